@@ -13,11 +13,13 @@
 
 import pytest
 from bqskit import compile
-from bqskit.compiler import Compiler
 
 from benchpress.bqskit_gym.utils.bqskit_backend_utils import BqskitFlexibleBackend
 from benchpress.utilities.io import input_circuit_properties, output_circuit_properties
-from benchpress.utilities.io.hamiltonians import generate_hamiltonian_circuit
+from benchpress.utilities.io.hamiltonians import (
+    generate_hamiltonian_circuit,
+    hamlib_metadata,
+)
 from benchpress.workouts.validation import benchpress_test_validation
 from benchpress.config import Configuration
 from benchpress.utilities.validation import circuit_validator
@@ -35,14 +37,13 @@ OPTIMIZATION_LEVEL = Configuration.options["qiskit"]["optimization_level"]
 @benchpress_test_validation
 class TestWorkoutAbstractHamiltonians(WorkoutAbstractHamiltonians):
     @pytest.mark.parametrize("circ_and_topo", HAM_TOPO, ids=HAM_TOPO_NAMES)
-    def test_hamiltonians(self, benchmark, circ_and_topo):
+    def test_hamiltonians(self, benchmark, bqskit_compiler, circ_and_topo):
         circuit = generate_hamiltonian_circuit(
-            circ_and_topo[0].pop("ham_hamlib_hamiltonian"), benchmark
+            circ_and_topo[0]["ham_hamlib_hamiltonian"], benchmark
         )
         input_circuit_properties(circuit, benchmark)
         BACKEND = BqskitFlexibleBackend(circuit.num_qudits, circ_and_topo[1])
         TWO_Q_GATE = BACKEND.two_q_gate_type
-        compiler = Compiler()
 
         @benchmark
         def result():
@@ -50,11 +51,10 @@ class TestWorkoutAbstractHamiltonians(WorkoutAbstractHamiltonians):
                 circuit,
                 model=BACKEND,
                 optimization_level=OPTIMIZATION_LEVEL,
-                compiler=compiler,
+                compiler=bqskit_compiler,
             )
             return new_circ
 
-        compiler.close()
-        benchmark.extra_info.update(circ_and_topo[0])
+        benchmark.extra_info.update(hamlib_metadata(circ_and_topo[0]))
         output_circuit_properties(result, TWO_Q_GATE, benchmark)
         assert circuit_validator(result, BACKEND)
@@ -14,7 +14,6 @@
 import pytest
 
 from bqskit import compile
-from bqskit.compiler import Compiler
 from benchpress.utilities.io import qasm_circuit_loader, output_circuit_properties
 from benchpress.utilities.validation import circuit_validator
 from benchpress.workouts.validation import benchpress_test_validation
@@ -41,10 +40,9 @@ OPTIMIZATION_LEVEL = Configuration.options["bqskit"]["optimization_level"]
 @benchpress_test_validation
 class TestWorkoutAbstractQasmBenchSmall(WorkoutAbstractQasmBenchSmall):
     @pytest.mark.parametrize("circ_and_topo", SMALL_CIRC_TOPO, ids=SMALL_NAMES)
-    def test_QASMBench_small(self, benchmark, circ_and_topo):
+    def test_QASMBench_small(self, benchmark, bqskit_compiler, circ_and_topo):
         circuit = qasm_circuit_loader(circ_and_topo[0], benchmark)
         BACKEND = BqskitFlexibleBackend(circuit.num_qudits, circ_and_topo[1])
-        compiler = Compiler()
 
         @benchmark
         def result():
@@ -52,11 +50,10 @@ class TestWorkoutAbstractQasmBenchSmall(WorkoutAbstractQasmBenchSmall):
                 circuit,
                 model=BACKEND,
                 optimization_level=OPTIMIZATION_LEVEL,
-                compiler=compiler,
+                compiler=bqskit_compiler,
             )
             return new_circ
 
-        compiler.close()
         output_circuit_properties(result, BACKEND.two_q_gate_type, benchmark)
         assert circuit_validator(result, BACKEND)
 
@@ -64,10 +61,9 @@ class TestWorkoutAbstractQasmBenchSmall(WorkoutAbstractQasmBenchSmall):
 @benchpress_test_validation
 class TestWorkoutAbstractQasmBenchMedium(WorkoutAbstractQasmBenchMedium):
     @pytest.mark.parametrize("circ_and_topo", MEDIUM_CIRC_TOPO, ids=MEDIUM_NAMES)
-    def test_QASMBench_medium(self, benchmark, circ_and_topo):
+    def test_QASMBench_medium(self, benchmark, bqskit_compiler, circ_and_topo):
         circuit = qasm_circuit_loader(circ_and_topo[0], benchmark)
         BACKEND = BqskitFlexibleBackend(circuit.num_qudits, circ_and_topo[1])
-        compiler = Compiler()
 
         @benchmark
         def result():
@@ -75,11 +71,10 @@ class TestWorkoutAbstractQasmBenchMedium(WorkoutAbstractQasmBenchMedium):
                 circuit,
                 model=BACKEND,
                 optimization_level=OPTIMIZATION_LEVEL,
-                compiler=compiler,
+                compiler=bqskit_compiler,
             )
             return new_circ
 
-        compiler.close()
         output_circuit_properties(result, BACKEND.two_q_gate_type, benchmark)
         assert circuit_validator(result, BACKEND)
 
@@ -87,10 +82,9 @@ class TestWorkoutAbstractQasmBenchMedium(WorkoutAbstractQasmBenchMedium):
 @benchpress_test_validation
 class TestWorkoutAbstractQasmBenchLarge(WorkoutAbstractQasmBenchLarge):
     @pytest.mark.parametrize("circ_and_topo", LARGE_CIRC_TOPO, ids=LARGE_NAMES)
-    def test_QASMBench_large(self, benchmark, circ_and_topo):
+    def test_QASMBench_large(self, benchmark, bqskit_compiler, circ_and_topo):
         circuit = qasm_circuit_loader(circ_and_topo[0], benchmark)
         BACKEND = BqskitFlexibleBackend(circuit.num_qudits, circ_and_topo[1])
-        compiler = Compiler()
 
         @benchmark
         def result():
@@ -98,10 +92,9 @@ class TestWorkoutAbstractQasmBenchLarge(WorkoutAbstractQasmBenchLarge):
                 circuit,
                 model=BACKEND,
                 optimization_level=OPTIMIZATION_LEVEL,
-                compiler=compiler,
+                compiler=bqskit_compiler,
             )
             return new_circ
 
-        compiler.close()
         output_circuit_properties(result, BACKEND.two_q_gate_type, benchmark)
         assert circuit_validator(result, BACKEND)
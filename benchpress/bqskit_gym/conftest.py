@@ -9,7 +9,21 @@
 # Any modifications or derivative works of this code must retain this
 # copyright notice, and modified files need to carry a notice indicating
 # that they have been altered from the originals.
+from time import perf_counter
+
+import pytest
 import bqskit
+from bqskit import Circuit, compile
+from bqskit.compiler import Compiler
+from bqskit.ir.gates import CNOTGate, HGate
+
+from benchpress.config import Configuration
+
+NUM_WORKERS = Configuration.options["bqskit"].get("num_workers", -1)
+WARM_UP = Configuration.options["bqskit"].get("warm_up", True)
+
+# Startup cost of the shared compiler, reported once in the json output
+COMPILER_INFO = {}
 
 
 def pytest_report_header(config):
@@ -27,3 +41,28 @@ def pytest_report_header(config):
 def pytest_benchmark_update_json(config, benchmarks, output_json):
     """Adds custom sections to the pytest-benchmark report"""
     output_json["bqskit_info"] = {"bqskit": str(bqskit.__version__)}
+    output_json["bqskit_info"].update(COMPILER_INFO)
+
+
+@pytest.fixture(scope="session")
+def bqskit_compiler():
+    """A BQSKit Compiler, and its pool of runtime workers, shared by
+    all tests in the session
+
+    The time taken to start the workers (and optionally to run a small
+    warm-up compilation) is recorded once, so that per-test timings only
+    contain the compilation itself.
+    """
+    start = perf_counter()
+    compiler = Compiler(num_workers=NUM_WORKERS)
+    COMPILER_INFO["compiler_num_workers"] = NUM_WORKERS
+    COMPILER_INFO["compiler_startup_time"] = perf_counter() - start
+    if WARM_UP:
+        circuit = Circuit(2)
+        circuit.append_gate(HGate(), 0)
+        circuit.append_gate(CNOTGate(), (0, 1))
+        start = perf_counter()
+        compile(circuit, optimization_level=1, compiler=compiler)
+        COMPILER_INFO["compiler_warm_up_time"] = perf_counter() - start
+    yield compiler
+    compiler.close()
@@ -126,28 +126,26 @@ class TestWorkoutCircuitConstruction(WorkoutCircuitConstruction):
 
         assert result
 
-    def test_QV100_qasm2_import(self, benchmark):
+    def test_QV100_qasm2_import(self, benchmark, corpus_file):
         """QASM import of QV100 circuit"""
+        qasm_file = corpus_file(Configuration.get_qasm_dir("qv") + "qv_N100_12345.qasm")
 
         @benchmark
         def result():
-            out = Circuit.from_file(
-                Configuration.get_qasm_dir("qv") + "qv_N100_12345.qasm"
-            )
+            out = Circuit.from_file(qasm_file)
             return out
 
         assert result.gate_counts[RZGate()] == 120000
         assert result.gate_counts[RXGate()] == 80000
         assert result.gate_counts[CXGate()] == 15000
 
-    def test_bigint_qasm2_import(self, benchmark):
+    def test_bigint_qasm2_import(self, benchmark, corpus_file):
         """QASM import of QV100 circuit"""
+        qasm_file = corpus_file(Configuration.get_qasm_dir("bigint") + "bigint.qasm")
 
         @benchmark
         def result():
-            out = Circuit.from_file(
-                Configuration.get_qasm_dir("bigint") + "bigint.qasm"
-            )
+            out = Circuit.from_file(qasm_file)
             return out
 
         assert result
@@ -0,0 +1,42 @@
+"""Test the synthesis of Hamiltonian evolution circuits"""
+
+from bqskit.ir.gates import CNOTGate
+
+from benchpress.utilities.io import output_circuit_properties
+from benchpress.utilities.io.hamiltonians import (
+    hamiltonian_synthesis_parameters,
+    hamlib_metadata,
+    load_hamiltonian,
+    order_terms,
+    record_synthesis_memory,
+    synthesize_hamiltonian_circuit,
+)
+from benchpress.workouts.validation import benchpress_test_validation
+from benchpress.workouts.build import WorkoutHamiltonianSynthesis
+
+
+def pytest_generate_tests(metafunc):
+    metafunc.parametrize(
+        "hamiltonian_info,order,ordering", hamiltonian_synthesis_parameters()
+    )
+
+
+@benchpress_test_validation
+class TestWorkoutHamiltonianSynthesis(WorkoutHamiltonianSynthesis):
+
+    def test_hamiltonian_synthesis(self, benchmark, hamiltonian_info, order, ordering):
+        """Synthesize the Trotter circuit of a Hamiltonian"""
+        sparse_op = order_terms(
+            load_hamiltonian(hamiltonian_info["ham_hamlib_hamiltonian"], benchmark),
+            ordering,
+        )
+
+        @benchmark
+        def result():
+            return synthesize_hamiltonian_circuit(sparse_op, order, ordering)
+
+        benchmark.extra_info.update(hamlib_metadata(hamiltonian_info))
+        benchmark.extra_info.update(trotter_order=order, term_ordering=ordering)
+        output_circuit_properties(result, CNOTGate(), benchmark)
+        record_synthesis_memory(sparse_op, benchmark, order, ordering)
+        assert result.num_qudits == sparse_op.num_qubits
@@ -10,51 +10,49 @@
 # copyright notice, and modified files need to carry a notice indicating
 # that they have been altered from the originals.
 """Test transpilation against a device"""
-import os
 import pytest
 from bqskit import compile
-from bqskit.compiler import Compiler
 
 from benchpress.utilities.io import qasm_circuit_loader, output_circuit_properties
-from benchpress.utilities.validation import circuit_validator
+from benchpress.utilities.validation import circuit_validator, equivalence_validator
 from benchpress.config import Configuration
 from benchpress.workouts.validation import benchpress_test_validation
 from benchpress.workouts.device_transpile import WorkoutDeviceFeynman
+from benchpress.utilities.io.manifest import qasm_file_params
 
-
-BACKEND = Configuration.backend()
-TWO_Q_GATE = BACKEND.two_q_gate_type
 OPTIMIZATION_LEVEL = Configuration.options["bqskit"]["optimization_level"]
 
 
 def pytest_generate_tests(metafunc):
-    directory = Configuration.get_qasm_dir("feynman")
-    file_list = [x for x in os.listdir(directory) if x.endswith(".qasm")]
-    metafunc.parametrize("filename", file_list)
+    metafunc.parametrize(
+        "filename",
+        qasm_file_params("feynman", max_qubits=Configuration.backend_num_qubits()),
+    )
 
 
 @benchpress_test_validation
 class TestWorkoutDeviceFeynman(WorkoutDeviceFeynman):
 
-    def test_feynman_transpile(self, benchmark, filename):
+    def test_feynman_transpile(self, benchmark, backend, bqskit_compiler, filename):
         """Transpile a feynman benchmark qasm file against a target device"""
         circuit = qasm_circuit_loader(
             f"{Configuration.get_qasm_dir('feynman')}{filename}", benchmark
         )
-        if circuit.num_qudits > BACKEND.num_qudits:
+        if circuit.num_qudits > backend.num_qudits:
             pytest.skip("Circuit too large for given backend.")
-        compiler = Compiler()
 
         @benchmark
-        def result():
+        def compilation():
             new_circ = compile(
                 circuit,
-                model=BACKEND,
+                model=backend,
                 optimization_level=OPTIMIZATION_LEVEL,
-                compiler=compiler,
+                compiler=bqskit_compiler,
+                with_mapping=True,
             )
             return new_circ
 
-        compiler.close()
-        output_circuit_properties(result, TWO_Q_GATE, benchmark)
-        assert circuit_validator(result, BACKEND)
+        result = compilation[0]
+        output_circuit_properties(result, backend.two_q_gate_type, benchmark)
+        assert circuit_validator(result, backend)
+        assert equivalence_validator(circuit, compilation, benchmark)
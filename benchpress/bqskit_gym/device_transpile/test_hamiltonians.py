@@ -10,62 +10,60 @@
 # copyright notice, and modified files need to carry a notice indicating
 # that they have been altered from the originals.
 """Test transpilation against a device"""
-import json
 import pytest
 
 from bqskit import compile
-from bqskit.compiler import Compiler
-from qiskit.quantum_info import SparsePauliOp
 
 from benchpress.config import Configuration
 from benchpress.utilities.io import input_circuit_properties, output_circuit_properties
-from benchpress.utilities.io.hamiltonians import generate_hamiltonian_circuit
+from benchpress.utilities.io.hamiltonians import (
+    generate_hamiltonian_circuit,
+    hamlib_metadata,
+    hamlib_parameters,
+)
 from benchpress.workouts.validation import benchpress_test_validation
 from benchpress.workouts.device_transpile import WorkoutDeviceHamlibHamiltonians
-from benchpress.utilities.validation import circuit_validator
+from benchpress.utilities.validation import circuit_validator, equivalence_validator
 
-BACKEND = Configuration.backend()
-TWO_Q_GATE = BACKEND.two_q_gate_type
 OPTIMIZATION_LEVEL = Configuration.options["qiskit"]["optimization_level"]
 
 
 def pytest_generate_tests(metafunc):
-    directory = Configuration.get_hamiltonian_dir("hamlib")
-    ham_records = json.load(open(directory + "100_representative.json", "r"))
-    for h in ham_records:
-        terms = h.pop("ham_hamlib_hamiltonian_terms")
-        coefficients = h.pop("ham_hamlib_hamiltonian_coefficients")
-        h["ham_hamlib_hamiltonian"] = SparsePauliOp(terms, coefficients)
     metafunc.parametrize(
-        "hamiltonian_info", ham_records, ids=lambda x: "ham_" + x["ham_instance"][1:-1]
+        "hamiltonian_info",
+        hamlib_parameters(max_qubits=Configuration.backend_num_qubits()),
+        ids=lambda x: "ham_" + x["ham_instance"][1:-1],
     )
 
 
 @benchpress_test_validation
 class TestWorkoutDeviceHamlibHamiltonians(WorkoutDeviceHamlibHamiltonians):
 
-    def test_hamlib_hamiltonians_transpile(self, benchmark, hamiltonian_info):
+    def test_hamlib_hamiltonians_transpile(
+        self, benchmark, backend, bqskit_compiler, hamiltonian_info
+    ):
         """Transpile a Hamiltonian against a target device"""
-        if hamiltonian_info["ham_qubits"] > BACKEND.num_qudits:
+        if hamiltonian_info["ham_qubits"] > backend.num_qudits:
             pytest.skip("Circuit too large for given backend.")
 
         circuit = generate_hamiltonian_circuit(
-            hamiltonian_info.pop("ham_hamlib_hamiltonian"), benchmark
+            hamiltonian_info["ham_hamlib_hamiltonian"], benchmark
         )
         input_circuit_properties(circuit, benchmark)
-        compiler = Compiler()
 
         @benchmark
-        def result():
+        def compilation():
             new_circ = compile(
                 circuit,
-                model=BACKEND,
+                model=backend,
                 optimization_level=OPTIMIZATION_LEVEL,
-                compiler=compiler,
+                compiler=bqskit_compiler,
+                with_mapping=True,
             )
             return new_circ
 
-        compiler.close()
-        benchmark.extra_info.update(hamiltonian_info)
-        output_circuit_properties(result, TWO_Q_GATE, benchmark)
-        assert circuit_validator(result, BACKEND)
+        result = compilation[0]
+        benchmark.extra_info.update(hamlib_metadata(hamiltonian_info))
+        output_circuit_properties(result, backend.two_q_gate_type, benchmark)
+        assert circuit_validator(result, backend)
+        assert equivalence_validator(circuit, compilation, benchmark)
@@ -0,0 +1,68 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2024.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+"""Test transpilation of the Hamiltonians of a downloaded HamLib library"""
+import pytest
+
+from bqskit import compile
+
+from benchpress.config import Configuration
+from benchpress.utilities.io import input_circuit_properties, output_circuit_properties
+from benchpress.utilities.io.hamiltonians import (
+    generate_hamiltonian_circuit,
+    hamlib_metadata,
+    hamlib_library_parameters,
+)
+from benchpress.workouts.validation import benchpress_test_validation
+from benchpress.workouts.device_transpile import WorkoutDeviceHamlibLibrary
+from benchpress.utilities.validation import circuit_validator, equivalence_validator
+
+OPTIMIZATION_LEVEL = Configuration.options["qiskit"]["optimization_level"]
+
+
+def pytest_generate_tests(metafunc):
+    metafunc.parametrize(
+        "hamiltonian_info",
+        hamlib_library_parameters(max_qubits=Configuration.backend_num_qubits()),
+    )
+
+
+@benchpress_test_validation
+class TestWorkoutDeviceHamlibLibrary(WorkoutDeviceHamlibLibrary):
+
+    def test_hamlib_library_transpile(
+        self, benchmark, backend, bqskit_compiler, hamiltonian_info
+    ):
+        """Transpile a HamLib library Hamiltonian against a target device"""
+        if hamiltonian_info["ham_qubits"] > backend.num_qudits:
+            pytest.skip("Circuit too large for given backend.")
+
+        circuit = generate_hamiltonian_circuit(
+            hamiltonian_info["ham_hamlib_hamiltonian"], benchmark
+        )
+        input_circuit_properties(circuit, benchmark)
+
+        @benchmark
+        def compilation():
+            new_circ = compile(
+                circuit,
+                model=backend,
+                optimization_level=OPTIMIZATION_LEVEL,
+                compiler=bqskit_compiler,
+                with_mapping=True,
+            )
+            return new_circ
+
+        result = compilation[0]
+        benchmark.extra_info.update(hamlib_metadata(hamiltonian_info))
+        output_circuit_properties(result, backend.two_q_gate_type, benchmark)
+        assert circuit_validator(result, backend)
+        assert equivalence_validator(circuit, compilation, benchmark)
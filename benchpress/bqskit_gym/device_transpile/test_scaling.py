@@ -0,0 +1,61 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2024.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+"""Test how transpilation against a device scales with the circuit size"""
+import pytest
+from bqskit import compile
+
+from benchpress.utilities.io import qasm_circuit_loader, output_circuit_properties
+from benchpress.utilities.validation import circuit_validator, equivalence_validator
+from benchpress.config import Configuration
+from benchpress.workouts.validation import benchpress_test_validation
+from benchpress.workouts.device_transpile import WorkoutScalingSweep
+from benchpress.workouts.device_transpile.scaling_sweep import (
+    scaling_sweep_files,
+    scaling_sweep_params,
+)
+
+OPTIMIZATION_LEVEL = Configuration.options["bqskit"]["optimization_level"]
+SWEEP = scaling_sweep_files()
+
+
+def pytest_generate_tests(metafunc):
+    metafunc.parametrize(
+        "family,size",
+        scaling_sweep_params(max_qubits=Configuration.backend_num_qubits()),
+    )
+
+
+@benchpress_test_validation
+class TestWorkoutScalingSweep(WorkoutScalingSweep):
+
+    def test_scaling_transpile(self, benchmark, backend, bqskit_compiler, family, size):
+        """Transpile a circuit family at every shipped size against a target device"""
+        benchmark.extra_info.update(scaling_family=family, scaling_size=size)
+        circuit = qasm_circuit_loader(SWEEP[family][size], benchmark)
+        if circuit.num_qudits > backend.num_qudits:
+            pytest.skip("Circuit too large for given backend.")
+
+        @benchmark
+        def compilation():
+            new_circ = compile(
+                circuit,
+                model=backend,
+                optimization_level=OPTIMIZATION_LEVEL,
+                compiler=bqskit_compiler,
+                with_mapping=True,
+            )
+            return new_circ
+
+        result = compilation[0]
+        output_circuit_properties(result, backend.two_q_gate_type, benchmark)
+        assert circuit_validator(result, backend)
+        assert equivalence_validator(circuit, compilation, benchmark)
@@ -12,7 +12,6 @@
 """Test summit benchmarks"""
 
 from bqskit import compile
-from bqskit.compiler import Compiler
 
 from benchpress.bqskit_gym.circuits import (
     bqskit_bv_all_ones,
@@ -26,204 +25,211 @@ from benchpress.utilities.io import (
     input_circuit_properties,
     output_circuit_properties,
 )
-from benchpress.utilities.validation import circuit_validator
+from benchpress.utilities.validation import circuit_validator, equivalence_validator
 from benchpress.workouts.validation import benchpress_test_validation
 from benchpress.workouts.device_transpile import WorkoutDeviceTranspile100Q
 
-
-BACKEND = Configuration.backend()
-TWO_Q_GATE = BACKEND.two_q_gate_type
 OPTIMIZATION_LEVEL = Configuration.options["bqskit"]["optimization_level"]
 
 
 @benchpress_test_validation
 class TestWorkoutDeviceTranspile100Q(WorkoutDeviceTranspile100Q):
-    def test_QFT_100_transpile(self, benchmark):
+    def test_QFT_100_transpile(self, benchmark, backend, bqskit_compiler):
         """Compile 100Q QFT circuit against target backend"""
         circuit = qasm_circuit_loader(
             Configuration.get_qasm_dir("qft") + "qft_N100.qasm", benchmark
         )
-        compiler = Compiler()
 
         @benchmark
-        def result():
+        def compilation():
             new_circ = compile(
                 circuit,
-                model=BACKEND,
+                model=backend,
                 optimization_level=OPTIMIZATION_LEVEL,
-                compiler=compiler,
+                compiler=bqskit_compiler,
+                with_mapping=True,
             )
             return new_circ
 
-        compiler.close()
-        output_circuit_properties(result, TWO_Q_GATE, benchmark)
-        assert circuit_validator(result, BACKEND)
+        result = compilation[0]
+        output_circuit_properties(result, backend.two_q_gate_type, benchmark)
+        assert circuit_validator(result, backend)
+        assert equivalence_validator(circuit, compilation, benchmark)
 
-    def test_QV_100_transpile(self, benchmark):
+    def test_QV_100_transpile(self, benchmark, backend, bqskit_compiler):
         """Compile 10Q QV circuit against target backend"""
         circuit = bqskit_QV(100, 100, seed=12345)
-        compiler = Compiler()
 
         @benchmark
-        def result():
+        def compilation():
             new_circ = compile(
                 circuit,
-                model=BACKEND,
+                model=backend,
                 optimization_level=OPTIMIZATION_LEVEL,
-                compiler=compiler,
+                compiler=bqskit_compiler,
+                with_mapping=True,
             )
             return new_circ
 
-        compiler.close()
-        output_circuit_properties(result, TWO_Q_GATE, benchmark)
-        assert circuit_validator(result, BACKEND)
+        result = compilation[0]
+        output_circuit_properties(result, backend.two_q_gate_type, benchmark)
+        assert circuit_validator(result, backend)
+        assert equivalence_validator(circuit, compilation, benchmark)
 
-    def test_circSU2_89_transpile(self, benchmark):
+    def test_circSU2_89_transpile(self, benchmark, backend, bqskit_compiler):
         """Compile 89Q circSU2 circuit against target backend"""
         circuit = bqskit_circSU2(89, 3)
         input_circuit_properties(circuit, benchmark)
-        compiler = Compiler()
 
         @benchmark
-        def result():
+        def compilation():
             new_circ = compile(
                 circuit,
-                model=BACKEND,
+                model=backend,
                 optimization_level=OPTIMIZATION_LEVEL,
-                compiler=compiler,
+                compiler=bqskit_compiler,
+                with_mapping=True,
             )
             return new_circ
 
-        compiler.close()
-        output_circuit_properties(result, TWO_Q_GATE, benchmark)
-        assert circuit_validator(result, BACKEND)
+        result = compilation[0]
+        output_circuit_properties(result, backend.two_q_gate_type, benchmark)
+        assert circuit_validator(result, backend)
+        assert equivalence_validator(circuit, compilation, benchmark)
 
-    def test_circSU2_100_transpile(self, benchmark):
+    def test_circSU2_100_transpile(self, benchmark, backend, bqskit_compiler):
         """Compile 100Q circSU2 circuit against target backend"""
         circuit = bqskit_circSU2(100, 3)
         input_circuit_properties(circuit, benchmark)
-        compiler = Compiler()
 
         @benchmark
-        def result():
+        def compilation():
             new_circ = compile(
                 circuit,
-                model=BACKEND,
+                model=backend,
                 optimization_level=OPTIMIZATION_LEVEL,
-                compiler=compiler,
+                compiler=bqskit_compiler,
+                with_mapping=True,
             )
             return new_circ
 
-        compiler.close()
-        output_circuit_properties(result, TWO_Q_GATE, benchmark)
-        assert circuit_validator(result, BACKEND)
+        result = compilation[0]
+        output_circuit_properties(result, backend.two_q_gate_type, benchmark)
+        assert circuit_validator(result, backend)
+        assert equivalence_validator(circuit, compilation, benchmark)
 
-    def test_BV_100_transpile(self, benchmark):
+    def test_BV_100_transpile(self, benchmark, backend, bqskit_compiler):
         """Compile 100Q BV circuit against target backend"""
         circuit = bqskit_bv_all_ones(100)
         input_circuit_properties(circuit, benchmark)
-        compiler = Compiler()
 
         @benchmark
-        def result():
+        def compilation():
             new_circ = compile(
                 circuit,
-                model=BACKEND,
+                model=backend,
                 optimization_level=OPTIMIZATION_LEVEL,
-                compiler=compiler,
+                compiler=bqskit_compiler,
+                with_mapping=True,
             )
             return new_circ
 
-        compiler.close()
-        output_circuit_properties(result, TWO_Q_GATE, benchmark)
-        assert circuit_validator(result, BACKEND)
+        result = compilation[0]
+        output_circuit_properties(result, backend.two_q_gate_type, benchmark)
+        assert circuit_validator(result, backend)
+        assert equivalence_validator(circuit, compilation, benchmark)
 
-    def test_square_heisenberg_100_transpile(self, benchmark):
+    def test_square_heisenberg_100_transpile(self, benchmark, backend, bqskit_compiler):
         """Compile 100Q square-Heisenberg circuit against target backend"""
         circuit = qasm_circuit_loader(
             Configuration.get_qasm_dir("square-heisenberg")
             + "square_heisenberg_N100.qasm",
             benchmark,
         )
-        compiler = Compiler()
 
         @benchmark
-        def result():
+        def compilation():
             new_circ = compile(
                 circuit,
-                model=BACKEND,
+                model=backend,
                 optimization_level=OPTIMIZATION_LEVEL,
-                compiler=compiler,
+                compiler=bqskit_compiler,
+                with_mapping=True,
             )
             return new_circ
 
-        compiler.close()
-        output_circuit_properties(result, TWO_Q_GATE, benchmark)
-        assert circuit_validator(result, BACKEND)
+        result = compilation[0]
+        output_circuit_properties(result, backend.two_q_gate_type, benchmark)
+        assert circuit_validator(result, backend)
+        assert equivalence_validator(circuit, compilation, benchmark)
 
-    def test_QAOA_100_transpile(self, benchmark):
+    def test_QAOA_100_transpile(self, benchmark, backend, bqskit_compiler):
         """Compile 100Q QAOA circuit against target backend"""
         circuit = qasm_circuit_loader(
             Configuration.get_qasm_dir("qaoa") + "qaoa_barabasi_albert_N100_3reps.qasm",
             benchmark,
         )
-        compiler = Compiler()
 
         @benchmark
-        def result():
+        def compilation():
             new_circ = compile(
                 circuit,
-                model=BACKEND,
+                model=backend,
                 optimization_level=OPTIMIZATION_LEVEL,
-                compiler=compiler,
+                compiler=bqskit_compiler,
                 seed=0,
+                with_mapping=True,
             )
             return new_circ
 
-        output_circuit_properties(result, TWO_Q_GATE, benchmark)
-        assert circuit_validator(result, BACKEND)
+        result = compilation[0]
+        output_circuit_properties(result, backend.two_q_gate_type, benchmark)
+        assert circuit_validator(result, backend)
+        assert equivalence_validator(circuit, compilation, benchmark)
 
-    def test_BVlike_simplification_transpile(self, benchmark):
+    def test_BVlike_simplification_transpile(self, benchmark, backend, bqskit_compiler):
         """Transpile a BV-like circuit that should collapse down
         into a single X and Z gate on a target device
         """
         circuit = trivial_bvlike_circuit(100)
         input_circuit_properties(circuit, benchmark)
-        compiler = Compiler()
 
         @benchmark
-        def result():
+        def compilation():
             new_circ = compile(
                 circuit,
-                model=BACKEND,
+                model=backend,
                 optimization_level=OPTIMIZATION_LEVEL,
-                compiler=compiler,
+                compiler=bqskit_compiler,
                 seed=0,
+                with_mapping=True,
             )
             return new_circ
 
-        compiler.close()
-        output_circuit_properties(result, TWO_Q_GATE, benchmark)
-        assert circuit_validator(result, BACKEND)
+        result = compilation[0]
+        output_circuit_properties(result, backend.two_q_gate_type, benchmark)
+        assert circuit_validator(result, backend)
+        assert equivalence_validator(circuit, compilation, benchmark)
 
-    def test_clifford_100_transpile(self, benchmark):
+    def test_clifford_100_transpile(self, benchmark, backend, bqskit_compiler):
         """Compile 100Q Clifford circuit against target backend"""
         circuit = qasm_circuit_loader(
             Configuration.get_qasm_dir("clifford") + "clifford_100_12345.qasm",
             benchmark,
         )
-        compiler = Compiler()
 
         @benchmark
-        def result():
+        def compilation():
             new_circ = compile(
                 circuit,
-                model=BACKEND,
+                model=backend,
                 optimization_level=OPTIMIZATION_LEVEL,
-                compiler=compiler,
+                compiler=bqskit_compiler,
+                with_mapping=True,
             )
             return new_circ
 
-        compiler.close()
-        output_circuit_properties(result, TWO_Q_GATE, benchmark)
-        assert circuit_validator(result, BACKEND)
+        result = compilation[0]
+        output_circuit_properties(result, backend.two_q_gate_type, benchmark)
+        assert circuit_validator(result, backend)
+        assert equivalence_validator(circuit, compilation, benchmark)
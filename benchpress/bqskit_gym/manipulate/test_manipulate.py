@@ -13,7 +13,6 @@
 import pytest
 import numpy as np
 from bqskit import Circuit, MachineModel, compile
-from bqskit.compiler import Compiler
 from bqskit.ir.gates import (
     CNOTGate,
     IdentityGate,
@@ -103,7 +102,7 @@ class TestWorkoutCircuitManipulate(WorkoutCircuitManipulate):
     @pytest.mark.xfail(
         reason="Runs out of memory (128GB RAM) for 16Q MCX gate", run=False
     )
-    def test_multi_control_decompose(self, benchmark):
+    def test_multi_control_decompose(self, benchmark, bqskit_compiler):
         """Decompose a multi-control gate into the
         basis [rx, ry, rz, cz]
         """
@@ -122,7 +121,7 @@ class TestWorkoutCircuitManipulate(WorkoutCircuitManipulate):
                 model=model,
                 optimization_level=1,
                 max_synthesis_size=N,
-                compiler=Compiler(),
+                compiler=bqskit_compiler,
                 seed=0,
             )
             return out_circuit
@@ -130,7 +129,7 @@ class TestWorkoutCircuitManipulate(WorkoutCircuitManipulate):
         benchmark.extra_info["gate_count_2q"] = result.gate_counts[CZGate()]
         assert result
 
-    def test_QV100_basis_change(self, benchmark):
+    def test_QV100_basis_change(self, benchmark, bqskit_compiler):
         """Change a QV100 circuit basis from [rx, ry, rz, cx]
         to [sx, x, rz, cz]
         """
@@ -148,19 +147,19 @@ class TestWorkoutCircuitManipulate(WorkoutCircuitManipulate):
                 input=circ,
                 model=model,
                 optimization_level=1,
-                compiler=Compiler(),
+                compiler=bqskit_compiler,
                 seed=0,
             )
             return out
 
         assert result
 
-    def test_random_clifford_decompose(self, benchmark):
+    def test_random_clifford_decompose(self, benchmark, bqskit_compiler, corpus_file):
         """Decompose a random clifford into
         basis [rz, sx, x, cz]
         """
         qasm_file = Configuration.get_qasm_dir("clifford") + "clifford_20_12345.qasm"
-        circ = Circuit.from_file(qasm_file)
+        circ = Circuit.from_file(corpus_file(qasm_file))
 
         model = MachineModel(
             num_qudits=circ.num_qudits,
@@ -173,7 +172,7 @@ class TestWorkoutCircuitManipulate(WorkoutCircuitManipulate):
                 input=circ,
                 model=model,
                 optimization_level=1,
-                compiler=Compiler(),
+                compiler=bqskit_compiler,
                 seed=0,
             )
             return out
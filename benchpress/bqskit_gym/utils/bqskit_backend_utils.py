@@ -19,9 +19,9 @@ from bqskit.ir.gates.qubitgate import QubitGate
 from bqskit.qis.unitary.unitarymatrix import UnitaryMatrix
 
 from benchpress.config import POSSIBLE_2Q_GATES
-from benchpress.utilities.backends.flexible_backend import FlexibleBackend
+from benchpress.utilities.backends import cached_flexible_backend
+from benchpress.utilities.backends.fake_backends import ibm_fake_backend_class
 from benchpress.qiskit_gym.utils.qiskit_backend_utils import (
-    STR_TO_IBM_FAKE_BACKEND,
     extend_ibm_fake_backend,
     get_qiskit_bench_backend,
 )
@@ -68,7 +68,9 @@ def BqskitFlexibleBackend(min_qubits, layout="square", basis_gates=None):
     Returns:
         MachineModel: Mode representing flexible backend in Bqskit
     """
-    flex_backend = FlexibleBackend(min_qubits, layout=layout, basis_gates=basis_gates)
+    flex_backend = cached_flexible_backend(
+        min_qubits, layout=layout, basis_gates=basis_gates
+    )
     model = _get_bqskit_machine_model(flex_backend)
     possible_gates = _basis_gate_str_to_bqskit_gate(POSSIBLE_2Q_GATES)
     twoq_gates = list(model.gate_set.intersection(possible_gates))
@@ -115,7 +117,7 @@ def get_bqskit_bench_backend(backend_name: str):
         A backend (Model) of `MachineModel` object compatible with BQSKIT.
     """
     if "fake" in backend_name:
-        ibm_fake_backend = STR_TO_IBM_FAKE_BACKEND[backend_name]()
+        ibm_fake_backend = ibm_fake_backend_class(backend_name)()
         backend = extend_ibm_fake_backend(ibm_fake_backend)
     elif "ibm" in backend_name:
         backend = get_qiskit_bench_backend(backend_name)
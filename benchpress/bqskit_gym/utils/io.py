@@ -9,12 +9,18 @@
 # Any modifications or derivative works of this code must retain this
 # copyright notice, and modified files need to carry a notice indicating
 # that they have been altered from the originals.
+import pickle
 from time import perf_counter
 from math import pi
 
+import bqskit
 from bqskit import Circuit
 from bqskit.ext import qiskit_to_bqskit
 from benchpress.qiskit_gym.utils.io import qiskit_hamiltonian_circuit
+from benchpress.utilities.io.circuit_metrics import (
+    circuit_metrics,
+    record_output_metrics,
+)
 
 
 def bqskit_qasm_loader(qasm_file, benchmark):
@@ -35,12 +41,44 @@ def bqskit_qasm_loader(qasm_file, benchmark):
     return circuit
 
 
-def bqskit_hamiltonian_circuit(sparse_op, label=None, evo_time=1):
+def bqskit_cache_tag():
+    return f"bqskit-{bqskit.__version__}"
+
+
+def bqskit_circuit_to_bytes(circuit):
+    return pickle.dumps(circuit, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def bqskit_circuit_from_bytes(data):
+    return pickle.loads(data)
+
+
+def bqskit_hamiltonian_circuit(
+    sparse_op, label=None, evo_time=1, order=1, commuting_sets=False
+):
     # BQSKit uses qiskit to construct a Trotter circuit, see https://github.com/BQSKit/bqskit-tutorial/blob/d04b4c40180c26ef81a8927663679fa085efc053/hubbard/hubbard.py#L135
     # hence we also use it here. Note that we must decompose the returned circuit here because BQSKit
     # will complain about the n-qubit PauliBoxes inside the circuit returned by `qk_ham_circuit`
     return qiskit_to_bqskit(
-        qiskit_hamiltonian_circuit(sparse_op, label, evo_time).decompose().decompose()
+        qiskit_hamiltonian_circuit(sparse_op, label, evo_time, order, commuting_sets)
+        .decompose()
+        .decompose()
+    )
+
+
+def bqskit_synthesize_hamiltonian(sparse_op, order=1, commuting_sets=False):
+    """Trotter circuit of a Hamiltonian in CX gates and single qubit rotations
+
+    Parameters:
+        sparse_op (SparsePauliOp): The Hamiltonian
+        order (int): Order of the product formula, 1 or even
+        commuting_sets (bool): Let Qiskit reorder the terms to reduce the depth
+
+    Returns:
+        Circuit: The circuit
+    """
+    return bqskit_hamiltonian_circuit(
+        sparse_op, order=order, commuting_sets=commuting_sets
     )
 
 
@@ -48,16 +86,27 @@ def bqskit_input_circuit_properties(circuit, benchmark):
     benchmark.extra_info["input_num_qubits"] = circuit.num_qudits
 
 
+def bqskit_circuit_metrics(circuit, two_qubit_gate):
+    """Circuit metrics of a BQSKit circuit
+
+    Parameters:
+        circuit (Circuit): BQSKit circuit
+        two_qubit_gate (Gate): Target 2Q gate
+
+    Returns:
+        dict: Metrics as returned by `circuit_metrics`
+    """
+    instructions = ((op.gate.name, op.location) for op in circuit.operations())
+    return circuit_metrics(
+        circuit.num_qudits,
+        instructions,
+        two_qubit_gate.name,
+        swap_gates=("SwapGate",),
+        directives=("BarrierPlaceholder",),
+    )
+
+
 def bqskit_output_circuit_properties(circuit, two_qubit_gate, benchmark):
-    ops = {}
-    for op in circuit.operations():
-        if op.gate.name in ops:
-            ops[op.gate.name] += 1
-        else:
-            ops[op.gate.name] = 1
-    benchmark.extra_info["output_num_qubits"] = circuit.num_qudits
-    benchmark.extra_info["output_circuit_operations"] = ops
-    benchmark.extra_info["output_gate_count_2q"] = circuit.gate_counts.get(
-        two_qubit_gate, 0
+    record_output_metrics(
+        circuit.num_qudits, bqskit_circuit_metrics(circuit, two_qubit_gate), benchmark
     )
-    benchmark.extra_info["output_depth_2q"] = circuit.multi_qudit_depth
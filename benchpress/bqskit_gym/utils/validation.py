@@ -11,6 +11,11 @@
 # that they have been altered from the originals.
 """Basic circuit validation"""
 
+import numpy as np
+from bqskit.ext import bqskit_to_qiskit
+
+from benchpress.utilities.validation.topology import backend_topology
+
 
 def bqskit_circuit_validation(circuit, backend):
     """Validate that input circuit matches gate set
@@ -29,9 +34,38 @@ def bqskit_circuit_validation(circuit, backend):
     if diff_set:
         raise Exception(f"Circuit has gates outside backend basis set {diff_set}")
 
-    edges = backend.coupling_graph
-    for item in circuit.operations():
-        if item.gate == backend.two_q_gate_type:
-            if item.location not in edges and item.location[::-1] not in edges:
-                raise Exception(f"2Q gate edge {item.location} not in backend topology")
+    topology = backend_topology(
+        backend,
+        lambda: (backend.num_qudits, np.array(list(backend.coupling_graph)), True),
+    )
+    pairs = np.array(
+        [
+            item.location
+            for item in circuit.operations()
+            if item.gate == backend.two_q_gate_type
+        ],
+        dtype=np.int64,
+    ).reshape(-1, 2)
+    topology.validate(pairs)
     return True
+
+
+def bqskit_equivalence_inputs(circuit, result):
+    """Circuits and layouts to check the equivalence of a compilation
+
+    Parameters:
+        circuit (Circuit): Input circuit
+        result (tuple): Compiled circuit, initial and final mappings, as
+                        returned by `compile(..., with_mapping=True)`
+
+    Returns:
+        tuple: Input and compiled circuits as Qiskit circuits, and the
+               physical qubits every input qubit starts and ends on
+    """
+    compiled, initial_mapping, final_mapping = result
+    return (
+        bqskit_to_qiskit(circuit),
+        bqskit_to_qiskit(compiled),
+        list(initial_mapping),
+        list(final_mapping),
+    )
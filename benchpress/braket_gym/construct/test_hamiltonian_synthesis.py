@@ -0,0 +1,19 @@
+"""Test the synthesis of Hamiltonian evolution circuits"""
+
+import pytest
+from benchpress.utilities.io.hamiltonians import hamiltonian_synthesis_parameters
+from benchpress.workouts.validation import benchpress_test_validation
+from benchpress.workouts.build import WorkoutHamiltonianSynthesis
+
+
+def pytest_generate_tests(metafunc):
+    metafunc.parametrize(
+        "hamiltonian_info,order,ordering", hamiltonian_synthesis_parameters()
+    )
+
+
+@benchpress_test_validation
+class TestWorkoutHamiltonianSynthesis(WorkoutHamiltonianSynthesis):
+
+    def test_hamiltonian_synthesis(self, benchmark, hamiltonian_info, order, ordering):
+        pytest.skip("Not implimented")
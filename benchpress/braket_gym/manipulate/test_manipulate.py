@@ -69,13 +69,13 @@ def cx_twirl(circuit):
 
 @benchpress_test_validation
 class TestWorkoutCircuitManipulate(WorkoutCircuitManipulate):
-    def test_DTC100_twirling(self, benchmark):
+    def test_DTC100_twirling(self, benchmark, corpus_file):
         """Perform Pauli-twirling on a 100Q DTC
         circuit
         """
         # Unlike other SDKs, the QASM importer is a bit flaky so use provider
         circ_location = Configuration.get_qasm_dir("dtc") + "dtc_100_cx_12345.qasm"
-        qc = QuantumCircuit.from_qasm_file(circ_location)
+        qc = QuantumCircuit.from_qasm_file(corpus_file(circ_location))
         braket_qc = to_braket(qc)
 
         @benchmark
@@ -12,6 +12,11 @@
 from time import perf_counter
 from braket.circuits import Circuit
 
+from benchpress.utilities.io.circuit_metrics import (
+    circuit_metrics,
+    record_output_metrics,
+)
+
 
 def braket_qasm_loader(qasm_file, benchmark):
     """Loads a QASM file and measures the import time
@@ -53,14 +58,15 @@ def braket_output_circuit_properties(circuit, two_qubit_gate, benchmark):
         two_qubit_gate: A 2Q gate name, e.g.
         benchmark : The benchmark object
     """
-    count_ops = {}
-    for item in circuit.instructions:
-        name = item.operator.name
-        if name in count_ops:
-            count_ops[name] += 1
-        else:
-            count_ops[name] = 1
-    benchmark.extra_info["output_num_qubits"] = circuit.qubit_count
-    benchmark.extra_info["output_circuit_operations"] = count_ops
-    benchmark.extra_info["output_gate_count_2q"] = count_ops.get(two_qubit_gate, 0)
-    benchmark.extra_info["output_depth_2q"] = None
+    wires = {qubit: idx for idx, qubit in enumerate(circuit.qubits)}
+    instructions = (
+        (
+            item.operator.name,
+            [wires[qubit] for qubit in list(item.control) + list(item.target)],
+        )
+        for item in circuit.instructions
+    )
+    metrics = circuit_metrics(
+        len(wires), instructions, two_qubit_gate, swap_gates=("Swap",)
+    )
+    record_output_metrics(circuit.qubit_count, metrics, benchmark)
@@ -0,0 +1,37 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2024.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+"""Test cold start benchmarks"""
+from benchpress.workouts.validation import benchpress_test_validation
+from benchpress.workouts.cold_start import WorkoutColdStart
+
+SETUP = """
+import cirq
+"""
+
+FIRST_CALL = """
+qubits = cirq.LineQubit.range(5)
+circuit = cirq.Circuit(
+    [cirq.H(qubits[0])] + [cirq.CNOT(qubits[0], qubit) for qubit in qubits[1:]]
+)
+cirq.optimize_for_target_gateset(circuit, gateset=cirq.CZTargetGateset())
+"""
+
+
+@benchpress_test_validation
+class TestWorkoutColdStart(WorkoutColdStart):
+    def test_import_and_first_transpile(self, benchmark, cold_start_benchmark):
+        """Measures the time a fresh interpreter takes to import an SDK
+        and to compile a first small circuit, and the resident memory
+        after the import.
+        """
+        result = cold_start_benchmark(SETUP, FIRST_CALL)
+        assert result["cold_start_first_call_time"] > 0
@@ -81,14 +81,13 @@ class TestWorkoutCircuitConstruction(WorkoutCircuitConstruction):
 
         assert result
 
-    def test_QV100_qasm2_import(self, benchmark):
+    def test_QV100_qasm2_import(self, benchmark, corpus_file):
         """QASM import of QV100 circuit"""
+        qasm_file = corpus_file(Configuration.get_qasm_dir("qv") + "qv_N100_12345.qasm")
 
         @benchmark
         def result():
-            with open(
-                Configuration.get_qasm_dir("qv") + "qv_N100_12345.qasm", "r"
-            ) as file:
+            with open(qasm_file, "r") as file:
                 data = file.read()
             out = circuit_from_qasm(data)
             return out
@@ -101,14 +100,13 @@ class TestWorkoutCircuitConstruction(WorkoutCircuitConstruction):
             == 15000
         )
 
-    def test_bigint_qasm2_import(self, benchmark):
+    def test_bigint_qasm2_import(self, benchmark, corpus_file):
         """QASM import with bigint"""
+        qasm_file = corpus_file(Configuration.get_qasm_dir("bigint") + "bigint.qasm")
 
         @benchmark
         def result():
-            with open(
-                Configuration.get_qasm_dir("bigint") + "bigint.qasm", "r"
-            ) as file:
+            with open(qasm_file, "r") as file:
                 data = file.read()
             out = circuit_from_qasm(data)
             return out
@@ -0,0 +1,27 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2024.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+"""Test transpilation of the Hamiltonians of a downloaded HamLib library"""
+import pytest
+from benchpress.utilities.io.hamiltonians import hamlib_library_parameters
+from benchpress.workouts.validation import benchpress_test_validation
+from benchpress.workouts.device_transpile import WorkoutDeviceHamlibLibrary
+
+
+def pytest_generate_tests(metafunc):
+    metafunc.parametrize("hamiltonian_info", hamlib_library_parameters())
+
+
+@benchpress_test_validation
+class TestWorkoutDeviceHamlibLibrary(WorkoutDeviceHamlibLibrary):
+
+    def test_hamlib_library_transpile(self, benchmark, hamiltonian_info):
+        pytest.skip("Not implimented")
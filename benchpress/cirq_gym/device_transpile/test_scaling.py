@@ -0,0 +1,29 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2024.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+"""Test how transpilation against a device scales with the circuit size"""
+import pytest
+
+
+from benchpress.workouts.validation import benchpress_test_validation
+from benchpress.workouts.device_transpile import WorkoutScalingSweep
+from benchpress.workouts.device_transpile.scaling_sweep import scaling_sweep_params
+
+
+def pytest_generate_tests(metafunc):
+    metafunc.parametrize("family,size", scaling_sweep_params())
+
+
+@benchpress_test_validation
+class TestWorkoutScalingSweep(WorkoutScalingSweep):
+
+    def test_scaling_transpile(self, benchmark, family, size):
+        pytest.skip("Not implimented")
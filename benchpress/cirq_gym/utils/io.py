@@ -13,6 +13,11 @@ from time import perf_counter
 import cirq
 from cirq.contrib.qasm_import import circuit_from_qasm
 
+from benchpress.utilities.io.circuit_metrics import (
+    circuit_metrics,
+    record_output_metrics,
+)
+
 
 def cirq_qasm_loader(qasm_file, benchmark):
     """Loads a QASM file and measures the import time
@@ -34,6 +39,18 @@ def cirq_qasm_loader(qasm_file, benchmark):
     return circuit
 
 
+def cirq_cache_tag():
+    return f"cirq-{cirq.__version__}"
+
+
+def cirq_circuit_to_bytes(circuit):
+    return cirq.to_json(circuit).encode()
+
+
+def cirq_circuit_from_bytes(data):
+    return cirq.read_json(json_text=data.decode())
+
+
 def cirq_input_circuit_properties(circuit, benchmark):
     """Get cirq output circuit statistics
 
@@ -53,20 +70,12 @@ def cirq_output_circuit_properties(circuit, two_qubit_gate, benchmark):
         benchmark : The benchmark object
     """
 
-    twoq_gates = []
-    count_ops = {}
-
-    for item in circuit.all_operations():
-        item_name = type(item.gate).__name__
-        if item_name == two_qubit_gate:
-            twoq_gates.append(item)
-        if item_name in count_ops:
-            count_ops[item_name] += 1
-        else:
-            count_ops[item_name] = 1
-
-    benchmark.extra_info["output_num_qubits"] = cirq.num_qubits(circuit)
-    benchmark.extra_info["output_circuit_operations"] = count_ops
-    benchmark.extra_info["output_gate_count_2q"] = len(twoq_gates)
-    # https://quantumcomputing.stackexchange.com/questions/9302/computing-circuit-depth-in-cirq
-    benchmark.extra_info["output_depth_2q"] = len(cirq.Circuit(twoq_gates))
+    wires = {qubit: idx for idx, qubit in enumerate(sorted(circuit.all_qubits()))}
+    instructions = (
+        (type(item.gate).__name__, [wires[qubit] for qubit in item.qubits])
+        for item in circuit.all_operations()
+    )
+    metrics = circuit_metrics(
+        len(wires), instructions, two_qubit_gate, swap_gates=("SwapPowGate",)
+    )
+    record_output_metrics(len(wires), metrics, benchmark)
@@ -47,6 +47,7 @@ class BenchpressConfig:
             self.filename = filename
         self.options = {}
         self._gym_name = None
+        self._backends = {}
         self.config_parser = configparser.ConfigParser()
         self.qasm_dir = os.path.dirname(os.path.abspath(__file__)) + os.sep + "qasm"
         self.hamiltonian_dir = (
@@ -85,6 +86,11 @@ class BenchpressConfig:
         return ham_dir + os.sep + sub_dir + os.sep
 
     def backend(self):
+        """The target backend of the gym
+
+        The backend is built on the first call and the same object is
+        returned afterwards.
+        """
         from benchpress.utilities.backends import get_backend
 
         if self.gym_name is None:
@@ -97,13 +103,47 @@ class BenchpressConfig:
             "qiskit-ibm-transpiler",
             "staq",
         ]:
-            backend = get_backend(
-                backend_name=self.options["general"]["backend_name"],
-                gym_name=self.gym_name,
-            )
-            return backend
+            backend_name = self.options["general"]["backend_name"]
+            key = (self.gym_name, backend_name)
+            if key not in self._backends:
+                self._backends[key] = get_backend(
+                    backend_name=backend_name,
+                    gym_name=self.gym_name,
+                )
+            return self._backends[key]
         else:
             raise ValueError(f"{self.gym_name} does not support backends")
 
+    def backend_num_qubits(self):
+        """Number of qubits of the target backend
+
+        Fake backends are sized from their configuration file, so that tests
+        can be parametrized (and skipped) without building the backend.
+
+        Returns:
+            int: The number of qubits
+        """
+        from benchpress.utilities.backends.fake_backends import (
+            IBM_FAKE_BACKENDS,
+            fake_backend_num_qubits,
+        )
+
+        backend_name = self.options["general"]["backend_name"]
+        if backend_name in IBM_FAKE_BACKENDS:
+            num_qubits = fake_backend_num_qubits(backend_name)
+            if num_qubits is not None:
+                return num_qubits
+        if self.gym_name == "staq":
+            # pystaq devices do not expose their size
+            from benchpress.utilities.backends import get_backend
+
+            return get_backend(backend_name, "qiskit").num_qubits
+        backend = self.backend()
+        if self.gym_name == "tket":
+            return backend.backend_info.n_nodes
+        if self.gym_name == "bqskit":
+            return backend.num_qudits
+        return backend.num_qubits
+
 
 Configuration = BenchpressConfig()
@@ -10,11 +10,252 @@
 # copyright notice, and modified files need to carry a notice indicating
 # that they have been altered from the originals.
 # conftest.py
+import contextlib
+import math
 import time
 import numpy
 import scipy
 import pytest
-import packaging
+import packaging.version
+
+from benchpress.config import Configuration
+from benchpress.results.journal import JournalPlugin
+from benchpress.results.scaling import scaling_fits
+from benchpress.utilities.io.corpus import qasm_file
+from benchpress.utilities.profiling import (
+    AdaptiveBenchmarkFixture,
+    ResourceMonitor,
+    cold_start,
+    cold_start_summary,
+    configure_pass_trace,
+)
+
+RESOURCE_SAMPLE_INTERVAL = Configuration.options["general"].get(
+    "resource_sample_interval", 0.1
+)
+ADAPTIVE_ROUNDS = Configuration.options.get("adaptive_rounds", {})
+PASS_TRACE = Configuration.options.get("pass_trace", {})
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("benchpress")
+    group.addoption(
+        "--benchpress-journal",
+        metavar="PATH",
+        default=None,
+        help="Append every finished test to this JSONL journal as soon as it ends",
+    )
+    group.addoption(
+        "--benchpress-resume",
+        action="store_true",
+        default=False,
+        help="Skip the tests already finished in --benchpress-journal and merge "
+        "them into the final report",
+    )
+    group.addoption(
+        "--max-qubits",
+        type=int,
+        default=None,
+        help="Deselect the corpus tests with circuits wider than this, using the "
+        "corpus manifest",
+    )
+    group.addoption(
+        "--adaptive-rounds",
+        action="store_true",
+        default=ADAPTIVE_ROUNDS.get("enabled", False),
+        help="Run benchmark rounds until the confidence interval of the median "
+        "is narrow enough, or the time budget is spent, see [adaptive_rounds] "
+        "in default.conf",
+    )
+    group.addoption(
+        "--pass-trace",
+        action="store_true",
+        default=PASS_TRACE.get("enabled", False),
+        help="Record the time of every pass and the circuit size after it in "
+        "transpile tests, and write them as flamegraphs, see [pass_trace] in "
+        "default.conf",
+    )
+
+
+def pytest_configure(config):
+    config.addinivalue_line(
+        "markers", "num_qubits(n): width of the circuit a test works on"
+    )
+    if config.getoption("adaptive_rounds"):
+        if not AdaptiveBenchmarkFixture.supported():
+            raise pytest.UsageError(
+                "--adaptive-rounds needs pytest-benchmark 5.3 or later"
+            )
+        if config.getoption("benchmark_precision", None):
+            raise pytest.UsageError(
+                "--adaptive-rounds and --benchmark-precision cannot be combined"
+            )
+    journal = config.getoption("benchpress_journal")
+    resume = config.getoption("benchpress_resume")
+    if resume and journal is None:
+        raise pytest.UsageError("--benchpress-resume requires --benchpress-journal")
+    if journal is not None:
+        config.pluginmanager.register(
+            JournalPlugin(config, journal, resume=resume), "benchpress-journal"
+        )
+    configure_pass_trace(
+        config.getoption("pass_trace"), PASS_TRACE.get("directory", "pass_traces")
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    """Deselect the tests wider than --max-qubits"""
+    max_qubits = config.getoption("max_qubits")
+    if max_qubits is None:
+        return
+    keep, wide = [], []
+    for item in items:
+        marker = item.get_closest_marker("num_qubits")
+        if marker is not None and marker.args[0] > max_qubits:
+            wide.append(item)
+        else:
+            keep.append(item)
+    if wide:
+        config.hook.pytest_deselected(items=wide)
+        items[:] = keep
+
+
+@pytest.fixture(scope="session")
+def backend():
+    """The target device of the gym, built on first use and shared by the
+    whole session
+    """
+    return Configuration.backend()
+
+
+@pytest.fixture
+def benchmark(benchmark, request):
+    """The pytest-benchmark fixture, made adaptive by --adaptive-rounds
+
+    In adaptive mode the number of rounds of `benchmark(...)` follows the
+    spread of the timings, within `max_time_factor` times
+    --benchmark-max-time, and the width
+    of the confidence interval of the median that was reached is recorded
+    in `extra_info` as `median_ci_relative_width`.
+    """
+    if request.config.getoption("adaptive_rounds"):
+        AdaptiveBenchmarkFixture.adapt(
+            benchmark,
+            ADAPTIVE_ROUNDS.get("precision", 0.05),
+            confidence=ADAPTIVE_ROUNDS.get("confidence", 0.95),
+            max_time_factor=ADAPTIVE_ROUNDS.get("max_time_factor", 3),
+        )
+    return benchmark
+
+
+@pytest.fixture
+def corpus_file(benchmark):
+    """Plain files holding corpus QASM files, for SDK functions that only
+    read paths
+
+    Usage:
+
+        path = corpus_file(Configuration.get_qasm_dir("qv") + "qv_N100_12345.qasm")
+
+    Compressed files are decompressed to a scratch file, removed at the end
+    of the test, and the decompression time is recorded in `extra_info` as
+    `qasm_decompress_time`.
+    """
+    with contextlib.ExitStack() as stack:
+        yield lambda path: stack.enter_context(qasm_file(path, benchmark))
+
+
+@pytest.fixture
+def inplace_benchmark(benchmark):
+    """Benchmark an operation that modifies its input in place
+
+    Every round is handed a fresh copy of the input, made outside of the
+    timed region.  The mean time taken by the copies is recorded in
+    `extra_info` as `input_copy_time`.
+
+    Usage:
+
+        result = inplace_benchmark(pm.apply, circuit)
+
+    where `pm.apply(new_circuit)` is timed and `result` is the copy the
+    last round operated on.  A custom `copy` callable can be passed for
+    inputs without a `copy()` method.
+    """
+
+    def run(function, source, copy=None):
+        if copy is None:
+            copy = type(source).copy
+        copy_times = []
+        targets = []
+
+        def setup():
+            start = time.perf_counter()
+            target = copy(source)
+            copy_times.append(time.perf_counter() - start)
+            targets.append(target)
+            return (target,), {}
+
+        rounds = 1
+        if benchmark.enabled:
+            # Untimed calibration run sizing the number of rounds, as
+            # pytest-benchmark does for regular benchmarks
+            (target,), _ = setup()
+            start = time.perf_counter()
+            function(target)
+            duration = max(time.perf_counter() - start, 1e-9)
+            rounds = math.ceil(benchmark._max_time / duration)
+            rounds = max(rounds, benchmark._min_rounds)
+
+        benchmark.pedantic(function, setup=setup, rounds=rounds, iterations=1)
+        benchmark.extra_info["input_copy_time"] = sum(copy_times) / len(copy_times)
+        return targets[-1]
+
+    return run
+
+
+@pytest.fixture
+def cold_start_benchmark(benchmark):
+    """Benchmark the import of an SDK and its first call in fresh interpreters
+
+    Usage:
+
+        cold_start_benchmark(setup, first_call)
+
+    where `setup` is the code importing the SDK and `first_call` the code
+    run next, e.g. a first small compilation.  Every round starts a new
+    Python process, whose wall time is what the benchmark reports.  The
+    medians of the import time, first call time and resident memory after
+    the import are recorded in `extra_info`.
+    """
+    options = Configuration.options.get("cold_start", {})
+
+    def run(setup, first_call):
+        runs = []
+
+        def start():
+            runs.append(cold_start(setup, first_call, options.get("timeout")))
+
+        benchmark.pedantic(start, rounds=options.get("repeats", 5), iterations=1)
+        summary = cold_start_summary(runs)
+        benchmark.extra_info.update(summary)
+        return summary
+
+    return run
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_call(item):
+    """Record the OS resources used by every benchmark test in its extra info"""
+    benchmark = getattr(item, "funcargs", {}).get("benchmark")
+    if benchmark is None:
+        yield
+        return
+    monitor = ResourceMonitor(interval=RESOURCE_SAMPLE_INTERVAL)
+    monitor.start()
+    try:
+        yield
+    finally:
+        benchmark.extra_info.update(monitor.stop())
 
 
 def pytest_benchmark_update_json(config, benchmarks, output_json):
@@ -31,6 +272,8 @@ def pytest_benchmark_update_json(config, benchmarks, output_json):
     else:
         output_json["total_duration"] = time.time() - reporter._sessionstarttime
 
+    output_json["benchpress_config"] = Configuration.options
+
     output_json["env_info"] = {
         "numpy": str(numpy.__version__),
         "scipy": str(scipy.__version__),
@@ -52,3 +295,7 @@ def pytest_benchmark_update_json(config, benchmarks, output_json):
                 "keywords": test.keywords,
             }
     output_json["test_dumps"] = test_dumps
+
+    fits = scaling_fits(output_json["benchmarks"])
+    if fits:
+        output_json["scaling_fits"] = fits
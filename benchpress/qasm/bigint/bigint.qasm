@@ -1,8 +0,0 @@
-OPENQASM 2.0;
-include "qelib1.inc";
-qreg q0[301];
-creg c0[301];
-h q0[300];
-measure q0[300] -> c0[300];
-if(c0==2037035976334486086268445688409378161051468393665936250636140449354381299763336706183397376) h q0[300];
-measure q0[300] -> c0[200];
@@ -1,9900 +0,0 @@
-OPENQASM 2.0;
-include "qelib1.inc";
-qreg q[100];
-s q[0];
-h q[0];
-s q[0];
-h q[1];
-h q[2];
-s q[2];
-h q[5];
-s q[5];
-s q[6];
-h q[6];
-h q[7];
-s q[8];
-s q[13];
-h q[13];
-s q[13];
-s q[14];
-h q[14];
-s q[15];
-h q[15];
-h q[16];
-s q[16];
-h q[18];
-h q[19];
-h q[20];
-h q[23];
-s q[26];
-s q[27];
-h q[28];
-h q[29];
-s q[31];
-h q[31];
-s q[31];
-h q[32];
-s q[34];
-h q[34];
-s q[38];
-h q[38];
-s q[38];
-s q[39];
-h q[41];
-s q[42];
-h q[42];
-s q[43];
-s q[44];
-h q[44];
-s q[49];
-h q[50];
-s q[53];
-s q[54];
-s q[55];
-h q[55];
-s q[58];
-s q[62];
-h q[62];
-h q[63];
-h q[64];
-h q[65];
-h q[66];
-s q[67];
-s q[68];
-h q[68];
-h q[70];
-s q[71];
-h q[71];
-h q[74];
-h q[75];
-s q[76];
-s q[79];
-s q[81];
-h q[81];
-s q[81];
-s q[83];
-s q[84];
-h q[84];
-s q[85];
-h q[85];
-h q[87];
-h q[88];
-h q[89];
-h q[90];
-h q[91];
-h q[92];
-s q[92];
-s q[93];
-s q[94];
-s q[96];
-h q[97];
-s q[97];
-h q[98];
-swap q[71],q[0];
-cx q[71],q[8];
-cx q[71],q[12];
-cx q[71],q[18];
-cx q[71],q[23];
-cx q[71],q[30];
-cx q[71],q[37];
-cx q[71],q[40];
-cx q[71],q[43];
-cx q[71],q[46];
-cx q[71],q[47];
-cx q[71],q[52];
-cx q[71],q[53];
-cx q[71],q[58];
-cx q[71],q[61];
-cx q[71],q[64];
-cx q[71],q[67];
-cx q[71],q[70];
-cx q[71],q[75];
-cx q[71],q[82];
-cx q[71],q[83];
-cx q[71],q[88];
-cx q[71],q[93];
-cx q[71],q[94];
-cx q[71],q[96];
-cx q[7],q[71];
-cx q[10],q[71];
-cx q[11],q[71];
-cx q[14],q[71];
-cx q[17],q[71];
-cx q[20],q[71];
-cx q[32],q[71];
-cx q[34],q[71];
-cx q[42],q[71];
-cx q[50],q[71];
-cx q[55],q[71];
-cx q[57],q[71];
-cx q[59],q[71];
-cx q[66],q[71];
-cx q[68],q[71];
-cx q[74],q[71];
-cx q[80],q[71];
-cx q[84],q[71];
-cx q[85],q[71];
-cx q[0],q[71];
-cx q[1],q[3];
-cx q[1],q[19];
-cx q[1],q[21];
-cx q[1],q[22];
-cx q[1],q[25];
-cx q[1],q[27];
-cx q[1],q[28];
-cx q[1],q[35];
-cx q[1],q[36];
-cx q[1],q[49];
-cx q[1],q[51];
-cx q[1],q[65];
-cx q[1],q[89];
-cx q[1],q[91];
-cx q[1],q[98];
-cx q[71],q[1];
-h q[1];
-cx q[1],q[71];
-cx q[4],q[2];
-cx q[2],q[71];
-cx q[71],q[4];
-cx q[6],q[5];
-cx q[5],q[71];
-cx q[71],q[6];
-cx q[13],q[9];
-cx q[9],q[71];
-cx q[71],q[13];
-cx q[16],q[15];
-cx q[15],q[71];
-cx q[71],q[16];
-cx q[29],q[26];
-cx q[26],q[71];
-cx q[71],q[29];
-cx q[38],q[31];
-cx q[31],q[71];
-cx q[71],q[38];
-cx q[41],q[39];
-cx q[39],q[71];
-cx q[71],q[41];
-cx q[48],q[44];
-cx q[44],q[71];
-cx q[71],q[48];
-cx q[60],q[54];
-cx q[54],q[71];
-cx q[71],q[60];
-cx q[63],q[62];
-cx q[62],q[71];
-cx q[71],q[63];
-cx q[76],q[72];
-cx q[72],q[71];
-cx q[71],q[76];
-cx q[81],q[79];
-cx q[79],q[71];
-cx q[71],q[81];
-cx q[90],q[87];
-cx q[87],q[71];
-cx q[71],q[90];
-cx q[97],q[92];
-cx q[92],q[71];
-cx q[71],q[97];
-s q[0];
-h q[0];
-h q[1];
-s q[1];
-s q[2];
-h q[4];
-h q[6];
-s q[8];
-h q[10];
-s q[11];
-h q[11];
-h q[12];
-s q[15];
-h q[16];
-s q[16];
-s q[17];
-h q[17];
-h q[18];
-h q[19];
-s q[19];
-h q[21];
-s q[21];
-s q[22];
-h q[22];
-s q[24];
-h q[24];
-h q[25];
-s q[27];
-h q[27];
-s q[27];
-h q[28];
-s q[28];
-h q[29];
-s q[30];
-h q[30];
-h q[32];
-s q[32];
-h q[33];
-s q[34];
-s q[36];
-h q[36];
-s q[38];
-h q[38];
-s q[39];
-s q[40];
-h q[40];
-h q[41];
-h q[42];
-h q[43];
-h q[44];
-s q[45];
-h q[45];
-s q[45];
-s q[48];
-h q[48];
-h q[50];
-s q[51];
-h q[51];
-s q[55];
-h q[55];
-h q[58];
-s q[59];
-h q[59];
-s q[59];
-h q[63];
-s q[64];
-s q[65];
-h q[65];
-h q[67];
-h q[68];
-s q[69];
-h q[70];
-s q[73];
-s q[75];
-h q[75];
-s q[75];
-s q[76];
-h q[82];
-h q[83];
-s q[83];
-s q[84];
-s q[85];
-h q[85];
-s q[86];
-h q[86];
-h q[87];
-s q[88];
-h q[89];
-h q[90];
-h q[91];
-s q[92];
-h q[92];
-s q[93];
-h q[93];
-h q[95];
-s q[95];
-h q[97];
-h q[98];
-swap q[53],q[1];
-cx q[53],q[2];
-cx q[53],q[3];
-cx q[53],q[4];
-cx q[53],q[6];
-cx q[53],q[9];
-cx q[53],q[12];
-cx q[53],q[14];
-cx q[53],q[18];
-cx q[53],q[20];
-cx q[53],q[42];
-cx q[53],q[44];
-cx q[53],q[50];
-cx q[53],q[52];
-cx q[53],q[61];
-cx q[53],q[62];
-cx q[53],q[63];
-cx q[53],q[64];
-cx q[53],q[68];
-cx q[53],q[69];
-cx q[53],q[73];
-cx q[53],q[82];
-cx q[53],q[87];
-cx q[53],q[98];
-cx q[0],q[53];
-cx q[17],q[53];
-cx q[22],q[53];
-cx q[29],q[53];
-cx q[30],q[53];
-cx q[36],q[53];
-cx q[37],q[53];
-cx q[38],q[53];
-cx q[40],q[53];
-cx q[48],q[53];
-cx q[49],q[53];
-cx q[55],q[53];
-cx q[58],q[53];
-cx q[67],q[53];
-cx q[89],q[53];
-cx q[91],q[53];
-cx q[92],q[53];
-cx q[93],q[53];
-cx q[5],q[7];
-cx q[5],q[23];
-cx q[5],q[25];
-cx q[5],q[31];
-cx q[5],q[33];
-cx q[5],q[34];
-cx q[5],q[41];
-cx q[5],q[43];
-cx q[5],q[54];
-cx q[5],q[70];
-cx q[5],q[74];
-cx q[5],q[76];
-cx q[5],q[84];
-cx q[5],q[88];
-cx q[5],q[90];
-cx q[5],q[94];
-cx q[5],q[96];
-cx q[53],q[5];
-h q[5];
-cx q[5],q[53];
-cx q[10],q[8];
-cx q[8],q[53];
-cx q[53],q[10];
-cx q[15],q[11];
-cx q[11],q[53];
-cx q[53],q[15];
-cx q[19],q[16];
-cx q[16],q[53];
-cx q[53],q[19];
-cx q[24],q[21];
-cx q[21],q[53];
-cx q[53],q[24];
-cx q[28],q[27];
-cx q[27],q[53];
-cx q[53],q[28];
-cx q[39],q[32];
-cx q[32],q[53];
-cx q[53],q[39];
-cx q[51],q[45];
-cx q[45],q[53];
-cx q[53],q[51];
-cx q[65],q[59];
-cx q[59],q[53];
-cx q[53],q[65];
-cx q[72],q[66];
-cx q[66],q[53];
-cx q[53],q[72];
-cx q[79],q[75];
-cx q[75],q[53];
-cx q[53],q[79];
-cx q[83],q[81];
-cx q[81],q[53];
-cx q[53],q[83];
-cx q[86],q[85];
-cx q[85],q[53];
-cx q[53],q[86];
-cx q[97],q[95];
-cx q[95],q[53];
-cx q[53],q[97];
-h q[0];
-s q[1];
-s q[2];
-h q[2];
-h q[4];
-h q[5];
-s q[6];
-s q[7];
-h q[8];
-h q[10];
-s q[11];
-h q[12];
-s q[13];
-s q[16];
-h q[16];
-s q[16];
-s q[17];
-h q[17];
-s q[17];
-h q[18];
-h q[19];
-h q[20];
-h q[22];
-s q[23];
-h q[23];
-h q[26];
-s q[27];
-h q[32];
-h q[34];
-h q[35];
-s q[36];
-h q[36];
-h q[37];
-h q[39];
-s q[39];
-h q[40];
-s q[41];
-h q[42];
-h q[43];
-h q[44];
-h q[46];
-s q[46];
-h q[47];
-h q[48];
-s q[49];
-s q[51];
-h q[54];
-s q[55];
-h q[56];
-h q[59];
-s q[60];
-h q[60];
-s q[60];
-h q[61];
-h q[63];
-s q[64];
-s q[65];
-h q[70];
-s q[72];
-h q[72];
-s q[72];
-s q[75];
-s q[77];
-h q[77];
-s q[80];
-h q[80];
-s q[80];
-s q[81];
-h q[81];
-h q[82];
-s q[86];
-h q[87];
-s q[88];
-h q[88];
-h q[89];
-s q[91];
-h q[92];
-s q[98];
-swap q[70],q[2];
-cx q[70],q[0];
-cx q[70],q[3];
-cx q[70],q[5];
-cx q[70],q[6];
-cx q[70],q[9];
-cx q[70],q[10];
-cx q[70],q[14];
-cx q[70],q[20];
-cx q[70],q[27];
-cx q[70],q[40];
-cx q[70],q[49];
-cx q[70],q[50];
-cx q[70],q[52];
-cx q[70],q[61];
-cx q[70],q[73];
-cx q[70],q[83];
-cx q[70],q[87];
-cx q[70],q[89];
-cx q[70],q[90];
-cx q[70],q[94];
-cx q[70],q[2];
-cx q[12],q[70];
-cx q[19],q[70];
-cx q[23],q[70];
-cx q[24],q[70];
-cx q[26],q[70];
-cx q[36],q[70];
-cx q[38],q[70];
-cx q[42],q[70];
-cx q[47],q[70];
-cx q[48],q[70];
-cx q[74],q[70];
-cx q[79],q[70];
-cx q[81],q[70];
-cx q[92],q[70];
-cx q[97],q[70];
-cx q[1],q[7];
-cx q[1],q[8];
-cx q[1],q[11];
-cx q[1],q[13];
-cx q[1],q[18];
-cx q[1],q[22];
-cx q[1],q[25];
-cx q[1],q[31];
-cx q[1],q[32];
-cx q[1],q[33];
-cx q[1],q[37];
-cx q[1],q[41];
-cx q[1],q[43];
-cx q[1],q[54];
-cx q[1],q[55];
-cx q[1],q[57];
-cx q[1],q[58];
-cx q[1],q[63];
-cx q[1],q[65];
-cx q[1],q[69];
-cx q[1],q[75];
-cx q[1],q[93];
-cx q[1],q[96];
-cx q[70],q[1];
-h q[1];
-cx q[1],q[70];
-cx q[15],q[4];
-cx q[4],q[70];
-cx q[70],q[15];
-cx q[17],q[16];
-cx q[16],q[70];
-cx q[70],q[17];
-cx q[35],q[34];
-cx q[34],q[70];
-cx q[70],q[35];
-cx q[44],q[39];
-cx q[39],q[70];
-cx q[70],q[44];
-cx q[46],q[45];
-cx q[45],q[70];
-cx q[70],q[46];
-cx q[56],q[51];
-cx q[51],q[70];
-cx q[70],q[56];
-cx q[60],q[59];
-cx q[59],q[70];
-cx q[70],q[60];
-cx q[68],q[64];
-cx q[64],q[70];
-cx q[70],q[68];
-cx q[77],q[72];
-cx q[72],q[70];
-cx q[70],q[77];
-cx q[80],q[78];
-cx q[78],q[70];
-cx q[70],q[80];
-cx q[86],q[82];
-cx q[82],q[70];
-cx q[70],q[86];
-cx q[91],q[88];
-cx q[88],q[70];
-cx q[70],q[91];
-cx q[99],q[98];
-cx q[98],q[70];
-cx q[70],q[99];
-s q[0];
-s q[2];
-s q[3];
-h q[3];
-h q[6];
-h q[7];
-s q[8];
-h q[9];
-s q[10];
-h q[10];
-s q[10];
-h q[11];
-s q[12];
-h q[13];
-s q[15];
-h q[17];
-h q[18];
-h q[19];
-s q[20];
-h q[21];
-h q[23];
-s q[24];
-h q[24];
-s q[26];
-s q[29];
-h q[29];
-s q[29];
-h q[30];
-h q[33];
-h q[34];
-s q[35];
-s q[36];
-h q[37];
-s q[37];
-s q[43];
-s q[44];
-h q[46];
-s q[47];
-h q[47];
-h q[48];
-s q[49];
-h q[49];
-s q[49];
-h q[51];
-s q[56];
-h q[56];
-h q[60];
-h q[61];
-h q[62];
-h q[63];
-s q[64];
-h q[64];
-s q[65];
-s q[66];
-h q[66];
-h q[67];
-h q[68];
-s q[69];
-s q[72];
-h q[73];
-h q[75];
-h q[76];
-s q[77];
-s q[78];
-h q[78];
-h q[82];
-h q[86];
-s q[87];
-h q[87];
-h q[88];
-h q[89];
-s q[91];
-h q[91];
-s q[93];
-s q[94];
-h q[95];
-s q[97];
-h q[97];
-s q[98];
-s q[99];
-cx q[74],q[0];
-cx q[74],q[8];
-cx q[74],q[13];
-cx q[74],q[16];
-cx q[74],q[18];
-cx q[74],q[25];
-cx q[74],q[30];
-cx q[74],q[33];
-cx q[74],q[39];
-cx q[74],q[44];
-cx q[74],q[50];
-cx q[74],q[51];
-cx q[74],q[59];
-cx q[74],q[68];
-cx q[74],q[79];
-cx q[74],q[86];
-cx q[74],q[88];
-cx q[74],q[93];
-cx q[74],q[95];
-cx q[74],q[98];
-cx q[1],q[74];
-cx q[7],q[74];
-cx q[11],q[74];
-cx q[19],q[74];
-cx q[21],q[74];
-cx q[24],q[74];
-cx q[45],q[74];
-cx q[46],q[74];
-cx q[47],q[74];
-cx q[48],q[74];
-cx q[56],q[74];
-cx q[58],q[74];
-cx q[63],q[74];
-cx q[75],q[74];
-cx q[76],q[74];
-cx q[89],q[74];
-cx q[91],q[74];
-cx q[5],q[6];
-cx q[5],q[14];
-cx q[5],q[15];
-cx q[5],q[17];
-cx q[5],q[20];
-cx q[5],q[23];
-cx q[5],q[27];
-cx q[5],q[31];
-cx q[5],q[35];
-cx q[5],q[36];
-cx q[5],q[38];
-cx q[5],q[43];
-cx q[5],q[60];
-cx q[5],q[62];
-cx q[5],q[65];
-cx q[5],q[67];
-cx q[5],q[69];
-cx q[5],q[72];
-cx q[5],q[73];
-cx q[5],q[77];
-cx q[5],q[83];
-cx q[5],q[85];
-cx q[5],q[90];
-cx q[5],q[99];
-cx q[74],q[5];
-h q[5];
-cx q[5],q[74];
-cx q[3],q[2];
-cx q[2],q[74];
-cx q[74],q[3];
-cx q[10],q[9];
-cx q[9],q[74];
-cx q[74],q[10];
-cx q[22],q[12];
-cx q[12],q[74];
-cx q[74],q[22];
-cx q[29],q[26];
-cx q[26],q[74];
-cx q[74],q[29];
-cx q[34],q[32];
-cx q[32],q[74];
-cx q[74],q[34];
-cx q[41],q[37];
-cx q[37],q[74];
-cx q[74],q[41];
-cx q[55],q[49];
-cx q[49],q[74];
-cx q[74],q[55];
-cx q[64],q[61];
-cx q[61],q[74];
-cx q[74],q[64];
-cx q[78],q[66];
-cx q[66],q[74];
-cx q[74],q[78];
-cx q[84],q[82];
-cx q[82],q[74];
-cx q[74],q[84];
-cx q[92],q[87];
-cx q[87],q[74];
-cx q[74],q[92];
-cx q[97],q[94];
-cx q[94],q[74];
-cx q[74],q[97];
-h q[0];
-s q[0];
-s q[1];
-h q[2];
-h q[3];
-s q[4];
-h q[4];
-h q[5];
-s q[7];
-h q[7];
-h q[9];
-s q[14];
-h q[14];
-h q[15];
-s q[16];
-s q[18];
-s q[19];
-h q[20];
-s q[27];
-h q[28];
-s q[29];
-h q[29];
-h q[31];
-s q[32];
-h q[32];
-s q[32];
-h q[35];
-s q[36];
-h q[38];
-s q[38];
-s q[39];
-h q[40];
-h q[42];
-s q[43];
-h q[45];
-s q[45];
-h q[46];
-h q[47];
-h q[48];
-s q[48];
-s q[49];
-h q[49];
-h q[51];
-h q[55];
-h q[56];
-s q[57];
-h q[57];
-h q[58];
-s q[59];
-s q[60];
-h q[60];
-h q[63];
-s q[64];
-s q[66];
-h q[66];
-s q[66];
-h q[67];
-s q[67];
-h q[68];
-s q[69];
-h q[72];
-h q[73];
-h q[75];
-h q[76];
-h q[78];
-s q[80];
-s q[81];
-h q[82];
-s q[84];
-s q[85];
-s q[86];
-h q[86];
-s q[87];
-h q[87];
-s q[88];
-s q[91];
-h q[92];
-s q[93];
-h q[93];
-s q[95];
-h q[96];
-s q[97];
-s q[98];
-s q[99];
-swap q[84],q[0];
-cx q[84],q[15];
-cx q[84],q[17];
-cx q[84],q[20];
-cx q[84],q[26];
-cx q[84],q[28];
-cx q[84],q[30];
-cx q[84],q[33];
-cx q[84],q[37];
-cx q[84],q[43];
-cx q[84],q[46];
-cx q[84],q[51];
-cx q[84],q[78];
-cx q[84],q[80];
-cx q[84],q[85];
-cx q[84],q[95];
-cx q[84],q[96];
-cx q[84],q[98];
-cx q[84],q[99];
-cx q[2],q[84];
-cx q[7],q[84];
-cx q[10],q[84];
-cx q[44],q[84];
-cx q[49],q[84];
-cx q[56],q[84];
-cx q[57],q[84];
-cx q[60],q[84];
-cx q[62],q[84];
-cx q[72],q[84];
-cx q[90],q[84];
-cx q[1],q[3];
-cx q[1],q[5];
-cx q[1],q[6];
-cx q[1],q[9];
-cx q[1],q[13];
-cx q[1],q[16];
-cx q[1],q[22];
-cx q[1],q[27];
-cx q[1],q[31];
-cx q[1],q[35];
-cx q[1],q[39];
-cx q[1],q[42];
-cx q[1],q[47];
-cx q[1],q[50];
-cx q[1],q[52];
-cx q[1],q[55];
-cx q[1],q[59];
-cx q[1],q[63];
-cx q[1],q[65];
-cx q[1],q[68];
-cx q[1],q[69];
-cx q[1],q[73];
-cx q[1],q[75];
-cx q[1],q[81];
-cx q[1],q[83];
-cx q[1],q[88];
-cx q[1],q[91];
-cx q[1],q[0];
-cx q[84],q[1];
-h q[1];
-cx q[1],q[84];
-cx q[8],q[4];
-cx q[4],q[84];
-cx q[84],q[8];
-cx q[14],q[12];
-cx q[12],q[84];
-cx q[84],q[14];
-cx q[19],q[18];
-cx q[18],q[84];
-cx q[84],q[19];
-cx q[32],q[29];
-cx q[29],q[84];
-cx q[84],q[32];
-cx q[38],q[36];
-cx q[36],q[84];
-cx q[84],q[38];
-cx q[45],q[40];
-cx q[40],q[84];
-cx q[84],q[45];
-cx q[58],q[48];
-cx q[48],q[84];
-cx q[84],q[58];
-cx q[66],q[64];
-cx q[64],q[84];
-cx q[84],q[66];
-cx q[76],q[67];
-cx q[67],q[84];
-cx q[84],q[76];
-cx q[82],q[79];
-cx q[79],q[84];
-cx q[84],q[82];
-cx q[87],q[86];
-cx q[86],q[84];
-cx q[84],q[87];
-cx q[92],q[89];
-cx q[89],q[84];
-cx q[84],q[92];
-cx q[97],q[93];
-cx q[93],q[84];
-cx q[84],q[97];
-s q[0];
-h q[0];
-s q[0];
-s q[3];
-h q[4];
-s q[5];
-h q[5];
-h q[6];
-h q[7];
-s q[7];
-s q[10];
-h q[10];
-s q[12];
-h q[12];
-s q[12];
-h q[13];
-s q[14];
-h q[17];
-h q[18];
-h q[19];
-h q[20];
-s q[21];
-h q[23];
-h q[24];
-h q[25];
-s q[25];
-s q[26];
-h q[28];
-h q[29];
-s q[30];
-h q[30];
-s q[30];
-s q[32];
-h q[32];
-h q[35];
-s q[36];
-h q[37];
-s q[38];
-h q[41];
-s q[41];
-s q[42];
-h q[42];
-h q[43];
-s q[45];
-s q[46];
-h q[47];
-h q[48];
-s q[49];
-h q[50];
-s q[52];
-h q[52];
-s q[52];
-h q[54];
-h q[55];
-s q[59];
-s q[63];
-h q[63];
-s q[64];
-h q[67];
-s q[67];
-h q[68];
-h q[69];
-s q[72];
-h q[72];
-h q[73];
-h q[75];
-s q[76];
-h q[77];
-h q[78];
-s q[79];
-s q[80];
-s q[85];
-h q[85];
-s q[85];
-s q[87];
-s q[88];
-h q[88];
-s q[89];
-h q[89];
-h q[90];
-h q[91];
-s q[91];
-s q[93];
-h q[93];
-s q[95];
-s q[96];
-s q[98];
-h q[99];
-cx q[35],q[4];
-cx q[35],q[6];
-cx q[35],q[11];
-cx q[35],q[13];
-cx q[35],q[14];
-cx q[35],q[15];
-cx q[35],q[16];
-cx q[35],q[22];
-cx q[35],q[24];
-cx q[35],q[47];
-cx q[35],q[55];
-cx q[35],q[59];
-cx q[35],q[62];
-cx q[35],q[69];
-cx q[35],q[76];
-cx q[35],q[78];
-cx q[35],q[82];
-cx q[35],q[87];
-cx q[35],q[92];
-cx q[35],q[94];
-cx q[35],q[98];
-cx q[2],q[35];
-cx q[5],q[35];
-cx q[9],q[35];
-cx q[10],q[35];
-cx q[19],q[35];
-cx q[28],q[35];
-cx q[32],q[35];
-cx q[33],q[35];
-cx q[40],q[35];
-cx q[48],q[35];
-cx q[51],q[35];
-cx q[54],q[35];
-cx q[72],q[35];
-cx q[89],q[35];
-cx q[93],q[35];
-cx q[3],q[8];
-cx q[3],q[17];
-cx q[3],q[20];
-cx q[3],q[23];
-cx q[3],q[34];
-cx q[3],q[36];
-cx q[3],q[37];
-cx q[3],q[38];
-cx q[3],q[43];
-cx q[3],q[45];
-cx q[3],q[46];
-cx q[3],q[49];
-cx q[3],q[50];
-cx q[3],q[56];
-cx q[3],q[58];
-cx q[3],q[60];
-cx q[3],q[64];
-cx q[3],q[66];
-cx q[3],q[68];
-cx q[3],q[73];
-cx q[3],q[80];
-cx q[3],q[83];
-cx q[3],q[90];
-cx q[3],q[95];
-cx q[3],q[96];
-cx q[3],q[99];
-cx q[35],q[3];
-h q[3];
-cx q[3],q[35];
-cx q[7],q[0];
-cx q[0],q[35];
-cx q[35],q[7];
-cx q[18],q[12];
-cx q[12],q[35];
-cx q[35],q[18];
-cx q[25],q[21];
-cx q[21],q[35];
-cx q[35],q[25];
-cx q[29],q[26];
-cx q[26],q[35];
-cx q[35],q[29];
-cx q[39],q[30];
-cx q[30],q[35];
-cx q[35],q[39];
-cx q[42],q[41];
-cx q[41],q[35];
-cx q[35],q[42];
-cx q[52],q[44];
-cx q[44],q[35];
-cx q[35],q[52];
-cx q[67],q[63];
-cx q[63],q[35];
-cx q[35],q[67];
-cx q[77],q[75];
-cx q[75],q[35];
-cx q[35],q[77];
-cx q[81],q[79];
-cx q[79],q[35];
-cx q[35],q[81];
-cx q[88],q[85];
-cx q[85],q[35];
-cx q[35],q[88];
-cx q[97],q[91];
-cx q[91],q[35];
-cx q[35],q[97];
-s q[0];
-h q[0];
-h q[2];
-h q[4];
-h q[5];
-s q[6];
-h q[6];
-s q[7];
-h q[7];
-s q[8];
-h q[8];
-s q[11];
-h q[11];
-s q[12];
-h q[12];
-h q[14];
-h q[15];
-h q[16];
-s q[18];
-h q[18];
-h q[19];
-s q[20];
-s q[22];
-h q[22];
-s q[23];
-s q[24];
-h q[24];
-h q[25];
-h q[26];
-h q[27];
-s q[30];
-s q[31];
-s q[32];
-s q[33];
-h q[34];
-s q[36];
-h q[37];
-s q[37];
-s q[38];
-h q[38];
-s q[39];
-h q[39];
-s q[39];
-s q[40];
-h q[40];
-h q[41];
-s q[41];
-h q[42];
-h q[43];
-s q[45];
-h q[45];
-s q[46];
-s q[47];
-h q[47];
-h q[48];
-h q[52];
-s q[55];
-h q[55];
-s q[55];
-s q[56];
-h q[56];
-s q[56];
-h q[58];
-s q[59];
-h q[59];
-h q[60];
-h q[61];
-s q[62];
-s q[64];
-h q[65];
-h q[67];
-s q[67];
-s q[68];
-s q[69];
-s q[75];
-h q[79];
-s q[80];
-h q[80];
-s q[80];
-h q[81];
-s q[83];
-s q[85];
-h q[88];
-s q[88];
-h q[90];
-h q[94];
-h q[95];
-s q[95];
-s q[97];
-s q[98];
-h q[98];
-s q[98];
-h q[99];
-swap q[10],q[0];
-cx q[10],q[1];
-cx q[10],q[14];
-cx q[10],q[20];
-cx q[10],q[23];
-cx q[10],q[29];
-cx q[10],q[32];
-cx q[10],q[33];
-cx q[10],q[43];
-cx q[10],q[49];
-cx q[10],q[52];
-cx q[10],q[61];
-cx q[10],q[66];
-cx q[10],q[68];
-cx q[10],q[72];
-cx q[10],q[83];
-cx q[10],q[90];
-cx q[10],q[92];
-cx q[10],q[94];
-cx q[10],q[97];
-cx q[10],q[99];
-cx q[6],q[10];
-cx q[7],q[10];
-cx q[8],q[10];
-cx q[16],q[10];
-cx q[18],q[10];
-cx q[22],q[10];
-cx q[24],q[10];
-cx q[45],q[10];
-cx q[47],q[10];
-cx q[73],q[10];
-cx q[76],q[10];
-cx q[82],q[10];
-cx q[86],q[10];
-cx q[0],q[10];
-cx q[3],q[4];
-cx q[3],q[15];
-cx q[3],q[19];
-cx q[3],q[21];
-cx q[3],q[25];
-cx q[3],q[26];
-cx q[3],q[27];
-cx q[3],q[30];
-cx q[3],q[31];
-cx q[3],q[34];
-cx q[3],q[36];
-cx q[3],q[58];
-cx q[3],q[62];
-cx q[3],q[65];
-cx q[3],q[79];
-cx q[3],q[85];
-cx q[3],q[91];
-cx q[10],q[3];
-h q[3];
-cx q[3],q[10];
-cx q[5],q[2];
-cx q[2],q[10];
-cx q[10],q[5];
-cx q[12],q[11];
-cx q[11],q[10];
-cx q[10],q[12];
-cx q[28],q[17];
-cx q[17],q[10];
-cx q[10],q[28];
-cx q[38],q[37];
-cx q[37],q[10];
-cx q[10],q[38];
-cx q[40],q[39];
-cx q[39],q[10];
-cx q[10],q[40];
-cx q[42],q[41];
-cx q[41],q[10];
-cx q[10],q[42];
-cx q[46],q[44];
-cx q[44],q[10];
-cx q[10],q[46];
-cx q[55],q[48];
-cx q[48],q[10];
-cx q[10],q[55];
-cx q[59],q[56];
-cx q[56],q[10];
-cx q[10],q[59];
-cx q[63],q[60];
-cx q[60],q[10];
-cx q[10],q[63];
-cx q[67],q[64];
-cx q[64],q[10];
-cx q[10],q[67];
-cx q[75],q[69];
-cx q[69],q[10];
-cx q[10],q[75];
-cx q[80],q[78];
-cx q[78],q[10];
-cx q[10],q[80];
-cx q[88],q[81];
-cx q[81],q[10];
-cx q[10],q[88];
-cx q[98],q[95];
-cx q[95],q[10];
-cx q[10],q[98];
-s q[0];
-h q[5];
-s q[5];
-s q[7];
-s q[9];
-s q[12];
-h q[15];
-s q[16];
-h q[16];
-h q[17];
-h q[18];
-s q[18];
-s q[19];
-s q[20];
-h q[21];
-h q[22];
-s q[22];
-s q[23];
-h q[23];
-s q[23];
-s q[24];
-h q[24];
-s q[26];
-h q[28];
-s q[30];
-h q[30];
-s q[31];
-h q[33];
-h q[34];
-h q[38];
-s q[38];
-h q[40];
-h q[43];
-s q[45];
-h q[46];
-s q[47];
-s q[48];
-h q[48];
-s q[50];
-s q[54];
-h q[54];
-h q[56];
-s q[56];
-s q[59];
-h q[59];
-s q[61];
-h q[61];
-s q[62];
-s q[64];
-s q[67];
-h q[67];
-s q[67];
-h q[72];
-h q[73];
-s q[76];
-h q[78];
-s q[79];
-h q[79];
-h q[80];
-s q[81];
-s q[82];
-h q[83];
-h q[85];
-h q[86];
-s q[88];
-s q[90];
-h q[90];
-s q[90];
-s q[91];
-h q[93];
-s q[94];
-h q[95];
-h q[96];
-h q[97];
-h q[98];
-s q[99];
-h q[99];
-s q[99];
-swap q[92],q[5];
-cx q[92],q[0];
-cx q[92],q[6];
-cx q[92],q[7];
-cx q[92],q[17];
-cx q[92],q[28];
-cx q[92],q[31];
-cx q[92],q[41];
-cx q[92],q[42];
-cx q[92],q[45];
-cx q[92],q[62];
-cx q[92],q[66];
-cx q[92],q[72];
-cx q[92],q[73];
-cx q[92],q[78];
-cx q[92],q[83];
-cx q[92],q[89];
-cx q[92],q[98];
-cx q[2],q[92];
-cx q[8],q[92];
-cx q[13],q[92];
-cx q[14],q[92];
-cx q[15],q[92];
-cx q[24],q[92];
-cx q[25],q[92];
-cx q[29],q[92];
-cx q[33],q[92];
-cx q[34],q[92];
-cx q[44],q[92];
-cx q[46],q[92];
-cx q[49],q[92];
-cx q[54],q[92];
-cx q[57],q[92];
-cx q[68],q[92];
-cx q[77],q[92];
-cx q[85],q[92];
-cx q[86],q[92];
-cx q[93],q[92];
-cx q[96],q[92];
-cx q[3],q[4];
-cx q[3],q[9];
-cx q[3],q[11];
-cx q[3],q[12];
-cx q[3],q[21];
-cx q[3],q[26];
-cx q[3],q[27];
-cx q[3],q[39];
-cx q[3],q[50];
-cx q[3],q[63];
-cx q[3],q[64];
-cx q[3],q[82];
-cx q[3],q[87];
-cx q[3],q[88];
-cx q[3],q[91];
-cx q[3],q[97];
-cx q[92],q[3];
-h q[3];
-cx q[3],q[92];
-cx q[18],q[16];
-cx q[16],q[92];
-cx q[92],q[18];
-cx q[20],q[19];
-cx q[19],q[92];
-cx q[92],q[20];
-cx q[23],q[22];
-cx q[22],q[92];
-cx q[92],q[23];
-cx q[38],q[30];
-cx q[30],q[92];
-cx q[92],q[38];
-cx q[43],q[40];
-cx q[40],q[92];
-cx q[92],q[43];
-cx q[48],q[47];
-cx q[47],q[92];
-cx q[92],q[48];
-cx q[56],q[51];
-cx q[51],q[92];
-cx q[92],q[56];
-cx q[61],q[59];
-cx q[59],q[92];
-cx q[92],q[61];
-cx q[69],q[67];
-cx q[67],q[92];
-cx q[92],q[69];
-cx q[79],q[76];
-cx q[76],q[92];
-cx q[92],q[79];
-cx q[81],q[80];
-cx q[80],q[92];
-cx q[92],q[81];
-cx q[94],q[90];
-cx q[90],q[92];
-cx q[92],q[94];
-cx q[99],q[95];
-cx q[95],q[92];
-cx q[92],q[99];
-s q[0];
-h q[0];
-s q[3];
-h q[3];
-h q[5];
-h q[7];
-h q[8];
-h q[11];
-s q[11];
-h q[14];
-s q[15];
-h q[16];
-s q[16];
-h q[17];
-s q[18];
-h q[19];
-s q[20];
-s q[21];
-h q[21];
-s q[22];
-h q[22];
-h q[23];
-s q[25];
-h q[25];
-s q[27];
-h q[29];
-s q[30];
-h q[30];
-h q[34];
-s q[34];
-s q[36];
-h q[36];
-h q[37];
-s q[37];
-h q[38];
-s q[40];
-h q[40];
-s q[40];
-h q[41];
-s q[41];
-h q[42];
-s q[44];
-h q[44];
-h q[45];
-s q[46];
-h q[46];
-s q[47];
-h q[48];
-h q[50];
-h q[51];
-s q[52];
-h q[52];
-s q[52];
-h q[56];
-h q[58];
-h q[60];
-s q[61];
-h q[61];
-s q[62];
-h q[64];
-s q[66];
-h q[66];
-s q[67];
-h q[67];
-h q[68];
-s q[69];
-s q[75];
-s q[76];
-h q[76];
-s q[76];
-s q[79];
-h q[79];
-h q[80];
-s q[82];
-h q[82];
-s q[85];
-h q[85];
-h q[86];
-h q[90];
-h q[93];
-h q[95];
-s q[95];
-s q[96];
-h q[96];
-s q[97];
-s q[98];
-s q[99];
-swap q[85],q[0];
-cx q[85],q[1];
-cx q[85],q[8];
-cx q[85],q[9];
-cx q[85],q[18];
-cx q[85],q[27];
-cx q[85],q[32];
-cx q[85],q[51];
-cx q[85],q[55];
-cx q[85],q[59];
-cx q[85],q[73];
-cx q[85],q[78];
-cx q[85],q[83];
-cx q[85],q[93];
-cx q[85],q[99];
-cx q[4],q[85];
-cx q[5],q[85];
-cx q[6],q[85];
-cx q[17],q[85];
-cx q[22],q[85];
-cx q[26],q[85];
-cx q[36],q[85];
-cx q[39],q[85];
-cx q[46],q[85];
-cx q[48],q[85];
-cx q[58],q[85];
-cx q[60],q[85];
-cx q[64],q[85];
-cx q[66],q[85];
-cx q[67],q[85];
-cx q[68],q[85];
-cx q[79],q[85];
-cx q[88],q[85];
-cx q[91],q[85];
-cx q[0],q[85];
-cx q[14],q[15];
-cx q[14],q[19];
-cx q[14],q[23];
-cx q[14],q[24];
-cx q[14],q[29];
-cx q[14],q[38];
-cx q[14],q[42];
-cx q[14],q[45];
-cx q[14],q[47];
-cx q[14],q[50];
-cx q[14],q[54];
-cx q[14],q[56];
-cx q[14],q[65];
-cx q[14],q[75];
-cx q[14],q[81];
-cx q[14],q[94];
-cx q[14],q[97];
-cx q[14],q[98];
-cx q[85],q[14];
-h q[14];
-cx q[14],q[85];
-cx q[7],q[3];
-cx q[3],q[85];
-cx q[85],q[7];
-cx q[13],q[11];
-cx q[11],q[85];
-cx q[85],q[13];
-cx q[20],q[16];
-cx q[16],q[85];
-cx q[85],q[20];
-cx q[25],q[21];
-cx q[21],q[85];
-cx q[85],q[25];
-cx q[34],q[30];
-cx q[30],q[85];
-cx q[85],q[34];
-cx q[40],q[37];
-cx q[37],q[85];
-cx q[85],q[40];
-cx q[43],q[41];
-cx q[41],q[85];
-cx q[85],q[43];
-cx q[49],q[44];
-cx q[44],q[85];
-cx q[85],q[49];
-cx q[61],q[52];
-cx q[52],q[85];
-cx q[85],q[61];
-cx q[69],q[62];
-cx q[62],q[85];
-cx q[85],q[69];
-cx q[77],q[76];
-cx q[76],q[85];
-cx q[85],q[77];
-cx q[82],q[80];
-cx q[80],q[85];
-cx q[85],q[82];
-cx q[90],q[86];
-cx q[86],q[85];
-cx q[85],q[90];
-cx q[96],q[95];
-cx q[95],q[85];
-cx q[85],q[96];
-h q[0];
-h q[3];
-s q[4];
-h q[4];
-s q[4];
-s q[5];
-h q[6];
-s q[7];
-h q[8];
-h q[9];
-h q[11];
-s q[11];
-s q[12];
-s q[13];
-s q[14];
-h q[14];
-s q[16];
-s q[18];
-s q[22];
-h q[22];
-s q[22];
-s q[23];
-h q[23];
-h q[25];
-s q[26];
-h q[28];
-s q[29];
-h q[29];
-h q[30];
-s q[32];
-h q[32];
-h q[33];
-h q[34];
-s q[34];
-h q[36];
-s q[38];
-h q[39];
-h q[41];
-s q[44];
-h q[44];
-s q[44];
-s q[45];
-h q[45];
-s q[45];
-s q[46];
-h q[46];
-s q[49];
-h q[50];
-h q[51];
-h q[55];
-s q[57];
-s q[58];
-h q[58];
-s q[59];
-h q[59];
-h q[63];
-s q[63];
-s q[64];
-h q[64];
-h q[65];
-s q[65];
-s q[66];
-h q[66];
-s q[66];
-s q[67];
-s q[72];
-s q[75];
-h q[76];
-s q[76];
-h q[77];
-s q[79];
-s q[81];
-h q[87];
-s q[88];
-h q[88];
-s q[88];
-s q[89];
-h q[91];
-h q[93];
-s q[97];
-s q[98];
-s q[99];
-cx q[25],q[1];
-cx q[25],q[9];
-cx q[25],q[15];
-cx q[25],q[24];
-cx q[25],q[28];
-cx q[25],q[30];
-cx q[25],q[50];
-cx q[25],q[55];
-cx q[25],q[75];
-cx q[25],q[86];
-cx q[25],q[89];
-cx q[25],q[93];
-cx q[25],q[99];
-cx q[6],q[25];
-cx q[8],q[25];
-cx q[20],q[25];
-cx q[23],q[25];
-cx q[27],q[25];
-cx q[29],q[25];
-cx q[33],q[25];
-cx q[36],q[25];
-cx q[41],q[25];
-cx q[42],q[25];
-cx q[46],q[25];
-cx q[51],q[25];
-cx q[58],q[25];
-cx q[73],q[25];
-cx q[77],q[25];
-cx q[78],q[25];
-cx q[87],q[25];
-cx q[90],q[25];
-cx q[3],q[7];
-cx q[3],q[13];
-cx q[3],q[16];
-cx q[3],q[17];
-cx q[3],q[38];
-cx q[3],q[57];
-cx q[3],q[61];
-cx q[3],q[67];
-cx q[3],q[72];
-cx q[3],q[81];
-cx q[3],q[82];
-cx q[3],q[83];
-cx q[3],q[95];
-cx q[3],q[98];
-cx q[25],q[3];
-h q[3];
-cx q[3],q[25];
-cx q[2],q[0];
-cx q[0],q[25];
-cx q[25],q[2];
-cx q[5],q[4];
-cx q[4],q[25];
-cx q[25],q[5];
-cx q[12],q[11];
-cx q[11],q[25];
-cx q[25],q[12];
-cx q[18],q[14];
-cx q[14],q[25];
-cx q[25],q[18];
-cx q[22],q[21];
-cx q[21],q[25];
-cx q[25],q[22];
-cx q[32],q[26];
-cx q[26],q[25];
-cx q[25],q[32];
-cx q[37],q[34];
-cx q[34],q[25];
-cx q[25],q[37];
-cx q[43],q[39];
-cx q[39],q[25];
-cx q[25],q[43];
-cx q[45],q[44];
-cx q[44],q[25];
-cx q[25],q[45];
-cx q[59],q[49];
-cx q[49],q[25];
-cx q[25],q[59];
-cx q[64],q[63];
-cx q[63],q[25];
-cx q[25],q[64];
-cx q[66],q[65];
-cx q[65],q[25];
-cx q[25],q[66];
-cx q[79],q[76];
-cx q[76],q[25];
-cx q[25],q[79];
-cx q[88],q[80];
-cx q[80],q[25];
-cx q[25],q[88];
-cx q[97],q[91];
-cx q[91],q[25];
-cx q[25],q[97];
-h q[1];
-s q[2];
-h q[2];
-s q[2];
-h q[3];
-s q[3];
-h q[4];
-s q[4];
-h q[5];
-h q[6];
-s q[9];
-s q[11];
-h q[11];
-h q[15];
-h q[16];
-s q[17];
-h q[17];
-s q[18];
-h q[19];
-s q[19];
-h q[20];
-s q[21];
-h q[21];
-s q[22];
-h q[24];
-s q[26];
-s q[28];
-h q[28];
-s q[30];
-s q[31];
-h q[33];
-s q[33];
-s q[34];
-h q[34];
-h q[37];
-h q[39];
-s q[42];
-h q[42];
-h q[43];
-s q[47];
-s q[50];
-h q[50];
-h q[51];
-h q[58];
-h q[60];
-h q[61];
-s q[61];
-h q[62];
-h q[63];
-h q[67];
-h q[68];
-s q[68];
-s q[75];
-h q[75];
-h q[76];
-h q[77];
-s q[77];
-s q[79];
-h q[79];
-s q[79];
-s q[81];
-h q[81];
-s q[81];
-h q[82];
-h q[83];
-h q[87];
-s q[87];
-s q[89];
-h q[89];
-s q[90];
-h q[90];
-s q[90];
-s q[91];
-h q[93];
-s q[96];
-s q[98];
-h q[99];
-swap q[31],q[0];
-cx q[31],q[5];
-cx q[31],q[15];
-cx q[31],q[43];
-cx q[31],q[48];
-cx q[31],q[49];
-cx q[31],q[54];
-cx q[31],q[55];
-cx q[31],q[60];
-cx q[31],q[65];
-cx q[31],q[66];
-cx q[31],q[69];
-cx q[31],q[78];
-cx q[31],q[83];
-cx q[31],q[88];
-cx q[31],q[95];
-cx q[31],q[96];
-cx q[31],q[99];
-cx q[17],q[31];
-cx q[20],q[31];
-cx q[24],q[31];
-cx q[28],q[31];
-cx q[29],q[31];
-cx q[42],q[31];
-cx q[46],q[31];
-cx q[50],q[31];
-cx q[63],q[31];
-cx q[89],q[31];
-cx q[93],q[31];
-cx q[1],q[6];
-cx q[1],q[8];
-cx q[1],q[9];
-cx q[1],q[16];
-cx q[1],q[18];
-cx q[1],q[22];
-cx q[1],q[23];
-cx q[1],q[27];
-cx q[1],q[30];
-cx q[1],q[36];
-cx q[1],q[44];
-cx q[1],q[47];
-cx q[1],q[57];
-cx q[1],q[58];
-cx q[1],q[62];
-cx q[1],q[67];
-cx q[1],q[72];
-cx q[1],q[73];
-cx q[1],q[0];
-cx q[31],q[1];
-h q[1];
-cx q[1],q[31];
-cx q[3],q[2];
-cx q[2],q[31];
-cx q[31],q[3];
-cx q[11],q[4];
-cx q[4],q[31];
-cx q[31],q[11];
-cx q[19],q[14];
-cx q[14],q[31];
-cx q[31],q[19];
-cx q[26],q[21];
-cx q[21],q[31];
-cx q[31],q[26];
-cx q[34],q[33];
-cx q[33],q[31];
-cx q[31],q[34];
-cx q[39],q[37];
-cx q[37],q[31];
-cx q[31],q[39];
-cx q[51],q[41];
-cx q[41],q[31];
-cx q[31],q[51];
-cx q[59],q[56];
-cx q[56],q[31];
-cx q[31],q[59];
-cx q[68],q[61];
-cx q[61],q[31];
-cx q[31],q[68];
-cx q[76],q[75];
-cx q[75],q[31];
-cx q[31],q[76];
-cx q[79],q[77];
-cx q[77],q[31];
-cx q[31],q[79];
-cx q[81],q[80];
-cx q[80],q[31];
-cx q[31],q[81];
-cx q[87],q[82];
-cx q[82],q[31];
-cx q[31],q[87];
-cx q[91],q[90];
-cx q[90],q[31];
-cx q[31],q[91];
-cx q[98],q[94];
-cx q[94],q[31];
-cx q[31],q[98];
-h q[0];
-s q[2];
-h q[3];
-s q[5];
-h q[5];
-h q[6];
-s q[6];
-h q[7];
-h q[8];
-h q[11];
-h q[18];
-s q[18];
-h q[19];
-s q[20];
-h q[20];
-h q[23];
-h q[26];
-s q[27];
-h q[27];
-h q[28];
-s q[29];
-h q[29];
-s q[30];
-h q[30];
-s q[30];
-h q[32];
-s q[33];
-h q[34];
-s q[41];
-h q[41];
-s q[41];
-s q[42];
-s q[43];
-s q[44];
-h q[44];
-s q[46];
-h q[46];
-h q[47];
-s q[48];
-s q[51];
-s q[52];
-h q[54];
-s q[54];
-s q[56];
-s q[57];
-h q[57];
-s q[58];
-h q[58];
-s q[59];
-s q[60];
-h q[60];
-h q[62];
-s q[63];
-h q[63];
-h q[65];
-h q[68];
-h q[69];
-s q[72];
-h q[73];
-s q[75];
-h q[76];
-s q[77];
-h q[78];
-s q[79];
-s q[81];
-h q[81];
-s q[81];
-h q[86];
-s q[87];
-h q[87];
-h q[88];
-s q[91];
-h q[93];
-s q[93];
-s q[96];
-s q[98];
-h q[98];
-cx q[18],q[1];
-cx q[18],q[11];
-cx q[18],q[12];
-cx q[18],q[17];
-cx q[18],q[22];
-cx q[18],q[26];
-cx q[18],q[28];
-cx q[18],q[32];
-cx q[18],q[33];
-cx q[18],q[39];
-cx q[18],q[48];
-cx q[18],q[52];
-cx q[18],q[59];
-cx q[18],q[67];
-cx q[18],q[75];
-cx q[18],q[77];
-cx q[18],q[97];
-cx q[3],q[18];
-cx q[7],q[18];
-cx q[19],q[18];
-cx q[20],q[18];
-cx q[24],q[18];
-cx q[27],q[18];
-cx q[29],q[18];
-cx q[36],q[18];
-cx q[46],q[18];
-cx q[50],q[18];
-cx q[57],q[18];
-cx q[61],q[18];
-cx q[63],q[18];
-cx q[65],q[18];
-cx q[73],q[18];
-cx q[76],q[18];
-cx q[78],q[18];
-cx q[82],q[18];
-cx q[86],q[18];
-cx q[87],q[18];
-cx q[88],q[18];
-cx q[98],q[18];
-cx q[99],q[18];
-cx q[2],q[8];
-cx q[2],q[14];
-cx q[2],q[21];
-cx q[2],q[23];
-cx q[2],q[34];
-cx q[2],q[42];
-cx q[2],q[49];
-cx q[2],q[51];
-cx q[2],q[56];
-cx q[2],q[68];
-cx q[2],q[69];
-cx q[2],q[91];
-cx q[2],q[96];
-cx q[18],q[2];
-h q[2];
-cx q[2],q[18];
-cx q[5],q[0];
-cx q[0],q[18];
-cx q[18],q[5];
-cx q[13],q[6];
-cx q[6],q[18];
-cx q[18],q[13];
-cx q[30],q[16];
-cx q[16],q[18];
-cx q[18],q[30];
-cx q[41],q[37];
-cx q[37],q[18];
-cx q[18],q[41];
-cx q[44],q[43];
-cx q[43],q[18];
-cx q[18],q[44];
-cx q[54],q[47];
-cx q[47],q[18];
-cx q[18],q[54];
-cx q[58],q[55];
-cx q[55],q[18];
-cx q[18],q[58];
-cx q[62],q[60];
-cx q[60],q[18];
-cx q[18],q[62];
-cx q[79],q[72];
-cx q[72],q[18];
-cx q[18],q[79];
-cx q[83],q[81];
-cx q[81],q[18];
-cx q[18],q[83];
-cx q[93],q[89];
-cx q[89],q[18];
-cx q[18],q[93];
-s q[0];
-h q[0];
-s q[0];
-s q[1];
-h q[1];
-s q[1];
-h q[3];
-h q[7];
-s q[8];
-s q[9];
-h q[9];
-s q[11];
-h q[11];
-s q[13];
-h q[13];
-s q[14];
-s q[15];
-h q[17];
-h q[19];
-s q[20];
-s q[21];
-h q[21];
-s q[22];
-h q[22];
-h q[24];
-s q[26];
-h q[26];
-s q[26];
-s q[27];
-s q[28];
-h q[28];
-s q[28];
-s q[29];
-h q[32];
-s q[33];
-h q[33];
-s q[33];
-s q[37];
-s q[38];
-h q[38];
-s q[41];
-s q[43];
-s q[45];
-s q[46];
-s q[48];
-h q[48];
-s q[50];
-h q[50];
-h q[52];
-s q[55];
-h q[55];
-h q[56];
-s q[57];
-h q[57];
-s q[61];
-s q[62];
-h q[63];
-h q[64];
-s q[66];
-s q[67];
-h q[67];
-s q[69];
-h q[69];
-s q[69];
-s q[73];
-h q[75];
-s q[76];
-h q[76];
-s q[76];
-h q[77];
-s q[77];
-s q[78];
-h q[78];
-s q[79];
-h q[79];
-h q[80];
-h q[81];
-h q[82];
-s q[82];
-s q[83];
-s q[86];
-s q[87];
-h q[87];
-h q[88];
-s q[91];
-s q[94];
-h q[94];
-h q[98];
-swap q[99],q[0];
-cx q[99],q[2];
-cx q[99],q[4];
-cx q[99],q[5];
-cx q[99],q[7];
-cx q[99],q[12];
-cx q[99],q[15];
-cx q[99],q[16];
-cx q[99],q[17];
-cx q[99],q[19];
-cx q[99],q[27];
-cx q[99],q[30];
-cx q[99],q[36];
-cx q[99],q[39];
-cx q[99],q[42];
-cx q[99],q[43];
-cx q[99],q[46];
-cx q[99],q[47];
-cx q[99],q[58];
-cx q[99],q[63];
-cx q[99],q[75];
-cx q[99],q[81];
-cx q[99],q[90];
-cx q[99],q[93];
-cx q[99],q[97];
-cx q[9],q[99];
-cx q[13],q[99];
-cx q[21],q[99];
-cx q[22],q[99];
-cx q[32],q[99];
-cx q[34],q[99];
-cx q[44],q[99];
-cx q[48],q[99];
-cx q[49],q[99];
-cx q[50],q[99];
-cx q[54],q[99];
-cx q[55],q[99];
-cx q[64],q[99];
-cx q[67],q[99];
-cx q[79],q[99];
-cx q[80],q[99];
-cx q[87],q[99];
-cx q[89],q[99];
-cx q[94],q[99];
-cx q[96],q[99];
-cx q[3],q[6];
-cx q[3],q[8];
-cx q[3],q[24];
-cx q[3],q[40];
-cx q[3],q[56];
-cx q[3],q[59];
-cx q[3],q[61];
-cx q[3],q[66];
-cx q[3],q[68];
-cx q[3],q[73];
-cx q[3],q[83];
-cx q[3],q[86];
-cx q[3],q[88];
-cx q[3],q[91];
-cx q[3],q[95];
-cx q[3],q[98];
-cx q[3],q[0];
-cx q[99],q[3];
-h q[3];
-cx q[3],q[99];
-cx q[11],q[1];
-cx q[1],q[99];
-cx q[99],q[11];
-cx q[20],q[14];
-cx q[14],q[99];
-cx q[99],q[20];
-cx q[28],q[26];
-cx q[26],q[99];
-cx q[99],q[28];
-cx q[33],q[29];
-cx q[29],q[99];
-cx q[99],q[33];
-cx q[38],q[37];
-cx q[37],q[99];
-cx q[99],q[38];
-cx q[45],q[41];
-cx q[41],q[99];
-cx q[99],q[45];
-cx q[57],q[52];
-cx q[52],q[99];
-cx q[99],q[57];
-cx q[69],q[62];
-cx q[62],q[99];
-cx q[99],q[69];
-cx q[77],q[76];
-cx q[76],q[99];
-cx q[99],q[77];
-cx q[82],q[78];
-cx q[78],q[99];
-cx q[99],q[82];
-h q[0];
-h q[1];
-s q[2];
-s q[3];
-s q[5];
-h q[5];
-s q[6];
-s q[8];
-h q[8];
-h q[12];
-s q[13];
-s q[14];
-h q[14];
-s q[15];
-h q[15];
-s q[15];
-h q[16];
-h q[17];
-s q[19];
-s q[21];
-h q[21];
-s q[21];
-h q[23];
-h q[24];
-h q[29];
-s q[30];
-h q[32];
-s q[36];
-h q[37];
-h q[38];
-h q[39];
-s q[39];
-s q[40];
-h q[40];
-s q[40];
-s q[41];
-s q[42];
-h q[42];
-h q[43];
-h q[45];
-s q[48];
-h q[48];
-s q[48];
-h q[49];
-s q[49];
-h q[51];
-s q[51];
-h q[52];
-h q[54];
-h q[56];
-h q[57];
-s q[58];
-h q[58];
-s q[60];
-h q[61];
-s q[62];
-h q[62];
-h q[63];
-h q[64];
-s q[65];
-h q[65];
-s q[65];
-s q[67];
-h q[67];
-s q[67];
-h q[76];
-s q[76];
-h q[77];
-s q[78];
-h q[78];
-s q[78];
-h q[80];
-h q[81];
-s q[81];
-h q[82];
-h q[83];
-h q[86];
-h q[87];
-s q[88];
-s q[89];
-h q[89];
-s q[93];
-h q[94];
-h q[95];
-h q[96];
-s q[97];
-h q[97];
-swap q[4],q[0];
-cx q[4],q[3];
-cx q[4],q[7];
-cx q[4],q[9];
-cx q[4],q[11];
-cx q[4],q[30];
-cx q[4],q[36];
-cx q[4],q[38];
-cx q[4],q[52];
-cx q[4],q[57];
-cx q[4],q[59];
-cx q[4],q[60];
-cx q[4],q[79];
-cx q[4],q[88];
-cx q[4],q[93];
-cx q[4],q[95];
-cx q[1],q[4];
-cx q[5],q[4];
-cx q[8],q[4];
-cx q[12],q[4];
-cx q[14],q[4];
-cx q[17],q[4];
-cx q[32],q[4];
-cx q[43],q[4];
-cx q[54],q[4];
-cx q[55],q[4];
-cx q[56],q[4];
-cx q[58],q[4];
-cx q[61],q[4];
-cx q[73],q[4];
-cx q[75],q[4];
-cx q[77],q[4];
-cx q[80],q[4];
-cx q[83],q[4];
-cx q[94],q[4];
-cx q[97],q[4];
-cx q[22],q[24];
-cx q[22],q[26];
-cx q[22],q[29];
-cx q[22],q[34];
-cx q[22],q[41];
-cx q[22],q[44];
-cx q[22],q[45];
-cx q[22],q[64];
-cx q[22],q[66];
-cx q[22],q[68];
-cx q[22],q[86];
-cx q[22],q[96];
-cx q[4],q[22];
-h q[22];
-cx q[22],q[4];
-cx q[6],q[2];
-cx q[2],q[4];
-cx q[4],q[6];
-cx q[15],q[13];
-cx q[13],q[4];
-cx q[4],q[15];
-cx q[19],q[16];
-cx q[16],q[4];
-cx q[4],q[19];
-cx q[23],q[21];
-cx q[21],q[4];
-cx q[4],q[23];
-cx q[33],q[28];
-cx q[28],q[4];
-cx q[4],q[33];
-cx q[39],q[37];
-cx q[37],q[4];
-cx q[4],q[39];
-cx q[42],q[40];
-cx q[40],q[4];
-cx q[4],q[42];
-cx q[48],q[47];
-cx q[47],q[4];
-cx q[4],q[48];
-cx q[51],q[49];
-cx q[49],q[4];
-cx q[4],q[51];
-cx q[63],q[62];
-cx q[62],q[4];
-cx q[4],q[63];
-cx q[67],q[65];
-cx q[65],q[4];
-cx q[4],q[67];
-cx q[78],q[76];
-cx q[76],q[4];
-cx q[4],q[78];
-cx q[82],q[81];
-cx q[81],q[4];
-cx q[4],q[82];
-cx q[89],q[87];
-cx q[87],q[4];
-cx q[4],q[89];
-h q[1];
-s q[3];
-h q[6];
-s q[11];
-h q[13];
-s q[14];
-s q[15];
-s q[16];
-h q[17];
-h q[19];
-h q[22];
-s q[22];
-h q[24];
-h q[27];
-s q[28];
-h q[28];
-s q[29];
-s q[30];
-h q[30];
-s q[32];
-h q[33];
-s q[36];
-h q[37];
-s q[38];
-s q[39];
-s q[40];
-h q[40];
-s q[42];
-s q[44];
-h q[44];
-s q[45];
-h q[45];
-s q[47];
-h q[50];
-s q[51];
-h q[54];
-s q[56];
-h q[56];
-h q[57];
-s q[58];
-h q[58];
-h q[59];
-s q[60];
-h q[61];
-s q[62];
-h q[63];
-s q[64];
-h q[64];
-h q[66];
-h q[67];
-s q[67];
-s q[72];
-s q[75];
-h q[75];
-s q[75];
-s q[77];
-h q[78];
-s q[78];
-h q[86];
-h q[87];
-s q[88];
-s q[89];
-s q[94];
-h q[94];
-h q[98];
-s q[98];
-swap q[89],q[0];
-cx q[89],q[6];
-cx q[89],q[19];
-cx q[89],q[23];
-cx q[89],q[27];
-cx q[89],q[36];
-cx q[89],q[38];
-cx q[89],q[46];
-cx q[89],q[47];
-cx q[89],q[62];
-cx q[89],q[83];
-cx q[89],q[86];
-cx q[89],q[0];
-cx q[24],q[89];
-cx q[28],q[89];
-cx q[33],q[89];
-cx q[34],q[89];
-cx q[40],q[89];
-cx q[48],q[89];
-cx q[52],q[89];
-cx q[57],q[89];
-cx q[66],q[89];
-cx q[76],q[89];
-cx q[80],q[89];
-cx q[87],q[89];
-cx q[93],q[89];
-cx q[96],q[89];
-cx q[1],q[3];
-cx q[1],q[7];
-cx q[1],q[9];
-cx q[1],q[11];
-cx q[1],q[13];
-cx q[1],q[14];
-cx q[1],q[16];
-cx q[1],q[17];
-cx q[1],q[26];
-cx q[1],q[29];
-cx q[1],q[37];
-cx q[1],q[39];
-cx q[1],q[42];
-cx q[1],q[51];
-cx q[1],q[59];
-cx q[1],q[68];
-cx q[1],q[77];
-cx q[1],q[79];
-cx q[1],q[88];
-cx q[1],q[91];
-cx q[1],q[97];
-cx q[89],q[1];
-h q[1];
-cx q[1],q[89];
-cx q[5],q[2];
-cx q[2],q[89];
-cx q[89],q[5];
-cx q[15],q[12];
-cx q[12],q[89];
-cx q[89],q[15];
-cx q[22],q[20];
-cx q[20],q[89];
-cx q[89],q[22];
-cx q[32],q[30];
-cx q[30],q[89];
-cx q[89],q[32];
-cx q[44],q[41];
-cx q[41],q[89];
-cx q[89],q[44];
-cx q[50],q[45];
-cx q[45],q[89];
-cx q[89],q[50];
-cx q[55],q[54];
-cx q[54],q[89];
-cx q[89],q[55];
-cx q[58],q[56];
-cx q[56],q[89];
-cx q[89],q[58];
-cx q[61],q[60];
-cx q[60],q[89];
-cx q[89],q[61];
-cx q[64],q[63];
-cx q[63],q[89];
-cx q[89],q[64];
-cx q[69],q[67];
-cx q[67],q[89];
-cx q[89],q[69];
-cx q[75],q[72];
-cx q[72],q[89];
-cx q[89],q[75];
-cx q[90],q[78];
-cx q[78],q[89];
-cx q[89],q[90];
-cx q[98],q[94];
-cx q[94],q[89];
-cx q[89],q[98];
-s q[0];
-h q[0];
-s q[2];
-h q[3];
-h q[6];
-h q[7];
-s q[8];
-s q[9];
-h q[9];
-h q[11];
-s q[14];
-h q[14];
-s q[16];
-s q[17];
-s q[19];
-h q[19];
-s q[20];
-h q[26];
-s q[27];
-h q[28];
-s q[28];
-h q[29];
-s q[34];
-h q[36];
-s q[38];
-h q[38];
-s q[38];
-s q[39];
-s q[41];
-h q[41];
-s q[42];
-h q[42];
-h q[44];
-s q[46];
-h q[46];
-h q[48];
-h q[49];
-h q[51];
-s q[52];
-h q[52];
-h q[54];
-s q[54];
-h q[55];
-h q[56];
-s q[57];
-h q[57];
-s q[62];
-s q[64];
-h q[64];
-s q[65];
-h q[65];
-s q[65];
-s q[66];
-s q[68];
-h q[68];
-s q[69];
-h q[69];
-s q[69];
-h q[72];
-s q[72];
-s q[73];
-h q[73];
-s q[75];
-s q[76];
-h q[76];
-s q[76];
-h q[78];
-h q[80];
-s q[80];
-h q[81];
-h q[88];
-h q[90];
-s q[90];
-h q[93];
-s q[93];
-s q[94];
-h q[94];
-h q[95];
-h q[96];
-h q[97];
-cx q[0],q[1];
-cx q[0],q[2];
-cx q[0],q[15];
-cx q[0],q[20];
-cx q[0],q[26];
-cx q[0],q[40];
-cx q[0],q[48];
-cx q[0],q[60];
-cx q[0],q[67];
-cx q[0],q[75];
-cx q[0],q[77];
-cx q[0],q[79];
-cx q[0],q[86];
-cx q[0],q[95];
-cx q[3],q[0];
-cx q[5],q[0];
-cx q[9],q[0];
-cx q[14],q[0];
-cx q[19],q[0];
-cx q[21],q[0];
-cx q[30],q[0];
-cx q[36],q[0];
-cx q[41],q[0];
-cx q[43],q[0];
-cx q[46],q[0];
-cx q[49],q[0];
-cx q[56],q[0];
-cx q[64],q[0];
-cx q[68],q[0];
-cx q[78],q[0];
-cx q[88],q[0];
-cx q[94],q[0];
-cx q[97],q[0];
-cx q[7],q[8];
-cx q[7],q[12];
-cx q[7],q[13];
-cx q[7],q[16];
-cx q[7],q[22];
-cx q[7],q[23];
-cx q[7],q[37];
-cx q[7],q[39];
-cx q[7],q[44];
-cx q[7],q[51];
-cx q[7],q[55];
-cx q[7],q[62];
-cx q[7],q[81];
-cx q[7],q[96];
-cx q[0],q[7];
-h q[7];
-cx q[7],q[0];
-cx q[11],q[6];
-cx q[6],q[0];
-cx q[0],q[11];
-cx q[24],q[17];
-cx q[17],q[0];
-cx q[0],q[24];
-cx q[28],q[27];
-cx q[27],q[0];
-cx q[0],q[28];
-cx q[34],q[29];
-cx q[29],q[0];
-cx q[0],q[34];
-cx q[42],q[38];
-cx q[38],q[0];
-cx q[0],q[42];
-cx q[54],q[52];
-cx q[52],q[0];
-cx q[0],q[54];
-cx q[61],q[57];
-cx q[57],q[0];
-cx q[0],q[61];
-cx q[66],q[65];
-cx q[65],q[0];
-cx q[0],q[66];
-cx q[72],q[69];
-cx q[69],q[0];
-cx q[0],q[72];
-cx q[76],q[73];
-cx q[73],q[0];
-cx q[0],q[76];
-cx q[87],q[80];
-cx q[80],q[0];
-cx q[0],q[87];
-cx q[91],q[90];
-cx q[90],q[0];
-cx q[0],q[91];
-cx q[98],q[93];
-cx q[93],q[0];
-cx q[0],q[98];
-h q[1];
-s q[2];
-s q[3];
-h q[3];
-s q[5];
-h q[6];
-s q[6];
-h q[9];
-h q[13];
-s q[14];
-h q[14];
-s q[15];
-s q[19];
-h q[19];
-s q[23];
-h q[23];
-s q[23];
-s q[24];
-h q[26];
-s q[27];
-h q[27];
-s q[27];
-h q[28];
-h q[32];
-s q[32];
-h q[33];
-s q[40];
-h q[40];
-s q[40];
-s q[42];
-s q[43];
-s q[44];
-s q[47];
-s q[50];
-h q[50];
-s q[51];
-h q[51];
-s q[51];
-h q[52];
-s q[55];
-s q[57];
-h q[58];
-s q[58];
-h q[59];
-s q[59];
-s q[60];
-s q[62];
-s q[64];
-s q[65];
-h q[65];
-s q[66];
-h q[66];
-s q[68];
-h q[68];
-h q[69];
-s q[69];
-h q[73];
-h q[75];
-s q[76];
-h q[79];
-s q[82];
-h q[82];
-h q[86];
-h q[88];
-h q[90];
-s q[94];
-swap q[86],q[6];
-cx q[86],q[11];
-cx q[86],q[24];
-cx q[86],q[26];
-cx q[86],q[36];
-cx q[86],q[41];
-cx q[86],q[42];
-cx q[86],q[45];
-cx q[86],q[47];
-cx q[86],q[57];
-cx q[86],q[63];
-cx q[86],q[72];
-cx q[86],q[75];
-cx q[1],q[86];
-cx q[3],q[86];
-cx q[7],q[86];
-cx q[9],q[86];
-cx q[12],q[86];
-cx q[14],q[86];
-cx q[29],q[86];
-cx q[34],q[86];
-cx q[38],q[86];
-cx q[39],q[86];
-cx q[50],q[86];
-cx q[52],q[86];
-cx q[61],q[86];
-cx q[65],q[86];
-cx q[66],q[86];
-cx q[73],q[86];
-cx q[91],q[86];
-cx q[6],q[86];
-cx q[2],q[5];
-cx q[2],q[15];
-cx q[2],q[33];
-cx q[2],q[37];
-cx q[2],q[44];
-cx q[2],q[49];
-cx q[2],q[55];
-cx q[2],q[60];
-cx q[2],q[62];
-cx q[2],q[76];
-cx q[2],q[79];
-cx q[2],q[81];
-cx q[2],q[88];
-cx q[2],q[96];
-cx q[86],q[2];
-h q[2];
-cx q[2],q[86];
-cx q[19],q[13];
-cx q[13],q[86];
-cx q[86],q[19];
-cx q[23],q[22];
-cx q[22],q[86];
-cx q[86],q[23];
-cx q[28],q[27];
-cx q[27],q[86];
-cx q[86],q[28];
-cx q[32],q[30];
-cx q[30],q[86];
-cx q[86],q[32];
-cx q[43],q[40];
-cx q[40],q[86];
-cx q[86],q[43];
-cx q[48],q[46];
-cx q[46],q[86];
-cx q[86],q[48];
-cx q[58],q[51];
-cx q[51],q[86];
-cx q[86],q[58];
-cx q[64],q[59];
-cx q[59],q[86];
-cx q[86],q[64];
-cx q[68],q[67];
-cx q[67],q[86];
-cx q[86],q[68];
-cx q[80],q[69];
-cx q[69],q[86];
-cx q[86],q[80];
-cx q[90],q[82];
-cx q[82],q[86];
-cx q[86],q[90];
-cx q[94],q[93];
-cx q[93],q[86];
-cx q[86],q[94];
-cx q[98],q[95];
-cx q[95],q[86];
-cx q[86],q[98];
-s q[1];
-s q[2];
-h q[2];
-s q[3];
-h q[5];
-s q[5];
-h q[7];
-h q[8];
-s q[8];
-h q[11];
-s q[12];
-h q[14];
-s q[17];
-h q[19];
-s q[19];
-s q[21];
-h q[21];
-s q[24];
-h q[24];
-s q[26];
-h q[26];
-s q[27];
-h q[27];
-h q[28];
-s q[30];
-h q[32];
-h q[34];
-h q[36];
-h q[37];
-h q[39];
-s q[39];
-s q[40];
-h q[40];
-s q[41];
-h q[41];
-s q[42];
-h q[42];
-s q[43];
-h q[43];
-h q[44];
-s q[46];
-h q[49];
-h q[51];
-s q[56];
-h q[56];
-h q[57];
-s q[59];
-s q[60];
-h q[61];
-s q[62];
-h q[62];
-s q[62];
-h q[64];
-s q[65];
-s q[67];
-h q[67];
-h q[69];
-s q[69];
-s q[72];
-h q[73];
-h q[75];
-s q[76];
-h q[77];
-h q[78];
-h q[79];
-s q[82];
-h q[83];
-h q[87];
-h q[88];
-s q[90];
-h q[93];
-h q[94];
-s q[95];
-h q[95];
-s q[97];
-swap q[33],q[1];
-cx q[33],q[11];
-cx q[33],q[22];
-cx q[33],q[29];
-cx q[33],q[30];
-cx q[33],q[36];
-cx q[33],q[50];
-cx q[33],q[54];
-cx q[33],q[58];
-cx q[33],q[59];
-cx q[33],q[61];
-cx q[33],q[73];
-cx q[33],q[76];
-cx q[33],q[79];
-cx q[33],q[97];
-cx q[33],q[1];
-cx q[2],q[33];
-cx q[9],q[33];
-cx q[13],q[33];
-cx q[15],q[33];
-cx q[20],q[33];
-cx q[23],q[33];
-cx q[27],q[33];
-cx q[28],q[33];
-cx q[34],q[33];
-cx q[37],q[33];
-cx q[40],q[33];
-cx q[41],q[33];
-cx q[42],q[33];
-cx q[44],q[33];
-cx q[49],q[33];
-cx q[56],q[33];
-cx q[68],q[33];
-cx q[80],q[33];
-cx q[83],q[33];
-cx q[87],q[33];
-cx q[91],q[33];
-cx q[93],q[33];
-cx q[3],q[6];
-cx q[3],q[7];
-cx q[3],q[12];
-cx q[3],q[14];
-cx q[3],q[38];
-cx q[3],q[48];
-cx q[3],q[51];
-cx q[3],q[57];
-cx q[3],q[60];
-cx q[3],q[64];
-cx q[3],q[65];
-cx q[3],q[72];
-cx q[3],q[75];
-cx q[3],q[77];
-cx q[3],q[78];
-cx q[3],q[82];
-cx q[3],q[88];
-cx q[3],q[90];
-cx q[3],q[94];
-cx q[33],q[3];
-h q[3];
-cx q[3],q[33];
-cx q[8],q[5];
-cx q[5],q[33];
-cx q[33],q[8];
-cx q[19],q[17];
-cx q[17],q[33];
-cx q[33],q[19];
-cx q[24],q[21];
-cx q[21],q[33];
-cx q[33],q[24];
-cx q[32],q[26];
-cx q[26],q[33];
-cx q[33],q[32];
-cx q[43],q[39];
-cx q[39],q[33];
-cx q[33],q[43];
-cx q[52],q[46];
-cx q[46],q[33];
-cx q[33],q[52];
-cx q[66],q[62];
-cx q[62],q[33];
-cx q[33],q[66];
-cx q[69],q[67];
-cx q[67],q[33];
-cx q[33],q[69];
-cx q[96],q[95];
-cx q[95],q[33];
-cx q[33],q[96];
-s q[2];
-h q[3];
-s q[3];
-s q[5];
-s q[6];
-h q[6];
-s q[6];
-h q[8];
-s q[9];
-h q[11];
-h q[12];
-s q[13];
-h q[14];
-s q[15];
-h q[15];
-s q[15];
-h q[16];
-s q[19];
-s q[21];
-s q[22];
-s q[23];
-h q[23];
-h q[24];
-s q[28];
-h q[30];
-s q[34];
-h q[36];
-h q[37];
-s q[38];
-h q[39];
-s q[40];
-h q[41];
-s q[45];
-h q[45];
-s q[45];
-h q[46];
-h q[49];
-s q[50];
-s q[51];
-h q[51];
-s q[51];
-h q[52];
-s q[52];
-h q[54];
-s q[59];
-h q[59];
-s q[61];
-h q[61];
-h q[62];
-s q[62];
-s q[63];
-s q[64];
-h q[64];
-h q[65];
-s q[65];
-s q[66];
-s q[68];
-h q[68];
-h q[69];
-h q[73];
-s q[75];
-s q[76];
-h q[76];
-s q[77];
-h q[77];
-s q[79];
-h q[79];
-h q[80];
-h q[83];
-s q[83];
-h q[87];
-s q[88];
-s q[90];
-h q[90];
-h q[94];
-h q[96];
-h q[98];
-swap q[69],q[3];
-cx q[69],q[2];
-cx q[69],q[7];
-cx q[69],q[8];
-cx q[69],q[13];
-cx q[69],q[14];
-cx q[69],q[16];
-cx q[69],q[21];
-cx q[69],q[24];
-cx q[69],q[27];
-cx q[69],q[29];
-cx q[69],q[37];
-cx q[69],q[46];
-cx q[69],q[56];
-cx q[69],q[63];
-cx q[69],q[73];
-cx q[69],q[81];
-cx q[69],q[88];
-cx q[69],q[96];
-cx q[69],q[98];
-cx q[69],q[3];
-cx q[11],q[69];
-cx q[23],q[69];
-cx q[30],q[69];
-cx q[36],q[69];
-cx q[39],q[69];
-cx q[41],q[69];
-cx q[43],q[69];
-cx q[48],q[69];
-cx q[58],q[69];
-cx q[59],q[69];
-cx q[64],q[69];
-cx q[68],q[69];
-cx q[72],q[69];
-cx q[77],q[69];
-cx q[79],q[69];
-cx q[1],q[9];
-cx q[1],q[12];
-cx q[1],q[17];
-cx q[1],q[19];
-cx q[1],q[20];
-cx q[1],q[22];
-cx q[1],q[26];
-cx q[1],q[34];
-cx q[1],q[38];
-cx q[1],q[40];
-cx q[1],q[42];
-cx q[1],q[44];
-cx q[1],q[49];
-cx q[1],q[60];
-cx q[1],q[66];
-cx q[1],q[75];
-cx q[1],q[78];
-cx q[1],q[94];
-cx q[69],q[1];
-h q[1];
-cx q[1],q[69];
-cx q[6],q[5];
-cx q[5],q[69];
-cx q[69],q[6];
-cx q[28],q[15];
-cx q[15],q[69];
-cx q[69],q[28];
-cx q[45],q[32];
-cx q[32],q[69];
-cx q[69],q[45];
-cx q[51],q[50];
-cx q[50],q[69];
-cx q[69],q[51];
-cx q[54],q[52];
-cx q[52],q[69];
-cx q[69],q[54];
-cx q[62],q[61];
-cx q[61],q[69];
-cx q[69],q[62];
-cx q[76],q[65];
-cx q[65],q[69];
-cx q[69],q[76];
-cx q[83],q[80];
-cx q[80],q[69];
-cx q[69],q[83];
-cx q[90],q[87];
-cx q[87],q[69];
-cx q[69],q[90];
-s q[1];
-h q[1];
-s q[1];
-s q[5];
-s q[6];
-h q[6];
-s q[7];
-h q[7];
-s q[8];
-s q[9];
-h q[9];
-s q[9];
-h q[12];
-s q[12];
-s q[14];
-h q[14];
-s q[15];
-s q[17];
-s q[20];
-h q[20];
-s q[22];
-h q[23];
-s q[24];
-s q[27];
-h q[28];
-h q[29];
-h q[32];
-h q[36];
-h q[37];
-h q[38];
-s q[39];
-h q[40];
-s q[41];
-h q[41];
-s q[41];
-h q[42];
-s q[42];
-h q[43];
-s q[45];
-h q[45];
-s q[45];
-s q[46];
-h q[49];
-s q[50];
-s q[51];
-h q[55];
-h q[56];
-s q[57];
-h q[57];
-h q[58];
-s q[59];
-s q[60];
-h q[60];
-s q[63];
-h q[63];
-s q[63];
-s q[64];
-h q[67];
-s q[67];
-s q[73];
-h q[73];
-s q[73];
-s q[77];
-h q[77];
-s q[77];
-h q[81];
-s q[82];
-h q[82];
-h q[83];
-s q[87];
-h q[87];
-s q[87];
-s q[90];
-s q[91];
-h q[91];
-h q[93];
-h q[94];
-s q[95];
-s q[96];
-s q[98];
-h q[98];
-s q[98];
-swap q[58],q[1];
-cx q[58],q[11];
-cx q[58],q[16];
-cx q[58],q[29];
-cx q[58],q[39];
-cx q[58],q[40];
-cx q[58],q[44];
-cx q[58],q[54];
-cx q[58],q[59];
-cx q[58],q[62];
-cx q[58],q[64];
-cx q[58],q[65];
-cx q[58],q[80];
-cx q[58],q[81];
-cx q[58],q[93];
-cx q[58],q[94];
-cx q[58],q[95];
-cx q[2],q[58];
-cx q[13],q[58];
-cx q[14],q[58];
-cx q[20],q[58];
-cx q[26],q[58];
-cx q[34],q[58];
-cx q[55],q[58];
-cx q[60],q[58];
-cx q[72],q[58];
-cx q[76],q[58];
-cx q[78],q[58];
-cx q[79],q[58];
-cx q[82],q[58];
-cx q[91],q[58];
-cx q[5],q[15];
-cx q[5],q[19];
-cx q[5],q[22];
-cx q[5],q[27];
-cx q[5],q[28];
-cx q[5],q[32];
-cx q[5],q[36];
-cx q[5],q[37];
-cx q[5],q[38];
-cx q[5],q[49];
-cx q[5],q[50];
-cx q[5],q[56];
-cx q[5],q[83];
-cx q[5],q[1];
-cx q[58],q[5];
-h q[5];
-cx q[5],q[58];
-cx q[6],q[3];
-cx q[3],q[58];
-cx q[58],q[6];
-cx q[8],q[7];
-cx q[7],q[58];
-cx q[58],q[8];
-cx q[12],q[9];
-cx q[9],q[58];
-cx q[58],q[12];
-cx q[23],q[17];
-cx q[17],q[58];
-cx q[58],q[23];
-cx q[41],q[24];
-cx q[24],q[58];
-cx q[58],q[41];
-cx q[43],q[42];
-cx q[42],q[58];
-cx q[58],q[43];
-cx q[46],q[45];
-cx q[45],q[58];
-cx q[58],q[46];
-cx q[51],q[48];
-cx q[48],q[58];
-cx q[58],q[51];
-cx q[57],q[52];
-cx q[52],q[58];
-cx q[58],q[57];
-cx q[67],q[63];
-cx q[63],q[58];
-cx q[58],q[67];
-cx q[77],q[73];
-cx q[73],q[58];
-cx q[58],q[77];
-cx q[90],q[87];
-cx q[87],q[58];
-cx q[58],q[90];
-cx q[98],q[96];
-cx q[96],q[58];
-cx q[58],q[98];
-h q[3];
-s q[6];
-s q[9];
-h q[9];
-s q[9];
-s q[11];
-h q[11];
-s q[12];
-h q[12];
-s q[12];
-s q[14];
-s q[15];
-s q[16];
-s q[20];
-h q[20];
-s q[21];
-h q[22];
-s q[22];
-h q[23];
-s q[24];
-h q[24];
-s q[26];
-h q[26];
-h q[27];
-s q[27];
-s q[28];
-h q[30];
-s q[36];
-h q[36];
-s q[37];
-h q[39];
-s q[41];
-s q[43];
-h q[45];
-s q[46];
-h q[46];
-s q[47];
-h q[49];
-h q[50];
-s q[51];
-s q[55];
-h q[55];
-h q[59];
-h q[60];
-s q[60];
-s q[63];
-h q[63];
-s q[63];
-s q[64];
-h q[64];
-h q[65];
-h q[66];
-h q[72];
-s q[73];
-s q[76];
-h q[77];
-s q[77];
-s q[78];
-h q[82];
-s q[82];
-h q[87];
-s q[88];
-h q[88];
-s q[88];
-h q[90];
-s q[93];
-s q[94];
-h q[94];
-h q[95];
-s q[97];
-h q[97];
-cx q[41],q[2];
-cx q[41],q[5];
-cx q[41],q[6];
-cx q[41],q[14];
-cx q[41],q[17];
-cx q[41],q[21];
-cx q[41],q[28];
-cx q[41],q[37];
-cx q[41],q[43];
-cx q[41],q[45];
-cx q[41],q[49];
-cx q[41],q[52];
-cx q[41],q[72];
-cx q[41],q[75];
-cx q[41],q[83];
-cx q[8],q[41];
-cx q[11],q[41];
-cx q[19],q[41];
-cx q[20],q[41];
-cx q[24],q[41];
-cx q[32],q[41];
-cx q[36],q[41];
-cx q[38],q[41];
-cx q[40],q[41];
-cx q[54],q[41];
-cx q[55],q[41];
-cx q[67],q[41];
-cx q[80],q[41];
-cx q[87],q[41];
-cx q[90],q[41];
-cx q[94],q[41];
-cx q[1],q[7];
-cx q[1],q[13];
-cx q[1],q[15];
-cx q[1],q[16];
-cx q[1],q[23];
-cx q[1],q[30];
-cx q[1],q[34];
-cx q[1],q[39];
-cx q[1],q[47];
-cx q[1],q[48];
-cx q[1],q[51];
-cx q[1],q[57];
-cx q[1],q[65];
-cx q[1],q[68];
-cx q[1],q[73];
-cx q[1],q[91];
-cx q[1],q[93];
-cx q[1],q[95];
-cx q[41],q[1];
-h q[1];
-cx q[1],q[41];
-cx q[9],q[3];
-cx q[3],q[41];
-cx q[41],q[9];
-cx q[22],q[12];
-cx q[12],q[41];
-cx q[41],q[22];
-cx q[27],q[26];
-cx q[26],q[41];
-cx q[41],q[27];
-cx q[50],q[46];
-cx q[46],q[41];
-cx q[41],q[50];
-cx q[60],q[59];
-cx q[59],q[41];
-cx q[41],q[60];
-cx q[63],q[61];
-cx q[61],q[41];
-cx q[41],q[63];
-cx q[66],q[64];
-cx q[64],q[41];
-cx q[41],q[66];
-cx q[77],q[76];
-cx q[76],q[41];
-cx q[41],q[77];
-cx q[82],q[78];
-cx q[78],q[41];
-cx q[41],q[82];
-cx q[97],q[88];
-cx q[88],q[41];
-cx q[41],q[97];
-s q[1];
-h q[1];
-h q[2];
-h q[3];
-s q[6];
-h q[6];
-h q[7];
-s q[9];
-h q[11];
-h q[12];
-s q[13];
-h q[13];
-s q[14];
-h q[14];
-s q[15];
-s q[16];
-s q[17];
-h q[17];
-s q[17];
-h q[19];
-s q[20];
-h q[20];
-s q[21];
-h q[21];
-s q[21];
-s q[24];
-h q[26];
-h q[27];
-h q[30];
-h q[32];
-s q[34];
-s q[36];
-h q[36];
-h q[38];
-s q[39];
-h q[43];
-s q[44];
-h q[45];
-s q[47];
-h q[47];
-s q[47];
-s q[49];
-s q[50];
-h q[51];
-s q[52];
-h q[54];
-s q[55];
-h q[56];
-s q[57];
-h q[57];
-s q[57];
-s q[59];
-h q[59];
-s q[59];
-s q[60];
-s q[61];
-h q[61];
-s q[61];
-h q[64];
-s q[64];
-s q[66];
-h q[68];
-h q[72];
-s q[73];
-h q[73];
-h q[75];
-s q[76];
-s q[82];
-h q[82];
-s q[83];
-h q[83];
-h q[87];
-s q[87];
-s q[91];
-h q[91];
-s q[93];
-h q[93];
-s q[96];
-h q[96];
-s q[97];
-swap q[36],q[1];
-cx q[36],q[8];
-cx q[36],q[9];
-cx q[36],q[11];
-cx q[36],q[15];
-cx q[36],q[23];
-cx q[36],q[28];
-cx q[36],q[38];
-cx q[36],q[49];
-cx q[36],q[50];
-cx q[36],q[55];
-cx q[36],q[56];
-cx q[36],q[72];
-cx q[36],q[79];
-cx q[36],q[88];
-cx q[36],q[97];
-cx q[3],q[36];
-cx q[5],q[36];
-cx q[6],q[36];
-cx q[7],q[36];
-cx q[14],q[36];
-cx q[26],q[36];
-cx q[27],q[36];
-cx q[32],q[36];
-cx q[43],q[36];
-cx q[45],q[36];
-cx q[54],q[36];
-cx q[63],q[36];
-cx q[73],q[36];
-cx q[83],q[36];
-cx q[91],q[36];
-cx q[93],q[36];
-cx q[96],q[36];
-cx q[98],q[36];
-cx q[1],q[36];
-cx q[24],q[29];
-cx q[24],q[44];
-cx q[24],q[46];
-cx q[24],q[48];
-cx q[24],q[51];
-cx q[24],q[52];
-cx q[24],q[62];
-cx q[24],q[65];
-cx q[24],q[66];
-cx q[24],q[75];
-cx q[24],q[76];
-cx q[24],q[94];
-cx q[24],q[95];
-cx q[36],q[24];
-h q[24];
-cx q[24],q[36];
-cx q[12],q[2];
-cx q[2],q[36];
-cx q[36],q[12];
-cx q[16],q[13];
-cx q[13],q[36];
-cx q[36],q[16];
-cx q[19],q[17];
-cx q[17],q[36];
-cx q[36],q[19];
-cx q[21],q[20];
-cx q[20],q[36];
-cx q[36],q[21];
-cx q[34],q[30];
-cx q[30],q[36];
-cx q[36],q[34];
-cx q[47],q[39];
-cx q[39],q[36];
-cx q[36],q[47];
-cx q[59],q[57];
-cx q[57],q[36];
-cx q[36],q[59];
-cx q[61],q[60];
-cx q[60],q[36];
-cx q[36],q[61];
-cx q[68],q[64];
-cx q[64],q[36];
-cx q[36],q[68];
-cx q[87],q[82];
-cx q[82],q[36];
-cx q[36],q[87];
-s q[1];
-h q[2];
-s q[8];
-h q[9];
-s q[11];
-h q[12];
-h q[13];
-h q[15];
-s q[16];
-s q[19];
-h q[19];
-s q[19];
-s q[20];
-h q[21];
-h q[23];
-s q[26];
-s q[29];
-h q[30];
-h q[32];
-s q[38];
-h q[38];
-s q[38];
-s q[40];
-s q[43];
-h q[43];
-s q[44];
-h q[44];
-s q[44];
-s q[45];
-h q[47];
-s q[48];
-s q[49];
-s q[50];
-h q[50];
-h q[52];
-s q[52];
-s q[54];
-h q[54];
-s q[54];
-h q[56];
-s q[59];
-s q[60];
-s q[61];
-s q[62];
-h q[63];
-h q[64];
-s q[64];
-h q[65];
-s q[67];
-h q[67];
-s q[68];
-h q[68];
-s q[68];
-s q[72];
-h q[72];
-h q[75];
-s q[76];
-h q[77];
-h q[78];
-h q[79];
-s q[83];
-s q[90];
-h q[94];
-s q[96];
-h q[96];
-h q[97];
-h q[98];
-swap q[88],q[1];
-cx q[88],q[6];
-cx q[88],q[11];
-cx q[88],q[23];
-cx q[88],q[28];
-cx q[88],q[39];
-cx q[88],q[42];
-cx q[88],q[49];
-cx q[88],q[51];
-cx q[88],q[56];
-cx q[88],q[61];
-cx q[88],q[63];
-cx q[88],q[73];
-cx q[88],q[76];
-cx q[88],q[77];
-cx q[88],q[87];
-cx q[88],q[94];
-cx q[88],q[1];
-cx q[15],q[88];
-cx q[17],q[88];
-cx q[21],q[88];
-cx q[43],q[88];
-cx q[50],q[88];
-cx q[67],q[88];
-cx q[78],q[88];
-cx q[80],q[88];
-cx q[91],q[88];
-cx q[93],q[88];
-cx q[96],q[88];
-cx q[12],q[16];
-cx q[12],q[20];
-cx q[12],q[24];
-cx q[12],q[26];
-cx q[12],q[32];
-cx q[12],q[47];
-cx q[12],q[48];
-cx q[12],q[55];
-cx q[12],q[60];
-cx q[12],q[62];
-cx q[12],q[75];
-cx q[12],q[79];
-cx q[12],q[81];
-cx q[12],q[83];
-cx q[12],q[90];
-cx q[12],q[97];
-cx q[12],q[98];
-cx q[88],q[12];
-h q[12];
-cx q[12],q[88];
-cx q[5],q[2];
-cx q[2],q[88];
-cx q[88],q[5];
-cx q[9],q[8];
-cx q[8],q[88];
-cx q[88],q[9];
-cx q[19],q[13];
-cx q[13],q[88];
-cx q[88],q[19];
-cx q[30],q[29];
-cx q[29],q[88];
-cx q[88],q[30];
-cx q[40],q[38];
-cx q[38],q[88];
-cx q[88],q[40];
-cx q[45],q[44];
-cx q[44],q[88];
-cx q[88],q[45];
-cx q[54],q[52];
-cx q[52],q[88];
-cx q[88],q[54];
-cx q[64],q[59];
-cx q[59],q[88];
-cx q[88],q[64];
-cx q[68],q[65];
-cx q[65],q[88];
-cx q[88],q[68];
-cx q[95],q[72];
-cx q[72],q[88];
-cx q[88],q[95];
-s q[1];
-h q[1];
-s q[3];
-h q[3];
-s q[5];
-s q[6];
-h q[6];
-s q[9];
-h q[9];
-s q[9];
-h q[11];
-s q[13];
-h q[15];
-s q[16];
-h q[21];
-s q[21];
-h q[22];
-s q[23];
-h q[23];
-s q[24];
-h q[24];
-s q[26];
-h q[29];
-s q[32];
-s q[34];
-h q[40];
-s q[42];
-h q[43];
-s q[43];
-h q[45];
-h q[46];
-h q[47];
-s q[47];
-h q[48];
-s q[52];
-s q[55];
-h q[55];
-s q[55];
-s q[56];
-h q[57];
-s q[59];
-s q[60];
-h q[61];
-h q[62];
-h q[63];
-s q[64];
-h q[64];
-s q[65];
-h q[67];
-s q[68];
-h q[68];
-s q[68];
-s q[73];
-h q[73];
-s q[75];
-h q[76];
-s q[77];
-s q[78];
-h q[78];
-h q[81];
-s q[82];
-h q[82];
-s q[83];
-h q[87];
-s q[87];
-s q[91];
-h q[91];
-h q[93];
-h q[94];
-s q[94];
-cx q[59],q[2];
-cx q[59],q[13];
-cx q[59],q[15];
-cx q[59],q[29];
-cx q[59],q[45];
-cx q[59],q[50];
-cx q[59],q[56];
-cx q[59],q[65];
-cx q[59],q[66];
-cx q[59],q[76];
-cx q[59],q[81];
-cx q[59],q[83];
-cx q[3],q[59];
-cx q[6],q[59];
-cx q[12],q[59];
-cx q[19],q[59];
-cx q[23],q[59];
-cx q[28],q[59];
-cx q[44],q[59];
-cx q[46],q[59];
-cx q[48],q[59];
-cx q[61],q[59];
-cx q[63],q[59];
-cx q[67],q[59];
-cx q[78],q[59];
-cx q[80],q[59];
-cx q[82],q[59];
-cx q[90],q[59];
-cx q[91],q[59];
-cx q[97],q[59];
-cx q[14],q[20];
-cx q[14],q[22];
-cx q[14],q[32];
-cx q[14],q[40];
-cx q[14],q[60];
-cx q[14],q[79];
-cx q[14],q[95];
-cx q[14],q[98];
-cx q[59],q[14];
-h q[14];
-cx q[14],q[59];
-cx q[5],q[1];
-cx q[1],q[59];
-cx q[59],q[5];
-cx q[11],q[9];
-cx q[9],q[59];
-cx q[59],q[11];
-cx q[21],q[16];
-cx q[16],q[59];
-cx q[59],q[21];
-cx q[26],q[24];
-cx q[24],q[59];
-cx q[59],q[26];
-cx q[42],q[34];
-cx q[34],q[59];
-cx q[59],q[42];
-cx q[47],q[43];
-cx q[43],q[59];
-cx q[59],q[47];
-cx q[52],q[51];
-cx q[51],q[59];
-cx q[59],q[52];
-cx q[57],q[55];
-cx q[55],q[59];
-cx q[59],q[57];
-cx q[64],q[62];
-cx q[62],q[59];
-cx q[59],q[64];
-cx q[72],q[68];
-cx q[68],q[59];
-cx q[59],q[72];
-cx q[75],q[73];
-cx q[73],q[59];
-cx q[59],q[75];
-cx q[87],q[77];
-cx q[77],q[59];
-cx q[59],q[87];
-cx q[94],q[93];
-cx q[93],q[59];
-cx q[59],q[94];
-s q[1];
-s q[2];
-h q[2];
-h q[3];
-s q[6];
-h q[7];
-h q[8];
-h q[9];
-s q[9];
-h q[13];
-s q[15];
-h q[16];
-h q[17];
-h q[19];
-s q[20];
-h q[20];
-h q[21];
-s q[21];
-s q[22];
-h q[22];
-s q[24];
-h q[24];
-s q[27];
-h q[27];
-s q[27];
-s q[28];
-h q[30];
-s q[32];
-h q[32];
-h q[34];
-s q[38];
-s q[42];
-s q[44];
-h q[44];
-h q[46];
-s q[48];
-h q[50];
-h q[51];
-s q[52];
-h q[54];
-s q[55];
-h q[55];
-h q[60];
-h q[61];
-s q[63];
-h q[65];
-h q[67];
-s q[73];
-s q[75];
-s q[77];
-h q[77];
-h q[78];
-s q[80];
-h q[80];
-s q[81];
-h q[81];
-h q[83];
-s q[87];
-h q[91];
-h q[93];
-s q[95];
-h q[95];
-s q[96];
-h q[97];
-s q[97];
-swap q[19],q[1];
-cx q[19],q[13];
-cx q[19],q[15];
-cx q[19],q[16];
-cx q[19],q[17];
-cx q[19],q[28];
-cx q[19],q[34];
-cx q[19],q[39];
-cx q[19],q[46];
-cx q[19],q[47];
-cx q[19],q[49];
-cx q[19],q[51];
-cx q[19],q[60];
-cx q[19],q[61];
-cx q[19],q[64];
-cx q[19],q[68];
-cx q[19],q[72];
-cx q[19],q[79];
-cx q[19],q[96];
-cx q[2],q[19];
-cx q[8],q[19];
-cx q[12],q[19];
-cx q[20],q[19];
-cx q[32],q[19];
-cx q[37],q[19];
-cx q[44],q[19];
-cx q[55],q[19];
-cx q[67],q[19];
-cx q[76],q[19];
-cx q[77],q[19];
-cx q[80],q[19];
-cx q[91],q[19];
-cx q[1],q[19];
-cx q[3],q[6];
-cx q[3],q[38];
-cx q[3],q[45];
-cx q[3],q[50];
-cx q[3],q[52];
-cx q[3],q[54];
-cx q[3],q[56];
-cx q[3],q[57];
-cx q[3],q[62];
-cx q[3],q[73];
-cx q[3],q[78];
-cx q[3],q[87];
-cx q[3],q[93];
-cx q[3],q[98];
-cx q[19],q[3];
-h q[3];
-cx q[3],q[19];
-cx q[9],q[7];
-cx q[7],q[19];
-cx q[19],q[9];
-cx q[22],q[21];
-cx q[21],q[19];
-cx q[19],q[22];
-cx q[26],q[24];
-cx q[24],q[19];
-cx q[19],q[26];
-cx q[30],q[27];
-cx q[27],q[19];
-cx q[19],q[30];
-cx q[42],q[40];
-cx q[40],q[19];
-cx q[19],q[42];
-cx q[63],q[48];
-cx q[48],q[19];
-cx q[19],q[63];
-cx q[75],q[65];
-cx q[65],q[19];
-cx q[19],q[75];
-cx q[82],q[81];
-cx q[81],q[19];
-cx q[19],q[82];
-cx q[90],q[83];
-cx q[83],q[19];
-cx q[19],q[90];
-cx q[97],q[95];
-cx q[95],q[19];
-cx q[19],q[97];
-s q[1];
-h q[1];
-h q[2];
-s q[5];
-h q[6];
-s q[7];
-h q[7];
-s q[7];
-h q[8];
-s q[9];
-h q[9];
-s q[9];
-h q[11];
-s q[13];
-s q[15];
-h q[15];
-s q[20];
-s q[21];
-h q[21];
-s q[22];
-h q[27];
-h q[28];
-s q[30];
-s q[34];
-h q[34];
-s q[34];
-h q[37];
-s q[37];
-h q[38];
-s q[39];
-h q[39];
-s q[39];
-h q[43];
-s q[44];
-h q[44];
-s q[45];
-h q[45];
-s q[46];
-s q[48];
-h q[48];
-s q[48];
-s q[49];
-s q[51];
-h q[54];
-h q[56];
-s q[57];
-h q[57];
-s q[61];
-h q[62];
-s q[63];
-h q[64];
-h q[65];
-h q[66];
-s q[66];
-s q[67];
-h q[72];
-s q[73];
-h q[73];
-s q[78];
-h q[79];
-s q[81];
-h q[81];
-s q[81];
-s q[82];
-h q[87];
-s q[90];
-h q[90];
-s q[90];
-s q[91];
-h q[91];
-s q[91];
-h q[93];
-h q[94];
-s q[95];
-h q[95];
-h q[96];
-s q[96];
-swap q[60],q[7];
-cx q[60],q[13];
-cx q[60],q[22];
-cx q[60],q[30];
-cx q[60],q[38];
-cx q[60],q[40];
-cx q[60],q[46];
-cx q[60],q[47];
-cx q[60],q[51];
-cx q[60],q[54];
-cx q[60],q[55];
-cx q[60],q[56];
-cx q[60],q[64];
-cx q[60],q[72];
-cx q[60],q[76];
-cx q[60],q[78];
-cx q[1],q[60];
-cx q[2],q[60];
-cx q[3],q[60];
-cx q[8],q[60];
-cx q[14],q[60];
-cx q[16],q[60];
-cx q[43],q[60];
-cx q[44],q[60];
-cx q[45],q[60];
-cx q[57],q[60];
-cx q[65],q[60];
-cx q[68],q[60];
-cx q[73],q[60];
-cx q[80],q[60];
-cx q[95],q[60];
-cx q[5],q[6];
-cx q[5],q[11];
-cx q[5],q[24];
-cx q[5],q[28];
-cx q[5],q[29];
-cx q[5],q[62];
-cx q[5],q[82];
-cx q[5],q[87];
-cx q[5],q[93];
-cx q[5],q[98];
-cx q[60],q[5];
-h q[5];
-cx q[5],q[60];
-cx q[15],q[9];
-cx q[9],q[60];
-cx q[60],q[15];
-cx q[21],q[20];
-cx q[20],q[60];
-cx q[60],q[21];
-cx q[34],q[27];
-cx q[27],q[60];
-cx q[60],q[34];
-cx q[39],q[37];
-cx q[37],q[60];
-cx q[60],q[39];
-cx q[48],q[42];
-cx q[42],q[60];
-cx q[60],q[48];
-cx q[61],q[49];
-cx q[49],q[60];
-cx q[60],q[61];
-cx q[66],q[63];
-cx q[63],q[60];
-cx q[60],q[66];
-cx q[79],q[67];
-cx q[67],q[60];
-cx q[60],q[79];
-cx q[90],q[81];
-cx q[81],q[60];
-cx q[60],q[90];
-cx q[94],q[91];
-cx q[91],q[60];
-cx q[60],q[94];
-cx q[97],q[96];
-cx q[96],q[60];
-cx q[60],q[97];
-h q[2];
-s q[2];
-s q[3];
-h q[3];
-s q[3];
-s q[5];
-s q[7];
-h q[9];
-h q[11];
-s q[11];
-s q[12];
-h q[13];
-s q[14];
-h q[14];
-s q[14];
-s q[15];
-s q[17];
-h q[17];
-s q[20];
-h q[20];
-h q[22];
-s q[23];
-h q[24];
-s q[26];
-s q[29];
-h q[29];
-h q[34];
-s q[37];
-h q[37];
-h q[38];
-s q[39];
-h q[39];
-h q[42];
-h q[43];
-s q[43];
-h q[44];
-h q[46];
-s q[47];
-h q[47];
-s q[48];
-h q[50];
-h q[51];
-h q[52];
-s q[52];
-s q[55];
-h q[55];
-s q[55];
-h q[61];
-s q[61];
-s q[63];
-s q[64];
-s q[67];
-h q[67];
-s q[67];
-s q[68];
-h q[68];
-s q[76];
-h q[76];
-s q[80];
-h q[80];
-s q[81];
-h q[82];
-h q[83];
-h q[87];
-h q[91];
-s q[94];
-h q[94];
-s q[95];
-h q[95];
-s q[95];
-swap q[7],q[1];
-cx q[7],q[5];
-cx q[7],q[9];
-cx q[7],q[12];
-cx q[7],q[15];
-cx q[7],q[16];
-cx q[7],q[48];
-cx q[7],q[54];
-cx q[7],q[82];
-cx q[7],q[83];
-cx q[7],q[87];
-cx q[7],q[96];
-cx q[7],q[1];
-cx q[8],q[7];
-cx q[20],q[7];
-cx q[21],q[7];
-cx q[29],q[7];
-cx q[30],q[7];
-cx q[39],q[7];
-cx q[42],q[7];
-cx q[44],q[7];
-cx q[45],q[7];
-cx q[68],q[7];
-cx q[72],q[7];
-cx q[79],q[7];
-cx q[80],q[7];
-cx q[90],q[7];
-cx q[91],q[7];
-cx q[94],q[7];
-cx q[13],q[22];
-cx q[13],q[23];
-cx q[13],q[24];
-cx q[13],q[26];
-cx q[13],q[34];
-cx q[13],q[38];
-cx q[13],q[49];
-cx q[13],q[50];
-cx q[13],q[51];
-cx q[13],q[62];
-cx q[13],q[63];
-cx q[13],q[81];
-cx q[7],q[13];
-h q[13];
-cx q[13],q[7];
-cx q[3],q[2];
-cx q[2],q[7];
-cx q[7],q[3];
-cx q[14],q[11];
-cx q[11],q[7];
-cx q[7],q[14];
-cx q[27],q[17];
-cx q[17],q[7];
-cx q[7],q[27];
-cx q[32],q[28];
-cx q[28],q[7];
-cx q[7],q[32];
-cx q[43],q[37];
-cx q[37],q[7];
-cx q[7],q[43];
-cx q[47],q[46];
-cx q[46],q[7];
-cx q[7],q[47];
-cx q[55],q[52];
-cx q[52],q[7];
-cx q[7],q[55];
-cx q[61],q[56];
-cx q[56],q[7];
-cx q[7],q[61];
-cx q[65],q[64];
-cx q[64],q[7];
-cx q[7],q[65];
-cx q[76],q[67];
-cx q[67],q[7];
-cx q[7],q[76];
-cx q[98],q[95];
-cx q[95],q[7];
-cx q[7],q[98];
-h q[1];
-s q[3];
-h q[3];
-h q[5];
-s q[5];
-s q[9];
-h q[9];
-s q[9];
-h q[11];
-s q[11];
-s q[12];
-h q[12];
-h q[13];
-h q[14];
-s q[21];
-h q[22];
-s q[24];
-s q[27];
-s q[28];
-h q[30];
-h q[32];
-h q[34];
-s q[34];
-h q[38];
-s q[38];
-h q[39];
-h q[42];
-s q[44];
-h q[45];
-s q[48];
-h q[48];
-s q[51];
-s q[52];
-s q[54];
-h q[54];
-s q[55];
-h q[56];
-h q[57];
-s q[61];
-h q[61];
-h q[62];
-s q[62];
-h q[63];
-s q[64];
-h q[64];
-h q[65];
-s q[66];
-h q[72];
-s q[73];
-h q[73];
-h q[75];
-s q[75];
-s q[76];
-h q[77];
-h q[79];
-h q[80];
-h q[81];
-s q[81];
-s q[82];
-s q[83];
-h q[90];
-s q[91];
-h q[91];
-s q[93];
-h q[93];
-s q[96];
-h q[96];
-h q[97];
-swap q[90],q[1];
-cx q[90],q[8];
-cx q[90],q[15];
-cx q[90],q[17];
-cx q[90],q[24];
-cx q[90],q[29];
-cx q[90],q[32];
-cx q[90],q[43];
-cx q[90],q[44];
-cx q[90],q[46];
-cx q[90],q[56];
-cx q[90],q[76];
-cx q[90],q[79];
-cx q[90],q[94];
-cx q[13],q[90];
-cx q[14],q[90];
-cx q[23],q[90];
-cx q[39],q[90];
-cx q[45],q[90];
-cx q[61],q[90];
-cx q[64],q[90];
-cx q[72],q[90];
-cx q[73],q[90];
-cx q[91],q[90];
-cx q[93],q[90];
-cx q[96],q[90];
-cx q[97],q[90];
-cx q[1],q[90];
-cx q[6],q[20];
-cx q[6],q[21];
-cx q[6],q[22];
-cx q[6],q[26];
-cx q[6],q[40];
-cx q[6],q[42];
-cx q[6],q[63];
-cx q[6],q[65];
-cx q[6],q[78];
-cx q[6],q[80];
-cx q[6],q[82];
-cx q[6],q[95];
-cx q[90],q[6];
-h q[6];
-cx q[6],q[90];
-cx q[5],q[3];
-cx q[3],q[90];
-cx q[90],q[5];
-cx q[11],q[9];
-cx q[9],q[90];
-cx q[90],q[11];
-cx q[27],q[12];
-cx q[12],q[90];
-cx q[90],q[27];
-cx q[30],q[28];
-cx q[28],q[90];
-cx q[90],q[30];
-cx q[38],q[34];
-cx q[34],q[90];
-cx q[90],q[38];
-cx q[51],q[48];
-cx q[48],q[90];
-cx q[90],q[51];
-cx q[54],q[52];
-cx q[52],q[90];
-cx q[90],q[54];
-cx q[57],q[55];
-cx q[55],q[90];
-cx q[90],q[57];
-cx q[66],q[62];
-cx q[62],q[90];
-cx q[90],q[66];
-cx q[77],q[75];
-cx q[75],q[90];
-cx q[90],q[77];
-cx q[83],q[81];
-cx q[81],q[90];
-cx q[90],q[83];
-s q[3];
-h q[5];
-h q[9];
-h q[11];
-h q[13];
-s q[15];
-s q[17];
-h q[17];
-s q[17];
-s q[20];
-h q[20];
-s q[21];
-h q[27];
-s q[30];
-s q[34];
-h q[38];
-h q[39];
-s q[40];
-h q[40];
-s q[40];
-s q[43];
-h q[44];
-s q[44];
-h q[46];
-h q[52];
-h q[54];
-h q[55];
-h q[56];
-h q[57];
-h q[61];
-s q[62];
-s q[63];
-s q[64];
-h q[65];
-s q[66];
-h q[73];
-s q[75];
-s q[76];
-s q[77];
-h q[77];
-s q[78];
-h q[78];
-s q[79];
-h q[79];
-h q[80];
-s q[80];
-h q[82];
-h q[83];
-s q[91];
-s q[93];
-h q[94];
-s q[95];
-h q[95];
-s q[97];
-h q[98];
-s q[98];
-swap q[24],q[1];
-cx q[24],q[5];
-cx q[24],q[6];
-cx q[24],q[23];
-cx q[24],q[43];
-cx q[24],q[48];
-cx q[24],q[51];
-cx q[24],q[62];
-cx q[24],q[63];
-cx q[24],q[68];
-cx q[24],q[73];
-cx q[24],q[96];
-cx q[9],q[24];
-cx q[38],q[24];
-cx q[39],q[24];
-cx q[45],q[24];
-cx q[47],q[24];
-cx q[52],q[24];
-cx q[54],q[24];
-cx q[55],q[24];
-cx q[65],q[24];
-cx q[77],q[24];
-cx q[78],q[24];
-cx q[79],q[24];
-cx q[82],q[24];
-cx q[83],q[24];
-cx q[95],q[24];
-cx q[1],q[24];
-cx q[13],q[21];
-cx q[13],q[27];
-cx q[13],q[28];
-cx q[13],q[34];
-cx q[13],q[56];
-cx q[13],q[57];
-cx q[13],q[61];
-cx q[13],q[64];
-cx q[13],q[66];
-cx q[13],q[75];
-cx q[13],q[76];
-cx q[13],q[87];
-cx q[13],q[91];
-cx q[13],q[94];
-cx q[13],q[97];
-cx q[24],q[13];
-h q[13];
-cx q[13],q[24];
-cx q[3],q[2];
-cx q[2],q[24];
-cx q[24],q[3];
-cx q[11],q[8];
-cx q[8],q[24];
-cx q[24],q[11];
-cx q[15],q[14];
-cx q[14],q[24];
-cx q[24],q[15];
-cx q[17],q[16];
-cx q[16],q[24];
-cx q[24],q[17];
-cx q[30],q[20];
-cx q[20],q[24];
-cx q[24],q[30];
-cx q[40],q[37];
-cx q[37],q[24];
-cx q[24],q[40];
-cx q[44],q[42];
-cx q[42],q[24];
-cx q[24],q[44];
-cx q[67],q[46];
-cx q[46],q[24];
-cx q[24],q[67];
-cx q[81],q[80];
-cx q[80],q[24];
-cx q[24],q[81];
-cx q[98],q[93];
-cx q[93],q[24];
-cx q[24],q[98];
-s q[2];
-s q[3];
-s q[8];
-h q[8];
-h q[9];
-s q[12];
-s q[15];
-h q[15];
-s q[16];
-s q[17];
-h q[26];
-s q[26];
-h q[27];
-s q[28];
-s q[32];
-h q[34];
-s q[37];
-h q[37];
-s q[37];
-s q[40];
-h q[40];
-s q[43];
-h q[43];
-s q[44];
-h q[44];
-s q[46];
-h q[48];
-s q[48];
-s q[49];
-s q[50];
-h q[51];
-s q[51];
-h q[52];
-s q[54];
-h q[54];
-h q[56];
-h q[57];
-s q[63];
-h q[63];
-s q[65];
-h q[66];
-s q[68];
-s q[73];
-h q[76];
-s q[76];
-s q[78];
-h q[78];
-s q[78];
-h q[79];
-h q[80];
-s q[81];
-h q[82];
-s q[83];
-h q[87];
-s q[91];
-s q[94];
-h q[94];
-h q[95];
-s q[96];
-h q[96];
-h q[98];
-swap q[44],q[1];
-cx q[44],q[12];
-cx q[44],q[13];
-cx q[44],q[21];
-cx q[44],q[22];
-cx q[44],q[27];
-cx q[44],q[39];
-cx q[44],q[50];
-cx q[44],q[68];
-cx q[44],q[72];
-cx q[44],q[73];
-cx q[44],q[80];
-cx q[44],q[81];
-cx q[44],q[87];
-cx q[44],q[98];
-cx q[5],q[44];
-cx q[15],q[44];
-cx q[29],q[44];
-cx q[38],q[44];
-cx q[40],q[44];
-cx q[43],q[44];
-cx q[54],q[44];
-cx q[57],q[44];
-cx q[61],q[44];
-cx q[63],q[44];
-cx q[64],q[44];
-cx q[67],q[44];
-cx q[79],q[44];
-cx q[94],q[44];
-cx q[1],q[44];
-cx q[3],q[6];
-cx q[3],q[9];
-cx q[3],q[16];
-cx q[3],q[17];
-cx q[3],q[28];
-cx q[3],q[30];
-cx q[3],q[49];
-cx q[3],q[56];
-cx q[3],q[65];
-cx q[3],q[75];
-cx q[3],q[77];
-cx q[3],q[82];
-cx q[44],q[3];
-h q[3];
-cx q[3],q[44];
-cx q[8],q[2];
-cx q[2],q[44];
-cx q[44],q[8];
-cx q[23],q[20];
-cx q[20],q[44];
-cx q[44],q[23];
-cx q[32],q[26];
-cx q[26],q[44];
-cx q[44],q[32];
-cx q[37],q[34];
-cx q[34],q[44];
-cx q[44],q[37];
-cx q[46],q[42];
-cx q[42],q[44];
-cx q[44],q[46];
-cx q[51],q[48];
-cx q[48],q[44];
-cx q[44],q[51];
-cx q[66],q[52];
-cx q[52],q[44];
-cx q[44],q[66];
-cx q[78],q[76];
-cx q[76],q[44];
-cx q[44],q[78];
-cx q[91],q[83];
-cx q[83],q[44];
-cx q[44],q[91];
-cx q[96],q[95];
-cx q[95],q[44];
-cx q[44],q[96];
-s q[1];
-h q[2];
-s q[6];
-h q[11];
-h q[12];
-s q[14];
-h q[16];
-h q[17];
-s q[17];
-s q[20];
-s q[21];
-h q[21];
-s q[26];
-s q[28];
-h q[28];
-h q[29];
-h q[32];
-s q[34];
-h q[37];
-h q[39];
-h q[43];
-s q[45];
-h q[46];
-h q[47];
-s q[48];
-s q[50];
-h q[55];
-s q[56];
-h q[56];
-s q[57];
-s q[63];
-h q[63];
-h q[64];
-s q[65];
-s q[66];
-h q[66];
-s q[72];
-s q[73];
-h q[73];
-h q[75];
-s q[76];
-h q[76];
-s q[77];
-h q[78];
-h q[79];
-s q[79];
-h q[80];
-h q[81];
-h q[83];
-s q[93];
-h q[93];
-s q[93];
-s q[97];
-swap q[98],q[3];
-cx q[98],q[2];
-cx q[98],q[5];
-cx q[98],q[11];
-cx q[98],q[15];
-cx q[98],q[27];
-cx q[98],q[29];
-cx q[98],q[38];
-cx q[98],q[45];
-cx q[98],q[52];
-cx q[98],q[55];
-cx q[98],q[57];
-cx q[98],q[64];
-cx q[98],q[65];
-cx q[98],q[68];
-cx q[98],q[75];
-cx q[98],q[91];
-cx q[98],q[97];
-cx q[98],q[3];
-cx q[8],q[98];
-cx q[21],q[98];
-cx q[22],q[98];
-cx q[28],q[98];
-cx q[32],q[98];
-cx q[46],q[98];
-cx q[62],q[98];
-cx q[67],q[98];
-cx q[76],q[98];
-cx q[81],q[98];
-cx q[83],q[98];
-cx q[87],q[98];
-cx q[96],q[98];
-cx q[1],q[6];
-cx q[1],q[16];
-cx q[1],q[20];
-cx q[1],q[26];
-cx q[1],q[34];
-cx q[1],q[37];
-cx q[1],q[42];
-cx q[1],q[50];
-cx q[1],q[51];
-cx q[1],q[61];
-cx q[1],q[72];
-cx q[1],q[77];
-cx q[1],q[78];
-cx q[1],q[80];
-cx q[1],q[94];
-cx q[98],q[1];
-h q[1];
-cx q[1],q[98];
-cx q[13],q[12];
-cx q[12],q[98];
-cx q[98],q[13];
-cx q[17],q[14];
-cx q[14],q[98];
-cx q[98],q[17];
-cx q[43],q[39];
-cx q[39],q[98];
-cx q[98],q[43];
-cx q[48],q[47];
-cx q[47],q[98];
-cx q[98],q[48];
-cx q[63],q[56];
-cx q[56],q[98];
-cx q[98],q[63];
-cx q[73],q[66];
-cx q[66],q[98];
-cx q[98],q[73];
-cx q[93],q[79];
-cx q[79],q[98];
-cx q[98],q[93];
-s q[1];
-h q[1];
-s q[6];
-h q[6];
-s q[9];
-h q[12];
-s q[14];
-h q[14];
-s q[14];
-h q[15];
-s q[15];
-h q[16];
-s q[20];
-h q[20];
-h q[22];
-h q[23];
-s q[27];
-h q[28];
-s q[29];
-h q[34];
-s q[37];
-h q[37];
-h q[40];
-s q[43];
-h q[45];
-s q[45];
-s q[46];
-h q[46];
-s q[48];
-h q[48];
-s q[50];
-s q[52];
-s q[54];
-h q[54];
-s q[55];
-s q[56];
-h q[61];
-h q[62];
-s q[63];
-h q[63];
-h q[65];
-s q[66];
-h q[66];
-h q[67];
-s q[72];
-h q[73];
-h q[75];
-s q[76];
-h q[76];
-h q[77];
-s q[78];
-h q[79];
-s q[87];
-h q[87];
-s q[94];
-cx q[9],q[5];
-cx q[9],q[27];
-cx q[9],q[28];
-cx q[9],q[30];
-cx q[9],q[42];
-cx q[9],q[47];
-cx q[9],q[49];
-cx q[9],q[52];
-cx q[9],q[55];
-cx q[9],q[56];
-cx q[9],q[77];
-cx q[9],q[78];
-cx q[9],q[80];
-cx q[2],q[9];
-cx q[3],q[9];
-cx q[6],q[9];
-cx q[13],q[9];
-cx q[17],q[9];
-cx q[20],q[9];
-cx q[26],q[9];
-cx q[32],q[9];
-cx q[37],q[9];
-cx q[38],q[9];
-cx q[46],q[9];
-cx q[48],q[9];
-cx q[51],q[9];
-cx q[61],q[9];
-cx q[63],q[9];
-cx q[65],q[9];
-cx q[66],q[9];
-cx q[67],q[9];
-cx q[68],q[9];
-cx q[73],q[9];
-cx q[75],q[9];
-cx q[76],q[9];
-cx q[81],q[9];
-cx q[91],q[9];
-cx q[97],q[9];
-cx q[16],q[21];
-cx q[16],q[22];
-cx q[16],q[23];
-cx q[16],q[29];
-cx q[16],q[34];
-cx q[16],q[43];
-cx q[16],q[50];
-cx q[16],q[62];
-cx q[16],q[64];
-cx q[16],q[72];
-cx q[16],q[95];
-cx q[9],q[16];
-h q[16];
-cx q[16],q[9];
-cx q[8],q[1];
-cx q[1],q[9];
-cx q[9],q[8];
-cx q[14],q[12];
-cx q[12],q[9];
-cx q[9],q[14];
-cx q[40],q[15];
-cx q[15],q[9];
-cx q[9],q[40];
-cx q[54],q[45];
-cx q[45],q[9];
-cx q[9],q[54];
-cx q[79],q[57];
-cx q[57],q[9];
-cx q[9],q[79];
-cx q[87],q[83];
-cx q[83],q[9];
-cx q[9],q[87];
-cx q[96],q[94];
-cx q[94],q[9];
-cx q[9],q[96];
-h q[2];
-s q[3];
-s q[5];
-h q[5];
-s q[6];
-s q[11];
-h q[11];
-s q[14];
-s q[15];
-h q[15];
-s q[21];
-h q[23];
-h q[26];
-s q[27];
-h q[27];
-h q[28];
-s q[29];
-h q[37];
-h q[38];
-h q[39];
-h q[40];
-s q[42];
-s q[45];
-s q[46];
-h q[46];
-s q[47];
-s q[50];
-h q[50];
-h q[51];
-s q[52];
-s q[55];
-h q[55];
-s q[57];
-h q[57];
-h q[61];
-s q[61];
-s q[62];
-h q[62];
-s q[62];
-s q[63];
-h q[63];
-s q[63];
-s q[64];
-h q[64];
-h q[72];
-h q[73];
-h q[75];
-s q[75];
-s q[77];
-h q[78];
-h q[79];
-h q[81];
-h q[87];
-s q[93];
-s q[95];
-h q[95];
-s q[95];
-s q[96];
-h q[96];
-h q[97];
-swap q[48],q[6];
-cx q[48],q[3];
-cx q[48],q[16];
-cx q[48],q[17];
-cx q[48],q[21];
-cx q[48],q[22];
-cx q[48],q[23];
-cx q[48],q[30];
-cx q[48],q[42];
-cx q[48],q[43];
-cx q[48],q[45];
-cx q[48],q[52];
-cx q[48],q[54];
-cx q[48],q[66];
-cx q[48],q[67];
-cx q[48],q[79];
-cx q[48],q[93];
-cx q[2],q[48];
-cx q[5],q[48];
-cx q[11],q[48];
-cx q[26],q[48];
-cx q[27],q[48];
-cx q[32],q[48];
-cx q[37],q[48];
-cx q[38],q[48];
-cx q[39],q[48];
-cx q[56],q[48];
-cx q[57],q[48];
-cx q[64],q[48];
-cx q[68],q[48];
-cx q[73],q[48];
-cx q[87],q[48];
-cx q[96],q[48];
-cx q[97],q[48];
-cx q[14],q[28];
-cx q[14],q[29];
-cx q[14],q[40];
-cx q[14],q[47];
-cx q[14],q[51];
-cx q[14],q[72];
-cx q[14],q[80];
-cx q[14],q[82];
-cx q[14],q[94];
-cx q[48],q[14];
-h q[14];
-cx q[14],q[48];
-cx q[12],q[8];
-cx q[8],q[48];
-cx q[48],q[12];
-cx q[15],q[13];
-cx q[13],q[48];
-cx q[48],q[15];
-cx q[46],q[20];
-cx q[20],q[48];
-cx q[48],q[46];
-cx q[55],q[50];
-cx q[50],q[48];
-cx q[48],q[55];
-cx q[62],q[61];
-cx q[61],q[48];
-cx q[48],q[62];
-cx q[75],q[63];
-cx q[63],q[48];
-cx q[48],q[75];
-cx q[78],q[77];
-cx q[77],q[48];
-cx q[48],q[78];
-cx q[95],q[81];
-cx q[81],q[48];
-cx q[48],q[95];
-h q[1];
-h q[2];
-s q[3];
-h q[3];
-s q[3];
-s q[6];
-s q[8];
-h q[8];
-h q[13];
-h q[14];
-h q[15];
-s q[15];
-s q[16];
-h q[16];
-s q[16];
-s q[17];
-s q[20];
-s q[21];
-h q[26];
-h q[29];
-s q[30];
-s q[32];
-h q[37];
-s q[37];
-s q[38];
-s q[39];
-h q[39];
-h q[40];
-s q[42];
-s q[46];
-h q[47];
-s q[51];
-h q[51];
-s q[52];
-h q[52];
-s q[55];
-s q[56];
-h q[57];
-s q[61];
-h q[61];
-h q[63];
-h q[64];
-h q[65];
-s q[66];
-s q[67];
-h q[67];
-s q[67];
-s q[73];
-h q[75];
-s q[77];
-s q[78];
-s q[79];
-h q[79];
-s q[79];
-h q[80];
-s q[80];
-h q[81];
-s q[81];
-s q[83];
-h q[91];
-h q[93];
-h q[94];
-s q[95];
-h q[95];
-h q[96];
-h q[97];
-swap q[34],q[3];
-cx q[34],q[1];
-cx q[34],q[5];
-cx q[34],q[14];
-cx q[34],q[21];
-cx q[34],q[32];
-cx q[34],q[42];
-cx q[34],q[47];
-cx q[34],q[56];
-cx q[34],q[75];
-cx q[34],q[77];
-cx q[34],q[78];
-cx q[34],q[83];
-cx q[34],q[94];
-cx q[34],q[96];
-cx q[34],q[97];
-cx q[8],q[34];
-cx q[26],q[34];
-cx q[39],q[34];
-cx q[40],q[34];
-cx q[45],q[34];
-cx q[49],q[34];
-cx q[51],q[34];
-cx q[54],q[34];
-cx q[61],q[34];
-cx q[64],q[34];
-cx q[76],q[34];
-cx q[82],q[34];
-cx q[93],q[34];
-cx q[3],q[34];
-cx q[2],q[13];
-cx q[2],q[17];
-cx q[2],q[20];
-cx q[2],q[27];
-cx q[2],q[28];
-cx q[2],q[29];
-cx q[2],q[43];
-cx q[2],q[46];
-cx q[2],q[55];
-cx q[2],q[57];
-cx q[2],q[63];
-cx q[2],q[73];
-cx q[2],q[87];
-cx q[2],q[91];
-cx q[34],q[2];
-h q[2];
-cx q[2],q[34];
-cx q[15],q[6];
-cx q[6],q[34];
-cx q[34],q[15];
-cx q[30],q[16];
-cx q[16],q[34];
-cx q[34],q[30];
-cx q[38],q[37];
-cx q[37],q[34];
-cx q[34],q[38];
-cx q[65],q[52];
-cx q[52],q[34];
-cx q[34],q[65];
-cx q[67],q[66];
-cx q[66],q[34];
-cx q[34],q[67];
-cx q[80],q[79];
-cx q[79],q[34];
-cx q[34],q[80];
-cx q[95],q[81];
-cx q[81],q[34];
-cx q[34],q[95];
-s q[1];
-h q[1];
-s q[1];
-s q[6];
-s q[11];
-s q[15];
-h q[15];
-h q[16];
-s q[16];
-s q[20];
-h q[20];
-h q[22];
-h q[23];
-h q[26];
-s q[26];
-h q[28];
-h q[29];
-h q[32];
-h q[37];
-s q[38];
-h q[38];
-s q[39];
-h q[39];
-s q[40];
-s q[42];
-h q[42];
-s q[42];
-s q[43];
-h q[45];
-h q[46];
-s q[47];
-h q[47];
-s q[50];
-h q[50];
-s q[50];
-s q[54];
-h q[54];
-s q[54];
-s q[56];
-s q[57];
-h q[61];
-s q[63];
-h q[63];
-s q[64];
-s q[65];
-h q[65];
-h q[66];
-s q[66];
-h q[67];
-s q[67];
-s q[72];
-h q[72];
-s q[75];
-s q[77];
-h q[77];
-s q[77];
-h q[79];
-h q[81];
-h q[93];
-s q[94];
-h q[94];
-h q[95];
-s q[97];
-h q[97];
-cx q[66],q[11];
-cx q[66],q[17];
-cx q[66],q[21];
-cx q[66],q[27];
-cx q[66],q[32];
-cx q[66],q[43];
-cx q[66],q[45];
-cx q[66],q[49];
-cx q[66],q[52];
-cx q[66],q[56];
-cx q[66],q[73];
-cx q[66],q[78];
-cx q[66],q[81];
-cx q[66],q[91];
-cx q[66],q[95];
-cx q[2],q[66];
-cx q[5],q[66];
-cx q[13],q[66];
-cx q[15],q[66];
-cx q[20],q[66];
-cx q[22],q[66];
-cx q[28],q[66];
-cx q[39],q[66];
-cx q[47],q[66];
-cx q[63],q[66];
-cx q[65],q[66];
-cx q[72],q[66];
-cx q[79],q[66];
-cx q[82],q[66];
-cx q[83],q[66];
-cx q[93],q[66];
-cx q[94],q[66];
-cx q[96],q[66];
-cx q[6],q[8];
-cx q[6],q[23];
-cx q[6],q[29];
-cx q[6],q[30];
-cx q[6],q[40];
-cx q[6],q[62];
-cx q[6],q[64];
-cx q[6],q[75];
-cx q[6],q[76];
-cx q[6],q[87];
-cx q[66],q[6];
-h q[6];
-cx q[6],q[66];
-cx q[14],q[1];
-cx q[1],q[66];
-cx q[66],q[14];
-cx q[26],q[16];
-cx q[16],q[66];
-cx q[66],q[26];
-cx q[38],q[37];
-cx q[37],q[66];
-cx q[66],q[38];
-cx q[46],q[42];
-cx q[42],q[66];
-cx q[66],q[46];
-cx q[54],q[50];
-cx q[50],q[66];
-cx q[66],q[54];
-cx q[61],q[57];
-cx q[57],q[66];
-cx q[66],q[61];
-cx q[77],q[67];
-cx q[67],q[66];
-cx q[66],q[77];
-cx q[97],q[80];
-cx q[80],q[66];
-cx q[66],q[97];
-h q[1];
-h q[3];
-s q[5];
-s q[6];
-h q[6];
-h q[8];
-s q[11];
-s q[12];
-h q[12];
-h q[15];
-s q[15];
-h q[17];
-h q[21];
-s q[22];
-s q[26];
-h q[26];
-s q[27];
-h q[27];
-s q[28];
-h q[30];
-s q[30];
-h q[32];
-s q[39];
-h q[39];
-s q[42];
-h q[42];
-s q[43];
-s q[49];
-h q[49];
-h q[50];
-h q[51];
-s q[51];
-h q[54];
-s q[54];
-h q[55];
-h q[56];
-s q[57];
-h q[57];
-h q[61];
-h q[63];
-s q[64];
-h q[64];
-s q[64];
-h q[65];
-s q[72];
-h q[72];
-h q[75];
-s q[76];
-h q[76];
-s q[77];
-h q[78];
-h q[79];
-s q[80];
-s q[81];
-h q[81];
-s q[81];
-s q[91];
-s q[95];
-s q[97];
-swap q[82],q[1];
-cx q[82],q[2];
-cx q[82],q[8];
-cx q[82],q[11];
-cx q[82],q[21];
-cx q[82],q[22];
-cx q[82],q[23];
-cx q[82],q[37];
-cx q[82],q[43];
-cx q[82],q[65];
-cx q[82],q[75];
-cx q[82],q[79];
-cx q[82],q[95];
-cx q[82],q[97];
-cx q[82],q[1];
-cx q[12],q[82];
-cx q[13],q[82];
-cx q[20],q[82];
-cx q[27],q[82];
-cx q[39],q[82];
-cx q[40],q[82];
-cx q[42],q[82];
-cx q[49],q[82];
-cx q[57],q[82];
-cx q[61],q[82];
-cx q[67],q[82];
-cx q[72],q[82];
-cx q[94],q[82];
-cx q[3],q[5];
-cx q[3],q[14];
-cx q[3],q[17];
-cx q[3],q[29];
-cx q[3],q[32];
-cx q[3],q[50];
-cx q[3],q[52];
-cx q[3],q[55];
-cx q[3],q[56];
-cx q[3],q[63];
-cx q[3],q[73];
-cx q[82],q[3];
-h q[3];
-cx q[3],q[82];
-cx q[15],q[6];
-cx q[6],q[82];
-cx q[82],q[15];
-cx q[28],q[26];
-cx q[26],q[82];
-cx q[82],q[28];
-cx q[47],q[30];
-cx q[30],q[82];
-cx q[82],q[47];
-cx q[54],q[51];
-cx q[51],q[82];
-cx q[82],q[54];
-cx q[68],q[64];
-cx q[64],q[82];
-cx q[82],q[68];
-cx q[77],q[76];
-cx q[76],q[82];
-cx q[82],q[77];
-cx q[80],q[78];
-cx q[78],q[82];
-cx q[82],q[80];
-cx q[87],q[81];
-cx q[81],q[82];
-cx q[82],q[87];
-cx q[93],q[91];
-cx q[91],q[82];
-cx q[82],q[93];
-s q[2];
-h q[2];
-s q[3];
-h q[3];
-h q[5];
-s q[6];
-s q[11];
-s q[12];
-h q[13];
-h q[14];
-s q[16];
-s q[17];
-h q[21];
-s q[21];
-s q[22];
-h q[23];
-s q[23];
-h q[27];
-h q[28];
-s q[28];
-h q[29];
-h q[30];
-s q[32];
-h q[38];
-s q[39];
-s q[40];
-h q[40];
-s q[40];
-s q[43];
-h q[43];
-s q[49];
-h q[50];
-h q[52];
-h q[54];
-s q[55];
-h q[57];
-h q[61];
-h q[64];
-s q[65];
-h q[65];
-s q[68];
-h q[68];
-s q[77];
-h q[77];
-h q[79];
-s q[81];
-h q[91];
-s q[93];
-h q[93];
-h q[94];
-s q[96];
-swap q[20],q[2];
-cx q[20],q[8];
-cx q[20],q[16];
-cx q[20],q[17];
-cx q[20],q[32];
-cx q[20],q[38];
-cx q[20],q[50];
-cx q[20],q[51];
-cx q[20],q[79];
-cx q[20],q[81];
-cx q[20],q[87];
-cx q[20],q[91];
-cx q[20],q[96];
-cx q[20],q[2];
-cx q[5],q[20];
-cx q[13],q[20];
-cx q[29],q[20];
-cx q[37],q[20];
-cx q[42],q[20];
-cx q[46],q[20];
-cx q[52],q[20];
-cx q[57],q[20];
-cx q[62],q[20];
-cx q[68],q[20];
-cx q[77],q[20];
-cx q[78],q[20];
-cx q[94],q[20];
-cx q[11],q[14];
-cx q[11],q[15];
-cx q[11],q[22];
-cx q[11],q[27];
-cx q[11],q[54];
-cx q[11],q[55];
-cx q[11],q[61];
-cx q[11],q[64];
-cx q[11],q[75];
-cx q[11],q[95];
-cx q[11],q[97];
-cx q[20],q[11];
-h q[11];
-cx q[11],q[20];
-cx q[6],q[3];
-cx q[3],q[20];
-cx q[20],q[6];
-cx q[21],q[12];
-cx q[12],q[20];
-cx q[20],q[21];
-cx q[26],q[23];
-cx q[23],q[20];
-cx q[20],q[26];
-cx q[30],q[28];
-cx q[28],q[20];
-cx q[20],q[30];
-cx q[40],q[39];
-cx q[39],q[20];
-cx q[20],q[40];
-cx q[49],q[43];
-cx q[43],q[20];
-cx q[20],q[49];
-cx q[65],q[56];
-cx q[56],q[20];
-cx q[20],q[65];
-cx q[93],q[67];
-cx q[67],q[20];
-cx q[20],q[93];
-h q[6];
-s q[8];
-h q[12];
-h q[16];
-s q[16];
-s q[17];
-h q[22];
-h q[23];
-s q[28];
-h q[30];
-s q[30];
-s q[37];
-h q[37];
-s q[38];
-h q[39];
-s q[42];
-h q[42];
-h q[43];
-s q[43];
-h q[46];
-h q[47];
-s q[50];
-h q[51];
-h q[54];
-s q[54];
-s q[56];
-h q[56];
-s q[56];
-h q[61];
-h q[62];
-h q[65];
-s q[67];
-h q[67];
-h q[68];
-h q[72];
-h q[75];
-s q[75];
-h q[77];
-s q[77];
-s q[78];
-h q[78];
-s q[80];
-h q[80];
-s q[81];
-s q[83];
-s q[91];
-h q[93];
-s q[95];
-s q[96];
-h q[96];
-s q[97];
-h q[97];
-s q[97];
-swap q[29],q[1];
-cx q[29],q[11];
-cx q[29],q[12];
-cx q[29],q[13];
-cx q[29],q[28];
-cx q[29],q[46];
-cx q[29],q[50];
-cx q[29],q[61];
-cx q[29],q[62];
-cx q[29],q[64];
-cx q[29],q[81];
-cx q[29],q[83];
-cx q[15],q[29];
-cx q[22],q[29];
-cx q[39],q[29];
-cx q[40],q[29];
-cx q[42],q[29];
-cx q[51],q[29];
-cx q[57],q[29];
-cx q[72],q[29];
-cx q[78],q[29];
-cx q[80],q[29];
-cx q[87],q[29];
-cx q[93],q[29];
-cx q[96],q[29];
-cx q[1],q[29];
-cx q[6],q[8];
-cx q[6],q[23];
-cx q[6],q[38];
-cx q[6],q[47];
-cx q[6],q[65];
-cx q[6],q[68];
-cx q[6],q[73];
-cx q[6],q[76];
-cx q[6],q[94];
-cx q[6],q[95];
-cx q[29],q[6];
-h q[6];
-cx q[6],q[29];
-cx q[3],q[2];
-cx q[2],q[29];
-cx q[29],q[3];
-cx q[16],q[14];
-cx q[14],q[29];
-cx q[29],q[16];
-cx q[27],q[17];
-cx q[17],q[29];
-cx q[29],q[27];
-cx q[37],q[30];
-cx q[30],q[29];
-cx q[29],q[37];
-cx q[49],q[43];
-cx q[43],q[29];
-cx q[29],q[49];
-cx q[55],q[54];
-cx q[54],q[29];
-cx q[29],q[55];
-cx q[67],q[56];
-cx q[56],q[29];
-cx q[29],q[67];
-cx q[77],q[75];
-cx q[75],q[29];
-cx q[29],q[77];
-cx q[97],q[91];
-cx q[91],q[29];
-cx q[29],q[97];
-h q[1];
-s q[2];
-s q[3];
-h q[3];
-s q[3];
-h q[6];
-h q[8];
-h q[11];
-s q[12];
-s q[13];
-h q[13];
-h q[14];
-h q[15];
-s q[15];
-h q[17];
-s q[17];
-h q[23];
-s q[23];
-s q[26];
-h q[26];
-h q[30];
-h q[32];
-h q[38];
-s q[38];
-h q[39];
-s q[39];
-s q[42];
-s q[43];
-s q[45];
-s q[46];
-s q[47];
-h q[47];
-s q[47];
-h q[49];
-h q[51];
-h q[54];
-s q[55];
-h q[57];
-s q[61];
-s q[62];
-h q[63];
-s q[65];
-s q[68];
-h q[72];
-s q[73];
-s q[76];
-h q[77];
-s q[79];
-s q[80];
-s q[81];
-s q[93];
-h q[93];
-s q[93];
-h q[94];
-h q[95];
-s q[96];
-h q[96];
-s q[96];
-swap q[56],q[1];
-cx q[56],q[2];
-cx q[56],q[22];
-cx q[56],q[30];
-cx q[56],q[32];
-cx q[56],q[40];
-cx q[56],q[42];
-cx q[56],q[55];
-cx q[56],q[61];
-cx q[56],q[63];
-cx q[56],q[65];
-cx q[56],q[72];
-cx q[56],q[73];
-cx q[56],q[75];
-cx q[56],q[76];
-cx q[56],q[77];
-cx q[56],q[97];
-cx q[56],q[1];
-cx q[11],q[56];
-cx q[13],q[56];
-cx q[37],q[56];
-cx q[49],q[56];
-cx q[50],q[56];
-cx q[51],q[56];
-cx q[67],q[56];
-cx q[95],q[56];
-cx q[6],q[12];
-cx q[6],q[14];
-cx q[6],q[45];
-cx q[6],q[54];
-cx q[6],q[62];
-cx q[6],q[68];
-cx q[6],q[78];
-cx q[6],q[79];
-cx q[6],q[81];
-cx q[6],q[91];
-cx q[6],q[94];
-cx q[56],q[6];
-h q[6];
-cx q[6],q[56];
-cx q[8],q[3];
-cx q[3],q[56];
-cx q[56],q[8];
-cx q[17],q[15];
-cx q[15],q[56];
-cx q[56],q[17];
-cx q[26],q[23];
-cx q[23],q[56];
-cx q[56],q[26];
-cx q[28],q[27];
-cx q[27],q[56];
-cx q[56],q[28];
-cx q[39],q[38];
-cx q[38],q[56];
-cx q[56],q[39];
-cx q[46],q[43];
-cx q[43],q[56];
-cx q[56],q[46];
-cx q[57],q[47];
-cx q[47],q[56];
-cx q[56],q[57];
-cx q[87],q[80];
-cx q[80],q[56];
-cx q[56],q[87];
-cx q[96],q[93];
-cx q[93],q[56];
-cx q[56],q[96];
-s q[1];
-s q[2];
-s q[3];
-h q[3];
-s q[5];
-s q[6];
-h q[6];
-s q[6];
-s q[8];
-h q[11];
-s q[12];
-h q[13];
-s q[16];
-h q[21];
-h q[22];
-s q[27];
-s q[28];
-h q[32];
-h q[37];
-s q[40];
-h q[40];
-h q[42];
-h q[45];
-s q[46];
-s q[47];
-h q[51];
-s q[52];
-h q[52];
-h q[61];
-h q[62];
-s q[62];
-s q[63];
-h q[64];
-s q[65];
-h q[65];
-s q[67];
-h q[67];
-s q[68];
-h q[68];
-h q[76];
-s q[77];
-h q[77];
-h q[78];
-s q[80];
-h q[80];
-h q[81];
-h q[83];
-s q[91];
-s q[94];
-h q[94];
-h q[95];
-h q[96];
-s q[96];
-h q[97];
-swap q[30],q[1];
-cx q[30],q[13];
-cx q[30],q[23];
-cx q[30],q[27];
-cx q[30],q[37];
-cx q[30],q[42];
-cx q[30],q[45];
-cx q[30],q[50];
-cx q[30],q[55];
-cx q[30],q[81];
-cx q[30],q[91];
-cx q[30],q[95];
-cx q[3],q[30];
-cx q[15],q[30];
-cx q[21],q[30];
-cx q[32],q[30];
-cx q[40],q[30];
-cx q[57],q[30];
-cx q[61],q[30];
-cx q[67],q[30];
-cx q[68],q[30];
-cx q[76],q[30];
-cx q[77],q[30];
-cx q[94],q[30];
-cx q[1],q[30];
-cx q[8],q[12];
-cx q[8],q[17];
-cx q[8],q[49];
-cx q[8],q[51];
-cx q[8],q[54];
-cx q[8],q[63];
-cx q[8],q[64];
-cx q[8],q[72];
-cx q[8],q[78];
-cx q[30],q[8];
-h q[8];
-cx q[8],q[30];
-cx q[5],q[2];
-cx q[2],q[30];
-cx q[30],q[5];
-cx q[11],q[6];
-cx q[6],q[30];
-cx q[30],q[11];
-cx q[16],q[14];
-cx q[14],q[30];
-cx q[30],q[16];
-cx q[26],q[22];
-cx q[22],q[30];
-cx q[30],q[26];
-cx q[46],q[28];
-cx q[28],q[30];
-cx q[30],q[46];
-cx q[52],q[47];
-cx q[47],q[30];
-cx q[30],q[52];
-cx q[65],q[62];
-cx q[62],q[30];
-cx q[30],q[65];
-cx q[83],q[80];
-cx q[80],q[30];
-cx q[30],q[83];
-cx q[97],q[96];
-cx q[96],q[30];
-cx q[30],q[97];
-h q[1];
-s q[1];
-h q[2];
-h q[3];
-s q[5];
-h q[5];
-h q[15];
-s q[21];
-s q[22];
-h q[22];
-s q[22];
-h q[23];
-s q[23];
-h q[26];
-s q[27];
-s q[28];
-h q[32];
-s q[37];
-h q[37];
-s q[38];
-s q[40];
-h q[42];
-h q[45];
-s q[45];
-s q[46];
-s q[47];
-h q[47];
-s q[47];
-h q[49];
-h q[52];
-s q[52];
-s q[55];
-h q[61];
-h q[62];
-h q[63];
-h q[65];
-s q[67];
-h q[67];
-s q[73];
-s q[76];
-h q[76];
-s q[76];
-h q[77];
-h q[78];
-s q[79];
-h q[79];
-s q[80];
-h q[80];
-s q[80];
-h q[87];
-h q[91];
-s q[96];
-h q[97];
-swap q[61],q[1];
-cx q[61],q[2];
-cx q[61],q[8];
-cx q[61],q[15];
-cx q[61],q[16];
-cx q[61],q[28];
-cx q[61],q[39];
-cx q[61],q[43];
-cx q[61],q[46];
-cx q[61],q[78];
-cx q[61],q[87];
-cx q[61],q[96];
-cx q[13],q[61];
-cx q[14],q[61];
-cx q[32],q[61];
-cx q[37],q[61];
-cx q[49],q[61];
-cx q[63],q[61];
-cx q[79],q[61];
-cx q[81],q[61];
-cx q[83],q[61];
-cx q[91],q[61];
-cx q[93],q[61];
-cx q[1],q[61];
-cx q[26],q[27];
-cx q[26],q[38];
-cx q[26],q[40];
-cx q[26],q[54];
-cx q[26],q[55];
-cx q[26],q[62];
-cx q[26],q[73];
-cx q[26],q[97];
-cx q[61],q[26];
-h q[26];
-cx q[26],q[61];
-cx q[5],q[3];
-cx q[3],q[61];
-cx q[61],q[5];
-cx q[22],q[21];
-cx q[21],q[61];
-cx q[61],q[22];
-cx q[42],q[23];
-cx q[23],q[61];
-cx q[61],q[42];
-cx q[47],q[45];
-cx q[45],q[61];
-cx q[61],q[47];
-cx q[65],q[52];
-cx q[52],q[61];
-cx q[61],q[65];
-cx q[68],q[67];
-cx q[67],q[61];
-cx q[61],q[68];
-cx q[76],q[75];
-cx q[75],q[61];
-cx q[61],q[76];
-cx q[80],q[77];
-cx q[77],q[61];
-cx q[61],q[80];
-h q[1];
-s q[2];
-s q[3];
-h q[5];
-s q[6];
-h q[6];
-s q[8];
-h q[11];
-h q[12];
-s q[12];
-s q[13];
-h q[14];
-s q[15];
-h q[15];
-h q[17];
-s q[21];
-s q[23];
-s q[26];
-s q[27];
-s q[28];
-h q[28];
-s q[28];
-s q[37];
-s q[38];
-s q[39];
-h q[40];
-h q[42];
-h q[43];
-h q[45];
-s q[45];
-s q[47];
-h q[49];
-s q[49];
-s q[50];
-h q[50];
-s q[52];
-h q[52];
-s q[54];
-s q[55];
-h q[55];
-h q[64];
-h q[65];
-h q[76];
-h q[77];
-h q[79];
-h q[81];
-h q[83];
-h q[87];
-h q[91];
-h q[96];
-s q[96];
-swap q[68],q[1];
-cx q[68],q[2];
-cx q[68],q[11];
-cx q[68],q[14];
-cx q[68],q[21];
-cx q[68],q[22];
-cx q[68],q[23];
-cx q[68],q[40];
-cx q[68],q[42];
-cx q[68],q[46];
-cx q[68],q[47];
-cx q[68],q[83];
-cx q[68],q[87];
-cx q[68],q[1];
-cx q[5],q[68];
-cx q[50],q[68];
-cx q[51],q[68];
-cx q[52],q[68];
-cx q[67],q[68];
-cx q[73],q[68];
-cx q[81],q[68];
-cx q[8],q[13];
-cx q[8],q[16];
-cx q[8],q[17];
-cx q[8],q[26];
-cx q[8],q[37];
-cx q[8],q[38];
-cx q[8],q[39];
-cx q[8],q[65];
-cx q[8],q[76];
-cx q[8],q[77];
-cx q[8],q[79];
-cx q[8],q[93];
-cx q[8],q[94];
-cx q[68],q[8];
-h q[8];
-cx q[8],q[68];
-cx q[6],q[3];
-cx q[3],q[68];
-cx q[68],q[6];
-cx q[15],q[12];
-cx q[12],q[68];
-cx q[68],q[15];
-cx q[28],q[27];
-cx q[27],q[68];
-cx q[68],q[28];
-cx q[45],q[43];
-cx q[43],q[68];
-cx q[68],q[45];
-cx q[54],q[49];
-cx q[49],q[68];
-cx q[68],q[54];
-cx q[57],q[55];
-cx q[55],q[68];
-cx q[68],q[57];
-cx q[64],q[62];
-cx q[62],q[68];
-cx q[68],q[64];
-cx q[75],q[72];
-cx q[72],q[68];
-cx q[68],q[75];
-cx q[96],q[91];
-cx q[91],q[68];
-cx q[68],q[96];
-s q[1];
-s q[3];
-h q[3];
-h q[5];
-s q[6];
-h q[6];
-s q[8];
-h q[12];
-s q[13];
-s q[16];
-h q[17];
-s q[21];
-s q[23];
-h q[23];
-h q[26];
-h q[27];
-s q[28];
-h q[28];
-s q[28];
-s q[37];
-h q[38];
-h q[39];
-h q[40];
-s q[43];
-h q[45];
-h q[46];
-s q[47];
-h q[47];
-s q[49];
-h q[50];
-s q[50];
-h q[51];
-s q[52];
-h q[54];
-h q[55];
-s q[62];
-h q[64];
-s q[67];
-h q[67];
-s q[67];
-s q[72];
-h q[72];
-h q[75];
-h q[77];
-s q[78];
-s q[83];
-h q[83];
-s q[93];
-h q[94];
-h q[95];
-swap q[97],q[1];
-cx q[97],q[2];
-cx q[97],q[12];
-cx q[97],q[16];
-cx q[97],q[17];
-cx q[97],q[39];
-cx q[97],q[40];
-cx q[97],q[42];
-cx q[97],q[43];
-cx q[97],q[45];
-cx q[97],q[46];
-cx q[97],q[51];
-cx q[97],q[62];
-cx q[97],q[63];
-cx q[97],q[64];
-cx q[97],q[81];
-cx q[97],q[1];
-cx q[3],q[97];
-cx q[5],q[97];
-cx q[22],q[97];
-cx q[23],q[97];
-cx q[26],q[97];
-cx q[27],q[97];
-cx q[77],q[97];
-cx q[83],q[97];
-cx q[94],q[97];
-cx q[38],q[57];
-cx q[38],q[75];
-cx q[38],q[80];
-cx q[97],q[38];
-h q[38];
-cx q[38],q[97];
-cx q[8],q[6];
-cx q[6],q[97];
-cx q[97],q[8];
-cx q[14],q[13];
-cx q[13],q[97];
-cx q[97],q[14];
-cx q[28],q[21];
-cx q[21],q[97];
-cx q[97],q[28];
-cx q[37],q[32];
-cx q[32],q[97];
-cx q[97],q[37];
-cx q[49],q[47];
-cx q[47],q[97];
-cx q[97],q[49];
-cx q[52],q[50];
-cx q[50],q[97];
-cx q[97],q[52];
-cx q[55],q[54];
-cx q[54],q[97];
-cx q[97],q[55];
-cx q[72],q[67];
-cx q[67],q[97];
-cx q[97],q[72];
-cx q[93],q[78];
-cx q[78],q[97];
-cx q[97],q[93];
-cx q[96],q[95];
-cx q[95],q[97];
-cx q[97],q[96];
-s q[1];
-s q[5];
-h q[5];
-s q[5];
-h q[6];
-s q[6];
-h q[11];
-s q[11];
-h q[14];
-s q[17];
-s q[22];
-h q[23];
-s q[26];
-h q[28];
-s q[28];
-s q[32];
-s q[37];
-h q[38];
-h q[39];
-h q[40];
-s q[43];
-s q[46];
-h q[50];
-h q[51];
-s q[52];
-s q[54];
-h q[54];
-s q[55];
-h q[57];
-h q[63];
-s q[64];
-h q[64];
-s q[64];
-s q[75];
-h q[75];
-s q[75];
-s q[77];
-s q[78];
-h q[80];
-s q[81];
-h q[83];
-h q[87];
-s q[91];
-h q[91];
-s q[93];
-s q[94];
-h q[94];
-h q[95];
-s q[96];
-h q[96];
-s q[96];
-swap q[27],q[1];
-cx q[27],q[2];
-cx q[27],q[8];
-cx q[27],q[14];
-cx q[27],q[16];
-cx q[27],q[22];
-cx q[27],q[38];
-cx q[27],q[40];
-cx q[27],q[45];
-cx q[27],q[63];
-cx q[27],q[67];
-cx q[27],q[72];
-cx q[27],q[73];
-cx q[27],q[87];
-cx q[47],q[27];
-cx q[50],q[27];
-cx q[51],q[27];
-cx q[62],q[27];
-cx q[91],q[27];
-cx q[94],q[27];
-cx q[12],q[17];
-cx q[12],q[23];
-cx q[12],q[37];
-cx q[12],q[39];
-cx q[12],q[46];
-cx q[12],q[55];
-cx q[12],q[57];
-cx q[12],q[76];
-cx q[12],q[77];
-cx q[12],q[78];
-cx q[12],q[80];
-cx q[12],q[81];
-cx q[12],q[1];
-cx q[27],q[12];
-h q[12];
-cx q[12],q[27];
-cx q[6],q[5];
-cx q[5],q[27];
-cx q[27],q[6];
-cx q[13],q[11];
-cx q[11],q[27];
-cx q[27],q[13];
-cx q[28],q[26];
-cx q[26],q[27];
-cx q[27],q[28];
-cx q[42],q[32];
-cx q[32],q[27];
-cx q[27],q[42];
-cx q[49],q[43];
-cx q[43],q[27];
-cx q[27],q[49];
-cx q[54],q[52];
-cx q[52],q[27];
-cx q[27],q[54];
-cx q[75],q[64];
-cx q[64],q[27];
-cx q[27],q[75];
-cx q[93],q[83];
-cx q[83],q[27];
-cx q[27],q[93];
-cx q[96],q[95];
-cx q[95],q[27];
-cx q[27],q[96];
-s q[1];
-h q[1];
-s q[1];
-s q[2];
-h q[2];
-s q[3];
-h q[3];
-h q[6];
-h q[8];
-s q[11];
-h q[11];
-s q[11];
-s q[12];
-h q[12];
-s q[13];
-s q[14];
-h q[14];
-s q[14];
-h q[16];
-s q[17];
-h q[17];
-h q[21];
-s q[22];
-h q[22];
-s q[22];
-h q[23];
-s q[39];
-s q[42];
-h q[42];
-s q[42];
-s q[43];
-h q[43];
-s q[43];
-s q[45];
-s q[46];
-h q[46];
-h q[47];
-s q[47];
-h q[49];
-s q[49];
-h q[52];
-s q[54];
-h q[54];
-s q[54];
-h q[55];
-h q[57];
-s q[57];
-h q[65];
-h q[72];
-h q[75];
-s q[79];
-s q[80];
-s q[83];
-s q[87];
-s q[91];
-s q[94];
-swap q[3],q[1];
-cx q[3],q[6];
-cx q[3],q[40];
-cx q[3],q[45];
-cx q[3],q[75];
-cx q[3],q[79];
-cx q[3],q[80];
-cx q[3],q[83];
-cx q[3],q[91];
-cx q[5],q[3];
-cx q[8],q[3];
-cx q[16],q[3];
-cx q[17],q[3];
-cx q[21],q[3];
-cx q[26],q[3];
-cx q[63],q[3];
-cx q[96],q[3];
-cx q[1],q[3];
-cx q[23],q[37];
-cx q[23],q[52];
-cx q[23],q[55];
-cx q[23],q[64];
-cx q[23],q[65];
-cx q[23],q[76];
-cx q[23],q[81];
-cx q[23],q[94];
-cx q[23],q[95];
-cx q[3],q[23];
-h q[23];
-cx q[23],q[3];
-cx q[11],q[2];
-cx q[2],q[3];
-cx q[3],q[11];
-cx q[13],q[12];
-cx q[12],q[3];
-cx q[3],q[13];
-cx q[15],q[14];
-cx q[14],q[3];
-cx q[3],q[15];
-cx q[39],q[22];
-cx q[22],q[3];
-cx q[3],q[39];
-cx q[43],q[42];
-cx q[42],q[3];
-cx q[3],q[43];
-cx q[47],q[46];
-cx q[46],q[3];
-cx q[3],q[47];
-cx q[50],q[49];
-cx q[49],q[3];
-cx q[3],q[50];
-cx q[54],q[51];
-cx q[51],q[3];
-cx q[3],q[54];
-cx q[72],q[57];
-cx q[57],q[3];
-cx q[3],q[72];
-cx q[87],q[77];
-cx q[77],q[3];
-cx q[3],q[87];
-h q[2];
-s q[5];
-h q[5];
-h q[11];
-h q[12];
-s q[13];
-h q[13];
-s q[13];
-h q[17];
-s q[17];
-h q[23];
-s q[26];
-h q[26];
-s q[26];
-s q[28];
-h q[32];
-s q[37];
-h q[39];
-s q[40];
-h q[42];
-h q[43];
-h q[47];
-s q[51];
-s q[54];
-h q[54];
-h q[57];
-s q[63];
-h q[63];
-s q[63];
-h q[64];
-s q[65];
-h q[67];
-s q[72];
-s q[73];
-h q[73];
-h q[75];
-s q[75];
-h q[78];
-h q[79];
-s q[79];
-h q[80];
-s q[80];
-s q[81];
-h q[83];
-h q[91];
-h q[93];
-s q[95];
-s q[96];
-cx q[62],q[15];
-cx q[62],q[32];
-cx q[62],q[40];
-cx q[62],q[47];
-cx q[62],q[50];
-cx q[62],q[55];
-cx q[62],q[81];
-cx q[62],q[95];
-cx q[5],q[62];
-cx q[23],q[62];
-cx q[54],q[62];
-cx q[64],q[62];
-cx q[67],q[62];
-cx q[73],q[62];
-cx q[76],q[62];
-cx q[78],q[62];
-cx q[83],q[62];
-cx q[94],q[62];
-cx q[2],q[11];
-cx q[2],q[12];
-cx q[2],q[37];
-cx q[2],q[39];
-cx q[2],q[42];
-cx q[2],q[51];
-cx q[2],q[65];
-cx q[2],q[77];
-cx q[2],q[96];
-cx q[62],q[2];
-h q[2];
-cx q[2],q[62];
-cx q[13],q[1];
-cx q[1],q[62];
-cx q[62],q[13];
-cx q[16],q[14];
-cx q[14],q[62];
-cx q[62],q[16];
-cx q[26],q[17];
-cx q[17],q[62];
-cx q[62],q[26];
-cx q[43],q[28];
-cx q[28],q[62];
-cx q[62],q[43];
-cx q[49],q[45];
-cx q[45],q[62];
-cx q[62],q[49];
-cx q[63],q[57];
-cx q[57],q[62];
-cx q[62],q[63];
-cx q[75],q[72];
-cx q[72],q[62];
-cx q[62],q[75];
-cx q[80],q[79];
-cx q[79],q[62];
-cx q[62],q[80];
-cx q[93],q[91];
-cx q[91],q[62];
-cx q[62],q[93];
-s q[5];
-s q[8];
-h q[8];
-s q[11];
-s q[12];
-h q[12];
-s q[12];
-s q[15];
-s q[16];
-h q[17];
-s q[17];
-s q[21];
-h q[26];
-s q[28];
-h q[28];
-s q[37];
-h q[37];
-s q[37];
-h q[39];
-h q[40];
-h q[43];
-s q[46];
-h q[46];
-s q[46];
-h q[49];
-h q[50];
-h q[51];
-s q[52];
-h q[52];
-h q[54];
-s q[54];
-s q[55];
-s q[57];
-h q[63];
-s q[64];
-s q[65];
-s q[67];
-h q[67];
-h q[72];
-h q[75];
-h q[77];
-s q[78];
-s q[79];
-h q[81];
-s q[81];
-h q[83];
-h q[87];
-s q[91];
-cx q[55],q[11];
-cx q[55],q[14];
-cx q[55],q[16];
-cx q[55],q[26];
-cx q[55],q[32];
-cx q[55],q[47];
-cx q[55],q[51];
-cx q[55],q[77];
-cx q[55],q[79];
-cx q[55],q[87];
-cx q[55],q[93];
-cx q[55],q[94];
-cx q[2],q[55];
-cx q[8],q[55];
-cx q[23],q[55];
-cx q[28],q[55];
-cx q[40],q[55];
-cx q[42],q[55];
-cx q[43],q[55];
-cx q[49],q[55];
-cx q[52],q[55];
-cx q[72],q[55];
-cx q[75],q[55];
-cx q[1],q[5];
-cx q[1],q[15];
-cx q[1],q[21];
-cx q[1],q[45];
-cx q[1],q[50];
-cx q[1],q[57];
-cx q[1],q[63];
-cx q[1],q[64];
-cx q[1],q[65];
-cx q[1],q[78];
-cx q[1],q[83];
-cx q[1],q[91];
-cx q[55],q[1];
-h q[1];
-cx q[1],q[55];
-cx q[17],q[12];
-cx q[12],q[55];
-cx q[55],q[17];
-cx q[37],q[22];
-cx q[22],q[55];
-cx q[55],q[37];
-cx q[46],q[39];
-cx q[39],q[55];
-cx q[55],q[46];
-cx q[67],q[54];
-cx q[54],q[55];
-cx q[55],q[67];
-cx q[95],q[81];
-cx q[81],q[55];
-cx q[55],q[95];
-h q[1];
-h q[5];
-h q[6];
-h q[8];
-s q[11];
-s q[12];
-s q[13];
-h q[13];
-s q[14];
-s q[15];
-h q[15];
-s q[16];
-h q[17];
-s q[22];
-h q[28];
-s q[32];
-h q[37];
-h q[39];
-s q[40];
-s q[43];
-s q[45];
-h q[45];
-h q[46];
-s q[50];
-s q[52];
-h q[52];
-h q[54];
-s q[57];
-s q[64];
-s q[67];
-h q[67];
-h q[72];
-s q[72];
-h q[73];
-s q[75];
-h q[76];
-s q[78];
-h q[78];
-s q[80];
-h q[80];
-h q[81];
-s q[87];
-h q[87];
-s q[91];
-s q[93];
-s q[94];
-swap q[83],q[14];
-cx q[83],q[5];
-cx q[83],q[6];
-cx q[83],q[8];
-cx q[83],q[11];
-cx q[83],q[17];
-cx q[83],q[28];
-cx q[83],q[37];
-cx q[83],q[39];
-cx q[83],q[43];
-cx q[83],q[57];
-cx q[83],q[75];
-cx q[83],q[76];
-cx q[83],q[93];
-cx q[13],q[83];
-cx q[42],q[83];
-cx q[45],q[83];
-cx q[49],q[83];
-cx q[52],q[83];
-cx q[63],q[83];
-cx q[65],q[83];
-cx q[67],q[83];
-cx q[77],q[83];
-cx q[79],q[83];
-cx q[80],q[83];
-cx q[81],q[83];
-cx q[96],q[83];
-cx q[14],q[83];
-cx q[1],q[2];
-cx q[1],q[12];
-cx q[1],q[22];
-cx q[1],q[32];
-cx q[1],q[40];
-cx q[1],q[46];
-cx q[1],q[50];
-cx q[1],q[64];
-cx q[1],q[73];
-cx q[1],q[91];
-cx q[1],q[94];
-cx q[83],q[1];
-h q[1];
-cx q[1],q[83];
-cx q[16],q[15];
-cx q[15],q[83];
-cx q[83],q[16];
-cx q[26],q[21];
-cx q[21],q[83];
-cx q[83],q[26];
-cx q[72],q[54];
-cx q[54],q[83];
-cx q[83],q[72];
-cx q[87],q[78];
-cx q[78],q[83];
-cx q[83],q[87];
-s q[2];
-h q[5];
-h q[6];
-h q[11];
-s q[12];
-h q[13];
-s q[15];
-h q[15];
-s q[16];
-h q[16];
-s q[22];
-h q[22];
-s q[22];
-s q[23];
-s q[28];
-h q[32];
-h q[37];
-s q[38];
-s q[40];
-s q[42];
-h q[45];
-h q[46];
-h q[47];
-h q[49];
-h q[50];
-h q[51];
-s q[52];
-h q[52];
-s q[52];
-s q[54];
-s q[57];
-s q[63];
-h q[64];
-h q[65];
-h q[67];
-s q[76];
-h q[76];
-s q[76];
-s q[77];
-h q[79];
-s q[81];
-h q[81];
-s q[81];
-s q[87];
-h q[87];
-h q[91];
-s q[93];
-h q[95];
-h q[96];
-swap q[13],q[1];
-cx q[13],q[2];
-cx q[13],q[5];
-cx q[13],q[12];
-cx q[13],q[40];
-cx q[13],q[42];
-cx q[13],q[50];
-cx q[13],q[54];
-cx q[13],q[75];
-cx q[13],q[96];
-cx q[13],q[1];
-cx q[6],q[13];
-cx q[11],q[13];
-cx q[21],q[13];
-cx q[26],q[13];
-cx q[37],q[13];
-cx q[87],q[13];
-cx q[91],q[13];
-cx q[95],q[13];
-cx q[14],q[23];
-cx q[14],q[32];
-cx q[14],q[43];
-cx q[14],q[45];
-cx q[14],q[46];
-cx q[14],q[49];
-cx q[14],q[57];
-cx q[14],q[67];
-cx q[14],q[77];
-cx q[13],q[14];
-h q[14];
-cx q[14],q[13];
-cx q[16],q[15];
-cx q[15],q[13];
-cx q[13],q[16];
-cx q[28],q[22];
-cx q[22],q[13];
-cx q[13],q[28];
-cx q[47],q[38];
-cx q[38],q[13];
-cx q[13],q[47];
-cx q[52],q[51];
-cx q[51],q[13];
-cx q[13],q[52];
-cx q[64],q[63];
-cx q[63],q[13];
-cx q[13],q[64];
-cx q[76],q[65];
-cx q[65],q[13];
-cx q[13],q[76];
-cx q[81],q[79];
-cx q[79],q[13];
-cx q[13],q[81];
-cx q[94],q[93];
-cx q[93],q[13];
-cx q[13],q[94];
-h q[1];
-s q[11];
-s q[15];
-h q[15];
-s q[15];
-h q[16];
-s q[16];
-h q[17];
-s q[22];
-h q[22];
-s q[22];
-h q[23];
-s q[26];
-h q[26];
-s q[32];
-s q[37];
-s q[38];
-h q[38];
-s q[39];
-h q[39];
-s q[40];
-h q[40];
-s q[43];
-h q[47];
-s q[49];
-h q[49];
-h q[51];
-s q[52];
-h q[52];
-s q[52];
-h q[57];
-s q[57];
-s q[63];
-h q[65];
-s q[75];
-s q[76];
-s q[77];
-h q[77];
-s q[77];
-h q[80];
-s q[81];
-h q[81];
-s q[81];
-h q[91];
-h q[93];
-swap q[1],q[15];
-cx q[1],q[2];
-cx q[1],q[6];
-cx q[1],q[37];
-cx q[1],q[43];
-cx q[1],q[72];
-cx q[1],q[93];
-cx q[1],q[15];
-cx q[12],q[1];
-cx q[23],q[1];
-cx q[42],q[1];
-cx q[45],q[1];
-cx q[49],q[1];
-cx q[65],q[1];
-cx q[79],q[1];
-cx q[80],q[1];
-cx q[5],q[11];
-cx q[5],q[14];
-cx q[5],q[17];
-cx q[5],q[32];
-cx q[5],q[50];
-cx q[5],q[54];
-cx q[5],q[63];
-cx q[5],q[76];
-cx q[5],q[78];
-cx q[5],q[91];
-cx q[5],q[94];
-cx q[1],q[5];
-h q[5];
-cx q[5],q[1];
-cx q[21],q[16];
-cx q[16],q[1];
-cx q[1],q[21];
-cx q[26],q[22];
-cx q[22],q[1];
-cx q[1],q[26];
-cx q[39],q[38];
-cx q[38],q[1];
-cx q[1],q[39];
-cx q[47],q[40];
-cx q[40],q[1];
-cx q[1],q[47];
-cx q[52],q[51];
-cx q[51],q[1];
-cx q[1],q[52];
-cx q[75],q[57];
-cx q[57],q[1];
-cx q[1],q[75];
-cx q[81],q[77];
-cx q[77],q[1];
-cx q[1],q[81];
-h q[2];
-s q[2];
-s q[5];
-s q[6];
-h q[14];
-h q[16];
-s q[17];
-s q[21];
-h q[21];
-s q[22];
-h q[22];
-s q[23];
-h q[23];
-s q[26];
-h q[26];
-s q[32];
-s q[37];
-h q[37];
-s q[37];
-h q[38];
-h q[39];
-h q[40];
-h q[42];
-h q[45];
-s q[46];
-h q[46];
-s q[46];
-h q[47];
-h q[49];
-h q[50];
-h q[52];
-s q[57];
-s q[63];
-h q[63];
-s q[64];
-h q[65];
-h q[72];
-h q[73];
-s q[73];
-h q[75];
-s q[75];
-s q[78];
-h q[78];
-s q[79];
-s q[91];
-s q[95];
-h q[95];
-swap q[49],q[2];
-cx q[49],q[11];
-cx q[49],q[14];
-cx q[49],q[39];
-cx q[49],q[45];
-cx q[49],q[50];
-cx q[49],q[52];
-cx q[49],q[57];
-cx q[49],q[64];
-cx q[49],q[65];
-cx q[49],q[76];
-cx q[49],q[79];
-cx q[49],q[2];
-cx q[21],q[49];
-cx q[26],q[49];
-cx q[40],q[49];
-cx q[42],q[49];
-cx q[63],q[49];
-cx q[67],q[49];
-cx q[94],q[49];
-cx q[95],q[49];
-cx q[96],q[49];
-cx q[5],q[6];
-cx q[5],q[17];
-cx q[5],q[28];
-cx q[5],q[32];
-cx q[5],q[38];
-cx q[5],q[47];
-cx q[5],q[51];
-cx q[5],q[72];
-cx q[5],q[80];
-cx q[5],q[91];
-cx q[49],q[5];
-h q[5];
-cx q[5],q[49];
-cx q[16],q[15];
-cx q[15],q[49];
-cx q[49],q[16];
-cx q[23],q[22];
-cx q[22],q[49];
-cx q[49],q[23];
-cx q[46],q[37];
-cx q[37],q[49];
-cx q[49],q[46];
-cx q[73],q[54];
-cx q[54],q[49];
-cx q[49],q[73];
-cx q[78],q[75];
-cx q[75],q[49];
-cx q[49],q[78];
-s q[6];
-h q[8];
-s q[11];
-s q[12];
-s q[14];
-s q[15];
-h q[22];
-s q[22];
-h q[26];
-h q[28];
-s q[37];
-h q[37];
-s q[37];
-s q[38];
-h q[38];
-s q[39];
-h q[43];
-s q[43];
-s q[46];
-h q[46];
-s q[51];
-h q[54];
-s q[57];
-h q[63];
-s q[65];
-h q[73];
-s q[75];
-s q[76];
-s q[79];
-h q[81];
-s q[87];
-h q[87];
-s q[87];
-h q[93];
-h q[95];
-swap q[80],q[6];
-cx q[80],q[21];
-cx q[80],q[51];
-cx q[80],q[52];
-cx q[80],q[63];
-cx q[80],q[65];
-cx q[80],q[78];
-cx q[16],q[80];
-cx q[32],q[80];
-cx q[38],q[80];
-cx q[40],q[80];
-cx q[42],q[80];
-cx q[45],q[80];
-cx q[46],q[80];
-cx q[64],q[80];
-cx q[81],q[80];
-cx q[91],q[80];
-cx q[93],q[80];
-cx q[95],q[80];
-cx q[96],q[80];
-cx q[6],q[80];
-cx q[14],q[15];
-cx q[14],q[26];
-cx q[14],q[28];
-cx q[14],q[39];
-cx q[14],q[54];
-cx q[14],q[57];
-cx q[14],q[75];
-cx q[80],q[14];
-h q[14];
-cx q[14],q[80];
-cx q[11],q[8];
-cx q[8],q[80];
-cx q[80],q[11];
-cx q[22],q[12];
-cx q[12],q[80];
-cx q[80],q[22];
-cx q[43],q[37];
-cx q[37],q[80];
-cx q[80],q[43];
-cx q[73],q[50];
-cx q[50],q[80];
-cx q[80],q[73];
-cx q[79],q[76];
-cx q[76],q[80];
-cx q[80],q[79];
-cx q[94],q[87];
-cx q[87],q[80];
-cx q[80],q[94];
-h q[2];
-s q[2];
-h q[5];
-s q[6];
-h q[6];
-h q[8];
-s q[14];
-h q[14];
-s q[17];
-s q[23];
-h q[26];
-s q[28];
-h q[32];
-s q[37];
-s q[38];
-h q[38];
-s q[40];
-h q[42];
-s q[42];
-h q[46];
-s q[50];
-h q[50];
-s q[52];
-h q[52];
-s q[54];
-h q[63];
-s q[63];
-h q[64];
-s q[65];
-h q[65];
-h q[67];
-s q[72];
-s q[75];
-h q[77];
-s q[81];
-s q[87];
-h q[87];
-s q[91];
-h q[91];
-s q[93];
-s q[95];
-s q[96];
-swap q[12],q[2];
-cx q[12],q[15];
-cx q[12],q[17];
-cx q[12],q[21];
-cx q[12],q[23];
-cx q[12],q[26];
-cx q[12],q[28];
-cx q[12],q[39];
-cx q[12],q[45];
-cx q[12],q[72];
-cx q[12],q[93];
-cx q[12],q[95];
-cx q[12],q[96];
-cx q[12],q[2];
-cx q[14],q[12];
-cx q[22],q[12];
-cx q[32],q[12];
-cx q[38],q[12];
-cx q[52],q[12];
-cx q[64],q[12];
-cx q[65],q[12];
-cx q[78],q[12];
-cx q[87],q[12];
-cx q[91],q[12];
-cx q[37],q[40];
-cx q[37],q[43];
-cx q[37],q[67];
-cx q[37],q[75];
-cx q[37],q[77];
-cx q[12],q[37];
-h q[37];
-cx q[37],q[12];
-cx q[6],q[5];
-cx q[5],q[12];
-cx q[12],q[6];
-cx q[11],q[8];
-cx q[8],q[12];
-cx q[12],q[11];
-cx q[46],q[42];
-cx q[42],q[12];
-cx q[12],q[46];
-cx q[54],q[50];
-cx q[50],q[12];
-cx q[12],q[54];
-cx q[76],q[63];
-cx q[63],q[12];
-cx q[12],q[76];
-cx q[81],q[79];
-cx q[79],q[12];
-cx q[12],q[81];
-s q[2];
-s q[5];
-h q[8];
-h q[11];
-h q[15];
-h q[16];
-s q[16];
-h q[26];
-s q[26];
-h q[28];
-s q[32];
-h q[32];
-s q[32];
-h q[37];
-s q[38];
-h q[38];
-s q[39];
-s q[42];
-s q[52];
-s q[54];
-h q[54];
-s q[54];
-s q[57];
-h q[57];
-s q[57];
-s q[63];
-h q[65];
-h q[67];
-s q[72];
-h q[72];
-s q[72];
-s q[75];
-h q[75];
-h q[76];
-h q[77];
-s q[79];
-h q[81];
-s q[87];
-h q[87];
-s q[94];
-swap q[51],q[2];
-cx q[51],q[5];
-cx q[51],q[28];
-cx q[51],q[37];
-cx q[51],q[43];
-cx q[51],q[52];
-cx q[51],q[65];
-cx q[51],q[73];
-cx q[51],q[77];
-cx q[51],q[79];
-cx q[15],q[51];
-cx q[38],q[51];
-cx q[50],q[51];
-cx q[75],q[51];
-cx q[76],q[51];
-cx q[93],q[51];
-cx q[6],q[8];
-cx q[6],q[11];
-cx q[6],q[14];
-cx q[6],q[17];
-cx q[6],q[21];
-cx q[6],q[42];
-cx q[6],q[81];
-cx q[6],q[91];
-cx q[6],q[96];
-cx q[51],q[6];
-h q[6];
-cx q[6],q[51];
-cx q[26],q[16];
-cx q[16],q[51];
-cx q[51],q[26];
-cx q[39],q[32];
-cx q[32],q[51];
-cx q[51],q[39];
-cx q[54],q[47];
-cx q[47],q[51];
-cx q[51],q[54];
-cx q[63],q[57];
-cx q[57],q[51];
-cx q[51],q[63];
-cx q[67],q[64];
-cx q[64],q[51];
-cx q[51],q[67];
-cx q[87],q[72];
-cx q[72],q[51];
-cx q[51],q[87];
-cx q[95],q[94];
-cx q[94],q[51];
-cx q[51],q[95];
-s q[2];
-h q[2];
-s q[5];
-h q[5];
-h q[6];
-h q[14];
-h q[15];
-s q[16];
-h q[17];
-h q[21];
-h q[22];
-s q[23];
-h q[23];
-s q[23];
-s q[26];
-h q[26];
-s q[28];
-s q[37];
-h q[38];
-s q[38];
-s q[39];
-s q[46];
-h q[52];
-h q[54];
-s q[57];
-h q[57];
-h q[63];
-s q[64];
-h q[64];
-h q[65];
-s q[65];
-h q[73];
-s q[73];
-s q[78];
-h q[78];
-s q[81];
-h q[81];
-s q[91];
-h q[91];
-s q[91];
-h q[93];
-h q[94];
-s q[95];
-h q[95];
-cx q[2],q[16];
-cx q[2],q[17];
-cx q[2],q[22];
-cx q[2],q[28];
-cx q[2],q[43];
-cx q[2],q[87];
-cx q[2],q[94];
-cx q[14],q[2];
-cx q[15],q[2];
-cx q[26],q[2];
-cx q[32],q[2];
-cx q[78],q[2];
-cx q[95],q[2];
-cx q[8],q[37];
-cx q[8],q[40];
-cx q[8],q[42];
-cx q[8],q[45];
-cx q[8],q[52];
-cx q[8],q[63];
-cx q[8],q[72];
-cx q[8],q[93];
-cx q[2],q[8];
-h q[8];
-cx q[8],q[2];
-cx q[6],q[5];
-cx q[5],q[2];
-cx q[2],q[6];
-cx q[21],q[11];
-cx q[11],q[2];
-cx q[2],q[21];
-cx q[38],q[23];
-cx q[23],q[2];
-cx q[2],q[38];
-cx q[46],q[39];
-cx q[39],q[2];
-cx q[2],q[46];
-cx q[57],q[54];
-cx q[54],q[2];
-cx q[2],q[57];
-cx q[65],q[64];
-cx q[64],q[2];
-cx q[2],q[65];
-cx q[73],q[67];
-cx q[67],q[2];
-cx q[2],q[73];
-cx q[91],q[81];
-cx q[81],q[2];
-cx q[2],q[91];
-h q[6];
-s q[11];
-h q[11];
-s q[11];
-h q[14];
-h q[15];
-s q[16];
-h q[16];
-s q[16];
-h q[17];
-s q[22];
-h q[26];
-s q[32];
-h q[37];
-h q[39];
-s q[40];
-s q[43];
-h q[46];
-s q[47];
-h q[57];
-s q[64];
-s q[65];
-s q[72];
-h q[72];
-s q[72];
-s q[73];
-s q[76];
-h q[76];
-s q[76];
-s q[78];
-h q[78];
-h q[79];
-h q[87];
-s q[87];
-s q[93];
-h q[93];
-h q[94];
-s q[94];
-h q[95];
-h q[96];
-cx q[38],q[5];
-cx q[38],q[15];
-cx q[38],q[21];
-cx q[38],q[22];
-cx q[38],q[43];
-cx q[38],q[54];
-cx q[38],q[79];
-cx q[38],q[91];
-cx q[38],q[95];
-cx q[14],q[38];
-cx q[17],q[38];
-cx q[39],q[38];
-cx q[46],q[38];
-cx q[78],q[38];
-cx q[28],q[32];
-cx q[28],q[45];
-cx q[28],q[47];
-cx q[28],q[57];
-cx q[28],q[64];
-cx q[28],q[73];
-cx q[28],q[96];
-cx q[38],q[28];
-h q[28];
-cx q[28],q[38];
-cx q[11],q[6];
-cx q[6],q[38];
-cx q[38],q[11];
-cx q[26],q[16];
-cx q[16],q[38];
-cx q[38],q[26];
-cx q[40],q[37];
-cx q[37],q[38];
-cx q[38],q[40];
-cx q[52],q[42];
-cx q[42],q[38];
-cx q[38],q[52];
-cx q[72],q[65];
-cx q[65],q[38];
-cx q[38],q[72];
-cx q[87],q[76];
-cx q[76],q[38];
-cx q[38],q[87];
-cx q[94],q[93];
-cx q[93],q[38];
-cx q[38],q[94];
-s q[5];
-h q[11];
-h q[14];
-h q[15];
-h q[16];
-h q[17];
-h q[28];
-s q[32];
-h q[37];
-h q[39];
-s q[40];
-s q[42];
-s q[43];
-h q[43];
-s q[45];
-h q[45];
-s q[46];
-h q[50];
-h q[52];
-s q[54];
-h q[54];
-s q[63];
-s q[72];
-h q[72];
-h q[73];
-s q[73];
-s q[75];
-s q[76];
-h q[76];
-s q[77];
-h q[77];
-h q[78];
-h q[81];
-s q[91];
-h q[91];
-h q[93];
-s q[93];
-h q[96];
-cx q[76],q[11];
-cx q[76],q[17];
-cx q[76],q[26];
-cx q[76],q[28];
-cx q[76],q[46];
-cx q[76],q[63];
-cx q[76],q[67];
-cx q[76],q[78];
-cx q[76],q[95];
-cx q[76],q[96];
-cx q[14],q[76];
-cx q[15],q[76];
-cx q[21],q[76];
-cx q[22],q[76];
-cx q[37],q[76];
-cx q[45],q[76];
-cx q[50],q[76];
-cx q[57],q[76];
-cx q[77],q[76];
-cx q[91],q[76];
-cx q[94],q[76];
-cx q[16],q[32];
-cx q[16],q[39];
-cx q[16],q[40];
-cx q[16],q[81];
-cx q[76],q[16];
-h q[16];
-cx q[16],q[76];
-cx q[6],q[5];
-cx q[5],q[76];
-cx q[76],q[6];
-cx q[43],q[42];
-cx q[42],q[76];
-cx q[76],q[43];
-cx q[52],q[47];
-cx q[47],q[76];
-cx q[76],q[52];
-cx q[64],q[54];
-cx q[54],q[76];
-cx q[76],q[64];
-cx q[73],q[72];
-cx q[72],q[76];
-cx q[76],q[73];
-cx q[93],q[75];
-cx q[75],q[76];
-cx q[76],q[93];
-s q[6];
-s q[14];
-h q[14];
-h q[15];
-s q[16];
-h q[16];
-s q[16];
-s q[17];
-s q[21];
-h q[22];
-s q[23];
-h q[23];
-s q[26];
-s q[28];
-h q[28];
-h q[39];
-h q[40];
-s q[42];
-h q[42];
-h q[50];
-s q[54];
-s q[64];
-s q[65];
-s q[72];
-h q[72];
-s q[73];
-h q[77];
-h q[78];
-s q[81];
-h q[81];
-s q[87];
-s q[93];
-h q[94];
-s q[94];
-swap q[63],q[5];
-cx q[63],q[15];
-cx q[63],q[21];
-cx q[63],q[26];
-cx q[63],q[32];
-cx q[63],q[64];
-cx q[63],q[95];
-cx q[63],q[5];
-cx q[22],q[63];
-cx q[28],q[63];
-cx q[43],q[63];
-cx q[46],q[63];
-cx q[78],q[63];
-cx q[81],q[63];
-cx q[91],q[63];
-cx q[96],q[63];
-cx q[6],q[11];
-cx q[6],q[37];
-cx q[6],q[39];
-cx q[6],q[50];
-cx q[6],q[54];
-cx q[6],q[65];
-cx q[6],q[73];
-cx q[6],q[75];
-cx q[6],q[77];
-cx q[6],q[79];
-cx q[6],q[93];
-cx q[63],q[6];
-h q[6];
-cx q[6],q[63];
-cx q[16],q[14];
-cx q[14],q[63];
-cx q[63],q[16];
-cx q[23],q[17];
-cx q[17],q[63];
-cx q[63],q[23];
-cx q[42],q[40];
-cx q[40],q[63];
-cx q[63],q[42];
-cx q[72],q[57];
-cx q[57],q[63];
-cx q[63],q[72];
-cx q[94],q[87];
-cx q[87],q[63];
-cx q[63],q[94];
-h q[5];
-h q[6];
-h q[8];
-s q[11];
-s q[15];
-s q[16];
-h q[16];
-s q[21];
-h q[21];
-h q[22];
-s q[23];
-h q[28];
-h q[32];
-s q[37];
-h q[37];
-h q[39];
-h q[40];
-s q[42];
-s q[45];
-h q[45];
-h q[46];
-s q[47];
-s q[52];
-h q[52];
-s q[57];
-s q[67];
-h q[73];
-h q[75];
-s q[77];
-h q[77];
-h q[78];
-h q[81];
-h q[87];
-h q[91];
-h q[95];
-s q[95];
-h q[96];
-swap q[39],q[5];
-cx q[39],q[8];
-cx q[39],q[23];
-cx q[39],q[28];
-cx q[39],q[32];
-cx q[39],q[54];
-cx q[39],q[57];
-cx q[39],q[65];
-cx q[39],q[75];
-cx q[39],q[91];
-cx q[39],q[93];
-cx q[39],q[96];
-cx q[6],q[39];
-cx q[16],q[39];
-cx q[21],q[39];
-cx q[22],q[39];
-cx q[40],q[39];
-cx q[45],q[39];
-cx q[52],q[39];
-cx q[72],q[39];
-cx q[73],q[39];
-cx q[77],q[39];
-cx q[79],q[39];
-cx q[81],q[39];
-cx q[5],q[39];
-cx q[11],q[14];
-cx q[11],q[15];
-cx q[11],q[50];
-cx q[11],q[87];
-cx q[39],q[11];
-h q[11];
-cx q[11],q[39];
-cx q[42],q[37];
-cx q[37],q[39];
-cx q[39],q[42];
-cx q[46],q[43];
-cx q[43],q[39];
-cx q[39],q[46];
-cx q[67],q[47];
-cx q[47],q[39];
-cx q[39],q[67];
-cx q[95],q[78];
-cx q[78],q[39];
-cx q[39],q[95];
-h q[8];
-s q[8];
-h q[15];
-s q[16];
-h q[16];
-s q[21];
-h q[21];
-s q[21];
-s q[22];
-h q[22];
-s q[22];
-s q[23];
-h q[23];
-h q[26];
-s q[28];
-h q[32];
-s q[40];
-h q[42];
-h q[45];
-s q[46];
-s q[47];
-h q[52];
-h q[57];
-h q[64];
-h q[65];
-s q[65];
-h q[72];
-s q[73];
-h q[73];
-s q[75];
-h q[75];
-h q[78];
-s q[78];
-h q[79];
-s q[81];
-h q[81];
-s q[87];
-h q[91];
-s q[93];
-h q[93];
-s q[95];
-s q[96];
-cx q[65],q[6];
-cx q[65],q[15];
-cx q[65],q[17];
-cx q[65],q[40];
-cx q[65],q[42];
-cx q[65],q[54];
-cx q[65],q[57];
-cx q[65],q[72];
-cx q[65],q[87];
-cx q[65],q[95];
-cx q[65],q[96];
-cx q[16],q[65];
-cx q[32],q[65];
-cx q[43],q[65];
-cx q[64],q[65];
-cx q[81],q[65];
-cx q[14],q[28];
-cx q[14],q[45];
-cx q[14],q[46];
-cx q[14],q[47];
-cx q[14],q[52];
-cx q[14],q[67];
-cx q[14],q[79];
-cx q[14],q[91];
-cx q[65],q[14];
-h q[14];
-cx q[14],q[65];
-cx q[8],q[5];
-cx q[5],q[65];
-cx q[65],q[8];
-cx q[22],q[21];
-cx q[21],q[65];
-cx q[65],q[22];
-cx q[26],q[23];
-cx q[23],q[65];
-cx q[65],q[26];
-cx q[75],q[73];
-cx q[73],q[65];
-cx q[65],q[75];
-cx q[93],q[78];
-cx q[78],q[65];
-cx q[65],q[93];
-s q[5];
-h q[5];
-s q[5];
-s q[6];
-s q[11];
-h q[17];
-s q[17];
-s q[21];
-h q[21];
-s q[21];
-h q[22];
-s q[22];
-h q[43];
-h q[46];
-h q[47];
-s q[50];
-h q[52];
-h q[54];
-s q[54];
-h q[57];
-s q[64];
-h q[64];
-s q[64];
-s q[67];
-s q[72];
-h q[72];
-h q[73];
-h q[75];
-h q[77];
-s q[78];
-s q[79];
-h q[79];
-s q[81];
-h q[81];
-s q[87];
-s q[93];
-h q[95];
-swap q[26],q[5];
-cx q[26],q[23];
-cx q[26],q[37];
-cx q[26],q[47];
-cx q[26],q[52];
-cx q[14],q[26];
-cx q[40],q[26];
-cx q[42],q[26];
-cx q[57],q[26];
-cx q[72],q[26];
-cx q[75],q[26];
-cx q[77],q[26];
-cx q[91],q[26];
-cx q[11],q[16];
-cx q[11],q[32];
-cx q[11],q[46];
-cx q[11],q[50];
-cx q[11],q[73];
-cx q[11],q[87];
-cx q[11],q[93];
-cx q[11],q[94];
-cx q[11],q[95];
-cx q[26],q[11];
-h q[11];
-cx q[11],q[26];
-cx q[8],q[6];
-cx q[6],q[26];
-cx q[26],q[8];
-cx q[21],q[17];
-cx q[17],q[26];
-cx q[26],q[21];
-cx q[43],q[22];
-cx q[22],q[26];
-cx q[26],q[43];
-cx q[64],q[54];
-cx q[54],q[26];
-cx q[26],q[64];
-cx q[78],q[67];
-cx q[67],q[26];
-cx q[26],q[78];
-cx q[81],q[79];
-cx q[79],q[26];
-cx q[26],q[81];
-h q[11];
-s q[16];
-s q[17];
-h q[17];
-s q[17];
-h q[21];
-h q[22];
-h q[23];
-s q[23];
-s q[43];
-h q[43];
-h q[47];
-h q[52];
-s q[54];
-h q[54];
-h q[57];
-s q[64];
-h q[64];
-h q[72];
-h q[75];
-s q[77];
-h q[77];
-s q[77];
-h q[78];
-s q[79];
-h q[81];
-s q[87];
-h q[91];
-h q[93];
-s q[94];
-h q[94];
-s q[94];
-h q[95];
-s q[95];
-h q[96];
-swap q[11],q[5];
-cx q[11],q[40];
-cx q[11],q[73];
-cx q[11],q[87];
-cx q[11],q[93];
-cx q[15],q[11];
-cx q[47],q[11];
-cx q[50],q[11];
-cx q[54],q[11];
-cx q[67],q[11];
-cx q[78],q[11];
-cx q[5],q[11];
-cx q[14],q[16];
-cx q[14],q[21];
-cx q[14],q[45];
-cx q[14],q[46];
-cx q[14],q[52];
-cx q[14],q[57];
-cx q[14],q[72];
-cx q[14],q[75];
-cx q[14],q[81];
-cx q[14],q[91];
-cx q[11],q[14];
-h q[14];
-cx q[14],q[11];
-cx q[22],q[17];
-cx q[17],q[11];
-cx q[11],q[22];
-cx q[43],q[23];
-cx q[23],q[11];
-cx q[11],q[43];
-cx q[77],q[64];
-cx q[64],q[11];
-cx q[11],q[77];
-cx q[94],q[79];
-cx q[79],q[11];
-cx q[11],q[94];
-cx q[96],q[95];
-cx q[95],q[11];
-cx q[11],q[96];
-h q[5];
-s q[6];
-h q[6];
-s q[6];
-h q[8];
-s q[15];
-s q[16];
-s q[17];
-s q[21];
-h q[22];
-s q[23];
-h q[40];
-h q[43];
-h q[47];
-s q[47];
-s q[50];
-h q[50];
-s q[50];
-h q[52];
-s q[52];
-h q[57];
-s q[67];
-h q[72];
-h q[73];
-h q[75];
-s q[77];
-h q[77];
-s q[78];
-h q[79];
-s q[79];
-h q[81];
-s q[81];
-s q[87];
-h q[91];
-s q[93];
-h q[93];
-h q[94];
-h q[95];
-h q[96];
-swap q[42],q[5];
-cx q[42],q[15];
-cx q[42],q[16];
-cx q[42],q[17];
-cx q[42],q[21];
-cx q[42],q[23];
-cx q[42],q[64];
-cx q[42],q[67];
-cx q[42],q[75];
-cx q[42],q[94];
-cx q[42],q[95];
-cx q[42],q[5];
-cx q[32],q[42];
-cx q[73],q[42];
-cx q[77],q[42];
-cx q[93],q[42];
-cx q[96],q[42];
-cx q[40],q[43];
-cx q[40],q[46];
-cx q[40],q[72];
-cx q[40],q[87];
-cx q[42],q[40];
-h q[40];
-cx q[40],q[42];
-cx q[8],q[6];
-cx q[6],q[42];
-cx q[42],q[8];
-cx q[22],q[14];
-cx q[14],q[42];
-cx q[42],q[22];
-cx q[50],q[47];
-cx q[47],q[42];
-cx q[42],q[50];
-cx q[57],q[52];
-cx q[52],q[42];
-cx q[42],q[57];
-cx q[79],q[78];
-cx q[78],q[42];
-cx q[42],q[79];
-cx q[91],q[81];
-cx q[81],q[42];
-cx q[42],q[91];
-s q[5];
-h q[5];
-s q[6];
-h q[8];
-s q[8];
-s q[16];
-s q[17];
-h q[17];
-h q[21];
-h q[28];
-s q[28];
-h q[32];
-s q[32];
-h q[40];
-s q[45];
-s q[47];
-h q[47];
-h q[50];
-h q[54];
-h q[57];
-s q[64];
-h q[64];
-s q[67];
-h q[67];
-h q[72];
-h q[73];
-s q[73];
-h q[75];
-h q[79];
-s q[87];
-h q[94];
-s q[96];
-h q[96];
-s q[96];
-cx q[57],q[6];
-cx q[57],q[46];
-cx q[57],q[87];
-cx q[57],q[93];
-cx q[50],q[57];
-cx q[64],q[57];
-cx q[67],q[57];
-cx q[79],q[57];
-cx q[91],q[57];
-cx q[94],q[57];
-cx q[16],q[21];
-cx q[16],q[22];
-cx q[16],q[23];
-cx q[16],q[40];
-cx q[16],q[52];
-cx q[16],q[54];
-cx q[16],q[72];
-cx q[16],q[77];
-cx q[16],q[78];
-cx q[16],q[81];
-cx q[57],q[16];
-h q[16];
-cx q[16],q[57];
-cx q[8],q[5];
-cx q[5],q[57];
-cx q[57],q[8];
-cx q[28],q[17];
-cx q[17],q[57];
-cx q[57],q[28];
-cx q[45],q[32];
-cx q[32],q[57];
-cx q[57],q[45];
-cx q[73],q[47];
-cx q[47],q[57];
-cx q[57],q[73];
-cx q[96],q[75];
-cx q[75],q[57];
-cx q[57],q[96];
-h q[5];
-s q[5];
-s q[14];
-h q[14];
-s q[15];
-s q[22];
-h q[32];
-s q[37];
-h q[37];
-s q[40];
-s q[43];
-h q[50];
-h q[54];
-h q[67];
-h q[72];
-s q[72];
-s q[77];
-h q[77];
-h q[79];
-s q[81];
-h q[87];
-s q[91];
-h q[91];
-s q[93];
-s q[94];
-h q[95];
-s q[96];
-h q[96];
-s q[96];
-swap q[79],q[5];
-cx q[79],q[21];
-cx q[79],q[40];
-cx q[79],q[73];
-cx q[79],q[87];
-cx q[32],q[79];
-cx q[37],q[79];
-cx q[50],q[79];
-cx q[54],q[79];
-cx q[67],q[79];
-cx q[75],q[79];
-cx q[77],q[79];
-cx q[78],q[79];
-cx q[91],q[79];
-cx q[95],q[79];
-cx q[6],q[22];
-cx q[6],q[28];
-cx q[6],q[43];
-cx q[6],q[47];
-cx q[6],q[5];
-cx q[79],q[6];
-h q[6];
-cx q[6],q[79];
-cx q[14],q[8];
-cx q[8],q[79];
-cx q[79],q[14];
-cx q[17],q[15];
-cx q[15],q[79];
-cx q[79],q[17];
-cx q[72],q[52];
-cx q[52],q[79];
-cx q[79],q[72];
-cx q[93],q[81];
-cx q[81],q[79];
-cx q[79],q[93];
-cx q[96],q[94];
-cx q[94],q[79];
-cx q[79],q[96];
-s q[5];
-h q[5];
-s q[5];
-s q[6];
-h q[6];
-s q[6];
-s q[14];
-h q[14];
-h q[15];
-s q[16];
-s q[17];
-h q[17];
-s q[17];
-s q[22];
-h q[23];
-h q[40];
-s q[43];
-h q[43];
-h q[45];
-h q[50];
-s q[52];
-s q[54];
-h q[54];
-s q[64];
-h q[67];
-s q[72];
-h q[75];
-h q[77];
-s q[78];
-s q[81];
-h q[93];
-s q[95];
-cx q[77],q[21];
-cx q[77],q[22];
-cx q[77],q[23];
-cx q[77],q[40];
-cx q[77],q[46];
-cx q[77],q[73];
-cx q[77],q[81];
-cx q[77],q[93];
-cx q[77],q[95];
-cx q[8],q[77];
-cx q[15],q[77];
-cx q[32],q[77];
-cx q[43],q[77];
-cx q[45],q[77];
-cx q[47],q[77];
-cx q[50],q[77];
-cx q[54],q[77];
-cx q[16],q[28];
-cx q[16],q[37];
-cx q[16],q[64];
-cx q[16],q[67];
-cx q[16],q[72];
-cx q[16],q[78];
-cx q[16],q[94];
-cx q[77],q[16];
-h q[16];
-cx q[16],q[77];
-cx q[6],q[5];
-cx q[5],q[77];
-cx q[77],q[6];
-cx q[17],q[14];
-cx q[14],q[77];
-cx q[77],q[17];
-cx q[75],q[52];
-cx q[52],q[77];
-cx q[77],q[75];
-h q[5];
-s q[5];
-h q[15];
-s q[17];
-s q[21];
-s q[22];
-h q[22];
-s q[28];
-s q[43];
-s q[45];
-h q[46];
-s q[46];
-h q[50];
-h q[54];
-h q[64];
-s q[67];
-s q[72];
-s q[75];
-s q[78];
-h q[78];
-s q[81];
-h q[81];
-s q[81];
-h q[87];
-s q[91];
-h q[91];
-h q[93];
-h q[95];
-h q[96];
-cx q[96],q[8];
-cx q[96],q[23];
-cx q[96],q[45];
-cx q[96],q[95];
-cx q[6],q[96];
-cx q[22],q[96];
-cx q[47],q[96];
-cx q[64],q[96];
-cx q[78],q[96];
-cx q[91],q[96];
-cx q[21],q[28];
-cx q[21],q[32];
-cx q[21],q[40];
-cx q[21],q[72];
-cx q[21],q[87];
-cx q[21],q[94];
-cx q[96],q[21];
-h q[21];
-cx q[21],q[96];
-cx q[15],q[5];
-cx q[5],q[96];
-cx q[96],q[15];
-cx q[43],q[17];
-cx q[17],q[96];
-cx q[96],q[43];
-cx q[50],q[46];
-cx q[46],q[96];
-cx q[96],q[50];
-cx q[67],q[54];
-cx q[54],q[96];
-cx q[96],q[67];
-cx q[75],q[73];
-cx q[73],q[96];
-cx q[96],q[75];
-cx q[93],q[81];
-cx q[81],q[96];
-cx q[96],q[93];
-h q[6];
-s q[16];
-h q[16];
-s q[21];
-s q[22];
-h q[28];
-s q[40];
-s q[43];
-h q[43];
-s q[45];
-s q[46];
-h q[47];
-h q[52];
-h q[54];
-s q[64];
-h q[64];
-s q[64];
-h q[72];
-h q[75];
-s q[87];
-h q[87];
-h q[91];
-s q[93];
-s q[94];
-s q[95];
-h q[95];
-cx q[52],q[28];
-cx q[52],q[47];
-cx q[52],q[50];
-cx q[52],q[54];
-cx q[52],q[72];
-cx q[52],q[91];
-cx q[52],q[93];
-cx q[52],q[94];
-cx q[6],q[52];
-cx q[14],q[52];
-cx q[16],q[52];
-cx q[23],q[52];
-cx q[43],q[52];
-cx q[75],q[52];
-cx q[78],q[52];
-cx q[95],q[52];
-cx q[21],q[22];
-cx q[21],q[46];
-cx q[21],q[73];
-cx q[52],q[21];
-h q[21];
-cx q[21],q[52];
-cx q[40],q[32];
-cx q[32],q[52];
-cx q[52],q[40];
-cx q[64],q[45];
-cx q[45],q[52];
-cx q[52],q[64];
-cx q[87],q[81];
-cx q[81],q[52];
-cx q[52],q[87];
-h q[5];
-h q[8];
-s q[14];
-s q[16];
-s q[17];
-h q[21];
-s q[28];
-h q[32];
-h q[37];
-h q[45];
-s q[46];
-h q[47];
-s q[50];
-h q[50];
-s q[50];
-s q[54];
-s q[64];
-h q[67];
-h q[72];
-s q[72];
-h q[73];
-s q[78];
-s q[81];
-h q[81];
-s q[81];
-s q[87];
-h q[87];
-h q[93];
-s q[94];
-h q[94];
-cx q[50],q[16];
-cx q[50],q[23];
-cx q[50],q[32];
-cx q[50],q[40];
-cx q[50],q[46];
-cx q[50],q[47];
-cx q[50],q[54];
-cx q[50],q[73];
-cx q[50],q[75];
-cx q[50],q[93];
-cx q[8],q[50];
-cx q[22],q[50];
-cx q[37],q[50];
-cx q[43],q[50];
-cx q[67],q[50];
-cx q[87],q[50];
-cx q[94],q[50];
-cx q[21],q[28];
-cx q[21],q[45];
-cx q[21],q[64];
-cx q[21],q[78];
-cx q[50],q[21];
-h q[21];
-cx q[21],q[50];
-cx q[14],q[5];
-cx q[5],q[50];
-cx q[50],q[14];
-cx q[17],q[15];
-cx q[15],q[50];
-cx q[50],q[17];
-cx q[81],q[72];
-cx q[72],q[50];
-cx q[50],q[81];
-h q[5];
-s q[6];
-h q[6];
-s q[15];
-h q[15];
-h q[16];
-s q[21];
-h q[22];
-s q[22];
-h q[28];
-s q[32];
-h q[43];
-h q[45];
-s q[47];
-s q[54];
-s q[64];
-s q[67];
-h q[67];
-h q[72];
-s q[72];
-s q[73];
-h q[75];
-h q[78];
-h q[81];
-h q[87];
-h q[93];
-s q[94];
-h q[94];
-swap q[8],q[6];
-cx q[8],q[5];
-cx q[8],q[17];
-cx q[8],q[21];
-cx q[8],q[54];
-cx q[8],q[75];
-cx q[8],q[87];
-cx q[8],q[93];
-cx q[8],q[6];
-cx q[15],q[8];
-cx q[78],q[8];
-cx q[81],q[8];
-cx q[94],q[8];
-cx q[16],q[32];
-cx q[16],q[43];
-cx q[16],q[45];
-cx q[16],q[64];
-cx q[8],q[16];
-h q[16];
-cx q[16],q[8];
-cx q[28],q[22];
-cx q[22],q[8];
-cx q[8],q[28];
-cx q[47],q[46];
-cx q[46],q[8];
-cx q[8],q[47];
-cx q[72],q[67];
-cx q[67],q[8];
-cx q[8],q[72];
-cx q[91],q[73];
-cx q[73],q[8];
-cx q[8],q[91];
-h q[5];
-h q[6];
-h q[15];
-h q[17];
-s q[21];
-h q[32];
-h q[40];
-s q[45];
-h q[45];
-s q[45];
-h q[46];
-h q[47];
-h q[64];
-s q[64];
-s q[67];
-h q[72];
-s q[73];
-h q[73];
-h q[81];
-s q[93];
-h q[93];
-h q[94];
-h q[95];
-swap q[37],q[5];
-cx q[37],q[6];
-cx q[37],q[14];
-cx q[37],q[17];
-cx q[37],q[22];
-cx q[37],q[67];
-cx q[37],q[81];
-cx q[37],q[87];
-cx q[37],q[91];
-cx q[15],q[37];
-cx q[40],q[37];
-cx q[43],q[37];
-cx q[47],q[37];
-cx q[72],q[37];
-cx q[75],q[37];
-cx q[94],q[37];
-cx q[32],q[46];
-cx q[32],q[54];
-cx q[32],q[78];
-cx q[32],q[5];
-cx q[37],q[32];
-h q[32];
-cx q[32],q[37];
-cx q[45],q[21];
-cx q[21],q[37];
-cx q[37],q[45];
-cx q[73],q[64];
-cx q[64],q[37];
-cx q[37],q[73];
-cx q[95],q[93];
-cx q[93],q[37];
-cx q[37],q[95];
-h q[5];
-s q[6];
-h q[6];
-s q[14];
-h q[16];
-s q[16];
-s q[17];
-h q[17];
-s q[17];
-h q[21];
-s q[22];
-h q[22];
-s q[22];
-h q[32];
-s q[40];
-h q[40];
-s q[43];
-h q[43];
-s q[43];
-s q[45];
-s q[46];
-h q[46];
-s q[54];
-h q[64];
-s q[67];
-s q[73];
-h q[73];
-h q[87];
-h q[91];
-s q[91];
-s q[95];
-h q[95];
-swap q[5],q[14];
-cx q[5],q[15];
-cx q[5],q[21];
-cx q[5],q[32];
-cx q[5],q[45];
-cx q[5],q[54];
-cx q[5],q[64];
-cx q[5],q[67];
-cx q[5],q[75];
-cx q[5],q[81];
-cx q[6],q[5];
-cx q[23],q[5];
-cx q[40],q[5];
-cx q[73],q[5];
-cx q[95],q[5];
-cx q[14],q[5];
-cx q[72],q[87];
-cx q[5],q[72];
-h q[72];
-cx q[72],q[5];
-cx q[17],q[16];
-cx q[16],q[5];
-cx q[5],q[17];
-cx q[43],q[22];
-cx q[22],q[5];
-cx q[5],q[43];
-cx q[91],q[46];
-cx q[46],q[5];
-cx q[5],q[91];
-h q[6];
-s q[15];
-h q[15];
-h q[16];
-s q[22];
-h q[23];
-h q[40];
-s q[45];
-h q[45];
-s q[45];
-h q[47];
-s q[47];
-h q[64];
-h q[73];
-s q[73];
-h q[75];
-h q[78];
-h q[81];
-h q[87];
-h q[91];
-s q[91];
-h q[93];
-s q[94];
-swap q[54],q[6];
-cx q[54],q[22];
-cx q[54],q[23];
-cx q[54],q[28];
-cx q[54],q[32];
-cx q[54],q[94];
-cx q[15],q[54];
-cx q[43],q[54];
-cx q[72],q[54];
-cx q[78],q[54];
-cx q[81],q[54];
-cx q[87],q[54];
-cx q[93],q[54];
-cx q[14],q[16];
-cx q[14],q[40];
-cx q[14],q[64];
-cx q[14],q[6];
-cx q[54],q[14];
-h q[14];
-cx q[14],q[54];
-cx q[47],q[45];
-cx q[45],q[54];
-cx q[54],q[47];
-cx q[75],q[73];
-cx q[73],q[54];
-cx q[54],q[75];
-cx q[95],q[91];
-cx q[91],q[54];
-cx q[54],q[95];
-s q[14];
-h q[14];
-h q[15];
-s q[16];
-h q[16];
-s q[17];
-h q[17];
-s q[21];
-h q[21];
-h q[28];
-h q[40];
-h q[45];
-h q[46];
-h q[47];
-h q[67];
-h q[72];
-s q[81];
-s q[87];
-h q[87];
-s q[91];
-s q[93];
-swap q[23],q[6];
-cx q[23],q[15];
-cx q[23],q[32];
-cx q[23],q[40];
-cx q[23],q[43];
-cx q[23],q[46];
-cx q[21],q[23];
-cx q[45],q[23];
-cx q[67],q[23];
-cx q[72],q[23];
-cx q[28],q[47];
-cx q[28],q[64];
-cx q[28],q[81];
-cx q[28],q[91];
-cx q[28],q[93];
-cx q[23],q[28];
-h q[28];
-cx q[28],q[23];
-cx q[16],q[14];
-cx q[14],q[23];
-cx q[23],q[16];
-cx q[22],q[17];
-cx q[17],q[23];
-cx q[23],q[22];
-cx q[78],q[73];
-cx q[73],q[23];
-cx q[23],q[78];
-cx q[94],q[87];
-cx q[87],q[23];
-cx q[23],q[94];
-h q[6];
-s q[14];
-h q[14];
-s q[15];
-s q[17];
-h q[17];
-h q[21];
-s q[22];
-h q[22];
-s q[28];
-h q[28];
-s q[32];
-h q[40];
-h q[43];
-s q[43];
-s q[46];
-h q[46];
-s q[47];
-h q[47];
-s q[73];
-h q[73];
-s q[78];
-h q[81];
-s q[81];
-s q[87];
-s q[91];
-s q[93];
-h q[93];
-s q[94];
-swap q[15],q[6];
-cx q[15],q[21];
-cx q[15],q[32];
-cx q[15],q[40];
-cx q[15],q[78];
-cx q[15],q[94];
-cx q[15],q[95];
-cx q[15],q[6];
-cx q[22],q[15];
-cx q[28],q[15];
-cx q[46],q[15];
-cx q[47],q[15];
-cx q[67],q[15];
-cx q[75],q[15];
-cx q[93],q[15];
-cx q[72],q[91];
-cx q[15],q[72];
-h q[72];
-cx q[72],q[15];
-cx q[17],q[14];
-cx q[14],q[15];
-cx q[15],q[17];
-cx q[73],q[43];
-cx q[43],q[15];
-cx q[15],q[73];
-cx q[87],q[81];
-cx q[81],q[15];
-cx q[15],q[87];
-h q[14];
-s q[16];
-s q[17];
-h q[17];
-h q[21];
-h q[22];
-h q[28];
-s q[40];
-h q[40];
-s q[43];
-h q[43];
-s q[46];
-h q[46];
-s q[46];
-h q[64];
-s q[73];
-h q[73];
-s q[78];
-h q[78];
-s q[81];
-h q[81];
-s q[87];
-h q[87];
-h q[91];
-h q[93];
-s q[94];
-cx q[46],q[16];
-cx q[46],q[21];
-cx q[46],q[22];
-cx q[46],q[67];
-cx q[46],q[75];
-cx q[46],q[95];
-cx q[17],q[46];
-cx q[28],q[46];
-cx q[40],q[46];
-cx q[43],q[46];
-cx q[47],q[46];
-cx q[64],q[46];
-cx q[73],q[46];
-cx q[78],q[46];
-cx q[81],q[46];
-cx q[91],q[46];
-cx q[45],q[72];
-cx q[45],q[94];
-cx q[46],q[45];
-h q[45];
-cx q[45],q[46];
-cx q[14],q[6];
-cx q[6],q[46];
-cx q[46],q[14];
-cx q[93],q[87];
-cx q[87],q[46];
-cx q[46],q[93];
-h q[6];
-s q[6];
-h q[14];
-h q[17];
-s q[28];
-h q[28];
-s q[32];
-h q[32];
-s q[32];
-h q[40];
-s q[45];
-h q[45];
-s q[45];
-h q[64];
-h q[67];
-s q[67];
-h q[73];
-s q[75];
-h q[75];
-s q[78];
-s q[81];
-h q[93];
-s q[94];
-h q[94];
-h q[95];
-s q[95];
-cx q[67],q[78];
-cx q[67],q[87];
-cx q[67],q[93];
-cx q[14],q[67];
-cx q[17],q[67];
-cx q[21],q[67];
-cx q[22],q[67];
-cx q[64],q[67];
-cx q[73],q[67];
-cx q[94],q[67];
-cx q[16],q[40];
-cx q[16],q[81];
-cx q[67],q[16];
-h q[16];
-cx q[16],q[67];
-cx q[28],q[6];
-cx q[6],q[67];
-cx q[67],q[28];
-cx q[45],q[32];
-cx q[32],q[67];
-cx q[67],q[45];
-cx q[95],q[75];
-cx q[75],q[67];
-cx q[67],q[95];
-s q[6];
-s q[16];
-h q[21];
-s q[22];
-h q[22];
-s q[28];
-h q[28];
-s q[32];
-h q[43];
-s q[64];
-h q[64];
-s q[64];
-h q[73];
-h q[75];
-s q[75];
-s q[78];
-s q[81];
-h q[87];
-s q[93];
-h q[93];
-s q[95];
-h q[95];
-swap q[21],q[6];
-cx q[21],q[40];
-cx q[21],q[43];
-cx q[21],q[78];
-cx q[45],q[21];
-cx q[91],q[21];
-cx q[93],q[21];
-cx q[6],q[21];
-cx q[16],q[32];
-cx q[16],q[73];
-cx q[16],q[81];
-cx q[16],q[87];
-cx q[21],q[16];
-h q[16];
-cx q[16],q[21];
-cx q[22],q[14];
-cx q[14],q[21];
-cx q[21],q[22];
-cx q[64],q[28];
-cx q[28],q[21];
-cx q[21],q[64];
-cx q[95],q[75];
-cx q[75],q[21];
-cx q[21],q[95];
-s q[6];
-h q[6];
-s q[6];
-s q[16];
-s q[17];
-s q[22];
-h q[22];
-s q[22];
-h q[28];
-s q[32];
-h q[32];
-s q[32];
-h q[40];
-h q[64];
-s q[64];
-s q[78];
-h q[78];
-h q[91];
-s q[93];
-h q[93];
-h q[94];
-h q[95];
-swap q[75],q[6];
-cx q[75],q[17];
-cx q[75],q[28];
-cx q[75],q[73];
-cx q[75],q[91];
-cx q[78],q[75];
-cx q[93],q[75];
-cx q[95],q[75];
-cx q[14],q[16];
-cx q[14],q[40];
-cx q[14],q[6];
-cx q[75],q[14];
-h q[14];
-cx q[14],q[75];
-cx q[32],q[22];
-cx q[22],q[75];
-cx q[75],q[32];
-cx q[64],q[45];
-cx q[45],q[75];
-cx q[75],q[64];
-cx q[94],q[87];
-cx q[87],q[75];
-cx q[75],q[94];
-s q[6];
-s q[14];
-h q[14];
-s q[14];
-s q[16];
-h q[16];
-s q[17];
-h q[17];
-h q[28];
-h q[43];
-s q[45];
-h q[45];
-h q[47];
-s q[73];
-s q[78];
-h q[81];
-h q[93];
-s q[93];
-s q[95];
-swap q[91],q[6];
-cx q[91],q[40];
-cx q[91],q[47];
-cx q[28],q[91];
-cx q[72],q[91];
-cx q[32],q[64];
-cx q[32],q[73];
-cx q[32],q[81];
-cx q[32],q[94];
-cx q[91],q[32];
-h q[32];
-cx q[32],q[91];
-cx q[16],q[14];
-cx q[14],q[91];
-cx q[91],q[16];
-cx q[43],q[17];
-cx q[17],q[91];
-cx q[91],q[43];
-cx q[78],q[45];
-cx q[45],q[91];
-cx q[91],q[78];
-cx q[95],q[93];
-cx q[93],q[91];
-cx q[91],q[95];
-s q[6];
-h q[6];
-h q[14];
-s q[22];
-s q[28];
-s q[32];
-s q[40];
-h q[43];
-s q[45];
-h q[72];
-s q[94];
-h q[94];
-swap q[73],q[6];
-cx q[73],q[32];
-cx q[73],q[40];
-cx q[73],q[47];
-cx q[78],q[73];
-cx q[94],q[73];
-cx q[14],q[16];
-cx q[14],q[17];
-cx q[14],q[22];
-cx q[14],q[28];
-cx q[14],q[45];
-cx q[14],q[64];
-cx q[14],q[95];
-cx q[14],q[6];
-cx q[73],q[14];
-h q[14];
-cx q[14],q[73];
-cx q[72],q[43];
-cx q[43],q[73];
-cx q[73],q[72];
-cx q[93],q[81];
-cx q[81],q[73];
-cx q[73],q[93];
-h q[14];
-h q[16];
-s q[16];
-h q[22];
-h q[32];
-h q[40];
-s q[47];
-h q[64];
-s q[78];
-s q[81];
-h q[81];
-s q[81];
-s q[87];
-h q[87];
-s q[87];
-s q[93];
-h q[93];
-swap q[28],q[6];
-cx q[28],q[32];
-cx q[28],q[45];
-cx q[28],q[47];
-cx q[28],q[6];
-cx q[14],q[28];
-cx q[17],q[28];
-cx q[93],q[28];
-cx q[94],q[28];
-cx q[40],q[64];
-cx q[28],q[40];
-h q[40];
-cx q[40],q[28];
-cx q[22],q[16];
-cx q[16],q[28];
-cx q[28],q[22];
-cx q[81],q[78];
-cx q[78],q[28];
-cx q[28],q[81];
-cx q[95],q[87];
-cx q[87],q[28];
-cx q[28],q[95];
-s q[6];
-s q[14];
-h q[14];
-h q[16];
-s q[17];
-h q[43];
-h q[45];
-s q[64];
-h q[64];
-s q[72];
-h q[72];
-s q[72];
-s q[94];
-cx q[16],q[22];
-cx q[16],q[47];
-cx q[16],q[93];
-cx q[81],q[16];
-cx q[32],q[43];
-cx q[32],q[45];
-cx q[32],q[94];
-cx q[16],q[32];
-h q[32];
-cx q[32],q[16];
-cx q[14],q[6];
-cx q[6],q[16];
-cx q[16],q[14];
-cx q[64],q[17];
-cx q[17],q[16];
-cx q[16],q[64];
-cx q[95],q[72];
-cx q[72],q[16];
-cx q[16],q[95];
-h q[6];
-h q[14];
-s q[32];
-h q[40];
-s q[40];
-s q[47];
-h q[47];
-s q[47];
-h q[64];
-s q[72];
-h q[72];
-s q[78];
-s q[81];
-h q[81];
-s q[81];
-h q[94];
-s q[94];
-swap q[32],q[6];
-cx q[32],q[14];
-cx q[32],q[78];
-cx q[32],q[6];
-cx q[72],q[32];
-cx q[95],q[32];
-cx q[43],q[64];
-cx q[43],q[87];
-cx q[32],q[43];
-h q[43];
-cx q[43],q[32];
-cx q[40],q[22];
-cx q[22],q[32];
-cx q[32],q[40];
-cx q[81],q[47];
-cx q[47],q[32];
-cx q[32],q[81];
-cx q[94],q[93];
-cx q[93],q[32];
-cx q[32],q[94];
-s q[6];
-h q[6];
-s q[6];
-h q[14];
-s q[45];
-h q[45];
-s q[45];
-h q[47];
-h q[72];
-s q[72];
-h q[78];
-s q[81];
-h q[93];
-s q[95];
-cx q[22],q[78];
-cx q[22],q[81];
-cx q[40],q[43];
-cx q[40],q[47];
-cx q[40],q[95];
-cx q[22],q[40];
-h q[40];
-cx q[40],q[22];
-cx q[14],q[6];
-cx q[6],q[22];
-cx q[22],q[14];
-cx q[72],q[45];
-cx q[45],q[22];
-cx q[22],q[72];
-cx q[94],q[93];
-cx q[93],q[22];
-cx q[22],q[94];
-h q[6];
-s q[6];
-s q[14];
-s q[17];
-s q[40];
-s q[43];
-h q[45];
-h q[72];
-s q[78];
-h q[78];
-h q[81];
-h q[87];
-s q[93];
-h q[94];
-h q[95];
-cx q[6],q[43];
-cx q[6],q[45];
-cx q[6],q[47];
-cx q[6],q[94];
-cx q[72],q[6];
-cx q[78],q[6];
-cx q[81],q[6];
-cx q[95],q[6];
-cx q[17],q[40];
-cx q[17],q[64];
-cx q[17],q[87];
-cx q[6],q[17];
-h q[17];
-cx q[17],q[6];
-cx q[93],q[14];
-cx q[14],q[6];
-cx q[6],q[93];
-h q[17];
-h q[40];
-s q[64];
-s q[72];
-h q[72];
-s q[72];
-s q[78];
-h q[78];
-h q[81];
-s q[81];
-s q[87];
-s q[93];
-h q[93];
-s q[94];
-s q[95];
-h q[95];
-swap q[17],q[14];
-cx q[17],q[94];
-cx q[17],q[14];
-cx q[78],q[17];
-cx q[93],q[17];
-cx q[95],q[17];
-cx q[17],q[40];
-h q[40];
-cx q[40],q[17];
-cx q[72],q[64];
-cx q[64],q[17];
-cx q[17],q[72];
-cx q[87],q[81];
-cx q[81],q[17];
-cx q[17],q[87];
-h q[14];
-s q[14];
-s q[43];
-h q[45];
-h q[47];
-s q[78];
-h q[78];
-s q[78];
-s q[93];
-s q[94];
-h q[94];
-h q[95];
-swap q[72],q[14];
-cx q[72],q[45];
-cx q[72],q[93];
-cx q[40],q[72];
-cx q[47],q[72];
-cx q[94],q[72];
-cx q[14],q[72];
-cx q[43],q[87];
-cx q[43],q[95];
-cx q[72],q[43];
-h q[43];
-cx q[43],q[72];
-cx q[81],q[78];
-cx q[78],q[72];
-cx q[72],q[81];
-s q[14];
-h q[40];
-s q[40];
-s q[43];
-h q[43];
-s q[43];
-h q[47];
-h q[64];
-h q[78];
-h q[81];
-h q[87];
-s q[94];
-s q[95];
-cx q[40],q[87];
-cx q[40],q[95];
-cx q[64],q[78];
-cx q[64],q[81];
-cx q[40],q[64];
-h q[64];
-cx q[64],q[40];
-cx q[43],q[14];
-cx q[14],q[40];
-cx q[40],q[43];
-cx q[94],q[47];
-cx q[47],q[40];
-cx q[40],q[94];
-s q[14];
-s q[43];
-s q[78];
-h q[78];
-s q[87];
-h q[87];
-s q[87];
-h q[94];
-swap q[81],q[14];
-cx q[78],q[81];
-cx q[93],q[81];
-cx q[43],q[64];
-cx q[43],q[94];
-cx q[43],q[14];
-cx q[81],q[43];
-h q[43];
-cx q[43],q[81];
-cx q[87],q[47];
-cx q[47],q[81];
-cx q[81],q[87];
-h q[14];
-s q[14];
-s q[43];
-s q[87];
-h q[87];
-h q[93];
-s q[94];
-h q[95];
-cx q[87],q[93];
-cx q[87],q[94];
-cx q[45],q[95];
-cx q[87],q[45];
-h q[45];
-cx q[45],q[87];
-cx q[43],q[14];
-cx q[14],q[87];
-cx q[87],q[43];
-h q[14];
-s q[64];
-s q[78];
-h q[78];
-h q[94];
-h q[95];
-swap q[78],q[14];
-cx q[78],q[47];
-cx q[95],q[78];
-cx q[14],q[78];
-cx q[45],q[64];
-cx q[45],q[93];
-cx q[45],q[94];
-cx q[78],q[45];
-h q[45];
-cx q[45],q[78];
-h q[14];
-s q[14];
-s q[43];
-h q[45];
-s q[47];
-h q[47];
-h q[64];
-h q[94];
-swap q[45],q[14];
-cx q[45],q[95];
-cx q[64],q[45];
-cx q[94],q[14];
-cx q[45],q[94];
-h q[94];
-cx q[94],q[45];
-cx q[47],q[43];
-cx q[43],q[45];
-cx q[45],q[47];
-s q[14];
-s q[43];
-h q[47];
-h q[64];
-s q[64];
-h q[93];
-s q[94];
-h q[94];
-h q[95];
-cx q[93],q[14];
-cx q[94],q[14];
-cx q[95],q[14];
-cx q[14],q[43];
-h q[43];
-cx q[43],q[14];
-cx q[64],q[47];
-cx q[47],q[14];
-cx q[14],q[64];
-s q[43];
-s q[47];
-h q[47];
-s q[64];
-h q[64];
-h q[93];
-h q[94];
-swap q[95],q[43];
-cx q[95],q[43];
-cx q[47],q[95];
-cx q[94],q[95];
-cx q[93],q[64];
-cx q[64],q[95];
-cx q[95],q[93];
-s q[43];
-h q[43];
-h q[47];
-s q[47];
-s q[64];
-h q[64];
-h q[93];
-cx q[94],q[43];
-cx q[43],q[93];
-h q[93];
-cx q[93],q[43];
-cx q[64],q[47];
-cx q[47],q[43];
-cx q[43],q[64];
-h q[47];
-h q[64];
-s q[94];
-swap q[94],q[47];
-cx q[94],q[64];
-cx q[94],q[93];
-cx q[94],q[47];
-s q[47];
-h q[64];
-swap q[64],q[47];
-cx q[47],q[64];
-cx q[64],q[93];
-h q[93];
-cx q[93],q[64];
-h q[93];
-swap q[93],q[47];
-cx q[93],q[47];
-s q[47];
-h q[47];
-x q[1];
-y q[2];
-y q[3];
-y q[4];
-x q[5];
-z q[6];
-z q[7];
-z q[10];
-x q[11];
-y q[12];
-y q[13];
-y q[15];
-y q[16];
-z q[17];
-z q[18];
-y q[19];
-x q[21];
-z q[22];
-x q[24];
-x q[25];
-x q[27];
-z q[28];
-y q[30];
-y q[31];
-z q[32];
-y q[33];
-z q[36];
-x q[37];
-z q[38];
-y q[39];
-y q[41];
-x q[42];
-z q[43];
-x q[47];
-x q[48];
-z q[49];
-y q[50];
-z q[51];
-z q[52];
-z q[53];
-x q[54];
-x q[55];
-z q[60];
-x q[61];
-x q[62];
-x q[63];
-y q[64];
-y q[65];
-x q[66];
-y q[67];
-x q[68];
-z q[69];
-z q[70];
-x q[71];
-x q[72];
-x q[73];
-y q[74];
-z q[75];
-y q[76];
-x q[78];
-y q[79];
-x q[80];
-x q[82];
-y q[83];
-x q[84];
-x q[85];
-y q[87];
-z q[88];
-y q[89];
-y q[90];
-y q[91];
-x q[93];
-y q[94];
-y q[97];
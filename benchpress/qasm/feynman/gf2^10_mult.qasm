@@ -1,350 +0,0 @@
-OPENQASM 2.0;
-include "qelib1.inc";
-qreg qubits[30];
-h qubits[20];
-h qubits[21];
-h qubits[22];
-h qubits[23];
-h qubits[24];
-h qubits[25];
-h qubits[26];
-h qubits[27];
-h qubits[28];
-h qubits[20];
-ccx qubits[9],qubits[11],qubits[20];
-h qubits[20];
-h qubits[20];
-ccx qubits[8],qubits[12],qubits[20];
-h qubits[20];
-h qubits[20];
-ccx qubits[7],qubits[13],qubits[20];
-h qubits[20];
-h qubits[20];
-ccx qubits[6],qubits[14],qubits[20];
-h qubits[20];
-h qubits[20];
-ccx qubits[5],qubits[15],qubits[20];
-h qubits[20];
-h qubits[20];
-ccx qubits[4],qubits[16],qubits[20];
-h qubits[20];
-h qubits[20];
-ccx qubits[3],qubits[17],qubits[20];
-h qubits[20];
-h qubits[20];
-ccx qubits[2],qubits[18],qubits[20];
-h qubits[20];
-h qubits[20];
-ccx qubits[1],qubits[19],qubits[20];
-h qubits[20];
-h qubits[21];
-ccx qubits[9],qubits[12],qubits[21];
-h qubits[21];
-h qubits[21];
-ccx qubits[8],qubits[13],qubits[21];
-h qubits[21];
-h qubits[21];
-ccx qubits[7],qubits[14],qubits[21];
-h qubits[21];
-h qubits[21];
-ccx qubits[6],qubits[15],qubits[21];
-h qubits[21];
-h qubits[21];
-ccx qubits[5],qubits[16],qubits[21];
-h qubits[21];
-h qubits[21];
-ccx qubits[4],qubits[17],qubits[21];
-h qubits[21];
-h qubits[21];
-ccx qubits[3],qubits[18],qubits[21];
-h qubits[21];
-h qubits[21];
-ccx qubits[2],qubits[19],qubits[21];
-h qubits[21];
-h qubits[22];
-ccx qubits[9],qubits[13],qubits[22];
-h qubits[22];
-h qubits[22];
-ccx qubits[8],qubits[14],qubits[22];
-h qubits[22];
-h qubits[22];
-ccx qubits[7],qubits[15],qubits[22];
-h qubits[22];
-h qubits[22];
-ccx qubits[6],qubits[16],qubits[22];
-h qubits[22];
-h qubits[22];
-ccx qubits[5],qubits[17],qubits[22];
-h qubits[22];
-h qubits[22];
-ccx qubits[4],qubits[18],qubits[22];
-h qubits[22];
-h qubits[22];
-ccx qubits[3],qubits[19],qubits[22];
-h qubits[22];
-h qubits[23];
-ccx qubits[9],qubits[14],qubits[23];
-h qubits[23];
-h qubits[23];
-ccx qubits[8],qubits[15],qubits[23];
-h qubits[23];
-h qubits[23];
-ccx qubits[7],qubits[16],qubits[23];
-h qubits[23];
-h qubits[23];
-ccx qubits[6],qubits[17],qubits[23];
-h qubits[23];
-h qubits[23];
-ccx qubits[5],qubits[18],qubits[23];
-h qubits[23];
-h qubits[23];
-ccx qubits[4],qubits[19],qubits[23];
-h qubits[23];
-h qubits[24];
-ccx qubits[9],qubits[15],qubits[24];
-h qubits[24];
-h qubits[24];
-ccx qubits[8],qubits[16],qubits[24];
-h qubits[24];
-h qubits[24];
-ccx qubits[7],qubits[17],qubits[24];
-h qubits[24];
-h qubits[24];
-ccx qubits[6],qubits[18],qubits[24];
-h qubits[24];
-h qubits[24];
-ccx qubits[5],qubits[19],qubits[24];
-h qubits[24];
-h qubits[25];
-ccx qubits[9],qubits[16],qubits[25];
-h qubits[25];
-h qubits[25];
-ccx qubits[8],qubits[17],qubits[25];
-h qubits[25];
-h qubits[25];
-ccx qubits[7],qubits[18],qubits[25];
-h qubits[25];
-h qubits[25];
-ccx qubits[6],qubits[19],qubits[25];
-h qubits[25];
-h qubits[26];
-ccx qubits[9],qubits[17],qubits[26];
-h qubits[26];
-h qubits[26];
-ccx qubits[8],qubits[18],qubits[26];
-h qubits[26];
-h qubits[26];
-ccx qubits[7],qubits[19],qubits[26];
-h qubits[26];
-h qubits[27];
-ccx qubits[9],qubits[18],qubits[27];
-h qubits[27];
-h qubits[27];
-ccx qubits[8],qubits[19],qubits[27];
-h qubits[27];
-h qubits[28];
-ccx qubits[9],qubits[19],qubits[28];
-h qubits[28];
-h qubits[20];
-h qubits[21];
-h qubits[22];
-h qubits[23];
-h qubits[24];
-h qubits[25];
-h qubits[26];
-h qubits[27];
-h qubits[28];
-cx qubits[28],qubits[21];
-cx qubits[27],qubits[20];
-cx qubits[26],qubits[29];
-cx qubits[25],qubits[28];
-cx qubits[24],qubits[27];
-cx qubits[23],qubits[26];
-cx qubits[22],qubits[25];
-cx qubits[21],qubits[24];
-cx qubits[20],qubits[23];
-h qubits[20];
-h qubits[21];
-h qubits[22];
-h qubits[23];
-h qubits[24];
-h qubits[25];
-h qubits[26];
-h qubits[27];
-h qubits[28];
-h qubits[29];
-h qubits[29];
-ccx qubits[9],qubits[10],qubits[29];
-h qubits[29];
-h qubits[29];
-ccx qubits[8],qubits[11],qubits[29];
-h qubits[29];
-h qubits[29];
-ccx qubits[7],qubits[12],qubits[29];
-h qubits[29];
-h qubits[29];
-ccx qubits[6],qubits[13],qubits[29];
-h qubits[29];
-h qubits[29];
-ccx qubits[5],qubits[14],qubits[29];
-h qubits[29];
-h qubits[29];
-ccx qubits[4],qubits[15],qubits[29];
-h qubits[29];
-h qubits[29];
-ccx qubits[3],qubits[16],qubits[29];
-h qubits[29];
-h qubits[29];
-ccx qubits[2],qubits[17],qubits[29];
-h qubits[29];
-h qubits[29];
-ccx qubits[1],qubits[18],qubits[29];
-h qubits[29];
-h qubits[29];
-ccx qubits[0],qubits[19],qubits[29];
-h qubits[29];
-h qubits[28];
-ccx qubits[8],qubits[10],qubits[28];
-h qubits[28];
-h qubits[28];
-ccx qubits[7],qubits[11],qubits[28];
-h qubits[28];
-h qubits[28];
-ccx qubits[6],qubits[12],qubits[28];
-h qubits[28];
-h qubits[28];
-ccx qubits[5],qubits[13],qubits[28];
-h qubits[28];
-h qubits[28];
-ccx qubits[4],qubits[14],qubits[28];
-h qubits[28];
-h qubits[28];
-ccx qubits[3],qubits[15],qubits[28];
-h qubits[28];
-h qubits[28];
-ccx qubits[2],qubits[16],qubits[28];
-h qubits[28];
-h qubits[28];
-ccx qubits[1],qubits[17],qubits[28];
-h qubits[28];
-h qubits[28];
-ccx qubits[0],qubits[18],qubits[28];
-h qubits[28];
-h qubits[27];
-ccx qubits[7],qubits[10],qubits[27];
-h qubits[27];
-h qubits[27];
-ccx qubits[6],qubits[11],qubits[27];
-h qubits[27];
-h qubits[27];
-ccx qubits[5],qubits[12],qubits[27];
-h qubits[27];
-h qubits[27];
-ccx qubits[4],qubits[13],qubits[27];
-h qubits[27];
-h qubits[27];
-ccx qubits[3],qubits[14],qubits[27];
-h qubits[27];
-h qubits[27];
-ccx qubits[2],qubits[15],qubits[27];
-h qubits[27];
-h qubits[27];
-ccx qubits[1],qubits[16],qubits[27];
-h qubits[27];
-h qubits[27];
-ccx qubits[0],qubits[17],qubits[27];
-h qubits[27];
-h qubits[26];
-ccx qubits[6],qubits[10],qubits[26];
-h qubits[26];
-h qubits[26];
-ccx qubits[5],qubits[11],qubits[26];
-h qubits[26];
-h qubits[26];
-ccx qubits[4],qubits[12],qubits[26];
-h qubits[26];
-h qubits[26];
-ccx qubits[3],qubits[13],qubits[26];
-h qubits[26];
-h qubits[26];
-ccx qubits[2],qubits[14],qubits[26];
-h qubits[26];
-h qubits[26];
-ccx qubits[1],qubits[15],qubits[26];
-h qubits[26];
-h qubits[26];
-ccx qubits[0],qubits[16],qubits[26];
-h qubits[26];
-h qubits[25];
-ccx qubits[5],qubits[10],qubits[25];
-h qubits[25];
-h qubits[25];
-ccx qubits[4],qubits[11],qubits[25];
-h qubits[25];
-h qubits[25];
-ccx qubits[3],qubits[12],qubits[25];
-h qubits[25];
-h qubits[25];
-ccx qubits[2],qubits[13],qubits[25];
-h qubits[25];
-h qubits[25];
-ccx qubits[1],qubits[14],qubits[25];
-h qubits[25];
-h qubits[25];
-ccx qubits[0],qubits[15],qubits[25];
-h qubits[25];
-h qubits[24];
-ccx qubits[4],qubits[10],qubits[24];
-h qubits[24];
-h qubits[24];
-ccx qubits[3],qubits[11],qubits[24];
-h qubits[24];
-h qubits[24];
-ccx qubits[2],qubits[12],qubits[24];
-h qubits[24];
-h qubits[24];
-ccx qubits[1],qubits[13],qubits[24];
-h qubits[24];
-h qubits[24];
-ccx qubits[0],qubits[14],qubits[24];
-h qubits[24];
-h qubits[23];
-ccx qubits[3],qubits[10],qubits[23];
-h qubits[23];
-h qubits[23];
-ccx qubits[2],qubits[11],qubits[23];
-h qubits[23];
-h qubits[23];
-ccx qubits[1],qubits[12],qubits[23];
-h qubits[23];
-h qubits[23];
-ccx qubits[0],qubits[13],qubits[23];
-h qubits[23];
-h qubits[22];
-ccx qubits[2],qubits[10],qubits[22];
-h qubits[22];
-h qubits[22];
-ccx qubits[1],qubits[11],qubits[22];
-h qubits[22];
-h qubits[22];
-ccx qubits[0],qubits[12],qubits[22];
-h qubits[22];
-h qubits[21];
-ccx qubits[1],qubits[10],qubits[21];
-h qubits[21];
-h qubits[21];
-ccx qubits[0],qubits[11],qubits[21];
-h qubits[21];
-h qubits[20];
-ccx qubits[0],qubits[10],qubits[20];
-h qubits[20];
-h qubits[20];
-h qubits[21];
-h qubits[22];
-h qubits[23];
-h qubits[24];
-h qubits[25];
-h qubits[26];
-h qubits[27];
-h qubits[28];
-h qubits[29];
@@ -1,878 +0,0 @@
-OPENQASM 2.0;
-include "qelib1.inc";
-qreg qubits[48];
-h qubits[32];
-h qubits[33];
-h qubits[34];
-h qubits[35];
-h qubits[36];
-h qubits[37];
-h qubits[38];
-h qubits[39];
-h qubits[40];
-h qubits[41];
-h qubits[42];
-h qubits[43];
-h qubits[44];
-h qubits[45];
-h qubits[46];
-h qubits[32];
-ccx qubits[15],qubits[17],qubits[32];
-h qubits[32];
-h qubits[32];
-ccx qubits[14],qubits[18],qubits[32];
-h qubits[32];
-h qubits[32];
-ccx qubits[13],qubits[19],qubits[32];
-h qubits[32];
-h qubits[32];
-ccx qubits[12],qubits[20],qubits[32];
-h qubits[32];
-h qubits[32];
-ccx qubits[11],qubits[21],qubits[32];
-h qubits[32];
-h qubits[32];
-ccx qubits[10],qubits[22],qubits[32];
-h qubits[32];
-h qubits[32];
-ccx qubits[9],qubits[23],qubits[32];
-h qubits[32];
-h qubits[32];
-ccx qubits[8],qubits[24],qubits[32];
-h qubits[32];
-h qubits[32];
-ccx qubits[7],qubits[25],qubits[32];
-h qubits[32];
-h qubits[32];
-ccx qubits[6],qubits[26],qubits[32];
-h qubits[32];
-h qubits[32];
-ccx qubits[5],qubits[27],qubits[32];
-h qubits[32];
-h qubits[32];
-ccx qubits[4],qubits[28],qubits[32];
-h qubits[32];
-h qubits[32];
-ccx qubits[3],qubits[29],qubits[32];
-h qubits[32];
-h qubits[32];
-ccx qubits[2],qubits[30],qubits[32];
-h qubits[32];
-h qubits[32];
-ccx qubits[1],qubits[31],qubits[32];
-h qubits[32];
-h qubits[33];
-ccx qubits[15],qubits[18],qubits[33];
-h qubits[33];
-h qubits[33];
-ccx qubits[14],qubits[19],qubits[33];
-h qubits[33];
-h qubits[33];
-ccx qubits[13],qubits[20],qubits[33];
-h qubits[33];
-h qubits[33];
-ccx qubits[12],qubits[21],qubits[33];
-h qubits[33];
-h qubits[33];
-ccx qubits[11],qubits[22],qubits[33];
-h qubits[33];
-h qubits[33];
-ccx qubits[10],qubits[23],qubits[33];
-h qubits[33];
-h qubits[33];
-ccx qubits[9],qubits[24],qubits[33];
-h qubits[33];
-h qubits[33];
-ccx qubits[8],qubits[25],qubits[33];
-h qubits[33];
-h qubits[33];
-ccx qubits[7],qubits[26],qubits[33];
-h qubits[33];
-h qubits[33];
-ccx qubits[6],qubits[27],qubits[33];
-h qubits[33];
-h qubits[33];
-ccx qubits[5],qubits[28],qubits[33];
-h qubits[33];
-h qubits[33];
-ccx qubits[4],qubits[29],qubits[33];
-h qubits[33];
-h qubits[33];
-ccx qubits[3],qubits[30],qubits[33];
-h qubits[33];
-h qubits[33];
-ccx qubits[2],qubits[31],qubits[33];
-h qubits[33];
-h qubits[34];
-ccx qubits[15],qubits[19],qubits[34];
-h qubits[34];
-h qubits[34];
-ccx qubits[14],qubits[20],qubits[34];
-h qubits[34];
-h qubits[34];
-ccx qubits[13],qubits[21],qubits[34];
-h qubits[34];
-h qubits[34];
-ccx qubits[12],qubits[22],qubits[34];
-h qubits[34];
-h qubits[34];
-ccx qubits[11],qubits[23],qubits[34];
-h qubits[34];
-h qubits[34];
-ccx qubits[10],qubits[24],qubits[34];
-h qubits[34];
-h qubits[34];
-ccx qubits[9],qubits[25],qubits[34];
-h qubits[34];
-h qubits[34];
-ccx qubits[8],qubits[26],qubits[34];
-h qubits[34];
-h qubits[34];
-ccx qubits[7],qubits[27],qubits[34];
-h qubits[34];
-h qubits[34];
-ccx qubits[6],qubits[28],qubits[34];
-h qubits[34];
-h qubits[34];
-ccx qubits[5],qubits[29],qubits[34];
-h qubits[34];
-h qubits[34];
-ccx qubits[4],qubits[30],qubits[34];
-h qubits[34];
-h qubits[34];
-ccx qubits[3],qubits[31],qubits[34];
-h qubits[34];
-h qubits[35];
-ccx qubits[15],qubits[20],qubits[35];
-h qubits[35];
-h qubits[35];
-ccx qubits[14],qubits[21],qubits[35];
-h qubits[35];
-h qubits[35];
-ccx qubits[13],qubits[22],qubits[35];
-h qubits[35];
-h qubits[35];
-ccx qubits[12],qubits[23],qubits[35];
-h qubits[35];
-h qubits[35];
-ccx qubits[11],qubits[24],qubits[35];
-h qubits[35];
-h qubits[35];
-ccx qubits[10],qubits[25],qubits[35];
-h qubits[35];
-h qubits[35];
-ccx qubits[9],qubits[26],qubits[35];
-h qubits[35];
-h qubits[35];
-ccx qubits[8],qubits[27],qubits[35];
-h qubits[35];
-h qubits[35];
-ccx qubits[7],qubits[28],qubits[35];
-h qubits[35];
-h qubits[35];
-ccx qubits[6],qubits[29],qubits[35];
-h qubits[35];
-h qubits[35];
-ccx qubits[5],qubits[30],qubits[35];
-h qubits[35];
-h qubits[35];
-ccx qubits[4],qubits[31],qubits[35];
-h qubits[35];
-h qubits[36];
-ccx qubits[15],qubits[21],qubits[36];
-h qubits[36];
-h qubits[36];
-ccx qubits[14],qubits[22],qubits[36];
-h qubits[36];
-h qubits[36];
-ccx qubits[13],qubits[23],qubits[36];
-h qubits[36];
-h qubits[36];
-ccx qubits[12],qubits[24],qubits[36];
-h qubits[36];
-h qubits[36];
-ccx qubits[11],qubits[25],qubits[36];
-h qubits[36];
-h qubits[36];
-ccx qubits[10],qubits[26],qubits[36];
-h qubits[36];
-h qubits[36];
-ccx qubits[9],qubits[27],qubits[36];
-h qubits[36];
-h qubits[36];
-ccx qubits[8],qubits[28],qubits[36];
-h qubits[36];
-h qubits[36];
-ccx qubits[7],qubits[29],qubits[36];
-h qubits[36];
-h qubits[36];
-ccx qubits[6],qubits[30],qubits[36];
-h qubits[36];
-h qubits[36];
-ccx qubits[5],qubits[31],qubits[36];
-h qubits[36];
-h qubits[37];
-ccx qubits[15],qubits[22],qubits[37];
-h qubits[37];
-h qubits[37];
-ccx qubits[14],qubits[23],qubits[37];
-h qubits[37];
-h qubits[37];
-ccx qubits[13],qubits[24],qubits[37];
-h qubits[37];
-h qubits[37];
-ccx qubits[12],qubits[25],qubits[37];
-h qubits[37];
-h qubits[37];
-ccx qubits[11],qubits[26],qubits[37];
-h qubits[37];
-h qubits[37];
-ccx qubits[10],qubits[27],qubits[37];
-h qubits[37];
-h qubits[37];
-ccx qubits[9],qubits[28],qubits[37];
-h qubits[37];
-h qubits[37];
-ccx qubits[8],qubits[29],qubits[37];
-h qubits[37];
-h qubits[37];
-ccx qubits[7],qubits[30],qubits[37];
-h qubits[37];
-h qubits[37];
-ccx qubits[6],qubits[31],qubits[37];
-h qubits[37];
-h qubits[38];
-ccx qubits[15],qubits[23],qubits[38];
-h qubits[38];
-h qubits[38];
-ccx qubits[14],qubits[24],qubits[38];
-h qubits[38];
-h qubits[38];
-ccx qubits[13],qubits[25],qubits[38];
-h qubits[38];
-h qubits[38];
-ccx qubits[12],qubits[26],qubits[38];
-h qubits[38];
-h qubits[38];
-ccx qubits[11],qubits[27],qubits[38];
-h qubits[38];
-h qubits[38];
-ccx qubits[10],qubits[28],qubits[38];
-h qubits[38];
-h qubits[38];
-ccx qubits[9],qubits[29],qubits[38];
-h qubits[38];
-h qubits[38];
-ccx qubits[8],qubits[30],qubits[38];
-h qubits[38];
-h qubits[38];
-ccx qubits[7],qubits[31],qubits[38];
-h qubits[38];
-h qubits[39];
-ccx qubits[15],qubits[24],qubits[39];
-h qubits[39];
-h qubits[39];
-ccx qubits[14],qubits[25],qubits[39];
-h qubits[39];
-h qubits[39];
-ccx qubits[13],qubits[26],qubits[39];
-h qubits[39];
-h qubits[39];
-ccx qubits[12],qubits[27],qubits[39];
-h qubits[39];
-h qubits[39];
-ccx qubits[11],qubits[28],qubits[39];
-h qubits[39];
-h qubits[39];
-ccx qubits[10],qubits[29],qubits[39];
-h qubits[39];
-h qubits[39];
-ccx qubits[9],qubits[30],qubits[39];
-h qubits[39];
-h qubits[39];
-ccx qubits[8],qubits[31],qubits[39];
-h qubits[39];
-h qubits[40];
-ccx qubits[15],qubits[25],qubits[40];
-h qubits[40];
-h qubits[40];
-ccx qubits[14],qubits[26],qubits[40];
-h qubits[40];
-h qubits[40];
-ccx qubits[13],qubits[27],qubits[40];
-h qubits[40];
-h qubits[40];
-ccx qubits[12],qubits[28],qubits[40];
-h qubits[40];
-h qubits[40];
-ccx qubits[11],qubits[29],qubits[40];
-h qubits[40];
-h qubits[40];
-ccx qubits[10],qubits[30],qubits[40];
-h qubits[40];
-h qubits[40];
-ccx qubits[9],qubits[31],qubits[40];
-h qubits[40];
-h qubits[41];
-ccx qubits[15],qubits[26],qubits[41];
-h qubits[41];
-h qubits[41];
-ccx qubits[14],qubits[27],qubits[41];
-h qubits[41];
-h qubits[41];
-ccx qubits[13],qubits[28],qubits[41];
-h qubits[41];
-h qubits[41];
-ccx qubits[12],qubits[29],qubits[41];
-h qubits[41];
-h qubits[41];
-ccx qubits[11],qubits[30],qubits[41];
-h qubits[41];
-h qubits[41];
-ccx qubits[10],qubits[31],qubits[41];
-h qubits[41];
-h qubits[42];
-ccx qubits[15],qubits[27],qubits[42];
-h qubits[42];
-h qubits[42];
-ccx qubits[14],qubits[28],qubits[42];
-h qubits[42];
-h qubits[42];
-ccx qubits[13],qubits[29],qubits[42];
-h qubits[42];
-h qubits[42];
-ccx qubits[12],qubits[30],qubits[42];
-h qubits[42];
-h qubits[42];
-ccx qubits[11],qubits[31],qubits[42];
-h qubits[42];
-h qubits[43];
-ccx qubits[15],qubits[28],qubits[43];
-h qubits[43];
-h qubits[43];
-ccx qubits[14],qubits[29],qubits[43];
-h qubits[43];
-h qubits[43];
-ccx qubits[13],qubits[30],qubits[43];
-h qubits[43];
-h qubits[43];
-ccx qubits[12],qubits[31],qubits[43];
-h qubits[43];
-h qubits[44];
-ccx qubits[15],qubits[29],qubits[44];
-h qubits[44];
-h qubits[44];
-ccx qubits[14],qubits[30],qubits[44];
-h qubits[44];
-h qubits[44];
-ccx qubits[13],qubits[31],qubits[44];
-h qubits[44];
-h qubits[45];
-ccx qubits[15],qubits[30],qubits[45];
-h qubits[45];
-h qubits[45];
-ccx qubits[14],qubits[31],qubits[45];
-h qubits[45];
-h qubits[46];
-ccx qubits[15],qubits[31],qubits[46];
-h qubits[46];
-h qubits[32];
-h qubits[33];
-h qubits[34];
-h qubits[35];
-h qubits[36];
-h qubits[37];
-h qubits[38];
-h qubits[39];
-h qubits[40];
-h qubits[41];
-h qubits[42];
-h qubits[43];
-h qubits[44];
-h qubits[45];
-h qubits[46];
-cx qubits[46],qubits[35];
-cx qubits[46],qubits[33];
-cx qubits[46],qubits[32];
-cx qubits[45],qubits[34];
-cx qubits[45],qubits[32];
-cx qubits[45],qubits[47];
-cx qubits[44],qubits[33];
-cx qubits[44],qubits[47];
-cx qubits[44],qubits[46];
-cx qubits[43],qubits[32];
-cx qubits[43],qubits[46];
-cx qubits[43],qubits[45];
-cx qubits[42],qubits[47];
-cx qubits[42],qubits[45];
-cx qubits[42],qubits[44];
-cx qubits[41],qubits[46];
-cx qubits[41],qubits[44];
-cx qubits[41],qubits[43];
-cx qubits[40],qubits[45];
-cx qubits[40],qubits[43];
-cx qubits[40],qubits[42];
-cx qubits[39],qubits[44];
-cx qubits[39],qubits[42];
-cx qubits[39],qubits[41];
-cx qubits[38],qubits[43];
-cx qubits[38],qubits[41];
-cx qubits[38],qubits[40];
-cx qubits[37],qubits[42];
-cx qubits[37],qubits[40];
-cx qubits[37],qubits[39];
-cx qubits[36],qubits[41];
-cx qubits[36],qubits[39];
-cx qubits[36],qubits[38];
-cx qubits[35],qubits[40];
-cx qubits[35],qubits[38];
-cx qubits[35],qubits[37];
-cx qubits[34],qubits[39];
-cx qubits[34],qubits[37];
-cx qubits[34],qubits[36];
-cx qubits[33],qubits[38];
-cx qubits[33],qubits[36];
-cx qubits[33],qubits[35];
-cx qubits[32],qubits[37];
-cx qubits[32],qubits[35];
-cx qubits[32],qubits[34];
-h qubits[32];
-h qubits[33];
-h qubits[34];
-h qubits[35];
-h qubits[36];
-h qubits[37];
-h qubits[38];
-h qubits[39];
-h qubits[40];
-h qubits[41];
-h qubits[42];
-h qubits[43];
-h qubits[44];
-h qubits[45];
-h qubits[46];
-h qubits[47];
-h qubits[47];
-ccx qubits[15],qubits[16],qubits[47];
-h qubits[47];
-h qubits[47];
-ccx qubits[14],qubits[17],qubits[47];
-h qubits[47];
-h qubits[47];
-ccx qubits[13],qubits[18],qubits[47];
-h qubits[47];
-h qubits[47];
-ccx qubits[12],qubits[19],qubits[47];
-h qubits[47];
-h qubits[47];
-ccx qubits[11],qubits[20],qubits[47];
-h qubits[47];
-h qubits[47];
-ccx qubits[10],qubits[21],qubits[47];
-h qubits[47];
-h qubits[47];
-ccx qubits[9],qubits[22],qubits[47];
-h qubits[47];
-h qubits[47];
-ccx qubits[8],qubits[23],qubits[47];
-h qubits[47];
-h qubits[47];
-ccx qubits[7],qubits[24],qubits[47];
-h qubits[47];
-h qubits[47];
-ccx qubits[6],qubits[25],qubits[47];
-h qubits[47];
-h qubits[47];
-ccx qubits[5],qubits[26],qubits[47];
-h qubits[47];
-h qubits[47];
-ccx qubits[4],qubits[27],qubits[47];
-h qubits[47];
-h qubits[47];
-ccx qubits[3],qubits[28],qubits[47];
-h qubits[47];
-h qubits[47];
-ccx qubits[2],qubits[29],qubits[47];
-h qubits[47];
-h qubits[47];
-ccx qubits[1],qubits[30],qubits[47];
-h qubits[47];
-h qubits[47];
-ccx qubits[0],qubits[31],qubits[47];
-h qubits[47];
-h qubits[46];
-ccx qubits[14],qubits[16],qubits[46];
-h qubits[46];
-h qubits[46];
-ccx qubits[13],qubits[17],qubits[46];
-h qubits[46];
-h qubits[46];
-ccx qubits[12],qubits[18],qubits[46];
-h qubits[46];
-h qubits[46];
-ccx qubits[11],qubits[19],qubits[46];
-h qubits[46];
-h qubits[46];
-ccx qubits[10],qubits[20],qubits[46];
-h qubits[46];
-h qubits[46];
-ccx qubits[9],qubits[21],qubits[46];
-h qubits[46];
-h qubits[46];
-ccx qubits[8],qubits[22],qubits[46];
-h qubits[46];
-h qubits[46];
-ccx qubits[7],qubits[23],qubits[46];
-h qubits[46];
-h qubits[46];
-ccx qubits[6],qubits[24],qubits[46];
-h qubits[46];
-h qubits[46];
-ccx qubits[5],qubits[25],qubits[46];
-h qubits[46];
-h qubits[46];
-ccx qubits[4],qubits[26],qubits[46];
-h qubits[46];
-h qubits[46];
-ccx qubits[3],qubits[27],qubits[46];
-h qubits[46];
-h qubits[46];
-ccx qubits[2],qubits[28],qubits[46];
-h qubits[46];
-h qubits[46];
-ccx qubits[1],qubits[29],qubits[46];
-h qubits[46];
-h qubits[46];
-ccx qubits[0],qubits[30],qubits[46];
-h qubits[46];
-h qubits[45];
-ccx qubits[13],qubits[16],qubits[45];
-h qubits[45];
-h qubits[45];
-ccx qubits[12],qubits[17],qubits[45];
-h qubits[45];
-h qubits[45];
-ccx qubits[11],qubits[18],qubits[45];
-h qubits[45];
-h qubits[45];
-ccx qubits[10],qubits[19],qubits[45];
-h qubits[45];
-h qubits[45];
-ccx qubits[9],qubits[20],qubits[45];
-h qubits[45];
-h qubits[45];
-ccx qubits[8],qubits[21],qubits[45];
-h qubits[45];
-h qubits[45];
-ccx qubits[7],qubits[22],qubits[45];
-h qubits[45];
-h qubits[45];
-ccx qubits[6],qubits[23],qubits[45];
-h qubits[45];
-h qubits[45];
-ccx qubits[5],qubits[24],qubits[45];
-h qubits[45];
-h qubits[45];
-ccx qubits[4],qubits[25],qubits[45];
-h qubits[45];
-h qubits[45];
-ccx qubits[3],qubits[26],qubits[45];
-h qubits[45];
-h qubits[45];
-ccx qubits[2],qubits[27],qubits[45];
-h qubits[45];
-h qubits[45];
-ccx qubits[1],qubits[28],qubits[45];
-h qubits[45];
-h qubits[45];
-ccx qubits[0],qubits[29],qubits[45];
-h qubits[45];
-h qubits[44];
-ccx qubits[12],qubits[16],qubits[44];
-h qubits[44];
-h qubits[44];
-ccx qubits[11],qubits[17],qubits[44];
-h qubits[44];
-h qubits[44];
-ccx qubits[10],qubits[18],qubits[44];
-h qubits[44];
-h qubits[44];
-ccx qubits[9],qubits[19],qubits[44];
-h qubits[44];
-h qubits[44];
-ccx qubits[8],qubits[20],qubits[44];
-h qubits[44];
-h qubits[44];
-ccx qubits[7],qubits[21],qubits[44];
-h qubits[44];
-h qubits[44];
-ccx qubits[6],qubits[22],qubits[44];
-h qubits[44];
-h qubits[44];
-ccx qubits[5],qubits[23],qubits[44];
-h qubits[44];
-h qubits[44];
-ccx qubits[4],qubits[24],qubits[44];
-h qubits[44];
-h qubits[44];
-ccx qubits[3],qubits[25],qubits[44];
-h qubits[44];
-h qubits[44];
-ccx qubits[2],qubits[26],qubits[44];
-h qubits[44];
-h qubits[44];
-ccx qubits[1],qubits[27],qubits[44];
-h qubits[44];
-h qubits[44];
-ccx qubits[0],qubits[28],qubits[44];
-h qubits[44];
-h qubits[43];
-ccx qubits[11],qubits[16],qubits[43];
-h qubits[43];
-h qubits[43];
-ccx qubits[10],qubits[17],qubits[43];
-h qubits[43];
-h qubits[43];
-ccx qubits[9],qubits[18],qubits[43];
-h qubits[43];
-h qubits[43];
-ccx qubits[8],qubits[19],qubits[43];
-h qubits[43];
-h qubits[43];
-ccx qubits[7],qubits[20],qubits[43];
-h qubits[43];
-h qubits[43];
-ccx qubits[6],qubits[21],qubits[43];
-h qubits[43];
-h qubits[43];
-ccx qubits[5],qubits[22],qubits[43];
-h qubits[43];
-h qubits[43];
-ccx qubits[4],qubits[23],qubits[43];
-h qubits[43];
-h qubits[43];
-ccx qubits[3],qubits[24],qubits[43];
-h qubits[43];
-h qubits[43];
-ccx qubits[2],qubits[25],qubits[43];
-h qubits[43];
-h qubits[43];
-ccx qubits[1],qubits[26],qubits[43];
-h qubits[43];
-h qubits[43];
-ccx qubits[0],qubits[27],qubits[43];
-h qubits[43];
-h qubits[42];
-ccx qubits[10],qubits[16],qubits[42];
-h qubits[42];
-h qubits[42];
-ccx qubits[9],qubits[17],qubits[42];
-h qubits[42];
-h qubits[42];
-ccx qubits[8],qubits[18],qubits[42];
-h qubits[42];
-h qubits[42];
-ccx qubits[7],qubits[19],qubits[42];
-h qubits[42];
-h qubits[42];
-ccx qubits[6],qubits[20],qubits[42];
-h qubits[42];
-h qubits[42];
-ccx qubits[5],qubits[21],qubits[42];
-h qubits[42];
-h qubits[42];
-ccx qubits[4],qubits[22],qubits[42];
-h qubits[42];
-h qubits[42];
-ccx qubits[3],qubits[23],qubits[42];
-h qubits[42];
-h qubits[42];
-ccx qubits[2],qubits[24],qubits[42];
-h qubits[42];
-h qubits[42];
-ccx qubits[1],qubits[25],qubits[42];
-h qubits[42];
-h qubits[42];
-ccx qubits[0],qubits[26],qubits[42];
-h qubits[42];
-h qubits[41];
-ccx qubits[9],qubits[16],qubits[41];
-h qubits[41];
-h qubits[41];
-ccx qubits[8],qubits[17],qubits[41];
-h qubits[41];
-h qubits[41];
-ccx qubits[7],qubits[18],qubits[41];
-h qubits[41];
-h qubits[41];
-ccx qubits[6],qubits[19],qubits[41];
-h qubits[41];
-h qubits[41];
-ccx qubits[5],qubits[20],qubits[41];
-h qubits[41];
-h qubits[41];
-ccx qubits[4],qubits[21],qubits[41];
-h qubits[41];
-h qubits[41];
-ccx qubits[3],qubits[22],qubits[41];
-h qubits[41];
-h qubits[41];
-ccx qubits[2],qubits[23],qubits[41];
-h qubits[41];
-h qubits[41];
-ccx qubits[1],qubits[24],qubits[41];
-h qubits[41];
-h qubits[41];
-ccx qubits[0],qubits[25],qubits[41];
-h qubits[41];
-h qubits[40];
-ccx qubits[8],qubits[16],qubits[40];
-h qubits[40];
-h qubits[40];
-ccx qubits[7],qubits[17],qubits[40];
-h qubits[40];
-h qubits[40];
-ccx qubits[6],qubits[18],qubits[40];
-h qubits[40];
-h qubits[40];
-ccx qubits[5],qubits[19],qubits[40];
-h qubits[40];
-h qubits[40];
-ccx qubits[4],qubits[20],qubits[40];
-h qubits[40];
-h qubits[40];
-ccx qubits[3],qubits[21],qubits[40];
-h qubits[40];
-h qubits[40];
-ccx qubits[2],qubits[22],qubits[40];
-h qubits[40];
-h qubits[40];
-ccx qubits[1],qubits[23],qubits[40];
-h qubits[40];
-h qubits[40];
-ccx qubits[0],qubits[24],qubits[40];
-h qubits[40];
-h qubits[39];
-ccx qubits[7],qubits[16],qubits[39];
-h qubits[39];
-h qubits[39];
-ccx qubits[6],qubits[17],qubits[39];
-h qubits[39];
-h qubits[39];
-ccx qubits[5],qubits[18],qubits[39];
-h qubits[39];
-h qubits[39];
-ccx qubits[4],qubits[19],qubits[39];
-h qubits[39];
-h qubits[39];
-ccx qubits[3],qubits[20],qubits[39];
-h qubits[39];
-h qubits[39];
-ccx qubits[2],qubits[21],qubits[39];
-h qubits[39];
-h qubits[39];
-ccx qubits[1],qubits[22],qubits[39];
-h qubits[39];
-h qubits[39];
-ccx qubits[0],qubits[23],qubits[39];
-h qubits[39];
-h qubits[38];
-ccx qubits[6],qubits[16],qubits[38];
-h qubits[38];
-h qubits[38];
-ccx qubits[5],qubits[17],qubits[38];
-h qubits[38];
-h qubits[38];
-ccx qubits[4],qubits[18],qubits[38];
-h qubits[38];
-h qubits[38];
-ccx qubits[3],qubits[19],qubits[38];
-h qubits[38];
-h qubits[38];
-ccx qubits[2],qubits[20],qubits[38];
-h qubits[38];
-h qubits[38];
-ccx qubits[1],qubits[21],qubits[38];
-h qubits[38];
-h qubits[38];
-ccx qubits[0],qubits[22],qubits[38];
-h qubits[38];
-h qubits[37];
-ccx qubits[5],qubits[16],qubits[37];
-h qubits[37];
-h qubits[37];
-ccx qubits[4],qubits[17],qubits[37];
-h qubits[37];
-h qubits[37];
-ccx qubits[3],qubits[18],qubits[37];
-h qubits[37];
-h qubits[37];
-ccx qubits[2],qubits[19],qubits[37];
-h qubits[37];
-h qubits[37];
-ccx qubits[1],qubits[20],qubits[37];
-h qubits[37];
-h qubits[37];
-ccx qubits[0],qubits[21],qubits[37];
-h qubits[37];
-h qubits[36];
-ccx qubits[4],qubits[16],qubits[36];
-h qubits[36];
-h qubits[36];
-ccx qubits[3],qubits[17],qubits[36];
-h qubits[36];
-h qubits[36];
-ccx qubits[2],qubits[18],qubits[36];
-h qubits[36];
-h qubits[36];
-ccx qubits[1],qubits[19],qubits[36];
-h qubits[36];
-h qubits[36];
-ccx qubits[0],qubits[20],qubits[36];
-h qubits[36];
-h qubits[35];
-ccx qubits[3],qubits[16],qubits[35];
-h qubits[35];
-h qubits[35];
-ccx qubits[2],qubits[17],qubits[35];
-h qubits[35];
-h qubits[35];
-ccx qubits[1],qubits[18],qubits[35];
-h qubits[35];
-h qubits[35];
-ccx qubits[0],qubits[19],qubits[35];
-h qubits[35];
-h qubits[34];
-ccx qubits[2],qubits[16],qubits[34];
-h qubits[34];
-h qubits[34];
-ccx qubits[1],qubits[17],qubits[34];
-h qubits[34];
-h qubits[34];
-ccx qubits[0],qubits[18],qubits[34];
-h qubits[34];
-h qubits[33];
-ccx qubits[1],qubits[16],qubits[33];
-h qubits[33];
-h qubits[33];
-ccx qubits[0],qubits[17],qubits[33];
-h qubits[33];
-h qubits[32];
-ccx qubits[0],qubits[16],qubits[32];
-h qubits[32];
-h qubits[32];
-h qubits[33];
-h qubits[34];
-h qubits[35];
-h qubits[36];
-h qubits[37];
-h qubits[38];
-h qubits[39];
-h qubits[40];
-h qubits[41];
-h qubits[42];
-h qubits[43];
-h qubits[44];
-h qubits[45];
-h qubits[46];
-h qubits[47];
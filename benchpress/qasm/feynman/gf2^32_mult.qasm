@@ -1,3325 +0,0 @@
-OPENQASM 2.0;
-include "qelib1.inc";
-qreg qubits[96];
-h qubits[64];
-h qubits[65];
-h qubits[66];
-h qubits[67];
-h qubits[68];
-h qubits[69];
-h qubits[70];
-h qubits[71];
-h qubits[72];
-h qubits[73];
-h qubits[74];
-h qubits[75];
-h qubits[76];
-h qubits[77];
-h qubits[78];
-h qubits[79];
-h qubits[80];
-h qubits[81];
-h qubits[82];
-h qubits[83];
-h qubits[84];
-h qubits[85];
-h qubits[86];
-h qubits[87];
-h qubits[88];
-h qubits[89];
-h qubits[90];
-h qubits[91];
-h qubits[92];
-h qubits[93];
-h qubits[94];
-h qubits[64];
-ccx qubits[31],qubits[33],qubits[64];
-h qubits[64];
-h qubits[64];
-ccx qubits[30],qubits[34],qubits[64];
-h qubits[64];
-h qubits[64];
-ccx qubits[29],qubits[35],qubits[64];
-h qubits[64];
-h qubits[64];
-ccx qubits[28],qubits[36],qubits[64];
-h qubits[64];
-h qubits[64];
-ccx qubits[27],qubits[37],qubits[64];
-h qubits[64];
-h qubits[64];
-ccx qubits[26],qubits[38],qubits[64];
-h qubits[64];
-h qubits[64];
-ccx qubits[25],qubits[39],qubits[64];
-h qubits[64];
-h qubits[64];
-ccx qubits[24],qubits[40],qubits[64];
-h qubits[64];
-h qubits[64];
-ccx qubits[23],qubits[41],qubits[64];
-h qubits[64];
-h qubits[64];
-ccx qubits[22],qubits[42],qubits[64];
-h qubits[64];
-h qubits[64];
-ccx qubits[21],qubits[43],qubits[64];
-h qubits[64];
-h qubits[64];
-ccx qubits[20],qubits[44],qubits[64];
-h qubits[64];
-h qubits[64];
-ccx qubits[19],qubits[45],qubits[64];
-h qubits[64];
-h qubits[64];
-ccx qubits[18],qubits[46],qubits[64];
-h qubits[64];
-h qubits[64];
-ccx qubits[17],qubits[47],qubits[64];
-h qubits[64];
-h qubits[64];
-ccx qubits[16],qubits[48],qubits[64];
-h qubits[64];
-h qubits[64];
-ccx qubits[15],qubits[49],qubits[64];
-h qubits[64];
-h qubits[64];
-ccx qubits[14],qubits[50],qubits[64];
-h qubits[64];
-h qubits[64];
-ccx qubits[13],qubits[51],qubits[64];
-h qubits[64];
-h qubits[64];
-ccx qubits[12],qubits[52],qubits[64];
-h qubits[64];
-h qubits[64];
-ccx qubits[11],qubits[53],qubits[64];
-h qubits[64];
-h qubits[64];
-ccx qubits[10],qubits[54],qubits[64];
-h qubits[64];
-h qubits[64];
-ccx qubits[9],qubits[55],qubits[64];
-h qubits[64];
-h qubits[64];
-ccx qubits[8],qubits[56],qubits[64];
-h qubits[64];
-h qubits[64];
-ccx qubits[7],qubits[57],qubits[64];
-h qubits[64];
-h qubits[64];
-ccx qubits[6],qubits[58],qubits[64];
-h qubits[64];
-h qubits[64];
-ccx qubits[5],qubits[59],qubits[64];
-h qubits[64];
-h qubits[64];
-ccx qubits[4],qubits[60],qubits[64];
-h qubits[64];
-h qubits[64];
-ccx qubits[3],qubits[61],qubits[64];
-h qubits[64];
-h qubits[64];
-ccx qubits[2],qubits[62],qubits[64];
-h qubits[64];
-h qubits[64];
-ccx qubits[1],qubits[63],qubits[64];
-h qubits[64];
-h qubits[65];
-ccx qubits[31],qubits[34],qubits[65];
-h qubits[65];
-h qubits[65];
-ccx qubits[30],qubits[35],qubits[65];
-h qubits[65];
-h qubits[65];
-ccx qubits[29],qubits[36],qubits[65];
-h qubits[65];
-h qubits[65];
-ccx qubits[28],qubits[37],qubits[65];
-h qubits[65];
-h qubits[65];
-ccx qubits[27],qubits[38],qubits[65];
-h qubits[65];
-h qubits[65];
-ccx qubits[26],qubits[39],qubits[65];
-h qubits[65];
-h qubits[65];
-ccx qubits[25],qubits[40],qubits[65];
-h qubits[65];
-h qubits[65];
-ccx qubits[24],qubits[41],qubits[65];
-h qubits[65];
-h qubits[65];
-ccx qubits[23],qubits[42],qubits[65];
-h qubits[65];
-h qubits[65];
-ccx qubits[22],qubits[43],qubits[65];
-h qubits[65];
-h qubits[65];
-ccx qubits[21],qubits[44],qubits[65];
-h qubits[65];
-h qubits[65];
-ccx qubits[20],qubits[45],qubits[65];
-h qubits[65];
-h qubits[65];
-ccx qubits[19],qubits[46],qubits[65];
-h qubits[65];
-h qubits[65];
-ccx qubits[18],qubits[47],qubits[65];
-h qubits[65];
-h qubits[65];
-ccx qubits[17],qubits[48],qubits[65];
-h qubits[65];
-h qubits[65];
-ccx qubits[16],qubits[49],qubits[65];
-h qubits[65];
-h qubits[65];
-ccx qubits[15],qubits[50],qubits[65];
-h qubits[65];
-h qubits[65];
-ccx qubits[14],qubits[51],qubits[65];
-h qubits[65];
-h qubits[65];
-ccx qubits[13],qubits[52],qubits[65];
-h qubits[65];
-h qubits[65];
-ccx qubits[12],qubits[53],qubits[65];
-h qubits[65];
-h qubits[65];
-ccx qubits[11],qubits[54],qubits[65];
-h qubits[65];
-h qubits[65];
-ccx qubits[10],qubits[55],qubits[65];
-h qubits[65];
-h qubits[65];
-ccx qubits[9],qubits[56],qubits[65];
-h qubits[65];
-h qubits[65];
-ccx qubits[8],qubits[57],qubits[65];
-h qubits[65];
-h qubits[65];
-ccx qubits[7],qubits[58],qubits[65];
-h qubits[65];
-h qubits[65];
-ccx qubits[6],qubits[59],qubits[65];
-h qubits[65];
-h qubits[65];
-ccx qubits[5],qubits[60],qubits[65];
-h qubits[65];
-h qubits[65];
-ccx qubits[4],qubits[61],qubits[65];
-h qubits[65];
-h qubits[65];
-ccx qubits[3],qubits[62],qubits[65];
-h qubits[65];
-h qubits[65];
-ccx qubits[2],qubits[63],qubits[65];
-h qubits[65];
-h qubits[66];
-ccx qubits[31],qubits[35],qubits[66];
-h qubits[66];
-h qubits[66];
-ccx qubits[30],qubits[36],qubits[66];
-h qubits[66];
-h qubits[66];
-ccx qubits[29],qubits[37],qubits[66];
-h qubits[66];
-h qubits[66];
-ccx qubits[28],qubits[38],qubits[66];
-h qubits[66];
-h qubits[66];
-ccx qubits[27],qubits[39],qubits[66];
-h qubits[66];
-h qubits[66];
-ccx qubits[26],qubits[40],qubits[66];
-h qubits[66];
-h qubits[66];
-ccx qubits[25],qubits[41],qubits[66];
-h qubits[66];
-h qubits[66];
-ccx qubits[24],qubits[42],qubits[66];
-h qubits[66];
-h qubits[66];
-ccx qubits[23],qubits[43],qubits[66];
-h qubits[66];
-h qubits[66];
-ccx qubits[22],qubits[44],qubits[66];
-h qubits[66];
-h qubits[66];
-ccx qubits[21],qubits[45],qubits[66];
-h qubits[66];
-h qubits[66];
-ccx qubits[20],qubits[46],qubits[66];
-h qubits[66];
-h qubits[66];
-ccx qubits[19],qubits[47],qubits[66];
-h qubits[66];
-h qubits[66];
-ccx qubits[18],qubits[48],qubits[66];
-h qubits[66];
-h qubits[66];
-ccx qubits[17],qubits[49],qubits[66];
-h qubits[66];
-h qubits[66];
-ccx qubits[16],qubits[50],qubits[66];
-h qubits[66];
-h qubits[66];
-ccx qubits[15],qubits[51],qubits[66];
-h qubits[66];
-h qubits[66];
-ccx qubits[14],qubits[52],qubits[66];
-h qubits[66];
-h qubits[66];
-ccx qubits[13],qubits[53],qubits[66];
-h qubits[66];
-h qubits[66];
-ccx qubits[12],qubits[54],qubits[66];
-h qubits[66];
-h qubits[66];
-ccx qubits[11],qubits[55],qubits[66];
-h qubits[66];
-h qubits[66];
-ccx qubits[10],qubits[56],qubits[66];
-h qubits[66];
-h qubits[66];
-ccx qubits[9],qubits[57],qubits[66];
-h qubits[66];
-h qubits[66];
-ccx qubits[8],qubits[58],qubits[66];
-h qubits[66];
-h qubits[66];
-ccx qubits[7],qubits[59],qubits[66];
-h qubits[66];
-h qubits[66];
-ccx qubits[6],qubits[60],qubits[66];
-h qubits[66];
-h qubits[66];
-ccx qubits[5],qubits[61],qubits[66];
-h qubits[66];
-h qubits[66];
-ccx qubits[4],qubits[62],qubits[66];
-h qubits[66];
-h qubits[66];
-ccx qubits[3],qubits[63],qubits[66];
-h qubits[66];
-h qubits[67];
-ccx qubits[31],qubits[36],qubits[67];
-h qubits[67];
-h qubits[67];
-ccx qubits[30],qubits[37],qubits[67];
-h qubits[67];
-h qubits[67];
-ccx qubits[29],qubits[38],qubits[67];
-h qubits[67];
-h qubits[67];
-ccx qubits[28],qubits[39],qubits[67];
-h qubits[67];
-h qubits[67];
-ccx qubits[27],qubits[40],qubits[67];
-h qubits[67];
-h qubits[67];
-ccx qubits[26],qubits[41],qubits[67];
-h qubits[67];
-h qubits[67];
-ccx qubits[25],qubits[42],qubits[67];
-h qubits[67];
-h qubits[67];
-ccx qubits[24],qubits[43],qubits[67];
-h qubits[67];
-h qubits[67];
-ccx qubits[23],qubits[44],qubits[67];
-h qubits[67];
-h qubits[67];
-ccx qubits[22],qubits[45],qubits[67];
-h qubits[67];
-h qubits[67];
-ccx qubits[21],qubits[46],qubits[67];
-h qubits[67];
-h qubits[67];
-ccx qubits[20],qubits[47],qubits[67];
-h qubits[67];
-h qubits[67];
-ccx qubits[19],qubits[48],qubits[67];
-h qubits[67];
-h qubits[67];
-ccx qubits[18],qubits[49],qubits[67];
-h qubits[67];
-h qubits[67];
-ccx qubits[17],qubits[50],qubits[67];
-h qubits[67];
-h qubits[67];
-ccx qubits[16],qubits[51],qubits[67];
-h qubits[67];
-h qubits[67];
-ccx qubits[15],qubits[52],qubits[67];
-h qubits[67];
-h qubits[67];
-ccx qubits[14],qubits[53],qubits[67];
-h qubits[67];
-h qubits[67];
-ccx qubits[13],qubits[54],qubits[67];
-h qubits[67];
-h qubits[67];
-ccx qubits[12],qubits[55],qubits[67];
-h qubits[67];
-h qubits[67];
-ccx qubits[11],qubits[56],qubits[67];
-h qubits[67];
-h qubits[67];
-ccx qubits[10],qubits[57],qubits[67];
-h qubits[67];
-h qubits[67];
-ccx qubits[9],qubits[58],qubits[67];
-h qubits[67];
-h qubits[67];
-ccx qubits[8],qubits[59],qubits[67];
-h qubits[67];
-h qubits[67];
-ccx qubits[7],qubits[60],qubits[67];
-h qubits[67];
-h qubits[67];
-ccx qubits[6],qubits[61],qubits[67];
-h qubits[67];
-h qubits[67];
-ccx qubits[5],qubits[62],qubits[67];
-h qubits[67];
-h qubits[67];
-ccx qubits[4],qubits[63],qubits[67];
-h qubits[67];
-h qubits[68];
-ccx qubits[31],qubits[37],qubits[68];
-h qubits[68];
-h qubits[68];
-ccx qubits[30],qubits[38],qubits[68];
-h qubits[68];
-h qubits[68];
-ccx qubits[29],qubits[39],qubits[68];
-h qubits[68];
-h qubits[68];
-ccx qubits[28],qubits[40],qubits[68];
-h qubits[68];
-h qubits[68];
-ccx qubits[27],qubits[41],qubits[68];
-h qubits[68];
-h qubits[68];
-ccx qubits[26],qubits[42],qubits[68];
-h qubits[68];
-h qubits[68];
-ccx qubits[25],qubits[43],qubits[68];
-h qubits[68];
-h qubits[68];
-ccx qubits[24],qubits[44],qubits[68];
-h qubits[68];
-h qubits[68];
-ccx qubits[23],qubits[45],qubits[68];
-h qubits[68];
-h qubits[68];
-ccx qubits[22],qubits[46],qubits[68];
-h qubits[68];
-h qubits[68];
-ccx qubits[21],qubits[47],qubits[68];
-h qubits[68];
-h qubits[68];
-ccx qubits[20],qubits[48],qubits[68];
-h qubits[68];
-h qubits[68];
-ccx qubits[19],qubits[49],qubits[68];
-h qubits[68];
-h qubits[68];
-ccx qubits[18],qubits[50],qubits[68];
-h qubits[68];
-h qubits[68];
-ccx qubits[17],qubits[51],qubits[68];
-h qubits[68];
-h qubits[68];
-ccx qubits[16],qubits[52],qubits[68];
-h qubits[68];
-h qubits[68];
-ccx qubits[15],qubits[53],qubits[68];
-h qubits[68];
-h qubits[68];
-ccx qubits[14],qubits[54],qubits[68];
-h qubits[68];
-h qubits[68];
-ccx qubits[13],qubits[55],qubits[68];
-h qubits[68];
-h qubits[68];
-ccx qubits[12],qubits[56],qubits[68];
-h qubits[68];
-h qubits[68];
-ccx qubits[11],qubits[57],qubits[68];
-h qubits[68];
-h qubits[68];
-ccx qubits[10],qubits[58],qubits[68];
-h qubits[68];
-h qubits[68];
-ccx qubits[9],qubits[59],qubits[68];
-h qubits[68];
-h qubits[68];
-ccx qubits[8],qubits[60],qubits[68];
-h qubits[68];
-h qubits[68];
-ccx qubits[7],qubits[61],qubits[68];
-h qubits[68];
-h qubits[68];
-ccx qubits[6],qubits[62],qubits[68];
-h qubits[68];
-h qubits[68];
-ccx qubits[5],qubits[63],qubits[68];
-h qubits[68];
-h qubits[69];
-ccx qubits[31],qubits[38],qubits[69];
-h qubits[69];
-h qubits[69];
-ccx qubits[30],qubits[39],qubits[69];
-h qubits[69];
-h qubits[69];
-ccx qubits[29],qubits[40],qubits[69];
-h qubits[69];
-h qubits[69];
-ccx qubits[28],qubits[41],qubits[69];
-h qubits[69];
-h qubits[69];
-ccx qubits[27],qubits[42],qubits[69];
-h qubits[69];
-h qubits[69];
-ccx qubits[26],qubits[43],qubits[69];
-h qubits[69];
-h qubits[69];
-ccx qubits[25],qubits[44],qubits[69];
-h qubits[69];
-h qubits[69];
-ccx qubits[24],qubits[45],qubits[69];
-h qubits[69];
-h qubits[69];
-ccx qubits[23],qubits[46],qubits[69];
-h qubits[69];
-h qubits[69];
-ccx qubits[22],qubits[47],qubits[69];
-h qubits[69];
-h qubits[69];
-ccx qubits[21],qubits[48],qubits[69];
-h qubits[69];
-h qubits[69];
-ccx qubits[20],qubits[49],qubits[69];
-h qubits[69];
-h qubits[69];
-ccx qubits[19],qubits[50],qubits[69];
-h qubits[69];
-h qubits[69];
-ccx qubits[18],qubits[51],qubits[69];
-h qubits[69];
-h qubits[69];
-ccx qubits[17],qubits[52],qubits[69];
-h qubits[69];
-h qubits[69];
-ccx qubits[16],qubits[53],qubits[69];
-h qubits[69];
-h qubits[69];
-ccx qubits[15],qubits[54],qubits[69];
-h qubits[69];
-h qubits[69];
-ccx qubits[14],qubits[55],qubits[69];
-h qubits[69];
-h qubits[69];
-ccx qubits[13],qubits[56],qubits[69];
-h qubits[69];
-h qubits[69];
-ccx qubits[12],qubits[57],qubits[69];
-h qubits[69];
-h qubits[69];
-ccx qubits[11],qubits[58],qubits[69];
-h qubits[69];
-h qubits[69];
-ccx qubits[10],qubits[59],qubits[69];
-h qubits[69];
-h qubits[69];
-ccx qubits[9],qubits[60],qubits[69];
-h qubits[69];
-h qubits[69];
-ccx qubits[8],qubits[61],qubits[69];
-h qubits[69];
-h qubits[69];
-ccx qubits[7],qubits[62],qubits[69];
-h qubits[69];
-h qubits[69];
-ccx qubits[6],qubits[63],qubits[69];
-h qubits[69];
-h qubits[70];
-ccx qubits[31],qubits[39],qubits[70];
-h qubits[70];
-h qubits[70];
-ccx qubits[30],qubits[40],qubits[70];
-h qubits[70];
-h qubits[70];
-ccx qubits[29],qubits[41],qubits[70];
-h qubits[70];
-h qubits[70];
-ccx qubits[28],qubits[42],qubits[70];
-h qubits[70];
-h qubits[70];
-ccx qubits[27],qubits[43],qubits[70];
-h qubits[70];
-h qubits[70];
-ccx qubits[26],qubits[44],qubits[70];
-h qubits[70];
-h qubits[70];
-ccx qubits[25],qubits[45],qubits[70];
-h qubits[70];
-h qubits[70];
-ccx qubits[24],qubits[46],qubits[70];
-h qubits[70];
-h qubits[70];
-ccx qubits[23],qubits[47],qubits[70];
-h qubits[70];
-h qubits[70];
-ccx qubits[22],qubits[48],qubits[70];
-h qubits[70];
-h qubits[70];
-ccx qubits[21],qubits[49],qubits[70];
-h qubits[70];
-h qubits[70];
-ccx qubits[20],qubits[50],qubits[70];
-h qubits[70];
-h qubits[70];
-ccx qubits[19],qubits[51],qubits[70];
-h qubits[70];
-h qubits[70];
-ccx qubits[18],qubits[52],qubits[70];
-h qubits[70];
-h qubits[70];
-ccx qubits[17],qubits[53],qubits[70];
-h qubits[70];
-h qubits[70];
-ccx qubits[16],qubits[54],qubits[70];
-h qubits[70];
-h qubits[70];
-ccx qubits[15],qubits[55],qubits[70];
-h qubits[70];
-h qubits[70];
-ccx qubits[14],qubits[56],qubits[70];
-h qubits[70];
-h qubits[70];
-ccx qubits[13],qubits[57],qubits[70];
-h qubits[70];
-h qubits[70];
-ccx qubits[12],qubits[58],qubits[70];
-h qubits[70];
-h qubits[70];
-ccx qubits[11],qubits[59],qubits[70];
-h qubits[70];
-h qubits[70];
-ccx qubits[10],qubits[60],qubits[70];
-h qubits[70];
-h qubits[70];
-ccx qubits[9],qubits[61],qubits[70];
-h qubits[70];
-h qubits[70];
-ccx qubits[8],qubits[62],qubits[70];
-h qubits[70];
-h qubits[70];
-ccx qubits[7],qubits[63],qubits[70];
-h qubits[70];
-h qubits[71];
-ccx qubits[31],qubits[40],qubits[71];
-h qubits[71];
-h qubits[71];
-ccx qubits[30],qubits[41],qubits[71];
-h qubits[71];
-h qubits[71];
-ccx qubits[29],qubits[42],qubits[71];
-h qubits[71];
-h qubits[71];
-ccx qubits[28],qubits[43],qubits[71];
-h qubits[71];
-h qubits[71];
-ccx qubits[27],qubits[44],qubits[71];
-h qubits[71];
-h qubits[71];
-ccx qubits[26],qubits[45],qubits[71];
-h qubits[71];
-h qubits[71];
-ccx qubits[25],qubits[46],qubits[71];
-h qubits[71];
-h qubits[71];
-ccx qubits[24],qubits[47],qubits[71];
-h qubits[71];
-h qubits[71];
-ccx qubits[23],qubits[48],qubits[71];
-h qubits[71];
-h qubits[71];
-ccx qubits[22],qubits[49],qubits[71];
-h qubits[71];
-h qubits[71];
-ccx qubits[21],qubits[50],qubits[71];
-h qubits[71];
-h qubits[71];
-ccx qubits[20],qubits[51],qubits[71];
-h qubits[71];
-h qubits[71];
-ccx qubits[19],qubits[52],qubits[71];
-h qubits[71];
-h qubits[71];
-ccx qubits[18],qubits[53],qubits[71];
-h qubits[71];
-h qubits[71];
-ccx qubits[17],qubits[54],qubits[71];
-h qubits[71];
-h qubits[71];
-ccx qubits[16],qubits[55],qubits[71];
-h qubits[71];
-h qubits[71];
-ccx qubits[15],qubits[56],qubits[71];
-h qubits[71];
-h qubits[71];
-ccx qubits[14],qubits[57],qubits[71];
-h qubits[71];
-h qubits[71];
-ccx qubits[13],qubits[58],qubits[71];
-h qubits[71];
-h qubits[71];
-ccx qubits[12],qubits[59],qubits[71];
-h qubits[71];
-h qubits[71];
-ccx qubits[11],qubits[60],qubits[71];
-h qubits[71];
-h qubits[71];
-ccx qubits[10],qubits[61],qubits[71];
-h qubits[71];
-h qubits[71];
-ccx qubits[9],qubits[62],qubits[71];
-h qubits[71];
-h qubits[71];
-ccx qubits[8],qubits[63],qubits[71];
-h qubits[71];
-h qubits[72];
-ccx qubits[31],qubits[41],qubits[72];
-h qubits[72];
-h qubits[72];
-ccx qubits[30],qubits[42],qubits[72];
-h qubits[72];
-h qubits[72];
-ccx qubits[29],qubits[43],qubits[72];
-h qubits[72];
-h qubits[72];
-ccx qubits[28],qubits[44],qubits[72];
-h qubits[72];
-h qubits[72];
-ccx qubits[27],qubits[45],qubits[72];
-h qubits[72];
-h qubits[72];
-ccx qubits[26],qubits[46],qubits[72];
-h qubits[72];
-h qubits[72];
-ccx qubits[25],qubits[47],qubits[72];
-h qubits[72];
-h qubits[72];
-ccx qubits[24],qubits[48],qubits[72];
-h qubits[72];
-h qubits[72];
-ccx qubits[23],qubits[49],qubits[72];
-h qubits[72];
-h qubits[72];
-ccx qubits[22],qubits[50],qubits[72];
-h qubits[72];
-h qubits[72];
-ccx qubits[21],qubits[51],qubits[72];
-h qubits[72];
-h qubits[72];
-ccx qubits[20],qubits[52],qubits[72];
-h qubits[72];
-h qubits[72];
-ccx qubits[19],qubits[53],qubits[72];
-h qubits[72];
-h qubits[72];
-ccx qubits[18],qubits[54],qubits[72];
-h qubits[72];
-h qubits[72];
-ccx qubits[17],qubits[55],qubits[72];
-h qubits[72];
-h qubits[72];
-ccx qubits[16],qubits[56],qubits[72];
-h qubits[72];
-h qubits[72];
-ccx qubits[15],qubits[57],qubits[72];
-h qubits[72];
-h qubits[72];
-ccx qubits[14],qubits[58],qubits[72];
-h qubits[72];
-h qubits[72];
-ccx qubits[13],qubits[59],qubits[72];
-h qubits[72];
-h qubits[72];
-ccx qubits[12],qubits[60],qubits[72];
-h qubits[72];
-h qubits[72];
-ccx qubits[11],qubits[61],qubits[72];
-h qubits[72];
-h qubits[72];
-ccx qubits[10],qubits[62],qubits[72];
-h qubits[72];
-h qubits[72];
-ccx qubits[9],qubits[63],qubits[72];
-h qubits[72];
-h qubits[73];
-ccx qubits[31],qubits[42],qubits[73];
-h qubits[73];
-h qubits[73];
-ccx qubits[30],qubits[43],qubits[73];
-h qubits[73];
-h qubits[73];
-ccx qubits[29],qubits[44],qubits[73];
-h qubits[73];
-h qubits[73];
-ccx qubits[28],qubits[45],qubits[73];
-h qubits[73];
-h qubits[73];
-ccx qubits[27],qubits[46],qubits[73];
-h qubits[73];
-h qubits[73];
-ccx qubits[26],qubits[47],qubits[73];
-h qubits[73];
-h qubits[73];
-ccx qubits[25],qubits[48],qubits[73];
-h qubits[73];
-h qubits[73];
-ccx qubits[24],qubits[49],qubits[73];
-h qubits[73];
-h qubits[73];
-ccx qubits[23],qubits[50],qubits[73];
-h qubits[73];
-h qubits[73];
-ccx qubits[22],qubits[51],qubits[73];
-h qubits[73];
-h qubits[73];
-ccx qubits[21],qubits[52],qubits[73];
-h qubits[73];
-h qubits[73];
-ccx qubits[20],qubits[53],qubits[73];
-h qubits[73];
-h qubits[73];
-ccx qubits[19],qubits[54],qubits[73];
-h qubits[73];
-h qubits[73];
-ccx qubits[18],qubits[55],qubits[73];
-h qubits[73];
-h qubits[73];
-ccx qubits[17],qubits[56],qubits[73];
-h qubits[73];
-h qubits[73];
-ccx qubits[16],qubits[57],qubits[73];
-h qubits[73];
-h qubits[73];
-ccx qubits[15],qubits[58],qubits[73];
-h qubits[73];
-h qubits[73];
-ccx qubits[14],qubits[59],qubits[73];
-h qubits[73];
-h qubits[73];
-ccx qubits[13],qubits[60],qubits[73];
-h qubits[73];
-h qubits[73];
-ccx qubits[12],qubits[61],qubits[73];
-h qubits[73];
-h qubits[73];
-ccx qubits[11],qubits[62],qubits[73];
-h qubits[73];
-h qubits[73];
-ccx qubits[10],qubits[63],qubits[73];
-h qubits[73];
-h qubits[74];
-ccx qubits[31],qubits[43],qubits[74];
-h qubits[74];
-h qubits[74];
-ccx qubits[30],qubits[44],qubits[74];
-h qubits[74];
-h qubits[74];
-ccx qubits[29],qubits[45],qubits[74];
-h qubits[74];
-h qubits[74];
-ccx qubits[28],qubits[46],qubits[74];
-h qubits[74];
-h qubits[74];
-ccx qubits[27],qubits[47],qubits[74];
-h qubits[74];
-h qubits[74];
-ccx qubits[26],qubits[48],qubits[74];
-h qubits[74];
-h qubits[74];
-ccx qubits[25],qubits[49],qubits[74];
-h qubits[74];
-h qubits[74];
-ccx qubits[24],qubits[50],qubits[74];
-h qubits[74];
-h qubits[74];
-ccx qubits[23],qubits[51],qubits[74];
-h qubits[74];
-h qubits[74];
-ccx qubits[22],qubits[52],qubits[74];
-h qubits[74];
-h qubits[74];
-ccx qubits[21],qubits[53],qubits[74];
-h qubits[74];
-h qubits[74];
-ccx qubits[20],qubits[54],qubits[74];
-h qubits[74];
-h qubits[74];
-ccx qubits[19],qubits[55],qubits[74];
-h qubits[74];
-h qubits[74];
-ccx qubits[18],qubits[56],qubits[74];
-h qubits[74];
-h qubits[74];
-ccx qubits[17],qubits[57],qubits[74];
-h qubits[74];
-h qubits[74];
-ccx qubits[16],qubits[58],qubits[74];
-h qubits[74];
-h qubits[74];
-ccx qubits[15],qubits[59],qubits[74];
-h qubits[74];
-h qubits[74];
-ccx qubits[14],qubits[60],qubits[74];
-h qubits[74];
-h qubits[74];
-ccx qubits[13],qubits[61],qubits[74];
-h qubits[74];
-h qubits[74];
-ccx qubits[12],qubits[62],qubits[74];
-h qubits[74];
-h qubits[74];
-ccx qubits[11],qubits[63],qubits[74];
-h qubits[74];
-h qubits[75];
-ccx qubits[31],qubits[44],qubits[75];
-h qubits[75];
-h qubits[75];
-ccx qubits[30],qubits[45],qubits[75];
-h qubits[75];
-h qubits[75];
-ccx qubits[29],qubits[46],qubits[75];
-h qubits[75];
-h qubits[75];
-ccx qubits[28],qubits[47],qubits[75];
-h qubits[75];
-h qubits[75];
-ccx qubits[27],qubits[48],qubits[75];
-h qubits[75];
-h qubits[75];
-ccx qubits[26],qubits[49],qubits[75];
-h qubits[75];
-h qubits[75];
-ccx qubits[25],qubits[50],qubits[75];
-h qubits[75];
-h qubits[75];
-ccx qubits[24],qubits[51],qubits[75];
-h qubits[75];
-h qubits[75];
-ccx qubits[23],qubits[52],qubits[75];
-h qubits[75];
-h qubits[75];
-ccx qubits[22],qubits[53],qubits[75];
-h qubits[75];
-h qubits[75];
-ccx qubits[21],qubits[54],qubits[75];
-h qubits[75];
-h qubits[75];
-ccx qubits[20],qubits[55],qubits[75];
-h qubits[75];
-h qubits[75];
-ccx qubits[19],qubits[56],qubits[75];
-h qubits[75];
-h qubits[75];
-ccx qubits[18],qubits[57],qubits[75];
-h qubits[75];
-h qubits[75];
-ccx qubits[17],qubits[58],qubits[75];
-h qubits[75];
-h qubits[75];
-ccx qubits[16],qubits[59],qubits[75];
-h qubits[75];
-h qubits[75];
-ccx qubits[15],qubits[60],qubits[75];
-h qubits[75];
-h qubits[75];
-ccx qubits[14],qubits[61],qubits[75];
-h qubits[75];
-h qubits[75];
-ccx qubits[13],qubits[62],qubits[75];
-h qubits[75];
-h qubits[75];
-ccx qubits[12],qubits[63],qubits[75];
-h qubits[75];
-h qubits[76];
-ccx qubits[31],qubits[45],qubits[76];
-h qubits[76];
-h qubits[76];
-ccx qubits[30],qubits[46],qubits[76];
-h qubits[76];
-h qubits[76];
-ccx qubits[29],qubits[47],qubits[76];
-h qubits[76];
-h qubits[76];
-ccx qubits[28],qubits[48],qubits[76];
-h qubits[76];
-h qubits[76];
-ccx qubits[27],qubits[49],qubits[76];
-h qubits[76];
-h qubits[76];
-ccx qubits[26],qubits[50],qubits[76];
-h qubits[76];
-h qubits[76];
-ccx qubits[25],qubits[51],qubits[76];
-h qubits[76];
-h qubits[76];
-ccx qubits[24],qubits[52],qubits[76];
-h qubits[76];
-h qubits[76];
-ccx qubits[23],qubits[53],qubits[76];
-h qubits[76];
-h qubits[76];
-ccx qubits[22],qubits[54],qubits[76];
-h qubits[76];
-h qubits[76];
-ccx qubits[21],qubits[55],qubits[76];
-h qubits[76];
-h qubits[76];
-ccx qubits[20],qubits[56],qubits[76];
-h qubits[76];
-h qubits[76];
-ccx qubits[19],qubits[57],qubits[76];
-h qubits[76];
-h qubits[76];
-ccx qubits[18],qubits[58],qubits[76];
-h qubits[76];
-h qubits[76];
-ccx qubits[17],qubits[59],qubits[76];
-h qubits[76];
-h qubits[76];
-ccx qubits[16],qubits[60],qubits[76];
-h qubits[76];
-h qubits[76];
-ccx qubits[15],qubits[61],qubits[76];
-h qubits[76];
-h qubits[76];
-ccx qubits[14],qubits[62],qubits[76];
-h qubits[76];
-h qubits[76];
-ccx qubits[13],qubits[63],qubits[76];
-h qubits[76];
-h qubits[77];
-ccx qubits[31],qubits[46],qubits[77];
-h qubits[77];
-h qubits[77];
-ccx qubits[30],qubits[47],qubits[77];
-h qubits[77];
-h qubits[77];
-ccx qubits[29],qubits[48],qubits[77];
-h qubits[77];
-h qubits[77];
-ccx qubits[28],qubits[49],qubits[77];
-h qubits[77];
-h qubits[77];
-ccx qubits[27],qubits[50],qubits[77];
-h qubits[77];
-h qubits[77];
-ccx qubits[26],qubits[51],qubits[77];
-h qubits[77];
-h qubits[77];
-ccx qubits[25],qubits[52],qubits[77];
-h qubits[77];
-h qubits[77];
-ccx qubits[24],qubits[53],qubits[77];
-h qubits[77];
-h qubits[77];
-ccx qubits[23],qubits[54],qubits[77];
-h qubits[77];
-h qubits[77];
-ccx qubits[22],qubits[55],qubits[77];
-h qubits[77];
-h qubits[77];
-ccx qubits[21],qubits[56],qubits[77];
-h qubits[77];
-h qubits[77];
-ccx qubits[20],qubits[57],qubits[77];
-h qubits[77];
-h qubits[77];
-ccx qubits[19],qubits[58],qubits[77];
-h qubits[77];
-h qubits[77];
-ccx qubits[18],qubits[59],qubits[77];
-h qubits[77];
-h qubits[77];
-ccx qubits[17],qubits[60],qubits[77];
-h qubits[77];
-h qubits[77];
-ccx qubits[16],qubits[61],qubits[77];
-h qubits[77];
-h qubits[77];
-ccx qubits[15],qubits[62],qubits[77];
-h qubits[77];
-h qubits[77];
-ccx qubits[14],qubits[63],qubits[77];
-h qubits[77];
-h qubits[78];
-ccx qubits[31],qubits[47],qubits[78];
-h qubits[78];
-h qubits[78];
-ccx qubits[30],qubits[48],qubits[78];
-h qubits[78];
-h qubits[78];
-ccx qubits[29],qubits[49],qubits[78];
-h qubits[78];
-h qubits[78];
-ccx qubits[28],qubits[50],qubits[78];
-h qubits[78];
-h qubits[78];
-ccx qubits[27],qubits[51],qubits[78];
-h qubits[78];
-h qubits[78];
-ccx qubits[26],qubits[52],qubits[78];
-h qubits[78];
-h qubits[78];
-ccx qubits[25],qubits[53],qubits[78];
-h qubits[78];
-h qubits[78];
-ccx qubits[24],qubits[54],qubits[78];
-h qubits[78];
-h qubits[78];
-ccx qubits[23],qubits[55],qubits[78];
-h qubits[78];
-h qubits[78];
-ccx qubits[22],qubits[56],qubits[78];
-h qubits[78];
-h qubits[78];
-ccx qubits[21],qubits[57],qubits[78];
-h qubits[78];
-h qubits[78];
-ccx qubits[20],qubits[58],qubits[78];
-h qubits[78];
-h qubits[78];
-ccx qubits[19],qubits[59],qubits[78];
-h qubits[78];
-h qubits[78];
-ccx qubits[18],qubits[60],qubits[78];
-h qubits[78];
-h qubits[78];
-ccx qubits[17],qubits[61],qubits[78];
-h qubits[78];
-h qubits[78];
-ccx qubits[16],qubits[62],qubits[78];
-h qubits[78];
-h qubits[78];
-ccx qubits[15],qubits[63],qubits[78];
-h qubits[78];
-h qubits[79];
-ccx qubits[31],qubits[48],qubits[79];
-h qubits[79];
-h qubits[79];
-ccx qubits[30],qubits[49],qubits[79];
-h qubits[79];
-h qubits[79];
-ccx qubits[29],qubits[50],qubits[79];
-h qubits[79];
-h qubits[79];
-ccx qubits[28],qubits[51],qubits[79];
-h qubits[79];
-h qubits[79];
-ccx qubits[27],qubits[52],qubits[79];
-h qubits[79];
-h qubits[79];
-ccx qubits[26],qubits[53],qubits[79];
-h qubits[79];
-h qubits[79];
-ccx qubits[25],qubits[54],qubits[79];
-h qubits[79];
-h qubits[79];
-ccx qubits[24],qubits[55],qubits[79];
-h qubits[79];
-h qubits[79];
-ccx qubits[23],qubits[56],qubits[79];
-h qubits[79];
-h qubits[79];
-ccx qubits[22],qubits[57],qubits[79];
-h qubits[79];
-h qubits[79];
-ccx qubits[21],qubits[58],qubits[79];
-h qubits[79];
-h qubits[79];
-ccx qubits[20],qubits[59],qubits[79];
-h qubits[79];
-h qubits[79];
-ccx qubits[19],qubits[60],qubits[79];
-h qubits[79];
-h qubits[79];
-ccx qubits[18],qubits[61],qubits[79];
-h qubits[79];
-h qubits[79];
-ccx qubits[17],qubits[62],qubits[79];
-h qubits[79];
-h qubits[79];
-ccx qubits[16],qubits[63],qubits[79];
-h qubits[79];
-h qubits[80];
-ccx qubits[31],qubits[49],qubits[80];
-h qubits[80];
-h qubits[80];
-ccx qubits[30],qubits[50],qubits[80];
-h qubits[80];
-h qubits[80];
-ccx qubits[29],qubits[51],qubits[80];
-h qubits[80];
-h qubits[80];
-ccx qubits[28],qubits[52],qubits[80];
-h qubits[80];
-h qubits[80];
-ccx qubits[27],qubits[53],qubits[80];
-h qubits[80];
-h qubits[80];
-ccx qubits[26],qubits[54],qubits[80];
-h qubits[80];
-h qubits[80];
-ccx qubits[25],qubits[55],qubits[80];
-h qubits[80];
-h qubits[80];
-ccx qubits[24],qubits[56],qubits[80];
-h qubits[80];
-h qubits[80];
-ccx qubits[23],qubits[57],qubits[80];
-h qubits[80];
-h qubits[80];
-ccx qubits[22],qubits[58],qubits[80];
-h qubits[80];
-h qubits[80];
-ccx qubits[21],qubits[59],qubits[80];
-h qubits[80];
-h qubits[80];
-ccx qubits[20],qubits[60],qubits[80];
-h qubits[80];
-h qubits[80];
-ccx qubits[19],qubits[61],qubits[80];
-h qubits[80];
-h qubits[80];
-ccx qubits[18],qubits[62],qubits[80];
-h qubits[80];
-h qubits[80];
-ccx qubits[17],qubits[63],qubits[80];
-h qubits[80];
-h qubits[81];
-ccx qubits[31],qubits[50],qubits[81];
-h qubits[81];
-h qubits[81];
-ccx qubits[30],qubits[51],qubits[81];
-h qubits[81];
-h qubits[81];
-ccx qubits[29],qubits[52],qubits[81];
-h qubits[81];
-h qubits[81];
-ccx qubits[28],qubits[53],qubits[81];
-h qubits[81];
-h qubits[81];
-ccx qubits[27],qubits[54],qubits[81];
-h qubits[81];
-h qubits[81];
-ccx qubits[26],qubits[55],qubits[81];
-h qubits[81];
-h qubits[81];
-ccx qubits[25],qubits[56],qubits[81];
-h qubits[81];
-h qubits[81];
-ccx qubits[24],qubits[57],qubits[81];
-h qubits[81];
-h qubits[81];
-ccx qubits[23],qubits[58],qubits[81];
-h qubits[81];
-h qubits[81];
-ccx qubits[22],qubits[59],qubits[81];
-h qubits[81];
-h qubits[81];
-ccx qubits[21],qubits[60],qubits[81];
-h qubits[81];
-h qubits[81];
-ccx qubits[20],qubits[61],qubits[81];
-h qubits[81];
-h qubits[81];
-ccx qubits[19],qubits[62],qubits[81];
-h qubits[81];
-h qubits[81];
-ccx qubits[18],qubits[63],qubits[81];
-h qubits[81];
-h qubits[82];
-ccx qubits[31],qubits[51],qubits[82];
-h qubits[82];
-h qubits[82];
-ccx qubits[30],qubits[52],qubits[82];
-h qubits[82];
-h qubits[82];
-ccx qubits[29],qubits[53],qubits[82];
-h qubits[82];
-h qubits[82];
-ccx qubits[28],qubits[54],qubits[82];
-h qubits[82];
-h qubits[82];
-ccx qubits[27],qubits[55],qubits[82];
-h qubits[82];
-h qubits[82];
-ccx qubits[26],qubits[56],qubits[82];
-h qubits[82];
-h qubits[82];
-ccx qubits[25],qubits[57],qubits[82];
-h qubits[82];
-h qubits[82];
-ccx qubits[24],qubits[58],qubits[82];
-h qubits[82];
-h qubits[82];
-ccx qubits[23],qubits[59],qubits[82];
-h qubits[82];
-h qubits[82];
-ccx qubits[22],qubits[60],qubits[82];
-h qubits[82];
-h qubits[82];
-ccx qubits[21],qubits[61],qubits[82];
-h qubits[82];
-h qubits[82];
-ccx qubits[20],qubits[62],qubits[82];
-h qubits[82];
-h qubits[82];
-ccx qubits[19],qubits[63],qubits[82];
-h qubits[82];
-h qubits[83];
-ccx qubits[31],qubits[52],qubits[83];
-h qubits[83];
-h qubits[83];
-ccx qubits[30],qubits[53],qubits[83];
-h qubits[83];
-h qubits[83];
-ccx qubits[29],qubits[54],qubits[83];
-h qubits[83];
-h qubits[83];
-ccx qubits[28],qubits[55],qubits[83];
-h qubits[83];
-h qubits[83];
-ccx qubits[27],qubits[56],qubits[83];
-h qubits[83];
-h qubits[83];
-ccx qubits[26],qubits[57],qubits[83];
-h qubits[83];
-h qubits[83];
-ccx qubits[25],qubits[58],qubits[83];
-h qubits[83];
-h qubits[83];
-ccx qubits[24],qubits[59],qubits[83];
-h qubits[83];
-h qubits[83];
-ccx qubits[23],qubits[60],qubits[83];
-h qubits[83];
-h qubits[83];
-ccx qubits[22],qubits[61],qubits[83];
-h qubits[83];
-h qubits[83];
-ccx qubits[21],qubits[62],qubits[83];
-h qubits[83];
-h qubits[83];
-ccx qubits[20],qubits[63],qubits[83];
-h qubits[83];
-h qubits[84];
-ccx qubits[31],qubits[53],qubits[84];
-h qubits[84];
-h qubits[84];
-ccx qubits[30],qubits[54],qubits[84];
-h qubits[84];
-h qubits[84];
-ccx qubits[29],qubits[55],qubits[84];
-h qubits[84];
-h qubits[84];
-ccx qubits[28],qubits[56],qubits[84];
-h qubits[84];
-h qubits[84];
-ccx qubits[27],qubits[57],qubits[84];
-h qubits[84];
-h qubits[84];
-ccx qubits[26],qubits[58],qubits[84];
-h qubits[84];
-h qubits[84];
-ccx qubits[25],qubits[59],qubits[84];
-h qubits[84];
-h qubits[84];
-ccx qubits[24],qubits[60],qubits[84];
-h qubits[84];
-h qubits[84];
-ccx qubits[23],qubits[61],qubits[84];
-h qubits[84];
-h qubits[84];
-ccx qubits[22],qubits[62],qubits[84];
-h qubits[84];
-h qubits[84];
-ccx qubits[21],qubits[63],qubits[84];
-h qubits[84];
-h qubits[85];
-ccx qubits[31],qubits[54],qubits[85];
-h qubits[85];
-h qubits[85];
-ccx qubits[30],qubits[55],qubits[85];
-h qubits[85];
-h qubits[85];
-ccx qubits[29],qubits[56],qubits[85];
-h qubits[85];
-h qubits[85];
-ccx qubits[28],qubits[57],qubits[85];
-h qubits[85];
-h qubits[85];
-ccx qubits[27],qubits[58],qubits[85];
-h qubits[85];
-h qubits[85];
-ccx qubits[26],qubits[59],qubits[85];
-h qubits[85];
-h qubits[85];
-ccx qubits[25],qubits[60],qubits[85];
-h qubits[85];
-h qubits[85];
-ccx qubits[24],qubits[61],qubits[85];
-h qubits[85];
-h qubits[85];
-ccx qubits[23],qubits[62],qubits[85];
-h qubits[85];
-h qubits[85];
-ccx qubits[22],qubits[63],qubits[85];
-h qubits[85];
-h qubits[86];
-ccx qubits[31],qubits[55],qubits[86];
-h qubits[86];
-h qubits[86];
-ccx qubits[30],qubits[56],qubits[86];
-h qubits[86];
-h qubits[86];
-ccx qubits[29],qubits[57],qubits[86];
-h qubits[86];
-h qubits[86];
-ccx qubits[28],qubits[58],qubits[86];
-h qubits[86];
-h qubits[86];
-ccx qubits[27],qubits[59],qubits[86];
-h qubits[86];
-h qubits[86];
-ccx qubits[26],qubits[60],qubits[86];
-h qubits[86];
-h qubits[86];
-ccx qubits[25],qubits[61],qubits[86];
-h qubits[86];
-h qubits[86];
-ccx qubits[24],qubits[62],qubits[86];
-h qubits[86];
-h qubits[86];
-ccx qubits[23],qubits[63],qubits[86];
-h qubits[86];
-h qubits[87];
-ccx qubits[31],qubits[56],qubits[87];
-h qubits[87];
-h qubits[87];
-ccx qubits[30],qubits[57],qubits[87];
-h qubits[87];
-h qubits[87];
-ccx qubits[29],qubits[58],qubits[87];
-h qubits[87];
-h qubits[87];
-ccx qubits[28],qubits[59],qubits[87];
-h qubits[87];
-h qubits[87];
-ccx qubits[27],qubits[60],qubits[87];
-h qubits[87];
-h qubits[87];
-ccx qubits[26],qubits[61],qubits[87];
-h qubits[87];
-h qubits[87];
-ccx qubits[25],qubits[62],qubits[87];
-h qubits[87];
-h qubits[87];
-ccx qubits[24],qubits[63],qubits[87];
-h qubits[87];
-h qubits[88];
-ccx qubits[31],qubits[57],qubits[88];
-h qubits[88];
-h qubits[88];
-ccx qubits[30],qubits[58],qubits[88];
-h qubits[88];
-h qubits[88];
-ccx qubits[29],qubits[59],qubits[88];
-h qubits[88];
-h qubits[88];
-ccx qubits[28],qubits[60],qubits[88];
-h qubits[88];
-h qubits[88];
-ccx qubits[27],qubits[61],qubits[88];
-h qubits[88];
-h qubits[88];
-ccx qubits[26],qubits[62],qubits[88];
-h qubits[88];
-h qubits[88];
-ccx qubits[25],qubits[63],qubits[88];
-h qubits[88];
-h qubits[89];
-ccx qubits[31],qubits[58],qubits[89];
-h qubits[89];
-h qubits[89];
-ccx qubits[30],qubits[59],qubits[89];
-h qubits[89];
-h qubits[89];
-ccx qubits[29],qubits[60],qubits[89];
-h qubits[89];
-h qubits[89];
-ccx qubits[28],qubits[61],qubits[89];
-h qubits[89];
-h qubits[89];
-ccx qubits[27],qubits[62],qubits[89];
-h qubits[89];
-h qubits[89];
-ccx qubits[26],qubits[63],qubits[89];
-h qubits[89];
-h qubits[90];
-ccx qubits[31],qubits[59],qubits[90];
-h qubits[90];
-h qubits[90];
-ccx qubits[30],qubits[60],qubits[90];
-h qubits[90];
-h qubits[90];
-ccx qubits[29],qubits[61],qubits[90];
-h qubits[90];
-h qubits[90];
-ccx qubits[28],qubits[62],qubits[90];
-h qubits[90];
-h qubits[90];
-ccx qubits[27],qubits[63],qubits[90];
-h qubits[90];
-h qubits[91];
-ccx qubits[31],qubits[60],qubits[91];
-h qubits[91];
-h qubits[91];
-ccx qubits[30],qubits[61],qubits[91];
-h qubits[91];
-h qubits[91];
-ccx qubits[29],qubits[62],qubits[91];
-h qubits[91];
-h qubits[91];
-ccx qubits[28],qubits[63],qubits[91];
-h qubits[91];
-h qubits[92];
-ccx qubits[31],qubits[61],qubits[92];
-h qubits[92];
-h qubits[92];
-ccx qubits[30],qubits[62],qubits[92];
-h qubits[92];
-h qubits[92];
-ccx qubits[29],qubits[63],qubits[92];
-h qubits[92];
-h qubits[93];
-ccx qubits[31],qubits[62],qubits[93];
-h qubits[93];
-h qubits[93];
-ccx qubits[30],qubits[63],qubits[93];
-h qubits[93];
-h qubits[94];
-ccx qubits[31],qubits[63],qubits[94];
-h qubits[94];
-h qubits[64];
-h qubits[65];
-h qubits[66];
-h qubits[67];
-h qubits[68];
-h qubits[69];
-h qubits[70];
-h qubits[71];
-h qubits[72];
-h qubits[73];
-h qubits[74];
-h qubits[75];
-h qubits[76];
-h qubits[77];
-h qubits[78];
-h qubits[79];
-h qubits[80];
-h qubits[81];
-h qubits[82];
-h qubits[83];
-h qubits[84];
-h qubits[85];
-h qubits[86];
-h qubits[87];
-h qubits[88];
-h qubits[89];
-h qubits[90];
-h qubits[91];
-h qubits[92];
-h qubits[93];
-h qubits[94];
-cx qubits[94],qubits[69];
-cx qubits[94],qubits[67];
-cx qubits[94],qubits[65];
-cx qubits[94],qubits[95];
-cx qubits[93],qubits[68];
-cx qubits[93],qubits[66];
-cx qubits[93],qubits[64];
-cx qubits[93],qubits[94];
-cx qubits[92],qubits[67];
-cx qubits[92],qubits[65];
-cx qubits[92],qubits[95];
-cx qubits[92],qubits[93];
-cx qubits[91],qubits[66];
-cx qubits[91],qubits[64];
-cx qubits[91],qubits[94];
-cx qubits[91],qubits[92];
-cx qubits[90],qubits[65];
-cx qubits[90],qubits[95];
-cx qubits[90],qubits[93];
-cx qubits[90],qubits[91];
-cx qubits[89],qubits[64];
-cx qubits[89],qubits[94];
-cx qubits[89],qubits[92];
-cx qubits[89],qubits[90];
-cx qubits[88],qubits[95];
-cx qubits[88],qubits[93];
-cx qubits[88],qubits[91];
-cx qubits[88],qubits[89];
-cx qubits[87],qubits[94];
-cx qubits[87],qubits[92];
-cx qubits[87],qubits[90];
-cx qubits[87],qubits[88];
-cx qubits[86],qubits[93];
-cx qubits[86],qubits[91];
-cx qubits[86],qubits[89];
-cx qubits[86],qubits[87];
-cx qubits[85],qubits[92];
-cx qubits[85],qubits[90];
-cx qubits[85],qubits[88];
-cx qubits[85],qubits[86];
-cx qubits[84],qubits[91];
-cx qubits[84],qubits[89];
-cx qubits[84],qubits[87];
-cx qubits[84],qubits[85];
-cx qubits[83],qubits[90];
-cx qubits[83],qubits[88];
-cx qubits[83],qubits[86];
-cx qubits[83],qubits[84];
-cx qubits[82],qubits[89];
-cx qubits[82],qubits[87];
-cx qubits[82],qubits[85];
-cx qubits[82],qubits[83];
-cx qubits[81],qubits[88];
-cx qubits[81],qubits[86];
-cx qubits[81],qubits[84];
-cx qubits[81],qubits[82];
-cx qubits[80],qubits[87];
-cx qubits[80],qubits[85];
-cx qubits[80],qubits[83];
-cx qubits[80],qubits[81];
-cx qubits[79],qubits[86];
-cx qubits[79],qubits[84];
-cx qubits[79],qubits[82];
-cx qubits[79],qubits[80];
-cx qubits[78],qubits[85];
-cx qubits[78],qubits[83];
-cx qubits[78],qubits[81];
-cx qubits[78],qubits[79];
-cx qubits[77],qubits[84];
-cx qubits[77],qubits[82];
-cx qubits[77],qubits[80];
-cx qubits[77],qubits[78];
-cx qubits[76],qubits[83];
-cx qubits[76],qubits[81];
-cx qubits[76],qubits[79];
-cx qubits[76],qubits[77];
-cx qubits[75],qubits[82];
-cx qubits[75],qubits[80];
-cx qubits[75],qubits[78];
-cx qubits[75],qubits[76];
-cx qubits[74],qubits[81];
-cx qubits[74],qubits[79];
-cx qubits[74],qubits[77];
-cx qubits[74],qubits[75];
-cx qubits[73],qubits[80];
-cx qubits[73],qubits[78];
-cx qubits[73],qubits[76];
-cx qubits[73],qubits[74];
-cx qubits[72],qubits[79];
-cx qubits[72],qubits[77];
-cx qubits[72],qubits[75];
-cx qubits[72],qubits[73];
-cx qubits[71],qubits[78];
-cx qubits[71],qubits[76];
-cx qubits[71],qubits[74];
-cx qubits[71],qubits[72];
-cx qubits[70],qubits[77];
-cx qubits[70],qubits[75];
-cx qubits[70],qubits[73];
-cx qubits[70],qubits[71];
-cx qubits[69],qubits[76];
-cx qubits[69],qubits[74];
-cx qubits[69],qubits[72];
-cx qubits[69],qubits[70];
-cx qubits[68],qubits[75];
-cx qubits[68],qubits[73];
-cx qubits[68],qubits[71];
-cx qubits[68],qubits[69];
-cx qubits[67],qubits[74];
-cx qubits[67],qubits[72];
-cx qubits[67],qubits[70];
-cx qubits[67],qubits[68];
-cx qubits[66],qubits[73];
-cx qubits[66],qubits[71];
-cx qubits[66],qubits[69];
-cx qubits[66],qubits[67];
-cx qubits[65],qubits[72];
-cx qubits[65],qubits[70];
-cx qubits[65],qubits[68];
-cx qubits[65],qubits[66];
-cx qubits[64],qubits[71];
-cx qubits[64],qubits[69];
-cx qubits[64],qubits[67];
-cx qubits[64],qubits[65];
-h qubits[64];
-h qubits[65];
-h qubits[66];
-h qubits[67];
-h qubits[68];
-h qubits[69];
-h qubits[70];
-h qubits[71];
-h qubits[72];
-h qubits[73];
-h qubits[74];
-h qubits[75];
-h qubits[76];
-h qubits[77];
-h qubits[78];
-h qubits[79];
-h qubits[80];
-h qubits[81];
-h qubits[82];
-h qubits[83];
-h qubits[84];
-h qubits[85];
-h qubits[86];
-h qubits[87];
-h qubits[88];
-h qubits[89];
-h qubits[90];
-h qubits[91];
-h qubits[92];
-h qubits[93];
-h qubits[94];
-h qubits[95];
-h qubits[95];
-ccx qubits[31],qubits[32],qubits[95];
-h qubits[95];
-h qubits[95];
-ccx qubits[30],qubits[33],qubits[95];
-h qubits[95];
-h qubits[95];
-ccx qubits[29],qubits[34],qubits[95];
-h qubits[95];
-h qubits[95];
-ccx qubits[28],qubits[35],qubits[95];
-h qubits[95];
-h qubits[95];
-ccx qubits[27],qubits[36],qubits[95];
-h qubits[95];
-h qubits[95];
-ccx qubits[26],qubits[37],qubits[95];
-h qubits[95];
-h qubits[95];
-ccx qubits[25],qubits[38],qubits[95];
-h qubits[95];
-h qubits[95];
-ccx qubits[24],qubits[39],qubits[95];
-h qubits[95];
-h qubits[95];
-ccx qubits[23],qubits[40],qubits[95];
-h qubits[95];
-h qubits[95];
-ccx qubits[22],qubits[41],qubits[95];
-h qubits[95];
-h qubits[95];
-ccx qubits[21],qubits[42],qubits[95];
-h qubits[95];
-h qubits[95];
-ccx qubits[20],qubits[43],qubits[95];
-h qubits[95];
-h qubits[95];
-ccx qubits[19],qubits[44],qubits[95];
-h qubits[95];
-h qubits[95];
-ccx qubits[18],qubits[45],qubits[95];
-h qubits[95];
-h qubits[95];
-ccx qubits[17],qubits[46],qubits[95];
-h qubits[95];
-h qubits[95];
-ccx qubits[16],qubits[47],qubits[95];
-h qubits[95];
-h qubits[95];
-ccx qubits[15],qubits[48],qubits[95];
-h qubits[95];
-h qubits[95];
-ccx qubits[14],qubits[49],qubits[95];
-h qubits[95];
-h qubits[95];
-ccx qubits[13],qubits[50],qubits[95];
-h qubits[95];
-h qubits[95];
-ccx qubits[12],qubits[51],qubits[95];
-h qubits[95];
-h qubits[95];
-ccx qubits[11],qubits[52],qubits[95];
-h qubits[95];
-h qubits[95];
-ccx qubits[10],qubits[53],qubits[95];
-h qubits[95];
-h qubits[95];
-ccx qubits[9],qubits[54],qubits[95];
-h qubits[95];
-h qubits[95];
-ccx qubits[8],qubits[55],qubits[95];
-h qubits[95];
-h qubits[95];
-ccx qubits[7],qubits[56],qubits[95];
-h qubits[95];
-h qubits[95];
-ccx qubits[6],qubits[57],qubits[95];
-h qubits[95];
-h qubits[95];
-ccx qubits[5],qubits[58],qubits[95];
-h qubits[95];
-h qubits[95];
-ccx qubits[4],qubits[59],qubits[95];
-h qubits[95];
-h qubits[95];
-ccx qubits[3],qubits[60],qubits[95];
-h qubits[95];
-h qubits[95];
-ccx qubits[2],qubits[61],qubits[95];
-h qubits[95];
-h qubits[95];
-ccx qubits[1],qubits[62],qubits[95];
-h qubits[95];
-h qubits[95];
-ccx qubits[0],qubits[63],qubits[95];
-h qubits[95];
-h qubits[94];
-ccx qubits[30],qubits[32],qubits[94];
-h qubits[94];
-h qubits[94];
-ccx qubits[29],qubits[33],qubits[94];
-h qubits[94];
-h qubits[94];
-ccx qubits[28],qubits[34],qubits[94];
-h qubits[94];
-h qubits[94];
-ccx qubits[27],qubits[35],qubits[94];
-h qubits[94];
-h qubits[94];
-ccx qubits[26],qubits[36],qubits[94];
-h qubits[94];
-h qubits[94];
-ccx qubits[25],qubits[37],qubits[94];
-h qubits[94];
-h qubits[94];
-ccx qubits[24],qubits[38],qubits[94];
-h qubits[94];
-h qubits[94];
-ccx qubits[23],qubits[39],qubits[94];
-h qubits[94];
-h qubits[94];
-ccx qubits[22],qubits[40],qubits[94];
-h qubits[94];
-h qubits[94];
-ccx qubits[21],qubits[41],qubits[94];
-h qubits[94];
-h qubits[94];
-ccx qubits[20],qubits[42],qubits[94];
-h qubits[94];
-h qubits[94];
-ccx qubits[19],qubits[43],qubits[94];
-h qubits[94];
-h qubits[94];
-ccx qubits[18],qubits[44],qubits[94];
-h qubits[94];
-h qubits[94];
-ccx qubits[17],qubits[45],qubits[94];
-h qubits[94];
-h qubits[94];
-ccx qubits[16],qubits[46],qubits[94];
-h qubits[94];
-h qubits[94];
-ccx qubits[15],qubits[47],qubits[94];
-h qubits[94];
-h qubits[94];
-ccx qubits[14],qubits[48],qubits[94];
-h qubits[94];
-h qubits[94];
-ccx qubits[13],qubits[49],qubits[94];
-h qubits[94];
-h qubits[94];
-ccx qubits[12],qubits[50],qubits[94];
-h qubits[94];
-h qubits[94];
-ccx qubits[11],qubits[51],qubits[94];
-h qubits[94];
-h qubits[94];
-ccx qubits[10],qubits[52],qubits[94];
-h qubits[94];
-h qubits[94];
-ccx qubits[9],qubits[53],qubits[94];
-h qubits[94];
-h qubits[94];
-ccx qubits[8],qubits[54],qubits[94];
-h qubits[94];
-h qubits[94];
-ccx qubits[7],qubits[55],qubits[94];
-h qubits[94];
-h qubits[94];
-ccx qubits[6],qubits[56],qubits[94];
-h qubits[94];
-h qubits[94];
-ccx qubits[5],qubits[57],qubits[94];
-h qubits[94];
-h qubits[94];
-ccx qubits[4],qubits[58],qubits[94];
-h qubits[94];
-h qubits[94];
-ccx qubits[3],qubits[59],qubits[94];
-h qubits[94];
-h qubits[94];
-ccx qubits[2],qubits[60],qubits[94];
-h qubits[94];
-h qubits[94];
-ccx qubits[1],qubits[61],qubits[94];
-h qubits[94];
-h qubits[94];
-ccx qubits[0],qubits[62],qubits[94];
-h qubits[94];
-h qubits[93];
-ccx qubits[29],qubits[32],qubits[93];
-h qubits[93];
-h qubits[93];
-ccx qubits[28],qubits[33],qubits[93];
-h qubits[93];
-h qubits[93];
-ccx qubits[27],qubits[34],qubits[93];
-h qubits[93];
-h qubits[93];
-ccx qubits[26],qubits[35],qubits[93];
-h qubits[93];
-h qubits[93];
-ccx qubits[25],qubits[36],qubits[93];
-h qubits[93];
-h qubits[93];
-ccx qubits[24],qubits[37],qubits[93];
-h qubits[93];
-h qubits[93];
-ccx qubits[23],qubits[38],qubits[93];
-h qubits[93];
-h qubits[93];
-ccx qubits[22],qubits[39],qubits[93];
-h qubits[93];
-h qubits[93];
-ccx qubits[21],qubits[40],qubits[93];
-h qubits[93];
-h qubits[93];
-ccx qubits[20],qubits[41],qubits[93];
-h qubits[93];
-h qubits[93];
-ccx qubits[19],qubits[42],qubits[93];
-h qubits[93];
-h qubits[93];
-ccx qubits[18],qubits[43],qubits[93];
-h qubits[93];
-h qubits[93];
-ccx qubits[17],qubits[44],qubits[93];
-h qubits[93];
-h qubits[93];
-ccx qubits[16],qubits[45],qubits[93];
-h qubits[93];
-h qubits[93];
-ccx qubits[15],qubits[46],qubits[93];
-h qubits[93];
-h qubits[93];
-ccx qubits[14],qubits[47],qubits[93];
-h qubits[93];
-h qubits[93];
-ccx qubits[13],qubits[48],qubits[93];
-h qubits[93];
-h qubits[93];
-ccx qubits[12],qubits[49],qubits[93];
-h qubits[93];
-h qubits[93];
-ccx qubits[11],qubits[50],qubits[93];
-h qubits[93];
-h qubits[93];
-ccx qubits[10],qubits[51],qubits[93];
-h qubits[93];
-h qubits[93];
-ccx qubits[9],qubits[52],qubits[93];
-h qubits[93];
-h qubits[93];
-ccx qubits[8],qubits[53],qubits[93];
-h qubits[93];
-h qubits[93];
-ccx qubits[7],qubits[54],qubits[93];
-h qubits[93];
-h qubits[93];
-ccx qubits[6],qubits[55],qubits[93];
-h qubits[93];
-h qubits[93];
-ccx qubits[5],qubits[56],qubits[93];
-h qubits[93];
-h qubits[93];
-ccx qubits[4],qubits[57],qubits[93];
-h qubits[93];
-h qubits[93];
-ccx qubits[3],qubits[58],qubits[93];
-h qubits[93];
-h qubits[93];
-ccx qubits[2],qubits[59],qubits[93];
-h qubits[93];
-h qubits[93];
-ccx qubits[1],qubits[60],qubits[93];
-h qubits[93];
-h qubits[93];
-ccx qubits[0],qubits[61],qubits[93];
-h qubits[93];
-h qubits[92];
-ccx qubits[28],qubits[32],qubits[92];
-h qubits[92];
-h qubits[92];
-ccx qubits[27],qubits[33],qubits[92];
-h qubits[92];
-h qubits[92];
-ccx qubits[26],qubits[34],qubits[92];
-h qubits[92];
-h qubits[92];
-ccx qubits[25],qubits[35],qubits[92];
-h qubits[92];
-h qubits[92];
-ccx qubits[24],qubits[36],qubits[92];
-h qubits[92];
-h qubits[92];
-ccx qubits[23],qubits[37],qubits[92];
-h qubits[92];
-h qubits[92];
-ccx qubits[22],qubits[38],qubits[92];
-h qubits[92];
-h qubits[92];
-ccx qubits[21],qubits[39],qubits[92];
-h qubits[92];
-h qubits[92];
-ccx qubits[20],qubits[40],qubits[92];
-h qubits[92];
-h qubits[92];
-ccx qubits[19],qubits[41],qubits[92];
-h qubits[92];
-h qubits[92];
-ccx qubits[18],qubits[42],qubits[92];
-h qubits[92];
-h qubits[92];
-ccx qubits[17],qubits[43],qubits[92];
-h qubits[92];
-h qubits[92];
-ccx qubits[16],qubits[44],qubits[92];
-h qubits[92];
-h qubits[92];
-ccx qubits[15],qubits[45],qubits[92];
-h qubits[92];
-h qubits[92];
-ccx qubits[14],qubits[46],qubits[92];
-h qubits[92];
-h qubits[92];
-ccx qubits[13],qubits[47],qubits[92];
-h qubits[92];
-h qubits[92];
-ccx qubits[12],qubits[48],qubits[92];
-h qubits[92];
-h qubits[92];
-ccx qubits[11],qubits[49],qubits[92];
-h qubits[92];
-h qubits[92];
-ccx qubits[10],qubits[50],qubits[92];
-h qubits[92];
-h qubits[92];
-ccx qubits[9],qubits[51],qubits[92];
-h qubits[92];
-h qubits[92];
-ccx qubits[8],qubits[52],qubits[92];
-h qubits[92];
-h qubits[92];
-ccx qubits[7],qubits[53],qubits[92];
-h qubits[92];
-h qubits[92];
-ccx qubits[6],qubits[54],qubits[92];
-h qubits[92];
-h qubits[92];
-ccx qubits[5],qubits[55],qubits[92];
-h qubits[92];
-h qubits[92];
-ccx qubits[4],qubits[56],qubits[92];
-h qubits[92];
-h qubits[92];
-ccx qubits[3],qubits[57],qubits[92];
-h qubits[92];
-h qubits[92];
-ccx qubits[2],qubits[58],qubits[92];
-h qubits[92];
-h qubits[92];
-ccx qubits[1],qubits[59],qubits[92];
-h qubits[92];
-h qubits[92];
-ccx qubits[0],qubits[60],qubits[92];
-h qubits[92];
-h qubits[91];
-ccx qubits[27],qubits[32],qubits[91];
-h qubits[91];
-h qubits[91];
-ccx qubits[26],qubits[33],qubits[91];
-h qubits[91];
-h qubits[91];
-ccx qubits[25],qubits[34],qubits[91];
-h qubits[91];
-h qubits[91];
-ccx qubits[24],qubits[35],qubits[91];
-h qubits[91];
-h qubits[91];
-ccx qubits[23],qubits[36],qubits[91];
-h qubits[91];
-h qubits[91];
-ccx qubits[22],qubits[37],qubits[91];
-h qubits[91];
-h qubits[91];
-ccx qubits[21],qubits[38],qubits[91];
-h qubits[91];
-h qubits[91];
-ccx qubits[20],qubits[39],qubits[91];
-h qubits[91];
-h qubits[91];
-ccx qubits[19],qubits[40],qubits[91];
-h qubits[91];
-h qubits[91];
-ccx qubits[18],qubits[41],qubits[91];
-h qubits[91];
-h qubits[91];
-ccx qubits[17],qubits[42],qubits[91];
-h qubits[91];
-h qubits[91];
-ccx qubits[16],qubits[43],qubits[91];
-h qubits[91];
-h qubits[91];
-ccx qubits[15],qubits[44],qubits[91];
-h qubits[91];
-h qubits[91];
-ccx qubits[14],qubits[45],qubits[91];
-h qubits[91];
-h qubits[91];
-ccx qubits[13],qubits[46],qubits[91];
-h qubits[91];
-h qubits[91];
-ccx qubits[12],qubits[47],qubits[91];
-h qubits[91];
-h qubits[91];
-ccx qubits[11],qubits[48],qubits[91];
-h qubits[91];
-h qubits[91];
-ccx qubits[10],qubits[49],qubits[91];
-h qubits[91];
-h qubits[91];
-ccx qubits[9],qubits[50],qubits[91];
-h qubits[91];
-h qubits[91];
-ccx qubits[8],qubits[51],qubits[91];
-h qubits[91];
-h qubits[91];
-ccx qubits[7],qubits[52],qubits[91];
-h qubits[91];
-h qubits[91];
-ccx qubits[6],qubits[53],qubits[91];
-h qubits[91];
-h qubits[91];
-ccx qubits[5],qubits[54],qubits[91];
-h qubits[91];
-h qubits[91];
-ccx qubits[4],qubits[55],qubits[91];
-h qubits[91];
-h qubits[91];
-ccx qubits[3],qubits[56],qubits[91];
-h qubits[91];
-h qubits[91];
-ccx qubits[2],qubits[57],qubits[91];
-h qubits[91];
-h qubits[91];
-ccx qubits[1],qubits[58],qubits[91];
-h qubits[91];
-h qubits[91];
-ccx qubits[0],qubits[59],qubits[91];
-h qubits[91];
-h qubits[90];
-ccx qubits[26],qubits[32],qubits[90];
-h qubits[90];
-h qubits[90];
-ccx qubits[25],qubits[33],qubits[90];
-h qubits[90];
-h qubits[90];
-ccx qubits[24],qubits[34],qubits[90];
-h qubits[90];
-h qubits[90];
-ccx qubits[23],qubits[35],qubits[90];
-h qubits[90];
-h qubits[90];
-ccx qubits[22],qubits[36],qubits[90];
-h qubits[90];
-h qubits[90];
-ccx qubits[21],qubits[37],qubits[90];
-h qubits[90];
-h qubits[90];
-ccx qubits[20],qubits[38],qubits[90];
-h qubits[90];
-h qubits[90];
-ccx qubits[19],qubits[39],qubits[90];
-h qubits[90];
-h qubits[90];
-ccx qubits[18],qubits[40],qubits[90];
-h qubits[90];
-h qubits[90];
-ccx qubits[17],qubits[41],qubits[90];
-h qubits[90];
-h qubits[90];
-ccx qubits[16],qubits[42],qubits[90];
-h qubits[90];
-h qubits[90];
-ccx qubits[15],qubits[43],qubits[90];
-h qubits[90];
-h qubits[90];
-ccx qubits[14],qubits[44],qubits[90];
-h qubits[90];
-h qubits[90];
-ccx qubits[13],qubits[45],qubits[90];
-h qubits[90];
-h qubits[90];
-ccx qubits[12],qubits[46],qubits[90];
-h qubits[90];
-h qubits[90];
-ccx qubits[11],qubits[47],qubits[90];
-h qubits[90];
-h qubits[90];
-ccx qubits[10],qubits[48],qubits[90];
-h qubits[90];
-h qubits[90];
-ccx qubits[9],qubits[49],qubits[90];
-h qubits[90];
-h qubits[90];
-ccx qubits[8],qubits[50],qubits[90];
-h qubits[90];
-h qubits[90];
-ccx qubits[7],qubits[51],qubits[90];
-h qubits[90];
-h qubits[90];
-ccx qubits[6],qubits[52],qubits[90];
-h qubits[90];
-h qubits[90];
-ccx qubits[5],qubits[53],qubits[90];
-h qubits[90];
-h qubits[90];
-ccx qubits[4],qubits[54],qubits[90];
-h qubits[90];
-h qubits[90];
-ccx qubits[3],qubits[55],qubits[90];
-h qubits[90];
-h qubits[90];
-ccx qubits[2],qubits[56],qubits[90];
-h qubits[90];
-h qubits[90];
-ccx qubits[1],qubits[57],qubits[90];
-h qubits[90];
-h qubits[90];
-ccx qubits[0],qubits[58],qubits[90];
-h qubits[90];
-h qubits[89];
-ccx qubits[25],qubits[32],qubits[89];
-h qubits[89];
-h qubits[89];
-ccx qubits[24],qubits[33],qubits[89];
-h qubits[89];
-h qubits[89];
-ccx qubits[23],qubits[34],qubits[89];
-h qubits[89];
-h qubits[89];
-ccx qubits[22],qubits[35],qubits[89];
-h qubits[89];
-h qubits[89];
-ccx qubits[21],qubits[36],qubits[89];
-h qubits[89];
-h qubits[89];
-ccx qubits[20],qubits[37],qubits[89];
-h qubits[89];
-h qubits[89];
-ccx qubits[19],qubits[38],qubits[89];
-h qubits[89];
-h qubits[89];
-ccx qubits[18],qubits[39],qubits[89];
-h qubits[89];
-h qubits[89];
-ccx qubits[17],qubits[40],qubits[89];
-h qubits[89];
-h qubits[89];
-ccx qubits[16],qubits[41],qubits[89];
-h qubits[89];
-h qubits[89];
-ccx qubits[15],qubits[42],qubits[89];
-h qubits[89];
-h qubits[89];
-ccx qubits[14],qubits[43],qubits[89];
-h qubits[89];
-h qubits[89];
-ccx qubits[13],qubits[44],qubits[89];
-h qubits[89];
-h qubits[89];
-ccx qubits[12],qubits[45],qubits[89];
-h qubits[89];
-h qubits[89];
-ccx qubits[11],qubits[46],qubits[89];
-h qubits[89];
-h qubits[89];
-ccx qubits[10],qubits[47],qubits[89];
-h qubits[89];
-h qubits[89];
-ccx qubits[9],qubits[48],qubits[89];
-h qubits[89];
-h qubits[89];
-ccx qubits[8],qubits[49],qubits[89];
-h qubits[89];
-h qubits[89];
-ccx qubits[7],qubits[50],qubits[89];
-h qubits[89];
-h qubits[89];
-ccx qubits[6],qubits[51],qubits[89];
-h qubits[89];
-h qubits[89];
-ccx qubits[5],qubits[52],qubits[89];
-h qubits[89];
-h qubits[89];
-ccx qubits[4],qubits[53],qubits[89];
-h qubits[89];
-h qubits[89];
-ccx qubits[3],qubits[54],qubits[89];
-h qubits[89];
-h qubits[89];
-ccx qubits[2],qubits[55],qubits[89];
-h qubits[89];
-h qubits[89];
-ccx qubits[1],qubits[56],qubits[89];
-h qubits[89];
-h qubits[89];
-ccx qubits[0],qubits[57],qubits[89];
-h qubits[89];
-h qubits[88];
-ccx qubits[24],qubits[32],qubits[88];
-h qubits[88];
-h qubits[88];
-ccx qubits[23],qubits[33],qubits[88];
-h qubits[88];
-h qubits[88];
-ccx qubits[22],qubits[34],qubits[88];
-h qubits[88];
-h qubits[88];
-ccx qubits[21],qubits[35],qubits[88];
-h qubits[88];
-h qubits[88];
-ccx qubits[20],qubits[36],qubits[88];
-h qubits[88];
-h qubits[88];
-ccx qubits[19],qubits[37],qubits[88];
-h qubits[88];
-h qubits[88];
-ccx qubits[18],qubits[38],qubits[88];
-h qubits[88];
-h qubits[88];
-ccx qubits[17],qubits[39],qubits[88];
-h qubits[88];
-h qubits[88];
-ccx qubits[16],qubits[40],qubits[88];
-h qubits[88];
-h qubits[88];
-ccx qubits[15],qubits[41],qubits[88];
-h qubits[88];
-h qubits[88];
-ccx qubits[14],qubits[42],qubits[88];
-h qubits[88];
-h qubits[88];
-ccx qubits[13],qubits[43],qubits[88];
-h qubits[88];
-h qubits[88];
-ccx qubits[12],qubits[44],qubits[88];
-h qubits[88];
-h qubits[88];
-ccx qubits[11],qubits[45],qubits[88];
-h qubits[88];
-h qubits[88];
-ccx qubits[10],qubits[46],qubits[88];
-h qubits[88];
-h qubits[88];
-ccx qubits[9],qubits[47],qubits[88];
-h qubits[88];
-h qubits[88];
-ccx qubits[8],qubits[48],qubits[88];
-h qubits[88];
-h qubits[88];
-ccx qubits[7],qubits[49],qubits[88];
-h qubits[88];
-h qubits[88];
-ccx qubits[6],qubits[50],qubits[88];
-h qubits[88];
-h qubits[88];
-ccx qubits[5],qubits[51],qubits[88];
-h qubits[88];
-h qubits[88];
-ccx qubits[4],qubits[52],qubits[88];
-h qubits[88];
-h qubits[88];
-ccx qubits[3],qubits[53],qubits[88];
-h qubits[88];
-h qubits[88];
-ccx qubits[2],qubits[54],qubits[88];
-h qubits[88];
-h qubits[88];
-ccx qubits[1],qubits[55],qubits[88];
-h qubits[88];
-h qubits[88];
-ccx qubits[0],qubits[56],qubits[88];
-h qubits[88];
-h qubits[87];
-ccx qubits[23],qubits[32],qubits[87];
-h qubits[87];
-h qubits[87];
-ccx qubits[22],qubits[33],qubits[87];
-h qubits[87];
-h qubits[87];
-ccx qubits[21],qubits[34],qubits[87];
-h qubits[87];
-h qubits[87];
-ccx qubits[20],qubits[35],qubits[87];
-h qubits[87];
-h qubits[87];
-ccx qubits[19],qubits[36],qubits[87];
-h qubits[87];
-h qubits[87];
-ccx qubits[18],qubits[37],qubits[87];
-h qubits[87];
-h qubits[87];
-ccx qubits[17],qubits[38],qubits[87];
-h qubits[87];
-h qubits[87];
-ccx qubits[16],qubits[39],qubits[87];
-h qubits[87];
-h qubits[87];
-ccx qubits[15],qubits[40],qubits[87];
-h qubits[87];
-h qubits[87];
-ccx qubits[14],qubits[41],qubits[87];
-h qubits[87];
-h qubits[87];
-ccx qubits[13],qubits[42],qubits[87];
-h qubits[87];
-h qubits[87];
-ccx qubits[12],qubits[43],qubits[87];
-h qubits[87];
-h qubits[87];
-ccx qubits[11],qubits[44],qubits[87];
-h qubits[87];
-h qubits[87];
-ccx qubits[10],qubits[45],qubits[87];
-h qubits[87];
-h qubits[87];
-ccx qubits[9],qubits[46],qubits[87];
-h qubits[87];
-h qubits[87];
-ccx qubits[8],qubits[47],qubits[87];
-h qubits[87];
-h qubits[87];
-ccx qubits[7],qubits[48],qubits[87];
-h qubits[87];
-h qubits[87];
-ccx qubits[6],qubits[49],qubits[87];
-h qubits[87];
-h qubits[87];
-ccx qubits[5],qubits[50],qubits[87];
-h qubits[87];
-h qubits[87];
-ccx qubits[4],qubits[51],qubits[87];
-h qubits[87];
-h qubits[87];
-ccx qubits[3],qubits[52],qubits[87];
-h qubits[87];
-h qubits[87];
-ccx qubits[2],qubits[53],qubits[87];
-h qubits[87];
-h qubits[87];
-ccx qubits[1],qubits[54],qubits[87];
-h qubits[87];
-h qubits[87];
-ccx qubits[0],qubits[55],qubits[87];
-h qubits[87];
-h qubits[86];
-ccx qubits[22],qubits[32],qubits[86];
-h qubits[86];
-h qubits[86];
-ccx qubits[21],qubits[33],qubits[86];
-h qubits[86];
-h qubits[86];
-ccx qubits[20],qubits[34],qubits[86];
-h qubits[86];
-h qubits[86];
-ccx qubits[19],qubits[35],qubits[86];
-h qubits[86];
-h qubits[86];
-ccx qubits[18],qubits[36],qubits[86];
-h qubits[86];
-h qubits[86];
-ccx qubits[17],qubits[37],qubits[86];
-h qubits[86];
-h qubits[86];
-ccx qubits[16],qubits[38],qubits[86];
-h qubits[86];
-h qubits[86];
-ccx qubits[15],qubits[39],qubits[86];
-h qubits[86];
-h qubits[86];
-ccx qubits[14],qubits[40],qubits[86];
-h qubits[86];
-h qubits[86];
-ccx qubits[13],qubits[41],qubits[86];
-h qubits[86];
-h qubits[86];
-ccx qubits[12],qubits[42],qubits[86];
-h qubits[86];
-h qubits[86];
-ccx qubits[11],qubits[43],qubits[86];
-h qubits[86];
-h qubits[86];
-ccx qubits[10],qubits[44],qubits[86];
-h qubits[86];
-h qubits[86];
-ccx qubits[9],qubits[45],qubits[86];
-h qubits[86];
-h qubits[86];
-ccx qubits[8],qubits[46],qubits[86];
-h qubits[86];
-h qubits[86];
-ccx qubits[7],qubits[47],qubits[86];
-h qubits[86];
-h qubits[86];
-ccx qubits[6],qubits[48],qubits[86];
-h qubits[86];
-h qubits[86];
-ccx qubits[5],qubits[49],qubits[86];
-h qubits[86];
-h qubits[86];
-ccx qubits[4],qubits[50],qubits[86];
-h qubits[86];
-h qubits[86];
-ccx qubits[3],qubits[51],qubits[86];
-h qubits[86];
-h qubits[86];
-ccx qubits[2],qubits[52],qubits[86];
-h qubits[86];
-h qubits[86];
-ccx qubits[1],qubits[53],qubits[86];
-h qubits[86];
-h qubits[86];
-ccx qubits[0],qubits[54],qubits[86];
-h qubits[86];
-h qubits[85];
-ccx qubits[21],qubits[32],qubits[85];
-h qubits[85];
-h qubits[85];
-ccx qubits[20],qubits[33],qubits[85];
-h qubits[85];
-h qubits[85];
-ccx qubits[19],qubits[34],qubits[85];
-h qubits[85];
-h qubits[85];
-ccx qubits[18],qubits[35],qubits[85];
-h qubits[85];
-h qubits[85];
-ccx qubits[17],qubits[36],qubits[85];
-h qubits[85];
-h qubits[85];
-ccx qubits[16],qubits[37],qubits[85];
-h qubits[85];
-h qubits[85];
-ccx qubits[15],qubits[38],qubits[85];
-h qubits[85];
-h qubits[85];
-ccx qubits[14],qubits[39],qubits[85];
-h qubits[85];
-h qubits[85];
-ccx qubits[13],qubits[40],qubits[85];
-h qubits[85];
-h qubits[85];
-ccx qubits[12],qubits[41],qubits[85];
-h qubits[85];
-h qubits[85];
-ccx qubits[11],qubits[42],qubits[85];
-h qubits[85];
-h qubits[85];
-ccx qubits[10],qubits[43],qubits[85];
-h qubits[85];
-h qubits[85];
-ccx qubits[9],qubits[44],qubits[85];
-h qubits[85];
-h qubits[85];
-ccx qubits[8],qubits[45],qubits[85];
-h qubits[85];
-h qubits[85];
-ccx qubits[7],qubits[46],qubits[85];
-h qubits[85];
-h qubits[85];
-ccx qubits[6],qubits[47],qubits[85];
-h qubits[85];
-h qubits[85];
-ccx qubits[5],qubits[48],qubits[85];
-h qubits[85];
-h qubits[85];
-ccx qubits[4],qubits[49],qubits[85];
-h qubits[85];
-h qubits[85];
-ccx qubits[3],qubits[50],qubits[85];
-h qubits[85];
-h qubits[85];
-ccx qubits[2],qubits[51],qubits[85];
-h qubits[85];
-h qubits[85];
-ccx qubits[1],qubits[52],qubits[85];
-h qubits[85];
-h qubits[85];
-ccx qubits[0],qubits[53],qubits[85];
-h qubits[85];
-h qubits[84];
-ccx qubits[20],qubits[32],qubits[84];
-h qubits[84];
-h qubits[84];
-ccx qubits[19],qubits[33],qubits[84];
-h qubits[84];
-h qubits[84];
-ccx qubits[18],qubits[34],qubits[84];
-h qubits[84];
-h qubits[84];
-ccx qubits[17],qubits[35],qubits[84];
-h qubits[84];
-h qubits[84];
-ccx qubits[16],qubits[36],qubits[84];
-h qubits[84];
-h qubits[84];
-ccx qubits[15],qubits[37],qubits[84];
-h qubits[84];
-h qubits[84];
-ccx qubits[14],qubits[38],qubits[84];
-h qubits[84];
-h qubits[84];
-ccx qubits[13],qubits[39],qubits[84];
-h qubits[84];
-h qubits[84];
-ccx qubits[12],qubits[40],qubits[84];
-h qubits[84];
-h qubits[84];
-ccx qubits[11],qubits[41],qubits[84];
-h qubits[84];
-h qubits[84];
-ccx qubits[10],qubits[42],qubits[84];
-h qubits[84];
-h qubits[84];
-ccx qubits[9],qubits[43],qubits[84];
-h qubits[84];
-h qubits[84];
-ccx qubits[8],qubits[44],qubits[84];
-h qubits[84];
-h qubits[84];
-ccx qubits[7],qubits[45],qubits[84];
-h qubits[84];
-h qubits[84];
-ccx qubits[6],qubits[46],qubits[84];
-h qubits[84];
-h qubits[84];
-ccx qubits[5],qubits[47],qubits[84];
-h qubits[84];
-h qubits[84];
-ccx qubits[4],qubits[48],qubits[84];
-h qubits[84];
-h qubits[84];
-ccx qubits[3],qubits[49],qubits[84];
-h qubits[84];
-h qubits[84];
-ccx qubits[2],qubits[50],qubits[84];
-h qubits[84];
-h qubits[84];
-ccx qubits[1],qubits[51],qubits[84];
-h qubits[84];
-h qubits[84];
-ccx qubits[0],qubits[52],qubits[84];
-h qubits[84];
-h qubits[83];
-ccx qubits[19],qubits[32],qubits[83];
-h qubits[83];
-h qubits[83];
-ccx qubits[18],qubits[33],qubits[83];
-h qubits[83];
-h qubits[83];
-ccx qubits[17],qubits[34],qubits[83];
-h qubits[83];
-h qubits[83];
-ccx qubits[16],qubits[35],qubits[83];
-h qubits[83];
-h qubits[83];
-ccx qubits[15],qubits[36],qubits[83];
-h qubits[83];
-h qubits[83];
-ccx qubits[14],qubits[37],qubits[83];
-h qubits[83];
-h qubits[83];
-ccx qubits[13],qubits[38],qubits[83];
-h qubits[83];
-h qubits[83];
-ccx qubits[12],qubits[39],qubits[83];
-h qubits[83];
-h qubits[83];
-ccx qubits[11],qubits[40],qubits[83];
-h qubits[83];
-h qubits[83];
-ccx qubits[10],qubits[41],qubits[83];
-h qubits[83];
-h qubits[83];
-ccx qubits[9],qubits[42],qubits[83];
-h qubits[83];
-h qubits[83];
-ccx qubits[8],qubits[43],qubits[83];
-h qubits[83];
-h qubits[83];
-ccx qubits[7],qubits[44],qubits[83];
-h qubits[83];
-h qubits[83];
-ccx qubits[6],qubits[45],qubits[83];
-h qubits[83];
-h qubits[83];
-ccx qubits[5],qubits[46],qubits[83];
-h qubits[83];
-h qubits[83];
-ccx qubits[4],qubits[47],qubits[83];
-h qubits[83];
-h qubits[83];
-ccx qubits[3],qubits[48],qubits[83];
-h qubits[83];
-h qubits[83];
-ccx qubits[2],qubits[49],qubits[83];
-h qubits[83];
-h qubits[83];
-ccx qubits[1],qubits[50],qubits[83];
-h qubits[83];
-h qubits[83];
-ccx qubits[0],qubits[51],qubits[83];
-h qubits[83];
-h qubits[82];
-ccx qubits[18],qubits[32],qubits[82];
-h qubits[82];
-h qubits[82];
-ccx qubits[17],qubits[33],qubits[82];
-h qubits[82];
-h qubits[82];
-ccx qubits[16],qubits[34],qubits[82];
-h qubits[82];
-h qubits[82];
-ccx qubits[15],qubits[35],qubits[82];
-h qubits[82];
-h qubits[82];
-ccx qubits[14],qubits[36],qubits[82];
-h qubits[82];
-h qubits[82];
-ccx qubits[13],qubits[37],qubits[82];
-h qubits[82];
-h qubits[82];
-ccx qubits[12],qubits[38],qubits[82];
-h qubits[82];
-h qubits[82];
-ccx qubits[11],qubits[39],qubits[82];
-h qubits[82];
-h qubits[82];
-ccx qubits[10],qubits[40],qubits[82];
-h qubits[82];
-h qubits[82];
-ccx qubits[9],qubits[41],qubits[82];
-h qubits[82];
-h qubits[82];
-ccx qubits[8],qubits[42],qubits[82];
-h qubits[82];
-h qubits[82];
-ccx qubits[7],qubits[43],qubits[82];
-h qubits[82];
-h qubits[82];
-ccx qubits[6],qubits[44],qubits[82];
-h qubits[82];
-h qubits[82];
-ccx qubits[5],qubits[45],qubits[82];
-h qubits[82];
-h qubits[82];
-ccx qubits[4],qubits[46],qubits[82];
-h qubits[82];
-h qubits[82];
-ccx qubits[3],qubits[47],qubits[82];
-h qubits[82];
-h qubits[82];
-ccx qubits[2],qubits[48],qubits[82];
-h qubits[82];
-h qubits[82];
-ccx qubits[1],qubits[49],qubits[82];
-h qubits[82];
-h qubits[82];
-ccx qubits[0],qubits[50],qubits[82];
-h qubits[82];
-h qubits[81];
-ccx qubits[17],qubits[32],qubits[81];
-h qubits[81];
-h qubits[81];
-ccx qubits[16],qubits[33],qubits[81];
-h qubits[81];
-h qubits[81];
-ccx qubits[15],qubits[34],qubits[81];
-h qubits[81];
-h qubits[81];
-ccx qubits[14],qubits[35],qubits[81];
-h qubits[81];
-h qubits[81];
-ccx qubits[13],qubits[36],qubits[81];
-h qubits[81];
-h qubits[81];
-ccx qubits[12],qubits[37],qubits[81];
-h qubits[81];
-h qubits[81];
-ccx qubits[11],qubits[38],qubits[81];
-h qubits[81];
-h qubits[81];
-ccx qubits[10],qubits[39],qubits[81];
-h qubits[81];
-h qubits[81];
-ccx qubits[9],qubits[40],qubits[81];
-h qubits[81];
-h qubits[81];
-ccx qubits[8],qubits[41],qubits[81];
-h qubits[81];
-h qubits[81];
-ccx qubits[7],qubits[42],qubits[81];
-h qubits[81];
-h qubits[81];
-ccx qubits[6],qubits[43],qubits[81];
-h qubits[81];
-h qubits[81];
-ccx qubits[5],qubits[44],qubits[81];
-h qubits[81];
-h qubits[81];
-ccx qubits[4],qubits[45],qubits[81];
-h qubits[81];
-h qubits[81];
-ccx qubits[3],qubits[46],qubits[81];
-h qubits[81];
-h qubits[81];
-ccx qubits[2],qubits[47],qubits[81];
-h qubits[81];
-h qubits[81];
-ccx qubits[1],qubits[48],qubits[81];
-h qubits[81];
-h qubits[81];
-ccx qubits[0],qubits[49],qubits[81];
-h qubits[81];
-h qubits[80];
-ccx qubits[16],qubits[32],qubits[80];
-h qubits[80];
-h qubits[80];
-ccx qubits[15],qubits[33],qubits[80];
-h qubits[80];
-h qubits[80];
-ccx qubits[14],qubits[34],qubits[80];
-h qubits[80];
-h qubits[80];
-ccx qubits[13],qubits[35],qubits[80];
-h qubits[80];
-h qubits[80];
-ccx qubits[12],qubits[36],qubits[80];
-h qubits[80];
-h qubits[80];
-ccx qubits[11],qubits[37],qubits[80];
-h qubits[80];
-h qubits[80];
-ccx qubits[10],qubits[38],qubits[80];
-h qubits[80];
-h qubits[80];
-ccx qubits[9],qubits[39],qubits[80];
-h qubits[80];
-h qubits[80];
-ccx qubits[8],qubits[40],qubits[80];
-h qubits[80];
-h qubits[80];
-ccx qubits[7],qubits[41],qubits[80];
-h qubits[80];
-h qubits[80];
-ccx qubits[6],qubits[42],qubits[80];
-h qubits[80];
-h qubits[80];
-ccx qubits[5],qubits[43],qubits[80];
-h qubits[80];
-h qubits[80];
-ccx qubits[4],qubits[44],qubits[80];
-h qubits[80];
-h qubits[80];
-ccx qubits[3],qubits[45],qubits[80];
-h qubits[80];
-h qubits[80];
-ccx qubits[2],qubits[46],qubits[80];
-h qubits[80];
-h qubits[80];
-ccx qubits[1],qubits[47],qubits[80];
-h qubits[80];
-h qubits[80];
-ccx qubits[0],qubits[48],qubits[80];
-h qubits[80];
-h qubits[79];
-ccx qubits[15],qubits[32],qubits[79];
-h qubits[79];
-h qubits[79];
-ccx qubits[14],qubits[33],qubits[79];
-h qubits[79];
-h qubits[79];
-ccx qubits[13],qubits[34],qubits[79];
-h qubits[79];
-h qubits[79];
-ccx qubits[12],qubits[35],qubits[79];
-h qubits[79];
-h qubits[79];
-ccx qubits[11],qubits[36],qubits[79];
-h qubits[79];
-h qubits[79];
-ccx qubits[10],qubits[37],qubits[79];
-h qubits[79];
-h qubits[79];
-ccx qubits[9],qubits[38],qubits[79];
-h qubits[79];
-h qubits[79];
-ccx qubits[8],qubits[39],qubits[79];
-h qubits[79];
-h qubits[79];
-ccx qubits[7],qubits[40],qubits[79];
-h qubits[79];
-h qubits[79];
-ccx qubits[6],qubits[41],qubits[79];
-h qubits[79];
-h qubits[79];
-ccx qubits[5],qubits[42],qubits[79];
-h qubits[79];
-h qubits[79];
-ccx qubits[4],qubits[43],qubits[79];
-h qubits[79];
-h qubits[79];
-ccx qubits[3],qubits[44],qubits[79];
-h qubits[79];
-h qubits[79];
-ccx qubits[2],qubits[45],qubits[79];
-h qubits[79];
-h qubits[79];
-ccx qubits[1],qubits[46],qubits[79];
-h qubits[79];
-h qubits[79];
-ccx qubits[0],qubits[47],qubits[79];
-h qubits[79];
-h qubits[78];
-ccx qubits[14],qubits[32],qubits[78];
-h qubits[78];
-h qubits[78];
-ccx qubits[13],qubits[33],qubits[78];
-h qubits[78];
-h qubits[78];
-ccx qubits[12],qubits[34],qubits[78];
-h qubits[78];
-h qubits[78];
-ccx qubits[11],qubits[35],qubits[78];
-h qubits[78];
-h qubits[78];
-ccx qubits[10],qubits[36],qubits[78];
-h qubits[78];
-h qubits[78];
-ccx qubits[9],qubits[37],qubits[78];
-h qubits[78];
-h qubits[78];
-ccx qubits[8],qubits[38],qubits[78];
-h qubits[78];
-h qubits[78];
-ccx qubits[7],qubits[39],qubits[78];
-h qubits[78];
-h qubits[78];
-ccx qubits[6],qubits[40],qubits[78];
-h qubits[78];
-h qubits[78];
-ccx qubits[5],qubits[41],qubits[78];
-h qubits[78];
-h qubits[78];
-ccx qubits[4],qubits[42],qubits[78];
-h qubits[78];
-h qubits[78];
-ccx qubits[3],qubits[43],qubits[78];
-h qubits[78];
-h qubits[78];
-ccx qubits[2],qubits[44],qubits[78];
-h qubits[78];
-h qubits[78];
-ccx qubits[1],qubits[45],qubits[78];
-h qubits[78];
-h qubits[78];
-ccx qubits[0],qubits[46],qubits[78];
-h qubits[78];
-h qubits[77];
-ccx qubits[13],qubits[32],qubits[77];
-h qubits[77];
-h qubits[77];
-ccx qubits[12],qubits[33],qubits[77];
-h qubits[77];
-h qubits[77];
-ccx qubits[11],qubits[34],qubits[77];
-h qubits[77];
-h qubits[77];
-ccx qubits[10],qubits[35],qubits[77];
-h qubits[77];
-h qubits[77];
-ccx qubits[9],qubits[36],qubits[77];
-h qubits[77];
-h qubits[77];
-ccx qubits[8],qubits[37],qubits[77];
-h qubits[77];
-h qubits[77];
-ccx qubits[7],qubits[38],qubits[77];
-h qubits[77];
-h qubits[77];
-ccx qubits[6],qubits[39],qubits[77];
-h qubits[77];
-h qubits[77];
-ccx qubits[5],qubits[40],qubits[77];
-h qubits[77];
-h qubits[77];
-ccx qubits[4],qubits[41],qubits[77];
-h qubits[77];
-h qubits[77];
-ccx qubits[3],qubits[42],qubits[77];
-h qubits[77];
-h qubits[77];
-ccx qubits[2],qubits[43],qubits[77];
-h qubits[77];
-h qubits[77];
-ccx qubits[1],qubits[44],qubits[77];
-h qubits[77];
-h qubits[77];
-ccx qubits[0],qubits[45],qubits[77];
-h qubits[77];
-h qubits[76];
-ccx qubits[12],qubits[32],qubits[76];
-h qubits[76];
-h qubits[76];
-ccx qubits[11],qubits[33],qubits[76];
-h qubits[76];
-h qubits[76];
-ccx qubits[10],qubits[34],qubits[76];
-h qubits[76];
-h qubits[76];
-ccx qubits[9],qubits[35],qubits[76];
-h qubits[76];
-h qubits[76];
-ccx qubits[8],qubits[36],qubits[76];
-h qubits[76];
-h qubits[76];
-ccx qubits[7],qubits[37],qubits[76];
-h qubits[76];
-h qubits[76];
-ccx qubits[6],qubits[38],qubits[76];
-h qubits[76];
-h qubits[76];
-ccx qubits[5],qubits[39],qubits[76];
-h qubits[76];
-h qubits[76];
-ccx qubits[4],qubits[40],qubits[76];
-h qubits[76];
-h qubits[76];
-ccx qubits[3],qubits[41],qubits[76];
-h qubits[76];
-h qubits[76];
-ccx qubits[2],qubits[42],qubits[76];
-h qubits[76];
-h qubits[76];
-ccx qubits[1],qubits[43],qubits[76];
-h qubits[76];
-h qubits[76];
-ccx qubits[0],qubits[44],qubits[76];
-h qubits[76];
-h qubits[75];
-ccx qubits[11],qubits[32],qubits[75];
-h qubits[75];
-h qubits[75];
-ccx qubits[10],qubits[33],qubits[75];
-h qubits[75];
-h qubits[75];
-ccx qubits[9],qubits[34],qubits[75];
-h qubits[75];
-h qubits[75];
-ccx qubits[8],qubits[35],qubits[75];
-h qubits[75];
-h qubits[75];
-ccx qubits[7],qubits[36],qubits[75];
-h qubits[75];
-h qubits[75];
-ccx qubits[6],qubits[37],qubits[75];
-h qubits[75];
-h qubits[75];
-ccx qubits[5],qubits[38],qubits[75];
-h qubits[75];
-h qubits[75];
-ccx qubits[4],qubits[39],qubits[75];
-h qubits[75];
-h qubits[75];
-ccx qubits[3],qubits[40],qubits[75];
-h qubits[75];
-h qubits[75];
-ccx qubits[2],qubits[41],qubits[75];
-h qubits[75];
-h qubits[75];
-ccx qubits[1],qubits[42],qubits[75];
-h qubits[75];
-h qubits[75];
-ccx qubits[0],qubits[43],qubits[75];
-h qubits[75];
-h qubits[74];
-ccx qubits[10],qubits[32],qubits[74];
-h qubits[74];
-h qubits[74];
-ccx qubits[9],qubits[33],qubits[74];
-h qubits[74];
-h qubits[74];
-ccx qubits[8],qubits[34],qubits[74];
-h qubits[74];
-h qubits[74];
-ccx qubits[7],qubits[35],qubits[74];
-h qubits[74];
-h qubits[74];
-ccx qubits[6],qubits[36],qubits[74];
-h qubits[74];
-h qubits[74];
-ccx qubits[5],qubits[37],qubits[74];
-h qubits[74];
-h qubits[74];
-ccx qubits[4],qubits[38],qubits[74];
-h qubits[74];
-h qubits[74];
-ccx qubits[3],qubits[39],qubits[74];
-h qubits[74];
-h qubits[74];
-ccx qubits[2],qubits[40],qubits[74];
-h qubits[74];
-h qubits[74];
-ccx qubits[1],qubits[41],qubits[74];
-h qubits[74];
-h qubits[74];
-ccx qubits[0],qubits[42],qubits[74];
-h qubits[74];
-h qubits[73];
-ccx qubits[9],qubits[32],qubits[73];
-h qubits[73];
-h qubits[73];
-ccx qubits[8],qubits[33],qubits[73];
-h qubits[73];
-h qubits[73];
-ccx qubits[7],qubits[34],qubits[73];
-h qubits[73];
-h qubits[73];
-ccx qubits[6],qubits[35],qubits[73];
-h qubits[73];
-h qubits[73];
-ccx qubits[5],qubits[36],qubits[73];
-h qubits[73];
-h qubits[73];
-ccx qubits[4],qubits[37],qubits[73];
-h qubits[73];
-h qubits[73];
-ccx qubits[3],qubits[38],qubits[73];
-h qubits[73];
-h qubits[73];
-ccx qubits[2],qubits[39],qubits[73];
-h qubits[73];
-h qubits[73];
-ccx qubits[1],qubits[40],qubits[73];
-h qubits[73];
-h qubits[73];
-ccx qubits[0],qubits[41],qubits[73];
-h qubits[73];
-h qubits[72];
-ccx qubits[8],qubits[32],qubits[72];
-h qubits[72];
-h qubits[72];
-ccx qubits[7],qubits[33],qubits[72];
-h qubits[72];
-h qubits[72];
-ccx qubits[6],qubits[34],qubits[72];
-h qubits[72];
-h qubits[72];
-ccx qubits[5],qubits[35],qubits[72];
-h qubits[72];
-h qubits[72];
-ccx qubits[4],qubits[36],qubits[72];
-h qubits[72];
-h qubits[72];
-ccx qubits[3],qubits[37],qubits[72];
-h qubits[72];
-h qubits[72];
-ccx qubits[2],qubits[38],qubits[72];
-h qubits[72];
-h qubits[72];
-ccx qubits[1],qubits[39],qubits[72];
-h qubits[72];
-h qubits[72];
-ccx qubits[0],qubits[40],qubits[72];
-h qubits[72];
-h qubits[71];
-ccx qubits[7],qubits[32],qubits[71];
-h qubits[71];
-h qubits[71];
-ccx qubits[6],qubits[33],qubits[71];
-h qubits[71];
-h qubits[71];
-ccx qubits[5],qubits[34],qubits[71];
-h qubits[71];
-h qubits[71];
-ccx qubits[4],qubits[35],qubits[71];
-h qubits[71];
-h qubits[71];
-ccx qubits[3],qubits[36],qubits[71];
-h qubits[71];
-h qubits[71];
-ccx qubits[2],qubits[37],qubits[71];
-h qubits[71];
-h qubits[71];
-ccx qubits[1],qubits[38],qubits[71];
-h qubits[71];
-h qubits[71];
-ccx qubits[0],qubits[39],qubits[71];
-h qubits[71];
-h qubits[70];
-ccx qubits[6],qubits[32],qubits[70];
-h qubits[70];
-h qubits[70];
-ccx qubits[5],qubits[33],qubits[70];
-h qubits[70];
-h qubits[70];
-ccx qubits[4],qubits[34],qubits[70];
-h qubits[70];
-h qubits[70];
-ccx qubits[3],qubits[35],qubits[70];
-h qubits[70];
-h qubits[70];
-ccx qubits[2],qubits[36],qubits[70];
-h qubits[70];
-h qubits[70];
-ccx qubits[1],qubits[37],qubits[70];
-h qubits[70];
-h qubits[70];
-ccx qubits[0],qubits[38],qubits[70];
-h qubits[70];
-h qubits[69];
-ccx qubits[5],qubits[32],qubits[69];
-h qubits[69];
-h qubits[69];
-ccx qubits[4],qubits[33],qubits[69];
-h qubits[69];
-h qubits[69];
-ccx qubits[3],qubits[34],qubits[69];
-h qubits[69];
-h qubits[69];
-ccx qubits[2],qubits[35],qubits[69];
-h qubits[69];
-h qubits[69];
-ccx qubits[1],qubits[36],qubits[69];
-h qubits[69];
-h qubits[69];
-ccx qubits[0],qubits[37],qubits[69];
-h qubits[69];
-h qubits[68];
-ccx qubits[4],qubits[32],qubits[68];
-h qubits[68];
-h qubits[68];
-ccx qubits[3],qubits[33],qubits[68];
-h qubits[68];
-h qubits[68];
-ccx qubits[2],qubits[34],qubits[68];
-h qubits[68];
-h qubits[68];
-ccx qubits[1],qubits[35],qubits[68];
-h qubits[68];
-h qubits[68];
-ccx qubits[0],qubits[36],qubits[68];
-h qubits[68];
-h qubits[67];
-ccx qubits[3],qubits[32],qubits[67];
-h qubits[67];
-h qubits[67];
-ccx qubits[2],qubits[33],qubits[67];
-h qubits[67];
-h qubits[67];
-ccx qubits[1],qubits[34],qubits[67];
-h qubits[67];
-h qubits[67];
-ccx qubits[0],qubits[35],qubits[67];
-h qubits[67];
-h qubits[66];
-ccx qubits[2],qubits[32],qubits[66];
-h qubits[66];
-h qubits[66];
-ccx qubits[1],qubits[33],qubits[66];
-h qubits[66];
-h qubits[66];
-ccx qubits[0],qubits[34],qubits[66];
-h qubits[66];
-h qubits[65];
-ccx qubits[1],qubits[32],qubits[65];
-h qubits[65];
-h qubits[65];
-ccx qubits[0],qubits[33],qubits[65];
-h qubits[65];
-h qubits[64];
-ccx qubits[0],qubits[32],qubits[64];
-h qubits[64];
-h qubits[64];
-h qubits[65];
-h qubits[66];
-h qubits[67];
-h qubits[68];
-h qubits[69];
-h qubits[70];
-h qubits[71];
-h qubits[72];
-h qubits[73];
-h qubits[74];
-h qubits[75];
-h qubits[76];
-h qubits[77];
-h qubits[78];
-h qubits[79];
-h qubits[80];
-h qubits[81];
-h qubits[82];
-h qubits[83];
-h qubits[84];
-h qubits[85];
-h qubits[86];
-h qubits[87];
-h qubits[88];
-h qubits[89];
-h qubits[90];
-h qubits[91];
-h qubits[92];
-h qubits[93];
-h qubits[94];
-h qubits[95];
@@ -1,12734 +0,0 @@
-OPENQASM 2.0;
-include "qelib1.inc";
-qreg qubits[192];
-h qubits[128];
-h qubits[129];
-h qubits[130];
-h qubits[131];
-h qubits[132];
-h qubits[133];
-h qubits[134];
-h qubits[135];
-h qubits[136];
-h qubits[137];
-h qubits[138];
-h qubits[139];
-h qubits[140];
-h qubits[141];
-h qubits[142];
-h qubits[143];
-h qubits[144];
-h qubits[145];
-h qubits[146];
-h qubits[147];
-h qubits[148];
-h qubits[149];
-h qubits[150];
-h qubits[151];
-h qubits[152];
-h qubits[153];
-h qubits[154];
-h qubits[155];
-h qubits[156];
-h qubits[157];
-h qubits[158];
-h qubits[159];
-h qubits[160];
-h qubits[161];
-h qubits[162];
-h qubits[163];
-h qubits[164];
-h qubits[165];
-h qubits[166];
-h qubits[167];
-h qubits[168];
-h qubits[169];
-h qubits[170];
-h qubits[171];
-h qubits[172];
-h qubits[173];
-h qubits[174];
-h qubits[175];
-h qubits[176];
-h qubits[177];
-h qubits[178];
-h qubits[179];
-h qubits[180];
-h qubits[181];
-h qubits[182];
-h qubits[183];
-h qubits[184];
-h qubits[185];
-h qubits[186];
-h qubits[187];
-h qubits[188];
-h qubits[189];
-h qubits[190];
-h qubits[128];
-ccx qubits[63],qubits[65],qubits[128];
-h qubits[128];
-h qubits[128];
-ccx qubits[62],qubits[66],qubits[128];
-h qubits[128];
-h qubits[128];
-ccx qubits[61],qubits[67],qubits[128];
-h qubits[128];
-h qubits[128];
-ccx qubits[60],qubits[68],qubits[128];
-h qubits[128];
-h qubits[128];
-ccx qubits[59],qubits[69],qubits[128];
-h qubits[128];
-h qubits[128];
-ccx qubits[58],qubits[70],qubits[128];
-h qubits[128];
-h qubits[128];
-ccx qubits[57],qubits[71],qubits[128];
-h qubits[128];
-h qubits[128];
-ccx qubits[56],qubits[72],qubits[128];
-h qubits[128];
-h qubits[128];
-ccx qubits[55],qubits[73],qubits[128];
-h qubits[128];
-h qubits[128];
-ccx qubits[54],qubits[74],qubits[128];
-h qubits[128];
-h qubits[128];
-ccx qubits[53],qubits[75],qubits[128];
-h qubits[128];
-h qubits[128];
-ccx qubits[52],qubits[76],qubits[128];
-h qubits[128];
-h qubits[128];
-ccx qubits[51],qubits[77],qubits[128];
-h qubits[128];
-h qubits[128];
-ccx qubits[50],qubits[78],qubits[128];
-h qubits[128];
-h qubits[128];
-ccx qubits[49],qubits[79],qubits[128];
-h qubits[128];
-h qubits[128];
-ccx qubits[48],qubits[80],qubits[128];
-h qubits[128];
-h qubits[128];
-ccx qubits[47],qubits[81],qubits[128];
-h qubits[128];
-h qubits[128];
-ccx qubits[46],qubits[82],qubits[128];
-h qubits[128];
-h qubits[128];
-ccx qubits[45],qubits[83],qubits[128];
-h qubits[128];
-h qubits[128];
-ccx qubits[44],qubits[84],qubits[128];
-h qubits[128];
-h qubits[128];
-ccx qubits[43],qubits[85],qubits[128];
-h qubits[128];
-h qubits[128];
-ccx qubits[42],qubits[86],qubits[128];
-h qubits[128];
-h qubits[128];
-ccx qubits[41],qubits[87],qubits[128];
-h qubits[128];
-h qubits[128];
-ccx qubits[40],qubits[88],qubits[128];
-h qubits[128];
-h qubits[128];
-ccx qubits[39],qubits[89],qubits[128];
-h qubits[128];
-h qubits[128];
-ccx qubits[38],qubits[90],qubits[128];
-h qubits[128];
-h qubits[128];
-ccx qubits[37],qubits[91],qubits[128];
-h qubits[128];
-h qubits[128];
-ccx qubits[36],qubits[92],qubits[128];
-h qubits[128];
-h qubits[128];
-ccx qubits[35],qubits[93],qubits[128];
-h qubits[128];
-h qubits[128];
-ccx qubits[34],qubits[94],qubits[128];
-h qubits[128];
-h qubits[128];
-ccx qubits[33],qubits[95],qubits[128];
-h qubits[128];
-h qubits[128];
-ccx qubits[32],qubits[96],qubits[128];
-h qubits[128];
-h qubits[128];
-ccx qubits[31],qubits[97],qubits[128];
-h qubits[128];
-h qubits[128];
-ccx qubits[30],qubits[98],qubits[128];
-h qubits[128];
-h qubits[128];
-ccx qubits[29],qubits[99],qubits[128];
-h qubits[128];
-h qubits[128];
-ccx qubits[28],qubits[100],qubits[128];
-h qubits[128];
-h qubits[128];
-ccx qubits[27],qubits[101],qubits[128];
-h qubits[128];
-h qubits[128];
-ccx qubits[26],qubits[102],qubits[128];
-h qubits[128];
-h qubits[128];
-ccx qubits[25],qubits[103],qubits[128];
-h qubits[128];
-h qubits[128];
-ccx qubits[24],qubits[104],qubits[128];
-h qubits[128];
-h qubits[128];
-ccx qubits[23],qubits[105],qubits[128];
-h qubits[128];
-h qubits[128];
-ccx qubits[22],qubits[106],qubits[128];
-h qubits[128];
-h qubits[128];
-ccx qubits[21],qubits[107],qubits[128];
-h qubits[128];
-h qubits[128];
-ccx qubits[20],qubits[108],qubits[128];
-h qubits[128];
-h qubits[128];
-ccx qubits[19],qubits[109],qubits[128];
-h qubits[128];
-h qubits[128];
-ccx qubits[18],qubits[110],qubits[128];
-h qubits[128];
-h qubits[128];
-ccx qubits[17],qubits[111],qubits[128];
-h qubits[128];
-h qubits[128];
-ccx qubits[16],qubits[112],qubits[128];
-h qubits[128];
-h qubits[128];
-ccx qubits[15],qubits[113],qubits[128];
-h qubits[128];
-h qubits[128];
-ccx qubits[14],qubits[114],qubits[128];
-h qubits[128];
-h qubits[128];
-ccx qubits[13],qubits[115],qubits[128];
-h qubits[128];
-h qubits[128];
-ccx qubits[12],qubits[116],qubits[128];
-h qubits[128];
-h qubits[128];
-ccx qubits[11],qubits[117],qubits[128];
-h qubits[128];
-h qubits[128];
-ccx qubits[10],qubits[118],qubits[128];
-h qubits[128];
-h qubits[128];
-ccx qubits[9],qubits[119],qubits[128];
-h qubits[128];
-h qubits[128];
-ccx qubits[8],qubits[120],qubits[128];
-h qubits[128];
-h qubits[128];
-ccx qubits[7],qubits[121],qubits[128];
-h qubits[128];
-h qubits[128];
-ccx qubits[6],qubits[122],qubits[128];
-h qubits[128];
-h qubits[128];
-ccx qubits[5],qubits[123],qubits[128];
-h qubits[128];
-h qubits[128];
-ccx qubits[4],qubits[124],qubits[128];
-h qubits[128];
-h qubits[128];
-ccx qubits[3],qubits[125],qubits[128];
-h qubits[128];
-h qubits[128];
-ccx qubits[2],qubits[126],qubits[128];
-h qubits[128];
-h qubits[128];
-ccx qubits[1],qubits[127],qubits[128];
-h qubits[128];
-h qubits[129];
-ccx qubits[63],qubits[66],qubits[129];
-h qubits[129];
-h qubits[129];
-ccx qubits[62],qubits[67],qubits[129];
-h qubits[129];
-h qubits[129];
-ccx qubits[61],qubits[68],qubits[129];
-h qubits[129];
-h qubits[129];
-ccx qubits[60],qubits[69],qubits[129];
-h qubits[129];
-h qubits[129];
-ccx qubits[59],qubits[70],qubits[129];
-h qubits[129];
-h qubits[129];
-ccx qubits[58],qubits[71],qubits[129];
-h qubits[129];
-h qubits[129];
-ccx qubits[57],qubits[72],qubits[129];
-h qubits[129];
-h qubits[129];
-ccx qubits[56],qubits[73],qubits[129];
-h qubits[129];
-h qubits[129];
-ccx qubits[55],qubits[74],qubits[129];
-h qubits[129];
-h qubits[129];
-ccx qubits[54],qubits[75],qubits[129];
-h qubits[129];
-h qubits[129];
-ccx qubits[53],qubits[76],qubits[129];
-h qubits[129];
-h qubits[129];
-ccx qubits[52],qubits[77],qubits[129];
-h qubits[129];
-h qubits[129];
-ccx qubits[51],qubits[78],qubits[129];
-h qubits[129];
-h qubits[129];
-ccx qubits[50],qubits[79],qubits[129];
-h qubits[129];
-h qubits[129];
-ccx qubits[49],qubits[80],qubits[129];
-h qubits[129];
-h qubits[129];
-ccx qubits[48],qubits[81],qubits[129];
-h qubits[129];
-h qubits[129];
-ccx qubits[47],qubits[82],qubits[129];
-h qubits[129];
-h qubits[129];
-ccx qubits[46],qubits[83],qubits[129];
-h qubits[129];
-h qubits[129];
-ccx qubits[45],qubits[84],qubits[129];
-h qubits[129];
-h qubits[129];
-ccx qubits[44],qubits[85],qubits[129];
-h qubits[129];
-h qubits[129];
-ccx qubits[43],qubits[86],qubits[129];
-h qubits[129];
-h qubits[129];
-ccx qubits[42],qubits[87],qubits[129];
-h qubits[129];
-h qubits[129];
-ccx qubits[41],qubits[88],qubits[129];
-h qubits[129];
-h qubits[129];
-ccx qubits[40],qubits[89],qubits[129];
-h qubits[129];
-h qubits[129];
-ccx qubits[39],qubits[90],qubits[129];
-h qubits[129];
-h qubits[129];
-ccx qubits[38],qubits[91],qubits[129];
-h qubits[129];
-h qubits[129];
-ccx qubits[37],qubits[92],qubits[129];
-h qubits[129];
-h qubits[129];
-ccx qubits[36],qubits[93],qubits[129];
-h qubits[129];
-h qubits[129];
-ccx qubits[35],qubits[94],qubits[129];
-h qubits[129];
-h qubits[129];
-ccx qubits[34],qubits[95],qubits[129];
-h qubits[129];
-h qubits[129];
-ccx qubits[33],qubits[96],qubits[129];
-h qubits[129];
-h qubits[129];
-ccx qubits[32],qubits[97],qubits[129];
-h qubits[129];
-h qubits[129];
-ccx qubits[31],qubits[98],qubits[129];
-h qubits[129];
-h qubits[129];
-ccx qubits[30],qubits[99],qubits[129];
-h qubits[129];
-h qubits[129];
-ccx qubits[29],qubits[100],qubits[129];
-h qubits[129];
-h qubits[129];
-ccx qubits[28],qubits[101],qubits[129];
-h qubits[129];
-h qubits[129];
-ccx qubits[27],qubits[102],qubits[129];
-h qubits[129];
-h qubits[129];
-ccx qubits[26],qubits[103],qubits[129];
-h qubits[129];
-h qubits[129];
-ccx qubits[25],qubits[104],qubits[129];
-h qubits[129];
-h qubits[129];
-ccx qubits[24],qubits[105],qubits[129];
-h qubits[129];
-h qubits[129];
-ccx qubits[23],qubits[106],qubits[129];
-h qubits[129];
-h qubits[129];
-ccx qubits[22],qubits[107],qubits[129];
-h qubits[129];
-h qubits[129];
-ccx qubits[21],qubits[108],qubits[129];
-h qubits[129];
-h qubits[129];
-ccx qubits[20],qubits[109],qubits[129];
-h qubits[129];
-h qubits[129];
-ccx qubits[19],qubits[110],qubits[129];
-h qubits[129];
-h qubits[129];
-ccx qubits[18],qubits[111],qubits[129];
-h qubits[129];
-h qubits[129];
-ccx qubits[17],qubits[112],qubits[129];
-h qubits[129];
-h qubits[129];
-ccx qubits[16],qubits[113],qubits[129];
-h qubits[129];
-h qubits[129];
-ccx qubits[15],qubits[114],qubits[129];
-h qubits[129];
-h qubits[129];
-ccx qubits[14],qubits[115],qubits[129];
-h qubits[129];
-h qubits[129];
-ccx qubits[13],qubits[116],qubits[129];
-h qubits[129];
-h qubits[129];
-ccx qubits[12],qubits[117],qubits[129];
-h qubits[129];
-h qubits[129];
-ccx qubits[11],qubits[118],qubits[129];
-h qubits[129];
-h qubits[129];
-ccx qubits[10],qubits[119],qubits[129];
-h qubits[129];
-h qubits[129];
-ccx qubits[9],qubits[120],qubits[129];
-h qubits[129];
-h qubits[129];
-ccx qubits[8],qubits[121],qubits[129];
-h qubits[129];
-h qubits[129];
-ccx qubits[7],qubits[122],qubits[129];
-h qubits[129];
-h qubits[129];
-ccx qubits[6],qubits[123],qubits[129];
-h qubits[129];
-h qubits[129];
-ccx qubits[5],qubits[124],qubits[129];
-h qubits[129];
-h qubits[129];
-ccx qubits[4],qubits[125],qubits[129];
-h qubits[129];
-h qubits[129];
-ccx qubits[3],qubits[126],qubits[129];
-h qubits[129];
-h qubits[129];
-ccx qubits[2],qubits[127],qubits[129];
-h qubits[129];
-h qubits[130];
-ccx qubits[63],qubits[67],qubits[130];
-h qubits[130];
-h qubits[130];
-ccx qubits[62],qubits[68],qubits[130];
-h qubits[130];
-h qubits[130];
-ccx qubits[61],qubits[69],qubits[130];
-h qubits[130];
-h qubits[130];
-ccx qubits[60],qubits[70],qubits[130];
-h qubits[130];
-h qubits[130];
-ccx qubits[59],qubits[71],qubits[130];
-h qubits[130];
-h qubits[130];
-ccx qubits[58],qubits[72],qubits[130];
-h qubits[130];
-h qubits[130];
-ccx qubits[57],qubits[73],qubits[130];
-h qubits[130];
-h qubits[130];
-ccx qubits[56],qubits[74],qubits[130];
-h qubits[130];
-h qubits[130];
-ccx qubits[55],qubits[75],qubits[130];
-h qubits[130];
-h qubits[130];
-ccx qubits[54],qubits[76],qubits[130];
-h qubits[130];
-h qubits[130];
-ccx qubits[53],qubits[77],qubits[130];
-h qubits[130];
-h qubits[130];
-ccx qubits[52],qubits[78],qubits[130];
-h qubits[130];
-h qubits[130];
-ccx qubits[51],qubits[79],qubits[130];
-h qubits[130];
-h qubits[130];
-ccx qubits[50],qubits[80],qubits[130];
-h qubits[130];
-h qubits[130];
-ccx qubits[49],qubits[81],qubits[130];
-h qubits[130];
-h qubits[130];
-ccx qubits[48],qubits[82],qubits[130];
-h qubits[130];
-h qubits[130];
-ccx qubits[47],qubits[83],qubits[130];
-h qubits[130];
-h qubits[130];
-ccx qubits[46],qubits[84],qubits[130];
-h qubits[130];
-h qubits[130];
-ccx qubits[45],qubits[85],qubits[130];
-h qubits[130];
-h qubits[130];
-ccx qubits[44],qubits[86],qubits[130];
-h qubits[130];
-h qubits[130];
-ccx qubits[43],qubits[87],qubits[130];
-h qubits[130];
-h qubits[130];
-ccx qubits[42],qubits[88],qubits[130];
-h qubits[130];
-h qubits[130];
-ccx qubits[41],qubits[89],qubits[130];
-h qubits[130];
-h qubits[130];
-ccx qubits[40],qubits[90],qubits[130];
-h qubits[130];
-h qubits[130];
-ccx qubits[39],qubits[91],qubits[130];
-h qubits[130];
-h qubits[130];
-ccx qubits[38],qubits[92],qubits[130];
-h qubits[130];
-h qubits[130];
-ccx qubits[37],qubits[93],qubits[130];
-h qubits[130];
-h qubits[130];
-ccx qubits[36],qubits[94],qubits[130];
-h qubits[130];
-h qubits[130];
-ccx qubits[35],qubits[95],qubits[130];
-h qubits[130];
-h qubits[130];
-ccx qubits[34],qubits[96],qubits[130];
-h qubits[130];
-h qubits[130];
-ccx qubits[33],qubits[97],qubits[130];
-h qubits[130];
-h qubits[130];
-ccx qubits[32],qubits[98],qubits[130];
-h qubits[130];
-h qubits[130];
-ccx qubits[31],qubits[99],qubits[130];
-h qubits[130];
-h qubits[130];
-ccx qubits[30],qubits[100],qubits[130];
-h qubits[130];
-h qubits[130];
-ccx qubits[29],qubits[101],qubits[130];
-h qubits[130];
-h qubits[130];
-ccx qubits[28],qubits[102],qubits[130];
-h qubits[130];
-h qubits[130];
-ccx qubits[27],qubits[103],qubits[130];
-h qubits[130];
-h qubits[130];
-ccx qubits[26],qubits[104],qubits[130];
-h qubits[130];
-h qubits[130];
-ccx qubits[25],qubits[105],qubits[130];
-h qubits[130];
-h qubits[130];
-ccx qubits[24],qubits[106],qubits[130];
-h qubits[130];
-h qubits[130];
-ccx qubits[23],qubits[107],qubits[130];
-h qubits[130];
-h qubits[130];
-ccx qubits[22],qubits[108],qubits[130];
-h qubits[130];
-h qubits[130];
-ccx qubits[21],qubits[109],qubits[130];
-h qubits[130];
-h qubits[130];
-ccx qubits[20],qubits[110],qubits[130];
-h qubits[130];
-h qubits[130];
-ccx qubits[19],qubits[111],qubits[130];
-h qubits[130];
-h qubits[130];
-ccx qubits[18],qubits[112],qubits[130];
-h qubits[130];
-h qubits[130];
-ccx qubits[17],qubits[113],qubits[130];
-h qubits[130];
-h qubits[130];
-ccx qubits[16],qubits[114],qubits[130];
-h qubits[130];
-h qubits[130];
-ccx qubits[15],qubits[115],qubits[130];
-h qubits[130];
-h qubits[130];
-ccx qubits[14],qubits[116],qubits[130];
-h qubits[130];
-h qubits[130];
-ccx qubits[13],qubits[117],qubits[130];
-h qubits[130];
-h qubits[130];
-ccx qubits[12],qubits[118],qubits[130];
-h qubits[130];
-h qubits[130];
-ccx qubits[11],qubits[119],qubits[130];
-h qubits[130];
-h qubits[130];
-ccx qubits[10],qubits[120],qubits[130];
-h qubits[130];
-h qubits[130];
-ccx qubits[9],qubits[121],qubits[130];
-h qubits[130];
-h qubits[130];
-ccx qubits[8],qubits[122],qubits[130];
-h qubits[130];
-h qubits[130];
-ccx qubits[7],qubits[123],qubits[130];
-h qubits[130];
-h qubits[130];
-ccx qubits[6],qubits[124],qubits[130];
-h qubits[130];
-h qubits[130];
-ccx qubits[5],qubits[125],qubits[130];
-h qubits[130];
-h qubits[130];
-ccx qubits[4],qubits[126],qubits[130];
-h qubits[130];
-h qubits[130];
-ccx qubits[3],qubits[127],qubits[130];
-h qubits[130];
-h qubits[131];
-ccx qubits[63],qubits[68],qubits[131];
-h qubits[131];
-h qubits[131];
-ccx qubits[62],qubits[69],qubits[131];
-h qubits[131];
-h qubits[131];
-ccx qubits[61],qubits[70],qubits[131];
-h qubits[131];
-h qubits[131];
-ccx qubits[60],qubits[71],qubits[131];
-h qubits[131];
-h qubits[131];
-ccx qubits[59],qubits[72],qubits[131];
-h qubits[131];
-h qubits[131];
-ccx qubits[58],qubits[73],qubits[131];
-h qubits[131];
-h qubits[131];
-ccx qubits[57],qubits[74],qubits[131];
-h qubits[131];
-h qubits[131];
-ccx qubits[56],qubits[75],qubits[131];
-h qubits[131];
-h qubits[131];
-ccx qubits[55],qubits[76],qubits[131];
-h qubits[131];
-h qubits[131];
-ccx qubits[54],qubits[77],qubits[131];
-h qubits[131];
-h qubits[131];
-ccx qubits[53],qubits[78],qubits[131];
-h qubits[131];
-h qubits[131];
-ccx qubits[52],qubits[79],qubits[131];
-h qubits[131];
-h qubits[131];
-ccx qubits[51],qubits[80],qubits[131];
-h qubits[131];
-h qubits[131];
-ccx qubits[50],qubits[81],qubits[131];
-h qubits[131];
-h qubits[131];
-ccx qubits[49],qubits[82],qubits[131];
-h qubits[131];
-h qubits[131];
-ccx qubits[48],qubits[83],qubits[131];
-h qubits[131];
-h qubits[131];
-ccx qubits[47],qubits[84],qubits[131];
-h qubits[131];
-h qubits[131];
-ccx qubits[46],qubits[85],qubits[131];
-h qubits[131];
-h qubits[131];
-ccx qubits[45],qubits[86],qubits[131];
-h qubits[131];
-h qubits[131];
-ccx qubits[44],qubits[87],qubits[131];
-h qubits[131];
-h qubits[131];
-ccx qubits[43],qubits[88],qubits[131];
-h qubits[131];
-h qubits[131];
-ccx qubits[42],qubits[89],qubits[131];
-h qubits[131];
-h qubits[131];
-ccx qubits[41],qubits[90],qubits[131];
-h qubits[131];
-h qubits[131];
-ccx qubits[40],qubits[91],qubits[131];
-h qubits[131];
-h qubits[131];
-ccx qubits[39],qubits[92],qubits[131];
-h qubits[131];
-h qubits[131];
-ccx qubits[38],qubits[93],qubits[131];
-h qubits[131];
-h qubits[131];
-ccx qubits[37],qubits[94],qubits[131];
-h qubits[131];
-h qubits[131];
-ccx qubits[36],qubits[95],qubits[131];
-h qubits[131];
-h qubits[131];
-ccx qubits[35],qubits[96],qubits[131];
-h qubits[131];
-h qubits[131];
-ccx qubits[34],qubits[97],qubits[131];
-h qubits[131];
-h qubits[131];
-ccx qubits[33],qubits[98],qubits[131];
-h qubits[131];
-h qubits[131];
-ccx qubits[32],qubits[99],qubits[131];
-h qubits[131];
-h qubits[131];
-ccx qubits[31],qubits[100],qubits[131];
-h qubits[131];
-h qubits[131];
-ccx qubits[30],qubits[101],qubits[131];
-h qubits[131];
-h qubits[131];
-ccx qubits[29],qubits[102],qubits[131];
-h qubits[131];
-h qubits[131];
-ccx qubits[28],qubits[103],qubits[131];
-h qubits[131];
-h qubits[131];
-ccx qubits[27],qubits[104],qubits[131];
-h qubits[131];
-h qubits[131];
-ccx qubits[26],qubits[105],qubits[131];
-h qubits[131];
-h qubits[131];
-ccx qubits[25],qubits[106],qubits[131];
-h qubits[131];
-h qubits[131];
-ccx qubits[24],qubits[107],qubits[131];
-h qubits[131];
-h qubits[131];
-ccx qubits[23],qubits[108],qubits[131];
-h qubits[131];
-h qubits[131];
-ccx qubits[22],qubits[109],qubits[131];
-h qubits[131];
-h qubits[131];
-ccx qubits[21],qubits[110],qubits[131];
-h qubits[131];
-h qubits[131];
-ccx qubits[20],qubits[111],qubits[131];
-h qubits[131];
-h qubits[131];
-ccx qubits[19],qubits[112],qubits[131];
-h qubits[131];
-h qubits[131];
-ccx qubits[18],qubits[113],qubits[131];
-h qubits[131];
-h qubits[131];
-ccx qubits[17],qubits[114],qubits[131];
-h qubits[131];
-h qubits[131];
-ccx qubits[16],qubits[115],qubits[131];
-h qubits[131];
-h qubits[131];
-ccx qubits[15],qubits[116],qubits[131];
-h qubits[131];
-h qubits[131];
-ccx qubits[14],qubits[117],qubits[131];
-h qubits[131];
-h qubits[131];
-ccx qubits[13],qubits[118],qubits[131];
-h qubits[131];
-h qubits[131];
-ccx qubits[12],qubits[119],qubits[131];
-h qubits[131];
-h qubits[131];
-ccx qubits[11],qubits[120],qubits[131];
-h qubits[131];
-h qubits[131];
-ccx qubits[10],qubits[121],qubits[131];
-h qubits[131];
-h qubits[131];
-ccx qubits[9],qubits[122],qubits[131];
-h qubits[131];
-h qubits[131];
-ccx qubits[8],qubits[123],qubits[131];
-h qubits[131];
-h qubits[131];
-ccx qubits[7],qubits[124],qubits[131];
-h qubits[131];
-h qubits[131];
-ccx qubits[6],qubits[125],qubits[131];
-h qubits[131];
-h qubits[131];
-ccx qubits[5],qubits[126],qubits[131];
-h qubits[131];
-h qubits[131];
-ccx qubits[4],qubits[127],qubits[131];
-h qubits[131];
-h qubits[132];
-ccx qubits[63],qubits[69],qubits[132];
-h qubits[132];
-h qubits[132];
-ccx qubits[62],qubits[70],qubits[132];
-h qubits[132];
-h qubits[132];
-ccx qubits[61],qubits[71],qubits[132];
-h qubits[132];
-h qubits[132];
-ccx qubits[60],qubits[72],qubits[132];
-h qubits[132];
-h qubits[132];
-ccx qubits[59],qubits[73],qubits[132];
-h qubits[132];
-h qubits[132];
-ccx qubits[58],qubits[74],qubits[132];
-h qubits[132];
-h qubits[132];
-ccx qubits[57],qubits[75],qubits[132];
-h qubits[132];
-h qubits[132];
-ccx qubits[56],qubits[76],qubits[132];
-h qubits[132];
-h qubits[132];
-ccx qubits[55],qubits[77],qubits[132];
-h qubits[132];
-h qubits[132];
-ccx qubits[54],qubits[78],qubits[132];
-h qubits[132];
-h qubits[132];
-ccx qubits[53],qubits[79],qubits[132];
-h qubits[132];
-h qubits[132];
-ccx qubits[52],qubits[80],qubits[132];
-h qubits[132];
-h qubits[132];
-ccx qubits[51],qubits[81],qubits[132];
-h qubits[132];
-h qubits[132];
-ccx qubits[50],qubits[82],qubits[132];
-h qubits[132];
-h qubits[132];
-ccx qubits[49],qubits[83],qubits[132];
-h qubits[132];
-h qubits[132];
-ccx qubits[48],qubits[84],qubits[132];
-h qubits[132];
-h qubits[132];
-ccx qubits[47],qubits[85],qubits[132];
-h qubits[132];
-h qubits[132];
-ccx qubits[46],qubits[86],qubits[132];
-h qubits[132];
-h qubits[132];
-ccx qubits[45],qubits[87],qubits[132];
-h qubits[132];
-h qubits[132];
-ccx qubits[44],qubits[88],qubits[132];
-h qubits[132];
-h qubits[132];
-ccx qubits[43],qubits[89],qubits[132];
-h qubits[132];
-h qubits[132];
-ccx qubits[42],qubits[90],qubits[132];
-h qubits[132];
-h qubits[132];
-ccx qubits[41],qubits[91],qubits[132];
-h qubits[132];
-h qubits[132];
-ccx qubits[40],qubits[92],qubits[132];
-h qubits[132];
-h qubits[132];
-ccx qubits[39],qubits[93],qubits[132];
-h qubits[132];
-h qubits[132];
-ccx qubits[38],qubits[94],qubits[132];
-h qubits[132];
-h qubits[132];
-ccx qubits[37],qubits[95],qubits[132];
-h qubits[132];
-h qubits[132];
-ccx qubits[36],qubits[96],qubits[132];
-h qubits[132];
-h qubits[132];
-ccx qubits[35],qubits[97],qubits[132];
-h qubits[132];
-h qubits[132];
-ccx qubits[34],qubits[98],qubits[132];
-h qubits[132];
-h qubits[132];
-ccx qubits[33],qubits[99],qubits[132];
-h qubits[132];
-h qubits[132];
-ccx qubits[32],qubits[100],qubits[132];
-h qubits[132];
-h qubits[132];
-ccx qubits[31],qubits[101],qubits[132];
-h qubits[132];
-h qubits[132];
-ccx qubits[30],qubits[102],qubits[132];
-h qubits[132];
-h qubits[132];
-ccx qubits[29],qubits[103],qubits[132];
-h qubits[132];
-h qubits[132];
-ccx qubits[28],qubits[104],qubits[132];
-h qubits[132];
-h qubits[132];
-ccx qubits[27],qubits[105],qubits[132];
-h qubits[132];
-h qubits[132];
-ccx qubits[26],qubits[106],qubits[132];
-h qubits[132];
-h qubits[132];
-ccx qubits[25],qubits[107],qubits[132];
-h qubits[132];
-h qubits[132];
-ccx qubits[24],qubits[108],qubits[132];
-h qubits[132];
-h qubits[132];
-ccx qubits[23],qubits[109],qubits[132];
-h qubits[132];
-h qubits[132];
-ccx qubits[22],qubits[110],qubits[132];
-h qubits[132];
-h qubits[132];
-ccx qubits[21],qubits[111],qubits[132];
-h qubits[132];
-h qubits[132];
-ccx qubits[20],qubits[112],qubits[132];
-h qubits[132];
-h qubits[132];
-ccx qubits[19],qubits[113],qubits[132];
-h qubits[132];
-h qubits[132];
-ccx qubits[18],qubits[114],qubits[132];
-h qubits[132];
-h qubits[132];
-ccx qubits[17],qubits[115],qubits[132];
-h qubits[132];
-h qubits[132];
-ccx qubits[16],qubits[116],qubits[132];
-h qubits[132];
-h qubits[132];
-ccx qubits[15],qubits[117],qubits[132];
-h qubits[132];
-h qubits[132];
-ccx qubits[14],qubits[118],qubits[132];
-h qubits[132];
-h qubits[132];
-ccx qubits[13],qubits[119],qubits[132];
-h qubits[132];
-h qubits[132];
-ccx qubits[12],qubits[120],qubits[132];
-h qubits[132];
-h qubits[132];
-ccx qubits[11],qubits[121],qubits[132];
-h qubits[132];
-h qubits[132];
-ccx qubits[10],qubits[122],qubits[132];
-h qubits[132];
-h qubits[132];
-ccx qubits[9],qubits[123],qubits[132];
-h qubits[132];
-h qubits[132];
-ccx qubits[8],qubits[124],qubits[132];
-h qubits[132];
-h qubits[132];
-ccx qubits[7],qubits[125],qubits[132];
-h qubits[132];
-h qubits[132];
-ccx qubits[6],qubits[126],qubits[132];
-h qubits[132];
-h qubits[132];
-ccx qubits[5],qubits[127],qubits[132];
-h qubits[132];
-h qubits[133];
-ccx qubits[63],qubits[70],qubits[133];
-h qubits[133];
-h qubits[133];
-ccx qubits[62],qubits[71],qubits[133];
-h qubits[133];
-h qubits[133];
-ccx qubits[61],qubits[72],qubits[133];
-h qubits[133];
-h qubits[133];
-ccx qubits[60],qubits[73],qubits[133];
-h qubits[133];
-h qubits[133];
-ccx qubits[59],qubits[74],qubits[133];
-h qubits[133];
-h qubits[133];
-ccx qubits[58],qubits[75],qubits[133];
-h qubits[133];
-h qubits[133];
-ccx qubits[57],qubits[76],qubits[133];
-h qubits[133];
-h qubits[133];
-ccx qubits[56],qubits[77],qubits[133];
-h qubits[133];
-h qubits[133];
-ccx qubits[55],qubits[78],qubits[133];
-h qubits[133];
-h qubits[133];
-ccx qubits[54],qubits[79],qubits[133];
-h qubits[133];
-h qubits[133];
-ccx qubits[53],qubits[80],qubits[133];
-h qubits[133];
-h qubits[133];
-ccx qubits[52],qubits[81],qubits[133];
-h qubits[133];
-h qubits[133];
-ccx qubits[51],qubits[82],qubits[133];
-h qubits[133];
-h qubits[133];
-ccx qubits[50],qubits[83],qubits[133];
-h qubits[133];
-h qubits[133];
-ccx qubits[49],qubits[84],qubits[133];
-h qubits[133];
-h qubits[133];
-ccx qubits[48],qubits[85],qubits[133];
-h qubits[133];
-h qubits[133];
-ccx qubits[47],qubits[86],qubits[133];
-h qubits[133];
-h qubits[133];
-ccx qubits[46],qubits[87],qubits[133];
-h qubits[133];
-h qubits[133];
-ccx qubits[45],qubits[88],qubits[133];
-h qubits[133];
-h qubits[133];
-ccx qubits[44],qubits[89],qubits[133];
-h qubits[133];
-h qubits[133];
-ccx qubits[43],qubits[90],qubits[133];
-h qubits[133];
-h qubits[133];
-ccx qubits[42],qubits[91],qubits[133];
-h qubits[133];
-h qubits[133];
-ccx qubits[41],qubits[92],qubits[133];
-h qubits[133];
-h qubits[133];
-ccx qubits[40],qubits[93],qubits[133];
-h qubits[133];
-h qubits[133];
-ccx qubits[39],qubits[94],qubits[133];
-h qubits[133];
-h qubits[133];
-ccx qubits[38],qubits[95],qubits[133];
-h qubits[133];
-h qubits[133];
-ccx qubits[37],qubits[96],qubits[133];
-h qubits[133];
-h qubits[133];
-ccx qubits[36],qubits[97],qubits[133];
-h qubits[133];
-h qubits[133];
-ccx qubits[35],qubits[98],qubits[133];
-h qubits[133];
-h qubits[133];
-ccx qubits[34],qubits[99],qubits[133];
-h qubits[133];
-h qubits[133];
-ccx qubits[33],qubits[100],qubits[133];
-h qubits[133];
-h qubits[133];
-ccx qubits[32],qubits[101],qubits[133];
-h qubits[133];
-h qubits[133];
-ccx qubits[31],qubits[102],qubits[133];
-h qubits[133];
-h qubits[133];
-ccx qubits[30],qubits[103],qubits[133];
-h qubits[133];
-h qubits[133];
-ccx qubits[29],qubits[104],qubits[133];
-h qubits[133];
-h qubits[133];
-ccx qubits[28],qubits[105],qubits[133];
-h qubits[133];
-h qubits[133];
-ccx qubits[27],qubits[106],qubits[133];
-h qubits[133];
-h qubits[133];
-ccx qubits[26],qubits[107],qubits[133];
-h qubits[133];
-h qubits[133];
-ccx qubits[25],qubits[108],qubits[133];
-h qubits[133];
-h qubits[133];
-ccx qubits[24],qubits[109],qubits[133];
-h qubits[133];
-h qubits[133];
-ccx qubits[23],qubits[110],qubits[133];
-h qubits[133];
-h qubits[133];
-ccx qubits[22],qubits[111],qubits[133];
-h qubits[133];
-h qubits[133];
-ccx qubits[21],qubits[112],qubits[133];
-h qubits[133];
-h qubits[133];
-ccx qubits[20],qubits[113],qubits[133];
-h qubits[133];
-h qubits[133];
-ccx qubits[19],qubits[114],qubits[133];
-h qubits[133];
-h qubits[133];
-ccx qubits[18],qubits[115],qubits[133];
-h qubits[133];
-h qubits[133];
-ccx qubits[17],qubits[116],qubits[133];
-h qubits[133];
-h qubits[133];
-ccx qubits[16],qubits[117],qubits[133];
-h qubits[133];
-h qubits[133];
-ccx qubits[15],qubits[118],qubits[133];
-h qubits[133];
-h qubits[133];
-ccx qubits[14],qubits[119],qubits[133];
-h qubits[133];
-h qubits[133];
-ccx qubits[13],qubits[120],qubits[133];
-h qubits[133];
-h qubits[133];
-ccx qubits[12],qubits[121],qubits[133];
-h qubits[133];
-h qubits[133];
-ccx qubits[11],qubits[122],qubits[133];
-h qubits[133];
-h qubits[133];
-ccx qubits[10],qubits[123],qubits[133];
-h qubits[133];
-h qubits[133];
-ccx qubits[9],qubits[124],qubits[133];
-h qubits[133];
-h qubits[133];
-ccx qubits[8],qubits[125],qubits[133];
-h qubits[133];
-h qubits[133];
-ccx qubits[7],qubits[126],qubits[133];
-h qubits[133];
-h qubits[133];
-ccx qubits[6],qubits[127],qubits[133];
-h qubits[133];
-h qubits[134];
-ccx qubits[63],qubits[71],qubits[134];
-h qubits[134];
-h qubits[134];
-ccx qubits[62],qubits[72],qubits[134];
-h qubits[134];
-h qubits[134];
-ccx qubits[61],qubits[73],qubits[134];
-h qubits[134];
-h qubits[134];
-ccx qubits[60],qubits[74],qubits[134];
-h qubits[134];
-h qubits[134];
-ccx qubits[59],qubits[75],qubits[134];
-h qubits[134];
-h qubits[134];
-ccx qubits[58],qubits[76],qubits[134];
-h qubits[134];
-h qubits[134];
-ccx qubits[57],qubits[77],qubits[134];
-h qubits[134];
-h qubits[134];
-ccx qubits[56],qubits[78],qubits[134];
-h qubits[134];
-h qubits[134];
-ccx qubits[55],qubits[79],qubits[134];
-h qubits[134];
-h qubits[134];
-ccx qubits[54],qubits[80],qubits[134];
-h qubits[134];
-h qubits[134];
-ccx qubits[53],qubits[81],qubits[134];
-h qubits[134];
-h qubits[134];
-ccx qubits[52],qubits[82],qubits[134];
-h qubits[134];
-h qubits[134];
-ccx qubits[51],qubits[83],qubits[134];
-h qubits[134];
-h qubits[134];
-ccx qubits[50],qubits[84],qubits[134];
-h qubits[134];
-h qubits[134];
-ccx qubits[49],qubits[85],qubits[134];
-h qubits[134];
-h qubits[134];
-ccx qubits[48],qubits[86],qubits[134];
-h qubits[134];
-h qubits[134];
-ccx qubits[47],qubits[87],qubits[134];
-h qubits[134];
-h qubits[134];
-ccx qubits[46],qubits[88],qubits[134];
-h qubits[134];
-h qubits[134];
-ccx qubits[45],qubits[89],qubits[134];
-h qubits[134];
-h qubits[134];
-ccx qubits[44],qubits[90],qubits[134];
-h qubits[134];
-h qubits[134];
-ccx qubits[43],qubits[91],qubits[134];
-h qubits[134];
-h qubits[134];
-ccx qubits[42],qubits[92],qubits[134];
-h qubits[134];
-h qubits[134];
-ccx qubits[41],qubits[93],qubits[134];
-h qubits[134];
-h qubits[134];
-ccx qubits[40],qubits[94],qubits[134];
-h qubits[134];
-h qubits[134];
-ccx qubits[39],qubits[95],qubits[134];
-h qubits[134];
-h qubits[134];
-ccx qubits[38],qubits[96],qubits[134];
-h qubits[134];
-h qubits[134];
-ccx qubits[37],qubits[97],qubits[134];
-h qubits[134];
-h qubits[134];
-ccx qubits[36],qubits[98],qubits[134];
-h qubits[134];
-h qubits[134];
-ccx qubits[35],qubits[99],qubits[134];
-h qubits[134];
-h qubits[134];
-ccx qubits[34],qubits[100],qubits[134];
-h qubits[134];
-h qubits[134];
-ccx qubits[33],qubits[101],qubits[134];
-h qubits[134];
-h qubits[134];
-ccx qubits[32],qubits[102],qubits[134];
-h qubits[134];
-h qubits[134];
-ccx qubits[31],qubits[103],qubits[134];
-h qubits[134];
-h qubits[134];
-ccx qubits[30],qubits[104],qubits[134];
-h qubits[134];
-h qubits[134];
-ccx qubits[29],qubits[105],qubits[134];
-h qubits[134];
-h qubits[134];
-ccx qubits[28],qubits[106],qubits[134];
-h qubits[134];
-h qubits[134];
-ccx qubits[27],qubits[107],qubits[134];
-h qubits[134];
-h qubits[134];
-ccx qubits[26],qubits[108],qubits[134];
-h qubits[134];
-h qubits[134];
-ccx qubits[25],qubits[109],qubits[134];
-h qubits[134];
-h qubits[134];
-ccx qubits[24],qubits[110],qubits[134];
-h qubits[134];
-h qubits[134];
-ccx qubits[23],qubits[111],qubits[134];
-h qubits[134];
-h qubits[134];
-ccx qubits[22],qubits[112],qubits[134];
-h qubits[134];
-h qubits[134];
-ccx qubits[21],qubits[113],qubits[134];
-h qubits[134];
-h qubits[134];
-ccx qubits[20],qubits[114],qubits[134];
-h qubits[134];
-h qubits[134];
-ccx qubits[19],qubits[115],qubits[134];
-h qubits[134];
-h qubits[134];
-ccx qubits[18],qubits[116],qubits[134];
-h qubits[134];
-h qubits[134];
-ccx qubits[17],qubits[117],qubits[134];
-h qubits[134];
-h qubits[134];
-ccx qubits[16],qubits[118],qubits[134];
-h qubits[134];
-h qubits[134];
-ccx qubits[15],qubits[119],qubits[134];
-h qubits[134];
-h qubits[134];
-ccx qubits[14],qubits[120],qubits[134];
-h qubits[134];
-h qubits[134];
-ccx qubits[13],qubits[121],qubits[134];
-h qubits[134];
-h qubits[134];
-ccx qubits[12],qubits[122],qubits[134];
-h qubits[134];
-h qubits[134];
-ccx qubits[11],qubits[123],qubits[134];
-h qubits[134];
-h qubits[134];
-ccx qubits[10],qubits[124],qubits[134];
-h qubits[134];
-h qubits[134];
-ccx qubits[9],qubits[125],qubits[134];
-h qubits[134];
-h qubits[134];
-ccx qubits[8],qubits[126],qubits[134];
-h qubits[134];
-h qubits[134];
-ccx qubits[7],qubits[127],qubits[134];
-h qubits[134];
-h qubits[135];
-ccx qubits[63],qubits[72],qubits[135];
-h qubits[135];
-h qubits[135];
-ccx qubits[62],qubits[73],qubits[135];
-h qubits[135];
-h qubits[135];
-ccx qubits[61],qubits[74],qubits[135];
-h qubits[135];
-h qubits[135];
-ccx qubits[60],qubits[75],qubits[135];
-h qubits[135];
-h qubits[135];
-ccx qubits[59],qubits[76],qubits[135];
-h qubits[135];
-h qubits[135];
-ccx qubits[58],qubits[77],qubits[135];
-h qubits[135];
-h qubits[135];
-ccx qubits[57],qubits[78],qubits[135];
-h qubits[135];
-h qubits[135];
-ccx qubits[56],qubits[79],qubits[135];
-h qubits[135];
-h qubits[135];
-ccx qubits[55],qubits[80],qubits[135];
-h qubits[135];
-h qubits[135];
-ccx qubits[54],qubits[81],qubits[135];
-h qubits[135];
-h qubits[135];
-ccx qubits[53],qubits[82],qubits[135];
-h qubits[135];
-h qubits[135];
-ccx qubits[52],qubits[83],qubits[135];
-h qubits[135];
-h qubits[135];
-ccx qubits[51],qubits[84],qubits[135];
-h qubits[135];
-h qubits[135];
-ccx qubits[50],qubits[85],qubits[135];
-h qubits[135];
-h qubits[135];
-ccx qubits[49],qubits[86],qubits[135];
-h qubits[135];
-h qubits[135];
-ccx qubits[48],qubits[87],qubits[135];
-h qubits[135];
-h qubits[135];
-ccx qubits[47],qubits[88],qubits[135];
-h qubits[135];
-h qubits[135];
-ccx qubits[46],qubits[89],qubits[135];
-h qubits[135];
-h qubits[135];
-ccx qubits[45],qubits[90],qubits[135];
-h qubits[135];
-h qubits[135];
-ccx qubits[44],qubits[91],qubits[135];
-h qubits[135];
-h qubits[135];
-ccx qubits[43],qubits[92],qubits[135];
-h qubits[135];
-h qubits[135];
-ccx qubits[42],qubits[93],qubits[135];
-h qubits[135];
-h qubits[135];
-ccx qubits[41],qubits[94],qubits[135];
-h qubits[135];
-h qubits[135];
-ccx qubits[40],qubits[95],qubits[135];
-h qubits[135];
-h qubits[135];
-ccx qubits[39],qubits[96],qubits[135];
-h qubits[135];
-h qubits[135];
-ccx qubits[38],qubits[97],qubits[135];
-h qubits[135];
-h qubits[135];
-ccx qubits[37],qubits[98],qubits[135];
-h qubits[135];
-h qubits[135];
-ccx qubits[36],qubits[99],qubits[135];
-h qubits[135];
-h qubits[135];
-ccx qubits[35],qubits[100],qubits[135];
-h qubits[135];
-h qubits[135];
-ccx qubits[34],qubits[101],qubits[135];
-h qubits[135];
-h qubits[135];
-ccx qubits[33],qubits[102],qubits[135];
-h qubits[135];
-h qubits[135];
-ccx qubits[32],qubits[103],qubits[135];
-h qubits[135];
-h qubits[135];
-ccx qubits[31],qubits[104],qubits[135];
-h qubits[135];
-h qubits[135];
-ccx qubits[30],qubits[105],qubits[135];
-h qubits[135];
-h qubits[135];
-ccx qubits[29],qubits[106],qubits[135];
-h qubits[135];
-h qubits[135];
-ccx qubits[28],qubits[107],qubits[135];
-h qubits[135];
-h qubits[135];
-ccx qubits[27],qubits[108],qubits[135];
-h qubits[135];
-h qubits[135];
-ccx qubits[26],qubits[109],qubits[135];
-h qubits[135];
-h qubits[135];
-ccx qubits[25],qubits[110],qubits[135];
-h qubits[135];
-h qubits[135];
-ccx qubits[24],qubits[111],qubits[135];
-h qubits[135];
-h qubits[135];
-ccx qubits[23],qubits[112],qubits[135];
-h qubits[135];
-h qubits[135];
-ccx qubits[22],qubits[113],qubits[135];
-h qubits[135];
-h qubits[135];
-ccx qubits[21],qubits[114],qubits[135];
-h qubits[135];
-h qubits[135];
-ccx qubits[20],qubits[115],qubits[135];
-h qubits[135];
-h qubits[135];
-ccx qubits[19],qubits[116],qubits[135];
-h qubits[135];
-h qubits[135];
-ccx qubits[18],qubits[117],qubits[135];
-h qubits[135];
-h qubits[135];
-ccx qubits[17],qubits[118],qubits[135];
-h qubits[135];
-h qubits[135];
-ccx qubits[16],qubits[119],qubits[135];
-h qubits[135];
-h qubits[135];
-ccx qubits[15],qubits[120],qubits[135];
-h qubits[135];
-h qubits[135];
-ccx qubits[14],qubits[121],qubits[135];
-h qubits[135];
-h qubits[135];
-ccx qubits[13],qubits[122],qubits[135];
-h qubits[135];
-h qubits[135];
-ccx qubits[12],qubits[123],qubits[135];
-h qubits[135];
-h qubits[135];
-ccx qubits[11],qubits[124],qubits[135];
-h qubits[135];
-h qubits[135];
-ccx qubits[10],qubits[125],qubits[135];
-h qubits[135];
-h qubits[135];
-ccx qubits[9],qubits[126],qubits[135];
-h qubits[135];
-h qubits[135];
-ccx qubits[8],qubits[127],qubits[135];
-h qubits[135];
-h qubits[136];
-ccx qubits[63],qubits[73],qubits[136];
-h qubits[136];
-h qubits[136];
-ccx qubits[62],qubits[74],qubits[136];
-h qubits[136];
-h qubits[136];
-ccx qubits[61],qubits[75],qubits[136];
-h qubits[136];
-h qubits[136];
-ccx qubits[60],qubits[76],qubits[136];
-h qubits[136];
-h qubits[136];
-ccx qubits[59],qubits[77],qubits[136];
-h qubits[136];
-h qubits[136];
-ccx qubits[58],qubits[78],qubits[136];
-h qubits[136];
-h qubits[136];
-ccx qubits[57],qubits[79],qubits[136];
-h qubits[136];
-h qubits[136];
-ccx qubits[56],qubits[80],qubits[136];
-h qubits[136];
-h qubits[136];
-ccx qubits[55],qubits[81],qubits[136];
-h qubits[136];
-h qubits[136];
-ccx qubits[54],qubits[82],qubits[136];
-h qubits[136];
-h qubits[136];
-ccx qubits[53],qubits[83],qubits[136];
-h qubits[136];
-h qubits[136];
-ccx qubits[52],qubits[84],qubits[136];
-h qubits[136];
-h qubits[136];
-ccx qubits[51],qubits[85],qubits[136];
-h qubits[136];
-h qubits[136];
-ccx qubits[50],qubits[86],qubits[136];
-h qubits[136];
-h qubits[136];
-ccx qubits[49],qubits[87],qubits[136];
-h qubits[136];
-h qubits[136];
-ccx qubits[48],qubits[88],qubits[136];
-h qubits[136];
-h qubits[136];
-ccx qubits[47],qubits[89],qubits[136];
-h qubits[136];
-h qubits[136];
-ccx qubits[46],qubits[90],qubits[136];
-h qubits[136];
-h qubits[136];
-ccx qubits[45],qubits[91],qubits[136];
-h qubits[136];
-h qubits[136];
-ccx qubits[44],qubits[92],qubits[136];
-h qubits[136];
-h qubits[136];
-ccx qubits[43],qubits[93],qubits[136];
-h qubits[136];
-h qubits[136];
-ccx qubits[42],qubits[94],qubits[136];
-h qubits[136];
-h qubits[136];
-ccx qubits[41],qubits[95],qubits[136];
-h qubits[136];
-h qubits[136];
-ccx qubits[40],qubits[96],qubits[136];
-h qubits[136];
-h qubits[136];
-ccx qubits[39],qubits[97],qubits[136];
-h qubits[136];
-h qubits[136];
-ccx qubits[38],qubits[98],qubits[136];
-h qubits[136];
-h qubits[136];
-ccx qubits[37],qubits[99],qubits[136];
-h qubits[136];
-h qubits[136];
-ccx qubits[36],qubits[100],qubits[136];
-h qubits[136];
-h qubits[136];
-ccx qubits[35],qubits[101],qubits[136];
-h qubits[136];
-h qubits[136];
-ccx qubits[34],qubits[102],qubits[136];
-h qubits[136];
-h qubits[136];
-ccx qubits[33],qubits[103],qubits[136];
-h qubits[136];
-h qubits[136];
-ccx qubits[32],qubits[104],qubits[136];
-h qubits[136];
-h qubits[136];
-ccx qubits[31],qubits[105],qubits[136];
-h qubits[136];
-h qubits[136];
-ccx qubits[30],qubits[106],qubits[136];
-h qubits[136];
-h qubits[136];
-ccx qubits[29],qubits[107],qubits[136];
-h qubits[136];
-h qubits[136];
-ccx qubits[28],qubits[108],qubits[136];
-h qubits[136];
-h qubits[136];
-ccx qubits[27],qubits[109],qubits[136];
-h qubits[136];
-h qubits[136];
-ccx qubits[26],qubits[110],qubits[136];
-h qubits[136];
-h qubits[136];
-ccx qubits[25],qubits[111],qubits[136];
-h qubits[136];
-h qubits[136];
-ccx qubits[24],qubits[112],qubits[136];
-h qubits[136];
-h qubits[136];
-ccx qubits[23],qubits[113],qubits[136];
-h qubits[136];
-h qubits[136];
-ccx qubits[22],qubits[114],qubits[136];
-h qubits[136];
-h qubits[136];
-ccx qubits[21],qubits[115],qubits[136];
-h qubits[136];
-h qubits[136];
-ccx qubits[20],qubits[116],qubits[136];
-h qubits[136];
-h qubits[136];
-ccx qubits[19],qubits[117],qubits[136];
-h qubits[136];
-h qubits[136];
-ccx qubits[18],qubits[118],qubits[136];
-h qubits[136];
-h qubits[136];
-ccx qubits[17],qubits[119],qubits[136];
-h qubits[136];
-h qubits[136];
-ccx qubits[16],qubits[120],qubits[136];
-h qubits[136];
-h qubits[136];
-ccx qubits[15],qubits[121],qubits[136];
-h qubits[136];
-h qubits[136];
-ccx qubits[14],qubits[122],qubits[136];
-h qubits[136];
-h qubits[136];
-ccx qubits[13],qubits[123],qubits[136];
-h qubits[136];
-h qubits[136];
-ccx qubits[12],qubits[124],qubits[136];
-h qubits[136];
-h qubits[136];
-ccx qubits[11],qubits[125],qubits[136];
-h qubits[136];
-h qubits[136];
-ccx qubits[10],qubits[126],qubits[136];
-h qubits[136];
-h qubits[136];
-ccx qubits[9],qubits[127],qubits[136];
-h qubits[136];
-h qubits[137];
-ccx qubits[63],qubits[74],qubits[137];
-h qubits[137];
-h qubits[137];
-ccx qubits[62],qubits[75],qubits[137];
-h qubits[137];
-h qubits[137];
-ccx qubits[61],qubits[76],qubits[137];
-h qubits[137];
-h qubits[137];
-ccx qubits[60],qubits[77],qubits[137];
-h qubits[137];
-h qubits[137];
-ccx qubits[59],qubits[78],qubits[137];
-h qubits[137];
-h qubits[137];
-ccx qubits[58],qubits[79],qubits[137];
-h qubits[137];
-h qubits[137];
-ccx qubits[57],qubits[80],qubits[137];
-h qubits[137];
-h qubits[137];
-ccx qubits[56],qubits[81],qubits[137];
-h qubits[137];
-h qubits[137];
-ccx qubits[55],qubits[82],qubits[137];
-h qubits[137];
-h qubits[137];
-ccx qubits[54],qubits[83],qubits[137];
-h qubits[137];
-h qubits[137];
-ccx qubits[53],qubits[84],qubits[137];
-h qubits[137];
-h qubits[137];
-ccx qubits[52],qubits[85],qubits[137];
-h qubits[137];
-h qubits[137];
-ccx qubits[51],qubits[86],qubits[137];
-h qubits[137];
-h qubits[137];
-ccx qubits[50],qubits[87],qubits[137];
-h qubits[137];
-h qubits[137];
-ccx qubits[49],qubits[88],qubits[137];
-h qubits[137];
-h qubits[137];
-ccx qubits[48],qubits[89],qubits[137];
-h qubits[137];
-h qubits[137];
-ccx qubits[47],qubits[90],qubits[137];
-h qubits[137];
-h qubits[137];
-ccx qubits[46],qubits[91],qubits[137];
-h qubits[137];
-h qubits[137];
-ccx qubits[45],qubits[92],qubits[137];
-h qubits[137];
-h qubits[137];
-ccx qubits[44],qubits[93],qubits[137];
-h qubits[137];
-h qubits[137];
-ccx qubits[43],qubits[94],qubits[137];
-h qubits[137];
-h qubits[137];
-ccx qubits[42],qubits[95],qubits[137];
-h qubits[137];
-h qubits[137];
-ccx qubits[41],qubits[96],qubits[137];
-h qubits[137];
-h qubits[137];
-ccx qubits[40],qubits[97],qubits[137];
-h qubits[137];
-h qubits[137];
-ccx qubits[39],qubits[98],qubits[137];
-h qubits[137];
-h qubits[137];
-ccx qubits[38],qubits[99],qubits[137];
-h qubits[137];
-h qubits[137];
-ccx qubits[37],qubits[100],qubits[137];
-h qubits[137];
-h qubits[137];
-ccx qubits[36],qubits[101],qubits[137];
-h qubits[137];
-h qubits[137];
-ccx qubits[35],qubits[102],qubits[137];
-h qubits[137];
-h qubits[137];
-ccx qubits[34],qubits[103],qubits[137];
-h qubits[137];
-h qubits[137];
-ccx qubits[33],qubits[104],qubits[137];
-h qubits[137];
-h qubits[137];
-ccx qubits[32],qubits[105],qubits[137];
-h qubits[137];
-h qubits[137];
-ccx qubits[31],qubits[106],qubits[137];
-h qubits[137];
-h qubits[137];
-ccx qubits[30],qubits[107],qubits[137];
-h qubits[137];
-h qubits[137];
-ccx qubits[29],qubits[108],qubits[137];
-h qubits[137];
-h qubits[137];
-ccx qubits[28],qubits[109],qubits[137];
-h qubits[137];
-h qubits[137];
-ccx qubits[27],qubits[110],qubits[137];
-h qubits[137];
-h qubits[137];
-ccx qubits[26],qubits[111],qubits[137];
-h qubits[137];
-h qubits[137];
-ccx qubits[25],qubits[112],qubits[137];
-h qubits[137];
-h qubits[137];
-ccx qubits[24],qubits[113],qubits[137];
-h qubits[137];
-h qubits[137];
-ccx qubits[23],qubits[114],qubits[137];
-h qubits[137];
-h qubits[137];
-ccx qubits[22],qubits[115],qubits[137];
-h qubits[137];
-h qubits[137];
-ccx qubits[21],qubits[116],qubits[137];
-h qubits[137];
-h qubits[137];
-ccx qubits[20],qubits[117],qubits[137];
-h qubits[137];
-h qubits[137];
-ccx qubits[19],qubits[118],qubits[137];
-h qubits[137];
-h qubits[137];
-ccx qubits[18],qubits[119],qubits[137];
-h qubits[137];
-h qubits[137];
-ccx qubits[17],qubits[120],qubits[137];
-h qubits[137];
-h qubits[137];
-ccx qubits[16],qubits[121],qubits[137];
-h qubits[137];
-h qubits[137];
-ccx qubits[15],qubits[122],qubits[137];
-h qubits[137];
-h qubits[137];
-ccx qubits[14],qubits[123],qubits[137];
-h qubits[137];
-h qubits[137];
-ccx qubits[13],qubits[124],qubits[137];
-h qubits[137];
-h qubits[137];
-ccx qubits[12],qubits[125],qubits[137];
-h qubits[137];
-h qubits[137];
-ccx qubits[11],qubits[126],qubits[137];
-h qubits[137];
-h qubits[137];
-ccx qubits[10],qubits[127],qubits[137];
-h qubits[137];
-h qubits[138];
-ccx qubits[63],qubits[75],qubits[138];
-h qubits[138];
-h qubits[138];
-ccx qubits[62],qubits[76],qubits[138];
-h qubits[138];
-h qubits[138];
-ccx qubits[61],qubits[77],qubits[138];
-h qubits[138];
-h qubits[138];
-ccx qubits[60],qubits[78],qubits[138];
-h qubits[138];
-h qubits[138];
-ccx qubits[59],qubits[79],qubits[138];
-h qubits[138];
-h qubits[138];
-ccx qubits[58],qubits[80],qubits[138];
-h qubits[138];
-h qubits[138];
-ccx qubits[57],qubits[81],qubits[138];
-h qubits[138];
-h qubits[138];
-ccx qubits[56],qubits[82],qubits[138];
-h qubits[138];
-h qubits[138];
-ccx qubits[55],qubits[83],qubits[138];
-h qubits[138];
-h qubits[138];
-ccx qubits[54],qubits[84],qubits[138];
-h qubits[138];
-h qubits[138];
-ccx qubits[53],qubits[85],qubits[138];
-h qubits[138];
-h qubits[138];
-ccx qubits[52],qubits[86],qubits[138];
-h qubits[138];
-h qubits[138];
-ccx qubits[51],qubits[87],qubits[138];
-h qubits[138];
-h qubits[138];
-ccx qubits[50],qubits[88],qubits[138];
-h qubits[138];
-h qubits[138];
-ccx qubits[49],qubits[89],qubits[138];
-h qubits[138];
-h qubits[138];
-ccx qubits[48],qubits[90],qubits[138];
-h qubits[138];
-h qubits[138];
-ccx qubits[47],qubits[91],qubits[138];
-h qubits[138];
-h qubits[138];
-ccx qubits[46],qubits[92],qubits[138];
-h qubits[138];
-h qubits[138];
-ccx qubits[45],qubits[93],qubits[138];
-h qubits[138];
-h qubits[138];
-ccx qubits[44],qubits[94],qubits[138];
-h qubits[138];
-h qubits[138];
-ccx qubits[43],qubits[95],qubits[138];
-h qubits[138];
-h qubits[138];
-ccx qubits[42],qubits[96],qubits[138];
-h qubits[138];
-h qubits[138];
-ccx qubits[41],qubits[97],qubits[138];
-h qubits[138];
-h qubits[138];
-ccx qubits[40],qubits[98],qubits[138];
-h qubits[138];
-h qubits[138];
-ccx qubits[39],qubits[99],qubits[138];
-h qubits[138];
-h qubits[138];
-ccx qubits[38],qubits[100],qubits[138];
-h qubits[138];
-h qubits[138];
-ccx qubits[37],qubits[101],qubits[138];
-h qubits[138];
-h qubits[138];
-ccx qubits[36],qubits[102],qubits[138];
-h qubits[138];
-h qubits[138];
-ccx qubits[35],qubits[103],qubits[138];
-h qubits[138];
-h qubits[138];
-ccx qubits[34],qubits[104],qubits[138];
-h qubits[138];
-h qubits[138];
-ccx qubits[33],qubits[105],qubits[138];
-h qubits[138];
-h qubits[138];
-ccx qubits[32],qubits[106],qubits[138];
-h qubits[138];
-h qubits[138];
-ccx qubits[31],qubits[107],qubits[138];
-h qubits[138];
-h qubits[138];
-ccx qubits[30],qubits[108],qubits[138];
-h qubits[138];
-h qubits[138];
-ccx qubits[29],qubits[109],qubits[138];
-h qubits[138];
-h qubits[138];
-ccx qubits[28],qubits[110],qubits[138];
-h qubits[138];
-h qubits[138];
-ccx qubits[27],qubits[111],qubits[138];
-h qubits[138];
-h qubits[138];
-ccx qubits[26],qubits[112],qubits[138];
-h qubits[138];
-h qubits[138];
-ccx qubits[25],qubits[113],qubits[138];
-h qubits[138];
-h qubits[138];
-ccx qubits[24],qubits[114],qubits[138];
-h qubits[138];
-h qubits[138];
-ccx qubits[23],qubits[115],qubits[138];
-h qubits[138];
-h qubits[138];
-ccx qubits[22],qubits[116],qubits[138];
-h qubits[138];
-h qubits[138];
-ccx qubits[21],qubits[117],qubits[138];
-h qubits[138];
-h qubits[138];
-ccx qubits[20],qubits[118],qubits[138];
-h qubits[138];
-h qubits[138];
-ccx qubits[19],qubits[119],qubits[138];
-h qubits[138];
-h qubits[138];
-ccx qubits[18],qubits[120],qubits[138];
-h qubits[138];
-h qubits[138];
-ccx qubits[17],qubits[121],qubits[138];
-h qubits[138];
-h qubits[138];
-ccx qubits[16],qubits[122],qubits[138];
-h qubits[138];
-h qubits[138];
-ccx qubits[15],qubits[123],qubits[138];
-h qubits[138];
-h qubits[138];
-ccx qubits[14],qubits[124],qubits[138];
-h qubits[138];
-h qubits[138];
-ccx qubits[13],qubits[125],qubits[138];
-h qubits[138];
-h qubits[138];
-ccx qubits[12],qubits[126],qubits[138];
-h qubits[138];
-h qubits[138];
-ccx qubits[11],qubits[127],qubits[138];
-h qubits[138];
-h qubits[139];
-ccx qubits[63],qubits[76],qubits[139];
-h qubits[139];
-h qubits[139];
-ccx qubits[62],qubits[77],qubits[139];
-h qubits[139];
-h qubits[139];
-ccx qubits[61],qubits[78],qubits[139];
-h qubits[139];
-h qubits[139];
-ccx qubits[60],qubits[79],qubits[139];
-h qubits[139];
-h qubits[139];
-ccx qubits[59],qubits[80],qubits[139];
-h qubits[139];
-h qubits[139];
-ccx qubits[58],qubits[81],qubits[139];
-h qubits[139];
-h qubits[139];
-ccx qubits[57],qubits[82],qubits[139];
-h qubits[139];
-h qubits[139];
-ccx qubits[56],qubits[83],qubits[139];
-h qubits[139];
-h qubits[139];
-ccx qubits[55],qubits[84],qubits[139];
-h qubits[139];
-h qubits[139];
-ccx qubits[54],qubits[85],qubits[139];
-h qubits[139];
-h qubits[139];
-ccx qubits[53],qubits[86],qubits[139];
-h qubits[139];
-h qubits[139];
-ccx qubits[52],qubits[87],qubits[139];
-h qubits[139];
-h qubits[139];
-ccx qubits[51],qubits[88],qubits[139];
-h qubits[139];
-h qubits[139];
-ccx qubits[50],qubits[89],qubits[139];
-h qubits[139];
-h qubits[139];
-ccx qubits[49],qubits[90],qubits[139];
-h qubits[139];
-h qubits[139];
-ccx qubits[48],qubits[91],qubits[139];
-h qubits[139];
-h qubits[139];
-ccx qubits[47],qubits[92],qubits[139];
-h qubits[139];
-h qubits[139];
-ccx qubits[46],qubits[93],qubits[139];
-h qubits[139];
-h qubits[139];
-ccx qubits[45],qubits[94],qubits[139];
-h qubits[139];
-h qubits[139];
-ccx qubits[44],qubits[95],qubits[139];
-h qubits[139];
-h qubits[139];
-ccx qubits[43],qubits[96],qubits[139];
-h qubits[139];
-h qubits[139];
-ccx qubits[42],qubits[97],qubits[139];
-h qubits[139];
-h qubits[139];
-ccx qubits[41],qubits[98],qubits[139];
-h qubits[139];
-h qubits[139];
-ccx qubits[40],qubits[99],qubits[139];
-h qubits[139];
-h qubits[139];
-ccx qubits[39],qubits[100],qubits[139];
-h qubits[139];
-h qubits[139];
-ccx qubits[38],qubits[101],qubits[139];
-h qubits[139];
-h qubits[139];
-ccx qubits[37],qubits[102],qubits[139];
-h qubits[139];
-h qubits[139];
-ccx qubits[36],qubits[103],qubits[139];
-h qubits[139];
-h qubits[139];
-ccx qubits[35],qubits[104],qubits[139];
-h qubits[139];
-h qubits[139];
-ccx qubits[34],qubits[105],qubits[139];
-h qubits[139];
-h qubits[139];
-ccx qubits[33],qubits[106],qubits[139];
-h qubits[139];
-h qubits[139];
-ccx qubits[32],qubits[107],qubits[139];
-h qubits[139];
-h qubits[139];
-ccx qubits[31],qubits[108],qubits[139];
-h qubits[139];
-h qubits[139];
-ccx qubits[30],qubits[109],qubits[139];
-h qubits[139];
-h qubits[139];
-ccx qubits[29],qubits[110],qubits[139];
-h qubits[139];
-h qubits[139];
-ccx qubits[28],qubits[111],qubits[139];
-h qubits[139];
-h qubits[139];
-ccx qubits[27],qubits[112],qubits[139];
-h qubits[139];
-h qubits[139];
-ccx qubits[26],qubits[113],qubits[139];
-h qubits[139];
-h qubits[139];
-ccx qubits[25],qubits[114],qubits[139];
-h qubits[139];
-h qubits[139];
-ccx qubits[24],qubits[115],qubits[139];
-h qubits[139];
-h qubits[139];
-ccx qubits[23],qubits[116],qubits[139];
-h qubits[139];
-h qubits[139];
-ccx qubits[22],qubits[117],qubits[139];
-h qubits[139];
-h qubits[139];
-ccx qubits[21],qubits[118],qubits[139];
-h qubits[139];
-h qubits[139];
-ccx qubits[20],qubits[119],qubits[139];
-h qubits[139];
-h qubits[139];
-ccx qubits[19],qubits[120],qubits[139];
-h qubits[139];
-h qubits[139];
-ccx qubits[18],qubits[121],qubits[139];
-h qubits[139];
-h qubits[139];
-ccx qubits[17],qubits[122],qubits[139];
-h qubits[139];
-h qubits[139];
-ccx qubits[16],qubits[123],qubits[139];
-h qubits[139];
-h qubits[139];
-ccx qubits[15],qubits[124],qubits[139];
-h qubits[139];
-h qubits[139];
-ccx qubits[14],qubits[125],qubits[139];
-h qubits[139];
-h qubits[139];
-ccx qubits[13],qubits[126],qubits[139];
-h qubits[139];
-h qubits[139];
-ccx qubits[12],qubits[127],qubits[139];
-h qubits[139];
-h qubits[140];
-ccx qubits[63],qubits[77],qubits[140];
-h qubits[140];
-h qubits[140];
-ccx qubits[62],qubits[78],qubits[140];
-h qubits[140];
-h qubits[140];
-ccx qubits[61],qubits[79],qubits[140];
-h qubits[140];
-h qubits[140];
-ccx qubits[60],qubits[80],qubits[140];
-h qubits[140];
-h qubits[140];
-ccx qubits[59],qubits[81],qubits[140];
-h qubits[140];
-h qubits[140];
-ccx qubits[58],qubits[82],qubits[140];
-h qubits[140];
-h qubits[140];
-ccx qubits[57],qubits[83],qubits[140];
-h qubits[140];
-h qubits[140];
-ccx qubits[56],qubits[84],qubits[140];
-h qubits[140];
-h qubits[140];
-ccx qubits[55],qubits[85],qubits[140];
-h qubits[140];
-h qubits[140];
-ccx qubits[54],qubits[86],qubits[140];
-h qubits[140];
-h qubits[140];
-ccx qubits[53],qubits[87],qubits[140];
-h qubits[140];
-h qubits[140];
-ccx qubits[52],qubits[88],qubits[140];
-h qubits[140];
-h qubits[140];
-ccx qubits[51],qubits[89],qubits[140];
-h qubits[140];
-h qubits[140];
-ccx qubits[50],qubits[90],qubits[140];
-h qubits[140];
-h qubits[140];
-ccx qubits[49],qubits[91],qubits[140];
-h qubits[140];
-h qubits[140];
-ccx qubits[48],qubits[92],qubits[140];
-h qubits[140];
-h qubits[140];
-ccx qubits[47],qubits[93],qubits[140];
-h qubits[140];
-h qubits[140];
-ccx qubits[46],qubits[94],qubits[140];
-h qubits[140];
-h qubits[140];
-ccx qubits[45],qubits[95],qubits[140];
-h qubits[140];
-h qubits[140];
-ccx qubits[44],qubits[96],qubits[140];
-h qubits[140];
-h qubits[140];
-ccx qubits[43],qubits[97],qubits[140];
-h qubits[140];
-h qubits[140];
-ccx qubits[42],qubits[98],qubits[140];
-h qubits[140];
-h qubits[140];
-ccx qubits[41],qubits[99],qubits[140];
-h qubits[140];
-h qubits[140];
-ccx qubits[40],qubits[100],qubits[140];
-h qubits[140];
-h qubits[140];
-ccx qubits[39],qubits[101],qubits[140];
-h qubits[140];
-h qubits[140];
-ccx qubits[38],qubits[102],qubits[140];
-h qubits[140];
-h qubits[140];
-ccx qubits[37],qubits[103],qubits[140];
-h qubits[140];
-h qubits[140];
-ccx qubits[36],qubits[104],qubits[140];
-h qubits[140];
-h qubits[140];
-ccx qubits[35],qubits[105],qubits[140];
-h qubits[140];
-h qubits[140];
-ccx qubits[34],qubits[106],qubits[140];
-h qubits[140];
-h qubits[140];
-ccx qubits[33],qubits[107],qubits[140];
-h qubits[140];
-h qubits[140];
-ccx qubits[32],qubits[108],qubits[140];
-h qubits[140];
-h qubits[140];
-ccx qubits[31],qubits[109],qubits[140];
-h qubits[140];
-h qubits[140];
-ccx qubits[30],qubits[110],qubits[140];
-h qubits[140];
-h qubits[140];
-ccx qubits[29],qubits[111],qubits[140];
-h qubits[140];
-h qubits[140];
-ccx qubits[28],qubits[112],qubits[140];
-h qubits[140];
-h qubits[140];
-ccx qubits[27],qubits[113],qubits[140];
-h qubits[140];
-h qubits[140];
-ccx qubits[26],qubits[114],qubits[140];
-h qubits[140];
-h qubits[140];
-ccx qubits[25],qubits[115],qubits[140];
-h qubits[140];
-h qubits[140];
-ccx qubits[24],qubits[116],qubits[140];
-h qubits[140];
-h qubits[140];
-ccx qubits[23],qubits[117],qubits[140];
-h qubits[140];
-h qubits[140];
-ccx qubits[22],qubits[118],qubits[140];
-h qubits[140];
-h qubits[140];
-ccx qubits[21],qubits[119],qubits[140];
-h qubits[140];
-h qubits[140];
-ccx qubits[20],qubits[120],qubits[140];
-h qubits[140];
-h qubits[140];
-ccx qubits[19],qubits[121],qubits[140];
-h qubits[140];
-h qubits[140];
-ccx qubits[18],qubits[122],qubits[140];
-h qubits[140];
-h qubits[140];
-ccx qubits[17],qubits[123],qubits[140];
-h qubits[140];
-h qubits[140];
-ccx qubits[16],qubits[124],qubits[140];
-h qubits[140];
-h qubits[140];
-ccx qubits[15],qubits[125],qubits[140];
-h qubits[140];
-h qubits[140];
-ccx qubits[14],qubits[126],qubits[140];
-h qubits[140];
-h qubits[140];
-ccx qubits[13],qubits[127],qubits[140];
-h qubits[140];
-h qubits[141];
-ccx qubits[63],qubits[78],qubits[141];
-h qubits[141];
-h qubits[141];
-ccx qubits[62],qubits[79],qubits[141];
-h qubits[141];
-h qubits[141];
-ccx qubits[61],qubits[80],qubits[141];
-h qubits[141];
-h qubits[141];
-ccx qubits[60],qubits[81],qubits[141];
-h qubits[141];
-h qubits[141];
-ccx qubits[59],qubits[82],qubits[141];
-h qubits[141];
-h qubits[141];
-ccx qubits[58],qubits[83],qubits[141];
-h qubits[141];
-h qubits[141];
-ccx qubits[57],qubits[84],qubits[141];
-h qubits[141];
-h qubits[141];
-ccx qubits[56],qubits[85],qubits[141];
-h qubits[141];
-h qubits[141];
-ccx qubits[55],qubits[86],qubits[141];
-h qubits[141];
-h qubits[141];
-ccx qubits[54],qubits[87],qubits[141];
-h qubits[141];
-h qubits[141];
-ccx qubits[53],qubits[88],qubits[141];
-h qubits[141];
-h qubits[141];
-ccx qubits[52],qubits[89],qubits[141];
-h qubits[141];
-h qubits[141];
-ccx qubits[51],qubits[90],qubits[141];
-h qubits[141];
-h qubits[141];
-ccx qubits[50],qubits[91],qubits[141];
-h qubits[141];
-h qubits[141];
-ccx qubits[49],qubits[92],qubits[141];
-h qubits[141];
-h qubits[141];
-ccx qubits[48],qubits[93],qubits[141];
-h qubits[141];
-h qubits[141];
-ccx qubits[47],qubits[94],qubits[141];
-h qubits[141];
-h qubits[141];
-ccx qubits[46],qubits[95],qubits[141];
-h qubits[141];
-h qubits[141];
-ccx qubits[45],qubits[96],qubits[141];
-h qubits[141];
-h qubits[141];
-ccx qubits[44],qubits[97],qubits[141];
-h qubits[141];
-h qubits[141];
-ccx qubits[43],qubits[98],qubits[141];
-h qubits[141];
-h qubits[141];
-ccx qubits[42],qubits[99],qubits[141];
-h qubits[141];
-h qubits[141];
-ccx qubits[41],qubits[100],qubits[141];
-h qubits[141];
-h qubits[141];
-ccx qubits[40],qubits[101],qubits[141];
-h qubits[141];
-h qubits[141];
-ccx qubits[39],qubits[102],qubits[141];
-h qubits[141];
-h qubits[141];
-ccx qubits[38],qubits[103],qubits[141];
-h qubits[141];
-h qubits[141];
-ccx qubits[37],qubits[104],qubits[141];
-h qubits[141];
-h qubits[141];
-ccx qubits[36],qubits[105],qubits[141];
-h qubits[141];
-h qubits[141];
-ccx qubits[35],qubits[106],qubits[141];
-h qubits[141];
-h qubits[141];
-ccx qubits[34],qubits[107],qubits[141];
-h qubits[141];
-h qubits[141];
-ccx qubits[33],qubits[108],qubits[141];
-h qubits[141];
-h qubits[141];
-ccx qubits[32],qubits[109],qubits[141];
-h qubits[141];
-h qubits[141];
-ccx qubits[31],qubits[110],qubits[141];
-h qubits[141];
-h qubits[141];
-ccx qubits[30],qubits[111],qubits[141];
-h qubits[141];
-h qubits[141];
-ccx qubits[29],qubits[112],qubits[141];
-h qubits[141];
-h qubits[141];
-ccx qubits[28],qubits[113],qubits[141];
-h qubits[141];
-h qubits[141];
-ccx qubits[27],qubits[114],qubits[141];
-h qubits[141];
-h qubits[141];
-ccx qubits[26],qubits[115],qubits[141];
-h qubits[141];
-h qubits[141];
-ccx qubits[25],qubits[116],qubits[141];
-h qubits[141];
-h qubits[141];
-ccx qubits[24],qubits[117],qubits[141];
-h qubits[141];
-h qubits[141];
-ccx qubits[23],qubits[118],qubits[141];
-h qubits[141];
-h qubits[141];
-ccx qubits[22],qubits[119],qubits[141];
-h qubits[141];
-h qubits[141];
-ccx qubits[21],qubits[120],qubits[141];
-h qubits[141];
-h qubits[141];
-ccx qubits[20],qubits[121],qubits[141];
-h qubits[141];
-h qubits[141];
-ccx qubits[19],qubits[122],qubits[141];
-h qubits[141];
-h qubits[141];
-ccx qubits[18],qubits[123],qubits[141];
-h qubits[141];
-h qubits[141];
-ccx qubits[17],qubits[124],qubits[141];
-h qubits[141];
-h qubits[141];
-ccx qubits[16],qubits[125],qubits[141];
-h qubits[141];
-h qubits[141];
-ccx qubits[15],qubits[126],qubits[141];
-h qubits[141];
-h qubits[141];
-ccx qubits[14],qubits[127],qubits[141];
-h qubits[141];
-h qubits[142];
-ccx qubits[63],qubits[79],qubits[142];
-h qubits[142];
-h qubits[142];
-ccx qubits[62],qubits[80],qubits[142];
-h qubits[142];
-h qubits[142];
-ccx qubits[61],qubits[81],qubits[142];
-h qubits[142];
-h qubits[142];
-ccx qubits[60],qubits[82],qubits[142];
-h qubits[142];
-h qubits[142];
-ccx qubits[59],qubits[83],qubits[142];
-h qubits[142];
-h qubits[142];
-ccx qubits[58],qubits[84],qubits[142];
-h qubits[142];
-h qubits[142];
-ccx qubits[57],qubits[85],qubits[142];
-h qubits[142];
-h qubits[142];
-ccx qubits[56],qubits[86],qubits[142];
-h qubits[142];
-h qubits[142];
-ccx qubits[55],qubits[87],qubits[142];
-h qubits[142];
-h qubits[142];
-ccx qubits[54],qubits[88],qubits[142];
-h qubits[142];
-h qubits[142];
-ccx qubits[53],qubits[89],qubits[142];
-h qubits[142];
-h qubits[142];
-ccx qubits[52],qubits[90],qubits[142];
-h qubits[142];
-h qubits[142];
-ccx qubits[51],qubits[91],qubits[142];
-h qubits[142];
-h qubits[142];
-ccx qubits[50],qubits[92],qubits[142];
-h qubits[142];
-h qubits[142];
-ccx qubits[49],qubits[93],qubits[142];
-h qubits[142];
-h qubits[142];
-ccx qubits[48],qubits[94],qubits[142];
-h qubits[142];
-h qubits[142];
-ccx qubits[47],qubits[95],qubits[142];
-h qubits[142];
-h qubits[142];
-ccx qubits[46],qubits[96],qubits[142];
-h qubits[142];
-h qubits[142];
-ccx qubits[45],qubits[97],qubits[142];
-h qubits[142];
-h qubits[142];
-ccx qubits[44],qubits[98],qubits[142];
-h qubits[142];
-h qubits[142];
-ccx qubits[43],qubits[99],qubits[142];
-h qubits[142];
-h qubits[142];
-ccx qubits[42],qubits[100],qubits[142];
-h qubits[142];
-h qubits[142];
-ccx qubits[41],qubits[101],qubits[142];
-h qubits[142];
-h qubits[142];
-ccx qubits[40],qubits[102],qubits[142];
-h qubits[142];
-h qubits[142];
-ccx qubits[39],qubits[103],qubits[142];
-h qubits[142];
-h qubits[142];
-ccx qubits[38],qubits[104],qubits[142];
-h qubits[142];
-h qubits[142];
-ccx qubits[37],qubits[105],qubits[142];
-h qubits[142];
-h qubits[142];
-ccx qubits[36],qubits[106],qubits[142];
-h qubits[142];
-h qubits[142];
-ccx qubits[35],qubits[107],qubits[142];
-h qubits[142];
-h qubits[142];
-ccx qubits[34],qubits[108],qubits[142];
-h qubits[142];
-h qubits[142];
-ccx qubits[33],qubits[109],qubits[142];
-h qubits[142];
-h qubits[142];
-ccx qubits[32],qubits[110],qubits[142];
-h qubits[142];
-h qubits[142];
-ccx qubits[31],qubits[111],qubits[142];
-h qubits[142];
-h qubits[142];
-ccx qubits[30],qubits[112],qubits[142];
-h qubits[142];
-h qubits[142];
-ccx qubits[29],qubits[113],qubits[142];
-h qubits[142];
-h qubits[142];
-ccx qubits[28],qubits[114],qubits[142];
-h qubits[142];
-h qubits[142];
-ccx qubits[27],qubits[115],qubits[142];
-h qubits[142];
-h qubits[142];
-ccx qubits[26],qubits[116],qubits[142];
-h qubits[142];
-h qubits[142];
-ccx qubits[25],qubits[117],qubits[142];
-h qubits[142];
-h qubits[142];
-ccx qubits[24],qubits[118],qubits[142];
-h qubits[142];
-h qubits[142];
-ccx qubits[23],qubits[119],qubits[142];
-h qubits[142];
-h qubits[142];
-ccx qubits[22],qubits[120],qubits[142];
-h qubits[142];
-h qubits[142];
-ccx qubits[21],qubits[121],qubits[142];
-h qubits[142];
-h qubits[142];
-ccx qubits[20],qubits[122],qubits[142];
-h qubits[142];
-h qubits[142];
-ccx qubits[19],qubits[123],qubits[142];
-h qubits[142];
-h qubits[142];
-ccx qubits[18],qubits[124],qubits[142];
-h qubits[142];
-h qubits[142];
-ccx qubits[17],qubits[125],qubits[142];
-h qubits[142];
-h qubits[142];
-ccx qubits[16],qubits[126],qubits[142];
-h qubits[142];
-h qubits[142];
-ccx qubits[15],qubits[127],qubits[142];
-h qubits[142];
-h qubits[143];
-ccx qubits[63],qubits[80],qubits[143];
-h qubits[143];
-h qubits[143];
-ccx qubits[62],qubits[81],qubits[143];
-h qubits[143];
-h qubits[143];
-ccx qubits[61],qubits[82],qubits[143];
-h qubits[143];
-h qubits[143];
-ccx qubits[60],qubits[83],qubits[143];
-h qubits[143];
-h qubits[143];
-ccx qubits[59],qubits[84],qubits[143];
-h qubits[143];
-h qubits[143];
-ccx qubits[58],qubits[85],qubits[143];
-h qubits[143];
-h qubits[143];
-ccx qubits[57],qubits[86],qubits[143];
-h qubits[143];
-h qubits[143];
-ccx qubits[56],qubits[87],qubits[143];
-h qubits[143];
-h qubits[143];
-ccx qubits[55],qubits[88],qubits[143];
-h qubits[143];
-h qubits[143];
-ccx qubits[54],qubits[89],qubits[143];
-h qubits[143];
-h qubits[143];
-ccx qubits[53],qubits[90],qubits[143];
-h qubits[143];
-h qubits[143];
-ccx qubits[52],qubits[91],qubits[143];
-h qubits[143];
-h qubits[143];
-ccx qubits[51],qubits[92],qubits[143];
-h qubits[143];
-h qubits[143];
-ccx qubits[50],qubits[93],qubits[143];
-h qubits[143];
-h qubits[143];
-ccx qubits[49],qubits[94],qubits[143];
-h qubits[143];
-h qubits[143];
-ccx qubits[48],qubits[95],qubits[143];
-h qubits[143];
-h qubits[143];
-ccx qubits[47],qubits[96],qubits[143];
-h qubits[143];
-h qubits[143];
-ccx qubits[46],qubits[97],qubits[143];
-h qubits[143];
-h qubits[143];
-ccx qubits[45],qubits[98],qubits[143];
-h qubits[143];
-h qubits[143];
-ccx qubits[44],qubits[99],qubits[143];
-h qubits[143];
-h qubits[143];
-ccx qubits[43],qubits[100],qubits[143];
-h qubits[143];
-h qubits[143];
-ccx qubits[42],qubits[101],qubits[143];
-h qubits[143];
-h qubits[143];
-ccx qubits[41],qubits[102],qubits[143];
-h qubits[143];
-h qubits[143];
-ccx qubits[40],qubits[103],qubits[143];
-h qubits[143];
-h qubits[143];
-ccx qubits[39],qubits[104],qubits[143];
-h qubits[143];
-h qubits[143];
-ccx qubits[38],qubits[105],qubits[143];
-h qubits[143];
-h qubits[143];
-ccx qubits[37],qubits[106],qubits[143];
-h qubits[143];
-h qubits[143];
-ccx qubits[36],qubits[107],qubits[143];
-h qubits[143];
-h qubits[143];
-ccx qubits[35],qubits[108],qubits[143];
-h qubits[143];
-h qubits[143];
-ccx qubits[34],qubits[109],qubits[143];
-h qubits[143];
-h qubits[143];
-ccx qubits[33],qubits[110],qubits[143];
-h qubits[143];
-h qubits[143];
-ccx qubits[32],qubits[111],qubits[143];
-h qubits[143];
-h qubits[143];
-ccx qubits[31],qubits[112],qubits[143];
-h qubits[143];
-h qubits[143];
-ccx qubits[30],qubits[113],qubits[143];
-h qubits[143];
-h qubits[143];
-ccx qubits[29],qubits[114],qubits[143];
-h qubits[143];
-h qubits[143];
-ccx qubits[28],qubits[115],qubits[143];
-h qubits[143];
-h qubits[143];
-ccx qubits[27],qubits[116],qubits[143];
-h qubits[143];
-h qubits[143];
-ccx qubits[26],qubits[117],qubits[143];
-h qubits[143];
-h qubits[143];
-ccx qubits[25],qubits[118],qubits[143];
-h qubits[143];
-h qubits[143];
-ccx qubits[24],qubits[119],qubits[143];
-h qubits[143];
-h qubits[143];
-ccx qubits[23],qubits[120],qubits[143];
-h qubits[143];
-h qubits[143];
-ccx qubits[22],qubits[121],qubits[143];
-h qubits[143];
-h qubits[143];
-ccx qubits[21],qubits[122],qubits[143];
-h qubits[143];
-h qubits[143];
-ccx qubits[20],qubits[123],qubits[143];
-h qubits[143];
-h qubits[143];
-ccx qubits[19],qubits[124],qubits[143];
-h qubits[143];
-h qubits[143];
-ccx qubits[18],qubits[125],qubits[143];
-h qubits[143];
-h qubits[143];
-ccx qubits[17],qubits[126],qubits[143];
-h qubits[143];
-h qubits[143];
-ccx qubits[16],qubits[127],qubits[143];
-h qubits[143];
-h qubits[144];
-ccx qubits[63],qubits[81],qubits[144];
-h qubits[144];
-h qubits[144];
-ccx qubits[62],qubits[82],qubits[144];
-h qubits[144];
-h qubits[144];
-ccx qubits[61],qubits[83],qubits[144];
-h qubits[144];
-h qubits[144];
-ccx qubits[60],qubits[84],qubits[144];
-h qubits[144];
-h qubits[144];
-ccx qubits[59],qubits[85],qubits[144];
-h qubits[144];
-h qubits[144];
-ccx qubits[58],qubits[86],qubits[144];
-h qubits[144];
-h qubits[144];
-ccx qubits[57],qubits[87],qubits[144];
-h qubits[144];
-h qubits[144];
-ccx qubits[56],qubits[88],qubits[144];
-h qubits[144];
-h qubits[144];
-ccx qubits[55],qubits[89],qubits[144];
-h qubits[144];
-h qubits[144];
-ccx qubits[54],qubits[90],qubits[144];
-h qubits[144];
-h qubits[144];
-ccx qubits[53],qubits[91],qubits[144];
-h qubits[144];
-h qubits[144];
-ccx qubits[52],qubits[92],qubits[144];
-h qubits[144];
-h qubits[144];
-ccx qubits[51],qubits[93],qubits[144];
-h qubits[144];
-h qubits[144];
-ccx qubits[50],qubits[94],qubits[144];
-h qubits[144];
-h qubits[144];
-ccx qubits[49],qubits[95],qubits[144];
-h qubits[144];
-h qubits[144];
-ccx qubits[48],qubits[96],qubits[144];
-h qubits[144];
-h qubits[144];
-ccx qubits[47],qubits[97],qubits[144];
-h qubits[144];
-h qubits[144];
-ccx qubits[46],qubits[98],qubits[144];
-h qubits[144];
-h qubits[144];
-ccx qubits[45],qubits[99],qubits[144];
-h qubits[144];
-h qubits[144];
-ccx qubits[44],qubits[100],qubits[144];
-h qubits[144];
-h qubits[144];
-ccx qubits[43],qubits[101],qubits[144];
-h qubits[144];
-h qubits[144];
-ccx qubits[42],qubits[102],qubits[144];
-h qubits[144];
-h qubits[144];
-ccx qubits[41],qubits[103],qubits[144];
-h qubits[144];
-h qubits[144];
-ccx qubits[40],qubits[104],qubits[144];
-h qubits[144];
-h qubits[144];
-ccx qubits[39],qubits[105],qubits[144];
-h qubits[144];
-h qubits[144];
-ccx qubits[38],qubits[106],qubits[144];
-h qubits[144];
-h qubits[144];
-ccx qubits[37],qubits[107],qubits[144];
-h qubits[144];
-h qubits[144];
-ccx qubits[36],qubits[108],qubits[144];
-h qubits[144];
-h qubits[144];
-ccx qubits[35],qubits[109],qubits[144];
-h qubits[144];
-h qubits[144];
-ccx qubits[34],qubits[110],qubits[144];
-h qubits[144];
-h qubits[144];
-ccx qubits[33],qubits[111],qubits[144];
-h qubits[144];
-h qubits[144];
-ccx qubits[32],qubits[112],qubits[144];
-h qubits[144];
-h qubits[144];
-ccx qubits[31],qubits[113],qubits[144];
-h qubits[144];
-h qubits[144];
-ccx qubits[30],qubits[114],qubits[144];
-h qubits[144];
-h qubits[144];
-ccx qubits[29],qubits[115],qubits[144];
-h qubits[144];
-h qubits[144];
-ccx qubits[28],qubits[116],qubits[144];
-h qubits[144];
-h qubits[144];
-ccx qubits[27],qubits[117],qubits[144];
-h qubits[144];
-h qubits[144];
-ccx qubits[26],qubits[118],qubits[144];
-h qubits[144];
-h qubits[144];
-ccx qubits[25],qubits[119],qubits[144];
-h qubits[144];
-h qubits[144];
-ccx qubits[24],qubits[120],qubits[144];
-h qubits[144];
-h qubits[144];
-ccx qubits[23],qubits[121],qubits[144];
-h qubits[144];
-h qubits[144];
-ccx qubits[22],qubits[122],qubits[144];
-h qubits[144];
-h qubits[144];
-ccx qubits[21],qubits[123],qubits[144];
-h qubits[144];
-h qubits[144];
-ccx qubits[20],qubits[124],qubits[144];
-h qubits[144];
-h qubits[144];
-ccx qubits[19],qubits[125],qubits[144];
-h qubits[144];
-h qubits[144];
-ccx qubits[18],qubits[126],qubits[144];
-h qubits[144];
-h qubits[144];
-ccx qubits[17],qubits[127],qubits[144];
-h qubits[144];
-h qubits[145];
-ccx qubits[63],qubits[82],qubits[145];
-h qubits[145];
-h qubits[145];
-ccx qubits[62],qubits[83],qubits[145];
-h qubits[145];
-h qubits[145];
-ccx qubits[61],qubits[84],qubits[145];
-h qubits[145];
-h qubits[145];
-ccx qubits[60],qubits[85],qubits[145];
-h qubits[145];
-h qubits[145];
-ccx qubits[59],qubits[86],qubits[145];
-h qubits[145];
-h qubits[145];
-ccx qubits[58],qubits[87],qubits[145];
-h qubits[145];
-h qubits[145];
-ccx qubits[57],qubits[88],qubits[145];
-h qubits[145];
-h qubits[145];
-ccx qubits[56],qubits[89],qubits[145];
-h qubits[145];
-h qubits[145];
-ccx qubits[55],qubits[90],qubits[145];
-h qubits[145];
-h qubits[145];
-ccx qubits[54],qubits[91],qubits[145];
-h qubits[145];
-h qubits[145];
-ccx qubits[53],qubits[92],qubits[145];
-h qubits[145];
-h qubits[145];
-ccx qubits[52],qubits[93],qubits[145];
-h qubits[145];
-h qubits[145];
-ccx qubits[51],qubits[94],qubits[145];
-h qubits[145];
-h qubits[145];
-ccx qubits[50],qubits[95],qubits[145];
-h qubits[145];
-h qubits[145];
-ccx qubits[49],qubits[96],qubits[145];
-h qubits[145];
-h qubits[145];
-ccx qubits[48],qubits[97],qubits[145];
-h qubits[145];
-h qubits[145];
-ccx qubits[47],qubits[98],qubits[145];
-h qubits[145];
-h qubits[145];
-ccx qubits[46],qubits[99],qubits[145];
-h qubits[145];
-h qubits[145];
-ccx qubits[45],qubits[100],qubits[145];
-h qubits[145];
-h qubits[145];
-ccx qubits[44],qubits[101],qubits[145];
-h qubits[145];
-h qubits[145];
-ccx qubits[43],qubits[102],qubits[145];
-h qubits[145];
-h qubits[145];
-ccx qubits[42],qubits[103],qubits[145];
-h qubits[145];
-h qubits[145];
-ccx qubits[41],qubits[104],qubits[145];
-h qubits[145];
-h qubits[145];
-ccx qubits[40],qubits[105],qubits[145];
-h qubits[145];
-h qubits[145];
-ccx qubits[39],qubits[106],qubits[145];
-h qubits[145];
-h qubits[145];
-ccx qubits[38],qubits[107],qubits[145];
-h qubits[145];
-h qubits[145];
-ccx qubits[37],qubits[108],qubits[145];
-h qubits[145];
-h qubits[145];
-ccx qubits[36],qubits[109],qubits[145];
-h qubits[145];
-h qubits[145];
-ccx qubits[35],qubits[110],qubits[145];
-h qubits[145];
-h qubits[145];
-ccx qubits[34],qubits[111],qubits[145];
-h qubits[145];
-h qubits[145];
-ccx qubits[33],qubits[112],qubits[145];
-h qubits[145];
-h qubits[145];
-ccx qubits[32],qubits[113],qubits[145];
-h qubits[145];
-h qubits[145];
-ccx qubits[31],qubits[114],qubits[145];
-h qubits[145];
-h qubits[145];
-ccx qubits[30],qubits[115],qubits[145];
-h qubits[145];
-h qubits[145];
-ccx qubits[29],qubits[116],qubits[145];
-h qubits[145];
-h qubits[145];
-ccx qubits[28],qubits[117],qubits[145];
-h qubits[145];
-h qubits[145];
-ccx qubits[27],qubits[118],qubits[145];
-h qubits[145];
-h qubits[145];
-ccx qubits[26],qubits[119],qubits[145];
-h qubits[145];
-h qubits[145];
-ccx qubits[25],qubits[120],qubits[145];
-h qubits[145];
-h qubits[145];
-ccx qubits[24],qubits[121],qubits[145];
-h qubits[145];
-h qubits[145];
-ccx qubits[23],qubits[122],qubits[145];
-h qubits[145];
-h qubits[145];
-ccx qubits[22],qubits[123],qubits[145];
-h qubits[145];
-h qubits[145];
-ccx qubits[21],qubits[124],qubits[145];
-h qubits[145];
-h qubits[145];
-ccx qubits[20],qubits[125],qubits[145];
-h qubits[145];
-h qubits[145];
-ccx qubits[19],qubits[126],qubits[145];
-h qubits[145];
-h qubits[145];
-ccx qubits[18],qubits[127],qubits[145];
-h qubits[145];
-h qubits[146];
-ccx qubits[63],qubits[83],qubits[146];
-h qubits[146];
-h qubits[146];
-ccx qubits[62],qubits[84],qubits[146];
-h qubits[146];
-h qubits[146];
-ccx qubits[61],qubits[85],qubits[146];
-h qubits[146];
-h qubits[146];
-ccx qubits[60],qubits[86],qubits[146];
-h qubits[146];
-h qubits[146];
-ccx qubits[59],qubits[87],qubits[146];
-h qubits[146];
-h qubits[146];
-ccx qubits[58],qubits[88],qubits[146];
-h qubits[146];
-h qubits[146];
-ccx qubits[57],qubits[89],qubits[146];
-h qubits[146];
-h qubits[146];
-ccx qubits[56],qubits[90],qubits[146];
-h qubits[146];
-h qubits[146];
-ccx qubits[55],qubits[91],qubits[146];
-h qubits[146];
-h qubits[146];
-ccx qubits[54],qubits[92],qubits[146];
-h qubits[146];
-h qubits[146];
-ccx qubits[53],qubits[93],qubits[146];
-h qubits[146];
-h qubits[146];
-ccx qubits[52],qubits[94],qubits[146];
-h qubits[146];
-h qubits[146];
-ccx qubits[51],qubits[95],qubits[146];
-h qubits[146];
-h qubits[146];
-ccx qubits[50],qubits[96],qubits[146];
-h qubits[146];
-h qubits[146];
-ccx qubits[49],qubits[97],qubits[146];
-h qubits[146];
-h qubits[146];
-ccx qubits[48],qubits[98],qubits[146];
-h qubits[146];
-h qubits[146];
-ccx qubits[47],qubits[99],qubits[146];
-h qubits[146];
-h qubits[146];
-ccx qubits[46],qubits[100],qubits[146];
-h qubits[146];
-h qubits[146];
-ccx qubits[45],qubits[101],qubits[146];
-h qubits[146];
-h qubits[146];
-ccx qubits[44],qubits[102],qubits[146];
-h qubits[146];
-h qubits[146];
-ccx qubits[43],qubits[103],qubits[146];
-h qubits[146];
-h qubits[146];
-ccx qubits[42],qubits[104],qubits[146];
-h qubits[146];
-h qubits[146];
-ccx qubits[41],qubits[105],qubits[146];
-h qubits[146];
-h qubits[146];
-ccx qubits[40],qubits[106],qubits[146];
-h qubits[146];
-h qubits[146];
-ccx qubits[39],qubits[107],qubits[146];
-h qubits[146];
-h qubits[146];
-ccx qubits[38],qubits[108],qubits[146];
-h qubits[146];
-h qubits[146];
-ccx qubits[37],qubits[109],qubits[146];
-h qubits[146];
-h qubits[146];
-ccx qubits[36],qubits[110],qubits[146];
-h qubits[146];
-h qubits[146];
-ccx qubits[35],qubits[111],qubits[146];
-h qubits[146];
-h qubits[146];
-ccx qubits[34],qubits[112],qubits[146];
-h qubits[146];
-h qubits[146];
-ccx qubits[33],qubits[113],qubits[146];
-h qubits[146];
-h qubits[146];
-ccx qubits[32],qubits[114],qubits[146];
-h qubits[146];
-h qubits[146];
-ccx qubits[31],qubits[115],qubits[146];
-h qubits[146];
-h qubits[146];
-ccx qubits[30],qubits[116],qubits[146];
-h qubits[146];
-h qubits[146];
-ccx qubits[29],qubits[117],qubits[146];
-h qubits[146];
-h qubits[146];
-ccx qubits[28],qubits[118],qubits[146];
-h qubits[146];
-h qubits[146];
-ccx qubits[27],qubits[119],qubits[146];
-h qubits[146];
-h qubits[146];
-ccx qubits[26],qubits[120],qubits[146];
-h qubits[146];
-h qubits[146];
-ccx qubits[25],qubits[121],qubits[146];
-h qubits[146];
-h qubits[146];
-ccx qubits[24],qubits[122],qubits[146];
-h qubits[146];
-h qubits[146];
-ccx qubits[23],qubits[123],qubits[146];
-h qubits[146];
-h qubits[146];
-ccx qubits[22],qubits[124],qubits[146];
-h qubits[146];
-h qubits[146];
-ccx qubits[21],qubits[125],qubits[146];
-h qubits[146];
-h qubits[146];
-ccx qubits[20],qubits[126],qubits[146];
-h qubits[146];
-h qubits[146];
-ccx qubits[19],qubits[127],qubits[146];
-h qubits[146];
-h qubits[147];
-ccx qubits[63],qubits[84],qubits[147];
-h qubits[147];
-h qubits[147];
-ccx qubits[62],qubits[85],qubits[147];
-h qubits[147];
-h qubits[147];
-ccx qubits[61],qubits[86],qubits[147];
-h qubits[147];
-h qubits[147];
-ccx qubits[60],qubits[87],qubits[147];
-h qubits[147];
-h qubits[147];
-ccx qubits[59],qubits[88],qubits[147];
-h qubits[147];
-h qubits[147];
-ccx qubits[58],qubits[89],qubits[147];
-h qubits[147];
-h qubits[147];
-ccx qubits[57],qubits[90],qubits[147];
-h qubits[147];
-h qubits[147];
-ccx qubits[56],qubits[91],qubits[147];
-h qubits[147];
-h qubits[147];
-ccx qubits[55],qubits[92],qubits[147];
-h qubits[147];
-h qubits[147];
-ccx qubits[54],qubits[93],qubits[147];
-h qubits[147];
-h qubits[147];
-ccx qubits[53],qubits[94],qubits[147];
-h qubits[147];
-h qubits[147];
-ccx qubits[52],qubits[95],qubits[147];
-h qubits[147];
-h qubits[147];
-ccx qubits[51],qubits[96],qubits[147];
-h qubits[147];
-h qubits[147];
-ccx qubits[50],qubits[97],qubits[147];
-h qubits[147];
-h qubits[147];
-ccx qubits[49],qubits[98],qubits[147];
-h qubits[147];
-h qubits[147];
-ccx qubits[48],qubits[99],qubits[147];
-h qubits[147];
-h qubits[147];
-ccx qubits[47],qubits[100],qubits[147];
-h qubits[147];
-h qubits[147];
-ccx qubits[46],qubits[101],qubits[147];
-h qubits[147];
-h qubits[147];
-ccx qubits[45],qubits[102],qubits[147];
-h qubits[147];
-h qubits[147];
-ccx qubits[44],qubits[103],qubits[147];
-h qubits[147];
-h qubits[147];
-ccx qubits[43],qubits[104],qubits[147];
-h qubits[147];
-h qubits[147];
-ccx qubits[42],qubits[105],qubits[147];
-h qubits[147];
-h qubits[147];
-ccx qubits[41],qubits[106],qubits[147];
-h qubits[147];
-h qubits[147];
-ccx qubits[40],qubits[107],qubits[147];
-h qubits[147];
-h qubits[147];
-ccx qubits[39],qubits[108],qubits[147];
-h qubits[147];
-h qubits[147];
-ccx qubits[38],qubits[109],qubits[147];
-h qubits[147];
-h qubits[147];
-ccx qubits[37],qubits[110],qubits[147];
-h qubits[147];
-h qubits[147];
-ccx qubits[36],qubits[111],qubits[147];
-h qubits[147];
-h qubits[147];
-ccx qubits[35],qubits[112],qubits[147];
-h qubits[147];
-h qubits[147];
-ccx qubits[34],qubits[113],qubits[147];
-h qubits[147];
-h qubits[147];
-ccx qubits[33],qubits[114],qubits[147];
-h qubits[147];
-h qubits[147];
-ccx qubits[32],qubits[115],qubits[147];
-h qubits[147];
-h qubits[147];
-ccx qubits[31],qubits[116],qubits[147];
-h qubits[147];
-h qubits[147];
-ccx qubits[30],qubits[117],qubits[147];
-h qubits[147];
-h qubits[147];
-ccx qubits[29],qubits[118],qubits[147];
-h qubits[147];
-h qubits[147];
-ccx qubits[28],qubits[119],qubits[147];
-h qubits[147];
-h qubits[147];
-ccx qubits[27],qubits[120],qubits[147];
-h qubits[147];
-h qubits[147];
-ccx qubits[26],qubits[121],qubits[147];
-h qubits[147];
-h qubits[147];
-ccx qubits[25],qubits[122],qubits[147];
-h qubits[147];
-h qubits[147];
-ccx qubits[24],qubits[123],qubits[147];
-h qubits[147];
-h qubits[147];
-ccx qubits[23],qubits[124],qubits[147];
-h qubits[147];
-h qubits[147];
-ccx qubits[22],qubits[125],qubits[147];
-h qubits[147];
-h qubits[147];
-ccx qubits[21],qubits[126],qubits[147];
-h qubits[147];
-h qubits[147];
-ccx qubits[20],qubits[127],qubits[147];
-h qubits[147];
-h qubits[148];
-ccx qubits[63],qubits[85],qubits[148];
-h qubits[148];
-h qubits[148];
-ccx qubits[62],qubits[86],qubits[148];
-h qubits[148];
-h qubits[148];
-ccx qubits[61],qubits[87],qubits[148];
-h qubits[148];
-h qubits[148];
-ccx qubits[60],qubits[88],qubits[148];
-h qubits[148];
-h qubits[148];
-ccx qubits[59],qubits[89],qubits[148];
-h qubits[148];
-h qubits[148];
-ccx qubits[58],qubits[90],qubits[148];
-h qubits[148];
-h qubits[148];
-ccx qubits[57],qubits[91],qubits[148];
-h qubits[148];
-h qubits[148];
-ccx qubits[56],qubits[92],qubits[148];
-h qubits[148];
-h qubits[148];
-ccx qubits[55],qubits[93],qubits[148];
-h qubits[148];
-h qubits[148];
-ccx qubits[54],qubits[94],qubits[148];
-h qubits[148];
-h qubits[148];
-ccx qubits[53],qubits[95],qubits[148];
-h qubits[148];
-h qubits[148];
-ccx qubits[52],qubits[96],qubits[148];
-h qubits[148];
-h qubits[148];
-ccx qubits[51],qubits[97],qubits[148];
-h qubits[148];
-h qubits[148];
-ccx qubits[50],qubits[98],qubits[148];
-h qubits[148];
-h qubits[148];
-ccx qubits[49],qubits[99],qubits[148];
-h qubits[148];
-h qubits[148];
-ccx qubits[48],qubits[100],qubits[148];
-h qubits[148];
-h qubits[148];
-ccx qubits[47],qubits[101],qubits[148];
-h qubits[148];
-h qubits[148];
-ccx qubits[46],qubits[102],qubits[148];
-h qubits[148];
-h qubits[148];
-ccx qubits[45],qubits[103],qubits[148];
-h qubits[148];
-h qubits[148];
-ccx qubits[44],qubits[104],qubits[148];
-h qubits[148];
-h qubits[148];
-ccx qubits[43],qubits[105],qubits[148];
-h qubits[148];
-h qubits[148];
-ccx qubits[42],qubits[106],qubits[148];
-h qubits[148];
-h qubits[148];
-ccx qubits[41],qubits[107],qubits[148];
-h qubits[148];
-h qubits[148];
-ccx qubits[40],qubits[108],qubits[148];
-h qubits[148];
-h qubits[148];
-ccx qubits[39],qubits[109],qubits[148];
-h qubits[148];
-h qubits[148];
-ccx qubits[38],qubits[110],qubits[148];
-h qubits[148];
-h qubits[148];
-ccx qubits[37],qubits[111],qubits[148];
-h qubits[148];
-h qubits[148];
-ccx qubits[36],qubits[112],qubits[148];
-h qubits[148];
-h qubits[148];
-ccx qubits[35],qubits[113],qubits[148];
-h qubits[148];
-h qubits[148];
-ccx qubits[34],qubits[114],qubits[148];
-h qubits[148];
-h qubits[148];
-ccx qubits[33],qubits[115],qubits[148];
-h qubits[148];
-h qubits[148];
-ccx qubits[32],qubits[116],qubits[148];
-h qubits[148];
-h qubits[148];
-ccx qubits[31],qubits[117],qubits[148];
-h qubits[148];
-h qubits[148];
-ccx qubits[30],qubits[118],qubits[148];
-h qubits[148];
-h qubits[148];
-ccx qubits[29],qubits[119],qubits[148];
-h qubits[148];
-h qubits[148];
-ccx qubits[28],qubits[120],qubits[148];
-h qubits[148];
-h qubits[148];
-ccx qubits[27],qubits[121],qubits[148];
-h qubits[148];
-h qubits[148];
-ccx qubits[26],qubits[122],qubits[148];
-h qubits[148];
-h qubits[148];
-ccx qubits[25],qubits[123],qubits[148];
-h qubits[148];
-h qubits[148];
-ccx qubits[24],qubits[124],qubits[148];
-h qubits[148];
-h qubits[148];
-ccx qubits[23],qubits[125],qubits[148];
-h qubits[148];
-h qubits[148];
-ccx qubits[22],qubits[126],qubits[148];
-h qubits[148];
-h qubits[148];
-ccx qubits[21],qubits[127],qubits[148];
-h qubits[148];
-h qubits[149];
-ccx qubits[63],qubits[86],qubits[149];
-h qubits[149];
-h qubits[149];
-ccx qubits[62],qubits[87],qubits[149];
-h qubits[149];
-h qubits[149];
-ccx qubits[61],qubits[88],qubits[149];
-h qubits[149];
-h qubits[149];
-ccx qubits[60],qubits[89],qubits[149];
-h qubits[149];
-h qubits[149];
-ccx qubits[59],qubits[90],qubits[149];
-h qubits[149];
-h qubits[149];
-ccx qubits[58],qubits[91],qubits[149];
-h qubits[149];
-h qubits[149];
-ccx qubits[57],qubits[92],qubits[149];
-h qubits[149];
-h qubits[149];
-ccx qubits[56],qubits[93],qubits[149];
-h qubits[149];
-h qubits[149];
-ccx qubits[55],qubits[94],qubits[149];
-h qubits[149];
-h qubits[149];
-ccx qubits[54],qubits[95],qubits[149];
-h qubits[149];
-h qubits[149];
-ccx qubits[53],qubits[96],qubits[149];
-h qubits[149];
-h qubits[149];
-ccx qubits[52],qubits[97],qubits[149];
-h qubits[149];
-h qubits[149];
-ccx qubits[51],qubits[98],qubits[149];
-h qubits[149];
-h qubits[149];
-ccx qubits[50],qubits[99],qubits[149];
-h qubits[149];
-h qubits[149];
-ccx qubits[49],qubits[100],qubits[149];
-h qubits[149];
-h qubits[149];
-ccx qubits[48],qubits[101],qubits[149];
-h qubits[149];
-h qubits[149];
-ccx qubits[47],qubits[102],qubits[149];
-h qubits[149];
-h qubits[149];
-ccx qubits[46],qubits[103],qubits[149];
-h qubits[149];
-h qubits[149];
-ccx qubits[45],qubits[104],qubits[149];
-h qubits[149];
-h qubits[149];
-ccx qubits[44],qubits[105],qubits[149];
-h qubits[149];
-h qubits[149];
-ccx qubits[43],qubits[106],qubits[149];
-h qubits[149];
-h qubits[149];
-ccx qubits[42],qubits[107],qubits[149];
-h qubits[149];
-h qubits[149];
-ccx qubits[41],qubits[108],qubits[149];
-h qubits[149];
-h qubits[149];
-ccx qubits[40],qubits[109],qubits[149];
-h qubits[149];
-h qubits[149];
-ccx qubits[39],qubits[110],qubits[149];
-h qubits[149];
-h qubits[149];
-ccx qubits[38],qubits[111],qubits[149];
-h qubits[149];
-h qubits[149];
-ccx qubits[37],qubits[112],qubits[149];
-h qubits[149];
-h qubits[149];
-ccx qubits[36],qubits[113],qubits[149];
-h qubits[149];
-h qubits[149];
-ccx qubits[35],qubits[114],qubits[149];
-h qubits[149];
-h qubits[149];
-ccx qubits[34],qubits[115],qubits[149];
-h qubits[149];
-h qubits[149];
-ccx qubits[33],qubits[116],qubits[149];
-h qubits[149];
-h qubits[149];
-ccx qubits[32],qubits[117],qubits[149];
-h qubits[149];
-h qubits[149];
-ccx qubits[31],qubits[118],qubits[149];
-h qubits[149];
-h qubits[149];
-ccx qubits[30],qubits[119],qubits[149];
-h qubits[149];
-h qubits[149];
-ccx qubits[29],qubits[120],qubits[149];
-h qubits[149];
-h qubits[149];
-ccx qubits[28],qubits[121],qubits[149];
-h qubits[149];
-h qubits[149];
-ccx qubits[27],qubits[122],qubits[149];
-h qubits[149];
-h qubits[149];
-ccx qubits[26],qubits[123],qubits[149];
-h qubits[149];
-h qubits[149];
-ccx qubits[25],qubits[124],qubits[149];
-h qubits[149];
-h qubits[149];
-ccx qubits[24],qubits[125],qubits[149];
-h qubits[149];
-h qubits[149];
-ccx qubits[23],qubits[126],qubits[149];
-h qubits[149];
-h qubits[149];
-ccx qubits[22],qubits[127],qubits[149];
-h qubits[149];
-h qubits[150];
-ccx qubits[63],qubits[87],qubits[150];
-h qubits[150];
-h qubits[150];
-ccx qubits[62],qubits[88],qubits[150];
-h qubits[150];
-h qubits[150];
-ccx qubits[61],qubits[89],qubits[150];
-h qubits[150];
-h qubits[150];
-ccx qubits[60],qubits[90],qubits[150];
-h qubits[150];
-h qubits[150];
-ccx qubits[59],qubits[91],qubits[150];
-h qubits[150];
-h qubits[150];
-ccx qubits[58],qubits[92],qubits[150];
-h qubits[150];
-h qubits[150];
-ccx qubits[57],qubits[93],qubits[150];
-h qubits[150];
-h qubits[150];
-ccx qubits[56],qubits[94],qubits[150];
-h qubits[150];
-h qubits[150];
-ccx qubits[55],qubits[95],qubits[150];
-h qubits[150];
-h qubits[150];
-ccx qubits[54],qubits[96],qubits[150];
-h qubits[150];
-h qubits[150];
-ccx qubits[53],qubits[97],qubits[150];
-h qubits[150];
-h qubits[150];
-ccx qubits[52],qubits[98],qubits[150];
-h qubits[150];
-h qubits[150];
-ccx qubits[51],qubits[99],qubits[150];
-h qubits[150];
-h qubits[150];
-ccx qubits[50],qubits[100],qubits[150];
-h qubits[150];
-h qubits[150];
-ccx qubits[49],qubits[101],qubits[150];
-h qubits[150];
-h qubits[150];
-ccx qubits[48],qubits[102],qubits[150];
-h qubits[150];
-h qubits[150];
-ccx qubits[47],qubits[103],qubits[150];
-h qubits[150];
-h qubits[150];
-ccx qubits[46],qubits[104],qubits[150];
-h qubits[150];
-h qubits[150];
-ccx qubits[45],qubits[105],qubits[150];
-h qubits[150];
-h qubits[150];
-ccx qubits[44],qubits[106],qubits[150];
-h qubits[150];
-h qubits[150];
-ccx qubits[43],qubits[107],qubits[150];
-h qubits[150];
-h qubits[150];
-ccx qubits[42],qubits[108],qubits[150];
-h qubits[150];
-h qubits[150];
-ccx qubits[41],qubits[109],qubits[150];
-h qubits[150];
-h qubits[150];
-ccx qubits[40],qubits[110],qubits[150];
-h qubits[150];
-h qubits[150];
-ccx qubits[39],qubits[111],qubits[150];
-h qubits[150];
-h qubits[150];
-ccx qubits[38],qubits[112],qubits[150];
-h qubits[150];
-h qubits[150];
-ccx qubits[37],qubits[113],qubits[150];
-h qubits[150];
-h qubits[150];
-ccx qubits[36],qubits[114],qubits[150];
-h qubits[150];
-h qubits[150];
-ccx qubits[35],qubits[115],qubits[150];
-h qubits[150];
-h qubits[150];
-ccx qubits[34],qubits[116],qubits[150];
-h qubits[150];
-h qubits[150];
-ccx qubits[33],qubits[117],qubits[150];
-h qubits[150];
-h qubits[150];
-ccx qubits[32],qubits[118],qubits[150];
-h qubits[150];
-h qubits[150];
-ccx qubits[31],qubits[119],qubits[150];
-h qubits[150];
-h qubits[150];
-ccx qubits[30],qubits[120],qubits[150];
-h qubits[150];
-h qubits[150];
-ccx qubits[29],qubits[121],qubits[150];
-h qubits[150];
-h qubits[150];
-ccx qubits[28],qubits[122],qubits[150];
-h qubits[150];
-h qubits[150];
-ccx qubits[27],qubits[123],qubits[150];
-h qubits[150];
-h qubits[150];
-ccx qubits[26],qubits[124],qubits[150];
-h qubits[150];
-h qubits[150];
-ccx qubits[25],qubits[125],qubits[150];
-h qubits[150];
-h qubits[150];
-ccx qubits[24],qubits[126],qubits[150];
-h qubits[150];
-h qubits[150];
-ccx qubits[23],qubits[127],qubits[150];
-h qubits[150];
-h qubits[151];
-ccx qubits[63],qubits[88],qubits[151];
-h qubits[151];
-h qubits[151];
-ccx qubits[62],qubits[89],qubits[151];
-h qubits[151];
-h qubits[151];
-ccx qubits[61],qubits[90],qubits[151];
-h qubits[151];
-h qubits[151];
-ccx qubits[60],qubits[91],qubits[151];
-h qubits[151];
-h qubits[151];
-ccx qubits[59],qubits[92],qubits[151];
-h qubits[151];
-h qubits[151];
-ccx qubits[58],qubits[93],qubits[151];
-h qubits[151];
-h qubits[151];
-ccx qubits[57],qubits[94],qubits[151];
-h qubits[151];
-h qubits[151];
-ccx qubits[56],qubits[95],qubits[151];
-h qubits[151];
-h qubits[151];
-ccx qubits[55],qubits[96],qubits[151];
-h qubits[151];
-h qubits[151];
-ccx qubits[54],qubits[97],qubits[151];
-h qubits[151];
-h qubits[151];
-ccx qubits[53],qubits[98],qubits[151];
-h qubits[151];
-h qubits[151];
-ccx qubits[52],qubits[99],qubits[151];
-h qubits[151];
-h qubits[151];
-ccx qubits[51],qubits[100],qubits[151];
-h qubits[151];
-h qubits[151];
-ccx qubits[50],qubits[101],qubits[151];
-h qubits[151];
-h qubits[151];
-ccx qubits[49],qubits[102],qubits[151];
-h qubits[151];
-h qubits[151];
-ccx qubits[48],qubits[103],qubits[151];
-h qubits[151];
-h qubits[151];
-ccx qubits[47],qubits[104],qubits[151];
-h qubits[151];
-h qubits[151];
-ccx qubits[46],qubits[105],qubits[151];
-h qubits[151];
-h qubits[151];
-ccx qubits[45],qubits[106],qubits[151];
-h qubits[151];
-h qubits[151];
-ccx qubits[44],qubits[107],qubits[151];
-h qubits[151];
-h qubits[151];
-ccx qubits[43],qubits[108],qubits[151];
-h qubits[151];
-h qubits[151];
-ccx qubits[42],qubits[109],qubits[151];
-h qubits[151];
-h qubits[151];
-ccx qubits[41],qubits[110],qubits[151];
-h qubits[151];
-h qubits[151];
-ccx qubits[40],qubits[111],qubits[151];
-h qubits[151];
-h qubits[151];
-ccx qubits[39],qubits[112],qubits[151];
-h qubits[151];
-h qubits[151];
-ccx qubits[38],qubits[113],qubits[151];
-h qubits[151];
-h qubits[151];
-ccx qubits[37],qubits[114],qubits[151];
-h qubits[151];
-h qubits[151];
-ccx qubits[36],qubits[115],qubits[151];
-h qubits[151];
-h qubits[151];
-ccx qubits[35],qubits[116],qubits[151];
-h qubits[151];
-h qubits[151];
-ccx qubits[34],qubits[117],qubits[151];
-h qubits[151];
-h qubits[151];
-ccx qubits[33],qubits[118],qubits[151];
-h qubits[151];
-h qubits[151];
-ccx qubits[32],qubits[119],qubits[151];
-h qubits[151];
-h qubits[151];
-ccx qubits[31],qubits[120],qubits[151];
-h qubits[151];
-h qubits[151];
-ccx qubits[30],qubits[121],qubits[151];
-h qubits[151];
-h qubits[151];
-ccx qubits[29],qubits[122],qubits[151];
-h qubits[151];
-h qubits[151];
-ccx qubits[28],qubits[123],qubits[151];
-h qubits[151];
-h qubits[151];
-ccx qubits[27],qubits[124],qubits[151];
-h qubits[151];
-h qubits[151];
-ccx qubits[26],qubits[125],qubits[151];
-h qubits[151];
-h qubits[151];
-ccx qubits[25],qubits[126],qubits[151];
-h qubits[151];
-h qubits[151];
-ccx qubits[24],qubits[127],qubits[151];
-h qubits[151];
-h qubits[152];
-ccx qubits[63],qubits[89],qubits[152];
-h qubits[152];
-h qubits[152];
-ccx qubits[62],qubits[90],qubits[152];
-h qubits[152];
-h qubits[152];
-ccx qubits[61],qubits[91],qubits[152];
-h qubits[152];
-h qubits[152];
-ccx qubits[60],qubits[92],qubits[152];
-h qubits[152];
-h qubits[152];
-ccx qubits[59],qubits[93],qubits[152];
-h qubits[152];
-h qubits[152];
-ccx qubits[58],qubits[94],qubits[152];
-h qubits[152];
-h qubits[152];
-ccx qubits[57],qubits[95],qubits[152];
-h qubits[152];
-h qubits[152];
-ccx qubits[56],qubits[96],qubits[152];
-h qubits[152];
-h qubits[152];
-ccx qubits[55],qubits[97],qubits[152];
-h qubits[152];
-h qubits[152];
-ccx qubits[54],qubits[98],qubits[152];
-h qubits[152];
-h qubits[152];
-ccx qubits[53],qubits[99],qubits[152];
-h qubits[152];
-h qubits[152];
-ccx qubits[52],qubits[100],qubits[152];
-h qubits[152];
-h qubits[152];
-ccx qubits[51],qubits[101],qubits[152];
-h qubits[152];
-h qubits[152];
-ccx qubits[50],qubits[102],qubits[152];
-h qubits[152];
-h qubits[152];
-ccx qubits[49],qubits[103],qubits[152];
-h qubits[152];
-h qubits[152];
-ccx qubits[48],qubits[104],qubits[152];
-h qubits[152];
-h qubits[152];
-ccx qubits[47],qubits[105],qubits[152];
-h qubits[152];
-h qubits[152];
-ccx qubits[46],qubits[106],qubits[152];
-h qubits[152];
-h qubits[152];
-ccx qubits[45],qubits[107],qubits[152];
-h qubits[152];
-h qubits[152];
-ccx qubits[44],qubits[108],qubits[152];
-h qubits[152];
-h qubits[152];
-ccx qubits[43],qubits[109],qubits[152];
-h qubits[152];
-h qubits[152];
-ccx qubits[42],qubits[110],qubits[152];
-h qubits[152];
-h qubits[152];
-ccx qubits[41],qubits[111],qubits[152];
-h qubits[152];
-h qubits[152];
-ccx qubits[40],qubits[112],qubits[152];
-h qubits[152];
-h qubits[152];
-ccx qubits[39],qubits[113],qubits[152];
-h qubits[152];
-h qubits[152];
-ccx qubits[38],qubits[114],qubits[152];
-h qubits[152];
-h qubits[152];
-ccx qubits[37],qubits[115],qubits[152];
-h qubits[152];
-h qubits[152];
-ccx qubits[36],qubits[116],qubits[152];
-h qubits[152];
-h qubits[152];
-ccx qubits[35],qubits[117],qubits[152];
-h qubits[152];
-h qubits[152];
-ccx qubits[34],qubits[118],qubits[152];
-h qubits[152];
-h qubits[152];
-ccx qubits[33],qubits[119],qubits[152];
-h qubits[152];
-h qubits[152];
-ccx qubits[32],qubits[120],qubits[152];
-h qubits[152];
-h qubits[152];
-ccx qubits[31],qubits[121],qubits[152];
-h qubits[152];
-h qubits[152];
-ccx qubits[30],qubits[122],qubits[152];
-h qubits[152];
-h qubits[152];
-ccx qubits[29],qubits[123],qubits[152];
-h qubits[152];
-h qubits[152];
-ccx qubits[28],qubits[124],qubits[152];
-h qubits[152];
-h qubits[152];
-ccx qubits[27],qubits[125],qubits[152];
-h qubits[152];
-h qubits[152];
-ccx qubits[26],qubits[126],qubits[152];
-h qubits[152];
-h qubits[152];
-ccx qubits[25],qubits[127],qubits[152];
-h qubits[152];
-h qubits[153];
-ccx qubits[63],qubits[90],qubits[153];
-h qubits[153];
-h qubits[153];
-ccx qubits[62],qubits[91],qubits[153];
-h qubits[153];
-h qubits[153];
-ccx qubits[61],qubits[92],qubits[153];
-h qubits[153];
-h qubits[153];
-ccx qubits[60],qubits[93],qubits[153];
-h qubits[153];
-h qubits[153];
-ccx qubits[59],qubits[94],qubits[153];
-h qubits[153];
-h qubits[153];
-ccx qubits[58],qubits[95],qubits[153];
-h qubits[153];
-h qubits[153];
-ccx qubits[57],qubits[96],qubits[153];
-h qubits[153];
-h qubits[153];
-ccx qubits[56],qubits[97],qubits[153];
-h qubits[153];
-h qubits[153];
-ccx qubits[55],qubits[98],qubits[153];
-h qubits[153];
-h qubits[153];
-ccx qubits[54],qubits[99],qubits[153];
-h qubits[153];
-h qubits[153];
-ccx qubits[53],qubits[100],qubits[153];
-h qubits[153];
-h qubits[153];
-ccx qubits[52],qubits[101],qubits[153];
-h qubits[153];
-h qubits[153];
-ccx qubits[51],qubits[102],qubits[153];
-h qubits[153];
-h qubits[153];
-ccx qubits[50],qubits[103],qubits[153];
-h qubits[153];
-h qubits[153];
-ccx qubits[49],qubits[104],qubits[153];
-h qubits[153];
-h qubits[153];
-ccx qubits[48],qubits[105],qubits[153];
-h qubits[153];
-h qubits[153];
-ccx qubits[47],qubits[106],qubits[153];
-h qubits[153];
-h qubits[153];
-ccx qubits[46],qubits[107],qubits[153];
-h qubits[153];
-h qubits[153];
-ccx qubits[45],qubits[108],qubits[153];
-h qubits[153];
-h qubits[153];
-ccx qubits[44],qubits[109],qubits[153];
-h qubits[153];
-h qubits[153];
-ccx qubits[43],qubits[110],qubits[153];
-h qubits[153];
-h qubits[153];
-ccx qubits[42],qubits[111],qubits[153];
-h qubits[153];
-h qubits[153];
-ccx qubits[41],qubits[112],qubits[153];
-h qubits[153];
-h qubits[153];
-ccx qubits[40],qubits[113],qubits[153];
-h qubits[153];
-h qubits[153];
-ccx qubits[39],qubits[114],qubits[153];
-h qubits[153];
-h qubits[153];
-ccx qubits[38],qubits[115],qubits[153];
-h qubits[153];
-h qubits[153];
-ccx qubits[37],qubits[116],qubits[153];
-h qubits[153];
-h qubits[153];
-ccx qubits[36],qubits[117],qubits[153];
-h qubits[153];
-h qubits[153];
-ccx qubits[35],qubits[118],qubits[153];
-h qubits[153];
-h qubits[153];
-ccx qubits[34],qubits[119],qubits[153];
-h qubits[153];
-h qubits[153];
-ccx qubits[33],qubits[120],qubits[153];
-h qubits[153];
-h qubits[153];
-ccx qubits[32],qubits[121],qubits[153];
-h qubits[153];
-h qubits[153];
-ccx qubits[31],qubits[122],qubits[153];
-h qubits[153];
-h qubits[153];
-ccx qubits[30],qubits[123],qubits[153];
-h qubits[153];
-h qubits[153];
-ccx qubits[29],qubits[124],qubits[153];
-h qubits[153];
-h qubits[153];
-ccx qubits[28],qubits[125],qubits[153];
-h qubits[153];
-h qubits[153];
-ccx qubits[27],qubits[126],qubits[153];
-h qubits[153];
-h qubits[153];
-ccx qubits[26],qubits[127],qubits[153];
-h qubits[153];
-h qubits[154];
-ccx qubits[63],qubits[91],qubits[154];
-h qubits[154];
-h qubits[154];
-ccx qubits[62],qubits[92],qubits[154];
-h qubits[154];
-h qubits[154];
-ccx qubits[61],qubits[93],qubits[154];
-h qubits[154];
-h qubits[154];
-ccx qubits[60],qubits[94],qubits[154];
-h qubits[154];
-h qubits[154];
-ccx qubits[59],qubits[95],qubits[154];
-h qubits[154];
-h qubits[154];
-ccx qubits[58],qubits[96],qubits[154];
-h qubits[154];
-h qubits[154];
-ccx qubits[57],qubits[97],qubits[154];
-h qubits[154];
-h qubits[154];
-ccx qubits[56],qubits[98],qubits[154];
-h qubits[154];
-h qubits[154];
-ccx qubits[55],qubits[99],qubits[154];
-h qubits[154];
-h qubits[154];
-ccx qubits[54],qubits[100],qubits[154];
-h qubits[154];
-h qubits[154];
-ccx qubits[53],qubits[101],qubits[154];
-h qubits[154];
-h qubits[154];
-ccx qubits[52],qubits[102],qubits[154];
-h qubits[154];
-h qubits[154];
-ccx qubits[51],qubits[103],qubits[154];
-h qubits[154];
-h qubits[154];
-ccx qubits[50],qubits[104],qubits[154];
-h qubits[154];
-h qubits[154];
-ccx qubits[49],qubits[105],qubits[154];
-h qubits[154];
-h qubits[154];
-ccx qubits[48],qubits[106],qubits[154];
-h qubits[154];
-h qubits[154];
-ccx qubits[47],qubits[107],qubits[154];
-h qubits[154];
-h qubits[154];
-ccx qubits[46],qubits[108],qubits[154];
-h qubits[154];
-h qubits[154];
-ccx qubits[45],qubits[109],qubits[154];
-h qubits[154];
-h qubits[154];
-ccx qubits[44],qubits[110],qubits[154];
-h qubits[154];
-h qubits[154];
-ccx qubits[43],qubits[111],qubits[154];
-h qubits[154];
-h qubits[154];
-ccx qubits[42],qubits[112],qubits[154];
-h qubits[154];
-h qubits[154];
-ccx qubits[41],qubits[113],qubits[154];
-h qubits[154];
-h qubits[154];
-ccx qubits[40],qubits[114],qubits[154];
-h qubits[154];
-h qubits[154];
-ccx qubits[39],qubits[115],qubits[154];
-h qubits[154];
-h qubits[154];
-ccx qubits[38],qubits[116],qubits[154];
-h qubits[154];
-h qubits[154];
-ccx qubits[37],qubits[117],qubits[154];
-h qubits[154];
-h qubits[154];
-ccx qubits[36],qubits[118],qubits[154];
-h qubits[154];
-h qubits[154];
-ccx qubits[35],qubits[119],qubits[154];
-h qubits[154];
-h qubits[154];
-ccx qubits[34],qubits[120],qubits[154];
-h qubits[154];
-h qubits[154];
-ccx qubits[33],qubits[121],qubits[154];
-h qubits[154];
-h qubits[154];
-ccx qubits[32],qubits[122],qubits[154];
-h qubits[154];
-h qubits[154];
-ccx qubits[31],qubits[123],qubits[154];
-h qubits[154];
-h qubits[154];
-ccx qubits[30],qubits[124],qubits[154];
-h qubits[154];
-h qubits[154];
-ccx qubits[29],qubits[125],qubits[154];
-h qubits[154];
-h qubits[154];
-ccx qubits[28],qubits[126],qubits[154];
-h qubits[154];
-h qubits[154];
-ccx qubits[27],qubits[127],qubits[154];
-h qubits[154];
-h qubits[155];
-ccx qubits[63],qubits[92],qubits[155];
-h qubits[155];
-h qubits[155];
-ccx qubits[62],qubits[93],qubits[155];
-h qubits[155];
-h qubits[155];
-ccx qubits[61],qubits[94],qubits[155];
-h qubits[155];
-h qubits[155];
-ccx qubits[60],qubits[95],qubits[155];
-h qubits[155];
-h qubits[155];
-ccx qubits[59],qubits[96],qubits[155];
-h qubits[155];
-h qubits[155];
-ccx qubits[58],qubits[97],qubits[155];
-h qubits[155];
-h qubits[155];
-ccx qubits[57],qubits[98],qubits[155];
-h qubits[155];
-h qubits[155];
-ccx qubits[56],qubits[99],qubits[155];
-h qubits[155];
-h qubits[155];
-ccx qubits[55],qubits[100],qubits[155];
-h qubits[155];
-h qubits[155];
-ccx qubits[54],qubits[101],qubits[155];
-h qubits[155];
-h qubits[155];
-ccx qubits[53],qubits[102],qubits[155];
-h qubits[155];
-h qubits[155];
-ccx qubits[52],qubits[103],qubits[155];
-h qubits[155];
-h qubits[155];
-ccx qubits[51],qubits[104],qubits[155];
-h qubits[155];
-h qubits[155];
-ccx qubits[50],qubits[105],qubits[155];
-h qubits[155];
-h qubits[155];
-ccx qubits[49],qubits[106],qubits[155];
-h qubits[155];
-h qubits[155];
-ccx qubits[48],qubits[107],qubits[155];
-h qubits[155];
-h qubits[155];
-ccx qubits[47],qubits[108],qubits[155];
-h qubits[155];
-h qubits[155];
-ccx qubits[46],qubits[109],qubits[155];
-h qubits[155];
-h qubits[155];
-ccx qubits[45],qubits[110],qubits[155];
-h qubits[155];
-h qubits[155];
-ccx qubits[44],qubits[111],qubits[155];
-h qubits[155];
-h qubits[155];
-ccx qubits[43],qubits[112],qubits[155];
-h qubits[155];
-h qubits[155];
-ccx qubits[42],qubits[113],qubits[155];
-h qubits[155];
-h qubits[155];
-ccx qubits[41],qubits[114],qubits[155];
-h qubits[155];
-h qubits[155];
-ccx qubits[40],qubits[115],qubits[155];
-h qubits[155];
-h qubits[155];
-ccx qubits[39],qubits[116],qubits[155];
-h qubits[155];
-h qubits[155];
-ccx qubits[38],qubits[117],qubits[155];
-h qubits[155];
-h qubits[155];
-ccx qubits[37],qubits[118],qubits[155];
-h qubits[155];
-h qubits[155];
-ccx qubits[36],qubits[119],qubits[155];
-h qubits[155];
-h qubits[155];
-ccx qubits[35],qubits[120],qubits[155];
-h qubits[155];
-h qubits[155];
-ccx qubits[34],qubits[121],qubits[155];
-h qubits[155];
-h qubits[155];
-ccx qubits[33],qubits[122],qubits[155];
-h qubits[155];
-h qubits[155];
-ccx qubits[32],qubits[123],qubits[155];
-h qubits[155];
-h qubits[155];
-ccx qubits[31],qubits[124],qubits[155];
-h qubits[155];
-h qubits[155];
-ccx qubits[30],qubits[125],qubits[155];
-h qubits[155];
-h qubits[155];
-ccx qubits[29],qubits[126],qubits[155];
-h qubits[155];
-h qubits[155];
-ccx qubits[28],qubits[127],qubits[155];
-h qubits[155];
-h qubits[156];
-ccx qubits[63],qubits[93],qubits[156];
-h qubits[156];
-h qubits[156];
-ccx qubits[62],qubits[94],qubits[156];
-h qubits[156];
-h qubits[156];
-ccx qubits[61],qubits[95],qubits[156];
-h qubits[156];
-h qubits[156];
-ccx qubits[60],qubits[96],qubits[156];
-h qubits[156];
-h qubits[156];
-ccx qubits[59],qubits[97],qubits[156];
-h qubits[156];
-h qubits[156];
-ccx qubits[58],qubits[98],qubits[156];
-h qubits[156];
-h qubits[156];
-ccx qubits[57],qubits[99],qubits[156];
-h qubits[156];
-h qubits[156];
-ccx qubits[56],qubits[100],qubits[156];
-h qubits[156];
-h qubits[156];
-ccx qubits[55],qubits[101],qubits[156];
-h qubits[156];
-h qubits[156];
-ccx qubits[54],qubits[102],qubits[156];
-h qubits[156];
-h qubits[156];
-ccx qubits[53],qubits[103],qubits[156];
-h qubits[156];
-h qubits[156];
-ccx qubits[52],qubits[104],qubits[156];
-h qubits[156];
-h qubits[156];
-ccx qubits[51],qubits[105],qubits[156];
-h qubits[156];
-h qubits[156];
-ccx qubits[50],qubits[106],qubits[156];
-h qubits[156];
-h qubits[156];
-ccx qubits[49],qubits[107],qubits[156];
-h qubits[156];
-h qubits[156];
-ccx qubits[48],qubits[108],qubits[156];
-h qubits[156];
-h qubits[156];
-ccx qubits[47],qubits[109],qubits[156];
-h qubits[156];
-h qubits[156];
-ccx qubits[46],qubits[110],qubits[156];
-h qubits[156];
-h qubits[156];
-ccx qubits[45],qubits[111],qubits[156];
-h qubits[156];
-h qubits[156];
-ccx qubits[44],qubits[112],qubits[156];
-h qubits[156];
-h qubits[156];
-ccx qubits[43],qubits[113],qubits[156];
-h qubits[156];
-h qubits[156];
-ccx qubits[42],qubits[114],qubits[156];
-h qubits[156];
-h qubits[156];
-ccx qubits[41],qubits[115],qubits[156];
-h qubits[156];
-h qubits[156];
-ccx qubits[40],qubits[116],qubits[156];
-h qubits[156];
-h qubits[156];
-ccx qubits[39],qubits[117],qubits[156];
-h qubits[156];
-h qubits[156];
-ccx qubits[38],qubits[118],qubits[156];
-h qubits[156];
-h qubits[156];
-ccx qubits[37],qubits[119],qubits[156];
-h qubits[156];
-h qubits[156];
-ccx qubits[36],qubits[120],qubits[156];
-h qubits[156];
-h qubits[156];
-ccx qubits[35],qubits[121],qubits[156];
-h qubits[156];
-h qubits[156];
-ccx qubits[34],qubits[122],qubits[156];
-h qubits[156];
-h qubits[156];
-ccx qubits[33],qubits[123],qubits[156];
-h qubits[156];
-h qubits[156];
-ccx qubits[32],qubits[124],qubits[156];
-h qubits[156];
-h qubits[156];
-ccx qubits[31],qubits[125],qubits[156];
-h qubits[156];
-h qubits[156];
-ccx qubits[30],qubits[126],qubits[156];
-h qubits[156];
-h qubits[156];
-ccx qubits[29],qubits[127],qubits[156];
-h qubits[156];
-h qubits[157];
-ccx qubits[63],qubits[94],qubits[157];
-h qubits[157];
-h qubits[157];
-ccx qubits[62],qubits[95],qubits[157];
-h qubits[157];
-h qubits[157];
-ccx qubits[61],qubits[96],qubits[157];
-h qubits[157];
-h qubits[157];
-ccx qubits[60],qubits[97],qubits[157];
-h qubits[157];
-h qubits[157];
-ccx qubits[59],qubits[98],qubits[157];
-h qubits[157];
-h qubits[157];
-ccx qubits[58],qubits[99],qubits[157];
-h qubits[157];
-h qubits[157];
-ccx qubits[57],qubits[100],qubits[157];
-h qubits[157];
-h qubits[157];
-ccx qubits[56],qubits[101],qubits[157];
-h qubits[157];
-h qubits[157];
-ccx qubits[55],qubits[102],qubits[157];
-h qubits[157];
-h qubits[157];
-ccx qubits[54],qubits[103],qubits[157];
-h qubits[157];
-h qubits[157];
-ccx qubits[53],qubits[104],qubits[157];
-h qubits[157];
-h qubits[157];
-ccx qubits[52],qubits[105],qubits[157];
-h qubits[157];
-h qubits[157];
-ccx qubits[51],qubits[106],qubits[157];
-h qubits[157];
-h qubits[157];
-ccx qubits[50],qubits[107],qubits[157];
-h qubits[157];
-h qubits[157];
-ccx qubits[49],qubits[108],qubits[157];
-h qubits[157];
-h qubits[157];
-ccx qubits[48],qubits[109],qubits[157];
-h qubits[157];
-h qubits[157];
-ccx qubits[47],qubits[110],qubits[157];
-h qubits[157];
-h qubits[157];
-ccx qubits[46],qubits[111],qubits[157];
-h qubits[157];
-h qubits[157];
-ccx qubits[45],qubits[112],qubits[157];
-h qubits[157];
-h qubits[157];
-ccx qubits[44],qubits[113],qubits[157];
-h qubits[157];
-h qubits[157];
-ccx qubits[43],qubits[114],qubits[157];
-h qubits[157];
-h qubits[157];
-ccx qubits[42],qubits[115],qubits[157];
-h qubits[157];
-h qubits[157];
-ccx qubits[41],qubits[116],qubits[157];
-h qubits[157];
-h qubits[157];
-ccx qubits[40],qubits[117],qubits[157];
-h qubits[157];
-h qubits[157];
-ccx qubits[39],qubits[118],qubits[157];
-h qubits[157];
-h qubits[157];
-ccx qubits[38],qubits[119],qubits[157];
-h qubits[157];
-h qubits[157];
-ccx qubits[37],qubits[120],qubits[157];
-h qubits[157];
-h qubits[157];
-ccx qubits[36],qubits[121],qubits[157];
-h qubits[157];
-h qubits[157];
-ccx qubits[35],qubits[122],qubits[157];
-h qubits[157];
-h qubits[157];
-ccx qubits[34],qubits[123],qubits[157];
-h qubits[157];
-h qubits[157];
-ccx qubits[33],qubits[124],qubits[157];
-h qubits[157];
-h qubits[157];
-ccx qubits[32],qubits[125],qubits[157];
-h qubits[157];
-h qubits[157];
-ccx qubits[31],qubits[126],qubits[157];
-h qubits[157];
-h qubits[157];
-ccx qubits[30],qubits[127],qubits[157];
-h qubits[157];
-h qubits[158];
-ccx qubits[63],qubits[95],qubits[158];
-h qubits[158];
-h qubits[158];
-ccx qubits[62],qubits[96],qubits[158];
-h qubits[158];
-h qubits[158];
-ccx qubits[61],qubits[97],qubits[158];
-h qubits[158];
-h qubits[158];
-ccx qubits[60],qubits[98],qubits[158];
-h qubits[158];
-h qubits[158];
-ccx qubits[59],qubits[99],qubits[158];
-h qubits[158];
-h qubits[158];
-ccx qubits[58],qubits[100],qubits[158];
-h qubits[158];
-h qubits[158];
-ccx qubits[57],qubits[101],qubits[158];
-h qubits[158];
-h qubits[158];
-ccx qubits[56],qubits[102],qubits[158];
-h qubits[158];
-h qubits[158];
-ccx qubits[55],qubits[103],qubits[158];
-h qubits[158];
-h qubits[158];
-ccx qubits[54],qubits[104],qubits[158];
-h qubits[158];
-h qubits[158];
-ccx qubits[53],qubits[105],qubits[158];
-h qubits[158];
-h qubits[158];
-ccx qubits[52],qubits[106],qubits[158];
-h qubits[158];
-h qubits[158];
-ccx qubits[51],qubits[107],qubits[158];
-h qubits[158];
-h qubits[158];
-ccx qubits[50],qubits[108],qubits[158];
-h qubits[158];
-h qubits[158];
-ccx qubits[49],qubits[109],qubits[158];
-h qubits[158];
-h qubits[158];
-ccx qubits[48],qubits[110],qubits[158];
-h qubits[158];
-h qubits[158];
-ccx qubits[47],qubits[111],qubits[158];
-h qubits[158];
-h qubits[158];
-ccx qubits[46],qubits[112],qubits[158];
-h qubits[158];
-h qubits[158];
-ccx qubits[45],qubits[113],qubits[158];
-h qubits[158];
-h qubits[158];
-ccx qubits[44],qubits[114],qubits[158];
-h qubits[158];
-h qubits[158];
-ccx qubits[43],qubits[115],qubits[158];
-h qubits[158];
-h qubits[158];
-ccx qubits[42],qubits[116],qubits[158];
-h qubits[158];
-h qubits[158];
-ccx qubits[41],qubits[117],qubits[158];
-h qubits[158];
-h qubits[158];
-ccx qubits[40],qubits[118],qubits[158];
-h qubits[158];
-h qubits[158];
-ccx qubits[39],qubits[119],qubits[158];
-h qubits[158];
-h qubits[158];
-ccx qubits[38],qubits[120],qubits[158];
-h qubits[158];
-h qubits[158];
-ccx qubits[37],qubits[121],qubits[158];
-h qubits[158];
-h qubits[158];
-ccx qubits[36],qubits[122],qubits[158];
-h qubits[158];
-h qubits[158];
-ccx qubits[35],qubits[123],qubits[158];
-h qubits[158];
-h qubits[158];
-ccx qubits[34],qubits[124],qubits[158];
-h qubits[158];
-h qubits[158];
-ccx qubits[33],qubits[125],qubits[158];
-h qubits[158];
-h qubits[158];
-ccx qubits[32],qubits[126],qubits[158];
-h qubits[158];
-h qubits[158];
-ccx qubits[31],qubits[127],qubits[158];
-h qubits[158];
-h qubits[159];
-ccx qubits[63],qubits[96],qubits[159];
-h qubits[159];
-h qubits[159];
-ccx qubits[62],qubits[97],qubits[159];
-h qubits[159];
-h qubits[159];
-ccx qubits[61],qubits[98],qubits[159];
-h qubits[159];
-h qubits[159];
-ccx qubits[60],qubits[99],qubits[159];
-h qubits[159];
-h qubits[159];
-ccx qubits[59],qubits[100],qubits[159];
-h qubits[159];
-h qubits[159];
-ccx qubits[58],qubits[101],qubits[159];
-h qubits[159];
-h qubits[159];
-ccx qubits[57],qubits[102],qubits[159];
-h qubits[159];
-h qubits[159];
-ccx qubits[56],qubits[103],qubits[159];
-h qubits[159];
-h qubits[159];
-ccx qubits[55],qubits[104],qubits[159];
-h qubits[159];
-h qubits[159];
-ccx qubits[54],qubits[105],qubits[159];
-h qubits[159];
-h qubits[159];
-ccx qubits[53],qubits[106],qubits[159];
-h qubits[159];
-h qubits[159];
-ccx qubits[52],qubits[107],qubits[159];
-h qubits[159];
-h qubits[159];
-ccx qubits[51],qubits[108],qubits[159];
-h qubits[159];
-h qubits[159];
-ccx qubits[50],qubits[109],qubits[159];
-h qubits[159];
-h qubits[159];
-ccx qubits[49],qubits[110],qubits[159];
-h qubits[159];
-h qubits[159];
-ccx qubits[48],qubits[111],qubits[159];
-h qubits[159];
-h qubits[159];
-ccx qubits[47],qubits[112],qubits[159];
-h qubits[159];
-h qubits[159];
-ccx qubits[46],qubits[113],qubits[159];
-h qubits[159];
-h qubits[159];
-ccx qubits[45],qubits[114],qubits[159];
-h qubits[159];
-h qubits[159];
-ccx qubits[44],qubits[115],qubits[159];
-h qubits[159];
-h qubits[159];
-ccx qubits[43],qubits[116],qubits[159];
-h qubits[159];
-h qubits[159];
-ccx qubits[42],qubits[117],qubits[159];
-h qubits[159];
-h qubits[159];
-ccx qubits[41],qubits[118],qubits[159];
-h qubits[159];
-h qubits[159];
-ccx qubits[40],qubits[119],qubits[159];
-h qubits[159];
-h qubits[159];
-ccx qubits[39],qubits[120],qubits[159];
-h qubits[159];
-h qubits[159];
-ccx qubits[38],qubits[121],qubits[159];
-h qubits[159];
-h qubits[159];
-ccx qubits[37],qubits[122],qubits[159];
-h qubits[159];
-h qubits[159];
-ccx qubits[36],qubits[123],qubits[159];
-h qubits[159];
-h qubits[159];
-ccx qubits[35],qubits[124],qubits[159];
-h qubits[159];
-h qubits[159];
-ccx qubits[34],qubits[125],qubits[159];
-h qubits[159];
-h qubits[159];
-ccx qubits[33],qubits[126],qubits[159];
-h qubits[159];
-h qubits[159];
-ccx qubits[32],qubits[127],qubits[159];
-h qubits[159];
-h qubits[160];
-ccx qubits[63],qubits[97],qubits[160];
-h qubits[160];
-h qubits[160];
-ccx qubits[62],qubits[98],qubits[160];
-h qubits[160];
-h qubits[160];
-ccx qubits[61],qubits[99],qubits[160];
-h qubits[160];
-h qubits[160];
-ccx qubits[60],qubits[100],qubits[160];
-h qubits[160];
-h qubits[160];
-ccx qubits[59],qubits[101],qubits[160];
-h qubits[160];
-h qubits[160];
-ccx qubits[58],qubits[102],qubits[160];
-h qubits[160];
-h qubits[160];
-ccx qubits[57],qubits[103],qubits[160];
-h qubits[160];
-h qubits[160];
-ccx qubits[56],qubits[104],qubits[160];
-h qubits[160];
-h qubits[160];
-ccx qubits[55],qubits[105],qubits[160];
-h qubits[160];
-h qubits[160];
-ccx qubits[54],qubits[106],qubits[160];
-h qubits[160];
-h qubits[160];
-ccx qubits[53],qubits[107],qubits[160];
-h qubits[160];
-h qubits[160];
-ccx qubits[52],qubits[108],qubits[160];
-h qubits[160];
-h qubits[160];
-ccx qubits[51],qubits[109],qubits[160];
-h qubits[160];
-h qubits[160];
-ccx qubits[50],qubits[110],qubits[160];
-h qubits[160];
-h qubits[160];
-ccx qubits[49],qubits[111],qubits[160];
-h qubits[160];
-h qubits[160];
-ccx qubits[48],qubits[112],qubits[160];
-h qubits[160];
-h qubits[160];
-ccx qubits[47],qubits[113],qubits[160];
-h qubits[160];
-h qubits[160];
-ccx qubits[46],qubits[114],qubits[160];
-h qubits[160];
-h qubits[160];
-ccx qubits[45],qubits[115],qubits[160];
-h qubits[160];
-h qubits[160];
-ccx qubits[44],qubits[116],qubits[160];
-h qubits[160];
-h qubits[160];
-ccx qubits[43],qubits[117],qubits[160];
-h qubits[160];
-h qubits[160];
-ccx qubits[42],qubits[118],qubits[160];
-h qubits[160];
-h qubits[160];
-ccx qubits[41],qubits[119],qubits[160];
-h qubits[160];
-h qubits[160];
-ccx qubits[40],qubits[120],qubits[160];
-h qubits[160];
-h qubits[160];
-ccx qubits[39],qubits[121],qubits[160];
-h qubits[160];
-h qubits[160];
-ccx qubits[38],qubits[122],qubits[160];
-h qubits[160];
-h qubits[160];
-ccx qubits[37],qubits[123],qubits[160];
-h qubits[160];
-h qubits[160];
-ccx qubits[36],qubits[124],qubits[160];
-h qubits[160];
-h qubits[160];
-ccx qubits[35],qubits[125],qubits[160];
-h qubits[160];
-h qubits[160];
-ccx qubits[34],qubits[126],qubits[160];
-h qubits[160];
-h qubits[160];
-ccx qubits[33],qubits[127],qubits[160];
-h qubits[160];
-h qubits[161];
-ccx qubits[63],qubits[98],qubits[161];
-h qubits[161];
-h qubits[161];
-ccx qubits[62],qubits[99],qubits[161];
-h qubits[161];
-h qubits[161];
-ccx qubits[61],qubits[100],qubits[161];
-h qubits[161];
-h qubits[161];
-ccx qubits[60],qubits[101],qubits[161];
-h qubits[161];
-h qubits[161];
-ccx qubits[59],qubits[102],qubits[161];
-h qubits[161];
-h qubits[161];
-ccx qubits[58],qubits[103],qubits[161];
-h qubits[161];
-h qubits[161];
-ccx qubits[57],qubits[104],qubits[161];
-h qubits[161];
-h qubits[161];
-ccx qubits[56],qubits[105],qubits[161];
-h qubits[161];
-h qubits[161];
-ccx qubits[55],qubits[106],qubits[161];
-h qubits[161];
-h qubits[161];
-ccx qubits[54],qubits[107],qubits[161];
-h qubits[161];
-h qubits[161];
-ccx qubits[53],qubits[108],qubits[161];
-h qubits[161];
-h qubits[161];
-ccx qubits[52],qubits[109],qubits[161];
-h qubits[161];
-h qubits[161];
-ccx qubits[51],qubits[110],qubits[161];
-h qubits[161];
-h qubits[161];
-ccx qubits[50],qubits[111],qubits[161];
-h qubits[161];
-h qubits[161];
-ccx qubits[49],qubits[112],qubits[161];
-h qubits[161];
-h qubits[161];
-ccx qubits[48],qubits[113],qubits[161];
-h qubits[161];
-h qubits[161];
-ccx qubits[47],qubits[114],qubits[161];
-h qubits[161];
-h qubits[161];
-ccx qubits[46],qubits[115],qubits[161];
-h qubits[161];
-h qubits[161];
-ccx qubits[45],qubits[116],qubits[161];
-h qubits[161];
-h qubits[161];
-ccx qubits[44],qubits[117],qubits[161];
-h qubits[161];
-h qubits[161];
-ccx qubits[43],qubits[118],qubits[161];
-h qubits[161];
-h qubits[161];
-ccx qubits[42],qubits[119],qubits[161];
-h qubits[161];
-h qubits[161];
-ccx qubits[41],qubits[120],qubits[161];
-h qubits[161];
-h qubits[161];
-ccx qubits[40],qubits[121],qubits[161];
-h qubits[161];
-h qubits[161];
-ccx qubits[39],qubits[122],qubits[161];
-h qubits[161];
-h qubits[161];
-ccx qubits[38],qubits[123],qubits[161];
-h qubits[161];
-h qubits[161];
-ccx qubits[37],qubits[124],qubits[161];
-h qubits[161];
-h qubits[161];
-ccx qubits[36],qubits[125],qubits[161];
-h qubits[161];
-h qubits[161];
-ccx qubits[35],qubits[126],qubits[161];
-h qubits[161];
-h qubits[161];
-ccx qubits[34],qubits[127],qubits[161];
-h qubits[161];
-h qubits[162];
-ccx qubits[63],qubits[99],qubits[162];
-h qubits[162];
-h qubits[162];
-ccx qubits[62],qubits[100],qubits[162];
-h qubits[162];
-h qubits[162];
-ccx qubits[61],qubits[101],qubits[162];
-h qubits[162];
-h qubits[162];
-ccx qubits[60],qubits[102],qubits[162];
-h qubits[162];
-h qubits[162];
-ccx qubits[59],qubits[103],qubits[162];
-h qubits[162];
-h qubits[162];
-ccx qubits[58],qubits[104],qubits[162];
-h qubits[162];
-h qubits[162];
-ccx qubits[57],qubits[105],qubits[162];
-h qubits[162];
-h qubits[162];
-ccx qubits[56],qubits[106],qubits[162];
-h qubits[162];
-h qubits[162];
-ccx qubits[55],qubits[107],qubits[162];
-h qubits[162];
-h qubits[162];
-ccx qubits[54],qubits[108],qubits[162];
-h qubits[162];
-h qubits[162];
-ccx qubits[53],qubits[109],qubits[162];
-h qubits[162];
-h qubits[162];
-ccx qubits[52],qubits[110],qubits[162];
-h qubits[162];
-h qubits[162];
-ccx qubits[51],qubits[111],qubits[162];
-h qubits[162];
-h qubits[162];
-ccx qubits[50],qubits[112],qubits[162];
-h qubits[162];
-h qubits[162];
-ccx qubits[49],qubits[113],qubits[162];
-h qubits[162];
-h qubits[162];
-ccx qubits[48],qubits[114],qubits[162];
-h qubits[162];
-h qubits[162];
-ccx qubits[47],qubits[115],qubits[162];
-h qubits[162];
-h qubits[162];
-ccx qubits[46],qubits[116],qubits[162];
-h qubits[162];
-h qubits[162];
-ccx qubits[45],qubits[117],qubits[162];
-h qubits[162];
-h qubits[162];
-ccx qubits[44],qubits[118],qubits[162];
-h qubits[162];
-h qubits[162];
-ccx qubits[43],qubits[119],qubits[162];
-h qubits[162];
-h qubits[162];
-ccx qubits[42],qubits[120],qubits[162];
-h qubits[162];
-h qubits[162];
-ccx qubits[41],qubits[121],qubits[162];
-h qubits[162];
-h qubits[162];
-ccx qubits[40],qubits[122],qubits[162];
-h qubits[162];
-h qubits[162];
-ccx qubits[39],qubits[123],qubits[162];
-h qubits[162];
-h qubits[162];
-ccx qubits[38],qubits[124],qubits[162];
-h qubits[162];
-h qubits[162];
-ccx qubits[37],qubits[125],qubits[162];
-h qubits[162];
-h qubits[162];
-ccx qubits[36],qubits[126],qubits[162];
-h qubits[162];
-h qubits[162];
-ccx qubits[35],qubits[127],qubits[162];
-h qubits[162];
-h qubits[163];
-ccx qubits[63],qubits[100],qubits[163];
-h qubits[163];
-h qubits[163];
-ccx qubits[62],qubits[101],qubits[163];
-h qubits[163];
-h qubits[163];
-ccx qubits[61],qubits[102],qubits[163];
-h qubits[163];
-h qubits[163];
-ccx qubits[60],qubits[103],qubits[163];
-h qubits[163];
-h qubits[163];
-ccx qubits[59],qubits[104],qubits[163];
-h qubits[163];
-h qubits[163];
-ccx qubits[58],qubits[105],qubits[163];
-h qubits[163];
-h qubits[163];
-ccx qubits[57],qubits[106],qubits[163];
-h qubits[163];
-h qubits[163];
-ccx qubits[56],qubits[107],qubits[163];
-h qubits[163];
-h qubits[163];
-ccx qubits[55],qubits[108],qubits[163];
-h qubits[163];
-h qubits[163];
-ccx qubits[54],qubits[109],qubits[163];
-h qubits[163];
-h qubits[163];
-ccx qubits[53],qubits[110],qubits[163];
-h qubits[163];
-h qubits[163];
-ccx qubits[52],qubits[111],qubits[163];
-h qubits[163];
-h qubits[163];
-ccx qubits[51],qubits[112],qubits[163];
-h qubits[163];
-h qubits[163];
-ccx qubits[50],qubits[113],qubits[163];
-h qubits[163];
-h qubits[163];
-ccx qubits[49],qubits[114],qubits[163];
-h qubits[163];
-h qubits[163];
-ccx qubits[48],qubits[115],qubits[163];
-h qubits[163];
-h qubits[163];
-ccx qubits[47],qubits[116],qubits[163];
-h qubits[163];
-h qubits[163];
-ccx qubits[46],qubits[117],qubits[163];
-h qubits[163];
-h qubits[163];
-ccx qubits[45],qubits[118],qubits[163];
-h qubits[163];
-h qubits[163];
-ccx qubits[44],qubits[119],qubits[163];
-h qubits[163];
-h qubits[163];
-ccx qubits[43],qubits[120],qubits[163];
-h qubits[163];
-h qubits[163];
-ccx qubits[42],qubits[121],qubits[163];
-h qubits[163];
-h qubits[163];
-ccx qubits[41],qubits[122],qubits[163];
-h qubits[163];
-h qubits[163];
-ccx qubits[40],qubits[123],qubits[163];
-h qubits[163];
-h qubits[163];
-ccx qubits[39],qubits[124],qubits[163];
-h qubits[163];
-h qubits[163];
-ccx qubits[38],qubits[125],qubits[163];
-h qubits[163];
-h qubits[163];
-ccx qubits[37],qubits[126],qubits[163];
-h qubits[163];
-h qubits[163];
-ccx qubits[36],qubits[127],qubits[163];
-h qubits[163];
-h qubits[164];
-ccx qubits[63],qubits[101],qubits[164];
-h qubits[164];
-h qubits[164];
-ccx qubits[62],qubits[102],qubits[164];
-h qubits[164];
-h qubits[164];
-ccx qubits[61],qubits[103],qubits[164];
-h qubits[164];
-h qubits[164];
-ccx qubits[60],qubits[104],qubits[164];
-h qubits[164];
-h qubits[164];
-ccx qubits[59],qubits[105],qubits[164];
-h qubits[164];
-h qubits[164];
-ccx qubits[58],qubits[106],qubits[164];
-h qubits[164];
-h qubits[164];
-ccx qubits[57],qubits[107],qubits[164];
-h qubits[164];
-h qubits[164];
-ccx qubits[56],qubits[108],qubits[164];
-h qubits[164];
-h qubits[164];
-ccx qubits[55],qubits[109],qubits[164];
-h qubits[164];
-h qubits[164];
-ccx qubits[54],qubits[110],qubits[164];
-h qubits[164];
-h qubits[164];
-ccx qubits[53],qubits[111],qubits[164];
-h qubits[164];
-h qubits[164];
-ccx qubits[52],qubits[112],qubits[164];
-h qubits[164];
-h qubits[164];
-ccx qubits[51],qubits[113],qubits[164];
-h qubits[164];
-h qubits[164];
-ccx qubits[50],qubits[114],qubits[164];
-h qubits[164];
-h qubits[164];
-ccx qubits[49],qubits[115],qubits[164];
-h qubits[164];
-h qubits[164];
-ccx qubits[48],qubits[116],qubits[164];
-h qubits[164];
-h qubits[164];
-ccx qubits[47],qubits[117],qubits[164];
-h qubits[164];
-h qubits[164];
-ccx qubits[46],qubits[118],qubits[164];
-h qubits[164];
-h qubits[164];
-ccx qubits[45],qubits[119],qubits[164];
-h qubits[164];
-h qubits[164];
-ccx qubits[44],qubits[120],qubits[164];
-h qubits[164];
-h qubits[164];
-ccx qubits[43],qubits[121],qubits[164];
-h qubits[164];
-h qubits[164];
-ccx qubits[42],qubits[122],qubits[164];
-h qubits[164];
-h qubits[164];
-ccx qubits[41],qubits[123],qubits[164];
-h qubits[164];
-h qubits[164];
-ccx qubits[40],qubits[124],qubits[164];
-h qubits[164];
-h qubits[164];
-ccx qubits[39],qubits[125],qubits[164];
-h qubits[164];
-h qubits[164];
-ccx qubits[38],qubits[126],qubits[164];
-h qubits[164];
-h qubits[164];
-ccx qubits[37],qubits[127],qubits[164];
-h qubits[164];
-h qubits[165];
-ccx qubits[63],qubits[102],qubits[165];
-h qubits[165];
-h qubits[165];
-ccx qubits[62],qubits[103],qubits[165];
-h qubits[165];
-h qubits[165];
-ccx qubits[61],qubits[104],qubits[165];
-h qubits[165];
-h qubits[165];
-ccx qubits[60],qubits[105],qubits[165];
-h qubits[165];
-h qubits[165];
-ccx qubits[59],qubits[106],qubits[165];
-h qubits[165];
-h qubits[165];
-ccx qubits[58],qubits[107],qubits[165];
-h qubits[165];
-h qubits[165];
-ccx qubits[57],qubits[108],qubits[165];
-h qubits[165];
-h qubits[165];
-ccx qubits[56],qubits[109],qubits[165];
-h qubits[165];
-h qubits[165];
-ccx qubits[55],qubits[110],qubits[165];
-h qubits[165];
-h qubits[165];
-ccx qubits[54],qubits[111],qubits[165];
-h qubits[165];
-h qubits[165];
-ccx qubits[53],qubits[112],qubits[165];
-h qubits[165];
-h qubits[165];
-ccx qubits[52],qubits[113],qubits[165];
-h qubits[165];
-h qubits[165];
-ccx qubits[51],qubits[114],qubits[165];
-h qubits[165];
-h qubits[165];
-ccx qubits[50],qubits[115],qubits[165];
-h qubits[165];
-h qubits[165];
-ccx qubits[49],qubits[116],qubits[165];
-h qubits[165];
-h qubits[165];
-ccx qubits[48],qubits[117],qubits[165];
-h qubits[165];
-h qubits[165];
-ccx qubits[47],qubits[118],qubits[165];
-h qubits[165];
-h qubits[165];
-ccx qubits[46],qubits[119],qubits[165];
-h qubits[165];
-h qubits[165];
-ccx qubits[45],qubits[120],qubits[165];
-h qubits[165];
-h qubits[165];
-ccx qubits[44],qubits[121],qubits[165];
-h qubits[165];
-h qubits[165];
-ccx qubits[43],qubits[122],qubits[165];
-h qubits[165];
-h qubits[165];
-ccx qubits[42],qubits[123],qubits[165];
-h qubits[165];
-h qubits[165];
-ccx qubits[41],qubits[124],qubits[165];
-h qubits[165];
-h qubits[165];
-ccx qubits[40],qubits[125],qubits[165];
-h qubits[165];
-h qubits[165];
-ccx qubits[39],qubits[126],qubits[165];
-h qubits[165];
-h qubits[165];
-ccx qubits[38],qubits[127],qubits[165];
-h qubits[165];
-h qubits[166];
-ccx qubits[63],qubits[103],qubits[166];
-h qubits[166];
-h qubits[166];
-ccx qubits[62],qubits[104],qubits[166];
-h qubits[166];
-h qubits[166];
-ccx qubits[61],qubits[105],qubits[166];
-h qubits[166];
-h qubits[166];
-ccx qubits[60],qubits[106],qubits[166];
-h qubits[166];
-h qubits[166];
-ccx qubits[59],qubits[107],qubits[166];
-h qubits[166];
-h qubits[166];
-ccx qubits[58],qubits[108],qubits[166];
-h qubits[166];
-h qubits[166];
-ccx qubits[57],qubits[109],qubits[166];
-h qubits[166];
-h qubits[166];
-ccx qubits[56],qubits[110],qubits[166];
-h qubits[166];
-h qubits[166];
-ccx qubits[55],qubits[111],qubits[166];
-h qubits[166];
-h qubits[166];
-ccx qubits[54],qubits[112],qubits[166];
-h qubits[166];
-h qubits[166];
-ccx qubits[53],qubits[113],qubits[166];
-h qubits[166];
-h qubits[166];
-ccx qubits[52],qubits[114],qubits[166];
-h qubits[166];
-h qubits[166];
-ccx qubits[51],qubits[115],qubits[166];
-h qubits[166];
-h qubits[166];
-ccx qubits[50],qubits[116],qubits[166];
-h qubits[166];
-h qubits[166];
-ccx qubits[49],qubits[117],qubits[166];
-h qubits[166];
-h qubits[166];
-ccx qubits[48],qubits[118],qubits[166];
-h qubits[166];
-h qubits[166];
-ccx qubits[47],qubits[119],qubits[166];
-h qubits[166];
-h qubits[166];
-ccx qubits[46],qubits[120],qubits[166];
-h qubits[166];
-h qubits[166];
-ccx qubits[45],qubits[121],qubits[166];
-h qubits[166];
-h qubits[166];
-ccx qubits[44],qubits[122],qubits[166];
-h qubits[166];
-h qubits[166];
-ccx qubits[43],qubits[123],qubits[166];
-h qubits[166];
-h qubits[166];
-ccx qubits[42],qubits[124],qubits[166];
-h qubits[166];
-h qubits[166];
-ccx qubits[41],qubits[125],qubits[166];
-h qubits[166];
-h qubits[166];
-ccx qubits[40],qubits[126],qubits[166];
-h qubits[166];
-h qubits[166];
-ccx qubits[39],qubits[127],qubits[166];
-h qubits[166];
-h qubits[167];
-ccx qubits[63],qubits[104],qubits[167];
-h qubits[167];
-h qubits[167];
-ccx qubits[62],qubits[105],qubits[167];
-h qubits[167];
-h qubits[167];
-ccx qubits[61],qubits[106],qubits[167];
-h qubits[167];
-h qubits[167];
-ccx qubits[60],qubits[107],qubits[167];
-h qubits[167];
-h qubits[167];
-ccx qubits[59],qubits[108],qubits[167];
-h qubits[167];
-h qubits[167];
-ccx qubits[58],qubits[109],qubits[167];
-h qubits[167];
-h qubits[167];
-ccx qubits[57],qubits[110],qubits[167];
-h qubits[167];
-h qubits[167];
-ccx qubits[56],qubits[111],qubits[167];
-h qubits[167];
-h qubits[167];
-ccx qubits[55],qubits[112],qubits[167];
-h qubits[167];
-h qubits[167];
-ccx qubits[54],qubits[113],qubits[167];
-h qubits[167];
-h qubits[167];
-ccx qubits[53],qubits[114],qubits[167];
-h qubits[167];
-h qubits[167];
-ccx qubits[52],qubits[115],qubits[167];
-h qubits[167];
-h qubits[167];
-ccx qubits[51],qubits[116],qubits[167];
-h qubits[167];
-h qubits[167];
-ccx qubits[50],qubits[117],qubits[167];
-h qubits[167];
-h qubits[167];
-ccx qubits[49],qubits[118],qubits[167];
-h qubits[167];
-h qubits[167];
-ccx qubits[48],qubits[119],qubits[167];
-h qubits[167];
-h qubits[167];
-ccx qubits[47],qubits[120],qubits[167];
-h qubits[167];
-h qubits[167];
-ccx qubits[46],qubits[121],qubits[167];
-h qubits[167];
-h qubits[167];
-ccx qubits[45],qubits[122],qubits[167];
-h qubits[167];
-h qubits[167];
-ccx qubits[44],qubits[123],qubits[167];
-h qubits[167];
-h qubits[167];
-ccx qubits[43],qubits[124],qubits[167];
-h qubits[167];
-h qubits[167];
-ccx qubits[42],qubits[125],qubits[167];
-h qubits[167];
-h qubits[167];
-ccx qubits[41],qubits[126],qubits[167];
-h qubits[167];
-h qubits[167];
-ccx qubits[40],qubits[127],qubits[167];
-h qubits[167];
-h qubits[168];
-ccx qubits[63],qubits[105],qubits[168];
-h qubits[168];
-h qubits[168];
-ccx qubits[62],qubits[106],qubits[168];
-h qubits[168];
-h qubits[168];
-ccx qubits[61],qubits[107],qubits[168];
-h qubits[168];
-h qubits[168];
-ccx qubits[60],qubits[108],qubits[168];
-h qubits[168];
-h qubits[168];
-ccx qubits[59],qubits[109],qubits[168];
-h qubits[168];
-h qubits[168];
-ccx qubits[58],qubits[110],qubits[168];
-h qubits[168];
-h qubits[168];
-ccx qubits[57],qubits[111],qubits[168];
-h qubits[168];
-h qubits[168];
-ccx qubits[56],qubits[112],qubits[168];
-h qubits[168];
-h qubits[168];
-ccx qubits[55],qubits[113],qubits[168];
-h qubits[168];
-h qubits[168];
-ccx qubits[54],qubits[114],qubits[168];
-h qubits[168];
-h qubits[168];
-ccx qubits[53],qubits[115],qubits[168];
-h qubits[168];
-h qubits[168];
-ccx qubits[52],qubits[116],qubits[168];
-h qubits[168];
-h qubits[168];
-ccx qubits[51],qubits[117],qubits[168];
-h qubits[168];
-h qubits[168];
-ccx qubits[50],qubits[118],qubits[168];
-h qubits[168];
-h qubits[168];
-ccx qubits[49],qubits[119],qubits[168];
-h qubits[168];
-h qubits[168];
-ccx qubits[48],qubits[120],qubits[168];
-h qubits[168];
-h qubits[168];
-ccx qubits[47],qubits[121],qubits[168];
-h qubits[168];
-h qubits[168];
-ccx qubits[46],qubits[122],qubits[168];
-h qubits[168];
-h qubits[168];
-ccx qubits[45],qubits[123],qubits[168];
-h qubits[168];
-h qubits[168];
-ccx qubits[44],qubits[124],qubits[168];
-h qubits[168];
-h qubits[168];
-ccx qubits[43],qubits[125],qubits[168];
-h qubits[168];
-h qubits[168];
-ccx qubits[42],qubits[126],qubits[168];
-h qubits[168];
-h qubits[168];
-ccx qubits[41],qubits[127],qubits[168];
-h qubits[168];
-h qubits[169];
-ccx qubits[63],qubits[106],qubits[169];
-h qubits[169];
-h qubits[169];
-ccx qubits[62],qubits[107],qubits[169];
-h qubits[169];
-h qubits[169];
-ccx qubits[61],qubits[108],qubits[169];
-h qubits[169];
-h qubits[169];
-ccx qubits[60],qubits[109],qubits[169];
-h qubits[169];
-h qubits[169];
-ccx qubits[59],qubits[110],qubits[169];
-h qubits[169];
-h qubits[169];
-ccx qubits[58],qubits[111],qubits[169];
-h qubits[169];
-h qubits[169];
-ccx qubits[57],qubits[112],qubits[169];
-h qubits[169];
-h qubits[169];
-ccx qubits[56],qubits[113],qubits[169];
-h qubits[169];
-h qubits[169];
-ccx qubits[55],qubits[114],qubits[169];
-h qubits[169];
-h qubits[169];
-ccx qubits[54],qubits[115],qubits[169];
-h qubits[169];
-h qubits[169];
-ccx qubits[53],qubits[116],qubits[169];
-h qubits[169];
-h qubits[169];
-ccx qubits[52],qubits[117],qubits[169];
-h qubits[169];
-h qubits[169];
-ccx qubits[51],qubits[118],qubits[169];
-h qubits[169];
-h qubits[169];
-ccx qubits[50],qubits[119],qubits[169];
-h qubits[169];
-h qubits[169];
-ccx qubits[49],qubits[120],qubits[169];
-h qubits[169];
-h qubits[169];
-ccx qubits[48],qubits[121],qubits[169];
-h qubits[169];
-h qubits[169];
-ccx qubits[47],qubits[122],qubits[169];
-h qubits[169];
-h qubits[169];
-ccx qubits[46],qubits[123],qubits[169];
-h qubits[169];
-h qubits[169];
-ccx qubits[45],qubits[124],qubits[169];
-h qubits[169];
-h qubits[169];
-ccx qubits[44],qubits[125],qubits[169];
-h qubits[169];
-h qubits[169];
-ccx qubits[43],qubits[126],qubits[169];
-h qubits[169];
-h qubits[169];
-ccx qubits[42],qubits[127],qubits[169];
-h qubits[169];
-h qubits[170];
-ccx qubits[63],qubits[107],qubits[170];
-h qubits[170];
-h qubits[170];
-ccx qubits[62],qubits[108],qubits[170];
-h qubits[170];
-h qubits[170];
-ccx qubits[61],qubits[109],qubits[170];
-h qubits[170];
-h qubits[170];
-ccx qubits[60],qubits[110],qubits[170];
-h qubits[170];
-h qubits[170];
-ccx qubits[59],qubits[111],qubits[170];
-h qubits[170];
-h qubits[170];
-ccx qubits[58],qubits[112],qubits[170];
-h qubits[170];
-h qubits[170];
-ccx qubits[57],qubits[113],qubits[170];
-h qubits[170];
-h qubits[170];
-ccx qubits[56],qubits[114],qubits[170];
-h qubits[170];
-h qubits[170];
-ccx qubits[55],qubits[115],qubits[170];
-h qubits[170];
-h qubits[170];
-ccx qubits[54],qubits[116],qubits[170];
-h qubits[170];
-h qubits[170];
-ccx qubits[53],qubits[117],qubits[170];
-h qubits[170];
-h qubits[170];
-ccx qubits[52],qubits[118],qubits[170];
-h qubits[170];
-h qubits[170];
-ccx qubits[51],qubits[119],qubits[170];
-h qubits[170];
-h qubits[170];
-ccx qubits[50],qubits[120],qubits[170];
-h qubits[170];
-h qubits[170];
-ccx qubits[49],qubits[121],qubits[170];
-h qubits[170];
-h qubits[170];
-ccx qubits[48],qubits[122],qubits[170];
-h qubits[170];
-h qubits[170];
-ccx qubits[47],qubits[123],qubits[170];
-h qubits[170];
-h qubits[170];
-ccx qubits[46],qubits[124],qubits[170];
-h qubits[170];
-h qubits[170];
-ccx qubits[45],qubits[125],qubits[170];
-h qubits[170];
-h qubits[170];
-ccx qubits[44],qubits[126],qubits[170];
-h qubits[170];
-h qubits[170];
-ccx qubits[43],qubits[127],qubits[170];
-h qubits[170];
-h qubits[171];
-ccx qubits[63],qubits[108],qubits[171];
-h qubits[171];
-h qubits[171];
-ccx qubits[62],qubits[109],qubits[171];
-h qubits[171];
-h qubits[171];
-ccx qubits[61],qubits[110],qubits[171];
-h qubits[171];
-h qubits[171];
-ccx qubits[60],qubits[111],qubits[171];
-h qubits[171];
-h qubits[171];
-ccx qubits[59],qubits[112],qubits[171];
-h qubits[171];
-h qubits[171];
-ccx qubits[58],qubits[113],qubits[171];
-h qubits[171];
-h qubits[171];
-ccx qubits[57],qubits[114],qubits[171];
-h qubits[171];
-h qubits[171];
-ccx qubits[56],qubits[115],qubits[171];
-h qubits[171];
-h qubits[171];
-ccx qubits[55],qubits[116],qubits[171];
-h qubits[171];
-h qubits[171];
-ccx qubits[54],qubits[117],qubits[171];
-h qubits[171];
-h qubits[171];
-ccx qubits[53],qubits[118],qubits[171];
-h qubits[171];
-h qubits[171];
-ccx qubits[52],qubits[119],qubits[171];
-h qubits[171];
-h qubits[171];
-ccx qubits[51],qubits[120],qubits[171];
-h qubits[171];
-h qubits[171];
-ccx qubits[50],qubits[121],qubits[171];
-h qubits[171];
-h qubits[171];
-ccx qubits[49],qubits[122],qubits[171];
-h qubits[171];
-h qubits[171];
-ccx qubits[48],qubits[123],qubits[171];
-h qubits[171];
-h qubits[171];
-ccx qubits[47],qubits[124],qubits[171];
-h qubits[171];
-h qubits[171];
-ccx qubits[46],qubits[125],qubits[171];
-h qubits[171];
-h qubits[171];
-ccx qubits[45],qubits[126],qubits[171];
-h qubits[171];
-h qubits[171];
-ccx qubits[44],qubits[127],qubits[171];
-h qubits[171];
-h qubits[172];
-ccx qubits[63],qubits[109],qubits[172];
-h qubits[172];
-h qubits[172];
-ccx qubits[62],qubits[110],qubits[172];
-h qubits[172];
-h qubits[172];
-ccx qubits[61],qubits[111],qubits[172];
-h qubits[172];
-h qubits[172];
-ccx qubits[60],qubits[112],qubits[172];
-h qubits[172];
-h qubits[172];
-ccx qubits[59],qubits[113],qubits[172];
-h qubits[172];
-h qubits[172];
-ccx qubits[58],qubits[114],qubits[172];
-h qubits[172];
-h qubits[172];
-ccx qubits[57],qubits[115],qubits[172];
-h qubits[172];
-h qubits[172];
-ccx qubits[56],qubits[116],qubits[172];
-h qubits[172];
-h qubits[172];
-ccx qubits[55],qubits[117],qubits[172];
-h qubits[172];
-h qubits[172];
-ccx qubits[54],qubits[118],qubits[172];
-h qubits[172];
-h qubits[172];
-ccx qubits[53],qubits[119],qubits[172];
-h qubits[172];
-h qubits[172];
-ccx qubits[52],qubits[120],qubits[172];
-h qubits[172];
-h qubits[172];
-ccx qubits[51],qubits[121],qubits[172];
-h qubits[172];
-h qubits[172];
-ccx qubits[50],qubits[122],qubits[172];
-h qubits[172];
-h qubits[172];
-ccx qubits[49],qubits[123],qubits[172];
-h qubits[172];
-h qubits[172];
-ccx qubits[48],qubits[124],qubits[172];
-h qubits[172];
-h qubits[172];
-ccx qubits[47],qubits[125],qubits[172];
-h qubits[172];
-h qubits[172];
-ccx qubits[46],qubits[126],qubits[172];
-h qubits[172];
-h qubits[172];
-ccx qubits[45],qubits[127],qubits[172];
-h qubits[172];
-h qubits[173];
-ccx qubits[63],qubits[110],qubits[173];
-h qubits[173];
-h qubits[173];
-ccx qubits[62],qubits[111],qubits[173];
-h qubits[173];
-h qubits[173];
-ccx qubits[61],qubits[112],qubits[173];
-h qubits[173];
-h qubits[173];
-ccx qubits[60],qubits[113],qubits[173];
-h qubits[173];
-h qubits[173];
-ccx qubits[59],qubits[114],qubits[173];
-h qubits[173];
-h qubits[173];
-ccx qubits[58],qubits[115],qubits[173];
-h qubits[173];
-h qubits[173];
-ccx qubits[57],qubits[116],qubits[173];
-h qubits[173];
-h qubits[173];
-ccx qubits[56],qubits[117],qubits[173];
-h qubits[173];
-h qubits[173];
-ccx qubits[55],qubits[118],qubits[173];
-h qubits[173];
-h qubits[173];
-ccx qubits[54],qubits[119],qubits[173];
-h qubits[173];
-h qubits[173];
-ccx qubits[53],qubits[120],qubits[173];
-h qubits[173];
-h qubits[173];
-ccx qubits[52],qubits[121],qubits[173];
-h qubits[173];
-h qubits[173];
-ccx qubits[51],qubits[122],qubits[173];
-h qubits[173];
-h qubits[173];
-ccx qubits[50],qubits[123],qubits[173];
-h qubits[173];
-h qubits[173];
-ccx qubits[49],qubits[124],qubits[173];
-h qubits[173];
-h qubits[173];
-ccx qubits[48],qubits[125],qubits[173];
-h qubits[173];
-h qubits[173];
-ccx qubits[47],qubits[126],qubits[173];
-h qubits[173];
-h qubits[173];
-ccx qubits[46],qubits[127],qubits[173];
-h qubits[173];
-h qubits[174];
-ccx qubits[63],qubits[111],qubits[174];
-h qubits[174];
-h qubits[174];
-ccx qubits[62],qubits[112],qubits[174];
-h qubits[174];
-h qubits[174];
-ccx qubits[61],qubits[113],qubits[174];
-h qubits[174];
-h qubits[174];
-ccx qubits[60],qubits[114],qubits[174];
-h qubits[174];
-h qubits[174];
-ccx qubits[59],qubits[115],qubits[174];
-h qubits[174];
-h qubits[174];
-ccx qubits[58],qubits[116],qubits[174];
-h qubits[174];
-h qubits[174];
-ccx qubits[57],qubits[117],qubits[174];
-h qubits[174];
-h qubits[174];
-ccx qubits[56],qubits[118],qubits[174];
-h qubits[174];
-h qubits[174];
-ccx qubits[55],qubits[119],qubits[174];
-h qubits[174];
-h qubits[174];
-ccx qubits[54],qubits[120],qubits[174];
-h qubits[174];
-h qubits[174];
-ccx qubits[53],qubits[121],qubits[174];
-h qubits[174];
-h qubits[174];
-ccx qubits[52],qubits[122],qubits[174];
-h qubits[174];
-h qubits[174];
-ccx qubits[51],qubits[123],qubits[174];
-h qubits[174];
-h qubits[174];
-ccx qubits[50],qubits[124],qubits[174];
-h qubits[174];
-h qubits[174];
-ccx qubits[49],qubits[125],qubits[174];
-h qubits[174];
-h qubits[174];
-ccx qubits[48],qubits[126],qubits[174];
-h qubits[174];
-h qubits[174];
-ccx qubits[47],qubits[127],qubits[174];
-h qubits[174];
-h qubits[175];
-ccx qubits[63],qubits[112],qubits[175];
-h qubits[175];
-h qubits[175];
-ccx qubits[62],qubits[113],qubits[175];
-h qubits[175];
-h qubits[175];
-ccx qubits[61],qubits[114],qubits[175];
-h qubits[175];
-h qubits[175];
-ccx qubits[60],qubits[115],qubits[175];
-h qubits[175];
-h qubits[175];
-ccx qubits[59],qubits[116],qubits[175];
-h qubits[175];
-h qubits[175];
-ccx qubits[58],qubits[117],qubits[175];
-h qubits[175];
-h qubits[175];
-ccx qubits[57],qubits[118],qubits[175];
-h qubits[175];
-h qubits[175];
-ccx qubits[56],qubits[119],qubits[175];
-h qubits[175];
-h qubits[175];
-ccx qubits[55],qubits[120],qubits[175];
-h qubits[175];
-h qubits[175];
-ccx qubits[54],qubits[121],qubits[175];
-h qubits[175];
-h qubits[175];
-ccx qubits[53],qubits[122],qubits[175];
-h qubits[175];
-h qubits[175];
-ccx qubits[52],qubits[123],qubits[175];
-h qubits[175];
-h qubits[175];
-ccx qubits[51],qubits[124],qubits[175];
-h qubits[175];
-h qubits[175];
-ccx qubits[50],qubits[125],qubits[175];
-h qubits[175];
-h qubits[175];
-ccx qubits[49],qubits[126],qubits[175];
-h qubits[175];
-h qubits[175];
-ccx qubits[48],qubits[127],qubits[175];
-h qubits[175];
-h qubits[176];
-ccx qubits[63],qubits[113],qubits[176];
-h qubits[176];
-h qubits[176];
-ccx qubits[62],qubits[114],qubits[176];
-h qubits[176];
-h qubits[176];
-ccx qubits[61],qubits[115],qubits[176];
-h qubits[176];
-h qubits[176];
-ccx qubits[60],qubits[116],qubits[176];
-h qubits[176];
-h qubits[176];
-ccx qubits[59],qubits[117],qubits[176];
-h qubits[176];
-h qubits[176];
-ccx qubits[58],qubits[118],qubits[176];
-h qubits[176];
-h qubits[176];
-ccx qubits[57],qubits[119],qubits[176];
-h qubits[176];
-h qubits[176];
-ccx qubits[56],qubits[120],qubits[176];
-h qubits[176];
-h qubits[176];
-ccx qubits[55],qubits[121],qubits[176];
-h qubits[176];
-h qubits[176];
-ccx qubits[54],qubits[122],qubits[176];
-h qubits[176];
-h qubits[176];
-ccx qubits[53],qubits[123],qubits[176];
-h qubits[176];
-h qubits[176];
-ccx qubits[52],qubits[124],qubits[176];
-h qubits[176];
-h qubits[176];
-ccx qubits[51],qubits[125],qubits[176];
-h qubits[176];
-h qubits[176];
-ccx qubits[50],qubits[126],qubits[176];
-h qubits[176];
-h qubits[176];
-ccx qubits[49],qubits[127],qubits[176];
-h qubits[176];
-h qubits[177];
-ccx qubits[63],qubits[114],qubits[177];
-h qubits[177];
-h qubits[177];
-ccx qubits[62],qubits[115],qubits[177];
-h qubits[177];
-h qubits[177];
-ccx qubits[61],qubits[116],qubits[177];
-h qubits[177];
-h qubits[177];
-ccx qubits[60],qubits[117],qubits[177];
-h qubits[177];
-h qubits[177];
-ccx qubits[59],qubits[118],qubits[177];
-h qubits[177];
-h qubits[177];
-ccx qubits[58],qubits[119],qubits[177];
-h qubits[177];
-h qubits[177];
-ccx qubits[57],qubits[120],qubits[177];
-h qubits[177];
-h qubits[177];
-ccx qubits[56],qubits[121],qubits[177];
-h qubits[177];
-h qubits[177];
-ccx qubits[55],qubits[122],qubits[177];
-h qubits[177];
-h qubits[177];
-ccx qubits[54],qubits[123],qubits[177];
-h qubits[177];
-h qubits[177];
-ccx qubits[53],qubits[124],qubits[177];
-h qubits[177];
-h qubits[177];
-ccx qubits[52],qubits[125],qubits[177];
-h qubits[177];
-h qubits[177];
-ccx qubits[51],qubits[126],qubits[177];
-h qubits[177];
-h qubits[177];
-ccx qubits[50],qubits[127],qubits[177];
-h qubits[177];
-h qubits[178];
-ccx qubits[63],qubits[115],qubits[178];
-h qubits[178];
-h qubits[178];
-ccx qubits[62],qubits[116],qubits[178];
-h qubits[178];
-h qubits[178];
-ccx qubits[61],qubits[117],qubits[178];
-h qubits[178];
-h qubits[178];
-ccx qubits[60],qubits[118],qubits[178];
-h qubits[178];
-h qubits[178];
-ccx qubits[59],qubits[119],qubits[178];
-h qubits[178];
-h qubits[178];
-ccx qubits[58],qubits[120],qubits[178];
-h qubits[178];
-h qubits[178];
-ccx qubits[57],qubits[121],qubits[178];
-h qubits[178];
-h qubits[178];
-ccx qubits[56],qubits[122],qubits[178];
-h qubits[178];
-h qubits[178];
-ccx qubits[55],qubits[123],qubits[178];
-h qubits[178];
-h qubits[178];
-ccx qubits[54],qubits[124],qubits[178];
-h qubits[178];
-h qubits[178];
-ccx qubits[53],qubits[125],qubits[178];
-h qubits[178];
-h qubits[178];
-ccx qubits[52],qubits[126],qubits[178];
-h qubits[178];
-h qubits[178];
-ccx qubits[51],qubits[127],qubits[178];
-h qubits[178];
-h qubits[179];
-ccx qubits[63],qubits[116],qubits[179];
-h qubits[179];
-h qubits[179];
-ccx qubits[62],qubits[117],qubits[179];
-h qubits[179];
-h qubits[179];
-ccx qubits[61],qubits[118],qubits[179];
-h qubits[179];
-h qubits[179];
-ccx qubits[60],qubits[119],qubits[179];
-h qubits[179];
-h qubits[179];
-ccx qubits[59],qubits[120],qubits[179];
-h qubits[179];
-h qubits[179];
-ccx qubits[58],qubits[121],qubits[179];
-h qubits[179];
-h qubits[179];
-ccx qubits[57],qubits[122],qubits[179];
-h qubits[179];
-h qubits[179];
-ccx qubits[56],qubits[123],qubits[179];
-h qubits[179];
-h qubits[179];
-ccx qubits[55],qubits[124],qubits[179];
-h qubits[179];
-h qubits[179];
-ccx qubits[54],qubits[125],qubits[179];
-h qubits[179];
-h qubits[179];
-ccx qubits[53],qubits[126],qubits[179];
-h qubits[179];
-h qubits[179];
-ccx qubits[52],qubits[127],qubits[179];
-h qubits[179];
-h qubits[180];
-ccx qubits[63],qubits[117],qubits[180];
-h qubits[180];
-h qubits[180];
-ccx qubits[62],qubits[118],qubits[180];
-h qubits[180];
-h qubits[180];
-ccx qubits[61],qubits[119],qubits[180];
-h qubits[180];
-h qubits[180];
-ccx qubits[60],qubits[120],qubits[180];
-h qubits[180];
-h qubits[180];
-ccx qubits[59],qubits[121],qubits[180];
-h qubits[180];
-h qubits[180];
-ccx qubits[58],qubits[122],qubits[180];
-h qubits[180];
-h qubits[180];
-ccx qubits[57],qubits[123],qubits[180];
-h qubits[180];
-h qubits[180];
-ccx qubits[56],qubits[124],qubits[180];
-h qubits[180];
-h qubits[180];
-ccx qubits[55],qubits[125],qubits[180];
-h qubits[180];
-h qubits[180];
-ccx qubits[54],qubits[126],qubits[180];
-h qubits[180];
-h qubits[180];
-ccx qubits[53],qubits[127],qubits[180];
-h qubits[180];
-h qubits[181];
-ccx qubits[63],qubits[118],qubits[181];
-h qubits[181];
-h qubits[181];
-ccx qubits[62],qubits[119],qubits[181];
-h qubits[181];
-h qubits[181];
-ccx qubits[61],qubits[120],qubits[181];
-h qubits[181];
-h qubits[181];
-ccx qubits[60],qubits[121],qubits[181];
-h qubits[181];
-h qubits[181];
-ccx qubits[59],qubits[122],qubits[181];
-h qubits[181];
-h qubits[181];
-ccx qubits[58],qubits[123],qubits[181];
-h qubits[181];
-h qubits[181];
-ccx qubits[57],qubits[124],qubits[181];
-h qubits[181];
-h qubits[181];
-ccx qubits[56],qubits[125],qubits[181];
-h qubits[181];
-h qubits[181];
-ccx qubits[55],qubits[126],qubits[181];
-h qubits[181];
-h qubits[181];
-ccx qubits[54],qubits[127],qubits[181];
-h qubits[181];
-h qubits[182];
-ccx qubits[63],qubits[119],qubits[182];
-h qubits[182];
-h qubits[182];
-ccx qubits[62],qubits[120],qubits[182];
-h qubits[182];
-h qubits[182];
-ccx qubits[61],qubits[121],qubits[182];
-h qubits[182];
-h qubits[182];
-ccx qubits[60],qubits[122],qubits[182];
-h qubits[182];
-h qubits[182];
-ccx qubits[59],qubits[123],qubits[182];
-h qubits[182];
-h qubits[182];
-ccx qubits[58],qubits[124],qubits[182];
-h qubits[182];
-h qubits[182];
-ccx qubits[57],qubits[125],qubits[182];
-h qubits[182];
-h qubits[182];
-ccx qubits[56],qubits[126],qubits[182];
-h qubits[182];
-h qubits[182];
-ccx qubits[55],qubits[127],qubits[182];
-h qubits[182];
-h qubits[183];
-ccx qubits[63],qubits[120],qubits[183];
-h qubits[183];
-h qubits[183];
-ccx qubits[62],qubits[121],qubits[183];
-h qubits[183];
-h qubits[183];
-ccx qubits[61],qubits[122],qubits[183];
-h qubits[183];
-h qubits[183];
-ccx qubits[60],qubits[123],qubits[183];
-h qubits[183];
-h qubits[183];
-ccx qubits[59],qubits[124],qubits[183];
-h qubits[183];
-h qubits[183];
-ccx qubits[58],qubits[125],qubits[183];
-h qubits[183];
-h qubits[183];
-ccx qubits[57],qubits[126],qubits[183];
-h qubits[183];
-h qubits[183];
-ccx qubits[56],qubits[127],qubits[183];
-h qubits[183];
-h qubits[184];
-ccx qubits[63],qubits[121],qubits[184];
-h qubits[184];
-h qubits[184];
-ccx qubits[62],qubits[122],qubits[184];
-h qubits[184];
-h qubits[184];
-ccx qubits[61],qubits[123],qubits[184];
-h qubits[184];
-h qubits[184];
-ccx qubits[60],qubits[124],qubits[184];
-h qubits[184];
-h qubits[184];
-ccx qubits[59],qubits[125],qubits[184];
-h qubits[184];
-h qubits[184];
-ccx qubits[58],qubits[126],qubits[184];
-h qubits[184];
-h qubits[184];
-ccx qubits[57],qubits[127],qubits[184];
-h qubits[184];
-h qubits[185];
-ccx qubits[63],qubits[122],qubits[185];
-h qubits[185];
-h qubits[185];
-ccx qubits[62],qubits[123],qubits[185];
-h qubits[185];
-h qubits[185];
-ccx qubits[61],qubits[124],qubits[185];
-h qubits[185];
-h qubits[185];
-ccx qubits[60],qubits[125],qubits[185];
-h qubits[185];
-h qubits[185];
-ccx qubits[59],qubits[126],qubits[185];
-h qubits[185];
-h qubits[185];
-ccx qubits[58],qubits[127],qubits[185];
-h qubits[185];
-h qubits[186];
-ccx qubits[63],qubits[123],qubits[186];
-h qubits[186];
-h qubits[186];
-ccx qubits[62],qubits[124],qubits[186];
-h qubits[186];
-h qubits[186];
-ccx qubits[61],qubits[125],qubits[186];
-h qubits[186];
-h qubits[186];
-ccx qubits[60],qubits[126],qubits[186];
-h qubits[186];
-h qubits[186];
-ccx qubits[59],qubits[127],qubits[186];
-h qubits[186];
-h qubits[187];
-ccx qubits[63],qubits[124],qubits[187];
-h qubits[187];
-h qubits[187];
-ccx qubits[62],qubits[125],qubits[187];
-h qubits[187];
-h qubits[187];
-ccx qubits[61],qubits[126],qubits[187];
-h qubits[187];
-h qubits[187];
-ccx qubits[60],qubits[127],qubits[187];
-h qubits[187];
-h qubits[188];
-ccx qubits[63],qubits[125],qubits[188];
-h qubits[188];
-h qubits[188];
-ccx qubits[62],qubits[126],qubits[188];
-h qubits[188];
-h qubits[188];
-ccx qubits[61],qubits[127],qubits[188];
-h qubits[188];
-h qubits[189];
-ccx qubits[63],qubits[126],qubits[189];
-h qubits[189];
-h qubits[189];
-ccx qubits[62],qubits[127],qubits[189];
-h qubits[189];
-h qubits[190];
-ccx qubits[63],qubits[127],qubits[190];
-h qubits[190];
-h qubits[128];
-h qubits[129];
-h qubits[130];
-h qubits[131];
-h qubits[132];
-h qubits[133];
-h qubits[134];
-h qubits[135];
-h qubits[136];
-h qubits[137];
-h qubits[138];
-h qubits[139];
-h qubits[140];
-h qubits[141];
-h qubits[142];
-h qubits[143];
-h qubits[144];
-h qubits[145];
-h qubits[146];
-h qubits[147];
-h qubits[148];
-h qubits[149];
-h qubits[150];
-h qubits[151];
-h qubits[152];
-h qubits[153];
-h qubits[154];
-h qubits[155];
-h qubits[156];
-h qubits[157];
-h qubits[158];
-h qubits[159];
-h qubits[160];
-h qubits[161];
-h qubits[162];
-h qubits[163];
-h qubits[164];
-h qubits[165];
-h qubits[166];
-h qubits[167];
-h qubits[168];
-h qubits[169];
-h qubits[170];
-h qubits[171];
-h qubits[172];
-h qubits[173];
-h qubits[174];
-h qubits[175];
-h qubits[176];
-h qubits[177];
-h qubits[178];
-h qubits[179];
-h qubits[180];
-h qubits[181];
-h qubits[182];
-h qubits[183];
-h qubits[184];
-h qubits[185];
-h qubits[186];
-h qubits[187];
-h qubits[188];
-h qubits[189];
-h qubits[190];
-cx qubits[190],qubits[130];
-cx qubits[190],qubits[129];
-cx qubits[190],qubits[191];
-cx qubits[189],qubits[129];
-cx qubits[189],qubits[128];
-cx qubits[189],qubits[190];
-cx qubits[188],qubits[128];
-cx qubits[188],qubits[191];
-cx qubits[188],qubits[189];
-cx qubits[187],qubits[191];
-cx qubits[187],qubits[190];
-cx qubits[187],qubits[188];
-cx qubits[186],qubits[190];
-cx qubits[186],qubits[189];
-cx qubits[186],qubits[187];
-cx qubits[185],qubits[189];
-cx qubits[185],qubits[188];
-cx qubits[185],qubits[186];
-cx qubits[184],qubits[188];
-cx qubits[184],qubits[187];
-cx qubits[184],qubits[185];
-cx qubits[183],qubits[187];
-cx qubits[183],qubits[186];
-cx qubits[183],qubits[184];
-cx qubits[182],qubits[186];
-cx qubits[182],qubits[185];
-cx qubits[182],qubits[183];
-cx qubits[181],qubits[185];
-cx qubits[181],qubits[184];
-cx qubits[181],qubits[182];
-cx qubits[180],qubits[184];
-cx qubits[180],qubits[183];
-cx qubits[180],qubits[181];
-cx qubits[179],qubits[183];
-cx qubits[179],qubits[182];
-cx qubits[179],qubits[180];
-cx qubits[178],qubits[182];
-cx qubits[178],qubits[181];
-cx qubits[178],qubits[179];
-cx qubits[177],qubits[181];
-cx qubits[177],qubits[180];
-cx qubits[177],qubits[178];
-cx qubits[176],qubits[180];
-cx qubits[176],qubits[179];
-cx qubits[176],qubits[177];
-cx qubits[175],qubits[179];
-cx qubits[175],qubits[178];
-cx qubits[175],qubits[176];
-cx qubits[174],qubits[178];
-cx qubits[174],qubits[177];
-cx qubits[174],qubits[175];
-cx qubits[173],qubits[177];
-cx qubits[173],qubits[176];
-cx qubits[173],qubits[174];
-cx qubits[172],qubits[176];
-cx qubits[172],qubits[175];
-cx qubits[172],qubits[173];
-cx qubits[171],qubits[175];
-cx qubits[171],qubits[174];
-cx qubits[171],qubits[172];
-cx qubits[170],qubits[174];
-cx qubits[170],qubits[173];
-cx qubits[170],qubits[171];
-cx qubits[169],qubits[173];
-cx qubits[169],qubits[172];
-cx qubits[169],qubits[170];
-cx qubits[168],qubits[172];
-cx qubits[168],qubits[171];
-cx qubits[168],qubits[169];
-cx qubits[167],qubits[171];
-cx qubits[167],qubits[170];
-cx qubits[167],qubits[168];
-cx qubits[166],qubits[170];
-cx qubits[166],qubits[169];
-cx qubits[166],qubits[167];
-cx qubits[165],qubits[169];
-cx qubits[165],qubits[168];
-cx qubits[165],qubits[166];
-cx qubits[164],qubits[168];
-cx qubits[164],qubits[167];
-cx qubits[164],qubits[165];
-cx qubits[163],qubits[167];
-cx qubits[163],qubits[166];
-cx qubits[163],qubits[164];
-cx qubits[162],qubits[166];
-cx qubits[162],qubits[165];
-cx qubits[162],qubits[163];
-cx qubits[161],qubits[165];
-cx qubits[161],qubits[164];
-cx qubits[161],qubits[162];
-cx qubits[160],qubits[164];
-cx qubits[160],qubits[163];
-cx qubits[160],qubits[161];
-cx qubits[159],qubits[163];
-cx qubits[159],qubits[162];
-cx qubits[159],qubits[160];
-cx qubits[158],qubits[162];
-cx qubits[158],qubits[161];
-cx qubits[158],qubits[159];
-cx qubits[157],qubits[161];
-cx qubits[157],qubits[160];
-cx qubits[157],qubits[158];
-cx qubits[156],qubits[160];
-cx qubits[156],qubits[159];
-cx qubits[156],qubits[157];
-cx qubits[155],qubits[159];
-cx qubits[155],qubits[158];
-cx qubits[155],qubits[156];
-cx qubits[154],qubits[158];
-cx qubits[154],qubits[157];
-cx qubits[154],qubits[155];
-cx qubits[153],qubits[157];
-cx qubits[153],qubits[156];
-cx qubits[153],qubits[154];
-cx qubits[152],qubits[156];
-cx qubits[152],qubits[155];
-cx qubits[152],qubits[153];
-cx qubits[151],qubits[155];
-cx qubits[151],qubits[154];
-cx qubits[151],qubits[152];
-cx qubits[150],qubits[154];
-cx qubits[150],qubits[153];
-cx qubits[150],qubits[151];
-cx qubits[149],qubits[153];
-cx qubits[149],qubits[152];
-cx qubits[149],qubits[150];
-cx qubits[148],qubits[152];
-cx qubits[148],qubits[151];
-cx qubits[148],qubits[149];
-cx qubits[147],qubits[151];
-cx qubits[147],qubits[150];
-cx qubits[147],qubits[148];
-cx qubits[146],qubits[150];
-cx qubits[146],qubits[149];
-cx qubits[146],qubits[147];
-cx qubits[145],qubits[149];
-cx qubits[145],qubits[148];
-cx qubits[145],qubits[146];
-cx qubits[144],qubits[148];
-cx qubits[144],qubits[147];
-cx qubits[144],qubits[145];
-cx qubits[143],qubits[147];
-cx qubits[143],qubits[146];
-cx qubits[143],qubits[144];
-cx qubits[142],qubits[146];
-cx qubits[142],qubits[145];
-cx qubits[142],qubits[143];
-cx qubits[141],qubits[145];
-cx qubits[141],qubits[144];
-cx qubits[141],qubits[142];
-cx qubits[140],qubits[144];
-cx qubits[140],qubits[143];
-cx qubits[140],qubits[141];
-cx qubits[139],qubits[143];
-cx qubits[139],qubits[142];
-cx qubits[139],qubits[140];
-cx qubits[138],qubits[142];
-cx qubits[138],qubits[141];
-cx qubits[138],qubits[139];
-cx qubits[137],qubits[141];
-cx qubits[137],qubits[140];
-cx qubits[137],qubits[138];
-cx qubits[136],qubits[140];
-cx qubits[136],qubits[139];
-cx qubits[136],qubits[137];
-cx qubits[135],qubits[139];
-cx qubits[135],qubits[138];
-cx qubits[135],qubits[136];
-cx qubits[134],qubits[138];
-cx qubits[134],qubits[137];
-cx qubits[134],qubits[135];
-cx qubits[133],qubits[137];
-cx qubits[133],qubits[136];
-cx qubits[133],qubits[134];
-cx qubits[132],qubits[136];
-cx qubits[132],qubits[135];
-cx qubits[132],qubits[133];
-cx qubits[131],qubits[135];
-cx qubits[131],qubits[134];
-cx qubits[131],qubits[132];
-cx qubits[130],qubits[134];
-cx qubits[130],qubits[133];
-cx qubits[130],qubits[131];
-cx qubits[129],qubits[133];
-cx qubits[129],qubits[132];
-cx qubits[129],qubits[130];
-cx qubits[128],qubits[132];
-cx qubits[128],qubits[131];
-cx qubits[128],qubits[129];
-h qubits[128];
-h qubits[129];
-h qubits[130];
-h qubits[131];
-h qubits[132];
-h qubits[133];
-h qubits[134];
-h qubits[135];
-h qubits[136];
-h qubits[137];
-h qubits[138];
-h qubits[139];
-h qubits[140];
-h qubits[141];
-h qubits[142];
-h qubits[143];
-h qubits[144];
-h qubits[145];
-h qubits[146];
-h qubits[147];
-h qubits[148];
-h qubits[149];
-h qubits[150];
-h qubits[151];
-h qubits[152];
-h qubits[153];
-h qubits[154];
-h qubits[155];
-h qubits[156];
-h qubits[157];
-h qubits[158];
-h qubits[159];
-h qubits[160];
-h qubits[161];
-h qubits[162];
-h qubits[163];
-h qubits[164];
-h qubits[165];
-h qubits[166];
-h qubits[167];
-h qubits[168];
-h qubits[169];
-h qubits[170];
-h qubits[171];
-h qubits[172];
-h qubits[173];
-h qubits[174];
-h qubits[175];
-h qubits[176];
-h qubits[177];
-h qubits[178];
-h qubits[179];
-h qubits[180];
-h qubits[181];
-h qubits[182];
-h qubits[183];
-h qubits[184];
-h qubits[185];
-h qubits[186];
-h qubits[187];
-h qubits[188];
-h qubits[189];
-h qubits[190];
-h qubits[191];
-h qubits[191];
-ccx qubits[63],qubits[64],qubits[191];
-h qubits[191];
-h qubits[191];
-ccx qubits[62],qubits[65],qubits[191];
-h qubits[191];
-h qubits[191];
-ccx qubits[61],qubits[66],qubits[191];
-h qubits[191];
-h qubits[191];
-ccx qubits[60],qubits[67],qubits[191];
-h qubits[191];
-h qubits[191];
-ccx qubits[59],qubits[68],qubits[191];
-h qubits[191];
-h qubits[191];
-ccx qubits[58],qubits[69],qubits[191];
-h qubits[191];
-h qubits[191];
-ccx qubits[57],qubits[70],qubits[191];
-h qubits[191];
-h qubits[191];
-ccx qubits[56],qubits[71],qubits[191];
-h qubits[191];
-h qubits[191];
-ccx qubits[55],qubits[72],qubits[191];
-h qubits[191];
-h qubits[191];
-ccx qubits[54],qubits[73],qubits[191];
-h qubits[191];
-h qubits[191];
-ccx qubits[53],qubits[74],qubits[191];
-h qubits[191];
-h qubits[191];
-ccx qubits[52],qubits[75],qubits[191];
-h qubits[191];
-h qubits[191];
-ccx qubits[51],qubits[76],qubits[191];
-h qubits[191];
-h qubits[191];
-ccx qubits[50],qubits[77],qubits[191];
-h qubits[191];
-h qubits[191];
-ccx qubits[49],qubits[78],qubits[191];
-h qubits[191];
-h qubits[191];
-ccx qubits[48],qubits[79],qubits[191];
-h qubits[191];
-h qubits[191];
-ccx qubits[47],qubits[80],qubits[191];
-h qubits[191];
-h qubits[191];
-ccx qubits[46],qubits[81],qubits[191];
-h qubits[191];
-h qubits[191];
-ccx qubits[45],qubits[82],qubits[191];
-h qubits[191];
-h qubits[191];
-ccx qubits[44],qubits[83],qubits[191];
-h qubits[191];
-h qubits[191];
-ccx qubits[43],qubits[84],qubits[191];
-h qubits[191];
-h qubits[191];
-ccx qubits[42],qubits[85],qubits[191];
-h qubits[191];
-h qubits[191];
-ccx qubits[41],qubits[86],qubits[191];
-h qubits[191];
-h qubits[191];
-ccx qubits[40],qubits[87],qubits[191];
-h qubits[191];
-h qubits[191];
-ccx qubits[39],qubits[88],qubits[191];
-h qubits[191];
-h qubits[191];
-ccx qubits[38],qubits[89],qubits[191];
-h qubits[191];
-h qubits[191];
-ccx qubits[37],qubits[90],qubits[191];
-h qubits[191];
-h qubits[191];
-ccx qubits[36],qubits[91],qubits[191];
-h qubits[191];
-h qubits[191];
-ccx qubits[35],qubits[92],qubits[191];
-h qubits[191];
-h qubits[191];
-ccx qubits[34],qubits[93],qubits[191];
-h qubits[191];
-h qubits[191];
-ccx qubits[33],qubits[94],qubits[191];
-h qubits[191];
-h qubits[191];
-ccx qubits[32],qubits[95],qubits[191];
-h qubits[191];
-h qubits[191];
-ccx qubits[31],qubits[96],qubits[191];
-h qubits[191];
-h qubits[191];
-ccx qubits[30],qubits[97],qubits[191];
-h qubits[191];
-h qubits[191];
-ccx qubits[29],qubits[98],qubits[191];
-h qubits[191];
-h qubits[191];
-ccx qubits[28],qubits[99],qubits[191];
-h qubits[191];
-h qubits[191];
-ccx qubits[27],qubits[100],qubits[191];
-h qubits[191];
-h qubits[191];
-ccx qubits[26],qubits[101],qubits[191];
-h qubits[191];
-h qubits[191];
-ccx qubits[25],qubits[102],qubits[191];
-h qubits[191];
-h qubits[191];
-ccx qubits[24],qubits[103],qubits[191];
-h qubits[191];
-h qubits[191];
-ccx qubits[23],qubits[104],qubits[191];
-h qubits[191];
-h qubits[191];
-ccx qubits[22],qubits[105],qubits[191];
-h qubits[191];
-h qubits[191];
-ccx qubits[21],qubits[106],qubits[191];
-h qubits[191];
-h qubits[191];
-ccx qubits[20],qubits[107],qubits[191];
-h qubits[191];
-h qubits[191];
-ccx qubits[19],qubits[108],qubits[191];
-h qubits[191];
-h qubits[191];
-ccx qubits[18],qubits[109],qubits[191];
-h qubits[191];
-h qubits[191];
-ccx qubits[17],qubits[110],qubits[191];
-h qubits[191];
-h qubits[191];
-ccx qubits[16],qubits[111],qubits[191];
-h qubits[191];
-h qubits[191];
-ccx qubits[15],qubits[112],qubits[191];
-h qubits[191];
-h qubits[191];
-ccx qubits[14],qubits[113],qubits[191];
-h qubits[191];
-h qubits[191];
-ccx qubits[13],qubits[114],qubits[191];
-h qubits[191];
-h qubits[191];
-ccx qubits[12],qubits[115],qubits[191];
-h qubits[191];
-h qubits[191];
-ccx qubits[11],qubits[116],qubits[191];
-h qubits[191];
-h qubits[191];
-ccx qubits[10],qubits[117],qubits[191];
-h qubits[191];
-h qubits[191];
-ccx qubits[9],qubits[118],qubits[191];
-h qubits[191];
-h qubits[191];
-ccx qubits[8],qubits[119],qubits[191];
-h qubits[191];
-h qubits[191];
-ccx qubits[7],qubits[120],qubits[191];
-h qubits[191];
-h qubits[191];
-ccx qubits[6],qubits[121],qubits[191];
-h qubits[191];
-h qubits[191];
-ccx qubits[5],qubits[122],qubits[191];
-h qubits[191];
-h qubits[191];
-ccx qubits[4],qubits[123],qubits[191];
-h qubits[191];
-h qubits[191];
-ccx qubits[3],qubits[124],qubits[191];
-h qubits[191];
-h qubits[191];
-ccx qubits[2],qubits[125],qubits[191];
-h qubits[191];
-h qubits[191];
-ccx qubits[1],qubits[126],qubits[191];
-h qubits[191];
-h qubits[191];
-ccx qubits[0],qubits[127],qubits[191];
-h qubits[191];
-h qubits[190];
-ccx qubits[62],qubits[64],qubits[190];
-h qubits[190];
-h qubits[190];
-ccx qubits[61],qubits[65],qubits[190];
-h qubits[190];
-h qubits[190];
-ccx qubits[60],qubits[66],qubits[190];
-h qubits[190];
-h qubits[190];
-ccx qubits[59],qubits[67],qubits[190];
-h qubits[190];
-h qubits[190];
-ccx qubits[58],qubits[68],qubits[190];
-h qubits[190];
-h qubits[190];
-ccx qubits[57],qubits[69],qubits[190];
-h qubits[190];
-h qubits[190];
-ccx qubits[56],qubits[70],qubits[190];
-h qubits[190];
-h qubits[190];
-ccx qubits[55],qubits[71],qubits[190];
-h qubits[190];
-h qubits[190];
-ccx qubits[54],qubits[72],qubits[190];
-h qubits[190];
-h qubits[190];
-ccx qubits[53],qubits[73],qubits[190];
-h qubits[190];
-h qubits[190];
-ccx qubits[52],qubits[74],qubits[190];
-h qubits[190];
-h qubits[190];
-ccx qubits[51],qubits[75],qubits[190];
-h qubits[190];
-h qubits[190];
-ccx qubits[50],qubits[76],qubits[190];
-h qubits[190];
-h qubits[190];
-ccx qubits[49],qubits[77],qubits[190];
-h qubits[190];
-h qubits[190];
-ccx qubits[48],qubits[78],qubits[190];
-h qubits[190];
-h qubits[190];
-ccx qubits[47],qubits[79],qubits[190];
-h qubits[190];
-h qubits[190];
-ccx qubits[46],qubits[80],qubits[190];
-h qubits[190];
-h qubits[190];
-ccx qubits[45],qubits[81],qubits[190];
-h qubits[190];
-h qubits[190];
-ccx qubits[44],qubits[82],qubits[190];
-h qubits[190];
-h qubits[190];
-ccx qubits[43],qubits[83],qubits[190];
-h qubits[190];
-h qubits[190];
-ccx qubits[42],qubits[84],qubits[190];
-h qubits[190];
-h qubits[190];
-ccx qubits[41],qubits[85],qubits[190];
-h qubits[190];
-h qubits[190];
-ccx qubits[40],qubits[86],qubits[190];
-h qubits[190];
-h qubits[190];
-ccx qubits[39],qubits[87],qubits[190];
-h qubits[190];
-h qubits[190];
-ccx qubits[38],qubits[88],qubits[190];
-h qubits[190];
-h qubits[190];
-ccx qubits[37],qubits[89],qubits[190];
-h qubits[190];
-h qubits[190];
-ccx qubits[36],qubits[90],qubits[190];
-h qubits[190];
-h qubits[190];
-ccx qubits[35],qubits[91],qubits[190];
-h qubits[190];
-h qubits[190];
-ccx qubits[34],qubits[92],qubits[190];
-h qubits[190];
-h qubits[190];
-ccx qubits[33],qubits[93],qubits[190];
-h qubits[190];
-h qubits[190];
-ccx qubits[32],qubits[94],qubits[190];
-h qubits[190];
-h qubits[190];
-ccx qubits[31],qubits[95],qubits[190];
-h qubits[190];
-h qubits[190];
-ccx qubits[30],qubits[96],qubits[190];
-h qubits[190];
-h qubits[190];
-ccx qubits[29],qubits[97],qubits[190];
-h qubits[190];
-h qubits[190];
-ccx qubits[28],qubits[98],qubits[190];
-h qubits[190];
-h qubits[190];
-ccx qubits[27],qubits[99],qubits[190];
-h qubits[190];
-h qubits[190];
-ccx qubits[26],qubits[100],qubits[190];
-h qubits[190];
-h qubits[190];
-ccx qubits[25],qubits[101],qubits[190];
-h qubits[190];
-h qubits[190];
-ccx qubits[24],qubits[102],qubits[190];
-h qubits[190];
-h qubits[190];
-ccx qubits[23],qubits[103],qubits[190];
-h qubits[190];
-h qubits[190];
-ccx qubits[22],qubits[104],qubits[190];
-h qubits[190];
-h qubits[190];
-ccx qubits[21],qubits[105],qubits[190];
-h qubits[190];
-h qubits[190];
-ccx qubits[20],qubits[106],qubits[190];
-h qubits[190];
-h qubits[190];
-ccx qubits[19],qubits[107],qubits[190];
-h qubits[190];
-h qubits[190];
-ccx qubits[18],qubits[108],qubits[190];
-h qubits[190];
-h qubits[190];
-ccx qubits[17],qubits[109],qubits[190];
-h qubits[190];
-h qubits[190];
-ccx qubits[16],qubits[110],qubits[190];
-h qubits[190];
-h qubits[190];
-ccx qubits[15],qubits[111],qubits[190];
-h qubits[190];
-h qubits[190];
-ccx qubits[14],qubits[112],qubits[190];
-h qubits[190];
-h qubits[190];
-ccx qubits[13],qubits[113],qubits[190];
-h qubits[190];
-h qubits[190];
-ccx qubits[12],qubits[114],qubits[190];
-h qubits[190];
-h qubits[190];
-ccx qubits[11],qubits[115],qubits[190];
-h qubits[190];
-h qubits[190];
-ccx qubits[10],qubits[116],qubits[190];
-h qubits[190];
-h qubits[190];
-ccx qubits[9],qubits[117],qubits[190];
-h qubits[190];
-h qubits[190];
-ccx qubits[8],qubits[118],qubits[190];
-h qubits[190];
-h qubits[190];
-ccx qubits[7],qubits[119],qubits[190];
-h qubits[190];
-h qubits[190];
-ccx qubits[6],qubits[120],qubits[190];
-h qubits[190];
-h qubits[190];
-ccx qubits[5],qubits[121],qubits[190];
-h qubits[190];
-h qubits[190];
-ccx qubits[4],qubits[122],qubits[190];
-h qubits[190];
-h qubits[190];
-ccx qubits[3],qubits[123],qubits[190];
-h qubits[190];
-h qubits[190];
-ccx qubits[2],qubits[124],qubits[190];
-h qubits[190];
-h qubits[190];
-ccx qubits[1],qubits[125],qubits[190];
-h qubits[190];
-h qubits[190];
-ccx qubits[0],qubits[126],qubits[190];
-h qubits[190];
-h qubits[189];
-ccx qubits[61],qubits[64],qubits[189];
-h qubits[189];
-h qubits[189];
-ccx qubits[60],qubits[65],qubits[189];
-h qubits[189];
-h qubits[189];
-ccx qubits[59],qubits[66],qubits[189];
-h qubits[189];
-h qubits[189];
-ccx qubits[58],qubits[67],qubits[189];
-h qubits[189];
-h qubits[189];
-ccx qubits[57],qubits[68],qubits[189];
-h qubits[189];
-h qubits[189];
-ccx qubits[56],qubits[69],qubits[189];
-h qubits[189];
-h qubits[189];
-ccx qubits[55],qubits[70],qubits[189];
-h qubits[189];
-h qubits[189];
-ccx qubits[54],qubits[71],qubits[189];
-h qubits[189];
-h qubits[189];
-ccx qubits[53],qubits[72],qubits[189];
-h qubits[189];
-h qubits[189];
-ccx qubits[52],qubits[73],qubits[189];
-h qubits[189];
-h qubits[189];
-ccx qubits[51],qubits[74],qubits[189];
-h qubits[189];
-h qubits[189];
-ccx qubits[50],qubits[75],qubits[189];
-h qubits[189];
-h qubits[189];
-ccx qubits[49],qubits[76],qubits[189];
-h qubits[189];
-h qubits[189];
-ccx qubits[48],qubits[77],qubits[189];
-h qubits[189];
-h qubits[189];
-ccx qubits[47],qubits[78],qubits[189];
-h qubits[189];
-h qubits[189];
-ccx qubits[46],qubits[79],qubits[189];
-h qubits[189];
-h qubits[189];
-ccx qubits[45],qubits[80],qubits[189];
-h qubits[189];
-h qubits[189];
-ccx qubits[44],qubits[81],qubits[189];
-h qubits[189];
-h qubits[189];
-ccx qubits[43],qubits[82],qubits[189];
-h qubits[189];
-h qubits[189];
-ccx qubits[42],qubits[83],qubits[189];
-h qubits[189];
-h qubits[189];
-ccx qubits[41],qubits[84],qubits[189];
-h qubits[189];
-h qubits[189];
-ccx qubits[40],qubits[85],qubits[189];
-h qubits[189];
-h qubits[189];
-ccx qubits[39],qubits[86],qubits[189];
-h qubits[189];
-h qubits[189];
-ccx qubits[38],qubits[87],qubits[189];
-h qubits[189];
-h qubits[189];
-ccx qubits[37],qubits[88],qubits[189];
-h qubits[189];
-h qubits[189];
-ccx qubits[36],qubits[89],qubits[189];
-h qubits[189];
-h qubits[189];
-ccx qubits[35],qubits[90],qubits[189];
-h qubits[189];
-h qubits[189];
-ccx qubits[34],qubits[91],qubits[189];
-h qubits[189];
-h qubits[189];
-ccx qubits[33],qubits[92],qubits[189];
-h qubits[189];
-h qubits[189];
-ccx qubits[32],qubits[93],qubits[189];
-h qubits[189];
-h qubits[189];
-ccx qubits[31],qubits[94],qubits[189];
-h qubits[189];
-h qubits[189];
-ccx qubits[30],qubits[95],qubits[189];
-h qubits[189];
-h qubits[189];
-ccx qubits[29],qubits[96],qubits[189];
-h qubits[189];
-h qubits[189];
-ccx qubits[28],qubits[97],qubits[189];
-h qubits[189];
-h qubits[189];
-ccx qubits[27],qubits[98],qubits[189];
-h qubits[189];
-h qubits[189];
-ccx qubits[26],qubits[99],qubits[189];
-h qubits[189];
-h qubits[189];
-ccx qubits[25],qubits[100],qubits[189];
-h qubits[189];
-h qubits[189];
-ccx qubits[24],qubits[101],qubits[189];
-h qubits[189];
-h qubits[189];
-ccx qubits[23],qubits[102],qubits[189];
-h qubits[189];
-h qubits[189];
-ccx qubits[22],qubits[103],qubits[189];
-h qubits[189];
-h qubits[189];
-ccx qubits[21],qubits[104],qubits[189];
-h qubits[189];
-h qubits[189];
-ccx qubits[20],qubits[105],qubits[189];
-h qubits[189];
-h qubits[189];
-ccx qubits[19],qubits[106],qubits[189];
-h qubits[189];
-h qubits[189];
-ccx qubits[18],qubits[107],qubits[189];
-h qubits[189];
-h qubits[189];
-ccx qubits[17],qubits[108],qubits[189];
-h qubits[189];
-h qubits[189];
-ccx qubits[16],qubits[109],qubits[189];
-h qubits[189];
-h qubits[189];
-ccx qubits[15],qubits[110],qubits[189];
-h qubits[189];
-h qubits[189];
-ccx qubits[14],qubits[111],qubits[189];
-h qubits[189];
-h qubits[189];
-ccx qubits[13],qubits[112],qubits[189];
-h qubits[189];
-h qubits[189];
-ccx qubits[12],qubits[113],qubits[189];
-h qubits[189];
-h qubits[189];
-ccx qubits[11],qubits[114],qubits[189];
-h qubits[189];
-h qubits[189];
-ccx qubits[10],qubits[115],qubits[189];
-h qubits[189];
-h qubits[189];
-ccx qubits[9],qubits[116],qubits[189];
-h qubits[189];
-h qubits[189];
-ccx qubits[8],qubits[117],qubits[189];
-h qubits[189];
-h qubits[189];
-ccx qubits[7],qubits[118],qubits[189];
-h qubits[189];
-h qubits[189];
-ccx qubits[6],qubits[119],qubits[189];
-h qubits[189];
-h qubits[189];
-ccx qubits[5],qubits[120],qubits[189];
-h qubits[189];
-h qubits[189];
-ccx qubits[4],qubits[121],qubits[189];
-h qubits[189];
-h qubits[189];
-ccx qubits[3],qubits[122],qubits[189];
-h qubits[189];
-h qubits[189];
-ccx qubits[2],qubits[123],qubits[189];
-h qubits[189];
-h qubits[189];
-ccx qubits[1],qubits[124],qubits[189];
-h qubits[189];
-h qubits[189];
-ccx qubits[0],qubits[125],qubits[189];
-h qubits[189];
-h qubits[188];
-ccx qubits[60],qubits[64],qubits[188];
-h qubits[188];
-h qubits[188];
-ccx qubits[59],qubits[65],qubits[188];
-h qubits[188];
-h qubits[188];
-ccx qubits[58],qubits[66],qubits[188];
-h qubits[188];
-h qubits[188];
-ccx qubits[57],qubits[67],qubits[188];
-h qubits[188];
-h qubits[188];
-ccx qubits[56],qubits[68],qubits[188];
-h qubits[188];
-h qubits[188];
-ccx qubits[55],qubits[69],qubits[188];
-h qubits[188];
-h qubits[188];
-ccx qubits[54],qubits[70],qubits[188];
-h qubits[188];
-h qubits[188];
-ccx qubits[53],qubits[71],qubits[188];
-h qubits[188];
-h qubits[188];
-ccx qubits[52],qubits[72],qubits[188];
-h qubits[188];
-h qubits[188];
-ccx qubits[51],qubits[73],qubits[188];
-h qubits[188];
-h qubits[188];
-ccx qubits[50],qubits[74],qubits[188];
-h qubits[188];
-h qubits[188];
-ccx qubits[49],qubits[75],qubits[188];
-h qubits[188];
-h qubits[188];
-ccx qubits[48],qubits[76],qubits[188];
-h qubits[188];
-h qubits[188];
-ccx qubits[47],qubits[77],qubits[188];
-h qubits[188];
-h qubits[188];
-ccx qubits[46],qubits[78],qubits[188];
-h qubits[188];
-h qubits[188];
-ccx qubits[45],qubits[79],qubits[188];
-h qubits[188];
-h qubits[188];
-ccx qubits[44],qubits[80],qubits[188];
-h qubits[188];
-h qubits[188];
-ccx qubits[43],qubits[81],qubits[188];
-h qubits[188];
-h qubits[188];
-ccx qubits[42],qubits[82],qubits[188];
-h qubits[188];
-h qubits[188];
-ccx qubits[41],qubits[83],qubits[188];
-h qubits[188];
-h qubits[188];
-ccx qubits[40],qubits[84],qubits[188];
-h qubits[188];
-h qubits[188];
-ccx qubits[39],qubits[85],qubits[188];
-h qubits[188];
-h qubits[188];
-ccx qubits[38],qubits[86],qubits[188];
-h qubits[188];
-h qubits[188];
-ccx qubits[37],qubits[87],qubits[188];
-h qubits[188];
-h qubits[188];
-ccx qubits[36],qubits[88],qubits[188];
-h qubits[188];
-h qubits[188];
-ccx qubits[35],qubits[89],qubits[188];
-h qubits[188];
-h qubits[188];
-ccx qubits[34],qubits[90],qubits[188];
-h qubits[188];
-h qubits[188];
-ccx qubits[33],qubits[91],qubits[188];
-h qubits[188];
-h qubits[188];
-ccx qubits[32],qubits[92],qubits[188];
-h qubits[188];
-h qubits[188];
-ccx qubits[31],qubits[93],qubits[188];
-h qubits[188];
-h qubits[188];
-ccx qubits[30],qubits[94],qubits[188];
-h qubits[188];
-h qubits[188];
-ccx qubits[29],qubits[95],qubits[188];
-h qubits[188];
-h qubits[188];
-ccx qubits[28],qubits[96],qubits[188];
-h qubits[188];
-h qubits[188];
-ccx qubits[27],qubits[97],qubits[188];
-h qubits[188];
-h qubits[188];
-ccx qubits[26],qubits[98],qubits[188];
-h qubits[188];
-h qubits[188];
-ccx qubits[25],qubits[99],qubits[188];
-h qubits[188];
-h qubits[188];
-ccx qubits[24],qubits[100],qubits[188];
-h qubits[188];
-h qubits[188];
-ccx qubits[23],qubits[101],qubits[188];
-h qubits[188];
-h qubits[188];
-ccx qubits[22],qubits[102],qubits[188];
-h qubits[188];
-h qubits[188];
-ccx qubits[21],qubits[103],qubits[188];
-h qubits[188];
-h qubits[188];
-ccx qubits[20],qubits[104],qubits[188];
-h qubits[188];
-h qubits[188];
-ccx qubits[19],qubits[105],qubits[188];
-h qubits[188];
-h qubits[188];
-ccx qubits[18],qubits[106],qubits[188];
-h qubits[188];
-h qubits[188];
-ccx qubits[17],qubits[107],qubits[188];
-h qubits[188];
-h qubits[188];
-ccx qubits[16],qubits[108],qubits[188];
-h qubits[188];
-h qubits[188];
-ccx qubits[15],qubits[109],qubits[188];
-h qubits[188];
-h qubits[188];
-ccx qubits[14],qubits[110],qubits[188];
-h qubits[188];
-h qubits[188];
-ccx qubits[13],qubits[111],qubits[188];
-h qubits[188];
-h qubits[188];
-ccx qubits[12],qubits[112],qubits[188];
-h qubits[188];
-h qubits[188];
-ccx qubits[11],qubits[113],qubits[188];
-h qubits[188];
-h qubits[188];
-ccx qubits[10],qubits[114],qubits[188];
-h qubits[188];
-h qubits[188];
-ccx qubits[9],qubits[115],qubits[188];
-h qubits[188];
-h qubits[188];
-ccx qubits[8],qubits[116],qubits[188];
-h qubits[188];
-h qubits[188];
-ccx qubits[7],qubits[117],qubits[188];
-h qubits[188];
-h qubits[188];
-ccx qubits[6],qubits[118],qubits[188];
-h qubits[188];
-h qubits[188];
-ccx qubits[5],qubits[119],qubits[188];
-h qubits[188];
-h qubits[188];
-ccx qubits[4],qubits[120],qubits[188];
-h qubits[188];
-h qubits[188];
-ccx qubits[3],qubits[121],qubits[188];
-h qubits[188];
-h qubits[188];
-ccx qubits[2],qubits[122],qubits[188];
-h qubits[188];
-h qubits[188];
-ccx qubits[1],qubits[123],qubits[188];
-h qubits[188];
-h qubits[188];
-ccx qubits[0],qubits[124],qubits[188];
-h qubits[188];
-h qubits[187];
-ccx qubits[59],qubits[64],qubits[187];
-h qubits[187];
-h qubits[187];
-ccx qubits[58],qubits[65],qubits[187];
-h qubits[187];
-h qubits[187];
-ccx qubits[57],qubits[66],qubits[187];
-h qubits[187];
-h qubits[187];
-ccx qubits[56],qubits[67],qubits[187];
-h qubits[187];
-h qubits[187];
-ccx qubits[55],qubits[68],qubits[187];
-h qubits[187];
-h qubits[187];
-ccx qubits[54],qubits[69],qubits[187];
-h qubits[187];
-h qubits[187];
-ccx qubits[53],qubits[70],qubits[187];
-h qubits[187];
-h qubits[187];
-ccx qubits[52],qubits[71],qubits[187];
-h qubits[187];
-h qubits[187];
-ccx qubits[51],qubits[72],qubits[187];
-h qubits[187];
-h qubits[187];
-ccx qubits[50],qubits[73],qubits[187];
-h qubits[187];
-h qubits[187];
-ccx qubits[49],qubits[74],qubits[187];
-h qubits[187];
-h qubits[187];
-ccx qubits[48],qubits[75],qubits[187];
-h qubits[187];
-h qubits[187];
-ccx qubits[47],qubits[76],qubits[187];
-h qubits[187];
-h qubits[187];
-ccx qubits[46],qubits[77],qubits[187];
-h qubits[187];
-h qubits[187];
-ccx qubits[45],qubits[78],qubits[187];
-h qubits[187];
-h qubits[187];
-ccx qubits[44],qubits[79],qubits[187];
-h qubits[187];
-h qubits[187];
-ccx qubits[43],qubits[80],qubits[187];
-h qubits[187];
-h qubits[187];
-ccx qubits[42],qubits[81],qubits[187];
-h qubits[187];
-h qubits[187];
-ccx qubits[41],qubits[82],qubits[187];
-h qubits[187];
-h qubits[187];
-ccx qubits[40],qubits[83],qubits[187];
-h qubits[187];
-h qubits[187];
-ccx qubits[39],qubits[84],qubits[187];
-h qubits[187];
-h qubits[187];
-ccx qubits[38],qubits[85],qubits[187];
-h qubits[187];
-h qubits[187];
-ccx qubits[37],qubits[86],qubits[187];
-h qubits[187];
-h qubits[187];
-ccx qubits[36],qubits[87],qubits[187];
-h qubits[187];
-h qubits[187];
-ccx qubits[35],qubits[88],qubits[187];
-h qubits[187];
-h qubits[187];
-ccx qubits[34],qubits[89],qubits[187];
-h qubits[187];
-h qubits[187];
-ccx qubits[33],qubits[90],qubits[187];
-h qubits[187];
-h qubits[187];
-ccx qubits[32],qubits[91],qubits[187];
-h qubits[187];
-h qubits[187];
-ccx qubits[31],qubits[92],qubits[187];
-h qubits[187];
-h qubits[187];
-ccx qubits[30],qubits[93],qubits[187];
-h qubits[187];
-h qubits[187];
-ccx qubits[29],qubits[94],qubits[187];
-h qubits[187];
-h qubits[187];
-ccx qubits[28],qubits[95],qubits[187];
-h qubits[187];
-h qubits[187];
-ccx qubits[27],qubits[96],qubits[187];
-h qubits[187];
-h qubits[187];
-ccx qubits[26],qubits[97],qubits[187];
-h qubits[187];
-h qubits[187];
-ccx qubits[25],qubits[98],qubits[187];
-h qubits[187];
-h qubits[187];
-ccx qubits[24],qubits[99],qubits[187];
-h qubits[187];
-h qubits[187];
-ccx qubits[23],qubits[100],qubits[187];
-h qubits[187];
-h qubits[187];
-ccx qubits[22],qubits[101],qubits[187];
-h qubits[187];
-h qubits[187];
-ccx qubits[21],qubits[102],qubits[187];
-h qubits[187];
-h qubits[187];
-ccx qubits[20],qubits[103],qubits[187];
-h qubits[187];
-h qubits[187];
-ccx qubits[19],qubits[104],qubits[187];
-h qubits[187];
-h qubits[187];
-ccx qubits[18],qubits[105],qubits[187];
-h qubits[187];
-h qubits[187];
-ccx qubits[17],qubits[106],qubits[187];
-h qubits[187];
-h qubits[187];
-ccx qubits[16],qubits[107],qubits[187];
-h qubits[187];
-h qubits[187];
-ccx qubits[15],qubits[108],qubits[187];
-h qubits[187];
-h qubits[187];
-ccx qubits[14],qubits[109],qubits[187];
-h qubits[187];
-h qubits[187];
-ccx qubits[13],qubits[110],qubits[187];
-h qubits[187];
-h qubits[187];
-ccx qubits[12],qubits[111],qubits[187];
-h qubits[187];
-h qubits[187];
-ccx qubits[11],qubits[112],qubits[187];
-h qubits[187];
-h qubits[187];
-ccx qubits[10],qubits[113],qubits[187];
-h qubits[187];
-h qubits[187];
-ccx qubits[9],qubits[114],qubits[187];
-h qubits[187];
-h qubits[187];
-ccx qubits[8],qubits[115],qubits[187];
-h qubits[187];
-h qubits[187];
-ccx qubits[7],qubits[116],qubits[187];
-h qubits[187];
-h qubits[187];
-ccx qubits[6],qubits[117],qubits[187];
-h qubits[187];
-h qubits[187];
-ccx qubits[5],qubits[118],qubits[187];
-h qubits[187];
-h qubits[187];
-ccx qubits[4],qubits[119],qubits[187];
-h qubits[187];
-h qubits[187];
-ccx qubits[3],qubits[120],qubits[187];
-h qubits[187];
-h qubits[187];
-ccx qubits[2],qubits[121],qubits[187];
-h qubits[187];
-h qubits[187];
-ccx qubits[1],qubits[122],qubits[187];
-h qubits[187];
-h qubits[187];
-ccx qubits[0],qubits[123],qubits[187];
-h qubits[187];
-h qubits[186];
-ccx qubits[58],qubits[64],qubits[186];
-h qubits[186];
-h qubits[186];
-ccx qubits[57],qubits[65],qubits[186];
-h qubits[186];
-h qubits[186];
-ccx qubits[56],qubits[66],qubits[186];
-h qubits[186];
-h qubits[186];
-ccx qubits[55],qubits[67],qubits[186];
-h qubits[186];
-h qubits[186];
-ccx qubits[54],qubits[68],qubits[186];
-h qubits[186];
-h qubits[186];
-ccx qubits[53],qubits[69],qubits[186];
-h qubits[186];
-h qubits[186];
-ccx qubits[52],qubits[70],qubits[186];
-h qubits[186];
-h qubits[186];
-ccx qubits[51],qubits[71],qubits[186];
-h qubits[186];
-h qubits[186];
-ccx qubits[50],qubits[72],qubits[186];
-h qubits[186];
-h qubits[186];
-ccx qubits[49],qubits[73],qubits[186];
-h qubits[186];
-h qubits[186];
-ccx qubits[48],qubits[74],qubits[186];
-h qubits[186];
-h qubits[186];
-ccx qubits[47],qubits[75],qubits[186];
-h qubits[186];
-h qubits[186];
-ccx qubits[46],qubits[76],qubits[186];
-h qubits[186];
-h qubits[186];
-ccx qubits[45],qubits[77],qubits[186];
-h qubits[186];
-h qubits[186];
-ccx qubits[44],qubits[78],qubits[186];
-h qubits[186];
-h qubits[186];
-ccx qubits[43],qubits[79],qubits[186];
-h qubits[186];
-h qubits[186];
-ccx qubits[42],qubits[80],qubits[186];
-h qubits[186];
-h qubits[186];
-ccx qubits[41],qubits[81],qubits[186];
-h qubits[186];
-h qubits[186];
-ccx qubits[40],qubits[82],qubits[186];
-h qubits[186];
-h qubits[186];
-ccx qubits[39],qubits[83],qubits[186];
-h qubits[186];
-h qubits[186];
-ccx qubits[38],qubits[84],qubits[186];
-h qubits[186];
-h qubits[186];
-ccx qubits[37],qubits[85],qubits[186];
-h qubits[186];
-h qubits[186];
-ccx qubits[36],qubits[86],qubits[186];
-h qubits[186];
-h qubits[186];
-ccx qubits[35],qubits[87],qubits[186];
-h qubits[186];
-h qubits[186];
-ccx qubits[34],qubits[88],qubits[186];
-h qubits[186];
-h qubits[186];
-ccx qubits[33],qubits[89],qubits[186];
-h qubits[186];
-h qubits[186];
-ccx qubits[32],qubits[90],qubits[186];
-h qubits[186];
-h qubits[186];
-ccx qubits[31],qubits[91],qubits[186];
-h qubits[186];
-h qubits[186];
-ccx qubits[30],qubits[92],qubits[186];
-h qubits[186];
-h qubits[186];
-ccx qubits[29],qubits[93],qubits[186];
-h qubits[186];
-h qubits[186];
-ccx qubits[28],qubits[94],qubits[186];
-h qubits[186];
-h qubits[186];
-ccx qubits[27],qubits[95],qubits[186];
-h qubits[186];
-h qubits[186];
-ccx qubits[26],qubits[96],qubits[186];
-h qubits[186];
-h qubits[186];
-ccx qubits[25],qubits[97],qubits[186];
-h qubits[186];
-h qubits[186];
-ccx qubits[24],qubits[98],qubits[186];
-h qubits[186];
-h qubits[186];
-ccx qubits[23],qubits[99],qubits[186];
-h qubits[186];
-h qubits[186];
-ccx qubits[22],qubits[100],qubits[186];
-h qubits[186];
-h qubits[186];
-ccx qubits[21],qubits[101],qubits[186];
-h qubits[186];
-h qubits[186];
-ccx qubits[20],qubits[102],qubits[186];
-h qubits[186];
-h qubits[186];
-ccx qubits[19],qubits[103],qubits[186];
-h qubits[186];
-h qubits[186];
-ccx qubits[18],qubits[104],qubits[186];
-h qubits[186];
-h qubits[186];
-ccx qubits[17],qubits[105],qubits[186];
-h qubits[186];
-h qubits[186];
-ccx qubits[16],qubits[106],qubits[186];
-h qubits[186];
-h qubits[186];
-ccx qubits[15],qubits[107],qubits[186];
-h qubits[186];
-h qubits[186];
-ccx qubits[14],qubits[108],qubits[186];
-h qubits[186];
-h qubits[186];
-ccx qubits[13],qubits[109],qubits[186];
-h qubits[186];
-h qubits[186];
-ccx qubits[12],qubits[110],qubits[186];
-h qubits[186];
-h qubits[186];
-ccx qubits[11],qubits[111],qubits[186];
-h qubits[186];
-h qubits[186];
-ccx qubits[10],qubits[112],qubits[186];
-h qubits[186];
-h qubits[186];
-ccx qubits[9],qubits[113],qubits[186];
-h qubits[186];
-h qubits[186];
-ccx qubits[8],qubits[114],qubits[186];
-h qubits[186];
-h qubits[186];
-ccx qubits[7],qubits[115],qubits[186];
-h qubits[186];
-h qubits[186];
-ccx qubits[6],qubits[116],qubits[186];
-h qubits[186];
-h qubits[186];
-ccx qubits[5],qubits[117],qubits[186];
-h qubits[186];
-h qubits[186];
-ccx qubits[4],qubits[118],qubits[186];
-h qubits[186];
-h qubits[186];
-ccx qubits[3],qubits[119],qubits[186];
-h qubits[186];
-h qubits[186];
-ccx qubits[2],qubits[120],qubits[186];
-h qubits[186];
-h qubits[186];
-ccx qubits[1],qubits[121],qubits[186];
-h qubits[186];
-h qubits[186];
-ccx qubits[0],qubits[122],qubits[186];
-h qubits[186];
-h qubits[185];
-ccx qubits[57],qubits[64],qubits[185];
-h qubits[185];
-h qubits[185];
-ccx qubits[56],qubits[65],qubits[185];
-h qubits[185];
-h qubits[185];
-ccx qubits[55],qubits[66],qubits[185];
-h qubits[185];
-h qubits[185];
-ccx qubits[54],qubits[67],qubits[185];
-h qubits[185];
-h qubits[185];
-ccx qubits[53],qubits[68],qubits[185];
-h qubits[185];
-h qubits[185];
-ccx qubits[52],qubits[69],qubits[185];
-h qubits[185];
-h qubits[185];
-ccx qubits[51],qubits[70],qubits[185];
-h qubits[185];
-h qubits[185];
-ccx qubits[50],qubits[71],qubits[185];
-h qubits[185];
-h qubits[185];
-ccx qubits[49],qubits[72],qubits[185];
-h qubits[185];
-h qubits[185];
-ccx qubits[48],qubits[73],qubits[185];
-h qubits[185];
-h qubits[185];
-ccx qubits[47],qubits[74],qubits[185];
-h qubits[185];
-h qubits[185];
-ccx qubits[46],qubits[75],qubits[185];
-h qubits[185];
-h qubits[185];
-ccx qubits[45],qubits[76],qubits[185];
-h qubits[185];
-h qubits[185];
-ccx qubits[44],qubits[77],qubits[185];
-h qubits[185];
-h qubits[185];
-ccx qubits[43],qubits[78],qubits[185];
-h qubits[185];
-h qubits[185];
-ccx qubits[42],qubits[79],qubits[185];
-h qubits[185];
-h qubits[185];
-ccx qubits[41],qubits[80],qubits[185];
-h qubits[185];
-h qubits[185];
-ccx qubits[40],qubits[81],qubits[185];
-h qubits[185];
-h qubits[185];
-ccx qubits[39],qubits[82],qubits[185];
-h qubits[185];
-h qubits[185];
-ccx qubits[38],qubits[83],qubits[185];
-h qubits[185];
-h qubits[185];
-ccx qubits[37],qubits[84],qubits[185];
-h qubits[185];
-h qubits[185];
-ccx qubits[36],qubits[85],qubits[185];
-h qubits[185];
-h qubits[185];
-ccx qubits[35],qubits[86],qubits[185];
-h qubits[185];
-h qubits[185];
-ccx qubits[34],qubits[87],qubits[185];
-h qubits[185];
-h qubits[185];
-ccx qubits[33],qubits[88],qubits[185];
-h qubits[185];
-h qubits[185];
-ccx qubits[32],qubits[89],qubits[185];
-h qubits[185];
-h qubits[185];
-ccx qubits[31],qubits[90],qubits[185];
-h qubits[185];
-h qubits[185];
-ccx qubits[30],qubits[91],qubits[185];
-h qubits[185];
-h qubits[185];
-ccx qubits[29],qubits[92],qubits[185];
-h qubits[185];
-h qubits[185];
-ccx qubits[28],qubits[93],qubits[185];
-h qubits[185];
-h qubits[185];
-ccx qubits[27],qubits[94],qubits[185];
-h qubits[185];
-h qubits[185];
-ccx qubits[26],qubits[95],qubits[185];
-h qubits[185];
-h qubits[185];
-ccx qubits[25],qubits[96],qubits[185];
-h qubits[185];
-h qubits[185];
-ccx qubits[24],qubits[97],qubits[185];
-h qubits[185];
-h qubits[185];
-ccx qubits[23],qubits[98],qubits[185];
-h qubits[185];
-h qubits[185];
-ccx qubits[22],qubits[99],qubits[185];
-h qubits[185];
-h qubits[185];
-ccx qubits[21],qubits[100],qubits[185];
-h qubits[185];
-h qubits[185];
-ccx qubits[20],qubits[101],qubits[185];
-h qubits[185];
-h qubits[185];
-ccx qubits[19],qubits[102],qubits[185];
-h qubits[185];
-h qubits[185];
-ccx qubits[18],qubits[103],qubits[185];
-h qubits[185];
-h qubits[185];
-ccx qubits[17],qubits[104],qubits[185];
-h qubits[185];
-h qubits[185];
-ccx qubits[16],qubits[105],qubits[185];
-h qubits[185];
-h qubits[185];
-ccx qubits[15],qubits[106],qubits[185];
-h qubits[185];
-h qubits[185];
-ccx qubits[14],qubits[107],qubits[185];
-h qubits[185];
-h qubits[185];
-ccx qubits[13],qubits[108],qubits[185];
-h qubits[185];
-h qubits[185];
-ccx qubits[12],qubits[109],qubits[185];
-h qubits[185];
-h qubits[185];
-ccx qubits[11],qubits[110],qubits[185];
-h qubits[185];
-h qubits[185];
-ccx qubits[10],qubits[111],qubits[185];
-h qubits[185];
-h qubits[185];
-ccx qubits[9],qubits[112],qubits[185];
-h qubits[185];
-h qubits[185];
-ccx qubits[8],qubits[113],qubits[185];
-h qubits[185];
-h qubits[185];
-ccx qubits[7],qubits[114],qubits[185];
-h qubits[185];
-h qubits[185];
-ccx qubits[6],qubits[115],qubits[185];
-h qubits[185];
-h qubits[185];
-ccx qubits[5],qubits[116],qubits[185];
-h qubits[185];
-h qubits[185];
-ccx qubits[4],qubits[117],qubits[185];
-h qubits[185];
-h qubits[185];
-ccx qubits[3],qubits[118],qubits[185];
-h qubits[185];
-h qubits[185];
-ccx qubits[2],qubits[119],qubits[185];
-h qubits[185];
-h qubits[185];
-ccx qubits[1],qubits[120],qubits[185];
-h qubits[185];
-h qubits[185];
-ccx qubits[0],qubits[121],qubits[185];
-h qubits[185];
-h qubits[184];
-ccx qubits[56],qubits[64],qubits[184];
-h qubits[184];
-h qubits[184];
-ccx qubits[55],qubits[65],qubits[184];
-h qubits[184];
-h qubits[184];
-ccx qubits[54],qubits[66],qubits[184];
-h qubits[184];
-h qubits[184];
-ccx qubits[53],qubits[67],qubits[184];
-h qubits[184];
-h qubits[184];
-ccx qubits[52],qubits[68],qubits[184];
-h qubits[184];
-h qubits[184];
-ccx qubits[51],qubits[69],qubits[184];
-h qubits[184];
-h qubits[184];
-ccx qubits[50],qubits[70],qubits[184];
-h qubits[184];
-h qubits[184];
-ccx qubits[49],qubits[71],qubits[184];
-h qubits[184];
-h qubits[184];
-ccx qubits[48],qubits[72],qubits[184];
-h qubits[184];
-h qubits[184];
-ccx qubits[47],qubits[73],qubits[184];
-h qubits[184];
-h qubits[184];
-ccx qubits[46],qubits[74],qubits[184];
-h qubits[184];
-h qubits[184];
-ccx qubits[45],qubits[75],qubits[184];
-h qubits[184];
-h qubits[184];
-ccx qubits[44],qubits[76],qubits[184];
-h qubits[184];
-h qubits[184];
-ccx qubits[43],qubits[77],qubits[184];
-h qubits[184];
-h qubits[184];
-ccx qubits[42],qubits[78],qubits[184];
-h qubits[184];
-h qubits[184];
-ccx qubits[41],qubits[79],qubits[184];
-h qubits[184];
-h qubits[184];
-ccx qubits[40],qubits[80],qubits[184];
-h qubits[184];
-h qubits[184];
-ccx qubits[39],qubits[81],qubits[184];
-h qubits[184];
-h qubits[184];
-ccx qubits[38],qubits[82],qubits[184];
-h qubits[184];
-h qubits[184];
-ccx qubits[37],qubits[83],qubits[184];
-h qubits[184];
-h qubits[184];
-ccx qubits[36],qubits[84],qubits[184];
-h qubits[184];
-h qubits[184];
-ccx qubits[35],qubits[85],qubits[184];
-h qubits[184];
-h qubits[184];
-ccx qubits[34],qubits[86],qubits[184];
-h qubits[184];
-h qubits[184];
-ccx qubits[33],qubits[87],qubits[184];
-h qubits[184];
-h qubits[184];
-ccx qubits[32],qubits[88],qubits[184];
-h qubits[184];
-h qubits[184];
-ccx qubits[31],qubits[89],qubits[184];
-h qubits[184];
-h qubits[184];
-ccx qubits[30],qubits[90],qubits[184];
-h qubits[184];
-h qubits[184];
-ccx qubits[29],qubits[91],qubits[184];
-h qubits[184];
-h qubits[184];
-ccx qubits[28],qubits[92],qubits[184];
-h qubits[184];
-h qubits[184];
-ccx qubits[27],qubits[93],qubits[184];
-h qubits[184];
-h qubits[184];
-ccx qubits[26],qubits[94],qubits[184];
-h qubits[184];
-h qubits[184];
-ccx qubits[25],qubits[95],qubits[184];
-h qubits[184];
-h qubits[184];
-ccx qubits[24],qubits[96],qubits[184];
-h qubits[184];
-h qubits[184];
-ccx qubits[23],qubits[97],qubits[184];
-h qubits[184];
-h qubits[184];
-ccx qubits[22],qubits[98],qubits[184];
-h qubits[184];
-h qubits[184];
-ccx qubits[21],qubits[99],qubits[184];
-h qubits[184];
-h qubits[184];
-ccx qubits[20],qubits[100],qubits[184];
-h qubits[184];
-h qubits[184];
-ccx qubits[19],qubits[101],qubits[184];
-h qubits[184];
-h qubits[184];
-ccx qubits[18],qubits[102],qubits[184];
-h qubits[184];
-h qubits[184];
-ccx qubits[17],qubits[103],qubits[184];
-h qubits[184];
-h qubits[184];
-ccx qubits[16],qubits[104],qubits[184];
-h qubits[184];
-h qubits[184];
-ccx qubits[15],qubits[105],qubits[184];
-h qubits[184];
-h qubits[184];
-ccx qubits[14],qubits[106],qubits[184];
-h qubits[184];
-h qubits[184];
-ccx qubits[13],qubits[107],qubits[184];
-h qubits[184];
-h qubits[184];
-ccx qubits[12],qubits[108],qubits[184];
-h qubits[184];
-h qubits[184];
-ccx qubits[11],qubits[109],qubits[184];
-h qubits[184];
-h qubits[184];
-ccx qubits[10],qubits[110],qubits[184];
-h qubits[184];
-h qubits[184];
-ccx qubits[9],qubits[111],qubits[184];
-h qubits[184];
-h qubits[184];
-ccx qubits[8],qubits[112],qubits[184];
-h qubits[184];
-h qubits[184];
-ccx qubits[7],qubits[113],qubits[184];
-h qubits[184];
-h qubits[184];
-ccx qubits[6],qubits[114],qubits[184];
-h qubits[184];
-h qubits[184];
-ccx qubits[5],qubits[115],qubits[184];
-h qubits[184];
-h qubits[184];
-ccx qubits[4],qubits[116],qubits[184];
-h qubits[184];
-h qubits[184];
-ccx qubits[3],qubits[117],qubits[184];
-h qubits[184];
-h qubits[184];
-ccx qubits[2],qubits[118],qubits[184];
-h qubits[184];
-h qubits[184];
-ccx qubits[1],qubits[119],qubits[184];
-h qubits[184];
-h qubits[184];
-ccx qubits[0],qubits[120],qubits[184];
-h qubits[184];
-h qubits[183];
-ccx qubits[55],qubits[64],qubits[183];
-h qubits[183];
-h qubits[183];
-ccx qubits[54],qubits[65],qubits[183];
-h qubits[183];
-h qubits[183];
-ccx qubits[53],qubits[66],qubits[183];
-h qubits[183];
-h qubits[183];
-ccx qubits[52],qubits[67],qubits[183];
-h qubits[183];
-h qubits[183];
-ccx qubits[51],qubits[68],qubits[183];
-h qubits[183];
-h qubits[183];
-ccx qubits[50],qubits[69],qubits[183];
-h qubits[183];
-h qubits[183];
-ccx qubits[49],qubits[70],qubits[183];
-h qubits[183];
-h qubits[183];
-ccx qubits[48],qubits[71],qubits[183];
-h qubits[183];
-h qubits[183];
-ccx qubits[47],qubits[72],qubits[183];
-h qubits[183];
-h qubits[183];
-ccx qubits[46],qubits[73],qubits[183];
-h qubits[183];
-h qubits[183];
-ccx qubits[45],qubits[74],qubits[183];
-h qubits[183];
-h qubits[183];
-ccx qubits[44],qubits[75],qubits[183];
-h qubits[183];
-h qubits[183];
-ccx qubits[43],qubits[76],qubits[183];
-h qubits[183];
-h qubits[183];
-ccx qubits[42],qubits[77],qubits[183];
-h qubits[183];
-h qubits[183];
-ccx qubits[41],qubits[78],qubits[183];
-h qubits[183];
-h qubits[183];
-ccx qubits[40],qubits[79],qubits[183];
-h qubits[183];
-h qubits[183];
-ccx qubits[39],qubits[80],qubits[183];
-h qubits[183];
-h qubits[183];
-ccx qubits[38],qubits[81],qubits[183];
-h qubits[183];
-h qubits[183];
-ccx qubits[37],qubits[82],qubits[183];
-h qubits[183];
-h qubits[183];
-ccx qubits[36],qubits[83],qubits[183];
-h qubits[183];
-h qubits[183];
-ccx qubits[35],qubits[84],qubits[183];
-h qubits[183];
-h qubits[183];
-ccx qubits[34],qubits[85],qubits[183];
-h qubits[183];
-h qubits[183];
-ccx qubits[33],qubits[86],qubits[183];
-h qubits[183];
-h qubits[183];
-ccx qubits[32],qubits[87],qubits[183];
-h qubits[183];
-h qubits[183];
-ccx qubits[31],qubits[88],qubits[183];
-h qubits[183];
-h qubits[183];
-ccx qubits[30],qubits[89],qubits[183];
-h qubits[183];
-h qubits[183];
-ccx qubits[29],qubits[90],qubits[183];
-h qubits[183];
-h qubits[183];
-ccx qubits[28],qubits[91],qubits[183];
-h qubits[183];
-h qubits[183];
-ccx qubits[27],qubits[92],qubits[183];
-h qubits[183];
-h qubits[183];
-ccx qubits[26],qubits[93],qubits[183];
-h qubits[183];
-h qubits[183];
-ccx qubits[25],qubits[94],qubits[183];
-h qubits[183];
-h qubits[183];
-ccx qubits[24],qubits[95],qubits[183];
-h qubits[183];
-h qubits[183];
-ccx qubits[23],qubits[96],qubits[183];
-h qubits[183];
-h qubits[183];
-ccx qubits[22],qubits[97],qubits[183];
-h qubits[183];
-h qubits[183];
-ccx qubits[21],qubits[98],qubits[183];
-h qubits[183];
-h qubits[183];
-ccx qubits[20],qubits[99],qubits[183];
-h qubits[183];
-h qubits[183];
-ccx qubits[19],qubits[100],qubits[183];
-h qubits[183];
-h qubits[183];
-ccx qubits[18],qubits[101],qubits[183];
-h qubits[183];
-h qubits[183];
-ccx qubits[17],qubits[102],qubits[183];
-h qubits[183];
-h qubits[183];
-ccx qubits[16],qubits[103],qubits[183];
-h qubits[183];
-h qubits[183];
-ccx qubits[15],qubits[104],qubits[183];
-h qubits[183];
-h qubits[183];
-ccx qubits[14],qubits[105],qubits[183];
-h qubits[183];
-h qubits[183];
-ccx qubits[13],qubits[106],qubits[183];
-h qubits[183];
-h qubits[183];
-ccx qubits[12],qubits[107],qubits[183];
-h qubits[183];
-h qubits[183];
-ccx qubits[11],qubits[108],qubits[183];
-h qubits[183];
-h qubits[183];
-ccx qubits[10],qubits[109],qubits[183];
-h qubits[183];
-h qubits[183];
-ccx qubits[9],qubits[110],qubits[183];
-h qubits[183];
-h qubits[183];
-ccx qubits[8],qubits[111],qubits[183];
-h qubits[183];
-h qubits[183];
-ccx qubits[7],qubits[112],qubits[183];
-h qubits[183];
-h qubits[183];
-ccx qubits[6],qubits[113],qubits[183];
-h qubits[183];
-h qubits[183];
-ccx qubits[5],qubits[114],qubits[183];
-h qubits[183];
-h qubits[183];
-ccx qubits[4],qubits[115],qubits[183];
-h qubits[183];
-h qubits[183];
-ccx qubits[3],qubits[116],qubits[183];
-h qubits[183];
-h qubits[183];
-ccx qubits[2],qubits[117],qubits[183];
-h qubits[183];
-h qubits[183];
-ccx qubits[1],qubits[118],qubits[183];
-h qubits[183];
-h qubits[183];
-ccx qubits[0],qubits[119],qubits[183];
-h qubits[183];
-h qubits[182];
-ccx qubits[54],qubits[64],qubits[182];
-h qubits[182];
-h qubits[182];
-ccx qubits[53],qubits[65],qubits[182];
-h qubits[182];
-h qubits[182];
-ccx qubits[52],qubits[66],qubits[182];
-h qubits[182];
-h qubits[182];
-ccx qubits[51],qubits[67],qubits[182];
-h qubits[182];
-h qubits[182];
-ccx qubits[50],qubits[68],qubits[182];
-h qubits[182];
-h qubits[182];
-ccx qubits[49],qubits[69],qubits[182];
-h qubits[182];
-h qubits[182];
-ccx qubits[48],qubits[70],qubits[182];
-h qubits[182];
-h qubits[182];
-ccx qubits[47],qubits[71],qubits[182];
-h qubits[182];
-h qubits[182];
-ccx qubits[46],qubits[72],qubits[182];
-h qubits[182];
-h qubits[182];
-ccx qubits[45],qubits[73],qubits[182];
-h qubits[182];
-h qubits[182];
-ccx qubits[44],qubits[74],qubits[182];
-h qubits[182];
-h qubits[182];
-ccx qubits[43],qubits[75],qubits[182];
-h qubits[182];
-h qubits[182];
-ccx qubits[42],qubits[76],qubits[182];
-h qubits[182];
-h qubits[182];
-ccx qubits[41],qubits[77],qubits[182];
-h qubits[182];
-h qubits[182];
-ccx qubits[40],qubits[78],qubits[182];
-h qubits[182];
-h qubits[182];
-ccx qubits[39],qubits[79],qubits[182];
-h qubits[182];
-h qubits[182];
-ccx qubits[38],qubits[80],qubits[182];
-h qubits[182];
-h qubits[182];
-ccx qubits[37],qubits[81],qubits[182];
-h qubits[182];
-h qubits[182];
-ccx qubits[36],qubits[82],qubits[182];
-h qubits[182];
-h qubits[182];
-ccx qubits[35],qubits[83],qubits[182];
-h qubits[182];
-h qubits[182];
-ccx qubits[34],qubits[84],qubits[182];
-h qubits[182];
-h qubits[182];
-ccx qubits[33],qubits[85],qubits[182];
-h qubits[182];
-h qubits[182];
-ccx qubits[32],qubits[86],qubits[182];
-h qubits[182];
-h qubits[182];
-ccx qubits[31],qubits[87],qubits[182];
-h qubits[182];
-h qubits[182];
-ccx qubits[30],qubits[88],qubits[182];
-h qubits[182];
-h qubits[182];
-ccx qubits[29],qubits[89],qubits[182];
-h qubits[182];
-h qubits[182];
-ccx qubits[28],qubits[90],qubits[182];
-h qubits[182];
-h qubits[182];
-ccx qubits[27],qubits[91],qubits[182];
-h qubits[182];
-h qubits[182];
-ccx qubits[26],qubits[92],qubits[182];
-h qubits[182];
-h qubits[182];
-ccx qubits[25],qubits[93],qubits[182];
-h qubits[182];
-h qubits[182];
-ccx qubits[24],qubits[94],qubits[182];
-h qubits[182];
-h qubits[182];
-ccx qubits[23],qubits[95],qubits[182];
-h qubits[182];
-h qubits[182];
-ccx qubits[22],qubits[96],qubits[182];
-h qubits[182];
-h qubits[182];
-ccx qubits[21],qubits[97],qubits[182];
-h qubits[182];
-h qubits[182];
-ccx qubits[20],qubits[98],qubits[182];
-h qubits[182];
-h qubits[182];
-ccx qubits[19],qubits[99],qubits[182];
-h qubits[182];
-h qubits[182];
-ccx qubits[18],qubits[100],qubits[182];
-h qubits[182];
-h qubits[182];
-ccx qubits[17],qubits[101],qubits[182];
-h qubits[182];
-h qubits[182];
-ccx qubits[16],qubits[102],qubits[182];
-h qubits[182];
-h qubits[182];
-ccx qubits[15],qubits[103],qubits[182];
-h qubits[182];
-h qubits[182];
-ccx qubits[14],qubits[104],qubits[182];
-h qubits[182];
-h qubits[182];
-ccx qubits[13],qubits[105],qubits[182];
-h qubits[182];
-h qubits[182];
-ccx qubits[12],qubits[106],qubits[182];
-h qubits[182];
-h qubits[182];
-ccx qubits[11],qubits[107],qubits[182];
-h qubits[182];
-h qubits[182];
-ccx qubits[10],qubits[108],qubits[182];
-h qubits[182];
-h qubits[182];
-ccx qubits[9],qubits[109],qubits[182];
-h qubits[182];
-h qubits[182];
-ccx qubits[8],qubits[110],qubits[182];
-h qubits[182];
-h qubits[182];
-ccx qubits[7],qubits[111],qubits[182];
-h qubits[182];
-h qubits[182];
-ccx qubits[6],qubits[112],qubits[182];
-h qubits[182];
-h qubits[182];
-ccx qubits[5],qubits[113],qubits[182];
-h qubits[182];
-h qubits[182];
-ccx qubits[4],qubits[114],qubits[182];
-h qubits[182];
-h qubits[182];
-ccx qubits[3],qubits[115],qubits[182];
-h qubits[182];
-h qubits[182];
-ccx qubits[2],qubits[116],qubits[182];
-h qubits[182];
-h qubits[182];
-ccx qubits[1],qubits[117],qubits[182];
-h qubits[182];
-h qubits[182];
-ccx qubits[0],qubits[118],qubits[182];
-h qubits[182];
-h qubits[181];
-ccx qubits[53],qubits[64],qubits[181];
-h qubits[181];
-h qubits[181];
-ccx qubits[52],qubits[65],qubits[181];
-h qubits[181];
-h qubits[181];
-ccx qubits[51],qubits[66],qubits[181];
-h qubits[181];
-h qubits[181];
-ccx qubits[50],qubits[67],qubits[181];
-h qubits[181];
-h qubits[181];
-ccx qubits[49],qubits[68],qubits[181];
-h qubits[181];
-h qubits[181];
-ccx qubits[48],qubits[69],qubits[181];
-h qubits[181];
-h qubits[181];
-ccx qubits[47],qubits[70],qubits[181];
-h qubits[181];
-h qubits[181];
-ccx qubits[46],qubits[71],qubits[181];
-h qubits[181];
-h qubits[181];
-ccx qubits[45],qubits[72],qubits[181];
-h qubits[181];
-h qubits[181];
-ccx qubits[44],qubits[73],qubits[181];
-h qubits[181];
-h qubits[181];
-ccx qubits[43],qubits[74],qubits[181];
-h qubits[181];
-h qubits[181];
-ccx qubits[42],qubits[75],qubits[181];
-h qubits[181];
-h qubits[181];
-ccx qubits[41],qubits[76],qubits[181];
-h qubits[181];
-h qubits[181];
-ccx qubits[40],qubits[77],qubits[181];
-h qubits[181];
-h qubits[181];
-ccx qubits[39],qubits[78],qubits[181];
-h qubits[181];
-h qubits[181];
-ccx qubits[38],qubits[79],qubits[181];
-h qubits[181];
-h qubits[181];
-ccx qubits[37],qubits[80],qubits[181];
-h qubits[181];
-h qubits[181];
-ccx qubits[36],qubits[81],qubits[181];
-h qubits[181];
-h qubits[181];
-ccx qubits[35],qubits[82],qubits[181];
-h qubits[181];
-h qubits[181];
-ccx qubits[34],qubits[83],qubits[181];
-h qubits[181];
-h qubits[181];
-ccx qubits[33],qubits[84],qubits[181];
-h qubits[181];
-h qubits[181];
-ccx qubits[32],qubits[85],qubits[181];
-h qubits[181];
-h qubits[181];
-ccx qubits[31],qubits[86],qubits[181];
-h qubits[181];
-h qubits[181];
-ccx qubits[30],qubits[87],qubits[181];
-h qubits[181];
-h qubits[181];
-ccx qubits[29],qubits[88],qubits[181];
-h qubits[181];
-h qubits[181];
-ccx qubits[28],qubits[89],qubits[181];
-h qubits[181];
-h qubits[181];
-ccx qubits[27],qubits[90],qubits[181];
-h qubits[181];
-h qubits[181];
-ccx qubits[26],qubits[91],qubits[181];
-h qubits[181];
-h qubits[181];
-ccx qubits[25],qubits[92],qubits[181];
-h qubits[181];
-h qubits[181];
-ccx qubits[24],qubits[93],qubits[181];
-h qubits[181];
-h qubits[181];
-ccx qubits[23],qubits[94],qubits[181];
-h qubits[181];
-h qubits[181];
-ccx qubits[22],qubits[95],qubits[181];
-h qubits[181];
-h qubits[181];
-ccx qubits[21],qubits[96],qubits[181];
-h qubits[181];
-h qubits[181];
-ccx qubits[20],qubits[97],qubits[181];
-h qubits[181];
-h qubits[181];
-ccx qubits[19],qubits[98],qubits[181];
-h qubits[181];
-h qubits[181];
-ccx qubits[18],qubits[99],qubits[181];
-h qubits[181];
-h qubits[181];
-ccx qubits[17],qubits[100],qubits[181];
-h qubits[181];
-h qubits[181];
-ccx qubits[16],qubits[101],qubits[181];
-h qubits[181];
-h qubits[181];
-ccx qubits[15],qubits[102],qubits[181];
-h qubits[181];
-h qubits[181];
-ccx qubits[14],qubits[103],qubits[181];
-h qubits[181];
-h qubits[181];
-ccx qubits[13],qubits[104],qubits[181];
-h qubits[181];
-h qubits[181];
-ccx qubits[12],qubits[105],qubits[181];
-h qubits[181];
-h qubits[181];
-ccx qubits[11],qubits[106],qubits[181];
-h qubits[181];
-h qubits[181];
-ccx qubits[10],qubits[107],qubits[181];
-h qubits[181];
-h qubits[181];
-ccx qubits[9],qubits[108],qubits[181];
-h qubits[181];
-h qubits[181];
-ccx qubits[8],qubits[109],qubits[181];
-h qubits[181];
-h qubits[181];
-ccx qubits[7],qubits[110],qubits[181];
-h qubits[181];
-h qubits[181];
-ccx qubits[6],qubits[111],qubits[181];
-h qubits[181];
-h qubits[181];
-ccx qubits[5],qubits[112],qubits[181];
-h qubits[181];
-h qubits[181];
-ccx qubits[4],qubits[113],qubits[181];
-h qubits[181];
-h qubits[181];
-ccx qubits[3],qubits[114],qubits[181];
-h qubits[181];
-h qubits[181];
-ccx qubits[2],qubits[115],qubits[181];
-h qubits[181];
-h qubits[181];
-ccx qubits[1],qubits[116],qubits[181];
-h qubits[181];
-h qubits[181];
-ccx qubits[0],qubits[117],qubits[181];
-h qubits[181];
-h qubits[180];
-ccx qubits[52],qubits[64],qubits[180];
-h qubits[180];
-h qubits[180];
-ccx qubits[51],qubits[65],qubits[180];
-h qubits[180];
-h qubits[180];
-ccx qubits[50],qubits[66],qubits[180];
-h qubits[180];
-h qubits[180];
-ccx qubits[49],qubits[67],qubits[180];
-h qubits[180];
-h qubits[180];
-ccx qubits[48],qubits[68],qubits[180];
-h qubits[180];
-h qubits[180];
-ccx qubits[47],qubits[69],qubits[180];
-h qubits[180];
-h qubits[180];
-ccx qubits[46],qubits[70],qubits[180];
-h qubits[180];
-h qubits[180];
-ccx qubits[45],qubits[71],qubits[180];
-h qubits[180];
-h qubits[180];
-ccx qubits[44],qubits[72],qubits[180];
-h qubits[180];
-h qubits[180];
-ccx qubits[43],qubits[73],qubits[180];
-h qubits[180];
-h qubits[180];
-ccx qubits[42],qubits[74],qubits[180];
-h qubits[180];
-h qubits[180];
-ccx qubits[41],qubits[75],qubits[180];
-h qubits[180];
-h qubits[180];
-ccx qubits[40],qubits[76],qubits[180];
-h qubits[180];
-h qubits[180];
-ccx qubits[39],qubits[77],qubits[180];
-h qubits[180];
-h qubits[180];
-ccx qubits[38],qubits[78],qubits[180];
-h qubits[180];
-h qubits[180];
-ccx qubits[37],qubits[79],qubits[180];
-h qubits[180];
-h qubits[180];
-ccx qubits[36],qubits[80],qubits[180];
-h qubits[180];
-h qubits[180];
-ccx qubits[35],qubits[81],qubits[180];
-h qubits[180];
-h qubits[180];
-ccx qubits[34],qubits[82],qubits[180];
-h qubits[180];
-h qubits[180];
-ccx qubits[33],qubits[83],qubits[180];
-h qubits[180];
-h qubits[180];
-ccx qubits[32],qubits[84],qubits[180];
-h qubits[180];
-h qubits[180];
-ccx qubits[31],qubits[85],qubits[180];
-h qubits[180];
-h qubits[180];
-ccx qubits[30],qubits[86],qubits[180];
-h qubits[180];
-h qubits[180];
-ccx qubits[29],qubits[87],qubits[180];
-h qubits[180];
-h qubits[180];
-ccx qubits[28],qubits[88],qubits[180];
-h qubits[180];
-h qubits[180];
-ccx qubits[27],qubits[89],qubits[180];
-h qubits[180];
-h qubits[180];
-ccx qubits[26],qubits[90],qubits[180];
-h qubits[180];
-h qubits[180];
-ccx qubits[25],qubits[91],qubits[180];
-h qubits[180];
-h qubits[180];
-ccx qubits[24],qubits[92],qubits[180];
-h qubits[180];
-h qubits[180];
-ccx qubits[23],qubits[93],qubits[180];
-h qubits[180];
-h qubits[180];
-ccx qubits[22],qubits[94],qubits[180];
-h qubits[180];
-h qubits[180];
-ccx qubits[21],qubits[95],qubits[180];
-h qubits[180];
-h qubits[180];
-ccx qubits[20],qubits[96],qubits[180];
-h qubits[180];
-h qubits[180];
-ccx qubits[19],qubits[97],qubits[180];
-h qubits[180];
-h qubits[180];
-ccx qubits[18],qubits[98],qubits[180];
-h qubits[180];
-h qubits[180];
-ccx qubits[17],qubits[99],qubits[180];
-h qubits[180];
-h qubits[180];
-ccx qubits[16],qubits[100],qubits[180];
-h qubits[180];
-h qubits[180];
-ccx qubits[15],qubits[101],qubits[180];
-h qubits[180];
-h qubits[180];
-ccx qubits[14],qubits[102],qubits[180];
-h qubits[180];
-h qubits[180];
-ccx qubits[13],qubits[103],qubits[180];
-h qubits[180];
-h qubits[180];
-ccx qubits[12],qubits[104],qubits[180];
-h qubits[180];
-h qubits[180];
-ccx qubits[11],qubits[105],qubits[180];
-h qubits[180];
-h qubits[180];
-ccx qubits[10],qubits[106],qubits[180];
-h qubits[180];
-h qubits[180];
-ccx qubits[9],qubits[107],qubits[180];
-h qubits[180];
-h qubits[180];
-ccx qubits[8],qubits[108],qubits[180];
-h qubits[180];
-h qubits[180];
-ccx qubits[7],qubits[109],qubits[180];
-h qubits[180];
-h qubits[180];
-ccx qubits[6],qubits[110],qubits[180];
-h qubits[180];
-h qubits[180];
-ccx qubits[5],qubits[111],qubits[180];
-h qubits[180];
-h qubits[180];
-ccx qubits[4],qubits[112],qubits[180];
-h qubits[180];
-h qubits[180];
-ccx qubits[3],qubits[113],qubits[180];
-h qubits[180];
-h qubits[180];
-ccx qubits[2],qubits[114],qubits[180];
-h qubits[180];
-h qubits[180];
-ccx qubits[1],qubits[115],qubits[180];
-h qubits[180];
-h qubits[180];
-ccx qubits[0],qubits[116],qubits[180];
-h qubits[180];
-h qubits[179];
-ccx qubits[51],qubits[64],qubits[179];
-h qubits[179];
-h qubits[179];
-ccx qubits[50],qubits[65],qubits[179];
-h qubits[179];
-h qubits[179];
-ccx qubits[49],qubits[66],qubits[179];
-h qubits[179];
-h qubits[179];
-ccx qubits[48],qubits[67],qubits[179];
-h qubits[179];
-h qubits[179];
-ccx qubits[47],qubits[68],qubits[179];
-h qubits[179];
-h qubits[179];
-ccx qubits[46],qubits[69],qubits[179];
-h qubits[179];
-h qubits[179];
-ccx qubits[45],qubits[70],qubits[179];
-h qubits[179];
-h qubits[179];
-ccx qubits[44],qubits[71],qubits[179];
-h qubits[179];
-h qubits[179];
-ccx qubits[43],qubits[72],qubits[179];
-h qubits[179];
-h qubits[179];
-ccx qubits[42],qubits[73],qubits[179];
-h qubits[179];
-h qubits[179];
-ccx qubits[41],qubits[74],qubits[179];
-h qubits[179];
-h qubits[179];
-ccx qubits[40],qubits[75],qubits[179];
-h qubits[179];
-h qubits[179];
-ccx qubits[39],qubits[76],qubits[179];
-h qubits[179];
-h qubits[179];
-ccx qubits[38],qubits[77],qubits[179];
-h qubits[179];
-h qubits[179];
-ccx qubits[37],qubits[78],qubits[179];
-h qubits[179];
-h qubits[179];
-ccx qubits[36],qubits[79],qubits[179];
-h qubits[179];
-h qubits[179];
-ccx qubits[35],qubits[80],qubits[179];
-h qubits[179];
-h qubits[179];
-ccx qubits[34],qubits[81],qubits[179];
-h qubits[179];
-h qubits[179];
-ccx qubits[33],qubits[82],qubits[179];
-h qubits[179];
-h qubits[179];
-ccx qubits[32],qubits[83],qubits[179];
-h qubits[179];
-h qubits[179];
-ccx qubits[31],qubits[84],qubits[179];
-h qubits[179];
-h qubits[179];
-ccx qubits[30],qubits[85],qubits[179];
-h qubits[179];
-h qubits[179];
-ccx qubits[29],qubits[86],qubits[179];
-h qubits[179];
-h qubits[179];
-ccx qubits[28],qubits[87],qubits[179];
-h qubits[179];
-h qubits[179];
-ccx qubits[27],qubits[88],qubits[179];
-h qubits[179];
-h qubits[179];
-ccx qubits[26],qubits[89],qubits[179];
-h qubits[179];
-h qubits[179];
-ccx qubits[25],qubits[90],qubits[179];
-h qubits[179];
-h qubits[179];
-ccx qubits[24],qubits[91],qubits[179];
-h qubits[179];
-h qubits[179];
-ccx qubits[23],qubits[92],qubits[179];
-h qubits[179];
-h qubits[179];
-ccx qubits[22],qubits[93],qubits[179];
-h qubits[179];
-h qubits[179];
-ccx qubits[21],qubits[94],qubits[179];
-h qubits[179];
-h qubits[179];
-ccx qubits[20],qubits[95],qubits[179];
-h qubits[179];
-h qubits[179];
-ccx qubits[19],qubits[96],qubits[179];
-h qubits[179];
-h qubits[179];
-ccx qubits[18],qubits[97],qubits[179];
-h qubits[179];
-h qubits[179];
-ccx qubits[17],qubits[98],qubits[179];
-h qubits[179];
-h qubits[179];
-ccx qubits[16],qubits[99],qubits[179];
-h qubits[179];
-h qubits[179];
-ccx qubits[15],qubits[100],qubits[179];
-h qubits[179];
-h qubits[179];
-ccx qubits[14],qubits[101],qubits[179];
-h qubits[179];
-h qubits[179];
-ccx qubits[13],qubits[102],qubits[179];
-h qubits[179];
-h qubits[179];
-ccx qubits[12],qubits[103],qubits[179];
-h qubits[179];
-h qubits[179];
-ccx qubits[11],qubits[104],qubits[179];
-h qubits[179];
-h qubits[179];
-ccx qubits[10],qubits[105],qubits[179];
-h qubits[179];
-h qubits[179];
-ccx qubits[9],qubits[106],qubits[179];
-h qubits[179];
-h qubits[179];
-ccx qubits[8],qubits[107],qubits[179];
-h qubits[179];
-h qubits[179];
-ccx qubits[7],qubits[108],qubits[179];
-h qubits[179];
-h qubits[179];
-ccx qubits[6],qubits[109],qubits[179];
-h qubits[179];
-h qubits[179];
-ccx qubits[5],qubits[110],qubits[179];
-h qubits[179];
-h qubits[179];
-ccx qubits[4],qubits[111],qubits[179];
-h qubits[179];
-h qubits[179];
-ccx qubits[3],qubits[112],qubits[179];
-h qubits[179];
-h qubits[179];
-ccx qubits[2],qubits[113],qubits[179];
-h qubits[179];
-h qubits[179];
-ccx qubits[1],qubits[114],qubits[179];
-h qubits[179];
-h qubits[179];
-ccx qubits[0],qubits[115],qubits[179];
-h qubits[179];
-h qubits[178];
-ccx qubits[50],qubits[64],qubits[178];
-h qubits[178];
-h qubits[178];
-ccx qubits[49],qubits[65],qubits[178];
-h qubits[178];
-h qubits[178];
-ccx qubits[48],qubits[66],qubits[178];
-h qubits[178];
-h qubits[178];
-ccx qubits[47],qubits[67],qubits[178];
-h qubits[178];
-h qubits[178];
-ccx qubits[46],qubits[68],qubits[178];
-h qubits[178];
-h qubits[178];
-ccx qubits[45],qubits[69],qubits[178];
-h qubits[178];
-h qubits[178];
-ccx qubits[44],qubits[70],qubits[178];
-h qubits[178];
-h qubits[178];
-ccx qubits[43],qubits[71],qubits[178];
-h qubits[178];
-h qubits[178];
-ccx qubits[42],qubits[72],qubits[178];
-h qubits[178];
-h qubits[178];
-ccx qubits[41],qubits[73],qubits[178];
-h qubits[178];
-h qubits[178];
-ccx qubits[40],qubits[74],qubits[178];
-h qubits[178];
-h qubits[178];
-ccx qubits[39],qubits[75],qubits[178];
-h qubits[178];
-h qubits[178];
-ccx qubits[38],qubits[76],qubits[178];
-h qubits[178];
-h qubits[178];
-ccx qubits[37],qubits[77],qubits[178];
-h qubits[178];
-h qubits[178];
-ccx qubits[36],qubits[78],qubits[178];
-h qubits[178];
-h qubits[178];
-ccx qubits[35],qubits[79],qubits[178];
-h qubits[178];
-h qubits[178];
-ccx qubits[34],qubits[80],qubits[178];
-h qubits[178];
-h qubits[178];
-ccx qubits[33],qubits[81],qubits[178];
-h qubits[178];
-h qubits[178];
-ccx qubits[32],qubits[82],qubits[178];
-h qubits[178];
-h qubits[178];
-ccx qubits[31],qubits[83],qubits[178];
-h qubits[178];
-h qubits[178];
-ccx qubits[30],qubits[84],qubits[178];
-h qubits[178];
-h qubits[178];
-ccx qubits[29],qubits[85],qubits[178];
-h qubits[178];
-h qubits[178];
-ccx qubits[28],qubits[86],qubits[178];
-h qubits[178];
-h qubits[178];
-ccx qubits[27],qubits[87],qubits[178];
-h qubits[178];
-h qubits[178];
-ccx qubits[26],qubits[88],qubits[178];
-h qubits[178];
-h qubits[178];
-ccx qubits[25],qubits[89],qubits[178];
-h qubits[178];
-h qubits[178];
-ccx qubits[24],qubits[90],qubits[178];
-h qubits[178];
-h qubits[178];
-ccx qubits[23],qubits[91],qubits[178];
-h qubits[178];
-h qubits[178];
-ccx qubits[22],qubits[92],qubits[178];
-h qubits[178];
-h qubits[178];
-ccx qubits[21],qubits[93],qubits[178];
-h qubits[178];
-h qubits[178];
-ccx qubits[20],qubits[94],qubits[178];
-h qubits[178];
-h qubits[178];
-ccx qubits[19],qubits[95],qubits[178];
-h qubits[178];
-h qubits[178];
-ccx qubits[18],qubits[96],qubits[178];
-h qubits[178];
-h qubits[178];
-ccx qubits[17],qubits[97],qubits[178];
-h qubits[178];
-h qubits[178];
-ccx qubits[16],qubits[98],qubits[178];
-h qubits[178];
-h qubits[178];
-ccx qubits[15],qubits[99],qubits[178];
-h qubits[178];
-h qubits[178];
-ccx qubits[14],qubits[100],qubits[178];
-h qubits[178];
-h qubits[178];
-ccx qubits[13],qubits[101],qubits[178];
-h qubits[178];
-h qubits[178];
-ccx qubits[12],qubits[102],qubits[178];
-h qubits[178];
-h qubits[178];
-ccx qubits[11],qubits[103],qubits[178];
-h qubits[178];
-h qubits[178];
-ccx qubits[10],qubits[104],qubits[178];
-h qubits[178];
-h qubits[178];
-ccx qubits[9],qubits[105],qubits[178];
-h qubits[178];
-h qubits[178];
-ccx qubits[8],qubits[106],qubits[178];
-h qubits[178];
-h qubits[178];
-ccx qubits[7],qubits[107],qubits[178];
-h qubits[178];
-h qubits[178];
-ccx qubits[6],qubits[108],qubits[178];
-h qubits[178];
-h qubits[178];
-ccx qubits[5],qubits[109],qubits[178];
-h qubits[178];
-h qubits[178];
-ccx qubits[4],qubits[110],qubits[178];
-h qubits[178];
-h qubits[178];
-ccx qubits[3],qubits[111],qubits[178];
-h qubits[178];
-h qubits[178];
-ccx qubits[2],qubits[112],qubits[178];
-h qubits[178];
-h qubits[178];
-ccx qubits[1],qubits[113],qubits[178];
-h qubits[178];
-h qubits[178];
-ccx qubits[0],qubits[114],qubits[178];
-h qubits[178];
-h qubits[177];
-ccx qubits[49],qubits[64],qubits[177];
-h qubits[177];
-h qubits[177];
-ccx qubits[48],qubits[65],qubits[177];
-h qubits[177];
-h qubits[177];
-ccx qubits[47],qubits[66],qubits[177];
-h qubits[177];
-h qubits[177];
-ccx qubits[46],qubits[67],qubits[177];
-h qubits[177];
-h qubits[177];
-ccx qubits[45],qubits[68],qubits[177];
-h qubits[177];
-h qubits[177];
-ccx qubits[44],qubits[69],qubits[177];
-h qubits[177];
-h qubits[177];
-ccx qubits[43],qubits[70],qubits[177];
-h qubits[177];
-h qubits[177];
-ccx qubits[42],qubits[71],qubits[177];
-h qubits[177];
-h qubits[177];
-ccx qubits[41],qubits[72],qubits[177];
-h qubits[177];
-h qubits[177];
-ccx qubits[40],qubits[73],qubits[177];
-h qubits[177];
-h qubits[177];
-ccx qubits[39],qubits[74],qubits[177];
-h qubits[177];
-h qubits[177];
-ccx qubits[38],qubits[75],qubits[177];
-h qubits[177];
-h qubits[177];
-ccx qubits[37],qubits[76],qubits[177];
-h qubits[177];
-h qubits[177];
-ccx qubits[36],qubits[77],qubits[177];
-h qubits[177];
-h qubits[177];
-ccx qubits[35],qubits[78],qubits[177];
-h qubits[177];
-h qubits[177];
-ccx qubits[34],qubits[79],qubits[177];
-h qubits[177];
-h qubits[177];
-ccx qubits[33],qubits[80],qubits[177];
-h qubits[177];
-h qubits[177];
-ccx qubits[32],qubits[81],qubits[177];
-h qubits[177];
-h qubits[177];
-ccx qubits[31],qubits[82],qubits[177];
-h qubits[177];
-h qubits[177];
-ccx qubits[30],qubits[83],qubits[177];
-h qubits[177];
-h qubits[177];
-ccx qubits[29],qubits[84],qubits[177];
-h qubits[177];
-h qubits[177];
-ccx qubits[28],qubits[85],qubits[177];
-h qubits[177];
-h qubits[177];
-ccx qubits[27],qubits[86],qubits[177];
-h qubits[177];
-h qubits[177];
-ccx qubits[26],qubits[87],qubits[177];
-h qubits[177];
-h qubits[177];
-ccx qubits[25],qubits[88],qubits[177];
-h qubits[177];
-h qubits[177];
-ccx qubits[24],qubits[89],qubits[177];
-h qubits[177];
-h qubits[177];
-ccx qubits[23],qubits[90],qubits[177];
-h qubits[177];
-h qubits[177];
-ccx qubits[22],qubits[91],qubits[177];
-h qubits[177];
-h qubits[177];
-ccx qubits[21],qubits[92],qubits[177];
-h qubits[177];
-h qubits[177];
-ccx qubits[20],qubits[93],qubits[177];
-h qubits[177];
-h qubits[177];
-ccx qubits[19],qubits[94],qubits[177];
-h qubits[177];
-h qubits[177];
-ccx qubits[18],qubits[95],qubits[177];
-h qubits[177];
-h qubits[177];
-ccx qubits[17],qubits[96],qubits[177];
-h qubits[177];
-h qubits[177];
-ccx qubits[16],qubits[97],qubits[177];
-h qubits[177];
-h qubits[177];
-ccx qubits[15],qubits[98],qubits[177];
-h qubits[177];
-h qubits[177];
-ccx qubits[14],qubits[99],qubits[177];
-h qubits[177];
-h qubits[177];
-ccx qubits[13],qubits[100],qubits[177];
-h qubits[177];
-h qubits[177];
-ccx qubits[12],qubits[101],qubits[177];
-h qubits[177];
-h qubits[177];
-ccx qubits[11],qubits[102],qubits[177];
-h qubits[177];
-h qubits[177];
-ccx qubits[10],qubits[103],qubits[177];
-h qubits[177];
-h qubits[177];
-ccx qubits[9],qubits[104],qubits[177];
-h qubits[177];
-h qubits[177];
-ccx qubits[8],qubits[105],qubits[177];
-h qubits[177];
-h qubits[177];
-ccx qubits[7],qubits[106],qubits[177];
-h qubits[177];
-h qubits[177];
-ccx qubits[6],qubits[107],qubits[177];
-h qubits[177];
-h qubits[177];
-ccx qubits[5],qubits[108],qubits[177];
-h qubits[177];
-h qubits[177];
-ccx qubits[4],qubits[109],qubits[177];
-h qubits[177];
-h qubits[177];
-ccx qubits[3],qubits[110],qubits[177];
-h qubits[177];
-h qubits[177];
-ccx qubits[2],qubits[111],qubits[177];
-h qubits[177];
-h qubits[177];
-ccx qubits[1],qubits[112],qubits[177];
-h qubits[177];
-h qubits[177];
-ccx qubits[0],qubits[113],qubits[177];
-h qubits[177];
-h qubits[176];
-ccx qubits[48],qubits[64],qubits[176];
-h qubits[176];
-h qubits[176];
-ccx qubits[47],qubits[65],qubits[176];
-h qubits[176];
-h qubits[176];
-ccx qubits[46],qubits[66],qubits[176];
-h qubits[176];
-h qubits[176];
-ccx qubits[45],qubits[67],qubits[176];
-h qubits[176];
-h qubits[176];
-ccx qubits[44],qubits[68],qubits[176];
-h qubits[176];
-h qubits[176];
-ccx qubits[43],qubits[69],qubits[176];
-h qubits[176];
-h qubits[176];
-ccx qubits[42],qubits[70],qubits[176];
-h qubits[176];
-h qubits[176];
-ccx qubits[41],qubits[71],qubits[176];
-h qubits[176];
-h qubits[176];
-ccx qubits[40],qubits[72],qubits[176];
-h qubits[176];
-h qubits[176];
-ccx qubits[39],qubits[73],qubits[176];
-h qubits[176];
-h qubits[176];
-ccx qubits[38],qubits[74],qubits[176];
-h qubits[176];
-h qubits[176];
-ccx qubits[37],qubits[75],qubits[176];
-h qubits[176];
-h qubits[176];
-ccx qubits[36],qubits[76],qubits[176];
-h qubits[176];
-h qubits[176];
-ccx qubits[35],qubits[77],qubits[176];
-h qubits[176];
-h qubits[176];
-ccx qubits[34],qubits[78],qubits[176];
-h qubits[176];
-h qubits[176];
-ccx qubits[33],qubits[79],qubits[176];
-h qubits[176];
-h qubits[176];
-ccx qubits[32],qubits[80],qubits[176];
-h qubits[176];
-h qubits[176];
-ccx qubits[31],qubits[81],qubits[176];
-h qubits[176];
-h qubits[176];
-ccx qubits[30],qubits[82],qubits[176];
-h qubits[176];
-h qubits[176];
-ccx qubits[29],qubits[83],qubits[176];
-h qubits[176];
-h qubits[176];
-ccx qubits[28],qubits[84],qubits[176];
-h qubits[176];
-h qubits[176];
-ccx qubits[27],qubits[85],qubits[176];
-h qubits[176];
-h qubits[176];
-ccx qubits[26],qubits[86],qubits[176];
-h qubits[176];
-h qubits[176];
-ccx qubits[25],qubits[87],qubits[176];
-h qubits[176];
-h qubits[176];
-ccx qubits[24],qubits[88],qubits[176];
-h qubits[176];
-h qubits[176];
-ccx qubits[23],qubits[89],qubits[176];
-h qubits[176];
-h qubits[176];
-ccx qubits[22],qubits[90],qubits[176];
-h qubits[176];
-h qubits[176];
-ccx qubits[21],qubits[91],qubits[176];
-h qubits[176];
-h qubits[176];
-ccx qubits[20],qubits[92],qubits[176];
-h qubits[176];
-h qubits[176];
-ccx qubits[19],qubits[93],qubits[176];
-h qubits[176];
-h qubits[176];
-ccx qubits[18],qubits[94],qubits[176];
-h qubits[176];
-h qubits[176];
-ccx qubits[17],qubits[95],qubits[176];
-h qubits[176];
-h qubits[176];
-ccx qubits[16],qubits[96],qubits[176];
-h qubits[176];
-h qubits[176];
-ccx qubits[15],qubits[97],qubits[176];
-h qubits[176];
-h qubits[176];
-ccx qubits[14],qubits[98],qubits[176];
-h qubits[176];
-h qubits[176];
-ccx qubits[13],qubits[99],qubits[176];
-h qubits[176];
-h qubits[176];
-ccx qubits[12],qubits[100],qubits[176];
-h qubits[176];
-h qubits[176];
-ccx qubits[11],qubits[101],qubits[176];
-h qubits[176];
-h qubits[176];
-ccx qubits[10],qubits[102],qubits[176];
-h qubits[176];
-h qubits[176];
-ccx qubits[9],qubits[103],qubits[176];
-h qubits[176];
-h qubits[176];
-ccx qubits[8],qubits[104],qubits[176];
-h qubits[176];
-h qubits[176];
-ccx qubits[7],qubits[105],qubits[176];
-h qubits[176];
-h qubits[176];
-ccx qubits[6],qubits[106],qubits[176];
-h qubits[176];
-h qubits[176];
-ccx qubits[5],qubits[107],qubits[176];
-h qubits[176];
-h qubits[176];
-ccx qubits[4],qubits[108],qubits[176];
-h qubits[176];
-h qubits[176];
-ccx qubits[3],qubits[109],qubits[176];
-h qubits[176];
-h qubits[176];
-ccx qubits[2],qubits[110],qubits[176];
-h qubits[176];
-h qubits[176];
-ccx qubits[1],qubits[111],qubits[176];
-h qubits[176];
-h qubits[176];
-ccx qubits[0],qubits[112],qubits[176];
-h qubits[176];
-h qubits[175];
-ccx qubits[47],qubits[64],qubits[175];
-h qubits[175];
-h qubits[175];
-ccx qubits[46],qubits[65],qubits[175];
-h qubits[175];
-h qubits[175];
-ccx qubits[45],qubits[66],qubits[175];
-h qubits[175];
-h qubits[175];
-ccx qubits[44],qubits[67],qubits[175];
-h qubits[175];
-h qubits[175];
-ccx qubits[43],qubits[68],qubits[175];
-h qubits[175];
-h qubits[175];
-ccx qubits[42],qubits[69],qubits[175];
-h qubits[175];
-h qubits[175];
-ccx qubits[41],qubits[70],qubits[175];
-h qubits[175];
-h qubits[175];
-ccx qubits[40],qubits[71],qubits[175];
-h qubits[175];
-h qubits[175];
-ccx qubits[39],qubits[72],qubits[175];
-h qubits[175];
-h qubits[175];
-ccx qubits[38],qubits[73],qubits[175];
-h qubits[175];
-h qubits[175];
-ccx qubits[37],qubits[74],qubits[175];
-h qubits[175];
-h qubits[175];
-ccx qubits[36],qubits[75],qubits[175];
-h qubits[175];
-h qubits[175];
-ccx qubits[35],qubits[76],qubits[175];
-h qubits[175];
-h qubits[175];
-ccx qubits[34],qubits[77],qubits[175];
-h qubits[175];
-h qubits[175];
-ccx qubits[33],qubits[78],qubits[175];
-h qubits[175];
-h qubits[175];
-ccx qubits[32],qubits[79],qubits[175];
-h qubits[175];
-h qubits[175];
-ccx qubits[31],qubits[80],qubits[175];
-h qubits[175];
-h qubits[175];
-ccx qubits[30],qubits[81],qubits[175];
-h qubits[175];
-h qubits[175];
-ccx qubits[29],qubits[82],qubits[175];
-h qubits[175];
-h qubits[175];
-ccx qubits[28],qubits[83],qubits[175];
-h qubits[175];
-h qubits[175];
-ccx qubits[27],qubits[84],qubits[175];
-h qubits[175];
-h qubits[175];
-ccx qubits[26],qubits[85],qubits[175];
-h qubits[175];
-h qubits[175];
-ccx qubits[25],qubits[86],qubits[175];
-h qubits[175];
-h qubits[175];
-ccx qubits[24],qubits[87],qubits[175];
-h qubits[175];
-h qubits[175];
-ccx qubits[23],qubits[88],qubits[175];
-h qubits[175];
-h qubits[175];
-ccx qubits[22],qubits[89],qubits[175];
-h qubits[175];
-h qubits[175];
-ccx qubits[21],qubits[90],qubits[175];
-h qubits[175];
-h qubits[175];
-ccx qubits[20],qubits[91],qubits[175];
-h qubits[175];
-h qubits[175];
-ccx qubits[19],qubits[92],qubits[175];
-h qubits[175];
-h qubits[175];
-ccx qubits[18],qubits[93],qubits[175];
-h qubits[175];
-h qubits[175];
-ccx qubits[17],qubits[94],qubits[175];
-h qubits[175];
-h qubits[175];
-ccx qubits[16],qubits[95],qubits[175];
-h qubits[175];
-h qubits[175];
-ccx qubits[15],qubits[96],qubits[175];
-h qubits[175];
-h qubits[175];
-ccx qubits[14],qubits[97],qubits[175];
-h qubits[175];
-h qubits[175];
-ccx qubits[13],qubits[98],qubits[175];
-h qubits[175];
-h qubits[175];
-ccx qubits[12],qubits[99],qubits[175];
-h qubits[175];
-h qubits[175];
-ccx qubits[11],qubits[100],qubits[175];
-h qubits[175];
-h qubits[175];
-ccx qubits[10],qubits[101],qubits[175];
-h qubits[175];
-h qubits[175];
-ccx qubits[9],qubits[102],qubits[175];
-h qubits[175];
-h qubits[175];
-ccx qubits[8],qubits[103],qubits[175];
-h qubits[175];
-h qubits[175];
-ccx qubits[7],qubits[104],qubits[175];
-h qubits[175];
-h qubits[175];
-ccx qubits[6],qubits[105],qubits[175];
-h qubits[175];
-h qubits[175];
-ccx qubits[5],qubits[106],qubits[175];
-h qubits[175];
-h qubits[175];
-ccx qubits[4],qubits[107],qubits[175];
-h qubits[175];
-h qubits[175];
-ccx qubits[3],qubits[108],qubits[175];
-h qubits[175];
-h qubits[175];
-ccx qubits[2],qubits[109],qubits[175];
-h qubits[175];
-h qubits[175];
-ccx qubits[1],qubits[110],qubits[175];
-h qubits[175];
-h qubits[175];
-ccx qubits[0],qubits[111],qubits[175];
-h qubits[175];
-h qubits[174];
-ccx qubits[46],qubits[64],qubits[174];
-h qubits[174];
-h qubits[174];
-ccx qubits[45],qubits[65],qubits[174];
-h qubits[174];
-h qubits[174];
-ccx qubits[44],qubits[66],qubits[174];
-h qubits[174];
-h qubits[174];
-ccx qubits[43],qubits[67],qubits[174];
-h qubits[174];
-h qubits[174];
-ccx qubits[42],qubits[68],qubits[174];
-h qubits[174];
-h qubits[174];
-ccx qubits[41],qubits[69],qubits[174];
-h qubits[174];
-h qubits[174];
-ccx qubits[40],qubits[70],qubits[174];
-h qubits[174];
-h qubits[174];
-ccx qubits[39],qubits[71],qubits[174];
-h qubits[174];
-h qubits[174];
-ccx qubits[38],qubits[72],qubits[174];
-h qubits[174];
-h qubits[174];
-ccx qubits[37],qubits[73],qubits[174];
-h qubits[174];
-h qubits[174];
-ccx qubits[36],qubits[74],qubits[174];
-h qubits[174];
-h qubits[174];
-ccx qubits[35],qubits[75],qubits[174];
-h qubits[174];
-h qubits[174];
-ccx qubits[34],qubits[76],qubits[174];
-h qubits[174];
-h qubits[174];
-ccx qubits[33],qubits[77],qubits[174];
-h qubits[174];
-h qubits[174];
-ccx qubits[32],qubits[78],qubits[174];
-h qubits[174];
-h qubits[174];
-ccx qubits[31],qubits[79],qubits[174];
-h qubits[174];
-h qubits[174];
-ccx qubits[30],qubits[80],qubits[174];
-h qubits[174];
-h qubits[174];
-ccx qubits[29],qubits[81],qubits[174];
-h qubits[174];
-h qubits[174];
-ccx qubits[28],qubits[82],qubits[174];
-h qubits[174];
-h qubits[174];
-ccx qubits[27],qubits[83],qubits[174];
-h qubits[174];
-h qubits[174];
-ccx qubits[26],qubits[84],qubits[174];
-h qubits[174];
-h qubits[174];
-ccx qubits[25],qubits[85],qubits[174];
-h qubits[174];
-h qubits[174];
-ccx qubits[24],qubits[86],qubits[174];
-h qubits[174];
-h qubits[174];
-ccx qubits[23],qubits[87],qubits[174];
-h qubits[174];
-h qubits[174];
-ccx qubits[22],qubits[88],qubits[174];
-h qubits[174];
-h qubits[174];
-ccx qubits[21],qubits[89],qubits[174];
-h qubits[174];
-h qubits[174];
-ccx qubits[20],qubits[90],qubits[174];
-h qubits[174];
-h qubits[174];
-ccx qubits[19],qubits[91],qubits[174];
-h qubits[174];
-h qubits[174];
-ccx qubits[18],qubits[92],qubits[174];
-h qubits[174];
-h qubits[174];
-ccx qubits[17],qubits[93],qubits[174];
-h qubits[174];
-h qubits[174];
-ccx qubits[16],qubits[94],qubits[174];
-h qubits[174];
-h qubits[174];
-ccx qubits[15],qubits[95],qubits[174];
-h qubits[174];
-h qubits[174];
-ccx qubits[14],qubits[96],qubits[174];
-h qubits[174];
-h qubits[174];
-ccx qubits[13],qubits[97],qubits[174];
-h qubits[174];
-h qubits[174];
-ccx qubits[12],qubits[98],qubits[174];
-h qubits[174];
-h qubits[174];
-ccx qubits[11],qubits[99],qubits[174];
-h qubits[174];
-h qubits[174];
-ccx qubits[10],qubits[100],qubits[174];
-h qubits[174];
-h qubits[174];
-ccx qubits[9],qubits[101],qubits[174];
-h qubits[174];
-h qubits[174];
-ccx qubits[8],qubits[102],qubits[174];
-h qubits[174];
-h qubits[174];
-ccx qubits[7],qubits[103],qubits[174];
-h qubits[174];
-h qubits[174];
-ccx qubits[6],qubits[104],qubits[174];
-h qubits[174];
-h qubits[174];
-ccx qubits[5],qubits[105],qubits[174];
-h qubits[174];
-h qubits[174];
-ccx qubits[4],qubits[106],qubits[174];
-h qubits[174];
-h qubits[174];
-ccx qubits[3],qubits[107],qubits[174];
-h qubits[174];
-h qubits[174];
-ccx qubits[2],qubits[108],qubits[174];
-h qubits[174];
-h qubits[174];
-ccx qubits[1],qubits[109],qubits[174];
-h qubits[174];
-h qubits[174];
-ccx qubits[0],qubits[110],qubits[174];
-h qubits[174];
-h qubits[173];
-ccx qubits[45],qubits[64],qubits[173];
-h qubits[173];
-h qubits[173];
-ccx qubits[44],qubits[65],qubits[173];
-h qubits[173];
-h qubits[173];
-ccx qubits[43],qubits[66],qubits[173];
-h qubits[173];
-h qubits[173];
-ccx qubits[42],qubits[67],qubits[173];
-h qubits[173];
-h qubits[173];
-ccx qubits[41],qubits[68],qubits[173];
-h qubits[173];
-h qubits[173];
-ccx qubits[40],qubits[69],qubits[173];
-h qubits[173];
-h qubits[173];
-ccx qubits[39],qubits[70],qubits[173];
-h qubits[173];
-h qubits[173];
-ccx qubits[38],qubits[71],qubits[173];
-h qubits[173];
-h qubits[173];
-ccx qubits[37],qubits[72],qubits[173];
-h qubits[173];
-h qubits[173];
-ccx qubits[36],qubits[73],qubits[173];
-h qubits[173];
-h qubits[173];
-ccx qubits[35],qubits[74],qubits[173];
-h qubits[173];
-h qubits[173];
-ccx qubits[34],qubits[75],qubits[173];
-h qubits[173];
-h qubits[173];
-ccx qubits[33],qubits[76],qubits[173];
-h qubits[173];
-h qubits[173];
-ccx qubits[32],qubits[77],qubits[173];
-h qubits[173];
-h qubits[173];
-ccx qubits[31],qubits[78],qubits[173];
-h qubits[173];
-h qubits[173];
-ccx qubits[30],qubits[79],qubits[173];
-h qubits[173];
-h qubits[173];
-ccx qubits[29],qubits[80],qubits[173];
-h qubits[173];
-h qubits[173];
-ccx qubits[28],qubits[81],qubits[173];
-h qubits[173];
-h qubits[173];
-ccx qubits[27],qubits[82],qubits[173];
-h qubits[173];
-h qubits[173];
-ccx qubits[26],qubits[83],qubits[173];
-h qubits[173];
-h qubits[173];
-ccx qubits[25],qubits[84],qubits[173];
-h qubits[173];
-h qubits[173];
-ccx qubits[24],qubits[85],qubits[173];
-h qubits[173];
-h qubits[173];
-ccx qubits[23],qubits[86],qubits[173];
-h qubits[173];
-h qubits[173];
-ccx qubits[22],qubits[87],qubits[173];
-h qubits[173];
-h qubits[173];
-ccx qubits[21],qubits[88],qubits[173];
-h qubits[173];
-h qubits[173];
-ccx qubits[20],qubits[89],qubits[173];
-h qubits[173];
-h qubits[173];
-ccx qubits[19],qubits[90],qubits[173];
-h qubits[173];
-h qubits[173];
-ccx qubits[18],qubits[91],qubits[173];
-h qubits[173];
-h qubits[173];
-ccx qubits[17],qubits[92],qubits[173];
-h qubits[173];
-h qubits[173];
-ccx qubits[16],qubits[93],qubits[173];
-h qubits[173];
-h qubits[173];
-ccx qubits[15],qubits[94],qubits[173];
-h qubits[173];
-h qubits[173];
-ccx qubits[14],qubits[95],qubits[173];
-h qubits[173];
-h qubits[173];
-ccx qubits[13],qubits[96],qubits[173];
-h qubits[173];
-h qubits[173];
-ccx qubits[12],qubits[97],qubits[173];
-h qubits[173];
-h qubits[173];
-ccx qubits[11],qubits[98],qubits[173];
-h qubits[173];
-h qubits[173];
-ccx qubits[10],qubits[99],qubits[173];
-h qubits[173];
-h qubits[173];
-ccx qubits[9],qubits[100],qubits[173];
-h qubits[173];
-h qubits[173];
-ccx qubits[8],qubits[101],qubits[173];
-h qubits[173];
-h qubits[173];
-ccx qubits[7],qubits[102],qubits[173];
-h qubits[173];
-h qubits[173];
-ccx qubits[6],qubits[103],qubits[173];
-h qubits[173];
-h qubits[173];
-ccx qubits[5],qubits[104],qubits[173];
-h qubits[173];
-h qubits[173];
-ccx qubits[4],qubits[105],qubits[173];
-h qubits[173];
-h qubits[173];
-ccx qubits[3],qubits[106],qubits[173];
-h qubits[173];
-h qubits[173];
-ccx qubits[2],qubits[107],qubits[173];
-h qubits[173];
-h qubits[173];
-ccx qubits[1],qubits[108],qubits[173];
-h qubits[173];
-h qubits[173];
-ccx qubits[0],qubits[109],qubits[173];
-h qubits[173];
-h qubits[172];
-ccx qubits[44],qubits[64],qubits[172];
-h qubits[172];
-h qubits[172];
-ccx qubits[43],qubits[65],qubits[172];
-h qubits[172];
-h qubits[172];
-ccx qubits[42],qubits[66],qubits[172];
-h qubits[172];
-h qubits[172];
-ccx qubits[41],qubits[67],qubits[172];
-h qubits[172];
-h qubits[172];
-ccx qubits[40],qubits[68],qubits[172];
-h qubits[172];
-h qubits[172];
-ccx qubits[39],qubits[69],qubits[172];
-h qubits[172];
-h qubits[172];
-ccx qubits[38],qubits[70],qubits[172];
-h qubits[172];
-h qubits[172];
-ccx qubits[37],qubits[71],qubits[172];
-h qubits[172];
-h qubits[172];
-ccx qubits[36],qubits[72],qubits[172];
-h qubits[172];
-h qubits[172];
-ccx qubits[35],qubits[73],qubits[172];
-h qubits[172];
-h qubits[172];
-ccx qubits[34],qubits[74],qubits[172];
-h qubits[172];
-h qubits[172];
-ccx qubits[33],qubits[75],qubits[172];
-h qubits[172];
-h qubits[172];
-ccx qubits[32],qubits[76],qubits[172];
-h qubits[172];
-h qubits[172];
-ccx qubits[31],qubits[77],qubits[172];
-h qubits[172];
-h qubits[172];
-ccx qubits[30],qubits[78],qubits[172];
-h qubits[172];
-h qubits[172];
-ccx qubits[29],qubits[79],qubits[172];
-h qubits[172];
-h qubits[172];
-ccx qubits[28],qubits[80],qubits[172];
-h qubits[172];
-h qubits[172];
-ccx qubits[27],qubits[81],qubits[172];
-h qubits[172];
-h qubits[172];
-ccx qubits[26],qubits[82],qubits[172];
-h qubits[172];
-h qubits[172];
-ccx qubits[25],qubits[83],qubits[172];
-h qubits[172];
-h qubits[172];
-ccx qubits[24],qubits[84],qubits[172];
-h qubits[172];
-h qubits[172];
-ccx qubits[23],qubits[85],qubits[172];
-h qubits[172];
-h qubits[172];
-ccx qubits[22],qubits[86],qubits[172];
-h qubits[172];
-h qubits[172];
-ccx qubits[21],qubits[87],qubits[172];
-h qubits[172];
-h qubits[172];
-ccx qubits[20],qubits[88],qubits[172];
-h qubits[172];
-h qubits[172];
-ccx qubits[19],qubits[89],qubits[172];
-h qubits[172];
-h qubits[172];
-ccx qubits[18],qubits[90],qubits[172];
-h qubits[172];
-h qubits[172];
-ccx qubits[17],qubits[91],qubits[172];
-h qubits[172];
-h qubits[172];
-ccx qubits[16],qubits[92],qubits[172];
-h qubits[172];
-h qubits[172];
-ccx qubits[15],qubits[93],qubits[172];
-h qubits[172];
-h qubits[172];
-ccx qubits[14],qubits[94],qubits[172];
-h qubits[172];
-h qubits[172];
-ccx qubits[13],qubits[95],qubits[172];
-h qubits[172];
-h qubits[172];
-ccx qubits[12],qubits[96],qubits[172];
-h qubits[172];
-h qubits[172];
-ccx qubits[11],qubits[97],qubits[172];
-h qubits[172];
-h qubits[172];
-ccx qubits[10],qubits[98],qubits[172];
-h qubits[172];
-h qubits[172];
-ccx qubits[9],qubits[99],qubits[172];
-h qubits[172];
-h qubits[172];
-ccx qubits[8],qubits[100],qubits[172];
-h qubits[172];
-h qubits[172];
-ccx qubits[7],qubits[101],qubits[172];
-h qubits[172];
-h qubits[172];
-ccx qubits[6],qubits[102],qubits[172];
-h qubits[172];
-h qubits[172];
-ccx qubits[5],qubits[103],qubits[172];
-h qubits[172];
-h qubits[172];
-ccx qubits[4],qubits[104],qubits[172];
-h qubits[172];
-h qubits[172];
-ccx qubits[3],qubits[105],qubits[172];
-h qubits[172];
-h qubits[172];
-ccx qubits[2],qubits[106],qubits[172];
-h qubits[172];
-h qubits[172];
-ccx qubits[1],qubits[107],qubits[172];
-h qubits[172];
-h qubits[172];
-ccx qubits[0],qubits[108],qubits[172];
-h qubits[172];
-h qubits[171];
-ccx qubits[43],qubits[64],qubits[171];
-h qubits[171];
-h qubits[171];
-ccx qubits[42],qubits[65],qubits[171];
-h qubits[171];
-h qubits[171];
-ccx qubits[41],qubits[66],qubits[171];
-h qubits[171];
-h qubits[171];
-ccx qubits[40],qubits[67],qubits[171];
-h qubits[171];
-h qubits[171];
-ccx qubits[39],qubits[68],qubits[171];
-h qubits[171];
-h qubits[171];
-ccx qubits[38],qubits[69],qubits[171];
-h qubits[171];
-h qubits[171];
-ccx qubits[37],qubits[70],qubits[171];
-h qubits[171];
-h qubits[171];
-ccx qubits[36],qubits[71],qubits[171];
-h qubits[171];
-h qubits[171];
-ccx qubits[35],qubits[72],qubits[171];
-h qubits[171];
-h qubits[171];
-ccx qubits[34],qubits[73],qubits[171];
-h qubits[171];
-h qubits[171];
-ccx qubits[33],qubits[74],qubits[171];
-h qubits[171];
-h qubits[171];
-ccx qubits[32],qubits[75],qubits[171];
-h qubits[171];
-h qubits[171];
-ccx qubits[31],qubits[76],qubits[171];
-h qubits[171];
-h qubits[171];
-ccx qubits[30],qubits[77],qubits[171];
-h qubits[171];
-h qubits[171];
-ccx qubits[29],qubits[78],qubits[171];
-h qubits[171];
-h qubits[171];
-ccx qubits[28],qubits[79],qubits[171];
-h qubits[171];
-h qubits[171];
-ccx qubits[27],qubits[80],qubits[171];
-h qubits[171];
-h qubits[171];
-ccx qubits[26],qubits[81],qubits[171];
-h qubits[171];
-h qubits[171];
-ccx qubits[25],qubits[82],qubits[171];
-h qubits[171];
-h qubits[171];
-ccx qubits[24],qubits[83],qubits[171];
-h qubits[171];
-h qubits[171];
-ccx qubits[23],qubits[84],qubits[171];
-h qubits[171];
-h qubits[171];
-ccx qubits[22],qubits[85],qubits[171];
-h qubits[171];
-h qubits[171];
-ccx qubits[21],qubits[86],qubits[171];
-h qubits[171];
-h qubits[171];
-ccx qubits[20],qubits[87],qubits[171];
-h qubits[171];
-h qubits[171];
-ccx qubits[19],qubits[88],qubits[171];
-h qubits[171];
-h qubits[171];
-ccx qubits[18],qubits[89],qubits[171];
-h qubits[171];
-h qubits[171];
-ccx qubits[17],qubits[90],qubits[171];
-h qubits[171];
-h qubits[171];
-ccx qubits[16],qubits[91],qubits[171];
-h qubits[171];
-h qubits[171];
-ccx qubits[15],qubits[92],qubits[171];
-h qubits[171];
-h qubits[171];
-ccx qubits[14],qubits[93],qubits[171];
-h qubits[171];
-h qubits[171];
-ccx qubits[13],qubits[94],qubits[171];
-h qubits[171];
-h qubits[171];
-ccx qubits[12],qubits[95],qubits[171];
-h qubits[171];
-h qubits[171];
-ccx qubits[11],qubits[96],qubits[171];
-h qubits[171];
-h qubits[171];
-ccx qubits[10],qubits[97],qubits[171];
-h qubits[171];
-h qubits[171];
-ccx qubits[9],qubits[98],qubits[171];
-h qubits[171];
-h qubits[171];
-ccx qubits[8],qubits[99],qubits[171];
-h qubits[171];
-h qubits[171];
-ccx qubits[7],qubits[100],qubits[171];
-h qubits[171];
-h qubits[171];
-ccx qubits[6],qubits[101],qubits[171];
-h qubits[171];
-h qubits[171];
-ccx qubits[5],qubits[102],qubits[171];
-h qubits[171];
-h qubits[171];
-ccx qubits[4],qubits[103],qubits[171];
-h qubits[171];
-h qubits[171];
-ccx qubits[3],qubits[104],qubits[171];
-h qubits[171];
-h qubits[171];
-ccx qubits[2],qubits[105],qubits[171];
-h qubits[171];
-h qubits[171];
-ccx qubits[1],qubits[106],qubits[171];
-h qubits[171];
-h qubits[171];
-ccx qubits[0],qubits[107],qubits[171];
-h qubits[171];
-h qubits[170];
-ccx qubits[42],qubits[64],qubits[170];
-h qubits[170];
-h qubits[170];
-ccx qubits[41],qubits[65],qubits[170];
-h qubits[170];
-h qubits[170];
-ccx qubits[40],qubits[66],qubits[170];
-h qubits[170];
-h qubits[170];
-ccx qubits[39],qubits[67],qubits[170];
-h qubits[170];
-h qubits[170];
-ccx qubits[38],qubits[68],qubits[170];
-h qubits[170];
-h qubits[170];
-ccx qubits[37],qubits[69],qubits[170];
-h qubits[170];
-h qubits[170];
-ccx qubits[36],qubits[70],qubits[170];
-h qubits[170];
-h qubits[170];
-ccx qubits[35],qubits[71],qubits[170];
-h qubits[170];
-h qubits[170];
-ccx qubits[34],qubits[72],qubits[170];
-h qubits[170];
-h qubits[170];
-ccx qubits[33],qubits[73],qubits[170];
-h qubits[170];
-h qubits[170];
-ccx qubits[32],qubits[74],qubits[170];
-h qubits[170];
-h qubits[170];
-ccx qubits[31],qubits[75],qubits[170];
-h qubits[170];
-h qubits[170];
-ccx qubits[30],qubits[76],qubits[170];
-h qubits[170];
-h qubits[170];
-ccx qubits[29],qubits[77],qubits[170];
-h qubits[170];
-h qubits[170];
-ccx qubits[28],qubits[78],qubits[170];
-h qubits[170];
-h qubits[170];
-ccx qubits[27],qubits[79],qubits[170];
-h qubits[170];
-h qubits[170];
-ccx qubits[26],qubits[80],qubits[170];
-h qubits[170];
-h qubits[170];
-ccx qubits[25],qubits[81],qubits[170];
-h qubits[170];
-h qubits[170];
-ccx qubits[24],qubits[82],qubits[170];
-h qubits[170];
-h qubits[170];
-ccx qubits[23],qubits[83],qubits[170];
-h qubits[170];
-h qubits[170];
-ccx qubits[22],qubits[84],qubits[170];
-h qubits[170];
-h qubits[170];
-ccx qubits[21],qubits[85],qubits[170];
-h qubits[170];
-h qubits[170];
-ccx qubits[20],qubits[86],qubits[170];
-h qubits[170];
-h qubits[170];
-ccx qubits[19],qubits[87],qubits[170];
-h qubits[170];
-h qubits[170];
-ccx qubits[18],qubits[88],qubits[170];
-h qubits[170];
-h qubits[170];
-ccx qubits[17],qubits[89],qubits[170];
-h qubits[170];
-h qubits[170];
-ccx qubits[16],qubits[90],qubits[170];
-h qubits[170];
-h qubits[170];
-ccx qubits[15],qubits[91],qubits[170];
-h qubits[170];
-h qubits[170];
-ccx qubits[14],qubits[92],qubits[170];
-h qubits[170];
-h qubits[170];
-ccx qubits[13],qubits[93],qubits[170];
-h qubits[170];
-h qubits[170];
-ccx qubits[12],qubits[94],qubits[170];
-h qubits[170];
-h qubits[170];
-ccx qubits[11],qubits[95],qubits[170];
-h qubits[170];
-h qubits[170];
-ccx qubits[10],qubits[96],qubits[170];
-h qubits[170];
-h qubits[170];
-ccx qubits[9],qubits[97],qubits[170];
-h qubits[170];
-h qubits[170];
-ccx qubits[8],qubits[98],qubits[170];
-h qubits[170];
-h qubits[170];
-ccx qubits[7],qubits[99],qubits[170];
-h qubits[170];
-h qubits[170];
-ccx qubits[6],qubits[100],qubits[170];
-h qubits[170];
-h qubits[170];
-ccx qubits[5],qubits[101],qubits[170];
-h qubits[170];
-h qubits[170];
-ccx qubits[4],qubits[102],qubits[170];
-h qubits[170];
-h qubits[170];
-ccx qubits[3],qubits[103],qubits[170];
-h qubits[170];
-h qubits[170];
-ccx qubits[2],qubits[104],qubits[170];
-h qubits[170];
-h qubits[170];
-ccx qubits[1],qubits[105],qubits[170];
-h qubits[170];
-h qubits[170];
-ccx qubits[0],qubits[106],qubits[170];
-h qubits[170];
-h qubits[169];
-ccx qubits[41],qubits[64],qubits[169];
-h qubits[169];
-h qubits[169];
-ccx qubits[40],qubits[65],qubits[169];
-h qubits[169];
-h qubits[169];
-ccx qubits[39],qubits[66],qubits[169];
-h qubits[169];
-h qubits[169];
-ccx qubits[38],qubits[67],qubits[169];
-h qubits[169];
-h qubits[169];
-ccx qubits[37],qubits[68],qubits[169];
-h qubits[169];
-h qubits[169];
-ccx qubits[36],qubits[69],qubits[169];
-h qubits[169];
-h qubits[169];
-ccx qubits[35],qubits[70],qubits[169];
-h qubits[169];
-h qubits[169];
-ccx qubits[34],qubits[71],qubits[169];
-h qubits[169];
-h qubits[169];
-ccx qubits[33],qubits[72],qubits[169];
-h qubits[169];
-h qubits[169];
-ccx qubits[32],qubits[73],qubits[169];
-h qubits[169];
-h qubits[169];
-ccx qubits[31],qubits[74],qubits[169];
-h qubits[169];
-h qubits[169];
-ccx qubits[30],qubits[75],qubits[169];
-h qubits[169];
-h qubits[169];
-ccx qubits[29],qubits[76],qubits[169];
-h qubits[169];
-h qubits[169];
-ccx qubits[28],qubits[77],qubits[169];
-h qubits[169];
-h qubits[169];
-ccx qubits[27],qubits[78],qubits[169];
-h qubits[169];
-h qubits[169];
-ccx qubits[26],qubits[79],qubits[169];
-h qubits[169];
-h qubits[169];
-ccx qubits[25],qubits[80],qubits[169];
-h qubits[169];
-h qubits[169];
-ccx qubits[24],qubits[81],qubits[169];
-h qubits[169];
-h qubits[169];
-ccx qubits[23],qubits[82],qubits[169];
-h qubits[169];
-h qubits[169];
-ccx qubits[22],qubits[83],qubits[169];
-h qubits[169];
-h qubits[169];
-ccx qubits[21],qubits[84],qubits[169];
-h qubits[169];
-h qubits[169];
-ccx qubits[20],qubits[85],qubits[169];
-h qubits[169];
-h qubits[169];
-ccx qubits[19],qubits[86],qubits[169];
-h qubits[169];
-h qubits[169];
-ccx qubits[18],qubits[87],qubits[169];
-h qubits[169];
-h qubits[169];
-ccx qubits[17],qubits[88],qubits[169];
-h qubits[169];
-h qubits[169];
-ccx qubits[16],qubits[89],qubits[169];
-h qubits[169];
-h qubits[169];
-ccx qubits[15],qubits[90],qubits[169];
-h qubits[169];
-h qubits[169];
-ccx qubits[14],qubits[91],qubits[169];
-h qubits[169];
-h qubits[169];
-ccx qubits[13],qubits[92],qubits[169];
-h qubits[169];
-h qubits[169];
-ccx qubits[12],qubits[93],qubits[169];
-h qubits[169];
-h qubits[169];
-ccx qubits[11],qubits[94],qubits[169];
-h qubits[169];
-h qubits[169];
-ccx qubits[10],qubits[95],qubits[169];
-h qubits[169];
-h qubits[169];
-ccx qubits[9],qubits[96],qubits[169];
-h qubits[169];
-h qubits[169];
-ccx qubits[8],qubits[97],qubits[169];
-h qubits[169];
-h qubits[169];
-ccx qubits[7],qubits[98],qubits[169];
-h qubits[169];
-h qubits[169];
-ccx qubits[6],qubits[99],qubits[169];
-h qubits[169];
-h qubits[169];
-ccx qubits[5],qubits[100],qubits[169];
-h qubits[169];
-h qubits[169];
-ccx qubits[4],qubits[101],qubits[169];
-h qubits[169];
-h qubits[169];
-ccx qubits[3],qubits[102],qubits[169];
-h qubits[169];
-h qubits[169];
-ccx qubits[2],qubits[103],qubits[169];
-h qubits[169];
-h qubits[169];
-ccx qubits[1],qubits[104],qubits[169];
-h qubits[169];
-h qubits[169];
-ccx qubits[0],qubits[105],qubits[169];
-h qubits[169];
-h qubits[168];
-ccx qubits[40],qubits[64],qubits[168];
-h qubits[168];
-h qubits[168];
-ccx qubits[39],qubits[65],qubits[168];
-h qubits[168];
-h qubits[168];
-ccx qubits[38],qubits[66],qubits[168];
-h qubits[168];
-h qubits[168];
-ccx qubits[37],qubits[67],qubits[168];
-h qubits[168];
-h qubits[168];
-ccx qubits[36],qubits[68],qubits[168];
-h qubits[168];
-h qubits[168];
-ccx qubits[35],qubits[69],qubits[168];
-h qubits[168];
-h qubits[168];
-ccx qubits[34],qubits[70],qubits[168];
-h qubits[168];
-h qubits[168];
-ccx qubits[33],qubits[71],qubits[168];
-h qubits[168];
-h qubits[168];
-ccx qubits[32],qubits[72],qubits[168];
-h qubits[168];
-h qubits[168];
-ccx qubits[31],qubits[73],qubits[168];
-h qubits[168];
-h qubits[168];
-ccx qubits[30],qubits[74],qubits[168];
-h qubits[168];
-h qubits[168];
-ccx qubits[29],qubits[75],qubits[168];
-h qubits[168];
-h qubits[168];
-ccx qubits[28],qubits[76],qubits[168];
-h qubits[168];
-h qubits[168];
-ccx qubits[27],qubits[77],qubits[168];
-h qubits[168];
-h qubits[168];
-ccx qubits[26],qubits[78],qubits[168];
-h qubits[168];
-h qubits[168];
-ccx qubits[25],qubits[79],qubits[168];
-h qubits[168];
-h qubits[168];
-ccx qubits[24],qubits[80],qubits[168];
-h qubits[168];
-h qubits[168];
-ccx qubits[23],qubits[81],qubits[168];
-h qubits[168];
-h qubits[168];
-ccx qubits[22],qubits[82],qubits[168];
-h qubits[168];
-h qubits[168];
-ccx qubits[21],qubits[83],qubits[168];
-h qubits[168];
-h qubits[168];
-ccx qubits[20],qubits[84],qubits[168];
-h qubits[168];
-h qubits[168];
-ccx qubits[19],qubits[85],qubits[168];
-h qubits[168];
-h qubits[168];
-ccx qubits[18],qubits[86],qubits[168];
-h qubits[168];
-h qubits[168];
-ccx qubits[17],qubits[87],qubits[168];
-h qubits[168];
-h qubits[168];
-ccx qubits[16],qubits[88],qubits[168];
-h qubits[168];
-h qubits[168];
-ccx qubits[15],qubits[89],qubits[168];
-h qubits[168];
-h qubits[168];
-ccx qubits[14],qubits[90],qubits[168];
-h qubits[168];
-h qubits[168];
-ccx qubits[13],qubits[91],qubits[168];
-h qubits[168];
-h qubits[168];
-ccx qubits[12],qubits[92],qubits[168];
-h qubits[168];
-h qubits[168];
-ccx qubits[11],qubits[93],qubits[168];
-h qubits[168];
-h qubits[168];
-ccx qubits[10],qubits[94],qubits[168];
-h qubits[168];
-h qubits[168];
-ccx qubits[9],qubits[95],qubits[168];
-h qubits[168];
-h qubits[168];
-ccx qubits[8],qubits[96],qubits[168];
-h qubits[168];
-h qubits[168];
-ccx qubits[7],qubits[97],qubits[168];
-h qubits[168];
-h qubits[168];
-ccx qubits[6],qubits[98],qubits[168];
-h qubits[168];
-h qubits[168];
-ccx qubits[5],qubits[99],qubits[168];
-h qubits[168];
-h qubits[168];
-ccx qubits[4],qubits[100],qubits[168];
-h qubits[168];
-h qubits[168];
-ccx qubits[3],qubits[101],qubits[168];
-h qubits[168];
-h qubits[168];
-ccx qubits[2],qubits[102],qubits[168];
-h qubits[168];
-h qubits[168];
-ccx qubits[1],qubits[103],qubits[168];
-h qubits[168];
-h qubits[168];
-ccx qubits[0],qubits[104],qubits[168];
-h qubits[168];
-h qubits[167];
-ccx qubits[39],qubits[64],qubits[167];
-h qubits[167];
-h qubits[167];
-ccx qubits[38],qubits[65],qubits[167];
-h qubits[167];
-h qubits[167];
-ccx qubits[37],qubits[66],qubits[167];
-h qubits[167];
-h qubits[167];
-ccx qubits[36],qubits[67],qubits[167];
-h qubits[167];
-h qubits[167];
-ccx qubits[35],qubits[68],qubits[167];
-h qubits[167];
-h qubits[167];
-ccx qubits[34],qubits[69],qubits[167];
-h qubits[167];
-h qubits[167];
-ccx qubits[33],qubits[70],qubits[167];
-h qubits[167];
-h qubits[167];
-ccx qubits[32],qubits[71],qubits[167];
-h qubits[167];
-h qubits[167];
-ccx qubits[31],qubits[72],qubits[167];
-h qubits[167];
-h qubits[167];
-ccx qubits[30],qubits[73],qubits[167];
-h qubits[167];
-h qubits[167];
-ccx qubits[29],qubits[74],qubits[167];
-h qubits[167];
-h qubits[167];
-ccx qubits[28],qubits[75],qubits[167];
-h qubits[167];
-h qubits[167];
-ccx qubits[27],qubits[76],qubits[167];
-h qubits[167];
-h qubits[167];
-ccx qubits[26],qubits[77],qubits[167];
-h qubits[167];
-h qubits[167];
-ccx qubits[25],qubits[78],qubits[167];
-h qubits[167];
-h qubits[167];
-ccx qubits[24],qubits[79],qubits[167];
-h qubits[167];
-h qubits[167];
-ccx qubits[23],qubits[80],qubits[167];
-h qubits[167];
-h qubits[167];
-ccx qubits[22],qubits[81],qubits[167];
-h qubits[167];
-h qubits[167];
-ccx qubits[21],qubits[82],qubits[167];
-h qubits[167];
-h qubits[167];
-ccx qubits[20],qubits[83],qubits[167];
-h qubits[167];
-h qubits[167];
-ccx qubits[19],qubits[84],qubits[167];
-h qubits[167];
-h qubits[167];
-ccx qubits[18],qubits[85],qubits[167];
-h qubits[167];
-h qubits[167];
-ccx qubits[17],qubits[86],qubits[167];
-h qubits[167];
-h qubits[167];
-ccx qubits[16],qubits[87],qubits[167];
-h qubits[167];
-h qubits[167];
-ccx qubits[15],qubits[88],qubits[167];
-h qubits[167];
-h qubits[167];
-ccx qubits[14],qubits[89],qubits[167];
-h qubits[167];
-h qubits[167];
-ccx qubits[13],qubits[90],qubits[167];
-h qubits[167];
-h qubits[167];
-ccx qubits[12],qubits[91],qubits[167];
-h qubits[167];
-h qubits[167];
-ccx qubits[11],qubits[92],qubits[167];
-h qubits[167];
-h qubits[167];
-ccx qubits[10],qubits[93],qubits[167];
-h qubits[167];
-h qubits[167];
-ccx qubits[9],qubits[94],qubits[167];
-h qubits[167];
-h qubits[167];
-ccx qubits[8],qubits[95],qubits[167];
-h qubits[167];
-h qubits[167];
-ccx qubits[7],qubits[96],qubits[167];
-h qubits[167];
-h qubits[167];
-ccx qubits[6],qubits[97],qubits[167];
-h qubits[167];
-h qubits[167];
-ccx qubits[5],qubits[98],qubits[167];
-h qubits[167];
-h qubits[167];
-ccx qubits[4],qubits[99],qubits[167];
-h qubits[167];
-h qubits[167];
-ccx qubits[3],qubits[100],qubits[167];
-h qubits[167];
-h qubits[167];
-ccx qubits[2],qubits[101],qubits[167];
-h qubits[167];
-h qubits[167];
-ccx qubits[1],qubits[102],qubits[167];
-h qubits[167];
-h qubits[167];
-ccx qubits[0],qubits[103],qubits[167];
-h qubits[167];
-h qubits[166];
-ccx qubits[38],qubits[64],qubits[166];
-h qubits[166];
-h qubits[166];
-ccx qubits[37],qubits[65],qubits[166];
-h qubits[166];
-h qubits[166];
-ccx qubits[36],qubits[66],qubits[166];
-h qubits[166];
-h qubits[166];
-ccx qubits[35],qubits[67],qubits[166];
-h qubits[166];
-h qubits[166];
-ccx qubits[34],qubits[68],qubits[166];
-h qubits[166];
-h qubits[166];
-ccx qubits[33],qubits[69],qubits[166];
-h qubits[166];
-h qubits[166];
-ccx qubits[32],qubits[70],qubits[166];
-h qubits[166];
-h qubits[166];
-ccx qubits[31],qubits[71],qubits[166];
-h qubits[166];
-h qubits[166];
-ccx qubits[30],qubits[72],qubits[166];
-h qubits[166];
-h qubits[166];
-ccx qubits[29],qubits[73],qubits[166];
-h qubits[166];
-h qubits[166];
-ccx qubits[28],qubits[74],qubits[166];
-h qubits[166];
-h qubits[166];
-ccx qubits[27],qubits[75],qubits[166];
-h qubits[166];
-h qubits[166];
-ccx qubits[26],qubits[76],qubits[166];
-h qubits[166];
-h qubits[166];
-ccx qubits[25],qubits[77],qubits[166];
-h qubits[166];
-h qubits[166];
-ccx qubits[24],qubits[78],qubits[166];
-h qubits[166];
-h qubits[166];
-ccx qubits[23],qubits[79],qubits[166];
-h qubits[166];
-h qubits[166];
-ccx qubits[22],qubits[80],qubits[166];
-h qubits[166];
-h qubits[166];
-ccx qubits[21],qubits[81],qubits[166];
-h qubits[166];
-h qubits[166];
-ccx qubits[20],qubits[82],qubits[166];
-h qubits[166];
-h qubits[166];
-ccx qubits[19],qubits[83],qubits[166];
-h qubits[166];
-h qubits[166];
-ccx qubits[18],qubits[84],qubits[166];
-h qubits[166];
-h qubits[166];
-ccx qubits[17],qubits[85],qubits[166];
-h qubits[166];
-h qubits[166];
-ccx qubits[16],qubits[86],qubits[166];
-h qubits[166];
-h qubits[166];
-ccx qubits[15],qubits[87],qubits[166];
-h qubits[166];
-h qubits[166];
-ccx qubits[14],qubits[88],qubits[166];
-h qubits[166];
-h qubits[166];
-ccx qubits[13],qubits[89],qubits[166];
-h qubits[166];
-h qubits[166];
-ccx qubits[12],qubits[90],qubits[166];
-h qubits[166];
-h qubits[166];
-ccx qubits[11],qubits[91],qubits[166];
-h qubits[166];
-h qubits[166];
-ccx qubits[10],qubits[92],qubits[166];
-h qubits[166];
-h qubits[166];
-ccx qubits[9],qubits[93],qubits[166];
-h qubits[166];
-h qubits[166];
-ccx qubits[8],qubits[94],qubits[166];
-h qubits[166];
-h qubits[166];
-ccx qubits[7],qubits[95],qubits[166];
-h qubits[166];
-h qubits[166];
-ccx qubits[6],qubits[96],qubits[166];
-h qubits[166];
-h qubits[166];
-ccx qubits[5],qubits[97],qubits[166];
-h qubits[166];
-h qubits[166];
-ccx qubits[4],qubits[98],qubits[166];
-h qubits[166];
-h qubits[166];
-ccx qubits[3],qubits[99],qubits[166];
-h qubits[166];
-h qubits[166];
-ccx qubits[2],qubits[100],qubits[166];
-h qubits[166];
-h qubits[166];
-ccx qubits[1],qubits[101],qubits[166];
-h qubits[166];
-h qubits[166];
-ccx qubits[0],qubits[102],qubits[166];
-h qubits[166];
-h qubits[165];
-ccx qubits[37],qubits[64],qubits[165];
-h qubits[165];
-h qubits[165];
-ccx qubits[36],qubits[65],qubits[165];
-h qubits[165];
-h qubits[165];
-ccx qubits[35],qubits[66],qubits[165];
-h qubits[165];
-h qubits[165];
-ccx qubits[34],qubits[67],qubits[165];
-h qubits[165];
-h qubits[165];
-ccx qubits[33],qubits[68],qubits[165];
-h qubits[165];
-h qubits[165];
-ccx qubits[32],qubits[69],qubits[165];
-h qubits[165];
-h qubits[165];
-ccx qubits[31],qubits[70],qubits[165];
-h qubits[165];
-h qubits[165];
-ccx qubits[30],qubits[71],qubits[165];
-h qubits[165];
-h qubits[165];
-ccx qubits[29],qubits[72],qubits[165];
-h qubits[165];
-h qubits[165];
-ccx qubits[28],qubits[73],qubits[165];
-h qubits[165];
-h qubits[165];
-ccx qubits[27],qubits[74],qubits[165];
-h qubits[165];
-h qubits[165];
-ccx qubits[26],qubits[75],qubits[165];
-h qubits[165];
-h qubits[165];
-ccx qubits[25],qubits[76],qubits[165];
-h qubits[165];
-h qubits[165];
-ccx qubits[24],qubits[77],qubits[165];
-h qubits[165];
-h qubits[165];
-ccx qubits[23],qubits[78],qubits[165];
-h qubits[165];
-h qubits[165];
-ccx qubits[22],qubits[79],qubits[165];
-h qubits[165];
-h qubits[165];
-ccx qubits[21],qubits[80],qubits[165];
-h qubits[165];
-h qubits[165];
-ccx qubits[20],qubits[81],qubits[165];
-h qubits[165];
-h qubits[165];
-ccx qubits[19],qubits[82],qubits[165];
-h qubits[165];
-h qubits[165];
-ccx qubits[18],qubits[83],qubits[165];
-h qubits[165];
-h qubits[165];
-ccx qubits[17],qubits[84],qubits[165];
-h qubits[165];
-h qubits[165];
-ccx qubits[16],qubits[85],qubits[165];
-h qubits[165];
-h qubits[165];
-ccx qubits[15],qubits[86],qubits[165];
-h qubits[165];
-h qubits[165];
-ccx qubits[14],qubits[87],qubits[165];
-h qubits[165];
-h qubits[165];
-ccx qubits[13],qubits[88],qubits[165];
-h qubits[165];
-h qubits[165];
-ccx qubits[12],qubits[89],qubits[165];
-h qubits[165];
-h qubits[165];
-ccx qubits[11],qubits[90],qubits[165];
-h qubits[165];
-h qubits[165];
-ccx qubits[10],qubits[91],qubits[165];
-h qubits[165];
-h qubits[165];
-ccx qubits[9],qubits[92],qubits[165];
-h qubits[165];
-h qubits[165];
-ccx qubits[8],qubits[93],qubits[165];
-h qubits[165];
-h qubits[165];
-ccx qubits[7],qubits[94],qubits[165];
-h qubits[165];
-h qubits[165];
-ccx qubits[6],qubits[95],qubits[165];
-h qubits[165];
-h qubits[165];
-ccx qubits[5],qubits[96],qubits[165];
-h qubits[165];
-h qubits[165];
-ccx qubits[4],qubits[97],qubits[165];
-h qubits[165];
-h qubits[165];
-ccx qubits[3],qubits[98],qubits[165];
-h qubits[165];
-h qubits[165];
-ccx qubits[2],qubits[99],qubits[165];
-h qubits[165];
-h qubits[165];
-ccx qubits[1],qubits[100],qubits[165];
-h qubits[165];
-h qubits[165];
-ccx qubits[0],qubits[101],qubits[165];
-h qubits[165];
-h qubits[164];
-ccx qubits[36],qubits[64],qubits[164];
-h qubits[164];
-h qubits[164];
-ccx qubits[35],qubits[65],qubits[164];
-h qubits[164];
-h qubits[164];
-ccx qubits[34],qubits[66],qubits[164];
-h qubits[164];
-h qubits[164];
-ccx qubits[33],qubits[67],qubits[164];
-h qubits[164];
-h qubits[164];
-ccx qubits[32],qubits[68],qubits[164];
-h qubits[164];
-h qubits[164];
-ccx qubits[31],qubits[69],qubits[164];
-h qubits[164];
-h qubits[164];
-ccx qubits[30],qubits[70],qubits[164];
-h qubits[164];
-h qubits[164];
-ccx qubits[29],qubits[71],qubits[164];
-h qubits[164];
-h qubits[164];
-ccx qubits[28],qubits[72],qubits[164];
-h qubits[164];
-h qubits[164];
-ccx qubits[27],qubits[73],qubits[164];
-h qubits[164];
-h qubits[164];
-ccx qubits[26],qubits[74],qubits[164];
-h qubits[164];
-h qubits[164];
-ccx qubits[25],qubits[75],qubits[164];
-h qubits[164];
-h qubits[164];
-ccx qubits[24],qubits[76],qubits[164];
-h qubits[164];
-h qubits[164];
-ccx qubits[23],qubits[77],qubits[164];
-h qubits[164];
-h qubits[164];
-ccx qubits[22],qubits[78],qubits[164];
-h qubits[164];
-h qubits[164];
-ccx qubits[21],qubits[79],qubits[164];
-h qubits[164];
-h qubits[164];
-ccx qubits[20],qubits[80],qubits[164];
-h qubits[164];
-h qubits[164];
-ccx qubits[19],qubits[81],qubits[164];
-h qubits[164];
-h qubits[164];
-ccx qubits[18],qubits[82],qubits[164];
-h qubits[164];
-h qubits[164];
-ccx qubits[17],qubits[83],qubits[164];
-h qubits[164];
-h qubits[164];
-ccx qubits[16],qubits[84],qubits[164];
-h qubits[164];
-h qubits[164];
-ccx qubits[15],qubits[85],qubits[164];
-h qubits[164];
-h qubits[164];
-ccx qubits[14],qubits[86],qubits[164];
-h qubits[164];
-h qubits[164];
-ccx qubits[13],qubits[87],qubits[164];
-h qubits[164];
-h qubits[164];
-ccx qubits[12],qubits[88],qubits[164];
-h qubits[164];
-h qubits[164];
-ccx qubits[11],qubits[89],qubits[164];
-h qubits[164];
-h qubits[164];
-ccx qubits[10],qubits[90],qubits[164];
-h qubits[164];
-h qubits[164];
-ccx qubits[9],qubits[91],qubits[164];
-h qubits[164];
-h qubits[164];
-ccx qubits[8],qubits[92],qubits[164];
-h qubits[164];
-h qubits[164];
-ccx qubits[7],qubits[93],qubits[164];
-h qubits[164];
-h qubits[164];
-ccx qubits[6],qubits[94],qubits[164];
-h qubits[164];
-h qubits[164];
-ccx qubits[5],qubits[95],qubits[164];
-h qubits[164];
-h qubits[164];
-ccx qubits[4],qubits[96],qubits[164];
-h qubits[164];
-h qubits[164];
-ccx qubits[3],qubits[97],qubits[164];
-h qubits[164];
-h qubits[164];
-ccx qubits[2],qubits[98],qubits[164];
-h qubits[164];
-h qubits[164];
-ccx qubits[1],qubits[99],qubits[164];
-h qubits[164];
-h qubits[164];
-ccx qubits[0],qubits[100],qubits[164];
-h qubits[164];
-h qubits[163];
-ccx qubits[35],qubits[64],qubits[163];
-h qubits[163];
-h qubits[163];
-ccx qubits[34],qubits[65],qubits[163];
-h qubits[163];
-h qubits[163];
-ccx qubits[33],qubits[66],qubits[163];
-h qubits[163];
-h qubits[163];
-ccx qubits[32],qubits[67],qubits[163];
-h qubits[163];
-h qubits[163];
-ccx qubits[31],qubits[68],qubits[163];
-h qubits[163];
-h qubits[163];
-ccx qubits[30],qubits[69],qubits[163];
-h qubits[163];
-h qubits[163];
-ccx qubits[29],qubits[70],qubits[163];
-h qubits[163];
-h qubits[163];
-ccx qubits[28],qubits[71],qubits[163];
-h qubits[163];
-h qubits[163];
-ccx qubits[27],qubits[72],qubits[163];
-h qubits[163];
-h qubits[163];
-ccx qubits[26],qubits[73],qubits[163];
-h qubits[163];
-h qubits[163];
-ccx qubits[25],qubits[74],qubits[163];
-h qubits[163];
-h qubits[163];
-ccx qubits[24],qubits[75],qubits[163];
-h qubits[163];
-h qubits[163];
-ccx qubits[23],qubits[76],qubits[163];
-h qubits[163];
-h qubits[163];
-ccx qubits[22],qubits[77],qubits[163];
-h qubits[163];
-h qubits[163];
-ccx qubits[21],qubits[78],qubits[163];
-h qubits[163];
-h qubits[163];
-ccx qubits[20],qubits[79],qubits[163];
-h qubits[163];
-h qubits[163];
-ccx qubits[19],qubits[80],qubits[163];
-h qubits[163];
-h qubits[163];
-ccx qubits[18],qubits[81],qubits[163];
-h qubits[163];
-h qubits[163];
-ccx qubits[17],qubits[82],qubits[163];
-h qubits[163];
-h qubits[163];
-ccx qubits[16],qubits[83],qubits[163];
-h qubits[163];
-h qubits[163];
-ccx qubits[15],qubits[84],qubits[163];
-h qubits[163];
-h qubits[163];
-ccx qubits[14],qubits[85],qubits[163];
-h qubits[163];
-h qubits[163];
-ccx qubits[13],qubits[86],qubits[163];
-h qubits[163];
-h qubits[163];
-ccx qubits[12],qubits[87],qubits[163];
-h qubits[163];
-h qubits[163];
-ccx qubits[11],qubits[88],qubits[163];
-h qubits[163];
-h qubits[163];
-ccx qubits[10],qubits[89],qubits[163];
-h qubits[163];
-h qubits[163];
-ccx qubits[9],qubits[90],qubits[163];
-h qubits[163];
-h qubits[163];
-ccx qubits[8],qubits[91],qubits[163];
-h qubits[163];
-h qubits[163];
-ccx qubits[7],qubits[92],qubits[163];
-h qubits[163];
-h qubits[163];
-ccx qubits[6],qubits[93],qubits[163];
-h qubits[163];
-h qubits[163];
-ccx qubits[5],qubits[94],qubits[163];
-h qubits[163];
-h qubits[163];
-ccx qubits[4],qubits[95],qubits[163];
-h qubits[163];
-h qubits[163];
-ccx qubits[3],qubits[96],qubits[163];
-h qubits[163];
-h qubits[163];
-ccx qubits[2],qubits[97],qubits[163];
-h qubits[163];
-h qubits[163];
-ccx qubits[1],qubits[98],qubits[163];
-h qubits[163];
-h qubits[163];
-ccx qubits[0],qubits[99],qubits[163];
-h qubits[163];
-h qubits[162];
-ccx qubits[34],qubits[64],qubits[162];
-h qubits[162];
-h qubits[162];
-ccx qubits[33],qubits[65],qubits[162];
-h qubits[162];
-h qubits[162];
-ccx qubits[32],qubits[66],qubits[162];
-h qubits[162];
-h qubits[162];
-ccx qubits[31],qubits[67],qubits[162];
-h qubits[162];
-h qubits[162];
-ccx qubits[30],qubits[68],qubits[162];
-h qubits[162];
-h qubits[162];
-ccx qubits[29],qubits[69],qubits[162];
-h qubits[162];
-h qubits[162];
-ccx qubits[28],qubits[70],qubits[162];
-h qubits[162];
-h qubits[162];
-ccx qubits[27],qubits[71],qubits[162];
-h qubits[162];
-h qubits[162];
-ccx qubits[26],qubits[72],qubits[162];
-h qubits[162];
-h qubits[162];
-ccx qubits[25],qubits[73],qubits[162];
-h qubits[162];
-h qubits[162];
-ccx qubits[24],qubits[74],qubits[162];
-h qubits[162];
-h qubits[162];
-ccx qubits[23],qubits[75],qubits[162];
-h qubits[162];
-h qubits[162];
-ccx qubits[22],qubits[76],qubits[162];
-h qubits[162];
-h qubits[162];
-ccx qubits[21],qubits[77],qubits[162];
-h qubits[162];
-h qubits[162];
-ccx qubits[20],qubits[78],qubits[162];
-h qubits[162];
-h qubits[162];
-ccx qubits[19],qubits[79],qubits[162];
-h qubits[162];
-h qubits[162];
-ccx qubits[18],qubits[80],qubits[162];
-h qubits[162];
-h qubits[162];
-ccx qubits[17],qubits[81],qubits[162];
-h qubits[162];
-h qubits[162];
-ccx qubits[16],qubits[82],qubits[162];
-h qubits[162];
-h qubits[162];
-ccx qubits[15],qubits[83],qubits[162];
-h qubits[162];
-h qubits[162];
-ccx qubits[14],qubits[84],qubits[162];
-h qubits[162];
-h qubits[162];
-ccx qubits[13],qubits[85],qubits[162];
-h qubits[162];
-h qubits[162];
-ccx qubits[12],qubits[86],qubits[162];
-h qubits[162];
-h qubits[162];
-ccx qubits[11],qubits[87],qubits[162];
-h qubits[162];
-h qubits[162];
-ccx qubits[10],qubits[88],qubits[162];
-h qubits[162];
-h qubits[162];
-ccx qubits[9],qubits[89],qubits[162];
-h qubits[162];
-h qubits[162];
-ccx qubits[8],qubits[90],qubits[162];
-h qubits[162];
-h qubits[162];
-ccx qubits[7],qubits[91],qubits[162];
-h qubits[162];
-h qubits[162];
-ccx qubits[6],qubits[92],qubits[162];
-h qubits[162];
-h qubits[162];
-ccx qubits[5],qubits[93],qubits[162];
-h qubits[162];
-h qubits[162];
-ccx qubits[4],qubits[94],qubits[162];
-h qubits[162];
-h qubits[162];
-ccx qubits[3],qubits[95],qubits[162];
-h qubits[162];
-h qubits[162];
-ccx qubits[2],qubits[96],qubits[162];
-h qubits[162];
-h qubits[162];
-ccx qubits[1],qubits[97],qubits[162];
-h qubits[162];
-h qubits[162];
-ccx qubits[0],qubits[98],qubits[162];
-h qubits[162];
-h qubits[161];
-ccx qubits[33],qubits[64],qubits[161];
-h qubits[161];
-h qubits[161];
-ccx qubits[32],qubits[65],qubits[161];
-h qubits[161];
-h qubits[161];
-ccx qubits[31],qubits[66],qubits[161];
-h qubits[161];
-h qubits[161];
-ccx qubits[30],qubits[67],qubits[161];
-h qubits[161];
-h qubits[161];
-ccx qubits[29],qubits[68],qubits[161];
-h qubits[161];
-h qubits[161];
-ccx qubits[28],qubits[69],qubits[161];
-h qubits[161];
-h qubits[161];
-ccx qubits[27],qubits[70],qubits[161];
-h qubits[161];
-h qubits[161];
-ccx qubits[26],qubits[71],qubits[161];
-h qubits[161];
-h qubits[161];
-ccx qubits[25],qubits[72],qubits[161];
-h qubits[161];
-h qubits[161];
-ccx qubits[24],qubits[73],qubits[161];
-h qubits[161];
-h qubits[161];
-ccx qubits[23],qubits[74],qubits[161];
-h qubits[161];
-h qubits[161];
-ccx qubits[22],qubits[75],qubits[161];
-h qubits[161];
-h qubits[161];
-ccx qubits[21],qubits[76],qubits[161];
-h qubits[161];
-h qubits[161];
-ccx qubits[20],qubits[77],qubits[161];
-h qubits[161];
-h qubits[161];
-ccx qubits[19],qubits[78],qubits[161];
-h qubits[161];
-h qubits[161];
-ccx qubits[18],qubits[79],qubits[161];
-h qubits[161];
-h qubits[161];
-ccx qubits[17],qubits[80],qubits[161];
-h qubits[161];
-h qubits[161];
-ccx qubits[16],qubits[81],qubits[161];
-h qubits[161];
-h qubits[161];
-ccx qubits[15],qubits[82],qubits[161];
-h qubits[161];
-h qubits[161];
-ccx qubits[14],qubits[83],qubits[161];
-h qubits[161];
-h qubits[161];
-ccx qubits[13],qubits[84],qubits[161];
-h qubits[161];
-h qubits[161];
-ccx qubits[12],qubits[85],qubits[161];
-h qubits[161];
-h qubits[161];
-ccx qubits[11],qubits[86],qubits[161];
-h qubits[161];
-h qubits[161];
-ccx qubits[10],qubits[87],qubits[161];
-h qubits[161];
-h qubits[161];
-ccx qubits[9],qubits[88],qubits[161];
-h qubits[161];
-h qubits[161];
-ccx qubits[8],qubits[89],qubits[161];
-h qubits[161];
-h qubits[161];
-ccx qubits[7],qubits[90],qubits[161];
-h qubits[161];
-h qubits[161];
-ccx qubits[6],qubits[91],qubits[161];
-h qubits[161];
-h qubits[161];
-ccx qubits[5],qubits[92],qubits[161];
-h qubits[161];
-h qubits[161];
-ccx qubits[4],qubits[93],qubits[161];
-h qubits[161];
-h qubits[161];
-ccx qubits[3],qubits[94],qubits[161];
-h qubits[161];
-h qubits[161];
-ccx qubits[2],qubits[95],qubits[161];
-h qubits[161];
-h qubits[161];
-ccx qubits[1],qubits[96],qubits[161];
-h qubits[161];
-h qubits[161];
-ccx qubits[0],qubits[97],qubits[161];
-h qubits[161];
-h qubits[160];
-ccx qubits[32],qubits[64],qubits[160];
-h qubits[160];
-h qubits[160];
-ccx qubits[31],qubits[65],qubits[160];
-h qubits[160];
-h qubits[160];
-ccx qubits[30],qubits[66],qubits[160];
-h qubits[160];
-h qubits[160];
-ccx qubits[29],qubits[67],qubits[160];
-h qubits[160];
-h qubits[160];
-ccx qubits[28],qubits[68],qubits[160];
-h qubits[160];
-h qubits[160];
-ccx qubits[27],qubits[69],qubits[160];
-h qubits[160];
-h qubits[160];
-ccx qubits[26],qubits[70],qubits[160];
-h qubits[160];
-h qubits[160];
-ccx qubits[25],qubits[71],qubits[160];
-h qubits[160];
-h qubits[160];
-ccx qubits[24],qubits[72],qubits[160];
-h qubits[160];
-h qubits[160];
-ccx qubits[23],qubits[73],qubits[160];
-h qubits[160];
-h qubits[160];
-ccx qubits[22],qubits[74],qubits[160];
-h qubits[160];
-h qubits[160];
-ccx qubits[21],qubits[75],qubits[160];
-h qubits[160];
-h qubits[160];
-ccx qubits[20],qubits[76],qubits[160];
-h qubits[160];
-h qubits[160];
-ccx qubits[19],qubits[77],qubits[160];
-h qubits[160];
-h qubits[160];
-ccx qubits[18],qubits[78],qubits[160];
-h qubits[160];
-h qubits[160];
-ccx qubits[17],qubits[79],qubits[160];
-h qubits[160];
-h qubits[160];
-ccx qubits[16],qubits[80],qubits[160];
-h qubits[160];
-h qubits[160];
-ccx qubits[15],qubits[81],qubits[160];
-h qubits[160];
-h qubits[160];
-ccx qubits[14],qubits[82],qubits[160];
-h qubits[160];
-h qubits[160];
-ccx qubits[13],qubits[83],qubits[160];
-h qubits[160];
-h qubits[160];
-ccx qubits[12],qubits[84],qubits[160];
-h qubits[160];
-h qubits[160];
-ccx qubits[11],qubits[85],qubits[160];
-h qubits[160];
-h qubits[160];
-ccx qubits[10],qubits[86],qubits[160];
-h qubits[160];
-h qubits[160];
-ccx qubits[9],qubits[87],qubits[160];
-h qubits[160];
-h qubits[160];
-ccx qubits[8],qubits[88],qubits[160];
-h qubits[160];
-h qubits[160];
-ccx qubits[7],qubits[89],qubits[160];
-h qubits[160];
-h qubits[160];
-ccx qubits[6],qubits[90],qubits[160];
-h qubits[160];
-h qubits[160];
-ccx qubits[5],qubits[91],qubits[160];
-h qubits[160];
-h qubits[160];
-ccx qubits[4],qubits[92],qubits[160];
-h qubits[160];
-h qubits[160];
-ccx qubits[3],qubits[93],qubits[160];
-h qubits[160];
-h qubits[160];
-ccx qubits[2],qubits[94],qubits[160];
-h qubits[160];
-h qubits[160];
-ccx qubits[1],qubits[95],qubits[160];
-h qubits[160];
-h qubits[160];
-ccx qubits[0],qubits[96],qubits[160];
-h qubits[160];
-h qubits[159];
-ccx qubits[31],qubits[64],qubits[159];
-h qubits[159];
-h qubits[159];
-ccx qubits[30],qubits[65],qubits[159];
-h qubits[159];
-h qubits[159];
-ccx qubits[29],qubits[66],qubits[159];
-h qubits[159];
-h qubits[159];
-ccx qubits[28],qubits[67],qubits[159];
-h qubits[159];
-h qubits[159];
-ccx qubits[27],qubits[68],qubits[159];
-h qubits[159];
-h qubits[159];
-ccx qubits[26],qubits[69],qubits[159];
-h qubits[159];
-h qubits[159];
-ccx qubits[25],qubits[70],qubits[159];
-h qubits[159];
-h qubits[159];
-ccx qubits[24],qubits[71],qubits[159];
-h qubits[159];
-h qubits[159];
-ccx qubits[23],qubits[72],qubits[159];
-h qubits[159];
-h qubits[159];
-ccx qubits[22],qubits[73],qubits[159];
-h qubits[159];
-h qubits[159];
-ccx qubits[21],qubits[74],qubits[159];
-h qubits[159];
-h qubits[159];
-ccx qubits[20],qubits[75],qubits[159];
-h qubits[159];
-h qubits[159];
-ccx qubits[19],qubits[76],qubits[159];
-h qubits[159];
-h qubits[159];
-ccx qubits[18],qubits[77],qubits[159];
-h qubits[159];
-h qubits[159];
-ccx qubits[17],qubits[78],qubits[159];
-h qubits[159];
-h qubits[159];
-ccx qubits[16],qubits[79],qubits[159];
-h qubits[159];
-h qubits[159];
-ccx qubits[15],qubits[80],qubits[159];
-h qubits[159];
-h qubits[159];
-ccx qubits[14],qubits[81],qubits[159];
-h qubits[159];
-h qubits[159];
-ccx qubits[13],qubits[82],qubits[159];
-h qubits[159];
-h qubits[159];
-ccx qubits[12],qubits[83],qubits[159];
-h qubits[159];
-h qubits[159];
-ccx qubits[11],qubits[84],qubits[159];
-h qubits[159];
-h qubits[159];
-ccx qubits[10],qubits[85],qubits[159];
-h qubits[159];
-h qubits[159];
-ccx qubits[9],qubits[86],qubits[159];
-h qubits[159];
-h qubits[159];
-ccx qubits[8],qubits[87],qubits[159];
-h qubits[159];
-h qubits[159];
-ccx qubits[7],qubits[88],qubits[159];
-h qubits[159];
-h qubits[159];
-ccx qubits[6],qubits[89],qubits[159];
-h qubits[159];
-h qubits[159];
-ccx qubits[5],qubits[90],qubits[159];
-h qubits[159];
-h qubits[159];
-ccx qubits[4],qubits[91],qubits[159];
-h qubits[159];
-h qubits[159];
-ccx qubits[3],qubits[92],qubits[159];
-h qubits[159];
-h qubits[159];
-ccx qubits[2],qubits[93],qubits[159];
-h qubits[159];
-h qubits[159];
-ccx qubits[1],qubits[94],qubits[159];
-h qubits[159];
-h qubits[159];
-ccx qubits[0],qubits[95],qubits[159];
-h qubits[159];
-h qubits[158];
-ccx qubits[30],qubits[64],qubits[158];
-h qubits[158];
-h qubits[158];
-ccx qubits[29],qubits[65],qubits[158];
-h qubits[158];
-h qubits[158];
-ccx qubits[28],qubits[66],qubits[158];
-h qubits[158];
-h qubits[158];
-ccx qubits[27],qubits[67],qubits[158];
-h qubits[158];
-h qubits[158];
-ccx qubits[26],qubits[68],qubits[158];
-h qubits[158];
-h qubits[158];
-ccx qubits[25],qubits[69],qubits[158];
-h qubits[158];
-h qubits[158];
-ccx qubits[24],qubits[70],qubits[158];
-h qubits[158];
-h qubits[158];
-ccx qubits[23],qubits[71],qubits[158];
-h qubits[158];
-h qubits[158];
-ccx qubits[22],qubits[72],qubits[158];
-h qubits[158];
-h qubits[158];
-ccx qubits[21],qubits[73],qubits[158];
-h qubits[158];
-h qubits[158];
-ccx qubits[20],qubits[74],qubits[158];
-h qubits[158];
-h qubits[158];
-ccx qubits[19],qubits[75],qubits[158];
-h qubits[158];
-h qubits[158];
-ccx qubits[18],qubits[76],qubits[158];
-h qubits[158];
-h qubits[158];
-ccx qubits[17],qubits[77],qubits[158];
-h qubits[158];
-h qubits[158];
-ccx qubits[16],qubits[78],qubits[158];
-h qubits[158];
-h qubits[158];
-ccx qubits[15],qubits[79],qubits[158];
-h qubits[158];
-h qubits[158];
-ccx qubits[14],qubits[80],qubits[158];
-h qubits[158];
-h qubits[158];
-ccx qubits[13],qubits[81],qubits[158];
-h qubits[158];
-h qubits[158];
-ccx qubits[12],qubits[82],qubits[158];
-h qubits[158];
-h qubits[158];
-ccx qubits[11],qubits[83],qubits[158];
-h qubits[158];
-h qubits[158];
-ccx qubits[10],qubits[84],qubits[158];
-h qubits[158];
-h qubits[158];
-ccx qubits[9],qubits[85],qubits[158];
-h qubits[158];
-h qubits[158];
-ccx qubits[8],qubits[86],qubits[158];
-h qubits[158];
-h qubits[158];
-ccx qubits[7],qubits[87],qubits[158];
-h qubits[158];
-h qubits[158];
-ccx qubits[6],qubits[88],qubits[158];
-h qubits[158];
-h qubits[158];
-ccx qubits[5],qubits[89],qubits[158];
-h qubits[158];
-h qubits[158];
-ccx qubits[4],qubits[90],qubits[158];
-h qubits[158];
-h qubits[158];
-ccx qubits[3],qubits[91],qubits[158];
-h qubits[158];
-h qubits[158];
-ccx qubits[2],qubits[92],qubits[158];
-h qubits[158];
-h qubits[158];
-ccx qubits[1],qubits[93],qubits[158];
-h qubits[158];
-h qubits[158];
-ccx qubits[0],qubits[94],qubits[158];
-h qubits[158];
-h qubits[157];
-ccx qubits[29],qubits[64],qubits[157];
-h qubits[157];
-h qubits[157];
-ccx qubits[28],qubits[65],qubits[157];
-h qubits[157];
-h qubits[157];
-ccx qubits[27],qubits[66],qubits[157];
-h qubits[157];
-h qubits[157];
-ccx qubits[26],qubits[67],qubits[157];
-h qubits[157];
-h qubits[157];
-ccx qubits[25],qubits[68],qubits[157];
-h qubits[157];
-h qubits[157];
-ccx qubits[24],qubits[69],qubits[157];
-h qubits[157];
-h qubits[157];
-ccx qubits[23],qubits[70],qubits[157];
-h qubits[157];
-h qubits[157];
-ccx qubits[22],qubits[71],qubits[157];
-h qubits[157];
-h qubits[157];
-ccx qubits[21],qubits[72],qubits[157];
-h qubits[157];
-h qubits[157];
-ccx qubits[20],qubits[73],qubits[157];
-h qubits[157];
-h qubits[157];
-ccx qubits[19],qubits[74],qubits[157];
-h qubits[157];
-h qubits[157];
-ccx qubits[18],qubits[75],qubits[157];
-h qubits[157];
-h qubits[157];
-ccx qubits[17],qubits[76],qubits[157];
-h qubits[157];
-h qubits[157];
-ccx qubits[16],qubits[77],qubits[157];
-h qubits[157];
-h qubits[157];
-ccx qubits[15],qubits[78],qubits[157];
-h qubits[157];
-h qubits[157];
-ccx qubits[14],qubits[79],qubits[157];
-h qubits[157];
-h qubits[157];
-ccx qubits[13],qubits[80],qubits[157];
-h qubits[157];
-h qubits[157];
-ccx qubits[12],qubits[81],qubits[157];
-h qubits[157];
-h qubits[157];
-ccx qubits[11],qubits[82],qubits[157];
-h qubits[157];
-h qubits[157];
-ccx qubits[10],qubits[83],qubits[157];
-h qubits[157];
-h qubits[157];
-ccx qubits[9],qubits[84],qubits[157];
-h qubits[157];
-h qubits[157];
-ccx qubits[8],qubits[85],qubits[157];
-h qubits[157];
-h qubits[157];
-ccx qubits[7],qubits[86],qubits[157];
-h qubits[157];
-h qubits[157];
-ccx qubits[6],qubits[87],qubits[157];
-h qubits[157];
-h qubits[157];
-ccx qubits[5],qubits[88],qubits[157];
-h qubits[157];
-h qubits[157];
-ccx qubits[4],qubits[89],qubits[157];
-h qubits[157];
-h qubits[157];
-ccx qubits[3],qubits[90],qubits[157];
-h qubits[157];
-h qubits[157];
-ccx qubits[2],qubits[91],qubits[157];
-h qubits[157];
-h qubits[157];
-ccx qubits[1],qubits[92],qubits[157];
-h qubits[157];
-h qubits[157];
-ccx qubits[0],qubits[93],qubits[157];
-h qubits[157];
-h qubits[156];
-ccx qubits[28],qubits[64],qubits[156];
-h qubits[156];
-h qubits[156];
-ccx qubits[27],qubits[65],qubits[156];
-h qubits[156];
-h qubits[156];
-ccx qubits[26],qubits[66],qubits[156];
-h qubits[156];
-h qubits[156];
-ccx qubits[25],qubits[67],qubits[156];
-h qubits[156];
-h qubits[156];
-ccx qubits[24],qubits[68],qubits[156];
-h qubits[156];
-h qubits[156];
-ccx qubits[23],qubits[69],qubits[156];
-h qubits[156];
-h qubits[156];
-ccx qubits[22],qubits[70],qubits[156];
-h qubits[156];
-h qubits[156];
-ccx qubits[21],qubits[71],qubits[156];
-h qubits[156];
-h qubits[156];
-ccx qubits[20],qubits[72],qubits[156];
-h qubits[156];
-h qubits[156];
-ccx qubits[19],qubits[73],qubits[156];
-h qubits[156];
-h qubits[156];
-ccx qubits[18],qubits[74],qubits[156];
-h qubits[156];
-h qubits[156];
-ccx qubits[17],qubits[75],qubits[156];
-h qubits[156];
-h qubits[156];
-ccx qubits[16],qubits[76],qubits[156];
-h qubits[156];
-h qubits[156];
-ccx qubits[15],qubits[77],qubits[156];
-h qubits[156];
-h qubits[156];
-ccx qubits[14],qubits[78],qubits[156];
-h qubits[156];
-h qubits[156];
-ccx qubits[13],qubits[79],qubits[156];
-h qubits[156];
-h qubits[156];
-ccx qubits[12],qubits[80],qubits[156];
-h qubits[156];
-h qubits[156];
-ccx qubits[11],qubits[81],qubits[156];
-h qubits[156];
-h qubits[156];
-ccx qubits[10],qubits[82],qubits[156];
-h qubits[156];
-h qubits[156];
-ccx qubits[9],qubits[83],qubits[156];
-h qubits[156];
-h qubits[156];
-ccx qubits[8],qubits[84],qubits[156];
-h qubits[156];
-h qubits[156];
-ccx qubits[7],qubits[85],qubits[156];
-h qubits[156];
-h qubits[156];
-ccx qubits[6],qubits[86],qubits[156];
-h qubits[156];
-h qubits[156];
-ccx qubits[5],qubits[87],qubits[156];
-h qubits[156];
-h qubits[156];
-ccx qubits[4],qubits[88],qubits[156];
-h qubits[156];
-h qubits[156];
-ccx qubits[3],qubits[89],qubits[156];
-h qubits[156];
-h qubits[156];
-ccx qubits[2],qubits[90],qubits[156];
-h qubits[156];
-h qubits[156];
-ccx qubits[1],qubits[91],qubits[156];
-h qubits[156];
-h qubits[156];
-ccx qubits[0],qubits[92],qubits[156];
-h qubits[156];
-h qubits[155];
-ccx qubits[27],qubits[64],qubits[155];
-h qubits[155];
-h qubits[155];
-ccx qubits[26],qubits[65],qubits[155];
-h qubits[155];
-h qubits[155];
-ccx qubits[25],qubits[66],qubits[155];
-h qubits[155];
-h qubits[155];
-ccx qubits[24],qubits[67],qubits[155];
-h qubits[155];
-h qubits[155];
-ccx qubits[23],qubits[68],qubits[155];
-h qubits[155];
-h qubits[155];
-ccx qubits[22],qubits[69],qubits[155];
-h qubits[155];
-h qubits[155];
-ccx qubits[21],qubits[70],qubits[155];
-h qubits[155];
-h qubits[155];
-ccx qubits[20],qubits[71],qubits[155];
-h qubits[155];
-h qubits[155];
-ccx qubits[19],qubits[72],qubits[155];
-h qubits[155];
-h qubits[155];
-ccx qubits[18],qubits[73],qubits[155];
-h qubits[155];
-h qubits[155];
-ccx qubits[17],qubits[74],qubits[155];
-h qubits[155];
-h qubits[155];
-ccx qubits[16],qubits[75],qubits[155];
-h qubits[155];
-h qubits[155];
-ccx qubits[15],qubits[76],qubits[155];
-h qubits[155];
-h qubits[155];
-ccx qubits[14],qubits[77],qubits[155];
-h qubits[155];
-h qubits[155];
-ccx qubits[13],qubits[78],qubits[155];
-h qubits[155];
-h qubits[155];
-ccx qubits[12],qubits[79],qubits[155];
-h qubits[155];
-h qubits[155];
-ccx qubits[11],qubits[80],qubits[155];
-h qubits[155];
-h qubits[155];
-ccx qubits[10],qubits[81],qubits[155];
-h qubits[155];
-h qubits[155];
-ccx qubits[9],qubits[82],qubits[155];
-h qubits[155];
-h qubits[155];
-ccx qubits[8],qubits[83],qubits[155];
-h qubits[155];
-h qubits[155];
-ccx qubits[7],qubits[84],qubits[155];
-h qubits[155];
-h qubits[155];
-ccx qubits[6],qubits[85],qubits[155];
-h qubits[155];
-h qubits[155];
-ccx qubits[5],qubits[86],qubits[155];
-h qubits[155];
-h qubits[155];
-ccx qubits[4],qubits[87],qubits[155];
-h qubits[155];
-h qubits[155];
-ccx qubits[3],qubits[88],qubits[155];
-h qubits[155];
-h qubits[155];
-ccx qubits[2],qubits[89],qubits[155];
-h qubits[155];
-h qubits[155];
-ccx qubits[1],qubits[90],qubits[155];
-h qubits[155];
-h qubits[155];
-ccx qubits[0],qubits[91],qubits[155];
-h qubits[155];
-h qubits[154];
-ccx qubits[26],qubits[64],qubits[154];
-h qubits[154];
-h qubits[154];
-ccx qubits[25],qubits[65],qubits[154];
-h qubits[154];
-h qubits[154];
-ccx qubits[24],qubits[66],qubits[154];
-h qubits[154];
-h qubits[154];
-ccx qubits[23],qubits[67],qubits[154];
-h qubits[154];
-h qubits[154];
-ccx qubits[22],qubits[68],qubits[154];
-h qubits[154];
-h qubits[154];
-ccx qubits[21],qubits[69],qubits[154];
-h qubits[154];
-h qubits[154];
-ccx qubits[20],qubits[70],qubits[154];
-h qubits[154];
-h qubits[154];
-ccx qubits[19],qubits[71],qubits[154];
-h qubits[154];
-h qubits[154];
-ccx qubits[18],qubits[72],qubits[154];
-h qubits[154];
-h qubits[154];
-ccx qubits[17],qubits[73],qubits[154];
-h qubits[154];
-h qubits[154];
-ccx qubits[16],qubits[74],qubits[154];
-h qubits[154];
-h qubits[154];
-ccx qubits[15],qubits[75],qubits[154];
-h qubits[154];
-h qubits[154];
-ccx qubits[14],qubits[76],qubits[154];
-h qubits[154];
-h qubits[154];
-ccx qubits[13],qubits[77],qubits[154];
-h qubits[154];
-h qubits[154];
-ccx qubits[12],qubits[78],qubits[154];
-h qubits[154];
-h qubits[154];
-ccx qubits[11],qubits[79],qubits[154];
-h qubits[154];
-h qubits[154];
-ccx qubits[10],qubits[80],qubits[154];
-h qubits[154];
-h qubits[154];
-ccx qubits[9],qubits[81],qubits[154];
-h qubits[154];
-h qubits[154];
-ccx qubits[8],qubits[82],qubits[154];
-h qubits[154];
-h qubits[154];
-ccx qubits[7],qubits[83],qubits[154];
-h qubits[154];
-h qubits[154];
-ccx qubits[6],qubits[84],qubits[154];
-h qubits[154];
-h qubits[154];
-ccx qubits[5],qubits[85],qubits[154];
-h qubits[154];
-h qubits[154];
-ccx qubits[4],qubits[86],qubits[154];
-h qubits[154];
-h qubits[154];
-ccx qubits[3],qubits[87],qubits[154];
-h qubits[154];
-h qubits[154];
-ccx qubits[2],qubits[88],qubits[154];
-h qubits[154];
-h qubits[154];
-ccx qubits[1],qubits[89],qubits[154];
-h qubits[154];
-h qubits[154];
-ccx qubits[0],qubits[90],qubits[154];
-h qubits[154];
-h qubits[153];
-ccx qubits[25],qubits[64],qubits[153];
-h qubits[153];
-h qubits[153];
-ccx qubits[24],qubits[65],qubits[153];
-h qubits[153];
-h qubits[153];
-ccx qubits[23],qubits[66],qubits[153];
-h qubits[153];
-h qubits[153];
-ccx qubits[22],qubits[67],qubits[153];
-h qubits[153];
-h qubits[153];
-ccx qubits[21],qubits[68],qubits[153];
-h qubits[153];
-h qubits[153];
-ccx qubits[20],qubits[69],qubits[153];
-h qubits[153];
-h qubits[153];
-ccx qubits[19],qubits[70],qubits[153];
-h qubits[153];
-h qubits[153];
-ccx qubits[18],qubits[71],qubits[153];
-h qubits[153];
-h qubits[153];
-ccx qubits[17],qubits[72],qubits[153];
-h qubits[153];
-h qubits[153];
-ccx qubits[16],qubits[73],qubits[153];
-h qubits[153];
-h qubits[153];
-ccx qubits[15],qubits[74],qubits[153];
-h qubits[153];
-h qubits[153];
-ccx qubits[14],qubits[75],qubits[153];
-h qubits[153];
-h qubits[153];
-ccx qubits[13],qubits[76],qubits[153];
-h qubits[153];
-h qubits[153];
-ccx qubits[12],qubits[77],qubits[153];
-h qubits[153];
-h qubits[153];
-ccx qubits[11],qubits[78],qubits[153];
-h qubits[153];
-h qubits[153];
-ccx qubits[10],qubits[79],qubits[153];
-h qubits[153];
-h qubits[153];
-ccx qubits[9],qubits[80],qubits[153];
-h qubits[153];
-h qubits[153];
-ccx qubits[8],qubits[81],qubits[153];
-h qubits[153];
-h qubits[153];
-ccx qubits[7],qubits[82],qubits[153];
-h qubits[153];
-h qubits[153];
-ccx qubits[6],qubits[83],qubits[153];
-h qubits[153];
-h qubits[153];
-ccx qubits[5],qubits[84],qubits[153];
-h qubits[153];
-h qubits[153];
-ccx qubits[4],qubits[85],qubits[153];
-h qubits[153];
-h qubits[153];
-ccx qubits[3],qubits[86],qubits[153];
-h qubits[153];
-h qubits[153];
-ccx qubits[2],qubits[87],qubits[153];
-h qubits[153];
-h qubits[153];
-ccx qubits[1],qubits[88],qubits[153];
-h qubits[153];
-h qubits[153];
-ccx qubits[0],qubits[89],qubits[153];
-h qubits[153];
-h qubits[152];
-ccx qubits[24],qubits[64],qubits[152];
-h qubits[152];
-h qubits[152];
-ccx qubits[23],qubits[65],qubits[152];
-h qubits[152];
-h qubits[152];
-ccx qubits[22],qubits[66],qubits[152];
-h qubits[152];
-h qubits[152];
-ccx qubits[21],qubits[67],qubits[152];
-h qubits[152];
-h qubits[152];
-ccx qubits[20],qubits[68],qubits[152];
-h qubits[152];
-h qubits[152];
-ccx qubits[19],qubits[69],qubits[152];
-h qubits[152];
-h qubits[152];
-ccx qubits[18],qubits[70],qubits[152];
-h qubits[152];
-h qubits[152];
-ccx qubits[17],qubits[71],qubits[152];
-h qubits[152];
-h qubits[152];
-ccx qubits[16],qubits[72],qubits[152];
-h qubits[152];
-h qubits[152];
-ccx qubits[15],qubits[73],qubits[152];
-h qubits[152];
-h qubits[152];
-ccx qubits[14],qubits[74],qubits[152];
-h qubits[152];
-h qubits[152];
-ccx qubits[13],qubits[75],qubits[152];
-h qubits[152];
-h qubits[152];
-ccx qubits[12],qubits[76],qubits[152];
-h qubits[152];
-h qubits[152];
-ccx qubits[11],qubits[77],qubits[152];
-h qubits[152];
-h qubits[152];
-ccx qubits[10],qubits[78],qubits[152];
-h qubits[152];
-h qubits[152];
-ccx qubits[9],qubits[79],qubits[152];
-h qubits[152];
-h qubits[152];
-ccx qubits[8],qubits[80],qubits[152];
-h qubits[152];
-h qubits[152];
-ccx qubits[7],qubits[81],qubits[152];
-h qubits[152];
-h qubits[152];
-ccx qubits[6],qubits[82],qubits[152];
-h qubits[152];
-h qubits[152];
-ccx qubits[5],qubits[83],qubits[152];
-h qubits[152];
-h qubits[152];
-ccx qubits[4],qubits[84],qubits[152];
-h qubits[152];
-h qubits[152];
-ccx qubits[3],qubits[85],qubits[152];
-h qubits[152];
-h qubits[152];
-ccx qubits[2],qubits[86],qubits[152];
-h qubits[152];
-h qubits[152];
-ccx qubits[1],qubits[87],qubits[152];
-h qubits[152];
-h qubits[152];
-ccx qubits[0],qubits[88],qubits[152];
-h qubits[152];
-h qubits[151];
-ccx qubits[23],qubits[64],qubits[151];
-h qubits[151];
-h qubits[151];
-ccx qubits[22],qubits[65],qubits[151];
-h qubits[151];
-h qubits[151];
-ccx qubits[21],qubits[66],qubits[151];
-h qubits[151];
-h qubits[151];
-ccx qubits[20],qubits[67],qubits[151];
-h qubits[151];
-h qubits[151];
-ccx qubits[19],qubits[68],qubits[151];
-h qubits[151];
-h qubits[151];
-ccx qubits[18],qubits[69],qubits[151];
-h qubits[151];
-h qubits[151];
-ccx qubits[17],qubits[70],qubits[151];
-h qubits[151];
-h qubits[151];
-ccx qubits[16],qubits[71],qubits[151];
-h qubits[151];
-h qubits[151];
-ccx qubits[15],qubits[72],qubits[151];
-h qubits[151];
-h qubits[151];
-ccx qubits[14],qubits[73],qubits[151];
-h qubits[151];
-h qubits[151];
-ccx qubits[13],qubits[74],qubits[151];
-h qubits[151];
-h qubits[151];
-ccx qubits[12],qubits[75],qubits[151];
-h qubits[151];
-h qubits[151];
-ccx qubits[11],qubits[76],qubits[151];
-h qubits[151];
-h qubits[151];
-ccx qubits[10],qubits[77],qubits[151];
-h qubits[151];
-h qubits[151];
-ccx qubits[9],qubits[78],qubits[151];
-h qubits[151];
-h qubits[151];
-ccx qubits[8],qubits[79],qubits[151];
-h qubits[151];
-h qubits[151];
-ccx qubits[7],qubits[80],qubits[151];
-h qubits[151];
-h qubits[151];
-ccx qubits[6],qubits[81],qubits[151];
-h qubits[151];
-h qubits[151];
-ccx qubits[5],qubits[82],qubits[151];
-h qubits[151];
-h qubits[151];
-ccx qubits[4],qubits[83],qubits[151];
-h qubits[151];
-h qubits[151];
-ccx qubits[3],qubits[84],qubits[151];
-h qubits[151];
-h qubits[151];
-ccx qubits[2],qubits[85],qubits[151];
-h qubits[151];
-h qubits[151];
-ccx qubits[1],qubits[86],qubits[151];
-h qubits[151];
-h qubits[151];
-ccx qubits[0],qubits[87],qubits[151];
-h qubits[151];
-h qubits[150];
-ccx qubits[22],qubits[64],qubits[150];
-h qubits[150];
-h qubits[150];
-ccx qubits[21],qubits[65],qubits[150];
-h qubits[150];
-h qubits[150];
-ccx qubits[20],qubits[66],qubits[150];
-h qubits[150];
-h qubits[150];
-ccx qubits[19],qubits[67],qubits[150];
-h qubits[150];
-h qubits[150];
-ccx qubits[18],qubits[68],qubits[150];
-h qubits[150];
-h qubits[150];
-ccx qubits[17],qubits[69],qubits[150];
-h qubits[150];
-h qubits[150];
-ccx qubits[16],qubits[70],qubits[150];
-h qubits[150];
-h qubits[150];
-ccx qubits[15],qubits[71],qubits[150];
-h qubits[150];
-h qubits[150];
-ccx qubits[14],qubits[72],qubits[150];
-h qubits[150];
-h qubits[150];
-ccx qubits[13],qubits[73],qubits[150];
-h qubits[150];
-h qubits[150];
-ccx qubits[12],qubits[74],qubits[150];
-h qubits[150];
-h qubits[150];
-ccx qubits[11],qubits[75],qubits[150];
-h qubits[150];
-h qubits[150];
-ccx qubits[10],qubits[76],qubits[150];
-h qubits[150];
-h qubits[150];
-ccx qubits[9],qubits[77],qubits[150];
-h qubits[150];
-h qubits[150];
-ccx qubits[8],qubits[78],qubits[150];
-h qubits[150];
-h qubits[150];
-ccx qubits[7],qubits[79],qubits[150];
-h qubits[150];
-h qubits[150];
-ccx qubits[6],qubits[80],qubits[150];
-h qubits[150];
-h qubits[150];
-ccx qubits[5],qubits[81],qubits[150];
-h qubits[150];
-h qubits[150];
-ccx qubits[4],qubits[82],qubits[150];
-h qubits[150];
-h qubits[150];
-ccx qubits[3],qubits[83],qubits[150];
-h qubits[150];
-h qubits[150];
-ccx qubits[2],qubits[84],qubits[150];
-h qubits[150];
-h qubits[150];
-ccx qubits[1],qubits[85],qubits[150];
-h qubits[150];
-h qubits[150];
-ccx qubits[0],qubits[86],qubits[150];
-h qubits[150];
-h qubits[149];
-ccx qubits[21],qubits[64],qubits[149];
-h qubits[149];
-h qubits[149];
-ccx qubits[20],qubits[65],qubits[149];
-h qubits[149];
-h qubits[149];
-ccx qubits[19],qubits[66],qubits[149];
-h qubits[149];
-h qubits[149];
-ccx qubits[18],qubits[67],qubits[149];
-h qubits[149];
-h qubits[149];
-ccx qubits[17],qubits[68],qubits[149];
-h qubits[149];
-h qubits[149];
-ccx qubits[16],qubits[69],qubits[149];
-h qubits[149];
-h qubits[149];
-ccx qubits[15],qubits[70],qubits[149];
-h qubits[149];
-h qubits[149];
-ccx qubits[14],qubits[71],qubits[149];
-h qubits[149];
-h qubits[149];
-ccx qubits[13],qubits[72],qubits[149];
-h qubits[149];
-h qubits[149];
-ccx qubits[12],qubits[73],qubits[149];
-h qubits[149];
-h qubits[149];
-ccx qubits[11],qubits[74],qubits[149];
-h qubits[149];
-h qubits[149];
-ccx qubits[10],qubits[75],qubits[149];
-h qubits[149];
-h qubits[149];
-ccx qubits[9],qubits[76],qubits[149];
-h qubits[149];
-h qubits[149];
-ccx qubits[8],qubits[77],qubits[149];
-h qubits[149];
-h qubits[149];
-ccx qubits[7],qubits[78],qubits[149];
-h qubits[149];
-h qubits[149];
-ccx qubits[6],qubits[79],qubits[149];
-h qubits[149];
-h qubits[149];
-ccx qubits[5],qubits[80],qubits[149];
-h qubits[149];
-h qubits[149];
-ccx qubits[4],qubits[81],qubits[149];
-h qubits[149];
-h qubits[149];
-ccx qubits[3],qubits[82],qubits[149];
-h qubits[149];
-h qubits[149];
-ccx qubits[2],qubits[83],qubits[149];
-h qubits[149];
-h qubits[149];
-ccx qubits[1],qubits[84],qubits[149];
-h qubits[149];
-h qubits[149];
-ccx qubits[0],qubits[85],qubits[149];
-h qubits[149];
-h qubits[148];
-ccx qubits[20],qubits[64],qubits[148];
-h qubits[148];
-h qubits[148];
-ccx qubits[19],qubits[65],qubits[148];
-h qubits[148];
-h qubits[148];
-ccx qubits[18],qubits[66],qubits[148];
-h qubits[148];
-h qubits[148];
-ccx qubits[17],qubits[67],qubits[148];
-h qubits[148];
-h qubits[148];
-ccx qubits[16],qubits[68],qubits[148];
-h qubits[148];
-h qubits[148];
-ccx qubits[15],qubits[69],qubits[148];
-h qubits[148];
-h qubits[148];
-ccx qubits[14],qubits[70],qubits[148];
-h qubits[148];
-h qubits[148];
-ccx qubits[13],qubits[71],qubits[148];
-h qubits[148];
-h qubits[148];
-ccx qubits[12],qubits[72],qubits[148];
-h qubits[148];
-h qubits[148];
-ccx qubits[11],qubits[73],qubits[148];
-h qubits[148];
-h qubits[148];
-ccx qubits[10],qubits[74],qubits[148];
-h qubits[148];
-h qubits[148];
-ccx qubits[9],qubits[75],qubits[148];
-h qubits[148];
-h qubits[148];
-ccx qubits[8],qubits[76],qubits[148];
-h qubits[148];
-h qubits[148];
-ccx qubits[7],qubits[77],qubits[148];
-h qubits[148];
-h qubits[148];
-ccx qubits[6],qubits[78],qubits[148];
-h qubits[148];
-h qubits[148];
-ccx qubits[5],qubits[79],qubits[148];
-h qubits[148];
-h qubits[148];
-ccx qubits[4],qubits[80],qubits[148];
-h qubits[148];
-h qubits[148];
-ccx qubits[3],qubits[81],qubits[148];
-h qubits[148];
-h qubits[148];
-ccx qubits[2],qubits[82],qubits[148];
-h qubits[148];
-h qubits[148];
-ccx qubits[1],qubits[83],qubits[148];
-h qubits[148];
-h qubits[148];
-ccx qubits[0],qubits[84],qubits[148];
-h qubits[148];
-h qubits[147];
-ccx qubits[19],qubits[64],qubits[147];
-h qubits[147];
-h qubits[147];
-ccx qubits[18],qubits[65],qubits[147];
-h qubits[147];
-h qubits[147];
-ccx qubits[17],qubits[66],qubits[147];
-h qubits[147];
-h qubits[147];
-ccx qubits[16],qubits[67],qubits[147];
-h qubits[147];
-h qubits[147];
-ccx qubits[15],qubits[68],qubits[147];
-h qubits[147];
-h qubits[147];
-ccx qubits[14],qubits[69],qubits[147];
-h qubits[147];
-h qubits[147];
-ccx qubits[13],qubits[70],qubits[147];
-h qubits[147];
-h qubits[147];
-ccx qubits[12],qubits[71],qubits[147];
-h qubits[147];
-h qubits[147];
-ccx qubits[11],qubits[72],qubits[147];
-h qubits[147];
-h qubits[147];
-ccx qubits[10],qubits[73],qubits[147];
-h qubits[147];
-h qubits[147];
-ccx qubits[9],qubits[74],qubits[147];
-h qubits[147];
-h qubits[147];
-ccx qubits[8],qubits[75],qubits[147];
-h qubits[147];
-h qubits[147];
-ccx qubits[7],qubits[76],qubits[147];
-h qubits[147];
-h qubits[147];
-ccx qubits[6],qubits[77],qubits[147];
-h qubits[147];
-h qubits[147];
-ccx qubits[5],qubits[78],qubits[147];
-h qubits[147];
-h qubits[147];
-ccx qubits[4],qubits[79],qubits[147];
-h qubits[147];
-h qubits[147];
-ccx qubits[3],qubits[80],qubits[147];
-h qubits[147];
-h qubits[147];
-ccx qubits[2],qubits[81],qubits[147];
-h qubits[147];
-h qubits[147];
-ccx qubits[1],qubits[82],qubits[147];
-h qubits[147];
-h qubits[147];
-ccx qubits[0],qubits[83],qubits[147];
-h qubits[147];
-h qubits[146];
-ccx qubits[18],qubits[64],qubits[146];
-h qubits[146];
-h qubits[146];
-ccx qubits[17],qubits[65],qubits[146];
-h qubits[146];
-h qubits[146];
-ccx qubits[16],qubits[66],qubits[146];
-h qubits[146];
-h qubits[146];
-ccx qubits[15],qubits[67],qubits[146];
-h qubits[146];
-h qubits[146];
-ccx qubits[14],qubits[68],qubits[146];
-h qubits[146];
-h qubits[146];
-ccx qubits[13],qubits[69],qubits[146];
-h qubits[146];
-h qubits[146];
-ccx qubits[12],qubits[70],qubits[146];
-h qubits[146];
-h qubits[146];
-ccx qubits[11],qubits[71],qubits[146];
-h qubits[146];
-h qubits[146];
-ccx qubits[10],qubits[72],qubits[146];
-h qubits[146];
-h qubits[146];
-ccx qubits[9],qubits[73],qubits[146];
-h qubits[146];
-h qubits[146];
-ccx qubits[8],qubits[74],qubits[146];
-h qubits[146];
-h qubits[146];
-ccx qubits[7],qubits[75],qubits[146];
-h qubits[146];
-h qubits[146];
-ccx qubits[6],qubits[76],qubits[146];
-h qubits[146];
-h qubits[146];
-ccx qubits[5],qubits[77],qubits[146];
-h qubits[146];
-h qubits[146];
-ccx qubits[4],qubits[78],qubits[146];
-h qubits[146];
-h qubits[146];
-ccx qubits[3],qubits[79],qubits[146];
-h qubits[146];
-h qubits[146];
-ccx qubits[2],qubits[80],qubits[146];
-h qubits[146];
-h qubits[146];
-ccx qubits[1],qubits[81],qubits[146];
-h qubits[146];
-h qubits[146];
-ccx qubits[0],qubits[82],qubits[146];
-h qubits[146];
-h qubits[145];
-ccx qubits[17],qubits[64],qubits[145];
-h qubits[145];
-h qubits[145];
-ccx qubits[16],qubits[65],qubits[145];
-h qubits[145];
-h qubits[145];
-ccx qubits[15],qubits[66],qubits[145];
-h qubits[145];
-h qubits[145];
-ccx qubits[14],qubits[67],qubits[145];
-h qubits[145];
-h qubits[145];
-ccx qubits[13],qubits[68],qubits[145];
-h qubits[145];
-h qubits[145];
-ccx qubits[12],qubits[69],qubits[145];
-h qubits[145];
-h qubits[145];
-ccx qubits[11],qubits[70],qubits[145];
-h qubits[145];
-h qubits[145];
-ccx qubits[10],qubits[71],qubits[145];
-h qubits[145];
-h qubits[145];
-ccx qubits[9],qubits[72],qubits[145];
-h qubits[145];
-h qubits[145];
-ccx qubits[8],qubits[73],qubits[145];
-h qubits[145];
-h qubits[145];
-ccx qubits[7],qubits[74],qubits[145];
-h qubits[145];
-h qubits[145];
-ccx qubits[6],qubits[75],qubits[145];
-h qubits[145];
-h qubits[145];
-ccx qubits[5],qubits[76],qubits[145];
-h qubits[145];
-h qubits[145];
-ccx qubits[4],qubits[77],qubits[145];
-h qubits[145];
-h qubits[145];
-ccx qubits[3],qubits[78],qubits[145];
-h qubits[145];
-h qubits[145];
-ccx qubits[2],qubits[79],qubits[145];
-h qubits[145];
-h qubits[145];
-ccx qubits[1],qubits[80],qubits[145];
-h qubits[145];
-h qubits[145];
-ccx qubits[0],qubits[81],qubits[145];
-h qubits[145];
-h qubits[144];
-ccx qubits[16],qubits[64],qubits[144];
-h qubits[144];
-h qubits[144];
-ccx qubits[15],qubits[65],qubits[144];
-h qubits[144];
-h qubits[144];
-ccx qubits[14],qubits[66],qubits[144];
-h qubits[144];
-h qubits[144];
-ccx qubits[13],qubits[67],qubits[144];
-h qubits[144];
-h qubits[144];
-ccx qubits[12],qubits[68],qubits[144];
-h qubits[144];
-h qubits[144];
-ccx qubits[11],qubits[69],qubits[144];
-h qubits[144];
-h qubits[144];
-ccx qubits[10],qubits[70],qubits[144];
-h qubits[144];
-h qubits[144];
-ccx qubits[9],qubits[71],qubits[144];
-h qubits[144];
-h qubits[144];
-ccx qubits[8],qubits[72],qubits[144];
-h qubits[144];
-h qubits[144];
-ccx qubits[7],qubits[73],qubits[144];
-h qubits[144];
-h qubits[144];
-ccx qubits[6],qubits[74],qubits[144];
-h qubits[144];
-h qubits[144];
-ccx qubits[5],qubits[75],qubits[144];
-h qubits[144];
-h qubits[144];
-ccx qubits[4],qubits[76],qubits[144];
-h qubits[144];
-h qubits[144];
-ccx qubits[3],qubits[77],qubits[144];
-h qubits[144];
-h qubits[144];
-ccx qubits[2],qubits[78],qubits[144];
-h qubits[144];
-h qubits[144];
-ccx qubits[1],qubits[79],qubits[144];
-h qubits[144];
-h qubits[144];
-ccx qubits[0],qubits[80],qubits[144];
-h qubits[144];
-h qubits[143];
-ccx qubits[15],qubits[64],qubits[143];
-h qubits[143];
-h qubits[143];
-ccx qubits[14],qubits[65],qubits[143];
-h qubits[143];
-h qubits[143];
-ccx qubits[13],qubits[66],qubits[143];
-h qubits[143];
-h qubits[143];
-ccx qubits[12],qubits[67],qubits[143];
-h qubits[143];
-h qubits[143];
-ccx qubits[11],qubits[68],qubits[143];
-h qubits[143];
-h qubits[143];
-ccx qubits[10],qubits[69],qubits[143];
-h qubits[143];
-h qubits[143];
-ccx qubits[9],qubits[70],qubits[143];
-h qubits[143];
-h qubits[143];
-ccx qubits[8],qubits[71],qubits[143];
-h qubits[143];
-h qubits[143];
-ccx qubits[7],qubits[72],qubits[143];
-h qubits[143];
-h qubits[143];
-ccx qubits[6],qubits[73],qubits[143];
-h qubits[143];
-h qubits[143];
-ccx qubits[5],qubits[74],qubits[143];
-h qubits[143];
-h qubits[143];
-ccx qubits[4],qubits[75],qubits[143];
-h qubits[143];
-h qubits[143];
-ccx qubits[3],qubits[76],qubits[143];
-h qubits[143];
-h qubits[143];
-ccx qubits[2],qubits[77],qubits[143];
-h qubits[143];
-h qubits[143];
-ccx qubits[1],qubits[78],qubits[143];
-h qubits[143];
-h qubits[143];
-ccx qubits[0],qubits[79],qubits[143];
-h qubits[143];
-h qubits[142];
-ccx qubits[14],qubits[64],qubits[142];
-h qubits[142];
-h qubits[142];
-ccx qubits[13],qubits[65],qubits[142];
-h qubits[142];
-h qubits[142];
-ccx qubits[12],qubits[66],qubits[142];
-h qubits[142];
-h qubits[142];
-ccx qubits[11],qubits[67],qubits[142];
-h qubits[142];
-h qubits[142];
-ccx qubits[10],qubits[68],qubits[142];
-h qubits[142];
-h qubits[142];
-ccx qubits[9],qubits[69],qubits[142];
-h qubits[142];
-h qubits[142];
-ccx qubits[8],qubits[70],qubits[142];
-h qubits[142];
-h qubits[142];
-ccx qubits[7],qubits[71],qubits[142];
-h qubits[142];
-h qubits[142];
-ccx qubits[6],qubits[72],qubits[142];
-h qubits[142];
-h qubits[142];
-ccx qubits[5],qubits[73],qubits[142];
-h qubits[142];
-h qubits[142];
-ccx qubits[4],qubits[74],qubits[142];
-h qubits[142];
-h qubits[142];
-ccx qubits[3],qubits[75],qubits[142];
-h qubits[142];
-h qubits[142];
-ccx qubits[2],qubits[76],qubits[142];
-h qubits[142];
-h qubits[142];
-ccx qubits[1],qubits[77],qubits[142];
-h qubits[142];
-h qubits[142];
-ccx qubits[0],qubits[78],qubits[142];
-h qubits[142];
-h qubits[141];
-ccx qubits[13],qubits[64],qubits[141];
-h qubits[141];
-h qubits[141];
-ccx qubits[12],qubits[65],qubits[141];
-h qubits[141];
-h qubits[141];
-ccx qubits[11],qubits[66],qubits[141];
-h qubits[141];
-h qubits[141];
-ccx qubits[10],qubits[67],qubits[141];
-h qubits[141];
-h qubits[141];
-ccx qubits[9],qubits[68],qubits[141];
-h qubits[141];
-h qubits[141];
-ccx qubits[8],qubits[69],qubits[141];
-h qubits[141];
-h qubits[141];
-ccx qubits[7],qubits[70],qubits[141];
-h qubits[141];
-h qubits[141];
-ccx qubits[6],qubits[71],qubits[141];
-h qubits[141];
-h qubits[141];
-ccx qubits[5],qubits[72],qubits[141];
-h qubits[141];
-h qubits[141];
-ccx qubits[4],qubits[73],qubits[141];
-h qubits[141];
-h qubits[141];
-ccx qubits[3],qubits[74],qubits[141];
-h qubits[141];
-h qubits[141];
-ccx qubits[2],qubits[75],qubits[141];
-h qubits[141];
-h qubits[141];
-ccx qubits[1],qubits[76],qubits[141];
-h qubits[141];
-h qubits[141];
-ccx qubits[0],qubits[77],qubits[141];
-h qubits[141];
-h qubits[140];
-ccx qubits[12],qubits[64],qubits[140];
-h qubits[140];
-h qubits[140];
-ccx qubits[11],qubits[65],qubits[140];
-h qubits[140];
-h qubits[140];
-ccx qubits[10],qubits[66],qubits[140];
-h qubits[140];
-h qubits[140];
-ccx qubits[9],qubits[67],qubits[140];
-h qubits[140];
-h qubits[140];
-ccx qubits[8],qubits[68],qubits[140];
-h qubits[140];
-h qubits[140];
-ccx qubits[7],qubits[69],qubits[140];
-h qubits[140];
-h qubits[140];
-ccx qubits[6],qubits[70],qubits[140];
-h qubits[140];
-h qubits[140];
-ccx qubits[5],qubits[71],qubits[140];
-h qubits[140];
-h qubits[140];
-ccx qubits[4],qubits[72],qubits[140];
-h qubits[140];
-h qubits[140];
-ccx qubits[3],qubits[73],qubits[140];
-h qubits[140];
-h qubits[140];
-ccx qubits[2],qubits[74],qubits[140];
-h qubits[140];
-h qubits[140];
-ccx qubits[1],qubits[75],qubits[140];
-h qubits[140];
-h qubits[140];
-ccx qubits[0],qubits[76],qubits[140];
-h qubits[140];
-h qubits[139];
-ccx qubits[11],qubits[64],qubits[139];
-h qubits[139];
-h qubits[139];
-ccx qubits[10],qubits[65],qubits[139];
-h qubits[139];
-h qubits[139];
-ccx qubits[9],qubits[66],qubits[139];
-h qubits[139];
-h qubits[139];
-ccx qubits[8],qubits[67],qubits[139];
-h qubits[139];
-h qubits[139];
-ccx qubits[7],qubits[68],qubits[139];
-h qubits[139];
-h qubits[139];
-ccx qubits[6],qubits[69],qubits[139];
-h qubits[139];
-h qubits[139];
-ccx qubits[5],qubits[70],qubits[139];
-h qubits[139];
-h qubits[139];
-ccx qubits[4],qubits[71],qubits[139];
-h qubits[139];
-h qubits[139];
-ccx qubits[3],qubits[72],qubits[139];
-h qubits[139];
-h qubits[139];
-ccx qubits[2],qubits[73],qubits[139];
-h qubits[139];
-h qubits[139];
-ccx qubits[1],qubits[74],qubits[139];
-h qubits[139];
-h qubits[139];
-ccx qubits[0],qubits[75],qubits[139];
-h qubits[139];
-h qubits[138];
-ccx qubits[10],qubits[64],qubits[138];
-h qubits[138];
-h qubits[138];
-ccx qubits[9],qubits[65],qubits[138];
-h qubits[138];
-h qubits[138];
-ccx qubits[8],qubits[66],qubits[138];
-h qubits[138];
-h qubits[138];
-ccx qubits[7],qubits[67],qubits[138];
-h qubits[138];
-h qubits[138];
-ccx qubits[6],qubits[68],qubits[138];
-h qubits[138];
-h qubits[138];
-ccx qubits[5],qubits[69],qubits[138];
-h qubits[138];
-h qubits[138];
-ccx qubits[4],qubits[70],qubits[138];
-h qubits[138];
-h qubits[138];
-ccx qubits[3],qubits[71],qubits[138];
-h qubits[138];
-h qubits[138];
-ccx qubits[2],qubits[72],qubits[138];
-h qubits[138];
-h qubits[138];
-ccx qubits[1],qubits[73],qubits[138];
-h qubits[138];
-h qubits[138];
-ccx qubits[0],qubits[74],qubits[138];
-h qubits[138];
-h qubits[137];
-ccx qubits[9],qubits[64],qubits[137];
-h qubits[137];
-h qubits[137];
-ccx qubits[8],qubits[65],qubits[137];
-h qubits[137];
-h qubits[137];
-ccx qubits[7],qubits[66],qubits[137];
-h qubits[137];
-h qubits[137];
-ccx qubits[6],qubits[67],qubits[137];
-h qubits[137];
-h qubits[137];
-ccx qubits[5],qubits[68],qubits[137];
-h qubits[137];
-h qubits[137];
-ccx qubits[4],qubits[69],qubits[137];
-h qubits[137];
-h qubits[137];
-ccx qubits[3],qubits[70],qubits[137];
-h qubits[137];
-h qubits[137];
-ccx qubits[2],qubits[71],qubits[137];
-h qubits[137];
-h qubits[137];
-ccx qubits[1],qubits[72],qubits[137];
-h qubits[137];
-h qubits[137];
-ccx qubits[0],qubits[73],qubits[137];
-h qubits[137];
-h qubits[136];
-ccx qubits[8],qubits[64],qubits[136];
-h qubits[136];
-h qubits[136];
-ccx qubits[7],qubits[65],qubits[136];
-h qubits[136];
-h qubits[136];
-ccx qubits[6],qubits[66],qubits[136];
-h qubits[136];
-h qubits[136];
-ccx qubits[5],qubits[67],qubits[136];
-h qubits[136];
-h qubits[136];
-ccx qubits[4],qubits[68],qubits[136];
-h qubits[136];
-h qubits[136];
-ccx qubits[3],qubits[69],qubits[136];
-h qubits[136];
-h qubits[136];
-ccx qubits[2],qubits[70],qubits[136];
-h qubits[136];
-h qubits[136];
-ccx qubits[1],qubits[71],qubits[136];
-h qubits[136];
-h qubits[136];
-ccx qubits[0],qubits[72],qubits[136];
-h qubits[136];
-h qubits[135];
-ccx qubits[7],qubits[64],qubits[135];
-h qubits[135];
-h qubits[135];
-ccx qubits[6],qubits[65],qubits[135];
-h qubits[135];
-h qubits[135];
-ccx qubits[5],qubits[66],qubits[135];
-h qubits[135];
-h qubits[135];
-ccx qubits[4],qubits[67],qubits[135];
-h qubits[135];
-h qubits[135];
-ccx qubits[3],qubits[68],qubits[135];
-h qubits[135];
-h qubits[135];
-ccx qubits[2],qubits[69],qubits[135];
-h qubits[135];
-h qubits[135];
-ccx qubits[1],qubits[70],qubits[135];
-h qubits[135];
-h qubits[135];
-ccx qubits[0],qubits[71],qubits[135];
-h qubits[135];
-h qubits[134];
-ccx qubits[6],qubits[64],qubits[134];
-h qubits[134];
-h qubits[134];
-ccx qubits[5],qubits[65],qubits[134];
-h qubits[134];
-h qubits[134];
-ccx qubits[4],qubits[66],qubits[134];
-h qubits[134];
-h qubits[134];
-ccx qubits[3],qubits[67],qubits[134];
-h qubits[134];
-h qubits[134];
-ccx qubits[2],qubits[68],qubits[134];
-h qubits[134];
-h qubits[134];
-ccx qubits[1],qubits[69],qubits[134];
-h qubits[134];
-h qubits[134];
-ccx qubits[0],qubits[70],qubits[134];
-h qubits[134];
-h qubits[133];
-ccx qubits[5],qubits[64],qubits[133];
-h qubits[133];
-h qubits[133];
-ccx qubits[4],qubits[65],qubits[133];
-h qubits[133];
-h qubits[133];
-ccx qubits[3],qubits[66],qubits[133];
-h qubits[133];
-h qubits[133];
-ccx qubits[2],qubits[67],qubits[133];
-h qubits[133];
-h qubits[133];
-ccx qubits[1],qubits[68],qubits[133];
-h qubits[133];
-h qubits[133];
-ccx qubits[0],qubits[69],qubits[133];
-h qubits[133];
-h qubits[132];
-ccx qubits[4],qubits[64],qubits[132];
-h qubits[132];
-h qubits[132];
-ccx qubits[3],qubits[65],qubits[132];
-h qubits[132];
-h qubits[132];
-ccx qubits[2],qubits[66],qubits[132];
-h qubits[132];
-h qubits[132];
-ccx qubits[1],qubits[67],qubits[132];
-h qubits[132];
-h qubits[132];
-ccx qubits[0],qubits[68],qubits[132];
-h qubits[132];
-h qubits[131];
-ccx qubits[3],qubits[64],qubits[131];
-h qubits[131];
-h qubits[131];
-ccx qubits[2],qubits[65],qubits[131];
-h qubits[131];
-h qubits[131];
-ccx qubits[1],qubits[66],qubits[131];
-h qubits[131];
-h qubits[131];
-ccx qubits[0],qubits[67],qubits[131];
-h qubits[131];
-h qubits[130];
-ccx qubits[2],qubits[64],qubits[130];
-h qubits[130];
-h qubits[130];
-ccx qubits[1],qubits[65],qubits[130];
-h qubits[130];
-h qubits[130];
-ccx qubits[0],qubits[66],qubits[130];
-h qubits[130];
-h qubits[129];
-ccx qubits[1],qubits[64],qubits[129];
-h qubits[129];
-h qubits[129];
-ccx qubits[0],qubits[65],qubits[129];
-h qubits[129];
-h qubits[128];
-ccx qubits[0],qubits[64],qubits[128];
-h qubits[128];
-h qubits[128];
-h qubits[129];
-h qubits[130];
-h qubits[131];
-h qubits[132];
-h qubits[133];
-h qubits[134];
-h qubits[135];
-h qubits[136];
-h qubits[137];
-h qubits[138];
-h qubits[139];
-h qubits[140];
-h qubits[141];
-h qubits[142];
-h qubits[143];
-h qubits[144];
-h qubits[145];
-h qubits[146];
-h qubits[147];
-h qubits[148];
-h qubits[149];
-h qubits[150];
-h qubits[151];
-h qubits[152];
-h qubits[153];
-h qubits[154];
-h qubits[155];
-h qubits[156];
-h qubits[157];
-h qubits[158];
-h qubits[159];
-h qubits[160];
-h qubits[161];
-h qubits[162];
-h qubits[163];
-h qubits[164];
-h qubits[165];
-h qubits[166];
-h qubits[167];
-h qubits[168];
-h qubits[169];
-h qubits[170];
-h qubits[171];
-h qubits[172];
-h qubits[173];
-h qubits[174];
-h qubits[175];
-h qubits[176];
-h qubits[177];
-h qubits[178];
-h qubits[179];
-h qubits[180];
-h qubits[181];
-h qubits[182];
-h qubits[183];
-h qubits[184];
-h qubits[185];
-h qubits[186];
-h qubits[187];
-h qubits[188];
-h qubits[189];
-h qubits[190];
-h qubits[191];
@@ -1,182 +0,0 @@
-OPENQASM 2.0;
-include "qelib1.inc";
-qreg qubits[21];
-h qubits[14];
-h qubits[15];
-h qubits[16];
-h qubits[17];
-h qubits[18];
-h qubits[19];
-h qubits[14];
-ccx qubits[6],qubits[8],qubits[14];
-h qubits[14];
-h qubits[14];
-ccx qubits[5],qubits[9],qubits[14];
-h qubits[14];
-h qubits[14];
-ccx qubits[4],qubits[10],qubits[14];
-h qubits[14];
-h qubits[14];
-ccx qubits[3],qubits[11],qubits[14];
-h qubits[14];
-h qubits[14];
-ccx qubits[2],qubits[12],qubits[14];
-h qubits[14];
-h qubits[14];
-ccx qubits[1],qubits[13],qubits[14];
-h qubits[14];
-h qubits[15];
-ccx qubits[6],qubits[9],qubits[15];
-h qubits[15];
-h qubits[15];
-ccx qubits[5],qubits[10],qubits[15];
-h qubits[15];
-h qubits[15];
-ccx qubits[4],qubits[11],qubits[15];
-h qubits[15];
-h qubits[15];
-ccx qubits[3],qubits[12],qubits[15];
-h qubits[15];
-h qubits[15];
-ccx qubits[2],qubits[13],qubits[15];
-h qubits[15];
-h qubits[16];
-ccx qubits[6],qubits[10],qubits[16];
-h qubits[16];
-h qubits[16];
-ccx qubits[5],qubits[11],qubits[16];
-h qubits[16];
-h qubits[16];
-ccx qubits[4],qubits[12],qubits[16];
-h qubits[16];
-h qubits[16];
-ccx qubits[3],qubits[13],qubits[16];
-h qubits[16];
-h qubits[17];
-ccx qubits[6],qubits[11],qubits[17];
-h qubits[17];
-h qubits[17];
-ccx qubits[5],qubits[12],qubits[17];
-h qubits[17];
-h qubits[17];
-ccx qubits[4],qubits[13],qubits[17];
-h qubits[17];
-h qubits[18];
-ccx qubits[6],qubits[12],qubits[18];
-h qubits[18];
-h qubits[18];
-ccx qubits[5],qubits[13],qubits[18];
-h qubits[18];
-h qubits[19];
-ccx qubits[6],qubits[13],qubits[19];
-h qubits[19];
-h qubits[14];
-h qubits[15];
-h qubits[16];
-h qubits[17];
-h qubits[18];
-h qubits[19];
-cx qubits[19],qubits[20];
-cx qubits[18],qubits[19];
-cx qubits[17],qubits[18];
-cx qubits[16],qubits[17];
-cx qubits[15],qubits[16];
-cx qubits[14],qubits[15];
-h qubits[14];
-h qubits[15];
-h qubits[16];
-h qubits[17];
-h qubits[18];
-h qubits[19];
-h qubits[20];
-h qubits[20];
-ccx qubits[6],qubits[7],qubits[20];
-h qubits[20];
-h qubits[20];
-ccx qubits[5],qubits[8],qubits[20];
-h qubits[20];
-h qubits[20];
-ccx qubits[4],qubits[9],qubits[20];
-h qubits[20];
-h qubits[20];
-ccx qubits[3],qubits[10],qubits[20];
-h qubits[20];
-h qubits[20];
-ccx qubits[2],qubits[11],qubits[20];
-h qubits[20];
-h qubits[20];
-ccx qubits[1],qubits[12],qubits[20];
-h qubits[20];
-h qubits[20];
-ccx qubits[0],qubits[13],qubits[20];
-h qubits[20];
-h qubits[19];
-ccx qubits[5],qubits[7],qubits[19];
-h qubits[19];
-h qubits[19];
-ccx qubits[4],qubits[8],qubits[19];
-h qubits[19];
-h qubits[19];
-ccx qubits[3],qubits[9],qubits[19];
-h qubits[19];
-h qubits[19];
-ccx qubits[2],qubits[10],qubits[19];
-h qubits[19];
-h qubits[19];
-ccx qubits[1],qubits[11],qubits[19];
-h qubits[19];
-h qubits[19];
-ccx qubits[0],qubits[12],qubits[19];
-h qubits[19];
-h qubits[18];
-ccx qubits[4],qubits[7],qubits[18];
-h qubits[18];
-h qubits[18];
-ccx qubits[3],qubits[8],qubits[18];
-h qubits[18];
-h qubits[18];
-ccx qubits[2],qubits[9],qubits[18];
-h qubits[18];
-h qubits[18];
-ccx qubits[1],qubits[10],qubits[18];
-h qubits[18];
-h qubits[18];
-ccx qubits[0],qubits[11],qubits[18];
-h qubits[18];
-h qubits[17];
-ccx qubits[3],qubits[7],qubits[17];
-h qubits[17];
-h qubits[17];
-ccx qubits[2],qubits[8],qubits[17];
-h qubits[17];
-h qubits[17];
-ccx qubits[1],qubits[9],qubits[17];
-h qubits[17];
-h qubits[17];
-ccx qubits[0],qubits[10],qubits[17];
-h qubits[17];
-h qubits[16];
-ccx qubits[2],qubits[7],qubits[16];
-h qubits[16];
-h qubits[16];
-ccx qubits[1],qubits[8],qubits[16];
-h qubits[16];
-h qubits[16];
-ccx qubits[0],qubits[9],qubits[16];
-h qubits[16];
-h qubits[15];
-ccx qubits[1],qubits[7],qubits[15];
-h qubits[15];
-h qubits[15];
-ccx qubits[0],qubits[8],qubits[15];
-h qubits[15];
-h qubits[14];
-ccx qubits[0],qubits[7],qubits[14];
-h qubits[14];
-h qubits[14];
-h qubits[15];
-h qubits[16];
-h qubits[17];
-h qubits[18];
-h qubits[19];
-h qubits[20];
@@ -1,216 +0,0 @@
-OPENQASM 2.0;
-include "qelib1.inc";
-qreg qubits[17];
-cx qubits[13],qubits[11];
-cx qubits[10],qubits[0];
-cx qubits[10],qubits[5];
-cx qubits[10],qubits[6];
-cx qubits[10],qubits[7];
-cx qubits[11],qubits[13];
-cx qubits[12],qubits[8];
-cx qubits[12],qubits[11];
-cx qubits[8],qubits[7];
-cx qubits[8],qubits[4];
-h qubits[8];
-h qubits[8];
-ccx qubits[11],qubits[12],qubits[8];
-h qubits[8];
-h qubits[8];
-cx qubits[8],qubits[4];
-cx qubits[8],qubits[7];
-cx qubits[14],qubits[0];
-cx qubits[14],qubits[6];
-cx qubits[14],qubits[8];
-cx qubits[14],qubits[13];
-cx qubits[12],qubits[3];
-h qubits[12];
-h qubits[12];
-ccx qubits[13],qubits[14],qubits[12];
-h qubits[12];
-h qubits[12];
-cx qubits[12],qubits[13];
-cx qubits[12],qubits[3];
-h qubits[14];
-h qubits[14];
-ccx qubits[12],qubits[13],qubits[14];
-h qubits[14];
-h qubits[14];
-cx qubits[12],qubits[10];
-h qubits[12];
-h qubits[12];
-ccx qubits[13],qubits[14],qubits[12];
-h qubits[12];
-h qubits[12];
-cx qubits[10],qubits[8];
-cx qubits[10],qubits[9];
-cx qubits[10],qubits[4];
-cx qubits[12],qubits[10];
-cx qubits[10],qubits[3];
-cx qubits[10],qubits[2];
-cx qubits[10],qubits[1];
-h qubits[16];
-h qubits[16];
-ccx qubits[11],qubits[12],qubits[16];
-h qubits[16];
-h qubits[16];
-h qubits[15];
-h qubits[15];
-ccx qubits[16],qubits[13],qubits[15];
-h qubits[15];
-h qubits[15];
-h qubits[10];
-h qubits[10];
-ccx qubits[15],qubits[14],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[15];
-h qubits[15];
-ccx qubits[16],qubits[13],qubits[15];
-h qubits[15];
-h qubits[15];
-h qubits[16];
-h qubits[16];
-ccx qubits[11],qubits[12],qubits[16];
-h qubits[16];
-h qubits[16];
-cx qubits[10],qubits[9];
-cx qubits[10],qubits[6];
-cx qubits[10],qubits[4];
-cx qubits[10],qubits[3];
-cx qubits[10],qubits[2];
-cx qubits[10],qubits[1];
-cx qubits[11],qubits[10];
-h qubits[15];
-h qubits[15];
-ccx qubits[12],qubits[13],qubits[15];
-h qubits[15];
-h qubits[15];
-h qubits[11];
-h qubits[11];
-ccx qubits[15],qubits[14],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[15];
-h qubits[15];
-ccx qubits[12],qubits[13],qubits[15];
-h qubits[15];
-h qubits[15];
-cx qubits[10],qubits[5];
-cx qubits[11],qubits[10];
-cx qubits[12],qubits[7];
-cx qubits[13],qubits[10];
-cx qubits[11],qubits[12];
-h qubits[15];
-h qubits[15];
-ccx qubits[12],qubits[13],qubits[15];
-h qubits[15];
-h qubits[15];
-h qubits[11];
-h qubits[11];
-ccx qubits[15],qubits[14],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[15];
-h qubits[15];
-ccx qubits[12],qubits[13],qubits[15];
-h qubits[15];
-h qubits[15];
-cx qubits[11],qubits[12];
-cx qubits[11],qubits[5];
-cx qubits[12],qubits[9];
-cx qubits[13],qubits[4];
-cx qubits[13],qubits[3];
-cx qubits[13],qubits[2];
-h qubits[15];
-h qubits[15];
-ccx qubits[11],qubits[12],qubits[15];
-h qubits[15];
-h qubits[15];
-h qubits[13];
-h qubits[13];
-ccx qubits[15],qubits[14],qubits[13];
-h qubits[13];
-h qubits[13];
-h qubits[15];
-h qubits[15];
-ccx qubits[11],qubits[12],qubits[15];
-h qubits[15];
-h qubits[15];
-cx qubits[13],qubits[10];
-cx qubits[10],qubits[0];
-cx qubits[10],qubits[8];
-cx qubits[13],qubits[3];
-cx qubits[13],qubits[2];
-cx qubits[12],qubits[2];
-cx qubits[12],qubits[0];
-h qubits[12];
-h qubits[12];
-ccx qubits[11],qubits[14],qubits[12];
-h qubits[12];
-h qubits[12];
-cx qubits[12],qubits[7];
-cx qubits[12],qubits[2];
-cx qubits[14],qubits[13];
-cx qubits[13],qubits[4];
-cx qubits[14],qubits[10];
-cx qubits[10],qubits[7];
-cx qubits[14],qubits[6];
-h qubits[15];
-h qubits[15];
-ccx qubits[11],qubits[12],qubits[15];
-h qubits[15];
-h qubits[15];
-h qubits[14];
-h qubits[14];
-ccx qubits[15],qubits[13],qubits[14];
-h qubits[14];
-h qubits[14];
-h qubits[15];
-h qubits[15];
-ccx qubits[11],qubits[12],qubits[15];
-h qubits[15];
-h qubits[15];
-cx qubits[14],qubits[12];
-cx qubits[12],qubits[4];
-cx qubits[12],qubits[0];
-cx qubits[14],qubits[11];
-cx qubits[14],qubits[10];
-cx qubits[14],qubits[6];
-h qubits[14];
-h qubits[14];
-ccx qubits[11],qubits[13],qubits[14];
-h qubits[14];
-h qubits[14];
-cx qubits[14],qubits[13];
-cx qubits[14],qubits[11];
-cx qubits[10],qubits[14];
-cx qubits[13],qubits[10];
-cx qubits[10],qubits[13];
-cx qubits[13],qubits[6];
-cx qubits[13],qubits[9];
-cx qubits[9],qubits[13];
-cx qubits[8],qubits[12];
-cx qubits[9],qubits[8];
-cx qubits[7],qubits[11];
-cx qubits[8],qubits[7];
-cx qubits[6],qubits[10];
-cx qubits[7],qubits[6];
-cx qubits[6],qubits[9];
-cx qubits[9],qubits[5];
-cx qubits[5],qubits[9];
-cx qubits[5],qubits[8];
-cx qubits[8],qubits[4];
-cx qubits[4],qubits[8];
-cx qubits[4],qubits[7];
-cx qubits[7],qubits[3];
-cx qubits[3],qubits[7];
-cx qubits[3],qubits[6];
-cx qubits[6],qubits[2];
-cx qubits[2],qubits[6];
-cx qubits[2],qubits[5];
-cx qubits[5],qubits[1];
-cx qubits[1],qubits[5];
-cx qubits[1],qubits[4];
-cx qubits[4],qubits[0];
-cx qubits[0],qubits[4];
-cx qubits[0],qubits[3];
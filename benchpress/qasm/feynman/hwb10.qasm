@@ -1,31767 +0,0 @@
-OPENQASM 2.0;
-include "qelib1.inc";
-qreg qubits[16];
-x qubits[0];
-cx qubits[0],qubits[2];
-cx qubits[2],qubits[0];
-cx qubits[2],qubits[3];
-cx qubits[2],qubits[4];
-cx qubits[3],qubits[6];
-cx qubits[6],qubits[2];
-cx qubits[6],qubits[3];
-cx qubits[6],qubits[5];
-cx qubits[3],qubits[7];
-cx qubits[7],qubits[2];
-cx qubits[7],qubits[3];
-x qubits[7];
-cx qubits[7],qubits[5];
-cx qubits[7],qubits[4];
-cx qubits[3],qubits[9];
-cx qubits[9],qubits[2];
-cx qubits[9],qubits[3];
-cx qubits[9],qubits[6];
-cx qubits[9],qubits[7];
-cx qubits[9],qubits[8];
-cx qubits[3],qubits[8];
-cx qubits[8],qubits[2];
-cx qubits[8],qubits[3];
-cx qubits[8],qubits[4];
-cx qubits[8],qubits[5];
-cx qubits[8],qubits[9];
-cx qubits[3],qubits[0];
-cx qubits[0],qubits[2];
-cx qubits[0],qubits[9];
-cx qubits[0],qubits[1];
-h qubits[0];
-h qubits[0];
-ccx qubits[9],qubits[2],qubits[0];
-h qubits[0];
-h qubits[0];
-cx qubits[3],qubits[1];
-cx qubits[0],qubits[3];
-cx qubits[0],qubits[6];
-cx qubits[3],qubits[0];
-cx qubits[0],qubits[7];
-cx qubits[3],qubits[5];
-cx qubits[3],qubits[7];
-x qubits[3];
-h qubits[3];
-h qubits[3];
-ccx qubits[1],qubits[9],qubits[3];
-h qubits[3];
-h qubits[3];
-cx qubits[9],qubits[7];
-cx qubits[3],qubits[7];
-cx qubits[0],qubits[5];
-h qubits[0];
-h qubits[0];
-ccx qubits[9],qubits[8],qubits[0];
-h qubits[0];
-h qubits[0];
-cx qubits[0],qubits[5];
-h qubits[7];
-h qubits[7];
-ccx qubits[2],qubits[9],qubits[7];
-h qubits[7];
-h qubits[7];
-cx qubits[0],qubits[9];
-cx qubits[0],qubits[8];
-cx qubits[7],qubits[0];
-cx qubits[2],qubits[1];
-cx qubits[1],qubits[7];
-cx qubits[2],qubits[8];
-cx qubits[6],qubits[9];
-cx qubits[6],qubits[8];
-h qubits[2];
-h qubits[2];
-ccx qubits[1],qubits[8],qubits[2];
-h qubits[2];
-h qubits[2];
-cx qubits[6],qubits[1];
-cx qubits[1],qubits[2];
-h qubits[6];
-h qubits[6];
-ccx qubits[1],qubits[7],qubits[6];
-h qubits[6];
-h qubits[6];
-cx qubits[0],qubits[1];
-cx qubits[0],qubits[2];
-cx qubits[0],qubits[6];
-h qubits[7];
-h qubits[7];
-ccx qubits[9],qubits[8],qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[9];
-h qubits[9];
-ccx qubits[10],qubits[7],qubits[9];
-h qubits[9];
-h qubits[9];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[0];
-h qubits[0];
-ccx qubits[10],qubits[5],qubits[0];
-h qubits[0];
-h qubits[0];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[9];
-h qubits[9];
-ccx qubits[10],qubits[7],qubits[9];
-h qubits[9];
-h qubits[9];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[7];
-h qubits[7];
-ccx qubits[9],qubits[8],qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[8];
-h qubits[8];
-ccx qubits[10],qubits[7],qubits[8];
-h qubits[8];
-h qubits[8];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[0];
-h qubits[0];
-ccx qubits[10],qubits[5],qubits[0];
-h qubits[0];
-h qubits[0];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[8];
-h qubits[8];
-ccx qubits[10],qubits[7],qubits[8];
-h qubits[8];
-h qubits[8];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-x qubits[5];
-x qubits[3];
-cx qubits[0],qubits[6];
-cx qubits[1],qubits[2];
-cx qubits[0],qubits[1];
-h qubits[6];
-h qubits[6];
-ccx qubits[1],qubits[7],qubits[6];
-h qubits[6];
-h qubits[6];
-cx qubits[6],qubits[1];
-h qubits[2];
-h qubits[2];
-ccx qubits[1],qubits[8],qubits[2];
-h qubits[2];
-h qubits[2];
-cx qubits[6],qubits[8];
-cx qubits[6],qubits[9];
-cx qubits[2],qubits[8];
-cx qubits[1],qubits[7];
-cx qubits[2],qubits[1];
-cx qubits[7],qubits[0];
-cx qubits[0],qubits[8];
-cx qubits[0],qubits[9];
-cx qubits[9],qubits[7];
-h qubits[7];
-h qubits[7];
-ccx qubits[1],qubits[9],qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[7];
-ccx qubits[2],qubits[9],qubits[7];
-h qubits[7];
-h qubits[7];
-cx qubits[0],qubits[5];
-h qubits[0];
-h qubits[0];
-ccx qubits[9],qubits[8],qubits[0];
-h qubits[0];
-h qubits[0];
-cx qubits[0],qubits[5];
-h qubits[3];
-h qubits[3];
-ccx qubits[9],qubits[1],qubits[3];
-h qubits[3];
-h qubits[3];
-cx qubits[3],qubits[5];
-cx qubits[0],qubits[7];
-cx qubits[3],qubits[0];
-cx qubits[0],qubits[3];
-cx qubits[3],qubits[1];
-cx qubits[0],qubits[6];
-h qubits[0];
-h qubits[0];
-ccx qubits[9],qubits[2],qubits[0];
-h qubits[0];
-h qubits[0];
-cx qubits[0],qubits[1];
-cx qubits[0],qubits[9];
-cx qubits[0],qubits[2];
-cx qubits[3],qubits[0];
-cx qubits[8],qubits[9];
-cx qubits[8],qubits[5];
-cx qubits[8],qubits[4];
-cx qubits[8],qubits[3];
-cx qubits[8],qubits[2];
-cx qubits[9],qubits[3];
-cx qubits[3],qubits[8];
-cx qubits[9],qubits[7];
-cx qubits[6],qubits[2];
-cx qubits[9],qubits[6];
-cx qubits[3],qubits[9];
-cx qubits[7],qubits[5];
-cx qubits[7],qubits[4];
-cx qubits[7],qubits[3];
-cx qubits[7],qubits[2];
-cx qubits[3],qubits[7];
-cx qubits[3],qubits[6];
-cx qubits[6],qubits[5];
-cx qubits[6],qubits[3];
-cx qubits[3],qubits[6];
-cx qubits[2],qubits[4];
-cx qubits[2],qubits[3];
-cx qubits[0],qubits[2];
-cx qubits[0],qubits[1];
-x qubits[0];
-cx qubits[2],qubits[0];
-cx qubits[0],qubits[2];
-cx qubits[2],qubits[3];
-cx qubits[2],qubits[5];
-cx qubits[6],qubits[2];
-cx qubits[6],qubits[4];
-cx qubits[7],qubits[3];
-cx qubits[7],qubits[2];
-cx qubits[9],qubits[7];
-cx qubits[9],qubits[5];
-cx qubits[8],qubits[0];
-cx qubits[8],qubits[2];
-cx qubits[8],qubits[3];
-cx qubits[8],qubits[5];
-cx qubits[3],qubits[1];
-cx qubits[3],qubits[0];
-cx qubits[0],qubits[3];
-cx qubits[0],qubits[2];
-cx qubits[0],qubits[7];
-cx qubits[0],qubits[9];
-cx qubits[5],qubits[9];
-cx qubits[5],qubits[1];
-h qubits[5];
-h qubits[5];
-ccx qubits[9],qubits[2],qubits[5];
-h qubits[5];
-h qubits[5];
-cx qubits[3],qubits[0];
-cx qubits[3],qubits[2];
-cx qubits[3],qubits[4];
-cx qubits[3],qubits[5];
-cx qubits[3],qubits[7];
-h qubits[3];
-h qubits[3];
-ccx qubits[9],qubits[1],qubits[3];
-h qubits[3];
-h qubits[3];
-cx qubits[0],qubits[3];
-cx qubits[0],qubits[5];
-cx qubits[0],qubits[6];
-h qubits[0];
-h qubits[0];
-ccx qubits[9],qubits[8],qubits[0];
-h qubits[0];
-h qubits[0];
-cx qubits[0],qubits[3];
-cx qubits[0],qubits[5];
-cx qubits[0],qubits[6];
-cx qubits[2],qubits[1];
-h qubits[7];
-h qubits[7];
-ccx qubits[1],qubits[9],qubits[7];
-h qubits[7];
-h qubits[7];
-cx qubits[9],qubits[7];
-cx qubits[8],qubits[7];
-cx qubits[0],qubits[9];
-cx qubits[0],qubits[8];
-cx qubits[7],qubits[0];
-cx qubits[1],qubits[7];
-cx qubits[2],qubits[8];
-cx qubits[6],qubits[9];
-cx qubits[6],qubits[8];
-h qubits[2];
-h qubits[2];
-ccx qubits[1],qubits[8],qubits[2];
-h qubits[2];
-h qubits[2];
-cx qubits[6],qubits[1];
-cx qubits[1],qubits[2];
-h qubits[6];
-h qubits[6];
-ccx qubits[1],qubits[7],qubits[6];
-h qubits[6];
-h qubits[6];
-cx qubits[0],qubits[1];
-cx qubits[0],qubits[2];
-cx qubits[0],qubits[6];
-x qubits[3];
-x qubits[5];
-h qubits[7];
-h qubits[7];
-ccx qubits[9],qubits[8],qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[9];
-h qubits[9];
-ccx qubits[10],qubits[7],qubits[9];
-h qubits[9];
-h qubits[9];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[0];
-h qubits[0];
-ccx qubits[10],qubits[5],qubits[0];
-h qubits[0];
-h qubits[0];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[9];
-h qubits[9];
-ccx qubits[10],qubits[7],qubits[9];
-h qubits[9];
-h qubits[9];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[7];
-h qubits[7];
-ccx qubits[9],qubits[8],qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[8];
-h qubits[8];
-ccx qubits[10],qubits[7],qubits[8];
-h qubits[8];
-h qubits[8];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[0];
-h qubits[0];
-ccx qubits[10],qubits[5],qubits[0];
-h qubits[0];
-h qubits[0];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[8];
-h qubits[8];
-ccx qubits[10],qubits[7],qubits[8];
-h qubits[8];
-h qubits[8];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-x qubits[5];
-x qubits[3];
-cx qubits[0],qubits[6];
-cx qubits[1],qubits[2];
-cx qubits[0],qubits[1];
-h qubits[6];
-h qubits[6];
-ccx qubits[1],qubits[7],qubits[6];
-h qubits[6];
-h qubits[6];
-cx qubits[6],qubits[1];
-h qubits[2];
-h qubits[2];
-ccx qubits[1],qubits[8],qubits[2];
-h qubits[2];
-h qubits[2];
-cx qubits[6],qubits[8];
-cx qubits[6],qubits[9];
-cx qubits[2],qubits[8];
-cx qubits[1],qubits[7];
-cx qubits[2],qubits[1];
-cx qubits[7],qubits[0];
-cx qubits[0],qubits[8];
-cx qubits[0],qubits[9];
-cx qubits[8],qubits[7];
-cx qubits[9],qubits[7];
-h qubits[7];
-h qubits[7];
-ccx qubits[1],qubits[9],qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[7];
-ccx qubits[2],qubits[9],qubits[7];
-h qubits[7];
-h qubits[7];
-cx qubits[0],qubits[6];
-cx qubits[0],qubits[5];
-cx qubits[0],qubits[3];
-h qubits[0];
-h qubits[0];
-ccx qubits[9],qubits[8],qubits[0];
-h qubits[0];
-h qubits[0];
-cx qubits[0],qubits[6];
-cx qubits[0],qubits[5];
-cx qubits[0],qubits[3];
-h qubits[3];
-h qubits[3];
-ccx qubits[9],qubits[1],qubits[3];
-h qubits[3];
-h qubits[3];
-cx qubits[3],qubits[7];
-cx qubits[3],qubits[5];
-cx qubits[3],qubits[4];
-cx qubits[3],qubits[2];
-cx qubits[3],qubits[0];
-cx qubits[0],qubits[3];
-cx qubits[3],qubits[1];
-h qubits[5];
-h qubits[5];
-ccx qubits[9],qubits[2],qubits[5];
-h qubits[5];
-h qubits[5];
-cx qubits[5],qubits[9];
-x qubits[5];
-cx qubits[9],qubits[7];
-cx qubits[5],qubits[1];
-cx qubits[0],qubits[9];
-cx qubits[0],qubits[2];
-cx qubits[8],qubits[3];
-cx qubits[3],qubits[0];
-cx qubits[8],qubits[5];
-cx qubits[8],qubits[2];
-cx qubits[9],qubits[5];
-cx qubits[7],qubits[3];
-cx qubits[7],qubits[2];
-cx qubits[6],qubits[5];
-cx qubits[6],qubits[4];
-cx qubits[6],qubits[2];
-cx qubits[2],qubits[6];
-cx qubits[6],qubits[3];
-cx qubits[2],qubits[5];
-cx qubits[2],qubits[1];
-cx qubits[2],qubits[7];
-cx qubits[2],qubits[8];
-cx qubits[6],qubits[0];
-cx qubits[6],qubits[2];
-cx qubits[6],qubits[7];
-cx qubits[6],qubits[9];
-cx qubits[3],qubits[7];
-cx qubits[7],qubits[3];
-cx qubits[7],qubits[8];
-cx qubits[7],qubits[9];
-cx qubits[7],qubits[6];
-cx qubits[0],qubits[9];
-cx qubits[9],qubits[0];
-cx qubits[9],qubits[5];
-cx qubits[8],qubits[2];
-cx qubits[8],qubits[3];
-cx qubits[3],qubits[4];
-cx qubits[3],qubits[0];
-cx qubits[0],qubits[3];
-cx qubits[0],qubits[5];
-cx qubits[0],qubits[7];
-cx qubits[0],qubits[9];
-cx qubits[3],qubits[9];
-cx qubits[3],qubits[6];
-cx qubits[3],qubits[7];
-cx qubits[3],qubits[8];
-h qubits[3];
-h qubits[3];
-ccx qubits[9],qubits[2],qubits[3];
-h qubits[3];
-h qubits[3];
-cx qubits[3],qubits[9];
-cx qubits[3],qubits[1];
-cx qubits[3],qubits[2];
-cx qubits[3],qubits[8];
-h qubits[3];
-h qubits[3];
-ccx qubits[9],qubits[1],qubits[3];
-h qubits[3];
-h qubits[3];
-cx qubits[3],qubits[8];
-cx qubits[3],qubits[1];
-cx qubits[3],qubits[2];
-h qubits[3];
-h qubits[3];
-ccx qubits[9],qubits[8],qubits[3];
-h qubits[3];
-h qubits[3];
-cx qubits[2],qubits[1];
-h qubits[7];
-h qubits[7];
-ccx qubits[1],qubits[9],qubits[7];
-h qubits[7];
-h qubits[7];
-cx qubits[9],qubits[7];
-cx qubits[8],qubits[7];
-cx qubits[0],qubits[9];
-cx qubits[0],qubits[8];
-cx qubits[7],qubits[0];
-cx qubits[1],qubits[7];
-cx qubits[2],qubits[8];
-cx qubits[6],qubits[9];
-cx qubits[6],qubits[8];
-h qubits[2];
-h qubits[2];
-ccx qubits[1],qubits[8],qubits[2];
-h qubits[2];
-h qubits[2];
-cx qubits[6],qubits[1];
-cx qubits[1],qubits[2];
-h qubits[6];
-h qubits[6];
-ccx qubits[1],qubits[7],qubits[6];
-h qubits[6];
-h qubits[6];
-cx qubits[0],qubits[1];
-cx qubits[0],qubits[2];
-cx qubits[0],qubits[6];
-x qubits[3];
-h qubits[7];
-h qubits[7];
-ccx qubits[9],qubits[8],qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[9];
-h qubits[9];
-ccx qubits[10],qubits[7],qubits[9];
-h qubits[9];
-h qubits[9];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[0];
-h qubits[0];
-ccx qubits[10],qubits[5],qubits[0];
-h qubits[0];
-h qubits[0];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[9];
-h qubits[9];
-ccx qubits[10],qubits[7],qubits[9];
-h qubits[9];
-h qubits[9];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[7];
-h qubits[7];
-ccx qubits[9],qubits[8],qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[8];
-h qubits[8];
-ccx qubits[10],qubits[7],qubits[8];
-h qubits[8];
-h qubits[8];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[0];
-h qubits[0];
-ccx qubits[10],qubits[5],qubits[0];
-h qubits[0];
-h qubits[0];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[8];
-h qubits[8];
-ccx qubits[10],qubits[7],qubits[8];
-h qubits[8];
-h qubits[8];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-x qubits[3];
-cx qubits[0],qubits[6];
-cx qubits[1],qubits[2];
-cx qubits[0],qubits[1];
-h qubits[6];
-h qubits[6];
-ccx qubits[1],qubits[7],qubits[6];
-h qubits[6];
-h qubits[6];
-cx qubits[6],qubits[1];
-h qubits[2];
-h qubits[2];
-ccx qubits[1],qubits[8],qubits[2];
-h qubits[2];
-h qubits[2];
-cx qubits[6],qubits[8];
-cx qubits[6],qubits[9];
-cx qubits[2],qubits[8];
-cx qubits[1],qubits[7];
-cx qubits[2],qubits[1];
-cx qubits[7],qubits[0];
-cx qubits[0],qubits[8];
-cx qubits[8],qubits[7];
-cx qubits[9],qubits[7];
-cx qubits[0],qubits[9];
-h qubits[7];
-h qubits[7];
-ccx qubits[1],qubits[9],qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[7];
-ccx qubits[2],qubits[9],qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[3];
-h qubits[3];
-ccx qubits[9],qubits[8],qubits[3];
-h qubits[3];
-h qubits[3];
-cx qubits[3],qubits[2];
-cx qubits[3],qubits[1];
-cx qubits[3],qubits[8];
-h qubits[3];
-h qubits[3];
-ccx qubits[9],qubits[1],qubits[3];
-h qubits[3];
-h qubits[3];
-cx qubits[3],qubits[8];
-cx qubits[3],qubits[2];
-cx qubits[3],qubits[1];
-cx qubits[3],qubits[9];
-h qubits[3];
-h qubits[3];
-ccx qubits[9],qubits[2],qubits[3];
-h qubits[3];
-h qubits[3];
-cx qubits[7],qubits[6];
-cx qubits[3],qubits[7];
-cx qubits[3],qubits[8];
-cx qubits[0],qubits[3];
-cx qubits[3],qubits[4];
-cx qubits[3],qubits[9];
-cx qubits[0],qubits[5];
-cx qubits[3],qubits[0];
-cx qubits[8],qubits[3];
-cx qubits[8],qubits[2];
-cx qubits[9],qubits[5];
-cx qubits[9],qubits[0];
-cx qubits[0],qubits[9];
-cx qubits[7],qubits[9];
-cx qubits[7],qubits[8];
-cx qubits[7],qubits[3];
-cx qubits[3],qubits[7];
-cx qubits[6],qubits[9];
-cx qubits[0],qubits[7];
-cx qubits[7],qubits[0];
-cx qubits[2],qubits[0];
-x qubits[7];
-cx qubits[6],qubits[2];
-cx qubits[2],qubits[6];
-x qubits[2];
-cx qubits[2],qubits[8];
-x qubits[1];
-cx qubits[5],qubits[2];
-cx qubits[2],qubits[5];
-cx qubits[5],qubits[6];
-cx qubits[6],qubits[1];
-cx qubits[6],qubits[5];
-cx qubits[6],qubits[8];
-cx qubits[6],qubits[9];
-cx qubits[7],qubits[2];
-cx qubits[7],qubits[3];
-cx qubits[7],qubits[8];
-cx qubits[8],qubits[7];
-cx qubits[0],qubits[9];
-cx qubits[9],qubits[7];
-cx qubits[0],qubits[1];
-cx qubits[9],qubits[0];
-cx qubits[9],qubits[2];
-cx qubits[9],qubits[3];
-cx qubits[9],qubits[4];
-cx qubits[8],qubits[1];
-cx qubits[8],qubits[2];
-cx qubits[8],qubits[4];
-cx qubits[5],qubits[6];
-cx qubits[5],qubits[9];
-cx qubits[8],qubits[5];
-cx qubits[0],qubits[3];
-cx qubits[0],qubits[4];
-cx qubits[0],qubits[7];
-cx qubits[0],qubits[9];
-h qubits[5];
-h qubits[5];
-ccx qubits[9],qubits[2],qubits[5];
-h qubits[5];
-h qubits[5];
-cx qubits[3],qubits[8];
-cx qubits[2],qubits[3];
-h qubits[2];
-h qubits[2];
-ccx qubits[9],qubits[1],qubits[2];
-h qubits[2];
-h qubits[2];
-cx qubits[2],qubits[3];
-cx qubits[3],qubits[9];
-cx qubits[3],qubits[0];
-cx qubits[3],qubits[6];
-h qubits[3];
-h qubits[3];
-ccx qubits[9],qubits[8],qubits[3];
-h qubits[3];
-h qubits[3];
-cx qubits[2],qubits[1];
-h qubits[7];
-h qubits[7];
-ccx qubits[1],qubits[9],qubits[7];
-h qubits[7];
-h qubits[7];
-cx qubits[9],qubits[7];
-cx qubits[0],qubits[9];
-cx qubits[0],qubits[8];
-cx qubits[7],qubits[0];
-cx qubits[1],qubits[7];
-cx qubits[2],qubits[8];
-cx qubits[6],qubits[9];
-cx qubits[6],qubits[8];
-h qubits[2];
-h qubits[2];
-ccx qubits[1],qubits[8],qubits[2];
-h qubits[2];
-h qubits[2];
-cx qubits[6],qubits[1];
-cx qubits[1],qubits[2];
-h qubits[6];
-h qubits[6];
-ccx qubits[1],qubits[7],qubits[6];
-h qubits[6];
-h qubits[6];
-cx qubits[0],qubits[1];
-cx qubits[0],qubits[2];
-cx qubits[0],qubits[6];
-x qubits[3];
-x qubits[5];
-h qubits[7];
-h qubits[7];
-ccx qubits[9],qubits[8],qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[9];
-h qubits[9];
-ccx qubits[10],qubits[7],qubits[9];
-h qubits[9];
-h qubits[9];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[0];
-h qubits[0];
-ccx qubits[10],qubits[5],qubits[0];
-h qubits[0];
-h qubits[0];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[9];
-h qubits[9];
-ccx qubits[10],qubits[7],qubits[9];
-h qubits[9];
-h qubits[9];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[7];
-h qubits[7];
-ccx qubits[9],qubits[8],qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[8];
-h qubits[8];
-ccx qubits[10],qubits[7],qubits[8];
-h qubits[8];
-h qubits[8];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[0];
-h qubits[0];
-ccx qubits[10],qubits[5],qubits[0];
-h qubits[0];
-h qubits[0];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[8];
-h qubits[8];
-ccx qubits[10],qubits[7],qubits[8];
-h qubits[8];
-h qubits[8];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-x qubits[5];
-x qubits[4];
-x qubits[3];
-cx qubits[0],qubits[6];
-cx qubits[1],qubits[2];
-cx qubits[0],qubits[1];
-h qubits[6];
-h qubits[6];
-ccx qubits[1],qubits[7],qubits[6];
-h qubits[6];
-h qubits[6];
-cx qubits[6],qubits[1];
-h qubits[2];
-h qubits[2];
-ccx qubits[1],qubits[8],qubits[2];
-h qubits[2];
-h qubits[2];
-cx qubits[6],qubits[8];
-cx qubits[6],qubits[9];
-cx qubits[2],qubits[8];
-cx qubits[1],qubits[7];
-cx qubits[2],qubits[1];
-cx qubits[7],qubits[0];
-cx qubits[0],qubits[8];
-cx qubits[8],qubits[7];
-cx qubits[9],qubits[7];
-cx qubits[0],qubits[9];
-h qubits[7];
-h qubits[7];
-ccx qubits[1],qubits[9],qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[7];
-ccx qubits[2],qubits[9],qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[3];
-h qubits[3];
-ccx qubits[9],qubits[8],qubits[3];
-h qubits[3];
-h qubits[3];
-cx qubits[3],qubits[6];
-cx qubits[3],qubits[0];
-cx qubits[3],qubits[8];
-cx qubits[3],qubits[9];
-cx qubits[7],qubits[3];
-cx qubits[2],qubits[7];
-cx qubits[2],qubits[8];
-h qubits[2];
-h qubits[2];
-ccx qubits[9],qubits[1],qubits[2];
-h qubits[2];
-h qubits[2];
-cx qubits[2],qubits[7];
-cx qubits[2],qubits[8];
-h qubits[5];
-h qubits[5];
-ccx qubits[9],qubits[2],qubits[5];
-h qubits[5];
-h qubits[5];
-cx qubits[5],qubits[6];
-cx qubits[5],qubits[9];
-cx qubits[0],qubits[9];
-cx qubits[0],qubits[4];
-cx qubits[0],qubits[3];
-cx qubits[0],qubits[1];
-cx qubits[9],qubits[4];
-cx qubits[9],qubits[2];
-cx qubits[9],qubits[1];
-cx qubits[8],qubits[9];
-cx qubits[6],qubits[5];
-cx qubits[8],qubits[6];
-cx qubits[9],qubits[7];
-cx qubits[9],qubits[0];
-cx qubits[0],qubits[9];
-cx qubits[7],qubits[8];
-cx qubits[7],qubits[2];
-cx qubits[7],qubits[0];
-cx qubits[0],qubits[7];
-cx qubits[6],qubits[9];
-cx qubits[6],qubits[8];
-x qubits[6];
-x qubits[1];
-cx qubits[5],qubits[8];
-cx qubits[2],qubits[5];
-cx qubits[5],qubits[2];
-cx qubits[2],qubits[3];
-cx qubits[2],qubits[0];
-x qubits[2];
-cx qubits[2],qubits[1];
-cx qubits[2],qubits[9];
-cx qubits[9],qubits[2];
-cx qubits[6],qubits[9];
-cx qubits[6],qubits[0];
-cx qubits[9],qubits[7];
-cx qubits[0],qubits[7];
-cx qubits[7],qubits[0];
-cx qubits[0],qubits[7];
-cx qubits[8],qubits[5];
-cx qubits[9],qubits[8];
-cx qubits[8],qubits[9];
-cx qubits[8],qubits[1];
-cx qubits[8],qubits[2];
-cx qubits[8],qubits[6];
-cx qubits[0],qubits[2];
-cx qubits[0],qubits[5];
-cx qubits[0],qubits[6];
-cx qubits[0],qubits[9];
-cx qubits[3],qubits[7];
-cx qubits[3],qubits[9];
-cx qubits[3],qubits[2];
-cx qubits[4],qubits[1];
-cx qubits[4],qubits[5];
-cx qubits[3],qubits[4];
-h qubits[3];
-h qubits[3];
-ccx qubits[9],qubits[2],qubits[3];
-h qubits[3];
-h qubits[3];
-h qubits[4];
-h qubits[4];
-ccx qubits[9],qubits[1],qubits[4];
-h qubits[4];
-h qubits[4];
-cx qubits[3],qubits[9];
-cx qubits[3],qubits[1];
-cx qubits[3],qubits[5];
-h qubits[3];
-h qubits[3];
-ccx qubits[9],qubits[8],qubits[3];
-h qubits[3];
-h qubits[3];
-cx qubits[2],qubits[1];
-h qubits[7];
-h qubits[7];
-ccx qubits[1],qubits[9],qubits[7];
-h qubits[7];
-h qubits[7];
-cx qubits[9],qubits[7];
-cx qubits[0],qubits[9];
-cx qubits[0],qubits[8];
-cx qubits[7],qubits[0];
-cx qubits[1],qubits[7];
-cx qubits[2],qubits[8];
-cx qubits[6],qubits[9];
-cx qubits[6],qubits[8];
-h qubits[2];
-h qubits[2];
-ccx qubits[1],qubits[8],qubits[2];
-h qubits[2];
-h qubits[2];
-cx qubits[6],qubits[1];
-cx qubits[1],qubits[2];
-h qubits[6];
-h qubits[6];
-ccx qubits[1],qubits[7],qubits[6];
-h qubits[6];
-h qubits[6];
-cx qubits[0],qubits[1];
-cx qubits[0],qubits[2];
-cx qubits[0],qubits[6];
-x qubits[3];
-x qubits[4];
-h qubits[7];
-h qubits[7];
-ccx qubits[9],qubits[8],qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[9];
-h qubits[9];
-ccx qubits[10],qubits[7],qubits[9];
-h qubits[9];
-h qubits[9];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[0];
-h qubits[0];
-ccx qubits[10],qubits[5],qubits[0];
-h qubits[0];
-h qubits[0];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[9];
-h qubits[9];
-ccx qubits[10],qubits[7],qubits[9];
-h qubits[9];
-h qubits[9];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[7];
-h qubits[7];
-ccx qubits[9],qubits[8],qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[8];
-h qubits[8];
-ccx qubits[10],qubits[7],qubits[8];
-h qubits[8];
-h qubits[8];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[0];
-h qubits[0];
-ccx qubits[10],qubits[5],qubits[0];
-h qubits[0];
-h qubits[0];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[8];
-h qubits[8];
-ccx qubits[10],qubits[7],qubits[8];
-h qubits[8];
-h qubits[8];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-x qubits[5];
-x qubits[4];
-x qubits[3];
-cx qubits[0],qubits[6];
-cx qubits[1],qubits[2];
-cx qubits[0],qubits[1];
-h qubits[6];
-h qubits[6];
-ccx qubits[1],qubits[7],qubits[6];
-h qubits[6];
-h qubits[6];
-cx qubits[6],qubits[1];
-h qubits[2];
-h qubits[2];
-ccx qubits[1],qubits[8],qubits[2];
-h qubits[2];
-h qubits[2];
-cx qubits[6],qubits[8];
-cx qubits[6],qubits[9];
-cx qubits[2],qubits[8];
-cx qubits[1],qubits[7];
-cx qubits[2],qubits[1];
-cx qubits[7],qubits[0];
-cx qubits[0],qubits[8];
-cx qubits[9],qubits[7];
-cx qubits[0],qubits[9];
-h qubits[7];
-h qubits[7];
-ccx qubits[1],qubits[9],qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[7];
-ccx qubits[2],qubits[9],qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[3];
-h qubits[3];
-ccx qubits[9],qubits[8],qubits[3];
-h qubits[3];
-h qubits[3];
-cx qubits[3],qubits[5];
-cx qubits[3],qubits[1];
-cx qubits[3],qubits[9];
-h qubits[4];
-h qubits[4];
-ccx qubits[9],qubits[1],qubits[4];
-h qubits[4];
-h qubits[4];
-cx qubits[4],qubits[5];
-x qubits[4];
-cx qubits[4],qubits[1];
-cx qubits[0],qubits[6];
-h qubits[3];
-h qubits[3];
-ccx qubits[9],qubits[2],qubits[3];
-h qubits[3];
-h qubits[3];
-cx qubits[3],qubits[7];
-cx qubits[3],qubits[5];
-cx qubits[3],qubits[4];
-cx qubits[3],qubits[1];
-cx qubits[3],qubits[2];
-cx qubits[3],qubits[9];
-cx qubits[0],qubits[9];
-cx qubits[0],qubits[5];
-cx qubits[0],qubits[2];
-cx qubits[8],qubits[9];
-cx qubits[8],qubits[6];
-cx qubits[8],qubits[5];
-cx qubits[8],qubits[2];
-cx qubits[8],qubits[1];
-cx qubits[9],qubits[8];
-cx qubits[9],qubits[7];
-cx qubits[9],qubits[5];
-cx qubits[9],qubits[2];
-cx qubits[9],qubits[0];
-cx qubits[7],qubits[0];
-cx qubits[0],qubits[7];
-cx qubits[2],qubits[9];
-cx qubits[2],qubits[1];
-cx qubits[6],qubits[2];
-cx qubits[2],qubits[6];
-cx qubits[0],qubits[6];
-cx qubits[6],qubits[0];
-cx qubits[0],qubits[6];
-cx qubits[2],qubits[8];
-cx qubits[2],qubits[3];
-cx qubits[3],qubits[2];
-cx qubits[2],qubits[1];
-cx qubits[2],qubits[3];
-cx qubits[2],qubits[9];
-cx qubits[6],qubits[4];
-cx qubits[6],qubits[5];
-cx qubits[7],qubits[0];
-cx qubits[7],qubits[3];
-cx qubits[7],qubits[5];
-cx qubits[7],qubits[8];
-cx qubits[5],qubits[9];
-cx qubits[9],qubits[1];
-cx qubits[9],qubits[5];
-cx qubits[9],qubits[6];
-cx qubits[5],qubits[7];
-cx qubits[8],qubits[4];
-cx qubits[0],qubits[5];
-cx qubits[3],qubits[9];
-cx qubits[3],qubits[0];
-cx qubits[3],qubits[1];
-cx qubits[3],qubits[4];
-cx qubits[3],qubits[7];
-h qubits[3];
-h qubits[3];
-ccx qubits[9],qubits[2],qubits[3];
-h qubits[3];
-h qubits[3];
-cx qubits[5],qubits[9];
-cx qubits[5],qubits[1];
-h qubits[5];
-h qubits[5];
-ccx qubits[9],qubits[1],qubits[5];
-h qubits[5];
-h qubits[5];
-cx qubits[0],qubits[3];
-cx qubits[0],qubits[5];
-cx qubits[0],qubits[6];
-h qubits[0];
-h qubits[0];
-ccx qubits[9],qubits[8],qubits[0];
-h qubits[0];
-h qubits[0];
-cx qubits[0],qubits[3];
-cx qubits[0],qubits[5];
-cx qubits[6],qubits[8];
-cx qubits[0],qubits[6];
-cx qubits[2],qubits[1];
-h qubits[7];
-h qubits[7];
-ccx qubits[1],qubits[9],qubits[7];
-h qubits[7];
-h qubits[7];
-cx qubits[9],qubits[7];
-cx qubits[0],qubits[9];
-cx qubits[7],qubits[0];
-cx qubits[1],qubits[7];
-cx qubits[2],qubits[8];
-cx qubits[6],qubits[9];
-h qubits[2];
-h qubits[2];
-ccx qubits[1],qubits[8],qubits[2];
-h qubits[2];
-h qubits[2];
-cx qubits[6],qubits[1];
-cx qubits[1],qubits[2];
-h qubits[6];
-h qubits[6];
-ccx qubits[1],qubits[7],qubits[6];
-h qubits[6];
-h qubits[6];
-cx qubits[0],qubits[1];
-cx qubits[0],qubits[2];
-cx qubits[0],qubits[6];
-x qubits[3];
-x qubits[5];
-h qubits[7];
-h qubits[7];
-ccx qubits[9],qubits[8],qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[9];
-h qubits[9];
-ccx qubits[10],qubits[7],qubits[9];
-h qubits[9];
-h qubits[9];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[0];
-h qubits[0];
-ccx qubits[10],qubits[5],qubits[0];
-h qubits[0];
-h qubits[0];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[9];
-h qubits[9];
-ccx qubits[10],qubits[7],qubits[9];
-h qubits[9];
-h qubits[9];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[7];
-h qubits[7];
-ccx qubits[9],qubits[8],qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[8];
-h qubits[8];
-ccx qubits[10],qubits[7],qubits[8];
-h qubits[8];
-h qubits[8];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[0];
-h qubits[0];
-ccx qubits[10],qubits[5],qubits[0];
-h qubits[0];
-h qubits[0];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[8];
-h qubits[8];
-ccx qubits[10],qubits[7],qubits[8];
-h qubits[8];
-h qubits[8];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-x qubits[5];
-x qubits[3];
-cx qubits[0],qubits[6];
-cx qubits[1],qubits[2];
-cx qubits[0],qubits[1];
-h qubits[6];
-h qubits[6];
-ccx qubits[1],qubits[7],qubits[6];
-h qubits[6];
-h qubits[6];
-cx qubits[6],qubits[1];
-h qubits[2];
-h qubits[2];
-ccx qubits[1],qubits[8],qubits[2];
-h qubits[2];
-h qubits[2];
-cx qubits[6],qubits[8];
-cx qubits[6],qubits[9];
-cx qubits[2],qubits[8];
-cx qubits[1],qubits[7];
-cx qubits[2],qubits[1];
-cx qubits[7],qubits[0];
-cx qubits[0],qubits[8];
-cx qubits[0],qubits[9];
-cx qubits[9],qubits[7];
-h qubits[7];
-h qubits[7];
-ccx qubits[1],qubits[9],qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[7];
-ccx qubits[2],qubits[9],qubits[7];
-h qubits[7];
-h qubits[7];
-cx qubits[0],qubits[6];
-cx qubits[0],qubits[5];
-cx qubits[0],qubits[3];
-h qubits[0];
-h qubits[0];
-ccx qubits[9],qubits[8],qubits[0];
-h qubits[0];
-h qubits[0];
-cx qubits[0],qubits[6];
-cx qubits[0],qubits[5];
-cx qubits[0],qubits[3];
-h qubits[5];
-h qubits[5];
-ccx qubits[9],qubits[1],qubits[5];
-h qubits[5];
-h qubits[5];
-cx qubits[5],qubits[7];
-cx qubits[5],qubits[1];
-cx qubits[5],qubits[9];
-h qubits[3];
-h qubits[3];
-ccx qubits[9],qubits[2],qubits[3];
-h qubits[3];
-h qubits[3];
-cx qubits[3],qubits[7];
-cx qubits[3],qubits[4];
-cx qubits[3],qubits[1];
-cx qubits[3],qubits[0];
-cx qubits[3],qubits[9];
-cx qubits[0],qubits[7];
-cx qubits[0],qubits[5];
-cx qubits[8],qubits[4];
-cx qubits[9],qubits[6];
-cx qubits[9],qubits[5];
-cx qubits[9],qubits[1];
-cx qubits[5],qubits[9];
-cx qubits[7],qubits[8];
-cx qubits[7],qubits[5];
-cx qubits[7],qubits[3];
-cx qubits[7],qubits[0];
-cx qubits[6],qubits[5];
-cx qubits[6],qubits[4];
-cx qubits[6],qubits[0];
-cx qubits[0],qubits[6];
-cx qubits[2],qubits[9];
-cx qubits[2],qubits[3];
-x qubits[2];
-cx qubits[2],qubits[1];
-cx qubits[3],qubits[2];
-x qubits[3];
-cx qubits[0],qubits[2];
-cx qubits[2],qubits[0];
-cx qubits[2],qubits[1];
-cx qubits[2],qubits[3];
-cx qubits[4],qubits[7];
-cx qubits[7],qubits[4];
-cx qubits[3],qubits[6];
-cx qubits[6],qubits[3];
-cx qubits[6],qubits[2];
-cx qubits[2],qubits[4];
-cx qubits[7],qubits[6];
-cx qubits[6],qubits[8];
-cx qubits[7],qubits[5];
-cx qubits[7],qubits[9];
-cx qubits[4],qubits[9];
-cx qubits[9],qubits[1];
-cx qubits[9],qubits[4];
-cx qubits[9],qubits[6];
-cx qubits[9],qubits[8];
-cx qubits[8],qubits[0];
-cx qubits[8],qubits[4];
-cx qubits[8],qubits[5];
-cx qubits[8],qubits[7];
-cx qubits[8],qubits[9];
-cx qubits[5],qubits[0];
-cx qubits[0],qubits[1];
-cx qubits[5],qubits[2];
-cx qubits[0],qubits[5];
-cx qubits[0],qubits[7];
-cx qubits[0],qubits[9];
-cx qubits[5],qubits[9];
-cx qubits[3],qubits[5];
-cx qubits[5],qubits[6];
-cx qubits[5],qubits[8];
-cx qubits[5],qubits[7];
-x qubits[5];
-h qubits[5];
-h qubits[5];
-ccx qubits[2],qubits[9],qubits[5];
-h qubits[5];
-h qubits[5];
-cx qubits[9],qubits[7];
-x qubits[7];
-cx qubits[5],qubits[7];
-cx qubits[3],qubits[4];
-cx qubits[3],qubits[7];
-h qubits[3];
-h qubits[3];
-ccx qubits[9],qubits[1],qubits[3];
-h qubits[3];
-h qubits[3];
-cx qubits[3],qubits[5];
-cx qubits[3],qubits[6];
-cx qubits[3],qubits[0];
-h qubits[3];
-h qubits[3];
-ccx qubits[9],qubits[8],qubits[3];
-h qubits[3];
-h qubits[3];
-h qubits[7];
-h qubits[7];
-ccx qubits[1],qubits[9],qubits[7];
-h qubits[7];
-h qubits[7];
-cx qubits[8],qubits[7];
-cx qubits[0],qubits[9];
-cx qubits[0],qubits[8];
-cx qubits[7],qubits[0];
-cx qubits[2],qubits[1];
-cx qubits[1],qubits[7];
-cx qubits[2],qubits[8];
-cx qubits[6],qubits[9];
-cx qubits[6],qubits[8];
-h qubits[2];
-h qubits[2];
-ccx qubits[1],qubits[8],qubits[2];
-h qubits[2];
-h qubits[2];
-cx qubits[6],qubits[1];
-cx qubits[1],qubits[2];
-h qubits[6];
-h qubits[6];
-ccx qubits[1],qubits[7],qubits[6];
-h qubits[6];
-h qubits[6];
-cx qubits[0],qubits[1];
-cx qubits[0],qubits[2];
-cx qubits[0],qubits[6];
-x qubits[3];
-x qubits[4];
-h qubits[7];
-h qubits[7];
-ccx qubits[9],qubits[8],qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[9];
-h qubits[9];
-ccx qubits[10],qubits[7],qubits[9];
-h qubits[9];
-h qubits[9];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[0];
-h qubits[0];
-ccx qubits[10],qubits[5],qubits[0];
-h qubits[0];
-h qubits[0];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[9];
-h qubits[9];
-ccx qubits[10],qubits[7],qubits[9];
-h qubits[9];
-h qubits[9];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[7];
-h qubits[7];
-ccx qubits[9],qubits[8],qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[8];
-h qubits[8];
-ccx qubits[10],qubits[7],qubits[8];
-h qubits[8];
-h qubits[8];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[0];
-h qubits[0];
-ccx qubits[10],qubits[5],qubits[0];
-h qubits[0];
-h qubits[0];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[8];
-h qubits[8];
-ccx qubits[10],qubits[7],qubits[8];
-h qubits[8];
-h qubits[8];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-x qubits[5];
-x qubits[4];
-x qubits[3];
-cx qubits[0],qubits[6];
-cx qubits[1],qubits[2];
-cx qubits[0],qubits[1];
-h qubits[6];
-h qubits[6];
-ccx qubits[1],qubits[7],qubits[6];
-h qubits[6];
-h qubits[6];
-cx qubits[6],qubits[1];
-h qubits[2];
-h qubits[2];
-ccx qubits[1],qubits[8],qubits[2];
-h qubits[2];
-h qubits[2];
-cx qubits[6],qubits[8];
-cx qubits[6],qubits[9];
-cx qubits[2],qubits[8];
-cx qubits[1],qubits[7];
-cx qubits[2],qubits[1];
-cx qubits[7],qubits[0];
-cx qubits[0],qubits[8];
-cx qubits[0],qubits[9];
-cx qubits[8],qubits[7];
-cx qubits[9],qubits[7];
-h qubits[7];
-h qubits[7];
-ccx qubits[1],qubits[9],qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[7];
-ccx qubits[2],qubits[9],qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[3];
-h qubits[3];
-ccx qubits[9],qubits[8],qubits[3];
-h qubits[3];
-h qubits[3];
-cx qubits[3],qubits[0];
-cx qubits[3],qubits[6];
-cx qubits[3],qubits[5];
-h qubits[3];
-h qubits[3];
-ccx qubits[9],qubits[1],qubits[3];
-h qubits[3];
-h qubits[3];
-cx qubits[3],qubits[8];
-cx qubits[3],qubits[7];
-cx qubits[3],qubits[6];
-cx qubits[3],qubits[5];
-cx qubits[3],qubits[4];
-h qubits[5];
-h qubits[5];
-ccx qubits[9],qubits[2],qubits[5];
-h qubits[5];
-h qubits[5];
-cx qubits[5],qubits[8];
-cx qubits[5],qubits[6];
-cx qubits[0],qubits[5];
-cx qubits[5],qubits[2];
-cx qubits[8],qubits[5];
-cx qubits[5],qubits[9];
-cx qubits[0],qubits[7];
-cx qubits[0],qubits[1];
-cx qubits[5],qubits[0];
-cx qubits[8],qubits[7];
-cx qubits[9],qubits[8];
-cx qubits[8],qubits[4];
-cx qubits[9],qubits[6];
-cx qubits[9],qubits[1];
-cx qubits[7],qubits[4];
-cx qubits[4],qubits[9];
-cx qubits[6],qubits[8];
-cx qubits[7],qubits[6];
-cx qubits[7],qubits[5];
-cx qubits[6],qubits[4];
-cx qubits[4],qubits[7];
-cx qubits[6],qubits[3];
-cx qubits[6],qubits[2];
-cx qubits[3],qubits[6];
-cx qubits[2],qubits[7];
-cx qubits[2],qubits[4];
-cx qubits[2],qubits[3];
-cx qubits[2],qubits[1];
-cx qubits[2],qubits[0];
-cx qubits[0],qubits[2];
-x qubits[1];
-cx qubits[4],qubits[2];
-cx qubits[2],qubits[4];
-cx qubits[2],qubits[6];
-cx qubits[2],qubits[7];
-cx qubits[0],qubits[6];
-cx qubits[6],qubits[0];
-cx qubits[6],qubits[4];
-cx qubits[7],qubits[6];
-cx qubits[6],qubits[8];
-cx qubits[6],qubits[9];
-cx qubits[7],qubits[0];
-cx qubits[7],qubits[2];
-cx qubits[0],qubits[7];
-cx qubits[9],qubits[7];
-cx qubits[0],qubits[9];
-cx qubits[0],qubits[8];
-cx qubits[8],qubits[0];
-cx qubits[9],qubits[0];
-cx qubits[0],qubits[8];
-cx qubits[8],qubits[6];
-cx qubits[5],qubits[8];
-cx qubits[8],qubits[7];
-cx qubits[0],qubits[4];
-cx qubits[3],qubits[2];
-cx qubits[3],qubits[0];
-cx qubits[3],qubits[7];
-x qubits[3];
-h qubits[3];
-h qubits[3];
-ccx qubits[2],qubits[9],qubits[3];
-h qubits[3];
-h qubits[3];
-cx qubits[3],qubits[7];
-cx qubits[5],qubits[1];
-cx qubits[5],qubits[0];
-cx qubits[5],qubits[7];
-x qubits[5];
-h qubits[5];
-h qubits[5];
-ccx qubits[1],qubits[9],qubits[5];
-h qubits[5];
-h qubits[5];
-cx qubits[5],qubits[7];
-cx qubits[4],qubits[8];
-cx qubits[4],qubits[0];
-h qubits[4];
-h qubits[4];
-ccx qubits[9],qubits[8],qubits[4];
-h qubits[4];
-h qubits[4];
-cx qubits[8],qubits[7];
-cx qubits[0],qubits[9];
-cx qubits[0],qubits[8];
-cx qubits[7],qubits[0];
-cx qubits[2],qubits[1];
-cx qubits[1],qubits[7];
-cx qubits[2],qubits[8];
-cx qubits[6],qubits[9];
-cx qubits[6],qubits[8];
-h qubits[2];
-h qubits[2];
-ccx qubits[1],qubits[8],qubits[2];
-h qubits[2];
-h qubits[2];
-cx qubits[6],qubits[1];
-cx qubits[1],qubits[2];
-h qubits[6];
-h qubits[6];
-ccx qubits[1],qubits[7],qubits[6];
-h qubits[6];
-h qubits[6];
-cx qubits[0],qubits[1];
-cx qubits[0],qubits[2];
-cx qubits[0],qubits[6];
-x qubits[4];
-h qubits[7];
-h qubits[7];
-ccx qubits[9],qubits[8],qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[9];
-h qubits[9];
-ccx qubits[10],qubits[7],qubits[9];
-h qubits[9];
-h qubits[9];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[0];
-h qubits[0];
-ccx qubits[10],qubits[5],qubits[0];
-h qubits[0];
-h qubits[0];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[9];
-h qubits[9];
-ccx qubits[10],qubits[7],qubits[9];
-h qubits[9];
-h qubits[9];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[7];
-h qubits[7];
-ccx qubits[9],qubits[8],qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[8];
-h qubits[8];
-ccx qubits[10],qubits[7],qubits[8];
-h qubits[8];
-h qubits[8];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[0];
-h qubits[0];
-ccx qubits[10],qubits[5],qubits[0];
-h qubits[0];
-h qubits[0];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[8];
-h qubits[8];
-ccx qubits[10],qubits[7],qubits[8];
-h qubits[8];
-h qubits[8];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-x qubits[5];
-x qubits[4];
-x qubits[3];
-cx qubits[0],qubits[6];
-cx qubits[1],qubits[2];
-cx qubits[0],qubits[1];
-h qubits[6];
-h qubits[6];
-ccx qubits[1],qubits[7],qubits[6];
-h qubits[6];
-h qubits[6];
-cx qubits[6],qubits[1];
-h qubits[2];
-h qubits[2];
-ccx qubits[1],qubits[8],qubits[2];
-h qubits[2];
-h qubits[2];
-cx qubits[6],qubits[8];
-cx qubits[6],qubits[9];
-cx qubits[2],qubits[8];
-cx qubits[1],qubits[7];
-cx qubits[2],qubits[1];
-cx qubits[7],qubits[0];
-cx qubits[0],qubits[8];
-cx qubits[0],qubits[9];
-cx qubits[8],qubits[7];
-cx qubits[9],qubits[7];
-h qubits[7];
-h qubits[7];
-ccx qubits[1],qubits[9],qubits[7];
-h qubits[7];
-h qubits[7];
-cx qubits[3],qubits[7];
-h qubits[3];
-h qubits[3];
-ccx qubits[2],qubits[9],qubits[3];
-h qubits[3];
-h qubits[3];
-cx qubits[3],qubits[2];
-cx qubits[3],qubits[7];
-h qubits[4];
-h qubits[4];
-ccx qubits[9],qubits[8],qubits[4];
-h qubits[4];
-h qubits[4];
-cx qubits[4],qubits[0];
-cx qubits[4],qubits[8];
-h qubits[5];
-h qubits[5];
-ccx qubits[9],qubits[1],qubits[5];
-h qubits[5];
-h qubits[5];
-cx qubits[8],qubits[7];
-cx qubits[5],qubits[8];
-cx qubits[5],qubits[0];
-cx qubits[5],qubits[1];
-cx qubits[3],qubits[0];
-cx qubits[8],qubits[6];
-cx qubits[0],qubits[8];
-cx qubits[0],qubits[4];
-cx qubits[8],qubits[9];
-cx qubits[9],qubits[0];
-cx qubits[7],qubits[0];
-cx qubits[0],qubits[8];
-cx qubits[8],qubits[9];
-cx qubits[7],qubits[6];
-cx qubits[7],qubits[2];
-cx qubits[6],qubits[9];
-cx qubits[6],qubits[8];
-cx qubits[6],qubits[4];
-cx qubits[6],qubits[0];
-cx qubits[0],qubits[6];
-cx qubits[2],qubits[7];
-cx qubits[2],qubits[6];
-cx qubits[2],qubits[4];
-cx qubits[4],qubits[2];
-cx qubits[2],qubits[0];
-x qubits[2];
-cx qubits[2],qubits[4];
-cx qubits[2],qubits[7];
-cx qubits[2],qubits[8];
-cx qubits[0],qubits[6];
-cx qubits[6],qubits[0];
-cx qubits[6],qubits[4];
-cx qubits[6],qubits[9];
-cx qubits[4],qubits[7];
-cx qubits[7],qubits[1];
-cx qubits[7],qubits[4];
-cx qubits[7],qubits[6];
-cx qubits[7],qubits[9];
-cx qubits[0],qubits[9];
-cx qubits[9],qubits[0];
-cx qubits[9],qubits[1];
-cx qubits[8],qubits[7];
-cx qubits[8],qubits[2];
-cx qubits[9],qubits[2];
-cx qubits[9],qubits[7];
-cx qubits[3],qubits[4];
-cx qubits[8],qubits[3];
-cx qubits[8],qubits[6];
-cx qubits[3],qubits[0];
-cx qubits[0],qubits[2];
-cx qubits[0],qubits[9];
-cx qubits[1],qubits[6];
-cx qubits[1],qubits[8];
-h qubits[1];
-h qubits[1];
-ccx qubits[9],qubits[2],qubits[1];
-h qubits[1];
-h qubits[1];
-cx qubits[1],qubits[6];
-cx qubits[1],qubits[8];
-cx qubits[0],qubits[4];
-cx qubits[0],qubits[5];
-cx qubits[0],qubits[6];
-cx qubits[0],qubits[7];
-h qubits[0];
-h qubits[0];
-ccx qubits[9],qubits[1],qubits[0];
-h qubits[0];
-h qubits[0];
-cx qubits[3],qubits[5];
-cx qubits[0],qubits[3];
-cx qubits[0],qubits[6];
-cx qubits[3],qubits[0];
-cx qubits[0],qubits[7];
-cx qubits[3],qubits[9];
-cx qubits[3],qubits[1];
-h qubits[3];
-h qubits[3];
-ccx qubits[9],qubits[8],qubits[3];
-h qubits[3];
-h qubits[3];
-cx qubits[2],qubits[1];
-h qubits[7];
-h qubits[7];
-ccx qubits[1],qubits[9],qubits[7];
-h qubits[7];
-h qubits[7];
-cx qubits[9],qubits[7];
-cx qubits[8],qubits[7];
-cx qubits[0],qubits[9];
-cx qubits[0],qubits[8];
-cx qubits[7],qubits[0];
-cx qubits[1],qubits[7];
-cx qubits[2],qubits[8];
-cx qubits[6],qubits[9];
-cx qubits[6],qubits[8];
-h qubits[2];
-h qubits[2];
-ccx qubits[1],qubits[8],qubits[2];
-h qubits[2];
-h qubits[2];
-cx qubits[6],qubits[1];
-cx qubits[1],qubits[2];
-h qubits[6];
-h qubits[6];
-ccx qubits[1],qubits[7],qubits[6];
-h qubits[6];
-h qubits[6];
-cx qubits[0],qubits[1];
-cx qubits[0],qubits[2];
-cx qubits[0],qubits[6];
-x qubits[3];
-x qubits[4];
-x qubits[5];
-h qubits[7];
-h qubits[7];
-ccx qubits[9],qubits[8],qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[9];
-h qubits[9];
-ccx qubits[10],qubits[7],qubits[9];
-h qubits[9];
-h qubits[9];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[0];
-h qubits[0];
-ccx qubits[10],qubits[5],qubits[0];
-h qubits[0];
-h qubits[0];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[9];
-h qubits[9];
-ccx qubits[10],qubits[7],qubits[9];
-h qubits[9];
-h qubits[9];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[7];
-h qubits[7];
-ccx qubits[9],qubits[8],qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[8];
-h qubits[8];
-ccx qubits[10],qubits[7],qubits[8];
-h qubits[8];
-h qubits[8];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[0];
-h qubits[0];
-ccx qubits[10],qubits[5],qubits[0];
-h qubits[0];
-h qubits[0];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[8];
-h qubits[8];
-ccx qubits[10],qubits[7],qubits[8];
-h qubits[8];
-h qubits[8];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-cx qubits[0],qubits[6];
-x qubits[3];
-cx qubits[1],qubits[2];
-cx qubits[0],qubits[1];
-h qubits[6];
-h qubits[6];
-ccx qubits[1],qubits[7],qubits[6];
-h qubits[6];
-h qubits[6];
-cx qubits[6],qubits[1];
-h qubits[2];
-h qubits[2];
-ccx qubits[1],qubits[8],qubits[2];
-h qubits[2];
-h qubits[2];
-cx qubits[6],qubits[8];
-cx qubits[6],qubits[9];
-cx qubits[2],qubits[8];
-cx qubits[1],qubits[7];
-cx qubits[2],qubits[1];
-cx qubits[7],qubits[0];
-cx qubits[0],qubits[8];
-cx qubits[0],qubits[9];
-cx qubits[8],qubits[7];
-cx qubits[9],qubits[7];
-h qubits[7];
-h qubits[7];
-ccx qubits[1],qubits[9],qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[7];
-ccx qubits[2],qubits[9],qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[3];
-h qubits[3];
-ccx qubits[9],qubits[8],qubits[3];
-h qubits[3];
-h qubits[3];
-cx qubits[3],qubits[7];
-cx qubits[3],qubits[5];
-cx qubits[3],qubits[4];
-cx qubits[3],qubits[1];
-cx qubits[3],qubits[0];
-cx qubits[3],qubits[9];
-cx qubits[0],qubits[7];
-cx qubits[0],qubits[6];
-cx qubits[0],qubits[5];
-cx qubits[0],qubits[4];
-cx qubits[0],qubits[3];
-h qubits[0];
-h qubits[0];
-ccx qubits[9],qubits[1],qubits[0];
-h qubits[0];
-h qubits[0];
-cx qubits[0],qubits[7];
-cx qubits[0],qubits[6];
-cx qubits[0],qubits[5];
-cx qubits[0],qubits[4];
-cx qubits[8],qubits[6];
-cx qubits[1],qubits[8];
-h qubits[1];
-h qubits[1];
-ccx qubits[9],qubits[2],qubits[1];
-h qubits[1];
-h qubits[1];
-cx qubits[1],qubits[8];
-cx qubits[0],qubits[9];
-cx qubits[9],qubits[0];
-cx qubits[0],qubits[2];
-cx qubits[3],qubits[0];
-cx qubits[8],qubits[7];
-cx qubits[8],qubits[4];
-cx qubits[8],qubits[3];
-cx qubits[8],qubits[2];
-cx qubits[7],qubits[1];
-cx qubits[9],qubits[7];
-cx qubits[7],qubits[9];
-x qubits[1];
-cx qubits[0],qubits[9];
-cx qubits[7],qubits[6];
-cx qubits[7],qubits[4];
-cx qubits[4],qubits[7];
-cx qubits[6],qubits[4];
-cx qubits[6],qubits[0];
-x qubits[6];
-cx qubits[6],qubits[9];
-cx qubits[0],qubits[6];
-cx qubits[2],qubits[8];
-cx qubits[2],qubits[7];
-cx qubits[2],qubits[4];
-cx qubits[2],qubits[0];
-x qubits[2];
-cx qubits[4],qubits[2];
-cx qubits[2],qubits[1];
-cx qubits[2],qubits[4];
-cx qubits[2],qubits[7];
-cx qubits[2],qubits[8];
-cx qubits[2],qubits[9];
-cx qubits[6],qubits[5];
-cx qubits[6],qubits[8];
-cx qubits[0],qubits[7];
-cx qubits[7],qubits[0];
-cx qubits[7],qubits[2];
-cx qubits[7],qubits[6];
-cx qubits[7],qubits[3];
-cx qubits[8],qubits[7];
-cx qubits[0],qubits[9];
-cx qubits[9],qubits[0];
-cx qubits[9],qubits[3];
-cx qubits[9],qubits[8];
-cx qubits[8],qubits[9];
-cx qubits[8],qubits[1];
-cx qubits[8],qubits[3];
-cx qubits[8],qubits[5];
-cx qubits[3],qubits[0];
-cx qubits[0],qubits[2];
-cx qubits[0],qubits[3];
-cx qubits[0],qubits[4];
-cx qubits[3],qubits[0];
-cx qubits[0],qubits[5];
-cx qubits[0],qubits[6];
-cx qubits[0],qubits[9];
-h qubits[3];
-h qubits[3];
-ccx qubits[9],qubits[2],qubits[3];
-h qubits[3];
-h qubits[3];
-h qubits[0];
-h qubits[0];
-ccx qubits[9],qubits[1],qubits[0];
-h qubits[0];
-h qubits[0];
-cx qubits[0],qubits[8];
-h qubits[9];
-h qubits[9];
-ccx qubits[1],qubits[6],qubits[9];
-h qubits[9];
-h qubits[9];
-h qubits[8];
-h qubits[8];
-ccx qubits[1],qubits[6],qubits[8];
-h qubits[8];
-h qubits[8];
-cx qubits[0],qubits[1];
-cx qubits[0],qubits[6];
-h qubits[0];
-h qubits[0];
-ccx qubits[9],qubits[8],qubits[0];
-h qubits[0];
-h qubits[0];
-cx qubits[0],qubits[1];
-cx qubits[0],qubits[6];
-cx qubits[0],qubits[7];
-cx qubits[2],qubits[1];
-h qubits[7];
-h qubits[7];
-ccx qubits[1],qubits[9],qubits[7];
-h qubits[7];
-h qubits[7];
-cx qubits[9],qubits[7];
-cx qubits[8],qubits[7];
-cx qubits[0],qubits[9];
-cx qubits[0],qubits[8];
-cx qubits[7],qubits[0];
-cx qubits[1],qubits[7];
-cx qubits[2],qubits[8];
-cx qubits[6],qubits[9];
-cx qubits[6],qubits[8];
-h qubits[2];
-h qubits[2];
-ccx qubits[1],qubits[8],qubits[2];
-h qubits[2];
-h qubits[2];
-cx qubits[6],qubits[1];
-cx qubits[1],qubits[2];
-h qubits[6];
-h qubits[6];
-ccx qubits[1],qubits[7],qubits[6];
-h qubits[6];
-h qubits[6];
-cx qubits[0],qubits[1];
-cx qubits[0],qubits[2];
-cx qubits[0],qubits[6];
-x qubits[3];
-x qubits[4];
-x qubits[5];
-h qubits[7];
-h qubits[7];
-ccx qubits[9],qubits[8],qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[9];
-h qubits[9];
-ccx qubits[10],qubits[7],qubits[9];
-h qubits[9];
-h qubits[9];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[0];
-h qubits[0];
-ccx qubits[10],qubits[5],qubits[0];
-h qubits[0];
-h qubits[0];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[9];
-h qubits[9];
-ccx qubits[10],qubits[7],qubits[9];
-h qubits[9];
-h qubits[9];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[7];
-h qubits[7];
-ccx qubits[9],qubits[8],qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[8];
-h qubits[8];
-ccx qubits[10],qubits[7],qubits[8];
-h qubits[8];
-h qubits[8];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[0];
-h qubits[0];
-ccx qubits[10],qubits[5],qubits[0];
-h qubits[0];
-h qubits[0];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[8];
-h qubits[8];
-ccx qubits[10],qubits[7],qubits[8];
-h qubits[8];
-h qubits[8];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-x qubits[4];
-x qubits[3];
-cx qubits[0],qubits[6];
-cx qubits[1],qubits[2];
-cx qubits[0],qubits[1];
-h qubits[6];
-h qubits[6];
-ccx qubits[1],qubits[7],qubits[6];
-h qubits[6];
-h qubits[6];
-cx qubits[6],qubits[1];
-h qubits[2];
-h qubits[2];
-ccx qubits[1],qubits[8],qubits[2];
-h qubits[2];
-h qubits[2];
-cx qubits[6],qubits[8];
-cx qubits[6],qubits[9];
-cx qubits[2],qubits[8];
-cx qubits[1],qubits[7];
-cx qubits[2],qubits[1];
-cx qubits[7],qubits[0];
-cx qubits[8],qubits[7];
-cx qubits[0],qubits[8];
-cx qubits[0],qubits[9];
-cx qubits[9],qubits[7];
-h qubits[7];
-h qubits[7];
-ccx qubits[1],qubits[9],qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[7];
-ccx qubits[2],qubits[9],qubits[7];
-h qubits[7];
-h qubits[7];
-cx qubits[0],qubits[6];
-cx qubits[0],qubits[1];
-h qubits[0];
-h qubits[0];
-ccx qubits[9],qubits[8],qubits[0];
-h qubits[0];
-h qubits[0];
-cx qubits[0],qubits[6];
-cx qubits[0],qubits[1];
-h qubits[8];
-h qubits[8];
-ccx qubits[1],qubits[6],qubits[8];
-h qubits[8];
-h qubits[8];
-h qubits[9];
-h qubits[9];
-ccx qubits[1],qubits[6],qubits[9];
-h qubits[9];
-h qubits[9];
-cx qubits[0],qubits[8];
-h qubits[0];
-h qubits[0];
-ccx qubits[9],qubits[1],qubits[0];
-h qubits[0];
-h qubits[0];
-cx qubits[8],qubits[7];
-cx qubits[0],qubits[8];
-h qubits[3];
-h qubits[3];
-ccx qubits[9],qubits[2],qubits[3];
-h qubits[3];
-h qubits[3];
-cx qubits[3],qubits[8];
-cx qubits[3],qubits[6];
-cx qubits[0],qubits[5];
-cx qubits[0],qubits[9];
-cx qubits[3],qubits[0];
-cx qubits[0],qubits[3];
-cx qubits[0],qubits[8];
-cx qubits[0],qubits[6];
-cx qubits[0],qubits[4];
-cx qubits[0],qubits[2];
-cx qubits[3],qubits[0];
-cx qubits[8],qubits[9];
-cx qubits[8],qubits[5];
-cx qubits[8],qubits[3];
-cx qubits[8],qubits[1];
-cx qubits[9],qubits[8];
-cx qubits[7],qubits[3];
-cx qubits[9],qubits[7];
-cx qubits[9],qubits[0];
-cx qubits[0],qubits[9];
-cx qubits[7],qubits[6];
-cx qubits[7],qubits[2];
-cx qubits[7],qubits[0];
-cx qubits[0],qubits[7];
-cx qubits[6],qubits[8];
-x qubits[6];
-cx qubits[6],qubits[5];
-cx qubits[2],qubits[8];
-x qubits[2];
-cx qubits[2],qubits[9];
-cx qubits[2],qubits[7];
-cx qubits[2],qubits[1];
-cx qubits[2],qubits[4];
-cx qubits[4],qubits[2];
-x qubits[3];
-cx qubits[0],qubits[2];
-cx qubits[2],qubits[0];
-cx qubits[2],qubits[3];
-cx qubits[2],qubits[4];
-cx qubits[2],qubits[7];
-cx qubits[2],qubits[9];
-cx qubits[0],qubits[6];
-cx qubits[6],qubits[0];
-cx qubits[6],qubits[1];
-cx qubits[7],qubits[2];
-cx qubits[6],qubits[7];
-cx qubits[7],qubits[1];
-cx qubits[7],qubits[9];
-cx qubits[9],qubits[7];
-cx qubits[7],qubits[3];
-cx qubits[7],qubits[4];
-cx qubits[0],qubits[7];
-cx qubits[9],qubits[7];
-cx qubits[9],qubits[0];
-cx qubits[9],qubits[2];
-cx qubits[9],qubits[6];
-cx qubits[3],qubits[8];
-cx qubits[3],qubits[6];
-cx qubits[3],qubits[7];
-cx qubits[8],qubits[3];
-cx qubits[0],qubits[1];
-cx qubits[4],qubits[5];
-cx qubits[0],qubits[4];
-h qubits[4];
-h qubits[4];
-ccx qubits[9],qubits[2],qubits[4];
-h qubits[4];
-h qubits[4];
-cx qubits[3],qubits[1];
-cx qubits[3],qubits[0];
-h qubits[3];
-h qubits[3];
-ccx qubits[9],qubits[1],qubits[3];
-h qubits[3];
-h qubits[3];
-cx qubits[4],qubits[9];
-cx qubits[4],qubits[8];
-cx qubits[4],qubits[0];
-cx qubits[4],qubits[2];
-cx qubits[4],qubits[6];
-h qubits[4];
-h qubits[4];
-ccx qubits[9],qubits[8],qubits[4];
-h qubits[4];
-h qubits[4];
-cx qubits[2],qubits[1];
-h qubits[7];
-h qubits[7];
-ccx qubits[1],qubits[9],qubits[7];
-h qubits[7];
-h qubits[7];
-cx qubits[9],qubits[7];
-cx qubits[8],qubits[7];
-cx qubits[0],qubits[9];
-cx qubits[0],qubits[8];
-cx qubits[7],qubits[0];
-cx qubits[1],qubits[7];
-cx qubits[2],qubits[8];
-cx qubits[6],qubits[9];
-cx qubits[6],qubits[8];
-h qubits[2];
-h qubits[2];
-ccx qubits[1],qubits[8],qubits[2];
-h qubits[2];
-h qubits[2];
-cx qubits[6],qubits[1];
-cx qubits[1],qubits[2];
-h qubits[6];
-h qubits[6];
-ccx qubits[1],qubits[7],qubits[6];
-h qubits[6];
-h qubits[6];
-cx qubits[0],qubits[1];
-cx qubits[0],qubits[2];
-cx qubits[0],qubits[6];
-x qubits[3];
-x qubits[4];
-h qubits[7];
-h qubits[7];
-ccx qubits[9],qubits[8],qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[9];
-h qubits[9];
-ccx qubits[10],qubits[7],qubits[9];
-h qubits[9];
-h qubits[9];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[0];
-h qubits[0];
-ccx qubits[10],qubits[5],qubits[0];
-h qubits[0];
-h qubits[0];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[9];
-h qubits[9];
-ccx qubits[10],qubits[7],qubits[9];
-h qubits[9];
-h qubits[9];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[7];
-h qubits[7];
-ccx qubits[9],qubits[8],qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[8];
-h qubits[8];
-ccx qubits[10],qubits[7],qubits[8];
-h qubits[8];
-h qubits[8];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[0];
-h qubits[0];
-ccx qubits[10],qubits[5],qubits[0];
-h qubits[0];
-h qubits[0];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[8];
-h qubits[8];
-ccx qubits[10],qubits[7],qubits[8];
-h qubits[8];
-h qubits[8];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-x qubits[4];
-x qubits[3];
-cx qubits[0],qubits[6];
-cx qubits[1],qubits[2];
-cx qubits[0],qubits[1];
-h qubits[6];
-h qubits[6];
-ccx qubits[1],qubits[7],qubits[6];
-h qubits[6];
-h qubits[6];
-cx qubits[6],qubits[1];
-h qubits[2];
-h qubits[2];
-ccx qubits[1],qubits[8],qubits[2];
-h qubits[2];
-h qubits[2];
-cx qubits[6],qubits[8];
-cx qubits[6],qubits[9];
-cx qubits[2],qubits[8];
-cx qubits[1],qubits[7];
-cx qubits[2],qubits[1];
-cx qubits[7],qubits[0];
-cx qubits[0],qubits[8];
-cx qubits[0],qubits[9];
-cx qubits[8],qubits[7];
-cx qubits[9],qubits[7];
-h qubits[7];
-h qubits[7];
-ccx qubits[1],qubits[9],qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[7];
-ccx qubits[2],qubits[9],qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[4];
-h qubits[4];
-ccx qubits[9],qubits[8],qubits[4];
-h qubits[4];
-h qubits[4];
-cx qubits[4],qubits[6];
-cx qubits[4],qubits[2];
-cx qubits[4],qubits[0];
-cx qubits[4],qubits[8];
-cx qubits[4],qubits[9];
-h qubits[3];
-h qubits[3];
-ccx qubits[9],qubits[1],qubits[3];
-h qubits[3];
-h qubits[3];
-cx qubits[3],qubits[7];
-cx qubits[3],qubits[6];
-cx qubits[0],qubits[1];
-cx qubits[3],qubits[0];
-h qubits[4];
-h qubits[4];
-ccx qubits[9],qubits[2],qubits[4];
-h qubits[4];
-h qubits[4];
-cx qubits[0],qubits[4];
-cx qubits[0],qubits[7];
-x qubits[4];
-cx qubits[4],qubits[5];
-cx qubits[8],qubits[7];
-cx qubits[8],qubits[6];
-cx qubits[8],qubits[3];
-cx qubits[7],qubits[8];
-x qubits[3];
-cx qubits[7],qubits[3];
-cx qubits[3],qubits[8];
-cx qubits[9],qubits[7];
-cx qubits[9],qubits[6];
-cx qubits[9],qubits[4];
-cx qubits[9],qubits[2];
-cx qubits[9],qubits[0];
-cx qubits[7],qubits[9];
-cx qubits[7],qubits[4];
-cx qubits[6],qubits[7];
-cx qubits[7],qubits[2];
-cx qubits[7],qubits[1];
-x qubits[1];
-cx qubits[6],qubits[0];
-cx qubits[0],qubits[6];
-cx qubits[2],qubits[9];
-cx qubits[2],qubits[7];
-cx qubits[2],qubits[4];
-cx qubits[2],qubits[3];
-cx qubits[2],qubits[0];
-cx qubits[0],qubits[2];
-cx qubits[6],qubits[9];
-x qubits[6];
-cx qubits[4],qubits[2];
-cx qubits[2],qubits[1];
-cx qubits[2],qubits[4];
-cx qubits[6],qubits[7];
-cx qubits[2],qubits[6];
-cx qubits[6],qubits[0];
-cx qubits[6],qubits[5];
-cx qubits[7],qubits[1];
-cx qubits[3],qubits[4];
-cx qubits[3],qubits[6];
-cx qubits[7],qubits[8];
-cx qubits[7],qubits[3];
-cx qubits[3],qubits[7];
-cx qubits[0],qubits[9];
-cx qubits[9],qubits[0];
-cx qubits[3],qubits[9];
-cx qubits[9],qubits[1];
-cx qubits[9],qubits[5];
-cx qubits[0],qubits[8];
-cx qubits[8],qubits[0];
-cx qubits[8],qubits[1];
-cx qubits[8],qubits[2];
-cx qubits[8],qubits[6];
-cx qubits[8],qubits[9];
-cx qubits[4],qubits[5];
-cx qubits[0],qubits[4];
-cx qubits[0],qubits[9];
-cx qubits[3],qubits[0];
-h qubits[3];
-h qubits[3];
-ccx qubits[9],qubits[2],qubits[3];
-h qubits[3];
-h qubits[3];
-cx qubits[3],qubits[9];
-cx qubits[3],qubits[0];
-cx qubits[3],qubits[4];
-cx qubits[3],qubits[6];
-h qubits[3];
-h qubits[3];
-ccx qubits[9],qubits[1],qubits[3];
-h qubits[3];
-h qubits[3];
-cx qubits[4],qubits[9];
-cx qubits[4],qubits[2];
-cx qubits[4],qubits[7];
-h qubits[4];
-h qubits[4];
-ccx qubits[9],qubits[8],qubits[4];
-h qubits[4];
-h qubits[4];
-cx qubits[2],qubits[1];
-h qubits[7];
-h qubits[7];
-ccx qubits[1],qubits[9],qubits[7];
-h qubits[7];
-h qubits[7];
-cx qubits[9],qubits[7];
-cx qubits[0],qubits[9];
-cx qubits[0],qubits[8];
-cx qubits[7],qubits[0];
-cx qubits[1],qubits[7];
-cx qubits[2],qubits[8];
-cx qubits[6],qubits[9];
-cx qubits[6],qubits[8];
-h qubits[2];
-h qubits[2];
-ccx qubits[1],qubits[8],qubits[2];
-h qubits[2];
-h qubits[2];
-cx qubits[6],qubits[1];
-cx qubits[1],qubits[2];
-h qubits[6];
-h qubits[6];
-ccx qubits[1],qubits[7],qubits[6];
-h qubits[6];
-h qubits[6];
-cx qubits[0],qubits[1];
-cx qubits[0],qubits[2];
-cx qubits[0],qubits[6];
-x qubits[3];
-x qubits[4];
-h qubits[7];
-h qubits[7];
-ccx qubits[9],qubits[8],qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[9];
-h qubits[9];
-ccx qubits[10],qubits[7],qubits[9];
-h qubits[9];
-h qubits[9];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[0];
-h qubits[0];
-ccx qubits[10],qubits[5],qubits[0];
-h qubits[0];
-h qubits[0];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[9];
-h qubits[9];
-ccx qubits[10],qubits[7],qubits[9];
-h qubits[9];
-h qubits[9];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[7];
-h qubits[7];
-ccx qubits[9],qubits[8],qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[8];
-h qubits[8];
-ccx qubits[10],qubits[7],qubits[8];
-h qubits[8];
-h qubits[8];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[0];
-h qubits[0];
-ccx qubits[10],qubits[5],qubits[0];
-h qubits[0];
-h qubits[0];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[8];
-h qubits[8];
-ccx qubits[10],qubits[7],qubits[8];
-h qubits[8];
-h qubits[8];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-x qubits[4];
-x qubits[3];
-cx qubits[0],qubits[6];
-cx qubits[1],qubits[2];
-cx qubits[0],qubits[1];
-h qubits[6];
-h qubits[6];
-ccx qubits[1],qubits[7],qubits[6];
-h qubits[6];
-h qubits[6];
-cx qubits[6],qubits[1];
-h qubits[2];
-h qubits[2];
-ccx qubits[1],qubits[8],qubits[2];
-h qubits[2];
-h qubits[2];
-cx qubits[6],qubits[8];
-cx qubits[6],qubits[9];
-cx qubits[2],qubits[8];
-cx qubits[1],qubits[7];
-cx qubits[2],qubits[1];
-cx qubits[7],qubits[0];
-cx qubits[0],qubits[8];
-cx qubits[0],qubits[9];
-cx qubits[9],qubits[7];
-h qubits[7];
-h qubits[7];
-ccx qubits[1],qubits[9],qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[7];
-ccx qubits[2],qubits[9],qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[4];
-h qubits[4];
-ccx qubits[9],qubits[8],qubits[4];
-h qubits[4];
-h qubits[4];
-cx qubits[4],qubits[7];
-cx qubits[4],qubits[5];
-cx qubits[4],qubits[2];
-cx qubits[4],qubits[9];
-h qubits[3];
-h qubits[3];
-ccx qubits[9],qubits[1],qubits[3];
-h qubits[3];
-h qubits[3];
-cx qubits[3],qubits[6];
-cx qubits[3],qubits[5];
-cx qubits[3],qubits[4];
-cx qubits[3],qubits[0];
-cx qubits[3],qubits[9];
-h qubits[3];
-h qubits[3];
-ccx qubits[9],qubits[2],qubits[3];
-h qubits[3];
-h qubits[3];
-cx qubits[3],qubits[7];
-cx qubits[3],qubits[6];
-cx qubits[3],qubits[5];
-cx qubits[3],qubits[4];
-cx qubits[3],qubits[1];
-cx qubits[0],qubits[9];
-cx qubits[3],qubits[0];
-cx qubits[0],qubits[5];
-cx qubits[0],qubits[4];
-cx qubits[8],qubits[9];
-cx qubits[8],qubits[6];
-cx qubits[8],qubits[2];
-cx qubits[8],qubits[1];
-cx qubits[8],qubits[0];
-cx qubits[0],qubits[8];
-cx qubits[9],qubits[5];
-cx qubits[9],qubits[1];
-cx qubits[9],qubits[0];
-cx qubits[0],qubits[6];
-x qubits[0];
-cx qubits[0],qubits[9];
-cx qubits[7],qubits[8];
-cx qubits[7],qubits[6];
-cx qubits[7],qubits[4];
-cx qubits[7],qubits[3];
-cx qubits[7],qubits[1];
-cx qubits[6],qubits[0];
-cx qubits[0],qubits[7];
-cx qubits[6],qubits[5];
-cx qubits[0],qubits[6];
-cx qubits[2],qubits[7];
-cx qubits[2],qubits[5];
-cx qubits[6],qubits[8];
-cx qubits[7],qubits[3];
-cx qubits[7],qubits[4];
-cx qubits[7],qubits[9];
-cx qubits[9],qubits[7];
-cx qubits[7],qubits[6];
-cx qubits[9],qubits[0];
-cx qubits[9],qubits[1];
-cx qubits[3],qubits[8];
-cx qubits[8],qubits[3];
-cx qubits[8],qubits[2];
-cx qubits[9],qubits[8];
-x qubits[3];
-cx qubits[8],qubits[9];
-cx qubits[8],qubits[5];
-cx qubits[8],qubits[6];
-h qubits[0];
-h qubits[0];
-ccx qubits[7],qubits[8],qubits[0];
-h qubits[0];
-h qubits[0];
-cx qubits[5],qubits[8];
-cx qubits[0],qubits[8];
-cx qubits[0],qubits[7];
-cx qubits[5],qubits[7];
-cx qubits[5],qubits[2];
-cx qubits[5],qubits[1];
-h qubits[5];
-h qubits[5];
-ccx qubits[9],qubits[2],qubits[5];
-h qubits[5];
-h qubits[5];
-cx qubits[4],qubits[9];
-cx qubits[4],qubits[0];
-cx qubits[4],qubits[2];
-cx qubits[4],qubits[8];
-h qubits[4];
-h qubits[4];
-ccx qubits[9],qubits[1],qubits[4];
-h qubits[4];
-h qubits[4];
-cx qubits[5],qubits[9];
-cx qubits[5],qubits[1];
-h qubits[5];
-h qubits[5];
-ccx qubits[9],qubits[8],qubits[5];
-h qubits[5];
-h qubits[5];
-cx qubits[2],qubits[1];
-h qubits[7];
-h qubits[7];
-ccx qubits[1],qubits[9],qubits[7];
-h qubits[7];
-h qubits[7];
-cx qubits[9],qubits[7];
-cx qubits[8],qubits[7];
-cx qubits[0],qubits[9];
-cx qubits[0],qubits[8];
-cx qubits[7],qubits[0];
-cx qubits[1],qubits[7];
-cx qubits[2],qubits[8];
-cx qubits[6],qubits[9];
-cx qubits[6],qubits[8];
-h qubits[2];
-h qubits[2];
-ccx qubits[1],qubits[8],qubits[2];
-h qubits[2];
-h qubits[2];
-cx qubits[6],qubits[1];
-cx qubits[1],qubits[2];
-h qubits[6];
-h qubits[6];
-ccx qubits[1],qubits[7],qubits[6];
-h qubits[6];
-h qubits[6];
-cx qubits[0],qubits[1];
-cx qubits[0],qubits[2];
-cx qubits[0],qubits[6];
-x qubits[4];
-x qubits[5];
-h qubits[7];
-h qubits[7];
-ccx qubits[9],qubits[8],qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[9];
-h qubits[9];
-ccx qubits[10],qubits[7],qubits[9];
-h qubits[9];
-h qubits[9];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[0];
-h qubits[0];
-ccx qubits[10],qubits[5],qubits[0];
-h qubits[0];
-h qubits[0];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[9];
-h qubits[9];
-ccx qubits[10],qubits[7],qubits[9];
-h qubits[9];
-h qubits[9];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[7];
-h qubits[7];
-ccx qubits[9],qubits[8],qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[8];
-h qubits[8];
-ccx qubits[10],qubits[7],qubits[8];
-h qubits[8];
-h qubits[8];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[0];
-h qubits[0];
-ccx qubits[10],qubits[5],qubits[0];
-h qubits[0];
-h qubits[0];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[8];
-h qubits[8];
-ccx qubits[10],qubits[7],qubits[8];
-h qubits[8];
-h qubits[8];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-x qubits[5];
-x qubits[4];
-x qubits[3];
-cx qubits[0],qubits[6];
-cx qubits[1],qubits[2];
-cx qubits[0],qubits[1];
-h qubits[6];
-h qubits[6];
-ccx qubits[1],qubits[7],qubits[6];
-h qubits[6];
-h qubits[6];
-cx qubits[6],qubits[1];
-h qubits[2];
-h qubits[2];
-ccx qubits[1],qubits[8],qubits[2];
-h qubits[2];
-h qubits[2];
-cx qubits[6],qubits[8];
-cx qubits[6],qubits[9];
-cx qubits[2],qubits[8];
-cx qubits[1],qubits[7];
-cx qubits[2],qubits[1];
-cx qubits[7],qubits[0];
-cx qubits[0],qubits[8];
-cx qubits[0],qubits[9];
-cx qubits[8],qubits[7];
-cx qubits[9],qubits[7];
-h qubits[7];
-h qubits[7];
-ccx qubits[1],qubits[9],qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[7];
-ccx qubits[2],qubits[9],qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[5];
-h qubits[5];
-ccx qubits[9],qubits[8],qubits[5];
-h qubits[5];
-h qubits[5];
-cx qubits[5],qubits[1];
-cx qubits[5],qubits[9];
-h qubits[4];
-h qubits[4];
-ccx qubits[9],qubits[1],qubits[4];
-h qubits[4];
-h qubits[4];
-cx qubits[4],qubits[8];
-cx qubits[4],qubits[2];
-cx qubits[4],qubits[0];
-cx qubits[4],qubits[9];
-h qubits[5];
-h qubits[5];
-ccx qubits[9],qubits[2],qubits[5];
-h qubits[5];
-h qubits[5];
-cx qubits[5],qubits[8];
-cx qubits[5],qubits[7];
-cx qubits[5],qubits[1];
-cx qubits[5],qubits[2];
-cx qubits[0],qubits[8];
-cx qubits[0],qubits[7];
-h qubits[0];
-h qubits[0];
-ccx qubits[7],qubits[8],qubits[0];
-h qubits[0];
-h qubits[0];
-cx qubits[9],qubits[6];
-cx qubits[8],qubits[9];
-cx qubits[8],qubits[5];
-cx qubits[8],qubits[3];
-cx qubits[8],qubits[2];
-cx qubits[3],qubits[8];
-cx qubits[7],qubits[3];
-cx qubits[9],qubits[7];
-cx qubits[2],qubits[1];
-cx qubits[9],qubits[2];
-cx qubits[9],qubits[0];
-cx qubits[0],qubits[9];
-cx qubits[7],qubits[9];
-cx qubits[7],qubits[6];
-cx qubits[7],qubits[4];
-cx qubits[6],qubits[8];
-cx qubits[6],qubits[5];
-cx qubits[6],qubits[0];
-cx qubits[0],qubits[6];
-cx qubits[2],qubits[9];
-cx qubits[2],qubits[6];
-cx qubits[2],qubits[5];
-cx qubits[2],qubits[4];
-cx qubits[4],qubits[2];
-x qubits[9];
-x qubits[8];
-x qubits[7];
-cx qubits[0],qubits[1];
-cx qubits[1],qubits[5];
-x qubits[1];
-cx qubits[1],qubits[0];
-cx qubits[3],qubits[2];
-cx qubits[2],qubits[3];
-cx qubits[2],qubits[8];
-cx qubits[4],qubits[6];
-cx qubits[6],qubits[4];
-cx qubits[6],qubits[9];
-cx qubits[0],qubits[7];
-cx qubits[9],qubits[0];
-cx qubits[5],qubits[9];
-cx qubits[9],qubits[5];
-cx qubits[7],qubits[9];
-cx qubits[7],qubits[0];
-cx qubits[9],qubits[6];
-cx qubits[5],qubits[8];
-cx qubits[8],qubits[5];
-cx qubits[8],qubits[6];
-cx qubits[0],qubits[8];
-cx qubits[4],qubits[1];
-cx qubits[8],qubits[4];
-cx qubits[0],qubits[2];
-cx qubits[4],qubits[0];
-cx qubits[0],qubits[9];
-cx qubits[4],qubits[6];
-cx qubits[4],qubits[7];
-h qubits[4];
-h qubits[4];
-ccx qubits[9],qubits[2],qubits[4];
-h qubits[4];
-h qubits[4];
-cx qubits[3],qubits[9];
-cx qubits[3],qubits[1];
-cx qubits[3],qubits[0];
-cx qubits[3],qubits[5];
-cx qubits[3],qubits[7];
-h qubits[3];
-h qubits[3];
-ccx qubits[9],qubits[1],qubits[3];
-h qubits[3];
-h qubits[3];
-cx qubits[3],qubits[9];
-cx qubits[3],qubits[0];
-cx qubits[3],qubits[1];
-cx qubits[3],qubits[2];
-cx qubits[3],qubits[5];
-h qubits[3];
-h qubits[3];
-ccx qubits[9],qubits[8],qubits[3];
-h qubits[3];
-h qubits[3];
-cx qubits[2],qubits[1];
-h qubits[7];
-h qubits[7];
-ccx qubits[1],qubits[9],qubits[7];
-h qubits[7];
-h qubits[7];
-cx qubits[9],qubits[7];
-cx qubits[8],qubits[7];
-cx qubits[0],qubits[9];
-cx qubits[0],qubits[8];
-cx qubits[7],qubits[0];
-cx qubits[1],qubits[7];
-cx qubits[2],qubits[8];
-cx qubits[6],qubits[9];
-cx qubits[6],qubits[8];
-h qubits[2];
-h qubits[2];
-ccx qubits[1],qubits[8],qubits[2];
-h qubits[2];
-h qubits[2];
-cx qubits[6],qubits[1];
-cx qubits[1],qubits[2];
-h qubits[6];
-h qubits[6];
-ccx qubits[1],qubits[7],qubits[6];
-h qubits[6];
-h qubits[6];
-cx qubits[0],qubits[1];
-cx qubits[0],qubits[2];
-cx qubits[0],qubits[6];
-x qubits[3];
-x qubits[4];
-x qubits[5];
-h qubits[7];
-h qubits[7];
-ccx qubits[9],qubits[8],qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[9];
-h qubits[9];
-ccx qubits[10],qubits[7],qubits[9];
-h qubits[9];
-h qubits[9];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[0];
-h qubits[0];
-ccx qubits[10],qubits[5],qubits[0];
-h qubits[0];
-h qubits[0];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[9];
-h qubits[9];
-ccx qubits[10],qubits[7],qubits[9];
-h qubits[9];
-h qubits[9];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[7];
-h qubits[7];
-ccx qubits[9],qubits[8],qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[8];
-h qubits[8];
-ccx qubits[10],qubits[7],qubits[8];
-h qubits[8];
-h qubits[8];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[0];
-h qubits[0];
-ccx qubits[10],qubits[5],qubits[0];
-h qubits[0];
-h qubits[0];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[8];
-h qubits[8];
-ccx qubits[10],qubits[7],qubits[8];
-h qubits[8];
-h qubits[8];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-x qubits[5];
-x qubits[4];
-x qubits[3];
-cx qubits[0],qubits[6];
-cx qubits[1],qubits[2];
-cx qubits[0],qubits[1];
-h qubits[6];
-h qubits[6];
-ccx qubits[1],qubits[7],qubits[6];
-h qubits[6];
-h qubits[6];
-cx qubits[6],qubits[1];
-h qubits[2];
-h qubits[2];
-ccx qubits[1],qubits[8],qubits[2];
-h qubits[2];
-h qubits[2];
-cx qubits[6],qubits[8];
-cx qubits[6],qubits[9];
-cx qubits[2],qubits[8];
-cx qubits[1],qubits[7];
-cx qubits[2],qubits[1];
-cx qubits[7],qubits[0];
-cx qubits[0],qubits[8];
-cx qubits[0],qubits[9];
-cx qubits[8],qubits[7];
-cx qubits[9],qubits[7];
-h qubits[7];
-h qubits[7];
-ccx qubits[1],qubits[9],qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[7];
-ccx qubits[2],qubits[9],qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[3];
-h qubits[3];
-ccx qubits[9],qubits[8],qubits[3];
-h qubits[3];
-h qubits[3];
-cx qubits[3],qubits[5];
-cx qubits[3],qubits[2];
-cx qubits[3],qubits[1];
-cx qubits[3],qubits[0];
-cx qubits[3],qubits[9];
-h qubits[3];
-h qubits[3];
-ccx qubits[9],qubits[1],qubits[3];
-h qubits[3];
-h qubits[3];
-cx qubits[3],qubits[7];
-cx qubits[3],qubits[5];
-cx qubits[3],qubits[0];
-cx qubits[3],qubits[1];
-cx qubits[3],qubits[9];
-h qubits[4];
-h qubits[4];
-ccx qubits[9],qubits[2],qubits[4];
-h qubits[4];
-h qubits[4];
-cx qubits[4],qubits[7];
-cx qubits[4],qubits[6];
-cx qubits[4],qubits[1];
-cx qubits[0],qubits[9];
-cx qubits[4],qubits[0];
-cx qubits[0],qubits[6];
-cx qubits[0],qubits[5];
-cx qubits[0],qubits[2];
-cx qubits[8],qubits[5];
-cx qubits[5],qubits[0];
-cx qubits[8],qubits[6];
-cx qubits[8],qubits[4];
-cx qubits[8],qubits[1];
-cx qubits[0],qubits[8];
-cx qubits[9],qubits[6];
-cx qubits[9],qubits[5];
-cx qubits[5],qubits[9];
-cx qubits[7],qubits[5];
-cx qubits[7],qubits[0];
-cx qubits[0],qubits[7];
-cx qubits[6],qubits[9];
-cx qubits[6],qubits[4];
-cx qubits[4],qubits[6];
-cx qubits[3],qubits[5];
-cx qubits[2],qubits[3];
-x qubits[3];
-x qubits[0];
-cx qubits[3],qubits[8];
-cx qubits[3],qubits[2];
-cx qubits[1],qubits[5];
-cx qubits[1],qubits[0];
-cx qubits[0],qubits[1];
-cx qubits[6],qubits[0];
-cx qubits[2],qubits[6];
-cx qubits[6],qubits[1];
-cx qubits[6],qubits[2];
-cx qubits[6],qubits[3];
-cx qubits[0],qubits[7];
-cx qubits[7],qubits[0];
-cx qubits[9],qubits[1];
-cx qubits[9],qubits[2];
-cx qubits[9],qubits[5];
-cx qubits[9],qubits[8];
-cx qubits[0],qubits[8];
-cx qubits[8],qubits[0];
-cx qubits[8],qubits[1];
-cx qubits[8],qubits[3];
-cx qubits[8],qubits[6];
-cx qubits[5],qubits[0];
-cx qubits[0],qubits[2];
-cx qubits[0],qubits[5];
-cx qubits[0],qubits[6];
-cx qubits[0],qubits[9];
-cx qubits[0],qubits[3];
-cx qubits[0],qubits[4];
-cx qubits[0],qubits[8];
-h qubits[0];
-h qubits[0];
-ccx qubits[9],qubits[2],qubits[0];
-h qubits[0];
-h qubits[0];
-cx qubits[0],qubits[1];
-cx qubits[0],qubits[3];
-cx qubits[0],qubits[4];
-cx qubits[0],qubits[8];
-cx qubits[4],qubits[9];
-cx qubits[4],qubits[0];
-cx qubits[4],qubits[2];
-cx qubits[4],qubits[6];
-cx qubits[4],qubits[7];
-x qubits[4];
-h qubits[4];
-h qubits[4];
-ccx qubits[1],qubits[9],qubits[4];
-h qubits[4];
-h qubits[4];
-cx qubits[9],qubits[7];
-x qubits[7];
-cx qubits[4],qubits[7];
-cx qubits[2],qubits[3];
-cx qubits[2],qubits[5];
-cx qubits[2],qubits[7];
-h qubits[2];
-h qubits[2];
-ccx qubits[9],qubits[8],qubits[2];
-h qubits[2];
-h qubits[2];
-cx qubits[2],qubits[3];
-cx qubits[2],qubits[5];
-cx qubits[2],qubits[7];
-h qubits[7];
-h qubits[7];
-ccx qubits[2],qubits[9],qubits[7];
-h qubits[7];
-h qubits[7];
-cx qubits[8],qubits[7];
-cx qubits[0],qubits[9];
-cx qubits[0],qubits[8];
-cx qubits[7],qubits[0];
-cx qubits[2],qubits[1];
-cx qubits[1],qubits[7];
-cx qubits[2],qubits[8];
-cx qubits[6],qubits[9];
-cx qubits[6],qubits[8];
-h qubits[2];
-h qubits[2];
-ccx qubits[1],qubits[8],qubits[2];
-h qubits[2];
-h qubits[2];
-cx qubits[6],qubits[1];
-cx qubits[1],qubits[2];
-h qubits[6];
-h qubits[6];
-ccx qubits[1],qubits[7],qubits[6];
-h qubits[6];
-h qubits[6];
-cx qubits[0],qubits[1];
-cx qubits[0],qubits[2];
-cx qubits[0],qubits[6];
-x qubits[5];
-h qubits[7];
-h qubits[7];
-ccx qubits[9],qubits[8],qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[9];
-h qubits[9];
-ccx qubits[10],qubits[7],qubits[9];
-h qubits[9];
-h qubits[9];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[0];
-h qubits[0];
-ccx qubits[10],qubits[5],qubits[0];
-h qubits[0];
-h qubits[0];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[9];
-h qubits[9];
-ccx qubits[10],qubits[7],qubits[9];
-h qubits[9];
-h qubits[9];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[7];
-h qubits[7];
-ccx qubits[9],qubits[8],qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[8];
-h qubits[8];
-ccx qubits[10],qubits[7],qubits[8];
-h qubits[8];
-h qubits[8];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[0];
-h qubits[0];
-ccx qubits[10],qubits[5],qubits[0];
-h qubits[0];
-h qubits[0];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[8];
-h qubits[8];
-ccx qubits[10],qubits[7],qubits[8];
-h qubits[8];
-h qubits[8];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-x qubits[5];
-x qubits[4];
-x qubits[3];
-cx qubits[0],qubits[6];
-cx qubits[1],qubits[2];
-cx qubits[0],qubits[1];
-h qubits[6];
-h qubits[6];
-ccx qubits[1],qubits[7],qubits[6];
-h qubits[6];
-h qubits[6];
-cx qubits[6],qubits[1];
-h qubits[2];
-h qubits[2];
-ccx qubits[1],qubits[8],qubits[2];
-h qubits[2];
-h qubits[2];
-cx qubits[6],qubits[8];
-cx qubits[6],qubits[9];
-cx qubits[2],qubits[8];
-cx qubits[1],qubits[7];
-cx qubits[2],qubits[1];
-cx qubits[7],qubits[0];
-cx qubits[0],qubits[8];
-cx qubits[0],qubits[9];
-cx qubits[8],qubits[7];
-cx qubits[9],qubits[7];
-h qubits[7];
-h qubits[7];
-ccx qubits[1],qubits[9],qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[7];
-ccx qubits[2],qubits[9],qubits[7];
-h qubits[7];
-h qubits[7];
-cx qubits[2],qubits[7];
-cx qubits[2],qubits[5];
-cx qubits[2],qubits[3];
-h qubits[2];
-h qubits[2];
-ccx qubits[9],qubits[8],qubits[2];
-h qubits[2];
-h qubits[2];
-cx qubits[2],qubits[7];
-cx qubits[2],qubits[5];
-cx qubits[2],qubits[3];
-h qubits[4];
-h qubits[4];
-ccx qubits[9],qubits[1],qubits[4];
-h qubits[4];
-h qubits[4];
-cx qubits[4],qubits[6];
-cx qubits[4],qubits[2];
-cx qubits[4],qubits[0];
-cx qubits[4],qubits[9];
-cx qubits[0],qubits[8];
-cx qubits[0],qubits[4];
-cx qubits[0],qubits[3];
-cx qubits[0],qubits[1];
-h qubits[0];
-h qubits[0];
-ccx qubits[2],qubits[9],qubits[0];
-h qubits[0];
-h qubits[0];
-cx qubits[9],qubits[2];
-cx qubits[0],qubits[9];
-cx qubits[0],qubits[8];
-cx qubits[0],qubits[4];
-cx qubits[6],qubits[3];
-cx qubits[0],qubits[6];
-cx qubits[0],qubits[5];
-cx qubits[5],qubits[0];
-cx qubits[6],qubits[1];
-cx qubits[8],qubits[6];
-x qubits[1];
-cx qubits[8],qubits[0];
-cx qubits[0],qubits[8];
-cx qubits[9],qubits[8];
-cx qubits[9],qubits[5];
-cx qubits[9],qubits[1];
-cx qubits[7],qubits[0];
-cx qubits[6],qubits[0];
-cx qubits[0],qubits[6];
-cx qubits[0],qubits[2];
-cx qubits[2],qubits[0];
-cx qubits[6],qubits[2];
-cx qubits[2],qubits[8];
-cx qubits[2],qubits[1];
-cx qubits[2],qubits[4];
-cx qubits[2],qubits[9];
-cx qubits[6],qubits[3];
-cx qubits[6],qubits[4];
-cx qubits[6],qubits[5];
-cx qubits[0],qubits[7];
-cx qubits[7],qubits[0];
-cx qubits[7],qubits[1];
-cx qubits[3],qubits[2];
-cx qubits[7],qubits[3];
-cx qubits[7],qubits[9];
-cx qubits[9],qubits[7];
-cx qubits[7],qubits[6];
-cx qubits[9],qubits[2];
-cx qubits[9],qubits[5];
-cx qubits[3],qubits[8];
-cx qubits[8],qubits[3];
-cx qubits[8],qubits[9];
-cx qubits[3],qubits[4];
-cx qubits[3],qubits[0];
-cx qubits[0],qubits[3];
-cx qubits[0],qubits[5];
-cx qubits[9],qubits[7];
-cx qubits[0],qubits[9];
-cx qubits[3],qubits[9];
-h qubits[3];
-h qubits[3];
-ccx qubits[9],qubits[2],qubits[3];
-h qubits[3];
-h qubits[3];
-cx qubits[3],qubits[1];
-cx qubits[3],qubits[5];
-cx qubits[3],qubits[6];
-cx qubits[3],qubits[8];
-h qubits[3];
-h qubits[3];
-ccx qubits[9],qubits[1],qubits[3];
-h qubits[3];
-h qubits[3];
-cx qubits[3],qubits[8];
-cx qubits[3],qubits[0];
-cx qubits[3],qubits[1];
-cx qubits[3],qubits[5];
-h qubits[3];
-h qubits[3];
-ccx qubits[9],qubits[8],qubits[3];
-h qubits[3];
-h qubits[3];
-cx qubits[2],qubits[1];
-h qubits[7];
-h qubits[7];
-ccx qubits[1],qubits[9],qubits[7];
-h qubits[7];
-h qubits[7];
-cx qubits[8],qubits[7];
-cx qubits[0],qubits[9];
-cx qubits[0],qubits[8];
-cx qubits[7],qubits[0];
-cx qubits[1],qubits[7];
-cx qubits[2],qubits[8];
-cx qubits[6],qubits[9];
-cx qubits[6],qubits[8];
-h qubits[2];
-h qubits[2];
-ccx qubits[1],qubits[8],qubits[2];
-h qubits[2];
-h qubits[2];
-cx qubits[6],qubits[1];
-cx qubits[1],qubits[2];
-h qubits[6];
-h qubits[6];
-ccx qubits[1],qubits[7],qubits[6];
-h qubits[6];
-h qubits[6];
-cx qubits[0],qubits[1];
-cx qubits[0],qubits[2];
-cx qubits[0],qubits[6];
-x qubits[3];
-x qubits[4];
-x qubits[5];
-h qubits[7];
-h qubits[7];
-ccx qubits[9],qubits[8],qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[9];
-h qubits[9];
-ccx qubits[10],qubits[7],qubits[9];
-h qubits[9];
-h qubits[9];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[0];
-h qubits[0];
-ccx qubits[10],qubits[5],qubits[0];
-h qubits[0];
-h qubits[0];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[9];
-h qubits[9];
-ccx qubits[10],qubits[7],qubits[9];
-h qubits[9];
-h qubits[9];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[7];
-h qubits[7];
-ccx qubits[9],qubits[8],qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[8];
-h qubits[8];
-ccx qubits[10],qubits[7],qubits[8];
-h qubits[8];
-h qubits[8];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[0];
-h qubits[0];
-ccx qubits[10],qubits[5],qubits[0];
-h qubits[0];
-h qubits[0];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[8];
-h qubits[8];
-ccx qubits[10],qubits[7],qubits[8];
-h qubits[8];
-h qubits[8];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-x qubits[4];
-x qubits[3];
-cx qubits[0],qubits[6];
-cx qubits[1],qubits[2];
-cx qubits[0],qubits[1];
-h qubits[6];
-h qubits[6];
-ccx qubits[1],qubits[7],qubits[6];
-h qubits[6];
-h qubits[6];
-cx qubits[6],qubits[1];
-h qubits[2];
-h qubits[2];
-ccx qubits[1],qubits[8],qubits[2];
-h qubits[2];
-h qubits[2];
-cx qubits[6],qubits[8];
-cx qubits[6],qubits[9];
-cx qubits[2],qubits[8];
-cx qubits[1],qubits[7];
-cx qubits[2],qubits[1];
-cx qubits[7],qubits[0];
-cx qubits[0],qubits[8];
-cx qubits[0],qubits[9];
-cx qubits[8],qubits[7];
-cx qubits[9],qubits[7];
-h qubits[7];
-h qubits[7];
-ccx qubits[1],qubits[9],qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[7];
-ccx qubits[2],qubits[9],qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[3];
-h qubits[3];
-ccx qubits[9],qubits[8],qubits[3];
-h qubits[3];
-h qubits[3];
-cx qubits[3],qubits[5];
-cx qubits[3],qubits[1];
-cx qubits[3],qubits[0];
-cx qubits[3],qubits[8];
-h qubits[3];
-h qubits[3];
-ccx qubits[9],qubits[1],qubits[3];
-h qubits[3];
-h qubits[3];
-cx qubits[3],qubits[8];
-cx qubits[3],qubits[6];
-cx qubits[3],qubits[1];
-cx qubits[0],qubits[3];
-cx qubits[3],qubits[5];
-h qubits[3];
-h qubits[3];
-ccx qubits[9],qubits[2],qubits[3];
-h qubits[3];
-h qubits[3];
-cx qubits[3],qubits[7];
-cx qubits[3],qubits[4];
-cx qubits[3],qubits[2];
-cx qubits[3],qubits[9];
-cx qubits[3],qubits[0];
-cx qubits[8],qubits[9];
-cx qubits[8],qubits[3];
-cx qubits[8],qubits[2];
-cx qubits[3],qubits[8];
-cx qubits[7],qubits[6];
-cx qubits[9],qubits[7];
-cx qubits[9],qubits[5];
-cx qubits[7],qubits[9];
-cx qubits[9],qubits[2];
-cx qubits[2],qubits[9];
-cx qubits[7],qubits[3];
-cx qubits[7],qubits[1];
-cx qubits[7],qubits[0];
-cx qubits[6],qubits[0];
-cx qubits[0],qubits[7];
-cx qubits[6],qubits[5];
-cx qubits[6],qubits[4];
-cx qubits[6],qubits[3];
-cx qubits[0],qubits[6];
-cx qubits[2],qubits[4];
-x qubits[2];
-cx qubits[2],qubits[5];
-cx qubits[2],qubits[1];
-x qubits[3];
-cx qubits[0],qubits[2];
-cx qubits[2],qubits[0];
-cx qubits[2],qubits[3];
-cx qubits[2],qubits[5];
-cx qubits[6],qubits[9];
-cx qubits[2],qubits[6];
-cx qubits[6],qubits[2];
-cx qubits[9],qubits[6];
-cx qubits[6],qubits[3];
-cx qubits[6],qubits[8];
-cx qubits[5],qubits[7];
-cx qubits[7],qubits[5];
-cx qubits[7],qubits[8];
-cx qubits[8],qubits[7];
-cx qubits[7],qubits[6];
-cx qubits[9],qubits[1];
-cx qubits[9],qubits[5];
-cx qubits[8],qubits[1];
-cx qubits[8],qubits[9];
-cx qubits[3],qubits[0];
-cx qubits[0],qubits[1];
-cx qubits[3],qubits[5];
-cx qubits[0],qubits[3];
-cx qubits[0],qubits[9];
-cx qubits[3],qubits[2];
-cx qubits[3],qubits[8];
-h qubits[3];
-h qubits[3];
-ccx qubits[9],qubits[2],qubits[3];
-h qubits[3];
-h qubits[3];
-cx qubits[4],qubits[9];
-cx qubits[4],qubits[8];
-cx qubits[4],qubits[7];
-x qubits[4];
-h qubits[4];
-h qubits[4];
-ccx qubits[1],qubits[9],qubits[4];
-h qubits[4];
-h qubits[4];
-cx qubits[9],qubits[7];
-x qubits[7];
-cx qubits[4],qubits[7];
-h qubits[5];
-h qubits[5];
-ccx qubits[9],qubits[8],qubits[5];
-h qubits[5];
-h qubits[5];
-h qubits[7];
-h qubits[7];
-ccx qubits[2],qubits[9],qubits[7];
-h qubits[7];
-h qubits[7];
-cx qubits[8],qubits[7];
-cx qubits[0],qubits[9];
-cx qubits[0],qubits[8];
-cx qubits[7],qubits[0];
-cx qubits[2],qubits[1];
-cx qubits[1],qubits[7];
-cx qubits[2],qubits[8];
-cx qubits[6],qubits[9];
-cx qubits[6],qubits[8];
-h qubits[2];
-h qubits[2];
-ccx qubits[1],qubits[8],qubits[2];
-h qubits[2];
-h qubits[2];
-cx qubits[6],qubits[1];
-cx qubits[1],qubits[2];
-h qubits[6];
-h qubits[6];
-ccx qubits[1],qubits[7],qubits[6];
-h qubits[6];
-h qubits[6];
-cx qubits[0],qubits[1];
-cx qubits[0],qubits[2];
-cx qubits[0],qubits[6];
-x qubits[3];
-x qubits[5];
-h qubits[7];
-h qubits[7];
-ccx qubits[9],qubits[8],qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[9];
-h qubits[9];
-ccx qubits[10],qubits[7],qubits[9];
-h qubits[9];
-h qubits[9];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[0];
-h qubits[0];
-ccx qubits[10],qubits[5],qubits[0];
-h qubits[0];
-h qubits[0];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[9];
-h qubits[9];
-ccx qubits[10],qubits[7],qubits[9];
-h qubits[9];
-h qubits[9];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[7];
-h qubits[7];
-ccx qubits[9],qubits[8],qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[8];
-h qubits[8];
-ccx qubits[10],qubits[7],qubits[8];
-h qubits[8];
-h qubits[8];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[0];
-h qubits[0];
-ccx qubits[10],qubits[5],qubits[0];
-h qubits[0];
-h qubits[0];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[8];
-h qubits[8];
-ccx qubits[10],qubits[7],qubits[8];
-h qubits[8];
-h qubits[8];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-x qubits[5];
-x qubits[4];
-x qubits[3];
-cx qubits[0],qubits[6];
-cx qubits[1],qubits[2];
-cx qubits[0],qubits[1];
-h qubits[6];
-h qubits[6];
-ccx qubits[1],qubits[7],qubits[6];
-h qubits[6];
-h qubits[6];
-cx qubits[6],qubits[1];
-h qubits[2];
-h qubits[2];
-ccx qubits[1],qubits[8],qubits[2];
-h qubits[2];
-h qubits[2];
-cx qubits[6],qubits[8];
-cx qubits[6],qubits[9];
-cx qubits[2],qubits[8];
-cx qubits[1],qubits[7];
-cx qubits[2],qubits[1];
-cx qubits[7],qubits[0];
-cx qubits[0],qubits[8];
-cx qubits[0],qubits[9];
-cx qubits[8],qubits[7];
-cx qubits[9],qubits[7];
-h qubits[7];
-h qubits[7];
-ccx qubits[1],qubits[9],qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[7];
-ccx qubits[2],qubits[9],qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[5];
-h qubits[5];
-ccx qubits[9],qubits[8],qubits[5];
-h qubits[5];
-h qubits[5];
-h qubits[4];
-h qubits[4];
-ccx qubits[9],qubits[1],qubits[4];
-h qubits[4];
-h qubits[4];
-cx qubits[4],qubits[8];
-cx qubits[4],qubits[9];
-h qubits[3];
-h qubits[3];
-ccx qubits[9],qubits[2],qubits[3];
-h qubits[3];
-h qubits[3];
-cx qubits[3],qubits[8];
-cx qubits[3],qubits[2];
-cx qubits[0],qubits[3];
-cx qubits[3],qubits[5];
-cx qubits[0],qubits[9];
-cx qubits[0],qubits[1];
-cx qubits[3],qubits[0];
-cx qubits[8],qubits[9];
-cx qubits[7],qubits[6];
-cx qubits[8],qubits[7];
-x qubits[1];
-cx qubits[9],qubits[8];
-cx qubits[8],qubits[1];
-cx qubits[9],qubits[6];
-cx qubits[9],qubits[5];
-cx qubits[6],qubits[9];
-cx qubits[9],qubits[3];
-cx qubits[7],qubits[8];
-cx qubits[7],qubits[5];
-cx qubits[5],qubits[7];
-cx qubits[6],qubits[8];
-cx qubits[6],qubits[2];
-cx qubits[2],qubits[9];
-cx qubits[2],qubits[6];
-cx qubits[2],qubits[0];
-cx qubits[6],qubits[2];
-cx qubits[0],qubits[6];
-cx qubits[0],qubits[5];
-cx qubits[6],qubits[0];
-cx qubits[0],qubits[3];
-cx qubits[2],qubits[4];
-cx qubits[6],qubits[7];
-cx qubits[7],qubits[6];
-cx qubits[2],qubits[9];
-cx qubits[9],qubits[2];
-cx qubits[9],qubits[0];
-cx qubits[7],qubits[9];
-cx qubits[0],qubits[2];
-cx qubits[6],qubits[5];
-cx qubits[7],qubits[4];
-cx qubits[7],qubits[8];
-cx qubits[9],qubits[1];
-cx qubits[5],qubits[8];
-cx qubits[8],qubits[2];
-cx qubits[8],qubits[5];
-cx qubits[8],qubits[6];
-cx qubits[4],qubits[0];
-cx qubits[8],qubits[7];
-cx qubits[0],qubits[8];
-cx qubits[4],qubits[9];
-x qubits[4];
-cx qubits[4],qubits[5];
-h qubits[4];
-h qubits[4];
-ccx qubits[2],qubits[9],qubits[4];
-h qubits[4];
-h qubits[4];
-cx qubits[0],qubits[3];
-cx qubits[0],qubits[4];
-h qubits[0];
-h qubits[0];
-ccx qubits[9],qubits[1],qubits[0];
-h qubits[0];
-h qubits[0];
-cx qubits[0],qubits[3];
-cx qubits[0],qubits[4];
-cx qubits[3],qubits[6];
-h qubits[3];
-h qubits[3];
-ccx qubits[9],qubits[8],qubits[3];
-h qubits[3];
-h qubits[3];
-cx qubits[3],qubits[6];
-cx qubits[2],qubits[1];
-h qubits[7];
-h qubits[7];
-ccx qubits[1],qubits[9],qubits[7];
-h qubits[7];
-h qubits[7];
-cx qubits[9],qubits[7];
-cx qubits[0],qubits[9];
-cx qubits[0],qubits[8];
-cx qubits[7],qubits[0];
-cx qubits[1],qubits[7];
-cx qubits[2],qubits[8];
-cx qubits[6],qubits[9];
-cx qubits[6],qubits[8];
-h qubits[2];
-h qubits[2];
-ccx qubits[1],qubits[8],qubits[2];
-h qubits[2];
-h qubits[2];
-cx qubits[6],qubits[1];
-cx qubits[1],qubits[2];
-h qubits[6];
-h qubits[6];
-ccx qubits[1],qubits[7],qubits[6];
-h qubits[6];
-h qubits[6];
-cx qubits[0],qubits[1];
-cx qubits[0],qubits[2];
-cx qubits[0],qubits[6];
-x qubits[3];
-h qubits[7];
-h qubits[7];
-ccx qubits[9],qubits[8],qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[9];
-h qubits[9];
-ccx qubits[10],qubits[7],qubits[9];
-h qubits[9];
-h qubits[9];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[0];
-h qubits[0];
-ccx qubits[10],qubits[5],qubits[0];
-h qubits[0];
-h qubits[0];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[9];
-h qubits[9];
-ccx qubits[10],qubits[7],qubits[9];
-h qubits[9];
-h qubits[9];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[7];
-h qubits[7];
-ccx qubits[9],qubits[8],qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[8];
-h qubits[8];
-ccx qubits[10],qubits[7],qubits[8];
-h qubits[8];
-h qubits[8];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[0];
-h qubits[0];
-ccx qubits[10],qubits[5],qubits[0];
-h qubits[0];
-h qubits[0];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[8];
-h qubits[8];
-ccx qubits[10],qubits[7],qubits[8];
-h qubits[8];
-h qubits[8];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-x qubits[5];
-x qubits[4];
-x qubits[3];
-cx qubits[0],qubits[6];
-cx qubits[1],qubits[2];
-cx qubits[0],qubits[1];
-h qubits[6];
-h qubits[6];
-ccx qubits[1],qubits[7],qubits[6];
-h qubits[6];
-h qubits[6];
-cx qubits[6],qubits[1];
-h qubits[2];
-h qubits[2];
-ccx qubits[1],qubits[8],qubits[2];
-h qubits[2];
-h qubits[2];
-cx qubits[6],qubits[8];
-cx qubits[6],qubits[9];
-cx qubits[2],qubits[8];
-cx qubits[1],qubits[7];
-cx qubits[2],qubits[1];
-cx qubits[7],qubits[0];
-cx qubits[0],qubits[8];
-cx qubits[0],qubits[9];
-cx qubits[8],qubits[7];
-cx qubits[9],qubits[7];
-h qubits[7];
-h qubits[7];
-ccx qubits[1],qubits[9],qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[7];
-ccx qubits[2],qubits[9],qubits[7];
-h qubits[7];
-h qubits[7];
-cx qubits[3],qubits[6];
-h qubits[3];
-h qubits[3];
-ccx qubits[9],qubits[8],qubits[3];
-h qubits[3];
-h qubits[3];
-cx qubits[3],qubits[6];
-cx qubits[0],qubits[4];
-cx qubits[0],qubits[3];
-h qubits[0];
-h qubits[0];
-ccx qubits[9],qubits[1],qubits[0];
-h qubits[0];
-h qubits[0];
-cx qubits[0],qubits[4];
-cx qubits[0],qubits[3];
-h qubits[4];
-h qubits[4];
-ccx qubits[9],qubits[2],qubits[4];
-h qubits[4];
-h qubits[4];
-cx qubits[4],qubits[8];
-cx qubits[4],qubits[5];
-cx qubits[0],qubits[7];
-cx qubits[4],qubits[0];
-cx qubits[7],qubits[5];
-cx qubits[4],qubits[9];
-cx qubits[0],qubits[8];
-cx qubits[7],qubits[0];
-cx qubits[0],qubits[2];
-cx qubits[8],qubits[6];
-cx qubits[8],qubits[5];
-cx qubits[8],qubits[2];
-cx qubits[5],qubits[8];
-cx qubits[9],qubits[2];
-cx qubits[9],qubits[1];
-cx qubits[9],qubits[0];
-cx qubits[6],qubits[9];
-cx qubits[6],qubits[4];
-cx qubits[7],qubits[6];
-cx qubits[6],qubits[7];
-cx qubits[6],qubits[5];
-cx qubits[2],qubits[3];
-cx qubits[6],qubits[2];
-cx qubits[6],qubits[0];
-cx qubits[0],qubits[6];
-cx qubits[2],qubits[9];
-cx qubits[2],qubits[5];
-cx qubits[2],qubits[4];
-x qubits[1];
-x qubits[2];
-cx qubits[0],qubits[2];
-cx qubits[2],qubits[0];
-cx qubits[2],qubits[3];
-cx qubits[2],qubits[4];
-cx qubits[2],qubits[5];
-cx qubits[2],qubits[9];
-cx qubits[5],qubits[6];
-cx qubits[6],qubits[1];
-cx qubits[6],qubits[2];
-cx qubits[6],qubits[5];
-cx qubits[6],qubits[7];
-cx qubits[6],qubits[9];
-cx qubits[0],qubits[7];
-cx qubits[7],qubits[0];
-cx qubits[7],qubits[6];
-cx qubits[7],qubits[4];
-cx qubits[7],qubits[8];
-cx qubits[5],qubits[9];
-cx qubits[9],qubits[5];
-cx qubits[9],qubits[6];
-cx qubits[9],qubits[7];
-cx qubits[9],qubits[8];
-cx qubits[0],qubits[8];
-cx qubits[8],qubits[0];
-cx qubits[8],qubits[1];
-cx qubits[8],qubits[3];
-cx qubits[4],qubits[5];
-cx qubits[8],qubits[4];
-cx qubits[3],qubits[2];
-cx qubits[3],qubits[0];
-cx qubits[0],qubits[3];
-cx qubits[0],qubits[6];
-cx qubits[3],qubits[9];
-cx qubits[3],qubits[0];
-cx qubits[3],qubits[5];
-h qubits[3];
-h qubits[3];
-ccx qubits[9],qubits[2],qubits[3];
-h qubits[3];
-h qubits[3];
-cx qubits[4],qubits[9];
-cx qubits[4],qubits[1];
-cx qubits[4],qubits[0];
-cx qubits[4],qubits[2];
-cx qubits[4],qubits[7];
-h qubits[4];
-h qubits[4];
-ccx qubits[9],qubits[1],qubits[4];
-h qubits[4];
-h qubits[4];
-cx qubits[0],qubits[3];
-cx qubits[0],qubits[4];
-cx qubits[0],qubits[6];
-h qubits[0];
-h qubits[0];
-ccx qubits[9],qubits[8],qubits[0];
-h qubits[0];
-h qubits[0];
-cx qubits[0],qubits[3];
-cx qubits[0],qubits[4];
-cx qubits[0],qubits[6];
-cx qubits[2],qubits[1];
-h qubits[7];
-h qubits[7];
-ccx qubits[1],qubits[9],qubits[7];
-h qubits[7];
-h qubits[7];
-cx qubits[9],qubits[7];
-cx qubits[8],qubits[7];
-cx qubits[0],qubits[9];
-cx qubits[0],qubits[8];
-cx qubits[7],qubits[0];
-cx qubits[1],qubits[7];
-cx qubits[2],qubits[8];
-cx qubits[6],qubits[9];
-cx qubits[6],qubits[8];
-h qubits[2];
-h qubits[2];
-ccx qubits[1],qubits[8],qubits[2];
-h qubits[2];
-h qubits[2];
-cx qubits[6],qubits[1];
-cx qubits[1],qubits[2];
-h qubits[6];
-h qubits[6];
-ccx qubits[1],qubits[7],qubits[6];
-h qubits[6];
-h qubits[6];
-cx qubits[0],qubits[1];
-cx qubits[0],qubits[2];
-cx qubits[0],qubits[6];
-x qubits[3];
-x qubits[4];
-x qubits[5];
-h qubits[7];
-h qubits[7];
-ccx qubits[9],qubits[8],qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[9];
-h qubits[9];
-ccx qubits[10],qubits[7],qubits[9];
-h qubits[9];
-h qubits[9];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[0];
-h qubits[0];
-ccx qubits[10],qubits[5],qubits[0];
-h qubits[0];
-h qubits[0];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[9];
-h qubits[9];
-ccx qubits[10],qubits[7],qubits[9];
-h qubits[9];
-h qubits[9];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[7];
-h qubits[7];
-ccx qubits[9],qubits[8],qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[8];
-h qubits[8];
-ccx qubits[10],qubits[7],qubits[8];
-h qubits[8];
-h qubits[8];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[0];
-h qubits[0];
-ccx qubits[10],qubits[5],qubits[0];
-h qubits[0];
-h qubits[0];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[8];
-h qubits[8];
-ccx qubits[10],qubits[7],qubits[8];
-h qubits[8];
-h qubits[8];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-x qubits[5];
-x qubits[4];
-x qubits[3];
-cx qubits[0],qubits[6];
-cx qubits[1],qubits[2];
-cx qubits[0],qubits[1];
-h qubits[6];
-h qubits[6];
-ccx qubits[1],qubits[7],qubits[6];
-h qubits[6];
-h qubits[6];
-cx qubits[6],qubits[1];
-h qubits[2];
-h qubits[2];
-ccx qubits[1],qubits[8],qubits[2];
-h qubits[2];
-h qubits[2];
-cx qubits[6],qubits[8];
-cx qubits[6],qubits[9];
-cx qubits[2],qubits[8];
-cx qubits[1],qubits[7];
-cx qubits[2],qubits[1];
-cx qubits[7],qubits[0];
-cx qubits[0],qubits[8];
-cx qubits[0],qubits[9];
-cx qubits[8],qubits[7];
-cx qubits[9],qubits[7];
-h qubits[7];
-h qubits[7];
-ccx qubits[1],qubits[9],qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[7];
-ccx qubits[2],qubits[9],qubits[7];
-h qubits[7];
-h qubits[7];
-cx qubits[0],qubits[6];
-cx qubits[0],qubits[4];
-cx qubits[0],qubits[3];
-h qubits[0];
-h qubits[0];
-ccx qubits[9],qubits[8],qubits[0];
-h qubits[0];
-h qubits[0];
-cx qubits[0],qubits[6];
-cx qubits[0],qubits[4];
-cx qubits[0],qubits[3];
-h qubits[4];
-h qubits[4];
-ccx qubits[9],qubits[1],qubits[4];
-h qubits[4];
-h qubits[4];
-cx qubits[4],qubits[7];
-cx qubits[4],qubits[5];
-cx qubits[4],qubits[2];
-cx qubits[4],qubits[0];
-cx qubits[4],qubits[9];
-x qubits[4];
-cx qubits[9],qubits[5];
-cx qubits[4],qubits[1];
-h qubits[3];
-h qubits[3];
-ccx qubits[9],qubits[2],qubits[3];
-h qubits[3];
-h qubits[3];
-cx qubits[3],qubits[9];
-cx qubits[0],qubits[2];
-cx qubits[3],qubits[0];
-cx qubits[0],qubits[6];
-cx qubits[8],qubits[3];
-cx qubits[0],qubits[3];
-cx qubits[3],qubits[0];
-cx qubits[8],qubits[5];
-cx qubits[8],qubits[4];
-cx qubits[8],qubits[1];
-cx qubits[0],qubits[8];
-cx qubits[7],qubits[8];
-cx qubits[7],qubits[6];
-cx qubits[9],qubits[7];
-cx qubits[6],qubits[5];
-cx qubits[5],qubits[9];
-cx qubits[7],qubits[4];
-cx qubits[7],qubits[0];
-cx qubits[0],qubits[7];
-cx qubits[2],qubits[7];
-cx qubits[6],qubits[2];
-cx qubits[5],qubits[6];
-cx qubits[5],qubits[1];
-cx qubits[6],qubits[5];
-cx qubits[2],qubits[9];
-cx qubits[2],qubits[5];
-cx qubits[2],qubits[3];
-cx qubits[6],qubits[0];
-cx qubits[7],qubits[3];
-cx qubits[6],qubits[7];
-cx qubits[9],qubits[8];
-cx qubits[6],qubits[9];
-cx qubits[7],qubits[2];
-cx qubits[7],qubits[0];
-cx qubits[9],qubits[0];
-cx qubits[9],qubits[3];
-cx qubits[9],qubits[4];
-cx qubits[9],qubits[5];
-cx qubits[0],qubits[8];
-cx qubits[8],qubits[0];
-cx qubits[8],qubits[2];
-cx qubits[8],qubits[3];
-cx qubits[8],qubits[5];
-cx qubits[8],qubits[6];
-cx qubits[8],qubits[9];
-cx qubits[0],qubits[3];
-cx qubits[0],qubits[4];
-cx qubits[0],qubits[1];
-cx qubits[0],qubits[8];
-h qubits[0];
-h qubits[0];
-ccx qubits[9],qubits[2],qubits[0];
-h qubits[0];
-h qubits[0];
-cx qubits[0],qubits[1];
-cx qubits[8],qubits[7];
-cx qubits[5],qubits[8];
-cx qubits[0],qubits[5];
-cx qubits[3],qubits[9];
-cx qubits[3],qubits[2];
-cx qubits[5],qubits[6];
-cx qubits[3],qubits[5];
-h qubits[3];
-h qubits[3];
-ccx qubits[9],qubits[1],qubits[3];
-h qubits[3];
-h qubits[3];
-cx qubits[5],qubits[1];
-h qubits[5];
-h qubits[5];
-ccx qubits[9],qubits[8],qubits[5];
-h qubits[5];
-h qubits[5];
-cx qubits[2],qubits[1];
-h qubits[7];
-h qubits[7];
-ccx qubits[1],qubits[9],qubits[7];
-h qubits[7];
-h qubits[7];
-cx qubits[9],qubits[7];
-cx qubits[0],qubits[9];
-cx qubits[0],qubits[8];
-cx qubits[7],qubits[0];
-cx qubits[1],qubits[7];
-cx qubits[2],qubits[8];
-cx qubits[6],qubits[9];
-cx qubits[6],qubits[8];
-h qubits[2];
-h qubits[2];
-ccx qubits[1],qubits[8],qubits[2];
-h qubits[2];
-h qubits[2];
-cx qubits[6],qubits[1];
-cx qubits[1],qubits[2];
-h qubits[6];
-h qubits[6];
-ccx qubits[1],qubits[7],qubits[6];
-h qubits[6];
-h qubits[6];
-cx qubits[0],qubits[1];
-cx qubits[0],qubits[2];
-cx qubits[0],qubits[6];
-x qubits[3];
-x qubits[5];
-h qubits[7];
-h qubits[7];
-ccx qubits[9],qubits[8],qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[9];
-h qubits[9];
-ccx qubits[10],qubits[7],qubits[9];
-h qubits[9];
-h qubits[9];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[0];
-h qubits[0];
-ccx qubits[10],qubits[5],qubits[0];
-h qubits[0];
-h qubits[0];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[9];
-h qubits[9];
-ccx qubits[10],qubits[7],qubits[9];
-h qubits[9];
-h qubits[9];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[7];
-h qubits[7];
-ccx qubits[9],qubits[8],qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[8];
-h qubits[8];
-ccx qubits[10],qubits[7],qubits[8];
-h qubits[8];
-h qubits[8];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[0];
-h qubits[0];
-ccx qubits[10],qubits[5],qubits[0];
-h qubits[0];
-h qubits[0];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[8];
-h qubits[8];
-ccx qubits[10],qubits[7],qubits[8];
-h qubits[8];
-h qubits[8];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-x qubits[5];
-x qubits[3];
-cx qubits[0],qubits[6];
-cx qubits[1],qubits[2];
-cx qubits[0],qubits[1];
-h qubits[6];
-h qubits[6];
-ccx qubits[1],qubits[7],qubits[6];
-h qubits[6];
-h qubits[6];
-cx qubits[6],qubits[1];
-h qubits[2];
-h qubits[2];
-ccx qubits[1],qubits[8],qubits[2];
-h qubits[2];
-h qubits[2];
-cx qubits[6],qubits[8];
-cx qubits[6],qubits[9];
-cx qubits[2],qubits[8];
-cx qubits[1],qubits[7];
-cx qubits[2],qubits[1];
-cx qubits[7],qubits[0];
-cx qubits[0],qubits[8];
-cx qubits[9],qubits[7];
-cx qubits[0],qubits[9];
-cx qubits[8],qubits[7];
-h qubits[7];
-h qubits[7];
-ccx qubits[1],qubits[9],qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[7];
-ccx qubits[2],qubits[9],qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[5];
-h qubits[5];
-ccx qubits[9],qubits[8],qubits[5];
-h qubits[5];
-h qubits[5];
-cx qubits[5],qubits[7];
-cx qubits[5],qubits[6];
-cx qubits[5],qubits[1];
-cx qubits[0],qubits[5];
-cx qubits[5],qubits[8];
-h qubits[3];
-h qubits[3];
-ccx qubits[9],qubits[1],qubits[3];
-h qubits[3];
-h qubits[3];
-cx qubits[3],qubits[8];
-cx qubits[3],qubits[7];
-cx qubits[6],qubits[5];
-cx qubits[3],qubits[6];
-cx qubits[3],qubits[2];
-cx qubits[3],qubits[9];
-cx qubits[0],qubits[1];
-h qubits[0];
-h qubits[0];
-ccx qubits[9],qubits[2],qubits[0];
-h qubits[0];
-h qubits[0];
-cx qubits[0],qubits[8];
-cx qubits[0],qubits[1];
-cx qubits[0],qubits[4];
-cx qubits[8],qubits[0];
-cx qubits[0],qubits[3];
-cx qubits[8],qubits[9];
-cx qubits[8],qubits[6];
-cx qubits[8],qubits[2];
-cx qubits[9],qubits[0];
-cx qubits[0],qubits[8];
-cx qubits[9],qubits[5];
-cx qubits[9],qubits[4];
-cx qubits[9],qubits[3];
-cx qubits[7],qubits[3];
-x qubits[0];
-cx qubits[7],qubits[2];
-cx qubits[6],qubits[7];
-cx qubits[7],qubits[0];
-cx qubits[6],qubits[9];
-cx qubits[6],qubits[8];
-cx qubits[6],qubits[3];
-cx qubits[6],qubits[1];
-x qubits[3];
-cx qubits[2],qubits[1];
-cx qubits[2],qubits[5];
-cx qubits[0],qubits[6];
-cx qubits[6],qubits[0];
-cx qubits[6],qubits[1];
-cx qubits[6],qubits[2];
-cx qubits[6],qubits[3];
-cx qubits[9],qubits[7];
-cx qubits[6],qubits[9];
-cx qubits[7],qubits[2];
-cx qubits[7],qubits[5];
-cx qubits[7],qubits[4];
-x qubits[5];
-cx qubits[9],qubits[0];
-cx qubits[9],qubits[1];
-cx qubits[9],qubits[3];
-cx qubits[4],qubits[9];
-cx qubits[9],qubits[6];
-cx qubits[0],qubits[8];
-cx qubits[8],qubits[0];
-cx qubits[8],qubits[2];
-cx qubits[8],qubits[4];
-cx qubits[4],qubits[8];
-cx qubits[3],qubits[0];
-cx qubits[0],qubits[1];
-cx qubits[0],qubits[3];
-cx qubits[0],qubits[4];
-cx qubits[4],qubits[0];
-cx qubits[4],qubits[2];
-cx qubits[4],qubits[1];
-cx qubits[2],qubits[4];
-cx qubits[4],qubits[7];
-h qubits[4];
-h qubits[4];
-ccx qubits[9],qubits[2],qubits[4];
-h qubits[4];
-h qubits[4];
-cx qubits[2],qubits[3];
-cx qubits[2],qubits[5];
-cx qubits[2],qubits[6];
-h qubits[2];
-h qubits[2];
-ccx qubits[9],qubits[1],qubits[2];
-h qubits[2];
-h qubits[2];
-cx qubits[2],qubits[3];
-cx qubits[2],qubits[4];
-cx qubits[2],qubits[5];
-cx qubits[2],qubits[6];
-cx qubits[2],qubits[7];
-cx qubits[3],qubits[6];
-h qubits[3];
-h qubits[3];
-ccx qubits[9],qubits[8],qubits[3];
-h qubits[3];
-h qubits[3];
-cx qubits[3],qubits[6];
-cx qubits[2],qubits[1];
-h qubits[7];
-h qubits[7];
-ccx qubits[1],qubits[9],qubits[7];
-h qubits[7];
-h qubits[7];
-cx qubits[9],qubits[7];
-cx qubits[8],qubits[7];
-cx qubits[0],qubits[9];
-cx qubits[0],qubits[8];
-cx qubits[7],qubits[0];
-cx qubits[1],qubits[7];
-cx qubits[2],qubits[8];
-cx qubits[6],qubits[9];
-cx qubits[6],qubits[8];
-h qubits[2];
-h qubits[2];
-ccx qubits[1],qubits[8],qubits[2];
-h qubits[2];
-h qubits[2];
-cx qubits[6],qubits[1];
-cx qubits[1],qubits[2];
-h qubits[6];
-h qubits[6];
-ccx qubits[1],qubits[7],qubits[6];
-h qubits[6];
-h qubits[6];
-cx qubits[0],qubits[1];
-cx qubits[0],qubits[2];
-cx qubits[0],qubits[6];
-x qubits[3];
-x qubits[4];
-h qubits[7];
-h qubits[7];
-ccx qubits[9],qubits[8],qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[9];
-h qubits[9];
-ccx qubits[10],qubits[7],qubits[9];
-h qubits[9];
-h qubits[9];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[0];
-h qubits[0];
-ccx qubits[10],qubits[5],qubits[0];
-h qubits[0];
-h qubits[0];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[9];
-h qubits[9];
-ccx qubits[10],qubits[7],qubits[9];
-h qubits[9];
-h qubits[9];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[7];
-h qubits[7];
-ccx qubits[9],qubits[8],qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[8];
-h qubits[8];
-ccx qubits[10],qubits[7],qubits[8];
-h qubits[8];
-h qubits[8];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[0];
-h qubits[0];
-ccx qubits[10],qubits[5],qubits[0];
-h qubits[0];
-h qubits[0];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[8];
-h qubits[8];
-ccx qubits[10],qubits[7],qubits[8];
-h qubits[8];
-h qubits[8];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-x qubits[4];
-x qubits[3];
-cx qubits[0],qubits[6];
-cx qubits[1],qubits[2];
-cx qubits[0],qubits[1];
-h qubits[6];
-h qubits[6];
-ccx qubits[1],qubits[7],qubits[6];
-h qubits[6];
-h qubits[6];
-cx qubits[6],qubits[1];
-h qubits[2];
-h qubits[2];
-ccx qubits[1],qubits[8],qubits[2];
-h qubits[2];
-h qubits[2];
-cx qubits[6],qubits[8];
-cx qubits[6],qubits[9];
-cx qubits[2],qubits[8];
-cx qubits[1],qubits[7];
-cx qubits[2],qubits[1];
-cx qubits[7],qubits[0];
-cx qubits[0],qubits[8];
-cx qubits[0],qubits[9];
-cx qubits[8],qubits[7];
-cx qubits[9],qubits[7];
-h qubits[7];
-h qubits[7];
-ccx qubits[1],qubits[9],qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[7];
-ccx qubits[2],qubits[9],qubits[7];
-h qubits[7];
-h qubits[7];
-cx qubits[3],qubits[6];
-h qubits[3];
-h qubits[3];
-ccx qubits[9],qubits[8],qubits[3];
-h qubits[3];
-h qubits[3];
-cx qubits[2],qubits[3];
-cx qubits[3],qubits[6];
-cx qubits[2],qubits[7];
-cx qubits[2],qubits[5];
-h qubits[4];
-h qubits[4];
-ccx qubits[2],qubits[9],qubits[4];
-h qubits[4];
-h qubits[4];
-h qubits[2];
-h qubits[2];
-ccx qubits[1],qubits[9],qubits[2];
-h qubits[2];
-h qubits[2];
-cx qubits[2],qubits[7];
-cx qubits[2],qubits[6];
-cx qubits[2],qubits[5];
-cx qubits[2],qubits[3];
-cx qubits[4],qubits[8];
-cx qubits[4],qubits[7];
-cx qubits[4],qubits[6];
-cx qubits[0],qubits[1];
-cx qubits[4],qubits[0];
-cx qubits[4],qubits[2];
-cx qubits[0],qubits[4];
-cx qubits[4],qubits[9];
-cx qubits[8],qubits[6];
-cx qubits[0],qubits[8];
-cx qubits[0],qubits[3];
-cx qubits[3],qubits[0];
-cx qubits[9],qubits[4];
-cx qubits[9],qubits[2];
-cx qubits[8],qubits[9];
-cx qubits[8],qubits[0];
-cx qubits[0],qubits[8];
-cx qubits[9],qubits[7];
-cx qubits[9],qubits[6];
-cx qubits[9],qubits[5];
-cx qubits[6],qubits[9];
-cx qubits[9],qubits[3];
-cx qubits[9],qubits[1];
-cx qubits[9],qubits[0];
-cx qubits[7],qubits[5];
-cx qubits[7],qubits[4];
-cx qubits[6],qubits[7];
-cx qubits[7],qubits[2];
-cx qubits[2],qubits[7];
-x qubits[6];
-cx qubits[0],qubits[6];
-cx qubits[2],qubits[5];
-x qubits[4];
-x qubits[2];
-x qubits[9];
-cx qubits[6],qubits[8];
-cx qubits[2],qubits[6];
-cx qubits[6],qubits[0];
-cx qubits[6],qubits[5];
-cx qubits[6],qubits[7];
-cx qubits[6],qubits[9];
-cx qubits[0],qubits[7];
-cx qubits[0],qubits[2];
-cx qubits[7],qubits[8];
-cx qubits[7],qubits[9];
-cx qubits[9],qubits[8];
-cx qubits[7],qubits[0];
-cx qubits[0],qubits[7];
-cx qubits[9],qubits[5];
-cx qubits[8],qubits[1];
-cx qubits[8],qubits[2];
-cx qubits[8],qubits[3];
-cx qubits[0],qubits[8];
-cx qubits[8],qubits[5];
-cx qubits[0],qubits[9];
-cx qubits[0],qubits[6];
-h qubits[0];
-h qubits[0];
-ccx qubits[9],qubits[2],qubits[0];
-h qubits[0];
-h qubits[0];
-cx qubits[0],qubits[3];
-cx qubits[0],qubits[4];
-cx qubits[0],qubits[6];
-cx qubits[0],qubits[7];
-cx qubits[3],qubits[9];
-cx qubits[3],qubits[5];
-cx qubits[8],qubits[7];
-cx qubits[3],qubits[8];
-h qubits[3];
-h qubits[3];
-ccx qubits[9],qubits[1],qubits[3];
-h qubits[3];
-h qubits[3];
-cx qubits[3],qubits[9];
-cx qubits[3],qubits[0];
-cx qubits[3],qubits[1];
-cx qubits[3],qubits[5];
-cx qubits[3],qubits[7];
-h qubits[3];
-h qubits[3];
-ccx qubits[9],qubits[8],qubits[3];
-h qubits[3];
-h qubits[3];
-cx qubits[2],qubits[1];
-h qubits[7];
-h qubits[7];
-ccx qubits[1],qubits[9],qubits[7];
-h qubits[7];
-h qubits[7];
-cx qubits[9],qubits[7];
-cx qubits[0],qubits[9];
-cx qubits[0],qubits[8];
-cx qubits[7],qubits[0];
-cx qubits[1],qubits[7];
-cx qubits[2],qubits[8];
-cx qubits[6],qubits[9];
-cx qubits[6],qubits[8];
-h qubits[2];
-h qubits[2];
-ccx qubits[1],qubits[8],qubits[2];
-h qubits[2];
-h qubits[2];
-cx qubits[6],qubits[1];
-cx qubits[1],qubits[2];
-h qubits[6];
-h qubits[6];
-ccx qubits[1],qubits[7],qubits[6];
-h qubits[6];
-h qubits[6];
-cx qubits[0],qubits[1];
-cx qubits[0],qubits[2];
-cx qubits[0],qubits[6];
-x qubits[3];
-h qubits[7];
-h qubits[7];
-ccx qubits[9],qubits[8],qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[9];
-h qubits[9];
-ccx qubits[10],qubits[7],qubits[9];
-h qubits[9];
-h qubits[9];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[0];
-h qubits[0];
-ccx qubits[10],qubits[5],qubits[0];
-h qubits[0];
-h qubits[0];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[9];
-h qubits[9];
-ccx qubits[10],qubits[7],qubits[9];
-h qubits[9];
-h qubits[9];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[7];
-h qubits[7];
-ccx qubits[9],qubits[8],qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[8];
-h qubits[8];
-ccx qubits[10],qubits[7],qubits[8];
-h qubits[8];
-h qubits[8];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[0];
-h qubits[0];
-ccx qubits[10],qubits[5],qubits[0];
-h qubits[0];
-h qubits[0];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[8];
-h qubits[8];
-ccx qubits[10],qubits[7],qubits[8];
-h qubits[8];
-h qubits[8];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-x qubits[3];
-cx qubits[0],qubits[6];
-cx qubits[1],qubits[2];
-cx qubits[0],qubits[1];
-h qubits[6];
-h qubits[6];
-ccx qubits[1],qubits[7],qubits[6];
-h qubits[6];
-h qubits[6];
-cx qubits[6],qubits[1];
-h qubits[2];
-h qubits[2];
-ccx qubits[1],qubits[8],qubits[2];
-h qubits[2];
-h qubits[2];
-cx qubits[6],qubits[8];
-cx qubits[6],qubits[9];
-cx qubits[2],qubits[8];
-cx qubits[1],qubits[7];
-cx qubits[2],qubits[1];
-cx qubits[7],qubits[0];
-cx qubits[0],qubits[8];
-cx qubits[0],qubits[9];
-cx qubits[8],qubits[7];
-cx qubits[9],qubits[7];
-h qubits[7];
-h qubits[7];
-ccx qubits[1],qubits[9],qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[7];
-ccx qubits[2],qubits[9],qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[3];
-h qubits[3];
-ccx qubits[9],qubits[8],qubits[3];
-h qubits[3];
-h qubits[3];
-cx qubits[3],qubits[7];
-cx qubits[3],qubits[5];
-cx qubits[3],qubits[1];
-cx qubits[3],qubits[0];
-cx qubits[3],qubits[9];
-h qubits[3];
-h qubits[3];
-ccx qubits[9],qubits[1],qubits[3];
-h qubits[3];
-h qubits[3];
-cx qubits[3],qubits[8];
-cx qubits[3],qubits[7];
-cx qubits[3],qubits[5];
-cx qubits[3],qubits[9];
-cx qubits[0],qubits[7];
-cx qubits[0],qubits[6];
-cx qubits[0],qubits[4];
-cx qubits[0],qubits[3];
-h qubits[0];
-h qubits[0];
-ccx qubits[9],qubits[2],qubits[0];
-h qubits[0];
-h qubits[0];
-cx qubits[0],qubits[7];
-cx qubits[0],qubits[6];
-cx qubits[0],qubits[9];
-cx qubits[8],qubits[5];
-cx qubits[8],qubits[2];
-cx qubits[0],qubits[8];
-cx qubits[8],qubits[3];
-cx qubits[8],qubits[1];
-cx qubits[9],qubits[5];
-cx qubits[7],qubits[9];
-cx qubits[9],qubits[8];
-cx qubits[7],qubits[2];
-cx qubits[7],qubits[0];
-x qubits[7];
-cx qubits[6],qubits[0];
-cx qubits[0],qubits[7];
-cx qubits[6],qubits[9];
-cx qubits[6],qubits[8];
-x qubits[6];
-cx qubits[6],qubits[5];
-cx qubits[2],qubits[5];
-cx qubits[2],qubits[7];
-cx qubits[0],qubits[6];
-cx qubits[6],qubits[0];
-cx qubits[6],qubits[5];
-cx qubits[0],qubits[7];
-cx qubits[7],qubits[0];
-cx qubits[7],qubits[1];
-cx qubits[7],qubits[2];
-cx qubits[7],qubits[9];
-cx qubits[9],qubits[7];
-cx qubits[7],qubits[5];
-cx qubits[7],qubits[8];
-cx qubits[8],qubits[7];
-cx qubits[9],qubits[1];
-cx qubits[9],qubits[3];
-cx qubits[9],qubits[4];
-cx qubits[8],qubits[2];
-cx qubits[8],qubits[3];
-cx qubits[8],qubits[4];
-cx qubits[5],qubits[0];
-cx qubits[0],qubits[1];
-cx qubits[0],qubits[2];
-cx qubits[0],qubits[5];
-cx qubits[0],qubits[6];
-cx qubits[0],qubits[7];
-h qubits[9];
-h qubits[9];
-ccx qubits[6],qubits[7],qubits[9];
-h qubits[9];
-h qubits[9];
-h qubits[2];
-h qubits[2];
-ccx qubits[6],qubits[7],qubits[2];
-h qubits[2];
-h qubits[2];
-cx qubits[9],qubits[7];
-cx qubits[0],qubits[6];
-cx qubits[0],qubits[7];
-cx qubits[0],qubits[8];
-h qubits[0];
-h qubits[0];
-ccx qubits[9],qubits[2],qubits[0];
-h qubits[0];
-h qubits[0];
-cx qubits[0],qubits[6];
-cx qubits[0],qubits[7];
-h qubits[1];
-h qubits[1];
-ccx qubits[2],qubits[6],qubits[1];
-h qubits[1];
-h qubits[1];
-cx qubits[0],qubits[2];
-cx qubits[0],qubits[6];
-h qubits[0];
-h qubits[0];
-ccx qubits[9],qubits[1],qubits[0];
-h qubits[0];
-h qubits[0];
-cx qubits[0],qubits[2];
-cx qubits[0],qubits[6];
-cx qubits[0],qubits[8];
-h qubits[8];
-h qubits[8];
-ccx qubits[1],qubits[6],qubits[8];
-h qubits[8];
-h qubits[8];
-cx qubits[0],qubits[1];
-cx qubits[0],qubits[6];
-cx qubits[0],qubits[7];
-h qubits[0];
-h qubits[0];
-ccx qubits[9],qubits[8],qubits[0];
-h qubits[0];
-h qubits[0];
-cx qubits[0],qubits[1];
-cx qubits[0],qubits[6];
-cx qubits[0],qubits[7];
-cx qubits[2],qubits[1];
-h qubits[7];
-h qubits[7];
-ccx qubits[1],qubits[9],qubits[7];
-h qubits[7];
-h qubits[7];
-cx qubits[8],qubits[7];
-cx qubits[0],qubits[9];
-cx qubits[0],qubits[8];
-cx qubits[7],qubits[0];
-cx qubits[1],qubits[7];
-cx qubits[2],qubits[8];
-cx qubits[6],qubits[9];
-cx qubits[6],qubits[8];
-h qubits[2];
-h qubits[2];
-ccx qubits[1],qubits[8],qubits[2];
-h qubits[2];
-h qubits[2];
-cx qubits[6],qubits[1];
-cx qubits[1],qubits[2];
-h qubits[6];
-h qubits[6];
-ccx qubits[1],qubits[7],qubits[6];
-h qubits[6];
-h qubits[6];
-cx qubits[0],qubits[1];
-cx qubits[0],qubits[2];
-cx qubits[0],qubits[6];
-x qubits[3];
-x qubits[5];
-h qubits[7];
-h qubits[7];
-ccx qubits[9],qubits[8],qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[9];
-h qubits[9];
-ccx qubits[10],qubits[7],qubits[9];
-h qubits[9];
-h qubits[9];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[0];
-h qubits[0];
-ccx qubits[10],qubits[5],qubits[0];
-h qubits[0];
-h qubits[0];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[9];
-h qubits[9];
-ccx qubits[10],qubits[7],qubits[9];
-h qubits[9];
-h qubits[9];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[7];
-h qubits[7];
-ccx qubits[9],qubits[8],qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[8];
-h qubits[8];
-ccx qubits[10],qubits[7],qubits[8];
-h qubits[8];
-h qubits[8];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[0];
-h qubits[0];
-ccx qubits[10],qubits[5],qubits[0];
-h qubits[0];
-h qubits[0];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[8];
-h qubits[8];
-ccx qubits[10],qubits[7],qubits[8];
-h qubits[8];
-h qubits[8];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-x qubits[5];
-cx qubits[0],qubits[6];
-cx qubits[1],qubits[2];
-cx qubits[0],qubits[1];
-h qubits[6];
-h qubits[6];
-ccx qubits[1],qubits[7],qubits[6];
-h qubits[6];
-h qubits[6];
-cx qubits[6],qubits[1];
-h qubits[2];
-h qubits[2];
-ccx qubits[1],qubits[8],qubits[2];
-h qubits[2];
-h qubits[2];
-cx qubits[6],qubits[8];
-cx qubits[6],qubits[9];
-cx qubits[2],qubits[8];
-cx qubits[1],qubits[7];
-cx qubits[2],qubits[1];
-cx qubits[7],qubits[0];
-cx qubits[8],qubits[7];
-cx qubits[0],qubits[8];
-cx qubits[0],qubits[9];
-cx qubits[9],qubits[7];
-h qubits[7];
-h qubits[7];
-ccx qubits[1],qubits[9],qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[7];
-ccx qubits[2],qubits[9],qubits[7];
-h qubits[7];
-h qubits[7];
-cx qubits[0],qubits[6];
-cx qubits[0],qubits[1];
-h qubits[0];
-h qubits[0];
-ccx qubits[9],qubits[8],qubits[0];
-h qubits[0];
-h qubits[0];
-cx qubits[0],qubits[7];
-cx qubits[0],qubits[6];
-cx qubits[0],qubits[1];
-h qubits[8];
-h qubits[8];
-ccx qubits[1],qubits[6],qubits[8];
-h qubits[8];
-h qubits[8];
-cx qubits[0],qubits[8];
-cx qubits[0],qubits[6];
-cx qubits[0],qubits[2];
-h qubits[0];
-h qubits[0];
-ccx qubits[9],qubits[1],qubits[0];
-h qubits[0];
-h qubits[0];
-cx qubits[0],qubits[6];
-cx qubits[0],qubits[2];
-h qubits[1];
-h qubits[1];
-ccx qubits[2],qubits[6],qubits[1];
-h qubits[1];
-h qubits[1];
-cx qubits[0],qubits[7];
-cx qubits[0],qubits[6];
-h qubits[0];
-h qubits[0];
-ccx qubits[9],qubits[2],qubits[0];
-h qubits[0];
-h qubits[0];
-cx qubits[0],qubits[8];
-cx qubits[0],qubits[7];
-cx qubits[0],qubits[6];
-h qubits[2];
-h qubits[2];
-ccx qubits[6],qubits[7],qubits[2];
-h qubits[2];
-h qubits[2];
-h qubits[9];
-h qubits[9];
-ccx qubits[6],qubits[7],qubits[9];
-h qubits[9];
-h qubits[9];
-cx qubits[0],qubits[7];
-cx qubits[0],qubits[6];
-cx qubits[0],qubits[5];
-cx qubits[0],qubits[2];
-cx qubits[0],qubits[1];
-cx qubits[5],qubits[0];
-cx qubits[8],qubits[7];
-cx qubits[8],qubits[4];
-cx qubits[8],qubits[3];
-cx qubits[8],qubits[2];
-cx qubits[7],qubits[8];
-cx qubits[7],qubits[5];
-cx qubits[9],qubits[7];
-cx qubits[9],qubits[4];
-cx qubits[9],qubits[3];
-cx qubits[7],qubits[9];
-cx qubits[9],qubits[1];
-x qubits[9];
-cx qubits[2],qubits[0];
-cx qubits[7],qubits[2];
-x qubits[7];
-cx qubits[6],qubits[0];
-cx qubits[0],qubits[6];
-cx qubits[2],qubits[8];
-cx qubits[2],qubits[4];
-cx qubits[0],qubits[2];
-x qubits[4];
-cx qubits[0],qubits[1];
-cx qubits[2],qubits[0];
-cx qubits[6],qubits[2];
-cx qubits[2],qubits[9];
-cx qubits[6],qubits[3];
-cx qubits[6],qubits[4];
-cx qubits[3],qubits[7];
-cx qubits[7],qubits[1];
-cx qubits[7],qubits[3];
-cx qubits[7],qubits[8];
-cx qubits[7],qubits[9];
-cx qubits[7],qubits[4];
-cx qubits[0],qubits[9];
-cx qubits[9],qubits[0];
-cx qubits[9],qubits[1];
-cx qubits[9],qubits[2];
-cx qubits[9],qubits[3];
-cx qubits[9],qubits[5];
-cx qubits[9],qubits[6];
-cx qubits[9],qubits[8];
-cx qubits[8],qubits[0];
-cx qubits[8],qubits[1];
-cx qubits[8],qubits[3];
-cx qubits[8],qubits[5];
-cx qubits[0],qubits[2];
-cx qubits[0],qubits[4];
-cx qubits[0],qubits[8];
-h qubits[0];
-h qubits[0];
-ccx qubits[9],qubits[2],qubits[0];
-h qubits[0];
-h qubits[0];
-cx qubits[0],qubits[1];
-cx qubits[3],qubits[8];
-cx qubits[0],qubits[3];
-cx qubits[5],qubits[1];
-cx qubits[5],qubits[2];
-cx qubits[5],qubits[8];
-h qubits[5];
-h qubits[5];
-ccx qubits[9],qubits[1],qubits[5];
-h qubits[5];
-h qubits[5];
-cx qubits[3],qubits[1];
-cx qubits[3],qubits[6];
-h qubits[3];
-h qubits[3];
-ccx qubits[9],qubits[8],qubits[3];
-h qubits[3];
-h qubits[3];
-cx qubits[2],qubits[1];
-h qubits[7];
-h qubits[7];
-ccx qubits[1],qubits[9],qubits[7];
-h qubits[7];
-h qubits[7];
-cx qubits[8],qubits[7];
-cx qubits[0],qubits[9];
-cx qubits[0],qubits[8];
-cx qubits[7],qubits[0];
-cx qubits[1],qubits[7];
-cx qubits[2],qubits[8];
-cx qubits[6],qubits[9];
-cx qubits[6],qubits[8];
-h qubits[2];
-h qubits[2];
-ccx qubits[1],qubits[8],qubits[2];
-h qubits[2];
-h qubits[2];
-cx qubits[6],qubits[1];
-cx qubits[1],qubits[2];
-h qubits[6];
-h qubits[6];
-ccx qubits[1],qubits[7],qubits[6];
-h qubits[6];
-h qubits[6];
-cx qubits[0],qubits[1];
-cx qubits[0],qubits[2];
-cx qubits[0],qubits[6];
-x qubits[3];
-x qubits[5];
-h qubits[7];
-h qubits[7];
-ccx qubits[9],qubits[8],qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[9];
-h qubits[9];
-ccx qubits[10],qubits[7],qubits[9];
-h qubits[9];
-h qubits[9];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[0];
-h qubits[0];
-ccx qubits[10],qubits[5],qubits[0];
-h qubits[0];
-h qubits[0];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[9];
-h qubits[9];
-ccx qubits[10],qubits[7],qubits[9];
-h qubits[9];
-h qubits[9];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[7];
-h qubits[7];
-ccx qubits[9],qubits[8],qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[8];
-h qubits[8];
-ccx qubits[10],qubits[7],qubits[8];
-h qubits[8];
-h qubits[8];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[0];
-h qubits[0];
-ccx qubits[10],qubits[5],qubits[0];
-h qubits[0];
-h qubits[0];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[8];
-h qubits[8];
-ccx qubits[10],qubits[7],qubits[8];
-h qubits[8];
-h qubits[8];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-x qubits[5];
-x qubits[3];
-cx qubits[0],qubits[6];
-cx qubits[1],qubits[2];
-cx qubits[0],qubits[1];
-h qubits[6];
-h qubits[6];
-ccx qubits[1],qubits[7],qubits[6];
-h qubits[6];
-h qubits[6];
-cx qubits[6],qubits[1];
-h qubits[2];
-h qubits[2];
-ccx qubits[1],qubits[8],qubits[2];
-h qubits[2];
-h qubits[2];
-cx qubits[6],qubits[8];
-cx qubits[6],qubits[9];
-cx qubits[2],qubits[8];
-cx qubits[1],qubits[7];
-cx qubits[2],qubits[1];
-cx qubits[7],qubits[0];
-cx qubits[0],qubits[8];
-cx qubits[0],qubits[9];
-cx qubits[8],qubits[7];
-h qubits[7];
-h qubits[7];
-ccx qubits[1],qubits[9],qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[7];
-ccx qubits[2],qubits[9],qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[3];
-h qubits[3];
-ccx qubits[9],qubits[8],qubits[3];
-h qubits[3];
-h qubits[3];
-cx qubits[3],qubits[6];
-cx qubits[3],qubits[1];
-cx qubits[0],qubits[3];
-cx qubits[3],qubits[8];
-h qubits[5];
-h qubits[5];
-ccx qubits[9],qubits[1],qubits[5];
-h qubits[5];
-h qubits[5];
-cx qubits[5],qubits[8];
-cx qubits[5],qubits[2];
-cx qubits[5],qubits[1];
-cx qubits[0],qubits[1];
-h qubits[0];
-h qubits[0];
-ccx qubits[9],qubits[2],qubits[0];
-h qubits[0];
-h qubits[0];
-cx qubits[0],qubits[8];
-cx qubits[0],qubits[4];
-cx qubits[0],qubits[2];
-cx qubits[8],qubits[5];
-cx qubits[8],qubits[3];
-cx qubits[9],qubits[8];
-cx qubits[8],qubits[1];
-cx qubits[8],qubits[0];
-cx qubits[6],qubits[5];
-cx qubits[6],qubits[3];
-cx qubits[6],qubits[2];
-cx qubits[9],qubits[6];
-cx qubits[2],qubits[6];
-cx qubits[0],qubits[9];
-cx qubits[7],qubits[8];
-x qubits[9];
-cx qubits[4],qubits[9];
-cx qubits[7],qubits[4];
-cx qubits[7],qubits[3];
-cx qubits[7],qubits[1];
-cx qubits[3],qubits[7];
-cx qubits[2],qubits[5];
-cx qubits[2],qubits[1];
-x qubits[1];
-cx qubits[2],qubits[7];
-cx qubits[6],qubits[1];
-cx qubits[6],qubits[3];
-cx qubits[6],qubits[5];
-cx qubits[6],qubits[7];
-cx qubits[0],qubits[7];
-cx qubits[7],qubits[0];
-cx qubits[7],qubits[1];
-cx qubits[7],qubits[2];
-cx qubits[7],qubits[3];
-cx qubits[7],qubits[5];
-cx qubits[7],qubits[6];
-cx qubits[7],qubits[9];
-cx qubits[9],qubits[1];
-cx qubits[9],qubits[4];
-cx qubits[9],qubits[5];
-cx qubits[9],qubits[7];
-cx qubits[9],qubits[8];
-cx qubits[8],qubits[1];
-cx qubits[8],qubits[2];
-cx qubits[8],qubits[3];
-cx qubits[5],qubits[9];
-cx qubits[8],qubits[5];
-cx qubits[0],qubits[2];
-cx qubits[0],qubits[3];
-cx qubits[0],qubits[4];
-cx qubits[0],qubits[9];
-cx qubits[5],qubits[0];
-cx qubits[5],qubits[1];
-cx qubits[5],qubits[7];
-h qubits[5];
-h qubits[5];
-ccx qubits[9],qubits[2],qubits[5];
-h qubits[5];
-h qubits[5];
-cx qubits[3],qubits[9];
-cx qubits[3],qubits[1];
-cx qubits[3],qubits[0];
-cx qubits[3],qubits[2];
-cx qubits[3],qubits[6];
-x qubits[3];
-cx qubits[3],qubits[5];
-cx qubits[1],qubits[3];
-h qubits[3];
-h qubits[3];
-ccx qubits[9],qubits[1],qubits[3];
-h qubits[3];
-h qubits[3];
-cx qubits[1],qubits[4];
-cx qubits[9],qubits[7];
-h qubits[7];
-h qubits[7];
-ccx qubits[1],qubits[9],qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[1];
-h qubits[1];
-ccx qubits[8],qubits[9],qubits[1];
-h qubits[1];
-h qubits[1];
-cx qubits[1],qubits[3];
-cx qubits[1],qubits[4];
-h qubits[7];
-h qubits[7];
-ccx qubits[2],qubits[9],qubits[7];
-h qubits[7];
-h qubits[7];
-cx qubits[0],qubits[9];
-cx qubits[0],qubits[8];
-cx qubits[7],qubits[0];
-cx qubits[2],qubits[1];
-cx qubits[1],qubits[7];
-cx qubits[2],qubits[8];
-cx qubits[6],qubits[9];
-cx qubits[6],qubits[8];
-h qubits[2];
-h qubits[2];
-ccx qubits[1],qubits[8],qubits[2];
-h qubits[2];
-h qubits[2];
-cx qubits[6],qubits[1];
-cx qubits[1],qubits[2];
-h qubits[6];
-h qubits[6];
-ccx qubits[1],qubits[7],qubits[6];
-h qubits[6];
-h qubits[6];
-cx qubits[0],qubits[1];
-cx qubits[0],qubits[2];
-cx qubits[0],qubits[6];
-h qubits[7];
-h qubits[7];
-ccx qubits[9],qubits[8],qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[9];
-h qubits[9];
-ccx qubits[10],qubits[7],qubits[9];
-h qubits[9];
-h qubits[9];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[0];
-h qubits[0];
-ccx qubits[10],qubits[5],qubits[0];
-h qubits[0];
-h qubits[0];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[9];
-h qubits[9];
-ccx qubits[10],qubits[7],qubits[9];
-h qubits[9];
-h qubits[9];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[7];
-h qubits[7];
-ccx qubits[9],qubits[8],qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[8];
-h qubits[8];
-ccx qubits[10],qubits[7],qubits[8];
-h qubits[8];
-h qubits[8];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[0];
-h qubits[0];
-ccx qubits[10],qubits[5],qubits[0];
-h qubits[0];
-h qubits[0];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[8];
-h qubits[8];
-ccx qubits[10],qubits[7],qubits[8];
-h qubits[8];
-h qubits[8];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-x qubits[5];
-x qubits[4];
-x qubits[3];
-cx qubits[0],qubits[6];
-cx qubits[1],qubits[2];
-cx qubits[0],qubits[1];
-h qubits[6];
-h qubits[6];
-ccx qubits[1],qubits[7],qubits[6];
-h qubits[6];
-h qubits[6];
-cx qubits[6],qubits[1];
-h qubits[2];
-h qubits[2];
-ccx qubits[1],qubits[8],qubits[2];
-h qubits[2];
-h qubits[2];
-cx qubits[6],qubits[8];
-cx qubits[6],qubits[9];
-cx qubits[2],qubits[8];
-cx qubits[1],qubits[7];
-cx qubits[2],qubits[1];
-cx qubits[7],qubits[0];
-cx qubits[0],qubits[8];
-cx qubits[0],qubits[9];
-cx qubits[2],qubits[7];
-cx qubits[1],qubits[2];
-h qubits[7];
-h qubits[7];
-ccx qubits[2],qubits[9],qubits[7];
-h qubits[7];
-h qubits[7];
-cx qubits[9],qubits[7];
-cx qubits[2],qubits[7];
-cx qubits[1],qubits[2];
-cx qubits[1],qubits[4];
-cx qubits[1],qubits[3];
-h qubits[1];
-h qubits[1];
-ccx qubits[9],qubits[8],qubits[1];
-h qubits[1];
-h qubits[1];
-cx qubits[1],qubits[7];
-cx qubits[1],qubits[4];
-cx qubits[1],qubits[3];
-h qubits[3];
-h qubits[3];
-ccx qubits[9],qubits[1],qubits[3];
-h qubits[3];
-h qubits[3];
-cx qubits[3],qubits[6];
-cx qubits[3],qubits[5];
-cx qubits[3],qubits[2];
-cx qubits[3],qubits[0];
-cx qubits[3],qubits[1];
-cx qubits[3],qubits[9];
-h qubits[5];
-h qubits[5];
-ccx qubits[9],qubits[2],qubits[5];
-h qubits[5];
-h qubits[5];
-cx qubits[5],qubits[7];
-cx qubits[5],qubits[1];
-cx qubits[0],qubits[9];
-cx qubits[5],qubits[0];
-cx qubits[0],qubits[4];
-cx qubits[0],qubits[3];
-cx qubits[0],qubits[2];
-cx qubits[9],qubits[5];
-cx qubits[8],qubits[9];
-cx qubits[8],qubits[3];
-cx qubits[8],qubits[2];
-cx qubits[9],qubits[8];
-cx qubits[8],qubits[1];
-cx qubits[9],qubits[7];
-cx qubits[9],qubits[4];
-cx qubits[4],qubits[9];
-cx qubits[6],qubits[9];
-cx qubits[6],qubits[5];
-cx qubits[6],qubits[3];
-cx qubits[7],qubits[6];
-cx qubits[7],qubits[2];
-cx qubits[7],qubits[1];
-cx qubits[7],qubits[0];
-cx qubits[0],qubits[7];
-cx qubits[6],qubits[7];
-cx qubits[2],qubits[4];
-cx qubits[4],qubits[2];
-x qubits[1];
-cx qubits[6],qubits[4];
-cx qubits[4],qubits[2];
-x qubits[6];
-cx qubits[6],qubits[4];
-x qubits[7];
-cx qubits[2],qubits[0];
-cx qubits[6],qubits[3];
-cx qubits[6],qubits[5];
-cx qubits[6],qubits[8];
-cx qubits[6],qubits[9];
-cx qubits[8],qubits[7];
-cx qubits[7],qubits[1];
-cx qubits[7],qubits[2];
-cx qubits[7],qubits[9];
-cx qubits[7],qubits[8];
-cx qubits[8],qubits[7];
-cx qubits[7],qubits[6];
-cx qubits[9],qubits[8];
-cx qubits[8],qubits[6];
-cx qubits[9],qubits[0];
-cx qubits[9],qubits[1];
-cx qubits[8],qubits[9];
-cx qubits[9],qubits[3];
-cx qubits[9],qubits[5];
-cx qubits[8],qubits[2];
-cx qubits[3],qubits[0];
-cx qubits[0],qubits[3];
-cx qubits[0],qubits[4];
-cx qubits[5],qubits[8];
-cx qubits[0],qubits[5];
-cx qubits[0],qubits[9];
-cx qubits[5],qubits[2];
-cx qubits[5],qubits[0];
-cx qubits[5],qubits[1];
-cx qubits[5],qubits[6];
-cx qubits[4],qubits[5];
-cx qubits[3],qubits[5];
-cx qubits[5],qubits[7];
-h qubits[5];
-h qubits[5];
-ccx qubits[9],qubits[2],qubits[5];
-h qubits[5];
-h qubits[5];
-cx qubits[4],qubits[9];
-cx qubits[4],qubits[0];
-h qubits[4];
-h qubits[4];
-ccx qubits[9],qubits[1],qubits[4];
-h qubits[4];
-h qubits[4];
-cx qubits[3],qubits[9];
-cx qubits[3],qubits[8];
-cx qubits[3],qubits[0];
-cx qubits[3],qubits[1];
-cx qubits[3],qubits[2];
-cx qubits[3],qubits[6];
-h qubits[3];
-h qubits[3];
-ccx qubits[9],qubits[8],qubits[3];
-h qubits[3];
-h qubits[3];
-cx qubits[2],qubits[1];
-h qubits[7];
-h qubits[7];
-ccx qubits[1],qubits[9],qubits[7];
-h qubits[7];
-h qubits[7];
-cx qubits[9],qubits[7];
-cx qubits[8],qubits[7];
-cx qubits[0],qubits[9];
-cx qubits[0],qubits[8];
-cx qubits[7],qubits[0];
-cx qubits[1],qubits[7];
-cx qubits[2],qubits[8];
-cx qubits[6],qubits[9];
-cx qubits[6],qubits[8];
-h qubits[2];
-h qubits[2];
-ccx qubits[1],qubits[8],qubits[2];
-h qubits[2];
-h qubits[2];
-cx qubits[6],qubits[1];
-cx qubits[1],qubits[2];
-h qubits[6];
-h qubits[6];
-ccx qubits[1],qubits[7],qubits[6];
-h qubits[6];
-h qubits[6];
-cx qubits[0],qubits[1];
-cx qubits[0],qubits[2];
-cx qubits[0],qubits[6];
-x qubits[3];
-x qubits[4];
-x qubits[5];
-h qubits[7];
-h qubits[7];
-ccx qubits[9],qubits[8],qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[9];
-h qubits[9];
-ccx qubits[10],qubits[7],qubits[9];
-h qubits[9];
-h qubits[9];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[0];
-h qubits[0];
-ccx qubits[10],qubits[5],qubits[0];
-h qubits[0];
-h qubits[0];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[9];
-h qubits[9];
-ccx qubits[10],qubits[7],qubits[9];
-h qubits[9];
-h qubits[9];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[7];
-h qubits[7];
-ccx qubits[9],qubits[8],qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[8];
-h qubits[8];
-ccx qubits[10],qubits[7],qubits[8];
-h qubits[8];
-h qubits[8];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[0];
-h qubits[0];
-ccx qubits[10],qubits[5],qubits[0];
-h qubits[0];
-h qubits[0];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[8];
-h qubits[8];
-ccx qubits[10],qubits[7],qubits[8];
-h qubits[8];
-h qubits[8];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-x qubits[5];
-x qubits[4];
-x qubits[3];
-cx qubits[0],qubits[6];
-cx qubits[1],qubits[2];
-cx qubits[0],qubits[1];
-h qubits[6];
-h qubits[6];
-ccx qubits[1],qubits[7],qubits[6];
-h qubits[6];
-h qubits[6];
-cx qubits[6],qubits[1];
-h qubits[2];
-h qubits[2];
-ccx qubits[1],qubits[8],qubits[2];
-h qubits[2];
-h qubits[2];
-cx qubits[6],qubits[8];
-cx qubits[6],qubits[9];
-cx qubits[2],qubits[8];
-cx qubits[1],qubits[7];
-cx qubits[2],qubits[1];
-cx qubits[7],qubits[0];
-cx qubits[0],qubits[8];
-cx qubits[0],qubits[9];
-cx qubits[8],qubits[7];
-cx qubits[9],qubits[7];
-h qubits[7];
-h qubits[7];
-ccx qubits[1],qubits[9],qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[7];
-ccx qubits[2],qubits[9],qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[3];
-h qubits[3];
-ccx qubits[9],qubits[8],qubits[3];
-h qubits[3];
-h qubits[3];
-cx qubits[3],qubits[7];
-cx qubits[3],qubits[6];
-cx qubits[3],qubits[5];
-cx qubits[3],qubits[2];
-cx qubits[3],qubits[1];
-cx qubits[3],qubits[0];
-cx qubits[3],qubits[8];
-cx qubits[3],qubits[9];
-h qubits[4];
-h qubits[4];
-ccx qubits[9],qubits[1],qubits[4];
-h qubits[4];
-h qubits[4];
-cx qubits[4],qubits[7];
-cx qubits[4],qubits[5];
-cx qubits[4],qubits[0];
-cx qubits[4],qubits[9];
-h qubits[5];
-h qubits[5];
-ccx qubits[9],qubits[2],qubits[5];
-h qubits[5];
-h qubits[5];
-cx qubits[5],qubits[8];
-cx qubits[5],qubits[7];
-cx qubits[5],qubits[6];
-cx qubits[5],qubits[1];
-cx qubits[5],qubits[0];
-cx qubits[5],qubits[2];
-cx qubits[9],qubits[5];
-cx qubits[8],qubits[9];
-cx qubits[0],qubits[8];
-cx qubits[0],qubits[4];
-cx qubits[0],qubits[3];
-cx qubits[3],qubits[0];
-cx qubits[8],qubits[7];
-cx qubits[8],qubits[3];
-cx qubits[8],qubits[2];
-cx qubits[7],qubits[8];
-cx qubits[7],qubits[6];
-cx qubits[9],qubits[7];
-cx qubits[9],qubits[3];
-cx qubits[9],qubits[1];
-cx qubits[9],qubits[0];
-cx qubits[7],qubits[9];
-cx qubits[7],qubits[2];
-cx qubits[7],qubits[1];
-cx qubits[8],qubits[7];
-cx qubits[6],qubits[9];
-cx qubits[6],qubits[8];
-cx qubits[6],qubits[5];
-cx qubits[6],qubits[4];
-x qubits[3];
-cx qubits[6],qubits[3];
-cx qubits[6],qubits[1];
-cx qubits[2],qubits[0];
-cx qubits[2],qubits[6];
-x qubits[2];
-cx qubits[2],qubits[7];
-cx qubits[4],qubits[8];
-cx qubits[2],qubits[8];
-x qubits[8];
-cx qubits[6],qubits[2];
-cx qubits[6],qubits[4];
-cx qubits[6],qubits[9];
-cx qubits[0],qubits[7];
-cx qubits[7],qubits[0];
-cx qubits[7],qubits[1];
-cx qubits[0],qubits[9];
-cx qubits[9],qubits[7];
-cx qubits[9],qubits[0];
-cx qubits[8],qubits[1];
-cx qubits[9],qubits[8];
-cx qubits[8],qubits[4];
-cx qubits[8],qubits[5];
-cx qubits[8],qubits[6];
-cx qubits[3],qubits[2];
-cx qubits[3],qubits[0];
-cx qubits[0],qubits[3];
-cx qubits[0],qubits[4];
-cx qubits[0],qubits[9];
-cx qubits[3],qubits[6];
-h qubits[3];
-h qubits[3];
-ccx qubits[9],qubits[2],qubits[3];
-h qubits[3];
-h qubits[3];
-cx qubits[0],qubits[2];
-cx qubits[0],qubits[5];
-cx qubits[0],qubits[7];
-h qubits[0];
-h qubits[0];
-ccx qubits[9],qubits[1],qubits[0];
-h qubits[0];
-h qubits[0];
-cx qubits[0],qubits[2];
-cx qubits[0],qubits[5];
-cx qubits[0],qubits[7];
-cx qubits[3],qubits[8];
-cx qubits[3],qubits[1];
-cx qubits[3],qubits[4];
-cx qubits[3],qubits[6];
-cx qubits[3],qubits[7];
-h qubits[3];
-h qubits[3];
-ccx qubits[9],qubits[8],qubits[3];
-h qubits[3];
-h qubits[3];
-cx qubits[2],qubits[1];
-h qubits[7];
-h qubits[7];
-ccx qubits[1],qubits[9],qubits[7];
-h qubits[7];
-h qubits[7];
-cx qubits[9],qubits[7];
-cx qubits[8],qubits[7];
-cx qubits[0],qubits[9];
-cx qubits[0],qubits[8];
-cx qubits[7],qubits[0];
-cx qubits[1],qubits[7];
-cx qubits[2],qubits[8];
-cx qubits[6],qubits[9];
-cx qubits[6],qubits[8];
-h qubits[2];
-h qubits[2];
-ccx qubits[1],qubits[8],qubits[2];
-h qubits[2];
-h qubits[2];
-cx qubits[6],qubits[1];
-cx qubits[1],qubits[2];
-h qubits[6];
-h qubits[6];
-ccx qubits[1],qubits[7],qubits[6];
-h qubits[6];
-h qubits[6];
-cx qubits[0],qubits[1];
-cx qubits[0],qubits[2];
-cx qubits[0],qubits[6];
-x qubits[3];
-h qubits[7];
-h qubits[7];
-ccx qubits[9],qubits[8],qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[9];
-h qubits[9];
-ccx qubits[10],qubits[7],qubits[9];
-h qubits[9];
-h qubits[9];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[0];
-h qubits[0];
-ccx qubits[10],qubits[5],qubits[0];
-h qubits[0];
-h qubits[0];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[9];
-h qubits[9];
-ccx qubits[10],qubits[7],qubits[9];
-h qubits[9];
-h qubits[9];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[7];
-h qubits[7];
-ccx qubits[9],qubits[8],qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[8];
-h qubits[8];
-ccx qubits[10],qubits[7],qubits[8];
-h qubits[8];
-h qubits[8];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[0];
-h qubits[0];
-ccx qubits[10],qubits[5],qubits[0];
-h qubits[0];
-h qubits[0];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[8];
-h qubits[8];
-ccx qubits[10],qubits[7],qubits[8];
-h qubits[8];
-h qubits[8];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-x qubits[4];
-x qubits[3];
-cx qubits[0],qubits[6];
-cx qubits[1],qubits[2];
-cx qubits[0],qubits[1];
-h qubits[6];
-h qubits[6];
-ccx qubits[1],qubits[7],qubits[6];
-h qubits[6];
-h qubits[6];
-cx qubits[6],qubits[1];
-h qubits[2];
-h qubits[2];
-ccx qubits[1],qubits[8],qubits[2];
-h qubits[2];
-h qubits[2];
-cx qubits[6],qubits[8];
-cx qubits[6],qubits[9];
-cx qubits[2],qubits[8];
-cx qubits[1],qubits[7];
-cx qubits[2],qubits[1];
-cx qubits[7],qubits[0];
-cx qubits[8],qubits[7];
-cx qubits[0],qubits[8];
-cx qubits[0],qubits[9];
-cx qubits[9],qubits[7];
-h qubits[7];
-h qubits[7];
-ccx qubits[1],qubits[9],qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[7];
-ccx qubits[2],qubits[9],qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[3];
-h qubits[3];
-ccx qubits[9],qubits[8],qubits[3];
-h qubits[3];
-h qubits[3];
-cx qubits[3],qubits[7];
-cx qubits[3],qubits[6];
-cx qubits[3],qubits[4];
-cx qubits[3],qubits[1];
-cx qubits[3],qubits[8];
-cx qubits[0],qubits[5];
-cx qubits[0],qubits[2];
-h qubits[0];
-h qubits[0];
-ccx qubits[9],qubits[1],qubits[0];
-h qubits[0];
-h qubits[0];
-cx qubits[0],qubits[7];
-cx qubits[0],qubits[5];
-cx qubits[0],qubits[2];
-h qubits[3];
-h qubits[3];
-ccx qubits[9],qubits[2],qubits[3];
-h qubits[3];
-h qubits[3];
-cx qubits[3],qubits[6];
-cx qubits[0],qubits[3];
-cx qubits[3],qubits[2];
-cx qubits[0],qubits[9];
-cx qubits[0],qubits[4];
-cx qubits[3],qubits[0];
-cx qubits[8],qubits[6];
-cx qubits[8],qubits[5];
-cx qubits[8],qubits[4];
-cx qubits[8],qubits[1];
-cx qubits[4],qubits[8];
-cx qubits[9],qubits[8];
-cx qubits[7],qubits[1];
-cx qubits[7],qubits[0];
-cx qubits[9],qubits[7];
-cx qubits[0],qubits[7];
-cx qubits[7],qubits[9];
-x qubits[7];
-cx qubits[6],qubits[9];
-cx qubits[6],qubits[4];
-cx qubits[6],qubits[0];
-cx qubits[2],qubits[8];
-cx qubits[2],qubits[7];
-cx qubits[2],qubits[6];
-cx qubits[6],qubits[2];
-x qubits[2];
-cx qubits[0],qubits[2];
-cx qubits[2],qubits[0];
-cx qubits[2],qubits[4];
-cx qubits[2],qubits[7];
-cx qubits[6],qubits[3];
-cx qubits[6],qubits[5];
-cx qubits[6],qubits[9];
-cx qubits[9],qubits[6];
-cx qubits[6],qubits[8];
-cx qubits[0],qubits[6];
-cx qubits[8],qubits[0];
-cx qubits[3],qubits[7];
-cx qubits[7],qubits[2];
-cx qubits[7],qubits[3];
-cx qubits[4],qubits[5];
-cx qubits[7],qubits[4];
-cx qubits[9],qubits[2];
-cx qubits[8],qubits[9];
-cx qubits[9],qubits[3];
-cx qubits[8],qubits[4];
-cx qubits[0],qubits[1];
-cx qubits[0],qubits[2];
-cx qubits[0],qubits[3];
-cx qubits[0],qubits[5];
-cx qubits[3],qubits[0];
-cx qubits[0],qubits[8];
-cx qubits[4],qubits[9];
-cx qubits[4],qubits[2];
-cx qubits[4],qubits[6];
-cx qubits[9],qubits[7];
-h qubits[4];
-h qubits[4];
-ccx qubits[2],qubits[9],qubits[4];
-h qubits[4];
-h qubits[4];
-x qubits[7];
-cx qubits[1],qubits[6];
-cx qubits[3],qubits[1];
-x qubits[3];
-cx qubits[1],qubits[6];
-h qubits[3];
-h qubits[3];
-ccx qubits[1],qubits[9],qubits[3];
-h qubits[3];
-h qubits[3];
-cx qubits[3],qubits[7];
-h qubits[4];
-h qubits[4];
-ccx qubits[9],qubits[8],qubits[4];
-h qubits[4];
-h qubits[4];
-cx qubits[4],qubits[7];
-cx qubits[8],qubits[7];
-cx qubits[0],qubits[9];
-cx qubits[0],qubits[8];
-cx qubits[7],qubits[0];
-cx qubits[2],qubits[1];
-cx qubits[1],qubits[7];
-cx qubits[2],qubits[8];
-cx qubits[6],qubits[9];
-cx qubits[6],qubits[8];
-h qubits[2];
-h qubits[2];
-ccx qubits[1],qubits[8],qubits[2];
-h qubits[2];
-h qubits[2];
-cx qubits[6],qubits[1];
-cx qubits[1],qubits[2];
-h qubits[6];
-h qubits[6];
-ccx qubits[1],qubits[7],qubits[6];
-h qubits[6];
-h qubits[6];
-cx qubits[0],qubits[1];
-cx qubits[0],qubits[2];
-cx qubits[0],qubits[6];
-x qubits[4];
-x qubits[5];
-h qubits[7];
-h qubits[7];
-ccx qubits[9],qubits[8],qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[9];
-h qubits[9];
-ccx qubits[10],qubits[7],qubits[9];
-h qubits[9];
-h qubits[9];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[0];
-h qubits[0];
-ccx qubits[10],qubits[5],qubits[0];
-h qubits[0];
-h qubits[0];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[9];
-h qubits[9];
-ccx qubits[10],qubits[7],qubits[9];
-h qubits[9];
-h qubits[9];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[7];
-h qubits[7];
-ccx qubits[9],qubits[8],qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[8];
-h qubits[8];
-ccx qubits[10],qubits[7],qubits[8];
-h qubits[8];
-h qubits[8];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[0];
-h qubits[0];
-ccx qubits[10],qubits[5],qubits[0];
-h qubits[0];
-h qubits[0];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[8];
-h qubits[8];
-ccx qubits[10],qubits[7],qubits[8];
-h qubits[8];
-h qubits[8];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-x qubits[4];
-x qubits[3];
-cx qubits[0],qubits[6];
-cx qubits[1],qubits[2];
-cx qubits[0],qubits[1];
-h qubits[6];
-h qubits[6];
-ccx qubits[1],qubits[7],qubits[6];
-h qubits[6];
-h qubits[6];
-cx qubits[6],qubits[1];
-h qubits[2];
-h qubits[2];
-ccx qubits[1],qubits[8],qubits[2];
-h qubits[2];
-h qubits[2];
-cx qubits[6],qubits[8];
-cx qubits[6],qubits[9];
-cx qubits[2],qubits[8];
-cx qubits[1],qubits[7];
-cx qubits[2],qubits[1];
-cx qubits[7],qubits[0];
-cx qubits[0],qubits[8];
-cx qubits[0],qubits[9];
-cx qubits[8],qubits[7];
-cx qubits[9],qubits[7];
-h qubits[7];
-h qubits[7];
-ccx qubits[1],qubits[9],qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[7];
-ccx qubits[2],qubits[9],qubits[7];
-h qubits[7];
-h qubits[7];
-cx qubits[4],qubits[7];
-h qubits[4];
-h qubits[4];
-ccx qubits[9],qubits[8],qubits[4];
-h qubits[4];
-h qubits[4];
-cx qubits[4],qubits[7];
-h qubits[3];
-h qubits[3];
-ccx qubits[9],qubits[1],qubits[3];
-h qubits[3];
-h qubits[3];
-cx qubits[3],qubits[8];
-cx qubits[3],qubits[7];
-cx qubits[0],qubits[6];
-cx qubits[3],qubits[0];
-cx qubits[0],qubits[3];
-cx qubits[3],qubits[1];
-h qubits[4];
-h qubits[4];
-ccx qubits[9],qubits[2],qubits[4];
-h qubits[4];
-h qubits[4];
-cx qubits[4],qubits[7];
-cx qubits[4],qubits[6];
-cx qubits[4],qubits[5];
-cx qubits[4],qubits[2];
-cx qubits[4],qubits[9];
-cx qubits[8],qubits[5];
-cx qubits[0],qubits[8];
-cx qubits[0],qubits[2];
-cx qubits[9],qubits[6];
-cx qubits[8],qubits[9];
-cx qubits[8],qubits[4];
-cx qubits[8],qubits[3];
-cx qubits[8],qubits[0];
-cx qubits[9],qubits[8];
-cx qubits[9],qubits[3];
-cx qubits[9],qubits[2];
-cx qubits[7],qubits[5];
-cx qubits[7],qubits[4];
-cx qubits[7],qubits[3];
-cx qubits[7],qubits[2];
-x qubits[3];
-cx qubits[3],qubits[7];
-cx qubits[2],qubits[7];
-cx qubits[6],qubits[9];
-cx qubits[6],qubits[8];
-cx qubits[6],qubits[5];
-cx qubits[2],qubits[4];
-cx qubits[2],qubits[0];
-cx qubits[0],qubits[2];
-cx qubits[2],qubits[6];
-cx qubits[2],qubits[7];
-cx qubits[2],qubits[9];
-cx qubits[6],qubits[9];
-cx qubits[9],qubits[6];
-cx qubits[6],qubits[1];
-cx qubits[6],qubits[4];
-cx qubits[0],qubits[7];
-cx qubits[7],qubits[0];
-cx qubits[7],qubits[1];
-cx qubits[9],qubits[2];
-cx qubits[9],qubits[3];
-cx qubits[0],qubits[8];
-cx qubits[8],qubits[0];
-cx qubits[8],qubits[2];
-cx qubits[8],qubits[5];
-cx qubits[4],qubits[5];
-cx qubits[4],qubits[6];
-cx qubits[4],qubits[7];
-cx qubits[4],qubits[9];
-cx qubits[0],qubits[4];
-cx qubits[4],qubits[0];
-cx qubits[4],qubits[2];
-cx qubits[4],qubits[8];
-h qubits[4];
-h qubits[4];
-ccx qubits[9],qubits[2],qubits[4];
-h qubits[4];
-h qubits[4];
-cx qubits[3],qubits[1];
-cx qubits[3],qubits[8];
-h qubits[3];
-h qubits[3];
-ccx qubits[9],qubits[1],qubits[3];
-h qubits[3];
-h qubits[3];
-cx qubits[2],qubits[3];
-cx qubits[2],qubits[4];
-cx qubits[2],qubits[6];
-cx qubits[2],qubits[7];
-h qubits[2];
-h qubits[2];
-ccx qubits[9],qubits[8],qubits[2];
-h qubits[2];
-h qubits[2];
-cx qubits[2],qubits[3];
-cx qubits[2],qubits[4];
-cx qubits[2],qubits[6];
-cx qubits[2],qubits[7];
-cx qubits[9],qubits[7];
-cx qubits[2],qubits[1];
-h qubits[7];
-h qubits[7];
-ccx qubits[1],qubits[9],qubits[7];
-h qubits[7];
-h qubits[7];
-cx qubits[8],qubits[7];
-cx qubits[0],qubits[9];
-cx qubits[0],qubits[8];
-cx qubits[7],qubits[0];
-cx qubits[1],qubits[7];
-cx qubits[2],qubits[8];
-cx qubits[6],qubits[9];
-cx qubits[6],qubits[8];
-h qubits[2];
-h qubits[2];
-ccx qubits[1],qubits[8],qubits[2];
-h qubits[2];
-h qubits[2];
-cx qubits[6],qubits[1];
-cx qubits[1],qubits[2];
-h qubits[6];
-h qubits[6];
-ccx qubits[1],qubits[7],qubits[6];
-h qubits[6];
-h qubits[6];
-cx qubits[0],qubits[1];
-cx qubits[0],qubits[2];
-cx qubits[0],qubits[6];
-x qubits[3];
-x qubits[4];
-x qubits[5];
-h qubits[7];
-h qubits[7];
-ccx qubits[9],qubits[8],qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[9];
-h qubits[9];
-ccx qubits[10],qubits[7],qubits[9];
-h qubits[9];
-h qubits[9];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[0];
-h qubits[0];
-ccx qubits[10],qubits[5],qubits[0];
-h qubits[0];
-h qubits[0];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[9];
-h qubits[9];
-ccx qubits[10],qubits[7],qubits[9];
-h qubits[9];
-h qubits[9];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[7];
-h qubits[7];
-ccx qubits[9],qubits[8],qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[8];
-h qubits[8];
-ccx qubits[10],qubits[7],qubits[8];
-h qubits[8];
-h qubits[8];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[0];
-h qubits[0];
-ccx qubits[10],qubits[5],qubits[0];
-h qubits[0];
-h qubits[0];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[8];
-h qubits[8];
-ccx qubits[10],qubits[7],qubits[8];
-h qubits[8];
-h qubits[8];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-x qubits[4];
-x qubits[3];
-cx qubits[0],qubits[6];
-cx qubits[1],qubits[2];
-cx qubits[0],qubits[1];
-h qubits[6];
-h qubits[6];
-ccx qubits[1],qubits[7],qubits[6];
-h qubits[6];
-h qubits[6];
-cx qubits[6],qubits[1];
-h qubits[2];
-h qubits[2];
-ccx qubits[1],qubits[8],qubits[2];
-h qubits[2];
-h qubits[2];
-cx qubits[6],qubits[8];
-cx qubits[6],qubits[9];
-cx qubits[2],qubits[8];
-cx qubits[1],qubits[7];
-cx qubits[2],qubits[1];
-cx qubits[7],qubits[0];
-cx qubits[0],qubits[8];
-cx qubits[0],qubits[9];
-cx qubits[8],qubits[7];
-cx qubits[9],qubits[7];
-h qubits[7];
-h qubits[7];
-ccx qubits[1],qubits[9],qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[7];
-ccx qubits[2],qubits[9],qubits[7];
-h qubits[7];
-h qubits[7];
-cx qubits[2],qubits[7];
-cx qubits[2],qubits[6];
-cx qubits[2],qubits[4];
-cx qubits[2],qubits[3];
-h qubits[2];
-h qubits[2];
-ccx qubits[9],qubits[8],qubits[2];
-h qubits[2];
-h qubits[2];
-cx qubits[2],qubits[7];
-cx qubits[2],qubits[6];
-cx qubits[2],qubits[4];
-cx qubits[2],qubits[3];
-h qubits[3];
-h qubits[3];
-ccx qubits[9],qubits[1],qubits[3];
-h qubits[3];
-h qubits[3];
-cx qubits[3],qubits[8];
-cx qubits[3],qubits[1];
-h qubits[4];
-h qubits[4];
-ccx qubits[9],qubits[2],qubits[4];
-h qubits[4];
-h qubits[4];
-cx qubits[4],qubits[8];
-cx qubits[4],qubits[7];
-cx qubits[4],qubits[6];
-cx qubits[0],qubits[5];
-cx qubits[4],qubits[0];
-cx qubits[4],qubits[2];
-cx qubits[4],qubits[9];
-cx qubits[9],qubits[4];
-cx qubits[0],qubits[9];
-cx qubits[0],qubits[7];
-cx qubits[0],qubits[6];
-cx qubits[8],qubits[5];
-cx qubits[8],qubits[2];
-cx qubits[8],qubits[0];
-cx qubits[0],qubits[8];
-cx qubits[6],qubits[3];
-cx qubits[9],qubits[6];
-x qubits[3];
-cx qubits[9],qubits[2];
-cx qubits[9],qubits[1];
-cx qubits[7],qubits[1];
-cx qubits[7],qubits[0];
-cx qubits[6],qubits[9];
-cx qubits[6],qubits[1];
-cx qubits[3],qubits[6];
-cx qubits[3],qubits[4];
-cx qubits[9],qubits[3];
-cx qubits[2],qubits[9];
-cx qubits[2],qubits[7];
-x qubits[8];
-cx qubits[0],qubits[2];
-cx qubits[2],qubits[0];
-cx qubits[7],qubits[0];
-cx qubits[2],qubits[6];
-cx qubits[6],qubits[2];
-cx qubits[2],qubits[8];
-cx qubits[6],qubits[3];
-cx qubits[6],qubits[5];
-cx qubits[7],qubits[2];
-cx qubits[7],qubits[4];
-cx qubits[7],qubits[6];
-cx qubits[9],qubits[0];
-cx qubits[0],qubits[9];
-cx qubits[9],qubits[6];
-cx qubits[3],qubits[8];
-cx qubits[8],qubits[1];
-cx qubits[8],qubits[2];
-cx qubits[8],qubits[3];
-cx qubits[8],qubits[4];
-cx qubits[8],qubits[6];
-cx qubits[8],qubits[9];
-cx qubits[0],qubits[1];
-cx qubits[0],qubits[3];
-cx qubits[0],qubits[4];
-cx qubits[0],qubits[8];
-h qubits[2];
-h qubits[2];
-ccx qubits[1],qubits[9],qubits[2];
-h qubits[2];
-h qubits[2];
-cx qubits[0],qubits[1];
-h qubits[0];
-h qubits[0];
-ccx qubits[9],qubits[2],qubits[0];
-h qubits[0];
-h qubits[0];
-cx qubits[0],qubits[1];
-cx qubits[4],qubits[9];
-cx qubits[4],qubits[5];
-cx qubits[4],qubits[6];
-cx qubits[4],qubits[7];
-x qubits[4];
-cx qubits[3],qubits[4];
-cx qubits[3],qubits[6];
-h qubits[4];
-h qubits[4];
-ccx qubits[9],qubits[1],qubits[4];
-h qubits[4];
-h qubits[4];
-cx qubits[3],qubits[9];
-cx qubits[3],qubits[8];
-cx qubits[3],qubits[0];
-h qubits[3];
-h qubits[3];
-ccx qubits[9],qubits[8],qubits[3];
-h qubits[3];
-h qubits[3];
-cx qubits[2],qubits[1];
-h qubits[7];
-h qubits[7];
-ccx qubits[1],qubits[9],qubits[7];
-h qubits[7];
-h qubits[7];
-cx qubits[9],qubits[7];
-cx qubits[8],qubits[7];
-cx qubits[0],qubits[9];
-cx qubits[0],qubits[8];
-cx qubits[7],qubits[0];
-cx qubits[1],qubits[7];
-cx qubits[2],qubits[8];
-cx qubits[6],qubits[9];
-cx qubits[6],qubits[8];
-h qubits[2];
-h qubits[2];
-ccx qubits[1],qubits[8],qubits[2];
-h qubits[2];
-h qubits[2];
-cx qubits[6],qubits[1];
-cx qubits[1],qubits[2];
-h qubits[6];
-h qubits[6];
-ccx qubits[1],qubits[7],qubits[6];
-h qubits[6];
-h qubits[6];
-cx qubits[0],qubits[1];
-cx qubits[0],qubits[2];
-cx qubits[0],qubits[6];
-x qubits[3];
-x qubits[5];
-h qubits[7];
-h qubits[7];
-ccx qubits[9],qubits[8],qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[9];
-h qubits[9];
-ccx qubits[10],qubits[7],qubits[9];
-h qubits[9];
-h qubits[9];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[0];
-h qubits[0];
-ccx qubits[10],qubits[5],qubits[0];
-h qubits[0];
-h qubits[0];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[9];
-h qubits[9];
-ccx qubits[10],qubits[7],qubits[9];
-h qubits[9];
-h qubits[9];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[7];
-h qubits[7];
-ccx qubits[9],qubits[8],qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[8];
-h qubits[8];
-ccx qubits[10],qubits[7],qubits[8];
-h qubits[8];
-h qubits[8];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[0];
-h qubits[0];
-ccx qubits[10],qubits[5],qubits[0];
-h qubits[0];
-h qubits[0];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[8];
-h qubits[8];
-ccx qubits[10],qubits[7],qubits[8];
-h qubits[8];
-h qubits[8];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-x qubits[4];
-x qubits[3];
-cx qubits[0],qubits[6];
-cx qubits[1],qubits[2];
-cx qubits[0],qubits[1];
-h qubits[6];
-h qubits[6];
-ccx qubits[1],qubits[7],qubits[6];
-h qubits[6];
-h qubits[6];
-cx qubits[6],qubits[1];
-h qubits[2];
-h qubits[2];
-ccx qubits[1],qubits[8],qubits[2];
-h qubits[2];
-h qubits[2];
-cx qubits[6],qubits[8];
-cx qubits[6],qubits[9];
-cx qubits[2],qubits[8];
-cx qubits[1],qubits[7];
-cx qubits[2],qubits[1];
-cx qubits[7],qubits[0];
-cx qubits[0],qubits[8];
-cx qubits[0],qubits[9];
-cx qubits[8],qubits[7];
-cx qubits[9],qubits[7];
-h qubits[7];
-h qubits[7];
-ccx qubits[1],qubits[9],qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[7];
-ccx qubits[2],qubits[9],qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[3];
-h qubits[3];
-ccx qubits[9],qubits[8],qubits[3];
-h qubits[3];
-h qubits[3];
-cx qubits[3],qubits[6];
-cx qubits[3],qubits[4];
-cx qubits[3],qubits[0];
-cx qubits[3],qubits[8];
-cx qubits[3],qubits[9];
-h qubits[4];
-h qubits[4];
-ccx qubits[9],qubits[1],qubits[4];
-h qubits[4];
-h qubits[4];
-cx qubits[4],qubits[7];
-cx qubits[4],qubits[6];
-cx qubits[4],qubits[5];
-cx qubits[4],qubits[9];
-cx qubits[0],qubits[1];
-h qubits[0];
-h qubits[0];
-ccx qubits[9],qubits[2],qubits[0];
-h qubits[0];
-h qubits[0];
-cx qubits[0],qubits[1];
-h qubits[2];
-h qubits[2];
-ccx qubits[1],qubits[9],qubits[2];
-h qubits[2];
-h qubits[2];
-cx qubits[9],qubits[6];
-cx qubits[8],qubits[9];
-cx qubits[8],qubits[4];
-cx qubits[8],qubits[3];
-cx qubits[8],qubits[1];
-cx qubits[0],qubits[8];
-cx qubits[8],qubits[2];
-cx qubits[3],qubits[8];
-cx qubits[9],qubits[3];
-cx qubits[9],qubits[0];
-cx qubits[6],qubits[4];
-cx qubits[6],qubits[2];
-cx qubits[7],qubits[6];
-cx qubits[7],qubits[0];
-cx qubits[0],qubits[7];
-cx qubits[6],qubits[8];
-cx qubits[3],qubits[6];
-cx qubits[6],qubits[3];
-x qubits[3];
-cx qubits[3],qubits[6];
-cx qubits[3],qubits[5];
-cx qubits[2],qubits[7];
-x qubits[7];
-cx qubits[7],qubits[2];
-cx qubits[2],qubits[5];
-cx qubits[6],qubits[2];
-cx qubits[7],qubits[6];
-cx qubits[6],qubits[4];
-cx qubits[6],qubits[9];
-cx qubits[7],qubits[1];
-cx qubits[7],qubits[8];
-cx qubits[9],qubits[7];
-cx qubits[7],qubits[0];
-cx qubits[9],qubits[2];
-cx qubits[9],qubits[3];
-cx qubits[9],qubits[5];
-h qubits[8];
-h qubits[8];
-ccx qubits[1],qubits[2],qubits[8];
-h qubits[8];
-h qubits[8];
-cx qubits[8],qubits[1];
-cx qubits[8],qubits[2];
-cx qubits[8],qubits[7];
-cx qubits[3],qubits[0];
-cx qubits[0],qubits[1];
-cx qubits[0],qubits[2];
-cx qubits[0],qubits[3];
-cx qubits[0],qubits[4];
-cx qubits[0],qubits[5];
-cx qubits[0],qubits[8];
-cx qubits[0],qubits[9];
-cx qubits[3],qubits[9];
-cx qubits[5],qubits[7];
-cx qubits[3],qubits[5];
-h qubits[3];
-h qubits[3];
-ccx qubits[9],qubits[2],qubits[3];
-h qubits[3];
-h qubits[3];
-cx qubits[0],qubits[7];
-h qubits[0];
-h qubits[0];
-ccx qubits[9],qubits[1],qubits[0];
-h qubits[0];
-h qubits[0];
-cx qubits[0],qubits[7];
-cx qubits[5],qubits[9];
-cx qubits[5],qubits[8];
-cx qubits[5],qubits[2];
-h qubits[5];
-h qubits[5];
-ccx qubits[9],qubits[8],qubits[5];
-h qubits[5];
-h qubits[5];
-cx qubits[2],qubits[1];
-h qubits[7];
-h qubits[7];
-ccx qubits[1],qubits[9],qubits[7];
-h qubits[7];
-h qubits[7];
-cx qubits[9],qubits[7];
-cx qubits[8],qubits[7];
-cx qubits[0],qubits[9];
-cx qubits[0],qubits[8];
-cx qubits[7],qubits[0];
-cx qubits[1],qubits[7];
-cx qubits[2],qubits[8];
-cx qubits[6],qubits[9];
-cx qubits[6],qubits[8];
-h qubits[2];
-h qubits[2];
-ccx qubits[1],qubits[8],qubits[2];
-h qubits[2];
-h qubits[2];
-cx qubits[6],qubits[1];
-cx qubits[1],qubits[2];
-h qubits[6];
-h qubits[6];
-ccx qubits[1],qubits[7],qubits[6];
-h qubits[6];
-h qubits[6];
-cx qubits[0],qubits[1];
-cx qubits[0],qubits[2];
-cx qubits[0],qubits[6];
-x qubits[3];
-x qubits[4];
-x qubits[5];
-h qubits[7];
-h qubits[7];
-ccx qubits[9],qubits[8],qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[9];
-h qubits[9];
-ccx qubits[10],qubits[7],qubits[9];
-h qubits[9];
-h qubits[9];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[0];
-h qubits[0];
-ccx qubits[10],qubits[5],qubits[0];
-h qubits[0];
-h qubits[0];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[9];
-h qubits[9];
-ccx qubits[10],qubits[7],qubits[9];
-h qubits[9];
-h qubits[9];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[7];
-h qubits[7];
-ccx qubits[9],qubits[8],qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[8];
-h qubits[8];
-ccx qubits[10],qubits[7],qubits[8];
-h qubits[8];
-h qubits[8];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[0];
-h qubits[0];
-ccx qubits[10],qubits[5],qubits[0];
-h qubits[0];
-h qubits[0];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[8];
-h qubits[8];
-ccx qubits[10],qubits[7],qubits[8];
-h qubits[8];
-h qubits[8];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-x qubits[5];
-x qubits[3];
-cx qubits[0],qubits[6];
-cx qubits[1],qubits[2];
-cx qubits[0],qubits[1];
-h qubits[6];
-h qubits[6];
-ccx qubits[1],qubits[7],qubits[6];
-h qubits[6];
-h qubits[6];
-cx qubits[6],qubits[1];
-h qubits[2];
-h qubits[2];
-ccx qubits[1],qubits[8],qubits[2];
-h qubits[2];
-h qubits[2];
-cx qubits[6],qubits[8];
-cx qubits[6],qubits[9];
-cx qubits[2],qubits[8];
-cx qubits[1],qubits[7];
-cx qubits[2],qubits[1];
-cx qubits[7],qubits[0];
-cx qubits[8],qubits[7];
-cx qubits[0],qubits[8];
-cx qubits[0],qubits[9];
-cx qubits[9],qubits[7];
-h qubits[7];
-h qubits[7];
-ccx qubits[1],qubits[9],qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[7];
-ccx qubits[2],qubits[9],qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[5];
-h qubits[5];
-ccx qubits[9],qubits[8],qubits[5];
-h qubits[5];
-h qubits[5];
-cx qubits[5],qubits[7];
-cx qubits[5],qubits[2];
-cx qubits[5],qubits[8];
-cx qubits[5],qubits[9];
-h qubits[0];
-h qubits[0];
-ccx qubits[9],qubits[1],qubits[0];
-h qubits[0];
-h qubits[0];
-cx qubits[8],qubits[7];
-cx qubits[0],qubits[8];
-h qubits[3];
-h qubits[3];
-ccx qubits[9],qubits[2],qubits[3];
-h qubits[3];
-h qubits[3];
-cx qubits[7],qubits[5];
-cx qubits[3],qubits[7];
-cx qubits[0],qubits[3];
-cx qubits[3],qubits[9];
-cx qubits[0],qubits[5];
-cx qubits[0],qubits[4];
-cx qubits[0],qubits[2];
-cx qubits[0],qubits[1];
-cx qubits[9],qubits[3];
-cx qubits[3],qubits[0];
-cx qubits[8],qubits[2];
-cx qubits[8],qubits[1];
-h qubits[8];
-h qubits[8];
-ccx qubits[1],qubits[2],qubits[8];
-h qubits[8];
-h qubits[8];
-cx qubits[7],qubits[2];
-cx qubits[9],qubits[7];
-cx qubits[7],qubits[9];
-cx qubits[7],qubits[8];
-cx qubits[6],qubits[4];
-cx qubits[7],qubits[6];
-cx qubits[7],qubits[1];
-cx qubits[7],qubits[0];
-cx qubits[6],qubits[9];
-cx qubits[6],qubits[3];
-cx qubits[6],qubits[2];
-cx qubits[2],qubits[8];
-cx qubits[2],qubits[5];
-cx qubits[0],qubits[2];
-cx qubits[2],qubits[0];
-x qubits[6];
-cx qubits[2],qubits[4];
-cx qubits[0],qubits[2];
-x qubits[8];
-x qubits[7];
-cx qubits[2],qubits[6];
-cx qubits[2],qubits[7];
-cx qubits[6],qubits[0];
-cx qubits[6],qubits[2];
-cx qubits[7],qubits[4];
-cx qubits[7],qubits[9];
-cx qubits[6],qubits[7];
-cx qubits[7],qubits[6];
-cx qubits[7],qubits[1];
-cx qubits[7],qubits[2];
-cx qubits[0],qubits[9];
-cx qubits[9],qubits[0];
-cx qubits[9],qubits[1];
-cx qubits[9],qubits[2];
-cx qubits[9],qubits[7];
-cx qubits[3],qubits[4];
-cx qubits[3],qubits[8];
-cx qubits[0],qubits[3];
-cx qubits[8],qubits[0];
-cx qubits[8],qubits[5];
-x qubits[4];
-cx qubits[0],qubits[1];
-cx qubits[0],qubits[6];
-cx qubits[0],qubits[7];
-cx qubits[3],qubits[9];
-cx qubits[3],qubits[2];
-h qubits[3];
-h qubits[3];
-ccx qubits[9],qubits[2],qubits[3];
-h qubits[3];
-h qubits[3];
-cx qubits[3],qubits[1];
-cx qubits[3],qubits[0];
-cx qubits[3],qubits[2];
-cx qubits[3],qubits[4];
-cx qubits[3],qubits[6];
-cx qubits[3],qubits[8];
-h qubits[3];
-h qubits[3];
-ccx qubits[9],qubits[1],qubits[3];
-h qubits[3];
-h qubits[3];
-cx qubits[3],qubits[9];
-cx qubits[3],qubits[8];
-cx qubits[3],qubits[1];
-cx qubits[3],qubits[4];
-cx qubits[3],qubits[5];
-cx qubits[3],qubits[6];
-cx qubits[3],qubits[7];
-h qubits[3];
-h qubits[3];
-ccx qubits[9],qubits[8],qubits[3];
-h qubits[3];
-h qubits[3];
-cx qubits[2],qubits[1];
-h qubits[7];
-h qubits[7];
-ccx qubits[1],qubits[9],qubits[7];
-h qubits[7];
-h qubits[7];
-cx qubits[9],qubits[7];
-cx qubits[8],qubits[7];
-cx qubits[0],qubits[9];
-cx qubits[0],qubits[8];
-cx qubits[7],qubits[0];
-cx qubits[1],qubits[7];
-cx qubits[2],qubits[8];
-cx qubits[6],qubits[9];
-cx qubits[6],qubits[8];
-h qubits[2];
-h qubits[2];
-ccx qubits[1],qubits[8],qubits[2];
-h qubits[2];
-h qubits[2];
-cx qubits[6],qubits[1];
-cx qubits[1],qubits[2];
-h qubits[6];
-h qubits[6];
-ccx qubits[1],qubits[7],qubits[6];
-h qubits[6];
-h qubits[6];
-cx qubits[0],qubits[1];
-cx qubits[0],qubits[2];
-cx qubits[0],qubits[6];
-x qubits[3];
-h qubits[7];
-h qubits[7];
-ccx qubits[9],qubits[8],qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[9];
-h qubits[9];
-ccx qubits[10],qubits[7],qubits[9];
-h qubits[9];
-h qubits[9];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[0];
-h qubits[0];
-ccx qubits[10],qubits[5],qubits[0];
-h qubits[0];
-h qubits[0];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[9];
-h qubits[9];
-ccx qubits[10],qubits[7],qubits[9];
-h qubits[9];
-h qubits[9];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[7];
-h qubits[7];
-ccx qubits[9],qubits[8],qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[8];
-h qubits[8];
-ccx qubits[10],qubits[7],qubits[8];
-h qubits[8];
-h qubits[8];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[0];
-h qubits[0];
-ccx qubits[10],qubits[5],qubits[0];
-h qubits[0];
-h qubits[0];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[8];
-h qubits[8];
-ccx qubits[10],qubits[7],qubits[8];
-h qubits[8];
-h qubits[8];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-x qubits[3];
-cx qubits[0],qubits[6];
-cx qubits[1],qubits[2];
-cx qubits[0],qubits[1];
-h qubits[6];
-h qubits[6];
-ccx qubits[1],qubits[7],qubits[6];
-h qubits[6];
-h qubits[6];
-cx qubits[6],qubits[1];
-h qubits[2];
-h qubits[2];
-ccx qubits[1],qubits[8],qubits[2];
-h qubits[2];
-h qubits[2];
-cx qubits[6],qubits[8];
-cx qubits[6],qubits[9];
-cx qubits[2],qubits[8];
-cx qubits[1],qubits[7];
-cx qubits[2],qubits[1];
-cx qubits[7],qubits[0];
-cx qubits[0],qubits[8];
-cx qubits[0],qubits[9];
-cx qubits[8],qubits[7];
-cx qubits[9],qubits[7];
-h qubits[7];
-h qubits[7];
-ccx qubits[1],qubits[9],qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[7];
-ccx qubits[2],qubits[9],qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[3];
-h qubits[3];
-ccx qubits[9],qubits[8],qubits[3];
-h qubits[3];
-h qubits[3];
-cx qubits[3],qubits[7];
-cx qubits[3],qubits[6];
-cx qubits[3],qubits[5];
-cx qubits[3],qubits[4];
-cx qubits[3],qubits[1];
-cx qubits[3],qubits[8];
-cx qubits[3],qubits[9];
-h qubits[3];
-h qubits[3];
-ccx qubits[9],qubits[1],qubits[3];
-h qubits[3];
-h qubits[3];
-cx qubits[3],qubits[8];
-cx qubits[3],qubits[6];
-cx qubits[3],qubits[4];
-cx qubits[3],qubits[2];
-cx qubits[0],qubits[1];
-cx qubits[3],qubits[0];
-h qubits[3];
-h qubits[3];
-ccx qubits[9],qubits[2],qubits[3];
-h qubits[3];
-h qubits[3];
-cx qubits[3],qubits[8];
-cx qubits[3],qubits[7];
-cx qubits[3],qubits[6];
-cx qubits[3],qubits[5];
-cx qubits[0],qubits[4];
-cx qubits[3],qubits[0];
-cx qubits[9],qubits[2];
-cx qubits[3],qubits[9];
-cx qubits[0],qubits[7];
-cx qubits[0],qubits[6];
-cx qubits[8],qubits[0];
-cx qubits[0],qubits[3];
-cx qubits[8],qubits[5];
-cx qubits[8],qubits[4];
-cx qubits[0],qubits[8];
-cx qubits[7],qubits[1];
-cx qubits[9],qubits[7];
-cx qubits[9],qubits[0];
-cx qubits[0],qubits[9];
-cx qubits[6],qubits[9];
-x qubits[9];
-cx qubits[6],qubits[4];
-cx qubits[7],qubits[6];
-cx qubits[7],qubits[2];
-cx qubits[2],qubits[7];
-cx qubits[2],qubits[0];
-cx qubits[0],qubits[6];
-cx qubits[6],qubits[2];
-cx qubits[0],qubits[4];
-cx qubits[2],qubits[0];
-cx qubits[6],qubits[8];
-cx qubits[6],qubits[9];
-cx qubits[2],qubits[6];
-cx qubits[3],qubits[1];
-cx qubits[6],qubits[3];
-cx qubits[6],qubits[5];
-cx qubits[6],qubits[7];
-cx qubits[0],qubits[7];
-cx qubits[7],qubits[0];
-cx qubits[7],qubits[4];
-cx qubits[7],qubits[5];
-cx qubits[7],qubits[9];
-cx qubits[4],qubits[9];
-cx qubits[9],qubits[4];
-cx qubits[9],qubits[7];
-cx qubits[9],qubits[8];
-cx qubits[0],qubits[8];
-cx qubits[8],qubits[0];
-cx qubits[8],qubits[6];
-cx qubits[8],qubits[9];
-cx qubits[3],qubits[2];
-cx qubits[3],qubits[4];
-cx qubits[3],qubits[7];
-cx qubits[3],qubits[0];
-cx qubits[0],qubits[3];
-cx qubits[0],qubits[8];
-cx qubits[3],qubits[9];
-cx qubits[3],qubits[0];
-cx qubits[3],qubits[6];
-h qubits[3];
-h qubits[3];
-ccx qubits[9],qubits[2],qubits[3];
-h qubits[3];
-h qubits[3];
-h qubits[9];
-h qubits[9];
-ccx qubits[1],qubits[2],qubits[9];
-h qubits[9];
-h qubits[9];
-cx qubits[2],qubits[6];
-cx qubits[8],qubits[7];
-cx qubits[2],qubits[8];
-h qubits[2];
-h qubits[2];
-ccx qubits[9],qubits[1],qubits[2];
-h qubits[2];
-h qubits[2];
-cx qubits[2],qubits[6];
-cx qubits[2],qubits[8];
-cx qubits[1],qubits[2];
-cx qubits[1],qubits[4];
-cx qubits[1],qubits[5];
-cx qubits[9],qubits[7];
-h qubits[7];
-h qubits[7];
-ccx qubits[1],qubits[9],qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[1];
-h qubits[1];
-ccx qubits[8],qubits[9],qubits[1];
-h qubits[1];
-h qubits[1];
-cx qubits[1],qubits[2];
-cx qubits[1],qubits[4];
-cx qubits[1],qubits[5];
-h qubits[7];
-h qubits[7];
-ccx qubits[2],qubits[9],qubits[7];
-h qubits[7];
-h qubits[7];
-cx qubits[0],qubits[9];
-cx qubits[0],qubits[8];
-cx qubits[7],qubits[0];
-cx qubits[2],qubits[1];
-cx qubits[1],qubits[7];
-cx qubits[2],qubits[8];
-cx qubits[6],qubits[9];
-cx qubits[6],qubits[8];
-h qubits[2];
-h qubits[2];
-ccx qubits[1],qubits[8],qubits[2];
-h qubits[2];
-h qubits[2];
-cx qubits[6],qubits[1];
-cx qubits[1],qubits[2];
-h qubits[6];
-h qubits[6];
-ccx qubits[1],qubits[7],qubits[6];
-h qubits[6];
-h qubits[6];
-cx qubits[0],qubits[1];
-cx qubits[0],qubits[2];
-cx qubits[0],qubits[6];
-x qubits[3];
-x qubits[4];
-x qubits[5];
-h qubits[7];
-h qubits[7];
-ccx qubits[9],qubits[8],qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[9];
-h qubits[9];
-ccx qubits[10],qubits[7],qubits[9];
-h qubits[9];
-h qubits[9];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[0];
-h qubits[0];
-ccx qubits[10],qubits[5],qubits[0];
-h qubits[0];
-h qubits[0];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[9];
-h qubits[9];
-ccx qubits[10],qubits[7],qubits[9];
-h qubits[9];
-h qubits[9];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[7];
-h qubits[7];
-ccx qubits[9],qubits[8],qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[8];
-h qubits[8];
-ccx qubits[10],qubits[7],qubits[8];
-h qubits[8];
-h qubits[8];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[0];
-h qubits[0];
-ccx qubits[10],qubits[5],qubits[0];
-h qubits[0];
-h qubits[0];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[8];
-h qubits[8];
-ccx qubits[10],qubits[7],qubits[8];
-h qubits[8];
-h qubits[8];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-x qubits[4];
-x qubits[3];
-cx qubits[0],qubits[6];
-cx qubits[1],qubits[2];
-cx qubits[0],qubits[1];
-h qubits[6];
-h qubits[6];
-ccx qubits[1],qubits[7],qubits[6];
-h qubits[6];
-h qubits[6];
-cx qubits[6],qubits[1];
-h qubits[2];
-h qubits[2];
-ccx qubits[1],qubits[8],qubits[2];
-h qubits[2];
-h qubits[2];
-cx qubits[6],qubits[8];
-cx qubits[6],qubits[9];
-cx qubits[2],qubits[8];
-cx qubits[1],qubits[7];
-cx qubits[2],qubits[1];
-cx qubits[7],qubits[0];
-cx qubits[0],qubits[8];
-cx qubits[0],qubits[9];
-cx qubits[8],qubits[7];
-cx qubits[2],qubits[7];
-cx qubits[1],qubits[2];
-h qubits[7];
-h qubits[7];
-ccx qubits[2],qubits[9],qubits[7];
-h qubits[7];
-h qubits[7];
-cx qubits[9],qubits[7];
-cx qubits[2],qubits[7];
-cx qubits[1],qubits[5];
-cx qubits[1],qubits[4];
-h qubits[1];
-h qubits[1];
-ccx qubits[9],qubits[8],qubits[1];
-h qubits[1];
-h qubits[1];
-cx qubits[1],qubits[7];
-cx qubits[1],qubits[5];
-cx qubits[1],qubits[4];
-cx qubits[1],qubits[2];
-cx qubits[2],qubits[8];
-cx qubits[2],qubits[7];
-cx qubits[2],qubits[6];
-h qubits[2];
-h qubits[2];
-ccx qubits[9],qubits[1],qubits[2];
-h qubits[2];
-h qubits[2];
-cx qubits[2],qubits[8];
-cx qubits[2],qubits[7];
-cx qubits[2],qubits[6];
-h qubits[9];
-h qubits[9];
-ccx qubits[1],qubits[2],qubits[9];
-h qubits[9];
-h qubits[9];
-h qubits[3];
-h qubits[3];
-ccx qubits[9],qubits[2],qubits[3];
-h qubits[3];
-h qubits[3];
-cx qubits[3],qubits[7];
-cx qubits[3],qubits[6];
-cx qubits[3],qubits[4];
-cx qubits[0],qubits[1];
-cx qubits[0],qubits[2];
-cx qubits[3],qubits[0];
-cx qubits[3],qubits[9];
-cx qubits[0],qubits[8];
-cx qubits[7],qubits[4];
-cx qubits[0],qubits[7];
-cx qubits[0],qubits[3];
-cx qubits[3],qubits[0];
-cx qubits[8],qubits[9];
-cx qubits[8],qubits[6];
-cx qubits[8],qubits[0];
-cx qubits[0],qubits[8];
-cx qubits[9],qubits[8];
-cx qubits[9],qubits[7];
-cx qubits[4],qubits[9];
-cx qubits[7],qubits[0];
-x qubits[7];
-cx qubits[7],qubits[5];
-cx qubits[0],qubits[7];
-cx qubits[6],qubits[9];
-cx qubits[6],qubits[8];
-cx qubits[6],qubits[7];
-cx qubits[6],qubits[5];
-cx qubits[6],qubits[3];
-cx qubits[6],qubits[1];
-x qubits[6];
-cx qubits[2],qubits[5];
-cx qubits[2],qubits[7];
-cx qubits[3],qubits[6];
-cx qubits[6],qubits[1];
-cx qubits[6],qubits[3];
-cx qubits[6],qubits[5];
-cx qubits[7],qubits[0];
-cx qubits[7],qubits[3];
-cx qubits[7],qubits[4];
-cx qubits[7],qubits[9];
-cx qubits[9],qubits[7];
-cx qubits[7],qubits[6];
-cx qubits[9],qubits[3];
-cx qubits[9],qubits[5];
-cx qubits[9],qubits[8];
-cx qubits[0],qubits[8];
-cx qubits[8],qubits[0];
-cx qubits[8],qubits[1];
-cx qubits[8],qubits[2];
-cx qubits[8],qubits[5];
-cx qubits[8],qubits[6];
-h qubits[0];
-h qubits[0];
-ccx qubits[2],qubits[6],qubits[0];
-h qubits[0];
-h qubits[0];
-cx qubits[0],qubits[2];
-cx qubits[0],qubits[6];
-cx qubits[8],qubits[7];
-cx qubits[0],qubits[8];
-cx qubits[0],qubits[9];
-cx qubits[3],qubits[2];
-cx qubits[3],qubits[0];
-cx qubits[3],qubits[1];
-cx qubits[3],qubits[6];
-h qubits[3];
-h qubits[3];
-ccx qubits[9],qubits[2],qubits[3];
-h qubits[3];
-h qubits[3];
-cx qubits[3],qubits[1];
-cx qubits[3],qubits[0];
-cx qubits[5],qubits[8];
-cx qubits[3],qubits[5];
-h qubits[3];
-h qubits[3];
-ccx qubits[9],qubits[1],qubits[3];
-h qubits[3];
-h qubits[3];
-cx qubits[5],qubits[9];
-cx qubits[5],qubits[2];
-h qubits[5];
-h qubits[5];
-ccx qubits[9],qubits[8],qubits[5];
-h qubits[5];
-h qubits[5];
-cx qubits[2],qubits[1];
-h qubits[7];
-h qubits[7];
-ccx qubits[1],qubits[9],qubits[7];
-h qubits[7];
-h qubits[7];
-cx qubits[9],qubits[7];
-cx qubits[0],qubits[9];
-cx qubits[0],qubits[8];
-cx qubits[7],qubits[0];
-cx qubits[1],qubits[7];
-cx qubits[2],qubits[8];
-cx qubits[6],qubits[9];
-cx qubits[6],qubits[8];
-h qubits[2];
-h qubits[2];
-ccx qubits[1],qubits[8],qubits[2];
-h qubits[2];
-h qubits[2];
-cx qubits[6],qubits[1];
-cx qubits[1],qubits[2];
-h qubits[6];
-h qubits[6];
-ccx qubits[1],qubits[7],qubits[6];
-h qubits[6];
-h qubits[6];
-cx qubits[0],qubits[1];
-cx qubits[0],qubits[2];
-cx qubits[0],qubits[6];
-x qubits[3];
-x qubits[4];
-x qubits[5];
-h qubits[7];
-h qubits[7];
-ccx qubits[9],qubits[8],qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[9];
-h qubits[9];
-ccx qubits[10],qubits[7],qubits[9];
-h qubits[9];
-h qubits[9];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[0];
-h qubits[0];
-ccx qubits[10],qubits[5],qubits[0];
-h qubits[0];
-h qubits[0];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[9];
-h qubits[9];
-ccx qubits[10],qubits[7],qubits[9];
-h qubits[9];
-h qubits[9];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[7];
-h qubits[7];
-ccx qubits[9],qubits[8],qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[8];
-h qubits[8];
-ccx qubits[10],qubits[7],qubits[8];
-h qubits[8];
-h qubits[8];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[0];
-h qubits[0];
-ccx qubits[10],qubits[5],qubits[0];
-h qubits[0];
-h qubits[0];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[8];
-h qubits[8];
-ccx qubits[10],qubits[7],qubits[8];
-h qubits[8];
-h qubits[8];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-x qubits[5];
-x qubits[3];
-cx qubits[0],qubits[6];
-cx qubits[1],qubits[2];
-cx qubits[0],qubits[1];
-h qubits[6];
-h qubits[6];
-ccx qubits[1],qubits[7],qubits[6];
-h qubits[6];
-h qubits[6];
-cx qubits[6],qubits[1];
-h qubits[2];
-h qubits[2];
-ccx qubits[1],qubits[8],qubits[2];
-h qubits[2];
-h qubits[2];
-cx qubits[6],qubits[8];
-cx qubits[6],qubits[9];
-cx qubits[2],qubits[8];
-cx qubits[1],qubits[7];
-cx qubits[2],qubits[1];
-cx qubits[7],qubits[0];
-cx qubits[0],qubits[8];
-cx qubits[0],qubits[9];
-cx qubits[8],qubits[7];
-cx qubits[9],qubits[7];
-h qubits[7];
-h qubits[7];
-ccx qubits[1],qubits[9],qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[7];
-ccx qubits[2],qubits[9],qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[5];
-h qubits[5];
-ccx qubits[9],qubits[8],qubits[5];
-h qubits[5];
-h qubits[5];
-cx qubits[5],qubits[7];
-cx qubits[5],qubits[2];
-cx qubits[5],qubits[8];
-cx qubits[5],qubits[9];
-h qubits[3];
-h qubits[3];
-ccx qubits[9],qubits[1],qubits[3];
-h qubits[3];
-h qubits[3];
-cx qubits[3],qubits[8];
-cx qubits[3],qubits[7];
-cx qubits[3],qubits[5];
-cx qubits[3],qubits[0];
-cx qubits[3],qubits[1];
-h qubits[3];
-h qubits[3];
-ccx qubits[9],qubits[2],qubits[3];
-h qubits[3];
-h qubits[3];
-cx qubits[3],qubits[6];
-cx qubits[3],qubits[1];
-cx qubits[0],qubits[2];
-cx qubits[3],qubits[0];
-cx qubits[0],qubits[9];
-cx qubits[0],qubits[8];
-cx qubits[0],qubits[7];
-cx qubits[0],qubits[6];
-h qubits[0];
-h qubits[0];
-ccx qubits[2],qubits[6],qubits[0];
-h qubits[0];
-h qubits[0];
-cx qubits[8],qubits[6];
-cx qubits[8],qubits[5];
-cx qubits[8],qubits[2];
-cx qubits[8],qubits[1];
-cx qubits[8],qubits[0];
-cx qubits[0],qubits[8];
-cx qubits[9],qubits[8];
-cx qubits[7],qubits[6];
-cx qubits[9],qubits[7];
-x qubits[9];
-cx qubits[9],qubits[5];
-cx qubits[7],qubits[9];
-cx qubits[9],qubits[3];
-cx qubits[7],qubits[4];
-cx qubits[2],qubits[7];
-cx qubits[7],qubits[0];
-x qubits[7];
-cx qubits[6],qubits[5];
-x qubits[1];
-cx qubits[6],qubits[3];
-cx qubits[6],qubits[1];
-cx qubits[3],qubits[6];
-cx qubits[2],qubits[9];
-cx qubits[2],qubits[8];
-cx qubits[2],qubits[6];
-cx qubits[0],qubits[5];
-cx qubits[0],qubits[2];
-cx qubits[0],qubits[4];
-x qubits[0];
-cx qubits[2],qubits[0];
-cx qubits[2],qubits[1];
-cx qubits[6],qubits[9];
-cx qubits[2],qubits[6];
-cx qubits[6],qubits[2];
-cx qubits[9],qubits[2];
-cx qubits[6],qubits[3];
-cx qubits[9],qubits[6];
-cx qubits[6],qubits[8];
-cx qubits[8],qubits[6];
-cx qubits[0],qubits[7];
-cx qubits[7],qubits[0];
-cx qubits[7],qubits[2];
-cx qubits[7],qubits[4];
-cx qubits[7],qubits[5];
-cx qubits[7],qubits[6];
-cx qubits[9],qubits[0];
-cx qubits[9],qubits[5];
-cx qubits[8],qubits[1];
-cx qubits[8],qubits[2];
-cx qubits[8],qubits[4];
-cx qubits[8],qubits[7];
-cx qubits[5],qubits[8];
-cx qubits[8],qubits[9];
-cx qubits[3],qubits[0];
-cx qubits[0],qubits[2];
-cx qubits[0],qubits[3];
-x qubits[7];
-cx qubits[9],qubits[7];
-cx qubits[3],qubits[6];
-cx qubits[0],qubits[9];
-cx qubits[3],qubits[0];
-cx qubits[5],qubits[2];
-x qubits[5];
-cx qubits[3],qubits[1];
-cx qubits[3],qubits[5];
-h qubits[5];
-h qubits[5];
-ccx qubits[2],qubits[9],qubits[5];
-h qubits[5];
-h qubits[5];
-cx qubits[5],qubits[7];
-cx qubits[3],qubits[8];
-x qubits[3];
-cx qubits[3],qubits[4];
-cx qubits[0],qubits[3];
-h qubits[3];
-h qubits[3];
-ccx qubits[9],qubits[1],qubits[3];
-h qubits[3];
-h qubits[3];
-cx qubits[0],qubits[5];
-h qubits[0];
-h qubits[0];
-ccx qubits[9],qubits[8],qubits[0];
-h qubits[0];
-h qubits[0];
-cx qubits[0],qubits[3];
-cx qubits[0],qubits[5];
-cx qubits[0],qubits[6];
-h qubits[7];
-h qubits[7];
-ccx qubits[1],qubits[9],qubits[7];
-h qubits[7];
-h qubits[7];
-cx qubits[8],qubits[7];
-cx qubits[0],qubits[9];
-cx qubits[0],qubits[8];
-cx qubits[7],qubits[0];
-cx qubits[2],qubits[1];
-cx qubits[1],qubits[7];
-cx qubits[2],qubits[8];
-cx qubits[6],qubits[9];
-cx qubits[6],qubits[8];
-h qubits[2];
-h qubits[2];
-ccx qubits[1],qubits[8],qubits[2];
-h qubits[2];
-h qubits[2];
-cx qubits[6],qubits[1];
-cx qubits[1],qubits[2];
-h qubits[6];
-h qubits[6];
-ccx qubits[1],qubits[7],qubits[6];
-h qubits[6];
-h qubits[6];
-cx qubits[0],qubits[1];
-cx qubits[0],qubits[2];
-cx qubits[0],qubits[6];
-h qubits[7];
-h qubits[7];
-ccx qubits[9],qubits[8],qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[9];
-h qubits[9];
-ccx qubits[10],qubits[7],qubits[9];
-h qubits[9];
-h qubits[9];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[0];
-h qubits[0];
-ccx qubits[10],qubits[5],qubits[0];
-h qubits[0];
-h qubits[0];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[9];
-h qubits[9];
-ccx qubits[10],qubits[7],qubits[9];
-h qubits[9];
-h qubits[9];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[7];
-h qubits[7];
-ccx qubits[9],qubits[8],qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[8];
-h qubits[8];
-ccx qubits[10],qubits[7],qubits[8];
-h qubits[8];
-h qubits[8];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[0];
-h qubits[0];
-ccx qubits[10],qubits[5],qubits[0];
-h qubits[0];
-h qubits[0];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[8];
-h qubits[8];
-ccx qubits[10],qubits[7],qubits[8];
-h qubits[8];
-h qubits[8];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-x qubits[5];
-x qubits[3];
-cx qubits[0],qubits[6];
-cx qubits[1],qubits[2];
-cx qubits[0],qubits[1];
-h qubits[6];
-h qubits[6];
-ccx qubits[1],qubits[7],qubits[6];
-h qubits[6];
-h qubits[6];
-cx qubits[6],qubits[1];
-h qubits[2];
-h qubits[2];
-ccx qubits[1],qubits[8],qubits[2];
-h qubits[2];
-h qubits[2];
-cx qubits[6],qubits[8];
-cx qubits[6],qubits[9];
-cx qubits[2],qubits[8];
-cx qubits[1],qubits[7];
-cx qubits[2],qubits[1];
-cx qubits[7],qubits[0];
-cx qubits[0],qubits[8];
-cx qubits[0],qubits[9];
-cx qubits[9],qubits[7];
-h qubits[7];
-h qubits[7];
-ccx qubits[1],qubits[9],qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[7];
-ccx qubits[2],qubits[9],qubits[7];
-h qubits[7];
-h qubits[7];
-cx qubits[0],qubits[6];
-cx qubits[0],qubits[5];
-cx qubits[0],qubits[3];
-h qubits[0];
-h qubits[0];
-ccx qubits[9],qubits[8],qubits[0];
-h qubits[0];
-h qubits[0];
-cx qubits[0],qubits[6];
-cx qubits[0],qubits[5];
-cx qubits[0],qubits[3];
-h qubits[3];
-h qubits[3];
-ccx qubits[9],qubits[1],qubits[3];
-h qubits[3];
-h qubits[3];
-cx qubits[3],qubits[8];
-cx qubits[3],qubits[5];
-cx qubits[3],qubits[4];
-cx qubits[3],qubits[0];
-cx qubits[3],qubits[1];
-h qubits[5];
-h qubits[5];
-ccx qubits[9],qubits[2],qubits[5];
-h qubits[5];
-h qubits[5];
-cx qubits[8],qubits[2];
-cx qubits[8],qubits[9];
-cx qubits[5],qubits[8];
-cx qubits[0],qubits[9];
-cx qubits[7],qubits[6];
-cx qubits[0],qubits[7];
-cx qubits[0],qubits[3];
-cx qubits[0],qubits[2];
-cx qubits[3],qubits[0];
-cx qubits[8],qubits[6];
-cx qubits[8],qubits[4];
-cx qubits[8],qubits[1];
-cx qubits[6],qubits[8];
-cx qubits[9],qubits[6];
-cx qubits[9],qubits[5];
-cx qubits[9],qubits[2];
-cx qubits[9],qubits[0];
-cx qubits[7],qubits[5];
-cx qubits[7],qubits[4];
-cx qubits[7],qubits[2];
-cx qubits[7],qubits[0];
-cx qubits[0],qubits[7];
-cx qubits[6],qubits[9];
-cx qubits[6],qubits[3];
-cx qubits[6],qubits[2];
-cx qubits[2],qubits[9];
-cx qubits[2],qubits[6];
-cx qubits[2],qubits[1];
-x qubits[1];
-x qubits[4];
-cx qubits[2],qubits[8];
-cx qubits[0],qubits[6];
-cx qubits[6],qubits[0];
-cx qubits[6],qubits[2];
-cx qubits[6],qubits[3];
-cx qubits[6],qubits[5];
-cx qubits[6],qubits[7];
-cx qubits[6],qubits[8];
-cx qubits[7],qubits[6];
-cx qubits[6],qubits[9];
-cx qubits[7],qubits[3];
-cx qubits[7],qubits[4];
-cx qubits[0],qubits[9];
-cx qubits[9],qubits[0];
-cx qubits[9],qubits[1];
-cx qubits[9],qubits[2];
-cx qubits[9],qubits[3];
-cx qubits[9],qubits[4];
-cx qubits[9],qubits[5];
-cx qubits[3],qubits[8];
-cx qubits[8],qubits[2];
-cx qubits[8],qubits[3];
-cx qubits[8],qubits[4];
-cx qubits[0],qubits[9];
-cx qubits[0],qubits[6];
-h qubits[0];
-h qubits[0];
-ccx qubits[9],qubits[2],qubits[0];
-h qubits[0];
-h qubits[0];
-cx qubits[0],qubits[1];
-cx qubits[0],qubits[3];
-cx qubits[4],qubits[5];
-cx qubits[0],qubits[4];
-cx qubits[4],qubits[6];
-cx qubits[0],qubits[7];
-cx qubits[4],qubits[0];
-cx qubits[0],qubits[6];
-cx qubits[0],qubits[8];
-cx qubits[4],qubits[1];
-h qubits[4];
-h qubits[4];
-ccx qubits[9],qubits[1],qubits[4];
-h qubits[4];
-h qubits[4];
-cx qubits[4],qubits[9];
-cx qubits[4],qubits[8];
-cx qubits[4],qubits[1];
-cx qubits[4],qubits[2];
-cx qubits[4],qubits[5];
-cx qubits[4],qubits[6];
-cx qubits[4],qubits[7];
-h qubits[4];
-h qubits[4];
-ccx qubits[9],qubits[8],qubits[4];
-h qubits[4];
-h qubits[4];
-cx qubits[2],qubits[1];
-h qubits[7];
-h qubits[7];
-ccx qubits[1],qubits[9],qubits[7];
-h qubits[7];
-h qubits[7];
-cx qubits[9],qubits[7];
-cx qubits[8],qubits[7];
-cx qubits[0],qubits[9];
-cx qubits[0],qubits[8];
-cx qubits[7],qubits[0];
-cx qubits[1],qubits[7];
-cx qubits[2],qubits[8];
-cx qubits[6],qubits[9];
-cx qubits[6],qubits[8];
-h qubits[2];
-h qubits[2];
-ccx qubits[1],qubits[8],qubits[2];
-h qubits[2];
-h qubits[2];
-cx qubits[6],qubits[1];
-cx qubits[1],qubits[2];
-h qubits[6];
-h qubits[6];
-ccx qubits[1],qubits[7],qubits[6];
-h qubits[6];
-h qubits[6];
-cx qubits[0],qubits[1];
-cx qubits[0],qubits[2];
-cx qubits[0],qubits[6];
-x qubits[3];
-x qubits[4];
-x qubits[5];
-h qubits[7];
-h qubits[7];
-ccx qubits[9],qubits[8],qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[9];
-h qubits[9];
-ccx qubits[10],qubits[7],qubits[9];
-h qubits[9];
-h qubits[9];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[0];
-h qubits[0];
-ccx qubits[10],qubits[5],qubits[0];
-h qubits[0];
-h qubits[0];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[9];
-h qubits[9];
-ccx qubits[10],qubits[7],qubits[9];
-h qubits[9];
-h qubits[9];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[7];
-h qubits[7];
-ccx qubits[9],qubits[8],qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[8];
-h qubits[8];
-ccx qubits[10],qubits[7],qubits[8];
-h qubits[8];
-h qubits[8];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[0];
-h qubits[0];
-ccx qubits[10],qubits[5],qubits[0];
-h qubits[0];
-h qubits[0];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[8];
-h qubits[8];
-ccx qubits[10],qubits[7],qubits[8];
-h qubits[8];
-h qubits[8];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-x qubits[5];
-x qubits[4];
-x qubits[3];
-cx qubits[0],qubits[6];
-cx qubits[1],qubits[2];
-cx qubits[0],qubits[1];
-h qubits[6];
-h qubits[6];
-ccx qubits[1],qubits[7],qubits[6];
-h qubits[6];
-h qubits[6];
-cx qubits[6],qubits[1];
-h qubits[2];
-h qubits[2];
-ccx qubits[1],qubits[8],qubits[2];
-h qubits[2];
-h qubits[2];
-cx qubits[6],qubits[8];
-cx qubits[6],qubits[9];
-cx qubits[2],qubits[8];
-cx qubits[1],qubits[7];
-cx qubits[2],qubits[1];
-cx qubits[7],qubits[0];
-cx qubits[0],qubits[8];
-cx qubits[0],qubits[9];
-cx qubits[8],qubits[7];
-cx qubits[9],qubits[7];
-h qubits[7];
-h qubits[7];
-ccx qubits[1],qubits[9],qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[7];
-ccx qubits[2],qubits[9],qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[4];
-h qubits[4];
-ccx qubits[9],qubits[8],qubits[4];
-h qubits[4];
-h qubits[4];
-cx qubits[7],qubits[6];
-cx qubits[4],qubits[7];
-cx qubits[4],qubits[5];
-cx qubits[4],qubits[2];
-cx qubits[4],qubits[1];
-cx qubits[4],qubits[8];
-cx qubits[4],qubits[9];
-h qubits[4];
-h qubits[4];
-ccx qubits[9],qubits[1],qubits[4];
-h qubits[4];
-h qubits[4];
-cx qubits[4],qubits[8];
-cx qubits[0],qubits[5];
-cx qubits[4],qubits[0];
-cx qubits[0],qubits[4];
-cx qubits[4],qubits[1];
-cx qubits[0],qubits[8];
-cx qubits[0],qubits[7];
-cx qubits[0],qubits[3];
-h qubits[0];
-h qubits[0];
-ccx qubits[9],qubits[2],qubits[0];
-h qubits[0];
-h qubits[0];
-cx qubits[0],qubits[6];
-cx qubits[0],qubits[9];
-cx qubits[8],qubits[4];
-cx qubits[8],qubits[3];
-cx qubits[8],qubits[2];
-cx qubits[3],qubits[8];
-cx qubits[9],qubits[5];
-cx qubits[9],qubits[4];
-cx qubits[9],qubits[3];
-cx qubits[9],qubits[2];
-cx qubits[9],qubits[1];
-cx qubits[9],qubits[0];
-cx qubits[0],qubits[9];
-cx qubits[7],qubits[9];
-cx qubits[7],qubits[4];
-cx qubits[6],qubits[7];
-cx qubits[7],qubits[3];
-cx qubits[6],qubits[9];
-cx qubits[6],qubits[8];
-cx qubits[2],qubits[5];
-cx qubits[6],qubits[2];
-cx qubits[6],qubits[0];
-cx qubits[0],qubits[6];
-x qubits[8];
-cx qubits[2],qubits[4];
-x qubits[2];
-cx qubits[2],qubits[0];
-cx qubits[2],qubits[5];
-cx qubits[6],qubits[0];
-cx qubits[6],qubits[3];
-cx qubits[6],qubits[4];
-cx qubits[6],qubits[7];
-cx qubits[6],qubits[8];
-cx qubits[6],qubits[9];
-cx qubits[3],qubits[7];
-cx qubits[7],qubits[1];
-cx qubits[7],qubits[2];
-cx qubits[7],qubits[3];
-cx qubits[7],qubits[8];
-x qubits[4];
-cx qubits[7],qubits[4];
-cx qubits[3],qubits[9];
-cx qubits[9],qubits[1];
-cx qubits[9],qubits[3];
-cx qubits[9],qubits[4];
-cx qubits[9],qubits[6];
-cx qubits[9],qubits[7];
-cx qubits[0],qubits[9];
-cx qubits[9],qubits[8];
-cx qubits[8],qubits[0];
-cx qubits[8],qubits[3];
-cx qubits[8],qubits[4];
-cx qubits[8],qubits[7];
-cx qubits[0],qubits[1];
-cx qubits[5],qubits[2];
-cx qubits[0],qubits[5];
-cx qubits[0],qubits[7];
-cx qubits[5],qubits[9];
-cx qubits[0],qubits[6];
-cx qubits[5],qubits[0];
-cx qubits[0],qubits[5];
-h qubits[5];
-h qubits[5];
-ccx qubits[9],qubits[2],qubits[5];
-h qubits[5];
-h qubits[5];
-cx qubits[3],qubits[9];
-cx qubits[3],qubits[1];
-cx qubits[3],qubits[2];
-cx qubits[3],qubits[5];
-cx qubits[3],qubits[6];
-cx qubits[3],qubits[8];
-h qubits[3];
-h qubits[3];
-ccx qubits[9],qubits[1],qubits[3];
-h qubits[3];
-h qubits[3];
-cx qubits[0],qubits[3];
-h qubits[0];
-h qubits[0];
-ccx qubits[9],qubits[8],qubits[0];
-h qubits[0];
-h qubits[0];
-cx qubits[0],qubits[3];
-cx qubits[0],qubits[5];
-cx qubits[0],qubits[6];
-cx qubits[2],qubits[1];
-h qubits[7];
-h qubits[7];
-ccx qubits[1],qubits[9],qubits[7];
-h qubits[7];
-h qubits[7];
-cx qubits[9],qubits[7];
-cx qubits[8],qubits[7];
-cx qubits[0],qubits[9];
-cx qubits[0],qubits[8];
-cx qubits[7],qubits[0];
-cx qubits[1],qubits[7];
-cx qubits[2],qubits[8];
-cx qubits[6],qubits[9];
-cx qubits[6],qubits[8];
-h qubits[2];
-h qubits[2];
-ccx qubits[1],qubits[8],qubits[2];
-h qubits[2];
-h qubits[2];
-cx qubits[6],qubits[1];
-cx qubits[1],qubits[2];
-h qubits[6];
-h qubits[6];
-ccx qubits[1],qubits[7],qubits[6];
-h qubits[6];
-h qubits[6];
-cx qubits[0],qubits[1];
-cx qubits[0],qubits[2];
-cx qubits[0],qubits[6];
-x qubits[3];
-x qubits[5];
-h qubits[7];
-h qubits[7];
-ccx qubits[9],qubits[8],qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[9];
-h qubits[9];
-ccx qubits[10],qubits[7],qubits[9];
-h qubits[9];
-h qubits[9];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[0];
-h qubits[0];
-ccx qubits[10],qubits[5],qubits[0];
-h qubits[0];
-h qubits[0];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[9];
-h qubits[9];
-ccx qubits[10],qubits[7],qubits[9];
-h qubits[9];
-h qubits[9];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[7];
-h qubits[7];
-ccx qubits[9],qubits[8],qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[8];
-h qubits[8];
-ccx qubits[10],qubits[7],qubits[8];
-h qubits[8];
-h qubits[8];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[0];
-h qubits[0];
-ccx qubits[10],qubits[5],qubits[0];
-h qubits[0];
-h qubits[0];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[8];
-h qubits[8];
-ccx qubits[10],qubits[7],qubits[8];
-h qubits[8];
-h qubits[8];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-x qubits[5];
-x qubits[3];
-cx qubits[0],qubits[6];
-cx qubits[1],qubits[2];
-cx qubits[0],qubits[1];
-h qubits[6];
-h qubits[6];
-ccx qubits[1],qubits[7],qubits[6];
-h qubits[6];
-h qubits[6];
-cx qubits[6],qubits[1];
-h qubits[2];
-h qubits[2];
-ccx qubits[1],qubits[8],qubits[2];
-h qubits[2];
-h qubits[2];
-cx qubits[6],qubits[8];
-cx qubits[6],qubits[9];
-cx qubits[2],qubits[8];
-cx qubits[1],qubits[7];
-cx qubits[2],qubits[1];
-cx qubits[7],qubits[0];
-cx qubits[0],qubits[8];
-cx qubits[0],qubits[9];
-cx qubits[8],qubits[7];
-cx qubits[9],qubits[7];
-h qubits[7];
-h qubits[7];
-ccx qubits[1],qubits[9],qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[7];
-ccx qubits[2],qubits[9],qubits[7];
-h qubits[7];
-h qubits[7];
-cx qubits[0],qubits[6];
-cx qubits[0],qubits[5];
-cx qubits[0],qubits[3];
-h qubits[0];
-h qubits[0];
-ccx qubits[9],qubits[8],qubits[0];
-h qubits[0];
-h qubits[0];
-cx qubits[0],qubits[6];
-cx qubits[0],qubits[5];
-cx qubits[0],qubits[3];
-h qubits[3];
-h qubits[3];
-ccx qubits[9],qubits[1],qubits[3];
-h qubits[3];
-h qubits[3];
-cx qubits[3],qubits[8];
-cx qubits[3],qubits[6];
-cx qubits[3],qubits[5];
-cx qubits[3],qubits[2];
-cx qubits[3],qubits[1];
-cx qubits[3],qubits[9];
-h qubits[5];
-h qubits[5];
-ccx qubits[9],qubits[2],qubits[5];
-h qubits[5];
-h qubits[5];
-cx qubits[5],qubits[6];
-cx qubits[0],qubits[2];
-cx qubits[0],qubits[9];
-cx qubits[5],qubits[0];
-cx qubits[0],qubits[5];
-cx qubits[0],qubits[7];
-cx qubits[0],qubits[1];
-cx qubits[7],qubits[4];
-cx qubits[9],qubits[7];
-cx qubits[9],qubits[3];
-cx qubits[8],qubits[9];
-cx qubits[8],qubits[0];
-cx qubits[0],qubits[8];
-cx qubits[6],qubits[8];
-cx qubits[9],qubits[6];
-cx qubits[9],qubits[1];
-cx qubits[3],qubits[9];
-cx qubits[7],qubits[8];
-cx qubits[7],qubits[3];
-cx qubits[7],qubits[2];
-cx qubits[7],qubits[1];
-cx qubits[6],qubits[3];
-cx qubits[3],qubits[7];
-x qubits[3];
-cx qubits[6],qubits[9];
-cx qubits[6],qubits[4];
-cx qubits[6],qubits[0];
-cx qubits[8],qubits[5];
-cx qubits[2],qubits[8];
-x qubits[2];
-x qubits[0];
-cx qubits[4],qubits[2];
-cx qubits[2],qubits[4];
-cx qubits[2],qubits[6];
-cx qubits[2],qubits[9];
-cx qubits[0],qubits[6];
-cx qubits[6],qubits[0];
-cx qubits[6],qubits[2];
-cx qubits[6],qubits[3];
-cx qubits[9],qubits[4];
-cx qubits[6],qubits[9];
-cx qubits[7],qubits[8];
-cx qubits[6],qubits[7];
-cx qubits[3],qubits[0];
-cx qubits[7],qubits[3];
-cx qubits[7],qubits[6];
-cx qubits[0],qubits[1];
-cx qubits[9],qubits[0];
-cx qubits[8],qubits[2];
-cx qubits[9],qubits[8];
-cx qubits[9],qubits[7];
-cx qubits[8],qubits[9];
-x qubits[7];
-cx qubits[0],qubits[3];
-cx qubits[0],qubits[7];
-cx qubits[3],qubits[1];
-h qubits[0];
-h qubits[0];
-ccx qubits[9],qubits[2],qubits[0];
-h qubits[0];
-h qubits[0];
-cx qubits[0],qubits[1];
-cx qubits[0],qubits[4];
-cx qubits[0],qubits[6];
-cx qubits[3],qubits[5];
-cx qubits[3],qubits[6];
-x qubits[3];
-h qubits[3];
-h qubits[3];
-ccx qubits[1],qubits[9],qubits[3];
-h qubits[3];
-h qubits[3];
-cx qubits[3],qubits[7];
-cx qubits[4],qubits[8];
-cx qubits[4],qubits[2];
-cx qubits[4],qubits[5];
-h qubits[4];
-h qubits[4];
-ccx qubits[9],qubits[8],qubits[4];
-h qubits[4];
-h qubits[4];
-h qubits[7];
-h qubits[7];
-ccx qubits[2],qubits[9],qubits[7];
-h qubits[7];
-h qubits[7];
-cx qubits[8],qubits[7];
-cx qubits[0],qubits[9];
-cx qubits[0],qubits[8];
-cx qubits[7],qubits[0];
-cx qubits[2],qubits[1];
-cx qubits[1],qubits[7];
-cx qubits[2],qubits[8];
-cx qubits[6],qubits[9];
-cx qubits[6],qubits[8];
-h qubits[2];
-h qubits[2];
-ccx qubits[1],qubits[8],qubits[2];
-h qubits[2];
-h qubits[2];
-cx qubits[6],qubits[1];
-cx qubits[1],qubits[2];
-h qubits[6];
-h qubits[6];
-ccx qubits[1],qubits[7],qubits[6];
-h qubits[6];
-h qubits[6];
-cx qubits[0],qubits[1];
-cx qubits[0],qubits[2];
-cx qubits[0],qubits[6];
-x qubits[4];
-h qubits[7];
-h qubits[7];
-ccx qubits[9],qubits[8],qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[9];
-h qubits[9];
-ccx qubits[10],qubits[7],qubits[9];
-h qubits[9];
-h qubits[9];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[0];
-h qubits[0];
-ccx qubits[10],qubits[5],qubits[0];
-h qubits[0];
-h qubits[0];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[9];
-h qubits[9];
-ccx qubits[10],qubits[7],qubits[9];
-h qubits[9];
-h qubits[9];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[7];
-h qubits[7];
-ccx qubits[9],qubits[8],qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[8];
-h qubits[8];
-ccx qubits[10],qubits[7],qubits[8];
-h qubits[8];
-h qubits[8];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[0];
-h qubits[0];
-ccx qubits[10],qubits[5],qubits[0];
-h qubits[0];
-h qubits[0];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[8];
-h qubits[8];
-ccx qubits[10],qubits[7],qubits[8];
-h qubits[8];
-h qubits[8];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-x qubits[4];
-x qubits[3];
-cx qubits[0],qubits[6];
-cx qubits[1],qubits[2];
-cx qubits[0],qubits[1];
-h qubits[6];
-h qubits[6];
-ccx qubits[1],qubits[7],qubits[6];
-h qubits[6];
-h qubits[6];
-cx qubits[6],qubits[1];
-h qubits[2];
-h qubits[2];
-ccx qubits[1],qubits[8],qubits[2];
-h qubits[2];
-h qubits[2];
-cx qubits[6],qubits[8];
-cx qubits[6],qubits[9];
-cx qubits[2],qubits[8];
-cx qubits[1],qubits[7];
-cx qubits[2],qubits[1];
-cx qubits[7],qubits[0];
-cx qubits[0],qubits[8];
-cx qubits[0],qubits[9];
-cx qubits[8],qubits[7];
-cx qubits[9],qubits[7];
-h qubits[7];
-h qubits[7];
-ccx qubits[1],qubits[9],qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[7];
-ccx qubits[2],qubits[9],qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[4];
-h qubits[4];
-ccx qubits[9],qubits[8],qubits[4];
-h qubits[4];
-h qubits[4];
-cx qubits[4],qubits[5];
-cx qubits[4],qubits[2];
-cx qubits[4],qubits[8];
-h qubits[3];
-h qubits[3];
-ccx qubits[9],qubits[1],qubits[3];
-h qubits[3];
-h qubits[3];
-cx qubits[3],qubits[7];
-cx qubits[3],qubits[6];
-cx qubits[3],qubits[5];
-cx qubits[3],qubits[1];
-cx qubits[0],qubits[6];
-cx qubits[0],qubits[4];
-cx qubits[0],qubits[1];
-h qubits[0];
-h qubits[0];
-ccx qubits[9],qubits[2],qubits[0];
-h qubits[0];
-h qubits[0];
-cx qubits[0],qubits[1];
-cx qubits[0],qubits[7];
-cx qubits[6],qubits[3];
-cx qubits[0],qubits[3];
-cx qubits[3],qubits[0];
-cx qubits[8],qubits[9];
-cx qubits[7],qubits[5];
-cx qubits[8],qubits[7];
-cx qubits[9],qubits[8];
-cx qubits[8],qubits[2];
-cx qubits[9],qubits[5];
-cx qubits[9],qubits[4];
-cx qubits[9],qubits[1];
-cx qubits[9],qubits[0];
-cx qubits[6],qubits[8];
-cx qubits[7],qubits[6];
-x qubits[7];
-cx qubits[6],qubits[7];
-cx qubits[6],qubits[9];
-cx qubits[6],qubits[5];
-cx qubits[6],qubits[4];
-cx qubits[6],qubits[2];
-cx qubits[0],qubits[6];
-x qubits[6];
-x qubits[5];
-cx qubits[2],qubits[5];
-cx qubits[6],qubits[2];
-cx qubits[2],qubits[7];
-cx qubits[6],qubits[0];
-cx qubits[6],qubits[3];
-cx qubits[6],qubits[4];
-cx qubits[4],qubits[7];
-cx qubits[7],qubits[1];
-cx qubits[7],qubits[2];
-cx qubits[7],qubits[5];
-cx qubits[7],qubits[4];
-cx qubits[7],qubits[9];
-cx qubits[0],qubits[9];
-cx qubits[9],qubits[0];
-cx qubits[9],qubits[4];
-cx qubits[9],qubits[6];
-cx qubits[9],qubits[8];
-cx qubits[8],qubits[0];
-cx qubits[8],qubits[1];
-cx qubits[8],qubits[2];
-cx qubits[8],qubits[3];
-cx qubits[3],qubits[0];
-cx qubits[0],qubits[3];
-cx qubits[0],qubits[4];
-cx qubits[0],qubits[8];
-h qubits[9];
-h qubits[9];
-ccx qubits[1],qubits[2],qubits[9];
-h qubits[9];
-h qubits[9];
-cx qubits[0],qubits[1];
-cx qubits[0],qubits[6];
-h qubits[0];
-h qubits[0];
-ccx qubits[9],qubits[2],qubits[0];
-h qubits[0];
-h qubits[0];
-cx qubits[0],qubits[1];
-cx qubits[0],qubits[6];
-cx qubits[4],qubits[1];
-cx qubits[4],qubits[0];
-cx qubits[5],qubits[2];
-cx qubits[4],qubits[5];
-h qubits[4];
-h qubits[4];
-ccx qubits[9],qubits[1],qubits[4];
-h qubits[4];
-h qubits[4];
-cx qubits[5],qubits[9];
-cx qubits[5],qubits[8];
-h qubits[5];
-h qubits[5];
-ccx qubits[9],qubits[8],qubits[5];
-h qubits[5];
-h qubits[5];
-cx qubits[2],qubits[1];
-h qubits[7];
-h qubits[7];
-ccx qubits[1],qubits[9],qubits[7];
-h qubits[7];
-h qubits[7];
-cx qubits[9],qubits[7];
-cx qubits[0],qubits[9];
-cx qubits[0],qubits[8];
-cx qubits[7],qubits[0];
-cx qubits[1],qubits[7];
-cx qubits[2],qubits[8];
-cx qubits[6],qubits[9];
-cx qubits[6],qubits[8];
-h qubits[2];
-h qubits[2];
-ccx qubits[1],qubits[8],qubits[2];
-h qubits[2];
-h qubits[2];
-cx qubits[6],qubits[1];
-cx qubits[1],qubits[2];
-h qubits[6];
-h qubits[6];
-ccx qubits[1],qubits[7],qubits[6];
-h qubits[6];
-h qubits[6];
-cx qubits[0],qubits[1];
-cx qubits[0],qubits[2];
-cx qubits[0],qubits[6];
-x qubits[3];
-x qubits[4];
-x qubits[5];
-h qubits[7];
-h qubits[7];
-ccx qubits[9],qubits[8],qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[9];
-h qubits[9];
-ccx qubits[10],qubits[7],qubits[9];
-h qubits[9];
-h qubits[9];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[0];
-h qubits[0];
-ccx qubits[10],qubits[5],qubits[0];
-h qubits[0];
-h qubits[0];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[9];
-h qubits[9];
-ccx qubits[10],qubits[7],qubits[9];
-h qubits[9];
-h qubits[9];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[7];
-h qubits[7];
-ccx qubits[9],qubits[8],qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[8];
-h qubits[8];
-ccx qubits[10],qubits[7],qubits[8];
-h qubits[8];
-h qubits[8];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[0];
-h qubits[0];
-ccx qubits[10],qubits[5],qubits[0];
-h qubits[0];
-h qubits[0];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[8];
-h qubits[8];
-ccx qubits[10],qubits[7],qubits[8];
-h qubits[8];
-h qubits[8];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-x qubits[5];
-x qubits[4];
-x qubits[3];
-cx qubits[0],qubits[6];
-cx qubits[1],qubits[2];
-cx qubits[0],qubits[1];
-h qubits[6];
-h qubits[6];
-ccx qubits[1],qubits[7],qubits[6];
-h qubits[6];
-h qubits[6];
-cx qubits[6],qubits[1];
-h qubits[2];
-h qubits[2];
-ccx qubits[1],qubits[8],qubits[2];
-h qubits[2];
-h qubits[2];
-cx qubits[6],qubits[8];
-cx qubits[6],qubits[9];
-cx qubits[2],qubits[8];
-cx qubits[1],qubits[7];
-cx qubits[2],qubits[1];
-cx qubits[7],qubits[0];
-cx qubits[0],qubits[8];
-cx qubits[0],qubits[9];
-cx qubits[8],qubits[7];
-cx qubits[9],qubits[7];
-h qubits[7];
-h qubits[7];
-ccx qubits[1],qubits[9],qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[7];
-ccx qubits[2],qubits[9],qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[5];
-h qubits[5];
-ccx qubits[9],qubits[8],qubits[5];
-h qubits[5];
-h qubits[5];
-cx qubits[5],qubits[7];
-cx qubits[5],qubits[2];
-cx qubits[5],qubits[8];
-cx qubits[5],qubits[9];
-h qubits[4];
-h qubits[4];
-ccx qubits[9],qubits[1],qubits[4];
-h qubits[4];
-h qubits[4];
-cx qubits[4],qubits[5];
-cx qubits[4],qubits[2];
-cx qubits[0],qubits[1];
-cx qubits[4],qubits[0];
-cx qubits[0],qubits[6];
-h qubits[0];
-h qubits[0];
-ccx qubits[9],qubits[2],qubits[0];
-h qubits[0];
-h qubits[0];
-cx qubits[0],qubits[6];
-cx qubits[0],qubits[1];
-h qubits[9];
-h qubits[9];
-ccx qubits[1],qubits[2],qubits[9];
-h qubits[9];
-h qubits[9];
-cx qubits[8],qubits[7];
-cx qubits[0],qubits[8];
-cx qubits[0],qubits[4];
-cx qubits[8],qubits[3];
-cx qubits[0],qubits[3];
-cx qubits[3],qubits[0];
-cx qubits[8],qubits[2];
-cx qubits[8],qubits[1];
-cx qubits[9],qubits[8];
-cx qubits[6],qubits[4];
-cx qubits[9],qubits[6];
-cx qubits[9],qubits[0];
-cx qubits[0],qubits[9];
-cx qubits[7],qubits[9];
-cx qubits[7],qubits[5];
-cx qubits[7],qubits[4];
-cx qubits[7],qubits[2];
-x qubits[7];
-cx qubits[7],qubits[1];
-cx qubits[4],qubits[7];
-cx qubits[6],qubits[3];
-cx qubits[6],qubits[2];
-cx qubits[6],qubits[0];
-x qubits[6];
-cx qubits[2],qubits[9];
-cx qubits[2],qubits[7];
-cx qubits[2],qubits[5];
-cx qubits[2],qubits[4];
-cx qubits[4],qubits[2];
-cx qubits[6],qubits[4];
-cx qubits[2],qubits[6];
-cx qubits[2],qubits[0];
-cx qubits[2],qubits[1];
-cx qubits[2],qubits[3];
-cx qubits[6],qubits[2];
-cx qubits[2],qubits[9];
-cx qubits[6],qubits[7];
-cx qubits[6],qubits[8];
-cx qubits[7],qubits[2];
-cx qubits[7],qubits[3];
-cx qubits[7],qubits[4];
-cx qubits[9],qubits[6];
-cx qubits[7],qubits[9];
-cx qubits[9],qubits[0];
-cx qubits[9],qubits[2];
-cx qubits[9],qubits[3];
-cx qubits[5],qubits[8];
-cx qubits[9],qubits[5];
-cx qubits[8],qubits[5];
-cx qubits[8],qubits[1];
-cx qubits[8],qubits[2];
-cx qubits[8],qubits[6];
-cx qubits[4],qubits[8];
-cx qubits[0],qubits[5];
-cx qubits[0],qubits[6];
-cx qubits[1],qubits[3];
-cx qubits[1],qubits[6];
-h qubits[1];
-h qubits[1];
-ccx qubits[9],qubits[2],qubits[1];
-h qubits[1];
-h qubits[1];
-cx qubits[1],qubits[3];
-cx qubits[4],qubits[1];
-cx qubits[1],qubits[6];
-cx qubits[4],qubits[9];
-h qubits[4];
-h qubits[4];
-ccx qubits[9],qubits[1],qubits[4];
-h qubits[4];
-h qubits[4];
-cx qubits[0],qubits[1];
-h qubits[0];
-h qubits[0];
-ccx qubits[9],qubits[8],qubits[0];
-h qubits[0];
-h qubits[0];
-cx qubits[0],qubits[1];
-cx qubits[0],qubits[3];
-cx qubits[2],qubits[1];
-h qubits[7];
-h qubits[7];
-ccx qubits[1],qubits[9],qubits[7];
-h qubits[7];
-h qubits[7];
-cx qubits[9],qubits[7];
-cx qubits[0],qubits[9];
-cx qubits[0],qubits[8];
-cx qubits[7],qubits[0];
-cx qubits[1],qubits[7];
-cx qubits[2],qubits[8];
-cx qubits[6],qubits[9];
-cx qubits[6],qubits[8];
-h qubits[2];
-h qubits[2];
-ccx qubits[1],qubits[8],qubits[2];
-h qubits[2];
-h qubits[2];
-cx qubits[6],qubits[1];
-cx qubits[1],qubits[2];
-h qubits[6];
-h qubits[6];
-ccx qubits[1],qubits[7],qubits[6];
-h qubits[6];
-h qubits[6];
-cx qubits[0],qubits[1];
-cx qubits[0],qubits[2];
-cx qubits[0],qubits[6];
-x qubits[4];
-x qubits[5];
-h qubits[7];
-h qubits[7];
-ccx qubits[9],qubits[8],qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[9];
-h qubits[9];
-ccx qubits[10],qubits[7],qubits[9];
-h qubits[9];
-h qubits[9];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[0];
-h qubits[0];
-ccx qubits[10],qubits[5],qubits[0];
-h qubits[0];
-h qubits[0];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[9];
-h qubits[9];
-ccx qubits[10],qubits[7],qubits[9];
-h qubits[9];
-h qubits[9];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[7];
-h qubits[7];
-ccx qubits[9],qubits[8],qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[8];
-h qubits[8];
-ccx qubits[10],qubits[7],qubits[8];
-h qubits[8];
-h qubits[8];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[0];
-h qubits[0];
-ccx qubits[10],qubits[5],qubits[0];
-h qubits[0];
-h qubits[0];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[8];
-h qubits[8];
-ccx qubits[10],qubits[7],qubits[8];
-h qubits[8];
-h qubits[8];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-x qubits[5];
-x qubits[4];
-cx qubits[0],qubits[6];
-cx qubits[1],qubits[2];
-cx qubits[0],qubits[1];
-h qubits[6];
-h qubits[6];
-ccx qubits[1],qubits[7],qubits[6];
-h qubits[6];
-h qubits[6];
-cx qubits[6],qubits[1];
-h qubits[2];
-h qubits[2];
-ccx qubits[1],qubits[8],qubits[2];
-h qubits[2];
-h qubits[2];
-cx qubits[6],qubits[8];
-cx qubits[6],qubits[9];
-cx qubits[2],qubits[8];
-cx qubits[1],qubits[7];
-cx qubits[2],qubits[1];
-cx qubits[7],qubits[0];
-cx qubits[0],qubits[8];
-cx qubits[0],qubits[9];
-cx qubits[9],qubits[7];
-h qubits[7];
-h qubits[7];
-ccx qubits[1],qubits[9],qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[7];
-ccx qubits[2],qubits[9],qubits[7];
-h qubits[7];
-h qubits[7];
-cx qubits[0],qubits[3];
-cx qubits[0],qubits[1];
-h qubits[0];
-h qubits[0];
-ccx qubits[9],qubits[8],qubits[0];
-h qubits[0];
-h qubits[0];
-cx qubits[0],qubits[1];
-h qubits[4];
-h qubits[4];
-ccx qubits[9],qubits[1],qubits[4];
-h qubits[4];
-h qubits[4];
-cx qubits[8],qubits[6];
-cx qubits[4],qubits[8];
-cx qubits[4],qubits[1];
-cx qubits[4],qubits[9];
-cx qubits[1],qubits[6];
-cx qubits[1],qubits[3];
-h qubits[1];
-h qubits[1];
-ccx qubits[9],qubits[2],qubits[1];
-h qubits[1];
-h qubits[1];
-cx qubits[1],qubits[6];
-x qubits[1];
-cx qubits[1],qubits[3];
-cx qubits[0],qubits[6];
-cx qubits[0],qubits[5];
-cx qubits[8],qubits[5];
-cx qubits[8],qubits[2];
-cx qubits[8],qubits[1];
-cx qubits[9],qubits[5];
-cx qubits[5],qubits[8];
-cx qubits[9],qubits[6];
-cx qubits[9],qubits[3];
-cx qubits[9],qubits[2];
-cx qubits[9],qubits[0];
-cx qubits[6],qubits[9];
-cx qubits[6],qubits[4];
-cx qubits[7],qubits[6];
-cx qubits[7],qubits[3];
-cx qubits[6],qubits[7];
-cx qubits[7],qubits[2];
-cx qubits[2],qubits[7];
-cx qubits[4],qubits[6];
-cx qubits[2],qubits[4];
-cx qubits[4],qubits[8];
-cx qubits[9],qubits[3];
-cx qubits[6],qubits[2];
-cx qubits[2],qubits[9];
-cx qubits[2],qubits[1];
-cx qubits[6],qubits[5];
-cx qubits[9],qubits[6];
-cx qubits[7],qubits[9];
-cx qubits[0],qubits[1];
-cx qubits[7],qubits[0];
-x qubits[7];
-cx qubits[0],qubits[6];
-cx qubits[0],qubits[7];
-cx qubits[7],qubits[5];
-x qubits[7];
-cx qubits[9],qubits[2];
-cx qubits[9],qubits[4];
-cx qubits[3],qubits[8];
-cx qubits[8],qubits[2];
-cx qubits[8],qubits[3];
-cx qubits[8],qubits[4];
-cx qubits[0],qubits[3];
-cx qubits[0],qubits[8];
-cx qubits[4],qubits[0];
-cx qubits[0],qubits[9];
-cx qubits[4],qubits[1];
-cx qubits[4],qubits[5];
-h qubits[4];
-h qubits[4];
-ccx qubits[9],qubits[2],qubits[4];
-h qubits[4];
-h qubits[4];
-cx qubits[0],qubits[3];
-cx qubits[0],qubits[5];
-cx qubits[0],qubits[7];
-h qubits[0];
-h qubits[0];
-ccx qubits[9],qubits[1],qubits[0];
-h qubits[0];
-h qubits[0];
-cx qubits[0],qubits[3];
-cx qubits[0],qubits[5];
-cx qubits[0],qubits[7];
-cx qubits[3],qubits[9];
-cx qubits[3],qubits[1];
-cx qubits[3],qubits[4];
-cx qubits[3],qubits[7];
-h qubits[3];
-h qubits[3];
-ccx qubits[9],qubits[8],qubits[3];
-h qubits[3];
-h qubits[3];
-cx qubits[2],qubits[1];
-h qubits[7];
-h qubits[7];
-ccx qubits[1],qubits[9],qubits[7];
-h qubits[7];
-h qubits[7];
-cx qubits[9],qubits[7];
-cx qubits[8],qubits[7];
-cx qubits[0],qubits[9];
-cx qubits[0],qubits[8];
-cx qubits[7],qubits[0];
-cx qubits[1],qubits[7];
-cx qubits[2],qubits[8];
-cx qubits[6],qubits[9];
-cx qubits[6],qubits[8];
-h qubits[2];
-h qubits[2];
-ccx qubits[1],qubits[8],qubits[2];
-h qubits[2];
-h qubits[2];
-cx qubits[6],qubits[1];
-cx qubits[1],qubits[2];
-h qubits[6];
-h qubits[6];
-ccx qubits[1],qubits[7],qubits[6];
-h qubits[6];
-h qubits[6];
-cx qubits[0],qubits[1];
-cx qubits[0],qubits[2];
-cx qubits[0],qubits[6];
-x qubits[3];
-x qubits[4];
-h qubits[7];
-h qubits[7];
-ccx qubits[9],qubits[8],qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[9];
-h qubits[9];
-ccx qubits[10],qubits[7],qubits[9];
-h qubits[9];
-h qubits[9];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[0];
-h qubits[0];
-ccx qubits[10],qubits[5],qubits[0];
-h qubits[0];
-h qubits[0];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[9];
-h qubits[9];
-ccx qubits[10],qubits[7],qubits[9];
-h qubits[9];
-h qubits[9];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[7];
-h qubits[7];
-ccx qubits[9],qubits[8],qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[8];
-h qubits[8];
-ccx qubits[10],qubits[7],qubits[8];
-h qubits[8];
-h qubits[8];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[0];
-h qubits[0];
-ccx qubits[10],qubits[5],qubits[0];
-h qubits[0];
-h qubits[0];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[8];
-h qubits[8];
-ccx qubits[10],qubits[7],qubits[8];
-h qubits[8];
-h qubits[8];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-x qubits[4];
-x qubits[3];
-cx qubits[0],qubits[6];
-cx qubits[1],qubits[2];
-cx qubits[0],qubits[1];
-h qubits[6];
-h qubits[6];
-ccx qubits[1],qubits[7],qubits[6];
-h qubits[6];
-h qubits[6];
-cx qubits[6],qubits[1];
-h qubits[2];
-h qubits[2];
-ccx qubits[1],qubits[8],qubits[2];
-h qubits[2];
-h qubits[2];
-cx qubits[6],qubits[8];
-cx qubits[6],qubits[9];
-cx qubits[2],qubits[8];
-cx qubits[1],qubits[7];
-cx qubits[2],qubits[1];
-cx qubits[7],qubits[0];
-cx qubits[8],qubits[7];
-cx qubits[0],qubits[8];
-cx qubits[0],qubits[9];
-cx qubits[9],qubits[7];
-h qubits[7];
-h qubits[7];
-ccx qubits[1],qubits[9],qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[7];
-ccx qubits[2],qubits[9],qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[3];
-h qubits[3];
-ccx qubits[9],qubits[8],qubits[3];
-h qubits[3];
-h qubits[3];
-cx qubits[3],qubits[7];
-cx qubits[3],qubits[4];
-cx qubits[3],qubits[1];
-cx qubits[3],qubits[9];
-cx qubits[0],qubits[5];
-cx qubits[0],qubits[3];
-h qubits[0];
-h qubits[0];
-ccx qubits[9],qubits[1],qubits[0];
-h qubits[0];
-h qubits[0];
-cx qubits[7],qubits[5];
-cx qubits[0],qubits[7];
-cx qubits[0],qubits[3];
-h qubits[4];
-h qubits[4];
-ccx qubits[9],qubits[2],qubits[4];
-h qubits[4];
-h qubits[4];
-cx qubits[4],qubits[5];
-cx qubits[0],qubits[1];
-cx qubits[0],qubits[9];
-cx qubits[4],qubits[0];
-cx qubits[9],qubits[4];
-cx qubits[8],qubits[3];
-cx qubits[0],qubits[8];
-cx qubits[7],qubits[6];
-cx qubits[0],qubits[7];
-cx qubits[8],qubits[4];
-cx qubits[8],qubits[2];
-cx qubits[3],qubits[8];
-cx qubits[6],qubits[3];
-cx qubits[6],qubits[2];
-cx qubits[9],qubits[6];
-cx qubits[6],qubits[9];
-cx qubits[7],qubits[9];
-cx qubits[7],qubits[3];
-x qubits[7];
-cx qubits[7],qubits[1];
-cx qubits[7],qubits[0];
-cx qubits[2],qubits[0];
-cx qubits[0],qubits[7];
-x qubits[2];
-x qubits[6];
-cx qubits[2],qubits[4];
-cx qubits[6],qubits[3];
-cx qubits[7],qubits[9];
-cx qubits[6],qubits[7];
-cx qubits[7],qubits[6];
-cx qubits[7],qubits[0];
-cx qubits[9],qubits[7];
-cx qubits[7],qubits[5];
-cx qubits[8],qubits[5];
-cx qubits[7],qubits[2];
-cx qubits[8],qubits[7];
-cx qubits[0],qubits[1];
-cx qubits[0],qubits[3];
-cx qubits[9],qubits[0];
-cx qubits[8],qubits[9];
-cx qubits[9],qubits[4];
-cx qubits[8],qubits[1];
-cx qubits[8],qubits[3];
-cx qubits[8],qubits[6];
-cx qubits[0],qubits[5];
-cx qubits[3],qubits[9];
-cx qubits[3],qubits[0];
-cx qubits[4],qubits[6];
-cx qubits[3],qubits[4];
-h qubits[3];
-h qubits[3];
-ccx qubits[9],qubits[2],qubits[3];
-h qubits[3];
-h qubits[3];
-cx qubits[5],qubits[9];
-cx qubits[5],qubits[6];
-cx qubits[5],qubits[8];
-h qubits[5];
-h qubits[5];
-ccx qubits[9],qubits[1],qubits[5];
-h qubits[5];
-h qubits[5];
-cx qubits[4],qubits[9];
-cx qubits[4],qubits[1];
-cx qubits[4],qubits[5];
-cx qubits[4],qubits[7];
-h qubits[4];
-h qubits[4];
-ccx qubits[9],qubits[8],qubits[4];
-h qubits[4];
-h qubits[4];
-cx qubits[2],qubits[1];
-h qubits[7];
-h qubits[7];
-ccx qubits[1],qubits[9],qubits[7];
-h qubits[7];
-h qubits[7];
-cx qubits[9],qubits[7];
-cx qubits[0],qubits[9];
-cx qubits[0],qubits[8];
-cx qubits[7],qubits[0];
-cx qubits[1],qubits[7];
-cx qubits[2],qubits[8];
-cx qubits[6],qubits[9];
-cx qubits[6],qubits[8];
-h qubits[2];
-h qubits[2];
-ccx qubits[1],qubits[8],qubits[2];
-h qubits[2];
-h qubits[2];
-cx qubits[6],qubits[1];
-cx qubits[1],qubits[2];
-h qubits[6];
-h qubits[6];
-ccx qubits[1],qubits[7],qubits[6];
-h qubits[6];
-h qubits[6];
-cx qubits[0],qubits[1];
-cx qubits[0],qubits[2];
-cx qubits[0],qubits[6];
-x qubits[3];
-x qubits[4];
-x qubits[5];
-h qubits[7];
-h qubits[7];
-ccx qubits[9],qubits[8],qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[9];
-h qubits[9];
-ccx qubits[10],qubits[7],qubits[9];
-h qubits[9];
-h qubits[9];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[0];
-h qubits[0];
-ccx qubits[10],qubits[5],qubits[0];
-h qubits[0];
-h qubits[0];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[9];
-h qubits[9];
-ccx qubits[10],qubits[7],qubits[9];
-h qubits[9];
-h qubits[9];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[7];
-h qubits[7];
-ccx qubits[9],qubits[8],qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[8];
-h qubits[8];
-ccx qubits[10],qubits[7],qubits[8];
-h qubits[8];
-h qubits[8];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[0];
-h qubits[0];
-ccx qubits[10],qubits[5],qubits[0];
-h qubits[0];
-h qubits[0];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[8];
-h qubits[8];
-ccx qubits[10],qubits[7],qubits[8];
-h qubits[8];
-h qubits[8];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-x qubits[5];
-x qubits[4];
-x qubits[3];
-cx qubits[0],qubits[6];
-cx qubits[1],qubits[2];
-cx qubits[0],qubits[1];
-h qubits[6];
-h qubits[6];
-ccx qubits[1],qubits[7],qubits[6];
-h qubits[6];
-h qubits[6];
-cx qubits[6],qubits[1];
-h qubits[2];
-h qubits[2];
-ccx qubits[1],qubits[8],qubits[2];
-h qubits[2];
-h qubits[2];
-cx qubits[6],qubits[8];
-cx qubits[6],qubits[9];
-cx qubits[2],qubits[8];
-cx qubits[1],qubits[7];
-cx qubits[2],qubits[1];
-cx qubits[7],qubits[0];
-cx qubits[0],qubits[8];
-cx qubits[0],qubits[9];
-cx qubits[8],qubits[7];
-cx qubits[9],qubits[7];
-h qubits[7];
-h qubits[7];
-ccx qubits[1],qubits[9],qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[7];
-ccx qubits[2],qubits[9],qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[4];
-h qubits[4];
-ccx qubits[9],qubits[8],qubits[4];
-h qubits[4];
-h qubits[4];
-cx qubits[4],qubits[7];
-cx qubits[4],qubits[6];
-cx qubits[4],qubits[5];
-cx qubits[4],qubits[1];
-cx qubits[4],qubits[9];
-h qubits[5];
-h qubits[5];
-ccx qubits[9],qubits[1],qubits[5];
-h qubits[5];
-h qubits[5];
-cx qubits[5],qubits[8];
-cx qubits[5],qubits[7];
-cx qubits[5],qubits[6];
-cx qubits[5],qubits[9];
-h qubits[3];
-h qubits[3];
-ccx qubits[9],qubits[2],qubits[3];
-h qubits[3];
-h qubits[3];
-cx qubits[3],qubits[6];
-cx qubits[3],qubits[4];
-cx qubits[3],qubits[0];
-cx qubits[3],qubits[9];
-cx qubits[0],qubits[5];
-cx qubits[0],qubits[3];
-cx qubits[0],qubits[1];
-cx qubits[8],qubits[9];
-cx qubits[8],qubits[6];
-cx qubits[8],qubits[5];
-cx qubits[8],qubits[4];
-cx qubits[8],qubits[3];
-cx qubits[8],qubits[1];
-cx qubits[7],qubits[5];
-cx qubits[9],qubits[7];
-cx qubits[9],qubits[4];
-cx qubits[9],qubits[3];
-cx qubits[9],qubits[2];
-cx qubits[9],qubits[1];
-cx qubits[7],qubits[9];
-cx qubits[9],qubits[0];
-cx qubits[7],qubits[6];
-cx qubits[7],qubits[2];
-cx qubits[0],qubits[7];
-cx qubits[6],qubits[9];
-cx qubits[7],qubits[8];
-cx qubits[6],qubits[7];
-cx qubits[6],qubits[5];
-cx qubits[6],qubits[3];
-cx qubits[6],qubits[1];
-cx qubits[2],qubits[7];
-cx qubits[4],qubits[6];
-cx qubits[6],qubits[4];
-cx qubits[2],qubits[4];
-x qubits[6];
-x qubits[3];
-cx qubits[0],qubits[2];
-cx qubits[2],qubits[1];
-cx qubits[2],qubits[0];
-x qubits[2];
-cx qubits[7],qubits[5];
-cx qubits[2],qubits[7];
-cx qubits[7],qubits[2];
-cx qubits[6],qubits[5];
-cx qubits[9],qubits[6];
-cx qubits[6],qubits[8];
-cx qubits[7],qubits[1];
-cx qubits[9],qubits[1];
-cx qubits[9],qubits[3];
-cx qubits[9],qubits[4];
-cx qubits[0],qubits[8];
-cx qubits[8],qubits[0];
-cx qubits[8],qubits[2];
-cx qubits[3],qubits[7];
-cx qubits[8],qubits[3];
-cx qubits[4],qubits[0];
-cx qubits[0],qubits[1];
-cx qubits[0],qubits[2];
-cx qubits[0],qubits[4];
-cx qubits[5],qubits[0];
-cx qubits[0],qubits[7];
-cx qubits[5],qubits[2];
-cx qubits[5],qubits[1];
-cx qubits[5],qubits[6];
-cx qubits[5],qubits[8];
-h qubits[5];
-h qubits[5];
-ccx qubits[9],qubits[2],qubits[5];
-h qubits[5];
-h qubits[5];
-cx qubits[3],qubits[9];
-cx qubits[3],qubits[1];
-cx qubits[3],qubits[0];
-cx qubits[3],qubits[2];
-cx qubits[3],qubits[6];
-h qubits[3];
-h qubits[3];
-ccx qubits[9],qubits[1],qubits[3];
-h qubits[3];
-h qubits[3];
-cx qubits[3],qubits[9];
-cx qubits[3],qubits[4];
-h qubits[3];
-h qubits[3];
-ccx qubits[9],qubits[8],qubits[3];
-h qubits[3];
-h qubits[3];
-cx qubits[2],qubits[1];
-h qubits[7];
-h qubits[7];
-ccx qubits[1],qubits[9],qubits[7];
-h qubits[7];
-h qubits[7];
-cx qubits[9],qubits[7];
-cx qubits[8],qubits[7];
-cx qubits[0],qubits[9];
-cx qubits[0],qubits[8];
-cx qubits[7],qubits[0];
-cx qubits[1],qubits[7];
-cx qubits[2],qubits[8];
-cx qubits[6],qubits[9];
-cx qubits[6],qubits[8];
-h qubits[2];
-h qubits[2];
-ccx qubits[1],qubits[8],qubits[2];
-h qubits[2];
-h qubits[2];
-cx qubits[6],qubits[1];
-cx qubits[1],qubits[2];
-h qubits[6];
-h qubits[6];
-ccx qubits[1],qubits[7],qubits[6];
-h qubits[6];
-h qubits[6];
-cx qubits[0],qubits[1];
-cx qubits[0],qubits[2];
-cx qubits[0],qubits[6];
-x qubits[3];
-x qubits[4];
-x qubits[5];
-h qubits[7];
-h qubits[7];
-ccx qubits[9],qubits[8],qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[9];
-h qubits[9];
-ccx qubits[10],qubits[7],qubits[9];
-h qubits[9];
-h qubits[9];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[0];
-h qubits[0];
-ccx qubits[10],qubits[5],qubits[0];
-h qubits[0];
-h qubits[0];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[9];
-h qubits[9];
-ccx qubits[10],qubits[7],qubits[9];
-h qubits[9];
-h qubits[9];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[7];
-h qubits[7];
-ccx qubits[9],qubits[8],qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[8];
-h qubits[8];
-ccx qubits[10],qubits[7],qubits[8];
-h qubits[8];
-h qubits[8];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[0];
-h qubits[0];
-ccx qubits[10],qubits[5],qubits[0];
-h qubits[0];
-h qubits[0];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[8];
-h qubits[8];
-ccx qubits[10],qubits[7],qubits[8];
-h qubits[8];
-h qubits[8];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-x qubits[5];
-x qubits[4];
-x qubits[3];
-cx qubits[0],qubits[6];
-cx qubits[1],qubits[2];
-cx qubits[0],qubits[1];
-h qubits[6];
-h qubits[6];
-ccx qubits[1],qubits[7],qubits[6];
-h qubits[6];
-h qubits[6];
-cx qubits[6],qubits[1];
-h qubits[2];
-h qubits[2];
-ccx qubits[1],qubits[8],qubits[2];
-h qubits[2];
-h qubits[2];
-cx qubits[6],qubits[8];
-cx qubits[6],qubits[9];
-cx qubits[2],qubits[8];
-cx qubits[1],qubits[7];
-cx qubits[2],qubits[1];
-cx qubits[7],qubits[0];
-cx qubits[0],qubits[8];
-cx qubits[0],qubits[9];
-cx qubits[9],qubits[7];
-h qubits[7];
-h qubits[7];
-ccx qubits[1],qubits[9],qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[7];
-ccx qubits[2],qubits[9],qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[3];
-h qubits[3];
-ccx qubits[9],qubits[8],qubits[3];
-h qubits[3];
-h qubits[3];
-cx qubits[3],qubits[4];
-cx qubits[3],qubits[9];
-h qubits[3];
-h qubits[3];
-ccx qubits[9],qubits[1],qubits[3];
-h qubits[3];
-h qubits[3];
-cx qubits[3],qubits[7];
-cx qubits[3],qubits[6];
-cx qubits[3],qubits[2];
-cx qubits[0],qubits[1];
-cx qubits[3],qubits[0];
-cx qubits[3],qubits[9];
-h qubits[5];
-h qubits[5];
-ccx qubits[9],qubits[2],qubits[5];
-h qubits[5];
-h qubits[5];
-cx qubits[5],qubits[8];
-cx qubits[5],qubits[6];
-cx qubits[0],qubits[2];
-cx qubits[5],qubits[0];
-cx qubits[0],qubits[7];
-cx qubits[0],qubits[4];
-cx qubits[4],qubits[0];
-cx qubits[8],qubits[3];
-cx qubits[8],qubits[2];
-cx qubits[8],qubits[0];
-cx qubits[0],qubits[8];
-cx qubits[6],qubits[8];
-cx qubits[6],qubits[4];
-cx qubits[9],qubits[6];
-cx qubits[9],qubits[3];
-cx qubits[9],qubits[1];
-cx qubits[2],qubits[5];
-cx qubits[2],qubits[1];
-cx qubits[7],qubits[2];
-cx qubits[2],qubits[7];
-cx qubits[6],qubits[5];
-cx qubits[4],qubits[6];
-cx qubits[0],qubits[3];
-cx qubits[0],qubits[2];
-x qubits[0];
-cx qubits[2],qubits[0];
-cx qubits[0],qubits[2];
-cx qubits[2],qubits[1];
-cx qubits[2],qubits[4];
-cx qubits[2],qubits[7];
-cx qubits[0],qubits[6];
-cx qubits[6],qubits[0];
-cx qubits[6],qubits[1];
-cx qubits[6],qubits[2];
-cx qubits[7],qubits[5];
-cx qubits[7],qubits[9];
-cx qubits[6],qubits[7];
-cx qubits[7],qubits[6];
-cx qubits[7],qubits[1];
-cx qubits[7],qubits[2];
-cx qubits[0],qubits[9];
-cx qubits[9],qubits[0];
-cx qubits[9],qubits[3];
-cx qubits[9],qubits[4];
-cx qubits[9],qubits[6];
-cx qubits[0],qubits[8];
-cx qubits[0],qubits[2];
-cx qubits[8],qubits[0];
-cx qubits[3],qubits[5];
-cx qubits[8],qubits[3];
-cx qubits[8],qubits[9];
-cx qubits[0],qubits[1];
-cx qubits[0],qubits[5];
-h qubits[4];
-h qubits[4];
-ccx qubits[9],qubits[2],qubits[4];
-h qubits[4];
-h qubits[4];
-cx qubits[3],qubits[9];
-cx qubits[3],qubits[0];
-cx qubits[4],qubits[2];
-cx qubits[3],qubits[4];
-cx qubits[3],qubits[6];
-cx qubits[3],qubits[7];
-x qubits[3];
-h qubits[3];
-h qubits[3];
-ccx qubits[1],qubits[9],qubits[3];
-h qubits[3];
-h qubits[3];
-cx qubits[9],qubits[7];
-x qubits[7];
-cx qubits[8],qubits[7];
-cx qubits[4],qubits[8];
-cx qubits[3],qubits[7];
-x qubits[4];
-cx qubits[4],qubits[5];
-h qubits[4];
-h qubits[4];
-ccx qubits[9],qubits[8],qubits[4];
-h qubits[4];
-h qubits[4];
-h qubits[7];
-h qubits[7];
-ccx qubits[2],qubits[9],qubits[7];
-h qubits[7];
-h qubits[7];
-cx qubits[0],qubits[9];
-cx qubits[0],qubits[8];
-cx qubits[7],qubits[0];
-cx qubits[2],qubits[1];
-cx qubits[1],qubits[7];
-cx qubits[2],qubits[8];
-cx qubits[6],qubits[9];
-cx qubits[6],qubits[8];
-h qubits[2];
-h qubits[2];
-ccx qubits[1],qubits[8],qubits[2];
-h qubits[2];
-h qubits[2];
-cx qubits[6],qubits[1];
-cx qubits[1],qubits[2];
-h qubits[6];
-h qubits[6];
-ccx qubits[1],qubits[7],qubits[6];
-h qubits[6];
-h qubits[6];
-cx qubits[0],qubits[1];
-cx qubits[0],qubits[2];
-cx qubits[0],qubits[6];
-h qubits[7];
-h qubits[7];
-ccx qubits[9],qubits[8],qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[9];
-h qubits[9];
-ccx qubits[10],qubits[7],qubits[9];
-h qubits[9];
-h qubits[9];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[0];
-h qubits[0];
-ccx qubits[10],qubits[5],qubits[0];
-h qubits[0];
-h qubits[0];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[9];
-h qubits[9];
-ccx qubits[10],qubits[7],qubits[9];
-h qubits[9];
-h qubits[9];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[7];
-h qubits[7];
-ccx qubits[9],qubits[8],qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[8];
-h qubits[8];
-ccx qubits[10],qubits[7],qubits[8];
-h qubits[8];
-h qubits[8];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[0];
-h qubits[0];
-ccx qubits[10],qubits[5],qubits[0];
-h qubits[0];
-h qubits[0];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[8];
-h qubits[8];
-ccx qubits[10],qubits[7],qubits[8];
-h qubits[8];
-h qubits[8];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-x qubits[4];
-x qubits[3];
-cx qubits[0],qubits[6];
-cx qubits[1],qubits[2];
-cx qubits[0],qubits[1];
-h qubits[6];
-h qubits[6];
-ccx qubits[1],qubits[7],qubits[6];
-h qubits[6];
-h qubits[6];
-cx qubits[6],qubits[1];
-h qubits[2];
-h qubits[2];
-ccx qubits[1],qubits[8],qubits[2];
-h qubits[2];
-h qubits[2];
-cx qubits[6],qubits[8];
-cx qubits[6],qubits[9];
-cx qubits[2],qubits[8];
-cx qubits[1],qubits[7];
-cx qubits[2],qubits[1];
-cx qubits[7],qubits[0];
-cx qubits[0],qubits[8];
-cx qubits[0],qubits[9];
-cx qubits[8],qubits[7];
-cx qubits[9],qubits[7];
-h qubits[7];
-h qubits[7];
-ccx qubits[1],qubits[9],qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[7];
-ccx qubits[2],qubits[9],qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[4];
-h qubits[4];
-ccx qubits[9],qubits[8],qubits[4];
-h qubits[4];
-h qubits[4];
-cx qubits[4],qubits[7];
-x qubits[5];
-cx qubits[8],qubits[5];
-cx qubits[4],qubits[2];
-cx qubits[4],qubits[8];
-h qubits[3];
-h qubits[3];
-ccx qubits[9],qubits[1],qubits[3];
-h qubits[3];
-h qubits[3];
-cx qubits[3],qubits[6];
-cx qubits[3],qubits[5];
-cx qubits[3],qubits[4];
-cx qubits[3],qubits[2];
-cx qubits[3],qubits[0];
-cx qubits[3],qubits[9];
-h qubits[4];
-h qubits[4];
-ccx qubits[9],qubits[2],qubits[4];
-h qubits[4];
-h qubits[4];
-cx qubits[0],qubits[5];
-cx qubits[0],qubits[2];
-cx qubits[0],qubits[1];
-cx qubits[8],qubits[9];
-cx qubits[8],qubits[3];
-cx qubits[8],qubits[2];
-cx qubits[8],qubits[0];
-cx qubits[0],qubits[8];
-cx qubits[9],qubits[6];
-cx qubits[9],qubits[4];
-cx qubits[9],qubits[3];
-cx qubits[9],qubits[0];
-cx qubits[0],qubits[9];
-cx qubits[7],qubits[9];
-cx qubits[6],qubits[8];
-cx qubits[6],qubits[5];
-cx qubits[7],qubits[6];
-cx qubits[6],qubits[7];
-cx qubits[2],qubits[1];
-cx qubits[7],qubits[2];
-cx qubits[2],qubits[7];
-x qubits[1];
-cx qubits[6],qubits[9];
-cx qubits[6],qubits[0];
-cx qubits[0],qubits[6];
-cx qubits[2],qubits[8];
-cx qubits[2],qubits[4];
-cx qubits[2],qubits[3];
-cx qubits[2],qubits[0];
-x qubits[2];
-cx qubits[5],qubits[2];
-cx qubits[2],qubits[1];
-cx qubits[6],qubits[5];
-cx qubits[2],qubits[6];
-cx qubits[2],qubits[8];
-cx qubits[2],qubits[9];
-cx qubits[6],qubits[1];
-cx qubits[6],qubits[2];
-cx qubits[3],qubits[7];
-cx qubits[7],qubits[6];
-cx qubits[6],qubits[3];
-cx qubits[7],qubits[1];
-cx qubits[7],qubits[4];
-cx qubits[7],qubits[2];
-cx qubits[4],qubits[8];
-cx qubits[0],qubits[9];
-cx qubits[9],qubits[0];
-cx qubits[9],qubits[2];
-cx qubits[9],qubits[6];
-cx qubits[4],qubits[0];
-cx qubits[8],qubits[4];
-cx qubits[8],qubits[5];
-cx qubits[0],qubits[5];
-cx qubits[5],qubits[8];
-cx qubits[0],qubits[1];
-cx qubits[0],qubits[6];
-cx qubits[5],qubits[0];
-cx qubits[0],qubits[7];
-cx qubits[5],qubits[9];
-cx qubits[5],qubits[2];
-h qubits[5];
-h qubits[5];
-ccx qubits[9],qubits[2],qubits[5];
-h qubits[5];
-h qubits[5];
-cx qubits[3],qubits[9];
-cx qubits[3],qubits[1];
-cx qubits[3],qubits[2];
-cx qubits[3],qubits[4];
-cx qubits[3],qubits[5];
-cx qubits[3],qubits[6];
-cx qubits[8],qubits[7];
-cx qubits[3],qubits[8];
-h qubits[3];
-h qubits[3];
-ccx qubits[9],qubits[1],qubits[3];
-h qubits[3];
-h qubits[3];
-cx qubits[0],qubits[2];
-cx qubits[0],qubits[3];
-cx qubits[0],qubits[4];
-cx qubits[0],qubits[5];
-h qubits[0];
-h qubits[0];
-ccx qubits[8],qubits[9],qubits[0];
-h qubits[0];
-h qubits[0];
-cx qubits[2],qubits[8];
-cx qubits[0],qubits[2];
-cx qubits[0],qubits[3];
-cx qubits[0],qubits[4];
-cx qubits[0],qubits[5];
-cx qubits[2],qubits[1];
-h qubits[7];
-h qubits[7];
-ccx qubits[1],qubits[9],qubits[7];
-h qubits[7];
-h qubits[7];
-cx qubits[9],qubits[7];
-cx qubits[0],qubits[9];
-cx qubits[7],qubits[0];
-cx qubits[1],qubits[7];
-cx qubits[6],qubits[9];
-cx qubits[6],qubits[8];
-h qubits[2];
-h qubits[2];
-ccx qubits[1],qubits[8],qubits[2];
-h qubits[2];
-h qubits[2];
-cx qubits[6],qubits[1];
-cx qubits[1],qubits[2];
-h qubits[6];
-h qubits[6];
-ccx qubits[1],qubits[7],qubits[6];
-h qubits[6];
-h qubits[6];
-cx qubits[0],qubits[1];
-cx qubits[0],qubits[2];
-cx qubits[0],qubits[6];
-x qubits[3];
-x qubits[4];
-x qubits[5];
-h qubits[7];
-h qubits[7];
-ccx qubits[9],qubits[8],qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[9];
-h qubits[9];
-ccx qubits[10],qubits[7],qubits[9];
-h qubits[9];
-h qubits[9];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[0];
-h qubits[0];
-ccx qubits[10],qubits[5],qubits[0];
-h qubits[0];
-h qubits[0];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[9];
-h qubits[9];
-ccx qubits[10],qubits[7],qubits[9];
-h qubits[9];
-h qubits[9];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[7];
-h qubits[7];
-ccx qubits[9],qubits[8],qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[8];
-h qubits[8];
-ccx qubits[10],qubits[7],qubits[8];
-h qubits[8];
-h qubits[8];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[0];
-h qubits[0];
-ccx qubits[10],qubits[5],qubits[0];
-h qubits[0];
-h qubits[0];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[8];
-h qubits[8];
-ccx qubits[10],qubits[7],qubits[8];
-h qubits[8];
-h qubits[8];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-x qubits[5];
-x qubits[4];
-x qubits[3];
-cx qubits[0],qubits[6];
-cx qubits[1],qubits[2];
-cx qubits[0],qubits[1];
-h qubits[6];
-h qubits[6];
-ccx qubits[1],qubits[7],qubits[6];
-h qubits[6];
-h qubits[6];
-cx qubits[6],qubits[1];
-h qubits[2];
-h qubits[2];
-ccx qubits[1],qubits[8],qubits[2];
-h qubits[2];
-h qubits[2];
-cx qubits[6],qubits[8];
-cx qubits[6],qubits[9];
-cx qubits[2],qubits[8];
-cx qubits[1],qubits[7];
-cx qubits[2],qubits[1];
-cx qubits[7],qubits[0];
-cx qubits[0],qubits[8];
-cx qubits[0],qubits[9];
-cx qubits[8],qubits[7];
-cx qubits[9],qubits[7];
-h qubits[7];
-h qubits[7];
-ccx qubits[1],qubits[9],qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[7];
-ccx qubits[2],qubits[9],qubits[7];
-h qubits[7];
-h qubits[7];
-cx qubits[0],qubits[5];
-cx qubits[0],qubits[4];
-cx qubits[0],qubits[3];
-cx qubits[0],qubits[2];
-h qubits[0];
-h qubits[0];
-ccx qubits[9],qubits[8],qubits[0];
-h qubits[0];
-h qubits[0];
-cx qubits[0],qubits[5];
-cx qubits[0],qubits[4];
-cx qubits[0],qubits[3];
-cx qubits[0],qubits[2];
-h qubits[3];
-h qubits[3];
-ccx qubits[9],qubits[1],qubits[3];
-h qubits[3];
-h qubits[3];
-cx qubits[3],qubits[8];
-cx qubits[3],qubits[7];
-cx qubits[3],qubits[6];
-cx qubits[3],qubits[5];
-cx qubits[3],qubits[4];
-cx qubits[3],qubits[2];
-cx qubits[3],qubits[1];
-cx qubits[3],qubits[9];
-h qubits[5];
-h qubits[5];
-ccx qubits[2],qubits[9],qubits[5];
-h qubits[5];
-h qubits[5];
-cx qubits[9],qubits[2];
-cx qubits[5],qubits[9];
-cx qubits[5],qubits[8];
-cx qubits[0],qubits[7];
-cx qubits[5],qubits[0];
-cx qubits[0],qubits[8];
-cx qubits[0],qubits[6];
-cx qubits[0],qubits[4];
-cx qubits[0],qubits[1];
-cx qubits[8],qubits[4];
-cx qubits[4],qubits[0];
-cx qubits[8],qubits[5];
-cx qubits[0],qubits[8];
-cx qubits[9],qubits[6];
-cx qubits[9],qubits[0];
-cx qubits[0],qubits[9];
-cx qubits[7],qubits[6];
-cx qubits[7],qubits[4];
-cx qubits[7],qubits[3];
-cx qubits[2],qubits[1];
-cx qubits[7],qubits[2];
-x qubits[7];
-cx qubits[6],qubits[3];
-cx qubits[3],qubits[7];
-cx qubits[6],qubits[2];
-cx qubits[2],qubits[6];
-x qubits[6];
-cx qubits[6],qubits[5];
-cx qubits[2],qubits[9];
-cx qubits[2],qubits[8];
-cx qubits[5],qubits[2];
-x qubits[0];
-cx qubits[9],qubits[2];
-cx qubits[2],qubits[9];
-cx qubits[3],qubits[6];
-cx qubits[6],qubits[1];
-cx qubits[6],qubits[2];
-cx qubits[6],qubits[3];
-cx qubits[6],qubits[5];
-cx qubits[6],qubits[7];
-cx qubits[0],qubits[7];
-cx qubits[7],qubits[0];
-cx qubits[7],qubits[9];
-cx qubits[9],qubits[7];
-cx qubits[7],qubits[1];
-cx qubits[3],qubits[4];
-cx qubits[3],qubits[7];
-cx qubits[7],qubits[2];
-cx qubits[9],qubits[6];
-cx qubits[9],qubits[8];
-cx qubits[0],qubits[8];
-cx qubits[8],qubits[0];
-cx qubits[8],qubits[1];
-cx qubits[8],qubits[2];
-cx qubits[8],qubits[4];
-cx qubits[8],qubits[5];
-cx qubits[8],qubits[7];
-cx qubits[3],qubits[8];
-cx qubits[3],qubits[9];
-cx qubits[3],qubits[0];
-cx qubits[0],qubits[3];
-cx qubits[3],qubits[0];
-cx qubits[5],qubits[6];
-cx qubits[3],qubits[5];
-h qubits[3];
-h qubits[3];
-ccx qubits[9],qubits[2],qubits[3];
-h qubits[3];
-h qubits[3];
-cx qubits[5],qubits[1];
-cx qubits[5],qubits[2];
-h qubits[5];
-h qubits[5];
-ccx qubits[9],qubits[1],qubits[5];
-h qubits[5];
-h qubits[5];
-cx qubits[0],qubits[3];
-cx qubits[0],qubits[5];
-cx qubits[0],qubits[6];
-h qubits[0];
-h qubits[0];
-ccx qubits[9],qubits[8],qubits[0];
-h qubits[0];
-h qubits[0];
-cx qubits[0],qubits[3];
-cx qubits[0],qubits[5];
-cx qubits[0],qubits[6];
-cx qubits[2],qubits[1];
-h qubits[7];
-h qubits[7];
-ccx qubits[1],qubits[9],qubits[7];
-h qubits[7];
-h qubits[7];
-cx qubits[9],qubits[7];
-cx qubits[8],qubits[7];
-cx qubits[0],qubits[9];
-cx qubits[0],qubits[8];
-cx qubits[7],qubits[0];
-cx qubits[1],qubits[7];
-cx qubits[2],qubits[8];
-cx qubits[6],qubits[9];
-cx qubits[6],qubits[8];
-h qubits[2];
-h qubits[2];
-ccx qubits[1],qubits[8],qubits[2];
-h qubits[2];
-h qubits[2];
-cx qubits[6],qubits[1];
-cx qubits[1],qubits[2];
-h qubits[6];
-h qubits[6];
-ccx qubits[1],qubits[7],qubits[6];
-h qubits[6];
-h qubits[6];
-cx qubits[0],qubits[1];
-cx qubits[0],qubits[2];
-cx qubits[0],qubits[6];
-x qubits[3];
-x qubits[5];
-h qubits[7];
-h qubits[7];
-ccx qubits[9],qubits[8],qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[9];
-h qubits[9];
-ccx qubits[10],qubits[7],qubits[9];
-h qubits[9];
-h qubits[9];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[0];
-h qubits[0];
-ccx qubits[10],qubits[5],qubits[0];
-h qubits[0];
-h qubits[0];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[9];
-h qubits[9];
-ccx qubits[10],qubits[7],qubits[9];
-h qubits[9];
-h qubits[9];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[7];
-h qubits[7];
-ccx qubits[9],qubits[8],qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[8];
-h qubits[8];
-ccx qubits[10],qubits[7],qubits[8];
-h qubits[8];
-h qubits[8];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[0];
-h qubits[0];
-ccx qubits[10],qubits[5],qubits[0];
-h qubits[0];
-h qubits[0];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[8];
-h qubits[8];
-ccx qubits[10],qubits[7],qubits[8];
-h qubits[8];
-h qubits[8];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-x qubits[5];
-x qubits[3];
-cx qubits[0],qubits[6];
-cx qubits[1],qubits[2];
-cx qubits[0],qubits[1];
-h qubits[6];
-h qubits[6];
-ccx qubits[1],qubits[7],qubits[6];
-h qubits[6];
-h qubits[6];
-cx qubits[6],qubits[1];
-h qubits[2];
-h qubits[2];
-ccx qubits[1],qubits[8],qubits[2];
-h qubits[2];
-h qubits[2];
-cx qubits[6],qubits[8];
-cx qubits[6],qubits[9];
-cx qubits[2],qubits[8];
-cx qubits[1],qubits[7];
-cx qubits[2],qubits[1];
-cx qubits[7],qubits[0];
-cx qubits[0],qubits[8];
-cx qubits[0],qubits[9];
-cx qubits[8],qubits[7];
-cx qubits[9],qubits[7];
-h qubits[7];
-h qubits[7];
-ccx qubits[1],qubits[9],qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[7];
-ccx qubits[2],qubits[9],qubits[7];
-h qubits[7];
-h qubits[7];
-cx qubits[0],qubits[6];
-cx qubits[0],qubits[5];
-cx qubits[0],qubits[3];
-h qubits[0];
-h qubits[0];
-ccx qubits[9],qubits[8],qubits[0];
-h qubits[0];
-h qubits[0];
-cx qubits[0],qubits[6];
-cx qubits[0],qubits[5];
-cx qubits[0],qubits[3];
-h qubits[5];
-h qubits[5];
-ccx qubits[9],qubits[1],qubits[5];
-h qubits[5];
-h qubits[5];
-cx qubits[5],qubits[6];
-cx qubits[5],qubits[2];
-cx qubits[5],qubits[1];
-h qubits[3];
-h qubits[3];
-ccx qubits[9],qubits[2],qubits[3];
-h qubits[3];
-h qubits[3];
-cx qubits[3],qubits[8];
-cx qubits[3],qubits[7];
-cx qubits[3],qubits[6];
-cx qubits[3],qubits[5];
-cx qubits[0],qubits[4];
-cx qubits[0],qubits[2];
-cx qubits[0],qubits[9];
-cx qubits[3],qubits[0];
-cx qubits[0],qubits[3];
-cx qubits[0],qubits[8];
-cx qubits[8],qubits[0];
-cx qubits[0],qubits[7];
-cx qubits[3],qubits[0];
-cx qubits[8],qubits[5];
-cx qubits[8],qubits[4];
-cx qubits[8],qubits[2];
-cx qubits[8],qubits[1];
-cx qubits[0],qubits[8];
-cx qubits[9],qubits[8];
-cx qubits[9],qubits[7];
-cx qubits[6],qubits[2];
-cx qubits[6],qubits[1];
-cx qubits[9],qubits[6];
-cx qubits[2],qubits[9];
-cx qubits[9],qubits[2];
-cx qubits[7],qubits[2];
-cx qubits[7],qubits[1];
-cx qubits[7],qubits[0];
-cx qubits[0],qubits[7];
-cx qubits[6],qubits[7];
-cx qubits[6],qubits[5];
-cx qubits[6],qubits[3];
-cx qubits[3],qubits[6];
-x qubits[3];
-x qubits[0];
-cx qubits[3],qubits[2];
-cx qubits[2],qubits[3];
-cx qubits[6],qubits[4];
-cx qubits[6],qubits[7];
-cx qubits[6],qubits[9];
-cx qubits[2],qubits[6];
-cx qubits[6],qubits[0];
-cx qubits[6],qubits[3];
-cx qubits[0],qubits[7];
-cx qubits[7],qubits[0];
-cx qubits[7],qubits[2];
-cx qubits[7],qubits[3];
-cx qubits[7],qubits[5];
-cx qubits[0],qubits[9];
-cx qubits[9],qubits[0];
-cx qubits[9],qubits[1];
-cx qubits[9],qubits[3];
-cx qubits[9],qubits[4];
-cx qubits[9],qubits[6];
-cx qubits[7],qubits[8];
-cx qubits[3],qubits[7];
-cx qubits[9],qubits[7];
-cx qubits[7],qubits[8];
-cx qubits[8],qubits[9];
-cx qubits[8],qubits[3];
-cx qubits[3],qubits[7];
-cx qubits[8],qubits[4];
-cx qubits[8],qubits[5];
-cx qubits[8],qubits[6];
-cx qubits[3],qubits[0];
-cx qubits[0],qubits[1];
-cx qubits[0],qubits[2];
-cx qubits[0],qubits[3];
-cx qubits[5],qubits[7];
-cx qubits[0],qubits[5];
-cx qubits[5],qubits[9];
-cx qubits[5],qubits[2];
-cx qubits[5],qubits[6];
-h qubits[5];
-h qubits[5];
-ccx qubits[9],qubits[2],qubits[5];
-h qubits[5];
-h qubits[5];
-cx qubits[3],qubits[9];
-cx qubits[3],qubits[4];
-x qubits[5];
-x qubits[4];
-cx qubits[0],qubits[5];
-cx qubits[3],qubits[0];
-cx qubits[3],qubits[8];
-h qubits[3];
-h qubits[3];
-ccx qubits[9],qubits[1],qubits[3];
-h qubits[3];
-h qubits[3];
-cx qubits[0],qubits[3];
-cx qubits[0],qubits[6];
-h qubits[0];
-h qubits[0];
-ccx qubits[9],qubits[8],qubits[0];
-h qubits[0];
-h qubits[0];
-cx qubits[0],qubits[3];
-cx qubits[0],qubits[5];
-cx qubits[0],qubits[6];
-cx qubits[2],qubits[1];
-h qubits[7];
-h qubits[7];
-ccx qubits[1],qubits[9],qubits[7];
-h qubits[7];
-h qubits[7];
-cx qubits[9],qubits[7];
-cx qubits[8],qubits[7];
-cx qubits[0],qubits[9];
-cx qubits[0],qubits[8];
-cx qubits[7],qubits[0];
-cx qubits[1],qubits[7];
-cx qubits[2],qubits[8];
-cx qubits[6],qubits[9];
-cx qubits[6],qubits[8];
-h qubits[2];
-h qubits[2];
-ccx qubits[1],qubits[8],qubits[2];
-h qubits[2];
-h qubits[2];
-cx qubits[6],qubits[1];
-cx qubits[1],qubits[2];
-h qubits[6];
-h qubits[6];
-ccx qubits[1],qubits[7],qubits[6];
-h qubits[6];
-h qubits[6];
-cx qubits[0],qubits[1];
-cx qubits[0],qubits[2];
-cx qubits[0],qubits[6];
-x qubits[3];
-h qubits[7];
-h qubits[7];
-ccx qubits[9],qubits[8],qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[9];
-h qubits[9];
-ccx qubits[10],qubits[7],qubits[9];
-h qubits[9];
-h qubits[9];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[0];
-h qubits[0];
-ccx qubits[10],qubits[5],qubits[0];
-h qubits[0];
-h qubits[0];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[9];
-h qubits[9];
-ccx qubits[10],qubits[7],qubits[9];
-h qubits[9];
-h qubits[9];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[7];
-h qubits[7];
-ccx qubits[9],qubits[8],qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[8];
-h qubits[8];
-ccx qubits[10],qubits[7],qubits[8];
-h qubits[8];
-h qubits[8];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[0];
-h qubits[0];
-ccx qubits[10],qubits[5],qubits[0];
-h qubits[0];
-h qubits[0];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[8];
-h qubits[8];
-ccx qubits[10],qubits[7],qubits[8];
-h qubits[8];
-h qubits[8];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-x qubits[5];
-x qubits[3];
-cx qubits[0],qubits[6];
-cx qubits[1],qubits[2];
-cx qubits[0],qubits[1];
-h qubits[6];
-h qubits[6];
-ccx qubits[1],qubits[7],qubits[6];
-h qubits[6];
-h qubits[6];
-cx qubits[6],qubits[1];
-h qubits[2];
-h qubits[2];
-ccx qubits[1],qubits[8],qubits[2];
-h qubits[2];
-h qubits[2];
-cx qubits[6],qubits[8];
-cx qubits[6],qubits[9];
-cx qubits[2],qubits[8];
-cx qubits[1],qubits[7];
-cx qubits[2],qubits[1];
-cx qubits[7],qubits[0];
-cx qubits[0],qubits[8];
-cx qubits[0],qubits[9];
-cx qubits[8],qubits[7];
-cx qubits[9],qubits[7];
-h qubits[7];
-h qubits[7];
-ccx qubits[1],qubits[9],qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[7];
-ccx qubits[2],qubits[9],qubits[7];
-h qubits[7];
-h qubits[7];
-cx qubits[0],qubits[6];
-cx qubits[0],qubits[5];
-cx qubits[0],qubits[3];
-h qubits[0];
-h qubits[0];
-ccx qubits[9],qubits[8],qubits[0];
-h qubits[0];
-h qubits[0];
-cx qubits[0],qubits[6];
-cx qubits[0],qubits[5];
-cx qubits[0],qubits[3];
-h qubits[3];
-h qubits[3];
-ccx qubits[9],qubits[1],qubits[3];
-h qubits[3];
-h qubits[3];
-cx qubits[3],qubits[8];
-cx qubits[3],qubits[5];
-cx qubits[3],qubits[4];
-cx qubits[3],qubits[0];
-cx qubits[3],qubits[9];
-h qubits[5];
-h qubits[5];
-ccx qubits[9],qubits[2],qubits[5];
-h qubits[5];
-h qubits[5];
-cx qubits[5],qubits[7];
-cx qubits[5],qubits[6];
-cx qubits[5],qubits[2];
-cx qubits[5],qubits[9];
-cx qubits[0],qubits[7];
-cx qubits[0],qubits[5];
-cx qubits[0],qubits[3];
-cx qubits[0],qubits[2];
-cx qubits[0],qubits[1];
-cx qubits[3],qubits[0];
-cx qubits[9],qubits[7];
-cx qubits[9],qubits[6];
-cx qubits[8],qubits[9];
-cx qubits[8],qubits[5];
-cx qubits[8],qubits[4];
-cx qubits[9],qubits[3];
-cx qubits[8],qubits[3];
-cx qubits[3],qubits[8];
-cx qubits[9],qubits[4];
-cx qubits[9],qubits[1];
-cx qubits[9],qubits[0];
-cx qubits[0],qubits[9];
-cx qubits[7],qubits[5];
-cx qubits[2],qubits[3];
-cx qubits[7],qubits[2];
-cx qubits[6],qubits[7];
-cx qubits[7],qubits[0];
-cx qubits[0],qubits[7];
-cx qubits[6],qubits[4];
-cx qubits[6],qubits[3];
-cx qubits[2],qubits[6];
-cx qubits[2],qubits[4];
-cx qubits[3],qubits[2];
-x qubits[1];
-x qubits[2];
-cx qubits[2],qubits[0];
-cx qubits[2],qubits[3];
-cx qubits[2],qubits[4];
-cx qubits[2],qubits[6];
-cx qubits[6],qubits[0];
-cx qubits[6],qubits[1];
-cx qubits[0],qubits[7];
-cx qubits[7],qubits[0];
-cx qubits[7],qubits[1];
-cx qubits[7],qubits[5];
-cx qubits[7],qubits[4];
-cx qubits[7],qubits[9];
-cx qubits[0],qubits[9];
-cx qubits[9],qubits[0];
-cx qubits[9],qubits[1];
-cx qubits[9],qubits[2];
-cx qubits[5],qubits[6];
-cx qubits[9],qubits[5];
-cx qubits[9],qubits[8];
-cx qubits[0],qubits[8];
-cx qubits[8],qubits[0];
-cx qubits[8],qubits[1];
-cx qubits[8],qubits[3];
-cx qubits[8],qubits[4];
-cx qubits[8],qubits[5];
-cx qubits[8],qubits[9];
-cx qubits[3],qubits[0];
-cx qubits[2],qubits[3];
-cx qubits[0],qubits[2];
-cx qubits[0],qubits[5];
-cx qubits[0],qubits[7];
-cx qubits[5],qubits[9];
-h qubits[5];
-h qubits[5];
-ccx qubits[9],qubits[2],qubits[5];
-h qubits[5];
-h qubits[5];
-cx qubits[2],qubits[5];
-cx qubits[2],qubits[6];
-cx qubits[8],qubits[7];
-cx qubits[2],qubits[8];
-h qubits[2];
-h qubits[2];
-ccx qubits[9],qubits[1],qubits[2];
-h qubits[2];
-h qubits[2];
-cx qubits[2],qubits[3];
-cx qubits[2],qubits[5];
-cx qubits[2],qubits[6];
-cx qubits[3],qubits[2];
-cx qubits[2],qubits[8];
-cx qubits[3],qubits[0];
-h qubits[3];
-h qubits[3];
-ccx qubits[9],qubits[8],qubits[3];
-h qubits[3];
-h qubits[3];
-cx qubits[2],qubits[1];
-h qubits[7];
-h qubits[7];
-ccx qubits[1],qubits[9],qubits[7];
-h qubits[7];
-h qubits[7];
-cx qubits[9],qubits[7];
-cx qubits[0],qubits[9];
-cx qubits[0],qubits[8];
-cx qubits[7],qubits[0];
-cx qubits[1],qubits[7];
-cx qubits[2],qubits[8];
-cx qubits[6],qubits[9];
-cx qubits[6],qubits[8];
-h qubits[2];
-h qubits[2];
-ccx qubits[1],qubits[8],qubits[2];
-h qubits[2];
-h qubits[2];
-cx qubits[6],qubits[1];
-cx qubits[1],qubits[2];
-h qubits[6];
-h qubits[6];
-ccx qubits[1],qubits[7],qubits[6];
-h qubits[6];
-h qubits[6];
-cx qubits[0],qubits[1];
-cx qubits[0],qubits[2];
-cx qubits[0],qubits[6];
-x qubits[3];
-x qubits[5];
-h qubits[7];
-h qubits[7];
-ccx qubits[9],qubits[8],qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[9];
-h qubits[9];
-ccx qubits[10],qubits[7],qubits[9];
-h qubits[9];
-h qubits[9];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[0];
-h qubits[0];
-ccx qubits[10],qubits[5],qubits[0];
-h qubits[0];
-h qubits[0];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[9];
-h qubits[9];
-ccx qubits[10],qubits[7],qubits[9];
-h qubits[9];
-h qubits[9];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[7];
-h qubits[7];
-ccx qubits[9],qubits[8],qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[8];
-h qubits[8];
-ccx qubits[10],qubits[7],qubits[8];
-h qubits[8];
-h qubits[8];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[0];
-h qubits[0];
-ccx qubits[10],qubits[5],qubits[0];
-h qubits[0];
-h qubits[0];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[8];
-h qubits[8];
-ccx qubits[10],qubits[7],qubits[8];
-h qubits[8];
-h qubits[8];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-x qubits[5];
-x qubits[3];
-cx qubits[0],qubits[6];
-cx qubits[1],qubits[2];
-cx qubits[0],qubits[1];
-h qubits[6];
-h qubits[6];
-ccx qubits[1],qubits[7],qubits[6];
-h qubits[6];
-h qubits[6];
-cx qubits[6],qubits[1];
-h qubits[2];
-h qubits[2];
-ccx qubits[1],qubits[8],qubits[2];
-h qubits[2];
-h qubits[2];
-cx qubits[6],qubits[8];
-cx qubits[6],qubits[9];
-cx qubits[2],qubits[8];
-cx qubits[1],qubits[7];
-cx qubits[2],qubits[1];
-cx qubits[7],qubits[0];
-cx qubits[0],qubits[8];
-cx qubits[0],qubits[9];
-cx qubits[8],qubits[7];
-cx qubits[9],qubits[7];
-h qubits[7];
-h qubits[7];
-ccx qubits[1],qubits[9],qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[7];
-ccx qubits[2],qubits[9],qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[3];
-h qubits[3];
-ccx qubits[9],qubits[8],qubits[3];
-h qubits[3];
-h qubits[3];
-cx qubits[2],qubits[7];
-cx qubits[3],qubits[2];
-cx qubits[3],qubits[0];
-cx qubits[2],qubits[3];
-cx qubits[3],qubits[8];
-cx qubits[2],qubits[6];
-cx qubits[2],qubits[5];
-h qubits[2];
-h qubits[2];
-ccx qubits[9],qubits[1],qubits[2];
-h qubits[2];
-h qubits[2];
-cx qubits[2],qubits[8];
-cx qubits[2],qubits[7];
-cx qubits[2],qubits[6];
-cx qubits[2],qubits[5];
-cx qubits[2],qubits[3];
-h qubits[5];
-h qubits[5];
-ccx qubits[9],qubits[2],qubits[5];
-h qubits[5];
-h qubits[5];
-cx qubits[5],qubits[9];
-cx qubits[9],qubits[5];
-cx qubits[0],qubits[5];
-cx qubits[5],qubits[6];
-cx qubits[0],qubits[7];
-cx qubits[0],qubits[3];
-cx qubits[0],qubits[2];
-cx qubits[8],qubits[3];
-cx qubits[3],qubits[0];
-cx qubits[8],qubits[9];
-cx qubits[8],qubits[4];
-cx qubits[8],qubits[1];
-cx qubits[9],qubits[0];
-cx qubits[0],qubits[8];
-cx qubits[9],qubits[2];
-cx qubits[9],qubits[1];
-cx qubits[7],qubits[0];
-cx qubits[6],qubits[0];
-cx qubits[2],qubits[0];
-cx qubits[0],qubits[9];
-cx qubits[7],qubits[5];
-cx qubits[7],qubits[4];
-cx qubits[7],qubits[1];
-cx qubits[0],qubits[7];
-cx qubits[6],qubits[1];
-cx qubits[2],qubits[6];
-cx qubits[2],qubits[4];
-cx qubits[2],qubits[3];
-x qubits[1];
-x qubits[4];
-cx qubits[0],qubits[2];
-cx qubits[2],qubits[3];
-cx qubits[0],qubits[6];
-cx qubits[7],qubits[0];
-cx qubits[6],qubits[4];
-cx qubits[6],qubits[2];
-cx qubits[2],qubits[7];
-cx qubits[7],qubits[2];
-cx qubits[7],qubits[1];
-cx qubits[2],qubits[9];
-cx qubits[6],qubits[8];
-cx qubits[3],qubits[9];
-cx qubits[9],qubits[2];
-cx qubits[9],qubits[3];
-cx qubits[9],qubits[5];
-cx qubits[9],qubits[6];
-cx qubits[9],qubits[7];
-cx qubits[4],qubits[8];
-cx qubits[8],qubits[2];
-cx qubits[8],qubits[4];
-cx qubits[8],qubits[5];
-cx qubits[3],qubits[0];
-cx qubits[0],qubits[3];
-cx qubits[0],qubits[4];
-cx qubits[0],qubits[7];
-cx qubits[0],qubits[8];
-cx qubits[5],qubits[0];
-cx qubits[0],qubits[9];
-cx qubits[3],qubits[5];
-cx qubits[5],qubits[6];
-cx qubits[5],qubits[7];
-h qubits[5];
-h qubits[5];
-ccx qubits[9],qubits[2],qubits[5];
-h qubits[5];
-h qubits[5];
-cx qubits[3],qubits[9];
-cx qubits[3],qubits[2];
-cx qubits[3],qubits[8];
-h qubits[3];
-h qubits[3];
-ccx qubits[9],qubits[1],qubits[3];
-h qubits[3];
-h qubits[3];
-cx qubits[3],qubits[9];
-cx qubits[3],qubits[0];
-cx qubits[3],qubits[4];
-h qubits[3];
-h qubits[3];
-ccx qubits[9],qubits[8],qubits[3];
-h qubits[3];
-h qubits[3];
-cx qubits[2],qubits[1];
-h qubits[7];
-h qubits[7];
-ccx qubits[1],qubits[9],qubits[7];
-h qubits[7];
-h qubits[7];
-cx qubits[9],qubits[7];
-cx qubits[8],qubits[7];
-cx qubits[0],qubits[9];
-cx qubits[0],qubits[8];
-cx qubits[7],qubits[0];
-cx qubits[1],qubits[7];
-cx qubits[2],qubits[8];
-cx qubits[6],qubits[9];
-cx qubits[6],qubits[8];
-h qubits[2];
-h qubits[2];
-ccx qubits[1],qubits[8],qubits[2];
-h qubits[2];
-h qubits[2];
-cx qubits[6],qubits[1];
-cx qubits[1],qubits[2];
-h qubits[6];
-h qubits[6];
-ccx qubits[1],qubits[7],qubits[6];
-h qubits[6];
-h qubits[6];
-cx qubits[0],qubits[1];
-cx qubits[0],qubits[2];
-cx qubits[0],qubits[6];
-x qubits[3];
-x qubits[4];
-x qubits[5];
-h qubits[7];
-h qubits[7];
-ccx qubits[9],qubits[8],qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[9];
-h qubits[9];
-ccx qubits[10],qubits[7],qubits[9];
-h qubits[9];
-h qubits[9];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[0];
-h qubits[0];
-ccx qubits[10],qubits[5],qubits[0];
-h qubits[0];
-h qubits[0];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[9];
-h qubits[9];
-ccx qubits[10],qubits[7],qubits[9];
-h qubits[9];
-h qubits[9];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[7];
-h qubits[7];
-ccx qubits[9],qubits[8],qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[8];
-h qubits[8];
-ccx qubits[10],qubits[7],qubits[8];
-h qubits[8];
-h qubits[8];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[0];
-h qubits[0];
-ccx qubits[10],qubits[5],qubits[0];
-h qubits[0];
-h qubits[0];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[8];
-h qubits[8];
-ccx qubits[10],qubits[7],qubits[8];
-h qubits[8];
-h qubits[8];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-x qubits[5];
-x qubits[4];
-x qubits[3];
-cx qubits[0],qubits[6];
-cx qubits[1],qubits[2];
-cx qubits[0],qubits[1];
-h qubits[6];
-h qubits[6];
-ccx qubits[1],qubits[7],qubits[6];
-h qubits[6];
-h qubits[6];
-cx qubits[6],qubits[1];
-h qubits[2];
-h qubits[2];
-ccx qubits[1],qubits[8],qubits[2];
-h qubits[2];
-h qubits[2];
-cx qubits[6],qubits[8];
-cx qubits[6],qubits[9];
-cx qubits[2],qubits[8];
-cx qubits[1],qubits[7];
-cx qubits[2],qubits[1];
-cx qubits[7],qubits[0];
-cx qubits[0],qubits[8];
-cx qubits[0],qubits[9];
-cx qubits[8],qubits[7];
-cx qubits[9],qubits[7];
-h qubits[7];
-h qubits[7];
-ccx qubits[1],qubits[9],qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[7];
-ccx qubits[2],qubits[9],qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[3];
-h qubits[3];
-ccx qubits[9],qubits[8],qubits[3];
-h qubits[3];
-h qubits[3];
-cx qubits[3],qubits[4];
-cx qubits[3],qubits[0];
-cx qubits[3],qubits[9];
-h qubits[3];
-h qubits[3];
-ccx qubits[9],qubits[1],qubits[3];
-h qubits[3];
-h qubits[3];
-cx qubits[3],qubits[8];
-cx qubits[3],qubits[7];
-cx qubits[3],qubits[6];
-cx qubits[3],qubits[5];
-cx qubits[3],qubits[2];
-cx qubits[3],qubits[9];
-h qubits[5];
-h qubits[5];
-ccx qubits[9],qubits[2],qubits[5];
-h qubits[5];
-h qubits[5];
-cx qubits[5],qubits[7];
-cx qubits[5],qubits[6];
-cx qubits[0],qubits[9];
-cx qubits[5],qubits[0];
-cx qubits[9],qubits[5];
-cx qubits[0],qubits[8];
-cx qubits[0],qubits[7];
-cx qubits[0],qubits[4];
-cx qubits[0],qubits[3];
-cx qubits[3],qubits[0];
-cx qubits[8],qubits[5];
-cx qubits[8],qubits[4];
-cx qubits[8],qubits[2];
-cx qubits[4],qubits[8];
-cx qubits[9],qubits[7];
-cx qubits[9],qubits[6];
-cx qubits[9],qubits[3];
-cx qubits[7],qubits[9];
-cx qubits[9],qubits[2];
-cx qubits[3],qubits[9];
-cx qubits[6],qubits[7];
-x qubits[1];
-cx qubits[2],qubits[1];
-cx qubits[0],qubits[9];
-cx qubits[6],qubits[0];
-cx qubits[2],qubits[5];
-cx qubits[6],qubits[3];
-cx qubits[7],qubits[4];
-cx qubits[7],qubits[9];
-cx qubits[7],qubits[8];
-cx qubits[8],qubits[7];
-cx qubits[7],qubits[6];
-cx qubits[9],qubits[8];
-cx qubits[9],qubits[0];
-cx qubits[9],qubits[1];
-cx qubits[9],qubits[3];
-cx qubits[9],qubits[5];
-cx qubits[8],qubits[4];
-cx qubits[8],qubits[5];
-cx qubits[5],qubits[2];
-cx qubits[5],qubits[6];
-cx qubits[5],qubits[7];
-cx qubits[0],qubits[5];
-cx qubits[0],qubits[9];
-cx qubits[5],qubits[1];
-h qubits[5];
-h qubits[5];
-ccx qubits[9],qubits[2],qubits[5];
-h qubits[5];
-h qubits[5];
-cx qubits[0],qubits[2];
-cx qubits[0],qubits[3];
-cx qubits[0],qubits[5];
-h qubits[0];
-h qubits[0];
-ccx qubits[9],qubits[1],qubits[0];
-h qubits[0];
-h qubits[0];
-cx qubits[0],qubits[4];
-cx qubits[0],qubits[8];
-cx qubits[0],qubits[1];
-cx qubits[0],qubits[6];
-h qubits[0];
-h qubits[0];
-ccx qubits[9],qubits[8],qubits[0];
-h qubits[0];
-h qubits[0];
-cx qubits[2],qubits[1];
-cx qubits[0],qubits[2];
-cx qubits[0],qubits[3];
-cx qubits[0],qubits[5];
-cx qubits[0],qubits[6];
-h qubits[7];
-h qubits[7];
-ccx qubits[1],qubits[9],qubits[7];
-h qubits[7];
-h qubits[7];
-cx qubits[9],qubits[7];
-cx qubits[8],qubits[7];
-cx qubits[0],qubits[9];
-cx qubits[0],qubits[8];
-cx qubits[7],qubits[0];
-cx qubits[1],qubits[7];
-cx qubits[2],qubits[8];
-cx qubits[6],qubits[9];
-cx qubits[6],qubits[8];
-h qubits[2];
-h qubits[2];
-ccx qubits[1],qubits[8],qubits[2];
-h qubits[2];
-h qubits[2];
-cx qubits[6],qubits[1];
-cx qubits[1],qubits[2];
-h qubits[6];
-h qubits[6];
-ccx qubits[1],qubits[7],qubits[6];
-h qubits[6];
-h qubits[6];
-cx qubits[0],qubits[1];
-cx qubits[0],qubits[2];
-cx qubits[0],qubits[6];
-x qubits[4];
-x qubits[5];
-h qubits[7];
-h qubits[7];
-ccx qubits[9],qubits[8],qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[9];
-h qubits[9];
-ccx qubits[10],qubits[7],qubits[9];
-h qubits[9];
-h qubits[9];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[0];
-h qubits[0];
-ccx qubits[10],qubits[5],qubits[0];
-h qubits[0];
-h qubits[0];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[9];
-h qubits[9];
-ccx qubits[10],qubits[7],qubits[9];
-h qubits[9];
-h qubits[9];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[7];
-h qubits[7];
-ccx qubits[9],qubits[8],qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[8];
-h qubits[8];
-ccx qubits[10],qubits[7],qubits[8];
-h qubits[8];
-h qubits[8];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[0];
-h qubits[0];
-ccx qubits[10],qubits[5],qubits[0];
-h qubits[0];
-h qubits[0];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[8];
-h qubits[8];
-ccx qubits[10],qubits[7],qubits[8];
-h qubits[8];
-h qubits[8];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-x qubits[5];
-cx qubits[0],qubits[6];
-cx qubits[1],qubits[2];
-cx qubits[0],qubits[1];
-h qubits[6];
-h qubits[6];
-ccx qubits[1],qubits[7],qubits[6];
-h qubits[6];
-h qubits[6];
-cx qubits[6],qubits[1];
-h qubits[2];
-h qubits[2];
-ccx qubits[1],qubits[8],qubits[2];
-h qubits[2];
-h qubits[2];
-cx qubits[6],qubits[8];
-cx qubits[6],qubits[9];
-cx qubits[2],qubits[8];
-cx qubits[1],qubits[7];
-cx qubits[2],qubits[1];
-cx qubits[7],qubits[0];
-cx qubits[0],qubits[8];
-cx qubits[0],qubits[9];
-cx qubits[8],qubits[7];
-h qubits[7];
-h qubits[7];
-ccx qubits[1],qubits[9],qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[7];
-ccx qubits[2],qubits[9],qubits[7];
-h qubits[7];
-h qubits[7];
-cx qubits[0],qubits[6];
-cx qubits[0],qubits[5];
-cx qubits[0],qubits[3];
-cx qubits[0],qubits[2];
-cx qubits[0],qubits[1];
-h qubits[0];
-h qubits[0];
-ccx qubits[9],qubits[8],qubits[0];
-h qubits[0];
-h qubits[0];
-cx qubits[0],qubits[6];
-cx qubits[0],qubits[1];
-cx qubits[8],qubits[4];
-cx qubits[0],qubits[8];
-h qubits[0];
-h qubits[0];
-ccx qubits[9],qubits[1],qubits[0];
-h qubits[0];
-h qubits[0];
-cx qubits[0],qubits[5];
-cx qubits[0],qubits[3];
-cx qubits[0],qubits[2];
-h qubits[5];
-h qubits[5];
-ccx qubits[9],qubits[2],qubits[5];
-h qubits[5];
-h qubits[5];
-cx qubits[5],qubits[7];
-cx qubits[5],qubits[6];
-cx qubits[5],qubits[1];
-cx qubits[0],qubits[5];
-cx qubits[5],qubits[2];
-cx qubits[0],qubits[9];
-cx qubits[9],qubits[0];
-cx qubits[0],qubits[6];
-cx qubits[7],qubits[6];
-cx qubits[8],qubits[7];
-cx qubits[9],qubits[8];
-cx qubits[8],qubits[5];
-cx qubits[9],qubits[3];
-cx qubits[9],qubits[1];
-cx qubits[7],qubits[0];
-cx qubits[0],qubits[9];
-cx qubits[7],qubits[8];
-cx qubits[7],qubits[4];
-x qubits[7];
-cx qubits[7],qubits[1];
-cx qubits[6],qubits[8];
-cx qubits[6],qubits[5];
-cx qubits[6],qubits[4];
-cx qubits[2],qubits[3];
-cx qubits[2],qubits[0];
-cx qubits[6],qubits[2];
-cx qubits[0],qubits[6];
-cx qubits[2],qubits[9];
-cx qubits[2],qubits[7];
-cx qubits[2],qubits[5];
-cx qubits[0],qubits[2];
-cx qubits[2],qubits[1];
-cx qubits[2],qubits[0];
-cx qubits[1],qubits[2];
-x qubits[1];
-cx qubits[1],qubits[5];
-cx qubits[2],qubits[1];
-cx qubits[1],qubits[7];
-cx qubits[2],qubits[4];
-cx qubits[6],qubits[5];
-cx qubits[2],qubits[6];
-cx qubits[2],qubits[9];
-cx qubits[6],qubits[0];
-cx qubits[6],qubits[1];
-cx qubits[6],qubits[2];
-cx qubits[0],qubits[7];
-cx qubits[0],qubits[4];
-cx qubits[0],qubits[5];
-cx qubits[7],qubits[0];
-cx qubits[7],qubits[6];
-cx qubits[7],qubits[9];
-cx qubits[3],qubits[9];
-cx qubits[9],qubits[1];
-cx qubits[9],qubits[3];
-cx qubits[9],qubits[4];
-cx qubits[9],qubits[6];
-cx qubits[9],qubits[8];
-cx qubits[8],qubits[1];
-cx qubits[8],qubits[4];
-cx qubits[8],qubits[9];
-cx qubits[1],qubits[2];
-cx qubits[0],qubits[1];
-cx qubits[1],qubits[2];
-cx qubits[0],qubits[7];
-cx qubits[0],qubits[9];
-cx qubits[3],qubits[2];
-cx qubits[3],qubits[6];
-cx qubits[3],qubits[8];
-h qubits[3];
-h qubits[3];
-ccx qubits[9],qubits[2],qubits[3];
-h qubits[3];
-h qubits[3];
-cx qubits[3],qubits[6];
-h qubits[3];
-h qubits[3];
-ccx qubits[9],qubits[1],qubits[3];
-h qubits[3];
-h qubits[3];
-cx qubits[3],qubits[6];
-cx qubits[5],qubits[9];
-cx qubits[5],qubits[8];
-cx qubits[5],qubits[2];
-cx qubits[5],qubits[7];
-h qubits[5];
-h qubits[5];
-ccx qubits[9],qubits[8],qubits[5];
-h qubits[5];
-h qubits[5];
-cx qubits[2],qubits[1];
-h qubits[7];
-h qubits[7];
-ccx qubits[1],qubits[9],qubits[7];
-h qubits[7];
-h qubits[7];
-cx qubits[9],qubits[7];
-cx qubits[8],qubits[7];
-cx qubits[0],qubits[9];
-cx qubits[0],qubits[8];
-cx qubits[7],qubits[0];
-cx qubits[1],qubits[7];
-cx qubits[2],qubits[8];
-cx qubits[6],qubits[9];
-cx qubits[6],qubits[8];
-h qubits[2];
-h qubits[2];
-ccx qubits[1],qubits[8],qubits[2];
-h qubits[2];
-h qubits[2];
-cx qubits[6],qubits[1];
-cx qubits[1],qubits[2];
-h qubits[6];
-h qubits[6];
-ccx qubits[1],qubits[7],qubits[6];
-h qubits[6];
-h qubits[6];
-cx qubits[0],qubits[1];
-cx qubits[0],qubits[2];
-cx qubits[0],qubits[6];
-x qubits[3];
-x qubits[4];
-x qubits[5];
-h qubits[7];
-h qubits[7];
-ccx qubits[9],qubits[8],qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[9];
-h qubits[9];
-ccx qubits[10],qubits[7],qubits[9];
-h qubits[9];
-h qubits[9];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[0];
-h qubits[0];
-ccx qubits[10],qubits[5],qubits[0];
-h qubits[0];
-h qubits[0];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[9];
-h qubits[9];
-ccx qubits[10],qubits[7],qubits[9];
-h qubits[9];
-h qubits[9];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[7];
-h qubits[7];
-ccx qubits[9],qubits[8],qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[8];
-h qubits[8];
-ccx qubits[10],qubits[7],qubits[8];
-h qubits[8];
-h qubits[8];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[0];
-h qubits[0];
-ccx qubits[10],qubits[5],qubits[0];
-h qubits[0];
-h qubits[0];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[8];
-h qubits[8];
-ccx qubits[10],qubits[7],qubits[8];
-h qubits[8];
-h qubits[8];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-x qubits[5];
-x qubits[3];
-cx qubits[0],qubits[6];
-cx qubits[1],qubits[2];
-cx qubits[0],qubits[1];
-h qubits[6];
-h qubits[6];
-ccx qubits[1],qubits[7],qubits[6];
-h qubits[6];
-h qubits[6];
-cx qubits[6],qubits[1];
-h qubits[2];
-h qubits[2];
-ccx qubits[1],qubits[8],qubits[2];
-h qubits[2];
-h qubits[2];
-cx qubits[6],qubits[8];
-cx qubits[6],qubits[9];
-cx qubits[2],qubits[8];
-cx qubits[1],qubits[7];
-cx qubits[2],qubits[1];
-cx qubits[7],qubits[0];
-cx qubits[0],qubits[8];
-cx qubits[9],qubits[7];
-cx qubits[0],qubits[9];
-cx qubits[8],qubits[7];
-h qubits[7];
-h qubits[7];
-ccx qubits[1],qubits[9],qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[7];
-ccx qubits[2],qubits[9],qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[5];
-h qubits[5];
-ccx qubits[9],qubits[8],qubits[5];
-h qubits[5];
-h qubits[5];
-cx qubits[5],qubits[7];
-cx qubits[5],qubits[2];
-cx qubits[5],qubits[8];
-cx qubits[5],qubits[9];
-cx qubits[3],qubits[6];
-h qubits[3];
-h qubits[3];
-ccx qubits[9],qubits[1],qubits[3];
-h qubits[3];
-h qubits[3];
-cx qubits[3],qubits[6];
-h qubits[3];
-h qubits[3];
-ccx qubits[9],qubits[2],qubits[3];
-h qubits[3];
-h qubits[3];
-cx qubits[3],qubits[8];
-cx qubits[3],qubits[6];
-cx qubits[3],qubits[2];
-cx qubits[0],qubits[9];
-cx qubits[0],qubits[5];
-cx qubits[0],qubits[4];
-cx qubits[2],qubits[1];
-cx qubits[0],qubits[2];
-cx qubits[9],qubits[4];
-cx qubits[8],qubits[9];
-cx qubits[9],qubits[8];
-cx qubits[8],qubits[1];
-cx qubits[9],qubits[6];
-cx qubits[9],qubits[3];
-cx qubits[3],qubits[9];
-cx qubits[6],qubits[9];
-cx qubits[6],qubits[5];
-cx qubits[7],qubits[6];
-cx qubits[7],qubits[4];
-cx qubits[7],qubits[0];
-cx qubits[0],qubits[7];
-cx qubits[2],qubits[0];
-cx qubits[6],qubits[2];
-cx qubits[2],qubits[6];
-cx qubits[2],qubits[7];
-cx qubits[2],qubits[4];
-cx qubits[1],qubits[2];
-cx qubits[2],qubits[5];
-cx qubits[1],qubits[7];
-cx qubits[1],qubits[0];
-cx qubits[0],qubits[1];
-x qubits[0];
-x qubits[3];
-x qubits[7];
-cx qubits[2],qubits[0];
-cx qubits[2],qubits[9];
-cx qubits[6],qubits[0];
-cx qubits[6],qubits[1];
-cx qubits[6],qubits[5];
-cx qubits[7],qubits[9];
-cx qubits[9],qubits[7];
-cx qubits[0],qubits[9];
-cx qubits[7],qubits[0];
-cx qubits[7],qubits[2];
-cx qubits[9],qubits[1];
-cx qubits[9],qubits[8];
-cx qubits[3],qubits[8];
-cx qubits[8],qubits[2];
-cx qubits[8],qubits[3];
-cx qubits[8],qubits[4];
-h qubits[0];
-h qubits[0];
-ccx qubits[1],qubits[6],qubits[0];
-h qubits[0];
-h qubits[0];
-cx qubits[0],qubits[1];
-cx qubits[0],qubits[6];
-cx qubits[0],qubits[9];
-cx qubits[2],qubits[9];
-h qubits[2];
-h qubits[2];
-ccx qubits[1],qubits[7],qubits[2];
-h qubits[2];
-h qubits[2];
-cx qubits[1],qubits[7];
-cx qubits[2],qubits[9];
-cx qubits[1],qubits[8];
-h qubits[1];
-h qubits[1];
-ccx qubits[9],qubits[2],qubits[1];
-h qubits[1];
-h qubits[1];
-cx qubits[1],qubits[7];
-cx qubits[1],qubits[8];
-cx qubits[2],qubits[8];
-h qubits[2];
-h qubits[2];
-ccx qubits[9],qubits[1],qubits[2];
-h qubits[2];
-h qubits[2];
-cx qubits[8],qubits[7];
-cx qubits[2],qubits[8];
-h qubits[9];
-h qubits[9];
-ccx qubits[2],qubits[6],qubits[9];
-h qubits[9];
-h qubits[9];
-cx qubits[2],qubits[6];
-h qubits[2];
-h qubits[2];
-ccx qubits[8],qubits[9],qubits[2];
-h qubits[2];
-h qubits[2];
-cx qubits[6],qubits[8];
-cx qubits[2],qubits[6];
-cx qubits[2],qubits[7];
-cx qubits[9],qubits[7];
-cx qubits[2],qubits[1];
-h qubits[7];
-h qubits[7];
-ccx qubits[1],qubits[9],qubits[7];
-h qubits[7];
-h qubits[7];
-cx qubits[0],qubits[9];
-cx qubits[0],qubits[8];
-cx qubits[7],qubits[0];
-cx qubits[1],qubits[7];
-cx qubits[6],qubits[9];
-h qubits[2];
-h qubits[2];
-ccx qubits[1],qubits[8],qubits[2];
-h qubits[2];
-h qubits[2];
-cx qubits[6],qubits[1];
-cx qubits[1],qubits[2];
-h qubits[6];
-h qubits[6];
-ccx qubits[1],qubits[7],qubits[6];
-h qubits[6];
-h qubits[6];
-cx qubits[0],qubits[1];
-cx qubits[0],qubits[2];
-cx qubits[0],qubits[6];
-x qubits[3];
-h qubits[7];
-h qubits[7];
-ccx qubits[9],qubits[8],qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[9];
-h qubits[9];
-ccx qubits[10],qubits[7],qubits[9];
-h qubits[9];
-h qubits[9];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[0];
-h qubits[0];
-ccx qubits[10],qubits[5],qubits[0];
-h qubits[0];
-h qubits[0];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[9];
-h qubits[9];
-ccx qubits[10],qubits[7],qubits[9];
-h qubits[9];
-h qubits[9];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[7];
-h qubits[7];
-ccx qubits[9],qubits[8],qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[8];
-h qubits[8];
-ccx qubits[10],qubits[7],qubits[8];
-h qubits[8];
-h qubits[8];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[0];
-h qubits[0];
-ccx qubits[10],qubits[5],qubits[0];
-h qubits[0];
-h qubits[0];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[8];
-h qubits[8];
-ccx qubits[10],qubits[7],qubits[8];
-h qubits[8];
-h qubits[8];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-x qubits[4];
-x qubits[3];
-cx qubits[0],qubits[6];
-cx qubits[1],qubits[2];
-cx qubits[0],qubits[1];
-h qubits[6];
-h qubits[6];
-ccx qubits[1],qubits[7],qubits[6];
-h qubits[6];
-h qubits[6];
-cx qubits[6],qubits[1];
-h qubits[2];
-h qubits[2];
-ccx qubits[1],qubits[8],qubits[2];
-h qubits[2];
-h qubits[2];
-cx qubits[6],qubits[8];
-cx qubits[6],qubits[9];
-cx qubits[2],qubits[8];
-cx qubits[2],qubits[1];
-cx qubits[2],qubits[0];
-cx qubits[7],qubits[0];
-cx qubits[1],qubits[0];
-cx qubits[0],qubits[8];
-cx qubits[0],qubits[9];
-cx qubits[8],qubits[7];
-cx qubits[9],qubits[7];
-h qubits[7];
-h qubits[7];
-ccx qubits[1],qubits[9],qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[7];
-ccx qubits[2],qubits[9],qubits[7];
-h qubits[7];
-h qubits[7];
-cx qubits[2],qubits[6];
-h qubits[2];
-h qubits[2];
-ccx qubits[9],qubits[8],qubits[2];
-h qubits[2];
-h qubits[2];
-cx qubits[2],qubits[7];
-cx qubits[2],qubits[6];
-h qubits[9];
-h qubits[9];
-ccx qubits[2],qubits[6],qubits[9];
-h qubits[9];
-h qubits[9];
-cx qubits[2],qubits[8];
-h qubits[2];
-h qubits[2];
-ccx qubits[9],qubits[1],qubits[2];
-h qubits[2];
-h qubits[2];
-cx qubits[2],qubits[8];
-cx qubits[1],qubits[8];
-h qubits[1];
-h qubits[1];
-ccx qubits[9],qubits[2],qubits[1];
-h qubits[1];
-h qubits[1];
-cx qubits[1],qubits[8];
-cx qubits[1],qubits[7];
-cx qubits[2],qubits[9];
-h qubits[2];
-h qubits[2];
-ccx qubits[1],qubits[7],qubits[2];
-h qubits[2];
-h qubits[2];
-cx qubits[2],qubits[9];
-cx qubits[7],qubits[2];
-x qubits[7];
-cx qubits[0],qubits[9];
-cx qubits[0],qubits[6];
-cx qubits[0],qubits[1];
-h qubits[0];
-h qubits[0];
-ccx qubits[1],qubits[6],qubits[0];
-h qubits[0];
-h qubits[0];
-cx qubits[8],qubits[4];
-cx qubits[8],qubits[3];
-cx qubits[8],qubits[2];
-cx qubits[3],qubits[8];
-cx qubits[9],qubits[8];
-cx qubits[9],qubits[7];
-cx qubits[9],qubits[1];
-cx qubits[7],qubits[9];
-cx qubits[9],qubits[0];
-cx qubits[0],qubits[7];
-cx qubits[6],qubits[9];
-cx qubits[6],qubits[5];
-cx qubits[6],qubits[1];
-cx qubits[6],qubits[0];
-cx qubits[2],qubits[0];
-x qubits[2];
-x qubits[5];
-cx qubits[2],qubits[4];
-cx qubits[4],qubits[6];
-cx qubits[6],qubits[1];
-cx qubits[6],qubits[2];
-cx qubits[6],qubits[4];
-cx qubits[6],qubits[5];
-cx qubits[6],qubits[8];
-cx qubits[0],qubits[7];
-cx qubits[7],qubits[0];
-cx qubits[7],qubits[1];
-cx qubits[7],qubits[3];
-cx qubits[7],qubits[2];
-cx qubits[7],qubits[9];
-cx qubits[0],qubits[9];
-cx qubits[9],qubits[0];
-cx qubits[9],qubits[1];
-cx qubits[9],qubits[2];
-cx qubits[9],qubits[3];
-cx qubits[9],qubits[7];
-cx qubits[9],qubits[8];
-cx qubits[3],qubits[8];
-cx qubits[3],qubits[0];
-cx qubits[8],qubits[3];
-cx qubits[8],qubits[4];
-cx qubits[0],qubits[8];
-cx qubits[8],qubits[6];
-cx qubits[8],qubits[7];
-cx qubits[8],qubits[9];
-cx qubits[5],qubits[7];
-cx qubits[0],qubits[5];
-cx qubits[5],qubits[0];
-cx qubits[5],qubits[9];
-cx qubits[5],qubits[1];
-h qubits[5];
-h qubits[5];
-ccx qubits[9],qubits[2],qubits[5];
-h qubits[5];
-h qubits[5];
-cx qubits[0],qubits[2];
-cx qubits[0],qubits[4];
-cx qubits[0],qubits[5];
-cx qubits[0],qubits[6];
-h qubits[0];
-h qubits[0];
-ccx qubits[9],qubits[1],qubits[0];
-h qubits[0];
-h qubits[0];
-cx qubits[0],qubits[2];
-cx qubits[0],qubits[4];
-cx qubits[0],qubits[5];
-cx qubits[3],qubits[0];
-cx qubits[0],qubits[6];
-cx qubits[3],qubits[8];
-cx qubits[3],qubits[1];
-cx qubits[3],qubits[2];
-h qubits[3];
-h qubits[3];
-ccx qubits[9],qubits[8],qubits[3];
-h qubits[3];
-h qubits[3];
-cx qubits[2],qubits[1];
-h qubits[7];
-h qubits[7];
-ccx qubits[1],qubits[9],qubits[7];
-h qubits[7];
-h qubits[7];
-cx qubits[9],qubits[7];
-cx qubits[8],qubits[7];
-cx qubits[0],qubits[9];
-cx qubits[0],qubits[8];
-cx qubits[7],qubits[0];
-cx qubits[1],qubits[7];
-cx qubits[2],qubits[8];
-cx qubits[6],qubits[9];
-cx qubits[6],qubits[8];
-h qubits[2];
-h qubits[2];
-ccx qubits[1],qubits[8],qubits[2];
-h qubits[2];
-h qubits[2];
-cx qubits[6],qubits[1];
-cx qubits[1],qubits[2];
-h qubits[6];
-h qubits[6];
-ccx qubits[1],qubits[7],qubits[6];
-h qubits[6];
-h qubits[6];
-cx qubits[0],qubits[1];
-cx qubits[0],qubits[2];
-cx qubits[0],qubits[6];
-x qubits[3];
-x qubits[4];
-x qubits[5];
-h qubits[7];
-h qubits[7];
-ccx qubits[9],qubits[8],qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[9];
-h qubits[9];
-ccx qubits[10],qubits[7],qubits[9];
-h qubits[9];
-h qubits[9];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[0];
-h qubits[0];
-ccx qubits[10],qubits[5],qubits[0];
-h qubits[0];
-h qubits[0];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[9];
-h qubits[9];
-ccx qubits[10],qubits[7],qubits[9];
-h qubits[9];
-h qubits[9];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[7];
-h qubits[7];
-ccx qubits[9],qubits[8],qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[8];
-h qubits[8];
-ccx qubits[10],qubits[7],qubits[8];
-h qubits[8];
-h qubits[8];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[0];
-h qubits[0];
-ccx qubits[10],qubits[5],qubits[0];
-h qubits[0];
-h qubits[0];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[8];
-h qubits[8];
-ccx qubits[10],qubits[7],qubits[8];
-h qubits[8];
-h qubits[8];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-x qubits[5];
-x qubits[4];
-x qubits[3];
-cx qubits[0],qubits[6];
-cx qubits[1],qubits[2];
-cx qubits[0],qubits[1];
-h qubits[6];
-h qubits[6];
-ccx qubits[1],qubits[7],qubits[6];
-h qubits[6];
-h qubits[6];
-cx qubits[6],qubits[1];
-h qubits[2];
-h qubits[2];
-ccx qubits[1],qubits[8],qubits[2];
-h qubits[2];
-h qubits[2];
-cx qubits[6],qubits[8];
-cx qubits[6],qubits[9];
-cx qubits[2],qubits[8];
-cx qubits[1],qubits[7];
-cx qubits[2],qubits[1];
-cx qubits[7],qubits[0];
-cx qubits[0],qubits[8];
-cx qubits[0],qubits[9];
-cx qubits[8],qubits[7];
-cx qubits[9],qubits[7];
-h qubits[7];
-h qubits[7];
-ccx qubits[1],qubits[9],qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[7];
-ccx qubits[2],qubits[9],qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[3];
-h qubits[3];
-ccx qubits[9],qubits[8],qubits[3];
-h qubits[3];
-h qubits[3];
-cx qubits[3],qubits[6];
-cx qubits[3],qubits[2];
-cx qubits[3],qubits[1];
-cx qubits[3],qubits[0];
-cx qubits[3],qubits[8];
-cx qubits[0],qubits[6];
-cx qubits[0],qubits[5];
-cx qubits[0],qubits[4];
-cx qubits[0],qubits[2];
-h qubits[0];
-h qubits[0];
-ccx qubits[9],qubits[1],qubits[0];
-h qubits[0];
-h qubits[0];
-cx qubits[0],qubits[6];
-cx qubits[0],qubits[5];
-cx qubits[0],qubits[4];
-cx qubits[0],qubits[2];
-h qubits[5];
-h qubits[5];
-ccx qubits[9],qubits[2],qubits[5];
-h qubits[5];
-h qubits[5];
-cx qubits[5],qubits[7];
-cx qubits[5],qubits[1];
-cx qubits[5],qubits[0];
-cx qubits[5],qubits[9];
-cx qubits[0],qubits[7];
-cx qubits[0],qubits[5];
-cx qubits[0],qubits[4];
-cx qubits[8],qubits[3];
-cx qubits[0],qubits[3];
-cx qubits[3],qubits[0];
-cx qubits[9],qubits[7];
-cx qubits[8],qubits[9];
-cx qubits[6],qubits[4];
-cx qubits[8],qubits[6];
-cx qubits[6],qubits[8];
-cx qubits[9],qubits[0];
-cx qubits[0],qubits[8];
-cx qubits[9],qubits[3];
-cx qubits[9],qubits[2];
-cx qubits[9],qubits[1];
-cx qubits[7],qubits[0];
-cx qubits[0],qubits[9];
-cx qubits[7],qubits[3];
-cx qubits[7],qubits[2];
-cx qubits[7],qubits[1];
-cx qubits[0],qubits[7];
-cx qubits[6],qubits[5];
-cx qubits[6],qubits[2];
-cx qubits[6],qubits[1];
-cx qubits[4],qubits[6];
-cx qubits[2],qubits[9];
-cx qubits[2],qubits[4];
-x qubits[3];
-x qubits[0];
-x qubits[1];
-x qubits[4];
-cx qubits[0],qubits[2];
-cx qubits[2],qubits[0];
-cx qubits[2],qubits[1];
-cx qubits[2],qubits[5];
-cx qubits[2],qubits[6];
-cx qubits[2],qubits[9];
-cx qubits[0],qubits[6];
-cx qubits[6],qubits[0];
-cx qubits[6],qubits[1];
-cx qubits[6],qubits[2];
-cx qubits[6],qubits[3];
-cx qubits[7],qubits[4];
-cx qubits[7],qubits[8];
-cx qubits[6],qubits[7];
-cx qubits[6],qubits[9];
-cx qubits[7],qubits[0];
-cx qubits[7],qubits[3];
-cx qubits[9],qubits[7];
-cx qubits[7],qubits[5];
-cx qubits[7],qubits[6];
-cx qubits[9],qubits[0];
-cx qubits[9],qubits[1];
-cx qubits[9],qubits[8];
-cx qubits[8],qubits[3];
-cx qubits[8],qubits[6];
-cx qubits[9],qubits[7];
-cx qubits[8],qubits[9];
-cx qubits[3],qubits[0];
-cx qubits[0],qubits[2];
-cx qubits[0],qubits[4];
-cx qubits[0],qubits[5];
-cx qubits[0],qubits[6];
-cx qubits[0],qubits[9];
-cx qubits[0],qubits[1];
-cx qubits[0],qubits[8];
-h qubits[0];
-h qubits[0];
-ccx qubits[9],qubits[2],qubits[0];
-h qubits[0];
-h qubits[0];
-cx qubits[0],qubits[1];
-cx qubits[0],qubits[3];
-cx qubits[0],qubits[8];
-cx qubits[4],qubits[1];
-cx qubits[4],qubits[2];
-cx qubits[4],qubits[8];
-h qubits[4];
-h qubits[4];
-ccx qubits[9],qubits[1],qubits[4];
-h qubits[4];
-h qubits[4];
-cx qubits[1],qubits[5];
-cx qubits[8],qubits[7];
-h qubits[7];
-h qubits[7];
-ccx qubits[1],qubits[9],qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[1];
-h qubits[1];
-ccx qubits[8],qubits[9],qubits[1];
-h qubits[1];
-h qubits[1];
-cx qubits[1],qubits[5];
-h qubits[7];
-h qubits[7];
-ccx qubits[2],qubits[9],qubits[7];
-h qubits[7];
-h qubits[7];
-cx qubits[0],qubits[9];
-cx qubits[0],qubits[8];
-cx qubits[7],qubits[0];
-cx qubits[2],qubits[1];
-cx qubits[1],qubits[7];
-cx qubits[2],qubits[8];
-cx qubits[6],qubits[9];
-cx qubits[6],qubits[8];
-h qubits[2];
-h qubits[2];
-ccx qubits[1],qubits[8],qubits[2];
-h qubits[2];
-h qubits[2];
-cx qubits[6],qubits[1];
-cx qubits[1],qubits[2];
-h qubits[6];
-h qubits[6];
-ccx qubits[1],qubits[7],qubits[6];
-h qubits[6];
-h qubits[6];
-cx qubits[0],qubits[1];
-cx qubits[0],qubits[2];
-cx qubits[0],qubits[6];
-x qubits[3];
-x qubits[4];
-x qubits[5];
-h qubits[7];
-h qubits[7];
-ccx qubits[9],qubits[8],qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[9];
-h qubits[9];
-ccx qubits[10],qubits[7],qubits[9];
-h qubits[9];
-h qubits[9];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[0];
-h qubits[0];
-ccx qubits[10],qubits[5],qubits[0];
-h qubits[0];
-h qubits[0];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[9];
-h qubits[9];
-ccx qubits[10],qubits[7],qubits[9];
-h qubits[9];
-h qubits[9];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[7];
-h qubits[7];
-ccx qubits[9],qubits[8],qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[8];
-h qubits[8];
-ccx qubits[10],qubits[7],qubits[8];
-h qubits[8];
-h qubits[8];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[0];
-h qubits[0];
-ccx qubits[10],qubits[5],qubits[0];
-h qubits[0];
-h qubits[0];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[8];
-h qubits[8];
-ccx qubits[10],qubits[7],qubits[8];
-h qubits[8];
-h qubits[8];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-x qubits[4];
-x qubits[3];
-cx qubits[0],qubits[6];
-cx qubits[1],qubits[2];
-cx qubits[0],qubits[1];
-h qubits[6];
-h qubits[6];
-ccx qubits[1],qubits[7],qubits[6];
-h qubits[6];
-h qubits[6];
-cx qubits[6],qubits[1];
-h qubits[2];
-h qubits[2];
-ccx qubits[1],qubits[8],qubits[2];
-h qubits[2];
-h qubits[2];
-cx qubits[6],qubits[8];
-cx qubits[6],qubits[9];
-cx qubits[2],qubits[8];
-cx qubits[1],qubits[7];
-cx qubits[2],qubits[1];
-cx qubits[7],qubits[0];
-cx qubits[0],qubits[8];
-cx qubits[0],qubits[9];
-cx qubits[8],qubits[7];
-h qubits[7];
-h qubits[7];
-ccx qubits[1],qubits[9],qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[7];
-ccx qubits[2],qubits[9],qubits[7];
-h qubits[7];
-h qubits[7];
-cx qubits[7],qubits[5];
-cx qubits[1],qubits[7];
-h qubits[1];
-h qubits[1];
-ccx qubits[9],qubits[8],qubits[1];
-h qubits[1];
-h qubits[1];
-cx qubits[1],qubits[7];
-h qubits[4];
-h qubits[4];
-ccx qubits[9],qubits[1],qubits[4];
-h qubits[4];
-h qubits[4];
-cx qubits[4],qubits[8];
-cx qubits[4],qubits[2];
-cx qubits[4],qubits[1];
-cx qubits[0],qubits[8];
-cx qubits[0],qubits[3];
-cx qubits[0],qubits[1];
-h qubits[0];
-h qubits[0];
-ccx qubits[9],qubits[2],qubits[0];
-h qubits[0];
-h qubits[0];
-cx qubits[0],qubits[8];
-cx qubits[0],qubits[1];
-cx qubits[9],qubits[6];
-cx qubits[0],qubits[9];
-cx qubits[0],qubits[5];
-cx qubits[0],qubits[4];
-cx qubits[0],qubits[2];
-cx qubits[3],qubits[0];
-cx qubits[8],qubits[9];
-cx qubits[8],qubits[3];
-cx qubits[9],qubits[8];
-cx qubits[9],qubits[5];
-cx qubits[9],qubits[1];
-cx qubits[9],qubits[0];
-cx qubits[6],qubits[8];
-cx qubits[7],qubits[6];
-cx qubits[6],qubits[7];
-cx qubits[7],qubits[4];
-cx qubits[7],qubits[3];
-cx qubits[7],qubits[0];
-cx qubits[2],qubits[9];
-cx qubits[2],qubits[1];
-cx qubits[6],qubits[2];
-cx qubits[2],qubits[0];
-cx qubits[0],qubits[6];
-cx qubits[2],qubits[5];
-cx qubits[0],qubits[2];
-cx qubits[2],qubits[3];
-x qubits[2];
-cx qubits[2],qubits[0];
-cx qubits[2],qubits[1];
-cx qubits[9],qubits[4];
-cx qubits[6],qubits[9];
-cx qubits[2],qubits[6];
-cx qubits[9],qubits[2];
-cx qubits[6],qubits[5];
-cx qubits[6],qubits[7];
-cx qubits[7],qubits[8];
-cx qubits[8],qubits[7];
-cx qubits[0],qubits[7];
-cx qubits[7],qubits[0];
-cx qubits[3],qubits[1];
-cx qubits[9],qubits[3];
-cx qubits[9],qubits[5];
-cx qubits[3],qubits[9];
-cx qubits[9],qubits[6];
-cx qubits[8],qubits[1];
-cx qubits[8],qubits[5];
-cx qubits[8],qubits[6];
-cx qubits[3],qubits[2];
-cx qubits[3],qubits[0];
-cx qubits[0],qubits[3];
-cx qubits[3],qubits[0];
-cx qubits[4],qubits[5];
-cx qubits[4],qubits[8];
-cx qubits[3],qubits[4];
-h qubits[3];
-h qubits[3];
-ccx qubits[9],qubits[2],qubits[3];
-h qubits[3];
-h qubits[3];
-cx qubits[0],qubits[3];
-cx qubits[0],qubits[5];
-cx qubits[0],qubits[6];
-cx qubits[9],qubits[7];
-h qubits[0];
-h qubits[0];
-ccx qubits[1],qubits[9],qubits[0];
-h qubits[0];
-h qubits[0];
-cx qubits[0],qubits[3];
-cx qubits[0],qubits[5];
-cx qubits[0],qubits[6];
-cx qubits[4],qubits[2];
-h qubits[4];
-h qubits[4];
-ccx qubits[9],qubits[8],qubits[4];
-h qubits[4];
-h qubits[4];
-h qubits[7];
-h qubits[7];
-ccx qubits[2],qubits[9],qubits[7];
-h qubits[7];
-h qubits[7];
-cx qubits[0],qubits[9];
-cx qubits[0],qubits[8];
-cx qubits[7],qubits[0];
-cx qubits[2],qubits[1];
-cx qubits[1],qubits[7];
-cx qubits[2],qubits[8];
-cx qubits[6],qubits[9];
-cx qubits[6],qubits[8];
-h qubits[2];
-h qubits[2];
-ccx qubits[1],qubits[8],qubits[2];
-h qubits[2];
-h qubits[2];
-cx qubits[6],qubits[1];
-cx qubits[1],qubits[2];
-h qubits[6];
-h qubits[6];
-ccx qubits[1],qubits[7],qubits[6];
-h qubits[6];
-h qubits[6];
-cx qubits[0],qubits[1];
-cx qubits[0],qubits[2];
-cx qubits[0],qubits[6];
-x qubits[3];
-x qubits[4];
-h qubits[7];
-h qubits[7];
-ccx qubits[9],qubits[8],qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[9];
-h qubits[9];
-ccx qubits[10],qubits[7],qubits[9];
-h qubits[9];
-h qubits[9];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[0];
-h qubits[0];
-ccx qubits[10],qubits[5],qubits[0];
-h qubits[0];
-h qubits[0];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[9];
-h qubits[9];
-ccx qubits[10],qubits[7],qubits[9];
-h qubits[9];
-h qubits[9];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[7];
-h qubits[7];
-ccx qubits[9],qubits[8],qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[8];
-h qubits[8];
-ccx qubits[10],qubits[7],qubits[8];
-h qubits[8];
-h qubits[8];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[0];
-h qubits[0];
-ccx qubits[10],qubits[5],qubits[0];
-h qubits[0];
-h qubits[0];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[8];
-h qubits[8];
-ccx qubits[10],qubits[7],qubits[8];
-h qubits[8];
-h qubits[8];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-x qubits[4];
-x qubits[3];
-cx qubits[0],qubits[6];
-cx qubits[1],qubits[2];
-cx qubits[0],qubits[1];
-h qubits[6];
-h qubits[6];
-ccx qubits[1],qubits[7],qubits[6];
-h qubits[6];
-h qubits[6];
-cx qubits[6],qubits[1];
-h qubits[2];
-h qubits[2];
-ccx qubits[1],qubits[8],qubits[2];
-h qubits[2];
-h qubits[2];
-cx qubits[6],qubits[8];
-cx qubits[6],qubits[9];
-cx qubits[2],qubits[8];
-cx qubits[1],qubits[7];
-cx qubits[2],qubits[1];
-cx qubits[7],qubits[0];
-cx qubits[8],qubits[7];
-cx qubits[0],qubits[8];
-cx qubits[0],qubits[9];
-cx qubits[9],qubits[7];
-h qubits[7];
-h qubits[7];
-ccx qubits[1],qubits[9],qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[7];
-ccx qubits[2],qubits[9],qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[4];
-h qubits[4];
-ccx qubits[9],qubits[8],qubits[4];
-h qubits[4];
-h qubits[4];
-cx qubits[4],qubits[7];
-cx qubits[4],qubits[5];
-cx qubits[4],qubits[2];
-cx qubits[4],qubits[8];
-cx qubits[0],qubits[6];
-cx qubits[0],qubits[5];
-cx qubits[0],qubits[3];
-h qubits[0];
-h qubits[0];
-ccx qubits[9],qubits[1],qubits[0];
-h qubits[0];
-h qubits[0];
-cx qubits[0],qubits[7];
-cx qubits[0],qubits[6];
-cx qubits[0],qubits[5];
-cx qubits[0],qubits[3];
-h qubits[3];
-h qubits[3];
-ccx qubits[9],qubits[2],qubits[3];
-h qubits[3];
-h qubits[3];
-cx qubits[3],qubits[8];
-cx qubits[3],qubits[7];
-cx qubits[3],qubits[6];
-cx qubits[3],qubits[5];
-cx qubits[3],qubits[4];
-cx qubits[2],qubits[1];
-cx qubits[0],qubits[2];
-x qubits[1];
-cx qubits[0],qubits[9];
-cx qubits[3],qubits[0];
-cx qubits[0],qubits[3];
-cx qubits[0],qubits[6];
-cx qubits[3],qubits[0];
-cx qubits[6],qubits[5];
-cx qubits[8],qubits[6];
-x qubits[5];
-cx qubits[8],qubits[1];
-cx qubits[8],qubits[0];
-cx qubits[0],qubits[8];
-cx qubits[6],qubits[4];
-cx qubits[6],qubits[3];
-cx qubits[2],qubits[6];
-cx qubits[9],qubits[2];
-cx qubits[7],qubits[9];
-cx qubits[6],qubits[7];
-cx qubits[7],qubits[0];
-cx qubits[2],qubits[0];
-cx qubits[2],qubits[4];
-x qubits[2];
-cx qubits[4],qubits[2];
-cx qubits[2],qubits[1];
-cx qubits[7],qubits[4];
-cx qubits[7],qubits[8];
-cx qubits[2],qubits[7];
-cx qubits[9],qubits[2];
-cx qubits[6],qubits[2];
-cx qubits[6],qubits[4];
-cx qubits[7],qubits[0];
-cx qubits[7],qubits[1];
-cx qubits[5],qubits[6];
-cx qubits[7],qubits[5];
-cx qubits[7],qubits[3];
-cx qubits[9],qubits[3];
-cx qubits[8],qubits[9];
-cx qubits[9],qubits[4];
-cx qubits[8],qubits[0];
-cx qubits[8],qubits[2];
-cx qubits[3],qubits[0];
-cx qubits[0],qubits[3];
-cx qubits[0],qubits[7];
-cx qubits[0],qubits[8];
-cx qubits[5],qubits[9];
-cx qubits[5],qubits[1];
-cx qubits[5],qubits[8];
-h qubits[5];
-h qubits[5];
-ccx qubits[9],qubits[2],qubits[5];
-h qubits[5];
-h qubits[5];
-cx qubits[4],qubits[9];
-cx qubits[4],qubits[1];
-cx qubits[4],qubits[5];
-cx qubits[4],qubits[6];
-cx qubits[4],qubits[7];
-h qubits[4];
-h qubits[4];
-ccx qubits[9],qubits[1],qubits[4];
-h qubits[4];
-h qubits[4];
-cx qubits[0],qubits[4];
-cx qubits[0],qubits[5];
-cx qubits[0],qubits[6];
-h qubits[0];
-h qubits[0];
-ccx qubits[9],qubits[8],qubits[0];
-h qubits[0];
-h qubits[0];
-cx qubits[0],qubits[4];
-cx qubits[0],qubits[5];
-cx qubits[0],qubits[6];
-cx qubits[2],qubits[1];
-h qubits[7];
-h qubits[7];
-ccx qubits[1],qubits[9],qubits[7];
-h qubits[7];
-h qubits[7];
-cx qubits[9],qubits[7];
-cx qubits[8],qubits[7];
-cx qubits[0],qubits[9];
-cx qubits[0],qubits[8];
-cx qubits[7],qubits[0];
-cx qubits[1],qubits[7];
-cx qubits[2],qubits[8];
-cx qubits[6],qubits[9];
-cx qubits[6],qubits[8];
-h qubits[2];
-h qubits[2];
-ccx qubits[1],qubits[8],qubits[2];
-h qubits[2];
-h qubits[2];
-cx qubits[6],qubits[1];
-cx qubits[1],qubits[2];
-h qubits[6];
-h qubits[6];
-ccx qubits[1],qubits[7],qubits[6];
-h qubits[6];
-h qubits[6];
-cx qubits[0],qubits[1];
-cx qubits[0],qubits[2];
-cx qubits[0],qubits[6];
-x qubits[3];
-x qubits[4];
-x qubits[5];
-h qubits[7];
-h qubits[7];
-ccx qubits[9],qubits[8],qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[9];
-h qubits[9];
-ccx qubits[10],qubits[7],qubits[9];
-h qubits[9];
-h qubits[9];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[0];
-h qubits[0];
-ccx qubits[10],qubits[5],qubits[0];
-h qubits[0];
-h qubits[0];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[9];
-h qubits[9];
-ccx qubits[10],qubits[7],qubits[9];
-h qubits[9];
-h qubits[9];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[7];
-h qubits[7];
-ccx qubits[9],qubits[8],qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[8];
-h qubits[8];
-ccx qubits[10],qubits[7],qubits[8];
-h qubits[8];
-h qubits[8];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[0];
-h qubits[0];
-ccx qubits[10],qubits[5],qubits[0];
-h qubits[0];
-h qubits[0];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[8];
-h qubits[8];
-ccx qubits[10],qubits[7],qubits[8];
-h qubits[8];
-h qubits[8];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-x qubits[5];
-x qubits[4];
-x qubits[3];
-cx qubits[0],qubits[6];
-cx qubits[1],qubits[2];
-cx qubits[0],qubits[1];
-h qubits[6];
-h qubits[6];
-ccx qubits[1],qubits[7],qubits[6];
-h qubits[6];
-h qubits[6];
-cx qubits[6],qubits[1];
-h qubits[2];
-h qubits[2];
-ccx qubits[1],qubits[8],qubits[2];
-h qubits[2];
-h qubits[2];
-cx qubits[6],qubits[8];
-cx qubits[6],qubits[9];
-cx qubits[2],qubits[8];
-cx qubits[1],qubits[7];
-cx qubits[2],qubits[1];
-cx qubits[7],qubits[0];
-cx qubits[0],qubits[8];
-cx qubits[0],qubits[9];
-cx qubits[8],qubits[7];
-cx qubits[9],qubits[7];
-h qubits[7];
-h qubits[7];
-ccx qubits[1],qubits[9],qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[7];
-ccx qubits[2],qubits[9],qubits[7];
-h qubits[7];
-h qubits[7];
-cx qubits[0],qubits[6];
-cx qubits[0],qubits[5];
-cx qubits[0],qubits[4];
-h qubits[0];
-h qubits[0];
-ccx qubits[9],qubits[8],qubits[0];
-h qubits[0];
-h qubits[0];
-cx qubits[0],qubits[6];
-cx qubits[0],qubits[5];
-cx qubits[0],qubits[4];
-h qubits[4];
-h qubits[4];
-ccx qubits[9],qubits[1],qubits[4];
-h qubits[4];
-h qubits[4];
-cx qubits[4],qubits[7];
-cx qubits[4],qubits[6];
-cx qubits[4],qubits[5];
-cx qubits[4],qubits[1];
-cx qubits[4],qubits[9];
-h qubits[5];
-h qubits[5];
-ccx qubits[9],qubits[2],qubits[5];
-h qubits[5];
-h qubits[5];
-cx qubits[5],qubits[8];
-cx qubits[5],qubits[6];
-cx qubits[5],qubits[1];
-cx qubits[5],qubits[9];
-cx qubits[0],qubits[8];
-cx qubits[7],qubits[3];
-cx qubits[0],qubits[7];
-cx qubits[3],qubits[0];
-cx qubits[9],qubits[4];
-cx qubits[9],qubits[2];
-cx qubits[8],qubits[9];
-cx qubits[8],qubits[0];
-cx qubits[9],qubits[3];
-cx qubits[7],qubits[9];
-cx qubits[7],qubits[8];
-cx qubits[7],qubits[6];
-cx qubits[7],qubits[5];
-cx qubits[7],qubits[4];
-cx qubits[7],qubits[1];
-x qubits[7];
-cx qubits[6],qubits[0];
-cx qubits[6],qubits[4];
-x qubits[0];
-cx qubits[6],qubits[3];
-cx qubits[6],qubits[2];
-cx qubits[2],qubits[9];
-cx qubits[2],qubits[8];
-cx qubits[2],qubits[7];
-cx qubits[2],qubits[4];
-cx qubits[2],qubits[1];
-cx qubits[4],qubits[2];
-x qubits[5];
-x qubits[6];
-cx qubits[2],qubits[4];
-cx qubits[2],qubits[5];
-cx qubits[2],qubits[6];
-cx qubits[2],qubits[7];
-cx qubits[2],qubits[8];
-cx qubits[2],qubits[9];
-cx qubits[6],qubits[8];
-cx qubits[6],qubits[9];
-cx qubits[3],qubits[4];
-cx qubits[0],qubits[3];
-cx qubits[3],qubits[4];
-cx qubits[7],qubits[0];
-cx qubits[9],qubits[0];
-cx qubits[8],qubits[9];
-cx qubits[9],qubits[5];
-cx qubits[0],qubits[9];
-cx qubits[9],qubits[6];
-cx qubits[8],qubits[3];
-cx qubits[8],qubits[4];
-cx qubits[5],qubits[8];
-cx qubits[0],qubits[1];
-h qubits[0];
-h qubits[0];
-ccx qubits[9],qubits[2],qubits[0];
-h qubits[0];
-h qubits[0];
-cx qubits[0],qubits[1];
-cx qubits[0],qubits[5];
-cx qubits[3],qubits[1];
-cx qubits[3],qubits[0];
-cx qubits[3],qubits[2];
-cx qubits[3],qubits[6];
-cx qubits[3],qubits[7];
-h qubits[3];
-h qubits[3];
-ccx qubits[9],qubits[1],qubits[3];
-h qubits[3];
-h qubits[3];
-cx qubits[5],qubits[1];
-cx qubits[5],qubits[6];
-h qubits[5];
-h qubits[5];
-ccx qubits[9],qubits[8],qubits[5];
-h qubits[5];
-h qubits[5];
-cx qubits[2],qubits[1];
-h qubits[7];
-h qubits[7];
-ccx qubits[1],qubits[9],qubits[7];
-h qubits[7];
-h qubits[7];
-cx qubits[9],qubits[7];
-cx qubits[0],qubits[9];
-cx qubits[0],qubits[8];
-cx qubits[7],qubits[0];
-cx qubits[1],qubits[7];
-cx qubits[2],qubits[8];
-cx qubits[6],qubits[9];
-cx qubits[6],qubits[8];
-h qubits[2];
-h qubits[2];
-ccx qubits[1],qubits[8],qubits[2];
-h qubits[2];
-h qubits[2];
-cx qubits[6],qubits[1];
-cx qubits[1],qubits[2];
-h qubits[6];
-h qubits[6];
-ccx qubits[1],qubits[7],qubits[6];
-h qubits[6];
-h qubits[6];
-cx qubits[0],qubits[1];
-cx qubits[0],qubits[2];
-cx qubits[0],qubits[6];
-x qubits[3];
-x qubits[5];
-h qubits[7];
-h qubits[7];
-ccx qubits[9],qubits[8],qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[9];
-h qubits[9];
-ccx qubits[10],qubits[7],qubits[9];
-h qubits[9];
-h qubits[9];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[0];
-h qubits[0];
-ccx qubits[10],qubits[5],qubits[0];
-h qubits[0];
-h qubits[0];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[9];
-h qubits[9];
-ccx qubits[10],qubits[7],qubits[9];
-h qubits[9];
-h qubits[9];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[7];
-h qubits[7];
-ccx qubits[9],qubits[8],qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[8];
-h qubits[8];
-ccx qubits[10],qubits[7],qubits[8];
-h qubits[8];
-h qubits[8];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[0];
-h qubits[0];
-ccx qubits[10],qubits[5],qubits[0];
-h qubits[0];
-h qubits[0];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[8];
-h qubits[8];
-ccx qubits[10],qubits[7],qubits[8];
-h qubits[8];
-h qubits[8];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-x qubits[5];
-x qubits[3];
-cx qubits[0],qubits[6];
-cx qubits[1],qubits[2];
-cx qubits[0],qubits[1];
-h qubits[6];
-h qubits[6];
-ccx qubits[1],qubits[7],qubits[6];
-h qubits[6];
-h qubits[6];
-cx qubits[6],qubits[1];
-h qubits[2];
-h qubits[2];
-ccx qubits[1],qubits[8],qubits[2];
-h qubits[2];
-h qubits[2];
-cx qubits[6],qubits[8];
-cx qubits[6],qubits[9];
-cx qubits[2],qubits[8];
-cx qubits[1],qubits[7];
-cx qubits[2],qubits[1];
-cx qubits[7],qubits[0];
-cx qubits[0],qubits[8];
-cx qubits[0],qubits[9];
-cx qubits[8],qubits[7];
-cx qubits[9],qubits[7];
-h qubits[7];
-h qubits[7];
-ccx qubits[1],qubits[9],qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[7];
-ccx qubits[2],qubits[9],qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[5];
-h qubits[5];
-ccx qubits[9],qubits[8],qubits[5];
-h qubits[5];
-h qubits[5];
-cx qubits[5],qubits[7];
-cx qubits[5],qubits[6];
-cx qubits[5],qubits[1];
-cx qubits[5],qubits[8];
-h qubits[3];
-h qubits[3];
-ccx qubits[9],qubits[1],qubits[3];
-h qubits[3];
-h qubits[3];
-cx qubits[3],qubits[7];
-cx qubits[3],qubits[6];
-cx qubits[3],qubits[2];
-cx qubits[0],qubits[1];
-cx qubits[3],qubits[0];
-cx qubits[8],qubits[7];
-cx qubits[8],qubits[5];
-cx qubits[0],qubits[8];
-h qubits[0];
-h qubits[0];
-ccx qubits[9],qubits[2],qubits[0];
-h qubits[0];
-h qubits[0];
-cx qubits[0],qubits[1];
-cx qubits[9],qubits[6];
-cx qubits[9],qubits[4];
-cx qubits[9],qubits[3];
-cx qubits[0],qubits[9];
-x qubits[3];
-cx qubits[8],qubits[9];
-cx qubits[9],qubits[5];
-cx qubits[9],qubits[0];
-cx qubits[7],qubits[4];
-cx qubits[7],qubits[3];
-cx qubits[7],qubits[0];
-cx qubits[0],qubits[7];
-cx qubits[6],qubits[9];
-cx qubits[2],qubits[8];
-cx qubits[2],qubits[6];
-cx qubits[2],qubits[5];
-cx qubits[2],qubits[4];
-cx qubits[2],qubits[3];
-cx qubits[6],qubits[0];
-cx qubits[6],qubits[3];
-cx qubits[6],qubits[4];
-cx qubits[7],qubits[0];
-cx qubits[7],qubits[8];
-cx qubits[7],qubits[9];
-cx qubits[9],qubits[8];
-cx qubits[9],qubits[7];
-cx qubits[7],qubits[2];
-cx qubits[9],qubits[1];
-cx qubits[9],qubits[3];
-cx qubits[9],qubits[4];
-cx qubits[9],qubits[5];
-cx qubits[9],qubits[6];
-cx qubits[0],qubits[8];
-cx qubits[8],qubits[0];
-cx qubits[8],qubits[2];
-cx qubits[8],qubits[4];
-cx qubits[5],qubits[7];
-cx qubits[3],qubits[5];
-cx qubits[8],qubits[5];
-cx qubits[8],qubits[7];
-cx qubits[3],qubits[8];
-cx qubits[0],qubits[3];
-cx qubits[3],qubits[0];
-cx qubits[3],qubits[2];
-cx qubits[3],qubits[6];
-cx qubits[3],qubits[7];
-h qubits[3];
-h qubits[3];
-ccx qubits[9],qubits[2],qubits[3];
-h qubits[3];
-h qubits[3];
-cx qubits[3],qubits[9];
-cx qubits[3],qubits[1];
-cx qubits[3],qubits[0];
-cx qubits[5],qubits[2];
-cx qubits[3],qubits[5];
-h qubits[3];
-h qubits[3];
-ccx qubits[9],qubits[1],qubits[3];
-h qubits[3];
-h qubits[3];
-cx qubits[5],qubits[9];
-cx qubits[5],qubits[1];
-cx qubits[5],qubits[6];
-h qubits[5];
-h qubits[5];
-ccx qubits[9],qubits[8],qubits[5];
-h qubits[5];
-h qubits[5];
-cx qubits[2],qubits[1];
-h qubits[7];
-h qubits[7];
-ccx qubits[1],qubits[9],qubits[7];
-h qubits[7];
-h qubits[7];
-cx qubits[9],qubits[7];
-cx qubits[0],qubits[9];
-cx qubits[0],qubits[8];
-cx qubits[7],qubits[0];
-cx qubits[1],qubits[7];
-cx qubits[2],qubits[8];
-cx qubits[6],qubits[9];
-cx qubits[6],qubits[8];
-h qubits[2];
-h qubits[2];
-ccx qubits[1],qubits[8],qubits[2];
-h qubits[2];
-h qubits[2];
-cx qubits[6],qubits[1];
-cx qubits[1],qubits[2];
-h qubits[6];
-h qubits[6];
-ccx qubits[1],qubits[7],qubits[6];
-h qubits[6];
-h qubits[6];
-cx qubits[0],qubits[1];
-cx qubits[0],qubits[2];
-cx qubits[0],qubits[6];
-x qubits[3];
-x qubits[4];
-x qubits[5];
-h qubits[7];
-h qubits[7];
-ccx qubits[9],qubits[8],qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[9];
-h qubits[9];
-ccx qubits[10],qubits[7],qubits[9];
-h qubits[9];
-h qubits[9];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[0];
-h qubits[0];
-ccx qubits[10],qubits[5],qubits[0];
-h qubits[0];
-h qubits[0];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[9];
-h qubits[9];
-ccx qubits[10],qubits[7],qubits[9];
-h qubits[9];
-h qubits[9];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[7];
-h qubits[7];
-ccx qubits[9],qubits[8],qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[8];
-h qubits[8];
-ccx qubits[10],qubits[7],qubits[8];
-h qubits[8];
-h qubits[8];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[0];
-h qubits[0];
-ccx qubits[10],qubits[5],qubits[0];
-h qubits[0];
-h qubits[0];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[8];
-h qubits[8];
-ccx qubits[10],qubits[7],qubits[8];
-h qubits[8];
-h qubits[8];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-x qubits[5];
-x qubits[3];
-cx qubits[0],qubits[6];
-cx qubits[1],qubits[2];
-cx qubits[0],qubits[1];
-h qubits[6];
-h qubits[6];
-ccx qubits[1],qubits[7],qubits[6];
-h qubits[6];
-h qubits[6];
-cx qubits[6],qubits[1];
-h qubits[2];
-h qubits[2];
-ccx qubits[1],qubits[8],qubits[2];
-h qubits[2];
-h qubits[2];
-cx qubits[6],qubits[8];
-cx qubits[6],qubits[9];
-cx qubits[2],qubits[8];
-cx qubits[1],qubits[7];
-cx qubits[2],qubits[1];
-cx qubits[7],qubits[0];
-cx qubits[0],qubits[8];
-cx qubits[0],qubits[9];
-cx qubits[8],qubits[7];
-cx qubits[9],qubits[7];
-h qubits[7];
-h qubits[7];
-ccx qubits[1],qubits[9],qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[7];
-ccx qubits[2],qubits[9],qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[5];
-h qubits[5];
-ccx qubits[9],qubits[8],qubits[5];
-h qubits[5];
-h qubits[5];
-cx qubits[5],qubits[7];
-cx qubits[5],qubits[6];
-cx qubits[5],qubits[2];
-cx qubits[5],qubits[1];
-cx qubits[5],qubits[9];
-h qubits[3];
-h qubits[3];
-ccx qubits[9],qubits[1],qubits[3];
-h qubits[3];
-h qubits[3];
-cx qubits[3],qubits[7];
-cx qubits[3],qubits[5];
-cx qubits[3],qubits[2];
-cx qubits[3],qubits[0];
-cx qubits[3],qubits[1];
-cx qubits[3],qubits[9];
-h qubits[3];
-h qubits[3];
-ccx qubits[9],qubits[2],qubits[3];
-h qubits[3];
-h qubits[3];
-cx qubits[3],qubits[8];
-cx qubits[3],qubits[7];
-cx qubits[3],qubits[6];
-cx qubits[0],qubits[5];
-cx qubits[3],qubits[0];
-cx qubits[3],qubits[2];
-cx qubits[0],qubits[8];
-cx qubits[0],qubits[3];
-cx qubits[8],qubits[7];
-cx qubits[8],qubits[5];
-cx qubits[8],qubits[4];
-cx qubits[8],qubits[2];
-cx qubits[8],qubits[0];
-cx qubits[0],qubits[8];
-cx qubits[9],qubits[8];
-cx qubits[9],qubits[7];
-cx qubits[9],qubits[6];
-cx qubits[9],qubits[5];
-cx qubits[9],qubits[4];
-cx qubits[9],qubits[3];
-cx qubits[9],qubits[2];
-cx qubits[9],qubits[1];
-cx qubits[7],qubits[2];
-cx qubits[7],qubits[0];
-cx qubits[2],qubits[7];
-cx qubits[6],qubits[8];
-cx qubits[6],qubits[4];
-cx qubits[6],qubits[3];
-cx qubits[4],qubits[2];
-cx qubits[2],qubits[4];
-x qubits[4];
-cx qubits[4],qubits[3];
-cx qubits[7],qubits[5];
-cx qubits[2],qubits[7];
-cx qubits[7],qubits[2];
-cx qubits[6],qubits[4];
-cx qubits[6],qubits[9];
-cx qubits[7],qubits[0];
-cx qubits[4],qubits[9];
-cx qubits[9],qubits[4];
-cx qubits[7],qubits[9];
-cx qubits[7],qubits[1];
-cx qubits[9],qubits[2];
-cx qubits[3],qubits[8];
-cx qubits[8],qubits[1];
-cx qubits[8],qubits[3];
-cx qubits[4],qubits[6];
-cx qubits[8],qubits[4];
-cx qubits[8],qubits[9];
-cx qubits[0],qubits[3];
-cx qubits[4],qubits[5];
-cx qubits[0],qubits[4];
-cx qubits[0],qubits[7];
-h qubits[0];
-h qubits[0];
-ccx qubits[9],qubits[2],qubits[0];
-h qubits[0];
-h qubits[0];
-cx qubits[4],qubits[1];
-cx qubits[0],qubits[4];
-cx qubits[4],qubits[0];
-cx qubits[4],qubits[7];
-x qubits[4];
-cx qubits[4],qubits[5];
-h qubits[4];
-h qubits[4];
-ccx qubits[9],qubits[1],qubits[4];
-h qubits[4];
-h qubits[4];
-cx qubits[0],qubits[6];
-h qubits[0];
-h qubits[0];
-ccx qubits[9],qubits[8],qubits[0];
-h qubits[0];
-h qubits[0];
-cx qubits[0],qubits[5];
-cx qubits[0],qubits[6];
-cx qubits[0],qubits[7];
-cx qubits[2],qubits[1];
-h qubits[7];
-h qubits[7];
-ccx qubits[1],qubits[9],qubits[7];
-h qubits[7];
-h qubits[7];
-cx qubits[9],qubits[7];
-cx qubits[8],qubits[7];
-cx qubits[0],qubits[9];
-cx qubits[0],qubits[8];
-cx qubits[7],qubits[0];
-cx qubits[1],qubits[7];
-cx qubits[2],qubits[8];
-cx qubits[6],qubits[9];
-cx qubits[6],qubits[8];
-h qubits[2];
-h qubits[2];
-ccx qubits[1],qubits[8],qubits[2];
-h qubits[2];
-h qubits[2];
-cx qubits[6],qubits[1];
-cx qubits[1],qubits[2];
-h qubits[6];
-h qubits[6];
-ccx qubits[1],qubits[7],qubits[6];
-h qubits[6];
-h qubits[6];
-cx qubits[0],qubits[1];
-cx qubits[0],qubits[2];
-cx qubits[0],qubits[6];
-x qubits[3];
-h qubits[7];
-h qubits[7];
-ccx qubits[9],qubits[8],qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[9];
-h qubits[9];
-ccx qubits[10],qubits[7],qubits[9];
-h qubits[9];
-h qubits[9];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[0];
-h qubits[0];
-ccx qubits[10],qubits[5],qubits[0];
-h qubits[0];
-h qubits[0];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[9];
-h qubits[9];
-ccx qubits[10],qubits[7],qubits[9];
-h qubits[9];
-h qubits[9];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[7];
-h qubits[7];
-ccx qubits[9],qubits[8],qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[8];
-h qubits[8];
-ccx qubits[10],qubits[7],qubits[8];
-h qubits[8];
-h qubits[8];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[0];
-h qubits[0];
-ccx qubits[10],qubits[5],qubits[0];
-h qubits[0];
-h qubits[0];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[8];
-h qubits[8];
-ccx qubits[10],qubits[7],qubits[8];
-h qubits[8];
-h qubits[8];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-x qubits[4];
-x qubits[3];
-cx qubits[0],qubits[6];
-cx qubits[1],qubits[2];
-cx qubits[0],qubits[1];
-h qubits[6];
-h qubits[6];
-ccx qubits[1],qubits[7],qubits[6];
-h qubits[6];
-h qubits[6];
-cx qubits[6],qubits[1];
-h qubits[2];
-h qubits[2];
-ccx qubits[1],qubits[8],qubits[2];
-h qubits[2];
-h qubits[2];
-cx qubits[6],qubits[8];
-cx qubits[6],qubits[9];
-cx qubits[2],qubits[8];
-cx qubits[1],qubits[7];
-cx qubits[2],qubits[1];
-cx qubits[7],qubits[0];
-cx qubits[8],qubits[7];
-cx qubits[0],qubits[8];
-cx qubits[0],qubits[9];
-cx qubits[9],qubits[7];
-h qubits[7];
-h qubits[7];
-ccx qubits[1],qubits[9],qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[7];
-ccx qubits[2],qubits[9],qubits[7];
-h qubits[7];
-h qubits[7];
-cx qubits[0],qubits[6];
-cx qubits[0],qubits[5];
-h qubits[0];
-h qubits[0];
-ccx qubits[9],qubits[8],qubits[0];
-h qubits[0];
-h qubits[0];
-cx qubits[0],qubits[7];
-cx qubits[0],qubits[5];
-h qubits[4];
-h qubits[4];
-ccx qubits[9],qubits[1],qubits[4];
-h qubits[4];
-h qubits[4];
-cx qubits[4],qubits[5];
-cx qubits[4],qubits[0];
-cx qubits[0],qubits[4];
-cx qubits[8],qubits[4];
-cx qubits[4],qubits[1];
-cx qubits[0],qubits[7];
-h qubits[0];
-h qubits[0];
-ccx qubits[9],qubits[2],qubits[0];
-h qubits[0];
-h qubits[0];
-cx qubits[0],qubits[7];
-cx qubits[0],qubits[6];
-cx qubits[0],qubits[4];
-cx qubits[0],qubits[5];
-cx qubits[0],qubits[3];
-cx qubits[8],qubits[9];
-cx qubits[8],qubits[6];
-cx qubits[8],qubits[3];
-cx qubits[3],qubits[8];
-cx qubits[9],qubits[4];
-cx qubits[9],qubits[2];
-cx qubits[7],qubits[4];
-cx qubits[6],qubits[4];
-cx qubits[4],qubits[9];
-cx qubits[7],qubits[8];
-cx qubits[2],qubits[5];
-cx qubits[7],qubits[2];
-cx qubits[7],qubits[1];
-cx qubits[7],qubits[0];
-cx qubits[6],qubits[0];
-cx qubits[2],qubits[9];
-cx qubits[2],qubits[8];
-cx qubits[2],qubits[7];
-cx qubits[2],qubits[4];
-x qubits[4];
-cx qubits[4],qubits[2];
-x qubits[3];
-cx qubits[0],qubits[2];
-cx qubits[2],qubits[1];
-cx qubits[2],qubits[0];
-x qubits[2];
-cx qubits[2],qubits[4];
-cx qubits[2],qubits[5];
-cx qubits[2],qubits[6];
-cx qubits[2],qubits[8];
-cx qubits[6],qubits[2];
-cx qubits[2],qubits[9];
-cx qubits[6],qubits[1];
-cx qubits[6],qubits[3];
-cx qubits[6],qubits[4];
-cx qubits[6],qubits[7];
-cx qubits[3],qubits[6];
-cx qubits[7],qubits[3];
-cx qubits[7],qubits[5];
-cx qubits[7],qubits[8];
-cx qubits[0],qubits[7];
-cx qubits[0],qubits[9];
-cx qubits[9],qubits[0];
-cx qubits[9],qubits[2];
-cx qubits[9],qubits[6];
-cx qubits[3],qubits[8];
-cx qubits[3],qubits[9];
-cx qubits[8],qubits[3];
-cx qubits[3],qubits[8];
-cx qubits[0],qubits[1];
-cx qubits[0],qubits[4];
-cx qubits[0],qubits[8];
-cx qubits[3],qubits[2];
-cx qubits[3],qubits[0];
-cx qubits[3],qubits[1];
-cx qubits[3],qubits[7];
-cx qubits[9],qubits[7];
-h qubits[3];
-h qubits[3];
-ccx qubits[2],qubits[9],qubits[3];
-h qubits[3];
-h qubits[3];
-cx qubits[3],qubits[9];
-cx qubits[3],qubits[1];
-cx qubits[3],qubits[4];
-cx qubits[3],qubits[6];
-cx qubits[3],qubits[8];
-cx qubits[3],qubits[7];
-x qubits[3];
-h qubits[3];
-h qubits[3];
-ccx qubits[1],qubits[9],qubits[3];
-h qubits[3];
-h qubits[3];
-x qubits[7];
-cx qubits[8],qubits[7];
-cx qubits[4],qubits[8];
-cx qubits[3],qubits[7];
-cx qubits[4],qubits[2];
-cx qubits[4],qubits[5];
-h qubits[4];
-h qubits[4];
-ccx qubits[9],qubits[8],qubits[4];
-h qubits[4];
-h qubits[4];
-h qubits[7];
-h qubits[7];
-ccx qubits[2],qubits[9],qubits[7];
-h qubits[7];
-h qubits[7];
-cx qubits[0],qubits[9];
-cx qubits[0],qubits[8];
-cx qubits[7],qubits[0];
-cx qubits[2],qubits[1];
-cx qubits[1],qubits[7];
-cx qubits[2],qubits[8];
-cx qubits[6],qubits[9];
-cx qubits[6],qubits[8];
-h qubits[2];
-h qubits[2];
-ccx qubits[1],qubits[8],qubits[2];
-h qubits[2];
-h qubits[2];
-cx qubits[6],qubits[1];
-cx qubits[1],qubits[2];
-h qubits[6];
-h qubits[6];
-ccx qubits[1],qubits[7],qubits[6];
-h qubits[6];
-h qubits[6];
-cx qubits[0],qubits[1];
-cx qubits[0],qubits[2];
-cx qubits[0],qubits[6];
-x qubits[4];
-x qubits[5];
-h qubits[7];
-h qubits[7];
-ccx qubits[9],qubits[8],qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[9];
-h qubits[9];
-ccx qubits[10],qubits[7],qubits[9];
-h qubits[9];
-h qubits[9];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[0];
-h qubits[0];
-ccx qubits[10],qubits[5],qubits[0];
-h qubits[0];
-h qubits[0];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[9];
-h qubits[9];
-ccx qubits[10],qubits[7],qubits[9];
-h qubits[9];
-h qubits[9];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[7];
-h qubits[7];
-ccx qubits[9],qubits[8],qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[8];
-h qubits[8];
-ccx qubits[10],qubits[7],qubits[8];
-h qubits[8];
-h qubits[8];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[0];
-h qubits[0];
-ccx qubits[10],qubits[5],qubits[0];
-h qubits[0];
-h qubits[0];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[8];
-h qubits[8];
-ccx qubits[10],qubits[7],qubits[8];
-h qubits[8];
-h qubits[8];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-x qubits[4];
-x qubits[3];
-cx qubits[0],qubits[6];
-cx qubits[1],qubits[2];
-cx qubits[0],qubits[1];
-h qubits[6];
-h qubits[6];
-ccx qubits[1],qubits[7],qubits[6];
-h qubits[6];
-h qubits[6];
-cx qubits[6],qubits[1];
-h qubits[2];
-h qubits[2];
-ccx qubits[1],qubits[8],qubits[2];
-h qubits[2];
-h qubits[2];
-cx qubits[6],qubits[8];
-cx qubits[6],qubits[9];
-cx qubits[2],qubits[8];
-cx qubits[1],qubits[7];
-cx qubits[2],qubits[1];
-cx qubits[7],qubits[0];
-cx qubits[0],qubits[8];
-cx qubits[0],qubits[9];
-cx qubits[8],qubits[7];
-cx qubits[9],qubits[7];
-h qubits[7];
-h qubits[7];
-ccx qubits[1],qubits[9],qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[7];
-ccx qubits[2],qubits[9],qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[4];
-h qubits[4];
-ccx qubits[9],qubits[8],qubits[4];
-h qubits[4];
-h qubits[4];
-cx qubits[4],qubits[7];
-cx qubits[4],qubits[5];
-cx qubits[4],qubits[2];
-cx qubits[4],qubits[8];
-h qubits[3];
-h qubits[3];
-ccx qubits[9],qubits[1],qubits[3];
-h qubits[3];
-h qubits[3];
-cx qubits[3],qubits[8];
-cx qubits[3],qubits[7];
-cx qubits[3],qubits[6];
-cx qubits[3],qubits[4];
-cx qubits[3],qubits[1];
-cx qubits[3],qubits[9];
-h qubits[3];
-h qubits[3];
-ccx qubits[9],qubits[2],qubits[3];
-h qubits[3];
-h qubits[3];
-cx qubits[3],qubits[8];
-cx qubits[3],qubits[7];
-cx qubits[3],qubits[6];
-cx qubits[0],qubits[1];
-cx qubits[3],qubits[0];
-cx qubits[3],qubits[2];
-cx qubits[3],qubits[9];
-cx qubits[0],qubits[8];
-cx qubits[0],qubits[7];
-cx qubits[0],qubits[4];
-cx qubits[9],qubits[6];
-cx qubits[8],qubits[9];
-cx qubits[8],qubits[3];
-cx qubits[3],qubits[8];
-cx qubits[9],qubits[7];
-cx qubits[9],qubits[2];
-cx qubits[9],qubits[0];
-cx qubits[0],qubits[9];
-cx qubits[7],qubits[8];
-cx qubits[7],qubits[6];
-cx qubits[7],qubits[5];
-cx qubits[6],qubits[7];
-cx qubits[7],qubits[3];
-cx qubits[6],qubits[9];
-cx qubits[2],qubits[4];
-cx qubits[2],qubits[1];
-cx qubits[6],qubits[2];
-cx qubits[6],qubits[8];
-cx qubits[2],qubits[6];
-cx qubits[2],qubits[9];
-cx qubits[0],qubits[2];
-x qubits[0];
-cx qubits[2],qubits[0];
-cx qubits[0],qubits[2];
-cx qubits[0],qubits[5];
-cx qubits[9],qubits[1];
-cx qubits[2],qubits[9];
-cx qubits[6],qubits[3];
-cx qubits[2],qubits[6];
-cx qubits[6],qubits[1];
-cx qubits[6],qubits[2];
-cx qubits[6],qubits[5];
-cx qubits[6],qubits[7];
-cx qubits[0],qubits[7];
-cx qubits[7],qubits[0];
-cx qubits[9],qubits[6];
-cx qubits[9],qubits[2];
-cx qubits[9],qubits[3];
-cx qubits[9],qubits[4];
-cx qubits[9],qubits[5];
-cx qubits[8],qubits[7];
-cx qubits[9],qubits[8];
-cx qubits[0],qubits[9];
-cx qubits[8],qubits[0];
-cx qubits[8],qubits[1];
-cx qubits[2],qubits[4];
-cx qubits[8],qubits[4];
-cx qubits[0],qubits[2];
-cx qubits[2],qubits[4];
-cx qubits[4],qubits[0];
-cx qubits[4],qubits[3];
-cx qubits[4],qubits[5];
-cx qubits[0],qubits[7];
-cx qubits[4],qubits[9];
-h qubits[4];
-h qubits[4];
-ccx qubits[9],qubits[2],qubits[4];
-h qubits[4];
-h qubits[4];
-cx qubits[0],qubits[2];
-cx qubits[0],qubits[6];
-h qubits[0];
-h qubits[0];
-ccx qubits[9],qubits[1],qubits[0];
-h qubits[0];
-h qubits[0];
-cx qubits[0],qubits[2];
-cx qubits[0],qubits[3];
-cx qubits[0],qubits[5];
-cx qubits[0],qubits[6];
-cx qubits[0],qubits[8];
-cx qubits[5],qubits[9];
-cx qubits[5],qubits[0];
-cx qubits[5],qubits[2];
-h qubits[5];
-h qubits[5];
-ccx qubits[9],qubits[8],qubits[5];
-h qubits[5];
-h qubits[5];
-cx qubits[2],qubits[1];
-h qubits[7];
-h qubits[7];
-ccx qubits[1],qubits[9],qubits[7];
-h qubits[7];
-h qubits[7];
-cx qubits[9],qubits[7];
-cx qubits[8],qubits[7];
-cx qubits[0],qubits[9];
-cx qubits[0],qubits[8];
-cx qubits[7],qubits[0];
-cx qubits[1],qubits[7];
-cx qubits[2],qubits[8];
-cx qubits[6],qubits[9];
-cx qubits[6],qubits[8];
-h qubits[2];
-h qubits[2];
-ccx qubits[1],qubits[8],qubits[2];
-h qubits[2];
-h qubits[2];
-cx qubits[6],qubits[1];
-cx qubits[1],qubits[2];
-h qubits[6];
-h qubits[6];
-ccx qubits[1],qubits[7],qubits[6];
-h qubits[6];
-h qubits[6];
-cx qubits[0],qubits[1];
-cx qubits[0],qubits[2];
-cx qubits[0],qubits[6];
-x qubits[4];
-x qubits[5];
-h qubits[7];
-h qubits[7];
-ccx qubits[9],qubits[8],qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[9];
-h qubits[9];
-ccx qubits[10],qubits[7],qubits[9];
-h qubits[9];
-h qubits[9];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[0];
-h qubits[0];
-ccx qubits[10],qubits[5],qubits[0];
-h qubits[0];
-h qubits[0];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[9];
-h qubits[9];
-ccx qubits[10],qubits[7],qubits[9];
-h qubits[9];
-h qubits[9];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[7];
-h qubits[7];
-ccx qubits[9],qubits[8],qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[8];
-h qubits[8];
-ccx qubits[10],qubits[7],qubits[8];
-h qubits[8];
-h qubits[8];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[0];
-h qubits[0];
-ccx qubits[10],qubits[5],qubits[0];
-h qubits[0];
-h qubits[0];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[8];
-h qubits[8];
-ccx qubits[10],qubits[7],qubits[8];
-h qubits[8];
-h qubits[8];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-x qubits[5];
-x qubits[4];
-cx qubits[0],qubits[6];
-cx qubits[1],qubits[2];
-cx qubits[0],qubits[1];
-h qubits[6];
-h qubits[6];
-ccx qubits[1],qubits[7],qubits[6];
-h qubits[6];
-h qubits[6];
-cx qubits[6],qubits[1];
-h qubits[2];
-h qubits[2];
-ccx qubits[1],qubits[8],qubits[2];
-h qubits[2];
-h qubits[2];
-cx qubits[6],qubits[8];
-cx qubits[6],qubits[9];
-cx qubits[2],qubits[8];
-cx qubits[1],qubits[7];
-cx qubits[2],qubits[1];
-cx qubits[7],qubits[0];
-cx qubits[0],qubits[8];
-cx qubits[0],qubits[9];
-cx qubits[8],qubits[7];
-cx qubits[9],qubits[7];
-h qubits[7];
-h qubits[7];
-ccx qubits[1],qubits[9],qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[7];
-ccx qubits[2],qubits[9],qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[5];
-h qubits[5];
-ccx qubits[9],qubits[8],qubits[5];
-h qubits[5];
-h qubits[5];
-cx qubits[0],qubits[2];
-cx qubits[5],qubits[0];
-cx qubits[5],qubits[9];
-cx qubits[0],qubits[8];
-cx qubits[6],qubits[5];
-cx qubits[0],qubits[6];
-cx qubits[0],qubits[3];
-h qubits[0];
-h qubits[0];
-ccx qubits[9],qubits[1],qubits[0];
-h qubits[0];
-h qubits[0];
-cx qubits[0],qubits[8];
-cx qubits[0],qubits[6];
-cx qubits[2],qubits[3];
-cx qubits[0],qubits[2];
-x qubits[3];
-h qubits[4];
-h qubits[4];
-ccx qubits[9],qubits[2],qubits[4];
-h qubits[4];
-h qubits[4];
-cx qubits[4],qubits[8];
-cx qubits[9],qubits[7];
-cx qubits[0],qubits[9];
-cx qubits[4],qubits[0];
-cx qubits[8],qubits[4];
-cx qubits[0],qubits[8];
-cx qubits[0],qubits[5];
-cx qubits[0],qubits[2];
-cx qubits[9],qubits[1];
-cx qubits[8],qubits[9];
-cx qubits[8],qubits[0];
-cx qubits[6],qubits[8];
-cx qubits[9],qubits[6];
-cx qubits[9],qubits[4];
-cx qubits[9],qubits[2];
-cx qubits[7],qubits[0];
-cx qubits[0],qubits[7];
-cx qubits[6],qubits[7];
-cx qubits[2],qubits[1];
-cx qubits[6],qubits[2];
-cx qubits[2],qubits[6];
-x qubits[1];
-x qubits[9];
-cx qubits[9],qubits[0];
-cx qubits[2],qubits[0];
-x qubits[2];
-x qubits[8];
-cx qubits[2],qubits[1];
-cx qubits[2],qubits[4];
-cx qubits[6],qubits[7];
-cx qubits[2],qubits[6];
-cx qubits[6],qubits[2];
-cx qubits[6],qubits[3];
-cx qubits[6],qubits[8];
-cx qubits[3],qubits[7];
-cx qubits[7],qubits[3];
-cx qubits[7],qubits[1];
-cx qubits[7],qubits[4];
-cx qubits[9],qubits[4];
-cx qubits[8],qubits[5];
-cx qubits[9],qubits[8];
-cx qubits[0],qubits[9];
-cx qubits[8],qubits[0];
-cx qubits[4],qubits[2];
-cx qubits[4],qubits[1];
-cx qubits[8],qubits[4];
-cx qubits[8],qubits[6];
-cx qubits[8],qubits[7];
-cx qubits[0],qubits[2];
-cx qubits[0],qubits[3];
-cx qubits[0],qubits[5];
-cx qubits[0],qubits[8];
-h qubits[4];
-h qubits[4];
-ccx qubits[9],qubits[2],qubits[4];
-h qubits[4];
-h qubits[4];
-cx qubits[4],qubits[1];
-cx qubits[4],qubits[0];
-cx qubits[4],qubits[5];
-cx qubits[3],qubits[4];
-cx qubits[4],qubits[7];
-h qubits[4];
-h qubits[4];
-ccx qubits[9],qubits[1],qubits[4];
-h qubits[4];
-h qubits[4];
-cx qubits[3],qubits[9];
-cx qubits[3],qubits[8];
-cx qubits[3],qubits[2];
-cx qubits[3],qubits[6];
-h qubits[3];
-h qubits[3];
-ccx qubits[9],qubits[8],qubits[3];
-h qubits[3];
-h qubits[3];
-cx qubits[2],qubits[1];
-h qubits[7];
-h qubits[7];
-ccx qubits[1],qubits[9],qubits[7];
-h qubits[7];
-h qubits[7];
-cx qubits[9],qubits[7];
-cx qubits[8],qubits[7];
-cx qubits[0],qubits[9];
-cx qubits[0],qubits[8];
-cx qubits[7],qubits[0];
-cx qubits[1],qubits[7];
-cx qubits[2],qubits[8];
-cx qubits[6],qubits[9];
-cx qubits[6],qubits[8];
-h qubits[2];
-h qubits[2];
-ccx qubits[1],qubits[8],qubits[2];
-h qubits[2];
-h qubits[2];
-cx qubits[6],qubits[1];
-cx qubits[1],qubits[2];
-h qubits[6];
-h qubits[6];
-ccx qubits[1],qubits[7],qubits[6];
-h qubits[6];
-h qubits[6];
-cx qubits[0],qubits[1];
-cx qubits[0],qubits[2];
-cx qubits[0],qubits[6];
-x qubits[3];
-x qubits[4];
-x qubits[5];
-h qubits[7];
-h qubits[7];
-ccx qubits[9],qubits[8],qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[9];
-h qubits[9];
-ccx qubits[10],qubits[7],qubits[9];
-h qubits[9];
-h qubits[9];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[0];
-h qubits[0];
-ccx qubits[10],qubits[5],qubits[0];
-h qubits[0];
-h qubits[0];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[9];
-h qubits[9];
-ccx qubits[10],qubits[7],qubits[9];
-h qubits[9];
-h qubits[9];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[7];
-h qubits[7];
-ccx qubits[9],qubits[8],qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[8];
-h qubits[8];
-ccx qubits[10],qubits[7],qubits[8];
-h qubits[8];
-h qubits[8];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[0];
-h qubits[0];
-ccx qubits[10],qubits[5],qubits[0];
-h qubits[0];
-h qubits[0];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[8];
-h qubits[8];
-ccx qubits[10],qubits[7],qubits[8];
-h qubits[8];
-h qubits[8];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-x qubits[4];
-x qubits[3];
-cx qubits[0],qubits[6];
-cx qubits[1],qubits[2];
-cx qubits[0],qubits[1];
-h qubits[6];
-h qubits[6];
-ccx qubits[1],qubits[7],qubits[6];
-h qubits[6];
-h qubits[6];
-cx qubits[6],qubits[1];
-h qubits[2];
-h qubits[2];
-ccx qubits[1],qubits[8],qubits[2];
-h qubits[2];
-h qubits[2];
-cx qubits[6],qubits[8];
-cx qubits[6],qubits[9];
-cx qubits[2],qubits[8];
-cx qubits[1],qubits[7];
-cx qubits[2],qubits[1];
-cx qubits[7],qubits[0];
-cx qubits[0],qubits[8];
-cx qubits[0],qubits[9];
-cx qubits[8],qubits[7];
-cx qubits[9],qubits[7];
-h qubits[7];
-h qubits[7];
-ccx qubits[1],qubits[9],qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[7];
-ccx qubits[2],qubits[9],qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[3];
-h qubits[3];
-ccx qubits[9],qubits[8],qubits[3];
-h qubits[3];
-h qubits[3];
-cx qubits[3],qubits[7];
-cx qubits[3],qubits[6];
-cx qubits[3],qubits[4];
-cx qubits[3],qubits[2];
-cx qubits[3],qubits[8];
-cx qubits[3],qubits[9];
-h qubits[4];
-h qubits[4];
-ccx qubits[9],qubits[1],qubits[4];
-h qubits[4];
-h qubits[4];
-cx qubits[4],qubits[7];
-cx qubits[0],qubits[5];
-cx qubits[4],qubits[0];
-cx qubits[4],qubits[1];
-h qubits[4];
-h qubits[4];
-ccx qubits[9],qubits[2],qubits[4];
-h qubits[4];
-h qubits[4];
-cx qubits[4],qubits[1];
-cx qubits[4],qubits[2];
-cx qubits[8],qubits[9];
-cx qubits[0],qubits[8];
-cx qubits[0],qubits[3];
-cx qubits[8],qubits[0];
-cx qubits[0],qubits[2];
-cx qubits[8],qubits[7];
-cx qubits[8],qubits[6];
-cx qubits[8],qubits[5];
-cx qubits[8],qubits[4];
-cx qubits[8],qubits[1];
-cx qubits[9],qubits[8];
-cx qubits[9],qubits[5];
-cx qubits[9],qubits[4];
-cx qubits[9],qubits[0];
-cx qubits[7],qubits[4];
-cx qubits[7],qubits[3];
-x qubits[7];
-cx qubits[7],qubits[1];
-cx qubits[6],qubits[3];
-cx qubits[3],qubits[7];
-cx qubits[2],qubits[8];
-cx qubits[6],qubits[2];
-cx qubits[2],qubits[6];
-cx qubits[2],qubits[9];
-cx qubits[2],qubits[4];
-x qubits[2];
-cx qubits[2],qubits[0];
-cx qubits[2],qubits[6];
-cx qubits[9],qubits[8];
-cx qubits[2],qubits[9];
-cx qubits[8],qubits[2];
-cx qubits[6],qubits[1];
-cx qubits[9],qubits[3];
-cx qubits[6],qubits[9];
-cx qubits[7],qubits[0];
-cx qubits[7],qubits[2];
-cx qubits[7],qubits[6];
-cx qubits[7],qubits[3];
-cx qubits[8],qubits[3];
-cx qubits[9],qubits[0];
-cx qubits[0],qubits[9];
-cx qubits[8],qubits[9];
-cx qubits[0],qubits[1];
-cx qubits[0],qubits[5];
-cx qubits[0],qubits[4];
-cx qubits[0],qubits[8];
-h qubits[0];
-h qubits[0];
-ccx qubits[9],qubits[2],qubits[0];
-h qubits[0];
-h qubits[0];
-cx qubits[0],qubits[4];
-cx qubits[0],qubits[8];
-cx qubits[3],qubits[1];
-cx qubits[3],qubits[4];
-h qubits[3];
-h qubits[3];
-ccx qubits[9],qubits[1],qubits[3];
-h qubits[3];
-h qubits[3];
-cx qubits[0],qubits[1];
-cx qubits[0],qubits[2];
-cx qubits[0],qubits[3];
-cx qubits[0],qubits[5];
-cx qubits[0],qubits[6];
-h qubits[0];
-h qubits[0];
-ccx qubits[9],qubits[8],qubits[0];
-h qubits[0];
-h qubits[0];
-cx qubits[0],qubits[1];
-cx qubits[0],qubits[2];
-cx qubits[0],qubits[3];
-cx qubits[0],qubits[5];
-cx qubits[0],qubits[6];
-cx qubits[2],qubits[1];
-h qubits[7];
-h qubits[7];
-ccx qubits[1],qubits[9],qubits[7];
-h qubits[7];
-h qubits[7];
-cx qubits[8],qubits[7];
-cx qubits[0],qubits[9];
-cx qubits[0],qubits[8];
-cx qubits[7],qubits[0];
-cx qubits[1],qubits[7];
-cx qubits[2],qubits[8];
-cx qubits[6],qubits[9];
-cx qubits[6],qubits[8];
-h qubits[2];
-h qubits[2];
-ccx qubits[1],qubits[8],qubits[2];
-h qubits[2];
-h qubits[2];
-cx qubits[6],qubits[1];
-cx qubits[1],qubits[2];
-h qubits[6];
-h qubits[6];
-ccx qubits[1],qubits[7],qubits[6];
-h qubits[6];
-h qubits[6];
-cx qubits[0],qubits[1];
-cx qubits[0],qubits[2];
-cx qubits[0],qubits[6];
-x qubits[3];
-h qubits[7];
-h qubits[7];
-ccx qubits[9],qubits[8],qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[9];
-h qubits[9];
-ccx qubits[10],qubits[7],qubits[9];
-h qubits[9];
-h qubits[9];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[0];
-h qubits[0];
-ccx qubits[10],qubits[5],qubits[0];
-h qubits[0];
-h qubits[0];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[9];
-h qubits[9];
-ccx qubits[10],qubits[7],qubits[9];
-h qubits[9];
-h qubits[9];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[7];
-h qubits[7];
-ccx qubits[9],qubits[8],qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[8];
-h qubits[8];
-ccx qubits[10],qubits[7],qubits[8];
-h qubits[8];
-h qubits[8];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[0];
-h qubits[0];
-ccx qubits[10],qubits[5],qubits[0];
-h qubits[0];
-h qubits[0];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[8];
-h qubits[8];
-ccx qubits[10],qubits[7],qubits[8];
-h qubits[8];
-h qubits[8];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-x qubits[3];
-cx qubits[0],qubits[6];
-cx qubits[1],qubits[2];
-cx qubits[0],qubits[1];
-h qubits[6];
-h qubits[6];
-ccx qubits[1],qubits[7],qubits[6];
-h qubits[6];
-h qubits[6];
-cx qubits[6],qubits[1];
-h qubits[2];
-h qubits[2];
-ccx qubits[1],qubits[8],qubits[2];
-h qubits[2];
-h qubits[2];
-cx qubits[6],qubits[8];
-cx qubits[6],qubits[9];
-cx qubits[2],qubits[8];
-cx qubits[1],qubits[7];
-cx qubits[2],qubits[1];
-cx qubits[7],qubits[0];
-cx qubits[0],qubits[8];
-cx qubits[0],qubits[9];
-cx qubits[8],qubits[7];
-h qubits[7];
-h qubits[7];
-ccx qubits[1],qubits[9],qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[7];
-ccx qubits[2],qubits[9],qubits[7];
-h qubits[7];
-h qubits[7];
-cx qubits[0],qubits[6];
-cx qubits[0],qubits[5];
-cx qubits[0],qubits[3];
-cx qubits[0],qubits[2];
-cx qubits[0],qubits[1];
-h qubits[0];
-h qubits[0];
-ccx qubits[9],qubits[8],qubits[0];
-h qubits[0];
-h qubits[0];
-cx qubits[0],qubits[6];
-cx qubits[0],qubits[5];
-cx qubits[0],qubits[3];
-cx qubits[0],qubits[2];
-cx qubits[0],qubits[1];
-h qubits[3];
-h qubits[3];
-ccx qubits[9],qubits[1],qubits[3];
-h qubits[3];
-h qubits[3];
-cx qubits[3],qubits[4];
-cx qubits[3],qubits[1];
-cx qubits[0],qubits[8];
-cx qubits[0],qubits[4];
-h qubits[0];
-h qubits[0];
-ccx qubits[9],qubits[2],qubits[0];
-h qubits[0];
-h qubits[0];
-cx qubits[0],qubits[8];
-cx qubits[0],qubits[4];
-cx qubits[0],qubits[9];
-cx qubits[0],qubits[5];
-cx qubits[0],qubits[1];
-cx qubits[9],qubits[3];
-cx qubits[8],qubits[9];
-cx qubits[8],qubits[2];
-cx qubits[9],qubits[8];
-cx qubits[9],qubits[0];
-cx qubits[6],qubits[3];
-cx qubits[7],qubits[6];
-cx qubits[2],qubits[0];
-cx qubits[7],qubits[2];
-cx qubits[2],qubits[7];
-cx qubits[2],qubits[6];
-cx qubits[0],qubits[2];
-cx qubits[2],qubits[0];
-x qubits[0];
-cx qubits[6],qubits[9];
-cx qubits[6],qubits[8];
-cx qubits[6],qubits[1];
-x qubits[4];
-cx qubits[7],qubits[1];
-cx qubits[2],qubits[7];
-cx qubits[2],qubits[6];
-cx qubits[2],qubits[9];
-cx qubits[0],qubits[6];
-cx qubits[6],qubits[0];
-cx qubits[6],qubits[1];
-cx qubits[6],qubits[3];
-cx qubits[6],qubits[4];
-cx qubits[6],qubits[8];
-cx qubits[6],qubits[9];
-cx qubits[7],qubits[0];
-cx qubits[7],qubits[2];
-cx qubits[7],qubits[3];
-cx qubits[7],qubits[6];
-cx qubits[7],qubits[4];
-cx qubits[7],qubits[8];
-cx qubits[4],qubits[9];
-cx qubits[9],qubits[4];
-cx qubits[3],qubits[9];
-cx qubits[9],qubits[6];
-cx qubits[8],qubits[1];
-h qubits[0];
-h qubits[0];
-ccx qubits[1],qubits[2],qubits[0];
-h qubits[0];
-h qubits[0];
-cx qubits[0],qubits[1];
-cx qubits[0],qubits[2];
-cx qubits[3],qubits[0];
-cx qubits[0],qubits[8];
-cx qubits[3],qubits[5];
-cx qubits[3],qubits[7];
-h qubits[3];
-h qubits[3];
-ccx qubits[9],qubits[2],qubits[3];
-h qubits[3];
-h qubits[3];
-cx qubits[3],qubits[9];
-cx qubits[3],qubits[1];
-cx qubits[0],qubits[5];
-cx qubits[3],qubits[0];
-cx qubits[3],qubits[6];
-cx qubits[3],qubits[8];
-h qubits[3];
-h qubits[3];
-ccx qubits[9],qubits[1],qubits[3];
-h qubits[3];
-h qubits[3];
-cx qubits[2],qubits[1];
-cx qubits[0],qubits[2];
-cx qubits[0],qubits[7];
-h qubits[0];
-h qubits[0];
-ccx qubits[9],qubits[8],qubits[0];
-h qubits[0];
-h qubits[0];
-cx qubits[0],qubits[2];
-cx qubits[0],qubits[5];
-cx qubits[0],qubits[7];
-h qubits[7];
-h qubits[7];
-ccx qubits[1],qubits[9],qubits[7];
-h qubits[7];
-h qubits[7];
-cx qubits[9],qubits[7];
-cx qubits[8],qubits[7];
-cx qubits[0],qubits[9];
-cx qubits[0],qubits[8];
-cx qubits[7],qubits[0];
-cx qubits[1],qubits[7];
-cx qubits[2],qubits[8];
-cx qubits[6],qubits[9];
-cx qubits[6],qubits[8];
-h qubits[2];
-h qubits[2];
-ccx qubits[1],qubits[8],qubits[2];
-h qubits[2];
-h qubits[2];
-cx qubits[6],qubits[1];
-cx qubits[1],qubits[2];
-h qubits[6];
-h qubits[6];
-ccx qubits[1],qubits[7],qubits[6];
-h qubits[6];
-h qubits[6];
-cx qubits[0],qubits[1];
-cx qubits[0],qubits[2];
-cx qubits[0],qubits[6];
-x qubits[3];
-x qubits[4];
-h qubits[7];
-h qubits[7];
-ccx qubits[9],qubits[8],qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[9];
-h qubits[9];
-ccx qubits[10],qubits[7],qubits[9];
-h qubits[9];
-h qubits[9];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[0];
-h qubits[0];
-ccx qubits[10],qubits[5],qubits[0];
-h qubits[0];
-h qubits[0];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[9];
-h qubits[9];
-ccx qubits[10],qubits[7],qubits[9];
-h qubits[9];
-h qubits[9];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[7];
-h qubits[7];
-ccx qubits[9],qubits[8],qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[8];
-h qubits[8];
-ccx qubits[10],qubits[7],qubits[8];
-h qubits[8];
-h qubits[8];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[0];
-h qubits[0];
-ccx qubits[10],qubits[5],qubits[0];
-h qubits[0];
-h qubits[0];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[8];
-h qubits[8];
-ccx qubits[10],qubits[7],qubits[8];
-h qubits[8];
-h qubits[8];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-x qubits[4];
-x qubits[3];
-cx qubits[0],qubits[6];
-cx qubits[1],qubits[2];
-cx qubits[0],qubits[1];
-h qubits[6];
-h qubits[6];
-ccx qubits[1],qubits[7],qubits[6];
-h qubits[6];
-h qubits[6];
-cx qubits[6],qubits[1];
-h qubits[2];
-h qubits[2];
-ccx qubits[1],qubits[8],qubits[2];
-h qubits[2];
-h qubits[2];
-cx qubits[6],qubits[8];
-cx qubits[6],qubits[9];
-cx qubits[2],qubits[8];
-cx qubits[1],qubits[7];
-cx qubits[2],qubits[1];
-cx qubits[7],qubits[0];
-cx qubits[8],qubits[7];
-cx qubits[0],qubits[8];
-cx qubits[0],qubits[9];
-cx qubits[9],qubits[7];
-h qubits[7];
-h qubits[7];
-ccx qubits[1],qubits[9],qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[7];
-ccx qubits[2],qubits[9],qubits[7];
-h qubits[7];
-h qubits[7];
-cx qubits[0],qubits[5];
-cx qubits[0],qubits[2];
-cx qubits[0],qubits[1];
-h qubits[0];
-h qubits[0];
-ccx qubits[9],qubits[8],qubits[0];
-h qubits[0];
-h qubits[0];
-cx qubits[0],qubits[7];
-cx qubits[0],qubits[5];
-cx qubits[0],qubits[2];
-cx qubits[0],qubits[1];
-h qubits[3];
-h qubits[3];
-ccx qubits[9],qubits[1],qubits[3];
-h qubits[3];
-h qubits[3];
-cx qubits[3],qubits[8];
-cx qubits[3],qubits[6];
-cx qubits[3],qubits[5];
-cx qubits[3],qubits[0];
-cx qubits[3],qubits[1];
-cx qubits[3],qubits[9];
-h qubits[3];
-h qubits[3];
-ccx qubits[9],qubits[2],qubits[3];
-h qubits[3];
-h qubits[3];
-cx qubits[3],qubits[8];
-cx qubits[7],qubits[6];
-cx qubits[3],qubits[7];
-cx qubits[3],qubits[5];
-cx qubits[3],qubits[0];
-cx qubits[3],qubits[9];
-cx qubits[0],qubits[8];
-cx qubits[0],qubits[2];
-cx qubits[0],qubits[1];
-h qubits[0];
-h qubits[0];
-ccx qubits[1],qubits[2],qubits[0];
-h qubits[0];
-h qubits[0];
-cx qubits[8],qubits[1];
-cx qubits[7],qubits[8];
-cx qubits[6],qubits[4];
-cx qubits[9],qubits[6];
-cx qubits[7],qubits[4];
-cx qubits[4],qubits[9];
-cx qubits[7],qubits[3];
-cx qubits[2],qubits[0];
-cx qubits[7],qubits[2];
-cx qubits[2],qubits[7];
-cx qubits[6],qubits[8];
-cx qubits[6],qubits[3];
-cx qubits[6],qubits[1];
-cx qubits[6],qubits[0];
-cx qubits[0],qubits[6];
-cx qubits[0],qubits[2];
-x qubits[3];
-x qubits[0];
-x qubits[5];
-cx qubits[9],qubits[8];
-x qubits[9];
-cx qubits[3],qubits[2];
-cx qubits[2],qubits[1];
-cx qubits[2],qubits[3];
-cx qubits[2],qubits[5];
-cx qubits[3],qubits[6];
-cx qubits[6],qubits[3];
-cx qubits[6],qubits[4];
-cx qubits[7],qubits[0];
-cx qubits[7],qubits[4];
-cx qubits[7],qubits[5];
-cx qubits[0],qubits[1];
-cx qubits[9],qubits[0];
-cx qubits[5],qubits[9];
-cx qubits[0],qubits[8];
-cx qubits[8],qubits[0];
-cx qubits[8],qubits[4];
-cx qubits[8],qubits[6];
-cx qubits[8],qubits[7];
-cx qubits[0],qubits[3];
-cx qubits[5],qubits[6];
-cx qubits[0],qubits[5];
-cx qubits[5],qubits[8];
-h qubits[5];
-h qubits[5];
-ccx qubits[9],qubits[2],qubits[5];
-h qubits[5];
-h qubits[5];
-cx qubits[5],qubits[1];
-cx qubits[5],qubits[2];
-h qubits[5];
-h qubits[5];
-ccx qubits[9],qubits[1],qubits[5];
-h qubits[5];
-h qubits[5];
-h qubits[8];
-h qubits[8];
-ccx qubits[1],qubits[2],qubits[8];
-h qubits[8];
-h qubits[8];
-cx qubits[1],qubits[2];
-h qubits[1];
-h qubits[1];
-ccx qubits[9],qubits[8],qubits[1];
-h qubits[1];
-h qubits[1];
-cx qubits[2],qubits[7];
-h qubits[7];
-h qubits[7];
-ccx qubits[2],qubits[9],qubits[7];
-h qubits[7];
-h qubits[7];
-cx qubits[1],qubits[2];
-cx qubits[2],qubits[1];
-cx qubits[1],qubits[7];
-cx qubits[8],qubits[7];
-cx qubits[0],qubits[9];
-cx qubits[0],qubits[8];
-cx qubits[7],qubits[0];
-cx qubits[1],qubits[7];
-cx qubits[2],qubits[8];
-cx qubits[6],qubits[9];
-cx qubits[6],qubits[8];
-h qubits[2];
-h qubits[2];
-ccx qubits[1],qubits[8],qubits[2];
-h qubits[2];
-h qubits[2];
-cx qubits[6],qubits[1];
-cx qubits[1],qubits[2];
-h qubits[6];
-h qubits[6];
-ccx qubits[1],qubits[7],qubits[6];
-h qubits[6];
-h qubits[6];
-cx qubits[0],qubits[1];
-cx qubits[0],qubits[2];
-cx qubits[0],qubits[6];
-x qubits[3];
-x qubits[5];
-h qubits[7];
-h qubits[7];
-ccx qubits[9],qubits[8],qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[9];
-h qubits[9];
-ccx qubits[10],qubits[7],qubits[9];
-h qubits[9];
-h qubits[9];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[0];
-h qubits[0];
-ccx qubits[10],qubits[5],qubits[0];
-h qubits[0];
-h qubits[0];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[9];
-h qubits[9];
-ccx qubits[10],qubits[7],qubits[9];
-h qubits[9];
-h qubits[9];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[7];
-h qubits[7];
-ccx qubits[9],qubits[8],qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[8];
-h qubits[8];
-ccx qubits[10],qubits[7],qubits[8];
-h qubits[8];
-h qubits[8];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[0];
-h qubits[0];
-ccx qubits[10],qubits[5],qubits[0];
-h qubits[0];
-h qubits[0];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[8];
-h qubits[8];
-ccx qubits[10],qubits[7],qubits[8];
-h qubits[8];
-h qubits[8];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-x qubits[5];
-x qubits[3];
-cx qubits[0],qubits[6];
-cx qubits[1],qubits[2];
-cx qubits[0],qubits[1];
-h qubits[6];
-h qubits[6];
-ccx qubits[1],qubits[7],qubits[6];
-h qubits[6];
-h qubits[6];
-cx qubits[6],qubits[1];
-h qubits[2];
-h qubits[2];
-ccx qubits[1],qubits[8],qubits[2];
-h qubits[2];
-h qubits[2];
-cx qubits[6],qubits[8];
-cx qubits[6],qubits[9];
-cx qubits[2],qubits[8];
-cx qubits[1],qubits[7];
-cx qubits[2],qubits[1];
-cx qubits[7],qubits[0];
-cx qubits[0],qubits[8];
-cx qubits[9],qubits[7];
-cx qubits[0],qubits[9];
-cx qubits[8],qubits[7];
-h qubits[7];
-h qubits[7];
-ccx qubits[1],qubits[9],qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[7];
-ccx qubits[2],qubits[9],qubits[7];
-h qubits[7];
-h qubits[7];
-cx qubits[1],qubits[2];
-h qubits[1];
-h qubits[1];
-ccx qubits[9],qubits[8],qubits[1];
-h qubits[1];
-h qubits[1];
-cx qubits[1],qubits[2];
-h qubits[8];
-h qubits[8];
-ccx qubits[1],qubits[2],qubits[8];
-h qubits[8];
-h qubits[8];
-h qubits[5];
-h qubits[5];
-ccx qubits[9],qubits[1],qubits[5];
-h qubits[5];
-h qubits[5];
-cx qubits[5],qubits[2];
-cx qubits[5],qubits[1];
-h qubits[5];
-h qubits[5];
-ccx qubits[9],qubits[2],qubits[5];
-h qubits[5];
-h qubits[5];
-cx qubits[8],qubits[7];
-cx qubits[8],qubits[6];
-cx qubits[5],qubits[8];
-cx qubits[0],qubits[5];
-cx qubits[5],qubits[9];
-cx qubits[6],qubits[3];
-cx qubits[0],qubits[6];
-cx qubits[8],qubits[0];
-cx qubits[0],qubits[1];
-cx qubits[8],qubits[4];
-cx qubits[9],qubits[0];
-cx qubits[0],qubits[8];
-cx qubits[7],qubits[1];
-x qubits[7];
-cx qubits[9],qubits[7];
-cx qubits[7],qubits[5];
-cx qubits[7],qubits[4];
-cx qubits[7],qubits[9];
-cx qubits[7],qubits[0];
-cx qubits[6],qubits[4];
-cx qubits[3],qubits[6];
-cx qubits[2],qubits[5];
-cx qubits[2],qubits[3];
-cx qubits[2],qubits[1];
-x qubits[3];
-cx qubits[3],qubits[2];
-cx qubits[0],qubits[2];
-cx qubits[2],qubits[0];
-cx qubits[2],qubits[4];
-cx qubits[2],qubits[5];
-cx qubits[6],qubits[0];
-cx qubits[6],qubits[7];
-cx qubits[3],qubits[8];
-cx qubits[6],qubits[3];
-cx qubits[6],qubits[9];
-cx qubits[0],qubits[7];
-cx qubits[7],qubits[0];
-cx qubits[7],qubits[1];
-cx qubits[5],qubits[9];
-cx qubits[9],qubits[5];
-cx qubits[9],qubits[1];
-cx qubits[9],qubits[7];
-cx qubits[3],qubits[1];
-cx qubits[8],qubits[3];
-cx qubits[8],qubits[5];
-cx qubits[8],qubits[9];
-cx qubits[0],qubits[5];
-cx qubits[0],qubits[7];
-cx qubits[0],qubits[8];
-cx qubits[3],qubits[2];
-cx qubits[3],qubits[4];
-cx qubits[3],qubits[6];
-cx qubits[3],qubits[8];
-h qubits[3];
-h qubits[3];
-ccx qubits[9],qubits[2],qubits[3];
-h qubits[3];
-h qubits[3];
-cx qubits[3],qubits[9];
-cx qubits[3],qubits[5];
-cx qubits[3],qubits[6];
-cx qubits[3],qubits[7];
-cx qubits[3],qubits[8];
-h qubits[3];
-h qubits[3];
-ccx qubits[9],qubits[1],qubits[3];
-h qubits[3];
-h qubits[3];
-cx qubits[5],qubits[9];
-cx qubits[5],qubits[8];
-cx qubits[5],qubits[0];
-cx qubits[5],qubits[7];
-h qubits[5];
-h qubits[5];
-ccx qubits[9],qubits[8],qubits[5];
-h qubits[5];
-h qubits[5];
-cx qubits[2],qubits[1];
-h qubits[7];
-h qubits[7];
-ccx qubits[1],qubits[9],qubits[7];
-h qubits[7];
-h qubits[7];
-cx qubits[9],qubits[7];
-cx qubits[8],qubits[7];
-cx qubits[0],qubits[9];
-cx qubits[0],qubits[8];
-cx qubits[7],qubits[0];
-cx qubits[1],qubits[7];
-cx qubits[2],qubits[8];
-cx qubits[6],qubits[9];
-cx qubits[6],qubits[8];
-h qubits[2];
-h qubits[2];
-ccx qubits[1],qubits[8],qubits[2];
-h qubits[2];
-h qubits[2];
-cx qubits[6],qubits[1];
-cx qubits[1],qubits[2];
-h qubits[6];
-h qubits[6];
-ccx qubits[1],qubits[7],qubits[6];
-h qubits[6];
-h qubits[6];
-cx qubits[0],qubits[1];
-cx qubits[0],qubits[2];
-cx qubits[0],qubits[6];
-x qubits[3];
-x qubits[5];
-h qubits[7];
-h qubits[7];
-ccx qubits[9],qubits[8],qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[9];
-h qubits[9];
-ccx qubits[10],qubits[7],qubits[9];
-h qubits[9];
-h qubits[9];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[0];
-h qubits[0];
-ccx qubits[10],qubits[5],qubits[0];
-h qubits[0];
-h qubits[0];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[9];
-h qubits[9];
-ccx qubits[10],qubits[7],qubits[9];
-h qubits[9];
-h qubits[9];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[7];
-h qubits[7];
-ccx qubits[9],qubits[8],qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[8];
-h qubits[8];
-ccx qubits[10],qubits[7],qubits[8];
-h qubits[8];
-h qubits[8];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[0];
-h qubits[0];
-ccx qubits[10],qubits[5],qubits[0];
-h qubits[0];
-h qubits[0];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[8];
-h qubits[8];
-ccx qubits[10],qubits[7],qubits[8];
-h qubits[8];
-h qubits[8];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-x qubits[5];
-x qubits[3];
-cx qubits[0],qubits[6];
-cx qubits[1],qubits[2];
-cx qubits[0],qubits[1];
-h qubits[6];
-h qubits[6];
-ccx qubits[1],qubits[7],qubits[6];
-h qubits[6];
-h qubits[6];
-cx qubits[6],qubits[1];
-h qubits[2];
-h qubits[2];
-ccx qubits[1],qubits[8],qubits[2];
-h qubits[2];
-h qubits[2];
-cx qubits[6],qubits[8];
-cx qubits[6],qubits[9];
-cx qubits[2],qubits[8];
-cx qubits[1],qubits[7];
-cx qubits[2],qubits[1];
-cx qubits[7],qubits[0];
-cx qubits[8],qubits[7];
-cx qubits[0],qubits[8];
-cx qubits[0],qubits[9];
-cx qubits[9],qubits[7];
-h qubits[7];
-h qubits[7];
-ccx qubits[1],qubits[9],qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[7];
-ccx qubits[2],qubits[9],qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[5];
-h qubits[5];
-ccx qubits[9],qubits[8],qubits[5];
-h qubits[5];
-h qubits[5];
-cx qubits[0],qubits[8];
-cx qubits[5],qubits[0];
-cx qubits[5],qubits[9];
-h qubits[3];
-h qubits[3];
-ccx qubits[9],qubits[1],qubits[3];
-h qubits[3];
-h qubits[3];
-cx qubits[3],qubits[8];
-cx qubits[3],qubits[7];
-cx qubits[3],qubits[6];
-cx qubits[9],qubits[5];
-cx qubits[3],qubits[9];
-h qubits[3];
-h qubits[3];
-ccx qubits[9],qubits[2],qubits[3];
-h qubits[3];
-h qubits[3];
-cx qubits[6],qubits[4];
-cx qubits[8],qubits[1];
-cx qubits[3],qubits[8];
-cx qubits[3],qubits[6];
-cx qubits[3],qubits[2];
-cx qubits[0],qubits[5];
-cx qubits[8],qubits[9];
-cx qubits[8],qubits[3];
-cx qubits[6],qubits[3];
-cx qubits[3],qubits[8];
-cx qubits[7],qubits[1];
-cx qubits[9],qubits[7];
-cx qubits[6],qubits[5];
-cx qubits[5],qubits[9];
-cx qubits[6],qubits[7];
-cx qubits[7],qubits[0];
-cx qubits[0],qubits[7];
-cx qubits[2],qubits[5];
-cx qubits[2],qubits[4];
-cx qubits[2],qubits[0];
-cx qubits[0],qubits[2];
-x qubits[2];
-cx qubits[2],qubits[0];
-cx qubits[2],qubits[3];
-cx qubits[2],qubits[6];
-cx qubits[6],qubits[1];
-cx qubits[0],qubits[7];
-cx qubits[7],qubits[0];
-cx qubits[7],qubits[6];
-cx qubits[7],qubits[2];
-cx qubits[9],qubits[7];
-cx qubits[9],qubits[4];
-cx qubits[9],qubits[5];
-cx qubits[9],qubits[8];
-cx qubits[4],qubits[8];
-cx qubits[8],qubits[2];
-cx qubits[8],qubits[4];
-cx qubits[8],qubits[5];
-h qubits[0];
-h qubits[0];
-ccx qubits[2],qubits[6],qubits[0];
-h qubits[0];
-h qubits[0];
-cx qubits[0],qubits[2];
-cx qubits[0],qubits[6];
-cx qubits[0],qubits[7];
-cx qubits[0],qubits[8];
-cx qubits[0],qubits[9];
-h qubits[2];
-h qubits[2];
-ccx qubits[6],qubits[9],qubits[2];
-h qubits[2];
-h qubits[2];
-cx qubits[6],qubits[8];
-h qubits[6];
-h qubits[6];
-ccx qubits[9],qubits[2],qubits[6];
-h qubits[6];
-h qubits[6];
-cx qubits[6],qubits[8];
-h qubits[9];
-h qubits[9];
-ccx qubits[1],qubits[8],qubits[9];
-h qubits[9];
-h qubits[9];
-cx qubits[0],qubits[8];
-h qubits[0];
-h qubits[0];
-ccx qubits[9],qubits[1],qubits[0];
-h qubits[0];
-h qubits[0];
-cx qubits[0],qubits[8];
-h qubits[9];
-h qubits[9];
-ccx qubits[1],qubits[2],qubits[9];
-h qubits[9];
-h qubits[9];
-cx qubits[1],qubits[2];
-cx qubits[1],qubits[6];
-cx qubits[1],qubits[7];
-h qubits[1];
-h qubits[1];
-ccx qubits[9],qubits[8],qubits[1];
-h qubits[1];
-h qubits[1];
-cx qubits[1],qubits[2];
-cx qubits[1],qubits[6];
-cx qubits[2],qubits[1];
-h qubits[7];
-h qubits[7];
-ccx qubits[1],qubits[9],qubits[7];
-h qubits[7];
-h qubits[7];
-cx qubits[9],qubits[7];
-cx qubits[1],qubits[7];
-cx qubits[2],qubits[7];
-cx qubits[8],qubits[7];
-cx qubits[0],qubits[9];
-cx qubits[0],qubits[8];
-cx qubits[7],qubits[0];
-cx qubits[1],qubits[7];
-cx qubits[2],qubits[8];
-cx qubits[6],qubits[9];
-cx qubits[6],qubits[8];
-h qubits[2];
-h qubits[2];
-ccx qubits[1],qubits[8],qubits[2];
-h qubits[2];
-h qubits[2];
-cx qubits[6],qubits[1];
-cx qubits[1],qubits[2];
-h qubits[6];
-h qubits[6];
-ccx qubits[1],qubits[7],qubits[6];
-h qubits[6];
-h qubits[6];
-cx qubits[0],qubits[1];
-cx qubits[0],qubits[2];
-cx qubits[0],qubits[6];
-x qubits[4];
-h qubits[7];
-h qubits[7];
-ccx qubits[9],qubits[8],qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[9];
-h qubits[9];
-ccx qubits[10],qubits[7],qubits[9];
-h qubits[9];
-h qubits[9];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[0];
-h qubits[0];
-ccx qubits[10],qubits[5],qubits[0];
-h qubits[0];
-h qubits[0];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[9];
-h qubits[9];
-ccx qubits[10],qubits[7],qubits[9];
-h qubits[9];
-h qubits[9];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[7];
-h qubits[7];
-ccx qubits[9],qubits[8],qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[8];
-h qubits[8];
-ccx qubits[10],qubits[7],qubits[8];
-h qubits[8];
-h qubits[8];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[0];
-h qubits[0];
-ccx qubits[10],qubits[5],qubits[0];
-h qubits[0];
-h qubits[0];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[8];
-h qubits[8];
-ccx qubits[10],qubits[7],qubits[8];
-h qubits[8];
-h qubits[8];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-x qubits[4];
-cx qubits[0],qubits[6];
-cx qubits[1],qubits[2];
-cx qubits[0],qubits[1];
-h qubits[6];
-h qubits[6];
-ccx qubits[1],qubits[7],qubits[6];
-h qubits[6];
-h qubits[6];
-cx qubits[6],qubits[1];
-h qubits[2];
-h qubits[2];
-ccx qubits[1],qubits[8],qubits[2];
-h qubits[2];
-h qubits[2];
-cx qubits[6],qubits[8];
-cx qubits[6],qubits[9];
-cx qubits[2],qubits[8];
-cx qubits[1],qubits[7];
-cx qubits[2],qubits[1];
-cx qubits[7],qubits[0];
-cx qubits[0],qubits[8];
-cx qubits[0],qubits[9];
-cx qubits[8],qubits[7];
-cx qubits[2],qubits[7];
-cx qubits[1],qubits[2];
-h qubits[7];
-h qubits[7];
-ccx qubits[2],qubits[9],qubits[7];
-h qubits[7];
-h qubits[7];
-cx qubits[9],qubits[7];
-cx qubits[2],qubits[7];
-cx qubits[1],qubits[6];
-h qubits[1];
-h qubits[1];
-ccx qubits[9],qubits[8],qubits[1];
-h qubits[1];
-h qubits[1];
-cx qubits[1],qubits[7];
-cx qubits[1],qubits[6];
-cx qubits[1],qubits[2];
-h qubits[9];
-h qubits[9];
-ccx qubits[1],qubits[2],qubits[9];
-h qubits[9];
-h qubits[9];
-cx qubits[0],qubits[8];
-h qubits[0];
-h qubits[0];
-ccx qubits[9],qubits[1],qubits[0];
-h qubits[0];
-h qubits[0];
-cx qubits[0],qubits[8];
-h qubits[9];
-h qubits[9];
-ccx qubits[1],qubits[8],qubits[9];
-h qubits[9];
-h qubits[9];
-cx qubits[6],qubits[8];
-h qubits[6];
-h qubits[6];
-ccx qubits[9],qubits[2],qubits[6];
-h qubits[6];
-h qubits[6];
-cx qubits[6],qubits[8];
-h qubits[2];
-h qubits[2];
-ccx qubits[6],qubits[9],qubits[2];
-h qubits[2];
-h qubits[2];
-cx qubits[0],qubits[9];
-cx qubits[0],qubits[8];
-cx qubits[0],qubits[7];
-cx qubits[0],qubits[6];
-cx qubits[0],qubits[2];
-h qubits[0];
-h qubits[0];
-ccx qubits[2],qubits[6],qubits[0];
-h qubits[0];
-h qubits[0];
-cx qubits[8],qubits[5];
-cx qubits[8],qubits[4];
-cx qubits[8],qubits[2];
-cx qubits[9],qubits[4];
-cx qubits[4],qubits[8];
-cx qubits[9],qubits[7];
-cx qubits[9],qubits[5];
-cx qubits[7],qubits[6];
-cx qubits[2],qubits[0];
-cx qubits[7],qubits[2];
-cx qubits[0],qubits[7];
-x qubits[0];
-cx qubits[6],qubits[7];
-cx qubits[6],qubits[5];
-cx qubits[3],qubits[4];
-cx qubits[3],qubits[6];
-cx qubits[2],qubits[3];
-cx qubits[6],qubits[3];
-cx qubits[2],qubits[9];
-cx qubits[9],qubits[8];
-cx qubits[7],qubits[9];
-cx qubits[9],qubits[7];
-cx qubits[8],qubits[7];
-cx qubits[6],qubits[7];
-cx qubits[7],qubits[6];
-cx qubits[7],qubits[1];
-cx qubits[9],qubits[4];
-cx qubits[9],qubits[5];
-cx qubits[8],qubits[9];
-cx qubits[4],qubits[1];
-cx qubits[4],qubits[0];
-cx qubits[0],qubits[4];
-cx qubits[0],qubits[5];
-cx qubits[0],qubits[7];
-cx qubits[0],qubits[8];
-cx qubits[4],qubits[2];
-cx qubits[4],qubits[0];
-cx qubits[4],qubits[7];
-x qubits[4];
-h qubits[4];
-h qubits[4];
-ccx qubits[2],qubits[9],qubits[4];
-h qubits[4];
-h qubits[4];
-cx qubits[9],qubits[7];
-x qubits[7];
-cx qubits[4],qubits[7];
-cx qubits[3],qubits[0];
-cx qubits[3],qubits[8];
-h qubits[3];
-h qubits[3];
-ccx qubits[9],qubits[1],qubits[3];
-h qubits[3];
-h qubits[3];
-cx qubits[0],qubits[1];
-cx qubits[0],qubits[3];
-cx qubits[0],qubits[5];
-cx qubits[0],qubits[7];
-h qubits[0];
-h qubits[0];
-ccx qubits[9],qubits[8],qubits[0];
-h qubits[0];
-h qubits[0];
-cx qubits[0],qubits[1];
-cx qubits[0],qubits[3];
-cx qubits[0],qubits[5];
-cx qubits[0],qubits[7];
-h qubits[7];
-h qubits[7];
-ccx qubits[1],qubits[9],qubits[7];
-h qubits[7];
-h qubits[7];
-cx qubits[8],qubits[7];
-cx qubits[0],qubits[9];
-cx qubits[0],qubits[8];
-cx qubits[7],qubits[0];
-cx qubits[2],qubits[1];
-cx qubits[1],qubits[7];
-cx qubits[2],qubits[8];
-cx qubits[6],qubits[9];
-cx qubits[6],qubits[8];
-h qubits[2];
-h qubits[2];
-ccx qubits[1],qubits[8],qubits[2];
-h qubits[2];
-h qubits[2];
-cx qubits[6],qubits[1];
-cx qubits[1],qubits[2];
-h qubits[6];
-h qubits[6];
-ccx qubits[1],qubits[7],qubits[6];
-h qubits[6];
-h qubits[6];
-cx qubits[0],qubits[1];
-cx qubits[0],qubits[2];
-cx qubits[0],qubits[6];
-x qubits[3];
-h qubits[7];
-h qubits[7];
-ccx qubits[9],qubits[8],qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[9];
-h qubits[9];
-ccx qubits[10],qubits[7],qubits[9];
-h qubits[9];
-h qubits[9];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[0];
-h qubits[0];
-ccx qubits[10],qubits[5],qubits[0];
-h qubits[0];
-h qubits[0];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[9];
-h qubits[9];
-ccx qubits[10],qubits[7],qubits[9];
-h qubits[9];
-h qubits[9];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[7];
-h qubits[7];
-ccx qubits[9],qubits[8],qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[8];
-h qubits[8];
-ccx qubits[10],qubits[7],qubits[8];
-h qubits[8];
-h qubits[8];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[0];
-h qubits[0];
-ccx qubits[10],qubits[5],qubits[0];
-h qubits[0];
-h qubits[0];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[8];
-h qubits[8];
-ccx qubits[10],qubits[7],qubits[8];
-h qubits[8];
-h qubits[8];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-x qubits[4];
-x qubits[3];
-cx qubits[0],qubits[6];
-cx qubits[1],qubits[2];
-cx qubits[0],qubits[1];
-h qubits[6];
-h qubits[6];
-ccx qubits[1],qubits[7],qubits[6];
-h qubits[6];
-h qubits[6];
-cx qubits[6],qubits[1];
-h qubits[2];
-h qubits[2];
-ccx qubits[1],qubits[8],qubits[2];
-h qubits[2];
-h qubits[2];
-cx qubits[6],qubits[8];
-cx qubits[6],qubits[9];
-cx qubits[2],qubits[8];
-cx qubits[1],qubits[7];
-cx qubits[2],qubits[1];
-cx qubits[7],qubits[0];
-cx qubits[8],qubits[7];
-cx qubits[0],qubits[8];
-cx qubits[0],qubits[9];
-cx qubits[9],qubits[7];
-h qubits[7];
-h qubits[7];
-ccx qubits[1],qubits[9],qubits[7];
-h qubits[7];
-h qubits[7];
-cx qubits[4],qubits[7];
-h qubits[4];
-h qubits[4];
-ccx qubits[2],qubits[9],qubits[4];
-h qubits[4];
-h qubits[4];
-cx qubits[4],qubits[2];
-cx qubits[4],qubits[7];
-cx qubits[0],qubits[5];
-cx qubits[0],qubits[3];
-cx qubits[0],qubits[1];
-h qubits[0];
-h qubits[0];
-ccx qubits[9],qubits[8],qubits[0];
-h qubits[0];
-h qubits[0];
-cx qubits[0],qubits[7];
-cx qubits[0],qubits[5];
-cx qubits[0],qubits[3];
-cx qubits[0],qubits[1];
-h qubits[3];
-h qubits[3];
-ccx qubits[9],qubits[1],qubits[3];
-h qubits[3];
-h qubits[3];
-cx qubits[3],qubits[8];
-cx qubits[0],qubits[1];
-cx qubits[3],qubits[0];
-cx qubits[4],qubits[0];
-cx qubits[8],qubits[7];
-cx qubits[0],qubits[8];
-cx qubits[0],qubits[5];
-cx qubits[0],qubits[4];
-cx qubits[4],qubits[0];
-cx qubits[9],qubits[6];
-cx qubits[8],qubits[9];
-cx qubits[9],qubits[8];
-cx qubits[8],qubits[1];
-cx qubits[9],qubits[7];
-cx qubits[9],qubits[5];
-cx qubits[9],qubits[4];
-x qubits[9];
-cx qubits[6],qubits[8];
-cx qubits[6],qubits[9];
-cx qubits[7],qubits[6];
-cx qubits[7],qubits[1];
-cx qubits[6],qubits[7];
-cx qubits[6],qubits[4];
-cx qubits[6],qubits[3];
-cx qubits[3],qubits[6];
-cx qubits[2],qubits[4];
-x qubits[2];
-x qubits[1];
-cx qubits[6],qubits[2];
-cx qubits[2],qubits[0];
-cx qubits[0],qubits[2];
-cx qubits[6],qubits[1];
-cx qubits[6],qubits[3];
-cx qubits[5],qubits[7];
-cx qubits[7],qubits[5];
-cx qubits[6],qubits[5];
-cx qubits[9],qubits[2];
-cx qubits[7],qubits[9];
-cx qubits[9],qubits[5];
-cx qubits[8],qubits[0];
-cx qubits[0],qubits[1];
-x qubits[5];
-cx qubits[0],qubits[4];
-cx qubits[0],qubits[5];
-cx qubits[0],qubits[3];
-cx qubits[3],qubits[2];
-cx qubits[3],qubits[8];
-h qubits[3];
-h qubits[3];
-ccx qubits[9],qubits[2],qubits[3];
-h qubits[3];
-h qubits[3];
-cx qubits[3],qubits[1];
-cx qubits[3],qubits[0];
-cx qubits[3],qubits[5];
-cx qubits[3],qubits[7];
-cx qubits[3],qubits[8];
-h qubits[3];
-h qubits[3];
-ccx qubits[9],qubits[1],qubits[3];
-h qubits[3];
-h qubits[3];
-cx qubits[3],qubits[8];
-cx qubits[3],qubits[1];
-cx qubits[3],qubits[5];
-cx qubits[3],qubits[6];
-cx qubits[3],qubits[7];
-h qubits[3];
-h qubits[3];
-ccx qubits[9],qubits[8],qubits[3];
-h qubits[3];
-h qubits[3];
-cx qubits[2],qubits[1];
-h qubits[7];
-h qubits[7];
-ccx qubits[1],qubits[9],qubits[7];
-h qubits[7];
-h qubits[7];
-cx qubits[8],qubits[7];
-cx qubits[0],qubits[9];
-cx qubits[0],qubits[8];
-cx qubits[7],qubits[0];
-cx qubits[1],qubits[7];
-cx qubits[2],qubits[8];
-cx qubits[6],qubits[9];
-cx qubits[6],qubits[8];
-h qubits[2];
-h qubits[2];
-ccx qubits[1],qubits[8],qubits[2];
-h qubits[2];
-h qubits[2];
-cx qubits[6],qubits[1];
-cx qubits[1],qubits[2];
-h qubits[6];
-h qubits[6];
-ccx qubits[1],qubits[7],qubits[6];
-h qubits[6];
-h qubits[6];
-cx qubits[0],qubits[1];
-cx qubits[0],qubits[2];
-cx qubits[0],qubits[6];
-x qubits[3];
-h qubits[7];
-h qubits[7];
-ccx qubits[9],qubits[8],qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[9];
-h qubits[9];
-ccx qubits[10],qubits[7],qubits[9];
-h qubits[9];
-h qubits[9];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[0];
-h qubits[0];
-ccx qubits[10],qubits[5],qubits[0];
-h qubits[0];
-h qubits[0];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[9];
-h qubits[9];
-ccx qubits[10],qubits[7],qubits[9];
-h qubits[9];
-h qubits[9];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[7];
-h qubits[7];
-ccx qubits[9],qubits[8],qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[8];
-h qubits[8];
-ccx qubits[10],qubits[7],qubits[8];
-h qubits[8];
-h qubits[8];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[0];
-h qubits[0];
-ccx qubits[10],qubits[5],qubits[0];
-h qubits[0];
-h qubits[0];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[8];
-h qubits[8];
-ccx qubits[10],qubits[7],qubits[8];
-h qubits[8];
-h qubits[8];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-x qubits[5];
-x qubits[3];
-cx qubits[0],qubits[6];
-cx qubits[1],qubits[2];
-cx qubits[0],qubits[1];
-h qubits[6];
-h qubits[6];
-ccx qubits[1],qubits[7],qubits[6];
-h qubits[6];
-h qubits[6];
-cx qubits[6],qubits[1];
-h qubits[2];
-h qubits[2];
-ccx qubits[1],qubits[8],qubits[2];
-h qubits[2];
-h qubits[2];
-cx qubits[6],qubits[8];
-cx qubits[6],qubits[9];
-cx qubits[2],qubits[8];
-cx qubits[1],qubits[7];
-cx qubits[2],qubits[1];
-cx qubits[7],qubits[0];
-cx qubits[0],qubits[8];
-cx qubits[0],qubits[9];
-cx qubits[8],qubits[7];
-h qubits[7];
-h qubits[7];
-ccx qubits[1],qubits[9],qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[7];
-ccx qubits[2],qubits[9],qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[3];
-h qubits[3];
-ccx qubits[9],qubits[8],qubits[3];
-h qubits[3];
-h qubits[3];
-cx qubits[3],qubits[7];
-cx qubits[3],qubits[6];
-cx qubits[3],qubits[5];
-cx qubits[3],qubits[1];
-cx qubits[3],qubits[8];
-h qubits[3];
-h qubits[3];
-ccx qubits[9],qubits[1],qubits[3];
-h qubits[3];
-h qubits[3];
-cx qubits[3],qubits[8];
-cx qubits[7],qubits[5];
-cx qubits[3],qubits[7];
-cx qubits[0],qubits[1];
-cx qubits[3],qubits[0];
-h qubits[3];
-h qubits[3];
-ccx qubits[9],qubits[2],qubits[3];
-h qubits[3];
-h qubits[3];
-cx qubits[8],qubits[2];
-cx qubits[3],qubits[8];
-cx qubits[0],qubits[5];
-cx qubits[0],qubits[4];
-cx qubits[0],qubits[3];
-cx qubits[0],qubits[2];
-cx qubits[8],qubits[0];
-cx qubits[9],qubits[5];
-cx qubits[7],qubits[9];
-cx qubits[9],qubits[2];
-cx qubits[6],qubits[5];
-cx qubits[5],qubits[7];
-cx qubits[6],qubits[3];
-cx qubits[2],qubits[1];
-cx qubits[2],qubits[0];
-cx qubits[6],qubits[2];
-cx qubits[2],qubits[9];
-cx qubits[2],qubits[5];
-x qubits[2];
-x qubits[4];
-cx qubits[0],qubits[2];
-cx qubits[2],qubits[0];
-cx qubits[2],qubits[1];
-cx qubits[2],qubits[7];
-cx qubits[2],qubits[8];
-cx qubits[2],qubits[9];
-cx qubits[5],qubits[6];
-cx qubits[6],qubits[1];
-cx qubits[6],qubits[5];
-cx qubits[6],qubits[9];
-cx qubits[0],qubits[7];
-cx qubits[7],qubits[0];
-cx qubits[7],qubits[4];
-cx qubits[7],qubits[2];
-cx qubits[7],qubits[8];
-cx qubits[0],qubits[9];
-cx qubits[9],qubits[0];
-cx qubits[9],qubits[2];
-cx qubits[9],qubits[4];
-cx qubits[9],qubits[5];
-cx qubits[9],qubits[6];
-cx qubits[9],qubits[7];
-cx qubits[3],qubits[5];
-cx qubits[3],qubits[9];
-cx qubits[8],qubits[3];
-cx qubits[3],qubits[8];
-cx qubits[0],qubits[1];
-cx qubits[3],qubits[2];
-cx qubits[0],qubits[3];
-cx qubits[3],qubits[4];
-h qubits[3];
-h qubits[3];
-ccx qubits[9],qubits[2],qubits[3];
-h qubits[3];
-h qubits[3];
-cx qubits[0],qubits[2];
-cx qubits[0],qubits[5];
-cx qubits[8],qubits[7];
-cx qubits[0],qubits[8];
-h qubits[0];
-h qubits[0];
-ccx qubits[9],qubits[1],qubits[0];
-h qubits[0];
-h qubits[0];
-cx qubits[0],qubits[2];
-cx qubits[0],qubits[3];
-cx qubits[4],qubits[5];
-cx qubits[4],qubits[8];
-cx qubits[0],qubits[4];
-cx qubits[4],qubits[2];
-cx qubits[4],qubits[6];
-h qubits[4];
-h qubits[4];
-ccx qubits[9],qubits[8],qubits[4];
-h qubits[4];
-h qubits[4];
-cx qubits[2],qubits[1];
-h qubits[7];
-h qubits[7];
-ccx qubits[1],qubits[9],qubits[7];
-h qubits[7];
-h qubits[7];
-cx qubits[9],qubits[7];
-cx qubits[0],qubits[9];
-cx qubits[0],qubits[8];
-cx qubits[7],qubits[0];
-cx qubits[1],qubits[7];
-cx qubits[2],qubits[8];
-cx qubits[6],qubits[9];
-cx qubits[6],qubits[8];
-h qubits[2];
-h qubits[2];
-ccx qubits[1],qubits[8],qubits[2];
-h qubits[2];
-h qubits[2];
-cx qubits[6],qubits[1];
-cx qubits[1],qubits[2];
-h qubits[6];
-h qubits[6];
-ccx qubits[1],qubits[7],qubits[6];
-h qubits[6];
-h qubits[6];
-cx qubits[0],qubits[1];
-cx qubits[0],qubits[2];
-cx qubits[0],qubits[6];
-x qubits[3];
-x qubits[4];
-x qubits[5];
-h qubits[7];
-h qubits[7];
-ccx qubits[9],qubits[8],qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[9];
-h qubits[9];
-ccx qubits[10],qubits[7],qubits[9];
-h qubits[9];
-h qubits[9];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[0];
-h qubits[0];
-ccx qubits[10],qubits[5],qubits[0];
-h qubits[0];
-h qubits[0];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[9];
-h qubits[9];
-ccx qubits[10],qubits[7],qubits[9];
-h qubits[9];
-h qubits[9];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[7];
-h qubits[7];
-ccx qubits[9],qubits[8],qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[8];
-h qubits[8];
-ccx qubits[10],qubits[7],qubits[8];
-h qubits[8];
-h qubits[8];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[0];
-h qubits[0];
-ccx qubits[10],qubits[5],qubits[0];
-h qubits[0];
-h qubits[0];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[8];
-h qubits[8];
-ccx qubits[10],qubits[7],qubits[8];
-h qubits[8];
-h qubits[8];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-x qubits[4];
-x qubits[3];
-cx qubits[0],qubits[6];
-cx qubits[1],qubits[2];
-cx qubits[0],qubits[1];
-h qubits[6];
-h qubits[6];
-ccx qubits[1],qubits[7],qubits[6];
-h qubits[6];
-h qubits[6];
-cx qubits[6],qubits[1];
-h qubits[2];
-h qubits[2];
-ccx qubits[1],qubits[8],qubits[2];
-h qubits[2];
-h qubits[2];
-cx qubits[6],qubits[8];
-cx qubits[6],qubits[9];
-cx qubits[2],qubits[8];
-cx qubits[1],qubits[7];
-cx qubits[2],qubits[1];
-cx qubits[7],qubits[0];
-cx qubits[8],qubits[7];
-cx qubits[0],qubits[8];
-cx qubits[0],qubits[9];
-cx qubits[9],qubits[7];
-h qubits[7];
-h qubits[7];
-ccx qubits[1],qubits[9],qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[7];
-ccx qubits[2],qubits[9],qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[4];
-h qubits[4];
-ccx qubits[9],qubits[8],qubits[4];
-h qubits[4];
-h qubits[4];
-cx qubits[4],qubits[7];
-cx qubits[4],qubits[6];
-cx qubits[0],qubits[4];
-cx qubits[4],qubits[5];
-cx qubits[4],qubits[2];
-cx qubits[4],qubits[8];
-cx qubits[0],qubits[3];
-h qubits[0];
-h qubits[0];
-ccx qubits[9],qubits[1],qubits[0];
-h qubits[0];
-h qubits[0];
-cx qubits[0],qubits[8];
-cx qubits[0],qubits[7];
-cx qubits[0],qubits[5];
-cx qubits[0],qubits[4];
-cx qubits[0],qubits[3];
-cx qubits[0],qubits[2];
-h qubits[3];
-h qubits[3];
-ccx qubits[9],qubits[2],qubits[3];
-h qubits[3];
-h qubits[3];
-cx qubits[8],qubits[5];
-cx qubits[3],qubits[8];
-cx qubits[2],qubits[4];
-cx qubits[3],qubits[2];
-cx qubits[8],qubits[3];
-cx qubits[3],qubits[9];
-cx qubits[0],qubits[1];
-cx qubits[7],qubits[2];
-cx qubits[9],qubits[7];
-cx qubits[6],qubits[5];
-cx qubits[9],qubits[6];
-cx qubits[9],qubits[0];
-cx qubits[0],qubits[9];
-cx qubits[7],qubits[8];
-x qubits[0];
-cx qubits[7],qubits[0];
-cx qubits[2],qubits[7];
-cx qubits[6],qubits[9];
-cx qubits[6],qubits[1];
-cx qubits[5],qubits[6];
-cx qubits[2],qubits[8];
-cx qubits[2],qubits[1];
-cx qubits[6],qubits[5];
-cx qubits[6],qubits[7];
-cx qubits[2],qubits[6];
-cx qubits[9],qubits[2];
-cx qubits[2],qubits[8];
-cx qubits[6],qubits[2];
-cx qubits[9],qubits[6];
-cx qubits[6],qubits[4];
-cx qubits[7],qubits[0];
-cx qubits[9],qubits[7];
-cx qubits[7],qubits[1];
-cx qubits[1],qubits[3];
-cx qubits[8],qubits[1];
-cx qubits[8],qubits[4];
-cx qubits[8],qubits[9];
-cx qubits[0],qubits[3];
-cx qubits[0],qubits[6];
-cx qubits[0],qubits[7];
-cx qubits[0],qubits[9];
-cx qubits[1],qubits[5];
-h qubits[1];
-h qubits[1];
-ccx qubits[9],qubits[2],qubits[1];
-h qubits[1];
-h qubits[1];
-cx qubits[1],qubits[3];
-cx qubits[1],qubits[5];
-cx qubits[3],qubits[9];
-cx qubits[3],qubits[1];
-cx qubits[3],qubits[2];
-cx qubits[3],qubits[7];
-h qubits[3];
-h qubits[3];
-ccx qubits[9],qubits[1],qubits[3];
-h qubits[3];
-h qubits[3];
-cx qubits[5],qubits[9];
-cx qubits[5],qubits[0];
-cx qubits[5],qubits[2];
-cx qubits[5],qubits[6];
-cx qubits[5],qubits[7];
-h qubits[5];
-h qubits[5];
-ccx qubits[9],qubits[8],qubits[5];
-h qubits[5];
-h qubits[5];
-cx qubits[2],qubits[1];
-h qubits[7];
-h qubits[7];
-ccx qubits[1],qubits[9],qubits[7];
-h qubits[7];
-h qubits[7];
-cx qubits[9],qubits[7];
-cx qubits[8],qubits[7];
-cx qubits[0],qubits[9];
-cx qubits[0],qubits[8];
-cx qubits[7],qubits[0];
-cx qubits[1],qubits[7];
-cx qubits[2],qubits[8];
-cx qubits[6],qubits[9];
-cx qubits[6],qubits[8];
-h qubits[2];
-h qubits[2];
-ccx qubits[1],qubits[8],qubits[2];
-h qubits[2];
-h qubits[2];
-cx qubits[6],qubits[1];
-cx qubits[1],qubits[2];
-h qubits[6];
-h qubits[6];
-ccx qubits[1],qubits[7],qubits[6];
-h qubits[6];
-h qubits[6];
-cx qubits[0],qubits[1];
-cx qubits[0],qubits[2];
-cx qubits[0],qubits[6];
-x qubits[3];
-x qubits[4];
-x qubits[5];
-h qubits[7];
-h qubits[7];
-ccx qubits[9],qubits[8],qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[9];
-h qubits[9];
-ccx qubits[10],qubits[7],qubits[9];
-h qubits[9];
-h qubits[9];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[0];
-h qubits[0];
-ccx qubits[10],qubits[5],qubits[0];
-h qubits[0];
-h qubits[0];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[9];
-h qubits[9];
-ccx qubits[10],qubits[7],qubits[9];
-h qubits[9];
-h qubits[9];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[7];
-h qubits[7];
-ccx qubits[9],qubits[8],qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[8];
-h qubits[8];
-ccx qubits[10],qubits[7],qubits[8];
-h qubits[8];
-h qubits[8];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[0];
-h qubits[0];
-ccx qubits[10],qubits[5],qubits[0];
-h qubits[0];
-h qubits[0];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[8];
-h qubits[8];
-ccx qubits[10],qubits[7],qubits[8];
-h qubits[8];
-h qubits[8];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-x qubits[5];
-x qubits[3];
-cx qubits[0],qubits[6];
-cx qubits[1],qubits[2];
-cx qubits[0],qubits[1];
-h qubits[6];
-h qubits[6];
-ccx qubits[1],qubits[7],qubits[6];
-h qubits[6];
-h qubits[6];
-cx qubits[6],qubits[1];
-h qubits[2];
-h qubits[2];
-ccx qubits[1],qubits[8],qubits[2];
-h qubits[2];
-h qubits[2];
-cx qubits[6],qubits[8];
-cx qubits[6],qubits[9];
-cx qubits[2],qubits[8];
-cx qubits[1],qubits[7];
-cx qubits[2],qubits[1];
-cx qubits[7],qubits[0];
-cx qubits[0],qubits[8];
-cx qubits[0],qubits[9];
-cx qubits[8],qubits[7];
-cx qubits[9],qubits[7];
-h qubits[7];
-h qubits[7];
-ccx qubits[1],qubits[9],qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[7];
-ccx qubits[2],qubits[9],qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[5];
-h qubits[5];
-ccx qubits[9],qubits[8],qubits[5];
-h qubits[5];
-h qubits[5];
-cx qubits[5],qubits[7];
-cx qubits[5],qubits[6];
-cx qubits[5],qubits[2];
-cx qubits[5],qubits[0];
-cx qubits[5],qubits[9];
-h qubits[3];
-h qubits[3];
-ccx qubits[9],qubits[1],qubits[3];
-h qubits[3];
-h qubits[3];
-cx qubits[3],qubits[7];
-cx qubits[3],qubits[2];
-cx qubits[3],qubits[1];
-cx qubits[3],qubits[9];
-cx qubits[1],qubits[5];
-cx qubits[1],qubits[3];
-h qubits[1];
-h qubits[1];
-ccx qubits[9],qubits[2],qubits[1];
-h qubits[1];
-h qubits[1];
-cx qubits[1],qubits[5];
-cx qubits[1],qubits[3];
-cx qubits[0],qubits[9];
-cx qubits[0],qubits[7];
-cx qubits[0],qubits[6];
-cx qubits[0],qubits[3];
-cx qubits[9],qubits[4];
-cx qubits[8],qubits[9];
-cx qubits[8],qubits[3];
-cx qubits[9],qubits[8];
-cx qubits[8],qubits[1];
-cx qubits[9],qubits[7];
-cx qubits[6],qubits[2];
-cx qubits[9],qubits[6];
-cx qubits[7],qubits[1];
-cx qubits[7],qubits[0];
-cx qubits[6],qubits[7];
-cx qubits[4],qubits[6];
-cx qubits[6],qubits[5];
-x qubits[5];
-cx qubits[6],qubits[4];
-cx qubits[4],qubits[6];
-cx qubits[2],qubits[4];
-cx qubits[2],qubits[7];
-cx qubits[2],qubits[5];
-cx qubits[6],qubits[1];
-cx qubits[6],qubits[8];
-cx qubits[6],qubits[9];
-cx qubits[7],qubits[0];
-cx qubits[5],qubits[9];
-x qubits[5];
-cx qubits[9],qubits[5];
-cx qubits[7],qubits[1];
-cx qubits[9],qubits[6];
-cx qubits[0],qubits[8];
-cx qubits[8],qubits[0];
-cx qubits[8],qubits[1];
-cx qubits[8],qubits[2];
-cx qubits[8],qubits[4];
-cx qubits[8],qubits[5];
-cx qubits[8],qubits[6];
-cx qubits[8],qubits[7];
-cx qubits[3],qubits[0];
-cx qubits[0],qubits[2];
-cx qubits[0],qubits[3];
-cx qubits[4],qubits[7];
-cx qubits[0],qubits[4];
-cx qubits[4],qubits[0];
-cx qubits[4],qubits[9];
-cx qubits[4],qubits[2];
-h qubits[4];
-h qubits[4];
-ccx qubits[9],qubits[2],qubits[4];
-h qubits[4];
-h qubits[4];
-cx qubits[4],qubits[1];
-cx qubits[4],qubits[2];
-cx qubits[4],qubits[5];
-cx qubits[4],qubits[6];
-cx qubits[4],qubits[7];
-cx qubits[4],qubits[8];
-h qubits[4];
-h qubits[4];
-ccx qubits[9],qubits[1],qubits[4];
-h qubits[4];
-h qubits[4];
-cx qubits[4],qubits[8];
-cx qubits[4],qubits[0];
-cx qubits[4],qubits[1];
-cx qubits[4],qubits[2];
-cx qubits[4],qubits[5];
-cx qubits[4],qubits[7];
-h qubits[4];
-h qubits[4];
-ccx qubits[9],qubits[8],qubits[4];
-h qubits[4];
-h qubits[4];
-cx qubits[2],qubits[1];
-h qubits[7];
-h qubits[7];
-ccx qubits[1],qubits[9],qubits[7];
-h qubits[7];
-h qubits[7];
-cx qubits[8],qubits[7];
-cx qubits[0],qubits[9];
-cx qubits[0],qubits[8];
-cx qubits[7],qubits[0];
-cx qubits[1],qubits[7];
-cx qubits[2],qubits[8];
-cx qubits[6],qubits[9];
-cx qubits[6],qubits[8];
-h qubits[2];
-h qubits[2];
-ccx qubits[1],qubits[8],qubits[2];
-h qubits[2];
-h qubits[2];
-cx qubits[6],qubits[1];
-cx qubits[1],qubits[2];
-h qubits[6];
-h qubits[6];
-ccx qubits[1],qubits[7],qubits[6];
-h qubits[6];
-h qubits[6];
-cx qubits[0],qubits[1];
-cx qubits[0],qubits[2];
-cx qubits[0],qubits[6];
-x qubits[3];
-x qubits[4];
-h qubits[7];
-h qubits[7];
-ccx qubits[9],qubits[8],qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[9];
-h qubits[9];
-ccx qubits[10],qubits[7],qubits[9];
-h qubits[9];
-h qubits[9];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[0];
-h qubits[0];
-ccx qubits[10],qubits[5],qubits[0];
-h qubits[0];
-h qubits[0];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[9];
-h qubits[9];
-ccx qubits[10],qubits[7],qubits[9];
-h qubits[9];
-h qubits[9];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[7];
-h qubits[7];
-ccx qubits[9],qubits[8],qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[8];
-h qubits[8];
-ccx qubits[10],qubits[7],qubits[8];
-h qubits[8];
-h qubits[8];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[0];
-h qubits[0];
-ccx qubits[10],qubits[5],qubits[0];
-h qubits[0];
-h qubits[0];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[8];
-h qubits[8];
-ccx qubits[10],qubits[7],qubits[8];
-h qubits[8];
-h qubits[8];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-x qubits[5];
-x qubits[4];
-x qubits[3];
-cx qubits[0],qubits[6];
-cx qubits[1],qubits[2];
-cx qubits[0],qubits[1];
-h qubits[6];
-h qubits[6];
-ccx qubits[1],qubits[7],qubits[6];
-h qubits[6];
-h qubits[6];
-cx qubits[6],qubits[1];
-h qubits[2];
-h qubits[2];
-ccx qubits[1],qubits[8],qubits[2];
-h qubits[2];
-h qubits[2];
-cx qubits[6],qubits[8];
-cx qubits[6],qubits[9];
-cx qubits[2],qubits[8];
-cx qubits[1],qubits[7];
-cx qubits[2],qubits[1];
-cx qubits[7],qubits[0];
-cx qubits[0],qubits[8];
-cx qubits[0],qubits[9];
-cx qubits[8],qubits[7];
-cx qubits[9],qubits[7];
-h qubits[7];
-h qubits[7];
-ccx qubits[1],qubits[9],qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[7];
-ccx qubits[2],qubits[9],qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[4];
-h qubits[4];
-ccx qubits[9],qubits[8],qubits[4];
-h qubits[4];
-h qubits[4];
-cx qubits[4],qubits[7];
-cx qubits[4],qubits[5];
-cx qubits[4],qubits[2];
-cx qubits[4],qubits[1];
-cx qubits[4],qubits[0];
-cx qubits[4],qubits[8];
-h qubits[4];
-h qubits[4];
-ccx qubits[9],qubits[1],qubits[4];
-h qubits[4];
-h qubits[4];
-cx qubits[8],qubits[7];
-cx qubits[6],qubits[5];
-cx qubits[8],qubits[6];
-cx qubits[4],qubits[8];
-cx qubits[4],qubits[2];
-cx qubits[4],qubits[1];
-h qubits[4];
-h qubits[4];
-ccx qubits[9],qubits[2],qubits[4];
-h qubits[4];
-h qubits[4];
-cx qubits[0],qubits[2];
-cx qubits[4],qubits[0];
-cx qubits[4],qubits[9];
-cx qubits[0],qubits[7];
-cx qubits[0],qubits[4];
-cx qubits[0],qubits[3];
-cx qubits[3],qubits[0];
-cx qubits[8],qubits[4];
-cx qubits[8],qubits[2];
-cx qubits[8],qubits[1];
-cx qubits[8],qubits[0];
-cx qubits[0],qubits[8];
-cx qubits[9],qubits[7];
-cx qubits[9],qubits[6];
-cx qubits[5],qubits[9];
-cx qubits[7],qubits[1];
-cx qubits[7],qubits[0];
-cx qubits[0],qubits[7];
-cx qubits[6],qubits[8];
-cx qubits[6],qubits[4];
-cx qubits[6],qubits[1];
-cx qubits[4],qubits[6];
-cx qubits[2],qubits[9];
-cx qubits[2],qubits[8];
-cx qubits[2],qubits[0];
-x qubits[0];
-cx qubits[0],qubits[2];
-cx qubits[3],qubits[2];
-cx qubits[2],qubits[3];
-cx qubits[2],qubits[4];
-cx qubits[6],qubits[7];
-cx qubits[6],qubits[9];
-x qubits[2];
-cx qubits[2],qubits[6];
-cx qubits[6],qubits[0];
-cx qubits[6],qubits[1];
-cx qubits[3],qubits[7];
-cx qubits[3],qubits[9];
-cx qubits[9],qubits[3];
-cx qubits[9],qubits[1];
-cx qubits[7],qubits[9];
-cx qubits[9],qubits[7];
-cx qubits[2],qubits[8];
-cx qubits[0],qubits[2];
-cx qubits[9],qubits[2];
-cx qubits[2],qubits[8];
-cx qubits[8],qubits[0];
-cx qubits[8],qubits[1];
-cx qubits[3],qubits[7];
-cx qubits[3],qubits[9];
-cx qubits[0],qubits[3];
-cx qubits[9],qubits[7];
-cx qubits[3],qubits[1];
-cx qubits[3],qubits[5];
-cx qubits[3],qubits[6];
-cx qubits[3],qubits[8];
-x qubits[3];
-h qubits[3];
-h qubits[3];
-ccx qubits[2],qubits[9],qubits[3];
-h qubits[3];
-h qubits[3];
-cx qubits[3],qubits[7];
-cx qubits[4],qubits[1];
-cx qubits[4],qubits[5];
-cx qubits[4],qubits[7];
-x qubits[4];
-h qubits[4];
-h qubits[4];
-ccx qubits[1],qubits[9],qubits[4];
-h qubits[4];
-h qubits[4];
-cx qubits[4],qubits[7];
-cx qubits[5],qubits[6];
-h qubits[5];
-h qubits[5];
-ccx qubits[9],qubits[8],qubits[5];
-h qubits[5];
-h qubits[5];
-cx qubits[5],qubits[6];
-cx qubits[8],qubits[7];
-cx qubits[0],qubits[9];
-cx qubits[0],qubits[8];
-cx qubits[7],qubits[0];
-cx qubits[2],qubits[1];
-cx qubits[1],qubits[7];
-cx qubits[2],qubits[8];
-cx qubits[6],qubits[9];
-cx qubits[6],qubits[8];
-h qubits[2];
-h qubits[2];
-ccx qubits[1],qubits[8],qubits[2];
-h qubits[2];
-h qubits[2];
-cx qubits[6],qubits[1];
-cx qubits[1],qubits[2];
-h qubits[6];
-h qubits[6];
-ccx qubits[1],qubits[7],qubits[6];
-h qubits[6];
-h qubits[6];
-cx qubits[0],qubits[1];
-cx qubits[0],qubits[2];
-cx qubits[0],qubits[6];
-x qubits[5];
-h qubits[7];
-h qubits[7];
-ccx qubits[9],qubits[8],qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[9];
-h qubits[9];
-ccx qubits[10],qubits[7],qubits[9];
-h qubits[9];
-h qubits[9];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[0];
-h qubits[0];
-ccx qubits[10],qubits[5],qubits[0];
-h qubits[0];
-h qubits[0];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[9];
-h qubits[9];
-ccx qubits[10],qubits[7],qubits[9];
-h qubits[9];
-h qubits[9];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[7];
-h qubits[7];
-ccx qubits[9],qubits[8],qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[8];
-h qubits[8];
-ccx qubits[10],qubits[7],qubits[8];
-h qubits[8];
-h qubits[8];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[0];
-h qubits[0];
-ccx qubits[10],qubits[5],qubits[0];
-h qubits[0];
-h qubits[0];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[8];
-h qubits[8];
-ccx qubits[10],qubits[7],qubits[8];
-h qubits[8];
-h qubits[8];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-x qubits[5];
-x qubits[4];
-x qubits[3];
-cx qubits[0],qubits[6];
-cx qubits[1],qubits[2];
-cx qubits[0],qubits[1];
-h qubits[6];
-h qubits[6];
-ccx qubits[1],qubits[7],qubits[6];
-h qubits[6];
-h qubits[6];
-cx qubits[6],qubits[1];
-h qubits[2];
-h qubits[2];
-ccx qubits[1],qubits[8],qubits[2];
-h qubits[2];
-h qubits[2];
-cx qubits[6],qubits[8];
-cx qubits[6],qubits[9];
-cx qubits[2],qubits[8];
-cx qubits[1],qubits[7];
-cx qubits[2],qubits[1];
-cx qubits[7],qubits[0];
-cx qubits[0],qubits[8];
-cx qubits[9],qubits[7];
-cx qubits[0],qubits[9];
-cx qubits[8],qubits[7];
-h qubits[7];
-h qubits[7];
-ccx qubits[1],qubits[9],qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[7];
-ccx qubits[2],qubits[9],qubits[7];
-h qubits[7];
-h qubits[7];
-cx qubits[5],qubits[6];
-h qubits[5];
-h qubits[5];
-ccx qubits[9],qubits[8],qubits[5];
-h qubits[5];
-h qubits[5];
-cx qubits[5],qubits[6];
-h qubits[4];
-h qubits[4];
-ccx qubits[9],qubits[1],qubits[4];
-h qubits[4];
-h qubits[4];
-cx qubits[4],qubits[5];
-cx qubits[4],qubits[1];
-h qubits[3];
-h qubits[3];
-ccx qubits[9],qubits[2],qubits[3];
-h qubits[3];
-h qubits[3];
-cx qubits[3],qubits[8];
-cx qubits[3],qubits[6];
-cx qubits[3],qubits[5];
-cx qubits[3],qubits[1];
-cx qubits[3],qubits[9];
-cx qubits[9],qubits[3];
-cx qubits[9],qubits[2];
-cx qubits[0],qubits[9];
-cx qubits[8],qubits[2];
-cx qubits[8],qubits[1];
-cx qubits[8],qubits[0];
-cx qubits[0],qubits[8];
-cx qubits[9],qubits[8];
-cx qubits[7],qubits[1];
-cx qubits[9],qubits[7];
-cx qubits[3],qubits[9];
-cx qubits[7],qubits[3];
-cx qubits[3],qubits[7];
-cx qubits[6],qubits[9];
-cx qubits[6],qubits[7];
-cx qubits[6],qubits[1];
-cx qubits[6],qubits[0];
-cx qubits[2],qubits[9];
-cx qubits[2],qubits[7];
-cx qubits[6],qubits[4];
-cx qubits[2],qubits[6];
-cx qubits[2],qubits[3];
-cx qubits[3],qubits[2];
-x qubits[0];
-cx qubits[0],qubits[2];
-cx qubits[2],qubits[0];
-cx qubits[6],qubits[1];
-cx qubits[6],qubits[9];
-cx qubits[2],qubits[6];
-cx qubits[7],qubits[8];
-cx qubits[2],qubits[7];
-cx qubits[6],qubits[3];
-cx qubits[7],qubits[1];
-cx qubits[7],qubits[2];
-cx qubits[7],qubits[6];
-cx qubits[8],qubits[6];
-cx qubits[7],qubits[3];
-cx qubits[8],qubits[7];
-cx qubits[4],qubits[9];
-cx qubits[9],qubits[4];
-cx qubits[9],qubits[6];
-cx qubits[8],qubits[1];
-cx qubits[8],qubits[2];
-cx qubits[8],qubits[9];
-h qubits[0];
-h qubits[0];
-ccx qubits[1],qubits[6],qubits[0];
-h qubits[0];
-h qubits[0];
-cx qubits[0],qubits[1];
-cx qubits[0],qubits[6];
-cx qubits[0],qubits[7];
-cx qubits[0],qubits[8];
-cx qubits[0],qubits[9];
-cx qubits[4],qubits[2];
-cx qubits[4],qubits[1];
-cx qubits[4],qubits[5];
-cx qubits[4],qubits[6];
-h qubits[4];
-h qubits[4];
-ccx qubits[9],qubits[2],qubits[4];
-h qubits[4];
-h qubits[4];
-cx qubits[0],qubits[2];
-cx qubits[0],qubits[3];
-cx qubits[0],qubits[4];
-h qubits[0];
-h qubits[0];
-ccx qubits[9],qubits[1],qubits[0];
-h qubits[0];
-h qubits[0];
-cx qubits[0],qubits[2];
-cx qubits[0],qubits[3];
-cx qubits[0],qubits[4];
-cx qubits[4],qubits[8];
-cx qubits[4],qubits[0];
-cx qubits[4],qubits[1];
-cx qubits[4],qubits[5];
-h qubits[4];
-h qubits[4];
-ccx qubits[9],qubits[8],qubits[4];
-h qubits[4];
-h qubits[4];
-cx qubits[2],qubits[1];
-h qubits[7];
-h qubits[7];
-ccx qubits[1],qubits[9],qubits[7];
-h qubits[7];
-h qubits[7];
-cx qubits[9],qubits[7];
-cx qubits[8],qubits[7];
-cx qubits[0],qubits[9];
-cx qubits[0],qubits[8];
-cx qubits[7],qubits[0];
-cx qubits[1],qubits[7];
-cx qubits[2],qubits[8];
-cx qubits[6],qubits[9];
-cx qubits[6],qubits[8];
-h qubits[2];
-h qubits[2];
-ccx qubits[1],qubits[8],qubits[2];
-h qubits[2];
-h qubits[2];
-cx qubits[6],qubits[1];
-cx qubits[1],qubits[2];
-h qubits[6];
-h qubits[6];
-ccx qubits[1],qubits[7],qubits[6];
-h qubits[6];
-h qubits[6];
-cx qubits[0],qubits[1];
-cx qubits[0],qubits[2];
-cx qubits[0],qubits[6];
-x qubits[4];
-x qubits[5];
-h qubits[7];
-h qubits[7];
-ccx qubits[9],qubits[8],qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[9];
-h qubits[9];
-ccx qubits[10],qubits[7],qubits[9];
-h qubits[9];
-h qubits[9];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[0];
-h qubits[0];
-ccx qubits[10],qubits[5],qubits[0];
-h qubits[0];
-h qubits[0];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[9];
-h qubits[9];
-ccx qubits[10],qubits[7],qubits[9];
-h qubits[9];
-h qubits[9];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[7];
-h qubits[7];
-ccx qubits[9],qubits[8],qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[8];
-h qubits[8];
-ccx qubits[10],qubits[7],qubits[8];
-h qubits[8];
-h qubits[8];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[0];
-h qubits[0];
-ccx qubits[10],qubits[5],qubits[0];
-h qubits[0];
-h qubits[0];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[8];
-h qubits[8];
-ccx qubits[10],qubits[7],qubits[8];
-h qubits[8];
-h qubits[8];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-x qubits[4];
-cx qubits[0],qubits[6];
-cx qubits[1],qubits[2];
-cx qubits[0],qubits[1];
-h qubits[6];
-h qubits[6];
-ccx qubits[1],qubits[7],qubits[6];
-h qubits[6];
-h qubits[6];
-cx qubits[6],qubits[1];
-h qubits[2];
-h qubits[2];
-ccx qubits[1],qubits[8],qubits[2];
-h qubits[2];
-h qubits[2];
-cx qubits[6],qubits[8];
-cx qubits[6],qubits[9];
-cx qubits[2],qubits[8];
-cx qubits[1],qubits[7];
-cx qubits[2],qubits[1];
-cx qubits[7],qubits[0];
-cx qubits[0],qubits[8];
-cx qubits[0],qubits[9];
-cx qubits[8],qubits[7];
-cx qubits[9],qubits[7];
-h qubits[7];
-h qubits[7];
-ccx qubits[1],qubits[9],qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[7];
-ccx qubits[2],qubits[9],qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[4];
-h qubits[4];
-ccx qubits[9],qubits[8],qubits[4];
-h qubits[4];
-h qubits[4];
-cx qubits[4],qubits[5];
-cx qubits[4],qubits[1];
-cx qubits[4],qubits[0];
-cx qubits[4],qubits[8];
-cx qubits[0],qubits[4];
-cx qubits[0],qubits[3];
-cx qubits[0],qubits[2];
-h qubits[0];
-h qubits[0];
-ccx qubits[9],qubits[1],qubits[0];
-h qubits[0];
-h qubits[0];
-cx qubits[0],qubits[4];
-cx qubits[0],qubits[3];
-cx qubits[0],qubits[2];
-h qubits[4];
-h qubits[4];
-ccx qubits[9],qubits[2],qubits[4];
-h qubits[4];
-h qubits[4];
-cx qubits[4],qubits[6];
-cx qubits[4],qubits[5];
-cx qubits[4],qubits[1];
-cx qubits[4],qubits[2];
-cx qubits[8],qubits[9];
-cx qubits[8],qubits[7];
-cx qubits[0],qubits[8];
-cx qubits[0],qubits[6];
-cx qubits[0],qubits[1];
-h qubits[0];
-h qubits[0];
-ccx qubits[1],qubits[6],qubits[0];
-h qubits[0];
-h qubits[0];
-cx qubits[8],qubits[6];
-cx qubits[7],qubits[8];
-cx qubits[2],qubits[1];
-cx qubits[8],qubits[2];
-cx qubits[2],qubits[8];
-cx qubits[9],qubits[6];
-cx qubits[9],qubits[4];
-cx qubits[4],qubits[9];
-cx qubits[6],qubits[3];
-x qubits[6];
-cx qubits[7],qubits[6];
-cx qubits[6],qubits[9];
-cx qubits[6],qubits[1];
-cx qubits[2],qubits[6];
-cx qubits[6],qubits[4];
-cx qubits[2],qubits[9];
-cx qubits[0],qubits[7];
-cx qubits[7],qubits[2];
-x qubits[7];
-cx qubits[2],qubits[0];
-cx qubits[0],qubits[2];
-x qubits[5];
-cx qubits[2],qubits[4];
-cx qubits[2],qubits[5];
-cx qubits[5],qubits[6];
-cx qubits[6],qubits[2];
-cx qubits[6],qubits[5];
-cx qubits[6],qubits[9];
-cx qubits[7],qubits[2];
-cx qubits[7],qubits[6];
-cx qubits[7],qubits[4];
-cx qubits[9],qubits[4];
-cx qubits[9],qubits[7];
-cx qubits[9],qubits[0];
-cx qubits[9],qubits[1];
-cx qubits[9],qubits[2];
-cx qubits[0],qubits[2];
-cx qubits[0],qubits[3];
-cx qubits[8],qubits[0];
-cx qubits[8],qubits[6];
-cx qubits[0],qubits[8];
-cx qubits[8],qubits[7];
-cx qubits[0],qubits[1];
-cx qubits[0],qubits[4];
-cx qubits[0],qubits[9];
-h qubits[2];
-h qubits[2];
-ccx qubits[6],qubits[9],qubits[2];
-h qubits[2];
-h qubits[2];
-cx qubits[0],qubits[6];
-h qubits[0];
-h qubits[0];
-ccx qubits[9],qubits[2],qubits[0];
-h qubits[0];
-h qubits[0];
-cx qubits[0],qubits[8];
-cx qubits[0],qubits[2];
-cx qubits[0],qubits[3];
-h qubits[0];
-h qubits[0];
-ccx qubits[9],qubits[1],qubits[0];
-h qubits[0];
-h qubits[0];
-cx qubits[0],qubits[2];
-cx qubits[0],qubits[3];
-cx qubits[0],qubits[6];
-cx qubits[4],qubits[9];
-cx qubits[4],qubits[8];
-cx qubits[4],qubits[1];
-cx qubits[4],qubits[5];
-cx qubits[4],qubits[7];
-h qubits[4];
-h qubits[4];
-ccx qubits[9],qubits[8],qubits[4];
-h qubits[4];
-h qubits[4];
-cx qubits[2],qubits[1];
-h qubits[7];
-h qubits[7];
-ccx qubits[1],qubits[9],qubits[7];
-h qubits[7];
-h qubits[7];
-cx qubits[9],qubits[7];
-cx qubits[8],qubits[7];
-cx qubits[0],qubits[9];
-cx qubits[0],qubits[8];
-cx qubits[7],qubits[0];
-cx qubits[1],qubits[7];
-cx qubits[2],qubits[8];
-cx qubits[6],qubits[9];
-cx qubits[6],qubits[8];
-h qubits[2];
-h qubits[2];
-ccx qubits[1],qubits[8],qubits[2];
-h qubits[2];
-h qubits[2];
-cx qubits[6],qubits[1];
-cx qubits[1],qubits[2];
-h qubits[6];
-h qubits[6];
-ccx qubits[1],qubits[7],qubits[6];
-h qubits[6];
-h qubits[6];
-cx qubits[0],qubits[1];
-cx qubits[0],qubits[2];
-cx qubits[0],qubits[6];
-x qubits[4];
-x qubits[5];
-h qubits[7];
-h qubits[7];
-ccx qubits[9],qubits[8],qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[9];
-h qubits[9];
-ccx qubits[10],qubits[7],qubits[9];
-h qubits[9];
-h qubits[9];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[0];
-h qubits[0];
-ccx qubits[10],qubits[5],qubits[0];
-h qubits[0];
-h qubits[0];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[9];
-h qubits[9];
-ccx qubits[10],qubits[7],qubits[9];
-h qubits[9];
-h qubits[9];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[7];
-h qubits[7];
-ccx qubits[9],qubits[8],qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[8];
-h qubits[8];
-ccx qubits[10],qubits[7],qubits[8];
-h qubits[8];
-h qubits[8];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[0];
-h qubits[0];
-ccx qubits[10],qubits[5],qubits[0];
-h qubits[0];
-h qubits[0];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[8];
-h qubits[8];
-ccx qubits[10],qubits[7],qubits[8];
-h qubits[8];
-h qubits[8];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-x qubits[5];
-x qubits[4];
-cx qubits[0],qubits[6];
-cx qubits[1],qubits[2];
-cx qubits[0],qubits[1];
-h qubits[6];
-h qubits[6];
-ccx qubits[1],qubits[7],qubits[6];
-h qubits[6];
-h qubits[6];
-cx qubits[6],qubits[1];
-h qubits[2];
-h qubits[2];
-ccx qubits[1],qubits[8],qubits[2];
-h qubits[2];
-h qubits[2];
-cx qubits[6],qubits[8];
-cx qubits[6],qubits[9];
-cx qubits[2],qubits[8];
-cx qubits[1],qubits[7];
-cx qubits[2],qubits[1];
-cx qubits[7],qubits[0];
-cx qubits[0],qubits[8];
-cx qubits[0],qubits[9];
-cx qubits[8],qubits[7];
-cx qubits[9],qubits[7];
-h qubits[7];
-h qubits[7];
-ccx qubits[1],qubits[9],qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[7];
-ccx qubits[2],qubits[9],qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[4];
-h qubits[4];
-ccx qubits[9],qubits[8],qubits[4];
-h qubits[4];
-h qubits[4];
-cx qubits[4],qubits[7];
-cx qubits[4],qubits[5];
-cx qubits[4],qubits[1];
-cx qubits[4],qubits[8];
-cx qubits[4],qubits[9];
-cx qubits[0],qubits[6];
-cx qubits[0],qubits[3];
-cx qubits[0],qubits[2];
-h qubits[0];
-h qubits[0];
-ccx qubits[9],qubits[1],qubits[0];
-h qubits[0];
-h qubits[0];
-cx qubits[0],qubits[3];
-cx qubits[0],qubits[2];
-cx qubits[0],qubits[8];
-h qubits[0];
-h qubits[0];
-ccx qubits[9],qubits[2],qubits[0];
-h qubits[0];
-h qubits[0];
-cx qubits[0],qubits[8];
-cx qubits[0],qubits[6];
-h qubits[2];
-h qubits[2];
-ccx qubits[6],qubits[9],qubits[2];
-h qubits[2];
-h qubits[2];
-cx qubits[9],qubits[7];
-cx qubits[9],qubits[4];
-cx qubits[0],qubits[9];
-cx qubits[0],qubits[3];
-cx qubits[0],qubits[2];
-cx qubits[0],qubits[1];
-cx qubits[7],qubits[6];
-cx qubits[8],qubits[7];
-cx qubits[8],qubits[3];
-cx qubits[8],qubits[2];
-cx qubits[8],qubits[0];
-cx qubits[9],qubits[2];
-cx qubits[9],qubits[0];
-x qubits[9];
-cx qubits[9],qubits[1];
-cx qubits[7],qubits[4];
-cx qubits[7],qubits[2];
-cx qubits[7],qubits[0];
-cx qubits[0],qubits[7];
-cx qubits[6],qubits[9];
-cx qubits[6],qubits[5];
-cx qubits[6],qubits[2];
-cx qubits[5],qubits[6];
-cx qubits[2],qubits[5];
-cx qubits[2],qubits[4];
-x qubits[5];
-x qubits[3];
-cx qubits[0],qubits[2];
-cx qubits[2],qubits[0];
-cx qubits[2],qubits[1];
-cx qubits[2],qubits[5];
-cx qubits[2],qubits[6];
-cx qubits[2],qubits[9];
-cx qubits[3],qubits[6];
-cx qubits[6],qubits[1];
-cx qubits[6],qubits[3];
-cx qubits[7],qubits[5];
-cx qubits[7],qubits[9];
-cx qubits[6],qubits[7];
-cx qubits[7],qubits[6];
-cx qubits[7],qubits[1];
-cx qubits[3],qubits[4];
-cx qubits[7],qubits[3];
-cx qubits[7],qubits[2];
-cx qubits[9],qubits[1];
-cx qubits[9],qubits[4];
-cx qubits[8],qubits[5];
-cx qubits[9],qubits[8];
-cx qubits[8],qubits[9];
-cx qubits[8],qubits[1];
-cx qubits[8],qubits[4];
-cx qubits[0],qubits[9];
-h qubits[0];
-h qubits[0];
-ccx qubits[9],qubits[2],qubits[0];
-h qubits[0];
-h qubits[0];
-cx qubits[0],qubits[1];
-cx qubits[5],qubits[7];
-cx qubits[0],qubits[5];
-cx qubits[0],qubits[8];
-cx qubits[3],qubits[9];
-cx qubits[3],qubits[2];
-cx qubits[3],qubits[5];
-h qubits[3];
-h qubits[3];
-ccx qubits[9],qubits[1],qubits[3];
-h qubits[3];
-h qubits[3];
-cx qubits[5],qubits[8];
-cx qubits[5],qubits[1];
-cx qubits[5],qubits[6];
-h qubits[5];
-h qubits[5];
-ccx qubits[9],qubits[8],qubits[5];
-h qubits[5];
-h qubits[5];
-cx qubits[2],qubits[1];
-h qubits[7];
-h qubits[7];
-ccx qubits[1],qubits[9],qubits[7];
-h qubits[7];
-h qubits[7];
-cx qubits[9],qubits[7];
-cx qubits[8],qubits[7];
-cx qubits[0],qubits[9];
-cx qubits[0],qubits[8];
-cx qubits[7],qubits[0];
-cx qubits[1],qubits[7];
-cx qubits[2],qubits[8];
-cx qubits[6],qubits[9];
-cx qubits[6],qubits[8];
-h qubits[2];
-h qubits[2];
-ccx qubits[1],qubits[8],qubits[2];
-h qubits[2];
-h qubits[2];
-cx qubits[6],qubits[1];
-cx qubits[1],qubits[2];
-h qubits[6];
-h qubits[6];
-ccx qubits[1],qubits[7],qubits[6];
-h qubits[6];
-h qubits[6];
-cx qubits[0],qubits[1];
-cx qubits[0],qubits[2];
-cx qubits[0],qubits[6];
-x qubits[3];
-x qubits[5];
-h qubits[7];
-h qubits[7];
-ccx qubits[9],qubits[8],qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[9];
-h qubits[9];
-ccx qubits[10],qubits[7],qubits[9];
-h qubits[9];
-h qubits[9];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[0];
-h qubits[0];
-ccx qubits[10],qubits[5],qubits[0];
-h qubits[0];
-h qubits[0];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[9];
-h qubits[9];
-ccx qubits[10],qubits[7],qubits[9];
-h qubits[9];
-h qubits[9];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[7];
-h qubits[7];
-ccx qubits[9],qubits[8],qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[8];
-h qubits[8];
-ccx qubits[10],qubits[7],qubits[8];
-h qubits[8];
-h qubits[8];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[0];
-h qubits[0];
-ccx qubits[10],qubits[5],qubits[0];
-h qubits[0];
-h qubits[0];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[8];
-h qubits[8];
-ccx qubits[10],qubits[7],qubits[8];
-h qubits[8];
-h qubits[8];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-x qubits[5];
-x qubits[3];
-cx qubits[0],qubits[6];
-cx qubits[1],qubits[2];
-cx qubits[0],qubits[1];
-h qubits[6];
-h qubits[6];
-ccx qubits[1],qubits[7],qubits[6];
-h qubits[6];
-h qubits[6];
-cx qubits[6],qubits[1];
-h qubits[2];
-h qubits[2];
-ccx qubits[1],qubits[8],qubits[2];
-h qubits[2];
-h qubits[2];
-cx qubits[6],qubits[8];
-cx qubits[6],qubits[9];
-cx qubits[2],qubits[8];
-cx qubits[1],qubits[7];
-cx qubits[2],qubits[1];
-cx qubits[7],qubits[0];
-cx qubits[8],qubits[7];
-cx qubits[0],qubits[8];
-cx qubits[0],qubits[9];
-cx qubits[9],qubits[7];
-h qubits[7];
-h qubits[7];
-ccx qubits[1],qubits[9],qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[7];
-ccx qubits[2],qubits[9],qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[5];
-h qubits[5];
-ccx qubits[9],qubits[8],qubits[5];
-h qubits[5];
-h qubits[5];
-cx qubits[5],qubits[7];
-cx qubits[5],qubits[6];
-cx qubits[5],qubits[1];
-cx qubits[5],qubits[8];
-cx qubits[8],qubits[5];
-cx qubits[0],qubits[8];
-h qubits[3];
-h qubits[3];
-ccx qubits[9],qubits[1],qubits[3];
-h qubits[3];
-h qubits[3];
-cx qubits[7],qubits[5];
-cx qubits[7],qubits[4];
-cx qubits[3],qubits[7];
-cx qubits[3],qubits[2];
-cx qubits[3],qubits[9];
-cx qubits[0],qubits[1];
-h qubits[0];
-h qubits[0];
-ccx qubits[9],qubits[2],qubits[0];
-h qubits[0];
-h qubits[0];
-cx qubits[0],qubits[9];
-cx qubits[9],qubits[4];
-cx qubits[8],qubits[9];
-cx qubits[9],qubits[8];
-cx qubits[8],qubits[1];
-cx qubits[9],qubits[5];
-cx qubits[6],qubits[9];
-cx qubits[6],qubits[3];
-cx qubits[7],qubits[6];
-cx qubits[2],qubits[1];
-cx qubits[7],qubits[2];
-cx qubits[6],qubits[7];
-cx qubits[6],qubits[5];
-cx qubits[6],qubits[1];
-cx qubits[3],qubits[6];
-x qubits[9];
-cx qubits[2],qubits[6];
-x qubits[2];
-x qubits[0];
-cx qubits[2],qubits[5];
-cx qubits[2],qubits[1];
-cx qubits[2],qubits[4];
-cx qubits[6],qubits[2];
-cx qubits[2],qubits[7];
-cx qubits[6],qubits[0];
-cx qubits[9],qubits[6];
-cx qubits[3],qubits[8];
-cx qubits[8],qubits[6];
-cx qubits[6],qubits[3];
-cx qubits[0],qubits[7];
-cx qubits[7],qubits[0];
-cx qubits[7],qubits[1];
-cx qubits[0],qubits[2];
-cx qubits[9],qubits[0];
-cx qubits[9],qubits[4];
-cx qubits[8],qubits[2];
-cx qubits[8],qubits[7];
-cx qubits[8],qubits[9];
-cx qubits[3],qubits[4];
-cx qubits[0],qubits[3];
-cx qubits[3],qubits[0];
-cx qubits[3],qubits[9];
-cx qubits[0],qubits[3];
-cx qubits[3],qubits[5];
-cx qubits[3],qubits[8];
-cx qubits[3],qubits[7];
-x qubits[3];
-h qubits[3];
-h qubits[3];
-ccx qubits[2],qubits[9],qubits[3];
-h qubits[3];
-h qubits[3];
-cx qubits[9],qubits[7];
-x qubits[7];
-cx qubits[3],qubits[7];
-cx qubits[0],qubits[6];
-h qubits[0];
-h qubits[0];
-ccx qubits[9],qubits[1],qubits[0];
-h qubits[0];
-h qubits[0];
-cx qubits[0],qubits[3];
-cx qubits[0],qubits[5];
-cx qubits[0],qubits[6];
-cx qubits[0],qubits[8];
-cx qubits[5],qubits[8];
-h qubits[5];
-h qubits[5];
-ccx qubits[9],qubits[8],qubits[5];
-h qubits[5];
-h qubits[5];
-h qubits[7];
-h qubits[7];
-ccx qubits[1],qubits[9],qubits[7];
-h qubits[7];
-h qubits[7];
-cx qubits[8],qubits[7];
-cx qubits[0],qubits[9];
-cx qubits[0],qubits[8];
-cx qubits[7],qubits[0];
-cx qubits[2],qubits[1];
-cx qubits[1],qubits[7];
-cx qubits[2],qubits[8];
-cx qubits[6],qubits[9];
-cx qubits[6],qubits[8];
-h qubits[2];
-h qubits[2];
-ccx qubits[1],qubits[8],qubits[2];
-h qubits[2];
-h qubits[2];
-cx qubits[6],qubits[1];
-cx qubits[1],qubits[2];
-h qubits[6];
-h qubits[6];
-ccx qubits[1],qubits[7],qubits[6];
-h qubits[6];
-h qubits[6];
-cx qubits[0],qubits[1];
-cx qubits[0],qubits[2];
-cx qubits[0],qubits[6];
-x qubits[4];
-x qubits[5];
-h qubits[7];
-h qubits[7];
-ccx qubits[9],qubits[8],qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[9];
-h qubits[9];
-ccx qubits[10],qubits[7],qubits[9];
-h qubits[9];
-h qubits[9];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[0];
-h qubits[0];
-ccx qubits[10],qubits[5],qubits[0];
-h qubits[0];
-h qubits[0];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[9];
-h qubits[9];
-ccx qubits[10],qubits[7],qubits[9];
-h qubits[9];
-h qubits[9];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[7];
-h qubits[7];
-ccx qubits[9],qubits[8],qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[8];
-h qubits[8];
-ccx qubits[10],qubits[7],qubits[8];
-h qubits[8];
-h qubits[8];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[0];
-h qubits[0];
-ccx qubits[10],qubits[5],qubits[0];
-h qubits[0];
-h qubits[0];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[8];
-h qubits[8];
-ccx qubits[10],qubits[7],qubits[8];
-h qubits[8];
-h qubits[8];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-x qubits[5];
-x qubits[3];
-cx qubits[0],qubits[6];
-cx qubits[1],qubits[2];
-cx qubits[0],qubits[1];
-h qubits[6];
-h qubits[6];
-ccx qubits[1],qubits[7],qubits[6];
-h qubits[6];
-h qubits[6];
-cx qubits[6],qubits[1];
-h qubits[2];
-h qubits[2];
-ccx qubits[1],qubits[8],qubits[2];
-h qubits[2];
-h qubits[2];
-cx qubits[6],qubits[8];
-cx qubits[6],qubits[9];
-cx qubits[2],qubits[8];
-cx qubits[1],qubits[7];
-cx qubits[2],qubits[1];
-cx qubits[7],qubits[0];
-cx qubits[0],qubits[8];
-cx qubits[0],qubits[9];
-cx qubits[8],qubits[7];
-cx qubits[9],qubits[7];
-h qubits[7];
-h qubits[7];
-ccx qubits[1],qubits[9],qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[7];
-ccx qubits[2],qubits[9],qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[5];
-h qubits[5];
-ccx qubits[9],qubits[8],qubits[5];
-h qubits[5];
-h qubits[5];
-cx qubits[0],qubits[5];
-cx qubits[5],qubits[8];
-cx qubits[0],qubits[6];
-cx qubits[0],qubits[3];
-h qubits[0];
-h qubits[0];
-ccx qubits[9],qubits[1],qubits[0];
-h qubits[0];
-h qubits[0];
-cx qubits[0],qubits[8];
-cx qubits[0],qubits[6];
-cx qubits[0],qubits[5];
-cx qubits[0],qubits[3];
-h qubits[3];
-h qubits[3];
-ccx qubits[9],qubits[2],qubits[3];
-h qubits[3];
-h qubits[3];
-cx qubits[3],qubits[8];
-cx qubits[3],qubits[5];
-cx qubits[0],qubits[4];
-cx qubits[3],qubits[0];
-cx qubits[3],qubits[9];
-cx qubits[0],qubits[3];
-cx qubits[0],qubits[2];
-cx qubits[8],qubits[9];
-cx qubits[8],qubits[7];
-cx qubits[8],qubits[6];
-cx qubits[8],qubits[3];
-cx qubits[8],qubits[2];
-cx qubits[9],qubits[3];
-cx qubits[3],qubits[8];
-cx qubits[9],qubits[6];
-cx qubits[9],qubits[4];
-cx qubits[9],qubits[2];
-cx qubits[9],qubits[0];
-cx qubits[7],qubits[1];
-cx qubits[7],qubits[0];
-cx qubits[6],qubits[0];
-cx qubits[0],qubits[7];
-cx qubits[6],qubits[8];
-cx qubits[6],qubits[3];
-cx qubits[6],qubits[2];
-x qubits[9];
-cx qubits[2],qubits[7];
-x qubits[2];
-x qubits[4];
-x qubits[1];
-x qubits[0];
-cx qubits[2],qubits[5];
-cx qubits[0],qubits[6];
-cx qubits[0],qubits[2];
-cx qubits[6],qubits[0];
-cx qubits[6],qubits[7];
-cx qubits[7],qubits[6];
-cx qubits[6],qubits[5];
-cx qubits[7],qubits[1];
-cx qubits[7],qubits[4];
-cx qubits[8],qubits[4];
-cx qubits[7],qubits[2];
-cx qubits[8],qubits[7];
-cx qubits[5],qubits[9];
-cx qubits[9],qubits[2];
-cx qubits[9],qubits[5];
-cx qubits[9],qubits[7];
-cx qubits[8],qubits[1];
-cx qubits[8],qubits[6];
-cx qubits[3],qubits[4];
-cx qubits[0],qubits[3];
-cx qubits[0],qubits[5];
-cx qubits[3],qubits[0];
-cx qubits[0],qubits[9];
-cx qubits[3],qubits[2];
-cx qubits[3],qubits[1];
-h qubits[3];
-h qubits[3];
-ccx qubits[9],qubits[2],qubits[3];
-h qubits[3];
-h qubits[3];
-cx qubits[3],qubits[9];
-cx qubits[3],qubits[0];
-cx qubits[3],qubits[4];
-cx qubits[3],qubits[5];
-cx qubits[3],qubits[6];
-cx qubits[3],qubits[8];
-h qubits[3];
-h qubits[3];
-ccx qubits[9],qubits[1],qubits[3];
-h qubits[3];
-h qubits[3];
-cx qubits[3],qubits[8];
-cx qubits[3],qubits[0];
-cx qubits[3],qubits[5];
-cx qubits[3],qubits[7];
-h qubits[3];
-h qubits[3];
-ccx qubits[9],qubits[8],qubits[3];
-h qubits[3];
-h qubits[3];
-cx qubits[2],qubits[1];
-h qubits[7];
-h qubits[7];
-ccx qubits[1],qubits[9],qubits[7];
-h qubits[7];
-h qubits[7];
-cx qubits[9],qubits[7];
-cx qubits[8],qubits[7];
-cx qubits[0],qubits[9];
-cx qubits[0],qubits[8];
-cx qubits[7],qubits[0];
-cx qubits[1],qubits[7];
-cx qubits[2],qubits[8];
-cx qubits[6],qubits[9];
-cx qubits[6],qubits[8];
-h qubits[2];
-h qubits[2];
-ccx qubits[1],qubits[8],qubits[2];
-h qubits[2];
-h qubits[2];
-cx qubits[6],qubits[1];
-cx qubits[1],qubits[2];
-h qubits[6];
-h qubits[6];
-ccx qubits[1],qubits[7],qubits[6];
-h qubits[6];
-h qubits[6];
-cx qubits[0],qubits[1];
-cx qubits[0],qubits[2];
-cx qubits[0],qubits[6];
-x qubits[3];
-x qubits[5];
-h qubits[7];
-h qubits[7];
-ccx qubits[9],qubits[8],qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[9];
-h qubits[9];
-ccx qubits[10],qubits[7],qubits[9];
-h qubits[9];
-h qubits[9];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[0];
-h qubits[0];
-ccx qubits[10],qubits[5],qubits[0];
-h qubits[0];
-h qubits[0];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[9];
-h qubits[9];
-ccx qubits[10],qubits[7],qubits[9];
-h qubits[9];
-h qubits[9];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[7];
-h qubits[7];
-ccx qubits[9],qubits[8],qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[8];
-h qubits[8];
-ccx qubits[10],qubits[7],qubits[8];
-h qubits[8];
-h qubits[8];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[0];
-h qubits[0];
-ccx qubits[10],qubits[5],qubits[0];
-h qubits[0];
-h qubits[0];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[8];
-h qubits[8];
-ccx qubits[10],qubits[7],qubits[8];
-h qubits[8];
-h qubits[8];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-x qubits[5];
-x qubits[3];
-cx qubits[0],qubits[6];
-cx qubits[1],qubits[2];
-cx qubits[0],qubits[1];
-h qubits[6];
-h qubits[6];
-ccx qubits[1],qubits[7],qubits[6];
-h qubits[6];
-h qubits[6];
-cx qubits[6],qubits[1];
-h qubits[2];
-h qubits[2];
-ccx qubits[1],qubits[8],qubits[2];
-h qubits[2];
-h qubits[2];
-cx qubits[6],qubits[8];
-cx qubits[6],qubits[9];
-cx qubits[2],qubits[8];
-cx qubits[1],qubits[7];
-cx qubits[2],qubits[1];
-cx qubits[7],qubits[0];
-cx qubits[0],qubits[8];
-cx qubits[0],qubits[9];
-cx qubits[8],qubits[7];
-cx qubits[9],qubits[7];
-h qubits[7];
-h qubits[7];
-ccx qubits[1],qubits[9],qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[7];
-ccx qubits[2],qubits[9],qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[3];
-h qubits[3];
-ccx qubits[9],qubits[8],qubits[3];
-h qubits[3];
-h qubits[3];
-cx qubits[3],qubits[7];
-cx qubits[3],qubits[5];
-cx qubits[3],qubits[0];
-cx qubits[3],qubits[8];
-h qubits[3];
-h qubits[3];
-ccx qubits[9],qubits[1],qubits[3];
-h qubits[3];
-h qubits[3];
-cx qubits[8],qubits[6];
-cx qubits[3],qubits[8];
-cx qubits[3],qubits[5];
-cx qubits[3],qubits[4];
-cx qubits[3],qubits[0];
-cx qubits[3],qubits[9];
-h qubits[3];
-h qubits[3];
-ccx qubits[9],qubits[2],qubits[3];
-h qubits[3];
-h qubits[3];
-cx qubits[3],qubits[4];
-cx qubits[3],qubits[1];
-cx qubits[9],qubits[2];
-cx qubits[0],qubits[9];
-cx qubits[3],qubits[0];
-cx qubits[0],qubits[3];
-cx qubits[0],qubits[5];
-cx qubits[0],qubits[4];
-cx qubits[8],qubits[7];
-cx qubits[8],qubits[4];
-cx qubits[8],qubits[1];
-cx qubits[9],qubits[7];
-cx qubits[9],qubits[5];
-cx qubits[5],qubits[9];
-cx qubits[6],qubits[5];
-cx qubits[7],qubits[6];
-cx qubits[7],qubits[4];
-cx qubits[7],qubits[2];
-cx qubits[7],qubits[1];
-cx qubits[6],qubits[7];
-cx qubits[6],qubits[2];
-cx qubits[6],qubits[0];
-cx qubits[0],qubits[6];
-cx qubits[2],qubits[9];
-cx qubits[2],qubits[5];
-cx qubits[2],qubits[4];
-cx qubits[2],qubits[0];
-cx qubits[0],qubits[2];
-cx qubits[3],qubits[2];
-cx qubits[3],qubits[1];
-cx qubits[2],qubits[3];
-cx qubits[2],qubits[9];
-cx qubits[9],qubits[6];
-cx qubits[6],qubits[9];
-cx qubits[4],qubits[7];
-cx qubits[7],qubits[1];
-cx qubits[7],qubits[4];
-cx qubits[9],qubits[8];
-cx qubits[7],qubits[9];
-cx qubits[8],qubits[7];
-cx qubits[9],qubits[0];
-cx qubits[8],qubits[1];
-cx qubits[8],qubits[2];
-cx qubits[8],qubits[3];
-cx qubits[0],qubits[8];
-cx qubits[8],qubits[6];
-cx qubits[0],qubits[7];
-cx qubits[4],qubits[2];
-cx qubits[4],qubits[0];
-cx qubits[3],qubits[4];
-cx qubits[4],qubits[8];
-h qubits[4];
-h qubits[4];
-ccx qubits[9],qubits[2],qubits[4];
-h qubits[4];
-h qubits[4];
-cx qubits[5],qubits[9];
-cx qubits[5],qubits[6];
-cx qubits[5],qubits[7];
-x qubits[5];
-h qubits[5];
-h qubits[5];
-ccx qubits[1],qubits[9],qubits[5];
-h qubits[5];
-h qubits[5];
-cx qubits[9],qubits[7];
-x qubits[7];
-cx qubits[5],qubits[7];
-cx qubits[3],qubits[2];
-h qubits[3];
-h qubits[3];
-ccx qubits[9],qubits[8],qubits[3];
-h qubits[3];
-h qubits[3];
-h qubits[7];
-h qubits[7];
-ccx qubits[2],qubits[9],qubits[7];
-h qubits[7];
-h qubits[7];
-cx qubits[8],qubits[7];
-cx qubits[0],qubits[9];
-cx qubits[0],qubits[8];
-cx qubits[7],qubits[0];
-cx qubits[2],qubits[1];
-cx qubits[1],qubits[7];
-cx qubits[2],qubits[8];
-cx qubits[6],qubits[9];
-cx qubits[6],qubits[8];
-h qubits[2];
-h qubits[2];
-ccx qubits[1],qubits[8],qubits[2];
-h qubits[2];
-h qubits[2];
-cx qubits[6],qubits[1];
-cx qubits[1],qubits[2];
-h qubits[6];
-h qubits[6];
-ccx qubits[1],qubits[7],qubits[6];
-h qubits[6];
-h qubits[6];
-cx qubits[0],qubits[1];
-cx qubits[0],qubits[2];
-cx qubits[0],qubits[6];
-x qubits[3];
-x qubits[4];
-h qubits[7];
-h qubits[7];
-ccx qubits[9],qubits[8],qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[9];
-h qubits[9];
-ccx qubits[10],qubits[7],qubits[9];
-h qubits[9];
-h qubits[9];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[0];
-h qubits[0];
-ccx qubits[10],qubits[5],qubits[0];
-h qubits[0];
-h qubits[0];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[9];
-h qubits[9];
-ccx qubits[10],qubits[7],qubits[9];
-h qubits[9];
-h qubits[9];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[7];
-h qubits[7];
-ccx qubits[9],qubits[8],qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[8];
-h qubits[8];
-ccx qubits[10],qubits[7],qubits[8];
-h qubits[8];
-h qubits[8];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[0];
-h qubits[0];
-ccx qubits[10],qubits[5],qubits[0];
-h qubits[0];
-h qubits[0];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[8];
-h qubits[8];
-ccx qubits[10],qubits[7],qubits[8];
-h qubits[8];
-h qubits[8];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-x qubits[5];
-x qubits[4];
-x qubits[3];
-cx qubits[0],qubits[6];
-cx qubits[1],qubits[2];
-cx qubits[0],qubits[1];
-h qubits[6];
-h qubits[6];
-ccx qubits[1],qubits[7],qubits[6];
-h qubits[6];
-h qubits[6];
-cx qubits[6],qubits[1];
-h qubits[2];
-h qubits[2];
-ccx qubits[1],qubits[8],qubits[2];
-h qubits[2];
-h qubits[2];
-cx qubits[6],qubits[8];
-cx qubits[6],qubits[9];
-cx qubits[2],qubits[8];
-cx qubits[1],qubits[7];
-cx qubits[2],qubits[1];
-cx qubits[7],qubits[0];
-cx qubits[0],qubits[8];
-cx qubits[0],qubits[9];
-cx qubits[8],qubits[7];
-cx qubits[9],qubits[7];
-h qubits[7];
-h qubits[7];
-ccx qubits[1],qubits[9],qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[7];
-ccx qubits[2],qubits[9],qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[3];
-h qubits[3];
-ccx qubits[9],qubits[8],qubits[3];
-h qubits[3];
-h qubits[3];
-cx qubits[3],qubits[4];
-cx qubits[3],qubits[2];
-cx qubits[3],qubits[8];
-h qubits[5];
-h qubits[5];
-ccx qubits[9],qubits[1],qubits[5];
-h qubits[5];
-h qubits[5];
-cx qubits[5],qubits[6];
-cx qubits[5],qubits[9];
-h qubits[4];
-h qubits[4];
-ccx qubits[9],qubits[2],qubits[4];
-h qubits[4];
-h qubits[4];
-cx qubits[0],qubits[8];
-cx qubits[4],qubits[0];
-cx qubits[4],qubits[2];
-cx qubits[0],qubits[7];
-cx qubits[0],qubits[6];
-cx qubits[0],qubits[1];
-cx qubits[8],qubits[7];
-cx qubits[8],qubits[6];
-cx qubits[2],qubits[3];
-x qubits[8];
-cx qubits[2],qubits[1];
-cx qubits[8],qubits[2];
-cx qubits[9],qubits[8];
-cx qubits[9],qubits[1];
-cx qubits[9],qubits[0];
-cx qubits[7],qubits[9];
-cx qubits[7],qubits[8];
-cx qubits[7],qubits[4];
-cx qubits[7],qubits[1];
-cx qubits[4],qubits[7];
-cx qubits[6],qubits[9];
-cx qubits[9],qubits[6];
-cx qubits[2],qubits[9];
-x qubits[6];
-cx qubits[3],qubits[2];
-cx qubits[2],qubits[0];
-cx qubits[2],qubits[1];
-cx qubits[2],qubits[4];
-cx qubits[2],qubits[8];
-cx qubits[0],qubits[6];
-cx qubits[6],qubits[0];
-cx qubits[6],qubits[1];
-cx qubits[6],qubits[8];
-cx qubits[0],qubits[7];
-cx qubits[7],qubits[0];
-cx qubits[7],qubits[2];
-cx qubits[7],qubits[9];
-cx qubits[4],qubits[9];
-cx qubits[9],qubits[7];
-cx qubits[7],qubits[4];
-x qubits[4];
-cx qubits[7],qubits[8];
-h qubits[8];
-h qubits[8];
-ccx qubits[2],qubits[6],qubits[8];
-h qubits[8];
-h qubits[8];
-cx qubits[8],qubits[2];
-cx qubits[8],qubits[6];
-cx qubits[8],qubits[9];
-h qubits[0];
-h qubits[0];
-ccx qubits[1],qubits[6],qubits[0];
-h qubits[0];
-h qubits[0];
-cx qubits[0],qubits[1];
-cx qubits[0],qubits[6];
-cx qubits[0],qubits[7];
-h qubits[2];
-h qubits[2];
-ccx qubits[7],qubits[9],qubits[2];
-h qubits[2];
-h qubits[2];
-cx qubits[7],qubits[8];
-h qubits[7];
-h qubits[7];
-ccx qubits[9],qubits[2],qubits[7];
-h qubits[7];
-h qubits[7];
-cx qubits[7],qubits[8];
-h qubits[1];
-h qubits[1];
-ccx qubits[2],qubits[8],qubits[1];
-h qubits[1];
-h qubits[1];
-cx qubits[0],qubits[2];
-cx qubits[0],qubits[8];
-h qubits[0];
-h qubits[0];
-ccx qubits[9],qubits[1],qubits[0];
-h qubits[0];
-h qubits[0];
-cx qubits[0],qubits[2];
-cx qubits[0],qubits[8];
-h qubits[9];
-h qubits[9];
-ccx qubits[1],qubits[7],qubits[9];
-h qubits[9];
-h qubits[9];
-cx qubits[8],qubits[7];
-cx qubits[9],qubits[7];
-h qubits[1];
-h qubits[1];
-ccx qubits[8],qubits[9],qubits[1];
-h qubits[1];
-h qubits[1];
-cx qubits[2],qubits[1];
-h qubits[7];
-h qubits[7];
-ccx qubits[1],qubits[9],qubits[7];
-h qubits[7];
-h qubits[7];
-cx qubits[0],qubits[9];
-cx qubits[0],qubits[8];
-cx qubits[7],qubits[0];
-cx qubits[1],qubits[7];
-cx qubits[2],qubits[8];
-cx qubits[6],qubits[9];
-cx qubits[6],qubits[8];
-h qubits[2];
-h qubits[2];
-ccx qubits[1],qubits[8],qubits[2];
-h qubits[2];
-h qubits[2];
-cx qubits[6],qubits[1];
-cx qubits[1],qubits[2];
-h qubits[6];
-h qubits[6];
-ccx qubits[1],qubits[7],qubits[6];
-h qubits[6];
-h qubits[6];
-cx qubits[0],qubits[1];
-cx qubits[0],qubits[2];
-cx qubits[0],qubits[6];
-x qubits[3];
-x qubits[5];
-h qubits[7];
-h qubits[7];
-ccx qubits[9],qubits[8],qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[9];
-h qubits[9];
-ccx qubits[10],qubits[7],qubits[9];
-h qubits[9];
-h qubits[9];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[0];
-h qubits[0];
-ccx qubits[10],qubits[5],qubits[0];
-h qubits[0];
-h qubits[0];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[9];
-h qubits[9];
-ccx qubits[10],qubits[7],qubits[9];
-h qubits[9];
-h qubits[9];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[7];
-h qubits[7];
-ccx qubits[9],qubits[8],qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[8];
-h qubits[8];
-ccx qubits[10],qubits[7],qubits[8];
-h qubits[8];
-h qubits[8];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[0];
-h qubits[0];
-ccx qubits[10],qubits[5],qubits[0];
-h qubits[0];
-h qubits[0];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[4],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[3],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[12];
-h qubits[12];
-ccx qubits[1],qubits[2],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[8];
-h qubits[8];
-ccx qubits[10],qubits[7],qubits[8];
-h qubits[8];
-h qubits[8];
-h qubits[10];
-h qubits[10];
-ccx qubits[0],qubits[6],qubits[10];
-h qubits[10];
-h qubits[10];
-x qubits[4];
-cx qubits[0],qubits[6];
-cx qubits[1],qubits[2];
-cx qubits[0],qubits[1];
-h qubits[6];
-h qubits[6];
-ccx qubits[1],qubits[7],qubits[6];
-h qubits[6];
-h qubits[6];
-cx qubits[6],qubits[1];
-h qubits[2];
-h qubits[2];
-ccx qubits[1],qubits[8],qubits[2];
-h qubits[2];
-h qubits[2];
-cx qubits[6],qubits[8];
-cx qubits[6],qubits[9];
-cx qubits[2],qubits[8];
-cx qubits[1],qubits[7];
-cx qubits[2],qubits[1];
-cx qubits[7],qubits[0];
-cx qubits[0],qubits[8];
-cx qubits[0],qubits[9];
-cx qubits[8],qubits[7];
-cx qubits[9],qubits[7];
-h qubits[7];
-h qubits[7];
-ccx qubits[1],qubits[9],qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[7];
-ccx qubits[2],qubits[9],qubits[7];
-h qubits[7];
-h qubits[7];
-h qubits[1];
-h qubits[1];
-ccx qubits[9],qubits[8],qubits[1];
-h qubits[1];
-h qubits[1];
-h qubits[9];
-h qubits[9];
-ccx qubits[1],qubits[7],qubits[9];
-h qubits[9];
-h qubits[9];
-cx qubits[0],qubits[8];
-cx qubits[0],qubits[2];
-h qubits[0];
-h qubits[0];
-ccx qubits[9],qubits[1],qubits[0];
-h qubits[0];
-h qubits[0];
-cx qubits[0],qubits[8];
-cx qubits[0],qubits[2];
-h qubits[1];
-h qubits[1];
-ccx qubits[2],qubits[8],qubits[1];
-h qubits[1];
-h qubits[1];
-cx qubits[7],qubits[8];
-h qubits[7];
-h qubits[7];
-ccx qubits[9],qubits[2],qubits[7];
-h qubits[7];
-h qubits[7];
-cx qubits[7],qubits[8];
-h qubits[2];
-h qubits[2];
-ccx qubits[7],qubits[9],qubits[2];
-h qubits[2];
-h qubits[2];
-cx qubits[0],qubits[7];
-cx qubits[0],qubits[6];
-cx qubits[0],qubits[1];
-h qubits[0];
-h qubits[0];
-ccx qubits[1],qubits[6],qubits[0];
-h qubits[0];
-h qubits[0];
-cx qubits[8],qubits[9];
-cx qubits[8],qubits[6];
-cx qubits[8],qubits[2];
-h qubits[8];
-h qubits[8];
-ccx qubits[2],qubits[6],qubits[8];
-h qubits[8];
-h qubits[8];
-cx qubits[7],qubits[8];
-cx qubits[9],qubits[7];
-cx qubits[9],qubits[4];
-cx qubits[4],qubits[9];
-cx qubits[2],qubits[4];
-cx qubits[7],qubits[2];
-cx qubits[7],qubits[0];
-cx qubits[0],qubits[7];
-cx qubits[6],qubits[8];
-cx qubits[2],qubits[6];
-cx qubits[6],qubits[1];
-x qubits[2];
-cx qubits[6],qubits[9];
-cx qubits[6],qubits[0];
-cx qubits[9],qubits[6];
-cx qubits[9],qubits[1];
-x qubits[9];
-cx qubits[2],qubits[8];
-cx qubits[0],qubits[1];
-cx qubits[0],qubits[5];
-cx qubits[9],qubits[7];
-cx qubits[1],qubits[2];
-cx qubits[2],qubits[9];
-h qubits[2];
-h qubits[2];
-ccx qubits[0],qubits[1],qubits[2];
-h qubits[2];
-h qubits[2];
-x qubits[3];
-x qubits[5];
-h qubits[15];
-h qubits[15];
-ccx qubits[2],qubits[3],qubits[15];
-h qubits[15];
-h qubits[15];
-h qubits[14];
-h qubits[14];
-ccx qubits[15],qubits[4],qubits[14];
-h qubits[14];
-h qubits[14];
-h qubits[13];
-h qubits[13];
-ccx qubits[14],qubits[5],qubits[13];
-h qubits[13];
-h qubits[13];
-h qubits[12];
-h qubits[12];
-ccx qubits[13],qubits[6],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[7],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[8],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[0];
-h qubits[0];
-ccx qubits[10],qubits[9],qubits[0];
-h qubits[0];
-h qubits[0];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[8],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[7],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[12];
-h qubits[12];
-ccx qubits[13],qubits[6],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[13];
-h qubits[13];
-ccx qubits[14],qubits[5],qubits[13];
-h qubits[13];
-h qubits[13];
-h qubits[14];
-h qubits[14];
-ccx qubits[15],qubits[4],qubits[14];
-h qubits[14];
-h qubits[14];
-h qubits[15];
-h qubits[15];
-ccx qubits[2],qubits[3],qubits[15];
-h qubits[15];
-h qubits[15];
-x qubits[3];
-cx qubits[0],qubits[3];
-cx qubits[0],qubits[2];
-x qubits[2];
-x qubits[9];
-cx qubits[0],qubits[9];
-cx qubits[0],qubits[7];
-cx qubits[0],qubits[8];
-h qubits[15];
-h qubits[15];
-ccx qubits[2],qubits[3],qubits[15];
-h qubits[15];
-h qubits[15];
-h qubits[14];
-h qubits[14];
-ccx qubits[15],qubits[4],qubits[14];
-h qubits[14];
-h qubits[14];
-h qubits[13];
-h qubits[13];
-ccx qubits[14],qubits[5],qubits[13];
-h qubits[13];
-h qubits[13];
-h qubits[12];
-h qubits[12];
-ccx qubits[13],qubits[6],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[7],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[8],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[0];
-h qubits[0];
-ccx qubits[10],qubits[9],qubits[0];
-h qubits[0];
-h qubits[0];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[8],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[7],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[12];
-h qubits[12];
-ccx qubits[13],qubits[6],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[13];
-h qubits[13];
-ccx qubits[14],qubits[5],qubits[13];
-h qubits[13];
-h qubits[13];
-h qubits[14];
-h qubits[14];
-ccx qubits[15],qubits[4],qubits[14];
-h qubits[14];
-h qubits[14];
-h qubits[15];
-h qubits[15];
-ccx qubits[2],qubits[3],qubits[15];
-h qubits[15];
-h qubits[15];
-cx qubits[0],qubits[1];
-cx qubits[0],qubits[7];
-cx qubits[0],qubits[6];
-cx qubits[0],qubits[8];
-cx qubits[0],qubits[3];
-cx qubits[0],qubits[4];
-x qubits[3];
-x qubits[4];
-h qubits[15];
-h qubits[15];
-ccx qubits[2],qubits[3],qubits[15];
-h qubits[15];
-h qubits[15];
-h qubits[14];
-h qubits[14];
-ccx qubits[15],qubits[4],qubits[14];
-h qubits[14];
-h qubits[14];
-h qubits[13];
-h qubits[13];
-ccx qubits[14],qubits[5],qubits[13];
-h qubits[13];
-h qubits[13];
-h qubits[12];
-h qubits[12];
-ccx qubits[13],qubits[6],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[7],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[8],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[0];
-h qubits[0];
-ccx qubits[10],qubits[9],qubits[0];
-h qubits[0];
-h qubits[0];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[8],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[7],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[12];
-h qubits[12];
-ccx qubits[13],qubits[6],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[13];
-h qubits[13];
-ccx qubits[14],qubits[5],qubits[13];
-h qubits[13];
-h qubits[13];
-h qubits[14];
-h qubits[14];
-ccx qubits[15],qubits[4],qubits[14];
-h qubits[14];
-h qubits[14];
-h qubits[15];
-h qubits[15];
-ccx qubits[2],qubits[3],qubits[15];
-h qubits[15];
-h qubits[15];
-x qubits[9];
-cx qubits[0],qubits[2];
-cx qubits[0],qubits[9];
-x qubits[2];
-cx qubits[0],qubits[7];
-cx qubits[0],qubits[3];
-cx qubits[0],qubits[8];
-x qubits[3];
-h qubits[15];
-h qubits[15];
-ccx qubits[2],qubits[3],qubits[15];
-h qubits[15];
-h qubits[15];
-h qubits[14];
-h qubits[14];
-ccx qubits[15],qubits[4],qubits[14];
-h qubits[14];
-h qubits[14];
-h qubits[13];
-h qubits[13];
-ccx qubits[14],qubits[5],qubits[13];
-h qubits[13];
-h qubits[13];
-h qubits[12];
-h qubits[12];
-ccx qubits[13],qubits[6],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[7],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[8],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[0];
-h qubits[0];
-ccx qubits[10],qubits[9],qubits[0];
-h qubits[0];
-h qubits[0];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[8],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[7],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[12];
-h qubits[12];
-ccx qubits[13],qubits[6],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[13];
-h qubits[13];
-ccx qubits[14],qubits[5],qubits[13];
-h qubits[13];
-h qubits[13];
-h qubits[14];
-h qubits[14];
-ccx qubits[15],qubits[4],qubits[14];
-h qubits[14];
-h qubits[14];
-h qubits[15];
-h qubits[15];
-ccx qubits[2],qubits[3],qubits[15];
-h qubits[15];
-h qubits[15];
-x qubits[7];
-x qubits[6];
-h qubits[2];
-h qubits[2];
-ccx qubits[0],qubits[1],qubits[2];
-h qubits[2];
-h qubits[2];
-cx qubits[2],qubits[9];
-cx qubits[1],qubits[2];
-cx qubits[9],qubits[7];
-cx qubits[9],qubits[6];
-cx qubits[9],qubits[1];
-cx qubits[0],qubits[6];
-cx qubits[6],qubits[9];
-cx qubits[0],qubits[8];
-cx qubits[0],qubits[5];
-cx qubits[0],qubits[4];
-cx qubits[0],qubits[3];
-cx qubits[0],qubits[1];
-x qubits[2];
-cx qubits[1],qubits[0];
-cx qubits[0],qubits[1];
-cx qubits[0],qubits[6];
-cx qubits[0],qubits[7];
-cx qubits[3],qubits[1];
-cx qubits[1],qubits[3];
-cx qubits[7],qubits[9];
-cx qubits[9],qubits[1];
-cx qubits[9],qubits[7];
-cx qubits[9],qubits[8];
-cx qubits[0],qubits[2];
-cx qubits[1],qubits[2];
-cx qubits[2],qubits[9];
-h qubits[2];
-h qubits[2];
-ccx qubits[0],qubits[1],qubits[2];
-h qubits[2];
-h qubits[2];
-x qubits[3];
-x qubits[4];
-x qubits[5];
-x qubits[6];
-x qubits[7];
-h qubits[15];
-h qubits[15];
-ccx qubits[2],qubits[3],qubits[15];
-h qubits[15];
-h qubits[15];
-h qubits[14];
-h qubits[14];
-ccx qubits[15],qubits[4],qubits[14];
-h qubits[14];
-h qubits[14];
-h qubits[13];
-h qubits[13];
-ccx qubits[14],qubits[5],qubits[13];
-h qubits[13];
-h qubits[13];
-h qubits[12];
-h qubits[12];
-ccx qubits[13],qubits[6],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[7],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[8],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[0];
-h qubits[0];
-ccx qubits[10],qubits[9],qubits[0];
-h qubits[0];
-h qubits[0];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[8],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[7],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[12];
-h qubits[12];
-ccx qubits[13],qubits[6],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[13];
-h qubits[13];
-ccx qubits[14],qubits[5],qubits[13];
-h qubits[13];
-h qubits[13];
-h qubits[14];
-h qubits[14];
-ccx qubits[15],qubits[4],qubits[14];
-h qubits[14];
-h qubits[14];
-h qubits[15];
-h qubits[15];
-ccx qubits[2],qubits[3],qubits[15];
-h qubits[15];
-h qubits[15];
-x qubits[7];
-x qubits[3];
-h qubits[2];
-h qubits[2];
-ccx qubits[0],qubits[1],qubits[2];
-h qubits[2];
-h qubits[2];
-cx qubits[2],qubits[9];
-cx qubits[1],qubits[2];
-cx qubits[0],qubits[2];
-cx qubits[9],qubits[8];
-cx qubits[9],qubits[7];
-cx qubits[9],qubits[1];
-cx qubits[7],qubits[9];
-cx qubits[1],qubits[3];
-cx qubits[3],qubits[1];
-cx qubits[0],qubits[7];
-cx qubits[0],qubits[6];
-cx qubits[0],qubits[1];
-x qubits[1];
-cx qubits[1],qubits[0];
-cx qubits[3],qubits[0];
-cx qubits[0],qubits[3];
-cx qubits[0],qubits[7];
-cx qubits[1],qubits[0];
-cx qubits[0],qubits[8];
-cx qubits[1],qubits[4];
-cx qubits[9],qubits[1];
-cx qubits[1],qubits[7];
-x qubits[7];
-cx qubits[9],qubits[6];
-cx qubits[9],qubits[8];
-cx qubits[0],qubits[2];
-cx qubits[1],qubits[2];
-cx qubits[2],qubits[9];
-h qubits[2];
-h qubits[2];
-ccx qubits[0],qubits[1],qubits[2];
-h qubits[2];
-h qubits[2];
-h qubits[15];
-h qubits[15];
-ccx qubits[2],qubits[3],qubits[15];
-h qubits[15];
-h qubits[15];
-h qubits[14];
-h qubits[14];
-ccx qubits[15],qubits[4],qubits[14];
-h qubits[14];
-h qubits[14];
-h qubits[13];
-h qubits[13];
-ccx qubits[14],qubits[5],qubits[13];
-h qubits[13];
-h qubits[13];
-h qubits[12];
-h qubits[12];
-ccx qubits[13],qubits[6],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[7],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[8],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[0];
-h qubits[0];
-ccx qubits[10],qubits[9],qubits[0];
-h qubits[0];
-h qubits[0];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[8],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[7],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[12];
-h qubits[12];
-ccx qubits[13],qubits[6],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[13];
-h qubits[13];
-ccx qubits[14],qubits[5],qubits[13];
-h qubits[13];
-h qubits[13];
-h qubits[14];
-h qubits[14];
-ccx qubits[15],qubits[4],qubits[14];
-h qubits[14];
-h qubits[14];
-h qubits[15];
-h qubits[15];
-ccx qubits[2],qubits[3],qubits[15];
-h qubits[15];
-h qubits[15];
-x qubits[7];
-x qubits[3];
-h qubits[2];
-h qubits[2];
-ccx qubits[0],qubits[1],qubits[2];
-h qubits[2];
-h qubits[2];
-cx qubits[2],qubits[9];
-cx qubits[1],qubits[2];
-cx qubits[0],qubits[2];
-cx qubits[9],qubits[8];
-cx qubits[9],qubits[7];
-cx qubits[9],qubits[6];
-cx qubits[9],qubits[1];
-cx qubits[1],qubits[8];
-cx qubits[1],qubits[4];
-cx qubits[0],qubits[7];
-cx qubits[1],qubits[0];
-cx qubits[0],qubits[8];
-cx qubits[0],qubits[3];
-cx qubits[3],qubits[0];
-x qubits[3];
-cx qubits[4],qubits[0];
-cx qubits[0],qubits[4];
-cx qubits[7],qubits[9];
-cx qubits[9],qubits[7];
-cx qubits[0],qubits[7];
-x qubits[7];
-cx qubits[3],qubits[1];
-cx qubits[1],qubits[3];
-cx qubits[9],qubits[1];
-cx qubits[9],qubits[8];
-cx qubits[0],qubits[2];
-cx qubits[1],qubits[2];
-cx qubits[2],qubits[9];
-h qubits[2];
-h qubits[2];
-ccx qubits[0],qubits[1],qubits[2];
-h qubits[2];
-h qubits[2];
-x qubits[3];
-x qubits[4];
-h qubits[15];
-h qubits[15];
-ccx qubits[2],qubits[3],qubits[15];
-h qubits[15];
-h qubits[15];
-h qubits[14];
-h qubits[14];
-ccx qubits[15],qubits[4],qubits[14];
-h qubits[14];
-h qubits[14];
-h qubits[13];
-h qubits[13];
-ccx qubits[14],qubits[5],qubits[13];
-h qubits[13];
-h qubits[13];
-h qubits[12];
-h qubits[12];
-ccx qubits[13],qubits[6],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[7],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[8],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[0];
-h qubits[0];
-ccx qubits[10],qubits[9],qubits[0];
-h qubits[0];
-h qubits[0];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[8],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[7],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[12];
-h qubits[12];
-ccx qubits[13],qubits[6],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[13];
-h qubits[13];
-ccx qubits[14],qubits[5],qubits[13];
-h qubits[13];
-h qubits[13];
-h qubits[14];
-h qubits[14];
-ccx qubits[15],qubits[4],qubits[14];
-h qubits[14];
-h qubits[14];
-h qubits[15];
-h qubits[15];
-ccx qubits[2],qubits[3],qubits[15];
-h qubits[15];
-h qubits[15];
-x qubits[4];
-x qubits[7];
-h qubits[2];
-h qubits[2];
-ccx qubits[0],qubits[1],qubits[2];
-h qubits[2];
-h qubits[2];
-cx qubits[2],qubits[9];
-cx qubits[1],qubits[2];
-cx qubits[0],qubits[2];
-cx qubits[9],qubits[8];
-cx qubits[9],qubits[7];
-cx qubits[9],qubits[1];
-cx qubits[1],qubits[3];
-cx qubits[0],qubits[7];
-cx qubits[7],qubits[9];
-cx qubits[3],qubits[4];
-cx qubits[4],qubits[3];
-cx qubits[0],qubits[4];
-x qubits[3];
-cx qubits[4],qubits[0];
-cx qubits[3],qubits[4];
-cx qubits[0],qubits[6];
-cx qubits[1],qubits[0];
-cx qubits[0],qubits[7];
-cx qubits[9],qubits[8];
-cx qubits[9],qubits[2];
-cx qubits[0],qubits[9];
-cx qubits[1],qubits[5];
-cx qubits[9],qubits[3];
-cx qubits[9],qubits[4];
-cx qubits[9],qubits[5];
-cx qubits[9],qubits[6];
-cx qubits[2],qubits[9];
-h qubits[2];
-h qubits[2];
-ccx qubits[0],qubits[1],qubits[2];
-h qubits[2];
-h qubits[2];
-x qubits[7];
-h qubits[15];
-h qubits[15];
-ccx qubits[2],qubits[3],qubits[15];
-h qubits[15];
-h qubits[15];
-h qubits[14];
-h qubits[14];
-ccx qubits[15],qubits[4],qubits[14];
-h qubits[14];
-h qubits[14];
-h qubits[13];
-h qubits[13];
-ccx qubits[14],qubits[5],qubits[13];
-h qubits[13];
-h qubits[13];
-h qubits[12];
-h qubits[12];
-ccx qubits[13],qubits[6],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[7],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[8],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[0];
-h qubits[0];
-ccx qubits[10],qubits[9],qubits[0];
-h qubits[0];
-h qubits[0];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[8],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[7],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[12];
-h qubits[12];
-ccx qubits[13],qubits[6],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[13];
-h qubits[13];
-ccx qubits[14],qubits[5],qubits[13];
-h qubits[13];
-h qubits[13];
-h qubits[14];
-h qubits[14];
-ccx qubits[15],qubits[4],qubits[14];
-h qubits[14];
-h qubits[14];
-h qubits[15];
-h qubits[15];
-ccx qubits[2],qubits[3],qubits[15];
-h qubits[15];
-h qubits[15];
-x qubits[3];
-h qubits[2];
-h qubits[2];
-ccx qubits[0],qubits[1],qubits[2];
-h qubits[2];
-h qubits[2];
-cx qubits[2],qubits[9];
-cx qubits[0],qubits[2];
-cx qubits[9],qubits[8];
-cx qubits[9],qubits[6];
-cx qubits[9],qubits[5];
-cx qubits[9],qubits[4];
-cx qubits[9],qubits[3];
-cx qubits[9],qubits[2];
-cx qubits[1],qubits[6];
-cx qubits[1],qubits[5];
-cx qubits[1],qubits[4];
-cx qubits[1],qubits[3];
-cx qubits[0],qubits[3];
-cx qubits[3],qubits[1];
-cx qubits[0],qubits[9];
-cx qubits[0],qubits[8];
-cx qubits[0],qubits[7];
-cx qubits[0],qubits[6];
-cx qubits[0],qubits[4];
-cx qubits[1],qubits[0];
-x qubits[2];
-cx qubits[0],qubits[3];
-cx qubits[0],qubits[5];
-cx qubits[0],qubits[8];
-cx qubits[6],qubits[9];
-cx qubits[9],qubits[1];
-cx qubits[9],qubits[6];
-cx qubits[9],qubits[7];
-cx qubits[1],qubits[2];
-cx qubits[2],qubits[9];
-h qubits[2];
-h qubits[2];
-ccx qubits[0],qubits[1],qubits[2];
-h qubits[2];
-h qubits[2];
-x qubits[3];
-x qubits[4];
-x qubits[5];
-x qubits[6];
-h qubits[15];
-h qubits[15];
-ccx qubits[2],qubits[3],qubits[15];
-h qubits[15];
-h qubits[15];
-h qubits[14];
-h qubits[14];
-ccx qubits[15],qubits[4],qubits[14];
-h qubits[14];
-h qubits[14];
-h qubits[13];
-h qubits[13];
-ccx qubits[14],qubits[5],qubits[13];
-h qubits[13];
-h qubits[13];
-h qubits[12];
-h qubits[12];
-ccx qubits[13],qubits[6],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[7],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[8],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[0];
-h qubits[0];
-ccx qubits[10],qubits[9],qubits[0];
-h qubits[0];
-h qubits[0];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[8],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[7],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[12];
-h qubits[12];
-ccx qubits[13],qubits[6],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[13];
-h qubits[13];
-ccx qubits[14],qubits[5],qubits[13];
-h qubits[13];
-h qubits[13];
-h qubits[14];
-h qubits[14];
-ccx qubits[15],qubits[4],qubits[14];
-h qubits[14];
-h qubits[14];
-h qubits[15];
-h qubits[15];
-ccx qubits[2],qubits[3],qubits[15];
-h qubits[15];
-h qubits[15];
-cx qubits[0],qubits[1];
-cx qubits[0],qubits[7];
-cx qubits[0],qubits[6];
-cx qubits[0],qubits[8];
-cx qubits[0],qubits[3];
-cx qubits[0],qubits[4];
-x qubits[3];
-x qubits[4];
-h qubits[15];
-h qubits[15];
-ccx qubits[2],qubits[3],qubits[15];
-h qubits[15];
-h qubits[15];
-h qubits[14];
-h qubits[14];
-ccx qubits[15],qubits[4],qubits[14];
-h qubits[14];
-h qubits[14];
-h qubits[13];
-h qubits[13];
-ccx qubits[14],qubits[5],qubits[13];
-h qubits[13];
-h qubits[13];
-h qubits[12];
-h qubits[12];
-ccx qubits[13],qubits[6],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[7],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[8],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[0];
-h qubits[0];
-ccx qubits[10],qubits[9],qubits[0];
-h qubits[0];
-h qubits[0];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[8],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[7],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[12];
-h qubits[12];
-ccx qubits[13],qubits[6],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[13];
-h qubits[13];
-ccx qubits[14],qubits[5],qubits[13];
-h qubits[13];
-h qubits[13];
-h qubits[14];
-h qubits[14];
-ccx qubits[15],qubits[4],qubits[14];
-h qubits[14];
-h qubits[14];
-h qubits[15];
-h qubits[15];
-ccx qubits[2],qubits[3],qubits[15];
-h qubits[15];
-h qubits[15];
-x qubits[9];
-cx qubits[0],qubits[2];
-cx qubits[0],qubits[9];
-x qubits[2];
-x qubits[1];
-cx qubits[0],qubits[7];
-cx qubits[0],qubits[3];
-cx qubits[0],qubits[8];
-x qubits[3];
-h qubits[15];
-h qubits[15];
-ccx qubits[2],qubits[3],qubits[15];
-h qubits[15];
-h qubits[15];
-h qubits[14];
-h qubits[14];
-ccx qubits[15],qubits[4],qubits[14];
-h qubits[14];
-h qubits[14];
-h qubits[13];
-h qubits[13];
-ccx qubits[14],qubits[5],qubits[13];
-h qubits[13];
-h qubits[13];
-h qubits[12];
-h qubits[12];
-ccx qubits[13],qubits[6],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[7],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[8],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[0];
-h qubits[0];
-ccx qubits[10],qubits[9],qubits[0];
-h qubits[0];
-h qubits[0];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[8],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[7],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[12];
-h qubits[12];
-ccx qubits[13],qubits[6],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[13];
-h qubits[13];
-ccx qubits[14],qubits[5],qubits[13];
-h qubits[13];
-h qubits[13];
-h qubits[14];
-h qubits[14];
-ccx qubits[15],qubits[4],qubits[14];
-h qubits[14];
-h qubits[14];
-h qubits[15];
-h qubits[15];
-ccx qubits[2],qubits[3],qubits[15];
-h qubits[15];
-h qubits[15];
-x qubits[7];
-x qubits[6];
-h qubits[2];
-h qubits[2];
-ccx qubits[0],qubits[1],qubits[2];
-h qubits[2];
-h qubits[2];
-cx qubits[2],qubits[9];
-cx qubits[1],qubits[2];
-cx qubits[9],qubits[7];
-cx qubits[9],qubits[6];
-cx qubits[9],qubits[1];
-cx qubits[0],qubits[6];
-cx qubits[6],qubits[9];
-cx qubits[0],qubits[8];
-cx qubits[0],qubits[5];
-cx qubits[0],qubits[4];
-cx qubits[0],qubits[3];
-cx qubits[0],qubits[1];
-x qubits[2];
-cx qubits[1],qubits[0];
-cx qubits[0],qubits[1];
-cx qubits[0],qubits[6];
-cx qubits[0],qubits[7];
-cx qubits[3],qubits[1];
-cx qubits[1],qubits[3];
-cx qubits[7],qubits[9];
-cx qubits[9],qubits[1];
-cx qubits[9],qubits[7];
-cx qubits[9],qubits[8];
-cx qubits[0],qubits[2];
-cx qubits[1],qubits[2];
-cx qubits[2],qubits[9];
-h qubits[2];
-h qubits[2];
-ccx qubits[0],qubits[1],qubits[2];
-h qubits[2];
-h qubits[2];
-x qubits[3];
-x qubits[4];
-x qubits[5];
-x qubits[6];
-x qubits[7];
-h qubits[15];
-h qubits[15];
-ccx qubits[2],qubits[3],qubits[15];
-h qubits[15];
-h qubits[15];
-h qubits[14];
-h qubits[14];
-ccx qubits[15],qubits[4],qubits[14];
-h qubits[14];
-h qubits[14];
-h qubits[13];
-h qubits[13];
-ccx qubits[14],qubits[5],qubits[13];
-h qubits[13];
-h qubits[13];
-h qubits[12];
-h qubits[12];
-ccx qubits[13],qubits[6],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[7],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[8],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[0];
-h qubits[0];
-ccx qubits[10],qubits[9],qubits[0];
-h qubits[0];
-h qubits[0];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[8],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[7],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[12];
-h qubits[12];
-ccx qubits[13],qubits[6],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[13];
-h qubits[13];
-ccx qubits[14],qubits[5],qubits[13];
-h qubits[13];
-h qubits[13];
-h qubits[14];
-h qubits[14];
-ccx qubits[15],qubits[4],qubits[14];
-h qubits[14];
-h qubits[14];
-h qubits[15];
-h qubits[15];
-ccx qubits[2],qubits[3],qubits[15];
-h qubits[15];
-h qubits[15];
-x qubits[7];
-x qubits[4];
-x qubits[3];
-h qubits[2];
-h qubits[2];
-ccx qubits[0],qubits[1],qubits[2];
-h qubits[2];
-h qubits[2];
-cx qubits[2],qubits[9];
-cx qubits[1],qubits[2];
-cx qubits[0],qubits[2];
-cx qubits[9],qubits[8];
-cx qubits[9],qubits[7];
-cx qubits[9],qubits[1];
-cx qubits[7],qubits[9];
-cx qubits[1],qubits[3];
-cx qubits[3],qubits[1];
-cx qubits[0],qubits[7];
-cx qubits[0],qubits[6];
-cx qubits[0],qubits[1];
-x qubits[1];
-cx qubits[1],qubits[0];
-cx qubits[3],qubits[0];
-cx qubits[0],qubits[3];
-cx qubits[0],qubits[7];
-cx qubits[0],qubits[8];
-cx qubits[4],qubits[1];
-cx qubits[0],qubits[2];
-cx qubits[1],qubits[0];
-cx qubits[1],qubits[4];
-cx qubits[1],qubits[7];
-cx qubits[9],qubits[1];
-cx qubits[1],qubits[8];
-cx qubits[1],qubits[2];
-cx qubits[2],qubits[9];
-h qubits[2];
-h qubits[2];
-ccx qubits[0],qubits[1],qubits[2];
-h qubits[2];
-h qubits[2];
-x qubits[4];
-x qubits[7];
-h qubits[15];
-h qubits[15];
-ccx qubits[2],qubits[3],qubits[15];
-h qubits[15];
-h qubits[15];
-h qubits[14];
-h qubits[14];
-ccx qubits[15],qubits[4],qubits[14];
-h qubits[14];
-h qubits[14];
-h qubits[13];
-h qubits[13];
-ccx qubits[14],qubits[5],qubits[13];
-h qubits[13];
-h qubits[13];
-h qubits[12];
-h qubits[12];
-ccx qubits[13],qubits[6],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[7],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[8],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[0];
-h qubits[0];
-ccx qubits[10],qubits[9],qubits[0];
-h qubits[0];
-h qubits[0];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[8],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[7],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[12];
-h qubits[12];
-ccx qubits[13],qubits[6],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[13];
-h qubits[13];
-ccx qubits[14],qubits[5],qubits[13];
-h qubits[13];
-h qubits[13];
-h qubits[14];
-h qubits[14];
-ccx qubits[15],qubits[4],qubits[14];
-h qubits[14];
-h qubits[14];
-h qubits[15];
-h qubits[15];
-ccx qubits[2],qubits[3],qubits[15];
-h qubits[15];
-h qubits[15];
-x qubits[4];
-h qubits[2];
-h qubits[2];
-ccx qubits[0],qubits[1],qubits[2];
-h qubits[2];
-h qubits[2];
-cx qubits[2],qubits[9];
-cx qubits[9],qubits[1];
-x qubits[2];
-cx qubits[9],qubits[2];
-cx qubits[0],qubits[2];
-cx qubits[9],qubits[8];
-cx qubits[1],qubits[8];
-cx qubits[1],qubits[7];
-cx qubits[1],qubits[4];
-cx qubits[1],qubits[0];
-cx qubits[4],qubits[1];
-cx qubits[0],qubits[7];
-x qubits[6];
-cx qubits[0],qubits[4];
-cx qubits[0],qubits[9];
-cx qubits[6],qubits[9];
-cx qubits[9],qubits[1];
-cx qubits[9],qubits[6];
-cx qubits[9],qubits[7];
-cx qubits[1],qubits[2];
-cx qubits[2],qubits[9];
-h qubits[2];
-h qubits[2];
-ccx qubits[0],qubits[1],qubits[2];
-h qubits[2];
-h qubits[2];
-x qubits[6];
-h qubits[15];
-h qubits[15];
-ccx qubits[2],qubits[3],qubits[15];
-h qubits[15];
-h qubits[15];
-h qubits[14];
-h qubits[14];
-ccx qubits[15],qubits[4],qubits[14];
-h qubits[14];
-h qubits[14];
-h qubits[13];
-h qubits[13];
-ccx qubits[14],qubits[5],qubits[13];
-h qubits[13];
-h qubits[13];
-h qubits[12];
-h qubits[12];
-ccx qubits[13],qubits[6],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[7],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[8],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[0];
-h qubits[0];
-ccx qubits[10],qubits[9],qubits[0];
-h qubits[0];
-h qubits[0];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[8],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[7],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[12];
-h qubits[12];
-ccx qubits[13],qubits[6],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[13];
-h qubits[13];
-ccx qubits[14],qubits[5],qubits[13];
-h qubits[13];
-h qubits[13];
-h qubits[14];
-h qubits[14];
-ccx qubits[15],qubits[4],qubits[14];
-h qubits[14];
-h qubits[14];
-h qubits[15];
-h qubits[15];
-ccx qubits[2],qubits[3],qubits[15];
-h qubits[15];
-h qubits[15];
-x qubits[6];
-x qubits[3];
-h qubits[2];
-h qubits[2];
-ccx qubits[0],qubits[1],qubits[2];
-h qubits[2];
-h qubits[2];
-cx qubits[2],qubits[9];
-cx qubits[1],qubits[2];
-cx qubits[9],qubits[7];
-cx qubits[9],qubits[6];
-cx qubits[9],qubits[1];
-cx qubits[6],qubits[9];
-cx qubits[0],qubits[9];
-cx qubits[0],qubits[8];
-cx qubits[0],qubits[3];
-x qubits[0];
-cx qubits[3],qubits[0];
-cx qubits[3],qubits[4];
-cx qubits[0],qubits[3];
-x qubits[2];
-cx qubits[0],qubits[5];
-cx qubits[0],qubits[7];
-cx qubits[0],qubits[8];
-cx qubits[0],qubits[9];
-cx qubits[4],qubits[1];
-cx qubits[1],qubits[0];
-cx qubits[1],qubits[4];
-cx qubits[1],qubits[6];
-cx qubits[1],qubits[8];
-cx qubits[1],qubits[9];
-cx qubits[9],qubits[0];
-cx qubits[1],qubits[2];
-cx qubits[9],qubits[1];
-cx qubits[9],qubits[3];
-cx qubits[9],qubits[4];
-cx qubits[0],qubits[2];
-cx qubits[2],qubits[9];
-h qubits[2];
-h qubits[2];
-ccx qubits[0],qubits[1],qubits[2];
-h qubits[2];
-h qubits[2];
-x qubits[3];
-x qubits[4];
-x qubits[6];
-h qubits[15];
-h qubits[15];
-ccx qubits[2],qubits[3],qubits[15];
-h qubits[15];
-h qubits[15];
-h qubits[14];
-h qubits[14];
-ccx qubits[15],qubits[4],qubits[14];
-h qubits[14];
-h qubits[14];
-h qubits[13];
-h qubits[13];
-ccx qubits[14],qubits[5],qubits[13];
-h qubits[13];
-h qubits[13];
-h qubits[12];
-h qubits[12];
-ccx qubits[13],qubits[6],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[7],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[8],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[0];
-h qubits[0];
-ccx qubits[10],qubits[9],qubits[0];
-h qubits[0];
-h qubits[0];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[8],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[7],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[12];
-h qubits[12];
-ccx qubits[13],qubits[6],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[13];
-h qubits[13];
-ccx qubits[14],qubits[5],qubits[13];
-h qubits[13];
-h qubits[13];
-h qubits[14];
-h qubits[14];
-ccx qubits[15],qubits[4],qubits[14];
-h qubits[14];
-h qubits[14];
-h qubits[15];
-h qubits[15];
-ccx qubits[2],qubits[3],qubits[15];
-h qubits[15];
-h qubits[15];
-x qubits[4];
-h qubits[2];
-h qubits[2];
-ccx qubits[0],qubits[1],qubits[2];
-h qubits[2];
-h qubits[2];
-cx qubits[2],qubits[9];
-cx qubits[9],qubits[1];
-cx qubits[1],qubits[0];
-cx qubits[0],qubits[2];
-cx qubits[9],qubits[4];
-cx qubits[9],qubits[0];
-cx qubits[0],qubits[9];
-cx qubits[9],qubits[3];
-cx qubits[1],qubits[9];
-cx qubits[1],qubits[8];
-cx qubits[1],qubits[6];
-cx qubits[1],qubits[4];
-cx qubits[4],qubits[1];
-cx qubits[0],qubits[8];
-x qubits[0];
-cx qubits[0],qubits[7];
-x qubits[1];
-cx qubits[0],qubits[9];
-cx qubits[1],qubits[2];
-cx qubits[1],qubits[3];
-cx qubits[6],qubits[9];
-cx qubits[9],qubits[1];
-cx qubits[9],qubits[6];
-cx qubits[9],qubits[8];
-cx qubits[1],qubits[2];
-cx qubits[2],qubits[9];
-h qubits[2];
-h qubits[2];
-ccx qubits[0],qubits[1],qubits[2];
-h qubits[2];
-h qubits[2];
-x qubits[3];
-x qubits[6];
-h qubits[15];
-h qubits[15];
-ccx qubits[2],qubits[3],qubits[15];
-h qubits[15];
-h qubits[15];
-h qubits[14];
-h qubits[14];
-ccx qubits[15],qubits[4],qubits[14];
-h qubits[14];
-h qubits[14];
-h qubits[13];
-h qubits[13];
-ccx qubits[14],qubits[5],qubits[13];
-h qubits[13];
-h qubits[13];
-h qubits[12];
-h qubits[12];
-ccx qubits[13],qubits[6],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[7],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[8],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[0];
-h qubits[0];
-ccx qubits[10],qubits[9],qubits[0];
-h qubits[0];
-h qubits[0];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[8],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[7],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[12];
-h qubits[12];
-ccx qubits[13],qubits[6],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[13];
-h qubits[13];
-ccx qubits[14],qubits[5],qubits[13];
-h qubits[13];
-h qubits[13];
-h qubits[14];
-h qubits[14];
-ccx qubits[15],qubits[4],qubits[14];
-h qubits[14];
-h qubits[14];
-h qubits[15];
-h qubits[15];
-ccx qubits[2],qubits[3],qubits[15];
-h qubits[15];
-h qubits[15];
-x qubits[6];
-h qubits[2];
-h qubits[2];
-ccx qubits[0],qubits[1],qubits[2];
-h qubits[2];
-h qubits[2];
-cx qubits[2],qubits[9];
-cx qubits[9],qubits[2];
-cx qubits[9],qubits[1];
-cx qubits[9],qubits[8];
-cx qubits[9],qubits[6];
-cx qubits[6],qubits[9];
-cx qubits[1],qubits[3];
-cx qubits[0],qubits[9];
-cx qubits[0],qubits[5];
-cx qubits[0],qubits[4];
-cx qubits[3],qubits[0];
-x qubits[3];
-cx qubits[3],qubits[1];
-cx qubits[0],qubits[3];
-cx qubits[1],qubits[0];
-cx qubits[0],qubits[6];
-cx qubits[0],qubits[8];
-cx qubits[1],qubits[2];
-cx qubits[1],qubits[4];
-cx qubits[9],qubits[1];
-cx qubits[9],qubits[8];
-cx qubits[1],qubits[2];
-cx qubits[2],qubits[9];
-h qubits[2];
-h qubits[2];
-ccx qubits[0],qubits[1],qubits[2];
-h qubits[2];
-h qubits[2];
-x qubits[4];
-x qubits[5];
-x qubits[6];
-h qubits[15];
-h qubits[15];
-ccx qubits[2],qubits[3],qubits[15];
-h qubits[15];
-h qubits[15];
-h qubits[14];
-h qubits[14];
-ccx qubits[15],qubits[4],qubits[14];
-h qubits[14];
-h qubits[14];
-h qubits[13];
-h qubits[13];
-ccx qubits[14],qubits[5],qubits[13];
-h qubits[13];
-h qubits[13];
-h qubits[12];
-h qubits[12];
-ccx qubits[13],qubits[6],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[7],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[8],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[0];
-h qubits[0];
-ccx qubits[10],qubits[9],qubits[0];
-h qubits[0];
-h qubits[0];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[8],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[7],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[12];
-h qubits[12];
-ccx qubits[13],qubits[6],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[13];
-h qubits[13];
-ccx qubits[14],qubits[5],qubits[13];
-h qubits[13];
-h qubits[13];
-h qubits[14];
-h qubits[14];
-ccx qubits[15],qubits[4],qubits[14];
-h qubits[14];
-h qubits[14];
-h qubits[15];
-h qubits[15];
-ccx qubits[2],qubits[3],qubits[15];
-h qubits[15];
-h qubits[15];
-x qubits[6];
-h qubits[2];
-h qubits[2];
-ccx qubits[0],qubits[1],qubits[2];
-h qubits[2];
-h qubits[2];
-cx qubits[2],qubits[9];
-x qubits[2];
-cx qubits[9],qubits[2];
-cx qubits[1],qubits[8];
-cx qubits[9],qubits[1];
-cx qubits[0],qubits[4];
-cx qubits[1],qubits[0];
-cx qubits[0],qubits[7];
-cx qubits[0],qubits[9];
-cx qubits[1],qubits[6];
-cx qubits[6],qubits[9];
-cx qubits[9],qubits[1];
-cx qubits[9],qubits[6];
-cx qubits[9],qubits[7];
-cx qubits[0],qubits[2];
-cx qubits[1],qubits[2];
-cx qubits[2],qubits[9];
-h qubits[2];
-h qubits[2];
-ccx qubits[0],qubits[1],qubits[2];
-h qubits[2];
-h qubits[2];
-x qubits[4];
-x qubits[6];
-h qubits[15];
-h qubits[15];
-ccx qubits[2],qubits[3],qubits[15];
-h qubits[15];
-h qubits[15];
-h qubits[14];
-h qubits[14];
-ccx qubits[15],qubits[4],qubits[14];
-h qubits[14];
-h qubits[14];
-h qubits[13];
-h qubits[13];
-ccx qubits[14],qubits[5],qubits[13];
-h qubits[13];
-h qubits[13];
-h qubits[12];
-h qubits[12];
-ccx qubits[13],qubits[6],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[7],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[8],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[0];
-h qubits[0];
-ccx qubits[10],qubits[9],qubits[0];
-h qubits[0];
-h qubits[0];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[8],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[7],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[12];
-h qubits[12];
-ccx qubits[13],qubits[6],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[13];
-h qubits[13];
-ccx qubits[14],qubits[5],qubits[13];
-h qubits[13];
-h qubits[13];
-h qubits[14];
-h qubits[14];
-ccx qubits[15],qubits[4],qubits[14];
-h qubits[14];
-h qubits[14];
-h qubits[15];
-h qubits[15];
-ccx qubits[2],qubits[3],qubits[15];
-h qubits[15];
-h qubits[15];
-x qubits[6];
-x qubits[3];
-h qubits[2];
-h qubits[2];
-ccx qubits[0],qubits[1],qubits[2];
-h qubits[2];
-h qubits[2];
-cx qubits[2],qubits[9];
-cx qubits[1],qubits[2];
-cx qubits[0],qubits[2];
-cx qubits[9],qubits[7];
-cx qubits[1],qubits[6];
-cx qubits[9],qubits[1];
-cx qubits[6],qubits[9];
-cx qubits[1],qubits[8];
-cx qubits[1],qubits[7];
-cx qubits[1],qubits[4];
-cx qubits[0],qubits[3];
-cx qubits[1],qubits[0];
-cx qubits[3],qubits[1];
-cx qubits[0],qubits[9];
-cx qubits[0],qubits[8];
-cx qubits[0],qubits[7];
-cx qubits[0],qubits[6];
-cx qubits[0],qubits[4];
-cx qubits[1],qubits[0];
-cx qubits[0],qubits[2];
-cx qubits[1],qubits[3];
-x qubits[0];
-cx qubits[0],qubits[1];
-cx qubits[0],qubits[4];
-cx qubits[0],qubits[5];
-cx qubits[0],qubits[6];
-cx qubits[1],qubits[0];
-cx qubits[0],qubits[8];
-cx qubits[0],qubits[9];
-cx qubits[3],qubits[9];
-cx qubits[9],qubits[0];
-cx qubits[1],qubits[2];
-cx qubits[9],qubits[1];
-cx qubits[9],qubits[3];
-cx qubits[9],qubits[4];
-cx qubits[9],qubits[6];
-cx qubits[9],qubits[8];
-cx qubits[0],qubits[2];
-cx qubits[2],qubits[9];
-h qubits[2];
-h qubits[2];
-ccx qubits[0],qubits[1],qubits[2];
-h qubits[2];
-h qubits[2];
-x qubits[3];
-x qubits[6];
-h qubits[15];
-h qubits[15];
-ccx qubits[2],qubits[3],qubits[15];
-h qubits[15];
-h qubits[15];
-h qubits[14];
-h qubits[14];
-ccx qubits[15],qubits[4],qubits[14];
-h qubits[14];
-h qubits[14];
-h qubits[13];
-h qubits[13];
-ccx qubits[14],qubits[5],qubits[13];
-h qubits[13];
-h qubits[13];
-h qubits[12];
-h qubits[12];
-ccx qubits[13],qubits[6],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[7],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[8],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[0];
-h qubits[0];
-ccx qubits[10],qubits[9],qubits[0];
-h qubits[0];
-h qubits[0];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[8],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[7],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[12];
-h qubits[12];
-ccx qubits[13],qubits[6],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[13];
-h qubits[13];
-ccx qubits[14],qubits[5],qubits[13];
-h qubits[13];
-h qubits[13];
-h qubits[14];
-h qubits[14];
-ccx qubits[15],qubits[4],qubits[14];
-h qubits[14];
-h qubits[14];
-h qubits[15];
-h qubits[15];
-ccx qubits[2],qubits[3],qubits[15];
-h qubits[15];
-h qubits[15];
-x qubits[3];
-h qubits[2];
-h qubits[2];
-ccx qubits[0],qubits[1],qubits[2];
-h qubits[2];
-h qubits[2];
-cx qubits[2],qubits[9];
-cx qubits[9],qubits[1];
-cx qubits[0],qubits[8];
-cx qubits[1],qubits[0];
-cx qubits[9],qubits[2];
-cx qubits[0],qubits[6];
-x qubits[9];
-cx qubits[9],qubits[0];
-cx qubits[9],qubits[4];
-cx qubits[0],qubits[9];
-cx qubits[9],qubits[3];
-cx qubits[7],qubits[9];
-cx qubits[1],qubits[3];
-cx qubits[3],qubits[9];
-cx qubits[3],qubits[1];
-cx qubits[0],qubits[1];
-cx qubits[1],qubits[3];
-cx qubits[9],qubits[1];
-cx qubits[9],qubits[7];
-cx qubits[9],qubits[8];
-cx qubits[1],qubits[2];
-cx qubits[2],qubits[9];
-h qubits[2];
-h qubits[2];
-ccx qubits[0],qubits[1],qubits[2];
-h qubits[2];
-h qubits[2];
-x qubits[6];
-h qubits[15];
-h qubits[15];
-ccx qubits[2],qubits[3],qubits[15];
-h qubits[15];
-h qubits[15];
-h qubits[14];
-h qubits[14];
-ccx qubits[15],qubits[4],qubits[14];
-h qubits[14];
-h qubits[14];
-h qubits[13];
-h qubits[13];
-ccx qubits[14],qubits[5],qubits[13];
-h qubits[13];
-h qubits[13];
-h qubits[12];
-h qubits[12];
-ccx qubits[13],qubits[6],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[7],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[8],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[0];
-h qubits[0];
-ccx qubits[10],qubits[9],qubits[0];
-h qubits[0];
-h qubits[0];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[8],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[7],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[12];
-h qubits[12];
-ccx qubits[13],qubits[6],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[13];
-h qubits[13];
-ccx qubits[14],qubits[5],qubits[13];
-h qubits[13];
-h qubits[13];
-h qubits[14];
-h qubits[14];
-ccx qubits[15],qubits[4],qubits[14];
-h qubits[14];
-h qubits[14];
-h qubits[15];
-h qubits[15];
-ccx qubits[2],qubits[3],qubits[15];
-h qubits[15];
-h qubits[15];
-x qubits[7];
-x qubits[5];
-x qubits[3];
-h qubits[2];
-h qubits[2];
-ccx qubits[0],qubits[1],qubits[2];
-h qubits[2];
-h qubits[2];
-cx qubits[2],qubits[9];
-cx qubits[9],qubits[2];
-cx qubits[9],qubits[1];
-cx qubits[9],qubits[8];
-cx qubits[9],qubits[7];
-cx qubits[7],qubits[9];
-cx qubits[0],qubits[3];
-cx qubits[1],qubits[0];
-cx qubits[0],qubits[6];
-cx qubits[0],qubits[8];
-cx qubits[1],qubits[4];
-cx qubits[5],qubits[9];
-cx qubits[9],qubits[1];
-x qubits[5];
-cx qubits[1],qubits[5];
-cx qubits[9],qubits[6];
-cx qubits[1],qubits[2];
-cx qubits[2],qubits[9];
-h qubits[2];
-h qubits[2];
-ccx qubits[0],qubits[1],qubits[2];
-h qubits[2];
-h qubits[2];
-x qubits[7];
-h qubits[15];
-h qubits[15];
-ccx qubits[2],qubits[3],qubits[15];
-h qubits[15];
-h qubits[15];
-h qubits[14];
-h qubits[14];
-ccx qubits[15],qubits[4],qubits[14];
-h qubits[14];
-h qubits[14];
-h qubits[13];
-h qubits[13];
-ccx qubits[14],qubits[5],qubits[13];
-h qubits[13];
-h qubits[13];
-h qubits[12];
-h qubits[12];
-ccx qubits[13],qubits[6],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[7],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[8],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[0];
-h qubits[0];
-ccx qubits[10],qubits[9],qubits[0];
-h qubits[0];
-h qubits[0];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[8],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[7],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[12];
-h qubits[12];
-ccx qubits[13],qubits[6],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[13];
-h qubits[13];
-ccx qubits[14],qubits[5],qubits[13];
-h qubits[13];
-h qubits[13];
-h qubits[14];
-h qubits[14];
-ccx qubits[15],qubits[4],qubits[14];
-h qubits[14];
-h qubits[14];
-h qubits[15];
-h qubits[15];
-ccx qubits[2],qubits[3],qubits[15];
-h qubits[15];
-h qubits[15];
-x qubits[5];
-x qubits[3];
-h qubits[2];
-h qubits[2];
-ccx qubits[0],qubits[1],qubits[2];
-h qubits[2];
-h qubits[2];
-cx qubits[2],qubits[9];
-cx qubits[1],qubits[2];
-cx qubits[0],qubits[2];
-cx qubits[9],qubits[6];
-cx qubits[1],qubits[5];
-cx qubits[9],qubits[1];
-cx qubits[5],qubits[9];
-cx qubits[1],qubits[8];
-cx qubits[1],qubits[6];
-cx qubits[1],qubits[4];
-cx qubits[0],qubits[3];
-cx qubits[1],qubits[0];
-x qubits[1];
-cx qubits[3],qubits[1];
-cx qubits[0],qubits[9];
-cx qubits[0],qubits[8];
-cx qubits[0],qubits[6];
-cx qubits[0],qubits[5];
-cx qubits[0],qubits[4];
-cx qubits[0],qubits[2];
-cx qubits[6],qubits[9];
-x qubits[9];
-cx qubits[9],qubits[6];
-x qubits[2];
-cx qubits[3],qubits[0];
-cx qubits[0],qubits[3];
-cx qubits[0],qubits[7];
-cx qubits[0],qubits[8];
-cx qubits[9],qubits[1];
-cx qubits[9],qubits[7];
-cx qubits[0],qubits[2];
-cx qubits[1],qubits[2];
-cx qubits[2],qubits[9];
-h qubits[2];
-h qubits[2];
-ccx qubits[0],qubits[1],qubits[2];
-h qubits[2];
-h qubits[2];
-x qubits[3];
-x qubits[4];
-h qubits[15];
-h qubits[15];
-ccx qubits[2],qubits[3],qubits[15];
-h qubits[15];
-h qubits[15];
-h qubits[14];
-h qubits[14];
-ccx qubits[15],qubits[4],qubits[14];
-h qubits[14];
-h qubits[14];
-h qubits[13];
-h qubits[13];
-ccx qubits[14],qubits[5],qubits[13];
-h qubits[13];
-h qubits[13];
-h qubits[12];
-h qubits[12];
-ccx qubits[13],qubits[6],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[7],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[8],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[0];
-h qubits[0];
-ccx qubits[10],qubits[9],qubits[0];
-h qubits[0];
-h qubits[0];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[8],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[7],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[12];
-h qubits[12];
-ccx qubits[13],qubits[6],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[13];
-h qubits[13];
-ccx qubits[14],qubits[5],qubits[13];
-h qubits[13];
-h qubits[13];
-h qubits[14];
-h qubits[14];
-ccx qubits[15],qubits[4],qubits[14];
-h qubits[14];
-h qubits[14];
-h qubits[15];
-h qubits[15];
-ccx qubits[2],qubits[3],qubits[15];
-h qubits[15];
-h qubits[15];
-x qubits[4];
-x qubits[6];
-h qubits[2];
-h qubits[2];
-ccx qubits[0],qubits[1],qubits[2];
-h qubits[2];
-h qubits[2];
-cx qubits[2],qubits[9];
-cx qubits[1],qubits[2];
-cx qubits[0],qubits[2];
-cx qubits[9],qubits[7];
-cx qubits[9],qubits[6];
-cx qubits[9],qubits[1];
-cx qubits[6],qubits[9];
-cx qubits[0],qubits[8];
-cx qubits[0],qubits[7];
-cx qubits[0],qubits[3];
-cx qubits[3],qubits[0];
-cx qubits[0],qubits[3];
-x qubits[2];
-cx qubits[0],qubits[5];
-cx qubits[0],qubits[8];
-cx qubits[4],qubits[1];
-cx qubits[1],qubits[0];
-cx qubits[1],qubits[4];
-cx qubits[9],qubits[1];
-cx qubits[1],qubits[5];
-cx qubits[1],qubits[8];
-cx qubits[9],qubits[7];
-cx qubits[1],qubits[2];
-cx qubits[2],qubits[9];
-h qubits[2];
-h qubits[2];
-ccx qubits[0],qubits[1],qubits[2];
-h qubits[2];
-h qubits[2];
-x qubits[4];
-x qubits[6];
-h qubits[15];
-h qubits[15];
-ccx qubits[2],qubits[3],qubits[15];
-h qubits[15];
-h qubits[15];
-h qubits[14];
-h qubits[14];
-ccx qubits[15],qubits[4],qubits[14];
-h qubits[14];
-h qubits[14];
-h qubits[13];
-h qubits[13];
-ccx qubits[14],qubits[5],qubits[13];
-h qubits[13];
-h qubits[13];
-h qubits[12];
-h qubits[12];
-ccx qubits[13],qubits[6],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[7],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[8],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[0];
-h qubits[0];
-ccx qubits[10],qubits[9],qubits[0];
-h qubits[0];
-h qubits[0];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[8],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[7],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[12];
-h qubits[12];
-ccx qubits[13],qubits[6],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[13];
-h qubits[13];
-ccx qubits[14],qubits[5],qubits[13];
-h qubits[13];
-h qubits[13];
-h qubits[14];
-h qubits[14];
-ccx qubits[15],qubits[4],qubits[14];
-h qubits[14];
-h qubits[14];
-h qubits[15];
-h qubits[15];
-ccx qubits[2],qubits[3],qubits[15];
-h qubits[15];
-h qubits[15];
-x qubits[4];
-h qubits[2];
-h qubits[2];
-ccx qubits[0],qubits[1],qubits[2];
-h qubits[2];
-h qubits[2];
-cx qubits[2],qubits[9];
-cx qubits[9],qubits[2];
-cx qubits[1],qubits[8];
-cx qubits[9],qubits[1];
-cx qubits[1],qubits[2];
-cx qubits[0],qubits[5];
-x qubits[5];
-cx qubits[1],qubits[0];
-cx qubits[9],qubits[7];
-cx qubits[9],qubits[5];
-cx qubits[1],qubits[4];
-cx qubits[4],qubits[1];
-cx qubits[0],qubits[8];
-cx qubits[1],qubits[0];
-x qubits[1];
-cx qubits[0],qubits[1];
-cx qubits[1],qubits[3];
-cx qubits[0],qubits[4];
-cx qubits[0],qubits[6];
-cx qubits[0],qubits[9];
-cx qubits[1],qubits[2];
-cx qubits[5],qubits[9];
-cx qubits[9],qubits[1];
-cx qubits[9],qubits[5];
-cx qubits[9],qubits[6];
-cx qubits[1],qubits[2];
-cx qubits[2],qubits[9];
-h qubits[2];
-h qubits[2];
-ccx qubits[0],qubits[1],qubits[2];
-h qubits[2];
-h qubits[2];
-x qubits[5];
-h qubits[15];
-h qubits[15];
-ccx qubits[2],qubits[3],qubits[15];
-h qubits[15];
-h qubits[15];
-h qubits[14];
-h qubits[14];
-ccx qubits[15],qubits[4],qubits[14];
-h qubits[14];
-h qubits[14];
-h qubits[13];
-h qubits[13];
-ccx qubits[14],qubits[5],qubits[13];
-h qubits[13];
-h qubits[13];
-h qubits[12];
-h qubits[12];
-ccx qubits[13],qubits[6],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[7],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[8],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[0];
-h qubits[0];
-ccx qubits[10],qubits[9],qubits[0];
-h qubits[0];
-h qubits[0];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[8],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[7],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[12];
-h qubits[12];
-ccx qubits[13],qubits[6],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[13];
-h qubits[13];
-ccx qubits[14],qubits[5],qubits[13];
-h qubits[13];
-h qubits[13];
-h qubits[14];
-h qubits[14];
-ccx qubits[15],qubits[4],qubits[14];
-h qubits[14];
-h qubits[14];
-h qubits[15];
-h qubits[15];
-ccx qubits[2],qubits[3],qubits[15];
-h qubits[15];
-h qubits[15];
-x qubits[9];
-cx qubits[0],qubits[2];
-cx qubits[0],qubits[9];
-x qubits[2];
-cx qubits[0],qubits[3];
-cx qubits[0],qubits[7];
-cx qubits[0],qubits[8];
-x qubits[3];
-h qubits[15];
-h qubits[15];
-ccx qubits[2],qubits[3],qubits[15];
-h qubits[15];
-h qubits[15];
-h qubits[14];
-h qubits[14];
-ccx qubits[15],qubits[4],qubits[14];
-h qubits[14];
-h qubits[14];
-h qubits[13];
-h qubits[13];
-ccx qubits[14],qubits[5],qubits[13];
-h qubits[13];
-h qubits[13];
-h qubits[12];
-h qubits[12];
-ccx qubits[13],qubits[6],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[7],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[8],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[0];
-h qubits[0];
-ccx qubits[10],qubits[9],qubits[0];
-h qubits[0];
-h qubits[0];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[8],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[7],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[12];
-h qubits[12];
-ccx qubits[13],qubits[6],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[13];
-h qubits[13];
-ccx qubits[14],qubits[5],qubits[13];
-h qubits[13];
-h qubits[13];
-h qubits[14];
-h qubits[14];
-ccx qubits[15],qubits[4],qubits[14];
-h qubits[14];
-h qubits[14];
-h qubits[15];
-h qubits[15];
-ccx qubits[2],qubits[3],qubits[15];
-h qubits[15];
-h qubits[15];
-x qubits[5];
-h qubits[2];
-h qubits[2];
-ccx qubits[0],qubits[1],qubits[2];
-h qubits[2];
-h qubits[2];
-cx qubits[2],qubits[9];
-cx qubits[9],qubits[1];
-x qubits[2];
-cx qubits[9],qubits[2];
-cx qubits[0],qubits[2];
-cx qubits[9],qubits[6];
-cx qubits[9],qubits[5];
-x qubits[9];
-cx qubits[0],qubits[8];
-cx qubits[0],qubits[9];
-cx qubits[9],qubits[5];
-x qubits[9];
-cx qubits[0],qubits[7];
-cx qubits[0],qubits[3];
-cx qubits[3],qubits[0];
-cx qubits[3],qubits[6];
-cx qubits[3],qubits[4];
-cx qubits[0],qubits[3];
-cx qubits[0],qubits[1];
-x qubits[1];
-cx qubits[1],qubits[2];
-cx qubits[0],qubits[8];
-cx qubits[0],qubits[5];
-cx qubits[9],qubits[1];
-cx qubits[9],qubits[6];
-cx qubits[1],qubits[2];
-cx qubits[2],qubits[9];
-h qubits[2];
-h qubits[2];
-ccx qubits[0],qubits[1],qubits[2];
-h qubits[2];
-h qubits[2];
-h qubits[15];
-h qubits[15];
-ccx qubits[2],qubits[3],qubits[15];
-h qubits[15];
-h qubits[15];
-h qubits[14];
-h qubits[14];
-ccx qubits[15],qubits[4],qubits[14];
-h qubits[14];
-h qubits[14];
-h qubits[13];
-h qubits[13];
-ccx qubits[14],qubits[5],qubits[13];
-h qubits[13];
-h qubits[13];
-h qubits[12];
-h qubits[12];
-ccx qubits[13],qubits[6],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[7],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[8],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[0];
-h qubits[0];
-ccx qubits[10],qubits[9],qubits[0];
-h qubits[0];
-h qubits[0];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[8],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[7],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[12];
-h qubits[12];
-ccx qubits[13],qubits[6],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[13];
-h qubits[13];
-ccx qubits[14],qubits[5],qubits[13];
-h qubits[13];
-h qubits[13];
-h qubits[14];
-h qubits[14];
-ccx qubits[15],qubits[4],qubits[14];
-h qubits[14];
-h qubits[14];
-h qubits[15];
-h qubits[15];
-ccx qubits[2],qubits[3],qubits[15];
-h qubits[15];
-h qubits[15];
-cx qubits[1],qubits[5];
-cx qubits[0],qubits[3];
-h qubits[2];
-h qubits[2];
-ccx qubits[0],qubits[1],qubits[2];
-h qubits[2];
-h qubits[2];
-cx qubits[2],qubits[9];
-cx qubits[9],qubits[2];
-cx qubits[9],qubits[1];
-x qubits[8];
-cx qubits[0],qubits[8];
-cx qubits[1],qubits[6];
-cx qubits[9],qubits[6];
-x qubits[0];
-cx qubits[5],qubits[9];
-cx qubits[1],qubits[0];
-cx qubits[1],qubits[4];
-cx qubits[3],qubits[1];
-cx qubits[0],qubits[1];
-cx qubits[0],qubits[7];
-cx qubits[4],qubits[1];
-cx qubits[1],qubits[2];
-cx qubits[1],qubits[4];
-cx qubits[1],qubits[5];
-cx qubits[4],qubits[9];
-cx qubits[9],qubits[0];
-cx qubits[9],qubits[1];
-cx qubits[9],qubits[4];
-cx qubits[9],qubits[5];
-cx qubits[9],qubits[6];
-cx qubits[9],qubits[7];
-cx qubits[0],qubits[2];
-cx qubits[1],qubits[2];
-cx qubits[2],qubits[9];
-h qubits[2];
-h qubits[2];
-ccx qubits[0],qubits[1],qubits[2];
-h qubits[2];
-h qubits[2];
-x qubits[4];
-x qubits[7];
-h qubits[15];
-h qubits[15];
-ccx qubits[2],qubits[3],qubits[15];
-h qubits[15];
-h qubits[15];
-h qubits[14];
-h qubits[14];
-ccx qubits[15],qubits[4],qubits[14];
-h qubits[14];
-h qubits[14];
-h qubits[13];
-h qubits[13];
-ccx qubits[14],qubits[5],qubits[13];
-h qubits[13];
-h qubits[13];
-h qubits[12];
-h qubits[12];
-ccx qubits[13],qubits[6],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[7],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[8],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[0];
-h qubits[0];
-ccx qubits[10],qubits[9],qubits[0];
-h qubits[0];
-h qubits[0];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[8],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[7],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[12];
-h qubits[12];
-ccx qubits[13],qubits[6],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[13];
-h qubits[13];
-ccx qubits[14],qubits[5],qubits[13];
-h qubits[13];
-h qubits[13];
-h qubits[14];
-h qubits[14];
-ccx qubits[15],qubits[4],qubits[14];
-h qubits[14];
-h qubits[14];
-h qubits[15];
-h qubits[15];
-ccx qubits[2],qubits[3],qubits[15];
-h qubits[15];
-h qubits[15];
-x qubits[7];
-x qubits[4];
-h qubits[2];
-h qubits[2];
-ccx qubits[0],qubits[1],qubits[2];
-h qubits[2];
-h qubits[2];
-cx qubits[2],qubits[9];
-cx qubits[9],qubits[2];
-cx qubits[9],qubits[1];
-cx qubits[0],qubits[2];
-cx qubits[9],qubits[7];
-cx qubits[9],qubits[6];
-cx qubits[9],qubits[5];
-cx qubits[0],qubits[4];
-cx qubits[9],qubits[0];
-cx qubits[4],qubits[9];
-cx qubits[1],qubits[5];
-cx qubits[1],qubits[4];
-cx qubits[4],qubits[1];
-cx qubits[0],qubits[7];
-cx qubits[0],qubits[6];
-cx qubits[0],qubits[5];
-cx qubits[3],qubits[1];
-cx qubits[3],qubits[0];
-cx qubits[0],qubits[3];
-cx qubits[1],qubits[0];
-x qubits[3];
-cx qubits[0],qubits[4];
-cx qubits[0],qubits[6];
-cx qubits[7],qubits[9];
-x qubits[7];
-cx qubits[9],qubits[7];
-cx qubits[0],qubits[8];
-cx qubits[0],qubits[7];
-cx qubits[9],qubits[8];
-cx qubits[9],qubits[1];
-cx qubits[0],qubits[2];
-cx qubits[1],qubits[2];
-cx qubits[2],qubits[9];
-h qubits[2];
-h qubits[2];
-ccx qubits[0],qubits[1],qubits[2];
-h qubits[2];
-h qubits[2];
-x qubits[4];
-x qubits[5];
-h qubits[15];
-h qubits[15];
-ccx qubits[2],qubits[3],qubits[15];
-h qubits[15];
-h qubits[15];
-h qubits[14];
-h qubits[14];
-ccx qubits[15],qubits[4],qubits[14];
-h qubits[14];
-h qubits[14];
-h qubits[13];
-h qubits[13];
-ccx qubits[14],qubits[5],qubits[13];
-h qubits[13];
-h qubits[13];
-h qubits[12];
-h qubits[12];
-ccx qubits[13],qubits[6],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[7],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[8],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[0];
-h qubits[0];
-ccx qubits[10],qubits[9],qubits[0];
-h qubits[0];
-h qubits[0];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[8],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[7],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[12];
-h qubits[12];
-ccx qubits[13],qubits[6],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[13];
-h qubits[13];
-ccx qubits[14],qubits[5],qubits[13];
-h qubits[13];
-h qubits[13];
-h qubits[14];
-h qubits[14];
-ccx qubits[15],qubits[4],qubits[14];
-h qubits[14];
-h qubits[14];
-h qubits[15];
-h qubits[15];
-ccx qubits[2],qubits[3],qubits[15];
-h qubits[15];
-h qubits[15];
-x qubits[7];
-x qubits[3];
-h qubits[2];
-h qubits[2];
-ccx qubits[0],qubits[1],qubits[2];
-h qubits[2];
-h qubits[2];
-cx qubits[2],qubits[9];
-cx qubits[1],qubits[2];
-cx qubits[0],qubits[2];
-cx qubits[9],qubits[8];
-cx qubits[9],qubits[7];
-cx qubits[9],qubits[1];
-cx qubits[0],qubits[7];
-cx qubits[7],qubits[9];
-cx qubits[1],qubits[3];
-cx qubits[0],qubits[3];
-cx qubits[3],qubits[1];
-cx qubits[0],qubits[8];
-cx qubits[0],qubits[6];
-cx qubits[4],qubits[0];
-cx qubits[0],qubits[4];
-cx qubits[4],qubits[0];
-x qubits[1];
-x qubits[5];
-x qubits[7];
-cx qubits[0],qubits[7];
-cx qubits[0],qubits[9];
-cx qubits[1],qubits[2];
-cx qubits[5],qubits[9];
-cx qubits[9],qubits[1];
-cx qubits[9],qubits[5];
-cx qubits[9],qubits[6];
-cx qubits[0],qubits[2];
-cx qubits[1],qubits[2];
-cx qubits[2],qubits[9];
-h qubits[2];
-h qubits[2];
-ccx qubits[0],qubits[1],qubits[2];
-h qubits[2];
-h qubits[2];
-x qubits[5];
-h qubits[15];
-h qubits[15];
-ccx qubits[2],qubits[3],qubits[15];
-h qubits[15];
-h qubits[15];
-h qubits[14];
-h qubits[14];
-ccx qubits[15],qubits[4],qubits[14];
-h qubits[14];
-h qubits[14];
-h qubits[13];
-h qubits[13];
-ccx qubits[14],qubits[5],qubits[13];
-h qubits[13];
-h qubits[13];
-h qubits[12];
-h qubits[12];
-ccx qubits[13],qubits[6],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[7],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[8],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[0];
-h qubits[0];
-ccx qubits[10],qubits[9],qubits[0];
-h qubits[0];
-h qubits[0];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[8],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[7],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[12];
-h qubits[12];
-ccx qubits[13],qubits[6],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[13];
-h qubits[13];
-ccx qubits[14],qubits[5],qubits[13];
-h qubits[13];
-h qubits[13];
-h qubits[14];
-h qubits[14];
-ccx qubits[15],qubits[4],qubits[14];
-h qubits[14];
-h qubits[14];
-h qubits[15];
-h qubits[15];
-ccx qubits[2],qubits[3],qubits[15];
-h qubits[15];
-h qubits[15];
-x qubits[5];
-x qubits[4];
-h qubits[2];
-h qubits[2];
-ccx qubits[0],qubits[1],qubits[2];
-h qubits[2];
-h qubits[2];
-cx qubits[2],qubits[9];
-cx qubits[9],qubits[2];
-cx qubits[9],qubits[1];
-cx qubits[0],qubits[2];
-cx qubits[9],qubits[6];
-cx qubits[9],qubits[5];
-cx qubits[5],qubits[9];
-cx qubits[1],qubits[9];
-cx qubits[1],qubits[7];
-cx qubits[0],qubits[4];
-cx qubits[1],qubits[0];
-x qubits[1];
-cx qubits[0],qubits[9];
-cx qubits[4],qubits[7];
-cx qubits[4],qubits[0];
-x qubits[3];
-cx qubits[0],qubits[5];
-cx qubits[3],qubits[1];
-cx qubits[1],qubits[2];
-cx qubits[1],qubits[3];
-cx qubits[1],qubits[4];
-cx qubits[9],qubits[1];
-cx qubits[9],qubits[8];
-cx qubits[0],qubits[2];
-cx qubits[1],qubits[2];
-cx qubits[2],qubits[9];
-h qubits[2];
-h qubits[2];
-ccx qubits[0],qubits[1],qubits[2];
-h qubits[2];
-h qubits[2];
-x qubits[3];
-x qubits[6];
-h qubits[15];
-h qubits[15];
-ccx qubits[2],qubits[3],qubits[15];
-h qubits[15];
-h qubits[15];
-h qubits[14];
-h qubits[14];
-ccx qubits[15],qubits[4],qubits[14];
-h qubits[14];
-h qubits[14];
-h qubits[13];
-h qubits[13];
-ccx qubits[14],qubits[5],qubits[13];
-h qubits[13];
-h qubits[13];
-h qubits[12];
-h qubits[12];
-ccx qubits[13],qubits[6],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[7],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[8],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[0];
-h qubits[0];
-ccx qubits[10],qubits[9],qubits[0];
-h qubits[0];
-h qubits[0];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[8],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[7],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[12];
-h qubits[12];
-ccx qubits[13],qubits[6],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[13];
-h qubits[13];
-ccx qubits[14],qubits[5],qubits[13];
-h qubits[13];
-h qubits[13];
-h qubits[14];
-h qubits[14];
-ccx qubits[15],qubits[4],qubits[14];
-h qubits[14];
-h qubits[14];
-h qubits[15];
-h qubits[15];
-ccx qubits[2],qubits[3],qubits[15];
-h qubits[15];
-h qubits[15];
-x qubits[3];
-h qubits[2];
-h qubits[2];
-ccx qubits[0],qubits[1],qubits[2];
-h qubits[2];
-h qubits[2];
-cx qubits[2],qubits[9];
-cx qubits[9],qubits[1];
-x qubits[2];
-cx qubits[9],qubits[2];
-cx qubits[0],qubits[2];
-cx qubits[9],qubits[8];
-x qubits[9];
-cx qubits[6],qubits[9];
-x qubits[1];
-cx qubits[1],qubits[3];
-cx qubits[1],qubits[4];
-cx qubits[3],qubits[1];
-cx qubits[0],qubits[7];
-cx qubits[0],qubits[4];
-cx qubits[0],qubits[9];
-cx qubits[9],qubits[1];
-cx qubits[9],qubits[6];
-cx qubits[9],qubits[7];
-cx qubits[1],qubits[2];
-cx qubits[2],qubits[9];
-h qubits[2];
-h qubits[2];
-ccx qubits[0],qubits[1],qubits[2];
-h qubits[2];
-h qubits[2];
-h qubits[15];
-h qubits[15];
-ccx qubits[2],qubits[3],qubits[15];
-h qubits[15];
-h qubits[15];
-h qubits[14];
-h qubits[14];
-ccx qubits[15],qubits[4],qubits[14];
-h qubits[14];
-h qubits[14];
-h qubits[13];
-h qubits[13];
-ccx qubits[14],qubits[5],qubits[13];
-h qubits[13];
-h qubits[13];
-h qubits[12];
-h qubits[12];
-ccx qubits[13],qubits[6],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[7],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[8],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[0];
-h qubits[0];
-ccx qubits[10],qubits[9],qubits[0];
-h qubits[0];
-h qubits[0];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[8],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[7],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[12];
-h qubits[12];
-ccx qubits[13],qubits[6],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[13];
-h qubits[13];
-ccx qubits[14],qubits[5],qubits[13];
-h qubits[13];
-h qubits[13];
-h qubits[14];
-h qubits[14];
-ccx qubits[15],qubits[4],qubits[14];
-h qubits[14];
-h qubits[14];
-h qubits[15];
-h qubits[15];
-ccx qubits[2],qubits[3],qubits[15];
-h qubits[15];
-h qubits[15];
-x qubits[6];
-h qubits[2];
-h qubits[2];
-ccx qubits[0],qubits[1],qubits[2];
-h qubits[2];
-h qubits[2];
-cx qubits[2],qubits[9];
-cx qubits[9],qubits[1];
-x qubits[2];
-cx qubits[9],qubits[2];
-cx qubits[9],qubits[7];
-cx qubits[9],qubits[6];
-cx qubits[6],qubits[9];
-cx qubits[0],qubits[9];
-cx qubits[0],qubits[5];
-cx qubits[0],qubits[4];
-cx qubits[4],qubits[0];
-x qubits[4];
-cx qubits[0],qubits[4];
-cx qubits[0],qubits[7];
-cx qubits[0],qubits[9];
-cx qubits[1],qubits[4];
-cx qubits[1],qubits[5];
-cx qubits[4],qubits[9];
-cx qubits[9],qubits[0];
-cx qubits[9],qubits[1];
-cx qubits[9],qubits[4];
-cx qubits[9],qubits[5];
-cx qubits[9],qubits[6];
-cx qubits[9],qubits[7];
-cx qubits[0],qubits[2];
-cx qubits[1],qubits[2];
-cx qubits[2],qubits[9];
-h qubits[2];
-h qubits[2];
-ccx qubits[0],qubits[1],qubits[2];
-h qubits[2];
-h qubits[2];
-x qubits[4];
-x qubits[6];
-h qubits[15];
-h qubits[15];
-ccx qubits[2],qubits[3],qubits[15];
-h qubits[15];
-h qubits[15];
-h qubits[14];
-h qubits[14];
-ccx qubits[15],qubits[4],qubits[14];
-h qubits[14];
-h qubits[14];
-h qubits[13];
-h qubits[13];
-ccx qubits[14],qubits[5],qubits[13];
-h qubits[13];
-h qubits[13];
-h qubits[12];
-h qubits[12];
-ccx qubits[13],qubits[6],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[7],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[8],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[0];
-h qubits[0];
-ccx qubits[10],qubits[9],qubits[0];
-h qubits[0];
-h qubits[0];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[8],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[7],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[12];
-h qubits[12];
-ccx qubits[13],qubits[6],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[13];
-h qubits[13];
-ccx qubits[14],qubits[5],qubits[13];
-h qubits[13];
-h qubits[13];
-h qubits[14];
-h qubits[14];
-ccx qubits[15],qubits[4],qubits[14];
-h qubits[14];
-h qubits[14];
-h qubits[15];
-h qubits[15];
-ccx qubits[2],qubits[3],qubits[15];
-h qubits[15];
-h qubits[15];
-x qubits[4];
-h qubits[2];
-h qubits[2];
-ccx qubits[0],qubits[1],qubits[2];
-h qubits[2];
-h qubits[2];
-cx qubits[2],qubits[9];
-cx qubits[9],qubits[2];
-cx qubits[9],qubits[1];
-cx qubits[0],qubits[2];
-cx qubits[9],qubits[7];
-cx qubits[9],qubits[6];
-cx qubits[9],qubits[5];
-cx qubits[0],qubits[4];
-cx qubits[9],qubits[0];
-cx qubits[4],qubits[9];
-cx qubits[1],qubits[5];
-cx qubits[1],qubits[4];
-cx qubits[4],qubits[7];
-cx qubits[4],qubits[0];
-x qubits[3];
-cx qubits[0],qubits[5];
-cx qubits[3],qubits[1];
-cx qubits[1],qubits[0];
-cx qubits[1],qubits[3];
-cx qubits[1],qubits[4];
-cx qubits[9],qubits[1];
-cx qubits[1],qubits[5];
-x qubits[5];
-cx qubits[1],qubits[7];
-cx qubits[9],qubits[8];
-cx qubits[0],qubits[2];
-cx qubits[1],qubits[2];
-cx qubits[2],qubits[9];
-h qubits[2];
-h qubits[2];
-ccx qubits[0],qubits[1],qubits[2];
-h qubits[2];
-h qubits[2];
-x qubits[3];
-h qubits[15];
-h qubits[15];
-ccx qubits[2],qubits[3],qubits[15];
-h qubits[15];
-h qubits[15];
-h qubits[14];
-h qubits[14];
-ccx qubits[15],qubits[4],qubits[14];
-h qubits[14];
-h qubits[14];
-h qubits[13];
-h qubits[13];
-ccx qubits[14],qubits[5],qubits[13];
-h qubits[13];
-h qubits[13];
-h qubits[12];
-h qubits[12];
-ccx qubits[13],qubits[6],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[7],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[8],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[0];
-h qubits[0];
-ccx qubits[10],qubits[9],qubits[0];
-h qubits[0];
-h qubits[0];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[8],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[7],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[12];
-h qubits[12];
-ccx qubits[13],qubits[6],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[13];
-h qubits[13];
-ccx qubits[14],qubits[5],qubits[13];
-h qubits[13];
-h qubits[13];
-h qubits[14];
-h qubits[14];
-ccx qubits[15],qubits[4],qubits[14];
-h qubits[14];
-h qubits[14];
-h qubits[15];
-h qubits[15];
-ccx qubits[2],qubits[3],qubits[15];
-h qubits[15];
-h qubits[15];
-x qubits[3];
-h qubits[2];
-h qubits[2];
-ccx qubits[0],qubits[1],qubits[2];
-h qubits[2];
-h qubits[2];
-cx qubits[2],qubits[9];
-cx qubits[1],qubits[2];
-cx qubits[0],qubits[2];
-cx qubits[9],qubits[8];
-cx qubits[9],qubits[7];
-x qubits[5];
-cx qubits[1],qubits[5];
-cx qubits[9],qubits[1];
-cx qubits[1],qubits[7];
-cx qubits[1],qubits[4];
-cx qubits[1],qubits[3];
-cx qubits[1],qubits[0];
-cx qubits[3],qubits[1];
-cx qubits[0],qubits[7];
-cx qubits[0],qubits[5];
-cx qubits[1],qubits[0];
-x qubits[1];
-cx qubits[0],qubits[1];
-cx qubits[0],qubits[3];
-cx qubits[0],qubits[4];
-cx qubits[0],qubits[6];
-cx qubits[0],qubits[7];
-cx qubits[0],qubits[8];
-cx qubits[0],qubits[9];
-cx qubits[1],qubits[2];
-cx qubits[5],qubits[9];
-cx qubits[9],qubits[1];
-cx qubits[9],qubits[5];
-cx qubits[9],qubits[6];
-cx qubits[0],qubits[2];
-cx qubits[1],qubits[2];
-cx qubits[2],qubits[9];
-h qubits[2];
-h qubits[2];
-ccx qubits[0],qubits[1],qubits[2];
-h qubits[2];
-h qubits[2];
-x qubits[4];
-x qubits[5];
-h qubits[15];
-h qubits[15];
-ccx qubits[2],qubits[3],qubits[15];
-h qubits[15];
-h qubits[15];
-h qubits[14];
-h qubits[14];
-ccx qubits[15],qubits[4],qubits[14];
-h qubits[14];
-h qubits[14];
-h qubits[13];
-h qubits[13];
-ccx qubits[14],qubits[5],qubits[13];
-h qubits[13];
-h qubits[13];
-h qubits[12];
-h qubits[12];
-ccx qubits[13],qubits[6],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[7],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[8],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[0];
-h qubits[0];
-ccx qubits[10],qubits[9],qubits[0];
-h qubits[0];
-h qubits[0];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[8],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[7],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[12];
-h qubits[12];
-ccx qubits[13],qubits[6],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[13];
-h qubits[13];
-ccx qubits[14],qubits[5],qubits[13];
-h qubits[13];
-h qubits[13];
-h qubits[14];
-h qubits[14];
-ccx qubits[15],qubits[4],qubits[14];
-h qubits[14];
-h qubits[14];
-h qubits[15];
-h qubits[15];
-ccx qubits[2],qubits[3],qubits[15];
-h qubits[15];
-h qubits[15];
-x qubits[9];
-cx qubits[0],qubits[2];
-cx qubits[0],qubits[9];
-x qubits[2];
-cx qubits[0],qubits[8];
-cx qubits[0],qubits[7];
-cx qubits[0],qubits[3];
-x qubits[3];
-h qubits[15];
-h qubits[15];
-ccx qubits[2],qubits[3],qubits[15];
-h qubits[15];
-h qubits[15];
-h qubits[14];
-h qubits[14];
-ccx qubits[15],qubits[4],qubits[14];
-h qubits[14];
-h qubits[14];
-h qubits[13];
-h qubits[13];
-ccx qubits[14],qubits[5],qubits[13];
-h qubits[13];
-h qubits[13];
-h qubits[12];
-h qubits[12];
-ccx qubits[13],qubits[6],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[7],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[8],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[0];
-h qubits[0];
-ccx qubits[10],qubits[9],qubits[0];
-h qubits[0];
-h qubits[0];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[8],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[7],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[12];
-h qubits[12];
-ccx qubits[13],qubits[6],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[13];
-h qubits[13];
-ccx qubits[14],qubits[5],qubits[13];
-h qubits[13];
-h qubits[13];
-h qubits[14];
-h qubits[14];
-ccx qubits[15],qubits[4],qubits[14];
-h qubits[14];
-h qubits[14];
-h qubits[15];
-h qubits[15];
-ccx qubits[2],qubits[3],qubits[15];
-h qubits[15];
-h qubits[15];
-x qubits[5];
-h qubits[2];
-h qubits[2];
-ccx qubits[0],qubits[1],qubits[2];
-h qubits[2];
-h qubits[2];
-cx qubits[2],qubits[9];
-cx qubits[9],qubits[1];
-x qubits[2];
-cx qubits[9],qubits[2];
-cx qubits[9],qubits[6];
-cx qubits[9],qubits[5];
-cx qubits[5],qubits[9];
-cx qubits[0],qubits[4];
-cx qubits[4],qubits[0];
-cx qubits[4],qubits[9];
-cx qubits[4],qubits[6];
-cx qubits[0],qubits[4];
-cx qubits[0],qubits[1];
-x qubits[1];
-cx qubits[0],qubits[5];
-cx qubits[0],qubits[7];
-cx qubits[1],qubits[2];
-cx qubits[5],qubits[9];
-cx qubits[9],qubits[1];
-cx qubits[9],qubits[5];
-cx qubits[9],qubits[6];
-cx qubits[0],qubits[2];
-cx qubits[1],qubits[2];
-cx qubits[2],qubits[9];
-h qubits[2];
-h qubits[2];
-ccx qubits[0],qubits[1],qubits[2];
-h qubits[2];
-h qubits[2];
-x qubits[5];
-h qubits[15];
-h qubits[15];
-ccx qubits[2],qubits[3],qubits[15];
-h qubits[15];
-h qubits[15];
-h qubits[14];
-h qubits[14];
-ccx qubits[15],qubits[4],qubits[14];
-h qubits[14];
-h qubits[14];
-h qubits[13];
-h qubits[13];
-ccx qubits[14],qubits[5],qubits[13];
-h qubits[13];
-h qubits[13];
-h qubits[12];
-h qubits[12];
-ccx qubits[13],qubits[6],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[7],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[8],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[0];
-h qubits[0];
-ccx qubits[10],qubits[9],qubits[0];
-h qubits[0];
-h qubits[0];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[8],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[7],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[12];
-h qubits[12];
-ccx qubits[13],qubits[6],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[13];
-h qubits[13];
-ccx qubits[14],qubits[5],qubits[13];
-h qubits[13];
-h qubits[13];
-h qubits[14];
-h qubits[14];
-ccx qubits[15],qubits[4],qubits[14];
-h qubits[14];
-h qubits[14];
-h qubits[15];
-h qubits[15];
-ccx qubits[2],qubits[3],qubits[15];
-h qubits[15];
-h qubits[15];
-x qubits[5];
-x qubits[4];
-h qubits[2];
-h qubits[2];
-ccx qubits[0],qubits[1],qubits[2];
-h qubits[2];
-h qubits[2];
-cx qubits[2],qubits[9];
-cx qubits[9],qubits[2];
-cx qubits[1],qubits[6];
-cx qubits[1],qubits[5];
-cx qubits[9],qubits[1];
-cx qubits[5],qubits[9];
-cx qubits[0],qubits[2];
-cx qubits[1],qubits[7];
-cx qubits[0],qubits[4];
-cx qubits[1],qubits[0];
-cx qubits[3],qubits[1];
-cx qubits[4],qubits[1];
-cx qubits[0],qubits[9];
-x qubits[0];
-cx qubits[0],qubits[7];
-x qubits[5];
-cx qubits[0],qubits[1];
-cx qubits[1],qubits[2];
-cx qubits[1],qubits[3];
-cx qubits[1],qubits[4];
-cx qubits[9],qubits[1];
-cx qubits[9],qubits[8];
-cx qubits[1],qubits[2];
-cx qubits[2],qubits[9];
-h qubits[2];
-h qubits[2];
-ccx qubits[0],qubits[1],qubits[2];
-h qubits[2];
-h qubits[2];
-h qubits[15];
-h qubits[15];
-ccx qubits[2],qubits[3],qubits[15];
-h qubits[15];
-h qubits[15];
-h qubits[14];
-h qubits[14];
-ccx qubits[15],qubits[4],qubits[14];
-h qubits[14];
-h qubits[14];
-h qubits[13];
-h qubits[13];
-ccx qubits[14],qubits[5],qubits[13];
-h qubits[13];
-h qubits[13];
-h qubits[12];
-h qubits[12];
-ccx qubits[13],qubits[6],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[7],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[8],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[0];
-h qubits[0];
-ccx qubits[10],qubits[9],qubits[0];
-h qubits[0];
-h qubits[0];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[8],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[7],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[12];
-h qubits[12];
-ccx qubits[13],qubits[6],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[13];
-h qubits[13];
-ccx qubits[14],qubits[5],qubits[13];
-h qubits[13];
-h qubits[13];
-h qubits[14];
-h qubits[14];
-ccx qubits[15],qubits[4],qubits[14];
-h qubits[14];
-h qubits[14];
-h qubits[15];
-h qubits[15];
-ccx qubits[2],qubits[3],qubits[15];
-h qubits[15];
-h qubits[15];
-x qubits[6];
-x qubits[3];
-h qubits[2];
-h qubits[2];
-ccx qubits[0],qubits[1],qubits[2];
-h qubits[2];
-h qubits[2];
-cx qubits[2],qubits[9];
-cx qubits[9],qubits[1];
-x qubits[2];
-cx qubits[9],qubits[2];
-cx qubits[9],qubits[8];
-x qubits[1];
-cx qubits[1],qubits[3];
-cx qubits[1],qubits[4];
-cx qubits[3],qubits[1];
-cx qubits[0],qubits[4];
-cx qubits[0],qubits[7];
-cx qubits[0],qubits[9];
-cx qubits[6],qubits[9];
-cx qubits[9],qubits[1];
-cx qubits[9],qubits[6];
-cx qubits[9],qubits[7];
-cx qubits[0],qubits[2];
-cx qubits[1],qubits[2];
-cx qubits[2],qubits[9];
-h qubits[2];
-h qubits[2];
-ccx qubits[0],qubits[1],qubits[2];
-h qubits[2];
-h qubits[2];
-x qubits[6];
-h qubits[15];
-h qubits[15];
-ccx qubits[2],qubits[3],qubits[15];
-h qubits[15];
-h qubits[15];
-h qubits[14];
-h qubits[14];
-ccx qubits[15],qubits[4],qubits[14];
-h qubits[14];
-h qubits[14];
-h qubits[13];
-h qubits[13];
-ccx qubits[14],qubits[5],qubits[13];
-h qubits[13];
-h qubits[13];
-h qubits[12];
-h qubits[12];
-ccx qubits[13],qubits[6],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[7],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[8],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[0];
-h qubits[0];
-ccx qubits[10],qubits[9],qubits[0];
-h qubits[0];
-h qubits[0];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[8],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[7],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[12];
-h qubits[12];
-ccx qubits[13],qubits[6],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[13];
-h qubits[13];
-ccx qubits[14],qubits[5],qubits[13];
-h qubits[13];
-h qubits[13];
-h qubits[14];
-h qubits[14];
-ccx qubits[15],qubits[4],qubits[14];
-h qubits[14];
-h qubits[14];
-h qubits[15];
-h qubits[15];
-ccx qubits[2],qubits[3],qubits[15];
-h qubits[15];
-h qubits[15];
-x qubits[6];
-h qubits[2];
-h qubits[2];
-ccx qubits[0],qubits[1],qubits[2];
-h qubits[2];
-h qubits[2];
-cx qubits[2],qubits[9];
-x qubits[2];
-cx qubits[0],qubits[1];
-cx qubits[1],qubits[2];
-cx qubits[9],qubits[7];
-cx qubits[9],qubits[6];
-cx qubits[9],qubits[1];
-cx qubits[0],qubits[6];
-cx qubits[6],qubits[9];
-cx qubits[0],qubits[7];
-cx qubits[0],qubits[5];
-cx qubits[1],qubits[4];
-cx qubits[1],qubits[0];
-cx qubits[4],qubits[1];
-x qubits[0];
-cx qubits[0],qubits[1];
-cx qubits[1],qubits[4];
-cx qubits[0],qubits[2];
-cx qubits[0],qubits[6];
-cx qubits[0],qubits[9];
-cx qubits[1],qubits[5];
-cx qubits[4],qubits[9];
-cx qubits[9],qubits[0];
-cx qubits[9],qubits[1];
-cx qubits[9],qubits[4];
-cx qubits[9],qubits[6];
-cx qubits[0],qubits[2];
-cx qubits[2],qubits[9];
-h qubits[2];
-h qubits[2];
-ccx qubits[0],qubits[1],qubits[2];
-h qubits[2];
-h qubits[2];
-x qubits[4];
-x qubits[6];
-h qubits[15];
-h qubits[15];
-ccx qubits[2],qubits[3],qubits[15];
-h qubits[15];
-h qubits[15];
-h qubits[14];
-h qubits[14];
-ccx qubits[15],qubits[4],qubits[14];
-h qubits[14];
-h qubits[14];
-h qubits[13];
-h qubits[13];
-ccx qubits[14],qubits[5],qubits[13];
-h qubits[13];
-h qubits[13];
-h qubits[12];
-h qubits[12];
-ccx qubits[13],qubits[6],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[7],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[8],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[0];
-h qubits[0];
-ccx qubits[10],qubits[9],qubits[0];
-h qubits[0];
-h qubits[0];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[8],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[7],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[12];
-h qubits[12];
-ccx qubits[13],qubits[6],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[13];
-h qubits[13];
-ccx qubits[14],qubits[5],qubits[13];
-h qubits[13];
-h qubits[13];
-h qubits[14];
-h qubits[14];
-ccx qubits[15],qubits[4],qubits[14];
-h qubits[14];
-h qubits[14];
-h qubits[15];
-h qubits[15];
-ccx qubits[2],qubits[3],qubits[15];
-h qubits[15];
-h qubits[15];
-x qubits[4];
-h qubits[2];
-h qubits[2];
-ccx qubits[0],qubits[1],qubits[2];
-h qubits[2];
-h qubits[2];
-cx qubits[2],qubits[9];
-cx qubits[9],qubits[1];
-cx qubits[9],qubits[2];
-cx qubits[9],qubits[0];
-x qubits[2];
-cx qubits[9],qubits[6];
-cx qubits[9],qubits[4];
-x qubits[6];
-cx qubits[6],qubits[9];
-cx qubits[4],qubits[9];
-cx qubits[1],qubits[5];
-cx qubits[1],qubits[4];
-cx qubits[4],qubits[1];
-cx qubits[0],qubits[3];
-cx qubits[3],qubits[1];
-cx qubits[1],qubits[0];
-cx qubits[1],qubits[3];
-x qubits[0];
-cx qubits[0],qubits[7];
-cx qubits[0],qubits[8];
-cx qubits[1],qubits[4];
-cx qubits[9],qubits[1];
-cx qubits[1],qubits[6];
-cx qubits[9],qubits[7];
-cx qubits[0],qubits[2];
-cx qubits[1],qubits[2];
-cx qubits[2],qubits[9];
-h qubits[2];
-h qubits[2];
-ccx qubits[0],qubits[1],qubits[2];
-h qubits[2];
-h qubits[2];
-x qubits[5];
-h qubits[15];
-h qubits[15];
-ccx qubits[2],qubits[3],qubits[15];
-h qubits[15];
-h qubits[15];
-h qubits[14];
-h qubits[14];
-ccx qubits[15],qubits[4],qubits[14];
-h qubits[14];
-h qubits[14];
-h qubits[13];
-h qubits[13];
-ccx qubits[14],qubits[5],qubits[13];
-h qubits[13];
-h qubits[13];
-h qubits[12];
-h qubits[12];
-ccx qubits[13],qubits[6],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[7],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[8],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[0];
-h qubits[0];
-ccx qubits[10],qubits[9],qubits[0];
-h qubits[0];
-h qubits[0];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[8],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[7],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[12];
-h qubits[12];
-ccx qubits[13],qubits[6],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[13];
-h qubits[13];
-ccx qubits[14],qubits[5],qubits[13];
-h qubits[13];
-h qubits[13];
-h qubits[14];
-h qubits[14];
-ccx qubits[15],qubits[4],qubits[14];
-h qubits[14];
-h qubits[14];
-h qubits[15];
-h qubits[15];
-ccx qubits[2],qubits[3],qubits[15];
-h qubits[15];
-h qubits[15];
-x qubits[6];
-x qubits[3];
-h qubits[2];
-h qubits[2];
-ccx qubits[0],qubits[1],qubits[2];
-h qubits[2];
-h qubits[2];
-cx qubits[2],qubits[9];
-cx qubits[1],qubits[2];
-cx qubits[0],qubits[2];
-cx qubits[9],qubits[7];
-cx qubits[1],qubits[6];
-cx qubits[9],qubits[1];
-cx qubits[6],qubits[9];
-cx qubits[1],qubits[8];
-cx qubits[1],qubits[7];
-cx qubits[1],qubits[4];
-cx qubits[0],qubits[3];
-cx qubits[1],qubits[0];
-cx qubits[3],qubits[1];
-cx qubits[0],qubits[9];
-cx qubits[0],qubits[8];
-cx qubits[0],qubits[7];
-cx qubits[0],qubits[6];
-cx qubits[1],qubits[4];
-cx qubits[1],qubits[0];
-cx qubits[4],qubits[1];
-x qubits[0];
-cx qubits[1],qubits[2];
-cx qubits[0],qubits[1];
-x qubits[2];
-cx qubits[1],qubits[4];
-x qubits[4];
-x qubits[5];
-cx qubits[0],qubits[3];
-cx qubits[1],qubits[0];
-cx qubits[0],qubits[5];
-cx qubits[0],qubits[6];
-cx qubits[0],qubits[8];
-cx qubits[0],qubits[9];
-cx qubits[5],qubits[9];
-cx qubits[9],qubits[1];
-cx qubits[9],qubits[5];
-cx qubits[9],qubits[6];
-cx qubits[9],qubits[7];
-cx qubits[9],qubits[8];
-cx qubits[0],qubits[2];
-cx qubits[1],qubits[2];
-cx qubits[2],qubits[9];
-h qubits[2];
-h qubits[2];
-ccx qubits[0],qubits[1],qubits[2];
-h qubits[2];
-h qubits[2];
-x qubits[3];
-x qubits[5];
-x qubits[6];
-h qubits[15];
-h qubits[15];
-ccx qubits[2],qubits[3],qubits[15];
-h qubits[15];
-h qubits[15];
-h qubits[14];
-h qubits[14];
-ccx qubits[15],qubits[4],qubits[14];
-h qubits[14];
-h qubits[14];
-h qubits[13];
-h qubits[13];
-ccx qubits[14],qubits[5],qubits[13];
-h qubits[13];
-h qubits[13];
-h qubits[12];
-h qubits[12];
-ccx qubits[13],qubits[6],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[7],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[8],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[0];
-h qubits[0];
-ccx qubits[10],qubits[9],qubits[0];
-h qubits[0];
-h qubits[0];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[8],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[7],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[12];
-h qubits[12];
-ccx qubits[13],qubits[6],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[13];
-h qubits[13];
-ccx qubits[14],qubits[5],qubits[13];
-h qubits[13];
-h qubits[13];
-h qubits[14];
-h qubits[14];
-ccx qubits[15],qubits[4],qubits[14];
-h qubits[14];
-h qubits[14];
-h qubits[15];
-h qubits[15];
-ccx qubits[2],qubits[3],qubits[15];
-h qubits[15];
-h qubits[15];
-x qubits[6];
-x qubits[5];
-x qubits[4];
-h qubits[2];
-h qubits[2];
-ccx qubits[0],qubits[1],qubits[2];
-h qubits[2];
-h qubits[2];
-cx qubits[2],qubits[9];
-cx qubits[9],qubits[1];
-x qubits[2];
-cx qubits[9],qubits[2];
-cx qubits[0],qubits[2];
-cx qubits[9],qubits[8];
-cx qubits[9],qubits[7];
-cx qubits[9],qubits[6];
-cx qubits[9],qubits[5];
-cx qubits[1],qubits[5];
-cx qubits[5],qubits[9];
-cx qubits[1],qubits[8];
-cx qubits[1],qubits[6];
-cx qubits[1],qubits[4];
-cx qubits[1],qubits[0];
-cx qubits[4],qubits[1];
-cx qubits[0],qubits[8];
-cx qubits[0],qubits[3];
-cx qubits[0],qubits[7];
-cx qubits[6],qubits[9];
-cx qubits[9],qubits[1];
-cx qubits[9],qubits[6];
-cx qubits[9],qubits[7];
-cx qubits[1],qubits[2];
-cx qubits[2],qubits[9];
-h qubits[2];
-h qubits[2];
-ccx qubits[0],qubits[1],qubits[2];
-h qubits[2];
-h qubits[2];
-x qubits[3];
-x qubits[4];
-x qubits[5];
-x qubits[6];
-h qubits[15];
-h qubits[15];
-ccx qubits[2],qubits[3],qubits[15];
-h qubits[15];
-h qubits[15];
-h qubits[14];
-h qubits[14];
-ccx qubits[15],qubits[4],qubits[14];
-h qubits[14];
-h qubits[14];
-h qubits[13];
-h qubits[13];
-ccx qubits[14],qubits[5],qubits[13];
-h qubits[13];
-h qubits[13];
-h qubits[12];
-h qubits[12];
-ccx qubits[13],qubits[6],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[7],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[8],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[0];
-h qubits[0];
-ccx qubits[10],qubits[9],qubits[0];
-h qubits[0];
-h qubits[0];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[8],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[7],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[12];
-h qubits[12];
-ccx qubits[13],qubits[6],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[13];
-h qubits[13];
-ccx qubits[14],qubits[5],qubits[13];
-h qubits[13];
-h qubits[13];
-h qubits[14];
-h qubits[14];
-ccx qubits[15],qubits[4],qubits[14];
-h qubits[14];
-h qubits[14];
-h qubits[15];
-h qubits[15];
-ccx qubits[2],qubits[3],qubits[15];
-h qubits[15];
-h qubits[15];
-x qubits[6];
-h qubits[2];
-h qubits[2];
-ccx qubits[0],qubits[1],qubits[2];
-h qubits[2];
-h qubits[2];
-cx qubits[2],qubits[9];
-x qubits[2];
-cx qubits[0],qubits[1];
-cx qubits[1],qubits[2];
-cx qubits[9],qubits[7];
-cx qubits[9],qubits[6];
-cx qubits[9],qubits[1];
-cx qubits[0],qubits[6];
-cx qubits[6],qubits[9];
-cx qubits[0],qubits[7];
-cx qubits[0],qubits[5];
-cx qubits[0],qubits[4];
-x qubits[0];
-x qubits[3];
-cx qubits[1],qubits[0];
-cx qubits[0],qubits[1];
-cx qubits[0],qubits[4];
-cx qubits[0],qubits[6];
-cx qubits[0],qubits[9];
-cx qubits[3],qubits[1];
-cx qubits[1],qubits[3];
-cx qubits[1],qubits[5];
-cx qubits[1],qubits[6];
-cx qubits[3],qubits[9];
-cx qubits[9],qubits[3];
-cx qubits[9],qubits[5];
-cx qubits[9],qubits[6];
-cx qubits[9],qubits[7];
-cx qubits[9],qubits[8];
-cx qubits[1],qubits[2];
-cx qubits[2],qubits[9];
-h qubits[2];
-h qubits[2];
-ccx qubits[0],qubits[1],qubits[2];
-h qubits[2];
-h qubits[2];
-x qubits[3];
-x qubits[6];
-h qubits[15];
-h qubits[15];
-ccx qubits[2],qubits[3],qubits[15];
-h qubits[15];
-h qubits[15];
-h qubits[14];
-h qubits[14];
-ccx qubits[15],qubits[4],qubits[14];
-h qubits[14];
-h qubits[14];
-h qubits[13];
-h qubits[13];
-ccx qubits[14],qubits[5],qubits[13];
-h qubits[13];
-h qubits[13];
-h qubits[12];
-h qubits[12];
-ccx qubits[13],qubits[6],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[7],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[8],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[0];
-h qubits[0];
-ccx qubits[10],qubits[9],qubits[0];
-h qubits[0];
-h qubits[0];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[8],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[7],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[12];
-h qubits[12];
-ccx qubits[13],qubits[6],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[13];
-h qubits[13];
-ccx qubits[14],qubits[5],qubits[13];
-h qubits[13];
-h qubits[13];
-h qubits[14];
-h qubits[14];
-ccx qubits[15],qubits[4],qubits[14];
-h qubits[14];
-h qubits[14];
-h qubits[15];
-h qubits[15];
-ccx qubits[2],qubits[3],qubits[15];
-h qubits[15];
-h qubits[15];
-x qubits[3];
-h qubits[2];
-h qubits[2];
-ccx qubits[0],qubits[1],qubits[2];
-h qubits[2];
-h qubits[2];
-cx qubits[2],qubits[9];
-cx qubits[1],qubits[2];
-cx qubits[9],qubits[8];
-cx qubits[9],qubits[7];
-cx qubits[9],qubits[6];
-cx qubits[9],qubits[5];
-cx qubits[9],qubits[3];
-cx qubits[3],qubits[9];
-cx qubits[1],qubits[6];
-cx qubits[1],qubits[5];
-cx qubits[1],qubits[3];
-cx qubits[3],qubits[1];
-cx qubits[0],qubits[9];
-cx qubits[0],qubits[6];
-cx qubits[1],qubits[0];
-cx qubits[0],qubits[4];
-cx qubits[1],qubits[3];
-cx qubits[3],qubits[1];
-cx qubits[0],qubits[1];
-cx qubits[1],qubits[3];
-cx qubits[3],qubits[0];
-cx qubits[0],qubits[2];
-cx qubits[0],qubits[5];
-x qubits[6];
-cx qubits[1],qubits[0];
-cx qubits[0],qubits[6];
-cx qubits[0],qubits[8];
-cx qubits[0],qubits[9];
-cx qubits[1],qubits[4];
-cx qubits[1],qubits[5];
-cx qubits[5],qubits[9];
-cx qubits[9],qubits[1];
-cx qubits[9],qubits[5];
-cx qubits[9],qubits[6];
-cx qubits[0],qubits[2];
-cx qubits[1],qubits[2];
-cx qubits[2],qubits[9];
-h qubits[2];
-h qubits[2];
-ccx qubits[0],qubits[1],qubits[2];
-h qubits[2];
-h qubits[2];
-x qubits[5];
-h qubits[15];
-h qubits[15];
-ccx qubits[2],qubits[3],qubits[15];
-h qubits[15];
-h qubits[15];
-h qubits[14];
-h qubits[14];
-ccx qubits[15],qubits[4],qubits[14];
-h qubits[14];
-h qubits[14];
-h qubits[13];
-h qubits[13];
-ccx qubits[14],qubits[5],qubits[13];
-h qubits[13];
-h qubits[13];
-h qubits[12];
-h qubits[12];
-ccx qubits[13],qubits[6],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[7],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[8],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[0];
-h qubits[0];
-ccx qubits[10],qubits[9],qubits[0];
-h qubits[0];
-h qubits[0];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[8],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[7],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[12];
-h qubits[12];
-ccx qubits[13],qubits[6],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[13];
-h qubits[13];
-ccx qubits[14],qubits[5],qubits[13];
-h qubits[13];
-h qubits[13];
-h qubits[14];
-h qubits[14];
-ccx qubits[15],qubits[4],qubits[14];
-h qubits[14];
-h qubits[14];
-h qubits[15];
-h qubits[15];
-ccx qubits[2],qubits[3],qubits[15];
-h qubits[15];
-h qubits[15];
-x qubits[5];
-x qubits[3];
-h qubits[2];
-h qubits[2];
-ccx qubits[0],qubits[1],qubits[2];
-h qubits[2];
-h qubits[2];
-cx qubits[2],qubits[9];
-cx qubits[1],qubits[2];
-cx qubits[0],qubits[2];
-cx qubits[5],qubits[6];
-cx qubits[1],qubits[5];
-cx qubits[9],qubits[5];
-cx qubits[5],qubits[6];
-x qubits[5];
-cx qubits[9],qubits[1];
-cx qubits[1],qubits[8];
-cx qubits[1],qubits[4];
-cx qubits[1],qubits[3];
-cx qubits[1],qubits[0];
-cx qubits[3],qubits[1];
-cx qubits[0],qubits[8];
-cx qubits[0],qubits[3];
-cx qubits[0],qubits[2];
-cx qubits[4],qubits[1];
-cx qubits[1],qubits[2];
-x qubits[1];
-cx qubits[1],qubits[4];
-cx qubits[1],qubits[0];
-cx qubits[0],qubits[7];
-cx qubits[1],qubits[6];
-cx qubits[1],qubits[5];
-cx qubits[9],qubits[1];
-cx qubits[0],qubits[2];
-cx qubits[1],qubits[2];
-cx qubits[2],qubits[9];
-h qubits[2];
-h qubits[2];
-ccx qubits[0],qubits[1],qubits[2];
-h qubits[2];
-h qubits[2];
-h qubits[15];
-h qubits[15];
-ccx qubits[2],qubits[3],qubits[15];
-h qubits[15];
-h qubits[15];
-h qubits[14];
-h qubits[14];
-ccx qubits[15],qubits[4],qubits[14];
-h qubits[14];
-h qubits[14];
-h qubits[13];
-h qubits[13];
-ccx qubits[14],qubits[5],qubits[13];
-h qubits[13];
-h qubits[13];
-h qubits[12];
-h qubits[12];
-ccx qubits[13],qubits[6],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[7],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[8],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[0];
-h qubits[0];
-ccx qubits[10],qubits[9],qubits[0];
-h qubits[0];
-h qubits[0];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[8],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[7],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[12];
-h qubits[12];
-ccx qubits[13],qubits[6],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[13];
-h qubits[13];
-ccx qubits[14],qubits[5],qubits[13];
-h qubits[13];
-h qubits[13];
-h qubits[14];
-h qubits[14];
-ccx qubits[15],qubits[4],qubits[14];
-h qubits[14];
-h qubits[14];
-h qubits[15];
-h qubits[15];
-ccx qubits[2],qubits[3],qubits[15];
-h qubits[15];
-h qubits[15];
-x qubits[5];
-x qubits[4];
-h qubits[2];
-h qubits[2];
-ccx qubits[0],qubits[1],qubits[2];
-h qubits[2];
-h qubits[2];
-cx qubits[2],qubits[9];
-cx qubits[9],qubits[2];
-cx qubits[1],qubits[6];
-cx qubits[1],qubits[5];
-cx qubits[9],qubits[1];
-cx qubits[5],qubits[9];
-cx qubits[0],qubits[2];
-cx qubits[1],qubits[7];
-cx qubits[0],qubits[4];
-cx qubits[1],qubits[0];
-cx qubits[4],qubits[1];
-cx qubits[0],qubits[9];
-cx qubits[0],qubits[7];
-cx qubits[0],qubits[6];
-cx qubits[0],qubits[5];
-cx qubits[0],qubits[2];
-cx qubits[1],qubits[0];
-cx qubits[0],qubits[4];
-x qubits[0];
-cx qubits[0],qubits[1];
-cx qubits[0],qubits[6];
-cx qubits[0],qubits[9];
-cx qubits[5],qubits[9];
-cx qubits[9],qubits[1];
-cx qubits[9],qubits[5];
-cx qubits[9],qubits[6];
-cx qubits[1],qubits[2];
-cx qubits[2],qubits[9];
-h qubits[2];
-h qubits[2];
-ccx qubits[0],qubits[1],qubits[2];
-h qubits[2];
-h qubits[2];
-x qubits[5];
-h qubits[15];
-h qubits[15];
-ccx qubits[2],qubits[3],qubits[15];
-h qubits[15];
-h qubits[15];
-h qubits[14];
-h qubits[14];
-ccx qubits[15],qubits[4],qubits[14];
-h qubits[14];
-h qubits[14];
-h qubits[13];
-h qubits[13];
-ccx qubits[14],qubits[5],qubits[13];
-h qubits[13];
-h qubits[13];
-h qubits[12];
-h qubits[12];
-ccx qubits[13],qubits[6],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[7],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[8],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[0];
-h qubits[0];
-ccx qubits[10],qubits[9],qubits[0];
-h qubits[0];
-h qubits[0];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[8],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[7],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[12];
-h qubits[12];
-ccx qubits[13],qubits[6],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[13];
-h qubits[13];
-ccx qubits[14],qubits[5],qubits[13];
-h qubits[13];
-h qubits[13];
-h qubits[14];
-h qubits[14];
-ccx qubits[15],qubits[4],qubits[14];
-h qubits[14];
-h qubits[14];
-h qubits[15];
-h qubits[15];
-ccx qubits[2],qubits[3],qubits[15];
-h qubits[15];
-h qubits[15];
-h qubits[2];
-h qubits[2];
-ccx qubits[0],qubits[1],qubits[2];
-h qubits[2];
-h qubits[2];
-cx qubits[2],qubits[9];
-cx qubits[9],qubits[6];
-x qubits[9];
-cx qubits[9],qubits[1];
-cx qubits[9],qubits[2];
-cx qubits[9],qubits[5];
-cx qubits[0],qubits[9];
-x qubits[4];
-cx qubits[0],qubits[3];
-x qubits[0];
-x qubits[6];
-cx qubits[0],qubits[7];
-cx qubits[0],qubits[8];
-cx qubits[9],qubits[2];
-cx qubits[0],qubits[9];
-cx qubits[9],qubits[1];
-cx qubits[9],qubits[5];
-cx qubits[9],qubits[6];
-cx qubits[2],qubits[9];
-h qubits[2];
-h qubits[2];
-ccx qubits[0],qubits[1],qubits[2];
-h qubits[2];
-h qubits[2];
-h qubits[15];
-h qubits[15];
-ccx qubits[2],qubits[3],qubits[15];
-h qubits[15];
-h qubits[15];
-h qubits[14];
-h qubits[14];
-ccx qubits[15],qubits[4],qubits[14];
-h qubits[14];
-h qubits[14];
-h qubits[13];
-h qubits[13];
-ccx qubits[14],qubits[5],qubits[13];
-h qubits[13];
-h qubits[13];
-h qubits[12];
-h qubits[12];
-ccx qubits[13],qubits[6],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[7],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[8],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[0];
-h qubits[0];
-ccx qubits[10],qubits[9],qubits[0];
-h qubits[0];
-h qubits[0];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[8],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[7],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[12];
-h qubits[12];
-ccx qubits[13],qubits[6],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[13];
-h qubits[13];
-ccx qubits[14],qubits[5],qubits[13];
-h qubits[13];
-h qubits[13];
-h qubits[14];
-h qubits[14];
-ccx qubits[15],qubits[4],qubits[14];
-h qubits[14];
-h qubits[14];
-h qubits[15];
-h qubits[15];
-ccx qubits[2],qubits[3],qubits[15];
-h qubits[15];
-h qubits[15];
-x qubits[5];
-x qubits[3];
-h qubits[2];
-h qubits[2];
-ccx qubits[0],qubits[1],qubits[2];
-h qubits[2];
-h qubits[2];
-cx qubits[2],qubits[9];
-cx qubits[9],qubits[1];
-x qubits[2];
-cx qubits[9],qubits[2];
-cx qubits[0],qubits[2];
-cx qubits[9],qubits[6];
-cx qubits[9],qubits[5];
-cx qubits[5],qubits[9];
-cx qubits[0],qubits[9];
-cx qubits[0],qubits[8];
-cx qubits[0],qubits[7];
-cx qubits[0],qubits[6];
-cx qubits[0],qubits[4];
-cx qubits[3],qubits[1];
-cx qubits[0],qubits[3];
-x qubits[3];
-cx qubits[1],qubits[3];
-cx qubits[3],qubits[0];
-cx qubits[0],qubits[3];
-x qubits[7];
-cx qubits[0],qubits[4];
-cx qubits[0],qubits[5];
-cx qubits[0],qubits[6];
-cx qubits[0],qubits[8];
-cx qubits[0],qubits[9];
-cx qubits[7],qubits[9];
-cx qubits[9],qubits[1];
-cx qubits[9],qubits[7];
-cx qubits[9],qubits[8];
-cx qubits[1],qubits[2];
-cx qubits[2],qubits[9];
-h qubits[2];
-h qubits[2];
-ccx qubits[0],qubits[1],qubits[2];
-h qubits[2];
-h qubits[2];
-x qubits[5];
-x qubits[7];
-h qubits[15];
-h qubits[15];
-ccx qubits[2],qubits[3],qubits[15];
-h qubits[15];
-h qubits[15];
-h qubits[14];
-h qubits[14];
-ccx qubits[15],qubits[4],qubits[14];
-h qubits[14];
-h qubits[14];
-h qubits[13];
-h qubits[13];
-ccx qubits[14],qubits[5],qubits[13];
-h qubits[13];
-h qubits[13];
-h qubits[12];
-h qubits[12];
-ccx qubits[13],qubits[6],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[7],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[8],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[0];
-h qubits[0];
-ccx qubits[10],qubits[9],qubits[0];
-h qubits[0];
-h qubits[0];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[8],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[7],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[12];
-h qubits[12];
-ccx qubits[13],qubits[6],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[13];
-h qubits[13];
-ccx qubits[14],qubits[5],qubits[13];
-h qubits[13];
-h qubits[13];
-h qubits[14];
-h qubits[14];
-ccx qubits[15],qubits[4],qubits[14];
-h qubits[14];
-h qubits[14];
-h qubits[15];
-h qubits[15];
-ccx qubits[2],qubits[3],qubits[15];
-h qubits[15];
-h qubits[15];
-x qubits[7];
-cx qubits[0],qubits[3];
-h qubits[2];
-h qubits[2];
-ccx qubits[0],qubits[1],qubits[2];
-h qubits[2];
-h qubits[2];
-cx qubits[2],qubits[9];
-cx qubits[1],qubits[2];
-cx qubits[9],qubits[8];
-cx qubits[9],qubits[7];
-cx qubits[9],qubits[1];
-cx qubits[7],qubits[9];
-cx qubits[1],qubits[5];
-cx qubits[0],qubits[9];
-cx qubits[0],qubits[4];
-cx qubits[3],qubits[9];
-cx qubits[9],qubits[3];
-cx qubits[0],qubits[9];
-x qubits[0];
-cx qubits[9],qubits[0];
-cx qubits[0],qubits[7];
-cx qubits[9],qubits[2];
-cx qubits[9],qubits[1];
-cx qubits[9],qubits[5];
-cx qubits[9],qubits[6];
-cx qubits[0],qubits[2];
-cx qubits[2],qubits[9];
-h qubits[2];
-h qubits[2];
-ccx qubits[0],qubits[1],qubits[2];
-h qubits[2];
-h qubits[2];
-h qubits[15];
-h qubits[15];
-ccx qubits[2],qubits[3],qubits[15];
-h qubits[15];
-h qubits[15];
-h qubits[14];
-h qubits[14];
-ccx qubits[15],qubits[4],qubits[14];
-h qubits[14];
-h qubits[14];
-h qubits[13];
-h qubits[13];
-ccx qubits[14],qubits[5],qubits[13];
-h qubits[13];
-h qubits[13];
-h qubits[12];
-h qubits[12];
-ccx qubits[13],qubits[6],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[7],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[8],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[0];
-h qubits[0];
-ccx qubits[10],qubits[9],qubits[0];
-h qubits[0];
-h qubits[0];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[8],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[7],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[12];
-h qubits[12];
-ccx qubits[13],qubits[6],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[13];
-h qubits[13];
-ccx qubits[14],qubits[5],qubits[13];
-h qubits[13];
-h qubits[13];
-h qubits[14];
-h qubits[14];
-ccx qubits[15],qubits[4],qubits[14];
-h qubits[14];
-h qubits[14];
-h qubits[15];
-h qubits[15];
-ccx qubits[2],qubits[3],qubits[15];
-h qubits[15];
-h qubits[15];
-x qubits[6];
-x qubits[3];
-h qubits[2];
-h qubits[2];
-ccx qubits[0],qubits[1],qubits[2];
-h qubits[2];
-h qubits[2];
-cx qubits[2],qubits[9];
-cx qubits[9],qubits[2];
-cx qubits[9],qubits[1];
-cx qubits[0],qubits[2];
-cx qubits[9],qubits[7];
-cx qubits[9],qubits[6];
-cx qubits[9],qubits[5];
-cx qubits[9],qubits[3];
-cx qubits[9],qubits[0];
-cx qubits[3],qubits[9];
-cx qubits[1],qubits[5];
-cx qubits[1],qubits[3];
-cx qubits[0],qubits[3];
-cx qubits[0],qubits[8];
-cx qubits[0],qubits[7];
-cx qubits[0],qubits[6];
-cx qubits[0],qubits[5];
-x qubits[2];
-cx qubits[3],qubits[0];
-cx qubits[0],qubits[3];
-x qubits[3];
-cx qubits[0],qubits[6];
-cx qubits[0],qubits[8];
-cx qubits[6],qubits[9];
-cx qubits[9],qubits[1];
-cx qubits[9],qubits[6];
-cx qubits[9],qubits[7];
-cx qubits[1],qubits[2];
-cx qubits[2],qubits[9];
-h qubits[2];
-h qubits[2];
-ccx qubits[0],qubits[1],qubits[2];
-h qubits[2];
-h qubits[2];
-x qubits[5];
-x qubits[6];
-h qubits[15];
-h qubits[15];
-ccx qubits[2],qubits[3],qubits[15];
-h qubits[15];
-h qubits[15];
-h qubits[14];
-h qubits[14];
-ccx qubits[15],qubits[4],qubits[14];
-h qubits[14];
-h qubits[14];
-h qubits[13];
-h qubits[13];
-ccx qubits[14],qubits[5],qubits[13];
-h qubits[13];
-h qubits[13];
-h qubits[12];
-h qubits[12];
-ccx qubits[13],qubits[6],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[7],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[8],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[0];
-h qubits[0];
-ccx qubits[10],qubits[9],qubits[0];
-h qubits[0];
-h qubits[0];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[8],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[7],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[12];
-h qubits[12];
-ccx qubits[13],qubits[6],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[13];
-h qubits[13];
-ccx qubits[14],qubits[5],qubits[13];
-h qubits[13];
-h qubits[13];
-h qubits[14];
-h qubits[14];
-ccx qubits[15],qubits[4],qubits[14];
-h qubits[14];
-h qubits[14];
-h qubits[15];
-h qubits[15];
-ccx qubits[2],qubits[3],qubits[15];
-h qubits[15];
-h qubits[15];
-x qubits[6];
-x qubits[3];
-h qubits[2];
-h qubits[2];
-ccx qubits[0],qubits[1],qubits[2];
-h qubits[2];
-h qubits[2];
-cx qubits[2],qubits[9];
-x qubits[2];
-cx qubits[1],qubits[2];
-cx qubits[9],qubits[1];
-cx qubits[0],qubits[8];
-cx qubits[0],qubits[3];
-cx qubits[1],qubits[0];
-cx qubits[9],qubits[7];
-cx qubits[9],qubits[6];
-cx qubits[6],qubits[9];
-cx qubits[1],qubits[6];
-cx qubits[3],qubits[1];
-cx qubits[0],qubits[6];
-cx qubits[1],qubits[0];
-x qubits[0];
-cx qubits[0],qubits[1];
-cx qubits[0],qubits[3];
-cx qubits[0],qubits[5];
-cx qubits[0],qubits[6];
-cx qubits[1],qubits[0];
-cx qubits[0],qubits[7];
-cx qubits[0],qubits[8];
-cx qubits[1],qubits[2];
-cx qubits[3],qubits[9];
-cx qubits[9],qubits[0];
-cx qubits[9],qubits[1];
-cx qubits[9],qubits[3];
-cx qubits[9],qubits[6];
-cx qubits[9],qubits[7];
-cx qubits[0],qubits[2];
-cx qubits[1],qubits[2];
-cx qubits[2],qubits[9];
-h qubits[2];
-h qubits[2];
-ccx qubits[0],qubits[1],qubits[2];
-h qubits[2];
-h qubits[2];
-x qubits[3];
-x qubits[6];
-h qubits[15];
-h qubits[15];
-ccx qubits[2],qubits[3],qubits[15];
-h qubits[15];
-h qubits[15];
-h qubits[14];
-h qubits[14];
-ccx qubits[15],qubits[4],qubits[14];
-h qubits[14];
-h qubits[14];
-h qubits[13];
-h qubits[13];
-ccx qubits[14],qubits[5],qubits[13];
-h qubits[13];
-h qubits[13];
-h qubits[12];
-h qubits[12];
-ccx qubits[13],qubits[6],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[7],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[8],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[0];
-h qubits[0];
-ccx qubits[10],qubits[9],qubits[0];
-h qubits[0];
-h qubits[0];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[8],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[7],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[12];
-h qubits[12];
-ccx qubits[13],qubits[6],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[13];
-h qubits[13];
-ccx qubits[14],qubits[5],qubits[13];
-h qubits[13];
-h qubits[13];
-h qubits[14];
-h qubits[14];
-ccx qubits[15],qubits[4],qubits[14];
-h qubits[14];
-h qubits[14];
-h qubits[15];
-h qubits[15];
-ccx qubits[2],qubits[3],qubits[15];
-h qubits[15];
-h qubits[15];
-x qubits[3];
-h qubits[2];
-h qubits[2];
-ccx qubits[0],qubits[1],qubits[2];
-h qubits[2];
-h qubits[2];
-cx qubits[2],qubits[9];
-cx qubits[9],qubits[0];
-x qubits[2];
-cx qubits[0],qubits[2];
-cx qubits[1],qubits[7];
-cx qubits[9],qubits[1];
-cx qubits[9],qubits[6];
-cx qubits[9],qubits[3];
-cx qubits[3],qubits[9];
-cx qubits[0],qubits[8];
-cx qubits[1],qubits[0];
-cx qubits[0],qubits[1];
-cx qubits[0],qubits[7];
-cx qubits[0],qubits[6];
-x qubits[0];
-cx qubits[0],qubits[8];
-cx qubits[6],qubits[9];
-cx qubits[9],qubits[1];
-cx qubits[9],qubits[6];
-cx qubits[9],qubits[7];
-cx qubits[1],qubits[2];
-cx qubits[2],qubits[9];
-h qubits[2];
-h qubits[2];
-ccx qubits[0],qubits[1],qubits[2];
-h qubits[2];
-h qubits[2];
-x qubits[6];
-h qubits[15];
-h qubits[15];
-ccx qubits[2],qubits[3],qubits[15];
-h qubits[15];
-h qubits[15];
-h qubits[14];
-h qubits[14];
-ccx qubits[15],qubits[4],qubits[14];
-h qubits[14];
-h qubits[14];
-h qubits[13];
-h qubits[13];
-ccx qubits[14],qubits[5],qubits[13];
-h qubits[13];
-h qubits[13];
-h qubits[12];
-h qubits[12];
-ccx qubits[13],qubits[6],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[7],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[8],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[0];
-h qubits[0];
-ccx qubits[10],qubits[9],qubits[0];
-h qubits[0];
-h qubits[0];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[8],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[7],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[12];
-h qubits[12];
-ccx qubits[13],qubits[6],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[13];
-h qubits[13];
-ccx qubits[14],qubits[5],qubits[13];
-h qubits[13];
-h qubits[13];
-h qubits[14];
-h qubits[14];
-ccx qubits[15],qubits[4],qubits[14];
-h qubits[14];
-h qubits[14];
-h qubits[15];
-h qubits[15];
-ccx qubits[2],qubits[3],qubits[15];
-h qubits[15];
-h qubits[15];
-x qubits[6];
-h qubits[2];
-h qubits[2];
-ccx qubits[0],qubits[1],qubits[2];
-h qubits[2];
-h qubits[2];
-cx qubits[2],qubits[9];
-cx qubits[9],qubits[1];
-x qubits[2];
-cx qubits[9],qubits[2];
-cx qubits[9],qubits[7];
-cx qubits[9],qubits[6];
-cx qubits[6],qubits[9];
-cx qubits[0],qubits[8];
-cx qubits[0],qubits[5];
-cx qubits[0],qubits[3];
-cx qubits[3],qubits[0];
-x qubits[3];
-cx qubits[0],qubits[3];
-cx qubits[0],qubits[7];
-cx qubits[0],qubits[8];
-cx qubits[1],qubits[3];
-cx qubits[1],qubits[5];
-cx qubits[3],qubits[9];
-cx qubits[9],qubits[0];
-cx qubits[9],qubits[1];
-cx qubits[9],qubits[3];
-cx qubits[9],qubits[5];
-cx qubits[9],qubits[6];
-cx qubits[9],qubits[7];
-cx qubits[0],qubits[2];
-cx qubits[1],qubits[2];
-cx qubits[2],qubits[9];
-h qubits[2];
-h qubits[2];
-ccx qubits[0],qubits[1],qubits[2];
-h qubits[2];
-h qubits[2];
-x qubits[3];
-x qubits[6];
-h qubits[15];
-h qubits[15];
-ccx qubits[2],qubits[3],qubits[15];
-h qubits[15];
-h qubits[15];
-h qubits[14];
-h qubits[14];
-ccx qubits[15],qubits[4],qubits[14];
-h qubits[14];
-h qubits[14];
-h qubits[13];
-h qubits[13];
-ccx qubits[14],qubits[5],qubits[13];
-h qubits[13];
-h qubits[13];
-h qubits[12];
-h qubits[12];
-ccx qubits[13],qubits[6],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[7],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[8],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[0];
-h qubits[0];
-ccx qubits[10],qubits[9],qubits[0];
-h qubits[0];
-h qubits[0];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[8],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[7],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[12];
-h qubits[12];
-ccx qubits[13],qubits[6],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[13];
-h qubits[13];
-ccx qubits[14],qubits[5],qubits[13];
-h qubits[13];
-h qubits[13];
-h qubits[14];
-h qubits[14];
-ccx qubits[15],qubits[4],qubits[14];
-h qubits[14];
-h qubits[14];
-h qubits[15];
-h qubits[15];
-ccx qubits[2],qubits[3],qubits[15];
-h qubits[15];
-h qubits[15];
-x qubits[3];
-h qubits[2];
-h qubits[2];
-ccx qubits[0],qubits[1],qubits[2];
-h qubits[2];
-h qubits[2];
-cx qubits[2],qubits[9];
-cx qubits[9],qubits[0];
-cx qubits[0],qubits[2];
-cx qubits[1],qubits[7];
-cx qubits[9],qubits[1];
-cx qubits[9],qubits[6];
-cx qubits[9],qubits[5];
-cx qubits[9],qubits[3];
-cx qubits[3],qubits[9];
-cx qubits[1],qubits[3];
-cx qubits[0],qubits[8];
-cx qubits[0],qubits[3];
-cx qubits[3],qubits[0];
-cx qubits[3],qubits[7];
-cx qubits[0],qubits[5];
-cx qubits[1],qubits[0];
-cx qubits[1],qubits[3];
-cx qubits[5],qubits[9];
-cx qubits[9],qubits[1];
-cx qubits[9],qubits[5];
-cx qubits[9],qubits[6];
-cx qubits[9],qubits[7];
-cx qubits[9],qubits[8];
-cx qubits[0],qubits[2];
-cx qubits[1],qubits[2];
-cx qubits[2],qubits[9];
-h qubits[2];
-h qubits[2];
-ccx qubits[0],qubits[1],qubits[2];
-h qubits[2];
-h qubits[2];
-x qubits[5];
-h qubits[15];
-h qubits[15];
-ccx qubits[2],qubits[3],qubits[15];
-h qubits[15];
-h qubits[15];
-h qubits[14];
-h qubits[14];
-ccx qubits[15],qubits[4],qubits[14];
-h qubits[14];
-h qubits[14];
-h qubits[13];
-h qubits[13];
-ccx qubits[14],qubits[5],qubits[13];
-h qubits[13];
-h qubits[13];
-h qubits[12];
-h qubits[12];
-ccx qubits[13],qubits[6],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[7],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[8],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[0];
-h qubits[0];
-ccx qubits[10],qubits[9],qubits[0];
-h qubits[0];
-h qubits[0];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[8],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[7],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[12];
-h qubits[12];
-ccx qubits[13],qubits[6],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[13];
-h qubits[13];
-ccx qubits[14],qubits[5],qubits[13];
-h qubits[13];
-h qubits[13];
-h qubits[14];
-h qubits[14];
-ccx qubits[15],qubits[4],qubits[14];
-h qubits[14];
-h qubits[14];
-h qubits[15];
-h qubits[15];
-ccx qubits[2],qubits[3],qubits[15];
-h qubits[15];
-h qubits[15];
-x qubits[3];
-cx qubits[0],qubits[3];
-h qubits[2];
-h qubits[2];
-ccx qubits[0],qubits[1],qubits[2];
-h qubits[2];
-h qubits[2];
-cx qubits[2],qubits[9];
-cx qubits[1],qubits[2];
-cx qubits[0],qubits[2];
-cx qubits[9],qubits[8];
-cx qubits[9],qubits[7];
-cx qubits[9],qubits[6];
-cx qubits[9],qubits[1];
-cx qubits[1],qubits[9];
-cx qubits[9],qubits[5];
-cx qubits[5],qubits[9];
-cx qubits[0],qubits[7];
-cx qubits[1],qubits[0];
-cx qubits[6],qubits[9];
-cx qubits[9],qubits[6];
-x qubits[2];
-cx qubits[0],qubits[8];
-cx qubits[9],qubits[1];
-cx qubits[9],qubits[7];
-cx qubits[1],qubits[2];
-cx qubits[2],qubits[9];
-h qubits[2];
-h qubits[2];
-ccx qubits[0],qubits[1],qubits[2];
-h qubits[2];
-h qubits[2];
-h qubits[15];
-h qubits[15];
-ccx qubits[2],qubits[3],qubits[15];
-h qubits[15];
-h qubits[15];
-h qubits[14];
-h qubits[14];
-ccx qubits[15],qubits[4],qubits[14];
-h qubits[14];
-h qubits[14];
-h qubits[13];
-h qubits[13];
-ccx qubits[14],qubits[5],qubits[13];
-h qubits[13];
-h qubits[13];
-h qubits[12];
-h qubits[12];
-ccx qubits[13],qubits[6],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[7],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[8],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[0];
-h qubits[0];
-ccx qubits[10],qubits[9],qubits[0];
-h qubits[0];
-h qubits[0];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[8],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[7],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[12];
-h qubits[12];
-ccx qubits[13],qubits[6],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[13];
-h qubits[13];
-ccx qubits[14],qubits[5],qubits[13];
-h qubits[13];
-h qubits[13];
-h qubits[14];
-h qubits[14];
-ccx qubits[15],qubits[4],qubits[14];
-h qubits[14];
-h qubits[14];
-h qubits[15];
-h qubits[15];
-ccx qubits[2],qubits[3],qubits[15];
-h qubits[15];
-h qubits[15];
-x qubits[6];
-h qubits[2];
-h qubits[2];
-ccx qubits[0],qubits[1],qubits[2];
-h qubits[2];
-h qubits[2];
-cx qubits[2],qubits[9];
-cx qubits[1],qubits[2];
-cx qubits[9],qubits[7];
-cx qubits[9],qubits[6];
-cx qubits[9],qubits[1];
-cx qubits[6],qubits[9];
-cx qubits[0],qubits[8];
-x qubits[2];
-x qubits[0];
-x qubits[1];
-cx qubits[3],qubits[1];
-cx qubits[1],qubits[3];
-cx qubits[0],qubits[3];
-cx qubits[0],qubits[6];
-cx qubits[7],qubits[9];
-cx qubits[9],qubits[1];
-cx qubits[9],qubits[7];
-cx qubits[9],qubits[8];
-cx qubits[1],qubits[2];
-cx qubits[2],qubits[9];
-h qubits[2];
-h qubits[2];
-ccx qubits[0],qubits[1],qubits[2];
-h qubits[2];
-h qubits[2];
-x qubits[7];
-h qubits[15];
-h qubits[15];
-ccx qubits[2],qubits[3],qubits[15];
-h qubits[15];
-h qubits[15];
-h qubits[14];
-h qubits[14];
-ccx qubits[15],qubits[4],qubits[14];
-h qubits[14];
-h qubits[14];
-h qubits[13];
-h qubits[13];
-ccx qubits[14],qubits[5],qubits[13];
-h qubits[13];
-h qubits[13];
-h qubits[12];
-h qubits[12];
-ccx qubits[13],qubits[6],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[7],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[8],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[0];
-h qubits[0];
-ccx qubits[10],qubits[9],qubits[0];
-h qubits[0];
-h qubits[0];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[8],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[7],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[12];
-h qubits[12];
-ccx qubits[13],qubits[6],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[13];
-h qubits[13];
-ccx qubits[14],qubits[5],qubits[13];
-h qubits[13];
-h qubits[13];
-h qubits[14];
-h qubits[14];
-ccx qubits[15],qubits[4],qubits[14];
-h qubits[14];
-h qubits[14];
-h qubits[15];
-h qubits[15];
-ccx qubits[2],qubits[3],qubits[15];
-h qubits[15];
-h qubits[15];
-x qubits[7];
-x qubits[5];
-x qubits[3];
-h qubits[2];
-h qubits[2];
-ccx qubits[0],qubits[1],qubits[2];
-h qubits[2];
-h qubits[2];
-cx qubits[2],qubits[9];
-cx qubits[1],qubits[2];
-cx qubits[9],qubits[8];
-cx qubits[9],qubits[7];
-cx qubits[9],qubits[1];
-cx qubits[7],qubits[9];
-cx qubits[1],qubits[3];
-cx qubits[0],qubits[3];
-cx qubits[3],qubits[1];
-x qubits[1];
-cx qubits[1],qubits[3];
-cx qubits[0],qubits[6];
-cx qubits[1],qubits[2];
-cx qubits[1],qubits[0];
-cx qubits[0],qubits[8];
-cx qubits[1],qubits[5];
-cx qubits[5],qubits[9];
-cx qubits[9],qubits[1];
-cx qubits[9],qubits[5];
-cx qubits[9],qubits[6];
-cx qubits[1],qubits[2];
-cx qubits[2],qubits[9];
-h qubits[2];
-h qubits[2];
-ccx qubits[0],qubits[1],qubits[2];
-h qubits[2];
-h qubits[2];
-x qubits[5];
-x qubits[7];
-h qubits[15];
-h qubits[15];
-ccx qubits[2],qubits[3],qubits[15];
-h qubits[15];
-h qubits[15];
-h qubits[14];
-h qubits[14];
-ccx qubits[15],qubits[4],qubits[14];
-h qubits[14];
-h qubits[14];
-h qubits[13];
-h qubits[13];
-ccx qubits[14],qubits[5],qubits[13];
-h qubits[13];
-h qubits[13];
-h qubits[12];
-h qubits[12];
-ccx qubits[13],qubits[6],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[7],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[8],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[0];
-h qubits[0];
-ccx qubits[10],qubits[9],qubits[0];
-h qubits[0];
-h qubits[0];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[8],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[7],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[12];
-h qubits[12];
-ccx qubits[13],qubits[6],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[13];
-h qubits[13];
-ccx qubits[14],qubits[5],qubits[13];
-h qubits[13];
-h qubits[13];
-h qubits[14];
-h qubits[14];
-ccx qubits[15],qubits[4],qubits[14];
-h qubits[14];
-h qubits[14];
-h qubits[15];
-h qubits[15];
-ccx qubits[2],qubits[3],qubits[15];
-h qubits[15];
-h qubits[15];
-x qubits[5];
-h qubits[2];
-h qubits[2];
-ccx qubits[0],qubits[1],qubits[2];
-h qubits[2];
-h qubits[2];
-cx qubits[2],qubits[9];
-cx qubits[1],qubits[2];
-cx qubits[0],qubits[2];
-cx qubits[9],qubits[6];
-cx qubits[9],qubits[5];
-cx qubits[9],qubits[1];
-cx qubits[5],qubits[9];
-cx qubits[1],qubits[8];
-cx qubits[1],qubits[5];
-cx qubits[0],qubits[3];
-cx qubits[1],qubits[0];
-x qubits[3];
-cx qubits[3],qubits[1];
-cx qubits[1],qubits[6];
-cx qubits[0],qubits[8];
-cx qubits[0],qubits[2];
-x qubits[0];
-cx qubits[0],qubits[1];
-cx qubits[1],qubits[0];
-cx qubits[1],qubits[3];
-cx qubits[1],qubits[5];
-cx qubits[5],qubits[9];
-cx qubits[9],qubits[1];
-cx qubits[9],qubits[5];
-cx qubits[9],qubits[6];
-cx qubits[9],qubits[7];
-cx qubits[9],qubits[8];
-cx qubits[1],qubits[2];
-cx qubits[2],qubits[9];
-h qubits[2];
-h qubits[2];
-ccx qubits[0],qubits[1],qubits[2];
-h qubits[2];
-h qubits[2];
-x qubits[5];
-h qubits[15];
-h qubits[15];
-ccx qubits[2],qubits[3],qubits[15];
-h qubits[15];
-h qubits[15];
-h qubits[14];
-h qubits[14];
-ccx qubits[15],qubits[4],qubits[14];
-h qubits[14];
-h qubits[14];
-h qubits[13];
-h qubits[13];
-ccx qubits[14],qubits[5],qubits[13];
-h qubits[13];
-h qubits[13];
-h qubits[12];
-h qubits[12];
-ccx qubits[13],qubits[6],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[7],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[8],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[0];
-h qubits[0];
-ccx qubits[10],qubits[9],qubits[0];
-h qubits[0];
-h qubits[0];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[8],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[7],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[12];
-h qubits[12];
-ccx qubits[13],qubits[6],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[13];
-h qubits[13];
-ccx qubits[14],qubits[5],qubits[13];
-h qubits[13];
-h qubits[13];
-h qubits[14];
-h qubits[14];
-ccx qubits[15],qubits[4],qubits[14];
-h qubits[14];
-h qubits[14];
-h qubits[15];
-h qubits[15];
-ccx qubits[2],qubits[3],qubits[15];
-h qubits[15];
-h qubits[15];
-x qubits[6];
-x qubits[5];
-x qubits[3];
-h qubits[2];
-h qubits[2];
-ccx qubits[0],qubits[1],qubits[2];
-h qubits[2];
-h qubits[2];
-cx qubits[2],qubits[9];
-cx qubits[9],qubits[1];
-x qubits[2];
-cx qubits[9],qubits[2];
-cx qubits[0],qubits[2];
-cx qubits[9],qubits[8];
-cx qubits[9],qubits[7];
-cx qubits[9],qubits[6];
-cx qubits[9],qubits[5];
-cx qubits[5],qubits[9];
-cx qubits[1],qubits[6];
-cx qubits[1],qubits[5];
-cx qubits[1],qubits[3];
-cx qubits[1],qubits[0];
-cx qubits[3],qubits[1];
-cx qubits[0],qubits[3];
-cx qubits[0],qubits[7];
-cx qubits[0],qubits[8];
-cx qubits[6],qubits[9];
-cx qubits[9],qubits[1];
-cx qubits[9],qubits[6];
-cx qubits[9],qubits[7];
-cx qubits[1],qubits[2];
-cx qubits[2],qubits[9];
-h qubits[2];
-h qubits[2];
-ccx qubits[0],qubits[1],qubits[2];
-h qubits[2];
-h qubits[2];
-x qubits[5];
-x qubits[6];
-h qubits[15];
-h qubits[15];
-ccx qubits[2],qubits[3],qubits[15];
-h qubits[15];
-h qubits[15];
-h qubits[14];
-h qubits[14];
-ccx qubits[15],qubits[4],qubits[14];
-h qubits[14];
-h qubits[14];
-h qubits[13];
-h qubits[13];
-ccx qubits[14],qubits[5],qubits[13];
-h qubits[13];
-h qubits[13];
-h qubits[12];
-h qubits[12];
-ccx qubits[13],qubits[6],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[7],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[8],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[0];
-h qubits[0];
-ccx qubits[10],qubits[9],qubits[0];
-h qubits[0];
-h qubits[0];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[8],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[7],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[12];
-h qubits[12];
-ccx qubits[13],qubits[6],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[13];
-h qubits[13];
-ccx qubits[14],qubits[5],qubits[13];
-h qubits[13];
-h qubits[13];
-h qubits[14];
-h qubits[14];
-ccx qubits[15],qubits[4],qubits[14];
-h qubits[14];
-h qubits[14];
-h qubits[15];
-h qubits[15];
-ccx qubits[2],qubits[3],qubits[15];
-h qubits[15];
-h qubits[15];
-x qubits[6];
-h qubits[2];
-h qubits[2];
-ccx qubits[0],qubits[1],qubits[2];
-h qubits[2];
-h qubits[2];
-cx qubits[2],qubits[9];
-cx qubits[1],qubits[2];
-x qubits[0];
-x qubits[2];
-cx qubits[9],qubits[7];
-cx qubits[9],qubits[6];
-cx qubits[9],qubits[1];
-cx qubits[6],qubits[9];
-x qubits[6];
-x qubits[8];
-x qubits[7];
-x qubits[5];
-cx qubits[3],qubits[1];
-cx qubits[1],qubits[0];
-cx qubits[1],qubits[3];
-cx qubits[1],qubits[5];
-cx qubits[1],qubits[6];
-cx qubits[1],qubits[7];
-cx qubits[1],qubits[8];
-cx qubits[5],qubits[9];
-cx qubits[9],qubits[1];
-cx qubits[9],qubits[5];
-cx qubits[9],qubits[6];
-cx qubits[1],qubits[2];
-cx qubits[2],qubits[9];
-h qubits[2];
-h qubits[2];
-ccx qubits[0],qubits[1],qubits[2];
-h qubits[2];
-h qubits[2];
-x qubits[3];
-x qubits[5];
-h qubits[15];
-h qubits[15];
-ccx qubits[2],qubits[3],qubits[15];
-h qubits[15];
-h qubits[15];
-h qubits[14];
-h qubits[14];
-ccx qubits[15],qubits[4],qubits[14];
-h qubits[14];
-h qubits[14];
-h qubits[13];
-h qubits[13];
-ccx qubits[14],qubits[5],qubits[13];
-h qubits[13];
-h qubits[13];
-h qubits[12];
-h qubits[12];
-ccx qubits[13],qubits[6],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[7],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[8],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[0];
-h qubits[0];
-ccx qubits[10],qubits[9],qubits[0];
-h qubits[0];
-h qubits[0];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[8],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[7],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[12];
-h qubits[12];
-ccx qubits[13],qubits[6],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[13];
-h qubits[13];
-ccx qubits[14],qubits[5],qubits[13];
-h qubits[13];
-h qubits[13];
-h qubits[14];
-h qubits[14];
-ccx qubits[15],qubits[4],qubits[14];
-h qubits[14];
-h qubits[14];
-h qubits[15];
-h qubits[15];
-ccx qubits[2],qubits[3],qubits[15];
-h qubits[15];
-h qubits[15];
-x qubits[5];
-x qubits[3];
-h qubits[2];
-h qubits[2];
-ccx qubits[0],qubits[1],qubits[2];
-h qubits[2];
-h qubits[2];
-cx qubits[2],qubits[9];
-cx qubits[9],qubits[2];
-cx qubits[1],qubits[6];
-cx qubits[9],qubits[1];
-cx qubits[0],qubits[2];
-cx qubits[9],qubits[5];
-cx qubits[5],qubits[9];
-cx qubits[1],qubits[8];
-cx qubits[1],qubits[7];
-cx qubits[1],qubits[5];
-cx qubits[0],qubits[3];
-cx qubits[1],qubits[0];
-cx qubits[3],qubits[1];
-cx qubits[0],qubits[8];
-cx qubits[0],qubits[7];
-cx qubits[0],qubits[6];
-cx qubits[0],qubits[5];
-x qubits[0];
-x qubits[2];
-cx qubits[1],qubits[0];
-cx qubits[0],qubits[1];
-cx qubits[0],qubits[3];
-cx qubits[0],qubits[6];
-cx qubits[0],qubits[8];
-cx qubits[5],qubits[1];
-cx qubits[1],qubits[5];
-cx qubits[3],qubits[9];
-cx qubits[9],qubits[0];
-cx qubits[9],qubits[3];
-cx qubits[9],qubits[5];
-cx qubits[9],qubits[6];
-cx qubits[9],qubits[7];
-cx qubits[9],qubits[8];
-cx qubits[1],qubits[2];
-cx qubits[2],qubits[9];
-h qubits[2];
-h qubits[2];
-ccx qubits[0],qubits[1],qubits[2];
-h qubits[2];
-h qubits[2];
-x qubits[3];
-x qubits[5];
-h qubits[15];
-h qubits[15];
-ccx qubits[2],qubits[3],qubits[15];
-h qubits[15];
-h qubits[15];
-h qubits[14];
-h qubits[14];
-ccx qubits[15],qubits[4],qubits[14];
-h qubits[14];
-h qubits[14];
-h qubits[13];
-h qubits[13];
-ccx qubits[14],qubits[5],qubits[13];
-h qubits[13];
-h qubits[13];
-h qubits[12];
-h qubits[12];
-ccx qubits[13],qubits[6],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[7],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[8],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[0];
-h qubits[0];
-ccx qubits[10],qubits[9],qubits[0];
-h qubits[0];
-h qubits[0];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[8],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[7],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[12];
-h qubits[12];
-ccx qubits[13],qubits[6],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[13];
-h qubits[13];
-ccx qubits[14],qubits[5],qubits[13];
-h qubits[13];
-h qubits[13];
-h qubits[14];
-h qubits[14];
-ccx qubits[15],qubits[4],qubits[14];
-h qubits[14];
-h qubits[14];
-h qubits[15];
-h qubits[15];
-ccx qubits[2],qubits[3],qubits[15];
-h qubits[15];
-h qubits[15];
-x qubits[5];
-x qubits[3];
-h qubits[2];
-h qubits[2];
-ccx qubits[0],qubits[1],qubits[2];
-h qubits[2];
-h qubits[2];
-cx qubits[2],qubits[9];
-cx qubits[1],qubits[2];
-x qubits[2];
-cx qubits[0],qubits[8];
-x qubits[7];
-cx qubits[9],qubits[7];
-cx qubits[0],qubits[6];
-cx qubits[9],qubits[0];
-cx qubits[9],qubits[5];
-cx qubits[9],qubits[3];
-cx qubits[3],qubits[9];
-cx qubits[1],qubits[5];
-cx qubits[5],qubits[1];
-cx qubits[0],qubits[3];
-x qubits[3];
-cx qubits[1],qubits[5];
-cx qubits[1],qubits[0];
-cx qubits[0],qubits[1];
-x qubits[0];
-cx qubits[1],qubits[0];
-cx qubits[0],qubits[6];
-cx qubits[6],qubits[9];
-cx qubits[9],qubits[1];
-cx qubits[9],qubits[6];
-cx qubits[9],qubits[7];
-cx qubits[1],qubits[2];
-cx qubits[2],qubits[9];
-h qubits[2];
-h qubits[2];
-ccx qubits[0],qubits[1],qubits[2];
-h qubits[2];
-h qubits[2];
-x qubits[6];
-x qubits[8];
-h qubits[15];
-h qubits[15];
-ccx qubits[2],qubits[3],qubits[15];
-h qubits[15];
-h qubits[15];
-h qubits[14];
-h qubits[14];
-ccx qubits[15],qubits[4],qubits[14];
-h qubits[14];
-h qubits[14];
-h qubits[13];
-h qubits[13];
-ccx qubits[14],qubits[5],qubits[13];
-h qubits[13];
-h qubits[13];
-h qubits[12];
-h qubits[12];
-ccx qubits[13],qubits[6],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[7],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[8],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[0];
-h qubits[0];
-ccx qubits[10],qubits[9],qubits[0];
-h qubits[0];
-h qubits[0];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[8],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[7],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[12];
-h qubits[12];
-ccx qubits[13],qubits[6],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[13];
-h qubits[13];
-ccx qubits[14],qubits[5],qubits[13];
-h qubits[13];
-h qubits[13];
-h qubits[14];
-h qubits[14];
-ccx qubits[15],qubits[4],qubits[14];
-h qubits[14];
-h qubits[14];
-h qubits[15];
-h qubits[15];
-ccx qubits[2],qubits[3],qubits[15];
-h qubits[15];
-h qubits[15];
-x qubits[6];
-x qubits[5];
-h qubits[2];
-h qubits[2];
-ccx qubits[0],qubits[1],qubits[2];
-h qubits[2];
-h qubits[2];
-cx qubits[2],qubits[9];
-cx qubits[1],qubits[2];
-cx qubits[9],qubits[7];
-cx qubits[9],qubits[6];
-cx qubits[9],qubits[1];
-cx qubits[6],qubits[9];
-cx qubits[0],qubits[6];
-cx qubits[0],qubits[5];
-cx qubits[0],qubits[1];
-x qubits[2];
-cx qubits[1],qubits[0];
-cx qubits[0],qubits[6];
-x qubits[0];
-cx qubits[0],qubits[1];
-cx qubits[0],qubits[7];
-cx qubits[5],qubits[1];
-cx qubits[1],qubits[5];
-cx qubits[5],qubits[9];
-cx qubits[9],qubits[0];
-cx qubits[9],qubits[5];
-cx qubits[9],qubits[6];
-cx qubits[0],qubits[2];
-cx qubits[1],qubits[2];
-cx qubits[2],qubits[9];
-h qubits[2];
-h qubits[2];
-ccx qubits[0],qubits[1],qubits[2];
-h qubits[2];
-h qubits[2];
-x qubits[5];
-h qubits[15];
-h qubits[15];
-ccx qubits[2],qubits[3],qubits[15];
-h qubits[15];
-h qubits[15];
-h qubits[14];
-h qubits[14];
-ccx qubits[15],qubits[4],qubits[14];
-h qubits[14];
-h qubits[14];
-h qubits[13];
-h qubits[13];
-ccx qubits[14],qubits[5],qubits[13];
-h qubits[13];
-h qubits[13];
-h qubits[12];
-h qubits[12];
-ccx qubits[13],qubits[6],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[7],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[8],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[0];
-h qubits[0];
-ccx qubits[10],qubits[9],qubits[0];
-h qubits[0];
-h qubits[0];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[8],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[7],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[12];
-h qubits[12];
-ccx qubits[13],qubits[6],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[13];
-h qubits[13];
-ccx qubits[14],qubits[5],qubits[13];
-h qubits[13];
-h qubits[13];
-h qubits[14];
-h qubits[14];
-ccx qubits[15],qubits[4],qubits[14];
-h qubits[14];
-h qubits[14];
-h qubits[15];
-h qubits[15];
-ccx qubits[2],qubits[3],qubits[15];
-h qubits[15];
-h qubits[15];
-x qubits[5];
-h qubits[2];
-h qubits[2];
-ccx qubits[0],qubits[1],qubits[2];
-h qubits[2];
-h qubits[2];
-cx qubits[2],qubits[9];
-cx qubits[1],qubits[2];
-cx qubits[0],qubits[2];
-cx qubits[9],qubits[6];
-cx qubits[9],qubits[5];
-cx qubits[9],qubits[0];
-cx qubits[5],qubits[9];
-cx qubits[0],qubits[5];
-cx qubits[5],qubits[1];
-cx qubits[0],qubits[7];
-cx qubits[0],qubits[6];
-cx qubits[5],qubits[0];
-x qubits[5];
-cx qubits[0],qubits[7];
-cx qubits[1],qubits[2];
-cx qubits[1],qubits[6];
-cx qubits[5],qubits[9];
-cx qubits[9],qubits[0];
-cx qubits[9],qubits[1];
-cx qubits[9],qubits[5];
-cx qubits[9],qubits[7];
-cx qubits[0],qubits[2];
-cx qubits[1],qubits[2];
-cx qubits[2],qubits[9];
-h qubits[2];
-h qubits[2];
-ccx qubits[0],qubits[1],qubits[2];
-h qubits[2];
-h qubits[2];
-x qubits[5];
-h qubits[15];
-h qubits[15];
-ccx qubits[2],qubits[3],qubits[15];
-h qubits[15];
-h qubits[15];
-h qubits[14];
-h qubits[14];
-ccx qubits[15],qubits[4],qubits[14];
-h qubits[14];
-h qubits[14];
-h qubits[13];
-h qubits[13];
-ccx qubits[14],qubits[5],qubits[13];
-h qubits[13];
-h qubits[13];
-h qubits[12];
-h qubits[12];
-ccx qubits[13],qubits[6],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[7],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[8],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[0];
-h qubits[0];
-ccx qubits[10],qubits[9],qubits[0];
-h qubits[0];
-h qubits[0];
-h qubits[10];
-h qubits[10];
-ccx qubits[11],qubits[8],qubits[10];
-h qubits[10];
-h qubits[10];
-h qubits[11];
-h qubits[11];
-ccx qubits[12],qubits[7],qubits[11];
-h qubits[11];
-h qubits[11];
-h qubits[12];
-h qubits[12];
-ccx qubits[13],qubits[6],qubits[12];
-h qubits[12];
-h qubits[12];
-h qubits[13];
-h qubits[13];
-ccx qubits[14],qubits[5],qubits[13];
-h qubits[13];
-h qubits[13];
-h qubits[14];
-h qubits[14];
-ccx qubits[15],qubits[4],qubits[14];
-h qubits[14];
-h qubits[14];
-h qubits[15];
-h qubits[15];
-ccx qubits[2],qubits[3],qubits[15];
-h qubits[15];
-h qubits[15];
-x qubits[7];
-x qubits[6];
-x qubits[5];
-h qubits[2];
-h qubits[2];
-ccx qubits[0],qubits[1],qubits[2];
-h qubits[2];
-h qubits[2];
-cx qubits[2],qubits[9];
-cx qubits[9],qubits[2];
-cx qubits[9],qubits[1];
-cx qubits[0],qubits[2];
-cx qubits[9],qubits[7];
-cx qubits[9],qubits[5];
-cx qubits[9],qubits[0];
-cx qubits[5],qubits[9];
-cx qubits[1],qubits[6];
-cx qubits[1],qubits[5];
-cx qubits[5],qubits[1];
-cx qubits[0],qubits[7];
-cx qubits[0],qubits[5];
-x qubits[9];
-x qubits[5];
-cx qubits[9],qubits[0];
-cx qubits[9],qubits[1];
-cx qubits[9],qubits[2];
-cx qubits[9],qubits[3];
-cx qubits[9],qubits[4];
-cx qubits[9],qubits[5];
-cx qubits[9],qubits[6];
-cx qubits[9],qubits[7];
-cx qubits[9],qubits[8];
-cx qubits[8],qubits[9];
-cx qubits[9],qubits[8];
-cx qubits[7],qubits[8];
-cx qubits[8],qubits[7];
-cx qubits[6],qubits[7];
-cx qubits[7],qubits[6];
-cx qubits[5],qubits[6];
-cx qubits[6],qubits[5];
-cx qubits[4],qubits[5];
-cx qubits[5],qubits[4];
-cx qubits[3],qubits[4];
-cx qubits[4],qubits[3];
-cx qubits[2],qubits[3];
-cx qubits[3],qubits[2];
-cx qubits[1],qubits[2];
-cx qubits[2],qubits[1];
-cx qubits[0],qubits[1];
-cx qubits[1],qubits[0];
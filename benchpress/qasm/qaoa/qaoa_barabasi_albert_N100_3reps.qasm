@@ -1,2267 +0,0 @@
-OPENQASM 2.0;
-include "qelib1.inc";
-qreg q[100];
-ry(pi/2) q[0];
-rx(pi) q[0];
-ry(pi/2) q[1];
-rx(pi) q[1];
-cx q[0],q[1];
-rz(5.647723184300621) q[1];
-cx q[0],q[1];
-ry(pi/2) q[2];
-rx(pi) q[2];
-cx q[0],q[2];
-rz(5.647723184300621) q[2];
-cx q[0],q[2];
-ry(pi/2) q[3];
-rx(pi) q[3];
-cx q[0],q[3];
-rz(5.647723184300621) q[3];
-cx q[0],q[3];
-cx q[1],q[3];
-rz(5.647723184300621) q[3];
-cx q[1],q[3];
-ry(pi/2) q[4];
-rx(pi) q[4];
-cx q[1],q[4];
-rz(5.647723184300621) q[4];
-cx q[1],q[4];
-cx q[3],q[4];
-rz(5.647723184300621) q[4];
-cx q[3],q[4];
-ry(pi/2) q[5];
-rx(pi) q[5];
-cx q[1],q[5];
-rz(5.647723184300621) q[5];
-cx q[1],q[5];
-cx q[3],q[5];
-rz(5.647723184300621) q[5];
-cx q[3],q[5];
-ry(pi/2) q[6];
-rx(pi) q[6];
-cx q[4],q[6];
-rz(5.647723184300621) q[6];
-cx q[4],q[6];
-cx q[5],q[6];
-rz(5.647723184300621) q[6];
-cx q[5],q[6];
-ry(pi/2) q[7];
-rx(pi) q[7];
-cx q[3],q[7];
-rz(5.647723184300621) q[7];
-cx q[3],q[7];
-cx q[4],q[7];
-rz(5.647723184300621) q[7];
-cx q[4],q[7];
-ry(pi/2) q[8];
-rx(pi) q[8];
-cx q[3],q[8];
-rz(5.647723184300621) q[8];
-cx q[3],q[8];
-cx q[5],q[8];
-rz(5.647723184300621) q[8];
-cx q[5],q[8];
-ry(pi/2) q[9];
-rx(pi) q[9];
-cx q[1],q[9];
-rz(5.647723184300621) q[9];
-cx q[1],q[9];
-cx q[3],q[9];
-rz(5.647723184300621) q[9];
-cx q[3],q[9];
-ry(pi/2) q[10];
-rx(pi) q[10];
-cx q[4],q[10];
-rz(5.647723184300621) q[10];
-cx q[4],q[10];
-cx q[6],q[10];
-rz(5.647723184300621) q[10];
-cx q[6],q[10];
-ry(pi/2) q[11];
-rx(pi) q[11];
-cx q[5],q[11];
-rz(5.647723184300621) q[11];
-cx q[5],q[11];
-cx q[6],q[11];
-rz(5.647723184300621) q[11];
-cx q[6],q[11];
-rx(7.169066981845267) q[11];
-ry(pi/2) q[12];
-rx(pi) q[12];
-cx q[3],q[12];
-rz(5.647723184300621) q[12];
-cx q[3],q[12];
-cx q[5],q[12];
-rz(5.647723184300621) q[12];
-cx q[5],q[12];
-ry(pi/2) q[13];
-rx(pi) q[13];
-cx q[4],q[13];
-rz(5.647723184300621) q[13];
-cx q[4],q[13];
-cx q[5],q[13];
-rz(5.647723184300621) q[13];
-cx q[5],q[13];
-ry(pi/2) q[14];
-rx(pi) q[14];
-cx q[3],q[14];
-rz(5.647723184300621) q[14];
-cx q[3],q[14];
-cx q[4],q[14];
-rz(5.647723184300621) q[14];
-cx q[4],q[14];
-rx(7.169066981845267) q[14];
-ry(pi/2) q[15];
-rx(pi) q[15];
-cx q[0],q[15];
-rz(5.647723184300621) q[15];
-cx q[0],q[15];
-cx q[3],q[15];
-rz(5.647723184300621) q[15];
-cx q[3],q[15];
-ry(pi/2) q[16];
-rx(pi) q[16];
-cx q[0],q[16];
-rz(5.647723184300621) q[16];
-cx q[0],q[16];
-cx q[3],q[16];
-rz(5.647723184300621) q[16];
-cx q[3],q[16];
-ry(pi/2) q[17];
-rx(pi) q[17];
-cx q[1],q[17];
-rz(5.647723184300621) q[17];
-cx q[1],q[17];
-cx q[3],q[17];
-rz(5.647723184300621) q[17];
-cx q[3],q[17];
-ry(pi/2) q[18];
-rx(pi) q[18];
-cx q[3],q[18];
-rz(5.647723184300621) q[18];
-cx q[3],q[18];
-cx q[4],q[18];
-rz(5.647723184300621) q[18];
-cx q[4],q[18];
-ry(pi/2) q[19];
-rx(pi) q[19];
-cx q[3],q[19];
-rz(5.647723184300621) q[19];
-cx q[3],q[19];
-cx q[7],q[19];
-rz(5.647723184300621) q[19];
-cx q[7],q[19];
-ry(pi/2) q[20];
-rx(pi) q[20];
-cx q[0],q[20];
-rz(5.647723184300621) q[20];
-cx q[0],q[20];
-cx q[15],q[20];
-rz(5.647723184300621) q[20];
-cx q[15],q[20];
-ry(pi/2) q[21];
-rx(pi) q[21];
-cx q[4],q[21];
-rz(5.647723184300621) q[21];
-cx q[4],q[21];
-cx q[15],q[21];
-rz(5.647723184300621) q[21];
-cx q[15],q[21];
-ry(pi/2) q[22];
-rx(pi) q[22];
-cx q[3],q[22];
-rz(5.647723184300621) q[22];
-cx q[3],q[22];
-cx q[9],q[22];
-rz(5.647723184300621) q[22];
-cx q[9],q[22];
-rx(7.169066981845267) q[22];
-ry(pi/2) q[23];
-rx(pi) q[23];
-cx q[3],q[23];
-rz(5.647723184300621) q[23];
-cx q[3],q[23];
-cx q[17],q[23];
-rz(5.647723184300621) q[23];
-cx q[17],q[23];
-ry(pi/2) q[24];
-rx(pi) q[24];
-cx q[3],q[24];
-rz(5.647723184300621) q[24];
-cx q[3],q[24];
-cx q[5],q[24];
-rz(5.647723184300621) q[24];
-cx q[5],q[24];
-ry(pi/2) q[25];
-rx(pi) q[25];
-cx q[3],q[25];
-rz(5.647723184300621) q[25];
-cx q[3],q[25];
-cx q[12],q[25];
-rz(5.647723184300621) q[25];
-cx q[12],q[25];
-rx(7.169066981845267) q[25];
-ry(pi/2) q[26];
-rx(pi) q[26];
-cx q[3],q[26];
-rz(5.647723184300621) q[26];
-cx q[3],q[26];
-cx q[21],q[26];
-rz(5.647723184300621) q[26];
-cx q[21],q[26];
-ry(pi/2) q[27];
-rx(pi) q[27];
-cx q[4],q[27];
-rz(5.647723184300621) q[27];
-cx q[4],q[27];
-cx q[6],q[27];
-rz(5.647723184300621) q[27];
-cx q[6],q[27];
-ry(pi/2) q[28];
-rx(pi) q[28];
-cx q[1],q[28];
-rz(5.647723184300621) q[28];
-cx q[1],q[28];
-cx q[3],q[28];
-rz(5.647723184300621) q[28];
-cx q[3],q[28];
-ry(pi/2) q[29];
-rx(pi) q[29];
-cx q[1],q[29];
-rz(5.647723184300621) q[29];
-cx q[1],q[29];
-cx q[3],q[29];
-rz(5.647723184300621) q[29];
-cx q[3],q[29];
-rx(7.169066981845267) q[29];
-ry(pi/2) q[30];
-rx(pi) q[30];
-cx q[3],q[30];
-rz(5.647723184300621) q[30];
-cx q[3],q[30];
-cx q[18],q[30];
-rz(5.647723184300621) q[30];
-cx q[18],q[30];
-rx(7.169066981845267) q[18];
-ry(pi/2) q[31];
-rx(pi) q[31];
-cx q[12],q[31];
-rz(5.647723184300621) q[31];
-cx q[12],q[31];
-cx q[26],q[31];
-rz(5.647723184300621) q[31];
-cx q[26],q[31];
-rx(7.169066981845267) q[26];
-rx(7.169066981845267) q[31];
-ry(pi/2) q[32];
-rx(pi) q[32];
-cx q[0],q[32];
-rz(5.647723184300621) q[32];
-cx q[0],q[32];
-cx q[21],q[32];
-rz(5.647723184300621) q[32];
-cx q[21],q[32];
-ry(pi/2) q[33];
-rx(pi) q[33];
-cx q[5],q[33];
-rz(5.647723184300621) q[33];
-cx q[5],q[33];
-cx q[30],q[33];
-rz(5.647723184300621) q[33];
-cx q[30],q[33];
-rx(7.169066981845267) q[33];
-ry(pi/2) q[34];
-rx(pi) q[34];
-cx q[3],q[34];
-rz(5.647723184300621) q[34];
-cx q[3],q[34];
-cx q[12],q[34];
-rz(5.647723184300621) q[34];
-cx q[12],q[34];
-ry(pi/2) q[35];
-rx(pi) q[35];
-cx q[3],q[35];
-rz(5.647723184300621) q[35];
-cx q[3],q[35];
-cx q[32],q[35];
-rz(5.647723184300621) q[35];
-cx q[32],q[35];
-rx(7.169066981845267) q[35];
-ry(pi/2) q[36];
-rx(pi) q[36];
-cx q[15],q[36];
-rz(5.647723184300621) q[36];
-cx q[15],q[36];
-cx q[20],q[36];
-rz(5.647723184300621) q[36];
-cx q[20],q[36];
-ry(pi/2) q[37];
-rx(pi) q[37];
-cx q[10],q[37];
-rz(5.647723184300621) q[37];
-cx q[10],q[37];
-cx q[34],q[37];
-rz(5.647723184300621) q[37];
-cx q[34],q[37];
-rx(7.169066981845267) q[34];
-ry(pi/2) q[38];
-rx(pi) q[38];
-cx q[19],q[38];
-rz(5.647723184300621) q[38];
-cx q[19],q[38];
-rx(7.169066981845267) q[19];
-cx q[21],q[38];
-rz(5.647723184300621) q[38];
-cx q[21],q[38];
-ry(pi/2) q[39];
-rx(pi) q[39];
-cx q[3],q[39];
-rz(5.647723184300621) q[39];
-cx q[3],q[39];
-cx q[13],q[39];
-rz(5.647723184300621) q[39];
-cx q[13],q[39];
-rx(7.169066981845267) q[39];
-ry(pi/2) q[40];
-rx(pi) q[40];
-cx q[3],q[40];
-rz(5.647723184300621) q[40];
-cx q[3],q[40];
-cx q[23],q[40];
-rz(5.647723184300621) q[40];
-cx q[23],q[40];
-rx(7.169066981845267) q[40];
-ry(pi/2) q[41];
-rx(pi) q[41];
-cx q[10],q[41];
-rz(5.647723184300621) q[41];
-cx q[10],q[41];
-cx q[27],q[41];
-rz(5.647723184300621) q[41];
-cx q[27],q[41];
-ry(pi/2) q[42];
-rx(pi) q[42];
-cx q[0],q[42];
-rz(5.647723184300621) q[42];
-cx q[0],q[42];
-cx q[3],q[42];
-rz(5.647723184300621) q[42];
-cx q[3],q[42];
-ry(pi/2) q[43];
-rx(pi) q[43];
-cx q[3],q[43];
-rz(5.647723184300621) q[43];
-cx q[3],q[43];
-cx q[20],q[43];
-rz(5.647723184300621) q[43];
-cx q[20],q[43];
-rx(7.169066981845267) q[20];
-rx(7.169066981845267) q[43];
-ry(pi/2) q[44];
-rx(pi) q[44];
-cx q[3],q[44];
-rz(5.647723184300621) q[44];
-cx q[3],q[44];
-cx q[12],q[44];
-rz(5.647723184300621) q[44];
-cx q[12],q[44];
-ry(pi/2) q[45];
-rx(pi) q[45];
-cx q[1],q[45];
-rz(5.647723184300621) q[45];
-cx q[1],q[45];
-cx q[16],q[45];
-rz(5.647723184300621) q[45];
-cx q[16],q[45];
-ry(pi/2) q[46];
-rx(pi) q[46];
-cx q[5],q[46];
-rz(5.647723184300621) q[46];
-cx q[5],q[46];
-cx q[38],q[46];
-rz(5.647723184300621) q[46];
-cx q[38],q[46];
-rx(7.169066981845267) q[38];
-rx(7.169066981845267) q[46];
-ry(pi/2) q[47];
-rx(pi) q[47];
-cx q[4],q[47];
-rz(5.647723184300621) q[47];
-cx q[4],q[47];
-cx q[17],q[47];
-rz(5.647723184300621) q[47];
-cx q[17],q[47];
-ry(pi/2) q[48];
-rx(pi) q[48];
-cx q[0],q[48];
-rz(5.647723184300621) q[48];
-cx q[0],q[48];
-cx q[30],q[48];
-rz(5.647723184300621) q[48];
-cx q[30],q[48];
-rx(7.169066981845267) q[48];
-ry(pi/2) q[49];
-rx(pi) q[49];
-cx q[3],q[49];
-rz(5.647723184300621) q[49];
-cx q[3],q[49];
-cx q[4],q[49];
-rz(5.647723184300621) q[49];
-cx q[4],q[49];
-rx(7.169066981845267) q[49];
-ry(pi/2) q[50];
-rx(pi) q[50];
-cx q[3],q[50];
-rz(5.647723184300621) q[50];
-cx q[3],q[50];
-cx q[12],q[50];
-rz(5.647723184300621) q[50];
-cx q[12],q[50];
-ry(pi/2) q[51];
-rx(pi) q[51];
-cx q[0],q[51];
-rz(5.647723184300621) q[51];
-cx q[0],q[51];
-cx q[28],q[51];
-rz(5.647723184300621) q[51];
-cx q[28],q[51];
-rx(7.169066981845267) q[51];
-ry(pi/2) q[52];
-rx(pi) q[52];
-cx q[3],q[52];
-rz(5.647723184300621) q[52];
-cx q[3],q[52];
-cx q[10],q[52];
-rz(5.647723184300621) q[52];
-cx q[10],q[52];
-rx(7.169066981845267) q[52];
-ry(pi/2) q[53];
-rx(pi) q[53];
-cx q[17],q[53];
-rz(5.647723184300621) q[53];
-cx q[17],q[53];
-cx q[21],q[53];
-rz(5.647723184300621) q[53];
-cx q[21],q[53];
-ry(pi/2) q[54];
-rx(pi) q[54];
-cx q[24],q[54];
-rz(5.647723184300621) q[54];
-cx q[24],q[54];
-cx q[28],q[54];
-rz(5.647723184300621) q[54];
-cx q[28],q[54];
-rx(7.169066981845267) q[54];
-ry(pi/2) q[55];
-rx(pi) q[55];
-cx q[9],q[55];
-rz(5.647723184300621) q[55];
-cx q[9],q[55];
-cx q[15],q[55];
-rz(5.647723184300621) q[55];
-cx q[15],q[55];
-ry(pi/2) q[56];
-rx(pi) q[56];
-cx q[13],q[56];
-rz(5.647723184300621) q[56];
-cx q[13],q[56];
-cx q[45],q[56];
-rz(5.647723184300621) q[56];
-cx q[45],q[56];
-rx(7.169066981845267) q[45];
-ry(pi/2) q[57];
-rx(pi) q[57];
-cx q[1],q[57];
-rz(5.647723184300621) q[57];
-cx q[1],q[57];
-cx q[3],q[57];
-rz(5.647723184300621) q[57];
-cx q[3],q[57];
-rx(7.169066981845267) q[57];
-ry(pi/2) q[58];
-rx(pi) q[58];
-cx q[24],q[58];
-rz(5.647723184300621) q[58];
-cx q[24],q[58];
-cx q[28],q[58];
-rz(5.647723184300621) q[58];
-cx q[28],q[58];
-rx(7.169066981845267) q[58];
-ry(pi/2) q[59];
-rx(pi) q[59];
-cx q[16],q[59];
-rz(5.647723184300621) q[59];
-cx q[16],q[59];
-cx q[32],q[59];
-rz(5.647723184300621) q[59];
-cx q[32],q[59];
-ry(pi/2) q[60];
-rx(pi) q[60];
-cx q[1],q[60];
-rz(5.647723184300621) q[60];
-cx q[1],q[60];
-cx q[7],q[60];
-rz(5.647723184300621) q[60];
-cx q[7],q[60];
-ry(pi/2) q[61];
-rx(pi) q[61];
-cx q[4],q[61];
-rz(5.647723184300621) q[61];
-cx q[4],q[61];
-cx q[7],q[61];
-rz(5.647723184300621) q[61];
-cx q[7],q[61];
-rx(7.169066981845267) q[61];
-ry(pi/2) q[62];
-rx(pi) q[62];
-cx q[0],q[62];
-rz(5.647723184300621) q[62];
-cx q[0],q[62];
-cx q[17],q[62];
-rz(5.647723184300621) q[62];
-cx q[17],q[62];
-rx(7.169066981845267) q[62];
-ry(pi/2) q[63];
-rx(pi) q[63];
-cx q[12],q[63];
-rz(5.647723184300621) q[63];
-cx q[12],q[63];
-rx(7.169066981845267) q[12];
-cx q[17],q[63];
-rz(5.647723184300621) q[63];
-cx q[17],q[63];
-ry(pi/2) q[64];
-rx(pi) q[64];
-cx q[0],q[64];
-rz(5.647723184300621) q[64];
-cx q[0],q[64];
-cx q[10],q[64];
-rz(5.647723184300621) q[64];
-cx q[10],q[64];
-rx(7.169066981845267) q[64];
-ry(pi/2) q[65];
-rx(pi) q[65];
-cx q[5],q[65];
-rz(5.647723184300621) q[65];
-cx q[5],q[65];
-cx q[23],q[65];
-rz(5.647723184300621) q[65];
-cx q[23],q[65];
-rx(7.169066981845267) q[23];
-rx(7.169066981845267) q[65];
-ry(pi/2) q[66];
-rx(pi) q[66];
-cx q[17],q[66];
-rz(5.647723184300621) q[66];
-cx q[17],q[66];
-rx(7.169066981845267) q[17];
-cx q[47],q[66];
-rz(5.647723184300621) q[66];
-cx q[47],q[66];
-rx(7.169066981845267) q[47];
-rx(7.169066981845267) q[66];
-ry(pi/2) q[67];
-rx(pi) q[67];
-cx q[41],q[67];
-rz(5.647723184300621) q[67];
-cx q[41],q[67];
-cx q[56],q[67];
-rz(5.647723184300621) q[67];
-cx q[56],q[67];
-rx(7.169066981845267) q[67];
-ry(pi/2) q[68];
-rx(pi) q[68];
-cx q[13],q[68];
-rz(5.647723184300621) q[68];
-cx q[13],q[68];
-rx(7.169066981845267) q[13];
-cx q[32],q[68];
-rz(5.647723184300621) q[68];
-cx q[32],q[68];
-ry(pi/2) q[69];
-rx(pi) q[69];
-cx q[6],q[69];
-rz(5.647723184300621) q[69];
-cx q[6],q[69];
-cx q[59],q[69];
-rz(5.647723184300621) q[69];
-cx q[59],q[69];
-rx(7.169066981845267) q[69];
-ry(pi/2) q[70];
-rx(pi) q[70];
-cx q[3],q[70];
-rz(5.647723184300621) q[70];
-cx q[3],q[70];
-cx q[15],q[70];
-rz(5.647723184300621) q[70];
-cx q[15],q[70];
-ry(pi/2) q[71];
-rx(pi) q[71];
-cx q[3],q[71];
-rz(5.647723184300621) q[71];
-cx q[3],q[71];
-cx q[53],q[71];
-rz(5.647723184300621) q[71];
-cx q[53],q[71];
-rx(7.169066981845267) q[71];
-ry(pi/2) q[72];
-rx(pi) q[72];
-cx q[27],q[72];
-rz(5.647723184300621) q[72];
-cx q[27],q[72];
-cx q[44],q[72];
-rz(5.647723184300621) q[72];
-cx q[44],q[72];
-rx(7.169066981845267) q[44];
-rx(7.169066981845267) q[72];
-ry(pi/2) q[73];
-rx(pi) q[73];
-cx q[16],q[73];
-rz(5.647723184300621) q[73];
-cx q[16],q[73];
-rx(7.169066981845267) q[16];
-cx q[59],q[73];
-rz(5.647723184300621) q[73];
-cx q[59],q[73];
-ry(pi/2) q[74];
-rx(pi) q[74];
-cx q[56],q[74];
-rz(5.647723184300621) q[74];
-cx q[56],q[74];
-cx q[63],q[74];
-rz(5.647723184300621) q[74];
-cx q[63],q[74];
-rx(7.169066981845267) q[63];
-rx(7.169066981845267) q[74];
-ry(pi/2) q[75];
-rx(pi) q[75];
-cx q[0],q[75];
-rz(5.647723184300621) q[75];
-cx q[0],q[75];
-cx q[21],q[75];
-rz(5.647723184300621) q[75];
-cx q[21],q[75];
-rx(7.169066981845267) q[75];
-ry(pi/2) q[76];
-rx(pi) q[76];
-cx q[5],q[76];
-rz(5.647723184300621) q[76];
-cx q[5],q[76];
-cx q[6],q[76];
-rz(5.647723184300621) q[76];
-cx q[6],q[76];
-rx(7.169066981845267) q[76];
-ry(pi/2) q[77];
-rx(pi) q[77];
-cx q[3],q[77];
-rz(5.647723184300621) q[77];
-cx q[3],q[77];
-cx q[30],q[77];
-rz(5.647723184300621) q[77];
-cx q[30],q[77];
-rx(7.169066981845267) q[30];
-ry(pi/2) q[78];
-rx(pi) q[78];
-cx q[42],q[78];
-rz(5.647723184300621) q[78];
-cx q[42],q[78];
-rx(7.169066981845267) q[42];
-cx q[60],q[78];
-rz(5.647723184300621) q[78];
-cx q[60],q[78];
-rx(7.169066981845267) q[78];
-ry(pi/2) q[79];
-rx(pi) q[79];
-cx q[6],q[79];
-rz(5.647723184300621) q[79];
-cx q[6],q[79];
-cx q[50],q[79];
-rz(5.647723184300621) q[79];
-cx q[50],q[79];
-rx(7.169066981845267) q[50];
-rx(7.169066981845267) q[79];
-ry(pi/2) q[80];
-rx(pi) q[80];
-cx q[9],q[80];
-rz(5.647723184300621) q[80];
-cx q[9],q[80];
-rx(7.169066981845267) q[9];
-cx q[15],q[80];
-rz(5.647723184300621) q[80];
-cx q[15],q[80];
-rx(7.169066981845267) q[80];
-ry(pi/2) q[81];
-rx(pi) q[81];
-cx q[21],q[81];
-rz(5.647723184300621) q[81];
-cx q[21],q[81];
-cx q[77],q[81];
-rz(5.647723184300621) q[81];
-cx q[77],q[81];
-rx(7.169066981845267) q[77];
-rx(7.169066981845267) q[81];
-ry(pi/2) q[82];
-rx(pi) q[82];
-cx q[0],q[82];
-rz(5.647723184300621) q[82];
-cx q[0],q[82];
-cx q[56],q[82];
-rz(5.647723184300621) q[82];
-cx q[56],q[82];
-rx(7.169066981845267) q[82];
-ry(pi/2) q[83];
-rx(pi) q[83];
-cx q[8],q[83];
-rz(5.647723184300621) q[83];
-cx q[8],q[83];
-rx(7.169066981845267) q[8];
-cx q[68],q[83];
-rz(5.647723184300621) q[83];
-cx q[68],q[83];
-rx(7.169066981845267) q[68];
-rx(7.169066981845267) q[83];
-ry(pi/2) q[84];
-rx(pi) q[84];
-cx q[70],q[84];
-rz(5.647723184300621) q[84];
-cx q[70],q[84];
-rx(7.169066981845267) q[70];
-cx q[73],q[84];
-rz(5.647723184300621) q[84];
-cx q[73],q[84];
-rx(7.169066981845267) q[73];
-rx(7.169066981845267) q[84];
-ry(pi/2) q[85];
-rx(pi) q[85];
-cx q[37],q[85];
-rz(5.647723184300621) q[85];
-cx q[37],q[85];
-rx(7.169066981845267) q[37];
-cx q[59],q[85];
-rz(5.647723184300621) q[85];
-cx q[59],q[85];
-rx(7.169066981845267) q[59];
-rx(7.169066981845267) q[85];
-ry(pi/2) q[86];
-rx(pi) q[86];
-cx q[24],q[86];
-rz(5.647723184300621) q[86];
-cx q[24],q[86];
-rx(7.169066981845267) q[24];
-cx q[53],q[86];
-rz(5.647723184300621) q[86];
-cx q[53],q[86];
-rx(7.169066981845267) q[53];
-rx(7.169066981845267) q[86];
-ry(pi/2) q[87];
-rx(pi) q[87];
-cx q[28],q[87];
-rz(5.647723184300621) q[87];
-cx q[28],q[87];
-rx(7.169066981845267) q[28];
-cx q[32],q[87];
-rz(5.647723184300621) q[87];
-cx q[32],q[87];
-rx(7.169066981845267) q[87];
-ry(pi/2) q[88];
-rx(pi) q[88];
-cx q[3],q[88];
-rz(5.647723184300621) q[88];
-cx q[3],q[88];
-rx(7.169066981845267) q[3];
-cx q[60],q[88];
-rz(5.647723184300621) q[88];
-cx q[60],q[88];
-rx(7.169066981845267) q[60];
-rx(7.169066981845267) q[88];
-ry(pi/2) q[89];
-rx(pi) q[89];
-cx q[2],q[89];
-rz(5.647723184300621) q[89];
-cx q[2],q[89];
-rx(7.169066981845267) q[2];
-cx q[5],q[89];
-rz(5.647723184300621) q[89];
-cx q[5],q[89];
-ry(pi/2) q[90];
-rx(pi) q[90];
-cx q[15],q[90];
-rz(5.647723184300621) q[90];
-cx q[15],q[90];
-cx q[27],q[90];
-rz(5.647723184300621) q[90];
-cx q[27],q[90];
-rx(7.169066981845267) q[90];
-ry(pi/2) q[91];
-rx(pi) q[91];
-cx q[0],q[91];
-rz(5.647723184300621) q[91];
-cx q[0],q[91];
-cx q[6],q[91];
-rz(5.647723184300621) q[91];
-cx q[6],q[91];
-rx(7.169066981845267) q[6];
-rx(7.169066981845267) q[91];
-ry(pi/2) q[92];
-rx(pi) q[92];
-cx q[15],q[92];
-rz(5.647723184300621) q[92];
-cx q[15],q[92];
-rx(7.169066981845267) q[15];
-cx q[89],q[92];
-rz(5.647723184300621) q[92];
-cx q[89],q[92];
-rx(7.169066981845267) q[89];
-ry(pi/2) q[93];
-rx(pi) q[93];
-cx q[0],q[93];
-rz(5.647723184300621) q[93];
-cx q[0],q[93];
-rx(7.169066981845267) q[0];
-cx q[32],q[93];
-rz(5.647723184300621) q[93];
-cx q[32],q[93];
-rx(7.169066981845267) q[32];
-rx(7.169066981845267) q[93];
-ry(pi/2) q[94];
-rx(pi) q[94];
-cx q[36],q[94];
-rz(5.647723184300621) q[94];
-cx q[36],q[94];
-rx(7.169066981845267) q[36];
-cx q[55],q[94];
-rz(5.647723184300621) q[94];
-cx q[55],q[94];
-rx(7.169066981845267) q[55];
-rx(7.169066981845267) q[94];
-ry(pi/2) q[95];
-rx(pi) q[95];
-cx q[5],q[95];
-rz(5.647723184300621) q[95];
-cx q[5],q[95];
-rx(7.169066981845267) q[5];
-cx q[27],q[95];
-rz(5.647723184300621) q[95];
-cx q[27],q[95];
-rx(7.169066981845267) q[27];
-rx(7.169066981845267) q[95];
-ry(pi/2) q[96];
-rx(pi) q[96];
-cx q[56],q[96];
-rz(5.647723184300621) q[96];
-cx q[56],q[96];
-rx(7.169066981845267) q[56];
-cx q[92],q[96];
-rz(5.647723184300621) q[96];
-cx q[92],q[96];
-rx(7.169066981845267) q[92];
-rx(7.169066981845267) q[96];
-ry(pi/2) q[97];
-rx(pi) q[97];
-cx q[1],q[97];
-rz(5.647723184300621) q[97];
-cx q[1],q[97];
-rx(7.169066981845267) q[1];
-cx q[0],q[1];
-rz(5.714059968062441) q[1];
-cx q[0],q[1];
-cx q[0],q[2];
-rz(5.714059968062441) q[2];
-cx q[0],q[2];
-cx q[0],q[3];
-cx q[2],q[89];
-rz(5.714059968062441) q[3];
-cx q[0],q[3];
-cx q[0],q[15];
-cx q[1],q[3];
-rz(5.714059968062441) q[3];
-cx q[1],q[3];
-cx q[7],q[97];
-rz(5.714059968062441) q[15];
-cx q[0],q[15];
-cx q[0],q[16];
-rz(5.714059968062441) q[16];
-cx q[0],q[16];
-cx q[0],q[20];
-rz(5.714059968062441) q[20];
-cx q[0],q[20];
-cx q[0],q[32];
-rz(5.714059968062441) q[32];
-cx q[0],q[32];
-cx q[0],q[42];
-rz(5.714059968062441) q[42];
-cx q[0],q[42];
-cx q[0],q[48];
-rz(5.714059968062441) q[48];
-cx q[0],q[48];
-cx q[0],q[51];
-rz(5.714059968062441) q[51];
-cx q[0],q[51];
-cx q[0],q[62];
-rz(5.714059968062441) q[62];
-cx q[0],q[62];
-cx q[0],q[64];
-rz(5.714059968062441) q[64];
-cx q[0],q[64];
-cx q[0],q[75];
-rz(5.714059968062441) q[75];
-cx q[0],q[75];
-cx q[0],q[82];
-rz(5.714059968062441) q[82];
-cx q[0],q[82];
-cx q[0],q[91];
-rz(5.714059968062441) q[89];
-cx q[2],q[89];
-rx(2.9806314421133004) q[2];
-rz(5.714059968062441) q[91];
-cx q[0],q[91];
-cx q[0],q[93];
-rz(5.714059968062441) q[93];
-cx q[0],q[93];
-rx(2.9806314421133004) q[0];
-rz(5.647723184300621) q[97];
-cx q[7],q[97];
-rx(7.169066981845267) q[7];
-rx(7.169066981845267) q[97];
-ry(pi/2) q[98];
-rx(pi) q[98];
-cx q[10],q[98];
-rz(5.647723184300621) q[98];
-cx q[10],q[98];
-rx(7.169066981845267) q[10];
-cx q[21],q[98];
-rz(5.647723184300621) q[98];
-cx q[21],q[98];
-rx(7.169066981845267) q[21];
-rx(7.169066981845267) q[98];
-ry(pi/2) q[99];
-rx(pi) q[99];
-cx q[4],q[99];
-rz(5.647723184300621) q[99];
-cx q[4],q[99];
-rx(7.169066981845267) q[4];
-cx q[1],q[4];
-rz(5.714059968062441) q[4];
-cx q[1],q[4];
-cx q[1],q[5];
-cx q[3],q[4];
-rz(5.714059968062441) q[4];
-cx q[3],q[4];
-cx q[4],q[6];
-rz(5.714059968062441) q[5];
-cx q[1],q[5];
-cx q[1],q[9];
-cx q[3],q[5];
-rz(5.714059968062441) q[5];
-cx q[3],q[5];
-cx q[3],q[7];
-rz(5.714059968062441) q[6];
-cx q[4],q[6];
-cx q[5],q[6];
-rz(5.714059968062441) q[6];
-cx q[5],q[6];
-rz(5.714059968062441) q[7];
-cx q[3],q[7];
-cx q[3],q[8];
-cx q[4],q[7];
-rz(5.714059968062441) q[7];
-cx q[4],q[7];
-cx q[4],q[10];
-rz(5.714059968062441) q[8];
-cx q[3],q[8];
-cx q[5],q[8];
-rz(5.714059968062441) q[8];
-cx q[5],q[8];
-cx q[5],q[11];
-cx q[8],q[83];
-rz(5.714059968062441) q[9];
-cx q[1],q[9];
-cx q[1],q[17];
-cx q[3],q[9];
-rz(5.714059968062441) q[9];
-cx q[3],q[9];
-cx q[3],q[12];
-rz(5.714059968062441) q[10];
-cx q[4],q[10];
-cx q[4],q[13];
-cx q[6],q[10];
-rz(5.714059968062441) q[10];
-cx q[6],q[10];
-cx q[10],q[37];
-rz(5.714059968062441) q[11];
-cx q[5],q[11];
-cx q[6],q[11];
-rz(5.714059968062441) q[11];
-cx q[6],q[11];
-rx(2.9806314421133004) q[11];
-rz(5.714059968062441) q[12];
-cx q[3],q[12];
-cx q[3],q[14];
-cx q[5],q[12];
-rz(5.714059968062441) q[12];
-cx q[5],q[12];
-rz(5.714059968062441) q[13];
-cx q[4],q[13];
-cx q[5],q[13];
-rz(5.714059968062441) q[13];
-cx q[5],q[13];
-rz(5.714059968062441) q[14];
-cx q[3],q[14];
-cx q[3],q[15];
-cx q[4],q[14];
-rz(5.714059968062441) q[14];
-cx q[4],q[14];
-rx(2.9806314421133004) q[14];
-rz(5.714059968062441) q[15];
-cx q[3],q[15];
-cx q[3],q[16];
-cx q[15],q[20];
-rz(5.714059968062441) q[16];
-cx q[3],q[16];
-rz(5.714059968062441) q[17];
-cx q[1],q[17];
-cx q[1],q[28];
-cx q[3],q[17];
-rz(5.714059968062441) q[17];
-cx q[3],q[17];
-cx q[3],q[18];
-rz(5.714059968062441) q[18];
-cx q[3],q[18];
-cx q[3],q[19];
-cx q[4],q[18];
-rz(5.714059968062441) q[18];
-cx q[4],q[18];
-cx q[4],q[21];
-rz(5.714059968062441) q[19];
-cx q[3],q[19];
-cx q[3],q[22];
-cx q[7],q[19];
-rz(5.714059968062441) q[19];
-cx q[7],q[19];
-cx q[19],q[38];
-rz(5.714059968062441) q[20];
-cx q[15],q[20];
-rz(5.714059968062441) q[21];
-cx q[4],q[21];
-cx q[4],q[27];
-cx q[15],q[21];
-rz(5.714059968062441) q[21];
-cx q[15],q[21];
-cx q[15],q[36];
-rz(5.714059968062441) q[22];
-cx q[3],q[22];
-cx q[3],q[23];
-cx q[9],q[22];
-rz(5.714059968062441) q[22];
-cx q[9],q[22];
-cx q[9],q[55];
-rx(2.9806314421133004) q[22];
-rz(5.714059968062441) q[23];
-cx q[3],q[23];
-cx q[3],q[24];
-cx q[17],q[23];
-rz(5.714059968062441) q[23];
-cx q[17],q[23];
-rz(5.714059968062441) q[24];
-cx q[3],q[24];
-cx q[3],q[25];
-cx q[5],q[24];
-rz(5.714059968062441) q[24];
-cx q[5],q[24];
-cx q[5],q[33];
-cx q[24],q[54];
-rz(5.714059968062441) q[25];
-cx q[3],q[25];
-cx q[3],q[26];
-cx q[12],q[25];
-rz(5.714059968062441) q[25];
-cx q[12],q[25];
-cx q[12],q[31];
-rx(2.9806314421133004) q[25];
-rz(5.714059968062441) q[26];
-cx q[3],q[26];
-cx q[21],q[26];
-rz(5.714059968062441) q[26];
-cx q[21],q[26];
-cx q[21],q[32];
-rz(5.714059968062441) q[27];
-cx q[4],q[27];
-cx q[4],q[47];
-cx q[6],q[27];
-rz(5.714059968062441) q[27];
-cx q[6],q[27];
-cx q[6],q[69];
-rz(5.714059968062441) q[28];
-cx q[1],q[28];
-cx q[1],q[29];
-cx q[3],q[28];
-rz(5.714059968062441) q[28];
-cx q[3],q[28];
-cx q[28],q[51];
-rz(5.714059968062441) q[29];
-cx q[1],q[29];
-cx q[1],q[45];
-cx q[3],q[29];
-rz(5.714059968062441) q[29];
-cx q[3],q[29];
-cx q[3],q[30];
-rx(2.9806314421133004) q[29];
-rz(5.714059968062441) q[30];
-cx q[3],q[30];
-cx q[3],q[34];
-cx q[18],q[30];
-rz(5.714059968062441) q[30];
-cx q[18],q[30];
-rx(2.9806314421133004) q[18];
-rz(5.714059968062441) q[31];
-cx q[12],q[31];
-cx q[26],q[31];
-rz(5.714059968062441) q[31];
-cx q[26],q[31];
-rx(2.9806314421133004) q[26];
-rx(2.9806314421133004) q[31];
-rz(5.714059968062441) q[32];
-cx q[21],q[32];
-rz(5.714059968062441) q[33];
-cx q[5],q[33];
-cx q[5],q[46];
-cx q[30],q[33];
-rz(5.714059968062441) q[33];
-cx q[30],q[33];
-cx q[30],q[48];
-rx(2.9806314421133004) q[33];
-rz(5.714059968062441) q[34];
-cx q[3],q[34];
-cx q[3],q[35];
-cx q[12],q[34];
-rz(5.714059968062441) q[34];
-cx q[12],q[34];
-rz(5.714059968062441) q[35];
-cx q[3],q[35];
-cx q[3],q[39];
-cx q[32],q[35];
-rz(5.714059968062441) q[35];
-cx q[32],q[35];
-rx(2.9806314421133004) q[35];
-rz(5.714059968062441) q[36];
-cx q[15],q[36];
-cx q[20],q[36];
-rz(5.714059968062441) q[36];
-cx q[20],q[36];
-cx q[36],q[94];
-rz(5.714059968062441) q[37];
-cx q[10],q[37];
-cx q[34],q[37];
-rz(5.714059968062441) q[37];
-cx q[34],q[37];
-rx(2.9806314421133004) q[34];
-cx q[37],q[85];
-rz(5.714059968062441) q[38];
-cx q[19],q[38];
-rx(2.9806314421133004) q[19];
-cx q[21],q[38];
-rz(5.714059968062441) q[38];
-cx q[21],q[38];
-rz(5.714059968062441) q[39];
-cx q[3],q[39];
-cx q[3],q[40];
-cx q[13],q[39];
-rz(5.714059968062441) q[39];
-cx q[13],q[39];
-cx q[13],q[56];
-rx(2.9806314421133004) q[39];
-rz(5.714059968062441) q[40];
-cx q[3],q[40];
-cx q[3],q[42];
-cx q[23],q[40];
-rz(5.714059968062441) q[40];
-cx q[23],q[40];
-rx(2.9806314421133004) q[40];
-cx q[41],q[99];
-rz(5.714059968062441) q[42];
-cx q[3],q[42];
-cx q[3],q[43];
-cx q[42],q[78];
-rz(5.714059968062441) q[43];
-cx q[3],q[43];
-cx q[3],q[44];
-cx q[20],q[43];
-rz(5.714059968062441) q[43];
-cx q[20],q[43];
-rx(2.9806314421133004) q[20];
-rx(2.9806314421133004) q[43];
-rz(5.714059968062441) q[44];
-cx q[3],q[44];
-cx q[3],q[49];
-cx q[12],q[44];
-rz(5.714059968062441) q[44];
-cx q[12],q[44];
-rz(5.714059968062441) q[45];
-cx q[1],q[45];
-cx q[1],q[57];
-cx q[16],q[45];
-rz(5.714059968062441) q[45];
-cx q[16],q[45];
-cx q[16],q[59];
-rz(5.714059968062441) q[46];
-cx q[5],q[46];
-cx q[5],q[65];
-cx q[38],q[46];
-rz(5.714059968062441) q[46];
-cx q[38],q[46];
-rx(2.9806314421133004) q[38];
-rx(2.9806314421133004) q[46];
-rz(5.714059968062441) q[47];
-cx q[4],q[47];
-cx q[17],q[47];
-rz(5.714059968062441) q[47];
-cx q[17],q[47];
-cx q[17],q[53];
-rz(5.714059968062441) q[48];
-cx q[30],q[48];
-rx(2.9806314421133004) q[48];
-rz(5.714059968062441) q[49];
-cx q[3],q[49];
-cx q[3],q[50];
-cx q[4],q[49];
-rz(5.714059968062441) q[49];
-cx q[4],q[49];
-cx q[4],q[61];
-rx(2.9806314421133004) q[49];
-rz(5.714059968062441) q[50];
-cx q[3],q[50];
-cx q[3],q[52];
-cx q[12],q[50];
-rz(5.714059968062441) q[50];
-cx q[12],q[50];
-cx q[12],q[63];
-rz(5.714059968062441) q[51];
-cx q[28],q[51];
-rx(2.9806314421133004) q[51];
-rz(5.714059968062441) q[52];
-cx q[3],q[52];
-rz(5.714059968062441) q[53];
-cx q[17],q[53];
-cx q[17],q[62];
-cx q[21],q[53];
-rz(5.714059968062441) q[53];
-cx q[21],q[53];
-cx q[21],q[75];
-rz(5.714059968062441) q[54];
-cx q[24],q[54];
-cx q[24],q[58];
-cx q[28],q[54];
-rz(5.714059968062441) q[54];
-cx q[28],q[54];
-rx(2.9806314421133004) q[54];
-rz(5.714059968062441) q[55];
-cx q[9],q[55];
-cx q[9],q[80];
-cx q[15],q[55];
-rz(5.714059968062441) q[55];
-cx q[15],q[55];
-rz(5.714059968062441) q[56];
-cx q[13],q[56];
-cx q[13],q[68];
-cx q[45],q[56];
-rz(5.714059968062441) q[56];
-cx q[45],q[56];
-rx(2.9806314421133004) q[45];
-rz(5.714059968062441) q[57];
-cx q[1],q[57];
-cx q[1],q[60];
-cx q[3],q[57];
-rz(5.714059968062441) q[57];
-cx q[3],q[57];
-cx q[3],q[70];
-rx(2.9806314421133004) q[57];
-rz(5.714059968062441) q[58];
-cx q[24],q[58];
-cx q[24],q[86];
-cx q[28],q[58];
-rz(5.714059968062441) q[58];
-cx q[28],q[58];
-cx q[28],q[87];
-rx(2.9806314421133004) q[58];
-rz(5.714059968062441) q[59];
-cx q[16],q[59];
-cx q[16],q[73];
-cx q[32],q[59];
-rz(5.714059968062441) q[59];
-cx q[32],q[59];
-rz(5.714059968062441) q[60];
-cx q[1],q[60];
-cx q[1],q[97];
-cx q[7],q[60];
-rz(5.714059968062441) q[60];
-cx q[7],q[60];
-rz(5.714059968062441) q[61];
-cx q[4],q[61];
-cx q[7],q[61];
-rz(5.714059968062441) q[61];
-cx q[7],q[61];
-rx(2.9806314421133004) q[61];
-rz(5.714059968062441) q[62];
-cx q[17],q[62];
-rx(2.9806314421133004) q[62];
-rz(5.714059968062441) q[63];
-cx q[12],q[63];
-rx(2.9806314421133004) q[12];
-cx q[17],q[63];
-rz(5.714059968062441) q[63];
-cx q[17],q[63];
-cx q[17],q[66];
-rz(5.714059968062441) q[65];
-cx q[5],q[65];
-cx q[5],q[76];
-cx q[23],q[65];
-rz(5.714059968062441) q[65];
-cx q[23],q[65];
-rx(2.9806314421133004) q[23];
-rx(2.9806314421133004) q[65];
-rz(5.714059968062441) q[66];
-cx q[17],q[66];
-rx(2.9806314421133004) q[17];
-cx q[47],q[66];
-rz(5.714059968062441) q[66];
-cx q[47],q[66];
-rx(2.9806314421133004) q[47];
-rx(2.9806314421133004) q[66];
-rz(5.714059968062441) q[68];
-cx q[13],q[68];
-rx(2.9806314421133004) q[13];
-cx q[32],q[68];
-rz(5.714059968062441) q[68];
-cx q[32],q[68];
-rz(5.714059968062441) q[69];
-cx q[6],q[69];
-cx q[59],q[69];
-rz(5.714059968062441) q[69];
-cx q[59],q[69];
-rx(2.9806314421133004) q[69];
-rz(5.714059968062441) q[70];
-cx q[3],q[70];
-cx q[3],q[71];
-cx q[15],q[70];
-rz(5.714059968062441) q[70];
-cx q[15],q[70];
-cx q[70],q[84];
-rz(5.714059968062441) q[71];
-cx q[3],q[71];
-cx q[3],q[77];
-cx q[53],q[71];
-rz(5.714059968062441) q[71];
-cx q[53],q[71];
-rx(2.9806314421133004) q[71];
-rz(5.714059968062441) q[73];
-cx q[16],q[73];
-rx(2.9806314421133004) q[16];
-cx q[59],q[73];
-rz(5.714059968062441) q[73];
-cx q[59],q[73];
-rz(5.714059968062441) q[75];
-cx q[21],q[75];
-cx q[21],q[81];
-rx(2.9806314421133004) q[75];
-rz(5.714059968062441) q[76];
-cx q[5],q[76];
-cx q[5],q[89];
-cx q[6],q[76];
-rz(5.714059968062441) q[76];
-cx q[6],q[76];
-cx q[6],q[79];
-rx(2.9806314421133004) q[76];
-rz(5.714059968062441) q[77];
-cx q[3],q[77];
-cx q[3],q[88];
-cx q[30],q[77];
-rz(5.714059968062441) q[77];
-cx q[30],q[77];
-rx(2.9806314421133004) q[30];
-rz(5.714059968062441) q[78];
-cx q[42],q[78];
-rx(2.9806314421133004) q[42];
-cx q[60],q[78];
-rz(5.714059968062441) q[78];
-cx q[60],q[78];
-rx(2.9806314421133004) q[78];
-rz(5.714059968062441) q[79];
-cx q[6],q[79];
-cx q[6],q[91];
-cx q[50],q[79];
-rz(5.714059968062441) q[79];
-cx q[50],q[79];
-rx(2.9806314421133004) q[50];
-rx(2.9806314421133004) q[79];
-rz(5.714059968062441) q[80];
-cx q[9],q[80];
-rx(2.9806314421133004) q[9];
-cx q[15],q[80];
-rz(5.714059968062441) q[80];
-cx q[15],q[80];
-cx q[15],q[90];
-rx(2.9806314421133004) q[80];
-rz(5.714059968062441) q[81];
-cx q[21],q[81];
-cx q[77],q[81];
-rz(5.714059968062441) q[81];
-cx q[77],q[81];
-rx(2.9806314421133004) q[77];
-rx(2.9806314421133004) q[81];
-rz(5.714059968062441) q[83];
-cx q[8],q[83];
-rx(2.9806314421133004) q[8];
-cx q[68],q[83];
-rz(5.714059968062441) q[83];
-cx q[68],q[83];
-rx(2.9806314421133004) q[68];
-rx(2.9806314421133004) q[83];
-rz(5.714059968062441) q[84];
-cx q[70],q[84];
-rx(2.9806314421133004) q[70];
-cx q[73],q[84];
-rz(5.714059968062441) q[84];
-cx q[73],q[84];
-rx(2.9806314421133004) q[73];
-rx(2.9806314421133004) q[84];
-rz(5.714059968062441) q[85];
-cx q[37],q[85];
-rx(2.9806314421133004) q[37];
-cx q[59],q[85];
-rz(5.714059968062441) q[85];
-cx q[59],q[85];
-rx(2.9806314421133004) q[59];
-rx(2.9806314421133004) q[85];
-rz(5.714059968062441) q[86];
-cx q[24],q[86];
-rx(2.9806314421133004) q[24];
-cx q[53],q[86];
-rz(5.714059968062441) q[86];
-cx q[53],q[86];
-rx(2.9806314421133004) q[53];
-rx(2.9806314421133004) q[86];
-rz(5.714059968062441) q[87];
-cx q[28],q[87];
-rx(2.9806314421133004) q[28];
-cx q[32],q[87];
-rz(5.714059968062441) q[87];
-cx q[32],q[87];
-cx q[32],q[93];
-rx(2.9806314421133004) q[87];
-rz(5.714059968062441) q[88];
-cx q[3],q[88];
-rx(2.9806314421133004) q[3];
-cx q[60],q[88];
-rz(5.714059968062441) q[88];
-cx q[60],q[88];
-rx(2.9806314421133004) q[60];
-rx(2.9806314421133004) q[88];
-rz(5.714059968062441) q[89];
-cx q[5],q[89];
-cx q[5],q[95];
-rz(5.714059968062441) q[90];
-cx q[15],q[90];
-cx q[15],q[92];
-rz(5.714059968062441) q[91];
-cx q[6],q[91];
-rx(2.9806314421133004) q[6];
-rx(2.9806314421133004) q[91];
-rz(5.714059968062441) q[92];
-cx q[15],q[92];
-rx(2.9806314421133004) q[15];
-cx q[89],q[92];
-rz(5.714059968062441) q[92];
-cx q[89],q[92];
-rx(2.9806314421133004) q[89];
-rz(5.714059968062441) q[93];
-cx q[32],q[93];
-rx(2.9806314421133004) q[32];
-rx(2.9806314421133004) q[93];
-rz(5.714059968062441) q[94];
-cx q[36],q[94];
-rx(2.9806314421133004) q[36];
-cx q[55],q[94];
-rz(5.714059968062441) q[94];
-cx q[55],q[94];
-rx(2.9806314421133004) q[55];
-rx(2.9806314421133004) q[94];
-rz(5.714059968062441) q[95];
-cx q[5],q[95];
-rx(2.9806314421133004) q[5];
-rz(5.714059968062441) q[97];
-cx q[1],q[97];
-rx(2.9806314421133004) q[1];
-cx q[0],q[1];
-rz(0.15577406107991335) q[1];
-cx q[0],q[1];
-cx q[0],q[2];
-rz(0.15577406107991335) q[2];
-cx q[0],q[2];
-cx q[0],q[3];
-cx q[2],q[89];
-rz(0.15577406107991335) q[3];
-cx q[0],q[3];
-cx q[0],q[15];
-cx q[1],q[3];
-rz(0.15577406107991335) q[3];
-cx q[1],q[3];
-cx q[7],q[97];
-rz(0.15577406107991335) q[15];
-cx q[0],q[15];
-cx q[0],q[16];
-rz(0.15577406107991335) q[16];
-cx q[0],q[16];
-cx q[0],q[20];
-rz(0.15577406107991335) q[20];
-cx q[0],q[20];
-cx q[0],q[32];
-rz(0.15577406107991335) q[32];
-cx q[0],q[32];
-cx q[0],q[42];
-rz(0.15577406107991335) q[42];
-cx q[0],q[42];
-cx q[0],q[48];
-rz(0.15577406107991335) q[48];
-cx q[0],q[48];
-cx q[0],q[51];
-rz(0.15577406107991335) q[51];
-cx q[0],q[51];
-cx q[0],q[62];
-rz(0.15577406107991335) q[62];
-cx q[0],q[62];
-rz(0.15577406107991335) q[89];
-cx q[2],q[89];
-rx(8.726161038927415) q[2];
-rz(5.714059968062441) q[97];
-cx q[7],q[97];
-rx(2.9806314421133004) q[7];
-rx(2.9806314421133004) q[97];
-rz(5.647723184300621) q[99];
-cx q[41],q[99];
-rx(7.169066981845267) q[41];
-cx q[10],q[41];
-rz(5.714059968062441) q[41];
-cx q[10],q[41];
-cx q[10],q[52];
-cx q[27],q[41];
-rz(5.714059968062441) q[41];
-cx q[27],q[41];
-cx q[27],q[72];
-cx q[41],q[67];
-rz(5.714059968062441) q[52];
-cx q[10],q[52];
-cx q[10],q[64];
-rx(2.9806314421133004) q[52];
-rz(5.714059968062441) q[64];
-cx q[10],q[64];
-cx q[10],q[98];
-rx(2.9806314421133004) q[64];
-cx q[0],q[64];
-rz(0.15577406107991335) q[64];
-cx q[0],q[64];
-cx q[0],q[75];
-rz(5.714059968062441) q[67];
-cx q[41],q[67];
-cx q[56],q[67];
-rz(5.714059968062441) q[67];
-cx q[56],q[67];
-cx q[56],q[74];
-rx(2.9806314421133004) q[67];
-rz(5.714059968062441) q[72];
-cx q[27],q[72];
-cx q[27],q[90];
-cx q[44],q[72];
-rz(5.714059968062441) q[72];
-cx q[44],q[72];
-rx(2.9806314421133004) q[44];
-rx(2.9806314421133004) q[72];
-rz(5.714059968062441) q[74];
-cx q[56],q[74];
-cx q[56],q[82];
-cx q[63],q[74];
-rz(5.714059968062441) q[74];
-cx q[63],q[74];
-rx(2.9806314421133004) q[63];
-rx(2.9806314421133004) q[74];
-rz(0.15577406107991335) q[75];
-cx q[0],q[75];
-rz(5.714059968062441) q[82];
-cx q[56],q[82];
-cx q[56],q[96];
-rx(2.9806314421133004) q[82];
-cx q[0],q[82];
-rz(0.15577406107991335) q[82];
-cx q[0],q[82];
-cx q[0],q[91];
-rz(5.714059968062441) q[90];
-cx q[27],q[90];
-cx q[27],q[95];
-rx(2.9806314421133004) q[90];
-rz(0.15577406107991335) q[91];
-cx q[0],q[91];
-cx q[0],q[93];
-rz(0.15577406107991335) q[93];
-cx q[0],q[93];
-rx(8.726161038927415) q[0];
-rz(5.714059968062441) q[95];
-cx q[27],q[95];
-rx(2.9806314421133004) q[27];
-rx(2.9806314421133004) q[95];
-rz(5.714059968062441) q[96];
-cx q[56],q[96];
-rx(2.9806314421133004) q[56];
-cx q[92],q[96];
-rz(5.714059968062441) q[96];
-cx q[92],q[96];
-rx(2.9806314421133004) q[92];
-rx(2.9806314421133004) q[96];
-rz(5.714059968062441) q[98];
-cx q[10],q[98];
-rx(2.9806314421133004) q[10];
-cx q[21],q[98];
-rz(5.714059968062441) q[98];
-cx q[21],q[98];
-rx(2.9806314421133004) q[21];
-rx(2.9806314421133004) q[98];
-rx(7.169066981845267) q[99];
-cx q[4],q[99];
-rz(5.714059968062441) q[99];
-cx q[4],q[99];
-rx(2.9806314421133004) q[4];
-cx q[1],q[4];
-rz(0.15577406107991335) q[4];
-cx q[1],q[4];
-cx q[1],q[5];
-cx q[3],q[4];
-rz(0.15577406107991335) q[4];
-cx q[3],q[4];
-cx q[4],q[6];
-rz(0.15577406107991335) q[5];
-cx q[1],q[5];
-cx q[1],q[9];
-cx q[3],q[5];
-rz(0.15577406107991335) q[5];
-cx q[3],q[5];
-cx q[3],q[7];
-rz(0.15577406107991335) q[6];
-cx q[4],q[6];
-cx q[5],q[6];
-rz(0.15577406107991335) q[6];
-cx q[5],q[6];
-rz(0.15577406107991335) q[7];
-cx q[3],q[7];
-cx q[3],q[8];
-cx q[4],q[7];
-rz(0.15577406107991335) q[7];
-cx q[4],q[7];
-cx q[4],q[10];
-rz(0.15577406107991335) q[8];
-cx q[3],q[8];
-cx q[5],q[8];
-rz(0.15577406107991335) q[8];
-cx q[5],q[8];
-cx q[5],q[11];
-cx q[8],q[83];
-rz(0.15577406107991335) q[9];
-cx q[1],q[9];
-cx q[1],q[17];
-cx q[3],q[9];
-rz(0.15577406107991335) q[9];
-cx q[3],q[9];
-cx q[3],q[12];
-rz(0.15577406107991335) q[10];
-cx q[4],q[10];
-cx q[4],q[13];
-cx q[6],q[10];
-rz(0.15577406107991335) q[10];
-cx q[6],q[10];
-cx q[10],q[37];
-rz(0.15577406107991335) q[11];
-cx q[5],q[11];
-cx q[6],q[11];
-rz(0.15577406107991335) q[11];
-cx q[6],q[11];
-rx(8.726161038927415) q[11];
-rz(0.15577406107991335) q[12];
-cx q[3],q[12];
-cx q[3],q[14];
-cx q[5],q[12];
-rz(0.15577406107991335) q[12];
-cx q[5],q[12];
-rz(0.15577406107991335) q[13];
-cx q[4],q[13];
-cx q[5],q[13];
-rz(0.15577406107991335) q[13];
-cx q[5],q[13];
-rz(0.15577406107991335) q[14];
-cx q[3],q[14];
-cx q[3],q[15];
-cx q[4],q[14];
-rz(0.15577406107991335) q[14];
-cx q[4],q[14];
-rx(8.726161038927415) q[14];
-rz(0.15577406107991335) q[15];
-cx q[3],q[15];
-cx q[3],q[16];
-cx q[15],q[20];
-rz(0.15577406107991335) q[16];
-cx q[3],q[16];
-rz(0.15577406107991335) q[17];
-cx q[1],q[17];
-cx q[1],q[28];
-cx q[3],q[17];
-rz(0.15577406107991335) q[17];
-cx q[3],q[17];
-cx q[3],q[18];
-rz(0.15577406107991335) q[18];
-cx q[3],q[18];
-cx q[3],q[19];
-cx q[4],q[18];
-rz(0.15577406107991335) q[18];
-cx q[4],q[18];
-cx q[4],q[21];
-rz(0.15577406107991335) q[19];
-cx q[3],q[19];
-cx q[3],q[22];
-cx q[7],q[19];
-rz(0.15577406107991335) q[19];
-cx q[7],q[19];
-cx q[19],q[38];
-rz(0.15577406107991335) q[20];
-cx q[15],q[20];
-rz(0.15577406107991335) q[21];
-cx q[4],q[21];
-cx q[4],q[27];
-cx q[15],q[21];
-rz(0.15577406107991335) q[21];
-cx q[15],q[21];
-cx q[15],q[36];
-rz(0.15577406107991335) q[22];
-cx q[3],q[22];
-cx q[3],q[23];
-cx q[9],q[22];
-rz(0.15577406107991335) q[22];
-cx q[9],q[22];
-cx q[9],q[55];
-rx(8.726161038927415) q[22];
-rz(0.15577406107991335) q[23];
-cx q[3],q[23];
-cx q[3],q[24];
-cx q[17],q[23];
-rz(0.15577406107991335) q[23];
-cx q[17],q[23];
-rz(0.15577406107991335) q[24];
-cx q[3],q[24];
-cx q[3],q[25];
-cx q[5],q[24];
-rz(0.15577406107991335) q[24];
-cx q[5],q[24];
-cx q[5],q[33];
-cx q[24],q[54];
-rz(0.15577406107991335) q[25];
-cx q[3],q[25];
-cx q[3],q[26];
-cx q[12],q[25];
-rz(0.15577406107991335) q[25];
-cx q[12],q[25];
-cx q[12],q[31];
-rx(8.726161038927415) q[25];
-rz(0.15577406107991335) q[26];
-cx q[3],q[26];
-cx q[21],q[26];
-rz(0.15577406107991335) q[26];
-cx q[21],q[26];
-cx q[21],q[32];
-rz(0.15577406107991335) q[27];
-cx q[4],q[27];
-cx q[4],q[47];
-cx q[6],q[27];
-rz(0.15577406107991335) q[27];
-cx q[6],q[27];
-cx q[6],q[69];
-rz(0.15577406107991335) q[28];
-cx q[1],q[28];
-cx q[1],q[29];
-cx q[3],q[28];
-rz(0.15577406107991335) q[28];
-cx q[3],q[28];
-cx q[28],q[51];
-rz(0.15577406107991335) q[29];
-cx q[1],q[29];
-cx q[1],q[45];
-cx q[3],q[29];
-rz(0.15577406107991335) q[29];
-cx q[3],q[29];
-cx q[3],q[30];
-rx(8.726161038927415) q[29];
-rz(0.15577406107991335) q[30];
-cx q[3],q[30];
-cx q[3],q[34];
-cx q[18],q[30];
-rz(0.15577406107991335) q[30];
-cx q[18],q[30];
-rx(8.726161038927415) q[18];
-rz(0.15577406107991335) q[31];
-cx q[12],q[31];
-cx q[26],q[31];
-rz(0.15577406107991335) q[31];
-cx q[26],q[31];
-rx(8.726161038927415) q[26];
-rx(8.726161038927415) q[31];
-rz(0.15577406107991335) q[32];
-cx q[21],q[32];
-rz(0.15577406107991335) q[33];
-cx q[5],q[33];
-cx q[5],q[46];
-cx q[30],q[33];
-rz(0.15577406107991335) q[33];
-cx q[30],q[33];
-cx q[30],q[48];
-rx(8.726161038927415) q[33];
-rz(0.15577406107991335) q[34];
-cx q[3],q[34];
-cx q[3],q[35];
-cx q[12],q[34];
-rz(0.15577406107991335) q[34];
-cx q[12],q[34];
-rz(0.15577406107991335) q[35];
-cx q[3],q[35];
-cx q[3],q[39];
-cx q[32],q[35];
-rz(0.15577406107991335) q[35];
-cx q[32],q[35];
-rx(8.726161038927415) q[35];
-rz(0.15577406107991335) q[36];
-cx q[15],q[36];
-cx q[20],q[36];
-rz(0.15577406107991335) q[36];
-cx q[20],q[36];
-cx q[36],q[94];
-rz(0.15577406107991335) q[37];
-cx q[10],q[37];
-cx q[34],q[37];
-rz(0.15577406107991335) q[37];
-cx q[34],q[37];
-rx(8.726161038927415) q[34];
-cx q[37],q[85];
-rz(0.15577406107991335) q[38];
-cx q[19],q[38];
-rx(8.726161038927415) q[19];
-cx q[21],q[38];
-rz(0.15577406107991335) q[38];
-cx q[21],q[38];
-rz(0.15577406107991335) q[39];
-cx q[3],q[39];
-cx q[3],q[40];
-cx q[13],q[39];
-rz(0.15577406107991335) q[39];
-cx q[13],q[39];
-cx q[13],q[56];
-rx(8.726161038927415) q[39];
-rz(0.15577406107991335) q[40];
-cx q[3],q[40];
-cx q[3],q[42];
-cx q[23],q[40];
-rz(0.15577406107991335) q[40];
-cx q[23],q[40];
-rx(8.726161038927415) q[40];
-cx q[41],q[99];
-rz(0.15577406107991335) q[42];
-cx q[3],q[42];
-cx q[3],q[43];
-cx q[42],q[78];
-rz(0.15577406107991335) q[43];
-cx q[3],q[43];
-cx q[3],q[44];
-cx q[20],q[43];
-rz(0.15577406107991335) q[43];
-cx q[20],q[43];
-rx(8.726161038927415) q[20];
-rx(8.726161038927415) q[43];
-rz(0.15577406107991335) q[44];
-cx q[3],q[44];
-cx q[3],q[49];
-cx q[12],q[44];
-rz(0.15577406107991335) q[44];
-cx q[12],q[44];
-rz(0.15577406107991335) q[45];
-cx q[1],q[45];
-cx q[1],q[57];
-cx q[16],q[45];
-rz(0.15577406107991335) q[45];
-cx q[16],q[45];
-cx q[16],q[59];
-rz(0.15577406107991335) q[46];
-cx q[5],q[46];
-cx q[5],q[65];
-cx q[38],q[46];
-rz(0.15577406107991335) q[46];
-cx q[38],q[46];
-rx(8.726161038927415) q[38];
-rx(8.726161038927415) q[46];
-rz(0.15577406107991335) q[47];
-cx q[4],q[47];
-cx q[17],q[47];
-rz(0.15577406107991335) q[47];
-cx q[17],q[47];
-cx q[17],q[53];
-rz(0.15577406107991335) q[48];
-cx q[30],q[48];
-rx(8.726161038927415) q[48];
-rz(0.15577406107991335) q[49];
-cx q[3],q[49];
-cx q[3],q[50];
-cx q[4],q[49];
-rz(0.15577406107991335) q[49];
-cx q[4],q[49];
-cx q[4],q[61];
-rx(8.726161038927415) q[49];
-rz(0.15577406107991335) q[50];
-cx q[3],q[50];
-cx q[3],q[52];
-cx q[12],q[50];
-rz(0.15577406107991335) q[50];
-cx q[12],q[50];
-cx q[12],q[63];
-rz(0.15577406107991335) q[51];
-cx q[28],q[51];
-rx(8.726161038927415) q[51];
-rz(0.15577406107991335) q[52];
-cx q[3],q[52];
-rz(0.15577406107991335) q[53];
-cx q[17],q[53];
-cx q[17],q[62];
-cx q[21],q[53];
-rz(0.15577406107991335) q[53];
-cx q[21],q[53];
-cx q[21],q[75];
-rz(0.15577406107991335) q[54];
-cx q[24],q[54];
-cx q[24],q[58];
-cx q[28],q[54];
-rz(0.15577406107991335) q[54];
-cx q[28],q[54];
-rx(8.726161038927415) q[54];
-rz(0.15577406107991335) q[55];
-cx q[9],q[55];
-cx q[9],q[80];
-cx q[15],q[55];
-rz(0.15577406107991335) q[55];
-cx q[15],q[55];
-rz(0.15577406107991335) q[56];
-cx q[13],q[56];
-cx q[13],q[68];
-cx q[45],q[56];
-rz(0.15577406107991335) q[56];
-cx q[45],q[56];
-rx(8.726161038927415) q[45];
-rz(0.15577406107991335) q[57];
-cx q[1],q[57];
-cx q[1],q[60];
-cx q[3],q[57];
-rz(0.15577406107991335) q[57];
-cx q[3],q[57];
-cx q[3],q[70];
-rx(8.726161038927415) q[57];
-rz(0.15577406107991335) q[58];
-cx q[24],q[58];
-cx q[24],q[86];
-cx q[28],q[58];
-rz(0.15577406107991335) q[58];
-cx q[28],q[58];
-cx q[28],q[87];
-rx(8.726161038927415) q[58];
-rz(0.15577406107991335) q[59];
-cx q[16],q[59];
-cx q[16],q[73];
-cx q[32],q[59];
-rz(0.15577406107991335) q[59];
-cx q[32],q[59];
-rz(0.15577406107991335) q[60];
-cx q[1],q[60];
-cx q[1],q[97];
-cx q[7],q[60];
-rz(0.15577406107991335) q[60];
-cx q[7],q[60];
-rz(0.15577406107991335) q[61];
-cx q[4],q[61];
-cx q[7],q[61];
-rz(0.15577406107991335) q[61];
-cx q[7],q[61];
-rx(8.726161038927415) q[61];
-rz(0.15577406107991335) q[62];
-cx q[17],q[62];
-rx(8.726161038927415) q[62];
-rz(0.15577406107991335) q[63];
-cx q[12],q[63];
-rx(8.726161038927415) q[12];
-cx q[17],q[63];
-rz(0.15577406107991335) q[63];
-cx q[17],q[63];
-cx q[17],q[66];
-rz(0.15577406107991335) q[65];
-cx q[5],q[65];
-cx q[5],q[76];
-cx q[23],q[65];
-rz(0.15577406107991335) q[65];
-cx q[23],q[65];
-rx(8.726161038927415) q[23];
-rx(8.726161038927415) q[65];
-rz(0.15577406107991335) q[66];
-cx q[17],q[66];
-rx(8.726161038927415) q[17];
-cx q[47],q[66];
-rz(0.15577406107991335) q[66];
-cx q[47],q[66];
-rx(8.726161038927415) q[47];
-rx(8.726161038927415) q[66];
-rz(0.15577406107991335) q[68];
-cx q[13],q[68];
-rx(8.726161038927415) q[13];
-cx q[32],q[68];
-rz(0.15577406107991335) q[68];
-cx q[32],q[68];
-rz(0.15577406107991335) q[69];
-cx q[6],q[69];
-cx q[59],q[69];
-rz(0.15577406107991335) q[69];
-cx q[59],q[69];
-rx(8.726161038927415) q[69];
-rz(0.15577406107991335) q[70];
-cx q[3],q[70];
-cx q[3],q[71];
-cx q[15],q[70];
-rz(0.15577406107991335) q[70];
-cx q[15],q[70];
-cx q[70],q[84];
-rz(0.15577406107991335) q[71];
-cx q[3],q[71];
-cx q[3],q[77];
-cx q[53],q[71];
-rz(0.15577406107991335) q[71];
-cx q[53],q[71];
-rx(8.726161038927415) q[71];
-rz(0.15577406107991335) q[73];
-cx q[16],q[73];
-rx(8.726161038927415) q[16];
-cx q[59],q[73];
-rz(0.15577406107991335) q[73];
-cx q[59],q[73];
-rz(0.15577406107991335) q[75];
-cx q[21],q[75];
-cx q[21],q[81];
-rx(8.726161038927415) q[75];
-rz(0.15577406107991335) q[76];
-cx q[5],q[76];
-cx q[5],q[89];
-cx q[6],q[76];
-rz(0.15577406107991335) q[76];
-cx q[6],q[76];
-cx q[6],q[79];
-rx(8.726161038927415) q[76];
-rz(0.15577406107991335) q[77];
-cx q[3],q[77];
-cx q[3],q[88];
-cx q[30],q[77];
-rz(0.15577406107991335) q[77];
-cx q[30],q[77];
-rx(8.726161038927415) q[30];
-rz(0.15577406107991335) q[78];
-cx q[42],q[78];
-rx(8.726161038927415) q[42];
-cx q[60],q[78];
-rz(0.15577406107991335) q[78];
-cx q[60],q[78];
-rx(8.726161038927415) q[78];
-rz(0.15577406107991335) q[79];
-cx q[6],q[79];
-cx q[6],q[91];
-cx q[50],q[79];
-rz(0.15577406107991335) q[79];
-cx q[50],q[79];
-rx(8.726161038927415) q[50];
-rx(8.726161038927415) q[79];
-rz(0.15577406107991335) q[80];
-cx q[9],q[80];
-rx(8.726161038927415) q[9];
-cx q[15],q[80];
-rz(0.15577406107991335) q[80];
-cx q[15],q[80];
-cx q[15],q[90];
-rx(8.726161038927415) q[80];
-rz(0.15577406107991335) q[81];
-cx q[21],q[81];
-cx q[77],q[81];
-rz(0.15577406107991335) q[81];
-cx q[77],q[81];
-rx(8.726161038927415) q[77];
-rx(8.726161038927415) q[81];
-rz(0.15577406107991335) q[83];
-cx q[8],q[83];
-rx(8.726161038927415) q[8];
-cx q[68],q[83];
-rz(0.15577406107991335) q[83];
-cx q[68],q[83];
-rx(8.726161038927415) q[68];
-rx(8.726161038927415) q[83];
-rz(0.15577406107991335) q[84];
-cx q[70],q[84];
-rx(8.726161038927415) q[70];
-cx q[73],q[84];
-rz(0.15577406107991335) q[84];
-cx q[73],q[84];
-rx(8.726161038927415) q[73];
-rx(8.726161038927415) q[84];
-rz(0.15577406107991335) q[85];
-cx q[37],q[85];
-rx(8.726161038927415) q[37];
-cx q[59],q[85];
-rz(0.15577406107991335) q[85];
-cx q[59],q[85];
-rx(8.726161038927415) q[59];
-rx(8.726161038927415) q[85];
-rz(0.15577406107991335) q[86];
-cx q[24],q[86];
-rx(8.726161038927415) q[24];
-cx q[53],q[86];
-rz(0.15577406107991335) q[86];
-cx q[53],q[86];
-rx(8.726161038927415) q[53];
-rx(8.726161038927415) q[86];
-rz(0.15577406107991335) q[87];
-cx q[28],q[87];
-rx(8.726161038927415) q[28];
-cx q[32],q[87];
-rz(0.15577406107991335) q[87];
-cx q[32],q[87];
-cx q[32],q[93];
-rx(8.726161038927415) q[87];
-rz(0.15577406107991335) q[88];
-cx q[3],q[88];
-rx(8.726161038927415) q[3];
-cx q[60],q[88];
-rz(0.15577406107991335) q[88];
-cx q[60],q[88];
-rx(8.726161038927415) q[60];
-rx(8.726161038927415) q[88];
-rz(0.15577406107991335) q[89];
-cx q[5],q[89];
-cx q[5],q[95];
-rz(0.15577406107991335) q[90];
-cx q[15],q[90];
-cx q[15],q[92];
-rz(0.15577406107991335) q[91];
-cx q[6],q[91];
-rx(8.726161038927415) q[6];
-rx(8.726161038927415) q[91];
-rz(0.15577406107991335) q[92];
-cx q[15],q[92];
-rx(8.726161038927415) q[15];
-cx q[89],q[92];
-rz(0.15577406107991335) q[92];
-cx q[89],q[92];
-rx(8.726161038927415) q[89];
-rz(0.15577406107991335) q[93];
-cx q[32],q[93];
-rx(8.726161038927415) q[32];
-rx(8.726161038927415) q[93];
-rz(0.15577406107991335) q[94];
-cx q[36],q[94];
-rx(8.726161038927415) q[36];
-cx q[55],q[94];
-rz(0.15577406107991335) q[94];
-cx q[55],q[94];
-rx(8.726161038927415) q[55];
-rx(8.726161038927415) q[94];
-rz(0.15577406107991335) q[95];
-cx q[5],q[95];
-rx(8.726161038927415) q[5];
-rz(0.15577406107991335) q[97];
-cx q[1],q[97];
-rx(8.726161038927415) q[1];
-cx q[7],q[97];
-rz(0.15577406107991335) q[97];
-cx q[7],q[97];
-rx(8.726161038927415) q[7];
-rx(8.726161038927415) q[97];
-rz(5.714059968062441) q[99];
-cx q[41],q[99];
-rx(2.9806314421133004) q[41];
-cx q[10],q[41];
-rz(0.15577406107991335) q[41];
-cx q[10],q[41];
-cx q[10],q[52];
-cx q[27],q[41];
-rz(0.15577406107991335) q[41];
-cx q[27],q[41];
-cx q[27],q[72];
-cx q[41],q[67];
-rz(0.15577406107991335) q[52];
-cx q[10],q[52];
-cx q[10],q[64];
-rx(8.726161038927415) q[52];
-rz(0.15577406107991335) q[64];
-cx q[10],q[64];
-cx q[10],q[98];
-rx(8.726161038927415) q[64];
-rz(0.15577406107991335) q[67];
-cx q[41],q[67];
-cx q[56],q[67];
-rz(0.15577406107991335) q[67];
-cx q[56],q[67];
-cx q[56],q[74];
-rx(8.726161038927415) q[67];
-rz(0.15577406107991335) q[72];
-cx q[27],q[72];
-cx q[27],q[90];
-cx q[44],q[72];
-rz(0.15577406107991335) q[72];
-cx q[44],q[72];
-rx(8.726161038927415) q[44];
-rx(8.726161038927415) q[72];
-rz(0.15577406107991335) q[74];
-cx q[56],q[74];
-cx q[56],q[82];
-cx q[63],q[74];
-rz(0.15577406107991335) q[74];
-cx q[63],q[74];
-rx(8.726161038927415) q[63];
-rx(8.726161038927415) q[74];
-rz(0.15577406107991335) q[82];
-cx q[56],q[82];
-cx q[56],q[96];
-rx(8.726161038927415) q[82];
-rz(0.15577406107991335) q[90];
-cx q[27],q[90];
-cx q[27],q[95];
-rx(8.726161038927415) q[90];
-rz(0.15577406107991335) q[95];
-cx q[27],q[95];
-rx(8.726161038927415) q[27];
-rx(8.726161038927415) q[95];
-rz(0.15577406107991335) q[96];
-cx q[56],q[96];
-rx(8.726161038927415) q[56];
-cx q[92],q[96];
-rz(0.15577406107991335) q[96];
-cx q[92],q[96];
-rx(8.726161038927415) q[92];
-rx(8.726161038927415) q[96];
-rz(0.15577406107991335) q[98];
-cx q[10],q[98];
-rx(8.726161038927415) q[10];
-cx q[21],q[98];
-rz(0.15577406107991335) q[98];
-cx q[21],q[98];
-rx(8.726161038927415) q[21];
-rx(8.726161038927415) q[98];
-rx(2.9806314421133004) q[99];
-cx q[4],q[99];
-rz(0.15577406107991335) q[99];
-cx q[4],q[99];
-rx(8.726161038927415) q[4];
-cx q[41],q[99];
-rz(0.15577406107991335) q[99];
-cx q[41],q[99];
-rx(8.726161038927415) q[41];
-rx(8.726161038927415) q[99];
\ No newline at end of file
@@ -1,2290 +0,0 @@
-OPENQASM 2.0;
-include "qelib1.inc";
-qreg q[101];
-ry(pi/2) q[0];
-rx(pi) q[0];
-ry(pi/2) q[1];
-rx(pi) q[1];
-cx q[0],q[1];
-rz(2.2683182363061576) q[1];
-cx q[0],q[1];
-ry(pi/2) q[2];
-rx(pi) q[2];
-cx q[0],q[2];
-rz(2.2683182363061576) q[2];
-cx q[0],q[2];
-ry(pi/2) q[3];
-rx(pi) q[3];
-cx q[0],q[3];
-rz(2.2683182363061576) q[3];
-cx q[0],q[3];
-cx q[1],q[3];
-rz(2.2683182363061576) q[3];
-cx q[1],q[3];
-ry(pi/2) q[4];
-rx(pi) q[4];
-cx q[1],q[4];
-rz(2.2683182363061576) q[4];
-cx q[1],q[4];
-cx q[3],q[4];
-rz(2.2683182363061576) q[4];
-cx q[3],q[4];
-ry(pi/2) q[5];
-rx(pi) q[5];
-cx q[1],q[5];
-rz(2.2683182363061576) q[5];
-cx q[1],q[5];
-cx q[3],q[5];
-rz(2.2683182363061576) q[5];
-cx q[3],q[5];
-ry(pi/2) q[6];
-rx(pi) q[6];
-cx q[4],q[6];
-rz(2.2683182363061576) q[6];
-cx q[4],q[6];
-cx q[5],q[6];
-rz(2.2683182363061576) q[6];
-cx q[5],q[6];
-ry(pi/2) q[7];
-rx(pi) q[7];
-cx q[3],q[7];
-rz(2.2683182363061576) q[7];
-cx q[3],q[7];
-cx q[4],q[7];
-rz(2.2683182363061576) q[7];
-cx q[4],q[7];
-ry(pi/2) q[8];
-rx(pi) q[8];
-cx q[3],q[8];
-rz(2.2683182363061576) q[8];
-cx q[3],q[8];
-cx q[5],q[8];
-rz(2.2683182363061576) q[8];
-cx q[5],q[8];
-ry(pi/2) q[9];
-rx(pi) q[9];
-cx q[1],q[9];
-rz(2.2683182363061576) q[9];
-cx q[1],q[9];
-cx q[3],q[9];
-rz(2.2683182363061576) q[9];
-cx q[3],q[9];
-ry(pi/2) q[10];
-rx(pi) q[10];
-cx q[4],q[10];
-rz(2.2683182363061576) q[10];
-cx q[4],q[10];
-cx q[6],q[10];
-rz(2.2683182363061576) q[10];
-cx q[6],q[10];
-ry(pi/2) q[11];
-rx(pi) q[11];
-cx q[5],q[11];
-rz(2.2683182363061576) q[11];
-cx q[5],q[11];
-cx q[6],q[11];
-rz(2.2683182363061576) q[11];
-cx q[6],q[11];
-rx(8.143471016941358) q[11];
-ry(pi/2) q[12];
-rx(pi) q[12];
-cx q[3],q[12];
-rz(2.2683182363061576) q[12];
-cx q[3],q[12];
-cx q[5],q[12];
-rz(2.2683182363061576) q[12];
-cx q[5],q[12];
-ry(pi/2) q[13];
-rx(pi) q[13];
-cx q[4],q[13];
-rz(2.2683182363061576) q[13];
-cx q[4],q[13];
-cx q[5],q[13];
-rz(2.2683182363061576) q[13];
-cx q[5],q[13];
-ry(pi/2) q[14];
-rx(pi) q[14];
-cx q[3],q[14];
-rz(2.2683182363061576) q[14];
-cx q[3],q[14];
-cx q[4],q[14];
-rz(2.2683182363061576) q[14];
-cx q[4],q[14];
-rx(8.143471016941358) q[14];
-ry(pi/2) q[15];
-rx(pi) q[15];
-cx q[0],q[15];
-rz(2.2683182363061576) q[15];
-cx q[0],q[15];
-cx q[3],q[15];
-rz(2.2683182363061576) q[15];
-cx q[3],q[15];
-ry(pi/2) q[16];
-rx(pi) q[16];
-cx q[0],q[16];
-rz(2.2683182363061576) q[16];
-cx q[0],q[16];
-cx q[3],q[16];
-rz(2.2683182363061576) q[16];
-cx q[3],q[16];
-ry(pi/2) q[17];
-rx(pi) q[17];
-cx q[1],q[17];
-rz(2.2683182363061576) q[17];
-cx q[1],q[17];
-cx q[3],q[17];
-rz(2.2683182363061576) q[17];
-cx q[3],q[17];
-ry(pi/2) q[18];
-rx(pi) q[18];
-cx q[3],q[18];
-rz(2.2683182363061576) q[18];
-cx q[3],q[18];
-cx q[4],q[18];
-rz(2.2683182363061576) q[18];
-cx q[4],q[18];
-ry(pi/2) q[19];
-rx(pi) q[19];
-cx q[3],q[19];
-rz(2.2683182363061576) q[19];
-cx q[3],q[19];
-cx q[7],q[19];
-rz(2.2683182363061576) q[19];
-cx q[7],q[19];
-ry(pi/2) q[20];
-rx(pi) q[20];
-cx q[0],q[20];
-rz(2.2683182363061576) q[20];
-cx q[0],q[20];
-cx q[15],q[20];
-rz(2.2683182363061576) q[20];
-cx q[15],q[20];
-ry(pi/2) q[21];
-rx(pi) q[21];
-cx q[4],q[21];
-rz(2.2683182363061576) q[21];
-cx q[4],q[21];
-cx q[15],q[21];
-rz(2.2683182363061576) q[21];
-cx q[15],q[21];
-ry(pi/2) q[22];
-rx(pi) q[22];
-cx q[3],q[22];
-rz(2.2683182363061576) q[22];
-cx q[3],q[22];
-cx q[9],q[22];
-rz(2.2683182363061576) q[22];
-cx q[9],q[22];
-rx(8.143471016941358) q[22];
-ry(pi/2) q[23];
-rx(pi) q[23];
-cx q[3],q[23];
-rz(2.2683182363061576) q[23];
-cx q[3],q[23];
-cx q[17],q[23];
-rz(2.2683182363061576) q[23];
-cx q[17],q[23];
-ry(pi/2) q[24];
-rx(pi) q[24];
-cx q[3],q[24];
-rz(2.2683182363061576) q[24];
-cx q[3],q[24];
-cx q[5],q[24];
-rz(2.2683182363061576) q[24];
-cx q[5],q[24];
-ry(pi/2) q[25];
-rx(pi) q[25];
-cx q[3],q[25];
-rz(2.2683182363061576) q[25];
-cx q[3],q[25];
-cx q[12],q[25];
-rz(2.2683182363061576) q[25];
-cx q[12],q[25];
-ry(pi/2) q[26];
-rx(pi) q[26];
-cx q[3],q[26];
-rz(2.2683182363061576) q[26];
-cx q[3],q[26];
-cx q[21],q[26];
-rz(2.2683182363061576) q[26];
-cx q[21],q[26];
-ry(pi/2) q[27];
-rx(pi) q[27];
-cx q[4],q[27];
-rz(2.2683182363061576) q[27];
-cx q[4],q[27];
-cx q[6],q[27];
-rz(2.2683182363061576) q[27];
-cx q[6],q[27];
-ry(pi/2) q[28];
-rx(pi) q[28];
-cx q[1],q[28];
-rz(2.2683182363061576) q[28];
-cx q[1],q[28];
-cx q[3],q[28];
-rz(2.2683182363061576) q[28];
-cx q[3],q[28];
-ry(pi/2) q[29];
-rx(pi) q[29];
-cx q[1],q[29];
-rz(2.2683182363061576) q[29];
-cx q[1],q[29];
-cx q[3],q[29];
-rz(2.2683182363061576) q[29];
-cx q[3],q[29];
-rx(8.143471016941358) q[29];
-ry(pi/2) q[30];
-rx(pi) q[30];
-cx q[3],q[30];
-rz(2.2683182363061576) q[30];
-cx q[3],q[30];
-cx q[18],q[30];
-rz(2.2683182363061576) q[30];
-cx q[18],q[30];
-rx(8.143471016941358) q[18];
-ry(pi/2) q[31];
-rx(pi) q[31];
-cx q[12],q[31];
-rz(2.2683182363061576) q[31];
-cx q[12],q[31];
-cx q[26],q[31];
-rz(2.2683182363061576) q[31];
-cx q[26],q[31];
-rx(8.143471016941358) q[26];
-rx(8.143471016941358) q[31];
-ry(pi/2) q[32];
-rx(pi) q[32];
-cx q[0],q[32];
-rz(2.2683182363061576) q[32];
-cx q[0],q[32];
-cx q[21],q[32];
-rz(2.2683182363061576) q[32];
-cx q[21],q[32];
-ry(pi/2) q[33];
-rx(pi) q[33];
-cx q[5],q[33];
-rz(2.2683182363061576) q[33];
-cx q[5],q[33];
-cx q[30],q[33];
-rz(2.2683182363061576) q[33];
-cx q[30],q[33];
-rx(8.143471016941358) q[33];
-ry(pi/2) q[34];
-rx(pi) q[34];
-cx q[3],q[34];
-rz(2.2683182363061576) q[34];
-cx q[3],q[34];
-cx q[12],q[34];
-rz(2.2683182363061576) q[34];
-cx q[12],q[34];
-ry(pi/2) q[35];
-rx(pi) q[35];
-cx q[3],q[35];
-rz(2.2683182363061576) q[35];
-cx q[3],q[35];
-cx q[32],q[35];
-rz(2.2683182363061576) q[35];
-cx q[32],q[35];
-rx(8.143471016941358) q[35];
-ry(pi/2) q[36];
-rx(pi) q[36];
-cx q[15],q[36];
-rz(2.2683182363061576) q[36];
-cx q[15],q[36];
-cx q[20],q[36];
-rz(2.2683182363061576) q[36];
-cx q[20],q[36];
-ry(pi/2) q[37];
-rx(pi) q[37];
-cx q[10],q[37];
-rz(2.2683182363061576) q[37];
-cx q[10],q[37];
-cx q[34],q[37];
-rz(2.2683182363061576) q[37];
-cx q[34],q[37];
-rx(8.143471016941358) q[34];
-ry(pi/2) q[38];
-rx(pi) q[38];
-cx q[19],q[38];
-rz(2.2683182363061576) q[38];
-cx q[19],q[38];
-rx(8.143471016941358) q[19];
-cx q[21],q[38];
-rz(2.2683182363061576) q[38];
-cx q[21],q[38];
-ry(pi/2) q[39];
-rx(pi) q[39];
-cx q[3],q[39];
-rz(2.2683182363061576) q[39];
-cx q[3],q[39];
-cx q[13],q[39];
-rz(2.2683182363061576) q[39];
-cx q[13],q[39];
-rx(8.143471016941358) q[39];
-ry(pi/2) q[40];
-rx(pi) q[40];
-cx q[3],q[40];
-rz(2.2683182363061576) q[40];
-cx q[3],q[40];
-cx q[23],q[40];
-rz(2.2683182363061576) q[40];
-cx q[23],q[40];
-rx(8.143471016941358) q[40];
-ry(pi/2) q[41];
-rx(pi) q[41];
-cx q[10],q[41];
-rz(2.2683182363061576) q[41];
-cx q[10],q[41];
-cx q[27],q[41];
-rz(2.2683182363061576) q[41];
-cx q[27],q[41];
-ry(pi/2) q[42];
-rx(pi) q[42];
-cx q[0],q[42];
-rz(2.2683182363061576) q[42];
-cx q[0],q[42];
-cx q[3],q[42];
-rz(2.2683182363061576) q[42];
-cx q[3],q[42];
-ry(pi/2) q[43];
-rx(pi) q[43];
-cx q[3],q[43];
-rz(2.2683182363061576) q[43];
-cx q[3],q[43];
-cx q[20],q[43];
-rz(2.2683182363061576) q[43];
-cx q[20],q[43];
-rx(8.143471016941358) q[20];
-rx(8.143471016941358) q[43];
-ry(pi/2) q[44];
-rx(pi) q[44];
-cx q[3],q[44];
-rz(2.2683182363061576) q[44];
-cx q[3],q[44];
-cx q[12],q[44];
-rz(2.2683182363061576) q[44];
-cx q[12],q[44];
-ry(pi/2) q[45];
-rx(pi) q[45];
-cx q[1],q[45];
-rz(2.2683182363061576) q[45];
-cx q[1],q[45];
-cx q[16],q[45];
-rz(2.2683182363061576) q[45];
-cx q[16],q[45];
-ry(pi/2) q[46];
-rx(pi) q[46];
-cx q[5],q[46];
-rz(2.2683182363061576) q[46];
-cx q[5],q[46];
-cx q[38],q[46];
-rz(2.2683182363061576) q[46];
-cx q[38],q[46];
-rx(8.143471016941358) q[38];
-rx(8.143471016941358) q[46];
-ry(pi/2) q[47];
-rx(pi) q[47];
-cx q[4],q[47];
-rz(2.2683182363061576) q[47];
-cx q[4],q[47];
-cx q[17],q[47];
-rz(2.2683182363061576) q[47];
-cx q[17],q[47];
-ry(pi/2) q[48];
-rx(pi) q[48];
-cx q[0],q[48];
-rz(2.2683182363061576) q[48];
-cx q[0],q[48];
-cx q[30],q[48];
-rz(2.2683182363061576) q[48];
-cx q[30],q[48];
-rx(8.143471016941358) q[48];
-ry(pi/2) q[49];
-rx(pi) q[49];
-cx q[3],q[49];
-rz(2.2683182363061576) q[49];
-cx q[3],q[49];
-cx q[4],q[49];
-rz(2.2683182363061576) q[49];
-cx q[4],q[49];
-rx(8.143471016941358) q[49];
-ry(pi/2) q[50];
-rx(pi) q[50];
-cx q[3],q[50];
-rz(2.2683182363061576) q[50];
-cx q[3],q[50];
-cx q[12],q[50];
-rz(2.2683182363061576) q[50];
-cx q[12],q[50];
-ry(pi/2) q[51];
-rx(pi) q[51];
-cx q[0],q[51];
-rz(2.2683182363061576) q[51];
-cx q[0],q[51];
-cx q[28],q[51];
-rz(2.2683182363061576) q[51];
-cx q[28],q[51];
-rx(8.143471016941358) q[51];
-ry(pi/2) q[52];
-rx(pi) q[52];
-cx q[3],q[52];
-rz(2.2683182363061576) q[52];
-cx q[3],q[52];
-cx q[10],q[52];
-rz(2.2683182363061576) q[52];
-cx q[10],q[52];
-rx(8.143471016941358) q[52];
-ry(pi/2) q[53];
-rx(pi) q[53];
-cx q[17],q[53];
-rz(2.2683182363061576) q[53];
-cx q[17],q[53];
-cx q[21],q[53];
-rz(2.2683182363061576) q[53];
-cx q[21],q[53];
-ry(pi/2) q[54];
-rx(pi) q[54];
-cx q[24],q[54];
-rz(2.2683182363061576) q[54];
-cx q[24],q[54];
-cx q[28],q[54];
-rz(2.2683182363061576) q[54];
-cx q[28],q[54];
-rx(8.143471016941358) q[54];
-ry(pi/2) q[55];
-rx(pi) q[55];
-cx q[9],q[55];
-rz(2.2683182363061576) q[55];
-cx q[9],q[55];
-cx q[15],q[55];
-rz(2.2683182363061576) q[55];
-cx q[15],q[55];
-ry(pi/2) q[56];
-rx(pi) q[56];
-cx q[13],q[56];
-rz(2.2683182363061576) q[56];
-cx q[13],q[56];
-cx q[45],q[56];
-rz(2.2683182363061576) q[56];
-cx q[45],q[56];
-rx(8.143471016941358) q[45];
-ry(pi/2) q[57];
-rx(pi) q[57];
-cx q[1],q[57];
-rz(2.2683182363061576) q[57];
-cx q[1],q[57];
-cx q[3],q[57];
-rz(2.2683182363061576) q[57];
-cx q[3],q[57];
-rx(8.143471016941358) q[57];
-ry(pi/2) q[58];
-rx(pi) q[58];
-cx q[24],q[58];
-rz(2.2683182363061576) q[58];
-cx q[24],q[58];
-cx q[28],q[58];
-rz(2.2683182363061576) q[58];
-cx q[28],q[58];
-rx(8.143471016941358) q[58];
-ry(pi/2) q[59];
-rx(pi) q[59];
-cx q[16],q[59];
-rz(2.2683182363061576) q[59];
-cx q[16],q[59];
-cx q[32],q[59];
-rz(2.2683182363061576) q[59];
-cx q[32],q[59];
-ry(pi/2) q[60];
-rx(pi) q[60];
-cx q[1],q[60];
-rz(2.2683182363061576) q[60];
-cx q[1],q[60];
-cx q[7],q[60];
-rz(2.2683182363061576) q[60];
-cx q[7],q[60];
-ry(pi/2) q[61];
-rx(pi) q[61];
-cx q[4],q[61];
-rz(2.2683182363061576) q[61];
-cx q[4],q[61];
-cx q[7],q[61];
-rz(2.2683182363061576) q[61];
-cx q[7],q[61];
-rx(8.143471016941358) q[61];
-ry(pi/2) q[62];
-rx(pi) q[62];
-cx q[0],q[62];
-rz(2.2683182363061576) q[62];
-cx q[0],q[62];
-cx q[17],q[62];
-rz(2.2683182363061576) q[62];
-cx q[17],q[62];
-rx(8.143471016941358) q[62];
-ry(pi/2) q[63];
-rx(pi) q[63];
-cx q[12],q[63];
-rz(2.2683182363061576) q[63];
-cx q[12],q[63];
-rx(8.143471016941358) q[12];
-cx q[17],q[63];
-rz(2.2683182363061576) q[63];
-cx q[17],q[63];
-ry(pi/2) q[64];
-rx(pi) q[64];
-cx q[0],q[64];
-rz(2.2683182363061576) q[64];
-cx q[0],q[64];
-cx q[10],q[64];
-rz(2.2683182363061576) q[64];
-cx q[10],q[64];
-rx(8.143471016941358) q[64];
-ry(pi/2) q[65];
-rx(pi) q[65];
-cx q[5],q[65];
-rz(2.2683182363061576) q[65];
-cx q[5],q[65];
-cx q[23],q[65];
-rz(2.2683182363061576) q[65];
-cx q[23],q[65];
-rx(8.143471016941358) q[23];
-rx(8.143471016941358) q[65];
-ry(pi/2) q[66];
-rx(pi) q[66];
-cx q[17],q[66];
-rz(2.2683182363061576) q[66];
-cx q[17],q[66];
-rx(8.143471016941358) q[17];
-cx q[47],q[66];
-rz(2.2683182363061576) q[66];
-cx q[47],q[66];
-rx(8.143471016941358) q[47];
-rx(8.143471016941358) q[66];
-ry(pi/2) q[67];
-rx(pi) q[67];
-cx q[41],q[67];
-rz(2.2683182363061576) q[67];
-cx q[41],q[67];
-cx q[56],q[67];
-rz(2.2683182363061576) q[67];
-cx q[56],q[67];
-rx(8.143471016941358) q[67];
-ry(pi/2) q[68];
-rx(pi) q[68];
-cx q[13],q[68];
-rz(2.2683182363061576) q[68];
-cx q[13],q[68];
-rx(8.143471016941358) q[13];
-cx q[32],q[68];
-rz(2.2683182363061576) q[68];
-cx q[32],q[68];
-ry(pi/2) q[69];
-rx(pi) q[69];
-cx q[6],q[69];
-rz(2.2683182363061576) q[69];
-cx q[6],q[69];
-cx q[59],q[69];
-rz(2.2683182363061576) q[69];
-cx q[59],q[69];
-rx(8.143471016941358) q[69];
-ry(pi/2) q[70];
-rx(pi) q[70];
-cx q[3],q[70];
-rz(2.2683182363061576) q[70];
-cx q[3],q[70];
-cx q[15],q[70];
-rz(2.2683182363061576) q[70];
-cx q[15],q[70];
-ry(pi/2) q[71];
-rx(pi) q[71];
-cx q[3],q[71];
-rz(2.2683182363061576) q[71];
-cx q[3],q[71];
-cx q[53],q[71];
-rz(2.2683182363061576) q[71];
-cx q[53],q[71];
-rx(8.143471016941358) q[71];
-ry(pi/2) q[72];
-rx(pi) q[72];
-cx q[27],q[72];
-rz(2.2683182363061576) q[72];
-cx q[27],q[72];
-cx q[44],q[72];
-rz(2.2683182363061576) q[72];
-cx q[44],q[72];
-rx(8.143471016941358) q[44];
-rx(8.143471016941358) q[72];
-ry(pi/2) q[73];
-rx(pi) q[73];
-cx q[16],q[73];
-rz(2.2683182363061576) q[73];
-cx q[16],q[73];
-rx(8.143471016941358) q[16];
-cx q[59],q[73];
-rz(2.2683182363061576) q[73];
-cx q[59],q[73];
-ry(pi/2) q[74];
-rx(pi) q[74];
-cx q[56],q[74];
-rz(2.2683182363061576) q[74];
-cx q[56],q[74];
-cx q[63],q[74];
-rz(2.2683182363061576) q[74];
-cx q[63],q[74];
-rx(8.143471016941358) q[63];
-rx(8.143471016941358) q[74];
-ry(pi/2) q[75];
-rx(pi) q[75];
-cx q[0],q[75];
-rz(2.2683182363061576) q[75];
-cx q[0],q[75];
-cx q[21],q[75];
-rz(2.2683182363061576) q[75];
-cx q[21],q[75];
-rx(8.143471016941358) q[75];
-ry(pi/2) q[76];
-rx(pi) q[76];
-cx q[5],q[76];
-rz(2.2683182363061576) q[76];
-cx q[5],q[76];
-cx q[6],q[76];
-rz(2.2683182363061576) q[76];
-cx q[6],q[76];
-rx(8.143471016941358) q[76];
-ry(pi/2) q[77];
-rx(pi) q[77];
-cx q[3],q[77];
-rz(2.2683182363061576) q[77];
-cx q[3],q[77];
-cx q[30],q[77];
-rz(2.2683182363061576) q[77];
-cx q[30],q[77];
-rx(8.143471016941358) q[30];
-ry(pi/2) q[78];
-rx(pi) q[78];
-cx q[42],q[78];
-rz(2.2683182363061576) q[78];
-cx q[42],q[78];
-rx(8.143471016941358) q[42];
-cx q[60],q[78];
-rz(2.2683182363061576) q[78];
-cx q[60],q[78];
-rx(8.143471016941358) q[78];
-ry(pi/2) q[79];
-rx(pi) q[79];
-cx q[6],q[79];
-rz(2.2683182363061576) q[79];
-cx q[6],q[79];
-cx q[50],q[79];
-rz(2.2683182363061576) q[79];
-cx q[50],q[79];
-rx(8.143471016941358) q[50];
-rx(8.143471016941358) q[79];
-ry(pi/2) q[80];
-rx(pi) q[80];
-cx q[9],q[80];
-rz(2.2683182363061576) q[80];
-cx q[9],q[80];
-rx(8.143471016941358) q[9];
-cx q[15],q[80];
-rz(2.2683182363061576) q[80];
-cx q[15],q[80];
-rx(8.143471016941358) q[80];
-ry(pi/2) q[81];
-rx(pi) q[81];
-cx q[21],q[81];
-rz(2.2683182363061576) q[81];
-cx q[21],q[81];
-cx q[77],q[81];
-rz(2.2683182363061576) q[81];
-cx q[77],q[81];
-rx(8.143471016941358) q[77];
-rx(8.143471016941358) q[81];
-ry(pi/2) q[82];
-rx(pi) q[82];
-cx q[0],q[82];
-rz(2.2683182363061576) q[82];
-cx q[0],q[82];
-cx q[56],q[82];
-rz(2.2683182363061576) q[82];
-cx q[56],q[82];
-rx(8.143471016941358) q[82];
-ry(pi/2) q[83];
-rx(pi) q[83];
-cx q[8],q[83];
-rz(2.2683182363061576) q[83];
-cx q[8],q[83];
-rx(8.143471016941358) q[8];
-cx q[68],q[83];
-rz(2.2683182363061576) q[83];
-cx q[68],q[83];
-rx(8.143471016941358) q[68];
-rx(8.143471016941358) q[83];
-ry(pi/2) q[84];
-rx(pi) q[84];
-cx q[70],q[84];
-rz(2.2683182363061576) q[84];
-cx q[70],q[84];
-rx(8.143471016941358) q[70];
-cx q[73],q[84];
-rz(2.2683182363061576) q[84];
-cx q[73],q[84];
-rx(8.143471016941358) q[73];
-rx(8.143471016941358) q[84];
-ry(pi/2) q[85];
-rx(pi) q[85];
-cx q[37],q[85];
-rz(2.2683182363061576) q[85];
-cx q[37],q[85];
-rx(8.143471016941358) q[37];
-cx q[59],q[85];
-rz(2.2683182363061576) q[85];
-cx q[59],q[85];
-rx(8.143471016941358) q[59];
-rx(8.143471016941358) q[85];
-ry(pi/2) q[86];
-rx(pi) q[86];
-cx q[24],q[86];
-rz(2.2683182363061576) q[86];
-cx q[24],q[86];
-rx(8.143471016941358) q[24];
-cx q[53],q[86];
-rz(2.2683182363061576) q[86];
-cx q[53],q[86];
-rx(8.143471016941358) q[53];
-rx(8.143471016941358) q[86];
-ry(pi/2) q[87];
-rx(pi) q[87];
-cx q[28],q[87];
-rz(2.2683182363061576) q[87];
-cx q[28],q[87];
-rx(8.143471016941358) q[28];
-cx q[32],q[87];
-rz(2.2683182363061576) q[87];
-cx q[32],q[87];
-rx(8.143471016941358) q[87];
-ry(pi/2) q[88];
-rx(pi) q[88];
-cx q[3],q[88];
-rz(2.2683182363061576) q[88];
-cx q[3],q[88];
-cx q[60],q[88];
-rz(2.2683182363061576) q[88];
-cx q[60],q[88];
-rx(8.143471016941358) q[60];
-rx(8.143471016941358) q[88];
-ry(pi/2) q[89];
-rx(pi) q[89];
-cx q[2],q[89];
-rz(2.2683182363061576) q[89];
-cx q[2],q[89];
-rx(8.143471016941358) q[2];
-cx q[5],q[89];
-rz(2.2683182363061576) q[89];
-cx q[5],q[89];
-ry(pi/2) q[90];
-rx(pi) q[90];
-cx q[15],q[90];
-rz(2.2683182363061576) q[90];
-cx q[15],q[90];
-cx q[27],q[90];
-rz(2.2683182363061576) q[90];
-cx q[27],q[90];
-rx(8.143471016941358) q[90];
-ry(pi/2) q[91];
-rx(pi) q[91];
-cx q[0],q[91];
-rz(2.2683182363061576) q[91];
-cx q[0],q[91];
-cx q[6],q[91];
-rz(2.2683182363061576) q[91];
-cx q[6],q[91];
-rx(8.143471016941358) q[6];
-rx(8.143471016941358) q[91];
-ry(pi/2) q[92];
-rx(pi) q[92];
-cx q[15],q[92];
-rz(2.2683182363061576) q[92];
-cx q[15],q[92];
-rx(8.143471016941358) q[15];
-cx q[89],q[92];
-rz(2.2683182363061576) q[92];
-cx q[89],q[92];
-rx(8.143471016941358) q[89];
-ry(pi/2) q[93];
-rx(pi) q[93];
-cx q[0],q[93];
-rz(2.2683182363061576) q[93];
-cx q[0],q[93];
-rx(8.143471016941358) q[0];
-cx q[32],q[93];
-rz(2.2683182363061576) q[93];
-cx q[32],q[93];
-rx(8.143471016941358) q[32];
-rx(8.143471016941358) q[93];
-ry(pi/2) q[94];
-rx(pi) q[94];
-cx q[36],q[94];
-rz(2.2683182363061576) q[94];
-cx q[36],q[94];
-rx(8.143471016941358) q[36];
-cx q[55],q[94];
-rz(2.2683182363061576) q[94];
-cx q[55],q[94];
-rx(8.143471016941358) q[55];
-rx(8.143471016941358) q[94];
-ry(pi/2) q[95];
-rx(pi) q[95];
-cx q[5],q[95];
-rz(2.2683182363061576) q[95];
-cx q[5],q[95];
-rx(8.143471016941358) q[5];
-cx q[27],q[95];
-rz(2.2683182363061576) q[95];
-cx q[27],q[95];
-rx(8.143471016941358) q[27];
-rx(8.143471016941358) q[95];
-ry(pi/2) q[96];
-rx(pi) q[96];
-cx q[56],q[96];
-rz(2.2683182363061576) q[96];
-cx q[56],q[96];
-rx(8.143471016941358) q[56];
-cx q[92],q[96];
-rz(2.2683182363061576) q[96];
-cx q[92],q[96];
-rx(8.143471016941358) q[92];
-rx(8.143471016941358) q[96];
-ry(pi/2) q[97];
-rx(pi) q[97];
-cx q[1],q[97];
-rz(2.2683182363061576) q[97];
-cx q[1],q[97];
-rx(8.143471016941358) q[1];
-cx q[0],q[1];
-rz(6.211904807912513) q[1];
-cx q[0],q[1];
-cx q[0],q[2];
-rz(6.211904807912513) q[2];
-cx q[0],q[2];
-cx q[2],q[89];
-cx q[7],q[97];
-rz(6.211904807912513) q[89];
-cx q[2],q[89];
-rx(6.020220753415364) q[2];
-rz(2.2683182363061576) q[97];
-cx q[7],q[97];
-rx(8.143471016941358) q[7];
-rx(8.143471016941358) q[97];
-ry(pi/2) q[98];
-rx(pi) q[98];
-cx q[10],q[98];
-rz(2.2683182363061576) q[98];
-cx q[10],q[98];
-rx(8.143471016941358) q[10];
-cx q[21],q[98];
-rz(2.2683182363061576) q[98];
-cx q[21],q[98];
-rx(8.143471016941358) q[21];
-rx(8.143471016941358) q[98];
-ry(pi/2) q[99];
-rx(pi) q[99];
-cx q[4],q[99];
-rz(2.2683182363061576) q[99];
-cx q[4],q[99];
-rx(8.143471016941358) q[4];
-cx q[41],q[99];
-rz(2.2683182363061576) q[99];
-cx q[41],q[99];
-rx(8.143471016941358) q[41];
-rx(8.143471016941358) q[99];
-ry(pi/2) q[100];
-rx(pi) q[100];
-cx q[3],q[100];
-rz(2.2683182363061576) q[100];
-cx q[3],q[100];
-rx(8.143471016941358) q[3];
-cx q[0],q[3];
-rz(6.211904807912513) q[3];
-cx q[0],q[3];
-cx q[0],q[15];
-cx q[1],q[3];
-rz(6.211904807912513) q[3];
-cx q[1],q[3];
-cx q[1],q[4];
-rz(6.211904807912513) q[4];
-cx q[1],q[4];
-cx q[1],q[5];
-cx q[3],q[4];
-rz(6.211904807912513) q[4];
-cx q[3],q[4];
-cx q[4],q[6];
-rz(6.211904807912513) q[5];
-cx q[1],q[5];
-cx q[1],q[9];
-cx q[3],q[5];
-rz(6.211904807912513) q[5];
-cx q[3],q[5];
-cx q[3],q[7];
-rz(6.211904807912513) q[6];
-cx q[4],q[6];
-cx q[5],q[6];
-rz(6.211904807912513) q[6];
-cx q[5],q[6];
-rz(6.211904807912513) q[7];
-cx q[3],q[7];
-cx q[3],q[8];
-cx q[4],q[7];
-rz(6.211904807912513) q[7];
-cx q[4],q[7];
-cx q[4],q[10];
-rz(6.211904807912513) q[8];
-cx q[3],q[8];
-cx q[5],q[8];
-rz(6.211904807912513) q[8];
-cx q[5],q[8];
-cx q[5],q[11];
-cx q[8],q[83];
-rz(6.211904807912513) q[9];
-cx q[1],q[9];
-cx q[1],q[17];
-cx q[3],q[9];
-rz(6.211904807912513) q[9];
-cx q[3],q[9];
-cx q[3],q[12];
-rz(6.211904807912513) q[10];
-cx q[4],q[10];
-cx q[4],q[13];
-cx q[6],q[10];
-rz(6.211904807912513) q[10];
-cx q[6],q[10];
-cx q[10],q[37];
-rz(6.211904807912513) q[11];
-cx q[5],q[11];
-cx q[6],q[11];
-rz(6.211904807912513) q[11];
-cx q[6],q[11];
-rx(6.020220753415364) q[11];
-rz(6.211904807912513) q[12];
-cx q[3],q[12];
-cx q[3],q[14];
-cx q[5],q[12];
-rz(6.211904807912513) q[12];
-cx q[5],q[12];
-rz(6.211904807912513) q[13];
-cx q[4],q[13];
-cx q[5],q[13];
-rz(6.211904807912513) q[13];
-cx q[5],q[13];
-rz(6.211904807912513) q[14];
-cx q[3],q[14];
-cx q[4],q[14];
-rz(6.211904807912513) q[14];
-cx q[4],q[14];
-rx(6.020220753415364) q[14];
-rz(6.211904807912513) q[15];
-cx q[0],q[15];
-cx q[0],q[16];
-cx q[3],q[15];
-rz(6.211904807912513) q[15];
-cx q[3],q[15];
-rz(6.211904807912513) q[16];
-cx q[0],q[16];
-cx q[0],q[20];
-cx q[3],q[16];
-rz(6.211904807912513) q[16];
-cx q[3],q[16];
-rz(6.211904807912513) q[17];
-cx q[1],q[17];
-cx q[1],q[28];
-cx q[3],q[17];
-rz(6.211904807912513) q[17];
-cx q[3],q[17];
-cx q[3],q[18];
-rz(6.211904807912513) q[18];
-cx q[3],q[18];
-cx q[3],q[19];
-cx q[4],q[18];
-rz(6.211904807912513) q[18];
-cx q[4],q[18];
-cx q[4],q[21];
-rz(6.211904807912513) q[19];
-cx q[3],q[19];
-cx q[3],q[22];
-cx q[7],q[19];
-rz(6.211904807912513) q[19];
-cx q[7],q[19];
-cx q[19],q[38];
-rz(6.211904807912513) q[20];
-cx q[0],q[20];
-cx q[0],q[32];
-cx q[15],q[20];
-rz(6.211904807912513) q[20];
-cx q[15],q[20];
-rz(6.211904807912513) q[21];
-cx q[4],q[21];
-cx q[4],q[27];
-cx q[15],q[21];
-rz(6.211904807912513) q[21];
-cx q[15],q[21];
-cx q[15],q[36];
-rz(6.211904807912513) q[22];
-cx q[3],q[22];
-cx q[3],q[23];
-cx q[9],q[22];
-rz(6.211904807912513) q[22];
-cx q[9],q[22];
-cx q[9],q[55];
-rx(6.020220753415364) q[22];
-rz(6.211904807912513) q[23];
-cx q[3],q[23];
-cx q[3],q[24];
-cx q[17],q[23];
-rz(6.211904807912513) q[23];
-cx q[17],q[23];
-rz(6.211904807912513) q[24];
-cx q[3],q[24];
-cx q[5],q[24];
-rz(6.211904807912513) q[24];
-cx q[5],q[24];
-cx q[5],q[33];
-cx q[24],q[54];
-cx q[25],q[100];
-rz(6.211904807912513) q[27];
-cx q[4],q[27];
-cx q[4],q[47];
-cx q[6],q[27];
-rz(6.211904807912513) q[27];
-cx q[6],q[27];
-cx q[6],q[69];
-rz(6.211904807912513) q[28];
-cx q[1],q[28];
-cx q[1],q[29];
-rz(6.211904807912513) q[29];
-cx q[1],q[29];
-cx q[1],q[45];
-rz(6.211904807912513) q[32];
-cx q[0],q[32];
-cx q[0],q[42];
-rz(6.211904807912513) q[33];
-cx q[5],q[33];
-cx q[5],q[46];
-rz(6.211904807912513) q[36];
-cx q[15],q[36];
-cx q[20],q[36];
-rz(6.211904807912513) q[36];
-cx q[20],q[36];
-cx q[36],q[94];
-rz(6.211904807912513) q[37];
-cx q[10],q[37];
-cx q[10],q[41];
-rz(6.211904807912513) q[38];
-cx q[19],q[38];
-rx(6.020220753415364) q[19];
-rz(6.211904807912513) q[41];
-cx q[10],q[41];
-cx q[27],q[41];
-rz(6.211904807912513) q[41];
-cx q[27],q[41];
-cx q[27],q[72];
-cx q[41],q[67];
-rz(6.211904807912513) q[42];
-cx q[0],q[42];
-cx q[0],q[48];
-rz(6.211904807912513) q[45];
-cx q[1],q[45];
-cx q[1],q[57];
-cx q[16],q[45];
-rz(6.211904807912513) q[45];
-cx q[16],q[45];
-cx q[16],q[59];
-rz(6.211904807912513) q[46];
-cx q[5],q[46];
-cx q[5],q[65];
-rz(6.211904807912513) q[47];
-cx q[4],q[47];
-cx q[17],q[47];
-rz(6.211904807912513) q[47];
-cx q[17],q[47];
-cx q[17],q[53];
-rz(6.211904807912513) q[48];
-cx q[0],q[48];
-cx q[0],q[51];
-rz(6.211904807912513) q[51];
-cx q[0],q[51];
-cx q[0],q[62];
-rz(6.211904807912513) q[53];
-cx q[17],q[53];
-rz(6.211904807912513) q[54];
-cx q[24],q[54];
-cx q[24],q[58];
-rz(6.211904807912513) q[55];
-cx q[9],q[55];
-cx q[9],q[80];
-cx q[15],q[55];
-rz(6.211904807912513) q[55];
-cx q[15],q[55];
-rz(6.211904807912513) q[57];
-cx q[1],q[57];
-cx q[1],q[60];
-rz(6.211904807912513) q[58];
-cx q[24],q[58];
-cx q[24],q[86];
-rz(6.211904807912513) q[59];
-cx q[16],q[59];
-cx q[16],q[73];
-rz(6.211904807912513) q[60];
-cx q[1],q[60];
-cx q[1],q[97];
-cx q[7],q[60];
-rz(6.211904807912513) q[60];
-cx q[7],q[60];
-rz(6.211904807912513) q[62];
-cx q[0],q[62];
-cx q[0],q[64];
-cx q[17],q[62];
-rz(6.211904807912513) q[62];
-cx q[17],q[62];
-rx(6.020220753415364) q[62];
-rz(6.211904807912513) q[64];
-cx q[0],q[64];
-cx q[0],q[75];
-rz(6.211904807912513) q[65];
-cx q[5],q[65];
-cx q[5],q[76];
-rz(6.211904807912513) q[67];
-cx q[41],q[67];
-rz(6.211904807912513) q[69];
-cx q[6],q[69];
-rz(6.211904807912513) q[72];
-cx q[27],q[72];
-rz(6.211904807912513) q[73];
-cx q[16],q[73];
-rx(6.020220753415364) q[16];
-rz(6.211904807912513) q[75];
-cx q[0],q[75];
-cx q[0],q[82];
-rz(6.211904807912513) q[76];
-cx q[5],q[76];
-cx q[5],q[89];
-cx q[6],q[76];
-rz(6.211904807912513) q[76];
-cx q[6],q[76];
-cx q[6],q[79];
-rx(6.020220753415364) q[76];
-rz(6.211904807912513) q[79];
-cx q[6],q[79];
-rz(6.211904807912513) q[80];
-cx q[9],q[80];
-rx(6.020220753415364) q[9];
-rz(6.211904807912513) q[82];
-cx q[0],q[82];
-cx q[0],q[91];
-rz(6.211904807912513) q[83];
-cx q[8],q[83];
-rx(6.020220753415364) q[8];
-rz(6.211904807912513) q[86];
-cx q[24],q[86];
-rx(6.020220753415364) q[24];
-rz(6.211904807912513) q[89];
-cx q[5],q[89];
-cx q[5],q[95];
-rz(6.211904807912513) q[91];
-cx q[0],q[91];
-cx q[0],q[93];
-cx q[6],q[91];
-rz(6.211904807912513) q[91];
-cx q[6],q[91];
-rx(6.020220753415364) q[6];
-rx(6.020220753415364) q[91];
-rz(6.211904807912513) q[93];
-cx q[0],q[93];
-rx(6.020220753415364) q[0];
-rz(6.211904807912513) q[94];
-cx q[36],q[94];
-rx(6.020220753415364) q[36];
-cx q[55],q[94];
-rz(6.211904807912513) q[94];
-cx q[55],q[94];
-rx(6.020220753415364) q[55];
-rx(6.020220753415364) q[94];
-rz(6.211904807912513) q[95];
-cx q[5],q[95];
-rx(6.020220753415364) q[5];
-rz(6.211904807912513) q[97];
-cx q[1],q[97];
-rx(6.020220753415364) q[1];
-cx q[0],q[1];
-rz(5.23210128134655) q[1];
-cx q[0],q[1];
-cx q[0],q[2];
-rz(5.23210128134655) q[2];
-cx q[0],q[2];
-rz(2.2683182363061576) q[100];
-cx q[25],q[100];
-rx(8.143471016941358) q[25];
-cx q[3],q[25];
-rz(6.211904807912513) q[25];
-cx q[3],q[25];
-cx q[3],q[26];
-cx q[12],q[25];
-rz(6.211904807912513) q[25];
-cx q[12],q[25];
-cx q[12],q[31];
-rz(6.211904807912513) q[26];
-cx q[3],q[26];
-cx q[3],q[28];
-cx q[21],q[26];
-rz(6.211904807912513) q[26];
-cx q[21],q[26];
-cx q[21],q[32];
-rz(6.211904807912513) q[28];
-cx q[3],q[28];
-cx q[3],q[29];
-cx q[28],q[51];
-rz(6.211904807912513) q[29];
-cx q[3],q[29];
-cx q[3],q[30];
-rx(6.020220753415364) q[29];
-rz(6.211904807912513) q[30];
-cx q[3],q[30];
-cx q[3],q[34];
-cx q[18],q[30];
-rz(6.211904807912513) q[30];
-cx q[18],q[30];
-rx(6.020220753415364) q[18];
-cx q[30],q[33];
-rz(6.211904807912513) q[31];
-cx q[12],q[31];
-cx q[26],q[31];
-rz(6.211904807912513) q[31];
-cx q[26],q[31];
-rx(6.020220753415364) q[26];
-rx(6.020220753415364) q[31];
-rz(6.211904807912513) q[32];
-cx q[21],q[32];
-cx q[21],q[38];
-rz(6.211904807912513) q[33];
-cx q[30],q[33];
-cx q[30],q[48];
-rx(6.020220753415364) q[33];
-rz(6.211904807912513) q[34];
-cx q[3],q[34];
-cx q[3],q[35];
-cx q[12],q[34];
-rz(6.211904807912513) q[34];
-cx q[12],q[34];
-cx q[34],q[37];
-rz(6.211904807912513) q[35];
-cx q[3],q[35];
-cx q[3],q[39];
-cx q[32],q[35];
-rz(6.211904807912513) q[35];
-cx q[32],q[35];
-cx q[32],q[59];
-rx(6.020220753415364) q[35];
-rz(6.211904807912513) q[37];
-cx q[34],q[37];
-rx(6.020220753415364) q[34];
-cx q[37],q[85];
-rz(6.211904807912513) q[38];
-cx q[21],q[38];
-cx q[21],q[53];
-cx q[38],q[46];
-rz(6.211904807912513) q[39];
-cx q[3],q[39];
-cx q[3],q[40];
-cx q[13],q[39];
-rz(6.211904807912513) q[39];
-cx q[13],q[39];
-cx q[13],q[56];
-rx(6.020220753415364) q[39];
-rz(6.211904807912513) q[40];
-cx q[3],q[40];
-cx q[3],q[42];
-cx q[23],q[40];
-rz(6.211904807912513) q[40];
-cx q[23],q[40];
-cx q[23],q[65];
-rx(6.020220753415364) q[40];
-rz(6.211904807912513) q[42];
-cx q[3],q[42];
-cx q[3],q[43];
-cx q[42],q[78];
-rz(6.211904807912513) q[43];
-cx q[3],q[43];
-cx q[3],q[44];
-cx q[20],q[43];
-rz(6.211904807912513) q[43];
-cx q[20],q[43];
-rx(6.020220753415364) q[20];
-rx(6.020220753415364) q[43];
-rz(6.211904807912513) q[44];
-cx q[3],q[44];
-cx q[3],q[49];
-cx q[12],q[44];
-rz(6.211904807912513) q[44];
-cx q[12],q[44];
-cx q[44],q[72];
-rz(6.211904807912513) q[46];
-cx q[38],q[46];
-rx(6.020220753415364) q[38];
-rx(6.020220753415364) q[46];
-rz(6.211904807912513) q[48];
-cx q[30],q[48];
-rx(6.020220753415364) q[48];
-rz(6.211904807912513) q[49];
-cx q[3],q[49];
-cx q[3],q[50];
-cx q[4],q[49];
-rz(6.211904807912513) q[49];
-cx q[4],q[49];
-cx q[4],q[61];
-rx(6.020220753415364) q[49];
-rz(6.211904807912513) q[50];
-cx q[3],q[50];
-cx q[3],q[52];
-cx q[12],q[50];
-rz(6.211904807912513) q[50];
-cx q[12],q[50];
-cx q[12],q[63];
-cx q[50],q[79];
-rz(6.211904807912513) q[51];
-cx q[28],q[51];
-cx q[28],q[54];
-rx(6.020220753415364) q[51];
-rz(6.211904807912513) q[52];
-cx q[3],q[52];
-cx q[3],q[57];
-cx q[10],q[52];
-rz(6.211904807912513) q[52];
-cx q[10],q[52];
-cx q[10],q[64];
-rx(6.020220753415364) q[52];
-rz(6.211904807912513) q[53];
-cx q[21],q[53];
-cx q[21],q[75];
-rz(6.211904807912513) q[54];
-cx q[28],q[54];
-cx q[28],q[58];
-rx(6.020220753415364) q[54];
-rz(6.211904807912513) q[56];
-cx q[13],q[56];
-cx q[13],q[68];
-cx q[45],q[56];
-rz(6.211904807912513) q[56];
-cx q[45],q[56];
-rx(6.020220753415364) q[45];
-cx q[56],q[67];
-rz(6.211904807912513) q[57];
-cx q[3],q[57];
-cx q[3],q[70];
-rx(6.020220753415364) q[57];
-rz(6.211904807912513) q[58];
-cx q[28],q[58];
-cx q[28],q[87];
-rx(6.020220753415364) q[58];
-rz(6.211904807912513) q[59];
-cx q[32],q[59];
-cx q[59],q[69];
-rz(6.211904807912513) q[61];
-cx q[4],q[61];
-cx q[4],q[99];
-cx q[7],q[61];
-rz(6.211904807912513) q[61];
-cx q[7],q[61];
-cx q[7],q[97];
-rx(6.020220753415364) q[61];
-rz(6.211904807912513) q[63];
-cx q[12],q[63];
-rx(6.020220753415364) q[12];
-cx q[17],q[63];
-rz(6.211904807912513) q[63];
-cx q[17],q[63];
-cx q[17],q[66];
-rz(6.211904807912513) q[64];
-cx q[10],q[64];
-cx q[10],q[98];
-rx(6.020220753415364) q[64];
-rz(6.211904807912513) q[65];
-cx q[23],q[65];
-rx(6.020220753415364) q[23];
-rx(6.020220753415364) q[65];
-rz(6.211904807912513) q[66];
-cx q[17],q[66];
-rx(6.020220753415364) q[17];
-cx q[47],q[66];
-rz(6.211904807912513) q[66];
-cx q[47],q[66];
-rx(6.020220753415364) q[47];
-rx(6.020220753415364) q[66];
-rz(6.211904807912513) q[67];
-cx q[56],q[67];
-cx q[56],q[74];
-rx(6.020220753415364) q[67];
-rz(6.211904807912513) q[68];
-cx q[13],q[68];
-rx(6.020220753415364) q[13];
-cx q[32],q[68];
-rz(6.211904807912513) q[68];
-cx q[32],q[68];
-cx q[68],q[83];
-rz(6.211904807912513) q[69];
-cx q[59],q[69];
-cx q[59],q[73];
-rx(6.020220753415364) q[69];
-rz(6.211904807912513) q[70];
-cx q[3],q[70];
-cx q[3],q[71];
-cx q[15],q[70];
-rz(6.211904807912513) q[70];
-cx q[15],q[70];
-cx q[15],q[80];
-cx q[70],q[84];
-rz(6.211904807912513) q[71];
-cx q[3],q[71];
-cx q[3],q[77];
-cx q[53],q[71];
-rz(6.211904807912513) q[71];
-cx q[53],q[71];
-cx q[53],q[86];
-rx(6.020220753415364) q[71];
-rz(6.211904807912513) q[72];
-cx q[44],q[72];
-rx(6.020220753415364) q[44];
-rx(6.020220753415364) q[72];
-rz(6.211904807912513) q[73];
-cx q[59],q[73];
-rz(6.211904807912513) q[74];
-cx q[56],q[74];
-cx q[56],q[82];
-cx q[63],q[74];
-rz(6.211904807912513) q[74];
-cx q[63],q[74];
-rx(6.020220753415364) q[63];
-rx(6.020220753415364) q[74];
-rz(6.211904807912513) q[75];
-cx q[21],q[75];
-cx q[21],q[81];
-rx(6.020220753415364) q[75];
-rz(6.211904807912513) q[77];
-cx q[3],q[77];
-cx q[3],q[88];
-cx q[30],q[77];
-rz(6.211904807912513) q[77];
-cx q[30],q[77];
-rx(6.020220753415364) q[30];
-rz(6.211904807912513) q[78];
-cx q[42],q[78];
-rx(6.020220753415364) q[42];
-cx q[60],q[78];
-rz(6.211904807912513) q[78];
-cx q[60],q[78];
-rx(6.020220753415364) q[78];
-rz(6.211904807912513) q[79];
-cx q[50],q[79];
-rx(6.020220753415364) q[50];
-rx(6.020220753415364) q[79];
-rz(6.211904807912513) q[80];
-cx q[15],q[80];
-cx q[15],q[90];
-rx(6.020220753415364) q[80];
-rz(6.211904807912513) q[81];
-cx q[21],q[81];
-cx q[77],q[81];
-rz(6.211904807912513) q[81];
-cx q[77],q[81];
-rx(6.020220753415364) q[77];
-rx(6.020220753415364) q[81];
-rz(6.211904807912513) q[82];
-cx q[56],q[82];
-cx q[56],q[96];
-rx(6.020220753415364) q[82];
-rz(6.211904807912513) q[83];
-cx q[68],q[83];
-rx(6.020220753415364) q[68];
-rx(6.020220753415364) q[83];
-rz(6.211904807912513) q[84];
-cx q[70],q[84];
-rx(6.020220753415364) q[70];
-cx q[73],q[84];
-rz(6.211904807912513) q[84];
-cx q[73],q[84];
-rx(6.020220753415364) q[73];
-rx(6.020220753415364) q[84];
-rz(6.211904807912513) q[85];
-cx q[37],q[85];
-rx(6.020220753415364) q[37];
-cx q[59],q[85];
-rz(6.211904807912513) q[85];
-cx q[59],q[85];
-rx(6.020220753415364) q[59];
-rx(6.020220753415364) q[85];
-rz(6.211904807912513) q[86];
-cx q[53],q[86];
-rx(6.020220753415364) q[53];
-rx(6.020220753415364) q[86];
-rz(6.211904807912513) q[87];
-cx q[28],q[87];
-rx(6.020220753415364) q[28];
-cx q[32],q[87];
-rz(6.211904807912513) q[87];
-cx q[32],q[87];
-cx q[32],q[93];
-rx(6.020220753415364) q[87];
-rz(6.211904807912513) q[88];
-cx q[3],q[88];
-cx q[60],q[88];
-rz(6.211904807912513) q[88];
-cx q[60],q[88];
-rx(6.020220753415364) q[60];
-rx(6.020220753415364) q[88];
-rz(6.211904807912513) q[90];
-cx q[15],q[90];
-cx q[15],q[92];
-cx q[27],q[90];
-rz(6.211904807912513) q[90];
-cx q[27],q[90];
-cx q[27],q[95];
-rx(6.020220753415364) q[90];
-rz(6.211904807912513) q[92];
-cx q[15],q[92];
-rx(6.020220753415364) q[15];
-cx q[89],q[92];
-rz(6.211904807912513) q[92];
-cx q[89],q[92];
-rx(6.020220753415364) q[89];
-cx q[2],q[89];
-rz(5.23210128134655) q[89];
-cx q[2],q[89];
-rx(6.585311788218899) q[2];
-rz(6.211904807912513) q[93];
-cx q[32],q[93];
-rx(6.020220753415364) q[32];
-rx(6.020220753415364) q[93];
-rz(6.211904807912513) q[95];
-cx q[27],q[95];
-rx(6.020220753415364) q[27];
-rx(6.020220753415364) q[95];
-rz(6.211904807912513) q[96];
-cx q[56],q[96];
-rx(6.020220753415364) q[56];
-cx q[92],q[96];
-rz(6.211904807912513) q[96];
-cx q[92],q[96];
-rx(6.020220753415364) q[92];
-rx(6.020220753415364) q[96];
-rz(6.211904807912513) q[97];
-cx q[7],q[97];
-rx(6.020220753415364) q[7];
-rx(6.020220753415364) q[97];
-rz(6.211904807912513) q[98];
-cx q[10],q[98];
-rx(6.020220753415364) q[10];
-cx q[21],q[98];
-rz(6.211904807912513) q[98];
-cx q[21],q[98];
-rx(6.020220753415364) q[21];
-rx(6.020220753415364) q[98];
-rz(6.211904807912513) q[99];
-cx q[4],q[99];
-rx(6.020220753415364) q[4];
-cx q[41],q[99];
-rz(6.211904807912513) q[99];
-cx q[41],q[99];
-rx(6.020220753415364) q[41];
-rx(6.020220753415364) q[99];
-rx(8.143471016941358) q[100];
-cx q[3],q[100];
-rz(6.211904807912513) q[100];
-cx q[3],q[100];
-rx(6.020220753415364) q[3];
-cx q[0],q[3];
-rz(5.23210128134655) q[3];
-cx q[0],q[3];
-cx q[0],q[15];
-cx q[1],q[3];
-rz(5.23210128134655) q[3];
-cx q[1],q[3];
-cx q[1],q[4];
-rz(5.23210128134655) q[4];
-cx q[1],q[4];
-cx q[1],q[5];
-cx q[3],q[4];
-rz(5.23210128134655) q[4];
-cx q[3],q[4];
-cx q[4],q[6];
-rz(5.23210128134655) q[5];
-cx q[1],q[5];
-cx q[1],q[9];
-cx q[3],q[5];
-rz(5.23210128134655) q[5];
-cx q[3],q[5];
-cx q[3],q[7];
-rz(5.23210128134655) q[6];
-cx q[4],q[6];
-cx q[5],q[6];
-rz(5.23210128134655) q[6];
-cx q[5],q[6];
-rz(5.23210128134655) q[7];
-cx q[3],q[7];
-cx q[3],q[8];
-cx q[4],q[7];
-rz(5.23210128134655) q[7];
-cx q[4],q[7];
-cx q[4],q[10];
-rz(5.23210128134655) q[8];
-cx q[3],q[8];
-cx q[5],q[8];
-rz(5.23210128134655) q[8];
-cx q[5],q[8];
-cx q[5],q[11];
-cx q[8],q[83];
-rz(5.23210128134655) q[9];
-cx q[1],q[9];
-cx q[1],q[17];
-cx q[3],q[9];
-rz(5.23210128134655) q[9];
-cx q[3],q[9];
-cx q[3],q[12];
-rz(5.23210128134655) q[10];
-cx q[4],q[10];
-cx q[4],q[13];
-cx q[6],q[10];
-rz(5.23210128134655) q[10];
-cx q[6],q[10];
-cx q[10],q[37];
-rz(5.23210128134655) q[11];
-cx q[5],q[11];
-cx q[6],q[11];
-rz(5.23210128134655) q[11];
-cx q[6],q[11];
-rx(6.585311788218899) q[11];
-rz(5.23210128134655) q[12];
-cx q[3],q[12];
-cx q[3],q[14];
-cx q[5],q[12];
-rz(5.23210128134655) q[12];
-cx q[5],q[12];
-rz(5.23210128134655) q[13];
-cx q[4],q[13];
-cx q[5],q[13];
-rz(5.23210128134655) q[13];
-cx q[5],q[13];
-rz(5.23210128134655) q[14];
-cx q[3],q[14];
-cx q[4],q[14];
-rz(5.23210128134655) q[14];
-cx q[4],q[14];
-rx(6.585311788218899) q[14];
-rz(5.23210128134655) q[15];
-cx q[0],q[15];
-cx q[0],q[16];
-cx q[3],q[15];
-rz(5.23210128134655) q[15];
-cx q[3],q[15];
-rz(5.23210128134655) q[16];
-cx q[0],q[16];
-cx q[0],q[20];
-cx q[3],q[16];
-rz(5.23210128134655) q[16];
-cx q[3],q[16];
-rz(5.23210128134655) q[17];
-cx q[1],q[17];
-cx q[1],q[28];
-cx q[3],q[17];
-rz(5.23210128134655) q[17];
-cx q[3],q[17];
-cx q[3],q[18];
-rz(5.23210128134655) q[18];
-cx q[3],q[18];
-cx q[3],q[19];
-cx q[4],q[18];
-rz(5.23210128134655) q[18];
-cx q[4],q[18];
-cx q[4],q[21];
-rz(5.23210128134655) q[19];
-cx q[3],q[19];
-cx q[3],q[22];
-cx q[7],q[19];
-rz(5.23210128134655) q[19];
-cx q[7],q[19];
-cx q[19],q[38];
-rz(5.23210128134655) q[20];
-cx q[0],q[20];
-cx q[0],q[32];
-cx q[15],q[20];
-rz(5.23210128134655) q[20];
-cx q[15],q[20];
-rz(5.23210128134655) q[21];
-cx q[4],q[21];
-cx q[4],q[27];
-cx q[15],q[21];
-rz(5.23210128134655) q[21];
-cx q[15],q[21];
-cx q[15],q[36];
-rz(5.23210128134655) q[22];
-cx q[3],q[22];
-cx q[3],q[23];
-cx q[9],q[22];
-rz(5.23210128134655) q[22];
-cx q[9],q[22];
-cx q[9],q[55];
-rx(6.585311788218899) q[22];
-rz(5.23210128134655) q[23];
-cx q[3],q[23];
-cx q[3],q[24];
-cx q[17],q[23];
-rz(5.23210128134655) q[23];
-cx q[17],q[23];
-rz(5.23210128134655) q[24];
-cx q[3],q[24];
-cx q[5],q[24];
-rz(5.23210128134655) q[24];
-cx q[5],q[24];
-cx q[5],q[33];
-cx q[24],q[54];
-cx q[25],q[100];
-rz(5.23210128134655) q[27];
-cx q[4],q[27];
-cx q[4],q[47];
-cx q[6],q[27];
-rz(5.23210128134655) q[27];
-cx q[6],q[27];
-cx q[6],q[69];
-rz(5.23210128134655) q[28];
-cx q[1],q[28];
-cx q[1],q[29];
-rz(5.23210128134655) q[29];
-cx q[1],q[29];
-cx q[1],q[45];
-rz(5.23210128134655) q[32];
-cx q[0],q[32];
-cx q[0],q[42];
-rz(5.23210128134655) q[33];
-cx q[5],q[33];
-cx q[5],q[46];
-rz(5.23210128134655) q[36];
-cx q[15],q[36];
-cx q[20],q[36];
-rz(5.23210128134655) q[36];
-cx q[20],q[36];
-cx q[36],q[94];
-rz(5.23210128134655) q[37];
-cx q[10],q[37];
-cx q[10],q[41];
-rz(5.23210128134655) q[38];
-cx q[19],q[38];
-rx(6.585311788218899) q[19];
-rz(5.23210128134655) q[41];
-cx q[10],q[41];
-cx q[27],q[41];
-rz(5.23210128134655) q[41];
-cx q[27],q[41];
-cx q[27],q[72];
-cx q[41],q[67];
-rz(5.23210128134655) q[42];
-cx q[0],q[42];
-cx q[0],q[48];
-rz(5.23210128134655) q[45];
-cx q[1],q[45];
-cx q[1],q[57];
-cx q[16],q[45];
-rz(5.23210128134655) q[45];
-cx q[16],q[45];
-cx q[16],q[59];
-rz(5.23210128134655) q[46];
-cx q[5],q[46];
-cx q[5],q[65];
-rz(5.23210128134655) q[47];
-cx q[4],q[47];
-cx q[17],q[47];
-rz(5.23210128134655) q[47];
-cx q[17],q[47];
-cx q[17],q[53];
-rz(5.23210128134655) q[48];
-cx q[0],q[48];
-cx q[0],q[51];
-rz(5.23210128134655) q[51];
-cx q[0],q[51];
-cx q[0],q[62];
-rz(5.23210128134655) q[53];
-cx q[17],q[53];
-rz(5.23210128134655) q[54];
-cx q[24],q[54];
-cx q[24],q[58];
-rz(5.23210128134655) q[55];
-cx q[9],q[55];
-cx q[9],q[80];
-cx q[15],q[55];
-rz(5.23210128134655) q[55];
-cx q[15],q[55];
-rz(5.23210128134655) q[57];
-cx q[1],q[57];
-cx q[1],q[60];
-rz(5.23210128134655) q[58];
-cx q[24],q[58];
-cx q[24],q[86];
-rz(5.23210128134655) q[59];
-cx q[16],q[59];
-cx q[16],q[73];
-rz(5.23210128134655) q[60];
-cx q[1],q[60];
-cx q[1],q[97];
-cx q[7],q[60];
-rz(5.23210128134655) q[60];
-cx q[7],q[60];
-rz(5.23210128134655) q[62];
-cx q[0],q[62];
-cx q[0],q[64];
-cx q[17],q[62];
-rz(5.23210128134655) q[62];
-cx q[17],q[62];
-rx(6.585311788218899) q[62];
-rz(5.23210128134655) q[64];
-cx q[0],q[64];
-cx q[0],q[75];
-rz(5.23210128134655) q[65];
-cx q[5],q[65];
-cx q[5],q[76];
-rz(5.23210128134655) q[67];
-cx q[41],q[67];
-rz(5.23210128134655) q[69];
-cx q[6],q[69];
-rz(5.23210128134655) q[72];
-cx q[27],q[72];
-rz(5.23210128134655) q[73];
-cx q[16],q[73];
-rx(6.585311788218899) q[16];
-rz(5.23210128134655) q[75];
-cx q[0],q[75];
-cx q[0],q[82];
-rz(5.23210128134655) q[76];
-cx q[5],q[76];
-cx q[5],q[89];
-cx q[6],q[76];
-rz(5.23210128134655) q[76];
-cx q[6],q[76];
-cx q[6],q[79];
-rx(6.585311788218899) q[76];
-rz(5.23210128134655) q[79];
-cx q[6],q[79];
-rz(5.23210128134655) q[80];
-cx q[9],q[80];
-rx(6.585311788218899) q[9];
-rz(5.23210128134655) q[82];
-cx q[0],q[82];
-cx q[0],q[91];
-rz(5.23210128134655) q[83];
-cx q[8],q[83];
-rx(6.585311788218899) q[8];
-rz(5.23210128134655) q[86];
-cx q[24],q[86];
-rx(6.585311788218899) q[24];
-rz(5.23210128134655) q[89];
-cx q[5],q[89];
-cx q[5],q[95];
-rz(5.23210128134655) q[91];
-cx q[0],q[91];
-cx q[0],q[93];
-cx q[6],q[91];
-rz(5.23210128134655) q[91];
-cx q[6],q[91];
-rx(6.585311788218899) q[6];
-rx(6.585311788218899) q[91];
-rz(5.23210128134655) q[93];
-cx q[0],q[93];
-rx(6.585311788218899) q[0];
-rz(5.23210128134655) q[94];
-cx q[36],q[94];
-rx(6.585311788218899) q[36];
-cx q[55],q[94];
-rz(5.23210128134655) q[94];
-cx q[55],q[94];
-rx(6.585311788218899) q[55];
-rx(6.585311788218899) q[94];
-rz(5.23210128134655) q[95];
-cx q[5],q[95];
-rx(6.585311788218899) q[5];
-rz(5.23210128134655) q[97];
-cx q[1],q[97];
-rx(6.585311788218899) q[1];
-rz(6.211904807912513) q[100];
-cx q[25],q[100];
-rx(6.020220753415364) q[25];
-cx q[3],q[25];
-rz(5.23210128134655) q[25];
-cx q[3],q[25];
-cx q[3],q[26];
-cx q[12],q[25];
-rz(5.23210128134655) q[25];
-cx q[12],q[25];
-cx q[12],q[31];
-rz(5.23210128134655) q[26];
-cx q[3],q[26];
-cx q[3],q[28];
-cx q[21],q[26];
-rz(5.23210128134655) q[26];
-cx q[21],q[26];
-cx q[21],q[32];
-rz(5.23210128134655) q[28];
-cx q[3],q[28];
-cx q[3],q[29];
-cx q[28],q[51];
-rz(5.23210128134655) q[29];
-cx q[3],q[29];
-cx q[3],q[30];
-rx(6.585311788218899) q[29];
-rz(5.23210128134655) q[30];
-cx q[3],q[30];
-cx q[3],q[34];
-cx q[18],q[30];
-rz(5.23210128134655) q[30];
-cx q[18],q[30];
-rx(6.585311788218899) q[18];
-cx q[30],q[33];
-rz(5.23210128134655) q[31];
-cx q[12],q[31];
-cx q[26],q[31];
-rz(5.23210128134655) q[31];
-cx q[26],q[31];
-rx(6.585311788218899) q[26];
-rx(6.585311788218899) q[31];
-rz(5.23210128134655) q[32];
-cx q[21],q[32];
-cx q[21],q[38];
-rz(5.23210128134655) q[33];
-cx q[30],q[33];
-cx q[30],q[48];
-rx(6.585311788218899) q[33];
-rz(5.23210128134655) q[34];
-cx q[3],q[34];
-cx q[3],q[35];
-cx q[12],q[34];
-rz(5.23210128134655) q[34];
-cx q[12],q[34];
-cx q[34],q[37];
-rz(5.23210128134655) q[35];
-cx q[3],q[35];
-cx q[3],q[39];
-cx q[32],q[35];
-rz(5.23210128134655) q[35];
-cx q[32],q[35];
-cx q[32],q[59];
-rx(6.585311788218899) q[35];
-rz(5.23210128134655) q[37];
-cx q[34],q[37];
-rx(6.585311788218899) q[34];
-cx q[37],q[85];
-rz(5.23210128134655) q[38];
-cx q[21],q[38];
-cx q[21],q[53];
-cx q[38],q[46];
-rz(5.23210128134655) q[39];
-cx q[3],q[39];
-cx q[3],q[40];
-cx q[13],q[39];
-rz(5.23210128134655) q[39];
-cx q[13],q[39];
-cx q[13],q[56];
-rx(6.585311788218899) q[39];
-rz(5.23210128134655) q[40];
-cx q[3],q[40];
-cx q[3],q[42];
-cx q[23],q[40];
-rz(5.23210128134655) q[40];
-cx q[23],q[40];
-cx q[23],q[65];
-rx(6.585311788218899) q[40];
-rz(5.23210128134655) q[42];
-cx q[3],q[42];
-cx q[3],q[43];
-cx q[42],q[78];
-rz(5.23210128134655) q[43];
-cx q[3],q[43];
-cx q[3],q[44];
-cx q[20],q[43];
-rz(5.23210128134655) q[43];
-cx q[20],q[43];
-rx(6.585311788218899) q[20];
-rx(6.585311788218899) q[43];
-rz(5.23210128134655) q[44];
-cx q[3],q[44];
-cx q[3],q[49];
-cx q[12],q[44];
-rz(5.23210128134655) q[44];
-cx q[12],q[44];
-cx q[44],q[72];
-rz(5.23210128134655) q[46];
-cx q[38],q[46];
-rx(6.585311788218899) q[38];
-rx(6.585311788218899) q[46];
-rz(5.23210128134655) q[48];
-cx q[30],q[48];
-rx(6.585311788218899) q[48];
-rz(5.23210128134655) q[49];
-cx q[3],q[49];
-cx q[3],q[50];
-cx q[4],q[49];
-rz(5.23210128134655) q[49];
-cx q[4],q[49];
-cx q[4],q[61];
-rx(6.585311788218899) q[49];
-rz(5.23210128134655) q[50];
-cx q[3],q[50];
-cx q[3],q[52];
-cx q[12],q[50];
-rz(5.23210128134655) q[50];
-cx q[12],q[50];
-cx q[12],q[63];
-cx q[50],q[79];
-rz(5.23210128134655) q[51];
-cx q[28],q[51];
-cx q[28],q[54];
-rx(6.585311788218899) q[51];
-rz(5.23210128134655) q[52];
-cx q[3],q[52];
-cx q[3],q[57];
-cx q[10],q[52];
-rz(5.23210128134655) q[52];
-cx q[10],q[52];
-cx q[10],q[64];
-rx(6.585311788218899) q[52];
-rz(5.23210128134655) q[53];
-cx q[21],q[53];
-cx q[21],q[75];
-rz(5.23210128134655) q[54];
-cx q[28],q[54];
-cx q[28],q[58];
-rx(6.585311788218899) q[54];
-rz(5.23210128134655) q[56];
-cx q[13],q[56];
-cx q[13],q[68];
-cx q[45],q[56];
-rz(5.23210128134655) q[56];
-cx q[45],q[56];
-rx(6.585311788218899) q[45];
-cx q[56],q[67];
-rz(5.23210128134655) q[57];
-cx q[3],q[57];
-cx q[3],q[70];
-rx(6.585311788218899) q[57];
-rz(5.23210128134655) q[58];
-cx q[28],q[58];
-cx q[28],q[87];
-rx(6.585311788218899) q[58];
-rz(5.23210128134655) q[59];
-cx q[32],q[59];
-cx q[59],q[69];
-rz(5.23210128134655) q[61];
-cx q[4],q[61];
-cx q[4],q[99];
-cx q[7],q[61];
-rz(5.23210128134655) q[61];
-cx q[7],q[61];
-cx q[7],q[97];
-rx(6.585311788218899) q[61];
-rz(5.23210128134655) q[63];
-cx q[12],q[63];
-rx(6.585311788218899) q[12];
-cx q[17],q[63];
-rz(5.23210128134655) q[63];
-cx q[17],q[63];
-cx q[17],q[66];
-rz(5.23210128134655) q[64];
-cx q[10],q[64];
-cx q[10],q[98];
-rx(6.585311788218899) q[64];
-rz(5.23210128134655) q[65];
-cx q[23],q[65];
-rx(6.585311788218899) q[23];
-rx(6.585311788218899) q[65];
-rz(5.23210128134655) q[66];
-cx q[17],q[66];
-rx(6.585311788218899) q[17];
-cx q[47],q[66];
-rz(5.23210128134655) q[66];
-cx q[47],q[66];
-rx(6.585311788218899) q[47];
-rx(6.585311788218899) q[66];
-rz(5.23210128134655) q[67];
-cx q[56],q[67];
-cx q[56],q[74];
-rx(6.585311788218899) q[67];
-rz(5.23210128134655) q[68];
-cx q[13],q[68];
-rx(6.585311788218899) q[13];
-cx q[32],q[68];
-rz(5.23210128134655) q[68];
-cx q[32],q[68];
-cx q[68],q[83];
-rz(5.23210128134655) q[69];
-cx q[59],q[69];
-cx q[59],q[73];
-rx(6.585311788218899) q[69];
-rz(5.23210128134655) q[70];
-cx q[3],q[70];
-cx q[3],q[71];
-cx q[15],q[70];
-rz(5.23210128134655) q[70];
-cx q[15],q[70];
-cx q[15],q[80];
-cx q[70],q[84];
-rz(5.23210128134655) q[71];
-cx q[3],q[71];
-cx q[3],q[77];
-cx q[53],q[71];
-rz(5.23210128134655) q[71];
-cx q[53],q[71];
-cx q[53],q[86];
-rx(6.585311788218899) q[71];
-rz(5.23210128134655) q[72];
-cx q[44],q[72];
-rx(6.585311788218899) q[44];
-rx(6.585311788218899) q[72];
-rz(5.23210128134655) q[73];
-cx q[59],q[73];
-rz(5.23210128134655) q[74];
-cx q[56],q[74];
-cx q[56],q[82];
-cx q[63],q[74];
-rz(5.23210128134655) q[74];
-cx q[63],q[74];
-rx(6.585311788218899) q[63];
-rx(6.585311788218899) q[74];
-rz(5.23210128134655) q[75];
-cx q[21],q[75];
-cx q[21],q[81];
-rx(6.585311788218899) q[75];
-rz(5.23210128134655) q[77];
-cx q[3],q[77];
-cx q[3],q[88];
-cx q[30],q[77];
-rz(5.23210128134655) q[77];
-cx q[30],q[77];
-rx(6.585311788218899) q[30];
-rz(5.23210128134655) q[78];
-cx q[42],q[78];
-rx(6.585311788218899) q[42];
-cx q[60],q[78];
-rz(5.23210128134655) q[78];
-cx q[60],q[78];
-rx(6.585311788218899) q[78];
-rz(5.23210128134655) q[79];
-cx q[50],q[79];
-rx(6.585311788218899) q[50];
-rx(6.585311788218899) q[79];
-rz(5.23210128134655) q[80];
-cx q[15],q[80];
-cx q[15],q[90];
-rx(6.585311788218899) q[80];
-rz(5.23210128134655) q[81];
-cx q[21],q[81];
-cx q[77],q[81];
-rz(5.23210128134655) q[81];
-cx q[77],q[81];
-rx(6.585311788218899) q[77];
-rx(6.585311788218899) q[81];
-rz(5.23210128134655) q[82];
-cx q[56],q[82];
-cx q[56],q[96];
-rx(6.585311788218899) q[82];
-rz(5.23210128134655) q[83];
-cx q[68],q[83];
-rx(6.585311788218899) q[68];
-rx(6.585311788218899) q[83];
-rz(5.23210128134655) q[84];
-cx q[70],q[84];
-rx(6.585311788218899) q[70];
-cx q[73],q[84];
-rz(5.23210128134655) q[84];
-cx q[73],q[84];
-rx(6.585311788218899) q[73];
-rx(6.585311788218899) q[84];
-rz(5.23210128134655) q[85];
-cx q[37],q[85];
-rx(6.585311788218899) q[37];
-cx q[59],q[85];
-rz(5.23210128134655) q[85];
-cx q[59],q[85];
-rx(6.585311788218899) q[59];
-rx(6.585311788218899) q[85];
-rz(5.23210128134655) q[86];
-cx q[53],q[86];
-rx(6.585311788218899) q[53];
-rx(6.585311788218899) q[86];
-rz(5.23210128134655) q[87];
-cx q[28],q[87];
-rx(6.585311788218899) q[28];
-cx q[32],q[87];
-rz(5.23210128134655) q[87];
-cx q[32],q[87];
-cx q[32],q[93];
-rx(6.585311788218899) q[87];
-rz(5.23210128134655) q[88];
-cx q[3],q[88];
-cx q[60],q[88];
-rz(5.23210128134655) q[88];
-cx q[60],q[88];
-rx(6.585311788218899) q[60];
-rx(6.585311788218899) q[88];
-rz(5.23210128134655) q[90];
-cx q[15],q[90];
-cx q[15],q[92];
-cx q[27],q[90];
-rz(5.23210128134655) q[90];
-cx q[27],q[90];
-cx q[27],q[95];
-rx(6.585311788218899) q[90];
-rz(5.23210128134655) q[92];
-cx q[15],q[92];
-rx(6.585311788218899) q[15];
-cx q[89],q[92];
-rz(5.23210128134655) q[92];
-cx q[89],q[92];
-rx(6.585311788218899) q[89];
-rz(5.23210128134655) q[93];
-cx q[32],q[93];
-rx(6.585311788218899) q[32];
-rx(6.585311788218899) q[93];
-rz(5.23210128134655) q[95];
-cx q[27],q[95];
-rx(6.585311788218899) q[27];
-rx(6.585311788218899) q[95];
-rz(5.23210128134655) q[96];
-cx q[56],q[96];
-rx(6.585311788218899) q[56];
-cx q[92],q[96];
-rz(5.23210128134655) q[96];
-cx q[92],q[96];
-rx(6.585311788218899) q[92];
-rx(6.585311788218899) q[96];
-rz(5.23210128134655) q[97];
-cx q[7],q[97];
-rx(6.585311788218899) q[7];
-rx(6.585311788218899) q[97];
-rz(5.23210128134655) q[98];
-cx q[10],q[98];
-rx(6.585311788218899) q[10];
-cx q[21],q[98];
-rz(5.23210128134655) q[98];
-cx q[21],q[98];
-rx(6.585311788218899) q[21];
-rx(6.585311788218899) q[98];
-rz(5.23210128134655) q[99];
-cx q[4],q[99];
-rx(6.585311788218899) q[4];
-cx q[41],q[99];
-rz(5.23210128134655) q[99];
-cx q[41],q[99];
-rx(6.585311788218899) q[41];
-rx(6.585311788218899) q[99];
-rx(6.020220753415364) q[100];
-cx q[3],q[100];
-rz(5.23210128134655) q[100];
-cx q[3],q[100];
-rx(6.585311788218899) q[3];
-cx q[25],q[100];
-rz(5.23210128134655) q[100];
-cx q[25],q[100];
-rx(6.585311788218899) q[25];
-rx(6.585311788218899) q[100];
\ No newline at end of file
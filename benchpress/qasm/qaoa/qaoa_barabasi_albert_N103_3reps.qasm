@@ -1,2336 +0,0 @@
-OPENQASM 2.0;
-include "qelib1.inc";
-qreg q[103];
-ry(pi/2) q[0];
-rx(pi) q[0];
-ry(pi/2) q[1];
-rx(pi) q[1];
-cx q[0],q[1];
-rz(0.01912545426534473) q[1];
-cx q[0],q[1];
-ry(pi/2) q[2];
-rx(pi) q[2];
-cx q[0],q[2];
-rz(0.01912545426534473) q[2];
-cx q[0],q[2];
-ry(pi/2) q[3];
-rx(pi) q[3];
-cx q[0],q[3];
-rz(0.01912545426534473) q[3];
-cx q[0],q[3];
-cx q[1],q[3];
-rz(0.01912545426534473) q[3];
-cx q[1],q[3];
-ry(pi/2) q[4];
-rx(pi) q[4];
-cx q[1],q[4];
-rz(0.01912545426534473) q[4];
-cx q[1],q[4];
-cx q[3],q[4];
-rz(0.01912545426534473) q[4];
-cx q[3],q[4];
-ry(pi/2) q[5];
-rx(pi) q[5];
-cx q[1],q[5];
-rz(0.01912545426534473) q[5];
-cx q[1],q[5];
-cx q[3],q[5];
-rz(0.01912545426534473) q[5];
-cx q[3],q[5];
-ry(pi/2) q[6];
-rx(pi) q[6];
-cx q[4],q[6];
-rz(0.01912545426534473) q[6];
-cx q[4],q[6];
-cx q[5],q[6];
-rz(0.01912545426534473) q[6];
-cx q[5],q[6];
-ry(pi/2) q[7];
-rx(pi) q[7];
-cx q[3],q[7];
-rz(0.01912545426534473) q[7];
-cx q[3],q[7];
-cx q[4],q[7];
-rz(0.01912545426534473) q[7];
-cx q[4],q[7];
-ry(pi/2) q[8];
-rx(pi) q[8];
-cx q[3],q[8];
-rz(0.01912545426534473) q[8];
-cx q[3],q[8];
-cx q[5],q[8];
-rz(0.01912545426534473) q[8];
-cx q[5],q[8];
-ry(pi/2) q[9];
-rx(pi) q[9];
-cx q[1],q[9];
-rz(0.01912545426534473) q[9];
-cx q[1],q[9];
-cx q[3],q[9];
-rz(0.01912545426534473) q[9];
-cx q[3],q[9];
-ry(pi/2) q[10];
-rx(pi) q[10];
-cx q[4],q[10];
-rz(0.01912545426534473) q[10];
-cx q[4],q[10];
-cx q[6],q[10];
-rz(0.01912545426534473) q[10];
-cx q[6],q[10];
-ry(pi/2) q[11];
-rx(pi) q[11];
-cx q[5],q[11];
-rz(0.01912545426534473) q[11];
-cx q[5],q[11];
-cx q[6],q[11];
-rz(0.01912545426534473) q[11];
-cx q[6],q[11];
-rx(8.211955033045463) q[11];
-ry(pi/2) q[12];
-rx(pi) q[12];
-cx q[3],q[12];
-rz(0.01912545426534473) q[12];
-cx q[3],q[12];
-cx q[5],q[12];
-rz(0.01912545426534473) q[12];
-cx q[5],q[12];
-ry(pi/2) q[13];
-rx(pi) q[13];
-cx q[4],q[13];
-rz(0.01912545426534473) q[13];
-cx q[4],q[13];
-cx q[5],q[13];
-rz(0.01912545426534473) q[13];
-cx q[5],q[13];
-ry(pi/2) q[14];
-rx(pi) q[14];
-cx q[3],q[14];
-rz(0.01912545426534473) q[14];
-cx q[3],q[14];
-cx q[4],q[14];
-rz(0.01912545426534473) q[14];
-cx q[4],q[14];
-rx(8.211955033045463) q[14];
-ry(pi/2) q[15];
-rx(pi) q[15];
-cx q[0],q[15];
-rz(0.01912545426534473) q[15];
-cx q[0],q[15];
-cx q[3],q[15];
-rz(0.01912545426534473) q[15];
-cx q[3],q[15];
-ry(pi/2) q[16];
-rx(pi) q[16];
-cx q[0],q[16];
-rz(0.01912545426534473) q[16];
-cx q[0],q[16];
-cx q[3],q[16];
-rz(0.01912545426534473) q[16];
-cx q[3],q[16];
-ry(pi/2) q[17];
-rx(pi) q[17];
-cx q[1],q[17];
-rz(0.01912545426534473) q[17];
-cx q[1],q[17];
-cx q[3],q[17];
-rz(0.01912545426534473) q[17];
-cx q[3],q[17];
-ry(pi/2) q[18];
-rx(pi) q[18];
-cx q[3],q[18];
-rz(0.01912545426534473) q[18];
-cx q[3],q[18];
-cx q[4],q[18];
-rz(0.01912545426534473) q[18];
-cx q[4],q[18];
-ry(pi/2) q[19];
-rx(pi) q[19];
-cx q[3],q[19];
-rz(0.01912545426534473) q[19];
-cx q[3],q[19];
-cx q[7],q[19];
-rz(0.01912545426534473) q[19];
-cx q[7],q[19];
-ry(pi/2) q[20];
-rx(pi) q[20];
-cx q[0],q[20];
-rz(0.01912545426534473) q[20];
-cx q[0],q[20];
-cx q[15],q[20];
-rz(0.01912545426534473) q[20];
-cx q[15],q[20];
-ry(pi/2) q[21];
-rx(pi) q[21];
-cx q[4],q[21];
-rz(0.01912545426534473) q[21];
-cx q[4],q[21];
-cx q[15],q[21];
-rz(0.01912545426534473) q[21];
-cx q[15],q[21];
-ry(pi/2) q[22];
-rx(pi) q[22];
-cx q[3],q[22];
-rz(0.01912545426534473) q[22];
-cx q[3],q[22];
-cx q[9],q[22];
-rz(0.01912545426534473) q[22];
-cx q[9],q[22];
-rx(8.211955033045463) q[22];
-ry(pi/2) q[23];
-rx(pi) q[23];
-cx q[3],q[23];
-rz(0.01912545426534473) q[23];
-cx q[3],q[23];
-cx q[17],q[23];
-rz(0.01912545426534473) q[23];
-cx q[17],q[23];
-ry(pi/2) q[24];
-rx(pi) q[24];
-cx q[3],q[24];
-rz(0.01912545426534473) q[24];
-cx q[3],q[24];
-cx q[5],q[24];
-rz(0.01912545426534473) q[24];
-cx q[5],q[24];
-ry(pi/2) q[25];
-rx(pi) q[25];
-cx q[3],q[25];
-rz(0.01912545426534473) q[25];
-cx q[3],q[25];
-cx q[12],q[25];
-rz(0.01912545426534473) q[25];
-cx q[12],q[25];
-ry(pi/2) q[26];
-rx(pi) q[26];
-cx q[3],q[26];
-rz(0.01912545426534473) q[26];
-cx q[3],q[26];
-cx q[21],q[26];
-rz(0.01912545426534473) q[26];
-cx q[21],q[26];
-ry(pi/2) q[27];
-rx(pi) q[27];
-cx q[4],q[27];
-rz(0.01912545426534473) q[27];
-cx q[4],q[27];
-cx q[6],q[27];
-rz(0.01912545426534473) q[27];
-cx q[6],q[27];
-ry(pi/2) q[28];
-rx(pi) q[28];
-cx q[1],q[28];
-rz(0.01912545426534473) q[28];
-cx q[1],q[28];
-cx q[3],q[28];
-rz(0.01912545426534473) q[28];
-cx q[3],q[28];
-ry(pi/2) q[29];
-rx(pi) q[29];
-cx q[1],q[29];
-rz(0.01912545426534473) q[29];
-cx q[1],q[29];
-cx q[3],q[29];
-rz(0.01912545426534473) q[29];
-cx q[3],q[29];
-rx(8.211955033045463) q[29];
-ry(pi/2) q[30];
-rx(pi) q[30];
-cx q[3],q[30];
-rz(0.01912545426534473) q[30];
-cx q[3],q[30];
-cx q[18],q[30];
-rz(0.01912545426534473) q[30];
-cx q[18],q[30];
-rx(8.211955033045463) q[18];
-ry(pi/2) q[31];
-rx(pi) q[31];
-cx q[12],q[31];
-rz(0.01912545426534473) q[31];
-cx q[12],q[31];
-cx q[26],q[31];
-rz(0.01912545426534473) q[31];
-cx q[26],q[31];
-rx(8.211955033045463) q[26];
-rx(8.211955033045463) q[31];
-ry(pi/2) q[32];
-rx(pi) q[32];
-cx q[0],q[32];
-rz(0.01912545426534473) q[32];
-cx q[0],q[32];
-cx q[21],q[32];
-rz(0.01912545426534473) q[32];
-cx q[21],q[32];
-ry(pi/2) q[33];
-rx(pi) q[33];
-cx q[5],q[33];
-rz(0.01912545426534473) q[33];
-cx q[5],q[33];
-cx q[30],q[33];
-rz(0.01912545426534473) q[33];
-cx q[30],q[33];
-rx(8.211955033045463) q[33];
-ry(pi/2) q[34];
-rx(pi) q[34];
-cx q[3],q[34];
-rz(0.01912545426534473) q[34];
-cx q[3],q[34];
-cx q[12],q[34];
-rz(0.01912545426534473) q[34];
-cx q[12],q[34];
-ry(pi/2) q[35];
-rx(pi) q[35];
-cx q[3],q[35];
-rz(0.01912545426534473) q[35];
-cx q[3],q[35];
-cx q[32],q[35];
-rz(0.01912545426534473) q[35];
-cx q[32],q[35];
-rx(8.211955033045463) q[35];
-ry(pi/2) q[36];
-rx(pi) q[36];
-cx q[15],q[36];
-rz(0.01912545426534473) q[36];
-cx q[15],q[36];
-cx q[20],q[36];
-rz(0.01912545426534473) q[36];
-cx q[20],q[36];
-ry(pi/2) q[37];
-rx(pi) q[37];
-cx q[10],q[37];
-rz(0.01912545426534473) q[37];
-cx q[10],q[37];
-cx q[34],q[37];
-rz(0.01912545426534473) q[37];
-cx q[34],q[37];
-rx(8.211955033045463) q[34];
-ry(pi/2) q[38];
-rx(pi) q[38];
-cx q[19],q[38];
-rz(0.01912545426534473) q[38];
-cx q[19],q[38];
-rx(8.211955033045463) q[19];
-cx q[21],q[38];
-rz(0.01912545426534473) q[38];
-cx q[21],q[38];
-ry(pi/2) q[39];
-rx(pi) q[39];
-cx q[3],q[39];
-rz(0.01912545426534473) q[39];
-cx q[3],q[39];
-cx q[13],q[39];
-rz(0.01912545426534473) q[39];
-cx q[13],q[39];
-rx(8.211955033045463) q[39];
-ry(pi/2) q[40];
-rx(pi) q[40];
-cx q[3],q[40];
-rz(0.01912545426534473) q[40];
-cx q[3],q[40];
-cx q[23],q[40];
-rz(0.01912545426534473) q[40];
-cx q[23],q[40];
-rx(8.211955033045463) q[40];
-ry(pi/2) q[41];
-rx(pi) q[41];
-cx q[10],q[41];
-rz(0.01912545426534473) q[41];
-cx q[10],q[41];
-cx q[27],q[41];
-rz(0.01912545426534473) q[41];
-cx q[27],q[41];
-ry(pi/2) q[42];
-rx(pi) q[42];
-cx q[0],q[42];
-rz(0.01912545426534473) q[42];
-cx q[0],q[42];
-cx q[3],q[42];
-rz(0.01912545426534473) q[42];
-cx q[3],q[42];
-ry(pi/2) q[43];
-rx(pi) q[43];
-cx q[3],q[43];
-rz(0.01912545426534473) q[43];
-cx q[3],q[43];
-cx q[20],q[43];
-rz(0.01912545426534473) q[43];
-cx q[20],q[43];
-rx(8.211955033045463) q[20];
-rx(8.211955033045463) q[43];
-ry(pi/2) q[44];
-rx(pi) q[44];
-cx q[3],q[44];
-rz(0.01912545426534473) q[44];
-cx q[3],q[44];
-cx q[12],q[44];
-rz(0.01912545426534473) q[44];
-cx q[12],q[44];
-ry(pi/2) q[45];
-rx(pi) q[45];
-cx q[1],q[45];
-rz(0.01912545426534473) q[45];
-cx q[1],q[45];
-cx q[16],q[45];
-rz(0.01912545426534473) q[45];
-cx q[16],q[45];
-ry(pi/2) q[46];
-rx(pi) q[46];
-cx q[5],q[46];
-rz(0.01912545426534473) q[46];
-cx q[5],q[46];
-cx q[38],q[46];
-rz(0.01912545426534473) q[46];
-cx q[38],q[46];
-rx(8.211955033045463) q[38];
-rx(8.211955033045463) q[46];
-ry(pi/2) q[47];
-rx(pi) q[47];
-cx q[4],q[47];
-rz(0.01912545426534473) q[47];
-cx q[4],q[47];
-cx q[17],q[47];
-rz(0.01912545426534473) q[47];
-cx q[17],q[47];
-ry(pi/2) q[48];
-rx(pi) q[48];
-cx q[0],q[48];
-rz(0.01912545426534473) q[48];
-cx q[0],q[48];
-cx q[30],q[48];
-rz(0.01912545426534473) q[48];
-cx q[30],q[48];
-rx(8.211955033045463) q[48];
-ry(pi/2) q[49];
-rx(pi) q[49];
-cx q[3],q[49];
-rz(0.01912545426534473) q[49];
-cx q[3],q[49];
-cx q[4],q[49];
-rz(0.01912545426534473) q[49];
-cx q[4],q[49];
-rx(8.211955033045463) q[49];
-ry(pi/2) q[50];
-rx(pi) q[50];
-cx q[3],q[50];
-rz(0.01912545426534473) q[50];
-cx q[3],q[50];
-cx q[12],q[50];
-rz(0.01912545426534473) q[50];
-cx q[12],q[50];
-ry(pi/2) q[51];
-rx(pi) q[51];
-cx q[0],q[51];
-rz(0.01912545426534473) q[51];
-cx q[0],q[51];
-cx q[28],q[51];
-rz(0.01912545426534473) q[51];
-cx q[28],q[51];
-rx(8.211955033045463) q[51];
-ry(pi/2) q[52];
-rx(pi) q[52];
-cx q[3],q[52];
-rz(0.01912545426534473) q[52];
-cx q[3],q[52];
-cx q[10],q[52];
-rz(0.01912545426534473) q[52];
-cx q[10],q[52];
-rx(8.211955033045463) q[52];
-ry(pi/2) q[53];
-rx(pi) q[53];
-cx q[17],q[53];
-rz(0.01912545426534473) q[53];
-cx q[17],q[53];
-cx q[21],q[53];
-rz(0.01912545426534473) q[53];
-cx q[21],q[53];
-ry(pi/2) q[54];
-rx(pi) q[54];
-cx q[24],q[54];
-rz(0.01912545426534473) q[54];
-cx q[24],q[54];
-cx q[28],q[54];
-rz(0.01912545426534473) q[54];
-cx q[28],q[54];
-rx(8.211955033045463) q[54];
-ry(pi/2) q[55];
-rx(pi) q[55];
-cx q[9],q[55];
-rz(0.01912545426534473) q[55];
-cx q[9],q[55];
-cx q[15],q[55];
-rz(0.01912545426534473) q[55];
-cx q[15],q[55];
-ry(pi/2) q[56];
-rx(pi) q[56];
-cx q[13],q[56];
-rz(0.01912545426534473) q[56];
-cx q[13],q[56];
-cx q[45],q[56];
-rz(0.01912545426534473) q[56];
-cx q[45],q[56];
-rx(8.211955033045463) q[45];
-ry(pi/2) q[57];
-rx(pi) q[57];
-cx q[1],q[57];
-rz(0.01912545426534473) q[57];
-cx q[1],q[57];
-cx q[3],q[57];
-rz(0.01912545426534473) q[57];
-cx q[3],q[57];
-rx(8.211955033045463) q[57];
-ry(pi/2) q[58];
-rx(pi) q[58];
-cx q[24],q[58];
-rz(0.01912545426534473) q[58];
-cx q[24],q[58];
-cx q[28],q[58];
-rz(0.01912545426534473) q[58];
-cx q[28],q[58];
-rx(8.211955033045463) q[58];
-ry(pi/2) q[59];
-rx(pi) q[59];
-cx q[16],q[59];
-rz(0.01912545426534473) q[59];
-cx q[16],q[59];
-cx q[32],q[59];
-rz(0.01912545426534473) q[59];
-cx q[32],q[59];
-ry(pi/2) q[60];
-rx(pi) q[60];
-cx q[1],q[60];
-rz(0.01912545426534473) q[60];
-cx q[1],q[60];
-cx q[7],q[60];
-rz(0.01912545426534473) q[60];
-cx q[7],q[60];
-ry(pi/2) q[61];
-rx(pi) q[61];
-cx q[4],q[61];
-rz(0.01912545426534473) q[61];
-cx q[4],q[61];
-cx q[7],q[61];
-rz(0.01912545426534473) q[61];
-cx q[7],q[61];
-rx(8.211955033045463) q[61];
-ry(pi/2) q[62];
-rx(pi) q[62];
-cx q[0],q[62];
-rz(0.01912545426534473) q[62];
-cx q[0],q[62];
-cx q[17],q[62];
-rz(0.01912545426534473) q[62];
-cx q[17],q[62];
-rx(8.211955033045463) q[62];
-ry(pi/2) q[63];
-rx(pi) q[63];
-cx q[12],q[63];
-rz(0.01912545426534473) q[63];
-cx q[12],q[63];
-rx(8.211955033045463) q[12];
-cx q[17],q[63];
-rz(0.01912545426534473) q[63];
-cx q[17],q[63];
-ry(pi/2) q[64];
-rx(pi) q[64];
-cx q[0],q[64];
-rz(0.01912545426534473) q[64];
-cx q[0],q[64];
-cx q[10],q[64];
-rz(0.01912545426534473) q[64];
-cx q[10],q[64];
-rx(8.211955033045463) q[64];
-ry(pi/2) q[65];
-rx(pi) q[65];
-cx q[5],q[65];
-rz(0.01912545426534473) q[65];
-cx q[5],q[65];
-cx q[23],q[65];
-rz(0.01912545426534473) q[65];
-cx q[23],q[65];
-rx(8.211955033045463) q[23];
-rx(8.211955033045463) q[65];
-ry(pi/2) q[66];
-rx(pi) q[66];
-cx q[17],q[66];
-rz(0.01912545426534473) q[66];
-cx q[17],q[66];
-rx(8.211955033045463) q[17];
-cx q[47],q[66];
-rz(0.01912545426534473) q[66];
-cx q[47],q[66];
-rx(8.211955033045463) q[47];
-rx(8.211955033045463) q[66];
-ry(pi/2) q[67];
-rx(pi) q[67];
-cx q[41],q[67];
-rz(0.01912545426534473) q[67];
-cx q[41],q[67];
-cx q[56],q[67];
-rz(0.01912545426534473) q[67];
-cx q[56],q[67];
-rx(8.211955033045463) q[67];
-ry(pi/2) q[68];
-rx(pi) q[68];
-cx q[13],q[68];
-rz(0.01912545426534473) q[68];
-cx q[13],q[68];
-rx(8.211955033045463) q[13];
-cx q[32],q[68];
-rz(0.01912545426534473) q[68];
-cx q[32],q[68];
-ry(pi/2) q[69];
-rx(pi) q[69];
-cx q[6],q[69];
-rz(0.01912545426534473) q[69];
-cx q[6],q[69];
-cx q[59],q[69];
-rz(0.01912545426534473) q[69];
-cx q[59],q[69];
-rx(8.211955033045463) q[69];
-ry(pi/2) q[70];
-rx(pi) q[70];
-cx q[3],q[70];
-rz(0.01912545426534473) q[70];
-cx q[3],q[70];
-cx q[15],q[70];
-rz(0.01912545426534473) q[70];
-cx q[15],q[70];
-ry(pi/2) q[71];
-rx(pi) q[71];
-cx q[3],q[71];
-rz(0.01912545426534473) q[71];
-cx q[3],q[71];
-cx q[53],q[71];
-rz(0.01912545426534473) q[71];
-cx q[53],q[71];
-rx(8.211955033045463) q[71];
-ry(pi/2) q[72];
-rx(pi) q[72];
-cx q[27],q[72];
-rz(0.01912545426534473) q[72];
-cx q[27],q[72];
-cx q[44],q[72];
-rz(0.01912545426534473) q[72];
-cx q[44],q[72];
-rx(8.211955033045463) q[44];
-rx(8.211955033045463) q[72];
-ry(pi/2) q[73];
-rx(pi) q[73];
-cx q[16],q[73];
-rz(0.01912545426534473) q[73];
-cx q[16],q[73];
-cx q[59],q[73];
-rz(0.01912545426534473) q[73];
-cx q[59],q[73];
-ry(pi/2) q[74];
-rx(pi) q[74];
-cx q[56],q[74];
-rz(0.01912545426534473) q[74];
-cx q[56],q[74];
-cx q[63],q[74];
-rz(0.01912545426534473) q[74];
-cx q[63],q[74];
-rx(8.211955033045463) q[63];
-rx(8.211955033045463) q[74];
-ry(pi/2) q[75];
-rx(pi) q[75];
-cx q[0],q[75];
-rz(0.01912545426534473) q[75];
-cx q[0],q[75];
-cx q[21],q[75];
-rz(0.01912545426534473) q[75];
-cx q[21],q[75];
-rx(8.211955033045463) q[75];
-ry(pi/2) q[76];
-rx(pi) q[76];
-cx q[5],q[76];
-rz(0.01912545426534473) q[76];
-cx q[5],q[76];
-cx q[6],q[76];
-rz(0.01912545426534473) q[76];
-cx q[6],q[76];
-rx(8.211955033045463) q[76];
-ry(pi/2) q[77];
-rx(pi) q[77];
-cx q[3],q[77];
-rz(0.01912545426534473) q[77];
-cx q[3],q[77];
-cx q[30],q[77];
-rz(0.01912545426534473) q[77];
-cx q[30],q[77];
-rx(8.211955033045463) q[30];
-ry(pi/2) q[78];
-rx(pi) q[78];
-cx q[42],q[78];
-rz(0.01912545426534473) q[78];
-cx q[42],q[78];
-rx(8.211955033045463) q[42];
-cx q[60],q[78];
-rz(0.01912545426534473) q[78];
-cx q[60],q[78];
-rx(8.211955033045463) q[78];
-ry(pi/2) q[79];
-rx(pi) q[79];
-cx q[6],q[79];
-rz(0.01912545426534473) q[79];
-cx q[6],q[79];
-cx q[50],q[79];
-rz(0.01912545426534473) q[79];
-cx q[50],q[79];
-rx(8.211955033045463) q[79];
-ry(pi/2) q[80];
-rx(pi) q[80];
-cx q[9],q[80];
-rz(0.01912545426534473) q[80];
-cx q[9],q[80];
-rx(8.211955033045463) q[9];
-cx q[15],q[80];
-rz(0.01912545426534473) q[80];
-cx q[15],q[80];
-rx(8.211955033045463) q[80];
-ry(pi/2) q[81];
-rx(pi) q[81];
-cx q[21],q[81];
-rz(0.01912545426534473) q[81];
-cx q[21],q[81];
-cx q[77],q[81];
-rz(0.01912545426534473) q[81];
-cx q[77],q[81];
-rx(8.211955033045463) q[77];
-rx(8.211955033045463) q[81];
-ry(pi/2) q[82];
-rx(pi) q[82];
-cx q[0],q[82];
-rz(0.01912545426534473) q[82];
-cx q[0],q[82];
-cx q[56],q[82];
-rz(0.01912545426534473) q[82];
-cx q[56],q[82];
-rx(8.211955033045463) q[82];
-ry(pi/2) q[83];
-rx(pi) q[83];
-cx q[8],q[83];
-rz(0.01912545426534473) q[83];
-cx q[8],q[83];
-rx(8.211955033045463) q[8];
-cx q[68],q[83];
-rz(0.01912545426534473) q[83];
-cx q[68],q[83];
-rx(8.211955033045463) q[68];
-rx(8.211955033045463) q[83];
-ry(pi/2) q[84];
-rx(pi) q[84];
-cx q[70],q[84];
-rz(0.01912545426534473) q[84];
-cx q[70],q[84];
-rx(8.211955033045463) q[70];
-cx q[73],q[84];
-rz(0.01912545426534473) q[84];
-cx q[73],q[84];
-rx(8.211955033045463) q[73];
-rx(8.211955033045463) q[84];
-ry(pi/2) q[85];
-rx(pi) q[85];
-cx q[37],q[85];
-rz(0.01912545426534473) q[85];
-cx q[37],q[85];
-rx(8.211955033045463) q[37];
-cx q[59],q[85];
-rz(0.01912545426534473) q[85];
-cx q[59],q[85];
-rx(8.211955033045463) q[59];
-rx(8.211955033045463) q[85];
-ry(pi/2) q[86];
-rx(pi) q[86];
-cx q[24],q[86];
-rz(0.01912545426534473) q[86];
-cx q[24],q[86];
-rx(8.211955033045463) q[24];
-cx q[53],q[86];
-rz(0.01912545426534473) q[86];
-cx q[53],q[86];
-rx(8.211955033045463) q[53];
-rx(8.211955033045463) q[86];
-ry(pi/2) q[87];
-rx(pi) q[87];
-cx q[28],q[87];
-rz(0.01912545426534473) q[87];
-cx q[28],q[87];
-rx(8.211955033045463) q[28];
-cx q[32],q[87];
-rz(0.01912545426534473) q[87];
-cx q[32],q[87];
-rx(8.211955033045463) q[87];
-ry(pi/2) q[88];
-rx(pi) q[88];
-cx q[3],q[88];
-rz(0.01912545426534473) q[88];
-cx q[3],q[88];
-cx q[60],q[88];
-rz(0.01912545426534473) q[88];
-cx q[60],q[88];
-rx(8.211955033045463) q[60];
-rx(8.211955033045463) q[88];
-ry(pi/2) q[89];
-rx(pi) q[89];
-cx q[2],q[89];
-rz(0.01912545426534473) q[89];
-cx q[2],q[89];
-rx(8.211955033045463) q[2];
-cx q[5],q[89];
-rz(0.01912545426534473) q[89];
-cx q[5],q[89];
-ry(pi/2) q[90];
-rx(pi) q[90];
-cx q[15],q[90];
-rz(0.01912545426534473) q[90];
-cx q[15],q[90];
-cx q[27],q[90];
-rz(0.01912545426534473) q[90];
-cx q[27],q[90];
-rx(8.211955033045463) q[90];
-ry(pi/2) q[91];
-rx(pi) q[91];
-cx q[0],q[91];
-rz(0.01912545426534473) q[91];
-cx q[0],q[91];
-cx q[6],q[91];
-rz(0.01912545426534473) q[91];
-cx q[6],q[91];
-rx(8.211955033045463) q[6];
-rx(8.211955033045463) q[91];
-ry(pi/2) q[92];
-rx(pi) q[92];
-cx q[15],q[92];
-rz(0.01912545426534473) q[92];
-cx q[15],q[92];
-rx(8.211955033045463) q[15];
-cx q[89],q[92];
-rz(0.01912545426534473) q[92];
-cx q[89],q[92];
-rx(8.211955033045463) q[89];
-ry(pi/2) q[93];
-rx(pi) q[93];
-cx q[0],q[93];
-rz(0.01912545426534473) q[93];
-cx q[0],q[93];
-rx(8.211955033045463) q[0];
-cx q[32],q[93];
-rz(0.01912545426534473) q[93];
-cx q[32],q[93];
-rx(8.211955033045463) q[32];
-rx(8.211955033045463) q[93];
-ry(pi/2) q[94];
-rx(pi) q[94];
-cx q[36],q[94];
-rz(0.01912545426534473) q[94];
-cx q[36],q[94];
-rx(8.211955033045463) q[36];
-cx q[55],q[94];
-rz(0.01912545426534473) q[94];
-cx q[55],q[94];
-rx(8.211955033045463) q[55];
-rx(8.211955033045463) q[94];
-ry(pi/2) q[95];
-rx(pi) q[95];
-cx q[5],q[95];
-rz(0.01912545426534473) q[95];
-cx q[5],q[95];
-rx(8.211955033045463) q[5];
-cx q[27],q[95];
-rz(0.01912545426534473) q[95];
-cx q[27],q[95];
-rx(8.211955033045463) q[27];
-rx(8.211955033045463) q[95];
-ry(pi/2) q[96];
-rx(pi) q[96];
-cx q[56],q[96];
-rz(0.01912545426534473) q[96];
-cx q[56],q[96];
-rx(8.211955033045463) q[56];
-cx q[92],q[96];
-rz(0.01912545426534473) q[96];
-cx q[92],q[96];
-rx(8.211955033045463) q[92];
-rx(8.211955033045463) q[96];
-ry(pi/2) q[97];
-rx(pi) q[97];
-cx q[1],q[97];
-rz(0.01912545426534473) q[97];
-cx q[1],q[97];
-rx(8.211955033045463) q[1];
-cx q[0],q[1];
-rz(1.5529786639952434) q[1];
-cx q[0],q[1];
-cx q[0],q[2];
-rz(1.5529786639952434) q[2];
-cx q[0],q[2];
-cx q[2],q[89];
-cx q[7],q[97];
-rz(1.5529786639952434) q[89];
-cx q[2],q[89];
-rx(11.497827390172548) q[2];
-rz(0.01912545426534473) q[97];
-cx q[7],q[97];
-rx(8.211955033045463) q[7];
-rx(8.211955033045463) q[97];
-ry(pi/2) q[98];
-rx(pi) q[98];
-cx q[10],q[98];
-rz(0.01912545426534473) q[98];
-cx q[10],q[98];
-rx(8.211955033045463) q[10];
-cx q[21],q[98];
-rz(0.01912545426534473) q[98];
-cx q[21],q[98];
-rx(8.211955033045463) q[21];
-rx(8.211955033045463) q[98];
-ry(pi/2) q[99];
-rx(pi) q[99];
-cx q[4],q[99];
-rz(0.01912545426534473) q[99];
-cx q[4],q[99];
-cx q[41],q[99];
-rz(0.01912545426534473) q[99];
-cx q[41],q[99];
-rx(8.211955033045463) q[41];
-rx(8.211955033045463) q[99];
-ry(pi/2) q[100];
-rx(pi) q[100];
-cx q[3],q[100];
-rz(0.01912545426534473) q[100];
-cx q[3],q[100];
-cx q[25],q[100];
-rz(0.01912545426534473) q[100];
-cx q[25],q[100];
-rx(8.211955033045463) q[25];
-rx(8.211955033045463) q[100];
-ry(pi/2) q[101];
-rx(pi) q[101];
-cx q[16],q[101];
-rz(0.01912545426534473) q[101];
-cx q[16],q[101];
-rx(8.211955033045463) q[16];
-cx q[50],q[101];
-rz(0.01912545426534473) q[101];
-cx q[50],q[101];
-rx(8.211955033045463) q[50];
-rx(8.211955033045463) q[101];
-ry(pi/2) q[102];
-rx(pi) q[102];
-cx q[3],q[102];
-rz(0.01912545426534473) q[102];
-cx q[3],q[102];
-rx(8.211955033045463) q[3];
-cx q[0],q[3];
-rz(1.5529786639952434) q[3];
-cx q[0],q[3];
-cx q[0],q[15];
-cx q[1],q[3];
-rz(1.5529786639952434) q[3];
-cx q[1],q[3];
-cx q[4],q[102];
-rz(1.5529786639952434) q[15];
-cx q[0],q[15];
-cx q[0],q[16];
-rz(1.5529786639952434) q[16];
-cx q[0],q[16];
-cx q[0],q[20];
-rz(1.5529786639952434) q[20];
-cx q[0],q[20];
-cx q[0],q[32];
-rz(1.5529786639952434) q[32];
-cx q[0],q[32];
-cx q[0],q[42];
-rz(1.5529786639952434) q[42];
-cx q[0],q[42];
-cx q[0],q[48];
-rz(1.5529786639952434) q[48];
-cx q[0],q[48];
-cx q[0],q[51];
-rz(1.5529786639952434) q[51];
-cx q[0],q[51];
-cx q[0],q[62];
-rz(1.5529786639952434) q[62];
-cx q[0],q[62];
-cx q[0],q[64];
-rz(1.5529786639952434) q[64];
-cx q[0],q[64];
-cx q[0],q[75];
-rz(1.5529786639952434) q[75];
-cx q[0],q[75];
-cx q[0],q[82];
-rz(1.5529786639952434) q[82];
-cx q[0],q[82];
-cx q[0],q[91];
-rz(1.5529786639952434) q[91];
-cx q[0],q[91];
-cx q[0],q[93];
-rz(1.5529786639952434) q[93];
-cx q[0],q[93];
-rx(11.497827390172548) q[0];
-rz(0.01912545426534473) q[102];
-cx q[4],q[102];
-rx(8.211955033045463) q[4];
-cx q[1],q[4];
-rz(1.5529786639952434) q[4];
-cx q[1],q[4];
-cx q[1],q[5];
-cx q[3],q[4];
-rz(1.5529786639952434) q[4];
-cx q[3],q[4];
-cx q[4],q[6];
-rz(1.5529786639952434) q[5];
-cx q[1],q[5];
-cx q[1],q[9];
-cx q[3],q[5];
-rz(1.5529786639952434) q[5];
-cx q[3],q[5];
-cx q[3],q[7];
-rz(1.5529786639952434) q[6];
-cx q[4],q[6];
-cx q[5],q[6];
-rz(1.5529786639952434) q[6];
-cx q[5],q[6];
-rz(1.5529786639952434) q[7];
-cx q[3],q[7];
-cx q[3],q[8];
-cx q[4],q[7];
-rz(1.5529786639952434) q[7];
-cx q[4],q[7];
-cx q[4],q[10];
-rz(1.5529786639952434) q[8];
-cx q[3],q[8];
-cx q[5],q[8];
-rz(1.5529786639952434) q[8];
-cx q[5],q[8];
-cx q[5],q[11];
-cx q[8],q[83];
-rz(1.5529786639952434) q[9];
-cx q[1],q[9];
-cx q[1],q[17];
-cx q[3],q[9];
-rz(1.5529786639952434) q[9];
-cx q[3],q[9];
-cx q[3],q[12];
-rz(1.5529786639952434) q[10];
-cx q[4],q[10];
-cx q[4],q[13];
-cx q[6],q[10];
-rz(1.5529786639952434) q[10];
-cx q[6],q[10];
-cx q[10],q[37];
-rz(1.5529786639952434) q[11];
-cx q[5],q[11];
-cx q[6],q[11];
-rz(1.5529786639952434) q[11];
-cx q[6],q[11];
-rx(11.497827390172548) q[11];
-rz(1.5529786639952434) q[12];
-cx q[3],q[12];
-cx q[3],q[14];
-cx q[5],q[12];
-rz(1.5529786639952434) q[12];
-cx q[5],q[12];
-rz(1.5529786639952434) q[13];
-cx q[4],q[13];
-cx q[5],q[13];
-rz(1.5529786639952434) q[13];
-cx q[5],q[13];
-rz(1.5529786639952434) q[14];
-cx q[3],q[14];
-cx q[3],q[15];
-cx q[4],q[14];
-rz(1.5529786639952434) q[14];
-cx q[4],q[14];
-rx(11.497827390172548) q[14];
-rz(1.5529786639952434) q[15];
-cx q[3],q[15];
-cx q[3],q[16];
-cx q[15],q[20];
-rz(1.5529786639952434) q[16];
-cx q[3],q[16];
-rz(1.5529786639952434) q[17];
-cx q[1],q[17];
-cx q[1],q[28];
-cx q[3],q[17];
-rz(1.5529786639952434) q[17];
-cx q[3],q[17];
-cx q[3],q[18];
-rz(1.5529786639952434) q[18];
-cx q[3],q[18];
-cx q[3],q[19];
-cx q[4],q[18];
-rz(1.5529786639952434) q[18];
-cx q[4],q[18];
-cx q[4],q[21];
-rz(1.5529786639952434) q[19];
-cx q[3],q[19];
-cx q[3],q[22];
-cx q[7],q[19];
-rz(1.5529786639952434) q[19];
-cx q[7],q[19];
-cx q[19],q[38];
-rz(1.5529786639952434) q[20];
-cx q[15],q[20];
-rz(1.5529786639952434) q[21];
-cx q[4],q[21];
-cx q[4],q[27];
-cx q[15],q[21];
-rz(1.5529786639952434) q[21];
-cx q[15],q[21];
-cx q[15],q[36];
-rz(1.5529786639952434) q[22];
-cx q[3],q[22];
-cx q[3],q[23];
-cx q[9],q[22];
-rz(1.5529786639952434) q[22];
-cx q[9],q[22];
-cx q[9],q[55];
-rx(11.497827390172548) q[22];
-rz(1.5529786639952434) q[23];
-cx q[3],q[23];
-cx q[3],q[24];
-cx q[17],q[23];
-rz(1.5529786639952434) q[23];
-cx q[17],q[23];
-rz(1.5529786639952434) q[24];
-cx q[3],q[24];
-cx q[3],q[25];
-cx q[5],q[24];
-rz(1.5529786639952434) q[24];
-cx q[5],q[24];
-cx q[5],q[33];
-cx q[24],q[54];
-rz(1.5529786639952434) q[25];
-cx q[3],q[25];
-cx q[3],q[26];
-cx q[12],q[25];
-rz(1.5529786639952434) q[25];
-cx q[12],q[25];
-cx q[12],q[31];
-rz(1.5529786639952434) q[26];
-cx q[3],q[26];
-cx q[21],q[26];
-rz(1.5529786639952434) q[26];
-cx q[21],q[26];
-cx q[21],q[32];
-rz(1.5529786639952434) q[27];
-cx q[4],q[27];
-cx q[4],q[47];
-cx q[6],q[27];
-rz(1.5529786639952434) q[27];
-cx q[6],q[27];
-cx q[6],q[69];
-rz(1.5529786639952434) q[28];
-cx q[1],q[28];
-cx q[1],q[29];
-cx q[3],q[28];
-rz(1.5529786639952434) q[28];
-cx q[3],q[28];
-cx q[28],q[51];
-rz(1.5529786639952434) q[29];
-cx q[1],q[29];
-cx q[1],q[45];
-cx q[3],q[29];
-rz(1.5529786639952434) q[29];
-cx q[3],q[29];
-cx q[3],q[30];
-rx(11.497827390172548) q[29];
-rz(1.5529786639952434) q[30];
-cx q[3],q[30];
-cx q[3],q[34];
-cx q[18],q[30];
-rz(1.5529786639952434) q[30];
-cx q[18],q[30];
-rx(11.497827390172548) q[18];
-rz(1.5529786639952434) q[31];
-cx q[12],q[31];
-cx q[26],q[31];
-rz(1.5529786639952434) q[31];
-cx q[26],q[31];
-rx(11.497827390172548) q[26];
-rx(11.497827390172548) q[31];
-rz(1.5529786639952434) q[32];
-cx q[21],q[32];
-rz(1.5529786639952434) q[33];
-cx q[5],q[33];
-cx q[5],q[46];
-cx q[30],q[33];
-rz(1.5529786639952434) q[33];
-cx q[30],q[33];
-cx q[30],q[48];
-rx(11.497827390172548) q[33];
-rz(1.5529786639952434) q[34];
-cx q[3],q[34];
-cx q[3],q[35];
-cx q[12],q[34];
-rz(1.5529786639952434) q[34];
-cx q[12],q[34];
-rz(1.5529786639952434) q[35];
-cx q[3],q[35];
-cx q[3],q[39];
-cx q[32],q[35];
-rz(1.5529786639952434) q[35];
-cx q[32],q[35];
-rx(11.497827390172548) q[35];
-rz(1.5529786639952434) q[36];
-cx q[15],q[36];
-cx q[20],q[36];
-rz(1.5529786639952434) q[36];
-cx q[20],q[36];
-cx q[36],q[94];
-rz(1.5529786639952434) q[37];
-cx q[10],q[37];
-cx q[10],q[41];
-cx q[34],q[37];
-rz(1.5529786639952434) q[37];
-cx q[34],q[37];
-rx(11.497827390172548) q[34];
-cx q[37],q[85];
-rz(1.5529786639952434) q[38];
-cx q[19],q[38];
-rx(11.497827390172548) q[19];
-cx q[21],q[38];
-rz(1.5529786639952434) q[38];
-cx q[21],q[38];
-rz(1.5529786639952434) q[39];
-cx q[3],q[39];
-cx q[3],q[40];
-cx q[13],q[39];
-rz(1.5529786639952434) q[39];
-cx q[13],q[39];
-cx q[13],q[56];
-rx(11.497827390172548) q[39];
-rz(1.5529786639952434) q[40];
-cx q[3],q[40];
-cx q[3],q[42];
-cx q[23],q[40];
-rz(1.5529786639952434) q[40];
-cx q[23],q[40];
-rx(11.497827390172548) q[40];
-rz(1.5529786639952434) q[41];
-cx q[10],q[41];
-cx q[27],q[41];
-rz(1.5529786639952434) q[41];
-cx q[27],q[41];
-cx q[27],q[72];
-cx q[41],q[67];
-rz(1.5529786639952434) q[42];
-cx q[3],q[42];
-cx q[3],q[43];
-cx q[42],q[78];
-rz(1.5529786639952434) q[43];
-cx q[3],q[43];
-cx q[3],q[44];
-cx q[20],q[43];
-rz(1.5529786639952434) q[43];
-cx q[20],q[43];
-rx(11.497827390172548) q[20];
-rx(11.497827390172548) q[43];
-rz(1.5529786639952434) q[44];
-cx q[3],q[44];
-cx q[3],q[49];
-cx q[12],q[44];
-rz(1.5529786639952434) q[44];
-cx q[12],q[44];
-rz(1.5529786639952434) q[45];
-cx q[1],q[45];
-cx q[1],q[57];
-cx q[16],q[45];
-rz(1.5529786639952434) q[45];
-cx q[16],q[45];
-cx q[16],q[59];
-rz(1.5529786639952434) q[46];
-cx q[5],q[46];
-cx q[5],q[65];
-cx q[38],q[46];
-rz(1.5529786639952434) q[46];
-cx q[38],q[46];
-rx(11.497827390172548) q[38];
-rx(11.497827390172548) q[46];
-rz(1.5529786639952434) q[47];
-cx q[4],q[47];
-cx q[17],q[47];
-rz(1.5529786639952434) q[47];
-cx q[17],q[47];
-cx q[17],q[53];
-rz(1.5529786639952434) q[48];
-cx q[30],q[48];
-rx(11.497827390172548) q[48];
-rz(1.5529786639952434) q[49];
-cx q[3],q[49];
-cx q[3],q[50];
-cx q[4],q[49];
-rz(1.5529786639952434) q[49];
-cx q[4],q[49];
-cx q[4],q[61];
-rx(11.497827390172548) q[49];
-rz(1.5529786639952434) q[50];
-cx q[3],q[50];
-cx q[3],q[52];
-cx q[12],q[50];
-rz(1.5529786639952434) q[50];
-cx q[12],q[50];
-cx q[12],q[63];
-rz(1.5529786639952434) q[51];
-cx q[28],q[51];
-rx(11.497827390172548) q[51];
-rz(1.5529786639952434) q[52];
-cx q[3],q[52];
-cx q[10],q[52];
-rz(1.5529786639952434) q[52];
-cx q[10],q[52];
-cx q[10],q[64];
-rx(11.497827390172548) q[52];
-rz(1.5529786639952434) q[53];
-cx q[17],q[53];
-cx q[17],q[62];
-cx q[21],q[53];
-rz(1.5529786639952434) q[53];
-cx q[21],q[53];
-cx q[21],q[75];
-rz(1.5529786639952434) q[54];
-cx q[24],q[54];
-cx q[24],q[58];
-cx q[28],q[54];
-rz(1.5529786639952434) q[54];
-cx q[28],q[54];
-rx(11.497827390172548) q[54];
-rz(1.5529786639952434) q[55];
-cx q[9],q[55];
-cx q[9],q[80];
-cx q[15],q[55];
-rz(1.5529786639952434) q[55];
-cx q[15],q[55];
-rz(1.5529786639952434) q[56];
-cx q[13],q[56];
-cx q[13],q[68];
-cx q[45],q[56];
-rz(1.5529786639952434) q[56];
-cx q[45],q[56];
-rx(11.497827390172548) q[45];
-rz(1.5529786639952434) q[57];
-cx q[1],q[57];
-cx q[1],q[60];
-cx q[3],q[57];
-rz(1.5529786639952434) q[57];
-cx q[3],q[57];
-cx q[3],q[70];
-rx(11.497827390172548) q[57];
-rz(1.5529786639952434) q[58];
-cx q[24],q[58];
-cx q[24],q[86];
-cx q[28],q[58];
-rz(1.5529786639952434) q[58];
-cx q[28],q[58];
-cx q[28],q[87];
-rx(11.497827390172548) q[58];
-rz(1.5529786639952434) q[59];
-cx q[16],q[59];
-cx q[16],q[73];
-cx q[32],q[59];
-rz(1.5529786639952434) q[59];
-cx q[32],q[59];
-rz(1.5529786639952434) q[60];
-cx q[1],q[60];
-cx q[1],q[97];
-cx q[7],q[60];
-rz(1.5529786639952434) q[60];
-cx q[7],q[60];
-rz(1.5529786639952434) q[61];
-cx q[4],q[61];
-cx q[4],q[99];
-cx q[7],q[61];
-rz(1.5529786639952434) q[61];
-cx q[7],q[61];
-rx(11.497827390172548) q[61];
-rz(1.5529786639952434) q[62];
-cx q[17],q[62];
-rx(11.497827390172548) q[62];
-rz(1.5529786639952434) q[63];
-cx q[12],q[63];
-rx(11.497827390172548) q[12];
-cx q[17],q[63];
-rz(1.5529786639952434) q[63];
-cx q[17],q[63];
-cx q[17],q[66];
-rz(1.5529786639952434) q[64];
-cx q[10],q[64];
-cx q[10],q[98];
-rx(11.497827390172548) q[64];
-rz(1.5529786639952434) q[65];
-cx q[5],q[65];
-cx q[5],q[76];
-cx q[23],q[65];
-rz(1.5529786639952434) q[65];
-cx q[23],q[65];
-rx(11.497827390172548) q[23];
-rx(11.497827390172548) q[65];
-rz(1.5529786639952434) q[66];
-cx q[17],q[66];
-rx(11.497827390172548) q[17];
-cx q[47],q[66];
-rz(1.5529786639952434) q[66];
-cx q[47],q[66];
-rx(11.497827390172548) q[47];
-rx(11.497827390172548) q[66];
-rz(1.5529786639952434) q[67];
-cx q[41],q[67];
-cx q[56],q[67];
-rz(1.5529786639952434) q[67];
-cx q[56],q[67];
-cx q[56],q[74];
-rx(11.497827390172548) q[67];
-rz(1.5529786639952434) q[68];
-cx q[13],q[68];
-rx(11.497827390172548) q[13];
-cx q[32],q[68];
-rz(1.5529786639952434) q[68];
-cx q[32],q[68];
-rz(1.5529786639952434) q[69];
-cx q[6],q[69];
-cx q[59],q[69];
-rz(1.5529786639952434) q[69];
-cx q[59],q[69];
-rx(11.497827390172548) q[69];
-rz(1.5529786639952434) q[70];
-cx q[3],q[70];
-cx q[3],q[71];
-cx q[15],q[70];
-rz(1.5529786639952434) q[70];
-cx q[15],q[70];
-cx q[70],q[84];
-rz(1.5529786639952434) q[71];
-cx q[3],q[71];
-cx q[3],q[77];
-cx q[53],q[71];
-rz(1.5529786639952434) q[71];
-cx q[53],q[71];
-rx(11.497827390172548) q[71];
-rz(1.5529786639952434) q[72];
-cx q[27],q[72];
-cx q[44],q[72];
-rz(1.5529786639952434) q[72];
-cx q[44],q[72];
-rx(11.497827390172548) q[44];
-rx(11.497827390172548) q[72];
-rz(1.5529786639952434) q[73];
-cx q[16],q[73];
-cx q[16],q[101];
-cx q[59],q[73];
-rz(1.5529786639952434) q[73];
-cx q[59],q[73];
-rz(1.5529786639952434) q[74];
-cx q[56],q[74];
-cx q[56],q[82];
-cx q[63],q[74];
-rz(1.5529786639952434) q[74];
-cx q[63],q[74];
-rx(11.497827390172548) q[63];
-rx(11.497827390172548) q[74];
-rz(1.5529786639952434) q[75];
-cx q[21],q[75];
-cx q[21],q[81];
-rx(11.497827390172548) q[75];
-rz(1.5529786639952434) q[76];
-cx q[5],q[76];
-cx q[5],q[89];
-cx q[6],q[76];
-rz(1.5529786639952434) q[76];
-cx q[6],q[76];
-cx q[6],q[79];
-rx(11.497827390172548) q[76];
-rz(1.5529786639952434) q[77];
-cx q[3],q[77];
-cx q[3],q[88];
-cx q[30],q[77];
-rz(1.5529786639952434) q[77];
-cx q[30],q[77];
-rx(11.497827390172548) q[30];
-rz(1.5529786639952434) q[78];
-cx q[42],q[78];
-rx(11.497827390172548) q[42];
-cx q[60],q[78];
-rz(1.5529786639952434) q[78];
-cx q[60],q[78];
-rx(11.497827390172548) q[78];
-rz(1.5529786639952434) q[79];
-cx q[6],q[79];
-cx q[6],q[91];
-cx q[50],q[79];
-rz(1.5529786639952434) q[79];
-cx q[50],q[79];
-rx(11.497827390172548) q[79];
-rz(1.5529786639952434) q[80];
-cx q[9],q[80];
-rx(11.497827390172548) q[9];
-cx q[15],q[80];
-rz(1.5529786639952434) q[80];
-cx q[15],q[80];
-cx q[15],q[90];
-rx(11.497827390172548) q[80];
-rz(1.5529786639952434) q[81];
-cx q[21],q[81];
-cx q[77],q[81];
-rz(1.5529786639952434) q[81];
-cx q[77],q[81];
-rx(11.497827390172548) q[77];
-rx(11.497827390172548) q[81];
-rz(1.5529786639952434) q[82];
-cx q[56],q[82];
-cx q[56],q[96];
-rx(11.497827390172548) q[82];
-rz(1.5529786639952434) q[83];
-cx q[8],q[83];
-rx(11.497827390172548) q[8];
-cx q[68],q[83];
-rz(1.5529786639952434) q[83];
-cx q[68],q[83];
-rx(11.497827390172548) q[68];
-rx(11.497827390172548) q[83];
-rz(1.5529786639952434) q[84];
-cx q[70],q[84];
-rx(11.497827390172548) q[70];
-cx q[73],q[84];
-rz(1.5529786639952434) q[84];
-cx q[73],q[84];
-rx(11.497827390172548) q[73];
-rx(11.497827390172548) q[84];
-rz(1.5529786639952434) q[85];
-cx q[37],q[85];
-rx(11.497827390172548) q[37];
-cx q[59],q[85];
-rz(1.5529786639952434) q[85];
-cx q[59],q[85];
-rx(11.497827390172548) q[59];
-rx(11.497827390172548) q[85];
-rz(1.5529786639952434) q[86];
-cx q[24],q[86];
-rx(11.497827390172548) q[24];
-cx q[53],q[86];
-rz(1.5529786639952434) q[86];
-cx q[53],q[86];
-rx(11.497827390172548) q[53];
-rx(11.497827390172548) q[86];
-rz(1.5529786639952434) q[87];
-cx q[28],q[87];
-rx(11.497827390172548) q[28];
-cx q[32],q[87];
-rz(1.5529786639952434) q[87];
-cx q[32],q[87];
-cx q[32],q[93];
-rx(11.497827390172548) q[87];
-rz(1.5529786639952434) q[88];
-cx q[3],q[88];
-cx q[3],q[100];
-cx q[60],q[88];
-rz(1.5529786639952434) q[88];
-cx q[60],q[88];
-rx(11.497827390172548) q[60];
-rx(11.497827390172548) q[88];
-rz(1.5529786639952434) q[89];
-cx q[5],q[89];
-cx q[5],q[95];
-rz(1.5529786639952434) q[90];
-cx q[15],q[90];
-cx q[15],q[92];
-cx q[27],q[90];
-rz(1.5529786639952434) q[90];
-cx q[27],q[90];
-rx(11.497827390172548) q[90];
-rz(1.5529786639952434) q[91];
-cx q[6],q[91];
-rx(11.497827390172548) q[6];
-rx(11.497827390172548) q[91];
-rz(1.5529786639952434) q[92];
-cx q[15],q[92];
-rx(11.497827390172548) q[15];
-cx q[89],q[92];
-rz(1.5529786639952434) q[92];
-cx q[89],q[92];
-rx(11.497827390172548) q[89];
-rz(1.5529786639952434) q[93];
-cx q[32],q[93];
-rx(11.497827390172548) q[32];
-rx(11.497827390172548) q[93];
-rz(1.5529786639952434) q[94];
-cx q[36],q[94];
-rx(11.497827390172548) q[36];
-cx q[55],q[94];
-rz(1.5529786639952434) q[94];
-cx q[55],q[94];
-rx(11.497827390172548) q[55];
-rx(11.497827390172548) q[94];
-rz(1.5529786639952434) q[95];
-cx q[5],q[95];
-rx(11.497827390172548) q[5];
-cx q[27],q[95];
-rz(1.5529786639952434) q[95];
-cx q[27],q[95];
-rx(11.497827390172548) q[27];
-rx(11.497827390172548) q[95];
-rz(1.5529786639952434) q[96];
-cx q[56],q[96];
-rx(11.497827390172548) q[56];
-cx q[92],q[96];
-rz(1.5529786639952434) q[96];
-cx q[92],q[96];
-rx(11.497827390172548) q[92];
-rx(11.497827390172548) q[96];
-rz(1.5529786639952434) q[97];
-cx q[1],q[97];
-rx(11.497827390172548) q[1];
-cx q[0],q[1];
-rz(0.194825549418697) q[1];
-cx q[0],q[1];
-cx q[0],q[2];
-rz(0.194825549418697) q[2];
-cx q[0],q[2];
-cx q[2],q[89];
-cx q[7],q[97];
-rz(0.194825549418697) q[89];
-cx q[2],q[89];
-rx(5.441214901998974) q[2];
-rz(1.5529786639952434) q[97];
-cx q[7],q[97];
-rx(11.497827390172548) q[7];
-rx(11.497827390172548) q[97];
-rz(1.5529786639952434) q[98];
-cx q[10],q[98];
-rx(11.497827390172548) q[10];
-cx q[21],q[98];
-rz(1.5529786639952434) q[98];
-cx q[21],q[98];
-rx(11.497827390172548) q[21];
-rx(11.497827390172548) q[98];
-rz(1.5529786639952434) q[99];
-cx q[4],q[99];
-cx q[41],q[99];
-rz(1.5529786639952434) q[99];
-cx q[41],q[99];
-rx(11.497827390172548) q[41];
-rx(11.497827390172548) q[99];
-rz(1.5529786639952434) q[100];
-cx q[3],q[100];
-cx q[25],q[100];
-rz(1.5529786639952434) q[100];
-cx q[25],q[100];
-rx(11.497827390172548) q[25];
-rx(11.497827390172548) q[100];
-rz(1.5529786639952434) q[101];
-cx q[16],q[101];
-rx(11.497827390172548) q[16];
-cx q[50],q[101];
-rz(1.5529786639952434) q[101];
-cx q[50],q[101];
-rx(11.497827390172548) q[50];
-rx(11.497827390172548) q[101];
-rx(8.211955033045463) q[102];
-cx q[3],q[102];
-rz(1.5529786639952434) q[102];
-cx q[3],q[102];
-rx(11.497827390172548) q[3];
-cx q[0],q[3];
-rz(0.194825549418697) q[3];
-cx q[0],q[3];
-cx q[0],q[15];
-cx q[1],q[3];
-rz(0.194825549418697) q[3];
-cx q[1],q[3];
-cx q[4],q[102];
-rz(0.194825549418697) q[15];
-cx q[0],q[15];
-cx q[0],q[16];
-rz(0.194825549418697) q[16];
-cx q[0],q[16];
-cx q[0],q[20];
-rz(0.194825549418697) q[20];
-cx q[0],q[20];
-cx q[0],q[32];
-rz(0.194825549418697) q[32];
-cx q[0],q[32];
-cx q[0],q[42];
-rz(0.194825549418697) q[42];
-cx q[0],q[42];
-cx q[0],q[48];
-rz(0.194825549418697) q[48];
-cx q[0],q[48];
-cx q[0],q[51];
-rz(0.194825549418697) q[51];
-cx q[0],q[51];
-cx q[0],q[62];
-rz(0.194825549418697) q[62];
-cx q[0],q[62];
-cx q[0],q[64];
-rz(0.194825549418697) q[64];
-cx q[0],q[64];
-cx q[0],q[75];
-rz(0.194825549418697) q[75];
-cx q[0],q[75];
-cx q[0],q[82];
-rz(0.194825549418697) q[82];
-cx q[0],q[82];
-cx q[0],q[91];
-rz(0.194825549418697) q[91];
-cx q[0],q[91];
-cx q[0],q[93];
-rz(0.194825549418697) q[93];
-cx q[0],q[93];
-rx(5.441214901998974) q[0];
-rz(1.5529786639952434) q[102];
-cx q[4],q[102];
-rx(11.497827390172548) q[4];
-cx q[1],q[4];
-rz(0.194825549418697) q[4];
-cx q[1],q[4];
-cx q[1],q[5];
-cx q[3],q[4];
-rz(0.194825549418697) q[4];
-cx q[3],q[4];
-cx q[4],q[6];
-rz(0.194825549418697) q[5];
-cx q[1],q[5];
-cx q[1],q[9];
-cx q[3],q[5];
-rz(0.194825549418697) q[5];
-cx q[3],q[5];
-cx q[3],q[7];
-rz(0.194825549418697) q[6];
-cx q[4],q[6];
-cx q[5],q[6];
-rz(0.194825549418697) q[6];
-cx q[5],q[6];
-rz(0.194825549418697) q[7];
-cx q[3],q[7];
-cx q[3],q[8];
-cx q[4],q[7];
-rz(0.194825549418697) q[7];
-cx q[4],q[7];
-cx q[4],q[10];
-rz(0.194825549418697) q[8];
-cx q[3],q[8];
-cx q[5],q[8];
-rz(0.194825549418697) q[8];
-cx q[5],q[8];
-cx q[5],q[11];
-cx q[8],q[83];
-rz(0.194825549418697) q[9];
-cx q[1],q[9];
-cx q[1],q[17];
-cx q[3],q[9];
-rz(0.194825549418697) q[9];
-cx q[3],q[9];
-cx q[3],q[12];
-rz(0.194825549418697) q[10];
-cx q[4],q[10];
-cx q[4],q[13];
-cx q[6],q[10];
-rz(0.194825549418697) q[10];
-cx q[6],q[10];
-cx q[10],q[37];
-rz(0.194825549418697) q[11];
-cx q[5],q[11];
-cx q[6],q[11];
-rz(0.194825549418697) q[11];
-cx q[6],q[11];
-rx(5.441214901998974) q[11];
-rz(0.194825549418697) q[12];
-cx q[3],q[12];
-cx q[3],q[14];
-cx q[5],q[12];
-rz(0.194825549418697) q[12];
-cx q[5],q[12];
-rz(0.194825549418697) q[13];
-cx q[4],q[13];
-cx q[5],q[13];
-rz(0.194825549418697) q[13];
-cx q[5],q[13];
-rz(0.194825549418697) q[14];
-cx q[3],q[14];
-cx q[3],q[15];
-cx q[4],q[14];
-rz(0.194825549418697) q[14];
-cx q[4],q[14];
-rx(5.441214901998974) q[14];
-rz(0.194825549418697) q[15];
-cx q[3],q[15];
-cx q[3],q[16];
-cx q[15],q[20];
-rz(0.194825549418697) q[16];
-cx q[3],q[16];
-rz(0.194825549418697) q[17];
-cx q[1],q[17];
-cx q[1],q[28];
-cx q[3],q[17];
-rz(0.194825549418697) q[17];
-cx q[3],q[17];
-cx q[3],q[18];
-rz(0.194825549418697) q[18];
-cx q[3],q[18];
-cx q[3],q[19];
-cx q[4],q[18];
-rz(0.194825549418697) q[18];
-cx q[4],q[18];
-cx q[4],q[21];
-rz(0.194825549418697) q[19];
-cx q[3],q[19];
-cx q[3],q[22];
-cx q[7],q[19];
-rz(0.194825549418697) q[19];
-cx q[7],q[19];
-cx q[19],q[38];
-rz(0.194825549418697) q[20];
-cx q[15],q[20];
-rz(0.194825549418697) q[21];
-cx q[4],q[21];
-cx q[4],q[27];
-cx q[15],q[21];
-rz(0.194825549418697) q[21];
-cx q[15],q[21];
-cx q[15],q[36];
-rz(0.194825549418697) q[22];
-cx q[3],q[22];
-cx q[3],q[23];
-cx q[9],q[22];
-rz(0.194825549418697) q[22];
-cx q[9],q[22];
-cx q[9],q[55];
-rx(5.441214901998974) q[22];
-rz(0.194825549418697) q[23];
-cx q[3],q[23];
-cx q[3],q[24];
-cx q[17],q[23];
-rz(0.194825549418697) q[23];
-cx q[17],q[23];
-rz(0.194825549418697) q[24];
-cx q[3],q[24];
-cx q[3],q[25];
-cx q[5],q[24];
-rz(0.194825549418697) q[24];
-cx q[5],q[24];
-cx q[5],q[33];
-cx q[24],q[54];
-rz(0.194825549418697) q[25];
-cx q[3],q[25];
-cx q[3],q[26];
-cx q[12],q[25];
-rz(0.194825549418697) q[25];
-cx q[12],q[25];
-cx q[12],q[31];
-rz(0.194825549418697) q[26];
-cx q[3],q[26];
-cx q[21],q[26];
-rz(0.194825549418697) q[26];
-cx q[21],q[26];
-cx q[21],q[32];
-rz(0.194825549418697) q[27];
-cx q[4],q[27];
-cx q[4],q[47];
-cx q[6],q[27];
-rz(0.194825549418697) q[27];
-cx q[6],q[27];
-cx q[6],q[69];
-rz(0.194825549418697) q[28];
-cx q[1],q[28];
-cx q[1],q[29];
-cx q[3],q[28];
-rz(0.194825549418697) q[28];
-cx q[3],q[28];
-cx q[28],q[51];
-rz(0.194825549418697) q[29];
-cx q[1],q[29];
-cx q[1],q[45];
-cx q[3],q[29];
-rz(0.194825549418697) q[29];
-cx q[3],q[29];
-cx q[3],q[30];
-rx(5.441214901998974) q[29];
-rz(0.194825549418697) q[30];
-cx q[3],q[30];
-cx q[3],q[34];
-cx q[18],q[30];
-rz(0.194825549418697) q[30];
-cx q[18],q[30];
-rx(5.441214901998974) q[18];
-rz(0.194825549418697) q[31];
-cx q[12],q[31];
-cx q[26],q[31];
-rz(0.194825549418697) q[31];
-cx q[26],q[31];
-rx(5.441214901998974) q[26];
-rx(5.441214901998974) q[31];
-rz(0.194825549418697) q[32];
-cx q[21],q[32];
-rz(0.194825549418697) q[33];
-cx q[5],q[33];
-cx q[5],q[46];
-cx q[30],q[33];
-rz(0.194825549418697) q[33];
-cx q[30],q[33];
-cx q[30],q[48];
-rx(5.441214901998974) q[33];
-rz(0.194825549418697) q[34];
-cx q[3],q[34];
-cx q[3],q[35];
-cx q[12],q[34];
-rz(0.194825549418697) q[34];
-cx q[12],q[34];
-rz(0.194825549418697) q[35];
-cx q[3],q[35];
-cx q[3],q[39];
-cx q[32],q[35];
-rz(0.194825549418697) q[35];
-cx q[32],q[35];
-rx(5.441214901998974) q[35];
-rz(0.194825549418697) q[36];
-cx q[15],q[36];
-cx q[20],q[36];
-rz(0.194825549418697) q[36];
-cx q[20],q[36];
-cx q[36],q[94];
-rz(0.194825549418697) q[37];
-cx q[10],q[37];
-cx q[10],q[41];
-cx q[34],q[37];
-rz(0.194825549418697) q[37];
-cx q[34],q[37];
-rx(5.441214901998974) q[34];
-cx q[37],q[85];
-rz(0.194825549418697) q[38];
-cx q[19],q[38];
-rx(5.441214901998974) q[19];
-cx q[21],q[38];
-rz(0.194825549418697) q[38];
-cx q[21],q[38];
-rz(0.194825549418697) q[39];
-cx q[3],q[39];
-cx q[3],q[40];
-cx q[13],q[39];
-rz(0.194825549418697) q[39];
-cx q[13],q[39];
-cx q[13],q[56];
-rx(5.441214901998974) q[39];
-rz(0.194825549418697) q[40];
-cx q[3],q[40];
-cx q[3],q[42];
-cx q[23],q[40];
-rz(0.194825549418697) q[40];
-cx q[23],q[40];
-rx(5.441214901998974) q[40];
-rz(0.194825549418697) q[41];
-cx q[10],q[41];
-cx q[27],q[41];
-rz(0.194825549418697) q[41];
-cx q[27],q[41];
-cx q[27],q[72];
-cx q[41],q[67];
-rz(0.194825549418697) q[42];
-cx q[3],q[42];
-cx q[3],q[43];
-cx q[42],q[78];
-rz(0.194825549418697) q[43];
-cx q[3],q[43];
-cx q[3],q[44];
-cx q[20],q[43];
-rz(0.194825549418697) q[43];
-cx q[20],q[43];
-rx(5.441214901998974) q[20];
-rx(5.441214901998974) q[43];
-rz(0.194825549418697) q[44];
-cx q[3],q[44];
-cx q[3],q[49];
-cx q[12],q[44];
-rz(0.194825549418697) q[44];
-cx q[12],q[44];
-rz(0.194825549418697) q[45];
-cx q[1],q[45];
-cx q[1],q[57];
-cx q[16],q[45];
-rz(0.194825549418697) q[45];
-cx q[16],q[45];
-cx q[16],q[59];
-rz(0.194825549418697) q[46];
-cx q[5],q[46];
-cx q[5],q[65];
-cx q[38],q[46];
-rz(0.194825549418697) q[46];
-cx q[38],q[46];
-rx(5.441214901998974) q[38];
-rx(5.441214901998974) q[46];
-rz(0.194825549418697) q[47];
-cx q[4],q[47];
-cx q[17],q[47];
-rz(0.194825549418697) q[47];
-cx q[17],q[47];
-cx q[17],q[53];
-rz(0.194825549418697) q[48];
-cx q[30],q[48];
-rx(5.441214901998974) q[48];
-rz(0.194825549418697) q[49];
-cx q[3],q[49];
-cx q[3],q[50];
-cx q[4],q[49];
-rz(0.194825549418697) q[49];
-cx q[4],q[49];
-cx q[4],q[61];
-rx(5.441214901998974) q[49];
-rz(0.194825549418697) q[50];
-cx q[3],q[50];
-cx q[3],q[52];
-cx q[12],q[50];
-rz(0.194825549418697) q[50];
-cx q[12],q[50];
-cx q[12],q[63];
-rz(0.194825549418697) q[51];
-cx q[28],q[51];
-rx(5.441214901998974) q[51];
-rz(0.194825549418697) q[52];
-cx q[3],q[52];
-cx q[10],q[52];
-rz(0.194825549418697) q[52];
-cx q[10],q[52];
-cx q[10],q[64];
-rx(5.441214901998974) q[52];
-rz(0.194825549418697) q[53];
-cx q[17],q[53];
-cx q[17],q[62];
-cx q[21],q[53];
-rz(0.194825549418697) q[53];
-cx q[21],q[53];
-cx q[21],q[75];
-rz(0.194825549418697) q[54];
-cx q[24],q[54];
-cx q[24],q[58];
-cx q[28],q[54];
-rz(0.194825549418697) q[54];
-cx q[28],q[54];
-rx(5.441214901998974) q[54];
-rz(0.194825549418697) q[55];
-cx q[9],q[55];
-cx q[9],q[80];
-cx q[15],q[55];
-rz(0.194825549418697) q[55];
-cx q[15],q[55];
-rz(0.194825549418697) q[56];
-cx q[13],q[56];
-cx q[13],q[68];
-cx q[45],q[56];
-rz(0.194825549418697) q[56];
-cx q[45],q[56];
-rx(5.441214901998974) q[45];
-rz(0.194825549418697) q[57];
-cx q[1],q[57];
-cx q[1],q[60];
-cx q[3],q[57];
-rz(0.194825549418697) q[57];
-cx q[3],q[57];
-cx q[3],q[70];
-rx(5.441214901998974) q[57];
-rz(0.194825549418697) q[58];
-cx q[24],q[58];
-cx q[24],q[86];
-cx q[28],q[58];
-rz(0.194825549418697) q[58];
-cx q[28],q[58];
-cx q[28],q[87];
-rx(5.441214901998974) q[58];
-rz(0.194825549418697) q[59];
-cx q[16],q[59];
-cx q[16],q[73];
-cx q[32],q[59];
-rz(0.194825549418697) q[59];
-cx q[32],q[59];
-rz(0.194825549418697) q[60];
-cx q[1],q[60];
-cx q[1],q[97];
-cx q[7],q[60];
-rz(0.194825549418697) q[60];
-cx q[7],q[60];
-rz(0.194825549418697) q[61];
-cx q[4],q[61];
-cx q[4],q[99];
-cx q[7],q[61];
-rz(0.194825549418697) q[61];
-cx q[7],q[61];
-rx(5.441214901998974) q[61];
-rz(0.194825549418697) q[62];
-cx q[17],q[62];
-rx(5.441214901998974) q[62];
-rz(0.194825549418697) q[63];
-cx q[12],q[63];
-rx(5.441214901998974) q[12];
-cx q[17],q[63];
-rz(0.194825549418697) q[63];
-cx q[17],q[63];
-cx q[17],q[66];
-rz(0.194825549418697) q[64];
-cx q[10],q[64];
-cx q[10],q[98];
-rx(5.441214901998974) q[64];
-rz(0.194825549418697) q[65];
-cx q[5],q[65];
-cx q[5],q[76];
-cx q[23],q[65];
-rz(0.194825549418697) q[65];
-cx q[23],q[65];
-rx(5.441214901998974) q[23];
-rx(5.441214901998974) q[65];
-rz(0.194825549418697) q[66];
-cx q[17],q[66];
-rx(5.441214901998974) q[17];
-cx q[47],q[66];
-rz(0.194825549418697) q[66];
-cx q[47],q[66];
-rx(5.441214901998974) q[47];
-rx(5.441214901998974) q[66];
-rz(0.194825549418697) q[67];
-cx q[41],q[67];
-cx q[56],q[67];
-rz(0.194825549418697) q[67];
-cx q[56],q[67];
-cx q[56],q[74];
-rx(5.441214901998974) q[67];
-rz(0.194825549418697) q[68];
-cx q[13],q[68];
-rx(5.441214901998974) q[13];
-cx q[32],q[68];
-rz(0.194825549418697) q[68];
-cx q[32],q[68];
-rz(0.194825549418697) q[69];
-cx q[6],q[69];
-cx q[59],q[69];
-rz(0.194825549418697) q[69];
-cx q[59],q[69];
-rx(5.441214901998974) q[69];
-rz(0.194825549418697) q[70];
-cx q[3],q[70];
-cx q[3],q[71];
-cx q[15],q[70];
-rz(0.194825549418697) q[70];
-cx q[15],q[70];
-cx q[70],q[84];
-rz(0.194825549418697) q[71];
-cx q[3],q[71];
-cx q[3],q[77];
-cx q[53],q[71];
-rz(0.194825549418697) q[71];
-cx q[53],q[71];
-rx(5.441214901998974) q[71];
-rz(0.194825549418697) q[72];
-cx q[27],q[72];
-cx q[44],q[72];
-rz(0.194825549418697) q[72];
-cx q[44],q[72];
-rx(5.441214901998974) q[44];
-rx(5.441214901998974) q[72];
-rz(0.194825549418697) q[73];
-cx q[16],q[73];
-cx q[16],q[101];
-cx q[59],q[73];
-rz(0.194825549418697) q[73];
-cx q[59],q[73];
-rz(0.194825549418697) q[74];
-cx q[56],q[74];
-cx q[56],q[82];
-cx q[63],q[74];
-rz(0.194825549418697) q[74];
-cx q[63],q[74];
-rx(5.441214901998974) q[63];
-rx(5.441214901998974) q[74];
-rz(0.194825549418697) q[75];
-cx q[21],q[75];
-cx q[21],q[81];
-rx(5.441214901998974) q[75];
-rz(0.194825549418697) q[76];
-cx q[5],q[76];
-cx q[5],q[89];
-cx q[6],q[76];
-rz(0.194825549418697) q[76];
-cx q[6],q[76];
-cx q[6],q[79];
-rx(5.441214901998974) q[76];
-rz(0.194825549418697) q[77];
-cx q[3],q[77];
-cx q[3],q[88];
-cx q[30],q[77];
-rz(0.194825549418697) q[77];
-cx q[30],q[77];
-rx(5.441214901998974) q[30];
-rz(0.194825549418697) q[78];
-cx q[42],q[78];
-rx(5.441214901998974) q[42];
-cx q[60],q[78];
-rz(0.194825549418697) q[78];
-cx q[60],q[78];
-rx(5.441214901998974) q[78];
-rz(0.194825549418697) q[79];
-cx q[6],q[79];
-cx q[6],q[91];
-cx q[50],q[79];
-rz(0.194825549418697) q[79];
-cx q[50],q[79];
-rx(5.441214901998974) q[79];
-rz(0.194825549418697) q[80];
-cx q[9],q[80];
-rx(5.441214901998974) q[9];
-cx q[15],q[80];
-rz(0.194825549418697) q[80];
-cx q[15],q[80];
-cx q[15],q[90];
-rx(5.441214901998974) q[80];
-rz(0.194825549418697) q[81];
-cx q[21],q[81];
-cx q[77],q[81];
-rz(0.194825549418697) q[81];
-cx q[77],q[81];
-rx(5.441214901998974) q[77];
-rx(5.441214901998974) q[81];
-rz(0.194825549418697) q[82];
-cx q[56],q[82];
-cx q[56],q[96];
-rx(5.441214901998974) q[82];
-rz(0.194825549418697) q[83];
-cx q[8],q[83];
-rx(5.441214901998974) q[8];
-cx q[68],q[83];
-rz(0.194825549418697) q[83];
-cx q[68],q[83];
-rx(5.441214901998974) q[68];
-rx(5.441214901998974) q[83];
-rz(0.194825549418697) q[84];
-cx q[70],q[84];
-rx(5.441214901998974) q[70];
-cx q[73],q[84];
-rz(0.194825549418697) q[84];
-cx q[73],q[84];
-rx(5.441214901998974) q[73];
-rx(5.441214901998974) q[84];
-rz(0.194825549418697) q[85];
-cx q[37],q[85];
-rx(5.441214901998974) q[37];
-cx q[59],q[85];
-rz(0.194825549418697) q[85];
-cx q[59],q[85];
-rx(5.441214901998974) q[59];
-rx(5.441214901998974) q[85];
-rz(0.194825549418697) q[86];
-cx q[24],q[86];
-rx(5.441214901998974) q[24];
-cx q[53],q[86];
-rz(0.194825549418697) q[86];
-cx q[53],q[86];
-rx(5.441214901998974) q[53];
-rx(5.441214901998974) q[86];
-rz(0.194825549418697) q[87];
-cx q[28],q[87];
-rx(5.441214901998974) q[28];
-cx q[32],q[87];
-rz(0.194825549418697) q[87];
-cx q[32],q[87];
-cx q[32],q[93];
-rx(5.441214901998974) q[87];
-rz(0.194825549418697) q[88];
-cx q[3],q[88];
-cx q[3],q[100];
-cx q[60],q[88];
-rz(0.194825549418697) q[88];
-cx q[60],q[88];
-rx(5.441214901998974) q[60];
-rx(5.441214901998974) q[88];
-rz(0.194825549418697) q[89];
-cx q[5],q[89];
-cx q[5],q[95];
-rz(0.194825549418697) q[90];
-cx q[15],q[90];
-cx q[15],q[92];
-cx q[27],q[90];
-rz(0.194825549418697) q[90];
-cx q[27],q[90];
-rx(5.441214901998974) q[90];
-rz(0.194825549418697) q[91];
-cx q[6],q[91];
-rx(5.441214901998974) q[6];
-rx(5.441214901998974) q[91];
-rz(0.194825549418697) q[92];
-cx q[15],q[92];
-rx(5.441214901998974) q[15];
-cx q[89],q[92];
-rz(0.194825549418697) q[92];
-cx q[89],q[92];
-rx(5.441214901998974) q[89];
-rz(0.194825549418697) q[93];
-cx q[32],q[93];
-rx(5.441214901998974) q[32];
-rx(5.441214901998974) q[93];
-rz(0.194825549418697) q[94];
-cx q[36],q[94];
-rx(5.441214901998974) q[36];
-cx q[55],q[94];
-rz(0.194825549418697) q[94];
-cx q[55],q[94];
-rx(5.441214901998974) q[55];
-rx(5.441214901998974) q[94];
-rz(0.194825549418697) q[95];
-cx q[5],q[95];
-rx(5.441214901998974) q[5];
-cx q[27],q[95];
-rz(0.194825549418697) q[95];
-cx q[27],q[95];
-rx(5.441214901998974) q[27];
-rx(5.441214901998974) q[95];
-rz(0.194825549418697) q[96];
-cx q[56],q[96];
-rx(5.441214901998974) q[56];
-cx q[92],q[96];
-rz(0.194825549418697) q[96];
-cx q[92],q[96];
-rx(5.441214901998974) q[92];
-rx(5.441214901998974) q[96];
-rz(0.194825549418697) q[97];
-cx q[1],q[97];
-rx(5.441214901998974) q[1];
-cx q[7],q[97];
-rz(0.194825549418697) q[97];
-cx q[7],q[97];
-rx(5.441214901998974) q[7];
-rx(5.441214901998974) q[97];
-rz(0.194825549418697) q[98];
-cx q[10],q[98];
-rx(5.441214901998974) q[10];
-cx q[21],q[98];
-rz(0.194825549418697) q[98];
-cx q[21],q[98];
-rx(5.441214901998974) q[21];
-rx(5.441214901998974) q[98];
-rz(0.194825549418697) q[99];
-cx q[4],q[99];
-cx q[41],q[99];
-rz(0.194825549418697) q[99];
-cx q[41],q[99];
-rx(5.441214901998974) q[41];
-rx(5.441214901998974) q[99];
-rz(0.194825549418697) q[100];
-cx q[3],q[100];
-cx q[25],q[100];
-rz(0.194825549418697) q[100];
-cx q[25],q[100];
-rx(5.441214901998974) q[25];
-rx(5.441214901998974) q[100];
-rz(0.194825549418697) q[101];
-cx q[16],q[101];
-rx(5.441214901998974) q[16];
-cx q[50],q[101];
-rz(0.194825549418697) q[101];
-cx q[50],q[101];
-rx(5.441214901998974) q[50];
-rx(5.441214901998974) q[101];
-rx(11.497827390172548) q[102];
-cx q[3],q[102];
-rz(0.194825549418697) q[102];
-cx q[3],q[102];
-rx(5.441214901998974) q[3];
-cx q[4],q[102];
-rz(0.194825549418697) q[102];
-cx q[4],q[102];
-rx(5.441214901998974) q[4];
-rx(5.441214901998974) q[102];
\ No newline at end of file
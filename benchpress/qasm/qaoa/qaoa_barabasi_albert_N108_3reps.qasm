@@ -1,2451 +0,0 @@
-OPENQASM 2.0;
-include "qelib1.inc";
-qreg q[108];
-ry(pi/2) q[0];
-rx(pi) q[0];
-ry(pi/2) q[1];
-rx(pi) q[1];
-cx q[0],q[1];
-rz(2.0297165742807874) q[1];
-cx q[0],q[1];
-ry(pi/2) q[2];
-rx(pi) q[2];
-cx q[0],q[2];
-rz(2.0297165742807874) q[2];
-cx q[0],q[2];
-ry(pi/2) q[3];
-rx(pi) q[3];
-cx q[0],q[3];
-rz(2.0297165742807874) q[3];
-cx q[0],q[3];
-cx q[1],q[3];
-rz(2.0297165742807874) q[3];
-cx q[1],q[3];
-ry(pi/2) q[4];
-rx(pi) q[4];
-cx q[1],q[4];
-rz(2.0297165742807874) q[4];
-cx q[1],q[4];
-cx q[3],q[4];
-rz(2.0297165742807874) q[4];
-cx q[3],q[4];
-ry(pi/2) q[5];
-rx(pi) q[5];
-cx q[1],q[5];
-rz(2.0297165742807874) q[5];
-cx q[1],q[5];
-cx q[3],q[5];
-rz(2.0297165742807874) q[5];
-cx q[3],q[5];
-ry(pi/2) q[6];
-rx(pi) q[6];
-cx q[4],q[6];
-rz(2.0297165742807874) q[6];
-cx q[4],q[6];
-cx q[5],q[6];
-rz(2.0297165742807874) q[6];
-cx q[5],q[6];
-ry(pi/2) q[7];
-rx(pi) q[7];
-cx q[3],q[7];
-rz(2.0297165742807874) q[7];
-cx q[3],q[7];
-cx q[4],q[7];
-rz(2.0297165742807874) q[7];
-cx q[4],q[7];
-ry(pi/2) q[8];
-rx(pi) q[8];
-cx q[3],q[8];
-rz(2.0297165742807874) q[8];
-cx q[3],q[8];
-cx q[5],q[8];
-rz(2.0297165742807874) q[8];
-cx q[5],q[8];
-ry(pi/2) q[9];
-rx(pi) q[9];
-cx q[1],q[9];
-rz(2.0297165742807874) q[9];
-cx q[1],q[9];
-cx q[3],q[9];
-rz(2.0297165742807874) q[9];
-cx q[3],q[9];
-ry(pi/2) q[10];
-rx(pi) q[10];
-cx q[4],q[10];
-rz(2.0297165742807874) q[10];
-cx q[4],q[10];
-cx q[6],q[10];
-rz(2.0297165742807874) q[10];
-cx q[6],q[10];
-ry(pi/2) q[11];
-rx(pi) q[11];
-cx q[5],q[11];
-rz(2.0297165742807874) q[11];
-cx q[5],q[11];
-cx q[6],q[11];
-rz(2.0297165742807874) q[11];
-cx q[6],q[11];
-rx(0.14295371502408735) q[11];
-ry(pi/2) q[12];
-rx(pi) q[12];
-cx q[3],q[12];
-rz(2.0297165742807874) q[12];
-cx q[3],q[12];
-cx q[5],q[12];
-rz(2.0297165742807874) q[12];
-cx q[5],q[12];
-ry(pi/2) q[13];
-rx(pi) q[13];
-cx q[4],q[13];
-rz(2.0297165742807874) q[13];
-cx q[4],q[13];
-cx q[5],q[13];
-rz(2.0297165742807874) q[13];
-cx q[5],q[13];
-ry(pi/2) q[14];
-rx(pi) q[14];
-cx q[3],q[14];
-rz(2.0297165742807874) q[14];
-cx q[3],q[14];
-cx q[4],q[14];
-rz(2.0297165742807874) q[14];
-cx q[4],q[14];
-rx(0.14295371502408735) q[14];
-ry(pi/2) q[15];
-rx(pi) q[15];
-cx q[0],q[15];
-rz(2.0297165742807874) q[15];
-cx q[0],q[15];
-cx q[3],q[15];
-rz(2.0297165742807874) q[15];
-cx q[3],q[15];
-ry(pi/2) q[16];
-rx(pi) q[16];
-cx q[0],q[16];
-rz(2.0297165742807874) q[16];
-cx q[0],q[16];
-cx q[3],q[16];
-rz(2.0297165742807874) q[16];
-cx q[3],q[16];
-ry(pi/2) q[17];
-rx(pi) q[17];
-cx q[1],q[17];
-rz(2.0297165742807874) q[17];
-cx q[1],q[17];
-cx q[3],q[17];
-rz(2.0297165742807874) q[17];
-cx q[3],q[17];
-ry(pi/2) q[18];
-rx(pi) q[18];
-cx q[3],q[18];
-rz(2.0297165742807874) q[18];
-cx q[3],q[18];
-cx q[4],q[18];
-rz(2.0297165742807874) q[18];
-cx q[4],q[18];
-ry(pi/2) q[19];
-rx(pi) q[19];
-cx q[3],q[19];
-rz(2.0297165742807874) q[19];
-cx q[3],q[19];
-cx q[7],q[19];
-rz(2.0297165742807874) q[19];
-cx q[7],q[19];
-ry(pi/2) q[20];
-rx(pi) q[20];
-cx q[0],q[20];
-rz(2.0297165742807874) q[20];
-cx q[0],q[20];
-cx q[15],q[20];
-rz(2.0297165742807874) q[20];
-cx q[15],q[20];
-ry(pi/2) q[21];
-rx(pi) q[21];
-cx q[4],q[21];
-rz(2.0297165742807874) q[21];
-cx q[4],q[21];
-cx q[15],q[21];
-rz(2.0297165742807874) q[21];
-cx q[15],q[21];
-ry(pi/2) q[22];
-rx(pi) q[22];
-cx q[3],q[22];
-rz(2.0297165742807874) q[22];
-cx q[3],q[22];
-cx q[9],q[22];
-rz(2.0297165742807874) q[22];
-cx q[9],q[22];
-rx(0.14295371502408735) q[22];
-ry(pi/2) q[23];
-rx(pi) q[23];
-cx q[3],q[23];
-rz(2.0297165742807874) q[23];
-cx q[3],q[23];
-cx q[17],q[23];
-rz(2.0297165742807874) q[23];
-cx q[17],q[23];
-ry(pi/2) q[24];
-rx(pi) q[24];
-cx q[3],q[24];
-rz(2.0297165742807874) q[24];
-cx q[3],q[24];
-cx q[5],q[24];
-rz(2.0297165742807874) q[24];
-cx q[5],q[24];
-ry(pi/2) q[25];
-rx(pi) q[25];
-cx q[3],q[25];
-rz(2.0297165742807874) q[25];
-cx q[3],q[25];
-cx q[12],q[25];
-rz(2.0297165742807874) q[25];
-cx q[12],q[25];
-ry(pi/2) q[26];
-rx(pi) q[26];
-cx q[3],q[26];
-rz(2.0297165742807874) q[26];
-cx q[3],q[26];
-cx q[21],q[26];
-rz(2.0297165742807874) q[26];
-cx q[21],q[26];
-ry(pi/2) q[27];
-rx(pi) q[27];
-cx q[4],q[27];
-rz(2.0297165742807874) q[27];
-cx q[4],q[27];
-cx q[6],q[27];
-rz(2.0297165742807874) q[27];
-cx q[6],q[27];
-ry(pi/2) q[28];
-rx(pi) q[28];
-cx q[1],q[28];
-rz(2.0297165742807874) q[28];
-cx q[1],q[28];
-cx q[3],q[28];
-rz(2.0297165742807874) q[28];
-cx q[3],q[28];
-ry(pi/2) q[29];
-rx(pi) q[29];
-cx q[1],q[29];
-rz(2.0297165742807874) q[29];
-cx q[1],q[29];
-cx q[3],q[29];
-rz(2.0297165742807874) q[29];
-cx q[3],q[29];
-rx(0.14295371502408735) q[29];
-ry(pi/2) q[30];
-rx(pi) q[30];
-cx q[3],q[30];
-rz(2.0297165742807874) q[30];
-cx q[3],q[30];
-cx q[18],q[30];
-rz(2.0297165742807874) q[30];
-cx q[18],q[30];
-rx(0.14295371502408735) q[18];
-ry(pi/2) q[31];
-rx(pi) q[31];
-cx q[12],q[31];
-rz(2.0297165742807874) q[31];
-cx q[12],q[31];
-cx q[26],q[31];
-rz(2.0297165742807874) q[31];
-cx q[26],q[31];
-ry(pi/2) q[32];
-rx(pi) q[32];
-cx q[0],q[32];
-rz(2.0297165742807874) q[32];
-cx q[0],q[32];
-cx q[21],q[32];
-rz(2.0297165742807874) q[32];
-cx q[21],q[32];
-ry(pi/2) q[33];
-rx(pi) q[33];
-cx q[5],q[33];
-rz(2.0297165742807874) q[33];
-cx q[5],q[33];
-cx q[30],q[33];
-rz(2.0297165742807874) q[33];
-cx q[30],q[33];
-rx(0.14295371502408735) q[33];
-ry(pi/2) q[34];
-rx(pi) q[34];
-cx q[3],q[34];
-rz(2.0297165742807874) q[34];
-cx q[3],q[34];
-cx q[12],q[34];
-rz(2.0297165742807874) q[34];
-cx q[12],q[34];
-ry(pi/2) q[35];
-rx(pi) q[35];
-cx q[3],q[35];
-rz(2.0297165742807874) q[35];
-cx q[3],q[35];
-cx q[32],q[35];
-rz(2.0297165742807874) q[35];
-cx q[32],q[35];
-rx(0.14295371502408735) q[35];
-ry(pi/2) q[36];
-rx(pi) q[36];
-cx q[15],q[36];
-rz(2.0297165742807874) q[36];
-cx q[15],q[36];
-cx q[20],q[36];
-rz(2.0297165742807874) q[36];
-cx q[20],q[36];
-ry(pi/2) q[37];
-rx(pi) q[37];
-cx q[10],q[37];
-rz(2.0297165742807874) q[37];
-cx q[10],q[37];
-cx q[34],q[37];
-rz(2.0297165742807874) q[37];
-cx q[34],q[37];
-rx(0.14295371502408735) q[34];
-ry(pi/2) q[38];
-rx(pi) q[38];
-cx q[19],q[38];
-rz(2.0297165742807874) q[38];
-cx q[19],q[38];
-rx(0.14295371502408735) q[19];
-cx q[21],q[38];
-rz(2.0297165742807874) q[38];
-cx q[21],q[38];
-ry(pi/2) q[39];
-rx(pi) q[39];
-cx q[3],q[39];
-rz(2.0297165742807874) q[39];
-cx q[3],q[39];
-cx q[13],q[39];
-rz(2.0297165742807874) q[39];
-cx q[13],q[39];
-rx(0.14295371502408735) q[39];
-ry(pi/2) q[40];
-rx(pi) q[40];
-cx q[3],q[40];
-rz(2.0297165742807874) q[40];
-cx q[3],q[40];
-cx q[23],q[40];
-rz(2.0297165742807874) q[40];
-cx q[23],q[40];
-rx(0.14295371502408735) q[40];
-ry(pi/2) q[41];
-rx(pi) q[41];
-cx q[10],q[41];
-rz(2.0297165742807874) q[41];
-cx q[10],q[41];
-cx q[27],q[41];
-rz(2.0297165742807874) q[41];
-cx q[27],q[41];
-ry(pi/2) q[42];
-rx(pi) q[42];
-cx q[0],q[42];
-rz(2.0297165742807874) q[42];
-cx q[0],q[42];
-cx q[3],q[42];
-rz(2.0297165742807874) q[42];
-cx q[3],q[42];
-ry(pi/2) q[43];
-rx(pi) q[43];
-cx q[3],q[43];
-rz(2.0297165742807874) q[43];
-cx q[3],q[43];
-cx q[20],q[43];
-rz(2.0297165742807874) q[43];
-cx q[20],q[43];
-rx(0.14295371502408735) q[20];
-rx(0.14295371502408735) q[43];
-ry(pi/2) q[44];
-rx(pi) q[44];
-cx q[3],q[44];
-rz(2.0297165742807874) q[44];
-cx q[3],q[44];
-cx q[12],q[44];
-rz(2.0297165742807874) q[44];
-cx q[12],q[44];
-ry(pi/2) q[45];
-rx(pi) q[45];
-cx q[1],q[45];
-rz(2.0297165742807874) q[45];
-cx q[1],q[45];
-cx q[16],q[45];
-rz(2.0297165742807874) q[45];
-cx q[16],q[45];
-ry(pi/2) q[46];
-rx(pi) q[46];
-cx q[5],q[46];
-rz(2.0297165742807874) q[46];
-cx q[5],q[46];
-cx q[38],q[46];
-rz(2.0297165742807874) q[46];
-cx q[38],q[46];
-rx(0.14295371502408735) q[38];
-rx(0.14295371502408735) q[46];
-ry(pi/2) q[47];
-rx(pi) q[47];
-cx q[4],q[47];
-rz(2.0297165742807874) q[47];
-cx q[4],q[47];
-cx q[17],q[47];
-rz(2.0297165742807874) q[47];
-cx q[17],q[47];
-ry(pi/2) q[48];
-rx(pi) q[48];
-cx q[0],q[48];
-rz(2.0297165742807874) q[48];
-cx q[0],q[48];
-cx q[30],q[48];
-rz(2.0297165742807874) q[48];
-cx q[30],q[48];
-rx(0.14295371502408735) q[48];
-ry(pi/2) q[49];
-rx(pi) q[49];
-cx q[3],q[49];
-rz(2.0297165742807874) q[49];
-cx q[3],q[49];
-cx q[4],q[49];
-rz(2.0297165742807874) q[49];
-cx q[4],q[49];
-rx(0.14295371502408735) q[49];
-ry(pi/2) q[50];
-rx(pi) q[50];
-cx q[3],q[50];
-rz(2.0297165742807874) q[50];
-cx q[3],q[50];
-cx q[12],q[50];
-rz(2.0297165742807874) q[50];
-cx q[12],q[50];
-ry(pi/2) q[51];
-rx(pi) q[51];
-cx q[0],q[51];
-rz(2.0297165742807874) q[51];
-cx q[0],q[51];
-cx q[28],q[51];
-rz(2.0297165742807874) q[51];
-cx q[28],q[51];
-rx(0.14295371502408735) q[51];
-ry(pi/2) q[52];
-rx(pi) q[52];
-cx q[3],q[52];
-rz(2.0297165742807874) q[52];
-cx q[3],q[52];
-cx q[10],q[52];
-rz(2.0297165742807874) q[52];
-cx q[10],q[52];
-rx(0.14295371502408735) q[52];
-ry(pi/2) q[53];
-rx(pi) q[53];
-cx q[17],q[53];
-rz(2.0297165742807874) q[53];
-cx q[17],q[53];
-cx q[21],q[53];
-rz(2.0297165742807874) q[53];
-cx q[21],q[53];
-ry(pi/2) q[54];
-rx(pi) q[54];
-cx q[24],q[54];
-rz(2.0297165742807874) q[54];
-cx q[24],q[54];
-cx q[28],q[54];
-rz(2.0297165742807874) q[54];
-cx q[28],q[54];
-rx(0.14295371502408735) q[54];
-ry(pi/2) q[55];
-rx(pi) q[55];
-cx q[9],q[55];
-rz(2.0297165742807874) q[55];
-cx q[9],q[55];
-cx q[15],q[55];
-rz(2.0297165742807874) q[55];
-cx q[15],q[55];
-ry(pi/2) q[56];
-rx(pi) q[56];
-cx q[13],q[56];
-rz(2.0297165742807874) q[56];
-cx q[13],q[56];
-cx q[45],q[56];
-rz(2.0297165742807874) q[56];
-cx q[45],q[56];
-rx(0.14295371502408735) q[45];
-ry(pi/2) q[57];
-rx(pi) q[57];
-cx q[1],q[57];
-rz(2.0297165742807874) q[57];
-cx q[1],q[57];
-cx q[3],q[57];
-rz(2.0297165742807874) q[57];
-cx q[3],q[57];
-ry(pi/2) q[58];
-rx(pi) q[58];
-cx q[24],q[58];
-rz(2.0297165742807874) q[58];
-cx q[24],q[58];
-cx q[28],q[58];
-rz(2.0297165742807874) q[58];
-cx q[28],q[58];
-rx(0.14295371502408735) q[58];
-ry(pi/2) q[59];
-rx(pi) q[59];
-cx q[16],q[59];
-rz(2.0297165742807874) q[59];
-cx q[16],q[59];
-cx q[32],q[59];
-rz(2.0297165742807874) q[59];
-cx q[32],q[59];
-ry(pi/2) q[60];
-rx(pi) q[60];
-cx q[1],q[60];
-rz(2.0297165742807874) q[60];
-cx q[1],q[60];
-cx q[7],q[60];
-rz(2.0297165742807874) q[60];
-cx q[7],q[60];
-ry(pi/2) q[61];
-rx(pi) q[61];
-cx q[4],q[61];
-rz(2.0297165742807874) q[61];
-cx q[4],q[61];
-cx q[7],q[61];
-rz(2.0297165742807874) q[61];
-cx q[7],q[61];
-rx(0.14295371502408735) q[61];
-ry(pi/2) q[62];
-rx(pi) q[62];
-cx q[0],q[62];
-rz(2.0297165742807874) q[62];
-cx q[0],q[62];
-cx q[17],q[62];
-rz(2.0297165742807874) q[62];
-cx q[17],q[62];
-rx(0.14295371502408735) q[62];
-ry(pi/2) q[63];
-rx(pi) q[63];
-cx q[12],q[63];
-rz(2.0297165742807874) q[63];
-cx q[12],q[63];
-rx(0.14295371502408735) q[12];
-cx q[17],q[63];
-rz(2.0297165742807874) q[63];
-cx q[17],q[63];
-ry(pi/2) q[64];
-rx(pi) q[64];
-cx q[0],q[64];
-rz(2.0297165742807874) q[64];
-cx q[0],q[64];
-cx q[10],q[64];
-rz(2.0297165742807874) q[64];
-cx q[10],q[64];
-rx(0.14295371502408735) q[64];
-ry(pi/2) q[65];
-rx(pi) q[65];
-cx q[5],q[65];
-rz(2.0297165742807874) q[65];
-cx q[5],q[65];
-cx q[23],q[65];
-rz(2.0297165742807874) q[65];
-cx q[23],q[65];
-rx(0.14295371502408735) q[23];
-rx(0.14295371502408735) q[65];
-ry(pi/2) q[66];
-rx(pi) q[66];
-cx q[17],q[66];
-rz(2.0297165742807874) q[66];
-cx q[17],q[66];
-rx(0.14295371502408735) q[17];
-cx q[47],q[66];
-rz(2.0297165742807874) q[66];
-cx q[47],q[66];
-rx(0.14295371502408735) q[47];
-rx(0.14295371502408735) q[66];
-ry(pi/2) q[67];
-rx(pi) q[67];
-cx q[41],q[67];
-rz(2.0297165742807874) q[67];
-cx q[41],q[67];
-cx q[56],q[67];
-rz(2.0297165742807874) q[67];
-cx q[56],q[67];
-rx(0.14295371502408735) q[67];
-ry(pi/2) q[68];
-rx(pi) q[68];
-cx q[13],q[68];
-rz(2.0297165742807874) q[68];
-cx q[13],q[68];
-cx q[32],q[68];
-rz(2.0297165742807874) q[68];
-cx q[32],q[68];
-ry(pi/2) q[69];
-rx(pi) q[69];
-cx q[6],q[69];
-rz(2.0297165742807874) q[69];
-cx q[6],q[69];
-cx q[59],q[69];
-rz(2.0297165742807874) q[69];
-cx q[59],q[69];
-rx(0.14295371502408735) q[69];
-ry(pi/2) q[70];
-rx(pi) q[70];
-cx q[3],q[70];
-rz(2.0297165742807874) q[70];
-cx q[3],q[70];
-cx q[15],q[70];
-rz(2.0297165742807874) q[70];
-cx q[15],q[70];
-ry(pi/2) q[71];
-rx(pi) q[71];
-cx q[3],q[71];
-rz(2.0297165742807874) q[71];
-cx q[3],q[71];
-cx q[53],q[71];
-rz(2.0297165742807874) q[71];
-cx q[53],q[71];
-rx(0.14295371502408735) q[71];
-ry(pi/2) q[72];
-rx(pi) q[72];
-cx q[27],q[72];
-rz(2.0297165742807874) q[72];
-cx q[27],q[72];
-cx q[44],q[72];
-rz(2.0297165742807874) q[72];
-cx q[44],q[72];
-rx(0.14295371502408735) q[44];
-rx(0.14295371502408735) q[72];
-ry(pi/2) q[73];
-rx(pi) q[73];
-cx q[16],q[73];
-rz(2.0297165742807874) q[73];
-cx q[16],q[73];
-cx q[59],q[73];
-rz(2.0297165742807874) q[73];
-cx q[59],q[73];
-ry(pi/2) q[74];
-rx(pi) q[74];
-cx q[56],q[74];
-rz(2.0297165742807874) q[74];
-cx q[56],q[74];
-cx q[63],q[74];
-rz(2.0297165742807874) q[74];
-cx q[63],q[74];
-rx(0.14295371502408735) q[63];
-rx(0.14295371502408735) q[74];
-ry(pi/2) q[75];
-rx(pi) q[75];
-cx q[0],q[75];
-rz(2.0297165742807874) q[75];
-cx q[0],q[75];
-cx q[21],q[75];
-rz(2.0297165742807874) q[75];
-cx q[21],q[75];
-rx(0.14295371502408735) q[75];
-ry(pi/2) q[76];
-rx(pi) q[76];
-cx q[5],q[76];
-rz(2.0297165742807874) q[76];
-cx q[5],q[76];
-cx q[6],q[76];
-rz(2.0297165742807874) q[76];
-cx q[6],q[76];
-rx(0.14295371502408735) q[76];
-ry(pi/2) q[77];
-rx(pi) q[77];
-cx q[3],q[77];
-rz(2.0297165742807874) q[77];
-cx q[3],q[77];
-cx q[30],q[77];
-rz(2.0297165742807874) q[77];
-cx q[30],q[77];
-rx(0.14295371502408735) q[30];
-ry(pi/2) q[78];
-rx(pi) q[78];
-cx q[42],q[78];
-rz(2.0297165742807874) q[78];
-cx q[42],q[78];
-rx(0.14295371502408735) q[42];
-cx q[60],q[78];
-rz(2.0297165742807874) q[78];
-cx q[60],q[78];
-rx(0.14295371502408735) q[78];
-ry(pi/2) q[79];
-rx(pi) q[79];
-cx q[6],q[79];
-rz(2.0297165742807874) q[79];
-cx q[6],q[79];
-cx q[50],q[79];
-rz(2.0297165742807874) q[79];
-cx q[50],q[79];
-rx(0.14295371502408735) q[79];
-ry(pi/2) q[80];
-rx(pi) q[80];
-cx q[9],q[80];
-rz(2.0297165742807874) q[80];
-cx q[9],q[80];
-rx(0.14295371502408735) q[9];
-cx q[15],q[80];
-rz(2.0297165742807874) q[80];
-cx q[15],q[80];
-rx(0.14295371502408735) q[80];
-ry(pi/2) q[81];
-rx(pi) q[81];
-cx q[21],q[81];
-rz(2.0297165742807874) q[81];
-cx q[21],q[81];
-cx q[77],q[81];
-rz(2.0297165742807874) q[81];
-cx q[77],q[81];
-rx(0.14295371502408735) q[77];
-rx(0.14295371502408735) q[81];
-ry(pi/2) q[82];
-rx(pi) q[82];
-cx q[0],q[82];
-rz(2.0297165742807874) q[82];
-cx q[0],q[82];
-cx q[56],q[82];
-rz(2.0297165742807874) q[82];
-cx q[56],q[82];
-rx(0.14295371502408735) q[82];
-ry(pi/2) q[83];
-rx(pi) q[83];
-cx q[8],q[83];
-rz(2.0297165742807874) q[83];
-cx q[8],q[83];
-rx(0.14295371502408735) q[8];
-cx q[68],q[83];
-rz(2.0297165742807874) q[83];
-cx q[68],q[83];
-rx(0.14295371502408735) q[68];
-rx(0.14295371502408735) q[83];
-ry(pi/2) q[84];
-rx(pi) q[84];
-cx q[70],q[84];
-rz(2.0297165742807874) q[84];
-cx q[70],q[84];
-rx(0.14295371502408735) q[70];
-cx q[73],q[84];
-rz(2.0297165742807874) q[84];
-cx q[73],q[84];
-rx(0.14295371502408735) q[73];
-rx(0.14295371502408735) q[84];
-ry(pi/2) q[85];
-rx(pi) q[85];
-cx q[37],q[85];
-rz(2.0297165742807874) q[85];
-cx q[37],q[85];
-rx(0.14295371502408735) q[37];
-cx q[59],q[85];
-rz(2.0297165742807874) q[85];
-cx q[59],q[85];
-rx(0.14295371502408735) q[59];
-rx(0.14295371502408735) q[85];
-ry(pi/2) q[86];
-rx(pi) q[86];
-cx q[24],q[86];
-rz(2.0297165742807874) q[86];
-cx q[24],q[86];
-rx(0.14295371502408735) q[24];
-cx q[53],q[86];
-rz(2.0297165742807874) q[86];
-cx q[53],q[86];
-rx(0.14295371502408735) q[53];
-rx(0.14295371502408735) q[86];
-ry(pi/2) q[87];
-rx(pi) q[87];
-cx q[28],q[87];
-rz(2.0297165742807874) q[87];
-cx q[28],q[87];
-cx q[32],q[87];
-rz(2.0297165742807874) q[87];
-cx q[32],q[87];
-rx(0.14295371502408735) q[87];
-ry(pi/2) q[88];
-rx(pi) q[88];
-cx q[3],q[88];
-rz(2.0297165742807874) q[88];
-cx q[3],q[88];
-cx q[60],q[88];
-rz(2.0297165742807874) q[88];
-cx q[60],q[88];
-rx(0.14295371502408735) q[60];
-rx(0.14295371502408735) q[88];
-ry(pi/2) q[89];
-rx(pi) q[89];
-cx q[2],q[89];
-rz(2.0297165742807874) q[89];
-cx q[2],q[89];
-rx(0.14295371502408735) q[2];
-cx q[5],q[89];
-rz(2.0297165742807874) q[89];
-cx q[5],q[89];
-ry(pi/2) q[90];
-rx(pi) q[90];
-cx q[15],q[90];
-rz(2.0297165742807874) q[90];
-cx q[15],q[90];
-cx q[27],q[90];
-rz(2.0297165742807874) q[90];
-cx q[27],q[90];
-rx(0.14295371502408735) q[90];
-ry(pi/2) q[91];
-rx(pi) q[91];
-cx q[0],q[91];
-rz(2.0297165742807874) q[91];
-cx q[0],q[91];
-cx q[6],q[91];
-rz(2.0297165742807874) q[91];
-cx q[6],q[91];
-rx(0.14295371502408735) q[6];
-rx(0.14295371502408735) q[91];
-ry(pi/2) q[92];
-rx(pi) q[92];
-cx q[15],q[92];
-rz(2.0297165742807874) q[92];
-cx q[15],q[92];
-rx(0.14295371502408735) q[15];
-cx q[89],q[92];
-rz(2.0297165742807874) q[92];
-cx q[89],q[92];
-rx(0.14295371502408735) q[89];
-ry(pi/2) q[93];
-rx(pi) q[93];
-cx q[0],q[93];
-rz(2.0297165742807874) q[93];
-cx q[0],q[93];
-rx(0.14295371502408735) q[0];
-cx q[32],q[93];
-rz(2.0297165742807874) q[93];
-cx q[32],q[93];
-rx(0.14295371502408735) q[32];
-rx(0.14295371502408735) q[93];
-ry(pi/2) q[94];
-rx(pi) q[94];
-cx q[36],q[94];
-rz(2.0297165742807874) q[94];
-cx q[36],q[94];
-cx q[55],q[94];
-rz(2.0297165742807874) q[94];
-cx q[55],q[94];
-rx(0.14295371502408735) q[55];
-rx(0.14295371502408735) q[94];
-ry(pi/2) q[95];
-rx(pi) q[95];
-cx q[5],q[95];
-rz(2.0297165742807874) q[95];
-cx q[5],q[95];
-cx q[27],q[95];
-rz(2.0297165742807874) q[95];
-cx q[27],q[95];
-rx(0.14295371502408735) q[27];
-rx(0.14295371502408735) q[95];
-ry(pi/2) q[96];
-rx(pi) q[96];
-cx q[56],q[96];
-rz(2.0297165742807874) q[96];
-cx q[56],q[96];
-rx(0.14295371502408735) q[56];
-cx q[92],q[96];
-rz(2.0297165742807874) q[96];
-cx q[92],q[96];
-rx(0.14295371502408735) q[92];
-rx(0.14295371502408735) q[96];
-ry(pi/2) q[97];
-rx(pi) q[97];
-cx q[1],q[97];
-rz(2.0297165742807874) q[97];
-cx q[1],q[97];
-rx(0.14295371502408735) q[1];
-cx q[0],q[1];
-rz(2.4401085386567147) q[1];
-cx q[0],q[1];
-cx q[0],q[2];
-rz(2.4401085386567147) q[2];
-cx q[0],q[2];
-cx q[2],q[89];
-cx q[7],q[97];
-rz(2.4401085386567147) q[89];
-cx q[2],q[89];
-rx(2.644092806367516) q[2];
-rz(2.0297165742807874) q[97];
-cx q[7],q[97];
-rx(0.14295371502408735) q[97];
-ry(pi/2) q[98];
-rx(pi) q[98];
-cx q[10],q[98];
-rz(2.0297165742807874) q[98];
-cx q[10],q[98];
-rx(0.14295371502408735) q[10];
-cx q[21],q[98];
-rz(2.0297165742807874) q[98];
-cx q[21],q[98];
-rx(0.14295371502408735) q[21];
-rx(0.14295371502408735) q[98];
-ry(pi/2) q[99];
-rx(pi) q[99];
-cx q[4],q[99];
-rz(2.0297165742807874) q[99];
-cx q[4],q[99];
-cx q[41],q[99];
-rz(2.0297165742807874) q[99];
-cx q[41],q[99];
-rx(0.14295371502408735) q[41];
-rx(0.14295371502408735) q[99];
-ry(pi/2) q[100];
-rx(pi) q[100];
-cx q[3],q[100];
-rz(2.0297165742807874) q[100];
-cx q[3],q[100];
-cx q[25],q[100];
-rz(2.0297165742807874) q[100];
-cx q[25],q[100];
-rx(0.14295371502408735) q[25];
-rx(0.14295371502408735) q[100];
-ry(pi/2) q[101];
-rx(pi) q[101];
-cx q[16],q[101];
-rz(2.0297165742807874) q[101];
-cx q[16],q[101];
-cx q[50],q[101];
-rz(2.0297165742807874) q[101];
-cx q[50],q[101];
-rx(0.14295371502408735) q[50];
-rx(0.14295371502408735) q[101];
-ry(pi/2) q[102];
-rx(pi) q[102];
-cx q[3],q[102];
-rz(2.0297165742807874) q[102];
-cx q[3],q[102];
-cx q[4],q[102];
-rz(2.0297165742807874) q[102];
-cx q[4],q[102];
-rx(0.14295371502408735) q[4];
-rx(0.14295371502408735) q[102];
-ry(pi/2) q[103];
-rx(pi) q[103];
-cx q[16],q[103];
-rz(2.0297165742807874) q[103];
-cx q[16],q[103];
-rx(0.14295371502408735) q[16];
-cx q[57],q[103];
-rz(2.0297165742807874) q[103];
-cx q[57],q[103];
-rx(0.14295371502408735) q[57];
-rx(0.14295371502408735) q[103];
-ry(pi/2) q[104];
-rx(pi) q[104];
-cx q[7],q[104];
-rz(2.0297165742807874) q[104];
-cx q[7],q[104];
-rx(0.14295371502408735) q[7];
-cx q[13],q[104];
-rz(2.0297165742807874) q[104];
-cx q[13],q[104];
-rx(0.14295371502408735) q[13];
-rx(0.14295371502408735) q[104];
-ry(pi/2) q[105];
-rx(pi) q[105];
-cx q[26],q[105];
-rz(2.0297165742807874) q[105];
-cx q[26],q[105];
-rx(0.14295371502408735) q[26];
-cx q[28],q[105];
-rz(2.0297165742807874) q[105];
-cx q[28],q[105];
-rx(0.14295371502408735) q[28];
-rx(0.14295371502408735) q[105];
-ry(pi/2) q[106];
-rx(pi) q[106];
-cx q[5],q[106];
-rz(2.0297165742807874) q[106];
-cx q[5],q[106];
-rx(0.14295371502408735) q[5];
-cx q[36],q[106];
-rz(2.0297165742807874) q[106];
-cx q[36],q[106];
-rx(0.14295371502408735) q[36];
-rx(0.14295371502408735) q[106];
-ry(pi/2) q[107];
-rx(pi) q[107];
-cx q[3],q[107];
-rz(2.0297165742807874) q[107];
-cx q[3],q[107];
-rx(0.14295371502408735) q[3];
-cx q[0],q[3];
-rz(2.4401085386567147) q[3];
-cx q[0],q[3];
-cx q[0],q[15];
-cx q[1],q[3];
-rz(2.4401085386567147) q[3];
-cx q[1],q[3];
-cx q[1],q[4];
-rz(2.4401085386567147) q[4];
-cx q[1],q[4];
-cx q[1],q[5];
-cx q[3],q[4];
-rz(2.4401085386567147) q[4];
-cx q[3],q[4];
-cx q[4],q[6];
-rz(2.4401085386567147) q[5];
-cx q[1],q[5];
-cx q[1],q[9];
-cx q[3],q[5];
-rz(2.4401085386567147) q[5];
-cx q[3],q[5];
-cx q[3],q[7];
-rz(2.4401085386567147) q[6];
-cx q[4],q[6];
-cx q[5],q[6];
-rz(2.4401085386567147) q[6];
-cx q[5],q[6];
-rz(2.4401085386567147) q[7];
-cx q[3],q[7];
-cx q[3],q[8];
-cx q[4],q[7];
-rz(2.4401085386567147) q[7];
-cx q[4],q[7];
-cx q[4],q[10];
-rz(2.4401085386567147) q[8];
-cx q[3],q[8];
-cx q[5],q[8];
-rz(2.4401085386567147) q[8];
-cx q[5],q[8];
-cx q[5],q[11];
-cx q[8],q[83];
-rz(2.4401085386567147) q[9];
-cx q[1],q[9];
-cx q[1],q[17];
-cx q[3],q[9];
-rz(2.4401085386567147) q[9];
-cx q[3],q[9];
-cx q[3],q[12];
-rz(2.4401085386567147) q[10];
-cx q[4],q[10];
-cx q[4],q[13];
-cx q[6],q[10];
-rz(2.4401085386567147) q[10];
-cx q[6],q[10];
-cx q[10],q[37];
-rz(2.4401085386567147) q[11];
-cx q[5],q[11];
-cx q[6],q[11];
-rz(2.4401085386567147) q[11];
-cx q[6],q[11];
-rx(2.644092806367516) q[11];
-rz(2.4401085386567147) q[12];
-cx q[3],q[12];
-cx q[3],q[14];
-cx q[5],q[12];
-rz(2.4401085386567147) q[12];
-cx q[5],q[12];
-rz(2.4401085386567147) q[13];
-cx q[4],q[13];
-cx q[5],q[13];
-rz(2.4401085386567147) q[13];
-cx q[5],q[13];
-rz(2.4401085386567147) q[14];
-cx q[3],q[14];
-cx q[4],q[14];
-rz(2.4401085386567147) q[14];
-cx q[4],q[14];
-rx(2.644092806367516) q[14];
-rz(2.4401085386567147) q[15];
-cx q[0],q[15];
-cx q[0],q[16];
-cx q[3],q[15];
-rz(2.4401085386567147) q[15];
-cx q[3],q[15];
-rz(2.4401085386567147) q[16];
-cx q[0],q[16];
-cx q[0],q[20];
-cx q[3],q[16];
-rz(2.4401085386567147) q[16];
-cx q[3],q[16];
-rz(2.4401085386567147) q[17];
-cx q[1],q[17];
-cx q[1],q[28];
-cx q[3],q[17];
-rz(2.4401085386567147) q[17];
-cx q[3],q[17];
-cx q[3],q[18];
-rz(2.4401085386567147) q[18];
-cx q[3],q[18];
-cx q[3],q[19];
-cx q[4],q[18];
-rz(2.4401085386567147) q[18];
-cx q[4],q[18];
-cx q[4],q[21];
-rz(2.4401085386567147) q[19];
-cx q[3],q[19];
-cx q[3],q[22];
-cx q[7],q[19];
-rz(2.4401085386567147) q[19];
-cx q[7],q[19];
-cx q[19],q[38];
-rz(2.4401085386567147) q[20];
-cx q[0],q[20];
-cx q[0],q[32];
-cx q[15],q[20];
-rz(2.4401085386567147) q[20];
-cx q[15],q[20];
-rz(2.4401085386567147) q[21];
-cx q[4],q[21];
-cx q[4],q[27];
-cx q[15],q[21];
-rz(2.4401085386567147) q[21];
-cx q[15],q[21];
-cx q[15],q[36];
-rz(2.4401085386567147) q[22];
-cx q[3],q[22];
-cx q[3],q[23];
-cx q[9],q[22];
-rz(2.4401085386567147) q[22];
-cx q[9],q[22];
-cx q[9],q[55];
-rx(2.644092806367516) q[22];
-rz(2.4401085386567147) q[23];
-cx q[3],q[23];
-cx q[3],q[24];
-cx q[17],q[23];
-rz(2.4401085386567147) q[23];
-cx q[17],q[23];
-rz(2.4401085386567147) q[24];
-cx q[3],q[24];
-cx q[3],q[25];
-cx q[5],q[24];
-rz(2.4401085386567147) q[24];
-cx q[5],q[24];
-cx q[5],q[33];
-cx q[24],q[54];
-rz(2.4401085386567147) q[25];
-cx q[3],q[25];
-cx q[3],q[26];
-cx q[12],q[25];
-rz(2.4401085386567147) q[25];
-cx q[12],q[25];
-rz(2.4401085386567147) q[26];
-cx q[3],q[26];
-cx q[21],q[26];
-rz(2.4401085386567147) q[26];
-cx q[21],q[26];
-rz(2.4401085386567147) q[27];
-cx q[4],q[27];
-cx q[4],q[47];
-cx q[6],q[27];
-rz(2.4401085386567147) q[27];
-cx q[6],q[27];
-cx q[6],q[69];
-rz(2.4401085386567147) q[28];
-cx q[1],q[28];
-cx q[1],q[29];
-cx q[3],q[28];
-rz(2.4401085386567147) q[28];
-cx q[3],q[28];
-rz(2.4401085386567147) q[29];
-cx q[1],q[29];
-cx q[1],q[45];
-cx q[3],q[29];
-rz(2.4401085386567147) q[29];
-cx q[3],q[29];
-cx q[3],q[30];
-rx(2.644092806367516) q[29];
-rz(2.4401085386567147) q[30];
-cx q[3],q[30];
-cx q[3],q[34];
-cx q[18],q[30];
-rz(2.4401085386567147) q[30];
-cx q[18],q[30];
-rx(2.644092806367516) q[18];
-cx q[31],q[107];
-rz(2.4401085386567147) q[32];
-cx q[0],q[32];
-cx q[0],q[42];
-cx q[21],q[32];
-rz(2.4401085386567147) q[32];
-cx q[21],q[32];
-rz(2.4401085386567147) q[33];
-cx q[5],q[33];
-cx q[5],q[46];
-cx q[30],q[33];
-rz(2.4401085386567147) q[33];
-cx q[30],q[33];
-rx(2.644092806367516) q[33];
-rz(2.4401085386567147) q[34];
-cx q[3],q[34];
-cx q[3],q[35];
-rz(2.4401085386567147) q[35];
-cx q[3],q[35];
-cx q[3],q[39];
-cx q[32],q[35];
-rz(2.4401085386567147) q[35];
-cx q[32],q[35];
-rx(2.644092806367516) q[35];
-rz(2.4401085386567147) q[36];
-cx q[15],q[36];
-cx q[20],q[36];
-rz(2.4401085386567147) q[36];
-cx q[20],q[36];
-cx q[36],q[94];
-rz(2.4401085386567147) q[37];
-cx q[10],q[37];
-cx q[10],q[41];
-rz(2.4401085386567147) q[38];
-cx q[19],q[38];
-rx(2.644092806367516) q[19];
-cx q[21],q[38];
-rz(2.4401085386567147) q[38];
-cx q[21],q[38];
-rz(2.4401085386567147) q[39];
-cx q[3],q[39];
-cx q[3],q[40];
-cx q[13],q[39];
-rz(2.4401085386567147) q[39];
-cx q[13],q[39];
-cx q[13],q[56];
-rx(2.644092806367516) q[39];
-rz(2.4401085386567147) q[40];
-cx q[3],q[40];
-cx q[23],q[40];
-rz(2.4401085386567147) q[40];
-cx q[23],q[40];
-rx(2.644092806367516) q[40];
-rz(2.4401085386567147) q[41];
-cx q[10],q[41];
-cx q[27],q[41];
-rz(2.4401085386567147) q[41];
-cx q[27],q[41];
-cx q[27],q[72];
-cx q[41],q[67];
-rz(2.4401085386567147) q[42];
-cx q[0],q[42];
-cx q[0],q[48];
-cx q[3],q[42];
-rz(2.4401085386567147) q[42];
-cx q[3],q[42];
-cx q[3],q[43];
-cx q[42],q[78];
-rz(2.4401085386567147) q[43];
-cx q[3],q[43];
-cx q[3],q[44];
-cx q[20],q[43];
-rz(2.4401085386567147) q[43];
-cx q[20],q[43];
-rx(2.644092806367516) q[20];
-rx(2.644092806367516) q[43];
-rz(2.4401085386567147) q[44];
-cx q[3],q[44];
-cx q[3],q[49];
-rz(2.4401085386567147) q[45];
-cx q[1],q[45];
-cx q[1],q[57];
-cx q[16],q[45];
-rz(2.4401085386567147) q[45];
-cx q[16],q[45];
-cx q[16],q[59];
-rz(2.4401085386567147) q[46];
-cx q[5],q[46];
-cx q[5],q[65];
-cx q[38],q[46];
-rz(2.4401085386567147) q[46];
-cx q[38],q[46];
-rx(2.644092806367516) q[38];
-rx(2.644092806367516) q[46];
-rz(2.4401085386567147) q[47];
-cx q[4],q[47];
-cx q[17],q[47];
-rz(2.4401085386567147) q[47];
-cx q[17],q[47];
-cx q[17],q[53];
-rz(2.4401085386567147) q[48];
-cx q[0],q[48];
-cx q[0],q[51];
-cx q[30],q[48];
-rz(2.4401085386567147) q[48];
-cx q[30],q[48];
-rx(2.644092806367516) q[48];
-rz(2.4401085386567147) q[49];
-cx q[3],q[49];
-cx q[3],q[50];
-cx q[4],q[49];
-rz(2.4401085386567147) q[49];
-cx q[4],q[49];
-cx q[4],q[61];
-rx(2.644092806367516) q[49];
-rz(2.4401085386567147) q[50];
-cx q[3],q[50];
-cx q[3],q[52];
-rz(2.4401085386567147) q[51];
-cx q[0],q[51];
-cx q[0],q[62];
-cx q[28],q[51];
-rz(2.4401085386567147) q[51];
-cx q[28],q[51];
-rx(2.644092806367516) q[51];
-rz(2.4401085386567147) q[52];
-cx q[3],q[52];
-cx q[10],q[52];
-rz(2.4401085386567147) q[52];
-cx q[10],q[52];
-rx(2.644092806367516) q[52];
-rz(2.4401085386567147) q[53];
-cx q[17],q[53];
-cx q[21],q[53];
-rz(2.4401085386567147) q[53];
-cx q[21],q[53];
-rz(2.4401085386567147) q[54];
-cx q[24],q[54];
-cx q[24],q[58];
-cx q[28],q[54];
-rz(2.4401085386567147) q[54];
-cx q[28],q[54];
-rx(2.644092806367516) q[54];
-rz(2.4401085386567147) q[55];
-cx q[9],q[55];
-cx q[9],q[80];
-cx q[15],q[55];
-rz(2.4401085386567147) q[55];
-cx q[15],q[55];
-rz(2.4401085386567147) q[56];
-cx q[13],q[56];
-cx q[13],q[68];
-cx q[45],q[56];
-rz(2.4401085386567147) q[56];
-cx q[45],q[56];
-rx(2.644092806367516) q[45];
-rz(2.4401085386567147) q[57];
-cx q[1],q[57];
-cx q[1],q[60];
-cx q[3],q[57];
-rz(2.4401085386567147) q[57];
-cx q[3],q[57];
-cx q[3],q[70];
-rz(2.4401085386567147) q[58];
-cx q[24],q[58];
-cx q[24],q[86];
-cx q[28],q[58];
-rz(2.4401085386567147) q[58];
-cx q[28],q[58];
-cx q[28],q[87];
-rx(2.644092806367516) q[58];
-rz(2.4401085386567147) q[59];
-cx q[16],q[59];
-cx q[16],q[73];
-cx q[32],q[59];
-rz(2.4401085386567147) q[59];
-cx q[32],q[59];
-rz(2.4401085386567147) q[60];
-cx q[1],q[60];
-cx q[1],q[97];
-cx q[7],q[60];
-rz(2.4401085386567147) q[60];
-cx q[7],q[60];
-rz(2.4401085386567147) q[61];
-cx q[4],q[61];
-cx q[4],q[99];
-cx q[7],q[61];
-rz(2.4401085386567147) q[61];
-cx q[7],q[61];
-rx(2.644092806367516) q[61];
-rz(2.4401085386567147) q[62];
-cx q[0],q[62];
-cx q[0],q[64];
-cx q[17],q[62];
-rz(2.4401085386567147) q[62];
-cx q[17],q[62];
-rx(2.644092806367516) q[62];
-rz(2.4401085386567147) q[64];
-cx q[0],q[64];
-cx q[0],q[75];
-cx q[10],q[64];
-rz(2.4401085386567147) q[64];
-cx q[10],q[64];
-cx q[10],q[98];
-rx(2.644092806367516) q[64];
-rz(2.4401085386567147) q[65];
-cx q[5],q[65];
-cx q[5],q[76];
-cx q[23],q[65];
-rz(2.4401085386567147) q[65];
-cx q[23],q[65];
-rx(2.644092806367516) q[23];
-rx(2.644092806367516) q[65];
-rz(2.4401085386567147) q[67];
-cx q[41],q[67];
-cx q[56],q[67];
-rz(2.4401085386567147) q[67];
-cx q[56],q[67];
-cx q[56],q[74];
-rx(2.644092806367516) q[67];
-rz(2.4401085386567147) q[68];
-cx q[13],q[68];
-cx q[32],q[68];
-rz(2.4401085386567147) q[68];
-cx q[32],q[68];
-rz(2.4401085386567147) q[69];
-cx q[6],q[69];
-cx q[59],q[69];
-rz(2.4401085386567147) q[69];
-cx q[59],q[69];
-rx(2.644092806367516) q[69];
-rz(2.4401085386567147) q[70];
-cx q[3],q[70];
-cx q[3],q[71];
-cx q[15],q[70];
-rz(2.4401085386567147) q[70];
-cx q[15],q[70];
-cx q[70],q[84];
-rz(2.4401085386567147) q[71];
-cx q[3],q[71];
-cx q[3],q[77];
-cx q[53],q[71];
-rz(2.4401085386567147) q[71];
-cx q[53],q[71];
-rx(2.644092806367516) q[71];
-rz(2.4401085386567147) q[72];
-cx q[27],q[72];
-rz(2.4401085386567147) q[73];
-cx q[16],q[73];
-cx q[16],q[101];
-cx q[59],q[73];
-rz(2.4401085386567147) q[73];
-cx q[59],q[73];
-rz(2.4401085386567147) q[74];
-cx q[56],q[74];
-rz(2.4401085386567147) q[75];
-cx q[0],q[75];
-cx q[0],q[82];
-cx q[21],q[75];
-rz(2.4401085386567147) q[75];
-cx q[21],q[75];
-cx q[21],q[81];
-rx(2.644092806367516) q[75];
-rz(2.4401085386567147) q[76];
-cx q[5],q[76];
-cx q[5],q[89];
-cx q[6],q[76];
-rz(2.4401085386567147) q[76];
-cx q[6],q[76];
-cx q[6],q[79];
-rx(2.644092806367516) q[76];
-rz(2.4401085386567147) q[77];
-cx q[3],q[77];
-cx q[3],q[88];
-cx q[30],q[77];
-rz(2.4401085386567147) q[77];
-cx q[30],q[77];
-rx(2.644092806367516) q[30];
-rz(2.4401085386567147) q[78];
-cx q[42],q[78];
-rx(2.644092806367516) q[42];
-cx q[60],q[78];
-rz(2.4401085386567147) q[78];
-cx q[60],q[78];
-rx(2.644092806367516) q[78];
-rz(2.4401085386567147) q[79];
-cx q[6],q[79];
-rz(2.4401085386567147) q[80];
-cx q[9],q[80];
-rx(2.644092806367516) q[9];
-cx q[15],q[80];
-rz(2.4401085386567147) q[80];
-cx q[15],q[80];
-cx q[15],q[90];
-rx(2.644092806367516) q[80];
-rz(2.4401085386567147) q[81];
-cx q[21],q[81];
-cx q[77],q[81];
-rz(2.4401085386567147) q[81];
-cx q[77],q[81];
-rx(2.644092806367516) q[77];
-rx(2.644092806367516) q[81];
-rz(2.4401085386567147) q[82];
-cx q[0],q[82];
-cx q[0],q[91];
-cx q[56],q[82];
-rz(2.4401085386567147) q[82];
-cx q[56],q[82];
-cx q[56],q[96];
-rx(2.644092806367516) q[82];
-rz(2.4401085386567147) q[83];
-cx q[8],q[83];
-rx(2.644092806367516) q[8];
-cx q[68],q[83];
-rz(2.4401085386567147) q[83];
-cx q[68],q[83];
-rx(2.644092806367516) q[68];
-rx(2.644092806367516) q[83];
-rz(2.4401085386567147) q[84];
-cx q[70],q[84];
-rx(2.644092806367516) q[70];
-cx q[73],q[84];
-rz(2.4401085386567147) q[84];
-cx q[73],q[84];
-rx(2.644092806367516) q[73];
-rx(2.644092806367516) q[84];
-rz(2.4401085386567147) q[86];
-cx q[24],q[86];
-rx(2.644092806367516) q[24];
-cx q[53],q[86];
-rz(2.4401085386567147) q[86];
-cx q[53],q[86];
-rx(2.644092806367516) q[53];
-rx(2.644092806367516) q[86];
-rz(2.4401085386567147) q[87];
-cx q[28],q[87];
-cx q[32],q[87];
-rz(2.4401085386567147) q[87];
-cx q[32],q[87];
-rx(2.644092806367516) q[87];
-rz(2.4401085386567147) q[88];
-cx q[3],q[88];
-cx q[3],q[100];
-cx q[60],q[88];
-rz(2.4401085386567147) q[88];
-cx q[60],q[88];
-rx(2.644092806367516) q[60];
-rx(2.644092806367516) q[88];
-rz(2.4401085386567147) q[89];
-cx q[5],q[89];
-cx q[5],q[95];
-rz(2.4401085386567147) q[90];
-cx q[15],q[90];
-cx q[15],q[92];
-cx q[27],q[90];
-rz(2.4401085386567147) q[90];
-cx q[27],q[90];
-rx(2.644092806367516) q[90];
-rz(2.4401085386567147) q[91];
-cx q[0],q[91];
-cx q[0],q[93];
-cx q[6],q[91];
-rz(2.4401085386567147) q[91];
-cx q[6],q[91];
-rx(2.644092806367516) q[6];
-rx(2.644092806367516) q[91];
-rz(2.4401085386567147) q[92];
-cx q[15],q[92];
-rx(2.644092806367516) q[15];
-cx q[89],q[92];
-rz(2.4401085386567147) q[92];
-cx q[89],q[92];
-rx(2.644092806367516) q[89];
-rz(2.4401085386567147) q[93];
-cx q[0],q[93];
-rx(2.644092806367516) q[0];
-cx q[32],q[93];
-rz(2.4401085386567147) q[93];
-cx q[32],q[93];
-rx(2.644092806367516) q[32];
-rx(2.644092806367516) q[93];
-rz(2.4401085386567147) q[94];
-cx q[36],q[94];
-cx q[55],q[94];
-rz(2.4401085386567147) q[94];
-cx q[55],q[94];
-rx(2.644092806367516) q[55];
-rx(2.644092806367516) q[94];
-rz(2.4401085386567147) q[95];
-cx q[5],q[95];
-cx q[5],q[106];
-cx q[27],q[95];
-rz(2.4401085386567147) q[95];
-cx q[27],q[95];
-rx(2.644092806367516) q[27];
-rx(2.644092806367516) q[95];
-rz(2.4401085386567147) q[96];
-cx q[56],q[96];
-rx(2.644092806367516) q[56];
-cx q[92],q[96];
-rz(2.4401085386567147) q[96];
-cx q[92],q[96];
-rx(2.644092806367516) q[92];
-rx(2.644092806367516) q[96];
-rz(2.4401085386567147) q[97];
-cx q[1],q[97];
-rx(2.644092806367516) q[1];
-cx q[0],q[1];
-rz(2.3898457559225412) q[1];
-cx q[0],q[1];
-cx q[0],q[2];
-rz(2.3898457559225412) q[2];
-cx q[0],q[2];
-cx q[2],q[89];
-cx q[7],q[97];
-rz(2.3898457559225412) q[89];
-cx q[2],q[89];
-rx(8.436849296326734) q[2];
-rz(2.4401085386567147) q[97];
-cx q[7],q[97];
-cx q[7],q[104];
-rx(2.644092806367516) q[97];
-rz(2.4401085386567147) q[98];
-cx q[10],q[98];
-rx(2.644092806367516) q[10];
-cx q[21],q[98];
-rz(2.4401085386567147) q[98];
-cx q[21],q[98];
-rx(2.644092806367516) q[21];
-rx(2.644092806367516) q[98];
-rz(2.4401085386567147) q[99];
-cx q[4],q[99];
-cx q[41],q[99];
-rz(2.4401085386567147) q[99];
-cx q[41],q[99];
-rx(2.644092806367516) q[41];
-rx(2.644092806367516) q[99];
-rz(2.4401085386567147) q[100];
-cx q[3],q[100];
-cx q[3],q[102];
-cx q[25],q[100];
-rz(2.4401085386567147) q[100];
-cx q[25],q[100];
-rx(2.644092806367516) q[25];
-rx(2.644092806367516) q[100];
-rz(2.4401085386567147) q[101];
-cx q[16],q[101];
-cx q[16],q[103];
-rz(2.4401085386567147) q[102];
-cx q[3],q[102];
-cx q[4],q[102];
-rz(2.4401085386567147) q[102];
-cx q[4],q[102];
-rx(2.644092806367516) q[4];
-rx(2.644092806367516) q[102];
-rz(2.4401085386567147) q[103];
-cx q[16],q[103];
-rx(2.644092806367516) q[16];
-cx q[57],q[103];
-rz(2.4401085386567147) q[103];
-cx q[57],q[103];
-rx(2.644092806367516) q[57];
-rx(2.644092806367516) q[103];
-rz(2.4401085386567147) q[104];
-cx q[7],q[104];
-rx(2.644092806367516) q[7];
-cx q[13],q[104];
-rz(2.4401085386567147) q[104];
-cx q[13],q[104];
-rx(2.644092806367516) q[13];
-rx(2.644092806367516) q[104];
-rz(2.4401085386567147) q[106];
-cx q[5],q[106];
-rx(2.644092806367516) q[5];
-cx q[36],q[106];
-rz(2.4401085386567147) q[106];
-cx q[36],q[106];
-rx(2.644092806367516) q[36];
-rx(2.644092806367516) q[106];
-rz(2.0297165742807874) q[107];
-cx q[31],q[107];
-rx(0.14295371502408735) q[31];
-cx q[12],q[31];
-rz(2.4401085386567147) q[31];
-cx q[12],q[31];
-cx q[12],q[34];
-cx q[26],q[31];
-rz(2.4401085386567147) q[31];
-cx q[26],q[31];
-cx q[26],q[105];
-rz(2.4401085386567147) q[34];
-cx q[12],q[34];
-cx q[12],q[44];
-cx q[34],q[37];
-rz(2.4401085386567147) q[37];
-cx q[34],q[37];
-rx(2.644092806367516) q[34];
-cx q[37],q[85];
-rz(2.4401085386567147) q[44];
-cx q[12],q[44];
-cx q[12],q[50];
-cx q[44],q[72];
-rz(2.4401085386567147) q[50];
-cx q[12],q[50];
-cx q[12],q[63];
-cx q[50],q[79];
-rz(2.4401085386567147) q[63];
-cx q[12],q[63];
-rx(2.644092806367516) q[12];
-cx q[17],q[63];
-rz(2.4401085386567147) q[63];
-cx q[17],q[63];
-cx q[17],q[66];
-cx q[63],q[74];
-rz(2.4401085386567147) q[66];
-cx q[17],q[66];
-rx(2.644092806367516) q[17];
-cx q[47],q[66];
-rz(2.4401085386567147) q[66];
-cx q[47],q[66];
-rx(2.644092806367516) q[47];
-rx(2.644092806367516) q[66];
-rz(2.4401085386567147) q[72];
-cx q[44],q[72];
-rx(2.644092806367516) q[44];
-rx(2.644092806367516) q[72];
-rz(2.4401085386567147) q[74];
-cx q[63],q[74];
-rx(2.644092806367516) q[63];
-rx(2.644092806367516) q[74];
-rz(2.4401085386567147) q[79];
-cx q[50],q[79];
-cx q[50],q[101];
-rx(2.644092806367516) q[79];
-rz(2.4401085386567147) q[85];
-cx q[37],q[85];
-rx(2.644092806367516) q[37];
-cx q[59],q[85];
-rz(2.4401085386567147) q[85];
-cx q[59],q[85];
-rx(2.644092806367516) q[59];
-rx(2.644092806367516) q[85];
-rz(2.4401085386567147) q[101];
-cx q[50],q[101];
-rx(2.644092806367516) q[50];
-rx(2.644092806367516) q[101];
-rz(2.4401085386567147) q[105];
-cx q[26],q[105];
-rx(2.644092806367516) q[26];
-cx q[28],q[105];
-rz(2.4401085386567147) q[105];
-cx q[28],q[105];
-rx(2.644092806367516) q[28];
-rx(2.644092806367516) q[105];
-rx(0.14295371502408735) q[107];
-cx q[3],q[107];
-rz(2.4401085386567147) q[107];
-cx q[3],q[107];
-rx(2.644092806367516) q[3];
-cx q[0],q[3];
-rz(2.3898457559225412) q[3];
-cx q[0],q[3];
-cx q[0],q[15];
-cx q[1],q[3];
-rz(2.3898457559225412) q[3];
-cx q[1],q[3];
-cx q[1],q[4];
-rz(2.3898457559225412) q[4];
-cx q[1],q[4];
-cx q[1],q[5];
-cx q[3],q[4];
-rz(2.3898457559225412) q[4];
-cx q[3],q[4];
-cx q[4],q[6];
-rz(2.3898457559225412) q[5];
-cx q[1],q[5];
-cx q[1],q[9];
-cx q[3],q[5];
-rz(2.3898457559225412) q[5];
-cx q[3],q[5];
-cx q[3],q[7];
-rz(2.3898457559225412) q[6];
-cx q[4],q[6];
-cx q[5],q[6];
-rz(2.3898457559225412) q[6];
-cx q[5],q[6];
-rz(2.3898457559225412) q[7];
-cx q[3],q[7];
-cx q[3],q[8];
-cx q[4],q[7];
-rz(2.3898457559225412) q[7];
-cx q[4],q[7];
-cx q[4],q[10];
-rz(2.3898457559225412) q[8];
-cx q[3],q[8];
-cx q[5],q[8];
-rz(2.3898457559225412) q[8];
-cx q[5],q[8];
-cx q[5],q[11];
-cx q[8],q[83];
-rz(2.3898457559225412) q[9];
-cx q[1],q[9];
-cx q[1],q[17];
-cx q[3],q[9];
-rz(2.3898457559225412) q[9];
-cx q[3],q[9];
-cx q[3],q[12];
-rz(2.3898457559225412) q[10];
-cx q[4],q[10];
-cx q[4],q[13];
-cx q[6],q[10];
-rz(2.3898457559225412) q[10];
-cx q[6],q[10];
-cx q[10],q[37];
-rz(2.3898457559225412) q[11];
-cx q[5],q[11];
-cx q[6],q[11];
-rz(2.3898457559225412) q[11];
-cx q[6],q[11];
-rx(8.436849296326734) q[11];
-rz(2.3898457559225412) q[12];
-cx q[3],q[12];
-cx q[3],q[14];
-cx q[5],q[12];
-rz(2.3898457559225412) q[12];
-cx q[5],q[12];
-rz(2.3898457559225412) q[13];
-cx q[4],q[13];
-cx q[5],q[13];
-rz(2.3898457559225412) q[13];
-cx q[5],q[13];
-rz(2.3898457559225412) q[14];
-cx q[3],q[14];
-cx q[4],q[14];
-rz(2.3898457559225412) q[14];
-cx q[4],q[14];
-rx(8.436849296326734) q[14];
-rz(2.3898457559225412) q[15];
-cx q[0],q[15];
-cx q[0],q[16];
-cx q[3],q[15];
-rz(2.3898457559225412) q[15];
-cx q[3],q[15];
-rz(2.3898457559225412) q[16];
-cx q[0],q[16];
-cx q[0],q[20];
-cx q[3],q[16];
-rz(2.3898457559225412) q[16];
-cx q[3],q[16];
-rz(2.3898457559225412) q[17];
-cx q[1],q[17];
-cx q[1],q[28];
-cx q[3],q[17];
-rz(2.3898457559225412) q[17];
-cx q[3],q[17];
-cx q[3],q[18];
-rz(2.3898457559225412) q[18];
-cx q[3],q[18];
-cx q[3],q[19];
-cx q[4],q[18];
-rz(2.3898457559225412) q[18];
-cx q[4],q[18];
-cx q[4],q[21];
-rz(2.3898457559225412) q[19];
-cx q[3],q[19];
-cx q[3],q[22];
-cx q[7],q[19];
-rz(2.3898457559225412) q[19];
-cx q[7],q[19];
-cx q[19],q[38];
-rz(2.3898457559225412) q[20];
-cx q[0],q[20];
-cx q[0],q[32];
-cx q[15],q[20];
-rz(2.3898457559225412) q[20];
-cx q[15],q[20];
-rz(2.3898457559225412) q[21];
-cx q[4],q[21];
-cx q[4],q[27];
-cx q[15],q[21];
-rz(2.3898457559225412) q[21];
-cx q[15],q[21];
-cx q[15],q[36];
-rz(2.3898457559225412) q[22];
-cx q[3],q[22];
-cx q[3],q[23];
-cx q[9],q[22];
-rz(2.3898457559225412) q[22];
-cx q[9],q[22];
-cx q[9],q[55];
-rx(8.436849296326734) q[22];
-rz(2.3898457559225412) q[23];
-cx q[3],q[23];
-cx q[3],q[24];
-cx q[17],q[23];
-rz(2.3898457559225412) q[23];
-cx q[17],q[23];
-rz(2.3898457559225412) q[24];
-cx q[3],q[24];
-cx q[3],q[25];
-cx q[5],q[24];
-rz(2.3898457559225412) q[24];
-cx q[5],q[24];
-cx q[5],q[33];
-cx q[24],q[54];
-rz(2.3898457559225412) q[25];
-cx q[3],q[25];
-cx q[3],q[26];
-cx q[12],q[25];
-rz(2.3898457559225412) q[25];
-cx q[12],q[25];
-rz(2.3898457559225412) q[26];
-cx q[3],q[26];
-cx q[21],q[26];
-rz(2.3898457559225412) q[26];
-cx q[21],q[26];
-rz(2.3898457559225412) q[27];
-cx q[4],q[27];
-cx q[4],q[47];
-cx q[6],q[27];
-rz(2.3898457559225412) q[27];
-cx q[6],q[27];
-cx q[6],q[69];
-rz(2.3898457559225412) q[28];
-cx q[1],q[28];
-cx q[1],q[29];
-cx q[3],q[28];
-rz(2.3898457559225412) q[28];
-cx q[3],q[28];
-rz(2.3898457559225412) q[29];
-cx q[1],q[29];
-cx q[1],q[45];
-cx q[3],q[29];
-rz(2.3898457559225412) q[29];
-cx q[3],q[29];
-cx q[3],q[30];
-rx(8.436849296326734) q[29];
-rz(2.3898457559225412) q[30];
-cx q[3],q[30];
-cx q[3],q[34];
-cx q[18],q[30];
-rz(2.3898457559225412) q[30];
-cx q[18],q[30];
-rx(8.436849296326734) q[18];
-cx q[31],q[107];
-rz(2.3898457559225412) q[32];
-cx q[0],q[32];
-cx q[0],q[42];
-cx q[21],q[32];
-rz(2.3898457559225412) q[32];
-cx q[21],q[32];
-rz(2.3898457559225412) q[33];
-cx q[5],q[33];
-cx q[5],q[46];
-cx q[30],q[33];
-rz(2.3898457559225412) q[33];
-cx q[30],q[33];
-rx(8.436849296326734) q[33];
-rz(2.3898457559225412) q[34];
-cx q[3],q[34];
-cx q[3],q[35];
-rz(2.3898457559225412) q[35];
-cx q[3],q[35];
-cx q[3],q[39];
-cx q[32],q[35];
-rz(2.3898457559225412) q[35];
-cx q[32],q[35];
-rx(8.436849296326734) q[35];
-rz(2.3898457559225412) q[36];
-cx q[15],q[36];
-cx q[20],q[36];
-rz(2.3898457559225412) q[36];
-cx q[20],q[36];
-cx q[36],q[94];
-rz(2.3898457559225412) q[37];
-cx q[10],q[37];
-cx q[10],q[41];
-rz(2.3898457559225412) q[38];
-cx q[19],q[38];
-rx(8.436849296326734) q[19];
-cx q[21],q[38];
-rz(2.3898457559225412) q[38];
-cx q[21],q[38];
-rz(2.3898457559225412) q[39];
-cx q[3],q[39];
-cx q[3],q[40];
-cx q[13],q[39];
-rz(2.3898457559225412) q[39];
-cx q[13],q[39];
-cx q[13],q[56];
-rx(8.436849296326734) q[39];
-rz(2.3898457559225412) q[40];
-cx q[3],q[40];
-cx q[23],q[40];
-rz(2.3898457559225412) q[40];
-cx q[23],q[40];
-rx(8.436849296326734) q[40];
-rz(2.3898457559225412) q[41];
-cx q[10],q[41];
-cx q[27],q[41];
-rz(2.3898457559225412) q[41];
-cx q[27],q[41];
-cx q[27],q[72];
-cx q[41],q[67];
-rz(2.3898457559225412) q[42];
-cx q[0],q[42];
-cx q[0],q[48];
-cx q[3],q[42];
-rz(2.3898457559225412) q[42];
-cx q[3],q[42];
-cx q[3],q[43];
-cx q[42],q[78];
-rz(2.3898457559225412) q[43];
-cx q[3],q[43];
-cx q[3],q[44];
-cx q[20],q[43];
-rz(2.3898457559225412) q[43];
-cx q[20],q[43];
-rx(8.436849296326734) q[20];
-rx(8.436849296326734) q[43];
-rz(2.3898457559225412) q[44];
-cx q[3],q[44];
-cx q[3],q[49];
-rz(2.3898457559225412) q[45];
-cx q[1],q[45];
-cx q[1],q[57];
-cx q[16],q[45];
-rz(2.3898457559225412) q[45];
-cx q[16],q[45];
-cx q[16],q[59];
-rz(2.3898457559225412) q[46];
-cx q[5],q[46];
-cx q[5],q[65];
-cx q[38],q[46];
-rz(2.3898457559225412) q[46];
-cx q[38],q[46];
-rx(8.436849296326734) q[38];
-rx(8.436849296326734) q[46];
-rz(2.3898457559225412) q[47];
-cx q[4],q[47];
-cx q[17],q[47];
-rz(2.3898457559225412) q[47];
-cx q[17],q[47];
-cx q[17],q[53];
-rz(2.3898457559225412) q[48];
-cx q[0],q[48];
-cx q[0],q[51];
-cx q[30],q[48];
-rz(2.3898457559225412) q[48];
-cx q[30],q[48];
-rx(8.436849296326734) q[48];
-rz(2.3898457559225412) q[49];
-cx q[3],q[49];
-cx q[3],q[50];
-cx q[4],q[49];
-rz(2.3898457559225412) q[49];
-cx q[4],q[49];
-cx q[4],q[61];
-rx(8.436849296326734) q[49];
-rz(2.3898457559225412) q[50];
-cx q[3],q[50];
-cx q[3],q[52];
-rz(2.3898457559225412) q[51];
-cx q[0],q[51];
-cx q[0],q[62];
-cx q[28],q[51];
-rz(2.3898457559225412) q[51];
-cx q[28],q[51];
-rx(8.436849296326734) q[51];
-rz(2.3898457559225412) q[52];
-cx q[3],q[52];
-cx q[10],q[52];
-rz(2.3898457559225412) q[52];
-cx q[10],q[52];
-rx(8.436849296326734) q[52];
-rz(2.3898457559225412) q[53];
-cx q[17],q[53];
-cx q[21],q[53];
-rz(2.3898457559225412) q[53];
-cx q[21],q[53];
-rz(2.3898457559225412) q[54];
-cx q[24],q[54];
-cx q[24],q[58];
-cx q[28],q[54];
-rz(2.3898457559225412) q[54];
-cx q[28],q[54];
-rx(8.436849296326734) q[54];
-rz(2.3898457559225412) q[55];
-cx q[9],q[55];
-cx q[9],q[80];
-cx q[15],q[55];
-rz(2.3898457559225412) q[55];
-cx q[15],q[55];
-rz(2.3898457559225412) q[56];
-cx q[13],q[56];
-cx q[13],q[68];
-cx q[45],q[56];
-rz(2.3898457559225412) q[56];
-cx q[45],q[56];
-rx(8.436849296326734) q[45];
-rz(2.3898457559225412) q[57];
-cx q[1],q[57];
-cx q[1],q[60];
-cx q[3],q[57];
-rz(2.3898457559225412) q[57];
-cx q[3],q[57];
-cx q[3],q[70];
-rz(2.3898457559225412) q[58];
-cx q[24],q[58];
-cx q[24],q[86];
-cx q[28],q[58];
-rz(2.3898457559225412) q[58];
-cx q[28],q[58];
-cx q[28],q[87];
-rx(8.436849296326734) q[58];
-rz(2.3898457559225412) q[59];
-cx q[16],q[59];
-cx q[16],q[73];
-cx q[32],q[59];
-rz(2.3898457559225412) q[59];
-cx q[32],q[59];
-rz(2.3898457559225412) q[60];
-cx q[1],q[60];
-cx q[1],q[97];
-cx q[7],q[60];
-rz(2.3898457559225412) q[60];
-cx q[7],q[60];
-rz(2.3898457559225412) q[61];
-cx q[4],q[61];
-cx q[4],q[99];
-cx q[7],q[61];
-rz(2.3898457559225412) q[61];
-cx q[7],q[61];
-rx(8.436849296326734) q[61];
-rz(2.3898457559225412) q[62];
-cx q[0],q[62];
-cx q[0],q[64];
-cx q[17],q[62];
-rz(2.3898457559225412) q[62];
-cx q[17],q[62];
-rx(8.436849296326734) q[62];
-rz(2.3898457559225412) q[64];
-cx q[0],q[64];
-cx q[0],q[75];
-cx q[10],q[64];
-rz(2.3898457559225412) q[64];
-cx q[10],q[64];
-cx q[10],q[98];
-rx(8.436849296326734) q[64];
-rz(2.3898457559225412) q[65];
-cx q[5],q[65];
-cx q[5],q[76];
-cx q[23],q[65];
-rz(2.3898457559225412) q[65];
-cx q[23],q[65];
-rx(8.436849296326734) q[23];
-rx(8.436849296326734) q[65];
-rz(2.3898457559225412) q[67];
-cx q[41],q[67];
-cx q[56],q[67];
-rz(2.3898457559225412) q[67];
-cx q[56],q[67];
-cx q[56],q[74];
-rx(8.436849296326734) q[67];
-rz(2.3898457559225412) q[68];
-cx q[13],q[68];
-cx q[32],q[68];
-rz(2.3898457559225412) q[68];
-cx q[32],q[68];
-rz(2.3898457559225412) q[69];
-cx q[6],q[69];
-cx q[59],q[69];
-rz(2.3898457559225412) q[69];
-cx q[59],q[69];
-rx(8.436849296326734) q[69];
-rz(2.3898457559225412) q[70];
-cx q[3],q[70];
-cx q[3],q[71];
-cx q[15],q[70];
-rz(2.3898457559225412) q[70];
-cx q[15],q[70];
-cx q[70],q[84];
-rz(2.3898457559225412) q[71];
-cx q[3],q[71];
-cx q[3],q[77];
-cx q[53],q[71];
-rz(2.3898457559225412) q[71];
-cx q[53],q[71];
-rx(8.436849296326734) q[71];
-rz(2.3898457559225412) q[72];
-cx q[27],q[72];
-rz(2.3898457559225412) q[73];
-cx q[16],q[73];
-cx q[16],q[101];
-cx q[59],q[73];
-rz(2.3898457559225412) q[73];
-cx q[59],q[73];
-rz(2.3898457559225412) q[74];
-cx q[56],q[74];
-rz(2.3898457559225412) q[75];
-cx q[0],q[75];
-cx q[0],q[82];
-cx q[21],q[75];
-rz(2.3898457559225412) q[75];
-cx q[21],q[75];
-cx q[21],q[81];
-rx(8.436849296326734) q[75];
-rz(2.3898457559225412) q[76];
-cx q[5],q[76];
-cx q[5],q[89];
-cx q[6],q[76];
-rz(2.3898457559225412) q[76];
-cx q[6],q[76];
-cx q[6],q[79];
-rx(8.436849296326734) q[76];
-rz(2.3898457559225412) q[77];
-cx q[3],q[77];
-cx q[3],q[88];
-cx q[30],q[77];
-rz(2.3898457559225412) q[77];
-cx q[30],q[77];
-rx(8.436849296326734) q[30];
-rz(2.3898457559225412) q[78];
-cx q[42],q[78];
-rx(8.436849296326734) q[42];
-cx q[60],q[78];
-rz(2.3898457559225412) q[78];
-cx q[60],q[78];
-rx(8.436849296326734) q[78];
-rz(2.3898457559225412) q[79];
-cx q[6],q[79];
-rz(2.3898457559225412) q[80];
-cx q[9],q[80];
-rx(8.436849296326734) q[9];
-cx q[15],q[80];
-rz(2.3898457559225412) q[80];
-cx q[15],q[80];
-cx q[15],q[90];
-rx(8.436849296326734) q[80];
-rz(2.3898457559225412) q[81];
-cx q[21],q[81];
-cx q[77],q[81];
-rz(2.3898457559225412) q[81];
-cx q[77],q[81];
-rx(8.436849296326734) q[77];
-rx(8.436849296326734) q[81];
-rz(2.3898457559225412) q[82];
-cx q[0],q[82];
-cx q[0],q[91];
-cx q[56],q[82];
-rz(2.3898457559225412) q[82];
-cx q[56],q[82];
-cx q[56],q[96];
-rx(8.436849296326734) q[82];
-rz(2.3898457559225412) q[83];
-cx q[8],q[83];
-rx(8.436849296326734) q[8];
-cx q[68],q[83];
-rz(2.3898457559225412) q[83];
-cx q[68],q[83];
-rx(8.436849296326734) q[68];
-rx(8.436849296326734) q[83];
-rz(2.3898457559225412) q[84];
-cx q[70],q[84];
-rx(8.436849296326734) q[70];
-cx q[73],q[84];
-rz(2.3898457559225412) q[84];
-cx q[73],q[84];
-rx(8.436849296326734) q[73];
-rx(8.436849296326734) q[84];
-rz(2.3898457559225412) q[86];
-cx q[24],q[86];
-rx(8.436849296326734) q[24];
-cx q[53],q[86];
-rz(2.3898457559225412) q[86];
-cx q[53],q[86];
-rx(8.436849296326734) q[53];
-rx(8.436849296326734) q[86];
-rz(2.3898457559225412) q[87];
-cx q[28],q[87];
-cx q[32],q[87];
-rz(2.3898457559225412) q[87];
-cx q[32],q[87];
-rx(8.436849296326734) q[87];
-rz(2.3898457559225412) q[88];
-cx q[3],q[88];
-cx q[3],q[100];
-cx q[60],q[88];
-rz(2.3898457559225412) q[88];
-cx q[60],q[88];
-rx(8.436849296326734) q[60];
-rx(8.436849296326734) q[88];
-rz(2.3898457559225412) q[89];
-cx q[5],q[89];
-cx q[5],q[95];
-rz(2.3898457559225412) q[90];
-cx q[15],q[90];
-cx q[15],q[92];
-cx q[27],q[90];
-rz(2.3898457559225412) q[90];
-cx q[27],q[90];
-rx(8.436849296326734) q[90];
-rz(2.3898457559225412) q[91];
-cx q[0],q[91];
-cx q[0],q[93];
-cx q[6],q[91];
-rz(2.3898457559225412) q[91];
-cx q[6],q[91];
-rx(8.436849296326734) q[6];
-rx(8.436849296326734) q[91];
-rz(2.3898457559225412) q[92];
-cx q[15],q[92];
-rx(8.436849296326734) q[15];
-cx q[89],q[92];
-rz(2.3898457559225412) q[92];
-cx q[89],q[92];
-rx(8.436849296326734) q[89];
-rz(2.3898457559225412) q[93];
-cx q[0],q[93];
-rx(8.436849296326734) q[0];
-cx q[32],q[93];
-rz(2.3898457559225412) q[93];
-cx q[32],q[93];
-rx(8.436849296326734) q[32];
-rx(8.436849296326734) q[93];
-rz(2.3898457559225412) q[94];
-cx q[36],q[94];
-cx q[55],q[94];
-rz(2.3898457559225412) q[94];
-cx q[55],q[94];
-rx(8.436849296326734) q[55];
-rx(8.436849296326734) q[94];
-rz(2.3898457559225412) q[95];
-cx q[5],q[95];
-cx q[5],q[106];
-cx q[27],q[95];
-rz(2.3898457559225412) q[95];
-cx q[27],q[95];
-rx(8.436849296326734) q[27];
-rx(8.436849296326734) q[95];
-rz(2.3898457559225412) q[96];
-cx q[56],q[96];
-rx(8.436849296326734) q[56];
-cx q[92],q[96];
-rz(2.3898457559225412) q[96];
-cx q[92],q[96];
-rx(8.436849296326734) q[92];
-rx(8.436849296326734) q[96];
-rz(2.3898457559225412) q[97];
-cx q[1],q[97];
-rx(8.436849296326734) q[1];
-cx q[7],q[97];
-rz(2.3898457559225412) q[97];
-cx q[7],q[97];
-cx q[7],q[104];
-rx(8.436849296326734) q[97];
-rz(2.3898457559225412) q[98];
-cx q[10],q[98];
-rx(8.436849296326734) q[10];
-cx q[21],q[98];
-rz(2.3898457559225412) q[98];
-cx q[21],q[98];
-rx(8.436849296326734) q[21];
-rx(8.436849296326734) q[98];
-rz(2.3898457559225412) q[99];
-cx q[4],q[99];
-cx q[41],q[99];
-rz(2.3898457559225412) q[99];
-cx q[41],q[99];
-rx(8.436849296326734) q[41];
-rx(8.436849296326734) q[99];
-rz(2.3898457559225412) q[100];
-cx q[3],q[100];
-cx q[3],q[102];
-cx q[25],q[100];
-rz(2.3898457559225412) q[100];
-cx q[25],q[100];
-rx(8.436849296326734) q[25];
-rx(8.436849296326734) q[100];
-rz(2.3898457559225412) q[101];
-cx q[16],q[101];
-cx q[16],q[103];
-rz(2.3898457559225412) q[102];
-cx q[3],q[102];
-cx q[4],q[102];
-rz(2.3898457559225412) q[102];
-cx q[4],q[102];
-rx(8.436849296326734) q[4];
-rx(8.436849296326734) q[102];
-rz(2.3898457559225412) q[103];
-cx q[16],q[103];
-rx(8.436849296326734) q[16];
-cx q[57],q[103];
-rz(2.3898457559225412) q[103];
-cx q[57],q[103];
-rx(8.436849296326734) q[57];
-rx(8.436849296326734) q[103];
-rz(2.3898457559225412) q[104];
-cx q[7],q[104];
-rx(8.436849296326734) q[7];
-cx q[13],q[104];
-rz(2.3898457559225412) q[104];
-cx q[13],q[104];
-rx(8.436849296326734) q[13];
-rx(8.436849296326734) q[104];
-rz(2.3898457559225412) q[106];
-cx q[5],q[106];
-rx(8.436849296326734) q[5];
-cx q[36],q[106];
-rz(2.3898457559225412) q[106];
-cx q[36],q[106];
-rx(8.436849296326734) q[36];
-rx(8.436849296326734) q[106];
-rz(2.4401085386567147) q[107];
-cx q[31],q[107];
-rx(2.644092806367516) q[31];
-cx q[12],q[31];
-rz(2.3898457559225412) q[31];
-cx q[12],q[31];
-cx q[12],q[34];
-cx q[26],q[31];
-rz(2.3898457559225412) q[31];
-cx q[26],q[31];
-cx q[26],q[105];
-rz(2.3898457559225412) q[34];
-cx q[12],q[34];
-cx q[12],q[44];
-cx q[34],q[37];
-rz(2.3898457559225412) q[37];
-cx q[34],q[37];
-rx(8.436849296326734) q[34];
-cx q[37],q[85];
-rz(2.3898457559225412) q[44];
-cx q[12],q[44];
-cx q[12],q[50];
-cx q[44],q[72];
-rz(2.3898457559225412) q[50];
-cx q[12],q[50];
-cx q[12],q[63];
-cx q[50],q[79];
-rz(2.3898457559225412) q[63];
-cx q[12],q[63];
-rx(8.436849296326734) q[12];
-cx q[17],q[63];
-rz(2.3898457559225412) q[63];
-cx q[17],q[63];
-cx q[17],q[66];
-cx q[63],q[74];
-rz(2.3898457559225412) q[66];
-cx q[17],q[66];
-rx(8.436849296326734) q[17];
-cx q[47],q[66];
-rz(2.3898457559225412) q[66];
-cx q[47],q[66];
-rx(8.436849296326734) q[47];
-rx(8.436849296326734) q[66];
-rz(2.3898457559225412) q[72];
-cx q[44],q[72];
-rx(8.436849296326734) q[44];
-rx(8.436849296326734) q[72];
-rz(2.3898457559225412) q[74];
-cx q[63],q[74];
-rx(8.436849296326734) q[63];
-rx(8.436849296326734) q[74];
-rz(2.3898457559225412) q[79];
-cx q[50],q[79];
-cx q[50],q[101];
-rx(8.436849296326734) q[79];
-rz(2.3898457559225412) q[85];
-cx q[37],q[85];
-rx(8.436849296326734) q[37];
-cx q[59],q[85];
-rz(2.3898457559225412) q[85];
-cx q[59],q[85];
-rx(8.436849296326734) q[59];
-rx(8.436849296326734) q[85];
-rz(2.3898457559225412) q[101];
-cx q[50],q[101];
-rx(8.436849296326734) q[50];
-rx(8.436849296326734) q[101];
-rz(2.3898457559225412) q[105];
-cx q[26],q[105];
-rx(8.436849296326734) q[26];
-cx q[28],q[105];
-rz(2.3898457559225412) q[105];
-cx q[28],q[105];
-rx(8.436849296326734) q[28];
-rx(8.436849296326734) q[105];
-rx(2.644092806367516) q[107];
-cx q[3],q[107];
-rz(2.3898457559225412) q[107];
-cx q[3],q[107];
-rx(8.436849296326734) q[3];
-cx q[31],q[107];
-rz(2.3898457559225412) q[107];
-cx q[31],q[107];
-rx(8.436849296326734) q[31];
-rx(8.436849296326734) q[107];
\ No newline at end of file
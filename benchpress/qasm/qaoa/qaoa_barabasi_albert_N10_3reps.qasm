@@ -1,197 +0,0 @@
-OPENQASM 2.0;
-include "qelib1.inc";
-qreg q[10];
-ry(pi/2) q[0];
-rx(pi) q[0];
-ry(pi/2) q[1];
-rx(pi) q[1];
-cx q[0],q[1];
-rz(1.5846238651156088) q[1];
-cx q[0],q[1];
-ry(pi/2) q[2];
-rx(pi) q[2];
-cx q[0],q[2];
-rz(1.5846238651156088) q[2];
-cx q[0],q[2];
-rx(1.9993980494552113) q[2];
-ry(pi/2) q[3];
-rx(pi) q[3];
-cx q[0],q[3];
-rz(1.5846238651156088) q[3];
-cx q[0],q[3];
-rx(1.9993980494552113) q[0];
-cx q[1],q[3];
-rz(1.5846238651156088) q[3];
-cx q[1],q[3];
-ry(pi/2) q[4];
-rx(pi) q[4];
-cx q[1],q[4];
-rz(1.5846238651156088) q[4];
-cx q[1],q[4];
-cx q[3],q[4];
-rz(1.5846238651156088) q[4];
-cx q[3],q[4];
-ry(pi/2) q[5];
-rx(pi) q[5];
-cx q[1],q[5];
-rz(1.5846238651156088) q[5];
-cx q[1],q[5];
-cx q[3],q[5];
-rz(1.5846238651156088) q[5];
-cx q[3],q[5];
-ry(pi/2) q[6];
-rx(pi) q[6];
-cx q[4],q[6];
-rz(1.5846238651156088) q[6];
-cx q[4],q[6];
-cx q[5],q[6];
-rz(1.5846238651156088) q[6];
-cx q[5],q[6];
-rx(1.9993980494552113) q[6];
-ry(pi/2) q[7];
-rx(pi) q[7];
-cx q[3],q[7];
-rz(1.5846238651156088) q[7];
-cx q[3],q[7];
-cx q[4],q[7];
-rz(1.5846238651156088) q[7];
-cx q[4],q[7];
-rx(1.9993980494552113) q[4];
-rx(1.9993980494552113) q[7];
-ry(pi/2) q[8];
-rx(pi) q[8];
-cx q[3],q[8];
-rz(1.5846238651156088) q[8];
-cx q[3],q[8];
-cx q[5],q[8];
-rz(1.5846238651156088) q[8];
-cx q[5],q[8];
-rx(1.9993980494552113) q[5];
-rx(1.9993980494552113) q[8];
-ry(pi/2) q[9];
-rx(pi) q[9];
-cx q[1],q[9];
-rz(1.5846238651156088) q[9];
-cx q[1],q[9];
-rx(1.9993980494552113) q[1];
-cx q[0],q[1];
-rz(0.8199726992929931) q[1];
-cx q[0],q[1];
-cx q[0],q[2];
-rz(0.8199726992929931) q[2];
-cx q[0],q[2];
-rx(9.808607416083087) q[2];
-cx q[3],q[9];
-rz(1.5846238651156088) q[9];
-cx q[3],q[9];
-rx(1.9993980494552113) q[3];
-cx q[0],q[3];
-rz(0.8199726992929931) q[3];
-cx q[0],q[3];
-rx(9.808607416083087) q[0];
-cx q[1],q[3];
-rz(0.8199726992929931) q[3];
-cx q[1],q[3];
-cx q[1],q[4];
-rz(0.8199726992929931) q[4];
-cx q[1],q[4];
-cx q[1],q[5];
-cx q[3],q[4];
-rz(0.8199726992929931) q[4];
-cx q[3],q[4];
-cx q[4],q[6];
-rz(0.8199726992929931) q[5];
-cx q[1],q[5];
-cx q[3],q[5];
-rz(0.8199726992929931) q[5];
-cx q[3],q[5];
-cx q[3],q[7];
-rz(0.8199726992929931) q[6];
-cx q[4],q[6];
-cx q[5],q[6];
-rz(0.8199726992929931) q[6];
-cx q[5],q[6];
-rx(9.808607416083087) q[6];
-rz(0.8199726992929931) q[7];
-cx q[3],q[7];
-cx q[3],q[8];
-cx q[4],q[7];
-rz(0.8199726992929931) q[7];
-cx q[4],q[7];
-rx(9.808607416083087) q[4];
-rx(9.808607416083087) q[7];
-rz(0.8199726992929931) q[8];
-cx q[3],q[8];
-cx q[5],q[8];
-rz(0.8199726992929931) q[8];
-cx q[5],q[8];
-rx(9.808607416083087) q[5];
-rx(9.808607416083087) q[8];
-rx(1.9993980494552113) q[9];
-cx q[1],q[9];
-rz(0.8199726992929931) q[9];
-cx q[1],q[9];
-rx(9.808607416083087) q[1];
-cx q[0],q[1];
-rz(1.2724239654332838) q[1];
-cx q[0],q[1];
-cx q[0],q[2];
-rz(1.2724239654332838) q[2];
-cx q[0],q[2];
-rx(4.304211127616218) q[2];
-cx q[3],q[9];
-rz(0.8199726992929931) q[9];
-cx q[3],q[9];
-rx(9.808607416083087) q[3];
-cx q[0],q[3];
-rz(1.2724239654332838) q[3];
-cx q[0],q[3];
-rx(4.304211127616218) q[0];
-cx q[1],q[3];
-rz(1.2724239654332838) q[3];
-cx q[1],q[3];
-cx q[1],q[4];
-rz(1.2724239654332838) q[4];
-cx q[1],q[4];
-cx q[1],q[5];
-cx q[3],q[4];
-rz(1.2724239654332838) q[4];
-cx q[3],q[4];
-cx q[4],q[6];
-rz(1.2724239654332838) q[5];
-cx q[1],q[5];
-cx q[3],q[5];
-rz(1.2724239654332838) q[5];
-cx q[3],q[5];
-cx q[3],q[7];
-rz(1.2724239654332838) q[6];
-cx q[4],q[6];
-cx q[5],q[6];
-rz(1.2724239654332838) q[6];
-cx q[5],q[6];
-rx(4.304211127616218) q[6];
-rz(1.2724239654332838) q[7];
-cx q[3],q[7];
-cx q[3],q[8];
-cx q[4],q[7];
-rz(1.2724239654332838) q[7];
-cx q[4],q[7];
-rx(4.304211127616218) q[4];
-rx(4.304211127616218) q[7];
-rz(1.2724239654332838) q[8];
-cx q[3],q[8];
-cx q[5],q[8];
-rz(1.2724239654332838) q[8];
-cx q[5],q[8];
-rx(4.304211127616218) q[5];
-rx(4.304211127616218) q[8];
-rx(9.808607416083087) q[9];
-cx q[1],q[9];
-rz(1.2724239654332838) q[9];
-cx q[1],q[9];
-rx(4.304211127616218) q[1];
-cx q[3],q[9];
-rz(1.2724239654332838) q[9];
-cx q[3],q[9];
-rx(4.304211127616218) q[3];
-rx(4.304211127616218) q[9];
\ No newline at end of file
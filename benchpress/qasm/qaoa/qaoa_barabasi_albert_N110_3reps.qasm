@@ -1,2497 +0,0 @@
-OPENQASM 2.0;
-include "qelib1.inc";
-qreg q[110];
-ry(pi/2) q[0];
-rx(pi) q[0];
-ry(pi/2) q[1];
-rx(pi) q[1];
-cx q[0],q[1];
-rz(2.865768638322769) q[1];
-cx q[0],q[1];
-ry(pi/2) q[2];
-rx(pi) q[2];
-cx q[0],q[2];
-rz(2.865768638322769) q[2];
-cx q[0],q[2];
-ry(pi/2) q[3];
-rx(pi) q[3];
-cx q[0],q[3];
-rz(2.865768638322769) q[3];
-cx q[0],q[3];
-cx q[1],q[3];
-rz(2.865768638322769) q[3];
-cx q[1],q[3];
-ry(pi/2) q[4];
-rx(pi) q[4];
-cx q[1],q[4];
-rz(2.865768638322769) q[4];
-cx q[1],q[4];
-cx q[3],q[4];
-rz(2.865768638322769) q[4];
-cx q[3],q[4];
-ry(pi/2) q[5];
-rx(pi) q[5];
-cx q[1],q[5];
-rz(2.865768638322769) q[5];
-cx q[1],q[5];
-cx q[3],q[5];
-rz(2.865768638322769) q[5];
-cx q[3],q[5];
-ry(pi/2) q[6];
-rx(pi) q[6];
-cx q[4],q[6];
-rz(2.865768638322769) q[6];
-cx q[4],q[6];
-cx q[5],q[6];
-rz(2.865768638322769) q[6];
-cx q[5],q[6];
-ry(pi/2) q[7];
-rx(pi) q[7];
-cx q[3],q[7];
-rz(2.865768638322769) q[7];
-cx q[3],q[7];
-cx q[4],q[7];
-rz(2.865768638322769) q[7];
-cx q[4],q[7];
-ry(pi/2) q[8];
-rx(pi) q[8];
-cx q[3],q[8];
-rz(2.865768638322769) q[8];
-cx q[3],q[8];
-cx q[5],q[8];
-rz(2.865768638322769) q[8];
-cx q[5],q[8];
-ry(pi/2) q[9];
-rx(pi) q[9];
-cx q[1],q[9];
-rz(2.865768638322769) q[9];
-cx q[1],q[9];
-cx q[3],q[9];
-rz(2.865768638322769) q[9];
-cx q[3],q[9];
-ry(pi/2) q[10];
-rx(pi) q[10];
-cx q[4],q[10];
-rz(2.865768638322769) q[10];
-cx q[4],q[10];
-cx q[6],q[10];
-rz(2.865768638322769) q[10];
-cx q[6],q[10];
-ry(pi/2) q[11];
-rx(pi) q[11];
-cx q[5],q[11];
-rz(2.865768638322769) q[11];
-cx q[5],q[11];
-cx q[6],q[11];
-rz(2.865768638322769) q[11];
-cx q[6],q[11];
-rx(8.130134158291192) q[11];
-ry(pi/2) q[12];
-rx(pi) q[12];
-cx q[3],q[12];
-rz(2.865768638322769) q[12];
-cx q[3],q[12];
-cx q[5],q[12];
-rz(2.865768638322769) q[12];
-cx q[5],q[12];
-ry(pi/2) q[13];
-rx(pi) q[13];
-cx q[4],q[13];
-rz(2.865768638322769) q[13];
-cx q[4],q[13];
-cx q[5],q[13];
-rz(2.865768638322769) q[13];
-cx q[5],q[13];
-ry(pi/2) q[14];
-rx(pi) q[14];
-cx q[3],q[14];
-rz(2.865768638322769) q[14];
-cx q[3],q[14];
-cx q[4],q[14];
-rz(2.865768638322769) q[14];
-cx q[4],q[14];
-rx(8.130134158291192) q[14];
-ry(pi/2) q[15];
-rx(pi) q[15];
-cx q[0],q[15];
-rz(2.865768638322769) q[15];
-cx q[0],q[15];
-cx q[3],q[15];
-rz(2.865768638322769) q[15];
-cx q[3],q[15];
-ry(pi/2) q[16];
-rx(pi) q[16];
-cx q[0],q[16];
-rz(2.865768638322769) q[16];
-cx q[0],q[16];
-cx q[3],q[16];
-rz(2.865768638322769) q[16];
-cx q[3],q[16];
-ry(pi/2) q[17];
-rx(pi) q[17];
-cx q[1],q[17];
-rz(2.865768638322769) q[17];
-cx q[1],q[17];
-cx q[3],q[17];
-rz(2.865768638322769) q[17];
-cx q[3],q[17];
-ry(pi/2) q[18];
-rx(pi) q[18];
-cx q[3],q[18];
-rz(2.865768638322769) q[18];
-cx q[3],q[18];
-cx q[4],q[18];
-rz(2.865768638322769) q[18];
-cx q[4],q[18];
-ry(pi/2) q[19];
-rx(pi) q[19];
-cx q[3],q[19];
-rz(2.865768638322769) q[19];
-cx q[3],q[19];
-cx q[7],q[19];
-rz(2.865768638322769) q[19];
-cx q[7],q[19];
-ry(pi/2) q[20];
-rx(pi) q[20];
-cx q[0],q[20];
-rz(2.865768638322769) q[20];
-cx q[0],q[20];
-cx q[15],q[20];
-rz(2.865768638322769) q[20];
-cx q[15],q[20];
-ry(pi/2) q[21];
-rx(pi) q[21];
-cx q[4],q[21];
-rz(2.865768638322769) q[21];
-cx q[4],q[21];
-cx q[15],q[21];
-rz(2.865768638322769) q[21];
-cx q[15],q[21];
-ry(pi/2) q[22];
-rx(pi) q[22];
-cx q[3],q[22];
-rz(2.865768638322769) q[22];
-cx q[3],q[22];
-cx q[9],q[22];
-rz(2.865768638322769) q[22];
-cx q[9],q[22];
-rx(8.130134158291192) q[22];
-ry(pi/2) q[23];
-rx(pi) q[23];
-cx q[3],q[23];
-rz(2.865768638322769) q[23];
-cx q[3],q[23];
-cx q[17],q[23];
-rz(2.865768638322769) q[23];
-cx q[17],q[23];
-ry(pi/2) q[24];
-rx(pi) q[24];
-cx q[3],q[24];
-rz(2.865768638322769) q[24];
-cx q[3],q[24];
-cx q[5],q[24];
-rz(2.865768638322769) q[24];
-cx q[5],q[24];
-ry(pi/2) q[25];
-rx(pi) q[25];
-cx q[3],q[25];
-rz(2.865768638322769) q[25];
-cx q[3],q[25];
-cx q[12],q[25];
-rz(2.865768638322769) q[25];
-cx q[12],q[25];
-ry(pi/2) q[26];
-rx(pi) q[26];
-cx q[3],q[26];
-rz(2.865768638322769) q[26];
-cx q[3],q[26];
-cx q[21],q[26];
-rz(2.865768638322769) q[26];
-cx q[21],q[26];
-ry(pi/2) q[27];
-rx(pi) q[27];
-cx q[4],q[27];
-rz(2.865768638322769) q[27];
-cx q[4],q[27];
-cx q[6],q[27];
-rz(2.865768638322769) q[27];
-cx q[6],q[27];
-ry(pi/2) q[28];
-rx(pi) q[28];
-cx q[1],q[28];
-rz(2.865768638322769) q[28];
-cx q[1],q[28];
-cx q[3],q[28];
-rz(2.865768638322769) q[28];
-cx q[3],q[28];
-ry(pi/2) q[29];
-rx(pi) q[29];
-cx q[1],q[29];
-rz(2.865768638322769) q[29];
-cx q[1],q[29];
-cx q[3],q[29];
-rz(2.865768638322769) q[29];
-cx q[3],q[29];
-rx(8.130134158291192) q[29];
-ry(pi/2) q[30];
-rx(pi) q[30];
-cx q[3],q[30];
-rz(2.865768638322769) q[30];
-cx q[3],q[30];
-cx q[18],q[30];
-rz(2.865768638322769) q[30];
-cx q[18],q[30];
-rx(8.130134158291192) q[18];
-ry(pi/2) q[31];
-rx(pi) q[31];
-cx q[12],q[31];
-rz(2.865768638322769) q[31];
-cx q[12],q[31];
-cx q[26],q[31];
-rz(2.865768638322769) q[31];
-cx q[26],q[31];
-ry(pi/2) q[32];
-rx(pi) q[32];
-cx q[0],q[32];
-rz(2.865768638322769) q[32];
-cx q[0],q[32];
-cx q[21],q[32];
-rz(2.865768638322769) q[32];
-cx q[21],q[32];
-ry(pi/2) q[33];
-rx(pi) q[33];
-cx q[5],q[33];
-rz(2.865768638322769) q[33];
-cx q[5],q[33];
-cx q[30],q[33];
-rz(2.865768638322769) q[33];
-cx q[30],q[33];
-rx(8.130134158291192) q[33];
-ry(pi/2) q[34];
-rx(pi) q[34];
-cx q[3],q[34];
-rz(2.865768638322769) q[34];
-cx q[3],q[34];
-cx q[12],q[34];
-rz(2.865768638322769) q[34];
-cx q[12],q[34];
-ry(pi/2) q[35];
-rx(pi) q[35];
-cx q[3],q[35];
-rz(2.865768638322769) q[35];
-cx q[3],q[35];
-cx q[32],q[35];
-rz(2.865768638322769) q[35];
-cx q[32],q[35];
-rx(8.130134158291192) q[35];
-ry(pi/2) q[36];
-rx(pi) q[36];
-cx q[15],q[36];
-rz(2.865768638322769) q[36];
-cx q[15],q[36];
-cx q[20],q[36];
-rz(2.865768638322769) q[36];
-cx q[20],q[36];
-ry(pi/2) q[37];
-rx(pi) q[37];
-cx q[10],q[37];
-rz(2.865768638322769) q[37];
-cx q[10],q[37];
-cx q[34],q[37];
-rz(2.865768638322769) q[37];
-cx q[34],q[37];
-rx(8.130134158291192) q[34];
-ry(pi/2) q[38];
-rx(pi) q[38];
-cx q[19],q[38];
-rz(2.865768638322769) q[38];
-cx q[19],q[38];
-rx(8.130134158291192) q[19];
-cx q[21],q[38];
-rz(2.865768638322769) q[38];
-cx q[21],q[38];
-ry(pi/2) q[39];
-rx(pi) q[39];
-cx q[3],q[39];
-rz(2.865768638322769) q[39];
-cx q[3],q[39];
-cx q[13],q[39];
-rz(2.865768638322769) q[39];
-cx q[13],q[39];
-ry(pi/2) q[40];
-rx(pi) q[40];
-cx q[3],q[40];
-rz(2.865768638322769) q[40];
-cx q[3],q[40];
-cx q[23],q[40];
-rz(2.865768638322769) q[40];
-cx q[23],q[40];
-rx(8.130134158291192) q[40];
-ry(pi/2) q[41];
-rx(pi) q[41];
-cx q[10],q[41];
-rz(2.865768638322769) q[41];
-cx q[10],q[41];
-cx q[27],q[41];
-rz(2.865768638322769) q[41];
-cx q[27],q[41];
-ry(pi/2) q[42];
-rx(pi) q[42];
-cx q[0],q[42];
-rz(2.865768638322769) q[42];
-cx q[0],q[42];
-cx q[3],q[42];
-rz(2.865768638322769) q[42];
-cx q[3],q[42];
-ry(pi/2) q[43];
-rx(pi) q[43];
-cx q[3],q[43];
-rz(2.865768638322769) q[43];
-cx q[3],q[43];
-cx q[20],q[43];
-rz(2.865768638322769) q[43];
-cx q[20],q[43];
-rx(8.130134158291192) q[20];
-rx(8.130134158291192) q[43];
-ry(pi/2) q[44];
-rx(pi) q[44];
-cx q[3],q[44];
-rz(2.865768638322769) q[44];
-cx q[3],q[44];
-cx q[12],q[44];
-rz(2.865768638322769) q[44];
-cx q[12],q[44];
-ry(pi/2) q[45];
-rx(pi) q[45];
-cx q[1],q[45];
-rz(2.865768638322769) q[45];
-cx q[1],q[45];
-cx q[16],q[45];
-rz(2.865768638322769) q[45];
-cx q[16],q[45];
-ry(pi/2) q[46];
-rx(pi) q[46];
-cx q[5],q[46];
-rz(2.865768638322769) q[46];
-cx q[5],q[46];
-cx q[38],q[46];
-rz(2.865768638322769) q[46];
-cx q[38],q[46];
-rx(8.130134158291192) q[38];
-rx(8.130134158291192) q[46];
-ry(pi/2) q[47];
-rx(pi) q[47];
-cx q[4],q[47];
-rz(2.865768638322769) q[47];
-cx q[4],q[47];
-cx q[17],q[47];
-rz(2.865768638322769) q[47];
-cx q[17],q[47];
-ry(pi/2) q[48];
-rx(pi) q[48];
-cx q[0],q[48];
-rz(2.865768638322769) q[48];
-cx q[0],q[48];
-cx q[30],q[48];
-rz(2.865768638322769) q[48];
-cx q[30],q[48];
-rx(8.130134158291192) q[48];
-ry(pi/2) q[49];
-rx(pi) q[49];
-cx q[3],q[49];
-rz(2.865768638322769) q[49];
-cx q[3],q[49];
-cx q[4],q[49];
-rz(2.865768638322769) q[49];
-cx q[4],q[49];
-rx(8.130134158291192) q[49];
-ry(pi/2) q[50];
-rx(pi) q[50];
-cx q[3],q[50];
-rz(2.865768638322769) q[50];
-cx q[3],q[50];
-cx q[12],q[50];
-rz(2.865768638322769) q[50];
-cx q[12],q[50];
-ry(pi/2) q[51];
-rx(pi) q[51];
-cx q[0],q[51];
-rz(2.865768638322769) q[51];
-cx q[0],q[51];
-cx q[28],q[51];
-rz(2.865768638322769) q[51];
-cx q[28],q[51];
-rx(8.130134158291192) q[51];
-ry(pi/2) q[52];
-rx(pi) q[52];
-cx q[3],q[52];
-rz(2.865768638322769) q[52];
-cx q[3],q[52];
-cx q[10],q[52];
-rz(2.865768638322769) q[52];
-cx q[10],q[52];
-rx(8.130134158291192) q[52];
-ry(pi/2) q[53];
-rx(pi) q[53];
-cx q[17],q[53];
-rz(2.865768638322769) q[53];
-cx q[17],q[53];
-cx q[21],q[53];
-rz(2.865768638322769) q[53];
-cx q[21],q[53];
-ry(pi/2) q[54];
-rx(pi) q[54];
-cx q[24],q[54];
-rz(2.865768638322769) q[54];
-cx q[24],q[54];
-cx q[28],q[54];
-rz(2.865768638322769) q[54];
-cx q[28],q[54];
-rx(8.130134158291192) q[54];
-ry(pi/2) q[55];
-rx(pi) q[55];
-cx q[9],q[55];
-rz(2.865768638322769) q[55];
-cx q[9],q[55];
-cx q[15],q[55];
-rz(2.865768638322769) q[55];
-cx q[15],q[55];
-ry(pi/2) q[56];
-rx(pi) q[56];
-cx q[13],q[56];
-rz(2.865768638322769) q[56];
-cx q[13],q[56];
-cx q[45],q[56];
-rz(2.865768638322769) q[56];
-cx q[45],q[56];
-rx(8.130134158291192) q[45];
-ry(pi/2) q[57];
-rx(pi) q[57];
-cx q[1],q[57];
-rz(2.865768638322769) q[57];
-cx q[1],q[57];
-cx q[3],q[57];
-rz(2.865768638322769) q[57];
-cx q[3],q[57];
-ry(pi/2) q[58];
-rx(pi) q[58];
-cx q[24],q[58];
-rz(2.865768638322769) q[58];
-cx q[24],q[58];
-cx q[28],q[58];
-rz(2.865768638322769) q[58];
-cx q[28],q[58];
-rx(8.130134158291192) q[58];
-ry(pi/2) q[59];
-rx(pi) q[59];
-cx q[16],q[59];
-rz(2.865768638322769) q[59];
-cx q[16],q[59];
-cx q[32],q[59];
-rz(2.865768638322769) q[59];
-cx q[32],q[59];
-ry(pi/2) q[60];
-rx(pi) q[60];
-cx q[1],q[60];
-rz(2.865768638322769) q[60];
-cx q[1],q[60];
-cx q[7],q[60];
-rz(2.865768638322769) q[60];
-cx q[7],q[60];
-ry(pi/2) q[61];
-rx(pi) q[61];
-cx q[4],q[61];
-rz(2.865768638322769) q[61];
-cx q[4],q[61];
-cx q[7],q[61];
-rz(2.865768638322769) q[61];
-cx q[7],q[61];
-rx(8.130134158291192) q[61];
-ry(pi/2) q[62];
-rx(pi) q[62];
-cx q[0],q[62];
-rz(2.865768638322769) q[62];
-cx q[0],q[62];
-cx q[17],q[62];
-rz(2.865768638322769) q[62];
-cx q[17],q[62];
-rx(8.130134158291192) q[62];
-ry(pi/2) q[63];
-rx(pi) q[63];
-cx q[12],q[63];
-rz(2.865768638322769) q[63];
-cx q[12],q[63];
-rx(8.130134158291192) q[12];
-cx q[17],q[63];
-rz(2.865768638322769) q[63];
-cx q[17],q[63];
-ry(pi/2) q[64];
-rx(pi) q[64];
-cx q[0],q[64];
-rz(2.865768638322769) q[64];
-cx q[0],q[64];
-cx q[10],q[64];
-rz(2.865768638322769) q[64];
-cx q[10],q[64];
-rx(8.130134158291192) q[64];
-ry(pi/2) q[65];
-rx(pi) q[65];
-cx q[5],q[65];
-rz(2.865768638322769) q[65];
-cx q[5],q[65];
-cx q[23],q[65];
-rz(2.865768638322769) q[65];
-cx q[23],q[65];
-rx(8.130134158291192) q[23];
-rx(8.130134158291192) q[65];
-ry(pi/2) q[66];
-rx(pi) q[66];
-cx q[17],q[66];
-rz(2.865768638322769) q[66];
-cx q[17],q[66];
-rx(8.130134158291192) q[17];
-cx q[47],q[66];
-rz(2.865768638322769) q[66];
-cx q[47],q[66];
-rx(8.130134158291192) q[47];
-rx(8.130134158291192) q[66];
-ry(pi/2) q[67];
-rx(pi) q[67];
-cx q[41],q[67];
-rz(2.865768638322769) q[67];
-cx q[41],q[67];
-cx q[56],q[67];
-rz(2.865768638322769) q[67];
-cx q[56],q[67];
-rx(8.130134158291192) q[67];
-ry(pi/2) q[68];
-rx(pi) q[68];
-cx q[13],q[68];
-rz(2.865768638322769) q[68];
-cx q[13],q[68];
-cx q[32],q[68];
-rz(2.865768638322769) q[68];
-cx q[32],q[68];
-ry(pi/2) q[69];
-rx(pi) q[69];
-cx q[6],q[69];
-rz(2.865768638322769) q[69];
-cx q[6],q[69];
-cx q[59],q[69];
-rz(2.865768638322769) q[69];
-cx q[59],q[69];
-rx(8.130134158291192) q[69];
-ry(pi/2) q[70];
-rx(pi) q[70];
-cx q[3],q[70];
-rz(2.865768638322769) q[70];
-cx q[3],q[70];
-cx q[15],q[70];
-rz(2.865768638322769) q[70];
-cx q[15],q[70];
-ry(pi/2) q[71];
-rx(pi) q[71];
-cx q[3],q[71];
-rz(2.865768638322769) q[71];
-cx q[3],q[71];
-cx q[53],q[71];
-rz(2.865768638322769) q[71];
-cx q[53],q[71];
-rx(8.130134158291192) q[71];
-ry(pi/2) q[72];
-rx(pi) q[72];
-cx q[27],q[72];
-rz(2.865768638322769) q[72];
-cx q[27],q[72];
-cx q[44],q[72];
-rz(2.865768638322769) q[72];
-cx q[44],q[72];
-rx(8.130134158291192) q[44];
-rx(8.130134158291192) q[72];
-ry(pi/2) q[73];
-rx(pi) q[73];
-cx q[16],q[73];
-rz(2.865768638322769) q[73];
-cx q[16],q[73];
-cx q[59],q[73];
-rz(2.865768638322769) q[73];
-cx q[59],q[73];
-ry(pi/2) q[74];
-rx(pi) q[74];
-cx q[56],q[74];
-rz(2.865768638322769) q[74];
-cx q[56],q[74];
-cx q[63],q[74];
-rz(2.865768638322769) q[74];
-cx q[63],q[74];
-rx(8.130134158291192) q[63];
-rx(8.130134158291192) q[74];
-ry(pi/2) q[75];
-rx(pi) q[75];
-cx q[0],q[75];
-rz(2.865768638322769) q[75];
-cx q[0],q[75];
-cx q[21],q[75];
-rz(2.865768638322769) q[75];
-cx q[21],q[75];
-rx(8.130134158291192) q[75];
-ry(pi/2) q[76];
-rx(pi) q[76];
-cx q[5],q[76];
-rz(2.865768638322769) q[76];
-cx q[5],q[76];
-cx q[6],q[76];
-rz(2.865768638322769) q[76];
-cx q[6],q[76];
-rx(8.130134158291192) q[76];
-ry(pi/2) q[77];
-rx(pi) q[77];
-cx q[3],q[77];
-rz(2.865768638322769) q[77];
-cx q[3],q[77];
-cx q[30],q[77];
-rz(2.865768638322769) q[77];
-cx q[30],q[77];
-rx(8.130134158291192) q[30];
-ry(pi/2) q[78];
-rx(pi) q[78];
-cx q[42],q[78];
-rz(2.865768638322769) q[78];
-cx q[42],q[78];
-rx(8.130134158291192) q[42];
-cx q[60],q[78];
-rz(2.865768638322769) q[78];
-cx q[60],q[78];
-rx(8.130134158291192) q[78];
-ry(pi/2) q[79];
-rx(pi) q[79];
-cx q[6],q[79];
-rz(2.865768638322769) q[79];
-cx q[6],q[79];
-cx q[50],q[79];
-rz(2.865768638322769) q[79];
-cx q[50],q[79];
-rx(8.130134158291192) q[79];
-ry(pi/2) q[80];
-rx(pi) q[80];
-cx q[9],q[80];
-rz(2.865768638322769) q[80];
-cx q[9],q[80];
-rx(8.130134158291192) q[9];
-cx q[15],q[80];
-rz(2.865768638322769) q[80];
-cx q[15],q[80];
-rx(8.130134158291192) q[80];
-ry(pi/2) q[81];
-rx(pi) q[81];
-cx q[21],q[81];
-rz(2.865768638322769) q[81];
-cx q[21],q[81];
-cx q[77],q[81];
-rz(2.865768638322769) q[81];
-cx q[77],q[81];
-rx(8.130134158291192) q[77];
-rx(8.130134158291192) q[81];
-ry(pi/2) q[82];
-rx(pi) q[82];
-cx q[0],q[82];
-rz(2.865768638322769) q[82];
-cx q[0],q[82];
-cx q[56],q[82];
-rz(2.865768638322769) q[82];
-cx q[56],q[82];
-rx(8.130134158291192) q[82];
-ry(pi/2) q[83];
-rx(pi) q[83];
-cx q[8],q[83];
-rz(2.865768638322769) q[83];
-cx q[8],q[83];
-rx(8.130134158291192) q[8];
-cx q[68],q[83];
-rz(2.865768638322769) q[83];
-cx q[68],q[83];
-rx(8.130134158291192) q[68];
-rx(8.130134158291192) q[83];
-ry(pi/2) q[84];
-rx(pi) q[84];
-cx q[70],q[84];
-rz(2.865768638322769) q[84];
-cx q[70],q[84];
-rx(8.130134158291192) q[70];
-cx q[73],q[84];
-rz(2.865768638322769) q[84];
-cx q[73],q[84];
-rx(8.130134158291192) q[73];
-rx(8.130134158291192) q[84];
-ry(pi/2) q[85];
-rx(pi) q[85];
-cx q[37],q[85];
-rz(2.865768638322769) q[85];
-cx q[37],q[85];
-rx(8.130134158291192) q[37];
-cx q[59],q[85];
-rz(2.865768638322769) q[85];
-cx q[59],q[85];
-rx(8.130134158291192) q[59];
-rx(8.130134158291192) q[85];
-ry(pi/2) q[86];
-rx(pi) q[86];
-cx q[24],q[86];
-rz(2.865768638322769) q[86];
-cx q[24],q[86];
-rx(8.130134158291192) q[24];
-cx q[53],q[86];
-rz(2.865768638322769) q[86];
-cx q[53],q[86];
-rx(8.130134158291192) q[53];
-rx(8.130134158291192) q[86];
-ry(pi/2) q[87];
-rx(pi) q[87];
-cx q[28],q[87];
-rz(2.865768638322769) q[87];
-cx q[28],q[87];
-cx q[32],q[87];
-rz(2.865768638322769) q[87];
-cx q[32],q[87];
-rx(8.130134158291192) q[87];
-ry(pi/2) q[88];
-rx(pi) q[88];
-cx q[3],q[88];
-rz(2.865768638322769) q[88];
-cx q[3],q[88];
-cx q[60],q[88];
-rz(2.865768638322769) q[88];
-cx q[60],q[88];
-rx(8.130134158291192) q[60];
-rx(8.130134158291192) q[88];
-ry(pi/2) q[89];
-rx(pi) q[89];
-cx q[2],q[89];
-rz(2.865768638322769) q[89];
-cx q[2],q[89];
-rx(8.130134158291192) q[2];
-cx q[5],q[89];
-rz(2.865768638322769) q[89];
-cx q[5],q[89];
-ry(pi/2) q[90];
-rx(pi) q[90];
-cx q[15],q[90];
-rz(2.865768638322769) q[90];
-cx q[15],q[90];
-cx q[27],q[90];
-rz(2.865768638322769) q[90];
-cx q[27],q[90];
-rx(8.130134158291192) q[90];
-ry(pi/2) q[91];
-rx(pi) q[91];
-cx q[0],q[91];
-rz(2.865768638322769) q[91];
-cx q[0],q[91];
-cx q[6],q[91];
-rz(2.865768638322769) q[91];
-cx q[6],q[91];
-rx(8.130134158291192) q[6];
-rx(8.130134158291192) q[91];
-ry(pi/2) q[92];
-rx(pi) q[92];
-cx q[15],q[92];
-rz(2.865768638322769) q[92];
-cx q[15],q[92];
-cx q[89],q[92];
-rz(2.865768638322769) q[92];
-cx q[89],q[92];
-rx(8.130134158291192) q[89];
-ry(pi/2) q[93];
-rx(pi) q[93];
-cx q[0],q[93];
-rz(2.865768638322769) q[93];
-cx q[0],q[93];
-rx(8.130134158291192) q[0];
-cx q[32],q[93];
-rz(2.865768638322769) q[93];
-cx q[32],q[93];
-rx(8.130134158291192) q[32];
-rx(8.130134158291192) q[93];
-ry(pi/2) q[94];
-rx(pi) q[94];
-cx q[36],q[94];
-rz(2.865768638322769) q[94];
-cx q[36],q[94];
-cx q[55],q[94];
-rz(2.865768638322769) q[94];
-cx q[55],q[94];
-rx(8.130134158291192) q[55];
-rx(8.130134158291192) q[94];
-ry(pi/2) q[95];
-rx(pi) q[95];
-cx q[5],q[95];
-rz(2.865768638322769) q[95];
-cx q[5],q[95];
-cx q[27],q[95];
-rz(2.865768638322769) q[95];
-cx q[27],q[95];
-rx(8.130134158291192) q[27];
-rx(8.130134158291192) q[95];
-ry(pi/2) q[96];
-rx(pi) q[96];
-cx q[56],q[96];
-rz(2.865768638322769) q[96];
-cx q[56],q[96];
-rx(8.130134158291192) q[56];
-cx q[92],q[96];
-rz(2.865768638322769) q[96];
-cx q[92],q[96];
-rx(8.130134158291192) q[92];
-rx(8.130134158291192) q[96];
-ry(pi/2) q[97];
-rx(pi) q[97];
-cx q[1],q[97];
-rz(2.865768638322769) q[97];
-cx q[1],q[97];
-rx(8.130134158291192) q[1];
-cx q[0],q[1];
-rz(6.0326094159894295) q[1];
-cx q[0],q[1];
-cx q[0],q[2];
-rz(6.0326094159894295) q[2];
-cx q[0],q[2];
-cx q[2],q[89];
-cx q[7],q[97];
-rz(6.0326094159894295) q[89];
-cx q[2],q[89];
-rx(1.3772888704935138) q[2];
-rz(2.865768638322769) q[97];
-cx q[7],q[97];
-rx(8.130134158291192) q[97];
-ry(pi/2) q[98];
-rx(pi) q[98];
-cx q[10],q[98];
-rz(2.865768638322769) q[98];
-cx q[10],q[98];
-rx(8.130134158291192) q[10];
-cx q[21],q[98];
-rz(2.865768638322769) q[98];
-cx q[21],q[98];
-rx(8.130134158291192) q[21];
-rx(8.130134158291192) q[98];
-ry(pi/2) q[99];
-rx(pi) q[99];
-cx q[4],q[99];
-rz(2.865768638322769) q[99];
-cx q[4],q[99];
-cx q[41],q[99];
-rz(2.865768638322769) q[99];
-cx q[41],q[99];
-rx(8.130134158291192) q[41];
-rx(8.130134158291192) q[99];
-ry(pi/2) q[100];
-rx(pi) q[100];
-cx q[3],q[100];
-rz(2.865768638322769) q[100];
-cx q[3],q[100];
-cx q[25],q[100];
-rz(2.865768638322769) q[100];
-cx q[25],q[100];
-rx(8.130134158291192) q[25];
-rx(8.130134158291192) q[100];
-ry(pi/2) q[101];
-rx(pi) q[101];
-cx q[16],q[101];
-rz(2.865768638322769) q[101];
-cx q[16],q[101];
-cx q[50],q[101];
-rz(2.865768638322769) q[101];
-cx q[50],q[101];
-rx(8.130134158291192) q[50];
-rx(8.130134158291192) q[101];
-ry(pi/2) q[102];
-rx(pi) q[102];
-cx q[3],q[102];
-rz(2.865768638322769) q[102];
-cx q[3],q[102];
-cx q[4],q[102];
-rz(2.865768638322769) q[102];
-cx q[4],q[102];
-rx(8.130134158291192) q[4];
-rx(8.130134158291192) q[102];
-ry(pi/2) q[103];
-rx(pi) q[103];
-cx q[16],q[103];
-rz(2.865768638322769) q[103];
-cx q[16],q[103];
-rx(8.130134158291192) q[16];
-cx q[57],q[103];
-rz(2.865768638322769) q[103];
-cx q[57],q[103];
-rx(8.130134158291192) q[57];
-rx(8.130134158291192) q[103];
-ry(pi/2) q[104];
-rx(pi) q[104];
-cx q[7],q[104];
-rz(2.865768638322769) q[104];
-cx q[7],q[104];
-rx(8.130134158291192) q[7];
-cx q[13],q[104];
-rz(2.865768638322769) q[104];
-cx q[13],q[104];
-rx(8.130134158291192) q[13];
-rx(8.130134158291192) q[104];
-ry(pi/2) q[105];
-rx(pi) q[105];
-cx q[26],q[105];
-rz(2.865768638322769) q[105];
-cx q[26],q[105];
-rx(8.130134158291192) q[26];
-cx q[28],q[105];
-rz(2.865768638322769) q[105];
-cx q[28],q[105];
-rx(8.130134158291192) q[28];
-rx(8.130134158291192) q[105];
-ry(pi/2) q[106];
-rx(pi) q[106];
-cx q[5],q[106];
-rz(2.865768638322769) q[106];
-cx q[5],q[106];
-cx q[36],q[106];
-rz(2.865768638322769) q[106];
-cx q[36],q[106];
-rx(8.130134158291192) q[36];
-rx(8.130134158291192) q[106];
-ry(pi/2) q[107];
-rx(pi) q[107];
-cx q[3],q[107];
-rz(2.865768638322769) q[107];
-cx q[3],q[107];
-rx(8.130134158291192) q[3];
-cx q[0],q[3];
-rz(6.0326094159894295) q[3];
-cx q[0],q[3];
-cx q[1],q[3];
-rz(6.0326094159894295) q[3];
-cx q[1],q[3];
-cx q[1],q[4];
-rz(6.0326094159894295) q[4];
-cx q[1],q[4];
-cx q[3],q[4];
-rz(6.0326094159894295) q[4];
-cx q[3],q[4];
-cx q[4],q[6];
-rz(6.0326094159894295) q[6];
-cx q[4],q[6];
-cx q[31],q[107];
-rz(2.865768638322769) q[107];
-cx q[31],q[107];
-rx(8.130134158291192) q[107];
-ry(pi/2) q[108];
-rx(pi) q[108];
-cx q[15],q[108];
-rz(2.865768638322769) q[108];
-cx q[15],q[108];
-rx(8.130134158291192) q[15];
-cx q[0],q[15];
-rz(6.0326094159894295) q[15];
-cx q[0],q[15];
-cx q[0],q[16];
-rz(6.0326094159894295) q[16];
-cx q[0],q[16];
-cx q[0],q[20];
-rz(6.0326094159894295) q[20];
-cx q[0],q[20];
-cx q[0],q[32];
-cx q[31],q[108];
-rz(6.0326094159894295) q[32];
-cx q[0],q[32];
-cx q[0],q[42];
-rz(6.0326094159894295) q[42];
-cx q[0],q[42];
-cx q[0],q[48];
-rz(6.0326094159894295) q[48];
-cx q[0],q[48];
-cx q[0],q[51];
-rz(6.0326094159894295) q[51];
-cx q[0],q[51];
-cx q[0],q[62];
-rz(6.0326094159894295) q[62];
-cx q[0],q[62];
-cx q[0],q[64];
-rz(6.0326094159894295) q[64];
-cx q[0],q[64];
-cx q[0],q[75];
-rz(6.0326094159894295) q[75];
-cx q[0],q[75];
-cx q[0],q[82];
-rz(6.0326094159894295) q[82];
-cx q[0],q[82];
-cx q[0],q[91];
-rz(6.0326094159894295) q[91];
-cx q[0],q[91];
-cx q[0],q[93];
-rz(6.0326094159894295) q[93];
-cx q[0],q[93];
-rx(1.3772888704935138) q[0];
-rz(2.865768638322769) q[108];
-cx q[31],q[108];
-rx(8.130134158291192) q[31];
-rx(8.130134158291192) q[108];
-ry(pi/2) q[109];
-rx(pi) q[109];
-cx q[5],q[109];
-rz(2.865768638322769) q[109];
-cx q[5],q[109];
-rx(8.130134158291192) q[5];
-cx q[1],q[5];
-rz(6.0326094159894295) q[5];
-cx q[1],q[5];
-cx q[1],q[9];
-cx q[3],q[5];
-rz(6.0326094159894295) q[5];
-cx q[3],q[5];
-cx q[3],q[7];
-cx q[5],q[6];
-rz(6.0326094159894295) q[6];
-cx q[5],q[6];
-rz(6.0326094159894295) q[7];
-cx q[3],q[7];
-cx q[3],q[8];
-cx q[4],q[7];
-rz(6.0326094159894295) q[7];
-cx q[4],q[7];
-cx q[4],q[10];
-rz(6.0326094159894295) q[8];
-cx q[3],q[8];
-cx q[5],q[8];
-rz(6.0326094159894295) q[8];
-cx q[5],q[8];
-cx q[5],q[11];
-cx q[8],q[83];
-rz(6.0326094159894295) q[9];
-cx q[1],q[9];
-cx q[1],q[17];
-cx q[3],q[9];
-rz(6.0326094159894295) q[9];
-cx q[3],q[9];
-cx q[3],q[12];
-rz(6.0326094159894295) q[10];
-cx q[4],q[10];
-cx q[4],q[13];
-cx q[6],q[10];
-rz(6.0326094159894295) q[10];
-cx q[6],q[10];
-cx q[10],q[37];
-rz(6.0326094159894295) q[11];
-cx q[5],q[11];
-cx q[6],q[11];
-rz(6.0326094159894295) q[11];
-cx q[6],q[11];
-rx(1.3772888704935138) q[11];
-rz(6.0326094159894295) q[12];
-cx q[3],q[12];
-cx q[3],q[14];
-cx q[5],q[12];
-rz(6.0326094159894295) q[12];
-cx q[5],q[12];
-rz(6.0326094159894295) q[13];
-cx q[4],q[13];
-cx q[5],q[13];
-rz(6.0326094159894295) q[13];
-cx q[5],q[13];
-rz(6.0326094159894295) q[14];
-cx q[3],q[14];
-cx q[3],q[15];
-cx q[4],q[14];
-rz(6.0326094159894295) q[14];
-cx q[4],q[14];
-rx(1.3772888704935138) q[14];
-rz(6.0326094159894295) q[15];
-cx q[3],q[15];
-cx q[3],q[16];
-cx q[15],q[20];
-rz(6.0326094159894295) q[16];
-cx q[3],q[16];
-rz(6.0326094159894295) q[17];
-cx q[1],q[17];
-cx q[1],q[28];
-cx q[3],q[17];
-rz(6.0326094159894295) q[17];
-cx q[3],q[17];
-cx q[3],q[18];
-rz(6.0326094159894295) q[18];
-cx q[3],q[18];
-cx q[3],q[19];
-cx q[4],q[18];
-rz(6.0326094159894295) q[18];
-cx q[4],q[18];
-cx q[4],q[21];
-rz(6.0326094159894295) q[19];
-cx q[3],q[19];
-cx q[3],q[22];
-cx q[7],q[19];
-rz(6.0326094159894295) q[19];
-cx q[7],q[19];
-cx q[19],q[38];
-rz(6.0326094159894295) q[20];
-cx q[15],q[20];
-rz(6.0326094159894295) q[21];
-cx q[4],q[21];
-cx q[4],q[27];
-cx q[15],q[21];
-rz(6.0326094159894295) q[21];
-cx q[15],q[21];
-cx q[15],q[36];
-rz(6.0326094159894295) q[22];
-cx q[3],q[22];
-cx q[3],q[23];
-cx q[9],q[22];
-rz(6.0326094159894295) q[22];
-cx q[9],q[22];
-cx q[9],q[55];
-rx(1.3772888704935138) q[22];
-rz(6.0326094159894295) q[23];
-cx q[3],q[23];
-cx q[3],q[24];
-cx q[17],q[23];
-rz(6.0326094159894295) q[23];
-cx q[17],q[23];
-rz(6.0326094159894295) q[24];
-cx q[3],q[24];
-cx q[3],q[25];
-cx q[5],q[24];
-rz(6.0326094159894295) q[24];
-cx q[5],q[24];
-cx q[5],q[33];
-cx q[24],q[54];
-rz(6.0326094159894295) q[25];
-cx q[3],q[25];
-cx q[3],q[26];
-cx q[12],q[25];
-rz(6.0326094159894295) q[25];
-cx q[12],q[25];
-cx q[12],q[31];
-rz(6.0326094159894295) q[26];
-cx q[3],q[26];
-cx q[21],q[26];
-rz(6.0326094159894295) q[26];
-cx q[21],q[26];
-cx q[21],q[32];
-rz(6.0326094159894295) q[27];
-cx q[4],q[27];
-cx q[4],q[47];
-cx q[6],q[27];
-rz(6.0326094159894295) q[27];
-cx q[6],q[27];
-cx q[6],q[69];
-rz(6.0326094159894295) q[28];
-cx q[1],q[28];
-cx q[1],q[29];
-cx q[3],q[28];
-rz(6.0326094159894295) q[28];
-cx q[3],q[28];
-cx q[28],q[51];
-rz(6.0326094159894295) q[29];
-cx q[1],q[29];
-cx q[1],q[45];
-cx q[3],q[29];
-rz(6.0326094159894295) q[29];
-cx q[3],q[29];
-cx q[3],q[30];
-rx(1.3772888704935138) q[29];
-rz(6.0326094159894295) q[30];
-cx q[3],q[30];
-cx q[3],q[34];
-cx q[18],q[30];
-rz(6.0326094159894295) q[30];
-cx q[18],q[30];
-rx(1.3772888704935138) q[18];
-rz(6.0326094159894295) q[31];
-cx q[12],q[31];
-cx q[26],q[31];
-rz(6.0326094159894295) q[31];
-cx q[26],q[31];
-cx q[26],q[105];
-rz(6.0326094159894295) q[32];
-cx q[21],q[32];
-rz(6.0326094159894295) q[33];
-cx q[5],q[33];
-cx q[5],q[46];
-cx q[30],q[33];
-rz(6.0326094159894295) q[33];
-cx q[30],q[33];
-cx q[30],q[48];
-rx(1.3772888704935138) q[33];
-rz(6.0326094159894295) q[34];
-cx q[3],q[34];
-cx q[3],q[35];
-cx q[12],q[34];
-rz(6.0326094159894295) q[34];
-cx q[12],q[34];
-rz(6.0326094159894295) q[35];
-cx q[3],q[35];
-cx q[32],q[35];
-rz(6.0326094159894295) q[35];
-cx q[32],q[35];
-rx(1.3772888704935138) q[35];
-rz(6.0326094159894295) q[36];
-cx q[15],q[36];
-cx q[20],q[36];
-rz(6.0326094159894295) q[36];
-cx q[20],q[36];
-cx q[36],q[94];
-rz(6.0326094159894295) q[37];
-cx q[10],q[37];
-cx q[10],q[41];
-cx q[34],q[37];
-rz(6.0326094159894295) q[37];
-cx q[34],q[37];
-rx(1.3772888704935138) q[34];
-cx q[37],q[85];
-rz(6.0326094159894295) q[38];
-cx q[19],q[38];
-rx(1.3772888704935138) q[19];
-cx q[21],q[38];
-rz(6.0326094159894295) q[38];
-cx q[21],q[38];
-cx q[39],q[109];
-rz(6.0326094159894295) q[41];
-cx q[10],q[41];
-cx q[27],q[41];
-rz(6.0326094159894295) q[41];
-cx q[27],q[41];
-cx q[27],q[72];
-cx q[41],q[67];
-rz(6.0326094159894295) q[45];
-cx q[1],q[45];
-cx q[1],q[57];
-cx q[16],q[45];
-rz(6.0326094159894295) q[45];
-cx q[16],q[45];
-cx q[16],q[59];
-rz(6.0326094159894295) q[46];
-cx q[5],q[46];
-cx q[5],q[65];
-cx q[38],q[46];
-rz(6.0326094159894295) q[46];
-cx q[38],q[46];
-rx(1.3772888704935138) q[38];
-rx(1.3772888704935138) q[46];
-rz(6.0326094159894295) q[47];
-cx q[4],q[47];
-cx q[17],q[47];
-rz(6.0326094159894295) q[47];
-cx q[17],q[47];
-cx q[17],q[53];
-rz(6.0326094159894295) q[48];
-cx q[30],q[48];
-rx(1.3772888704935138) q[48];
-rz(6.0326094159894295) q[51];
-cx q[28],q[51];
-rx(1.3772888704935138) q[51];
-rz(6.0326094159894295) q[53];
-cx q[17],q[53];
-cx q[17],q[62];
-cx q[21],q[53];
-rz(6.0326094159894295) q[53];
-cx q[21],q[53];
-cx q[21],q[75];
-rz(6.0326094159894295) q[54];
-cx q[24],q[54];
-cx q[24],q[58];
-cx q[28],q[54];
-rz(6.0326094159894295) q[54];
-cx q[28],q[54];
-rx(1.3772888704935138) q[54];
-rz(6.0326094159894295) q[55];
-cx q[9],q[55];
-cx q[9],q[80];
-cx q[15],q[55];
-rz(6.0326094159894295) q[55];
-cx q[15],q[55];
-rz(6.0326094159894295) q[57];
-cx q[1],q[57];
-cx q[1],q[60];
-rz(6.0326094159894295) q[58];
-cx q[24],q[58];
-cx q[24],q[86];
-cx q[28],q[58];
-rz(6.0326094159894295) q[58];
-cx q[28],q[58];
-cx q[28],q[87];
-rx(1.3772888704935138) q[58];
-rz(6.0326094159894295) q[59];
-cx q[16],q[59];
-cx q[16],q[73];
-cx q[32],q[59];
-rz(6.0326094159894295) q[59];
-cx q[32],q[59];
-rz(6.0326094159894295) q[60];
-cx q[1],q[60];
-cx q[1],q[97];
-cx q[7],q[60];
-rz(6.0326094159894295) q[60];
-cx q[7],q[60];
-rz(6.0326094159894295) q[62];
-cx q[17],q[62];
-rx(1.3772888704935138) q[62];
-rz(6.0326094159894295) q[65];
-cx q[5],q[65];
-cx q[5],q[76];
-rz(6.0326094159894295) q[67];
-cx q[41],q[67];
-rz(6.0326094159894295) q[69];
-cx q[6],q[69];
-cx q[59],q[69];
-rz(6.0326094159894295) q[69];
-cx q[59],q[69];
-rx(1.3772888704935138) q[69];
-rz(6.0326094159894295) q[72];
-cx q[27],q[72];
-rz(6.0326094159894295) q[73];
-cx q[16],q[73];
-cx q[16],q[101];
-cx q[59],q[73];
-rz(6.0326094159894295) q[73];
-cx q[59],q[73];
-rz(6.0326094159894295) q[75];
-cx q[21],q[75];
-cx q[21],q[81];
-rx(1.3772888704935138) q[75];
-rz(6.0326094159894295) q[76];
-cx q[5],q[76];
-cx q[5],q[89];
-cx q[6],q[76];
-rz(6.0326094159894295) q[76];
-cx q[6],q[76];
-cx q[6],q[79];
-rx(1.3772888704935138) q[76];
-rz(6.0326094159894295) q[79];
-cx q[6],q[79];
-cx q[6],q[91];
-rz(6.0326094159894295) q[80];
-cx q[9],q[80];
-rx(1.3772888704935138) q[9];
-rz(6.0326094159894295) q[81];
-cx q[21],q[81];
-rz(6.0326094159894295) q[83];
-cx q[8],q[83];
-rx(1.3772888704935138) q[8];
-rz(6.0326094159894295) q[85];
-cx q[37],q[85];
-rx(1.3772888704935138) q[37];
-cx q[59],q[85];
-rz(6.0326094159894295) q[85];
-cx q[59],q[85];
-rx(1.3772888704935138) q[59];
-rx(1.3772888704935138) q[85];
-rz(6.0326094159894295) q[86];
-cx q[24],q[86];
-rx(1.3772888704935138) q[24];
-rz(6.0326094159894295) q[87];
-cx q[28],q[87];
-rz(6.0326094159894295) q[89];
-cx q[5],q[89];
-cx q[5],q[95];
-rz(6.0326094159894295) q[91];
-cx q[6],q[91];
-rx(1.3772888704935138) q[6];
-rx(1.3772888704935138) q[91];
-rz(6.0326094159894295) q[94];
-cx q[36],q[94];
-cx q[55],q[94];
-rz(6.0326094159894295) q[94];
-cx q[55],q[94];
-rx(1.3772888704935138) q[55];
-rx(1.3772888704935138) q[94];
-rz(6.0326094159894295) q[95];
-cx q[5],q[95];
-cx q[5],q[106];
-rz(6.0326094159894295) q[97];
-cx q[1],q[97];
-rx(1.3772888704935138) q[1];
-cx q[0],q[1];
-rz(4.218013125149368) q[1];
-cx q[0],q[1];
-cx q[0],q[2];
-rz(4.218013125149368) q[2];
-cx q[0],q[2];
-rz(6.0326094159894295) q[101];
-cx q[16],q[101];
-cx q[16],q[103];
-rz(6.0326094159894295) q[103];
-cx q[16],q[103];
-rx(1.3772888704935138) q[16];
-rz(6.0326094159894295) q[105];
-cx q[26],q[105];
-rx(1.3772888704935138) q[26];
-cx q[28],q[105];
-rz(6.0326094159894295) q[105];
-cx q[28],q[105];
-rx(1.3772888704935138) q[28];
-rx(1.3772888704935138) q[105];
-rz(6.0326094159894295) q[106];
-cx q[5],q[106];
-cx q[36],q[106];
-rz(6.0326094159894295) q[106];
-cx q[36],q[106];
-rx(1.3772888704935138) q[36];
-rx(1.3772888704935138) q[106];
-rz(2.865768638322769) q[109];
-cx q[39],q[109];
-rx(8.130134158291192) q[39];
-cx q[3],q[39];
-rz(6.0326094159894295) q[39];
-cx q[3],q[39];
-cx q[3],q[40];
-cx q[13],q[39];
-rz(6.0326094159894295) q[39];
-cx q[13],q[39];
-cx q[13],q[56];
-rz(6.0326094159894295) q[40];
-cx q[3],q[40];
-cx q[3],q[42];
-cx q[23],q[40];
-rz(6.0326094159894295) q[40];
-cx q[23],q[40];
-cx q[23],q[65];
-rx(1.3772888704935138) q[40];
-rz(6.0326094159894295) q[42];
-cx q[3],q[42];
-cx q[3],q[43];
-cx q[42],q[78];
-rz(6.0326094159894295) q[43];
-cx q[3],q[43];
-cx q[3],q[44];
-cx q[20],q[43];
-rz(6.0326094159894295) q[43];
-cx q[20],q[43];
-rx(1.3772888704935138) q[20];
-rx(1.3772888704935138) q[43];
-rz(6.0326094159894295) q[44];
-cx q[3],q[44];
-cx q[3],q[49];
-cx q[12],q[44];
-rz(6.0326094159894295) q[44];
-cx q[12],q[44];
-cx q[44],q[72];
-rz(6.0326094159894295) q[49];
-cx q[3],q[49];
-cx q[3],q[50];
-cx q[4],q[49];
-rz(6.0326094159894295) q[49];
-cx q[4],q[49];
-cx q[4],q[61];
-rx(1.3772888704935138) q[49];
-rz(6.0326094159894295) q[50];
-cx q[3],q[50];
-cx q[3],q[52];
-cx q[12],q[50];
-rz(6.0326094159894295) q[50];
-cx q[12],q[50];
-cx q[12],q[63];
-cx q[50],q[79];
-rz(6.0326094159894295) q[52];
-cx q[3],q[52];
-cx q[3],q[57];
-cx q[10],q[52];
-rz(6.0326094159894295) q[52];
-cx q[10],q[52];
-cx q[10],q[64];
-rx(1.3772888704935138) q[52];
-rz(6.0326094159894295) q[56];
-cx q[13],q[56];
-cx q[13],q[68];
-cx q[45],q[56];
-rz(6.0326094159894295) q[56];
-cx q[45],q[56];
-rx(1.3772888704935138) q[45];
-cx q[56],q[67];
-rz(6.0326094159894295) q[57];
-cx q[3],q[57];
-cx q[3],q[70];
-cx q[57],q[103];
-rz(6.0326094159894295) q[61];
-cx q[4],q[61];
-cx q[4],q[99];
-cx q[7],q[61];
-rz(6.0326094159894295) q[61];
-cx q[7],q[61];
-cx q[7],q[97];
-rx(1.3772888704935138) q[61];
-rz(6.0326094159894295) q[63];
-cx q[12],q[63];
-rx(1.3772888704935138) q[12];
-cx q[17],q[63];
-rz(6.0326094159894295) q[63];
-cx q[17],q[63];
-cx q[17],q[66];
-rz(6.0326094159894295) q[64];
-cx q[10],q[64];
-cx q[10],q[98];
-rx(1.3772888704935138) q[64];
-rz(6.0326094159894295) q[65];
-cx q[23],q[65];
-rx(1.3772888704935138) q[23];
-rx(1.3772888704935138) q[65];
-rz(6.0326094159894295) q[66];
-cx q[17],q[66];
-rx(1.3772888704935138) q[17];
-cx q[47],q[66];
-rz(6.0326094159894295) q[66];
-cx q[47],q[66];
-rx(1.3772888704935138) q[47];
-rx(1.3772888704935138) q[66];
-rz(6.0326094159894295) q[67];
-cx q[56],q[67];
-cx q[56],q[74];
-rx(1.3772888704935138) q[67];
-rz(6.0326094159894295) q[68];
-cx q[13],q[68];
-cx q[32],q[68];
-rz(6.0326094159894295) q[68];
-cx q[32],q[68];
-cx q[32],q[87];
-cx q[68],q[83];
-rz(6.0326094159894295) q[70];
-cx q[3],q[70];
-cx q[3],q[71];
-cx q[15],q[70];
-rz(6.0326094159894295) q[70];
-cx q[15],q[70];
-cx q[15],q[80];
-cx q[70],q[84];
-rz(6.0326094159894295) q[71];
-cx q[3],q[71];
-cx q[3],q[77];
-cx q[53],q[71];
-rz(6.0326094159894295) q[71];
-cx q[53],q[71];
-cx q[53],q[86];
-rx(1.3772888704935138) q[71];
-rz(6.0326094159894295) q[72];
-cx q[44],q[72];
-rx(1.3772888704935138) q[44];
-rx(1.3772888704935138) q[72];
-rz(6.0326094159894295) q[74];
-cx q[56],q[74];
-cx q[56],q[82];
-cx q[63],q[74];
-rz(6.0326094159894295) q[74];
-cx q[63],q[74];
-rx(1.3772888704935138) q[63];
-rx(1.3772888704935138) q[74];
-rz(6.0326094159894295) q[77];
-cx q[3],q[77];
-cx q[3],q[88];
-cx q[30],q[77];
-rz(6.0326094159894295) q[77];
-cx q[30],q[77];
-rx(1.3772888704935138) q[30];
-cx q[77],q[81];
-rz(6.0326094159894295) q[78];
-cx q[42],q[78];
-rx(1.3772888704935138) q[42];
-cx q[60],q[78];
-rz(6.0326094159894295) q[78];
-cx q[60],q[78];
-rx(1.3772888704935138) q[78];
-rz(6.0326094159894295) q[79];
-cx q[50],q[79];
-cx q[50],q[101];
-rx(1.3772888704935138) q[79];
-rz(6.0326094159894295) q[80];
-cx q[15],q[80];
-cx q[15],q[90];
-rx(1.3772888704935138) q[80];
-rz(6.0326094159894295) q[81];
-cx q[77],q[81];
-rx(1.3772888704935138) q[77];
-rx(1.3772888704935138) q[81];
-rz(6.0326094159894295) q[82];
-cx q[56],q[82];
-cx q[56],q[96];
-rx(1.3772888704935138) q[82];
-rz(6.0326094159894295) q[83];
-cx q[68],q[83];
-rx(1.3772888704935138) q[68];
-rx(1.3772888704935138) q[83];
-rz(6.0326094159894295) q[84];
-cx q[70],q[84];
-rx(1.3772888704935138) q[70];
-cx q[73],q[84];
-rz(6.0326094159894295) q[84];
-cx q[73],q[84];
-rx(1.3772888704935138) q[73];
-rx(1.3772888704935138) q[84];
-rz(6.0326094159894295) q[86];
-cx q[53],q[86];
-rx(1.3772888704935138) q[53];
-rx(1.3772888704935138) q[86];
-rz(6.0326094159894295) q[87];
-cx q[32],q[87];
-cx q[32],q[93];
-rx(1.3772888704935138) q[87];
-rz(6.0326094159894295) q[88];
-cx q[3],q[88];
-cx q[3],q[100];
-cx q[60],q[88];
-rz(6.0326094159894295) q[88];
-cx q[60],q[88];
-rx(1.3772888704935138) q[60];
-rx(1.3772888704935138) q[88];
-rz(6.0326094159894295) q[90];
-cx q[15],q[90];
-cx q[15],q[92];
-cx q[27],q[90];
-rz(6.0326094159894295) q[90];
-cx q[27],q[90];
-cx q[27],q[95];
-rx(1.3772888704935138) q[90];
-rz(6.0326094159894295) q[92];
-cx q[15],q[92];
-cx q[15],q[108];
-cx q[89],q[92];
-rz(6.0326094159894295) q[92];
-cx q[89],q[92];
-rx(1.3772888704935138) q[89];
-cx q[2],q[89];
-rz(4.218013125149368) q[89];
-cx q[2],q[89];
-rx(12.52105496138625) q[2];
-rz(6.0326094159894295) q[93];
-cx q[32],q[93];
-rx(1.3772888704935138) q[32];
-rx(1.3772888704935138) q[93];
-rz(6.0326094159894295) q[95];
-cx q[27],q[95];
-rx(1.3772888704935138) q[27];
-rx(1.3772888704935138) q[95];
-rz(6.0326094159894295) q[96];
-cx q[56],q[96];
-rx(1.3772888704935138) q[56];
-cx q[92],q[96];
-rz(6.0326094159894295) q[96];
-cx q[92],q[96];
-rx(1.3772888704935138) q[92];
-rx(1.3772888704935138) q[96];
-rz(6.0326094159894295) q[97];
-cx q[7],q[97];
-cx q[7],q[104];
-rx(1.3772888704935138) q[97];
-rz(6.0326094159894295) q[98];
-cx q[10],q[98];
-rx(1.3772888704935138) q[10];
-cx q[21],q[98];
-rz(6.0326094159894295) q[98];
-cx q[21],q[98];
-rx(1.3772888704935138) q[21];
-rx(1.3772888704935138) q[98];
-rz(6.0326094159894295) q[99];
-cx q[4],q[99];
-cx q[41],q[99];
-rz(6.0326094159894295) q[99];
-cx q[41],q[99];
-rx(1.3772888704935138) q[41];
-rx(1.3772888704935138) q[99];
-rz(6.0326094159894295) q[100];
-cx q[3],q[100];
-cx q[3],q[102];
-cx q[25],q[100];
-rz(6.0326094159894295) q[100];
-cx q[25],q[100];
-rx(1.3772888704935138) q[25];
-rx(1.3772888704935138) q[100];
-rz(6.0326094159894295) q[101];
-cx q[50],q[101];
-rx(1.3772888704935138) q[50];
-rx(1.3772888704935138) q[101];
-rz(6.0326094159894295) q[102];
-cx q[3],q[102];
-cx q[3],q[107];
-cx q[4],q[102];
-rz(6.0326094159894295) q[102];
-cx q[4],q[102];
-rx(1.3772888704935138) q[4];
-rx(1.3772888704935138) q[102];
-rz(6.0326094159894295) q[103];
-cx q[57],q[103];
-rx(1.3772888704935138) q[57];
-rx(1.3772888704935138) q[103];
-rz(6.0326094159894295) q[104];
-cx q[7],q[104];
-rx(1.3772888704935138) q[7];
-cx q[13],q[104];
-rz(6.0326094159894295) q[104];
-cx q[13],q[104];
-rx(1.3772888704935138) q[13];
-rx(1.3772888704935138) q[104];
-rz(6.0326094159894295) q[107];
-cx q[3],q[107];
-rx(1.3772888704935138) q[3];
-cx q[0],q[3];
-rz(4.218013125149368) q[3];
-cx q[0],q[3];
-cx q[1],q[3];
-rz(4.218013125149368) q[3];
-cx q[1],q[3];
-cx q[1],q[4];
-rz(4.218013125149368) q[4];
-cx q[1],q[4];
-cx q[3],q[4];
-rz(4.218013125149368) q[4];
-cx q[3],q[4];
-cx q[4],q[6];
-rz(4.218013125149368) q[6];
-cx q[4],q[6];
-cx q[31],q[107];
-rz(6.0326094159894295) q[107];
-cx q[31],q[107];
-rx(1.3772888704935138) q[107];
-rz(6.0326094159894295) q[108];
-cx q[15],q[108];
-rx(1.3772888704935138) q[15];
-cx q[0],q[15];
-rz(4.218013125149368) q[15];
-cx q[0],q[15];
-cx q[0],q[16];
-rz(4.218013125149368) q[16];
-cx q[0],q[16];
-cx q[0],q[20];
-rz(4.218013125149368) q[20];
-cx q[0],q[20];
-cx q[0],q[32];
-cx q[31],q[108];
-rz(4.218013125149368) q[32];
-cx q[0],q[32];
-cx q[0],q[42];
-rz(4.218013125149368) q[42];
-cx q[0],q[42];
-cx q[0],q[48];
-rz(4.218013125149368) q[48];
-cx q[0],q[48];
-cx q[0],q[51];
-rz(4.218013125149368) q[51];
-cx q[0],q[51];
-cx q[0],q[62];
-rz(4.218013125149368) q[62];
-cx q[0],q[62];
-cx q[0],q[64];
-rz(4.218013125149368) q[64];
-cx q[0],q[64];
-cx q[0],q[75];
-rz(4.218013125149368) q[75];
-cx q[0],q[75];
-cx q[0],q[82];
-rz(4.218013125149368) q[82];
-cx q[0],q[82];
-cx q[0],q[91];
-rz(4.218013125149368) q[91];
-cx q[0],q[91];
-cx q[0],q[93];
-rz(4.218013125149368) q[93];
-cx q[0],q[93];
-rx(12.52105496138625) q[0];
-rz(6.0326094159894295) q[108];
-cx q[31],q[108];
-rx(1.3772888704935138) q[31];
-rx(1.3772888704935138) q[108];
-rx(8.130134158291192) q[109];
-cx q[5],q[109];
-rz(6.0326094159894295) q[109];
-cx q[5],q[109];
-rx(1.3772888704935138) q[5];
-cx q[1],q[5];
-rz(4.218013125149368) q[5];
-cx q[1],q[5];
-cx q[1],q[9];
-cx q[3],q[5];
-rz(4.218013125149368) q[5];
-cx q[3],q[5];
-cx q[3],q[7];
-cx q[5],q[6];
-rz(4.218013125149368) q[6];
-cx q[5],q[6];
-rz(4.218013125149368) q[7];
-cx q[3],q[7];
-cx q[3],q[8];
-cx q[4],q[7];
-rz(4.218013125149368) q[7];
-cx q[4],q[7];
-cx q[4],q[10];
-rz(4.218013125149368) q[8];
-cx q[3],q[8];
-cx q[5],q[8];
-rz(4.218013125149368) q[8];
-cx q[5],q[8];
-cx q[5],q[11];
-cx q[8],q[83];
-rz(4.218013125149368) q[9];
-cx q[1],q[9];
-cx q[1],q[17];
-cx q[3],q[9];
-rz(4.218013125149368) q[9];
-cx q[3],q[9];
-cx q[3],q[12];
-rz(4.218013125149368) q[10];
-cx q[4],q[10];
-cx q[4],q[13];
-cx q[6],q[10];
-rz(4.218013125149368) q[10];
-cx q[6],q[10];
-cx q[10],q[37];
-rz(4.218013125149368) q[11];
-cx q[5],q[11];
-cx q[6],q[11];
-rz(4.218013125149368) q[11];
-cx q[6],q[11];
-rx(12.52105496138625) q[11];
-rz(4.218013125149368) q[12];
-cx q[3],q[12];
-cx q[3],q[14];
-cx q[5],q[12];
-rz(4.218013125149368) q[12];
-cx q[5],q[12];
-rz(4.218013125149368) q[13];
-cx q[4],q[13];
-cx q[5],q[13];
-rz(4.218013125149368) q[13];
-cx q[5],q[13];
-rz(4.218013125149368) q[14];
-cx q[3],q[14];
-cx q[3],q[15];
-cx q[4],q[14];
-rz(4.218013125149368) q[14];
-cx q[4],q[14];
-rx(12.52105496138625) q[14];
-rz(4.218013125149368) q[15];
-cx q[3],q[15];
-cx q[3],q[16];
-cx q[15],q[20];
-rz(4.218013125149368) q[16];
-cx q[3],q[16];
-rz(4.218013125149368) q[17];
-cx q[1],q[17];
-cx q[1],q[28];
-cx q[3],q[17];
-rz(4.218013125149368) q[17];
-cx q[3],q[17];
-cx q[3],q[18];
-rz(4.218013125149368) q[18];
-cx q[3],q[18];
-cx q[3],q[19];
-cx q[4],q[18];
-rz(4.218013125149368) q[18];
-cx q[4],q[18];
-cx q[4],q[21];
-rz(4.218013125149368) q[19];
-cx q[3],q[19];
-cx q[3],q[22];
-cx q[7],q[19];
-rz(4.218013125149368) q[19];
-cx q[7],q[19];
-cx q[19],q[38];
-rz(4.218013125149368) q[20];
-cx q[15],q[20];
-rz(4.218013125149368) q[21];
-cx q[4],q[21];
-cx q[4],q[27];
-cx q[15],q[21];
-rz(4.218013125149368) q[21];
-cx q[15],q[21];
-cx q[15],q[36];
-rz(4.218013125149368) q[22];
-cx q[3],q[22];
-cx q[3],q[23];
-cx q[9],q[22];
-rz(4.218013125149368) q[22];
-cx q[9],q[22];
-cx q[9],q[55];
-rx(12.52105496138625) q[22];
-rz(4.218013125149368) q[23];
-cx q[3],q[23];
-cx q[3],q[24];
-cx q[17],q[23];
-rz(4.218013125149368) q[23];
-cx q[17],q[23];
-rz(4.218013125149368) q[24];
-cx q[3],q[24];
-cx q[3],q[25];
-cx q[5],q[24];
-rz(4.218013125149368) q[24];
-cx q[5],q[24];
-cx q[5],q[33];
-cx q[24],q[54];
-rz(4.218013125149368) q[25];
-cx q[3],q[25];
-cx q[3],q[26];
-cx q[12],q[25];
-rz(4.218013125149368) q[25];
-cx q[12],q[25];
-cx q[12],q[31];
-rz(4.218013125149368) q[26];
-cx q[3],q[26];
-cx q[21],q[26];
-rz(4.218013125149368) q[26];
-cx q[21],q[26];
-cx q[21],q[32];
-rz(4.218013125149368) q[27];
-cx q[4],q[27];
-cx q[4],q[47];
-cx q[6],q[27];
-rz(4.218013125149368) q[27];
-cx q[6],q[27];
-cx q[6],q[69];
-rz(4.218013125149368) q[28];
-cx q[1],q[28];
-cx q[1],q[29];
-cx q[3],q[28];
-rz(4.218013125149368) q[28];
-cx q[3],q[28];
-cx q[28],q[51];
-rz(4.218013125149368) q[29];
-cx q[1],q[29];
-cx q[1],q[45];
-cx q[3],q[29];
-rz(4.218013125149368) q[29];
-cx q[3],q[29];
-cx q[3],q[30];
-rx(12.52105496138625) q[29];
-rz(4.218013125149368) q[30];
-cx q[3],q[30];
-cx q[3],q[34];
-cx q[18],q[30];
-rz(4.218013125149368) q[30];
-cx q[18],q[30];
-rx(12.52105496138625) q[18];
-rz(4.218013125149368) q[31];
-cx q[12],q[31];
-cx q[26],q[31];
-rz(4.218013125149368) q[31];
-cx q[26],q[31];
-cx q[26],q[105];
-rz(4.218013125149368) q[32];
-cx q[21],q[32];
-rz(4.218013125149368) q[33];
-cx q[5],q[33];
-cx q[5],q[46];
-cx q[30],q[33];
-rz(4.218013125149368) q[33];
-cx q[30],q[33];
-cx q[30],q[48];
-rx(12.52105496138625) q[33];
-rz(4.218013125149368) q[34];
-cx q[3],q[34];
-cx q[3],q[35];
-cx q[12],q[34];
-rz(4.218013125149368) q[34];
-cx q[12],q[34];
-rz(4.218013125149368) q[35];
-cx q[3],q[35];
-cx q[32],q[35];
-rz(4.218013125149368) q[35];
-cx q[32],q[35];
-rx(12.52105496138625) q[35];
-rz(4.218013125149368) q[36];
-cx q[15],q[36];
-cx q[20],q[36];
-rz(4.218013125149368) q[36];
-cx q[20],q[36];
-cx q[36],q[94];
-rz(4.218013125149368) q[37];
-cx q[10],q[37];
-cx q[10],q[41];
-cx q[34],q[37];
-rz(4.218013125149368) q[37];
-cx q[34],q[37];
-rx(12.52105496138625) q[34];
-cx q[37],q[85];
-rz(4.218013125149368) q[38];
-cx q[19],q[38];
-rx(12.52105496138625) q[19];
-cx q[21],q[38];
-rz(4.218013125149368) q[38];
-cx q[21],q[38];
-cx q[39],q[109];
-rz(4.218013125149368) q[41];
-cx q[10],q[41];
-cx q[27],q[41];
-rz(4.218013125149368) q[41];
-cx q[27],q[41];
-cx q[27],q[72];
-cx q[41],q[67];
-rz(4.218013125149368) q[45];
-cx q[1],q[45];
-cx q[1],q[57];
-cx q[16],q[45];
-rz(4.218013125149368) q[45];
-cx q[16],q[45];
-cx q[16],q[59];
-rz(4.218013125149368) q[46];
-cx q[5],q[46];
-cx q[5],q[65];
-cx q[38],q[46];
-rz(4.218013125149368) q[46];
-cx q[38],q[46];
-rx(12.52105496138625) q[38];
-rx(12.52105496138625) q[46];
-rz(4.218013125149368) q[47];
-cx q[4],q[47];
-cx q[17],q[47];
-rz(4.218013125149368) q[47];
-cx q[17],q[47];
-cx q[17],q[53];
-rz(4.218013125149368) q[48];
-cx q[30],q[48];
-rx(12.52105496138625) q[48];
-rz(4.218013125149368) q[51];
-cx q[28],q[51];
-rx(12.52105496138625) q[51];
-rz(4.218013125149368) q[53];
-cx q[17],q[53];
-cx q[17],q[62];
-cx q[21],q[53];
-rz(4.218013125149368) q[53];
-cx q[21],q[53];
-cx q[21],q[75];
-rz(4.218013125149368) q[54];
-cx q[24],q[54];
-cx q[24],q[58];
-cx q[28],q[54];
-rz(4.218013125149368) q[54];
-cx q[28],q[54];
-rx(12.52105496138625) q[54];
-rz(4.218013125149368) q[55];
-cx q[9],q[55];
-cx q[9],q[80];
-cx q[15],q[55];
-rz(4.218013125149368) q[55];
-cx q[15],q[55];
-rz(4.218013125149368) q[57];
-cx q[1],q[57];
-cx q[1],q[60];
-rz(4.218013125149368) q[58];
-cx q[24],q[58];
-cx q[24],q[86];
-cx q[28],q[58];
-rz(4.218013125149368) q[58];
-cx q[28],q[58];
-cx q[28],q[87];
-rx(12.52105496138625) q[58];
-rz(4.218013125149368) q[59];
-cx q[16],q[59];
-cx q[16],q[73];
-cx q[32],q[59];
-rz(4.218013125149368) q[59];
-cx q[32],q[59];
-rz(4.218013125149368) q[60];
-cx q[1],q[60];
-cx q[1],q[97];
-cx q[7],q[60];
-rz(4.218013125149368) q[60];
-cx q[7],q[60];
-rz(4.218013125149368) q[62];
-cx q[17],q[62];
-rx(12.52105496138625) q[62];
-rz(4.218013125149368) q[65];
-cx q[5],q[65];
-cx q[5],q[76];
-rz(4.218013125149368) q[67];
-cx q[41],q[67];
-rz(4.218013125149368) q[69];
-cx q[6],q[69];
-cx q[59],q[69];
-rz(4.218013125149368) q[69];
-cx q[59],q[69];
-rx(12.52105496138625) q[69];
-rz(4.218013125149368) q[72];
-cx q[27],q[72];
-rz(4.218013125149368) q[73];
-cx q[16],q[73];
-cx q[16],q[101];
-cx q[59],q[73];
-rz(4.218013125149368) q[73];
-cx q[59],q[73];
-rz(4.218013125149368) q[75];
-cx q[21],q[75];
-cx q[21],q[81];
-rx(12.52105496138625) q[75];
-rz(4.218013125149368) q[76];
-cx q[5],q[76];
-cx q[5],q[89];
-cx q[6],q[76];
-rz(4.218013125149368) q[76];
-cx q[6],q[76];
-cx q[6],q[79];
-rx(12.52105496138625) q[76];
-rz(4.218013125149368) q[79];
-cx q[6],q[79];
-cx q[6],q[91];
-rz(4.218013125149368) q[80];
-cx q[9],q[80];
-rx(12.52105496138625) q[9];
-rz(4.218013125149368) q[81];
-cx q[21],q[81];
-rz(4.218013125149368) q[83];
-cx q[8],q[83];
-rx(12.52105496138625) q[8];
-rz(4.218013125149368) q[85];
-cx q[37],q[85];
-rx(12.52105496138625) q[37];
-cx q[59],q[85];
-rz(4.218013125149368) q[85];
-cx q[59],q[85];
-rx(12.52105496138625) q[59];
-rx(12.52105496138625) q[85];
-rz(4.218013125149368) q[86];
-cx q[24],q[86];
-rx(12.52105496138625) q[24];
-rz(4.218013125149368) q[87];
-cx q[28],q[87];
-rz(4.218013125149368) q[89];
-cx q[5],q[89];
-cx q[5],q[95];
-rz(4.218013125149368) q[91];
-cx q[6],q[91];
-rx(12.52105496138625) q[6];
-rx(12.52105496138625) q[91];
-rz(4.218013125149368) q[94];
-cx q[36],q[94];
-cx q[55],q[94];
-rz(4.218013125149368) q[94];
-cx q[55],q[94];
-rx(12.52105496138625) q[55];
-rx(12.52105496138625) q[94];
-rz(4.218013125149368) q[95];
-cx q[5],q[95];
-cx q[5],q[106];
-rz(4.218013125149368) q[97];
-cx q[1],q[97];
-rx(12.52105496138625) q[1];
-rz(4.218013125149368) q[101];
-cx q[16],q[101];
-cx q[16],q[103];
-rz(4.218013125149368) q[103];
-cx q[16],q[103];
-rx(12.52105496138625) q[16];
-rz(4.218013125149368) q[105];
-cx q[26],q[105];
-rx(12.52105496138625) q[26];
-cx q[28],q[105];
-rz(4.218013125149368) q[105];
-cx q[28],q[105];
-rx(12.52105496138625) q[28];
-rx(12.52105496138625) q[105];
-rz(4.218013125149368) q[106];
-cx q[5],q[106];
-cx q[36],q[106];
-rz(4.218013125149368) q[106];
-cx q[36],q[106];
-rx(12.52105496138625) q[36];
-rx(12.52105496138625) q[106];
-rz(6.0326094159894295) q[109];
-cx q[39],q[109];
-rx(1.3772888704935138) q[39];
-cx q[3],q[39];
-rz(4.218013125149368) q[39];
-cx q[3],q[39];
-cx q[3],q[40];
-cx q[13],q[39];
-rz(4.218013125149368) q[39];
-cx q[13],q[39];
-cx q[13],q[56];
-rz(4.218013125149368) q[40];
-cx q[3],q[40];
-cx q[3],q[42];
-cx q[23],q[40];
-rz(4.218013125149368) q[40];
-cx q[23],q[40];
-cx q[23],q[65];
-rx(12.52105496138625) q[40];
-rz(4.218013125149368) q[42];
-cx q[3],q[42];
-cx q[3],q[43];
-cx q[42],q[78];
-rz(4.218013125149368) q[43];
-cx q[3],q[43];
-cx q[3],q[44];
-cx q[20],q[43];
-rz(4.218013125149368) q[43];
-cx q[20],q[43];
-rx(12.52105496138625) q[20];
-rx(12.52105496138625) q[43];
-rz(4.218013125149368) q[44];
-cx q[3],q[44];
-cx q[3],q[49];
-cx q[12],q[44];
-rz(4.218013125149368) q[44];
-cx q[12],q[44];
-cx q[44],q[72];
-rz(4.218013125149368) q[49];
-cx q[3],q[49];
-cx q[3],q[50];
-cx q[4],q[49];
-rz(4.218013125149368) q[49];
-cx q[4],q[49];
-cx q[4],q[61];
-rx(12.52105496138625) q[49];
-rz(4.218013125149368) q[50];
-cx q[3],q[50];
-cx q[3],q[52];
-cx q[12],q[50];
-rz(4.218013125149368) q[50];
-cx q[12],q[50];
-cx q[12],q[63];
-cx q[50],q[79];
-rz(4.218013125149368) q[52];
-cx q[3],q[52];
-cx q[3],q[57];
-cx q[10],q[52];
-rz(4.218013125149368) q[52];
-cx q[10],q[52];
-cx q[10],q[64];
-rx(12.52105496138625) q[52];
-rz(4.218013125149368) q[56];
-cx q[13],q[56];
-cx q[13],q[68];
-cx q[45],q[56];
-rz(4.218013125149368) q[56];
-cx q[45],q[56];
-rx(12.52105496138625) q[45];
-cx q[56],q[67];
-rz(4.218013125149368) q[57];
-cx q[3],q[57];
-cx q[3],q[70];
-cx q[57],q[103];
-rz(4.218013125149368) q[61];
-cx q[4],q[61];
-cx q[4],q[99];
-cx q[7],q[61];
-rz(4.218013125149368) q[61];
-cx q[7],q[61];
-cx q[7],q[97];
-rx(12.52105496138625) q[61];
-rz(4.218013125149368) q[63];
-cx q[12],q[63];
-rx(12.52105496138625) q[12];
-cx q[17],q[63];
-rz(4.218013125149368) q[63];
-cx q[17],q[63];
-cx q[17],q[66];
-rz(4.218013125149368) q[64];
-cx q[10],q[64];
-cx q[10],q[98];
-rx(12.52105496138625) q[64];
-rz(4.218013125149368) q[65];
-cx q[23],q[65];
-rx(12.52105496138625) q[23];
-rx(12.52105496138625) q[65];
-rz(4.218013125149368) q[66];
-cx q[17],q[66];
-rx(12.52105496138625) q[17];
-cx q[47],q[66];
-rz(4.218013125149368) q[66];
-cx q[47],q[66];
-rx(12.52105496138625) q[47];
-rx(12.52105496138625) q[66];
-rz(4.218013125149368) q[67];
-cx q[56],q[67];
-cx q[56],q[74];
-rx(12.52105496138625) q[67];
-rz(4.218013125149368) q[68];
-cx q[13],q[68];
-cx q[32],q[68];
-rz(4.218013125149368) q[68];
-cx q[32],q[68];
-cx q[32],q[87];
-cx q[68],q[83];
-rz(4.218013125149368) q[70];
-cx q[3],q[70];
-cx q[3],q[71];
-cx q[15],q[70];
-rz(4.218013125149368) q[70];
-cx q[15],q[70];
-cx q[15],q[80];
-cx q[70],q[84];
-rz(4.218013125149368) q[71];
-cx q[3],q[71];
-cx q[3],q[77];
-cx q[53],q[71];
-rz(4.218013125149368) q[71];
-cx q[53],q[71];
-cx q[53],q[86];
-rx(12.52105496138625) q[71];
-rz(4.218013125149368) q[72];
-cx q[44],q[72];
-rx(12.52105496138625) q[44];
-rx(12.52105496138625) q[72];
-rz(4.218013125149368) q[74];
-cx q[56],q[74];
-cx q[56],q[82];
-cx q[63],q[74];
-rz(4.218013125149368) q[74];
-cx q[63],q[74];
-rx(12.52105496138625) q[63];
-rx(12.52105496138625) q[74];
-rz(4.218013125149368) q[77];
-cx q[3],q[77];
-cx q[3],q[88];
-cx q[30],q[77];
-rz(4.218013125149368) q[77];
-cx q[30],q[77];
-rx(12.52105496138625) q[30];
-cx q[77],q[81];
-rz(4.218013125149368) q[78];
-cx q[42],q[78];
-rx(12.52105496138625) q[42];
-cx q[60],q[78];
-rz(4.218013125149368) q[78];
-cx q[60],q[78];
-rx(12.52105496138625) q[78];
-rz(4.218013125149368) q[79];
-cx q[50],q[79];
-cx q[50],q[101];
-rx(12.52105496138625) q[79];
-rz(4.218013125149368) q[80];
-cx q[15],q[80];
-cx q[15],q[90];
-rx(12.52105496138625) q[80];
-rz(4.218013125149368) q[81];
-cx q[77],q[81];
-rx(12.52105496138625) q[77];
-rx(12.52105496138625) q[81];
-rz(4.218013125149368) q[82];
-cx q[56],q[82];
-cx q[56],q[96];
-rx(12.52105496138625) q[82];
-rz(4.218013125149368) q[83];
-cx q[68],q[83];
-rx(12.52105496138625) q[68];
-rx(12.52105496138625) q[83];
-rz(4.218013125149368) q[84];
-cx q[70],q[84];
-rx(12.52105496138625) q[70];
-cx q[73],q[84];
-rz(4.218013125149368) q[84];
-cx q[73],q[84];
-rx(12.52105496138625) q[73];
-rx(12.52105496138625) q[84];
-rz(4.218013125149368) q[86];
-cx q[53],q[86];
-rx(12.52105496138625) q[53];
-rx(12.52105496138625) q[86];
-rz(4.218013125149368) q[87];
-cx q[32],q[87];
-cx q[32],q[93];
-rx(12.52105496138625) q[87];
-rz(4.218013125149368) q[88];
-cx q[3],q[88];
-cx q[3],q[100];
-cx q[60],q[88];
-rz(4.218013125149368) q[88];
-cx q[60],q[88];
-rx(12.52105496138625) q[60];
-rx(12.52105496138625) q[88];
-rz(4.218013125149368) q[90];
-cx q[15],q[90];
-cx q[15],q[92];
-cx q[27],q[90];
-rz(4.218013125149368) q[90];
-cx q[27],q[90];
-cx q[27],q[95];
-rx(12.52105496138625) q[90];
-rz(4.218013125149368) q[92];
-cx q[15],q[92];
-cx q[15],q[108];
-cx q[89],q[92];
-rz(4.218013125149368) q[92];
-cx q[89],q[92];
-rx(12.52105496138625) q[89];
-rz(4.218013125149368) q[93];
-cx q[32],q[93];
-rx(12.52105496138625) q[32];
-rx(12.52105496138625) q[93];
-rz(4.218013125149368) q[95];
-cx q[27],q[95];
-rx(12.52105496138625) q[27];
-rx(12.52105496138625) q[95];
-rz(4.218013125149368) q[96];
-cx q[56],q[96];
-rx(12.52105496138625) q[56];
-cx q[92],q[96];
-rz(4.218013125149368) q[96];
-cx q[92],q[96];
-rx(12.52105496138625) q[92];
-rx(12.52105496138625) q[96];
-rz(4.218013125149368) q[97];
-cx q[7],q[97];
-cx q[7],q[104];
-rx(12.52105496138625) q[97];
-rz(4.218013125149368) q[98];
-cx q[10],q[98];
-rx(12.52105496138625) q[10];
-cx q[21],q[98];
-rz(4.218013125149368) q[98];
-cx q[21],q[98];
-rx(12.52105496138625) q[21];
-rx(12.52105496138625) q[98];
-rz(4.218013125149368) q[99];
-cx q[4],q[99];
-cx q[41],q[99];
-rz(4.218013125149368) q[99];
-cx q[41],q[99];
-rx(12.52105496138625) q[41];
-rx(12.52105496138625) q[99];
-rz(4.218013125149368) q[100];
-cx q[3],q[100];
-cx q[3],q[102];
-cx q[25],q[100];
-rz(4.218013125149368) q[100];
-cx q[25],q[100];
-rx(12.52105496138625) q[25];
-rx(12.52105496138625) q[100];
-rz(4.218013125149368) q[101];
-cx q[50],q[101];
-rx(12.52105496138625) q[50];
-rx(12.52105496138625) q[101];
-rz(4.218013125149368) q[102];
-cx q[3],q[102];
-cx q[3],q[107];
-cx q[4],q[102];
-rz(4.218013125149368) q[102];
-cx q[4],q[102];
-rx(12.52105496138625) q[4];
-rx(12.52105496138625) q[102];
-rz(4.218013125149368) q[103];
-cx q[57],q[103];
-rx(12.52105496138625) q[57];
-rx(12.52105496138625) q[103];
-rz(4.218013125149368) q[104];
-cx q[7],q[104];
-rx(12.52105496138625) q[7];
-cx q[13],q[104];
-rz(4.218013125149368) q[104];
-cx q[13],q[104];
-rx(12.52105496138625) q[13];
-rx(12.52105496138625) q[104];
-rz(4.218013125149368) q[107];
-cx q[3],q[107];
-rx(12.52105496138625) q[3];
-cx q[31],q[107];
-rz(4.218013125149368) q[107];
-cx q[31],q[107];
-rx(12.52105496138625) q[107];
-rz(4.218013125149368) q[108];
-cx q[15],q[108];
-rx(12.52105496138625) q[15];
-cx q[31],q[108];
-rz(4.218013125149368) q[108];
-cx q[31],q[108];
-rx(12.52105496138625) q[31];
-rx(12.52105496138625) q[108];
-rx(1.3772888704935138) q[109];
-cx q[5],q[109];
-rz(4.218013125149368) q[109];
-cx q[5],q[109];
-rx(12.52105496138625) q[5];
-cx q[39],q[109];
-rz(4.218013125149368) q[109];
-cx q[39],q[109];
-rx(12.52105496138625) q[39];
-rx(12.52105496138625) q[109];
\ No newline at end of file
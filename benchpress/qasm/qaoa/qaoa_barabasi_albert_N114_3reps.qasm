@@ -1,2589 +0,0 @@
-OPENQASM 2.0;
-include "qelib1.inc";
-qreg q[114];
-ry(pi/2) q[0];
-rx(pi) q[0];
-ry(pi/2) q[1];
-rx(pi) q[1];
-cx q[0],q[1];
-rz(2.598543468353628) q[1];
-cx q[0],q[1];
-ry(pi/2) q[2];
-rx(pi) q[2];
-cx q[0],q[2];
-rz(2.598543468353628) q[2];
-cx q[0],q[2];
-ry(pi/2) q[3];
-rx(pi) q[3];
-cx q[0],q[3];
-rz(2.598543468353628) q[3];
-cx q[0],q[3];
-cx q[1],q[3];
-rz(2.598543468353628) q[3];
-cx q[1],q[3];
-ry(pi/2) q[4];
-rx(pi) q[4];
-cx q[1],q[4];
-rz(2.598543468353628) q[4];
-cx q[1],q[4];
-cx q[3],q[4];
-rz(2.598543468353628) q[4];
-cx q[3],q[4];
-ry(pi/2) q[5];
-rx(pi) q[5];
-cx q[1],q[5];
-rz(2.598543468353628) q[5];
-cx q[1],q[5];
-cx q[3],q[5];
-rz(2.598543468353628) q[5];
-cx q[3],q[5];
-ry(pi/2) q[6];
-rx(pi) q[6];
-cx q[4],q[6];
-rz(2.598543468353628) q[6];
-cx q[4],q[6];
-cx q[5],q[6];
-rz(2.598543468353628) q[6];
-cx q[5],q[6];
-ry(pi/2) q[7];
-rx(pi) q[7];
-cx q[3],q[7];
-rz(2.598543468353628) q[7];
-cx q[3],q[7];
-cx q[4],q[7];
-rz(2.598543468353628) q[7];
-cx q[4],q[7];
-ry(pi/2) q[8];
-rx(pi) q[8];
-cx q[3],q[8];
-rz(2.598543468353628) q[8];
-cx q[3],q[8];
-cx q[5],q[8];
-rz(2.598543468353628) q[8];
-cx q[5],q[8];
-ry(pi/2) q[9];
-rx(pi) q[9];
-cx q[1],q[9];
-rz(2.598543468353628) q[9];
-cx q[1],q[9];
-cx q[3],q[9];
-rz(2.598543468353628) q[9];
-cx q[3],q[9];
-ry(pi/2) q[10];
-rx(pi) q[10];
-cx q[4],q[10];
-rz(2.598543468353628) q[10];
-cx q[4],q[10];
-cx q[6],q[10];
-rz(2.598543468353628) q[10];
-cx q[6],q[10];
-ry(pi/2) q[11];
-rx(pi) q[11];
-cx q[5],q[11];
-rz(2.598543468353628) q[11];
-cx q[5],q[11];
-cx q[6],q[11];
-rz(2.598543468353628) q[11];
-cx q[6],q[11];
-rx(11.972056945480901) q[11];
-ry(pi/2) q[12];
-rx(pi) q[12];
-cx q[3],q[12];
-rz(2.598543468353628) q[12];
-cx q[3],q[12];
-cx q[5],q[12];
-rz(2.598543468353628) q[12];
-cx q[5],q[12];
-ry(pi/2) q[13];
-rx(pi) q[13];
-cx q[4],q[13];
-rz(2.598543468353628) q[13];
-cx q[4],q[13];
-cx q[5],q[13];
-rz(2.598543468353628) q[13];
-cx q[5],q[13];
-ry(pi/2) q[14];
-rx(pi) q[14];
-cx q[3],q[14];
-rz(2.598543468353628) q[14];
-cx q[3],q[14];
-cx q[4],q[14];
-rz(2.598543468353628) q[14];
-cx q[4],q[14];
-rx(11.972056945480901) q[14];
-ry(pi/2) q[15];
-rx(pi) q[15];
-cx q[0],q[15];
-rz(2.598543468353628) q[15];
-cx q[0],q[15];
-cx q[3],q[15];
-rz(2.598543468353628) q[15];
-cx q[3],q[15];
-ry(pi/2) q[16];
-rx(pi) q[16];
-cx q[0],q[16];
-rz(2.598543468353628) q[16];
-cx q[0],q[16];
-cx q[3],q[16];
-rz(2.598543468353628) q[16];
-cx q[3],q[16];
-ry(pi/2) q[17];
-rx(pi) q[17];
-cx q[1],q[17];
-rz(2.598543468353628) q[17];
-cx q[1],q[17];
-cx q[3],q[17];
-rz(2.598543468353628) q[17];
-cx q[3],q[17];
-ry(pi/2) q[18];
-rx(pi) q[18];
-cx q[3],q[18];
-rz(2.598543468353628) q[18];
-cx q[3],q[18];
-cx q[4],q[18];
-rz(2.598543468353628) q[18];
-cx q[4],q[18];
-ry(pi/2) q[19];
-rx(pi) q[19];
-cx q[3],q[19];
-rz(2.598543468353628) q[19];
-cx q[3],q[19];
-cx q[7],q[19];
-rz(2.598543468353628) q[19];
-cx q[7],q[19];
-ry(pi/2) q[20];
-rx(pi) q[20];
-cx q[0],q[20];
-rz(2.598543468353628) q[20];
-cx q[0],q[20];
-cx q[15],q[20];
-rz(2.598543468353628) q[20];
-cx q[15],q[20];
-ry(pi/2) q[21];
-rx(pi) q[21];
-cx q[4],q[21];
-rz(2.598543468353628) q[21];
-cx q[4],q[21];
-cx q[15],q[21];
-rz(2.598543468353628) q[21];
-cx q[15],q[21];
-ry(pi/2) q[22];
-rx(pi) q[22];
-cx q[3],q[22];
-rz(2.598543468353628) q[22];
-cx q[3],q[22];
-cx q[9],q[22];
-rz(2.598543468353628) q[22];
-cx q[9],q[22];
-rx(11.972056945480901) q[22];
-ry(pi/2) q[23];
-rx(pi) q[23];
-cx q[3],q[23];
-rz(2.598543468353628) q[23];
-cx q[3],q[23];
-cx q[17],q[23];
-rz(2.598543468353628) q[23];
-cx q[17],q[23];
-ry(pi/2) q[24];
-rx(pi) q[24];
-cx q[3],q[24];
-rz(2.598543468353628) q[24];
-cx q[3],q[24];
-cx q[5],q[24];
-rz(2.598543468353628) q[24];
-cx q[5],q[24];
-ry(pi/2) q[25];
-rx(pi) q[25];
-cx q[3],q[25];
-rz(2.598543468353628) q[25];
-cx q[3],q[25];
-cx q[12],q[25];
-rz(2.598543468353628) q[25];
-cx q[12],q[25];
-ry(pi/2) q[26];
-rx(pi) q[26];
-cx q[3],q[26];
-rz(2.598543468353628) q[26];
-cx q[3],q[26];
-cx q[21],q[26];
-rz(2.598543468353628) q[26];
-cx q[21],q[26];
-ry(pi/2) q[27];
-rx(pi) q[27];
-cx q[4],q[27];
-rz(2.598543468353628) q[27];
-cx q[4],q[27];
-cx q[6],q[27];
-rz(2.598543468353628) q[27];
-cx q[6],q[27];
-ry(pi/2) q[28];
-rx(pi) q[28];
-cx q[1],q[28];
-rz(2.598543468353628) q[28];
-cx q[1],q[28];
-cx q[3],q[28];
-rz(2.598543468353628) q[28];
-cx q[3],q[28];
-ry(pi/2) q[29];
-rx(pi) q[29];
-cx q[1],q[29];
-rz(2.598543468353628) q[29];
-cx q[1],q[29];
-cx q[3],q[29];
-rz(2.598543468353628) q[29];
-cx q[3],q[29];
-rx(11.972056945480901) q[29];
-ry(pi/2) q[30];
-rx(pi) q[30];
-cx q[3],q[30];
-rz(2.598543468353628) q[30];
-cx q[3],q[30];
-cx q[18],q[30];
-rz(2.598543468353628) q[30];
-cx q[18],q[30];
-rx(11.972056945480901) q[18];
-ry(pi/2) q[31];
-rx(pi) q[31];
-cx q[12],q[31];
-rz(2.598543468353628) q[31];
-cx q[12],q[31];
-cx q[26],q[31];
-rz(2.598543468353628) q[31];
-cx q[26],q[31];
-ry(pi/2) q[32];
-rx(pi) q[32];
-cx q[0],q[32];
-rz(2.598543468353628) q[32];
-cx q[0],q[32];
-cx q[21],q[32];
-rz(2.598543468353628) q[32];
-cx q[21],q[32];
-ry(pi/2) q[33];
-rx(pi) q[33];
-cx q[5],q[33];
-rz(2.598543468353628) q[33];
-cx q[5],q[33];
-cx q[30],q[33];
-rz(2.598543468353628) q[33];
-cx q[30],q[33];
-rx(11.972056945480901) q[33];
-ry(pi/2) q[34];
-rx(pi) q[34];
-cx q[3],q[34];
-rz(2.598543468353628) q[34];
-cx q[3],q[34];
-cx q[12],q[34];
-rz(2.598543468353628) q[34];
-cx q[12],q[34];
-ry(pi/2) q[35];
-rx(pi) q[35];
-cx q[3],q[35];
-rz(2.598543468353628) q[35];
-cx q[3],q[35];
-cx q[32],q[35];
-rz(2.598543468353628) q[35];
-cx q[32],q[35];
-rx(11.972056945480901) q[35];
-ry(pi/2) q[36];
-rx(pi) q[36];
-cx q[15],q[36];
-rz(2.598543468353628) q[36];
-cx q[15],q[36];
-cx q[20],q[36];
-rz(2.598543468353628) q[36];
-cx q[20],q[36];
-ry(pi/2) q[37];
-rx(pi) q[37];
-cx q[10],q[37];
-rz(2.598543468353628) q[37];
-cx q[10],q[37];
-cx q[34],q[37];
-rz(2.598543468353628) q[37];
-cx q[34],q[37];
-rx(11.972056945480901) q[34];
-ry(pi/2) q[38];
-rx(pi) q[38];
-cx q[19],q[38];
-rz(2.598543468353628) q[38];
-cx q[19],q[38];
-rx(11.972056945480901) q[19];
-cx q[21],q[38];
-rz(2.598543468353628) q[38];
-cx q[21],q[38];
-ry(pi/2) q[39];
-rx(pi) q[39];
-cx q[3],q[39];
-rz(2.598543468353628) q[39];
-cx q[3],q[39];
-cx q[13],q[39];
-rz(2.598543468353628) q[39];
-cx q[13],q[39];
-ry(pi/2) q[40];
-rx(pi) q[40];
-cx q[3],q[40];
-rz(2.598543468353628) q[40];
-cx q[3],q[40];
-cx q[23],q[40];
-rz(2.598543468353628) q[40];
-cx q[23],q[40];
-rx(11.972056945480901) q[40];
-ry(pi/2) q[41];
-rx(pi) q[41];
-cx q[10],q[41];
-rz(2.598543468353628) q[41];
-cx q[10],q[41];
-cx q[27],q[41];
-rz(2.598543468353628) q[41];
-cx q[27],q[41];
-ry(pi/2) q[42];
-rx(pi) q[42];
-cx q[0],q[42];
-rz(2.598543468353628) q[42];
-cx q[0],q[42];
-cx q[3],q[42];
-rz(2.598543468353628) q[42];
-cx q[3],q[42];
-ry(pi/2) q[43];
-rx(pi) q[43];
-cx q[3],q[43];
-rz(2.598543468353628) q[43];
-cx q[3],q[43];
-cx q[20],q[43];
-rz(2.598543468353628) q[43];
-cx q[20],q[43];
-rx(11.972056945480901) q[20];
-rx(11.972056945480901) q[43];
-ry(pi/2) q[44];
-rx(pi) q[44];
-cx q[3],q[44];
-rz(2.598543468353628) q[44];
-cx q[3],q[44];
-cx q[12],q[44];
-rz(2.598543468353628) q[44];
-cx q[12],q[44];
-ry(pi/2) q[45];
-rx(pi) q[45];
-cx q[1],q[45];
-rz(2.598543468353628) q[45];
-cx q[1],q[45];
-cx q[16],q[45];
-rz(2.598543468353628) q[45];
-cx q[16],q[45];
-ry(pi/2) q[46];
-rx(pi) q[46];
-cx q[5],q[46];
-rz(2.598543468353628) q[46];
-cx q[5],q[46];
-cx q[38],q[46];
-rz(2.598543468353628) q[46];
-cx q[38],q[46];
-rx(11.972056945480901) q[38];
-rx(11.972056945480901) q[46];
-ry(pi/2) q[47];
-rx(pi) q[47];
-cx q[4],q[47];
-rz(2.598543468353628) q[47];
-cx q[4],q[47];
-cx q[17],q[47];
-rz(2.598543468353628) q[47];
-cx q[17],q[47];
-ry(pi/2) q[48];
-rx(pi) q[48];
-cx q[0],q[48];
-rz(2.598543468353628) q[48];
-cx q[0],q[48];
-cx q[30],q[48];
-rz(2.598543468353628) q[48];
-cx q[30],q[48];
-rx(11.972056945480901) q[48];
-ry(pi/2) q[49];
-rx(pi) q[49];
-cx q[3],q[49];
-rz(2.598543468353628) q[49];
-cx q[3],q[49];
-cx q[4],q[49];
-rz(2.598543468353628) q[49];
-cx q[4],q[49];
-rx(11.972056945480901) q[49];
-ry(pi/2) q[50];
-rx(pi) q[50];
-cx q[3],q[50];
-rz(2.598543468353628) q[50];
-cx q[3],q[50];
-cx q[12],q[50];
-rz(2.598543468353628) q[50];
-cx q[12],q[50];
-ry(pi/2) q[51];
-rx(pi) q[51];
-cx q[0],q[51];
-rz(2.598543468353628) q[51];
-cx q[0],q[51];
-cx q[28],q[51];
-rz(2.598543468353628) q[51];
-cx q[28],q[51];
-rx(11.972056945480901) q[51];
-ry(pi/2) q[52];
-rx(pi) q[52];
-cx q[3],q[52];
-rz(2.598543468353628) q[52];
-cx q[3],q[52];
-cx q[10],q[52];
-rz(2.598543468353628) q[52];
-cx q[10],q[52];
-rx(11.972056945480901) q[52];
-ry(pi/2) q[53];
-rx(pi) q[53];
-cx q[17],q[53];
-rz(2.598543468353628) q[53];
-cx q[17],q[53];
-cx q[21],q[53];
-rz(2.598543468353628) q[53];
-cx q[21],q[53];
-ry(pi/2) q[54];
-rx(pi) q[54];
-cx q[24],q[54];
-rz(2.598543468353628) q[54];
-cx q[24],q[54];
-cx q[28],q[54];
-rz(2.598543468353628) q[54];
-cx q[28],q[54];
-rx(11.972056945480901) q[54];
-ry(pi/2) q[55];
-rx(pi) q[55];
-cx q[9],q[55];
-rz(2.598543468353628) q[55];
-cx q[9],q[55];
-cx q[15],q[55];
-rz(2.598543468353628) q[55];
-cx q[15],q[55];
-ry(pi/2) q[56];
-rx(pi) q[56];
-cx q[13],q[56];
-rz(2.598543468353628) q[56];
-cx q[13],q[56];
-cx q[45],q[56];
-rz(2.598543468353628) q[56];
-cx q[45],q[56];
-rx(11.972056945480901) q[45];
-ry(pi/2) q[57];
-rx(pi) q[57];
-cx q[1],q[57];
-rz(2.598543468353628) q[57];
-cx q[1],q[57];
-cx q[3],q[57];
-rz(2.598543468353628) q[57];
-cx q[3],q[57];
-ry(pi/2) q[58];
-rx(pi) q[58];
-cx q[24],q[58];
-rz(2.598543468353628) q[58];
-cx q[24],q[58];
-cx q[28],q[58];
-rz(2.598543468353628) q[58];
-cx q[28],q[58];
-rx(11.972056945480901) q[58];
-ry(pi/2) q[59];
-rx(pi) q[59];
-cx q[16],q[59];
-rz(2.598543468353628) q[59];
-cx q[16],q[59];
-cx q[32],q[59];
-rz(2.598543468353628) q[59];
-cx q[32],q[59];
-ry(pi/2) q[60];
-rx(pi) q[60];
-cx q[1],q[60];
-rz(2.598543468353628) q[60];
-cx q[1],q[60];
-cx q[7],q[60];
-rz(2.598543468353628) q[60];
-cx q[7],q[60];
-ry(pi/2) q[61];
-rx(pi) q[61];
-cx q[4],q[61];
-rz(2.598543468353628) q[61];
-cx q[4],q[61];
-cx q[7],q[61];
-rz(2.598543468353628) q[61];
-cx q[7],q[61];
-rx(11.972056945480901) q[61];
-ry(pi/2) q[62];
-rx(pi) q[62];
-cx q[0],q[62];
-rz(2.598543468353628) q[62];
-cx q[0],q[62];
-cx q[17],q[62];
-rz(2.598543468353628) q[62];
-cx q[17],q[62];
-rx(11.972056945480901) q[62];
-ry(pi/2) q[63];
-rx(pi) q[63];
-cx q[12],q[63];
-rz(2.598543468353628) q[63];
-cx q[12],q[63];
-rx(11.972056945480901) q[12];
-cx q[17],q[63];
-rz(2.598543468353628) q[63];
-cx q[17],q[63];
-ry(pi/2) q[64];
-rx(pi) q[64];
-cx q[0],q[64];
-rz(2.598543468353628) q[64];
-cx q[0],q[64];
-cx q[10],q[64];
-rz(2.598543468353628) q[64];
-cx q[10],q[64];
-rx(11.972056945480901) q[64];
-ry(pi/2) q[65];
-rx(pi) q[65];
-cx q[5],q[65];
-rz(2.598543468353628) q[65];
-cx q[5],q[65];
-cx q[23],q[65];
-rz(2.598543468353628) q[65];
-cx q[23],q[65];
-rx(11.972056945480901) q[23];
-rx(11.972056945480901) q[65];
-ry(pi/2) q[66];
-rx(pi) q[66];
-cx q[17],q[66];
-rz(2.598543468353628) q[66];
-cx q[17],q[66];
-rx(11.972056945480901) q[17];
-cx q[47],q[66];
-rz(2.598543468353628) q[66];
-cx q[47],q[66];
-rx(11.972056945480901) q[47];
-rx(11.972056945480901) q[66];
-ry(pi/2) q[67];
-rx(pi) q[67];
-cx q[41],q[67];
-rz(2.598543468353628) q[67];
-cx q[41],q[67];
-cx q[56],q[67];
-rz(2.598543468353628) q[67];
-cx q[56],q[67];
-rx(11.972056945480901) q[67];
-ry(pi/2) q[68];
-rx(pi) q[68];
-cx q[13],q[68];
-rz(2.598543468353628) q[68];
-cx q[13],q[68];
-cx q[32],q[68];
-rz(2.598543468353628) q[68];
-cx q[32],q[68];
-ry(pi/2) q[69];
-rx(pi) q[69];
-cx q[6],q[69];
-rz(2.598543468353628) q[69];
-cx q[6],q[69];
-cx q[59],q[69];
-rz(2.598543468353628) q[69];
-cx q[59],q[69];
-rx(11.972056945480901) q[69];
-ry(pi/2) q[70];
-rx(pi) q[70];
-cx q[3],q[70];
-rz(2.598543468353628) q[70];
-cx q[3],q[70];
-cx q[15],q[70];
-rz(2.598543468353628) q[70];
-cx q[15],q[70];
-ry(pi/2) q[71];
-rx(pi) q[71];
-cx q[3],q[71];
-rz(2.598543468353628) q[71];
-cx q[3],q[71];
-cx q[53],q[71];
-rz(2.598543468353628) q[71];
-cx q[53],q[71];
-rx(11.972056945480901) q[71];
-ry(pi/2) q[72];
-rx(pi) q[72];
-cx q[27],q[72];
-rz(2.598543468353628) q[72];
-cx q[27],q[72];
-cx q[44],q[72];
-rz(2.598543468353628) q[72];
-cx q[44],q[72];
-rx(11.972056945480901) q[44];
-rx(11.972056945480901) q[72];
-ry(pi/2) q[73];
-rx(pi) q[73];
-cx q[16],q[73];
-rz(2.598543468353628) q[73];
-cx q[16],q[73];
-cx q[59],q[73];
-rz(2.598543468353628) q[73];
-cx q[59],q[73];
-ry(pi/2) q[74];
-rx(pi) q[74];
-cx q[56],q[74];
-rz(2.598543468353628) q[74];
-cx q[56],q[74];
-cx q[63],q[74];
-rz(2.598543468353628) q[74];
-cx q[63],q[74];
-rx(11.972056945480901) q[63];
-rx(11.972056945480901) q[74];
-ry(pi/2) q[75];
-rx(pi) q[75];
-cx q[0],q[75];
-rz(2.598543468353628) q[75];
-cx q[0],q[75];
-cx q[21],q[75];
-rz(2.598543468353628) q[75];
-cx q[21],q[75];
-rx(11.972056945480901) q[75];
-ry(pi/2) q[76];
-rx(pi) q[76];
-cx q[5],q[76];
-rz(2.598543468353628) q[76];
-cx q[5],q[76];
-cx q[6],q[76];
-rz(2.598543468353628) q[76];
-cx q[6],q[76];
-rx(11.972056945480901) q[76];
-ry(pi/2) q[77];
-rx(pi) q[77];
-cx q[3],q[77];
-rz(2.598543468353628) q[77];
-cx q[3],q[77];
-cx q[30],q[77];
-rz(2.598543468353628) q[77];
-cx q[30],q[77];
-rx(11.972056945480901) q[30];
-ry(pi/2) q[78];
-rx(pi) q[78];
-cx q[42],q[78];
-rz(2.598543468353628) q[78];
-cx q[42],q[78];
-rx(11.972056945480901) q[42];
-cx q[60],q[78];
-rz(2.598543468353628) q[78];
-cx q[60],q[78];
-rx(11.972056945480901) q[78];
-ry(pi/2) q[79];
-rx(pi) q[79];
-cx q[6],q[79];
-rz(2.598543468353628) q[79];
-cx q[6],q[79];
-cx q[50],q[79];
-rz(2.598543468353628) q[79];
-cx q[50],q[79];
-rx(11.972056945480901) q[79];
-ry(pi/2) q[80];
-rx(pi) q[80];
-cx q[9],q[80];
-rz(2.598543468353628) q[80];
-cx q[9],q[80];
-rx(11.972056945480901) q[9];
-cx q[15],q[80];
-rz(2.598543468353628) q[80];
-cx q[15],q[80];
-rx(11.972056945480901) q[80];
-ry(pi/2) q[81];
-rx(pi) q[81];
-cx q[21],q[81];
-rz(2.598543468353628) q[81];
-cx q[21],q[81];
-cx q[77],q[81];
-rz(2.598543468353628) q[81];
-cx q[77],q[81];
-rx(11.972056945480901) q[77];
-rx(11.972056945480901) q[81];
-ry(pi/2) q[82];
-rx(pi) q[82];
-cx q[0],q[82];
-rz(2.598543468353628) q[82];
-cx q[0],q[82];
-cx q[56],q[82];
-rz(2.598543468353628) q[82];
-cx q[56],q[82];
-rx(11.972056945480901) q[82];
-ry(pi/2) q[83];
-rx(pi) q[83];
-cx q[8],q[83];
-rz(2.598543468353628) q[83];
-cx q[8],q[83];
-rx(11.972056945480901) q[8];
-cx q[68],q[83];
-rz(2.598543468353628) q[83];
-cx q[68],q[83];
-rx(11.972056945480901) q[68];
-rx(11.972056945480901) q[83];
-ry(pi/2) q[84];
-rx(pi) q[84];
-cx q[70],q[84];
-rz(2.598543468353628) q[84];
-cx q[70],q[84];
-rx(11.972056945480901) q[70];
-cx q[73],q[84];
-rz(2.598543468353628) q[84];
-cx q[73],q[84];
-rx(11.972056945480901) q[73];
-rx(11.972056945480901) q[84];
-ry(pi/2) q[85];
-rx(pi) q[85];
-cx q[37],q[85];
-rz(2.598543468353628) q[85];
-cx q[37],q[85];
-rx(11.972056945480901) q[37];
-cx q[59],q[85];
-rz(2.598543468353628) q[85];
-cx q[59],q[85];
-rx(11.972056945480901) q[59];
-rx(11.972056945480901) q[85];
-ry(pi/2) q[86];
-rx(pi) q[86];
-cx q[24],q[86];
-rz(2.598543468353628) q[86];
-cx q[24],q[86];
-cx q[53],q[86];
-rz(2.598543468353628) q[86];
-cx q[53],q[86];
-rx(11.972056945480901) q[53];
-rx(11.972056945480901) q[86];
-ry(pi/2) q[87];
-rx(pi) q[87];
-cx q[28],q[87];
-rz(2.598543468353628) q[87];
-cx q[28],q[87];
-cx q[32],q[87];
-rz(2.598543468353628) q[87];
-cx q[32],q[87];
-rx(11.972056945480901) q[87];
-ry(pi/2) q[88];
-rx(pi) q[88];
-cx q[3],q[88];
-rz(2.598543468353628) q[88];
-cx q[3],q[88];
-cx q[60],q[88];
-rz(2.598543468353628) q[88];
-cx q[60],q[88];
-rx(11.972056945480901) q[60];
-rx(11.972056945480901) q[88];
-ry(pi/2) q[89];
-rx(pi) q[89];
-cx q[2],q[89];
-rz(2.598543468353628) q[89];
-cx q[2],q[89];
-rx(11.972056945480901) q[2];
-cx q[5],q[89];
-rz(2.598543468353628) q[89];
-cx q[5],q[89];
-ry(pi/2) q[90];
-rx(pi) q[90];
-cx q[15],q[90];
-rz(2.598543468353628) q[90];
-cx q[15],q[90];
-cx q[27],q[90];
-rz(2.598543468353628) q[90];
-cx q[27],q[90];
-rx(11.972056945480901) q[90];
-ry(pi/2) q[91];
-rx(pi) q[91];
-cx q[0],q[91];
-rz(2.598543468353628) q[91];
-cx q[0],q[91];
-cx q[6],q[91];
-rz(2.598543468353628) q[91];
-cx q[6],q[91];
-rx(11.972056945480901) q[6];
-rx(11.972056945480901) q[91];
-ry(pi/2) q[92];
-rx(pi) q[92];
-cx q[15],q[92];
-rz(2.598543468353628) q[92];
-cx q[15],q[92];
-cx q[89],q[92];
-rz(2.598543468353628) q[92];
-cx q[89],q[92];
-rx(11.972056945480901) q[89];
-ry(pi/2) q[93];
-rx(pi) q[93];
-cx q[0],q[93];
-rz(2.598543468353628) q[93];
-cx q[0],q[93];
-rx(11.972056945480901) q[0];
-cx q[32],q[93];
-rz(2.598543468353628) q[93];
-cx q[32],q[93];
-rx(11.972056945480901) q[32];
-rx(11.972056945480901) q[93];
-ry(pi/2) q[94];
-rx(pi) q[94];
-cx q[36],q[94];
-rz(2.598543468353628) q[94];
-cx q[36],q[94];
-cx q[55],q[94];
-rz(2.598543468353628) q[94];
-cx q[55],q[94];
-rx(11.972056945480901) q[55];
-rx(11.972056945480901) q[94];
-ry(pi/2) q[95];
-rx(pi) q[95];
-cx q[5],q[95];
-rz(2.598543468353628) q[95];
-cx q[5],q[95];
-cx q[27],q[95];
-rz(2.598543468353628) q[95];
-cx q[27],q[95];
-rx(11.972056945480901) q[27];
-rx(11.972056945480901) q[95];
-ry(pi/2) q[96];
-rx(pi) q[96];
-cx q[56],q[96];
-rz(2.598543468353628) q[96];
-cx q[56],q[96];
-rx(11.972056945480901) q[56];
-cx q[92],q[96];
-rz(2.598543468353628) q[96];
-cx q[92],q[96];
-rx(11.972056945480901) q[92];
-rx(11.972056945480901) q[96];
-ry(pi/2) q[97];
-rx(pi) q[97];
-cx q[1],q[97];
-rz(2.598543468353628) q[97];
-cx q[1],q[97];
-cx q[7],q[97];
-rz(2.598543468353628) q[97];
-cx q[7],q[97];
-rx(11.972056945480901) q[97];
-ry(pi/2) q[98];
-rx(pi) q[98];
-cx q[10],q[98];
-rz(2.598543468353628) q[98];
-cx q[10],q[98];
-rx(11.972056945480901) q[10];
-cx q[21],q[98];
-rz(2.598543468353628) q[98];
-cx q[21],q[98];
-rx(11.972056945480901) q[98];
-ry(pi/2) q[99];
-rx(pi) q[99];
-cx q[4],q[99];
-rz(2.598543468353628) q[99];
-cx q[4],q[99];
-cx q[41],q[99];
-rz(2.598543468353628) q[99];
-cx q[41],q[99];
-rx(11.972056945480901) q[41];
-rx(11.972056945480901) q[99];
-ry(pi/2) q[100];
-rx(pi) q[100];
-cx q[3],q[100];
-rz(2.598543468353628) q[100];
-cx q[3],q[100];
-cx q[25],q[100];
-rz(2.598543468353628) q[100];
-cx q[25],q[100];
-rx(11.972056945480901) q[25];
-rx(11.972056945480901) q[100];
-ry(pi/2) q[101];
-rx(pi) q[101];
-cx q[16],q[101];
-rz(2.598543468353628) q[101];
-cx q[16],q[101];
-cx q[50],q[101];
-rz(2.598543468353628) q[101];
-cx q[50],q[101];
-rx(11.972056945480901) q[50];
-rx(11.972056945480901) q[101];
-ry(pi/2) q[102];
-rx(pi) q[102];
-cx q[3],q[102];
-rz(2.598543468353628) q[102];
-cx q[3],q[102];
-cx q[4],q[102];
-rz(2.598543468353628) q[102];
-cx q[4],q[102];
-rx(11.972056945480901) q[4];
-rx(11.972056945480901) q[102];
-ry(pi/2) q[103];
-rx(pi) q[103];
-cx q[16],q[103];
-rz(2.598543468353628) q[103];
-cx q[16],q[103];
-rx(11.972056945480901) q[16];
-cx q[57],q[103];
-rz(2.598543468353628) q[103];
-cx q[57],q[103];
-rx(11.972056945480901) q[57];
-rx(11.972056945480901) q[103];
-ry(pi/2) q[104];
-rx(pi) q[104];
-cx q[7],q[104];
-rz(2.598543468353628) q[104];
-cx q[7],q[104];
-rx(11.972056945480901) q[7];
-cx q[13],q[104];
-rz(2.598543468353628) q[104];
-cx q[13],q[104];
-rx(11.972056945480901) q[13];
-rx(11.972056945480901) q[104];
-ry(pi/2) q[105];
-rx(pi) q[105];
-cx q[26],q[105];
-rz(2.598543468353628) q[105];
-cx q[26],q[105];
-rx(11.972056945480901) q[26];
-cx q[28],q[105];
-rz(2.598543468353628) q[105];
-cx q[28],q[105];
-rx(11.972056945480901) q[28];
-rx(11.972056945480901) q[105];
-ry(pi/2) q[106];
-rx(pi) q[106];
-cx q[5],q[106];
-rz(2.598543468353628) q[106];
-cx q[5],q[106];
-cx q[36],q[106];
-rz(2.598543468353628) q[106];
-cx q[36],q[106];
-rx(11.972056945480901) q[106];
-ry(pi/2) q[107];
-rx(pi) q[107];
-cx q[3],q[107];
-rz(2.598543468353628) q[107];
-cx q[3],q[107];
-cx q[31],q[107];
-rz(2.598543468353628) q[107];
-cx q[31],q[107];
-rx(11.972056945480901) q[107];
-ry(pi/2) q[108];
-rx(pi) q[108];
-cx q[15],q[108];
-rz(2.598543468353628) q[108];
-cx q[15],q[108];
-rx(11.972056945480901) q[15];
-cx q[31],q[108];
-rz(2.598543468353628) q[108];
-cx q[31],q[108];
-rx(11.972056945480901) q[31];
-rx(11.972056945480901) q[108];
-ry(pi/2) q[109];
-rx(pi) q[109];
-cx q[5],q[109];
-rz(2.598543468353628) q[109];
-cx q[5],q[109];
-rx(11.972056945480901) q[5];
-cx q[39],q[109];
-rz(2.598543468353628) q[109];
-cx q[39],q[109];
-rx(11.972056945480901) q[39];
-rx(11.972056945480901) q[109];
-ry(pi/2) q[110];
-rx(pi) q[110];
-cx q[3],q[110];
-rz(2.598543468353628) q[110];
-cx q[3],q[110];
-cx q[24],q[110];
-rz(2.598543468353628) q[110];
-cx q[24],q[110];
-rx(11.972056945480901) q[24];
-rx(11.972056945480901) q[110];
-ry(pi/2) q[111];
-rx(pi) q[111];
-cx q[3],q[111];
-rz(2.598543468353628) q[111];
-cx q[3],q[111];
-cx q[21],q[111];
-rz(2.598543468353628) q[111];
-cx q[21],q[111];
-rx(11.972056945480901) q[111];
-ry(pi/2) q[112];
-rx(pi) q[112];
-cx q[21],q[112];
-rz(2.598543468353628) q[112];
-cx q[21],q[112];
-rx(11.972056945480901) q[21];
-cx q[36],q[112];
-rz(2.598543468353628) q[112];
-cx q[36],q[112];
-rx(11.972056945480901) q[36];
-rx(11.972056945480901) q[112];
-ry(pi/2) q[113];
-rx(pi) q[113];
-cx q[1],q[113];
-rz(2.598543468353628) q[113];
-cx q[1],q[113];
-rx(11.972056945480901) q[1];
-cx q[0],q[1];
-rz(1.8766812918030171) q[1];
-cx q[0],q[1];
-cx q[0],q[2];
-rz(1.8766812918030171) q[2];
-cx q[0],q[2];
-cx q[2],q[89];
-cx q[3],q[113];
-rz(1.8766812918030171) q[89];
-cx q[2],q[89];
-rx(0.8224462625715805) q[2];
-rz(2.598543468353628) q[113];
-cx q[3],q[113];
-rx(11.972056945480901) q[3];
-cx q[0],q[3];
-rz(1.8766812918030171) q[3];
-cx q[0],q[3];
-cx q[0],q[15];
-cx q[1],q[3];
-rz(1.8766812918030171) q[3];
-cx q[1],q[3];
-cx q[1],q[4];
-rz(1.8766812918030171) q[4];
-cx q[1],q[4];
-cx q[1],q[5];
-cx q[3],q[4];
-rz(1.8766812918030171) q[4];
-cx q[3],q[4];
-cx q[4],q[6];
-rz(1.8766812918030171) q[5];
-cx q[1],q[5];
-cx q[1],q[9];
-cx q[3],q[5];
-rz(1.8766812918030171) q[5];
-cx q[3],q[5];
-cx q[3],q[7];
-rz(1.8766812918030171) q[6];
-cx q[4],q[6];
-cx q[5],q[6];
-rz(1.8766812918030171) q[6];
-cx q[5],q[6];
-rz(1.8766812918030171) q[7];
-cx q[3],q[7];
-cx q[3],q[8];
-cx q[4],q[7];
-rz(1.8766812918030171) q[7];
-cx q[4],q[7];
-cx q[4],q[10];
-rz(1.8766812918030171) q[8];
-cx q[3],q[8];
-cx q[5],q[8];
-rz(1.8766812918030171) q[8];
-cx q[5],q[8];
-cx q[5],q[11];
-cx q[8],q[83];
-rz(1.8766812918030171) q[9];
-cx q[1],q[9];
-cx q[1],q[17];
-cx q[3],q[9];
-rz(1.8766812918030171) q[9];
-cx q[3],q[9];
-cx q[3],q[12];
-rz(1.8766812918030171) q[10];
-cx q[4],q[10];
-cx q[4],q[13];
-cx q[6],q[10];
-rz(1.8766812918030171) q[10];
-cx q[6],q[10];
-cx q[10],q[37];
-rz(1.8766812918030171) q[11];
-cx q[5],q[11];
-cx q[6],q[11];
-rz(1.8766812918030171) q[11];
-cx q[6],q[11];
-rx(0.8224462625715805) q[11];
-rz(1.8766812918030171) q[12];
-cx q[3],q[12];
-cx q[3],q[14];
-cx q[5],q[12];
-rz(1.8766812918030171) q[12];
-cx q[5],q[12];
-rz(1.8766812918030171) q[13];
-cx q[4],q[13];
-cx q[5],q[13];
-rz(1.8766812918030171) q[13];
-cx q[5],q[13];
-rz(1.8766812918030171) q[14];
-cx q[3],q[14];
-cx q[4],q[14];
-rz(1.8766812918030171) q[14];
-cx q[4],q[14];
-rx(0.8224462625715805) q[14];
-rz(1.8766812918030171) q[15];
-cx q[0],q[15];
-cx q[0],q[16];
-cx q[3],q[15];
-rz(1.8766812918030171) q[15];
-cx q[3],q[15];
-rz(1.8766812918030171) q[16];
-cx q[0],q[16];
-cx q[0],q[20];
-cx q[3],q[16];
-rz(1.8766812918030171) q[16];
-cx q[3],q[16];
-rz(1.8766812918030171) q[17];
-cx q[1],q[17];
-cx q[1],q[28];
-cx q[3],q[17];
-rz(1.8766812918030171) q[17];
-cx q[3],q[17];
-cx q[3],q[18];
-rz(1.8766812918030171) q[18];
-cx q[3],q[18];
-cx q[3],q[19];
-cx q[4],q[18];
-rz(1.8766812918030171) q[18];
-cx q[4],q[18];
-cx q[4],q[21];
-rz(1.8766812918030171) q[19];
-cx q[3],q[19];
-cx q[3],q[22];
-cx q[7],q[19];
-rz(1.8766812918030171) q[19];
-cx q[7],q[19];
-cx q[19],q[38];
-rz(1.8766812918030171) q[20];
-cx q[0],q[20];
-cx q[0],q[32];
-cx q[15],q[20];
-rz(1.8766812918030171) q[20];
-cx q[15],q[20];
-rz(1.8766812918030171) q[21];
-cx q[4],q[21];
-cx q[4],q[27];
-cx q[15],q[21];
-rz(1.8766812918030171) q[21];
-cx q[15],q[21];
-cx q[15],q[36];
-rz(1.8766812918030171) q[22];
-cx q[3],q[22];
-cx q[3],q[23];
-cx q[9],q[22];
-rz(1.8766812918030171) q[22];
-cx q[9],q[22];
-cx q[9],q[55];
-rx(0.8224462625715805) q[22];
-rz(1.8766812918030171) q[23];
-cx q[3],q[23];
-cx q[3],q[24];
-cx q[17],q[23];
-rz(1.8766812918030171) q[23];
-cx q[17],q[23];
-rz(1.8766812918030171) q[24];
-cx q[3],q[24];
-cx q[3],q[25];
-cx q[5],q[24];
-rz(1.8766812918030171) q[24];
-cx q[5],q[24];
-cx q[5],q[33];
-cx q[24],q[54];
-rz(1.8766812918030171) q[25];
-cx q[3],q[25];
-cx q[3],q[26];
-cx q[12],q[25];
-rz(1.8766812918030171) q[25];
-cx q[12],q[25];
-cx q[12],q[31];
-rz(1.8766812918030171) q[26];
-cx q[3],q[26];
-cx q[21],q[26];
-rz(1.8766812918030171) q[26];
-cx q[21],q[26];
-rz(1.8766812918030171) q[27];
-cx q[4],q[27];
-cx q[4],q[47];
-cx q[6],q[27];
-rz(1.8766812918030171) q[27];
-cx q[6],q[27];
-cx q[6],q[69];
-rz(1.8766812918030171) q[28];
-cx q[1],q[28];
-cx q[1],q[29];
-cx q[3],q[28];
-rz(1.8766812918030171) q[28];
-cx q[3],q[28];
-rz(1.8766812918030171) q[29];
-cx q[1],q[29];
-cx q[1],q[45];
-cx q[3],q[29];
-rz(1.8766812918030171) q[29];
-cx q[3],q[29];
-cx q[3],q[30];
-rx(0.8224462625715805) q[29];
-rz(1.8766812918030171) q[30];
-cx q[3],q[30];
-cx q[3],q[34];
-cx q[18],q[30];
-rz(1.8766812918030171) q[30];
-cx q[18],q[30];
-rx(0.8224462625715805) q[18];
-rz(1.8766812918030171) q[31];
-cx q[12],q[31];
-cx q[26],q[31];
-rz(1.8766812918030171) q[31];
-cx q[26],q[31];
-cx q[26],q[105];
-rz(1.8766812918030171) q[32];
-cx q[0],q[32];
-cx q[0],q[42];
-cx q[21],q[32];
-rz(1.8766812918030171) q[32];
-cx q[21],q[32];
-rz(1.8766812918030171) q[33];
-cx q[5],q[33];
-cx q[5],q[46];
-cx q[30],q[33];
-rz(1.8766812918030171) q[33];
-cx q[30],q[33];
-rx(0.8224462625715805) q[33];
-rz(1.8766812918030171) q[34];
-cx q[3],q[34];
-cx q[3],q[35];
-cx q[12],q[34];
-rz(1.8766812918030171) q[34];
-cx q[12],q[34];
-rz(1.8766812918030171) q[35];
-cx q[3],q[35];
-cx q[3],q[39];
-cx q[32],q[35];
-rz(1.8766812918030171) q[35];
-cx q[32],q[35];
-rx(0.8224462625715805) q[35];
-rz(1.8766812918030171) q[36];
-cx q[15],q[36];
-cx q[20],q[36];
-rz(1.8766812918030171) q[36];
-cx q[20],q[36];
-cx q[36],q[94];
-rz(1.8766812918030171) q[37];
-cx q[10],q[37];
-cx q[10],q[41];
-cx q[34],q[37];
-rz(1.8766812918030171) q[37];
-cx q[34],q[37];
-rx(0.8224462625715805) q[34];
-cx q[37],q[85];
-rz(1.8766812918030171) q[38];
-cx q[19],q[38];
-rx(0.8224462625715805) q[19];
-cx q[21],q[38];
-rz(1.8766812918030171) q[38];
-cx q[21],q[38];
-rz(1.8766812918030171) q[39];
-cx q[3],q[39];
-cx q[3],q[40];
-cx q[13],q[39];
-rz(1.8766812918030171) q[39];
-cx q[13],q[39];
-cx q[13],q[56];
-rz(1.8766812918030171) q[40];
-cx q[3],q[40];
-cx q[23],q[40];
-rz(1.8766812918030171) q[40];
-cx q[23],q[40];
-rx(0.8224462625715805) q[40];
-rz(1.8766812918030171) q[41];
-cx q[10],q[41];
-cx q[27],q[41];
-rz(1.8766812918030171) q[41];
-cx q[27],q[41];
-cx q[27],q[72];
-cx q[41],q[67];
-rz(1.8766812918030171) q[42];
-cx q[0],q[42];
-cx q[0],q[48];
-cx q[3],q[42];
-rz(1.8766812918030171) q[42];
-cx q[3],q[42];
-cx q[3],q[43];
-cx q[42],q[78];
-rz(1.8766812918030171) q[43];
-cx q[3],q[43];
-cx q[3],q[44];
-cx q[20],q[43];
-rz(1.8766812918030171) q[43];
-cx q[20],q[43];
-rx(0.8224462625715805) q[20];
-rx(0.8224462625715805) q[43];
-rz(1.8766812918030171) q[44];
-cx q[3],q[44];
-cx q[3],q[49];
-cx q[12],q[44];
-rz(1.8766812918030171) q[44];
-cx q[12],q[44];
-rz(1.8766812918030171) q[45];
-cx q[1],q[45];
-cx q[1],q[57];
-cx q[16],q[45];
-rz(1.8766812918030171) q[45];
-cx q[16],q[45];
-cx q[16],q[59];
-rz(1.8766812918030171) q[46];
-cx q[5],q[46];
-cx q[5],q[65];
-cx q[38],q[46];
-rz(1.8766812918030171) q[46];
-cx q[38],q[46];
-rx(0.8224462625715805) q[38];
-rx(0.8224462625715805) q[46];
-rz(1.8766812918030171) q[47];
-cx q[4],q[47];
-cx q[17],q[47];
-rz(1.8766812918030171) q[47];
-cx q[17],q[47];
-cx q[17],q[53];
-rz(1.8766812918030171) q[48];
-cx q[0],q[48];
-cx q[0],q[51];
-cx q[30],q[48];
-rz(1.8766812918030171) q[48];
-cx q[30],q[48];
-rx(0.8224462625715805) q[48];
-rz(1.8766812918030171) q[49];
-cx q[3],q[49];
-cx q[3],q[50];
-cx q[4],q[49];
-rz(1.8766812918030171) q[49];
-cx q[4],q[49];
-cx q[4],q[61];
-rx(0.8224462625715805) q[49];
-rz(1.8766812918030171) q[50];
-cx q[3],q[50];
-cx q[3],q[52];
-cx q[12],q[50];
-rz(1.8766812918030171) q[50];
-cx q[12],q[50];
-cx q[12],q[63];
-rz(1.8766812918030171) q[51];
-cx q[0],q[51];
-cx q[0],q[62];
-cx q[28],q[51];
-rz(1.8766812918030171) q[51];
-cx q[28],q[51];
-rx(0.8224462625715805) q[51];
-rz(1.8766812918030171) q[52];
-cx q[3],q[52];
-cx q[10],q[52];
-rz(1.8766812918030171) q[52];
-cx q[10],q[52];
-rx(0.8224462625715805) q[52];
-rz(1.8766812918030171) q[53];
-cx q[17],q[53];
-cx q[21],q[53];
-rz(1.8766812918030171) q[53];
-cx q[21],q[53];
-rz(1.8766812918030171) q[54];
-cx q[24],q[54];
-cx q[24],q[58];
-cx q[28],q[54];
-rz(1.8766812918030171) q[54];
-cx q[28],q[54];
-rx(0.8224462625715805) q[54];
-rz(1.8766812918030171) q[55];
-cx q[9],q[55];
-cx q[9],q[80];
-cx q[15],q[55];
-rz(1.8766812918030171) q[55];
-cx q[15],q[55];
-rz(1.8766812918030171) q[56];
-cx q[13],q[56];
-cx q[13],q[68];
-cx q[45],q[56];
-rz(1.8766812918030171) q[56];
-cx q[45],q[56];
-rx(0.8224462625715805) q[45];
-rz(1.8766812918030171) q[57];
-cx q[1],q[57];
-cx q[1],q[60];
-cx q[3],q[57];
-rz(1.8766812918030171) q[57];
-cx q[3],q[57];
-cx q[3],q[70];
-rz(1.8766812918030171) q[58];
-cx q[24],q[58];
-cx q[24],q[86];
-cx q[28],q[58];
-rz(1.8766812918030171) q[58];
-cx q[28],q[58];
-cx q[28],q[87];
-rx(0.8224462625715805) q[58];
-rz(1.8766812918030171) q[59];
-cx q[16],q[59];
-cx q[16],q[73];
-cx q[32],q[59];
-rz(1.8766812918030171) q[59];
-cx q[32],q[59];
-rz(1.8766812918030171) q[60];
-cx q[1],q[60];
-cx q[1],q[97];
-cx q[7],q[60];
-rz(1.8766812918030171) q[60];
-cx q[7],q[60];
-rz(1.8766812918030171) q[61];
-cx q[4],q[61];
-cx q[4],q[99];
-cx q[7],q[61];
-rz(1.8766812918030171) q[61];
-cx q[7],q[61];
-rx(0.8224462625715805) q[61];
-rz(1.8766812918030171) q[62];
-cx q[0],q[62];
-cx q[0],q[64];
-cx q[17],q[62];
-rz(1.8766812918030171) q[62];
-cx q[17],q[62];
-rx(0.8224462625715805) q[62];
-rz(1.8766812918030171) q[63];
-cx q[12],q[63];
-rx(0.8224462625715805) q[12];
-cx q[17],q[63];
-rz(1.8766812918030171) q[63];
-cx q[17],q[63];
-cx q[17],q[66];
-rz(1.8766812918030171) q[64];
-cx q[0],q[64];
-cx q[0],q[75];
-cx q[10],q[64];
-rz(1.8766812918030171) q[64];
-cx q[10],q[64];
-cx q[10],q[98];
-rx(0.8224462625715805) q[64];
-rz(1.8766812918030171) q[65];
-cx q[5],q[65];
-cx q[5],q[76];
-cx q[23],q[65];
-rz(1.8766812918030171) q[65];
-cx q[23],q[65];
-rx(0.8224462625715805) q[23];
-rx(0.8224462625715805) q[65];
-rz(1.8766812918030171) q[66];
-cx q[17],q[66];
-rx(0.8224462625715805) q[17];
-cx q[47],q[66];
-rz(1.8766812918030171) q[66];
-cx q[47],q[66];
-rx(0.8224462625715805) q[47];
-rx(0.8224462625715805) q[66];
-rz(1.8766812918030171) q[67];
-cx q[41],q[67];
-cx q[56],q[67];
-rz(1.8766812918030171) q[67];
-cx q[56],q[67];
-cx q[56],q[74];
-rx(0.8224462625715805) q[67];
-rz(1.8766812918030171) q[68];
-cx q[13],q[68];
-cx q[32],q[68];
-rz(1.8766812918030171) q[68];
-cx q[32],q[68];
-rz(1.8766812918030171) q[69];
-cx q[6],q[69];
-cx q[59],q[69];
-rz(1.8766812918030171) q[69];
-cx q[59],q[69];
-rx(0.8224462625715805) q[69];
-rz(1.8766812918030171) q[70];
-cx q[3],q[70];
-cx q[3],q[71];
-cx q[15],q[70];
-rz(1.8766812918030171) q[70];
-cx q[15],q[70];
-cx q[70],q[84];
-rz(1.8766812918030171) q[71];
-cx q[3],q[71];
-cx q[3],q[77];
-cx q[53],q[71];
-rz(1.8766812918030171) q[71];
-cx q[53],q[71];
-rx(0.8224462625715805) q[71];
-rz(1.8766812918030171) q[72];
-cx q[27],q[72];
-cx q[44],q[72];
-rz(1.8766812918030171) q[72];
-cx q[44],q[72];
-rx(0.8224462625715805) q[44];
-rx(0.8224462625715805) q[72];
-rz(1.8766812918030171) q[73];
-cx q[16],q[73];
-cx q[16],q[101];
-cx q[59],q[73];
-rz(1.8766812918030171) q[73];
-cx q[59],q[73];
-rz(1.8766812918030171) q[74];
-cx q[56],q[74];
-cx q[63],q[74];
-rz(1.8766812918030171) q[74];
-cx q[63],q[74];
-rx(0.8224462625715805) q[63];
-rx(0.8224462625715805) q[74];
-rz(1.8766812918030171) q[75];
-cx q[0],q[75];
-cx q[0],q[82];
-cx q[21],q[75];
-rz(1.8766812918030171) q[75];
-cx q[21],q[75];
-cx q[21],q[81];
-rx(0.8224462625715805) q[75];
-rz(1.8766812918030171) q[76];
-cx q[5],q[76];
-cx q[5],q[89];
-cx q[6],q[76];
-rz(1.8766812918030171) q[76];
-cx q[6],q[76];
-cx q[6],q[79];
-rx(0.8224462625715805) q[76];
-rz(1.8766812918030171) q[77];
-cx q[3],q[77];
-cx q[3],q[88];
-cx q[30],q[77];
-rz(1.8766812918030171) q[77];
-cx q[30],q[77];
-rx(0.8224462625715805) q[30];
-rz(1.8766812918030171) q[78];
-cx q[42],q[78];
-rx(0.8224462625715805) q[42];
-cx q[60],q[78];
-rz(1.8766812918030171) q[78];
-cx q[60],q[78];
-rx(0.8224462625715805) q[78];
-rz(1.8766812918030171) q[79];
-cx q[6],q[79];
-cx q[50],q[79];
-rz(1.8766812918030171) q[79];
-cx q[50],q[79];
-rx(0.8224462625715805) q[79];
-rz(1.8766812918030171) q[80];
-cx q[9],q[80];
-rx(0.8224462625715805) q[9];
-cx q[15],q[80];
-rz(1.8766812918030171) q[80];
-cx q[15],q[80];
-cx q[15],q[90];
-rx(0.8224462625715805) q[80];
-rz(1.8766812918030171) q[81];
-cx q[21],q[81];
-cx q[77],q[81];
-rz(1.8766812918030171) q[81];
-cx q[77],q[81];
-rx(0.8224462625715805) q[77];
-rx(0.8224462625715805) q[81];
-rz(1.8766812918030171) q[82];
-cx q[0],q[82];
-cx q[0],q[91];
-cx q[56],q[82];
-rz(1.8766812918030171) q[82];
-cx q[56],q[82];
-cx q[56],q[96];
-rx(0.8224462625715805) q[82];
-rz(1.8766812918030171) q[83];
-cx q[8],q[83];
-rx(0.8224462625715805) q[8];
-cx q[68],q[83];
-rz(1.8766812918030171) q[83];
-cx q[68],q[83];
-rx(0.8224462625715805) q[68];
-rx(0.8224462625715805) q[83];
-rz(1.8766812918030171) q[84];
-cx q[70],q[84];
-rx(0.8224462625715805) q[70];
-cx q[73],q[84];
-rz(1.8766812918030171) q[84];
-cx q[73],q[84];
-rx(0.8224462625715805) q[73];
-rx(0.8224462625715805) q[84];
-rz(1.8766812918030171) q[85];
-cx q[37],q[85];
-rx(0.8224462625715805) q[37];
-cx q[59],q[85];
-rz(1.8766812918030171) q[85];
-cx q[59],q[85];
-rx(0.8224462625715805) q[59];
-rx(0.8224462625715805) q[85];
-rz(1.8766812918030171) q[86];
-cx q[24],q[86];
-cx q[53],q[86];
-rz(1.8766812918030171) q[86];
-cx q[53],q[86];
-rx(0.8224462625715805) q[53];
-rx(0.8224462625715805) q[86];
-rz(1.8766812918030171) q[87];
-cx q[28],q[87];
-cx q[32],q[87];
-rz(1.8766812918030171) q[87];
-cx q[32],q[87];
-rx(0.8224462625715805) q[87];
-rz(1.8766812918030171) q[88];
-cx q[3],q[88];
-cx q[3],q[100];
-cx q[60],q[88];
-rz(1.8766812918030171) q[88];
-cx q[60],q[88];
-rx(0.8224462625715805) q[60];
-rx(0.8224462625715805) q[88];
-rz(1.8766812918030171) q[89];
-cx q[5],q[89];
-cx q[5],q[95];
-rz(1.8766812918030171) q[90];
-cx q[15],q[90];
-cx q[15],q[92];
-cx q[27],q[90];
-rz(1.8766812918030171) q[90];
-cx q[27],q[90];
-rx(0.8224462625715805) q[90];
-rz(1.8766812918030171) q[91];
-cx q[0],q[91];
-cx q[0],q[93];
-cx q[6],q[91];
-rz(1.8766812918030171) q[91];
-cx q[6],q[91];
-rx(0.8224462625715805) q[6];
-rx(0.8224462625715805) q[91];
-rz(1.8766812918030171) q[92];
-cx q[15],q[92];
-cx q[15],q[108];
-cx q[89],q[92];
-rz(1.8766812918030171) q[92];
-cx q[89],q[92];
-rx(0.8224462625715805) q[89];
-rz(1.8766812918030171) q[93];
-cx q[0],q[93];
-rx(0.8224462625715805) q[0];
-cx q[32],q[93];
-rz(1.8766812918030171) q[93];
-cx q[32],q[93];
-rx(0.8224462625715805) q[32];
-rx(0.8224462625715805) q[93];
-rz(1.8766812918030171) q[94];
-cx q[36],q[94];
-cx q[55],q[94];
-rz(1.8766812918030171) q[94];
-cx q[55],q[94];
-rx(0.8224462625715805) q[55];
-rx(0.8224462625715805) q[94];
-rz(1.8766812918030171) q[95];
-cx q[5],q[95];
-cx q[5],q[106];
-cx q[27],q[95];
-rz(1.8766812918030171) q[95];
-cx q[27],q[95];
-rx(0.8224462625715805) q[27];
-rx(0.8224462625715805) q[95];
-rz(1.8766812918030171) q[96];
-cx q[56],q[96];
-rx(0.8224462625715805) q[56];
-cx q[92],q[96];
-rz(1.8766812918030171) q[96];
-cx q[92],q[96];
-rx(0.8224462625715805) q[92];
-rx(0.8224462625715805) q[96];
-rz(1.8766812918030171) q[97];
-cx q[1],q[97];
-cx q[7],q[97];
-rz(1.8766812918030171) q[97];
-cx q[7],q[97];
-cx q[7],q[104];
-rx(0.8224462625715805) q[97];
-rz(1.8766812918030171) q[98];
-cx q[10],q[98];
-rx(0.8224462625715805) q[10];
-cx q[21],q[98];
-rz(1.8766812918030171) q[98];
-cx q[21],q[98];
-rx(0.8224462625715805) q[98];
-rz(1.8766812918030171) q[99];
-cx q[4],q[99];
-cx q[41],q[99];
-rz(1.8766812918030171) q[99];
-cx q[41],q[99];
-rx(0.8224462625715805) q[41];
-rx(0.8224462625715805) q[99];
-rz(1.8766812918030171) q[100];
-cx q[3],q[100];
-cx q[3],q[102];
-cx q[25],q[100];
-rz(1.8766812918030171) q[100];
-cx q[25],q[100];
-rx(0.8224462625715805) q[25];
-rx(0.8224462625715805) q[100];
-rz(1.8766812918030171) q[101];
-cx q[16],q[101];
-cx q[16],q[103];
-cx q[50],q[101];
-rz(1.8766812918030171) q[101];
-cx q[50],q[101];
-rx(0.8224462625715805) q[50];
-rx(0.8224462625715805) q[101];
-rz(1.8766812918030171) q[102];
-cx q[3],q[102];
-cx q[3],q[107];
-cx q[4],q[102];
-rz(1.8766812918030171) q[102];
-cx q[4],q[102];
-rx(0.8224462625715805) q[4];
-rx(0.8224462625715805) q[102];
-rz(1.8766812918030171) q[103];
-cx q[16],q[103];
-rx(0.8224462625715805) q[16];
-cx q[57],q[103];
-rz(1.8766812918030171) q[103];
-cx q[57],q[103];
-rx(0.8224462625715805) q[57];
-rx(0.8224462625715805) q[103];
-rz(1.8766812918030171) q[104];
-cx q[7],q[104];
-rx(0.8224462625715805) q[7];
-cx q[13],q[104];
-rz(1.8766812918030171) q[104];
-cx q[13],q[104];
-rx(0.8224462625715805) q[13];
-rx(0.8224462625715805) q[104];
-rz(1.8766812918030171) q[105];
-cx q[26],q[105];
-rx(0.8224462625715805) q[26];
-cx q[28],q[105];
-rz(1.8766812918030171) q[105];
-cx q[28],q[105];
-rx(0.8224462625715805) q[28];
-rx(0.8224462625715805) q[105];
-rz(1.8766812918030171) q[106];
-cx q[5],q[106];
-cx q[5],q[109];
-cx q[36],q[106];
-rz(1.8766812918030171) q[106];
-cx q[36],q[106];
-rx(0.8224462625715805) q[106];
-rz(1.8766812918030171) q[107];
-cx q[3],q[107];
-cx q[3],q[110];
-cx q[31],q[107];
-rz(1.8766812918030171) q[107];
-cx q[31],q[107];
-rx(0.8224462625715805) q[107];
-rz(1.8766812918030171) q[108];
-cx q[15],q[108];
-rx(0.8224462625715805) q[15];
-cx q[31],q[108];
-rz(1.8766812918030171) q[108];
-cx q[31],q[108];
-rx(0.8224462625715805) q[31];
-rx(0.8224462625715805) q[108];
-rz(1.8766812918030171) q[109];
-cx q[5],q[109];
-rx(0.8224462625715805) q[5];
-cx q[39],q[109];
-rz(1.8766812918030171) q[109];
-cx q[39],q[109];
-rx(0.8224462625715805) q[39];
-rx(0.8224462625715805) q[109];
-rz(1.8766812918030171) q[110];
-cx q[3],q[110];
-cx q[3],q[111];
-cx q[24],q[110];
-rz(1.8766812918030171) q[110];
-cx q[24],q[110];
-rx(0.8224462625715805) q[24];
-rx(0.8224462625715805) q[110];
-rz(1.8766812918030171) q[111];
-cx q[3],q[111];
-cx q[21],q[111];
-rz(1.8766812918030171) q[111];
-cx q[21],q[111];
-cx q[21],q[112];
-rx(0.8224462625715805) q[111];
-rz(1.8766812918030171) q[112];
-cx q[21],q[112];
-rx(0.8224462625715805) q[21];
-cx q[36],q[112];
-rz(1.8766812918030171) q[112];
-cx q[36],q[112];
-rx(0.8224462625715805) q[36];
-rx(0.8224462625715805) q[112];
-rx(11.972056945480901) q[113];
-cx q[1],q[113];
-rz(1.8766812918030171) q[113];
-cx q[1],q[113];
-rx(0.8224462625715805) q[1];
-cx q[0],q[1];
-rz(0.07401882290454395) q[1];
-cx q[0],q[1];
-cx q[0],q[2];
-rz(0.07401882290454395) q[2];
-cx q[0],q[2];
-cx q[2],q[89];
-cx q[3],q[113];
-rz(0.07401882290454395) q[89];
-cx q[2],q[89];
-rx(7.766369375783992) q[2];
-rz(1.8766812918030171) q[113];
-cx q[3],q[113];
-rx(0.8224462625715805) q[3];
-cx q[0],q[3];
-rz(0.07401882290454395) q[3];
-cx q[0],q[3];
-cx q[0],q[15];
-cx q[1],q[3];
-rz(0.07401882290454395) q[3];
-cx q[1],q[3];
-cx q[1],q[4];
-rz(0.07401882290454395) q[4];
-cx q[1],q[4];
-cx q[1],q[5];
-cx q[3],q[4];
-rz(0.07401882290454395) q[4];
-cx q[3],q[4];
-cx q[4],q[6];
-rz(0.07401882290454395) q[5];
-cx q[1],q[5];
-cx q[1],q[9];
-cx q[3],q[5];
-rz(0.07401882290454395) q[5];
-cx q[3],q[5];
-cx q[3],q[7];
-rz(0.07401882290454395) q[6];
-cx q[4],q[6];
-cx q[5],q[6];
-rz(0.07401882290454395) q[6];
-cx q[5],q[6];
-rz(0.07401882290454395) q[7];
-cx q[3],q[7];
-cx q[3],q[8];
-cx q[4],q[7];
-rz(0.07401882290454395) q[7];
-cx q[4],q[7];
-cx q[4],q[10];
-rz(0.07401882290454395) q[8];
-cx q[3],q[8];
-cx q[5],q[8];
-rz(0.07401882290454395) q[8];
-cx q[5],q[8];
-cx q[5],q[11];
-cx q[8],q[83];
-rz(0.07401882290454395) q[9];
-cx q[1],q[9];
-cx q[1],q[17];
-cx q[3],q[9];
-rz(0.07401882290454395) q[9];
-cx q[3],q[9];
-cx q[3],q[12];
-rz(0.07401882290454395) q[10];
-cx q[4],q[10];
-cx q[4],q[13];
-cx q[6],q[10];
-rz(0.07401882290454395) q[10];
-cx q[6],q[10];
-cx q[10],q[37];
-rz(0.07401882290454395) q[11];
-cx q[5],q[11];
-cx q[6],q[11];
-rz(0.07401882290454395) q[11];
-cx q[6],q[11];
-rx(7.766369375783992) q[11];
-rz(0.07401882290454395) q[12];
-cx q[3],q[12];
-cx q[3],q[14];
-cx q[5],q[12];
-rz(0.07401882290454395) q[12];
-cx q[5],q[12];
-rz(0.07401882290454395) q[13];
-cx q[4],q[13];
-cx q[5],q[13];
-rz(0.07401882290454395) q[13];
-cx q[5],q[13];
-rz(0.07401882290454395) q[14];
-cx q[3],q[14];
-cx q[4],q[14];
-rz(0.07401882290454395) q[14];
-cx q[4],q[14];
-rx(7.766369375783992) q[14];
-rz(0.07401882290454395) q[15];
-cx q[0],q[15];
-cx q[0],q[16];
-cx q[3],q[15];
-rz(0.07401882290454395) q[15];
-cx q[3],q[15];
-rz(0.07401882290454395) q[16];
-cx q[0],q[16];
-cx q[0],q[20];
-cx q[3],q[16];
-rz(0.07401882290454395) q[16];
-cx q[3],q[16];
-rz(0.07401882290454395) q[17];
-cx q[1],q[17];
-cx q[1],q[28];
-cx q[3],q[17];
-rz(0.07401882290454395) q[17];
-cx q[3],q[17];
-cx q[3],q[18];
-rz(0.07401882290454395) q[18];
-cx q[3],q[18];
-cx q[3],q[19];
-cx q[4],q[18];
-rz(0.07401882290454395) q[18];
-cx q[4],q[18];
-cx q[4],q[21];
-rz(0.07401882290454395) q[19];
-cx q[3],q[19];
-cx q[3],q[22];
-cx q[7],q[19];
-rz(0.07401882290454395) q[19];
-cx q[7],q[19];
-cx q[19],q[38];
-rz(0.07401882290454395) q[20];
-cx q[0],q[20];
-cx q[0],q[32];
-cx q[15],q[20];
-rz(0.07401882290454395) q[20];
-cx q[15],q[20];
-rz(0.07401882290454395) q[21];
-cx q[4],q[21];
-cx q[4],q[27];
-cx q[15],q[21];
-rz(0.07401882290454395) q[21];
-cx q[15],q[21];
-cx q[15],q[36];
-rz(0.07401882290454395) q[22];
-cx q[3],q[22];
-cx q[3],q[23];
-cx q[9],q[22];
-rz(0.07401882290454395) q[22];
-cx q[9],q[22];
-cx q[9],q[55];
-rx(7.766369375783992) q[22];
-rz(0.07401882290454395) q[23];
-cx q[3],q[23];
-cx q[3],q[24];
-cx q[17],q[23];
-rz(0.07401882290454395) q[23];
-cx q[17],q[23];
-rz(0.07401882290454395) q[24];
-cx q[3],q[24];
-cx q[3],q[25];
-cx q[5],q[24];
-rz(0.07401882290454395) q[24];
-cx q[5],q[24];
-cx q[5],q[33];
-cx q[24],q[54];
-rz(0.07401882290454395) q[25];
-cx q[3],q[25];
-cx q[3],q[26];
-cx q[12],q[25];
-rz(0.07401882290454395) q[25];
-cx q[12],q[25];
-cx q[12],q[31];
-rz(0.07401882290454395) q[26];
-cx q[3],q[26];
-cx q[21],q[26];
-rz(0.07401882290454395) q[26];
-cx q[21],q[26];
-rz(0.07401882290454395) q[27];
-cx q[4],q[27];
-cx q[4],q[47];
-cx q[6],q[27];
-rz(0.07401882290454395) q[27];
-cx q[6],q[27];
-cx q[6],q[69];
-rz(0.07401882290454395) q[28];
-cx q[1],q[28];
-cx q[1],q[29];
-cx q[3],q[28];
-rz(0.07401882290454395) q[28];
-cx q[3],q[28];
-rz(0.07401882290454395) q[29];
-cx q[1],q[29];
-cx q[1],q[45];
-cx q[3],q[29];
-rz(0.07401882290454395) q[29];
-cx q[3],q[29];
-cx q[3],q[30];
-rx(7.766369375783992) q[29];
-rz(0.07401882290454395) q[30];
-cx q[3],q[30];
-cx q[3],q[34];
-cx q[18],q[30];
-rz(0.07401882290454395) q[30];
-cx q[18],q[30];
-rx(7.766369375783992) q[18];
-rz(0.07401882290454395) q[31];
-cx q[12],q[31];
-cx q[26],q[31];
-rz(0.07401882290454395) q[31];
-cx q[26],q[31];
-cx q[26],q[105];
-rz(0.07401882290454395) q[32];
-cx q[0],q[32];
-cx q[0],q[42];
-cx q[21],q[32];
-rz(0.07401882290454395) q[32];
-cx q[21],q[32];
-rz(0.07401882290454395) q[33];
-cx q[5],q[33];
-cx q[5],q[46];
-cx q[30],q[33];
-rz(0.07401882290454395) q[33];
-cx q[30],q[33];
-rx(7.766369375783992) q[33];
-rz(0.07401882290454395) q[34];
-cx q[3],q[34];
-cx q[3],q[35];
-cx q[12],q[34];
-rz(0.07401882290454395) q[34];
-cx q[12],q[34];
-rz(0.07401882290454395) q[35];
-cx q[3],q[35];
-cx q[3],q[39];
-cx q[32],q[35];
-rz(0.07401882290454395) q[35];
-cx q[32],q[35];
-rx(7.766369375783992) q[35];
-rz(0.07401882290454395) q[36];
-cx q[15],q[36];
-cx q[20],q[36];
-rz(0.07401882290454395) q[36];
-cx q[20],q[36];
-cx q[36],q[94];
-rz(0.07401882290454395) q[37];
-cx q[10],q[37];
-cx q[10],q[41];
-cx q[34],q[37];
-rz(0.07401882290454395) q[37];
-cx q[34],q[37];
-rx(7.766369375783992) q[34];
-cx q[37],q[85];
-rz(0.07401882290454395) q[38];
-cx q[19],q[38];
-rx(7.766369375783992) q[19];
-cx q[21],q[38];
-rz(0.07401882290454395) q[38];
-cx q[21],q[38];
-rz(0.07401882290454395) q[39];
-cx q[3],q[39];
-cx q[3],q[40];
-cx q[13],q[39];
-rz(0.07401882290454395) q[39];
-cx q[13],q[39];
-cx q[13],q[56];
-rz(0.07401882290454395) q[40];
-cx q[3],q[40];
-cx q[23],q[40];
-rz(0.07401882290454395) q[40];
-cx q[23],q[40];
-rx(7.766369375783992) q[40];
-rz(0.07401882290454395) q[41];
-cx q[10],q[41];
-cx q[27],q[41];
-rz(0.07401882290454395) q[41];
-cx q[27],q[41];
-cx q[27],q[72];
-cx q[41],q[67];
-rz(0.07401882290454395) q[42];
-cx q[0],q[42];
-cx q[0],q[48];
-cx q[3],q[42];
-rz(0.07401882290454395) q[42];
-cx q[3],q[42];
-cx q[3],q[43];
-cx q[42],q[78];
-rz(0.07401882290454395) q[43];
-cx q[3],q[43];
-cx q[3],q[44];
-cx q[20],q[43];
-rz(0.07401882290454395) q[43];
-cx q[20],q[43];
-rx(7.766369375783992) q[20];
-rx(7.766369375783992) q[43];
-rz(0.07401882290454395) q[44];
-cx q[3],q[44];
-cx q[3],q[49];
-cx q[12],q[44];
-rz(0.07401882290454395) q[44];
-cx q[12],q[44];
-rz(0.07401882290454395) q[45];
-cx q[1],q[45];
-cx q[1],q[57];
-cx q[16],q[45];
-rz(0.07401882290454395) q[45];
-cx q[16],q[45];
-cx q[16],q[59];
-rz(0.07401882290454395) q[46];
-cx q[5],q[46];
-cx q[5],q[65];
-cx q[38],q[46];
-rz(0.07401882290454395) q[46];
-cx q[38],q[46];
-rx(7.766369375783992) q[38];
-rx(7.766369375783992) q[46];
-rz(0.07401882290454395) q[47];
-cx q[4],q[47];
-cx q[17],q[47];
-rz(0.07401882290454395) q[47];
-cx q[17],q[47];
-cx q[17],q[53];
-rz(0.07401882290454395) q[48];
-cx q[0],q[48];
-cx q[0],q[51];
-cx q[30],q[48];
-rz(0.07401882290454395) q[48];
-cx q[30],q[48];
-rx(7.766369375783992) q[48];
-rz(0.07401882290454395) q[49];
-cx q[3],q[49];
-cx q[3],q[50];
-cx q[4],q[49];
-rz(0.07401882290454395) q[49];
-cx q[4],q[49];
-cx q[4],q[61];
-rx(7.766369375783992) q[49];
-rz(0.07401882290454395) q[50];
-cx q[3],q[50];
-cx q[3],q[52];
-cx q[12],q[50];
-rz(0.07401882290454395) q[50];
-cx q[12],q[50];
-cx q[12],q[63];
-rz(0.07401882290454395) q[51];
-cx q[0],q[51];
-cx q[0],q[62];
-cx q[28],q[51];
-rz(0.07401882290454395) q[51];
-cx q[28],q[51];
-rx(7.766369375783992) q[51];
-rz(0.07401882290454395) q[52];
-cx q[3],q[52];
-cx q[10],q[52];
-rz(0.07401882290454395) q[52];
-cx q[10],q[52];
-rx(7.766369375783992) q[52];
-rz(0.07401882290454395) q[53];
-cx q[17],q[53];
-cx q[21],q[53];
-rz(0.07401882290454395) q[53];
-cx q[21],q[53];
-rz(0.07401882290454395) q[54];
-cx q[24],q[54];
-cx q[24],q[58];
-cx q[28],q[54];
-rz(0.07401882290454395) q[54];
-cx q[28],q[54];
-rx(7.766369375783992) q[54];
-rz(0.07401882290454395) q[55];
-cx q[9],q[55];
-cx q[9],q[80];
-cx q[15],q[55];
-rz(0.07401882290454395) q[55];
-cx q[15],q[55];
-rz(0.07401882290454395) q[56];
-cx q[13],q[56];
-cx q[13],q[68];
-cx q[45],q[56];
-rz(0.07401882290454395) q[56];
-cx q[45],q[56];
-rx(7.766369375783992) q[45];
-rz(0.07401882290454395) q[57];
-cx q[1],q[57];
-cx q[1],q[60];
-cx q[3],q[57];
-rz(0.07401882290454395) q[57];
-cx q[3],q[57];
-cx q[3],q[70];
-rz(0.07401882290454395) q[58];
-cx q[24],q[58];
-cx q[24],q[86];
-cx q[28],q[58];
-rz(0.07401882290454395) q[58];
-cx q[28],q[58];
-cx q[28],q[87];
-rx(7.766369375783992) q[58];
-rz(0.07401882290454395) q[59];
-cx q[16],q[59];
-cx q[16],q[73];
-cx q[32],q[59];
-rz(0.07401882290454395) q[59];
-cx q[32],q[59];
-rz(0.07401882290454395) q[60];
-cx q[1],q[60];
-cx q[1],q[97];
-cx q[7],q[60];
-rz(0.07401882290454395) q[60];
-cx q[7],q[60];
-rz(0.07401882290454395) q[61];
-cx q[4],q[61];
-cx q[4],q[99];
-cx q[7],q[61];
-rz(0.07401882290454395) q[61];
-cx q[7],q[61];
-rx(7.766369375783992) q[61];
-rz(0.07401882290454395) q[62];
-cx q[0],q[62];
-cx q[0],q[64];
-cx q[17],q[62];
-rz(0.07401882290454395) q[62];
-cx q[17],q[62];
-rx(7.766369375783992) q[62];
-rz(0.07401882290454395) q[63];
-cx q[12],q[63];
-rx(7.766369375783992) q[12];
-cx q[17],q[63];
-rz(0.07401882290454395) q[63];
-cx q[17],q[63];
-cx q[17],q[66];
-rz(0.07401882290454395) q[64];
-cx q[0],q[64];
-cx q[0],q[75];
-cx q[10],q[64];
-rz(0.07401882290454395) q[64];
-cx q[10],q[64];
-cx q[10],q[98];
-rx(7.766369375783992) q[64];
-rz(0.07401882290454395) q[65];
-cx q[5],q[65];
-cx q[5],q[76];
-cx q[23],q[65];
-rz(0.07401882290454395) q[65];
-cx q[23],q[65];
-rx(7.766369375783992) q[23];
-rx(7.766369375783992) q[65];
-rz(0.07401882290454395) q[66];
-cx q[17],q[66];
-rx(7.766369375783992) q[17];
-cx q[47],q[66];
-rz(0.07401882290454395) q[66];
-cx q[47],q[66];
-rx(7.766369375783992) q[47];
-rx(7.766369375783992) q[66];
-rz(0.07401882290454395) q[67];
-cx q[41],q[67];
-cx q[56],q[67];
-rz(0.07401882290454395) q[67];
-cx q[56],q[67];
-cx q[56],q[74];
-rx(7.766369375783992) q[67];
-rz(0.07401882290454395) q[68];
-cx q[13],q[68];
-cx q[32],q[68];
-rz(0.07401882290454395) q[68];
-cx q[32],q[68];
-rz(0.07401882290454395) q[69];
-cx q[6],q[69];
-cx q[59],q[69];
-rz(0.07401882290454395) q[69];
-cx q[59],q[69];
-rx(7.766369375783992) q[69];
-rz(0.07401882290454395) q[70];
-cx q[3],q[70];
-cx q[3],q[71];
-cx q[15],q[70];
-rz(0.07401882290454395) q[70];
-cx q[15],q[70];
-cx q[70],q[84];
-rz(0.07401882290454395) q[71];
-cx q[3],q[71];
-cx q[3],q[77];
-cx q[53],q[71];
-rz(0.07401882290454395) q[71];
-cx q[53],q[71];
-rx(7.766369375783992) q[71];
-rz(0.07401882290454395) q[72];
-cx q[27],q[72];
-cx q[44],q[72];
-rz(0.07401882290454395) q[72];
-cx q[44],q[72];
-rx(7.766369375783992) q[44];
-rx(7.766369375783992) q[72];
-rz(0.07401882290454395) q[73];
-cx q[16],q[73];
-cx q[16],q[101];
-cx q[59],q[73];
-rz(0.07401882290454395) q[73];
-cx q[59],q[73];
-rz(0.07401882290454395) q[74];
-cx q[56],q[74];
-cx q[63],q[74];
-rz(0.07401882290454395) q[74];
-cx q[63],q[74];
-rx(7.766369375783992) q[63];
-rx(7.766369375783992) q[74];
-rz(0.07401882290454395) q[75];
-cx q[0],q[75];
-cx q[0],q[82];
-cx q[21],q[75];
-rz(0.07401882290454395) q[75];
-cx q[21],q[75];
-cx q[21],q[81];
-rx(7.766369375783992) q[75];
-rz(0.07401882290454395) q[76];
-cx q[5],q[76];
-cx q[5],q[89];
-cx q[6],q[76];
-rz(0.07401882290454395) q[76];
-cx q[6],q[76];
-cx q[6],q[79];
-rx(7.766369375783992) q[76];
-rz(0.07401882290454395) q[77];
-cx q[3],q[77];
-cx q[3],q[88];
-cx q[30],q[77];
-rz(0.07401882290454395) q[77];
-cx q[30],q[77];
-rx(7.766369375783992) q[30];
-rz(0.07401882290454395) q[78];
-cx q[42],q[78];
-rx(7.766369375783992) q[42];
-cx q[60],q[78];
-rz(0.07401882290454395) q[78];
-cx q[60],q[78];
-rx(7.766369375783992) q[78];
-rz(0.07401882290454395) q[79];
-cx q[6],q[79];
-cx q[50],q[79];
-rz(0.07401882290454395) q[79];
-cx q[50],q[79];
-rx(7.766369375783992) q[79];
-rz(0.07401882290454395) q[80];
-cx q[9],q[80];
-rx(7.766369375783992) q[9];
-cx q[15],q[80];
-rz(0.07401882290454395) q[80];
-cx q[15],q[80];
-cx q[15],q[90];
-rx(7.766369375783992) q[80];
-rz(0.07401882290454395) q[81];
-cx q[21],q[81];
-cx q[77],q[81];
-rz(0.07401882290454395) q[81];
-cx q[77],q[81];
-rx(7.766369375783992) q[77];
-rx(7.766369375783992) q[81];
-rz(0.07401882290454395) q[82];
-cx q[0],q[82];
-cx q[0],q[91];
-cx q[56],q[82];
-rz(0.07401882290454395) q[82];
-cx q[56],q[82];
-cx q[56],q[96];
-rx(7.766369375783992) q[82];
-rz(0.07401882290454395) q[83];
-cx q[8],q[83];
-rx(7.766369375783992) q[8];
-cx q[68],q[83];
-rz(0.07401882290454395) q[83];
-cx q[68],q[83];
-rx(7.766369375783992) q[68];
-rx(7.766369375783992) q[83];
-rz(0.07401882290454395) q[84];
-cx q[70],q[84];
-rx(7.766369375783992) q[70];
-cx q[73],q[84];
-rz(0.07401882290454395) q[84];
-cx q[73],q[84];
-rx(7.766369375783992) q[73];
-rx(7.766369375783992) q[84];
-rz(0.07401882290454395) q[85];
-cx q[37],q[85];
-rx(7.766369375783992) q[37];
-cx q[59],q[85];
-rz(0.07401882290454395) q[85];
-cx q[59],q[85];
-rx(7.766369375783992) q[59];
-rx(7.766369375783992) q[85];
-rz(0.07401882290454395) q[86];
-cx q[24],q[86];
-cx q[53],q[86];
-rz(0.07401882290454395) q[86];
-cx q[53],q[86];
-rx(7.766369375783992) q[53];
-rx(7.766369375783992) q[86];
-rz(0.07401882290454395) q[87];
-cx q[28],q[87];
-cx q[32],q[87];
-rz(0.07401882290454395) q[87];
-cx q[32],q[87];
-rx(7.766369375783992) q[87];
-rz(0.07401882290454395) q[88];
-cx q[3],q[88];
-cx q[3],q[100];
-cx q[60],q[88];
-rz(0.07401882290454395) q[88];
-cx q[60],q[88];
-rx(7.766369375783992) q[60];
-rx(7.766369375783992) q[88];
-rz(0.07401882290454395) q[89];
-cx q[5],q[89];
-cx q[5],q[95];
-rz(0.07401882290454395) q[90];
-cx q[15],q[90];
-cx q[15],q[92];
-cx q[27],q[90];
-rz(0.07401882290454395) q[90];
-cx q[27],q[90];
-rx(7.766369375783992) q[90];
-rz(0.07401882290454395) q[91];
-cx q[0],q[91];
-cx q[0],q[93];
-cx q[6],q[91];
-rz(0.07401882290454395) q[91];
-cx q[6],q[91];
-rx(7.766369375783992) q[6];
-rx(7.766369375783992) q[91];
-rz(0.07401882290454395) q[92];
-cx q[15],q[92];
-cx q[15],q[108];
-cx q[89],q[92];
-rz(0.07401882290454395) q[92];
-cx q[89],q[92];
-rx(7.766369375783992) q[89];
-rz(0.07401882290454395) q[93];
-cx q[0],q[93];
-rx(7.766369375783992) q[0];
-cx q[32],q[93];
-rz(0.07401882290454395) q[93];
-cx q[32],q[93];
-rx(7.766369375783992) q[32];
-rx(7.766369375783992) q[93];
-rz(0.07401882290454395) q[94];
-cx q[36],q[94];
-cx q[55],q[94];
-rz(0.07401882290454395) q[94];
-cx q[55],q[94];
-rx(7.766369375783992) q[55];
-rx(7.766369375783992) q[94];
-rz(0.07401882290454395) q[95];
-cx q[5],q[95];
-cx q[5],q[106];
-cx q[27],q[95];
-rz(0.07401882290454395) q[95];
-cx q[27],q[95];
-rx(7.766369375783992) q[27];
-rx(7.766369375783992) q[95];
-rz(0.07401882290454395) q[96];
-cx q[56],q[96];
-rx(7.766369375783992) q[56];
-cx q[92],q[96];
-rz(0.07401882290454395) q[96];
-cx q[92],q[96];
-rx(7.766369375783992) q[92];
-rx(7.766369375783992) q[96];
-rz(0.07401882290454395) q[97];
-cx q[1],q[97];
-cx q[7],q[97];
-rz(0.07401882290454395) q[97];
-cx q[7],q[97];
-cx q[7],q[104];
-rx(7.766369375783992) q[97];
-rz(0.07401882290454395) q[98];
-cx q[10],q[98];
-rx(7.766369375783992) q[10];
-cx q[21],q[98];
-rz(0.07401882290454395) q[98];
-cx q[21],q[98];
-rx(7.766369375783992) q[98];
-rz(0.07401882290454395) q[99];
-cx q[4],q[99];
-cx q[41],q[99];
-rz(0.07401882290454395) q[99];
-cx q[41],q[99];
-rx(7.766369375783992) q[41];
-rx(7.766369375783992) q[99];
-rz(0.07401882290454395) q[100];
-cx q[3],q[100];
-cx q[3],q[102];
-cx q[25],q[100];
-rz(0.07401882290454395) q[100];
-cx q[25],q[100];
-rx(7.766369375783992) q[25];
-rx(7.766369375783992) q[100];
-rz(0.07401882290454395) q[101];
-cx q[16],q[101];
-cx q[16],q[103];
-cx q[50],q[101];
-rz(0.07401882290454395) q[101];
-cx q[50],q[101];
-rx(7.766369375783992) q[50];
-rx(7.766369375783992) q[101];
-rz(0.07401882290454395) q[102];
-cx q[3],q[102];
-cx q[3],q[107];
-cx q[4],q[102];
-rz(0.07401882290454395) q[102];
-cx q[4],q[102];
-rx(7.766369375783992) q[4];
-rx(7.766369375783992) q[102];
-rz(0.07401882290454395) q[103];
-cx q[16],q[103];
-rx(7.766369375783992) q[16];
-cx q[57],q[103];
-rz(0.07401882290454395) q[103];
-cx q[57],q[103];
-rx(7.766369375783992) q[57];
-rx(7.766369375783992) q[103];
-rz(0.07401882290454395) q[104];
-cx q[7],q[104];
-rx(7.766369375783992) q[7];
-cx q[13],q[104];
-rz(0.07401882290454395) q[104];
-cx q[13],q[104];
-rx(7.766369375783992) q[13];
-rx(7.766369375783992) q[104];
-rz(0.07401882290454395) q[105];
-cx q[26],q[105];
-rx(7.766369375783992) q[26];
-cx q[28],q[105];
-rz(0.07401882290454395) q[105];
-cx q[28],q[105];
-rx(7.766369375783992) q[28];
-rx(7.766369375783992) q[105];
-rz(0.07401882290454395) q[106];
-cx q[5],q[106];
-cx q[5],q[109];
-cx q[36],q[106];
-rz(0.07401882290454395) q[106];
-cx q[36],q[106];
-rx(7.766369375783992) q[106];
-rz(0.07401882290454395) q[107];
-cx q[3],q[107];
-cx q[3],q[110];
-cx q[31],q[107];
-rz(0.07401882290454395) q[107];
-cx q[31],q[107];
-rx(7.766369375783992) q[107];
-rz(0.07401882290454395) q[108];
-cx q[15],q[108];
-rx(7.766369375783992) q[15];
-cx q[31],q[108];
-rz(0.07401882290454395) q[108];
-cx q[31],q[108];
-rx(7.766369375783992) q[31];
-rx(7.766369375783992) q[108];
-rz(0.07401882290454395) q[109];
-cx q[5],q[109];
-rx(7.766369375783992) q[5];
-cx q[39],q[109];
-rz(0.07401882290454395) q[109];
-cx q[39],q[109];
-rx(7.766369375783992) q[39];
-rx(7.766369375783992) q[109];
-rz(0.07401882290454395) q[110];
-cx q[3],q[110];
-cx q[3],q[111];
-cx q[24],q[110];
-rz(0.07401882290454395) q[110];
-cx q[24],q[110];
-rx(7.766369375783992) q[24];
-rx(7.766369375783992) q[110];
-rz(0.07401882290454395) q[111];
-cx q[3],q[111];
-cx q[21],q[111];
-rz(0.07401882290454395) q[111];
-cx q[21],q[111];
-cx q[21],q[112];
-rx(7.766369375783992) q[111];
-rz(0.07401882290454395) q[112];
-cx q[21],q[112];
-rx(7.766369375783992) q[21];
-cx q[36],q[112];
-rz(0.07401882290454395) q[112];
-cx q[36],q[112];
-rx(7.766369375783992) q[36];
-rx(7.766369375783992) q[112];
-rx(0.8224462625715805) q[113];
-cx q[1],q[113];
-rz(0.07401882290454395) q[113];
-cx q[1],q[113];
-rx(7.766369375783992) q[1];
-cx q[3],q[113];
-rz(0.07401882290454395) q[113];
-cx q[3],q[113];
-rx(7.766369375783992) q[3];
-rx(7.766369375783992) q[113];
\ No newline at end of file
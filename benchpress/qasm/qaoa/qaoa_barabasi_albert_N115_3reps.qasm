@@ -1,2612 +0,0 @@
-OPENQASM 2.0;
-include "qelib1.inc";
-qreg q[115];
-ry(pi/2) q[0];
-rx(pi) q[0];
-ry(pi/2) q[1];
-rx(pi) q[1];
-cx q[0],q[1];
-rz(0.9174338957155904) q[1];
-cx q[0],q[1];
-ry(pi/2) q[2];
-rx(pi) q[2];
-cx q[0],q[2];
-rz(0.9174338957155904) q[2];
-cx q[0],q[2];
-ry(pi/2) q[3];
-rx(pi) q[3];
-cx q[0],q[3];
-rz(0.9174338957155904) q[3];
-cx q[0],q[3];
-cx q[1],q[3];
-rz(0.9174338957155904) q[3];
-cx q[1],q[3];
-ry(pi/2) q[4];
-rx(pi) q[4];
-cx q[1],q[4];
-rz(0.9174338957155904) q[4];
-cx q[1],q[4];
-cx q[3],q[4];
-rz(0.9174338957155904) q[4];
-cx q[3],q[4];
-ry(pi/2) q[5];
-rx(pi) q[5];
-cx q[1],q[5];
-rz(0.9174338957155904) q[5];
-cx q[1],q[5];
-cx q[3],q[5];
-rz(0.9174338957155904) q[5];
-cx q[3],q[5];
-ry(pi/2) q[6];
-rx(pi) q[6];
-cx q[4],q[6];
-rz(0.9174338957155904) q[6];
-cx q[4],q[6];
-cx q[5],q[6];
-rz(0.9174338957155904) q[6];
-cx q[5],q[6];
-ry(pi/2) q[7];
-rx(pi) q[7];
-cx q[3],q[7];
-rz(0.9174338957155904) q[7];
-cx q[3],q[7];
-cx q[4],q[7];
-rz(0.9174338957155904) q[7];
-cx q[4],q[7];
-ry(pi/2) q[8];
-rx(pi) q[8];
-cx q[3],q[8];
-rz(0.9174338957155904) q[8];
-cx q[3],q[8];
-cx q[5],q[8];
-rz(0.9174338957155904) q[8];
-cx q[5],q[8];
-ry(pi/2) q[9];
-rx(pi) q[9];
-cx q[1],q[9];
-rz(0.9174338957155904) q[9];
-cx q[1],q[9];
-cx q[3],q[9];
-rz(0.9174338957155904) q[9];
-cx q[3],q[9];
-ry(pi/2) q[10];
-rx(pi) q[10];
-cx q[4],q[10];
-rz(0.9174338957155904) q[10];
-cx q[4],q[10];
-cx q[6],q[10];
-rz(0.9174338957155904) q[10];
-cx q[6],q[10];
-ry(pi/2) q[11];
-rx(pi) q[11];
-cx q[5],q[11];
-rz(0.9174338957155904) q[11];
-cx q[5],q[11];
-cx q[6],q[11];
-rz(0.9174338957155904) q[11];
-cx q[6],q[11];
-rx(3.8576308052616097) q[11];
-ry(pi/2) q[12];
-rx(pi) q[12];
-cx q[3],q[12];
-rz(0.9174338957155904) q[12];
-cx q[3],q[12];
-cx q[5],q[12];
-rz(0.9174338957155904) q[12];
-cx q[5],q[12];
-ry(pi/2) q[13];
-rx(pi) q[13];
-cx q[4],q[13];
-rz(0.9174338957155904) q[13];
-cx q[4],q[13];
-cx q[5],q[13];
-rz(0.9174338957155904) q[13];
-cx q[5],q[13];
-ry(pi/2) q[14];
-rx(pi) q[14];
-cx q[3],q[14];
-rz(0.9174338957155904) q[14];
-cx q[3],q[14];
-cx q[4],q[14];
-rz(0.9174338957155904) q[14];
-cx q[4],q[14];
-rx(3.8576308052616097) q[14];
-ry(pi/2) q[15];
-rx(pi) q[15];
-cx q[0],q[15];
-rz(0.9174338957155904) q[15];
-cx q[0],q[15];
-cx q[3],q[15];
-rz(0.9174338957155904) q[15];
-cx q[3],q[15];
-ry(pi/2) q[16];
-rx(pi) q[16];
-cx q[0],q[16];
-rz(0.9174338957155904) q[16];
-cx q[0],q[16];
-cx q[3],q[16];
-rz(0.9174338957155904) q[16];
-cx q[3],q[16];
-ry(pi/2) q[17];
-rx(pi) q[17];
-cx q[1],q[17];
-rz(0.9174338957155904) q[17];
-cx q[1],q[17];
-cx q[3],q[17];
-rz(0.9174338957155904) q[17];
-cx q[3],q[17];
-ry(pi/2) q[18];
-rx(pi) q[18];
-cx q[3],q[18];
-rz(0.9174338957155904) q[18];
-cx q[3],q[18];
-cx q[4],q[18];
-rz(0.9174338957155904) q[18];
-cx q[4],q[18];
-ry(pi/2) q[19];
-rx(pi) q[19];
-cx q[3],q[19];
-rz(0.9174338957155904) q[19];
-cx q[3],q[19];
-cx q[7],q[19];
-rz(0.9174338957155904) q[19];
-cx q[7],q[19];
-ry(pi/2) q[20];
-rx(pi) q[20];
-cx q[0],q[20];
-rz(0.9174338957155904) q[20];
-cx q[0],q[20];
-cx q[15],q[20];
-rz(0.9174338957155904) q[20];
-cx q[15],q[20];
-ry(pi/2) q[21];
-rx(pi) q[21];
-cx q[4],q[21];
-rz(0.9174338957155904) q[21];
-cx q[4],q[21];
-cx q[15],q[21];
-rz(0.9174338957155904) q[21];
-cx q[15],q[21];
-ry(pi/2) q[22];
-rx(pi) q[22];
-cx q[3],q[22];
-rz(0.9174338957155904) q[22];
-cx q[3],q[22];
-cx q[9],q[22];
-rz(0.9174338957155904) q[22];
-cx q[9],q[22];
-rx(3.8576308052616097) q[22];
-ry(pi/2) q[23];
-rx(pi) q[23];
-cx q[3],q[23];
-rz(0.9174338957155904) q[23];
-cx q[3],q[23];
-cx q[17],q[23];
-rz(0.9174338957155904) q[23];
-cx q[17],q[23];
-ry(pi/2) q[24];
-rx(pi) q[24];
-cx q[3],q[24];
-rz(0.9174338957155904) q[24];
-cx q[3],q[24];
-cx q[5],q[24];
-rz(0.9174338957155904) q[24];
-cx q[5],q[24];
-ry(pi/2) q[25];
-rx(pi) q[25];
-cx q[3],q[25];
-rz(0.9174338957155904) q[25];
-cx q[3],q[25];
-cx q[12],q[25];
-rz(0.9174338957155904) q[25];
-cx q[12],q[25];
-ry(pi/2) q[26];
-rx(pi) q[26];
-cx q[3],q[26];
-rz(0.9174338957155904) q[26];
-cx q[3],q[26];
-cx q[21],q[26];
-rz(0.9174338957155904) q[26];
-cx q[21],q[26];
-ry(pi/2) q[27];
-rx(pi) q[27];
-cx q[4],q[27];
-rz(0.9174338957155904) q[27];
-cx q[4],q[27];
-cx q[6],q[27];
-rz(0.9174338957155904) q[27];
-cx q[6],q[27];
-ry(pi/2) q[28];
-rx(pi) q[28];
-cx q[1],q[28];
-rz(0.9174338957155904) q[28];
-cx q[1],q[28];
-cx q[3],q[28];
-rz(0.9174338957155904) q[28];
-cx q[3],q[28];
-ry(pi/2) q[29];
-rx(pi) q[29];
-cx q[1],q[29];
-rz(0.9174338957155904) q[29];
-cx q[1],q[29];
-cx q[3],q[29];
-rz(0.9174338957155904) q[29];
-cx q[3],q[29];
-rx(3.8576308052616097) q[29];
-ry(pi/2) q[30];
-rx(pi) q[30];
-cx q[3],q[30];
-rz(0.9174338957155904) q[30];
-cx q[3],q[30];
-cx q[18],q[30];
-rz(0.9174338957155904) q[30];
-cx q[18],q[30];
-rx(3.8576308052616097) q[18];
-ry(pi/2) q[31];
-rx(pi) q[31];
-cx q[12],q[31];
-rz(0.9174338957155904) q[31];
-cx q[12],q[31];
-cx q[26],q[31];
-rz(0.9174338957155904) q[31];
-cx q[26],q[31];
-ry(pi/2) q[32];
-rx(pi) q[32];
-cx q[0],q[32];
-rz(0.9174338957155904) q[32];
-cx q[0],q[32];
-cx q[21],q[32];
-rz(0.9174338957155904) q[32];
-cx q[21],q[32];
-ry(pi/2) q[33];
-rx(pi) q[33];
-cx q[5],q[33];
-rz(0.9174338957155904) q[33];
-cx q[5],q[33];
-cx q[30],q[33];
-rz(0.9174338957155904) q[33];
-cx q[30],q[33];
-rx(3.8576308052616097) q[33];
-ry(pi/2) q[34];
-rx(pi) q[34];
-cx q[3],q[34];
-rz(0.9174338957155904) q[34];
-cx q[3],q[34];
-cx q[12],q[34];
-rz(0.9174338957155904) q[34];
-cx q[12],q[34];
-ry(pi/2) q[35];
-rx(pi) q[35];
-cx q[3],q[35];
-rz(0.9174338957155904) q[35];
-cx q[3],q[35];
-cx q[32],q[35];
-rz(0.9174338957155904) q[35];
-cx q[32],q[35];
-rx(3.8576308052616097) q[35];
-ry(pi/2) q[36];
-rx(pi) q[36];
-cx q[15],q[36];
-rz(0.9174338957155904) q[36];
-cx q[15],q[36];
-cx q[20],q[36];
-rz(0.9174338957155904) q[36];
-cx q[20],q[36];
-ry(pi/2) q[37];
-rx(pi) q[37];
-cx q[10],q[37];
-rz(0.9174338957155904) q[37];
-cx q[10],q[37];
-cx q[34],q[37];
-rz(0.9174338957155904) q[37];
-cx q[34],q[37];
-rx(3.8576308052616097) q[34];
-ry(pi/2) q[38];
-rx(pi) q[38];
-cx q[19],q[38];
-rz(0.9174338957155904) q[38];
-cx q[19],q[38];
-rx(3.8576308052616097) q[19];
-cx q[21],q[38];
-rz(0.9174338957155904) q[38];
-cx q[21],q[38];
-ry(pi/2) q[39];
-rx(pi) q[39];
-cx q[3],q[39];
-rz(0.9174338957155904) q[39];
-cx q[3],q[39];
-cx q[13],q[39];
-rz(0.9174338957155904) q[39];
-cx q[13],q[39];
-ry(pi/2) q[40];
-rx(pi) q[40];
-cx q[3],q[40];
-rz(0.9174338957155904) q[40];
-cx q[3],q[40];
-cx q[23],q[40];
-rz(0.9174338957155904) q[40];
-cx q[23],q[40];
-rx(3.8576308052616097) q[40];
-ry(pi/2) q[41];
-rx(pi) q[41];
-cx q[10],q[41];
-rz(0.9174338957155904) q[41];
-cx q[10],q[41];
-cx q[27],q[41];
-rz(0.9174338957155904) q[41];
-cx q[27],q[41];
-ry(pi/2) q[42];
-rx(pi) q[42];
-cx q[0],q[42];
-rz(0.9174338957155904) q[42];
-cx q[0],q[42];
-cx q[3],q[42];
-rz(0.9174338957155904) q[42];
-cx q[3],q[42];
-ry(pi/2) q[43];
-rx(pi) q[43];
-cx q[3],q[43];
-rz(0.9174338957155904) q[43];
-cx q[3],q[43];
-cx q[20],q[43];
-rz(0.9174338957155904) q[43];
-cx q[20],q[43];
-rx(3.8576308052616097) q[20];
-rx(3.8576308052616097) q[43];
-ry(pi/2) q[44];
-rx(pi) q[44];
-cx q[3],q[44];
-rz(0.9174338957155904) q[44];
-cx q[3],q[44];
-cx q[12],q[44];
-rz(0.9174338957155904) q[44];
-cx q[12],q[44];
-ry(pi/2) q[45];
-rx(pi) q[45];
-cx q[1],q[45];
-rz(0.9174338957155904) q[45];
-cx q[1],q[45];
-cx q[16],q[45];
-rz(0.9174338957155904) q[45];
-cx q[16],q[45];
-ry(pi/2) q[46];
-rx(pi) q[46];
-cx q[5],q[46];
-rz(0.9174338957155904) q[46];
-cx q[5],q[46];
-cx q[38],q[46];
-rz(0.9174338957155904) q[46];
-cx q[38],q[46];
-rx(3.8576308052616097) q[38];
-rx(3.8576308052616097) q[46];
-ry(pi/2) q[47];
-rx(pi) q[47];
-cx q[4],q[47];
-rz(0.9174338957155904) q[47];
-cx q[4],q[47];
-cx q[17],q[47];
-rz(0.9174338957155904) q[47];
-cx q[17],q[47];
-ry(pi/2) q[48];
-rx(pi) q[48];
-cx q[0],q[48];
-rz(0.9174338957155904) q[48];
-cx q[0],q[48];
-cx q[30],q[48];
-rz(0.9174338957155904) q[48];
-cx q[30],q[48];
-rx(3.8576308052616097) q[48];
-ry(pi/2) q[49];
-rx(pi) q[49];
-cx q[3],q[49];
-rz(0.9174338957155904) q[49];
-cx q[3],q[49];
-cx q[4],q[49];
-rz(0.9174338957155904) q[49];
-cx q[4],q[49];
-rx(3.8576308052616097) q[49];
-ry(pi/2) q[50];
-rx(pi) q[50];
-cx q[3],q[50];
-rz(0.9174338957155904) q[50];
-cx q[3],q[50];
-cx q[12],q[50];
-rz(0.9174338957155904) q[50];
-cx q[12],q[50];
-ry(pi/2) q[51];
-rx(pi) q[51];
-cx q[0],q[51];
-rz(0.9174338957155904) q[51];
-cx q[0],q[51];
-cx q[28],q[51];
-rz(0.9174338957155904) q[51];
-cx q[28],q[51];
-rx(3.8576308052616097) q[51];
-ry(pi/2) q[52];
-rx(pi) q[52];
-cx q[3],q[52];
-rz(0.9174338957155904) q[52];
-cx q[3],q[52];
-cx q[10],q[52];
-rz(0.9174338957155904) q[52];
-cx q[10],q[52];
-rx(3.8576308052616097) q[52];
-ry(pi/2) q[53];
-rx(pi) q[53];
-cx q[17],q[53];
-rz(0.9174338957155904) q[53];
-cx q[17],q[53];
-cx q[21],q[53];
-rz(0.9174338957155904) q[53];
-cx q[21],q[53];
-ry(pi/2) q[54];
-rx(pi) q[54];
-cx q[24],q[54];
-rz(0.9174338957155904) q[54];
-cx q[24],q[54];
-cx q[28],q[54];
-rz(0.9174338957155904) q[54];
-cx q[28],q[54];
-rx(3.8576308052616097) q[54];
-ry(pi/2) q[55];
-rx(pi) q[55];
-cx q[9],q[55];
-rz(0.9174338957155904) q[55];
-cx q[9],q[55];
-cx q[15],q[55];
-rz(0.9174338957155904) q[55];
-cx q[15],q[55];
-ry(pi/2) q[56];
-rx(pi) q[56];
-cx q[13],q[56];
-rz(0.9174338957155904) q[56];
-cx q[13],q[56];
-cx q[45],q[56];
-rz(0.9174338957155904) q[56];
-cx q[45],q[56];
-rx(3.8576308052616097) q[45];
-ry(pi/2) q[57];
-rx(pi) q[57];
-cx q[1],q[57];
-rz(0.9174338957155904) q[57];
-cx q[1],q[57];
-cx q[3],q[57];
-rz(0.9174338957155904) q[57];
-cx q[3],q[57];
-ry(pi/2) q[58];
-rx(pi) q[58];
-cx q[24],q[58];
-rz(0.9174338957155904) q[58];
-cx q[24],q[58];
-cx q[28],q[58];
-rz(0.9174338957155904) q[58];
-cx q[28],q[58];
-rx(3.8576308052616097) q[58];
-ry(pi/2) q[59];
-rx(pi) q[59];
-cx q[16],q[59];
-rz(0.9174338957155904) q[59];
-cx q[16],q[59];
-cx q[32],q[59];
-rz(0.9174338957155904) q[59];
-cx q[32],q[59];
-ry(pi/2) q[60];
-rx(pi) q[60];
-cx q[1],q[60];
-rz(0.9174338957155904) q[60];
-cx q[1],q[60];
-cx q[7],q[60];
-rz(0.9174338957155904) q[60];
-cx q[7],q[60];
-ry(pi/2) q[61];
-rx(pi) q[61];
-cx q[4],q[61];
-rz(0.9174338957155904) q[61];
-cx q[4],q[61];
-cx q[7],q[61];
-rz(0.9174338957155904) q[61];
-cx q[7],q[61];
-rx(3.8576308052616097) q[61];
-ry(pi/2) q[62];
-rx(pi) q[62];
-cx q[0],q[62];
-rz(0.9174338957155904) q[62];
-cx q[0],q[62];
-cx q[17],q[62];
-rz(0.9174338957155904) q[62];
-cx q[17],q[62];
-rx(3.8576308052616097) q[62];
-ry(pi/2) q[63];
-rx(pi) q[63];
-cx q[12],q[63];
-rz(0.9174338957155904) q[63];
-cx q[12],q[63];
-rx(3.8576308052616097) q[12];
-cx q[17],q[63];
-rz(0.9174338957155904) q[63];
-cx q[17],q[63];
-ry(pi/2) q[64];
-rx(pi) q[64];
-cx q[0],q[64];
-rz(0.9174338957155904) q[64];
-cx q[0],q[64];
-cx q[10],q[64];
-rz(0.9174338957155904) q[64];
-cx q[10],q[64];
-rx(3.8576308052616097) q[64];
-ry(pi/2) q[65];
-rx(pi) q[65];
-cx q[5],q[65];
-rz(0.9174338957155904) q[65];
-cx q[5],q[65];
-cx q[23],q[65];
-rz(0.9174338957155904) q[65];
-cx q[23],q[65];
-rx(3.8576308052616097) q[23];
-rx(3.8576308052616097) q[65];
-ry(pi/2) q[66];
-rx(pi) q[66];
-cx q[17],q[66];
-rz(0.9174338957155904) q[66];
-cx q[17],q[66];
-rx(3.8576308052616097) q[17];
-cx q[47],q[66];
-rz(0.9174338957155904) q[66];
-cx q[47],q[66];
-rx(3.8576308052616097) q[47];
-rx(3.8576308052616097) q[66];
-ry(pi/2) q[67];
-rx(pi) q[67];
-cx q[41],q[67];
-rz(0.9174338957155904) q[67];
-cx q[41],q[67];
-cx q[56],q[67];
-rz(0.9174338957155904) q[67];
-cx q[56],q[67];
-rx(3.8576308052616097) q[67];
-ry(pi/2) q[68];
-rx(pi) q[68];
-cx q[13],q[68];
-rz(0.9174338957155904) q[68];
-cx q[13],q[68];
-cx q[32],q[68];
-rz(0.9174338957155904) q[68];
-cx q[32],q[68];
-ry(pi/2) q[69];
-rx(pi) q[69];
-cx q[6],q[69];
-rz(0.9174338957155904) q[69];
-cx q[6],q[69];
-cx q[59],q[69];
-rz(0.9174338957155904) q[69];
-cx q[59],q[69];
-rx(3.8576308052616097) q[69];
-ry(pi/2) q[70];
-rx(pi) q[70];
-cx q[3],q[70];
-rz(0.9174338957155904) q[70];
-cx q[3],q[70];
-cx q[15],q[70];
-rz(0.9174338957155904) q[70];
-cx q[15],q[70];
-ry(pi/2) q[71];
-rx(pi) q[71];
-cx q[3],q[71];
-rz(0.9174338957155904) q[71];
-cx q[3],q[71];
-cx q[53],q[71];
-rz(0.9174338957155904) q[71];
-cx q[53],q[71];
-rx(3.8576308052616097) q[71];
-ry(pi/2) q[72];
-rx(pi) q[72];
-cx q[27],q[72];
-rz(0.9174338957155904) q[72];
-cx q[27],q[72];
-cx q[44],q[72];
-rz(0.9174338957155904) q[72];
-cx q[44],q[72];
-rx(3.8576308052616097) q[44];
-rx(3.8576308052616097) q[72];
-ry(pi/2) q[73];
-rx(pi) q[73];
-cx q[16],q[73];
-rz(0.9174338957155904) q[73];
-cx q[16],q[73];
-cx q[59],q[73];
-rz(0.9174338957155904) q[73];
-cx q[59],q[73];
-ry(pi/2) q[74];
-rx(pi) q[74];
-cx q[56],q[74];
-rz(0.9174338957155904) q[74];
-cx q[56],q[74];
-cx q[63],q[74];
-rz(0.9174338957155904) q[74];
-cx q[63],q[74];
-rx(3.8576308052616097) q[63];
-rx(3.8576308052616097) q[74];
-ry(pi/2) q[75];
-rx(pi) q[75];
-cx q[0],q[75];
-rz(0.9174338957155904) q[75];
-cx q[0],q[75];
-cx q[21],q[75];
-rz(0.9174338957155904) q[75];
-cx q[21],q[75];
-rx(3.8576308052616097) q[75];
-ry(pi/2) q[76];
-rx(pi) q[76];
-cx q[5],q[76];
-rz(0.9174338957155904) q[76];
-cx q[5],q[76];
-cx q[6],q[76];
-rz(0.9174338957155904) q[76];
-cx q[6],q[76];
-rx(3.8576308052616097) q[76];
-ry(pi/2) q[77];
-rx(pi) q[77];
-cx q[3],q[77];
-rz(0.9174338957155904) q[77];
-cx q[3],q[77];
-cx q[30],q[77];
-rz(0.9174338957155904) q[77];
-cx q[30],q[77];
-rx(3.8576308052616097) q[30];
-ry(pi/2) q[78];
-rx(pi) q[78];
-cx q[42],q[78];
-rz(0.9174338957155904) q[78];
-cx q[42],q[78];
-rx(3.8576308052616097) q[42];
-cx q[60],q[78];
-rz(0.9174338957155904) q[78];
-cx q[60],q[78];
-rx(3.8576308052616097) q[78];
-ry(pi/2) q[79];
-rx(pi) q[79];
-cx q[6],q[79];
-rz(0.9174338957155904) q[79];
-cx q[6],q[79];
-cx q[50],q[79];
-rz(0.9174338957155904) q[79];
-cx q[50],q[79];
-rx(3.8576308052616097) q[79];
-ry(pi/2) q[80];
-rx(pi) q[80];
-cx q[9],q[80];
-rz(0.9174338957155904) q[80];
-cx q[9],q[80];
-rx(3.8576308052616097) q[9];
-cx q[15],q[80];
-rz(0.9174338957155904) q[80];
-cx q[15],q[80];
-rx(3.8576308052616097) q[80];
-ry(pi/2) q[81];
-rx(pi) q[81];
-cx q[21],q[81];
-rz(0.9174338957155904) q[81];
-cx q[21],q[81];
-cx q[77],q[81];
-rz(0.9174338957155904) q[81];
-cx q[77],q[81];
-rx(3.8576308052616097) q[77];
-rx(3.8576308052616097) q[81];
-ry(pi/2) q[82];
-rx(pi) q[82];
-cx q[0],q[82];
-rz(0.9174338957155904) q[82];
-cx q[0],q[82];
-cx q[56],q[82];
-rz(0.9174338957155904) q[82];
-cx q[56],q[82];
-rx(3.8576308052616097) q[82];
-ry(pi/2) q[83];
-rx(pi) q[83];
-cx q[8],q[83];
-rz(0.9174338957155904) q[83];
-cx q[8],q[83];
-rx(3.8576308052616097) q[8];
-cx q[68],q[83];
-rz(0.9174338957155904) q[83];
-cx q[68],q[83];
-rx(3.8576308052616097) q[68];
-rx(3.8576308052616097) q[83];
-ry(pi/2) q[84];
-rx(pi) q[84];
-cx q[70],q[84];
-rz(0.9174338957155904) q[84];
-cx q[70],q[84];
-rx(3.8576308052616097) q[70];
-cx q[73],q[84];
-rz(0.9174338957155904) q[84];
-cx q[73],q[84];
-rx(3.8576308052616097) q[73];
-rx(3.8576308052616097) q[84];
-ry(pi/2) q[85];
-rx(pi) q[85];
-cx q[37],q[85];
-rz(0.9174338957155904) q[85];
-cx q[37],q[85];
-rx(3.8576308052616097) q[37];
-cx q[59],q[85];
-rz(0.9174338957155904) q[85];
-cx q[59],q[85];
-rx(3.8576308052616097) q[59];
-rx(3.8576308052616097) q[85];
-ry(pi/2) q[86];
-rx(pi) q[86];
-cx q[24],q[86];
-rz(0.9174338957155904) q[86];
-cx q[24],q[86];
-cx q[53],q[86];
-rz(0.9174338957155904) q[86];
-cx q[53],q[86];
-rx(3.8576308052616097) q[53];
-rx(3.8576308052616097) q[86];
-ry(pi/2) q[87];
-rx(pi) q[87];
-cx q[28],q[87];
-rz(0.9174338957155904) q[87];
-cx q[28],q[87];
-cx q[32],q[87];
-rz(0.9174338957155904) q[87];
-cx q[32],q[87];
-rx(3.8576308052616097) q[87];
-ry(pi/2) q[88];
-rx(pi) q[88];
-cx q[3],q[88];
-rz(0.9174338957155904) q[88];
-cx q[3],q[88];
-cx q[60],q[88];
-rz(0.9174338957155904) q[88];
-cx q[60],q[88];
-rx(3.8576308052616097) q[60];
-rx(3.8576308052616097) q[88];
-ry(pi/2) q[89];
-rx(pi) q[89];
-cx q[2],q[89];
-rz(0.9174338957155904) q[89];
-cx q[2],q[89];
-rx(3.8576308052616097) q[2];
-cx q[5],q[89];
-rz(0.9174338957155904) q[89];
-cx q[5],q[89];
-ry(pi/2) q[90];
-rx(pi) q[90];
-cx q[15],q[90];
-rz(0.9174338957155904) q[90];
-cx q[15],q[90];
-cx q[27],q[90];
-rz(0.9174338957155904) q[90];
-cx q[27],q[90];
-rx(3.8576308052616097) q[90];
-ry(pi/2) q[91];
-rx(pi) q[91];
-cx q[0],q[91];
-rz(0.9174338957155904) q[91];
-cx q[0],q[91];
-cx q[6],q[91];
-rz(0.9174338957155904) q[91];
-cx q[6],q[91];
-rx(3.8576308052616097) q[6];
-rx(3.8576308052616097) q[91];
-ry(pi/2) q[92];
-rx(pi) q[92];
-cx q[15],q[92];
-rz(0.9174338957155904) q[92];
-cx q[15],q[92];
-cx q[89],q[92];
-rz(0.9174338957155904) q[92];
-cx q[89],q[92];
-rx(3.8576308052616097) q[89];
-ry(pi/2) q[93];
-rx(pi) q[93];
-cx q[0],q[93];
-rz(0.9174338957155904) q[93];
-cx q[0],q[93];
-rx(3.8576308052616097) q[0];
-cx q[32],q[93];
-rz(0.9174338957155904) q[93];
-cx q[32],q[93];
-rx(3.8576308052616097) q[32];
-rx(3.8576308052616097) q[93];
-ry(pi/2) q[94];
-rx(pi) q[94];
-cx q[36],q[94];
-rz(0.9174338957155904) q[94];
-cx q[36],q[94];
-cx q[55],q[94];
-rz(0.9174338957155904) q[94];
-cx q[55],q[94];
-rx(3.8576308052616097) q[55];
-rx(3.8576308052616097) q[94];
-ry(pi/2) q[95];
-rx(pi) q[95];
-cx q[5],q[95];
-rz(0.9174338957155904) q[95];
-cx q[5],q[95];
-cx q[27],q[95];
-rz(0.9174338957155904) q[95];
-cx q[27],q[95];
-rx(3.8576308052616097) q[27];
-rx(3.8576308052616097) q[95];
-ry(pi/2) q[96];
-rx(pi) q[96];
-cx q[56],q[96];
-rz(0.9174338957155904) q[96];
-cx q[56],q[96];
-rx(3.8576308052616097) q[56];
-cx q[92],q[96];
-rz(0.9174338957155904) q[96];
-cx q[92],q[96];
-rx(3.8576308052616097) q[92];
-rx(3.8576308052616097) q[96];
-ry(pi/2) q[97];
-rx(pi) q[97];
-cx q[1],q[97];
-rz(0.9174338957155904) q[97];
-cx q[1],q[97];
-cx q[7],q[97];
-rz(0.9174338957155904) q[97];
-cx q[7],q[97];
-rx(3.8576308052616097) q[97];
-ry(pi/2) q[98];
-rx(pi) q[98];
-cx q[10],q[98];
-rz(0.9174338957155904) q[98];
-cx q[10],q[98];
-rx(3.8576308052616097) q[10];
-cx q[21],q[98];
-rz(0.9174338957155904) q[98];
-cx q[21],q[98];
-rx(3.8576308052616097) q[98];
-ry(pi/2) q[99];
-rx(pi) q[99];
-cx q[4],q[99];
-rz(0.9174338957155904) q[99];
-cx q[4],q[99];
-cx q[41],q[99];
-rz(0.9174338957155904) q[99];
-cx q[41],q[99];
-rx(3.8576308052616097) q[41];
-rx(3.8576308052616097) q[99];
-ry(pi/2) q[100];
-rx(pi) q[100];
-cx q[3],q[100];
-rz(0.9174338957155904) q[100];
-cx q[3],q[100];
-cx q[25],q[100];
-rz(0.9174338957155904) q[100];
-cx q[25],q[100];
-rx(3.8576308052616097) q[25];
-rx(3.8576308052616097) q[100];
-ry(pi/2) q[101];
-rx(pi) q[101];
-cx q[16],q[101];
-rz(0.9174338957155904) q[101];
-cx q[16],q[101];
-cx q[50],q[101];
-rz(0.9174338957155904) q[101];
-cx q[50],q[101];
-rx(3.8576308052616097) q[50];
-rx(3.8576308052616097) q[101];
-ry(pi/2) q[102];
-rx(pi) q[102];
-cx q[3],q[102];
-rz(0.9174338957155904) q[102];
-cx q[3],q[102];
-cx q[4],q[102];
-rz(0.9174338957155904) q[102];
-cx q[4],q[102];
-rx(3.8576308052616097) q[4];
-rx(3.8576308052616097) q[102];
-ry(pi/2) q[103];
-rx(pi) q[103];
-cx q[16],q[103];
-rz(0.9174338957155904) q[103];
-cx q[16],q[103];
-rx(3.8576308052616097) q[16];
-cx q[57],q[103];
-rz(0.9174338957155904) q[103];
-cx q[57],q[103];
-rx(3.8576308052616097) q[57];
-rx(3.8576308052616097) q[103];
-ry(pi/2) q[104];
-rx(pi) q[104];
-cx q[7],q[104];
-rz(0.9174338957155904) q[104];
-cx q[7],q[104];
-rx(3.8576308052616097) q[7];
-cx q[13],q[104];
-rz(0.9174338957155904) q[104];
-cx q[13],q[104];
-rx(3.8576308052616097) q[13];
-ry(pi/2) q[105];
-rx(pi) q[105];
-cx q[26],q[105];
-rz(0.9174338957155904) q[105];
-cx q[26],q[105];
-rx(3.8576308052616097) q[26];
-cx q[28],q[105];
-rz(0.9174338957155904) q[105];
-cx q[28],q[105];
-rx(3.8576308052616097) q[28];
-rx(3.8576308052616097) q[105];
-ry(pi/2) q[106];
-rx(pi) q[106];
-cx q[5],q[106];
-rz(0.9174338957155904) q[106];
-cx q[5],q[106];
-cx q[36],q[106];
-rz(0.9174338957155904) q[106];
-cx q[36],q[106];
-rx(3.8576308052616097) q[106];
-ry(pi/2) q[107];
-rx(pi) q[107];
-cx q[3],q[107];
-rz(0.9174338957155904) q[107];
-cx q[3],q[107];
-cx q[31],q[107];
-rz(0.9174338957155904) q[107];
-cx q[31],q[107];
-rx(3.8576308052616097) q[107];
-ry(pi/2) q[108];
-rx(pi) q[108];
-cx q[15],q[108];
-rz(0.9174338957155904) q[108];
-cx q[15],q[108];
-rx(3.8576308052616097) q[15];
-cx q[31],q[108];
-rz(0.9174338957155904) q[108];
-cx q[31],q[108];
-rx(3.8576308052616097) q[31];
-rx(3.8576308052616097) q[108];
-ry(pi/2) q[109];
-rx(pi) q[109];
-cx q[5],q[109];
-rz(0.9174338957155904) q[109];
-cx q[5],q[109];
-rx(3.8576308052616097) q[5];
-cx q[39],q[109];
-rz(0.9174338957155904) q[109];
-cx q[39],q[109];
-rx(3.8576308052616097) q[39];
-rx(3.8576308052616097) q[109];
-ry(pi/2) q[110];
-rx(pi) q[110];
-cx q[3],q[110];
-rz(0.9174338957155904) q[110];
-cx q[3],q[110];
-cx q[24],q[110];
-rz(0.9174338957155904) q[110];
-cx q[24],q[110];
-rx(3.8576308052616097) q[24];
-ry(pi/2) q[111];
-rx(pi) q[111];
-cx q[3],q[111];
-rz(0.9174338957155904) q[111];
-cx q[3],q[111];
-cx q[21],q[111];
-rz(0.9174338957155904) q[111];
-cx q[21],q[111];
-rx(3.8576308052616097) q[111];
-ry(pi/2) q[112];
-rx(pi) q[112];
-cx q[21],q[112];
-rz(0.9174338957155904) q[112];
-cx q[21],q[112];
-rx(3.8576308052616097) q[21];
-cx q[36],q[112];
-rz(0.9174338957155904) q[112];
-cx q[36],q[112];
-rx(3.8576308052616097) q[36];
-rx(3.8576308052616097) q[112];
-ry(pi/2) q[113];
-rx(pi) q[113];
-cx q[1],q[113];
-rz(0.9174338957155904) q[113];
-cx q[1],q[113];
-rx(3.8576308052616097) q[1];
-cx q[0],q[1];
-rz(0.8963600250031072) q[1];
-cx q[0],q[1];
-cx q[0],q[2];
-rz(0.8963600250031072) q[2];
-cx q[0],q[2];
-cx q[2],q[89];
-cx q[3],q[113];
-rz(0.8963600250031072) q[89];
-cx q[2],q[89];
-rx(4.6110634833564665) q[2];
-rz(0.9174338957155904) q[113];
-cx q[3],q[113];
-rx(3.8576308052616097) q[3];
-cx q[0],q[3];
-rz(0.8963600250031072) q[3];
-cx q[0],q[3];
-cx q[0],q[15];
-cx q[1],q[3];
-rz(0.8963600250031072) q[3];
-cx q[1],q[3];
-cx q[1],q[4];
-rz(0.8963600250031072) q[4];
-cx q[1],q[4];
-cx q[1],q[5];
-cx q[3],q[4];
-rz(0.8963600250031072) q[4];
-cx q[3],q[4];
-cx q[4],q[6];
-rz(0.8963600250031072) q[5];
-cx q[1],q[5];
-cx q[1],q[9];
-cx q[3],q[5];
-rz(0.8963600250031072) q[5];
-cx q[3],q[5];
-cx q[3],q[7];
-rz(0.8963600250031072) q[6];
-cx q[4],q[6];
-cx q[5],q[6];
-rz(0.8963600250031072) q[6];
-cx q[5],q[6];
-rz(0.8963600250031072) q[7];
-cx q[3],q[7];
-cx q[3],q[8];
-cx q[4],q[7];
-rz(0.8963600250031072) q[7];
-cx q[4],q[7];
-cx q[4],q[10];
-rz(0.8963600250031072) q[8];
-cx q[3],q[8];
-cx q[5],q[8];
-rz(0.8963600250031072) q[8];
-cx q[5],q[8];
-cx q[5],q[11];
-cx q[8],q[83];
-rz(0.8963600250031072) q[9];
-cx q[1],q[9];
-cx q[1],q[17];
-cx q[3],q[9];
-rz(0.8963600250031072) q[9];
-cx q[3],q[9];
-cx q[3],q[12];
-rz(0.8963600250031072) q[10];
-cx q[4],q[10];
-cx q[4],q[13];
-cx q[6],q[10];
-rz(0.8963600250031072) q[10];
-cx q[6],q[10];
-cx q[10],q[37];
-rz(0.8963600250031072) q[11];
-cx q[5],q[11];
-cx q[6],q[11];
-rz(0.8963600250031072) q[11];
-cx q[6],q[11];
-rx(4.6110634833564665) q[11];
-rz(0.8963600250031072) q[12];
-cx q[3],q[12];
-cx q[3],q[14];
-cx q[5],q[12];
-rz(0.8963600250031072) q[12];
-cx q[5],q[12];
-rz(0.8963600250031072) q[13];
-cx q[4],q[13];
-cx q[5],q[13];
-rz(0.8963600250031072) q[13];
-cx q[5],q[13];
-rz(0.8963600250031072) q[14];
-cx q[3],q[14];
-cx q[4],q[14];
-rz(0.8963600250031072) q[14];
-cx q[4],q[14];
-rx(4.6110634833564665) q[14];
-rz(0.8963600250031072) q[15];
-cx q[0],q[15];
-cx q[0],q[16];
-cx q[3],q[15];
-rz(0.8963600250031072) q[15];
-cx q[3],q[15];
-rz(0.8963600250031072) q[16];
-cx q[0],q[16];
-cx q[0],q[20];
-cx q[3],q[16];
-rz(0.8963600250031072) q[16];
-cx q[3],q[16];
-rz(0.8963600250031072) q[17];
-cx q[1],q[17];
-cx q[1],q[28];
-cx q[3],q[17];
-rz(0.8963600250031072) q[17];
-cx q[3],q[17];
-cx q[3],q[18];
-rz(0.8963600250031072) q[18];
-cx q[3],q[18];
-cx q[3],q[19];
-cx q[4],q[18];
-rz(0.8963600250031072) q[18];
-cx q[4],q[18];
-cx q[4],q[21];
-rz(0.8963600250031072) q[19];
-cx q[3],q[19];
-cx q[3],q[22];
-cx q[7],q[19];
-rz(0.8963600250031072) q[19];
-cx q[7],q[19];
-cx q[19],q[38];
-rz(0.8963600250031072) q[20];
-cx q[0],q[20];
-cx q[0],q[32];
-cx q[15],q[20];
-rz(0.8963600250031072) q[20];
-cx q[15],q[20];
-rz(0.8963600250031072) q[21];
-cx q[4],q[21];
-cx q[4],q[27];
-cx q[15],q[21];
-rz(0.8963600250031072) q[21];
-cx q[15],q[21];
-cx q[15],q[36];
-rz(0.8963600250031072) q[22];
-cx q[3],q[22];
-cx q[3],q[23];
-cx q[9],q[22];
-rz(0.8963600250031072) q[22];
-cx q[9],q[22];
-cx q[9],q[55];
-rx(4.6110634833564665) q[22];
-rz(0.8963600250031072) q[23];
-cx q[3],q[23];
-cx q[3],q[24];
-cx q[17],q[23];
-rz(0.8963600250031072) q[23];
-cx q[17],q[23];
-rz(0.8963600250031072) q[24];
-cx q[3],q[24];
-cx q[3],q[25];
-cx q[5],q[24];
-rz(0.8963600250031072) q[24];
-cx q[5],q[24];
-cx q[5],q[33];
-cx q[24],q[54];
-rz(0.8963600250031072) q[25];
-cx q[3],q[25];
-cx q[3],q[26];
-cx q[12],q[25];
-rz(0.8963600250031072) q[25];
-cx q[12],q[25];
-cx q[12],q[31];
-rz(0.8963600250031072) q[26];
-cx q[3],q[26];
-cx q[21],q[26];
-rz(0.8963600250031072) q[26];
-cx q[21],q[26];
-rz(0.8963600250031072) q[27];
-cx q[4],q[27];
-cx q[4],q[47];
-cx q[6],q[27];
-rz(0.8963600250031072) q[27];
-cx q[6],q[27];
-cx q[6],q[69];
-rz(0.8963600250031072) q[28];
-cx q[1],q[28];
-cx q[1],q[29];
-cx q[3],q[28];
-rz(0.8963600250031072) q[28];
-cx q[3],q[28];
-rz(0.8963600250031072) q[29];
-cx q[1],q[29];
-cx q[1],q[45];
-cx q[3],q[29];
-rz(0.8963600250031072) q[29];
-cx q[3],q[29];
-cx q[3],q[30];
-rx(4.6110634833564665) q[29];
-rz(0.8963600250031072) q[30];
-cx q[3],q[30];
-cx q[3],q[34];
-cx q[18],q[30];
-rz(0.8963600250031072) q[30];
-cx q[18],q[30];
-rx(4.6110634833564665) q[18];
-rz(0.8963600250031072) q[31];
-cx q[12],q[31];
-cx q[26],q[31];
-rz(0.8963600250031072) q[31];
-cx q[26],q[31];
-cx q[26],q[105];
-rz(0.8963600250031072) q[32];
-cx q[0],q[32];
-cx q[0],q[42];
-cx q[21],q[32];
-rz(0.8963600250031072) q[32];
-cx q[21],q[32];
-rz(0.8963600250031072) q[33];
-cx q[5],q[33];
-cx q[5],q[46];
-cx q[30],q[33];
-rz(0.8963600250031072) q[33];
-cx q[30],q[33];
-rx(4.6110634833564665) q[33];
-rz(0.8963600250031072) q[34];
-cx q[3],q[34];
-cx q[3],q[35];
-cx q[12],q[34];
-rz(0.8963600250031072) q[34];
-cx q[12],q[34];
-rz(0.8963600250031072) q[35];
-cx q[3],q[35];
-cx q[3],q[39];
-cx q[32],q[35];
-rz(0.8963600250031072) q[35];
-cx q[32],q[35];
-rx(4.6110634833564665) q[35];
-rz(0.8963600250031072) q[36];
-cx q[15],q[36];
-cx q[20],q[36];
-rz(0.8963600250031072) q[36];
-cx q[20],q[36];
-cx q[36],q[94];
-rz(0.8963600250031072) q[37];
-cx q[10],q[37];
-cx q[10],q[41];
-cx q[34],q[37];
-rz(0.8963600250031072) q[37];
-cx q[34],q[37];
-rx(4.6110634833564665) q[34];
-cx q[37],q[85];
-rz(0.8963600250031072) q[38];
-cx q[19],q[38];
-rx(4.6110634833564665) q[19];
-cx q[21],q[38];
-rz(0.8963600250031072) q[38];
-cx q[21],q[38];
-rz(0.8963600250031072) q[39];
-cx q[3],q[39];
-cx q[3],q[40];
-cx q[13],q[39];
-rz(0.8963600250031072) q[39];
-cx q[13],q[39];
-cx q[13],q[56];
-rz(0.8963600250031072) q[40];
-cx q[3],q[40];
-cx q[23],q[40];
-rz(0.8963600250031072) q[40];
-cx q[23],q[40];
-rx(4.6110634833564665) q[40];
-rz(0.8963600250031072) q[41];
-cx q[10],q[41];
-cx q[27],q[41];
-rz(0.8963600250031072) q[41];
-cx q[27],q[41];
-cx q[27],q[72];
-cx q[41],q[67];
-rz(0.8963600250031072) q[42];
-cx q[0],q[42];
-cx q[0],q[48];
-cx q[3],q[42];
-rz(0.8963600250031072) q[42];
-cx q[3],q[42];
-cx q[3],q[43];
-cx q[42],q[78];
-rz(0.8963600250031072) q[43];
-cx q[3],q[43];
-cx q[3],q[44];
-cx q[20],q[43];
-rz(0.8963600250031072) q[43];
-cx q[20],q[43];
-rx(4.6110634833564665) q[20];
-rx(4.6110634833564665) q[43];
-rz(0.8963600250031072) q[44];
-cx q[3],q[44];
-cx q[3],q[49];
-cx q[12],q[44];
-rz(0.8963600250031072) q[44];
-cx q[12],q[44];
-rz(0.8963600250031072) q[45];
-cx q[1],q[45];
-cx q[1],q[57];
-cx q[16],q[45];
-rz(0.8963600250031072) q[45];
-cx q[16],q[45];
-cx q[16],q[59];
-rz(0.8963600250031072) q[46];
-cx q[5],q[46];
-cx q[5],q[65];
-cx q[38],q[46];
-rz(0.8963600250031072) q[46];
-cx q[38],q[46];
-rx(4.6110634833564665) q[38];
-rx(4.6110634833564665) q[46];
-rz(0.8963600250031072) q[47];
-cx q[4],q[47];
-cx q[17],q[47];
-rz(0.8963600250031072) q[47];
-cx q[17],q[47];
-cx q[17],q[53];
-rz(0.8963600250031072) q[48];
-cx q[0],q[48];
-cx q[0],q[51];
-cx q[30],q[48];
-rz(0.8963600250031072) q[48];
-cx q[30],q[48];
-rx(4.6110634833564665) q[48];
-rz(0.8963600250031072) q[49];
-cx q[3],q[49];
-cx q[3],q[50];
-cx q[4],q[49];
-rz(0.8963600250031072) q[49];
-cx q[4],q[49];
-cx q[4],q[61];
-rx(4.6110634833564665) q[49];
-rz(0.8963600250031072) q[50];
-cx q[3],q[50];
-cx q[3],q[52];
-cx q[12],q[50];
-rz(0.8963600250031072) q[50];
-cx q[12],q[50];
-cx q[12],q[63];
-rz(0.8963600250031072) q[51];
-cx q[0],q[51];
-cx q[0],q[62];
-cx q[28],q[51];
-rz(0.8963600250031072) q[51];
-cx q[28],q[51];
-rx(4.6110634833564665) q[51];
-rz(0.8963600250031072) q[52];
-cx q[3],q[52];
-cx q[10],q[52];
-rz(0.8963600250031072) q[52];
-cx q[10],q[52];
-rx(4.6110634833564665) q[52];
-rz(0.8963600250031072) q[53];
-cx q[17],q[53];
-cx q[21],q[53];
-rz(0.8963600250031072) q[53];
-cx q[21],q[53];
-rz(0.8963600250031072) q[54];
-cx q[24],q[54];
-cx q[24],q[58];
-cx q[28],q[54];
-rz(0.8963600250031072) q[54];
-cx q[28],q[54];
-rx(4.6110634833564665) q[54];
-rz(0.8963600250031072) q[55];
-cx q[9],q[55];
-cx q[9],q[80];
-cx q[15],q[55];
-rz(0.8963600250031072) q[55];
-cx q[15],q[55];
-rz(0.8963600250031072) q[56];
-cx q[13],q[56];
-cx q[13],q[68];
-cx q[45],q[56];
-rz(0.8963600250031072) q[56];
-cx q[45],q[56];
-rx(4.6110634833564665) q[45];
-rz(0.8963600250031072) q[57];
-cx q[1],q[57];
-cx q[1],q[60];
-cx q[3],q[57];
-rz(0.8963600250031072) q[57];
-cx q[3],q[57];
-cx q[3],q[70];
-rz(0.8963600250031072) q[58];
-cx q[24],q[58];
-cx q[24],q[86];
-cx q[28],q[58];
-rz(0.8963600250031072) q[58];
-cx q[28],q[58];
-cx q[28],q[87];
-rx(4.6110634833564665) q[58];
-rz(0.8963600250031072) q[59];
-cx q[16],q[59];
-cx q[16],q[73];
-cx q[32],q[59];
-rz(0.8963600250031072) q[59];
-cx q[32],q[59];
-rz(0.8963600250031072) q[60];
-cx q[1],q[60];
-cx q[1],q[97];
-cx q[7],q[60];
-rz(0.8963600250031072) q[60];
-cx q[7],q[60];
-rz(0.8963600250031072) q[61];
-cx q[4],q[61];
-cx q[4],q[99];
-cx q[7],q[61];
-rz(0.8963600250031072) q[61];
-cx q[7],q[61];
-rx(4.6110634833564665) q[61];
-rz(0.8963600250031072) q[62];
-cx q[0],q[62];
-cx q[0],q[64];
-cx q[17],q[62];
-rz(0.8963600250031072) q[62];
-cx q[17],q[62];
-rx(4.6110634833564665) q[62];
-rz(0.8963600250031072) q[63];
-cx q[12],q[63];
-rx(4.6110634833564665) q[12];
-cx q[17],q[63];
-rz(0.8963600250031072) q[63];
-cx q[17],q[63];
-cx q[17],q[66];
-rz(0.8963600250031072) q[64];
-cx q[0],q[64];
-cx q[0],q[75];
-cx q[10],q[64];
-rz(0.8963600250031072) q[64];
-cx q[10],q[64];
-cx q[10],q[98];
-rx(4.6110634833564665) q[64];
-rz(0.8963600250031072) q[65];
-cx q[5],q[65];
-cx q[5],q[76];
-cx q[23],q[65];
-rz(0.8963600250031072) q[65];
-cx q[23],q[65];
-rx(4.6110634833564665) q[23];
-rx(4.6110634833564665) q[65];
-rz(0.8963600250031072) q[66];
-cx q[17],q[66];
-rx(4.6110634833564665) q[17];
-cx q[47],q[66];
-rz(0.8963600250031072) q[66];
-cx q[47],q[66];
-rx(4.6110634833564665) q[47];
-rx(4.6110634833564665) q[66];
-rz(0.8963600250031072) q[67];
-cx q[41],q[67];
-cx q[56],q[67];
-rz(0.8963600250031072) q[67];
-cx q[56],q[67];
-cx q[56],q[74];
-rx(4.6110634833564665) q[67];
-rz(0.8963600250031072) q[68];
-cx q[13],q[68];
-cx q[32],q[68];
-rz(0.8963600250031072) q[68];
-cx q[32],q[68];
-rz(0.8963600250031072) q[69];
-cx q[6],q[69];
-cx q[59],q[69];
-rz(0.8963600250031072) q[69];
-cx q[59],q[69];
-rx(4.6110634833564665) q[69];
-rz(0.8963600250031072) q[70];
-cx q[3],q[70];
-cx q[3],q[71];
-cx q[15],q[70];
-rz(0.8963600250031072) q[70];
-cx q[15],q[70];
-cx q[70],q[84];
-rz(0.8963600250031072) q[71];
-cx q[3],q[71];
-cx q[3],q[77];
-cx q[53],q[71];
-rz(0.8963600250031072) q[71];
-cx q[53],q[71];
-rx(4.6110634833564665) q[71];
-rz(0.8963600250031072) q[72];
-cx q[27],q[72];
-cx q[44],q[72];
-rz(0.8963600250031072) q[72];
-cx q[44],q[72];
-rx(4.6110634833564665) q[44];
-rx(4.6110634833564665) q[72];
-rz(0.8963600250031072) q[73];
-cx q[16],q[73];
-cx q[16],q[101];
-cx q[59],q[73];
-rz(0.8963600250031072) q[73];
-cx q[59],q[73];
-rz(0.8963600250031072) q[74];
-cx q[56],q[74];
-cx q[63],q[74];
-rz(0.8963600250031072) q[74];
-cx q[63],q[74];
-rx(4.6110634833564665) q[63];
-rx(4.6110634833564665) q[74];
-rz(0.8963600250031072) q[75];
-cx q[0],q[75];
-cx q[0],q[82];
-cx q[21],q[75];
-rz(0.8963600250031072) q[75];
-cx q[21],q[75];
-cx q[21],q[81];
-rx(4.6110634833564665) q[75];
-rz(0.8963600250031072) q[76];
-cx q[5],q[76];
-cx q[5],q[89];
-cx q[6],q[76];
-rz(0.8963600250031072) q[76];
-cx q[6],q[76];
-cx q[6],q[79];
-rx(4.6110634833564665) q[76];
-rz(0.8963600250031072) q[77];
-cx q[3],q[77];
-cx q[3],q[88];
-cx q[30],q[77];
-rz(0.8963600250031072) q[77];
-cx q[30],q[77];
-rx(4.6110634833564665) q[30];
-rz(0.8963600250031072) q[78];
-cx q[42],q[78];
-rx(4.6110634833564665) q[42];
-cx q[60],q[78];
-rz(0.8963600250031072) q[78];
-cx q[60],q[78];
-rx(4.6110634833564665) q[78];
-rz(0.8963600250031072) q[79];
-cx q[6],q[79];
-cx q[50],q[79];
-rz(0.8963600250031072) q[79];
-cx q[50],q[79];
-rx(4.6110634833564665) q[79];
-rz(0.8963600250031072) q[80];
-cx q[9],q[80];
-rx(4.6110634833564665) q[9];
-cx q[15],q[80];
-rz(0.8963600250031072) q[80];
-cx q[15],q[80];
-cx q[15],q[90];
-rx(4.6110634833564665) q[80];
-rz(0.8963600250031072) q[81];
-cx q[21],q[81];
-cx q[77],q[81];
-rz(0.8963600250031072) q[81];
-cx q[77],q[81];
-rx(4.6110634833564665) q[77];
-rx(4.6110634833564665) q[81];
-rz(0.8963600250031072) q[82];
-cx q[0],q[82];
-cx q[0],q[91];
-cx q[56],q[82];
-rz(0.8963600250031072) q[82];
-cx q[56],q[82];
-cx q[56],q[96];
-rx(4.6110634833564665) q[82];
-rz(0.8963600250031072) q[83];
-cx q[8],q[83];
-rx(4.6110634833564665) q[8];
-cx q[68],q[83];
-rz(0.8963600250031072) q[83];
-cx q[68],q[83];
-rx(4.6110634833564665) q[68];
-rx(4.6110634833564665) q[83];
-rz(0.8963600250031072) q[84];
-cx q[70],q[84];
-rx(4.6110634833564665) q[70];
-cx q[73],q[84];
-rz(0.8963600250031072) q[84];
-cx q[73],q[84];
-rx(4.6110634833564665) q[73];
-rx(4.6110634833564665) q[84];
-rz(0.8963600250031072) q[85];
-cx q[37],q[85];
-rx(4.6110634833564665) q[37];
-cx q[59],q[85];
-rz(0.8963600250031072) q[85];
-cx q[59],q[85];
-rx(4.6110634833564665) q[59];
-rx(4.6110634833564665) q[85];
-rz(0.8963600250031072) q[86];
-cx q[24],q[86];
-cx q[53],q[86];
-rz(0.8963600250031072) q[86];
-cx q[53],q[86];
-rx(4.6110634833564665) q[53];
-rx(4.6110634833564665) q[86];
-rz(0.8963600250031072) q[87];
-cx q[28],q[87];
-cx q[32],q[87];
-rz(0.8963600250031072) q[87];
-cx q[32],q[87];
-rx(4.6110634833564665) q[87];
-rz(0.8963600250031072) q[88];
-cx q[3],q[88];
-cx q[3],q[100];
-cx q[60],q[88];
-rz(0.8963600250031072) q[88];
-cx q[60],q[88];
-rx(4.6110634833564665) q[60];
-rx(4.6110634833564665) q[88];
-rz(0.8963600250031072) q[89];
-cx q[5],q[89];
-cx q[5],q[95];
-rz(0.8963600250031072) q[90];
-cx q[15],q[90];
-cx q[15],q[92];
-cx q[27],q[90];
-rz(0.8963600250031072) q[90];
-cx q[27],q[90];
-rx(4.6110634833564665) q[90];
-rz(0.8963600250031072) q[91];
-cx q[0],q[91];
-cx q[0],q[93];
-cx q[6],q[91];
-rz(0.8963600250031072) q[91];
-cx q[6],q[91];
-rx(4.6110634833564665) q[6];
-rx(4.6110634833564665) q[91];
-rz(0.8963600250031072) q[92];
-cx q[15],q[92];
-cx q[15],q[108];
-cx q[89],q[92];
-rz(0.8963600250031072) q[92];
-cx q[89],q[92];
-rx(4.6110634833564665) q[89];
-rz(0.8963600250031072) q[93];
-cx q[0],q[93];
-rx(4.6110634833564665) q[0];
-cx q[32],q[93];
-rz(0.8963600250031072) q[93];
-cx q[32],q[93];
-rx(4.6110634833564665) q[32];
-rx(4.6110634833564665) q[93];
-rz(0.8963600250031072) q[94];
-cx q[36],q[94];
-cx q[55],q[94];
-rz(0.8963600250031072) q[94];
-cx q[55],q[94];
-rx(4.6110634833564665) q[55];
-rx(4.6110634833564665) q[94];
-rz(0.8963600250031072) q[95];
-cx q[5],q[95];
-cx q[5],q[106];
-cx q[27],q[95];
-rz(0.8963600250031072) q[95];
-cx q[27],q[95];
-rx(4.6110634833564665) q[27];
-rx(4.6110634833564665) q[95];
-rz(0.8963600250031072) q[96];
-cx q[56],q[96];
-rx(4.6110634833564665) q[56];
-cx q[92],q[96];
-rz(0.8963600250031072) q[96];
-cx q[92],q[96];
-rx(4.6110634833564665) q[92];
-rx(4.6110634833564665) q[96];
-rz(0.8963600250031072) q[97];
-cx q[1],q[97];
-cx q[7],q[97];
-rz(0.8963600250031072) q[97];
-cx q[7],q[97];
-rx(4.6110634833564665) q[97];
-rz(0.8963600250031072) q[98];
-cx q[10],q[98];
-rx(4.6110634833564665) q[10];
-cx q[21],q[98];
-rz(0.8963600250031072) q[98];
-cx q[21],q[98];
-rx(4.6110634833564665) q[98];
-rz(0.8963600250031072) q[99];
-cx q[4],q[99];
-cx q[41],q[99];
-rz(0.8963600250031072) q[99];
-cx q[41],q[99];
-rx(4.6110634833564665) q[41];
-rx(4.6110634833564665) q[99];
-rz(0.8963600250031072) q[100];
-cx q[3],q[100];
-cx q[3],q[102];
-cx q[25],q[100];
-rz(0.8963600250031072) q[100];
-cx q[25],q[100];
-rx(4.6110634833564665) q[25];
-rx(4.6110634833564665) q[100];
-rz(0.8963600250031072) q[101];
-cx q[16],q[101];
-cx q[16],q[103];
-cx q[50],q[101];
-rz(0.8963600250031072) q[101];
-cx q[50],q[101];
-rx(4.6110634833564665) q[50];
-rx(4.6110634833564665) q[101];
-rz(0.8963600250031072) q[102];
-cx q[3],q[102];
-cx q[3],q[107];
-cx q[4],q[102];
-rz(0.8963600250031072) q[102];
-cx q[4],q[102];
-rx(4.6110634833564665) q[4];
-rx(4.6110634833564665) q[102];
-rz(0.8963600250031072) q[103];
-cx q[16],q[103];
-rx(4.6110634833564665) q[16];
-cx q[57],q[103];
-rz(0.8963600250031072) q[103];
-cx q[57],q[103];
-rx(4.6110634833564665) q[57];
-rx(4.6110634833564665) q[103];
-rz(0.8963600250031072) q[105];
-cx q[26],q[105];
-rx(4.6110634833564665) q[26];
-cx q[28],q[105];
-rz(0.8963600250031072) q[105];
-cx q[28],q[105];
-rx(4.6110634833564665) q[28];
-rx(4.6110634833564665) q[105];
-rz(0.8963600250031072) q[106];
-cx q[5],q[106];
-cx q[5],q[109];
-cx q[36],q[106];
-rz(0.8963600250031072) q[106];
-cx q[36],q[106];
-rx(4.6110634833564665) q[106];
-rz(0.8963600250031072) q[107];
-cx q[3],q[107];
-cx q[31],q[107];
-rz(0.8963600250031072) q[107];
-cx q[31],q[107];
-rx(4.6110634833564665) q[107];
-rz(0.8963600250031072) q[108];
-cx q[15],q[108];
-rx(4.6110634833564665) q[15];
-cx q[31],q[108];
-rz(0.8963600250031072) q[108];
-cx q[31],q[108];
-rx(4.6110634833564665) q[31];
-rx(4.6110634833564665) q[108];
-rz(0.8963600250031072) q[109];
-cx q[5],q[109];
-rx(4.6110634833564665) q[5];
-cx q[39],q[109];
-rz(0.8963600250031072) q[109];
-cx q[39],q[109];
-rx(4.6110634833564665) q[39];
-rx(4.6110634833564665) q[109];
-rx(3.8576308052616097) q[113];
-cx q[1],q[113];
-rz(0.8963600250031072) q[113];
-cx q[1],q[113];
-rx(4.6110634833564665) q[1];
-cx q[0],q[1];
-rz(6.1991607121802526) q[1];
-cx q[0],q[1];
-cx q[0],q[2];
-rz(6.1991607121802526) q[2];
-cx q[0],q[2];
-cx q[2],q[89];
-rz(6.1991607121802526) q[89];
-cx q[2],q[89];
-rx(1.700632143232285) q[2];
-ry(pi/2) q[114];
-rx(pi) q[114];
-cx q[104],q[114];
-rz(0.9174338957155904) q[114];
-cx q[104],q[114];
-rx(3.8576308052616097) q[104];
-cx q[7],q[104];
-rz(0.8963600250031072) q[104];
-cx q[7],q[104];
-rx(4.6110634833564665) q[7];
-cx q[13],q[104];
-rz(0.8963600250031072) q[104];
-cx q[13],q[104];
-rx(4.6110634833564665) q[13];
-cx q[110],q[114];
-rz(0.9174338957155904) q[114];
-cx q[110],q[114];
-rx(3.8576308052616097) q[110];
-cx q[3],q[110];
-rz(0.8963600250031072) q[110];
-cx q[3],q[110];
-cx q[3],q[111];
-cx q[24],q[110];
-rz(0.8963600250031072) q[110];
-cx q[24],q[110];
-rx(4.6110634833564665) q[24];
-rz(0.8963600250031072) q[111];
-cx q[3],q[111];
-cx q[3],q[113];
-cx q[21],q[111];
-rz(0.8963600250031072) q[111];
-cx q[21],q[111];
-cx q[21],q[112];
-rx(4.6110634833564665) q[111];
-rz(0.8963600250031072) q[112];
-cx q[21],q[112];
-rx(4.6110634833564665) q[21];
-cx q[36],q[112];
-rz(0.8963600250031072) q[112];
-cx q[36],q[112];
-rx(4.6110634833564665) q[36];
-rx(4.6110634833564665) q[112];
-rz(0.8963600250031072) q[113];
-cx q[3],q[113];
-rx(4.6110634833564665) q[3];
-cx q[0],q[3];
-rz(6.1991607121802526) q[3];
-cx q[0],q[3];
-cx q[0],q[15];
-cx q[1],q[3];
-rz(6.1991607121802526) q[3];
-cx q[1],q[3];
-cx q[1],q[4];
-rz(6.1991607121802526) q[4];
-cx q[1],q[4];
-cx q[1],q[5];
-cx q[3],q[4];
-rz(6.1991607121802526) q[4];
-cx q[3],q[4];
-cx q[4],q[6];
-rz(6.1991607121802526) q[5];
-cx q[1],q[5];
-cx q[1],q[9];
-cx q[3],q[5];
-rz(6.1991607121802526) q[5];
-cx q[3],q[5];
-cx q[3],q[7];
-rz(6.1991607121802526) q[6];
-cx q[4],q[6];
-cx q[5],q[6];
-rz(6.1991607121802526) q[6];
-cx q[5],q[6];
-rz(6.1991607121802526) q[7];
-cx q[3],q[7];
-cx q[3],q[8];
-cx q[4],q[7];
-rz(6.1991607121802526) q[7];
-cx q[4],q[7];
-cx q[4],q[10];
-rz(6.1991607121802526) q[8];
-cx q[3],q[8];
-cx q[5],q[8];
-rz(6.1991607121802526) q[8];
-cx q[5],q[8];
-cx q[5],q[11];
-cx q[8],q[83];
-rz(6.1991607121802526) q[9];
-cx q[1],q[9];
-cx q[1],q[17];
-cx q[3],q[9];
-rz(6.1991607121802526) q[9];
-cx q[3],q[9];
-cx q[3],q[12];
-rz(6.1991607121802526) q[10];
-cx q[4],q[10];
-cx q[4],q[13];
-cx q[6],q[10];
-rz(6.1991607121802526) q[10];
-cx q[6],q[10];
-cx q[10],q[37];
-rz(6.1991607121802526) q[11];
-cx q[5],q[11];
-cx q[6],q[11];
-rz(6.1991607121802526) q[11];
-cx q[6],q[11];
-rx(1.700632143232285) q[11];
-rz(6.1991607121802526) q[12];
-cx q[3],q[12];
-cx q[3],q[14];
-cx q[5],q[12];
-rz(6.1991607121802526) q[12];
-cx q[5],q[12];
-rz(6.1991607121802526) q[13];
-cx q[4],q[13];
-cx q[5],q[13];
-rz(6.1991607121802526) q[13];
-cx q[5],q[13];
-rz(6.1991607121802526) q[14];
-cx q[3],q[14];
-cx q[4],q[14];
-rz(6.1991607121802526) q[14];
-cx q[4],q[14];
-rx(1.700632143232285) q[14];
-rz(6.1991607121802526) q[15];
-cx q[0],q[15];
-cx q[0],q[16];
-cx q[3],q[15];
-rz(6.1991607121802526) q[15];
-cx q[3],q[15];
-rz(6.1991607121802526) q[16];
-cx q[0],q[16];
-cx q[0],q[20];
-cx q[3],q[16];
-rz(6.1991607121802526) q[16];
-cx q[3],q[16];
-rz(6.1991607121802526) q[17];
-cx q[1],q[17];
-cx q[1],q[28];
-cx q[3],q[17];
-rz(6.1991607121802526) q[17];
-cx q[3],q[17];
-cx q[3],q[18];
-rz(6.1991607121802526) q[18];
-cx q[3],q[18];
-cx q[3],q[19];
-cx q[4],q[18];
-rz(6.1991607121802526) q[18];
-cx q[4],q[18];
-cx q[4],q[21];
-rz(6.1991607121802526) q[19];
-cx q[3],q[19];
-cx q[3],q[22];
-cx q[7],q[19];
-rz(6.1991607121802526) q[19];
-cx q[7],q[19];
-cx q[19],q[38];
-rz(6.1991607121802526) q[20];
-cx q[0],q[20];
-cx q[0],q[32];
-cx q[15],q[20];
-rz(6.1991607121802526) q[20];
-cx q[15],q[20];
-rz(6.1991607121802526) q[21];
-cx q[4],q[21];
-cx q[4],q[27];
-cx q[15],q[21];
-rz(6.1991607121802526) q[21];
-cx q[15],q[21];
-cx q[15],q[36];
-rz(6.1991607121802526) q[22];
-cx q[3],q[22];
-cx q[3],q[23];
-cx q[9],q[22];
-rz(6.1991607121802526) q[22];
-cx q[9],q[22];
-cx q[9],q[55];
-rx(1.700632143232285) q[22];
-rz(6.1991607121802526) q[23];
-cx q[3],q[23];
-cx q[3],q[24];
-cx q[17],q[23];
-rz(6.1991607121802526) q[23];
-cx q[17],q[23];
-rz(6.1991607121802526) q[24];
-cx q[3],q[24];
-cx q[3],q[25];
-cx q[5],q[24];
-rz(6.1991607121802526) q[24];
-cx q[5],q[24];
-cx q[5],q[33];
-cx q[24],q[54];
-rz(6.1991607121802526) q[25];
-cx q[3],q[25];
-cx q[3],q[26];
-cx q[12],q[25];
-rz(6.1991607121802526) q[25];
-cx q[12],q[25];
-cx q[12],q[31];
-rz(6.1991607121802526) q[26];
-cx q[3],q[26];
-cx q[21],q[26];
-rz(6.1991607121802526) q[26];
-cx q[21],q[26];
-rz(6.1991607121802526) q[27];
-cx q[4],q[27];
-cx q[4],q[47];
-cx q[6],q[27];
-rz(6.1991607121802526) q[27];
-cx q[6],q[27];
-cx q[6],q[69];
-rz(6.1991607121802526) q[28];
-cx q[1],q[28];
-cx q[1],q[29];
-cx q[3],q[28];
-rz(6.1991607121802526) q[28];
-cx q[3],q[28];
-rz(6.1991607121802526) q[29];
-cx q[1],q[29];
-cx q[1],q[45];
-cx q[3],q[29];
-rz(6.1991607121802526) q[29];
-cx q[3],q[29];
-cx q[3],q[30];
-rx(1.700632143232285) q[29];
-rz(6.1991607121802526) q[30];
-cx q[3],q[30];
-cx q[3],q[34];
-cx q[18],q[30];
-rz(6.1991607121802526) q[30];
-cx q[18],q[30];
-rx(1.700632143232285) q[18];
-rz(6.1991607121802526) q[31];
-cx q[12],q[31];
-cx q[26],q[31];
-rz(6.1991607121802526) q[31];
-cx q[26],q[31];
-cx q[26],q[105];
-rz(6.1991607121802526) q[32];
-cx q[0],q[32];
-cx q[0],q[42];
-cx q[21],q[32];
-rz(6.1991607121802526) q[32];
-cx q[21],q[32];
-rz(6.1991607121802526) q[33];
-cx q[5],q[33];
-cx q[5],q[46];
-cx q[30],q[33];
-rz(6.1991607121802526) q[33];
-cx q[30],q[33];
-rx(1.700632143232285) q[33];
-rz(6.1991607121802526) q[34];
-cx q[3],q[34];
-cx q[3],q[35];
-cx q[12],q[34];
-rz(6.1991607121802526) q[34];
-cx q[12],q[34];
-rz(6.1991607121802526) q[35];
-cx q[3],q[35];
-cx q[3],q[39];
-cx q[32],q[35];
-rz(6.1991607121802526) q[35];
-cx q[32],q[35];
-rx(1.700632143232285) q[35];
-rz(6.1991607121802526) q[36];
-cx q[15],q[36];
-cx q[20],q[36];
-rz(6.1991607121802526) q[36];
-cx q[20],q[36];
-cx q[36],q[94];
-rz(6.1991607121802526) q[37];
-cx q[10],q[37];
-cx q[10],q[41];
-cx q[34],q[37];
-rz(6.1991607121802526) q[37];
-cx q[34],q[37];
-rx(1.700632143232285) q[34];
-cx q[37],q[85];
-rz(6.1991607121802526) q[38];
-cx q[19],q[38];
-rx(1.700632143232285) q[19];
-cx q[21],q[38];
-rz(6.1991607121802526) q[38];
-cx q[21],q[38];
-rz(6.1991607121802526) q[39];
-cx q[3],q[39];
-cx q[3],q[40];
-cx q[13],q[39];
-rz(6.1991607121802526) q[39];
-cx q[13],q[39];
-cx q[13],q[56];
-rz(6.1991607121802526) q[40];
-cx q[3],q[40];
-cx q[23],q[40];
-rz(6.1991607121802526) q[40];
-cx q[23],q[40];
-rx(1.700632143232285) q[40];
-rz(6.1991607121802526) q[41];
-cx q[10],q[41];
-cx q[27],q[41];
-rz(6.1991607121802526) q[41];
-cx q[27],q[41];
-cx q[27],q[72];
-cx q[41],q[67];
-rz(6.1991607121802526) q[42];
-cx q[0],q[42];
-cx q[0],q[48];
-cx q[3],q[42];
-rz(6.1991607121802526) q[42];
-cx q[3],q[42];
-cx q[3],q[43];
-cx q[42],q[78];
-rz(6.1991607121802526) q[43];
-cx q[3],q[43];
-cx q[3],q[44];
-cx q[20],q[43];
-rz(6.1991607121802526) q[43];
-cx q[20],q[43];
-rx(1.700632143232285) q[20];
-rx(1.700632143232285) q[43];
-rz(6.1991607121802526) q[44];
-cx q[3],q[44];
-cx q[3],q[49];
-cx q[12],q[44];
-rz(6.1991607121802526) q[44];
-cx q[12],q[44];
-rz(6.1991607121802526) q[45];
-cx q[1],q[45];
-cx q[1],q[57];
-cx q[16],q[45];
-rz(6.1991607121802526) q[45];
-cx q[16],q[45];
-cx q[16],q[59];
-rz(6.1991607121802526) q[46];
-cx q[5],q[46];
-cx q[5],q[65];
-cx q[38],q[46];
-rz(6.1991607121802526) q[46];
-cx q[38],q[46];
-rx(1.700632143232285) q[38];
-rx(1.700632143232285) q[46];
-rz(6.1991607121802526) q[47];
-cx q[4],q[47];
-cx q[17],q[47];
-rz(6.1991607121802526) q[47];
-cx q[17],q[47];
-cx q[17],q[53];
-rz(6.1991607121802526) q[48];
-cx q[0],q[48];
-cx q[0],q[51];
-cx q[30],q[48];
-rz(6.1991607121802526) q[48];
-cx q[30],q[48];
-rx(1.700632143232285) q[48];
-rz(6.1991607121802526) q[49];
-cx q[3],q[49];
-cx q[3],q[50];
-cx q[4],q[49];
-rz(6.1991607121802526) q[49];
-cx q[4],q[49];
-cx q[4],q[61];
-rx(1.700632143232285) q[49];
-rz(6.1991607121802526) q[50];
-cx q[3],q[50];
-cx q[3],q[52];
-cx q[12],q[50];
-rz(6.1991607121802526) q[50];
-cx q[12],q[50];
-cx q[12],q[63];
-rz(6.1991607121802526) q[51];
-cx q[0],q[51];
-cx q[0],q[62];
-cx q[28],q[51];
-rz(6.1991607121802526) q[51];
-cx q[28],q[51];
-rx(1.700632143232285) q[51];
-rz(6.1991607121802526) q[52];
-cx q[3],q[52];
-cx q[10],q[52];
-rz(6.1991607121802526) q[52];
-cx q[10],q[52];
-rx(1.700632143232285) q[52];
-rz(6.1991607121802526) q[53];
-cx q[17],q[53];
-cx q[21],q[53];
-rz(6.1991607121802526) q[53];
-cx q[21],q[53];
-rz(6.1991607121802526) q[54];
-cx q[24],q[54];
-cx q[24],q[58];
-cx q[28],q[54];
-rz(6.1991607121802526) q[54];
-cx q[28],q[54];
-rx(1.700632143232285) q[54];
-rz(6.1991607121802526) q[55];
-cx q[9],q[55];
-cx q[9],q[80];
-cx q[15],q[55];
-rz(6.1991607121802526) q[55];
-cx q[15],q[55];
-rz(6.1991607121802526) q[56];
-cx q[13],q[56];
-cx q[13],q[68];
-cx q[45],q[56];
-rz(6.1991607121802526) q[56];
-cx q[45],q[56];
-rx(1.700632143232285) q[45];
-rz(6.1991607121802526) q[57];
-cx q[1],q[57];
-cx q[1],q[60];
-cx q[3],q[57];
-rz(6.1991607121802526) q[57];
-cx q[3],q[57];
-cx q[3],q[70];
-rz(6.1991607121802526) q[58];
-cx q[24],q[58];
-cx q[24],q[86];
-cx q[28],q[58];
-rz(6.1991607121802526) q[58];
-cx q[28],q[58];
-cx q[28],q[87];
-rx(1.700632143232285) q[58];
-rz(6.1991607121802526) q[59];
-cx q[16],q[59];
-cx q[16],q[73];
-cx q[32],q[59];
-rz(6.1991607121802526) q[59];
-cx q[32],q[59];
-rz(6.1991607121802526) q[60];
-cx q[1],q[60];
-cx q[1],q[97];
-cx q[7],q[60];
-rz(6.1991607121802526) q[60];
-cx q[7],q[60];
-rz(6.1991607121802526) q[61];
-cx q[4],q[61];
-cx q[4],q[99];
-cx q[7],q[61];
-rz(6.1991607121802526) q[61];
-cx q[7],q[61];
-rx(1.700632143232285) q[61];
-rz(6.1991607121802526) q[62];
-cx q[0],q[62];
-cx q[0],q[64];
-cx q[17],q[62];
-rz(6.1991607121802526) q[62];
-cx q[17],q[62];
-rx(1.700632143232285) q[62];
-rz(6.1991607121802526) q[63];
-cx q[12],q[63];
-rx(1.700632143232285) q[12];
-cx q[17],q[63];
-rz(6.1991607121802526) q[63];
-cx q[17],q[63];
-cx q[17],q[66];
-rz(6.1991607121802526) q[64];
-cx q[0],q[64];
-cx q[0],q[75];
-cx q[10],q[64];
-rz(6.1991607121802526) q[64];
-cx q[10],q[64];
-cx q[10],q[98];
-rx(1.700632143232285) q[64];
-rz(6.1991607121802526) q[65];
-cx q[5],q[65];
-cx q[5],q[76];
-cx q[23],q[65];
-rz(6.1991607121802526) q[65];
-cx q[23],q[65];
-rx(1.700632143232285) q[23];
-rx(1.700632143232285) q[65];
-rz(6.1991607121802526) q[66];
-cx q[17],q[66];
-rx(1.700632143232285) q[17];
-cx q[47],q[66];
-rz(6.1991607121802526) q[66];
-cx q[47],q[66];
-rx(1.700632143232285) q[47];
-rx(1.700632143232285) q[66];
-rz(6.1991607121802526) q[67];
-cx q[41],q[67];
-cx q[56],q[67];
-rz(6.1991607121802526) q[67];
-cx q[56],q[67];
-cx q[56],q[74];
-rx(1.700632143232285) q[67];
-rz(6.1991607121802526) q[68];
-cx q[13],q[68];
-cx q[32],q[68];
-rz(6.1991607121802526) q[68];
-cx q[32],q[68];
-rz(6.1991607121802526) q[69];
-cx q[6],q[69];
-cx q[59],q[69];
-rz(6.1991607121802526) q[69];
-cx q[59],q[69];
-rx(1.700632143232285) q[69];
-rz(6.1991607121802526) q[70];
-cx q[3],q[70];
-cx q[3],q[71];
-cx q[15],q[70];
-rz(6.1991607121802526) q[70];
-cx q[15],q[70];
-cx q[70],q[84];
-rz(6.1991607121802526) q[71];
-cx q[3],q[71];
-cx q[3],q[77];
-cx q[53],q[71];
-rz(6.1991607121802526) q[71];
-cx q[53],q[71];
-rx(1.700632143232285) q[71];
-rz(6.1991607121802526) q[72];
-cx q[27],q[72];
-cx q[44],q[72];
-rz(6.1991607121802526) q[72];
-cx q[44],q[72];
-rx(1.700632143232285) q[44];
-rx(1.700632143232285) q[72];
-rz(6.1991607121802526) q[73];
-cx q[16],q[73];
-cx q[16],q[101];
-cx q[59],q[73];
-rz(6.1991607121802526) q[73];
-cx q[59],q[73];
-rz(6.1991607121802526) q[74];
-cx q[56],q[74];
-cx q[63],q[74];
-rz(6.1991607121802526) q[74];
-cx q[63],q[74];
-rx(1.700632143232285) q[63];
-rx(1.700632143232285) q[74];
-rz(6.1991607121802526) q[75];
-cx q[0],q[75];
-cx q[0],q[82];
-cx q[21],q[75];
-rz(6.1991607121802526) q[75];
-cx q[21],q[75];
-cx q[21],q[81];
-rx(1.700632143232285) q[75];
-rz(6.1991607121802526) q[76];
-cx q[5],q[76];
-cx q[5],q[89];
-cx q[6],q[76];
-rz(6.1991607121802526) q[76];
-cx q[6],q[76];
-cx q[6],q[79];
-rx(1.700632143232285) q[76];
-rz(6.1991607121802526) q[77];
-cx q[3],q[77];
-cx q[3],q[88];
-cx q[30],q[77];
-rz(6.1991607121802526) q[77];
-cx q[30],q[77];
-rx(1.700632143232285) q[30];
-rz(6.1991607121802526) q[78];
-cx q[42],q[78];
-rx(1.700632143232285) q[42];
-cx q[60],q[78];
-rz(6.1991607121802526) q[78];
-cx q[60],q[78];
-rx(1.700632143232285) q[78];
-rz(6.1991607121802526) q[79];
-cx q[6],q[79];
-cx q[50],q[79];
-rz(6.1991607121802526) q[79];
-cx q[50],q[79];
-rx(1.700632143232285) q[79];
-rz(6.1991607121802526) q[80];
-cx q[9],q[80];
-rx(1.700632143232285) q[9];
-cx q[15],q[80];
-rz(6.1991607121802526) q[80];
-cx q[15],q[80];
-cx q[15],q[90];
-rx(1.700632143232285) q[80];
-rz(6.1991607121802526) q[81];
-cx q[21],q[81];
-cx q[77],q[81];
-rz(6.1991607121802526) q[81];
-cx q[77],q[81];
-rx(1.700632143232285) q[77];
-rx(1.700632143232285) q[81];
-rz(6.1991607121802526) q[82];
-cx q[0],q[82];
-cx q[0],q[91];
-cx q[56],q[82];
-rz(6.1991607121802526) q[82];
-cx q[56],q[82];
-cx q[56],q[96];
-rx(1.700632143232285) q[82];
-rz(6.1991607121802526) q[83];
-cx q[8],q[83];
-rx(1.700632143232285) q[8];
-cx q[68],q[83];
-rz(6.1991607121802526) q[83];
-cx q[68],q[83];
-rx(1.700632143232285) q[68];
-rx(1.700632143232285) q[83];
-rz(6.1991607121802526) q[84];
-cx q[70],q[84];
-rx(1.700632143232285) q[70];
-cx q[73],q[84];
-rz(6.1991607121802526) q[84];
-cx q[73],q[84];
-rx(1.700632143232285) q[73];
-rx(1.700632143232285) q[84];
-rz(6.1991607121802526) q[85];
-cx q[37],q[85];
-rx(1.700632143232285) q[37];
-cx q[59],q[85];
-rz(6.1991607121802526) q[85];
-cx q[59],q[85];
-rx(1.700632143232285) q[59];
-rx(1.700632143232285) q[85];
-rz(6.1991607121802526) q[86];
-cx q[24],q[86];
-cx q[53],q[86];
-rz(6.1991607121802526) q[86];
-cx q[53],q[86];
-rx(1.700632143232285) q[53];
-rx(1.700632143232285) q[86];
-rz(6.1991607121802526) q[87];
-cx q[28],q[87];
-cx q[32],q[87];
-rz(6.1991607121802526) q[87];
-cx q[32],q[87];
-rx(1.700632143232285) q[87];
-rz(6.1991607121802526) q[88];
-cx q[3],q[88];
-cx q[3],q[100];
-cx q[60],q[88];
-rz(6.1991607121802526) q[88];
-cx q[60],q[88];
-rx(1.700632143232285) q[60];
-rx(1.700632143232285) q[88];
-rz(6.1991607121802526) q[89];
-cx q[5],q[89];
-cx q[5],q[95];
-rz(6.1991607121802526) q[90];
-cx q[15],q[90];
-cx q[15],q[92];
-cx q[27],q[90];
-rz(6.1991607121802526) q[90];
-cx q[27],q[90];
-rx(1.700632143232285) q[90];
-rz(6.1991607121802526) q[91];
-cx q[0],q[91];
-cx q[0],q[93];
-cx q[6],q[91];
-rz(6.1991607121802526) q[91];
-cx q[6],q[91];
-rx(1.700632143232285) q[6];
-rx(1.700632143232285) q[91];
-rz(6.1991607121802526) q[92];
-cx q[15],q[92];
-cx q[15],q[108];
-cx q[89],q[92];
-rz(6.1991607121802526) q[92];
-cx q[89],q[92];
-rx(1.700632143232285) q[89];
-rz(6.1991607121802526) q[93];
-cx q[0],q[93];
-rx(1.700632143232285) q[0];
-cx q[32],q[93];
-rz(6.1991607121802526) q[93];
-cx q[32],q[93];
-rx(1.700632143232285) q[32];
-rx(1.700632143232285) q[93];
-rz(6.1991607121802526) q[94];
-cx q[36],q[94];
-cx q[55],q[94];
-rz(6.1991607121802526) q[94];
-cx q[55],q[94];
-rx(1.700632143232285) q[55];
-rx(1.700632143232285) q[94];
-rz(6.1991607121802526) q[95];
-cx q[5],q[95];
-cx q[5],q[106];
-cx q[27],q[95];
-rz(6.1991607121802526) q[95];
-cx q[27],q[95];
-rx(1.700632143232285) q[27];
-rx(1.700632143232285) q[95];
-rz(6.1991607121802526) q[96];
-cx q[56],q[96];
-rx(1.700632143232285) q[56];
-cx q[92],q[96];
-rz(6.1991607121802526) q[96];
-cx q[92],q[96];
-rx(1.700632143232285) q[92];
-rx(1.700632143232285) q[96];
-rz(6.1991607121802526) q[97];
-cx q[1],q[97];
-cx q[7],q[97];
-rz(6.1991607121802526) q[97];
-cx q[7],q[97];
-rx(1.700632143232285) q[97];
-rz(6.1991607121802526) q[98];
-cx q[10],q[98];
-rx(1.700632143232285) q[10];
-cx q[21],q[98];
-rz(6.1991607121802526) q[98];
-cx q[21],q[98];
-rx(1.700632143232285) q[98];
-rz(6.1991607121802526) q[99];
-cx q[4],q[99];
-cx q[41],q[99];
-rz(6.1991607121802526) q[99];
-cx q[41],q[99];
-rx(1.700632143232285) q[41];
-rx(1.700632143232285) q[99];
-rz(6.1991607121802526) q[100];
-cx q[3],q[100];
-cx q[3],q[102];
-cx q[25],q[100];
-rz(6.1991607121802526) q[100];
-cx q[25],q[100];
-rx(1.700632143232285) q[25];
-rx(1.700632143232285) q[100];
-rz(6.1991607121802526) q[101];
-cx q[16],q[101];
-cx q[16],q[103];
-cx q[50],q[101];
-rz(6.1991607121802526) q[101];
-cx q[50],q[101];
-rx(1.700632143232285) q[50];
-rx(1.700632143232285) q[101];
-rz(6.1991607121802526) q[102];
-cx q[3],q[102];
-cx q[3],q[107];
-cx q[4],q[102];
-rz(6.1991607121802526) q[102];
-cx q[4],q[102];
-rx(1.700632143232285) q[4];
-rx(1.700632143232285) q[102];
-rz(6.1991607121802526) q[103];
-cx q[16],q[103];
-rx(1.700632143232285) q[16];
-cx q[57],q[103];
-rz(6.1991607121802526) q[103];
-cx q[57],q[103];
-rx(1.700632143232285) q[57];
-rx(1.700632143232285) q[103];
-rz(6.1991607121802526) q[105];
-cx q[26],q[105];
-rx(1.700632143232285) q[26];
-cx q[28],q[105];
-rz(6.1991607121802526) q[105];
-cx q[28],q[105];
-rx(1.700632143232285) q[28];
-rx(1.700632143232285) q[105];
-rz(6.1991607121802526) q[106];
-cx q[5],q[106];
-cx q[5],q[109];
-cx q[36],q[106];
-rz(6.1991607121802526) q[106];
-cx q[36],q[106];
-rx(1.700632143232285) q[106];
-rz(6.1991607121802526) q[107];
-cx q[3],q[107];
-cx q[31],q[107];
-rz(6.1991607121802526) q[107];
-cx q[31],q[107];
-rx(1.700632143232285) q[107];
-rz(6.1991607121802526) q[108];
-cx q[15],q[108];
-rx(1.700632143232285) q[15];
-cx q[31],q[108];
-rz(6.1991607121802526) q[108];
-cx q[31],q[108];
-rx(1.700632143232285) q[31];
-rx(1.700632143232285) q[108];
-rz(6.1991607121802526) q[109];
-cx q[5],q[109];
-rx(1.700632143232285) q[5];
-cx q[39],q[109];
-rz(6.1991607121802526) q[109];
-cx q[39],q[109];
-rx(1.700632143232285) q[39];
-rx(1.700632143232285) q[109];
-rx(4.6110634833564665) q[113];
-cx q[1],q[113];
-rz(6.1991607121802526) q[113];
-cx q[1],q[113];
-rx(1.700632143232285) q[1];
-rx(3.8576308052616097) q[114];
-cx q[104],q[114];
-rz(0.8963600250031072) q[114];
-cx q[104],q[114];
-rx(4.6110634833564665) q[104];
-cx q[7],q[104];
-rz(6.1991607121802526) q[104];
-cx q[7],q[104];
-rx(1.700632143232285) q[7];
-cx q[13],q[104];
-rz(6.1991607121802526) q[104];
-cx q[13],q[104];
-rx(1.700632143232285) q[13];
-cx q[110],q[114];
-rz(0.8963600250031072) q[114];
-cx q[110],q[114];
-rx(4.6110634833564665) q[110];
-cx q[3],q[110];
-rz(6.1991607121802526) q[110];
-cx q[3],q[110];
-cx q[3],q[111];
-cx q[24],q[110];
-rz(6.1991607121802526) q[110];
-cx q[24],q[110];
-rx(1.700632143232285) q[24];
-rz(6.1991607121802526) q[111];
-cx q[3],q[111];
-cx q[3],q[113];
-cx q[21],q[111];
-rz(6.1991607121802526) q[111];
-cx q[21],q[111];
-cx q[21],q[112];
-rx(1.700632143232285) q[111];
-rz(6.1991607121802526) q[112];
-cx q[21],q[112];
-rx(1.700632143232285) q[21];
-cx q[36],q[112];
-rz(6.1991607121802526) q[112];
-cx q[36],q[112];
-rx(1.700632143232285) q[36];
-rx(1.700632143232285) q[112];
-rz(6.1991607121802526) q[113];
-cx q[3],q[113];
-rx(1.700632143232285) q[3];
-rx(1.700632143232285) q[113];
-rx(4.6110634833564665) q[114];
-cx q[104],q[114];
-rz(6.1991607121802526) q[114];
-cx q[104],q[114];
-rx(1.700632143232285) q[104];
-cx q[110],q[114];
-rz(6.1991607121802526) q[114];
-cx q[110],q[114];
-rx(1.700632143232285) q[110];
-rx(1.700632143232285) q[114];
\ No newline at end of file
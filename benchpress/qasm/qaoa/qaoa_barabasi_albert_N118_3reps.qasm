@@ -1,2681 +0,0 @@
-OPENQASM 2.0;
-include "qelib1.inc";
-qreg q[118];
-ry(pi/2) q[0];
-rx(pi) q[0];
-ry(pi/2) q[1];
-rx(pi) q[1];
-cx q[0],q[1];
-rz(5.814702176590749) q[1];
-cx q[0],q[1];
-ry(pi/2) q[2];
-rx(pi) q[2];
-cx q[0],q[2];
-rz(5.814702176590749) q[2];
-cx q[0],q[2];
-ry(pi/2) q[3];
-rx(pi) q[3];
-cx q[0],q[3];
-rz(5.814702176590749) q[3];
-cx q[0],q[3];
-cx q[1],q[3];
-rz(5.814702176590749) q[3];
-cx q[1],q[3];
-ry(pi/2) q[4];
-rx(pi) q[4];
-cx q[1],q[4];
-rz(5.814702176590749) q[4];
-cx q[1],q[4];
-cx q[3],q[4];
-rz(5.814702176590749) q[4];
-cx q[3],q[4];
-ry(pi/2) q[5];
-rx(pi) q[5];
-cx q[1],q[5];
-rz(5.814702176590749) q[5];
-cx q[1],q[5];
-cx q[3],q[5];
-rz(5.814702176590749) q[5];
-cx q[3],q[5];
-ry(pi/2) q[6];
-rx(pi) q[6];
-cx q[4],q[6];
-rz(5.814702176590749) q[6];
-cx q[4],q[6];
-cx q[5],q[6];
-rz(5.814702176590749) q[6];
-cx q[5],q[6];
-ry(pi/2) q[7];
-rx(pi) q[7];
-cx q[3],q[7];
-rz(5.814702176590749) q[7];
-cx q[3],q[7];
-cx q[4],q[7];
-rz(5.814702176590749) q[7];
-cx q[4],q[7];
-ry(pi/2) q[8];
-rx(pi) q[8];
-cx q[3],q[8];
-rz(5.814702176590749) q[8];
-cx q[3],q[8];
-cx q[5],q[8];
-rz(5.814702176590749) q[8];
-cx q[5],q[8];
-ry(pi/2) q[9];
-rx(pi) q[9];
-cx q[1],q[9];
-rz(5.814702176590749) q[9];
-cx q[1],q[9];
-cx q[3],q[9];
-rz(5.814702176590749) q[9];
-cx q[3],q[9];
-ry(pi/2) q[10];
-rx(pi) q[10];
-cx q[4],q[10];
-rz(5.814702176590749) q[10];
-cx q[4],q[10];
-cx q[6],q[10];
-rz(5.814702176590749) q[10];
-cx q[6],q[10];
-ry(pi/2) q[11];
-rx(pi) q[11];
-cx q[5],q[11];
-rz(5.814702176590749) q[11];
-cx q[5],q[11];
-cx q[6],q[11];
-rz(5.814702176590749) q[11];
-cx q[6],q[11];
-rx(5.131992068896703) q[11];
-ry(pi/2) q[12];
-rx(pi) q[12];
-cx q[3],q[12];
-rz(5.814702176590749) q[12];
-cx q[3],q[12];
-cx q[5],q[12];
-rz(5.814702176590749) q[12];
-cx q[5],q[12];
-ry(pi/2) q[13];
-rx(pi) q[13];
-cx q[4],q[13];
-rz(5.814702176590749) q[13];
-cx q[4],q[13];
-cx q[5],q[13];
-rz(5.814702176590749) q[13];
-cx q[5],q[13];
-ry(pi/2) q[14];
-rx(pi) q[14];
-cx q[3],q[14];
-rz(5.814702176590749) q[14];
-cx q[3],q[14];
-cx q[4],q[14];
-rz(5.814702176590749) q[14];
-cx q[4],q[14];
-rx(5.131992068896703) q[14];
-ry(pi/2) q[15];
-rx(pi) q[15];
-cx q[0],q[15];
-rz(5.814702176590749) q[15];
-cx q[0],q[15];
-cx q[3],q[15];
-rz(5.814702176590749) q[15];
-cx q[3],q[15];
-ry(pi/2) q[16];
-rx(pi) q[16];
-cx q[0],q[16];
-rz(5.814702176590749) q[16];
-cx q[0],q[16];
-cx q[3],q[16];
-rz(5.814702176590749) q[16];
-cx q[3],q[16];
-ry(pi/2) q[17];
-rx(pi) q[17];
-cx q[1],q[17];
-rz(5.814702176590749) q[17];
-cx q[1],q[17];
-cx q[3],q[17];
-rz(5.814702176590749) q[17];
-cx q[3],q[17];
-ry(pi/2) q[18];
-rx(pi) q[18];
-cx q[3],q[18];
-rz(5.814702176590749) q[18];
-cx q[3],q[18];
-cx q[4],q[18];
-rz(5.814702176590749) q[18];
-cx q[4],q[18];
-ry(pi/2) q[19];
-rx(pi) q[19];
-cx q[3],q[19];
-rz(5.814702176590749) q[19];
-cx q[3],q[19];
-cx q[7],q[19];
-rz(5.814702176590749) q[19];
-cx q[7],q[19];
-ry(pi/2) q[20];
-rx(pi) q[20];
-cx q[0],q[20];
-rz(5.814702176590749) q[20];
-cx q[0],q[20];
-cx q[15],q[20];
-rz(5.814702176590749) q[20];
-cx q[15],q[20];
-ry(pi/2) q[21];
-rx(pi) q[21];
-cx q[4],q[21];
-rz(5.814702176590749) q[21];
-cx q[4],q[21];
-cx q[15],q[21];
-rz(5.814702176590749) q[21];
-cx q[15],q[21];
-ry(pi/2) q[22];
-rx(pi) q[22];
-cx q[3],q[22];
-rz(5.814702176590749) q[22];
-cx q[3],q[22];
-cx q[9],q[22];
-rz(5.814702176590749) q[22];
-cx q[9],q[22];
-rx(5.131992068896703) q[22];
-ry(pi/2) q[23];
-rx(pi) q[23];
-cx q[3],q[23];
-rz(5.814702176590749) q[23];
-cx q[3],q[23];
-cx q[17],q[23];
-rz(5.814702176590749) q[23];
-cx q[17],q[23];
-ry(pi/2) q[24];
-rx(pi) q[24];
-cx q[3],q[24];
-rz(5.814702176590749) q[24];
-cx q[3],q[24];
-cx q[5],q[24];
-rz(5.814702176590749) q[24];
-cx q[5],q[24];
-ry(pi/2) q[25];
-rx(pi) q[25];
-cx q[3],q[25];
-rz(5.814702176590749) q[25];
-cx q[3],q[25];
-cx q[12],q[25];
-rz(5.814702176590749) q[25];
-cx q[12],q[25];
-ry(pi/2) q[26];
-rx(pi) q[26];
-cx q[3],q[26];
-rz(5.814702176590749) q[26];
-cx q[3],q[26];
-cx q[21],q[26];
-rz(5.814702176590749) q[26];
-cx q[21],q[26];
-ry(pi/2) q[27];
-rx(pi) q[27];
-cx q[4],q[27];
-rz(5.814702176590749) q[27];
-cx q[4],q[27];
-cx q[6],q[27];
-rz(5.814702176590749) q[27];
-cx q[6],q[27];
-ry(pi/2) q[28];
-rx(pi) q[28];
-cx q[1],q[28];
-rz(5.814702176590749) q[28];
-cx q[1],q[28];
-cx q[3],q[28];
-rz(5.814702176590749) q[28];
-cx q[3],q[28];
-ry(pi/2) q[29];
-rx(pi) q[29];
-cx q[1],q[29];
-rz(5.814702176590749) q[29];
-cx q[1],q[29];
-cx q[3],q[29];
-rz(5.814702176590749) q[29];
-cx q[3],q[29];
-rx(5.131992068896703) q[29];
-ry(pi/2) q[30];
-rx(pi) q[30];
-cx q[3],q[30];
-rz(5.814702176590749) q[30];
-cx q[3],q[30];
-cx q[18],q[30];
-rz(5.814702176590749) q[30];
-cx q[18],q[30];
-rx(5.131992068896703) q[18];
-ry(pi/2) q[31];
-rx(pi) q[31];
-cx q[12],q[31];
-rz(5.814702176590749) q[31];
-cx q[12],q[31];
-cx q[26],q[31];
-rz(5.814702176590749) q[31];
-cx q[26],q[31];
-ry(pi/2) q[32];
-rx(pi) q[32];
-cx q[0],q[32];
-rz(5.814702176590749) q[32];
-cx q[0],q[32];
-cx q[21],q[32];
-rz(5.814702176590749) q[32];
-cx q[21],q[32];
-ry(pi/2) q[33];
-rx(pi) q[33];
-cx q[5],q[33];
-rz(5.814702176590749) q[33];
-cx q[5],q[33];
-cx q[30],q[33];
-rz(5.814702176590749) q[33];
-cx q[30],q[33];
-rx(5.131992068896703) q[33];
-ry(pi/2) q[34];
-rx(pi) q[34];
-cx q[3],q[34];
-rz(5.814702176590749) q[34];
-cx q[3],q[34];
-cx q[12],q[34];
-rz(5.814702176590749) q[34];
-cx q[12],q[34];
-ry(pi/2) q[35];
-rx(pi) q[35];
-cx q[3],q[35];
-rz(5.814702176590749) q[35];
-cx q[3],q[35];
-cx q[32],q[35];
-rz(5.814702176590749) q[35];
-cx q[32],q[35];
-rx(5.131992068896703) q[35];
-ry(pi/2) q[36];
-rx(pi) q[36];
-cx q[15],q[36];
-rz(5.814702176590749) q[36];
-cx q[15],q[36];
-cx q[20],q[36];
-rz(5.814702176590749) q[36];
-cx q[20],q[36];
-ry(pi/2) q[37];
-rx(pi) q[37];
-cx q[10],q[37];
-rz(5.814702176590749) q[37];
-cx q[10],q[37];
-cx q[34],q[37];
-rz(5.814702176590749) q[37];
-cx q[34],q[37];
-rx(5.131992068896703) q[34];
-ry(pi/2) q[38];
-rx(pi) q[38];
-cx q[19],q[38];
-rz(5.814702176590749) q[38];
-cx q[19],q[38];
-rx(5.131992068896703) q[19];
-cx q[21],q[38];
-rz(5.814702176590749) q[38];
-cx q[21],q[38];
-ry(pi/2) q[39];
-rx(pi) q[39];
-cx q[3],q[39];
-rz(5.814702176590749) q[39];
-cx q[3],q[39];
-cx q[13],q[39];
-rz(5.814702176590749) q[39];
-cx q[13],q[39];
-ry(pi/2) q[40];
-rx(pi) q[40];
-cx q[3],q[40];
-rz(5.814702176590749) q[40];
-cx q[3],q[40];
-cx q[23],q[40];
-rz(5.814702176590749) q[40];
-cx q[23],q[40];
-rx(5.131992068896703) q[40];
-ry(pi/2) q[41];
-rx(pi) q[41];
-cx q[10],q[41];
-rz(5.814702176590749) q[41];
-cx q[10],q[41];
-cx q[27],q[41];
-rz(5.814702176590749) q[41];
-cx q[27],q[41];
-ry(pi/2) q[42];
-rx(pi) q[42];
-cx q[0],q[42];
-rz(5.814702176590749) q[42];
-cx q[0],q[42];
-cx q[3],q[42];
-rz(5.814702176590749) q[42];
-cx q[3],q[42];
-ry(pi/2) q[43];
-rx(pi) q[43];
-cx q[3],q[43];
-rz(5.814702176590749) q[43];
-cx q[3],q[43];
-cx q[20],q[43];
-rz(5.814702176590749) q[43];
-cx q[20],q[43];
-rx(5.131992068896703) q[20];
-rx(5.131992068896703) q[43];
-ry(pi/2) q[44];
-rx(pi) q[44];
-cx q[3],q[44];
-rz(5.814702176590749) q[44];
-cx q[3],q[44];
-cx q[12],q[44];
-rz(5.814702176590749) q[44];
-cx q[12],q[44];
-ry(pi/2) q[45];
-rx(pi) q[45];
-cx q[1],q[45];
-rz(5.814702176590749) q[45];
-cx q[1],q[45];
-cx q[16],q[45];
-rz(5.814702176590749) q[45];
-cx q[16],q[45];
-ry(pi/2) q[46];
-rx(pi) q[46];
-cx q[5],q[46];
-rz(5.814702176590749) q[46];
-cx q[5],q[46];
-cx q[38],q[46];
-rz(5.814702176590749) q[46];
-cx q[38],q[46];
-rx(5.131992068896703) q[38];
-rx(5.131992068896703) q[46];
-ry(pi/2) q[47];
-rx(pi) q[47];
-cx q[4],q[47];
-rz(5.814702176590749) q[47];
-cx q[4],q[47];
-cx q[17],q[47];
-rz(5.814702176590749) q[47];
-cx q[17],q[47];
-ry(pi/2) q[48];
-rx(pi) q[48];
-cx q[0],q[48];
-rz(5.814702176590749) q[48];
-cx q[0],q[48];
-cx q[30],q[48];
-rz(5.814702176590749) q[48];
-cx q[30],q[48];
-rx(5.131992068896703) q[48];
-ry(pi/2) q[49];
-rx(pi) q[49];
-cx q[3],q[49];
-rz(5.814702176590749) q[49];
-cx q[3],q[49];
-cx q[4],q[49];
-rz(5.814702176590749) q[49];
-cx q[4],q[49];
-rx(5.131992068896703) q[49];
-ry(pi/2) q[50];
-rx(pi) q[50];
-cx q[3],q[50];
-rz(5.814702176590749) q[50];
-cx q[3],q[50];
-cx q[12],q[50];
-rz(5.814702176590749) q[50];
-cx q[12],q[50];
-ry(pi/2) q[51];
-rx(pi) q[51];
-cx q[0],q[51];
-rz(5.814702176590749) q[51];
-cx q[0],q[51];
-cx q[28],q[51];
-rz(5.814702176590749) q[51];
-cx q[28],q[51];
-rx(5.131992068896703) q[51];
-ry(pi/2) q[52];
-rx(pi) q[52];
-cx q[3],q[52];
-rz(5.814702176590749) q[52];
-cx q[3],q[52];
-cx q[10],q[52];
-rz(5.814702176590749) q[52];
-cx q[10],q[52];
-rx(5.131992068896703) q[52];
-ry(pi/2) q[53];
-rx(pi) q[53];
-cx q[17],q[53];
-rz(5.814702176590749) q[53];
-cx q[17],q[53];
-cx q[21],q[53];
-rz(5.814702176590749) q[53];
-cx q[21],q[53];
-ry(pi/2) q[54];
-rx(pi) q[54];
-cx q[24],q[54];
-rz(5.814702176590749) q[54];
-cx q[24],q[54];
-cx q[28],q[54];
-rz(5.814702176590749) q[54];
-cx q[28],q[54];
-rx(5.131992068896703) q[54];
-ry(pi/2) q[55];
-rx(pi) q[55];
-cx q[9],q[55];
-rz(5.814702176590749) q[55];
-cx q[9],q[55];
-cx q[15],q[55];
-rz(5.814702176590749) q[55];
-cx q[15],q[55];
-ry(pi/2) q[56];
-rx(pi) q[56];
-cx q[13],q[56];
-rz(5.814702176590749) q[56];
-cx q[13],q[56];
-cx q[45],q[56];
-rz(5.814702176590749) q[56];
-cx q[45],q[56];
-rx(5.131992068896703) q[45];
-ry(pi/2) q[57];
-rx(pi) q[57];
-cx q[1],q[57];
-rz(5.814702176590749) q[57];
-cx q[1],q[57];
-cx q[3],q[57];
-rz(5.814702176590749) q[57];
-cx q[3],q[57];
-ry(pi/2) q[58];
-rx(pi) q[58];
-cx q[24],q[58];
-rz(5.814702176590749) q[58];
-cx q[24],q[58];
-cx q[28],q[58];
-rz(5.814702176590749) q[58];
-cx q[28],q[58];
-rx(5.131992068896703) q[58];
-ry(pi/2) q[59];
-rx(pi) q[59];
-cx q[16],q[59];
-rz(5.814702176590749) q[59];
-cx q[16],q[59];
-cx q[32],q[59];
-rz(5.814702176590749) q[59];
-cx q[32],q[59];
-ry(pi/2) q[60];
-rx(pi) q[60];
-cx q[1],q[60];
-rz(5.814702176590749) q[60];
-cx q[1],q[60];
-cx q[7],q[60];
-rz(5.814702176590749) q[60];
-cx q[7],q[60];
-ry(pi/2) q[61];
-rx(pi) q[61];
-cx q[4],q[61];
-rz(5.814702176590749) q[61];
-cx q[4],q[61];
-cx q[7],q[61];
-rz(5.814702176590749) q[61];
-cx q[7],q[61];
-rx(5.131992068896703) q[61];
-ry(pi/2) q[62];
-rx(pi) q[62];
-cx q[0],q[62];
-rz(5.814702176590749) q[62];
-cx q[0],q[62];
-cx q[17],q[62];
-rz(5.814702176590749) q[62];
-cx q[17],q[62];
-rx(5.131992068896703) q[62];
-ry(pi/2) q[63];
-rx(pi) q[63];
-cx q[12],q[63];
-rz(5.814702176590749) q[63];
-cx q[12],q[63];
-rx(5.131992068896703) q[12];
-cx q[17],q[63];
-rz(5.814702176590749) q[63];
-cx q[17],q[63];
-ry(pi/2) q[64];
-rx(pi) q[64];
-cx q[0],q[64];
-rz(5.814702176590749) q[64];
-cx q[0],q[64];
-cx q[10],q[64];
-rz(5.814702176590749) q[64];
-cx q[10],q[64];
-rx(5.131992068896703) q[64];
-ry(pi/2) q[65];
-rx(pi) q[65];
-cx q[5],q[65];
-rz(5.814702176590749) q[65];
-cx q[5],q[65];
-cx q[23],q[65];
-rz(5.814702176590749) q[65];
-cx q[23],q[65];
-rx(5.131992068896703) q[23];
-rx(5.131992068896703) q[65];
-ry(pi/2) q[66];
-rx(pi) q[66];
-cx q[17],q[66];
-rz(5.814702176590749) q[66];
-cx q[17],q[66];
-rx(5.131992068896703) q[17];
-cx q[47],q[66];
-rz(5.814702176590749) q[66];
-cx q[47],q[66];
-rx(5.131992068896703) q[47];
-rx(5.131992068896703) q[66];
-ry(pi/2) q[67];
-rx(pi) q[67];
-cx q[41],q[67];
-rz(5.814702176590749) q[67];
-cx q[41],q[67];
-cx q[56],q[67];
-rz(5.814702176590749) q[67];
-cx q[56],q[67];
-rx(5.131992068896703) q[67];
-ry(pi/2) q[68];
-rx(pi) q[68];
-cx q[13],q[68];
-rz(5.814702176590749) q[68];
-cx q[13],q[68];
-cx q[32],q[68];
-rz(5.814702176590749) q[68];
-cx q[32],q[68];
-ry(pi/2) q[69];
-rx(pi) q[69];
-cx q[6],q[69];
-rz(5.814702176590749) q[69];
-cx q[6],q[69];
-cx q[59],q[69];
-rz(5.814702176590749) q[69];
-cx q[59],q[69];
-rx(5.131992068896703) q[69];
-ry(pi/2) q[70];
-rx(pi) q[70];
-cx q[3],q[70];
-rz(5.814702176590749) q[70];
-cx q[3],q[70];
-cx q[15],q[70];
-rz(5.814702176590749) q[70];
-cx q[15],q[70];
-ry(pi/2) q[71];
-rx(pi) q[71];
-cx q[3],q[71];
-rz(5.814702176590749) q[71];
-cx q[3],q[71];
-cx q[53],q[71];
-rz(5.814702176590749) q[71];
-cx q[53],q[71];
-rx(5.131992068896703) q[71];
-ry(pi/2) q[72];
-rx(pi) q[72];
-cx q[27],q[72];
-rz(5.814702176590749) q[72];
-cx q[27],q[72];
-cx q[44],q[72];
-rz(5.814702176590749) q[72];
-cx q[44],q[72];
-rx(5.131992068896703) q[44];
-rx(5.131992068896703) q[72];
-ry(pi/2) q[73];
-rx(pi) q[73];
-cx q[16],q[73];
-rz(5.814702176590749) q[73];
-cx q[16],q[73];
-cx q[59],q[73];
-rz(5.814702176590749) q[73];
-cx q[59],q[73];
-ry(pi/2) q[74];
-rx(pi) q[74];
-cx q[56],q[74];
-rz(5.814702176590749) q[74];
-cx q[56],q[74];
-cx q[63],q[74];
-rz(5.814702176590749) q[74];
-cx q[63],q[74];
-rx(5.131992068896703) q[63];
-rx(5.131992068896703) q[74];
-ry(pi/2) q[75];
-rx(pi) q[75];
-cx q[0],q[75];
-rz(5.814702176590749) q[75];
-cx q[0],q[75];
-cx q[21],q[75];
-rz(5.814702176590749) q[75];
-cx q[21],q[75];
-rx(5.131992068896703) q[75];
-ry(pi/2) q[76];
-rx(pi) q[76];
-cx q[5],q[76];
-rz(5.814702176590749) q[76];
-cx q[5],q[76];
-cx q[6],q[76];
-rz(5.814702176590749) q[76];
-cx q[6],q[76];
-rx(5.131992068896703) q[76];
-ry(pi/2) q[77];
-rx(pi) q[77];
-cx q[3],q[77];
-rz(5.814702176590749) q[77];
-cx q[3],q[77];
-cx q[30],q[77];
-rz(5.814702176590749) q[77];
-cx q[30],q[77];
-rx(5.131992068896703) q[30];
-ry(pi/2) q[78];
-rx(pi) q[78];
-cx q[42],q[78];
-rz(5.814702176590749) q[78];
-cx q[42],q[78];
-cx q[60],q[78];
-rz(5.814702176590749) q[78];
-cx q[60],q[78];
-rx(5.131992068896703) q[78];
-ry(pi/2) q[79];
-rx(pi) q[79];
-cx q[6],q[79];
-rz(5.814702176590749) q[79];
-cx q[6],q[79];
-cx q[50],q[79];
-rz(5.814702176590749) q[79];
-cx q[50],q[79];
-rx(5.131992068896703) q[79];
-ry(pi/2) q[80];
-rx(pi) q[80];
-cx q[9],q[80];
-rz(5.814702176590749) q[80];
-cx q[9],q[80];
-rx(5.131992068896703) q[9];
-cx q[15],q[80];
-rz(5.814702176590749) q[80];
-cx q[15],q[80];
-rx(5.131992068896703) q[80];
-ry(pi/2) q[81];
-rx(pi) q[81];
-cx q[21],q[81];
-rz(5.814702176590749) q[81];
-cx q[21],q[81];
-cx q[77],q[81];
-rz(5.814702176590749) q[81];
-cx q[77],q[81];
-rx(5.131992068896703) q[77];
-rx(5.131992068896703) q[81];
-ry(pi/2) q[82];
-rx(pi) q[82];
-cx q[0],q[82];
-rz(5.814702176590749) q[82];
-cx q[0],q[82];
-cx q[56],q[82];
-rz(5.814702176590749) q[82];
-cx q[56],q[82];
-rx(5.131992068896703) q[82];
-ry(pi/2) q[83];
-rx(pi) q[83];
-cx q[8],q[83];
-rz(5.814702176590749) q[83];
-cx q[8],q[83];
-rx(5.131992068896703) q[8];
-cx q[68],q[83];
-rz(5.814702176590749) q[83];
-cx q[68],q[83];
-rx(5.131992068896703) q[68];
-rx(5.131992068896703) q[83];
-ry(pi/2) q[84];
-rx(pi) q[84];
-cx q[70],q[84];
-rz(5.814702176590749) q[84];
-cx q[70],q[84];
-rx(5.131992068896703) q[70];
-cx q[73],q[84];
-rz(5.814702176590749) q[84];
-cx q[73],q[84];
-rx(5.131992068896703) q[73];
-rx(5.131992068896703) q[84];
-ry(pi/2) q[85];
-rx(pi) q[85];
-cx q[37],q[85];
-rz(5.814702176590749) q[85];
-cx q[37],q[85];
-rx(5.131992068896703) q[37];
-cx q[59],q[85];
-rz(5.814702176590749) q[85];
-cx q[59],q[85];
-rx(5.131992068896703) q[59];
-rx(5.131992068896703) q[85];
-ry(pi/2) q[86];
-rx(pi) q[86];
-cx q[24],q[86];
-rz(5.814702176590749) q[86];
-cx q[24],q[86];
-cx q[53],q[86];
-rz(5.814702176590749) q[86];
-cx q[53],q[86];
-rx(5.131992068896703) q[53];
-rx(5.131992068896703) q[86];
-ry(pi/2) q[87];
-rx(pi) q[87];
-cx q[28],q[87];
-rz(5.814702176590749) q[87];
-cx q[28],q[87];
-cx q[32],q[87];
-rz(5.814702176590749) q[87];
-cx q[32],q[87];
-rx(5.131992068896703) q[87];
-ry(pi/2) q[88];
-rx(pi) q[88];
-cx q[3],q[88];
-rz(5.814702176590749) q[88];
-cx q[3],q[88];
-cx q[60],q[88];
-rz(5.814702176590749) q[88];
-cx q[60],q[88];
-rx(5.131992068896703) q[60];
-rx(5.131992068896703) q[88];
-ry(pi/2) q[89];
-rx(pi) q[89];
-cx q[2],q[89];
-rz(5.814702176590749) q[89];
-cx q[2],q[89];
-rx(5.131992068896703) q[2];
-cx q[5],q[89];
-rz(5.814702176590749) q[89];
-cx q[5],q[89];
-ry(pi/2) q[90];
-rx(pi) q[90];
-cx q[15],q[90];
-rz(5.814702176590749) q[90];
-cx q[15],q[90];
-cx q[27],q[90];
-rz(5.814702176590749) q[90];
-cx q[27],q[90];
-rx(5.131992068896703) q[90];
-ry(pi/2) q[91];
-rx(pi) q[91];
-cx q[0],q[91];
-rz(5.814702176590749) q[91];
-cx q[0],q[91];
-cx q[6],q[91];
-rz(5.814702176590749) q[91];
-cx q[6],q[91];
-rx(5.131992068896703) q[6];
-rx(5.131992068896703) q[91];
-ry(pi/2) q[92];
-rx(pi) q[92];
-cx q[15],q[92];
-rz(5.814702176590749) q[92];
-cx q[15],q[92];
-cx q[89],q[92];
-rz(5.814702176590749) q[92];
-cx q[89],q[92];
-rx(5.131992068896703) q[89];
-ry(pi/2) q[93];
-rx(pi) q[93];
-cx q[0],q[93];
-rz(5.814702176590749) q[93];
-cx q[0],q[93];
-rx(5.131992068896703) q[0];
-cx q[32],q[93];
-rz(5.814702176590749) q[93];
-cx q[32],q[93];
-rx(5.131992068896703) q[93];
-ry(pi/2) q[94];
-rx(pi) q[94];
-cx q[36],q[94];
-rz(5.814702176590749) q[94];
-cx q[36],q[94];
-cx q[55],q[94];
-rz(5.814702176590749) q[94];
-cx q[55],q[94];
-rx(5.131992068896703) q[55];
-rx(5.131992068896703) q[94];
-ry(pi/2) q[95];
-rx(pi) q[95];
-cx q[5],q[95];
-rz(5.814702176590749) q[95];
-cx q[5],q[95];
-cx q[27],q[95];
-rz(5.814702176590749) q[95];
-cx q[27],q[95];
-rx(5.131992068896703) q[27];
-rx(5.131992068896703) q[95];
-ry(pi/2) q[96];
-rx(pi) q[96];
-cx q[56],q[96];
-rz(5.814702176590749) q[96];
-cx q[56],q[96];
-rx(5.131992068896703) q[56];
-cx q[92],q[96];
-rz(5.814702176590749) q[96];
-cx q[92],q[96];
-rx(5.131992068896703) q[96];
-ry(pi/2) q[97];
-rx(pi) q[97];
-cx q[1],q[97];
-rz(5.814702176590749) q[97];
-cx q[1],q[97];
-cx q[7],q[97];
-rz(5.814702176590749) q[97];
-cx q[7],q[97];
-rx(5.131992068896703) q[97];
-ry(pi/2) q[98];
-rx(pi) q[98];
-cx q[10],q[98];
-rz(5.814702176590749) q[98];
-cx q[10],q[98];
-rx(5.131992068896703) q[10];
-cx q[21],q[98];
-rz(5.814702176590749) q[98];
-cx q[21],q[98];
-rx(5.131992068896703) q[98];
-ry(pi/2) q[99];
-rx(pi) q[99];
-cx q[4],q[99];
-rz(5.814702176590749) q[99];
-cx q[4],q[99];
-cx q[41],q[99];
-rz(5.814702176590749) q[99];
-cx q[41],q[99];
-rx(5.131992068896703) q[41];
-rx(5.131992068896703) q[99];
-ry(pi/2) q[100];
-rx(pi) q[100];
-cx q[3],q[100];
-rz(5.814702176590749) q[100];
-cx q[3],q[100];
-cx q[25],q[100];
-rz(5.814702176590749) q[100];
-cx q[25],q[100];
-rx(5.131992068896703) q[25];
-rx(5.131992068896703) q[100];
-ry(pi/2) q[101];
-rx(pi) q[101];
-cx q[16],q[101];
-rz(5.814702176590749) q[101];
-cx q[16],q[101];
-cx q[50],q[101];
-rz(5.814702176590749) q[101];
-cx q[50],q[101];
-rx(5.131992068896703) q[50];
-rx(5.131992068896703) q[101];
-ry(pi/2) q[102];
-rx(pi) q[102];
-cx q[3],q[102];
-rz(5.814702176590749) q[102];
-cx q[3],q[102];
-cx q[4],q[102];
-rz(5.814702176590749) q[102];
-cx q[4],q[102];
-rx(5.131992068896703) q[4];
-rx(5.131992068896703) q[102];
-ry(pi/2) q[103];
-rx(pi) q[103];
-cx q[16],q[103];
-rz(5.814702176590749) q[103];
-cx q[16],q[103];
-rx(5.131992068896703) q[16];
-cx q[57],q[103];
-rz(5.814702176590749) q[103];
-cx q[57],q[103];
-rx(5.131992068896703) q[57];
-rx(5.131992068896703) q[103];
-ry(pi/2) q[104];
-rx(pi) q[104];
-cx q[7],q[104];
-rz(5.814702176590749) q[104];
-cx q[7],q[104];
-rx(5.131992068896703) q[7];
-cx q[13],q[104];
-rz(5.814702176590749) q[104];
-cx q[13],q[104];
-rx(5.131992068896703) q[13];
-ry(pi/2) q[105];
-rx(pi) q[105];
-cx q[26],q[105];
-rz(5.814702176590749) q[105];
-cx q[26],q[105];
-cx q[28],q[105];
-rz(5.814702176590749) q[105];
-cx q[28],q[105];
-rx(5.131992068896703) q[105];
-ry(pi/2) q[106];
-rx(pi) q[106];
-cx q[5],q[106];
-rz(5.814702176590749) q[106];
-cx q[5],q[106];
-cx q[36],q[106];
-rz(5.814702176590749) q[106];
-cx q[36],q[106];
-rx(5.131992068896703) q[106];
-ry(pi/2) q[107];
-rx(pi) q[107];
-cx q[3],q[107];
-rz(5.814702176590749) q[107];
-cx q[3],q[107];
-cx q[31],q[107];
-rz(5.814702176590749) q[107];
-cx q[31],q[107];
-rx(5.131992068896703) q[107];
-ry(pi/2) q[108];
-rx(pi) q[108];
-cx q[15],q[108];
-rz(5.814702176590749) q[108];
-cx q[15],q[108];
-cx q[31],q[108];
-rz(5.814702176590749) q[108];
-cx q[31],q[108];
-rx(5.131992068896703) q[31];
-rx(5.131992068896703) q[108];
-ry(pi/2) q[109];
-rx(pi) q[109];
-cx q[5],q[109];
-rz(5.814702176590749) q[109];
-cx q[5],q[109];
-rx(5.131992068896703) q[5];
-cx q[39],q[109];
-rz(5.814702176590749) q[109];
-cx q[39],q[109];
-rx(5.131992068896703) q[39];
-rx(5.131992068896703) q[109];
-ry(pi/2) q[110];
-rx(pi) q[110];
-cx q[3],q[110];
-rz(5.814702176590749) q[110];
-cx q[3],q[110];
-cx q[24],q[110];
-rz(5.814702176590749) q[110];
-cx q[24],q[110];
-rx(5.131992068896703) q[24];
-ry(pi/2) q[111];
-rx(pi) q[111];
-cx q[3],q[111];
-rz(5.814702176590749) q[111];
-cx q[3],q[111];
-cx q[21],q[111];
-rz(5.814702176590749) q[111];
-cx q[21],q[111];
-rx(5.131992068896703) q[111];
-ry(pi/2) q[112];
-rx(pi) q[112];
-cx q[21],q[112];
-rz(5.814702176590749) q[112];
-cx q[21],q[112];
-rx(5.131992068896703) q[21];
-cx q[36],q[112];
-rz(5.814702176590749) q[112];
-cx q[36],q[112];
-rx(5.131992068896703) q[36];
-rx(5.131992068896703) q[112];
-ry(pi/2) q[113];
-rx(pi) q[113];
-cx q[1],q[113];
-rz(5.814702176590749) q[113];
-cx q[1],q[113];
-rx(5.131992068896703) q[1];
-cx q[0],q[1];
-rz(3.3044396690702524) q[1];
-cx q[0],q[1];
-cx q[0],q[2];
-rz(3.3044396690702524) q[2];
-cx q[0],q[2];
-cx q[2],q[89];
-cx q[3],q[113];
-rz(3.3044396690702524) q[89];
-cx q[2],q[89];
-rx(0.24816772030626383) q[2];
-rz(5.814702176590749) q[113];
-cx q[3],q[113];
-rx(5.131992068896703) q[3];
-cx q[0],q[3];
-rz(3.3044396690702524) q[3];
-cx q[0],q[3];
-cx q[1],q[3];
-rz(3.3044396690702524) q[3];
-cx q[1],q[3];
-cx q[1],q[4];
-rz(3.3044396690702524) q[4];
-cx q[1],q[4];
-cx q[1],q[5];
-cx q[3],q[4];
-rz(3.3044396690702524) q[4];
-cx q[3],q[4];
-cx q[4],q[6];
-rz(3.3044396690702524) q[5];
-cx q[1],q[5];
-cx q[1],q[9];
-cx q[3],q[5];
-rz(3.3044396690702524) q[5];
-cx q[3],q[5];
-cx q[3],q[7];
-rz(3.3044396690702524) q[6];
-cx q[4],q[6];
-cx q[5],q[6];
-rz(3.3044396690702524) q[6];
-cx q[5],q[6];
-rz(3.3044396690702524) q[7];
-cx q[3],q[7];
-cx q[3],q[8];
-cx q[4],q[7];
-rz(3.3044396690702524) q[7];
-cx q[4],q[7];
-cx q[4],q[10];
-rz(3.3044396690702524) q[8];
-cx q[3],q[8];
-cx q[5],q[8];
-rz(3.3044396690702524) q[8];
-cx q[5],q[8];
-cx q[5],q[11];
-cx q[8],q[83];
-rz(3.3044396690702524) q[9];
-cx q[1],q[9];
-cx q[1],q[17];
-cx q[3],q[9];
-rz(3.3044396690702524) q[9];
-cx q[3],q[9];
-cx q[3],q[12];
-rz(3.3044396690702524) q[10];
-cx q[4],q[10];
-cx q[4],q[13];
-cx q[6],q[10];
-rz(3.3044396690702524) q[10];
-cx q[6],q[10];
-cx q[10],q[37];
-rz(3.3044396690702524) q[11];
-cx q[5],q[11];
-cx q[6],q[11];
-rz(3.3044396690702524) q[11];
-cx q[6],q[11];
-rx(0.24816772030626383) q[11];
-rz(3.3044396690702524) q[12];
-cx q[3],q[12];
-cx q[3],q[14];
-cx q[5],q[12];
-rz(3.3044396690702524) q[12];
-cx q[5],q[12];
-rz(3.3044396690702524) q[13];
-cx q[4],q[13];
-cx q[5],q[13];
-rz(3.3044396690702524) q[13];
-cx q[5],q[13];
-rz(3.3044396690702524) q[14];
-cx q[3],q[14];
-cx q[4],q[14];
-rz(3.3044396690702524) q[14];
-cx q[4],q[14];
-rx(0.24816772030626383) q[14];
-rz(3.3044396690702524) q[17];
-cx q[1],q[17];
-rz(3.3044396690702524) q[37];
-cx q[10],q[37];
-cx q[10],q[41];
-rz(3.3044396690702524) q[41];
-cx q[10],q[41];
-rz(3.3044396690702524) q[83];
-cx q[8],q[83];
-rx(0.24816772030626383) q[8];
-rx(5.131992068896703) q[113];
-ry(pi/2) q[114];
-rx(pi) q[114];
-cx q[104],q[114];
-rz(5.814702176590749) q[114];
-cx q[104],q[114];
-rx(5.131992068896703) q[104];
-cx q[110],q[114];
-rz(5.814702176590749) q[114];
-cx q[110],q[114];
-rx(5.131992068896703) q[110];
-rx(5.131992068896703) q[114];
-ry(pi/2) q[115];
-rx(pi) q[115];
-cx q[15],q[115];
-rz(5.814702176590749) q[115];
-cx q[15],q[115];
-rx(5.131992068896703) q[15];
-cx q[0],q[15];
-rz(3.3044396690702524) q[15];
-cx q[0],q[15];
-cx q[0],q[16];
-cx q[3],q[15];
-rz(3.3044396690702524) q[15];
-cx q[3],q[15];
-rz(3.3044396690702524) q[16];
-cx q[0],q[16];
-cx q[0],q[20];
-cx q[3],q[16];
-rz(3.3044396690702524) q[16];
-cx q[3],q[16];
-cx q[3],q[17];
-rz(3.3044396690702524) q[17];
-cx q[3],q[17];
-cx q[3],q[18];
-rz(3.3044396690702524) q[18];
-cx q[3],q[18];
-cx q[3],q[19];
-cx q[4],q[18];
-rz(3.3044396690702524) q[18];
-cx q[4],q[18];
-cx q[4],q[21];
-rz(3.3044396690702524) q[19];
-cx q[3],q[19];
-cx q[3],q[22];
-cx q[7],q[19];
-rz(3.3044396690702524) q[19];
-cx q[7],q[19];
-cx q[19],q[38];
-rz(3.3044396690702524) q[20];
-cx q[0],q[20];
-cx q[15],q[20];
-rz(3.3044396690702524) q[20];
-cx q[15],q[20];
-rz(3.3044396690702524) q[21];
-cx q[4],q[21];
-cx q[4],q[27];
-cx q[15],q[21];
-rz(3.3044396690702524) q[21];
-cx q[15],q[21];
-cx q[15],q[36];
-rz(3.3044396690702524) q[22];
-cx q[3],q[22];
-cx q[3],q[23];
-cx q[9],q[22];
-rz(3.3044396690702524) q[22];
-cx q[9],q[22];
-cx q[9],q[55];
-rx(0.24816772030626383) q[22];
-rz(3.3044396690702524) q[23];
-cx q[3],q[23];
-cx q[3],q[24];
-cx q[17],q[23];
-rz(3.3044396690702524) q[23];
-cx q[17],q[23];
-rz(3.3044396690702524) q[24];
-cx q[3],q[24];
-cx q[3],q[25];
-cx q[5],q[24];
-rz(3.3044396690702524) q[24];
-cx q[5],q[24];
-cx q[5],q[33];
-cx q[24],q[54];
-rz(3.3044396690702524) q[25];
-cx q[3],q[25];
-cx q[12],q[25];
-rz(3.3044396690702524) q[25];
-cx q[12],q[25];
-cx q[12],q[31];
-rz(3.3044396690702524) q[27];
-cx q[4],q[27];
-cx q[4],q[47];
-cx q[6],q[27];
-rz(3.3044396690702524) q[27];
-cx q[6],q[27];
-cx q[6],q[69];
-cx q[27],q[41];
-rz(3.3044396690702524) q[31];
-cx q[12],q[31];
-rz(3.3044396690702524) q[33];
-cx q[5],q[33];
-cx q[5],q[46];
-rz(3.3044396690702524) q[36];
-cx q[15],q[36];
-cx q[20],q[36];
-rz(3.3044396690702524) q[36];
-cx q[20],q[36];
-cx q[36],q[94];
-rz(3.3044396690702524) q[38];
-cx q[19],q[38];
-rx(0.24816772030626383) q[19];
-rz(3.3044396690702524) q[41];
-cx q[27],q[41];
-cx q[27],q[72];
-cx q[41],q[67];
-rz(3.3044396690702524) q[46];
-cx q[5],q[46];
-cx q[5],q[65];
-rz(3.3044396690702524) q[47];
-cx q[4],q[47];
-cx q[17],q[47];
-rz(3.3044396690702524) q[47];
-cx q[17],q[47];
-cx q[17],q[53];
-rz(3.3044396690702524) q[53];
-cx q[17],q[53];
-rz(3.3044396690702524) q[54];
-cx q[24],q[54];
-cx q[24],q[58];
-rz(3.3044396690702524) q[55];
-cx q[9],q[55];
-cx q[9],q[80];
-cx q[15],q[55];
-rz(3.3044396690702524) q[55];
-cx q[15],q[55];
-rz(3.3044396690702524) q[58];
-cx q[24],q[58];
-cx q[24],q[86];
-rz(3.3044396690702524) q[65];
-cx q[5],q[65];
-cx q[5],q[76];
-rz(3.3044396690702524) q[67];
-cx q[41],q[67];
-rz(3.3044396690702524) q[69];
-cx q[6],q[69];
-rz(3.3044396690702524) q[72];
-cx q[27],q[72];
-rz(3.3044396690702524) q[76];
-cx q[5],q[76];
-cx q[5],q[89];
-cx q[6],q[76];
-rz(3.3044396690702524) q[76];
-cx q[6],q[76];
-cx q[6],q[79];
-rx(0.24816772030626383) q[76];
-rz(3.3044396690702524) q[79];
-cx q[6],q[79];
-rz(3.3044396690702524) q[80];
-cx q[9],q[80];
-rx(0.24816772030626383) q[9];
-rz(3.3044396690702524) q[86];
-cx q[24],q[86];
-rz(3.3044396690702524) q[89];
-cx q[5],q[89];
-cx q[5],q[95];
-cx q[92],q[115];
-rz(3.3044396690702524) q[94];
-cx q[36],q[94];
-cx q[55],q[94];
-rz(3.3044396690702524) q[94];
-cx q[55],q[94];
-rx(0.24816772030626383) q[55];
-rx(0.24816772030626383) q[94];
-rz(3.3044396690702524) q[95];
-cx q[5],q[95];
-cx q[5],q[106];
-rz(3.3044396690702524) q[106];
-cx q[5],q[106];
-cx q[5],q[109];
-cx q[36],q[106];
-rz(3.3044396690702524) q[106];
-cx q[36],q[106];
-rx(0.24816772030626383) q[106];
-rz(3.3044396690702524) q[109];
-cx q[5],q[109];
-rx(0.24816772030626383) q[5];
-rz(5.814702176590749) q[115];
-cx q[92],q[115];
-rx(5.131992068896703) q[92];
-rx(5.131992068896703) q[115];
-ry(pi/2) q[116];
-rx(pi) q[116];
-cx q[28],q[116];
-rz(5.814702176590749) q[116];
-cx q[28],q[116];
-rx(5.131992068896703) q[28];
-cx q[1],q[28];
-rz(3.3044396690702524) q[28];
-cx q[1],q[28];
-cx q[1],q[29];
-rz(3.3044396690702524) q[29];
-cx q[1],q[29];
-cx q[1],q[45];
-cx q[42],q[116];
-rz(3.3044396690702524) q[45];
-cx q[1],q[45];
-cx q[1],q[57];
-cx q[16],q[45];
-rz(3.3044396690702524) q[45];
-cx q[16],q[45];
-cx q[16],q[59];
-rz(3.3044396690702524) q[57];
-cx q[1],q[57];
-cx q[1],q[60];
-rz(3.3044396690702524) q[59];
-cx q[16],q[59];
-cx q[16],q[73];
-rz(3.3044396690702524) q[60];
-cx q[1],q[60];
-cx q[1],q[97];
-cx q[7],q[60];
-rz(3.3044396690702524) q[60];
-cx q[7],q[60];
-rz(3.3044396690702524) q[73];
-cx q[16],q[73];
-cx q[16],q[101];
-rz(3.3044396690702524) q[97];
-cx q[1],q[97];
-cx q[1],q[113];
-rz(3.3044396690702524) q[101];
-cx q[16],q[101];
-cx q[16],q[103];
-rz(3.3044396690702524) q[103];
-cx q[16],q[103];
-rx(0.24816772030626383) q[16];
-rz(3.3044396690702524) q[113];
-cx q[1],q[113];
-rx(0.24816772030626383) q[1];
-rz(5.814702176590749) q[116];
-cx q[42],q[116];
-rx(5.131992068896703) q[42];
-rx(5.131992068896703) q[116];
-ry(pi/2) q[117];
-rx(pi) q[117];
-cx q[26],q[117];
-rz(5.814702176590749) q[117];
-cx q[26],q[117];
-rx(5.131992068896703) q[26];
-cx q[3],q[26];
-rz(3.3044396690702524) q[26];
-cx q[3],q[26];
-cx q[3],q[28];
-cx q[21],q[26];
-rz(3.3044396690702524) q[26];
-cx q[21],q[26];
-cx q[26],q[31];
-rz(3.3044396690702524) q[28];
-cx q[3],q[28];
-cx q[3],q[29];
-rz(3.3044396690702524) q[29];
-cx q[3],q[29];
-cx q[3],q[30];
-rx(0.24816772030626383) q[29];
-rz(3.3044396690702524) q[30];
-cx q[3],q[30];
-cx q[3],q[34];
-cx q[18],q[30];
-rz(3.3044396690702524) q[30];
-cx q[18],q[30];
-rx(0.24816772030626383) q[18];
-cx q[30],q[33];
-rz(3.3044396690702524) q[31];
-cx q[26],q[31];
-cx q[26],q[105];
-cx q[32],q[117];
-rz(3.3044396690702524) q[33];
-cx q[30],q[33];
-rx(0.24816772030626383) q[33];
-rz(3.3044396690702524) q[34];
-cx q[3],q[34];
-cx q[3],q[35];
-cx q[12],q[34];
-rz(3.3044396690702524) q[34];
-cx q[12],q[34];
-cx q[34],q[37];
-rz(3.3044396690702524) q[35];
-cx q[3],q[35];
-cx q[3],q[39];
-rz(3.3044396690702524) q[37];
-cx q[34],q[37];
-rx(0.24816772030626383) q[34];
-cx q[37],q[85];
-rz(3.3044396690702524) q[39];
-cx q[3],q[39];
-cx q[3],q[40];
-cx q[13],q[39];
-rz(3.3044396690702524) q[39];
-cx q[13],q[39];
-cx q[13],q[56];
-cx q[39],q[109];
-rz(3.3044396690702524) q[40];
-cx q[3],q[40];
-cx q[23],q[40];
-rz(3.3044396690702524) q[40];
-cx q[23],q[40];
-cx q[23],q[65];
-rx(0.24816772030626383) q[40];
-rz(3.3044396690702524) q[56];
-cx q[13],q[56];
-cx q[13],q[68];
-cx q[45],q[56];
-rz(3.3044396690702524) q[56];
-cx q[45],q[56];
-rx(0.24816772030626383) q[45];
-cx q[56],q[67];
-rz(3.3044396690702524) q[65];
-cx q[23],q[65];
-rx(0.24816772030626383) q[23];
-rx(0.24816772030626383) q[65];
-rz(3.3044396690702524) q[67];
-cx q[56],q[67];
-cx q[56],q[74];
-rx(0.24816772030626383) q[67];
-rz(3.3044396690702524) q[68];
-cx q[13],q[68];
-rz(3.3044396690702524) q[74];
-cx q[56],q[74];
-rz(3.3044396690702524) q[85];
-cx q[37],q[85];
-rx(0.24816772030626383) q[37];
-rz(3.3044396690702524) q[105];
-cx q[26],q[105];
-rz(3.3044396690702524) q[109];
-cx q[39],q[109];
-rx(0.24816772030626383) q[39];
-rx(0.24816772030626383) q[109];
-rz(5.814702176590749) q[117];
-cx q[32],q[117];
-rx(5.131992068896703) q[32];
-cx q[0],q[32];
-rz(3.3044396690702524) q[32];
-cx q[0],q[32];
-cx q[0],q[42];
-cx q[21],q[32];
-rz(3.3044396690702524) q[32];
-cx q[21],q[32];
-cx q[21],q[38];
-cx q[32],q[35];
-rz(3.3044396690702524) q[35];
-cx q[32],q[35];
-cx q[32],q[59];
-rx(0.24816772030626383) q[35];
-rz(3.3044396690702524) q[38];
-cx q[21],q[38];
-cx q[21],q[53];
-cx q[38],q[46];
-rz(3.3044396690702524) q[42];
-cx q[0],q[42];
-cx q[0],q[48];
-cx q[3],q[42];
-rz(3.3044396690702524) q[42];
-cx q[3],q[42];
-cx q[3],q[43];
-cx q[42],q[78];
-rz(3.3044396690702524) q[43];
-cx q[3],q[43];
-cx q[3],q[44];
-cx q[20],q[43];
-rz(3.3044396690702524) q[43];
-cx q[20],q[43];
-rx(0.24816772030626383) q[20];
-rx(0.24816772030626383) q[43];
-rz(3.3044396690702524) q[44];
-cx q[3],q[44];
-cx q[3],q[49];
-cx q[12],q[44];
-rz(3.3044396690702524) q[44];
-cx q[12],q[44];
-cx q[44],q[72];
-rz(3.3044396690702524) q[46];
-cx q[38],q[46];
-rx(0.24816772030626383) q[38];
-rx(0.24816772030626383) q[46];
-rz(3.3044396690702524) q[48];
-cx q[0],q[48];
-cx q[0],q[51];
-cx q[30],q[48];
-rz(3.3044396690702524) q[48];
-cx q[30],q[48];
-rx(0.24816772030626383) q[48];
-rz(3.3044396690702524) q[49];
-cx q[3],q[49];
-cx q[3],q[50];
-cx q[4],q[49];
-rz(3.3044396690702524) q[49];
-cx q[4],q[49];
-cx q[4],q[61];
-rx(0.24816772030626383) q[49];
-rz(3.3044396690702524) q[50];
-cx q[3],q[50];
-cx q[3],q[52];
-cx q[12],q[50];
-rz(3.3044396690702524) q[50];
-cx q[12],q[50];
-cx q[12],q[63];
-cx q[50],q[79];
-rz(3.3044396690702524) q[51];
-cx q[0],q[51];
-cx q[0],q[62];
-cx q[28],q[51];
-rz(3.3044396690702524) q[51];
-cx q[28],q[51];
-cx q[28],q[54];
-rx(0.24816772030626383) q[51];
-rz(3.3044396690702524) q[52];
-cx q[3],q[52];
-cx q[3],q[57];
-cx q[10],q[52];
-rz(3.3044396690702524) q[52];
-cx q[10],q[52];
-rx(0.24816772030626383) q[52];
-rz(3.3044396690702524) q[53];
-cx q[21],q[53];
-rz(3.3044396690702524) q[54];
-cx q[28],q[54];
-cx q[28],q[58];
-rx(0.24816772030626383) q[54];
-rz(3.3044396690702524) q[57];
-cx q[3],q[57];
-cx q[3],q[70];
-cx q[57],q[103];
-rz(3.3044396690702524) q[58];
-cx q[28],q[58];
-cx q[28],q[87];
-rx(0.24816772030626383) q[58];
-rz(3.3044396690702524) q[59];
-cx q[32],q[59];
-cx q[32],q[68];
-cx q[59],q[69];
-rz(3.3044396690702524) q[61];
-cx q[4],q[61];
-cx q[4],q[99];
-cx q[7],q[61];
-rz(3.3044396690702524) q[61];
-cx q[7],q[61];
-cx q[7],q[97];
-rx(0.24816772030626383) q[61];
-rz(3.3044396690702524) q[62];
-cx q[0],q[62];
-cx q[0],q[64];
-cx q[17],q[62];
-rz(3.3044396690702524) q[62];
-cx q[17],q[62];
-rx(0.24816772030626383) q[62];
-rz(3.3044396690702524) q[63];
-cx q[12],q[63];
-rx(0.24816772030626383) q[12];
-cx q[17],q[63];
-rz(3.3044396690702524) q[63];
-cx q[17],q[63];
-cx q[17],q[66];
-cx q[63],q[74];
-rz(3.3044396690702524) q[64];
-cx q[0],q[64];
-cx q[0],q[75];
-cx q[10],q[64];
-rz(3.3044396690702524) q[64];
-cx q[10],q[64];
-cx q[10],q[98];
-rx(0.24816772030626383) q[64];
-rz(3.3044396690702524) q[66];
-cx q[17],q[66];
-rx(0.24816772030626383) q[17];
-cx q[47],q[66];
-rz(3.3044396690702524) q[66];
-cx q[47],q[66];
-rx(0.24816772030626383) q[47];
-rx(0.24816772030626383) q[66];
-rz(3.3044396690702524) q[68];
-cx q[32],q[68];
-cx q[68],q[83];
-rz(3.3044396690702524) q[69];
-cx q[59],q[69];
-cx q[59],q[73];
-rx(0.24816772030626383) q[69];
-rz(3.3044396690702524) q[70];
-cx q[3],q[70];
-cx q[3],q[71];
-cx q[15],q[70];
-rz(3.3044396690702524) q[70];
-cx q[15],q[70];
-cx q[15],q[80];
-cx q[70],q[84];
-rz(3.3044396690702524) q[71];
-cx q[3],q[71];
-cx q[3],q[77];
-cx q[53],q[71];
-rz(3.3044396690702524) q[71];
-cx q[53],q[71];
-cx q[53],q[86];
-rx(0.24816772030626383) q[71];
-rz(3.3044396690702524) q[72];
-cx q[44],q[72];
-rx(0.24816772030626383) q[44];
-rx(0.24816772030626383) q[72];
-rz(3.3044396690702524) q[73];
-cx q[59],q[73];
-cx q[59],q[85];
-rz(3.3044396690702524) q[74];
-cx q[63],q[74];
-rx(0.24816772030626383) q[63];
-rx(0.24816772030626383) q[74];
-rz(3.3044396690702524) q[75];
-cx q[0],q[75];
-cx q[0],q[82];
-cx q[21],q[75];
-rz(3.3044396690702524) q[75];
-cx q[21],q[75];
-cx q[21],q[81];
-rx(0.24816772030626383) q[75];
-rz(3.3044396690702524) q[77];
-cx q[3],q[77];
-cx q[3],q[88];
-cx q[30],q[77];
-rz(3.3044396690702524) q[77];
-cx q[30],q[77];
-rx(0.24816772030626383) q[30];
-rz(3.3044396690702524) q[78];
-cx q[42],q[78];
-cx q[60],q[78];
-rz(3.3044396690702524) q[78];
-cx q[60],q[78];
-rx(0.24816772030626383) q[78];
-rz(3.3044396690702524) q[79];
-cx q[50],q[79];
-cx q[50],q[101];
-rx(0.24816772030626383) q[79];
-rz(3.3044396690702524) q[80];
-cx q[15],q[80];
-cx q[15],q[90];
-rx(0.24816772030626383) q[80];
-rz(3.3044396690702524) q[81];
-cx q[21],q[81];
-cx q[77],q[81];
-rz(3.3044396690702524) q[81];
-cx q[77],q[81];
-rx(0.24816772030626383) q[77];
-rx(0.24816772030626383) q[81];
-rz(3.3044396690702524) q[82];
-cx q[0],q[82];
-cx q[0],q[91];
-cx q[56],q[82];
-rz(3.3044396690702524) q[82];
-cx q[56],q[82];
-cx q[56],q[96];
-rx(0.24816772030626383) q[82];
-rz(3.3044396690702524) q[83];
-cx q[68],q[83];
-rx(0.24816772030626383) q[68];
-rx(0.24816772030626383) q[83];
-rz(3.3044396690702524) q[84];
-cx q[70],q[84];
-rx(0.24816772030626383) q[70];
-cx q[73],q[84];
-rz(3.3044396690702524) q[84];
-cx q[73],q[84];
-rx(0.24816772030626383) q[73];
-rx(0.24816772030626383) q[84];
-rz(3.3044396690702524) q[85];
-cx q[59],q[85];
-rx(0.24816772030626383) q[59];
-rx(0.24816772030626383) q[85];
-rz(3.3044396690702524) q[86];
-cx q[53],q[86];
-rx(0.24816772030626383) q[53];
-rx(0.24816772030626383) q[86];
-rz(3.3044396690702524) q[87];
-cx q[28],q[87];
-cx q[28],q[105];
-cx q[32],q[87];
-rz(3.3044396690702524) q[87];
-cx q[32],q[87];
-rx(0.24816772030626383) q[87];
-rz(3.3044396690702524) q[88];
-cx q[3],q[88];
-cx q[3],q[100];
-cx q[60],q[88];
-rz(3.3044396690702524) q[88];
-cx q[60],q[88];
-rx(0.24816772030626383) q[60];
-rx(0.24816772030626383) q[88];
-rz(3.3044396690702524) q[90];
-cx q[15],q[90];
-cx q[15],q[92];
-cx q[27],q[90];
-rz(3.3044396690702524) q[90];
-cx q[27],q[90];
-cx q[27],q[95];
-rx(0.24816772030626383) q[90];
-rz(3.3044396690702524) q[91];
-cx q[0],q[91];
-cx q[0],q[93];
-cx q[6],q[91];
-rz(3.3044396690702524) q[91];
-cx q[6],q[91];
-rx(0.24816772030626383) q[6];
-rx(0.24816772030626383) q[91];
-rz(3.3044396690702524) q[92];
-cx q[15],q[92];
-cx q[15],q[108];
-cx q[89],q[92];
-rz(3.3044396690702524) q[92];
-cx q[89],q[92];
-rx(0.24816772030626383) q[89];
-rz(3.3044396690702524) q[93];
-cx q[0],q[93];
-rx(0.24816772030626383) q[0];
-cx q[0],q[1];
-rz(3.187342021408229) q[1];
-cx q[0],q[1];
-cx q[0],q[2];
-rz(3.187342021408229) q[2];
-cx q[0],q[2];
-cx q[2],q[89];
-cx q[32],q[93];
-rz(3.187342021408229) q[89];
-cx q[2],q[89];
-rx(3.1713080161061193) q[2];
-rz(3.3044396690702524) q[93];
-cx q[32],q[93];
-rx(0.24816772030626383) q[93];
-rz(3.3044396690702524) q[95];
-cx q[27],q[95];
-rx(0.24816772030626383) q[27];
-rx(0.24816772030626383) q[95];
-rz(3.3044396690702524) q[96];
-cx q[56],q[96];
-rx(0.24816772030626383) q[56];
-cx q[92],q[96];
-rz(3.3044396690702524) q[96];
-cx q[92],q[96];
-rx(0.24816772030626383) q[96];
-rz(3.3044396690702524) q[97];
-cx q[7],q[97];
-cx q[7],q[104];
-rx(0.24816772030626383) q[97];
-rz(3.3044396690702524) q[98];
-cx q[10],q[98];
-rx(0.24816772030626383) q[10];
-cx q[21],q[98];
-rz(3.3044396690702524) q[98];
-cx q[21],q[98];
-rx(0.24816772030626383) q[98];
-rz(3.3044396690702524) q[99];
-cx q[4],q[99];
-cx q[41],q[99];
-rz(3.3044396690702524) q[99];
-cx q[41],q[99];
-rx(0.24816772030626383) q[41];
-rx(0.24816772030626383) q[99];
-rz(3.3044396690702524) q[100];
-cx q[3],q[100];
-cx q[3],q[102];
-cx q[25],q[100];
-rz(3.3044396690702524) q[100];
-cx q[25],q[100];
-rx(0.24816772030626383) q[25];
-rx(0.24816772030626383) q[100];
-rz(3.3044396690702524) q[101];
-cx q[50],q[101];
-rx(0.24816772030626383) q[50];
-rx(0.24816772030626383) q[101];
-rz(3.3044396690702524) q[102];
-cx q[3],q[102];
-cx q[3],q[107];
-cx q[4],q[102];
-rz(3.3044396690702524) q[102];
-cx q[4],q[102];
-rx(0.24816772030626383) q[4];
-rx(0.24816772030626383) q[102];
-rz(3.3044396690702524) q[103];
-cx q[57],q[103];
-rx(0.24816772030626383) q[57];
-rx(0.24816772030626383) q[103];
-rz(3.3044396690702524) q[104];
-cx q[7],q[104];
-rx(0.24816772030626383) q[7];
-cx q[13],q[104];
-rz(3.3044396690702524) q[104];
-cx q[13],q[104];
-rx(0.24816772030626383) q[13];
-cx q[104],q[114];
-rz(3.3044396690702524) q[105];
-cx q[28],q[105];
-cx q[28],q[116];
-rx(0.24816772030626383) q[105];
-rz(3.3044396690702524) q[107];
-cx q[3],q[107];
-cx q[3],q[110];
-cx q[31],q[107];
-rz(3.3044396690702524) q[107];
-cx q[31],q[107];
-rx(0.24816772030626383) q[107];
-rz(3.3044396690702524) q[108];
-cx q[15],q[108];
-cx q[15],q[115];
-cx q[31],q[108];
-rz(3.3044396690702524) q[108];
-cx q[31],q[108];
-rx(0.24816772030626383) q[31];
-rx(0.24816772030626383) q[108];
-rz(3.3044396690702524) q[110];
-cx q[3],q[110];
-cx q[3],q[111];
-cx q[24],q[110];
-rz(3.3044396690702524) q[110];
-cx q[24],q[110];
-rx(0.24816772030626383) q[24];
-rz(3.3044396690702524) q[111];
-cx q[3],q[111];
-cx q[3],q[113];
-cx q[21],q[111];
-rz(3.3044396690702524) q[111];
-cx q[21],q[111];
-cx q[21],q[112];
-rx(0.24816772030626383) q[111];
-rz(3.3044396690702524) q[112];
-cx q[21],q[112];
-rx(0.24816772030626383) q[21];
-cx q[36],q[112];
-rz(3.3044396690702524) q[112];
-cx q[36],q[112];
-rx(0.24816772030626383) q[36];
-rx(0.24816772030626383) q[112];
-rz(3.3044396690702524) q[113];
-cx q[3],q[113];
-rx(0.24816772030626383) q[3];
-cx q[0],q[3];
-rz(3.187342021408229) q[3];
-cx q[0],q[3];
-cx q[1],q[3];
-rz(3.187342021408229) q[3];
-cx q[1],q[3];
-cx q[1],q[4];
-rz(3.187342021408229) q[4];
-cx q[1],q[4];
-cx q[1],q[5];
-cx q[3],q[4];
-rz(3.187342021408229) q[4];
-cx q[3],q[4];
-cx q[4],q[6];
-rz(3.187342021408229) q[5];
-cx q[1],q[5];
-cx q[1],q[9];
-cx q[3],q[5];
-rz(3.187342021408229) q[5];
-cx q[3],q[5];
-cx q[3],q[7];
-rz(3.187342021408229) q[6];
-cx q[4],q[6];
-cx q[5],q[6];
-rz(3.187342021408229) q[6];
-cx q[5],q[6];
-rz(3.187342021408229) q[7];
-cx q[3],q[7];
-cx q[3],q[8];
-cx q[4],q[7];
-rz(3.187342021408229) q[7];
-cx q[4],q[7];
-cx q[4],q[10];
-rz(3.187342021408229) q[8];
-cx q[3],q[8];
-cx q[5],q[8];
-rz(3.187342021408229) q[8];
-cx q[5],q[8];
-cx q[5],q[11];
-cx q[8],q[83];
-rz(3.187342021408229) q[9];
-cx q[1],q[9];
-cx q[1],q[17];
-cx q[3],q[9];
-rz(3.187342021408229) q[9];
-cx q[3],q[9];
-cx q[3],q[12];
-rz(3.187342021408229) q[10];
-cx q[4],q[10];
-cx q[4],q[13];
-cx q[6],q[10];
-rz(3.187342021408229) q[10];
-cx q[6],q[10];
-cx q[10],q[37];
-rz(3.187342021408229) q[11];
-cx q[5],q[11];
-cx q[6],q[11];
-rz(3.187342021408229) q[11];
-cx q[6],q[11];
-rx(3.1713080161061193) q[11];
-rz(3.187342021408229) q[12];
-cx q[3],q[12];
-cx q[3],q[14];
-cx q[5],q[12];
-rz(3.187342021408229) q[12];
-cx q[5],q[12];
-rz(3.187342021408229) q[13];
-cx q[4],q[13];
-cx q[5],q[13];
-rz(3.187342021408229) q[13];
-cx q[5],q[13];
-rz(3.187342021408229) q[14];
-cx q[3],q[14];
-cx q[4],q[14];
-rz(3.187342021408229) q[14];
-cx q[4],q[14];
-rx(3.1713080161061193) q[14];
-rz(3.187342021408229) q[17];
-cx q[1],q[17];
-rz(3.187342021408229) q[37];
-cx q[10],q[37];
-cx q[10],q[41];
-rz(3.187342021408229) q[41];
-cx q[10],q[41];
-rz(3.187342021408229) q[83];
-cx q[8],q[83];
-rx(3.1713080161061193) q[8];
-rx(0.24816772030626383) q[113];
-rz(3.3044396690702524) q[114];
-cx q[104],q[114];
-rx(0.24816772030626383) q[104];
-cx q[110],q[114];
-rz(3.3044396690702524) q[114];
-cx q[110],q[114];
-rx(0.24816772030626383) q[110];
-rx(0.24816772030626383) q[114];
-rz(3.3044396690702524) q[115];
-cx q[15],q[115];
-rx(0.24816772030626383) q[15];
-cx q[0],q[15];
-rz(3.187342021408229) q[15];
-cx q[0],q[15];
-cx q[0],q[16];
-cx q[3],q[15];
-rz(3.187342021408229) q[15];
-cx q[3],q[15];
-rz(3.187342021408229) q[16];
-cx q[0],q[16];
-cx q[0],q[20];
-cx q[3],q[16];
-rz(3.187342021408229) q[16];
-cx q[3],q[16];
-cx q[3],q[17];
-rz(3.187342021408229) q[17];
-cx q[3],q[17];
-cx q[3],q[18];
-rz(3.187342021408229) q[18];
-cx q[3],q[18];
-cx q[3],q[19];
-cx q[4],q[18];
-rz(3.187342021408229) q[18];
-cx q[4],q[18];
-cx q[4],q[21];
-rz(3.187342021408229) q[19];
-cx q[3],q[19];
-cx q[3],q[22];
-cx q[7],q[19];
-rz(3.187342021408229) q[19];
-cx q[7],q[19];
-cx q[19],q[38];
-rz(3.187342021408229) q[20];
-cx q[0],q[20];
-cx q[15],q[20];
-rz(3.187342021408229) q[20];
-cx q[15],q[20];
-rz(3.187342021408229) q[21];
-cx q[4],q[21];
-cx q[4],q[27];
-cx q[15],q[21];
-rz(3.187342021408229) q[21];
-cx q[15],q[21];
-cx q[15],q[36];
-rz(3.187342021408229) q[22];
-cx q[3],q[22];
-cx q[3],q[23];
-cx q[9],q[22];
-rz(3.187342021408229) q[22];
-cx q[9],q[22];
-cx q[9],q[55];
-rx(3.1713080161061193) q[22];
-rz(3.187342021408229) q[23];
-cx q[3],q[23];
-cx q[3],q[24];
-cx q[17],q[23];
-rz(3.187342021408229) q[23];
-cx q[17],q[23];
-rz(3.187342021408229) q[24];
-cx q[3],q[24];
-cx q[3],q[25];
-cx q[5],q[24];
-rz(3.187342021408229) q[24];
-cx q[5],q[24];
-cx q[5],q[33];
-cx q[24],q[54];
-rz(3.187342021408229) q[25];
-cx q[3],q[25];
-cx q[12],q[25];
-rz(3.187342021408229) q[25];
-cx q[12],q[25];
-cx q[12],q[31];
-rz(3.187342021408229) q[27];
-cx q[4],q[27];
-cx q[4],q[47];
-cx q[6],q[27];
-rz(3.187342021408229) q[27];
-cx q[6],q[27];
-cx q[6],q[69];
-cx q[27],q[41];
-rz(3.187342021408229) q[31];
-cx q[12],q[31];
-rz(3.187342021408229) q[33];
-cx q[5],q[33];
-cx q[5],q[46];
-rz(3.187342021408229) q[36];
-cx q[15],q[36];
-cx q[20],q[36];
-rz(3.187342021408229) q[36];
-cx q[20],q[36];
-cx q[36],q[94];
-rz(3.187342021408229) q[38];
-cx q[19],q[38];
-rx(3.1713080161061193) q[19];
-rz(3.187342021408229) q[41];
-cx q[27],q[41];
-cx q[27],q[72];
-cx q[41],q[67];
-rz(3.187342021408229) q[46];
-cx q[5],q[46];
-cx q[5],q[65];
-rz(3.187342021408229) q[47];
-cx q[4],q[47];
-cx q[17],q[47];
-rz(3.187342021408229) q[47];
-cx q[17],q[47];
-cx q[17],q[53];
-rz(3.187342021408229) q[53];
-cx q[17],q[53];
-rz(3.187342021408229) q[54];
-cx q[24],q[54];
-cx q[24],q[58];
-rz(3.187342021408229) q[55];
-cx q[9],q[55];
-cx q[9],q[80];
-cx q[15],q[55];
-rz(3.187342021408229) q[55];
-cx q[15],q[55];
-rz(3.187342021408229) q[58];
-cx q[24],q[58];
-cx q[24],q[86];
-rz(3.187342021408229) q[65];
-cx q[5],q[65];
-cx q[5],q[76];
-rz(3.187342021408229) q[67];
-cx q[41],q[67];
-rz(3.187342021408229) q[69];
-cx q[6],q[69];
-rz(3.187342021408229) q[72];
-cx q[27],q[72];
-rz(3.187342021408229) q[76];
-cx q[5],q[76];
-cx q[5],q[89];
-cx q[6],q[76];
-rz(3.187342021408229) q[76];
-cx q[6],q[76];
-cx q[6],q[79];
-rx(3.1713080161061193) q[76];
-rz(3.187342021408229) q[79];
-cx q[6],q[79];
-rz(3.187342021408229) q[80];
-cx q[9],q[80];
-rx(3.1713080161061193) q[9];
-rz(3.187342021408229) q[86];
-cx q[24],q[86];
-rz(3.187342021408229) q[89];
-cx q[5],q[89];
-cx q[5],q[95];
-cx q[92],q[115];
-rz(3.187342021408229) q[94];
-cx q[36],q[94];
-cx q[55],q[94];
-rz(3.187342021408229) q[94];
-cx q[55],q[94];
-rx(3.1713080161061193) q[55];
-rx(3.1713080161061193) q[94];
-rz(3.187342021408229) q[95];
-cx q[5],q[95];
-cx q[5],q[106];
-rz(3.187342021408229) q[106];
-cx q[5],q[106];
-cx q[5],q[109];
-cx q[36],q[106];
-rz(3.187342021408229) q[106];
-cx q[36],q[106];
-rx(3.1713080161061193) q[106];
-rz(3.187342021408229) q[109];
-cx q[5],q[109];
-rx(3.1713080161061193) q[5];
-rz(3.3044396690702524) q[115];
-cx q[92],q[115];
-rx(0.24816772030626383) q[92];
-rx(0.24816772030626383) q[115];
-rz(3.3044396690702524) q[116];
-cx q[28],q[116];
-rx(0.24816772030626383) q[28];
-cx q[1],q[28];
-rz(3.187342021408229) q[28];
-cx q[1],q[28];
-cx q[1],q[29];
-rz(3.187342021408229) q[29];
-cx q[1],q[29];
-cx q[1],q[45];
-cx q[42],q[116];
-rz(3.187342021408229) q[45];
-cx q[1],q[45];
-cx q[1],q[57];
-cx q[16],q[45];
-rz(3.187342021408229) q[45];
-cx q[16],q[45];
-cx q[16],q[59];
-rz(3.187342021408229) q[57];
-cx q[1],q[57];
-cx q[1],q[60];
-rz(3.187342021408229) q[59];
-cx q[16],q[59];
-cx q[16],q[73];
-rz(3.187342021408229) q[60];
-cx q[1],q[60];
-cx q[1],q[97];
-cx q[7],q[60];
-rz(3.187342021408229) q[60];
-cx q[7],q[60];
-rz(3.187342021408229) q[73];
-cx q[16],q[73];
-cx q[16],q[101];
-rz(3.187342021408229) q[97];
-cx q[1],q[97];
-cx q[1],q[113];
-rz(3.187342021408229) q[101];
-cx q[16],q[101];
-cx q[16],q[103];
-rz(3.187342021408229) q[103];
-cx q[16],q[103];
-rx(3.1713080161061193) q[16];
-rz(3.187342021408229) q[113];
-cx q[1],q[113];
-rx(3.1713080161061193) q[1];
-rz(3.3044396690702524) q[116];
-cx q[42],q[116];
-rx(0.24816772030626383) q[42];
-rx(0.24816772030626383) q[116];
-rx(5.131992068896703) q[117];
-cx q[26],q[117];
-rz(3.3044396690702524) q[117];
-cx q[26],q[117];
-rx(0.24816772030626383) q[26];
-cx q[3],q[26];
-rz(3.187342021408229) q[26];
-cx q[3],q[26];
-cx q[3],q[28];
-cx q[21],q[26];
-rz(3.187342021408229) q[26];
-cx q[21],q[26];
-cx q[26],q[31];
-rz(3.187342021408229) q[28];
-cx q[3],q[28];
-cx q[3],q[29];
-rz(3.187342021408229) q[29];
-cx q[3],q[29];
-cx q[3],q[30];
-rx(3.1713080161061193) q[29];
-rz(3.187342021408229) q[30];
-cx q[3],q[30];
-cx q[3],q[34];
-cx q[18],q[30];
-rz(3.187342021408229) q[30];
-cx q[18],q[30];
-rx(3.1713080161061193) q[18];
-cx q[30],q[33];
-rz(3.187342021408229) q[31];
-cx q[26],q[31];
-cx q[26],q[105];
-cx q[32],q[117];
-rz(3.187342021408229) q[33];
-cx q[30],q[33];
-rx(3.1713080161061193) q[33];
-rz(3.187342021408229) q[34];
-cx q[3],q[34];
-cx q[3],q[35];
-cx q[12],q[34];
-rz(3.187342021408229) q[34];
-cx q[12],q[34];
-cx q[34],q[37];
-rz(3.187342021408229) q[35];
-cx q[3],q[35];
-cx q[3],q[39];
-rz(3.187342021408229) q[37];
-cx q[34],q[37];
-rx(3.1713080161061193) q[34];
-cx q[37],q[85];
-rz(3.187342021408229) q[39];
-cx q[3],q[39];
-cx q[3],q[40];
-cx q[13],q[39];
-rz(3.187342021408229) q[39];
-cx q[13],q[39];
-cx q[13],q[56];
-cx q[39],q[109];
-rz(3.187342021408229) q[40];
-cx q[3],q[40];
-cx q[23],q[40];
-rz(3.187342021408229) q[40];
-cx q[23],q[40];
-cx q[23],q[65];
-rx(3.1713080161061193) q[40];
-rz(3.187342021408229) q[56];
-cx q[13],q[56];
-cx q[13],q[68];
-cx q[45],q[56];
-rz(3.187342021408229) q[56];
-cx q[45],q[56];
-rx(3.1713080161061193) q[45];
-cx q[56],q[67];
-rz(3.187342021408229) q[65];
-cx q[23],q[65];
-rx(3.1713080161061193) q[23];
-rx(3.1713080161061193) q[65];
-rz(3.187342021408229) q[67];
-cx q[56],q[67];
-cx q[56],q[74];
-rx(3.1713080161061193) q[67];
-rz(3.187342021408229) q[68];
-cx q[13],q[68];
-rz(3.187342021408229) q[74];
-cx q[56],q[74];
-rz(3.187342021408229) q[85];
-cx q[37],q[85];
-rx(3.1713080161061193) q[37];
-rz(3.187342021408229) q[105];
-cx q[26],q[105];
-rz(3.187342021408229) q[109];
-cx q[39],q[109];
-rx(3.1713080161061193) q[39];
-rx(3.1713080161061193) q[109];
-rz(3.3044396690702524) q[117];
-cx q[32],q[117];
-rx(0.24816772030626383) q[32];
-cx q[0],q[32];
-rz(3.187342021408229) q[32];
-cx q[0],q[32];
-cx q[0],q[42];
-cx q[21],q[32];
-rz(3.187342021408229) q[32];
-cx q[21],q[32];
-cx q[21],q[38];
-cx q[32],q[35];
-rz(3.187342021408229) q[35];
-cx q[32],q[35];
-cx q[32],q[59];
-rx(3.1713080161061193) q[35];
-rz(3.187342021408229) q[38];
-cx q[21],q[38];
-cx q[21],q[53];
-cx q[38],q[46];
-rz(3.187342021408229) q[42];
-cx q[0],q[42];
-cx q[0],q[48];
-cx q[3],q[42];
-rz(3.187342021408229) q[42];
-cx q[3],q[42];
-cx q[3],q[43];
-cx q[42],q[78];
-rz(3.187342021408229) q[43];
-cx q[3],q[43];
-cx q[3],q[44];
-cx q[20],q[43];
-rz(3.187342021408229) q[43];
-cx q[20],q[43];
-rx(3.1713080161061193) q[20];
-rx(3.1713080161061193) q[43];
-rz(3.187342021408229) q[44];
-cx q[3],q[44];
-cx q[3],q[49];
-cx q[12],q[44];
-rz(3.187342021408229) q[44];
-cx q[12],q[44];
-cx q[44],q[72];
-rz(3.187342021408229) q[46];
-cx q[38],q[46];
-rx(3.1713080161061193) q[38];
-rx(3.1713080161061193) q[46];
-rz(3.187342021408229) q[48];
-cx q[0],q[48];
-cx q[0],q[51];
-cx q[30],q[48];
-rz(3.187342021408229) q[48];
-cx q[30],q[48];
-rx(3.1713080161061193) q[48];
-rz(3.187342021408229) q[49];
-cx q[3],q[49];
-cx q[3],q[50];
-cx q[4],q[49];
-rz(3.187342021408229) q[49];
-cx q[4],q[49];
-cx q[4],q[61];
-rx(3.1713080161061193) q[49];
-rz(3.187342021408229) q[50];
-cx q[3],q[50];
-cx q[3],q[52];
-cx q[12],q[50];
-rz(3.187342021408229) q[50];
-cx q[12],q[50];
-cx q[12],q[63];
-cx q[50],q[79];
-rz(3.187342021408229) q[51];
-cx q[0],q[51];
-cx q[0],q[62];
-cx q[28],q[51];
-rz(3.187342021408229) q[51];
-cx q[28],q[51];
-cx q[28],q[54];
-rx(3.1713080161061193) q[51];
-rz(3.187342021408229) q[52];
-cx q[3],q[52];
-cx q[3],q[57];
-cx q[10],q[52];
-rz(3.187342021408229) q[52];
-cx q[10],q[52];
-rx(3.1713080161061193) q[52];
-rz(3.187342021408229) q[53];
-cx q[21],q[53];
-rz(3.187342021408229) q[54];
-cx q[28],q[54];
-cx q[28],q[58];
-rx(3.1713080161061193) q[54];
-rz(3.187342021408229) q[57];
-cx q[3],q[57];
-cx q[3],q[70];
-cx q[57],q[103];
-rz(3.187342021408229) q[58];
-cx q[28],q[58];
-cx q[28],q[87];
-rx(3.1713080161061193) q[58];
-rz(3.187342021408229) q[59];
-cx q[32],q[59];
-cx q[32],q[68];
-cx q[59],q[69];
-rz(3.187342021408229) q[61];
-cx q[4],q[61];
-cx q[4],q[99];
-cx q[7],q[61];
-rz(3.187342021408229) q[61];
-cx q[7],q[61];
-cx q[7],q[97];
-rx(3.1713080161061193) q[61];
-rz(3.187342021408229) q[62];
-cx q[0],q[62];
-cx q[0],q[64];
-cx q[17],q[62];
-rz(3.187342021408229) q[62];
-cx q[17],q[62];
-rx(3.1713080161061193) q[62];
-rz(3.187342021408229) q[63];
-cx q[12],q[63];
-rx(3.1713080161061193) q[12];
-cx q[17],q[63];
-rz(3.187342021408229) q[63];
-cx q[17],q[63];
-cx q[17],q[66];
-cx q[63],q[74];
-rz(3.187342021408229) q[64];
-cx q[0],q[64];
-cx q[0],q[75];
-cx q[10],q[64];
-rz(3.187342021408229) q[64];
-cx q[10],q[64];
-cx q[10],q[98];
-rx(3.1713080161061193) q[64];
-rz(3.187342021408229) q[66];
-cx q[17],q[66];
-rx(3.1713080161061193) q[17];
-cx q[47],q[66];
-rz(3.187342021408229) q[66];
-cx q[47],q[66];
-rx(3.1713080161061193) q[47];
-rx(3.1713080161061193) q[66];
-rz(3.187342021408229) q[68];
-cx q[32],q[68];
-cx q[68],q[83];
-rz(3.187342021408229) q[69];
-cx q[59],q[69];
-cx q[59],q[73];
-rx(3.1713080161061193) q[69];
-rz(3.187342021408229) q[70];
-cx q[3],q[70];
-cx q[3],q[71];
-cx q[15],q[70];
-rz(3.187342021408229) q[70];
-cx q[15],q[70];
-cx q[15],q[80];
-cx q[70],q[84];
-rz(3.187342021408229) q[71];
-cx q[3],q[71];
-cx q[3],q[77];
-cx q[53],q[71];
-rz(3.187342021408229) q[71];
-cx q[53],q[71];
-cx q[53],q[86];
-rx(3.1713080161061193) q[71];
-rz(3.187342021408229) q[72];
-cx q[44],q[72];
-rx(3.1713080161061193) q[44];
-rx(3.1713080161061193) q[72];
-rz(3.187342021408229) q[73];
-cx q[59],q[73];
-cx q[59],q[85];
-rz(3.187342021408229) q[74];
-cx q[63],q[74];
-rx(3.1713080161061193) q[63];
-rx(3.1713080161061193) q[74];
-rz(3.187342021408229) q[75];
-cx q[0],q[75];
-cx q[0],q[82];
-cx q[21],q[75];
-rz(3.187342021408229) q[75];
-cx q[21],q[75];
-cx q[21],q[81];
-rx(3.1713080161061193) q[75];
-rz(3.187342021408229) q[77];
-cx q[3],q[77];
-cx q[3],q[88];
-cx q[30],q[77];
-rz(3.187342021408229) q[77];
-cx q[30],q[77];
-rx(3.1713080161061193) q[30];
-rz(3.187342021408229) q[78];
-cx q[42],q[78];
-cx q[60],q[78];
-rz(3.187342021408229) q[78];
-cx q[60],q[78];
-rx(3.1713080161061193) q[78];
-rz(3.187342021408229) q[79];
-cx q[50],q[79];
-cx q[50],q[101];
-rx(3.1713080161061193) q[79];
-rz(3.187342021408229) q[80];
-cx q[15],q[80];
-cx q[15],q[90];
-rx(3.1713080161061193) q[80];
-rz(3.187342021408229) q[81];
-cx q[21],q[81];
-cx q[77],q[81];
-rz(3.187342021408229) q[81];
-cx q[77],q[81];
-rx(3.1713080161061193) q[77];
-rx(3.1713080161061193) q[81];
-rz(3.187342021408229) q[82];
-cx q[0],q[82];
-cx q[0],q[91];
-cx q[56],q[82];
-rz(3.187342021408229) q[82];
-cx q[56],q[82];
-cx q[56],q[96];
-rx(3.1713080161061193) q[82];
-rz(3.187342021408229) q[83];
-cx q[68],q[83];
-rx(3.1713080161061193) q[68];
-rx(3.1713080161061193) q[83];
-rz(3.187342021408229) q[84];
-cx q[70],q[84];
-rx(3.1713080161061193) q[70];
-cx q[73],q[84];
-rz(3.187342021408229) q[84];
-cx q[73],q[84];
-rx(3.1713080161061193) q[73];
-rx(3.1713080161061193) q[84];
-rz(3.187342021408229) q[85];
-cx q[59],q[85];
-rx(3.1713080161061193) q[59];
-rx(3.1713080161061193) q[85];
-rz(3.187342021408229) q[86];
-cx q[53],q[86];
-rx(3.1713080161061193) q[53];
-rx(3.1713080161061193) q[86];
-rz(3.187342021408229) q[87];
-cx q[28],q[87];
-cx q[28],q[105];
-cx q[32],q[87];
-rz(3.187342021408229) q[87];
-cx q[32],q[87];
-rx(3.1713080161061193) q[87];
-rz(3.187342021408229) q[88];
-cx q[3],q[88];
-cx q[3],q[100];
-cx q[60],q[88];
-rz(3.187342021408229) q[88];
-cx q[60],q[88];
-rx(3.1713080161061193) q[60];
-rx(3.1713080161061193) q[88];
-rz(3.187342021408229) q[90];
-cx q[15],q[90];
-cx q[15],q[92];
-cx q[27],q[90];
-rz(3.187342021408229) q[90];
-cx q[27],q[90];
-cx q[27],q[95];
-rx(3.1713080161061193) q[90];
-rz(3.187342021408229) q[91];
-cx q[0],q[91];
-cx q[0],q[93];
-cx q[6],q[91];
-rz(3.187342021408229) q[91];
-cx q[6],q[91];
-rx(3.1713080161061193) q[6];
-rx(3.1713080161061193) q[91];
-rz(3.187342021408229) q[92];
-cx q[15],q[92];
-cx q[15],q[108];
-cx q[89],q[92];
-rz(3.187342021408229) q[92];
-cx q[89],q[92];
-rx(3.1713080161061193) q[89];
-rz(3.187342021408229) q[93];
-cx q[0],q[93];
-rx(3.1713080161061193) q[0];
-cx q[32],q[93];
-rz(3.187342021408229) q[93];
-cx q[32],q[93];
-rx(3.1713080161061193) q[93];
-rz(3.187342021408229) q[95];
-cx q[27],q[95];
-rx(3.1713080161061193) q[27];
-rx(3.1713080161061193) q[95];
-rz(3.187342021408229) q[96];
-cx q[56],q[96];
-rx(3.1713080161061193) q[56];
-cx q[92],q[96];
-rz(3.187342021408229) q[96];
-cx q[92],q[96];
-rx(3.1713080161061193) q[96];
-rz(3.187342021408229) q[97];
-cx q[7],q[97];
-cx q[7],q[104];
-rx(3.1713080161061193) q[97];
-rz(3.187342021408229) q[98];
-cx q[10],q[98];
-rx(3.1713080161061193) q[10];
-cx q[21],q[98];
-rz(3.187342021408229) q[98];
-cx q[21],q[98];
-rx(3.1713080161061193) q[98];
-rz(3.187342021408229) q[99];
-cx q[4],q[99];
-cx q[41],q[99];
-rz(3.187342021408229) q[99];
-cx q[41],q[99];
-rx(3.1713080161061193) q[41];
-rx(3.1713080161061193) q[99];
-rz(3.187342021408229) q[100];
-cx q[3],q[100];
-cx q[3],q[102];
-cx q[25],q[100];
-rz(3.187342021408229) q[100];
-cx q[25],q[100];
-rx(3.1713080161061193) q[25];
-rx(3.1713080161061193) q[100];
-rz(3.187342021408229) q[101];
-cx q[50],q[101];
-rx(3.1713080161061193) q[50];
-rx(3.1713080161061193) q[101];
-rz(3.187342021408229) q[102];
-cx q[3],q[102];
-cx q[3],q[107];
-cx q[4],q[102];
-rz(3.187342021408229) q[102];
-cx q[4],q[102];
-rx(3.1713080161061193) q[4];
-rx(3.1713080161061193) q[102];
-rz(3.187342021408229) q[103];
-cx q[57],q[103];
-rx(3.1713080161061193) q[57];
-rx(3.1713080161061193) q[103];
-rz(3.187342021408229) q[104];
-cx q[7],q[104];
-rx(3.1713080161061193) q[7];
-cx q[13],q[104];
-rz(3.187342021408229) q[104];
-cx q[13],q[104];
-rx(3.1713080161061193) q[13];
-cx q[104],q[114];
-rz(3.187342021408229) q[105];
-cx q[28],q[105];
-cx q[28],q[116];
-rx(3.1713080161061193) q[105];
-rz(3.187342021408229) q[107];
-cx q[3],q[107];
-cx q[3],q[110];
-cx q[31],q[107];
-rz(3.187342021408229) q[107];
-cx q[31],q[107];
-rx(3.1713080161061193) q[107];
-rz(3.187342021408229) q[108];
-cx q[15],q[108];
-cx q[15],q[115];
-cx q[31],q[108];
-rz(3.187342021408229) q[108];
-cx q[31],q[108];
-rx(3.1713080161061193) q[31];
-rx(3.1713080161061193) q[108];
-rz(3.187342021408229) q[110];
-cx q[3],q[110];
-cx q[3],q[111];
-cx q[24],q[110];
-rz(3.187342021408229) q[110];
-cx q[24],q[110];
-rx(3.1713080161061193) q[24];
-rz(3.187342021408229) q[111];
-cx q[3],q[111];
-cx q[3],q[113];
-cx q[21],q[111];
-rz(3.187342021408229) q[111];
-cx q[21],q[111];
-cx q[21],q[112];
-rx(3.1713080161061193) q[111];
-rz(3.187342021408229) q[112];
-cx q[21],q[112];
-rx(3.1713080161061193) q[21];
-cx q[36],q[112];
-rz(3.187342021408229) q[112];
-cx q[36],q[112];
-rx(3.1713080161061193) q[36];
-rx(3.1713080161061193) q[112];
-rz(3.187342021408229) q[113];
-cx q[3],q[113];
-rx(3.1713080161061193) q[3];
-rx(3.1713080161061193) q[113];
-rz(3.187342021408229) q[114];
-cx q[104],q[114];
-rx(3.1713080161061193) q[104];
-cx q[110],q[114];
-rz(3.187342021408229) q[114];
-cx q[110],q[114];
-rx(3.1713080161061193) q[110];
-rx(3.1713080161061193) q[114];
-rz(3.187342021408229) q[115];
-cx q[15],q[115];
-rx(3.1713080161061193) q[15];
-cx q[92],q[115];
-rz(3.187342021408229) q[115];
-cx q[92],q[115];
-rx(3.1713080161061193) q[92];
-rx(3.1713080161061193) q[115];
-rz(3.187342021408229) q[116];
-cx q[28],q[116];
-rx(3.1713080161061193) q[28];
-cx q[42],q[116];
-rz(3.187342021408229) q[116];
-cx q[42],q[116];
-rx(3.1713080161061193) q[42];
-rx(3.1713080161061193) q[116];
-rx(0.24816772030626383) q[117];
-cx q[26],q[117];
-rz(3.187342021408229) q[117];
-cx q[26],q[117];
-rx(3.1713080161061193) q[26];
-cx q[32],q[117];
-rz(3.187342021408229) q[117];
-cx q[32],q[117];
-rx(3.1713080161061193) q[32];
-rx(3.1713080161061193) q[117];
\ No newline at end of file
@@ -1,220 +0,0 @@
-OPENQASM 2.0;
-include "qelib1.inc";
-qreg q[11];
-ry(pi/2) q[0];
-rx(pi) q[0];
-ry(pi/2) q[1];
-rx(pi) q[1];
-cx q[0],q[1];
-rz(2.303259931221852) q[1];
-cx q[0],q[1];
-ry(pi/2) q[2];
-rx(pi) q[2];
-cx q[0],q[2];
-rz(2.303259931221852) q[2];
-cx q[0],q[2];
-rx(3.7523596551558827) q[2];
-ry(pi/2) q[3];
-rx(pi) q[3];
-cx q[0],q[3];
-rz(2.303259931221852) q[3];
-cx q[0],q[3];
-rx(3.7523596551558827) q[0];
-cx q[1],q[3];
-rz(2.303259931221852) q[3];
-cx q[1],q[3];
-ry(pi/2) q[4];
-rx(pi) q[4];
-cx q[1],q[4];
-rz(2.303259931221852) q[4];
-cx q[1],q[4];
-cx q[3],q[4];
-rz(2.303259931221852) q[4];
-cx q[3],q[4];
-ry(pi/2) q[5];
-rx(pi) q[5];
-cx q[1],q[5];
-rz(2.303259931221852) q[5];
-cx q[1],q[5];
-cx q[3],q[5];
-rz(2.303259931221852) q[5];
-cx q[3],q[5];
-ry(pi/2) q[6];
-rx(pi) q[6];
-cx q[4],q[6];
-rz(2.303259931221852) q[6];
-cx q[4],q[6];
-cx q[5],q[6];
-rz(2.303259931221852) q[6];
-cx q[5],q[6];
-ry(pi/2) q[7];
-rx(pi) q[7];
-cx q[3],q[7];
-rz(2.303259931221852) q[7];
-cx q[3],q[7];
-cx q[4],q[7];
-rz(2.303259931221852) q[7];
-cx q[4],q[7];
-rx(3.7523596551558827) q[7];
-ry(pi/2) q[8];
-rx(pi) q[8];
-cx q[3],q[8];
-rz(2.303259931221852) q[8];
-cx q[3],q[8];
-cx q[5],q[8];
-rz(2.303259931221852) q[8];
-cx q[5],q[8];
-rx(3.7523596551558827) q[5];
-rx(3.7523596551558827) q[8];
-ry(pi/2) q[9];
-rx(pi) q[9];
-cx q[1],q[9];
-rz(2.303259931221852) q[9];
-cx q[1],q[9];
-rx(3.7523596551558827) q[1];
-cx q[0],q[1];
-rz(5.525498461131764) q[1];
-cx q[0],q[1];
-cx q[0],q[2];
-rz(5.525498461131764) q[2];
-cx q[0],q[2];
-rx(2.373359419039761) q[2];
-cx q[3],q[9];
-rz(2.303259931221852) q[9];
-cx q[3],q[9];
-rx(3.7523596551558827) q[3];
-cx q[0],q[3];
-rz(5.525498461131764) q[3];
-cx q[0],q[3];
-rx(2.373359419039761) q[0];
-cx q[1],q[3];
-rz(5.525498461131764) q[3];
-cx q[1],q[3];
-rx(3.7523596551558827) q[9];
-ry(pi/2) q[10];
-rx(pi) q[10];
-cx q[4],q[10];
-rz(2.303259931221852) q[10];
-cx q[4],q[10];
-rx(3.7523596551558827) q[4];
-cx q[1],q[4];
-rz(5.525498461131764) q[4];
-cx q[1],q[4];
-cx q[1],q[5];
-cx q[3],q[4];
-rz(5.525498461131764) q[4];
-cx q[3],q[4];
-rz(5.525498461131764) q[5];
-cx q[1],q[5];
-cx q[1],q[9];
-cx q[3],q[5];
-rz(5.525498461131764) q[5];
-cx q[3],q[5];
-cx q[3],q[7];
-cx q[6],q[10];
-rz(5.525498461131764) q[7];
-cx q[3],q[7];
-cx q[3],q[8];
-rz(5.525498461131764) q[8];
-cx q[3],q[8];
-rz(5.525498461131764) q[9];
-cx q[1],q[9];
-rx(2.373359419039761) q[1];
-cx q[0],q[1];
-rz(3.69774541936582) q[1];
-cx q[0],q[1];
-cx q[0],q[2];
-rz(3.69774541936582) q[2];
-cx q[0],q[2];
-rx(2.460993526488573) q[2];
-cx q[3],q[9];
-rz(5.525498461131764) q[9];
-cx q[3],q[9];
-rx(2.373359419039761) q[3];
-cx q[0],q[3];
-rz(3.69774541936582) q[3];
-cx q[0],q[3];
-rx(2.460993526488573) q[0];
-cx q[1],q[3];
-rz(3.69774541936582) q[3];
-cx q[1],q[3];
-rx(2.373359419039761) q[9];
-rz(2.303259931221852) q[10];
-cx q[6],q[10];
-rx(3.7523596551558827) q[6];
-cx q[4],q[6];
-rz(5.525498461131764) q[6];
-cx q[4],q[6];
-cx q[4],q[7];
-cx q[5],q[6];
-rz(5.525498461131764) q[6];
-cx q[5],q[6];
-cx q[5],q[8];
-rz(5.525498461131764) q[7];
-cx q[4],q[7];
-rx(2.373359419039761) q[7];
-rz(5.525498461131764) q[8];
-cx q[5],q[8];
-rx(2.373359419039761) q[5];
-rx(2.373359419039761) q[8];
-rx(3.7523596551558827) q[10];
-cx q[4],q[10];
-rz(5.525498461131764) q[10];
-cx q[4],q[10];
-rx(2.373359419039761) q[4];
-cx q[1],q[4];
-rz(3.69774541936582) q[4];
-cx q[1],q[4];
-cx q[1],q[5];
-cx q[3],q[4];
-rz(3.69774541936582) q[4];
-cx q[3],q[4];
-rz(3.69774541936582) q[5];
-cx q[1],q[5];
-cx q[1],q[9];
-cx q[3],q[5];
-rz(3.69774541936582) q[5];
-cx q[3],q[5];
-cx q[3],q[7];
-cx q[6],q[10];
-rz(3.69774541936582) q[7];
-cx q[3],q[7];
-cx q[3],q[8];
-rz(3.69774541936582) q[8];
-cx q[3],q[8];
-rz(3.69774541936582) q[9];
-cx q[1],q[9];
-rx(2.460993526488573) q[1];
-cx q[3],q[9];
-rz(3.69774541936582) q[9];
-cx q[3],q[9];
-rx(2.460993526488573) q[3];
-rx(2.460993526488573) q[9];
-rz(5.525498461131764) q[10];
-cx q[6],q[10];
-rx(2.373359419039761) q[6];
-cx q[4],q[6];
-rz(3.69774541936582) q[6];
-cx q[4],q[6];
-cx q[4],q[7];
-cx q[5],q[6];
-rz(3.69774541936582) q[6];
-cx q[5],q[6];
-cx q[5],q[8];
-rz(3.69774541936582) q[7];
-cx q[4],q[7];
-rx(2.460993526488573) q[7];
-rz(3.69774541936582) q[8];
-cx q[5],q[8];
-rx(2.460993526488573) q[5];
-rx(2.460993526488573) q[8];
-rx(2.373359419039761) q[10];
-cx q[4],q[10];
-rz(3.69774541936582) q[10];
-cx q[4],q[10];
-rx(2.460993526488573) q[4];
-cx q[6],q[10];
-rz(3.69774541936582) q[10];
-cx q[6],q[10];
-rx(2.460993526488573) q[6];
-rx(2.460993526488573) q[10];
\ No newline at end of file
@@ -1,2819 +0,0 @@
-OPENQASM 2.0;
-include "qelib1.inc";
-qreg q[124];
-ry(pi/2) q[0];
-rx(pi) q[0];
-ry(pi/2) q[1];
-rx(pi) q[1];
-cx q[0],q[1];
-rz(5.70381642468168) q[1];
-cx q[0],q[1];
-ry(pi/2) q[2];
-rx(pi) q[2];
-cx q[0],q[2];
-rz(5.70381642468168) q[2];
-cx q[0],q[2];
-ry(pi/2) q[3];
-rx(pi) q[3];
-cx q[0],q[3];
-rz(5.70381642468168) q[3];
-cx q[0],q[3];
-cx q[1],q[3];
-rz(5.70381642468168) q[3];
-cx q[1],q[3];
-ry(pi/2) q[4];
-rx(pi) q[4];
-cx q[1],q[4];
-rz(5.70381642468168) q[4];
-cx q[1],q[4];
-cx q[3],q[4];
-rz(5.70381642468168) q[4];
-cx q[3],q[4];
-ry(pi/2) q[5];
-rx(pi) q[5];
-cx q[1],q[5];
-rz(5.70381642468168) q[5];
-cx q[1],q[5];
-cx q[3],q[5];
-rz(5.70381642468168) q[5];
-cx q[3],q[5];
-ry(pi/2) q[6];
-rx(pi) q[6];
-cx q[4],q[6];
-rz(5.70381642468168) q[6];
-cx q[4],q[6];
-cx q[5],q[6];
-rz(5.70381642468168) q[6];
-cx q[5],q[6];
-ry(pi/2) q[7];
-rx(pi) q[7];
-cx q[3],q[7];
-rz(5.70381642468168) q[7];
-cx q[3],q[7];
-cx q[4],q[7];
-rz(5.70381642468168) q[7];
-cx q[4],q[7];
-ry(pi/2) q[8];
-rx(pi) q[8];
-cx q[3],q[8];
-rz(5.70381642468168) q[8];
-cx q[3],q[8];
-cx q[5],q[8];
-rz(5.70381642468168) q[8];
-cx q[5],q[8];
-ry(pi/2) q[9];
-rx(pi) q[9];
-cx q[1],q[9];
-rz(5.70381642468168) q[9];
-cx q[1],q[9];
-cx q[3],q[9];
-rz(5.70381642468168) q[9];
-cx q[3],q[9];
-ry(pi/2) q[10];
-rx(pi) q[10];
-cx q[4],q[10];
-rz(5.70381642468168) q[10];
-cx q[4],q[10];
-cx q[6],q[10];
-rz(5.70381642468168) q[10];
-cx q[6],q[10];
-ry(pi/2) q[11];
-rx(pi) q[11];
-cx q[5],q[11];
-rz(5.70381642468168) q[11];
-cx q[5],q[11];
-cx q[6],q[11];
-rz(5.70381642468168) q[11];
-cx q[6],q[11];
-rx(10.168461270732157) q[11];
-ry(pi/2) q[12];
-rx(pi) q[12];
-cx q[3],q[12];
-rz(5.70381642468168) q[12];
-cx q[3],q[12];
-cx q[5],q[12];
-rz(5.70381642468168) q[12];
-cx q[5],q[12];
-ry(pi/2) q[13];
-rx(pi) q[13];
-cx q[4],q[13];
-rz(5.70381642468168) q[13];
-cx q[4],q[13];
-cx q[5],q[13];
-rz(5.70381642468168) q[13];
-cx q[5],q[13];
-ry(pi/2) q[14];
-rx(pi) q[14];
-cx q[3],q[14];
-rz(5.70381642468168) q[14];
-cx q[3],q[14];
-cx q[4],q[14];
-rz(5.70381642468168) q[14];
-cx q[4],q[14];
-rx(10.168461270732157) q[14];
-ry(pi/2) q[15];
-rx(pi) q[15];
-cx q[0],q[15];
-rz(5.70381642468168) q[15];
-cx q[0],q[15];
-cx q[3],q[15];
-rz(5.70381642468168) q[15];
-cx q[3],q[15];
-ry(pi/2) q[16];
-rx(pi) q[16];
-cx q[0],q[16];
-rz(5.70381642468168) q[16];
-cx q[0],q[16];
-cx q[3],q[16];
-rz(5.70381642468168) q[16];
-cx q[3],q[16];
-ry(pi/2) q[17];
-rx(pi) q[17];
-cx q[1],q[17];
-rz(5.70381642468168) q[17];
-cx q[1],q[17];
-cx q[3],q[17];
-rz(5.70381642468168) q[17];
-cx q[3],q[17];
-ry(pi/2) q[18];
-rx(pi) q[18];
-cx q[3],q[18];
-rz(5.70381642468168) q[18];
-cx q[3],q[18];
-cx q[4],q[18];
-rz(5.70381642468168) q[18];
-cx q[4],q[18];
-ry(pi/2) q[19];
-rx(pi) q[19];
-cx q[3],q[19];
-rz(5.70381642468168) q[19];
-cx q[3],q[19];
-cx q[7],q[19];
-rz(5.70381642468168) q[19];
-cx q[7],q[19];
-ry(pi/2) q[20];
-rx(pi) q[20];
-cx q[0],q[20];
-rz(5.70381642468168) q[20];
-cx q[0],q[20];
-cx q[15],q[20];
-rz(5.70381642468168) q[20];
-cx q[15],q[20];
-ry(pi/2) q[21];
-rx(pi) q[21];
-cx q[4],q[21];
-rz(5.70381642468168) q[21];
-cx q[4],q[21];
-cx q[15],q[21];
-rz(5.70381642468168) q[21];
-cx q[15],q[21];
-ry(pi/2) q[22];
-rx(pi) q[22];
-cx q[3],q[22];
-rz(5.70381642468168) q[22];
-cx q[3],q[22];
-cx q[9],q[22];
-rz(5.70381642468168) q[22];
-cx q[9],q[22];
-rx(10.168461270732157) q[22];
-ry(pi/2) q[23];
-rx(pi) q[23];
-cx q[3],q[23];
-rz(5.70381642468168) q[23];
-cx q[3],q[23];
-cx q[17],q[23];
-rz(5.70381642468168) q[23];
-cx q[17],q[23];
-ry(pi/2) q[24];
-rx(pi) q[24];
-cx q[3],q[24];
-rz(5.70381642468168) q[24];
-cx q[3],q[24];
-cx q[5],q[24];
-rz(5.70381642468168) q[24];
-cx q[5],q[24];
-ry(pi/2) q[25];
-rx(pi) q[25];
-cx q[3],q[25];
-rz(5.70381642468168) q[25];
-cx q[3],q[25];
-cx q[12],q[25];
-rz(5.70381642468168) q[25];
-cx q[12],q[25];
-ry(pi/2) q[26];
-rx(pi) q[26];
-cx q[3],q[26];
-rz(5.70381642468168) q[26];
-cx q[3],q[26];
-cx q[21],q[26];
-rz(5.70381642468168) q[26];
-cx q[21],q[26];
-ry(pi/2) q[27];
-rx(pi) q[27];
-cx q[4],q[27];
-rz(5.70381642468168) q[27];
-cx q[4],q[27];
-cx q[6],q[27];
-rz(5.70381642468168) q[27];
-cx q[6],q[27];
-ry(pi/2) q[28];
-rx(pi) q[28];
-cx q[1],q[28];
-rz(5.70381642468168) q[28];
-cx q[1],q[28];
-cx q[3],q[28];
-rz(5.70381642468168) q[28];
-cx q[3],q[28];
-ry(pi/2) q[29];
-rx(pi) q[29];
-cx q[1],q[29];
-rz(5.70381642468168) q[29];
-cx q[1],q[29];
-cx q[3],q[29];
-rz(5.70381642468168) q[29];
-cx q[3],q[29];
-rx(10.168461270732157) q[29];
-ry(pi/2) q[30];
-rx(pi) q[30];
-cx q[3],q[30];
-rz(5.70381642468168) q[30];
-cx q[3],q[30];
-cx q[18],q[30];
-rz(5.70381642468168) q[30];
-cx q[18],q[30];
-rx(10.168461270732157) q[18];
-ry(pi/2) q[31];
-rx(pi) q[31];
-cx q[12],q[31];
-rz(5.70381642468168) q[31];
-cx q[12],q[31];
-cx q[26],q[31];
-rz(5.70381642468168) q[31];
-cx q[26],q[31];
-ry(pi/2) q[32];
-rx(pi) q[32];
-cx q[0],q[32];
-rz(5.70381642468168) q[32];
-cx q[0],q[32];
-cx q[21],q[32];
-rz(5.70381642468168) q[32];
-cx q[21],q[32];
-ry(pi/2) q[33];
-rx(pi) q[33];
-cx q[5],q[33];
-rz(5.70381642468168) q[33];
-cx q[5],q[33];
-cx q[30],q[33];
-rz(5.70381642468168) q[33];
-cx q[30],q[33];
-rx(10.168461270732157) q[33];
-ry(pi/2) q[34];
-rx(pi) q[34];
-cx q[3],q[34];
-rz(5.70381642468168) q[34];
-cx q[3],q[34];
-cx q[12],q[34];
-rz(5.70381642468168) q[34];
-cx q[12],q[34];
-ry(pi/2) q[35];
-rx(pi) q[35];
-cx q[3],q[35];
-rz(5.70381642468168) q[35];
-cx q[3],q[35];
-cx q[32],q[35];
-rz(5.70381642468168) q[35];
-cx q[32],q[35];
-rx(10.168461270732157) q[35];
-ry(pi/2) q[36];
-rx(pi) q[36];
-cx q[15],q[36];
-rz(5.70381642468168) q[36];
-cx q[15],q[36];
-cx q[20],q[36];
-rz(5.70381642468168) q[36];
-cx q[20],q[36];
-ry(pi/2) q[37];
-rx(pi) q[37];
-cx q[10],q[37];
-rz(5.70381642468168) q[37];
-cx q[10],q[37];
-cx q[34],q[37];
-rz(5.70381642468168) q[37];
-cx q[34],q[37];
-rx(10.168461270732157) q[34];
-ry(pi/2) q[38];
-rx(pi) q[38];
-cx q[19],q[38];
-rz(5.70381642468168) q[38];
-cx q[19],q[38];
-rx(10.168461270732157) q[19];
-cx q[21],q[38];
-rz(5.70381642468168) q[38];
-cx q[21],q[38];
-ry(pi/2) q[39];
-rx(pi) q[39];
-cx q[3],q[39];
-rz(5.70381642468168) q[39];
-cx q[3],q[39];
-cx q[13],q[39];
-rz(5.70381642468168) q[39];
-cx q[13],q[39];
-ry(pi/2) q[40];
-rx(pi) q[40];
-cx q[3],q[40];
-rz(5.70381642468168) q[40];
-cx q[3],q[40];
-cx q[23],q[40];
-rz(5.70381642468168) q[40];
-cx q[23],q[40];
-ry(pi/2) q[41];
-rx(pi) q[41];
-cx q[10],q[41];
-rz(5.70381642468168) q[41];
-cx q[10],q[41];
-cx q[27],q[41];
-rz(5.70381642468168) q[41];
-cx q[27],q[41];
-ry(pi/2) q[42];
-rx(pi) q[42];
-cx q[0],q[42];
-rz(5.70381642468168) q[42];
-cx q[0],q[42];
-cx q[3],q[42];
-rz(5.70381642468168) q[42];
-cx q[3],q[42];
-ry(pi/2) q[43];
-rx(pi) q[43];
-cx q[3],q[43];
-rz(5.70381642468168) q[43];
-cx q[3],q[43];
-cx q[20],q[43];
-rz(5.70381642468168) q[43];
-cx q[20],q[43];
-rx(10.168461270732157) q[43];
-ry(pi/2) q[44];
-rx(pi) q[44];
-cx q[3],q[44];
-rz(5.70381642468168) q[44];
-cx q[3],q[44];
-cx q[12],q[44];
-rz(5.70381642468168) q[44];
-cx q[12],q[44];
-ry(pi/2) q[45];
-rx(pi) q[45];
-cx q[1],q[45];
-rz(5.70381642468168) q[45];
-cx q[1],q[45];
-cx q[16],q[45];
-rz(5.70381642468168) q[45];
-cx q[16],q[45];
-ry(pi/2) q[46];
-rx(pi) q[46];
-cx q[5],q[46];
-rz(5.70381642468168) q[46];
-cx q[5],q[46];
-cx q[38],q[46];
-rz(5.70381642468168) q[46];
-cx q[38],q[46];
-rx(10.168461270732157) q[38];
-ry(pi/2) q[47];
-rx(pi) q[47];
-cx q[4],q[47];
-rz(5.70381642468168) q[47];
-cx q[4],q[47];
-cx q[17],q[47];
-rz(5.70381642468168) q[47];
-cx q[17],q[47];
-ry(pi/2) q[48];
-rx(pi) q[48];
-cx q[0],q[48];
-rz(5.70381642468168) q[48];
-cx q[0],q[48];
-cx q[30],q[48];
-rz(5.70381642468168) q[48];
-cx q[30],q[48];
-rx(10.168461270732157) q[48];
-ry(pi/2) q[49];
-rx(pi) q[49];
-cx q[3],q[49];
-rz(5.70381642468168) q[49];
-cx q[3],q[49];
-cx q[4],q[49];
-rz(5.70381642468168) q[49];
-cx q[4],q[49];
-rx(10.168461270732157) q[49];
-ry(pi/2) q[50];
-rx(pi) q[50];
-cx q[3],q[50];
-rz(5.70381642468168) q[50];
-cx q[3],q[50];
-cx q[12],q[50];
-rz(5.70381642468168) q[50];
-cx q[12],q[50];
-ry(pi/2) q[51];
-rx(pi) q[51];
-cx q[0],q[51];
-rz(5.70381642468168) q[51];
-cx q[0],q[51];
-cx q[28],q[51];
-rz(5.70381642468168) q[51];
-cx q[28],q[51];
-rx(10.168461270732157) q[51];
-ry(pi/2) q[52];
-rx(pi) q[52];
-cx q[3],q[52];
-rz(5.70381642468168) q[52];
-cx q[3],q[52];
-cx q[10],q[52];
-rz(5.70381642468168) q[52];
-cx q[10],q[52];
-ry(pi/2) q[53];
-rx(pi) q[53];
-cx q[17],q[53];
-rz(5.70381642468168) q[53];
-cx q[17],q[53];
-cx q[21],q[53];
-rz(5.70381642468168) q[53];
-cx q[21],q[53];
-ry(pi/2) q[54];
-rx(pi) q[54];
-cx q[24],q[54];
-rz(5.70381642468168) q[54];
-cx q[24],q[54];
-cx q[28],q[54];
-rz(5.70381642468168) q[54];
-cx q[28],q[54];
-rx(10.168461270732157) q[54];
-ry(pi/2) q[55];
-rx(pi) q[55];
-cx q[9],q[55];
-rz(5.70381642468168) q[55];
-cx q[9],q[55];
-cx q[15],q[55];
-rz(5.70381642468168) q[55];
-cx q[15],q[55];
-ry(pi/2) q[56];
-rx(pi) q[56];
-cx q[13],q[56];
-rz(5.70381642468168) q[56];
-cx q[13],q[56];
-cx q[45],q[56];
-rz(5.70381642468168) q[56];
-cx q[45],q[56];
-rx(10.168461270732157) q[45];
-ry(pi/2) q[57];
-rx(pi) q[57];
-cx q[1],q[57];
-rz(5.70381642468168) q[57];
-cx q[1],q[57];
-cx q[3],q[57];
-rz(5.70381642468168) q[57];
-cx q[3],q[57];
-ry(pi/2) q[58];
-rx(pi) q[58];
-cx q[24],q[58];
-rz(5.70381642468168) q[58];
-cx q[24],q[58];
-cx q[28],q[58];
-rz(5.70381642468168) q[58];
-cx q[28],q[58];
-rx(10.168461270732157) q[58];
-ry(pi/2) q[59];
-rx(pi) q[59];
-cx q[16],q[59];
-rz(5.70381642468168) q[59];
-cx q[16],q[59];
-cx q[32],q[59];
-rz(5.70381642468168) q[59];
-cx q[32],q[59];
-ry(pi/2) q[60];
-rx(pi) q[60];
-cx q[1],q[60];
-rz(5.70381642468168) q[60];
-cx q[1],q[60];
-cx q[7],q[60];
-rz(5.70381642468168) q[60];
-cx q[7],q[60];
-ry(pi/2) q[61];
-rx(pi) q[61];
-cx q[4],q[61];
-rz(5.70381642468168) q[61];
-cx q[4],q[61];
-cx q[7],q[61];
-rz(5.70381642468168) q[61];
-cx q[7],q[61];
-rx(10.168461270732157) q[61];
-ry(pi/2) q[62];
-rx(pi) q[62];
-cx q[0],q[62];
-rz(5.70381642468168) q[62];
-cx q[0],q[62];
-cx q[17],q[62];
-rz(5.70381642468168) q[62];
-cx q[17],q[62];
-rx(10.168461270732157) q[62];
-ry(pi/2) q[63];
-rx(pi) q[63];
-cx q[12],q[63];
-rz(5.70381642468168) q[63];
-cx q[12],q[63];
-rx(10.168461270732157) q[12];
-cx q[17],q[63];
-rz(5.70381642468168) q[63];
-cx q[17],q[63];
-ry(pi/2) q[64];
-rx(pi) q[64];
-cx q[0],q[64];
-rz(5.70381642468168) q[64];
-cx q[0],q[64];
-cx q[10],q[64];
-rz(5.70381642468168) q[64];
-cx q[10],q[64];
-rx(10.168461270732157) q[64];
-ry(pi/2) q[65];
-rx(pi) q[65];
-cx q[5],q[65];
-rz(5.70381642468168) q[65];
-cx q[5],q[65];
-cx q[23],q[65];
-rz(5.70381642468168) q[65];
-cx q[23],q[65];
-rx(10.168461270732157) q[23];
-rx(10.168461270732157) q[65];
-ry(pi/2) q[66];
-rx(pi) q[66];
-cx q[17],q[66];
-rz(5.70381642468168) q[66];
-cx q[17],q[66];
-rx(10.168461270732157) q[17];
-cx q[47],q[66];
-rz(5.70381642468168) q[66];
-cx q[47],q[66];
-rx(10.168461270732157) q[47];
-rx(10.168461270732157) q[66];
-ry(pi/2) q[67];
-rx(pi) q[67];
-cx q[41],q[67];
-rz(5.70381642468168) q[67];
-cx q[41],q[67];
-cx q[56],q[67];
-rz(5.70381642468168) q[67];
-cx q[56],q[67];
-rx(10.168461270732157) q[67];
-ry(pi/2) q[68];
-rx(pi) q[68];
-cx q[13],q[68];
-rz(5.70381642468168) q[68];
-cx q[13],q[68];
-cx q[32],q[68];
-rz(5.70381642468168) q[68];
-cx q[32],q[68];
-ry(pi/2) q[69];
-rx(pi) q[69];
-cx q[6],q[69];
-rz(5.70381642468168) q[69];
-cx q[6],q[69];
-cx q[59],q[69];
-rz(5.70381642468168) q[69];
-cx q[59],q[69];
-ry(pi/2) q[70];
-rx(pi) q[70];
-cx q[3],q[70];
-rz(5.70381642468168) q[70];
-cx q[3],q[70];
-cx q[15],q[70];
-rz(5.70381642468168) q[70];
-cx q[15],q[70];
-ry(pi/2) q[71];
-rx(pi) q[71];
-cx q[3],q[71];
-rz(5.70381642468168) q[71];
-cx q[3],q[71];
-cx q[53],q[71];
-rz(5.70381642468168) q[71];
-cx q[53],q[71];
-rx(10.168461270732157) q[71];
-ry(pi/2) q[72];
-rx(pi) q[72];
-cx q[27],q[72];
-rz(5.70381642468168) q[72];
-cx q[27],q[72];
-cx q[44],q[72];
-rz(5.70381642468168) q[72];
-cx q[44],q[72];
-rx(10.168461270732157) q[44];
-rx(10.168461270732157) q[72];
-ry(pi/2) q[73];
-rx(pi) q[73];
-cx q[16],q[73];
-rz(5.70381642468168) q[73];
-cx q[16],q[73];
-cx q[59],q[73];
-rz(5.70381642468168) q[73];
-cx q[59],q[73];
-ry(pi/2) q[74];
-rx(pi) q[74];
-cx q[56],q[74];
-rz(5.70381642468168) q[74];
-cx q[56],q[74];
-cx q[63],q[74];
-rz(5.70381642468168) q[74];
-cx q[63],q[74];
-rx(10.168461270732157) q[74];
-ry(pi/2) q[75];
-rx(pi) q[75];
-cx q[0],q[75];
-rz(5.70381642468168) q[75];
-cx q[0],q[75];
-cx q[21],q[75];
-rz(5.70381642468168) q[75];
-cx q[21],q[75];
-rx(10.168461270732157) q[75];
-ry(pi/2) q[76];
-rx(pi) q[76];
-cx q[5],q[76];
-rz(5.70381642468168) q[76];
-cx q[5],q[76];
-cx q[6],q[76];
-rz(5.70381642468168) q[76];
-cx q[6],q[76];
-rx(10.168461270732157) q[76];
-ry(pi/2) q[77];
-rx(pi) q[77];
-cx q[3],q[77];
-rz(5.70381642468168) q[77];
-cx q[3],q[77];
-cx q[30],q[77];
-rz(5.70381642468168) q[77];
-cx q[30],q[77];
-rx(10.168461270732157) q[30];
-ry(pi/2) q[78];
-rx(pi) q[78];
-cx q[42],q[78];
-rz(5.70381642468168) q[78];
-cx q[42],q[78];
-cx q[60],q[78];
-rz(5.70381642468168) q[78];
-cx q[60],q[78];
-rx(10.168461270732157) q[78];
-ry(pi/2) q[79];
-rx(pi) q[79];
-cx q[6],q[79];
-rz(5.70381642468168) q[79];
-cx q[6],q[79];
-cx q[50],q[79];
-rz(5.70381642468168) q[79];
-cx q[50],q[79];
-rx(10.168461270732157) q[79];
-ry(pi/2) q[80];
-rx(pi) q[80];
-cx q[9],q[80];
-rz(5.70381642468168) q[80];
-cx q[9],q[80];
-rx(10.168461270732157) q[9];
-cx q[15],q[80];
-rz(5.70381642468168) q[80];
-cx q[15],q[80];
-rx(10.168461270732157) q[80];
-ry(pi/2) q[81];
-rx(pi) q[81];
-cx q[21],q[81];
-rz(5.70381642468168) q[81];
-cx q[21],q[81];
-cx q[77],q[81];
-rz(5.70381642468168) q[81];
-cx q[77],q[81];
-rx(10.168461270732157) q[77];
-ry(pi/2) q[82];
-rx(pi) q[82];
-cx q[0],q[82];
-rz(5.70381642468168) q[82];
-cx q[0],q[82];
-cx q[56],q[82];
-rz(5.70381642468168) q[82];
-cx q[56],q[82];
-rx(10.168461270732157) q[82];
-ry(pi/2) q[83];
-rx(pi) q[83];
-cx q[8],q[83];
-rz(5.70381642468168) q[83];
-cx q[8],q[83];
-rx(10.168461270732157) q[8];
-cx q[68],q[83];
-rz(5.70381642468168) q[83];
-cx q[68],q[83];
-rx(10.168461270732157) q[68];
-rx(10.168461270732157) q[83];
-ry(pi/2) q[84];
-rx(pi) q[84];
-cx q[70],q[84];
-rz(5.70381642468168) q[84];
-cx q[70],q[84];
-rx(10.168461270732157) q[70];
-cx q[73],q[84];
-rz(5.70381642468168) q[84];
-cx q[73],q[84];
-rx(10.168461270732157) q[73];
-rx(10.168461270732157) q[84];
-ry(pi/2) q[85];
-rx(pi) q[85];
-cx q[37],q[85];
-rz(5.70381642468168) q[85];
-cx q[37],q[85];
-rx(10.168461270732157) q[37];
-cx q[59],q[85];
-rz(5.70381642468168) q[85];
-cx q[59],q[85];
-rx(10.168461270732157) q[59];
-rx(10.168461270732157) q[85];
-ry(pi/2) q[86];
-rx(pi) q[86];
-cx q[24],q[86];
-rz(5.70381642468168) q[86];
-cx q[24],q[86];
-cx q[53],q[86];
-rz(5.70381642468168) q[86];
-cx q[53],q[86];
-rx(10.168461270732157) q[53];
-rx(10.168461270732157) q[86];
-ry(pi/2) q[87];
-rx(pi) q[87];
-cx q[28],q[87];
-rz(5.70381642468168) q[87];
-cx q[28],q[87];
-cx q[32],q[87];
-rz(5.70381642468168) q[87];
-cx q[32],q[87];
-rx(10.168461270732157) q[87];
-ry(pi/2) q[88];
-rx(pi) q[88];
-cx q[3],q[88];
-rz(5.70381642468168) q[88];
-cx q[3],q[88];
-cx q[60],q[88];
-rz(5.70381642468168) q[88];
-cx q[60],q[88];
-rx(10.168461270732157) q[60];
-rx(10.168461270732157) q[88];
-ry(pi/2) q[89];
-rx(pi) q[89];
-cx q[2],q[89];
-rz(5.70381642468168) q[89];
-cx q[2],q[89];
-rx(10.168461270732157) q[2];
-cx q[5],q[89];
-rz(5.70381642468168) q[89];
-cx q[5],q[89];
-ry(pi/2) q[90];
-rx(pi) q[90];
-cx q[15],q[90];
-rz(5.70381642468168) q[90];
-cx q[15],q[90];
-cx q[27],q[90];
-rz(5.70381642468168) q[90];
-cx q[27],q[90];
-rx(10.168461270732157) q[90];
-ry(pi/2) q[91];
-rx(pi) q[91];
-cx q[0],q[91];
-rz(5.70381642468168) q[91];
-cx q[0],q[91];
-cx q[6],q[91];
-rz(5.70381642468168) q[91];
-cx q[6],q[91];
-rx(10.168461270732157) q[6];
-rx(10.168461270732157) q[91];
-ry(pi/2) q[92];
-rx(pi) q[92];
-cx q[15],q[92];
-rz(5.70381642468168) q[92];
-cx q[15],q[92];
-cx q[89],q[92];
-rz(5.70381642468168) q[92];
-cx q[89],q[92];
-rx(10.168461270732157) q[89];
-ry(pi/2) q[93];
-rx(pi) q[93];
-cx q[0],q[93];
-rz(5.70381642468168) q[93];
-cx q[0],q[93];
-cx q[32],q[93];
-rz(5.70381642468168) q[93];
-cx q[32],q[93];
-rx(10.168461270732157) q[93];
-ry(pi/2) q[94];
-rx(pi) q[94];
-cx q[36],q[94];
-rz(5.70381642468168) q[94];
-cx q[36],q[94];
-cx q[55],q[94];
-rz(5.70381642468168) q[94];
-cx q[55],q[94];
-rx(10.168461270732157) q[55];
-ry(pi/2) q[95];
-rx(pi) q[95];
-cx q[5],q[95];
-rz(5.70381642468168) q[95];
-cx q[5],q[95];
-cx q[27],q[95];
-rz(5.70381642468168) q[95];
-cx q[27],q[95];
-rx(10.168461270732157) q[27];
-rx(10.168461270732157) q[95];
-ry(pi/2) q[96];
-rx(pi) q[96];
-cx q[56],q[96];
-rz(5.70381642468168) q[96];
-cx q[56],q[96];
-rx(10.168461270732157) q[56];
-cx q[92],q[96];
-rz(5.70381642468168) q[96];
-cx q[92],q[96];
-rx(10.168461270732157) q[96];
-ry(pi/2) q[97];
-rx(pi) q[97];
-cx q[1],q[97];
-rz(5.70381642468168) q[97];
-cx q[1],q[97];
-cx q[7],q[97];
-rz(5.70381642468168) q[97];
-cx q[7],q[97];
-rx(10.168461270732157) q[97];
-ry(pi/2) q[98];
-rx(pi) q[98];
-cx q[10],q[98];
-rz(5.70381642468168) q[98];
-cx q[10],q[98];
-rx(10.168461270732157) q[10];
-cx q[21],q[98];
-rz(5.70381642468168) q[98];
-cx q[21],q[98];
-rx(10.168461270732157) q[98];
-ry(pi/2) q[99];
-rx(pi) q[99];
-cx q[4],q[99];
-rz(5.70381642468168) q[99];
-cx q[4],q[99];
-cx q[41],q[99];
-rz(5.70381642468168) q[99];
-cx q[41],q[99];
-rx(10.168461270732157) q[41];
-rx(10.168461270732157) q[99];
-ry(pi/2) q[100];
-rx(pi) q[100];
-cx q[3],q[100];
-rz(5.70381642468168) q[100];
-cx q[3],q[100];
-cx q[25],q[100];
-rz(5.70381642468168) q[100];
-cx q[25],q[100];
-rx(10.168461270732157) q[25];
-rx(10.168461270732157) q[100];
-ry(pi/2) q[101];
-rx(pi) q[101];
-cx q[16],q[101];
-rz(5.70381642468168) q[101];
-cx q[16],q[101];
-cx q[50],q[101];
-rz(5.70381642468168) q[101];
-cx q[50],q[101];
-rx(10.168461270732157) q[50];
-rx(10.168461270732157) q[101];
-ry(pi/2) q[102];
-rx(pi) q[102];
-cx q[3],q[102];
-rz(5.70381642468168) q[102];
-cx q[3],q[102];
-cx q[4],q[102];
-rz(5.70381642468168) q[102];
-cx q[4],q[102];
-rx(10.168461270732157) q[4];
-rx(10.168461270732157) q[102];
-ry(pi/2) q[103];
-rx(pi) q[103];
-cx q[16],q[103];
-rz(5.70381642468168) q[103];
-cx q[16],q[103];
-rx(10.168461270732157) q[16];
-cx q[57],q[103];
-rz(5.70381642468168) q[103];
-cx q[57],q[103];
-rx(10.168461270732157) q[57];
-rx(10.168461270732157) q[103];
-ry(pi/2) q[104];
-rx(pi) q[104];
-cx q[7],q[104];
-rz(5.70381642468168) q[104];
-cx q[7],q[104];
-rx(10.168461270732157) q[7];
-cx q[13],q[104];
-rz(5.70381642468168) q[104];
-cx q[13],q[104];
-rx(10.168461270732157) q[13];
-ry(pi/2) q[105];
-rx(pi) q[105];
-cx q[26],q[105];
-rz(5.70381642468168) q[105];
-cx q[26],q[105];
-cx q[28],q[105];
-rz(5.70381642468168) q[105];
-cx q[28],q[105];
-rx(10.168461270732157) q[105];
-ry(pi/2) q[106];
-rx(pi) q[106];
-cx q[5],q[106];
-rz(5.70381642468168) q[106];
-cx q[5],q[106];
-cx q[36],q[106];
-rz(5.70381642468168) q[106];
-cx q[36],q[106];
-rx(10.168461270732157) q[106];
-ry(pi/2) q[107];
-rx(pi) q[107];
-cx q[3],q[107];
-rz(5.70381642468168) q[107];
-cx q[3],q[107];
-cx q[31],q[107];
-rz(5.70381642468168) q[107];
-cx q[31],q[107];
-rx(10.168461270732157) q[107];
-ry(pi/2) q[108];
-rx(pi) q[108];
-cx q[15],q[108];
-rz(5.70381642468168) q[108];
-cx q[15],q[108];
-cx q[31],q[108];
-rz(5.70381642468168) q[108];
-cx q[31],q[108];
-rx(10.168461270732157) q[31];
-rx(10.168461270732157) q[108];
-ry(pi/2) q[109];
-rx(pi) q[109];
-cx q[5],q[109];
-rz(5.70381642468168) q[109];
-cx q[5],q[109];
-cx q[39],q[109];
-rz(5.70381642468168) q[109];
-cx q[39],q[109];
-rx(10.168461270732157) q[39];
-rx(10.168461270732157) q[109];
-ry(pi/2) q[110];
-rx(pi) q[110];
-cx q[3],q[110];
-rz(5.70381642468168) q[110];
-cx q[3],q[110];
-cx q[24],q[110];
-rz(5.70381642468168) q[110];
-cx q[24],q[110];
-rx(10.168461270732157) q[24];
-ry(pi/2) q[111];
-rx(pi) q[111];
-cx q[3],q[111];
-rz(5.70381642468168) q[111];
-cx q[3],q[111];
-cx q[21],q[111];
-rz(5.70381642468168) q[111];
-cx q[21],q[111];
-rx(10.168461270732157) q[111];
-ry(pi/2) q[112];
-rx(pi) q[112];
-cx q[21],q[112];
-rz(5.70381642468168) q[112];
-cx q[21],q[112];
-rx(10.168461270732157) q[21];
-cx q[36],q[112];
-rz(5.70381642468168) q[112];
-cx q[36],q[112];
-rx(10.168461270732157) q[36];
-rx(10.168461270732157) q[112];
-ry(pi/2) q[113];
-rx(pi) q[113];
-cx q[1],q[113];
-rz(5.70381642468168) q[113];
-cx q[1],q[113];
-rx(10.168461270732157) q[1];
-cx q[3],q[113];
-rz(5.70381642468168) q[113];
-cx q[3],q[113];
-rx(10.168461270732157) q[3];
-rx(10.168461270732157) q[113];
-ry(pi/2) q[114];
-rx(pi) q[114];
-cx q[104],q[114];
-rz(5.70381642468168) q[114];
-cx q[104],q[114];
-cx q[110],q[114];
-rz(5.70381642468168) q[114];
-cx q[110],q[114];
-rx(10.168461270732157) q[110];
-rx(10.168461270732157) q[114];
-ry(pi/2) q[115];
-rx(pi) q[115];
-cx q[15],q[115];
-rz(5.70381642468168) q[115];
-cx q[15],q[115];
-cx q[92],q[115];
-rz(5.70381642468168) q[115];
-cx q[92],q[115];
-rx(10.168461270732157) q[92];
-rx(10.168461270732157) q[115];
-ry(pi/2) q[116];
-rx(pi) q[116];
-cx q[28],q[116];
-rz(5.70381642468168) q[116];
-cx q[28],q[116];
-rx(10.168461270732157) q[28];
-cx q[42],q[116];
-rz(5.70381642468168) q[116];
-cx q[42],q[116];
-rx(10.168461270732157) q[42];
-rx(10.168461270732157) q[116];
-ry(pi/2) q[117];
-rx(pi) q[117];
-cx q[26],q[117];
-rz(5.70381642468168) q[117];
-cx q[26],q[117];
-rx(10.168461270732157) q[26];
-cx q[32],q[117];
-rz(5.70381642468168) q[117];
-cx q[32],q[117];
-rx(10.168461270732157) q[32];
-rx(10.168461270732157) q[117];
-ry(pi/2) q[118];
-rx(pi) q[118];
-cx q[5],q[118];
-rz(5.70381642468168) q[118];
-cx q[5],q[118];
-rx(10.168461270732157) q[5];
-cx q[15],q[118];
-rz(5.70381642468168) q[118];
-cx q[15],q[118];
-rx(10.168461270732157) q[15];
-rx(10.168461270732157) q[118];
-ry(pi/2) q[119];
-rx(pi) q[119];
-cx q[40],q[119];
-rz(5.70381642468168) q[119];
-cx q[40],q[119];
-rx(10.168461270732157) q[40];
-cx q[69],q[119];
-rz(5.70381642468168) q[119];
-cx q[69],q[119];
-rx(10.168461270732157) q[69];
-rx(10.168461270732157) q[119];
-ry(pi/2) q[120];
-rx(pi) q[120];
-cx q[46],q[120];
-rz(5.70381642468168) q[120];
-cx q[46],q[120];
-rx(10.168461270732157) q[46];
-cx q[94],q[120];
-rz(5.70381642468168) q[120];
-cx q[94],q[120];
-rx(10.168461270732157) q[94];
-rx(10.168461270732157) q[120];
-ry(pi/2) q[121];
-rx(pi) q[121];
-cx q[20],q[121];
-rz(5.70381642468168) q[121];
-cx q[20],q[121];
-rx(10.168461270732157) q[20];
-cx q[104],q[121];
-rz(5.70381642468168) q[121];
-cx q[104],q[121];
-rx(10.168461270732157) q[104];
-rx(10.168461270732157) q[121];
-ry(pi/2) q[122];
-rx(pi) q[122];
-cx q[63],q[122];
-rz(5.70381642468168) q[122];
-cx q[63],q[122];
-rx(10.168461270732157) q[63];
-cx q[81],q[122];
-rz(5.70381642468168) q[122];
-cx q[81],q[122];
-rx(10.168461270732157) q[81];
-rx(10.168461270732157) q[122];
-ry(pi/2) q[123];
-rx(pi) q[123];
-cx q[0],q[123];
-rz(5.70381642468168) q[123];
-cx q[0],q[123];
-rx(10.168461270732157) q[0];
-cx q[0],q[1];
-rz(5.369912692098647) q[1];
-cx q[0],q[1];
-cx q[0],q[2];
-rz(5.369912692098647) q[2];
-cx q[0],q[2];
-cx q[0],q[3];
-cx q[2],q[89];
-rz(5.369912692098647) q[3];
-cx q[0],q[3];
-cx q[0],q[15];
-cx q[1],q[3];
-rz(5.369912692098647) q[3];
-cx q[1],q[3];
-cx q[1],q[4];
-rz(5.369912692098647) q[4];
-cx q[1],q[4];
-cx q[1],q[5];
-cx q[3],q[4];
-rz(5.369912692098647) q[4];
-cx q[3],q[4];
-cx q[4],q[6];
-rz(5.369912692098647) q[5];
-cx q[1],q[5];
-cx q[1],q[9];
-cx q[3],q[5];
-rz(5.369912692098647) q[5];
-cx q[3],q[5];
-cx q[3],q[7];
-rz(5.369912692098647) q[6];
-cx q[4],q[6];
-cx q[5],q[6];
-rz(5.369912692098647) q[6];
-cx q[5],q[6];
-rz(5.369912692098647) q[7];
-cx q[3],q[7];
-cx q[3],q[8];
-cx q[4],q[7];
-rz(5.369912692098647) q[7];
-cx q[4],q[7];
-cx q[4],q[10];
-rz(5.369912692098647) q[8];
-cx q[3],q[8];
-cx q[5],q[8];
-rz(5.369912692098647) q[8];
-cx q[5],q[8];
-cx q[5],q[11];
-cx q[8],q[83];
-rz(5.369912692098647) q[9];
-cx q[1],q[9];
-cx q[1],q[17];
-cx q[3],q[9];
-rz(5.369912692098647) q[9];
-cx q[3],q[9];
-cx q[3],q[12];
-rz(5.369912692098647) q[10];
-cx q[4],q[10];
-cx q[4],q[13];
-cx q[6],q[10];
-rz(5.369912692098647) q[10];
-cx q[6],q[10];
-cx q[10],q[37];
-rz(5.369912692098647) q[11];
-cx q[5],q[11];
-cx q[6],q[11];
-rz(5.369912692098647) q[11];
-cx q[6],q[11];
-rx(5.784552394117822) q[11];
-rz(5.369912692098647) q[12];
-cx q[3],q[12];
-cx q[3],q[14];
-cx q[5],q[12];
-rz(5.369912692098647) q[12];
-cx q[5],q[12];
-rz(5.369912692098647) q[13];
-cx q[4],q[13];
-cx q[5],q[13];
-rz(5.369912692098647) q[13];
-cx q[5],q[13];
-rz(5.369912692098647) q[14];
-cx q[3],q[14];
-cx q[4],q[14];
-rz(5.369912692098647) q[14];
-cx q[4],q[14];
-rx(5.784552394117822) q[14];
-rz(5.369912692098647) q[15];
-cx q[0],q[15];
-cx q[0],q[16];
-cx q[3],q[15];
-rz(5.369912692098647) q[15];
-cx q[3],q[15];
-rz(5.369912692098647) q[16];
-cx q[0],q[16];
-cx q[0],q[20];
-cx q[3],q[16];
-rz(5.369912692098647) q[16];
-cx q[3],q[16];
-rz(5.369912692098647) q[17];
-cx q[1],q[17];
-cx q[1],q[28];
-cx q[3],q[17];
-rz(5.369912692098647) q[17];
-cx q[3],q[17];
-cx q[3],q[18];
-rz(5.369912692098647) q[18];
-cx q[3],q[18];
-cx q[3],q[19];
-cx q[4],q[18];
-rz(5.369912692098647) q[18];
-cx q[4],q[18];
-cx q[4],q[21];
-rz(5.369912692098647) q[19];
-cx q[3],q[19];
-cx q[3],q[22];
-cx q[7],q[19];
-rz(5.369912692098647) q[19];
-cx q[7],q[19];
-cx q[19],q[38];
-rz(5.369912692098647) q[20];
-cx q[0],q[20];
-cx q[0],q[32];
-cx q[15],q[20];
-rz(5.369912692098647) q[20];
-cx q[15],q[20];
-rz(5.369912692098647) q[21];
-cx q[4],q[21];
-cx q[4],q[27];
-cx q[15],q[21];
-rz(5.369912692098647) q[21];
-cx q[15],q[21];
-cx q[15],q[36];
-rz(5.369912692098647) q[22];
-cx q[3],q[22];
-cx q[3],q[23];
-cx q[9],q[22];
-rz(5.369912692098647) q[22];
-cx q[9],q[22];
-cx q[9],q[55];
-rx(5.784552394117822) q[22];
-rz(5.369912692098647) q[23];
-cx q[3],q[23];
-cx q[3],q[24];
-cx q[17],q[23];
-rz(5.369912692098647) q[23];
-cx q[17],q[23];
-rz(5.369912692098647) q[24];
-cx q[3],q[24];
-cx q[3],q[25];
-cx q[5],q[24];
-rz(5.369912692098647) q[24];
-cx q[5],q[24];
-cx q[5],q[33];
-cx q[24],q[54];
-rz(5.369912692098647) q[25];
-cx q[3],q[25];
-cx q[3],q[26];
-cx q[12],q[25];
-rz(5.369912692098647) q[25];
-cx q[12],q[25];
-cx q[12],q[31];
-rz(5.369912692098647) q[26];
-cx q[3],q[26];
-cx q[21],q[26];
-rz(5.369912692098647) q[26];
-cx q[21],q[26];
-rz(5.369912692098647) q[27];
-cx q[4],q[27];
-cx q[4],q[47];
-cx q[6],q[27];
-rz(5.369912692098647) q[27];
-cx q[6],q[27];
-cx q[6],q[69];
-rz(5.369912692098647) q[28];
-cx q[1],q[28];
-cx q[1],q[29];
-cx q[3],q[28];
-rz(5.369912692098647) q[28];
-cx q[3],q[28];
-rz(5.369912692098647) q[29];
-cx q[1],q[29];
-cx q[1],q[45];
-cx q[3],q[29];
-rz(5.369912692098647) q[29];
-cx q[3],q[29];
-cx q[3],q[30];
-rx(5.784552394117822) q[29];
-rz(5.369912692098647) q[30];
-cx q[3],q[30];
-cx q[3],q[34];
-cx q[18],q[30];
-rz(5.369912692098647) q[30];
-cx q[18],q[30];
-rx(5.784552394117822) q[18];
-rz(5.369912692098647) q[31];
-cx q[12],q[31];
-cx q[26],q[31];
-rz(5.369912692098647) q[31];
-cx q[26],q[31];
-cx q[26],q[105];
-rz(5.369912692098647) q[32];
-cx q[0],q[32];
-cx q[0],q[42];
-cx q[21],q[32];
-rz(5.369912692098647) q[32];
-cx q[21],q[32];
-rz(5.369912692098647) q[33];
-cx q[5],q[33];
-cx q[5],q[46];
-cx q[30],q[33];
-rz(5.369912692098647) q[33];
-cx q[30],q[33];
-rx(5.784552394117822) q[33];
-rz(5.369912692098647) q[34];
-cx q[3],q[34];
-cx q[3],q[35];
-cx q[12],q[34];
-rz(5.369912692098647) q[34];
-cx q[12],q[34];
-rz(5.369912692098647) q[35];
-cx q[3],q[35];
-cx q[3],q[39];
-cx q[32],q[35];
-rz(5.369912692098647) q[35];
-cx q[32],q[35];
-rx(5.784552394117822) q[35];
-rz(5.369912692098647) q[36];
-cx q[15],q[36];
-cx q[20],q[36];
-rz(5.369912692098647) q[36];
-cx q[20],q[36];
-cx q[36],q[94];
-rz(5.369912692098647) q[37];
-cx q[10],q[37];
-cx q[10],q[41];
-cx q[34],q[37];
-rz(5.369912692098647) q[37];
-cx q[34],q[37];
-rx(5.784552394117822) q[34];
-cx q[37],q[85];
-rz(5.369912692098647) q[38];
-cx q[19],q[38];
-rx(5.784552394117822) q[19];
-cx q[21],q[38];
-rz(5.369912692098647) q[38];
-cx q[21],q[38];
-rz(5.369912692098647) q[39];
-cx q[3],q[39];
-cx q[3],q[40];
-cx q[13],q[39];
-rz(5.369912692098647) q[39];
-cx q[13],q[39];
-cx q[13],q[56];
-rz(5.369912692098647) q[40];
-cx q[3],q[40];
-cx q[23],q[40];
-rz(5.369912692098647) q[40];
-cx q[23],q[40];
-cx q[40],q[119];
-rz(5.369912692098647) q[41];
-cx q[10],q[41];
-cx q[27],q[41];
-rz(5.369912692098647) q[41];
-cx q[27],q[41];
-cx q[27],q[72];
-cx q[41],q[67];
-rz(5.369912692098647) q[42];
-cx q[0],q[42];
-cx q[0],q[48];
-cx q[3],q[42];
-rz(5.369912692098647) q[42];
-cx q[3],q[42];
-cx q[3],q[43];
-cx q[42],q[78];
-rz(5.369912692098647) q[43];
-cx q[3],q[43];
-cx q[3],q[44];
-cx q[20],q[43];
-rz(5.369912692098647) q[43];
-cx q[20],q[43];
-cx q[20],q[121];
-rx(5.784552394117822) q[43];
-rz(5.369912692098647) q[44];
-cx q[3],q[44];
-cx q[3],q[49];
-cx q[12],q[44];
-rz(5.369912692098647) q[44];
-cx q[12],q[44];
-rz(5.369912692098647) q[45];
-cx q[1],q[45];
-cx q[1],q[57];
-cx q[16],q[45];
-rz(5.369912692098647) q[45];
-cx q[16],q[45];
-cx q[16],q[59];
-rz(5.369912692098647) q[46];
-cx q[5],q[46];
-cx q[5],q[65];
-cx q[38],q[46];
-rz(5.369912692098647) q[46];
-cx q[38],q[46];
-rx(5.784552394117822) q[38];
-cx q[46],q[120];
-rz(5.369912692098647) q[47];
-cx q[4],q[47];
-cx q[17],q[47];
-rz(5.369912692098647) q[47];
-cx q[17],q[47];
-cx q[17],q[53];
-rz(5.369912692098647) q[48];
-cx q[0],q[48];
-cx q[0],q[51];
-cx q[30],q[48];
-rz(5.369912692098647) q[48];
-cx q[30],q[48];
-rx(5.784552394117822) q[48];
-rz(5.369912692098647) q[49];
-cx q[3],q[49];
-cx q[3],q[50];
-cx q[4],q[49];
-rz(5.369912692098647) q[49];
-cx q[4],q[49];
-cx q[4],q[61];
-rx(5.784552394117822) q[49];
-rz(5.369912692098647) q[50];
-cx q[3],q[50];
-cx q[12],q[50];
-rz(5.369912692098647) q[50];
-cx q[12],q[50];
-cx q[12],q[63];
-rz(5.369912692098647) q[51];
-cx q[0],q[51];
-cx q[0],q[62];
-cx q[28],q[51];
-rz(5.369912692098647) q[51];
-cx q[28],q[51];
-rx(5.784552394117822) q[51];
-cx q[52],q[123];
-rz(5.369912692098647) q[53];
-cx q[17],q[53];
-cx q[21],q[53];
-rz(5.369912692098647) q[53];
-cx q[21],q[53];
-rz(5.369912692098647) q[54];
-cx q[24],q[54];
-cx q[24],q[58];
-cx q[28],q[54];
-rz(5.369912692098647) q[54];
-cx q[28],q[54];
-rx(5.784552394117822) q[54];
-rz(5.369912692098647) q[55];
-cx q[9],q[55];
-cx q[9],q[80];
-cx q[15],q[55];
-rz(5.369912692098647) q[55];
-cx q[15],q[55];
-rz(5.369912692098647) q[56];
-cx q[13],q[56];
-cx q[13],q[68];
-cx q[45],q[56];
-rz(5.369912692098647) q[56];
-cx q[45],q[56];
-rx(5.784552394117822) q[45];
-rz(5.369912692098647) q[57];
-cx q[1],q[57];
-cx q[1],q[60];
-rz(5.369912692098647) q[58];
-cx q[24],q[58];
-cx q[24],q[86];
-cx q[28],q[58];
-rz(5.369912692098647) q[58];
-cx q[28],q[58];
-cx q[28],q[87];
-rx(5.784552394117822) q[58];
-rz(5.369912692098647) q[59];
-cx q[16],q[59];
-cx q[16],q[73];
-cx q[32],q[59];
-rz(5.369912692098647) q[59];
-cx q[32],q[59];
-rz(5.369912692098647) q[60];
-cx q[1],q[60];
-cx q[1],q[97];
-cx q[7],q[60];
-rz(5.369912692098647) q[60];
-cx q[7],q[60];
-rz(5.369912692098647) q[61];
-cx q[4],q[61];
-cx q[4],q[99];
-cx q[7],q[61];
-rz(5.369912692098647) q[61];
-cx q[7],q[61];
-rx(5.784552394117822) q[61];
-rz(5.369912692098647) q[62];
-cx q[0],q[62];
-cx q[0],q[64];
-cx q[17],q[62];
-rz(5.369912692098647) q[62];
-cx q[17],q[62];
-rx(5.784552394117822) q[62];
-rz(5.369912692098647) q[63];
-cx q[12],q[63];
-rx(5.784552394117822) q[12];
-cx q[17],q[63];
-rz(5.369912692098647) q[63];
-cx q[17],q[63];
-cx q[17],q[66];
-rz(5.369912692098647) q[64];
-cx q[0],q[64];
-cx q[0],q[75];
-rz(5.369912692098647) q[65];
-cx q[5],q[65];
-cx q[5],q[76];
-cx q[23],q[65];
-rz(5.369912692098647) q[65];
-cx q[23],q[65];
-rx(5.784552394117822) q[23];
-rx(5.784552394117822) q[65];
-rz(5.369912692098647) q[66];
-cx q[17],q[66];
-rx(5.784552394117822) q[17];
-cx q[47],q[66];
-rz(5.369912692098647) q[66];
-cx q[47],q[66];
-rx(5.784552394117822) q[47];
-rx(5.784552394117822) q[66];
-rz(5.369912692098647) q[67];
-cx q[41],q[67];
-cx q[56],q[67];
-rz(5.369912692098647) q[67];
-cx q[56],q[67];
-cx q[56],q[74];
-rx(5.784552394117822) q[67];
-rz(5.369912692098647) q[68];
-cx q[13],q[68];
-cx q[32],q[68];
-rz(5.369912692098647) q[68];
-cx q[32],q[68];
-rz(5.369912692098647) q[69];
-cx q[6],q[69];
-cx q[59],q[69];
-rz(5.369912692098647) q[69];
-cx q[59],q[69];
-rz(5.369912692098647) q[72];
-cx q[27],q[72];
-cx q[44],q[72];
-rz(5.369912692098647) q[72];
-cx q[44],q[72];
-rx(5.784552394117822) q[44];
-rx(5.784552394117822) q[72];
-rz(5.369912692098647) q[73];
-cx q[16],q[73];
-cx q[16],q[101];
-cx q[59],q[73];
-rz(5.369912692098647) q[73];
-cx q[59],q[73];
-rz(5.369912692098647) q[74];
-cx q[56],q[74];
-cx q[63],q[74];
-rz(5.369912692098647) q[74];
-cx q[63],q[74];
-cx q[63],q[122];
-rx(5.784552394117822) q[74];
-rz(5.369912692098647) q[75];
-cx q[0],q[75];
-cx q[0],q[82];
-cx q[21],q[75];
-rz(5.369912692098647) q[75];
-cx q[21],q[75];
-cx q[21],q[81];
-rx(5.784552394117822) q[75];
-rz(5.369912692098647) q[76];
-cx q[5],q[76];
-cx q[6],q[76];
-rz(5.369912692098647) q[76];
-cx q[6],q[76];
-cx q[6],q[79];
-rx(5.784552394117822) q[76];
-rz(5.369912692098647) q[78];
-cx q[42],q[78];
-cx q[60],q[78];
-rz(5.369912692098647) q[78];
-cx q[60],q[78];
-rx(5.784552394117822) q[78];
-rz(5.369912692098647) q[79];
-cx q[6],q[79];
-cx q[50],q[79];
-rz(5.369912692098647) q[79];
-cx q[50],q[79];
-rx(5.784552394117822) q[79];
-rz(5.369912692098647) q[80];
-cx q[9],q[80];
-rx(5.784552394117822) q[9];
-rz(5.369912692098647) q[81];
-cx q[21],q[81];
-rz(5.369912692098647) q[82];
-cx q[0],q[82];
-cx q[0],q[91];
-cx q[56],q[82];
-rz(5.369912692098647) q[82];
-cx q[56],q[82];
-cx q[56],q[96];
-rx(5.784552394117822) q[82];
-rz(5.369912692098647) q[83];
-cx q[8],q[83];
-rx(5.784552394117822) q[8];
-cx q[68],q[83];
-rz(5.369912692098647) q[83];
-cx q[68],q[83];
-rx(5.784552394117822) q[68];
-rx(5.784552394117822) q[83];
-rz(5.369912692098647) q[85];
-cx q[37],q[85];
-rx(5.784552394117822) q[37];
-cx q[59],q[85];
-rz(5.369912692098647) q[85];
-cx q[59],q[85];
-rx(5.784552394117822) q[59];
-rx(5.784552394117822) q[85];
-rz(5.369912692098647) q[86];
-cx q[24],q[86];
-rz(5.369912692098647) q[87];
-cx q[28],q[87];
-cx q[32],q[87];
-rz(5.369912692098647) q[87];
-cx q[32],q[87];
-rx(5.784552394117822) q[87];
-rz(5.369912692098647) q[89];
-cx q[2],q[89];
-rx(5.784552394117822) q[2];
-cx q[5],q[89];
-rz(5.369912692098647) q[89];
-cx q[5],q[89];
-cx q[5],q[95];
-rz(5.369912692098647) q[91];
-cx q[0],q[91];
-cx q[0],q[93];
-cx q[6],q[91];
-rz(5.369912692098647) q[91];
-cx q[6],q[91];
-rx(5.784552394117822) q[6];
-rx(5.784552394117822) q[91];
-rz(5.369912692098647) q[93];
-cx q[0],q[93];
-cx q[32],q[93];
-rz(5.369912692098647) q[93];
-cx q[32],q[93];
-rx(5.784552394117822) q[93];
-rz(5.369912692098647) q[94];
-cx q[36],q[94];
-cx q[55],q[94];
-rz(5.369912692098647) q[94];
-cx q[55],q[94];
-rx(5.784552394117822) q[55];
-rz(5.369912692098647) q[95];
-cx q[5],q[95];
-cx q[5],q[106];
-rz(5.369912692098647) q[96];
-cx q[56],q[96];
-rx(5.784552394117822) q[56];
-rz(5.369912692098647) q[97];
-cx q[1],q[97];
-cx q[1],q[113];
-cx q[7],q[97];
-rz(5.369912692098647) q[97];
-cx q[7],q[97];
-cx q[7],q[104];
-rx(5.784552394117822) q[97];
-rz(5.369912692098647) q[99];
-cx q[4],q[99];
-cx q[41],q[99];
-rz(5.369912692098647) q[99];
-cx q[41],q[99];
-rx(5.784552394117822) q[41];
-rx(5.784552394117822) q[99];
-rz(5.369912692098647) q[101];
-cx q[16],q[101];
-cx q[16],q[103];
-cx q[50],q[101];
-rz(5.369912692098647) q[101];
-cx q[50],q[101];
-rx(5.784552394117822) q[50];
-rx(5.784552394117822) q[101];
-rz(5.369912692098647) q[103];
-cx q[16],q[103];
-rx(5.784552394117822) q[16];
-rz(5.369912692098647) q[104];
-cx q[7],q[104];
-rx(5.784552394117822) q[7];
-cx q[13],q[104];
-rz(5.369912692098647) q[104];
-cx q[13],q[104];
-rx(5.784552394117822) q[13];
-cx q[104],q[114];
-rz(5.369912692098647) q[105];
-cx q[26],q[105];
-cx q[26],q[117];
-cx q[28],q[105];
-rz(5.369912692098647) q[105];
-cx q[28],q[105];
-cx q[28],q[116];
-rx(5.784552394117822) q[105];
-rz(5.369912692098647) q[106];
-cx q[5],q[106];
-cx q[5],q[109];
-cx q[36],q[106];
-rz(5.369912692098647) q[106];
-cx q[36],q[106];
-rx(5.784552394117822) q[106];
-rz(5.369912692098647) q[109];
-cx q[5],q[109];
-cx q[5],q[118];
-cx q[39],q[109];
-rz(5.369912692098647) q[109];
-cx q[39],q[109];
-rx(5.784552394117822) q[39];
-rx(5.784552394117822) q[109];
-rz(5.369912692098647) q[113];
-cx q[1],q[113];
-rx(5.784552394117822) q[1];
-rz(5.369912692098647) q[114];
-cx q[104],q[114];
-rz(5.369912692098647) q[116];
-cx q[28],q[116];
-rx(5.784552394117822) q[28];
-cx q[42],q[116];
-rz(5.369912692098647) q[116];
-cx q[42],q[116];
-rx(5.784552394117822) q[42];
-rx(5.784552394117822) q[116];
-rz(5.369912692098647) q[117];
-cx q[26],q[117];
-rx(5.784552394117822) q[26];
-cx q[32],q[117];
-rz(5.369912692098647) q[117];
-cx q[32],q[117];
-rx(5.784552394117822) q[32];
-rx(5.784552394117822) q[117];
-rz(5.369912692098647) q[118];
-cx q[5],q[118];
-rx(5.784552394117822) q[5];
-rz(5.369912692098647) q[119];
-cx q[40],q[119];
-rx(5.784552394117822) q[40];
-cx q[69],q[119];
-rz(5.369912692098647) q[119];
-cx q[69],q[119];
-rx(5.784552394117822) q[69];
-rx(5.784552394117822) q[119];
-rz(5.369912692098647) q[120];
-cx q[46],q[120];
-rx(5.784552394117822) q[46];
-cx q[94],q[120];
-rz(5.369912692098647) q[120];
-cx q[94],q[120];
-rx(5.784552394117822) q[94];
-rx(5.784552394117822) q[120];
-rz(5.369912692098647) q[121];
-cx q[20],q[121];
-rx(5.784552394117822) q[20];
-cx q[104],q[121];
-rz(5.369912692098647) q[121];
-cx q[104],q[121];
-rx(5.784552394117822) q[104];
-rx(5.784552394117822) q[121];
-rz(5.369912692098647) q[122];
-cx q[63],q[122];
-rx(5.784552394117822) q[63];
-rz(5.70381642468168) q[123];
-cx q[52],q[123];
-rx(10.168461270732157) q[52];
-cx q[3],q[52];
-rz(5.369912692098647) q[52];
-cx q[3],q[52];
-cx q[3],q[57];
-cx q[10],q[52];
-rz(5.369912692098647) q[52];
-cx q[10],q[52];
-cx q[10],q[64];
-rz(5.369912692098647) q[57];
-cx q[3],q[57];
-cx q[3],q[70];
-cx q[57],q[103];
-rz(5.369912692098647) q[64];
-cx q[10],q[64];
-cx q[10],q[98];
-rx(5.784552394117822) q[64];
-rz(5.369912692098647) q[70];
-cx q[3],q[70];
-cx q[3],q[71];
-cx q[15],q[70];
-rz(5.369912692098647) q[70];
-cx q[15],q[70];
-cx q[15],q[80];
-cx q[70],q[84];
-rz(5.369912692098647) q[71];
-cx q[3],q[71];
-cx q[3],q[77];
-cx q[53],q[71];
-rz(5.369912692098647) q[71];
-cx q[53],q[71];
-cx q[53],q[86];
-rx(5.784552394117822) q[71];
-rz(5.369912692098647) q[77];
-cx q[3],q[77];
-cx q[3],q[88];
-cx q[30],q[77];
-rz(5.369912692098647) q[77];
-cx q[30],q[77];
-rx(5.784552394117822) q[30];
-cx q[77],q[81];
-rz(5.369912692098647) q[80];
-cx q[15],q[80];
-cx q[15],q[90];
-rx(5.784552394117822) q[80];
-rz(5.369912692098647) q[81];
-cx q[77],q[81];
-rx(5.784552394117822) q[77];
-cx q[81],q[122];
-rz(5.369912692098647) q[84];
-cx q[70],q[84];
-rx(5.784552394117822) q[70];
-cx q[73],q[84];
-rz(5.369912692098647) q[84];
-cx q[73],q[84];
-rx(5.784552394117822) q[73];
-rx(5.784552394117822) q[84];
-rz(5.369912692098647) q[86];
-cx q[53],q[86];
-rx(5.784552394117822) q[53];
-rx(5.784552394117822) q[86];
-rz(5.369912692098647) q[88];
-cx q[3],q[88];
-cx q[3],q[100];
-cx q[60],q[88];
-rz(5.369912692098647) q[88];
-cx q[60],q[88];
-rx(5.784552394117822) q[60];
-rx(5.784552394117822) q[88];
-rz(5.369912692098647) q[90];
-cx q[15],q[90];
-cx q[15],q[92];
-cx q[27],q[90];
-rz(5.369912692098647) q[90];
-cx q[27],q[90];
-cx q[27],q[95];
-rx(5.784552394117822) q[90];
-rz(5.369912692098647) q[92];
-cx q[15],q[92];
-cx q[15],q[108];
-cx q[89],q[92];
-rz(5.369912692098647) q[92];
-cx q[89],q[92];
-rx(5.784552394117822) q[89];
-cx q[92],q[96];
-rz(5.369912692098647) q[95];
-cx q[27],q[95];
-rx(5.784552394117822) q[27];
-rx(5.784552394117822) q[95];
-rz(5.369912692098647) q[96];
-cx q[92],q[96];
-rx(5.784552394117822) q[96];
-rz(5.369912692098647) q[98];
-cx q[10],q[98];
-rx(5.784552394117822) q[10];
-cx q[21],q[98];
-rz(5.369912692098647) q[98];
-cx q[21],q[98];
-rx(5.784552394117822) q[98];
-rz(5.369912692098647) q[100];
-cx q[3],q[100];
-cx q[3],q[102];
-cx q[25],q[100];
-rz(5.369912692098647) q[100];
-cx q[25],q[100];
-rx(5.784552394117822) q[25];
-rx(5.784552394117822) q[100];
-rz(5.369912692098647) q[102];
-cx q[3],q[102];
-cx q[3],q[107];
-cx q[4],q[102];
-rz(5.369912692098647) q[102];
-cx q[4],q[102];
-rx(5.784552394117822) q[4];
-rx(5.784552394117822) q[102];
-rz(5.369912692098647) q[103];
-cx q[57],q[103];
-rx(5.784552394117822) q[57];
-rx(5.784552394117822) q[103];
-rz(5.369912692098647) q[107];
-cx q[3],q[107];
-cx q[3],q[110];
-cx q[31],q[107];
-rz(5.369912692098647) q[107];
-cx q[31],q[107];
-rx(5.784552394117822) q[107];
-rz(5.369912692098647) q[108];
-cx q[15],q[108];
-cx q[15],q[115];
-cx q[31],q[108];
-rz(5.369912692098647) q[108];
-cx q[31],q[108];
-rx(5.784552394117822) q[31];
-rx(5.784552394117822) q[108];
-rz(5.369912692098647) q[110];
-cx q[3],q[110];
-cx q[3],q[111];
-cx q[24],q[110];
-rz(5.369912692098647) q[110];
-cx q[24],q[110];
-rx(5.784552394117822) q[24];
-cx q[110],q[114];
-rz(5.369912692098647) q[111];
-cx q[3],q[111];
-cx q[3],q[113];
-cx q[21],q[111];
-rz(5.369912692098647) q[111];
-cx q[21],q[111];
-cx q[21],q[112];
-rx(5.784552394117822) q[111];
-rz(5.369912692098647) q[112];
-cx q[21],q[112];
-rx(5.784552394117822) q[21];
-cx q[36],q[112];
-rz(5.369912692098647) q[112];
-cx q[36],q[112];
-rx(5.784552394117822) q[36];
-rx(5.784552394117822) q[112];
-rz(5.369912692098647) q[113];
-cx q[3],q[113];
-rx(5.784552394117822) q[3];
-rx(5.784552394117822) q[113];
-rz(5.369912692098647) q[114];
-cx q[110],q[114];
-rx(5.784552394117822) q[110];
-rx(5.784552394117822) q[114];
-rz(5.369912692098647) q[115];
-cx q[15],q[115];
-cx q[15],q[118];
-cx q[92],q[115];
-rz(5.369912692098647) q[115];
-cx q[92],q[115];
-rx(5.784552394117822) q[92];
-rx(5.784552394117822) q[115];
-rz(5.369912692098647) q[118];
-cx q[15],q[118];
-rx(5.784552394117822) q[15];
-rx(5.784552394117822) q[118];
-rz(5.369912692098647) q[122];
-cx q[81],q[122];
-rx(5.784552394117822) q[81];
-rx(5.784552394117822) q[122];
-rx(10.168461270732157) q[123];
-cx q[0],q[123];
-rz(5.369912692098647) q[123];
-cx q[0],q[123];
-rx(5.784552394117822) q[0];
-cx q[0],q[1];
-rz(0.5577096589851137) q[1];
-cx q[0],q[1];
-cx q[0],q[2];
-rz(0.5577096589851137) q[2];
-cx q[0],q[2];
-cx q[0],q[3];
-cx q[2],q[89];
-rz(0.5577096589851137) q[3];
-cx q[0],q[3];
-cx q[0],q[15];
-cx q[1],q[3];
-rz(0.5577096589851137) q[3];
-cx q[1],q[3];
-cx q[1],q[4];
-rz(0.5577096589851137) q[4];
-cx q[1],q[4];
-cx q[1],q[5];
-cx q[3],q[4];
-rz(0.5577096589851137) q[4];
-cx q[3],q[4];
-cx q[4],q[6];
-rz(0.5577096589851137) q[5];
-cx q[1],q[5];
-cx q[1],q[9];
-cx q[3],q[5];
-rz(0.5577096589851137) q[5];
-cx q[3],q[5];
-cx q[3],q[7];
-rz(0.5577096589851137) q[6];
-cx q[4],q[6];
-cx q[5],q[6];
-rz(0.5577096589851137) q[6];
-cx q[5],q[6];
-rz(0.5577096589851137) q[7];
-cx q[3],q[7];
-cx q[3],q[8];
-cx q[4],q[7];
-rz(0.5577096589851137) q[7];
-cx q[4],q[7];
-cx q[4],q[10];
-rz(0.5577096589851137) q[8];
-cx q[3],q[8];
-cx q[5],q[8];
-rz(0.5577096589851137) q[8];
-cx q[5],q[8];
-cx q[5],q[11];
-cx q[8],q[83];
-rz(0.5577096589851137) q[9];
-cx q[1],q[9];
-cx q[1],q[17];
-cx q[3],q[9];
-rz(0.5577096589851137) q[9];
-cx q[3],q[9];
-cx q[3],q[12];
-rz(0.5577096589851137) q[10];
-cx q[4],q[10];
-cx q[4],q[13];
-cx q[6],q[10];
-rz(0.5577096589851137) q[10];
-cx q[6],q[10];
-cx q[10],q[37];
-rz(0.5577096589851137) q[11];
-cx q[5],q[11];
-cx q[6],q[11];
-rz(0.5577096589851137) q[11];
-cx q[6],q[11];
-rx(11.763095620228839) q[11];
-rz(0.5577096589851137) q[12];
-cx q[3],q[12];
-cx q[3],q[14];
-cx q[5],q[12];
-rz(0.5577096589851137) q[12];
-cx q[5],q[12];
-rz(0.5577096589851137) q[13];
-cx q[4],q[13];
-cx q[5],q[13];
-rz(0.5577096589851137) q[13];
-cx q[5],q[13];
-rz(0.5577096589851137) q[14];
-cx q[3],q[14];
-cx q[4],q[14];
-rz(0.5577096589851137) q[14];
-cx q[4],q[14];
-rx(11.763095620228839) q[14];
-rz(0.5577096589851137) q[15];
-cx q[0],q[15];
-cx q[0],q[16];
-cx q[3],q[15];
-rz(0.5577096589851137) q[15];
-cx q[3],q[15];
-rz(0.5577096589851137) q[16];
-cx q[0],q[16];
-cx q[0],q[20];
-cx q[3],q[16];
-rz(0.5577096589851137) q[16];
-cx q[3],q[16];
-rz(0.5577096589851137) q[17];
-cx q[1],q[17];
-cx q[1],q[28];
-cx q[3],q[17];
-rz(0.5577096589851137) q[17];
-cx q[3],q[17];
-cx q[3],q[18];
-rz(0.5577096589851137) q[18];
-cx q[3],q[18];
-cx q[3],q[19];
-cx q[4],q[18];
-rz(0.5577096589851137) q[18];
-cx q[4],q[18];
-cx q[4],q[21];
-rz(0.5577096589851137) q[19];
-cx q[3],q[19];
-cx q[3],q[22];
-cx q[7],q[19];
-rz(0.5577096589851137) q[19];
-cx q[7],q[19];
-cx q[19],q[38];
-rz(0.5577096589851137) q[20];
-cx q[0],q[20];
-cx q[0],q[32];
-cx q[15],q[20];
-rz(0.5577096589851137) q[20];
-cx q[15],q[20];
-rz(0.5577096589851137) q[21];
-cx q[4],q[21];
-cx q[4],q[27];
-cx q[15],q[21];
-rz(0.5577096589851137) q[21];
-cx q[15],q[21];
-cx q[15],q[36];
-rz(0.5577096589851137) q[22];
-cx q[3],q[22];
-cx q[3],q[23];
-cx q[9],q[22];
-rz(0.5577096589851137) q[22];
-cx q[9],q[22];
-cx q[9],q[55];
-rx(11.763095620228839) q[22];
-rz(0.5577096589851137) q[23];
-cx q[3],q[23];
-cx q[3],q[24];
-cx q[17],q[23];
-rz(0.5577096589851137) q[23];
-cx q[17],q[23];
-rz(0.5577096589851137) q[24];
-cx q[3],q[24];
-cx q[3],q[25];
-cx q[5],q[24];
-rz(0.5577096589851137) q[24];
-cx q[5],q[24];
-cx q[5],q[33];
-cx q[24],q[54];
-rz(0.5577096589851137) q[25];
-cx q[3],q[25];
-cx q[3],q[26];
-cx q[12],q[25];
-rz(0.5577096589851137) q[25];
-cx q[12],q[25];
-cx q[12],q[31];
-rz(0.5577096589851137) q[26];
-cx q[3],q[26];
-cx q[21],q[26];
-rz(0.5577096589851137) q[26];
-cx q[21],q[26];
-rz(0.5577096589851137) q[27];
-cx q[4],q[27];
-cx q[4],q[47];
-cx q[6],q[27];
-rz(0.5577096589851137) q[27];
-cx q[6],q[27];
-cx q[6],q[69];
-rz(0.5577096589851137) q[28];
-cx q[1],q[28];
-cx q[1],q[29];
-cx q[3],q[28];
-rz(0.5577096589851137) q[28];
-cx q[3],q[28];
-rz(0.5577096589851137) q[29];
-cx q[1],q[29];
-cx q[1],q[45];
-cx q[3],q[29];
-rz(0.5577096589851137) q[29];
-cx q[3],q[29];
-cx q[3],q[30];
-rx(11.763095620228839) q[29];
-rz(0.5577096589851137) q[30];
-cx q[3],q[30];
-cx q[3],q[34];
-cx q[18],q[30];
-rz(0.5577096589851137) q[30];
-cx q[18],q[30];
-rx(11.763095620228839) q[18];
-rz(0.5577096589851137) q[31];
-cx q[12],q[31];
-cx q[26],q[31];
-rz(0.5577096589851137) q[31];
-cx q[26],q[31];
-cx q[26],q[105];
-rz(0.5577096589851137) q[32];
-cx q[0],q[32];
-cx q[0],q[42];
-cx q[21],q[32];
-rz(0.5577096589851137) q[32];
-cx q[21],q[32];
-rz(0.5577096589851137) q[33];
-cx q[5],q[33];
-cx q[5],q[46];
-cx q[30],q[33];
-rz(0.5577096589851137) q[33];
-cx q[30],q[33];
-rx(11.763095620228839) q[33];
-rz(0.5577096589851137) q[34];
-cx q[3],q[34];
-cx q[3],q[35];
-cx q[12],q[34];
-rz(0.5577096589851137) q[34];
-cx q[12],q[34];
-rz(0.5577096589851137) q[35];
-cx q[3],q[35];
-cx q[3],q[39];
-cx q[32],q[35];
-rz(0.5577096589851137) q[35];
-cx q[32],q[35];
-rx(11.763095620228839) q[35];
-rz(0.5577096589851137) q[36];
-cx q[15],q[36];
-cx q[20],q[36];
-rz(0.5577096589851137) q[36];
-cx q[20],q[36];
-cx q[36],q[94];
-rz(0.5577096589851137) q[37];
-cx q[10],q[37];
-cx q[10],q[41];
-cx q[34],q[37];
-rz(0.5577096589851137) q[37];
-cx q[34],q[37];
-rx(11.763095620228839) q[34];
-cx q[37],q[85];
-rz(0.5577096589851137) q[38];
-cx q[19],q[38];
-rx(11.763095620228839) q[19];
-cx q[21],q[38];
-rz(0.5577096589851137) q[38];
-cx q[21],q[38];
-rz(0.5577096589851137) q[39];
-cx q[3],q[39];
-cx q[3],q[40];
-cx q[13],q[39];
-rz(0.5577096589851137) q[39];
-cx q[13],q[39];
-cx q[13],q[56];
-rz(0.5577096589851137) q[40];
-cx q[3],q[40];
-cx q[23],q[40];
-rz(0.5577096589851137) q[40];
-cx q[23],q[40];
-cx q[40],q[119];
-rz(0.5577096589851137) q[41];
-cx q[10],q[41];
-cx q[27],q[41];
-rz(0.5577096589851137) q[41];
-cx q[27],q[41];
-cx q[27],q[72];
-cx q[41],q[67];
-rz(0.5577096589851137) q[42];
-cx q[0],q[42];
-cx q[0],q[48];
-cx q[3],q[42];
-rz(0.5577096589851137) q[42];
-cx q[3],q[42];
-cx q[3],q[43];
-cx q[42],q[78];
-rz(0.5577096589851137) q[43];
-cx q[3],q[43];
-cx q[3],q[44];
-cx q[20],q[43];
-rz(0.5577096589851137) q[43];
-cx q[20],q[43];
-cx q[20],q[121];
-rx(11.763095620228839) q[43];
-rz(0.5577096589851137) q[44];
-cx q[3],q[44];
-cx q[3],q[49];
-cx q[12],q[44];
-rz(0.5577096589851137) q[44];
-cx q[12],q[44];
-rz(0.5577096589851137) q[45];
-cx q[1],q[45];
-cx q[1],q[57];
-cx q[16],q[45];
-rz(0.5577096589851137) q[45];
-cx q[16],q[45];
-cx q[16],q[59];
-rz(0.5577096589851137) q[46];
-cx q[5],q[46];
-cx q[5],q[65];
-cx q[38],q[46];
-rz(0.5577096589851137) q[46];
-cx q[38],q[46];
-rx(11.763095620228839) q[38];
-cx q[46],q[120];
-rz(0.5577096589851137) q[47];
-cx q[4],q[47];
-cx q[17],q[47];
-rz(0.5577096589851137) q[47];
-cx q[17],q[47];
-cx q[17],q[53];
-rz(0.5577096589851137) q[48];
-cx q[0],q[48];
-cx q[0],q[51];
-cx q[30],q[48];
-rz(0.5577096589851137) q[48];
-cx q[30],q[48];
-rx(11.763095620228839) q[48];
-rz(0.5577096589851137) q[49];
-cx q[3],q[49];
-cx q[3],q[50];
-cx q[4],q[49];
-rz(0.5577096589851137) q[49];
-cx q[4],q[49];
-cx q[4],q[61];
-rx(11.763095620228839) q[49];
-rz(0.5577096589851137) q[50];
-cx q[3],q[50];
-cx q[12],q[50];
-rz(0.5577096589851137) q[50];
-cx q[12],q[50];
-cx q[12],q[63];
-rz(0.5577096589851137) q[51];
-cx q[0],q[51];
-cx q[0],q[62];
-cx q[28],q[51];
-rz(0.5577096589851137) q[51];
-cx q[28],q[51];
-rx(11.763095620228839) q[51];
-cx q[52],q[123];
-rz(0.5577096589851137) q[53];
-cx q[17],q[53];
-cx q[21],q[53];
-rz(0.5577096589851137) q[53];
-cx q[21],q[53];
-rz(0.5577096589851137) q[54];
-cx q[24],q[54];
-cx q[24],q[58];
-cx q[28],q[54];
-rz(0.5577096589851137) q[54];
-cx q[28],q[54];
-rx(11.763095620228839) q[54];
-rz(0.5577096589851137) q[55];
-cx q[9],q[55];
-cx q[9],q[80];
-cx q[15],q[55];
-rz(0.5577096589851137) q[55];
-cx q[15],q[55];
-rz(0.5577096589851137) q[56];
-cx q[13],q[56];
-cx q[13],q[68];
-cx q[45],q[56];
-rz(0.5577096589851137) q[56];
-cx q[45],q[56];
-rx(11.763095620228839) q[45];
-rz(0.5577096589851137) q[57];
-cx q[1],q[57];
-cx q[1],q[60];
-rz(0.5577096589851137) q[58];
-cx q[24],q[58];
-cx q[24],q[86];
-cx q[28],q[58];
-rz(0.5577096589851137) q[58];
-cx q[28],q[58];
-cx q[28],q[87];
-rx(11.763095620228839) q[58];
-rz(0.5577096589851137) q[59];
-cx q[16],q[59];
-cx q[16],q[73];
-cx q[32],q[59];
-rz(0.5577096589851137) q[59];
-cx q[32],q[59];
-rz(0.5577096589851137) q[60];
-cx q[1],q[60];
-cx q[1],q[97];
-cx q[7],q[60];
-rz(0.5577096589851137) q[60];
-cx q[7],q[60];
-rz(0.5577096589851137) q[61];
-cx q[4],q[61];
-cx q[4],q[99];
-cx q[7],q[61];
-rz(0.5577096589851137) q[61];
-cx q[7],q[61];
-rx(11.763095620228839) q[61];
-rz(0.5577096589851137) q[62];
-cx q[0],q[62];
-cx q[0],q[64];
-cx q[17],q[62];
-rz(0.5577096589851137) q[62];
-cx q[17],q[62];
-rx(11.763095620228839) q[62];
-rz(0.5577096589851137) q[63];
-cx q[12],q[63];
-rx(11.763095620228839) q[12];
-cx q[17],q[63];
-rz(0.5577096589851137) q[63];
-cx q[17],q[63];
-cx q[17],q[66];
-rz(0.5577096589851137) q[64];
-cx q[0],q[64];
-cx q[0],q[75];
-rz(0.5577096589851137) q[65];
-cx q[5],q[65];
-cx q[5],q[76];
-cx q[23],q[65];
-rz(0.5577096589851137) q[65];
-cx q[23],q[65];
-rx(11.763095620228839) q[23];
-rx(11.763095620228839) q[65];
-rz(0.5577096589851137) q[66];
-cx q[17],q[66];
-rx(11.763095620228839) q[17];
-cx q[47],q[66];
-rz(0.5577096589851137) q[66];
-cx q[47],q[66];
-rx(11.763095620228839) q[47];
-rx(11.763095620228839) q[66];
-rz(0.5577096589851137) q[67];
-cx q[41],q[67];
-cx q[56],q[67];
-rz(0.5577096589851137) q[67];
-cx q[56],q[67];
-cx q[56],q[74];
-rx(11.763095620228839) q[67];
-rz(0.5577096589851137) q[68];
-cx q[13],q[68];
-cx q[32],q[68];
-rz(0.5577096589851137) q[68];
-cx q[32],q[68];
-rz(0.5577096589851137) q[69];
-cx q[6],q[69];
-cx q[59],q[69];
-rz(0.5577096589851137) q[69];
-cx q[59],q[69];
-rz(0.5577096589851137) q[72];
-cx q[27],q[72];
-cx q[44],q[72];
-rz(0.5577096589851137) q[72];
-cx q[44],q[72];
-rx(11.763095620228839) q[44];
-rx(11.763095620228839) q[72];
-rz(0.5577096589851137) q[73];
-cx q[16],q[73];
-cx q[16],q[101];
-cx q[59],q[73];
-rz(0.5577096589851137) q[73];
-cx q[59],q[73];
-rz(0.5577096589851137) q[74];
-cx q[56],q[74];
-cx q[63],q[74];
-rz(0.5577096589851137) q[74];
-cx q[63],q[74];
-cx q[63],q[122];
-rx(11.763095620228839) q[74];
-rz(0.5577096589851137) q[75];
-cx q[0],q[75];
-cx q[0],q[82];
-cx q[21],q[75];
-rz(0.5577096589851137) q[75];
-cx q[21],q[75];
-cx q[21],q[81];
-rx(11.763095620228839) q[75];
-rz(0.5577096589851137) q[76];
-cx q[5],q[76];
-cx q[6],q[76];
-rz(0.5577096589851137) q[76];
-cx q[6],q[76];
-cx q[6],q[79];
-rx(11.763095620228839) q[76];
-rz(0.5577096589851137) q[78];
-cx q[42],q[78];
-cx q[60],q[78];
-rz(0.5577096589851137) q[78];
-cx q[60],q[78];
-rx(11.763095620228839) q[78];
-rz(0.5577096589851137) q[79];
-cx q[6],q[79];
-cx q[50],q[79];
-rz(0.5577096589851137) q[79];
-cx q[50],q[79];
-rx(11.763095620228839) q[79];
-rz(0.5577096589851137) q[80];
-cx q[9],q[80];
-rx(11.763095620228839) q[9];
-rz(0.5577096589851137) q[81];
-cx q[21],q[81];
-rz(0.5577096589851137) q[82];
-cx q[0],q[82];
-cx q[0],q[91];
-cx q[56],q[82];
-rz(0.5577096589851137) q[82];
-cx q[56],q[82];
-cx q[56],q[96];
-rx(11.763095620228839) q[82];
-rz(0.5577096589851137) q[83];
-cx q[8],q[83];
-rx(11.763095620228839) q[8];
-cx q[68],q[83];
-rz(0.5577096589851137) q[83];
-cx q[68],q[83];
-rx(11.763095620228839) q[68];
-rx(11.763095620228839) q[83];
-rz(0.5577096589851137) q[85];
-cx q[37],q[85];
-rx(11.763095620228839) q[37];
-cx q[59],q[85];
-rz(0.5577096589851137) q[85];
-cx q[59],q[85];
-rx(11.763095620228839) q[59];
-rx(11.763095620228839) q[85];
-rz(0.5577096589851137) q[86];
-cx q[24],q[86];
-rz(0.5577096589851137) q[87];
-cx q[28],q[87];
-cx q[32],q[87];
-rz(0.5577096589851137) q[87];
-cx q[32],q[87];
-rx(11.763095620228839) q[87];
-rz(0.5577096589851137) q[89];
-cx q[2],q[89];
-rx(11.763095620228839) q[2];
-cx q[5],q[89];
-rz(0.5577096589851137) q[89];
-cx q[5],q[89];
-cx q[5],q[95];
-rz(0.5577096589851137) q[91];
-cx q[0],q[91];
-cx q[0],q[93];
-cx q[6],q[91];
-rz(0.5577096589851137) q[91];
-cx q[6],q[91];
-rx(11.763095620228839) q[6];
-rx(11.763095620228839) q[91];
-rz(0.5577096589851137) q[93];
-cx q[0],q[93];
-cx q[32],q[93];
-rz(0.5577096589851137) q[93];
-cx q[32],q[93];
-rx(11.763095620228839) q[93];
-rz(0.5577096589851137) q[94];
-cx q[36],q[94];
-cx q[55],q[94];
-rz(0.5577096589851137) q[94];
-cx q[55],q[94];
-rx(11.763095620228839) q[55];
-rz(0.5577096589851137) q[95];
-cx q[5],q[95];
-cx q[5],q[106];
-rz(0.5577096589851137) q[96];
-cx q[56],q[96];
-rx(11.763095620228839) q[56];
-rz(0.5577096589851137) q[97];
-cx q[1],q[97];
-cx q[1],q[113];
-cx q[7],q[97];
-rz(0.5577096589851137) q[97];
-cx q[7],q[97];
-cx q[7],q[104];
-rx(11.763095620228839) q[97];
-rz(0.5577096589851137) q[99];
-cx q[4],q[99];
-cx q[41],q[99];
-rz(0.5577096589851137) q[99];
-cx q[41],q[99];
-rx(11.763095620228839) q[41];
-rx(11.763095620228839) q[99];
-rz(0.5577096589851137) q[101];
-cx q[16],q[101];
-cx q[16],q[103];
-cx q[50],q[101];
-rz(0.5577096589851137) q[101];
-cx q[50],q[101];
-rx(11.763095620228839) q[50];
-rx(11.763095620228839) q[101];
-rz(0.5577096589851137) q[103];
-cx q[16],q[103];
-rx(11.763095620228839) q[16];
-rz(0.5577096589851137) q[104];
-cx q[7],q[104];
-rx(11.763095620228839) q[7];
-cx q[13],q[104];
-rz(0.5577096589851137) q[104];
-cx q[13],q[104];
-rx(11.763095620228839) q[13];
-cx q[104],q[114];
-rz(0.5577096589851137) q[105];
-cx q[26],q[105];
-cx q[26],q[117];
-cx q[28],q[105];
-rz(0.5577096589851137) q[105];
-cx q[28],q[105];
-cx q[28],q[116];
-rx(11.763095620228839) q[105];
-rz(0.5577096589851137) q[106];
-cx q[5],q[106];
-cx q[5],q[109];
-cx q[36],q[106];
-rz(0.5577096589851137) q[106];
-cx q[36],q[106];
-rx(11.763095620228839) q[106];
-rz(0.5577096589851137) q[109];
-cx q[5],q[109];
-cx q[5],q[118];
-cx q[39],q[109];
-rz(0.5577096589851137) q[109];
-cx q[39],q[109];
-rx(11.763095620228839) q[39];
-rx(11.763095620228839) q[109];
-rz(0.5577096589851137) q[113];
-cx q[1],q[113];
-rx(11.763095620228839) q[1];
-rz(0.5577096589851137) q[114];
-cx q[104],q[114];
-rz(0.5577096589851137) q[116];
-cx q[28],q[116];
-rx(11.763095620228839) q[28];
-cx q[42],q[116];
-rz(0.5577096589851137) q[116];
-cx q[42],q[116];
-rx(11.763095620228839) q[42];
-rx(11.763095620228839) q[116];
-rz(0.5577096589851137) q[117];
-cx q[26],q[117];
-rx(11.763095620228839) q[26];
-cx q[32],q[117];
-rz(0.5577096589851137) q[117];
-cx q[32],q[117];
-rx(11.763095620228839) q[32];
-rx(11.763095620228839) q[117];
-rz(0.5577096589851137) q[118];
-cx q[5],q[118];
-rx(11.763095620228839) q[5];
-rz(0.5577096589851137) q[119];
-cx q[40],q[119];
-rx(11.763095620228839) q[40];
-cx q[69],q[119];
-rz(0.5577096589851137) q[119];
-cx q[69],q[119];
-rx(11.763095620228839) q[69];
-rx(11.763095620228839) q[119];
-rz(0.5577096589851137) q[120];
-cx q[46],q[120];
-rx(11.763095620228839) q[46];
-cx q[94],q[120];
-rz(0.5577096589851137) q[120];
-cx q[94],q[120];
-rx(11.763095620228839) q[94];
-rx(11.763095620228839) q[120];
-rz(0.5577096589851137) q[121];
-cx q[20],q[121];
-rx(11.763095620228839) q[20];
-cx q[104],q[121];
-rz(0.5577096589851137) q[121];
-cx q[104],q[121];
-rx(11.763095620228839) q[104];
-rx(11.763095620228839) q[121];
-rz(0.5577096589851137) q[122];
-cx q[63],q[122];
-rx(11.763095620228839) q[63];
-rz(5.369912692098647) q[123];
-cx q[52],q[123];
-rx(5.784552394117822) q[52];
-cx q[3],q[52];
-rz(0.5577096589851137) q[52];
-cx q[3],q[52];
-cx q[3],q[57];
-cx q[10],q[52];
-rz(0.5577096589851137) q[52];
-cx q[10],q[52];
-cx q[10],q[64];
-rz(0.5577096589851137) q[57];
-cx q[3],q[57];
-cx q[3],q[70];
-cx q[57],q[103];
-rz(0.5577096589851137) q[64];
-cx q[10],q[64];
-cx q[10],q[98];
-rx(11.763095620228839) q[64];
-rz(0.5577096589851137) q[70];
-cx q[3],q[70];
-cx q[3],q[71];
-cx q[15],q[70];
-rz(0.5577096589851137) q[70];
-cx q[15],q[70];
-cx q[15],q[80];
-cx q[70],q[84];
-rz(0.5577096589851137) q[71];
-cx q[3],q[71];
-cx q[3],q[77];
-cx q[53],q[71];
-rz(0.5577096589851137) q[71];
-cx q[53],q[71];
-cx q[53],q[86];
-rx(11.763095620228839) q[71];
-rz(0.5577096589851137) q[77];
-cx q[3],q[77];
-cx q[3],q[88];
-cx q[30],q[77];
-rz(0.5577096589851137) q[77];
-cx q[30],q[77];
-rx(11.763095620228839) q[30];
-cx q[77],q[81];
-rz(0.5577096589851137) q[80];
-cx q[15],q[80];
-cx q[15],q[90];
-rx(11.763095620228839) q[80];
-rz(0.5577096589851137) q[81];
-cx q[77],q[81];
-rx(11.763095620228839) q[77];
-cx q[81],q[122];
-rz(0.5577096589851137) q[84];
-cx q[70],q[84];
-rx(11.763095620228839) q[70];
-cx q[73],q[84];
-rz(0.5577096589851137) q[84];
-cx q[73],q[84];
-rx(11.763095620228839) q[73];
-rx(11.763095620228839) q[84];
-rz(0.5577096589851137) q[86];
-cx q[53],q[86];
-rx(11.763095620228839) q[53];
-rx(11.763095620228839) q[86];
-rz(0.5577096589851137) q[88];
-cx q[3],q[88];
-cx q[3],q[100];
-cx q[60],q[88];
-rz(0.5577096589851137) q[88];
-cx q[60],q[88];
-rx(11.763095620228839) q[60];
-rx(11.763095620228839) q[88];
-rz(0.5577096589851137) q[90];
-cx q[15],q[90];
-cx q[15],q[92];
-cx q[27],q[90];
-rz(0.5577096589851137) q[90];
-cx q[27],q[90];
-cx q[27],q[95];
-rx(11.763095620228839) q[90];
-rz(0.5577096589851137) q[92];
-cx q[15],q[92];
-cx q[15],q[108];
-cx q[89],q[92];
-rz(0.5577096589851137) q[92];
-cx q[89],q[92];
-rx(11.763095620228839) q[89];
-cx q[92],q[96];
-rz(0.5577096589851137) q[95];
-cx q[27],q[95];
-rx(11.763095620228839) q[27];
-rx(11.763095620228839) q[95];
-rz(0.5577096589851137) q[96];
-cx q[92],q[96];
-rx(11.763095620228839) q[96];
-rz(0.5577096589851137) q[98];
-cx q[10],q[98];
-rx(11.763095620228839) q[10];
-cx q[21],q[98];
-rz(0.5577096589851137) q[98];
-cx q[21],q[98];
-rx(11.763095620228839) q[98];
-rz(0.5577096589851137) q[100];
-cx q[3],q[100];
-cx q[3],q[102];
-cx q[25],q[100];
-rz(0.5577096589851137) q[100];
-cx q[25],q[100];
-rx(11.763095620228839) q[25];
-rx(11.763095620228839) q[100];
-rz(0.5577096589851137) q[102];
-cx q[3],q[102];
-cx q[3],q[107];
-cx q[4],q[102];
-rz(0.5577096589851137) q[102];
-cx q[4],q[102];
-rx(11.763095620228839) q[4];
-rx(11.763095620228839) q[102];
-rz(0.5577096589851137) q[103];
-cx q[57],q[103];
-rx(11.763095620228839) q[57];
-rx(11.763095620228839) q[103];
-rz(0.5577096589851137) q[107];
-cx q[3],q[107];
-cx q[3],q[110];
-cx q[31],q[107];
-rz(0.5577096589851137) q[107];
-cx q[31],q[107];
-rx(11.763095620228839) q[107];
-rz(0.5577096589851137) q[108];
-cx q[15],q[108];
-cx q[15],q[115];
-cx q[31],q[108];
-rz(0.5577096589851137) q[108];
-cx q[31],q[108];
-rx(11.763095620228839) q[31];
-rx(11.763095620228839) q[108];
-rz(0.5577096589851137) q[110];
-cx q[3],q[110];
-cx q[3],q[111];
-cx q[24],q[110];
-rz(0.5577096589851137) q[110];
-cx q[24],q[110];
-rx(11.763095620228839) q[24];
-cx q[110],q[114];
-rz(0.5577096589851137) q[111];
-cx q[3],q[111];
-cx q[3],q[113];
-cx q[21],q[111];
-rz(0.5577096589851137) q[111];
-cx q[21],q[111];
-cx q[21],q[112];
-rx(11.763095620228839) q[111];
-rz(0.5577096589851137) q[112];
-cx q[21],q[112];
-rx(11.763095620228839) q[21];
-cx q[36],q[112];
-rz(0.5577096589851137) q[112];
-cx q[36],q[112];
-rx(11.763095620228839) q[36];
-rx(11.763095620228839) q[112];
-rz(0.5577096589851137) q[113];
-cx q[3],q[113];
-rx(11.763095620228839) q[3];
-rx(11.763095620228839) q[113];
-rz(0.5577096589851137) q[114];
-cx q[110],q[114];
-rx(11.763095620228839) q[110];
-rx(11.763095620228839) q[114];
-rz(0.5577096589851137) q[115];
-cx q[15],q[115];
-cx q[15],q[118];
-cx q[92],q[115];
-rz(0.5577096589851137) q[115];
-cx q[92],q[115];
-rx(11.763095620228839) q[92];
-rx(11.763095620228839) q[115];
-rz(0.5577096589851137) q[118];
-cx q[15],q[118];
-rx(11.763095620228839) q[15];
-rx(11.763095620228839) q[118];
-rz(0.5577096589851137) q[122];
-cx q[81],q[122];
-rx(11.763095620228839) q[81];
-rx(11.763095620228839) q[122];
-rx(5.784552394117822) q[123];
-cx q[0],q[123];
-rz(0.5577096589851137) q[123];
-cx q[0],q[123];
-rx(11.763095620228839) q[0];
-cx q[52],q[123];
-rz(0.5577096589851137) q[123];
-cx q[52],q[123];
-rx(11.763095620228839) q[52];
-rx(11.763095620228839) q[123];
\ No newline at end of file
@@ -1,2842 +0,0 @@
-OPENQASM 2.0;
-include "qelib1.inc";
-qreg q[125];
-ry(pi/2) q[0];
-rx(pi) q[0];
-ry(pi/2) q[1];
-rx(pi) q[1];
-cx q[0],q[1];
-rz(2.3585308227235546) q[1];
-cx q[0],q[1];
-ry(pi/2) q[2];
-rx(pi) q[2];
-cx q[0],q[2];
-rz(2.3585308227235546) q[2];
-cx q[0],q[2];
-ry(pi/2) q[3];
-rx(pi) q[3];
-cx q[0],q[3];
-rz(2.3585308227235546) q[3];
-cx q[0],q[3];
-cx q[1],q[3];
-rz(2.3585308227235546) q[3];
-cx q[1],q[3];
-ry(pi/2) q[4];
-rx(pi) q[4];
-cx q[1],q[4];
-rz(2.3585308227235546) q[4];
-cx q[1],q[4];
-cx q[3],q[4];
-rz(2.3585308227235546) q[4];
-cx q[3],q[4];
-ry(pi/2) q[5];
-rx(pi) q[5];
-cx q[1],q[5];
-rz(2.3585308227235546) q[5];
-cx q[1],q[5];
-cx q[3],q[5];
-rz(2.3585308227235546) q[5];
-cx q[3],q[5];
-ry(pi/2) q[6];
-rx(pi) q[6];
-cx q[4],q[6];
-rz(2.3585308227235546) q[6];
-cx q[4],q[6];
-cx q[5],q[6];
-rz(2.3585308227235546) q[6];
-cx q[5],q[6];
-ry(pi/2) q[7];
-rx(pi) q[7];
-cx q[3],q[7];
-rz(2.3585308227235546) q[7];
-cx q[3],q[7];
-cx q[4],q[7];
-rz(2.3585308227235546) q[7];
-cx q[4],q[7];
-ry(pi/2) q[8];
-rx(pi) q[8];
-cx q[3],q[8];
-rz(2.3585308227235546) q[8];
-cx q[3],q[8];
-cx q[5],q[8];
-rz(2.3585308227235546) q[8];
-cx q[5],q[8];
-ry(pi/2) q[9];
-rx(pi) q[9];
-cx q[1],q[9];
-rz(2.3585308227235546) q[9];
-cx q[1],q[9];
-cx q[3],q[9];
-rz(2.3585308227235546) q[9];
-cx q[3],q[9];
-ry(pi/2) q[10];
-rx(pi) q[10];
-cx q[4],q[10];
-rz(2.3585308227235546) q[10];
-cx q[4],q[10];
-cx q[6],q[10];
-rz(2.3585308227235546) q[10];
-cx q[6],q[10];
-ry(pi/2) q[11];
-rx(pi) q[11];
-cx q[5],q[11];
-rz(2.3585308227235546) q[11];
-cx q[5],q[11];
-cx q[6],q[11];
-rz(2.3585308227235546) q[11];
-cx q[6],q[11];
-rx(6.8070791339217) q[11];
-ry(pi/2) q[12];
-rx(pi) q[12];
-cx q[3],q[12];
-rz(2.3585308227235546) q[12];
-cx q[3],q[12];
-cx q[5],q[12];
-rz(2.3585308227235546) q[12];
-cx q[5],q[12];
-ry(pi/2) q[13];
-rx(pi) q[13];
-cx q[4],q[13];
-rz(2.3585308227235546) q[13];
-cx q[4],q[13];
-cx q[5],q[13];
-rz(2.3585308227235546) q[13];
-cx q[5],q[13];
-ry(pi/2) q[14];
-rx(pi) q[14];
-cx q[3],q[14];
-rz(2.3585308227235546) q[14];
-cx q[3],q[14];
-cx q[4],q[14];
-rz(2.3585308227235546) q[14];
-cx q[4],q[14];
-rx(6.8070791339217) q[14];
-ry(pi/2) q[15];
-rx(pi) q[15];
-cx q[0],q[15];
-rz(2.3585308227235546) q[15];
-cx q[0],q[15];
-cx q[3],q[15];
-rz(2.3585308227235546) q[15];
-cx q[3],q[15];
-ry(pi/2) q[16];
-rx(pi) q[16];
-cx q[0],q[16];
-rz(2.3585308227235546) q[16];
-cx q[0],q[16];
-cx q[3],q[16];
-rz(2.3585308227235546) q[16];
-cx q[3],q[16];
-ry(pi/2) q[17];
-rx(pi) q[17];
-cx q[1],q[17];
-rz(2.3585308227235546) q[17];
-cx q[1],q[17];
-cx q[3],q[17];
-rz(2.3585308227235546) q[17];
-cx q[3],q[17];
-ry(pi/2) q[18];
-rx(pi) q[18];
-cx q[3],q[18];
-rz(2.3585308227235546) q[18];
-cx q[3],q[18];
-cx q[4],q[18];
-rz(2.3585308227235546) q[18];
-cx q[4],q[18];
-ry(pi/2) q[19];
-rx(pi) q[19];
-cx q[3],q[19];
-rz(2.3585308227235546) q[19];
-cx q[3],q[19];
-cx q[7],q[19];
-rz(2.3585308227235546) q[19];
-cx q[7],q[19];
-ry(pi/2) q[20];
-rx(pi) q[20];
-cx q[0],q[20];
-rz(2.3585308227235546) q[20];
-cx q[0],q[20];
-cx q[15],q[20];
-rz(2.3585308227235546) q[20];
-cx q[15],q[20];
-ry(pi/2) q[21];
-rx(pi) q[21];
-cx q[4],q[21];
-rz(2.3585308227235546) q[21];
-cx q[4],q[21];
-cx q[15],q[21];
-rz(2.3585308227235546) q[21];
-cx q[15],q[21];
-ry(pi/2) q[22];
-rx(pi) q[22];
-cx q[3],q[22];
-rz(2.3585308227235546) q[22];
-cx q[3],q[22];
-cx q[9],q[22];
-rz(2.3585308227235546) q[22];
-cx q[9],q[22];
-rx(6.8070791339217) q[22];
-ry(pi/2) q[23];
-rx(pi) q[23];
-cx q[3],q[23];
-rz(2.3585308227235546) q[23];
-cx q[3],q[23];
-cx q[17],q[23];
-rz(2.3585308227235546) q[23];
-cx q[17],q[23];
-ry(pi/2) q[24];
-rx(pi) q[24];
-cx q[3],q[24];
-rz(2.3585308227235546) q[24];
-cx q[3],q[24];
-cx q[5],q[24];
-rz(2.3585308227235546) q[24];
-cx q[5],q[24];
-ry(pi/2) q[25];
-rx(pi) q[25];
-cx q[3],q[25];
-rz(2.3585308227235546) q[25];
-cx q[3],q[25];
-cx q[12],q[25];
-rz(2.3585308227235546) q[25];
-cx q[12],q[25];
-ry(pi/2) q[26];
-rx(pi) q[26];
-cx q[3],q[26];
-rz(2.3585308227235546) q[26];
-cx q[3],q[26];
-cx q[21],q[26];
-rz(2.3585308227235546) q[26];
-cx q[21],q[26];
-ry(pi/2) q[27];
-rx(pi) q[27];
-cx q[4],q[27];
-rz(2.3585308227235546) q[27];
-cx q[4],q[27];
-cx q[6],q[27];
-rz(2.3585308227235546) q[27];
-cx q[6],q[27];
-ry(pi/2) q[28];
-rx(pi) q[28];
-cx q[1],q[28];
-rz(2.3585308227235546) q[28];
-cx q[1],q[28];
-cx q[3],q[28];
-rz(2.3585308227235546) q[28];
-cx q[3],q[28];
-ry(pi/2) q[29];
-rx(pi) q[29];
-cx q[1],q[29];
-rz(2.3585308227235546) q[29];
-cx q[1],q[29];
-cx q[3],q[29];
-rz(2.3585308227235546) q[29];
-cx q[3],q[29];
-rx(6.8070791339217) q[29];
-ry(pi/2) q[30];
-rx(pi) q[30];
-cx q[3],q[30];
-rz(2.3585308227235546) q[30];
-cx q[3],q[30];
-cx q[18],q[30];
-rz(2.3585308227235546) q[30];
-cx q[18],q[30];
-rx(6.8070791339217) q[18];
-ry(pi/2) q[31];
-rx(pi) q[31];
-cx q[12],q[31];
-rz(2.3585308227235546) q[31];
-cx q[12],q[31];
-cx q[26],q[31];
-rz(2.3585308227235546) q[31];
-cx q[26],q[31];
-ry(pi/2) q[32];
-rx(pi) q[32];
-cx q[0],q[32];
-rz(2.3585308227235546) q[32];
-cx q[0],q[32];
-cx q[21],q[32];
-rz(2.3585308227235546) q[32];
-cx q[21],q[32];
-ry(pi/2) q[33];
-rx(pi) q[33];
-cx q[5],q[33];
-rz(2.3585308227235546) q[33];
-cx q[5],q[33];
-cx q[30],q[33];
-rz(2.3585308227235546) q[33];
-cx q[30],q[33];
-rx(6.8070791339217) q[33];
-ry(pi/2) q[34];
-rx(pi) q[34];
-cx q[3],q[34];
-rz(2.3585308227235546) q[34];
-cx q[3],q[34];
-cx q[12],q[34];
-rz(2.3585308227235546) q[34];
-cx q[12],q[34];
-ry(pi/2) q[35];
-rx(pi) q[35];
-cx q[3],q[35];
-rz(2.3585308227235546) q[35];
-cx q[3],q[35];
-cx q[32],q[35];
-rz(2.3585308227235546) q[35];
-cx q[32],q[35];
-rx(6.8070791339217) q[35];
-ry(pi/2) q[36];
-rx(pi) q[36];
-cx q[15],q[36];
-rz(2.3585308227235546) q[36];
-cx q[15],q[36];
-cx q[20],q[36];
-rz(2.3585308227235546) q[36];
-cx q[20],q[36];
-ry(pi/2) q[37];
-rx(pi) q[37];
-cx q[10],q[37];
-rz(2.3585308227235546) q[37];
-cx q[10],q[37];
-cx q[34],q[37];
-rz(2.3585308227235546) q[37];
-cx q[34],q[37];
-rx(6.8070791339217) q[34];
-ry(pi/2) q[38];
-rx(pi) q[38];
-cx q[19],q[38];
-rz(2.3585308227235546) q[38];
-cx q[19],q[38];
-rx(6.8070791339217) q[19];
-cx q[21],q[38];
-rz(2.3585308227235546) q[38];
-cx q[21],q[38];
-ry(pi/2) q[39];
-rx(pi) q[39];
-cx q[3],q[39];
-rz(2.3585308227235546) q[39];
-cx q[3],q[39];
-cx q[13],q[39];
-rz(2.3585308227235546) q[39];
-cx q[13],q[39];
-ry(pi/2) q[40];
-rx(pi) q[40];
-cx q[3],q[40];
-rz(2.3585308227235546) q[40];
-cx q[3],q[40];
-cx q[23],q[40];
-rz(2.3585308227235546) q[40];
-cx q[23],q[40];
-ry(pi/2) q[41];
-rx(pi) q[41];
-cx q[10],q[41];
-rz(2.3585308227235546) q[41];
-cx q[10],q[41];
-cx q[27],q[41];
-rz(2.3585308227235546) q[41];
-cx q[27],q[41];
-ry(pi/2) q[42];
-rx(pi) q[42];
-cx q[0],q[42];
-rz(2.3585308227235546) q[42];
-cx q[0],q[42];
-cx q[3],q[42];
-rz(2.3585308227235546) q[42];
-cx q[3],q[42];
-ry(pi/2) q[43];
-rx(pi) q[43];
-cx q[3],q[43];
-rz(2.3585308227235546) q[43];
-cx q[3],q[43];
-cx q[20],q[43];
-rz(2.3585308227235546) q[43];
-cx q[20],q[43];
-rx(6.8070791339217) q[43];
-ry(pi/2) q[44];
-rx(pi) q[44];
-cx q[3],q[44];
-rz(2.3585308227235546) q[44];
-cx q[3],q[44];
-cx q[12],q[44];
-rz(2.3585308227235546) q[44];
-cx q[12],q[44];
-ry(pi/2) q[45];
-rx(pi) q[45];
-cx q[1],q[45];
-rz(2.3585308227235546) q[45];
-cx q[1],q[45];
-cx q[16],q[45];
-rz(2.3585308227235546) q[45];
-cx q[16],q[45];
-ry(pi/2) q[46];
-rx(pi) q[46];
-cx q[5],q[46];
-rz(2.3585308227235546) q[46];
-cx q[5],q[46];
-cx q[38],q[46];
-rz(2.3585308227235546) q[46];
-cx q[38],q[46];
-rx(6.8070791339217) q[38];
-ry(pi/2) q[47];
-rx(pi) q[47];
-cx q[4],q[47];
-rz(2.3585308227235546) q[47];
-cx q[4],q[47];
-cx q[17],q[47];
-rz(2.3585308227235546) q[47];
-cx q[17],q[47];
-ry(pi/2) q[48];
-rx(pi) q[48];
-cx q[0],q[48];
-rz(2.3585308227235546) q[48];
-cx q[0],q[48];
-cx q[30],q[48];
-rz(2.3585308227235546) q[48];
-cx q[30],q[48];
-rx(6.8070791339217) q[48];
-ry(pi/2) q[49];
-rx(pi) q[49];
-cx q[3],q[49];
-rz(2.3585308227235546) q[49];
-cx q[3],q[49];
-cx q[4],q[49];
-rz(2.3585308227235546) q[49];
-cx q[4],q[49];
-rx(6.8070791339217) q[49];
-ry(pi/2) q[50];
-rx(pi) q[50];
-cx q[3],q[50];
-rz(2.3585308227235546) q[50];
-cx q[3],q[50];
-cx q[12],q[50];
-rz(2.3585308227235546) q[50];
-cx q[12],q[50];
-ry(pi/2) q[51];
-rx(pi) q[51];
-cx q[0],q[51];
-rz(2.3585308227235546) q[51];
-cx q[0],q[51];
-cx q[28],q[51];
-rz(2.3585308227235546) q[51];
-cx q[28],q[51];
-rx(6.8070791339217) q[51];
-ry(pi/2) q[52];
-rx(pi) q[52];
-cx q[3],q[52];
-rz(2.3585308227235546) q[52];
-cx q[3],q[52];
-cx q[10],q[52];
-rz(2.3585308227235546) q[52];
-cx q[10],q[52];
-ry(pi/2) q[53];
-rx(pi) q[53];
-cx q[17],q[53];
-rz(2.3585308227235546) q[53];
-cx q[17],q[53];
-cx q[21],q[53];
-rz(2.3585308227235546) q[53];
-cx q[21],q[53];
-ry(pi/2) q[54];
-rx(pi) q[54];
-cx q[24],q[54];
-rz(2.3585308227235546) q[54];
-cx q[24],q[54];
-cx q[28],q[54];
-rz(2.3585308227235546) q[54];
-cx q[28],q[54];
-rx(6.8070791339217) q[54];
-ry(pi/2) q[55];
-rx(pi) q[55];
-cx q[9],q[55];
-rz(2.3585308227235546) q[55];
-cx q[9],q[55];
-cx q[15],q[55];
-rz(2.3585308227235546) q[55];
-cx q[15],q[55];
-ry(pi/2) q[56];
-rx(pi) q[56];
-cx q[13],q[56];
-rz(2.3585308227235546) q[56];
-cx q[13],q[56];
-cx q[45],q[56];
-rz(2.3585308227235546) q[56];
-cx q[45],q[56];
-rx(6.8070791339217) q[45];
-ry(pi/2) q[57];
-rx(pi) q[57];
-cx q[1],q[57];
-rz(2.3585308227235546) q[57];
-cx q[1],q[57];
-cx q[3],q[57];
-rz(2.3585308227235546) q[57];
-cx q[3],q[57];
-ry(pi/2) q[58];
-rx(pi) q[58];
-cx q[24],q[58];
-rz(2.3585308227235546) q[58];
-cx q[24],q[58];
-cx q[28],q[58];
-rz(2.3585308227235546) q[58];
-cx q[28],q[58];
-rx(6.8070791339217) q[58];
-ry(pi/2) q[59];
-rx(pi) q[59];
-cx q[16],q[59];
-rz(2.3585308227235546) q[59];
-cx q[16],q[59];
-cx q[32],q[59];
-rz(2.3585308227235546) q[59];
-cx q[32],q[59];
-ry(pi/2) q[60];
-rx(pi) q[60];
-cx q[1],q[60];
-rz(2.3585308227235546) q[60];
-cx q[1],q[60];
-cx q[7],q[60];
-rz(2.3585308227235546) q[60];
-cx q[7],q[60];
-ry(pi/2) q[61];
-rx(pi) q[61];
-cx q[4],q[61];
-rz(2.3585308227235546) q[61];
-cx q[4],q[61];
-cx q[7],q[61];
-rz(2.3585308227235546) q[61];
-cx q[7],q[61];
-rx(6.8070791339217) q[61];
-ry(pi/2) q[62];
-rx(pi) q[62];
-cx q[0],q[62];
-rz(2.3585308227235546) q[62];
-cx q[0],q[62];
-cx q[17],q[62];
-rz(2.3585308227235546) q[62];
-cx q[17],q[62];
-rx(6.8070791339217) q[62];
-ry(pi/2) q[63];
-rx(pi) q[63];
-cx q[12],q[63];
-rz(2.3585308227235546) q[63];
-cx q[12],q[63];
-rx(6.8070791339217) q[12];
-cx q[17],q[63];
-rz(2.3585308227235546) q[63];
-cx q[17],q[63];
-ry(pi/2) q[64];
-rx(pi) q[64];
-cx q[0],q[64];
-rz(2.3585308227235546) q[64];
-cx q[0],q[64];
-cx q[10],q[64];
-rz(2.3585308227235546) q[64];
-cx q[10],q[64];
-rx(6.8070791339217) q[64];
-ry(pi/2) q[65];
-rx(pi) q[65];
-cx q[5],q[65];
-rz(2.3585308227235546) q[65];
-cx q[5],q[65];
-cx q[23],q[65];
-rz(2.3585308227235546) q[65];
-cx q[23],q[65];
-rx(6.8070791339217) q[23];
-rx(6.8070791339217) q[65];
-ry(pi/2) q[66];
-rx(pi) q[66];
-cx q[17],q[66];
-rz(2.3585308227235546) q[66];
-cx q[17],q[66];
-rx(6.8070791339217) q[17];
-cx q[47],q[66];
-rz(2.3585308227235546) q[66];
-cx q[47],q[66];
-rx(6.8070791339217) q[47];
-rx(6.8070791339217) q[66];
-ry(pi/2) q[67];
-rx(pi) q[67];
-cx q[41],q[67];
-rz(2.3585308227235546) q[67];
-cx q[41],q[67];
-cx q[56],q[67];
-rz(2.3585308227235546) q[67];
-cx q[56],q[67];
-rx(6.8070791339217) q[67];
-ry(pi/2) q[68];
-rx(pi) q[68];
-cx q[13],q[68];
-rz(2.3585308227235546) q[68];
-cx q[13],q[68];
-cx q[32],q[68];
-rz(2.3585308227235546) q[68];
-cx q[32],q[68];
-ry(pi/2) q[69];
-rx(pi) q[69];
-cx q[6],q[69];
-rz(2.3585308227235546) q[69];
-cx q[6],q[69];
-cx q[59],q[69];
-rz(2.3585308227235546) q[69];
-cx q[59],q[69];
-ry(pi/2) q[70];
-rx(pi) q[70];
-cx q[3],q[70];
-rz(2.3585308227235546) q[70];
-cx q[3],q[70];
-cx q[15],q[70];
-rz(2.3585308227235546) q[70];
-cx q[15],q[70];
-ry(pi/2) q[71];
-rx(pi) q[71];
-cx q[3],q[71];
-rz(2.3585308227235546) q[71];
-cx q[3],q[71];
-cx q[53],q[71];
-rz(2.3585308227235546) q[71];
-cx q[53],q[71];
-rx(6.8070791339217) q[71];
-ry(pi/2) q[72];
-rx(pi) q[72];
-cx q[27],q[72];
-rz(2.3585308227235546) q[72];
-cx q[27],q[72];
-cx q[44],q[72];
-rz(2.3585308227235546) q[72];
-cx q[44],q[72];
-rx(6.8070791339217) q[44];
-rx(6.8070791339217) q[72];
-ry(pi/2) q[73];
-rx(pi) q[73];
-cx q[16],q[73];
-rz(2.3585308227235546) q[73];
-cx q[16],q[73];
-cx q[59],q[73];
-rz(2.3585308227235546) q[73];
-cx q[59],q[73];
-ry(pi/2) q[74];
-rx(pi) q[74];
-cx q[56],q[74];
-rz(2.3585308227235546) q[74];
-cx q[56],q[74];
-cx q[63],q[74];
-rz(2.3585308227235546) q[74];
-cx q[63],q[74];
-rx(6.8070791339217) q[74];
-ry(pi/2) q[75];
-rx(pi) q[75];
-cx q[0],q[75];
-rz(2.3585308227235546) q[75];
-cx q[0],q[75];
-cx q[21],q[75];
-rz(2.3585308227235546) q[75];
-cx q[21],q[75];
-rx(6.8070791339217) q[75];
-ry(pi/2) q[76];
-rx(pi) q[76];
-cx q[5],q[76];
-rz(2.3585308227235546) q[76];
-cx q[5],q[76];
-cx q[6],q[76];
-rz(2.3585308227235546) q[76];
-cx q[6],q[76];
-rx(6.8070791339217) q[76];
-ry(pi/2) q[77];
-rx(pi) q[77];
-cx q[3],q[77];
-rz(2.3585308227235546) q[77];
-cx q[3],q[77];
-cx q[30],q[77];
-rz(2.3585308227235546) q[77];
-cx q[30],q[77];
-rx(6.8070791339217) q[30];
-ry(pi/2) q[78];
-rx(pi) q[78];
-cx q[42],q[78];
-rz(2.3585308227235546) q[78];
-cx q[42],q[78];
-cx q[60],q[78];
-rz(2.3585308227235546) q[78];
-cx q[60],q[78];
-rx(6.8070791339217) q[78];
-ry(pi/2) q[79];
-rx(pi) q[79];
-cx q[6],q[79];
-rz(2.3585308227235546) q[79];
-cx q[6],q[79];
-cx q[50],q[79];
-rz(2.3585308227235546) q[79];
-cx q[50],q[79];
-rx(6.8070791339217) q[79];
-ry(pi/2) q[80];
-rx(pi) q[80];
-cx q[9],q[80];
-rz(2.3585308227235546) q[80];
-cx q[9],q[80];
-rx(6.8070791339217) q[9];
-cx q[15],q[80];
-rz(2.3585308227235546) q[80];
-cx q[15],q[80];
-rx(6.8070791339217) q[80];
-ry(pi/2) q[81];
-rx(pi) q[81];
-cx q[21],q[81];
-rz(2.3585308227235546) q[81];
-cx q[21],q[81];
-cx q[77],q[81];
-rz(2.3585308227235546) q[81];
-cx q[77],q[81];
-rx(6.8070791339217) q[77];
-ry(pi/2) q[82];
-rx(pi) q[82];
-cx q[0],q[82];
-rz(2.3585308227235546) q[82];
-cx q[0],q[82];
-cx q[56],q[82];
-rz(2.3585308227235546) q[82];
-cx q[56],q[82];
-rx(6.8070791339217) q[82];
-ry(pi/2) q[83];
-rx(pi) q[83];
-cx q[8],q[83];
-rz(2.3585308227235546) q[83];
-cx q[8],q[83];
-rx(6.8070791339217) q[8];
-cx q[68],q[83];
-rz(2.3585308227235546) q[83];
-cx q[68],q[83];
-rx(6.8070791339217) q[68];
-rx(6.8070791339217) q[83];
-ry(pi/2) q[84];
-rx(pi) q[84];
-cx q[70],q[84];
-rz(2.3585308227235546) q[84];
-cx q[70],q[84];
-rx(6.8070791339217) q[70];
-cx q[73],q[84];
-rz(2.3585308227235546) q[84];
-cx q[73],q[84];
-rx(6.8070791339217) q[73];
-rx(6.8070791339217) q[84];
-ry(pi/2) q[85];
-rx(pi) q[85];
-cx q[37],q[85];
-rz(2.3585308227235546) q[85];
-cx q[37],q[85];
-rx(6.8070791339217) q[37];
-cx q[59],q[85];
-rz(2.3585308227235546) q[85];
-cx q[59],q[85];
-rx(6.8070791339217) q[59];
-rx(6.8070791339217) q[85];
-ry(pi/2) q[86];
-rx(pi) q[86];
-cx q[24],q[86];
-rz(2.3585308227235546) q[86];
-cx q[24],q[86];
-cx q[53],q[86];
-rz(2.3585308227235546) q[86];
-cx q[53],q[86];
-rx(6.8070791339217) q[86];
-ry(pi/2) q[87];
-rx(pi) q[87];
-cx q[28],q[87];
-rz(2.3585308227235546) q[87];
-cx q[28],q[87];
-cx q[32],q[87];
-rz(2.3585308227235546) q[87];
-cx q[32],q[87];
-rx(6.8070791339217) q[87];
-ry(pi/2) q[88];
-rx(pi) q[88];
-cx q[3],q[88];
-rz(2.3585308227235546) q[88];
-cx q[3],q[88];
-cx q[60],q[88];
-rz(2.3585308227235546) q[88];
-cx q[60],q[88];
-rx(6.8070791339217) q[60];
-rx(6.8070791339217) q[88];
-ry(pi/2) q[89];
-rx(pi) q[89];
-cx q[2],q[89];
-rz(2.3585308227235546) q[89];
-cx q[2],q[89];
-rx(6.8070791339217) q[2];
-cx q[5],q[89];
-rz(2.3585308227235546) q[89];
-cx q[5],q[89];
-ry(pi/2) q[90];
-rx(pi) q[90];
-cx q[15],q[90];
-rz(2.3585308227235546) q[90];
-cx q[15],q[90];
-cx q[27],q[90];
-rz(2.3585308227235546) q[90];
-cx q[27],q[90];
-rx(6.8070791339217) q[90];
-ry(pi/2) q[91];
-rx(pi) q[91];
-cx q[0],q[91];
-rz(2.3585308227235546) q[91];
-cx q[0],q[91];
-cx q[6],q[91];
-rz(2.3585308227235546) q[91];
-cx q[6],q[91];
-rx(6.8070791339217) q[6];
-rx(6.8070791339217) q[91];
-ry(pi/2) q[92];
-rx(pi) q[92];
-cx q[15],q[92];
-rz(2.3585308227235546) q[92];
-cx q[15],q[92];
-cx q[89],q[92];
-rz(2.3585308227235546) q[92];
-cx q[89],q[92];
-rx(6.8070791339217) q[89];
-ry(pi/2) q[93];
-rx(pi) q[93];
-cx q[0],q[93];
-rz(2.3585308227235546) q[93];
-cx q[0],q[93];
-cx q[32],q[93];
-rz(2.3585308227235546) q[93];
-cx q[32],q[93];
-rx(6.8070791339217) q[93];
-ry(pi/2) q[94];
-rx(pi) q[94];
-cx q[36],q[94];
-rz(2.3585308227235546) q[94];
-cx q[36],q[94];
-cx q[55],q[94];
-rz(2.3585308227235546) q[94];
-cx q[55],q[94];
-rx(6.8070791339217) q[55];
-ry(pi/2) q[95];
-rx(pi) q[95];
-cx q[5],q[95];
-rz(2.3585308227235546) q[95];
-cx q[5],q[95];
-cx q[27],q[95];
-rz(2.3585308227235546) q[95];
-cx q[27],q[95];
-rx(6.8070791339217) q[27];
-rx(6.8070791339217) q[95];
-ry(pi/2) q[96];
-rx(pi) q[96];
-cx q[56],q[96];
-rz(2.3585308227235546) q[96];
-cx q[56],q[96];
-rx(6.8070791339217) q[56];
-cx q[92],q[96];
-rz(2.3585308227235546) q[96];
-cx q[92],q[96];
-rx(6.8070791339217) q[96];
-ry(pi/2) q[97];
-rx(pi) q[97];
-cx q[1],q[97];
-rz(2.3585308227235546) q[97];
-cx q[1],q[97];
-cx q[7],q[97];
-rz(2.3585308227235546) q[97];
-cx q[7],q[97];
-rx(6.8070791339217) q[97];
-ry(pi/2) q[98];
-rx(pi) q[98];
-cx q[10],q[98];
-rz(2.3585308227235546) q[98];
-cx q[10],q[98];
-rx(6.8070791339217) q[10];
-cx q[21],q[98];
-rz(2.3585308227235546) q[98];
-cx q[21],q[98];
-rx(6.8070791339217) q[98];
-ry(pi/2) q[99];
-rx(pi) q[99];
-cx q[4],q[99];
-rz(2.3585308227235546) q[99];
-cx q[4],q[99];
-cx q[41],q[99];
-rz(2.3585308227235546) q[99];
-cx q[41],q[99];
-rx(6.8070791339217) q[41];
-rx(6.8070791339217) q[99];
-ry(pi/2) q[100];
-rx(pi) q[100];
-cx q[3],q[100];
-rz(2.3585308227235546) q[100];
-cx q[3],q[100];
-cx q[25],q[100];
-rz(2.3585308227235546) q[100];
-cx q[25],q[100];
-rx(6.8070791339217) q[25];
-rx(6.8070791339217) q[100];
-ry(pi/2) q[101];
-rx(pi) q[101];
-cx q[16],q[101];
-rz(2.3585308227235546) q[101];
-cx q[16],q[101];
-cx q[50],q[101];
-rz(2.3585308227235546) q[101];
-cx q[50],q[101];
-rx(6.8070791339217) q[50];
-rx(6.8070791339217) q[101];
-ry(pi/2) q[102];
-rx(pi) q[102];
-cx q[3],q[102];
-rz(2.3585308227235546) q[102];
-cx q[3],q[102];
-cx q[4],q[102];
-rz(2.3585308227235546) q[102];
-cx q[4],q[102];
-rx(6.8070791339217) q[4];
-rx(6.8070791339217) q[102];
-ry(pi/2) q[103];
-rx(pi) q[103];
-cx q[16],q[103];
-rz(2.3585308227235546) q[103];
-cx q[16],q[103];
-rx(6.8070791339217) q[16];
-cx q[57],q[103];
-rz(2.3585308227235546) q[103];
-cx q[57],q[103];
-rx(6.8070791339217) q[57];
-rx(6.8070791339217) q[103];
-ry(pi/2) q[104];
-rx(pi) q[104];
-cx q[7],q[104];
-rz(2.3585308227235546) q[104];
-cx q[7],q[104];
-rx(6.8070791339217) q[7];
-cx q[13],q[104];
-rz(2.3585308227235546) q[104];
-cx q[13],q[104];
-rx(6.8070791339217) q[13];
-ry(pi/2) q[105];
-rx(pi) q[105];
-cx q[26],q[105];
-rz(2.3585308227235546) q[105];
-cx q[26],q[105];
-cx q[28],q[105];
-rz(2.3585308227235546) q[105];
-cx q[28],q[105];
-rx(6.8070791339217) q[105];
-ry(pi/2) q[106];
-rx(pi) q[106];
-cx q[5],q[106];
-rz(2.3585308227235546) q[106];
-cx q[5],q[106];
-cx q[36],q[106];
-rz(2.3585308227235546) q[106];
-cx q[36],q[106];
-rx(6.8070791339217) q[106];
-ry(pi/2) q[107];
-rx(pi) q[107];
-cx q[3],q[107];
-rz(2.3585308227235546) q[107];
-cx q[3],q[107];
-cx q[31],q[107];
-rz(2.3585308227235546) q[107];
-cx q[31],q[107];
-rx(6.8070791339217) q[107];
-ry(pi/2) q[108];
-rx(pi) q[108];
-cx q[15],q[108];
-rz(2.3585308227235546) q[108];
-cx q[15],q[108];
-cx q[31],q[108];
-rz(2.3585308227235546) q[108];
-cx q[31],q[108];
-rx(6.8070791339217) q[31];
-rx(6.8070791339217) q[108];
-ry(pi/2) q[109];
-rx(pi) q[109];
-cx q[5],q[109];
-rz(2.3585308227235546) q[109];
-cx q[5],q[109];
-cx q[39],q[109];
-rz(2.3585308227235546) q[109];
-cx q[39],q[109];
-rx(6.8070791339217) q[39];
-rx(6.8070791339217) q[109];
-ry(pi/2) q[110];
-rx(pi) q[110];
-cx q[3],q[110];
-rz(2.3585308227235546) q[110];
-cx q[3],q[110];
-cx q[24],q[110];
-rz(2.3585308227235546) q[110];
-cx q[24],q[110];
-rx(6.8070791339217) q[24];
-ry(pi/2) q[111];
-rx(pi) q[111];
-cx q[3],q[111];
-rz(2.3585308227235546) q[111];
-cx q[3],q[111];
-cx q[21],q[111];
-rz(2.3585308227235546) q[111];
-cx q[21],q[111];
-rx(6.8070791339217) q[111];
-ry(pi/2) q[112];
-rx(pi) q[112];
-cx q[21],q[112];
-rz(2.3585308227235546) q[112];
-cx q[21],q[112];
-rx(6.8070791339217) q[21];
-cx q[36],q[112];
-rz(2.3585308227235546) q[112];
-cx q[36],q[112];
-rx(6.8070791339217) q[36];
-rx(6.8070791339217) q[112];
-ry(pi/2) q[113];
-rx(pi) q[113];
-cx q[1],q[113];
-rz(2.3585308227235546) q[113];
-cx q[1],q[113];
-rx(6.8070791339217) q[1];
-cx q[3],q[113];
-rz(2.3585308227235546) q[113];
-cx q[3],q[113];
-rx(6.8070791339217) q[3];
-rx(6.8070791339217) q[113];
-ry(pi/2) q[114];
-rx(pi) q[114];
-cx q[104],q[114];
-rz(2.3585308227235546) q[114];
-cx q[104],q[114];
-cx q[110],q[114];
-rz(2.3585308227235546) q[114];
-cx q[110],q[114];
-rx(6.8070791339217) q[110];
-rx(6.8070791339217) q[114];
-ry(pi/2) q[115];
-rx(pi) q[115];
-cx q[15],q[115];
-rz(2.3585308227235546) q[115];
-cx q[15],q[115];
-cx q[92],q[115];
-rz(2.3585308227235546) q[115];
-cx q[92],q[115];
-rx(6.8070791339217) q[92];
-rx(6.8070791339217) q[115];
-ry(pi/2) q[116];
-rx(pi) q[116];
-cx q[28],q[116];
-rz(2.3585308227235546) q[116];
-cx q[28],q[116];
-rx(6.8070791339217) q[28];
-cx q[42],q[116];
-rz(2.3585308227235546) q[116];
-cx q[42],q[116];
-rx(6.8070791339217) q[42];
-rx(6.8070791339217) q[116];
-ry(pi/2) q[117];
-rx(pi) q[117];
-cx q[26],q[117];
-rz(2.3585308227235546) q[117];
-cx q[26],q[117];
-rx(6.8070791339217) q[26];
-cx q[32],q[117];
-rz(2.3585308227235546) q[117];
-cx q[32],q[117];
-rx(6.8070791339217) q[32];
-rx(6.8070791339217) q[117];
-ry(pi/2) q[118];
-rx(pi) q[118];
-cx q[5],q[118];
-rz(2.3585308227235546) q[118];
-cx q[5],q[118];
-rx(6.8070791339217) q[5];
-cx q[15],q[118];
-rz(2.3585308227235546) q[118];
-cx q[15],q[118];
-rx(6.8070791339217) q[15];
-rx(6.8070791339217) q[118];
-ry(pi/2) q[119];
-rx(pi) q[119];
-cx q[40],q[119];
-rz(2.3585308227235546) q[119];
-cx q[40],q[119];
-rx(6.8070791339217) q[40];
-cx q[69],q[119];
-rz(2.3585308227235546) q[119];
-cx q[69],q[119];
-rx(6.8070791339217) q[69];
-rx(6.8070791339217) q[119];
-ry(pi/2) q[120];
-rx(pi) q[120];
-cx q[46],q[120];
-rz(2.3585308227235546) q[120];
-cx q[46],q[120];
-rx(6.8070791339217) q[46];
-cx q[94],q[120];
-rz(2.3585308227235546) q[120];
-cx q[94],q[120];
-rx(6.8070791339217) q[94];
-rx(6.8070791339217) q[120];
-ry(pi/2) q[121];
-rx(pi) q[121];
-cx q[20],q[121];
-rz(2.3585308227235546) q[121];
-cx q[20],q[121];
-rx(6.8070791339217) q[20];
-cx q[104],q[121];
-rz(2.3585308227235546) q[121];
-cx q[104],q[121];
-rx(6.8070791339217) q[104];
-rx(6.8070791339217) q[121];
-ry(pi/2) q[122];
-rx(pi) q[122];
-cx q[63],q[122];
-rz(2.3585308227235546) q[122];
-cx q[63],q[122];
-rx(6.8070791339217) q[63];
-cx q[81],q[122];
-rz(2.3585308227235546) q[122];
-cx q[81],q[122];
-rx(6.8070791339217) q[122];
-ry(pi/2) q[123];
-rx(pi) q[123];
-cx q[0],q[123];
-rz(2.3585308227235546) q[123];
-cx q[0],q[123];
-rx(6.8070791339217) q[0];
-cx q[0],q[1];
-rz(2.016025623591687) q[1];
-cx q[0],q[1];
-cx q[0],q[2];
-rz(2.016025623591687) q[2];
-cx q[0],q[2];
-cx q[0],q[3];
-cx q[2],q[89];
-rz(2.016025623591687) q[3];
-cx q[0],q[3];
-cx q[0],q[15];
-cx q[1],q[3];
-rz(2.016025623591687) q[3];
-cx q[1],q[3];
-cx q[1],q[4];
-rz(2.016025623591687) q[4];
-cx q[1],q[4];
-cx q[1],q[5];
-cx q[3],q[4];
-rz(2.016025623591687) q[4];
-cx q[3],q[4];
-cx q[4],q[6];
-rz(2.016025623591687) q[5];
-cx q[1],q[5];
-cx q[1],q[9];
-cx q[3],q[5];
-rz(2.016025623591687) q[5];
-cx q[3],q[5];
-cx q[3],q[7];
-rz(2.016025623591687) q[6];
-cx q[4],q[6];
-cx q[5],q[6];
-rz(2.016025623591687) q[6];
-cx q[5],q[6];
-rz(2.016025623591687) q[7];
-cx q[3],q[7];
-cx q[3],q[8];
-cx q[4],q[7];
-rz(2.016025623591687) q[7];
-cx q[4],q[7];
-cx q[4],q[10];
-rz(2.016025623591687) q[8];
-cx q[3],q[8];
-cx q[5],q[8];
-rz(2.016025623591687) q[8];
-cx q[5],q[8];
-cx q[5],q[11];
-cx q[8],q[83];
-rz(2.016025623591687) q[9];
-cx q[1],q[9];
-cx q[1],q[17];
-cx q[3],q[9];
-rz(2.016025623591687) q[9];
-cx q[3],q[9];
-cx q[3],q[12];
-rz(2.016025623591687) q[10];
-cx q[4],q[10];
-cx q[4],q[13];
-cx q[6],q[10];
-rz(2.016025623591687) q[10];
-cx q[6],q[10];
-cx q[10],q[37];
-rz(2.016025623591687) q[11];
-cx q[5],q[11];
-cx q[6],q[11];
-rz(2.016025623591687) q[11];
-cx q[6],q[11];
-rx(3.1420068932178316) q[11];
-rz(2.016025623591687) q[12];
-cx q[3],q[12];
-cx q[3],q[14];
-cx q[5],q[12];
-rz(2.016025623591687) q[12];
-cx q[5],q[12];
-rz(2.016025623591687) q[13];
-cx q[4],q[13];
-cx q[5],q[13];
-rz(2.016025623591687) q[13];
-cx q[5],q[13];
-rz(2.016025623591687) q[14];
-cx q[3],q[14];
-cx q[4],q[14];
-rz(2.016025623591687) q[14];
-cx q[4],q[14];
-rx(3.1420068932178316) q[14];
-rz(2.016025623591687) q[15];
-cx q[0],q[15];
-cx q[0],q[16];
-cx q[3],q[15];
-rz(2.016025623591687) q[15];
-cx q[3],q[15];
-rz(2.016025623591687) q[16];
-cx q[0],q[16];
-cx q[0],q[20];
-cx q[3],q[16];
-rz(2.016025623591687) q[16];
-cx q[3],q[16];
-rz(2.016025623591687) q[17];
-cx q[1],q[17];
-cx q[1],q[28];
-cx q[3],q[17];
-rz(2.016025623591687) q[17];
-cx q[3],q[17];
-cx q[3],q[18];
-rz(2.016025623591687) q[18];
-cx q[3],q[18];
-cx q[3],q[19];
-cx q[4],q[18];
-rz(2.016025623591687) q[18];
-cx q[4],q[18];
-cx q[4],q[21];
-rz(2.016025623591687) q[19];
-cx q[3],q[19];
-cx q[3],q[22];
-cx q[7],q[19];
-rz(2.016025623591687) q[19];
-cx q[7],q[19];
-cx q[19],q[38];
-rz(2.016025623591687) q[20];
-cx q[0],q[20];
-cx q[0],q[32];
-cx q[15],q[20];
-rz(2.016025623591687) q[20];
-cx q[15],q[20];
-rz(2.016025623591687) q[21];
-cx q[4],q[21];
-cx q[4],q[27];
-cx q[15],q[21];
-rz(2.016025623591687) q[21];
-cx q[15],q[21];
-cx q[15],q[36];
-rz(2.016025623591687) q[22];
-cx q[3],q[22];
-cx q[3],q[23];
-cx q[9],q[22];
-rz(2.016025623591687) q[22];
-cx q[9],q[22];
-cx q[9],q[55];
-rx(3.1420068932178316) q[22];
-rz(2.016025623591687) q[23];
-cx q[3],q[23];
-cx q[3],q[24];
-cx q[17],q[23];
-rz(2.016025623591687) q[23];
-cx q[17],q[23];
-rz(2.016025623591687) q[24];
-cx q[3],q[24];
-cx q[3],q[25];
-cx q[5],q[24];
-rz(2.016025623591687) q[24];
-cx q[5],q[24];
-cx q[5],q[33];
-cx q[24],q[54];
-rz(2.016025623591687) q[25];
-cx q[3],q[25];
-cx q[3],q[26];
-cx q[12],q[25];
-rz(2.016025623591687) q[25];
-cx q[12],q[25];
-cx q[12],q[31];
-rz(2.016025623591687) q[26];
-cx q[3],q[26];
-cx q[21],q[26];
-rz(2.016025623591687) q[26];
-cx q[21],q[26];
-rz(2.016025623591687) q[27];
-cx q[4],q[27];
-cx q[4],q[47];
-cx q[6],q[27];
-rz(2.016025623591687) q[27];
-cx q[6],q[27];
-cx q[6],q[69];
-rz(2.016025623591687) q[28];
-cx q[1],q[28];
-cx q[1],q[29];
-cx q[3],q[28];
-rz(2.016025623591687) q[28];
-cx q[3],q[28];
-rz(2.016025623591687) q[29];
-cx q[1],q[29];
-cx q[1],q[45];
-cx q[3],q[29];
-rz(2.016025623591687) q[29];
-cx q[3],q[29];
-cx q[3],q[30];
-rx(3.1420068932178316) q[29];
-rz(2.016025623591687) q[30];
-cx q[3],q[30];
-cx q[3],q[34];
-cx q[18],q[30];
-rz(2.016025623591687) q[30];
-cx q[18],q[30];
-rx(3.1420068932178316) q[18];
-rz(2.016025623591687) q[31];
-cx q[12],q[31];
-cx q[26],q[31];
-rz(2.016025623591687) q[31];
-cx q[26],q[31];
-cx q[26],q[105];
-rz(2.016025623591687) q[32];
-cx q[0],q[32];
-cx q[0],q[42];
-cx q[21],q[32];
-rz(2.016025623591687) q[32];
-cx q[21],q[32];
-rz(2.016025623591687) q[33];
-cx q[5],q[33];
-cx q[5],q[46];
-cx q[30],q[33];
-rz(2.016025623591687) q[33];
-cx q[30],q[33];
-rx(3.1420068932178316) q[33];
-rz(2.016025623591687) q[34];
-cx q[3],q[34];
-cx q[3],q[35];
-cx q[12],q[34];
-rz(2.016025623591687) q[34];
-cx q[12],q[34];
-rz(2.016025623591687) q[35];
-cx q[3],q[35];
-cx q[3],q[39];
-cx q[32],q[35];
-rz(2.016025623591687) q[35];
-cx q[32],q[35];
-rx(3.1420068932178316) q[35];
-rz(2.016025623591687) q[36];
-cx q[15],q[36];
-cx q[20],q[36];
-rz(2.016025623591687) q[36];
-cx q[20],q[36];
-cx q[36],q[94];
-rz(2.016025623591687) q[37];
-cx q[10],q[37];
-cx q[10],q[41];
-cx q[34],q[37];
-rz(2.016025623591687) q[37];
-cx q[34],q[37];
-rx(3.1420068932178316) q[34];
-cx q[37],q[85];
-rz(2.016025623591687) q[38];
-cx q[19],q[38];
-rx(3.1420068932178316) q[19];
-cx q[21],q[38];
-rz(2.016025623591687) q[38];
-cx q[21],q[38];
-rz(2.016025623591687) q[39];
-cx q[3],q[39];
-cx q[3],q[40];
-cx q[13],q[39];
-rz(2.016025623591687) q[39];
-cx q[13],q[39];
-cx q[13],q[56];
-rz(2.016025623591687) q[40];
-cx q[3],q[40];
-cx q[23],q[40];
-rz(2.016025623591687) q[40];
-cx q[23],q[40];
-cx q[40],q[119];
-rz(2.016025623591687) q[41];
-cx q[10],q[41];
-cx q[27],q[41];
-rz(2.016025623591687) q[41];
-cx q[27],q[41];
-cx q[27],q[72];
-cx q[41],q[67];
-rz(2.016025623591687) q[42];
-cx q[0],q[42];
-cx q[0],q[48];
-cx q[3],q[42];
-rz(2.016025623591687) q[42];
-cx q[3],q[42];
-cx q[3],q[43];
-cx q[42],q[78];
-rz(2.016025623591687) q[43];
-cx q[3],q[43];
-cx q[3],q[44];
-cx q[20],q[43];
-rz(2.016025623591687) q[43];
-cx q[20],q[43];
-cx q[20],q[121];
-rx(3.1420068932178316) q[43];
-rz(2.016025623591687) q[44];
-cx q[3],q[44];
-cx q[3],q[49];
-cx q[12],q[44];
-rz(2.016025623591687) q[44];
-cx q[12],q[44];
-rz(2.016025623591687) q[45];
-cx q[1],q[45];
-cx q[1],q[57];
-cx q[16],q[45];
-rz(2.016025623591687) q[45];
-cx q[16],q[45];
-cx q[16],q[59];
-rz(2.016025623591687) q[46];
-cx q[5],q[46];
-cx q[5],q[65];
-cx q[38],q[46];
-rz(2.016025623591687) q[46];
-cx q[38],q[46];
-rx(3.1420068932178316) q[38];
-cx q[46],q[120];
-rz(2.016025623591687) q[47];
-cx q[4],q[47];
-cx q[17],q[47];
-rz(2.016025623591687) q[47];
-cx q[17],q[47];
-rz(2.016025623591687) q[48];
-cx q[0],q[48];
-cx q[0],q[51];
-cx q[30],q[48];
-rz(2.016025623591687) q[48];
-cx q[30],q[48];
-rx(3.1420068932178316) q[48];
-rz(2.016025623591687) q[49];
-cx q[3],q[49];
-cx q[3],q[50];
-cx q[4],q[49];
-rz(2.016025623591687) q[49];
-cx q[4],q[49];
-cx q[4],q[61];
-rx(3.1420068932178316) q[49];
-rz(2.016025623591687) q[50];
-cx q[3],q[50];
-cx q[12],q[50];
-rz(2.016025623591687) q[50];
-cx q[12],q[50];
-cx q[12],q[63];
-rz(2.016025623591687) q[51];
-cx q[0],q[51];
-cx q[0],q[62];
-cx q[28],q[51];
-rz(2.016025623591687) q[51];
-cx q[28],q[51];
-rx(3.1420068932178316) q[51];
-cx q[52],q[123];
-rz(2.016025623591687) q[54];
-cx q[24],q[54];
-cx q[24],q[58];
-cx q[28],q[54];
-rz(2.016025623591687) q[54];
-cx q[28],q[54];
-rx(3.1420068932178316) q[54];
-rz(2.016025623591687) q[55];
-cx q[9],q[55];
-cx q[9],q[80];
-cx q[15],q[55];
-rz(2.016025623591687) q[55];
-cx q[15],q[55];
-rz(2.016025623591687) q[56];
-cx q[13],q[56];
-cx q[13],q[68];
-cx q[45],q[56];
-rz(2.016025623591687) q[56];
-cx q[45],q[56];
-rx(3.1420068932178316) q[45];
-rz(2.016025623591687) q[57];
-cx q[1],q[57];
-cx q[1],q[60];
-rz(2.016025623591687) q[58];
-cx q[24],q[58];
-cx q[24],q[86];
-cx q[28],q[58];
-rz(2.016025623591687) q[58];
-cx q[28],q[58];
-cx q[28],q[87];
-rx(3.1420068932178316) q[58];
-rz(2.016025623591687) q[59];
-cx q[16],q[59];
-cx q[16],q[73];
-cx q[32],q[59];
-rz(2.016025623591687) q[59];
-cx q[32],q[59];
-rz(2.016025623591687) q[60];
-cx q[1],q[60];
-cx q[1],q[97];
-cx q[7],q[60];
-rz(2.016025623591687) q[60];
-cx q[7],q[60];
-rz(2.016025623591687) q[61];
-cx q[4],q[61];
-cx q[4],q[99];
-cx q[7],q[61];
-rz(2.016025623591687) q[61];
-cx q[7],q[61];
-rx(3.1420068932178316) q[61];
-rz(2.016025623591687) q[62];
-cx q[0],q[62];
-cx q[0],q[64];
-rz(2.016025623591687) q[63];
-cx q[12],q[63];
-rx(3.1420068932178316) q[12];
-rz(2.016025623591687) q[64];
-cx q[0],q[64];
-cx q[0],q[75];
-rz(2.016025623591687) q[65];
-cx q[5],q[65];
-cx q[5],q[76];
-cx q[23],q[65];
-rz(2.016025623591687) q[65];
-cx q[23],q[65];
-rx(3.1420068932178316) q[23];
-rx(3.1420068932178316) q[65];
-rz(2.016025623591687) q[67];
-cx q[41],q[67];
-cx q[56],q[67];
-rz(2.016025623591687) q[67];
-cx q[56],q[67];
-cx q[56],q[74];
-rx(3.1420068932178316) q[67];
-rz(2.016025623591687) q[68];
-cx q[13],q[68];
-cx q[32],q[68];
-rz(2.016025623591687) q[68];
-cx q[32],q[68];
-rz(2.016025623591687) q[69];
-cx q[6],q[69];
-cx q[59],q[69];
-rz(2.016025623591687) q[69];
-cx q[59],q[69];
-rz(2.016025623591687) q[72];
-cx q[27],q[72];
-cx q[44],q[72];
-rz(2.016025623591687) q[72];
-cx q[44],q[72];
-rx(3.1420068932178316) q[44];
-rx(3.1420068932178316) q[72];
-rz(2.016025623591687) q[73];
-cx q[16],q[73];
-cx q[16],q[101];
-cx q[59],q[73];
-rz(2.016025623591687) q[73];
-cx q[59],q[73];
-rz(2.016025623591687) q[74];
-cx q[56],q[74];
-rz(2.016025623591687) q[75];
-cx q[0],q[75];
-cx q[0],q[82];
-rz(2.016025623591687) q[76];
-cx q[5],q[76];
-cx q[6],q[76];
-rz(2.016025623591687) q[76];
-cx q[6],q[76];
-cx q[6],q[79];
-rx(3.1420068932178316) q[76];
-rz(2.016025623591687) q[78];
-cx q[42],q[78];
-cx q[60],q[78];
-rz(2.016025623591687) q[78];
-cx q[60],q[78];
-rx(3.1420068932178316) q[78];
-rz(2.016025623591687) q[79];
-cx q[6],q[79];
-cx q[50],q[79];
-rz(2.016025623591687) q[79];
-cx q[50],q[79];
-rx(3.1420068932178316) q[79];
-rz(2.016025623591687) q[80];
-cx q[9],q[80];
-rx(3.1420068932178316) q[9];
-rz(2.016025623591687) q[82];
-cx q[0],q[82];
-cx q[0],q[91];
-cx q[56],q[82];
-rz(2.016025623591687) q[82];
-cx q[56],q[82];
-cx q[56],q[96];
-rx(3.1420068932178316) q[82];
-rz(2.016025623591687) q[83];
-cx q[8],q[83];
-rx(3.1420068932178316) q[8];
-cx q[68],q[83];
-rz(2.016025623591687) q[83];
-cx q[68],q[83];
-rx(3.1420068932178316) q[68];
-rx(3.1420068932178316) q[83];
-rz(2.016025623591687) q[85];
-cx q[37],q[85];
-rx(3.1420068932178316) q[37];
-cx q[59],q[85];
-rz(2.016025623591687) q[85];
-cx q[59],q[85];
-rx(3.1420068932178316) q[59];
-rx(3.1420068932178316) q[85];
-rz(2.016025623591687) q[86];
-cx q[24],q[86];
-rz(2.016025623591687) q[87];
-cx q[28],q[87];
-cx q[32],q[87];
-rz(2.016025623591687) q[87];
-cx q[32],q[87];
-rx(3.1420068932178316) q[87];
-rz(2.016025623591687) q[89];
-cx q[2],q[89];
-rx(3.1420068932178316) q[2];
-cx q[5],q[89];
-rz(2.016025623591687) q[89];
-cx q[5],q[89];
-cx q[5],q[95];
-rz(2.016025623591687) q[91];
-cx q[0],q[91];
-cx q[0],q[93];
-cx q[6],q[91];
-rz(2.016025623591687) q[91];
-cx q[6],q[91];
-rx(3.1420068932178316) q[6];
-rx(3.1420068932178316) q[91];
-rz(2.016025623591687) q[93];
-cx q[0],q[93];
-cx q[32],q[93];
-rz(2.016025623591687) q[93];
-cx q[32],q[93];
-rx(3.1420068932178316) q[93];
-rz(2.016025623591687) q[94];
-cx q[36],q[94];
-cx q[55],q[94];
-rz(2.016025623591687) q[94];
-cx q[55],q[94];
-rx(3.1420068932178316) q[55];
-rz(2.016025623591687) q[95];
-cx q[5],q[95];
-cx q[5],q[106];
-rz(2.016025623591687) q[96];
-cx q[56],q[96];
-rx(3.1420068932178316) q[56];
-rz(2.016025623591687) q[97];
-cx q[1],q[97];
-cx q[1],q[113];
-cx q[7],q[97];
-rz(2.016025623591687) q[97];
-cx q[7],q[97];
-cx q[7],q[104];
-rx(3.1420068932178316) q[97];
-rz(2.016025623591687) q[99];
-cx q[4],q[99];
-cx q[41],q[99];
-rz(2.016025623591687) q[99];
-cx q[41],q[99];
-rx(3.1420068932178316) q[41];
-rx(3.1420068932178316) q[99];
-rz(2.016025623591687) q[101];
-cx q[16],q[101];
-cx q[16],q[103];
-cx q[50],q[101];
-rz(2.016025623591687) q[101];
-cx q[50],q[101];
-rx(3.1420068932178316) q[50];
-rx(3.1420068932178316) q[101];
-rz(2.016025623591687) q[103];
-cx q[16],q[103];
-rx(3.1420068932178316) q[16];
-rz(2.016025623591687) q[104];
-cx q[7],q[104];
-rx(3.1420068932178316) q[7];
-cx q[13],q[104];
-rz(2.016025623591687) q[104];
-cx q[13],q[104];
-rx(3.1420068932178316) q[13];
-cx q[104],q[114];
-rz(2.016025623591687) q[105];
-cx q[26],q[105];
-cx q[26],q[117];
-cx q[28],q[105];
-rz(2.016025623591687) q[105];
-cx q[28],q[105];
-cx q[28],q[116];
-rx(3.1420068932178316) q[105];
-rz(2.016025623591687) q[106];
-cx q[5],q[106];
-cx q[5],q[109];
-cx q[36],q[106];
-rz(2.016025623591687) q[106];
-cx q[36],q[106];
-rx(3.1420068932178316) q[106];
-rz(2.016025623591687) q[109];
-cx q[5],q[109];
-cx q[5],q[118];
-cx q[39],q[109];
-rz(2.016025623591687) q[109];
-cx q[39],q[109];
-rx(3.1420068932178316) q[39];
-rx(3.1420068932178316) q[109];
-rz(2.016025623591687) q[113];
-cx q[1],q[113];
-rx(3.1420068932178316) q[1];
-rz(2.016025623591687) q[114];
-cx q[104],q[114];
-rz(2.016025623591687) q[116];
-cx q[28],q[116];
-rx(3.1420068932178316) q[28];
-cx q[42],q[116];
-rz(2.016025623591687) q[116];
-cx q[42],q[116];
-rx(3.1420068932178316) q[42];
-rx(3.1420068932178316) q[116];
-rz(2.016025623591687) q[117];
-cx q[26],q[117];
-rx(3.1420068932178316) q[26];
-cx q[32],q[117];
-rz(2.016025623591687) q[117];
-cx q[32],q[117];
-rx(3.1420068932178316) q[32];
-rx(3.1420068932178316) q[117];
-rz(2.016025623591687) q[118];
-cx q[5],q[118];
-rx(3.1420068932178316) q[5];
-rz(2.016025623591687) q[119];
-cx q[40],q[119];
-rx(3.1420068932178316) q[40];
-cx q[69],q[119];
-rz(2.016025623591687) q[119];
-cx q[69],q[119];
-rx(3.1420068932178316) q[69];
-rx(3.1420068932178316) q[119];
-rz(2.016025623591687) q[120];
-cx q[46],q[120];
-rx(3.1420068932178316) q[46];
-cx q[94],q[120];
-rz(2.016025623591687) q[120];
-cx q[94],q[120];
-rx(3.1420068932178316) q[94];
-rx(3.1420068932178316) q[120];
-rz(2.016025623591687) q[121];
-cx q[20],q[121];
-rx(3.1420068932178316) q[20];
-cx q[104],q[121];
-rz(2.016025623591687) q[121];
-cx q[104],q[121];
-rx(3.1420068932178316) q[104];
-rx(3.1420068932178316) q[121];
-rz(2.3585308227235546) q[123];
-cx q[52],q[123];
-rx(6.8070791339217) q[52];
-cx q[3],q[52];
-rz(2.016025623591687) q[52];
-cx q[3],q[52];
-cx q[3],q[57];
-cx q[10],q[52];
-rz(2.016025623591687) q[52];
-cx q[10],q[52];
-cx q[10],q[64];
-rz(2.016025623591687) q[57];
-cx q[3],q[57];
-cx q[3],q[70];
-cx q[57],q[103];
-rz(2.016025623591687) q[64];
-cx q[10],q[64];
-cx q[10],q[98];
-rx(3.1420068932178316) q[64];
-rz(2.016025623591687) q[70];
-cx q[3],q[70];
-cx q[3],q[71];
-cx q[15],q[70];
-rz(2.016025623591687) q[70];
-cx q[15],q[70];
-cx q[15],q[80];
-cx q[70],q[84];
-rz(2.016025623591687) q[71];
-cx q[3],q[71];
-cx q[3],q[77];
-rz(2.016025623591687) q[77];
-cx q[3],q[77];
-cx q[3],q[88];
-cx q[30],q[77];
-rz(2.016025623591687) q[77];
-cx q[30],q[77];
-rx(3.1420068932178316) q[30];
-rz(2.016025623591687) q[80];
-cx q[15],q[80];
-cx q[15],q[90];
-rx(3.1420068932178316) q[80];
-rz(2.016025623591687) q[84];
-cx q[70],q[84];
-rx(3.1420068932178316) q[70];
-cx q[73],q[84];
-rz(2.016025623591687) q[84];
-cx q[73],q[84];
-rx(3.1420068932178316) q[73];
-rx(3.1420068932178316) q[84];
-rz(2.016025623591687) q[88];
-cx q[3],q[88];
-cx q[3],q[100];
-cx q[60],q[88];
-rz(2.016025623591687) q[88];
-cx q[60],q[88];
-rx(3.1420068932178316) q[60];
-rx(3.1420068932178316) q[88];
-rz(2.016025623591687) q[90];
-cx q[15],q[90];
-cx q[15],q[92];
-cx q[27],q[90];
-rz(2.016025623591687) q[90];
-cx q[27],q[90];
-cx q[27],q[95];
-rx(3.1420068932178316) q[90];
-rz(2.016025623591687) q[92];
-cx q[15],q[92];
-cx q[15],q[108];
-cx q[89],q[92];
-rz(2.016025623591687) q[92];
-cx q[89],q[92];
-rx(3.1420068932178316) q[89];
-cx q[92],q[96];
-rz(2.016025623591687) q[95];
-cx q[27],q[95];
-rx(3.1420068932178316) q[27];
-rx(3.1420068932178316) q[95];
-rz(2.016025623591687) q[96];
-cx q[92],q[96];
-rx(3.1420068932178316) q[96];
-rz(2.016025623591687) q[98];
-cx q[10],q[98];
-rx(3.1420068932178316) q[10];
-rz(2.016025623591687) q[100];
-cx q[3],q[100];
-cx q[3],q[102];
-cx q[25],q[100];
-rz(2.016025623591687) q[100];
-cx q[25],q[100];
-rx(3.1420068932178316) q[25];
-rx(3.1420068932178316) q[100];
-rz(2.016025623591687) q[102];
-cx q[3],q[102];
-cx q[3],q[107];
-cx q[4],q[102];
-rz(2.016025623591687) q[102];
-cx q[4],q[102];
-rx(3.1420068932178316) q[4];
-rx(3.1420068932178316) q[102];
-rz(2.016025623591687) q[103];
-cx q[57],q[103];
-rx(3.1420068932178316) q[57];
-rx(3.1420068932178316) q[103];
-rz(2.016025623591687) q[107];
-cx q[3],q[107];
-cx q[3],q[110];
-cx q[31],q[107];
-rz(2.016025623591687) q[107];
-cx q[31],q[107];
-rx(3.1420068932178316) q[107];
-rz(2.016025623591687) q[108];
-cx q[15],q[108];
-cx q[15],q[115];
-cx q[31],q[108];
-rz(2.016025623591687) q[108];
-cx q[31],q[108];
-rx(3.1420068932178316) q[31];
-rx(3.1420068932178316) q[108];
-rz(2.016025623591687) q[110];
-cx q[3],q[110];
-cx q[3],q[111];
-cx q[24],q[110];
-rz(2.016025623591687) q[110];
-cx q[24],q[110];
-rx(3.1420068932178316) q[24];
-cx q[110],q[114];
-rz(2.016025623591687) q[111];
-cx q[3],q[111];
-cx q[3],q[113];
-rz(2.016025623591687) q[113];
-cx q[3],q[113];
-rx(3.1420068932178316) q[3];
-rx(3.1420068932178316) q[113];
-rz(2.016025623591687) q[114];
-cx q[110],q[114];
-rx(3.1420068932178316) q[110];
-rx(3.1420068932178316) q[114];
-rz(2.016025623591687) q[115];
-cx q[15],q[115];
-cx q[15],q[118];
-cx q[92],q[115];
-rz(2.016025623591687) q[115];
-cx q[92],q[115];
-rx(3.1420068932178316) q[92];
-rx(3.1420068932178316) q[115];
-rz(2.016025623591687) q[118];
-cx q[15],q[118];
-rx(3.1420068932178316) q[15];
-rx(3.1420068932178316) q[118];
-rx(6.8070791339217) q[123];
-cx q[0],q[123];
-rz(2.016025623591687) q[123];
-cx q[0],q[123];
-rx(3.1420068932178316) q[0];
-cx q[0],q[1];
-rz(5.1367255444690105) q[1];
-cx q[0],q[1];
-cx q[0],q[2];
-rz(5.1367255444690105) q[2];
-cx q[0],q[2];
-cx q[0],q[3];
-cx q[2],q[89];
-rz(5.1367255444690105) q[3];
-cx q[0],q[3];
-cx q[0],q[15];
-cx q[1],q[3];
-rz(5.1367255444690105) q[3];
-cx q[1],q[3];
-cx q[1],q[4];
-rz(5.1367255444690105) q[4];
-cx q[1],q[4];
-cx q[1],q[5];
-cx q[3],q[4];
-rz(5.1367255444690105) q[4];
-cx q[3],q[4];
-cx q[4],q[6];
-rz(5.1367255444690105) q[5];
-cx q[1],q[5];
-cx q[1],q[9];
-cx q[3],q[5];
-rz(5.1367255444690105) q[5];
-cx q[3],q[5];
-cx q[3],q[7];
-rz(5.1367255444690105) q[6];
-cx q[4],q[6];
-cx q[5],q[6];
-rz(5.1367255444690105) q[6];
-cx q[5],q[6];
-rz(5.1367255444690105) q[7];
-cx q[3],q[7];
-cx q[3],q[8];
-cx q[4],q[7];
-rz(5.1367255444690105) q[7];
-cx q[4],q[7];
-cx q[4],q[10];
-rz(5.1367255444690105) q[8];
-cx q[3],q[8];
-cx q[5],q[8];
-rz(5.1367255444690105) q[8];
-cx q[5],q[8];
-cx q[5],q[11];
-cx q[8],q[83];
-rz(5.1367255444690105) q[9];
-cx q[1],q[9];
-cx q[3],q[9];
-rz(5.1367255444690105) q[9];
-cx q[3],q[9];
-cx q[3],q[12];
-rz(5.1367255444690105) q[10];
-cx q[4],q[10];
-cx q[4],q[13];
-cx q[6],q[10];
-rz(5.1367255444690105) q[10];
-cx q[6],q[10];
-cx q[10],q[37];
-rz(5.1367255444690105) q[11];
-cx q[5],q[11];
-cx q[6],q[11];
-rz(5.1367255444690105) q[11];
-cx q[6],q[11];
-rx(2.8773724773516087) q[11];
-rz(5.1367255444690105) q[12];
-cx q[3],q[12];
-cx q[3],q[14];
-cx q[5],q[12];
-rz(5.1367255444690105) q[12];
-cx q[5],q[12];
-rz(5.1367255444690105) q[13];
-cx q[4],q[13];
-cx q[5],q[13];
-rz(5.1367255444690105) q[13];
-cx q[5],q[13];
-rz(5.1367255444690105) q[14];
-cx q[3],q[14];
-cx q[4],q[14];
-rz(5.1367255444690105) q[14];
-cx q[4],q[14];
-rx(2.8773724773516087) q[14];
-rz(5.1367255444690105) q[15];
-cx q[0],q[15];
-cx q[0],q[16];
-cx q[3],q[15];
-rz(5.1367255444690105) q[15];
-cx q[3],q[15];
-rz(5.1367255444690105) q[16];
-cx q[0],q[16];
-cx q[0],q[20];
-cx q[3],q[16];
-rz(5.1367255444690105) q[16];
-cx q[3],q[16];
-rz(5.1367255444690105) q[20];
-cx q[0],q[20];
-cx q[0],q[32];
-cx q[15],q[20];
-rz(5.1367255444690105) q[20];
-cx q[15],q[20];
-rz(5.1367255444690105) q[32];
-cx q[0],q[32];
-cx q[0],q[42];
-rz(5.1367255444690105) q[37];
-cx q[10],q[37];
-cx q[10],q[41];
-rz(5.1367255444690105) q[41];
-cx q[10],q[41];
-rz(5.1367255444690105) q[42];
-cx q[0],q[42];
-cx q[0],q[48];
-rz(5.1367255444690105) q[48];
-cx q[0],q[48];
-cx q[0],q[51];
-rz(5.1367255444690105) q[51];
-cx q[0],q[51];
-cx q[52],q[123];
-rz(5.1367255444690105) q[83];
-cx q[8],q[83];
-rx(2.8773724773516087) q[8];
-rz(5.1367255444690105) q[89];
-cx q[2],q[89];
-rx(2.8773724773516087) q[2];
-rz(2.016025623591687) q[123];
-cx q[52],q[123];
-rx(3.1420068932178316) q[52];
-rx(3.1420068932178316) q[123];
-ry(pi/2) q[124];
-rx(pi) q[124];
-cx q[53],q[124];
-rz(2.3585308227235546) q[124];
-cx q[53],q[124];
-rx(6.8070791339217) q[53];
-cx q[17],q[53];
-rz(2.016025623591687) q[53];
-cx q[17],q[53];
-cx q[17],q[62];
-cx q[21],q[53];
-rz(2.016025623591687) q[53];
-cx q[21],q[53];
-cx q[21],q[75];
-cx q[53],q[71];
-rz(2.016025623591687) q[62];
-cx q[17],q[62];
-cx q[17],q[63];
-rx(3.1420068932178316) q[62];
-cx q[0],q[62];
-rz(5.1367255444690105) q[62];
-cx q[0],q[62];
-cx q[0],q[64];
-rz(2.016025623591687) q[63];
-cx q[17],q[63];
-cx q[17],q[66];
-cx q[63],q[74];
-rz(5.1367255444690105) q[64];
-cx q[0],q[64];
-rz(2.016025623591687) q[66];
-cx q[17],q[66];
-rx(3.1420068932178316) q[17];
-cx q[1],q[17];
-rz(5.1367255444690105) q[17];
-cx q[1],q[17];
-cx q[1],q[28];
-cx q[3],q[17];
-rz(5.1367255444690105) q[17];
-cx q[3],q[17];
-cx q[3],q[18];
-rz(5.1367255444690105) q[18];
-cx q[3],q[18];
-cx q[3],q[19];
-cx q[4],q[18];
-rz(5.1367255444690105) q[18];
-cx q[4],q[18];
-rz(5.1367255444690105) q[19];
-cx q[3],q[19];
-cx q[3],q[22];
-cx q[7],q[19];
-rz(5.1367255444690105) q[19];
-cx q[7],q[19];
-cx q[19],q[38];
-rz(5.1367255444690105) q[22];
-cx q[3],q[22];
-cx q[3],q[23];
-cx q[9],q[22];
-rz(5.1367255444690105) q[22];
-cx q[9],q[22];
-cx q[9],q[55];
-rx(2.8773724773516087) q[22];
-rz(5.1367255444690105) q[23];
-cx q[3],q[23];
-cx q[3],q[24];
-cx q[17],q[23];
-rz(5.1367255444690105) q[23];
-cx q[17],q[23];
-rz(5.1367255444690105) q[24];
-cx q[3],q[24];
-cx q[3],q[25];
-cx q[5],q[24];
-rz(5.1367255444690105) q[24];
-cx q[5],q[24];
-cx q[5],q[33];
-cx q[24],q[54];
-rz(5.1367255444690105) q[25];
-cx q[3],q[25];
-cx q[3],q[26];
-cx q[12],q[25];
-rz(5.1367255444690105) q[25];
-cx q[12],q[25];
-cx q[12],q[31];
-rz(5.1367255444690105) q[26];
-cx q[3],q[26];
-rz(5.1367255444690105) q[28];
-cx q[1],q[28];
-cx q[1],q[29];
-cx q[3],q[28];
-rz(5.1367255444690105) q[28];
-cx q[3],q[28];
-cx q[28],q[51];
-rz(5.1367255444690105) q[29];
-cx q[1],q[29];
-cx q[1],q[45];
-cx q[3],q[29];
-rz(5.1367255444690105) q[29];
-cx q[3],q[29];
-cx q[3],q[30];
-rx(2.8773724773516087) q[29];
-rz(5.1367255444690105) q[30];
-cx q[3],q[30];
-cx q[3],q[34];
-cx q[18],q[30];
-rz(5.1367255444690105) q[30];
-cx q[18],q[30];
-rx(2.8773724773516087) q[18];
-rz(5.1367255444690105) q[31];
-cx q[12],q[31];
-rz(5.1367255444690105) q[33];
-cx q[5],q[33];
-cx q[5],q[46];
-cx q[30],q[33];
-rz(5.1367255444690105) q[33];
-cx q[30],q[33];
-cx q[30],q[48];
-rx(2.8773724773516087) q[33];
-rz(5.1367255444690105) q[34];
-cx q[3],q[34];
-cx q[3],q[35];
-cx q[12],q[34];
-rz(5.1367255444690105) q[34];
-cx q[12],q[34];
-cx q[34],q[37];
-rz(5.1367255444690105) q[35];
-cx q[3],q[35];
-cx q[3],q[39];
-rz(5.1367255444690105) q[37];
-cx q[34],q[37];
-rx(2.8773724773516087) q[34];
-cx q[37],q[85];
-rz(5.1367255444690105) q[38];
-cx q[19],q[38];
-rx(2.8773724773516087) q[19];
-rz(5.1367255444690105) q[39];
-cx q[3],q[39];
-cx q[3],q[40];
-cx q[13],q[39];
-rz(5.1367255444690105) q[39];
-cx q[13],q[39];
-cx q[13],q[56];
-rz(5.1367255444690105) q[40];
-cx q[3],q[40];
-cx q[3],q[42];
-cx q[23],q[40];
-rz(5.1367255444690105) q[40];
-cx q[23],q[40];
-cx q[40],q[119];
-rz(5.1367255444690105) q[42];
-cx q[3],q[42];
-cx q[3],q[43];
-cx q[42],q[78];
-rz(5.1367255444690105) q[43];
-cx q[3],q[43];
-cx q[3],q[44];
-rz(5.1367255444690105) q[44];
-cx q[3],q[44];
-cx q[3],q[49];
-cx q[12],q[44];
-rz(5.1367255444690105) q[44];
-cx q[12],q[44];
-rz(5.1367255444690105) q[45];
-cx q[1],q[45];
-cx q[1],q[57];
-cx q[16],q[45];
-rz(5.1367255444690105) q[45];
-cx q[16],q[45];
-cx q[16],q[59];
-rz(5.1367255444690105) q[46];
-cx q[5],q[46];
-cx q[5],q[65];
-cx q[47],q[66];
-rz(5.1367255444690105) q[48];
-cx q[30],q[48];
-rx(2.8773724773516087) q[48];
-rz(5.1367255444690105) q[49];
-cx q[3],q[49];
-cx q[3],q[50];
-rz(5.1367255444690105) q[50];
-cx q[3],q[50];
-cx q[3],q[52];
-cx q[12],q[50];
-rz(5.1367255444690105) q[50];
-cx q[12],q[50];
-rz(5.1367255444690105) q[51];
-cx q[28],q[51];
-rx(2.8773724773516087) q[51];
-rz(5.1367255444690105) q[52];
-cx q[3],q[52];
-cx q[10],q[52];
-rz(5.1367255444690105) q[52];
-cx q[10],q[52];
-cx q[10],q[64];
-rz(5.1367255444690105) q[54];
-cx q[24],q[54];
-cx q[24],q[58];
-cx q[28],q[54];
-rz(5.1367255444690105) q[54];
-cx q[28],q[54];
-rx(2.8773724773516087) q[54];
-rz(5.1367255444690105) q[55];
-cx q[9],q[55];
-cx q[9],q[80];
-rz(5.1367255444690105) q[56];
-cx q[13],q[56];
-cx q[13],q[68];
-cx q[45],q[56];
-rz(5.1367255444690105) q[56];
-cx q[45],q[56];
-rx(2.8773724773516087) q[45];
-rz(5.1367255444690105) q[57];
-cx q[1],q[57];
-cx q[1],q[60];
-cx q[3],q[57];
-rz(5.1367255444690105) q[57];
-cx q[3],q[57];
-cx q[3],q[70];
-rz(5.1367255444690105) q[58];
-cx q[24],q[58];
-cx q[28],q[58];
-rz(5.1367255444690105) q[58];
-cx q[28],q[58];
-cx q[28],q[87];
-rx(2.8773724773516087) q[58];
-rz(5.1367255444690105) q[59];
-cx q[16],q[59];
-cx q[16],q[73];
-rz(5.1367255444690105) q[60];
-cx q[1],q[60];
-cx q[1],q[97];
-cx q[7],q[60];
-rz(5.1367255444690105) q[60];
-cx q[7],q[60];
-rz(5.1367255444690105) q[64];
-cx q[10],q[64];
-rx(2.8773724773516087) q[64];
-rz(5.1367255444690105) q[65];
-cx q[5],q[65];
-cx q[5],q[76];
-cx q[23],q[65];
-rz(5.1367255444690105) q[65];
-cx q[23],q[65];
-rx(2.8773724773516087) q[23];
-rx(2.8773724773516087) q[65];
-rz(2.016025623591687) q[66];
-cx q[47],q[66];
-rx(3.1420068932178316) q[47];
-rx(3.1420068932178316) q[66];
-rz(5.1367255444690105) q[68];
-cx q[13],q[68];
-rz(5.1367255444690105) q[70];
-cx q[3],q[70];
-rz(2.016025623591687) q[71];
-cx q[53],q[71];
-cx q[53],q[86];
-rx(3.1420068932178316) q[71];
-cx q[3],q[71];
-rz(5.1367255444690105) q[71];
-cx q[3],q[71];
-rz(5.1367255444690105) q[73];
-cx q[16],q[73];
-cx q[16],q[101];
-rz(2.016025623591687) q[74];
-cx q[63],q[74];
-cx q[63],q[122];
-rx(3.1420068932178316) q[74];
-rz(2.016025623591687) q[75];
-cx q[21],q[75];
-rx(3.1420068932178316) q[75];
-cx q[0],q[75];
-rz(5.1367255444690105) q[75];
-cx q[0],q[75];
-cx q[0],q[82];
-rz(5.1367255444690105) q[76];
-cx q[5],q[76];
-cx q[5],q[89];
-rz(5.1367255444690105) q[78];
-cx q[42],q[78];
-cx q[60],q[78];
-rz(5.1367255444690105) q[78];
-cx q[60],q[78];
-rx(2.8773724773516087) q[78];
-rz(5.1367255444690105) q[80];
-cx q[9],q[80];
-rx(2.8773724773516087) q[9];
-cx q[81],q[124];
-rz(5.1367255444690105) q[82];
-cx q[0],q[82];
-cx q[0],q[91];
-rz(5.1367255444690105) q[85];
-cx q[37],q[85];
-rx(2.8773724773516087) q[37];
-rz(2.016025623591687) q[86];
-cx q[53],q[86];
-rx(3.1420068932178316) q[86];
-cx q[24],q[86];
-rz(5.1367255444690105) q[86];
-cx q[24],q[86];
-rz(5.1367255444690105) q[87];
-cx q[28],q[87];
-rz(5.1367255444690105) q[89];
-cx q[5],q[89];
-cx q[5],q[95];
-rz(5.1367255444690105) q[91];
-cx q[0],q[91];
-cx q[0],q[93];
-rz(5.1367255444690105) q[93];
-cx q[0],q[93];
-cx q[0],q[123];
-rz(5.1367255444690105) q[95];
-cx q[5],q[95];
-cx q[5],q[106];
-rz(5.1367255444690105) q[97];
-cx q[1],q[97];
-cx q[1],q[113];
-rz(5.1367255444690105) q[101];
-cx q[16],q[101];
-cx q[16],q[103];
-rz(5.1367255444690105) q[103];
-cx q[16],q[103];
-rx(2.8773724773516087) q[16];
-cx q[57],q[103];
-rz(5.1367255444690105) q[103];
-cx q[57],q[103];
-rx(2.8773724773516087) q[57];
-rx(2.8773724773516087) q[103];
-rz(5.1367255444690105) q[106];
-cx q[5],q[106];
-cx q[5],q[109];
-rz(5.1367255444690105) q[109];
-cx q[5],q[109];
-cx q[5],q[118];
-cx q[39],q[109];
-rz(5.1367255444690105) q[109];
-cx q[39],q[109];
-rx(2.8773724773516087) q[39];
-rx(2.8773724773516087) q[109];
-rz(5.1367255444690105) q[113];
-cx q[1],q[113];
-rx(2.8773724773516087) q[1];
-rz(5.1367255444690105) q[118];
-cx q[5],q[118];
-rx(2.8773724773516087) q[5];
-rz(5.1367255444690105) q[119];
-cx q[40],q[119];
-rx(2.8773724773516087) q[40];
-rz(2.016025623591687) q[122];
-cx q[63],q[122];
-rx(3.1420068932178316) q[63];
-cx q[12],q[63];
-rz(5.1367255444690105) q[63];
-cx q[12],q[63];
-rx(2.8773724773516087) q[12];
-rz(5.1367255444690105) q[123];
-cx q[0],q[123];
-rx(2.8773724773516087) q[0];
-cx q[52],q[123];
-rz(5.1367255444690105) q[123];
-cx q[52],q[123];
-rx(2.8773724773516087) q[52];
-rx(2.8773724773516087) q[123];
-rz(2.3585308227235546) q[124];
-cx q[81],q[124];
-rx(6.8070791339217) q[81];
-cx q[21],q[81];
-rz(2.016025623591687) q[81];
-cx q[21],q[81];
-cx q[21],q[98];
-cx q[77],q[81];
-rz(2.016025623591687) q[81];
-cx q[77],q[81];
-rx(3.1420068932178316) q[77];
-cx q[3],q[77];
-rz(5.1367255444690105) q[77];
-cx q[3],q[77];
-cx q[3],q[88];
-cx q[30],q[77];
-rz(5.1367255444690105) q[77];
-cx q[30],q[77];
-rx(2.8773724773516087) q[30];
-cx q[81],q[122];
-rz(5.1367255444690105) q[88];
-cx q[3],q[88];
-cx q[3],q[100];
-cx q[60],q[88];
-rz(5.1367255444690105) q[88];
-cx q[60],q[88];
-rx(2.8773724773516087) q[60];
-rx(2.8773724773516087) q[88];
-rz(2.016025623591687) q[98];
-cx q[21],q[98];
-cx q[21],q[111];
-rx(3.1420068932178316) q[98];
-cx q[10],q[98];
-rz(5.1367255444690105) q[98];
-cx q[10],q[98];
-rx(2.8773724773516087) q[10];
-rz(5.1367255444690105) q[100];
-cx q[3],q[100];
-cx q[3],q[102];
-cx q[25],q[100];
-rz(5.1367255444690105) q[100];
-cx q[25],q[100];
-rx(2.8773724773516087) q[25];
-rx(2.8773724773516087) q[100];
-rz(5.1367255444690105) q[102];
-cx q[3],q[102];
-cx q[3],q[107];
-rz(5.1367255444690105) q[107];
-cx q[3],q[107];
-cx q[3],q[110];
-rz(5.1367255444690105) q[110];
-cx q[3],q[110];
-cx q[24],q[110];
-rz(5.1367255444690105) q[110];
-cx q[24],q[110];
-rx(2.8773724773516087) q[24];
-rz(2.016025623591687) q[111];
-cx q[21],q[111];
-cx q[21],q[112];
-rx(3.1420068932178316) q[111];
-cx q[3],q[111];
-rz(5.1367255444690105) q[111];
-cx q[3],q[111];
-cx q[3],q[113];
-rz(2.016025623591687) q[112];
-cx q[21],q[112];
-rx(3.1420068932178316) q[21];
-cx q[4],q[21];
-rz(5.1367255444690105) q[21];
-cx q[4],q[21];
-cx q[4],q[27];
-cx q[15],q[21];
-rz(5.1367255444690105) q[21];
-cx q[15],q[21];
-cx q[21],q[26];
-rz(5.1367255444690105) q[26];
-cx q[21],q[26];
-cx q[21],q[32];
-cx q[26],q[31];
-rz(5.1367255444690105) q[27];
-cx q[4],q[27];
-cx q[4],q[47];
-cx q[6],q[27];
-rz(5.1367255444690105) q[27];
-cx q[6],q[27];
-cx q[6],q[69];
-cx q[27],q[41];
-rz(5.1367255444690105) q[31];
-cx q[26],q[31];
-cx q[26],q[105];
-cx q[31],q[107];
-rz(5.1367255444690105) q[32];
-cx q[21],q[32];
-cx q[21],q[38];
-cx q[32],q[35];
-rz(5.1367255444690105) q[35];
-cx q[32],q[35];
-cx q[32],q[59];
-rx(2.8773724773516087) q[35];
-cx q[36],q[112];
-rz(5.1367255444690105) q[38];
-cx q[21],q[38];
-cx q[38],q[46];
-rz(5.1367255444690105) q[41];
-cx q[27],q[41];
-cx q[27],q[72];
-cx q[41],q[67];
-rz(5.1367255444690105) q[46];
-cx q[38],q[46];
-rx(2.8773724773516087) q[38];
-cx q[46],q[120];
-rz(5.1367255444690105) q[47];
-cx q[4],q[47];
-cx q[4],q[49];
-cx q[17],q[47];
-rz(5.1367255444690105) q[47];
-cx q[17],q[47];
-rz(5.1367255444690105) q[49];
-cx q[4],q[49];
-cx q[4],q[61];
-rx(2.8773724773516087) q[49];
-rz(5.1367255444690105) q[59];
-cx q[32],q[59];
-cx q[32],q[68];
-rz(5.1367255444690105) q[61];
-cx q[4],q[61];
-cx q[4],q[99];
-cx q[7],q[61];
-rz(5.1367255444690105) q[61];
-cx q[7],q[61];
-cx q[7],q[97];
-rx(2.8773724773516087) q[61];
-rz(5.1367255444690105) q[67];
-cx q[41],q[67];
-cx q[56],q[67];
-rz(5.1367255444690105) q[67];
-cx q[56],q[67];
-cx q[56],q[74];
-rx(2.8773724773516087) q[67];
-rz(5.1367255444690105) q[68];
-cx q[32],q[68];
-cx q[32],q[87];
-cx q[68],q[83];
-rz(5.1367255444690105) q[69];
-cx q[6],q[69];
-cx q[6],q[76];
-cx q[59],q[69];
-rz(5.1367255444690105) q[69];
-cx q[59],q[69];
-cx q[59],q[73];
-cx q[69],q[119];
-rz(5.1367255444690105) q[72];
-cx q[27],q[72];
-cx q[44],q[72];
-rz(5.1367255444690105) q[72];
-cx q[44],q[72];
-rx(2.8773724773516087) q[44];
-rx(2.8773724773516087) q[72];
-rz(5.1367255444690105) q[73];
-cx q[59],q[73];
-cx q[59],q[85];
-rz(5.1367255444690105) q[74];
-cx q[56],q[74];
-cx q[56],q[82];
-rz(5.1367255444690105) q[76];
-cx q[6],q[76];
-cx q[6],q[79];
-rx(2.8773724773516087) q[76];
-rz(5.1367255444690105) q[79];
-cx q[6],q[79];
-cx q[6],q[91];
-cx q[50],q[79];
-rz(5.1367255444690105) q[79];
-cx q[50],q[79];
-cx q[50],q[101];
-rx(2.8773724773516087) q[79];
-rz(5.1367255444690105) q[82];
-cx q[56],q[82];
-cx q[56],q[96];
-rx(2.8773724773516087) q[82];
-rz(5.1367255444690105) q[83];
-cx q[68],q[83];
-rx(2.8773724773516087) q[68];
-rx(2.8773724773516087) q[83];
-rz(5.1367255444690105) q[85];
-cx q[59],q[85];
-rx(2.8773724773516087) q[59];
-rx(2.8773724773516087) q[85];
-rz(5.1367255444690105) q[87];
-cx q[32],q[87];
-cx q[32],q[93];
-rx(2.8773724773516087) q[87];
-rz(5.1367255444690105) q[91];
-cx q[6],q[91];
-rx(2.8773724773516087) q[6];
-rx(2.8773724773516087) q[91];
-rz(5.1367255444690105) q[93];
-cx q[32],q[93];
-rx(2.8773724773516087) q[93];
-rz(5.1367255444690105) q[96];
-cx q[56],q[96];
-rx(2.8773724773516087) q[56];
-rz(5.1367255444690105) q[97];
-cx q[7],q[97];
-cx q[7],q[104];
-rx(2.8773724773516087) q[97];
-rz(5.1367255444690105) q[99];
-cx q[4],q[99];
-cx q[4],q[102];
-cx q[41],q[99];
-rz(5.1367255444690105) q[99];
-cx q[41],q[99];
-rx(2.8773724773516087) q[41];
-rx(2.8773724773516087) q[99];
-rz(5.1367255444690105) q[101];
-cx q[50],q[101];
-rx(2.8773724773516087) q[50];
-rx(2.8773724773516087) q[101];
-rz(5.1367255444690105) q[102];
-cx q[4],q[102];
-rx(2.8773724773516087) q[4];
-rx(2.8773724773516087) q[102];
-rz(5.1367255444690105) q[104];
-cx q[7],q[104];
-rx(2.8773724773516087) q[7];
-cx q[13],q[104];
-rz(5.1367255444690105) q[104];
-cx q[13],q[104];
-rx(2.8773724773516087) q[13];
-cx q[104],q[114];
-rz(5.1367255444690105) q[105];
-cx q[26],q[105];
-cx q[26],q[117];
-cx q[28],q[105];
-rz(5.1367255444690105) q[105];
-cx q[28],q[105];
-cx q[28],q[116];
-rx(2.8773724773516087) q[105];
-rz(5.1367255444690105) q[107];
-cx q[31],q[107];
-rx(2.8773724773516087) q[107];
-rz(2.016025623591687) q[112];
-cx q[36],q[112];
-rx(3.1420068932178316) q[36];
-cx q[15],q[36];
-rz(5.1367255444690105) q[36];
-cx q[15],q[36];
-cx q[15],q[55];
-cx q[20],q[36];
-rz(5.1367255444690105) q[36];
-cx q[20],q[36];
-cx q[20],q[43];
-cx q[36],q[94];
-rz(5.1367255444690105) q[43];
-cx q[20],q[43];
-cx q[20],q[121];
-rx(2.8773724773516087) q[43];
-rz(5.1367255444690105) q[55];
-cx q[15],q[55];
-cx q[15],q[70];
-rz(5.1367255444690105) q[70];
-cx q[15],q[70];
-cx q[15],q[80];
-cx q[70],q[84];
-rz(5.1367255444690105) q[80];
-cx q[15],q[80];
-cx q[15],q[90];
-rx(2.8773724773516087) q[80];
-rz(5.1367255444690105) q[84];
-cx q[70],q[84];
-rx(2.8773724773516087) q[70];
-cx q[73],q[84];
-rz(5.1367255444690105) q[84];
-cx q[73],q[84];
-rx(2.8773724773516087) q[73];
-rx(2.8773724773516087) q[84];
-rz(5.1367255444690105) q[90];
-cx q[15],q[90];
-cx q[15],q[92];
-cx q[27],q[90];
-rz(5.1367255444690105) q[90];
-cx q[27],q[90];
-cx q[27],q[95];
-rx(2.8773724773516087) q[90];
-rz(5.1367255444690105) q[92];
-cx q[15],q[92];
-cx q[15],q[108];
-cx q[89],q[92];
-rz(5.1367255444690105) q[92];
-cx q[89],q[92];
-rx(2.8773724773516087) q[89];
-cx q[92],q[96];
-rz(5.1367255444690105) q[94];
-cx q[36],q[94];
-cx q[36],q[106];
-cx q[55],q[94];
-rz(5.1367255444690105) q[94];
-cx q[55],q[94];
-rx(2.8773724773516087) q[55];
-rz(5.1367255444690105) q[95];
-cx q[27],q[95];
-rx(2.8773724773516087) q[27];
-rx(2.8773724773516087) q[95];
-rz(5.1367255444690105) q[96];
-cx q[92],q[96];
-rx(2.8773724773516087) q[96];
-rz(5.1367255444690105) q[106];
-cx q[36],q[106];
-rx(2.8773724773516087) q[106];
-rz(5.1367255444690105) q[108];
-cx q[15],q[108];
-cx q[15],q[115];
-cx q[31],q[108];
-rz(5.1367255444690105) q[108];
-cx q[31],q[108];
-rx(2.8773724773516087) q[31];
-rx(2.8773724773516087) q[108];
-rx(3.1420068932178316) q[112];
-rz(5.1367255444690105) q[113];
-cx q[3],q[113];
-rx(2.8773724773516087) q[3];
-rx(2.8773724773516087) q[113];
-rz(5.1367255444690105) q[114];
-cx q[104],q[114];
-cx q[110],q[114];
-rz(5.1367255444690105) q[114];
-cx q[110],q[114];
-rx(2.8773724773516087) q[110];
-rx(2.8773724773516087) q[114];
-rz(5.1367255444690105) q[115];
-cx q[15],q[115];
-cx q[15],q[118];
-cx q[92],q[115];
-rz(5.1367255444690105) q[115];
-cx q[92],q[115];
-rx(2.8773724773516087) q[92];
-rx(2.8773724773516087) q[115];
-rz(5.1367255444690105) q[116];
-cx q[28],q[116];
-rx(2.8773724773516087) q[28];
-cx q[42],q[116];
-rz(5.1367255444690105) q[116];
-cx q[42],q[116];
-rx(2.8773724773516087) q[42];
-rx(2.8773724773516087) q[116];
-rz(5.1367255444690105) q[117];
-cx q[26],q[117];
-rx(2.8773724773516087) q[26];
-cx q[32],q[117];
-rz(5.1367255444690105) q[117];
-cx q[32],q[117];
-rx(2.8773724773516087) q[32];
-rx(2.8773724773516087) q[117];
-rz(5.1367255444690105) q[118];
-cx q[15],q[118];
-rx(2.8773724773516087) q[15];
-rx(2.8773724773516087) q[118];
-rz(5.1367255444690105) q[119];
-cx q[69],q[119];
-rx(2.8773724773516087) q[69];
-rx(2.8773724773516087) q[119];
-rz(5.1367255444690105) q[120];
-cx q[46],q[120];
-rx(2.8773724773516087) q[46];
-cx q[94],q[120];
-rz(5.1367255444690105) q[120];
-cx q[94],q[120];
-rx(2.8773724773516087) q[94];
-rx(2.8773724773516087) q[120];
-rz(5.1367255444690105) q[121];
-cx q[20],q[121];
-rx(2.8773724773516087) q[20];
-cx q[104],q[121];
-rz(5.1367255444690105) q[121];
-cx q[104],q[121];
-rx(2.8773724773516087) q[104];
-rx(2.8773724773516087) q[121];
-rz(2.016025623591687) q[122];
-cx q[81],q[122];
-rx(3.1420068932178316) q[122];
-rx(6.8070791339217) q[124];
-cx q[53],q[124];
-rz(2.016025623591687) q[124];
-cx q[53],q[124];
-rx(3.1420068932178316) q[53];
-cx q[17],q[53];
-rz(5.1367255444690105) q[53];
-cx q[17],q[53];
-cx q[17],q[62];
-cx q[21],q[53];
-rz(5.1367255444690105) q[53];
-cx q[21],q[53];
-cx q[21],q[75];
-cx q[53],q[71];
-rz(5.1367255444690105) q[62];
-cx q[17],q[62];
-cx q[17],q[63];
-rx(2.8773724773516087) q[62];
-rz(5.1367255444690105) q[63];
-cx q[17],q[63];
-cx q[17],q[66];
-cx q[63],q[74];
-rz(5.1367255444690105) q[66];
-cx q[17],q[66];
-rx(2.8773724773516087) q[17];
-cx q[47],q[66];
-rz(5.1367255444690105) q[66];
-cx q[47],q[66];
-rx(2.8773724773516087) q[47];
-rx(2.8773724773516087) q[66];
-rz(5.1367255444690105) q[71];
-cx q[53],q[71];
-cx q[53],q[86];
-rx(2.8773724773516087) q[71];
-rz(5.1367255444690105) q[74];
-cx q[63],q[74];
-cx q[63],q[122];
-rx(2.8773724773516087) q[74];
-rz(5.1367255444690105) q[75];
-cx q[21],q[75];
-rx(2.8773724773516087) q[75];
-cx q[81],q[124];
-rz(5.1367255444690105) q[86];
-cx q[53],q[86];
-rx(2.8773724773516087) q[86];
-rz(5.1367255444690105) q[122];
-cx q[63],q[122];
-rx(2.8773724773516087) q[63];
-rz(2.016025623591687) q[124];
-cx q[81],q[124];
-rx(3.1420068932178316) q[81];
-cx q[21],q[81];
-rz(5.1367255444690105) q[81];
-cx q[21],q[81];
-cx q[21],q[98];
-cx q[77],q[81];
-rz(5.1367255444690105) q[81];
-cx q[77],q[81];
-rx(2.8773724773516087) q[77];
-cx q[81],q[122];
-rz(5.1367255444690105) q[98];
-cx q[21],q[98];
-cx q[21],q[111];
-rx(2.8773724773516087) q[98];
-rz(5.1367255444690105) q[111];
-cx q[21],q[111];
-cx q[21],q[112];
-rx(2.8773724773516087) q[111];
-rz(5.1367255444690105) q[112];
-cx q[21],q[112];
-rx(2.8773724773516087) q[21];
-cx q[36],q[112];
-rz(5.1367255444690105) q[112];
-cx q[36],q[112];
-rx(2.8773724773516087) q[36];
-rx(2.8773724773516087) q[112];
-rz(5.1367255444690105) q[122];
-cx q[81],q[122];
-rx(2.8773724773516087) q[122];
-rx(3.1420068932178316) q[124];
-cx q[53],q[124];
-rz(5.1367255444690105) q[124];
-cx q[53],q[124];
-rx(2.8773724773516087) q[53];
-cx q[81],q[124];
-rz(5.1367255444690105) q[124];
-cx q[81],q[124];
-rx(2.8773724773516087) q[81];
-rx(2.8773724773516087) q[124];
\ No newline at end of file
@@ -1,2911 +0,0 @@
-OPENQASM 2.0;
-include "qelib1.inc";
-qreg q[128];
-ry(pi/2) q[0];
-rx(pi) q[0];
-ry(pi/2) q[1];
-rx(pi) q[1];
-cx q[0],q[1];
-rz(1.1513040615288597) q[1];
-cx q[0],q[1];
-ry(pi/2) q[2];
-rx(pi) q[2];
-cx q[0],q[2];
-rz(1.1513040615288597) q[2];
-cx q[0],q[2];
-ry(pi/2) q[3];
-rx(pi) q[3];
-cx q[0],q[3];
-rz(1.1513040615288597) q[3];
-cx q[0],q[3];
-cx q[1],q[3];
-rz(1.1513040615288597) q[3];
-cx q[1],q[3];
-ry(pi/2) q[4];
-rx(pi) q[4];
-cx q[1],q[4];
-rz(1.1513040615288597) q[4];
-cx q[1],q[4];
-cx q[3],q[4];
-rz(1.1513040615288597) q[4];
-cx q[3],q[4];
-ry(pi/2) q[5];
-rx(pi) q[5];
-cx q[1],q[5];
-rz(1.1513040615288597) q[5];
-cx q[1],q[5];
-cx q[3],q[5];
-rz(1.1513040615288597) q[5];
-cx q[3],q[5];
-ry(pi/2) q[6];
-rx(pi) q[6];
-cx q[4],q[6];
-rz(1.1513040615288597) q[6];
-cx q[4],q[6];
-cx q[5],q[6];
-rz(1.1513040615288597) q[6];
-cx q[5],q[6];
-ry(pi/2) q[7];
-rx(pi) q[7];
-cx q[3],q[7];
-rz(1.1513040615288597) q[7];
-cx q[3],q[7];
-cx q[4],q[7];
-rz(1.1513040615288597) q[7];
-cx q[4],q[7];
-ry(pi/2) q[8];
-rx(pi) q[8];
-cx q[3],q[8];
-rz(1.1513040615288597) q[8];
-cx q[3],q[8];
-cx q[5],q[8];
-rz(1.1513040615288597) q[8];
-cx q[5],q[8];
-ry(pi/2) q[9];
-rx(pi) q[9];
-cx q[1],q[9];
-rz(1.1513040615288597) q[9];
-cx q[1],q[9];
-cx q[3],q[9];
-rz(1.1513040615288597) q[9];
-cx q[3],q[9];
-ry(pi/2) q[10];
-rx(pi) q[10];
-cx q[4],q[10];
-rz(1.1513040615288597) q[10];
-cx q[4],q[10];
-cx q[6],q[10];
-rz(1.1513040615288597) q[10];
-cx q[6],q[10];
-ry(pi/2) q[11];
-rx(pi) q[11];
-cx q[5],q[11];
-rz(1.1513040615288597) q[11];
-cx q[5],q[11];
-cx q[6],q[11];
-rz(1.1513040615288597) q[11];
-cx q[6],q[11];
-rx(11.21904903175144) q[11];
-ry(pi/2) q[12];
-rx(pi) q[12];
-cx q[3],q[12];
-rz(1.1513040615288597) q[12];
-cx q[3],q[12];
-cx q[5],q[12];
-rz(1.1513040615288597) q[12];
-cx q[5],q[12];
-ry(pi/2) q[13];
-rx(pi) q[13];
-cx q[4],q[13];
-rz(1.1513040615288597) q[13];
-cx q[4],q[13];
-cx q[5],q[13];
-rz(1.1513040615288597) q[13];
-cx q[5],q[13];
-ry(pi/2) q[14];
-rx(pi) q[14];
-cx q[3],q[14];
-rz(1.1513040615288597) q[14];
-cx q[3],q[14];
-cx q[4],q[14];
-rz(1.1513040615288597) q[14];
-cx q[4],q[14];
-rx(11.21904903175144) q[14];
-ry(pi/2) q[15];
-rx(pi) q[15];
-cx q[0],q[15];
-rz(1.1513040615288597) q[15];
-cx q[0],q[15];
-cx q[3],q[15];
-rz(1.1513040615288597) q[15];
-cx q[3],q[15];
-ry(pi/2) q[16];
-rx(pi) q[16];
-cx q[0],q[16];
-rz(1.1513040615288597) q[16];
-cx q[0],q[16];
-cx q[3],q[16];
-rz(1.1513040615288597) q[16];
-cx q[3],q[16];
-ry(pi/2) q[17];
-rx(pi) q[17];
-cx q[1],q[17];
-rz(1.1513040615288597) q[17];
-cx q[1],q[17];
-cx q[3],q[17];
-rz(1.1513040615288597) q[17];
-cx q[3],q[17];
-ry(pi/2) q[18];
-rx(pi) q[18];
-cx q[3],q[18];
-rz(1.1513040615288597) q[18];
-cx q[3],q[18];
-cx q[4],q[18];
-rz(1.1513040615288597) q[18];
-cx q[4],q[18];
-ry(pi/2) q[19];
-rx(pi) q[19];
-cx q[3],q[19];
-rz(1.1513040615288597) q[19];
-cx q[3],q[19];
-cx q[7],q[19];
-rz(1.1513040615288597) q[19];
-cx q[7],q[19];
-ry(pi/2) q[20];
-rx(pi) q[20];
-cx q[0],q[20];
-rz(1.1513040615288597) q[20];
-cx q[0],q[20];
-cx q[15],q[20];
-rz(1.1513040615288597) q[20];
-cx q[15],q[20];
-ry(pi/2) q[21];
-rx(pi) q[21];
-cx q[4],q[21];
-rz(1.1513040615288597) q[21];
-cx q[4],q[21];
-cx q[15],q[21];
-rz(1.1513040615288597) q[21];
-cx q[15],q[21];
-ry(pi/2) q[22];
-rx(pi) q[22];
-cx q[3],q[22];
-rz(1.1513040615288597) q[22];
-cx q[3],q[22];
-cx q[9],q[22];
-rz(1.1513040615288597) q[22];
-cx q[9],q[22];
-rx(11.21904903175144) q[22];
-ry(pi/2) q[23];
-rx(pi) q[23];
-cx q[3],q[23];
-rz(1.1513040615288597) q[23];
-cx q[3],q[23];
-cx q[17],q[23];
-rz(1.1513040615288597) q[23];
-cx q[17],q[23];
-ry(pi/2) q[24];
-rx(pi) q[24];
-cx q[3],q[24];
-rz(1.1513040615288597) q[24];
-cx q[3],q[24];
-cx q[5],q[24];
-rz(1.1513040615288597) q[24];
-cx q[5],q[24];
-ry(pi/2) q[25];
-rx(pi) q[25];
-cx q[3],q[25];
-rz(1.1513040615288597) q[25];
-cx q[3],q[25];
-cx q[12],q[25];
-rz(1.1513040615288597) q[25];
-cx q[12],q[25];
-ry(pi/2) q[26];
-rx(pi) q[26];
-cx q[3],q[26];
-rz(1.1513040615288597) q[26];
-cx q[3],q[26];
-cx q[21],q[26];
-rz(1.1513040615288597) q[26];
-cx q[21],q[26];
-ry(pi/2) q[27];
-rx(pi) q[27];
-cx q[4],q[27];
-rz(1.1513040615288597) q[27];
-cx q[4],q[27];
-cx q[6],q[27];
-rz(1.1513040615288597) q[27];
-cx q[6],q[27];
-ry(pi/2) q[28];
-rx(pi) q[28];
-cx q[1],q[28];
-rz(1.1513040615288597) q[28];
-cx q[1],q[28];
-cx q[3],q[28];
-rz(1.1513040615288597) q[28];
-cx q[3],q[28];
-ry(pi/2) q[29];
-rx(pi) q[29];
-cx q[1],q[29];
-rz(1.1513040615288597) q[29];
-cx q[1],q[29];
-cx q[3],q[29];
-rz(1.1513040615288597) q[29];
-cx q[3],q[29];
-rx(11.21904903175144) q[29];
-ry(pi/2) q[30];
-rx(pi) q[30];
-cx q[3],q[30];
-rz(1.1513040615288597) q[30];
-cx q[3],q[30];
-cx q[18],q[30];
-rz(1.1513040615288597) q[30];
-cx q[18],q[30];
-rx(11.21904903175144) q[18];
-ry(pi/2) q[31];
-rx(pi) q[31];
-cx q[12],q[31];
-rz(1.1513040615288597) q[31];
-cx q[12],q[31];
-cx q[26],q[31];
-rz(1.1513040615288597) q[31];
-cx q[26],q[31];
-ry(pi/2) q[32];
-rx(pi) q[32];
-cx q[0],q[32];
-rz(1.1513040615288597) q[32];
-cx q[0],q[32];
-cx q[21],q[32];
-rz(1.1513040615288597) q[32];
-cx q[21],q[32];
-ry(pi/2) q[33];
-rx(pi) q[33];
-cx q[5],q[33];
-rz(1.1513040615288597) q[33];
-cx q[5],q[33];
-cx q[30],q[33];
-rz(1.1513040615288597) q[33];
-cx q[30],q[33];
-rx(11.21904903175144) q[33];
-ry(pi/2) q[34];
-rx(pi) q[34];
-cx q[3],q[34];
-rz(1.1513040615288597) q[34];
-cx q[3],q[34];
-cx q[12],q[34];
-rz(1.1513040615288597) q[34];
-cx q[12],q[34];
-ry(pi/2) q[35];
-rx(pi) q[35];
-cx q[3],q[35];
-rz(1.1513040615288597) q[35];
-cx q[3],q[35];
-cx q[32],q[35];
-rz(1.1513040615288597) q[35];
-cx q[32],q[35];
-rx(11.21904903175144) q[35];
-ry(pi/2) q[36];
-rx(pi) q[36];
-cx q[15],q[36];
-rz(1.1513040615288597) q[36];
-cx q[15],q[36];
-cx q[20],q[36];
-rz(1.1513040615288597) q[36];
-cx q[20],q[36];
-ry(pi/2) q[37];
-rx(pi) q[37];
-cx q[10],q[37];
-rz(1.1513040615288597) q[37];
-cx q[10],q[37];
-cx q[34],q[37];
-rz(1.1513040615288597) q[37];
-cx q[34],q[37];
-rx(11.21904903175144) q[34];
-ry(pi/2) q[38];
-rx(pi) q[38];
-cx q[19],q[38];
-rz(1.1513040615288597) q[38];
-cx q[19],q[38];
-rx(11.21904903175144) q[19];
-cx q[21],q[38];
-rz(1.1513040615288597) q[38];
-cx q[21],q[38];
-ry(pi/2) q[39];
-rx(pi) q[39];
-cx q[3],q[39];
-rz(1.1513040615288597) q[39];
-cx q[3],q[39];
-cx q[13],q[39];
-rz(1.1513040615288597) q[39];
-cx q[13],q[39];
-ry(pi/2) q[40];
-rx(pi) q[40];
-cx q[3],q[40];
-rz(1.1513040615288597) q[40];
-cx q[3],q[40];
-cx q[23],q[40];
-rz(1.1513040615288597) q[40];
-cx q[23],q[40];
-ry(pi/2) q[41];
-rx(pi) q[41];
-cx q[10],q[41];
-rz(1.1513040615288597) q[41];
-cx q[10],q[41];
-cx q[27],q[41];
-rz(1.1513040615288597) q[41];
-cx q[27],q[41];
-ry(pi/2) q[42];
-rx(pi) q[42];
-cx q[0],q[42];
-rz(1.1513040615288597) q[42];
-cx q[0],q[42];
-cx q[3],q[42];
-rz(1.1513040615288597) q[42];
-cx q[3],q[42];
-ry(pi/2) q[43];
-rx(pi) q[43];
-cx q[3],q[43];
-rz(1.1513040615288597) q[43];
-cx q[3],q[43];
-cx q[20],q[43];
-rz(1.1513040615288597) q[43];
-cx q[20],q[43];
-rx(11.21904903175144) q[43];
-ry(pi/2) q[44];
-rx(pi) q[44];
-cx q[3],q[44];
-rz(1.1513040615288597) q[44];
-cx q[3],q[44];
-cx q[12],q[44];
-rz(1.1513040615288597) q[44];
-cx q[12],q[44];
-ry(pi/2) q[45];
-rx(pi) q[45];
-cx q[1],q[45];
-rz(1.1513040615288597) q[45];
-cx q[1],q[45];
-cx q[16],q[45];
-rz(1.1513040615288597) q[45];
-cx q[16],q[45];
-ry(pi/2) q[46];
-rx(pi) q[46];
-cx q[5],q[46];
-rz(1.1513040615288597) q[46];
-cx q[5],q[46];
-cx q[38],q[46];
-rz(1.1513040615288597) q[46];
-cx q[38],q[46];
-rx(11.21904903175144) q[38];
-ry(pi/2) q[47];
-rx(pi) q[47];
-cx q[4],q[47];
-rz(1.1513040615288597) q[47];
-cx q[4],q[47];
-cx q[17],q[47];
-rz(1.1513040615288597) q[47];
-cx q[17],q[47];
-ry(pi/2) q[48];
-rx(pi) q[48];
-cx q[0],q[48];
-rz(1.1513040615288597) q[48];
-cx q[0],q[48];
-cx q[30],q[48];
-rz(1.1513040615288597) q[48];
-cx q[30],q[48];
-rx(11.21904903175144) q[48];
-ry(pi/2) q[49];
-rx(pi) q[49];
-cx q[3],q[49];
-rz(1.1513040615288597) q[49];
-cx q[3],q[49];
-cx q[4],q[49];
-rz(1.1513040615288597) q[49];
-cx q[4],q[49];
-rx(11.21904903175144) q[49];
-ry(pi/2) q[50];
-rx(pi) q[50];
-cx q[3],q[50];
-rz(1.1513040615288597) q[50];
-cx q[3],q[50];
-cx q[12],q[50];
-rz(1.1513040615288597) q[50];
-cx q[12],q[50];
-ry(pi/2) q[51];
-rx(pi) q[51];
-cx q[0],q[51];
-rz(1.1513040615288597) q[51];
-cx q[0],q[51];
-cx q[28],q[51];
-rz(1.1513040615288597) q[51];
-cx q[28],q[51];
-rx(11.21904903175144) q[51];
-ry(pi/2) q[52];
-rx(pi) q[52];
-cx q[3],q[52];
-rz(1.1513040615288597) q[52];
-cx q[3],q[52];
-cx q[10],q[52];
-rz(1.1513040615288597) q[52];
-cx q[10],q[52];
-ry(pi/2) q[53];
-rx(pi) q[53];
-cx q[17],q[53];
-rz(1.1513040615288597) q[53];
-cx q[17],q[53];
-cx q[21],q[53];
-rz(1.1513040615288597) q[53];
-cx q[21],q[53];
-ry(pi/2) q[54];
-rx(pi) q[54];
-cx q[24],q[54];
-rz(1.1513040615288597) q[54];
-cx q[24],q[54];
-cx q[28],q[54];
-rz(1.1513040615288597) q[54];
-cx q[28],q[54];
-rx(11.21904903175144) q[54];
-ry(pi/2) q[55];
-rx(pi) q[55];
-cx q[9],q[55];
-rz(1.1513040615288597) q[55];
-cx q[9],q[55];
-cx q[15],q[55];
-rz(1.1513040615288597) q[55];
-cx q[15],q[55];
-ry(pi/2) q[56];
-rx(pi) q[56];
-cx q[13],q[56];
-rz(1.1513040615288597) q[56];
-cx q[13],q[56];
-cx q[45],q[56];
-rz(1.1513040615288597) q[56];
-cx q[45],q[56];
-rx(11.21904903175144) q[45];
-ry(pi/2) q[57];
-rx(pi) q[57];
-cx q[1],q[57];
-rz(1.1513040615288597) q[57];
-cx q[1],q[57];
-cx q[3],q[57];
-rz(1.1513040615288597) q[57];
-cx q[3],q[57];
-ry(pi/2) q[58];
-rx(pi) q[58];
-cx q[24],q[58];
-rz(1.1513040615288597) q[58];
-cx q[24],q[58];
-cx q[28],q[58];
-rz(1.1513040615288597) q[58];
-cx q[28],q[58];
-rx(11.21904903175144) q[58];
-ry(pi/2) q[59];
-rx(pi) q[59];
-cx q[16],q[59];
-rz(1.1513040615288597) q[59];
-cx q[16],q[59];
-cx q[32],q[59];
-rz(1.1513040615288597) q[59];
-cx q[32],q[59];
-ry(pi/2) q[60];
-rx(pi) q[60];
-cx q[1],q[60];
-rz(1.1513040615288597) q[60];
-cx q[1],q[60];
-cx q[7],q[60];
-rz(1.1513040615288597) q[60];
-cx q[7],q[60];
-ry(pi/2) q[61];
-rx(pi) q[61];
-cx q[4],q[61];
-rz(1.1513040615288597) q[61];
-cx q[4],q[61];
-cx q[7],q[61];
-rz(1.1513040615288597) q[61];
-cx q[7],q[61];
-rx(11.21904903175144) q[61];
-ry(pi/2) q[62];
-rx(pi) q[62];
-cx q[0],q[62];
-rz(1.1513040615288597) q[62];
-cx q[0],q[62];
-cx q[17],q[62];
-rz(1.1513040615288597) q[62];
-cx q[17],q[62];
-ry(pi/2) q[63];
-rx(pi) q[63];
-cx q[12],q[63];
-rz(1.1513040615288597) q[63];
-cx q[12],q[63];
-cx q[17],q[63];
-rz(1.1513040615288597) q[63];
-cx q[17],q[63];
-ry(pi/2) q[64];
-rx(pi) q[64];
-cx q[0],q[64];
-rz(1.1513040615288597) q[64];
-cx q[0],q[64];
-cx q[10],q[64];
-rz(1.1513040615288597) q[64];
-cx q[10],q[64];
-rx(11.21904903175144) q[64];
-ry(pi/2) q[65];
-rx(pi) q[65];
-cx q[5],q[65];
-rz(1.1513040615288597) q[65];
-cx q[5],q[65];
-cx q[23],q[65];
-rz(1.1513040615288597) q[65];
-cx q[23],q[65];
-rx(11.21904903175144) q[23];
-rx(11.21904903175144) q[65];
-ry(pi/2) q[66];
-rx(pi) q[66];
-cx q[17],q[66];
-rz(1.1513040615288597) q[66];
-cx q[17],q[66];
-rx(11.21904903175144) q[17];
-cx q[47],q[66];
-rz(1.1513040615288597) q[66];
-cx q[47],q[66];
-rx(11.21904903175144) q[47];
-rx(11.21904903175144) q[66];
-ry(pi/2) q[67];
-rx(pi) q[67];
-cx q[41],q[67];
-rz(1.1513040615288597) q[67];
-cx q[41],q[67];
-cx q[56],q[67];
-rz(1.1513040615288597) q[67];
-cx q[56],q[67];
-rx(11.21904903175144) q[67];
-ry(pi/2) q[68];
-rx(pi) q[68];
-cx q[13],q[68];
-rz(1.1513040615288597) q[68];
-cx q[13],q[68];
-cx q[32],q[68];
-rz(1.1513040615288597) q[68];
-cx q[32],q[68];
-ry(pi/2) q[69];
-rx(pi) q[69];
-cx q[6],q[69];
-rz(1.1513040615288597) q[69];
-cx q[6],q[69];
-cx q[59],q[69];
-rz(1.1513040615288597) q[69];
-cx q[59],q[69];
-ry(pi/2) q[70];
-rx(pi) q[70];
-cx q[3],q[70];
-rz(1.1513040615288597) q[70];
-cx q[3],q[70];
-cx q[15],q[70];
-rz(1.1513040615288597) q[70];
-cx q[15],q[70];
-ry(pi/2) q[71];
-rx(pi) q[71];
-cx q[3],q[71];
-rz(1.1513040615288597) q[71];
-cx q[3],q[71];
-cx q[53],q[71];
-rz(1.1513040615288597) q[71];
-cx q[53],q[71];
-rx(11.21904903175144) q[71];
-ry(pi/2) q[72];
-rx(pi) q[72];
-cx q[27],q[72];
-rz(1.1513040615288597) q[72];
-cx q[27],q[72];
-cx q[44],q[72];
-rz(1.1513040615288597) q[72];
-cx q[44],q[72];
-rx(11.21904903175144) q[44];
-rx(11.21904903175144) q[72];
-ry(pi/2) q[73];
-rx(pi) q[73];
-cx q[16],q[73];
-rz(1.1513040615288597) q[73];
-cx q[16],q[73];
-cx q[59],q[73];
-rz(1.1513040615288597) q[73];
-cx q[59],q[73];
-ry(pi/2) q[74];
-rx(pi) q[74];
-cx q[56],q[74];
-rz(1.1513040615288597) q[74];
-cx q[56],q[74];
-cx q[63],q[74];
-rz(1.1513040615288597) q[74];
-cx q[63],q[74];
-rx(11.21904903175144) q[74];
-ry(pi/2) q[75];
-rx(pi) q[75];
-cx q[0],q[75];
-rz(1.1513040615288597) q[75];
-cx q[0],q[75];
-cx q[21],q[75];
-rz(1.1513040615288597) q[75];
-cx q[21],q[75];
-rx(11.21904903175144) q[75];
-ry(pi/2) q[76];
-rx(pi) q[76];
-cx q[5],q[76];
-rz(1.1513040615288597) q[76];
-cx q[5],q[76];
-cx q[6],q[76];
-rz(1.1513040615288597) q[76];
-cx q[6],q[76];
-rx(11.21904903175144) q[76];
-ry(pi/2) q[77];
-rx(pi) q[77];
-cx q[3],q[77];
-rz(1.1513040615288597) q[77];
-cx q[3],q[77];
-cx q[30],q[77];
-rz(1.1513040615288597) q[77];
-cx q[30],q[77];
-rx(11.21904903175144) q[30];
-ry(pi/2) q[78];
-rx(pi) q[78];
-cx q[42],q[78];
-rz(1.1513040615288597) q[78];
-cx q[42],q[78];
-cx q[60],q[78];
-rz(1.1513040615288597) q[78];
-cx q[60],q[78];
-rx(11.21904903175144) q[78];
-ry(pi/2) q[79];
-rx(pi) q[79];
-cx q[6],q[79];
-rz(1.1513040615288597) q[79];
-cx q[6],q[79];
-cx q[50],q[79];
-rz(1.1513040615288597) q[79];
-cx q[50],q[79];
-rx(11.21904903175144) q[79];
-ry(pi/2) q[80];
-rx(pi) q[80];
-cx q[9],q[80];
-rz(1.1513040615288597) q[80];
-cx q[9],q[80];
-rx(11.21904903175144) q[9];
-cx q[15],q[80];
-rz(1.1513040615288597) q[80];
-cx q[15],q[80];
-rx(11.21904903175144) q[80];
-ry(pi/2) q[81];
-rx(pi) q[81];
-cx q[21],q[81];
-rz(1.1513040615288597) q[81];
-cx q[21],q[81];
-cx q[77],q[81];
-rz(1.1513040615288597) q[81];
-cx q[77],q[81];
-rx(11.21904903175144) q[77];
-ry(pi/2) q[82];
-rx(pi) q[82];
-cx q[0],q[82];
-rz(1.1513040615288597) q[82];
-cx q[0],q[82];
-cx q[56],q[82];
-rz(1.1513040615288597) q[82];
-cx q[56],q[82];
-rx(11.21904903175144) q[82];
-ry(pi/2) q[83];
-rx(pi) q[83];
-cx q[8],q[83];
-rz(1.1513040615288597) q[83];
-cx q[8],q[83];
-rx(11.21904903175144) q[8];
-cx q[68],q[83];
-rz(1.1513040615288597) q[83];
-cx q[68],q[83];
-rx(11.21904903175144) q[68];
-rx(11.21904903175144) q[83];
-ry(pi/2) q[84];
-rx(pi) q[84];
-cx q[70],q[84];
-rz(1.1513040615288597) q[84];
-cx q[70],q[84];
-rx(11.21904903175144) q[70];
-cx q[73],q[84];
-rz(1.1513040615288597) q[84];
-cx q[73],q[84];
-rx(11.21904903175144) q[73];
-rx(11.21904903175144) q[84];
-ry(pi/2) q[85];
-rx(pi) q[85];
-cx q[37],q[85];
-rz(1.1513040615288597) q[85];
-cx q[37],q[85];
-rx(11.21904903175144) q[37];
-cx q[59],q[85];
-rz(1.1513040615288597) q[85];
-cx q[59],q[85];
-rx(11.21904903175144) q[59];
-rx(11.21904903175144) q[85];
-ry(pi/2) q[86];
-rx(pi) q[86];
-cx q[24],q[86];
-rz(1.1513040615288597) q[86];
-cx q[24],q[86];
-cx q[53],q[86];
-rz(1.1513040615288597) q[86];
-cx q[53],q[86];
-rx(11.21904903175144) q[86];
-ry(pi/2) q[87];
-rx(pi) q[87];
-cx q[28],q[87];
-rz(1.1513040615288597) q[87];
-cx q[28],q[87];
-cx q[32],q[87];
-rz(1.1513040615288597) q[87];
-cx q[32],q[87];
-rx(11.21904903175144) q[87];
-ry(pi/2) q[88];
-rx(pi) q[88];
-cx q[3],q[88];
-rz(1.1513040615288597) q[88];
-cx q[3],q[88];
-cx q[60],q[88];
-rz(1.1513040615288597) q[88];
-cx q[60],q[88];
-rx(11.21904903175144) q[60];
-rx(11.21904903175144) q[88];
-ry(pi/2) q[89];
-rx(pi) q[89];
-cx q[2],q[89];
-rz(1.1513040615288597) q[89];
-cx q[2],q[89];
-rx(11.21904903175144) q[2];
-cx q[5],q[89];
-rz(1.1513040615288597) q[89];
-cx q[5],q[89];
-ry(pi/2) q[90];
-rx(pi) q[90];
-cx q[15],q[90];
-rz(1.1513040615288597) q[90];
-cx q[15],q[90];
-cx q[27],q[90];
-rz(1.1513040615288597) q[90];
-cx q[27],q[90];
-rx(11.21904903175144) q[90];
-ry(pi/2) q[91];
-rx(pi) q[91];
-cx q[0],q[91];
-rz(1.1513040615288597) q[91];
-cx q[0],q[91];
-cx q[6],q[91];
-rz(1.1513040615288597) q[91];
-cx q[6],q[91];
-rx(11.21904903175144) q[6];
-rx(11.21904903175144) q[91];
-ry(pi/2) q[92];
-rx(pi) q[92];
-cx q[15],q[92];
-rz(1.1513040615288597) q[92];
-cx q[15],q[92];
-cx q[89],q[92];
-rz(1.1513040615288597) q[92];
-cx q[89],q[92];
-rx(11.21904903175144) q[89];
-ry(pi/2) q[93];
-rx(pi) q[93];
-cx q[0],q[93];
-rz(1.1513040615288597) q[93];
-cx q[0],q[93];
-cx q[32],q[93];
-rz(1.1513040615288597) q[93];
-cx q[32],q[93];
-rx(11.21904903175144) q[93];
-ry(pi/2) q[94];
-rx(pi) q[94];
-cx q[36],q[94];
-rz(1.1513040615288597) q[94];
-cx q[36],q[94];
-cx q[55],q[94];
-rz(1.1513040615288597) q[94];
-cx q[55],q[94];
-rx(11.21904903175144) q[55];
-ry(pi/2) q[95];
-rx(pi) q[95];
-cx q[5],q[95];
-rz(1.1513040615288597) q[95];
-cx q[5],q[95];
-cx q[27],q[95];
-rz(1.1513040615288597) q[95];
-cx q[27],q[95];
-rx(11.21904903175144) q[27];
-rx(11.21904903175144) q[95];
-ry(pi/2) q[96];
-rx(pi) q[96];
-cx q[56],q[96];
-rz(1.1513040615288597) q[96];
-cx q[56],q[96];
-rx(11.21904903175144) q[56];
-cx q[92],q[96];
-rz(1.1513040615288597) q[96];
-cx q[92],q[96];
-rx(11.21904903175144) q[96];
-ry(pi/2) q[97];
-rx(pi) q[97];
-cx q[1],q[97];
-rz(1.1513040615288597) q[97];
-cx q[1],q[97];
-cx q[7],q[97];
-rz(1.1513040615288597) q[97];
-cx q[7],q[97];
-rx(11.21904903175144) q[97];
-ry(pi/2) q[98];
-rx(pi) q[98];
-cx q[10],q[98];
-rz(1.1513040615288597) q[98];
-cx q[10],q[98];
-rx(11.21904903175144) q[10];
-cx q[21],q[98];
-rz(1.1513040615288597) q[98];
-cx q[21],q[98];
-rx(11.21904903175144) q[98];
-ry(pi/2) q[99];
-rx(pi) q[99];
-cx q[4],q[99];
-rz(1.1513040615288597) q[99];
-cx q[4],q[99];
-cx q[41],q[99];
-rz(1.1513040615288597) q[99];
-cx q[41],q[99];
-rx(11.21904903175144) q[41];
-rx(11.21904903175144) q[99];
-ry(pi/2) q[100];
-rx(pi) q[100];
-cx q[3],q[100];
-rz(1.1513040615288597) q[100];
-cx q[3],q[100];
-cx q[25],q[100];
-rz(1.1513040615288597) q[100];
-cx q[25],q[100];
-rx(11.21904903175144) q[25];
-rx(11.21904903175144) q[100];
-ry(pi/2) q[101];
-rx(pi) q[101];
-cx q[16],q[101];
-rz(1.1513040615288597) q[101];
-cx q[16],q[101];
-cx q[50],q[101];
-rz(1.1513040615288597) q[101];
-cx q[50],q[101];
-rx(11.21904903175144) q[50];
-rx(11.21904903175144) q[101];
-ry(pi/2) q[102];
-rx(pi) q[102];
-cx q[3],q[102];
-rz(1.1513040615288597) q[102];
-cx q[3],q[102];
-cx q[4],q[102];
-rz(1.1513040615288597) q[102];
-cx q[4],q[102];
-rx(11.21904903175144) q[102];
-ry(pi/2) q[103];
-rx(pi) q[103];
-cx q[16],q[103];
-rz(1.1513040615288597) q[103];
-cx q[16],q[103];
-rx(11.21904903175144) q[16];
-cx q[57],q[103];
-rz(1.1513040615288597) q[103];
-cx q[57],q[103];
-rx(11.21904903175144) q[57];
-rx(11.21904903175144) q[103];
-ry(pi/2) q[104];
-rx(pi) q[104];
-cx q[7],q[104];
-rz(1.1513040615288597) q[104];
-cx q[7],q[104];
-rx(11.21904903175144) q[7];
-cx q[13],q[104];
-rz(1.1513040615288597) q[104];
-cx q[13],q[104];
-rx(11.21904903175144) q[13];
-ry(pi/2) q[105];
-rx(pi) q[105];
-cx q[26],q[105];
-rz(1.1513040615288597) q[105];
-cx q[26],q[105];
-cx q[28],q[105];
-rz(1.1513040615288597) q[105];
-cx q[28],q[105];
-rx(11.21904903175144) q[105];
-ry(pi/2) q[106];
-rx(pi) q[106];
-cx q[5],q[106];
-rz(1.1513040615288597) q[106];
-cx q[5],q[106];
-cx q[36],q[106];
-rz(1.1513040615288597) q[106];
-cx q[36],q[106];
-rx(11.21904903175144) q[106];
-ry(pi/2) q[107];
-rx(pi) q[107];
-cx q[3],q[107];
-rz(1.1513040615288597) q[107];
-cx q[3],q[107];
-cx q[31],q[107];
-rz(1.1513040615288597) q[107];
-cx q[31],q[107];
-rx(11.21904903175144) q[107];
-ry(pi/2) q[108];
-rx(pi) q[108];
-cx q[15],q[108];
-rz(1.1513040615288597) q[108];
-cx q[15],q[108];
-cx q[31],q[108];
-rz(1.1513040615288597) q[108];
-cx q[31],q[108];
-rx(11.21904903175144) q[31];
-rx(11.21904903175144) q[108];
-ry(pi/2) q[109];
-rx(pi) q[109];
-cx q[5],q[109];
-rz(1.1513040615288597) q[109];
-cx q[5],q[109];
-cx q[39],q[109];
-rz(1.1513040615288597) q[109];
-cx q[39],q[109];
-rx(11.21904903175144) q[39];
-ry(pi/2) q[110];
-rx(pi) q[110];
-cx q[3],q[110];
-rz(1.1513040615288597) q[110];
-cx q[3],q[110];
-cx q[24],q[110];
-rz(1.1513040615288597) q[110];
-cx q[24],q[110];
-rx(11.21904903175144) q[24];
-ry(pi/2) q[111];
-rx(pi) q[111];
-cx q[3],q[111];
-rz(1.1513040615288597) q[111];
-cx q[3],q[111];
-cx q[21],q[111];
-rz(1.1513040615288597) q[111];
-cx q[21],q[111];
-rx(11.21904903175144) q[111];
-ry(pi/2) q[112];
-rx(pi) q[112];
-cx q[21],q[112];
-rz(1.1513040615288597) q[112];
-cx q[21],q[112];
-rx(11.21904903175144) q[21];
-cx q[36],q[112];
-rz(1.1513040615288597) q[112];
-cx q[36],q[112];
-rx(11.21904903175144) q[36];
-rx(11.21904903175144) q[112];
-ry(pi/2) q[113];
-rx(pi) q[113];
-cx q[1],q[113];
-rz(1.1513040615288597) q[113];
-cx q[1],q[113];
-rx(11.21904903175144) q[1];
-cx q[3],q[113];
-rz(1.1513040615288597) q[113];
-cx q[3],q[113];
-rx(11.21904903175144) q[113];
-ry(pi/2) q[114];
-rx(pi) q[114];
-cx q[104],q[114];
-rz(1.1513040615288597) q[114];
-cx q[104],q[114];
-cx q[110],q[114];
-rz(1.1513040615288597) q[114];
-cx q[110],q[114];
-rx(11.21904903175144) q[110];
-rx(11.21904903175144) q[114];
-ry(pi/2) q[115];
-rx(pi) q[115];
-cx q[15],q[115];
-rz(1.1513040615288597) q[115];
-cx q[15],q[115];
-cx q[92],q[115];
-rz(1.1513040615288597) q[115];
-cx q[92],q[115];
-rx(11.21904903175144) q[92];
-rx(11.21904903175144) q[115];
-ry(pi/2) q[116];
-rx(pi) q[116];
-cx q[28],q[116];
-rz(1.1513040615288597) q[116];
-cx q[28],q[116];
-rx(11.21904903175144) q[28];
-cx q[42],q[116];
-rz(1.1513040615288597) q[116];
-cx q[42],q[116];
-rx(11.21904903175144) q[42];
-rx(11.21904903175144) q[116];
-ry(pi/2) q[117];
-rx(pi) q[117];
-cx q[26],q[117];
-rz(1.1513040615288597) q[117];
-cx q[26],q[117];
-rx(11.21904903175144) q[26];
-cx q[32],q[117];
-rz(1.1513040615288597) q[117];
-cx q[32],q[117];
-rx(11.21904903175144) q[32];
-rx(11.21904903175144) q[117];
-ry(pi/2) q[118];
-rx(pi) q[118];
-cx q[5],q[118];
-rz(1.1513040615288597) q[118];
-cx q[5],q[118];
-rx(11.21904903175144) q[5];
-cx q[15],q[118];
-rz(1.1513040615288597) q[118];
-cx q[15],q[118];
-rx(11.21904903175144) q[15];
-rx(11.21904903175144) q[118];
-ry(pi/2) q[119];
-rx(pi) q[119];
-cx q[40],q[119];
-rz(1.1513040615288597) q[119];
-cx q[40],q[119];
-rx(11.21904903175144) q[40];
-cx q[69],q[119];
-rz(1.1513040615288597) q[119];
-cx q[69],q[119];
-rx(11.21904903175144) q[69];
-rx(11.21904903175144) q[119];
-ry(pi/2) q[120];
-rx(pi) q[120];
-cx q[46],q[120];
-rz(1.1513040615288597) q[120];
-cx q[46],q[120];
-rx(11.21904903175144) q[46];
-cx q[94],q[120];
-rz(1.1513040615288597) q[120];
-cx q[94],q[120];
-rx(11.21904903175144) q[94];
-rx(11.21904903175144) q[120];
-ry(pi/2) q[121];
-rx(pi) q[121];
-cx q[20],q[121];
-rz(1.1513040615288597) q[121];
-cx q[20],q[121];
-rx(11.21904903175144) q[20];
-cx q[104],q[121];
-rz(1.1513040615288597) q[121];
-cx q[104],q[121];
-rx(11.21904903175144) q[104];
-rx(11.21904903175144) q[121];
-ry(pi/2) q[122];
-rx(pi) q[122];
-cx q[63],q[122];
-rz(1.1513040615288597) q[122];
-cx q[63],q[122];
-rx(11.21904903175144) q[63];
-cx q[81],q[122];
-rz(1.1513040615288597) q[122];
-cx q[81],q[122];
-rx(11.21904903175144) q[122];
-ry(pi/2) q[123];
-rx(pi) q[123];
-cx q[0],q[123];
-rz(1.1513040615288597) q[123];
-cx q[0],q[123];
-cx q[52],q[123];
-rz(1.1513040615288597) q[123];
-cx q[52],q[123];
-rx(11.21904903175144) q[52];
-rx(11.21904903175144) q[123];
-ry(pi/2) q[124];
-rx(pi) q[124];
-cx q[53],q[124];
-rz(1.1513040615288597) q[124];
-cx q[53],q[124];
-rx(11.21904903175144) q[53];
-cx q[81],q[124];
-rz(1.1513040615288597) q[124];
-cx q[81],q[124];
-rx(11.21904903175144) q[81];
-rx(11.21904903175144) q[124];
-ry(pi/2) q[125];
-rx(pi) q[125];
-cx q[3],q[125];
-rz(1.1513040615288597) q[125];
-cx q[3],q[125];
-rx(11.21904903175144) q[3];
-cx q[109],q[125];
-rz(1.1513040615288597) q[125];
-cx q[109],q[125];
-rx(11.21904903175144) q[109];
-rx(11.21904903175144) q[125];
-ry(pi/2) q[126];
-rx(pi) q[126];
-cx q[0],q[126];
-rz(1.1513040615288597) q[126];
-cx q[0],q[126];
-rx(11.21904903175144) q[0];
-cx q[0],q[1];
-rz(4.981489899989122) q[1];
-cx q[0],q[1];
-cx q[0],q[2];
-rz(4.981489899989122) q[2];
-cx q[0],q[2];
-cx q[0],q[3];
-cx q[2],q[89];
-rz(4.981489899989122) q[3];
-cx q[0],q[3];
-cx q[0],q[15];
-cx q[1],q[3];
-rz(4.981489899989122) q[3];
-cx q[1],q[3];
-cx q[12],q[126];
-rz(4.981489899989122) q[15];
-cx q[0],q[15];
-cx q[0],q[16];
-rz(4.981489899989122) q[16];
-cx q[0],q[16];
-cx q[0],q[20];
-rz(4.981489899989122) q[20];
-cx q[0],q[20];
-cx q[0],q[32];
-rz(4.981489899989122) q[32];
-cx q[0],q[32];
-cx q[0],q[42];
-rz(4.981489899989122) q[42];
-cx q[0],q[42];
-cx q[0],q[48];
-rz(4.981489899989122) q[48];
-cx q[0],q[48];
-cx q[0],q[51];
-rz(4.981489899989122) q[51];
-cx q[0],q[51];
-rz(4.981489899989122) q[89];
-cx q[2],q[89];
-rx(9.041116863652526) q[2];
-rz(1.1513040615288597) q[126];
-cx q[12],q[126];
-rx(11.21904903175144) q[12];
-rx(11.21904903175144) q[126];
-ry(pi/2) q[127];
-rx(pi) q[127];
-cx q[4],q[127];
-rz(1.1513040615288597) q[127];
-cx q[4],q[127];
-rx(11.21904903175144) q[4];
-cx q[1],q[4];
-rz(4.981489899989122) q[4];
-cx q[1],q[4];
-cx q[1],q[5];
-cx q[3],q[4];
-rz(4.981489899989122) q[4];
-cx q[3],q[4];
-cx q[4],q[6];
-rz(4.981489899989122) q[5];
-cx q[1],q[5];
-cx q[1],q[9];
-cx q[3],q[5];
-rz(4.981489899989122) q[5];
-cx q[3],q[5];
-cx q[3],q[7];
-rz(4.981489899989122) q[6];
-cx q[4],q[6];
-cx q[5],q[6];
-rz(4.981489899989122) q[6];
-cx q[5],q[6];
-rz(4.981489899989122) q[7];
-cx q[3],q[7];
-cx q[3],q[8];
-cx q[4],q[7];
-rz(4.981489899989122) q[7];
-cx q[4],q[7];
-cx q[4],q[10];
-rz(4.981489899989122) q[8];
-cx q[3],q[8];
-cx q[5],q[8];
-rz(4.981489899989122) q[8];
-cx q[5],q[8];
-cx q[5],q[11];
-cx q[8],q[83];
-rz(4.981489899989122) q[9];
-cx q[1],q[9];
-cx q[1],q[17];
-cx q[3],q[9];
-rz(4.981489899989122) q[9];
-cx q[3],q[9];
-cx q[3],q[12];
-rz(4.981489899989122) q[10];
-cx q[4],q[10];
-cx q[4],q[13];
-cx q[6],q[10];
-rz(4.981489899989122) q[10];
-cx q[6],q[10];
-cx q[10],q[37];
-rz(4.981489899989122) q[11];
-cx q[5],q[11];
-cx q[6],q[11];
-rz(4.981489899989122) q[11];
-cx q[6],q[11];
-rx(9.041116863652526) q[11];
-rz(4.981489899989122) q[12];
-cx q[3],q[12];
-cx q[3],q[14];
-cx q[5],q[12];
-rz(4.981489899989122) q[12];
-cx q[5],q[12];
-rz(4.981489899989122) q[13];
-cx q[4],q[13];
-cx q[5],q[13];
-rz(4.981489899989122) q[13];
-cx q[5],q[13];
-rz(4.981489899989122) q[14];
-cx q[3],q[14];
-cx q[3],q[15];
-cx q[4],q[14];
-rz(4.981489899989122) q[14];
-cx q[4],q[14];
-rx(9.041116863652526) q[14];
-rz(4.981489899989122) q[15];
-cx q[3],q[15];
-cx q[3],q[16];
-cx q[15],q[20];
-rz(4.981489899989122) q[16];
-cx q[3],q[16];
-rz(4.981489899989122) q[17];
-cx q[1],q[17];
-cx q[1],q[28];
-cx q[3],q[17];
-rz(4.981489899989122) q[17];
-cx q[3],q[17];
-cx q[3],q[18];
-rz(4.981489899989122) q[18];
-cx q[3],q[18];
-cx q[3],q[19];
-cx q[4],q[18];
-rz(4.981489899989122) q[18];
-cx q[4],q[18];
-cx q[4],q[21];
-rz(4.981489899989122) q[19];
-cx q[3],q[19];
-cx q[3],q[22];
-cx q[7],q[19];
-rz(4.981489899989122) q[19];
-cx q[7],q[19];
-cx q[19],q[38];
-rz(4.981489899989122) q[20];
-cx q[15],q[20];
-rz(4.981489899989122) q[21];
-cx q[4],q[21];
-cx q[4],q[27];
-cx q[15],q[21];
-rz(4.981489899989122) q[21];
-cx q[15],q[21];
-cx q[15],q[36];
-rz(4.981489899989122) q[22];
-cx q[3],q[22];
-cx q[3],q[23];
-cx q[9],q[22];
-rz(4.981489899989122) q[22];
-cx q[9],q[22];
-cx q[9],q[55];
-rx(9.041116863652526) q[22];
-rz(4.981489899989122) q[23];
-cx q[3],q[23];
-cx q[3],q[24];
-cx q[17],q[23];
-rz(4.981489899989122) q[23];
-cx q[17],q[23];
-rz(4.981489899989122) q[24];
-cx q[3],q[24];
-cx q[3],q[25];
-cx q[5],q[24];
-rz(4.981489899989122) q[24];
-cx q[5],q[24];
-cx q[5],q[33];
-cx q[24],q[54];
-rz(4.981489899989122) q[25];
-cx q[3],q[25];
-cx q[3],q[26];
-cx q[12],q[25];
-rz(4.981489899989122) q[25];
-cx q[12],q[25];
-cx q[12],q[31];
-rz(4.981489899989122) q[26];
-cx q[3],q[26];
-cx q[21],q[26];
-rz(4.981489899989122) q[26];
-cx q[21],q[26];
-cx q[21],q[32];
-rz(4.981489899989122) q[27];
-cx q[4],q[27];
-cx q[4],q[47];
-cx q[6],q[27];
-rz(4.981489899989122) q[27];
-cx q[6],q[27];
-cx q[6],q[69];
-rz(4.981489899989122) q[28];
-cx q[1],q[28];
-cx q[1],q[29];
-cx q[3],q[28];
-rz(4.981489899989122) q[28];
-cx q[3],q[28];
-cx q[28],q[51];
-rz(4.981489899989122) q[29];
-cx q[1],q[29];
-cx q[1],q[45];
-cx q[3],q[29];
-rz(4.981489899989122) q[29];
-cx q[3],q[29];
-cx q[3],q[30];
-rx(9.041116863652526) q[29];
-rz(4.981489899989122) q[30];
-cx q[3],q[30];
-cx q[3],q[34];
-cx q[18],q[30];
-rz(4.981489899989122) q[30];
-cx q[18],q[30];
-rx(9.041116863652526) q[18];
-rz(4.981489899989122) q[31];
-cx q[12],q[31];
-cx q[26],q[31];
-rz(4.981489899989122) q[31];
-cx q[26],q[31];
-cx q[26],q[105];
-rz(4.981489899989122) q[32];
-cx q[21],q[32];
-rz(4.981489899989122) q[33];
-cx q[5],q[33];
-cx q[5],q[46];
-cx q[30],q[33];
-rz(4.981489899989122) q[33];
-cx q[30],q[33];
-cx q[30],q[48];
-rx(9.041116863652526) q[33];
-rz(4.981489899989122) q[34];
-cx q[3],q[34];
-cx q[3],q[35];
-cx q[12],q[34];
-rz(4.981489899989122) q[34];
-cx q[12],q[34];
-rz(4.981489899989122) q[35];
-cx q[3],q[35];
-cx q[3],q[39];
-cx q[32],q[35];
-rz(4.981489899989122) q[35];
-cx q[32],q[35];
-rx(9.041116863652526) q[35];
-rz(4.981489899989122) q[36];
-cx q[15],q[36];
-cx q[20],q[36];
-rz(4.981489899989122) q[36];
-cx q[20],q[36];
-cx q[36],q[94];
-rz(4.981489899989122) q[37];
-cx q[10],q[37];
-cx q[10],q[41];
-cx q[34],q[37];
-rz(4.981489899989122) q[37];
-cx q[34],q[37];
-rx(9.041116863652526) q[34];
-cx q[37],q[85];
-rz(4.981489899989122) q[38];
-cx q[19],q[38];
-rx(9.041116863652526) q[19];
-cx q[21],q[38];
-rz(4.981489899989122) q[38];
-cx q[21],q[38];
-rz(4.981489899989122) q[39];
-cx q[3],q[39];
-cx q[3],q[40];
-cx q[13],q[39];
-rz(4.981489899989122) q[39];
-cx q[13],q[39];
-cx q[13],q[56];
-rz(4.981489899989122) q[40];
-cx q[3],q[40];
-cx q[3],q[42];
-cx q[23],q[40];
-rz(4.981489899989122) q[40];
-cx q[23],q[40];
-cx q[40],q[119];
-rz(4.981489899989122) q[41];
-cx q[10],q[41];
-cx q[27],q[41];
-rz(4.981489899989122) q[41];
-cx q[27],q[41];
-cx q[27],q[72];
-cx q[41],q[67];
-rz(4.981489899989122) q[42];
-cx q[3],q[42];
-cx q[3],q[43];
-cx q[42],q[78];
-rz(4.981489899989122) q[43];
-cx q[3],q[43];
-cx q[3],q[44];
-cx q[20],q[43];
-rz(4.981489899989122) q[43];
-cx q[20],q[43];
-cx q[20],q[121];
-rx(9.041116863652526) q[43];
-rz(4.981489899989122) q[44];
-cx q[3],q[44];
-cx q[3],q[49];
-cx q[12],q[44];
-rz(4.981489899989122) q[44];
-cx q[12],q[44];
-rz(4.981489899989122) q[45];
-cx q[1],q[45];
-cx q[1],q[57];
-cx q[16],q[45];
-rz(4.981489899989122) q[45];
-cx q[16],q[45];
-cx q[16],q[59];
-rz(4.981489899989122) q[46];
-cx q[5],q[46];
-cx q[5],q[65];
-cx q[38],q[46];
-rz(4.981489899989122) q[46];
-cx q[38],q[46];
-rx(9.041116863652526) q[38];
-cx q[46],q[120];
-rz(4.981489899989122) q[47];
-cx q[4],q[47];
-cx q[17],q[47];
-rz(4.981489899989122) q[47];
-cx q[17],q[47];
-cx q[17],q[53];
-rz(4.981489899989122) q[48];
-cx q[30],q[48];
-rx(9.041116863652526) q[48];
-rz(4.981489899989122) q[49];
-cx q[3],q[49];
-cx q[3],q[50];
-cx q[4],q[49];
-rz(4.981489899989122) q[49];
-cx q[4],q[49];
-cx q[4],q[61];
-rx(9.041116863652526) q[49];
-rz(4.981489899989122) q[50];
-cx q[3],q[50];
-cx q[3],q[52];
-cx q[12],q[50];
-rz(4.981489899989122) q[50];
-cx q[12],q[50];
-cx q[12],q[63];
-rz(4.981489899989122) q[51];
-cx q[28],q[51];
-rx(9.041116863652526) q[51];
-rz(4.981489899989122) q[52];
-cx q[3],q[52];
-cx q[10],q[52];
-rz(4.981489899989122) q[52];
-cx q[10],q[52];
-rz(4.981489899989122) q[53];
-cx q[17],q[53];
-cx q[21],q[53];
-rz(4.981489899989122) q[53];
-cx q[21],q[53];
-rz(4.981489899989122) q[54];
-cx q[24],q[54];
-cx q[24],q[58];
-cx q[28],q[54];
-rz(4.981489899989122) q[54];
-cx q[28],q[54];
-rx(9.041116863652526) q[54];
-rz(4.981489899989122) q[55];
-cx q[9],q[55];
-cx q[9],q[80];
-cx q[15],q[55];
-rz(4.981489899989122) q[55];
-cx q[15],q[55];
-rz(4.981489899989122) q[56];
-cx q[13],q[56];
-cx q[13],q[68];
-cx q[45],q[56];
-rz(4.981489899989122) q[56];
-cx q[45],q[56];
-rx(9.041116863652526) q[45];
-rz(4.981489899989122) q[57];
-cx q[1],q[57];
-cx q[1],q[60];
-cx q[3],q[57];
-rz(4.981489899989122) q[57];
-cx q[3],q[57];
-cx q[3],q[70];
-rz(4.981489899989122) q[58];
-cx q[24],q[58];
-cx q[24],q[86];
-cx q[28],q[58];
-rz(4.981489899989122) q[58];
-cx q[28],q[58];
-cx q[28],q[87];
-rx(9.041116863652526) q[58];
-rz(4.981489899989122) q[59];
-cx q[16],q[59];
-cx q[16],q[73];
-cx q[32],q[59];
-rz(4.981489899989122) q[59];
-cx q[32],q[59];
-rz(4.981489899989122) q[60];
-cx q[1],q[60];
-cx q[1],q[97];
-cx q[7],q[60];
-rz(4.981489899989122) q[60];
-cx q[7],q[60];
-rz(4.981489899989122) q[61];
-cx q[4],q[61];
-cx q[4],q[99];
-cx q[7],q[61];
-rz(4.981489899989122) q[61];
-cx q[7],q[61];
-rx(9.041116863652526) q[61];
-cx q[62],q[127];
-rz(4.981489899989122) q[63];
-cx q[12],q[63];
-rz(4.981489899989122) q[65];
-cx q[5],q[65];
-cx q[5],q[76];
-cx q[23],q[65];
-rz(4.981489899989122) q[65];
-cx q[23],q[65];
-rx(9.041116863652526) q[23];
-rx(9.041116863652526) q[65];
-rz(4.981489899989122) q[67];
-cx q[41],q[67];
-cx q[56],q[67];
-rz(4.981489899989122) q[67];
-cx q[56],q[67];
-cx q[56],q[74];
-rx(9.041116863652526) q[67];
-rz(4.981489899989122) q[68];
-cx q[13],q[68];
-cx q[32],q[68];
-rz(4.981489899989122) q[68];
-cx q[32],q[68];
-rz(4.981489899989122) q[69];
-cx q[6],q[69];
-cx q[59],q[69];
-rz(4.981489899989122) q[69];
-cx q[59],q[69];
-rz(4.981489899989122) q[70];
-cx q[3],q[70];
-cx q[3],q[71];
-cx q[15],q[70];
-rz(4.981489899989122) q[70];
-cx q[15],q[70];
-cx q[70],q[84];
-rz(4.981489899989122) q[71];
-cx q[3],q[71];
-cx q[3],q[77];
-cx q[53],q[71];
-rz(4.981489899989122) q[71];
-cx q[53],q[71];
-rx(9.041116863652526) q[71];
-rz(4.981489899989122) q[72];
-cx q[27],q[72];
-cx q[44],q[72];
-rz(4.981489899989122) q[72];
-cx q[44],q[72];
-rx(9.041116863652526) q[44];
-rx(9.041116863652526) q[72];
-rz(4.981489899989122) q[73];
-cx q[16],q[73];
-cx q[16],q[101];
-cx q[59],q[73];
-rz(4.981489899989122) q[73];
-cx q[59],q[73];
-rz(4.981489899989122) q[74];
-cx q[56],q[74];
-rz(4.981489899989122) q[76];
-cx q[5],q[76];
-cx q[5],q[89];
-cx q[6],q[76];
-rz(4.981489899989122) q[76];
-cx q[6],q[76];
-cx q[6],q[79];
-rx(9.041116863652526) q[76];
-rz(4.981489899989122) q[77];
-cx q[3],q[77];
-cx q[3],q[88];
-cx q[30],q[77];
-rz(4.981489899989122) q[77];
-cx q[30],q[77];
-rx(9.041116863652526) q[30];
-rz(4.981489899989122) q[78];
-cx q[42],q[78];
-cx q[60],q[78];
-rz(4.981489899989122) q[78];
-cx q[60],q[78];
-rx(9.041116863652526) q[78];
-rz(4.981489899989122) q[79];
-cx q[6],q[79];
-cx q[50],q[79];
-rz(4.981489899989122) q[79];
-cx q[50],q[79];
-rx(9.041116863652526) q[79];
-rz(4.981489899989122) q[80];
-cx q[9],q[80];
-rx(9.041116863652526) q[9];
-cx q[15],q[80];
-rz(4.981489899989122) q[80];
-cx q[15],q[80];
-cx q[15],q[90];
-rx(9.041116863652526) q[80];
-rz(4.981489899989122) q[83];
-cx q[8],q[83];
-rx(9.041116863652526) q[8];
-cx q[68],q[83];
-rz(4.981489899989122) q[83];
-cx q[68],q[83];
-rx(9.041116863652526) q[68];
-rx(9.041116863652526) q[83];
-rz(4.981489899989122) q[84];
-cx q[70],q[84];
-rx(9.041116863652526) q[70];
-cx q[73],q[84];
-rz(4.981489899989122) q[84];
-cx q[73],q[84];
-rx(9.041116863652526) q[73];
-rx(9.041116863652526) q[84];
-rz(4.981489899989122) q[85];
-cx q[37],q[85];
-rx(9.041116863652526) q[37];
-cx q[59],q[85];
-rz(4.981489899989122) q[85];
-cx q[59],q[85];
-rx(9.041116863652526) q[59];
-rx(9.041116863652526) q[85];
-rz(4.981489899989122) q[86];
-cx q[24],q[86];
-cx q[53],q[86];
-rz(4.981489899989122) q[86];
-cx q[53],q[86];
-cx q[53],q[124];
-rx(9.041116863652526) q[86];
-rz(4.981489899989122) q[87];
-cx q[28],q[87];
-cx q[32],q[87];
-rz(4.981489899989122) q[87];
-cx q[32],q[87];
-rx(9.041116863652526) q[87];
-rz(4.981489899989122) q[88];
-cx q[3],q[88];
-cx q[3],q[100];
-cx q[60],q[88];
-rz(4.981489899989122) q[88];
-cx q[60],q[88];
-rx(9.041116863652526) q[60];
-rx(9.041116863652526) q[88];
-rz(4.981489899989122) q[89];
-cx q[5],q[89];
-cx q[5],q[95];
-rz(4.981489899989122) q[90];
-cx q[15],q[90];
-cx q[15],q[92];
-cx q[27],q[90];
-rz(4.981489899989122) q[90];
-cx q[27],q[90];
-rx(9.041116863652526) q[90];
-rz(4.981489899989122) q[92];
-cx q[15],q[92];
-cx q[15],q[108];
-cx q[89],q[92];
-rz(4.981489899989122) q[92];
-cx q[89],q[92];
-rx(9.041116863652526) q[89];
-rz(4.981489899989122) q[94];
-cx q[36],q[94];
-cx q[55],q[94];
-rz(4.981489899989122) q[94];
-cx q[55],q[94];
-rx(9.041116863652526) q[55];
-rz(4.981489899989122) q[95];
-cx q[5],q[95];
-cx q[5],q[106];
-cx q[27],q[95];
-rz(4.981489899989122) q[95];
-cx q[27],q[95];
-rx(9.041116863652526) q[27];
-rx(9.041116863652526) q[95];
-rz(4.981489899989122) q[97];
-cx q[1],q[97];
-cx q[1],q[113];
-cx q[7],q[97];
-rz(4.981489899989122) q[97];
-cx q[7],q[97];
-cx q[7],q[104];
-rx(9.041116863652526) q[97];
-rz(4.981489899989122) q[99];
-cx q[4],q[99];
-cx q[41],q[99];
-rz(4.981489899989122) q[99];
-cx q[41],q[99];
-rx(9.041116863652526) q[41];
-rx(9.041116863652526) q[99];
-rz(4.981489899989122) q[100];
-cx q[3],q[100];
-cx q[3],q[102];
-cx q[25],q[100];
-rz(4.981489899989122) q[100];
-cx q[25],q[100];
-rx(9.041116863652526) q[25];
-rx(9.041116863652526) q[100];
-rz(4.981489899989122) q[101];
-cx q[16],q[101];
-cx q[16],q[103];
-cx q[50],q[101];
-rz(4.981489899989122) q[101];
-cx q[50],q[101];
-rx(9.041116863652526) q[50];
-rx(9.041116863652526) q[101];
-rz(4.981489899989122) q[102];
-cx q[3],q[102];
-cx q[3],q[107];
-cx q[4],q[102];
-rz(4.981489899989122) q[102];
-cx q[4],q[102];
-rx(9.041116863652526) q[102];
-rz(4.981489899989122) q[103];
-cx q[16],q[103];
-rx(9.041116863652526) q[16];
-cx q[57],q[103];
-rz(4.981489899989122) q[103];
-cx q[57],q[103];
-rx(9.041116863652526) q[57];
-rx(9.041116863652526) q[103];
-rz(4.981489899989122) q[104];
-cx q[7],q[104];
-rx(9.041116863652526) q[7];
-cx q[13],q[104];
-rz(4.981489899989122) q[104];
-cx q[13],q[104];
-rx(9.041116863652526) q[13];
-cx q[104],q[114];
-rz(4.981489899989122) q[105];
-cx q[26],q[105];
-cx q[26],q[117];
-cx q[28],q[105];
-rz(4.981489899989122) q[105];
-cx q[28],q[105];
-cx q[28],q[116];
-rx(9.041116863652526) q[105];
-rz(4.981489899989122) q[106];
-cx q[5],q[106];
-cx q[5],q[109];
-cx q[36],q[106];
-rz(4.981489899989122) q[106];
-cx q[36],q[106];
-rx(9.041116863652526) q[106];
-rz(4.981489899989122) q[107];
-cx q[3],q[107];
-cx q[3],q[110];
-cx q[31],q[107];
-rz(4.981489899989122) q[107];
-cx q[31],q[107];
-rx(9.041116863652526) q[107];
-rz(4.981489899989122) q[108];
-cx q[15],q[108];
-cx q[15],q[115];
-cx q[31],q[108];
-rz(4.981489899989122) q[108];
-cx q[31],q[108];
-rx(9.041116863652526) q[31];
-rx(9.041116863652526) q[108];
-rz(4.981489899989122) q[109];
-cx q[5],q[109];
-cx q[5],q[118];
-cx q[39],q[109];
-rz(4.981489899989122) q[109];
-cx q[39],q[109];
-rx(9.041116863652526) q[39];
-rz(4.981489899989122) q[110];
-cx q[3],q[110];
-cx q[3],q[111];
-cx q[24],q[110];
-rz(4.981489899989122) q[110];
-cx q[24],q[110];
-rx(9.041116863652526) q[24];
-rz(4.981489899989122) q[111];
-cx q[3],q[111];
-rz(4.981489899989122) q[113];
-cx q[1],q[113];
-rx(9.041116863652526) q[1];
-cx q[3],q[113];
-rz(4.981489899989122) q[113];
-cx q[3],q[113];
-cx q[3],q[125];
-rx(9.041116863652526) q[113];
-rz(4.981489899989122) q[114];
-cx q[104],q[114];
-cx q[110],q[114];
-rz(4.981489899989122) q[114];
-cx q[110],q[114];
-rx(9.041116863652526) q[110];
-rx(9.041116863652526) q[114];
-rz(4.981489899989122) q[115];
-cx q[15],q[115];
-rz(4.981489899989122) q[116];
-cx q[28],q[116];
-rx(9.041116863652526) q[28];
-cx q[42],q[116];
-rz(4.981489899989122) q[116];
-cx q[42],q[116];
-rx(9.041116863652526) q[42];
-rx(9.041116863652526) q[116];
-rz(4.981489899989122) q[117];
-cx q[26],q[117];
-rx(9.041116863652526) q[26];
-rz(4.981489899989122) q[118];
-cx q[5],q[118];
-rx(9.041116863652526) q[5];
-cx q[15],q[118];
-rz(4.981489899989122) q[118];
-cx q[15],q[118];
-rx(9.041116863652526) q[15];
-rx(9.041116863652526) q[118];
-rz(4.981489899989122) q[119];
-cx q[40],q[119];
-rx(9.041116863652526) q[40];
-cx q[69],q[119];
-rz(4.981489899989122) q[119];
-cx q[69],q[119];
-rx(9.041116863652526) q[69];
-rx(9.041116863652526) q[119];
-rz(4.981489899989122) q[120];
-cx q[46],q[120];
-rx(9.041116863652526) q[46];
-cx q[94],q[120];
-rz(4.981489899989122) q[120];
-cx q[94],q[120];
-rx(9.041116863652526) q[94];
-rx(9.041116863652526) q[120];
-rz(4.981489899989122) q[121];
-cx q[20],q[121];
-rx(9.041116863652526) q[20];
-cx q[104],q[121];
-rz(4.981489899989122) q[121];
-cx q[104],q[121];
-rx(9.041116863652526) q[104];
-rx(9.041116863652526) q[121];
-rz(4.981489899989122) q[124];
-cx q[53],q[124];
-rx(9.041116863652526) q[53];
-rz(4.981489899989122) q[125];
-cx q[3],q[125];
-rx(9.041116863652526) q[3];
-cx q[109],q[125];
-rz(4.981489899989122) q[125];
-cx q[109],q[125];
-rx(9.041116863652526) q[109];
-rx(9.041116863652526) q[125];
-rz(1.1513040615288597) q[127];
-cx q[62],q[127];
-rx(11.21904903175144) q[62];
-cx q[0],q[62];
-rz(4.981489899989122) q[62];
-cx q[0],q[62];
-cx q[0],q[64];
-cx q[17],q[62];
-rz(4.981489899989122) q[62];
-cx q[17],q[62];
-cx q[17],q[63];
-rz(4.981489899989122) q[63];
-cx q[17],q[63];
-cx q[17],q[66];
-cx q[63],q[74];
-rz(4.981489899989122) q[64];
-cx q[0],q[64];
-cx q[0],q[75];
-cx q[10],q[64];
-rz(4.981489899989122) q[64];
-cx q[10],q[64];
-cx q[10],q[98];
-rx(9.041116863652526) q[64];
-rz(4.981489899989122) q[66];
-cx q[17],q[66];
-rx(9.041116863652526) q[17];
-cx q[47],q[66];
-rz(4.981489899989122) q[66];
-cx q[47],q[66];
-rx(9.041116863652526) q[47];
-rx(9.041116863652526) q[66];
-rz(4.981489899989122) q[74];
-cx q[63],q[74];
-cx q[63],q[122];
-rx(9.041116863652526) q[74];
-rz(4.981489899989122) q[75];
-cx q[0],q[75];
-cx q[0],q[82];
-cx q[21],q[75];
-rz(4.981489899989122) q[75];
-cx q[21],q[75];
-cx q[21],q[81];
-rx(9.041116863652526) q[75];
-rz(4.981489899989122) q[81];
-cx q[21],q[81];
-cx q[77],q[81];
-rz(4.981489899989122) q[81];
-cx q[77],q[81];
-rx(9.041116863652526) q[77];
-rz(4.981489899989122) q[82];
-cx q[0],q[82];
-cx q[0],q[91];
-cx q[56],q[82];
-rz(4.981489899989122) q[82];
-cx q[56],q[82];
-cx q[56],q[96];
-rx(9.041116863652526) q[82];
-rz(4.981489899989122) q[91];
-cx q[0],q[91];
-cx q[0],q[93];
-cx q[6],q[91];
-rz(4.981489899989122) q[91];
-cx q[6],q[91];
-rx(9.041116863652526) q[6];
-rx(9.041116863652526) q[91];
-rz(4.981489899989122) q[93];
-cx q[0],q[93];
-cx q[0],q[123];
-cx q[32],q[93];
-rz(4.981489899989122) q[93];
-cx q[32],q[93];
-cx q[32],q[117];
-rx(9.041116863652526) q[93];
-rz(4.981489899989122) q[96];
-cx q[56],q[96];
-rx(9.041116863652526) q[56];
-cx q[92],q[96];
-rz(4.981489899989122) q[96];
-cx q[92],q[96];
-cx q[92],q[115];
-rx(9.041116863652526) q[96];
-rz(4.981489899989122) q[98];
-cx q[10],q[98];
-rx(9.041116863652526) q[10];
-cx q[21],q[98];
-rz(4.981489899989122) q[98];
-cx q[21],q[98];
-cx q[21],q[111];
-rx(9.041116863652526) q[98];
-rz(4.981489899989122) q[111];
-cx q[21],q[111];
-cx q[21],q[112];
-rx(9.041116863652526) q[111];
-rz(4.981489899989122) q[112];
-cx q[21],q[112];
-rx(9.041116863652526) q[21];
-cx q[36],q[112];
-rz(4.981489899989122) q[112];
-cx q[36],q[112];
-rx(9.041116863652526) q[36];
-rx(9.041116863652526) q[112];
-rz(4.981489899989122) q[115];
-cx q[92],q[115];
-rx(9.041116863652526) q[92];
-rx(9.041116863652526) q[115];
-rz(4.981489899989122) q[117];
-cx q[32],q[117];
-rx(9.041116863652526) q[32];
-rx(9.041116863652526) q[117];
-rz(4.981489899989122) q[122];
-cx q[63],q[122];
-rx(9.041116863652526) q[63];
-cx q[81],q[122];
-rz(4.981489899989122) q[122];
-cx q[81],q[122];
-cx q[81],q[124];
-rx(9.041116863652526) q[122];
-rz(4.981489899989122) q[123];
-cx q[0],q[123];
-cx q[0],q[126];
-cx q[52],q[123];
-rz(4.981489899989122) q[123];
-cx q[52],q[123];
-rx(9.041116863652526) q[52];
-rx(9.041116863652526) q[123];
-rz(4.981489899989122) q[124];
-cx q[81],q[124];
-rx(9.041116863652526) q[81];
-rx(9.041116863652526) q[124];
-rz(4.981489899989122) q[126];
-cx q[0],q[126];
-rx(9.041116863652526) q[0];
-cx q[0],q[1];
-rz(2.5940589390813478) q[1];
-cx q[0],q[1];
-cx q[0],q[2];
-rz(2.5940589390813478) q[2];
-cx q[0],q[2];
-cx q[0],q[3];
-cx q[2],q[89];
-rz(2.5940589390813478) q[3];
-cx q[0],q[3];
-cx q[0],q[15];
-cx q[1],q[3];
-rz(2.5940589390813478) q[3];
-cx q[1],q[3];
-cx q[12],q[126];
-rz(2.5940589390813478) q[15];
-cx q[0],q[15];
-cx q[0],q[16];
-rz(2.5940589390813478) q[16];
-cx q[0],q[16];
-cx q[0],q[20];
-rz(2.5940589390813478) q[20];
-cx q[0],q[20];
-cx q[0],q[32];
-rz(2.5940589390813478) q[32];
-cx q[0],q[32];
-cx q[0],q[42];
-rz(2.5940589390813478) q[42];
-cx q[0],q[42];
-cx q[0],q[48];
-rz(2.5940589390813478) q[48];
-cx q[0],q[48];
-cx q[0],q[51];
-rz(2.5940589390813478) q[51];
-cx q[0],q[51];
-rz(2.5940589390813478) q[89];
-cx q[2],q[89];
-rx(4.7541951084485214) q[2];
-rz(4.981489899989122) q[126];
-cx q[12],q[126];
-rx(9.041116863652526) q[12];
-rx(9.041116863652526) q[126];
-rx(11.21904903175144) q[127];
-cx q[4],q[127];
-rz(4.981489899989122) q[127];
-cx q[4],q[127];
-rx(9.041116863652526) q[4];
-cx q[1],q[4];
-rz(2.5940589390813478) q[4];
-cx q[1],q[4];
-cx q[1],q[5];
-cx q[3],q[4];
-rz(2.5940589390813478) q[4];
-cx q[3],q[4];
-cx q[4],q[6];
-rz(2.5940589390813478) q[5];
-cx q[1],q[5];
-cx q[1],q[9];
-cx q[3],q[5];
-rz(2.5940589390813478) q[5];
-cx q[3],q[5];
-cx q[3],q[7];
-rz(2.5940589390813478) q[6];
-cx q[4],q[6];
-cx q[5],q[6];
-rz(2.5940589390813478) q[6];
-cx q[5],q[6];
-rz(2.5940589390813478) q[7];
-cx q[3],q[7];
-cx q[3],q[8];
-cx q[4],q[7];
-rz(2.5940589390813478) q[7];
-cx q[4],q[7];
-cx q[4],q[10];
-rz(2.5940589390813478) q[8];
-cx q[3],q[8];
-cx q[5],q[8];
-rz(2.5940589390813478) q[8];
-cx q[5],q[8];
-cx q[5],q[11];
-cx q[8],q[83];
-rz(2.5940589390813478) q[9];
-cx q[1],q[9];
-cx q[1],q[17];
-cx q[3],q[9];
-rz(2.5940589390813478) q[9];
-cx q[3],q[9];
-cx q[3],q[12];
-rz(2.5940589390813478) q[10];
-cx q[4],q[10];
-cx q[4],q[13];
-cx q[6],q[10];
-rz(2.5940589390813478) q[10];
-cx q[6],q[10];
-cx q[10],q[37];
-rz(2.5940589390813478) q[11];
-cx q[5],q[11];
-cx q[6],q[11];
-rz(2.5940589390813478) q[11];
-cx q[6],q[11];
-rx(4.7541951084485214) q[11];
-rz(2.5940589390813478) q[12];
-cx q[3],q[12];
-cx q[3],q[14];
-cx q[5],q[12];
-rz(2.5940589390813478) q[12];
-cx q[5],q[12];
-rz(2.5940589390813478) q[13];
-cx q[4],q[13];
-cx q[5],q[13];
-rz(2.5940589390813478) q[13];
-cx q[5],q[13];
-rz(2.5940589390813478) q[14];
-cx q[3],q[14];
-cx q[3],q[15];
-cx q[4],q[14];
-rz(2.5940589390813478) q[14];
-cx q[4],q[14];
-rx(4.7541951084485214) q[14];
-rz(2.5940589390813478) q[15];
-cx q[3],q[15];
-cx q[3],q[16];
-cx q[15],q[20];
-rz(2.5940589390813478) q[16];
-cx q[3],q[16];
-rz(2.5940589390813478) q[17];
-cx q[1],q[17];
-cx q[1],q[28];
-cx q[3],q[17];
-rz(2.5940589390813478) q[17];
-cx q[3],q[17];
-cx q[3],q[18];
-rz(2.5940589390813478) q[18];
-cx q[3],q[18];
-cx q[3],q[19];
-cx q[4],q[18];
-rz(2.5940589390813478) q[18];
-cx q[4],q[18];
-cx q[4],q[21];
-rz(2.5940589390813478) q[19];
-cx q[3],q[19];
-cx q[3],q[22];
-cx q[7],q[19];
-rz(2.5940589390813478) q[19];
-cx q[7],q[19];
-cx q[19],q[38];
-rz(2.5940589390813478) q[20];
-cx q[15],q[20];
-rz(2.5940589390813478) q[21];
-cx q[4],q[21];
-cx q[4],q[27];
-cx q[15],q[21];
-rz(2.5940589390813478) q[21];
-cx q[15],q[21];
-cx q[15],q[36];
-rz(2.5940589390813478) q[22];
-cx q[3],q[22];
-cx q[3],q[23];
-cx q[9],q[22];
-rz(2.5940589390813478) q[22];
-cx q[9],q[22];
-cx q[9],q[55];
-rx(4.7541951084485214) q[22];
-rz(2.5940589390813478) q[23];
-cx q[3],q[23];
-cx q[3],q[24];
-cx q[17],q[23];
-rz(2.5940589390813478) q[23];
-cx q[17],q[23];
-rz(2.5940589390813478) q[24];
-cx q[3],q[24];
-cx q[3],q[25];
-cx q[5],q[24];
-rz(2.5940589390813478) q[24];
-cx q[5],q[24];
-cx q[5],q[33];
-cx q[24],q[54];
-rz(2.5940589390813478) q[25];
-cx q[3],q[25];
-cx q[3],q[26];
-cx q[12],q[25];
-rz(2.5940589390813478) q[25];
-cx q[12],q[25];
-cx q[12],q[31];
-rz(2.5940589390813478) q[26];
-cx q[3],q[26];
-cx q[21],q[26];
-rz(2.5940589390813478) q[26];
-cx q[21],q[26];
-cx q[21],q[32];
-rz(2.5940589390813478) q[27];
-cx q[4],q[27];
-cx q[4],q[47];
-cx q[6],q[27];
-rz(2.5940589390813478) q[27];
-cx q[6],q[27];
-cx q[6],q[69];
-rz(2.5940589390813478) q[28];
-cx q[1],q[28];
-cx q[1],q[29];
-cx q[3],q[28];
-rz(2.5940589390813478) q[28];
-cx q[3],q[28];
-cx q[28],q[51];
-rz(2.5940589390813478) q[29];
-cx q[1],q[29];
-cx q[1],q[45];
-cx q[3],q[29];
-rz(2.5940589390813478) q[29];
-cx q[3],q[29];
-cx q[3],q[30];
-rx(4.7541951084485214) q[29];
-rz(2.5940589390813478) q[30];
-cx q[3],q[30];
-cx q[3],q[34];
-cx q[18],q[30];
-rz(2.5940589390813478) q[30];
-cx q[18],q[30];
-rx(4.7541951084485214) q[18];
-rz(2.5940589390813478) q[31];
-cx q[12],q[31];
-cx q[26],q[31];
-rz(2.5940589390813478) q[31];
-cx q[26],q[31];
-cx q[26],q[105];
-rz(2.5940589390813478) q[32];
-cx q[21],q[32];
-rz(2.5940589390813478) q[33];
-cx q[5],q[33];
-cx q[5],q[46];
-cx q[30],q[33];
-rz(2.5940589390813478) q[33];
-cx q[30],q[33];
-cx q[30],q[48];
-rx(4.7541951084485214) q[33];
-rz(2.5940589390813478) q[34];
-cx q[3],q[34];
-cx q[3],q[35];
-cx q[12],q[34];
-rz(2.5940589390813478) q[34];
-cx q[12],q[34];
-rz(2.5940589390813478) q[35];
-cx q[3],q[35];
-cx q[3],q[39];
-cx q[32],q[35];
-rz(2.5940589390813478) q[35];
-cx q[32],q[35];
-rx(4.7541951084485214) q[35];
-rz(2.5940589390813478) q[36];
-cx q[15],q[36];
-cx q[20],q[36];
-rz(2.5940589390813478) q[36];
-cx q[20],q[36];
-cx q[36],q[94];
-rz(2.5940589390813478) q[37];
-cx q[10],q[37];
-cx q[10],q[41];
-cx q[34],q[37];
-rz(2.5940589390813478) q[37];
-cx q[34],q[37];
-rx(4.7541951084485214) q[34];
-cx q[37],q[85];
-rz(2.5940589390813478) q[38];
-cx q[19],q[38];
-rx(4.7541951084485214) q[19];
-cx q[21],q[38];
-rz(2.5940589390813478) q[38];
-cx q[21],q[38];
-rz(2.5940589390813478) q[39];
-cx q[3],q[39];
-cx q[3],q[40];
-cx q[13],q[39];
-rz(2.5940589390813478) q[39];
-cx q[13],q[39];
-cx q[13],q[56];
-rz(2.5940589390813478) q[40];
-cx q[3],q[40];
-cx q[3],q[42];
-cx q[23],q[40];
-rz(2.5940589390813478) q[40];
-cx q[23],q[40];
-cx q[40],q[119];
-rz(2.5940589390813478) q[41];
-cx q[10],q[41];
-cx q[27],q[41];
-rz(2.5940589390813478) q[41];
-cx q[27],q[41];
-cx q[27],q[72];
-cx q[41],q[67];
-rz(2.5940589390813478) q[42];
-cx q[3],q[42];
-cx q[3],q[43];
-cx q[42],q[78];
-rz(2.5940589390813478) q[43];
-cx q[3],q[43];
-cx q[3],q[44];
-cx q[20],q[43];
-rz(2.5940589390813478) q[43];
-cx q[20],q[43];
-cx q[20],q[121];
-rx(4.7541951084485214) q[43];
-rz(2.5940589390813478) q[44];
-cx q[3],q[44];
-cx q[3],q[49];
-cx q[12],q[44];
-rz(2.5940589390813478) q[44];
-cx q[12],q[44];
-rz(2.5940589390813478) q[45];
-cx q[1],q[45];
-cx q[1],q[57];
-cx q[16],q[45];
-rz(2.5940589390813478) q[45];
-cx q[16],q[45];
-cx q[16],q[59];
-rz(2.5940589390813478) q[46];
-cx q[5],q[46];
-cx q[5],q[65];
-cx q[38],q[46];
-rz(2.5940589390813478) q[46];
-cx q[38],q[46];
-rx(4.7541951084485214) q[38];
-cx q[46],q[120];
-rz(2.5940589390813478) q[47];
-cx q[4],q[47];
-cx q[17],q[47];
-rz(2.5940589390813478) q[47];
-cx q[17],q[47];
-cx q[17],q[53];
-rz(2.5940589390813478) q[48];
-cx q[30],q[48];
-rx(4.7541951084485214) q[48];
-rz(2.5940589390813478) q[49];
-cx q[3],q[49];
-cx q[3],q[50];
-cx q[4],q[49];
-rz(2.5940589390813478) q[49];
-cx q[4],q[49];
-cx q[4],q[61];
-rx(4.7541951084485214) q[49];
-rz(2.5940589390813478) q[50];
-cx q[3],q[50];
-cx q[3],q[52];
-cx q[12],q[50];
-rz(2.5940589390813478) q[50];
-cx q[12],q[50];
-cx q[12],q[63];
-rz(2.5940589390813478) q[51];
-cx q[28],q[51];
-rx(4.7541951084485214) q[51];
-rz(2.5940589390813478) q[52];
-cx q[3],q[52];
-cx q[10],q[52];
-rz(2.5940589390813478) q[52];
-cx q[10],q[52];
-rz(2.5940589390813478) q[53];
-cx q[17],q[53];
-cx q[21],q[53];
-rz(2.5940589390813478) q[53];
-cx q[21],q[53];
-rz(2.5940589390813478) q[54];
-cx q[24],q[54];
-cx q[24],q[58];
-cx q[28],q[54];
-rz(2.5940589390813478) q[54];
-cx q[28],q[54];
-rx(4.7541951084485214) q[54];
-rz(2.5940589390813478) q[55];
-cx q[9],q[55];
-cx q[9],q[80];
-cx q[15],q[55];
-rz(2.5940589390813478) q[55];
-cx q[15],q[55];
-rz(2.5940589390813478) q[56];
-cx q[13],q[56];
-cx q[13],q[68];
-cx q[45],q[56];
-rz(2.5940589390813478) q[56];
-cx q[45],q[56];
-rx(4.7541951084485214) q[45];
-rz(2.5940589390813478) q[57];
-cx q[1],q[57];
-cx q[1],q[60];
-cx q[3],q[57];
-rz(2.5940589390813478) q[57];
-cx q[3],q[57];
-cx q[3],q[70];
-rz(2.5940589390813478) q[58];
-cx q[24],q[58];
-cx q[24],q[86];
-cx q[28],q[58];
-rz(2.5940589390813478) q[58];
-cx q[28],q[58];
-cx q[28],q[87];
-rx(4.7541951084485214) q[58];
-rz(2.5940589390813478) q[59];
-cx q[16],q[59];
-cx q[16],q[73];
-cx q[32],q[59];
-rz(2.5940589390813478) q[59];
-cx q[32],q[59];
-rz(2.5940589390813478) q[60];
-cx q[1],q[60];
-cx q[1],q[97];
-cx q[7],q[60];
-rz(2.5940589390813478) q[60];
-cx q[7],q[60];
-rz(2.5940589390813478) q[61];
-cx q[4],q[61];
-cx q[4],q[99];
-cx q[7],q[61];
-rz(2.5940589390813478) q[61];
-cx q[7],q[61];
-rx(4.7541951084485214) q[61];
-cx q[62],q[127];
-rz(2.5940589390813478) q[63];
-cx q[12],q[63];
-rz(2.5940589390813478) q[65];
-cx q[5],q[65];
-cx q[5],q[76];
-cx q[23],q[65];
-rz(2.5940589390813478) q[65];
-cx q[23],q[65];
-rx(4.7541951084485214) q[23];
-rx(4.7541951084485214) q[65];
-rz(2.5940589390813478) q[67];
-cx q[41],q[67];
-cx q[56],q[67];
-rz(2.5940589390813478) q[67];
-cx q[56],q[67];
-cx q[56],q[74];
-rx(4.7541951084485214) q[67];
-rz(2.5940589390813478) q[68];
-cx q[13],q[68];
-cx q[32],q[68];
-rz(2.5940589390813478) q[68];
-cx q[32],q[68];
-rz(2.5940589390813478) q[69];
-cx q[6],q[69];
-cx q[59],q[69];
-rz(2.5940589390813478) q[69];
-cx q[59],q[69];
-rz(2.5940589390813478) q[70];
-cx q[3],q[70];
-cx q[3],q[71];
-cx q[15],q[70];
-rz(2.5940589390813478) q[70];
-cx q[15],q[70];
-cx q[70],q[84];
-rz(2.5940589390813478) q[71];
-cx q[3],q[71];
-cx q[3],q[77];
-cx q[53],q[71];
-rz(2.5940589390813478) q[71];
-cx q[53],q[71];
-rx(4.7541951084485214) q[71];
-rz(2.5940589390813478) q[72];
-cx q[27],q[72];
-cx q[44],q[72];
-rz(2.5940589390813478) q[72];
-cx q[44],q[72];
-rx(4.7541951084485214) q[44];
-rx(4.7541951084485214) q[72];
-rz(2.5940589390813478) q[73];
-cx q[16],q[73];
-cx q[16],q[101];
-cx q[59],q[73];
-rz(2.5940589390813478) q[73];
-cx q[59],q[73];
-rz(2.5940589390813478) q[74];
-cx q[56],q[74];
-rz(2.5940589390813478) q[76];
-cx q[5],q[76];
-cx q[5],q[89];
-cx q[6],q[76];
-rz(2.5940589390813478) q[76];
-cx q[6],q[76];
-cx q[6],q[79];
-rx(4.7541951084485214) q[76];
-rz(2.5940589390813478) q[77];
-cx q[3],q[77];
-cx q[3],q[88];
-cx q[30],q[77];
-rz(2.5940589390813478) q[77];
-cx q[30],q[77];
-rx(4.7541951084485214) q[30];
-rz(2.5940589390813478) q[78];
-cx q[42],q[78];
-cx q[60],q[78];
-rz(2.5940589390813478) q[78];
-cx q[60],q[78];
-rx(4.7541951084485214) q[78];
-rz(2.5940589390813478) q[79];
-cx q[6],q[79];
-cx q[50],q[79];
-rz(2.5940589390813478) q[79];
-cx q[50],q[79];
-rx(4.7541951084485214) q[79];
-rz(2.5940589390813478) q[80];
-cx q[9],q[80];
-rx(4.7541951084485214) q[9];
-cx q[15],q[80];
-rz(2.5940589390813478) q[80];
-cx q[15],q[80];
-cx q[15],q[90];
-rx(4.7541951084485214) q[80];
-rz(2.5940589390813478) q[83];
-cx q[8],q[83];
-rx(4.7541951084485214) q[8];
-cx q[68],q[83];
-rz(2.5940589390813478) q[83];
-cx q[68],q[83];
-rx(4.7541951084485214) q[68];
-rx(4.7541951084485214) q[83];
-rz(2.5940589390813478) q[84];
-cx q[70],q[84];
-rx(4.7541951084485214) q[70];
-cx q[73],q[84];
-rz(2.5940589390813478) q[84];
-cx q[73],q[84];
-rx(4.7541951084485214) q[73];
-rx(4.7541951084485214) q[84];
-rz(2.5940589390813478) q[85];
-cx q[37],q[85];
-rx(4.7541951084485214) q[37];
-cx q[59],q[85];
-rz(2.5940589390813478) q[85];
-cx q[59],q[85];
-rx(4.7541951084485214) q[59];
-rx(4.7541951084485214) q[85];
-rz(2.5940589390813478) q[86];
-cx q[24],q[86];
-cx q[53],q[86];
-rz(2.5940589390813478) q[86];
-cx q[53],q[86];
-cx q[53],q[124];
-rx(4.7541951084485214) q[86];
-rz(2.5940589390813478) q[87];
-cx q[28],q[87];
-cx q[32],q[87];
-rz(2.5940589390813478) q[87];
-cx q[32],q[87];
-rx(4.7541951084485214) q[87];
-rz(2.5940589390813478) q[88];
-cx q[3],q[88];
-cx q[3],q[100];
-cx q[60],q[88];
-rz(2.5940589390813478) q[88];
-cx q[60],q[88];
-rx(4.7541951084485214) q[60];
-rx(4.7541951084485214) q[88];
-rz(2.5940589390813478) q[89];
-cx q[5],q[89];
-cx q[5],q[95];
-rz(2.5940589390813478) q[90];
-cx q[15],q[90];
-cx q[15],q[92];
-cx q[27],q[90];
-rz(2.5940589390813478) q[90];
-cx q[27],q[90];
-rx(4.7541951084485214) q[90];
-rz(2.5940589390813478) q[92];
-cx q[15],q[92];
-cx q[15],q[108];
-cx q[89],q[92];
-rz(2.5940589390813478) q[92];
-cx q[89],q[92];
-rx(4.7541951084485214) q[89];
-rz(2.5940589390813478) q[94];
-cx q[36],q[94];
-cx q[55],q[94];
-rz(2.5940589390813478) q[94];
-cx q[55],q[94];
-rx(4.7541951084485214) q[55];
-rz(2.5940589390813478) q[95];
-cx q[5],q[95];
-cx q[5],q[106];
-cx q[27],q[95];
-rz(2.5940589390813478) q[95];
-cx q[27],q[95];
-rx(4.7541951084485214) q[27];
-rx(4.7541951084485214) q[95];
-rz(2.5940589390813478) q[97];
-cx q[1],q[97];
-cx q[1],q[113];
-cx q[7],q[97];
-rz(2.5940589390813478) q[97];
-cx q[7],q[97];
-cx q[7],q[104];
-rx(4.7541951084485214) q[97];
-rz(2.5940589390813478) q[99];
-cx q[4],q[99];
-cx q[41],q[99];
-rz(2.5940589390813478) q[99];
-cx q[41],q[99];
-rx(4.7541951084485214) q[41];
-rx(4.7541951084485214) q[99];
-rz(2.5940589390813478) q[100];
-cx q[3],q[100];
-cx q[3],q[102];
-cx q[25],q[100];
-rz(2.5940589390813478) q[100];
-cx q[25],q[100];
-rx(4.7541951084485214) q[25];
-rx(4.7541951084485214) q[100];
-rz(2.5940589390813478) q[101];
-cx q[16],q[101];
-cx q[16],q[103];
-cx q[50],q[101];
-rz(2.5940589390813478) q[101];
-cx q[50],q[101];
-rx(4.7541951084485214) q[50];
-rx(4.7541951084485214) q[101];
-rz(2.5940589390813478) q[102];
-cx q[3],q[102];
-cx q[3],q[107];
-cx q[4],q[102];
-rz(2.5940589390813478) q[102];
-cx q[4],q[102];
-rx(4.7541951084485214) q[102];
-rz(2.5940589390813478) q[103];
-cx q[16],q[103];
-rx(4.7541951084485214) q[16];
-cx q[57],q[103];
-rz(2.5940589390813478) q[103];
-cx q[57],q[103];
-rx(4.7541951084485214) q[57];
-rx(4.7541951084485214) q[103];
-rz(2.5940589390813478) q[104];
-cx q[7],q[104];
-rx(4.7541951084485214) q[7];
-cx q[13],q[104];
-rz(2.5940589390813478) q[104];
-cx q[13],q[104];
-rx(4.7541951084485214) q[13];
-cx q[104],q[114];
-rz(2.5940589390813478) q[105];
-cx q[26],q[105];
-cx q[26],q[117];
-cx q[28],q[105];
-rz(2.5940589390813478) q[105];
-cx q[28],q[105];
-cx q[28],q[116];
-rx(4.7541951084485214) q[105];
-rz(2.5940589390813478) q[106];
-cx q[5],q[106];
-cx q[5],q[109];
-cx q[36],q[106];
-rz(2.5940589390813478) q[106];
-cx q[36],q[106];
-rx(4.7541951084485214) q[106];
-rz(2.5940589390813478) q[107];
-cx q[3],q[107];
-cx q[3],q[110];
-cx q[31],q[107];
-rz(2.5940589390813478) q[107];
-cx q[31],q[107];
-rx(4.7541951084485214) q[107];
-rz(2.5940589390813478) q[108];
-cx q[15],q[108];
-cx q[15],q[115];
-cx q[31],q[108];
-rz(2.5940589390813478) q[108];
-cx q[31],q[108];
-rx(4.7541951084485214) q[31];
-rx(4.7541951084485214) q[108];
-rz(2.5940589390813478) q[109];
-cx q[5],q[109];
-cx q[5],q[118];
-cx q[39],q[109];
-rz(2.5940589390813478) q[109];
-cx q[39],q[109];
-rx(4.7541951084485214) q[39];
-rz(2.5940589390813478) q[110];
-cx q[3],q[110];
-cx q[3],q[111];
-cx q[24],q[110];
-rz(2.5940589390813478) q[110];
-cx q[24],q[110];
-rx(4.7541951084485214) q[24];
-rz(2.5940589390813478) q[111];
-cx q[3],q[111];
-rz(2.5940589390813478) q[113];
-cx q[1],q[113];
-rx(4.7541951084485214) q[1];
-cx q[3],q[113];
-rz(2.5940589390813478) q[113];
-cx q[3],q[113];
-cx q[3],q[125];
-rx(4.7541951084485214) q[113];
-rz(2.5940589390813478) q[114];
-cx q[104],q[114];
-cx q[110],q[114];
-rz(2.5940589390813478) q[114];
-cx q[110],q[114];
-rx(4.7541951084485214) q[110];
-rx(4.7541951084485214) q[114];
-rz(2.5940589390813478) q[115];
-cx q[15],q[115];
-rz(2.5940589390813478) q[116];
-cx q[28],q[116];
-rx(4.7541951084485214) q[28];
-cx q[42],q[116];
-rz(2.5940589390813478) q[116];
-cx q[42],q[116];
-rx(4.7541951084485214) q[42];
-rx(4.7541951084485214) q[116];
-rz(2.5940589390813478) q[117];
-cx q[26],q[117];
-rx(4.7541951084485214) q[26];
-rz(2.5940589390813478) q[118];
-cx q[5],q[118];
-rx(4.7541951084485214) q[5];
-cx q[15],q[118];
-rz(2.5940589390813478) q[118];
-cx q[15],q[118];
-rx(4.7541951084485214) q[15];
-rx(4.7541951084485214) q[118];
-rz(2.5940589390813478) q[119];
-cx q[40],q[119];
-rx(4.7541951084485214) q[40];
-cx q[69],q[119];
-rz(2.5940589390813478) q[119];
-cx q[69],q[119];
-rx(4.7541951084485214) q[69];
-rx(4.7541951084485214) q[119];
-rz(2.5940589390813478) q[120];
-cx q[46],q[120];
-rx(4.7541951084485214) q[46];
-cx q[94],q[120];
-rz(2.5940589390813478) q[120];
-cx q[94],q[120];
-rx(4.7541951084485214) q[94];
-rx(4.7541951084485214) q[120];
-rz(2.5940589390813478) q[121];
-cx q[20],q[121];
-rx(4.7541951084485214) q[20];
-cx q[104],q[121];
-rz(2.5940589390813478) q[121];
-cx q[104],q[121];
-rx(4.7541951084485214) q[104];
-rx(4.7541951084485214) q[121];
-rz(2.5940589390813478) q[124];
-cx q[53],q[124];
-rx(4.7541951084485214) q[53];
-rz(2.5940589390813478) q[125];
-cx q[3],q[125];
-rx(4.7541951084485214) q[3];
-cx q[109],q[125];
-rz(2.5940589390813478) q[125];
-cx q[109],q[125];
-rx(4.7541951084485214) q[109];
-rx(4.7541951084485214) q[125];
-rz(4.981489899989122) q[127];
-cx q[62],q[127];
-rx(9.041116863652526) q[62];
-cx q[0],q[62];
-rz(2.5940589390813478) q[62];
-cx q[0],q[62];
-cx q[0],q[64];
-cx q[17],q[62];
-rz(2.5940589390813478) q[62];
-cx q[17],q[62];
-cx q[17],q[63];
-rz(2.5940589390813478) q[63];
-cx q[17],q[63];
-cx q[17],q[66];
-cx q[63],q[74];
-rz(2.5940589390813478) q[64];
-cx q[0],q[64];
-cx q[0],q[75];
-cx q[10],q[64];
-rz(2.5940589390813478) q[64];
-cx q[10],q[64];
-cx q[10],q[98];
-rx(4.7541951084485214) q[64];
-rz(2.5940589390813478) q[66];
-cx q[17],q[66];
-rx(4.7541951084485214) q[17];
-cx q[47],q[66];
-rz(2.5940589390813478) q[66];
-cx q[47],q[66];
-rx(4.7541951084485214) q[47];
-rx(4.7541951084485214) q[66];
-rz(2.5940589390813478) q[74];
-cx q[63],q[74];
-cx q[63],q[122];
-rx(4.7541951084485214) q[74];
-rz(2.5940589390813478) q[75];
-cx q[0],q[75];
-cx q[0],q[82];
-cx q[21],q[75];
-rz(2.5940589390813478) q[75];
-cx q[21],q[75];
-cx q[21],q[81];
-rx(4.7541951084485214) q[75];
-rz(2.5940589390813478) q[81];
-cx q[21],q[81];
-cx q[77],q[81];
-rz(2.5940589390813478) q[81];
-cx q[77],q[81];
-rx(4.7541951084485214) q[77];
-rz(2.5940589390813478) q[82];
-cx q[0],q[82];
-cx q[0],q[91];
-cx q[56],q[82];
-rz(2.5940589390813478) q[82];
-cx q[56],q[82];
-cx q[56],q[96];
-rx(4.7541951084485214) q[82];
-rz(2.5940589390813478) q[91];
-cx q[0],q[91];
-cx q[0],q[93];
-cx q[6],q[91];
-rz(2.5940589390813478) q[91];
-cx q[6],q[91];
-rx(4.7541951084485214) q[6];
-rx(4.7541951084485214) q[91];
-rz(2.5940589390813478) q[93];
-cx q[0],q[93];
-cx q[0],q[123];
-cx q[32],q[93];
-rz(2.5940589390813478) q[93];
-cx q[32],q[93];
-cx q[32],q[117];
-rx(4.7541951084485214) q[93];
-rz(2.5940589390813478) q[96];
-cx q[56],q[96];
-rx(4.7541951084485214) q[56];
-cx q[92],q[96];
-rz(2.5940589390813478) q[96];
-cx q[92],q[96];
-cx q[92],q[115];
-rx(4.7541951084485214) q[96];
-rz(2.5940589390813478) q[98];
-cx q[10],q[98];
-rx(4.7541951084485214) q[10];
-cx q[21],q[98];
-rz(2.5940589390813478) q[98];
-cx q[21],q[98];
-cx q[21],q[111];
-rx(4.7541951084485214) q[98];
-rz(2.5940589390813478) q[111];
-cx q[21],q[111];
-cx q[21],q[112];
-rx(4.7541951084485214) q[111];
-rz(2.5940589390813478) q[112];
-cx q[21],q[112];
-rx(4.7541951084485214) q[21];
-cx q[36],q[112];
-rz(2.5940589390813478) q[112];
-cx q[36],q[112];
-rx(4.7541951084485214) q[36];
-rx(4.7541951084485214) q[112];
-rz(2.5940589390813478) q[115];
-cx q[92],q[115];
-rx(4.7541951084485214) q[92];
-rx(4.7541951084485214) q[115];
-rz(2.5940589390813478) q[117];
-cx q[32],q[117];
-rx(4.7541951084485214) q[32];
-rx(4.7541951084485214) q[117];
-rz(2.5940589390813478) q[122];
-cx q[63],q[122];
-rx(4.7541951084485214) q[63];
-cx q[81],q[122];
-rz(2.5940589390813478) q[122];
-cx q[81],q[122];
-cx q[81],q[124];
-rx(4.7541951084485214) q[122];
-rz(2.5940589390813478) q[123];
-cx q[0],q[123];
-cx q[0],q[126];
-cx q[52],q[123];
-rz(2.5940589390813478) q[123];
-cx q[52],q[123];
-rx(4.7541951084485214) q[52];
-rx(4.7541951084485214) q[123];
-rz(2.5940589390813478) q[124];
-cx q[81],q[124];
-rx(4.7541951084485214) q[81];
-rx(4.7541951084485214) q[124];
-rz(2.5940589390813478) q[126];
-cx q[0],q[126];
-rx(4.7541951084485214) q[0];
-cx q[12],q[126];
-rz(2.5940589390813478) q[126];
-cx q[12],q[126];
-rx(4.7541951084485214) q[12];
-rx(4.7541951084485214) q[126];
-rx(9.041116863652526) q[127];
-cx q[4],q[127];
-rz(2.5940589390813478) q[127];
-cx q[4],q[127];
-rx(4.7541951084485214) q[4];
-cx q[62],q[127];
-rz(2.5940589390813478) q[127];
-cx q[62],q[127];
-rx(4.7541951084485214) q[62];
-rx(4.7541951084485214) q[127];
\ No newline at end of file
@@ -1,243 +0,0 @@
-OPENQASM 2.0;
-include "qelib1.inc";
-qreg q[12];
-ry(pi/2) q[0];
-rx(pi) q[0];
-ry(pi/2) q[1];
-rx(pi) q[1];
-cx q[0],q[1];
-rz(4.930589277673707) q[1];
-cx q[0],q[1];
-ry(pi/2) q[2];
-rx(pi) q[2];
-cx q[0],q[2];
-rz(4.930589277673707) q[2];
-cx q[0],q[2];
-rx(2.117199717515544) q[2];
-ry(pi/2) q[3];
-rx(pi) q[3];
-cx q[0],q[3];
-rz(4.930589277673707) q[3];
-cx q[0],q[3];
-rx(2.117199717515544) q[0];
-cx q[1],q[3];
-rz(4.930589277673707) q[3];
-cx q[1],q[3];
-ry(pi/2) q[4];
-rx(pi) q[4];
-cx q[1],q[4];
-rz(4.930589277673707) q[4];
-cx q[1],q[4];
-cx q[3],q[4];
-rz(4.930589277673707) q[4];
-cx q[3],q[4];
-ry(pi/2) q[5];
-rx(pi) q[5];
-cx q[1],q[5];
-rz(4.930589277673707) q[5];
-cx q[1],q[5];
-cx q[3],q[5];
-rz(4.930589277673707) q[5];
-cx q[3],q[5];
-ry(pi/2) q[6];
-rx(pi) q[6];
-cx q[4],q[6];
-rz(4.930589277673707) q[6];
-cx q[4],q[6];
-cx q[5],q[6];
-rz(4.930589277673707) q[6];
-cx q[5],q[6];
-ry(pi/2) q[7];
-rx(pi) q[7];
-cx q[3],q[7];
-rz(4.930589277673707) q[7];
-cx q[3],q[7];
-cx q[4],q[7];
-rz(4.930589277673707) q[7];
-cx q[4],q[7];
-rx(2.117199717515544) q[7];
-ry(pi/2) q[8];
-rx(pi) q[8];
-cx q[3],q[8];
-rz(4.930589277673707) q[8];
-cx q[3],q[8];
-cx q[5],q[8];
-rz(4.930589277673707) q[8];
-cx q[5],q[8];
-rx(2.117199717515544) q[8];
-ry(pi/2) q[9];
-rx(pi) q[9];
-cx q[1],q[9];
-rz(4.930589277673707) q[9];
-cx q[1],q[9];
-rx(2.117199717515544) q[1];
-cx q[0],q[1];
-rz(1.5612414092955575) q[1];
-cx q[0],q[1];
-cx q[0],q[2];
-rz(1.5612414092955575) q[2];
-cx q[0],q[2];
-rx(7.178255125731823) q[2];
-cx q[3],q[9];
-rz(4.930589277673707) q[9];
-cx q[3],q[9];
-rx(2.117199717515544) q[3];
-cx q[0],q[3];
-rz(1.5612414092955575) q[3];
-cx q[0],q[3];
-rx(7.178255125731823) q[0];
-cx q[1],q[3];
-rz(1.5612414092955575) q[3];
-cx q[1],q[3];
-rx(2.117199717515544) q[9];
-ry(pi/2) q[10];
-rx(pi) q[10];
-cx q[4],q[10];
-rz(4.930589277673707) q[10];
-cx q[4],q[10];
-rx(2.117199717515544) q[4];
-cx q[1],q[4];
-rz(1.5612414092955575) q[4];
-cx q[1],q[4];
-cx q[3],q[4];
-rz(1.5612414092955575) q[4];
-cx q[3],q[4];
-cx q[6],q[10];
-rz(4.930589277673707) q[10];
-cx q[6],q[10];
-rx(2.117199717515544) q[10];
-ry(pi/2) q[11];
-rx(pi) q[11];
-cx q[5],q[11];
-rz(4.930589277673707) q[11];
-cx q[5],q[11];
-rx(2.117199717515544) q[5];
-cx q[1],q[5];
-rz(1.5612414092955575) q[5];
-cx q[1],q[5];
-cx q[1],q[9];
-cx q[3],q[5];
-rz(1.5612414092955575) q[5];
-cx q[3],q[5];
-cx q[3],q[7];
-cx q[6],q[11];
-rz(1.5612414092955575) q[7];
-cx q[3],q[7];
-cx q[3],q[8];
-rz(1.5612414092955575) q[8];
-cx q[3],q[8];
-rz(1.5612414092955575) q[9];
-cx q[1],q[9];
-rx(7.178255125731823) q[1];
-cx q[0],q[1];
-rz(2.716432703490852) q[1];
-cx q[0],q[1];
-cx q[0],q[2];
-rz(2.716432703490852) q[2];
-cx q[0],q[2];
-rx(2.2085498806407893) q[2];
-cx q[3],q[9];
-rz(1.5612414092955575) q[9];
-cx q[3],q[9];
-rx(7.178255125731823) q[3];
-cx q[0],q[3];
-rz(2.716432703490852) q[3];
-cx q[0],q[3];
-rx(2.2085498806407893) q[0];
-cx q[1],q[3];
-rz(2.716432703490852) q[3];
-cx q[1],q[3];
-rx(7.178255125731823) q[9];
-rz(4.930589277673707) q[11];
-cx q[6],q[11];
-rx(2.117199717515544) q[6];
-cx q[4],q[6];
-rz(1.5612414092955575) q[6];
-cx q[4],q[6];
-cx q[4],q[7];
-cx q[5],q[6];
-rz(1.5612414092955575) q[6];
-cx q[5],q[6];
-cx q[5],q[8];
-rz(1.5612414092955575) q[7];
-cx q[4],q[7];
-cx q[4],q[10];
-rx(7.178255125731823) q[7];
-rz(1.5612414092955575) q[8];
-cx q[5],q[8];
-rx(7.178255125731823) q[8];
-rz(1.5612414092955575) q[10];
-cx q[4],q[10];
-rx(7.178255125731823) q[4];
-cx q[1],q[4];
-rz(2.716432703490852) q[4];
-cx q[1],q[4];
-cx q[3],q[4];
-rz(2.716432703490852) q[4];
-cx q[3],q[4];
-cx q[6],q[10];
-rz(1.5612414092955575) q[10];
-cx q[6],q[10];
-rx(7.178255125731823) q[10];
-rx(2.117199717515544) q[11];
-cx q[5],q[11];
-rz(1.5612414092955575) q[11];
-cx q[5],q[11];
-rx(7.178255125731823) q[5];
-cx q[1],q[5];
-rz(2.716432703490852) q[5];
-cx q[1],q[5];
-cx q[1],q[9];
-cx q[3],q[5];
-rz(2.716432703490852) q[5];
-cx q[3],q[5];
-cx q[3],q[7];
-cx q[6],q[11];
-rz(2.716432703490852) q[7];
-cx q[3],q[7];
-cx q[3],q[8];
-rz(2.716432703490852) q[8];
-cx q[3],q[8];
-rz(2.716432703490852) q[9];
-cx q[1],q[9];
-rx(2.2085498806407893) q[1];
-cx q[3],q[9];
-rz(2.716432703490852) q[9];
-cx q[3],q[9];
-rx(2.2085498806407893) q[3];
-rx(2.2085498806407893) q[9];
-rz(1.5612414092955575) q[11];
-cx q[6],q[11];
-rx(7.178255125731823) q[6];
-cx q[4],q[6];
-rz(2.716432703490852) q[6];
-cx q[4],q[6];
-cx q[4],q[7];
-cx q[5],q[6];
-rz(2.716432703490852) q[6];
-cx q[5],q[6];
-cx q[5],q[8];
-rz(2.716432703490852) q[7];
-cx q[4],q[7];
-cx q[4],q[10];
-rx(2.2085498806407893) q[7];
-rz(2.716432703490852) q[8];
-cx q[5],q[8];
-rx(2.2085498806407893) q[8];
-rz(2.716432703490852) q[10];
-cx q[4],q[10];
-rx(2.2085498806407893) q[4];
-cx q[6],q[10];
-rz(2.716432703490852) q[10];
-cx q[6],q[10];
-rx(2.2085498806407893) q[10];
-rx(7.178255125731823) q[11];
-cx q[5],q[11];
-rz(2.716432703490852) q[11];
-cx q[5],q[11];
-rx(2.2085498806407893) q[5];
-cx q[6],q[11];
-rz(2.716432703490852) q[11];
-cx q[6],q[11];
-rx(2.2085498806407893) q[6];
-rx(2.2085498806407893) q[11];
\ No newline at end of file
@@ -1,3026 +0,0 @@
-OPENQASM 2.0;
-include "qelib1.inc";
-qreg q[133];
-ry(pi/2) q[0];
-rx(pi) q[0];
-ry(pi/2) q[1];
-rx(pi) q[1];
-cx q[0],q[1];
-rz(4.855117943314672) q[1];
-cx q[0],q[1];
-ry(pi/2) q[2];
-rx(pi) q[2];
-cx q[0],q[2];
-rz(4.855117943314672) q[2];
-cx q[0],q[2];
-ry(pi/2) q[3];
-rx(pi) q[3];
-cx q[0],q[3];
-rz(4.855117943314672) q[3];
-cx q[0],q[3];
-cx q[1],q[3];
-rz(4.855117943314672) q[3];
-cx q[1],q[3];
-ry(pi/2) q[4];
-rx(pi) q[4];
-cx q[1],q[4];
-rz(4.855117943314672) q[4];
-cx q[1],q[4];
-cx q[3],q[4];
-rz(4.855117943314672) q[4];
-cx q[3],q[4];
-ry(pi/2) q[5];
-rx(pi) q[5];
-cx q[1],q[5];
-rz(4.855117943314672) q[5];
-cx q[1],q[5];
-cx q[3],q[5];
-rz(4.855117943314672) q[5];
-cx q[3],q[5];
-ry(pi/2) q[6];
-rx(pi) q[6];
-cx q[4],q[6];
-rz(4.855117943314672) q[6];
-cx q[4],q[6];
-cx q[5],q[6];
-rz(4.855117943314672) q[6];
-cx q[5],q[6];
-ry(pi/2) q[7];
-rx(pi) q[7];
-cx q[3],q[7];
-rz(4.855117943314672) q[7];
-cx q[3],q[7];
-cx q[4],q[7];
-rz(4.855117943314672) q[7];
-cx q[4],q[7];
-ry(pi/2) q[8];
-rx(pi) q[8];
-cx q[3],q[8];
-rz(4.855117943314672) q[8];
-cx q[3],q[8];
-cx q[5],q[8];
-rz(4.855117943314672) q[8];
-cx q[5],q[8];
-ry(pi/2) q[9];
-rx(pi) q[9];
-cx q[1],q[9];
-rz(4.855117943314672) q[9];
-cx q[1],q[9];
-cx q[3],q[9];
-rz(4.855117943314672) q[9];
-cx q[3],q[9];
-ry(pi/2) q[10];
-rx(pi) q[10];
-cx q[4],q[10];
-rz(4.855117943314672) q[10];
-cx q[4],q[10];
-cx q[6],q[10];
-rz(4.855117943314672) q[10];
-cx q[6],q[10];
-ry(pi/2) q[11];
-rx(pi) q[11];
-cx q[5],q[11];
-rz(4.855117943314672) q[11];
-cx q[5],q[11];
-cx q[6],q[11];
-rz(4.855117943314672) q[11];
-cx q[6],q[11];
-rx(10.916833501710489) q[11];
-ry(pi/2) q[12];
-rx(pi) q[12];
-cx q[3],q[12];
-rz(4.855117943314672) q[12];
-cx q[3],q[12];
-cx q[5],q[12];
-rz(4.855117943314672) q[12];
-cx q[5],q[12];
-ry(pi/2) q[13];
-rx(pi) q[13];
-cx q[4],q[13];
-rz(4.855117943314672) q[13];
-cx q[4],q[13];
-cx q[5],q[13];
-rz(4.855117943314672) q[13];
-cx q[5],q[13];
-ry(pi/2) q[14];
-rx(pi) q[14];
-cx q[3],q[14];
-rz(4.855117943314672) q[14];
-cx q[3],q[14];
-cx q[4],q[14];
-rz(4.855117943314672) q[14];
-cx q[4],q[14];
-rx(10.916833501710489) q[14];
-ry(pi/2) q[15];
-rx(pi) q[15];
-cx q[0],q[15];
-rz(4.855117943314672) q[15];
-cx q[0],q[15];
-cx q[3],q[15];
-rz(4.855117943314672) q[15];
-cx q[3],q[15];
-ry(pi/2) q[16];
-rx(pi) q[16];
-cx q[0],q[16];
-rz(4.855117943314672) q[16];
-cx q[0],q[16];
-cx q[3],q[16];
-rz(4.855117943314672) q[16];
-cx q[3],q[16];
-ry(pi/2) q[17];
-rx(pi) q[17];
-cx q[1],q[17];
-rz(4.855117943314672) q[17];
-cx q[1],q[17];
-cx q[3],q[17];
-rz(4.855117943314672) q[17];
-cx q[3],q[17];
-ry(pi/2) q[18];
-rx(pi) q[18];
-cx q[3],q[18];
-rz(4.855117943314672) q[18];
-cx q[3],q[18];
-cx q[4],q[18];
-rz(4.855117943314672) q[18];
-cx q[4],q[18];
-ry(pi/2) q[19];
-rx(pi) q[19];
-cx q[3],q[19];
-rz(4.855117943314672) q[19];
-cx q[3],q[19];
-cx q[7],q[19];
-rz(4.855117943314672) q[19];
-cx q[7],q[19];
-ry(pi/2) q[20];
-rx(pi) q[20];
-cx q[0],q[20];
-rz(4.855117943314672) q[20];
-cx q[0],q[20];
-cx q[15],q[20];
-rz(4.855117943314672) q[20];
-cx q[15],q[20];
-ry(pi/2) q[21];
-rx(pi) q[21];
-cx q[4],q[21];
-rz(4.855117943314672) q[21];
-cx q[4],q[21];
-cx q[15],q[21];
-rz(4.855117943314672) q[21];
-cx q[15],q[21];
-ry(pi/2) q[22];
-rx(pi) q[22];
-cx q[3],q[22];
-rz(4.855117943314672) q[22];
-cx q[3],q[22];
-cx q[9],q[22];
-rz(4.855117943314672) q[22];
-cx q[9],q[22];
-rx(10.916833501710489) q[22];
-ry(pi/2) q[23];
-rx(pi) q[23];
-cx q[3],q[23];
-rz(4.855117943314672) q[23];
-cx q[3],q[23];
-cx q[17],q[23];
-rz(4.855117943314672) q[23];
-cx q[17],q[23];
-ry(pi/2) q[24];
-rx(pi) q[24];
-cx q[3],q[24];
-rz(4.855117943314672) q[24];
-cx q[3],q[24];
-cx q[5],q[24];
-rz(4.855117943314672) q[24];
-cx q[5],q[24];
-ry(pi/2) q[25];
-rx(pi) q[25];
-cx q[3],q[25];
-rz(4.855117943314672) q[25];
-cx q[3],q[25];
-cx q[12],q[25];
-rz(4.855117943314672) q[25];
-cx q[12],q[25];
-ry(pi/2) q[26];
-rx(pi) q[26];
-cx q[3],q[26];
-rz(4.855117943314672) q[26];
-cx q[3],q[26];
-cx q[21],q[26];
-rz(4.855117943314672) q[26];
-cx q[21],q[26];
-ry(pi/2) q[27];
-rx(pi) q[27];
-cx q[4],q[27];
-rz(4.855117943314672) q[27];
-cx q[4],q[27];
-cx q[6],q[27];
-rz(4.855117943314672) q[27];
-cx q[6],q[27];
-ry(pi/2) q[28];
-rx(pi) q[28];
-cx q[1],q[28];
-rz(4.855117943314672) q[28];
-cx q[1],q[28];
-cx q[3],q[28];
-rz(4.855117943314672) q[28];
-cx q[3],q[28];
-ry(pi/2) q[29];
-rx(pi) q[29];
-cx q[1],q[29];
-rz(4.855117943314672) q[29];
-cx q[1],q[29];
-cx q[3],q[29];
-rz(4.855117943314672) q[29];
-cx q[3],q[29];
-rx(10.916833501710489) q[29];
-ry(pi/2) q[30];
-rx(pi) q[30];
-cx q[3],q[30];
-rz(4.855117943314672) q[30];
-cx q[3],q[30];
-cx q[18],q[30];
-rz(4.855117943314672) q[30];
-cx q[18],q[30];
-rx(10.916833501710489) q[18];
-ry(pi/2) q[31];
-rx(pi) q[31];
-cx q[12],q[31];
-rz(4.855117943314672) q[31];
-cx q[12],q[31];
-cx q[26],q[31];
-rz(4.855117943314672) q[31];
-cx q[26],q[31];
-ry(pi/2) q[32];
-rx(pi) q[32];
-cx q[0],q[32];
-rz(4.855117943314672) q[32];
-cx q[0],q[32];
-cx q[21],q[32];
-rz(4.855117943314672) q[32];
-cx q[21],q[32];
-ry(pi/2) q[33];
-rx(pi) q[33];
-cx q[5],q[33];
-rz(4.855117943314672) q[33];
-cx q[5],q[33];
-cx q[30],q[33];
-rz(4.855117943314672) q[33];
-cx q[30],q[33];
-rx(10.916833501710489) q[33];
-ry(pi/2) q[34];
-rx(pi) q[34];
-cx q[3],q[34];
-rz(4.855117943314672) q[34];
-cx q[3],q[34];
-cx q[12],q[34];
-rz(4.855117943314672) q[34];
-cx q[12],q[34];
-ry(pi/2) q[35];
-rx(pi) q[35];
-cx q[3],q[35];
-rz(4.855117943314672) q[35];
-cx q[3],q[35];
-cx q[32],q[35];
-rz(4.855117943314672) q[35];
-cx q[32],q[35];
-ry(pi/2) q[36];
-rx(pi) q[36];
-cx q[15],q[36];
-rz(4.855117943314672) q[36];
-cx q[15],q[36];
-cx q[20],q[36];
-rz(4.855117943314672) q[36];
-cx q[20],q[36];
-ry(pi/2) q[37];
-rx(pi) q[37];
-cx q[10],q[37];
-rz(4.855117943314672) q[37];
-cx q[10],q[37];
-cx q[34],q[37];
-rz(4.855117943314672) q[37];
-cx q[34],q[37];
-rx(10.916833501710489) q[34];
-ry(pi/2) q[38];
-rx(pi) q[38];
-cx q[19],q[38];
-rz(4.855117943314672) q[38];
-cx q[19],q[38];
-rx(10.916833501710489) q[19];
-cx q[21],q[38];
-rz(4.855117943314672) q[38];
-cx q[21],q[38];
-ry(pi/2) q[39];
-rx(pi) q[39];
-cx q[3],q[39];
-rz(4.855117943314672) q[39];
-cx q[3],q[39];
-cx q[13],q[39];
-rz(4.855117943314672) q[39];
-cx q[13],q[39];
-ry(pi/2) q[40];
-rx(pi) q[40];
-cx q[3],q[40];
-rz(4.855117943314672) q[40];
-cx q[3],q[40];
-cx q[23],q[40];
-rz(4.855117943314672) q[40];
-cx q[23],q[40];
-ry(pi/2) q[41];
-rx(pi) q[41];
-cx q[10],q[41];
-rz(4.855117943314672) q[41];
-cx q[10],q[41];
-cx q[27],q[41];
-rz(4.855117943314672) q[41];
-cx q[27],q[41];
-ry(pi/2) q[42];
-rx(pi) q[42];
-cx q[0],q[42];
-rz(4.855117943314672) q[42];
-cx q[0],q[42];
-cx q[3],q[42];
-rz(4.855117943314672) q[42];
-cx q[3],q[42];
-ry(pi/2) q[43];
-rx(pi) q[43];
-cx q[3],q[43];
-rz(4.855117943314672) q[43];
-cx q[3],q[43];
-cx q[20],q[43];
-rz(4.855117943314672) q[43];
-cx q[20],q[43];
-rx(10.916833501710489) q[43];
-ry(pi/2) q[44];
-rx(pi) q[44];
-cx q[3],q[44];
-rz(4.855117943314672) q[44];
-cx q[3],q[44];
-cx q[12],q[44];
-rz(4.855117943314672) q[44];
-cx q[12],q[44];
-ry(pi/2) q[45];
-rx(pi) q[45];
-cx q[1],q[45];
-rz(4.855117943314672) q[45];
-cx q[1],q[45];
-cx q[16],q[45];
-rz(4.855117943314672) q[45];
-cx q[16],q[45];
-ry(pi/2) q[46];
-rx(pi) q[46];
-cx q[5],q[46];
-rz(4.855117943314672) q[46];
-cx q[5],q[46];
-cx q[38],q[46];
-rz(4.855117943314672) q[46];
-cx q[38],q[46];
-rx(10.916833501710489) q[38];
-ry(pi/2) q[47];
-rx(pi) q[47];
-cx q[4],q[47];
-rz(4.855117943314672) q[47];
-cx q[4],q[47];
-cx q[17],q[47];
-rz(4.855117943314672) q[47];
-cx q[17],q[47];
-ry(pi/2) q[48];
-rx(pi) q[48];
-cx q[0],q[48];
-rz(4.855117943314672) q[48];
-cx q[0],q[48];
-cx q[30],q[48];
-rz(4.855117943314672) q[48];
-cx q[30],q[48];
-rx(10.916833501710489) q[48];
-ry(pi/2) q[49];
-rx(pi) q[49];
-cx q[3],q[49];
-rz(4.855117943314672) q[49];
-cx q[3],q[49];
-cx q[4],q[49];
-rz(4.855117943314672) q[49];
-cx q[4],q[49];
-rx(10.916833501710489) q[49];
-ry(pi/2) q[50];
-rx(pi) q[50];
-cx q[3],q[50];
-rz(4.855117943314672) q[50];
-cx q[3],q[50];
-cx q[12],q[50];
-rz(4.855117943314672) q[50];
-cx q[12],q[50];
-ry(pi/2) q[51];
-rx(pi) q[51];
-cx q[0],q[51];
-rz(4.855117943314672) q[51];
-cx q[0],q[51];
-cx q[28],q[51];
-rz(4.855117943314672) q[51];
-cx q[28],q[51];
-rx(10.916833501710489) q[51];
-ry(pi/2) q[52];
-rx(pi) q[52];
-cx q[3],q[52];
-rz(4.855117943314672) q[52];
-cx q[3],q[52];
-cx q[10],q[52];
-rz(4.855117943314672) q[52];
-cx q[10],q[52];
-ry(pi/2) q[53];
-rx(pi) q[53];
-cx q[17],q[53];
-rz(4.855117943314672) q[53];
-cx q[17],q[53];
-cx q[21],q[53];
-rz(4.855117943314672) q[53];
-cx q[21],q[53];
-ry(pi/2) q[54];
-rx(pi) q[54];
-cx q[24],q[54];
-rz(4.855117943314672) q[54];
-cx q[24],q[54];
-cx q[28],q[54];
-rz(4.855117943314672) q[54];
-cx q[28],q[54];
-rx(10.916833501710489) q[54];
-ry(pi/2) q[55];
-rx(pi) q[55];
-cx q[9],q[55];
-rz(4.855117943314672) q[55];
-cx q[9],q[55];
-cx q[15],q[55];
-rz(4.855117943314672) q[55];
-cx q[15],q[55];
-ry(pi/2) q[56];
-rx(pi) q[56];
-cx q[13],q[56];
-rz(4.855117943314672) q[56];
-cx q[13],q[56];
-cx q[45],q[56];
-rz(4.855117943314672) q[56];
-cx q[45],q[56];
-rx(10.916833501710489) q[45];
-ry(pi/2) q[57];
-rx(pi) q[57];
-cx q[1],q[57];
-rz(4.855117943314672) q[57];
-cx q[1],q[57];
-cx q[3],q[57];
-rz(4.855117943314672) q[57];
-cx q[3],q[57];
-ry(pi/2) q[58];
-rx(pi) q[58];
-cx q[24],q[58];
-rz(4.855117943314672) q[58];
-cx q[24],q[58];
-cx q[28],q[58];
-rz(4.855117943314672) q[58];
-cx q[28],q[58];
-rx(10.916833501710489) q[58];
-ry(pi/2) q[59];
-rx(pi) q[59];
-cx q[16],q[59];
-rz(4.855117943314672) q[59];
-cx q[16],q[59];
-cx q[32],q[59];
-rz(4.855117943314672) q[59];
-cx q[32],q[59];
-ry(pi/2) q[60];
-rx(pi) q[60];
-cx q[1],q[60];
-rz(4.855117943314672) q[60];
-cx q[1],q[60];
-cx q[7],q[60];
-rz(4.855117943314672) q[60];
-cx q[7],q[60];
-ry(pi/2) q[61];
-rx(pi) q[61];
-cx q[4],q[61];
-rz(4.855117943314672) q[61];
-cx q[4],q[61];
-cx q[7],q[61];
-rz(4.855117943314672) q[61];
-cx q[7],q[61];
-rx(10.916833501710489) q[61];
-ry(pi/2) q[62];
-rx(pi) q[62];
-cx q[0],q[62];
-rz(4.855117943314672) q[62];
-cx q[0],q[62];
-cx q[17],q[62];
-rz(4.855117943314672) q[62];
-cx q[17],q[62];
-ry(pi/2) q[63];
-rx(pi) q[63];
-cx q[12],q[63];
-rz(4.855117943314672) q[63];
-cx q[12],q[63];
-cx q[17],q[63];
-rz(4.855117943314672) q[63];
-cx q[17],q[63];
-ry(pi/2) q[64];
-rx(pi) q[64];
-cx q[0],q[64];
-rz(4.855117943314672) q[64];
-cx q[0],q[64];
-cx q[10],q[64];
-rz(4.855117943314672) q[64];
-cx q[10],q[64];
-rx(10.916833501710489) q[64];
-ry(pi/2) q[65];
-rx(pi) q[65];
-cx q[5],q[65];
-rz(4.855117943314672) q[65];
-cx q[5],q[65];
-cx q[23],q[65];
-rz(4.855117943314672) q[65];
-cx q[23],q[65];
-rx(10.916833501710489) q[23];
-rx(10.916833501710489) q[65];
-ry(pi/2) q[66];
-rx(pi) q[66];
-cx q[17],q[66];
-rz(4.855117943314672) q[66];
-cx q[17],q[66];
-rx(10.916833501710489) q[17];
-cx q[47],q[66];
-rz(4.855117943314672) q[66];
-cx q[47],q[66];
-rx(10.916833501710489) q[47];
-rx(10.916833501710489) q[66];
-ry(pi/2) q[67];
-rx(pi) q[67];
-cx q[41],q[67];
-rz(4.855117943314672) q[67];
-cx q[41],q[67];
-cx q[56],q[67];
-rz(4.855117943314672) q[67];
-cx q[56],q[67];
-rx(10.916833501710489) q[67];
-ry(pi/2) q[68];
-rx(pi) q[68];
-cx q[13],q[68];
-rz(4.855117943314672) q[68];
-cx q[13],q[68];
-cx q[32],q[68];
-rz(4.855117943314672) q[68];
-cx q[32],q[68];
-ry(pi/2) q[69];
-rx(pi) q[69];
-cx q[6],q[69];
-rz(4.855117943314672) q[69];
-cx q[6],q[69];
-cx q[59],q[69];
-rz(4.855117943314672) q[69];
-cx q[59],q[69];
-ry(pi/2) q[70];
-rx(pi) q[70];
-cx q[3],q[70];
-rz(4.855117943314672) q[70];
-cx q[3],q[70];
-cx q[15],q[70];
-rz(4.855117943314672) q[70];
-cx q[15],q[70];
-ry(pi/2) q[71];
-rx(pi) q[71];
-cx q[3],q[71];
-rz(4.855117943314672) q[71];
-cx q[3],q[71];
-cx q[53],q[71];
-rz(4.855117943314672) q[71];
-cx q[53],q[71];
-rx(10.916833501710489) q[71];
-ry(pi/2) q[72];
-rx(pi) q[72];
-cx q[27],q[72];
-rz(4.855117943314672) q[72];
-cx q[27],q[72];
-cx q[44],q[72];
-rz(4.855117943314672) q[72];
-cx q[44],q[72];
-rx(10.916833501710489) q[44];
-rx(10.916833501710489) q[72];
-ry(pi/2) q[73];
-rx(pi) q[73];
-cx q[16],q[73];
-rz(4.855117943314672) q[73];
-cx q[16],q[73];
-cx q[59],q[73];
-rz(4.855117943314672) q[73];
-cx q[59],q[73];
-ry(pi/2) q[74];
-rx(pi) q[74];
-cx q[56],q[74];
-rz(4.855117943314672) q[74];
-cx q[56],q[74];
-cx q[63],q[74];
-rz(4.855117943314672) q[74];
-cx q[63],q[74];
-rx(10.916833501710489) q[74];
-ry(pi/2) q[75];
-rx(pi) q[75];
-cx q[0],q[75];
-rz(4.855117943314672) q[75];
-cx q[0],q[75];
-cx q[21],q[75];
-rz(4.855117943314672) q[75];
-cx q[21],q[75];
-rx(10.916833501710489) q[75];
-ry(pi/2) q[76];
-rx(pi) q[76];
-cx q[5],q[76];
-rz(4.855117943314672) q[76];
-cx q[5],q[76];
-cx q[6],q[76];
-rz(4.855117943314672) q[76];
-cx q[6],q[76];
-rx(10.916833501710489) q[76];
-ry(pi/2) q[77];
-rx(pi) q[77];
-cx q[3],q[77];
-rz(4.855117943314672) q[77];
-cx q[3],q[77];
-cx q[30],q[77];
-rz(4.855117943314672) q[77];
-cx q[30],q[77];
-rx(10.916833501710489) q[30];
-ry(pi/2) q[78];
-rx(pi) q[78];
-cx q[42],q[78];
-rz(4.855117943314672) q[78];
-cx q[42],q[78];
-cx q[60],q[78];
-rz(4.855117943314672) q[78];
-cx q[60],q[78];
-rx(10.916833501710489) q[78];
-ry(pi/2) q[79];
-rx(pi) q[79];
-cx q[6],q[79];
-rz(4.855117943314672) q[79];
-cx q[6],q[79];
-cx q[50],q[79];
-rz(4.855117943314672) q[79];
-cx q[50],q[79];
-rx(10.916833501710489) q[79];
-ry(pi/2) q[80];
-rx(pi) q[80];
-cx q[9],q[80];
-rz(4.855117943314672) q[80];
-cx q[9],q[80];
-rx(10.916833501710489) q[9];
-cx q[15],q[80];
-rz(4.855117943314672) q[80];
-cx q[15],q[80];
-rx(10.916833501710489) q[80];
-ry(pi/2) q[81];
-rx(pi) q[81];
-cx q[21],q[81];
-rz(4.855117943314672) q[81];
-cx q[21],q[81];
-cx q[77],q[81];
-rz(4.855117943314672) q[81];
-cx q[77],q[81];
-rx(10.916833501710489) q[77];
-ry(pi/2) q[82];
-rx(pi) q[82];
-cx q[0],q[82];
-rz(4.855117943314672) q[82];
-cx q[0],q[82];
-cx q[56],q[82];
-rz(4.855117943314672) q[82];
-cx q[56],q[82];
-rx(10.916833501710489) q[82];
-ry(pi/2) q[83];
-rx(pi) q[83];
-cx q[8],q[83];
-rz(4.855117943314672) q[83];
-cx q[8],q[83];
-rx(10.916833501710489) q[8];
-cx q[68],q[83];
-rz(4.855117943314672) q[83];
-cx q[68],q[83];
-rx(10.916833501710489) q[68];
-rx(10.916833501710489) q[83];
-ry(pi/2) q[84];
-rx(pi) q[84];
-cx q[70],q[84];
-rz(4.855117943314672) q[84];
-cx q[70],q[84];
-rx(10.916833501710489) q[70];
-cx q[73],q[84];
-rz(4.855117943314672) q[84];
-cx q[73],q[84];
-rx(10.916833501710489) q[73];
-rx(10.916833501710489) q[84];
-ry(pi/2) q[85];
-rx(pi) q[85];
-cx q[37],q[85];
-rz(4.855117943314672) q[85];
-cx q[37],q[85];
-cx q[59],q[85];
-rz(4.855117943314672) q[85];
-cx q[59],q[85];
-rx(10.916833501710489) q[59];
-rx(10.916833501710489) q[85];
-ry(pi/2) q[86];
-rx(pi) q[86];
-cx q[24],q[86];
-rz(4.855117943314672) q[86];
-cx q[24],q[86];
-cx q[53],q[86];
-rz(4.855117943314672) q[86];
-cx q[53],q[86];
-rx(10.916833501710489) q[86];
-ry(pi/2) q[87];
-rx(pi) q[87];
-cx q[28],q[87];
-rz(4.855117943314672) q[87];
-cx q[28],q[87];
-cx q[32],q[87];
-rz(4.855117943314672) q[87];
-cx q[32],q[87];
-rx(10.916833501710489) q[87];
-ry(pi/2) q[88];
-rx(pi) q[88];
-cx q[3],q[88];
-rz(4.855117943314672) q[88];
-cx q[3],q[88];
-cx q[60],q[88];
-rz(4.855117943314672) q[88];
-cx q[60],q[88];
-rx(10.916833501710489) q[60];
-rx(10.916833501710489) q[88];
-ry(pi/2) q[89];
-rx(pi) q[89];
-cx q[2],q[89];
-rz(4.855117943314672) q[89];
-cx q[2],q[89];
-rx(10.916833501710489) q[2];
-cx q[5],q[89];
-rz(4.855117943314672) q[89];
-cx q[5],q[89];
-ry(pi/2) q[90];
-rx(pi) q[90];
-cx q[15],q[90];
-rz(4.855117943314672) q[90];
-cx q[15],q[90];
-cx q[27],q[90];
-rz(4.855117943314672) q[90];
-cx q[27],q[90];
-rx(10.916833501710489) q[90];
-ry(pi/2) q[91];
-rx(pi) q[91];
-cx q[0],q[91];
-rz(4.855117943314672) q[91];
-cx q[0],q[91];
-cx q[6],q[91];
-rz(4.855117943314672) q[91];
-cx q[6],q[91];
-rx(10.916833501710489) q[6];
-ry(pi/2) q[92];
-rx(pi) q[92];
-cx q[15],q[92];
-rz(4.855117943314672) q[92];
-cx q[15],q[92];
-cx q[89],q[92];
-rz(4.855117943314672) q[92];
-cx q[89],q[92];
-rx(10.916833501710489) q[89];
-ry(pi/2) q[93];
-rx(pi) q[93];
-cx q[0],q[93];
-rz(4.855117943314672) q[93];
-cx q[0],q[93];
-cx q[32],q[93];
-rz(4.855117943314672) q[93];
-cx q[32],q[93];
-rx(10.916833501710489) q[93];
-ry(pi/2) q[94];
-rx(pi) q[94];
-cx q[36],q[94];
-rz(4.855117943314672) q[94];
-cx q[36],q[94];
-cx q[55],q[94];
-rz(4.855117943314672) q[94];
-cx q[55],q[94];
-rx(10.916833501710489) q[55];
-ry(pi/2) q[95];
-rx(pi) q[95];
-cx q[5],q[95];
-rz(4.855117943314672) q[95];
-cx q[5],q[95];
-cx q[27],q[95];
-rz(4.855117943314672) q[95];
-cx q[27],q[95];
-rx(10.916833501710489) q[27];
-rx(10.916833501710489) q[95];
-ry(pi/2) q[96];
-rx(pi) q[96];
-cx q[56],q[96];
-rz(4.855117943314672) q[96];
-cx q[56],q[96];
-rx(10.916833501710489) q[56];
-cx q[92],q[96];
-rz(4.855117943314672) q[96];
-cx q[92],q[96];
-rx(10.916833501710489) q[96];
-ry(pi/2) q[97];
-rx(pi) q[97];
-cx q[1],q[97];
-rz(4.855117943314672) q[97];
-cx q[1],q[97];
-cx q[7],q[97];
-rz(4.855117943314672) q[97];
-cx q[7],q[97];
-rx(10.916833501710489) q[97];
-ry(pi/2) q[98];
-rx(pi) q[98];
-cx q[10],q[98];
-rz(4.855117943314672) q[98];
-cx q[10],q[98];
-rx(10.916833501710489) q[10];
-cx q[21],q[98];
-rz(4.855117943314672) q[98];
-cx q[21],q[98];
-rx(10.916833501710489) q[98];
-ry(pi/2) q[99];
-rx(pi) q[99];
-cx q[4],q[99];
-rz(4.855117943314672) q[99];
-cx q[4],q[99];
-cx q[41],q[99];
-rz(4.855117943314672) q[99];
-cx q[41],q[99];
-rx(10.916833501710489) q[41];
-rx(10.916833501710489) q[99];
-ry(pi/2) q[100];
-rx(pi) q[100];
-cx q[3],q[100];
-rz(4.855117943314672) q[100];
-cx q[3],q[100];
-cx q[25],q[100];
-rz(4.855117943314672) q[100];
-cx q[25],q[100];
-rx(10.916833501710489) q[25];
-rx(10.916833501710489) q[100];
-ry(pi/2) q[101];
-rx(pi) q[101];
-cx q[16],q[101];
-rz(4.855117943314672) q[101];
-cx q[16],q[101];
-cx q[50],q[101];
-rz(4.855117943314672) q[101];
-cx q[50],q[101];
-rx(10.916833501710489) q[101];
-ry(pi/2) q[102];
-rx(pi) q[102];
-cx q[3],q[102];
-rz(4.855117943314672) q[102];
-cx q[3],q[102];
-cx q[4],q[102];
-rz(4.855117943314672) q[102];
-cx q[4],q[102];
-rx(10.916833501710489) q[102];
-ry(pi/2) q[103];
-rx(pi) q[103];
-cx q[16],q[103];
-rz(4.855117943314672) q[103];
-cx q[16],q[103];
-rx(10.916833501710489) q[16];
-cx q[57],q[103];
-rz(4.855117943314672) q[103];
-cx q[57],q[103];
-rx(10.916833501710489) q[57];
-rx(10.916833501710489) q[103];
-ry(pi/2) q[104];
-rx(pi) q[104];
-cx q[7],q[104];
-rz(4.855117943314672) q[104];
-cx q[7],q[104];
-rx(10.916833501710489) q[7];
-cx q[13],q[104];
-rz(4.855117943314672) q[104];
-cx q[13],q[104];
-rx(10.916833501710489) q[13];
-ry(pi/2) q[105];
-rx(pi) q[105];
-cx q[26],q[105];
-rz(4.855117943314672) q[105];
-cx q[26],q[105];
-cx q[28],q[105];
-rz(4.855117943314672) q[105];
-cx q[28],q[105];
-rx(10.916833501710489) q[105];
-ry(pi/2) q[106];
-rx(pi) q[106];
-cx q[5],q[106];
-rz(4.855117943314672) q[106];
-cx q[5],q[106];
-cx q[36],q[106];
-rz(4.855117943314672) q[106];
-cx q[36],q[106];
-rx(10.916833501710489) q[106];
-ry(pi/2) q[107];
-rx(pi) q[107];
-cx q[3],q[107];
-rz(4.855117943314672) q[107];
-cx q[3],q[107];
-cx q[31],q[107];
-rz(4.855117943314672) q[107];
-cx q[31],q[107];
-rx(10.916833501710489) q[107];
-ry(pi/2) q[108];
-rx(pi) q[108];
-cx q[15],q[108];
-rz(4.855117943314672) q[108];
-cx q[15],q[108];
-cx q[31],q[108];
-rz(4.855117943314672) q[108];
-cx q[31],q[108];
-rx(10.916833501710489) q[31];
-rx(10.916833501710489) q[108];
-ry(pi/2) q[109];
-rx(pi) q[109];
-cx q[5],q[109];
-rz(4.855117943314672) q[109];
-cx q[5],q[109];
-cx q[39],q[109];
-rz(4.855117943314672) q[109];
-cx q[39],q[109];
-rx(10.916833501710489) q[39];
-ry(pi/2) q[110];
-rx(pi) q[110];
-cx q[3],q[110];
-rz(4.855117943314672) q[110];
-cx q[3],q[110];
-cx q[24],q[110];
-rz(4.855117943314672) q[110];
-cx q[24],q[110];
-rx(10.916833501710489) q[24];
-ry(pi/2) q[111];
-rx(pi) q[111];
-cx q[3],q[111];
-rz(4.855117943314672) q[111];
-cx q[3],q[111];
-cx q[21],q[111];
-rz(4.855117943314672) q[111];
-cx q[21],q[111];
-rx(10.916833501710489) q[111];
-ry(pi/2) q[112];
-rx(pi) q[112];
-cx q[21],q[112];
-rz(4.855117943314672) q[112];
-cx q[21],q[112];
-rx(10.916833501710489) q[21];
-cx q[36],q[112];
-rz(4.855117943314672) q[112];
-cx q[36],q[112];
-rx(10.916833501710489) q[36];
-rx(10.916833501710489) q[112];
-ry(pi/2) q[113];
-rx(pi) q[113];
-cx q[1],q[113];
-rz(4.855117943314672) q[113];
-cx q[1],q[113];
-rx(10.916833501710489) q[1];
-cx q[3],q[113];
-rz(4.855117943314672) q[113];
-cx q[3],q[113];
-rx(10.916833501710489) q[113];
-ry(pi/2) q[114];
-rx(pi) q[114];
-cx q[104],q[114];
-rz(4.855117943314672) q[114];
-cx q[104],q[114];
-cx q[110],q[114];
-rz(4.855117943314672) q[114];
-cx q[110],q[114];
-rx(10.916833501710489) q[110];
-rx(10.916833501710489) q[114];
-ry(pi/2) q[115];
-rx(pi) q[115];
-cx q[15],q[115];
-rz(4.855117943314672) q[115];
-cx q[15],q[115];
-cx q[92],q[115];
-rz(4.855117943314672) q[115];
-cx q[92],q[115];
-rx(10.916833501710489) q[92];
-rx(10.916833501710489) q[115];
-ry(pi/2) q[116];
-rx(pi) q[116];
-cx q[28],q[116];
-rz(4.855117943314672) q[116];
-cx q[28],q[116];
-rx(10.916833501710489) q[28];
-cx q[42],q[116];
-rz(4.855117943314672) q[116];
-cx q[42],q[116];
-rx(10.916833501710489) q[42];
-rx(10.916833501710489) q[116];
-ry(pi/2) q[117];
-rx(pi) q[117];
-cx q[26],q[117];
-rz(4.855117943314672) q[117];
-cx q[26],q[117];
-rx(10.916833501710489) q[26];
-cx q[32],q[117];
-rz(4.855117943314672) q[117];
-cx q[32],q[117];
-rx(10.916833501710489) q[117];
-ry(pi/2) q[118];
-rx(pi) q[118];
-cx q[5],q[118];
-rz(4.855117943314672) q[118];
-cx q[5],q[118];
-rx(10.916833501710489) q[5];
-cx q[15],q[118];
-rz(4.855117943314672) q[118];
-cx q[15],q[118];
-rx(10.916833501710489) q[15];
-rx(10.916833501710489) q[118];
-ry(pi/2) q[119];
-rx(pi) q[119];
-cx q[40],q[119];
-rz(4.855117943314672) q[119];
-cx q[40],q[119];
-rx(10.916833501710489) q[40];
-cx q[69],q[119];
-rz(4.855117943314672) q[119];
-cx q[69],q[119];
-rx(10.916833501710489) q[69];
-rx(10.916833501710489) q[119];
-ry(pi/2) q[120];
-rx(pi) q[120];
-cx q[46],q[120];
-rz(4.855117943314672) q[120];
-cx q[46],q[120];
-rx(10.916833501710489) q[46];
-cx q[94],q[120];
-rz(4.855117943314672) q[120];
-cx q[94],q[120];
-rx(10.916833501710489) q[94];
-rx(10.916833501710489) q[120];
-ry(pi/2) q[121];
-rx(pi) q[121];
-cx q[20],q[121];
-rz(4.855117943314672) q[121];
-cx q[20],q[121];
-rx(10.916833501710489) q[20];
-cx q[104],q[121];
-rz(4.855117943314672) q[121];
-cx q[104],q[121];
-rx(10.916833501710489) q[104];
-rx(10.916833501710489) q[121];
-ry(pi/2) q[122];
-rx(pi) q[122];
-cx q[63],q[122];
-rz(4.855117943314672) q[122];
-cx q[63],q[122];
-rx(10.916833501710489) q[63];
-cx q[81],q[122];
-rz(4.855117943314672) q[122];
-cx q[81],q[122];
-rx(10.916833501710489) q[122];
-ry(pi/2) q[123];
-rx(pi) q[123];
-cx q[0],q[123];
-rz(4.855117943314672) q[123];
-cx q[0],q[123];
-cx q[52],q[123];
-rz(4.855117943314672) q[123];
-cx q[52],q[123];
-rx(10.916833501710489) q[52];
-ry(pi/2) q[124];
-rx(pi) q[124];
-cx q[53],q[124];
-rz(4.855117943314672) q[124];
-cx q[53],q[124];
-rx(10.916833501710489) q[53];
-cx q[81],q[124];
-rz(4.855117943314672) q[124];
-cx q[81],q[124];
-rx(10.916833501710489) q[81];
-rx(10.916833501710489) q[124];
-ry(pi/2) q[125];
-rx(pi) q[125];
-cx q[3],q[125];
-rz(4.855117943314672) q[125];
-cx q[3],q[125];
-cx q[109],q[125];
-rz(4.855117943314672) q[125];
-cx q[109],q[125];
-rx(10.916833501710489) q[125];
-ry(pi/2) q[126];
-rx(pi) q[126];
-cx q[0],q[126];
-rz(4.855117943314672) q[126];
-cx q[0],q[126];
-rx(10.916833501710489) q[0];
-cx q[0],q[1];
-rz(1.0617804926614185) q[1];
-cx q[0],q[1];
-cx q[0],q[2];
-rz(1.0617804926614185) q[2];
-cx q[0],q[2];
-cx q[2],q[89];
-cx q[12],q[126];
-rz(1.0617804926614185) q[89];
-cx q[2],q[89];
-rx(10.489892349334573) q[2];
-rz(4.855117943314672) q[126];
-cx q[12],q[126];
-rx(10.916833501710489) q[12];
-rx(10.916833501710489) q[126];
-ry(pi/2) q[127];
-rx(pi) q[127];
-cx q[4],q[127];
-rz(4.855117943314672) q[127];
-cx q[4],q[127];
-rx(10.916833501710489) q[4];
-cx q[62],q[127];
-rz(4.855117943314672) q[127];
-cx q[62],q[127];
-rx(10.916833501710489) q[127];
-ry(pi/2) q[128];
-rx(pi) q[128];
-cx q[62],q[128];
-rz(4.855117943314672) q[128];
-cx q[62],q[128];
-rx(10.916833501710489) q[62];
-cx q[109],q[128];
-rz(4.855117943314672) q[128];
-cx q[109],q[128];
-rx(10.916833501710489) q[128];
-ry(pi/2) q[129];
-rx(pi) q[129];
-cx q[50],q[129];
-rz(4.855117943314672) q[129];
-cx q[50],q[129];
-rx(10.916833501710489) q[50];
-cx q[91],q[129];
-rz(4.855117943314672) q[129];
-cx q[91],q[129];
-rx(10.916833501710489) q[91];
-rx(10.916833501710489) q[129];
-ry(pi/2) q[130];
-rx(pi) q[130];
-cx q[35],q[130];
-rz(4.855117943314672) q[130];
-cx q[35],q[130];
-rx(10.916833501710489) q[35];
-cx q[109],q[130];
-rz(4.855117943314672) q[130];
-cx q[109],q[130];
-rx(10.916833501710489) q[109];
-rx(10.916833501710489) q[130];
-ry(pi/2) q[131];
-rx(pi) q[131];
-cx q[32],q[131];
-rz(4.855117943314672) q[131];
-cx q[32],q[131];
-rx(10.916833501710489) q[32];
-cx q[123],q[131];
-rz(4.855117943314672) q[131];
-cx q[123],q[131];
-rx(10.916833501710489) q[123];
-rx(10.916833501710489) q[131];
-ry(pi/2) q[132];
-rx(pi) q[132];
-cx q[3],q[132];
-rz(4.855117943314672) q[132];
-cx q[3],q[132];
-rx(10.916833501710489) q[3];
-cx q[0],q[3];
-rz(1.0617804926614185) q[3];
-cx q[0],q[3];
-cx q[0],q[15];
-cx q[1],q[3];
-rz(1.0617804926614185) q[3];
-cx q[1],q[3];
-cx q[1],q[4];
-rz(1.0617804926614185) q[4];
-cx q[1],q[4];
-cx q[1],q[5];
-cx q[3],q[4];
-rz(1.0617804926614185) q[4];
-cx q[3],q[4];
-cx q[4],q[6];
-rz(1.0617804926614185) q[5];
-cx q[1],q[5];
-cx q[1],q[9];
-cx q[3],q[5];
-rz(1.0617804926614185) q[5];
-cx q[3],q[5];
-cx q[3],q[7];
-rz(1.0617804926614185) q[6];
-cx q[4],q[6];
-cx q[5],q[6];
-rz(1.0617804926614185) q[6];
-cx q[5],q[6];
-rz(1.0617804926614185) q[7];
-cx q[3],q[7];
-cx q[3],q[8];
-cx q[4],q[7];
-rz(1.0617804926614185) q[7];
-cx q[4],q[7];
-cx q[4],q[10];
-rz(1.0617804926614185) q[8];
-cx q[3],q[8];
-cx q[5],q[8];
-rz(1.0617804926614185) q[8];
-cx q[5],q[8];
-cx q[5],q[11];
-cx q[8],q[83];
-rz(1.0617804926614185) q[9];
-cx q[1],q[9];
-cx q[1],q[17];
-cx q[3],q[9];
-rz(1.0617804926614185) q[9];
-cx q[3],q[9];
-cx q[3],q[12];
-rz(1.0617804926614185) q[10];
-cx q[4],q[10];
-cx q[4],q[13];
-cx q[6],q[10];
-rz(1.0617804926614185) q[10];
-cx q[6],q[10];
-rz(1.0617804926614185) q[11];
-cx q[5],q[11];
-cx q[6],q[11];
-rz(1.0617804926614185) q[11];
-cx q[6],q[11];
-rx(10.489892349334573) q[11];
-rz(1.0617804926614185) q[12];
-cx q[3],q[12];
-cx q[3],q[14];
-cx q[5],q[12];
-rz(1.0617804926614185) q[12];
-cx q[5],q[12];
-rz(1.0617804926614185) q[13];
-cx q[4],q[13];
-cx q[5],q[13];
-rz(1.0617804926614185) q[13];
-cx q[5],q[13];
-rz(1.0617804926614185) q[14];
-cx q[3],q[14];
-cx q[4],q[14];
-rz(1.0617804926614185) q[14];
-cx q[4],q[14];
-rx(10.489892349334573) q[14];
-rz(1.0617804926614185) q[15];
-cx q[0],q[15];
-cx q[0],q[16];
-cx q[3],q[15];
-rz(1.0617804926614185) q[15];
-cx q[3],q[15];
-rz(1.0617804926614185) q[16];
-cx q[0],q[16];
-cx q[0],q[20];
-cx q[3],q[16];
-rz(1.0617804926614185) q[16];
-cx q[3],q[16];
-rz(1.0617804926614185) q[17];
-cx q[1],q[17];
-cx q[1],q[28];
-cx q[3],q[17];
-rz(1.0617804926614185) q[17];
-cx q[3],q[17];
-cx q[3],q[18];
-rz(1.0617804926614185) q[18];
-cx q[3],q[18];
-cx q[3],q[19];
-cx q[4],q[18];
-rz(1.0617804926614185) q[18];
-cx q[4],q[18];
-cx q[4],q[21];
-rz(1.0617804926614185) q[19];
-cx q[3],q[19];
-cx q[3],q[22];
-cx q[7],q[19];
-rz(1.0617804926614185) q[19];
-cx q[7],q[19];
-cx q[19],q[38];
-rz(1.0617804926614185) q[20];
-cx q[0],q[20];
-cx q[0],q[32];
-cx q[15],q[20];
-rz(1.0617804926614185) q[20];
-cx q[15],q[20];
-rz(1.0617804926614185) q[21];
-cx q[4],q[21];
-cx q[4],q[27];
-cx q[15],q[21];
-rz(1.0617804926614185) q[21];
-cx q[15],q[21];
-cx q[15],q[36];
-rz(1.0617804926614185) q[22];
-cx q[3],q[22];
-cx q[3],q[23];
-cx q[9],q[22];
-rz(1.0617804926614185) q[22];
-cx q[9],q[22];
-cx q[9],q[55];
-rx(10.489892349334573) q[22];
-rz(1.0617804926614185) q[23];
-cx q[3],q[23];
-cx q[3],q[24];
-cx q[17],q[23];
-rz(1.0617804926614185) q[23];
-cx q[17],q[23];
-rz(1.0617804926614185) q[24];
-cx q[3],q[24];
-cx q[3],q[25];
-cx q[5],q[24];
-rz(1.0617804926614185) q[24];
-cx q[5],q[24];
-cx q[5],q[33];
-cx q[24],q[54];
-rz(1.0617804926614185) q[25];
-cx q[3],q[25];
-cx q[3],q[26];
-cx q[12],q[25];
-rz(1.0617804926614185) q[25];
-cx q[12],q[25];
-cx q[12],q[31];
-rz(1.0617804926614185) q[26];
-cx q[3],q[26];
-cx q[21],q[26];
-rz(1.0617804926614185) q[26];
-cx q[21],q[26];
-rz(1.0617804926614185) q[27];
-cx q[4],q[27];
-cx q[4],q[47];
-cx q[6],q[27];
-rz(1.0617804926614185) q[27];
-cx q[6],q[27];
-cx q[6],q[69];
-rz(1.0617804926614185) q[28];
-cx q[1],q[28];
-cx q[1],q[29];
-cx q[3],q[28];
-rz(1.0617804926614185) q[28];
-cx q[3],q[28];
-rz(1.0617804926614185) q[29];
-cx q[1],q[29];
-cx q[1],q[45];
-cx q[3],q[29];
-rz(1.0617804926614185) q[29];
-cx q[3],q[29];
-cx q[3],q[30];
-rx(10.489892349334573) q[29];
-rz(1.0617804926614185) q[30];
-cx q[3],q[30];
-cx q[3],q[34];
-cx q[18],q[30];
-rz(1.0617804926614185) q[30];
-cx q[18],q[30];
-rx(10.489892349334573) q[18];
-rz(1.0617804926614185) q[31];
-cx q[12],q[31];
-cx q[26],q[31];
-rz(1.0617804926614185) q[31];
-cx q[26],q[31];
-cx q[26],q[105];
-rz(1.0617804926614185) q[32];
-cx q[0],q[32];
-cx q[0],q[42];
-cx q[21],q[32];
-rz(1.0617804926614185) q[32];
-cx q[21],q[32];
-rz(1.0617804926614185) q[33];
-cx q[5],q[33];
-cx q[5],q[46];
-cx q[30],q[33];
-rz(1.0617804926614185) q[33];
-cx q[30],q[33];
-rx(10.489892349334573) q[33];
-rz(1.0617804926614185) q[34];
-cx q[3],q[34];
-cx q[3],q[35];
-cx q[12],q[34];
-rz(1.0617804926614185) q[34];
-cx q[12],q[34];
-rz(1.0617804926614185) q[35];
-cx q[3],q[35];
-cx q[3],q[39];
-cx q[32],q[35];
-rz(1.0617804926614185) q[35];
-cx q[32],q[35];
-cx q[35],q[130];
-rz(1.0617804926614185) q[36];
-cx q[15],q[36];
-cx q[20],q[36];
-rz(1.0617804926614185) q[36];
-cx q[20],q[36];
-cx q[36],q[94];
-cx q[37],q[132];
-rz(1.0617804926614185) q[38];
-cx q[19],q[38];
-rx(10.489892349334573) q[19];
-cx q[21],q[38];
-rz(1.0617804926614185) q[38];
-cx q[21],q[38];
-rz(1.0617804926614185) q[39];
-cx q[3],q[39];
-cx q[3],q[40];
-cx q[13],q[39];
-rz(1.0617804926614185) q[39];
-cx q[13],q[39];
-cx q[13],q[56];
-rz(1.0617804926614185) q[40];
-cx q[3],q[40];
-cx q[23],q[40];
-rz(1.0617804926614185) q[40];
-cx q[23],q[40];
-cx q[40],q[119];
-rz(1.0617804926614185) q[42];
-cx q[0],q[42];
-cx q[0],q[48];
-cx q[3],q[42];
-rz(1.0617804926614185) q[42];
-cx q[3],q[42];
-cx q[3],q[43];
-cx q[42],q[78];
-rz(1.0617804926614185) q[43];
-cx q[3],q[43];
-cx q[3],q[44];
-cx q[20],q[43];
-rz(1.0617804926614185) q[43];
-cx q[20],q[43];
-cx q[20],q[121];
-rx(10.489892349334573) q[43];
-rz(1.0617804926614185) q[44];
-cx q[3],q[44];
-cx q[3],q[49];
-cx q[12],q[44];
-rz(1.0617804926614185) q[44];
-cx q[12],q[44];
-rz(1.0617804926614185) q[45];
-cx q[1],q[45];
-cx q[1],q[57];
-cx q[16],q[45];
-rz(1.0617804926614185) q[45];
-cx q[16],q[45];
-cx q[16],q[59];
-rz(1.0617804926614185) q[46];
-cx q[5],q[46];
-cx q[5],q[65];
-cx q[38],q[46];
-rz(1.0617804926614185) q[46];
-cx q[38],q[46];
-rx(10.489892349334573) q[38];
-cx q[46],q[120];
-rz(1.0617804926614185) q[47];
-cx q[4],q[47];
-cx q[17],q[47];
-rz(1.0617804926614185) q[47];
-cx q[17],q[47];
-cx q[17],q[53];
-rz(1.0617804926614185) q[48];
-cx q[0],q[48];
-cx q[0],q[51];
-cx q[30],q[48];
-rz(1.0617804926614185) q[48];
-cx q[30],q[48];
-rx(10.489892349334573) q[48];
-rz(1.0617804926614185) q[49];
-cx q[3],q[49];
-cx q[3],q[50];
-cx q[4],q[49];
-rz(1.0617804926614185) q[49];
-cx q[4],q[49];
-cx q[4],q[61];
-rx(10.489892349334573) q[49];
-rz(1.0617804926614185) q[50];
-cx q[3],q[50];
-cx q[3],q[52];
-cx q[12],q[50];
-rz(1.0617804926614185) q[50];
-cx q[12],q[50];
-cx q[12],q[63];
-rz(1.0617804926614185) q[51];
-cx q[0],q[51];
-cx q[0],q[62];
-cx q[28],q[51];
-rz(1.0617804926614185) q[51];
-cx q[28],q[51];
-rx(10.489892349334573) q[51];
-rz(1.0617804926614185) q[52];
-cx q[3],q[52];
-rz(1.0617804926614185) q[53];
-cx q[17],q[53];
-cx q[21],q[53];
-rz(1.0617804926614185) q[53];
-cx q[21],q[53];
-rz(1.0617804926614185) q[54];
-cx q[24],q[54];
-cx q[24],q[58];
-cx q[28],q[54];
-rz(1.0617804926614185) q[54];
-cx q[28],q[54];
-rx(10.489892349334573) q[54];
-rz(1.0617804926614185) q[55];
-cx q[9],q[55];
-cx q[9],q[80];
-cx q[15],q[55];
-rz(1.0617804926614185) q[55];
-cx q[15],q[55];
-rz(1.0617804926614185) q[56];
-cx q[13],q[56];
-cx q[13],q[68];
-cx q[45],q[56];
-rz(1.0617804926614185) q[56];
-cx q[45],q[56];
-rx(10.489892349334573) q[45];
-rz(1.0617804926614185) q[57];
-cx q[1],q[57];
-cx q[1],q[60];
-cx q[3],q[57];
-rz(1.0617804926614185) q[57];
-cx q[3],q[57];
-cx q[3],q[70];
-rz(1.0617804926614185) q[58];
-cx q[24],q[58];
-cx q[24],q[86];
-cx q[28],q[58];
-rz(1.0617804926614185) q[58];
-cx q[28],q[58];
-cx q[28],q[87];
-rx(10.489892349334573) q[58];
-rz(1.0617804926614185) q[59];
-cx q[16],q[59];
-cx q[16],q[73];
-cx q[32],q[59];
-rz(1.0617804926614185) q[59];
-cx q[32],q[59];
-rz(1.0617804926614185) q[60];
-cx q[1],q[60];
-cx q[1],q[97];
-cx q[7],q[60];
-rz(1.0617804926614185) q[60];
-cx q[7],q[60];
-rz(1.0617804926614185) q[61];
-cx q[4],q[61];
-cx q[4],q[99];
-cx q[7],q[61];
-rz(1.0617804926614185) q[61];
-cx q[7],q[61];
-rx(10.489892349334573) q[61];
-rz(1.0617804926614185) q[62];
-cx q[0],q[62];
-cx q[0],q[64];
-cx q[17],q[62];
-rz(1.0617804926614185) q[62];
-cx q[17],q[62];
-rz(1.0617804926614185) q[63];
-cx q[12],q[63];
-cx q[17],q[63];
-rz(1.0617804926614185) q[63];
-cx q[17],q[63];
-cx q[17],q[66];
-rz(1.0617804926614185) q[64];
-cx q[0],q[64];
-cx q[0],q[75];
-rz(1.0617804926614185) q[65];
-cx q[5],q[65];
-cx q[5],q[76];
-cx q[23],q[65];
-rz(1.0617804926614185) q[65];
-cx q[23],q[65];
-rx(10.489892349334573) q[23];
-rx(10.489892349334573) q[65];
-rz(1.0617804926614185) q[66];
-cx q[17],q[66];
-rx(10.489892349334573) q[17];
-cx q[47],q[66];
-rz(1.0617804926614185) q[66];
-cx q[47],q[66];
-rx(10.489892349334573) q[47];
-rx(10.489892349334573) q[66];
-rz(1.0617804926614185) q[68];
-cx q[13],q[68];
-cx q[32],q[68];
-rz(1.0617804926614185) q[68];
-cx q[32],q[68];
-rz(1.0617804926614185) q[69];
-cx q[6],q[69];
-cx q[59],q[69];
-rz(1.0617804926614185) q[69];
-cx q[59],q[69];
-rz(1.0617804926614185) q[70];
-cx q[3],q[70];
-cx q[3],q[71];
-cx q[15],q[70];
-rz(1.0617804926614185) q[70];
-cx q[15],q[70];
-cx q[70],q[84];
-rz(1.0617804926614185) q[71];
-cx q[3],q[71];
-cx q[3],q[77];
-cx q[53],q[71];
-rz(1.0617804926614185) q[71];
-cx q[53],q[71];
-rx(10.489892349334573) q[71];
-rz(1.0617804926614185) q[73];
-cx q[16],q[73];
-cx q[16],q[101];
-cx q[59],q[73];
-rz(1.0617804926614185) q[73];
-cx q[59],q[73];
-rz(1.0617804926614185) q[75];
-cx q[0],q[75];
-cx q[0],q[82];
-cx q[21],q[75];
-rz(1.0617804926614185) q[75];
-cx q[21],q[75];
-cx q[21],q[81];
-rx(10.489892349334573) q[75];
-rz(1.0617804926614185) q[76];
-cx q[5],q[76];
-cx q[5],q[89];
-cx q[6],q[76];
-rz(1.0617804926614185) q[76];
-cx q[6],q[76];
-cx q[6],q[79];
-rx(10.489892349334573) q[76];
-rz(1.0617804926614185) q[77];
-cx q[3],q[77];
-cx q[3],q[88];
-cx q[30],q[77];
-rz(1.0617804926614185) q[77];
-cx q[30],q[77];
-rx(10.489892349334573) q[30];
-rz(1.0617804926614185) q[78];
-cx q[42],q[78];
-cx q[60],q[78];
-rz(1.0617804926614185) q[78];
-cx q[60],q[78];
-rx(10.489892349334573) q[78];
-rz(1.0617804926614185) q[79];
-cx q[6],q[79];
-cx q[50],q[79];
-rz(1.0617804926614185) q[79];
-cx q[50],q[79];
-rx(10.489892349334573) q[79];
-rz(1.0617804926614185) q[80];
-cx q[9],q[80];
-rx(10.489892349334573) q[9];
-cx q[15],q[80];
-rz(1.0617804926614185) q[80];
-cx q[15],q[80];
-cx q[15],q[90];
-rx(10.489892349334573) q[80];
-rz(1.0617804926614185) q[81];
-cx q[21],q[81];
-cx q[77],q[81];
-rz(1.0617804926614185) q[81];
-cx q[77],q[81];
-rx(10.489892349334573) q[77];
-rz(1.0617804926614185) q[82];
-cx q[0],q[82];
-cx q[0],q[91];
-rz(1.0617804926614185) q[83];
-cx q[8],q[83];
-rx(10.489892349334573) q[8];
-cx q[68],q[83];
-rz(1.0617804926614185) q[83];
-cx q[68],q[83];
-rx(10.489892349334573) q[68];
-rx(10.489892349334573) q[83];
-rz(1.0617804926614185) q[84];
-cx q[70],q[84];
-rx(10.489892349334573) q[70];
-cx q[73],q[84];
-rz(1.0617804926614185) q[84];
-cx q[73],q[84];
-rx(10.489892349334573) q[73];
-rx(10.489892349334573) q[84];
-rz(1.0617804926614185) q[86];
-cx q[24],q[86];
-cx q[53],q[86];
-rz(1.0617804926614185) q[86];
-cx q[53],q[86];
-cx q[53],q[124];
-rx(10.489892349334573) q[86];
-rz(1.0617804926614185) q[87];
-cx q[28],q[87];
-cx q[32],q[87];
-rz(1.0617804926614185) q[87];
-cx q[32],q[87];
-rx(10.489892349334573) q[87];
-rz(1.0617804926614185) q[88];
-cx q[3],q[88];
-cx q[3],q[100];
-cx q[60],q[88];
-rz(1.0617804926614185) q[88];
-cx q[60],q[88];
-rx(10.489892349334573) q[60];
-rx(10.489892349334573) q[88];
-rz(1.0617804926614185) q[89];
-cx q[5],q[89];
-cx q[5],q[95];
-rz(1.0617804926614185) q[90];
-cx q[15],q[90];
-cx q[15],q[92];
-rz(1.0617804926614185) q[91];
-cx q[0],q[91];
-cx q[0],q[93];
-cx q[6],q[91];
-rz(1.0617804926614185) q[91];
-cx q[6],q[91];
-rx(10.489892349334573) q[6];
-rz(1.0617804926614185) q[92];
-cx q[15],q[92];
-cx q[15],q[108];
-cx q[89],q[92];
-rz(1.0617804926614185) q[92];
-cx q[89],q[92];
-rx(10.489892349334573) q[89];
-rz(1.0617804926614185) q[93];
-cx q[0],q[93];
-cx q[0],q[123];
-cx q[32],q[93];
-rz(1.0617804926614185) q[93];
-cx q[32],q[93];
-rx(10.489892349334573) q[93];
-rz(1.0617804926614185) q[94];
-cx q[36],q[94];
-cx q[55],q[94];
-rz(1.0617804926614185) q[94];
-cx q[55],q[94];
-rx(10.489892349334573) q[55];
-rz(1.0617804926614185) q[95];
-cx q[5],q[95];
-cx q[5],q[106];
-rz(1.0617804926614185) q[97];
-cx q[1],q[97];
-cx q[1],q[113];
-cx q[7],q[97];
-rz(1.0617804926614185) q[97];
-cx q[7],q[97];
-cx q[7],q[104];
-rx(10.489892349334573) q[97];
-rz(1.0617804926614185) q[99];
-cx q[4],q[99];
-rz(1.0617804926614185) q[100];
-cx q[3],q[100];
-cx q[3],q[102];
-cx q[25],q[100];
-rz(1.0617804926614185) q[100];
-cx q[25],q[100];
-rx(10.489892349334573) q[25];
-rx(10.489892349334573) q[100];
-rz(1.0617804926614185) q[101];
-cx q[16],q[101];
-cx q[16],q[103];
-cx q[50],q[101];
-rz(1.0617804926614185) q[101];
-cx q[50],q[101];
-cx q[50],q[129];
-rx(10.489892349334573) q[101];
-rz(1.0617804926614185) q[102];
-cx q[3],q[102];
-cx q[3],q[107];
-cx q[4],q[102];
-rz(1.0617804926614185) q[102];
-cx q[4],q[102];
-cx q[4],q[127];
-rx(10.489892349334573) q[102];
-rz(1.0617804926614185) q[103];
-cx q[16],q[103];
-rx(10.489892349334573) q[16];
-cx q[57],q[103];
-rz(1.0617804926614185) q[103];
-cx q[57],q[103];
-rx(10.489892349334573) q[57];
-rx(10.489892349334573) q[103];
-rz(1.0617804926614185) q[104];
-cx q[7],q[104];
-rx(10.489892349334573) q[7];
-cx q[13],q[104];
-rz(1.0617804926614185) q[104];
-cx q[13],q[104];
-rx(10.489892349334573) q[13];
-cx q[104],q[114];
-rz(1.0617804926614185) q[105];
-cx q[26],q[105];
-cx q[26],q[117];
-cx q[28],q[105];
-rz(1.0617804926614185) q[105];
-cx q[28],q[105];
-cx q[28],q[116];
-rx(10.489892349334573) q[105];
-rz(1.0617804926614185) q[106];
-cx q[5],q[106];
-cx q[5],q[109];
-cx q[36],q[106];
-rz(1.0617804926614185) q[106];
-cx q[36],q[106];
-rx(10.489892349334573) q[106];
-rz(1.0617804926614185) q[107];
-cx q[3],q[107];
-cx q[3],q[110];
-cx q[31],q[107];
-rz(1.0617804926614185) q[107];
-cx q[31],q[107];
-rx(10.489892349334573) q[107];
-rz(1.0617804926614185) q[108];
-cx q[15],q[108];
-cx q[15],q[115];
-cx q[31],q[108];
-rz(1.0617804926614185) q[108];
-cx q[31],q[108];
-rx(10.489892349334573) q[31];
-rx(10.489892349334573) q[108];
-rz(1.0617804926614185) q[109];
-cx q[5],q[109];
-cx q[5],q[118];
-cx q[39],q[109];
-rz(1.0617804926614185) q[109];
-cx q[39],q[109];
-rx(10.489892349334573) q[39];
-rz(1.0617804926614185) q[110];
-cx q[3],q[110];
-cx q[3],q[111];
-cx q[24],q[110];
-rz(1.0617804926614185) q[110];
-cx q[24],q[110];
-rx(10.489892349334573) q[24];
-rz(1.0617804926614185) q[111];
-cx q[3],q[111];
-rz(1.0617804926614185) q[113];
-cx q[1],q[113];
-rx(10.489892349334573) q[1];
-cx q[3],q[113];
-rz(1.0617804926614185) q[113];
-cx q[3],q[113];
-cx q[3],q[125];
-rx(10.489892349334573) q[113];
-rz(1.0617804926614185) q[114];
-cx q[104],q[114];
-cx q[110],q[114];
-rz(1.0617804926614185) q[114];
-cx q[110],q[114];
-rx(10.489892349334573) q[110];
-rx(10.489892349334573) q[114];
-rz(1.0617804926614185) q[115];
-cx q[15],q[115];
-rz(1.0617804926614185) q[116];
-cx q[28],q[116];
-rx(10.489892349334573) q[28];
-cx q[42],q[116];
-rz(1.0617804926614185) q[116];
-cx q[42],q[116];
-rx(10.489892349334573) q[42];
-rx(10.489892349334573) q[116];
-rz(1.0617804926614185) q[117];
-cx q[26],q[117];
-rx(10.489892349334573) q[26];
-cx q[32],q[117];
-rz(1.0617804926614185) q[117];
-cx q[32],q[117];
-cx q[32],q[131];
-rx(10.489892349334573) q[117];
-rz(1.0617804926614185) q[118];
-cx q[5],q[118];
-rx(10.489892349334573) q[5];
-cx q[15],q[118];
-rz(1.0617804926614185) q[118];
-cx q[15],q[118];
-rx(10.489892349334573) q[15];
-rx(10.489892349334573) q[118];
-rz(1.0617804926614185) q[119];
-cx q[40],q[119];
-rx(10.489892349334573) q[40];
-cx q[69],q[119];
-rz(1.0617804926614185) q[119];
-cx q[69],q[119];
-rx(10.489892349334573) q[69];
-rx(10.489892349334573) q[119];
-rz(1.0617804926614185) q[120];
-cx q[46],q[120];
-rx(10.489892349334573) q[46];
-cx q[94],q[120];
-rz(1.0617804926614185) q[120];
-cx q[94],q[120];
-rx(10.489892349334573) q[94];
-rx(10.489892349334573) q[120];
-rz(1.0617804926614185) q[121];
-cx q[20],q[121];
-rx(10.489892349334573) q[20];
-cx q[104],q[121];
-rz(1.0617804926614185) q[121];
-cx q[104],q[121];
-rx(10.489892349334573) q[104];
-rx(10.489892349334573) q[121];
-rz(1.0617804926614185) q[123];
-cx q[0],q[123];
-cx q[0],q[126];
-rz(1.0617804926614185) q[124];
-cx q[53],q[124];
-rx(10.489892349334573) q[53];
-rz(1.0617804926614185) q[125];
-cx q[3],q[125];
-cx q[109],q[125];
-rz(1.0617804926614185) q[125];
-cx q[109],q[125];
-rx(10.489892349334573) q[125];
-rz(1.0617804926614185) q[126];
-cx q[0],q[126];
-rx(10.489892349334573) q[0];
-cx q[0],q[1];
-rz(4.189074879899592) q[1];
-cx q[0],q[1];
-cx q[0],q[2];
-rz(4.189074879899592) q[2];
-cx q[0],q[2];
-cx q[2],q[89];
-cx q[12],q[126];
-rz(4.189074879899592) q[89];
-cx q[2],q[89];
-rx(3.410283384478703) q[2];
-rz(1.0617804926614185) q[126];
-cx q[12],q[126];
-rx(10.489892349334573) q[12];
-rx(10.489892349334573) q[126];
-rz(1.0617804926614185) q[127];
-cx q[4],q[127];
-rx(10.489892349334573) q[4];
-cx q[62],q[127];
-rz(1.0617804926614185) q[127];
-cx q[62],q[127];
-cx q[62],q[128];
-rx(10.489892349334573) q[127];
-rz(1.0617804926614185) q[128];
-cx q[62],q[128];
-rx(10.489892349334573) q[62];
-cx q[109],q[128];
-rz(1.0617804926614185) q[128];
-cx q[109],q[128];
-rx(10.489892349334573) q[128];
-rz(1.0617804926614185) q[129];
-cx q[50],q[129];
-rx(10.489892349334573) q[50];
-cx q[91],q[129];
-rz(1.0617804926614185) q[129];
-cx q[91],q[129];
-rx(10.489892349334573) q[91];
-rx(10.489892349334573) q[129];
-rz(1.0617804926614185) q[130];
-cx q[35],q[130];
-rx(10.489892349334573) q[35];
-cx q[109],q[130];
-rz(1.0617804926614185) q[130];
-cx q[109],q[130];
-rx(10.489892349334573) q[109];
-rx(10.489892349334573) q[130];
-rz(1.0617804926614185) q[131];
-cx q[32],q[131];
-rx(10.489892349334573) q[32];
-rz(4.855117943314672) q[132];
-cx q[37],q[132];
-rx(10.916833501710489) q[37];
-cx q[10],q[37];
-rz(1.0617804926614185) q[37];
-cx q[10],q[37];
-cx q[10],q[41];
-cx q[34],q[37];
-rz(1.0617804926614185) q[37];
-cx q[34],q[37];
-rx(10.489892349334573) q[34];
-cx q[37],q[85];
-rz(1.0617804926614185) q[41];
-cx q[10],q[41];
-cx q[10],q[52];
-cx q[27],q[41];
-rz(1.0617804926614185) q[41];
-cx q[27],q[41];
-cx q[27],q[72];
-cx q[41],q[67];
-rz(1.0617804926614185) q[52];
-cx q[10],q[52];
-cx q[10],q[64];
-cx q[52],q[123];
-rz(1.0617804926614185) q[64];
-cx q[10],q[64];
-cx q[10],q[98];
-rx(10.489892349334573) q[64];
-rz(1.0617804926614185) q[67];
-cx q[41],q[67];
-cx q[41],q[99];
-cx q[56],q[67];
-rz(1.0617804926614185) q[67];
-cx q[56],q[67];
-cx q[56],q[74];
-rx(10.489892349334573) q[67];
-rz(1.0617804926614185) q[72];
-cx q[27],q[72];
-cx q[27],q[90];
-cx q[44],q[72];
-rz(1.0617804926614185) q[72];
-cx q[44],q[72];
-rx(10.489892349334573) q[44];
-rx(10.489892349334573) q[72];
-rz(1.0617804926614185) q[74];
-cx q[56],q[74];
-cx q[56],q[82];
-cx q[63],q[74];
-rz(1.0617804926614185) q[74];
-cx q[63],q[74];
-cx q[63],q[122];
-rx(10.489892349334573) q[74];
-rz(1.0617804926614185) q[82];
-cx q[56],q[82];
-cx q[56],q[96];
-rx(10.489892349334573) q[82];
-rz(1.0617804926614185) q[85];
-cx q[37],q[85];
-cx q[59],q[85];
-rz(1.0617804926614185) q[85];
-cx q[59],q[85];
-rx(10.489892349334573) q[59];
-rx(10.489892349334573) q[85];
-rz(1.0617804926614185) q[90];
-cx q[27],q[90];
-cx q[27],q[95];
-rx(10.489892349334573) q[90];
-rz(1.0617804926614185) q[95];
-cx q[27],q[95];
-rx(10.489892349334573) q[27];
-rx(10.489892349334573) q[95];
-rz(1.0617804926614185) q[96];
-cx q[56],q[96];
-rx(10.489892349334573) q[56];
-cx q[92],q[96];
-rz(1.0617804926614185) q[96];
-cx q[92],q[96];
-cx q[92],q[115];
-rx(10.489892349334573) q[96];
-rz(1.0617804926614185) q[98];
-cx q[10],q[98];
-rx(10.489892349334573) q[10];
-cx q[21],q[98];
-rz(1.0617804926614185) q[98];
-cx q[21],q[98];
-cx q[21],q[111];
-rx(10.489892349334573) q[98];
-rz(1.0617804926614185) q[99];
-cx q[41],q[99];
-rx(10.489892349334573) q[41];
-rx(10.489892349334573) q[99];
-rz(1.0617804926614185) q[111];
-cx q[21],q[111];
-cx q[21],q[112];
-rx(10.489892349334573) q[111];
-rz(1.0617804926614185) q[112];
-cx q[21],q[112];
-rx(10.489892349334573) q[21];
-cx q[36],q[112];
-rz(1.0617804926614185) q[112];
-cx q[36],q[112];
-rx(10.489892349334573) q[36];
-rx(10.489892349334573) q[112];
-rz(1.0617804926614185) q[115];
-cx q[92],q[115];
-rx(10.489892349334573) q[92];
-rx(10.489892349334573) q[115];
-rz(1.0617804926614185) q[122];
-cx q[63],q[122];
-rx(10.489892349334573) q[63];
-cx q[81],q[122];
-rz(1.0617804926614185) q[122];
-cx q[81],q[122];
-cx q[81],q[124];
-rx(10.489892349334573) q[122];
-rz(1.0617804926614185) q[123];
-cx q[52],q[123];
-rx(10.489892349334573) q[52];
-cx q[123],q[131];
-rz(1.0617804926614185) q[124];
-cx q[81],q[124];
-rx(10.489892349334573) q[81];
-rx(10.489892349334573) q[124];
-rz(1.0617804926614185) q[131];
-cx q[123],q[131];
-rx(10.489892349334573) q[123];
-rx(10.489892349334573) q[131];
-rx(10.916833501710489) q[132];
-cx q[3],q[132];
-rz(1.0617804926614185) q[132];
-cx q[3],q[132];
-rx(10.489892349334573) q[3];
-cx q[0],q[3];
-rz(4.189074879899592) q[3];
-cx q[0],q[3];
-cx q[0],q[15];
-cx q[1],q[3];
-rz(4.189074879899592) q[3];
-cx q[1],q[3];
-cx q[1],q[4];
-rz(4.189074879899592) q[4];
-cx q[1],q[4];
-cx q[1],q[5];
-cx q[3],q[4];
-rz(4.189074879899592) q[4];
-cx q[3],q[4];
-cx q[4],q[6];
-rz(4.189074879899592) q[5];
-cx q[1],q[5];
-cx q[1],q[9];
-cx q[3],q[5];
-rz(4.189074879899592) q[5];
-cx q[3],q[5];
-cx q[3],q[7];
-rz(4.189074879899592) q[6];
-cx q[4],q[6];
-cx q[5],q[6];
-rz(4.189074879899592) q[6];
-cx q[5],q[6];
-rz(4.189074879899592) q[7];
-cx q[3],q[7];
-cx q[3],q[8];
-cx q[4],q[7];
-rz(4.189074879899592) q[7];
-cx q[4],q[7];
-cx q[4],q[10];
-rz(4.189074879899592) q[8];
-cx q[3],q[8];
-cx q[5],q[8];
-rz(4.189074879899592) q[8];
-cx q[5],q[8];
-cx q[5],q[11];
-cx q[8],q[83];
-rz(4.189074879899592) q[9];
-cx q[1],q[9];
-cx q[1],q[17];
-cx q[3],q[9];
-rz(4.189074879899592) q[9];
-cx q[3],q[9];
-cx q[3],q[12];
-rz(4.189074879899592) q[10];
-cx q[4],q[10];
-cx q[4],q[13];
-cx q[6],q[10];
-rz(4.189074879899592) q[10];
-cx q[6],q[10];
-rz(4.189074879899592) q[11];
-cx q[5],q[11];
-cx q[6],q[11];
-rz(4.189074879899592) q[11];
-cx q[6],q[11];
-rx(3.410283384478703) q[11];
-rz(4.189074879899592) q[12];
-cx q[3],q[12];
-cx q[3],q[14];
-cx q[5],q[12];
-rz(4.189074879899592) q[12];
-cx q[5],q[12];
-rz(4.189074879899592) q[13];
-cx q[4],q[13];
-cx q[5],q[13];
-rz(4.189074879899592) q[13];
-cx q[5],q[13];
-rz(4.189074879899592) q[14];
-cx q[3],q[14];
-cx q[4],q[14];
-rz(4.189074879899592) q[14];
-cx q[4],q[14];
-rx(3.410283384478703) q[14];
-rz(4.189074879899592) q[15];
-cx q[0],q[15];
-cx q[0],q[16];
-cx q[3],q[15];
-rz(4.189074879899592) q[15];
-cx q[3],q[15];
-rz(4.189074879899592) q[16];
-cx q[0],q[16];
-cx q[0],q[20];
-cx q[3],q[16];
-rz(4.189074879899592) q[16];
-cx q[3],q[16];
-rz(4.189074879899592) q[17];
-cx q[1],q[17];
-cx q[1],q[28];
-cx q[3],q[17];
-rz(4.189074879899592) q[17];
-cx q[3],q[17];
-cx q[3],q[18];
-rz(4.189074879899592) q[18];
-cx q[3],q[18];
-cx q[3],q[19];
-cx q[4],q[18];
-rz(4.189074879899592) q[18];
-cx q[4],q[18];
-cx q[4],q[21];
-rz(4.189074879899592) q[19];
-cx q[3],q[19];
-cx q[3],q[22];
-cx q[7],q[19];
-rz(4.189074879899592) q[19];
-cx q[7],q[19];
-cx q[19],q[38];
-rz(4.189074879899592) q[20];
-cx q[0],q[20];
-cx q[0],q[32];
-cx q[15],q[20];
-rz(4.189074879899592) q[20];
-cx q[15],q[20];
-rz(4.189074879899592) q[21];
-cx q[4],q[21];
-cx q[4],q[27];
-cx q[15],q[21];
-rz(4.189074879899592) q[21];
-cx q[15],q[21];
-cx q[15],q[36];
-rz(4.189074879899592) q[22];
-cx q[3],q[22];
-cx q[3],q[23];
-cx q[9],q[22];
-rz(4.189074879899592) q[22];
-cx q[9],q[22];
-cx q[9],q[55];
-rx(3.410283384478703) q[22];
-rz(4.189074879899592) q[23];
-cx q[3],q[23];
-cx q[3],q[24];
-cx q[17],q[23];
-rz(4.189074879899592) q[23];
-cx q[17],q[23];
-rz(4.189074879899592) q[24];
-cx q[3],q[24];
-cx q[3],q[25];
-cx q[5],q[24];
-rz(4.189074879899592) q[24];
-cx q[5],q[24];
-cx q[5],q[33];
-cx q[24],q[54];
-rz(4.189074879899592) q[25];
-cx q[3],q[25];
-cx q[3],q[26];
-cx q[12],q[25];
-rz(4.189074879899592) q[25];
-cx q[12],q[25];
-cx q[12],q[31];
-rz(4.189074879899592) q[26];
-cx q[3],q[26];
-cx q[21],q[26];
-rz(4.189074879899592) q[26];
-cx q[21],q[26];
-rz(4.189074879899592) q[27];
-cx q[4],q[27];
-cx q[4],q[47];
-cx q[6],q[27];
-rz(4.189074879899592) q[27];
-cx q[6],q[27];
-cx q[6],q[69];
-rz(4.189074879899592) q[28];
-cx q[1],q[28];
-cx q[1],q[29];
-cx q[3],q[28];
-rz(4.189074879899592) q[28];
-cx q[3],q[28];
-rz(4.189074879899592) q[29];
-cx q[1],q[29];
-cx q[1],q[45];
-cx q[3],q[29];
-rz(4.189074879899592) q[29];
-cx q[3],q[29];
-cx q[3],q[30];
-rx(3.410283384478703) q[29];
-rz(4.189074879899592) q[30];
-cx q[3],q[30];
-cx q[3],q[34];
-cx q[18],q[30];
-rz(4.189074879899592) q[30];
-cx q[18],q[30];
-rx(3.410283384478703) q[18];
-rz(4.189074879899592) q[31];
-cx q[12],q[31];
-cx q[26],q[31];
-rz(4.189074879899592) q[31];
-cx q[26],q[31];
-cx q[26],q[105];
-rz(4.189074879899592) q[32];
-cx q[0],q[32];
-cx q[0],q[42];
-cx q[21],q[32];
-rz(4.189074879899592) q[32];
-cx q[21],q[32];
-rz(4.189074879899592) q[33];
-cx q[5],q[33];
-cx q[5],q[46];
-cx q[30],q[33];
-rz(4.189074879899592) q[33];
-cx q[30],q[33];
-rx(3.410283384478703) q[33];
-rz(4.189074879899592) q[34];
-cx q[3],q[34];
-cx q[3],q[35];
-cx q[12],q[34];
-rz(4.189074879899592) q[34];
-cx q[12],q[34];
-rz(4.189074879899592) q[35];
-cx q[3],q[35];
-cx q[3],q[39];
-cx q[32],q[35];
-rz(4.189074879899592) q[35];
-cx q[32],q[35];
-cx q[35],q[130];
-rz(4.189074879899592) q[36];
-cx q[15],q[36];
-cx q[20],q[36];
-rz(4.189074879899592) q[36];
-cx q[20],q[36];
-cx q[36],q[94];
-cx q[37],q[132];
-rz(4.189074879899592) q[38];
-cx q[19],q[38];
-rx(3.410283384478703) q[19];
-cx q[21],q[38];
-rz(4.189074879899592) q[38];
-cx q[21],q[38];
-rz(4.189074879899592) q[39];
-cx q[3],q[39];
-cx q[3],q[40];
-cx q[13],q[39];
-rz(4.189074879899592) q[39];
-cx q[13],q[39];
-cx q[13],q[56];
-rz(4.189074879899592) q[40];
-cx q[3],q[40];
-cx q[23],q[40];
-rz(4.189074879899592) q[40];
-cx q[23],q[40];
-cx q[40],q[119];
-rz(4.189074879899592) q[42];
-cx q[0],q[42];
-cx q[0],q[48];
-cx q[3],q[42];
-rz(4.189074879899592) q[42];
-cx q[3],q[42];
-cx q[3],q[43];
-cx q[42],q[78];
-rz(4.189074879899592) q[43];
-cx q[3],q[43];
-cx q[3],q[44];
-cx q[20],q[43];
-rz(4.189074879899592) q[43];
-cx q[20],q[43];
-cx q[20],q[121];
-rx(3.410283384478703) q[43];
-rz(4.189074879899592) q[44];
-cx q[3],q[44];
-cx q[3],q[49];
-cx q[12],q[44];
-rz(4.189074879899592) q[44];
-cx q[12],q[44];
-rz(4.189074879899592) q[45];
-cx q[1],q[45];
-cx q[1],q[57];
-cx q[16],q[45];
-rz(4.189074879899592) q[45];
-cx q[16],q[45];
-cx q[16],q[59];
-rz(4.189074879899592) q[46];
-cx q[5],q[46];
-cx q[5],q[65];
-cx q[38],q[46];
-rz(4.189074879899592) q[46];
-cx q[38],q[46];
-rx(3.410283384478703) q[38];
-cx q[46],q[120];
-rz(4.189074879899592) q[47];
-cx q[4],q[47];
-cx q[17],q[47];
-rz(4.189074879899592) q[47];
-cx q[17],q[47];
-cx q[17],q[53];
-rz(4.189074879899592) q[48];
-cx q[0],q[48];
-cx q[0],q[51];
-cx q[30],q[48];
-rz(4.189074879899592) q[48];
-cx q[30],q[48];
-rx(3.410283384478703) q[48];
-rz(4.189074879899592) q[49];
-cx q[3],q[49];
-cx q[3],q[50];
-cx q[4],q[49];
-rz(4.189074879899592) q[49];
-cx q[4],q[49];
-cx q[4],q[61];
-rx(3.410283384478703) q[49];
-rz(4.189074879899592) q[50];
-cx q[3],q[50];
-cx q[3],q[52];
-cx q[12],q[50];
-rz(4.189074879899592) q[50];
-cx q[12],q[50];
-cx q[12],q[63];
-rz(4.189074879899592) q[51];
-cx q[0],q[51];
-cx q[0],q[62];
-cx q[28],q[51];
-rz(4.189074879899592) q[51];
-cx q[28],q[51];
-rx(3.410283384478703) q[51];
-rz(4.189074879899592) q[52];
-cx q[3],q[52];
-rz(4.189074879899592) q[53];
-cx q[17],q[53];
-cx q[21],q[53];
-rz(4.189074879899592) q[53];
-cx q[21],q[53];
-rz(4.189074879899592) q[54];
-cx q[24],q[54];
-cx q[24],q[58];
-cx q[28],q[54];
-rz(4.189074879899592) q[54];
-cx q[28],q[54];
-rx(3.410283384478703) q[54];
-rz(4.189074879899592) q[55];
-cx q[9],q[55];
-cx q[9],q[80];
-cx q[15],q[55];
-rz(4.189074879899592) q[55];
-cx q[15],q[55];
-rz(4.189074879899592) q[56];
-cx q[13],q[56];
-cx q[13],q[68];
-cx q[45],q[56];
-rz(4.189074879899592) q[56];
-cx q[45],q[56];
-rx(3.410283384478703) q[45];
-rz(4.189074879899592) q[57];
-cx q[1],q[57];
-cx q[1],q[60];
-cx q[3],q[57];
-rz(4.189074879899592) q[57];
-cx q[3],q[57];
-cx q[3],q[70];
-rz(4.189074879899592) q[58];
-cx q[24],q[58];
-cx q[24],q[86];
-cx q[28],q[58];
-rz(4.189074879899592) q[58];
-cx q[28],q[58];
-cx q[28],q[87];
-rx(3.410283384478703) q[58];
-rz(4.189074879899592) q[59];
-cx q[16],q[59];
-cx q[16],q[73];
-cx q[32],q[59];
-rz(4.189074879899592) q[59];
-cx q[32],q[59];
-rz(4.189074879899592) q[60];
-cx q[1],q[60];
-cx q[1],q[97];
-cx q[7],q[60];
-rz(4.189074879899592) q[60];
-cx q[7],q[60];
-rz(4.189074879899592) q[61];
-cx q[4],q[61];
-cx q[4],q[99];
-cx q[7],q[61];
-rz(4.189074879899592) q[61];
-cx q[7],q[61];
-rx(3.410283384478703) q[61];
-rz(4.189074879899592) q[62];
-cx q[0],q[62];
-cx q[0],q[64];
-cx q[17],q[62];
-rz(4.189074879899592) q[62];
-cx q[17],q[62];
-rz(4.189074879899592) q[63];
-cx q[12],q[63];
-cx q[17],q[63];
-rz(4.189074879899592) q[63];
-cx q[17],q[63];
-cx q[17],q[66];
-rz(4.189074879899592) q[64];
-cx q[0],q[64];
-cx q[0],q[75];
-rz(4.189074879899592) q[65];
-cx q[5],q[65];
-cx q[5],q[76];
-cx q[23],q[65];
-rz(4.189074879899592) q[65];
-cx q[23],q[65];
-rx(3.410283384478703) q[23];
-rx(3.410283384478703) q[65];
-rz(4.189074879899592) q[66];
-cx q[17],q[66];
-rx(3.410283384478703) q[17];
-cx q[47],q[66];
-rz(4.189074879899592) q[66];
-cx q[47],q[66];
-rx(3.410283384478703) q[47];
-rx(3.410283384478703) q[66];
-rz(4.189074879899592) q[68];
-cx q[13],q[68];
-cx q[32],q[68];
-rz(4.189074879899592) q[68];
-cx q[32],q[68];
-rz(4.189074879899592) q[69];
-cx q[6],q[69];
-cx q[59],q[69];
-rz(4.189074879899592) q[69];
-cx q[59],q[69];
-rz(4.189074879899592) q[70];
-cx q[3],q[70];
-cx q[3],q[71];
-cx q[15],q[70];
-rz(4.189074879899592) q[70];
-cx q[15],q[70];
-cx q[70],q[84];
-rz(4.189074879899592) q[71];
-cx q[3],q[71];
-cx q[3],q[77];
-cx q[53],q[71];
-rz(4.189074879899592) q[71];
-cx q[53],q[71];
-rx(3.410283384478703) q[71];
-rz(4.189074879899592) q[73];
-cx q[16],q[73];
-cx q[16],q[101];
-cx q[59],q[73];
-rz(4.189074879899592) q[73];
-cx q[59],q[73];
-rz(4.189074879899592) q[75];
-cx q[0],q[75];
-cx q[0],q[82];
-cx q[21],q[75];
-rz(4.189074879899592) q[75];
-cx q[21],q[75];
-cx q[21],q[81];
-rx(3.410283384478703) q[75];
-rz(4.189074879899592) q[76];
-cx q[5],q[76];
-cx q[5],q[89];
-cx q[6],q[76];
-rz(4.189074879899592) q[76];
-cx q[6],q[76];
-cx q[6],q[79];
-rx(3.410283384478703) q[76];
-rz(4.189074879899592) q[77];
-cx q[3],q[77];
-cx q[3],q[88];
-cx q[30],q[77];
-rz(4.189074879899592) q[77];
-cx q[30],q[77];
-rx(3.410283384478703) q[30];
-rz(4.189074879899592) q[78];
-cx q[42],q[78];
-cx q[60],q[78];
-rz(4.189074879899592) q[78];
-cx q[60],q[78];
-rx(3.410283384478703) q[78];
-rz(4.189074879899592) q[79];
-cx q[6],q[79];
-cx q[50],q[79];
-rz(4.189074879899592) q[79];
-cx q[50],q[79];
-rx(3.410283384478703) q[79];
-rz(4.189074879899592) q[80];
-cx q[9],q[80];
-rx(3.410283384478703) q[9];
-cx q[15],q[80];
-rz(4.189074879899592) q[80];
-cx q[15],q[80];
-cx q[15],q[90];
-rx(3.410283384478703) q[80];
-rz(4.189074879899592) q[81];
-cx q[21],q[81];
-cx q[77],q[81];
-rz(4.189074879899592) q[81];
-cx q[77],q[81];
-rx(3.410283384478703) q[77];
-rz(4.189074879899592) q[82];
-cx q[0],q[82];
-cx q[0],q[91];
-rz(4.189074879899592) q[83];
-cx q[8],q[83];
-rx(3.410283384478703) q[8];
-cx q[68],q[83];
-rz(4.189074879899592) q[83];
-cx q[68],q[83];
-rx(3.410283384478703) q[68];
-rx(3.410283384478703) q[83];
-rz(4.189074879899592) q[84];
-cx q[70],q[84];
-rx(3.410283384478703) q[70];
-cx q[73],q[84];
-rz(4.189074879899592) q[84];
-cx q[73],q[84];
-rx(3.410283384478703) q[73];
-rx(3.410283384478703) q[84];
-rz(4.189074879899592) q[86];
-cx q[24],q[86];
-cx q[53],q[86];
-rz(4.189074879899592) q[86];
-cx q[53],q[86];
-cx q[53],q[124];
-rx(3.410283384478703) q[86];
-rz(4.189074879899592) q[87];
-cx q[28],q[87];
-cx q[32],q[87];
-rz(4.189074879899592) q[87];
-cx q[32],q[87];
-rx(3.410283384478703) q[87];
-rz(4.189074879899592) q[88];
-cx q[3],q[88];
-cx q[3],q[100];
-cx q[60],q[88];
-rz(4.189074879899592) q[88];
-cx q[60],q[88];
-rx(3.410283384478703) q[60];
-rx(3.410283384478703) q[88];
-rz(4.189074879899592) q[89];
-cx q[5],q[89];
-cx q[5],q[95];
-rz(4.189074879899592) q[90];
-cx q[15],q[90];
-cx q[15],q[92];
-rz(4.189074879899592) q[91];
-cx q[0],q[91];
-cx q[0],q[93];
-cx q[6],q[91];
-rz(4.189074879899592) q[91];
-cx q[6],q[91];
-rx(3.410283384478703) q[6];
-rz(4.189074879899592) q[92];
-cx q[15],q[92];
-cx q[15],q[108];
-cx q[89],q[92];
-rz(4.189074879899592) q[92];
-cx q[89],q[92];
-rx(3.410283384478703) q[89];
-rz(4.189074879899592) q[93];
-cx q[0],q[93];
-cx q[0],q[123];
-cx q[32],q[93];
-rz(4.189074879899592) q[93];
-cx q[32],q[93];
-rx(3.410283384478703) q[93];
-rz(4.189074879899592) q[94];
-cx q[36],q[94];
-cx q[55],q[94];
-rz(4.189074879899592) q[94];
-cx q[55],q[94];
-rx(3.410283384478703) q[55];
-rz(4.189074879899592) q[95];
-cx q[5],q[95];
-cx q[5],q[106];
-rz(4.189074879899592) q[97];
-cx q[1],q[97];
-cx q[1],q[113];
-cx q[7],q[97];
-rz(4.189074879899592) q[97];
-cx q[7],q[97];
-cx q[7],q[104];
-rx(3.410283384478703) q[97];
-rz(4.189074879899592) q[99];
-cx q[4],q[99];
-rz(4.189074879899592) q[100];
-cx q[3],q[100];
-cx q[3],q[102];
-cx q[25],q[100];
-rz(4.189074879899592) q[100];
-cx q[25],q[100];
-rx(3.410283384478703) q[25];
-rx(3.410283384478703) q[100];
-rz(4.189074879899592) q[101];
-cx q[16],q[101];
-cx q[16],q[103];
-cx q[50],q[101];
-rz(4.189074879899592) q[101];
-cx q[50],q[101];
-cx q[50],q[129];
-rx(3.410283384478703) q[101];
-rz(4.189074879899592) q[102];
-cx q[3],q[102];
-cx q[3],q[107];
-cx q[4],q[102];
-rz(4.189074879899592) q[102];
-cx q[4],q[102];
-cx q[4],q[127];
-rx(3.410283384478703) q[102];
-rz(4.189074879899592) q[103];
-cx q[16],q[103];
-rx(3.410283384478703) q[16];
-cx q[57],q[103];
-rz(4.189074879899592) q[103];
-cx q[57],q[103];
-rx(3.410283384478703) q[57];
-rx(3.410283384478703) q[103];
-rz(4.189074879899592) q[104];
-cx q[7],q[104];
-rx(3.410283384478703) q[7];
-cx q[13],q[104];
-rz(4.189074879899592) q[104];
-cx q[13],q[104];
-rx(3.410283384478703) q[13];
-cx q[104],q[114];
-rz(4.189074879899592) q[105];
-cx q[26],q[105];
-cx q[26],q[117];
-cx q[28],q[105];
-rz(4.189074879899592) q[105];
-cx q[28],q[105];
-cx q[28],q[116];
-rx(3.410283384478703) q[105];
-rz(4.189074879899592) q[106];
-cx q[5],q[106];
-cx q[5],q[109];
-cx q[36],q[106];
-rz(4.189074879899592) q[106];
-cx q[36],q[106];
-rx(3.410283384478703) q[106];
-rz(4.189074879899592) q[107];
-cx q[3],q[107];
-cx q[3],q[110];
-cx q[31],q[107];
-rz(4.189074879899592) q[107];
-cx q[31],q[107];
-rx(3.410283384478703) q[107];
-rz(4.189074879899592) q[108];
-cx q[15],q[108];
-cx q[15],q[115];
-cx q[31],q[108];
-rz(4.189074879899592) q[108];
-cx q[31],q[108];
-rx(3.410283384478703) q[31];
-rx(3.410283384478703) q[108];
-rz(4.189074879899592) q[109];
-cx q[5],q[109];
-cx q[5],q[118];
-cx q[39],q[109];
-rz(4.189074879899592) q[109];
-cx q[39],q[109];
-rx(3.410283384478703) q[39];
-rz(4.189074879899592) q[110];
-cx q[3],q[110];
-cx q[3],q[111];
-cx q[24],q[110];
-rz(4.189074879899592) q[110];
-cx q[24],q[110];
-rx(3.410283384478703) q[24];
-rz(4.189074879899592) q[111];
-cx q[3],q[111];
-rz(4.189074879899592) q[113];
-cx q[1],q[113];
-rx(3.410283384478703) q[1];
-cx q[3],q[113];
-rz(4.189074879899592) q[113];
-cx q[3],q[113];
-cx q[3],q[125];
-rx(3.410283384478703) q[113];
-rz(4.189074879899592) q[114];
-cx q[104],q[114];
-cx q[110],q[114];
-rz(4.189074879899592) q[114];
-cx q[110],q[114];
-rx(3.410283384478703) q[110];
-rx(3.410283384478703) q[114];
-rz(4.189074879899592) q[115];
-cx q[15],q[115];
-rz(4.189074879899592) q[116];
-cx q[28],q[116];
-rx(3.410283384478703) q[28];
-cx q[42],q[116];
-rz(4.189074879899592) q[116];
-cx q[42],q[116];
-rx(3.410283384478703) q[42];
-rx(3.410283384478703) q[116];
-rz(4.189074879899592) q[117];
-cx q[26],q[117];
-rx(3.410283384478703) q[26];
-cx q[32],q[117];
-rz(4.189074879899592) q[117];
-cx q[32],q[117];
-cx q[32],q[131];
-rx(3.410283384478703) q[117];
-rz(4.189074879899592) q[118];
-cx q[5],q[118];
-rx(3.410283384478703) q[5];
-cx q[15],q[118];
-rz(4.189074879899592) q[118];
-cx q[15],q[118];
-rx(3.410283384478703) q[15];
-rx(3.410283384478703) q[118];
-rz(4.189074879899592) q[119];
-cx q[40],q[119];
-rx(3.410283384478703) q[40];
-cx q[69],q[119];
-rz(4.189074879899592) q[119];
-cx q[69],q[119];
-rx(3.410283384478703) q[69];
-rx(3.410283384478703) q[119];
-rz(4.189074879899592) q[120];
-cx q[46],q[120];
-rx(3.410283384478703) q[46];
-cx q[94],q[120];
-rz(4.189074879899592) q[120];
-cx q[94],q[120];
-rx(3.410283384478703) q[94];
-rx(3.410283384478703) q[120];
-rz(4.189074879899592) q[121];
-cx q[20],q[121];
-rx(3.410283384478703) q[20];
-cx q[104],q[121];
-rz(4.189074879899592) q[121];
-cx q[104],q[121];
-rx(3.410283384478703) q[104];
-rx(3.410283384478703) q[121];
-rz(4.189074879899592) q[123];
-cx q[0],q[123];
-cx q[0],q[126];
-rz(4.189074879899592) q[124];
-cx q[53],q[124];
-rx(3.410283384478703) q[53];
-rz(4.189074879899592) q[125];
-cx q[3],q[125];
-cx q[109],q[125];
-rz(4.189074879899592) q[125];
-cx q[109],q[125];
-rx(3.410283384478703) q[125];
-rz(4.189074879899592) q[126];
-cx q[0],q[126];
-rx(3.410283384478703) q[0];
-cx q[12],q[126];
-rz(4.189074879899592) q[126];
-cx q[12],q[126];
-rx(3.410283384478703) q[12];
-rx(3.410283384478703) q[126];
-rz(4.189074879899592) q[127];
-cx q[4],q[127];
-rx(3.410283384478703) q[4];
-cx q[62],q[127];
-rz(4.189074879899592) q[127];
-cx q[62],q[127];
-cx q[62],q[128];
-rx(3.410283384478703) q[127];
-rz(4.189074879899592) q[128];
-cx q[62],q[128];
-rx(3.410283384478703) q[62];
-cx q[109],q[128];
-rz(4.189074879899592) q[128];
-cx q[109],q[128];
-rx(3.410283384478703) q[128];
-rz(4.189074879899592) q[129];
-cx q[50],q[129];
-rx(3.410283384478703) q[50];
-cx q[91],q[129];
-rz(4.189074879899592) q[129];
-cx q[91],q[129];
-rx(3.410283384478703) q[91];
-rx(3.410283384478703) q[129];
-rz(4.189074879899592) q[130];
-cx q[35],q[130];
-rx(3.410283384478703) q[35];
-cx q[109],q[130];
-rz(4.189074879899592) q[130];
-cx q[109],q[130];
-rx(3.410283384478703) q[109];
-rx(3.410283384478703) q[130];
-rz(4.189074879899592) q[131];
-cx q[32],q[131];
-rx(3.410283384478703) q[32];
-rz(1.0617804926614185) q[132];
-cx q[37],q[132];
-rx(10.489892349334573) q[37];
-cx q[10],q[37];
-rz(4.189074879899592) q[37];
-cx q[10],q[37];
-cx q[10],q[41];
-cx q[34],q[37];
-rz(4.189074879899592) q[37];
-cx q[34],q[37];
-rx(3.410283384478703) q[34];
-cx q[37],q[85];
-rz(4.189074879899592) q[41];
-cx q[10],q[41];
-cx q[10],q[52];
-cx q[27],q[41];
-rz(4.189074879899592) q[41];
-cx q[27],q[41];
-cx q[27],q[72];
-cx q[41],q[67];
-rz(4.189074879899592) q[52];
-cx q[10],q[52];
-cx q[10],q[64];
-cx q[52],q[123];
-rz(4.189074879899592) q[64];
-cx q[10],q[64];
-cx q[10],q[98];
-rx(3.410283384478703) q[64];
-rz(4.189074879899592) q[67];
-cx q[41],q[67];
-cx q[41],q[99];
-cx q[56],q[67];
-rz(4.189074879899592) q[67];
-cx q[56],q[67];
-cx q[56],q[74];
-rx(3.410283384478703) q[67];
-rz(4.189074879899592) q[72];
-cx q[27],q[72];
-cx q[27],q[90];
-cx q[44],q[72];
-rz(4.189074879899592) q[72];
-cx q[44],q[72];
-rx(3.410283384478703) q[44];
-rx(3.410283384478703) q[72];
-rz(4.189074879899592) q[74];
-cx q[56],q[74];
-cx q[56],q[82];
-cx q[63],q[74];
-rz(4.189074879899592) q[74];
-cx q[63],q[74];
-cx q[63],q[122];
-rx(3.410283384478703) q[74];
-rz(4.189074879899592) q[82];
-cx q[56],q[82];
-cx q[56],q[96];
-rx(3.410283384478703) q[82];
-rz(4.189074879899592) q[85];
-cx q[37],q[85];
-cx q[59],q[85];
-rz(4.189074879899592) q[85];
-cx q[59],q[85];
-rx(3.410283384478703) q[59];
-rx(3.410283384478703) q[85];
-rz(4.189074879899592) q[90];
-cx q[27],q[90];
-cx q[27],q[95];
-rx(3.410283384478703) q[90];
-rz(4.189074879899592) q[95];
-cx q[27],q[95];
-rx(3.410283384478703) q[27];
-rx(3.410283384478703) q[95];
-rz(4.189074879899592) q[96];
-cx q[56],q[96];
-rx(3.410283384478703) q[56];
-cx q[92],q[96];
-rz(4.189074879899592) q[96];
-cx q[92],q[96];
-cx q[92],q[115];
-rx(3.410283384478703) q[96];
-rz(4.189074879899592) q[98];
-cx q[10],q[98];
-rx(3.410283384478703) q[10];
-cx q[21],q[98];
-rz(4.189074879899592) q[98];
-cx q[21],q[98];
-cx q[21],q[111];
-rx(3.410283384478703) q[98];
-rz(4.189074879899592) q[99];
-cx q[41],q[99];
-rx(3.410283384478703) q[41];
-rx(3.410283384478703) q[99];
-rz(4.189074879899592) q[111];
-cx q[21],q[111];
-cx q[21],q[112];
-rx(3.410283384478703) q[111];
-rz(4.189074879899592) q[112];
-cx q[21],q[112];
-rx(3.410283384478703) q[21];
-cx q[36],q[112];
-rz(4.189074879899592) q[112];
-cx q[36],q[112];
-rx(3.410283384478703) q[36];
-rx(3.410283384478703) q[112];
-rz(4.189074879899592) q[115];
-cx q[92],q[115];
-rx(3.410283384478703) q[92];
-rx(3.410283384478703) q[115];
-rz(4.189074879899592) q[122];
-cx q[63],q[122];
-rx(3.410283384478703) q[63];
-cx q[81],q[122];
-rz(4.189074879899592) q[122];
-cx q[81],q[122];
-cx q[81],q[124];
-rx(3.410283384478703) q[122];
-rz(4.189074879899592) q[123];
-cx q[52],q[123];
-rx(3.410283384478703) q[52];
-cx q[123],q[131];
-rz(4.189074879899592) q[124];
-cx q[81],q[124];
-rx(3.410283384478703) q[81];
-rx(3.410283384478703) q[124];
-rz(4.189074879899592) q[131];
-cx q[123],q[131];
-rx(3.410283384478703) q[123];
-rx(3.410283384478703) q[131];
-rx(10.489892349334573) q[132];
-cx q[3],q[132];
-rz(4.189074879899592) q[132];
-cx q[3],q[132];
-rx(3.410283384478703) q[3];
-cx q[37],q[132];
-rz(4.189074879899592) q[132];
-cx q[37],q[132];
-rx(3.410283384478703) q[37];
-rx(3.410283384478703) q[132];
\ No newline at end of file
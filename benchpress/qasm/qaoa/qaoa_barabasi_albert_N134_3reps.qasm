@@ -1,3049 +0,0 @@
-OPENQASM 2.0;
-include "qelib1.inc";
-qreg q[134];
-ry(pi/2) q[0];
-rx(pi) q[0];
-ry(pi/2) q[1];
-rx(pi) q[1];
-cx q[0],q[1];
-rz(0.46450907397842434) q[1];
-cx q[0],q[1];
-ry(pi/2) q[2];
-rx(pi) q[2];
-cx q[0],q[2];
-rz(0.46450907397842434) q[2];
-cx q[0],q[2];
-ry(pi/2) q[3];
-rx(pi) q[3];
-cx q[0],q[3];
-rz(0.46450907397842434) q[3];
-cx q[0],q[3];
-cx q[1],q[3];
-rz(0.46450907397842434) q[3];
-cx q[1],q[3];
-ry(pi/2) q[4];
-rx(pi) q[4];
-cx q[1],q[4];
-rz(0.46450907397842434) q[4];
-cx q[1],q[4];
-cx q[3],q[4];
-rz(0.46450907397842434) q[4];
-cx q[3],q[4];
-ry(pi/2) q[5];
-rx(pi) q[5];
-cx q[1],q[5];
-rz(0.46450907397842434) q[5];
-cx q[1],q[5];
-cx q[3],q[5];
-rz(0.46450907397842434) q[5];
-cx q[3],q[5];
-ry(pi/2) q[6];
-rx(pi) q[6];
-cx q[4],q[6];
-rz(0.46450907397842434) q[6];
-cx q[4],q[6];
-cx q[5],q[6];
-rz(0.46450907397842434) q[6];
-cx q[5],q[6];
-ry(pi/2) q[7];
-rx(pi) q[7];
-cx q[3],q[7];
-rz(0.46450907397842434) q[7];
-cx q[3],q[7];
-cx q[4],q[7];
-rz(0.46450907397842434) q[7];
-cx q[4],q[7];
-ry(pi/2) q[8];
-rx(pi) q[8];
-cx q[3],q[8];
-rz(0.46450907397842434) q[8];
-cx q[3],q[8];
-cx q[5],q[8];
-rz(0.46450907397842434) q[8];
-cx q[5],q[8];
-ry(pi/2) q[9];
-rx(pi) q[9];
-cx q[1],q[9];
-rz(0.46450907397842434) q[9];
-cx q[1],q[9];
-cx q[3],q[9];
-rz(0.46450907397842434) q[9];
-cx q[3],q[9];
-ry(pi/2) q[10];
-rx(pi) q[10];
-cx q[4],q[10];
-rz(0.46450907397842434) q[10];
-cx q[4],q[10];
-cx q[6],q[10];
-rz(0.46450907397842434) q[10];
-cx q[6],q[10];
-ry(pi/2) q[11];
-rx(pi) q[11];
-cx q[5],q[11];
-rz(0.46450907397842434) q[11];
-cx q[5],q[11];
-cx q[6],q[11];
-rz(0.46450907397842434) q[11];
-cx q[6],q[11];
-rx(3.312892028470381) q[11];
-ry(pi/2) q[12];
-rx(pi) q[12];
-cx q[3],q[12];
-rz(0.46450907397842434) q[12];
-cx q[3],q[12];
-cx q[5],q[12];
-rz(0.46450907397842434) q[12];
-cx q[5],q[12];
-ry(pi/2) q[13];
-rx(pi) q[13];
-cx q[4],q[13];
-rz(0.46450907397842434) q[13];
-cx q[4],q[13];
-cx q[5],q[13];
-rz(0.46450907397842434) q[13];
-cx q[5],q[13];
-ry(pi/2) q[14];
-rx(pi) q[14];
-cx q[3],q[14];
-rz(0.46450907397842434) q[14];
-cx q[3],q[14];
-cx q[4],q[14];
-rz(0.46450907397842434) q[14];
-cx q[4],q[14];
-rx(3.312892028470381) q[14];
-ry(pi/2) q[15];
-rx(pi) q[15];
-cx q[0],q[15];
-rz(0.46450907397842434) q[15];
-cx q[0],q[15];
-cx q[3],q[15];
-rz(0.46450907397842434) q[15];
-cx q[3],q[15];
-ry(pi/2) q[16];
-rx(pi) q[16];
-cx q[0],q[16];
-rz(0.46450907397842434) q[16];
-cx q[0],q[16];
-cx q[3],q[16];
-rz(0.46450907397842434) q[16];
-cx q[3],q[16];
-ry(pi/2) q[17];
-rx(pi) q[17];
-cx q[1],q[17];
-rz(0.46450907397842434) q[17];
-cx q[1],q[17];
-cx q[3],q[17];
-rz(0.46450907397842434) q[17];
-cx q[3],q[17];
-ry(pi/2) q[18];
-rx(pi) q[18];
-cx q[3],q[18];
-rz(0.46450907397842434) q[18];
-cx q[3],q[18];
-cx q[4],q[18];
-rz(0.46450907397842434) q[18];
-cx q[4],q[18];
-ry(pi/2) q[19];
-rx(pi) q[19];
-cx q[3],q[19];
-rz(0.46450907397842434) q[19];
-cx q[3],q[19];
-cx q[7],q[19];
-rz(0.46450907397842434) q[19];
-cx q[7],q[19];
-ry(pi/2) q[20];
-rx(pi) q[20];
-cx q[0],q[20];
-rz(0.46450907397842434) q[20];
-cx q[0],q[20];
-cx q[15],q[20];
-rz(0.46450907397842434) q[20];
-cx q[15],q[20];
-ry(pi/2) q[21];
-rx(pi) q[21];
-cx q[4],q[21];
-rz(0.46450907397842434) q[21];
-cx q[4],q[21];
-cx q[15],q[21];
-rz(0.46450907397842434) q[21];
-cx q[15],q[21];
-ry(pi/2) q[22];
-rx(pi) q[22];
-cx q[3],q[22];
-rz(0.46450907397842434) q[22];
-cx q[3],q[22];
-cx q[9],q[22];
-rz(0.46450907397842434) q[22];
-cx q[9],q[22];
-rx(3.312892028470381) q[22];
-ry(pi/2) q[23];
-rx(pi) q[23];
-cx q[3],q[23];
-rz(0.46450907397842434) q[23];
-cx q[3],q[23];
-cx q[17],q[23];
-rz(0.46450907397842434) q[23];
-cx q[17],q[23];
-ry(pi/2) q[24];
-rx(pi) q[24];
-cx q[3],q[24];
-rz(0.46450907397842434) q[24];
-cx q[3],q[24];
-cx q[5],q[24];
-rz(0.46450907397842434) q[24];
-cx q[5],q[24];
-ry(pi/2) q[25];
-rx(pi) q[25];
-cx q[3],q[25];
-rz(0.46450907397842434) q[25];
-cx q[3],q[25];
-cx q[12],q[25];
-rz(0.46450907397842434) q[25];
-cx q[12],q[25];
-ry(pi/2) q[26];
-rx(pi) q[26];
-cx q[3],q[26];
-rz(0.46450907397842434) q[26];
-cx q[3],q[26];
-cx q[21],q[26];
-rz(0.46450907397842434) q[26];
-cx q[21],q[26];
-ry(pi/2) q[27];
-rx(pi) q[27];
-cx q[4],q[27];
-rz(0.46450907397842434) q[27];
-cx q[4],q[27];
-cx q[6],q[27];
-rz(0.46450907397842434) q[27];
-cx q[6],q[27];
-ry(pi/2) q[28];
-rx(pi) q[28];
-cx q[1],q[28];
-rz(0.46450907397842434) q[28];
-cx q[1],q[28];
-cx q[3],q[28];
-rz(0.46450907397842434) q[28];
-cx q[3],q[28];
-ry(pi/2) q[29];
-rx(pi) q[29];
-cx q[1],q[29];
-rz(0.46450907397842434) q[29];
-cx q[1],q[29];
-cx q[3],q[29];
-rz(0.46450907397842434) q[29];
-cx q[3],q[29];
-rx(3.312892028470381) q[29];
-ry(pi/2) q[30];
-rx(pi) q[30];
-cx q[3],q[30];
-rz(0.46450907397842434) q[30];
-cx q[3],q[30];
-cx q[18],q[30];
-rz(0.46450907397842434) q[30];
-cx q[18],q[30];
-rx(3.312892028470381) q[18];
-ry(pi/2) q[31];
-rx(pi) q[31];
-cx q[12],q[31];
-rz(0.46450907397842434) q[31];
-cx q[12],q[31];
-cx q[26],q[31];
-rz(0.46450907397842434) q[31];
-cx q[26],q[31];
-ry(pi/2) q[32];
-rx(pi) q[32];
-cx q[0],q[32];
-rz(0.46450907397842434) q[32];
-cx q[0],q[32];
-cx q[21],q[32];
-rz(0.46450907397842434) q[32];
-cx q[21],q[32];
-ry(pi/2) q[33];
-rx(pi) q[33];
-cx q[5],q[33];
-rz(0.46450907397842434) q[33];
-cx q[5],q[33];
-cx q[30],q[33];
-rz(0.46450907397842434) q[33];
-cx q[30],q[33];
-rx(3.312892028470381) q[33];
-ry(pi/2) q[34];
-rx(pi) q[34];
-cx q[3],q[34];
-rz(0.46450907397842434) q[34];
-cx q[3],q[34];
-cx q[12],q[34];
-rz(0.46450907397842434) q[34];
-cx q[12],q[34];
-ry(pi/2) q[35];
-rx(pi) q[35];
-cx q[3],q[35];
-rz(0.46450907397842434) q[35];
-cx q[3],q[35];
-cx q[32],q[35];
-rz(0.46450907397842434) q[35];
-cx q[32],q[35];
-ry(pi/2) q[36];
-rx(pi) q[36];
-cx q[15],q[36];
-rz(0.46450907397842434) q[36];
-cx q[15],q[36];
-cx q[20],q[36];
-rz(0.46450907397842434) q[36];
-cx q[20],q[36];
-ry(pi/2) q[37];
-rx(pi) q[37];
-cx q[10],q[37];
-rz(0.46450907397842434) q[37];
-cx q[10],q[37];
-cx q[34],q[37];
-rz(0.46450907397842434) q[37];
-cx q[34],q[37];
-rx(3.312892028470381) q[34];
-ry(pi/2) q[38];
-rx(pi) q[38];
-cx q[19],q[38];
-rz(0.46450907397842434) q[38];
-cx q[19],q[38];
-rx(3.312892028470381) q[19];
-cx q[21],q[38];
-rz(0.46450907397842434) q[38];
-cx q[21],q[38];
-ry(pi/2) q[39];
-rx(pi) q[39];
-cx q[3],q[39];
-rz(0.46450907397842434) q[39];
-cx q[3],q[39];
-cx q[13],q[39];
-rz(0.46450907397842434) q[39];
-cx q[13],q[39];
-ry(pi/2) q[40];
-rx(pi) q[40];
-cx q[3],q[40];
-rz(0.46450907397842434) q[40];
-cx q[3],q[40];
-cx q[23],q[40];
-rz(0.46450907397842434) q[40];
-cx q[23],q[40];
-ry(pi/2) q[41];
-rx(pi) q[41];
-cx q[10],q[41];
-rz(0.46450907397842434) q[41];
-cx q[10],q[41];
-cx q[27],q[41];
-rz(0.46450907397842434) q[41];
-cx q[27],q[41];
-ry(pi/2) q[42];
-rx(pi) q[42];
-cx q[0],q[42];
-rz(0.46450907397842434) q[42];
-cx q[0],q[42];
-cx q[3],q[42];
-rz(0.46450907397842434) q[42];
-cx q[3],q[42];
-ry(pi/2) q[43];
-rx(pi) q[43];
-cx q[3],q[43];
-rz(0.46450907397842434) q[43];
-cx q[3],q[43];
-cx q[20],q[43];
-rz(0.46450907397842434) q[43];
-cx q[20],q[43];
-rx(3.312892028470381) q[43];
-ry(pi/2) q[44];
-rx(pi) q[44];
-cx q[3],q[44];
-rz(0.46450907397842434) q[44];
-cx q[3],q[44];
-cx q[12],q[44];
-rz(0.46450907397842434) q[44];
-cx q[12],q[44];
-ry(pi/2) q[45];
-rx(pi) q[45];
-cx q[1],q[45];
-rz(0.46450907397842434) q[45];
-cx q[1],q[45];
-cx q[16],q[45];
-rz(0.46450907397842434) q[45];
-cx q[16],q[45];
-ry(pi/2) q[46];
-rx(pi) q[46];
-cx q[5],q[46];
-rz(0.46450907397842434) q[46];
-cx q[5],q[46];
-cx q[38],q[46];
-rz(0.46450907397842434) q[46];
-cx q[38],q[46];
-rx(3.312892028470381) q[38];
-ry(pi/2) q[47];
-rx(pi) q[47];
-cx q[4],q[47];
-rz(0.46450907397842434) q[47];
-cx q[4],q[47];
-cx q[17],q[47];
-rz(0.46450907397842434) q[47];
-cx q[17],q[47];
-ry(pi/2) q[48];
-rx(pi) q[48];
-cx q[0],q[48];
-rz(0.46450907397842434) q[48];
-cx q[0],q[48];
-cx q[30],q[48];
-rz(0.46450907397842434) q[48];
-cx q[30],q[48];
-rx(3.312892028470381) q[48];
-ry(pi/2) q[49];
-rx(pi) q[49];
-cx q[3],q[49];
-rz(0.46450907397842434) q[49];
-cx q[3],q[49];
-cx q[4],q[49];
-rz(0.46450907397842434) q[49];
-cx q[4],q[49];
-rx(3.312892028470381) q[49];
-ry(pi/2) q[50];
-rx(pi) q[50];
-cx q[3],q[50];
-rz(0.46450907397842434) q[50];
-cx q[3],q[50];
-cx q[12],q[50];
-rz(0.46450907397842434) q[50];
-cx q[12],q[50];
-ry(pi/2) q[51];
-rx(pi) q[51];
-cx q[0],q[51];
-rz(0.46450907397842434) q[51];
-cx q[0],q[51];
-cx q[28],q[51];
-rz(0.46450907397842434) q[51];
-cx q[28],q[51];
-rx(3.312892028470381) q[51];
-ry(pi/2) q[52];
-rx(pi) q[52];
-cx q[3],q[52];
-rz(0.46450907397842434) q[52];
-cx q[3],q[52];
-cx q[10],q[52];
-rz(0.46450907397842434) q[52];
-cx q[10],q[52];
-ry(pi/2) q[53];
-rx(pi) q[53];
-cx q[17],q[53];
-rz(0.46450907397842434) q[53];
-cx q[17],q[53];
-cx q[21],q[53];
-rz(0.46450907397842434) q[53];
-cx q[21],q[53];
-ry(pi/2) q[54];
-rx(pi) q[54];
-cx q[24],q[54];
-rz(0.46450907397842434) q[54];
-cx q[24],q[54];
-cx q[28],q[54];
-rz(0.46450907397842434) q[54];
-cx q[28],q[54];
-rx(3.312892028470381) q[54];
-ry(pi/2) q[55];
-rx(pi) q[55];
-cx q[9],q[55];
-rz(0.46450907397842434) q[55];
-cx q[9],q[55];
-cx q[15],q[55];
-rz(0.46450907397842434) q[55];
-cx q[15],q[55];
-ry(pi/2) q[56];
-rx(pi) q[56];
-cx q[13],q[56];
-rz(0.46450907397842434) q[56];
-cx q[13],q[56];
-cx q[45],q[56];
-rz(0.46450907397842434) q[56];
-cx q[45],q[56];
-rx(3.312892028470381) q[45];
-ry(pi/2) q[57];
-rx(pi) q[57];
-cx q[1],q[57];
-rz(0.46450907397842434) q[57];
-cx q[1],q[57];
-cx q[3],q[57];
-rz(0.46450907397842434) q[57];
-cx q[3],q[57];
-ry(pi/2) q[58];
-rx(pi) q[58];
-cx q[24],q[58];
-rz(0.46450907397842434) q[58];
-cx q[24],q[58];
-cx q[28],q[58];
-rz(0.46450907397842434) q[58];
-cx q[28],q[58];
-rx(3.312892028470381) q[58];
-ry(pi/2) q[59];
-rx(pi) q[59];
-cx q[16],q[59];
-rz(0.46450907397842434) q[59];
-cx q[16],q[59];
-cx q[32],q[59];
-rz(0.46450907397842434) q[59];
-cx q[32],q[59];
-ry(pi/2) q[60];
-rx(pi) q[60];
-cx q[1],q[60];
-rz(0.46450907397842434) q[60];
-cx q[1],q[60];
-cx q[7],q[60];
-rz(0.46450907397842434) q[60];
-cx q[7],q[60];
-ry(pi/2) q[61];
-rx(pi) q[61];
-cx q[4],q[61];
-rz(0.46450907397842434) q[61];
-cx q[4],q[61];
-cx q[7],q[61];
-rz(0.46450907397842434) q[61];
-cx q[7],q[61];
-rx(3.312892028470381) q[61];
-ry(pi/2) q[62];
-rx(pi) q[62];
-cx q[0],q[62];
-rz(0.46450907397842434) q[62];
-cx q[0],q[62];
-cx q[17],q[62];
-rz(0.46450907397842434) q[62];
-cx q[17],q[62];
-ry(pi/2) q[63];
-rx(pi) q[63];
-cx q[12],q[63];
-rz(0.46450907397842434) q[63];
-cx q[12],q[63];
-cx q[17],q[63];
-rz(0.46450907397842434) q[63];
-cx q[17],q[63];
-ry(pi/2) q[64];
-rx(pi) q[64];
-cx q[0],q[64];
-rz(0.46450907397842434) q[64];
-cx q[0],q[64];
-cx q[10],q[64];
-rz(0.46450907397842434) q[64];
-cx q[10],q[64];
-rx(3.312892028470381) q[64];
-ry(pi/2) q[65];
-rx(pi) q[65];
-cx q[5],q[65];
-rz(0.46450907397842434) q[65];
-cx q[5],q[65];
-cx q[23],q[65];
-rz(0.46450907397842434) q[65];
-cx q[23],q[65];
-rx(3.312892028470381) q[23];
-rx(3.312892028470381) q[65];
-ry(pi/2) q[66];
-rx(pi) q[66];
-cx q[17],q[66];
-rz(0.46450907397842434) q[66];
-cx q[17],q[66];
-rx(3.312892028470381) q[17];
-cx q[47],q[66];
-rz(0.46450907397842434) q[66];
-cx q[47],q[66];
-rx(3.312892028470381) q[47];
-rx(3.312892028470381) q[66];
-ry(pi/2) q[67];
-rx(pi) q[67];
-cx q[41],q[67];
-rz(0.46450907397842434) q[67];
-cx q[41],q[67];
-cx q[56],q[67];
-rz(0.46450907397842434) q[67];
-cx q[56],q[67];
-rx(3.312892028470381) q[67];
-ry(pi/2) q[68];
-rx(pi) q[68];
-cx q[13],q[68];
-rz(0.46450907397842434) q[68];
-cx q[13],q[68];
-cx q[32],q[68];
-rz(0.46450907397842434) q[68];
-cx q[32],q[68];
-ry(pi/2) q[69];
-rx(pi) q[69];
-cx q[6],q[69];
-rz(0.46450907397842434) q[69];
-cx q[6],q[69];
-cx q[59],q[69];
-rz(0.46450907397842434) q[69];
-cx q[59],q[69];
-ry(pi/2) q[70];
-rx(pi) q[70];
-cx q[3],q[70];
-rz(0.46450907397842434) q[70];
-cx q[3],q[70];
-cx q[15],q[70];
-rz(0.46450907397842434) q[70];
-cx q[15],q[70];
-ry(pi/2) q[71];
-rx(pi) q[71];
-cx q[3],q[71];
-rz(0.46450907397842434) q[71];
-cx q[3],q[71];
-cx q[53],q[71];
-rz(0.46450907397842434) q[71];
-cx q[53],q[71];
-rx(3.312892028470381) q[71];
-ry(pi/2) q[72];
-rx(pi) q[72];
-cx q[27],q[72];
-rz(0.46450907397842434) q[72];
-cx q[27],q[72];
-cx q[44],q[72];
-rz(0.46450907397842434) q[72];
-cx q[44],q[72];
-rx(3.312892028470381) q[44];
-rx(3.312892028470381) q[72];
-ry(pi/2) q[73];
-rx(pi) q[73];
-cx q[16],q[73];
-rz(0.46450907397842434) q[73];
-cx q[16],q[73];
-cx q[59],q[73];
-rz(0.46450907397842434) q[73];
-cx q[59],q[73];
-ry(pi/2) q[74];
-rx(pi) q[74];
-cx q[56],q[74];
-rz(0.46450907397842434) q[74];
-cx q[56],q[74];
-cx q[63],q[74];
-rz(0.46450907397842434) q[74];
-cx q[63],q[74];
-rx(3.312892028470381) q[74];
-ry(pi/2) q[75];
-rx(pi) q[75];
-cx q[0],q[75];
-rz(0.46450907397842434) q[75];
-cx q[0],q[75];
-cx q[21],q[75];
-rz(0.46450907397842434) q[75];
-cx q[21],q[75];
-rx(3.312892028470381) q[75];
-ry(pi/2) q[76];
-rx(pi) q[76];
-cx q[5],q[76];
-rz(0.46450907397842434) q[76];
-cx q[5],q[76];
-cx q[6],q[76];
-rz(0.46450907397842434) q[76];
-cx q[6],q[76];
-rx(3.312892028470381) q[76];
-ry(pi/2) q[77];
-rx(pi) q[77];
-cx q[3],q[77];
-rz(0.46450907397842434) q[77];
-cx q[3],q[77];
-cx q[30],q[77];
-rz(0.46450907397842434) q[77];
-cx q[30],q[77];
-rx(3.312892028470381) q[30];
-ry(pi/2) q[78];
-rx(pi) q[78];
-cx q[42],q[78];
-rz(0.46450907397842434) q[78];
-cx q[42],q[78];
-cx q[60],q[78];
-rz(0.46450907397842434) q[78];
-cx q[60],q[78];
-rx(3.312892028470381) q[78];
-ry(pi/2) q[79];
-rx(pi) q[79];
-cx q[6],q[79];
-rz(0.46450907397842434) q[79];
-cx q[6],q[79];
-cx q[50],q[79];
-rz(0.46450907397842434) q[79];
-cx q[50],q[79];
-rx(3.312892028470381) q[79];
-ry(pi/2) q[80];
-rx(pi) q[80];
-cx q[9],q[80];
-rz(0.46450907397842434) q[80];
-cx q[9],q[80];
-rx(3.312892028470381) q[9];
-cx q[15],q[80];
-rz(0.46450907397842434) q[80];
-cx q[15],q[80];
-rx(3.312892028470381) q[80];
-ry(pi/2) q[81];
-rx(pi) q[81];
-cx q[21],q[81];
-rz(0.46450907397842434) q[81];
-cx q[21],q[81];
-cx q[77],q[81];
-rz(0.46450907397842434) q[81];
-cx q[77],q[81];
-rx(3.312892028470381) q[77];
-ry(pi/2) q[82];
-rx(pi) q[82];
-cx q[0],q[82];
-rz(0.46450907397842434) q[82];
-cx q[0],q[82];
-cx q[56],q[82];
-rz(0.46450907397842434) q[82];
-cx q[56],q[82];
-rx(3.312892028470381) q[82];
-ry(pi/2) q[83];
-rx(pi) q[83];
-cx q[8],q[83];
-rz(0.46450907397842434) q[83];
-cx q[8],q[83];
-rx(3.312892028470381) q[8];
-cx q[68],q[83];
-rz(0.46450907397842434) q[83];
-cx q[68],q[83];
-rx(3.312892028470381) q[68];
-rx(3.312892028470381) q[83];
-ry(pi/2) q[84];
-rx(pi) q[84];
-cx q[70],q[84];
-rz(0.46450907397842434) q[84];
-cx q[70],q[84];
-rx(3.312892028470381) q[70];
-cx q[73],q[84];
-rz(0.46450907397842434) q[84];
-cx q[73],q[84];
-rx(3.312892028470381) q[73];
-rx(3.312892028470381) q[84];
-ry(pi/2) q[85];
-rx(pi) q[85];
-cx q[37],q[85];
-rz(0.46450907397842434) q[85];
-cx q[37],q[85];
-cx q[59],q[85];
-rz(0.46450907397842434) q[85];
-cx q[59],q[85];
-rx(3.312892028470381) q[59];
-rx(3.312892028470381) q[85];
-ry(pi/2) q[86];
-rx(pi) q[86];
-cx q[24],q[86];
-rz(0.46450907397842434) q[86];
-cx q[24],q[86];
-cx q[53],q[86];
-rz(0.46450907397842434) q[86];
-cx q[53],q[86];
-rx(3.312892028470381) q[86];
-ry(pi/2) q[87];
-rx(pi) q[87];
-cx q[28],q[87];
-rz(0.46450907397842434) q[87];
-cx q[28],q[87];
-cx q[32],q[87];
-rz(0.46450907397842434) q[87];
-cx q[32],q[87];
-rx(3.312892028470381) q[87];
-ry(pi/2) q[88];
-rx(pi) q[88];
-cx q[3],q[88];
-rz(0.46450907397842434) q[88];
-cx q[3],q[88];
-cx q[60],q[88];
-rz(0.46450907397842434) q[88];
-cx q[60],q[88];
-rx(3.312892028470381) q[60];
-rx(3.312892028470381) q[88];
-ry(pi/2) q[89];
-rx(pi) q[89];
-cx q[2],q[89];
-rz(0.46450907397842434) q[89];
-cx q[2],q[89];
-rx(3.312892028470381) q[2];
-cx q[5],q[89];
-rz(0.46450907397842434) q[89];
-cx q[5],q[89];
-ry(pi/2) q[90];
-rx(pi) q[90];
-cx q[15],q[90];
-rz(0.46450907397842434) q[90];
-cx q[15],q[90];
-cx q[27],q[90];
-rz(0.46450907397842434) q[90];
-cx q[27],q[90];
-rx(3.312892028470381) q[90];
-ry(pi/2) q[91];
-rx(pi) q[91];
-cx q[0],q[91];
-rz(0.46450907397842434) q[91];
-cx q[0],q[91];
-cx q[6],q[91];
-rz(0.46450907397842434) q[91];
-cx q[6],q[91];
-rx(3.312892028470381) q[6];
-ry(pi/2) q[92];
-rx(pi) q[92];
-cx q[15],q[92];
-rz(0.46450907397842434) q[92];
-cx q[15],q[92];
-cx q[89],q[92];
-rz(0.46450907397842434) q[92];
-cx q[89],q[92];
-ry(pi/2) q[93];
-rx(pi) q[93];
-cx q[0],q[93];
-rz(0.46450907397842434) q[93];
-cx q[0],q[93];
-cx q[32],q[93];
-rz(0.46450907397842434) q[93];
-cx q[32],q[93];
-rx(3.312892028470381) q[93];
-ry(pi/2) q[94];
-rx(pi) q[94];
-cx q[36],q[94];
-rz(0.46450907397842434) q[94];
-cx q[36],q[94];
-cx q[55],q[94];
-rz(0.46450907397842434) q[94];
-cx q[55],q[94];
-rx(3.312892028470381) q[55];
-ry(pi/2) q[95];
-rx(pi) q[95];
-cx q[5],q[95];
-rz(0.46450907397842434) q[95];
-cx q[5],q[95];
-cx q[27],q[95];
-rz(0.46450907397842434) q[95];
-cx q[27],q[95];
-rx(3.312892028470381) q[27];
-rx(3.312892028470381) q[95];
-ry(pi/2) q[96];
-rx(pi) q[96];
-cx q[56],q[96];
-rz(0.46450907397842434) q[96];
-cx q[56],q[96];
-rx(3.312892028470381) q[56];
-cx q[92],q[96];
-rz(0.46450907397842434) q[96];
-cx q[92],q[96];
-rx(3.312892028470381) q[96];
-ry(pi/2) q[97];
-rx(pi) q[97];
-cx q[1],q[97];
-rz(0.46450907397842434) q[97];
-cx q[1],q[97];
-cx q[7],q[97];
-rz(0.46450907397842434) q[97];
-cx q[7],q[97];
-rx(3.312892028470381) q[97];
-ry(pi/2) q[98];
-rx(pi) q[98];
-cx q[10],q[98];
-rz(0.46450907397842434) q[98];
-cx q[10],q[98];
-rx(3.312892028470381) q[10];
-cx q[21],q[98];
-rz(0.46450907397842434) q[98];
-cx q[21],q[98];
-rx(3.312892028470381) q[98];
-ry(pi/2) q[99];
-rx(pi) q[99];
-cx q[4],q[99];
-rz(0.46450907397842434) q[99];
-cx q[4],q[99];
-cx q[41],q[99];
-rz(0.46450907397842434) q[99];
-cx q[41],q[99];
-rx(3.312892028470381) q[41];
-rx(3.312892028470381) q[99];
-ry(pi/2) q[100];
-rx(pi) q[100];
-cx q[3],q[100];
-rz(0.46450907397842434) q[100];
-cx q[3],q[100];
-cx q[25],q[100];
-rz(0.46450907397842434) q[100];
-cx q[25],q[100];
-rx(3.312892028470381) q[25];
-rx(3.312892028470381) q[100];
-ry(pi/2) q[101];
-rx(pi) q[101];
-cx q[16],q[101];
-rz(0.46450907397842434) q[101];
-cx q[16],q[101];
-cx q[50],q[101];
-rz(0.46450907397842434) q[101];
-cx q[50],q[101];
-rx(3.312892028470381) q[101];
-ry(pi/2) q[102];
-rx(pi) q[102];
-cx q[3],q[102];
-rz(0.46450907397842434) q[102];
-cx q[3],q[102];
-cx q[4],q[102];
-rz(0.46450907397842434) q[102];
-cx q[4],q[102];
-rx(3.312892028470381) q[102];
-ry(pi/2) q[103];
-rx(pi) q[103];
-cx q[16],q[103];
-rz(0.46450907397842434) q[103];
-cx q[16],q[103];
-rx(3.312892028470381) q[16];
-cx q[57],q[103];
-rz(0.46450907397842434) q[103];
-cx q[57],q[103];
-rx(3.312892028470381) q[57];
-rx(3.312892028470381) q[103];
-ry(pi/2) q[104];
-rx(pi) q[104];
-cx q[7],q[104];
-rz(0.46450907397842434) q[104];
-cx q[7],q[104];
-cx q[13],q[104];
-rz(0.46450907397842434) q[104];
-cx q[13],q[104];
-rx(3.312892028470381) q[13];
-ry(pi/2) q[105];
-rx(pi) q[105];
-cx q[26],q[105];
-rz(0.46450907397842434) q[105];
-cx q[26],q[105];
-cx q[28],q[105];
-rz(0.46450907397842434) q[105];
-cx q[28],q[105];
-rx(3.312892028470381) q[105];
-ry(pi/2) q[106];
-rx(pi) q[106];
-cx q[5],q[106];
-rz(0.46450907397842434) q[106];
-cx q[5],q[106];
-cx q[36],q[106];
-rz(0.46450907397842434) q[106];
-cx q[36],q[106];
-rx(3.312892028470381) q[106];
-ry(pi/2) q[107];
-rx(pi) q[107];
-cx q[3],q[107];
-rz(0.46450907397842434) q[107];
-cx q[3],q[107];
-cx q[31],q[107];
-rz(0.46450907397842434) q[107];
-cx q[31],q[107];
-rx(3.312892028470381) q[107];
-ry(pi/2) q[108];
-rx(pi) q[108];
-cx q[15],q[108];
-rz(0.46450907397842434) q[108];
-cx q[15],q[108];
-cx q[31],q[108];
-rz(0.46450907397842434) q[108];
-cx q[31],q[108];
-rx(3.312892028470381) q[31];
-rx(3.312892028470381) q[108];
-ry(pi/2) q[109];
-rx(pi) q[109];
-cx q[5],q[109];
-rz(0.46450907397842434) q[109];
-cx q[5],q[109];
-cx q[39],q[109];
-rz(0.46450907397842434) q[109];
-cx q[39],q[109];
-rx(3.312892028470381) q[39];
-ry(pi/2) q[110];
-rx(pi) q[110];
-cx q[3],q[110];
-rz(0.46450907397842434) q[110];
-cx q[3],q[110];
-cx q[24],q[110];
-rz(0.46450907397842434) q[110];
-cx q[24],q[110];
-rx(3.312892028470381) q[24];
-ry(pi/2) q[111];
-rx(pi) q[111];
-cx q[3],q[111];
-rz(0.46450907397842434) q[111];
-cx q[3],q[111];
-cx q[21],q[111];
-rz(0.46450907397842434) q[111];
-cx q[21],q[111];
-rx(3.312892028470381) q[111];
-ry(pi/2) q[112];
-rx(pi) q[112];
-cx q[21],q[112];
-rz(0.46450907397842434) q[112];
-cx q[21],q[112];
-rx(3.312892028470381) q[21];
-cx q[36],q[112];
-rz(0.46450907397842434) q[112];
-cx q[36],q[112];
-rx(3.312892028470381) q[36];
-rx(3.312892028470381) q[112];
-ry(pi/2) q[113];
-rx(pi) q[113];
-cx q[1],q[113];
-rz(0.46450907397842434) q[113];
-cx q[1],q[113];
-rx(3.312892028470381) q[1];
-cx q[3],q[113];
-rz(0.46450907397842434) q[113];
-cx q[3],q[113];
-rx(3.312892028470381) q[113];
-ry(pi/2) q[114];
-rx(pi) q[114];
-cx q[104],q[114];
-rz(0.46450907397842434) q[114];
-cx q[104],q[114];
-cx q[110],q[114];
-rz(0.46450907397842434) q[114];
-cx q[110],q[114];
-rx(3.312892028470381) q[110];
-rx(3.312892028470381) q[114];
-ry(pi/2) q[115];
-rx(pi) q[115];
-cx q[15],q[115];
-rz(0.46450907397842434) q[115];
-cx q[15],q[115];
-cx q[92],q[115];
-rz(0.46450907397842434) q[115];
-cx q[92],q[115];
-rx(3.312892028470381) q[92];
-rx(3.312892028470381) q[115];
-ry(pi/2) q[116];
-rx(pi) q[116];
-cx q[28],q[116];
-rz(0.46450907397842434) q[116];
-cx q[28],q[116];
-rx(3.312892028470381) q[28];
-cx q[42],q[116];
-rz(0.46450907397842434) q[116];
-cx q[42],q[116];
-rx(3.312892028470381) q[42];
-rx(3.312892028470381) q[116];
-ry(pi/2) q[117];
-rx(pi) q[117];
-cx q[26],q[117];
-rz(0.46450907397842434) q[117];
-cx q[26],q[117];
-rx(3.312892028470381) q[26];
-cx q[32],q[117];
-rz(0.46450907397842434) q[117];
-cx q[32],q[117];
-rx(3.312892028470381) q[117];
-ry(pi/2) q[118];
-rx(pi) q[118];
-cx q[5],q[118];
-rz(0.46450907397842434) q[118];
-cx q[5],q[118];
-rx(3.312892028470381) q[5];
-cx q[15],q[118];
-rz(0.46450907397842434) q[118];
-cx q[15],q[118];
-rx(3.312892028470381) q[15];
-rx(3.312892028470381) q[118];
-ry(pi/2) q[119];
-rx(pi) q[119];
-cx q[40],q[119];
-rz(0.46450907397842434) q[119];
-cx q[40],q[119];
-rx(3.312892028470381) q[40];
-cx q[69],q[119];
-rz(0.46450907397842434) q[119];
-cx q[69],q[119];
-rx(3.312892028470381) q[69];
-rx(3.312892028470381) q[119];
-ry(pi/2) q[120];
-rx(pi) q[120];
-cx q[46],q[120];
-rz(0.46450907397842434) q[120];
-cx q[46],q[120];
-rx(3.312892028470381) q[46];
-cx q[94],q[120];
-rz(0.46450907397842434) q[120];
-cx q[94],q[120];
-rx(3.312892028470381) q[94];
-rx(3.312892028470381) q[120];
-ry(pi/2) q[121];
-rx(pi) q[121];
-cx q[20],q[121];
-rz(0.46450907397842434) q[121];
-cx q[20],q[121];
-rx(3.312892028470381) q[20];
-cx q[104],q[121];
-rz(0.46450907397842434) q[121];
-cx q[104],q[121];
-rx(3.312892028470381) q[104];
-rx(3.312892028470381) q[121];
-ry(pi/2) q[122];
-rx(pi) q[122];
-cx q[63],q[122];
-rz(0.46450907397842434) q[122];
-cx q[63],q[122];
-rx(3.312892028470381) q[63];
-cx q[81],q[122];
-rz(0.46450907397842434) q[122];
-cx q[81],q[122];
-rx(3.312892028470381) q[122];
-ry(pi/2) q[123];
-rx(pi) q[123];
-cx q[0],q[123];
-rz(0.46450907397842434) q[123];
-cx q[0],q[123];
-cx q[52],q[123];
-rz(0.46450907397842434) q[123];
-cx q[52],q[123];
-rx(3.312892028470381) q[52];
-ry(pi/2) q[124];
-rx(pi) q[124];
-cx q[53],q[124];
-rz(0.46450907397842434) q[124];
-cx q[53],q[124];
-rx(3.312892028470381) q[53];
-cx q[81],q[124];
-rz(0.46450907397842434) q[124];
-cx q[81],q[124];
-rx(3.312892028470381) q[81];
-rx(3.312892028470381) q[124];
-ry(pi/2) q[125];
-rx(pi) q[125];
-cx q[3],q[125];
-rz(0.46450907397842434) q[125];
-cx q[3],q[125];
-cx q[109],q[125];
-rz(0.46450907397842434) q[125];
-cx q[109],q[125];
-rx(3.312892028470381) q[125];
-ry(pi/2) q[126];
-rx(pi) q[126];
-cx q[0],q[126];
-rz(0.46450907397842434) q[126];
-cx q[0],q[126];
-rx(3.312892028470381) q[0];
-cx q[0],q[1];
-rz(0.39985135775015646) q[1];
-cx q[0],q[1];
-cx q[0],q[2];
-rz(0.39985135775015646) q[2];
-cx q[0],q[2];
-cx q[12],q[126];
-rz(0.46450907397842434) q[126];
-cx q[12],q[126];
-rx(3.312892028470381) q[12];
-rx(3.312892028470381) q[126];
-ry(pi/2) q[127];
-rx(pi) q[127];
-cx q[4],q[127];
-rz(0.46450907397842434) q[127];
-cx q[4],q[127];
-rx(3.312892028470381) q[4];
-cx q[62],q[127];
-rz(0.46450907397842434) q[127];
-cx q[62],q[127];
-rx(3.312892028470381) q[127];
-ry(pi/2) q[128];
-rx(pi) q[128];
-cx q[62],q[128];
-rz(0.46450907397842434) q[128];
-cx q[62],q[128];
-rx(3.312892028470381) q[62];
-cx q[109],q[128];
-rz(0.46450907397842434) q[128];
-cx q[109],q[128];
-rx(3.312892028470381) q[128];
-ry(pi/2) q[129];
-rx(pi) q[129];
-cx q[50],q[129];
-rz(0.46450907397842434) q[129];
-cx q[50],q[129];
-rx(3.312892028470381) q[50];
-cx q[91],q[129];
-rz(0.46450907397842434) q[129];
-cx q[91],q[129];
-rx(3.312892028470381) q[91];
-rx(3.312892028470381) q[129];
-ry(pi/2) q[130];
-rx(pi) q[130];
-cx q[35],q[130];
-rz(0.46450907397842434) q[130];
-cx q[35],q[130];
-rx(3.312892028470381) q[35];
-cx q[109],q[130];
-rz(0.46450907397842434) q[130];
-cx q[109],q[130];
-rx(3.312892028470381) q[109];
-rx(3.312892028470381) q[130];
-ry(pi/2) q[131];
-rx(pi) q[131];
-cx q[32],q[131];
-rz(0.46450907397842434) q[131];
-cx q[32],q[131];
-rx(3.312892028470381) q[32];
-cx q[123],q[131];
-rz(0.46450907397842434) q[131];
-cx q[123],q[131];
-rx(3.312892028470381) q[123];
-rx(3.312892028470381) q[131];
-ry(pi/2) q[132];
-rx(pi) q[132];
-cx q[3],q[132];
-rz(0.46450907397842434) q[132];
-cx q[3],q[132];
-rx(3.312892028470381) q[3];
-cx q[0],q[3];
-rz(0.39985135775015646) q[3];
-cx q[0],q[3];
-cx q[0],q[15];
-cx q[1],q[3];
-rz(0.39985135775015646) q[3];
-cx q[1],q[3];
-cx q[1],q[4];
-rz(0.39985135775015646) q[4];
-cx q[1],q[4];
-cx q[1],q[5];
-cx q[3],q[4];
-rz(0.39985135775015646) q[4];
-cx q[3],q[4];
-cx q[4],q[6];
-rz(0.39985135775015646) q[5];
-cx q[1],q[5];
-cx q[1],q[9];
-cx q[3],q[5];
-rz(0.39985135775015646) q[5];
-cx q[3],q[5];
-rz(0.39985135775015646) q[6];
-cx q[4],q[6];
-cx q[5],q[6];
-rz(0.39985135775015646) q[6];
-cx q[5],q[6];
-rz(0.39985135775015646) q[9];
-cx q[1],q[9];
-cx q[1],q[17];
-rz(0.39985135775015646) q[15];
-cx q[0],q[15];
-cx q[0],q[16];
-rz(0.39985135775015646) q[16];
-cx q[0],q[16];
-cx q[0],q[20];
-rz(0.39985135775015646) q[17];
-cx q[1],q[17];
-cx q[1],q[28];
-rz(0.39985135775015646) q[20];
-cx q[0],q[20];
-cx q[0],q[32];
-rz(0.39985135775015646) q[28];
-cx q[1],q[28];
-cx q[1],q[29];
-rz(0.39985135775015646) q[29];
-cx q[1],q[29];
-cx q[1],q[45];
-rz(0.39985135775015646) q[32];
-cx q[0],q[32];
-cx q[0],q[42];
-cx q[37],q[132];
-rz(0.39985135775015646) q[42];
-cx q[0],q[42];
-cx q[0],q[48];
-rz(0.39985135775015646) q[45];
-cx q[1],q[45];
-cx q[1],q[57];
-rz(0.39985135775015646) q[48];
-cx q[0],q[48];
-cx q[0],q[51];
-rz(0.39985135775015646) q[51];
-cx q[0],q[51];
-cx q[0],q[62];
-rz(0.39985135775015646) q[57];
-cx q[1],q[57];
-cx q[1],q[60];
-rz(0.39985135775015646) q[60];
-cx q[1],q[60];
-cx q[1],q[97];
-rz(0.39985135775015646) q[62];
-cx q[0],q[62];
-cx q[0],q[64];
-rz(0.39985135775015646) q[64];
-cx q[0],q[64];
-cx q[0],q[75];
-rz(0.39985135775015646) q[75];
-cx q[0],q[75];
-cx q[0],q[82];
-rz(0.39985135775015646) q[82];
-cx q[0],q[82];
-cx q[0],q[91];
-rz(0.39985135775015646) q[91];
-cx q[0],q[91];
-cx q[0],q[93];
-rz(0.39985135775015646) q[93];
-cx q[0],q[93];
-cx q[0],q[123];
-rz(0.39985135775015646) q[97];
-cx q[1],q[97];
-cx q[1],q[113];
-rz(0.39985135775015646) q[113];
-cx q[1],q[113];
-rx(8.302707954496386) q[1];
-rz(0.39985135775015646) q[123];
-cx q[0],q[123];
-cx q[0],q[126];
-rz(0.39985135775015646) q[126];
-cx q[0],q[126];
-rx(8.302707954496386) q[0];
-cx q[0],q[1];
-rz(0.3874383702223457) q[1];
-cx q[0],q[1];
-rz(0.46450907397842434) q[132];
-cx q[37],q[132];
-rx(3.312892028470381) q[37];
-rx(3.312892028470381) q[132];
-ry(pi/2) q[133];
-rx(pi) q[133];
-cx q[7],q[133];
-rz(0.46450907397842434) q[133];
-cx q[7],q[133];
-rx(3.312892028470381) q[7];
-cx q[3],q[7];
-rz(0.39985135775015646) q[7];
-cx q[3],q[7];
-cx q[3],q[8];
-cx q[4],q[7];
-rz(0.39985135775015646) q[7];
-cx q[4],q[7];
-cx q[4],q[10];
-rz(0.39985135775015646) q[8];
-cx q[3],q[8];
-cx q[3],q[9];
-cx q[5],q[8];
-rz(0.39985135775015646) q[8];
-cx q[5],q[8];
-cx q[5],q[11];
-cx q[8],q[83];
-rz(0.39985135775015646) q[9];
-cx q[3],q[9];
-cx q[3],q[12];
-rz(0.39985135775015646) q[10];
-cx q[4],q[10];
-cx q[4],q[13];
-cx q[6],q[10];
-rz(0.39985135775015646) q[10];
-cx q[6],q[10];
-cx q[10],q[37];
-rz(0.39985135775015646) q[11];
-cx q[5],q[11];
-cx q[6],q[11];
-rz(0.39985135775015646) q[11];
-cx q[6],q[11];
-rx(8.302707954496386) q[11];
-rz(0.39985135775015646) q[12];
-cx q[3],q[12];
-cx q[3],q[14];
-cx q[5],q[12];
-rz(0.39985135775015646) q[12];
-cx q[5],q[12];
-rz(0.39985135775015646) q[13];
-cx q[4],q[13];
-cx q[5],q[13];
-rz(0.39985135775015646) q[13];
-cx q[5],q[13];
-rz(0.39985135775015646) q[14];
-cx q[3],q[14];
-cx q[3],q[15];
-cx q[4],q[14];
-rz(0.39985135775015646) q[14];
-cx q[4],q[14];
-rx(8.302707954496386) q[14];
-rz(0.39985135775015646) q[15];
-cx q[3],q[15];
-cx q[3],q[16];
-cx q[15],q[20];
-rz(0.39985135775015646) q[16];
-cx q[3],q[16];
-cx q[3],q[17];
-cx q[16],q[45];
-rz(0.39985135775015646) q[17];
-cx q[3],q[17];
-cx q[3],q[18];
-rz(0.39985135775015646) q[18];
-cx q[3],q[18];
-cx q[3],q[19];
-cx q[4],q[18];
-rz(0.39985135775015646) q[18];
-cx q[4],q[18];
-cx q[4],q[21];
-rz(0.39985135775015646) q[19];
-cx q[3],q[19];
-cx q[3],q[22];
-cx q[7],q[19];
-rz(0.39985135775015646) q[19];
-cx q[7],q[19];
-cx q[7],q[60];
-cx q[19],q[38];
-rz(0.39985135775015646) q[20];
-cx q[15],q[20];
-rz(0.39985135775015646) q[21];
-cx q[4],q[21];
-cx q[4],q[27];
-cx q[15],q[21];
-rz(0.39985135775015646) q[21];
-cx q[15],q[21];
-cx q[15],q[36];
-rz(0.39985135775015646) q[22];
-cx q[3],q[22];
-cx q[3],q[23];
-cx q[9],q[22];
-rz(0.39985135775015646) q[22];
-cx q[9],q[22];
-cx q[9],q[55];
-rx(8.302707954496386) q[22];
-rz(0.39985135775015646) q[23];
-cx q[3],q[23];
-cx q[3],q[24];
-cx q[17],q[23];
-rz(0.39985135775015646) q[23];
-cx q[17],q[23];
-rz(0.39985135775015646) q[24];
-cx q[3],q[24];
-cx q[3],q[25];
-cx q[5],q[24];
-rz(0.39985135775015646) q[24];
-cx q[5],q[24];
-cx q[5],q[33];
-cx q[24],q[54];
-rz(0.39985135775015646) q[25];
-cx q[3],q[25];
-cx q[3],q[26];
-cx q[12],q[25];
-rz(0.39985135775015646) q[25];
-cx q[12],q[25];
-cx q[12],q[31];
-rz(0.39985135775015646) q[26];
-cx q[3],q[26];
-cx q[3],q[28];
-cx q[21],q[26];
-rz(0.39985135775015646) q[26];
-cx q[21],q[26];
-cx q[21],q[32];
-rz(0.39985135775015646) q[27];
-cx q[4],q[27];
-cx q[4],q[47];
-cx q[6],q[27];
-rz(0.39985135775015646) q[27];
-cx q[6],q[27];
-cx q[6],q[69];
-rz(0.39985135775015646) q[28];
-cx q[3],q[28];
-cx q[3],q[29];
-cx q[28],q[51];
-rz(0.39985135775015646) q[29];
-cx q[3],q[29];
-cx q[3],q[30];
-rx(8.302707954496386) q[29];
-rz(0.39985135775015646) q[30];
-cx q[3],q[30];
-cx q[3],q[34];
-cx q[18],q[30];
-rz(0.39985135775015646) q[30];
-cx q[18],q[30];
-rx(8.302707954496386) q[18];
-rz(0.39985135775015646) q[31];
-cx q[12],q[31];
-cx q[26],q[31];
-rz(0.39985135775015646) q[31];
-cx q[26],q[31];
-cx q[26],q[105];
-rz(0.39985135775015646) q[32];
-cx q[21],q[32];
-rz(0.39985135775015646) q[33];
-cx q[5],q[33];
-cx q[5],q[46];
-cx q[30],q[33];
-rz(0.39985135775015646) q[33];
-cx q[30],q[33];
-cx q[30],q[48];
-rx(8.302707954496386) q[33];
-rz(0.39985135775015646) q[34];
-cx q[3],q[34];
-cx q[3],q[35];
-cx q[12],q[34];
-rz(0.39985135775015646) q[34];
-cx q[12],q[34];
-rz(0.39985135775015646) q[35];
-cx q[3],q[35];
-cx q[3],q[39];
-cx q[32],q[35];
-rz(0.39985135775015646) q[35];
-cx q[32],q[35];
-cx q[35],q[130];
-rz(0.39985135775015646) q[36];
-cx q[15],q[36];
-cx q[20],q[36];
-rz(0.39985135775015646) q[36];
-cx q[20],q[36];
-cx q[36],q[94];
-rz(0.39985135775015646) q[37];
-cx q[10],q[37];
-cx q[10],q[41];
-cx q[34],q[37];
-rz(0.39985135775015646) q[37];
-cx q[34],q[37];
-rx(8.302707954496386) q[34];
-cx q[37],q[85];
-rz(0.39985135775015646) q[38];
-cx q[19],q[38];
-rx(8.302707954496386) q[19];
-cx q[21],q[38];
-rz(0.39985135775015646) q[38];
-cx q[21],q[38];
-rz(0.39985135775015646) q[39];
-cx q[3],q[39];
-cx q[3],q[40];
-cx q[13],q[39];
-rz(0.39985135775015646) q[39];
-cx q[13],q[39];
-cx q[13],q[56];
-rz(0.39985135775015646) q[40];
-cx q[3],q[40];
-cx q[3],q[42];
-cx q[23],q[40];
-rz(0.39985135775015646) q[40];
-cx q[23],q[40];
-cx q[40],q[119];
-rz(0.39985135775015646) q[41];
-cx q[10],q[41];
-cx q[27],q[41];
-rz(0.39985135775015646) q[41];
-cx q[27],q[41];
-cx q[27],q[72];
-cx q[41],q[67];
-rz(0.39985135775015646) q[42];
-cx q[3],q[42];
-cx q[3],q[43];
-cx q[42],q[78];
-rz(0.39985135775015646) q[43];
-cx q[3],q[43];
-cx q[3],q[44];
-cx q[20],q[43];
-rz(0.39985135775015646) q[43];
-cx q[20],q[43];
-cx q[20],q[121];
-rx(8.302707954496386) q[43];
-rz(0.39985135775015646) q[44];
-cx q[3],q[44];
-cx q[3],q[49];
-cx q[12],q[44];
-rz(0.39985135775015646) q[44];
-cx q[12],q[44];
-rz(0.39985135775015646) q[45];
-cx q[16],q[45];
-cx q[16],q[59];
-rz(0.39985135775015646) q[46];
-cx q[5],q[46];
-cx q[5],q[65];
-cx q[38],q[46];
-rz(0.39985135775015646) q[46];
-cx q[38],q[46];
-rx(8.302707954496386) q[38];
-cx q[46],q[120];
-rz(0.39985135775015646) q[47];
-cx q[4],q[47];
-cx q[17],q[47];
-rz(0.39985135775015646) q[47];
-cx q[17],q[47];
-cx q[17],q[53];
-rz(0.39985135775015646) q[48];
-cx q[30],q[48];
-rx(8.302707954496386) q[48];
-rz(0.39985135775015646) q[49];
-cx q[3],q[49];
-cx q[3],q[50];
-cx q[4],q[49];
-rz(0.39985135775015646) q[49];
-cx q[4],q[49];
-cx q[4],q[61];
-rx(8.302707954496386) q[49];
-rz(0.39985135775015646) q[50];
-cx q[3],q[50];
-cx q[3],q[52];
-cx q[12],q[50];
-rz(0.39985135775015646) q[50];
-cx q[12],q[50];
-cx q[12],q[63];
-rz(0.39985135775015646) q[51];
-cx q[28],q[51];
-rx(8.302707954496386) q[51];
-rz(0.39985135775015646) q[52];
-cx q[3],q[52];
-cx q[3],q[57];
-cx q[10],q[52];
-rz(0.39985135775015646) q[52];
-cx q[10],q[52];
-cx q[10],q[64];
-cx q[52],q[123];
-rz(0.39985135775015646) q[53];
-cx q[17],q[53];
-cx q[17],q[62];
-cx q[21],q[53];
-rz(0.39985135775015646) q[53];
-cx q[21],q[53];
-cx q[21],q[75];
-rz(0.39985135775015646) q[54];
-cx q[24],q[54];
-cx q[24],q[58];
-cx q[28],q[54];
-rz(0.39985135775015646) q[54];
-cx q[28],q[54];
-rx(8.302707954496386) q[54];
-rz(0.39985135775015646) q[55];
-cx q[9],q[55];
-cx q[9],q[80];
-cx q[15],q[55];
-rz(0.39985135775015646) q[55];
-cx q[15],q[55];
-rz(0.39985135775015646) q[56];
-cx q[13],q[56];
-cx q[13],q[68];
-cx q[45],q[56];
-rz(0.39985135775015646) q[56];
-cx q[45],q[56];
-rx(8.302707954496386) q[45];
-rz(0.39985135775015646) q[57];
-cx q[3],q[57];
-cx q[3],q[70];
-rz(0.39985135775015646) q[58];
-cx q[24],q[58];
-cx q[24],q[86];
-cx q[28],q[58];
-rz(0.39985135775015646) q[58];
-cx q[28],q[58];
-cx q[28],q[87];
-rx(8.302707954496386) q[58];
-rz(0.39985135775015646) q[59];
-cx q[16],q[59];
-cx q[16],q[73];
-cx q[32],q[59];
-rz(0.39985135775015646) q[59];
-cx q[32],q[59];
-rz(0.39985135775015646) q[60];
-cx q[7],q[60];
-rz(0.39985135775015646) q[61];
-cx q[4],q[61];
-cx q[4],q[99];
-cx q[7],q[61];
-rz(0.39985135775015646) q[61];
-cx q[7],q[61];
-cx q[7],q[97];
-rx(8.302707954496386) q[61];
-rz(0.39985135775015646) q[62];
-cx q[17],q[62];
-rz(0.39985135775015646) q[63];
-cx q[12],q[63];
-cx q[12],q[126];
-cx q[17],q[63];
-rz(0.39985135775015646) q[63];
-cx q[17],q[63];
-cx q[17],q[66];
-rz(0.39985135775015646) q[64];
-cx q[10],q[64];
-cx q[10],q[98];
-rx(8.302707954496386) q[64];
-rz(0.39985135775015646) q[65];
-cx q[5],q[65];
-cx q[5],q[76];
-cx q[23],q[65];
-rz(0.39985135775015646) q[65];
-cx q[23],q[65];
-rx(8.302707954496386) q[23];
-rx(8.302707954496386) q[65];
-rz(0.39985135775015646) q[66];
-cx q[17],q[66];
-rx(8.302707954496386) q[17];
-cx q[47],q[66];
-rz(0.39985135775015646) q[66];
-cx q[47],q[66];
-rx(8.302707954496386) q[47];
-rx(8.302707954496386) q[66];
-rz(0.39985135775015646) q[67];
-cx q[41],q[67];
-cx q[56],q[67];
-rz(0.39985135775015646) q[67];
-cx q[56],q[67];
-cx q[56],q[74];
-rx(8.302707954496386) q[67];
-rz(0.39985135775015646) q[68];
-cx q[13],q[68];
-cx q[32],q[68];
-rz(0.39985135775015646) q[68];
-cx q[32],q[68];
-rz(0.39985135775015646) q[69];
-cx q[6],q[69];
-cx q[59],q[69];
-rz(0.39985135775015646) q[69];
-cx q[59],q[69];
-rz(0.39985135775015646) q[70];
-cx q[3],q[70];
-cx q[3],q[71];
-cx q[15],q[70];
-rz(0.39985135775015646) q[70];
-cx q[15],q[70];
-cx q[70],q[84];
-rz(0.39985135775015646) q[71];
-cx q[3],q[71];
-cx q[3],q[77];
-cx q[53],q[71];
-rz(0.39985135775015646) q[71];
-cx q[53],q[71];
-rx(8.302707954496386) q[71];
-rz(0.39985135775015646) q[72];
-cx q[27],q[72];
-cx q[44],q[72];
-rz(0.39985135775015646) q[72];
-cx q[44],q[72];
-rx(8.302707954496386) q[44];
-rx(8.302707954496386) q[72];
-rz(0.39985135775015646) q[73];
-cx q[16],q[73];
-cx q[16],q[101];
-cx q[59],q[73];
-rz(0.39985135775015646) q[73];
-cx q[59],q[73];
-rz(0.39985135775015646) q[74];
-cx q[56],q[74];
-cx q[56],q[82];
-cx q[63],q[74];
-rz(0.39985135775015646) q[74];
-cx q[63],q[74];
-cx q[63],q[122];
-rx(8.302707954496386) q[74];
-rz(0.39985135775015646) q[75];
-cx q[21],q[75];
-cx q[21],q[81];
-rx(8.302707954496386) q[75];
-rz(0.39985135775015646) q[76];
-cx q[5],q[76];
-cx q[6],q[76];
-rz(0.39985135775015646) q[76];
-cx q[6],q[76];
-cx q[6],q[79];
-rx(8.302707954496386) q[76];
-rz(0.39985135775015646) q[77];
-cx q[3],q[77];
-cx q[3],q[88];
-cx q[30],q[77];
-rz(0.39985135775015646) q[77];
-cx q[30],q[77];
-rx(8.302707954496386) q[30];
-rz(0.39985135775015646) q[78];
-cx q[42],q[78];
-cx q[60],q[78];
-rz(0.39985135775015646) q[78];
-cx q[60],q[78];
-rx(8.302707954496386) q[78];
-rz(0.39985135775015646) q[79];
-cx q[6],q[79];
-cx q[6],q[91];
-cx q[50],q[79];
-rz(0.39985135775015646) q[79];
-cx q[50],q[79];
-rx(8.302707954496386) q[79];
-rz(0.39985135775015646) q[80];
-cx q[9],q[80];
-rx(8.302707954496386) q[9];
-cx q[15],q[80];
-rz(0.39985135775015646) q[80];
-cx q[15],q[80];
-cx q[15],q[90];
-rx(8.302707954496386) q[80];
-rz(0.39985135775015646) q[81];
-cx q[21],q[81];
-cx q[77],q[81];
-rz(0.39985135775015646) q[81];
-cx q[77],q[81];
-rx(8.302707954496386) q[77];
-rz(0.39985135775015646) q[82];
-cx q[56],q[82];
-cx q[56],q[96];
-rx(8.302707954496386) q[82];
-rz(0.39985135775015646) q[83];
-cx q[8],q[83];
-rx(8.302707954496386) q[8];
-cx q[68],q[83];
-rz(0.39985135775015646) q[83];
-cx q[68],q[83];
-rx(8.302707954496386) q[68];
-rx(8.302707954496386) q[83];
-rz(0.39985135775015646) q[84];
-cx q[70],q[84];
-rx(8.302707954496386) q[70];
-cx q[73],q[84];
-rz(0.39985135775015646) q[84];
-cx q[73],q[84];
-rx(8.302707954496386) q[73];
-rx(8.302707954496386) q[84];
-rz(0.39985135775015646) q[85];
-cx q[37],q[85];
-cx q[59],q[85];
-rz(0.39985135775015646) q[85];
-cx q[59],q[85];
-rx(8.302707954496386) q[59];
-rx(8.302707954496386) q[85];
-rz(0.39985135775015646) q[86];
-cx q[24],q[86];
-cx q[53],q[86];
-rz(0.39985135775015646) q[86];
-cx q[53],q[86];
-cx q[53],q[124];
-rx(8.302707954496386) q[86];
-rz(0.39985135775015646) q[87];
-cx q[28],q[87];
-cx q[32],q[87];
-rz(0.39985135775015646) q[87];
-cx q[32],q[87];
-cx q[32],q[93];
-rx(8.302707954496386) q[87];
-rz(0.39985135775015646) q[88];
-cx q[3],q[88];
-cx q[3],q[100];
-cx q[60],q[88];
-rz(0.39985135775015646) q[88];
-cx q[60],q[88];
-rx(8.302707954496386) q[60];
-rx(8.302707954496386) q[88];
-cx q[89],q[133];
-rz(0.39985135775015646) q[90];
-cx q[15],q[90];
-cx q[15],q[92];
-cx q[27],q[90];
-rz(0.39985135775015646) q[90];
-cx q[27],q[90];
-rx(8.302707954496386) q[90];
-rz(0.39985135775015646) q[91];
-cx q[6],q[91];
-rx(8.302707954496386) q[6];
-rz(0.39985135775015646) q[92];
-cx q[15],q[92];
-cx q[15],q[108];
-rz(0.39985135775015646) q[93];
-cx q[32],q[93];
-rx(8.302707954496386) q[93];
-rz(0.39985135775015646) q[94];
-cx q[36],q[94];
-cx q[55],q[94];
-rz(0.39985135775015646) q[94];
-cx q[55],q[94];
-rx(8.302707954496386) q[55];
-rz(0.39985135775015646) q[96];
-cx q[56],q[96];
-rx(8.302707954496386) q[56];
-rz(0.39985135775015646) q[97];
-cx q[7],q[97];
-cx q[7],q[104];
-rx(8.302707954496386) q[97];
-rz(0.39985135775015646) q[98];
-cx q[10],q[98];
-rx(8.302707954496386) q[10];
-cx q[21],q[98];
-rz(0.39985135775015646) q[98];
-cx q[21],q[98];
-rx(8.302707954496386) q[98];
-rz(0.39985135775015646) q[99];
-cx q[4],q[99];
-cx q[41],q[99];
-rz(0.39985135775015646) q[99];
-cx q[41],q[99];
-rx(8.302707954496386) q[41];
-rx(8.302707954496386) q[99];
-rz(0.39985135775015646) q[100];
-cx q[3],q[100];
-cx q[3],q[102];
-cx q[25],q[100];
-rz(0.39985135775015646) q[100];
-cx q[25],q[100];
-rx(8.302707954496386) q[25];
-rx(8.302707954496386) q[100];
-rz(0.39985135775015646) q[101];
-cx q[16],q[101];
-cx q[16],q[103];
-cx q[50],q[101];
-rz(0.39985135775015646) q[101];
-cx q[50],q[101];
-cx q[50],q[129];
-rx(8.302707954496386) q[101];
-rz(0.39985135775015646) q[102];
-cx q[3],q[102];
-cx q[3],q[107];
-cx q[4],q[102];
-rz(0.39985135775015646) q[102];
-cx q[4],q[102];
-cx q[4],q[127];
-rx(8.302707954496386) q[102];
-rz(0.39985135775015646) q[103];
-cx q[16],q[103];
-rx(8.302707954496386) q[16];
-cx q[57],q[103];
-rz(0.39985135775015646) q[103];
-cx q[57],q[103];
-rx(8.302707954496386) q[57];
-rx(8.302707954496386) q[103];
-rz(0.39985135775015646) q[104];
-cx q[7],q[104];
-cx q[13],q[104];
-rz(0.39985135775015646) q[104];
-cx q[13],q[104];
-rx(8.302707954496386) q[13];
-cx q[104],q[114];
-rz(0.39985135775015646) q[105];
-cx q[26],q[105];
-cx q[26],q[117];
-cx q[28],q[105];
-rz(0.39985135775015646) q[105];
-cx q[28],q[105];
-cx q[28],q[116];
-rx(8.302707954496386) q[105];
-rz(0.39985135775015646) q[107];
-cx q[3],q[107];
-cx q[3],q[110];
-cx q[31],q[107];
-rz(0.39985135775015646) q[107];
-cx q[31],q[107];
-rx(8.302707954496386) q[107];
-rz(0.39985135775015646) q[108];
-cx q[15],q[108];
-cx q[15],q[115];
-cx q[31],q[108];
-rz(0.39985135775015646) q[108];
-cx q[31],q[108];
-rx(8.302707954496386) q[31];
-rx(8.302707954496386) q[108];
-rz(0.39985135775015646) q[110];
-cx q[3],q[110];
-cx q[3],q[111];
-cx q[24],q[110];
-rz(0.39985135775015646) q[110];
-cx q[24],q[110];
-rx(8.302707954496386) q[24];
-rz(0.39985135775015646) q[111];
-cx q[3],q[111];
-cx q[3],q[113];
-cx q[21],q[111];
-rz(0.39985135775015646) q[111];
-cx q[21],q[111];
-cx q[21],q[112];
-rx(8.302707954496386) q[111];
-rz(0.39985135775015646) q[112];
-cx q[21],q[112];
-rx(8.302707954496386) q[21];
-rz(0.39985135775015646) q[113];
-cx q[3],q[113];
-cx q[3],q[125];
-rx(8.302707954496386) q[113];
-rz(0.39985135775015646) q[114];
-cx q[104],q[114];
-cx q[110],q[114];
-rz(0.39985135775015646) q[114];
-cx q[110],q[114];
-rx(8.302707954496386) q[110];
-rx(8.302707954496386) q[114];
-rz(0.39985135775015646) q[115];
-cx q[15],q[115];
-rz(0.39985135775015646) q[116];
-cx q[28],q[116];
-rx(8.302707954496386) q[28];
-cx q[42],q[116];
-rz(0.39985135775015646) q[116];
-cx q[42],q[116];
-rx(8.302707954496386) q[42];
-rx(8.302707954496386) q[116];
-rz(0.39985135775015646) q[117];
-cx q[26],q[117];
-rx(8.302707954496386) q[26];
-cx q[32],q[117];
-rz(0.39985135775015646) q[117];
-cx q[32],q[117];
-cx q[32],q[131];
-rx(8.302707954496386) q[117];
-rz(0.39985135775015646) q[119];
-cx q[40],q[119];
-rx(8.302707954496386) q[40];
-cx q[69],q[119];
-rz(0.39985135775015646) q[119];
-cx q[69],q[119];
-rx(8.302707954496386) q[69];
-rx(8.302707954496386) q[119];
-rz(0.39985135775015646) q[120];
-cx q[46],q[120];
-rx(8.302707954496386) q[46];
-cx q[94],q[120];
-rz(0.39985135775015646) q[120];
-cx q[94],q[120];
-rx(8.302707954496386) q[94];
-rx(8.302707954496386) q[120];
-rz(0.39985135775015646) q[121];
-cx q[20],q[121];
-rx(8.302707954496386) q[20];
-cx q[104],q[121];
-rz(0.39985135775015646) q[121];
-cx q[104],q[121];
-rx(8.302707954496386) q[104];
-rx(8.302707954496386) q[121];
-rz(0.39985135775015646) q[122];
-cx q[63],q[122];
-rx(8.302707954496386) q[63];
-cx q[81],q[122];
-rz(0.39985135775015646) q[122];
-cx q[81],q[122];
-rx(8.302707954496386) q[122];
-rz(0.39985135775015646) q[123];
-cx q[52],q[123];
-rx(8.302707954496386) q[52];
-rz(0.39985135775015646) q[124];
-cx q[53],q[124];
-rx(8.302707954496386) q[53];
-cx q[81],q[124];
-rz(0.39985135775015646) q[124];
-cx q[81],q[124];
-rx(8.302707954496386) q[81];
-rx(8.302707954496386) q[124];
-rz(0.39985135775015646) q[125];
-cx q[3],q[125];
-cx q[3],q[132];
-rz(0.39985135775015646) q[126];
-cx q[12],q[126];
-rx(8.302707954496386) q[12];
-rx(8.302707954496386) q[126];
-rz(0.39985135775015646) q[127];
-cx q[4],q[127];
-rx(8.302707954496386) q[4];
-cx q[62],q[127];
-rz(0.39985135775015646) q[127];
-cx q[62],q[127];
-cx q[62],q[128];
-rx(8.302707954496386) q[127];
-rz(0.39985135775015646) q[128];
-cx q[62],q[128];
-rx(8.302707954496386) q[62];
-rz(0.39985135775015646) q[129];
-cx q[50],q[129];
-rx(8.302707954496386) q[50];
-cx q[91],q[129];
-rz(0.39985135775015646) q[129];
-cx q[91],q[129];
-rx(8.302707954496386) q[91];
-rx(8.302707954496386) q[129];
-rz(0.39985135775015646) q[130];
-cx q[35],q[130];
-rx(8.302707954496386) q[35];
-rz(0.39985135775015646) q[131];
-cx q[32],q[131];
-rx(8.302707954496386) q[32];
-cx q[123],q[131];
-rz(0.39985135775015646) q[131];
-cx q[123],q[131];
-rx(8.302707954496386) q[123];
-rx(8.302707954496386) q[131];
-rz(0.39985135775015646) q[132];
-cx q[3],q[132];
-rx(8.302707954496386) q[3];
-cx q[37],q[132];
-rz(0.39985135775015646) q[132];
-cx q[37],q[132];
-rx(8.302707954496386) q[37];
-rx(8.302707954496386) q[132];
-rz(0.46450907397842434) q[133];
-cx q[89],q[133];
-rx(3.312892028470381) q[89];
-cx q[2],q[89];
-rz(0.39985135775015646) q[89];
-cx q[2],q[89];
-rx(8.302707954496386) q[2];
-cx q[0],q[2];
-rz(0.3874383702223457) q[2];
-cx q[0],q[2];
-cx q[0],q[3];
-rz(0.3874383702223457) q[3];
-cx q[0],q[3];
-cx q[1],q[3];
-rz(0.3874383702223457) q[3];
-cx q[1],q[3];
-cx q[1],q[4];
-rz(0.3874383702223457) q[4];
-cx q[1],q[4];
-cx q[3],q[4];
-rz(0.3874383702223457) q[4];
-cx q[3],q[4];
-cx q[4],q[6];
-cx q[5],q[89];
-rz(0.3874383702223457) q[6];
-cx q[4],q[6];
-rz(0.39985135775015646) q[89];
-cx q[5],q[89];
-cx q[5],q[95];
-cx q[89],q[92];
-rz(0.39985135775015646) q[92];
-cx q[89],q[92];
-cx q[92],q[96];
-rz(0.39985135775015646) q[95];
-cx q[5],q[95];
-cx q[5],q[106];
-cx q[27],q[95];
-rz(0.39985135775015646) q[95];
-cx q[27],q[95];
-rx(8.302707954496386) q[27];
-rx(8.302707954496386) q[95];
-rz(0.39985135775015646) q[96];
-cx q[92],q[96];
-cx q[92],q[115];
-rx(8.302707954496386) q[96];
-rz(0.39985135775015646) q[106];
-cx q[5],q[106];
-cx q[5],q[109];
-cx q[36],q[106];
-rz(0.39985135775015646) q[106];
-cx q[36],q[106];
-cx q[36],q[112];
-rx(8.302707954496386) q[106];
-rz(0.39985135775015646) q[109];
-cx q[5],q[109];
-cx q[5],q[118];
-cx q[39],q[109];
-rz(0.39985135775015646) q[109];
-cx q[39],q[109];
-rx(8.302707954496386) q[39];
-cx q[109],q[125];
-rz(0.39985135775015646) q[112];
-cx q[36],q[112];
-rx(8.302707954496386) q[36];
-rx(8.302707954496386) q[112];
-rz(0.39985135775015646) q[115];
-cx q[92],q[115];
-rx(8.302707954496386) q[92];
-rx(8.302707954496386) q[115];
-rz(0.39985135775015646) q[118];
-cx q[5],q[118];
-rx(8.302707954496386) q[5];
-cx q[1],q[5];
-rz(0.3874383702223457) q[5];
-cx q[1],q[5];
-cx q[1],q[9];
-cx q[3],q[5];
-rz(0.3874383702223457) q[5];
-cx q[3],q[5];
-cx q[5],q[6];
-rz(0.3874383702223457) q[6];
-cx q[5],q[6];
-rz(0.3874383702223457) q[9];
-cx q[1],q[9];
-cx q[1],q[17];
-cx q[15],q[118];
-rz(0.3874383702223457) q[17];
-cx q[1],q[17];
-cx q[1],q[28];
-rz(0.3874383702223457) q[28];
-cx q[1],q[28];
-cx q[1],q[29];
-rz(0.3874383702223457) q[29];
-cx q[1],q[29];
-cx q[1],q[45];
-rz(0.3874383702223457) q[45];
-cx q[1],q[45];
-cx q[1],q[57];
-rz(0.3874383702223457) q[57];
-cx q[1],q[57];
-cx q[1],q[60];
-rz(0.3874383702223457) q[60];
-cx q[1],q[60];
-cx q[1],q[97];
-rz(0.3874383702223457) q[97];
-cx q[1],q[97];
-cx q[1],q[113];
-rz(0.3874383702223457) q[113];
-cx q[1],q[113];
-rx(3.0258574787435393) q[1];
-rz(0.39985135775015646) q[118];
-cx q[15],q[118];
-rx(8.302707954496386) q[15];
-cx q[0],q[15];
-rz(0.3874383702223457) q[15];
-cx q[0],q[15];
-cx q[0],q[16];
-rz(0.3874383702223457) q[16];
-cx q[0],q[16];
-cx q[0],q[20];
-rz(0.3874383702223457) q[20];
-cx q[0],q[20];
-cx q[0],q[32];
-rz(0.3874383702223457) q[32];
-cx q[0],q[32];
-cx q[0],q[42];
-rz(0.3874383702223457) q[42];
-cx q[0],q[42];
-cx q[0],q[48];
-rz(0.3874383702223457) q[48];
-cx q[0],q[48];
-cx q[0],q[51];
-rz(0.3874383702223457) q[51];
-cx q[0],q[51];
-cx q[0],q[62];
-rz(0.3874383702223457) q[62];
-cx q[0],q[62];
-cx q[0],q[64];
-rz(0.3874383702223457) q[64];
-cx q[0],q[64];
-cx q[0],q[75];
-rz(0.3874383702223457) q[75];
-cx q[0],q[75];
-cx q[0],q[82];
-rz(0.3874383702223457) q[82];
-cx q[0],q[82];
-cx q[0],q[91];
-rz(0.3874383702223457) q[91];
-cx q[0],q[91];
-cx q[0],q[93];
-rz(0.3874383702223457) q[93];
-cx q[0],q[93];
-cx q[0],q[123];
-rx(8.302707954496386) q[118];
-rz(0.3874383702223457) q[123];
-cx q[0],q[123];
-cx q[0],q[126];
-rz(0.39985135775015646) q[125];
-cx q[109],q[125];
-cx q[109],q[128];
-rx(8.302707954496386) q[125];
-rz(0.3874383702223457) q[126];
-cx q[0],q[126];
-rx(3.0258574787435393) q[0];
-rz(0.39985135775015646) q[128];
-cx q[109],q[128];
-cx q[109],q[130];
-rx(8.302707954496386) q[128];
-rz(0.39985135775015646) q[130];
-cx q[109],q[130];
-rx(8.302707954496386) q[109];
-rx(8.302707954496386) q[130];
-rx(3.312892028470381) q[133];
-cx q[7],q[133];
-rz(0.39985135775015646) q[133];
-cx q[7],q[133];
-rx(8.302707954496386) q[7];
-cx q[3],q[7];
-rz(0.3874383702223457) q[7];
-cx q[3],q[7];
-cx q[3],q[8];
-cx q[4],q[7];
-rz(0.3874383702223457) q[7];
-cx q[4],q[7];
-cx q[4],q[10];
-rz(0.3874383702223457) q[8];
-cx q[3],q[8];
-cx q[3],q[9];
-cx q[5],q[8];
-rz(0.3874383702223457) q[8];
-cx q[5],q[8];
-cx q[5],q[11];
-cx q[8],q[83];
-rz(0.3874383702223457) q[9];
-cx q[3],q[9];
-cx q[3],q[12];
-rz(0.3874383702223457) q[10];
-cx q[4],q[10];
-cx q[4],q[13];
-cx q[6],q[10];
-rz(0.3874383702223457) q[10];
-cx q[6],q[10];
-cx q[10],q[37];
-rz(0.3874383702223457) q[11];
-cx q[5],q[11];
-cx q[6],q[11];
-rz(0.3874383702223457) q[11];
-cx q[6],q[11];
-rx(3.0258574787435393) q[11];
-rz(0.3874383702223457) q[12];
-cx q[3],q[12];
-cx q[3],q[14];
-cx q[5],q[12];
-rz(0.3874383702223457) q[12];
-cx q[5],q[12];
-rz(0.3874383702223457) q[13];
-cx q[4],q[13];
-cx q[5],q[13];
-rz(0.3874383702223457) q[13];
-cx q[5],q[13];
-rz(0.3874383702223457) q[14];
-cx q[3],q[14];
-cx q[3],q[15];
-cx q[4],q[14];
-rz(0.3874383702223457) q[14];
-cx q[4],q[14];
-rx(3.0258574787435393) q[14];
-rz(0.3874383702223457) q[15];
-cx q[3],q[15];
-cx q[3],q[16];
-cx q[15],q[20];
-rz(0.3874383702223457) q[16];
-cx q[3],q[16];
-cx q[3],q[17];
-cx q[16],q[45];
-rz(0.3874383702223457) q[17];
-cx q[3],q[17];
-cx q[3],q[18];
-rz(0.3874383702223457) q[18];
-cx q[3],q[18];
-cx q[3],q[19];
-cx q[4],q[18];
-rz(0.3874383702223457) q[18];
-cx q[4],q[18];
-cx q[4],q[21];
-rz(0.3874383702223457) q[19];
-cx q[3],q[19];
-cx q[3],q[22];
-cx q[7],q[19];
-rz(0.3874383702223457) q[19];
-cx q[7],q[19];
-cx q[7],q[60];
-cx q[19],q[38];
-rz(0.3874383702223457) q[20];
-cx q[15],q[20];
-rz(0.3874383702223457) q[21];
-cx q[4],q[21];
-cx q[4],q[27];
-cx q[15],q[21];
-rz(0.3874383702223457) q[21];
-cx q[15],q[21];
-cx q[15],q[36];
-rz(0.3874383702223457) q[22];
-cx q[3],q[22];
-cx q[3],q[23];
-cx q[9],q[22];
-rz(0.3874383702223457) q[22];
-cx q[9],q[22];
-cx q[9],q[55];
-rx(3.0258574787435393) q[22];
-rz(0.3874383702223457) q[23];
-cx q[3],q[23];
-cx q[3],q[24];
-cx q[17],q[23];
-rz(0.3874383702223457) q[23];
-cx q[17],q[23];
-rz(0.3874383702223457) q[24];
-cx q[3],q[24];
-cx q[3],q[25];
-cx q[5],q[24];
-rz(0.3874383702223457) q[24];
-cx q[5],q[24];
-cx q[5],q[33];
-cx q[24],q[54];
-rz(0.3874383702223457) q[25];
-cx q[3],q[25];
-cx q[3],q[26];
-cx q[12],q[25];
-rz(0.3874383702223457) q[25];
-cx q[12],q[25];
-cx q[12],q[31];
-rz(0.3874383702223457) q[26];
-cx q[3],q[26];
-cx q[3],q[28];
-cx q[21],q[26];
-rz(0.3874383702223457) q[26];
-cx q[21],q[26];
-cx q[21],q[32];
-rz(0.3874383702223457) q[27];
-cx q[4],q[27];
-cx q[4],q[47];
-cx q[6],q[27];
-rz(0.3874383702223457) q[27];
-cx q[6],q[27];
-cx q[6],q[69];
-rz(0.3874383702223457) q[28];
-cx q[3],q[28];
-cx q[3],q[29];
-cx q[28],q[51];
-rz(0.3874383702223457) q[29];
-cx q[3],q[29];
-cx q[3],q[30];
-rx(3.0258574787435393) q[29];
-rz(0.3874383702223457) q[30];
-cx q[3],q[30];
-cx q[3],q[34];
-cx q[18],q[30];
-rz(0.3874383702223457) q[30];
-cx q[18],q[30];
-rx(3.0258574787435393) q[18];
-rz(0.3874383702223457) q[31];
-cx q[12],q[31];
-cx q[26],q[31];
-rz(0.3874383702223457) q[31];
-cx q[26],q[31];
-cx q[26],q[105];
-rz(0.3874383702223457) q[32];
-cx q[21],q[32];
-rz(0.3874383702223457) q[33];
-cx q[5],q[33];
-cx q[5],q[46];
-cx q[30],q[33];
-rz(0.3874383702223457) q[33];
-cx q[30],q[33];
-cx q[30],q[48];
-rx(3.0258574787435393) q[33];
-rz(0.3874383702223457) q[34];
-cx q[3],q[34];
-cx q[3],q[35];
-cx q[12],q[34];
-rz(0.3874383702223457) q[34];
-cx q[12],q[34];
-rz(0.3874383702223457) q[35];
-cx q[3],q[35];
-cx q[3],q[39];
-cx q[32],q[35];
-rz(0.3874383702223457) q[35];
-cx q[32],q[35];
-cx q[35],q[130];
-rz(0.3874383702223457) q[36];
-cx q[15],q[36];
-cx q[20],q[36];
-rz(0.3874383702223457) q[36];
-cx q[20],q[36];
-cx q[36],q[94];
-rz(0.3874383702223457) q[37];
-cx q[10],q[37];
-cx q[10],q[41];
-cx q[34],q[37];
-rz(0.3874383702223457) q[37];
-cx q[34],q[37];
-rx(3.0258574787435393) q[34];
-cx q[37],q[85];
-rz(0.3874383702223457) q[38];
-cx q[19],q[38];
-rx(3.0258574787435393) q[19];
-cx q[21],q[38];
-rz(0.3874383702223457) q[38];
-cx q[21],q[38];
-rz(0.3874383702223457) q[39];
-cx q[3],q[39];
-cx q[3],q[40];
-cx q[13],q[39];
-rz(0.3874383702223457) q[39];
-cx q[13],q[39];
-cx q[13],q[56];
-rz(0.3874383702223457) q[40];
-cx q[3],q[40];
-cx q[3],q[42];
-cx q[23],q[40];
-rz(0.3874383702223457) q[40];
-cx q[23],q[40];
-cx q[40],q[119];
-rz(0.3874383702223457) q[41];
-cx q[10],q[41];
-cx q[27],q[41];
-rz(0.3874383702223457) q[41];
-cx q[27],q[41];
-cx q[27],q[72];
-cx q[41],q[67];
-rz(0.3874383702223457) q[42];
-cx q[3],q[42];
-cx q[3],q[43];
-cx q[42],q[78];
-rz(0.3874383702223457) q[43];
-cx q[3],q[43];
-cx q[3],q[44];
-cx q[20],q[43];
-rz(0.3874383702223457) q[43];
-cx q[20],q[43];
-cx q[20],q[121];
-rx(3.0258574787435393) q[43];
-rz(0.3874383702223457) q[44];
-cx q[3],q[44];
-cx q[3],q[49];
-cx q[12],q[44];
-rz(0.3874383702223457) q[44];
-cx q[12],q[44];
-rz(0.3874383702223457) q[45];
-cx q[16],q[45];
-cx q[16],q[59];
-rz(0.3874383702223457) q[46];
-cx q[5],q[46];
-cx q[5],q[65];
-cx q[38],q[46];
-rz(0.3874383702223457) q[46];
-cx q[38],q[46];
-rx(3.0258574787435393) q[38];
-cx q[46],q[120];
-rz(0.3874383702223457) q[47];
-cx q[4],q[47];
-cx q[17],q[47];
-rz(0.3874383702223457) q[47];
-cx q[17],q[47];
-cx q[17],q[53];
-rz(0.3874383702223457) q[48];
-cx q[30],q[48];
-rx(3.0258574787435393) q[48];
-rz(0.3874383702223457) q[49];
-cx q[3],q[49];
-cx q[3],q[50];
-cx q[4],q[49];
-rz(0.3874383702223457) q[49];
-cx q[4],q[49];
-cx q[4],q[61];
-rx(3.0258574787435393) q[49];
-rz(0.3874383702223457) q[50];
-cx q[3],q[50];
-cx q[3],q[52];
-cx q[12],q[50];
-rz(0.3874383702223457) q[50];
-cx q[12],q[50];
-cx q[12],q[63];
-rz(0.3874383702223457) q[51];
-cx q[28],q[51];
-rx(3.0258574787435393) q[51];
-rz(0.3874383702223457) q[52];
-cx q[3],q[52];
-cx q[3],q[57];
-cx q[10],q[52];
-rz(0.3874383702223457) q[52];
-cx q[10],q[52];
-cx q[10],q[64];
-cx q[52],q[123];
-rz(0.3874383702223457) q[53];
-cx q[17],q[53];
-cx q[17],q[62];
-cx q[21],q[53];
-rz(0.3874383702223457) q[53];
-cx q[21],q[53];
-cx q[21],q[75];
-rz(0.3874383702223457) q[54];
-cx q[24],q[54];
-cx q[24],q[58];
-cx q[28],q[54];
-rz(0.3874383702223457) q[54];
-cx q[28],q[54];
-rx(3.0258574787435393) q[54];
-rz(0.3874383702223457) q[55];
-cx q[9],q[55];
-cx q[9],q[80];
-cx q[15],q[55];
-rz(0.3874383702223457) q[55];
-cx q[15],q[55];
-rz(0.3874383702223457) q[56];
-cx q[13],q[56];
-cx q[13],q[68];
-cx q[45],q[56];
-rz(0.3874383702223457) q[56];
-cx q[45],q[56];
-rx(3.0258574787435393) q[45];
-rz(0.3874383702223457) q[57];
-cx q[3],q[57];
-cx q[3],q[70];
-rz(0.3874383702223457) q[58];
-cx q[24],q[58];
-cx q[24],q[86];
-cx q[28],q[58];
-rz(0.3874383702223457) q[58];
-cx q[28],q[58];
-cx q[28],q[87];
-rx(3.0258574787435393) q[58];
-rz(0.3874383702223457) q[59];
-cx q[16],q[59];
-cx q[16],q[73];
-cx q[32],q[59];
-rz(0.3874383702223457) q[59];
-cx q[32],q[59];
-rz(0.3874383702223457) q[60];
-cx q[7],q[60];
-rz(0.3874383702223457) q[61];
-cx q[4],q[61];
-cx q[4],q[99];
-cx q[7],q[61];
-rz(0.3874383702223457) q[61];
-cx q[7],q[61];
-cx q[7],q[97];
-rx(3.0258574787435393) q[61];
-rz(0.3874383702223457) q[62];
-cx q[17],q[62];
-rz(0.3874383702223457) q[63];
-cx q[12],q[63];
-cx q[12],q[126];
-cx q[17],q[63];
-rz(0.3874383702223457) q[63];
-cx q[17],q[63];
-cx q[17],q[66];
-rz(0.3874383702223457) q[64];
-cx q[10],q[64];
-cx q[10],q[98];
-rx(3.0258574787435393) q[64];
-rz(0.3874383702223457) q[65];
-cx q[5],q[65];
-cx q[5],q[76];
-cx q[23],q[65];
-rz(0.3874383702223457) q[65];
-cx q[23],q[65];
-rx(3.0258574787435393) q[23];
-rx(3.0258574787435393) q[65];
-rz(0.3874383702223457) q[66];
-cx q[17],q[66];
-rx(3.0258574787435393) q[17];
-cx q[47],q[66];
-rz(0.3874383702223457) q[66];
-cx q[47],q[66];
-rx(3.0258574787435393) q[47];
-rx(3.0258574787435393) q[66];
-rz(0.3874383702223457) q[67];
-cx q[41],q[67];
-cx q[56],q[67];
-rz(0.3874383702223457) q[67];
-cx q[56],q[67];
-cx q[56],q[74];
-rx(3.0258574787435393) q[67];
-rz(0.3874383702223457) q[68];
-cx q[13],q[68];
-cx q[32],q[68];
-rz(0.3874383702223457) q[68];
-cx q[32],q[68];
-rz(0.3874383702223457) q[69];
-cx q[6],q[69];
-cx q[59],q[69];
-rz(0.3874383702223457) q[69];
-cx q[59],q[69];
-rz(0.3874383702223457) q[70];
-cx q[3],q[70];
-cx q[3],q[71];
-cx q[15],q[70];
-rz(0.3874383702223457) q[70];
-cx q[15],q[70];
-cx q[70],q[84];
-rz(0.3874383702223457) q[71];
-cx q[3],q[71];
-cx q[3],q[77];
-cx q[53],q[71];
-rz(0.3874383702223457) q[71];
-cx q[53],q[71];
-rx(3.0258574787435393) q[71];
-rz(0.3874383702223457) q[72];
-cx q[27],q[72];
-cx q[44],q[72];
-rz(0.3874383702223457) q[72];
-cx q[44],q[72];
-rx(3.0258574787435393) q[44];
-rx(3.0258574787435393) q[72];
-rz(0.3874383702223457) q[73];
-cx q[16],q[73];
-cx q[16],q[101];
-cx q[59],q[73];
-rz(0.3874383702223457) q[73];
-cx q[59],q[73];
-rz(0.3874383702223457) q[74];
-cx q[56],q[74];
-cx q[56],q[82];
-cx q[63],q[74];
-rz(0.3874383702223457) q[74];
-cx q[63],q[74];
-cx q[63],q[122];
-rx(3.0258574787435393) q[74];
-rz(0.3874383702223457) q[75];
-cx q[21],q[75];
-cx q[21],q[81];
-rx(3.0258574787435393) q[75];
-rz(0.3874383702223457) q[76];
-cx q[5],q[76];
-cx q[6],q[76];
-rz(0.3874383702223457) q[76];
-cx q[6],q[76];
-cx q[6],q[79];
-rx(3.0258574787435393) q[76];
-rz(0.3874383702223457) q[77];
-cx q[3],q[77];
-cx q[3],q[88];
-cx q[30],q[77];
-rz(0.3874383702223457) q[77];
-cx q[30],q[77];
-rx(3.0258574787435393) q[30];
-rz(0.3874383702223457) q[78];
-cx q[42],q[78];
-cx q[60],q[78];
-rz(0.3874383702223457) q[78];
-cx q[60],q[78];
-rx(3.0258574787435393) q[78];
-rz(0.3874383702223457) q[79];
-cx q[6],q[79];
-cx q[6],q[91];
-cx q[50],q[79];
-rz(0.3874383702223457) q[79];
-cx q[50],q[79];
-rx(3.0258574787435393) q[79];
-rz(0.3874383702223457) q[80];
-cx q[9],q[80];
-rx(3.0258574787435393) q[9];
-cx q[15],q[80];
-rz(0.3874383702223457) q[80];
-cx q[15],q[80];
-cx q[15],q[90];
-rx(3.0258574787435393) q[80];
-rz(0.3874383702223457) q[81];
-cx q[21],q[81];
-cx q[77],q[81];
-rz(0.3874383702223457) q[81];
-cx q[77],q[81];
-rx(3.0258574787435393) q[77];
-rz(0.3874383702223457) q[82];
-cx q[56],q[82];
-cx q[56],q[96];
-rx(3.0258574787435393) q[82];
-rz(0.3874383702223457) q[83];
-cx q[8],q[83];
-rx(3.0258574787435393) q[8];
-cx q[68],q[83];
-rz(0.3874383702223457) q[83];
-cx q[68],q[83];
-rx(3.0258574787435393) q[68];
-rx(3.0258574787435393) q[83];
-rz(0.3874383702223457) q[84];
-cx q[70],q[84];
-rx(3.0258574787435393) q[70];
-cx q[73],q[84];
-rz(0.3874383702223457) q[84];
-cx q[73],q[84];
-rx(3.0258574787435393) q[73];
-rx(3.0258574787435393) q[84];
-rz(0.3874383702223457) q[85];
-cx q[37],q[85];
-cx q[59],q[85];
-rz(0.3874383702223457) q[85];
-cx q[59],q[85];
-rx(3.0258574787435393) q[59];
-rx(3.0258574787435393) q[85];
-rz(0.3874383702223457) q[86];
-cx q[24],q[86];
-cx q[53],q[86];
-rz(0.3874383702223457) q[86];
-cx q[53],q[86];
-cx q[53],q[124];
-rx(3.0258574787435393) q[86];
-rz(0.3874383702223457) q[87];
-cx q[28],q[87];
-cx q[32],q[87];
-rz(0.3874383702223457) q[87];
-cx q[32],q[87];
-cx q[32],q[93];
-rx(3.0258574787435393) q[87];
-rz(0.3874383702223457) q[88];
-cx q[3],q[88];
-cx q[3],q[100];
-cx q[60],q[88];
-rz(0.3874383702223457) q[88];
-cx q[60],q[88];
-rx(3.0258574787435393) q[60];
-rx(3.0258574787435393) q[88];
-cx q[89],q[133];
-rz(0.3874383702223457) q[90];
-cx q[15],q[90];
-cx q[15],q[92];
-cx q[27],q[90];
-rz(0.3874383702223457) q[90];
-cx q[27],q[90];
-rx(3.0258574787435393) q[90];
-rz(0.3874383702223457) q[91];
-cx q[6],q[91];
-rx(3.0258574787435393) q[6];
-rz(0.3874383702223457) q[92];
-cx q[15],q[92];
-cx q[15],q[108];
-rz(0.3874383702223457) q[93];
-cx q[32],q[93];
-rx(3.0258574787435393) q[93];
-rz(0.3874383702223457) q[94];
-cx q[36],q[94];
-cx q[55],q[94];
-rz(0.3874383702223457) q[94];
-cx q[55],q[94];
-rx(3.0258574787435393) q[55];
-rz(0.3874383702223457) q[96];
-cx q[56],q[96];
-rx(3.0258574787435393) q[56];
-rz(0.3874383702223457) q[97];
-cx q[7],q[97];
-cx q[7],q[104];
-rx(3.0258574787435393) q[97];
-rz(0.3874383702223457) q[98];
-cx q[10],q[98];
-rx(3.0258574787435393) q[10];
-cx q[21],q[98];
-rz(0.3874383702223457) q[98];
-cx q[21],q[98];
-rx(3.0258574787435393) q[98];
-rz(0.3874383702223457) q[99];
-cx q[4],q[99];
-cx q[41],q[99];
-rz(0.3874383702223457) q[99];
-cx q[41],q[99];
-rx(3.0258574787435393) q[41];
-rx(3.0258574787435393) q[99];
-rz(0.3874383702223457) q[100];
-cx q[3],q[100];
-cx q[3],q[102];
-cx q[25],q[100];
-rz(0.3874383702223457) q[100];
-cx q[25],q[100];
-rx(3.0258574787435393) q[25];
-rx(3.0258574787435393) q[100];
-rz(0.3874383702223457) q[101];
-cx q[16],q[101];
-cx q[16],q[103];
-cx q[50],q[101];
-rz(0.3874383702223457) q[101];
-cx q[50],q[101];
-cx q[50],q[129];
-rx(3.0258574787435393) q[101];
-rz(0.3874383702223457) q[102];
-cx q[3],q[102];
-cx q[3],q[107];
-cx q[4],q[102];
-rz(0.3874383702223457) q[102];
-cx q[4],q[102];
-cx q[4],q[127];
-rx(3.0258574787435393) q[102];
-rz(0.3874383702223457) q[103];
-cx q[16],q[103];
-rx(3.0258574787435393) q[16];
-cx q[57],q[103];
-rz(0.3874383702223457) q[103];
-cx q[57],q[103];
-rx(3.0258574787435393) q[57];
-rx(3.0258574787435393) q[103];
-rz(0.3874383702223457) q[104];
-cx q[7],q[104];
-cx q[13],q[104];
-rz(0.3874383702223457) q[104];
-cx q[13],q[104];
-rx(3.0258574787435393) q[13];
-cx q[104],q[114];
-rz(0.3874383702223457) q[105];
-cx q[26],q[105];
-cx q[26],q[117];
-cx q[28],q[105];
-rz(0.3874383702223457) q[105];
-cx q[28],q[105];
-cx q[28],q[116];
-rx(3.0258574787435393) q[105];
-rz(0.3874383702223457) q[107];
-cx q[3],q[107];
-cx q[3],q[110];
-cx q[31],q[107];
-rz(0.3874383702223457) q[107];
-cx q[31],q[107];
-rx(3.0258574787435393) q[107];
-rz(0.3874383702223457) q[108];
-cx q[15],q[108];
-cx q[15],q[115];
-cx q[31],q[108];
-rz(0.3874383702223457) q[108];
-cx q[31],q[108];
-rx(3.0258574787435393) q[31];
-rx(3.0258574787435393) q[108];
-rz(0.3874383702223457) q[110];
-cx q[3],q[110];
-cx q[3],q[111];
-cx q[24],q[110];
-rz(0.3874383702223457) q[110];
-cx q[24],q[110];
-rx(3.0258574787435393) q[24];
-rz(0.3874383702223457) q[111];
-cx q[3],q[111];
-cx q[3],q[113];
-cx q[21],q[111];
-rz(0.3874383702223457) q[111];
-cx q[21],q[111];
-cx q[21],q[112];
-rx(3.0258574787435393) q[111];
-rz(0.3874383702223457) q[112];
-cx q[21],q[112];
-rx(3.0258574787435393) q[21];
-rz(0.3874383702223457) q[113];
-cx q[3],q[113];
-cx q[3],q[125];
-rx(3.0258574787435393) q[113];
-rz(0.3874383702223457) q[114];
-cx q[104],q[114];
-cx q[110],q[114];
-rz(0.3874383702223457) q[114];
-cx q[110],q[114];
-rx(3.0258574787435393) q[110];
-rx(3.0258574787435393) q[114];
-rz(0.3874383702223457) q[115];
-cx q[15],q[115];
-rz(0.3874383702223457) q[116];
-cx q[28],q[116];
-rx(3.0258574787435393) q[28];
-cx q[42],q[116];
-rz(0.3874383702223457) q[116];
-cx q[42],q[116];
-rx(3.0258574787435393) q[42];
-rx(3.0258574787435393) q[116];
-rz(0.3874383702223457) q[117];
-cx q[26],q[117];
-rx(3.0258574787435393) q[26];
-cx q[32],q[117];
-rz(0.3874383702223457) q[117];
-cx q[32],q[117];
-cx q[32],q[131];
-rx(3.0258574787435393) q[117];
-rz(0.3874383702223457) q[119];
-cx q[40],q[119];
-rx(3.0258574787435393) q[40];
-cx q[69],q[119];
-rz(0.3874383702223457) q[119];
-cx q[69],q[119];
-rx(3.0258574787435393) q[69];
-rx(3.0258574787435393) q[119];
-rz(0.3874383702223457) q[120];
-cx q[46],q[120];
-rx(3.0258574787435393) q[46];
-cx q[94],q[120];
-rz(0.3874383702223457) q[120];
-cx q[94],q[120];
-rx(3.0258574787435393) q[94];
-rx(3.0258574787435393) q[120];
-rz(0.3874383702223457) q[121];
-cx q[20],q[121];
-rx(3.0258574787435393) q[20];
-cx q[104],q[121];
-rz(0.3874383702223457) q[121];
-cx q[104],q[121];
-rx(3.0258574787435393) q[104];
-rx(3.0258574787435393) q[121];
-rz(0.3874383702223457) q[122];
-cx q[63],q[122];
-rx(3.0258574787435393) q[63];
-cx q[81],q[122];
-rz(0.3874383702223457) q[122];
-cx q[81],q[122];
-rx(3.0258574787435393) q[122];
-rz(0.3874383702223457) q[123];
-cx q[52],q[123];
-rx(3.0258574787435393) q[52];
-rz(0.3874383702223457) q[124];
-cx q[53],q[124];
-rx(3.0258574787435393) q[53];
-cx q[81],q[124];
-rz(0.3874383702223457) q[124];
-cx q[81],q[124];
-rx(3.0258574787435393) q[81];
-rx(3.0258574787435393) q[124];
-rz(0.3874383702223457) q[125];
-cx q[3],q[125];
-cx q[3],q[132];
-rz(0.3874383702223457) q[126];
-cx q[12],q[126];
-rx(3.0258574787435393) q[12];
-rx(3.0258574787435393) q[126];
-rz(0.3874383702223457) q[127];
-cx q[4],q[127];
-rx(3.0258574787435393) q[4];
-cx q[62],q[127];
-rz(0.3874383702223457) q[127];
-cx q[62],q[127];
-cx q[62],q[128];
-rx(3.0258574787435393) q[127];
-rz(0.3874383702223457) q[128];
-cx q[62],q[128];
-rx(3.0258574787435393) q[62];
-rz(0.3874383702223457) q[129];
-cx q[50],q[129];
-rx(3.0258574787435393) q[50];
-cx q[91],q[129];
-rz(0.3874383702223457) q[129];
-cx q[91],q[129];
-rx(3.0258574787435393) q[91];
-rx(3.0258574787435393) q[129];
-rz(0.3874383702223457) q[130];
-cx q[35],q[130];
-rx(3.0258574787435393) q[35];
-rz(0.3874383702223457) q[131];
-cx q[32],q[131];
-rx(3.0258574787435393) q[32];
-cx q[123],q[131];
-rz(0.3874383702223457) q[131];
-cx q[123],q[131];
-rx(3.0258574787435393) q[123];
-rx(3.0258574787435393) q[131];
-rz(0.3874383702223457) q[132];
-cx q[3],q[132];
-rx(3.0258574787435393) q[3];
-cx q[37],q[132];
-rz(0.3874383702223457) q[132];
-cx q[37],q[132];
-rx(3.0258574787435393) q[37];
-rx(3.0258574787435393) q[132];
-rz(0.39985135775015646) q[133];
-cx q[89],q[133];
-rx(8.302707954496386) q[89];
-cx q[2],q[89];
-rz(0.3874383702223457) q[89];
-cx q[2],q[89];
-rx(3.0258574787435393) q[2];
-cx q[5],q[89];
-rz(0.3874383702223457) q[89];
-cx q[5],q[89];
-cx q[5],q[95];
-cx q[89],q[92];
-rz(0.3874383702223457) q[92];
-cx q[89],q[92];
-cx q[92],q[96];
-rz(0.3874383702223457) q[95];
-cx q[5],q[95];
-cx q[5],q[106];
-cx q[27],q[95];
-rz(0.3874383702223457) q[95];
-cx q[27],q[95];
-rx(3.0258574787435393) q[27];
-rx(3.0258574787435393) q[95];
-rz(0.3874383702223457) q[96];
-cx q[92],q[96];
-cx q[92],q[115];
-rx(3.0258574787435393) q[96];
-rz(0.3874383702223457) q[106];
-cx q[5],q[106];
-cx q[5],q[109];
-cx q[36],q[106];
-rz(0.3874383702223457) q[106];
-cx q[36],q[106];
-cx q[36],q[112];
-rx(3.0258574787435393) q[106];
-rz(0.3874383702223457) q[109];
-cx q[5],q[109];
-cx q[5],q[118];
-cx q[39],q[109];
-rz(0.3874383702223457) q[109];
-cx q[39],q[109];
-rx(3.0258574787435393) q[39];
-cx q[109],q[125];
-rz(0.3874383702223457) q[112];
-cx q[36],q[112];
-rx(3.0258574787435393) q[36];
-rx(3.0258574787435393) q[112];
-rz(0.3874383702223457) q[115];
-cx q[92],q[115];
-rx(3.0258574787435393) q[92];
-rx(3.0258574787435393) q[115];
-rz(0.3874383702223457) q[118];
-cx q[5],q[118];
-rx(3.0258574787435393) q[5];
-cx q[15],q[118];
-rz(0.3874383702223457) q[118];
-cx q[15],q[118];
-rx(3.0258574787435393) q[15];
-rx(3.0258574787435393) q[118];
-rz(0.3874383702223457) q[125];
-cx q[109],q[125];
-cx q[109],q[128];
-rx(3.0258574787435393) q[125];
-rz(0.3874383702223457) q[128];
-cx q[109],q[128];
-cx q[109],q[130];
-rx(3.0258574787435393) q[128];
-rz(0.3874383702223457) q[130];
-cx q[109],q[130];
-rx(3.0258574787435393) q[109];
-rx(3.0258574787435393) q[130];
-rx(8.302707954496386) q[133];
-cx q[7],q[133];
-rz(0.3874383702223457) q[133];
-cx q[7],q[133];
-rx(3.0258574787435393) q[7];
-cx q[89],q[133];
-rz(0.3874383702223457) q[133];
-cx q[89],q[133];
-rx(3.0258574787435393) q[89];
-rx(3.0258574787435393) q[133];
\ No newline at end of file
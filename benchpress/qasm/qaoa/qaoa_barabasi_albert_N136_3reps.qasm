@@ -1,3095 +0,0 @@
-OPENQASM 2.0;
-include "qelib1.inc";
-qreg q[136];
-ry(pi/2) q[0];
-rx(pi) q[0];
-ry(pi/2) q[1];
-rx(pi) q[1];
-cx q[0],q[1];
-rz(5.058885002185787) q[1];
-cx q[0],q[1];
-ry(pi/2) q[2];
-rx(pi) q[2];
-cx q[0],q[2];
-rz(5.058885002185787) q[2];
-cx q[0],q[2];
-ry(pi/2) q[3];
-rx(pi) q[3];
-cx q[0],q[3];
-rz(5.058885002185787) q[3];
-cx q[0],q[3];
-cx q[1],q[3];
-rz(5.058885002185787) q[3];
-cx q[1],q[3];
-ry(pi/2) q[4];
-rx(pi) q[4];
-cx q[1],q[4];
-rz(5.058885002185787) q[4];
-cx q[1],q[4];
-cx q[3],q[4];
-rz(5.058885002185787) q[4];
-cx q[3],q[4];
-ry(pi/2) q[5];
-rx(pi) q[5];
-cx q[1],q[5];
-rz(5.058885002185787) q[5];
-cx q[1],q[5];
-cx q[3],q[5];
-rz(5.058885002185787) q[5];
-cx q[3],q[5];
-ry(pi/2) q[6];
-rx(pi) q[6];
-cx q[4],q[6];
-rz(5.058885002185787) q[6];
-cx q[4],q[6];
-cx q[5],q[6];
-rz(5.058885002185787) q[6];
-cx q[5],q[6];
-ry(pi/2) q[7];
-rx(pi) q[7];
-cx q[3],q[7];
-rz(5.058885002185787) q[7];
-cx q[3],q[7];
-cx q[4],q[7];
-rz(5.058885002185787) q[7];
-cx q[4],q[7];
-ry(pi/2) q[8];
-rx(pi) q[8];
-cx q[3],q[8];
-rz(5.058885002185787) q[8];
-cx q[3],q[8];
-cx q[5],q[8];
-rz(5.058885002185787) q[8];
-cx q[5],q[8];
-ry(pi/2) q[9];
-rx(pi) q[9];
-cx q[1],q[9];
-rz(5.058885002185787) q[9];
-cx q[1],q[9];
-cx q[3],q[9];
-rz(5.058885002185787) q[9];
-cx q[3],q[9];
-ry(pi/2) q[10];
-rx(pi) q[10];
-cx q[4],q[10];
-rz(5.058885002185787) q[10];
-cx q[4],q[10];
-cx q[6],q[10];
-rz(5.058885002185787) q[10];
-cx q[6],q[10];
-ry(pi/2) q[11];
-rx(pi) q[11];
-cx q[5],q[11];
-rz(5.058885002185787) q[11];
-cx q[5],q[11];
-cx q[6],q[11];
-rz(5.058885002185787) q[11];
-cx q[6],q[11];
-rx(5.936674243179436) q[11];
-ry(pi/2) q[12];
-rx(pi) q[12];
-cx q[3],q[12];
-rz(5.058885002185787) q[12];
-cx q[3],q[12];
-cx q[5],q[12];
-rz(5.058885002185787) q[12];
-cx q[5],q[12];
-ry(pi/2) q[13];
-rx(pi) q[13];
-cx q[4],q[13];
-rz(5.058885002185787) q[13];
-cx q[4],q[13];
-cx q[5],q[13];
-rz(5.058885002185787) q[13];
-cx q[5],q[13];
-ry(pi/2) q[14];
-rx(pi) q[14];
-cx q[3],q[14];
-rz(5.058885002185787) q[14];
-cx q[3],q[14];
-cx q[4],q[14];
-rz(5.058885002185787) q[14];
-cx q[4],q[14];
-rx(5.936674243179436) q[14];
-ry(pi/2) q[15];
-rx(pi) q[15];
-cx q[0],q[15];
-rz(5.058885002185787) q[15];
-cx q[0],q[15];
-cx q[3],q[15];
-rz(5.058885002185787) q[15];
-cx q[3],q[15];
-ry(pi/2) q[16];
-rx(pi) q[16];
-cx q[0],q[16];
-rz(5.058885002185787) q[16];
-cx q[0],q[16];
-cx q[3],q[16];
-rz(5.058885002185787) q[16];
-cx q[3],q[16];
-ry(pi/2) q[17];
-rx(pi) q[17];
-cx q[1],q[17];
-rz(5.058885002185787) q[17];
-cx q[1],q[17];
-cx q[3],q[17];
-rz(5.058885002185787) q[17];
-cx q[3],q[17];
-ry(pi/2) q[18];
-rx(pi) q[18];
-cx q[3],q[18];
-rz(5.058885002185787) q[18];
-cx q[3],q[18];
-cx q[4],q[18];
-rz(5.058885002185787) q[18];
-cx q[4],q[18];
-ry(pi/2) q[19];
-rx(pi) q[19];
-cx q[3],q[19];
-rz(5.058885002185787) q[19];
-cx q[3],q[19];
-cx q[7],q[19];
-rz(5.058885002185787) q[19];
-cx q[7],q[19];
-ry(pi/2) q[20];
-rx(pi) q[20];
-cx q[0],q[20];
-rz(5.058885002185787) q[20];
-cx q[0],q[20];
-cx q[15],q[20];
-rz(5.058885002185787) q[20];
-cx q[15],q[20];
-ry(pi/2) q[21];
-rx(pi) q[21];
-cx q[4],q[21];
-rz(5.058885002185787) q[21];
-cx q[4],q[21];
-cx q[15],q[21];
-rz(5.058885002185787) q[21];
-cx q[15],q[21];
-ry(pi/2) q[22];
-rx(pi) q[22];
-cx q[3],q[22];
-rz(5.058885002185787) q[22];
-cx q[3],q[22];
-cx q[9],q[22];
-rz(5.058885002185787) q[22];
-cx q[9],q[22];
-rx(5.936674243179436) q[22];
-ry(pi/2) q[23];
-rx(pi) q[23];
-cx q[3],q[23];
-rz(5.058885002185787) q[23];
-cx q[3],q[23];
-cx q[17],q[23];
-rz(5.058885002185787) q[23];
-cx q[17],q[23];
-ry(pi/2) q[24];
-rx(pi) q[24];
-cx q[3],q[24];
-rz(5.058885002185787) q[24];
-cx q[3],q[24];
-cx q[5],q[24];
-rz(5.058885002185787) q[24];
-cx q[5],q[24];
-ry(pi/2) q[25];
-rx(pi) q[25];
-cx q[3],q[25];
-rz(5.058885002185787) q[25];
-cx q[3],q[25];
-cx q[12],q[25];
-rz(5.058885002185787) q[25];
-cx q[12],q[25];
-ry(pi/2) q[26];
-rx(pi) q[26];
-cx q[3],q[26];
-rz(5.058885002185787) q[26];
-cx q[3],q[26];
-cx q[21],q[26];
-rz(5.058885002185787) q[26];
-cx q[21],q[26];
-ry(pi/2) q[27];
-rx(pi) q[27];
-cx q[4],q[27];
-rz(5.058885002185787) q[27];
-cx q[4],q[27];
-cx q[6],q[27];
-rz(5.058885002185787) q[27];
-cx q[6],q[27];
-ry(pi/2) q[28];
-rx(pi) q[28];
-cx q[1],q[28];
-rz(5.058885002185787) q[28];
-cx q[1],q[28];
-cx q[3],q[28];
-rz(5.058885002185787) q[28];
-cx q[3],q[28];
-ry(pi/2) q[29];
-rx(pi) q[29];
-cx q[1],q[29];
-rz(5.058885002185787) q[29];
-cx q[1],q[29];
-cx q[3],q[29];
-rz(5.058885002185787) q[29];
-cx q[3],q[29];
-rx(5.936674243179436) q[29];
-ry(pi/2) q[30];
-rx(pi) q[30];
-cx q[3],q[30];
-rz(5.058885002185787) q[30];
-cx q[3],q[30];
-cx q[18],q[30];
-rz(5.058885002185787) q[30];
-cx q[18],q[30];
-rx(5.936674243179436) q[18];
-ry(pi/2) q[31];
-rx(pi) q[31];
-cx q[12],q[31];
-rz(5.058885002185787) q[31];
-cx q[12],q[31];
-cx q[26],q[31];
-rz(5.058885002185787) q[31];
-cx q[26],q[31];
-ry(pi/2) q[32];
-rx(pi) q[32];
-cx q[0],q[32];
-rz(5.058885002185787) q[32];
-cx q[0],q[32];
-cx q[21],q[32];
-rz(5.058885002185787) q[32];
-cx q[21],q[32];
-ry(pi/2) q[33];
-rx(pi) q[33];
-cx q[5],q[33];
-rz(5.058885002185787) q[33];
-cx q[5],q[33];
-cx q[30],q[33];
-rz(5.058885002185787) q[33];
-cx q[30],q[33];
-rx(5.936674243179436) q[33];
-ry(pi/2) q[34];
-rx(pi) q[34];
-cx q[3],q[34];
-rz(5.058885002185787) q[34];
-cx q[3],q[34];
-cx q[12],q[34];
-rz(5.058885002185787) q[34];
-cx q[12],q[34];
-ry(pi/2) q[35];
-rx(pi) q[35];
-cx q[3],q[35];
-rz(5.058885002185787) q[35];
-cx q[3],q[35];
-cx q[32],q[35];
-rz(5.058885002185787) q[35];
-cx q[32],q[35];
-ry(pi/2) q[36];
-rx(pi) q[36];
-cx q[15],q[36];
-rz(5.058885002185787) q[36];
-cx q[15],q[36];
-cx q[20],q[36];
-rz(5.058885002185787) q[36];
-cx q[20],q[36];
-ry(pi/2) q[37];
-rx(pi) q[37];
-cx q[10],q[37];
-rz(5.058885002185787) q[37];
-cx q[10],q[37];
-cx q[34],q[37];
-rz(5.058885002185787) q[37];
-cx q[34],q[37];
-rx(5.936674243179436) q[34];
-ry(pi/2) q[38];
-rx(pi) q[38];
-cx q[19],q[38];
-rz(5.058885002185787) q[38];
-cx q[19],q[38];
-rx(5.936674243179436) q[19];
-cx q[21],q[38];
-rz(5.058885002185787) q[38];
-cx q[21],q[38];
-ry(pi/2) q[39];
-rx(pi) q[39];
-cx q[3],q[39];
-rz(5.058885002185787) q[39];
-cx q[3],q[39];
-cx q[13],q[39];
-rz(5.058885002185787) q[39];
-cx q[13],q[39];
-ry(pi/2) q[40];
-rx(pi) q[40];
-cx q[3],q[40];
-rz(5.058885002185787) q[40];
-cx q[3],q[40];
-cx q[23],q[40];
-rz(5.058885002185787) q[40];
-cx q[23],q[40];
-ry(pi/2) q[41];
-rx(pi) q[41];
-cx q[10],q[41];
-rz(5.058885002185787) q[41];
-cx q[10],q[41];
-cx q[27],q[41];
-rz(5.058885002185787) q[41];
-cx q[27],q[41];
-ry(pi/2) q[42];
-rx(pi) q[42];
-cx q[0],q[42];
-rz(5.058885002185787) q[42];
-cx q[0],q[42];
-cx q[3],q[42];
-rz(5.058885002185787) q[42];
-cx q[3],q[42];
-ry(pi/2) q[43];
-rx(pi) q[43];
-cx q[3],q[43];
-rz(5.058885002185787) q[43];
-cx q[3],q[43];
-cx q[20],q[43];
-rz(5.058885002185787) q[43];
-cx q[20],q[43];
-rx(5.936674243179436) q[43];
-ry(pi/2) q[44];
-rx(pi) q[44];
-cx q[3],q[44];
-rz(5.058885002185787) q[44];
-cx q[3],q[44];
-cx q[12],q[44];
-rz(5.058885002185787) q[44];
-cx q[12],q[44];
-ry(pi/2) q[45];
-rx(pi) q[45];
-cx q[1],q[45];
-rz(5.058885002185787) q[45];
-cx q[1],q[45];
-cx q[16],q[45];
-rz(5.058885002185787) q[45];
-cx q[16],q[45];
-ry(pi/2) q[46];
-rx(pi) q[46];
-cx q[5],q[46];
-rz(5.058885002185787) q[46];
-cx q[5],q[46];
-cx q[38],q[46];
-rz(5.058885002185787) q[46];
-cx q[38],q[46];
-rx(5.936674243179436) q[38];
-ry(pi/2) q[47];
-rx(pi) q[47];
-cx q[4],q[47];
-rz(5.058885002185787) q[47];
-cx q[4],q[47];
-cx q[17],q[47];
-rz(5.058885002185787) q[47];
-cx q[17],q[47];
-ry(pi/2) q[48];
-rx(pi) q[48];
-cx q[0],q[48];
-rz(5.058885002185787) q[48];
-cx q[0],q[48];
-cx q[30],q[48];
-rz(5.058885002185787) q[48];
-cx q[30],q[48];
-rx(5.936674243179436) q[48];
-ry(pi/2) q[49];
-rx(pi) q[49];
-cx q[3],q[49];
-rz(5.058885002185787) q[49];
-cx q[3],q[49];
-cx q[4],q[49];
-rz(5.058885002185787) q[49];
-cx q[4],q[49];
-rx(5.936674243179436) q[49];
-ry(pi/2) q[50];
-rx(pi) q[50];
-cx q[3],q[50];
-rz(5.058885002185787) q[50];
-cx q[3],q[50];
-cx q[12],q[50];
-rz(5.058885002185787) q[50];
-cx q[12],q[50];
-ry(pi/2) q[51];
-rx(pi) q[51];
-cx q[0],q[51];
-rz(5.058885002185787) q[51];
-cx q[0],q[51];
-cx q[28],q[51];
-rz(5.058885002185787) q[51];
-cx q[28],q[51];
-rx(5.936674243179436) q[51];
-ry(pi/2) q[52];
-rx(pi) q[52];
-cx q[3],q[52];
-rz(5.058885002185787) q[52];
-cx q[3],q[52];
-cx q[10],q[52];
-rz(5.058885002185787) q[52];
-cx q[10],q[52];
-ry(pi/2) q[53];
-rx(pi) q[53];
-cx q[17],q[53];
-rz(5.058885002185787) q[53];
-cx q[17],q[53];
-cx q[21],q[53];
-rz(5.058885002185787) q[53];
-cx q[21],q[53];
-ry(pi/2) q[54];
-rx(pi) q[54];
-cx q[24],q[54];
-rz(5.058885002185787) q[54];
-cx q[24],q[54];
-cx q[28],q[54];
-rz(5.058885002185787) q[54];
-cx q[28],q[54];
-rx(5.936674243179436) q[54];
-ry(pi/2) q[55];
-rx(pi) q[55];
-cx q[9],q[55];
-rz(5.058885002185787) q[55];
-cx q[9],q[55];
-cx q[15],q[55];
-rz(5.058885002185787) q[55];
-cx q[15],q[55];
-ry(pi/2) q[56];
-rx(pi) q[56];
-cx q[13],q[56];
-rz(5.058885002185787) q[56];
-cx q[13],q[56];
-cx q[45],q[56];
-rz(5.058885002185787) q[56];
-cx q[45],q[56];
-rx(5.936674243179436) q[45];
-ry(pi/2) q[57];
-rx(pi) q[57];
-cx q[1],q[57];
-rz(5.058885002185787) q[57];
-cx q[1],q[57];
-cx q[3],q[57];
-rz(5.058885002185787) q[57];
-cx q[3],q[57];
-ry(pi/2) q[58];
-rx(pi) q[58];
-cx q[24],q[58];
-rz(5.058885002185787) q[58];
-cx q[24],q[58];
-cx q[28],q[58];
-rz(5.058885002185787) q[58];
-cx q[28],q[58];
-rx(5.936674243179436) q[58];
-ry(pi/2) q[59];
-rx(pi) q[59];
-cx q[16],q[59];
-rz(5.058885002185787) q[59];
-cx q[16],q[59];
-cx q[32],q[59];
-rz(5.058885002185787) q[59];
-cx q[32],q[59];
-ry(pi/2) q[60];
-rx(pi) q[60];
-cx q[1],q[60];
-rz(5.058885002185787) q[60];
-cx q[1],q[60];
-cx q[7],q[60];
-rz(5.058885002185787) q[60];
-cx q[7],q[60];
-ry(pi/2) q[61];
-rx(pi) q[61];
-cx q[4],q[61];
-rz(5.058885002185787) q[61];
-cx q[4],q[61];
-cx q[7],q[61];
-rz(5.058885002185787) q[61];
-cx q[7],q[61];
-rx(5.936674243179436) q[61];
-ry(pi/2) q[62];
-rx(pi) q[62];
-cx q[0],q[62];
-rz(5.058885002185787) q[62];
-cx q[0],q[62];
-cx q[17],q[62];
-rz(5.058885002185787) q[62];
-cx q[17],q[62];
-ry(pi/2) q[63];
-rx(pi) q[63];
-cx q[12],q[63];
-rz(5.058885002185787) q[63];
-cx q[12],q[63];
-cx q[17],q[63];
-rz(5.058885002185787) q[63];
-cx q[17],q[63];
-ry(pi/2) q[64];
-rx(pi) q[64];
-cx q[0],q[64];
-rz(5.058885002185787) q[64];
-cx q[0],q[64];
-cx q[10],q[64];
-rz(5.058885002185787) q[64];
-cx q[10],q[64];
-rx(5.936674243179436) q[64];
-ry(pi/2) q[65];
-rx(pi) q[65];
-cx q[5],q[65];
-rz(5.058885002185787) q[65];
-cx q[5],q[65];
-cx q[23],q[65];
-rz(5.058885002185787) q[65];
-cx q[23],q[65];
-rx(5.936674243179436) q[23];
-rx(5.936674243179436) q[65];
-ry(pi/2) q[66];
-rx(pi) q[66];
-cx q[17],q[66];
-rz(5.058885002185787) q[66];
-cx q[17],q[66];
-rx(5.936674243179436) q[17];
-cx q[47],q[66];
-rz(5.058885002185787) q[66];
-cx q[47],q[66];
-rx(5.936674243179436) q[66];
-ry(pi/2) q[67];
-rx(pi) q[67];
-cx q[41],q[67];
-rz(5.058885002185787) q[67];
-cx q[41],q[67];
-cx q[56],q[67];
-rz(5.058885002185787) q[67];
-cx q[56],q[67];
-rx(5.936674243179436) q[67];
-ry(pi/2) q[68];
-rx(pi) q[68];
-cx q[13],q[68];
-rz(5.058885002185787) q[68];
-cx q[13],q[68];
-cx q[32],q[68];
-rz(5.058885002185787) q[68];
-cx q[32],q[68];
-ry(pi/2) q[69];
-rx(pi) q[69];
-cx q[6],q[69];
-rz(5.058885002185787) q[69];
-cx q[6],q[69];
-cx q[59],q[69];
-rz(5.058885002185787) q[69];
-cx q[59],q[69];
-ry(pi/2) q[70];
-rx(pi) q[70];
-cx q[3],q[70];
-rz(5.058885002185787) q[70];
-cx q[3],q[70];
-cx q[15],q[70];
-rz(5.058885002185787) q[70];
-cx q[15],q[70];
-ry(pi/2) q[71];
-rx(pi) q[71];
-cx q[3],q[71];
-rz(5.058885002185787) q[71];
-cx q[3],q[71];
-cx q[53],q[71];
-rz(5.058885002185787) q[71];
-cx q[53],q[71];
-rx(5.936674243179436) q[71];
-ry(pi/2) q[72];
-rx(pi) q[72];
-cx q[27],q[72];
-rz(5.058885002185787) q[72];
-cx q[27],q[72];
-cx q[44],q[72];
-rz(5.058885002185787) q[72];
-cx q[44],q[72];
-rx(5.936674243179436) q[44];
-rx(5.936674243179436) q[72];
-ry(pi/2) q[73];
-rx(pi) q[73];
-cx q[16],q[73];
-rz(5.058885002185787) q[73];
-cx q[16],q[73];
-cx q[59],q[73];
-rz(5.058885002185787) q[73];
-cx q[59],q[73];
-ry(pi/2) q[74];
-rx(pi) q[74];
-cx q[56],q[74];
-rz(5.058885002185787) q[74];
-cx q[56],q[74];
-cx q[63],q[74];
-rz(5.058885002185787) q[74];
-cx q[63],q[74];
-rx(5.936674243179436) q[74];
-ry(pi/2) q[75];
-rx(pi) q[75];
-cx q[0],q[75];
-rz(5.058885002185787) q[75];
-cx q[0],q[75];
-cx q[21],q[75];
-rz(5.058885002185787) q[75];
-cx q[21],q[75];
-rx(5.936674243179436) q[75];
-ry(pi/2) q[76];
-rx(pi) q[76];
-cx q[5],q[76];
-rz(5.058885002185787) q[76];
-cx q[5],q[76];
-cx q[6],q[76];
-rz(5.058885002185787) q[76];
-cx q[6],q[76];
-rx(5.936674243179436) q[76];
-ry(pi/2) q[77];
-rx(pi) q[77];
-cx q[3],q[77];
-rz(5.058885002185787) q[77];
-cx q[3],q[77];
-cx q[30],q[77];
-rz(5.058885002185787) q[77];
-cx q[30],q[77];
-rx(5.936674243179436) q[30];
-ry(pi/2) q[78];
-rx(pi) q[78];
-cx q[42],q[78];
-rz(5.058885002185787) q[78];
-cx q[42],q[78];
-cx q[60],q[78];
-rz(5.058885002185787) q[78];
-cx q[60],q[78];
-rx(5.936674243179436) q[78];
-ry(pi/2) q[79];
-rx(pi) q[79];
-cx q[6],q[79];
-rz(5.058885002185787) q[79];
-cx q[6],q[79];
-cx q[50],q[79];
-rz(5.058885002185787) q[79];
-cx q[50],q[79];
-rx(5.936674243179436) q[79];
-ry(pi/2) q[80];
-rx(pi) q[80];
-cx q[9],q[80];
-rz(5.058885002185787) q[80];
-cx q[9],q[80];
-rx(5.936674243179436) q[9];
-cx q[15],q[80];
-rz(5.058885002185787) q[80];
-cx q[15],q[80];
-rx(5.936674243179436) q[80];
-ry(pi/2) q[81];
-rx(pi) q[81];
-cx q[21],q[81];
-rz(5.058885002185787) q[81];
-cx q[21],q[81];
-cx q[77],q[81];
-rz(5.058885002185787) q[81];
-cx q[77],q[81];
-rx(5.936674243179436) q[77];
-ry(pi/2) q[82];
-rx(pi) q[82];
-cx q[0],q[82];
-rz(5.058885002185787) q[82];
-cx q[0],q[82];
-cx q[56],q[82];
-rz(5.058885002185787) q[82];
-cx q[56],q[82];
-rx(5.936674243179436) q[82];
-ry(pi/2) q[83];
-rx(pi) q[83];
-cx q[8],q[83];
-rz(5.058885002185787) q[83];
-cx q[8],q[83];
-rx(5.936674243179436) q[8];
-cx q[68],q[83];
-rz(5.058885002185787) q[83];
-cx q[68],q[83];
-rx(5.936674243179436) q[68];
-rx(5.936674243179436) q[83];
-ry(pi/2) q[84];
-rx(pi) q[84];
-cx q[70],q[84];
-rz(5.058885002185787) q[84];
-cx q[70],q[84];
-rx(5.936674243179436) q[70];
-cx q[73],q[84];
-rz(5.058885002185787) q[84];
-cx q[73],q[84];
-rx(5.936674243179436) q[73];
-rx(5.936674243179436) q[84];
-ry(pi/2) q[85];
-rx(pi) q[85];
-cx q[37],q[85];
-rz(5.058885002185787) q[85];
-cx q[37],q[85];
-cx q[59],q[85];
-rz(5.058885002185787) q[85];
-cx q[59],q[85];
-rx(5.936674243179436) q[59];
-rx(5.936674243179436) q[85];
-ry(pi/2) q[86];
-rx(pi) q[86];
-cx q[24],q[86];
-rz(5.058885002185787) q[86];
-cx q[24],q[86];
-cx q[53],q[86];
-rz(5.058885002185787) q[86];
-cx q[53],q[86];
-rx(5.936674243179436) q[86];
-ry(pi/2) q[87];
-rx(pi) q[87];
-cx q[28],q[87];
-rz(5.058885002185787) q[87];
-cx q[28],q[87];
-cx q[32],q[87];
-rz(5.058885002185787) q[87];
-cx q[32],q[87];
-rx(5.936674243179436) q[87];
-ry(pi/2) q[88];
-rx(pi) q[88];
-cx q[3],q[88];
-rz(5.058885002185787) q[88];
-cx q[3],q[88];
-cx q[60],q[88];
-rz(5.058885002185787) q[88];
-cx q[60],q[88];
-rx(5.936674243179436) q[60];
-rx(5.936674243179436) q[88];
-ry(pi/2) q[89];
-rx(pi) q[89];
-cx q[2],q[89];
-rz(5.058885002185787) q[89];
-cx q[2],q[89];
-rx(5.936674243179436) q[2];
-cx q[5],q[89];
-rz(5.058885002185787) q[89];
-cx q[5],q[89];
-ry(pi/2) q[90];
-rx(pi) q[90];
-cx q[15],q[90];
-rz(5.058885002185787) q[90];
-cx q[15],q[90];
-cx q[27],q[90];
-rz(5.058885002185787) q[90];
-cx q[27],q[90];
-rx(5.936674243179436) q[90];
-ry(pi/2) q[91];
-rx(pi) q[91];
-cx q[0],q[91];
-rz(5.058885002185787) q[91];
-cx q[0],q[91];
-cx q[6],q[91];
-rz(5.058885002185787) q[91];
-cx q[6],q[91];
-rx(5.936674243179436) q[6];
-ry(pi/2) q[92];
-rx(pi) q[92];
-cx q[15],q[92];
-rz(5.058885002185787) q[92];
-cx q[15],q[92];
-cx q[89],q[92];
-rz(5.058885002185787) q[92];
-cx q[89],q[92];
-ry(pi/2) q[93];
-rx(pi) q[93];
-cx q[0],q[93];
-rz(5.058885002185787) q[93];
-cx q[0],q[93];
-cx q[32],q[93];
-rz(5.058885002185787) q[93];
-cx q[32],q[93];
-rx(5.936674243179436) q[93];
-ry(pi/2) q[94];
-rx(pi) q[94];
-cx q[36],q[94];
-rz(5.058885002185787) q[94];
-cx q[36],q[94];
-cx q[55],q[94];
-rz(5.058885002185787) q[94];
-cx q[55],q[94];
-rx(5.936674243179436) q[55];
-ry(pi/2) q[95];
-rx(pi) q[95];
-cx q[5],q[95];
-rz(5.058885002185787) q[95];
-cx q[5],q[95];
-cx q[27],q[95];
-rz(5.058885002185787) q[95];
-cx q[27],q[95];
-rx(5.936674243179436) q[27];
-rx(5.936674243179436) q[95];
-ry(pi/2) q[96];
-rx(pi) q[96];
-cx q[56],q[96];
-rz(5.058885002185787) q[96];
-cx q[56],q[96];
-rx(5.936674243179436) q[56];
-cx q[92],q[96];
-rz(5.058885002185787) q[96];
-cx q[92],q[96];
-rx(5.936674243179436) q[96];
-ry(pi/2) q[97];
-rx(pi) q[97];
-cx q[1],q[97];
-rz(5.058885002185787) q[97];
-cx q[1],q[97];
-cx q[7],q[97];
-rz(5.058885002185787) q[97];
-cx q[7],q[97];
-rx(5.936674243179436) q[97];
-ry(pi/2) q[98];
-rx(pi) q[98];
-cx q[10],q[98];
-rz(5.058885002185787) q[98];
-cx q[10],q[98];
-rx(5.936674243179436) q[10];
-cx q[21],q[98];
-rz(5.058885002185787) q[98];
-cx q[21],q[98];
-rx(5.936674243179436) q[98];
-ry(pi/2) q[99];
-rx(pi) q[99];
-cx q[4],q[99];
-rz(5.058885002185787) q[99];
-cx q[4],q[99];
-cx q[41],q[99];
-rz(5.058885002185787) q[99];
-cx q[41],q[99];
-rx(5.936674243179436) q[41];
-rx(5.936674243179436) q[99];
-ry(pi/2) q[100];
-rx(pi) q[100];
-cx q[3],q[100];
-rz(5.058885002185787) q[100];
-cx q[3],q[100];
-cx q[25],q[100];
-rz(5.058885002185787) q[100];
-cx q[25],q[100];
-rx(5.936674243179436) q[25];
-rx(5.936674243179436) q[100];
-ry(pi/2) q[101];
-rx(pi) q[101];
-cx q[16],q[101];
-rz(5.058885002185787) q[101];
-cx q[16],q[101];
-cx q[50],q[101];
-rz(5.058885002185787) q[101];
-cx q[50],q[101];
-rx(5.936674243179436) q[101];
-ry(pi/2) q[102];
-rx(pi) q[102];
-cx q[3],q[102];
-rz(5.058885002185787) q[102];
-cx q[3],q[102];
-cx q[4],q[102];
-rz(5.058885002185787) q[102];
-cx q[4],q[102];
-rx(5.936674243179436) q[102];
-ry(pi/2) q[103];
-rx(pi) q[103];
-cx q[16],q[103];
-rz(5.058885002185787) q[103];
-cx q[16],q[103];
-rx(5.936674243179436) q[16];
-cx q[57],q[103];
-rz(5.058885002185787) q[103];
-cx q[57],q[103];
-rx(5.936674243179436) q[57];
-rx(5.936674243179436) q[103];
-ry(pi/2) q[104];
-rx(pi) q[104];
-cx q[7],q[104];
-rz(5.058885002185787) q[104];
-cx q[7],q[104];
-cx q[13],q[104];
-rz(5.058885002185787) q[104];
-cx q[13],q[104];
-ry(pi/2) q[105];
-rx(pi) q[105];
-cx q[26],q[105];
-rz(5.058885002185787) q[105];
-cx q[26],q[105];
-cx q[28],q[105];
-rz(5.058885002185787) q[105];
-cx q[28],q[105];
-rx(5.936674243179436) q[105];
-ry(pi/2) q[106];
-rx(pi) q[106];
-cx q[5],q[106];
-rz(5.058885002185787) q[106];
-cx q[5],q[106];
-cx q[36],q[106];
-rz(5.058885002185787) q[106];
-cx q[36],q[106];
-rx(5.936674243179436) q[106];
-ry(pi/2) q[107];
-rx(pi) q[107];
-cx q[3],q[107];
-rz(5.058885002185787) q[107];
-cx q[3],q[107];
-cx q[31],q[107];
-rz(5.058885002185787) q[107];
-cx q[31],q[107];
-rx(5.936674243179436) q[107];
-ry(pi/2) q[108];
-rx(pi) q[108];
-cx q[15],q[108];
-rz(5.058885002185787) q[108];
-cx q[15],q[108];
-cx q[31],q[108];
-rz(5.058885002185787) q[108];
-cx q[31],q[108];
-rx(5.936674243179436) q[31];
-rx(5.936674243179436) q[108];
-ry(pi/2) q[109];
-rx(pi) q[109];
-cx q[5],q[109];
-rz(5.058885002185787) q[109];
-cx q[5],q[109];
-cx q[39],q[109];
-rz(5.058885002185787) q[109];
-cx q[39],q[109];
-rx(5.936674243179436) q[39];
-ry(pi/2) q[110];
-rx(pi) q[110];
-cx q[3],q[110];
-rz(5.058885002185787) q[110];
-cx q[3],q[110];
-cx q[24],q[110];
-rz(5.058885002185787) q[110];
-cx q[24],q[110];
-rx(5.936674243179436) q[24];
-ry(pi/2) q[111];
-rx(pi) q[111];
-cx q[3],q[111];
-rz(5.058885002185787) q[111];
-cx q[3],q[111];
-cx q[21],q[111];
-rz(5.058885002185787) q[111];
-cx q[21],q[111];
-rx(5.936674243179436) q[111];
-ry(pi/2) q[112];
-rx(pi) q[112];
-cx q[21],q[112];
-rz(5.058885002185787) q[112];
-cx q[21],q[112];
-rx(5.936674243179436) q[21];
-cx q[36],q[112];
-rz(5.058885002185787) q[112];
-cx q[36],q[112];
-rx(5.936674243179436) q[36];
-rx(5.936674243179436) q[112];
-ry(pi/2) q[113];
-rx(pi) q[113];
-cx q[1],q[113];
-rz(5.058885002185787) q[113];
-cx q[1],q[113];
-rx(5.936674243179436) q[1];
-cx q[3],q[113];
-rz(5.058885002185787) q[113];
-cx q[3],q[113];
-rx(5.936674243179436) q[113];
-ry(pi/2) q[114];
-rx(pi) q[114];
-cx q[104],q[114];
-rz(5.058885002185787) q[114];
-cx q[104],q[114];
-cx q[110],q[114];
-rz(5.058885002185787) q[114];
-cx q[110],q[114];
-rx(5.936674243179436) q[110];
-rx(5.936674243179436) q[114];
-ry(pi/2) q[115];
-rx(pi) q[115];
-cx q[15],q[115];
-rz(5.058885002185787) q[115];
-cx q[15],q[115];
-cx q[92],q[115];
-rz(5.058885002185787) q[115];
-cx q[92],q[115];
-rx(5.936674243179436) q[92];
-rx(5.936674243179436) q[115];
-ry(pi/2) q[116];
-rx(pi) q[116];
-cx q[28],q[116];
-rz(5.058885002185787) q[116];
-cx q[28],q[116];
-rx(5.936674243179436) q[28];
-cx q[42],q[116];
-rz(5.058885002185787) q[116];
-cx q[42],q[116];
-rx(5.936674243179436) q[42];
-rx(5.936674243179436) q[116];
-ry(pi/2) q[117];
-rx(pi) q[117];
-cx q[26],q[117];
-rz(5.058885002185787) q[117];
-cx q[26],q[117];
-rx(5.936674243179436) q[26];
-cx q[32],q[117];
-rz(5.058885002185787) q[117];
-cx q[32],q[117];
-rx(5.936674243179436) q[117];
-ry(pi/2) q[118];
-rx(pi) q[118];
-cx q[5],q[118];
-rz(5.058885002185787) q[118];
-cx q[5],q[118];
-rx(5.936674243179436) q[5];
-cx q[15],q[118];
-rz(5.058885002185787) q[118];
-cx q[15],q[118];
-rx(5.936674243179436) q[15];
-rx(5.936674243179436) q[118];
-ry(pi/2) q[119];
-rx(pi) q[119];
-cx q[40],q[119];
-rz(5.058885002185787) q[119];
-cx q[40],q[119];
-rx(5.936674243179436) q[40];
-cx q[69],q[119];
-rz(5.058885002185787) q[119];
-cx q[69],q[119];
-rx(5.936674243179436) q[69];
-rx(5.936674243179436) q[119];
-ry(pi/2) q[120];
-rx(pi) q[120];
-cx q[46],q[120];
-rz(5.058885002185787) q[120];
-cx q[46],q[120];
-rx(5.936674243179436) q[46];
-cx q[94],q[120];
-rz(5.058885002185787) q[120];
-cx q[94],q[120];
-rx(5.936674243179436) q[94];
-rx(5.936674243179436) q[120];
-ry(pi/2) q[121];
-rx(pi) q[121];
-cx q[20],q[121];
-rz(5.058885002185787) q[121];
-cx q[20],q[121];
-rx(5.936674243179436) q[20];
-cx q[104],q[121];
-rz(5.058885002185787) q[121];
-cx q[104],q[121];
-rx(5.936674243179436) q[104];
-rx(5.936674243179436) q[121];
-ry(pi/2) q[122];
-rx(pi) q[122];
-cx q[63],q[122];
-rz(5.058885002185787) q[122];
-cx q[63],q[122];
-rx(5.936674243179436) q[63];
-cx q[81],q[122];
-rz(5.058885002185787) q[122];
-cx q[81],q[122];
-rx(5.936674243179436) q[122];
-ry(pi/2) q[123];
-rx(pi) q[123];
-cx q[0],q[123];
-rz(5.058885002185787) q[123];
-cx q[0],q[123];
-cx q[52],q[123];
-rz(5.058885002185787) q[123];
-cx q[52],q[123];
-rx(5.936674243179436) q[52];
-ry(pi/2) q[124];
-rx(pi) q[124];
-cx q[53],q[124];
-rz(5.058885002185787) q[124];
-cx q[53],q[124];
-rx(5.936674243179436) q[53];
-cx q[81],q[124];
-rz(5.058885002185787) q[124];
-cx q[81],q[124];
-rx(5.936674243179436) q[81];
-rx(5.936674243179436) q[124];
-ry(pi/2) q[125];
-rx(pi) q[125];
-cx q[3],q[125];
-rz(5.058885002185787) q[125];
-cx q[3],q[125];
-cx q[109],q[125];
-rz(5.058885002185787) q[125];
-cx q[109],q[125];
-rx(5.936674243179436) q[125];
-ry(pi/2) q[126];
-rx(pi) q[126];
-cx q[0],q[126];
-rz(5.058885002185787) q[126];
-cx q[0],q[126];
-cx q[12],q[126];
-rz(5.058885002185787) q[126];
-cx q[12],q[126];
-rx(5.936674243179436) q[12];
-rx(5.936674243179436) q[126];
-ry(pi/2) q[127];
-rx(pi) q[127];
-cx q[4],q[127];
-rz(5.058885002185787) q[127];
-cx q[4],q[127];
-rx(5.936674243179436) q[4];
-cx q[62],q[127];
-rz(5.058885002185787) q[127];
-cx q[62],q[127];
-rx(5.936674243179436) q[127];
-ry(pi/2) q[128];
-rx(pi) q[128];
-cx q[62],q[128];
-rz(5.058885002185787) q[128];
-cx q[62],q[128];
-rx(5.936674243179436) q[62];
-cx q[109],q[128];
-rz(5.058885002185787) q[128];
-cx q[109],q[128];
-rx(5.936674243179436) q[128];
-ry(pi/2) q[129];
-rx(pi) q[129];
-cx q[50],q[129];
-rz(5.058885002185787) q[129];
-cx q[50],q[129];
-rx(5.936674243179436) q[50];
-cx q[91],q[129];
-rz(5.058885002185787) q[129];
-cx q[91],q[129];
-rx(5.936674243179436) q[91];
-rx(5.936674243179436) q[129];
-ry(pi/2) q[130];
-rx(pi) q[130];
-cx q[35],q[130];
-rz(5.058885002185787) q[130];
-cx q[35],q[130];
-rx(5.936674243179436) q[35];
-cx q[109],q[130];
-rz(5.058885002185787) q[130];
-cx q[109],q[130];
-rx(5.936674243179436) q[109];
-rx(5.936674243179436) q[130];
-ry(pi/2) q[131];
-rx(pi) q[131];
-cx q[32],q[131];
-rz(5.058885002185787) q[131];
-cx q[32],q[131];
-rx(5.936674243179436) q[32];
-cx q[123],q[131];
-rz(5.058885002185787) q[131];
-cx q[123],q[131];
-rx(5.936674243179436) q[123];
-rx(5.936674243179436) q[131];
-ry(pi/2) q[132];
-rx(pi) q[132];
-cx q[3],q[132];
-rz(5.058885002185787) q[132];
-cx q[3],q[132];
-cx q[37],q[132];
-rz(5.058885002185787) q[132];
-cx q[37],q[132];
-rx(5.936674243179436) q[37];
-rx(5.936674243179436) q[132];
-ry(pi/2) q[133];
-rx(pi) q[133];
-cx q[7],q[133];
-rz(5.058885002185787) q[133];
-cx q[7],q[133];
-rx(5.936674243179436) q[7];
-cx q[89],q[133];
-rz(5.058885002185787) q[133];
-cx q[89],q[133];
-rx(5.936674243179436) q[89];
-rx(5.936674243179436) q[133];
-ry(pi/2) q[134];
-rx(pi) q[134];
-cx q[3],q[134];
-rz(5.058885002185787) q[134];
-cx q[3],q[134];
-rx(5.936674243179436) q[3];
-cx q[47],q[134];
-rz(5.058885002185787) q[134];
-cx q[47],q[134];
-rx(5.936674243179436) q[47];
-rx(5.936674243179436) q[134];
-ry(pi/2) q[135];
-rx(pi) q[135];
-cx q[0],q[135];
-rz(5.058885002185787) q[135];
-cx q[0],q[135];
-rx(5.936674243179436) q[0];
-cx q[0],q[1];
-rz(4.419901217243866) q[1];
-cx q[0],q[1];
-cx q[0],q[2];
-rz(4.419901217243866) q[2];
-cx q[0],q[2];
-cx q[0],q[3];
-cx q[2],q[89];
-rz(4.419901217243866) q[3];
-cx q[0],q[3];
-cx q[0],q[15];
-cx q[1],q[3];
-rz(4.419901217243866) q[3];
-cx q[1],q[3];
-cx q[1],q[4];
-rz(4.419901217243866) q[4];
-cx q[1],q[4];
-cx q[1],q[5];
-cx q[3],q[4];
-rz(4.419901217243866) q[4];
-cx q[3],q[4];
-cx q[4],q[6];
-rz(4.419901217243866) q[5];
-cx q[1],q[5];
-cx q[1],q[9];
-cx q[3],q[5];
-rz(4.419901217243866) q[5];
-cx q[3],q[5];
-cx q[3],q[7];
-rz(4.419901217243866) q[6];
-cx q[4],q[6];
-cx q[5],q[6];
-rz(4.419901217243866) q[6];
-cx q[5],q[6];
-rz(4.419901217243866) q[7];
-cx q[3],q[7];
-cx q[3],q[8];
-cx q[4],q[7];
-rz(4.419901217243866) q[7];
-cx q[4],q[7];
-cx q[4],q[10];
-rz(4.419901217243866) q[8];
-cx q[3],q[8];
-cx q[5],q[8];
-rz(4.419901217243866) q[8];
-cx q[5],q[8];
-cx q[5],q[11];
-cx q[8],q[83];
-rz(4.419901217243866) q[9];
-cx q[1],q[9];
-cx q[1],q[17];
-cx q[3],q[9];
-rz(4.419901217243866) q[9];
-cx q[3],q[9];
-cx q[3],q[12];
-rz(4.419901217243866) q[10];
-cx q[4],q[10];
-cx q[6],q[10];
-rz(4.419901217243866) q[10];
-cx q[6],q[10];
-cx q[10],q[37];
-rz(4.419901217243866) q[11];
-cx q[5],q[11];
-cx q[6],q[11];
-rz(4.419901217243866) q[11];
-cx q[6],q[11];
-rx(8.351015112235597) q[11];
-rz(4.419901217243866) q[12];
-cx q[3],q[12];
-cx q[3],q[14];
-cx q[5],q[12];
-rz(4.419901217243866) q[12];
-cx q[5],q[12];
-cx q[13],q[135];
-rz(4.419901217243866) q[14];
-cx q[3],q[14];
-rz(4.419901217243866) q[15];
-cx q[0],q[15];
-cx q[0],q[16];
-cx q[3],q[15];
-rz(4.419901217243866) q[15];
-cx q[3],q[15];
-rz(4.419901217243866) q[16];
-cx q[0],q[16];
-cx q[0],q[20];
-cx q[3],q[16];
-rz(4.419901217243866) q[16];
-cx q[3],q[16];
-rz(4.419901217243866) q[17];
-cx q[1],q[17];
-cx q[1],q[28];
-cx q[3],q[17];
-rz(4.419901217243866) q[17];
-cx q[3],q[17];
-cx q[3],q[18];
-rz(4.419901217243866) q[18];
-cx q[3],q[18];
-cx q[3],q[19];
-rz(4.419901217243866) q[19];
-cx q[3],q[19];
-cx q[3],q[22];
-cx q[7],q[19];
-rz(4.419901217243866) q[19];
-cx q[7],q[19];
-cx q[19],q[38];
-rz(4.419901217243866) q[20];
-cx q[0],q[20];
-cx q[0],q[32];
-cx q[15],q[20];
-rz(4.419901217243866) q[20];
-cx q[15],q[20];
-rz(4.419901217243866) q[22];
-cx q[3],q[22];
-cx q[3],q[23];
-cx q[9],q[22];
-rz(4.419901217243866) q[22];
-cx q[9],q[22];
-cx q[9],q[55];
-rx(8.351015112235597) q[22];
-rz(4.419901217243866) q[23];
-cx q[3],q[23];
-cx q[3],q[24];
-cx q[17],q[23];
-rz(4.419901217243866) q[23];
-cx q[17],q[23];
-rz(4.419901217243866) q[24];
-cx q[3],q[24];
-cx q[3],q[25];
-rz(4.419901217243866) q[25];
-cx q[3],q[25];
-cx q[3],q[26];
-cx q[12],q[25];
-rz(4.419901217243866) q[25];
-cx q[12],q[25];
-cx q[12],q[31];
-rz(4.419901217243866) q[26];
-cx q[3],q[26];
-rz(4.419901217243866) q[28];
-cx q[1],q[28];
-cx q[1],q[29];
-cx q[3],q[28];
-rz(4.419901217243866) q[28];
-cx q[3],q[28];
-rz(4.419901217243866) q[29];
-cx q[1],q[29];
-cx q[1],q[45];
-cx q[3],q[29];
-rz(4.419901217243866) q[29];
-cx q[3],q[29];
-cx q[3],q[30];
-rx(8.351015112235597) q[29];
-rz(4.419901217243866) q[30];
-cx q[3],q[30];
-cx q[3],q[34];
-rz(4.419901217243866) q[31];
-cx q[12],q[31];
-rz(4.419901217243866) q[32];
-cx q[0],q[32];
-cx q[0],q[42];
-rz(4.419901217243866) q[34];
-cx q[3],q[34];
-cx q[3],q[35];
-cx q[12],q[34];
-rz(4.419901217243866) q[34];
-cx q[12],q[34];
-rz(4.419901217243866) q[35];
-cx q[3],q[35];
-cx q[3],q[39];
-rz(4.419901217243866) q[37];
-cx q[10],q[37];
-cx q[10],q[41];
-cx q[34],q[37];
-rz(4.419901217243866) q[37];
-cx q[34],q[37];
-rx(8.351015112235597) q[34];
-cx q[37],q[85];
-rz(4.419901217243866) q[38];
-cx q[19],q[38];
-rx(8.351015112235597) q[19];
-rz(4.419901217243866) q[39];
-cx q[3],q[39];
-cx q[3],q[40];
-rz(4.419901217243866) q[40];
-cx q[3],q[40];
-cx q[23],q[40];
-rz(4.419901217243866) q[40];
-cx q[23],q[40];
-cx q[40],q[119];
-rz(4.419901217243866) q[41];
-cx q[10],q[41];
-rz(4.419901217243866) q[42];
-cx q[0],q[42];
-cx q[0],q[48];
-cx q[3],q[42];
-rz(4.419901217243866) q[42];
-cx q[3],q[42];
-cx q[3],q[43];
-cx q[42],q[78];
-rz(4.419901217243866) q[43];
-cx q[3],q[43];
-cx q[3],q[44];
-rz(4.419901217243866) q[44];
-cx q[3],q[44];
-cx q[3],q[49];
-cx q[12],q[44];
-rz(4.419901217243866) q[44];
-cx q[12],q[44];
-rz(4.419901217243866) q[45];
-cx q[1],q[45];
-cx q[1],q[57];
-cx q[16],q[45];
-rz(4.419901217243866) q[45];
-cx q[16],q[45];
-cx q[16],q[59];
-rz(4.419901217243866) q[48];
-cx q[0],q[48];
-cx q[0],q[51];
-rz(4.419901217243866) q[49];
-cx q[3],q[49];
-cx q[3],q[50];
-rz(4.419901217243866) q[50];
-cx q[3],q[50];
-cx q[3],q[52];
-cx q[12],q[50];
-rz(4.419901217243866) q[50];
-cx q[12],q[50];
-cx q[12],q[63];
-rz(4.419901217243866) q[51];
-cx q[0],q[51];
-cx q[0],q[62];
-cx q[28],q[51];
-rz(4.419901217243866) q[51];
-cx q[28],q[51];
-rx(8.351015112235597) q[51];
-rz(4.419901217243866) q[52];
-cx q[3],q[52];
-cx q[10],q[52];
-rz(4.419901217243866) q[52];
-cx q[10],q[52];
-rz(4.419901217243866) q[55];
-cx q[9],q[55];
-cx q[9],q[80];
-rz(4.419901217243866) q[57];
-cx q[1],q[57];
-cx q[1],q[60];
-cx q[3],q[57];
-rz(4.419901217243866) q[57];
-cx q[3],q[57];
-cx q[3],q[70];
-rz(4.419901217243866) q[59];
-cx q[16],q[59];
-cx q[16],q[73];
-rz(4.419901217243866) q[60];
-cx q[1],q[60];
-cx q[1],q[97];
-cx q[7],q[60];
-rz(4.419901217243866) q[60];
-cx q[7],q[60];
-rz(4.419901217243866) q[62];
-cx q[0],q[62];
-cx q[0],q[64];
-rz(4.419901217243866) q[63];
-cx q[12],q[63];
-rz(4.419901217243866) q[64];
-cx q[0],q[64];
-cx q[0],q[75];
-cx q[10],q[64];
-rz(4.419901217243866) q[64];
-cx q[10],q[64];
-cx q[10],q[98];
-rx(8.351015112235597) q[64];
-rz(4.419901217243866) q[70];
-cx q[3],q[70];
-cx q[3],q[71];
-rz(4.419901217243866) q[71];
-cx q[3],q[71];
-cx q[3],q[77];
-rz(4.419901217243866) q[73];
-cx q[16],q[73];
-cx q[16],q[101];
-rz(4.419901217243866) q[75];
-cx q[0],q[75];
-cx q[0],q[82];
-rz(4.419901217243866) q[77];
-cx q[3],q[77];
-cx q[3],q[88];
-rz(4.419901217243866) q[78];
-cx q[42],q[78];
-cx q[60],q[78];
-rz(4.419901217243866) q[78];
-cx q[60],q[78];
-rx(8.351015112235597) q[78];
-rz(4.419901217243866) q[80];
-cx q[9],q[80];
-rx(8.351015112235597) q[9];
-rz(4.419901217243866) q[82];
-cx q[0],q[82];
-cx q[0],q[91];
-rz(4.419901217243866) q[83];
-cx q[8],q[83];
-rx(8.351015112235597) q[8];
-rz(4.419901217243866) q[85];
-cx q[37],q[85];
-rz(4.419901217243866) q[88];
-cx q[3],q[88];
-cx q[3],q[100];
-cx q[60],q[88];
-rz(4.419901217243866) q[88];
-cx q[60],q[88];
-rx(8.351015112235597) q[60];
-rx(8.351015112235597) q[88];
-rz(4.419901217243866) q[89];
-cx q[2],q[89];
-rx(8.351015112235597) q[2];
-rz(4.419901217243866) q[91];
-cx q[0],q[91];
-cx q[0],q[93];
-rz(4.419901217243866) q[93];
-cx q[0],q[93];
-cx q[0],q[123];
-rz(4.419901217243866) q[97];
-cx q[1],q[97];
-cx q[1],q[113];
-rz(4.419901217243866) q[98];
-cx q[10],q[98];
-rx(8.351015112235597) q[10];
-rz(4.419901217243866) q[100];
-cx q[3],q[100];
-cx q[3],q[102];
-cx q[25],q[100];
-rz(4.419901217243866) q[100];
-cx q[25],q[100];
-rx(8.351015112235597) q[25];
-rx(8.351015112235597) q[100];
-rz(4.419901217243866) q[101];
-cx q[16],q[101];
-cx q[16],q[103];
-rz(4.419901217243866) q[102];
-cx q[3],q[102];
-cx q[3],q[107];
-rz(4.419901217243866) q[103];
-cx q[16],q[103];
-rx(8.351015112235597) q[16];
-cx q[57],q[103];
-rz(4.419901217243866) q[103];
-cx q[57],q[103];
-rx(8.351015112235597) q[57];
-rx(8.351015112235597) q[103];
-rz(4.419901217243866) q[107];
-cx q[3],q[107];
-cx q[3],q[110];
-rz(4.419901217243866) q[110];
-cx q[3],q[110];
-cx q[3],q[111];
-rz(4.419901217243866) q[111];
-cx q[3],q[111];
-rz(4.419901217243866) q[113];
-cx q[1],q[113];
-rx(8.351015112235597) q[1];
-cx q[3],q[113];
-rz(4.419901217243866) q[113];
-cx q[3],q[113];
-cx q[3],q[125];
-rx(8.351015112235597) q[113];
-rz(4.419901217243866) q[119];
-cx q[40],q[119];
-rx(8.351015112235597) q[40];
-rz(4.419901217243866) q[123];
-cx q[0],q[123];
-cx q[0],q[126];
-cx q[52],q[123];
-rz(4.419901217243866) q[123];
-cx q[52],q[123];
-rx(8.351015112235597) q[52];
-rz(4.419901217243866) q[125];
-cx q[3],q[125];
-cx q[3],q[132];
-rz(4.419901217243866) q[126];
-cx q[0],q[126];
-cx q[12],q[126];
-rz(4.419901217243866) q[126];
-cx q[12],q[126];
-rx(8.351015112235597) q[12];
-rx(8.351015112235597) q[126];
-rz(4.419901217243866) q[132];
-cx q[3],q[132];
-cx q[3],q[134];
-cx q[37],q[132];
-rz(4.419901217243866) q[132];
-cx q[37],q[132];
-rx(8.351015112235597) q[37];
-rx(8.351015112235597) q[132];
-rz(4.419901217243866) q[134];
-cx q[3],q[134];
-rx(8.351015112235597) q[3];
-rz(5.058885002185787) q[135];
-cx q[13],q[135];
-rx(5.936674243179436) q[13];
-cx q[4],q[13];
-rz(4.419901217243866) q[13];
-cx q[4],q[13];
-cx q[4],q[14];
-cx q[5],q[13];
-rz(4.419901217243866) q[13];
-cx q[5],q[13];
-cx q[5],q[24];
-cx q[13],q[39];
-rz(4.419901217243866) q[14];
-cx q[4],q[14];
-cx q[4],q[18];
-rx(8.351015112235597) q[14];
-rz(4.419901217243866) q[18];
-cx q[4],q[18];
-cx q[4],q[21];
-cx q[18],q[30];
-rz(4.419901217243866) q[21];
-cx q[4],q[21];
-cx q[4],q[27];
-cx q[15],q[21];
-rz(4.419901217243866) q[21];
-cx q[15],q[21];
-cx q[15],q[36];
-cx q[21],q[26];
-rz(4.419901217243866) q[24];
-cx q[5],q[24];
-cx q[5],q[33];
-cx q[24],q[54];
-rz(4.419901217243866) q[26];
-cx q[21],q[26];
-cx q[21],q[32];
-cx q[26],q[31];
-rz(4.419901217243866) q[27];
-cx q[4],q[27];
-cx q[4],q[47];
-cx q[6],q[27];
-rz(4.419901217243866) q[27];
-cx q[6],q[27];
-cx q[6],q[69];
-cx q[27],q[41];
-rz(4.419901217243866) q[30];
-cx q[18],q[30];
-rx(8.351015112235597) q[18];
-rz(4.419901217243866) q[31];
-cx q[26],q[31];
-cx q[26],q[105];
-cx q[31],q[107];
-rz(4.419901217243866) q[32];
-cx q[21],q[32];
-cx q[21],q[38];
-cx q[32],q[35];
-rz(4.419901217243866) q[33];
-cx q[5],q[33];
-cx q[5],q[46];
-cx q[30],q[33];
-rz(4.419901217243866) q[33];
-cx q[30],q[33];
-cx q[30],q[48];
-rx(8.351015112235597) q[33];
-rz(4.419901217243866) q[35];
-cx q[32],q[35];
-cx q[32],q[59];
-cx q[35],q[130];
-rz(4.419901217243866) q[36];
-cx q[15],q[36];
-cx q[15],q[55];
-cx q[20],q[36];
-rz(4.419901217243866) q[36];
-cx q[20],q[36];
-cx q[20],q[43];
-cx q[36],q[94];
-rz(4.419901217243866) q[38];
-cx q[21],q[38];
-rz(4.419901217243866) q[39];
-cx q[13],q[39];
-cx q[13],q[56];
-rz(4.419901217243866) q[41];
-cx q[27],q[41];
-cx q[27],q[72];
-cx q[41],q[67];
-rz(4.419901217243866) q[43];
-cx q[20],q[43];
-cx q[20],q[121];
-rx(8.351015112235597) q[43];
-rz(4.419901217243866) q[46];
-cx q[5],q[46];
-cx q[5],q[65];
-cx q[38],q[46];
-rz(4.419901217243866) q[46];
-cx q[38],q[46];
-rx(8.351015112235597) q[38];
-cx q[46],q[120];
-rz(4.419901217243866) q[47];
-cx q[4],q[47];
-cx q[4],q[49];
-cx q[17],q[47];
-rz(4.419901217243866) q[47];
-cx q[17],q[47];
-cx q[17],q[53];
-rz(4.419901217243866) q[48];
-cx q[30],q[48];
-cx q[30],q[77];
-rx(8.351015112235597) q[48];
-rz(4.419901217243866) q[49];
-cx q[4],q[49];
-cx q[4],q[61];
-rx(8.351015112235597) q[49];
-rz(4.419901217243866) q[53];
-cx q[17],q[53];
-cx q[17],q[62];
-cx q[21],q[53];
-rz(4.419901217243866) q[53];
-cx q[21],q[53];
-cx q[21],q[75];
-cx q[53],q[71];
-rz(4.419901217243866) q[54];
-cx q[24],q[54];
-cx q[24],q[58];
-cx q[28],q[54];
-rz(4.419901217243866) q[54];
-cx q[28],q[54];
-rx(8.351015112235597) q[54];
-rz(4.419901217243866) q[55];
-cx q[15],q[55];
-cx q[15],q[70];
-rz(4.419901217243866) q[56];
-cx q[13],q[56];
-cx q[13],q[68];
-cx q[45],q[56];
-rz(4.419901217243866) q[56];
-cx q[45],q[56];
-rx(8.351015112235597) q[45];
-rz(4.419901217243866) q[58];
-cx q[24],q[58];
-cx q[24],q[86];
-cx q[28],q[58];
-rz(4.419901217243866) q[58];
-cx q[28],q[58];
-cx q[28],q[87];
-rx(8.351015112235597) q[58];
-rz(4.419901217243866) q[59];
-cx q[32],q[59];
-rz(4.419901217243866) q[61];
-cx q[4],q[61];
-cx q[4],q[99];
-cx q[7],q[61];
-rz(4.419901217243866) q[61];
-cx q[7],q[61];
-cx q[7],q[97];
-rx(8.351015112235597) q[61];
-rz(4.419901217243866) q[62];
-cx q[17],q[62];
-cx q[17],q[63];
-rz(4.419901217243866) q[63];
-cx q[17],q[63];
-cx q[17],q[66];
-rz(4.419901217243866) q[65];
-cx q[5],q[65];
-cx q[5],q[76];
-cx q[23],q[65];
-rz(4.419901217243866) q[65];
-cx q[23],q[65];
-rx(8.351015112235597) q[23];
-rx(8.351015112235597) q[65];
-rz(4.419901217243866) q[66];
-cx q[17],q[66];
-rx(8.351015112235597) q[17];
-cx q[47],q[66];
-rz(4.419901217243866) q[66];
-cx q[47],q[66];
-cx q[47],q[134];
-rx(8.351015112235597) q[66];
-rz(4.419901217243866) q[67];
-cx q[41],q[67];
-cx q[56],q[67];
-rz(4.419901217243866) q[67];
-cx q[56],q[67];
-cx q[56],q[74];
-rx(8.351015112235597) q[67];
-rz(4.419901217243866) q[68];
-cx q[13],q[68];
-cx q[32],q[68];
-rz(4.419901217243866) q[68];
-cx q[32],q[68];
-cx q[68],q[83];
-rz(4.419901217243866) q[69];
-cx q[6],q[69];
-cx q[59],q[69];
-rz(4.419901217243866) q[69];
-cx q[59],q[69];
-cx q[59],q[73];
-cx q[69],q[119];
-rz(4.419901217243866) q[70];
-cx q[15],q[70];
-cx q[15],q[80];
-cx q[70],q[84];
-rz(4.419901217243866) q[71];
-cx q[53],q[71];
-rx(8.351015112235597) q[71];
-rz(4.419901217243866) q[72];
-cx q[27],q[72];
-cx q[44],q[72];
-rz(4.419901217243866) q[72];
-cx q[44],q[72];
-rx(8.351015112235597) q[44];
-rx(8.351015112235597) q[72];
-rz(4.419901217243866) q[73];
-cx q[59],q[73];
-cx q[59],q[85];
-rz(4.419901217243866) q[74];
-cx q[56],q[74];
-cx q[56],q[82];
-cx q[63],q[74];
-rz(4.419901217243866) q[74];
-cx q[63],q[74];
-cx q[63],q[122];
-rx(8.351015112235597) q[74];
-rz(4.419901217243866) q[75];
-cx q[21],q[75];
-cx q[21],q[81];
-rx(8.351015112235597) q[75];
-rz(4.419901217243866) q[76];
-cx q[5],q[76];
-cx q[5],q[89];
-cx q[6],q[76];
-rz(4.419901217243866) q[76];
-cx q[6],q[76];
-cx q[6],q[79];
-rx(8.351015112235597) q[76];
-rz(4.419901217243866) q[77];
-cx q[30],q[77];
-rx(8.351015112235597) q[30];
-rz(4.419901217243866) q[79];
-cx q[6],q[79];
-cx q[6],q[91];
-cx q[50],q[79];
-rz(4.419901217243866) q[79];
-cx q[50],q[79];
-cx q[50],q[101];
-rx(8.351015112235597) q[79];
-rz(4.419901217243866) q[80];
-cx q[15],q[80];
-cx q[15],q[90];
-rx(8.351015112235597) q[80];
-rz(4.419901217243866) q[81];
-cx q[21],q[81];
-cx q[21],q[98];
-cx q[77],q[81];
-rz(4.419901217243866) q[81];
-cx q[77],q[81];
-rx(8.351015112235597) q[77];
-rz(4.419901217243866) q[82];
-cx q[56],q[82];
-cx q[56],q[96];
-rx(8.351015112235597) q[82];
-rz(4.419901217243866) q[83];
-cx q[68],q[83];
-rx(8.351015112235597) q[68];
-rx(8.351015112235597) q[83];
-rz(4.419901217243866) q[84];
-cx q[70],q[84];
-rx(8.351015112235597) q[70];
-cx q[73],q[84];
-rz(4.419901217243866) q[84];
-cx q[73],q[84];
-rx(8.351015112235597) q[73];
-rx(8.351015112235597) q[84];
-rz(4.419901217243866) q[85];
-cx q[59],q[85];
-rx(8.351015112235597) q[59];
-rx(8.351015112235597) q[85];
-rz(4.419901217243866) q[86];
-cx q[24],q[86];
-cx q[24],q[110];
-cx q[53],q[86];
-rz(4.419901217243866) q[86];
-cx q[53],q[86];
-cx q[53],q[124];
-rx(8.351015112235597) q[86];
-rz(4.419901217243866) q[87];
-cx q[28],q[87];
-cx q[32],q[87];
-rz(4.419901217243866) q[87];
-cx q[32],q[87];
-cx q[32],q[93];
-rx(8.351015112235597) q[87];
-rz(4.419901217243866) q[89];
-cx q[5],q[89];
-cx q[5],q[95];
-rz(4.419901217243866) q[90];
-cx q[15],q[90];
-cx q[15],q[92];
-cx q[27],q[90];
-rz(4.419901217243866) q[90];
-cx q[27],q[90];
-rx(8.351015112235597) q[90];
-rz(4.419901217243866) q[91];
-cx q[6],q[91];
-rx(8.351015112235597) q[6];
-rz(4.419901217243866) q[92];
-cx q[15],q[92];
-cx q[15],q[108];
-cx q[89],q[92];
-rz(4.419901217243866) q[92];
-cx q[89],q[92];
-rz(4.419901217243866) q[93];
-cx q[32],q[93];
-rx(8.351015112235597) q[93];
-rz(4.419901217243866) q[94];
-cx q[36],q[94];
-cx q[55],q[94];
-rz(4.419901217243866) q[94];
-cx q[55],q[94];
-rx(8.351015112235597) q[55];
-rz(4.419901217243866) q[95];
-cx q[5],q[95];
-cx q[5],q[106];
-cx q[27],q[95];
-rz(4.419901217243866) q[95];
-cx q[27],q[95];
-rx(8.351015112235597) q[27];
-rx(8.351015112235597) q[95];
-rz(4.419901217243866) q[96];
-cx q[56],q[96];
-rx(8.351015112235597) q[56];
-cx q[92],q[96];
-rz(4.419901217243866) q[96];
-cx q[92],q[96];
-rx(8.351015112235597) q[96];
-rz(4.419901217243866) q[97];
-cx q[7],q[97];
-cx q[7],q[104];
-rx(8.351015112235597) q[97];
-rz(4.419901217243866) q[98];
-cx q[21],q[98];
-cx q[21],q[111];
-rx(8.351015112235597) q[98];
-rz(4.419901217243866) q[99];
-cx q[4],q[99];
-cx q[4],q[102];
-cx q[41],q[99];
-rz(4.419901217243866) q[99];
-cx q[41],q[99];
-rx(8.351015112235597) q[41];
-rx(8.351015112235597) q[99];
-rz(4.419901217243866) q[101];
-cx q[50],q[101];
-cx q[50],q[129];
-rx(8.351015112235597) q[101];
-rz(4.419901217243866) q[102];
-cx q[4],q[102];
-cx q[4],q[127];
-rx(8.351015112235597) q[102];
-rz(4.419901217243866) q[104];
-cx q[7],q[104];
-cx q[7],q[133];
-cx q[13],q[104];
-rz(4.419901217243866) q[104];
-cx q[13],q[104];
-cx q[104],q[114];
-rz(4.419901217243866) q[105];
-cx q[26],q[105];
-cx q[26],q[117];
-cx q[28],q[105];
-rz(4.419901217243866) q[105];
-cx q[28],q[105];
-cx q[28],q[116];
-rx(8.351015112235597) q[105];
-rz(4.419901217243866) q[106];
-cx q[5],q[106];
-cx q[5],q[109];
-cx q[36],q[106];
-rz(4.419901217243866) q[106];
-cx q[36],q[106];
-rx(8.351015112235597) q[106];
-rz(4.419901217243866) q[107];
-cx q[31],q[107];
-rx(8.351015112235597) q[107];
-rz(4.419901217243866) q[108];
-cx q[15],q[108];
-cx q[15],q[115];
-cx q[31],q[108];
-rz(4.419901217243866) q[108];
-cx q[31],q[108];
-rx(8.351015112235597) q[31];
-rx(8.351015112235597) q[108];
-rz(4.419901217243866) q[109];
-cx q[5],q[109];
-cx q[5],q[118];
-cx q[39],q[109];
-rz(4.419901217243866) q[109];
-cx q[39],q[109];
-rx(8.351015112235597) q[39];
-cx q[109],q[125];
-rz(4.419901217243866) q[110];
-cx q[24],q[110];
-rx(8.351015112235597) q[24];
-rz(4.419901217243866) q[111];
-cx q[21],q[111];
-cx q[21],q[112];
-rx(8.351015112235597) q[111];
-rz(4.419901217243866) q[112];
-cx q[21],q[112];
-rx(8.351015112235597) q[21];
-cx q[36],q[112];
-rz(4.419901217243866) q[112];
-cx q[36],q[112];
-rx(8.351015112235597) q[36];
-rx(8.351015112235597) q[112];
-rz(4.419901217243866) q[114];
-cx q[104],q[114];
-cx q[110],q[114];
-rz(4.419901217243866) q[114];
-cx q[110],q[114];
-rx(8.351015112235597) q[110];
-rx(8.351015112235597) q[114];
-rz(4.419901217243866) q[115];
-cx q[15],q[115];
-cx q[92],q[115];
-rz(4.419901217243866) q[115];
-cx q[92],q[115];
-rx(8.351015112235597) q[92];
-rx(8.351015112235597) q[115];
-rz(4.419901217243866) q[116];
-cx q[28],q[116];
-rx(8.351015112235597) q[28];
-cx q[42],q[116];
-rz(4.419901217243866) q[116];
-cx q[42],q[116];
-rx(8.351015112235597) q[42];
-rx(8.351015112235597) q[116];
-rz(4.419901217243866) q[117];
-cx q[26],q[117];
-rx(8.351015112235597) q[26];
-cx q[32],q[117];
-rz(4.419901217243866) q[117];
-cx q[32],q[117];
-cx q[32],q[131];
-rx(8.351015112235597) q[117];
-rz(4.419901217243866) q[118];
-cx q[5],q[118];
-rx(8.351015112235597) q[5];
-cx q[15],q[118];
-rz(4.419901217243866) q[118];
-cx q[15],q[118];
-rx(8.351015112235597) q[15];
-rx(8.351015112235597) q[118];
-rz(4.419901217243866) q[119];
-cx q[69],q[119];
-rx(8.351015112235597) q[69];
-rx(8.351015112235597) q[119];
-rz(4.419901217243866) q[120];
-cx q[46],q[120];
-rx(8.351015112235597) q[46];
-cx q[94],q[120];
-rz(4.419901217243866) q[120];
-cx q[94],q[120];
-rx(8.351015112235597) q[94];
-rx(8.351015112235597) q[120];
-rz(4.419901217243866) q[121];
-cx q[20],q[121];
-rx(8.351015112235597) q[20];
-cx q[104],q[121];
-rz(4.419901217243866) q[121];
-cx q[104],q[121];
-rx(8.351015112235597) q[104];
-rx(8.351015112235597) q[121];
-rz(4.419901217243866) q[122];
-cx q[63],q[122];
-rx(8.351015112235597) q[63];
-cx q[81],q[122];
-rz(4.419901217243866) q[122];
-cx q[81],q[122];
-rx(8.351015112235597) q[122];
-rz(4.419901217243866) q[124];
-cx q[53],q[124];
-rx(8.351015112235597) q[53];
-cx q[81],q[124];
-rz(4.419901217243866) q[124];
-cx q[81],q[124];
-rx(8.351015112235597) q[81];
-rx(8.351015112235597) q[124];
-rz(4.419901217243866) q[125];
-cx q[109],q[125];
-rx(8.351015112235597) q[125];
-rz(4.419901217243866) q[127];
-cx q[4],q[127];
-rx(8.351015112235597) q[4];
-cx q[62],q[127];
-rz(4.419901217243866) q[127];
-cx q[62],q[127];
-cx q[62],q[128];
-rx(8.351015112235597) q[127];
-rz(4.419901217243866) q[128];
-cx q[62],q[128];
-rx(8.351015112235597) q[62];
-cx q[109],q[128];
-rz(4.419901217243866) q[128];
-cx q[109],q[128];
-rx(8.351015112235597) q[128];
-rz(4.419901217243866) q[129];
-cx q[50],q[129];
-rx(8.351015112235597) q[50];
-cx q[91],q[129];
-rz(4.419901217243866) q[129];
-cx q[91],q[129];
-rx(8.351015112235597) q[91];
-rx(8.351015112235597) q[129];
-rz(4.419901217243866) q[130];
-cx q[35],q[130];
-rx(8.351015112235597) q[35];
-cx q[109],q[130];
-rz(4.419901217243866) q[130];
-cx q[109],q[130];
-rx(8.351015112235597) q[109];
-rx(8.351015112235597) q[130];
-rz(4.419901217243866) q[131];
-cx q[32],q[131];
-rx(8.351015112235597) q[32];
-cx q[123],q[131];
-rz(4.419901217243866) q[131];
-cx q[123],q[131];
-rx(8.351015112235597) q[123];
-rx(8.351015112235597) q[131];
-rz(4.419901217243866) q[133];
-cx q[7],q[133];
-rx(8.351015112235597) q[7];
-cx q[89],q[133];
-rz(4.419901217243866) q[133];
-cx q[89],q[133];
-rx(8.351015112235597) q[89];
-rx(8.351015112235597) q[133];
-rz(4.419901217243866) q[134];
-cx q[47],q[134];
-rx(8.351015112235597) q[47];
-rx(8.351015112235597) q[134];
-rx(5.936674243179436) q[135];
-cx q[0],q[135];
-rz(4.419901217243866) q[135];
-cx q[0],q[135];
-rx(8.351015112235597) q[0];
-cx q[0],q[1];
-rz(6.01139199704797) q[1];
-cx q[0],q[1];
-cx q[0],q[2];
-rz(6.01139199704797) q[2];
-cx q[0],q[2];
-cx q[0],q[3];
-cx q[2],q[89];
-rz(6.01139199704797) q[3];
-cx q[0],q[3];
-cx q[0],q[15];
-cx q[1],q[3];
-rz(6.01139199704797) q[3];
-cx q[1],q[3];
-cx q[1],q[4];
-rz(6.01139199704797) q[4];
-cx q[1],q[4];
-cx q[1],q[5];
-cx q[3],q[4];
-rz(6.01139199704797) q[4];
-cx q[3],q[4];
-cx q[4],q[6];
-rz(6.01139199704797) q[5];
-cx q[1],q[5];
-cx q[1],q[9];
-cx q[3],q[5];
-rz(6.01139199704797) q[5];
-cx q[3],q[5];
-cx q[3],q[7];
-rz(6.01139199704797) q[6];
-cx q[4],q[6];
-cx q[5],q[6];
-rz(6.01139199704797) q[6];
-cx q[5],q[6];
-rz(6.01139199704797) q[7];
-cx q[3],q[7];
-cx q[3],q[8];
-cx q[4],q[7];
-rz(6.01139199704797) q[7];
-cx q[4],q[7];
-cx q[4],q[10];
-rz(6.01139199704797) q[8];
-cx q[3],q[8];
-cx q[5],q[8];
-rz(6.01139199704797) q[8];
-cx q[5],q[8];
-cx q[5],q[11];
-cx q[8],q[83];
-rz(6.01139199704797) q[9];
-cx q[1],q[9];
-cx q[1],q[17];
-cx q[3],q[9];
-rz(6.01139199704797) q[9];
-cx q[3],q[9];
-cx q[3],q[12];
-rz(6.01139199704797) q[10];
-cx q[4],q[10];
-cx q[6],q[10];
-rz(6.01139199704797) q[10];
-cx q[6],q[10];
-cx q[10],q[37];
-rz(6.01139199704797) q[11];
-cx q[5],q[11];
-cx q[6],q[11];
-rz(6.01139199704797) q[11];
-cx q[6],q[11];
-rx(1.8195494462708042) q[11];
-rz(6.01139199704797) q[12];
-cx q[3],q[12];
-cx q[3],q[14];
-cx q[5],q[12];
-rz(6.01139199704797) q[12];
-cx q[5],q[12];
-cx q[13],q[135];
-rz(6.01139199704797) q[14];
-cx q[3],q[14];
-rz(6.01139199704797) q[15];
-cx q[0],q[15];
-cx q[0],q[16];
-cx q[3],q[15];
-rz(6.01139199704797) q[15];
-cx q[3],q[15];
-rz(6.01139199704797) q[16];
-cx q[0],q[16];
-cx q[0],q[20];
-cx q[3],q[16];
-rz(6.01139199704797) q[16];
-cx q[3],q[16];
-rz(6.01139199704797) q[17];
-cx q[1],q[17];
-cx q[1],q[28];
-cx q[3],q[17];
-rz(6.01139199704797) q[17];
-cx q[3],q[17];
-cx q[3],q[18];
-rz(6.01139199704797) q[18];
-cx q[3],q[18];
-cx q[3],q[19];
-rz(6.01139199704797) q[19];
-cx q[3],q[19];
-cx q[3],q[22];
-cx q[7],q[19];
-rz(6.01139199704797) q[19];
-cx q[7],q[19];
-cx q[19],q[38];
-rz(6.01139199704797) q[20];
-cx q[0],q[20];
-cx q[0],q[32];
-cx q[15],q[20];
-rz(6.01139199704797) q[20];
-cx q[15],q[20];
-rz(6.01139199704797) q[22];
-cx q[3],q[22];
-cx q[3],q[23];
-cx q[9],q[22];
-rz(6.01139199704797) q[22];
-cx q[9],q[22];
-cx q[9],q[55];
-rx(1.8195494462708042) q[22];
-rz(6.01139199704797) q[23];
-cx q[3],q[23];
-cx q[3],q[24];
-cx q[17],q[23];
-rz(6.01139199704797) q[23];
-cx q[17],q[23];
-rz(6.01139199704797) q[24];
-cx q[3],q[24];
-cx q[3],q[25];
-rz(6.01139199704797) q[25];
-cx q[3],q[25];
-cx q[3],q[26];
-cx q[12],q[25];
-rz(6.01139199704797) q[25];
-cx q[12],q[25];
-cx q[12],q[31];
-rz(6.01139199704797) q[26];
-cx q[3],q[26];
-rz(6.01139199704797) q[28];
-cx q[1],q[28];
-cx q[1],q[29];
-cx q[3],q[28];
-rz(6.01139199704797) q[28];
-cx q[3],q[28];
-rz(6.01139199704797) q[29];
-cx q[1],q[29];
-cx q[1],q[45];
-cx q[3],q[29];
-rz(6.01139199704797) q[29];
-cx q[3],q[29];
-cx q[3],q[30];
-rx(1.8195494462708042) q[29];
-rz(6.01139199704797) q[30];
-cx q[3],q[30];
-cx q[3],q[34];
-rz(6.01139199704797) q[31];
-cx q[12],q[31];
-rz(6.01139199704797) q[32];
-cx q[0],q[32];
-cx q[0],q[42];
-rz(6.01139199704797) q[34];
-cx q[3],q[34];
-cx q[3],q[35];
-cx q[12],q[34];
-rz(6.01139199704797) q[34];
-cx q[12],q[34];
-rz(6.01139199704797) q[35];
-cx q[3],q[35];
-cx q[3],q[39];
-rz(6.01139199704797) q[37];
-cx q[10],q[37];
-cx q[10],q[41];
-cx q[34],q[37];
-rz(6.01139199704797) q[37];
-cx q[34],q[37];
-rx(1.8195494462708042) q[34];
-cx q[37],q[85];
-rz(6.01139199704797) q[38];
-cx q[19],q[38];
-rx(1.8195494462708042) q[19];
-rz(6.01139199704797) q[39];
-cx q[3],q[39];
-cx q[3],q[40];
-rz(6.01139199704797) q[40];
-cx q[3],q[40];
-cx q[23],q[40];
-rz(6.01139199704797) q[40];
-cx q[23],q[40];
-cx q[40],q[119];
-rz(6.01139199704797) q[41];
-cx q[10],q[41];
-rz(6.01139199704797) q[42];
-cx q[0],q[42];
-cx q[0],q[48];
-cx q[3],q[42];
-rz(6.01139199704797) q[42];
-cx q[3],q[42];
-cx q[3],q[43];
-cx q[42],q[78];
-rz(6.01139199704797) q[43];
-cx q[3],q[43];
-cx q[3],q[44];
-rz(6.01139199704797) q[44];
-cx q[3],q[44];
-cx q[3],q[49];
-cx q[12],q[44];
-rz(6.01139199704797) q[44];
-cx q[12],q[44];
-rz(6.01139199704797) q[45];
-cx q[1],q[45];
-cx q[1],q[57];
-cx q[16],q[45];
-rz(6.01139199704797) q[45];
-cx q[16],q[45];
-cx q[16],q[59];
-rz(6.01139199704797) q[48];
-cx q[0],q[48];
-cx q[0],q[51];
-rz(6.01139199704797) q[49];
-cx q[3],q[49];
-cx q[3],q[50];
-rz(6.01139199704797) q[50];
-cx q[3],q[50];
-cx q[3],q[52];
-cx q[12],q[50];
-rz(6.01139199704797) q[50];
-cx q[12],q[50];
-cx q[12],q[63];
-rz(6.01139199704797) q[51];
-cx q[0],q[51];
-cx q[0],q[62];
-cx q[28],q[51];
-rz(6.01139199704797) q[51];
-cx q[28],q[51];
-rx(1.8195494462708042) q[51];
-rz(6.01139199704797) q[52];
-cx q[3],q[52];
-cx q[10],q[52];
-rz(6.01139199704797) q[52];
-cx q[10],q[52];
-rz(6.01139199704797) q[55];
-cx q[9],q[55];
-cx q[9],q[80];
-rz(6.01139199704797) q[57];
-cx q[1],q[57];
-cx q[1],q[60];
-cx q[3],q[57];
-rz(6.01139199704797) q[57];
-cx q[3],q[57];
-cx q[3],q[70];
-rz(6.01139199704797) q[59];
-cx q[16],q[59];
-cx q[16],q[73];
-rz(6.01139199704797) q[60];
-cx q[1],q[60];
-cx q[1],q[97];
-cx q[7],q[60];
-rz(6.01139199704797) q[60];
-cx q[7],q[60];
-rz(6.01139199704797) q[62];
-cx q[0],q[62];
-cx q[0],q[64];
-rz(6.01139199704797) q[63];
-cx q[12],q[63];
-rz(6.01139199704797) q[64];
-cx q[0],q[64];
-cx q[0],q[75];
-cx q[10],q[64];
-rz(6.01139199704797) q[64];
-cx q[10],q[64];
-cx q[10],q[98];
-rx(1.8195494462708042) q[64];
-rz(6.01139199704797) q[70];
-cx q[3],q[70];
-cx q[3],q[71];
-rz(6.01139199704797) q[71];
-cx q[3],q[71];
-cx q[3],q[77];
-rz(6.01139199704797) q[73];
-cx q[16],q[73];
-cx q[16],q[101];
-rz(6.01139199704797) q[75];
-cx q[0],q[75];
-cx q[0],q[82];
-rz(6.01139199704797) q[77];
-cx q[3],q[77];
-cx q[3],q[88];
-rz(6.01139199704797) q[78];
-cx q[42],q[78];
-cx q[60],q[78];
-rz(6.01139199704797) q[78];
-cx q[60],q[78];
-rx(1.8195494462708042) q[78];
-rz(6.01139199704797) q[80];
-cx q[9],q[80];
-rx(1.8195494462708042) q[9];
-rz(6.01139199704797) q[82];
-cx q[0],q[82];
-cx q[0],q[91];
-rz(6.01139199704797) q[83];
-cx q[8],q[83];
-rx(1.8195494462708042) q[8];
-rz(6.01139199704797) q[85];
-cx q[37],q[85];
-rz(6.01139199704797) q[88];
-cx q[3],q[88];
-cx q[3],q[100];
-cx q[60],q[88];
-rz(6.01139199704797) q[88];
-cx q[60],q[88];
-rx(1.8195494462708042) q[60];
-rx(1.8195494462708042) q[88];
-rz(6.01139199704797) q[89];
-cx q[2],q[89];
-rx(1.8195494462708042) q[2];
-rz(6.01139199704797) q[91];
-cx q[0],q[91];
-cx q[0],q[93];
-rz(6.01139199704797) q[93];
-cx q[0],q[93];
-cx q[0],q[123];
-rz(6.01139199704797) q[97];
-cx q[1],q[97];
-cx q[1],q[113];
-rz(6.01139199704797) q[98];
-cx q[10],q[98];
-rx(1.8195494462708042) q[10];
-rz(6.01139199704797) q[100];
-cx q[3],q[100];
-cx q[3],q[102];
-cx q[25],q[100];
-rz(6.01139199704797) q[100];
-cx q[25],q[100];
-rx(1.8195494462708042) q[25];
-rx(1.8195494462708042) q[100];
-rz(6.01139199704797) q[101];
-cx q[16],q[101];
-cx q[16],q[103];
-rz(6.01139199704797) q[102];
-cx q[3],q[102];
-cx q[3],q[107];
-rz(6.01139199704797) q[103];
-cx q[16],q[103];
-rx(1.8195494462708042) q[16];
-cx q[57],q[103];
-rz(6.01139199704797) q[103];
-cx q[57],q[103];
-rx(1.8195494462708042) q[57];
-rx(1.8195494462708042) q[103];
-rz(6.01139199704797) q[107];
-cx q[3],q[107];
-cx q[3],q[110];
-rz(6.01139199704797) q[110];
-cx q[3],q[110];
-cx q[3],q[111];
-rz(6.01139199704797) q[111];
-cx q[3],q[111];
-rz(6.01139199704797) q[113];
-cx q[1],q[113];
-rx(1.8195494462708042) q[1];
-cx q[3],q[113];
-rz(6.01139199704797) q[113];
-cx q[3],q[113];
-cx q[3],q[125];
-rx(1.8195494462708042) q[113];
-rz(6.01139199704797) q[119];
-cx q[40],q[119];
-rx(1.8195494462708042) q[40];
-rz(6.01139199704797) q[123];
-cx q[0],q[123];
-cx q[0],q[126];
-cx q[52],q[123];
-rz(6.01139199704797) q[123];
-cx q[52],q[123];
-rx(1.8195494462708042) q[52];
-rz(6.01139199704797) q[125];
-cx q[3],q[125];
-cx q[3],q[132];
-rz(6.01139199704797) q[126];
-cx q[0],q[126];
-cx q[12],q[126];
-rz(6.01139199704797) q[126];
-cx q[12],q[126];
-rx(1.8195494462708042) q[12];
-rx(1.8195494462708042) q[126];
-rz(6.01139199704797) q[132];
-cx q[3],q[132];
-cx q[3],q[134];
-cx q[37],q[132];
-rz(6.01139199704797) q[132];
-cx q[37],q[132];
-rx(1.8195494462708042) q[37];
-rx(1.8195494462708042) q[132];
-rz(6.01139199704797) q[134];
-cx q[3],q[134];
-rx(1.8195494462708042) q[3];
-rz(4.419901217243866) q[135];
-cx q[13],q[135];
-rx(8.351015112235597) q[13];
-cx q[4],q[13];
-rz(6.01139199704797) q[13];
-cx q[4],q[13];
-cx q[4],q[14];
-cx q[5],q[13];
-rz(6.01139199704797) q[13];
-cx q[5],q[13];
-cx q[5],q[24];
-cx q[13],q[39];
-rz(6.01139199704797) q[14];
-cx q[4],q[14];
-cx q[4],q[18];
-rx(1.8195494462708042) q[14];
-rz(6.01139199704797) q[18];
-cx q[4],q[18];
-cx q[4],q[21];
-cx q[18],q[30];
-rz(6.01139199704797) q[21];
-cx q[4],q[21];
-cx q[4],q[27];
-cx q[15],q[21];
-rz(6.01139199704797) q[21];
-cx q[15],q[21];
-cx q[15],q[36];
-cx q[21],q[26];
-rz(6.01139199704797) q[24];
-cx q[5],q[24];
-cx q[5],q[33];
-cx q[24],q[54];
-rz(6.01139199704797) q[26];
-cx q[21],q[26];
-cx q[21],q[32];
-cx q[26],q[31];
-rz(6.01139199704797) q[27];
-cx q[4],q[27];
-cx q[4],q[47];
-cx q[6],q[27];
-rz(6.01139199704797) q[27];
-cx q[6],q[27];
-cx q[6],q[69];
-cx q[27],q[41];
-rz(6.01139199704797) q[30];
-cx q[18],q[30];
-rx(1.8195494462708042) q[18];
-rz(6.01139199704797) q[31];
-cx q[26],q[31];
-cx q[26],q[105];
-cx q[31],q[107];
-rz(6.01139199704797) q[32];
-cx q[21],q[32];
-cx q[21],q[38];
-cx q[32],q[35];
-rz(6.01139199704797) q[33];
-cx q[5],q[33];
-cx q[5],q[46];
-cx q[30],q[33];
-rz(6.01139199704797) q[33];
-cx q[30],q[33];
-cx q[30],q[48];
-rx(1.8195494462708042) q[33];
-rz(6.01139199704797) q[35];
-cx q[32],q[35];
-cx q[32],q[59];
-cx q[35],q[130];
-rz(6.01139199704797) q[36];
-cx q[15],q[36];
-cx q[15],q[55];
-cx q[20],q[36];
-rz(6.01139199704797) q[36];
-cx q[20],q[36];
-cx q[20],q[43];
-cx q[36],q[94];
-rz(6.01139199704797) q[38];
-cx q[21],q[38];
-rz(6.01139199704797) q[39];
-cx q[13],q[39];
-cx q[13],q[56];
-rz(6.01139199704797) q[41];
-cx q[27],q[41];
-cx q[27],q[72];
-cx q[41],q[67];
-rz(6.01139199704797) q[43];
-cx q[20],q[43];
-cx q[20],q[121];
-rx(1.8195494462708042) q[43];
-rz(6.01139199704797) q[46];
-cx q[5],q[46];
-cx q[5],q[65];
-cx q[38],q[46];
-rz(6.01139199704797) q[46];
-cx q[38],q[46];
-rx(1.8195494462708042) q[38];
-cx q[46],q[120];
-rz(6.01139199704797) q[47];
-cx q[4],q[47];
-cx q[4],q[49];
-cx q[17],q[47];
-rz(6.01139199704797) q[47];
-cx q[17],q[47];
-cx q[17],q[53];
-rz(6.01139199704797) q[48];
-cx q[30],q[48];
-cx q[30],q[77];
-rx(1.8195494462708042) q[48];
-rz(6.01139199704797) q[49];
-cx q[4],q[49];
-cx q[4],q[61];
-rx(1.8195494462708042) q[49];
-rz(6.01139199704797) q[53];
-cx q[17],q[53];
-cx q[17],q[62];
-cx q[21],q[53];
-rz(6.01139199704797) q[53];
-cx q[21],q[53];
-cx q[21],q[75];
-cx q[53],q[71];
-rz(6.01139199704797) q[54];
-cx q[24],q[54];
-cx q[24],q[58];
-cx q[28],q[54];
-rz(6.01139199704797) q[54];
-cx q[28],q[54];
-rx(1.8195494462708042) q[54];
-rz(6.01139199704797) q[55];
-cx q[15],q[55];
-cx q[15],q[70];
-rz(6.01139199704797) q[56];
-cx q[13],q[56];
-cx q[13],q[68];
-cx q[45],q[56];
-rz(6.01139199704797) q[56];
-cx q[45],q[56];
-rx(1.8195494462708042) q[45];
-rz(6.01139199704797) q[58];
-cx q[24],q[58];
-cx q[24],q[86];
-cx q[28],q[58];
-rz(6.01139199704797) q[58];
-cx q[28],q[58];
-cx q[28],q[87];
-rx(1.8195494462708042) q[58];
-rz(6.01139199704797) q[59];
-cx q[32],q[59];
-rz(6.01139199704797) q[61];
-cx q[4],q[61];
-cx q[4],q[99];
-cx q[7],q[61];
-rz(6.01139199704797) q[61];
-cx q[7],q[61];
-cx q[7],q[97];
-rx(1.8195494462708042) q[61];
-rz(6.01139199704797) q[62];
-cx q[17],q[62];
-cx q[17],q[63];
-rz(6.01139199704797) q[63];
-cx q[17],q[63];
-cx q[17],q[66];
-rz(6.01139199704797) q[65];
-cx q[5],q[65];
-cx q[5],q[76];
-cx q[23],q[65];
-rz(6.01139199704797) q[65];
-cx q[23],q[65];
-rx(1.8195494462708042) q[23];
-rx(1.8195494462708042) q[65];
-rz(6.01139199704797) q[66];
-cx q[17],q[66];
-rx(1.8195494462708042) q[17];
-cx q[47],q[66];
-rz(6.01139199704797) q[66];
-cx q[47],q[66];
-cx q[47],q[134];
-rx(1.8195494462708042) q[66];
-rz(6.01139199704797) q[67];
-cx q[41],q[67];
-cx q[56],q[67];
-rz(6.01139199704797) q[67];
-cx q[56],q[67];
-cx q[56],q[74];
-rx(1.8195494462708042) q[67];
-rz(6.01139199704797) q[68];
-cx q[13],q[68];
-cx q[32],q[68];
-rz(6.01139199704797) q[68];
-cx q[32],q[68];
-cx q[68],q[83];
-rz(6.01139199704797) q[69];
-cx q[6],q[69];
-cx q[59],q[69];
-rz(6.01139199704797) q[69];
-cx q[59],q[69];
-cx q[59],q[73];
-cx q[69],q[119];
-rz(6.01139199704797) q[70];
-cx q[15],q[70];
-cx q[15],q[80];
-cx q[70],q[84];
-rz(6.01139199704797) q[71];
-cx q[53],q[71];
-rx(1.8195494462708042) q[71];
-rz(6.01139199704797) q[72];
-cx q[27],q[72];
-cx q[44],q[72];
-rz(6.01139199704797) q[72];
-cx q[44],q[72];
-rx(1.8195494462708042) q[44];
-rx(1.8195494462708042) q[72];
-rz(6.01139199704797) q[73];
-cx q[59],q[73];
-cx q[59],q[85];
-rz(6.01139199704797) q[74];
-cx q[56],q[74];
-cx q[56],q[82];
-cx q[63],q[74];
-rz(6.01139199704797) q[74];
-cx q[63],q[74];
-cx q[63],q[122];
-rx(1.8195494462708042) q[74];
-rz(6.01139199704797) q[75];
-cx q[21],q[75];
-cx q[21],q[81];
-rx(1.8195494462708042) q[75];
-rz(6.01139199704797) q[76];
-cx q[5],q[76];
-cx q[5],q[89];
-cx q[6],q[76];
-rz(6.01139199704797) q[76];
-cx q[6],q[76];
-cx q[6],q[79];
-rx(1.8195494462708042) q[76];
-rz(6.01139199704797) q[77];
-cx q[30],q[77];
-rx(1.8195494462708042) q[30];
-rz(6.01139199704797) q[79];
-cx q[6],q[79];
-cx q[6],q[91];
-cx q[50],q[79];
-rz(6.01139199704797) q[79];
-cx q[50],q[79];
-cx q[50],q[101];
-rx(1.8195494462708042) q[79];
-rz(6.01139199704797) q[80];
-cx q[15],q[80];
-cx q[15],q[90];
-rx(1.8195494462708042) q[80];
-rz(6.01139199704797) q[81];
-cx q[21],q[81];
-cx q[21],q[98];
-cx q[77],q[81];
-rz(6.01139199704797) q[81];
-cx q[77],q[81];
-rx(1.8195494462708042) q[77];
-rz(6.01139199704797) q[82];
-cx q[56],q[82];
-cx q[56],q[96];
-rx(1.8195494462708042) q[82];
-rz(6.01139199704797) q[83];
-cx q[68],q[83];
-rx(1.8195494462708042) q[68];
-rx(1.8195494462708042) q[83];
-rz(6.01139199704797) q[84];
-cx q[70],q[84];
-rx(1.8195494462708042) q[70];
-cx q[73],q[84];
-rz(6.01139199704797) q[84];
-cx q[73],q[84];
-rx(1.8195494462708042) q[73];
-rx(1.8195494462708042) q[84];
-rz(6.01139199704797) q[85];
-cx q[59],q[85];
-rx(1.8195494462708042) q[59];
-rx(1.8195494462708042) q[85];
-rz(6.01139199704797) q[86];
-cx q[24],q[86];
-cx q[24],q[110];
-cx q[53],q[86];
-rz(6.01139199704797) q[86];
-cx q[53],q[86];
-cx q[53],q[124];
-rx(1.8195494462708042) q[86];
-rz(6.01139199704797) q[87];
-cx q[28],q[87];
-cx q[32],q[87];
-rz(6.01139199704797) q[87];
-cx q[32],q[87];
-cx q[32],q[93];
-rx(1.8195494462708042) q[87];
-rz(6.01139199704797) q[89];
-cx q[5],q[89];
-cx q[5],q[95];
-rz(6.01139199704797) q[90];
-cx q[15],q[90];
-cx q[15],q[92];
-cx q[27],q[90];
-rz(6.01139199704797) q[90];
-cx q[27],q[90];
-rx(1.8195494462708042) q[90];
-rz(6.01139199704797) q[91];
-cx q[6],q[91];
-rx(1.8195494462708042) q[6];
-rz(6.01139199704797) q[92];
-cx q[15],q[92];
-cx q[15],q[108];
-cx q[89],q[92];
-rz(6.01139199704797) q[92];
-cx q[89],q[92];
-rz(6.01139199704797) q[93];
-cx q[32],q[93];
-rx(1.8195494462708042) q[93];
-rz(6.01139199704797) q[94];
-cx q[36],q[94];
-cx q[55],q[94];
-rz(6.01139199704797) q[94];
-cx q[55],q[94];
-rx(1.8195494462708042) q[55];
-rz(6.01139199704797) q[95];
-cx q[5],q[95];
-cx q[5],q[106];
-cx q[27],q[95];
-rz(6.01139199704797) q[95];
-cx q[27],q[95];
-rx(1.8195494462708042) q[27];
-rx(1.8195494462708042) q[95];
-rz(6.01139199704797) q[96];
-cx q[56],q[96];
-rx(1.8195494462708042) q[56];
-cx q[92],q[96];
-rz(6.01139199704797) q[96];
-cx q[92],q[96];
-rx(1.8195494462708042) q[96];
-rz(6.01139199704797) q[97];
-cx q[7],q[97];
-cx q[7],q[104];
-rx(1.8195494462708042) q[97];
-rz(6.01139199704797) q[98];
-cx q[21],q[98];
-cx q[21],q[111];
-rx(1.8195494462708042) q[98];
-rz(6.01139199704797) q[99];
-cx q[4],q[99];
-cx q[4],q[102];
-cx q[41],q[99];
-rz(6.01139199704797) q[99];
-cx q[41],q[99];
-rx(1.8195494462708042) q[41];
-rx(1.8195494462708042) q[99];
-rz(6.01139199704797) q[101];
-cx q[50],q[101];
-cx q[50],q[129];
-rx(1.8195494462708042) q[101];
-rz(6.01139199704797) q[102];
-cx q[4],q[102];
-cx q[4],q[127];
-rx(1.8195494462708042) q[102];
-rz(6.01139199704797) q[104];
-cx q[7],q[104];
-cx q[7],q[133];
-cx q[13],q[104];
-rz(6.01139199704797) q[104];
-cx q[13],q[104];
-cx q[104],q[114];
-rz(6.01139199704797) q[105];
-cx q[26],q[105];
-cx q[26],q[117];
-cx q[28],q[105];
-rz(6.01139199704797) q[105];
-cx q[28],q[105];
-cx q[28],q[116];
-rx(1.8195494462708042) q[105];
-rz(6.01139199704797) q[106];
-cx q[5],q[106];
-cx q[5],q[109];
-cx q[36],q[106];
-rz(6.01139199704797) q[106];
-cx q[36],q[106];
-rx(1.8195494462708042) q[106];
-rz(6.01139199704797) q[107];
-cx q[31],q[107];
-rx(1.8195494462708042) q[107];
-rz(6.01139199704797) q[108];
-cx q[15],q[108];
-cx q[15],q[115];
-cx q[31],q[108];
-rz(6.01139199704797) q[108];
-cx q[31],q[108];
-rx(1.8195494462708042) q[31];
-rx(1.8195494462708042) q[108];
-rz(6.01139199704797) q[109];
-cx q[5],q[109];
-cx q[5],q[118];
-cx q[39],q[109];
-rz(6.01139199704797) q[109];
-cx q[39],q[109];
-rx(1.8195494462708042) q[39];
-cx q[109],q[125];
-rz(6.01139199704797) q[110];
-cx q[24],q[110];
-rx(1.8195494462708042) q[24];
-rz(6.01139199704797) q[111];
-cx q[21],q[111];
-cx q[21],q[112];
-rx(1.8195494462708042) q[111];
-rz(6.01139199704797) q[112];
-cx q[21],q[112];
-rx(1.8195494462708042) q[21];
-cx q[36],q[112];
-rz(6.01139199704797) q[112];
-cx q[36],q[112];
-rx(1.8195494462708042) q[36];
-rx(1.8195494462708042) q[112];
-rz(6.01139199704797) q[114];
-cx q[104],q[114];
-cx q[110],q[114];
-rz(6.01139199704797) q[114];
-cx q[110],q[114];
-rx(1.8195494462708042) q[110];
-rx(1.8195494462708042) q[114];
-rz(6.01139199704797) q[115];
-cx q[15],q[115];
-cx q[92],q[115];
-rz(6.01139199704797) q[115];
-cx q[92],q[115];
-rx(1.8195494462708042) q[92];
-rx(1.8195494462708042) q[115];
-rz(6.01139199704797) q[116];
-cx q[28],q[116];
-rx(1.8195494462708042) q[28];
-cx q[42],q[116];
-rz(6.01139199704797) q[116];
-cx q[42],q[116];
-rx(1.8195494462708042) q[42];
-rx(1.8195494462708042) q[116];
-rz(6.01139199704797) q[117];
-cx q[26],q[117];
-rx(1.8195494462708042) q[26];
-cx q[32],q[117];
-rz(6.01139199704797) q[117];
-cx q[32],q[117];
-cx q[32],q[131];
-rx(1.8195494462708042) q[117];
-rz(6.01139199704797) q[118];
-cx q[5],q[118];
-rx(1.8195494462708042) q[5];
-cx q[15],q[118];
-rz(6.01139199704797) q[118];
-cx q[15],q[118];
-rx(1.8195494462708042) q[15];
-rx(1.8195494462708042) q[118];
-rz(6.01139199704797) q[119];
-cx q[69],q[119];
-rx(1.8195494462708042) q[69];
-rx(1.8195494462708042) q[119];
-rz(6.01139199704797) q[120];
-cx q[46],q[120];
-rx(1.8195494462708042) q[46];
-cx q[94],q[120];
-rz(6.01139199704797) q[120];
-cx q[94],q[120];
-rx(1.8195494462708042) q[94];
-rx(1.8195494462708042) q[120];
-rz(6.01139199704797) q[121];
-cx q[20],q[121];
-rx(1.8195494462708042) q[20];
-cx q[104],q[121];
-rz(6.01139199704797) q[121];
-cx q[104],q[121];
-rx(1.8195494462708042) q[104];
-rx(1.8195494462708042) q[121];
-rz(6.01139199704797) q[122];
-cx q[63],q[122];
-rx(1.8195494462708042) q[63];
-cx q[81],q[122];
-rz(6.01139199704797) q[122];
-cx q[81],q[122];
-rx(1.8195494462708042) q[122];
-rz(6.01139199704797) q[124];
-cx q[53],q[124];
-rx(1.8195494462708042) q[53];
-cx q[81],q[124];
-rz(6.01139199704797) q[124];
-cx q[81],q[124];
-rx(1.8195494462708042) q[81];
-rx(1.8195494462708042) q[124];
-rz(6.01139199704797) q[125];
-cx q[109],q[125];
-rx(1.8195494462708042) q[125];
-rz(6.01139199704797) q[127];
-cx q[4],q[127];
-rx(1.8195494462708042) q[4];
-cx q[62],q[127];
-rz(6.01139199704797) q[127];
-cx q[62],q[127];
-cx q[62],q[128];
-rx(1.8195494462708042) q[127];
-rz(6.01139199704797) q[128];
-cx q[62],q[128];
-rx(1.8195494462708042) q[62];
-cx q[109],q[128];
-rz(6.01139199704797) q[128];
-cx q[109],q[128];
-rx(1.8195494462708042) q[128];
-rz(6.01139199704797) q[129];
-cx q[50],q[129];
-rx(1.8195494462708042) q[50];
-cx q[91],q[129];
-rz(6.01139199704797) q[129];
-cx q[91],q[129];
-rx(1.8195494462708042) q[91];
-rx(1.8195494462708042) q[129];
-rz(6.01139199704797) q[130];
-cx q[35],q[130];
-rx(1.8195494462708042) q[35];
-cx q[109],q[130];
-rz(6.01139199704797) q[130];
-cx q[109],q[130];
-rx(1.8195494462708042) q[109];
-rx(1.8195494462708042) q[130];
-rz(6.01139199704797) q[131];
-cx q[32],q[131];
-rx(1.8195494462708042) q[32];
-cx q[123],q[131];
-rz(6.01139199704797) q[131];
-cx q[123],q[131];
-rx(1.8195494462708042) q[123];
-rx(1.8195494462708042) q[131];
-rz(6.01139199704797) q[133];
-cx q[7],q[133];
-rx(1.8195494462708042) q[7];
-cx q[89],q[133];
-rz(6.01139199704797) q[133];
-cx q[89],q[133];
-rx(1.8195494462708042) q[89];
-rx(1.8195494462708042) q[133];
-rz(6.01139199704797) q[134];
-cx q[47],q[134];
-rx(1.8195494462708042) q[47];
-rx(1.8195494462708042) q[134];
-rx(8.351015112235597) q[135];
-cx q[0],q[135];
-rz(6.01139199704797) q[135];
-cx q[0],q[135];
-rx(1.8195494462708042) q[0];
-cx q[13],q[135];
-rz(6.01139199704797) q[135];
-cx q[13],q[135];
-rx(1.8195494462708042) q[13];
-rx(1.8195494462708042) q[135];
\ No newline at end of file
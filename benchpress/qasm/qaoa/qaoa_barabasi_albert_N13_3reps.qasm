@@ -1,266 +0,0 @@
-OPENQASM 2.0;
-include "qelib1.inc";
-qreg q[13];
-ry(pi/2) q[0];
-rx(pi) q[0];
-ry(pi/2) q[1];
-rx(pi) q[1];
-cx q[0],q[1];
-rz(4.795205280624918) q[1];
-cx q[0],q[1];
-ry(pi/2) q[2];
-rx(pi) q[2];
-cx q[0],q[2];
-rz(4.795205280624918) q[2];
-cx q[0],q[2];
-rx(7.80395686485872) q[2];
-ry(pi/2) q[3];
-rx(pi) q[3];
-cx q[0],q[3];
-rz(4.795205280624918) q[3];
-cx q[0],q[3];
-rx(7.80395686485872) q[0];
-cx q[1],q[3];
-rz(4.795205280624918) q[3];
-cx q[1],q[3];
-ry(pi/2) q[4];
-rx(pi) q[4];
-cx q[1],q[4];
-rz(4.795205280624918) q[4];
-cx q[1],q[4];
-cx q[3],q[4];
-rz(4.795205280624918) q[4];
-cx q[3],q[4];
-ry(pi/2) q[5];
-rx(pi) q[5];
-cx q[1],q[5];
-rz(4.795205280624918) q[5];
-cx q[1],q[5];
-cx q[3],q[5];
-rz(4.795205280624918) q[5];
-cx q[3],q[5];
-ry(pi/2) q[6];
-rx(pi) q[6];
-cx q[4],q[6];
-rz(4.795205280624918) q[6];
-cx q[4],q[6];
-cx q[5],q[6];
-rz(4.795205280624918) q[6];
-cx q[5],q[6];
-ry(pi/2) q[7];
-rx(pi) q[7];
-cx q[3],q[7];
-rz(4.795205280624918) q[7];
-cx q[3],q[7];
-cx q[4],q[7];
-rz(4.795205280624918) q[7];
-cx q[4],q[7];
-rx(7.80395686485872) q[7];
-ry(pi/2) q[8];
-rx(pi) q[8];
-cx q[3],q[8];
-rz(4.795205280624918) q[8];
-cx q[3],q[8];
-cx q[5],q[8];
-rz(4.795205280624918) q[8];
-cx q[5],q[8];
-rx(7.80395686485872) q[8];
-ry(pi/2) q[9];
-rx(pi) q[9];
-cx q[1],q[9];
-rz(4.795205280624918) q[9];
-cx q[1],q[9];
-rx(7.80395686485872) q[1];
-cx q[0],q[1];
-rz(0.7926295192259971) q[1];
-cx q[0],q[1];
-cx q[0],q[2];
-rz(0.7926295192259971) q[2];
-cx q[0],q[2];
-rx(4.362844045947177) q[2];
-cx q[3],q[9];
-rz(4.795205280624918) q[9];
-cx q[3],q[9];
-rx(7.80395686485872) q[9];
-ry(pi/2) q[10];
-rx(pi) q[10];
-cx q[4],q[10];
-rz(4.795205280624918) q[10];
-cx q[4],q[10];
-rx(7.80395686485872) q[4];
-cx q[6],q[10];
-rz(4.795205280624918) q[10];
-cx q[6],q[10];
-rx(7.80395686485872) q[10];
-ry(pi/2) q[11];
-rx(pi) q[11];
-cx q[5],q[11];
-rz(4.795205280624918) q[11];
-cx q[5],q[11];
-cx q[6],q[11];
-rz(4.795205280624918) q[11];
-cx q[6],q[11];
-rx(7.80395686485872) q[6];
-rx(7.80395686485872) q[11];
-ry(pi/2) q[12];
-rx(pi) q[12];
-cx q[3],q[12];
-rz(4.795205280624918) q[12];
-cx q[3],q[12];
-rx(7.80395686485872) q[3];
-cx q[0],q[3];
-rz(0.7926295192259971) q[3];
-cx q[0],q[3];
-rx(4.362844045947177) q[0];
-cx q[1],q[3];
-rz(0.7926295192259971) q[3];
-cx q[1],q[3];
-cx q[1],q[4];
-rz(0.7926295192259971) q[4];
-cx q[1],q[4];
-cx q[3],q[4];
-rz(0.7926295192259971) q[4];
-cx q[3],q[4];
-cx q[4],q[6];
-cx q[5],q[12];
-rz(0.7926295192259971) q[6];
-cx q[4],q[6];
-rz(4.795205280624918) q[12];
-cx q[5],q[12];
-rx(7.80395686485872) q[5];
-cx q[1],q[5];
-rz(0.7926295192259971) q[5];
-cx q[1],q[5];
-cx q[1],q[9];
-cx q[3],q[5];
-rz(0.7926295192259971) q[5];
-cx q[3],q[5];
-cx q[3],q[7];
-cx q[5],q[6];
-rz(0.7926295192259971) q[6];
-cx q[5],q[6];
-rz(0.7926295192259971) q[7];
-cx q[3],q[7];
-cx q[3],q[8];
-cx q[4],q[7];
-rz(0.7926295192259971) q[7];
-cx q[4],q[7];
-cx q[4],q[10];
-rx(4.362844045947177) q[7];
-rz(0.7926295192259971) q[8];
-cx q[3],q[8];
-cx q[5],q[8];
-rz(0.7926295192259971) q[8];
-cx q[5],q[8];
-cx q[5],q[11];
-rx(4.362844045947177) q[8];
-rz(0.7926295192259971) q[9];
-cx q[1],q[9];
-rx(4.362844045947177) q[1];
-cx q[0],q[1];
-rz(4.049902538998333) q[1];
-cx q[0],q[1];
-cx q[0],q[2];
-rz(4.049902538998333) q[2];
-cx q[0],q[2];
-rx(6.083750579823518) q[2];
-cx q[3],q[9];
-rz(0.7926295192259971) q[9];
-cx q[3],q[9];
-rx(4.362844045947177) q[9];
-rz(0.7926295192259971) q[10];
-cx q[4],q[10];
-rx(4.362844045947177) q[4];
-cx q[6],q[10];
-rz(0.7926295192259971) q[10];
-cx q[6],q[10];
-rx(4.362844045947177) q[10];
-rz(0.7926295192259971) q[11];
-cx q[5],q[11];
-cx q[6],q[11];
-rz(0.7926295192259971) q[11];
-cx q[6],q[11];
-rx(4.362844045947177) q[6];
-rx(4.362844045947177) q[11];
-rx(7.80395686485872) q[12];
-cx q[3],q[12];
-rz(0.7926295192259971) q[12];
-cx q[3],q[12];
-rx(4.362844045947177) q[3];
-cx q[0],q[3];
-rz(4.049902538998333) q[3];
-cx q[0],q[3];
-rx(6.083750579823518) q[0];
-cx q[1],q[3];
-rz(4.049902538998333) q[3];
-cx q[1],q[3];
-cx q[1],q[4];
-rz(4.049902538998333) q[4];
-cx q[1],q[4];
-cx q[3],q[4];
-rz(4.049902538998333) q[4];
-cx q[3],q[4];
-cx q[4],q[6];
-cx q[5],q[12];
-rz(4.049902538998333) q[6];
-cx q[4],q[6];
-rz(0.7926295192259971) q[12];
-cx q[5],q[12];
-rx(4.362844045947177) q[5];
-cx q[1],q[5];
-rz(4.049902538998333) q[5];
-cx q[1],q[5];
-cx q[1],q[9];
-cx q[3],q[5];
-rz(4.049902538998333) q[5];
-cx q[3],q[5];
-cx q[3],q[7];
-cx q[5],q[6];
-rz(4.049902538998333) q[6];
-cx q[5],q[6];
-rz(4.049902538998333) q[7];
-cx q[3],q[7];
-cx q[3],q[8];
-cx q[4],q[7];
-rz(4.049902538998333) q[7];
-cx q[4],q[7];
-cx q[4],q[10];
-rx(6.083750579823518) q[7];
-rz(4.049902538998333) q[8];
-cx q[3],q[8];
-cx q[5],q[8];
-rz(4.049902538998333) q[8];
-cx q[5],q[8];
-cx q[5],q[11];
-rx(6.083750579823518) q[8];
-rz(4.049902538998333) q[9];
-cx q[1],q[9];
-rx(6.083750579823518) q[1];
-cx q[3],q[9];
-rz(4.049902538998333) q[9];
-cx q[3],q[9];
-rx(6.083750579823518) q[9];
-rz(4.049902538998333) q[10];
-cx q[4],q[10];
-rx(6.083750579823518) q[4];
-cx q[6],q[10];
-rz(4.049902538998333) q[10];
-cx q[6],q[10];
-rx(6.083750579823518) q[10];
-rz(4.049902538998333) q[11];
-cx q[5],q[11];
-cx q[6],q[11];
-rz(4.049902538998333) q[11];
-cx q[6],q[11];
-rx(6.083750579823518) q[6];
-rx(6.083750579823518) q[11];
-rx(4.362844045947177) q[12];
-cx q[3],q[12];
-rz(4.049902538998333) q[12];
-cx q[3],q[12];
-rx(6.083750579823518) q[3];
-cx q[5],q[12];
-rz(4.049902538998333) q[12];
-cx q[5],q[12];
-rx(6.083750579823518) q[5];
-rx(6.083750579823518) q[12];
\ No newline at end of file
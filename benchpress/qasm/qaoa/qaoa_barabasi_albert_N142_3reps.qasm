@@ -1,3233 +0,0 @@
-OPENQASM 2.0;
-include "qelib1.inc";
-qreg q[142];
-ry(pi/2) q[0];
-rx(pi) q[0];
-ry(pi/2) q[1];
-rx(pi) q[1];
-cx q[0],q[1];
-rz(1.5665901801431257) q[1];
-cx q[0],q[1];
-ry(pi/2) q[2];
-rx(pi) q[2];
-cx q[0],q[2];
-rz(1.5665901801431257) q[2];
-cx q[0],q[2];
-ry(pi/2) q[3];
-rx(pi) q[3];
-cx q[0],q[3];
-rz(1.5665901801431257) q[3];
-cx q[0],q[3];
-cx q[1],q[3];
-rz(1.5665901801431257) q[3];
-cx q[1],q[3];
-ry(pi/2) q[4];
-rx(pi) q[4];
-cx q[1],q[4];
-rz(1.5665901801431257) q[4];
-cx q[1],q[4];
-cx q[3],q[4];
-rz(1.5665901801431257) q[4];
-cx q[3],q[4];
-ry(pi/2) q[5];
-rx(pi) q[5];
-cx q[1],q[5];
-rz(1.5665901801431257) q[5];
-cx q[1],q[5];
-cx q[3],q[5];
-rz(1.5665901801431257) q[5];
-cx q[3],q[5];
-ry(pi/2) q[6];
-rx(pi) q[6];
-cx q[4],q[6];
-rz(1.5665901801431257) q[6];
-cx q[4],q[6];
-cx q[5],q[6];
-rz(1.5665901801431257) q[6];
-cx q[5],q[6];
-ry(pi/2) q[7];
-rx(pi) q[7];
-cx q[3],q[7];
-rz(1.5665901801431257) q[7];
-cx q[3],q[7];
-cx q[4],q[7];
-rz(1.5665901801431257) q[7];
-cx q[4],q[7];
-ry(pi/2) q[8];
-rx(pi) q[8];
-cx q[3],q[8];
-rz(1.5665901801431257) q[8];
-cx q[3],q[8];
-cx q[5],q[8];
-rz(1.5665901801431257) q[8];
-cx q[5],q[8];
-ry(pi/2) q[9];
-rx(pi) q[9];
-cx q[1],q[9];
-rz(1.5665901801431257) q[9];
-cx q[1],q[9];
-cx q[3],q[9];
-rz(1.5665901801431257) q[9];
-cx q[3],q[9];
-ry(pi/2) q[10];
-rx(pi) q[10];
-cx q[4],q[10];
-rz(1.5665901801431257) q[10];
-cx q[4],q[10];
-cx q[6],q[10];
-rz(1.5665901801431257) q[10];
-cx q[6],q[10];
-ry(pi/2) q[11];
-rx(pi) q[11];
-cx q[5],q[11];
-rz(1.5665901801431257) q[11];
-cx q[5],q[11];
-cx q[6],q[11];
-rz(1.5665901801431257) q[11];
-cx q[6],q[11];
-rx(7.158176262199965) q[11];
-ry(pi/2) q[12];
-rx(pi) q[12];
-cx q[3],q[12];
-rz(1.5665901801431257) q[12];
-cx q[3],q[12];
-cx q[5],q[12];
-rz(1.5665901801431257) q[12];
-cx q[5],q[12];
-ry(pi/2) q[13];
-rx(pi) q[13];
-cx q[4],q[13];
-rz(1.5665901801431257) q[13];
-cx q[4],q[13];
-cx q[5],q[13];
-rz(1.5665901801431257) q[13];
-cx q[5],q[13];
-ry(pi/2) q[14];
-rx(pi) q[14];
-cx q[3],q[14];
-rz(1.5665901801431257) q[14];
-cx q[3],q[14];
-cx q[4],q[14];
-rz(1.5665901801431257) q[14];
-cx q[4],q[14];
-rx(7.158176262199965) q[14];
-ry(pi/2) q[15];
-rx(pi) q[15];
-cx q[0],q[15];
-rz(1.5665901801431257) q[15];
-cx q[0],q[15];
-cx q[3],q[15];
-rz(1.5665901801431257) q[15];
-cx q[3],q[15];
-ry(pi/2) q[16];
-rx(pi) q[16];
-cx q[0],q[16];
-rz(1.5665901801431257) q[16];
-cx q[0],q[16];
-cx q[3],q[16];
-rz(1.5665901801431257) q[16];
-cx q[3],q[16];
-ry(pi/2) q[17];
-rx(pi) q[17];
-cx q[1],q[17];
-rz(1.5665901801431257) q[17];
-cx q[1],q[17];
-cx q[3],q[17];
-rz(1.5665901801431257) q[17];
-cx q[3],q[17];
-ry(pi/2) q[18];
-rx(pi) q[18];
-cx q[3],q[18];
-rz(1.5665901801431257) q[18];
-cx q[3],q[18];
-cx q[4],q[18];
-rz(1.5665901801431257) q[18];
-cx q[4],q[18];
-ry(pi/2) q[19];
-rx(pi) q[19];
-cx q[3],q[19];
-rz(1.5665901801431257) q[19];
-cx q[3],q[19];
-cx q[7],q[19];
-rz(1.5665901801431257) q[19];
-cx q[7],q[19];
-ry(pi/2) q[20];
-rx(pi) q[20];
-cx q[0],q[20];
-rz(1.5665901801431257) q[20];
-cx q[0],q[20];
-cx q[15],q[20];
-rz(1.5665901801431257) q[20];
-cx q[15],q[20];
-ry(pi/2) q[21];
-rx(pi) q[21];
-cx q[4],q[21];
-rz(1.5665901801431257) q[21];
-cx q[4],q[21];
-cx q[15],q[21];
-rz(1.5665901801431257) q[21];
-cx q[15],q[21];
-ry(pi/2) q[22];
-rx(pi) q[22];
-cx q[3],q[22];
-rz(1.5665901801431257) q[22];
-cx q[3],q[22];
-cx q[9],q[22];
-rz(1.5665901801431257) q[22];
-cx q[9],q[22];
-rx(7.158176262199965) q[22];
-ry(pi/2) q[23];
-rx(pi) q[23];
-cx q[3],q[23];
-rz(1.5665901801431257) q[23];
-cx q[3],q[23];
-cx q[17],q[23];
-rz(1.5665901801431257) q[23];
-cx q[17],q[23];
-ry(pi/2) q[24];
-rx(pi) q[24];
-cx q[3],q[24];
-rz(1.5665901801431257) q[24];
-cx q[3],q[24];
-cx q[5],q[24];
-rz(1.5665901801431257) q[24];
-cx q[5],q[24];
-ry(pi/2) q[25];
-rx(pi) q[25];
-cx q[3],q[25];
-rz(1.5665901801431257) q[25];
-cx q[3],q[25];
-cx q[12],q[25];
-rz(1.5665901801431257) q[25];
-cx q[12],q[25];
-ry(pi/2) q[26];
-rx(pi) q[26];
-cx q[3],q[26];
-rz(1.5665901801431257) q[26];
-cx q[3],q[26];
-cx q[21],q[26];
-rz(1.5665901801431257) q[26];
-cx q[21],q[26];
-ry(pi/2) q[27];
-rx(pi) q[27];
-cx q[4],q[27];
-rz(1.5665901801431257) q[27];
-cx q[4],q[27];
-cx q[6],q[27];
-rz(1.5665901801431257) q[27];
-cx q[6],q[27];
-ry(pi/2) q[28];
-rx(pi) q[28];
-cx q[1],q[28];
-rz(1.5665901801431257) q[28];
-cx q[1],q[28];
-cx q[3],q[28];
-rz(1.5665901801431257) q[28];
-cx q[3],q[28];
-ry(pi/2) q[29];
-rx(pi) q[29];
-cx q[1],q[29];
-rz(1.5665901801431257) q[29];
-cx q[1],q[29];
-cx q[3],q[29];
-rz(1.5665901801431257) q[29];
-cx q[3],q[29];
-rx(7.158176262199965) q[29];
-ry(pi/2) q[30];
-rx(pi) q[30];
-cx q[3],q[30];
-rz(1.5665901801431257) q[30];
-cx q[3],q[30];
-cx q[18],q[30];
-rz(1.5665901801431257) q[30];
-cx q[18],q[30];
-rx(7.158176262199965) q[18];
-ry(pi/2) q[31];
-rx(pi) q[31];
-cx q[12],q[31];
-rz(1.5665901801431257) q[31];
-cx q[12],q[31];
-cx q[26],q[31];
-rz(1.5665901801431257) q[31];
-cx q[26],q[31];
-ry(pi/2) q[32];
-rx(pi) q[32];
-cx q[0],q[32];
-rz(1.5665901801431257) q[32];
-cx q[0],q[32];
-cx q[21],q[32];
-rz(1.5665901801431257) q[32];
-cx q[21],q[32];
-ry(pi/2) q[33];
-rx(pi) q[33];
-cx q[5],q[33];
-rz(1.5665901801431257) q[33];
-cx q[5],q[33];
-cx q[30],q[33];
-rz(1.5665901801431257) q[33];
-cx q[30],q[33];
-rx(7.158176262199965) q[33];
-ry(pi/2) q[34];
-rx(pi) q[34];
-cx q[3],q[34];
-rz(1.5665901801431257) q[34];
-cx q[3],q[34];
-cx q[12],q[34];
-rz(1.5665901801431257) q[34];
-cx q[12],q[34];
-ry(pi/2) q[35];
-rx(pi) q[35];
-cx q[3],q[35];
-rz(1.5665901801431257) q[35];
-cx q[3],q[35];
-cx q[32],q[35];
-rz(1.5665901801431257) q[35];
-cx q[32],q[35];
-ry(pi/2) q[36];
-rx(pi) q[36];
-cx q[15],q[36];
-rz(1.5665901801431257) q[36];
-cx q[15],q[36];
-cx q[20],q[36];
-rz(1.5665901801431257) q[36];
-cx q[20],q[36];
-ry(pi/2) q[37];
-rx(pi) q[37];
-cx q[10],q[37];
-rz(1.5665901801431257) q[37];
-cx q[10],q[37];
-cx q[34],q[37];
-rz(1.5665901801431257) q[37];
-cx q[34],q[37];
-rx(7.158176262199965) q[34];
-ry(pi/2) q[38];
-rx(pi) q[38];
-cx q[19],q[38];
-rz(1.5665901801431257) q[38];
-cx q[19],q[38];
-rx(7.158176262199965) q[19];
-cx q[21],q[38];
-rz(1.5665901801431257) q[38];
-cx q[21],q[38];
-ry(pi/2) q[39];
-rx(pi) q[39];
-cx q[3],q[39];
-rz(1.5665901801431257) q[39];
-cx q[3],q[39];
-cx q[13],q[39];
-rz(1.5665901801431257) q[39];
-cx q[13],q[39];
-ry(pi/2) q[40];
-rx(pi) q[40];
-cx q[3],q[40];
-rz(1.5665901801431257) q[40];
-cx q[3],q[40];
-cx q[23],q[40];
-rz(1.5665901801431257) q[40];
-cx q[23],q[40];
-ry(pi/2) q[41];
-rx(pi) q[41];
-cx q[10],q[41];
-rz(1.5665901801431257) q[41];
-cx q[10],q[41];
-cx q[27],q[41];
-rz(1.5665901801431257) q[41];
-cx q[27],q[41];
-ry(pi/2) q[42];
-rx(pi) q[42];
-cx q[0],q[42];
-rz(1.5665901801431257) q[42];
-cx q[0],q[42];
-cx q[3],q[42];
-rz(1.5665901801431257) q[42];
-cx q[3],q[42];
-ry(pi/2) q[43];
-rx(pi) q[43];
-cx q[3],q[43];
-rz(1.5665901801431257) q[43];
-cx q[3],q[43];
-cx q[20],q[43];
-rz(1.5665901801431257) q[43];
-cx q[20],q[43];
-rx(7.158176262199965) q[43];
-ry(pi/2) q[44];
-rx(pi) q[44];
-cx q[3],q[44];
-rz(1.5665901801431257) q[44];
-cx q[3],q[44];
-cx q[12],q[44];
-rz(1.5665901801431257) q[44];
-cx q[12],q[44];
-ry(pi/2) q[45];
-rx(pi) q[45];
-cx q[1],q[45];
-rz(1.5665901801431257) q[45];
-cx q[1],q[45];
-cx q[16],q[45];
-rz(1.5665901801431257) q[45];
-cx q[16],q[45];
-ry(pi/2) q[46];
-rx(pi) q[46];
-cx q[5],q[46];
-rz(1.5665901801431257) q[46];
-cx q[5],q[46];
-cx q[38],q[46];
-rz(1.5665901801431257) q[46];
-cx q[38],q[46];
-rx(7.158176262199965) q[38];
-ry(pi/2) q[47];
-rx(pi) q[47];
-cx q[4],q[47];
-rz(1.5665901801431257) q[47];
-cx q[4],q[47];
-cx q[17],q[47];
-rz(1.5665901801431257) q[47];
-cx q[17],q[47];
-ry(pi/2) q[48];
-rx(pi) q[48];
-cx q[0],q[48];
-rz(1.5665901801431257) q[48];
-cx q[0],q[48];
-cx q[30],q[48];
-rz(1.5665901801431257) q[48];
-cx q[30],q[48];
-rx(7.158176262199965) q[48];
-ry(pi/2) q[49];
-rx(pi) q[49];
-cx q[3],q[49];
-rz(1.5665901801431257) q[49];
-cx q[3],q[49];
-cx q[4],q[49];
-rz(1.5665901801431257) q[49];
-cx q[4],q[49];
-rx(7.158176262199965) q[49];
-ry(pi/2) q[50];
-rx(pi) q[50];
-cx q[3],q[50];
-rz(1.5665901801431257) q[50];
-cx q[3],q[50];
-cx q[12],q[50];
-rz(1.5665901801431257) q[50];
-cx q[12],q[50];
-ry(pi/2) q[51];
-rx(pi) q[51];
-cx q[0],q[51];
-rz(1.5665901801431257) q[51];
-cx q[0],q[51];
-cx q[28],q[51];
-rz(1.5665901801431257) q[51];
-cx q[28],q[51];
-rx(7.158176262199965) q[51];
-ry(pi/2) q[52];
-rx(pi) q[52];
-cx q[3],q[52];
-rz(1.5665901801431257) q[52];
-cx q[3],q[52];
-cx q[10],q[52];
-rz(1.5665901801431257) q[52];
-cx q[10],q[52];
-ry(pi/2) q[53];
-rx(pi) q[53];
-cx q[17],q[53];
-rz(1.5665901801431257) q[53];
-cx q[17],q[53];
-cx q[21],q[53];
-rz(1.5665901801431257) q[53];
-cx q[21],q[53];
-ry(pi/2) q[54];
-rx(pi) q[54];
-cx q[24],q[54];
-rz(1.5665901801431257) q[54];
-cx q[24],q[54];
-cx q[28],q[54];
-rz(1.5665901801431257) q[54];
-cx q[28],q[54];
-rx(7.158176262199965) q[54];
-ry(pi/2) q[55];
-rx(pi) q[55];
-cx q[9],q[55];
-rz(1.5665901801431257) q[55];
-cx q[9],q[55];
-cx q[15],q[55];
-rz(1.5665901801431257) q[55];
-cx q[15],q[55];
-ry(pi/2) q[56];
-rx(pi) q[56];
-cx q[13],q[56];
-rz(1.5665901801431257) q[56];
-cx q[13],q[56];
-cx q[45],q[56];
-rz(1.5665901801431257) q[56];
-cx q[45],q[56];
-rx(7.158176262199965) q[45];
-ry(pi/2) q[57];
-rx(pi) q[57];
-cx q[1],q[57];
-rz(1.5665901801431257) q[57];
-cx q[1],q[57];
-cx q[3],q[57];
-rz(1.5665901801431257) q[57];
-cx q[3],q[57];
-ry(pi/2) q[58];
-rx(pi) q[58];
-cx q[24],q[58];
-rz(1.5665901801431257) q[58];
-cx q[24],q[58];
-cx q[28],q[58];
-rz(1.5665901801431257) q[58];
-cx q[28],q[58];
-rx(7.158176262199965) q[58];
-ry(pi/2) q[59];
-rx(pi) q[59];
-cx q[16],q[59];
-rz(1.5665901801431257) q[59];
-cx q[16],q[59];
-cx q[32],q[59];
-rz(1.5665901801431257) q[59];
-cx q[32],q[59];
-ry(pi/2) q[60];
-rx(pi) q[60];
-cx q[1],q[60];
-rz(1.5665901801431257) q[60];
-cx q[1],q[60];
-cx q[7],q[60];
-rz(1.5665901801431257) q[60];
-cx q[7],q[60];
-ry(pi/2) q[61];
-rx(pi) q[61];
-cx q[4],q[61];
-rz(1.5665901801431257) q[61];
-cx q[4],q[61];
-cx q[7],q[61];
-rz(1.5665901801431257) q[61];
-cx q[7],q[61];
-rx(7.158176262199965) q[61];
-ry(pi/2) q[62];
-rx(pi) q[62];
-cx q[0],q[62];
-rz(1.5665901801431257) q[62];
-cx q[0],q[62];
-cx q[17],q[62];
-rz(1.5665901801431257) q[62];
-cx q[17],q[62];
-ry(pi/2) q[63];
-rx(pi) q[63];
-cx q[12],q[63];
-rz(1.5665901801431257) q[63];
-cx q[12],q[63];
-cx q[17],q[63];
-rz(1.5665901801431257) q[63];
-cx q[17],q[63];
-ry(pi/2) q[64];
-rx(pi) q[64];
-cx q[0],q[64];
-rz(1.5665901801431257) q[64];
-cx q[0],q[64];
-cx q[10],q[64];
-rz(1.5665901801431257) q[64];
-cx q[10],q[64];
-rx(7.158176262199965) q[64];
-ry(pi/2) q[65];
-rx(pi) q[65];
-cx q[5],q[65];
-rz(1.5665901801431257) q[65];
-cx q[5],q[65];
-cx q[23],q[65];
-rz(1.5665901801431257) q[65];
-cx q[23],q[65];
-rx(7.158176262199965) q[23];
-rx(7.158176262199965) q[65];
-ry(pi/2) q[66];
-rx(pi) q[66];
-cx q[17],q[66];
-rz(1.5665901801431257) q[66];
-cx q[17],q[66];
-rx(7.158176262199965) q[17];
-cx q[47],q[66];
-rz(1.5665901801431257) q[66];
-cx q[47],q[66];
-rx(7.158176262199965) q[66];
-ry(pi/2) q[67];
-rx(pi) q[67];
-cx q[41],q[67];
-rz(1.5665901801431257) q[67];
-cx q[41],q[67];
-cx q[56],q[67];
-rz(1.5665901801431257) q[67];
-cx q[56],q[67];
-rx(7.158176262199965) q[67];
-ry(pi/2) q[68];
-rx(pi) q[68];
-cx q[13],q[68];
-rz(1.5665901801431257) q[68];
-cx q[13],q[68];
-cx q[32],q[68];
-rz(1.5665901801431257) q[68];
-cx q[32],q[68];
-ry(pi/2) q[69];
-rx(pi) q[69];
-cx q[6],q[69];
-rz(1.5665901801431257) q[69];
-cx q[6],q[69];
-cx q[59],q[69];
-rz(1.5665901801431257) q[69];
-cx q[59],q[69];
-ry(pi/2) q[70];
-rx(pi) q[70];
-cx q[3],q[70];
-rz(1.5665901801431257) q[70];
-cx q[3],q[70];
-cx q[15],q[70];
-rz(1.5665901801431257) q[70];
-cx q[15],q[70];
-ry(pi/2) q[71];
-rx(pi) q[71];
-cx q[3],q[71];
-rz(1.5665901801431257) q[71];
-cx q[3],q[71];
-cx q[53],q[71];
-rz(1.5665901801431257) q[71];
-cx q[53],q[71];
-rx(7.158176262199965) q[71];
-ry(pi/2) q[72];
-rx(pi) q[72];
-cx q[27],q[72];
-rz(1.5665901801431257) q[72];
-cx q[27],q[72];
-cx q[44],q[72];
-rz(1.5665901801431257) q[72];
-cx q[44],q[72];
-rx(7.158176262199965) q[44];
-rx(7.158176262199965) q[72];
-ry(pi/2) q[73];
-rx(pi) q[73];
-cx q[16],q[73];
-rz(1.5665901801431257) q[73];
-cx q[16],q[73];
-cx q[59],q[73];
-rz(1.5665901801431257) q[73];
-cx q[59],q[73];
-ry(pi/2) q[74];
-rx(pi) q[74];
-cx q[56],q[74];
-rz(1.5665901801431257) q[74];
-cx q[56],q[74];
-cx q[63],q[74];
-rz(1.5665901801431257) q[74];
-cx q[63],q[74];
-rx(7.158176262199965) q[74];
-ry(pi/2) q[75];
-rx(pi) q[75];
-cx q[0],q[75];
-rz(1.5665901801431257) q[75];
-cx q[0],q[75];
-cx q[21],q[75];
-rz(1.5665901801431257) q[75];
-cx q[21],q[75];
-rx(7.158176262199965) q[75];
-ry(pi/2) q[76];
-rx(pi) q[76];
-cx q[5],q[76];
-rz(1.5665901801431257) q[76];
-cx q[5],q[76];
-cx q[6],q[76];
-rz(1.5665901801431257) q[76];
-cx q[6],q[76];
-rx(7.158176262199965) q[76];
-ry(pi/2) q[77];
-rx(pi) q[77];
-cx q[3],q[77];
-rz(1.5665901801431257) q[77];
-cx q[3],q[77];
-cx q[30],q[77];
-rz(1.5665901801431257) q[77];
-cx q[30],q[77];
-rx(7.158176262199965) q[30];
-ry(pi/2) q[78];
-rx(pi) q[78];
-cx q[42],q[78];
-rz(1.5665901801431257) q[78];
-cx q[42],q[78];
-cx q[60],q[78];
-rz(1.5665901801431257) q[78];
-cx q[60],q[78];
-rx(7.158176262199965) q[78];
-ry(pi/2) q[79];
-rx(pi) q[79];
-cx q[6],q[79];
-rz(1.5665901801431257) q[79];
-cx q[6],q[79];
-cx q[50],q[79];
-rz(1.5665901801431257) q[79];
-cx q[50],q[79];
-rx(7.158176262199965) q[79];
-ry(pi/2) q[80];
-rx(pi) q[80];
-cx q[9],q[80];
-rz(1.5665901801431257) q[80];
-cx q[9],q[80];
-rx(7.158176262199965) q[9];
-cx q[15],q[80];
-rz(1.5665901801431257) q[80];
-cx q[15],q[80];
-rx(7.158176262199965) q[80];
-ry(pi/2) q[81];
-rx(pi) q[81];
-cx q[21],q[81];
-rz(1.5665901801431257) q[81];
-cx q[21],q[81];
-cx q[77],q[81];
-rz(1.5665901801431257) q[81];
-cx q[77],q[81];
-rx(7.158176262199965) q[77];
-ry(pi/2) q[82];
-rx(pi) q[82];
-cx q[0],q[82];
-rz(1.5665901801431257) q[82];
-cx q[0],q[82];
-cx q[56],q[82];
-rz(1.5665901801431257) q[82];
-cx q[56],q[82];
-rx(7.158176262199965) q[82];
-ry(pi/2) q[83];
-rx(pi) q[83];
-cx q[8],q[83];
-rz(1.5665901801431257) q[83];
-cx q[8],q[83];
-rx(7.158176262199965) q[8];
-cx q[68],q[83];
-rz(1.5665901801431257) q[83];
-cx q[68],q[83];
-rx(7.158176262199965) q[68];
-rx(7.158176262199965) q[83];
-ry(pi/2) q[84];
-rx(pi) q[84];
-cx q[70],q[84];
-rz(1.5665901801431257) q[84];
-cx q[70],q[84];
-rx(7.158176262199965) q[70];
-cx q[73],q[84];
-rz(1.5665901801431257) q[84];
-cx q[73],q[84];
-rx(7.158176262199965) q[73];
-rx(7.158176262199965) q[84];
-ry(pi/2) q[85];
-rx(pi) q[85];
-cx q[37],q[85];
-rz(1.5665901801431257) q[85];
-cx q[37],q[85];
-cx q[59],q[85];
-rz(1.5665901801431257) q[85];
-cx q[59],q[85];
-rx(7.158176262199965) q[59];
-rx(7.158176262199965) q[85];
-ry(pi/2) q[86];
-rx(pi) q[86];
-cx q[24],q[86];
-rz(1.5665901801431257) q[86];
-cx q[24],q[86];
-cx q[53],q[86];
-rz(1.5665901801431257) q[86];
-cx q[53],q[86];
-rx(7.158176262199965) q[86];
-ry(pi/2) q[87];
-rx(pi) q[87];
-cx q[28],q[87];
-rz(1.5665901801431257) q[87];
-cx q[28],q[87];
-cx q[32],q[87];
-rz(1.5665901801431257) q[87];
-cx q[32],q[87];
-rx(7.158176262199965) q[87];
-ry(pi/2) q[88];
-rx(pi) q[88];
-cx q[3],q[88];
-rz(1.5665901801431257) q[88];
-cx q[3],q[88];
-cx q[60],q[88];
-rz(1.5665901801431257) q[88];
-cx q[60],q[88];
-rx(7.158176262199965) q[88];
-ry(pi/2) q[89];
-rx(pi) q[89];
-cx q[2],q[89];
-rz(1.5665901801431257) q[89];
-cx q[2],q[89];
-rx(7.158176262199965) q[2];
-cx q[5],q[89];
-rz(1.5665901801431257) q[89];
-cx q[5],q[89];
-ry(pi/2) q[90];
-rx(pi) q[90];
-cx q[15],q[90];
-rz(1.5665901801431257) q[90];
-cx q[15],q[90];
-cx q[27],q[90];
-rz(1.5665901801431257) q[90];
-cx q[27],q[90];
-rx(7.158176262199965) q[90];
-ry(pi/2) q[91];
-rx(pi) q[91];
-cx q[0],q[91];
-rz(1.5665901801431257) q[91];
-cx q[0],q[91];
-cx q[6],q[91];
-rz(1.5665901801431257) q[91];
-cx q[6],q[91];
-rx(7.158176262199965) q[6];
-ry(pi/2) q[92];
-rx(pi) q[92];
-cx q[15],q[92];
-rz(1.5665901801431257) q[92];
-cx q[15],q[92];
-cx q[89],q[92];
-rz(1.5665901801431257) q[92];
-cx q[89],q[92];
-ry(pi/2) q[93];
-rx(pi) q[93];
-cx q[0],q[93];
-rz(1.5665901801431257) q[93];
-cx q[0],q[93];
-cx q[32],q[93];
-rz(1.5665901801431257) q[93];
-cx q[32],q[93];
-rx(7.158176262199965) q[93];
-ry(pi/2) q[94];
-rx(pi) q[94];
-cx q[36],q[94];
-rz(1.5665901801431257) q[94];
-cx q[36],q[94];
-cx q[55],q[94];
-rz(1.5665901801431257) q[94];
-cx q[55],q[94];
-rx(7.158176262199965) q[55];
-ry(pi/2) q[95];
-rx(pi) q[95];
-cx q[5],q[95];
-rz(1.5665901801431257) q[95];
-cx q[5],q[95];
-cx q[27],q[95];
-rz(1.5665901801431257) q[95];
-cx q[27],q[95];
-rx(7.158176262199965) q[27];
-rx(7.158176262199965) q[95];
-ry(pi/2) q[96];
-rx(pi) q[96];
-cx q[56],q[96];
-rz(1.5665901801431257) q[96];
-cx q[56],q[96];
-rx(7.158176262199965) q[56];
-cx q[92],q[96];
-rz(1.5665901801431257) q[96];
-cx q[92],q[96];
-rx(7.158176262199965) q[96];
-ry(pi/2) q[97];
-rx(pi) q[97];
-cx q[1],q[97];
-rz(1.5665901801431257) q[97];
-cx q[1],q[97];
-cx q[7],q[97];
-rz(1.5665901801431257) q[97];
-cx q[7],q[97];
-rx(7.158176262199965) q[97];
-ry(pi/2) q[98];
-rx(pi) q[98];
-cx q[10],q[98];
-rz(1.5665901801431257) q[98];
-cx q[10],q[98];
-rx(7.158176262199965) q[10];
-cx q[21],q[98];
-rz(1.5665901801431257) q[98];
-cx q[21],q[98];
-rx(7.158176262199965) q[98];
-ry(pi/2) q[99];
-rx(pi) q[99];
-cx q[4],q[99];
-rz(1.5665901801431257) q[99];
-cx q[4],q[99];
-cx q[41],q[99];
-rz(1.5665901801431257) q[99];
-cx q[41],q[99];
-rx(7.158176262199965) q[41];
-rx(7.158176262199965) q[99];
-ry(pi/2) q[100];
-rx(pi) q[100];
-cx q[3],q[100];
-rz(1.5665901801431257) q[100];
-cx q[3],q[100];
-cx q[25],q[100];
-rz(1.5665901801431257) q[100];
-cx q[25],q[100];
-rx(7.158176262199965) q[25];
-rx(7.158176262199965) q[100];
-ry(pi/2) q[101];
-rx(pi) q[101];
-cx q[16],q[101];
-rz(1.5665901801431257) q[101];
-cx q[16],q[101];
-cx q[50],q[101];
-rz(1.5665901801431257) q[101];
-cx q[50],q[101];
-rx(7.158176262199965) q[101];
-ry(pi/2) q[102];
-rx(pi) q[102];
-cx q[3],q[102];
-rz(1.5665901801431257) q[102];
-cx q[3],q[102];
-cx q[4],q[102];
-rz(1.5665901801431257) q[102];
-cx q[4],q[102];
-rx(7.158176262199965) q[102];
-ry(pi/2) q[103];
-rx(pi) q[103];
-cx q[16],q[103];
-rz(1.5665901801431257) q[103];
-cx q[16],q[103];
-rx(7.158176262199965) q[16];
-cx q[57],q[103];
-rz(1.5665901801431257) q[103];
-cx q[57],q[103];
-rx(7.158176262199965) q[57];
-rx(7.158176262199965) q[103];
-ry(pi/2) q[104];
-rx(pi) q[104];
-cx q[7],q[104];
-rz(1.5665901801431257) q[104];
-cx q[7],q[104];
-cx q[13],q[104];
-rz(1.5665901801431257) q[104];
-cx q[13],q[104];
-ry(pi/2) q[105];
-rx(pi) q[105];
-cx q[26],q[105];
-rz(1.5665901801431257) q[105];
-cx q[26],q[105];
-cx q[28],q[105];
-rz(1.5665901801431257) q[105];
-cx q[28],q[105];
-rx(7.158176262199965) q[105];
-ry(pi/2) q[106];
-rx(pi) q[106];
-cx q[5],q[106];
-rz(1.5665901801431257) q[106];
-cx q[5],q[106];
-cx q[36],q[106];
-rz(1.5665901801431257) q[106];
-cx q[36],q[106];
-rx(7.158176262199965) q[106];
-ry(pi/2) q[107];
-rx(pi) q[107];
-cx q[3],q[107];
-rz(1.5665901801431257) q[107];
-cx q[3],q[107];
-cx q[31],q[107];
-rz(1.5665901801431257) q[107];
-cx q[31],q[107];
-rx(7.158176262199965) q[107];
-ry(pi/2) q[108];
-rx(pi) q[108];
-cx q[15],q[108];
-rz(1.5665901801431257) q[108];
-cx q[15],q[108];
-cx q[31],q[108];
-rz(1.5665901801431257) q[108];
-cx q[31],q[108];
-rx(7.158176262199965) q[31];
-rx(7.158176262199965) q[108];
-ry(pi/2) q[109];
-rx(pi) q[109];
-cx q[5],q[109];
-rz(1.5665901801431257) q[109];
-cx q[5],q[109];
-cx q[39],q[109];
-rz(1.5665901801431257) q[109];
-cx q[39],q[109];
-rx(7.158176262199965) q[39];
-ry(pi/2) q[110];
-rx(pi) q[110];
-cx q[3],q[110];
-rz(1.5665901801431257) q[110];
-cx q[3],q[110];
-cx q[24],q[110];
-rz(1.5665901801431257) q[110];
-cx q[24],q[110];
-ry(pi/2) q[111];
-rx(pi) q[111];
-cx q[3],q[111];
-rz(1.5665901801431257) q[111];
-cx q[3],q[111];
-cx q[21],q[111];
-rz(1.5665901801431257) q[111];
-cx q[21],q[111];
-rx(7.158176262199965) q[111];
-ry(pi/2) q[112];
-rx(pi) q[112];
-cx q[21],q[112];
-rz(1.5665901801431257) q[112];
-cx q[21],q[112];
-rx(7.158176262199965) q[21];
-cx q[36],q[112];
-rz(1.5665901801431257) q[112];
-cx q[36],q[112];
-rx(7.158176262199965) q[36];
-rx(7.158176262199965) q[112];
-ry(pi/2) q[113];
-rx(pi) q[113];
-cx q[1],q[113];
-rz(1.5665901801431257) q[113];
-cx q[1],q[113];
-rx(7.158176262199965) q[1];
-cx q[3],q[113];
-rz(1.5665901801431257) q[113];
-cx q[3],q[113];
-rx(7.158176262199965) q[113];
-ry(pi/2) q[114];
-rx(pi) q[114];
-cx q[104],q[114];
-rz(1.5665901801431257) q[114];
-cx q[104],q[114];
-cx q[110],q[114];
-rz(1.5665901801431257) q[114];
-cx q[110],q[114];
-rx(7.158176262199965) q[110];
-rx(7.158176262199965) q[114];
-ry(pi/2) q[115];
-rx(pi) q[115];
-cx q[15],q[115];
-rz(1.5665901801431257) q[115];
-cx q[15],q[115];
-cx q[92],q[115];
-rz(1.5665901801431257) q[115];
-cx q[92],q[115];
-rx(7.158176262199965) q[115];
-ry(pi/2) q[116];
-rx(pi) q[116];
-cx q[28],q[116];
-rz(1.5665901801431257) q[116];
-cx q[28],q[116];
-rx(7.158176262199965) q[28];
-cx q[42],q[116];
-rz(1.5665901801431257) q[116];
-cx q[42],q[116];
-rx(7.158176262199965) q[42];
-rx(7.158176262199965) q[116];
-ry(pi/2) q[117];
-rx(pi) q[117];
-cx q[26],q[117];
-rz(1.5665901801431257) q[117];
-cx q[26],q[117];
-rx(7.158176262199965) q[26];
-cx q[32],q[117];
-rz(1.5665901801431257) q[117];
-cx q[32],q[117];
-rx(7.158176262199965) q[117];
-ry(pi/2) q[118];
-rx(pi) q[118];
-cx q[5],q[118];
-rz(1.5665901801431257) q[118];
-cx q[5],q[118];
-cx q[15],q[118];
-rz(1.5665901801431257) q[118];
-cx q[15],q[118];
-rx(7.158176262199965) q[15];
-rx(7.158176262199965) q[118];
-ry(pi/2) q[119];
-rx(pi) q[119];
-cx q[40],q[119];
-rz(1.5665901801431257) q[119];
-cx q[40],q[119];
-rx(7.158176262199965) q[40];
-cx q[69],q[119];
-rz(1.5665901801431257) q[119];
-cx q[69],q[119];
-rx(7.158176262199965) q[69];
-ry(pi/2) q[120];
-rx(pi) q[120];
-cx q[46],q[120];
-rz(1.5665901801431257) q[120];
-cx q[46],q[120];
-rx(7.158176262199965) q[46];
-cx q[94],q[120];
-rz(1.5665901801431257) q[120];
-cx q[94],q[120];
-rx(7.158176262199965) q[94];
-rx(7.158176262199965) q[120];
-ry(pi/2) q[121];
-rx(pi) q[121];
-cx q[20],q[121];
-rz(1.5665901801431257) q[121];
-cx q[20],q[121];
-rx(7.158176262199965) q[20];
-cx q[104],q[121];
-rz(1.5665901801431257) q[121];
-cx q[104],q[121];
-rx(7.158176262199965) q[104];
-ry(pi/2) q[122];
-rx(pi) q[122];
-cx q[63],q[122];
-rz(1.5665901801431257) q[122];
-cx q[63],q[122];
-rx(7.158176262199965) q[63];
-cx q[81],q[122];
-rz(1.5665901801431257) q[122];
-cx q[81],q[122];
-rx(7.158176262199965) q[122];
-ry(pi/2) q[123];
-rx(pi) q[123];
-cx q[0],q[123];
-rz(1.5665901801431257) q[123];
-cx q[0],q[123];
-cx q[52],q[123];
-rz(1.5665901801431257) q[123];
-cx q[52],q[123];
-rx(7.158176262199965) q[52];
-ry(pi/2) q[124];
-rx(pi) q[124];
-cx q[53],q[124];
-rz(1.5665901801431257) q[124];
-cx q[53],q[124];
-rx(7.158176262199965) q[53];
-cx q[81],q[124];
-rz(1.5665901801431257) q[124];
-cx q[81],q[124];
-rx(7.158176262199965) q[81];
-rx(7.158176262199965) q[124];
-ry(pi/2) q[125];
-rx(pi) q[125];
-cx q[3],q[125];
-rz(1.5665901801431257) q[125];
-cx q[3],q[125];
-cx q[109],q[125];
-rz(1.5665901801431257) q[125];
-cx q[109],q[125];
-rx(7.158176262199965) q[125];
-ry(pi/2) q[126];
-rx(pi) q[126];
-cx q[0],q[126];
-rz(1.5665901801431257) q[126];
-cx q[0],q[126];
-cx q[12],q[126];
-rz(1.5665901801431257) q[126];
-cx q[12],q[126];
-rx(7.158176262199965) q[126];
-ry(pi/2) q[127];
-rx(pi) q[127];
-cx q[4],q[127];
-rz(1.5665901801431257) q[127];
-cx q[4],q[127];
-rx(7.158176262199965) q[4];
-cx q[62],q[127];
-rz(1.5665901801431257) q[127];
-cx q[62],q[127];
-rx(7.158176262199965) q[127];
-ry(pi/2) q[128];
-rx(pi) q[128];
-cx q[62],q[128];
-rz(1.5665901801431257) q[128];
-cx q[62],q[128];
-rx(7.158176262199965) q[62];
-cx q[109],q[128];
-rz(1.5665901801431257) q[128];
-cx q[109],q[128];
-rx(7.158176262199965) q[128];
-ry(pi/2) q[129];
-rx(pi) q[129];
-cx q[50],q[129];
-rz(1.5665901801431257) q[129];
-cx q[50],q[129];
-rx(7.158176262199965) q[50];
-cx q[91],q[129];
-rz(1.5665901801431257) q[129];
-cx q[91],q[129];
-rx(7.158176262199965) q[91];
-rx(7.158176262199965) q[129];
-ry(pi/2) q[130];
-rx(pi) q[130];
-cx q[35],q[130];
-rz(1.5665901801431257) q[130];
-cx q[35],q[130];
-rx(7.158176262199965) q[35];
-cx q[109],q[130];
-rz(1.5665901801431257) q[130];
-cx q[109],q[130];
-rx(7.158176262199965) q[109];
-rx(7.158176262199965) q[130];
-ry(pi/2) q[131];
-rx(pi) q[131];
-cx q[32],q[131];
-rz(1.5665901801431257) q[131];
-cx q[32],q[131];
-cx q[123],q[131];
-rz(1.5665901801431257) q[131];
-cx q[123],q[131];
-rx(7.158176262199965) q[123];
-rx(7.158176262199965) q[131];
-ry(pi/2) q[132];
-rx(pi) q[132];
-cx q[3],q[132];
-rz(1.5665901801431257) q[132];
-cx q[3],q[132];
-cx q[37],q[132];
-rz(1.5665901801431257) q[132];
-cx q[37],q[132];
-rx(7.158176262199965) q[37];
-rx(7.158176262199965) q[132];
-ry(pi/2) q[133];
-rx(pi) q[133];
-cx q[7],q[133];
-rz(1.5665901801431257) q[133];
-cx q[7],q[133];
-rx(7.158176262199965) q[7];
-cx q[89],q[133];
-rz(1.5665901801431257) q[133];
-cx q[89],q[133];
-rx(7.158176262199965) q[89];
-ry(pi/2) q[134];
-rx(pi) q[134];
-cx q[3],q[134];
-rz(1.5665901801431257) q[134];
-cx q[3],q[134];
-cx q[47],q[134];
-rz(1.5665901801431257) q[134];
-cx q[47],q[134];
-rx(7.158176262199965) q[47];
-rx(7.158176262199965) q[134];
-ry(pi/2) q[135];
-rx(pi) q[135];
-cx q[0],q[135];
-rz(1.5665901801431257) q[135];
-cx q[0],q[135];
-cx q[13],q[135];
-rz(1.5665901801431257) q[135];
-cx q[13],q[135];
-rx(7.158176262199965) q[13];
-rx(7.158176262199965) q[135];
-ry(pi/2) q[136];
-rx(pi) q[136];
-cx q[3],q[136];
-rz(1.5665901801431257) q[136];
-cx q[3],q[136];
-rx(7.158176262199965) q[3];
-cx q[92],q[136];
-rz(1.5665901801431257) q[136];
-cx q[92],q[136];
-rx(7.158176262199965) q[92];
-rx(7.158176262199965) q[136];
-ry(pi/2) q[137];
-rx(pi) q[137];
-cx q[24],q[137];
-rz(1.5665901801431257) q[137];
-cx q[24],q[137];
-rx(7.158176262199965) q[24];
-cx q[133],q[137];
-rz(1.5665901801431257) q[137];
-cx q[133],q[137];
-rx(7.158176262199965) q[137];
-ry(pi/2) q[138];
-rx(pi) q[138];
-cx q[60],q[138];
-rz(1.5665901801431257) q[138];
-cx q[60],q[138];
-rx(7.158176262199965) q[60];
-cx q[119],q[138];
-rz(1.5665901801431257) q[138];
-cx q[119],q[138];
-rx(7.158176262199965) q[119];
-rx(7.158176262199965) q[138];
-ry(pi/2) q[139];
-rx(pi) q[139];
-cx q[5],q[139];
-rz(1.5665901801431257) q[139];
-cx q[5],q[139];
-rx(7.158176262199965) q[5];
-cx q[133],q[139];
-rz(1.5665901801431257) q[139];
-cx q[133],q[139];
-rx(7.158176262199965) q[133];
-rx(7.158176262199965) q[139];
-ry(pi/2) q[140];
-rx(pi) q[140];
-cx q[0],q[140];
-rz(1.5665901801431257) q[140];
-cx q[0],q[140];
-rx(7.158176262199965) q[0];
-cx q[0],q[1];
-rz(4.761905643923349) q[1];
-cx q[0],q[1];
-cx q[0],q[2];
-rz(4.761905643923349) q[2];
-cx q[0],q[2];
-cx q[0],q[3];
-cx q[2],q[89];
-rz(4.761905643923349) q[3];
-cx q[0],q[3];
-cx q[0],q[15];
-cx q[1],q[3];
-rz(4.761905643923349) q[3];
-cx q[1],q[3];
-cx q[1],q[4];
-rz(4.761905643923349) q[4];
-cx q[1],q[4];
-cx q[1],q[5];
-cx q[3],q[4];
-rz(4.761905643923349) q[4];
-cx q[3],q[4];
-cx q[4],q[6];
-rz(4.761905643923349) q[5];
-cx q[1],q[5];
-cx q[1],q[9];
-cx q[3],q[5];
-rz(4.761905643923349) q[5];
-cx q[3],q[5];
-cx q[3],q[7];
-rz(4.761905643923349) q[6];
-cx q[4],q[6];
-cx q[5],q[6];
-rz(4.761905643923349) q[6];
-cx q[5],q[6];
-rz(4.761905643923349) q[7];
-cx q[3],q[7];
-cx q[3],q[8];
-cx q[4],q[7];
-rz(4.761905643923349) q[7];
-cx q[4],q[7];
-cx q[4],q[10];
-rz(4.761905643923349) q[8];
-cx q[3],q[8];
-cx q[5],q[8];
-rz(4.761905643923349) q[8];
-cx q[5],q[8];
-cx q[5],q[11];
-cx q[8],q[83];
-rz(4.761905643923349) q[9];
-cx q[1],q[9];
-cx q[1],q[17];
-cx q[3],q[9];
-rz(4.761905643923349) q[9];
-cx q[3],q[9];
-rz(4.761905643923349) q[10];
-cx q[4],q[10];
-cx q[4],q[13];
-cx q[6],q[10];
-rz(4.761905643923349) q[10];
-cx q[6],q[10];
-cx q[10],q[37];
-rz(4.761905643923349) q[11];
-cx q[5],q[11];
-cx q[6],q[11];
-rz(4.761905643923349) q[11];
-cx q[6],q[11];
-rx(8.446282262070188) q[11];
-rz(4.761905643923349) q[13];
-cx q[4],q[13];
-rz(4.761905643923349) q[15];
-cx q[0],q[15];
-cx q[0],q[16];
-rz(4.761905643923349) q[16];
-cx q[0],q[16];
-cx q[0],q[20];
-rz(4.761905643923349) q[17];
-cx q[1],q[17];
-cx q[1],q[28];
-rz(4.761905643923349) q[20];
-cx q[0],q[20];
-rz(4.761905643923349) q[28];
-cx q[1],q[28];
-cx q[1],q[29];
-rz(4.761905643923349) q[29];
-cx q[1],q[29];
-cx q[1],q[45];
-cx q[32],q[140];
-rz(4.761905643923349) q[37];
-cx q[10],q[37];
-cx q[10],q[41];
-rz(4.761905643923349) q[41];
-cx q[10],q[41];
-rz(4.761905643923349) q[45];
-cx q[1],q[45];
-cx q[1],q[57];
-rz(4.761905643923349) q[57];
-cx q[1],q[57];
-cx q[1],q[60];
-rz(4.761905643923349) q[60];
-cx q[1],q[60];
-cx q[1],q[97];
-rz(4.761905643923349) q[83];
-cx q[8],q[83];
-rx(8.446282262070188) q[8];
-rz(4.761905643923349) q[89];
-cx q[2],q[89];
-rx(8.446282262070188) q[2];
-rz(4.761905643923349) q[97];
-cx q[1],q[97];
-cx q[1],q[113];
-rz(4.761905643923349) q[113];
-cx q[1],q[113];
-rx(8.446282262070188) q[1];
-rz(1.5665901801431257) q[140];
-cx q[32],q[140];
-rx(7.158176262199965) q[32];
-cx q[0],q[32];
-rz(4.761905643923349) q[32];
-cx q[0],q[32];
-cx q[0],q[42];
-rz(4.761905643923349) q[42];
-cx q[0],q[42];
-cx q[0],q[48];
-rz(4.761905643923349) q[48];
-cx q[0],q[48];
-cx q[0],q[51];
-rz(4.761905643923349) q[51];
-cx q[0],q[51];
-cx q[0],q[62];
-rz(4.761905643923349) q[62];
-cx q[0],q[62];
-cx q[0],q[64];
-rz(4.761905643923349) q[64];
-cx q[0],q[64];
-cx q[0],q[75];
-rz(4.761905643923349) q[75];
-cx q[0],q[75];
-cx q[0],q[82];
-rz(4.761905643923349) q[82];
-cx q[0],q[82];
-cx q[0],q[91];
-rz(4.761905643923349) q[91];
-cx q[0],q[91];
-cx q[0],q[93];
-rz(4.761905643923349) q[93];
-cx q[0],q[93];
-cx q[0],q[123];
-rz(4.761905643923349) q[123];
-cx q[0],q[123];
-cx q[0],q[126];
-rz(4.761905643923349) q[126];
-cx q[0],q[126];
-cx q[0],q[135];
-rz(4.761905643923349) q[135];
-cx q[0],q[135];
-rx(7.158176262199965) q[140];
-cx q[0],q[140];
-rz(4.761905643923349) q[140];
-cx q[0],q[140];
-rx(8.446282262070188) q[0];
-cx q[0],q[1];
-rz(2.943030947447448) q[1];
-cx q[0],q[1];
-cx q[0],q[2];
-rz(2.943030947447448) q[2];
-cx q[0],q[2];
-ry(pi/2) q[141];
-rx(pi) q[141];
-cx q[12],q[141];
-rz(1.5665901801431257) q[141];
-cx q[12],q[141];
-rx(7.158176262199965) q[12];
-cx q[3],q[12];
-rz(4.761905643923349) q[12];
-cx q[3],q[12];
-cx q[3],q[14];
-cx q[5],q[12];
-rz(4.761905643923349) q[12];
-cx q[5],q[12];
-cx q[5],q[13];
-rz(4.761905643923349) q[13];
-cx q[5],q[13];
-rz(4.761905643923349) q[14];
-cx q[3],q[14];
-cx q[3],q[15];
-cx q[4],q[14];
-rz(4.761905643923349) q[14];
-cx q[4],q[14];
-rx(8.446282262070188) q[14];
-rz(4.761905643923349) q[15];
-cx q[3],q[15];
-cx q[3],q[16];
-cx q[15],q[20];
-rz(4.761905643923349) q[16];
-cx q[3],q[16];
-cx q[3],q[17];
-cx q[16],q[45];
-rz(4.761905643923349) q[17];
-cx q[3],q[17];
-cx q[3],q[18];
-rz(4.761905643923349) q[18];
-cx q[3],q[18];
-cx q[3],q[19];
-cx q[4],q[18];
-rz(4.761905643923349) q[18];
-cx q[4],q[18];
-cx q[4],q[21];
-rz(4.761905643923349) q[19];
-cx q[3],q[19];
-cx q[3],q[22];
-cx q[7],q[19];
-rz(4.761905643923349) q[19];
-cx q[7],q[19];
-cx q[7],q[60];
-cx q[19],q[38];
-rz(4.761905643923349) q[20];
-cx q[15],q[20];
-rz(4.761905643923349) q[21];
-cx q[4],q[21];
-cx q[4],q[27];
-cx q[15],q[21];
-rz(4.761905643923349) q[21];
-cx q[15],q[21];
-cx q[15],q[36];
-rz(4.761905643923349) q[22];
-cx q[3],q[22];
-cx q[3],q[23];
-cx q[9],q[22];
-rz(4.761905643923349) q[22];
-cx q[9],q[22];
-cx q[9],q[55];
-rx(8.446282262070188) q[22];
-rz(4.761905643923349) q[23];
-cx q[3],q[23];
-cx q[3],q[24];
-cx q[17],q[23];
-rz(4.761905643923349) q[23];
-cx q[17],q[23];
-rz(4.761905643923349) q[24];
-cx q[3],q[24];
-cx q[3],q[25];
-cx q[5],q[24];
-rz(4.761905643923349) q[24];
-cx q[5],q[24];
-cx q[5],q[33];
-cx q[24],q[54];
-rz(4.761905643923349) q[25];
-cx q[3],q[25];
-cx q[3],q[26];
-cx q[12],q[25];
-rz(4.761905643923349) q[25];
-cx q[12],q[25];
-cx q[12],q[31];
-rz(4.761905643923349) q[26];
-cx q[3],q[26];
-cx q[3],q[28];
-cx q[21],q[26];
-rz(4.761905643923349) q[26];
-cx q[21],q[26];
-cx q[21],q[32];
-rz(4.761905643923349) q[27];
-cx q[4],q[27];
-cx q[4],q[47];
-cx q[6],q[27];
-rz(4.761905643923349) q[27];
-cx q[6],q[27];
-cx q[6],q[69];
-cx q[27],q[41];
-rz(4.761905643923349) q[28];
-cx q[3],q[28];
-cx q[3],q[29];
-cx q[28],q[51];
-rz(4.761905643923349) q[29];
-cx q[3],q[29];
-cx q[3],q[30];
-rx(8.446282262070188) q[29];
-rz(4.761905643923349) q[30];
-cx q[3],q[30];
-cx q[3],q[34];
-cx q[18],q[30];
-rz(4.761905643923349) q[30];
-cx q[18],q[30];
-rx(8.446282262070188) q[18];
-rz(4.761905643923349) q[31];
-cx q[12],q[31];
-cx q[26],q[31];
-rz(4.761905643923349) q[31];
-cx q[26],q[31];
-cx q[26],q[105];
-rz(4.761905643923349) q[32];
-cx q[21],q[32];
-rz(4.761905643923349) q[33];
-cx q[5],q[33];
-cx q[5],q[46];
-cx q[30],q[33];
-rz(4.761905643923349) q[33];
-cx q[30],q[33];
-cx q[30],q[48];
-rx(8.446282262070188) q[33];
-rz(4.761905643923349) q[34];
-cx q[3],q[34];
-cx q[3],q[35];
-cx q[12],q[34];
-rz(4.761905643923349) q[34];
-cx q[12],q[34];
-cx q[34],q[37];
-rz(4.761905643923349) q[35];
-cx q[3],q[35];
-cx q[3],q[39];
-cx q[32],q[35];
-rz(4.761905643923349) q[35];
-cx q[32],q[35];
-cx q[35],q[130];
-rz(4.761905643923349) q[36];
-cx q[15],q[36];
-cx q[20],q[36];
-rz(4.761905643923349) q[36];
-cx q[20],q[36];
-cx q[36],q[94];
-rz(4.761905643923349) q[37];
-cx q[34],q[37];
-rx(8.446282262070188) q[34];
-cx q[37],q[85];
-rz(4.761905643923349) q[38];
-cx q[19],q[38];
-rx(8.446282262070188) q[19];
-cx q[21],q[38];
-rz(4.761905643923349) q[38];
-cx q[21],q[38];
-rz(4.761905643923349) q[39];
-cx q[3],q[39];
-cx q[3],q[40];
-cx q[13],q[39];
-rz(4.761905643923349) q[39];
-cx q[13],q[39];
-cx q[13],q[56];
-rz(4.761905643923349) q[40];
-cx q[3],q[40];
-cx q[3],q[42];
-cx q[23],q[40];
-rz(4.761905643923349) q[40];
-cx q[23],q[40];
-cx q[40],q[119];
-rz(4.761905643923349) q[41];
-cx q[27],q[41];
-cx q[27],q[72];
-cx q[41],q[67];
-rz(4.761905643923349) q[42];
-cx q[3],q[42];
-cx q[3],q[43];
-cx q[42],q[78];
-rz(4.761905643923349) q[43];
-cx q[3],q[43];
-cx q[3],q[44];
-cx q[20],q[43];
-rz(4.761905643923349) q[43];
-cx q[20],q[43];
-rx(8.446282262070188) q[43];
-rz(4.761905643923349) q[44];
-cx q[3],q[44];
-cx q[3],q[49];
-cx q[12],q[44];
-rz(4.761905643923349) q[44];
-cx q[12],q[44];
-rz(4.761905643923349) q[45];
-cx q[16],q[45];
-cx q[16],q[59];
-rz(4.761905643923349) q[46];
-cx q[5],q[46];
-cx q[5],q[65];
-cx q[38],q[46];
-rz(4.761905643923349) q[46];
-cx q[38],q[46];
-rx(8.446282262070188) q[38];
-cx q[46],q[120];
-rz(4.761905643923349) q[47];
-cx q[4],q[47];
-cx q[17],q[47];
-rz(4.761905643923349) q[47];
-cx q[17],q[47];
-cx q[17],q[53];
-rz(4.761905643923349) q[48];
-cx q[30],q[48];
-rx(8.446282262070188) q[48];
-rz(4.761905643923349) q[49];
-cx q[3],q[49];
-cx q[3],q[50];
-cx q[4],q[49];
-rz(4.761905643923349) q[49];
-cx q[4],q[49];
-cx q[4],q[61];
-rx(8.446282262070188) q[49];
-rz(4.761905643923349) q[50];
-cx q[3],q[50];
-cx q[3],q[52];
-cx q[12],q[50];
-rz(4.761905643923349) q[50];
-cx q[12],q[50];
-cx q[12],q[63];
-rz(4.761905643923349) q[51];
-cx q[28],q[51];
-rx(8.446282262070188) q[51];
-rz(4.761905643923349) q[52];
-cx q[3],q[52];
-cx q[3],q[57];
-cx q[10],q[52];
-rz(4.761905643923349) q[52];
-cx q[10],q[52];
-cx q[10],q[64];
-cx q[52],q[123];
-rz(4.761905643923349) q[53];
-cx q[17],q[53];
-cx q[17],q[62];
-cx q[21],q[53];
-rz(4.761905643923349) q[53];
-cx q[21],q[53];
-cx q[21],q[75];
-rz(4.761905643923349) q[54];
-cx q[24],q[54];
-cx q[24],q[58];
-cx q[28],q[54];
-rz(4.761905643923349) q[54];
-cx q[28],q[54];
-rx(8.446282262070188) q[54];
-rz(4.761905643923349) q[55];
-cx q[9],q[55];
-cx q[9],q[80];
-cx q[15],q[55];
-rz(4.761905643923349) q[55];
-cx q[15],q[55];
-rz(4.761905643923349) q[56];
-cx q[13],q[56];
-cx q[13],q[68];
-cx q[45],q[56];
-rz(4.761905643923349) q[56];
-cx q[45],q[56];
-rx(8.446282262070188) q[45];
-rz(4.761905643923349) q[57];
-cx q[3],q[57];
-cx q[3],q[70];
-rz(4.761905643923349) q[58];
-cx q[24],q[58];
-cx q[24],q[86];
-cx q[28],q[58];
-rz(4.761905643923349) q[58];
-cx q[28],q[58];
-cx q[28],q[87];
-rx(8.446282262070188) q[58];
-rz(4.761905643923349) q[59];
-cx q[16],q[59];
-cx q[16],q[73];
-cx q[32],q[59];
-rz(4.761905643923349) q[59];
-cx q[32],q[59];
-rz(4.761905643923349) q[60];
-cx q[7],q[60];
-rz(4.761905643923349) q[61];
-cx q[4],q[61];
-cx q[4],q[99];
-cx q[7],q[61];
-rz(4.761905643923349) q[61];
-cx q[7],q[61];
-cx q[7],q[97];
-rx(8.446282262070188) q[61];
-rz(4.761905643923349) q[62];
-cx q[17],q[62];
-rz(4.761905643923349) q[63];
-cx q[12],q[63];
-cx q[12],q[126];
-cx q[17],q[63];
-rz(4.761905643923349) q[63];
-cx q[17],q[63];
-cx q[17],q[66];
-rz(4.761905643923349) q[64];
-cx q[10],q[64];
-cx q[10],q[98];
-rx(8.446282262070188) q[64];
-rz(4.761905643923349) q[65];
-cx q[5],q[65];
-cx q[5],q[76];
-cx q[23],q[65];
-rz(4.761905643923349) q[65];
-cx q[23],q[65];
-rx(8.446282262070188) q[23];
-rx(8.446282262070188) q[65];
-rz(4.761905643923349) q[66];
-cx q[17],q[66];
-rx(8.446282262070188) q[17];
-cx q[47],q[66];
-rz(4.761905643923349) q[66];
-cx q[47],q[66];
-rx(8.446282262070188) q[66];
-rz(4.761905643923349) q[67];
-cx q[41],q[67];
-cx q[56],q[67];
-rz(4.761905643923349) q[67];
-cx q[56],q[67];
-cx q[56],q[74];
-rx(8.446282262070188) q[67];
-rz(4.761905643923349) q[68];
-cx q[13],q[68];
-cx q[32],q[68];
-rz(4.761905643923349) q[68];
-cx q[32],q[68];
-cx q[68],q[83];
-rz(4.761905643923349) q[69];
-cx q[6],q[69];
-cx q[59],q[69];
-rz(4.761905643923349) q[69];
-cx q[59],q[69];
-rz(4.761905643923349) q[70];
-cx q[3],q[70];
-cx q[3],q[71];
-cx q[15],q[70];
-rz(4.761905643923349) q[70];
-cx q[15],q[70];
-cx q[70],q[84];
-rz(4.761905643923349) q[71];
-cx q[3],q[71];
-cx q[3],q[77];
-cx q[53],q[71];
-rz(4.761905643923349) q[71];
-cx q[53],q[71];
-rx(8.446282262070188) q[71];
-rz(4.761905643923349) q[72];
-cx q[27],q[72];
-cx q[44],q[72];
-rz(4.761905643923349) q[72];
-cx q[44],q[72];
-rx(8.446282262070188) q[44];
-rx(8.446282262070188) q[72];
-rz(4.761905643923349) q[73];
-cx q[16],q[73];
-cx q[16],q[101];
-cx q[59],q[73];
-rz(4.761905643923349) q[73];
-cx q[59],q[73];
-rz(4.761905643923349) q[74];
-cx q[56],q[74];
-cx q[56],q[82];
-cx q[63],q[74];
-rz(4.761905643923349) q[74];
-cx q[63],q[74];
-cx q[63],q[122];
-rx(8.446282262070188) q[74];
-rz(4.761905643923349) q[75];
-cx q[21],q[75];
-cx q[21],q[81];
-rx(8.446282262070188) q[75];
-rz(4.761905643923349) q[76];
-cx q[5],q[76];
-cx q[5],q[89];
-cx q[6],q[76];
-rz(4.761905643923349) q[76];
-cx q[6],q[76];
-cx q[6],q[79];
-rx(8.446282262070188) q[76];
-rz(4.761905643923349) q[77];
-cx q[3],q[77];
-cx q[3],q[88];
-cx q[30],q[77];
-rz(4.761905643923349) q[77];
-cx q[30],q[77];
-rx(8.446282262070188) q[30];
-rz(4.761905643923349) q[78];
-cx q[42],q[78];
-cx q[60],q[78];
-rz(4.761905643923349) q[78];
-cx q[60],q[78];
-rx(8.446282262070188) q[78];
-rz(4.761905643923349) q[79];
-cx q[6],q[79];
-cx q[6],q[91];
-cx q[50],q[79];
-rz(4.761905643923349) q[79];
-cx q[50],q[79];
-rx(8.446282262070188) q[79];
-rz(4.761905643923349) q[80];
-cx q[9],q[80];
-rx(8.446282262070188) q[9];
-cx q[15],q[80];
-rz(4.761905643923349) q[80];
-cx q[15],q[80];
-cx q[15],q[90];
-rx(8.446282262070188) q[80];
-rz(4.761905643923349) q[81];
-cx q[21],q[81];
-cx q[77],q[81];
-rz(4.761905643923349) q[81];
-cx q[77],q[81];
-rx(8.446282262070188) q[77];
-rz(4.761905643923349) q[82];
-cx q[56],q[82];
-cx q[56],q[96];
-rx(8.446282262070188) q[82];
-rz(4.761905643923349) q[83];
-cx q[68],q[83];
-rx(8.446282262070188) q[68];
-rx(8.446282262070188) q[83];
-rz(4.761905643923349) q[84];
-cx q[70],q[84];
-rx(8.446282262070188) q[70];
-cx q[73],q[84];
-rz(4.761905643923349) q[84];
-cx q[73],q[84];
-rx(8.446282262070188) q[73];
-rx(8.446282262070188) q[84];
-rz(4.761905643923349) q[85];
-cx q[37],q[85];
-cx q[59],q[85];
-rz(4.761905643923349) q[85];
-cx q[59],q[85];
-rx(8.446282262070188) q[59];
-rx(8.446282262070188) q[85];
-rz(4.761905643923349) q[86];
-cx q[24],q[86];
-cx q[53],q[86];
-rz(4.761905643923349) q[86];
-cx q[53],q[86];
-cx q[53],q[124];
-rx(8.446282262070188) q[86];
-rz(4.761905643923349) q[87];
-cx q[28],q[87];
-cx q[32],q[87];
-rz(4.761905643923349) q[87];
-cx q[32],q[87];
-cx q[32],q[93];
-rx(8.446282262070188) q[87];
-rz(4.761905643923349) q[88];
-cx q[3],q[88];
-cx q[3],q[100];
-cx q[60],q[88];
-rz(4.761905643923349) q[88];
-cx q[60],q[88];
-cx q[60],q[138];
-rx(8.446282262070188) q[88];
-rz(4.761905643923349) q[89];
-cx q[5],q[89];
-cx q[5],q[95];
-rz(4.761905643923349) q[90];
-cx q[15],q[90];
-cx q[15],q[92];
-cx q[27],q[90];
-rz(4.761905643923349) q[90];
-cx q[27],q[90];
-rx(8.446282262070188) q[90];
-rz(4.761905643923349) q[91];
-cx q[6],q[91];
-rx(8.446282262070188) q[6];
-rz(4.761905643923349) q[92];
-cx q[15],q[92];
-cx q[15],q[108];
-cx q[89],q[92];
-rz(4.761905643923349) q[92];
-cx q[89],q[92];
-rz(4.761905643923349) q[93];
-cx q[32],q[93];
-rx(8.446282262070188) q[93];
-rz(4.761905643923349) q[94];
-cx q[36],q[94];
-cx q[55],q[94];
-rz(4.761905643923349) q[94];
-cx q[55],q[94];
-rx(8.446282262070188) q[55];
-rz(4.761905643923349) q[95];
-cx q[5],q[95];
-cx q[5],q[106];
-cx q[27],q[95];
-rz(4.761905643923349) q[95];
-cx q[27],q[95];
-rx(8.446282262070188) q[27];
-rx(8.446282262070188) q[95];
-rz(4.761905643923349) q[96];
-cx q[56],q[96];
-rx(8.446282262070188) q[56];
-cx q[92],q[96];
-rz(4.761905643923349) q[96];
-cx q[92],q[96];
-rx(8.446282262070188) q[96];
-rz(4.761905643923349) q[97];
-cx q[7],q[97];
-cx q[7],q[104];
-rx(8.446282262070188) q[97];
-rz(4.761905643923349) q[98];
-cx q[10],q[98];
-rx(8.446282262070188) q[10];
-cx q[21],q[98];
-rz(4.761905643923349) q[98];
-cx q[21],q[98];
-rx(8.446282262070188) q[98];
-rz(4.761905643923349) q[99];
-cx q[4],q[99];
-cx q[41],q[99];
-rz(4.761905643923349) q[99];
-cx q[41],q[99];
-rx(8.446282262070188) q[41];
-rx(8.446282262070188) q[99];
-rz(4.761905643923349) q[100];
-cx q[3],q[100];
-cx q[3],q[102];
-cx q[25],q[100];
-rz(4.761905643923349) q[100];
-cx q[25],q[100];
-rx(8.446282262070188) q[25];
-rx(8.446282262070188) q[100];
-rz(4.761905643923349) q[101];
-cx q[16],q[101];
-cx q[16],q[103];
-cx q[50],q[101];
-rz(4.761905643923349) q[101];
-cx q[50],q[101];
-cx q[50],q[129];
-rx(8.446282262070188) q[101];
-rz(4.761905643923349) q[102];
-cx q[3],q[102];
-cx q[3],q[107];
-cx q[4],q[102];
-rz(4.761905643923349) q[102];
-cx q[4],q[102];
-cx q[4],q[127];
-rx(8.446282262070188) q[102];
-rz(4.761905643923349) q[103];
-cx q[16],q[103];
-rx(8.446282262070188) q[16];
-cx q[57],q[103];
-rz(4.761905643923349) q[103];
-cx q[57],q[103];
-rx(8.446282262070188) q[57];
-rx(8.446282262070188) q[103];
-rz(4.761905643923349) q[104];
-cx q[7],q[104];
-cx q[7],q[133];
-cx q[13],q[104];
-rz(4.761905643923349) q[104];
-cx q[13],q[104];
-cx q[13],q[135];
-cx q[104],q[114];
-rz(4.761905643923349) q[105];
-cx q[26],q[105];
-cx q[26],q[117];
-cx q[28],q[105];
-rz(4.761905643923349) q[105];
-cx q[28],q[105];
-cx q[28],q[116];
-rx(8.446282262070188) q[105];
-rz(4.761905643923349) q[106];
-cx q[5],q[106];
-cx q[5],q[109];
-cx q[36],q[106];
-rz(4.761905643923349) q[106];
-cx q[36],q[106];
-rx(8.446282262070188) q[106];
-rz(4.761905643923349) q[107];
-cx q[3],q[107];
-cx q[3],q[110];
-cx q[31],q[107];
-rz(4.761905643923349) q[107];
-cx q[31],q[107];
-rx(8.446282262070188) q[107];
-rz(4.761905643923349) q[108];
-cx q[15],q[108];
-cx q[15],q[115];
-cx q[31],q[108];
-rz(4.761905643923349) q[108];
-cx q[31],q[108];
-rx(8.446282262070188) q[31];
-rx(8.446282262070188) q[108];
-rz(4.761905643923349) q[109];
-cx q[5],q[109];
-cx q[5],q[118];
-cx q[39],q[109];
-rz(4.761905643923349) q[109];
-cx q[39],q[109];
-rx(8.446282262070188) q[39];
-rz(4.761905643923349) q[110];
-cx q[3],q[110];
-cx q[3],q[111];
-cx q[24],q[110];
-rz(4.761905643923349) q[110];
-cx q[24],q[110];
-cx q[24],q[137];
-rz(4.761905643923349) q[111];
-cx q[3],q[111];
-cx q[3],q[113];
-cx q[21],q[111];
-rz(4.761905643923349) q[111];
-cx q[21],q[111];
-cx q[21],q[112];
-rx(8.446282262070188) q[111];
-rz(4.761905643923349) q[112];
-cx q[21],q[112];
-rx(8.446282262070188) q[21];
-cx q[36],q[112];
-rz(4.761905643923349) q[112];
-cx q[36],q[112];
-rx(8.446282262070188) q[36];
-rx(8.446282262070188) q[112];
-rz(4.761905643923349) q[113];
-cx q[3],q[113];
-cx q[3],q[125];
-rx(8.446282262070188) q[113];
-rz(4.761905643923349) q[114];
-cx q[104],q[114];
-cx q[110],q[114];
-rz(4.761905643923349) q[114];
-cx q[110],q[114];
-rx(8.446282262070188) q[110];
-rx(8.446282262070188) q[114];
-rz(4.761905643923349) q[115];
-cx q[15],q[115];
-cx q[92],q[115];
-rz(4.761905643923349) q[115];
-cx q[92],q[115];
-rx(8.446282262070188) q[115];
-rz(4.761905643923349) q[116];
-cx q[28],q[116];
-rx(8.446282262070188) q[28];
-cx q[42],q[116];
-rz(4.761905643923349) q[116];
-cx q[42],q[116];
-rx(8.446282262070188) q[42];
-rx(8.446282262070188) q[116];
-rz(4.761905643923349) q[117];
-cx q[26],q[117];
-rx(8.446282262070188) q[26];
-cx q[32],q[117];
-rz(4.761905643923349) q[117];
-cx q[32],q[117];
-cx q[32],q[131];
-rx(8.446282262070188) q[117];
-rz(4.761905643923349) q[118];
-cx q[5],q[118];
-cx q[5],q[139];
-cx q[15],q[118];
-rz(4.761905643923349) q[118];
-cx q[15],q[118];
-rx(8.446282262070188) q[15];
-rx(8.446282262070188) q[118];
-rz(4.761905643923349) q[119];
-cx q[40],q[119];
-rx(8.446282262070188) q[40];
-cx q[69],q[119];
-rz(4.761905643923349) q[119];
-cx q[69],q[119];
-rx(8.446282262070188) q[69];
-rz(4.761905643923349) q[120];
-cx q[46],q[120];
-rx(8.446282262070188) q[46];
-cx q[94],q[120];
-rz(4.761905643923349) q[120];
-cx q[94],q[120];
-rx(8.446282262070188) q[94];
-rx(8.446282262070188) q[120];
-cx q[121],q[141];
-rz(4.761905643923349) q[122];
-cx q[63],q[122];
-rx(8.446282262070188) q[63];
-cx q[81],q[122];
-rz(4.761905643923349) q[122];
-cx q[81],q[122];
-rx(8.446282262070188) q[122];
-rz(4.761905643923349) q[123];
-cx q[52],q[123];
-rx(8.446282262070188) q[52];
-rz(4.761905643923349) q[124];
-cx q[53],q[124];
-rx(8.446282262070188) q[53];
-cx q[81],q[124];
-rz(4.761905643923349) q[124];
-cx q[81],q[124];
-rx(8.446282262070188) q[81];
-rx(8.446282262070188) q[124];
-rz(4.761905643923349) q[125];
-cx q[3],q[125];
-cx q[3],q[132];
-cx q[109],q[125];
-rz(4.761905643923349) q[125];
-cx q[109],q[125];
-rx(8.446282262070188) q[125];
-rz(4.761905643923349) q[126];
-cx q[12],q[126];
-rx(8.446282262070188) q[126];
-rz(4.761905643923349) q[127];
-cx q[4],q[127];
-rx(8.446282262070188) q[4];
-cx q[62],q[127];
-rz(4.761905643923349) q[127];
-cx q[62],q[127];
-cx q[62],q[128];
-rx(8.446282262070188) q[127];
-rz(4.761905643923349) q[128];
-cx q[62],q[128];
-rx(8.446282262070188) q[62];
-cx q[109],q[128];
-rz(4.761905643923349) q[128];
-cx q[109],q[128];
-rx(8.446282262070188) q[128];
-rz(4.761905643923349) q[129];
-cx q[50],q[129];
-rx(8.446282262070188) q[50];
-cx q[91],q[129];
-rz(4.761905643923349) q[129];
-cx q[91],q[129];
-rx(8.446282262070188) q[91];
-rx(8.446282262070188) q[129];
-rz(4.761905643923349) q[130];
-cx q[35],q[130];
-rx(8.446282262070188) q[35];
-cx q[109],q[130];
-rz(4.761905643923349) q[130];
-cx q[109],q[130];
-rx(8.446282262070188) q[109];
-rx(8.446282262070188) q[130];
-rz(4.761905643923349) q[131];
-cx q[32],q[131];
-cx q[32],q[140];
-cx q[123],q[131];
-rz(4.761905643923349) q[131];
-cx q[123],q[131];
-rx(8.446282262070188) q[123];
-rx(8.446282262070188) q[131];
-rz(4.761905643923349) q[132];
-cx q[3],q[132];
-cx q[3],q[134];
-cx q[37],q[132];
-rz(4.761905643923349) q[132];
-cx q[37],q[132];
-rx(8.446282262070188) q[37];
-rx(8.446282262070188) q[132];
-rz(4.761905643923349) q[133];
-cx q[7],q[133];
-rx(8.446282262070188) q[7];
-cx q[89],q[133];
-rz(4.761905643923349) q[133];
-cx q[89],q[133];
-rx(8.446282262070188) q[89];
-cx q[2],q[89];
-rz(2.943030947447448) q[89];
-cx q[2],q[89];
-rx(2.1053040627240933) q[2];
-rz(4.761905643923349) q[134];
-cx q[3],q[134];
-cx q[3],q[136];
-cx q[47],q[134];
-rz(4.761905643923349) q[134];
-cx q[47],q[134];
-rx(8.446282262070188) q[47];
-rx(8.446282262070188) q[134];
-rz(4.761905643923349) q[135];
-cx q[13],q[135];
-rx(8.446282262070188) q[13];
-rx(8.446282262070188) q[135];
-rz(4.761905643923349) q[136];
-cx q[3],q[136];
-rx(8.446282262070188) q[3];
-cx q[0],q[3];
-rz(2.943030947447448) q[3];
-cx q[0],q[3];
-cx q[0],q[15];
-cx q[1],q[3];
-rz(2.943030947447448) q[3];
-cx q[1],q[3];
-cx q[1],q[4];
-rz(2.943030947447448) q[4];
-cx q[1],q[4];
-cx q[3],q[4];
-rz(2.943030947447448) q[4];
-cx q[3],q[4];
-cx q[4],q[6];
-rz(2.943030947447448) q[6];
-cx q[4],q[6];
-rz(2.943030947447448) q[15];
-cx q[0],q[15];
-cx q[0],q[16];
-rz(2.943030947447448) q[16];
-cx q[0],q[16];
-cx q[92],q[136];
-rz(4.761905643923349) q[136];
-cx q[92],q[136];
-rx(8.446282262070188) q[92];
-rx(8.446282262070188) q[136];
-rz(4.761905643923349) q[137];
-cx q[24],q[137];
-rx(8.446282262070188) q[24];
-cx q[133],q[137];
-rz(4.761905643923349) q[137];
-cx q[133],q[137];
-rx(8.446282262070188) q[137];
-rz(4.761905643923349) q[138];
-cx q[60],q[138];
-rx(8.446282262070188) q[60];
-cx q[119],q[138];
-rz(4.761905643923349) q[138];
-cx q[119],q[138];
-rx(8.446282262070188) q[119];
-rx(8.446282262070188) q[138];
-rz(4.761905643923349) q[139];
-cx q[5],q[139];
-rx(8.446282262070188) q[5];
-cx q[1],q[5];
-rz(2.943030947447448) q[5];
-cx q[1],q[5];
-cx q[1],q[9];
-cx q[3],q[5];
-rz(2.943030947447448) q[5];
-cx q[3],q[5];
-cx q[3],q[7];
-cx q[5],q[6];
-rz(2.943030947447448) q[6];
-cx q[5],q[6];
-rz(2.943030947447448) q[7];
-cx q[3],q[7];
-cx q[3],q[8];
-cx q[4],q[7];
-rz(2.943030947447448) q[7];
-cx q[4],q[7];
-cx q[4],q[10];
-rz(2.943030947447448) q[8];
-cx q[3],q[8];
-cx q[5],q[8];
-rz(2.943030947447448) q[8];
-cx q[5],q[8];
-cx q[5],q[11];
-cx q[8],q[83];
-rz(2.943030947447448) q[9];
-cx q[1],q[9];
-cx q[1],q[17];
-cx q[3],q[9];
-rz(2.943030947447448) q[9];
-cx q[3],q[9];
-rz(2.943030947447448) q[10];
-cx q[4],q[10];
-cx q[4],q[13];
-cx q[6],q[10];
-rz(2.943030947447448) q[10];
-cx q[6],q[10];
-cx q[10],q[37];
-rz(2.943030947447448) q[11];
-cx q[5],q[11];
-cx q[6],q[11];
-rz(2.943030947447448) q[11];
-cx q[6],q[11];
-rx(2.1053040627240933) q[11];
-rz(2.943030947447448) q[13];
-cx q[4],q[13];
-rz(2.943030947447448) q[17];
-cx q[1],q[17];
-cx q[1],q[28];
-rz(2.943030947447448) q[28];
-cx q[1],q[28];
-cx q[1],q[29];
-rz(2.943030947447448) q[29];
-cx q[1],q[29];
-cx q[1],q[45];
-rz(2.943030947447448) q[37];
-cx q[10],q[37];
-cx q[10],q[41];
-rz(2.943030947447448) q[41];
-cx q[10],q[41];
-rz(2.943030947447448) q[45];
-cx q[1],q[45];
-cx q[1],q[57];
-rz(2.943030947447448) q[57];
-cx q[1],q[57];
-cx q[1],q[60];
-rz(2.943030947447448) q[60];
-cx q[1],q[60];
-cx q[1],q[97];
-rz(2.943030947447448) q[83];
-cx q[8],q[83];
-rx(2.1053040627240933) q[8];
-rz(2.943030947447448) q[97];
-cx q[1],q[97];
-cx q[1],q[113];
-rz(2.943030947447448) q[113];
-cx q[1],q[113];
-rx(2.1053040627240933) q[1];
-cx q[133],q[139];
-rz(4.761905643923349) q[139];
-cx q[133],q[139];
-rx(8.446282262070188) q[133];
-rx(8.446282262070188) q[139];
-rz(4.761905643923349) q[140];
-cx q[32],q[140];
-rx(8.446282262070188) q[32];
-rx(8.446282262070188) q[140];
-rz(1.5665901801431257) q[141];
-cx q[121],q[141];
-rx(7.158176262199965) q[121];
-cx q[20],q[121];
-rz(4.761905643923349) q[121];
-cx q[20],q[121];
-rx(8.446282262070188) q[20];
-cx q[0],q[20];
-rz(2.943030947447448) q[20];
-cx q[0],q[20];
-cx q[0],q[32];
-rz(2.943030947447448) q[32];
-cx q[0],q[32];
-cx q[0],q[42];
-rz(2.943030947447448) q[42];
-cx q[0],q[42];
-cx q[0],q[48];
-rz(2.943030947447448) q[48];
-cx q[0],q[48];
-cx q[0],q[51];
-rz(2.943030947447448) q[51];
-cx q[0],q[51];
-cx q[0],q[62];
-rz(2.943030947447448) q[62];
-cx q[0],q[62];
-cx q[0],q[64];
-rz(2.943030947447448) q[64];
-cx q[0],q[64];
-cx q[0],q[75];
-rz(2.943030947447448) q[75];
-cx q[0],q[75];
-cx q[0],q[82];
-rz(2.943030947447448) q[82];
-cx q[0],q[82];
-cx q[0],q[91];
-rz(2.943030947447448) q[91];
-cx q[0],q[91];
-cx q[0],q[93];
-rz(2.943030947447448) q[93];
-cx q[0],q[93];
-cx q[0],q[123];
-cx q[104],q[121];
-rz(4.761905643923349) q[121];
-cx q[104],q[121];
-rx(8.446282262070188) q[104];
-rz(2.943030947447448) q[123];
-cx q[0],q[123];
-cx q[0],q[126];
-rz(2.943030947447448) q[126];
-cx q[0],q[126];
-cx q[0],q[135];
-rz(2.943030947447448) q[135];
-cx q[0],q[135];
-cx q[0],q[140];
-rz(2.943030947447448) q[140];
-cx q[0],q[140];
-rx(2.1053040627240933) q[0];
-rx(7.158176262199965) q[141];
-cx q[12],q[141];
-rz(4.761905643923349) q[141];
-cx q[12],q[141];
-rx(8.446282262070188) q[12];
-cx q[3],q[12];
-rz(2.943030947447448) q[12];
-cx q[3],q[12];
-cx q[3],q[14];
-cx q[5],q[12];
-rz(2.943030947447448) q[12];
-cx q[5],q[12];
-cx q[5],q[13];
-rz(2.943030947447448) q[13];
-cx q[5],q[13];
-rz(2.943030947447448) q[14];
-cx q[3],q[14];
-cx q[3],q[15];
-cx q[4],q[14];
-rz(2.943030947447448) q[14];
-cx q[4],q[14];
-rx(2.1053040627240933) q[14];
-rz(2.943030947447448) q[15];
-cx q[3],q[15];
-cx q[3],q[16];
-cx q[15],q[20];
-rz(2.943030947447448) q[16];
-cx q[3],q[16];
-cx q[3],q[17];
-cx q[16],q[45];
-rz(2.943030947447448) q[17];
-cx q[3],q[17];
-cx q[3],q[18];
-rz(2.943030947447448) q[18];
-cx q[3],q[18];
-cx q[3],q[19];
-cx q[4],q[18];
-rz(2.943030947447448) q[18];
-cx q[4],q[18];
-cx q[4],q[21];
-rz(2.943030947447448) q[19];
-cx q[3],q[19];
-cx q[3],q[22];
-cx q[7],q[19];
-rz(2.943030947447448) q[19];
-cx q[7],q[19];
-cx q[7],q[60];
-cx q[19],q[38];
-rz(2.943030947447448) q[20];
-cx q[15],q[20];
-rz(2.943030947447448) q[21];
-cx q[4],q[21];
-cx q[4],q[27];
-cx q[15],q[21];
-rz(2.943030947447448) q[21];
-cx q[15],q[21];
-cx q[15],q[36];
-rz(2.943030947447448) q[22];
-cx q[3],q[22];
-cx q[3],q[23];
-cx q[9],q[22];
-rz(2.943030947447448) q[22];
-cx q[9],q[22];
-cx q[9],q[55];
-rx(2.1053040627240933) q[22];
-rz(2.943030947447448) q[23];
-cx q[3],q[23];
-cx q[3],q[24];
-cx q[17],q[23];
-rz(2.943030947447448) q[23];
-cx q[17],q[23];
-rz(2.943030947447448) q[24];
-cx q[3],q[24];
-cx q[3],q[25];
-cx q[5],q[24];
-rz(2.943030947447448) q[24];
-cx q[5],q[24];
-cx q[5],q[33];
-cx q[24],q[54];
-rz(2.943030947447448) q[25];
-cx q[3],q[25];
-cx q[3],q[26];
-cx q[12],q[25];
-rz(2.943030947447448) q[25];
-cx q[12],q[25];
-cx q[12],q[31];
-rz(2.943030947447448) q[26];
-cx q[3],q[26];
-cx q[3],q[28];
-cx q[21],q[26];
-rz(2.943030947447448) q[26];
-cx q[21],q[26];
-cx q[21],q[32];
-rz(2.943030947447448) q[27];
-cx q[4],q[27];
-cx q[4],q[47];
-cx q[6],q[27];
-rz(2.943030947447448) q[27];
-cx q[6],q[27];
-cx q[6],q[69];
-cx q[27],q[41];
-rz(2.943030947447448) q[28];
-cx q[3],q[28];
-cx q[3],q[29];
-cx q[28],q[51];
-rz(2.943030947447448) q[29];
-cx q[3],q[29];
-cx q[3],q[30];
-rx(2.1053040627240933) q[29];
-rz(2.943030947447448) q[30];
-cx q[3],q[30];
-cx q[3],q[34];
-cx q[18],q[30];
-rz(2.943030947447448) q[30];
-cx q[18],q[30];
-rx(2.1053040627240933) q[18];
-rz(2.943030947447448) q[31];
-cx q[12],q[31];
-cx q[26],q[31];
-rz(2.943030947447448) q[31];
-cx q[26],q[31];
-cx q[26],q[105];
-rz(2.943030947447448) q[32];
-cx q[21],q[32];
-rz(2.943030947447448) q[33];
-cx q[5],q[33];
-cx q[5],q[46];
-cx q[30],q[33];
-rz(2.943030947447448) q[33];
-cx q[30],q[33];
-cx q[30],q[48];
-rx(2.1053040627240933) q[33];
-rz(2.943030947447448) q[34];
-cx q[3],q[34];
-cx q[3],q[35];
-cx q[12],q[34];
-rz(2.943030947447448) q[34];
-cx q[12],q[34];
-cx q[34],q[37];
-rz(2.943030947447448) q[35];
-cx q[3],q[35];
-cx q[3],q[39];
-cx q[32],q[35];
-rz(2.943030947447448) q[35];
-cx q[32],q[35];
-cx q[35],q[130];
-rz(2.943030947447448) q[36];
-cx q[15],q[36];
-cx q[20],q[36];
-rz(2.943030947447448) q[36];
-cx q[20],q[36];
-cx q[36],q[94];
-rz(2.943030947447448) q[37];
-cx q[34],q[37];
-rx(2.1053040627240933) q[34];
-cx q[37],q[85];
-rz(2.943030947447448) q[38];
-cx q[19],q[38];
-rx(2.1053040627240933) q[19];
-cx q[21],q[38];
-rz(2.943030947447448) q[38];
-cx q[21],q[38];
-rz(2.943030947447448) q[39];
-cx q[3],q[39];
-cx q[3],q[40];
-cx q[13],q[39];
-rz(2.943030947447448) q[39];
-cx q[13],q[39];
-cx q[13],q[56];
-rz(2.943030947447448) q[40];
-cx q[3],q[40];
-cx q[3],q[42];
-cx q[23],q[40];
-rz(2.943030947447448) q[40];
-cx q[23],q[40];
-cx q[40],q[119];
-rz(2.943030947447448) q[41];
-cx q[27],q[41];
-cx q[27],q[72];
-cx q[41],q[67];
-rz(2.943030947447448) q[42];
-cx q[3],q[42];
-cx q[3],q[43];
-cx q[42],q[78];
-rz(2.943030947447448) q[43];
-cx q[3],q[43];
-cx q[3],q[44];
-cx q[20],q[43];
-rz(2.943030947447448) q[43];
-cx q[20],q[43];
-rx(2.1053040627240933) q[43];
-rz(2.943030947447448) q[44];
-cx q[3],q[44];
-cx q[3],q[49];
-cx q[12],q[44];
-rz(2.943030947447448) q[44];
-cx q[12],q[44];
-rz(2.943030947447448) q[45];
-cx q[16],q[45];
-cx q[16],q[59];
-rz(2.943030947447448) q[46];
-cx q[5],q[46];
-cx q[5],q[65];
-cx q[38],q[46];
-rz(2.943030947447448) q[46];
-cx q[38],q[46];
-rx(2.1053040627240933) q[38];
-cx q[46],q[120];
-rz(2.943030947447448) q[47];
-cx q[4],q[47];
-cx q[17],q[47];
-rz(2.943030947447448) q[47];
-cx q[17],q[47];
-cx q[17],q[53];
-rz(2.943030947447448) q[48];
-cx q[30],q[48];
-rx(2.1053040627240933) q[48];
-rz(2.943030947447448) q[49];
-cx q[3],q[49];
-cx q[3],q[50];
-cx q[4],q[49];
-rz(2.943030947447448) q[49];
-cx q[4],q[49];
-cx q[4],q[61];
-rx(2.1053040627240933) q[49];
-rz(2.943030947447448) q[50];
-cx q[3],q[50];
-cx q[3],q[52];
-cx q[12],q[50];
-rz(2.943030947447448) q[50];
-cx q[12],q[50];
-cx q[12],q[63];
-rz(2.943030947447448) q[51];
-cx q[28],q[51];
-rx(2.1053040627240933) q[51];
-rz(2.943030947447448) q[52];
-cx q[3],q[52];
-cx q[3],q[57];
-cx q[10],q[52];
-rz(2.943030947447448) q[52];
-cx q[10],q[52];
-cx q[10],q[64];
-cx q[52],q[123];
-rz(2.943030947447448) q[53];
-cx q[17],q[53];
-cx q[17],q[62];
-cx q[21],q[53];
-rz(2.943030947447448) q[53];
-cx q[21],q[53];
-cx q[21],q[75];
-rz(2.943030947447448) q[54];
-cx q[24],q[54];
-cx q[24],q[58];
-cx q[28],q[54];
-rz(2.943030947447448) q[54];
-cx q[28],q[54];
-rx(2.1053040627240933) q[54];
-rz(2.943030947447448) q[55];
-cx q[9],q[55];
-cx q[9],q[80];
-cx q[15],q[55];
-rz(2.943030947447448) q[55];
-cx q[15],q[55];
-rz(2.943030947447448) q[56];
-cx q[13],q[56];
-cx q[13],q[68];
-cx q[45],q[56];
-rz(2.943030947447448) q[56];
-cx q[45],q[56];
-rx(2.1053040627240933) q[45];
-rz(2.943030947447448) q[57];
-cx q[3],q[57];
-cx q[3],q[70];
-rz(2.943030947447448) q[58];
-cx q[24],q[58];
-cx q[24],q[86];
-cx q[28],q[58];
-rz(2.943030947447448) q[58];
-cx q[28],q[58];
-cx q[28],q[87];
-rx(2.1053040627240933) q[58];
-rz(2.943030947447448) q[59];
-cx q[16],q[59];
-cx q[16],q[73];
-cx q[32],q[59];
-rz(2.943030947447448) q[59];
-cx q[32],q[59];
-rz(2.943030947447448) q[60];
-cx q[7],q[60];
-rz(2.943030947447448) q[61];
-cx q[4],q[61];
-cx q[4],q[99];
-cx q[7],q[61];
-rz(2.943030947447448) q[61];
-cx q[7],q[61];
-cx q[7],q[97];
-rx(2.1053040627240933) q[61];
-rz(2.943030947447448) q[62];
-cx q[17],q[62];
-rz(2.943030947447448) q[63];
-cx q[12],q[63];
-cx q[12],q[126];
-cx q[17],q[63];
-rz(2.943030947447448) q[63];
-cx q[17],q[63];
-cx q[17],q[66];
-rz(2.943030947447448) q[64];
-cx q[10],q[64];
-cx q[10],q[98];
-rx(2.1053040627240933) q[64];
-rz(2.943030947447448) q[65];
-cx q[5],q[65];
-cx q[5],q[76];
-cx q[23],q[65];
-rz(2.943030947447448) q[65];
-cx q[23],q[65];
-rx(2.1053040627240933) q[23];
-rx(2.1053040627240933) q[65];
-rz(2.943030947447448) q[66];
-cx q[17],q[66];
-rx(2.1053040627240933) q[17];
-cx q[47],q[66];
-rz(2.943030947447448) q[66];
-cx q[47],q[66];
-rx(2.1053040627240933) q[66];
-rz(2.943030947447448) q[67];
-cx q[41],q[67];
-cx q[56],q[67];
-rz(2.943030947447448) q[67];
-cx q[56],q[67];
-cx q[56],q[74];
-rx(2.1053040627240933) q[67];
-rz(2.943030947447448) q[68];
-cx q[13],q[68];
-cx q[32],q[68];
-rz(2.943030947447448) q[68];
-cx q[32],q[68];
-cx q[68],q[83];
-rz(2.943030947447448) q[69];
-cx q[6],q[69];
-cx q[59],q[69];
-rz(2.943030947447448) q[69];
-cx q[59],q[69];
-rz(2.943030947447448) q[70];
-cx q[3],q[70];
-cx q[3],q[71];
-cx q[15],q[70];
-rz(2.943030947447448) q[70];
-cx q[15],q[70];
-cx q[70],q[84];
-rz(2.943030947447448) q[71];
-cx q[3],q[71];
-cx q[3],q[77];
-cx q[53],q[71];
-rz(2.943030947447448) q[71];
-cx q[53],q[71];
-rx(2.1053040627240933) q[71];
-rz(2.943030947447448) q[72];
-cx q[27],q[72];
-cx q[44],q[72];
-rz(2.943030947447448) q[72];
-cx q[44],q[72];
-rx(2.1053040627240933) q[44];
-rx(2.1053040627240933) q[72];
-rz(2.943030947447448) q[73];
-cx q[16],q[73];
-cx q[16],q[101];
-cx q[59],q[73];
-rz(2.943030947447448) q[73];
-cx q[59],q[73];
-rz(2.943030947447448) q[74];
-cx q[56],q[74];
-cx q[56],q[82];
-cx q[63],q[74];
-rz(2.943030947447448) q[74];
-cx q[63],q[74];
-cx q[63],q[122];
-rx(2.1053040627240933) q[74];
-rz(2.943030947447448) q[75];
-cx q[21],q[75];
-cx q[21],q[81];
-rx(2.1053040627240933) q[75];
-rz(2.943030947447448) q[76];
-cx q[5],q[76];
-cx q[5],q[89];
-cx q[6],q[76];
-rz(2.943030947447448) q[76];
-cx q[6],q[76];
-cx q[6],q[79];
-rx(2.1053040627240933) q[76];
-rz(2.943030947447448) q[77];
-cx q[3],q[77];
-cx q[3],q[88];
-cx q[30],q[77];
-rz(2.943030947447448) q[77];
-cx q[30],q[77];
-rx(2.1053040627240933) q[30];
-rz(2.943030947447448) q[78];
-cx q[42],q[78];
-cx q[60],q[78];
-rz(2.943030947447448) q[78];
-cx q[60],q[78];
-rx(2.1053040627240933) q[78];
-rz(2.943030947447448) q[79];
-cx q[6],q[79];
-cx q[6],q[91];
-cx q[50],q[79];
-rz(2.943030947447448) q[79];
-cx q[50],q[79];
-rx(2.1053040627240933) q[79];
-rz(2.943030947447448) q[80];
-cx q[9],q[80];
-rx(2.1053040627240933) q[9];
-cx q[15],q[80];
-rz(2.943030947447448) q[80];
-cx q[15],q[80];
-cx q[15],q[90];
-rx(2.1053040627240933) q[80];
-rz(2.943030947447448) q[81];
-cx q[21],q[81];
-cx q[77],q[81];
-rz(2.943030947447448) q[81];
-cx q[77],q[81];
-rx(2.1053040627240933) q[77];
-rz(2.943030947447448) q[82];
-cx q[56],q[82];
-cx q[56],q[96];
-rx(2.1053040627240933) q[82];
-rz(2.943030947447448) q[83];
-cx q[68],q[83];
-rx(2.1053040627240933) q[68];
-rx(2.1053040627240933) q[83];
-rz(2.943030947447448) q[84];
-cx q[70],q[84];
-rx(2.1053040627240933) q[70];
-cx q[73],q[84];
-rz(2.943030947447448) q[84];
-cx q[73],q[84];
-rx(2.1053040627240933) q[73];
-rx(2.1053040627240933) q[84];
-rz(2.943030947447448) q[85];
-cx q[37],q[85];
-cx q[59],q[85];
-rz(2.943030947447448) q[85];
-cx q[59],q[85];
-rx(2.1053040627240933) q[59];
-rx(2.1053040627240933) q[85];
-rz(2.943030947447448) q[86];
-cx q[24],q[86];
-cx q[53],q[86];
-rz(2.943030947447448) q[86];
-cx q[53],q[86];
-cx q[53],q[124];
-rx(2.1053040627240933) q[86];
-rz(2.943030947447448) q[87];
-cx q[28],q[87];
-cx q[32],q[87];
-rz(2.943030947447448) q[87];
-cx q[32],q[87];
-cx q[32],q[93];
-rx(2.1053040627240933) q[87];
-rz(2.943030947447448) q[88];
-cx q[3],q[88];
-cx q[3],q[100];
-cx q[60],q[88];
-rz(2.943030947447448) q[88];
-cx q[60],q[88];
-cx q[60],q[138];
-rx(2.1053040627240933) q[88];
-rz(2.943030947447448) q[89];
-cx q[5],q[89];
-cx q[5],q[95];
-rz(2.943030947447448) q[90];
-cx q[15],q[90];
-cx q[15],q[92];
-cx q[27],q[90];
-rz(2.943030947447448) q[90];
-cx q[27],q[90];
-rx(2.1053040627240933) q[90];
-rz(2.943030947447448) q[91];
-cx q[6],q[91];
-rx(2.1053040627240933) q[6];
-rz(2.943030947447448) q[92];
-cx q[15],q[92];
-cx q[15],q[108];
-cx q[89],q[92];
-rz(2.943030947447448) q[92];
-cx q[89],q[92];
-rz(2.943030947447448) q[93];
-cx q[32],q[93];
-rx(2.1053040627240933) q[93];
-rz(2.943030947447448) q[94];
-cx q[36],q[94];
-cx q[55],q[94];
-rz(2.943030947447448) q[94];
-cx q[55],q[94];
-rx(2.1053040627240933) q[55];
-rz(2.943030947447448) q[95];
-cx q[5],q[95];
-cx q[5],q[106];
-cx q[27],q[95];
-rz(2.943030947447448) q[95];
-cx q[27],q[95];
-rx(2.1053040627240933) q[27];
-rx(2.1053040627240933) q[95];
-rz(2.943030947447448) q[96];
-cx q[56],q[96];
-rx(2.1053040627240933) q[56];
-cx q[92],q[96];
-rz(2.943030947447448) q[96];
-cx q[92],q[96];
-rx(2.1053040627240933) q[96];
-rz(2.943030947447448) q[97];
-cx q[7],q[97];
-cx q[7],q[104];
-rx(2.1053040627240933) q[97];
-rz(2.943030947447448) q[98];
-cx q[10],q[98];
-rx(2.1053040627240933) q[10];
-cx q[21],q[98];
-rz(2.943030947447448) q[98];
-cx q[21],q[98];
-rx(2.1053040627240933) q[98];
-rz(2.943030947447448) q[99];
-cx q[4],q[99];
-cx q[41],q[99];
-rz(2.943030947447448) q[99];
-cx q[41],q[99];
-rx(2.1053040627240933) q[41];
-rx(2.1053040627240933) q[99];
-rz(2.943030947447448) q[100];
-cx q[3],q[100];
-cx q[3],q[102];
-cx q[25],q[100];
-rz(2.943030947447448) q[100];
-cx q[25],q[100];
-rx(2.1053040627240933) q[25];
-rx(2.1053040627240933) q[100];
-rz(2.943030947447448) q[101];
-cx q[16],q[101];
-cx q[16],q[103];
-cx q[50],q[101];
-rz(2.943030947447448) q[101];
-cx q[50],q[101];
-cx q[50],q[129];
-rx(2.1053040627240933) q[101];
-rz(2.943030947447448) q[102];
-cx q[3],q[102];
-cx q[3],q[107];
-cx q[4],q[102];
-rz(2.943030947447448) q[102];
-cx q[4],q[102];
-cx q[4],q[127];
-rx(2.1053040627240933) q[102];
-rz(2.943030947447448) q[103];
-cx q[16],q[103];
-rx(2.1053040627240933) q[16];
-cx q[57],q[103];
-rz(2.943030947447448) q[103];
-cx q[57],q[103];
-rx(2.1053040627240933) q[57];
-rx(2.1053040627240933) q[103];
-rz(2.943030947447448) q[104];
-cx q[7],q[104];
-cx q[7],q[133];
-cx q[13],q[104];
-rz(2.943030947447448) q[104];
-cx q[13],q[104];
-cx q[13],q[135];
-cx q[104],q[114];
-rz(2.943030947447448) q[105];
-cx q[26],q[105];
-cx q[26],q[117];
-cx q[28],q[105];
-rz(2.943030947447448) q[105];
-cx q[28],q[105];
-cx q[28],q[116];
-rx(2.1053040627240933) q[105];
-rz(2.943030947447448) q[106];
-cx q[5],q[106];
-cx q[5],q[109];
-cx q[36],q[106];
-rz(2.943030947447448) q[106];
-cx q[36],q[106];
-rx(2.1053040627240933) q[106];
-rz(2.943030947447448) q[107];
-cx q[3],q[107];
-cx q[3],q[110];
-cx q[31],q[107];
-rz(2.943030947447448) q[107];
-cx q[31],q[107];
-rx(2.1053040627240933) q[107];
-rz(2.943030947447448) q[108];
-cx q[15],q[108];
-cx q[15],q[115];
-cx q[31],q[108];
-rz(2.943030947447448) q[108];
-cx q[31],q[108];
-rx(2.1053040627240933) q[31];
-rx(2.1053040627240933) q[108];
-rz(2.943030947447448) q[109];
-cx q[5],q[109];
-cx q[5],q[118];
-cx q[39],q[109];
-rz(2.943030947447448) q[109];
-cx q[39],q[109];
-rx(2.1053040627240933) q[39];
-rz(2.943030947447448) q[110];
-cx q[3],q[110];
-cx q[3],q[111];
-cx q[24],q[110];
-rz(2.943030947447448) q[110];
-cx q[24],q[110];
-cx q[24],q[137];
-rz(2.943030947447448) q[111];
-cx q[3],q[111];
-cx q[3],q[113];
-cx q[21],q[111];
-rz(2.943030947447448) q[111];
-cx q[21],q[111];
-cx q[21],q[112];
-rx(2.1053040627240933) q[111];
-rz(2.943030947447448) q[112];
-cx q[21],q[112];
-rx(2.1053040627240933) q[21];
-cx q[36],q[112];
-rz(2.943030947447448) q[112];
-cx q[36],q[112];
-rx(2.1053040627240933) q[36];
-rx(2.1053040627240933) q[112];
-rz(2.943030947447448) q[113];
-cx q[3],q[113];
-cx q[3],q[125];
-rx(2.1053040627240933) q[113];
-rz(2.943030947447448) q[114];
-cx q[104],q[114];
-cx q[110],q[114];
-rz(2.943030947447448) q[114];
-cx q[110],q[114];
-rx(2.1053040627240933) q[110];
-rx(2.1053040627240933) q[114];
-rz(2.943030947447448) q[115];
-cx q[15],q[115];
-cx q[92],q[115];
-rz(2.943030947447448) q[115];
-cx q[92],q[115];
-rx(2.1053040627240933) q[115];
-rz(2.943030947447448) q[116];
-cx q[28],q[116];
-rx(2.1053040627240933) q[28];
-cx q[42],q[116];
-rz(2.943030947447448) q[116];
-cx q[42],q[116];
-rx(2.1053040627240933) q[42];
-rx(2.1053040627240933) q[116];
-rz(2.943030947447448) q[117];
-cx q[26],q[117];
-rx(2.1053040627240933) q[26];
-cx q[32],q[117];
-rz(2.943030947447448) q[117];
-cx q[32],q[117];
-cx q[32],q[131];
-rx(2.1053040627240933) q[117];
-rz(2.943030947447448) q[118];
-cx q[5],q[118];
-cx q[5],q[139];
-cx q[15],q[118];
-rz(2.943030947447448) q[118];
-cx q[15],q[118];
-rx(2.1053040627240933) q[15];
-rx(2.1053040627240933) q[118];
-rz(2.943030947447448) q[119];
-cx q[40],q[119];
-rx(2.1053040627240933) q[40];
-cx q[69],q[119];
-rz(2.943030947447448) q[119];
-cx q[69],q[119];
-rx(2.1053040627240933) q[69];
-rz(2.943030947447448) q[120];
-cx q[46],q[120];
-rx(2.1053040627240933) q[46];
-cx q[94],q[120];
-rz(2.943030947447448) q[120];
-cx q[94],q[120];
-rx(2.1053040627240933) q[94];
-rx(2.1053040627240933) q[120];
-cx q[121],q[141];
-rz(2.943030947447448) q[122];
-cx q[63],q[122];
-rx(2.1053040627240933) q[63];
-cx q[81],q[122];
-rz(2.943030947447448) q[122];
-cx q[81],q[122];
-rx(2.1053040627240933) q[122];
-rz(2.943030947447448) q[123];
-cx q[52],q[123];
-rx(2.1053040627240933) q[52];
-rz(2.943030947447448) q[124];
-cx q[53],q[124];
-rx(2.1053040627240933) q[53];
-cx q[81],q[124];
-rz(2.943030947447448) q[124];
-cx q[81],q[124];
-rx(2.1053040627240933) q[81];
-rx(2.1053040627240933) q[124];
-rz(2.943030947447448) q[125];
-cx q[3],q[125];
-cx q[3],q[132];
-cx q[109],q[125];
-rz(2.943030947447448) q[125];
-cx q[109],q[125];
-rx(2.1053040627240933) q[125];
-rz(2.943030947447448) q[126];
-cx q[12],q[126];
-rx(2.1053040627240933) q[126];
-rz(2.943030947447448) q[127];
-cx q[4],q[127];
-rx(2.1053040627240933) q[4];
-cx q[62],q[127];
-rz(2.943030947447448) q[127];
-cx q[62],q[127];
-cx q[62],q[128];
-rx(2.1053040627240933) q[127];
-rz(2.943030947447448) q[128];
-cx q[62],q[128];
-rx(2.1053040627240933) q[62];
-cx q[109],q[128];
-rz(2.943030947447448) q[128];
-cx q[109],q[128];
-rx(2.1053040627240933) q[128];
-rz(2.943030947447448) q[129];
-cx q[50],q[129];
-rx(2.1053040627240933) q[50];
-cx q[91],q[129];
-rz(2.943030947447448) q[129];
-cx q[91],q[129];
-rx(2.1053040627240933) q[91];
-rx(2.1053040627240933) q[129];
-rz(2.943030947447448) q[130];
-cx q[35],q[130];
-rx(2.1053040627240933) q[35];
-cx q[109],q[130];
-rz(2.943030947447448) q[130];
-cx q[109],q[130];
-rx(2.1053040627240933) q[109];
-rx(2.1053040627240933) q[130];
-rz(2.943030947447448) q[131];
-cx q[32],q[131];
-cx q[32],q[140];
-cx q[123],q[131];
-rz(2.943030947447448) q[131];
-cx q[123],q[131];
-rx(2.1053040627240933) q[123];
-rx(2.1053040627240933) q[131];
-rz(2.943030947447448) q[132];
-cx q[3],q[132];
-cx q[3],q[134];
-cx q[37],q[132];
-rz(2.943030947447448) q[132];
-cx q[37],q[132];
-rx(2.1053040627240933) q[37];
-rx(2.1053040627240933) q[132];
-rz(2.943030947447448) q[133];
-cx q[7],q[133];
-rx(2.1053040627240933) q[7];
-cx q[89],q[133];
-rz(2.943030947447448) q[133];
-cx q[89],q[133];
-rx(2.1053040627240933) q[89];
-rz(2.943030947447448) q[134];
-cx q[3],q[134];
-cx q[3],q[136];
-cx q[47],q[134];
-rz(2.943030947447448) q[134];
-cx q[47],q[134];
-rx(2.1053040627240933) q[47];
-rx(2.1053040627240933) q[134];
-rz(2.943030947447448) q[135];
-cx q[13],q[135];
-rx(2.1053040627240933) q[13];
-rx(2.1053040627240933) q[135];
-rz(2.943030947447448) q[136];
-cx q[3],q[136];
-rx(2.1053040627240933) q[3];
-cx q[92],q[136];
-rz(2.943030947447448) q[136];
-cx q[92],q[136];
-rx(2.1053040627240933) q[92];
-rx(2.1053040627240933) q[136];
-rz(2.943030947447448) q[137];
-cx q[24],q[137];
-rx(2.1053040627240933) q[24];
-cx q[133],q[137];
-rz(2.943030947447448) q[137];
-cx q[133],q[137];
-rx(2.1053040627240933) q[137];
-rz(2.943030947447448) q[138];
-cx q[60],q[138];
-rx(2.1053040627240933) q[60];
-cx q[119],q[138];
-rz(2.943030947447448) q[138];
-cx q[119],q[138];
-rx(2.1053040627240933) q[119];
-rx(2.1053040627240933) q[138];
-rz(2.943030947447448) q[139];
-cx q[5],q[139];
-rx(2.1053040627240933) q[5];
-cx q[133],q[139];
-rz(2.943030947447448) q[139];
-cx q[133],q[139];
-rx(2.1053040627240933) q[133];
-rx(2.1053040627240933) q[139];
-rz(2.943030947447448) q[140];
-cx q[32],q[140];
-rx(2.1053040627240933) q[32];
-rx(2.1053040627240933) q[140];
-rz(4.761905643923349) q[141];
-cx q[121],q[141];
-rx(8.446282262070188) q[121];
-cx q[20],q[121];
-rz(2.943030947447448) q[121];
-cx q[20],q[121];
-rx(2.1053040627240933) q[20];
-cx q[104],q[121];
-rz(2.943030947447448) q[121];
-cx q[104],q[121];
-rx(2.1053040627240933) q[104];
-rx(8.446282262070188) q[141];
-cx q[12],q[141];
-rz(2.943030947447448) q[141];
-cx q[12],q[141];
-rx(2.1053040627240933) q[12];
-cx q[121],q[141];
-rz(2.943030947447448) q[141];
-cx q[121],q[141];
-rx(2.1053040627240933) q[121];
-rx(2.1053040627240933) q[141];
\ No newline at end of file
@@ -1,3325 +0,0 @@
-OPENQASM 2.0;
-include "qelib1.inc";
-qreg q[146];
-ry(pi/2) q[0];
-rx(pi) q[0];
-ry(pi/2) q[1];
-rx(pi) q[1];
-cx q[0],q[1];
-rz(5.5354809922324595) q[1];
-cx q[0],q[1];
-ry(pi/2) q[2];
-rx(pi) q[2];
-cx q[0],q[2];
-rz(5.5354809922324595) q[2];
-cx q[0],q[2];
-ry(pi/2) q[3];
-rx(pi) q[3];
-cx q[0],q[3];
-rz(5.5354809922324595) q[3];
-cx q[0],q[3];
-cx q[1],q[3];
-rz(5.5354809922324595) q[3];
-cx q[1],q[3];
-ry(pi/2) q[4];
-rx(pi) q[4];
-cx q[1],q[4];
-rz(5.5354809922324595) q[4];
-cx q[1],q[4];
-cx q[3],q[4];
-rz(5.5354809922324595) q[4];
-cx q[3],q[4];
-ry(pi/2) q[5];
-rx(pi) q[5];
-cx q[1],q[5];
-rz(5.5354809922324595) q[5];
-cx q[1],q[5];
-cx q[3],q[5];
-rz(5.5354809922324595) q[5];
-cx q[3],q[5];
-ry(pi/2) q[6];
-rx(pi) q[6];
-cx q[4],q[6];
-rz(5.5354809922324595) q[6];
-cx q[4],q[6];
-cx q[5],q[6];
-rz(5.5354809922324595) q[6];
-cx q[5],q[6];
-ry(pi/2) q[7];
-rx(pi) q[7];
-cx q[3],q[7];
-rz(5.5354809922324595) q[7];
-cx q[3],q[7];
-cx q[4],q[7];
-rz(5.5354809922324595) q[7];
-cx q[4],q[7];
-ry(pi/2) q[8];
-rx(pi) q[8];
-cx q[3],q[8];
-rz(5.5354809922324595) q[8];
-cx q[3],q[8];
-cx q[5],q[8];
-rz(5.5354809922324595) q[8];
-cx q[5],q[8];
-ry(pi/2) q[9];
-rx(pi) q[9];
-cx q[1],q[9];
-rz(5.5354809922324595) q[9];
-cx q[1],q[9];
-cx q[3],q[9];
-rz(5.5354809922324595) q[9];
-cx q[3],q[9];
-ry(pi/2) q[10];
-rx(pi) q[10];
-cx q[4],q[10];
-rz(5.5354809922324595) q[10];
-cx q[4],q[10];
-cx q[6],q[10];
-rz(5.5354809922324595) q[10];
-cx q[6],q[10];
-ry(pi/2) q[11];
-rx(pi) q[11];
-cx q[5],q[11];
-rz(5.5354809922324595) q[11];
-cx q[5],q[11];
-cx q[6],q[11];
-rz(5.5354809922324595) q[11];
-cx q[6],q[11];
-rx(1.1354764937816721) q[11];
-ry(pi/2) q[12];
-rx(pi) q[12];
-cx q[3],q[12];
-rz(5.5354809922324595) q[12];
-cx q[3],q[12];
-cx q[5],q[12];
-rz(5.5354809922324595) q[12];
-cx q[5],q[12];
-ry(pi/2) q[13];
-rx(pi) q[13];
-cx q[4],q[13];
-rz(5.5354809922324595) q[13];
-cx q[4],q[13];
-cx q[5],q[13];
-rz(5.5354809922324595) q[13];
-cx q[5],q[13];
-ry(pi/2) q[14];
-rx(pi) q[14];
-cx q[3],q[14];
-rz(5.5354809922324595) q[14];
-cx q[3],q[14];
-cx q[4],q[14];
-rz(5.5354809922324595) q[14];
-cx q[4],q[14];
-rx(1.1354764937816721) q[14];
-ry(pi/2) q[15];
-rx(pi) q[15];
-cx q[0],q[15];
-rz(5.5354809922324595) q[15];
-cx q[0],q[15];
-cx q[3],q[15];
-rz(5.5354809922324595) q[15];
-cx q[3],q[15];
-ry(pi/2) q[16];
-rx(pi) q[16];
-cx q[0],q[16];
-rz(5.5354809922324595) q[16];
-cx q[0],q[16];
-cx q[3],q[16];
-rz(5.5354809922324595) q[16];
-cx q[3],q[16];
-ry(pi/2) q[17];
-rx(pi) q[17];
-cx q[1],q[17];
-rz(5.5354809922324595) q[17];
-cx q[1],q[17];
-cx q[3],q[17];
-rz(5.5354809922324595) q[17];
-cx q[3],q[17];
-ry(pi/2) q[18];
-rx(pi) q[18];
-cx q[3],q[18];
-rz(5.5354809922324595) q[18];
-cx q[3],q[18];
-cx q[4],q[18];
-rz(5.5354809922324595) q[18];
-cx q[4],q[18];
-ry(pi/2) q[19];
-rx(pi) q[19];
-cx q[3],q[19];
-rz(5.5354809922324595) q[19];
-cx q[3],q[19];
-cx q[7],q[19];
-rz(5.5354809922324595) q[19];
-cx q[7],q[19];
-ry(pi/2) q[20];
-rx(pi) q[20];
-cx q[0],q[20];
-rz(5.5354809922324595) q[20];
-cx q[0],q[20];
-cx q[15],q[20];
-rz(5.5354809922324595) q[20];
-cx q[15],q[20];
-ry(pi/2) q[21];
-rx(pi) q[21];
-cx q[4],q[21];
-rz(5.5354809922324595) q[21];
-cx q[4],q[21];
-cx q[15],q[21];
-rz(5.5354809922324595) q[21];
-cx q[15],q[21];
-ry(pi/2) q[22];
-rx(pi) q[22];
-cx q[3],q[22];
-rz(5.5354809922324595) q[22];
-cx q[3],q[22];
-cx q[9],q[22];
-rz(5.5354809922324595) q[22];
-cx q[9],q[22];
-rx(1.1354764937816721) q[22];
-ry(pi/2) q[23];
-rx(pi) q[23];
-cx q[3],q[23];
-rz(5.5354809922324595) q[23];
-cx q[3],q[23];
-cx q[17],q[23];
-rz(5.5354809922324595) q[23];
-cx q[17],q[23];
-ry(pi/2) q[24];
-rx(pi) q[24];
-cx q[3],q[24];
-rz(5.5354809922324595) q[24];
-cx q[3],q[24];
-cx q[5],q[24];
-rz(5.5354809922324595) q[24];
-cx q[5],q[24];
-ry(pi/2) q[25];
-rx(pi) q[25];
-cx q[3],q[25];
-rz(5.5354809922324595) q[25];
-cx q[3],q[25];
-cx q[12],q[25];
-rz(5.5354809922324595) q[25];
-cx q[12],q[25];
-ry(pi/2) q[26];
-rx(pi) q[26];
-cx q[3],q[26];
-rz(5.5354809922324595) q[26];
-cx q[3],q[26];
-cx q[21],q[26];
-rz(5.5354809922324595) q[26];
-cx q[21],q[26];
-ry(pi/2) q[27];
-rx(pi) q[27];
-cx q[4],q[27];
-rz(5.5354809922324595) q[27];
-cx q[4],q[27];
-cx q[6],q[27];
-rz(5.5354809922324595) q[27];
-cx q[6],q[27];
-ry(pi/2) q[28];
-rx(pi) q[28];
-cx q[1],q[28];
-rz(5.5354809922324595) q[28];
-cx q[1],q[28];
-cx q[3],q[28];
-rz(5.5354809922324595) q[28];
-cx q[3],q[28];
-ry(pi/2) q[29];
-rx(pi) q[29];
-cx q[1],q[29];
-rz(5.5354809922324595) q[29];
-cx q[1],q[29];
-cx q[3],q[29];
-rz(5.5354809922324595) q[29];
-cx q[3],q[29];
-rx(1.1354764937816721) q[29];
-ry(pi/2) q[30];
-rx(pi) q[30];
-cx q[3],q[30];
-rz(5.5354809922324595) q[30];
-cx q[3],q[30];
-cx q[18],q[30];
-rz(5.5354809922324595) q[30];
-cx q[18],q[30];
-rx(1.1354764937816721) q[18];
-ry(pi/2) q[31];
-rx(pi) q[31];
-cx q[12],q[31];
-rz(5.5354809922324595) q[31];
-cx q[12],q[31];
-cx q[26],q[31];
-rz(5.5354809922324595) q[31];
-cx q[26],q[31];
-ry(pi/2) q[32];
-rx(pi) q[32];
-cx q[0],q[32];
-rz(5.5354809922324595) q[32];
-cx q[0],q[32];
-cx q[21],q[32];
-rz(5.5354809922324595) q[32];
-cx q[21],q[32];
-ry(pi/2) q[33];
-rx(pi) q[33];
-cx q[5],q[33];
-rz(5.5354809922324595) q[33];
-cx q[5],q[33];
-cx q[30],q[33];
-rz(5.5354809922324595) q[33];
-cx q[30],q[33];
-rx(1.1354764937816721) q[33];
-ry(pi/2) q[34];
-rx(pi) q[34];
-cx q[3],q[34];
-rz(5.5354809922324595) q[34];
-cx q[3],q[34];
-cx q[12],q[34];
-rz(5.5354809922324595) q[34];
-cx q[12],q[34];
-ry(pi/2) q[35];
-rx(pi) q[35];
-cx q[3],q[35];
-rz(5.5354809922324595) q[35];
-cx q[3],q[35];
-cx q[32],q[35];
-rz(5.5354809922324595) q[35];
-cx q[32],q[35];
-ry(pi/2) q[36];
-rx(pi) q[36];
-cx q[15],q[36];
-rz(5.5354809922324595) q[36];
-cx q[15],q[36];
-cx q[20],q[36];
-rz(5.5354809922324595) q[36];
-cx q[20],q[36];
-ry(pi/2) q[37];
-rx(pi) q[37];
-cx q[10],q[37];
-rz(5.5354809922324595) q[37];
-cx q[10],q[37];
-cx q[34],q[37];
-rz(5.5354809922324595) q[37];
-cx q[34],q[37];
-rx(1.1354764937816721) q[34];
-ry(pi/2) q[38];
-rx(pi) q[38];
-cx q[19],q[38];
-rz(5.5354809922324595) q[38];
-cx q[19],q[38];
-rx(1.1354764937816721) q[19];
-cx q[21],q[38];
-rz(5.5354809922324595) q[38];
-cx q[21],q[38];
-ry(pi/2) q[39];
-rx(pi) q[39];
-cx q[3],q[39];
-rz(5.5354809922324595) q[39];
-cx q[3],q[39];
-cx q[13],q[39];
-rz(5.5354809922324595) q[39];
-cx q[13],q[39];
-ry(pi/2) q[40];
-rx(pi) q[40];
-cx q[3],q[40];
-rz(5.5354809922324595) q[40];
-cx q[3],q[40];
-cx q[23],q[40];
-rz(5.5354809922324595) q[40];
-cx q[23],q[40];
-ry(pi/2) q[41];
-rx(pi) q[41];
-cx q[10],q[41];
-rz(5.5354809922324595) q[41];
-cx q[10],q[41];
-cx q[27],q[41];
-rz(5.5354809922324595) q[41];
-cx q[27],q[41];
-ry(pi/2) q[42];
-rx(pi) q[42];
-cx q[0],q[42];
-rz(5.5354809922324595) q[42];
-cx q[0],q[42];
-cx q[3],q[42];
-rz(5.5354809922324595) q[42];
-cx q[3],q[42];
-ry(pi/2) q[43];
-rx(pi) q[43];
-cx q[3],q[43];
-rz(5.5354809922324595) q[43];
-cx q[3],q[43];
-cx q[20],q[43];
-rz(5.5354809922324595) q[43];
-cx q[20],q[43];
-rx(1.1354764937816721) q[43];
-ry(pi/2) q[44];
-rx(pi) q[44];
-cx q[3],q[44];
-rz(5.5354809922324595) q[44];
-cx q[3],q[44];
-cx q[12],q[44];
-rz(5.5354809922324595) q[44];
-cx q[12],q[44];
-ry(pi/2) q[45];
-rx(pi) q[45];
-cx q[1],q[45];
-rz(5.5354809922324595) q[45];
-cx q[1],q[45];
-cx q[16],q[45];
-rz(5.5354809922324595) q[45];
-cx q[16],q[45];
-ry(pi/2) q[46];
-rx(pi) q[46];
-cx q[5],q[46];
-rz(5.5354809922324595) q[46];
-cx q[5],q[46];
-cx q[38],q[46];
-rz(5.5354809922324595) q[46];
-cx q[38],q[46];
-rx(1.1354764937816721) q[38];
-ry(pi/2) q[47];
-rx(pi) q[47];
-cx q[4],q[47];
-rz(5.5354809922324595) q[47];
-cx q[4],q[47];
-cx q[17],q[47];
-rz(5.5354809922324595) q[47];
-cx q[17],q[47];
-ry(pi/2) q[48];
-rx(pi) q[48];
-cx q[0],q[48];
-rz(5.5354809922324595) q[48];
-cx q[0],q[48];
-cx q[30],q[48];
-rz(5.5354809922324595) q[48];
-cx q[30],q[48];
-rx(1.1354764937816721) q[48];
-ry(pi/2) q[49];
-rx(pi) q[49];
-cx q[3],q[49];
-rz(5.5354809922324595) q[49];
-cx q[3],q[49];
-cx q[4],q[49];
-rz(5.5354809922324595) q[49];
-cx q[4],q[49];
-rx(1.1354764937816721) q[49];
-ry(pi/2) q[50];
-rx(pi) q[50];
-cx q[3],q[50];
-rz(5.5354809922324595) q[50];
-cx q[3],q[50];
-cx q[12],q[50];
-rz(5.5354809922324595) q[50];
-cx q[12],q[50];
-ry(pi/2) q[51];
-rx(pi) q[51];
-cx q[0],q[51];
-rz(5.5354809922324595) q[51];
-cx q[0],q[51];
-cx q[28],q[51];
-rz(5.5354809922324595) q[51];
-cx q[28],q[51];
-rx(1.1354764937816721) q[51];
-ry(pi/2) q[52];
-rx(pi) q[52];
-cx q[3],q[52];
-rz(5.5354809922324595) q[52];
-cx q[3],q[52];
-cx q[10],q[52];
-rz(5.5354809922324595) q[52];
-cx q[10],q[52];
-ry(pi/2) q[53];
-rx(pi) q[53];
-cx q[17],q[53];
-rz(5.5354809922324595) q[53];
-cx q[17],q[53];
-cx q[21],q[53];
-rz(5.5354809922324595) q[53];
-cx q[21],q[53];
-ry(pi/2) q[54];
-rx(pi) q[54];
-cx q[24],q[54];
-rz(5.5354809922324595) q[54];
-cx q[24],q[54];
-cx q[28],q[54];
-rz(5.5354809922324595) q[54];
-cx q[28],q[54];
-rx(1.1354764937816721) q[54];
-ry(pi/2) q[55];
-rx(pi) q[55];
-cx q[9],q[55];
-rz(5.5354809922324595) q[55];
-cx q[9],q[55];
-cx q[15],q[55];
-rz(5.5354809922324595) q[55];
-cx q[15],q[55];
-ry(pi/2) q[56];
-rx(pi) q[56];
-cx q[13],q[56];
-rz(5.5354809922324595) q[56];
-cx q[13],q[56];
-cx q[45],q[56];
-rz(5.5354809922324595) q[56];
-cx q[45],q[56];
-rx(1.1354764937816721) q[45];
-ry(pi/2) q[57];
-rx(pi) q[57];
-cx q[1],q[57];
-rz(5.5354809922324595) q[57];
-cx q[1],q[57];
-cx q[3],q[57];
-rz(5.5354809922324595) q[57];
-cx q[3],q[57];
-ry(pi/2) q[58];
-rx(pi) q[58];
-cx q[24],q[58];
-rz(5.5354809922324595) q[58];
-cx q[24],q[58];
-cx q[28],q[58];
-rz(5.5354809922324595) q[58];
-cx q[28],q[58];
-rx(1.1354764937816721) q[58];
-ry(pi/2) q[59];
-rx(pi) q[59];
-cx q[16],q[59];
-rz(5.5354809922324595) q[59];
-cx q[16],q[59];
-cx q[32],q[59];
-rz(5.5354809922324595) q[59];
-cx q[32],q[59];
-ry(pi/2) q[60];
-rx(pi) q[60];
-cx q[1],q[60];
-rz(5.5354809922324595) q[60];
-cx q[1],q[60];
-cx q[7],q[60];
-rz(5.5354809922324595) q[60];
-cx q[7],q[60];
-ry(pi/2) q[61];
-rx(pi) q[61];
-cx q[4],q[61];
-rz(5.5354809922324595) q[61];
-cx q[4],q[61];
-cx q[7],q[61];
-rz(5.5354809922324595) q[61];
-cx q[7],q[61];
-rx(1.1354764937816721) q[61];
-ry(pi/2) q[62];
-rx(pi) q[62];
-cx q[0],q[62];
-rz(5.5354809922324595) q[62];
-cx q[0],q[62];
-cx q[17],q[62];
-rz(5.5354809922324595) q[62];
-cx q[17],q[62];
-ry(pi/2) q[63];
-rx(pi) q[63];
-cx q[12],q[63];
-rz(5.5354809922324595) q[63];
-cx q[12],q[63];
-cx q[17],q[63];
-rz(5.5354809922324595) q[63];
-cx q[17],q[63];
-ry(pi/2) q[64];
-rx(pi) q[64];
-cx q[0],q[64];
-rz(5.5354809922324595) q[64];
-cx q[0],q[64];
-cx q[10],q[64];
-rz(5.5354809922324595) q[64];
-cx q[10],q[64];
-rx(1.1354764937816721) q[64];
-ry(pi/2) q[65];
-rx(pi) q[65];
-cx q[5],q[65];
-rz(5.5354809922324595) q[65];
-cx q[5],q[65];
-cx q[23],q[65];
-rz(5.5354809922324595) q[65];
-cx q[23],q[65];
-rx(1.1354764937816721) q[23];
-rx(1.1354764937816721) q[65];
-ry(pi/2) q[66];
-rx(pi) q[66];
-cx q[17],q[66];
-rz(5.5354809922324595) q[66];
-cx q[17],q[66];
-rx(1.1354764937816721) q[17];
-cx q[47],q[66];
-rz(5.5354809922324595) q[66];
-cx q[47],q[66];
-rx(1.1354764937816721) q[66];
-ry(pi/2) q[67];
-rx(pi) q[67];
-cx q[41],q[67];
-rz(5.5354809922324595) q[67];
-cx q[41],q[67];
-cx q[56],q[67];
-rz(5.5354809922324595) q[67];
-cx q[56],q[67];
-rx(1.1354764937816721) q[67];
-ry(pi/2) q[68];
-rx(pi) q[68];
-cx q[13],q[68];
-rz(5.5354809922324595) q[68];
-cx q[13],q[68];
-cx q[32],q[68];
-rz(5.5354809922324595) q[68];
-cx q[32],q[68];
-ry(pi/2) q[69];
-rx(pi) q[69];
-cx q[6],q[69];
-rz(5.5354809922324595) q[69];
-cx q[6],q[69];
-cx q[59],q[69];
-rz(5.5354809922324595) q[69];
-cx q[59],q[69];
-ry(pi/2) q[70];
-rx(pi) q[70];
-cx q[3],q[70];
-rz(5.5354809922324595) q[70];
-cx q[3],q[70];
-cx q[15],q[70];
-rz(5.5354809922324595) q[70];
-cx q[15],q[70];
-ry(pi/2) q[71];
-rx(pi) q[71];
-cx q[3],q[71];
-rz(5.5354809922324595) q[71];
-cx q[3],q[71];
-cx q[53],q[71];
-rz(5.5354809922324595) q[71];
-cx q[53],q[71];
-rx(1.1354764937816721) q[71];
-ry(pi/2) q[72];
-rx(pi) q[72];
-cx q[27],q[72];
-rz(5.5354809922324595) q[72];
-cx q[27],q[72];
-cx q[44],q[72];
-rz(5.5354809922324595) q[72];
-cx q[44],q[72];
-rx(1.1354764937816721) q[44];
-rx(1.1354764937816721) q[72];
-ry(pi/2) q[73];
-rx(pi) q[73];
-cx q[16],q[73];
-rz(5.5354809922324595) q[73];
-cx q[16],q[73];
-cx q[59],q[73];
-rz(5.5354809922324595) q[73];
-cx q[59],q[73];
-ry(pi/2) q[74];
-rx(pi) q[74];
-cx q[56],q[74];
-rz(5.5354809922324595) q[74];
-cx q[56],q[74];
-cx q[63],q[74];
-rz(5.5354809922324595) q[74];
-cx q[63],q[74];
-rx(1.1354764937816721) q[74];
-ry(pi/2) q[75];
-rx(pi) q[75];
-cx q[0],q[75];
-rz(5.5354809922324595) q[75];
-cx q[0],q[75];
-cx q[21],q[75];
-rz(5.5354809922324595) q[75];
-cx q[21],q[75];
-rx(1.1354764937816721) q[75];
-ry(pi/2) q[76];
-rx(pi) q[76];
-cx q[5],q[76];
-rz(5.5354809922324595) q[76];
-cx q[5],q[76];
-cx q[6],q[76];
-rz(5.5354809922324595) q[76];
-cx q[6],q[76];
-rx(1.1354764937816721) q[76];
-ry(pi/2) q[77];
-rx(pi) q[77];
-cx q[3],q[77];
-rz(5.5354809922324595) q[77];
-cx q[3],q[77];
-cx q[30],q[77];
-rz(5.5354809922324595) q[77];
-cx q[30],q[77];
-rx(1.1354764937816721) q[30];
-ry(pi/2) q[78];
-rx(pi) q[78];
-cx q[42],q[78];
-rz(5.5354809922324595) q[78];
-cx q[42],q[78];
-cx q[60],q[78];
-rz(5.5354809922324595) q[78];
-cx q[60],q[78];
-rx(1.1354764937816721) q[78];
-ry(pi/2) q[79];
-rx(pi) q[79];
-cx q[6],q[79];
-rz(5.5354809922324595) q[79];
-cx q[6],q[79];
-cx q[50],q[79];
-rz(5.5354809922324595) q[79];
-cx q[50],q[79];
-rx(1.1354764937816721) q[79];
-ry(pi/2) q[80];
-rx(pi) q[80];
-cx q[9],q[80];
-rz(5.5354809922324595) q[80];
-cx q[9],q[80];
-cx q[15],q[80];
-rz(5.5354809922324595) q[80];
-cx q[15],q[80];
-rx(1.1354764937816721) q[80];
-ry(pi/2) q[81];
-rx(pi) q[81];
-cx q[21],q[81];
-rz(5.5354809922324595) q[81];
-cx q[21],q[81];
-cx q[77],q[81];
-rz(5.5354809922324595) q[81];
-cx q[77],q[81];
-rx(1.1354764937816721) q[77];
-ry(pi/2) q[82];
-rx(pi) q[82];
-cx q[0],q[82];
-rz(5.5354809922324595) q[82];
-cx q[0],q[82];
-cx q[56],q[82];
-rz(5.5354809922324595) q[82];
-cx q[56],q[82];
-rx(1.1354764937816721) q[82];
-ry(pi/2) q[83];
-rx(pi) q[83];
-cx q[8],q[83];
-rz(5.5354809922324595) q[83];
-cx q[8],q[83];
-rx(1.1354764937816721) q[8];
-cx q[68],q[83];
-rz(5.5354809922324595) q[83];
-cx q[68],q[83];
-rx(1.1354764937816721) q[68];
-rx(1.1354764937816721) q[83];
-ry(pi/2) q[84];
-rx(pi) q[84];
-cx q[70],q[84];
-rz(5.5354809922324595) q[84];
-cx q[70],q[84];
-rx(1.1354764937816721) q[70];
-cx q[73],q[84];
-rz(5.5354809922324595) q[84];
-cx q[73],q[84];
-rx(1.1354764937816721) q[73];
-rx(1.1354764937816721) q[84];
-ry(pi/2) q[85];
-rx(pi) q[85];
-cx q[37],q[85];
-rz(5.5354809922324595) q[85];
-cx q[37],q[85];
-cx q[59],q[85];
-rz(5.5354809922324595) q[85];
-cx q[59],q[85];
-rx(1.1354764937816721) q[85];
-ry(pi/2) q[86];
-rx(pi) q[86];
-cx q[24],q[86];
-rz(5.5354809922324595) q[86];
-cx q[24],q[86];
-cx q[53],q[86];
-rz(5.5354809922324595) q[86];
-cx q[53],q[86];
-rx(1.1354764937816721) q[86];
-ry(pi/2) q[87];
-rx(pi) q[87];
-cx q[28],q[87];
-rz(5.5354809922324595) q[87];
-cx q[28],q[87];
-cx q[32],q[87];
-rz(5.5354809922324595) q[87];
-cx q[32],q[87];
-rx(1.1354764937816721) q[87];
-ry(pi/2) q[88];
-rx(pi) q[88];
-cx q[3],q[88];
-rz(5.5354809922324595) q[88];
-cx q[3],q[88];
-cx q[60],q[88];
-rz(5.5354809922324595) q[88];
-cx q[60],q[88];
-rx(1.1354764937816721) q[88];
-ry(pi/2) q[89];
-rx(pi) q[89];
-cx q[2],q[89];
-rz(5.5354809922324595) q[89];
-cx q[2],q[89];
-rx(1.1354764937816721) q[2];
-cx q[5],q[89];
-rz(5.5354809922324595) q[89];
-cx q[5],q[89];
-ry(pi/2) q[90];
-rx(pi) q[90];
-cx q[15],q[90];
-rz(5.5354809922324595) q[90];
-cx q[15],q[90];
-cx q[27],q[90];
-rz(5.5354809922324595) q[90];
-cx q[27],q[90];
-rx(1.1354764937816721) q[90];
-ry(pi/2) q[91];
-rx(pi) q[91];
-cx q[0],q[91];
-rz(5.5354809922324595) q[91];
-cx q[0],q[91];
-cx q[6],q[91];
-rz(5.5354809922324595) q[91];
-cx q[6],q[91];
-rx(1.1354764937816721) q[6];
-ry(pi/2) q[92];
-rx(pi) q[92];
-cx q[15],q[92];
-rz(5.5354809922324595) q[92];
-cx q[15],q[92];
-cx q[89],q[92];
-rz(5.5354809922324595) q[92];
-cx q[89],q[92];
-ry(pi/2) q[93];
-rx(pi) q[93];
-cx q[0],q[93];
-rz(5.5354809922324595) q[93];
-cx q[0],q[93];
-cx q[32],q[93];
-rz(5.5354809922324595) q[93];
-cx q[32],q[93];
-rx(1.1354764937816721) q[93];
-ry(pi/2) q[94];
-rx(pi) q[94];
-cx q[36],q[94];
-rz(5.5354809922324595) q[94];
-cx q[36],q[94];
-cx q[55],q[94];
-rz(5.5354809922324595) q[94];
-cx q[55],q[94];
-rx(1.1354764937816721) q[55];
-ry(pi/2) q[95];
-rx(pi) q[95];
-cx q[5],q[95];
-rz(5.5354809922324595) q[95];
-cx q[5],q[95];
-cx q[27],q[95];
-rz(5.5354809922324595) q[95];
-cx q[27],q[95];
-rx(1.1354764937816721) q[27];
-rx(1.1354764937816721) q[95];
-ry(pi/2) q[96];
-rx(pi) q[96];
-cx q[56],q[96];
-rz(5.5354809922324595) q[96];
-cx q[56],q[96];
-rx(1.1354764937816721) q[56];
-cx q[92],q[96];
-rz(5.5354809922324595) q[96];
-cx q[92],q[96];
-rx(1.1354764937816721) q[96];
-ry(pi/2) q[97];
-rx(pi) q[97];
-cx q[1],q[97];
-rz(5.5354809922324595) q[97];
-cx q[1],q[97];
-cx q[7],q[97];
-rz(5.5354809922324595) q[97];
-cx q[7],q[97];
-ry(pi/2) q[98];
-rx(pi) q[98];
-cx q[10],q[98];
-rz(5.5354809922324595) q[98];
-cx q[10],q[98];
-rx(1.1354764937816721) q[10];
-cx q[21],q[98];
-rz(5.5354809922324595) q[98];
-cx q[21],q[98];
-rx(1.1354764937816721) q[98];
-ry(pi/2) q[99];
-rx(pi) q[99];
-cx q[4],q[99];
-rz(5.5354809922324595) q[99];
-cx q[4],q[99];
-cx q[41],q[99];
-rz(5.5354809922324595) q[99];
-cx q[41],q[99];
-rx(1.1354764937816721) q[41];
-rx(1.1354764937816721) q[99];
-ry(pi/2) q[100];
-rx(pi) q[100];
-cx q[3],q[100];
-rz(5.5354809922324595) q[100];
-cx q[3],q[100];
-cx q[25],q[100];
-rz(5.5354809922324595) q[100];
-cx q[25],q[100];
-rx(1.1354764937816721) q[25];
-rx(1.1354764937816721) q[100];
-ry(pi/2) q[101];
-rx(pi) q[101];
-cx q[16],q[101];
-rz(5.5354809922324595) q[101];
-cx q[16],q[101];
-cx q[50],q[101];
-rz(5.5354809922324595) q[101];
-cx q[50],q[101];
-rx(1.1354764937816721) q[101];
-ry(pi/2) q[102];
-rx(pi) q[102];
-cx q[3],q[102];
-rz(5.5354809922324595) q[102];
-cx q[3],q[102];
-cx q[4],q[102];
-rz(5.5354809922324595) q[102];
-cx q[4],q[102];
-rx(1.1354764937816721) q[102];
-ry(pi/2) q[103];
-rx(pi) q[103];
-cx q[16],q[103];
-rz(5.5354809922324595) q[103];
-cx q[16],q[103];
-rx(1.1354764937816721) q[16];
-cx q[57],q[103];
-rz(5.5354809922324595) q[103];
-cx q[57],q[103];
-rx(1.1354764937816721) q[57];
-rx(1.1354764937816721) q[103];
-ry(pi/2) q[104];
-rx(pi) q[104];
-cx q[7],q[104];
-rz(5.5354809922324595) q[104];
-cx q[7],q[104];
-cx q[13],q[104];
-rz(5.5354809922324595) q[104];
-cx q[13],q[104];
-ry(pi/2) q[105];
-rx(pi) q[105];
-cx q[26],q[105];
-rz(5.5354809922324595) q[105];
-cx q[26],q[105];
-cx q[28],q[105];
-rz(5.5354809922324595) q[105];
-cx q[28],q[105];
-rx(1.1354764937816721) q[105];
-ry(pi/2) q[106];
-rx(pi) q[106];
-cx q[5],q[106];
-rz(5.5354809922324595) q[106];
-cx q[5],q[106];
-cx q[36],q[106];
-rz(5.5354809922324595) q[106];
-cx q[36],q[106];
-rx(1.1354764937816721) q[106];
-ry(pi/2) q[107];
-rx(pi) q[107];
-cx q[3],q[107];
-rz(5.5354809922324595) q[107];
-cx q[3],q[107];
-cx q[31],q[107];
-rz(5.5354809922324595) q[107];
-cx q[31],q[107];
-rx(1.1354764937816721) q[107];
-ry(pi/2) q[108];
-rx(pi) q[108];
-cx q[15],q[108];
-rz(5.5354809922324595) q[108];
-cx q[15],q[108];
-cx q[31],q[108];
-rz(5.5354809922324595) q[108];
-cx q[31],q[108];
-rx(1.1354764937816721) q[31];
-rx(1.1354764937816721) q[108];
-ry(pi/2) q[109];
-rx(pi) q[109];
-cx q[5],q[109];
-rz(5.5354809922324595) q[109];
-cx q[5],q[109];
-cx q[39],q[109];
-rz(5.5354809922324595) q[109];
-cx q[39],q[109];
-rx(1.1354764937816721) q[39];
-ry(pi/2) q[110];
-rx(pi) q[110];
-cx q[3],q[110];
-rz(5.5354809922324595) q[110];
-cx q[3],q[110];
-cx q[24],q[110];
-rz(5.5354809922324595) q[110];
-cx q[24],q[110];
-ry(pi/2) q[111];
-rx(pi) q[111];
-cx q[3],q[111];
-rz(5.5354809922324595) q[111];
-cx q[3],q[111];
-cx q[21],q[111];
-rz(5.5354809922324595) q[111];
-cx q[21],q[111];
-rx(1.1354764937816721) q[111];
-ry(pi/2) q[112];
-rx(pi) q[112];
-cx q[21],q[112];
-rz(5.5354809922324595) q[112];
-cx q[21],q[112];
-rx(1.1354764937816721) q[21];
-cx q[36],q[112];
-rz(5.5354809922324595) q[112];
-cx q[36],q[112];
-rx(1.1354764937816721) q[36];
-rx(1.1354764937816721) q[112];
-ry(pi/2) q[113];
-rx(pi) q[113];
-cx q[1],q[113];
-rz(5.5354809922324595) q[113];
-cx q[1],q[113];
-rx(1.1354764937816721) q[1];
-cx q[3],q[113];
-rz(5.5354809922324595) q[113];
-cx q[3],q[113];
-rx(1.1354764937816721) q[113];
-ry(pi/2) q[114];
-rx(pi) q[114];
-cx q[104],q[114];
-rz(5.5354809922324595) q[114];
-cx q[104],q[114];
-cx q[110],q[114];
-rz(5.5354809922324595) q[114];
-cx q[110],q[114];
-rx(1.1354764937816721) q[110];
-rx(1.1354764937816721) q[114];
-ry(pi/2) q[115];
-rx(pi) q[115];
-cx q[15],q[115];
-rz(5.5354809922324595) q[115];
-cx q[15],q[115];
-cx q[92],q[115];
-rz(5.5354809922324595) q[115];
-cx q[92],q[115];
-rx(1.1354764937816721) q[115];
-ry(pi/2) q[116];
-rx(pi) q[116];
-cx q[28],q[116];
-rz(5.5354809922324595) q[116];
-cx q[28],q[116];
-rx(1.1354764937816721) q[28];
-cx q[42],q[116];
-rz(5.5354809922324595) q[116];
-cx q[42],q[116];
-rx(1.1354764937816721) q[42];
-rx(1.1354764937816721) q[116];
-ry(pi/2) q[117];
-rx(pi) q[117];
-cx q[26],q[117];
-rz(5.5354809922324595) q[117];
-cx q[26],q[117];
-rx(1.1354764937816721) q[26];
-cx q[32],q[117];
-rz(5.5354809922324595) q[117];
-cx q[32],q[117];
-rx(1.1354764937816721) q[117];
-ry(pi/2) q[118];
-rx(pi) q[118];
-cx q[5],q[118];
-rz(5.5354809922324595) q[118];
-cx q[5],q[118];
-cx q[15],q[118];
-rz(5.5354809922324595) q[118];
-cx q[15],q[118];
-rx(1.1354764937816721) q[15];
-rx(1.1354764937816721) q[118];
-ry(pi/2) q[119];
-rx(pi) q[119];
-cx q[40],q[119];
-rz(5.5354809922324595) q[119];
-cx q[40],q[119];
-rx(1.1354764937816721) q[40];
-cx q[69],q[119];
-rz(5.5354809922324595) q[119];
-cx q[69],q[119];
-rx(1.1354764937816721) q[69];
-ry(pi/2) q[120];
-rx(pi) q[120];
-cx q[46],q[120];
-rz(5.5354809922324595) q[120];
-cx q[46],q[120];
-rx(1.1354764937816721) q[46];
-cx q[94],q[120];
-rz(5.5354809922324595) q[120];
-cx q[94],q[120];
-rx(1.1354764937816721) q[94];
-rx(1.1354764937816721) q[120];
-ry(pi/2) q[121];
-rx(pi) q[121];
-cx q[20],q[121];
-rz(5.5354809922324595) q[121];
-cx q[20],q[121];
-rx(1.1354764937816721) q[20];
-cx q[104],q[121];
-rz(5.5354809922324595) q[121];
-cx q[104],q[121];
-rx(1.1354764937816721) q[104];
-ry(pi/2) q[122];
-rx(pi) q[122];
-cx q[63],q[122];
-rz(5.5354809922324595) q[122];
-cx q[63],q[122];
-rx(1.1354764937816721) q[63];
-cx q[81],q[122];
-rz(5.5354809922324595) q[122];
-cx q[81],q[122];
-rx(1.1354764937816721) q[122];
-ry(pi/2) q[123];
-rx(pi) q[123];
-cx q[0],q[123];
-rz(5.5354809922324595) q[123];
-cx q[0],q[123];
-cx q[52],q[123];
-rz(5.5354809922324595) q[123];
-cx q[52],q[123];
-rx(1.1354764937816721) q[52];
-ry(pi/2) q[124];
-rx(pi) q[124];
-cx q[53],q[124];
-rz(5.5354809922324595) q[124];
-cx q[53],q[124];
-rx(1.1354764937816721) q[53];
-cx q[81],q[124];
-rz(5.5354809922324595) q[124];
-cx q[81],q[124];
-rx(1.1354764937816721) q[81];
-rx(1.1354764937816721) q[124];
-ry(pi/2) q[125];
-rx(pi) q[125];
-cx q[3],q[125];
-rz(5.5354809922324595) q[125];
-cx q[3],q[125];
-cx q[109],q[125];
-rz(5.5354809922324595) q[125];
-cx q[109],q[125];
-rx(1.1354764937816721) q[125];
-ry(pi/2) q[126];
-rx(pi) q[126];
-cx q[0],q[126];
-rz(5.5354809922324595) q[126];
-cx q[0],q[126];
-cx q[12],q[126];
-rz(5.5354809922324595) q[126];
-cx q[12],q[126];
-rx(1.1354764937816721) q[126];
-ry(pi/2) q[127];
-rx(pi) q[127];
-cx q[4],q[127];
-rz(5.5354809922324595) q[127];
-cx q[4],q[127];
-rx(1.1354764937816721) q[4];
-cx q[62],q[127];
-rz(5.5354809922324595) q[127];
-cx q[62],q[127];
-rx(1.1354764937816721) q[127];
-ry(pi/2) q[128];
-rx(pi) q[128];
-cx q[62],q[128];
-rz(5.5354809922324595) q[128];
-cx q[62],q[128];
-rx(1.1354764937816721) q[62];
-cx q[109],q[128];
-rz(5.5354809922324595) q[128];
-cx q[109],q[128];
-rx(1.1354764937816721) q[128];
-ry(pi/2) q[129];
-rx(pi) q[129];
-cx q[50],q[129];
-rz(5.5354809922324595) q[129];
-cx q[50],q[129];
-cx q[91],q[129];
-rz(5.5354809922324595) q[129];
-cx q[91],q[129];
-rx(1.1354764937816721) q[91];
-rx(1.1354764937816721) q[129];
-ry(pi/2) q[130];
-rx(pi) q[130];
-cx q[35],q[130];
-rz(5.5354809922324595) q[130];
-cx q[35],q[130];
-rx(1.1354764937816721) q[35];
-cx q[109],q[130];
-rz(5.5354809922324595) q[130];
-cx q[109],q[130];
-rx(1.1354764937816721) q[109];
-rx(1.1354764937816721) q[130];
-ry(pi/2) q[131];
-rx(pi) q[131];
-cx q[32],q[131];
-rz(5.5354809922324595) q[131];
-cx q[32],q[131];
-cx q[123],q[131];
-rz(5.5354809922324595) q[131];
-cx q[123],q[131];
-rx(1.1354764937816721) q[123];
-rx(1.1354764937816721) q[131];
-ry(pi/2) q[132];
-rx(pi) q[132];
-cx q[3],q[132];
-rz(5.5354809922324595) q[132];
-cx q[3],q[132];
-cx q[37],q[132];
-rz(5.5354809922324595) q[132];
-cx q[37],q[132];
-rx(1.1354764937816721) q[37];
-rx(1.1354764937816721) q[132];
-ry(pi/2) q[133];
-rx(pi) q[133];
-cx q[7],q[133];
-rz(5.5354809922324595) q[133];
-cx q[7],q[133];
-rx(1.1354764937816721) q[7];
-cx q[89],q[133];
-rz(5.5354809922324595) q[133];
-cx q[89],q[133];
-rx(1.1354764937816721) q[89];
-ry(pi/2) q[134];
-rx(pi) q[134];
-cx q[3],q[134];
-rz(5.5354809922324595) q[134];
-cx q[3],q[134];
-cx q[47],q[134];
-rz(5.5354809922324595) q[134];
-cx q[47],q[134];
-rx(1.1354764937816721) q[47];
-rx(1.1354764937816721) q[134];
-ry(pi/2) q[135];
-rx(pi) q[135];
-cx q[0],q[135];
-rz(5.5354809922324595) q[135];
-cx q[0],q[135];
-cx q[13],q[135];
-rz(5.5354809922324595) q[135];
-cx q[13],q[135];
-rx(1.1354764937816721) q[13];
-rx(1.1354764937816721) q[135];
-ry(pi/2) q[136];
-rx(pi) q[136];
-cx q[3],q[136];
-rz(5.5354809922324595) q[136];
-cx q[3],q[136];
-cx q[92],q[136];
-rz(5.5354809922324595) q[136];
-cx q[92],q[136];
-rx(1.1354764937816721) q[92];
-rx(1.1354764937816721) q[136];
-ry(pi/2) q[137];
-rx(pi) q[137];
-cx q[24],q[137];
-rz(5.5354809922324595) q[137];
-cx q[24],q[137];
-cx q[133],q[137];
-rz(5.5354809922324595) q[137];
-cx q[133],q[137];
-rx(1.1354764937816721) q[137];
-ry(pi/2) q[138];
-rx(pi) q[138];
-cx q[60],q[138];
-rz(5.5354809922324595) q[138];
-cx q[60],q[138];
-rx(1.1354764937816721) q[60];
-cx q[119],q[138];
-rz(5.5354809922324595) q[138];
-cx q[119],q[138];
-rx(1.1354764937816721) q[119];
-rx(1.1354764937816721) q[138];
-ry(pi/2) q[139];
-rx(pi) q[139];
-cx q[5],q[139];
-rz(5.5354809922324595) q[139];
-cx q[5],q[139];
-cx q[133],q[139];
-rz(5.5354809922324595) q[139];
-cx q[133],q[139];
-rx(1.1354764937816721) q[133];
-rx(1.1354764937816721) q[139];
-ry(pi/2) q[140];
-rx(pi) q[140];
-cx q[0],q[140];
-rz(5.5354809922324595) q[140];
-cx q[0],q[140];
-rx(1.1354764937816721) q[0];
-cx q[0],q[1];
-rz(1.0282599028820296) q[1];
-cx q[0],q[1];
-cx q[0],q[2];
-rz(1.0282599028820296) q[2];
-cx q[0],q[2];
-cx q[2],q[89];
-cx q[32],q[140];
-rz(1.0282599028820296) q[89];
-cx q[2],q[89];
-rx(11.2541027864931) q[2];
-rz(5.5354809922324595) q[140];
-cx q[32],q[140];
-rx(1.1354764937816721) q[32];
-rx(1.1354764937816721) q[140];
-ry(pi/2) q[141];
-rx(pi) q[141];
-cx q[12],q[141];
-rz(5.5354809922324595) q[141];
-cx q[12],q[141];
-cx q[121],q[141];
-rz(5.5354809922324595) q[141];
-cx q[121],q[141];
-rx(1.1354764937816721) q[121];
-rx(1.1354764937816721) q[141];
-ry(pi/2) q[142];
-rx(pi) q[142];
-cx q[5],q[142];
-rz(5.5354809922324595) q[142];
-cx q[5],q[142];
-rx(1.1354764937816721) q[5];
-cx q[24],q[142];
-rz(5.5354809922324595) q[142];
-cx q[24],q[142];
-rx(1.1354764937816721) q[24];
-rx(1.1354764937816721) q[142];
-ry(pi/2) q[143];
-rx(pi) q[143];
-cx q[12],q[143];
-rz(5.5354809922324595) q[143];
-cx q[12],q[143];
-rx(1.1354764937816721) q[12];
-cx q[50],q[143];
-rz(5.5354809922324595) q[143];
-cx q[50],q[143];
-rx(1.1354764937816721) q[50];
-rx(1.1354764937816721) q[143];
-ry(pi/2) q[144];
-rx(pi) q[144];
-cx q[9],q[144];
-rz(5.5354809922324595) q[144];
-cx q[9],q[144];
-rx(1.1354764937816721) q[9];
-cx q[59],q[144];
-rz(5.5354809922324595) q[144];
-cx q[59],q[144];
-rx(1.1354764937816721) q[59];
-rx(1.1354764937816721) q[144];
-ry(pi/2) q[145];
-rx(pi) q[145];
-cx q[3],q[145];
-rz(5.5354809922324595) q[145];
-cx q[3],q[145];
-rx(1.1354764937816721) q[3];
-cx q[0],q[3];
-rz(1.0282599028820296) q[3];
-cx q[0],q[3];
-cx q[0],q[15];
-cx q[1],q[3];
-rz(1.0282599028820296) q[3];
-cx q[1],q[3];
-cx q[1],q[4];
-rz(1.0282599028820296) q[4];
-cx q[1],q[4];
-cx q[1],q[5];
-cx q[3],q[4];
-rz(1.0282599028820296) q[4];
-cx q[3],q[4];
-cx q[4],q[6];
-rz(1.0282599028820296) q[5];
-cx q[1],q[5];
-cx q[1],q[9];
-cx q[3],q[5];
-rz(1.0282599028820296) q[5];
-cx q[3],q[5];
-cx q[3],q[7];
-rz(1.0282599028820296) q[6];
-cx q[4],q[6];
-cx q[5],q[6];
-rz(1.0282599028820296) q[6];
-cx q[5],q[6];
-rz(1.0282599028820296) q[7];
-cx q[3],q[7];
-cx q[3],q[8];
-cx q[4],q[7];
-rz(1.0282599028820296) q[7];
-cx q[4],q[7];
-cx q[4],q[10];
-rz(1.0282599028820296) q[8];
-cx q[3],q[8];
-cx q[5],q[8];
-rz(1.0282599028820296) q[8];
-cx q[5],q[8];
-cx q[5],q[11];
-cx q[8],q[83];
-rz(1.0282599028820296) q[9];
-cx q[1],q[9];
-cx q[1],q[17];
-cx q[3],q[9];
-rz(1.0282599028820296) q[9];
-cx q[3],q[9];
-cx q[3],q[12];
-rz(1.0282599028820296) q[10];
-cx q[4],q[10];
-cx q[4],q[13];
-cx q[6],q[10];
-rz(1.0282599028820296) q[10];
-cx q[6],q[10];
-cx q[10],q[37];
-rz(1.0282599028820296) q[11];
-cx q[5],q[11];
-cx q[6],q[11];
-rz(1.0282599028820296) q[11];
-cx q[6],q[11];
-rx(11.2541027864931) q[11];
-rz(1.0282599028820296) q[12];
-cx q[3],q[12];
-cx q[3],q[14];
-cx q[5],q[12];
-rz(1.0282599028820296) q[12];
-cx q[5],q[12];
-rz(1.0282599028820296) q[13];
-cx q[4],q[13];
-cx q[5],q[13];
-rz(1.0282599028820296) q[13];
-cx q[5],q[13];
-rz(1.0282599028820296) q[14];
-cx q[3],q[14];
-cx q[4],q[14];
-rz(1.0282599028820296) q[14];
-cx q[4],q[14];
-rx(11.2541027864931) q[14];
-rz(1.0282599028820296) q[15];
-cx q[0],q[15];
-cx q[0],q[16];
-cx q[3],q[15];
-rz(1.0282599028820296) q[15];
-cx q[3],q[15];
-rz(1.0282599028820296) q[16];
-cx q[0],q[16];
-cx q[0],q[20];
-cx q[3],q[16];
-rz(1.0282599028820296) q[16];
-cx q[3],q[16];
-rz(1.0282599028820296) q[17];
-cx q[1],q[17];
-cx q[1],q[28];
-cx q[3],q[17];
-rz(1.0282599028820296) q[17];
-cx q[3],q[17];
-cx q[3],q[18];
-rz(1.0282599028820296) q[18];
-cx q[3],q[18];
-cx q[3],q[19];
-cx q[4],q[18];
-rz(1.0282599028820296) q[18];
-cx q[4],q[18];
-cx q[4],q[21];
-rz(1.0282599028820296) q[19];
-cx q[3],q[19];
-cx q[3],q[22];
-cx q[7],q[19];
-rz(1.0282599028820296) q[19];
-cx q[7],q[19];
-cx q[19],q[38];
-rz(1.0282599028820296) q[20];
-cx q[0],q[20];
-cx q[0],q[32];
-cx q[15],q[20];
-rz(1.0282599028820296) q[20];
-cx q[15],q[20];
-rz(1.0282599028820296) q[21];
-cx q[4],q[21];
-cx q[4],q[27];
-cx q[15],q[21];
-rz(1.0282599028820296) q[21];
-cx q[15],q[21];
-cx q[15],q[36];
-rz(1.0282599028820296) q[22];
-cx q[3],q[22];
-cx q[3],q[23];
-cx q[9],q[22];
-rz(1.0282599028820296) q[22];
-cx q[9],q[22];
-cx q[9],q[55];
-rx(11.2541027864931) q[22];
-rz(1.0282599028820296) q[23];
-cx q[3],q[23];
-cx q[3],q[24];
-cx q[17],q[23];
-rz(1.0282599028820296) q[23];
-cx q[17],q[23];
-rz(1.0282599028820296) q[24];
-cx q[3],q[24];
-cx q[3],q[25];
-cx q[5],q[24];
-rz(1.0282599028820296) q[24];
-cx q[5],q[24];
-cx q[5],q[33];
-cx q[24],q[54];
-rz(1.0282599028820296) q[25];
-cx q[3],q[25];
-cx q[3],q[26];
-cx q[12],q[25];
-rz(1.0282599028820296) q[25];
-cx q[12],q[25];
-cx q[12],q[31];
-rz(1.0282599028820296) q[26];
-cx q[3],q[26];
-cx q[21],q[26];
-rz(1.0282599028820296) q[26];
-cx q[21],q[26];
-rz(1.0282599028820296) q[27];
-cx q[4],q[27];
-cx q[4],q[47];
-cx q[6],q[27];
-rz(1.0282599028820296) q[27];
-cx q[6],q[27];
-cx q[6],q[69];
-rz(1.0282599028820296) q[28];
-cx q[1],q[28];
-cx q[1],q[29];
-cx q[3],q[28];
-rz(1.0282599028820296) q[28];
-cx q[3],q[28];
-rz(1.0282599028820296) q[29];
-cx q[1],q[29];
-cx q[1],q[45];
-cx q[3],q[29];
-rz(1.0282599028820296) q[29];
-cx q[3],q[29];
-cx q[3],q[30];
-rx(11.2541027864931) q[29];
-rz(1.0282599028820296) q[30];
-cx q[3],q[30];
-cx q[3],q[34];
-cx q[18],q[30];
-rz(1.0282599028820296) q[30];
-cx q[18],q[30];
-rx(11.2541027864931) q[18];
-rz(1.0282599028820296) q[31];
-cx q[12],q[31];
-cx q[26],q[31];
-rz(1.0282599028820296) q[31];
-cx q[26],q[31];
-cx q[26],q[105];
-rz(1.0282599028820296) q[32];
-cx q[0],q[32];
-cx q[0],q[42];
-cx q[21],q[32];
-rz(1.0282599028820296) q[32];
-cx q[21],q[32];
-rz(1.0282599028820296) q[33];
-cx q[5],q[33];
-cx q[5],q[46];
-cx q[30],q[33];
-rz(1.0282599028820296) q[33];
-cx q[30],q[33];
-rx(11.2541027864931) q[33];
-rz(1.0282599028820296) q[34];
-cx q[3],q[34];
-cx q[3],q[35];
-cx q[12],q[34];
-rz(1.0282599028820296) q[34];
-cx q[12],q[34];
-rz(1.0282599028820296) q[35];
-cx q[3],q[35];
-cx q[3],q[39];
-cx q[32],q[35];
-rz(1.0282599028820296) q[35];
-cx q[32],q[35];
-cx q[35],q[130];
-rz(1.0282599028820296) q[36];
-cx q[15],q[36];
-cx q[20],q[36];
-rz(1.0282599028820296) q[36];
-cx q[20],q[36];
-cx q[36],q[94];
-rz(1.0282599028820296) q[37];
-cx q[10],q[37];
-cx q[10],q[41];
-cx q[34],q[37];
-rz(1.0282599028820296) q[37];
-cx q[34],q[37];
-rx(11.2541027864931) q[34];
-cx q[37],q[85];
-rz(1.0282599028820296) q[38];
-cx q[19],q[38];
-rx(11.2541027864931) q[19];
-cx q[21],q[38];
-rz(1.0282599028820296) q[38];
-cx q[21],q[38];
-rz(1.0282599028820296) q[39];
-cx q[3],q[39];
-cx q[3],q[40];
-cx q[13],q[39];
-rz(1.0282599028820296) q[39];
-cx q[13],q[39];
-cx q[13],q[56];
-rz(1.0282599028820296) q[40];
-cx q[3],q[40];
-cx q[23],q[40];
-rz(1.0282599028820296) q[40];
-cx q[23],q[40];
-cx q[40],q[119];
-rz(1.0282599028820296) q[41];
-cx q[10],q[41];
-cx q[27],q[41];
-rz(1.0282599028820296) q[41];
-cx q[27],q[41];
-cx q[27],q[72];
-cx q[41],q[67];
-rz(1.0282599028820296) q[42];
-cx q[0],q[42];
-cx q[0],q[48];
-cx q[3],q[42];
-rz(1.0282599028820296) q[42];
-cx q[3],q[42];
-cx q[3],q[43];
-cx q[42],q[78];
-rz(1.0282599028820296) q[43];
-cx q[3],q[43];
-cx q[3],q[44];
-cx q[20],q[43];
-rz(1.0282599028820296) q[43];
-cx q[20],q[43];
-cx q[20],q[121];
-rx(11.2541027864931) q[43];
-rz(1.0282599028820296) q[44];
-cx q[3],q[44];
-cx q[3],q[49];
-cx q[12],q[44];
-rz(1.0282599028820296) q[44];
-cx q[12],q[44];
-rz(1.0282599028820296) q[45];
-cx q[1],q[45];
-cx q[1],q[57];
-cx q[16],q[45];
-rz(1.0282599028820296) q[45];
-cx q[16],q[45];
-cx q[16],q[59];
-rz(1.0282599028820296) q[46];
-cx q[5],q[46];
-cx q[5],q[65];
-cx q[38],q[46];
-rz(1.0282599028820296) q[46];
-cx q[38],q[46];
-rx(11.2541027864931) q[38];
-cx q[46],q[120];
-rz(1.0282599028820296) q[47];
-cx q[4],q[47];
-cx q[17],q[47];
-rz(1.0282599028820296) q[47];
-cx q[17],q[47];
-cx q[17],q[53];
-rz(1.0282599028820296) q[48];
-cx q[0],q[48];
-cx q[0],q[51];
-cx q[30],q[48];
-rz(1.0282599028820296) q[48];
-cx q[30],q[48];
-rx(11.2541027864931) q[48];
-rz(1.0282599028820296) q[49];
-cx q[3],q[49];
-cx q[3],q[50];
-cx q[4],q[49];
-rz(1.0282599028820296) q[49];
-cx q[4],q[49];
-cx q[4],q[61];
-rx(11.2541027864931) q[49];
-rz(1.0282599028820296) q[50];
-cx q[3],q[50];
-cx q[3],q[52];
-cx q[12],q[50];
-rz(1.0282599028820296) q[50];
-cx q[12],q[50];
-cx q[12],q[63];
-rz(1.0282599028820296) q[51];
-cx q[0],q[51];
-cx q[0],q[62];
-cx q[28],q[51];
-rz(1.0282599028820296) q[51];
-cx q[28],q[51];
-rx(11.2541027864931) q[51];
-rz(1.0282599028820296) q[52];
-cx q[3],q[52];
-cx q[10],q[52];
-rz(1.0282599028820296) q[52];
-cx q[10],q[52];
-rz(1.0282599028820296) q[53];
-cx q[17],q[53];
-cx q[21],q[53];
-rz(1.0282599028820296) q[53];
-cx q[21],q[53];
-rz(1.0282599028820296) q[54];
-cx q[24],q[54];
-cx q[24],q[58];
-cx q[28],q[54];
-rz(1.0282599028820296) q[54];
-cx q[28],q[54];
-rx(11.2541027864931) q[54];
-rz(1.0282599028820296) q[55];
-cx q[9],q[55];
-cx q[9],q[80];
-cx q[15],q[55];
-rz(1.0282599028820296) q[55];
-cx q[15],q[55];
-rz(1.0282599028820296) q[56];
-cx q[13],q[56];
-cx q[13],q[68];
-cx q[45],q[56];
-rz(1.0282599028820296) q[56];
-cx q[45],q[56];
-rx(11.2541027864931) q[45];
-rz(1.0282599028820296) q[57];
-cx q[1],q[57];
-cx q[1],q[60];
-cx q[3],q[57];
-rz(1.0282599028820296) q[57];
-cx q[3],q[57];
-cx q[3],q[70];
-rz(1.0282599028820296) q[58];
-cx q[24],q[58];
-cx q[24],q[86];
-cx q[28],q[58];
-rz(1.0282599028820296) q[58];
-cx q[28],q[58];
-cx q[28],q[87];
-rx(11.2541027864931) q[58];
-rz(1.0282599028820296) q[59];
-cx q[16],q[59];
-cx q[16],q[73];
-cx q[32],q[59];
-rz(1.0282599028820296) q[59];
-cx q[32],q[59];
-rz(1.0282599028820296) q[60];
-cx q[1],q[60];
-cx q[7],q[60];
-rz(1.0282599028820296) q[60];
-cx q[7],q[60];
-rz(1.0282599028820296) q[61];
-cx q[4],q[61];
-cx q[4],q[99];
-cx q[7],q[61];
-rz(1.0282599028820296) q[61];
-cx q[7],q[61];
-rx(11.2541027864931) q[61];
-rz(1.0282599028820296) q[62];
-cx q[0],q[62];
-cx q[0],q[64];
-cx q[17],q[62];
-rz(1.0282599028820296) q[62];
-cx q[17],q[62];
-rz(1.0282599028820296) q[63];
-cx q[12],q[63];
-cx q[17],q[63];
-rz(1.0282599028820296) q[63];
-cx q[17],q[63];
-cx q[17],q[66];
-rz(1.0282599028820296) q[64];
-cx q[0],q[64];
-cx q[0],q[75];
-cx q[10],q[64];
-rz(1.0282599028820296) q[64];
-cx q[10],q[64];
-cx q[10],q[98];
-rx(11.2541027864931) q[64];
-rz(1.0282599028820296) q[65];
-cx q[5],q[65];
-cx q[5],q[76];
-cx q[23],q[65];
-rz(1.0282599028820296) q[65];
-cx q[23],q[65];
-rx(11.2541027864931) q[23];
-rx(11.2541027864931) q[65];
-rz(1.0282599028820296) q[66];
-cx q[17],q[66];
-rx(11.2541027864931) q[17];
-cx q[47],q[66];
-rz(1.0282599028820296) q[66];
-cx q[47],q[66];
-rx(11.2541027864931) q[66];
-rz(1.0282599028820296) q[67];
-cx q[41],q[67];
-cx q[56],q[67];
-rz(1.0282599028820296) q[67];
-cx q[56],q[67];
-cx q[56],q[74];
-rx(11.2541027864931) q[67];
-rz(1.0282599028820296) q[68];
-cx q[13],q[68];
-cx q[32],q[68];
-rz(1.0282599028820296) q[68];
-cx q[32],q[68];
-rz(1.0282599028820296) q[69];
-cx q[6],q[69];
-cx q[59],q[69];
-rz(1.0282599028820296) q[69];
-cx q[59],q[69];
-rz(1.0282599028820296) q[70];
-cx q[3],q[70];
-cx q[3],q[71];
-cx q[15],q[70];
-rz(1.0282599028820296) q[70];
-cx q[15],q[70];
-cx q[70],q[84];
-rz(1.0282599028820296) q[71];
-cx q[3],q[71];
-cx q[3],q[77];
-cx q[53],q[71];
-rz(1.0282599028820296) q[71];
-cx q[53],q[71];
-rx(11.2541027864931) q[71];
-rz(1.0282599028820296) q[72];
-cx q[27],q[72];
-cx q[44],q[72];
-rz(1.0282599028820296) q[72];
-cx q[44],q[72];
-rx(11.2541027864931) q[44];
-rx(11.2541027864931) q[72];
-rz(1.0282599028820296) q[73];
-cx q[16],q[73];
-cx q[16],q[101];
-cx q[59],q[73];
-rz(1.0282599028820296) q[73];
-cx q[59],q[73];
-rz(1.0282599028820296) q[74];
-cx q[56],q[74];
-cx q[63],q[74];
-rz(1.0282599028820296) q[74];
-cx q[63],q[74];
-cx q[63],q[122];
-rx(11.2541027864931) q[74];
-rz(1.0282599028820296) q[75];
-cx q[0],q[75];
-cx q[0],q[82];
-cx q[21],q[75];
-rz(1.0282599028820296) q[75];
-cx q[21],q[75];
-cx q[21],q[81];
-rx(11.2541027864931) q[75];
-rz(1.0282599028820296) q[76];
-cx q[5],q[76];
-cx q[5],q[89];
-cx q[6],q[76];
-rz(1.0282599028820296) q[76];
-cx q[6],q[76];
-cx q[6],q[79];
-rx(11.2541027864931) q[76];
-rz(1.0282599028820296) q[77];
-cx q[3],q[77];
-cx q[3],q[88];
-cx q[30],q[77];
-rz(1.0282599028820296) q[77];
-cx q[30],q[77];
-rx(11.2541027864931) q[30];
-rz(1.0282599028820296) q[78];
-cx q[42],q[78];
-cx q[60],q[78];
-rz(1.0282599028820296) q[78];
-cx q[60],q[78];
-rx(11.2541027864931) q[78];
-rz(1.0282599028820296) q[79];
-cx q[6],q[79];
-cx q[50],q[79];
-rz(1.0282599028820296) q[79];
-cx q[50],q[79];
-rx(11.2541027864931) q[79];
-rz(1.0282599028820296) q[80];
-cx q[9],q[80];
-cx q[9],q[144];
-cx q[15],q[80];
-rz(1.0282599028820296) q[80];
-cx q[15],q[80];
-cx q[15],q[90];
-rx(11.2541027864931) q[80];
-rz(1.0282599028820296) q[81];
-cx q[21],q[81];
-cx q[77],q[81];
-rz(1.0282599028820296) q[81];
-cx q[77],q[81];
-rx(11.2541027864931) q[77];
-rz(1.0282599028820296) q[82];
-cx q[0],q[82];
-cx q[0],q[91];
-cx q[56],q[82];
-rz(1.0282599028820296) q[82];
-cx q[56],q[82];
-cx q[56],q[96];
-rx(11.2541027864931) q[82];
-rz(1.0282599028820296) q[83];
-cx q[8],q[83];
-rx(11.2541027864931) q[8];
-cx q[68],q[83];
-rz(1.0282599028820296) q[83];
-cx q[68],q[83];
-rx(11.2541027864931) q[68];
-rx(11.2541027864931) q[83];
-rz(1.0282599028820296) q[84];
-cx q[70],q[84];
-rx(11.2541027864931) q[70];
-cx q[73],q[84];
-rz(1.0282599028820296) q[84];
-cx q[73],q[84];
-rx(11.2541027864931) q[73];
-rx(11.2541027864931) q[84];
-rz(1.0282599028820296) q[85];
-cx q[37],q[85];
-cx q[59],q[85];
-rz(1.0282599028820296) q[85];
-cx q[59],q[85];
-rx(11.2541027864931) q[85];
-rz(1.0282599028820296) q[86];
-cx q[24],q[86];
-cx q[53],q[86];
-rz(1.0282599028820296) q[86];
-cx q[53],q[86];
-cx q[53],q[124];
-rx(11.2541027864931) q[86];
-rz(1.0282599028820296) q[87];
-cx q[28],q[87];
-cx q[32],q[87];
-rz(1.0282599028820296) q[87];
-cx q[32],q[87];
-rx(11.2541027864931) q[87];
-rz(1.0282599028820296) q[88];
-cx q[3],q[88];
-cx q[3],q[100];
-cx q[60],q[88];
-rz(1.0282599028820296) q[88];
-cx q[60],q[88];
-cx q[60],q[138];
-rx(11.2541027864931) q[88];
-rz(1.0282599028820296) q[89];
-cx q[5],q[89];
-cx q[5],q[95];
-rz(1.0282599028820296) q[90];
-cx q[15],q[90];
-cx q[15],q[92];
-cx q[27],q[90];
-rz(1.0282599028820296) q[90];
-cx q[27],q[90];
-rx(11.2541027864931) q[90];
-rz(1.0282599028820296) q[91];
-cx q[0],q[91];
-cx q[0],q[93];
-cx q[6],q[91];
-rz(1.0282599028820296) q[91];
-cx q[6],q[91];
-rx(11.2541027864931) q[6];
-rz(1.0282599028820296) q[92];
-cx q[15],q[92];
-cx q[15],q[108];
-cx q[89],q[92];
-rz(1.0282599028820296) q[92];
-cx q[89],q[92];
-rz(1.0282599028820296) q[93];
-cx q[0],q[93];
-cx q[0],q[123];
-cx q[32],q[93];
-rz(1.0282599028820296) q[93];
-cx q[32],q[93];
-rx(11.2541027864931) q[93];
-rz(1.0282599028820296) q[94];
-cx q[36],q[94];
-cx q[55],q[94];
-rz(1.0282599028820296) q[94];
-cx q[55],q[94];
-rx(11.2541027864931) q[55];
-rz(1.0282599028820296) q[95];
-cx q[5],q[95];
-cx q[5],q[106];
-cx q[27],q[95];
-rz(1.0282599028820296) q[95];
-cx q[27],q[95];
-rx(11.2541027864931) q[27];
-rx(11.2541027864931) q[95];
-rz(1.0282599028820296) q[96];
-cx q[56],q[96];
-rx(11.2541027864931) q[56];
-cx q[92],q[96];
-rz(1.0282599028820296) q[96];
-cx q[92],q[96];
-rx(11.2541027864931) q[96];
-cx q[97],q[145];
-rz(1.0282599028820296) q[98];
-cx q[10],q[98];
-rx(11.2541027864931) q[10];
-cx q[21],q[98];
-rz(1.0282599028820296) q[98];
-cx q[21],q[98];
-rx(11.2541027864931) q[98];
-rz(1.0282599028820296) q[99];
-cx q[4],q[99];
-cx q[41],q[99];
-rz(1.0282599028820296) q[99];
-cx q[41],q[99];
-rx(11.2541027864931) q[41];
-rx(11.2541027864931) q[99];
-rz(1.0282599028820296) q[100];
-cx q[3],q[100];
-cx q[3],q[102];
-cx q[25],q[100];
-rz(1.0282599028820296) q[100];
-cx q[25],q[100];
-rx(11.2541027864931) q[25];
-rx(11.2541027864931) q[100];
-rz(1.0282599028820296) q[101];
-cx q[16],q[101];
-cx q[16],q[103];
-cx q[50],q[101];
-rz(1.0282599028820296) q[101];
-cx q[50],q[101];
-cx q[50],q[129];
-rx(11.2541027864931) q[101];
-rz(1.0282599028820296) q[102];
-cx q[3],q[102];
-cx q[3],q[107];
-cx q[4],q[102];
-rz(1.0282599028820296) q[102];
-cx q[4],q[102];
-cx q[4],q[127];
-rx(11.2541027864931) q[102];
-rz(1.0282599028820296) q[103];
-cx q[16],q[103];
-rx(11.2541027864931) q[16];
-cx q[57],q[103];
-rz(1.0282599028820296) q[103];
-cx q[57],q[103];
-rx(11.2541027864931) q[57];
-rx(11.2541027864931) q[103];
-rz(1.0282599028820296) q[105];
-cx q[26],q[105];
-cx q[26],q[117];
-cx q[28],q[105];
-rz(1.0282599028820296) q[105];
-cx q[28],q[105];
-cx q[28],q[116];
-rx(11.2541027864931) q[105];
-rz(1.0282599028820296) q[106];
-cx q[5],q[106];
-cx q[5],q[109];
-cx q[36],q[106];
-rz(1.0282599028820296) q[106];
-cx q[36],q[106];
-rx(11.2541027864931) q[106];
-rz(1.0282599028820296) q[107];
-cx q[3],q[107];
-cx q[3],q[110];
-cx q[31],q[107];
-rz(1.0282599028820296) q[107];
-cx q[31],q[107];
-rx(11.2541027864931) q[107];
-rz(1.0282599028820296) q[108];
-cx q[15],q[108];
-cx q[15],q[115];
-cx q[31],q[108];
-rz(1.0282599028820296) q[108];
-cx q[31],q[108];
-rx(11.2541027864931) q[31];
-rx(11.2541027864931) q[108];
-rz(1.0282599028820296) q[109];
-cx q[5],q[109];
-cx q[5],q[118];
-cx q[39],q[109];
-rz(1.0282599028820296) q[109];
-cx q[39],q[109];
-rx(11.2541027864931) q[39];
-rz(1.0282599028820296) q[110];
-cx q[3],q[110];
-cx q[3],q[111];
-cx q[24],q[110];
-rz(1.0282599028820296) q[110];
-cx q[24],q[110];
-cx q[24],q[137];
-rz(1.0282599028820296) q[111];
-cx q[3],q[111];
-cx q[21],q[111];
-rz(1.0282599028820296) q[111];
-cx q[21],q[111];
-cx q[21],q[112];
-rx(11.2541027864931) q[111];
-rz(1.0282599028820296) q[112];
-cx q[21],q[112];
-rx(11.2541027864931) q[21];
-cx q[36],q[112];
-rz(1.0282599028820296) q[112];
-cx q[36],q[112];
-rx(11.2541027864931) q[36];
-rx(11.2541027864931) q[112];
-rz(1.0282599028820296) q[115];
-cx q[15],q[115];
-cx q[92],q[115];
-rz(1.0282599028820296) q[115];
-cx q[92],q[115];
-rx(11.2541027864931) q[115];
-rz(1.0282599028820296) q[116];
-cx q[28],q[116];
-rx(11.2541027864931) q[28];
-cx q[42],q[116];
-rz(1.0282599028820296) q[116];
-cx q[42],q[116];
-rx(11.2541027864931) q[42];
-rx(11.2541027864931) q[116];
-rz(1.0282599028820296) q[117];
-cx q[26],q[117];
-rx(11.2541027864931) q[26];
-cx q[32],q[117];
-rz(1.0282599028820296) q[117];
-cx q[32],q[117];
-cx q[32],q[131];
-rx(11.2541027864931) q[117];
-rz(1.0282599028820296) q[118];
-cx q[5],q[118];
-cx q[5],q[139];
-cx q[15],q[118];
-rz(1.0282599028820296) q[118];
-cx q[15],q[118];
-rx(11.2541027864931) q[15];
-rx(11.2541027864931) q[118];
-rz(1.0282599028820296) q[119];
-cx q[40],q[119];
-rx(11.2541027864931) q[40];
-cx q[69],q[119];
-rz(1.0282599028820296) q[119];
-cx q[69],q[119];
-rx(11.2541027864931) q[69];
-rz(1.0282599028820296) q[120];
-cx q[46],q[120];
-rx(11.2541027864931) q[46];
-cx q[94],q[120];
-rz(1.0282599028820296) q[120];
-cx q[94],q[120];
-rx(11.2541027864931) q[94];
-rx(11.2541027864931) q[120];
-rz(1.0282599028820296) q[121];
-cx q[20],q[121];
-rx(11.2541027864931) q[20];
-rz(1.0282599028820296) q[122];
-cx q[63],q[122];
-rx(11.2541027864931) q[63];
-cx q[81],q[122];
-rz(1.0282599028820296) q[122];
-cx q[81],q[122];
-rx(11.2541027864931) q[122];
-rz(1.0282599028820296) q[123];
-cx q[0],q[123];
-cx q[0],q[126];
-cx q[52],q[123];
-rz(1.0282599028820296) q[123];
-cx q[52],q[123];
-rx(11.2541027864931) q[52];
-rz(1.0282599028820296) q[124];
-cx q[53],q[124];
-rx(11.2541027864931) q[53];
-cx q[81],q[124];
-rz(1.0282599028820296) q[124];
-cx q[81],q[124];
-rx(11.2541027864931) q[81];
-rx(11.2541027864931) q[124];
-rz(1.0282599028820296) q[126];
-cx q[0],q[126];
-cx q[0],q[135];
-cx q[12],q[126];
-rz(1.0282599028820296) q[126];
-cx q[12],q[126];
-cx q[12],q[141];
-rx(11.2541027864931) q[126];
-rz(1.0282599028820296) q[127];
-cx q[4],q[127];
-rx(11.2541027864931) q[4];
-cx q[62],q[127];
-rz(1.0282599028820296) q[127];
-cx q[62],q[127];
-cx q[62],q[128];
-rx(11.2541027864931) q[127];
-rz(1.0282599028820296) q[128];
-cx q[62],q[128];
-rx(11.2541027864931) q[62];
-rz(1.0282599028820296) q[129];
-cx q[50],q[129];
-cx q[91],q[129];
-rz(1.0282599028820296) q[129];
-cx q[91],q[129];
-rx(11.2541027864931) q[91];
-rx(11.2541027864931) q[129];
-rz(1.0282599028820296) q[130];
-cx q[35],q[130];
-rx(11.2541027864931) q[35];
-rz(1.0282599028820296) q[131];
-cx q[32],q[131];
-cx q[123],q[131];
-rz(1.0282599028820296) q[131];
-cx q[123],q[131];
-rx(11.2541027864931) q[123];
-rx(11.2541027864931) q[131];
-rz(1.0282599028820296) q[135];
-cx q[0],q[135];
-cx q[0],q[140];
-rz(1.0282599028820296) q[137];
-cx q[24],q[137];
-rz(1.0282599028820296) q[138];
-cx q[60],q[138];
-rx(11.2541027864931) q[60];
-cx q[119],q[138];
-rz(1.0282599028820296) q[138];
-cx q[119],q[138];
-rx(11.2541027864931) q[119];
-rx(11.2541027864931) q[138];
-rz(1.0282599028820296) q[139];
-cx q[5],q[139];
-cx q[5],q[142];
-rz(1.0282599028820296) q[140];
-cx q[0],q[140];
-rx(11.2541027864931) q[0];
-cx q[32],q[140];
-rz(1.0282599028820296) q[140];
-cx q[32],q[140];
-rx(11.2541027864931) q[32];
-rx(11.2541027864931) q[140];
-rz(1.0282599028820296) q[141];
-cx q[12],q[141];
-cx q[12],q[143];
-rz(1.0282599028820296) q[142];
-cx q[5],q[142];
-rx(11.2541027864931) q[5];
-cx q[24],q[142];
-rz(1.0282599028820296) q[142];
-cx q[24],q[142];
-rx(11.2541027864931) q[24];
-rx(11.2541027864931) q[142];
-rz(1.0282599028820296) q[143];
-cx q[12],q[143];
-rx(11.2541027864931) q[12];
-cx q[50],q[143];
-rz(1.0282599028820296) q[143];
-cx q[50],q[143];
-rx(11.2541027864931) q[50];
-rx(11.2541027864931) q[143];
-rz(1.0282599028820296) q[144];
-cx q[9],q[144];
-rx(11.2541027864931) q[9];
-cx q[59],q[144];
-rz(1.0282599028820296) q[144];
-cx q[59],q[144];
-rx(11.2541027864931) q[59];
-rx(11.2541027864931) q[144];
-rz(5.5354809922324595) q[145];
-cx q[97],q[145];
-rx(1.1354764937816721) q[97];
-cx q[1],q[97];
-rz(1.0282599028820296) q[97];
-cx q[1],q[97];
-cx q[1],q[113];
-cx q[7],q[97];
-rz(1.0282599028820296) q[97];
-cx q[7],q[97];
-cx q[7],q[104];
-rz(1.0282599028820296) q[104];
-cx q[7],q[104];
-cx q[7],q[133];
-cx q[13],q[104];
-rz(1.0282599028820296) q[104];
-cx q[13],q[104];
-cx q[13],q[135];
-cx q[104],q[114];
-rz(1.0282599028820296) q[113];
-cx q[1],q[113];
-rx(11.2541027864931) q[1];
-cx q[0],q[1];
-rz(2.0916748502577547) q[1];
-cx q[0],q[1];
-cx q[0],q[2];
-rz(2.0916748502577547) q[2];
-cx q[0],q[2];
-cx q[3],q[113];
-rz(1.0282599028820296) q[113];
-cx q[3],q[113];
-cx q[3],q[125];
-rx(11.2541027864931) q[113];
-rz(1.0282599028820296) q[114];
-cx q[104],q[114];
-cx q[104],q[121];
-cx q[110],q[114];
-rz(1.0282599028820296) q[114];
-cx q[110],q[114];
-rx(11.2541027864931) q[110];
-rx(11.2541027864931) q[114];
-rz(1.0282599028820296) q[121];
-cx q[104],q[121];
-rx(11.2541027864931) q[104];
-cx q[121],q[141];
-rz(1.0282599028820296) q[125];
-cx q[3],q[125];
-cx q[3],q[132];
-cx q[109],q[125];
-rz(1.0282599028820296) q[125];
-cx q[109],q[125];
-cx q[109],q[128];
-rx(11.2541027864931) q[125];
-rz(1.0282599028820296) q[128];
-cx q[109],q[128];
-cx q[109],q[130];
-rx(11.2541027864931) q[128];
-rz(1.0282599028820296) q[130];
-cx q[109],q[130];
-rx(11.2541027864931) q[109];
-rx(11.2541027864931) q[130];
-rz(1.0282599028820296) q[132];
-cx q[3],q[132];
-cx q[3],q[134];
-cx q[37],q[132];
-rz(1.0282599028820296) q[132];
-cx q[37],q[132];
-rx(11.2541027864931) q[37];
-rx(11.2541027864931) q[132];
-rz(1.0282599028820296) q[133];
-cx q[7],q[133];
-rx(11.2541027864931) q[7];
-cx q[89],q[133];
-rz(1.0282599028820296) q[133];
-cx q[89],q[133];
-rx(11.2541027864931) q[89];
-cx q[2],q[89];
-rz(2.0916748502577547) q[89];
-cx q[2],q[89];
-rx(0.9972396929898115) q[2];
-cx q[133],q[137];
-rz(1.0282599028820296) q[134];
-cx q[3],q[134];
-cx q[3],q[136];
-cx q[47],q[134];
-rz(1.0282599028820296) q[134];
-cx q[47],q[134];
-rx(11.2541027864931) q[47];
-rx(11.2541027864931) q[134];
-rz(1.0282599028820296) q[135];
-cx q[13],q[135];
-rx(11.2541027864931) q[13];
-rx(11.2541027864931) q[135];
-rz(1.0282599028820296) q[136];
-cx q[3],q[136];
-cx q[92],q[136];
-rz(1.0282599028820296) q[136];
-cx q[92],q[136];
-rx(11.2541027864931) q[92];
-rx(11.2541027864931) q[136];
-rz(1.0282599028820296) q[137];
-cx q[133],q[137];
-cx q[133],q[139];
-rx(11.2541027864931) q[137];
-rz(1.0282599028820296) q[139];
-cx q[133],q[139];
-rx(11.2541027864931) q[133];
-rx(11.2541027864931) q[139];
-rz(1.0282599028820296) q[141];
-cx q[121],q[141];
-rx(11.2541027864931) q[121];
-rx(11.2541027864931) q[141];
-rx(1.1354764937816721) q[145];
-cx q[3],q[145];
-rz(1.0282599028820296) q[145];
-cx q[3],q[145];
-rx(11.2541027864931) q[3];
-cx q[0],q[3];
-rz(2.0916748502577547) q[3];
-cx q[0],q[3];
-cx q[0],q[15];
-cx q[1],q[3];
-rz(2.0916748502577547) q[3];
-cx q[1],q[3];
-cx q[1],q[4];
-rz(2.0916748502577547) q[4];
-cx q[1],q[4];
-cx q[1],q[5];
-cx q[3],q[4];
-rz(2.0916748502577547) q[4];
-cx q[3],q[4];
-cx q[4],q[6];
-rz(2.0916748502577547) q[5];
-cx q[1],q[5];
-cx q[1],q[9];
-cx q[3],q[5];
-rz(2.0916748502577547) q[5];
-cx q[3],q[5];
-cx q[3],q[7];
-rz(2.0916748502577547) q[6];
-cx q[4],q[6];
-cx q[5],q[6];
-rz(2.0916748502577547) q[6];
-cx q[5],q[6];
-rz(2.0916748502577547) q[7];
-cx q[3],q[7];
-cx q[3],q[8];
-cx q[4],q[7];
-rz(2.0916748502577547) q[7];
-cx q[4],q[7];
-cx q[4],q[10];
-rz(2.0916748502577547) q[8];
-cx q[3],q[8];
-cx q[5],q[8];
-rz(2.0916748502577547) q[8];
-cx q[5],q[8];
-cx q[5],q[11];
-cx q[8],q[83];
-rz(2.0916748502577547) q[9];
-cx q[1],q[9];
-cx q[1],q[17];
-cx q[3],q[9];
-rz(2.0916748502577547) q[9];
-cx q[3],q[9];
-cx q[3],q[12];
-rz(2.0916748502577547) q[10];
-cx q[4],q[10];
-cx q[4],q[13];
-cx q[6],q[10];
-rz(2.0916748502577547) q[10];
-cx q[6],q[10];
-cx q[10],q[37];
-rz(2.0916748502577547) q[11];
-cx q[5],q[11];
-cx q[6],q[11];
-rz(2.0916748502577547) q[11];
-cx q[6],q[11];
-rx(0.9972396929898115) q[11];
-rz(2.0916748502577547) q[12];
-cx q[3],q[12];
-cx q[3],q[14];
-cx q[5],q[12];
-rz(2.0916748502577547) q[12];
-cx q[5],q[12];
-rz(2.0916748502577547) q[13];
-cx q[4],q[13];
-cx q[5],q[13];
-rz(2.0916748502577547) q[13];
-cx q[5],q[13];
-rz(2.0916748502577547) q[14];
-cx q[3],q[14];
-cx q[4],q[14];
-rz(2.0916748502577547) q[14];
-cx q[4],q[14];
-rx(0.9972396929898115) q[14];
-rz(2.0916748502577547) q[15];
-cx q[0],q[15];
-cx q[0],q[16];
-cx q[3],q[15];
-rz(2.0916748502577547) q[15];
-cx q[3],q[15];
-rz(2.0916748502577547) q[16];
-cx q[0],q[16];
-cx q[0],q[20];
-cx q[3],q[16];
-rz(2.0916748502577547) q[16];
-cx q[3],q[16];
-rz(2.0916748502577547) q[17];
-cx q[1],q[17];
-cx q[1],q[28];
-cx q[3],q[17];
-rz(2.0916748502577547) q[17];
-cx q[3],q[17];
-cx q[3],q[18];
-rz(2.0916748502577547) q[18];
-cx q[3],q[18];
-cx q[3],q[19];
-cx q[4],q[18];
-rz(2.0916748502577547) q[18];
-cx q[4],q[18];
-cx q[4],q[21];
-rz(2.0916748502577547) q[19];
-cx q[3],q[19];
-cx q[3],q[22];
-cx q[7],q[19];
-rz(2.0916748502577547) q[19];
-cx q[7],q[19];
-cx q[19],q[38];
-rz(2.0916748502577547) q[20];
-cx q[0],q[20];
-cx q[0],q[32];
-cx q[15],q[20];
-rz(2.0916748502577547) q[20];
-cx q[15],q[20];
-rz(2.0916748502577547) q[21];
-cx q[4],q[21];
-cx q[4],q[27];
-cx q[15],q[21];
-rz(2.0916748502577547) q[21];
-cx q[15],q[21];
-cx q[15],q[36];
-rz(2.0916748502577547) q[22];
-cx q[3],q[22];
-cx q[3],q[23];
-cx q[9],q[22];
-rz(2.0916748502577547) q[22];
-cx q[9],q[22];
-cx q[9],q[55];
-rx(0.9972396929898115) q[22];
-rz(2.0916748502577547) q[23];
-cx q[3],q[23];
-cx q[3],q[24];
-cx q[17],q[23];
-rz(2.0916748502577547) q[23];
-cx q[17],q[23];
-rz(2.0916748502577547) q[24];
-cx q[3],q[24];
-cx q[3],q[25];
-cx q[5],q[24];
-rz(2.0916748502577547) q[24];
-cx q[5],q[24];
-cx q[5],q[33];
-cx q[24],q[54];
-rz(2.0916748502577547) q[25];
-cx q[3],q[25];
-cx q[3],q[26];
-cx q[12],q[25];
-rz(2.0916748502577547) q[25];
-cx q[12],q[25];
-cx q[12],q[31];
-rz(2.0916748502577547) q[26];
-cx q[3],q[26];
-cx q[21],q[26];
-rz(2.0916748502577547) q[26];
-cx q[21],q[26];
-rz(2.0916748502577547) q[27];
-cx q[4],q[27];
-cx q[4],q[47];
-cx q[6],q[27];
-rz(2.0916748502577547) q[27];
-cx q[6],q[27];
-cx q[6],q[69];
-rz(2.0916748502577547) q[28];
-cx q[1],q[28];
-cx q[1],q[29];
-cx q[3],q[28];
-rz(2.0916748502577547) q[28];
-cx q[3],q[28];
-rz(2.0916748502577547) q[29];
-cx q[1],q[29];
-cx q[1],q[45];
-cx q[3],q[29];
-rz(2.0916748502577547) q[29];
-cx q[3],q[29];
-cx q[3],q[30];
-rx(0.9972396929898115) q[29];
-rz(2.0916748502577547) q[30];
-cx q[3],q[30];
-cx q[3],q[34];
-cx q[18],q[30];
-rz(2.0916748502577547) q[30];
-cx q[18],q[30];
-rx(0.9972396929898115) q[18];
-rz(2.0916748502577547) q[31];
-cx q[12],q[31];
-cx q[26],q[31];
-rz(2.0916748502577547) q[31];
-cx q[26],q[31];
-cx q[26],q[105];
-rz(2.0916748502577547) q[32];
-cx q[0],q[32];
-cx q[0],q[42];
-cx q[21],q[32];
-rz(2.0916748502577547) q[32];
-cx q[21],q[32];
-rz(2.0916748502577547) q[33];
-cx q[5],q[33];
-cx q[5],q[46];
-cx q[30],q[33];
-rz(2.0916748502577547) q[33];
-cx q[30],q[33];
-rx(0.9972396929898115) q[33];
-rz(2.0916748502577547) q[34];
-cx q[3],q[34];
-cx q[3],q[35];
-cx q[12],q[34];
-rz(2.0916748502577547) q[34];
-cx q[12],q[34];
-rz(2.0916748502577547) q[35];
-cx q[3],q[35];
-cx q[3],q[39];
-cx q[32],q[35];
-rz(2.0916748502577547) q[35];
-cx q[32],q[35];
-cx q[35],q[130];
-rz(2.0916748502577547) q[36];
-cx q[15],q[36];
-cx q[20],q[36];
-rz(2.0916748502577547) q[36];
-cx q[20],q[36];
-cx q[36],q[94];
-rz(2.0916748502577547) q[37];
-cx q[10],q[37];
-cx q[10],q[41];
-cx q[34],q[37];
-rz(2.0916748502577547) q[37];
-cx q[34],q[37];
-rx(0.9972396929898115) q[34];
-cx q[37],q[85];
-rz(2.0916748502577547) q[38];
-cx q[19],q[38];
-rx(0.9972396929898115) q[19];
-cx q[21],q[38];
-rz(2.0916748502577547) q[38];
-cx q[21],q[38];
-rz(2.0916748502577547) q[39];
-cx q[3],q[39];
-cx q[3],q[40];
-cx q[13],q[39];
-rz(2.0916748502577547) q[39];
-cx q[13],q[39];
-cx q[13],q[56];
-rz(2.0916748502577547) q[40];
-cx q[3],q[40];
-cx q[23],q[40];
-rz(2.0916748502577547) q[40];
-cx q[23],q[40];
-cx q[40],q[119];
-rz(2.0916748502577547) q[41];
-cx q[10],q[41];
-cx q[27],q[41];
-rz(2.0916748502577547) q[41];
-cx q[27],q[41];
-cx q[27],q[72];
-cx q[41],q[67];
-rz(2.0916748502577547) q[42];
-cx q[0],q[42];
-cx q[0],q[48];
-cx q[3],q[42];
-rz(2.0916748502577547) q[42];
-cx q[3],q[42];
-cx q[3],q[43];
-cx q[42],q[78];
-rz(2.0916748502577547) q[43];
-cx q[3],q[43];
-cx q[3],q[44];
-cx q[20],q[43];
-rz(2.0916748502577547) q[43];
-cx q[20],q[43];
-cx q[20],q[121];
-rx(0.9972396929898115) q[43];
-rz(2.0916748502577547) q[44];
-cx q[3],q[44];
-cx q[3],q[49];
-cx q[12],q[44];
-rz(2.0916748502577547) q[44];
-cx q[12],q[44];
-rz(2.0916748502577547) q[45];
-cx q[1],q[45];
-cx q[1],q[57];
-cx q[16],q[45];
-rz(2.0916748502577547) q[45];
-cx q[16],q[45];
-cx q[16],q[59];
-rz(2.0916748502577547) q[46];
-cx q[5],q[46];
-cx q[5],q[65];
-cx q[38],q[46];
-rz(2.0916748502577547) q[46];
-cx q[38],q[46];
-rx(0.9972396929898115) q[38];
-cx q[46],q[120];
-rz(2.0916748502577547) q[47];
-cx q[4],q[47];
-cx q[17],q[47];
-rz(2.0916748502577547) q[47];
-cx q[17],q[47];
-cx q[17],q[53];
-rz(2.0916748502577547) q[48];
-cx q[0],q[48];
-cx q[0],q[51];
-cx q[30],q[48];
-rz(2.0916748502577547) q[48];
-cx q[30],q[48];
-rx(0.9972396929898115) q[48];
-rz(2.0916748502577547) q[49];
-cx q[3],q[49];
-cx q[3],q[50];
-cx q[4],q[49];
-rz(2.0916748502577547) q[49];
-cx q[4],q[49];
-cx q[4],q[61];
-rx(0.9972396929898115) q[49];
-rz(2.0916748502577547) q[50];
-cx q[3],q[50];
-cx q[3],q[52];
-cx q[12],q[50];
-rz(2.0916748502577547) q[50];
-cx q[12],q[50];
-cx q[12],q[63];
-rz(2.0916748502577547) q[51];
-cx q[0],q[51];
-cx q[0],q[62];
-cx q[28],q[51];
-rz(2.0916748502577547) q[51];
-cx q[28],q[51];
-rx(0.9972396929898115) q[51];
-rz(2.0916748502577547) q[52];
-cx q[3],q[52];
-cx q[10],q[52];
-rz(2.0916748502577547) q[52];
-cx q[10],q[52];
-rz(2.0916748502577547) q[53];
-cx q[17],q[53];
-cx q[21],q[53];
-rz(2.0916748502577547) q[53];
-cx q[21],q[53];
-rz(2.0916748502577547) q[54];
-cx q[24],q[54];
-cx q[24],q[58];
-cx q[28],q[54];
-rz(2.0916748502577547) q[54];
-cx q[28],q[54];
-rx(0.9972396929898115) q[54];
-rz(2.0916748502577547) q[55];
-cx q[9],q[55];
-cx q[9],q[80];
-cx q[15],q[55];
-rz(2.0916748502577547) q[55];
-cx q[15],q[55];
-rz(2.0916748502577547) q[56];
-cx q[13],q[56];
-cx q[13],q[68];
-cx q[45],q[56];
-rz(2.0916748502577547) q[56];
-cx q[45],q[56];
-rx(0.9972396929898115) q[45];
-rz(2.0916748502577547) q[57];
-cx q[1],q[57];
-cx q[1],q[60];
-cx q[3],q[57];
-rz(2.0916748502577547) q[57];
-cx q[3],q[57];
-cx q[3],q[70];
-rz(2.0916748502577547) q[58];
-cx q[24],q[58];
-cx q[24],q[86];
-cx q[28],q[58];
-rz(2.0916748502577547) q[58];
-cx q[28],q[58];
-cx q[28],q[87];
-rx(0.9972396929898115) q[58];
-rz(2.0916748502577547) q[59];
-cx q[16],q[59];
-cx q[16],q[73];
-cx q[32],q[59];
-rz(2.0916748502577547) q[59];
-cx q[32],q[59];
-rz(2.0916748502577547) q[60];
-cx q[1],q[60];
-cx q[7],q[60];
-rz(2.0916748502577547) q[60];
-cx q[7],q[60];
-rz(2.0916748502577547) q[61];
-cx q[4],q[61];
-cx q[4],q[99];
-cx q[7],q[61];
-rz(2.0916748502577547) q[61];
-cx q[7],q[61];
-rx(0.9972396929898115) q[61];
-rz(2.0916748502577547) q[62];
-cx q[0],q[62];
-cx q[0],q[64];
-cx q[17],q[62];
-rz(2.0916748502577547) q[62];
-cx q[17],q[62];
-rz(2.0916748502577547) q[63];
-cx q[12],q[63];
-cx q[17],q[63];
-rz(2.0916748502577547) q[63];
-cx q[17],q[63];
-cx q[17],q[66];
-rz(2.0916748502577547) q[64];
-cx q[0],q[64];
-cx q[0],q[75];
-cx q[10],q[64];
-rz(2.0916748502577547) q[64];
-cx q[10],q[64];
-cx q[10],q[98];
-rx(0.9972396929898115) q[64];
-rz(2.0916748502577547) q[65];
-cx q[5],q[65];
-cx q[5],q[76];
-cx q[23],q[65];
-rz(2.0916748502577547) q[65];
-cx q[23],q[65];
-rx(0.9972396929898115) q[23];
-rx(0.9972396929898115) q[65];
-rz(2.0916748502577547) q[66];
-cx q[17],q[66];
-rx(0.9972396929898115) q[17];
-cx q[47],q[66];
-rz(2.0916748502577547) q[66];
-cx q[47],q[66];
-rx(0.9972396929898115) q[66];
-rz(2.0916748502577547) q[67];
-cx q[41],q[67];
-cx q[56],q[67];
-rz(2.0916748502577547) q[67];
-cx q[56],q[67];
-cx q[56],q[74];
-rx(0.9972396929898115) q[67];
-rz(2.0916748502577547) q[68];
-cx q[13],q[68];
-cx q[32],q[68];
-rz(2.0916748502577547) q[68];
-cx q[32],q[68];
-rz(2.0916748502577547) q[69];
-cx q[6],q[69];
-cx q[59],q[69];
-rz(2.0916748502577547) q[69];
-cx q[59],q[69];
-rz(2.0916748502577547) q[70];
-cx q[3],q[70];
-cx q[3],q[71];
-cx q[15],q[70];
-rz(2.0916748502577547) q[70];
-cx q[15],q[70];
-cx q[70],q[84];
-rz(2.0916748502577547) q[71];
-cx q[3],q[71];
-cx q[3],q[77];
-cx q[53],q[71];
-rz(2.0916748502577547) q[71];
-cx q[53],q[71];
-rx(0.9972396929898115) q[71];
-rz(2.0916748502577547) q[72];
-cx q[27],q[72];
-cx q[44],q[72];
-rz(2.0916748502577547) q[72];
-cx q[44],q[72];
-rx(0.9972396929898115) q[44];
-rx(0.9972396929898115) q[72];
-rz(2.0916748502577547) q[73];
-cx q[16],q[73];
-cx q[16],q[101];
-cx q[59],q[73];
-rz(2.0916748502577547) q[73];
-cx q[59],q[73];
-rz(2.0916748502577547) q[74];
-cx q[56],q[74];
-cx q[63],q[74];
-rz(2.0916748502577547) q[74];
-cx q[63],q[74];
-cx q[63],q[122];
-rx(0.9972396929898115) q[74];
-rz(2.0916748502577547) q[75];
-cx q[0],q[75];
-cx q[0],q[82];
-cx q[21],q[75];
-rz(2.0916748502577547) q[75];
-cx q[21],q[75];
-cx q[21],q[81];
-rx(0.9972396929898115) q[75];
-rz(2.0916748502577547) q[76];
-cx q[5],q[76];
-cx q[5],q[89];
-cx q[6],q[76];
-rz(2.0916748502577547) q[76];
-cx q[6],q[76];
-cx q[6],q[79];
-rx(0.9972396929898115) q[76];
-rz(2.0916748502577547) q[77];
-cx q[3],q[77];
-cx q[3],q[88];
-cx q[30],q[77];
-rz(2.0916748502577547) q[77];
-cx q[30],q[77];
-rx(0.9972396929898115) q[30];
-rz(2.0916748502577547) q[78];
-cx q[42],q[78];
-cx q[60],q[78];
-rz(2.0916748502577547) q[78];
-cx q[60],q[78];
-rx(0.9972396929898115) q[78];
-rz(2.0916748502577547) q[79];
-cx q[6],q[79];
-cx q[50],q[79];
-rz(2.0916748502577547) q[79];
-cx q[50],q[79];
-rx(0.9972396929898115) q[79];
-rz(2.0916748502577547) q[80];
-cx q[9],q[80];
-cx q[9],q[144];
-cx q[15],q[80];
-rz(2.0916748502577547) q[80];
-cx q[15],q[80];
-cx q[15],q[90];
-rx(0.9972396929898115) q[80];
-rz(2.0916748502577547) q[81];
-cx q[21],q[81];
-cx q[77],q[81];
-rz(2.0916748502577547) q[81];
-cx q[77],q[81];
-rx(0.9972396929898115) q[77];
-rz(2.0916748502577547) q[82];
-cx q[0],q[82];
-cx q[0],q[91];
-cx q[56],q[82];
-rz(2.0916748502577547) q[82];
-cx q[56],q[82];
-cx q[56],q[96];
-rx(0.9972396929898115) q[82];
-rz(2.0916748502577547) q[83];
-cx q[8],q[83];
-rx(0.9972396929898115) q[8];
-cx q[68],q[83];
-rz(2.0916748502577547) q[83];
-cx q[68],q[83];
-rx(0.9972396929898115) q[68];
-rx(0.9972396929898115) q[83];
-rz(2.0916748502577547) q[84];
-cx q[70],q[84];
-rx(0.9972396929898115) q[70];
-cx q[73],q[84];
-rz(2.0916748502577547) q[84];
-cx q[73],q[84];
-rx(0.9972396929898115) q[73];
-rx(0.9972396929898115) q[84];
-rz(2.0916748502577547) q[85];
-cx q[37],q[85];
-cx q[59],q[85];
-rz(2.0916748502577547) q[85];
-cx q[59],q[85];
-rx(0.9972396929898115) q[85];
-rz(2.0916748502577547) q[86];
-cx q[24],q[86];
-cx q[53],q[86];
-rz(2.0916748502577547) q[86];
-cx q[53],q[86];
-cx q[53],q[124];
-rx(0.9972396929898115) q[86];
-rz(2.0916748502577547) q[87];
-cx q[28],q[87];
-cx q[32],q[87];
-rz(2.0916748502577547) q[87];
-cx q[32],q[87];
-rx(0.9972396929898115) q[87];
-rz(2.0916748502577547) q[88];
-cx q[3],q[88];
-cx q[3],q[100];
-cx q[60],q[88];
-rz(2.0916748502577547) q[88];
-cx q[60],q[88];
-cx q[60],q[138];
-rx(0.9972396929898115) q[88];
-rz(2.0916748502577547) q[89];
-cx q[5],q[89];
-cx q[5],q[95];
-rz(2.0916748502577547) q[90];
-cx q[15],q[90];
-cx q[15],q[92];
-cx q[27],q[90];
-rz(2.0916748502577547) q[90];
-cx q[27],q[90];
-rx(0.9972396929898115) q[90];
-rz(2.0916748502577547) q[91];
-cx q[0],q[91];
-cx q[0],q[93];
-cx q[6],q[91];
-rz(2.0916748502577547) q[91];
-cx q[6],q[91];
-rx(0.9972396929898115) q[6];
-rz(2.0916748502577547) q[92];
-cx q[15],q[92];
-cx q[15],q[108];
-cx q[89],q[92];
-rz(2.0916748502577547) q[92];
-cx q[89],q[92];
-rz(2.0916748502577547) q[93];
-cx q[0],q[93];
-cx q[0],q[123];
-cx q[32],q[93];
-rz(2.0916748502577547) q[93];
-cx q[32],q[93];
-rx(0.9972396929898115) q[93];
-rz(2.0916748502577547) q[94];
-cx q[36],q[94];
-cx q[55],q[94];
-rz(2.0916748502577547) q[94];
-cx q[55],q[94];
-rx(0.9972396929898115) q[55];
-rz(2.0916748502577547) q[95];
-cx q[5],q[95];
-cx q[5],q[106];
-cx q[27],q[95];
-rz(2.0916748502577547) q[95];
-cx q[27],q[95];
-rx(0.9972396929898115) q[27];
-rx(0.9972396929898115) q[95];
-rz(2.0916748502577547) q[96];
-cx q[56],q[96];
-rx(0.9972396929898115) q[56];
-cx q[92],q[96];
-rz(2.0916748502577547) q[96];
-cx q[92],q[96];
-rx(0.9972396929898115) q[96];
-cx q[97],q[145];
-rz(2.0916748502577547) q[98];
-cx q[10],q[98];
-rx(0.9972396929898115) q[10];
-cx q[21],q[98];
-rz(2.0916748502577547) q[98];
-cx q[21],q[98];
-rx(0.9972396929898115) q[98];
-rz(2.0916748502577547) q[99];
-cx q[4],q[99];
-cx q[41],q[99];
-rz(2.0916748502577547) q[99];
-cx q[41],q[99];
-rx(0.9972396929898115) q[41];
-rx(0.9972396929898115) q[99];
-rz(2.0916748502577547) q[100];
-cx q[3],q[100];
-cx q[3],q[102];
-cx q[25],q[100];
-rz(2.0916748502577547) q[100];
-cx q[25],q[100];
-rx(0.9972396929898115) q[25];
-rx(0.9972396929898115) q[100];
-rz(2.0916748502577547) q[101];
-cx q[16],q[101];
-cx q[16],q[103];
-cx q[50],q[101];
-rz(2.0916748502577547) q[101];
-cx q[50],q[101];
-cx q[50],q[129];
-rx(0.9972396929898115) q[101];
-rz(2.0916748502577547) q[102];
-cx q[3],q[102];
-cx q[3],q[107];
-cx q[4],q[102];
-rz(2.0916748502577547) q[102];
-cx q[4],q[102];
-cx q[4],q[127];
-rx(0.9972396929898115) q[102];
-rz(2.0916748502577547) q[103];
-cx q[16],q[103];
-rx(0.9972396929898115) q[16];
-cx q[57],q[103];
-rz(2.0916748502577547) q[103];
-cx q[57],q[103];
-rx(0.9972396929898115) q[57];
-rx(0.9972396929898115) q[103];
-rz(2.0916748502577547) q[105];
-cx q[26],q[105];
-cx q[26],q[117];
-cx q[28],q[105];
-rz(2.0916748502577547) q[105];
-cx q[28],q[105];
-cx q[28],q[116];
-rx(0.9972396929898115) q[105];
-rz(2.0916748502577547) q[106];
-cx q[5],q[106];
-cx q[5],q[109];
-cx q[36],q[106];
-rz(2.0916748502577547) q[106];
-cx q[36],q[106];
-rx(0.9972396929898115) q[106];
-rz(2.0916748502577547) q[107];
-cx q[3],q[107];
-cx q[3],q[110];
-cx q[31],q[107];
-rz(2.0916748502577547) q[107];
-cx q[31],q[107];
-rx(0.9972396929898115) q[107];
-rz(2.0916748502577547) q[108];
-cx q[15],q[108];
-cx q[15],q[115];
-cx q[31],q[108];
-rz(2.0916748502577547) q[108];
-cx q[31],q[108];
-rx(0.9972396929898115) q[31];
-rx(0.9972396929898115) q[108];
-rz(2.0916748502577547) q[109];
-cx q[5],q[109];
-cx q[5],q[118];
-cx q[39],q[109];
-rz(2.0916748502577547) q[109];
-cx q[39],q[109];
-rx(0.9972396929898115) q[39];
-rz(2.0916748502577547) q[110];
-cx q[3],q[110];
-cx q[3],q[111];
-cx q[24],q[110];
-rz(2.0916748502577547) q[110];
-cx q[24],q[110];
-cx q[24],q[137];
-rz(2.0916748502577547) q[111];
-cx q[3],q[111];
-cx q[21],q[111];
-rz(2.0916748502577547) q[111];
-cx q[21],q[111];
-cx q[21],q[112];
-rx(0.9972396929898115) q[111];
-rz(2.0916748502577547) q[112];
-cx q[21],q[112];
-rx(0.9972396929898115) q[21];
-cx q[36],q[112];
-rz(2.0916748502577547) q[112];
-cx q[36],q[112];
-rx(0.9972396929898115) q[36];
-rx(0.9972396929898115) q[112];
-rz(2.0916748502577547) q[115];
-cx q[15],q[115];
-cx q[92],q[115];
-rz(2.0916748502577547) q[115];
-cx q[92],q[115];
-rx(0.9972396929898115) q[115];
-rz(2.0916748502577547) q[116];
-cx q[28],q[116];
-rx(0.9972396929898115) q[28];
-cx q[42],q[116];
-rz(2.0916748502577547) q[116];
-cx q[42],q[116];
-rx(0.9972396929898115) q[42];
-rx(0.9972396929898115) q[116];
-rz(2.0916748502577547) q[117];
-cx q[26],q[117];
-rx(0.9972396929898115) q[26];
-cx q[32],q[117];
-rz(2.0916748502577547) q[117];
-cx q[32],q[117];
-cx q[32],q[131];
-rx(0.9972396929898115) q[117];
-rz(2.0916748502577547) q[118];
-cx q[5],q[118];
-cx q[5],q[139];
-cx q[15],q[118];
-rz(2.0916748502577547) q[118];
-cx q[15],q[118];
-rx(0.9972396929898115) q[15];
-rx(0.9972396929898115) q[118];
-rz(2.0916748502577547) q[119];
-cx q[40],q[119];
-rx(0.9972396929898115) q[40];
-cx q[69],q[119];
-rz(2.0916748502577547) q[119];
-cx q[69],q[119];
-rx(0.9972396929898115) q[69];
-rz(2.0916748502577547) q[120];
-cx q[46],q[120];
-rx(0.9972396929898115) q[46];
-cx q[94],q[120];
-rz(2.0916748502577547) q[120];
-cx q[94],q[120];
-rx(0.9972396929898115) q[94];
-rx(0.9972396929898115) q[120];
-rz(2.0916748502577547) q[121];
-cx q[20],q[121];
-rx(0.9972396929898115) q[20];
-rz(2.0916748502577547) q[122];
-cx q[63],q[122];
-rx(0.9972396929898115) q[63];
-cx q[81],q[122];
-rz(2.0916748502577547) q[122];
-cx q[81],q[122];
-rx(0.9972396929898115) q[122];
-rz(2.0916748502577547) q[123];
-cx q[0],q[123];
-cx q[0],q[126];
-cx q[52],q[123];
-rz(2.0916748502577547) q[123];
-cx q[52],q[123];
-rx(0.9972396929898115) q[52];
-rz(2.0916748502577547) q[124];
-cx q[53],q[124];
-rx(0.9972396929898115) q[53];
-cx q[81],q[124];
-rz(2.0916748502577547) q[124];
-cx q[81],q[124];
-rx(0.9972396929898115) q[81];
-rx(0.9972396929898115) q[124];
-rz(2.0916748502577547) q[126];
-cx q[0],q[126];
-cx q[0],q[135];
-cx q[12],q[126];
-rz(2.0916748502577547) q[126];
-cx q[12],q[126];
-cx q[12],q[141];
-rx(0.9972396929898115) q[126];
-rz(2.0916748502577547) q[127];
-cx q[4],q[127];
-rx(0.9972396929898115) q[4];
-cx q[62],q[127];
-rz(2.0916748502577547) q[127];
-cx q[62],q[127];
-cx q[62],q[128];
-rx(0.9972396929898115) q[127];
-rz(2.0916748502577547) q[128];
-cx q[62],q[128];
-rx(0.9972396929898115) q[62];
-rz(2.0916748502577547) q[129];
-cx q[50],q[129];
-cx q[91],q[129];
-rz(2.0916748502577547) q[129];
-cx q[91],q[129];
-rx(0.9972396929898115) q[91];
-rx(0.9972396929898115) q[129];
-rz(2.0916748502577547) q[130];
-cx q[35],q[130];
-rx(0.9972396929898115) q[35];
-rz(2.0916748502577547) q[131];
-cx q[32],q[131];
-cx q[123],q[131];
-rz(2.0916748502577547) q[131];
-cx q[123],q[131];
-rx(0.9972396929898115) q[123];
-rx(0.9972396929898115) q[131];
-rz(2.0916748502577547) q[135];
-cx q[0],q[135];
-cx q[0],q[140];
-rz(2.0916748502577547) q[137];
-cx q[24],q[137];
-rz(2.0916748502577547) q[138];
-cx q[60],q[138];
-rx(0.9972396929898115) q[60];
-cx q[119],q[138];
-rz(2.0916748502577547) q[138];
-cx q[119],q[138];
-rx(0.9972396929898115) q[119];
-rx(0.9972396929898115) q[138];
-rz(2.0916748502577547) q[139];
-cx q[5],q[139];
-cx q[5],q[142];
-rz(2.0916748502577547) q[140];
-cx q[0],q[140];
-rx(0.9972396929898115) q[0];
-cx q[32],q[140];
-rz(2.0916748502577547) q[140];
-cx q[32],q[140];
-rx(0.9972396929898115) q[32];
-rx(0.9972396929898115) q[140];
-rz(2.0916748502577547) q[141];
-cx q[12],q[141];
-cx q[12],q[143];
-rz(2.0916748502577547) q[142];
-cx q[5],q[142];
-rx(0.9972396929898115) q[5];
-cx q[24],q[142];
-rz(2.0916748502577547) q[142];
-cx q[24],q[142];
-rx(0.9972396929898115) q[24];
-rx(0.9972396929898115) q[142];
-rz(2.0916748502577547) q[143];
-cx q[12],q[143];
-rx(0.9972396929898115) q[12];
-cx q[50],q[143];
-rz(2.0916748502577547) q[143];
-cx q[50],q[143];
-rx(0.9972396929898115) q[50];
-rx(0.9972396929898115) q[143];
-rz(2.0916748502577547) q[144];
-cx q[9],q[144];
-rx(0.9972396929898115) q[9];
-cx q[59],q[144];
-rz(2.0916748502577547) q[144];
-cx q[59],q[144];
-rx(0.9972396929898115) q[59];
-rx(0.9972396929898115) q[144];
-rz(1.0282599028820296) q[145];
-cx q[97],q[145];
-rx(11.2541027864931) q[97];
-cx q[1],q[97];
-rz(2.0916748502577547) q[97];
-cx q[1],q[97];
-cx q[1],q[113];
-cx q[7],q[97];
-rz(2.0916748502577547) q[97];
-cx q[7],q[97];
-cx q[7],q[104];
-rz(2.0916748502577547) q[104];
-cx q[7],q[104];
-cx q[7],q[133];
-cx q[13],q[104];
-rz(2.0916748502577547) q[104];
-cx q[13],q[104];
-cx q[13],q[135];
-cx q[104],q[114];
-rz(2.0916748502577547) q[113];
-cx q[1],q[113];
-rx(0.9972396929898115) q[1];
-cx q[3],q[113];
-rz(2.0916748502577547) q[113];
-cx q[3],q[113];
-cx q[3],q[125];
-rx(0.9972396929898115) q[113];
-rz(2.0916748502577547) q[114];
-cx q[104],q[114];
-cx q[104],q[121];
-cx q[110],q[114];
-rz(2.0916748502577547) q[114];
-cx q[110],q[114];
-rx(0.9972396929898115) q[110];
-rx(0.9972396929898115) q[114];
-rz(2.0916748502577547) q[121];
-cx q[104],q[121];
-rx(0.9972396929898115) q[104];
-cx q[121],q[141];
-rz(2.0916748502577547) q[125];
-cx q[3],q[125];
-cx q[3],q[132];
-cx q[109],q[125];
-rz(2.0916748502577547) q[125];
-cx q[109],q[125];
-cx q[109],q[128];
-rx(0.9972396929898115) q[125];
-rz(2.0916748502577547) q[128];
-cx q[109],q[128];
-cx q[109],q[130];
-rx(0.9972396929898115) q[128];
-rz(2.0916748502577547) q[130];
-cx q[109],q[130];
-rx(0.9972396929898115) q[109];
-rx(0.9972396929898115) q[130];
-rz(2.0916748502577547) q[132];
-cx q[3],q[132];
-cx q[3],q[134];
-cx q[37],q[132];
-rz(2.0916748502577547) q[132];
-cx q[37],q[132];
-rx(0.9972396929898115) q[37];
-rx(0.9972396929898115) q[132];
-rz(2.0916748502577547) q[133];
-cx q[7],q[133];
-rx(0.9972396929898115) q[7];
-cx q[89],q[133];
-rz(2.0916748502577547) q[133];
-cx q[89],q[133];
-rx(0.9972396929898115) q[89];
-cx q[133],q[137];
-rz(2.0916748502577547) q[134];
-cx q[3],q[134];
-cx q[3],q[136];
-cx q[47],q[134];
-rz(2.0916748502577547) q[134];
-cx q[47],q[134];
-rx(0.9972396929898115) q[47];
-rx(0.9972396929898115) q[134];
-rz(2.0916748502577547) q[135];
-cx q[13],q[135];
-rx(0.9972396929898115) q[13];
-rx(0.9972396929898115) q[135];
-rz(2.0916748502577547) q[136];
-cx q[3],q[136];
-cx q[92],q[136];
-rz(2.0916748502577547) q[136];
-cx q[92],q[136];
-rx(0.9972396929898115) q[92];
-rx(0.9972396929898115) q[136];
-rz(2.0916748502577547) q[137];
-cx q[133],q[137];
-cx q[133],q[139];
-rx(0.9972396929898115) q[137];
-rz(2.0916748502577547) q[139];
-cx q[133],q[139];
-rx(0.9972396929898115) q[133];
-rx(0.9972396929898115) q[139];
-rz(2.0916748502577547) q[141];
-cx q[121],q[141];
-rx(0.9972396929898115) q[121];
-rx(0.9972396929898115) q[141];
-rx(11.2541027864931) q[145];
-cx q[3],q[145];
-rz(2.0916748502577547) q[145];
-cx q[3],q[145];
-rx(0.9972396929898115) q[3];
-cx q[97],q[145];
-rz(2.0916748502577547) q[145];
-cx q[97],q[145];
-rx(0.9972396929898115) q[97];
-rx(0.9972396929898115) q[145];
\ No newline at end of file
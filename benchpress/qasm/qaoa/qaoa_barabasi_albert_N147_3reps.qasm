@@ -1,3348 +0,0 @@
-OPENQASM 2.0;
-include "qelib1.inc";
-qreg q[147];
-ry(pi/2) q[0];
-rx(pi) q[0];
-ry(pi/2) q[1];
-rx(pi) q[1];
-cx q[0],q[1];
-rz(3.6756457977804806) q[1];
-cx q[0],q[1];
-ry(pi/2) q[2];
-rx(pi) q[2];
-cx q[0],q[2];
-rz(3.6756457977804806) q[2];
-cx q[0],q[2];
-ry(pi/2) q[3];
-rx(pi) q[3];
-cx q[0],q[3];
-rz(3.6756457977804806) q[3];
-cx q[0],q[3];
-cx q[1],q[3];
-rz(3.6756457977804806) q[3];
-cx q[1],q[3];
-ry(pi/2) q[4];
-rx(pi) q[4];
-cx q[1],q[4];
-rz(3.6756457977804806) q[4];
-cx q[1],q[4];
-cx q[3],q[4];
-rz(3.6756457977804806) q[4];
-cx q[3],q[4];
-ry(pi/2) q[5];
-rx(pi) q[5];
-cx q[1],q[5];
-rz(3.6756457977804806) q[5];
-cx q[1],q[5];
-cx q[3],q[5];
-rz(3.6756457977804806) q[5];
-cx q[3],q[5];
-ry(pi/2) q[6];
-rx(pi) q[6];
-cx q[4],q[6];
-rz(3.6756457977804806) q[6];
-cx q[4],q[6];
-cx q[5],q[6];
-rz(3.6756457977804806) q[6];
-cx q[5],q[6];
-ry(pi/2) q[7];
-rx(pi) q[7];
-cx q[3],q[7];
-rz(3.6756457977804806) q[7];
-cx q[3],q[7];
-cx q[4],q[7];
-rz(3.6756457977804806) q[7];
-cx q[4],q[7];
-ry(pi/2) q[8];
-rx(pi) q[8];
-cx q[3],q[8];
-rz(3.6756457977804806) q[8];
-cx q[3],q[8];
-cx q[5],q[8];
-rz(3.6756457977804806) q[8];
-cx q[5],q[8];
-ry(pi/2) q[9];
-rx(pi) q[9];
-cx q[1],q[9];
-rz(3.6756457977804806) q[9];
-cx q[1],q[9];
-cx q[3],q[9];
-rz(3.6756457977804806) q[9];
-cx q[3],q[9];
-ry(pi/2) q[10];
-rx(pi) q[10];
-cx q[4],q[10];
-rz(3.6756457977804806) q[10];
-cx q[4],q[10];
-cx q[6],q[10];
-rz(3.6756457977804806) q[10];
-cx q[6],q[10];
-ry(pi/2) q[11];
-rx(pi) q[11];
-cx q[5],q[11];
-rz(3.6756457977804806) q[11];
-cx q[5],q[11];
-cx q[6],q[11];
-rz(3.6756457977804806) q[11];
-cx q[6],q[11];
-rx(4.773776175352732) q[11];
-ry(pi/2) q[12];
-rx(pi) q[12];
-cx q[3],q[12];
-rz(3.6756457977804806) q[12];
-cx q[3],q[12];
-cx q[5],q[12];
-rz(3.6756457977804806) q[12];
-cx q[5],q[12];
-ry(pi/2) q[13];
-rx(pi) q[13];
-cx q[4],q[13];
-rz(3.6756457977804806) q[13];
-cx q[4],q[13];
-cx q[5],q[13];
-rz(3.6756457977804806) q[13];
-cx q[5],q[13];
-ry(pi/2) q[14];
-rx(pi) q[14];
-cx q[3],q[14];
-rz(3.6756457977804806) q[14];
-cx q[3],q[14];
-cx q[4],q[14];
-rz(3.6756457977804806) q[14];
-cx q[4],q[14];
-rx(4.773776175352732) q[14];
-ry(pi/2) q[15];
-rx(pi) q[15];
-cx q[0],q[15];
-rz(3.6756457977804806) q[15];
-cx q[0],q[15];
-cx q[3],q[15];
-rz(3.6756457977804806) q[15];
-cx q[3],q[15];
-ry(pi/2) q[16];
-rx(pi) q[16];
-cx q[0],q[16];
-rz(3.6756457977804806) q[16];
-cx q[0],q[16];
-cx q[3],q[16];
-rz(3.6756457977804806) q[16];
-cx q[3],q[16];
-ry(pi/2) q[17];
-rx(pi) q[17];
-cx q[1],q[17];
-rz(3.6756457977804806) q[17];
-cx q[1],q[17];
-cx q[3],q[17];
-rz(3.6756457977804806) q[17];
-cx q[3],q[17];
-ry(pi/2) q[18];
-rx(pi) q[18];
-cx q[3],q[18];
-rz(3.6756457977804806) q[18];
-cx q[3],q[18];
-cx q[4],q[18];
-rz(3.6756457977804806) q[18];
-cx q[4],q[18];
-ry(pi/2) q[19];
-rx(pi) q[19];
-cx q[3],q[19];
-rz(3.6756457977804806) q[19];
-cx q[3],q[19];
-cx q[7],q[19];
-rz(3.6756457977804806) q[19];
-cx q[7],q[19];
-ry(pi/2) q[20];
-rx(pi) q[20];
-cx q[0],q[20];
-rz(3.6756457977804806) q[20];
-cx q[0],q[20];
-cx q[15],q[20];
-rz(3.6756457977804806) q[20];
-cx q[15],q[20];
-ry(pi/2) q[21];
-rx(pi) q[21];
-cx q[4],q[21];
-rz(3.6756457977804806) q[21];
-cx q[4],q[21];
-cx q[15],q[21];
-rz(3.6756457977804806) q[21];
-cx q[15],q[21];
-ry(pi/2) q[22];
-rx(pi) q[22];
-cx q[3],q[22];
-rz(3.6756457977804806) q[22];
-cx q[3],q[22];
-cx q[9],q[22];
-rz(3.6756457977804806) q[22];
-cx q[9],q[22];
-rx(4.773776175352732) q[22];
-ry(pi/2) q[23];
-rx(pi) q[23];
-cx q[3],q[23];
-rz(3.6756457977804806) q[23];
-cx q[3],q[23];
-cx q[17],q[23];
-rz(3.6756457977804806) q[23];
-cx q[17],q[23];
-ry(pi/2) q[24];
-rx(pi) q[24];
-cx q[3],q[24];
-rz(3.6756457977804806) q[24];
-cx q[3],q[24];
-cx q[5],q[24];
-rz(3.6756457977804806) q[24];
-cx q[5],q[24];
-ry(pi/2) q[25];
-rx(pi) q[25];
-cx q[3],q[25];
-rz(3.6756457977804806) q[25];
-cx q[3],q[25];
-cx q[12],q[25];
-rz(3.6756457977804806) q[25];
-cx q[12],q[25];
-ry(pi/2) q[26];
-rx(pi) q[26];
-cx q[3],q[26];
-rz(3.6756457977804806) q[26];
-cx q[3],q[26];
-cx q[21],q[26];
-rz(3.6756457977804806) q[26];
-cx q[21],q[26];
-ry(pi/2) q[27];
-rx(pi) q[27];
-cx q[4],q[27];
-rz(3.6756457977804806) q[27];
-cx q[4],q[27];
-cx q[6],q[27];
-rz(3.6756457977804806) q[27];
-cx q[6],q[27];
-ry(pi/2) q[28];
-rx(pi) q[28];
-cx q[1],q[28];
-rz(3.6756457977804806) q[28];
-cx q[1],q[28];
-cx q[3],q[28];
-rz(3.6756457977804806) q[28];
-cx q[3],q[28];
-ry(pi/2) q[29];
-rx(pi) q[29];
-cx q[1],q[29];
-rz(3.6756457977804806) q[29];
-cx q[1],q[29];
-cx q[3],q[29];
-rz(3.6756457977804806) q[29];
-cx q[3],q[29];
-rx(4.773776175352732) q[29];
-ry(pi/2) q[30];
-rx(pi) q[30];
-cx q[3],q[30];
-rz(3.6756457977804806) q[30];
-cx q[3],q[30];
-cx q[18],q[30];
-rz(3.6756457977804806) q[30];
-cx q[18],q[30];
-rx(4.773776175352732) q[18];
-ry(pi/2) q[31];
-rx(pi) q[31];
-cx q[12],q[31];
-rz(3.6756457977804806) q[31];
-cx q[12],q[31];
-cx q[26],q[31];
-rz(3.6756457977804806) q[31];
-cx q[26],q[31];
-ry(pi/2) q[32];
-rx(pi) q[32];
-cx q[0],q[32];
-rz(3.6756457977804806) q[32];
-cx q[0],q[32];
-cx q[21],q[32];
-rz(3.6756457977804806) q[32];
-cx q[21],q[32];
-ry(pi/2) q[33];
-rx(pi) q[33];
-cx q[5],q[33];
-rz(3.6756457977804806) q[33];
-cx q[5],q[33];
-cx q[30],q[33];
-rz(3.6756457977804806) q[33];
-cx q[30],q[33];
-rx(4.773776175352732) q[33];
-ry(pi/2) q[34];
-rx(pi) q[34];
-cx q[3],q[34];
-rz(3.6756457977804806) q[34];
-cx q[3],q[34];
-cx q[12],q[34];
-rz(3.6756457977804806) q[34];
-cx q[12],q[34];
-ry(pi/2) q[35];
-rx(pi) q[35];
-cx q[3],q[35];
-rz(3.6756457977804806) q[35];
-cx q[3],q[35];
-cx q[32],q[35];
-rz(3.6756457977804806) q[35];
-cx q[32],q[35];
-ry(pi/2) q[36];
-rx(pi) q[36];
-cx q[15],q[36];
-rz(3.6756457977804806) q[36];
-cx q[15],q[36];
-cx q[20],q[36];
-rz(3.6756457977804806) q[36];
-cx q[20],q[36];
-ry(pi/2) q[37];
-rx(pi) q[37];
-cx q[10],q[37];
-rz(3.6756457977804806) q[37];
-cx q[10],q[37];
-cx q[34],q[37];
-rz(3.6756457977804806) q[37];
-cx q[34],q[37];
-rx(4.773776175352732) q[34];
-ry(pi/2) q[38];
-rx(pi) q[38];
-cx q[19],q[38];
-rz(3.6756457977804806) q[38];
-cx q[19],q[38];
-rx(4.773776175352732) q[19];
-cx q[21],q[38];
-rz(3.6756457977804806) q[38];
-cx q[21],q[38];
-ry(pi/2) q[39];
-rx(pi) q[39];
-cx q[3],q[39];
-rz(3.6756457977804806) q[39];
-cx q[3],q[39];
-cx q[13],q[39];
-rz(3.6756457977804806) q[39];
-cx q[13],q[39];
-ry(pi/2) q[40];
-rx(pi) q[40];
-cx q[3],q[40];
-rz(3.6756457977804806) q[40];
-cx q[3],q[40];
-cx q[23],q[40];
-rz(3.6756457977804806) q[40];
-cx q[23],q[40];
-ry(pi/2) q[41];
-rx(pi) q[41];
-cx q[10],q[41];
-rz(3.6756457977804806) q[41];
-cx q[10],q[41];
-cx q[27],q[41];
-rz(3.6756457977804806) q[41];
-cx q[27],q[41];
-ry(pi/2) q[42];
-rx(pi) q[42];
-cx q[0],q[42];
-rz(3.6756457977804806) q[42];
-cx q[0],q[42];
-cx q[3],q[42];
-rz(3.6756457977804806) q[42];
-cx q[3],q[42];
-ry(pi/2) q[43];
-rx(pi) q[43];
-cx q[3],q[43];
-rz(3.6756457977804806) q[43];
-cx q[3],q[43];
-cx q[20],q[43];
-rz(3.6756457977804806) q[43];
-cx q[20],q[43];
-rx(4.773776175352732) q[43];
-ry(pi/2) q[44];
-rx(pi) q[44];
-cx q[3],q[44];
-rz(3.6756457977804806) q[44];
-cx q[3],q[44];
-cx q[12],q[44];
-rz(3.6756457977804806) q[44];
-cx q[12],q[44];
-ry(pi/2) q[45];
-rx(pi) q[45];
-cx q[1],q[45];
-rz(3.6756457977804806) q[45];
-cx q[1],q[45];
-cx q[16],q[45];
-rz(3.6756457977804806) q[45];
-cx q[16],q[45];
-ry(pi/2) q[46];
-rx(pi) q[46];
-cx q[5],q[46];
-rz(3.6756457977804806) q[46];
-cx q[5],q[46];
-cx q[38],q[46];
-rz(3.6756457977804806) q[46];
-cx q[38],q[46];
-rx(4.773776175352732) q[38];
-ry(pi/2) q[47];
-rx(pi) q[47];
-cx q[4],q[47];
-rz(3.6756457977804806) q[47];
-cx q[4],q[47];
-cx q[17],q[47];
-rz(3.6756457977804806) q[47];
-cx q[17],q[47];
-ry(pi/2) q[48];
-rx(pi) q[48];
-cx q[0],q[48];
-rz(3.6756457977804806) q[48];
-cx q[0],q[48];
-cx q[30],q[48];
-rz(3.6756457977804806) q[48];
-cx q[30],q[48];
-rx(4.773776175352732) q[48];
-ry(pi/2) q[49];
-rx(pi) q[49];
-cx q[3],q[49];
-rz(3.6756457977804806) q[49];
-cx q[3],q[49];
-cx q[4],q[49];
-rz(3.6756457977804806) q[49];
-cx q[4],q[49];
-rx(4.773776175352732) q[49];
-ry(pi/2) q[50];
-rx(pi) q[50];
-cx q[3],q[50];
-rz(3.6756457977804806) q[50];
-cx q[3],q[50];
-cx q[12],q[50];
-rz(3.6756457977804806) q[50];
-cx q[12],q[50];
-ry(pi/2) q[51];
-rx(pi) q[51];
-cx q[0],q[51];
-rz(3.6756457977804806) q[51];
-cx q[0],q[51];
-cx q[28],q[51];
-rz(3.6756457977804806) q[51];
-cx q[28],q[51];
-rx(4.773776175352732) q[51];
-ry(pi/2) q[52];
-rx(pi) q[52];
-cx q[3],q[52];
-rz(3.6756457977804806) q[52];
-cx q[3],q[52];
-cx q[10],q[52];
-rz(3.6756457977804806) q[52];
-cx q[10],q[52];
-ry(pi/2) q[53];
-rx(pi) q[53];
-cx q[17],q[53];
-rz(3.6756457977804806) q[53];
-cx q[17],q[53];
-cx q[21],q[53];
-rz(3.6756457977804806) q[53];
-cx q[21],q[53];
-ry(pi/2) q[54];
-rx(pi) q[54];
-cx q[24],q[54];
-rz(3.6756457977804806) q[54];
-cx q[24],q[54];
-cx q[28],q[54];
-rz(3.6756457977804806) q[54];
-cx q[28],q[54];
-rx(4.773776175352732) q[54];
-ry(pi/2) q[55];
-rx(pi) q[55];
-cx q[9],q[55];
-rz(3.6756457977804806) q[55];
-cx q[9],q[55];
-cx q[15],q[55];
-rz(3.6756457977804806) q[55];
-cx q[15],q[55];
-ry(pi/2) q[56];
-rx(pi) q[56];
-cx q[13],q[56];
-rz(3.6756457977804806) q[56];
-cx q[13],q[56];
-cx q[45],q[56];
-rz(3.6756457977804806) q[56];
-cx q[45],q[56];
-rx(4.773776175352732) q[45];
-ry(pi/2) q[57];
-rx(pi) q[57];
-cx q[1],q[57];
-rz(3.6756457977804806) q[57];
-cx q[1],q[57];
-cx q[3],q[57];
-rz(3.6756457977804806) q[57];
-cx q[3],q[57];
-ry(pi/2) q[58];
-rx(pi) q[58];
-cx q[24],q[58];
-rz(3.6756457977804806) q[58];
-cx q[24],q[58];
-cx q[28],q[58];
-rz(3.6756457977804806) q[58];
-cx q[28],q[58];
-rx(4.773776175352732) q[58];
-ry(pi/2) q[59];
-rx(pi) q[59];
-cx q[16],q[59];
-rz(3.6756457977804806) q[59];
-cx q[16],q[59];
-cx q[32],q[59];
-rz(3.6756457977804806) q[59];
-cx q[32],q[59];
-ry(pi/2) q[60];
-rx(pi) q[60];
-cx q[1],q[60];
-rz(3.6756457977804806) q[60];
-cx q[1],q[60];
-cx q[7],q[60];
-rz(3.6756457977804806) q[60];
-cx q[7],q[60];
-ry(pi/2) q[61];
-rx(pi) q[61];
-cx q[4],q[61];
-rz(3.6756457977804806) q[61];
-cx q[4],q[61];
-cx q[7],q[61];
-rz(3.6756457977804806) q[61];
-cx q[7],q[61];
-rx(4.773776175352732) q[61];
-ry(pi/2) q[62];
-rx(pi) q[62];
-cx q[0],q[62];
-rz(3.6756457977804806) q[62];
-cx q[0],q[62];
-cx q[17],q[62];
-rz(3.6756457977804806) q[62];
-cx q[17],q[62];
-ry(pi/2) q[63];
-rx(pi) q[63];
-cx q[12],q[63];
-rz(3.6756457977804806) q[63];
-cx q[12],q[63];
-cx q[17],q[63];
-rz(3.6756457977804806) q[63];
-cx q[17],q[63];
-ry(pi/2) q[64];
-rx(pi) q[64];
-cx q[0],q[64];
-rz(3.6756457977804806) q[64];
-cx q[0],q[64];
-cx q[10],q[64];
-rz(3.6756457977804806) q[64];
-cx q[10],q[64];
-rx(4.773776175352732) q[64];
-ry(pi/2) q[65];
-rx(pi) q[65];
-cx q[5],q[65];
-rz(3.6756457977804806) q[65];
-cx q[5],q[65];
-cx q[23],q[65];
-rz(3.6756457977804806) q[65];
-cx q[23],q[65];
-rx(4.773776175352732) q[23];
-rx(4.773776175352732) q[65];
-ry(pi/2) q[66];
-rx(pi) q[66];
-cx q[17],q[66];
-rz(3.6756457977804806) q[66];
-cx q[17],q[66];
-rx(4.773776175352732) q[17];
-cx q[47],q[66];
-rz(3.6756457977804806) q[66];
-cx q[47],q[66];
-rx(4.773776175352732) q[66];
-ry(pi/2) q[67];
-rx(pi) q[67];
-cx q[41],q[67];
-rz(3.6756457977804806) q[67];
-cx q[41],q[67];
-cx q[56],q[67];
-rz(3.6756457977804806) q[67];
-cx q[56],q[67];
-rx(4.773776175352732) q[67];
-ry(pi/2) q[68];
-rx(pi) q[68];
-cx q[13],q[68];
-rz(3.6756457977804806) q[68];
-cx q[13],q[68];
-cx q[32],q[68];
-rz(3.6756457977804806) q[68];
-cx q[32],q[68];
-ry(pi/2) q[69];
-rx(pi) q[69];
-cx q[6],q[69];
-rz(3.6756457977804806) q[69];
-cx q[6],q[69];
-cx q[59],q[69];
-rz(3.6756457977804806) q[69];
-cx q[59],q[69];
-ry(pi/2) q[70];
-rx(pi) q[70];
-cx q[3],q[70];
-rz(3.6756457977804806) q[70];
-cx q[3],q[70];
-cx q[15],q[70];
-rz(3.6756457977804806) q[70];
-cx q[15],q[70];
-ry(pi/2) q[71];
-rx(pi) q[71];
-cx q[3],q[71];
-rz(3.6756457977804806) q[71];
-cx q[3],q[71];
-cx q[53],q[71];
-rz(3.6756457977804806) q[71];
-cx q[53],q[71];
-rx(4.773776175352732) q[71];
-ry(pi/2) q[72];
-rx(pi) q[72];
-cx q[27],q[72];
-rz(3.6756457977804806) q[72];
-cx q[27],q[72];
-cx q[44],q[72];
-rz(3.6756457977804806) q[72];
-cx q[44],q[72];
-rx(4.773776175352732) q[44];
-rx(4.773776175352732) q[72];
-ry(pi/2) q[73];
-rx(pi) q[73];
-cx q[16],q[73];
-rz(3.6756457977804806) q[73];
-cx q[16],q[73];
-cx q[59],q[73];
-rz(3.6756457977804806) q[73];
-cx q[59],q[73];
-ry(pi/2) q[74];
-rx(pi) q[74];
-cx q[56],q[74];
-rz(3.6756457977804806) q[74];
-cx q[56],q[74];
-cx q[63],q[74];
-rz(3.6756457977804806) q[74];
-cx q[63],q[74];
-rx(4.773776175352732) q[74];
-ry(pi/2) q[75];
-rx(pi) q[75];
-cx q[0],q[75];
-rz(3.6756457977804806) q[75];
-cx q[0],q[75];
-cx q[21],q[75];
-rz(3.6756457977804806) q[75];
-cx q[21],q[75];
-rx(4.773776175352732) q[75];
-ry(pi/2) q[76];
-rx(pi) q[76];
-cx q[5],q[76];
-rz(3.6756457977804806) q[76];
-cx q[5],q[76];
-cx q[6],q[76];
-rz(3.6756457977804806) q[76];
-cx q[6],q[76];
-rx(4.773776175352732) q[76];
-ry(pi/2) q[77];
-rx(pi) q[77];
-cx q[3],q[77];
-rz(3.6756457977804806) q[77];
-cx q[3],q[77];
-cx q[30],q[77];
-rz(3.6756457977804806) q[77];
-cx q[30],q[77];
-rx(4.773776175352732) q[30];
-ry(pi/2) q[78];
-rx(pi) q[78];
-cx q[42],q[78];
-rz(3.6756457977804806) q[78];
-cx q[42],q[78];
-cx q[60],q[78];
-rz(3.6756457977804806) q[78];
-cx q[60],q[78];
-rx(4.773776175352732) q[78];
-ry(pi/2) q[79];
-rx(pi) q[79];
-cx q[6],q[79];
-rz(3.6756457977804806) q[79];
-cx q[6],q[79];
-cx q[50],q[79];
-rz(3.6756457977804806) q[79];
-cx q[50],q[79];
-rx(4.773776175352732) q[79];
-ry(pi/2) q[80];
-rx(pi) q[80];
-cx q[9],q[80];
-rz(3.6756457977804806) q[80];
-cx q[9],q[80];
-cx q[15],q[80];
-rz(3.6756457977804806) q[80];
-cx q[15],q[80];
-rx(4.773776175352732) q[80];
-ry(pi/2) q[81];
-rx(pi) q[81];
-cx q[21],q[81];
-rz(3.6756457977804806) q[81];
-cx q[21],q[81];
-cx q[77],q[81];
-rz(3.6756457977804806) q[81];
-cx q[77],q[81];
-rx(4.773776175352732) q[77];
-ry(pi/2) q[82];
-rx(pi) q[82];
-cx q[0],q[82];
-rz(3.6756457977804806) q[82];
-cx q[0],q[82];
-cx q[56],q[82];
-rz(3.6756457977804806) q[82];
-cx q[56],q[82];
-rx(4.773776175352732) q[82];
-ry(pi/2) q[83];
-rx(pi) q[83];
-cx q[8],q[83];
-rz(3.6756457977804806) q[83];
-cx q[8],q[83];
-rx(4.773776175352732) q[8];
-cx q[68],q[83];
-rz(3.6756457977804806) q[83];
-cx q[68],q[83];
-rx(4.773776175352732) q[68];
-rx(4.773776175352732) q[83];
-ry(pi/2) q[84];
-rx(pi) q[84];
-cx q[70],q[84];
-rz(3.6756457977804806) q[84];
-cx q[70],q[84];
-rx(4.773776175352732) q[70];
-cx q[73],q[84];
-rz(3.6756457977804806) q[84];
-cx q[73],q[84];
-rx(4.773776175352732) q[73];
-rx(4.773776175352732) q[84];
-ry(pi/2) q[85];
-rx(pi) q[85];
-cx q[37],q[85];
-rz(3.6756457977804806) q[85];
-cx q[37],q[85];
-cx q[59],q[85];
-rz(3.6756457977804806) q[85];
-cx q[59],q[85];
-rx(4.773776175352732) q[85];
-ry(pi/2) q[86];
-rx(pi) q[86];
-cx q[24],q[86];
-rz(3.6756457977804806) q[86];
-cx q[24],q[86];
-cx q[53],q[86];
-rz(3.6756457977804806) q[86];
-cx q[53],q[86];
-rx(4.773776175352732) q[86];
-ry(pi/2) q[87];
-rx(pi) q[87];
-cx q[28],q[87];
-rz(3.6756457977804806) q[87];
-cx q[28],q[87];
-cx q[32],q[87];
-rz(3.6756457977804806) q[87];
-cx q[32],q[87];
-rx(4.773776175352732) q[87];
-ry(pi/2) q[88];
-rx(pi) q[88];
-cx q[3],q[88];
-rz(3.6756457977804806) q[88];
-cx q[3],q[88];
-cx q[60],q[88];
-rz(3.6756457977804806) q[88];
-cx q[60],q[88];
-rx(4.773776175352732) q[88];
-ry(pi/2) q[89];
-rx(pi) q[89];
-cx q[2],q[89];
-rz(3.6756457977804806) q[89];
-cx q[2],q[89];
-rx(4.773776175352732) q[2];
-cx q[5],q[89];
-rz(3.6756457977804806) q[89];
-cx q[5],q[89];
-ry(pi/2) q[90];
-rx(pi) q[90];
-cx q[15],q[90];
-rz(3.6756457977804806) q[90];
-cx q[15],q[90];
-cx q[27],q[90];
-rz(3.6756457977804806) q[90];
-cx q[27],q[90];
-rx(4.773776175352732) q[90];
-ry(pi/2) q[91];
-rx(pi) q[91];
-cx q[0],q[91];
-rz(3.6756457977804806) q[91];
-cx q[0],q[91];
-cx q[6],q[91];
-rz(3.6756457977804806) q[91];
-cx q[6],q[91];
-rx(4.773776175352732) q[6];
-ry(pi/2) q[92];
-rx(pi) q[92];
-cx q[15],q[92];
-rz(3.6756457977804806) q[92];
-cx q[15],q[92];
-cx q[89],q[92];
-rz(3.6756457977804806) q[92];
-cx q[89],q[92];
-ry(pi/2) q[93];
-rx(pi) q[93];
-cx q[0],q[93];
-rz(3.6756457977804806) q[93];
-cx q[0],q[93];
-cx q[32],q[93];
-rz(3.6756457977804806) q[93];
-cx q[32],q[93];
-rx(4.773776175352732) q[93];
-ry(pi/2) q[94];
-rx(pi) q[94];
-cx q[36],q[94];
-rz(3.6756457977804806) q[94];
-cx q[36],q[94];
-cx q[55],q[94];
-rz(3.6756457977804806) q[94];
-cx q[55],q[94];
-rx(4.773776175352732) q[55];
-ry(pi/2) q[95];
-rx(pi) q[95];
-cx q[5],q[95];
-rz(3.6756457977804806) q[95];
-cx q[5],q[95];
-cx q[27],q[95];
-rz(3.6756457977804806) q[95];
-cx q[27],q[95];
-rx(4.773776175352732) q[27];
-rx(4.773776175352732) q[95];
-ry(pi/2) q[96];
-rx(pi) q[96];
-cx q[56],q[96];
-rz(3.6756457977804806) q[96];
-cx q[56],q[96];
-rx(4.773776175352732) q[56];
-cx q[92],q[96];
-rz(3.6756457977804806) q[96];
-cx q[92],q[96];
-rx(4.773776175352732) q[96];
-ry(pi/2) q[97];
-rx(pi) q[97];
-cx q[1],q[97];
-rz(3.6756457977804806) q[97];
-cx q[1],q[97];
-cx q[7],q[97];
-rz(3.6756457977804806) q[97];
-cx q[7],q[97];
-ry(pi/2) q[98];
-rx(pi) q[98];
-cx q[10],q[98];
-rz(3.6756457977804806) q[98];
-cx q[10],q[98];
-rx(4.773776175352732) q[10];
-cx q[21],q[98];
-rz(3.6756457977804806) q[98];
-cx q[21],q[98];
-rx(4.773776175352732) q[98];
-ry(pi/2) q[99];
-rx(pi) q[99];
-cx q[4],q[99];
-rz(3.6756457977804806) q[99];
-cx q[4],q[99];
-cx q[41],q[99];
-rz(3.6756457977804806) q[99];
-cx q[41],q[99];
-rx(4.773776175352732) q[41];
-rx(4.773776175352732) q[99];
-ry(pi/2) q[100];
-rx(pi) q[100];
-cx q[3],q[100];
-rz(3.6756457977804806) q[100];
-cx q[3],q[100];
-cx q[25],q[100];
-rz(3.6756457977804806) q[100];
-cx q[25],q[100];
-rx(4.773776175352732) q[25];
-rx(4.773776175352732) q[100];
-ry(pi/2) q[101];
-rx(pi) q[101];
-cx q[16],q[101];
-rz(3.6756457977804806) q[101];
-cx q[16],q[101];
-cx q[50],q[101];
-rz(3.6756457977804806) q[101];
-cx q[50],q[101];
-rx(4.773776175352732) q[101];
-ry(pi/2) q[102];
-rx(pi) q[102];
-cx q[3],q[102];
-rz(3.6756457977804806) q[102];
-cx q[3],q[102];
-cx q[4],q[102];
-rz(3.6756457977804806) q[102];
-cx q[4],q[102];
-rx(4.773776175352732) q[102];
-ry(pi/2) q[103];
-rx(pi) q[103];
-cx q[16],q[103];
-rz(3.6756457977804806) q[103];
-cx q[16],q[103];
-rx(4.773776175352732) q[16];
-cx q[57],q[103];
-rz(3.6756457977804806) q[103];
-cx q[57],q[103];
-rx(4.773776175352732) q[57];
-rx(4.773776175352732) q[103];
-ry(pi/2) q[104];
-rx(pi) q[104];
-cx q[7],q[104];
-rz(3.6756457977804806) q[104];
-cx q[7],q[104];
-cx q[13],q[104];
-rz(3.6756457977804806) q[104];
-cx q[13],q[104];
-ry(pi/2) q[105];
-rx(pi) q[105];
-cx q[26],q[105];
-rz(3.6756457977804806) q[105];
-cx q[26],q[105];
-cx q[28],q[105];
-rz(3.6756457977804806) q[105];
-cx q[28],q[105];
-rx(4.773776175352732) q[105];
-ry(pi/2) q[106];
-rx(pi) q[106];
-cx q[5],q[106];
-rz(3.6756457977804806) q[106];
-cx q[5],q[106];
-cx q[36],q[106];
-rz(3.6756457977804806) q[106];
-cx q[36],q[106];
-rx(4.773776175352732) q[106];
-ry(pi/2) q[107];
-rx(pi) q[107];
-cx q[3],q[107];
-rz(3.6756457977804806) q[107];
-cx q[3],q[107];
-cx q[31],q[107];
-rz(3.6756457977804806) q[107];
-cx q[31],q[107];
-rx(4.773776175352732) q[107];
-ry(pi/2) q[108];
-rx(pi) q[108];
-cx q[15],q[108];
-rz(3.6756457977804806) q[108];
-cx q[15],q[108];
-cx q[31],q[108];
-rz(3.6756457977804806) q[108];
-cx q[31],q[108];
-rx(4.773776175352732) q[31];
-rx(4.773776175352732) q[108];
-ry(pi/2) q[109];
-rx(pi) q[109];
-cx q[5],q[109];
-rz(3.6756457977804806) q[109];
-cx q[5],q[109];
-cx q[39],q[109];
-rz(3.6756457977804806) q[109];
-cx q[39],q[109];
-rx(4.773776175352732) q[39];
-ry(pi/2) q[110];
-rx(pi) q[110];
-cx q[3],q[110];
-rz(3.6756457977804806) q[110];
-cx q[3],q[110];
-cx q[24],q[110];
-rz(3.6756457977804806) q[110];
-cx q[24],q[110];
-ry(pi/2) q[111];
-rx(pi) q[111];
-cx q[3],q[111];
-rz(3.6756457977804806) q[111];
-cx q[3],q[111];
-cx q[21],q[111];
-rz(3.6756457977804806) q[111];
-cx q[21],q[111];
-rx(4.773776175352732) q[111];
-ry(pi/2) q[112];
-rx(pi) q[112];
-cx q[21],q[112];
-rz(3.6756457977804806) q[112];
-cx q[21],q[112];
-rx(4.773776175352732) q[21];
-cx q[36],q[112];
-rz(3.6756457977804806) q[112];
-cx q[36],q[112];
-rx(4.773776175352732) q[36];
-rx(4.773776175352732) q[112];
-ry(pi/2) q[113];
-rx(pi) q[113];
-cx q[1],q[113];
-rz(3.6756457977804806) q[113];
-cx q[1],q[113];
-rx(4.773776175352732) q[1];
-cx q[3],q[113];
-rz(3.6756457977804806) q[113];
-cx q[3],q[113];
-rx(4.773776175352732) q[113];
-ry(pi/2) q[114];
-rx(pi) q[114];
-cx q[104],q[114];
-rz(3.6756457977804806) q[114];
-cx q[104],q[114];
-cx q[110],q[114];
-rz(3.6756457977804806) q[114];
-cx q[110],q[114];
-rx(4.773776175352732) q[110];
-rx(4.773776175352732) q[114];
-ry(pi/2) q[115];
-rx(pi) q[115];
-cx q[15],q[115];
-rz(3.6756457977804806) q[115];
-cx q[15],q[115];
-cx q[92],q[115];
-rz(3.6756457977804806) q[115];
-cx q[92],q[115];
-rx(4.773776175352732) q[115];
-ry(pi/2) q[116];
-rx(pi) q[116];
-cx q[28],q[116];
-rz(3.6756457977804806) q[116];
-cx q[28],q[116];
-rx(4.773776175352732) q[28];
-cx q[42],q[116];
-rz(3.6756457977804806) q[116];
-cx q[42],q[116];
-rx(4.773776175352732) q[42];
-rx(4.773776175352732) q[116];
-ry(pi/2) q[117];
-rx(pi) q[117];
-cx q[26],q[117];
-rz(3.6756457977804806) q[117];
-cx q[26],q[117];
-rx(4.773776175352732) q[26];
-cx q[32],q[117];
-rz(3.6756457977804806) q[117];
-cx q[32],q[117];
-rx(4.773776175352732) q[117];
-ry(pi/2) q[118];
-rx(pi) q[118];
-cx q[5],q[118];
-rz(3.6756457977804806) q[118];
-cx q[5],q[118];
-cx q[15],q[118];
-rz(3.6756457977804806) q[118];
-cx q[15],q[118];
-rx(4.773776175352732) q[15];
-rx(4.773776175352732) q[118];
-ry(pi/2) q[119];
-rx(pi) q[119];
-cx q[40],q[119];
-rz(3.6756457977804806) q[119];
-cx q[40],q[119];
-rx(4.773776175352732) q[40];
-cx q[69],q[119];
-rz(3.6756457977804806) q[119];
-cx q[69],q[119];
-rx(4.773776175352732) q[69];
-ry(pi/2) q[120];
-rx(pi) q[120];
-cx q[46],q[120];
-rz(3.6756457977804806) q[120];
-cx q[46],q[120];
-rx(4.773776175352732) q[46];
-cx q[94],q[120];
-rz(3.6756457977804806) q[120];
-cx q[94],q[120];
-rx(4.773776175352732) q[94];
-rx(4.773776175352732) q[120];
-ry(pi/2) q[121];
-rx(pi) q[121];
-cx q[20],q[121];
-rz(3.6756457977804806) q[121];
-cx q[20],q[121];
-rx(4.773776175352732) q[20];
-cx q[104],q[121];
-rz(3.6756457977804806) q[121];
-cx q[104],q[121];
-rx(4.773776175352732) q[104];
-ry(pi/2) q[122];
-rx(pi) q[122];
-cx q[63],q[122];
-rz(3.6756457977804806) q[122];
-cx q[63],q[122];
-rx(4.773776175352732) q[63];
-cx q[81],q[122];
-rz(3.6756457977804806) q[122];
-cx q[81],q[122];
-rx(4.773776175352732) q[122];
-ry(pi/2) q[123];
-rx(pi) q[123];
-cx q[0],q[123];
-rz(3.6756457977804806) q[123];
-cx q[0],q[123];
-cx q[52],q[123];
-rz(3.6756457977804806) q[123];
-cx q[52],q[123];
-rx(4.773776175352732) q[52];
-ry(pi/2) q[124];
-rx(pi) q[124];
-cx q[53],q[124];
-rz(3.6756457977804806) q[124];
-cx q[53],q[124];
-rx(4.773776175352732) q[53];
-cx q[81],q[124];
-rz(3.6756457977804806) q[124];
-cx q[81],q[124];
-rx(4.773776175352732) q[81];
-rx(4.773776175352732) q[124];
-ry(pi/2) q[125];
-rx(pi) q[125];
-cx q[3],q[125];
-rz(3.6756457977804806) q[125];
-cx q[3],q[125];
-cx q[109],q[125];
-rz(3.6756457977804806) q[125];
-cx q[109],q[125];
-rx(4.773776175352732) q[125];
-ry(pi/2) q[126];
-rx(pi) q[126];
-cx q[0],q[126];
-rz(3.6756457977804806) q[126];
-cx q[0],q[126];
-cx q[12],q[126];
-rz(3.6756457977804806) q[126];
-cx q[12],q[126];
-rx(4.773776175352732) q[126];
-ry(pi/2) q[127];
-rx(pi) q[127];
-cx q[4],q[127];
-rz(3.6756457977804806) q[127];
-cx q[4],q[127];
-cx q[62],q[127];
-rz(3.6756457977804806) q[127];
-cx q[62],q[127];
-rx(4.773776175352732) q[127];
-ry(pi/2) q[128];
-rx(pi) q[128];
-cx q[62],q[128];
-rz(3.6756457977804806) q[128];
-cx q[62],q[128];
-rx(4.773776175352732) q[62];
-cx q[109],q[128];
-rz(3.6756457977804806) q[128];
-cx q[109],q[128];
-rx(4.773776175352732) q[128];
-ry(pi/2) q[129];
-rx(pi) q[129];
-cx q[50],q[129];
-rz(3.6756457977804806) q[129];
-cx q[50],q[129];
-cx q[91],q[129];
-rz(3.6756457977804806) q[129];
-cx q[91],q[129];
-rx(4.773776175352732) q[91];
-rx(4.773776175352732) q[129];
-ry(pi/2) q[130];
-rx(pi) q[130];
-cx q[35],q[130];
-rz(3.6756457977804806) q[130];
-cx q[35],q[130];
-rx(4.773776175352732) q[35];
-cx q[109],q[130];
-rz(3.6756457977804806) q[130];
-cx q[109],q[130];
-rx(4.773776175352732) q[109];
-rx(4.773776175352732) q[130];
-ry(pi/2) q[131];
-rx(pi) q[131];
-cx q[32],q[131];
-rz(3.6756457977804806) q[131];
-cx q[32],q[131];
-cx q[123],q[131];
-rz(3.6756457977804806) q[131];
-cx q[123],q[131];
-rx(4.773776175352732) q[123];
-rx(4.773776175352732) q[131];
-ry(pi/2) q[132];
-rx(pi) q[132];
-cx q[3],q[132];
-rz(3.6756457977804806) q[132];
-cx q[3],q[132];
-cx q[37],q[132];
-rz(3.6756457977804806) q[132];
-cx q[37],q[132];
-rx(4.773776175352732) q[37];
-rx(4.773776175352732) q[132];
-ry(pi/2) q[133];
-rx(pi) q[133];
-cx q[7],q[133];
-rz(3.6756457977804806) q[133];
-cx q[7],q[133];
-rx(4.773776175352732) q[7];
-cx q[89],q[133];
-rz(3.6756457977804806) q[133];
-cx q[89],q[133];
-rx(4.773776175352732) q[89];
-ry(pi/2) q[134];
-rx(pi) q[134];
-cx q[3],q[134];
-rz(3.6756457977804806) q[134];
-cx q[3],q[134];
-cx q[47],q[134];
-rz(3.6756457977804806) q[134];
-cx q[47],q[134];
-rx(4.773776175352732) q[47];
-rx(4.773776175352732) q[134];
-ry(pi/2) q[135];
-rx(pi) q[135];
-cx q[0],q[135];
-rz(3.6756457977804806) q[135];
-cx q[0],q[135];
-cx q[13],q[135];
-rz(3.6756457977804806) q[135];
-cx q[13],q[135];
-rx(4.773776175352732) q[13];
-rx(4.773776175352732) q[135];
-ry(pi/2) q[136];
-rx(pi) q[136];
-cx q[3],q[136];
-rz(3.6756457977804806) q[136];
-cx q[3],q[136];
-cx q[92],q[136];
-rz(3.6756457977804806) q[136];
-cx q[92],q[136];
-rx(4.773776175352732) q[92];
-rx(4.773776175352732) q[136];
-ry(pi/2) q[137];
-rx(pi) q[137];
-cx q[24],q[137];
-rz(3.6756457977804806) q[137];
-cx q[24],q[137];
-cx q[133],q[137];
-rz(3.6756457977804806) q[137];
-cx q[133],q[137];
-rx(4.773776175352732) q[137];
-ry(pi/2) q[138];
-rx(pi) q[138];
-cx q[60],q[138];
-rz(3.6756457977804806) q[138];
-cx q[60],q[138];
-rx(4.773776175352732) q[60];
-cx q[119],q[138];
-rz(3.6756457977804806) q[138];
-cx q[119],q[138];
-rx(4.773776175352732) q[119];
-rx(4.773776175352732) q[138];
-ry(pi/2) q[139];
-rx(pi) q[139];
-cx q[5],q[139];
-rz(3.6756457977804806) q[139];
-cx q[5],q[139];
-cx q[133],q[139];
-rz(3.6756457977804806) q[139];
-cx q[133],q[139];
-rx(4.773776175352732) q[133];
-rx(4.773776175352732) q[139];
-ry(pi/2) q[140];
-rx(pi) q[140];
-cx q[0],q[140];
-rz(3.6756457977804806) q[140];
-cx q[0],q[140];
-cx q[32],q[140];
-rz(3.6756457977804806) q[140];
-cx q[32],q[140];
-rx(4.773776175352732) q[32];
-rx(4.773776175352732) q[140];
-ry(pi/2) q[141];
-rx(pi) q[141];
-cx q[12],q[141];
-rz(3.6756457977804806) q[141];
-cx q[12],q[141];
-cx q[121],q[141];
-rz(3.6756457977804806) q[141];
-cx q[121],q[141];
-rx(4.773776175352732) q[121];
-rx(4.773776175352732) q[141];
-ry(pi/2) q[142];
-rx(pi) q[142];
-cx q[5],q[142];
-rz(3.6756457977804806) q[142];
-cx q[5],q[142];
-rx(4.773776175352732) q[5];
-cx q[24],q[142];
-rz(3.6756457977804806) q[142];
-cx q[24],q[142];
-rx(4.773776175352732) q[24];
-rx(4.773776175352732) q[142];
-ry(pi/2) q[143];
-rx(pi) q[143];
-cx q[12],q[143];
-rz(3.6756457977804806) q[143];
-cx q[12],q[143];
-rx(4.773776175352732) q[12];
-cx q[50],q[143];
-rz(3.6756457977804806) q[143];
-cx q[50],q[143];
-rx(4.773776175352732) q[50];
-rx(4.773776175352732) q[143];
-ry(pi/2) q[144];
-rx(pi) q[144];
-cx q[9],q[144];
-rz(3.6756457977804806) q[144];
-cx q[9],q[144];
-rx(4.773776175352732) q[9];
-cx q[59],q[144];
-rz(3.6756457977804806) q[144];
-cx q[59],q[144];
-rx(4.773776175352732) q[59];
-rx(4.773776175352732) q[144];
-ry(pi/2) q[145];
-rx(pi) q[145];
-cx q[3],q[145];
-rz(3.6756457977804806) q[145];
-cx q[3],q[145];
-rx(4.773776175352732) q[3];
-cx q[97],q[145];
-rz(3.6756457977804806) q[145];
-cx q[97],q[145];
-rx(4.773776175352732) q[97];
-rx(4.773776175352732) q[145];
-ry(pi/2) q[146];
-rx(pi) q[146];
-cx q[0],q[146];
-rz(3.6756457977804806) q[146];
-cx q[0],q[146];
-rx(4.773776175352732) q[0];
-cx q[0],q[1];
-rz(5.637526365349579) q[1];
-cx q[0],q[1];
-cx q[0],q[2];
-rz(5.637526365349579) q[2];
-cx q[0],q[2];
-cx q[0],q[3];
-cx q[2],q[89];
-rz(5.637526365349579) q[3];
-cx q[0],q[3];
-cx q[0],q[15];
-cx q[1],q[3];
-rz(5.637526365349579) q[3];
-cx q[1],q[3];
-cx q[4],q[146];
-rz(5.637526365349579) q[15];
-cx q[0],q[15];
-cx q[0],q[16];
-rz(5.637526365349579) q[16];
-cx q[0],q[16];
-cx q[0],q[20];
-rz(5.637526365349579) q[20];
-cx q[0],q[20];
-cx q[0],q[32];
-rz(5.637526365349579) q[32];
-cx q[0],q[32];
-cx q[0],q[42];
-rz(5.637526365349579) q[42];
-cx q[0],q[42];
-cx q[0],q[48];
-rz(5.637526365349579) q[48];
-cx q[0],q[48];
-cx q[0],q[51];
-rz(5.637526365349579) q[51];
-cx q[0],q[51];
-cx q[0],q[62];
-rz(5.637526365349579) q[62];
-cx q[0],q[62];
-cx q[0],q[64];
-rz(5.637526365349579) q[64];
-cx q[0],q[64];
-cx q[0],q[75];
-rz(5.637526365349579) q[75];
-cx q[0],q[75];
-cx q[0],q[82];
-rz(5.637526365349579) q[82];
-cx q[0],q[82];
-cx q[0],q[91];
-rz(5.637526365349579) q[89];
-cx q[2],q[89];
-rx(0.3232431470747441) q[2];
-rz(5.637526365349579) q[91];
-cx q[0],q[91];
-cx q[0],q[93];
-rz(5.637526365349579) q[93];
-cx q[0],q[93];
-cx q[0],q[123];
-rz(5.637526365349579) q[123];
-cx q[0],q[123];
-cx q[0],q[126];
-rz(5.637526365349579) q[126];
-cx q[0],q[126];
-cx q[0],q[135];
-rz(5.637526365349579) q[135];
-cx q[0],q[135];
-cx q[0],q[140];
-rz(5.637526365349579) q[140];
-cx q[0],q[140];
-rz(3.6756457977804806) q[146];
-cx q[4],q[146];
-rx(4.773776175352732) q[4];
-cx q[1],q[4];
-rz(5.637526365349579) q[4];
-cx q[1],q[4];
-cx q[1],q[5];
-cx q[3],q[4];
-rz(5.637526365349579) q[4];
-cx q[3],q[4];
-cx q[4],q[6];
-rz(5.637526365349579) q[5];
-cx q[1],q[5];
-cx q[1],q[9];
-cx q[3],q[5];
-rz(5.637526365349579) q[5];
-cx q[3],q[5];
-cx q[3],q[7];
-rz(5.637526365349579) q[6];
-cx q[4],q[6];
-cx q[5],q[6];
-rz(5.637526365349579) q[6];
-cx q[5],q[6];
-rz(5.637526365349579) q[7];
-cx q[3],q[7];
-cx q[3],q[8];
-cx q[4],q[7];
-rz(5.637526365349579) q[7];
-cx q[4],q[7];
-cx q[4],q[10];
-rz(5.637526365349579) q[8];
-cx q[3],q[8];
-cx q[5],q[8];
-rz(5.637526365349579) q[8];
-cx q[5],q[8];
-cx q[5],q[11];
-cx q[8],q[83];
-rz(5.637526365349579) q[9];
-cx q[1],q[9];
-cx q[1],q[17];
-cx q[3],q[9];
-rz(5.637526365349579) q[9];
-cx q[3],q[9];
-cx q[3],q[12];
-rz(5.637526365349579) q[10];
-cx q[4],q[10];
-cx q[4],q[13];
-cx q[6],q[10];
-rz(5.637526365349579) q[10];
-cx q[6],q[10];
-cx q[10],q[37];
-rz(5.637526365349579) q[11];
-cx q[5],q[11];
-cx q[6],q[11];
-rz(5.637526365349579) q[11];
-cx q[6],q[11];
-rx(0.3232431470747441) q[11];
-rz(5.637526365349579) q[12];
-cx q[3],q[12];
-cx q[3],q[14];
-cx q[5],q[12];
-rz(5.637526365349579) q[12];
-cx q[5],q[12];
-rz(5.637526365349579) q[13];
-cx q[4],q[13];
-cx q[5],q[13];
-rz(5.637526365349579) q[13];
-cx q[5],q[13];
-rz(5.637526365349579) q[14];
-cx q[3],q[14];
-cx q[3],q[15];
-cx q[4],q[14];
-rz(5.637526365349579) q[14];
-cx q[4],q[14];
-rx(0.3232431470747441) q[14];
-rz(5.637526365349579) q[15];
-cx q[3],q[15];
-cx q[3],q[16];
-cx q[15],q[20];
-rz(5.637526365349579) q[16];
-cx q[3],q[16];
-rz(5.637526365349579) q[17];
-cx q[1],q[17];
-cx q[1],q[28];
-cx q[3],q[17];
-rz(5.637526365349579) q[17];
-cx q[3],q[17];
-cx q[3],q[18];
-rz(5.637526365349579) q[18];
-cx q[3],q[18];
-cx q[3],q[19];
-cx q[4],q[18];
-rz(5.637526365349579) q[18];
-cx q[4],q[18];
-cx q[4],q[21];
-rz(5.637526365349579) q[19];
-cx q[3],q[19];
-cx q[3],q[22];
-cx q[7],q[19];
-rz(5.637526365349579) q[19];
-cx q[7],q[19];
-cx q[19],q[38];
-rz(5.637526365349579) q[20];
-cx q[15],q[20];
-rz(5.637526365349579) q[21];
-cx q[4],q[21];
-cx q[4],q[27];
-cx q[15],q[21];
-rz(5.637526365349579) q[21];
-cx q[15],q[21];
-cx q[15],q[36];
-rz(5.637526365349579) q[22];
-cx q[3],q[22];
-cx q[3],q[23];
-cx q[9],q[22];
-rz(5.637526365349579) q[22];
-cx q[9],q[22];
-cx q[9],q[55];
-rx(0.3232431470747441) q[22];
-rz(5.637526365349579) q[23];
-cx q[3],q[23];
-cx q[3],q[24];
-cx q[17],q[23];
-rz(5.637526365349579) q[23];
-cx q[17],q[23];
-rz(5.637526365349579) q[24];
-cx q[3],q[24];
-cx q[3],q[25];
-cx q[5],q[24];
-rz(5.637526365349579) q[24];
-cx q[5],q[24];
-cx q[5],q[33];
-cx q[24],q[54];
-rz(5.637526365349579) q[25];
-cx q[3],q[25];
-cx q[3],q[26];
-cx q[12],q[25];
-rz(5.637526365349579) q[25];
-cx q[12],q[25];
-cx q[12],q[31];
-rz(5.637526365349579) q[26];
-cx q[3],q[26];
-cx q[21],q[26];
-rz(5.637526365349579) q[26];
-cx q[21],q[26];
-cx q[21],q[32];
-rz(5.637526365349579) q[27];
-cx q[4],q[27];
-cx q[4],q[47];
-cx q[6],q[27];
-rz(5.637526365349579) q[27];
-cx q[6],q[27];
-cx q[6],q[69];
-rz(5.637526365349579) q[28];
-cx q[1],q[28];
-cx q[1],q[29];
-cx q[3],q[28];
-rz(5.637526365349579) q[28];
-cx q[3],q[28];
-cx q[28],q[51];
-rz(5.637526365349579) q[29];
-cx q[1],q[29];
-cx q[1],q[45];
-cx q[3],q[29];
-rz(5.637526365349579) q[29];
-cx q[3],q[29];
-cx q[3],q[30];
-rx(0.3232431470747441) q[29];
-rz(5.637526365349579) q[30];
-cx q[3],q[30];
-cx q[3],q[34];
-cx q[18],q[30];
-rz(5.637526365349579) q[30];
-cx q[18],q[30];
-rx(0.3232431470747441) q[18];
-rz(5.637526365349579) q[31];
-cx q[12],q[31];
-cx q[26],q[31];
-rz(5.637526365349579) q[31];
-cx q[26],q[31];
-cx q[26],q[105];
-rz(5.637526365349579) q[32];
-cx q[21],q[32];
-rz(5.637526365349579) q[33];
-cx q[5],q[33];
-cx q[5],q[46];
-cx q[30],q[33];
-rz(5.637526365349579) q[33];
-cx q[30],q[33];
-cx q[30],q[48];
-rx(0.3232431470747441) q[33];
-rz(5.637526365349579) q[34];
-cx q[3],q[34];
-cx q[3],q[35];
-cx q[12],q[34];
-rz(5.637526365349579) q[34];
-cx q[12],q[34];
-rz(5.637526365349579) q[35];
-cx q[3],q[35];
-cx q[3],q[39];
-cx q[32],q[35];
-rz(5.637526365349579) q[35];
-cx q[32],q[35];
-cx q[35],q[130];
-rz(5.637526365349579) q[36];
-cx q[15],q[36];
-cx q[20],q[36];
-rz(5.637526365349579) q[36];
-cx q[20],q[36];
-cx q[36],q[94];
-rz(5.637526365349579) q[37];
-cx q[10],q[37];
-cx q[10],q[41];
-cx q[34],q[37];
-rz(5.637526365349579) q[37];
-cx q[34],q[37];
-rx(0.3232431470747441) q[34];
-cx q[37],q[85];
-rz(5.637526365349579) q[38];
-cx q[19],q[38];
-rx(0.3232431470747441) q[19];
-cx q[21],q[38];
-rz(5.637526365349579) q[38];
-cx q[21],q[38];
-rz(5.637526365349579) q[39];
-cx q[3],q[39];
-cx q[3],q[40];
-cx q[13],q[39];
-rz(5.637526365349579) q[39];
-cx q[13],q[39];
-cx q[13],q[56];
-rz(5.637526365349579) q[40];
-cx q[3],q[40];
-cx q[3],q[42];
-cx q[23],q[40];
-rz(5.637526365349579) q[40];
-cx q[23],q[40];
-cx q[40],q[119];
-rz(5.637526365349579) q[41];
-cx q[10],q[41];
-cx q[27],q[41];
-rz(5.637526365349579) q[41];
-cx q[27],q[41];
-cx q[27],q[72];
-cx q[41],q[67];
-rz(5.637526365349579) q[42];
-cx q[3],q[42];
-cx q[3],q[43];
-cx q[42],q[78];
-rz(5.637526365349579) q[43];
-cx q[3],q[43];
-cx q[3],q[44];
-cx q[20],q[43];
-rz(5.637526365349579) q[43];
-cx q[20],q[43];
-cx q[20],q[121];
-rx(0.3232431470747441) q[43];
-rz(5.637526365349579) q[44];
-cx q[3],q[44];
-cx q[3],q[49];
-cx q[12],q[44];
-rz(5.637526365349579) q[44];
-cx q[12],q[44];
-rz(5.637526365349579) q[45];
-cx q[1],q[45];
-cx q[1],q[57];
-cx q[16],q[45];
-rz(5.637526365349579) q[45];
-cx q[16],q[45];
-cx q[16],q[59];
-rz(5.637526365349579) q[46];
-cx q[5],q[46];
-cx q[5],q[65];
-cx q[38],q[46];
-rz(5.637526365349579) q[46];
-cx q[38],q[46];
-rx(0.3232431470747441) q[38];
-cx q[46],q[120];
-rz(5.637526365349579) q[47];
-cx q[4],q[47];
-cx q[17],q[47];
-rz(5.637526365349579) q[47];
-cx q[17],q[47];
-cx q[17],q[53];
-rz(5.637526365349579) q[48];
-cx q[30],q[48];
-rx(0.3232431470747441) q[48];
-rz(5.637526365349579) q[49];
-cx q[3],q[49];
-cx q[3],q[50];
-cx q[4],q[49];
-rz(5.637526365349579) q[49];
-cx q[4],q[49];
-cx q[4],q[61];
-rx(0.3232431470747441) q[49];
-rz(5.637526365349579) q[50];
-cx q[3],q[50];
-cx q[3],q[52];
-cx q[12],q[50];
-rz(5.637526365349579) q[50];
-cx q[12],q[50];
-cx q[12],q[63];
-rz(5.637526365349579) q[51];
-cx q[28],q[51];
-rx(0.3232431470747441) q[51];
-rz(5.637526365349579) q[52];
-cx q[3],q[52];
-cx q[10],q[52];
-rz(5.637526365349579) q[52];
-cx q[10],q[52];
-cx q[10],q[64];
-cx q[52],q[123];
-rz(5.637526365349579) q[53];
-cx q[17],q[53];
-cx q[17],q[62];
-cx q[21],q[53];
-rz(5.637526365349579) q[53];
-cx q[21],q[53];
-cx q[21],q[75];
-rz(5.637526365349579) q[54];
-cx q[24],q[54];
-cx q[24],q[58];
-cx q[28],q[54];
-rz(5.637526365349579) q[54];
-cx q[28],q[54];
-rx(0.3232431470747441) q[54];
-rz(5.637526365349579) q[55];
-cx q[9],q[55];
-cx q[9],q[80];
-cx q[15],q[55];
-rz(5.637526365349579) q[55];
-cx q[15],q[55];
-rz(5.637526365349579) q[56];
-cx q[13],q[56];
-cx q[13],q[68];
-cx q[45],q[56];
-rz(5.637526365349579) q[56];
-cx q[45],q[56];
-rx(0.3232431470747441) q[45];
-rz(5.637526365349579) q[57];
-cx q[1],q[57];
-cx q[1],q[60];
-cx q[3],q[57];
-rz(5.637526365349579) q[57];
-cx q[3],q[57];
-cx q[3],q[70];
-rz(5.637526365349579) q[58];
-cx q[24],q[58];
-cx q[24],q[86];
-cx q[28],q[58];
-rz(5.637526365349579) q[58];
-cx q[28],q[58];
-cx q[28],q[87];
-rx(0.3232431470747441) q[58];
-rz(5.637526365349579) q[59];
-cx q[16],q[59];
-cx q[16],q[73];
-cx q[32],q[59];
-rz(5.637526365349579) q[59];
-cx q[32],q[59];
-rz(5.637526365349579) q[60];
-cx q[1],q[60];
-cx q[1],q[97];
-cx q[7],q[60];
-rz(5.637526365349579) q[60];
-cx q[7],q[60];
-rz(5.637526365349579) q[61];
-cx q[4],q[61];
-cx q[4],q[99];
-cx q[7],q[61];
-rz(5.637526365349579) q[61];
-cx q[7],q[61];
-rx(0.3232431470747441) q[61];
-rz(5.637526365349579) q[62];
-cx q[17],q[62];
-rz(5.637526365349579) q[63];
-cx q[12],q[63];
-cx q[12],q[126];
-cx q[17],q[63];
-rz(5.637526365349579) q[63];
-cx q[17],q[63];
-cx q[17],q[66];
-rz(5.637526365349579) q[64];
-cx q[10],q[64];
-cx q[10],q[98];
-rx(0.3232431470747441) q[64];
-rz(5.637526365349579) q[65];
-cx q[5],q[65];
-cx q[5],q[76];
-cx q[23],q[65];
-rz(5.637526365349579) q[65];
-cx q[23],q[65];
-rx(0.3232431470747441) q[23];
-rx(0.3232431470747441) q[65];
-rz(5.637526365349579) q[66];
-cx q[17],q[66];
-rx(0.3232431470747441) q[17];
-cx q[47],q[66];
-rz(5.637526365349579) q[66];
-cx q[47],q[66];
-rx(0.3232431470747441) q[66];
-rz(5.637526365349579) q[67];
-cx q[41],q[67];
-cx q[56],q[67];
-rz(5.637526365349579) q[67];
-cx q[56],q[67];
-cx q[56],q[74];
-rx(0.3232431470747441) q[67];
-rz(5.637526365349579) q[68];
-cx q[13],q[68];
-cx q[32],q[68];
-rz(5.637526365349579) q[68];
-cx q[32],q[68];
-rz(5.637526365349579) q[69];
-cx q[6],q[69];
-cx q[59],q[69];
-rz(5.637526365349579) q[69];
-cx q[59],q[69];
-rz(5.637526365349579) q[70];
-cx q[3],q[70];
-cx q[3],q[71];
-cx q[15],q[70];
-rz(5.637526365349579) q[70];
-cx q[15],q[70];
-cx q[70],q[84];
-rz(5.637526365349579) q[71];
-cx q[3],q[71];
-cx q[3],q[77];
-cx q[53],q[71];
-rz(5.637526365349579) q[71];
-cx q[53],q[71];
-rx(0.3232431470747441) q[71];
-rz(5.637526365349579) q[72];
-cx q[27],q[72];
-cx q[44],q[72];
-rz(5.637526365349579) q[72];
-cx q[44],q[72];
-rx(0.3232431470747441) q[44];
-rx(0.3232431470747441) q[72];
-rz(5.637526365349579) q[73];
-cx q[16],q[73];
-cx q[16],q[101];
-cx q[59],q[73];
-rz(5.637526365349579) q[73];
-cx q[59],q[73];
-rz(5.637526365349579) q[74];
-cx q[56],q[74];
-cx q[56],q[82];
-cx q[63],q[74];
-rz(5.637526365349579) q[74];
-cx q[63],q[74];
-cx q[63],q[122];
-rx(0.3232431470747441) q[74];
-rz(5.637526365349579) q[75];
-cx q[21],q[75];
-cx q[21],q[81];
-rx(0.3232431470747441) q[75];
-rz(5.637526365349579) q[76];
-cx q[5],q[76];
-cx q[5],q[89];
-cx q[6],q[76];
-rz(5.637526365349579) q[76];
-cx q[6],q[76];
-cx q[6],q[79];
-rx(0.3232431470747441) q[76];
-rz(5.637526365349579) q[77];
-cx q[3],q[77];
-cx q[3],q[88];
-cx q[30],q[77];
-rz(5.637526365349579) q[77];
-cx q[30],q[77];
-rx(0.3232431470747441) q[30];
-rz(5.637526365349579) q[78];
-cx q[42],q[78];
-cx q[60],q[78];
-rz(5.637526365349579) q[78];
-cx q[60],q[78];
-rx(0.3232431470747441) q[78];
-rz(5.637526365349579) q[79];
-cx q[6],q[79];
-cx q[6],q[91];
-cx q[50],q[79];
-rz(5.637526365349579) q[79];
-cx q[50],q[79];
-rx(0.3232431470747441) q[79];
-rz(5.637526365349579) q[80];
-cx q[9],q[80];
-cx q[9],q[144];
-cx q[15],q[80];
-rz(5.637526365349579) q[80];
-cx q[15],q[80];
-cx q[15],q[90];
-rx(0.3232431470747441) q[80];
-rz(5.637526365349579) q[81];
-cx q[21],q[81];
-cx q[77],q[81];
-rz(5.637526365349579) q[81];
-cx q[77],q[81];
-rx(0.3232431470747441) q[77];
-rz(5.637526365349579) q[82];
-cx q[56],q[82];
-cx q[56],q[96];
-rx(0.3232431470747441) q[82];
-rz(5.637526365349579) q[83];
-cx q[8],q[83];
-rx(0.3232431470747441) q[8];
-cx q[68],q[83];
-rz(5.637526365349579) q[83];
-cx q[68],q[83];
-rx(0.3232431470747441) q[68];
-rx(0.3232431470747441) q[83];
-rz(5.637526365349579) q[84];
-cx q[70],q[84];
-rx(0.3232431470747441) q[70];
-cx q[73],q[84];
-rz(5.637526365349579) q[84];
-cx q[73],q[84];
-rx(0.3232431470747441) q[73];
-rx(0.3232431470747441) q[84];
-rz(5.637526365349579) q[85];
-cx q[37],q[85];
-cx q[59],q[85];
-rz(5.637526365349579) q[85];
-cx q[59],q[85];
-rx(0.3232431470747441) q[85];
-rz(5.637526365349579) q[86];
-cx q[24],q[86];
-cx q[53],q[86];
-rz(5.637526365349579) q[86];
-cx q[53],q[86];
-cx q[53],q[124];
-rx(0.3232431470747441) q[86];
-rz(5.637526365349579) q[87];
-cx q[28],q[87];
-cx q[32],q[87];
-rz(5.637526365349579) q[87];
-cx q[32],q[87];
-cx q[32],q[93];
-rx(0.3232431470747441) q[87];
-rz(5.637526365349579) q[88];
-cx q[3],q[88];
-cx q[3],q[100];
-cx q[60],q[88];
-rz(5.637526365349579) q[88];
-cx q[60],q[88];
-cx q[60],q[138];
-rx(0.3232431470747441) q[88];
-rz(5.637526365349579) q[89];
-cx q[5],q[89];
-cx q[5],q[95];
-rz(5.637526365349579) q[90];
-cx q[15],q[90];
-cx q[15],q[92];
-cx q[27],q[90];
-rz(5.637526365349579) q[90];
-cx q[27],q[90];
-rx(0.3232431470747441) q[90];
-rz(5.637526365349579) q[91];
-cx q[6],q[91];
-rx(0.3232431470747441) q[6];
-rz(5.637526365349579) q[92];
-cx q[15],q[92];
-cx q[15],q[108];
-cx q[89],q[92];
-rz(5.637526365349579) q[92];
-cx q[89],q[92];
-rz(5.637526365349579) q[93];
-cx q[32],q[93];
-rx(0.3232431470747441) q[93];
-rz(5.637526365349579) q[94];
-cx q[36],q[94];
-cx q[55],q[94];
-rz(5.637526365349579) q[94];
-cx q[55],q[94];
-rx(0.3232431470747441) q[55];
-rz(5.637526365349579) q[95];
-cx q[5],q[95];
-cx q[5],q[106];
-cx q[27],q[95];
-rz(5.637526365349579) q[95];
-cx q[27],q[95];
-rx(0.3232431470747441) q[27];
-rx(0.3232431470747441) q[95];
-rz(5.637526365349579) q[96];
-cx q[56],q[96];
-rx(0.3232431470747441) q[56];
-cx q[92],q[96];
-rz(5.637526365349579) q[96];
-cx q[92],q[96];
-rx(0.3232431470747441) q[96];
-rz(5.637526365349579) q[97];
-cx q[1],q[97];
-cx q[1],q[113];
-cx q[7],q[97];
-rz(5.637526365349579) q[97];
-cx q[7],q[97];
-cx q[7],q[104];
-rz(5.637526365349579) q[98];
-cx q[10],q[98];
-rx(0.3232431470747441) q[10];
-cx q[21],q[98];
-rz(5.637526365349579) q[98];
-cx q[21],q[98];
-rx(0.3232431470747441) q[98];
-rz(5.637526365349579) q[99];
-cx q[4],q[99];
-cx q[41],q[99];
-rz(5.637526365349579) q[99];
-cx q[41],q[99];
-rx(0.3232431470747441) q[41];
-rx(0.3232431470747441) q[99];
-rz(5.637526365349579) q[100];
-cx q[3],q[100];
-cx q[3],q[102];
-cx q[25],q[100];
-rz(5.637526365349579) q[100];
-cx q[25],q[100];
-rx(0.3232431470747441) q[25];
-rx(0.3232431470747441) q[100];
-rz(5.637526365349579) q[101];
-cx q[16],q[101];
-cx q[16],q[103];
-cx q[50],q[101];
-rz(5.637526365349579) q[101];
-cx q[50],q[101];
-cx q[50],q[129];
-rx(0.3232431470747441) q[101];
-rz(5.637526365349579) q[102];
-cx q[3],q[102];
-cx q[3],q[107];
-cx q[4],q[102];
-rz(5.637526365349579) q[102];
-cx q[4],q[102];
-cx q[4],q[127];
-rx(0.3232431470747441) q[102];
-rz(5.637526365349579) q[103];
-cx q[16],q[103];
-rx(0.3232431470747441) q[16];
-cx q[57],q[103];
-rz(5.637526365349579) q[103];
-cx q[57],q[103];
-rx(0.3232431470747441) q[57];
-rx(0.3232431470747441) q[103];
-rz(5.637526365349579) q[104];
-cx q[7],q[104];
-cx q[7],q[133];
-cx q[13],q[104];
-rz(5.637526365349579) q[104];
-cx q[13],q[104];
-cx q[13],q[135];
-cx q[104],q[114];
-rz(5.637526365349579) q[105];
-cx q[26],q[105];
-cx q[26],q[117];
-cx q[28],q[105];
-rz(5.637526365349579) q[105];
-cx q[28],q[105];
-cx q[28],q[116];
-rx(0.3232431470747441) q[105];
-rz(5.637526365349579) q[106];
-cx q[5],q[106];
-cx q[5],q[109];
-cx q[36],q[106];
-rz(5.637526365349579) q[106];
-cx q[36],q[106];
-rx(0.3232431470747441) q[106];
-rz(5.637526365349579) q[107];
-cx q[3],q[107];
-cx q[3],q[110];
-cx q[31],q[107];
-rz(5.637526365349579) q[107];
-cx q[31],q[107];
-rx(0.3232431470747441) q[107];
-rz(5.637526365349579) q[108];
-cx q[15],q[108];
-cx q[15],q[115];
-cx q[31],q[108];
-rz(5.637526365349579) q[108];
-cx q[31],q[108];
-rx(0.3232431470747441) q[31];
-rx(0.3232431470747441) q[108];
-rz(5.637526365349579) q[109];
-cx q[5],q[109];
-cx q[5],q[118];
-cx q[39],q[109];
-rz(5.637526365349579) q[109];
-cx q[39],q[109];
-rx(0.3232431470747441) q[39];
-rz(5.637526365349579) q[110];
-cx q[3],q[110];
-cx q[3],q[111];
-cx q[24],q[110];
-rz(5.637526365349579) q[110];
-cx q[24],q[110];
-cx q[24],q[137];
-rz(5.637526365349579) q[111];
-cx q[3],q[111];
-cx q[21],q[111];
-rz(5.637526365349579) q[111];
-cx q[21],q[111];
-cx q[21],q[112];
-rx(0.3232431470747441) q[111];
-rz(5.637526365349579) q[112];
-cx q[21],q[112];
-rx(0.3232431470747441) q[21];
-cx q[36],q[112];
-rz(5.637526365349579) q[112];
-cx q[36],q[112];
-rx(0.3232431470747441) q[36];
-rx(0.3232431470747441) q[112];
-rz(5.637526365349579) q[113];
-cx q[1],q[113];
-rx(0.3232431470747441) q[1];
-cx q[3],q[113];
-rz(5.637526365349579) q[113];
-cx q[3],q[113];
-cx q[3],q[125];
-rx(0.3232431470747441) q[113];
-rz(5.637526365349579) q[114];
-cx q[104],q[114];
-cx q[110],q[114];
-rz(5.637526365349579) q[114];
-cx q[110],q[114];
-rx(0.3232431470747441) q[110];
-rx(0.3232431470747441) q[114];
-rz(5.637526365349579) q[115];
-cx q[15],q[115];
-cx q[92],q[115];
-rz(5.637526365349579) q[115];
-cx q[92],q[115];
-rx(0.3232431470747441) q[115];
-rz(5.637526365349579) q[116];
-cx q[28],q[116];
-rx(0.3232431470747441) q[28];
-cx q[42],q[116];
-rz(5.637526365349579) q[116];
-cx q[42],q[116];
-rx(0.3232431470747441) q[42];
-rx(0.3232431470747441) q[116];
-rz(5.637526365349579) q[117];
-cx q[26],q[117];
-rx(0.3232431470747441) q[26];
-cx q[32],q[117];
-rz(5.637526365349579) q[117];
-cx q[32],q[117];
-cx q[32],q[131];
-rx(0.3232431470747441) q[117];
-rz(5.637526365349579) q[118];
-cx q[5],q[118];
-cx q[5],q[139];
-cx q[15],q[118];
-rz(5.637526365349579) q[118];
-cx q[15],q[118];
-rx(0.3232431470747441) q[15];
-rx(0.3232431470747441) q[118];
-rz(5.637526365349579) q[119];
-cx q[40],q[119];
-rx(0.3232431470747441) q[40];
-cx q[69],q[119];
-rz(5.637526365349579) q[119];
-cx q[69],q[119];
-rx(0.3232431470747441) q[69];
-rz(5.637526365349579) q[120];
-cx q[46],q[120];
-rx(0.3232431470747441) q[46];
-cx q[94],q[120];
-rz(5.637526365349579) q[120];
-cx q[94],q[120];
-rx(0.3232431470747441) q[94];
-rx(0.3232431470747441) q[120];
-rz(5.637526365349579) q[121];
-cx q[20],q[121];
-rx(0.3232431470747441) q[20];
-cx q[104],q[121];
-rz(5.637526365349579) q[121];
-cx q[104],q[121];
-rx(0.3232431470747441) q[104];
-rz(5.637526365349579) q[122];
-cx q[63],q[122];
-rx(0.3232431470747441) q[63];
-cx q[81],q[122];
-rz(5.637526365349579) q[122];
-cx q[81],q[122];
-rx(0.3232431470747441) q[122];
-rz(5.637526365349579) q[123];
-cx q[52],q[123];
-rx(0.3232431470747441) q[52];
-rz(5.637526365349579) q[124];
-cx q[53],q[124];
-rx(0.3232431470747441) q[53];
-cx q[81],q[124];
-rz(5.637526365349579) q[124];
-cx q[81],q[124];
-rx(0.3232431470747441) q[81];
-rx(0.3232431470747441) q[124];
-rz(5.637526365349579) q[125];
-cx q[3],q[125];
-cx q[3],q[132];
-cx q[109],q[125];
-rz(5.637526365349579) q[125];
-cx q[109],q[125];
-rx(0.3232431470747441) q[125];
-rz(5.637526365349579) q[126];
-cx q[12],q[126];
-cx q[12],q[141];
-rx(0.3232431470747441) q[126];
-rz(5.637526365349579) q[127];
-cx q[4],q[127];
-cx q[62],q[127];
-rz(5.637526365349579) q[127];
-cx q[62],q[127];
-cx q[62],q[128];
-rx(0.3232431470747441) q[127];
-rz(5.637526365349579) q[128];
-cx q[62],q[128];
-rx(0.3232431470747441) q[62];
-cx q[109],q[128];
-rz(5.637526365349579) q[128];
-cx q[109],q[128];
-rx(0.3232431470747441) q[128];
-rz(5.637526365349579) q[129];
-cx q[50],q[129];
-cx q[91],q[129];
-rz(5.637526365349579) q[129];
-cx q[91],q[129];
-rx(0.3232431470747441) q[91];
-rx(0.3232431470747441) q[129];
-rz(5.637526365349579) q[130];
-cx q[35],q[130];
-rx(0.3232431470747441) q[35];
-cx q[109],q[130];
-rz(5.637526365349579) q[130];
-cx q[109],q[130];
-rx(0.3232431470747441) q[109];
-rx(0.3232431470747441) q[130];
-rz(5.637526365349579) q[131];
-cx q[32],q[131];
-cx q[32],q[140];
-cx q[123],q[131];
-rz(5.637526365349579) q[131];
-cx q[123],q[131];
-rx(0.3232431470747441) q[123];
-rx(0.3232431470747441) q[131];
-rz(5.637526365349579) q[132];
-cx q[3],q[132];
-cx q[3],q[134];
-cx q[37],q[132];
-rz(5.637526365349579) q[132];
-cx q[37],q[132];
-rx(0.3232431470747441) q[37];
-rx(0.3232431470747441) q[132];
-rz(5.637526365349579) q[133];
-cx q[7],q[133];
-rx(0.3232431470747441) q[7];
-cx q[89],q[133];
-rz(5.637526365349579) q[133];
-cx q[89],q[133];
-rx(0.3232431470747441) q[89];
-rz(5.637526365349579) q[134];
-cx q[3],q[134];
-cx q[3],q[136];
-cx q[47],q[134];
-rz(5.637526365349579) q[134];
-cx q[47],q[134];
-rx(0.3232431470747441) q[47];
-rx(0.3232431470747441) q[134];
-rz(5.637526365349579) q[135];
-cx q[13],q[135];
-rx(0.3232431470747441) q[13];
-rx(0.3232431470747441) q[135];
-rz(5.637526365349579) q[136];
-cx q[3],q[136];
-cx q[3],q[145];
-cx q[92],q[136];
-rz(5.637526365349579) q[136];
-cx q[92],q[136];
-rx(0.3232431470747441) q[92];
-rx(0.3232431470747441) q[136];
-rz(5.637526365349579) q[137];
-cx q[24],q[137];
-cx q[133],q[137];
-rz(5.637526365349579) q[137];
-cx q[133],q[137];
-rx(0.3232431470747441) q[137];
-rz(5.637526365349579) q[138];
-cx q[60],q[138];
-rx(0.3232431470747441) q[60];
-cx q[119],q[138];
-rz(5.637526365349579) q[138];
-cx q[119],q[138];
-rx(0.3232431470747441) q[119];
-rx(0.3232431470747441) q[138];
-rz(5.637526365349579) q[139];
-cx q[5],q[139];
-cx q[5],q[142];
-cx q[133],q[139];
-rz(5.637526365349579) q[139];
-cx q[133],q[139];
-rx(0.3232431470747441) q[133];
-rx(0.3232431470747441) q[139];
-rz(5.637526365349579) q[140];
-cx q[32],q[140];
-rx(0.3232431470747441) q[32];
-rx(0.3232431470747441) q[140];
-rz(5.637526365349579) q[141];
-cx q[12],q[141];
-cx q[12],q[143];
-cx q[121],q[141];
-rz(5.637526365349579) q[141];
-cx q[121],q[141];
-rx(0.3232431470747441) q[121];
-rx(0.3232431470747441) q[141];
-rz(5.637526365349579) q[142];
-cx q[5],q[142];
-rx(0.3232431470747441) q[5];
-cx q[24],q[142];
-rz(5.637526365349579) q[142];
-cx q[24],q[142];
-rx(0.3232431470747441) q[24];
-rx(0.3232431470747441) q[142];
-rz(5.637526365349579) q[143];
-cx q[12],q[143];
-rx(0.3232431470747441) q[12];
-cx q[50],q[143];
-rz(5.637526365349579) q[143];
-cx q[50],q[143];
-rx(0.3232431470747441) q[50];
-rx(0.3232431470747441) q[143];
-rz(5.637526365349579) q[144];
-cx q[9],q[144];
-rx(0.3232431470747441) q[9];
-cx q[59],q[144];
-rz(5.637526365349579) q[144];
-cx q[59],q[144];
-rx(0.3232431470747441) q[59];
-rx(0.3232431470747441) q[144];
-rz(5.637526365349579) q[145];
-cx q[3],q[145];
-rx(0.3232431470747441) q[3];
-cx q[97],q[145];
-rz(5.637526365349579) q[145];
-cx q[97],q[145];
-rx(0.3232431470747441) q[97];
-rx(0.3232431470747441) q[145];
-rx(4.773776175352732) q[146];
-cx q[0],q[146];
-rz(5.637526365349579) q[146];
-cx q[0],q[146];
-rx(0.3232431470747441) q[0];
-cx q[0],q[1];
-rz(4.486420746131294) q[1];
-cx q[0],q[1];
-cx q[0],q[2];
-rz(4.486420746131294) q[2];
-cx q[0],q[2];
-cx q[0],q[3];
-cx q[2],q[89];
-rz(4.486420746131294) q[3];
-cx q[0],q[3];
-cx q[0],q[15];
-cx q[1],q[3];
-rz(4.486420746131294) q[3];
-cx q[1],q[3];
-cx q[4],q[146];
-rz(4.486420746131294) q[15];
-cx q[0],q[15];
-cx q[0],q[16];
-rz(4.486420746131294) q[16];
-cx q[0],q[16];
-cx q[0],q[20];
-rz(4.486420746131294) q[20];
-cx q[0],q[20];
-cx q[0],q[32];
-rz(4.486420746131294) q[32];
-cx q[0],q[32];
-cx q[0],q[42];
-rz(4.486420746131294) q[42];
-cx q[0],q[42];
-cx q[0],q[48];
-rz(4.486420746131294) q[48];
-cx q[0],q[48];
-cx q[0],q[51];
-rz(4.486420746131294) q[51];
-cx q[0],q[51];
-cx q[0],q[62];
-rz(4.486420746131294) q[62];
-cx q[0],q[62];
-cx q[0],q[64];
-rz(4.486420746131294) q[64];
-cx q[0],q[64];
-cx q[0],q[75];
-rz(4.486420746131294) q[75];
-cx q[0],q[75];
-cx q[0],q[82];
-rz(4.486420746131294) q[82];
-cx q[0],q[82];
-cx q[0],q[91];
-rz(4.486420746131294) q[89];
-cx q[2],q[89];
-rx(9.833906463076955) q[2];
-rz(4.486420746131294) q[91];
-cx q[0],q[91];
-cx q[0],q[93];
-rz(4.486420746131294) q[93];
-cx q[0],q[93];
-cx q[0],q[123];
-rz(4.486420746131294) q[123];
-cx q[0],q[123];
-cx q[0],q[126];
-rz(4.486420746131294) q[126];
-cx q[0],q[126];
-cx q[0],q[135];
-rz(4.486420746131294) q[135];
-cx q[0],q[135];
-cx q[0],q[140];
-rz(4.486420746131294) q[140];
-cx q[0],q[140];
-rz(5.637526365349579) q[146];
-cx q[4],q[146];
-rx(0.3232431470747441) q[4];
-cx q[1],q[4];
-rz(4.486420746131294) q[4];
-cx q[1],q[4];
-cx q[1],q[5];
-cx q[3],q[4];
-rz(4.486420746131294) q[4];
-cx q[3],q[4];
-cx q[4],q[6];
-rz(4.486420746131294) q[5];
-cx q[1],q[5];
-cx q[1],q[9];
-cx q[3],q[5];
-rz(4.486420746131294) q[5];
-cx q[3],q[5];
-cx q[3],q[7];
-rz(4.486420746131294) q[6];
-cx q[4],q[6];
-cx q[5],q[6];
-rz(4.486420746131294) q[6];
-cx q[5],q[6];
-rz(4.486420746131294) q[7];
-cx q[3],q[7];
-cx q[3],q[8];
-cx q[4],q[7];
-rz(4.486420746131294) q[7];
-cx q[4],q[7];
-cx q[4],q[10];
-rz(4.486420746131294) q[8];
-cx q[3],q[8];
-cx q[5],q[8];
-rz(4.486420746131294) q[8];
-cx q[5],q[8];
-cx q[5],q[11];
-cx q[8],q[83];
-rz(4.486420746131294) q[9];
-cx q[1],q[9];
-cx q[1],q[17];
-cx q[3],q[9];
-rz(4.486420746131294) q[9];
-cx q[3],q[9];
-cx q[3],q[12];
-rz(4.486420746131294) q[10];
-cx q[4],q[10];
-cx q[4],q[13];
-cx q[6],q[10];
-rz(4.486420746131294) q[10];
-cx q[6],q[10];
-cx q[10],q[37];
-rz(4.486420746131294) q[11];
-cx q[5],q[11];
-cx q[6],q[11];
-rz(4.486420746131294) q[11];
-cx q[6],q[11];
-rx(9.833906463076955) q[11];
-rz(4.486420746131294) q[12];
-cx q[3],q[12];
-cx q[3],q[14];
-cx q[5],q[12];
-rz(4.486420746131294) q[12];
-cx q[5],q[12];
-rz(4.486420746131294) q[13];
-cx q[4],q[13];
-cx q[5],q[13];
-rz(4.486420746131294) q[13];
-cx q[5],q[13];
-rz(4.486420746131294) q[14];
-cx q[3],q[14];
-cx q[3],q[15];
-cx q[4],q[14];
-rz(4.486420746131294) q[14];
-cx q[4],q[14];
-rx(9.833906463076955) q[14];
-rz(4.486420746131294) q[15];
-cx q[3],q[15];
-cx q[3],q[16];
-cx q[15],q[20];
-rz(4.486420746131294) q[16];
-cx q[3],q[16];
-rz(4.486420746131294) q[17];
-cx q[1],q[17];
-cx q[1],q[28];
-cx q[3],q[17];
-rz(4.486420746131294) q[17];
-cx q[3],q[17];
-cx q[3],q[18];
-rz(4.486420746131294) q[18];
-cx q[3],q[18];
-cx q[3],q[19];
-cx q[4],q[18];
-rz(4.486420746131294) q[18];
-cx q[4],q[18];
-cx q[4],q[21];
-rz(4.486420746131294) q[19];
-cx q[3],q[19];
-cx q[3],q[22];
-cx q[7],q[19];
-rz(4.486420746131294) q[19];
-cx q[7],q[19];
-cx q[19],q[38];
-rz(4.486420746131294) q[20];
-cx q[15],q[20];
-rz(4.486420746131294) q[21];
-cx q[4],q[21];
-cx q[4],q[27];
-cx q[15],q[21];
-rz(4.486420746131294) q[21];
-cx q[15],q[21];
-cx q[15],q[36];
-rz(4.486420746131294) q[22];
-cx q[3],q[22];
-cx q[3],q[23];
-cx q[9],q[22];
-rz(4.486420746131294) q[22];
-cx q[9],q[22];
-cx q[9],q[55];
-rx(9.833906463076955) q[22];
-rz(4.486420746131294) q[23];
-cx q[3],q[23];
-cx q[3],q[24];
-cx q[17],q[23];
-rz(4.486420746131294) q[23];
-cx q[17],q[23];
-rz(4.486420746131294) q[24];
-cx q[3],q[24];
-cx q[3],q[25];
-cx q[5],q[24];
-rz(4.486420746131294) q[24];
-cx q[5],q[24];
-cx q[5],q[33];
-cx q[24],q[54];
-rz(4.486420746131294) q[25];
-cx q[3],q[25];
-cx q[3],q[26];
-cx q[12],q[25];
-rz(4.486420746131294) q[25];
-cx q[12],q[25];
-cx q[12],q[31];
-rz(4.486420746131294) q[26];
-cx q[3],q[26];
-cx q[21],q[26];
-rz(4.486420746131294) q[26];
-cx q[21],q[26];
-cx q[21],q[32];
-rz(4.486420746131294) q[27];
-cx q[4],q[27];
-cx q[4],q[47];
-cx q[6],q[27];
-rz(4.486420746131294) q[27];
-cx q[6],q[27];
-cx q[6],q[69];
-rz(4.486420746131294) q[28];
-cx q[1],q[28];
-cx q[1],q[29];
-cx q[3],q[28];
-rz(4.486420746131294) q[28];
-cx q[3],q[28];
-cx q[28],q[51];
-rz(4.486420746131294) q[29];
-cx q[1],q[29];
-cx q[1],q[45];
-cx q[3],q[29];
-rz(4.486420746131294) q[29];
-cx q[3],q[29];
-cx q[3],q[30];
-rx(9.833906463076955) q[29];
-rz(4.486420746131294) q[30];
-cx q[3],q[30];
-cx q[3],q[34];
-cx q[18],q[30];
-rz(4.486420746131294) q[30];
-cx q[18],q[30];
-rx(9.833906463076955) q[18];
-rz(4.486420746131294) q[31];
-cx q[12],q[31];
-cx q[26],q[31];
-rz(4.486420746131294) q[31];
-cx q[26],q[31];
-cx q[26],q[105];
-rz(4.486420746131294) q[32];
-cx q[21],q[32];
-rz(4.486420746131294) q[33];
-cx q[5],q[33];
-cx q[5],q[46];
-cx q[30],q[33];
-rz(4.486420746131294) q[33];
-cx q[30],q[33];
-cx q[30],q[48];
-rx(9.833906463076955) q[33];
-rz(4.486420746131294) q[34];
-cx q[3],q[34];
-cx q[3],q[35];
-cx q[12],q[34];
-rz(4.486420746131294) q[34];
-cx q[12],q[34];
-rz(4.486420746131294) q[35];
-cx q[3],q[35];
-cx q[3],q[39];
-cx q[32],q[35];
-rz(4.486420746131294) q[35];
-cx q[32],q[35];
-cx q[35],q[130];
-rz(4.486420746131294) q[36];
-cx q[15],q[36];
-cx q[20],q[36];
-rz(4.486420746131294) q[36];
-cx q[20],q[36];
-cx q[36],q[94];
-rz(4.486420746131294) q[37];
-cx q[10],q[37];
-cx q[10],q[41];
-cx q[34],q[37];
-rz(4.486420746131294) q[37];
-cx q[34],q[37];
-rx(9.833906463076955) q[34];
-cx q[37],q[85];
-rz(4.486420746131294) q[38];
-cx q[19],q[38];
-rx(9.833906463076955) q[19];
-cx q[21],q[38];
-rz(4.486420746131294) q[38];
-cx q[21],q[38];
-rz(4.486420746131294) q[39];
-cx q[3],q[39];
-cx q[3],q[40];
-cx q[13],q[39];
-rz(4.486420746131294) q[39];
-cx q[13],q[39];
-cx q[13],q[56];
-rz(4.486420746131294) q[40];
-cx q[3],q[40];
-cx q[3],q[42];
-cx q[23],q[40];
-rz(4.486420746131294) q[40];
-cx q[23],q[40];
-cx q[40],q[119];
-rz(4.486420746131294) q[41];
-cx q[10],q[41];
-cx q[27],q[41];
-rz(4.486420746131294) q[41];
-cx q[27],q[41];
-cx q[27],q[72];
-cx q[41],q[67];
-rz(4.486420746131294) q[42];
-cx q[3],q[42];
-cx q[3],q[43];
-cx q[42],q[78];
-rz(4.486420746131294) q[43];
-cx q[3],q[43];
-cx q[3],q[44];
-cx q[20],q[43];
-rz(4.486420746131294) q[43];
-cx q[20],q[43];
-cx q[20],q[121];
-rx(9.833906463076955) q[43];
-rz(4.486420746131294) q[44];
-cx q[3],q[44];
-cx q[3],q[49];
-cx q[12],q[44];
-rz(4.486420746131294) q[44];
-cx q[12],q[44];
-rz(4.486420746131294) q[45];
-cx q[1],q[45];
-cx q[1],q[57];
-cx q[16],q[45];
-rz(4.486420746131294) q[45];
-cx q[16],q[45];
-cx q[16],q[59];
-rz(4.486420746131294) q[46];
-cx q[5],q[46];
-cx q[5],q[65];
-cx q[38],q[46];
-rz(4.486420746131294) q[46];
-cx q[38],q[46];
-rx(9.833906463076955) q[38];
-cx q[46],q[120];
-rz(4.486420746131294) q[47];
-cx q[4],q[47];
-cx q[17],q[47];
-rz(4.486420746131294) q[47];
-cx q[17],q[47];
-cx q[17],q[53];
-rz(4.486420746131294) q[48];
-cx q[30],q[48];
-rx(9.833906463076955) q[48];
-rz(4.486420746131294) q[49];
-cx q[3],q[49];
-cx q[3],q[50];
-cx q[4],q[49];
-rz(4.486420746131294) q[49];
-cx q[4],q[49];
-cx q[4],q[61];
-rx(9.833906463076955) q[49];
-rz(4.486420746131294) q[50];
-cx q[3],q[50];
-cx q[3],q[52];
-cx q[12],q[50];
-rz(4.486420746131294) q[50];
-cx q[12],q[50];
-cx q[12],q[63];
-rz(4.486420746131294) q[51];
-cx q[28],q[51];
-rx(9.833906463076955) q[51];
-rz(4.486420746131294) q[52];
-cx q[3],q[52];
-cx q[10],q[52];
-rz(4.486420746131294) q[52];
-cx q[10],q[52];
-cx q[10],q[64];
-cx q[52],q[123];
-rz(4.486420746131294) q[53];
-cx q[17],q[53];
-cx q[17],q[62];
-cx q[21],q[53];
-rz(4.486420746131294) q[53];
-cx q[21],q[53];
-cx q[21],q[75];
-rz(4.486420746131294) q[54];
-cx q[24],q[54];
-cx q[24],q[58];
-cx q[28],q[54];
-rz(4.486420746131294) q[54];
-cx q[28],q[54];
-rx(9.833906463076955) q[54];
-rz(4.486420746131294) q[55];
-cx q[9],q[55];
-cx q[9],q[80];
-cx q[15],q[55];
-rz(4.486420746131294) q[55];
-cx q[15],q[55];
-rz(4.486420746131294) q[56];
-cx q[13],q[56];
-cx q[13],q[68];
-cx q[45],q[56];
-rz(4.486420746131294) q[56];
-cx q[45],q[56];
-rx(9.833906463076955) q[45];
-rz(4.486420746131294) q[57];
-cx q[1],q[57];
-cx q[1],q[60];
-cx q[3],q[57];
-rz(4.486420746131294) q[57];
-cx q[3],q[57];
-cx q[3],q[70];
-rz(4.486420746131294) q[58];
-cx q[24],q[58];
-cx q[24],q[86];
-cx q[28],q[58];
-rz(4.486420746131294) q[58];
-cx q[28],q[58];
-cx q[28],q[87];
-rx(9.833906463076955) q[58];
-rz(4.486420746131294) q[59];
-cx q[16],q[59];
-cx q[16],q[73];
-cx q[32],q[59];
-rz(4.486420746131294) q[59];
-cx q[32],q[59];
-rz(4.486420746131294) q[60];
-cx q[1],q[60];
-cx q[1],q[97];
-cx q[7],q[60];
-rz(4.486420746131294) q[60];
-cx q[7],q[60];
-rz(4.486420746131294) q[61];
-cx q[4],q[61];
-cx q[4],q[99];
-cx q[7],q[61];
-rz(4.486420746131294) q[61];
-cx q[7],q[61];
-rx(9.833906463076955) q[61];
-rz(4.486420746131294) q[62];
-cx q[17],q[62];
-rz(4.486420746131294) q[63];
-cx q[12],q[63];
-cx q[12],q[126];
-cx q[17],q[63];
-rz(4.486420746131294) q[63];
-cx q[17],q[63];
-cx q[17],q[66];
-rz(4.486420746131294) q[64];
-cx q[10],q[64];
-cx q[10],q[98];
-rx(9.833906463076955) q[64];
-rz(4.486420746131294) q[65];
-cx q[5],q[65];
-cx q[5],q[76];
-cx q[23],q[65];
-rz(4.486420746131294) q[65];
-cx q[23],q[65];
-rx(9.833906463076955) q[23];
-rx(9.833906463076955) q[65];
-rz(4.486420746131294) q[66];
-cx q[17],q[66];
-rx(9.833906463076955) q[17];
-cx q[47],q[66];
-rz(4.486420746131294) q[66];
-cx q[47],q[66];
-rx(9.833906463076955) q[66];
-rz(4.486420746131294) q[67];
-cx q[41],q[67];
-cx q[56],q[67];
-rz(4.486420746131294) q[67];
-cx q[56],q[67];
-cx q[56],q[74];
-rx(9.833906463076955) q[67];
-rz(4.486420746131294) q[68];
-cx q[13],q[68];
-cx q[32],q[68];
-rz(4.486420746131294) q[68];
-cx q[32],q[68];
-rz(4.486420746131294) q[69];
-cx q[6],q[69];
-cx q[59],q[69];
-rz(4.486420746131294) q[69];
-cx q[59],q[69];
-rz(4.486420746131294) q[70];
-cx q[3],q[70];
-cx q[3],q[71];
-cx q[15],q[70];
-rz(4.486420746131294) q[70];
-cx q[15],q[70];
-cx q[70],q[84];
-rz(4.486420746131294) q[71];
-cx q[3],q[71];
-cx q[3],q[77];
-cx q[53],q[71];
-rz(4.486420746131294) q[71];
-cx q[53],q[71];
-rx(9.833906463076955) q[71];
-rz(4.486420746131294) q[72];
-cx q[27],q[72];
-cx q[44],q[72];
-rz(4.486420746131294) q[72];
-cx q[44],q[72];
-rx(9.833906463076955) q[44];
-rx(9.833906463076955) q[72];
-rz(4.486420746131294) q[73];
-cx q[16],q[73];
-cx q[16],q[101];
-cx q[59],q[73];
-rz(4.486420746131294) q[73];
-cx q[59],q[73];
-rz(4.486420746131294) q[74];
-cx q[56],q[74];
-cx q[56],q[82];
-cx q[63],q[74];
-rz(4.486420746131294) q[74];
-cx q[63],q[74];
-cx q[63],q[122];
-rx(9.833906463076955) q[74];
-rz(4.486420746131294) q[75];
-cx q[21],q[75];
-cx q[21],q[81];
-rx(9.833906463076955) q[75];
-rz(4.486420746131294) q[76];
-cx q[5],q[76];
-cx q[5],q[89];
-cx q[6],q[76];
-rz(4.486420746131294) q[76];
-cx q[6],q[76];
-cx q[6],q[79];
-rx(9.833906463076955) q[76];
-rz(4.486420746131294) q[77];
-cx q[3],q[77];
-cx q[3],q[88];
-cx q[30],q[77];
-rz(4.486420746131294) q[77];
-cx q[30],q[77];
-rx(9.833906463076955) q[30];
-rz(4.486420746131294) q[78];
-cx q[42],q[78];
-cx q[60],q[78];
-rz(4.486420746131294) q[78];
-cx q[60],q[78];
-rx(9.833906463076955) q[78];
-rz(4.486420746131294) q[79];
-cx q[6],q[79];
-cx q[6],q[91];
-cx q[50],q[79];
-rz(4.486420746131294) q[79];
-cx q[50],q[79];
-rx(9.833906463076955) q[79];
-rz(4.486420746131294) q[80];
-cx q[9],q[80];
-cx q[9],q[144];
-cx q[15],q[80];
-rz(4.486420746131294) q[80];
-cx q[15],q[80];
-cx q[15],q[90];
-rx(9.833906463076955) q[80];
-rz(4.486420746131294) q[81];
-cx q[21],q[81];
-cx q[77],q[81];
-rz(4.486420746131294) q[81];
-cx q[77],q[81];
-rx(9.833906463076955) q[77];
-rz(4.486420746131294) q[82];
-cx q[56],q[82];
-cx q[56],q[96];
-rx(9.833906463076955) q[82];
-rz(4.486420746131294) q[83];
-cx q[8],q[83];
-rx(9.833906463076955) q[8];
-cx q[68],q[83];
-rz(4.486420746131294) q[83];
-cx q[68],q[83];
-rx(9.833906463076955) q[68];
-rx(9.833906463076955) q[83];
-rz(4.486420746131294) q[84];
-cx q[70],q[84];
-rx(9.833906463076955) q[70];
-cx q[73],q[84];
-rz(4.486420746131294) q[84];
-cx q[73],q[84];
-rx(9.833906463076955) q[73];
-rx(9.833906463076955) q[84];
-rz(4.486420746131294) q[85];
-cx q[37],q[85];
-cx q[59],q[85];
-rz(4.486420746131294) q[85];
-cx q[59],q[85];
-rx(9.833906463076955) q[85];
-rz(4.486420746131294) q[86];
-cx q[24],q[86];
-cx q[53],q[86];
-rz(4.486420746131294) q[86];
-cx q[53],q[86];
-cx q[53],q[124];
-rx(9.833906463076955) q[86];
-rz(4.486420746131294) q[87];
-cx q[28],q[87];
-cx q[32],q[87];
-rz(4.486420746131294) q[87];
-cx q[32],q[87];
-cx q[32],q[93];
-rx(9.833906463076955) q[87];
-rz(4.486420746131294) q[88];
-cx q[3],q[88];
-cx q[3],q[100];
-cx q[60],q[88];
-rz(4.486420746131294) q[88];
-cx q[60],q[88];
-cx q[60],q[138];
-rx(9.833906463076955) q[88];
-rz(4.486420746131294) q[89];
-cx q[5],q[89];
-cx q[5],q[95];
-rz(4.486420746131294) q[90];
-cx q[15],q[90];
-cx q[15],q[92];
-cx q[27],q[90];
-rz(4.486420746131294) q[90];
-cx q[27],q[90];
-rx(9.833906463076955) q[90];
-rz(4.486420746131294) q[91];
-cx q[6],q[91];
-rx(9.833906463076955) q[6];
-rz(4.486420746131294) q[92];
-cx q[15],q[92];
-cx q[15],q[108];
-cx q[89],q[92];
-rz(4.486420746131294) q[92];
-cx q[89],q[92];
-rz(4.486420746131294) q[93];
-cx q[32],q[93];
-rx(9.833906463076955) q[93];
-rz(4.486420746131294) q[94];
-cx q[36],q[94];
-cx q[55],q[94];
-rz(4.486420746131294) q[94];
-cx q[55],q[94];
-rx(9.833906463076955) q[55];
-rz(4.486420746131294) q[95];
-cx q[5],q[95];
-cx q[5],q[106];
-cx q[27],q[95];
-rz(4.486420746131294) q[95];
-cx q[27],q[95];
-rx(9.833906463076955) q[27];
-rx(9.833906463076955) q[95];
-rz(4.486420746131294) q[96];
-cx q[56],q[96];
-rx(9.833906463076955) q[56];
-cx q[92],q[96];
-rz(4.486420746131294) q[96];
-cx q[92],q[96];
-rx(9.833906463076955) q[96];
-rz(4.486420746131294) q[97];
-cx q[1],q[97];
-cx q[1],q[113];
-cx q[7],q[97];
-rz(4.486420746131294) q[97];
-cx q[7],q[97];
-cx q[7],q[104];
-rz(4.486420746131294) q[98];
-cx q[10],q[98];
-rx(9.833906463076955) q[10];
-cx q[21],q[98];
-rz(4.486420746131294) q[98];
-cx q[21],q[98];
-rx(9.833906463076955) q[98];
-rz(4.486420746131294) q[99];
-cx q[4],q[99];
-cx q[41],q[99];
-rz(4.486420746131294) q[99];
-cx q[41],q[99];
-rx(9.833906463076955) q[41];
-rx(9.833906463076955) q[99];
-rz(4.486420746131294) q[100];
-cx q[3],q[100];
-cx q[3],q[102];
-cx q[25],q[100];
-rz(4.486420746131294) q[100];
-cx q[25],q[100];
-rx(9.833906463076955) q[25];
-rx(9.833906463076955) q[100];
-rz(4.486420746131294) q[101];
-cx q[16],q[101];
-cx q[16],q[103];
-cx q[50],q[101];
-rz(4.486420746131294) q[101];
-cx q[50],q[101];
-cx q[50],q[129];
-rx(9.833906463076955) q[101];
-rz(4.486420746131294) q[102];
-cx q[3],q[102];
-cx q[3],q[107];
-cx q[4],q[102];
-rz(4.486420746131294) q[102];
-cx q[4],q[102];
-cx q[4],q[127];
-rx(9.833906463076955) q[102];
-rz(4.486420746131294) q[103];
-cx q[16],q[103];
-rx(9.833906463076955) q[16];
-cx q[57],q[103];
-rz(4.486420746131294) q[103];
-cx q[57],q[103];
-rx(9.833906463076955) q[57];
-rx(9.833906463076955) q[103];
-rz(4.486420746131294) q[104];
-cx q[7],q[104];
-cx q[7],q[133];
-cx q[13],q[104];
-rz(4.486420746131294) q[104];
-cx q[13],q[104];
-cx q[13],q[135];
-cx q[104],q[114];
-rz(4.486420746131294) q[105];
-cx q[26],q[105];
-cx q[26],q[117];
-cx q[28],q[105];
-rz(4.486420746131294) q[105];
-cx q[28],q[105];
-cx q[28],q[116];
-rx(9.833906463076955) q[105];
-rz(4.486420746131294) q[106];
-cx q[5],q[106];
-cx q[5],q[109];
-cx q[36],q[106];
-rz(4.486420746131294) q[106];
-cx q[36],q[106];
-rx(9.833906463076955) q[106];
-rz(4.486420746131294) q[107];
-cx q[3],q[107];
-cx q[3],q[110];
-cx q[31],q[107];
-rz(4.486420746131294) q[107];
-cx q[31],q[107];
-rx(9.833906463076955) q[107];
-rz(4.486420746131294) q[108];
-cx q[15],q[108];
-cx q[15],q[115];
-cx q[31],q[108];
-rz(4.486420746131294) q[108];
-cx q[31],q[108];
-rx(9.833906463076955) q[31];
-rx(9.833906463076955) q[108];
-rz(4.486420746131294) q[109];
-cx q[5],q[109];
-cx q[5],q[118];
-cx q[39],q[109];
-rz(4.486420746131294) q[109];
-cx q[39],q[109];
-rx(9.833906463076955) q[39];
-rz(4.486420746131294) q[110];
-cx q[3],q[110];
-cx q[3],q[111];
-cx q[24],q[110];
-rz(4.486420746131294) q[110];
-cx q[24],q[110];
-cx q[24],q[137];
-rz(4.486420746131294) q[111];
-cx q[3],q[111];
-cx q[21],q[111];
-rz(4.486420746131294) q[111];
-cx q[21],q[111];
-cx q[21],q[112];
-rx(9.833906463076955) q[111];
-rz(4.486420746131294) q[112];
-cx q[21],q[112];
-rx(9.833906463076955) q[21];
-cx q[36],q[112];
-rz(4.486420746131294) q[112];
-cx q[36],q[112];
-rx(9.833906463076955) q[36];
-rx(9.833906463076955) q[112];
-rz(4.486420746131294) q[113];
-cx q[1],q[113];
-rx(9.833906463076955) q[1];
-cx q[3],q[113];
-rz(4.486420746131294) q[113];
-cx q[3],q[113];
-cx q[3],q[125];
-rx(9.833906463076955) q[113];
-rz(4.486420746131294) q[114];
-cx q[104],q[114];
-cx q[110],q[114];
-rz(4.486420746131294) q[114];
-cx q[110],q[114];
-rx(9.833906463076955) q[110];
-rx(9.833906463076955) q[114];
-rz(4.486420746131294) q[115];
-cx q[15],q[115];
-cx q[92],q[115];
-rz(4.486420746131294) q[115];
-cx q[92],q[115];
-rx(9.833906463076955) q[115];
-rz(4.486420746131294) q[116];
-cx q[28],q[116];
-rx(9.833906463076955) q[28];
-cx q[42],q[116];
-rz(4.486420746131294) q[116];
-cx q[42],q[116];
-rx(9.833906463076955) q[42];
-rx(9.833906463076955) q[116];
-rz(4.486420746131294) q[117];
-cx q[26],q[117];
-rx(9.833906463076955) q[26];
-cx q[32],q[117];
-rz(4.486420746131294) q[117];
-cx q[32],q[117];
-cx q[32],q[131];
-rx(9.833906463076955) q[117];
-rz(4.486420746131294) q[118];
-cx q[5],q[118];
-cx q[5],q[139];
-cx q[15],q[118];
-rz(4.486420746131294) q[118];
-cx q[15],q[118];
-rx(9.833906463076955) q[15];
-rx(9.833906463076955) q[118];
-rz(4.486420746131294) q[119];
-cx q[40],q[119];
-rx(9.833906463076955) q[40];
-cx q[69],q[119];
-rz(4.486420746131294) q[119];
-cx q[69],q[119];
-rx(9.833906463076955) q[69];
-rz(4.486420746131294) q[120];
-cx q[46],q[120];
-rx(9.833906463076955) q[46];
-cx q[94],q[120];
-rz(4.486420746131294) q[120];
-cx q[94],q[120];
-rx(9.833906463076955) q[94];
-rx(9.833906463076955) q[120];
-rz(4.486420746131294) q[121];
-cx q[20],q[121];
-rx(9.833906463076955) q[20];
-cx q[104],q[121];
-rz(4.486420746131294) q[121];
-cx q[104],q[121];
-rx(9.833906463076955) q[104];
-rz(4.486420746131294) q[122];
-cx q[63],q[122];
-rx(9.833906463076955) q[63];
-cx q[81],q[122];
-rz(4.486420746131294) q[122];
-cx q[81],q[122];
-rx(9.833906463076955) q[122];
-rz(4.486420746131294) q[123];
-cx q[52],q[123];
-rx(9.833906463076955) q[52];
-rz(4.486420746131294) q[124];
-cx q[53],q[124];
-rx(9.833906463076955) q[53];
-cx q[81],q[124];
-rz(4.486420746131294) q[124];
-cx q[81],q[124];
-rx(9.833906463076955) q[81];
-rx(9.833906463076955) q[124];
-rz(4.486420746131294) q[125];
-cx q[3],q[125];
-cx q[3],q[132];
-cx q[109],q[125];
-rz(4.486420746131294) q[125];
-cx q[109],q[125];
-rx(9.833906463076955) q[125];
-rz(4.486420746131294) q[126];
-cx q[12],q[126];
-cx q[12],q[141];
-rx(9.833906463076955) q[126];
-rz(4.486420746131294) q[127];
-cx q[4],q[127];
-cx q[62],q[127];
-rz(4.486420746131294) q[127];
-cx q[62],q[127];
-cx q[62],q[128];
-rx(9.833906463076955) q[127];
-rz(4.486420746131294) q[128];
-cx q[62],q[128];
-rx(9.833906463076955) q[62];
-cx q[109],q[128];
-rz(4.486420746131294) q[128];
-cx q[109],q[128];
-rx(9.833906463076955) q[128];
-rz(4.486420746131294) q[129];
-cx q[50],q[129];
-cx q[91],q[129];
-rz(4.486420746131294) q[129];
-cx q[91],q[129];
-rx(9.833906463076955) q[91];
-rx(9.833906463076955) q[129];
-rz(4.486420746131294) q[130];
-cx q[35],q[130];
-rx(9.833906463076955) q[35];
-cx q[109],q[130];
-rz(4.486420746131294) q[130];
-cx q[109],q[130];
-rx(9.833906463076955) q[109];
-rx(9.833906463076955) q[130];
-rz(4.486420746131294) q[131];
-cx q[32],q[131];
-cx q[32],q[140];
-cx q[123],q[131];
-rz(4.486420746131294) q[131];
-cx q[123],q[131];
-rx(9.833906463076955) q[123];
-rx(9.833906463076955) q[131];
-rz(4.486420746131294) q[132];
-cx q[3],q[132];
-cx q[3],q[134];
-cx q[37],q[132];
-rz(4.486420746131294) q[132];
-cx q[37],q[132];
-rx(9.833906463076955) q[37];
-rx(9.833906463076955) q[132];
-rz(4.486420746131294) q[133];
-cx q[7],q[133];
-rx(9.833906463076955) q[7];
-cx q[89],q[133];
-rz(4.486420746131294) q[133];
-cx q[89],q[133];
-rx(9.833906463076955) q[89];
-rz(4.486420746131294) q[134];
-cx q[3],q[134];
-cx q[3],q[136];
-cx q[47],q[134];
-rz(4.486420746131294) q[134];
-cx q[47],q[134];
-rx(9.833906463076955) q[47];
-rx(9.833906463076955) q[134];
-rz(4.486420746131294) q[135];
-cx q[13],q[135];
-rx(9.833906463076955) q[13];
-rx(9.833906463076955) q[135];
-rz(4.486420746131294) q[136];
-cx q[3],q[136];
-cx q[3],q[145];
-cx q[92],q[136];
-rz(4.486420746131294) q[136];
-cx q[92],q[136];
-rx(9.833906463076955) q[92];
-rx(9.833906463076955) q[136];
-rz(4.486420746131294) q[137];
-cx q[24],q[137];
-cx q[133],q[137];
-rz(4.486420746131294) q[137];
-cx q[133],q[137];
-rx(9.833906463076955) q[137];
-rz(4.486420746131294) q[138];
-cx q[60],q[138];
-rx(9.833906463076955) q[60];
-cx q[119],q[138];
-rz(4.486420746131294) q[138];
-cx q[119],q[138];
-rx(9.833906463076955) q[119];
-rx(9.833906463076955) q[138];
-rz(4.486420746131294) q[139];
-cx q[5],q[139];
-cx q[5],q[142];
-cx q[133],q[139];
-rz(4.486420746131294) q[139];
-cx q[133],q[139];
-rx(9.833906463076955) q[133];
-rx(9.833906463076955) q[139];
-rz(4.486420746131294) q[140];
-cx q[32],q[140];
-rx(9.833906463076955) q[32];
-rx(9.833906463076955) q[140];
-rz(4.486420746131294) q[141];
-cx q[12],q[141];
-cx q[12],q[143];
-cx q[121],q[141];
-rz(4.486420746131294) q[141];
-cx q[121],q[141];
-rx(9.833906463076955) q[121];
-rx(9.833906463076955) q[141];
-rz(4.486420746131294) q[142];
-cx q[5],q[142];
-rx(9.833906463076955) q[5];
-cx q[24],q[142];
-rz(4.486420746131294) q[142];
-cx q[24],q[142];
-rx(9.833906463076955) q[24];
-rx(9.833906463076955) q[142];
-rz(4.486420746131294) q[143];
-cx q[12],q[143];
-rx(9.833906463076955) q[12];
-cx q[50],q[143];
-rz(4.486420746131294) q[143];
-cx q[50],q[143];
-rx(9.833906463076955) q[50];
-rx(9.833906463076955) q[143];
-rz(4.486420746131294) q[144];
-cx q[9],q[144];
-rx(9.833906463076955) q[9];
-cx q[59],q[144];
-rz(4.486420746131294) q[144];
-cx q[59],q[144];
-rx(9.833906463076955) q[59];
-rx(9.833906463076955) q[144];
-rz(4.486420746131294) q[145];
-cx q[3],q[145];
-rx(9.833906463076955) q[3];
-cx q[97],q[145];
-rz(4.486420746131294) q[145];
-cx q[97],q[145];
-rx(9.833906463076955) q[97];
-rx(9.833906463076955) q[145];
-rx(0.3232431470747441) q[146];
-cx q[0],q[146];
-rz(4.486420746131294) q[146];
-cx q[0],q[146];
-rx(9.833906463076955) q[0];
-cx q[4],q[146];
-rz(4.486420746131294) q[146];
-cx q[4],q[146];
-rx(9.833906463076955) q[4];
-rx(9.833906463076955) q[146];
\ No newline at end of file
@@ -1,3371 +0,0 @@
-OPENQASM 2.0;
-include "qelib1.inc";
-qreg q[148];
-ry(pi/2) q[0];
-rx(pi) q[0];
-ry(pi/2) q[1];
-rx(pi) q[1];
-cx q[0],q[1];
-rz(5.0806978167011625) q[1];
-cx q[0],q[1];
-ry(pi/2) q[2];
-rx(pi) q[2];
-cx q[0],q[2];
-rz(5.0806978167011625) q[2];
-cx q[0],q[2];
-ry(pi/2) q[3];
-rx(pi) q[3];
-cx q[0],q[3];
-rz(5.0806978167011625) q[3];
-cx q[0],q[3];
-cx q[1],q[3];
-rz(5.0806978167011625) q[3];
-cx q[1],q[3];
-ry(pi/2) q[4];
-rx(pi) q[4];
-cx q[1],q[4];
-rz(5.0806978167011625) q[4];
-cx q[1],q[4];
-cx q[3],q[4];
-rz(5.0806978167011625) q[4];
-cx q[3],q[4];
-ry(pi/2) q[5];
-rx(pi) q[5];
-cx q[1],q[5];
-rz(5.0806978167011625) q[5];
-cx q[1],q[5];
-cx q[3],q[5];
-rz(5.0806978167011625) q[5];
-cx q[3],q[5];
-ry(pi/2) q[6];
-rx(pi) q[6];
-cx q[4],q[6];
-rz(5.0806978167011625) q[6];
-cx q[4],q[6];
-cx q[5],q[6];
-rz(5.0806978167011625) q[6];
-cx q[5],q[6];
-ry(pi/2) q[7];
-rx(pi) q[7];
-cx q[3],q[7];
-rz(5.0806978167011625) q[7];
-cx q[3],q[7];
-cx q[4],q[7];
-rz(5.0806978167011625) q[7];
-cx q[4],q[7];
-ry(pi/2) q[8];
-rx(pi) q[8];
-cx q[3],q[8];
-rz(5.0806978167011625) q[8];
-cx q[3],q[8];
-cx q[5],q[8];
-rz(5.0806978167011625) q[8];
-cx q[5],q[8];
-ry(pi/2) q[9];
-rx(pi) q[9];
-cx q[1],q[9];
-rz(5.0806978167011625) q[9];
-cx q[1],q[9];
-cx q[3],q[9];
-rz(5.0806978167011625) q[9];
-cx q[3],q[9];
-ry(pi/2) q[10];
-rx(pi) q[10];
-cx q[4],q[10];
-rz(5.0806978167011625) q[10];
-cx q[4],q[10];
-cx q[6],q[10];
-rz(5.0806978167011625) q[10];
-cx q[6],q[10];
-ry(pi/2) q[11];
-rx(pi) q[11];
-cx q[5],q[11];
-rz(5.0806978167011625) q[11];
-cx q[5],q[11];
-cx q[6],q[11];
-rz(5.0806978167011625) q[11];
-cx q[6],q[11];
-rx(7.343253806982983) q[11];
-ry(pi/2) q[12];
-rx(pi) q[12];
-cx q[3],q[12];
-rz(5.0806978167011625) q[12];
-cx q[3],q[12];
-cx q[5],q[12];
-rz(5.0806978167011625) q[12];
-cx q[5],q[12];
-ry(pi/2) q[13];
-rx(pi) q[13];
-cx q[4],q[13];
-rz(5.0806978167011625) q[13];
-cx q[4],q[13];
-cx q[5],q[13];
-rz(5.0806978167011625) q[13];
-cx q[5],q[13];
-ry(pi/2) q[14];
-rx(pi) q[14];
-cx q[3],q[14];
-rz(5.0806978167011625) q[14];
-cx q[3],q[14];
-cx q[4],q[14];
-rz(5.0806978167011625) q[14];
-cx q[4],q[14];
-rx(7.343253806982983) q[14];
-ry(pi/2) q[15];
-rx(pi) q[15];
-cx q[0],q[15];
-rz(5.0806978167011625) q[15];
-cx q[0],q[15];
-cx q[3],q[15];
-rz(5.0806978167011625) q[15];
-cx q[3],q[15];
-ry(pi/2) q[16];
-rx(pi) q[16];
-cx q[0],q[16];
-rz(5.0806978167011625) q[16];
-cx q[0],q[16];
-cx q[3],q[16];
-rz(5.0806978167011625) q[16];
-cx q[3],q[16];
-ry(pi/2) q[17];
-rx(pi) q[17];
-cx q[1],q[17];
-rz(5.0806978167011625) q[17];
-cx q[1],q[17];
-cx q[3],q[17];
-rz(5.0806978167011625) q[17];
-cx q[3],q[17];
-ry(pi/2) q[18];
-rx(pi) q[18];
-cx q[3],q[18];
-rz(5.0806978167011625) q[18];
-cx q[3],q[18];
-cx q[4],q[18];
-rz(5.0806978167011625) q[18];
-cx q[4],q[18];
-ry(pi/2) q[19];
-rx(pi) q[19];
-cx q[3],q[19];
-rz(5.0806978167011625) q[19];
-cx q[3],q[19];
-cx q[7],q[19];
-rz(5.0806978167011625) q[19];
-cx q[7],q[19];
-ry(pi/2) q[20];
-rx(pi) q[20];
-cx q[0],q[20];
-rz(5.0806978167011625) q[20];
-cx q[0],q[20];
-cx q[15],q[20];
-rz(5.0806978167011625) q[20];
-cx q[15],q[20];
-ry(pi/2) q[21];
-rx(pi) q[21];
-cx q[4],q[21];
-rz(5.0806978167011625) q[21];
-cx q[4],q[21];
-cx q[15],q[21];
-rz(5.0806978167011625) q[21];
-cx q[15],q[21];
-ry(pi/2) q[22];
-rx(pi) q[22];
-cx q[3],q[22];
-rz(5.0806978167011625) q[22];
-cx q[3],q[22];
-cx q[9],q[22];
-rz(5.0806978167011625) q[22];
-cx q[9],q[22];
-rx(7.343253806982983) q[22];
-ry(pi/2) q[23];
-rx(pi) q[23];
-cx q[3],q[23];
-rz(5.0806978167011625) q[23];
-cx q[3],q[23];
-cx q[17],q[23];
-rz(5.0806978167011625) q[23];
-cx q[17],q[23];
-ry(pi/2) q[24];
-rx(pi) q[24];
-cx q[3],q[24];
-rz(5.0806978167011625) q[24];
-cx q[3],q[24];
-cx q[5],q[24];
-rz(5.0806978167011625) q[24];
-cx q[5],q[24];
-ry(pi/2) q[25];
-rx(pi) q[25];
-cx q[3],q[25];
-rz(5.0806978167011625) q[25];
-cx q[3],q[25];
-cx q[12],q[25];
-rz(5.0806978167011625) q[25];
-cx q[12],q[25];
-ry(pi/2) q[26];
-rx(pi) q[26];
-cx q[3],q[26];
-rz(5.0806978167011625) q[26];
-cx q[3],q[26];
-cx q[21],q[26];
-rz(5.0806978167011625) q[26];
-cx q[21],q[26];
-ry(pi/2) q[27];
-rx(pi) q[27];
-cx q[4],q[27];
-rz(5.0806978167011625) q[27];
-cx q[4],q[27];
-cx q[6],q[27];
-rz(5.0806978167011625) q[27];
-cx q[6],q[27];
-ry(pi/2) q[28];
-rx(pi) q[28];
-cx q[1],q[28];
-rz(5.0806978167011625) q[28];
-cx q[1],q[28];
-cx q[3],q[28];
-rz(5.0806978167011625) q[28];
-cx q[3],q[28];
-ry(pi/2) q[29];
-rx(pi) q[29];
-cx q[1],q[29];
-rz(5.0806978167011625) q[29];
-cx q[1],q[29];
-cx q[3],q[29];
-rz(5.0806978167011625) q[29];
-cx q[3],q[29];
-rx(7.343253806982983) q[29];
-ry(pi/2) q[30];
-rx(pi) q[30];
-cx q[3],q[30];
-rz(5.0806978167011625) q[30];
-cx q[3],q[30];
-cx q[18],q[30];
-rz(5.0806978167011625) q[30];
-cx q[18],q[30];
-rx(7.343253806982983) q[18];
-ry(pi/2) q[31];
-rx(pi) q[31];
-cx q[12],q[31];
-rz(5.0806978167011625) q[31];
-cx q[12],q[31];
-cx q[26],q[31];
-rz(5.0806978167011625) q[31];
-cx q[26],q[31];
-ry(pi/2) q[32];
-rx(pi) q[32];
-cx q[0],q[32];
-rz(5.0806978167011625) q[32];
-cx q[0],q[32];
-cx q[21],q[32];
-rz(5.0806978167011625) q[32];
-cx q[21],q[32];
-ry(pi/2) q[33];
-rx(pi) q[33];
-cx q[5],q[33];
-rz(5.0806978167011625) q[33];
-cx q[5],q[33];
-cx q[30],q[33];
-rz(5.0806978167011625) q[33];
-cx q[30],q[33];
-rx(7.343253806982983) q[33];
-ry(pi/2) q[34];
-rx(pi) q[34];
-cx q[3],q[34];
-rz(5.0806978167011625) q[34];
-cx q[3],q[34];
-cx q[12],q[34];
-rz(5.0806978167011625) q[34];
-cx q[12],q[34];
-ry(pi/2) q[35];
-rx(pi) q[35];
-cx q[3],q[35];
-rz(5.0806978167011625) q[35];
-cx q[3],q[35];
-cx q[32],q[35];
-rz(5.0806978167011625) q[35];
-cx q[32],q[35];
-ry(pi/2) q[36];
-rx(pi) q[36];
-cx q[15],q[36];
-rz(5.0806978167011625) q[36];
-cx q[15],q[36];
-cx q[20],q[36];
-rz(5.0806978167011625) q[36];
-cx q[20],q[36];
-ry(pi/2) q[37];
-rx(pi) q[37];
-cx q[10],q[37];
-rz(5.0806978167011625) q[37];
-cx q[10],q[37];
-cx q[34],q[37];
-rz(5.0806978167011625) q[37];
-cx q[34],q[37];
-rx(7.343253806982983) q[34];
-ry(pi/2) q[38];
-rx(pi) q[38];
-cx q[19],q[38];
-rz(5.0806978167011625) q[38];
-cx q[19],q[38];
-rx(7.343253806982983) q[19];
-cx q[21],q[38];
-rz(5.0806978167011625) q[38];
-cx q[21],q[38];
-ry(pi/2) q[39];
-rx(pi) q[39];
-cx q[3],q[39];
-rz(5.0806978167011625) q[39];
-cx q[3],q[39];
-cx q[13],q[39];
-rz(5.0806978167011625) q[39];
-cx q[13],q[39];
-ry(pi/2) q[40];
-rx(pi) q[40];
-cx q[3],q[40];
-rz(5.0806978167011625) q[40];
-cx q[3],q[40];
-cx q[23],q[40];
-rz(5.0806978167011625) q[40];
-cx q[23],q[40];
-ry(pi/2) q[41];
-rx(pi) q[41];
-cx q[10],q[41];
-rz(5.0806978167011625) q[41];
-cx q[10],q[41];
-cx q[27],q[41];
-rz(5.0806978167011625) q[41];
-cx q[27],q[41];
-ry(pi/2) q[42];
-rx(pi) q[42];
-cx q[0],q[42];
-rz(5.0806978167011625) q[42];
-cx q[0],q[42];
-cx q[3],q[42];
-rz(5.0806978167011625) q[42];
-cx q[3],q[42];
-ry(pi/2) q[43];
-rx(pi) q[43];
-cx q[3],q[43];
-rz(5.0806978167011625) q[43];
-cx q[3],q[43];
-cx q[20],q[43];
-rz(5.0806978167011625) q[43];
-cx q[20],q[43];
-rx(7.343253806982983) q[43];
-ry(pi/2) q[44];
-rx(pi) q[44];
-cx q[3],q[44];
-rz(5.0806978167011625) q[44];
-cx q[3],q[44];
-cx q[12],q[44];
-rz(5.0806978167011625) q[44];
-cx q[12],q[44];
-ry(pi/2) q[45];
-rx(pi) q[45];
-cx q[1],q[45];
-rz(5.0806978167011625) q[45];
-cx q[1],q[45];
-cx q[16],q[45];
-rz(5.0806978167011625) q[45];
-cx q[16],q[45];
-ry(pi/2) q[46];
-rx(pi) q[46];
-cx q[5],q[46];
-rz(5.0806978167011625) q[46];
-cx q[5],q[46];
-cx q[38],q[46];
-rz(5.0806978167011625) q[46];
-cx q[38],q[46];
-rx(7.343253806982983) q[38];
-ry(pi/2) q[47];
-rx(pi) q[47];
-cx q[4],q[47];
-rz(5.0806978167011625) q[47];
-cx q[4],q[47];
-cx q[17],q[47];
-rz(5.0806978167011625) q[47];
-cx q[17],q[47];
-ry(pi/2) q[48];
-rx(pi) q[48];
-cx q[0],q[48];
-rz(5.0806978167011625) q[48];
-cx q[0],q[48];
-cx q[30],q[48];
-rz(5.0806978167011625) q[48];
-cx q[30],q[48];
-rx(7.343253806982983) q[48];
-ry(pi/2) q[49];
-rx(pi) q[49];
-cx q[3],q[49];
-rz(5.0806978167011625) q[49];
-cx q[3],q[49];
-cx q[4],q[49];
-rz(5.0806978167011625) q[49];
-cx q[4],q[49];
-rx(7.343253806982983) q[49];
-ry(pi/2) q[50];
-rx(pi) q[50];
-cx q[3],q[50];
-rz(5.0806978167011625) q[50];
-cx q[3],q[50];
-cx q[12],q[50];
-rz(5.0806978167011625) q[50];
-cx q[12],q[50];
-ry(pi/2) q[51];
-rx(pi) q[51];
-cx q[0],q[51];
-rz(5.0806978167011625) q[51];
-cx q[0],q[51];
-cx q[28],q[51];
-rz(5.0806978167011625) q[51];
-cx q[28],q[51];
-rx(7.343253806982983) q[51];
-ry(pi/2) q[52];
-rx(pi) q[52];
-cx q[3],q[52];
-rz(5.0806978167011625) q[52];
-cx q[3],q[52];
-cx q[10],q[52];
-rz(5.0806978167011625) q[52];
-cx q[10],q[52];
-ry(pi/2) q[53];
-rx(pi) q[53];
-cx q[17],q[53];
-rz(5.0806978167011625) q[53];
-cx q[17],q[53];
-cx q[21],q[53];
-rz(5.0806978167011625) q[53];
-cx q[21],q[53];
-ry(pi/2) q[54];
-rx(pi) q[54];
-cx q[24],q[54];
-rz(5.0806978167011625) q[54];
-cx q[24],q[54];
-cx q[28],q[54];
-rz(5.0806978167011625) q[54];
-cx q[28],q[54];
-rx(7.343253806982983) q[54];
-ry(pi/2) q[55];
-rx(pi) q[55];
-cx q[9],q[55];
-rz(5.0806978167011625) q[55];
-cx q[9],q[55];
-cx q[15],q[55];
-rz(5.0806978167011625) q[55];
-cx q[15],q[55];
-ry(pi/2) q[56];
-rx(pi) q[56];
-cx q[13],q[56];
-rz(5.0806978167011625) q[56];
-cx q[13],q[56];
-cx q[45],q[56];
-rz(5.0806978167011625) q[56];
-cx q[45],q[56];
-rx(7.343253806982983) q[45];
-ry(pi/2) q[57];
-rx(pi) q[57];
-cx q[1],q[57];
-rz(5.0806978167011625) q[57];
-cx q[1],q[57];
-cx q[3],q[57];
-rz(5.0806978167011625) q[57];
-cx q[3],q[57];
-ry(pi/2) q[58];
-rx(pi) q[58];
-cx q[24],q[58];
-rz(5.0806978167011625) q[58];
-cx q[24],q[58];
-cx q[28],q[58];
-rz(5.0806978167011625) q[58];
-cx q[28],q[58];
-rx(7.343253806982983) q[58];
-ry(pi/2) q[59];
-rx(pi) q[59];
-cx q[16],q[59];
-rz(5.0806978167011625) q[59];
-cx q[16],q[59];
-cx q[32],q[59];
-rz(5.0806978167011625) q[59];
-cx q[32],q[59];
-ry(pi/2) q[60];
-rx(pi) q[60];
-cx q[1],q[60];
-rz(5.0806978167011625) q[60];
-cx q[1],q[60];
-cx q[7],q[60];
-rz(5.0806978167011625) q[60];
-cx q[7],q[60];
-ry(pi/2) q[61];
-rx(pi) q[61];
-cx q[4],q[61];
-rz(5.0806978167011625) q[61];
-cx q[4],q[61];
-cx q[7],q[61];
-rz(5.0806978167011625) q[61];
-cx q[7],q[61];
-rx(7.343253806982983) q[61];
-ry(pi/2) q[62];
-rx(pi) q[62];
-cx q[0],q[62];
-rz(5.0806978167011625) q[62];
-cx q[0],q[62];
-cx q[17],q[62];
-rz(5.0806978167011625) q[62];
-cx q[17],q[62];
-ry(pi/2) q[63];
-rx(pi) q[63];
-cx q[12],q[63];
-rz(5.0806978167011625) q[63];
-cx q[12],q[63];
-cx q[17],q[63];
-rz(5.0806978167011625) q[63];
-cx q[17],q[63];
-ry(pi/2) q[64];
-rx(pi) q[64];
-cx q[0],q[64];
-rz(5.0806978167011625) q[64];
-cx q[0],q[64];
-cx q[10],q[64];
-rz(5.0806978167011625) q[64];
-cx q[10],q[64];
-rx(7.343253806982983) q[64];
-ry(pi/2) q[65];
-rx(pi) q[65];
-cx q[5],q[65];
-rz(5.0806978167011625) q[65];
-cx q[5],q[65];
-cx q[23],q[65];
-rz(5.0806978167011625) q[65];
-cx q[23],q[65];
-rx(7.343253806982983) q[23];
-rx(7.343253806982983) q[65];
-ry(pi/2) q[66];
-rx(pi) q[66];
-cx q[17],q[66];
-rz(5.0806978167011625) q[66];
-cx q[17],q[66];
-rx(7.343253806982983) q[17];
-cx q[47],q[66];
-rz(5.0806978167011625) q[66];
-cx q[47],q[66];
-rx(7.343253806982983) q[66];
-ry(pi/2) q[67];
-rx(pi) q[67];
-cx q[41],q[67];
-rz(5.0806978167011625) q[67];
-cx q[41],q[67];
-cx q[56],q[67];
-rz(5.0806978167011625) q[67];
-cx q[56],q[67];
-rx(7.343253806982983) q[67];
-ry(pi/2) q[68];
-rx(pi) q[68];
-cx q[13],q[68];
-rz(5.0806978167011625) q[68];
-cx q[13],q[68];
-cx q[32],q[68];
-rz(5.0806978167011625) q[68];
-cx q[32],q[68];
-ry(pi/2) q[69];
-rx(pi) q[69];
-cx q[6],q[69];
-rz(5.0806978167011625) q[69];
-cx q[6],q[69];
-cx q[59],q[69];
-rz(5.0806978167011625) q[69];
-cx q[59],q[69];
-ry(pi/2) q[70];
-rx(pi) q[70];
-cx q[3],q[70];
-rz(5.0806978167011625) q[70];
-cx q[3],q[70];
-cx q[15],q[70];
-rz(5.0806978167011625) q[70];
-cx q[15],q[70];
-ry(pi/2) q[71];
-rx(pi) q[71];
-cx q[3],q[71];
-rz(5.0806978167011625) q[71];
-cx q[3],q[71];
-cx q[53],q[71];
-rz(5.0806978167011625) q[71];
-cx q[53],q[71];
-rx(7.343253806982983) q[71];
-ry(pi/2) q[72];
-rx(pi) q[72];
-cx q[27],q[72];
-rz(5.0806978167011625) q[72];
-cx q[27],q[72];
-cx q[44],q[72];
-rz(5.0806978167011625) q[72];
-cx q[44],q[72];
-rx(7.343253806982983) q[44];
-rx(7.343253806982983) q[72];
-ry(pi/2) q[73];
-rx(pi) q[73];
-cx q[16],q[73];
-rz(5.0806978167011625) q[73];
-cx q[16],q[73];
-cx q[59],q[73];
-rz(5.0806978167011625) q[73];
-cx q[59],q[73];
-ry(pi/2) q[74];
-rx(pi) q[74];
-cx q[56],q[74];
-rz(5.0806978167011625) q[74];
-cx q[56],q[74];
-cx q[63],q[74];
-rz(5.0806978167011625) q[74];
-cx q[63],q[74];
-rx(7.343253806982983) q[74];
-ry(pi/2) q[75];
-rx(pi) q[75];
-cx q[0],q[75];
-rz(5.0806978167011625) q[75];
-cx q[0],q[75];
-cx q[21],q[75];
-rz(5.0806978167011625) q[75];
-cx q[21],q[75];
-rx(7.343253806982983) q[75];
-ry(pi/2) q[76];
-rx(pi) q[76];
-cx q[5],q[76];
-rz(5.0806978167011625) q[76];
-cx q[5],q[76];
-cx q[6],q[76];
-rz(5.0806978167011625) q[76];
-cx q[6],q[76];
-rx(7.343253806982983) q[76];
-ry(pi/2) q[77];
-rx(pi) q[77];
-cx q[3],q[77];
-rz(5.0806978167011625) q[77];
-cx q[3],q[77];
-cx q[30],q[77];
-rz(5.0806978167011625) q[77];
-cx q[30],q[77];
-rx(7.343253806982983) q[30];
-ry(pi/2) q[78];
-rx(pi) q[78];
-cx q[42],q[78];
-rz(5.0806978167011625) q[78];
-cx q[42],q[78];
-cx q[60],q[78];
-rz(5.0806978167011625) q[78];
-cx q[60],q[78];
-rx(7.343253806982983) q[78];
-ry(pi/2) q[79];
-rx(pi) q[79];
-cx q[6],q[79];
-rz(5.0806978167011625) q[79];
-cx q[6],q[79];
-cx q[50],q[79];
-rz(5.0806978167011625) q[79];
-cx q[50],q[79];
-rx(7.343253806982983) q[79];
-ry(pi/2) q[80];
-rx(pi) q[80];
-cx q[9],q[80];
-rz(5.0806978167011625) q[80];
-cx q[9],q[80];
-cx q[15],q[80];
-rz(5.0806978167011625) q[80];
-cx q[15],q[80];
-rx(7.343253806982983) q[80];
-ry(pi/2) q[81];
-rx(pi) q[81];
-cx q[21],q[81];
-rz(5.0806978167011625) q[81];
-cx q[21],q[81];
-cx q[77],q[81];
-rz(5.0806978167011625) q[81];
-cx q[77],q[81];
-rx(7.343253806982983) q[77];
-ry(pi/2) q[82];
-rx(pi) q[82];
-cx q[0],q[82];
-rz(5.0806978167011625) q[82];
-cx q[0],q[82];
-cx q[56],q[82];
-rz(5.0806978167011625) q[82];
-cx q[56],q[82];
-rx(7.343253806982983) q[82];
-ry(pi/2) q[83];
-rx(pi) q[83];
-cx q[8],q[83];
-rz(5.0806978167011625) q[83];
-cx q[8],q[83];
-rx(7.343253806982983) q[8];
-cx q[68],q[83];
-rz(5.0806978167011625) q[83];
-cx q[68],q[83];
-rx(7.343253806982983) q[68];
-rx(7.343253806982983) q[83];
-ry(pi/2) q[84];
-rx(pi) q[84];
-cx q[70],q[84];
-rz(5.0806978167011625) q[84];
-cx q[70],q[84];
-rx(7.343253806982983) q[70];
-cx q[73],q[84];
-rz(5.0806978167011625) q[84];
-cx q[73],q[84];
-rx(7.343253806982983) q[73];
-rx(7.343253806982983) q[84];
-ry(pi/2) q[85];
-rx(pi) q[85];
-cx q[37],q[85];
-rz(5.0806978167011625) q[85];
-cx q[37],q[85];
-cx q[59],q[85];
-rz(5.0806978167011625) q[85];
-cx q[59],q[85];
-rx(7.343253806982983) q[85];
-ry(pi/2) q[86];
-rx(pi) q[86];
-cx q[24],q[86];
-rz(5.0806978167011625) q[86];
-cx q[24],q[86];
-cx q[53],q[86];
-rz(5.0806978167011625) q[86];
-cx q[53],q[86];
-rx(7.343253806982983) q[86];
-ry(pi/2) q[87];
-rx(pi) q[87];
-cx q[28],q[87];
-rz(5.0806978167011625) q[87];
-cx q[28],q[87];
-cx q[32],q[87];
-rz(5.0806978167011625) q[87];
-cx q[32],q[87];
-rx(7.343253806982983) q[87];
-ry(pi/2) q[88];
-rx(pi) q[88];
-cx q[3],q[88];
-rz(5.0806978167011625) q[88];
-cx q[3],q[88];
-cx q[60],q[88];
-rz(5.0806978167011625) q[88];
-cx q[60],q[88];
-rx(7.343253806982983) q[88];
-ry(pi/2) q[89];
-rx(pi) q[89];
-cx q[2],q[89];
-rz(5.0806978167011625) q[89];
-cx q[2],q[89];
-rx(7.343253806982983) q[2];
-cx q[5],q[89];
-rz(5.0806978167011625) q[89];
-cx q[5],q[89];
-ry(pi/2) q[90];
-rx(pi) q[90];
-cx q[15],q[90];
-rz(5.0806978167011625) q[90];
-cx q[15],q[90];
-cx q[27],q[90];
-rz(5.0806978167011625) q[90];
-cx q[27],q[90];
-rx(7.343253806982983) q[90];
-ry(pi/2) q[91];
-rx(pi) q[91];
-cx q[0],q[91];
-rz(5.0806978167011625) q[91];
-cx q[0],q[91];
-cx q[6],q[91];
-rz(5.0806978167011625) q[91];
-cx q[6],q[91];
-rx(7.343253806982983) q[6];
-ry(pi/2) q[92];
-rx(pi) q[92];
-cx q[15],q[92];
-rz(5.0806978167011625) q[92];
-cx q[15],q[92];
-cx q[89],q[92];
-rz(5.0806978167011625) q[92];
-cx q[89],q[92];
-ry(pi/2) q[93];
-rx(pi) q[93];
-cx q[0],q[93];
-rz(5.0806978167011625) q[93];
-cx q[0],q[93];
-cx q[32],q[93];
-rz(5.0806978167011625) q[93];
-cx q[32],q[93];
-rx(7.343253806982983) q[93];
-ry(pi/2) q[94];
-rx(pi) q[94];
-cx q[36],q[94];
-rz(5.0806978167011625) q[94];
-cx q[36],q[94];
-cx q[55],q[94];
-rz(5.0806978167011625) q[94];
-cx q[55],q[94];
-rx(7.343253806982983) q[55];
-ry(pi/2) q[95];
-rx(pi) q[95];
-cx q[5],q[95];
-rz(5.0806978167011625) q[95];
-cx q[5],q[95];
-cx q[27],q[95];
-rz(5.0806978167011625) q[95];
-cx q[27],q[95];
-rx(7.343253806982983) q[27];
-rx(7.343253806982983) q[95];
-ry(pi/2) q[96];
-rx(pi) q[96];
-cx q[56],q[96];
-rz(5.0806978167011625) q[96];
-cx q[56],q[96];
-rx(7.343253806982983) q[56];
-cx q[92],q[96];
-rz(5.0806978167011625) q[96];
-cx q[92],q[96];
-rx(7.343253806982983) q[96];
-ry(pi/2) q[97];
-rx(pi) q[97];
-cx q[1],q[97];
-rz(5.0806978167011625) q[97];
-cx q[1],q[97];
-cx q[7],q[97];
-rz(5.0806978167011625) q[97];
-cx q[7],q[97];
-ry(pi/2) q[98];
-rx(pi) q[98];
-cx q[10],q[98];
-rz(5.0806978167011625) q[98];
-cx q[10],q[98];
-rx(7.343253806982983) q[10];
-cx q[21],q[98];
-rz(5.0806978167011625) q[98];
-cx q[21],q[98];
-rx(7.343253806982983) q[98];
-ry(pi/2) q[99];
-rx(pi) q[99];
-cx q[4],q[99];
-rz(5.0806978167011625) q[99];
-cx q[4],q[99];
-cx q[41],q[99];
-rz(5.0806978167011625) q[99];
-cx q[41],q[99];
-rx(7.343253806982983) q[41];
-rx(7.343253806982983) q[99];
-ry(pi/2) q[100];
-rx(pi) q[100];
-cx q[3],q[100];
-rz(5.0806978167011625) q[100];
-cx q[3],q[100];
-cx q[25],q[100];
-rz(5.0806978167011625) q[100];
-cx q[25],q[100];
-rx(7.343253806982983) q[25];
-rx(7.343253806982983) q[100];
-ry(pi/2) q[101];
-rx(pi) q[101];
-cx q[16],q[101];
-rz(5.0806978167011625) q[101];
-cx q[16],q[101];
-cx q[50],q[101];
-rz(5.0806978167011625) q[101];
-cx q[50],q[101];
-rx(7.343253806982983) q[101];
-ry(pi/2) q[102];
-rx(pi) q[102];
-cx q[3],q[102];
-rz(5.0806978167011625) q[102];
-cx q[3],q[102];
-cx q[4],q[102];
-rz(5.0806978167011625) q[102];
-cx q[4],q[102];
-rx(7.343253806982983) q[102];
-ry(pi/2) q[103];
-rx(pi) q[103];
-cx q[16],q[103];
-rz(5.0806978167011625) q[103];
-cx q[16],q[103];
-rx(7.343253806982983) q[16];
-cx q[57],q[103];
-rz(5.0806978167011625) q[103];
-cx q[57],q[103];
-rx(7.343253806982983) q[57];
-rx(7.343253806982983) q[103];
-ry(pi/2) q[104];
-rx(pi) q[104];
-cx q[7],q[104];
-rz(5.0806978167011625) q[104];
-cx q[7],q[104];
-cx q[13],q[104];
-rz(5.0806978167011625) q[104];
-cx q[13],q[104];
-ry(pi/2) q[105];
-rx(pi) q[105];
-cx q[26],q[105];
-rz(5.0806978167011625) q[105];
-cx q[26],q[105];
-cx q[28],q[105];
-rz(5.0806978167011625) q[105];
-cx q[28],q[105];
-rx(7.343253806982983) q[105];
-ry(pi/2) q[106];
-rx(pi) q[106];
-cx q[5],q[106];
-rz(5.0806978167011625) q[106];
-cx q[5],q[106];
-cx q[36],q[106];
-rz(5.0806978167011625) q[106];
-cx q[36],q[106];
-rx(7.343253806982983) q[106];
-ry(pi/2) q[107];
-rx(pi) q[107];
-cx q[3],q[107];
-rz(5.0806978167011625) q[107];
-cx q[3],q[107];
-cx q[31],q[107];
-rz(5.0806978167011625) q[107];
-cx q[31],q[107];
-rx(7.343253806982983) q[107];
-ry(pi/2) q[108];
-rx(pi) q[108];
-cx q[15],q[108];
-rz(5.0806978167011625) q[108];
-cx q[15],q[108];
-cx q[31],q[108];
-rz(5.0806978167011625) q[108];
-cx q[31],q[108];
-rx(7.343253806982983) q[31];
-rx(7.343253806982983) q[108];
-ry(pi/2) q[109];
-rx(pi) q[109];
-cx q[5],q[109];
-rz(5.0806978167011625) q[109];
-cx q[5],q[109];
-cx q[39],q[109];
-rz(5.0806978167011625) q[109];
-cx q[39],q[109];
-rx(7.343253806982983) q[39];
-ry(pi/2) q[110];
-rx(pi) q[110];
-cx q[3],q[110];
-rz(5.0806978167011625) q[110];
-cx q[3],q[110];
-cx q[24],q[110];
-rz(5.0806978167011625) q[110];
-cx q[24],q[110];
-ry(pi/2) q[111];
-rx(pi) q[111];
-cx q[3],q[111];
-rz(5.0806978167011625) q[111];
-cx q[3],q[111];
-cx q[21],q[111];
-rz(5.0806978167011625) q[111];
-cx q[21],q[111];
-rx(7.343253806982983) q[111];
-ry(pi/2) q[112];
-rx(pi) q[112];
-cx q[21],q[112];
-rz(5.0806978167011625) q[112];
-cx q[21],q[112];
-rx(7.343253806982983) q[21];
-cx q[36],q[112];
-rz(5.0806978167011625) q[112];
-cx q[36],q[112];
-rx(7.343253806982983) q[36];
-rx(7.343253806982983) q[112];
-ry(pi/2) q[113];
-rx(pi) q[113];
-cx q[1],q[113];
-rz(5.0806978167011625) q[113];
-cx q[1],q[113];
-rx(7.343253806982983) q[1];
-cx q[3],q[113];
-rz(5.0806978167011625) q[113];
-cx q[3],q[113];
-rx(7.343253806982983) q[113];
-ry(pi/2) q[114];
-rx(pi) q[114];
-cx q[104],q[114];
-rz(5.0806978167011625) q[114];
-cx q[104],q[114];
-cx q[110],q[114];
-rz(5.0806978167011625) q[114];
-cx q[110],q[114];
-rx(7.343253806982983) q[110];
-rx(7.343253806982983) q[114];
-ry(pi/2) q[115];
-rx(pi) q[115];
-cx q[15],q[115];
-rz(5.0806978167011625) q[115];
-cx q[15],q[115];
-cx q[92],q[115];
-rz(5.0806978167011625) q[115];
-cx q[92],q[115];
-rx(7.343253806982983) q[115];
-ry(pi/2) q[116];
-rx(pi) q[116];
-cx q[28],q[116];
-rz(5.0806978167011625) q[116];
-cx q[28],q[116];
-rx(7.343253806982983) q[28];
-cx q[42],q[116];
-rz(5.0806978167011625) q[116];
-cx q[42],q[116];
-rx(7.343253806982983) q[42];
-rx(7.343253806982983) q[116];
-ry(pi/2) q[117];
-rx(pi) q[117];
-cx q[26],q[117];
-rz(5.0806978167011625) q[117];
-cx q[26],q[117];
-rx(7.343253806982983) q[26];
-cx q[32],q[117];
-rz(5.0806978167011625) q[117];
-cx q[32],q[117];
-rx(7.343253806982983) q[117];
-ry(pi/2) q[118];
-rx(pi) q[118];
-cx q[5],q[118];
-rz(5.0806978167011625) q[118];
-cx q[5],q[118];
-cx q[15],q[118];
-rz(5.0806978167011625) q[118];
-cx q[15],q[118];
-rx(7.343253806982983) q[15];
-ry(pi/2) q[119];
-rx(pi) q[119];
-cx q[40],q[119];
-rz(5.0806978167011625) q[119];
-cx q[40],q[119];
-rx(7.343253806982983) q[40];
-cx q[69],q[119];
-rz(5.0806978167011625) q[119];
-cx q[69],q[119];
-rx(7.343253806982983) q[69];
-ry(pi/2) q[120];
-rx(pi) q[120];
-cx q[46],q[120];
-rz(5.0806978167011625) q[120];
-cx q[46],q[120];
-rx(7.343253806982983) q[46];
-cx q[94],q[120];
-rz(5.0806978167011625) q[120];
-cx q[94],q[120];
-rx(7.343253806982983) q[94];
-rx(7.343253806982983) q[120];
-ry(pi/2) q[121];
-rx(pi) q[121];
-cx q[20],q[121];
-rz(5.0806978167011625) q[121];
-cx q[20],q[121];
-rx(7.343253806982983) q[20];
-cx q[104],q[121];
-rz(5.0806978167011625) q[121];
-cx q[104],q[121];
-rx(7.343253806982983) q[104];
-ry(pi/2) q[122];
-rx(pi) q[122];
-cx q[63],q[122];
-rz(5.0806978167011625) q[122];
-cx q[63],q[122];
-rx(7.343253806982983) q[63];
-cx q[81],q[122];
-rz(5.0806978167011625) q[122];
-cx q[81],q[122];
-rx(7.343253806982983) q[122];
-ry(pi/2) q[123];
-rx(pi) q[123];
-cx q[0],q[123];
-rz(5.0806978167011625) q[123];
-cx q[0],q[123];
-cx q[52],q[123];
-rz(5.0806978167011625) q[123];
-cx q[52],q[123];
-rx(7.343253806982983) q[52];
-ry(pi/2) q[124];
-rx(pi) q[124];
-cx q[53],q[124];
-rz(5.0806978167011625) q[124];
-cx q[53],q[124];
-rx(7.343253806982983) q[53];
-cx q[81],q[124];
-rz(5.0806978167011625) q[124];
-cx q[81],q[124];
-rx(7.343253806982983) q[81];
-rx(7.343253806982983) q[124];
-ry(pi/2) q[125];
-rx(pi) q[125];
-cx q[3],q[125];
-rz(5.0806978167011625) q[125];
-cx q[3],q[125];
-cx q[109],q[125];
-rz(5.0806978167011625) q[125];
-cx q[109],q[125];
-rx(7.343253806982983) q[125];
-ry(pi/2) q[126];
-rx(pi) q[126];
-cx q[0],q[126];
-rz(5.0806978167011625) q[126];
-cx q[0],q[126];
-cx q[12],q[126];
-rz(5.0806978167011625) q[126];
-cx q[12],q[126];
-rx(7.343253806982983) q[126];
-ry(pi/2) q[127];
-rx(pi) q[127];
-cx q[4],q[127];
-rz(5.0806978167011625) q[127];
-cx q[4],q[127];
-cx q[62],q[127];
-rz(5.0806978167011625) q[127];
-cx q[62],q[127];
-rx(7.343253806982983) q[127];
-ry(pi/2) q[128];
-rx(pi) q[128];
-cx q[62],q[128];
-rz(5.0806978167011625) q[128];
-cx q[62],q[128];
-rx(7.343253806982983) q[62];
-cx q[109],q[128];
-rz(5.0806978167011625) q[128];
-cx q[109],q[128];
-rx(7.343253806982983) q[128];
-ry(pi/2) q[129];
-rx(pi) q[129];
-cx q[50],q[129];
-rz(5.0806978167011625) q[129];
-cx q[50],q[129];
-cx q[91],q[129];
-rz(5.0806978167011625) q[129];
-cx q[91],q[129];
-rx(7.343253806982983) q[91];
-rx(7.343253806982983) q[129];
-ry(pi/2) q[130];
-rx(pi) q[130];
-cx q[35],q[130];
-rz(5.0806978167011625) q[130];
-cx q[35],q[130];
-rx(7.343253806982983) q[35];
-cx q[109],q[130];
-rz(5.0806978167011625) q[130];
-cx q[109],q[130];
-rx(7.343253806982983) q[109];
-rx(7.343253806982983) q[130];
-ry(pi/2) q[131];
-rx(pi) q[131];
-cx q[32],q[131];
-rz(5.0806978167011625) q[131];
-cx q[32],q[131];
-cx q[123],q[131];
-rz(5.0806978167011625) q[131];
-cx q[123],q[131];
-rx(7.343253806982983) q[123];
-rx(7.343253806982983) q[131];
-ry(pi/2) q[132];
-rx(pi) q[132];
-cx q[3],q[132];
-rz(5.0806978167011625) q[132];
-cx q[3],q[132];
-cx q[37],q[132];
-rz(5.0806978167011625) q[132];
-cx q[37],q[132];
-rx(7.343253806982983) q[37];
-rx(7.343253806982983) q[132];
-ry(pi/2) q[133];
-rx(pi) q[133];
-cx q[7],q[133];
-rz(5.0806978167011625) q[133];
-cx q[7],q[133];
-rx(7.343253806982983) q[7];
-cx q[89],q[133];
-rz(5.0806978167011625) q[133];
-cx q[89],q[133];
-rx(7.343253806982983) q[89];
-ry(pi/2) q[134];
-rx(pi) q[134];
-cx q[3],q[134];
-rz(5.0806978167011625) q[134];
-cx q[3],q[134];
-cx q[47],q[134];
-rz(5.0806978167011625) q[134];
-cx q[47],q[134];
-rx(7.343253806982983) q[47];
-rx(7.343253806982983) q[134];
-ry(pi/2) q[135];
-rx(pi) q[135];
-cx q[0],q[135];
-rz(5.0806978167011625) q[135];
-cx q[0],q[135];
-cx q[13],q[135];
-rz(5.0806978167011625) q[135];
-cx q[13],q[135];
-rx(7.343253806982983) q[13];
-rx(7.343253806982983) q[135];
-ry(pi/2) q[136];
-rx(pi) q[136];
-cx q[3],q[136];
-rz(5.0806978167011625) q[136];
-cx q[3],q[136];
-cx q[92],q[136];
-rz(5.0806978167011625) q[136];
-cx q[92],q[136];
-rx(7.343253806982983) q[92];
-rx(7.343253806982983) q[136];
-ry(pi/2) q[137];
-rx(pi) q[137];
-cx q[24],q[137];
-rz(5.0806978167011625) q[137];
-cx q[24],q[137];
-cx q[133],q[137];
-rz(5.0806978167011625) q[137];
-cx q[133],q[137];
-rx(7.343253806982983) q[137];
-ry(pi/2) q[138];
-rx(pi) q[138];
-cx q[60],q[138];
-rz(5.0806978167011625) q[138];
-cx q[60],q[138];
-rx(7.343253806982983) q[60];
-cx q[119],q[138];
-rz(5.0806978167011625) q[138];
-cx q[119],q[138];
-rx(7.343253806982983) q[119];
-rx(7.343253806982983) q[138];
-ry(pi/2) q[139];
-rx(pi) q[139];
-cx q[5],q[139];
-rz(5.0806978167011625) q[139];
-cx q[5],q[139];
-cx q[133],q[139];
-rz(5.0806978167011625) q[139];
-cx q[133],q[139];
-rx(7.343253806982983) q[133];
-rx(7.343253806982983) q[139];
-ry(pi/2) q[140];
-rx(pi) q[140];
-cx q[0],q[140];
-rz(5.0806978167011625) q[140];
-cx q[0],q[140];
-cx q[32],q[140];
-rz(5.0806978167011625) q[140];
-cx q[32],q[140];
-rx(7.343253806982983) q[32];
-rx(7.343253806982983) q[140];
-ry(pi/2) q[141];
-rx(pi) q[141];
-cx q[12],q[141];
-rz(5.0806978167011625) q[141];
-cx q[12],q[141];
-cx q[121],q[141];
-rz(5.0806978167011625) q[141];
-cx q[121],q[141];
-rx(7.343253806982983) q[121];
-rx(7.343253806982983) q[141];
-ry(pi/2) q[142];
-rx(pi) q[142];
-cx q[5],q[142];
-rz(5.0806978167011625) q[142];
-cx q[5],q[142];
-rx(7.343253806982983) q[5];
-cx q[24],q[142];
-rz(5.0806978167011625) q[142];
-cx q[24],q[142];
-rx(7.343253806982983) q[24];
-rx(7.343253806982983) q[142];
-ry(pi/2) q[143];
-rx(pi) q[143];
-cx q[12],q[143];
-rz(5.0806978167011625) q[143];
-cx q[12],q[143];
-rx(7.343253806982983) q[12];
-cx q[50],q[143];
-rz(5.0806978167011625) q[143];
-cx q[50],q[143];
-rx(7.343253806982983) q[50];
-rx(7.343253806982983) q[143];
-ry(pi/2) q[144];
-rx(pi) q[144];
-cx q[9],q[144];
-rz(5.0806978167011625) q[144];
-cx q[9],q[144];
-rx(7.343253806982983) q[9];
-cx q[59],q[144];
-rz(5.0806978167011625) q[144];
-cx q[59],q[144];
-rx(7.343253806982983) q[59];
-rx(7.343253806982983) q[144];
-ry(pi/2) q[145];
-rx(pi) q[145];
-cx q[3],q[145];
-rz(5.0806978167011625) q[145];
-cx q[3],q[145];
-cx q[97],q[145];
-rz(5.0806978167011625) q[145];
-cx q[97],q[145];
-rx(7.343253806982983) q[97];
-rx(7.343253806982983) q[145];
-ry(pi/2) q[146];
-rx(pi) q[146];
-cx q[0],q[146];
-rz(5.0806978167011625) q[146];
-cx q[0],q[146];
-rx(7.343253806982983) q[0];
-cx q[0],q[1];
-rz(4.072020350255479) q[1];
-cx q[0],q[1];
-cx q[0],q[2];
-rz(4.072020350255479) q[2];
-cx q[0],q[2];
-cx q[2],q[89];
-cx q[4],q[146];
-rz(4.072020350255479) q[89];
-cx q[2],q[89];
-rx(4.052865025049401) q[2];
-rz(5.0806978167011625) q[146];
-cx q[4],q[146];
-rx(7.343253806982983) q[4];
-rx(7.343253806982983) q[146];
-ry(pi/2) q[147];
-rx(pi) q[147];
-cx q[3],q[147];
-rz(5.0806978167011625) q[147];
-cx q[3],q[147];
-rx(7.343253806982983) q[3];
-cx q[0],q[3];
-rz(4.072020350255479) q[3];
-cx q[0],q[3];
-cx q[0],q[15];
-cx q[1],q[3];
-rz(4.072020350255479) q[3];
-cx q[1],q[3];
-cx q[1],q[4];
-rz(4.072020350255479) q[4];
-cx q[1],q[4];
-cx q[1],q[5];
-cx q[3],q[4];
-rz(4.072020350255479) q[4];
-cx q[3],q[4];
-cx q[4],q[6];
-rz(4.072020350255479) q[5];
-cx q[1],q[5];
-cx q[1],q[9];
-cx q[3],q[5];
-rz(4.072020350255479) q[5];
-cx q[3],q[5];
-cx q[3],q[7];
-rz(4.072020350255479) q[6];
-cx q[4],q[6];
-cx q[5],q[6];
-rz(4.072020350255479) q[6];
-cx q[5],q[6];
-rz(4.072020350255479) q[7];
-cx q[3],q[7];
-cx q[3],q[8];
-cx q[4],q[7];
-rz(4.072020350255479) q[7];
-cx q[4],q[7];
-cx q[4],q[10];
-rz(4.072020350255479) q[8];
-cx q[3],q[8];
-cx q[5],q[8];
-rz(4.072020350255479) q[8];
-cx q[5],q[8];
-cx q[5],q[11];
-cx q[8],q[83];
-rz(4.072020350255479) q[9];
-cx q[1],q[9];
-cx q[1],q[17];
-cx q[3],q[9];
-rz(4.072020350255479) q[9];
-cx q[3],q[9];
-cx q[3],q[12];
-rz(4.072020350255479) q[10];
-cx q[4],q[10];
-cx q[4],q[13];
-cx q[6],q[10];
-rz(4.072020350255479) q[10];
-cx q[6],q[10];
-cx q[10],q[37];
-rz(4.072020350255479) q[11];
-cx q[5],q[11];
-cx q[6],q[11];
-rz(4.072020350255479) q[11];
-cx q[6],q[11];
-rx(4.052865025049401) q[11];
-rz(4.072020350255479) q[12];
-cx q[3],q[12];
-cx q[3],q[14];
-cx q[5],q[12];
-rz(4.072020350255479) q[12];
-cx q[5],q[12];
-rz(4.072020350255479) q[13];
-cx q[4],q[13];
-cx q[5],q[13];
-rz(4.072020350255479) q[13];
-cx q[5],q[13];
-rz(4.072020350255479) q[14];
-cx q[3],q[14];
-cx q[4],q[14];
-rz(4.072020350255479) q[14];
-cx q[4],q[14];
-rx(4.052865025049401) q[14];
-rz(4.072020350255479) q[15];
-cx q[0],q[15];
-cx q[0],q[16];
-cx q[3],q[15];
-rz(4.072020350255479) q[15];
-cx q[3],q[15];
-rz(4.072020350255479) q[16];
-cx q[0],q[16];
-cx q[0],q[20];
-cx q[3],q[16];
-rz(4.072020350255479) q[16];
-cx q[3],q[16];
-rz(4.072020350255479) q[17];
-cx q[1],q[17];
-cx q[1],q[28];
-cx q[3],q[17];
-rz(4.072020350255479) q[17];
-cx q[3],q[17];
-cx q[3],q[18];
-rz(4.072020350255479) q[18];
-cx q[3],q[18];
-cx q[3],q[19];
-cx q[4],q[18];
-rz(4.072020350255479) q[18];
-cx q[4],q[18];
-cx q[4],q[21];
-rz(4.072020350255479) q[19];
-cx q[3],q[19];
-cx q[3],q[22];
-cx q[7],q[19];
-rz(4.072020350255479) q[19];
-cx q[7],q[19];
-cx q[19],q[38];
-rz(4.072020350255479) q[20];
-cx q[0],q[20];
-cx q[0],q[32];
-cx q[15],q[20];
-rz(4.072020350255479) q[20];
-cx q[15],q[20];
-rz(4.072020350255479) q[21];
-cx q[4],q[21];
-cx q[4],q[27];
-cx q[15],q[21];
-rz(4.072020350255479) q[21];
-cx q[15],q[21];
-cx q[15],q[36];
-rz(4.072020350255479) q[22];
-cx q[3],q[22];
-cx q[3],q[23];
-cx q[9],q[22];
-rz(4.072020350255479) q[22];
-cx q[9],q[22];
-cx q[9],q[55];
-rx(4.052865025049401) q[22];
-rz(4.072020350255479) q[23];
-cx q[3],q[23];
-cx q[3],q[24];
-cx q[17],q[23];
-rz(4.072020350255479) q[23];
-cx q[17],q[23];
-rz(4.072020350255479) q[24];
-cx q[3],q[24];
-cx q[3],q[25];
-cx q[5],q[24];
-rz(4.072020350255479) q[24];
-cx q[5],q[24];
-cx q[5],q[33];
-cx q[24],q[54];
-rz(4.072020350255479) q[25];
-cx q[3],q[25];
-cx q[3],q[26];
-cx q[12],q[25];
-rz(4.072020350255479) q[25];
-cx q[12],q[25];
-cx q[12],q[31];
-rz(4.072020350255479) q[26];
-cx q[3],q[26];
-cx q[21],q[26];
-rz(4.072020350255479) q[26];
-cx q[21],q[26];
-rz(4.072020350255479) q[27];
-cx q[4],q[27];
-cx q[4],q[47];
-cx q[6],q[27];
-rz(4.072020350255479) q[27];
-cx q[6],q[27];
-cx q[6],q[69];
-rz(4.072020350255479) q[28];
-cx q[1],q[28];
-cx q[1],q[29];
-cx q[3],q[28];
-rz(4.072020350255479) q[28];
-cx q[3],q[28];
-rz(4.072020350255479) q[29];
-cx q[1],q[29];
-cx q[1],q[45];
-cx q[3],q[29];
-rz(4.072020350255479) q[29];
-cx q[3],q[29];
-cx q[3],q[30];
-rx(4.052865025049401) q[29];
-rz(4.072020350255479) q[30];
-cx q[3],q[30];
-cx q[3],q[34];
-cx q[18],q[30];
-rz(4.072020350255479) q[30];
-cx q[18],q[30];
-rx(4.052865025049401) q[18];
-rz(4.072020350255479) q[31];
-cx q[12],q[31];
-cx q[26],q[31];
-rz(4.072020350255479) q[31];
-cx q[26],q[31];
-cx q[26],q[105];
-rz(4.072020350255479) q[32];
-cx q[0],q[32];
-cx q[0],q[42];
-cx q[21],q[32];
-rz(4.072020350255479) q[32];
-cx q[21],q[32];
-rz(4.072020350255479) q[33];
-cx q[5],q[33];
-cx q[5],q[46];
-cx q[30],q[33];
-rz(4.072020350255479) q[33];
-cx q[30],q[33];
-rx(4.052865025049401) q[33];
-rz(4.072020350255479) q[34];
-cx q[3],q[34];
-cx q[3],q[35];
-cx q[12],q[34];
-rz(4.072020350255479) q[34];
-cx q[12],q[34];
-rz(4.072020350255479) q[35];
-cx q[3],q[35];
-cx q[3],q[39];
-cx q[32],q[35];
-rz(4.072020350255479) q[35];
-cx q[32],q[35];
-cx q[35],q[130];
-rz(4.072020350255479) q[36];
-cx q[15],q[36];
-cx q[20],q[36];
-rz(4.072020350255479) q[36];
-cx q[20],q[36];
-cx q[36],q[94];
-rz(4.072020350255479) q[37];
-cx q[10],q[37];
-cx q[10],q[41];
-cx q[34],q[37];
-rz(4.072020350255479) q[37];
-cx q[34],q[37];
-rx(4.052865025049401) q[34];
-cx q[37],q[85];
-rz(4.072020350255479) q[38];
-cx q[19],q[38];
-rx(4.052865025049401) q[19];
-cx q[21],q[38];
-rz(4.072020350255479) q[38];
-cx q[21],q[38];
-rz(4.072020350255479) q[39];
-cx q[3],q[39];
-cx q[3],q[40];
-cx q[13],q[39];
-rz(4.072020350255479) q[39];
-cx q[13],q[39];
-cx q[13],q[56];
-rz(4.072020350255479) q[40];
-cx q[3],q[40];
-cx q[23],q[40];
-rz(4.072020350255479) q[40];
-cx q[23],q[40];
-cx q[40],q[119];
-rz(4.072020350255479) q[41];
-cx q[10],q[41];
-cx q[27],q[41];
-rz(4.072020350255479) q[41];
-cx q[27],q[41];
-cx q[27],q[72];
-cx q[41],q[67];
-rz(4.072020350255479) q[42];
-cx q[0],q[42];
-cx q[0],q[48];
-cx q[3],q[42];
-rz(4.072020350255479) q[42];
-cx q[3],q[42];
-cx q[3],q[43];
-cx q[42],q[78];
-rz(4.072020350255479) q[43];
-cx q[3],q[43];
-cx q[3],q[44];
-cx q[20],q[43];
-rz(4.072020350255479) q[43];
-cx q[20],q[43];
-cx q[20],q[121];
-rx(4.052865025049401) q[43];
-rz(4.072020350255479) q[44];
-cx q[3],q[44];
-cx q[3],q[49];
-cx q[12],q[44];
-rz(4.072020350255479) q[44];
-cx q[12],q[44];
-rz(4.072020350255479) q[45];
-cx q[1],q[45];
-cx q[1],q[57];
-cx q[16],q[45];
-rz(4.072020350255479) q[45];
-cx q[16],q[45];
-cx q[16],q[59];
-rz(4.072020350255479) q[46];
-cx q[5],q[46];
-cx q[5],q[65];
-cx q[38],q[46];
-rz(4.072020350255479) q[46];
-cx q[38],q[46];
-rx(4.052865025049401) q[38];
-cx q[46],q[120];
-rz(4.072020350255479) q[47];
-cx q[4],q[47];
-cx q[17],q[47];
-rz(4.072020350255479) q[47];
-cx q[17],q[47];
-cx q[17],q[53];
-rz(4.072020350255479) q[48];
-cx q[0],q[48];
-cx q[0],q[51];
-cx q[30],q[48];
-rz(4.072020350255479) q[48];
-cx q[30],q[48];
-rx(4.052865025049401) q[48];
-rz(4.072020350255479) q[49];
-cx q[3],q[49];
-cx q[3],q[50];
-cx q[4],q[49];
-rz(4.072020350255479) q[49];
-cx q[4],q[49];
-cx q[4],q[61];
-rx(4.052865025049401) q[49];
-rz(4.072020350255479) q[50];
-cx q[3],q[50];
-cx q[3],q[52];
-cx q[12],q[50];
-rz(4.072020350255479) q[50];
-cx q[12],q[50];
-cx q[12],q[63];
-rz(4.072020350255479) q[51];
-cx q[0],q[51];
-cx q[0],q[62];
-cx q[28],q[51];
-rz(4.072020350255479) q[51];
-cx q[28],q[51];
-rx(4.052865025049401) q[51];
-rz(4.072020350255479) q[52];
-cx q[3],q[52];
-cx q[10],q[52];
-rz(4.072020350255479) q[52];
-cx q[10],q[52];
-rz(4.072020350255479) q[53];
-cx q[17],q[53];
-cx q[21],q[53];
-rz(4.072020350255479) q[53];
-cx q[21],q[53];
-rz(4.072020350255479) q[54];
-cx q[24],q[54];
-cx q[24],q[58];
-cx q[28],q[54];
-rz(4.072020350255479) q[54];
-cx q[28],q[54];
-rx(4.052865025049401) q[54];
-rz(4.072020350255479) q[55];
-cx q[9],q[55];
-cx q[9],q[80];
-cx q[15],q[55];
-rz(4.072020350255479) q[55];
-cx q[15],q[55];
-rz(4.072020350255479) q[56];
-cx q[13],q[56];
-cx q[13],q[68];
-cx q[45],q[56];
-rz(4.072020350255479) q[56];
-cx q[45],q[56];
-rx(4.052865025049401) q[45];
-rz(4.072020350255479) q[57];
-cx q[1],q[57];
-cx q[1],q[60];
-cx q[3],q[57];
-rz(4.072020350255479) q[57];
-cx q[3],q[57];
-cx q[3],q[70];
-rz(4.072020350255479) q[58];
-cx q[24],q[58];
-cx q[24],q[86];
-cx q[28],q[58];
-rz(4.072020350255479) q[58];
-cx q[28],q[58];
-cx q[28],q[87];
-rx(4.052865025049401) q[58];
-rz(4.072020350255479) q[59];
-cx q[16],q[59];
-cx q[16],q[73];
-cx q[32],q[59];
-rz(4.072020350255479) q[59];
-cx q[32],q[59];
-rz(4.072020350255479) q[60];
-cx q[1],q[60];
-cx q[1],q[97];
-cx q[7],q[60];
-rz(4.072020350255479) q[60];
-cx q[7],q[60];
-rz(4.072020350255479) q[61];
-cx q[4],q[61];
-cx q[4],q[99];
-cx q[7],q[61];
-rz(4.072020350255479) q[61];
-cx q[7],q[61];
-rx(4.052865025049401) q[61];
-rz(4.072020350255479) q[62];
-cx q[0],q[62];
-cx q[0],q[64];
-cx q[17],q[62];
-rz(4.072020350255479) q[62];
-cx q[17],q[62];
-rz(4.072020350255479) q[63];
-cx q[12],q[63];
-cx q[17],q[63];
-rz(4.072020350255479) q[63];
-cx q[17],q[63];
-cx q[17],q[66];
-rz(4.072020350255479) q[64];
-cx q[0],q[64];
-cx q[0],q[75];
-cx q[10],q[64];
-rz(4.072020350255479) q[64];
-cx q[10],q[64];
-cx q[10],q[98];
-rx(4.052865025049401) q[64];
-rz(4.072020350255479) q[65];
-cx q[5],q[65];
-cx q[5],q[76];
-cx q[23],q[65];
-rz(4.072020350255479) q[65];
-cx q[23],q[65];
-rx(4.052865025049401) q[23];
-rx(4.052865025049401) q[65];
-rz(4.072020350255479) q[66];
-cx q[17],q[66];
-rx(4.052865025049401) q[17];
-cx q[47],q[66];
-rz(4.072020350255479) q[66];
-cx q[47],q[66];
-rx(4.052865025049401) q[66];
-rz(4.072020350255479) q[67];
-cx q[41],q[67];
-cx q[56],q[67];
-rz(4.072020350255479) q[67];
-cx q[56],q[67];
-cx q[56],q[74];
-rx(4.052865025049401) q[67];
-rz(4.072020350255479) q[68];
-cx q[13],q[68];
-cx q[32],q[68];
-rz(4.072020350255479) q[68];
-cx q[32],q[68];
-rz(4.072020350255479) q[69];
-cx q[6],q[69];
-cx q[59],q[69];
-rz(4.072020350255479) q[69];
-cx q[59],q[69];
-rz(4.072020350255479) q[70];
-cx q[3],q[70];
-cx q[3],q[71];
-cx q[15],q[70];
-rz(4.072020350255479) q[70];
-cx q[15],q[70];
-cx q[70],q[84];
-rz(4.072020350255479) q[71];
-cx q[3],q[71];
-cx q[3],q[77];
-cx q[53],q[71];
-rz(4.072020350255479) q[71];
-cx q[53],q[71];
-rx(4.052865025049401) q[71];
-rz(4.072020350255479) q[72];
-cx q[27],q[72];
-cx q[44],q[72];
-rz(4.072020350255479) q[72];
-cx q[44],q[72];
-rx(4.052865025049401) q[44];
-rx(4.052865025049401) q[72];
-rz(4.072020350255479) q[73];
-cx q[16],q[73];
-cx q[16],q[101];
-cx q[59],q[73];
-rz(4.072020350255479) q[73];
-cx q[59],q[73];
-rz(4.072020350255479) q[74];
-cx q[56],q[74];
-cx q[63],q[74];
-rz(4.072020350255479) q[74];
-cx q[63],q[74];
-cx q[63],q[122];
-rx(4.052865025049401) q[74];
-rz(4.072020350255479) q[75];
-cx q[0],q[75];
-cx q[0],q[82];
-cx q[21],q[75];
-rz(4.072020350255479) q[75];
-cx q[21],q[75];
-cx q[21],q[81];
-rx(4.052865025049401) q[75];
-rz(4.072020350255479) q[76];
-cx q[5],q[76];
-cx q[5],q[89];
-cx q[6],q[76];
-rz(4.072020350255479) q[76];
-cx q[6],q[76];
-cx q[6],q[79];
-rx(4.052865025049401) q[76];
-rz(4.072020350255479) q[77];
-cx q[3],q[77];
-cx q[3],q[88];
-cx q[30],q[77];
-rz(4.072020350255479) q[77];
-cx q[30],q[77];
-rx(4.052865025049401) q[30];
-rz(4.072020350255479) q[78];
-cx q[42],q[78];
-cx q[60],q[78];
-rz(4.072020350255479) q[78];
-cx q[60],q[78];
-rx(4.052865025049401) q[78];
-rz(4.072020350255479) q[79];
-cx q[6],q[79];
-cx q[50],q[79];
-rz(4.072020350255479) q[79];
-cx q[50],q[79];
-rx(4.052865025049401) q[79];
-rz(4.072020350255479) q[80];
-cx q[9],q[80];
-cx q[9],q[144];
-cx q[15],q[80];
-rz(4.072020350255479) q[80];
-cx q[15],q[80];
-cx q[15],q[90];
-rx(4.052865025049401) q[80];
-rz(4.072020350255479) q[81];
-cx q[21],q[81];
-cx q[77],q[81];
-rz(4.072020350255479) q[81];
-cx q[77],q[81];
-rx(4.052865025049401) q[77];
-rz(4.072020350255479) q[82];
-cx q[0],q[82];
-cx q[0],q[91];
-cx q[56],q[82];
-rz(4.072020350255479) q[82];
-cx q[56],q[82];
-cx q[56],q[96];
-rx(4.052865025049401) q[82];
-rz(4.072020350255479) q[83];
-cx q[8],q[83];
-rx(4.052865025049401) q[8];
-cx q[68],q[83];
-rz(4.072020350255479) q[83];
-cx q[68],q[83];
-rx(4.052865025049401) q[68];
-rx(4.052865025049401) q[83];
-rz(4.072020350255479) q[84];
-cx q[70],q[84];
-rx(4.052865025049401) q[70];
-cx q[73],q[84];
-rz(4.072020350255479) q[84];
-cx q[73],q[84];
-rx(4.052865025049401) q[73];
-rx(4.052865025049401) q[84];
-rz(4.072020350255479) q[85];
-cx q[37],q[85];
-cx q[59],q[85];
-rz(4.072020350255479) q[85];
-cx q[59],q[85];
-rx(4.052865025049401) q[85];
-rz(4.072020350255479) q[86];
-cx q[24],q[86];
-cx q[53],q[86];
-rz(4.072020350255479) q[86];
-cx q[53],q[86];
-cx q[53],q[124];
-rx(4.052865025049401) q[86];
-rz(4.072020350255479) q[87];
-cx q[28],q[87];
-cx q[32],q[87];
-rz(4.072020350255479) q[87];
-cx q[32],q[87];
-rx(4.052865025049401) q[87];
-rz(4.072020350255479) q[88];
-cx q[3],q[88];
-cx q[3],q[100];
-cx q[60],q[88];
-rz(4.072020350255479) q[88];
-cx q[60],q[88];
-cx q[60],q[138];
-rx(4.052865025049401) q[88];
-rz(4.072020350255479) q[89];
-cx q[5],q[89];
-cx q[5],q[95];
-rz(4.072020350255479) q[90];
-cx q[15],q[90];
-cx q[15],q[92];
-cx q[27],q[90];
-rz(4.072020350255479) q[90];
-cx q[27],q[90];
-rx(4.052865025049401) q[90];
-rz(4.072020350255479) q[91];
-cx q[0],q[91];
-cx q[0],q[93];
-cx q[6],q[91];
-rz(4.072020350255479) q[91];
-cx q[6],q[91];
-rx(4.052865025049401) q[6];
-rz(4.072020350255479) q[92];
-cx q[15],q[92];
-cx q[15],q[108];
-cx q[89],q[92];
-rz(4.072020350255479) q[92];
-cx q[89],q[92];
-rz(4.072020350255479) q[93];
-cx q[0],q[93];
-cx q[0],q[123];
-cx q[32],q[93];
-rz(4.072020350255479) q[93];
-cx q[32],q[93];
-rx(4.052865025049401) q[93];
-rz(4.072020350255479) q[94];
-cx q[36],q[94];
-cx q[55],q[94];
-rz(4.072020350255479) q[94];
-cx q[55],q[94];
-rx(4.052865025049401) q[55];
-rz(4.072020350255479) q[95];
-cx q[5],q[95];
-cx q[5],q[106];
-cx q[27],q[95];
-rz(4.072020350255479) q[95];
-cx q[27],q[95];
-rx(4.052865025049401) q[27];
-rx(4.052865025049401) q[95];
-rz(4.072020350255479) q[96];
-cx q[56],q[96];
-rx(4.052865025049401) q[56];
-cx q[92],q[96];
-rz(4.072020350255479) q[96];
-cx q[92],q[96];
-rx(4.052865025049401) q[96];
-rz(4.072020350255479) q[97];
-cx q[1],q[97];
-cx q[1],q[113];
-cx q[7],q[97];
-rz(4.072020350255479) q[97];
-cx q[7],q[97];
-cx q[7],q[104];
-rz(4.072020350255479) q[98];
-cx q[10],q[98];
-rx(4.052865025049401) q[10];
-cx q[21],q[98];
-rz(4.072020350255479) q[98];
-cx q[21],q[98];
-rx(4.052865025049401) q[98];
-rz(4.072020350255479) q[99];
-cx q[4],q[99];
-cx q[41],q[99];
-rz(4.072020350255479) q[99];
-cx q[41],q[99];
-rx(4.052865025049401) q[41];
-rx(4.052865025049401) q[99];
-rz(4.072020350255479) q[100];
-cx q[3],q[100];
-cx q[3],q[102];
-cx q[25],q[100];
-rz(4.072020350255479) q[100];
-cx q[25],q[100];
-rx(4.052865025049401) q[25];
-rx(4.052865025049401) q[100];
-rz(4.072020350255479) q[101];
-cx q[16],q[101];
-cx q[16],q[103];
-cx q[50],q[101];
-rz(4.072020350255479) q[101];
-cx q[50],q[101];
-cx q[50],q[129];
-rx(4.052865025049401) q[101];
-rz(4.072020350255479) q[102];
-cx q[3],q[102];
-cx q[3],q[107];
-cx q[4],q[102];
-rz(4.072020350255479) q[102];
-cx q[4],q[102];
-cx q[4],q[127];
-rx(4.052865025049401) q[102];
-rz(4.072020350255479) q[103];
-cx q[16],q[103];
-rx(4.052865025049401) q[16];
-cx q[57],q[103];
-rz(4.072020350255479) q[103];
-cx q[57],q[103];
-rx(4.052865025049401) q[57];
-rx(4.052865025049401) q[103];
-rz(4.072020350255479) q[104];
-cx q[7],q[104];
-cx q[7],q[133];
-cx q[13],q[104];
-rz(4.072020350255479) q[104];
-cx q[13],q[104];
-cx q[104],q[114];
-rz(4.072020350255479) q[105];
-cx q[26],q[105];
-cx q[26],q[117];
-cx q[28],q[105];
-rz(4.072020350255479) q[105];
-cx q[28],q[105];
-cx q[28],q[116];
-rx(4.052865025049401) q[105];
-rz(4.072020350255479) q[106];
-cx q[5],q[106];
-cx q[5],q[109];
-cx q[36],q[106];
-rz(4.072020350255479) q[106];
-cx q[36],q[106];
-rx(4.052865025049401) q[106];
-rz(4.072020350255479) q[107];
-cx q[3],q[107];
-cx q[3],q[110];
-cx q[31],q[107];
-rz(4.072020350255479) q[107];
-cx q[31],q[107];
-rx(4.052865025049401) q[107];
-rz(4.072020350255479) q[108];
-cx q[15],q[108];
-cx q[15],q[115];
-cx q[31],q[108];
-rz(4.072020350255479) q[108];
-cx q[31],q[108];
-rx(4.052865025049401) q[31];
-rx(4.052865025049401) q[108];
-rz(4.072020350255479) q[109];
-cx q[5],q[109];
-cx q[39],q[109];
-rz(4.072020350255479) q[109];
-cx q[39],q[109];
-rx(4.052865025049401) q[39];
-rz(4.072020350255479) q[110];
-cx q[3],q[110];
-cx q[3],q[111];
-cx q[24],q[110];
-rz(4.072020350255479) q[110];
-cx q[24],q[110];
-cx q[24],q[137];
-rz(4.072020350255479) q[111];
-cx q[3],q[111];
-cx q[21],q[111];
-rz(4.072020350255479) q[111];
-cx q[21],q[111];
-cx q[21],q[112];
-rx(4.052865025049401) q[111];
-rz(4.072020350255479) q[112];
-cx q[21],q[112];
-rx(4.052865025049401) q[21];
-cx q[36],q[112];
-rz(4.072020350255479) q[112];
-cx q[36],q[112];
-rx(4.052865025049401) q[36];
-rx(4.052865025049401) q[112];
-rz(4.072020350255479) q[113];
-cx q[1],q[113];
-rx(4.052865025049401) q[1];
-cx q[3],q[113];
-rz(4.072020350255479) q[113];
-cx q[3],q[113];
-cx q[3],q[125];
-rx(4.052865025049401) q[113];
-rz(4.072020350255479) q[114];
-cx q[104],q[114];
-cx q[110],q[114];
-rz(4.072020350255479) q[114];
-cx q[110],q[114];
-rx(4.052865025049401) q[110];
-rx(4.052865025049401) q[114];
-rz(4.072020350255479) q[115];
-cx q[15],q[115];
-cx q[92],q[115];
-rz(4.072020350255479) q[115];
-cx q[92],q[115];
-rx(4.052865025049401) q[115];
-rz(4.072020350255479) q[116];
-cx q[28],q[116];
-rx(4.052865025049401) q[28];
-cx q[42],q[116];
-rz(4.072020350255479) q[116];
-cx q[42],q[116];
-rx(4.052865025049401) q[42];
-rx(4.052865025049401) q[116];
-rz(4.072020350255479) q[117];
-cx q[26],q[117];
-rx(4.052865025049401) q[26];
-cx q[32],q[117];
-rz(4.072020350255479) q[117];
-cx q[32],q[117];
-cx q[32],q[131];
-rx(4.052865025049401) q[117];
-cx q[118],q[147];
-rz(4.072020350255479) q[119];
-cx q[40],q[119];
-rx(4.052865025049401) q[40];
-cx q[69],q[119];
-rz(4.072020350255479) q[119];
-cx q[69],q[119];
-rx(4.052865025049401) q[69];
-rz(4.072020350255479) q[120];
-cx q[46],q[120];
-rx(4.052865025049401) q[46];
-cx q[94],q[120];
-rz(4.072020350255479) q[120];
-cx q[94],q[120];
-rx(4.052865025049401) q[94];
-rx(4.052865025049401) q[120];
-rz(4.072020350255479) q[121];
-cx q[20],q[121];
-rx(4.052865025049401) q[20];
-cx q[104],q[121];
-rz(4.072020350255479) q[121];
-cx q[104],q[121];
-rx(4.052865025049401) q[104];
-rz(4.072020350255479) q[122];
-cx q[63],q[122];
-rx(4.052865025049401) q[63];
-cx q[81],q[122];
-rz(4.072020350255479) q[122];
-cx q[81],q[122];
-rx(4.052865025049401) q[122];
-rz(4.072020350255479) q[123];
-cx q[0],q[123];
-cx q[0],q[126];
-cx q[52],q[123];
-rz(4.072020350255479) q[123];
-cx q[52],q[123];
-rx(4.052865025049401) q[52];
-rz(4.072020350255479) q[124];
-cx q[53],q[124];
-rx(4.052865025049401) q[53];
-cx q[81],q[124];
-rz(4.072020350255479) q[124];
-cx q[81],q[124];
-rx(4.052865025049401) q[81];
-rx(4.052865025049401) q[124];
-rz(4.072020350255479) q[125];
-cx q[3],q[125];
-cx q[3],q[132];
-cx q[109],q[125];
-rz(4.072020350255479) q[125];
-cx q[109],q[125];
-rx(4.052865025049401) q[125];
-rz(4.072020350255479) q[126];
-cx q[0],q[126];
-cx q[0],q[135];
-cx q[12],q[126];
-rz(4.072020350255479) q[126];
-cx q[12],q[126];
-cx q[12],q[141];
-rx(4.052865025049401) q[126];
-rz(4.072020350255479) q[127];
-cx q[4],q[127];
-cx q[62],q[127];
-rz(4.072020350255479) q[127];
-cx q[62],q[127];
-cx q[62],q[128];
-rx(4.052865025049401) q[127];
-rz(4.072020350255479) q[128];
-cx q[62],q[128];
-rx(4.052865025049401) q[62];
-cx q[109],q[128];
-rz(4.072020350255479) q[128];
-cx q[109],q[128];
-rx(4.052865025049401) q[128];
-rz(4.072020350255479) q[129];
-cx q[50],q[129];
-cx q[91],q[129];
-rz(4.072020350255479) q[129];
-cx q[91],q[129];
-rx(4.052865025049401) q[91];
-rx(4.052865025049401) q[129];
-rz(4.072020350255479) q[130];
-cx q[35],q[130];
-rx(4.052865025049401) q[35];
-cx q[109],q[130];
-rz(4.072020350255479) q[130];
-cx q[109],q[130];
-rx(4.052865025049401) q[109];
-rx(4.052865025049401) q[130];
-rz(4.072020350255479) q[131];
-cx q[32],q[131];
-cx q[123],q[131];
-rz(4.072020350255479) q[131];
-cx q[123],q[131];
-rx(4.052865025049401) q[123];
-rx(4.052865025049401) q[131];
-rz(4.072020350255479) q[132];
-cx q[3],q[132];
-cx q[3],q[134];
-cx q[37],q[132];
-rz(4.072020350255479) q[132];
-cx q[37],q[132];
-rx(4.052865025049401) q[37];
-rx(4.052865025049401) q[132];
-rz(4.072020350255479) q[133];
-cx q[7],q[133];
-rx(4.052865025049401) q[7];
-cx q[89],q[133];
-rz(4.072020350255479) q[133];
-cx q[89],q[133];
-rx(4.052865025049401) q[89];
-rz(4.072020350255479) q[134];
-cx q[3],q[134];
-cx q[3],q[136];
-cx q[47],q[134];
-rz(4.072020350255479) q[134];
-cx q[47],q[134];
-rx(4.052865025049401) q[47];
-rx(4.052865025049401) q[134];
-rz(4.072020350255479) q[135];
-cx q[0],q[135];
-cx q[0],q[140];
-cx q[13],q[135];
-rz(4.072020350255479) q[135];
-cx q[13],q[135];
-rx(4.052865025049401) q[13];
-rx(4.052865025049401) q[135];
-rz(4.072020350255479) q[136];
-cx q[3],q[136];
-cx q[3],q[145];
-cx q[92],q[136];
-rz(4.072020350255479) q[136];
-cx q[92],q[136];
-rx(4.052865025049401) q[92];
-rx(4.052865025049401) q[136];
-rz(4.072020350255479) q[137];
-cx q[24],q[137];
-cx q[133],q[137];
-rz(4.072020350255479) q[137];
-cx q[133],q[137];
-rx(4.052865025049401) q[137];
-rz(4.072020350255479) q[138];
-cx q[60],q[138];
-rx(4.052865025049401) q[60];
-cx q[119],q[138];
-rz(4.072020350255479) q[138];
-cx q[119],q[138];
-rx(4.052865025049401) q[119];
-rx(4.052865025049401) q[138];
-rz(4.072020350255479) q[140];
-cx q[0],q[140];
-cx q[0],q[146];
-cx q[32],q[140];
-rz(4.072020350255479) q[140];
-cx q[32],q[140];
-rx(4.052865025049401) q[32];
-rx(4.052865025049401) q[140];
-rz(4.072020350255479) q[141];
-cx q[12],q[141];
-cx q[12],q[143];
-cx q[121],q[141];
-rz(4.072020350255479) q[141];
-cx q[121],q[141];
-rx(4.052865025049401) q[121];
-rx(4.052865025049401) q[141];
-rz(4.072020350255479) q[143];
-cx q[12],q[143];
-rx(4.052865025049401) q[12];
-cx q[50],q[143];
-rz(4.072020350255479) q[143];
-cx q[50],q[143];
-rx(4.052865025049401) q[50];
-rx(4.052865025049401) q[143];
-rz(4.072020350255479) q[144];
-cx q[9],q[144];
-rx(4.052865025049401) q[9];
-cx q[59],q[144];
-rz(4.072020350255479) q[144];
-cx q[59],q[144];
-rx(4.052865025049401) q[59];
-rx(4.052865025049401) q[144];
-rz(4.072020350255479) q[145];
-cx q[3],q[145];
-cx q[97],q[145];
-rz(4.072020350255479) q[145];
-cx q[97],q[145];
-rx(4.052865025049401) q[97];
-rx(4.052865025049401) q[145];
-rz(4.072020350255479) q[146];
-cx q[0],q[146];
-rx(4.052865025049401) q[0];
-cx q[0],q[1];
-rz(0.6834469027180843) q[1];
-cx q[0],q[1];
-cx q[0],q[2];
-rz(0.6834469027180843) q[2];
-cx q[0],q[2];
-cx q[2],q[89];
-cx q[4],q[146];
-rz(0.6834469027180843) q[89];
-cx q[2],q[89];
-rx(4.607960677389259) q[2];
-rz(4.072020350255479) q[146];
-cx q[4],q[146];
-rx(4.052865025049401) q[4];
-rx(4.052865025049401) q[146];
-rz(5.0806978167011625) q[147];
-cx q[118],q[147];
-rx(7.343253806982983) q[118];
-cx q[5],q[118];
-rz(4.072020350255479) q[118];
-cx q[5],q[118];
-cx q[5],q[139];
-cx q[15],q[118];
-rz(4.072020350255479) q[118];
-cx q[15],q[118];
-rx(4.052865025049401) q[15];
-rz(4.072020350255479) q[139];
-cx q[5],q[139];
-cx q[5],q[142];
-cx q[133],q[139];
-rz(4.072020350255479) q[139];
-cx q[133],q[139];
-rx(4.052865025049401) q[133];
-rx(4.052865025049401) q[139];
-rz(4.072020350255479) q[142];
-cx q[5],q[142];
-rx(4.052865025049401) q[5];
-cx q[24],q[142];
-rz(4.072020350255479) q[142];
-cx q[24],q[142];
-rx(4.052865025049401) q[24];
-rx(4.052865025049401) q[142];
-rx(7.343253806982983) q[147];
-cx q[3],q[147];
-rz(4.072020350255479) q[147];
-cx q[3],q[147];
-rx(4.052865025049401) q[3];
-cx q[0],q[3];
-rz(0.6834469027180843) q[3];
-cx q[0],q[3];
-cx q[0],q[15];
-cx q[1],q[3];
-rz(0.6834469027180843) q[3];
-cx q[1],q[3];
-cx q[1],q[4];
-rz(0.6834469027180843) q[4];
-cx q[1],q[4];
-cx q[1],q[5];
-cx q[3],q[4];
-rz(0.6834469027180843) q[4];
-cx q[3],q[4];
-cx q[4],q[6];
-rz(0.6834469027180843) q[5];
-cx q[1],q[5];
-cx q[1],q[9];
-cx q[3],q[5];
-rz(0.6834469027180843) q[5];
-cx q[3],q[5];
-cx q[3],q[7];
-rz(0.6834469027180843) q[6];
-cx q[4],q[6];
-cx q[5],q[6];
-rz(0.6834469027180843) q[6];
-cx q[5],q[6];
-rz(0.6834469027180843) q[7];
-cx q[3],q[7];
-cx q[3],q[8];
-cx q[4],q[7];
-rz(0.6834469027180843) q[7];
-cx q[4],q[7];
-cx q[4],q[10];
-rz(0.6834469027180843) q[8];
-cx q[3],q[8];
-cx q[5],q[8];
-rz(0.6834469027180843) q[8];
-cx q[5],q[8];
-cx q[5],q[11];
-cx q[8],q[83];
-rz(0.6834469027180843) q[9];
-cx q[1],q[9];
-cx q[1],q[17];
-cx q[3],q[9];
-rz(0.6834469027180843) q[9];
-cx q[3],q[9];
-cx q[3],q[12];
-rz(0.6834469027180843) q[10];
-cx q[4],q[10];
-cx q[4],q[13];
-cx q[6],q[10];
-rz(0.6834469027180843) q[10];
-cx q[6],q[10];
-cx q[10],q[37];
-rz(0.6834469027180843) q[11];
-cx q[5],q[11];
-cx q[6],q[11];
-rz(0.6834469027180843) q[11];
-cx q[6],q[11];
-rx(4.607960677389259) q[11];
-rz(0.6834469027180843) q[12];
-cx q[3],q[12];
-cx q[3],q[14];
-cx q[5],q[12];
-rz(0.6834469027180843) q[12];
-cx q[5],q[12];
-rz(0.6834469027180843) q[13];
-cx q[4],q[13];
-cx q[5],q[13];
-rz(0.6834469027180843) q[13];
-cx q[5],q[13];
-rz(0.6834469027180843) q[14];
-cx q[3],q[14];
-cx q[4],q[14];
-rz(0.6834469027180843) q[14];
-cx q[4],q[14];
-rx(4.607960677389259) q[14];
-rz(0.6834469027180843) q[15];
-cx q[0],q[15];
-cx q[0],q[16];
-cx q[3],q[15];
-rz(0.6834469027180843) q[15];
-cx q[3],q[15];
-rz(0.6834469027180843) q[16];
-cx q[0],q[16];
-cx q[0],q[20];
-cx q[3],q[16];
-rz(0.6834469027180843) q[16];
-cx q[3],q[16];
-rz(0.6834469027180843) q[17];
-cx q[1],q[17];
-cx q[1],q[28];
-cx q[3],q[17];
-rz(0.6834469027180843) q[17];
-cx q[3],q[17];
-cx q[3],q[18];
-rz(0.6834469027180843) q[18];
-cx q[3],q[18];
-cx q[3],q[19];
-cx q[4],q[18];
-rz(0.6834469027180843) q[18];
-cx q[4],q[18];
-cx q[4],q[21];
-rz(0.6834469027180843) q[19];
-cx q[3],q[19];
-cx q[3],q[22];
-cx q[7],q[19];
-rz(0.6834469027180843) q[19];
-cx q[7],q[19];
-cx q[19],q[38];
-rz(0.6834469027180843) q[20];
-cx q[0],q[20];
-cx q[0],q[32];
-cx q[15],q[20];
-rz(0.6834469027180843) q[20];
-cx q[15],q[20];
-rz(0.6834469027180843) q[21];
-cx q[4],q[21];
-cx q[4],q[27];
-cx q[15],q[21];
-rz(0.6834469027180843) q[21];
-cx q[15],q[21];
-cx q[15],q[36];
-rz(0.6834469027180843) q[22];
-cx q[3],q[22];
-cx q[3],q[23];
-cx q[9],q[22];
-rz(0.6834469027180843) q[22];
-cx q[9],q[22];
-cx q[9],q[55];
-rx(4.607960677389259) q[22];
-rz(0.6834469027180843) q[23];
-cx q[3],q[23];
-cx q[3],q[24];
-cx q[17],q[23];
-rz(0.6834469027180843) q[23];
-cx q[17],q[23];
-rz(0.6834469027180843) q[24];
-cx q[3],q[24];
-cx q[3],q[25];
-cx q[5],q[24];
-rz(0.6834469027180843) q[24];
-cx q[5],q[24];
-cx q[5],q[33];
-cx q[24],q[54];
-rz(0.6834469027180843) q[25];
-cx q[3],q[25];
-cx q[3],q[26];
-cx q[12],q[25];
-rz(0.6834469027180843) q[25];
-cx q[12],q[25];
-cx q[12],q[31];
-rz(0.6834469027180843) q[26];
-cx q[3],q[26];
-cx q[21],q[26];
-rz(0.6834469027180843) q[26];
-cx q[21],q[26];
-rz(0.6834469027180843) q[27];
-cx q[4],q[27];
-cx q[4],q[47];
-cx q[6],q[27];
-rz(0.6834469027180843) q[27];
-cx q[6],q[27];
-cx q[6],q[69];
-rz(0.6834469027180843) q[28];
-cx q[1],q[28];
-cx q[1],q[29];
-cx q[3],q[28];
-rz(0.6834469027180843) q[28];
-cx q[3],q[28];
-rz(0.6834469027180843) q[29];
-cx q[1],q[29];
-cx q[1],q[45];
-cx q[3],q[29];
-rz(0.6834469027180843) q[29];
-cx q[3],q[29];
-cx q[3],q[30];
-rx(4.607960677389259) q[29];
-rz(0.6834469027180843) q[30];
-cx q[3],q[30];
-cx q[3],q[34];
-cx q[18],q[30];
-rz(0.6834469027180843) q[30];
-cx q[18],q[30];
-rx(4.607960677389259) q[18];
-rz(0.6834469027180843) q[31];
-cx q[12],q[31];
-cx q[26],q[31];
-rz(0.6834469027180843) q[31];
-cx q[26],q[31];
-cx q[26],q[105];
-rz(0.6834469027180843) q[32];
-cx q[0],q[32];
-cx q[0],q[42];
-cx q[21],q[32];
-rz(0.6834469027180843) q[32];
-cx q[21],q[32];
-rz(0.6834469027180843) q[33];
-cx q[5],q[33];
-cx q[5],q[46];
-cx q[30],q[33];
-rz(0.6834469027180843) q[33];
-cx q[30],q[33];
-rx(4.607960677389259) q[33];
-rz(0.6834469027180843) q[34];
-cx q[3],q[34];
-cx q[3],q[35];
-cx q[12],q[34];
-rz(0.6834469027180843) q[34];
-cx q[12],q[34];
-rz(0.6834469027180843) q[35];
-cx q[3],q[35];
-cx q[3],q[39];
-cx q[32],q[35];
-rz(0.6834469027180843) q[35];
-cx q[32],q[35];
-cx q[35],q[130];
-rz(0.6834469027180843) q[36];
-cx q[15],q[36];
-cx q[20],q[36];
-rz(0.6834469027180843) q[36];
-cx q[20],q[36];
-cx q[36],q[94];
-rz(0.6834469027180843) q[37];
-cx q[10],q[37];
-cx q[10],q[41];
-cx q[34],q[37];
-rz(0.6834469027180843) q[37];
-cx q[34],q[37];
-rx(4.607960677389259) q[34];
-cx q[37],q[85];
-rz(0.6834469027180843) q[38];
-cx q[19],q[38];
-rx(4.607960677389259) q[19];
-cx q[21],q[38];
-rz(0.6834469027180843) q[38];
-cx q[21],q[38];
-rz(0.6834469027180843) q[39];
-cx q[3],q[39];
-cx q[3],q[40];
-cx q[13],q[39];
-rz(0.6834469027180843) q[39];
-cx q[13],q[39];
-cx q[13],q[56];
-rz(0.6834469027180843) q[40];
-cx q[3],q[40];
-cx q[23],q[40];
-rz(0.6834469027180843) q[40];
-cx q[23],q[40];
-cx q[40],q[119];
-rz(0.6834469027180843) q[41];
-cx q[10],q[41];
-cx q[27],q[41];
-rz(0.6834469027180843) q[41];
-cx q[27],q[41];
-cx q[27],q[72];
-cx q[41],q[67];
-rz(0.6834469027180843) q[42];
-cx q[0],q[42];
-cx q[0],q[48];
-cx q[3],q[42];
-rz(0.6834469027180843) q[42];
-cx q[3],q[42];
-cx q[3],q[43];
-cx q[42],q[78];
-rz(0.6834469027180843) q[43];
-cx q[3],q[43];
-cx q[3],q[44];
-cx q[20],q[43];
-rz(0.6834469027180843) q[43];
-cx q[20],q[43];
-cx q[20],q[121];
-rx(4.607960677389259) q[43];
-rz(0.6834469027180843) q[44];
-cx q[3],q[44];
-cx q[3],q[49];
-cx q[12],q[44];
-rz(0.6834469027180843) q[44];
-cx q[12],q[44];
-rz(0.6834469027180843) q[45];
-cx q[1],q[45];
-cx q[1],q[57];
-cx q[16],q[45];
-rz(0.6834469027180843) q[45];
-cx q[16],q[45];
-cx q[16],q[59];
-rz(0.6834469027180843) q[46];
-cx q[5],q[46];
-cx q[5],q[65];
-cx q[38],q[46];
-rz(0.6834469027180843) q[46];
-cx q[38],q[46];
-rx(4.607960677389259) q[38];
-cx q[46],q[120];
-rz(0.6834469027180843) q[47];
-cx q[4],q[47];
-cx q[17],q[47];
-rz(0.6834469027180843) q[47];
-cx q[17],q[47];
-cx q[17],q[53];
-rz(0.6834469027180843) q[48];
-cx q[0],q[48];
-cx q[0],q[51];
-cx q[30],q[48];
-rz(0.6834469027180843) q[48];
-cx q[30],q[48];
-rx(4.607960677389259) q[48];
-rz(0.6834469027180843) q[49];
-cx q[3],q[49];
-cx q[3],q[50];
-cx q[4],q[49];
-rz(0.6834469027180843) q[49];
-cx q[4],q[49];
-cx q[4],q[61];
-rx(4.607960677389259) q[49];
-rz(0.6834469027180843) q[50];
-cx q[3],q[50];
-cx q[3],q[52];
-cx q[12],q[50];
-rz(0.6834469027180843) q[50];
-cx q[12],q[50];
-cx q[12],q[63];
-rz(0.6834469027180843) q[51];
-cx q[0],q[51];
-cx q[0],q[62];
-cx q[28],q[51];
-rz(0.6834469027180843) q[51];
-cx q[28],q[51];
-rx(4.607960677389259) q[51];
-rz(0.6834469027180843) q[52];
-cx q[3],q[52];
-cx q[10],q[52];
-rz(0.6834469027180843) q[52];
-cx q[10],q[52];
-rz(0.6834469027180843) q[53];
-cx q[17],q[53];
-cx q[21],q[53];
-rz(0.6834469027180843) q[53];
-cx q[21],q[53];
-rz(0.6834469027180843) q[54];
-cx q[24],q[54];
-cx q[24],q[58];
-cx q[28],q[54];
-rz(0.6834469027180843) q[54];
-cx q[28],q[54];
-rx(4.607960677389259) q[54];
-rz(0.6834469027180843) q[55];
-cx q[9],q[55];
-cx q[9],q[80];
-cx q[15],q[55];
-rz(0.6834469027180843) q[55];
-cx q[15],q[55];
-rz(0.6834469027180843) q[56];
-cx q[13],q[56];
-cx q[13],q[68];
-cx q[45],q[56];
-rz(0.6834469027180843) q[56];
-cx q[45],q[56];
-rx(4.607960677389259) q[45];
-rz(0.6834469027180843) q[57];
-cx q[1],q[57];
-cx q[1],q[60];
-cx q[3],q[57];
-rz(0.6834469027180843) q[57];
-cx q[3],q[57];
-cx q[3],q[70];
-rz(0.6834469027180843) q[58];
-cx q[24],q[58];
-cx q[24],q[86];
-cx q[28],q[58];
-rz(0.6834469027180843) q[58];
-cx q[28],q[58];
-cx q[28],q[87];
-rx(4.607960677389259) q[58];
-rz(0.6834469027180843) q[59];
-cx q[16],q[59];
-cx q[16],q[73];
-cx q[32],q[59];
-rz(0.6834469027180843) q[59];
-cx q[32],q[59];
-rz(0.6834469027180843) q[60];
-cx q[1],q[60];
-cx q[1],q[97];
-cx q[7],q[60];
-rz(0.6834469027180843) q[60];
-cx q[7],q[60];
-rz(0.6834469027180843) q[61];
-cx q[4],q[61];
-cx q[4],q[99];
-cx q[7],q[61];
-rz(0.6834469027180843) q[61];
-cx q[7],q[61];
-rx(4.607960677389259) q[61];
-rz(0.6834469027180843) q[62];
-cx q[0],q[62];
-cx q[0],q[64];
-cx q[17],q[62];
-rz(0.6834469027180843) q[62];
-cx q[17],q[62];
-rz(0.6834469027180843) q[63];
-cx q[12],q[63];
-cx q[17],q[63];
-rz(0.6834469027180843) q[63];
-cx q[17],q[63];
-cx q[17],q[66];
-rz(0.6834469027180843) q[64];
-cx q[0],q[64];
-cx q[0],q[75];
-cx q[10],q[64];
-rz(0.6834469027180843) q[64];
-cx q[10],q[64];
-cx q[10],q[98];
-rx(4.607960677389259) q[64];
-rz(0.6834469027180843) q[65];
-cx q[5],q[65];
-cx q[5],q[76];
-cx q[23],q[65];
-rz(0.6834469027180843) q[65];
-cx q[23],q[65];
-rx(4.607960677389259) q[23];
-rx(4.607960677389259) q[65];
-rz(0.6834469027180843) q[66];
-cx q[17],q[66];
-rx(4.607960677389259) q[17];
-cx q[47],q[66];
-rz(0.6834469027180843) q[66];
-cx q[47],q[66];
-rx(4.607960677389259) q[66];
-rz(0.6834469027180843) q[67];
-cx q[41],q[67];
-cx q[56],q[67];
-rz(0.6834469027180843) q[67];
-cx q[56],q[67];
-cx q[56],q[74];
-rx(4.607960677389259) q[67];
-rz(0.6834469027180843) q[68];
-cx q[13],q[68];
-cx q[32],q[68];
-rz(0.6834469027180843) q[68];
-cx q[32],q[68];
-rz(0.6834469027180843) q[69];
-cx q[6],q[69];
-cx q[59],q[69];
-rz(0.6834469027180843) q[69];
-cx q[59],q[69];
-rz(0.6834469027180843) q[70];
-cx q[3],q[70];
-cx q[3],q[71];
-cx q[15],q[70];
-rz(0.6834469027180843) q[70];
-cx q[15],q[70];
-cx q[70],q[84];
-rz(0.6834469027180843) q[71];
-cx q[3],q[71];
-cx q[3],q[77];
-cx q[53],q[71];
-rz(0.6834469027180843) q[71];
-cx q[53],q[71];
-rx(4.607960677389259) q[71];
-rz(0.6834469027180843) q[72];
-cx q[27],q[72];
-cx q[44],q[72];
-rz(0.6834469027180843) q[72];
-cx q[44],q[72];
-rx(4.607960677389259) q[44];
-rx(4.607960677389259) q[72];
-rz(0.6834469027180843) q[73];
-cx q[16],q[73];
-cx q[16],q[101];
-cx q[59],q[73];
-rz(0.6834469027180843) q[73];
-cx q[59],q[73];
-rz(0.6834469027180843) q[74];
-cx q[56],q[74];
-cx q[63],q[74];
-rz(0.6834469027180843) q[74];
-cx q[63],q[74];
-cx q[63],q[122];
-rx(4.607960677389259) q[74];
-rz(0.6834469027180843) q[75];
-cx q[0],q[75];
-cx q[0],q[82];
-cx q[21],q[75];
-rz(0.6834469027180843) q[75];
-cx q[21],q[75];
-cx q[21],q[81];
-rx(4.607960677389259) q[75];
-rz(0.6834469027180843) q[76];
-cx q[5],q[76];
-cx q[5],q[89];
-cx q[6],q[76];
-rz(0.6834469027180843) q[76];
-cx q[6],q[76];
-cx q[6],q[79];
-rx(4.607960677389259) q[76];
-rz(0.6834469027180843) q[77];
-cx q[3],q[77];
-cx q[3],q[88];
-cx q[30],q[77];
-rz(0.6834469027180843) q[77];
-cx q[30],q[77];
-rx(4.607960677389259) q[30];
-rz(0.6834469027180843) q[78];
-cx q[42],q[78];
-cx q[60],q[78];
-rz(0.6834469027180843) q[78];
-cx q[60],q[78];
-rx(4.607960677389259) q[78];
-rz(0.6834469027180843) q[79];
-cx q[6],q[79];
-cx q[50],q[79];
-rz(0.6834469027180843) q[79];
-cx q[50],q[79];
-rx(4.607960677389259) q[79];
-rz(0.6834469027180843) q[80];
-cx q[9],q[80];
-cx q[9],q[144];
-cx q[15],q[80];
-rz(0.6834469027180843) q[80];
-cx q[15],q[80];
-cx q[15],q[90];
-rx(4.607960677389259) q[80];
-rz(0.6834469027180843) q[81];
-cx q[21],q[81];
-cx q[77],q[81];
-rz(0.6834469027180843) q[81];
-cx q[77],q[81];
-rx(4.607960677389259) q[77];
-rz(0.6834469027180843) q[82];
-cx q[0],q[82];
-cx q[0],q[91];
-cx q[56],q[82];
-rz(0.6834469027180843) q[82];
-cx q[56],q[82];
-cx q[56],q[96];
-rx(4.607960677389259) q[82];
-rz(0.6834469027180843) q[83];
-cx q[8],q[83];
-rx(4.607960677389259) q[8];
-cx q[68],q[83];
-rz(0.6834469027180843) q[83];
-cx q[68],q[83];
-rx(4.607960677389259) q[68];
-rx(4.607960677389259) q[83];
-rz(0.6834469027180843) q[84];
-cx q[70],q[84];
-rx(4.607960677389259) q[70];
-cx q[73],q[84];
-rz(0.6834469027180843) q[84];
-cx q[73],q[84];
-rx(4.607960677389259) q[73];
-rx(4.607960677389259) q[84];
-rz(0.6834469027180843) q[85];
-cx q[37],q[85];
-cx q[59],q[85];
-rz(0.6834469027180843) q[85];
-cx q[59],q[85];
-rx(4.607960677389259) q[85];
-rz(0.6834469027180843) q[86];
-cx q[24],q[86];
-cx q[53],q[86];
-rz(0.6834469027180843) q[86];
-cx q[53],q[86];
-cx q[53],q[124];
-rx(4.607960677389259) q[86];
-rz(0.6834469027180843) q[87];
-cx q[28],q[87];
-cx q[32],q[87];
-rz(0.6834469027180843) q[87];
-cx q[32],q[87];
-rx(4.607960677389259) q[87];
-rz(0.6834469027180843) q[88];
-cx q[3],q[88];
-cx q[3],q[100];
-cx q[60],q[88];
-rz(0.6834469027180843) q[88];
-cx q[60],q[88];
-cx q[60],q[138];
-rx(4.607960677389259) q[88];
-rz(0.6834469027180843) q[89];
-cx q[5],q[89];
-cx q[5],q[95];
-rz(0.6834469027180843) q[90];
-cx q[15],q[90];
-cx q[15],q[92];
-cx q[27],q[90];
-rz(0.6834469027180843) q[90];
-cx q[27],q[90];
-rx(4.607960677389259) q[90];
-rz(0.6834469027180843) q[91];
-cx q[0],q[91];
-cx q[0],q[93];
-cx q[6],q[91];
-rz(0.6834469027180843) q[91];
-cx q[6],q[91];
-rx(4.607960677389259) q[6];
-rz(0.6834469027180843) q[92];
-cx q[15],q[92];
-cx q[15],q[108];
-cx q[89],q[92];
-rz(0.6834469027180843) q[92];
-cx q[89],q[92];
-rz(0.6834469027180843) q[93];
-cx q[0],q[93];
-cx q[0],q[123];
-cx q[32],q[93];
-rz(0.6834469027180843) q[93];
-cx q[32],q[93];
-rx(4.607960677389259) q[93];
-rz(0.6834469027180843) q[94];
-cx q[36],q[94];
-cx q[55],q[94];
-rz(0.6834469027180843) q[94];
-cx q[55],q[94];
-rx(4.607960677389259) q[55];
-rz(0.6834469027180843) q[95];
-cx q[5],q[95];
-cx q[5],q[106];
-cx q[27],q[95];
-rz(0.6834469027180843) q[95];
-cx q[27],q[95];
-rx(4.607960677389259) q[27];
-rx(4.607960677389259) q[95];
-rz(0.6834469027180843) q[96];
-cx q[56],q[96];
-rx(4.607960677389259) q[56];
-cx q[92],q[96];
-rz(0.6834469027180843) q[96];
-cx q[92],q[96];
-rx(4.607960677389259) q[96];
-rz(0.6834469027180843) q[97];
-cx q[1],q[97];
-cx q[1],q[113];
-cx q[7],q[97];
-rz(0.6834469027180843) q[97];
-cx q[7],q[97];
-cx q[7],q[104];
-rz(0.6834469027180843) q[98];
-cx q[10],q[98];
-rx(4.607960677389259) q[10];
-cx q[21],q[98];
-rz(0.6834469027180843) q[98];
-cx q[21],q[98];
-rx(4.607960677389259) q[98];
-rz(0.6834469027180843) q[99];
-cx q[4],q[99];
-cx q[41],q[99];
-rz(0.6834469027180843) q[99];
-cx q[41],q[99];
-rx(4.607960677389259) q[41];
-rx(4.607960677389259) q[99];
-rz(0.6834469027180843) q[100];
-cx q[3],q[100];
-cx q[3],q[102];
-cx q[25],q[100];
-rz(0.6834469027180843) q[100];
-cx q[25],q[100];
-rx(4.607960677389259) q[25];
-rx(4.607960677389259) q[100];
-rz(0.6834469027180843) q[101];
-cx q[16],q[101];
-cx q[16],q[103];
-cx q[50],q[101];
-rz(0.6834469027180843) q[101];
-cx q[50],q[101];
-cx q[50],q[129];
-rx(4.607960677389259) q[101];
-rz(0.6834469027180843) q[102];
-cx q[3],q[102];
-cx q[3],q[107];
-cx q[4],q[102];
-rz(0.6834469027180843) q[102];
-cx q[4],q[102];
-cx q[4],q[127];
-rx(4.607960677389259) q[102];
-rz(0.6834469027180843) q[103];
-cx q[16],q[103];
-rx(4.607960677389259) q[16];
-cx q[57],q[103];
-rz(0.6834469027180843) q[103];
-cx q[57],q[103];
-rx(4.607960677389259) q[57];
-rx(4.607960677389259) q[103];
-rz(0.6834469027180843) q[104];
-cx q[7],q[104];
-cx q[7],q[133];
-cx q[13],q[104];
-rz(0.6834469027180843) q[104];
-cx q[13],q[104];
-cx q[104],q[114];
-rz(0.6834469027180843) q[105];
-cx q[26],q[105];
-cx q[26],q[117];
-cx q[28],q[105];
-rz(0.6834469027180843) q[105];
-cx q[28],q[105];
-cx q[28],q[116];
-rx(4.607960677389259) q[105];
-rz(0.6834469027180843) q[106];
-cx q[5],q[106];
-cx q[5],q[109];
-cx q[36],q[106];
-rz(0.6834469027180843) q[106];
-cx q[36],q[106];
-rx(4.607960677389259) q[106];
-rz(0.6834469027180843) q[107];
-cx q[3],q[107];
-cx q[3],q[110];
-cx q[31],q[107];
-rz(0.6834469027180843) q[107];
-cx q[31],q[107];
-rx(4.607960677389259) q[107];
-rz(0.6834469027180843) q[108];
-cx q[15],q[108];
-cx q[15],q[115];
-cx q[31],q[108];
-rz(0.6834469027180843) q[108];
-cx q[31],q[108];
-rx(4.607960677389259) q[31];
-rx(4.607960677389259) q[108];
-rz(0.6834469027180843) q[109];
-cx q[5],q[109];
-cx q[39],q[109];
-rz(0.6834469027180843) q[109];
-cx q[39],q[109];
-rx(4.607960677389259) q[39];
-rz(0.6834469027180843) q[110];
-cx q[3],q[110];
-cx q[3],q[111];
-cx q[24],q[110];
-rz(0.6834469027180843) q[110];
-cx q[24],q[110];
-cx q[24],q[137];
-rz(0.6834469027180843) q[111];
-cx q[3],q[111];
-cx q[21],q[111];
-rz(0.6834469027180843) q[111];
-cx q[21],q[111];
-cx q[21],q[112];
-rx(4.607960677389259) q[111];
-rz(0.6834469027180843) q[112];
-cx q[21],q[112];
-rx(4.607960677389259) q[21];
-cx q[36],q[112];
-rz(0.6834469027180843) q[112];
-cx q[36],q[112];
-rx(4.607960677389259) q[36];
-rx(4.607960677389259) q[112];
-rz(0.6834469027180843) q[113];
-cx q[1],q[113];
-rx(4.607960677389259) q[1];
-cx q[3],q[113];
-rz(0.6834469027180843) q[113];
-cx q[3],q[113];
-cx q[3],q[125];
-rx(4.607960677389259) q[113];
-rz(0.6834469027180843) q[114];
-cx q[104],q[114];
-cx q[110],q[114];
-rz(0.6834469027180843) q[114];
-cx q[110],q[114];
-rx(4.607960677389259) q[110];
-rx(4.607960677389259) q[114];
-rz(0.6834469027180843) q[115];
-cx q[15],q[115];
-cx q[92],q[115];
-rz(0.6834469027180843) q[115];
-cx q[92],q[115];
-rx(4.607960677389259) q[115];
-rz(0.6834469027180843) q[116];
-cx q[28],q[116];
-rx(4.607960677389259) q[28];
-cx q[42],q[116];
-rz(0.6834469027180843) q[116];
-cx q[42],q[116];
-rx(4.607960677389259) q[42];
-rx(4.607960677389259) q[116];
-rz(0.6834469027180843) q[117];
-cx q[26],q[117];
-rx(4.607960677389259) q[26];
-cx q[32],q[117];
-rz(0.6834469027180843) q[117];
-cx q[32],q[117];
-cx q[32],q[131];
-rx(4.607960677389259) q[117];
-cx q[118],q[147];
-rz(0.6834469027180843) q[119];
-cx q[40],q[119];
-rx(4.607960677389259) q[40];
-cx q[69],q[119];
-rz(0.6834469027180843) q[119];
-cx q[69],q[119];
-rx(4.607960677389259) q[69];
-rz(0.6834469027180843) q[120];
-cx q[46],q[120];
-rx(4.607960677389259) q[46];
-cx q[94],q[120];
-rz(0.6834469027180843) q[120];
-cx q[94],q[120];
-rx(4.607960677389259) q[94];
-rx(4.607960677389259) q[120];
-rz(0.6834469027180843) q[121];
-cx q[20],q[121];
-rx(4.607960677389259) q[20];
-cx q[104],q[121];
-rz(0.6834469027180843) q[121];
-cx q[104],q[121];
-rx(4.607960677389259) q[104];
-rz(0.6834469027180843) q[122];
-cx q[63],q[122];
-rx(4.607960677389259) q[63];
-cx q[81],q[122];
-rz(0.6834469027180843) q[122];
-cx q[81],q[122];
-rx(4.607960677389259) q[122];
-rz(0.6834469027180843) q[123];
-cx q[0],q[123];
-cx q[0],q[126];
-cx q[52],q[123];
-rz(0.6834469027180843) q[123];
-cx q[52],q[123];
-rx(4.607960677389259) q[52];
-rz(0.6834469027180843) q[124];
-cx q[53],q[124];
-rx(4.607960677389259) q[53];
-cx q[81],q[124];
-rz(0.6834469027180843) q[124];
-cx q[81],q[124];
-rx(4.607960677389259) q[81];
-rx(4.607960677389259) q[124];
-rz(0.6834469027180843) q[125];
-cx q[3],q[125];
-cx q[3],q[132];
-cx q[109],q[125];
-rz(0.6834469027180843) q[125];
-cx q[109],q[125];
-rx(4.607960677389259) q[125];
-rz(0.6834469027180843) q[126];
-cx q[0],q[126];
-cx q[0],q[135];
-cx q[12],q[126];
-rz(0.6834469027180843) q[126];
-cx q[12],q[126];
-cx q[12],q[141];
-rx(4.607960677389259) q[126];
-rz(0.6834469027180843) q[127];
-cx q[4],q[127];
-cx q[62],q[127];
-rz(0.6834469027180843) q[127];
-cx q[62],q[127];
-cx q[62],q[128];
-rx(4.607960677389259) q[127];
-rz(0.6834469027180843) q[128];
-cx q[62],q[128];
-rx(4.607960677389259) q[62];
-cx q[109],q[128];
-rz(0.6834469027180843) q[128];
-cx q[109],q[128];
-rx(4.607960677389259) q[128];
-rz(0.6834469027180843) q[129];
-cx q[50],q[129];
-cx q[91],q[129];
-rz(0.6834469027180843) q[129];
-cx q[91],q[129];
-rx(4.607960677389259) q[91];
-rx(4.607960677389259) q[129];
-rz(0.6834469027180843) q[130];
-cx q[35],q[130];
-rx(4.607960677389259) q[35];
-cx q[109],q[130];
-rz(0.6834469027180843) q[130];
-cx q[109],q[130];
-rx(4.607960677389259) q[109];
-rx(4.607960677389259) q[130];
-rz(0.6834469027180843) q[131];
-cx q[32],q[131];
-cx q[123],q[131];
-rz(0.6834469027180843) q[131];
-cx q[123],q[131];
-rx(4.607960677389259) q[123];
-rx(4.607960677389259) q[131];
-rz(0.6834469027180843) q[132];
-cx q[3],q[132];
-cx q[3],q[134];
-cx q[37],q[132];
-rz(0.6834469027180843) q[132];
-cx q[37],q[132];
-rx(4.607960677389259) q[37];
-rx(4.607960677389259) q[132];
-rz(0.6834469027180843) q[133];
-cx q[7],q[133];
-rx(4.607960677389259) q[7];
-cx q[89],q[133];
-rz(0.6834469027180843) q[133];
-cx q[89],q[133];
-rx(4.607960677389259) q[89];
-rz(0.6834469027180843) q[134];
-cx q[3],q[134];
-cx q[3],q[136];
-cx q[47],q[134];
-rz(0.6834469027180843) q[134];
-cx q[47],q[134];
-rx(4.607960677389259) q[47];
-rx(4.607960677389259) q[134];
-rz(0.6834469027180843) q[135];
-cx q[0],q[135];
-cx q[0],q[140];
-cx q[13],q[135];
-rz(0.6834469027180843) q[135];
-cx q[13],q[135];
-rx(4.607960677389259) q[13];
-rx(4.607960677389259) q[135];
-rz(0.6834469027180843) q[136];
-cx q[3],q[136];
-cx q[3],q[145];
-cx q[92],q[136];
-rz(0.6834469027180843) q[136];
-cx q[92],q[136];
-rx(4.607960677389259) q[92];
-rx(4.607960677389259) q[136];
-rz(0.6834469027180843) q[137];
-cx q[24],q[137];
-cx q[133],q[137];
-rz(0.6834469027180843) q[137];
-cx q[133],q[137];
-rx(4.607960677389259) q[137];
-rz(0.6834469027180843) q[138];
-cx q[60],q[138];
-rx(4.607960677389259) q[60];
-cx q[119],q[138];
-rz(0.6834469027180843) q[138];
-cx q[119],q[138];
-rx(4.607960677389259) q[119];
-rx(4.607960677389259) q[138];
-rz(0.6834469027180843) q[140];
-cx q[0],q[140];
-cx q[0],q[146];
-cx q[32],q[140];
-rz(0.6834469027180843) q[140];
-cx q[32],q[140];
-rx(4.607960677389259) q[32];
-rx(4.607960677389259) q[140];
-rz(0.6834469027180843) q[141];
-cx q[12],q[141];
-cx q[12],q[143];
-cx q[121],q[141];
-rz(0.6834469027180843) q[141];
-cx q[121],q[141];
-rx(4.607960677389259) q[121];
-rx(4.607960677389259) q[141];
-rz(0.6834469027180843) q[143];
-cx q[12],q[143];
-rx(4.607960677389259) q[12];
-cx q[50],q[143];
-rz(0.6834469027180843) q[143];
-cx q[50],q[143];
-rx(4.607960677389259) q[50];
-rx(4.607960677389259) q[143];
-rz(0.6834469027180843) q[144];
-cx q[9],q[144];
-rx(4.607960677389259) q[9];
-cx q[59],q[144];
-rz(0.6834469027180843) q[144];
-cx q[59],q[144];
-rx(4.607960677389259) q[59];
-rx(4.607960677389259) q[144];
-rz(0.6834469027180843) q[145];
-cx q[3],q[145];
-cx q[97],q[145];
-rz(0.6834469027180843) q[145];
-cx q[97],q[145];
-rx(4.607960677389259) q[97];
-rx(4.607960677389259) q[145];
-rz(0.6834469027180843) q[146];
-cx q[0],q[146];
-rx(4.607960677389259) q[0];
-cx q[4],q[146];
-rz(0.6834469027180843) q[146];
-cx q[4],q[146];
-rx(4.607960677389259) q[4];
-rx(4.607960677389259) q[146];
-rz(4.072020350255479) q[147];
-cx q[118],q[147];
-rx(4.052865025049401) q[118];
-cx q[5],q[118];
-rz(0.6834469027180843) q[118];
-cx q[5],q[118];
-cx q[5],q[139];
-cx q[15],q[118];
-rz(0.6834469027180843) q[118];
-cx q[15],q[118];
-rx(4.607960677389259) q[15];
-rz(0.6834469027180843) q[139];
-cx q[5],q[139];
-cx q[5],q[142];
-cx q[133],q[139];
-rz(0.6834469027180843) q[139];
-cx q[133],q[139];
-rx(4.607960677389259) q[133];
-rx(4.607960677389259) q[139];
-rz(0.6834469027180843) q[142];
-cx q[5],q[142];
-rx(4.607960677389259) q[5];
-cx q[24],q[142];
-rz(0.6834469027180843) q[142];
-cx q[24],q[142];
-rx(4.607960677389259) q[24];
-rx(4.607960677389259) q[142];
-rx(4.052865025049401) q[147];
-cx q[3],q[147];
-rz(0.6834469027180843) q[147];
-cx q[3],q[147];
-rx(4.607960677389259) q[3];
-cx q[118],q[147];
-rz(0.6834469027180843) q[147];
-cx q[118],q[147];
-rx(4.607960677389259) q[118];
-rx(4.607960677389259) q[147];
\ No newline at end of file
@@ -1,3394 +0,0 @@
-OPENQASM 2.0;
-include "qelib1.inc";
-qreg q[149];
-ry(pi/2) q[0];
-rx(pi) q[0];
-ry(pi/2) q[1];
-rx(pi) q[1];
-cx q[0],q[1];
-rz(5.676655381599885) q[1];
-cx q[0],q[1];
-ry(pi/2) q[2];
-rx(pi) q[2];
-cx q[0],q[2];
-rz(5.676655381599885) q[2];
-cx q[0],q[2];
-ry(pi/2) q[3];
-rx(pi) q[3];
-cx q[0],q[3];
-rz(5.676655381599885) q[3];
-cx q[0],q[3];
-cx q[1],q[3];
-rz(5.676655381599885) q[3];
-cx q[1],q[3];
-ry(pi/2) q[4];
-rx(pi) q[4];
-cx q[1],q[4];
-rz(5.676655381599885) q[4];
-cx q[1],q[4];
-cx q[3],q[4];
-rz(5.676655381599885) q[4];
-cx q[3],q[4];
-ry(pi/2) q[5];
-rx(pi) q[5];
-cx q[1],q[5];
-rz(5.676655381599885) q[5];
-cx q[1],q[5];
-cx q[3],q[5];
-rz(5.676655381599885) q[5];
-cx q[3],q[5];
-ry(pi/2) q[6];
-rx(pi) q[6];
-cx q[4],q[6];
-rz(5.676655381599885) q[6];
-cx q[4],q[6];
-cx q[5],q[6];
-rz(5.676655381599885) q[6];
-cx q[5],q[6];
-ry(pi/2) q[7];
-rx(pi) q[7];
-cx q[3],q[7];
-rz(5.676655381599885) q[7];
-cx q[3],q[7];
-cx q[4],q[7];
-rz(5.676655381599885) q[7];
-cx q[4],q[7];
-ry(pi/2) q[8];
-rx(pi) q[8];
-cx q[3],q[8];
-rz(5.676655381599885) q[8];
-cx q[3],q[8];
-cx q[5],q[8];
-rz(5.676655381599885) q[8];
-cx q[5],q[8];
-ry(pi/2) q[9];
-rx(pi) q[9];
-cx q[1],q[9];
-rz(5.676655381599885) q[9];
-cx q[1],q[9];
-cx q[3],q[9];
-rz(5.676655381599885) q[9];
-cx q[3],q[9];
-ry(pi/2) q[10];
-rx(pi) q[10];
-cx q[4],q[10];
-rz(5.676655381599885) q[10];
-cx q[4],q[10];
-cx q[6],q[10];
-rz(5.676655381599885) q[10];
-cx q[6],q[10];
-ry(pi/2) q[11];
-rx(pi) q[11];
-cx q[5],q[11];
-rz(5.676655381599885) q[11];
-cx q[5],q[11];
-cx q[6],q[11];
-rz(5.676655381599885) q[11];
-cx q[6],q[11];
-rx(12.231627273752405) q[11];
-ry(pi/2) q[12];
-rx(pi) q[12];
-cx q[3],q[12];
-rz(5.676655381599885) q[12];
-cx q[3],q[12];
-cx q[5],q[12];
-rz(5.676655381599885) q[12];
-cx q[5],q[12];
-ry(pi/2) q[13];
-rx(pi) q[13];
-cx q[4],q[13];
-rz(5.676655381599885) q[13];
-cx q[4],q[13];
-cx q[5],q[13];
-rz(5.676655381599885) q[13];
-cx q[5],q[13];
-ry(pi/2) q[14];
-rx(pi) q[14];
-cx q[3],q[14];
-rz(5.676655381599885) q[14];
-cx q[3],q[14];
-cx q[4],q[14];
-rz(5.676655381599885) q[14];
-cx q[4],q[14];
-rx(12.231627273752405) q[14];
-ry(pi/2) q[15];
-rx(pi) q[15];
-cx q[0],q[15];
-rz(5.676655381599885) q[15];
-cx q[0],q[15];
-cx q[3],q[15];
-rz(5.676655381599885) q[15];
-cx q[3],q[15];
-ry(pi/2) q[16];
-rx(pi) q[16];
-cx q[0],q[16];
-rz(5.676655381599885) q[16];
-cx q[0],q[16];
-cx q[3],q[16];
-rz(5.676655381599885) q[16];
-cx q[3],q[16];
-ry(pi/2) q[17];
-rx(pi) q[17];
-cx q[1],q[17];
-rz(5.676655381599885) q[17];
-cx q[1],q[17];
-cx q[3],q[17];
-rz(5.676655381599885) q[17];
-cx q[3],q[17];
-ry(pi/2) q[18];
-rx(pi) q[18];
-cx q[3],q[18];
-rz(5.676655381599885) q[18];
-cx q[3],q[18];
-cx q[4],q[18];
-rz(5.676655381599885) q[18];
-cx q[4],q[18];
-ry(pi/2) q[19];
-rx(pi) q[19];
-cx q[3],q[19];
-rz(5.676655381599885) q[19];
-cx q[3],q[19];
-cx q[7],q[19];
-rz(5.676655381599885) q[19];
-cx q[7],q[19];
-ry(pi/2) q[20];
-rx(pi) q[20];
-cx q[0],q[20];
-rz(5.676655381599885) q[20];
-cx q[0],q[20];
-cx q[15],q[20];
-rz(5.676655381599885) q[20];
-cx q[15],q[20];
-ry(pi/2) q[21];
-rx(pi) q[21];
-cx q[4],q[21];
-rz(5.676655381599885) q[21];
-cx q[4],q[21];
-cx q[15],q[21];
-rz(5.676655381599885) q[21];
-cx q[15],q[21];
-ry(pi/2) q[22];
-rx(pi) q[22];
-cx q[3],q[22];
-rz(5.676655381599885) q[22];
-cx q[3],q[22];
-cx q[9],q[22];
-rz(5.676655381599885) q[22];
-cx q[9],q[22];
-rx(12.231627273752405) q[22];
-ry(pi/2) q[23];
-rx(pi) q[23];
-cx q[3],q[23];
-rz(5.676655381599885) q[23];
-cx q[3],q[23];
-cx q[17],q[23];
-rz(5.676655381599885) q[23];
-cx q[17],q[23];
-ry(pi/2) q[24];
-rx(pi) q[24];
-cx q[3],q[24];
-rz(5.676655381599885) q[24];
-cx q[3],q[24];
-cx q[5],q[24];
-rz(5.676655381599885) q[24];
-cx q[5],q[24];
-ry(pi/2) q[25];
-rx(pi) q[25];
-cx q[3],q[25];
-rz(5.676655381599885) q[25];
-cx q[3],q[25];
-cx q[12],q[25];
-rz(5.676655381599885) q[25];
-cx q[12],q[25];
-ry(pi/2) q[26];
-rx(pi) q[26];
-cx q[3],q[26];
-rz(5.676655381599885) q[26];
-cx q[3],q[26];
-cx q[21],q[26];
-rz(5.676655381599885) q[26];
-cx q[21],q[26];
-ry(pi/2) q[27];
-rx(pi) q[27];
-cx q[4],q[27];
-rz(5.676655381599885) q[27];
-cx q[4],q[27];
-cx q[6],q[27];
-rz(5.676655381599885) q[27];
-cx q[6],q[27];
-ry(pi/2) q[28];
-rx(pi) q[28];
-cx q[1],q[28];
-rz(5.676655381599885) q[28];
-cx q[1],q[28];
-cx q[3],q[28];
-rz(5.676655381599885) q[28];
-cx q[3],q[28];
-ry(pi/2) q[29];
-rx(pi) q[29];
-cx q[1],q[29];
-rz(5.676655381599885) q[29];
-cx q[1],q[29];
-cx q[3],q[29];
-rz(5.676655381599885) q[29];
-cx q[3],q[29];
-rx(12.231627273752405) q[29];
-ry(pi/2) q[30];
-rx(pi) q[30];
-cx q[3],q[30];
-rz(5.676655381599885) q[30];
-cx q[3],q[30];
-cx q[18],q[30];
-rz(5.676655381599885) q[30];
-cx q[18],q[30];
-rx(12.231627273752405) q[18];
-ry(pi/2) q[31];
-rx(pi) q[31];
-cx q[12],q[31];
-rz(5.676655381599885) q[31];
-cx q[12],q[31];
-cx q[26],q[31];
-rz(5.676655381599885) q[31];
-cx q[26],q[31];
-ry(pi/2) q[32];
-rx(pi) q[32];
-cx q[0],q[32];
-rz(5.676655381599885) q[32];
-cx q[0],q[32];
-cx q[21],q[32];
-rz(5.676655381599885) q[32];
-cx q[21],q[32];
-ry(pi/2) q[33];
-rx(pi) q[33];
-cx q[5],q[33];
-rz(5.676655381599885) q[33];
-cx q[5],q[33];
-cx q[30],q[33];
-rz(5.676655381599885) q[33];
-cx q[30],q[33];
-rx(12.231627273752405) q[33];
-ry(pi/2) q[34];
-rx(pi) q[34];
-cx q[3],q[34];
-rz(5.676655381599885) q[34];
-cx q[3],q[34];
-cx q[12],q[34];
-rz(5.676655381599885) q[34];
-cx q[12],q[34];
-ry(pi/2) q[35];
-rx(pi) q[35];
-cx q[3],q[35];
-rz(5.676655381599885) q[35];
-cx q[3],q[35];
-cx q[32],q[35];
-rz(5.676655381599885) q[35];
-cx q[32],q[35];
-ry(pi/2) q[36];
-rx(pi) q[36];
-cx q[15],q[36];
-rz(5.676655381599885) q[36];
-cx q[15],q[36];
-cx q[20],q[36];
-rz(5.676655381599885) q[36];
-cx q[20],q[36];
-ry(pi/2) q[37];
-rx(pi) q[37];
-cx q[10],q[37];
-rz(5.676655381599885) q[37];
-cx q[10],q[37];
-cx q[34],q[37];
-rz(5.676655381599885) q[37];
-cx q[34],q[37];
-rx(12.231627273752405) q[34];
-ry(pi/2) q[38];
-rx(pi) q[38];
-cx q[19],q[38];
-rz(5.676655381599885) q[38];
-cx q[19],q[38];
-rx(12.231627273752405) q[19];
-cx q[21],q[38];
-rz(5.676655381599885) q[38];
-cx q[21],q[38];
-ry(pi/2) q[39];
-rx(pi) q[39];
-cx q[3],q[39];
-rz(5.676655381599885) q[39];
-cx q[3],q[39];
-cx q[13],q[39];
-rz(5.676655381599885) q[39];
-cx q[13],q[39];
-ry(pi/2) q[40];
-rx(pi) q[40];
-cx q[3],q[40];
-rz(5.676655381599885) q[40];
-cx q[3],q[40];
-cx q[23],q[40];
-rz(5.676655381599885) q[40];
-cx q[23],q[40];
-ry(pi/2) q[41];
-rx(pi) q[41];
-cx q[10],q[41];
-rz(5.676655381599885) q[41];
-cx q[10],q[41];
-cx q[27],q[41];
-rz(5.676655381599885) q[41];
-cx q[27],q[41];
-ry(pi/2) q[42];
-rx(pi) q[42];
-cx q[0],q[42];
-rz(5.676655381599885) q[42];
-cx q[0],q[42];
-cx q[3],q[42];
-rz(5.676655381599885) q[42];
-cx q[3],q[42];
-ry(pi/2) q[43];
-rx(pi) q[43];
-cx q[3],q[43];
-rz(5.676655381599885) q[43];
-cx q[3],q[43];
-cx q[20],q[43];
-rz(5.676655381599885) q[43];
-cx q[20],q[43];
-rx(12.231627273752405) q[43];
-ry(pi/2) q[44];
-rx(pi) q[44];
-cx q[3],q[44];
-rz(5.676655381599885) q[44];
-cx q[3],q[44];
-cx q[12],q[44];
-rz(5.676655381599885) q[44];
-cx q[12],q[44];
-ry(pi/2) q[45];
-rx(pi) q[45];
-cx q[1],q[45];
-rz(5.676655381599885) q[45];
-cx q[1],q[45];
-cx q[16],q[45];
-rz(5.676655381599885) q[45];
-cx q[16],q[45];
-ry(pi/2) q[46];
-rx(pi) q[46];
-cx q[5],q[46];
-rz(5.676655381599885) q[46];
-cx q[5],q[46];
-cx q[38],q[46];
-rz(5.676655381599885) q[46];
-cx q[38],q[46];
-rx(12.231627273752405) q[38];
-ry(pi/2) q[47];
-rx(pi) q[47];
-cx q[4],q[47];
-rz(5.676655381599885) q[47];
-cx q[4],q[47];
-cx q[17],q[47];
-rz(5.676655381599885) q[47];
-cx q[17],q[47];
-ry(pi/2) q[48];
-rx(pi) q[48];
-cx q[0],q[48];
-rz(5.676655381599885) q[48];
-cx q[0],q[48];
-cx q[30],q[48];
-rz(5.676655381599885) q[48];
-cx q[30],q[48];
-rx(12.231627273752405) q[48];
-ry(pi/2) q[49];
-rx(pi) q[49];
-cx q[3],q[49];
-rz(5.676655381599885) q[49];
-cx q[3],q[49];
-cx q[4],q[49];
-rz(5.676655381599885) q[49];
-cx q[4],q[49];
-rx(12.231627273752405) q[49];
-ry(pi/2) q[50];
-rx(pi) q[50];
-cx q[3],q[50];
-rz(5.676655381599885) q[50];
-cx q[3],q[50];
-cx q[12],q[50];
-rz(5.676655381599885) q[50];
-cx q[12],q[50];
-ry(pi/2) q[51];
-rx(pi) q[51];
-cx q[0],q[51];
-rz(5.676655381599885) q[51];
-cx q[0],q[51];
-cx q[28],q[51];
-rz(5.676655381599885) q[51];
-cx q[28],q[51];
-rx(12.231627273752405) q[51];
-ry(pi/2) q[52];
-rx(pi) q[52];
-cx q[3],q[52];
-rz(5.676655381599885) q[52];
-cx q[3],q[52];
-cx q[10],q[52];
-rz(5.676655381599885) q[52];
-cx q[10],q[52];
-ry(pi/2) q[53];
-rx(pi) q[53];
-cx q[17],q[53];
-rz(5.676655381599885) q[53];
-cx q[17],q[53];
-cx q[21],q[53];
-rz(5.676655381599885) q[53];
-cx q[21],q[53];
-ry(pi/2) q[54];
-rx(pi) q[54];
-cx q[24],q[54];
-rz(5.676655381599885) q[54];
-cx q[24],q[54];
-cx q[28],q[54];
-rz(5.676655381599885) q[54];
-cx q[28],q[54];
-rx(12.231627273752405) q[54];
-ry(pi/2) q[55];
-rx(pi) q[55];
-cx q[9],q[55];
-rz(5.676655381599885) q[55];
-cx q[9],q[55];
-cx q[15],q[55];
-rz(5.676655381599885) q[55];
-cx q[15],q[55];
-ry(pi/2) q[56];
-rx(pi) q[56];
-cx q[13],q[56];
-rz(5.676655381599885) q[56];
-cx q[13],q[56];
-cx q[45],q[56];
-rz(5.676655381599885) q[56];
-cx q[45],q[56];
-rx(12.231627273752405) q[45];
-ry(pi/2) q[57];
-rx(pi) q[57];
-cx q[1],q[57];
-rz(5.676655381599885) q[57];
-cx q[1],q[57];
-cx q[3],q[57];
-rz(5.676655381599885) q[57];
-cx q[3],q[57];
-ry(pi/2) q[58];
-rx(pi) q[58];
-cx q[24],q[58];
-rz(5.676655381599885) q[58];
-cx q[24],q[58];
-cx q[28],q[58];
-rz(5.676655381599885) q[58];
-cx q[28],q[58];
-rx(12.231627273752405) q[58];
-ry(pi/2) q[59];
-rx(pi) q[59];
-cx q[16],q[59];
-rz(5.676655381599885) q[59];
-cx q[16],q[59];
-cx q[32],q[59];
-rz(5.676655381599885) q[59];
-cx q[32],q[59];
-ry(pi/2) q[60];
-rx(pi) q[60];
-cx q[1],q[60];
-rz(5.676655381599885) q[60];
-cx q[1],q[60];
-cx q[7],q[60];
-rz(5.676655381599885) q[60];
-cx q[7],q[60];
-ry(pi/2) q[61];
-rx(pi) q[61];
-cx q[4],q[61];
-rz(5.676655381599885) q[61];
-cx q[4],q[61];
-cx q[7],q[61];
-rz(5.676655381599885) q[61];
-cx q[7],q[61];
-rx(12.231627273752405) q[61];
-ry(pi/2) q[62];
-rx(pi) q[62];
-cx q[0],q[62];
-rz(5.676655381599885) q[62];
-cx q[0],q[62];
-cx q[17],q[62];
-rz(5.676655381599885) q[62];
-cx q[17],q[62];
-ry(pi/2) q[63];
-rx(pi) q[63];
-cx q[12],q[63];
-rz(5.676655381599885) q[63];
-cx q[12],q[63];
-cx q[17],q[63];
-rz(5.676655381599885) q[63];
-cx q[17],q[63];
-ry(pi/2) q[64];
-rx(pi) q[64];
-cx q[0],q[64];
-rz(5.676655381599885) q[64];
-cx q[0],q[64];
-cx q[10],q[64];
-rz(5.676655381599885) q[64];
-cx q[10],q[64];
-rx(12.231627273752405) q[64];
-ry(pi/2) q[65];
-rx(pi) q[65];
-cx q[5],q[65];
-rz(5.676655381599885) q[65];
-cx q[5],q[65];
-cx q[23],q[65];
-rz(5.676655381599885) q[65];
-cx q[23],q[65];
-rx(12.231627273752405) q[23];
-rx(12.231627273752405) q[65];
-ry(pi/2) q[66];
-rx(pi) q[66];
-cx q[17],q[66];
-rz(5.676655381599885) q[66];
-cx q[17],q[66];
-rx(12.231627273752405) q[17];
-cx q[47],q[66];
-rz(5.676655381599885) q[66];
-cx q[47],q[66];
-rx(12.231627273752405) q[66];
-ry(pi/2) q[67];
-rx(pi) q[67];
-cx q[41],q[67];
-rz(5.676655381599885) q[67];
-cx q[41],q[67];
-cx q[56],q[67];
-rz(5.676655381599885) q[67];
-cx q[56],q[67];
-rx(12.231627273752405) q[67];
-ry(pi/2) q[68];
-rx(pi) q[68];
-cx q[13],q[68];
-rz(5.676655381599885) q[68];
-cx q[13],q[68];
-cx q[32],q[68];
-rz(5.676655381599885) q[68];
-cx q[32],q[68];
-ry(pi/2) q[69];
-rx(pi) q[69];
-cx q[6],q[69];
-rz(5.676655381599885) q[69];
-cx q[6],q[69];
-cx q[59],q[69];
-rz(5.676655381599885) q[69];
-cx q[59],q[69];
-ry(pi/2) q[70];
-rx(pi) q[70];
-cx q[3],q[70];
-rz(5.676655381599885) q[70];
-cx q[3],q[70];
-cx q[15],q[70];
-rz(5.676655381599885) q[70];
-cx q[15],q[70];
-ry(pi/2) q[71];
-rx(pi) q[71];
-cx q[3],q[71];
-rz(5.676655381599885) q[71];
-cx q[3],q[71];
-cx q[53],q[71];
-rz(5.676655381599885) q[71];
-cx q[53],q[71];
-rx(12.231627273752405) q[71];
-ry(pi/2) q[72];
-rx(pi) q[72];
-cx q[27],q[72];
-rz(5.676655381599885) q[72];
-cx q[27],q[72];
-cx q[44],q[72];
-rz(5.676655381599885) q[72];
-cx q[44],q[72];
-rx(12.231627273752405) q[44];
-rx(12.231627273752405) q[72];
-ry(pi/2) q[73];
-rx(pi) q[73];
-cx q[16],q[73];
-rz(5.676655381599885) q[73];
-cx q[16],q[73];
-cx q[59],q[73];
-rz(5.676655381599885) q[73];
-cx q[59],q[73];
-ry(pi/2) q[74];
-rx(pi) q[74];
-cx q[56],q[74];
-rz(5.676655381599885) q[74];
-cx q[56],q[74];
-cx q[63],q[74];
-rz(5.676655381599885) q[74];
-cx q[63],q[74];
-rx(12.231627273752405) q[74];
-ry(pi/2) q[75];
-rx(pi) q[75];
-cx q[0],q[75];
-rz(5.676655381599885) q[75];
-cx q[0],q[75];
-cx q[21],q[75];
-rz(5.676655381599885) q[75];
-cx q[21],q[75];
-rx(12.231627273752405) q[75];
-ry(pi/2) q[76];
-rx(pi) q[76];
-cx q[5],q[76];
-rz(5.676655381599885) q[76];
-cx q[5],q[76];
-cx q[6],q[76];
-rz(5.676655381599885) q[76];
-cx q[6],q[76];
-rx(12.231627273752405) q[76];
-ry(pi/2) q[77];
-rx(pi) q[77];
-cx q[3],q[77];
-rz(5.676655381599885) q[77];
-cx q[3],q[77];
-cx q[30],q[77];
-rz(5.676655381599885) q[77];
-cx q[30],q[77];
-rx(12.231627273752405) q[30];
-ry(pi/2) q[78];
-rx(pi) q[78];
-cx q[42],q[78];
-rz(5.676655381599885) q[78];
-cx q[42],q[78];
-cx q[60],q[78];
-rz(5.676655381599885) q[78];
-cx q[60],q[78];
-rx(12.231627273752405) q[78];
-ry(pi/2) q[79];
-rx(pi) q[79];
-cx q[6],q[79];
-rz(5.676655381599885) q[79];
-cx q[6],q[79];
-cx q[50],q[79];
-rz(5.676655381599885) q[79];
-cx q[50],q[79];
-rx(12.231627273752405) q[79];
-ry(pi/2) q[80];
-rx(pi) q[80];
-cx q[9],q[80];
-rz(5.676655381599885) q[80];
-cx q[9],q[80];
-cx q[15],q[80];
-rz(5.676655381599885) q[80];
-cx q[15],q[80];
-rx(12.231627273752405) q[80];
-ry(pi/2) q[81];
-rx(pi) q[81];
-cx q[21],q[81];
-rz(5.676655381599885) q[81];
-cx q[21],q[81];
-cx q[77],q[81];
-rz(5.676655381599885) q[81];
-cx q[77],q[81];
-rx(12.231627273752405) q[77];
-ry(pi/2) q[82];
-rx(pi) q[82];
-cx q[0],q[82];
-rz(5.676655381599885) q[82];
-cx q[0],q[82];
-cx q[56],q[82];
-rz(5.676655381599885) q[82];
-cx q[56],q[82];
-rx(12.231627273752405) q[82];
-ry(pi/2) q[83];
-rx(pi) q[83];
-cx q[8],q[83];
-rz(5.676655381599885) q[83];
-cx q[8],q[83];
-rx(12.231627273752405) q[8];
-cx q[68],q[83];
-rz(5.676655381599885) q[83];
-cx q[68],q[83];
-rx(12.231627273752405) q[68];
-rx(12.231627273752405) q[83];
-ry(pi/2) q[84];
-rx(pi) q[84];
-cx q[70],q[84];
-rz(5.676655381599885) q[84];
-cx q[70],q[84];
-rx(12.231627273752405) q[70];
-cx q[73],q[84];
-rz(5.676655381599885) q[84];
-cx q[73],q[84];
-rx(12.231627273752405) q[73];
-rx(12.231627273752405) q[84];
-ry(pi/2) q[85];
-rx(pi) q[85];
-cx q[37],q[85];
-rz(5.676655381599885) q[85];
-cx q[37],q[85];
-cx q[59],q[85];
-rz(5.676655381599885) q[85];
-cx q[59],q[85];
-rx(12.231627273752405) q[85];
-ry(pi/2) q[86];
-rx(pi) q[86];
-cx q[24],q[86];
-rz(5.676655381599885) q[86];
-cx q[24],q[86];
-cx q[53],q[86];
-rz(5.676655381599885) q[86];
-cx q[53],q[86];
-rx(12.231627273752405) q[86];
-ry(pi/2) q[87];
-rx(pi) q[87];
-cx q[28],q[87];
-rz(5.676655381599885) q[87];
-cx q[28],q[87];
-cx q[32],q[87];
-rz(5.676655381599885) q[87];
-cx q[32],q[87];
-rx(12.231627273752405) q[87];
-ry(pi/2) q[88];
-rx(pi) q[88];
-cx q[3],q[88];
-rz(5.676655381599885) q[88];
-cx q[3],q[88];
-cx q[60],q[88];
-rz(5.676655381599885) q[88];
-cx q[60],q[88];
-rx(12.231627273752405) q[88];
-ry(pi/2) q[89];
-rx(pi) q[89];
-cx q[2],q[89];
-rz(5.676655381599885) q[89];
-cx q[2],q[89];
-rx(12.231627273752405) q[2];
-cx q[5],q[89];
-rz(5.676655381599885) q[89];
-cx q[5],q[89];
-ry(pi/2) q[90];
-rx(pi) q[90];
-cx q[15],q[90];
-rz(5.676655381599885) q[90];
-cx q[15],q[90];
-cx q[27],q[90];
-rz(5.676655381599885) q[90];
-cx q[27],q[90];
-rx(12.231627273752405) q[90];
-ry(pi/2) q[91];
-rx(pi) q[91];
-cx q[0],q[91];
-rz(5.676655381599885) q[91];
-cx q[0],q[91];
-cx q[6],q[91];
-rz(5.676655381599885) q[91];
-cx q[6],q[91];
-rx(12.231627273752405) q[6];
-ry(pi/2) q[92];
-rx(pi) q[92];
-cx q[15],q[92];
-rz(5.676655381599885) q[92];
-cx q[15],q[92];
-cx q[89],q[92];
-rz(5.676655381599885) q[92];
-cx q[89],q[92];
-ry(pi/2) q[93];
-rx(pi) q[93];
-cx q[0],q[93];
-rz(5.676655381599885) q[93];
-cx q[0],q[93];
-cx q[32],q[93];
-rz(5.676655381599885) q[93];
-cx q[32],q[93];
-rx(12.231627273752405) q[93];
-ry(pi/2) q[94];
-rx(pi) q[94];
-cx q[36],q[94];
-rz(5.676655381599885) q[94];
-cx q[36],q[94];
-cx q[55],q[94];
-rz(5.676655381599885) q[94];
-cx q[55],q[94];
-rx(12.231627273752405) q[55];
-ry(pi/2) q[95];
-rx(pi) q[95];
-cx q[5],q[95];
-rz(5.676655381599885) q[95];
-cx q[5],q[95];
-cx q[27],q[95];
-rz(5.676655381599885) q[95];
-cx q[27],q[95];
-rx(12.231627273752405) q[27];
-rx(12.231627273752405) q[95];
-ry(pi/2) q[96];
-rx(pi) q[96];
-cx q[56],q[96];
-rz(5.676655381599885) q[96];
-cx q[56],q[96];
-rx(12.231627273752405) q[56];
-cx q[92],q[96];
-rz(5.676655381599885) q[96];
-cx q[92],q[96];
-rx(12.231627273752405) q[96];
-ry(pi/2) q[97];
-rx(pi) q[97];
-cx q[1],q[97];
-rz(5.676655381599885) q[97];
-cx q[1],q[97];
-cx q[7],q[97];
-rz(5.676655381599885) q[97];
-cx q[7],q[97];
-ry(pi/2) q[98];
-rx(pi) q[98];
-cx q[10],q[98];
-rz(5.676655381599885) q[98];
-cx q[10],q[98];
-rx(12.231627273752405) q[10];
-cx q[21],q[98];
-rz(5.676655381599885) q[98];
-cx q[21],q[98];
-rx(12.231627273752405) q[98];
-ry(pi/2) q[99];
-rx(pi) q[99];
-cx q[4],q[99];
-rz(5.676655381599885) q[99];
-cx q[4],q[99];
-cx q[41],q[99];
-rz(5.676655381599885) q[99];
-cx q[41],q[99];
-rx(12.231627273752405) q[41];
-rx(12.231627273752405) q[99];
-ry(pi/2) q[100];
-rx(pi) q[100];
-cx q[3],q[100];
-rz(5.676655381599885) q[100];
-cx q[3],q[100];
-cx q[25],q[100];
-rz(5.676655381599885) q[100];
-cx q[25],q[100];
-rx(12.231627273752405) q[25];
-rx(12.231627273752405) q[100];
-ry(pi/2) q[101];
-rx(pi) q[101];
-cx q[16],q[101];
-rz(5.676655381599885) q[101];
-cx q[16],q[101];
-cx q[50],q[101];
-rz(5.676655381599885) q[101];
-cx q[50],q[101];
-rx(12.231627273752405) q[101];
-ry(pi/2) q[102];
-rx(pi) q[102];
-cx q[3],q[102];
-rz(5.676655381599885) q[102];
-cx q[3],q[102];
-cx q[4],q[102];
-rz(5.676655381599885) q[102];
-cx q[4],q[102];
-rx(12.231627273752405) q[102];
-ry(pi/2) q[103];
-rx(pi) q[103];
-cx q[16],q[103];
-rz(5.676655381599885) q[103];
-cx q[16],q[103];
-rx(12.231627273752405) q[16];
-cx q[57],q[103];
-rz(5.676655381599885) q[103];
-cx q[57],q[103];
-rx(12.231627273752405) q[57];
-rx(12.231627273752405) q[103];
-ry(pi/2) q[104];
-rx(pi) q[104];
-cx q[7],q[104];
-rz(5.676655381599885) q[104];
-cx q[7],q[104];
-cx q[13],q[104];
-rz(5.676655381599885) q[104];
-cx q[13],q[104];
-ry(pi/2) q[105];
-rx(pi) q[105];
-cx q[26],q[105];
-rz(5.676655381599885) q[105];
-cx q[26],q[105];
-cx q[28],q[105];
-rz(5.676655381599885) q[105];
-cx q[28],q[105];
-rx(12.231627273752405) q[105];
-ry(pi/2) q[106];
-rx(pi) q[106];
-cx q[5],q[106];
-rz(5.676655381599885) q[106];
-cx q[5],q[106];
-cx q[36],q[106];
-rz(5.676655381599885) q[106];
-cx q[36],q[106];
-rx(12.231627273752405) q[106];
-ry(pi/2) q[107];
-rx(pi) q[107];
-cx q[3],q[107];
-rz(5.676655381599885) q[107];
-cx q[3],q[107];
-cx q[31],q[107];
-rz(5.676655381599885) q[107];
-cx q[31],q[107];
-rx(12.231627273752405) q[107];
-ry(pi/2) q[108];
-rx(pi) q[108];
-cx q[15],q[108];
-rz(5.676655381599885) q[108];
-cx q[15],q[108];
-cx q[31],q[108];
-rz(5.676655381599885) q[108];
-cx q[31],q[108];
-rx(12.231627273752405) q[31];
-rx(12.231627273752405) q[108];
-ry(pi/2) q[109];
-rx(pi) q[109];
-cx q[5],q[109];
-rz(5.676655381599885) q[109];
-cx q[5],q[109];
-cx q[39],q[109];
-rz(5.676655381599885) q[109];
-cx q[39],q[109];
-rx(12.231627273752405) q[39];
-ry(pi/2) q[110];
-rx(pi) q[110];
-cx q[3],q[110];
-rz(5.676655381599885) q[110];
-cx q[3],q[110];
-cx q[24],q[110];
-rz(5.676655381599885) q[110];
-cx q[24],q[110];
-ry(pi/2) q[111];
-rx(pi) q[111];
-cx q[3],q[111];
-rz(5.676655381599885) q[111];
-cx q[3],q[111];
-cx q[21],q[111];
-rz(5.676655381599885) q[111];
-cx q[21],q[111];
-rx(12.231627273752405) q[111];
-ry(pi/2) q[112];
-rx(pi) q[112];
-cx q[21],q[112];
-rz(5.676655381599885) q[112];
-cx q[21],q[112];
-rx(12.231627273752405) q[21];
-cx q[36],q[112];
-rz(5.676655381599885) q[112];
-cx q[36],q[112];
-rx(12.231627273752405) q[36];
-rx(12.231627273752405) q[112];
-ry(pi/2) q[113];
-rx(pi) q[113];
-cx q[1],q[113];
-rz(5.676655381599885) q[113];
-cx q[1],q[113];
-rx(12.231627273752405) q[1];
-cx q[3],q[113];
-rz(5.676655381599885) q[113];
-cx q[3],q[113];
-rx(12.231627273752405) q[113];
-ry(pi/2) q[114];
-rx(pi) q[114];
-cx q[104],q[114];
-rz(5.676655381599885) q[114];
-cx q[104],q[114];
-cx q[110],q[114];
-rz(5.676655381599885) q[114];
-cx q[110],q[114];
-rx(12.231627273752405) q[110];
-rx(12.231627273752405) q[114];
-ry(pi/2) q[115];
-rx(pi) q[115];
-cx q[15],q[115];
-rz(5.676655381599885) q[115];
-cx q[15],q[115];
-cx q[92],q[115];
-rz(5.676655381599885) q[115];
-cx q[92],q[115];
-rx(12.231627273752405) q[115];
-ry(pi/2) q[116];
-rx(pi) q[116];
-cx q[28],q[116];
-rz(5.676655381599885) q[116];
-cx q[28],q[116];
-rx(12.231627273752405) q[28];
-cx q[42],q[116];
-rz(5.676655381599885) q[116];
-cx q[42],q[116];
-rx(12.231627273752405) q[42];
-rx(12.231627273752405) q[116];
-ry(pi/2) q[117];
-rx(pi) q[117];
-cx q[26],q[117];
-rz(5.676655381599885) q[117];
-cx q[26],q[117];
-rx(12.231627273752405) q[26];
-cx q[32],q[117];
-rz(5.676655381599885) q[117];
-cx q[32],q[117];
-rx(12.231627273752405) q[117];
-ry(pi/2) q[118];
-rx(pi) q[118];
-cx q[5],q[118];
-rz(5.676655381599885) q[118];
-cx q[5],q[118];
-cx q[15],q[118];
-rz(5.676655381599885) q[118];
-cx q[15],q[118];
-rx(12.231627273752405) q[15];
-ry(pi/2) q[119];
-rx(pi) q[119];
-cx q[40],q[119];
-rz(5.676655381599885) q[119];
-cx q[40],q[119];
-rx(12.231627273752405) q[40];
-cx q[69],q[119];
-rz(5.676655381599885) q[119];
-cx q[69],q[119];
-rx(12.231627273752405) q[69];
-ry(pi/2) q[120];
-rx(pi) q[120];
-cx q[46],q[120];
-rz(5.676655381599885) q[120];
-cx q[46],q[120];
-rx(12.231627273752405) q[46];
-cx q[94],q[120];
-rz(5.676655381599885) q[120];
-cx q[94],q[120];
-rx(12.231627273752405) q[94];
-rx(12.231627273752405) q[120];
-ry(pi/2) q[121];
-rx(pi) q[121];
-cx q[20],q[121];
-rz(5.676655381599885) q[121];
-cx q[20],q[121];
-rx(12.231627273752405) q[20];
-cx q[104],q[121];
-rz(5.676655381599885) q[121];
-cx q[104],q[121];
-rx(12.231627273752405) q[104];
-ry(pi/2) q[122];
-rx(pi) q[122];
-cx q[63],q[122];
-rz(5.676655381599885) q[122];
-cx q[63],q[122];
-rx(12.231627273752405) q[63];
-cx q[81],q[122];
-rz(5.676655381599885) q[122];
-cx q[81],q[122];
-rx(12.231627273752405) q[122];
-ry(pi/2) q[123];
-rx(pi) q[123];
-cx q[0],q[123];
-rz(5.676655381599885) q[123];
-cx q[0],q[123];
-cx q[52],q[123];
-rz(5.676655381599885) q[123];
-cx q[52],q[123];
-rx(12.231627273752405) q[52];
-ry(pi/2) q[124];
-rx(pi) q[124];
-cx q[53],q[124];
-rz(5.676655381599885) q[124];
-cx q[53],q[124];
-rx(12.231627273752405) q[53];
-cx q[81],q[124];
-rz(5.676655381599885) q[124];
-cx q[81],q[124];
-rx(12.231627273752405) q[81];
-rx(12.231627273752405) q[124];
-ry(pi/2) q[125];
-rx(pi) q[125];
-cx q[3],q[125];
-rz(5.676655381599885) q[125];
-cx q[3],q[125];
-cx q[109],q[125];
-rz(5.676655381599885) q[125];
-cx q[109],q[125];
-rx(12.231627273752405) q[125];
-ry(pi/2) q[126];
-rx(pi) q[126];
-cx q[0],q[126];
-rz(5.676655381599885) q[126];
-cx q[0],q[126];
-cx q[12],q[126];
-rz(5.676655381599885) q[126];
-cx q[12],q[126];
-rx(12.231627273752405) q[126];
-ry(pi/2) q[127];
-rx(pi) q[127];
-cx q[4],q[127];
-rz(5.676655381599885) q[127];
-cx q[4],q[127];
-cx q[62],q[127];
-rz(5.676655381599885) q[127];
-cx q[62],q[127];
-rx(12.231627273752405) q[127];
-ry(pi/2) q[128];
-rx(pi) q[128];
-cx q[62],q[128];
-rz(5.676655381599885) q[128];
-cx q[62],q[128];
-rx(12.231627273752405) q[62];
-cx q[109],q[128];
-rz(5.676655381599885) q[128];
-cx q[109],q[128];
-rx(12.231627273752405) q[128];
-ry(pi/2) q[129];
-rx(pi) q[129];
-cx q[50],q[129];
-rz(5.676655381599885) q[129];
-cx q[50],q[129];
-cx q[91],q[129];
-rz(5.676655381599885) q[129];
-cx q[91],q[129];
-rx(12.231627273752405) q[91];
-rx(12.231627273752405) q[129];
-ry(pi/2) q[130];
-rx(pi) q[130];
-cx q[35],q[130];
-rz(5.676655381599885) q[130];
-cx q[35],q[130];
-rx(12.231627273752405) q[35];
-cx q[109],q[130];
-rz(5.676655381599885) q[130];
-cx q[109],q[130];
-rx(12.231627273752405) q[109];
-rx(12.231627273752405) q[130];
-ry(pi/2) q[131];
-rx(pi) q[131];
-cx q[32],q[131];
-rz(5.676655381599885) q[131];
-cx q[32],q[131];
-cx q[123],q[131];
-rz(5.676655381599885) q[131];
-cx q[123],q[131];
-rx(12.231627273752405) q[123];
-rx(12.231627273752405) q[131];
-ry(pi/2) q[132];
-rx(pi) q[132];
-cx q[3],q[132];
-rz(5.676655381599885) q[132];
-cx q[3],q[132];
-cx q[37],q[132];
-rz(5.676655381599885) q[132];
-cx q[37],q[132];
-rx(12.231627273752405) q[37];
-rx(12.231627273752405) q[132];
-ry(pi/2) q[133];
-rx(pi) q[133];
-cx q[7],q[133];
-rz(5.676655381599885) q[133];
-cx q[7],q[133];
-rx(12.231627273752405) q[7];
-cx q[89],q[133];
-rz(5.676655381599885) q[133];
-cx q[89],q[133];
-rx(12.231627273752405) q[89];
-ry(pi/2) q[134];
-rx(pi) q[134];
-cx q[3],q[134];
-rz(5.676655381599885) q[134];
-cx q[3],q[134];
-cx q[47],q[134];
-rz(5.676655381599885) q[134];
-cx q[47],q[134];
-rx(12.231627273752405) q[47];
-rx(12.231627273752405) q[134];
-ry(pi/2) q[135];
-rx(pi) q[135];
-cx q[0],q[135];
-rz(5.676655381599885) q[135];
-cx q[0],q[135];
-cx q[13],q[135];
-rz(5.676655381599885) q[135];
-cx q[13],q[135];
-rx(12.231627273752405) q[13];
-rx(12.231627273752405) q[135];
-ry(pi/2) q[136];
-rx(pi) q[136];
-cx q[3],q[136];
-rz(5.676655381599885) q[136];
-cx q[3],q[136];
-cx q[92],q[136];
-rz(5.676655381599885) q[136];
-cx q[92],q[136];
-rx(12.231627273752405) q[92];
-rx(12.231627273752405) q[136];
-ry(pi/2) q[137];
-rx(pi) q[137];
-cx q[24],q[137];
-rz(5.676655381599885) q[137];
-cx q[24],q[137];
-cx q[133],q[137];
-rz(5.676655381599885) q[137];
-cx q[133],q[137];
-rx(12.231627273752405) q[137];
-ry(pi/2) q[138];
-rx(pi) q[138];
-cx q[60],q[138];
-rz(5.676655381599885) q[138];
-cx q[60],q[138];
-rx(12.231627273752405) q[60];
-cx q[119],q[138];
-rz(5.676655381599885) q[138];
-cx q[119],q[138];
-rx(12.231627273752405) q[119];
-rx(12.231627273752405) q[138];
-ry(pi/2) q[139];
-rx(pi) q[139];
-cx q[5],q[139];
-rz(5.676655381599885) q[139];
-cx q[5],q[139];
-cx q[133],q[139];
-rz(5.676655381599885) q[139];
-cx q[133],q[139];
-rx(12.231627273752405) q[133];
-rx(12.231627273752405) q[139];
-ry(pi/2) q[140];
-rx(pi) q[140];
-cx q[0],q[140];
-rz(5.676655381599885) q[140];
-cx q[0],q[140];
-cx q[32],q[140];
-rz(5.676655381599885) q[140];
-cx q[32],q[140];
-rx(12.231627273752405) q[32];
-rx(12.231627273752405) q[140];
-ry(pi/2) q[141];
-rx(pi) q[141];
-cx q[12],q[141];
-rz(5.676655381599885) q[141];
-cx q[12],q[141];
-cx q[121],q[141];
-rz(5.676655381599885) q[141];
-cx q[121],q[141];
-rx(12.231627273752405) q[121];
-rx(12.231627273752405) q[141];
-ry(pi/2) q[142];
-rx(pi) q[142];
-cx q[5],q[142];
-rz(5.676655381599885) q[142];
-cx q[5],q[142];
-rx(12.231627273752405) q[5];
-cx q[24],q[142];
-rz(5.676655381599885) q[142];
-cx q[24],q[142];
-rx(12.231627273752405) q[24];
-ry(pi/2) q[143];
-rx(pi) q[143];
-cx q[12],q[143];
-rz(5.676655381599885) q[143];
-cx q[12],q[143];
-rx(12.231627273752405) q[12];
-cx q[50],q[143];
-rz(5.676655381599885) q[143];
-cx q[50],q[143];
-rx(12.231627273752405) q[50];
-rx(12.231627273752405) q[143];
-ry(pi/2) q[144];
-rx(pi) q[144];
-cx q[9],q[144];
-rz(5.676655381599885) q[144];
-cx q[9],q[144];
-rx(12.231627273752405) q[9];
-cx q[59],q[144];
-rz(5.676655381599885) q[144];
-cx q[59],q[144];
-rx(12.231627273752405) q[59];
-rx(12.231627273752405) q[144];
-ry(pi/2) q[145];
-rx(pi) q[145];
-cx q[3],q[145];
-rz(5.676655381599885) q[145];
-cx q[3],q[145];
-cx q[97],q[145];
-rz(5.676655381599885) q[145];
-cx q[97],q[145];
-rx(12.231627273752405) q[97];
-rx(12.231627273752405) q[145];
-ry(pi/2) q[146];
-rx(pi) q[146];
-cx q[0],q[146];
-rz(5.676655381599885) q[146];
-cx q[0],q[146];
-rx(12.231627273752405) q[0];
-cx q[0],q[1];
-rz(5.027700449798137) q[1];
-cx q[0],q[1];
-cx q[0],q[2];
-rz(5.027700449798137) q[2];
-cx q[0],q[2];
-cx q[2],q[89];
-cx q[4],q[146];
-rz(5.027700449798137) q[89];
-cx q[2],q[89];
-rx(6.041321886121141) q[2];
-rz(5.676655381599885) q[146];
-cx q[4],q[146];
-rx(12.231627273752405) q[4];
-rx(12.231627273752405) q[146];
-ry(pi/2) q[147];
-rx(pi) q[147];
-cx q[3],q[147];
-rz(5.676655381599885) q[147];
-cx q[3],q[147];
-cx q[118],q[147];
-rz(5.676655381599885) q[147];
-cx q[118],q[147];
-rx(12.231627273752405) q[118];
-rx(12.231627273752405) q[147];
-ry(pi/2) q[148];
-rx(pi) q[148];
-cx q[3],q[148];
-rz(5.676655381599885) q[148];
-cx q[3],q[148];
-rx(12.231627273752405) q[3];
-cx q[0],q[3];
-rz(5.027700449798137) q[3];
-cx q[0],q[3];
-cx q[0],q[15];
-cx q[1],q[3];
-rz(5.027700449798137) q[3];
-cx q[1],q[3];
-cx q[1],q[4];
-rz(5.027700449798137) q[4];
-cx q[1],q[4];
-cx q[1],q[5];
-cx q[3],q[4];
-rz(5.027700449798137) q[4];
-cx q[3],q[4];
-cx q[4],q[6];
-rz(5.027700449798137) q[5];
-cx q[1],q[5];
-cx q[1],q[9];
-cx q[3],q[5];
-rz(5.027700449798137) q[5];
-cx q[3],q[5];
-cx q[3],q[7];
-rz(5.027700449798137) q[6];
-cx q[4],q[6];
-cx q[5],q[6];
-rz(5.027700449798137) q[6];
-cx q[5],q[6];
-rz(5.027700449798137) q[7];
-cx q[3],q[7];
-cx q[3],q[8];
-cx q[4],q[7];
-rz(5.027700449798137) q[7];
-cx q[4],q[7];
-cx q[4],q[10];
-rz(5.027700449798137) q[8];
-cx q[3],q[8];
-cx q[5],q[8];
-rz(5.027700449798137) q[8];
-cx q[5],q[8];
-cx q[5],q[11];
-cx q[8],q[83];
-rz(5.027700449798137) q[9];
-cx q[1],q[9];
-cx q[1],q[17];
-cx q[3],q[9];
-rz(5.027700449798137) q[9];
-cx q[3],q[9];
-cx q[3],q[12];
-rz(5.027700449798137) q[10];
-cx q[4],q[10];
-cx q[4],q[13];
-cx q[6],q[10];
-rz(5.027700449798137) q[10];
-cx q[6],q[10];
-cx q[10],q[37];
-rz(5.027700449798137) q[11];
-cx q[5],q[11];
-cx q[6],q[11];
-rz(5.027700449798137) q[11];
-cx q[6],q[11];
-rx(6.041321886121141) q[11];
-rz(5.027700449798137) q[12];
-cx q[3],q[12];
-cx q[3],q[14];
-cx q[5],q[12];
-rz(5.027700449798137) q[12];
-cx q[5],q[12];
-rz(5.027700449798137) q[13];
-cx q[4],q[13];
-cx q[5],q[13];
-rz(5.027700449798137) q[13];
-cx q[5],q[13];
-rz(5.027700449798137) q[14];
-cx q[3],q[14];
-cx q[4],q[14];
-rz(5.027700449798137) q[14];
-cx q[4],q[14];
-rx(6.041321886121141) q[14];
-rz(5.027700449798137) q[15];
-cx q[0],q[15];
-cx q[0],q[16];
-cx q[3],q[15];
-rz(5.027700449798137) q[15];
-cx q[3],q[15];
-rz(5.027700449798137) q[16];
-cx q[0],q[16];
-cx q[0],q[20];
-cx q[3],q[16];
-rz(5.027700449798137) q[16];
-cx q[3],q[16];
-rz(5.027700449798137) q[17];
-cx q[1],q[17];
-cx q[1],q[28];
-cx q[3],q[17];
-rz(5.027700449798137) q[17];
-cx q[3],q[17];
-cx q[3],q[18];
-rz(5.027700449798137) q[18];
-cx q[3],q[18];
-cx q[3],q[19];
-cx q[4],q[18];
-rz(5.027700449798137) q[18];
-cx q[4],q[18];
-cx q[4],q[21];
-rz(5.027700449798137) q[19];
-cx q[3],q[19];
-cx q[3],q[22];
-cx q[7],q[19];
-rz(5.027700449798137) q[19];
-cx q[7],q[19];
-cx q[19],q[38];
-rz(5.027700449798137) q[20];
-cx q[0],q[20];
-cx q[0],q[32];
-cx q[15],q[20];
-rz(5.027700449798137) q[20];
-cx q[15],q[20];
-rz(5.027700449798137) q[21];
-cx q[4],q[21];
-cx q[4],q[27];
-cx q[15],q[21];
-rz(5.027700449798137) q[21];
-cx q[15],q[21];
-cx q[15],q[36];
-rz(5.027700449798137) q[22];
-cx q[3],q[22];
-cx q[3],q[23];
-cx q[9],q[22];
-rz(5.027700449798137) q[22];
-cx q[9],q[22];
-cx q[9],q[55];
-rx(6.041321886121141) q[22];
-rz(5.027700449798137) q[23];
-cx q[3],q[23];
-cx q[3],q[24];
-cx q[17],q[23];
-rz(5.027700449798137) q[23];
-cx q[17],q[23];
-rz(5.027700449798137) q[24];
-cx q[3],q[24];
-cx q[3],q[25];
-cx q[5],q[24];
-rz(5.027700449798137) q[24];
-cx q[5],q[24];
-cx q[5],q[33];
-cx q[24],q[54];
-rz(5.027700449798137) q[25];
-cx q[3],q[25];
-cx q[3],q[26];
-cx q[12],q[25];
-rz(5.027700449798137) q[25];
-cx q[12],q[25];
-cx q[12],q[31];
-rz(5.027700449798137) q[26];
-cx q[3],q[26];
-cx q[21],q[26];
-rz(5.027700449798137) q[26];
-cx q[21],q[26];
-rz(5.027700449798137) q[27];
-cx q[4],q[27];
-cx q[4],q[47];
-cx q[6],q[27];
-rz(5.027700449798137) q[27];
-cx q[6],q[27];
-cx q[6],q[69];
-rz(5.027700449798137) q[28];
-cx q[1],q[28];
-cx q[1],q[29];
-cx q[3],q[28];
-rz(5.027700449798137) q[28];
-cx q[3],q[28];
-rz(5.027700449798137) q[29];
-cx q[1],q[29];
-cx q[1],q[45];
-cx q[3],q[29];
-rz(5.027700449798137) q[29];
-cx q[3],q[29];
-cx q[3],q[30];
-rx(6.041321886121141) q[29];
-rz(5.027700449798137) q[30];
-cx q[3],q[30];
-cx q[3],q[34];
-cx q[18],q[30];
-rz(5.027700449798137) q[30];
-cx q[18],q[30];
-rx(6.041321886121141) q[18];
-rz(5.027700449798137) q[31];
-cx q[12],q[31];
-cx q[26],q[31];
-rz(5.027700449798137) q[31];
-cx q[26],q[31];
-cx q[26],q[105];
-rz(5.027700449798137) q[32];
-cx q[0],q[32];
-cx q[0],q[42];
-cx q[21],q[32];
-rz(5.027700449798137) q[32];
-cx q[21],q[32];
-rz(5.027700449798137) q[33];
-cx q[5],q[33];
-cx q[5],q[46];
-cx q[30],q[33];
-rz(5.027700449798137) q[33];
-cx q[30],q[33];
-rx(6.041321886121141) q[33];
-rz(5.027700449798137) q[34];
-cx q[3],q[34];
-cx q[3],q[35];
-cx q[12],q[34];
-rz(5.027700449798137) q[34];
-cx q[12],q[34];
-rz(5.027700449798137) q[35];
-cx q[3],q[35];
-cx q[3],q[39];
-cx q[32],q[35];
-rz(5.027700449798137) q[35];
-cx q[32],q[35];
-cx q[35],q[130];
-rz(5.027700449798137) q[36];
-cx q[15],q[36];
-cx q[20],q[36];
-rz(5.027700449798137) q[36];
-cx q[20],q[36];
-cx q[36],q[94];
-rz(5.027700449798137) q[37];
-cx q[10],q[37];
-cx q[10],q[41];
-cx q[34],q[37];
-rz(5.027700449798137) q[37];
-cx q[34],q[37];
-rx(6.041321886121141) q[34];
-cx q[37],q[85];
-rz(5.027700449798137) q[38];
-cx q[19],q[38];
-rx(6.041321886121141) q[19];
-cx q[21],q[38];
-rz(5.027700449798137) q[38];
-cx q[21],q[38];
-rz(5.027700449798137) q[39];
-cx q[3],q[39];
-cx q[3],q[40];
-cx q[13],q[39];
-rz(5.027700449798137) q[39];
-cx q[13],q[39];
-cx q[13],q[56];
-rz(5.027700449798137) q[40];
-cx q[3],q[40];
-cx q[23],q[40];
-rz(5.027700449798137) q[40];
-cx q[23],q[40];
-cx q[40],q[119];
-rz(5.027700449798137) q[41];
-cx q[10],q[41];
-cx q[27],q[41];
-rz(5.027700449798137) q[41];
-cx q[27],q[41];
-cx q[27],q[72];
-cx q[41],q[67];
-rz(5.027700449798137) q[42];
-cx q[0],q[42];
-cx q[0],q[48];
-cx q[3],q[42];
-rz(5.027700449798137) q[42];
-cx q[3],q[42];
-cx q[3],q[43];
-cx q[42],q[78];
-rz(5.027700449798137) q[43];
-cx q[3],q[43];
-cx q[3],q[44];
-cx q[20],q[43];
-rz(5.027700449798137) q[43];
-cx q[20],q[43];
-cx q[20],q[121];
-rx(6.041321886121141) q[43];
-rz(5.027700449798137) q[44];
-cx q[3],q[44];
-cx q[3],q[49];
-cx q[12],q[44];
-rz(5.027700449798137) q[44];
-cx q[12],q[44];
-rz(5.027700449798137) q[45];
-cx q[1],q[45];
-cx q[1],q[57];
-cx q[16],q[45];
-rz(5.027700449798137) q[45];
-cx q[16],q[45];
-cx q[16],q[59];
-rz(5.027700449798137) q[46];
-cx q[5],q[46];
-cx q[5],q[65];
-cx q[38],q[46];
-rz(5.027700449798137) q[46];
-cx q[38],q[46];
-rx(6.041321886121141) q[38];
-cx q[46],q[120];
-rz(5.027700449798137) q[47];
-cx q[4],q[47];
-cx q[17],q[47];
-rz(5.027700449798137) q[47];
-cx q[17],q[47];
-cx q[17],q[53];
-rz(5.027700449798137) q[48];
-cx q[0],q[48];
-cx q[0],q[51];
-cx q[30],q[48];
-rz(5.027700449798137) q[48];
-cx q[30],q[48];
-rx(6.041321886121141) q[48];
-rz(5.027700449798137) q[49];
-cx q[3],q[49];
-cx q[3],q[50];
-cx q[4],q[49];
-rz(5.027700449798137) q[49];
-cx q[4],q[49];
-cx q[4],q[61];
-rx(6.041321886121141) q[49];
-rz(5.027700449798137) q[50];
-cx q[3],q[50];
-cx q[3],q[52];
-cx q[12],q[50];
-rz(5.027700449798137) q[50];
-cx q[12],q[50];
-cx q[12],q[63];
-rz(5.027700449798137) q[51];
-cx q[0],q[51];
-cx q[0],q[62];
-cx q[28],q[51];
-rz(5.027700449798137) q[51];
-cx q[28],q[51];
-rx(6.041321886121141) q[51];
-rz(5.027700449798137) q[52];
-cx q[3],q[52];
-cx q[10],q[52];
-rz(5.027700449798137) q[52];
-cx q[10],q[52];
-rz(5.027700449798137) q[53];
-cx q[17],q[53];
-cx q[21],q[53];
-rz(5.027700449798137) q[53];
-cx q[21],q[53];
-rz(5.027700449798137) q[54];
-cx q[24],q[54];
-cx q[24],q[58];
-cx q[28],q[54];
-rz(5.027700449798137) q[54];
-cx q[28],q[54];
-rx(6.041321886121141) q[54];
-rz(5.027700449798137) q[55];
-cx q[9],q[55];
-cx q[9],q[80];
-cx q[15],q[55];
-rz(5.027700449798137) q[55];
-cx q[15],q[55];
-rz(5.027700449798137) q[56];
-cx q[13],q[56];
-cx q[13],q[68];
-cx q[45],q[56];
-rz(5.027700449798137) q[56];
-cx q[45],q[56];
-rx(6.041321886121141) q[45];
-rz(5.027700449798137) q[57];
-cx q[1],q[57];
-cx q[1],q[60];
-cx q[3],q[57];
-rz(5.027700449798137) q[57];
-cx q[3],q[57];
-cx q[3],q[70];
-rz(5.027700449798137) q[58];
-cx q[24],q[58];
-cx q[24],q[86];
-cx q[28],q[58];
-rz(5.027700449798137) q[58];
-cx q[28],q[58];
-cx q[28],q[87];
-rx(6.041321886121141) q[58];
-rz(5.027700449798137) q[59];
-cx q[16],q[59];
-cx q[16],q[73];
-cx q[32],q[59];
-rz(5.027700449798137) q[59];
-cx q[32],q[59];
-rz(5.027700449798137) q[60];
-cx q[1],q[60];
-cx q[1],q[97];
-cx q[7],q[60];
-rz(5.027700449798137) q[60];
-cx q[7],q[60];
-rz(5.027700449798137) q[61];
-cx q[4],q[61];
-cx q[4],q[99];
-cx q[7],q[61];
-rz(5.027700449798137) q[61];
-cx q[7],q[61];
-rx(6.041321886121141) q[61];
-rz(5.027700449798137) q[62];
-cx q[0],q[62];
-cx q[0],q[64];
-cx q[17],q[62];
-rz(5.027700449798137) q[62];
-cx q[17],q[62];
-rz(5.027700449798137) q[63];
-cx q[12],q[63];
-cx q[17],q[63];
-rz(5.027700449798137) q[63];
-cx q[17],q[63];
-cx q[17],q[66];
-rz(5.027700449798137) q[64];
-cx q[0],q[64];
-cx q[0],q[75];
-cx q[10],q[64];
-rz(5.027700449798137) q[64];
-cx q[10],q[64];
-cx q[10],q[98];
-rx(6.041321886121141) q[64];
-rz(5.027700449798137) q[65];
-cx q[5],q[65];
-cx q[5],q[76];
-cx q[23],q[65];
-rz(5.027700449798137) q[65];
-cx q[23],q[65];
-rx(6.041321886121141) q[23];
-rx(6.041321886121141) q[65];
-rz(5.027700449798137) q[66];
-cx q[17],q[66];
-rx(6.041321886121141) q[17];
-cx q[47],q[66];
-rz(5.027700449798137) q[66];
-cx q[47],q[66];
-rx(6.041321886121141) q[66];
-rz(5.027700449798137) q[67];
-cx q[41],q[67];
-cx q[56],q[67];
-rz(5.027700449798137) q[67];
-cx q[56],q[67];
-cx q[56],q[74];
-rx(6.041321886121141) q[67];
-rz(5.027700449798137) q[68];
-cx q[13],q[68];
-cx q[32],q[68];
-rz(5.027700449798137) q[68];
-cx q[32],q[68];
-rz(5.027700449798137) q[69];
-cx q[6],q[69];
-cx q[59],q[69];
-rz(5.027700449798137) q[69];
-cx q[59],q[69];
-rz(5.027700449798137) q[70];
-cx q[3],q[70];
-cx q[3],q[71];
-cx q[15],q[70];
-rz(5.027700449798137) q[70];
-cx q[15],q[70];
-cx q[70],q[84];
-rz(5.027700449798137) q[71];
-cx q[3],q[71];
-cx q[3],q[77];
-cx q[53],q[71];
-rz(5.027700449798137) q[71];
-cx q[53],q[71];
-rx(6.041321886121141) q[71];
-rz(5.027700449798137) q[72];
-cx q[27],q[72];
-cx q[44],q[72];
-rz(5.027700449798137) q[72];
-cx q[44],q[72];
-rx(6.041321886121141) q[44];
-rx(6.041321886121141) q[72];
-rz(5.027700449798137) q[73];
-cx q[16],q[73];
-cx q[16],q[101];
-cx q[59],q[73];
-rz(5.027700449798137) q[73];
-cx q[59],q[73];
-rz(5.027700449798137) q[74];
-cx q[56],q[74];
-cx q[63],q[74];
-rz(5.027700449798137) q[74];
-cx q[63],q[74];
-cx q[63],q[122];
-rx(6.041321886121141) q[74];
-rz(5.027700449798137) q[75];
-cx q[0],q[75];
-cx q[0],q[82];
-cx q[21],q[75];
-rz(5.027700449798137) q[75];
-cx q[21],q[75];
-cx q[21],q[81];
-rx(6.041321886121141) q[75];
-rz(5.027700449798137) q[76];
-cx q[5],q[76];
-cx q[5],q[89];
-cx q[6],q[76];
-rz(5.027700449798137) q[76];
-cx q[6],q[76];
-cx q[6],q[79];
-rx(6.041321886121141) q[76];
-rz(5.027700449798137) q[77];
-cx q[3],q[77];
-cx q[3],q[88];
-cx q[30],q[77];
-rz(5.027700449798137) q[77];
-cx q[30],q[77];
-rx(6.041321886121141) q[30];
-rz(5.027700449798137) q[78];
-cx q[42],q[78];
-cx q[60],q[78];
-rz(5.027700449798137) q[78];
-cx q[60],q[78];
-rx(6.041321886121141) q[78];
-rz(5.027700449798137) q[79];
-cx q[6],q[79];
-cx q[50],q[79];
-rz(5.027700449798137) q[79];
-cx q[50],q[79];
-rx(6.041321886121141) q[79];
-rz(5.027700449798137) q[80];
-cx q[9],q[80];
-cx q[9],q[144];
-cx q[15],q[80];
-rz(5.027700449798137) q[80];
-cx q[15],q[80];
-cx q[15],q[90];
-rx(6.041321886121141) q[80];
-rz(5.027700449798137) q[81];
-cx q[21],q[81];
-cx q[77],q[81];
-rz(5.027700449798137) q[81];
-cx q[77],q[81];
-rx(6.041321886121141) q[77];
-rz(5.027700449798137) q[82];
-cx q[0],q[82];
-cx q[0],q[91];
-cx q[56],q[82];
-rz(5.027700449798137) q[82];
-cx q[56],q[82];
-cx q[56],q[96];
-rx(6.041321886121141) q[82];
-rz(5.027700449798137) q[83];
-cx q[8],q[83];
-rx(6.041321886121141) q[8];
-cx q[68],q[83];
-rz(5.027700449798137) q[83];
-cx q[68],q[83];
-rx(6.041321886121141) q[68];
-rx(6.041321886121141) q[83];
-rz(5.027700449798137) q[84];
-cx q[70],q[84];
-rx(6.041321886121141) q[70];
-cx q[73],q[84];
-rz(5.027700449798137) q[84];
-cx q[73],q[84];
-rx(6.041321886121141) q[73];
-rx(6.041321886121141) q[84];
-rz(5.027700449798137) q[85];
-cx q[37],q[85];
-cx q[59],q[85];
-rz(5.027700449798137) q[85];
-cx q[59],q[85];
-rx(6.041321886121141) q[85];
-rz(5.027700449798137) q[86];
-cx q[24],q[86];
-cx q[53],q[86];
-rz(5.027700449798137) q[86];
-cx q[53],q[86];
-cx q[53],q[124];
-rx(6.041321886121141) q[86];
-rz(5.027700449798137) q[87];
-cx q[28],q[87];
-cx q[32],q[87];
-rz(5.027700449798137) q[87];
-cx q[32],q[87];
-rx(6.041321886121141) q[87];
-rz(5.027700449798137) q[88];
-cx q[3],q[88];
-cx q[3],q[100];
-cx q[60],q[88];
-rz(5.027700449798137) q[88];
-cx q[60],q[88];
-cx q[60],q[138];
-rx(6.041321886121141) q[88];
-rz(5.027700449798137) q[89];
-cx q[5],q[89];
-cx q[5],q[95];
-rz(5.027700449798137) q[90];
-cx q[15],q[90];
-cx q[15],q[92];
-cx q[27],q[90];
-rz(5.027700449798137) q[90];
-cx q[27],q[90];
-rx(6.041321886121141) q[90];
-rz(5.027700449798137) q[91];
-cx q[0],q[91];
-cx q[0],q[93];
-cx q[6],q[91];
-rz(5.027700449798137) q[91];
-cx q[6],q[91];
-rx(6.041321886121141) q[6];
-rz(5.027700449798137) q[92];
-cx q[15],q[92];
-cx q[15],q[108];
-cx q[89],q[92];
-rz(5.027700449798137) q[92];
-cx q[89],q[92];
-rz(5.027700449798137) q[93];
-cx q[0],q[93];
-cx q[0],q[123];
-cx q[32],q[93];
-rz(5.027700449798137) q[93];
-cx q[32],q[93];
-rx(6.041321886121141) q[93];
-rz(5.027700449798137) q[94];
-cx q[36],q[94];
-cx q[55],q[94];
-rz(5.027700449798137) q[94];
-cx q[55],q[94];
-rx(6.041321886121141) q[55];
-rz(5.027700449798137) q[95];
-cx q[5],q[95];
-cx q[5],q[106];
-cx q[27],q[95];
-rz(5.027700449798137) q[95];
-cx q[27],q[95];
-rx(6.041321886121141) q[27];
-rx(6.041321886121141) q[95];
-rz(5.027700449798137) q[96];
-cx q[56],q[96];
-rx(6.041321886121141) q[56];
-cx q[92],q[96];
-rz(5.027700449798137) q[96];
-cx q[92],q[96];
-rx(6.041321886121141) q[96];
-rz(5.027700449798137) q[97];
-cx q[1],q[97];
-cx q[1],q[113];
-cx q[7],q[97];
-rz(5.027700449798137) q[97];
-cx q[7],q[97];
-cx q[7],q[104];
-rz(5.027700449798137) q[98];
-cx q[10],q[98];
-rx(6.041321886121141) q[10];
-cx q[21],q[98];
-rz(5.027700449798137) q[98];
-cx q[21],q[98];
-rx(6.041321886121141) q[98];
-rz(5.027700449798137) q[99];
-cx q[4],q[99];
-cx q[41],q[99];
-rz(5.027700449798137) q[99];
-cx q[41],q[99];
-rx(6.041321886121141) q[41];
-rx(6.041321886121141) q[99];
-rz(5.027700449798137) q[100];
-cx q[3],q[100];
-cx q[3],q[102];
-cx q[25],q[100];
-rz(5.027700449798137) q[100];
-cx q[25],q[100];
-rx(6.041321886121141) q[25];
-rx(6.041321886121141) q[100];
-rz(5.027700449798137) q[101];
-cx q[16],q[101];
-cx q[16],q[103];
-cx q[50],q[101];
-rz(5.027700449798137) q[101];
-cx q[50],q[101];
-cx q[50],q[129];
-rx(6.041321886121141) q[101];
-rz(5.027700449798137) q[102];
-cx q[3],q[102];
-cx q[3],q[107];
-cx q[4],q[102];
-rz(5.027700449798137) q[102];
-cx q[4],q[102];
-cx q[4],q[127];
-rx(6.041321886121141) q[102];
-rz(5.027700449798137) q[103];
-cx q[16],q[103];
-rx(6.041321886121141) q[16];
-cx q[57],q[103];
-rz(5.027700449798137) q[103];
-cx q[57],q[103];
-rx(6.041321886121141) q[57];
-rx(6.041321886121141) q[103];
-rz(5.027700449798137) q[104];
-cx q[7],q[104];
-cx q[7],q[133];
-cx q[13],q[104];
-rz(5.027700449798137) q[104];
-cx q[13],q[104];
-cx q[104],q[114];
-rz(5.027700449798137) q[105];
-cx q[26],q[105];
-cx q[26],q[117];
-cx q[28],q[105];
-rz(5.027700449798137) q[105];
-cx q[28],q[105];
-cx q[28],q[116];
-rx(6.041321886121141) q[105];
-rz(5.027700449798137) q[106];
-cx q[5],q[106];
-cx q[5],q[109];
-cx q[36],q[106];
-rz(5.027700449798137) q[106];
-cx q[36],q[106];
-rx(6.041321886121141) q[106];
-rz(5.027700449798137) q[107];
-cx q[3],q[107];
-cx q[3],q[110];
-cx q[31],q[107];
-rz(5.027700449798137) q[107];
-cx q[31],q[107];
-rx(6.041321886121141) q[107];
-rz(5.027700449798137) q[108];
-cx q[15],q[108];
-cx q[15],q[115];
-cx q[31],q[108];
-rz(5.027700449798137) q[108];
-cx q[31],q[108];
-rx(6.041321886121141) q[31];
-rx(6.041321886121141) q[108];
-rz(5.027700449798137) q[109];
-cx q[5],q[109];
-cx q[5],q[118];
-cx q[39],q[109];
-rz(5.027700449798137) q[109];
-cx q[39],q[109];
-rx(6.041321886121141) q[39];
-rz(5.027700449798137) q[110];
-cx q[3],q[110];
-cx q[3],q[111];
-cx q[24],q[110];
-rz(5.027700449798137) q[110];
-cx q[24],q[110];
-cx q[24],q[137];
-rz(5.027700449798137) q[111];
-cx q[3],q[111];
-cx q[21],q[111];
-rz(5.027700449798137) q[111];
-cx q[21],q[111];
-cx q[21],q[112];
-rx(6.041321886121141) q[111];
-rz(5.027700449798137) q[112];
-cx q[21],q[112];
-rx(6.041321886121141) q[21];
-cx q[36],q[112];
-rz(5.027700449798137) q[112];
-cx q[36],q[112];
-rx(6.041321886121141) q[36];
-rx(6.041321886121141) q[112];
-rz(5.027700449798137) q[113];
-cx q[1],q[113];
-rx(6.041321886121141) q[1];
-cx q[3],q[113];
-rz(5.027700449798137) q[113];
-cx q[3],q[113];
-cx q[3],q[125];
-rx(6.041321886121141) q[113];
-rz(5.027700449798137) q[114];
-cx q[104],q[114];
-cx q[110],q[114];
-rz(5.027700449798137) q[114];
-cx q[110],q[114];
-rx(6.041321886121141) q[110];
-rx(6.041321886121141) q[114];
-rz(5.027700449798137) q[115];
-cx q[15],q[115];
-cx q[92],q[115];
-rz(5.027700449798137) q[115];
-cx q[92],q[115];
-rx(6.041321886121141) q[115];
-rz(5.027700449798137) q[116];
-cx q[28],q[116];
-rx(6.041321886121141) q[28];
-cx q[42],q[116];
-rz(5.027700449798137) q[116];
-cx q[42],q[116];
-rx(6.041321886121141) q[42];
-rx(6.041321886121141) q[116];
-rz(5.027700449798137) q[117];
-cx q[26],q[117];
-rx(6.041321886121141) q[26];
-cx q[32],q[117];
-rz(5.027700449798137) q[117];
-cx q[32],q[117];
-cx q[32],q[131];
-rx(6.041321886121141) q[117];
-rz(5.027700449798137) q[118];
-cx q[5],q[118];
-cx q[5],q[139];
-cx q[15],q[118];
-rz(5.027700449798137) q[118];
-cx q[15],q[118];
-rx(6.041321886121141) q[15];
-rz(5.027700449798137) q[119];
-cx q[40],q[119];
-rx(6.041321886121141) q[40];
-cx q[69],q[119];
-rz(5.027700449798137) q[119];
-cx q[69],q[119];
-rx(6.041321886121141) q[69];
-rz(5.027700449798137) q[120];
-cx q[46],q[120];
-rx(6.041321886121141) q[46];
-cx q[94],q[120];
-rz(5.027700449798137) q[120];
-cx q[94],q[120];
-rx(6.041321886121141) q[94];
-rx(6.041321886121141) q[120];
-rz(5.027700449798137) q[121];
-cx q[20],q[121];
-rx(6.041321886121141) q[20];
-cx q[104],q[121];
-rz(5.027700449798137) q[121];
-cx q[104],q[121];
-rx(6.041321886121141) q[104];
-rz(5.027700449798137) q[122];
-cx q[63],q[122];
-rx(6.041321886121141) q[63];
-cx q[81],q[122];
-rz(5.027700449798137) q[122];
-cx q[81],q[122];
-rx(6.041321886121141) q[122];
-rz(5.027700449798137) q[123];
-cx q[0],q[123];
-cx q[0],q[126];
-cx q[52],q[123];
-rz(5.027700449798137) q[123];
-cx q[52],q[123];
-rx(6.041321886121141) q[52];
-rz(5.027700449798137) q[124];
-cx q[53],q[124];
-rx(6.041321886121141) q[53];
-cx q[81],q[124];
-rz(5.027700449798137) q[124];
-cx q[81],q[124];
-rx(6.041321886121141) q[81];
-rx(6.041321886121141) q[124];
-rz(5.027700449798137) q[125];
-cx q[3],q[125];
-cx q[3],q[132];
-cx q[109],q[125];
-rz(5.027700449798137) q[125];
-cx q[109],q[125];
-rx(6.041321886121141) q[125];
-rz(5.027700449798137) q[126];
-cx q[0],q[126];
-cx q[0],q[135];
-cx q[12],q[126];
-rz(5.027700449798137) q[126];
-cx q[12],q[126];
-cx q[12],q[141];
-rx(6.041321886121141) q[126];
-rz(5.027700449798137) q[127];
-cx q[4],q[127];
-cx q[62],q[127];
-rz(5.027700449798137) q[127];
-cx q[62],q[127];
-cx q[62],q[128];
-rx(6.041321886121141) q[127];
-rz(5.027700449798137) q[128];
-cx q[62],q[128];
-rx(6.041321886121141) q[62];
-cx q[109],q[128];
-rz(5.027700449798137) q[128];
-cx q[109],q[128];
-rx(6.041321886121141) q[128];
-rz(5.027700449798137) q[129];
-cx q[50],q[129];
-cx q[91],q[129];
-rz(5.027700449798137) q[129];
-cx q[91],q[129];
-rx(6.041321886121141) q[91];
-rx(6.041321886121141) q[129];
-rz(5.027700449798137) q[130];
-cx q[35],q[130];
-rx(6.041321886121141) q[35];
-cx q[109],q[130];
-rz(5.027700449798137) q[130];
-cx q[109],q[130];
-rx(6.041321886121141) q[109];
-rx(6.041321886121141) q[130];
-rz(5.027700449798137) q[131];
-cx q[32],q[131];
-cx q[123],q[131];
-rz(5.027700449798137) q[131];
-cx q[123],q[131];
-rx(6.041321886121141) q[123];
-rx(6.041321886121141) q[131];
-rz(5.027700449798137) q[132];
-cx q[3],q[132];
-cx q[3],q[134];
-cx q[37],q[132];
-rz(5.027700449798137) q[132];
-cx q[37],q[132];
-rx(6.041321886121141) q[37];
-rx(6.041321886121141) q[132];
-rz(5.027700449798137) q[133];
-cx q[7],q[133];
-rx(6.041321886121141) q[7];
-cx q[89],q[133];
-rz(5.027700449798137) q[133];
-cx q[89],q[133];
-rx(6.041321886121141) q[89];
-rz(5.027700449798137) q[134];
-cx q[3],q[134];
-cx q[3],q[136];
-cx q[47],q[134];
-rz(5.027700449798137) q[134];
-cx q[47],q[134];
-rx(6.041321886121141) q[47];
-rx(6.041321886121141) q[134];
-rz(5.027700449798137) q[135];
-cx q[0],q[135];
-cx q[0],q[140];
-cx q[13],q[135];
-rz(5.027700449798137) q[135];
-cx q[13],q[135];
-rx(6.041321886121141) q[13];
-rx(6.041321886121141) q[135];
-rz(5.027700449798137) q[136];
-cx q[3],q[136];
-cx q[3],q[145];
-cx q[92],q[136];
-rz(5.027700449798137) q[136];
-cx q[92],q[136];
-rx(6.041321886121141) q[92];
-rx(6.041321886121141) q[136];
-rz(5.027700449798137) q[137];
-cx q[24],q[137];
-cx q[133],q[137];
-rz(5.027700449798137) q[137];
-cx q[133],q[137];
-rx(6.041321886121141) q[137];
-rz(5.027700449798137) q[138];
-cx q[60],q[138];
-rx(6.041321886121141) q[60];
-cx q[119],q[138];
-rz(5.027700449798137) q[138];
-cx q[119],q[138];
-rx(6.041321886121141) q[119];
-rx(6.041321886121141) q[138];
-rz(5.027700449798137) q[139];
-cx q[5],q[139];
-cx q[133],q[139];
-rz(5.027700449798137) q[139];
-cx q[133],q[139];
-rx(6.041321886121141) q[133];
-rx(6.041321886121141) q[139];
-rz(5.027700449798137) q[140];
-cx q[0],q[140];
-cx q[0],q[146];
-cx q[32],q[140];
-rz(5.027700449798137) q[140];
-cx q[32],q[140];
-rx(6.041321886121141) q[32];
-rx(6.041321886121141) q[140];
-rz(5.027700449798137) q[141];
-cx q[12],q[141];
-cx q[12],q[143];
-cx q[121],q[141];
-rz(5.027700449798137) q[141];
-cx q[121],q[141];
-rx(6.041321886121141) q[121];
-rx(6.041321886121141) q[141];
-cx q[142],q[148];
-rz(5.027700449798137) q[143];
-cx q[12],q[143];
-rx(6.041321886121141) q[12];
-cx q[50],q[143];
-rz(5.027700449798137) q[143];
-cx q[50],q[143];
-rx(6.041321886121141) q[50];
-rx(6.041321886121141) q[143];
-rz(5.027700449798137) q[144];
-cx q[9],q[144];
-rx(6.041321886121141) q[9];
-cx q[59],q[144];
-rz(5.027700449798137) q[144];
-cx q[59],q[144];
-rx(6.041321886121141) q[59];
-rx(6.041321886121141) q[144];
-rz(5.027700449798137) q[145];
-cx q[3],q[145];
-cx q[3],q[147];
-cx q[97],q[145];
-rz(5.027700449798137) q[145];
-cx q[97],q[145];
-rx(6.041321886121141) q[97];
-rx(6.041321886121141) q[145];
-rz(5.027700449798137) q[146];
-cx q[0],q[146];
-rx(6.041321886121141) q[0];
-cx q[0],q[1];
-rz(3.608333011035458) q[1];
-cx q[0],q[1];
-cx q[0],q[2];
-rz(3.608333011035458) q[2];
-cx q[0],q[2];
-cx q[2],q[89];
-cx q[4],q[146];
-rz(3.608333011035458) q[89];
-cx q[2],q[89];
-rx(0.28639260550961093) q[2];
-rz(5.027700449798137) q[146];
-cx q[4],q[146];
-rx(6.041321886121141) q[4];
-rx(6.041321886121141) q[146];
-rz(5.027700449798137) q[147];
-cx q[3],q[147];
-cx q[118],q[147];
-rz(5.027700449798137) q[147];
-cx q[118],q[147];
-rx(6.041321886121141) q[118];
-rx(6.041321886121141) q[147];
-rz(5.676655381599885) q[148];
-cx q[142],q[148];
-rx(12.231627273752405) q[142];
-cx q[5],q[142];
-rz(5.027700449798137) q[142];
-cx q[5],q[142];
-rx(6.041321886121141) q[5];
-cx q[24],q[142];
-rz(5.027700449798137) q[142];
-cx q[24],q[142];
-rx(6.041321886121141) q[24];
-rx(12.231627273752405) q[148];
-cx q[3],q[148];
-rz(5.027700449798137) q[148];
-cx q[3],q[148];
-rx(6.041321886121141) q[3];
-cx q[0],q[3];
-rz(3.608333011035458) q[3];
-cx q[0],q[3];
-cx q[0],q[15];
-cx q[1],q[3];
-rz(3.608333011035458) q[3];
-cx q[1],q[3];
-cx q[1],q[4];
-rz(3.608333011035458) q[4];
-cx q[1],q[4];
-cx q[1],q[5];
-cx q[3],q[4];
-rz(3.608333011035458) q[4];
-cx q[3],q[4];
-cx q[4],q[6];
-rz(3.608333011035458) q[5];
-cx q[1],q[5];
-cx q[1],q[9];
-cx q[3],q[5];
-rz(3.608333011035458) q[5];
-cx q[3],q[5];
-cx q[3],q[7];
-rz(3.608333011035458) q[6];
-cx q[4],q[6];
-cx q[5],q[6];
-rz(3.608333011035458) q[6];
-cx q[5],q[6];
-rz(3.608333011035458) q[7];
-cx q[3],q[7];
-cx q[3],q[8];
-cx q[4],q[7];
-rz(3.608333011035458) q[7];
-cx q[4],q[7];
-cx q[4],q[10];
-rz(3.608333011035458) q[8];
-cx q[3],q[8];
-cx q[5],q[8];
-rz(3.608333011035458) q[8];
-cx q[5],q[8];
-cx q[5],q[11];
-cx q[8],q[83];
-rz(3.608333011035458) q[9];
-cx q[1],q[9];
-cx q[1],q[17];
-cx q[3],q[9];
-rz(3.608333011035458) q[9];
-cx q[3],q[9];
-cx q[3],q[12];
-rz(3.608333011035458) q[10];
-cx q[4],q[10];
-cx q[4],q[13];
-cx q[6],q[10];
-rz(3.608333011035458) q[10];
-cx q[6],q[10];
-cx q[10],q[37];
-rz(3.608333011035458) q[11];
-cx q[5],q[11];
-cx q[6],q[11];
-rz(3.608333011035458) q[11];
-cx q[6],q[11];
-rx(0.28639260550961093) q[11];
-rz(3.608333011035458) q[12];
-cx q[3],q[12];
-cx q[3],q[14];
-cx q[5],q[12];
-rz(3.608333011035458) q[12];
-cx q[5],q[12];
-rz(3.608333011035458) q[13];
-cx q[4],q[13];
-cx q[5],q[13];
-rz(3.608333011035458) q[13];
-cx q[5],q[13];
-rz(3.608333011035458) q[14];
-cx q[3],q[14];
-cx q[4],q[14];
-rz(3.608333011035458) q[14];
-cx q[4],q[14];
-rx(0.28639260550961093) q[14];
-rz(3.608333011035458) q[15];
-cx q[0],q[15];
-cx q[0],q[16];
-cx q[3],q[15];
-rz(3.608333011035458) q[15];
-cx q[3],q[15];
-rz(3.608333011035458) q[16];
-cx q[0],q[16];
-cx q[0],q[20];
-cx q[3],q[16];
-rz(3.608333011035458) q[16];
-cx q[3],q[16];
-rz(3.608333011035458) q[17];
-cx q[1],q[17];
-cx q[1],q[28];
-cx q[3],q[17];
-rz(3.608333011035458) q[17];
-cx q[3],q[17];
-cx q[3],q[18];
-rz(3.608333011035458) q[18];
-cx q[3],q[18];
-cx q[3],q[19];
-cx q[4],q[18];
-rz(3.608333011035458) q[18];
-cx q[4],q[18];
-cx q[4],q[21];
-rz(3.608333011035458) q[19];
-cx q[3],q[19];
-cx q[3],q[22];
-cx q[7],q[19];
-rz(3.608333011035458) q[19];
-cx q[7],q[19];
-cx q[19],q[38];
-rz(3.608333011035458) q[20];
-cx q[0],q[20];
-cx q[0],q[32];
-cx q[15],q[20];
-rz(3.608333011035458) q[20];
-cx q[15],q[20];
-rz(3.608333011035458) q[21];
-cx q[4],q[21];
-cx q[4],q[27];
-cx q[15],q[21];
-rz(3.608333011035458) q[21];
-cx q[15],q[21];
-cx q[15],q[36];
-rz(3.608333011035458) q[22];
-cx q[3],q[22];
-cx q[3],q[23];
-cx q[9],q[22];
-rz(3.608333011035458) q[22];
-cx q[9],q[22];
-cx q[9],q[55];
-rx(0.28639260550961093) q[22];
-rz(3.608333011035458) q[23];
-cx q[3],q[23];
-cx q[3],q[24];
-cx q[17],q[23];
-rz(3.608333011035458) q[23];
-cx q[17],q[23];
-rz(3.608333011035458) q[24];
-cx q[3],q[24];
-cx q[3],q[25];
-cx q[5],q[24];
-rz(3.608333011035458) q[24];
-cx q[5],q[24];
-cx q[5],q[33];
-cx q[24],q[54];
-rz(3.608333011035458) q[25];
-cx q[3],q[25];
-cx q[3],q[26];
-cx q[12],q[25];
-rz(3.608333011035458) q[25];
-cx q[12],q[25];
-cx q[12],q[31];
-rz(3.608333011035458) q[26];
-cx q[3],q[26];
-cx q[21],q[26];
-rz(3.608333011035458) q[26];
-cx q[21],q[26];
-rz(3.608333011035458) q[27];
-cx q[4],q[27];
-cx q[4],q[47];
-cx q[6],q[27];
-rz(3.608333011035458) q[27];
-cx q[6],q[27];
-cx q[6],q[69];
-rz(3.608333011035458) q[28];
-cx q[1],q[28];
-cx q[1],q[29];
-cx q[3],q[28];
-rz(3.608333011035458) q[28];
-cx q[3],q[28];
-rz(3.608333011035458) q[29];
-cx q[1],q[29];
-cx q[1],q[45];
-cx q[3],q[29];
-rz(3.608333011035458) q[29];
-cx q[3],q[29];
-cx q[3],q[30];
-rx(0.28639260550961093) q[29];
-rz(3.608333011035458) q[30];
-cx q[3],q[30];
-cx q[3],q[34];
-cx q[18],q[30];
-rz(3.608333011035458) q[30];
-cx q[18],q[30];
-rx(0.28639260550961093) q[18];
-rz(3.608333011035458) q[31];
-cx q[12],q[31];
-cx q[26],q[31];
-rz(3.608333011035458) q[31];
-cx q[26],q[31];
-cx q[26],q[105];
-rz(3.608333011035458) q[32];
-cx q[0],q[32];
-cx q[0],q[42];
-cx q[21],q[32];
-rz(3.608333011035458) q[32];
-cx q[21],q[32];
-rz(3.608333011035458) q[33];
-cx q[5],q[33];
-cx q[5],q[46];
-cx q[30],q[33];
-rz(3.608333011035458) q[33];
-cx q[30],q[33];
-rx(0.28639260550961093) q[33];
-rz(3.608333011035458) q[34];
-cx q[3],q[34];
-cx q[3],q[35];
-cx q[12],q[34];
-rz(3.608333011035458) q[34];
-cx q[12],q[34];
-rz(3.608333011035458) q[35];
-cx q[3],q[35];
-cx q[3],q[39];
-cx q[32],q[35];
-rz(3.608333011035458) q[35];
-cx q[32],q[35];
-cx q[35],q[130];
-rz(3.608333011035458) q[36];
-cx q[15],q[36];
-cx q[20],q[36];
-rz(3.608333011035458) q[36];
-cx q[20],q[36];
-cx q[36],q[94];
-rz(3.608333011035458) q[37];
-cx q[10],q[37];
-cx q[10],q[41];
-cx q[34],q[37];
-rz(3.608333011035458) q[37];
-cx q[34],q[37];
-rx(0.28639260550961093) q[34];
-cx q[37],q[85];
-rz(3.608333011035458) q[38];
-cx q[19],q[38];
-rx(0.28639260550961093) q[19];
-cx q[21],q[38];
-rz(3.608333011035458) q[38];
-cx q[21],q[38];
-rz(3.608333011035458) q[39];
-cx q[3],q[39];
-cx q[3],q[40];
-cx q[13],q[39];
-rz(3.608333011035458) q[39];
-cx q[13],q[39];
-cx q[13],q[56];
-rz(3.608333011035458) q[40];
-cx q[3],q[40];
-cx q[23],q[40];
-rz(3.608333011035458) q[40];
-cx q[23],q[40];
-cx q[40],q[119];
-rz(3.608333011035458) q[41];
-cx q[10],q[41];
-cx q[27],q[41];
-rz(3.608333011035458) q[41];
-cx q[27],q[41];
-cx q[27],q[72];
-cx q[41],q[67];
-rz(3.608333011035458) q[42];
-cx q[0],q[42];
-cx q[0],q[48];
-cx q[3],q[42];
-rz(3.608333011035458) q[42];
-cx q[3],q[42];
-cx q[3],q[43];
-cx q[42],q[78];
-rz(3.608333011035458) q[43];
-cx q[3],q[43];
-cx q[3],q[44];
-cx q[20],q[43];
-rz(3.608333011035458) q[43];
-cx q[20],q[43];
-cx q[20],q[121];
-rx(0.28639260550961093) q[43];
-rz(3.608333011035458) q[44];
-cx q[3],q[44];
-cx q[3],q[49];
-cx q[12],q[44];
-rz(3.608333011035458) q[44];
-cx q[12],q[44];
-rz(3.608333011035458) q[45];
-cx q[1],q[45];
-cx q[1],q[57];
-cx q[16],q[45];
-rz(3.608333011035458) q[45];
-cx q[16],q[45];
-cx q[16],q[59];
-rz(3.608333011035458) q[46];
-cx q[5],q[46];
-cx q[5],q[65];
-cx q[38],q[46];
-rz(3.608333011035458) q[46];
-cx q[38],q[46];
-rx(0.28639260550961093) q[38];
-cx q[46],q[120];
-rz(3.608333011035458) q[47];
-cx q[4],q[47];
-cx q[17],q[47];
-rz(3.608333011035458) q[47];
-cx q[17],q[47];
-cx q[17],q[53];
-rz(3.608333011035458) q[48];
-cx q[0],q[48];
-cx q[0],q[51];
-cx q[30],q[48];
-rz(3.608333011035458) q[48];
-cx q[30],q[48];
-rx(0.28639260550961093) q[48];
-rz(3.608333011035458) q[49];
-cx q[3],q[49];
-cx q[3],q[50];
-cx q[4],q[49];
-rz(3.608333011035458) q[49];
-cx q[4],q[49];
-cx q[4],q[61];
-rx(0.28639260550961093) q[49];
-rz(3.608333011035458) q[50];
-cx q[3],q[50];
-cx q[3],q[52];
-cx q[12],q[50];
-rz(3.608333011035458) q[50];
-cx q[12],q[50];
-cx q[12],q[63];
-rz(3.608333011035458) q[51];
-cx q[0],q[51];
-cx q[0],q[62];
-cx q[28],q[51];
-rz(3.608333011035458) q[51];
-cx q[28],q[51];
-rx(0.28639260550961093) q[51];
-rz(3.608333011035458) q[52];
-cx q[3],q[52];
-cx q[10],q[52];
-rz(3.608333011035458) q[52];
-cx q[10],q[52];
-rz(3.608333011035458) q[53];
-cx q[17],q[53];
-cx q[21],q[53];
-rz(3.608333011035458) q[53];
-cx q[21],q[53];
-rz(3.608333011035458) q[54];
-cx q[24],q[54];
-cx q[24],q[58];
-cx q[28],q[54];
-rz(3.608333011035458) q[54];
-cx q[28],q[54];
-rx(0.28639260550961093) q[54];
-rz(3.608333011035458) q[55];
-cx q[9],q[55];
-cx q[9],q[80];
-cx q[15],q[55];
-rz(3.608333011035458) q[55];
-cx q[15],q[55];
-rz(3.608333011035458) q[56];
-cx q[13],q[56];
-cx q[13],q[68];
-cx q[45],q[56];
-rz(3.608333011035458) q[56];
-cx q[45],q[56];
-rx(0.28639260550961093) q[45];
-rz(3.608333011035458) q[57];
-cx q[1],q[57];
-cx q[1],q[60];
-cx q[3],q[57];
-rz(3.608333011035458) q[57];
-cx q[3],q[57];
-cx q[3],q[70];
-rz(3.608333011035458) q[58];
-cx q[24],q[58];
-cx q[24],q[86];
-cx q[28],q[58];
-rz(3.608333011035458) q[58];
-cx q[28],q[58];
-cx q[28],q[87];
-rx(0.28639260550961093) q[58];
-rz(3.608333011035458) q[59];
-cx q[16],q[59];
-cx q[16],q[73];
-cx q[32],q[59];
-rz(3.608333011035458) q[59];
-cx q[32],q[59];
-rz(3.608333011035458) q[60];
-cx q[1],q[60];
-cx q[1],q[97];
-cx q[7],q[60];
-rz(3.608333011035458) q[60];
-cx q[7],q[60];
-rz(3.608333011035458) q[61];
-cx q[4],q[61];
-cx q[4],q[99];
-cx q[7],q[61];
-rz(3.608333011035458) q[61];
-cx q[7],q[61];
-rx(0.28639260550961093) q[61];
-rz(3.608333011035458) q[62];
-cx q[0],q[62];
-cx q[0],q[64];
-cx q[17],q[62];
-rz(3.608333011035458) q[62];
-cx q[17],q[62];
-rz(3.608333011035458) q[63];
-cx q[12],q[63];
-cx q[17],q[63];
-rz(3.608333011035458) q[63];
-cx q[17],q[63];
-cx q[17],q[66];
-rz(3.608333011035458) q[64];
-cx q[0],q[64];
-cx q[0],q[75];
-cx q[10],q[64];
-rz(3.608333011035458) q[64];
-cx q[10],q[64];
-cx q[10],q[98];
-rx(0.28639260550961093) q[64];
-rz(3.608333011035458) q[65];
-cx q[5],q[65];
-cx q[5],q[76];
-cx q[23],q[65];
-rz(3.608333011035458) q[65];
-cx q[23],q[65];
-rx(0.28639260550961093) q[23];
-rx(0.28639260550961093) q[65];
-rz(3.608333011035458) q[66];
-cx q[17],q[66];
-rx(0.28639260550961093) q[17];
-cx q[47],q[66];
-rz(3.608333011035458) q[66];
-cx q[47],q[66];
-rx(0.28639260550961093) q[66];
-rz(3.608333011035458) q[67];
-cx q[41],q[67];
-cx q[56],q[67];
-rz(3.608333011035458) q[67];
-cx q[56],q[67];
-cx q[56],q[74];
-rx(0.28639260550961093) q[67];
-rz(3.608333011035458) q[68];
-cx q[13],q[68];
-cx q[32],q[68];
-rz(3.608333011035458) q[68];
-cx q[32],q[68];
-rz(3.608333011035458) q[69];
-cx q[6],q[69];
-cx q[59],q[69];
-rz(3.608333011035458) q[69];
-cx q[59],q[69];
-rz(3.608333011035458) q[70];
-cx q[3],q[70];
-cx q[3],q[71];
-cx q[15],q[70];
-rz(3.608333011035458) q[70];
-cx q[15],q[70];
-cx q[70],q[84];
-rz(3.608333011035458) q[71];
-cx q[3],q[71];
-cx q[3],q[77];
-cx q[53],q[71];
-rz(3.608333011035458) q[71];
-cx q[53],q[71];
-rx(0.28639260550961093) q[71];
-rz(3.608333011035458) q[72];
-cx q[27],q[72];
-cx q[44],q[72];
-rz(3.608333011035458) q[72];
-cx q[44],q[72];
-rx(0.28639260550961093) q[44];
-rx(0.28639260550961093) q[72];
-rz(3.608333011035458) q[73];
-cx q[16],q[73];
-cx q[16],q[101];
-cx q[59],q[73];
-rz(3.608333011035458) q[73];
-cx q[59],q[73];
-rz(3.608333011035458) q[74];
-cx q[56],q[74];
-cx q[63],q[74];
-rz(3.608333011035458) q[74];
-cx q[63],q[74];
-cx q[63],q[122];
-rx(0.28639260550961093) q[74];
-rz(3.608333011035458) q[75];
-cx q[0],q[75];
-cx q[0],q[82];
-cx q[21],q[75];
-rz(3.608333011035458) q[75];
-cx q[21],q[75];
-cx q[21],q[81];
-rx(0.28639260550961093) q[75];
-rz(3.608333011035458) q[76];
-cx q[5],q[76];
-cx q[5],q[89];
-cx q[6],q[76];
-rz(3.608333011035458) q[76];
-cx q[6],q[76];
-cx q[6],q[79];
-rx(0.28639260550961093) q[76];
-rz(3.608333011035458) q[77];
-cx q[3],q[77];
-cx q[3],q[88];
-cx q[30],q[77];
-rz(3.608333011035458) q[77];
-cx q[30],q[77];
-rx(0.28639260550961093) q[30];
-rz(3.608333011035458) q[78];
-cx q[42],q[78];
-cx q[60],q[78];
-rz(3.608333011035458) q[78];
-cx q[60],q[78];
-rx(0.28639260550961093) q[78];
-rz(3.608333011035458) q[79];
-cx q[6],q[79];
-cx q[50],q[79];
-rz(3.608333011035458) q[79];
-cx q[50],q[79];
-rx(0.28639260550961093) q[79];
-rz(3.608333011035458) q[80];
-cx q[9],q[80];
-cx q[9],q[144];
-cx q[15],q[80];
-rz(3.608333011035458) q[80];
-cx q[15],q[80];
-cx q[15],q[90];
-rx(0.28639260550961093) q[80];
-rz(3.608333011035458) q[81];
-cx q[21],q[81];
-cx q[77],q[81];
-rz(3.608333011035458) q[81];
-cx q[77],q[81];
-rx(0.28639260550961093) q[77];
-rz(3.608333011035458) q[82];
-cx q[0],q[82];
-cx q[0],q[91];
-cx q[56],q[82];
-rz(3.608333011035458) q[82];
-cx q[56],q[82];
-cx q[56],q[96];
-rx(0.28639260550961093) q[82];
-rz(3.608333011035458) q[83];
-cx q[8],q[83];
-rx(0.28639260550961093) q[8];
-cx q[68],q[83];
-rz(3.608333011035458) q[83];
-cx q[68],q[83];
-rx(0.28639260550961093) q[68];
-rx(0.28639260550961093) q[83];
-rz(3.608333011035458) q[84];
-cx q[70],q[84];
-rx(0.28639260550961093) q[70];
-cx q[73],q[84];
-rz(3.608333011035458) q[84];
-cx q[73],q[84];
-rx(0.28639260550961093) q[73];
-rx(0.28639260550961093) q[84];
-rz(3.608333011035458) q[85];
-cx q[37],q[85];
-cx q[59],q[85];
-rz(3.608333011035458) q[85];
-cx q[59],q[85];
-rx(0.28639260550961093) q[85];
-rz(3.608333011035458) q[86];
-cx q[24],q[86];
-cx q[53],q[86];
-rz(3.608333011035458) q[86];
-cx q[53],q[86];
-cx q[53],q[124];
-rx(0.28639260550961093) q[86];
-rz(3.608333011035458) q[87];
-cx q[28],q[87];
-cx q[32],q[87];
-rz(3.608333011035458) q[87];
-cx q[32],q[87];
-rx(0.28639260550961093) q[87];
-rz(3.608333011035458) q[88];
-cx q[3],q[88];
-cx q[3],q[100];
-cx q[60],q[88];
-rz(3.608333011035458) q[88];
-cx q[60],q[88];
-cx q[60],q[138];
-rx(0.28639260550961093) q[88];
-rz(3.608333011035458) q[89];
-cx q[5],q[89];
-cx q[5],q[95];
-rz(3.608333011035458) q[90];
-cx q[15],q[90];
-cx q[15],q[92];
-cx q[27],q[90];
-rz(3.608333011035458) q[90];
-cx q[27],q[90];
-rx(0.28639260550961093) q[90];
-rz(3.608333011035458) q[91];
-cx q[0],q[91];
-cx q[0],q[93];
-cx q[6],q[91];
-rz(3.608333011035458) q[91];
-cx q[6],q[91];
-rx(0.28639260550961093) q[6];
-rz(3.608333011035458) q[92];
-cx q[15],q[92];
-cx q[15],q[108];
-cx q[89],q[92];
-rz(3.608333011035458) q[92];
-cx q[89],q[92];
-rz(3.608333011035458) q[93];
-cx q[0],q[93];
-cx q[0],q[123];
-cx q[32],q[93];
-rz(3.608333011035458) q[93];
-cx q[32],q[93];
-rx(0.28639260550961093) q[93];
-rz(3.608333011035458) q[94];
-cx q[36],q[94];
-cx q[55],q[94];
-rz(3.608333011035458) q[94];
-cx q[55],q[94];
-rx(0.28639260550961093) q[55];
-rz(3.608333011035458) q[95];
-cx q[5],q[95];
-cx q[5],q[106];
-cx q[27],q[95];
-rz(3.608333011035458) q[95];
-cx q[27],q[95];
-rx(0.28639260550961093) q[27];
-rx(0.28639260550961093) q[95];
-rz(3.608333011035458) q[96];
-cx q[56],q[96];
-rx(0.28639260550961093) q[56];
-cx q[92],q[96];
-rz(3.608333011035458) q[96];
-cx q[92],q[96];
-rx(0.28639260550961093) q[96];
-rz(3.608333011035458) q[97];
-cx q[1],q[97];
-cx q[1],q[113];
-cx q[7],q[97];
-rz(3.608333011035458) q[97];
-cx q[7],q[97];
-cx q[7],q[104];
-rz(3.608333011035458) q[98];
-cx q[10],q[98];
-rx(0.28639260550961093) q[10];
-cx q[21],q[98];
-rz(3.608333011035458) q[98];
-cx q[21],q[98];
-rx(0.28639260550961093) q[98];
-rz(3.608333011035458) q[99];
-cx q[4],q[99];
-cx q[41],q[99];
-rz(3.608333011035458) q[99];
-cx q[41],q[99];
-rx(0.28639260550961093) q[41];
-rx(0.28639260550961093) q[99];
-rz(3.608333011035458) q[100];
-cx q[3],q[100];
-cx q[3],q[102];
-cx q[25],q[100];
-rz(3.608333011035458) q[100];
-cx q[25],q[100];
-rx(0.28639260550961093) q[25];
-rx(0.28639260550961093) q[100];
-rz(3.608333011035458) q[101];
-cx q[16],q[101];
-cx q[16],q[103];
-cx q[50],q[101];
-rz(3.608333011035458) q[101];
-cx q[50],q[101];
-cx q[50],q[129];
-rx(0.28639260550961093) q[101];
-rz(3.608333011035458) q[102];
-cx q[3],q[102];
-cx q[3],q[107];
-cx q[4],q[102];
-rz(3.608333011035458) q[102];
-cx q[4],q[102];
-cx q[4],q[127];
-rx(0.28639260550961093) q[102];
-rz(3.608333011035458) q[103];
-cx q[16],q[103];
-rx(0.28639260550961093) q[16];
-cx q[57],q[103];
-rz(3.608333011035458) q[103];
-cx q[57],q[103];
-rx(0.28639260550961093) q[57];
-rx(0.28639260550961093) q[103];
-rz(3.608333011035458) q[104];
-cx q[7],q[104];
-cx q[7],q[133];
-cx q[13],q[104];
-rz(3.608333011035458) q[104];
-cx q[13],q[104];
-cx q[104],q[114];
-rz(3.608333011035458) q[105];
-cx q[26],q[105];
-cx q[26],q[117];
-cx q[28],q[105];
-rz(3.608333011035458) q[105];
-cx q[28],q[105];
-cx q[28],q[116];
-rx(0.28639260550961093) q[105];
-rz(3.608333011035458) q[106];
-cx q[5],q[106];
-cx q[5],q[109];
-cx q[36],q[106];
-rz(3.608333011035458) q[106];
-cx q[36],q[106];
-rx(0.28639260550961093) q[106];
-rz(3.608333011035458) q[107];
-cx q[3],q[107];
-cx q[3],q[110];
-cx q[31],q[107];
-rz(3.608333011035458) q[107];
-cx q[31],q[107];
-rx(0.28639260550961093) q[107];
-rz(3.608333011035458) q[108];
-cx q[15],q[108];
-cx q[15],q[115];
-cx q[31],q[108];
-rz(3.608333011035458) q[108];
-cx q[31],q[108];
-rx(0.28639260550961093) q[31];
-rx(0.28639260550961093) q[108];
-rz(3.608333011035458) q[109];
-cx q[5],q[109];
-cx q[5],q[118];
-cx q[39],q[109];
-rz(3.608333011035458) q[109];
-cx q[39],q[109];
-rx(0.28639260550961093) q[39];
-rz(3.608333011035458) q[110];
-cx q[3],q[110];
-cx q[3],q[111];
-cx q[24],q[110];
-rz(3.608333011035458) q[110];
-cx q[24],q[110];
-cx q[24],q[137];
-rz(3.608333011035458) q[111];
-cx q[3],q[111];
-cx q[21],q[111];
-rz(3.608333011035458) q[111];
-cx q[21],q[111];
-cx q[21],q[112];
-rx(0.28639260550961093) q[111];
-rz(3.608333011035458) q[112];
-cx q[21],q[112];
-rx(0.28639260550961093) q[21];
-cx q[36],q[112];
-rz(3.608333011035458) q[112];
-cx q[36],q[112];
-rx(0.28639260550961093) q[36];
-rx(0.28639260550961093) q[112];
-rz(3.608333011035458) q[113];
-cx q[1],q[113];
-rx(0.28639260550961093) q[1];
-cx q[3],q[113];
-rz(3.608333011035458) q[113];
-cx q[3],q[113];
-cx q[3],q[125];
-rx(0.28639260550961093) q[113];
-rz(3.608333011035458) q[114];
-cx q[104],q[114];
-cx q[110],q[114];
-rz(3.608333011035458) q[114];
-cx q[110],q[114];
-rx(0.28639260550961093) q[110];
-rx(0.28639260550961093) q[114];
-rz(3.608333011035458) q[115];
-cx q[15],q[115];
-cx q[92],q[115];
-rz(3.608333011035458) q[115];
-cx q[92],q[115];
-rx(0.28639260550961093) q[115];
-rz(3.608333011035458) q[116];
-cx q[28],q[116];
-rx(0.28639260550961093) q[28];
-cx q[42],q[116];
-rz(3.608333011035458) q[116];
-cx q[42],q[116];
-rx(0.28639260550961093) q[42];
-rx(0.28639260550961093) q[116];
-rz(3.608333011035458) q[117];
-cx q[26],q[117];
-rx(0.28639260550961093) q[26];
-cx q[32],q[117];
-rz(3.608333011035458) q[117];
-cx q[32],q[117];
-cx q[32],q[131];
-rx(0.28639260550961093) q[117];
-rz(3.608333011035458) q[118];
-cx q[5],q[118];
-cx q[5],q[139];
-cx q[15],q[118];
-rz(3.608333011035458) q[118];
-cx q[15],q[118];
-rx(0.28639260550961093) q[15];
-rz(3.608333011035458) q[119];
-cx q[40],q[119];
-rx(0.28639260550961093) q[40];
-cx q[69],q[119];
-rz(3.608333011035458) q[119];
-cx q[69],q[119];
-rx(0.28639260550961093) q[69];
-rz(3.608333011035458) q[120];
-cx q[46],q[120];
-rx(0.28639260550961093) q[46];
-cx q[94],q[120];
-rz(3.608333011035458) q[120];
-cx q[94],q[120];
-rx(0.28639260550961093) q[94];
-rx(0.28639260550961093) q[120];
-rz(3.608333011035458) q[121];
-cx q[20],q[121];
-rx(0.28639260550961093) q[20];
-cx q[104],q[121];
-rz(3.608333011035458) q[121];
-cx q[104],q[121];
-rx(0.28639260550961093) q[104];
-rz(3.608333011035458) q[122];
-cx q[63],q[122];
-rx(0.28639260550961093) q[63];
-cx q[81],q[122];
-rz(3.608333011035458) q[122];
-cx q[81],q[122];
-rx(0.28639260550961093) q[122];
-rz(3.608333011035458) q[123];
-cx q[0],q[123];
-cx q[0],q[126];
-cx q[52],q[123];
-rz(3.608333011035458) q[123];
-cx q[52],q[123];
-rx(0.28639260550961093) q[52];
-rz(3.608333011035458) q[124];
-cx q[53],q[124];
-rx(0.28639260550961093) q[53];
-cx q[81],q[124];
-rz(3.608333011035458) q[124];
-cx q[81],q[124];
-rx(0.28639260550961093) q[81];
-rx(0.28639260550961093) q[124];
-rz(3.608333011035458) q[125];
-cx q[3],q[125];
-cx q[3],q[132];
-cx q[109],q[125];
-rz(3.608333011035458) q[125];
-cx q[109],q[125];
-rx(0.28639260550961093) q[125];
-rz(3.608333011035458) q[126];
-cx q[0],q[126];
-cx q[0],q[135];
-cx q[12],q[126];
-rz(3.608333011035458) q[126];
-cx q[12],q[126];
-cx q[12],q[141];
-rx(0.28639260550961093) q[126];
-rz(3.608333011035458) q[127];
-cx q[4],q[127];
-cx q[62],q[127];
-rz(3.608333011035458) q[127];
-cx q[62],q[127];
-cx q[62],q[128];
-rx(0.28639260550961093) q[127];
-rz(3.608333011035458) q[128];
-cx q[62],q[128];
-rx(0.28639260550961093) q[62];
-cx q[109],q[128];
-rz(3.608333011035458) q[128];
-cx q[109],q[128];
-rx(0.28639260550961093) q[128];
-rz(3.608333011035458) q[129];
-cx q[50],q[129];
-cx q[91],q[129];
-rz(3.608333011035458) q[129];
-cx q[91],q[129];
-rx(0.28639260550961093) q[91];
-rx(0.28639260550961093) q[129];
-rz(3.608333011035458) q[130];
-cx q[35],q[130];
-rx(0.28639260550961093) q[35];
-cx q[109],q[130];
-rz(3.608333011035458) q[130];
-cx q[109],q[130];
-rx(0.28639260550961093) q[109];
-rx(0.28639260550961093) q[130];
-rz(3.608333011035458) q[131];
-cx q[32],q[131];
-cx q[123],q[131];
-rz(3.608333011035458) q[131];
-cx q[123],q[131];
-rx(0.28639260550961093) q[123];
-rx(0.28639260550961093) q[131];
-rz(3.608333011035458) q[132];
-cx q[3],q[132];
-cx q[3],q[134];
-cx q[37],q[132];
-rz(3.608333011035458) q[132];
-cx q[37],q[132];
-rx(0.28639260550961093) q[37];
-rx(0.28639260550961093) q[132];
-rz(3.608333011035458) q[133];
-cx q[7],q[133];
-rx(0.28639260550961093) q[7];
-cx q[89],q[133];
-rz(3.608333011035458) q[133];
-cx q[89],q[133];
-rx(0.28639260550961093) q[89];
-rz(3.608333011035458) q[134];
-cx q[3],q[134];
-cx q[3],q[136];
-cx q[47],q[134];
-rz(3.608333011035458) q[134];
-cx q[47],q[134];
-rx(0.28639260550961093) q[47];
-rx(0.28639260550961093) q[134];
-rz(3.608333011035458) q[135];
-cx q[0],q[135];
-cx q[0],q[140];
-cx q[13],q[135];
-rz(3.608333011035458) q[135];
-cx q[13],q[135];
-rx(0.28639260550961093) q[13];
-rx(0.28639260550961093) q[135];
-rz(3.608333011035458) q[136];
-cx q[3],q[136];
-cx q[3],q[145];
-cx q[92],q[136];
-rz(3.608333011035458) q[136];
-cx q[92],q[136];
-rx(0.28639260550961093) q[92];
-rx(0.28639260550961093) q[136];
-rz(3.608333011035458) q[137];
-cx q[24],q[137];
-cx q[133],q[137];
-rz(3.608333011035458) q[137];
-cx q[133],q[137];
-rx(0.28639260550961093) q[137];
-rz(3.608333011035458) q[138];
-cx q[60],q[138];
-rx(0.28639260550961093) q[60];
-cx q[119],q[138];
-rz(3.608333011035458) q[138];
-cx q[119],q[138];
-rx(0.28639260550961093) q[119];
-rx(0.28639260550961093) q[138];
-rz(3.608333011035458) q[139];
-cx q[5],q[139];
-cx q[133],q[139];
-rz(3.608333011035458) q[139];
-cx q[133],q[139];
-rx(0.28639260550961093) q[133];
-rx(0.28639260550961093) q[139];
-rz(3.608333011035458) q[140];
-cx q[0],q[140];
-cx q[0],q[146];
-cx q[32],q[140];
-rz(3.608333011035458) q[140];
-cx q[32],q[140];
-rx(0.28639260550961093) q[32];
-rx(0.28639260550961093) q[140];
-rz(3.608333011035458) q[141];
-cx q[12],q[141];
-cx q[12],q[143];
-cx q[121],q[141];
-rz(3.608333011035458) q[141];
-cx q[121],q[141];
-rx(0.28639260550961093) q[121];
-rx(0.28639260550961093) q[141];
-cx q[142],q[148];
-rz(3.608333011035458) q[143];
-cx q[12],q[143];
-rx(0.28639260550961093) q[12];
-cx q[50],q[143];
-rz(3.608333011035458) q[143];
-cx q[50],q[143];
-rx(0.28639260550961093) q[50];
-rx(0.28639260550961093) q[143];
-rz(3.608333011035458) q[144];
-cx q[9],q[144];
-rx(0.28639260550961093) q[9];
-cx q[59],q[144];
-rz(3.608333011035458) q[144];
-cx q[59],q[144];
-rx(0.28639260550961093) q[59];
-rx(0.28639260550961093) q[144];
-rz(3.608333011035458) q[145];
-cx q[3],q[145];
-cx q[3],q[147];
-cx q[97],q[145];
-rz(3.608333011035458) q[145];
-cx q[97],q[145];
-rx(0.28639260550961093) q[97];
-rx(0.28639260550961093) q[145];
-rz(3.608333011035458) q[146];
-cx q[0],q[146];
-rx(0.28639260550961093) q[0];
-cx q[4],q[146];
-rz(3.608333011035458) q[146];
-cx q[4],q[146];
-rx(0.28639260550961093) q[4];
-rx(0.28639260550961093) q[146];
-rz(3.608333011035458) q[147];
-cx q[3],q[147];
-cx q[118],q[147];
-rz(3.608333011035458) q[147];
-cx q[118],q[147];
-rx(0.28639260550961093) q[118];
-rx(0.28639260550961093) q[147];
-rz(5.027700449798137) q[148];
-cx q[142],q[148];
-rx(6.041321886121141) q[142];
-cx q[5],q[142];
-rz(3.608333011035458) q[142];
-cx q[5],q[142];
-rx(0.28639260550961093) q[5];
-cx q[24],q[142];
-rz(3.608333011035458) q[142];
-cx q[24],q[142];
-rx(0.28639260550961093) q[24];
-rx(6.041321886121141) q[148];
-cx q[3],q[148];
-rz(3.608333011035458) q[148];
-cx q[3],q[148];
-rx(0.28639260550961093) q[3];
-cx q[142],q[148];
-rz(3.608333011035458) q[148];
-cx q[142],q[148];
-rx(0.28639260550961093) q[142];
-rx(0.28639260550961093) q[148];
\ No newline at end of file
@@ -1,289 +0,0 @@
-OPENQASM 2.0;
-include "qelib1.inc";
-qreg q[14];
-ry(pi/2) q[0];
-rx(pi) q[0];
-ry(pi/2) q[1];
-rx(pi) q[1];
-cx q[0],q[1];
-rz(5.236794250422649) q[1];
-cx q[0],q[1];
-ry(pi/2) q[2];
-rx(pi) q[2];
-cx q[0],q[2];
-rz(5.236794250422649) q[2];
-cx q[0],q[2];
-rx(8.151588555120023) q[2];
-ry(pi/2) q[3];
-rx(pi) q[3];
-cx q[0],q[3];
-rz(5.236794250422649) q[3];
-cx q[0],q[3];
-rx(8.151588555120023) q[0];
-cx q[1],q[3];
-rz(5.236794250422649) q[3];
-cx q[1],q[3];
-ry(pi/2) q[4];
-rx(pi) q[4];
-cx q[1],q[4];
-rz(5.236794250422649) q[4];
-cx q[1],q[4];
-cx q[3],q[4];
-rz(5.236794250422649) q[4];
-cx q[3],q[4];
-ry(pi/2) q[5];
-rx(pi) q[5];
-cx q[1],q[5];
-rz(5.236794250422649) q[5];
-cx q[1],q[5];
-cx q[3],q[5];
-rz(5.236794250422649) q[5];
-cx q[3],q[5];
-ry(pi/2) q[6];
-rx(pi) q[6];
-cx q[4],q[6];
-rz(5.236794250422649) q[6];
-cx q[4],q[6];
-cx q[5],q[6];
-rz(5.236794250422649) q[6];
-cx q[5],q[6];
-ry(pi/2) q[7];
-rx(pi) q[7];
-cx q[3],q[7];
-rz(5.236794250422649) q[7];
-cx q[3],q[7];
-cx q[4],q[7];
-rz(5.236794250422649) q[7];
-cx q[4],q[7];
-rx(8.151588555120023) q[7];
-ry(pi/2) q[8];
-rx(pi) q[8];
-cx q[3],q[8];
-rz(5.236794250422649) q[8];
-cx q[3],q[8];
-cx q[5],q[8];
-rz(5.236794250422649) q[8];
-cx q[5],q[8];
-rx(8.151588555120023) q[8];
-ry(pi/2) q[9];
-rx(pi) q[9];
-cx q[1],q[9];
-rz(5.236794250422649) q[9];
-cx q[1],q[9];
-rx(8.151588555120023) q[1];
-cx q[0],q[1];
-rz(3.554604959073194) q[1];
-cx q[0],q[1];
-cx q[0],q[2];
-rz(3.554604959073194) q[2];
-cx q[0],q[2];
-rx(9.033769362786488) q[2];
-cx q[3],q[9];
-rz(5.236794250422649) q[9];
-cx q[3],q[9];
-rx(8.151588555120023) q[9];
-ry(pi/2) q[10];
-rx(pi) q[10];
-cx q[4],q[10];
-rz(5.236794250422649) q[10];
-cx q[4],q[10];
-cx q[6],q[10];
-rz(5.236794250422649) q[10];
-cx q[6],q[10];
-rx(8.151588555120023) q[10];
-ry(pi/2) q[11];
-rx(pi) q[11];
-cx q[5],q[11];
-rz(5.236794250422649) q[11];
-cx q[5],q[11];
-cx q[6],q[11];
-rz(5.236794250422649) q[11];
-cx q[6],q[11];
-rx(8.151588555120023) q[6];
-rx(8.151588555120023) q[11];
-ry(pi/2) q[12];
-rx(pi) q[12];
-cx q[3],q[12];
-rz(5.236794250422649) q[12];
-cx q[3],q[12];
-rx(8.151588555120023) q[3];
-cx q[0],q[3];
-rz(3.554604959073194) q[3];
-cx q[0],q[3];
-rx(9.033769362786488) q[0];
-cx q[1],q[3];
-rz(3.554604959073194) q[3];
-cx q[1],q[3];
-cx q[5],q[12];
-rz(5.236794250422649) q[12];
-cx q[5],q[12];
-rx(8.151588555120023) q[12];
-ry(pi/2) q[13];
-rx(pi) q[13];
-cx q[4],q[13];
-rz(5.236794250422649) q[13];
-cx q[4],q[13];
-rx(8.151588555120023) q[4];
-cx q[1],q[4];
-rz(3.554604959073194) q[4];
-cx q[1],q[4];
-cx q[3],q[4];
-rz(3.554604959073194) q[4];
-cx q[3],q[4];
-cx q[4],q[6];
-cx q[5],q[13];
-rz(3.554604959073194) q[6];
-cx q[4],q[6];
-rz(5.236794250422649) q[13];
-cx q[5],q[13];
-rx(8.151588555120023) q[5];
-cx q[1],q[5];
-rz(3.554604959073194) q[5];
-cx q[1],q[5];
-cx q[1],q[9];
-cx q[3],q[5];
-rz(3.554604959073194) q[5];
-cx q[3],q[5];
-cx q[3],q[7];
-cx q[5],q[6];
-rz(3.554604959073194) q[6];
-cx q[5],q[6];
-rz(3.554604959073194) q[7];
-cx q[3],q[7];
-cx q[3],q[8];
-cx q[4],q[7];
-rz(3.554604959073194) q[7];
-cx q[4],q[7];
-cx q[4],q[10];
-rx(9.033769362786488) q[7];
-rz(3.554604959073194) q[8];
-cx q[3],q[8];
-cx q[5],q[8];
-rz(3.554604959073194) q[8];
-cx q[5],q[8];
-cx q[5],q[11];
-rx(9.033769362786488) q[8];
-rz(3.554604959073194) q[9];
-cx q[1],q[9];
-rx(9.033769362786488) q[1];
-cx q[0],q[1];
-rz(1.458637782748272) q[1];
-cx q[0],q[1];
-cx q[0],q[2];
-rz(1.458637782748272) q[2];
-cx q[0],q[2];
-rx(9.925213709229071) q[2];
-cx q[3],q[9];
-rz(3.554604959073194) q[9];
-cx q[3],q[9];
-cx q[3],q[12];
-rx(9.033769362786488) q[9];
-rz(3.554604959073194) q[10];
-cx q[4],q[10];
-cx q[6],q[10];
-rz(3.554604959073194) q[10];
-cx q[6],q[10];
-rx(9.033769362786488) q[10];
-rz(3.554604959073194) q[11];
-cx q[5],q[11];
-cx q[6],q[11];
-rz(3.554604959073194) q[11];
-cx q[6],q[11];
-rx(9.033769362786488) q[6];
-rx(9.033769362786488) q[11];
-rz(3.554604959073194) q[12];
-cx q[3],q[12];
-rx(9.033769362786488) q[3];
-cx q[0],q[3];
-rz(1.458637782748272) q[3];
-cx q[0],q[3];
-rx(9.925213709229071) q[0];
-cx q[1],q[3];
-rz(1.458637782748272) q[3];
-cx q[1],q[3];
-cx q[5],q[12];
-rz(3.554604959073194) q[12];
-cx q[5],q[12];
-rx(9.033769362786488) q[12];
-rx(8.151588555120023) q[13];
-cx q[4],q[13];
-rz(3.554604959073194) q[13];
-cx q[4],q[13];
-rx(9.033769362786488) q[4];
-cx q[1],q[4];
-rz(1.458637782748272) q[4];
-cx q[1],q[4];
-cx q[3],q[4];
-rz(1.458637782748272) q[4];
-cx q[3],q[4];
-cx q[4],q[6];
-cx q[5],q[13];
-rz(1.458637782748272) q[6];
-cx q[4],q[6];
-rz(3.554604959073194) q[13];
-cx q[5],q[13];
-rx(9.033769362786488) q[5];
-cx q[1],q[5];
-rz(1.458637782748272) q[5];
-cx q[1],q[5];
-cx q[1],q[9];
-cx q[3],q[5];
-rz(1.458637782748272) q[5];
-cx q[3],q[5];
-cx q[3],q[7];
-cx q[5],q[6];
-rz(1.458637782748272) q[6];
-cx q[5],q[6];
-rz(1.458637782748272) q[7];
-cx q[3],q[7];
-cx q[3],q[8];
-cx q[4],q[7];
-rz(1.458637782748272) q[7];
-cx q[4],q[7];
-cx q[4],q[10];
-rx(9.925213709229071) q[7];
-rz(1.458637782748272) q[8];
-cx q[3],q[8];
-cx q[5],q[8];
-rz(1.458637782748272) q[8];
-cx q[5],q[8];
-cx q[5],q[11];
-rx(9.925213709229071) q[8];
-rz(1.458637782748272) q[9];
-cx q[1],q[9];
-rx(9.925213709229071) q[1];
-cx q[3],q[9];
-rz(1.458637782748272) q[9];
-cx q[3],q[9];
-cx q[3],q[12];
-rx(9.925213709229071) q[9];
-rz(1.458637782748272) q[10];
-cx q[4],q[10];
-cx q[6],q[10];
-rz(1.458637782748272) q[10];
-cx q[6],q[10];
-rx(9.925213709229071) q[10];
-rz(1.458637782748272) q[11];
-cx q[5],q[11];
-cx q[6],q[11];
-rz(1.458637782748272) q[11];
-cx q[6],q[11];
-rx(9.925213709229071) q[6];
-rx(9.925213709229071) q[11];
-rz(1.458637782748272) q[12];
-cx q[3],q[12];
-rx(9.925213709229071) q[3];
-cx q[5],q[12];
-rz(1.458637782748272) q[12];
-cx q[5],q[12];
-rx(9.925213709229071) q[12];
-rx(9.033769362786488) q[13];
-cx q[4],q[13];
-rz(1.458637782748272) q[13];
-cx q[4],q[13];
-rx(9.925213709229071) q[4];
-cx q[5],q[13];
-rz(1.458637782748272) q[13];
-cx q[5],q[13];
-rx(9.925213709229071) q[5];
-rx(9.925213709229071) q[13];
\ No newline at end of file
@@ -1,312 +0,0 @@
-OPENQASM 2.0;
-include "qelib1.inc";
-qreg q[15];
-ry(pi/2) q[0];
-rx(pi) q[0];
-ry(pi/2) q[1];
-rx(pi) q[1];
-cx q[0],q[1];
-rz(0.587576222689545) q[1];
-cx q[0],q[1];
-ry(pi/2) q[2];
-rx(pi) q[2];
-cx q[0],q[2];
-rz(0.587576222689545) q[2];
-cx q[0],q[2];
-rx(6.318902436175149) q[2];
-ry(pi/2) q[3];
-rx(pi) q[3];
-cx q[0],q[3];
-rz(0.587576222689545) q[3];
-cx q[0],q[3];
-rx(6.318902436175149) q[0];
-cx q[1],q[3];
-rz(0.587576222689545) q[3];
-cx q[1],q[3];
-ry(pi/2) q[4];
-rx(pi) q[4];
-cx q[1],q[4];
-rz(0.587576222689545) q[4];
-cx q[1],q[4];
-cx q[3],q[4];
-rz(0.587576222689545) q[4];
-cx q[3],q[4];
-ry(pi/2) q[5];
-rx(pi) q[5];
-cx q[1],q[5];
-rz(0.587576222689545) q[5];
-cx q[1],q[5];
-cx q[3],q[5];
-rz(0.587576222689545) q[5];
-cx q[3],q[5];
-ry(pi/2) q[6];
-rx(pi) q[6];
-cx q[4],q[6];
-rz(0.587576222689545) q[6];
-cx q[4],q[6];
-cx q[5],q[6];
-rz(0.587576222689545) q[6];
-cx q[5],q[6];
-ry(pi/2) q[7];
-rx(pi) q[7];
-cx q[3],q[7];
-rz(0.587576222689545) q[7];
-cx q[3],q[7];
-cx q[4],q[7];
-rz(0.587576222689545) q[7];
-cx q[4],q[7];
-rx(6.318902436175149) q[7];
-ry(pi/2) q[8];
-rx(pi) q[8];
-cx q[3],q[8];
-rz(0.587576222689545) q[8];
-cx q[3],q[8];
-cx q[5],q[8];
-rz(0.587576222689545) q[8];
-cx q[5],q[8];
-rx(6.318902436175149) q[8];
-ry(pi/2) q[9];
-rx(pi) q[9];
-cx q[1],q[9];
-rz(0.587576222689545) q[9];
-cx q[1],q[9];
-rx(6.318902436175149) q[1];
-cx q[0],q[1];
-rz(0.62600514577917) q[1];
-cx q[0],q[1];
-cx q[0],q[2];
-rz(0.62600514577917) q[2];
-cx q[0],q[2];
-rx(8.298834288584436) q[2];
-cx q[3],q[9];
-rz(0.587576222689545) q[9];
-cx q[3],q[9];
-rx(6.318902436175149) q[9];
-ry(pi/2) q[10];
-rx(pi) q[10];
-cx q[4],q[10];
-rz(0.587576222689545) q[10];
-cx q[4],q[10];
-cx q[6],q[10];
-rz(0.587576222689545) q[10];
-cx q[6],q[10];
-rx(6.318902436175149) q[10];
-ry(pi/2) q[11];
-rx(pi) q[11];
-cx q[5],q[11];
-rz(0.587576222689545) q[11];
-cx q[5],q[11];
-cx q[6],q[11];
-rz(0.587576222689545) q[11];
-cx q[6],q[11];
-rx(6.318902436175149) q[6];
-rx(6.318902436175149) q[11];
-ry(pi/2) q[12];
-rx(pi) q[12];
-cx q[3],q[12];
-rz(0.587576222689545) q[12];
-cx q[3],q[12];
-cx q[5],q[12];
-rz(0.587576222689545) q[12];
-cx q[5],q[12];
-rx(6.318902436175149) q[12];
-ry(pi/2) q[13];
-rx(pi) q[13];
-cx q[4],q[13];
-rz(0.587576222689545) q[13];
-cx q[4],q[13];
-cx q[5],q[13];
-rz(0.587576222689545) q[13];
-cx q[5],q[13];
-rx(6.318902436175149) q[5];
-rx(6.318902436175149) q[13];
-ry(pi/2) q[14];
-rx(pi) q[14];
-cx q[3],q[14];
-rz(0.587576222689545) q[14];
-cx q[3],q[14];
-rx(6.318902436175149) q[3];
-cx q[0],q[3];
-rz(0.62600514577917) q[3];
-cx q[0],q[3];
-rx(8.298834288584436) q[0];
-cx q[1],q[3];
-rz(0.62600514577917) q[3];
-cx q[1],q[3];
-cx q[4],q[14];
-rz(0.587576222689545) q[14];
-cx q[4],q[14];
-rx(6.318902436175149) q[4];
-cx q[1],q[4];
-rz(0.62600514577917) q[4];
-cx q[1],q[4];
-cx q[1],q[5];
-cx q[3],q[4];
-rz(0.62600514577917) q[4];
-cx q[3],q[4];
-cx q[4],q[6];
-rz(0.62600514577917) q[5];
-cx q[1],q[5];
-cx q[1],q[9];
-cx q[3],q[5];
-rz(0.62600514577917) q[5];
-cx q[3],q[5];
-cx q[3],q[7];
-rz(0.62600514577917) q[6];
-cx q[4],q[6];
-cx q[5],q[6];
-rz(0.62600514577917) q[6];
-cx q[5],q[6];
-rz(0.62600514577917) q[7];
-cx q[3],q[7];
-cx q[3],q[8];
-cx q[4],q[7];
-rz(0.62600514577917) q[7];
-cx q[4],q[7];
-cx q[4],q[10];
-rx(8.298834288584436) q[7];
-rz(0.62600514577917) q[8];
-cx q[3],q[8];
-cx q[5],q[8];
-rz(0.62600514577917) q[8];
-cx q[5],q[8];
-cx q[5],q[11];
-rx(8.298834288584436) q[8];
-rz(0.62600514577917) q[9];
-cx q[1],q[9];
-rx(8.298834288584436) q[1];
-cx q[0],q[1];
-rz(4.184574547513163) q[1];
-cx q[0],q[1];
-cx q[0],q[2];
-rz(4.184574547513163) q[2];
-cx q[0],q[2];
-rx(4.449333291928791) q[2];
-cx q[3],q[9];
-rz(0.62600514577917) q[9];
-cx q[3],q[9];
-cx q[3],q[12];
-rx(8.298834288584436) q[9];
-rz(0.62600514577917) q[10];
-cx q[4],q[10];
-cx q[4],q[13];
-cx q[6],q[10];
-rz(0.62600514577917) q[10];
-cx q[6],q[10];
-rx(8.298834288584436) q[10];
-rz(0.62600514577917) q[11];
-cx q[5],q[11];
-cx q[6],q[11];
-rz(0.62600514577917) q[11];
-cx q[6],q[11];
-rx(8.298834288584436) q[6];
-rx(8.298834288584436) q[11];
-rz(0.62600514577917) q[12];
-cx q[3],q[12];
-cx q[5],q[12];
-rz(0.62600514577917) q[12];
-cx q[5],q[12];
-rx(8.298834288584436) q[12];
-rz(0.62600514577917) q[13];
-cx q[4],q[13];
-cx q[5],q[13];
-rz(0.62600514577917) q[13];
-cx q[5],q[13];
-rx(8.298834288584436) q[5];
-rx(8.298834288584436) q[13];
-rx(6.318902436175149) q[14];
-cx q[3],q[14];
-rz(0.62600514577917) q[14];
-cx q[3],q[14];
-rx(8.298834288584436) q[3];
-cx q[0],q[3];
-rz(4.184574547513163) q[3];
-cx q[0],q[3];
-rx(4.449333291928791) q[0];
-cx q[1],q[3];
-rz(4.184574547513163) q[3];
-cx q[1],q[3];
-cx q[4],q[14];
-rz(0.62600514577917) q[14];
-cx q[4],q[14];
-rx(8.298834288584436) q[4];
-cx q[1],q[4];
-rz(4.184574547513163) q[4];
-cx q[1],q[4];
-cx q[1],q[5];
-cx q[3],q[4];
-rz(4.184574547513163) q[4];
-cx q[3],q[4];
-cx q[4],q[6];
-rz(4.184574547513163) q[5];
-cx q[1],q[5];
-cx q[1],q[9];
-cx q[3],q[5];
-rz(4.184574547513163) q[5];
-cx q[3],q[5];
-cx q[3],q[7];
-rz(4.184574547513163) q[6];
-cx q[4],q[6];
-cx q[5],q[6];
-rz(4.184574547513163) q[6];
-cx q[5],q[6];
-rz(4.184574547513163) q[7];
-cx q[3],q[7];
-cx q[3],q[8];
-cx q[4],q[7];
-rz(4.184574547513163) q[7];
-cx q[4],q[7];
-cx q[4],q[10];
-rx(4.449333291928791) q[7];
-rz(4.184574547513163) q[8];
-cx q[3],q[8];
-cx q[5],q[8];
-rz(4.184574547513163) q[8];
-cx q[5],q[8];
-cx q[5],q[11];
-rx(4.449333291928791) q[8];
-rz(4.184574547513163) q[9];
-cx q[1],q[9];
-rx(4.449333291928791) q[1];
-cx q[3],q[9];
-rz(4.184574547513163) q[9];
-cx q[3],q[9];
-cx q[3],q[12];
-rx(4.449333291928791) q[9];
-rz(4.184574547513163) q[10];
-cx q[4],q[10];
-cx q[4],q[13];
-cx q[6],q[10];
-rz(4.184574547513163) q[10];
-cx q[6],q[10];
-rx(4.449333291928791) q[10];
-rz(4.184574547513163) q[11];
-cx q[5],q[11];
-cx q[6],q[11];
-rz(4.184574547513163) q[11];
-cx q[6],q[11];
-rx(4.449333291928791) q[6];
-rx(4.449333291928791) q[11];
-rz(4.184574547513163) q[12];
-cx q[3],q[12];
-cx q[5],q[12];
-rz(4.184574547513163) q[12];
-cx q[5],q[12];
-rx(4.449333291928791) q[12];
-rz(4.184574547513163) q[13];
-cx q[4],q[13];
-cx q[5],q[13];
-rz(4.184574547513163) q[13];
-cx q[5],q[13];
-rx(4.449333291928791) q[5];
-rx(4.449333291928791) q[13];
-rx(8.298834288584436) q[14];
-cx q[3],q[14];
-rz(4.184574547513163) q[14];
-cx q[3],q[14];
-rx(4.449333291928791) q[3];
-cx q[4],q[14];
-rz(4.184574547513163) q[14];
-cx q[4],q[14];
-rx(4.449333291928791) q[4];
-rx(4.449333291928791) q[14];
\ No newline at end of file
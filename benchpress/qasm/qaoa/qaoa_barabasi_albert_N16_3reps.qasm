@@ -1,335 +0,0 @@
-OPENQASM 2.0;
-include "qelib1.inc";
-qreg q[16];
-ry(pi/2) q[0];
-rx(pi) q[0];
-ry(pi/2) q[1];
-rx(pi) q[1];
-cx q[0],q[1];
-rz(2.5118802405405414) q[1];
-cx q[0],q[1];
-ry(pi/2) q[2];
-rx(pi) q[2];
-cx q[0],q[2];
-rz(2.5118802405405414) q[2];
-cx q[0],q[2];
-rx(0.662725374760094) q[2];
-ry(pi/2) q[3];
-rx(pi) q[3];
-cx q[0],q[3];
-rz(2.5118802405405414) q[3];
-cx q[0],q[3];
-cx q[1],q[3];
-rz(2.5118802405405414) q[3];
-cx q[1],q[3];
-ry(pi/2) q[4];
-rx(pi) q[4];
-cx q[1],q[4];
-rz(2.5118802405405414) q[4];
-cx q[1],q[4];
-cx q[3],q[4];
-rz(2.5118802405405414) q[4];
-cx q[3],q[4];
-ry(pi/2) q[5];
-rx(pi) q[5];
-cx q[1],q[5];
-rz(2.5118802405405414) q[5];
-cx q[1],q[5];
-cx q[3],q[5];
-rz(2.5118802405405414) q[5];
-cx q[3],q[5];
-ry(pi/2) q[6];
-rx(pi) q[6];
-cx q[4],q[6];
-rz(2.5118802405405414) q[6];
-cx q[4],q[6];
-cx q[5],q[6];
-rz(2.5118802405405414) q[6];
-cx q[5],q[6];
-ry(pi/2) q[7];
-rx(pi) q[7];
-cx q[3],q[7];
-rz(2.5118802405405414) q[7];
-cx q[3],q[7];
-cx q[4],q[7];
-rz(2.5118802405405414) q[7];
-cx q[4],q[7];
-rx(0.662725374760094) q[7];
-ry(pi/2) q[8];
-rx(pi) q[8];
-cx q[3],q[8];
-rz(2.5118802405405414) q[8];
-cx q[3],q[8];
-cx q[5],q[8];
-rz(2.5118802405405414) q[8];
-cx q[5],q[8];
-rx(0.662725374760094) q[8];
-ry(pi/2) q[9];
-rx(pi) q[9];
-cx q[1],q[9];
-rz(2.5118802405405414) q[9];
-cx q[1],q[9];
-rx(0.662725374760094) q[1];
-cx q[3],q[9];
-rz(2.5118802405405414) q[9];
-cx q[3],q[9];
-rx(0.662725374760094) q[9];
-ry(pi/2) q[10];
-rx(pi) q[10];
-cx q[4],q[10];
-rz(2.5118802405405414) q[10];
-cx q[4],q[10];
-cx q[6],q[10];
-rz(2.5118802405405414) q[10];
-cx q[6],q[10];
-rx(0.662725374760094) q[10];
-ry(pi/2) q[11];
-rx(pi) q[11];
-cx q[5],q[11];
-rz(2.5118802405405414) q[11];
-cx q[5],q[11];
-cx q[6],q[11];
-rz(2.5118802405405414) q[11];
-cx q[6],q[11];
-rx(0.662725374760094) q[6];
-rx(0.662725374760094) q[11];
-ry(pi/2) q[12];
-rx(pi) q[12];
-cx q[3],q[12];
-rz(2.5118802405405414) q[12];
-cx q[3],q[12];
-cx q[5],q[12];
-rz(2.5118802405405414) q[12];
-cx q[5],q[12];
-rx(0.662725374760094) q[12];
-ry(pi/2) q[13];
-rx(pi) q[13];
-cx q[4],q[13];
-rz(2.5118802405405414) q[13];
-cx q[4],q[13];
-cx q[5],q[13];
-rz(2.5118802405405414) q[13];
-cx q[5],q[13];
-rx(0.662725374760094) q[5];
-rx(0.662725374760094) q[13];
-ry(pi/2) q[14];
-rx(pi) q[14];
-cx q[3],q[14];
-rz(2.5118802405405414) q[14];
-cx q[3],q[14];
-cx q[4],q[14];
-rz(2.5118802405405414) q[14];
-cx q[4],q[14];
-rx(0.662725374760094) q[4];
-rx(0.662725374760094) q[14];
-ry(pi/2) q[15];
-rx(pi) q[15];
-cx q[0],q[15];
-rz(2.5118802405405414) q[15];
-cx q[0],q[15];
-rx(0.662725374760094) q[0];
-cx q[0],q[1];
-rz(3.5387794179701695) q[1];
-cx q[0],q[1];
-cx q[0],q[2];
-rz(3.5387794179701695) q[2];
-cx q[0],q[2];
-rx(3.070639963386067) q[2];
-cx q[3],q[15];
-rz(2.5118802405405414) q[15];
-cx q[3],q[15];
-rx(0.662725374760094) q[3];
-cx q[0],q[3];
-rz(3.5387794179701695) q[3];
-cx q[0],q[3];
-cx q[1],q[3];
-rz(3.5387794179701695) q[3];
-cx q[1],q[3];
-cx q[1],q[4];
-rz(3.5387794179701695) q[4];
-cx q[1],q[4];
-cx q[1],q[5];
-cx q[3],q[4];
-rz(3.5387794179701695) q[4];
-cx q[3],q[4];
-cx q[4],q[6];
-rz(3.5387794179701695) q[5];
-cx q[1],q[5];
-cx q[1],q[9];
-cx q[3],q[5];
-rz(3.5387794179701695) q[5];
-cx q[3],q[5];
-cx q[3],q[7];
-rz(3.5387794179701695) q[6];
-cx q[4],q[6];
-cx q[5],q[6];
-rz(3.5387794179701695) q[6];
-cx q[5],q[6];
-rz(3.5387794179701695) q[7];
-cx q[3],q[7];
-cx q[3],q[8];
-cx q[4],q[7];
-rz(3.5387794179701695) q[7];
-cx q[4],q[7];
-cx q[4],q[10];
-rx(3.070639963386067) q[7];
-rz(3.5387794179701695) q[8];
-cx q[3],q[8];
-cx q[5],q[8];
-rz(3.5387794179701695) q[8];
-cx q[5],q[8];
-cx q[5],q[11];
-rx(3.070639963386067) q[8];
-rz(3.5387794179701695) q[9];
-cx q[1],q[9];
-rx(3.070639963386067) q[1];
-cx q[3],q[9];
-rz(3.5387794179701695) q[9];
-cx q[3],q[9];
-cx q[3],q[12];
-rx(3.070639963386067) q[9];
-rz(3.5387794179701695) q[10];
-cx q[4],q[10];
-cx q[4],q[13];
-cx q[6],q[10];
-rz(3.5387794179701695) q[10];
-cx q[6],q[10];
-rx(3.070639963386067) q[10];
-rz(3.5387794179701695) q[11];
-cx q[5],q[11];
-cx q[6],q[11];
-rz(3.5387794179701695) q[11];
-cx q[6],q[11];
-rx(3.070639963386067) q[6];
-rx(3.070639963386067) q[11];
-rz(3.5387794179701695) q[12];
-cx q[3],q[12];
-cx q[3],q[14];
-cx q[5],q[12];
-rz(3.5387794179701695) q[12];
-cx q[5],q[12];
-rx(3.070639963386067) q[12];
-rz(3.5387794179701695) q[13];
-cx q[4],q[13];
-cx q[5],q[13];
-rz(3.5387794179701695) q[13];
-cx q[5],q[13];
-rx(3.070639963386067) q[5];
-rx(3.070639963386067) q[13];
-rz(3.5387794179701695) q[14];
-cx q[3],q[14];
-cx q[4],q[14];
-rz(3.5387794179701695) q[14];
-cx q[4],q[14];
-rx(3.070639963386067) q[4];
-rx(3.070639963386067) q[14];
-rx(0.662725374760094) q[15];
-cx q[0],q[15];
-rz(3.5387794179701695) q[15];
-cx q[0],q[15];
-rx(3.070639963386067) q[0];
-cx q[0],q[1];
-rz(1.618139136547044) q[1];
-cx q[0],q[1];
-cx q[0],q[2];
-rz(1.618139136547044) q[2];
-cx q[0],q[2];
-rx(0.5764839595238784) q[2];
-cx q[3],q[15];
-rz(3.5387794179701695) q[15];
-cx q[3],q[15];
-rx(3.070639963386067) q[3];
-cx q[0],q[3];
-rz(1.618139136547044) q[3];
-cx q[0],q[3];
-cx q[1],q[3];
-rz(1.618139136547044) q[3];
-cx q[1],q[3];
-cx q[1],q[4];
-rz(1.618139136547044) q[4];
-cx q[1],q[4];
-cx q[1],q[5];
-cx q[3],q[4];
-rz(1.618139136547044) q[4];
-cx q[3],q[4];
-cx q[4],q[6];
-rz(1.618139136547044) q[5];
-cx q[1],q[5];
-cx q[1],q[9];
-cx q[3],q[5];
-rz(1.618139136547044) q[5];
-cx q[3],q[5];
-cx q[3],q[7];
-rz(1.618139136547044) q[6];
-cx q[4],q[6];
-cx q[5],q[6];
-rz(1.618139136547044) q[6];
-cx q[5],q[6];
-rz(1.618139136547044) q[7];
-cx q[3],q[7];
-cx q[3],q[8];
-cx q[4],q[7];
-rz(1.618139136547044) q[7];
-cx q[4],q[7];
-cx q[4],q[10];
-rx(0.5764839595238784) q[7];
-rz(1.618139136547044) q[8];
-cx q[3],q[8];
-cx q[5],q[8];
-rz(1.618139136547044) q[8];
-cx q[5],q[8];
-cx q[5],q[11];
-rx(0.5764839595238784) q[8];
-rz(1.618139136547044) q[9];
-cx q[1],q[9];
-rx(0.5764839595238784) q[1];
-cx q[3],q[9];
-rz(1.618139136547044) q[9];
-cx q[3],q[9];
-cx q[3],q[12];
-rx(0.5764839595238784) q[9];
-rz(1.618139136547044) q[10];
-cx q[4],q[10];
-cx q[4],q[13];
-cx q[6],q[10];
-rz(1.618139136547044) q[10];
-cx q[6],q[10];
-rx(0.5764839595238784) q[10];
-rz(1.618139136547044) q[11];
-cx q[5],q[11];
-cx q[6],q[11];
-rz(1.618139136547044) q[11];
-cx q[6],q[11];
-rx(0.5764839595238784) q[6];
-rx(0.5764839595238784) q[11];
-rz(1.618139136547044) q[12];
-cx q[3],q[12];
-cx q[3],q[14];
-cx q[5],q[12];
-rz(1.618139136547044) q[12];
-cx q[5],q[12];
-rx(0.5764839595238784) q[12];
-rz(1.618139136547044) q[13];
-cx q[4],q[13];
-cx q[5],q[13];
-rz(1.618139136547044) q[13];
-cx q[5],q[13];
-rx(0.5764839595238784) q[5];
-rx(0.5764839595238784) q[13];
-rz(1.618139136547044) q[14];
-cx q[3],q[14];
-cx q[4],q[14];
-rz(1.618139136547044) q[14];
-cx q[4],q[14];
-rx(0.5764839595238784) q[4];
-rx(0.5764839595238784) q[14];
-rx(3.070639963386067) q[15];
-cx q[0],q[15];
-rz(1.618139136547044) q[15];
-cx q[0],q[15];
-rx(0.5764839595238784) q[0];
-cx q[3],q[15];
-rz(1.618139136547044) q[15];
-cx q[3],q[15];
-rx(0.5764839595238784) q[3];
-rx(0.5764839595238784) q[15];
\ No newline at end of file
@@ -1,358 +0,0 @@
-OPENQASM 2.0;
-include "qelib1.inc";
-qreg q[17];
-ry(pi/2) q[0];
-rx(pi) q[0];
-ry(pi/2) q[1];
-rx(pi) q[1];
-cx q[0],q[1];
-rz(0.2655458903736339) q[1];
-cx q[0],q[1];
-ry(pi/2) q[2];
-rx(pi) q[2];
-cx q[0],q[2];
-rz(0.2655458903736339) q[2];
-cx q[0],q[2];
-rx(9.834761531915337) q[2];
-ry(pi/2) q[3];
-rx(pi) q[3];
-cx q[0],q[3];
-rz(0.2655458903736339) q[3];
-cx q[0],q[3];
-cx q[1],q[3];
-rz(0.2655458903736339) q[3];
-cx q[1],q[3];
-ry(pi/2) q[4];
-rx(pi) q[4];
-cx q[1],q[4];
-rz(0.2655458903736339) q[4];
-cx q[1],q[4];
-cx q[3],q[4];
-rz(0.2655458903736339) q[4];
-cx q[3],q[4];
-ry(pi/2) q[5];
-rx(pi) q[5];
-cx q[1],q[5];
-rz(0.2655458903736339) q[5];
-cx q[1],q[5];
-cx q[3],q[5];
-rz(0.2655458903736339) q[5];
-cx q[3],q[5];
-ry(pi/2) q[6];
-rx(pi) q[6];
-cx q[4],q[6];
-rz(0.2655458903736339) q[6];
-cx q[4],q[6];
-cx q[5],q[6];
-rz(0.2655458903736339) q[6];
-cx q[5],q[6];
-ry(pi/2) q[7];
-rx(pi) q[7];
-cx q[3],q[7];
-rz(0.2655458903736339) q[7];
-cx q[3],q[7];
-cx q[4],q[7];
-rz(0.2655458903736339) q[7];
-cx q[4],q[7];
-rx(9.834761531915337) q[7];
-ry(pi/2) q[8];
-rx(pi) q[8];
-cx q[3],q[8];
-rz(0.2655458903736339) q[8];
-cx q[3],q[8];
-cx q[5],q[8];
-rz(0.2655458903736339) q[8];
-cx q[5],q[8];
-rx(9.834761531915337) q[8];
-ry(pi/2) q[9];
-rx(pi) q[9];
-cx q[1],q[9];
-rz(0.2655458903736339) q[9];
-cx q[1],q[9];
-rx(9.834761531915337) q[1];
-cx q[3],q[9];
-rz(0.2655458903736339) q[9];
-cx q[3],q[9];
-rx(9.834761531915337) q[9];
-ry(pi/2) q[10];
-rx(pi) q[10];
-cx q[4],q[10];
-rz(0.2655458903736339) q[10];
-cx q[4],q[10];
-cx q[6],q[10];
-rz(0.2655458903736339) q[10];
-cx q[6],q[10];
-rx(9.834761531915337) q[10];
-ry(pi/2) q[11];
-rx(pi) q[11];
-cx q[5],q[11];
-rz(0.2655458903736339) q[11];
-cx q[5],q[11];
-cx q[6],q[11];
-rz(0.2655458903736339) q[11];
-cx q[6],q[11];
-rx(9.834761531915337) q[6];
-rx(9.834761531915337) q[11];
-ry(pi/2) q[12];
-rx(pi) q[12];
-cx q[3],q[12];
-rz(0.2655458903736339) q[12];
-cx q[3],q[12];
-cx q[5],q[12];
-rz(0.2655458903736339) q[12];
-cx q[5],q[12];
-rx(9.834761531915337) q[12];
-ry(pi/2) q[13];
-rx(pi) q[13];
-cx q[4],q[13];
-rz(0.2655458903736339) q[13];
-cx q[4],q[13];
-cx q[5],q[13];
-rz(0.2655458903736339) q[13];
-cx q[5],q[13];
-rx(9.834761531915337) q[5];
-rx(9.834761531915337) q[13];
-ry(pi/2) q[14];
-rx(pi) q[14];
-cx q[3],q[14];
-rz(0.2655458903736339) q[14];
-cx q[3],q[14];
-cx q[4],q[14];
-rz(0.2655458903736339) q[14];
-cx q[4],q[14];
-rx(9.834761531915337) q[4];
-rx(9.834761531915337) q[14];
-ry(pi/2) q[15];
-rx(pi) q[15];
-cx q[0],q[15];
-rz(0.2655458903736339) q[15];
-cx q[0],q[15];
-cx q[3],q[15];
-rz(0.2655458903736339) q[15];
-cx q[3],q[15];
-rx(9.834761531915337) q[15];
-ry(pi/2) q[16];
-rx(pi) q[16];
-cx q[0],q[16];
-rz(0.2655458903736339) q[16];
-cx q[0],q[16];
-rx(9.834761531915337) q[0];
-cx q[0],q[1];
-rz(2.6968363140714637) q[1];
-cx q[0],q[1];
-cx q[0],q[2];
-rz(2.6968363140714637) q[2];
-cx q[0],q[2];
-rx(0.3743392225324573) q[2];
-cx q[3],q[16];
-rz(0.2655458903736339) q[16];
-cx q[3],q[16];
-rx(9.834761531915337) q[3];
-cx q[0],q[3];
-rz(2.6968363140714637) q[3];
-cx q[0],q[3];
-cx q[0],q[15];
-cx q[1],q[3];
-rz(2.6968363140714637) q[3];
-cx q[1],q[3];
-cx q[1],q[4];
-rz(2.6968363140714637) q[4];
-cx q[1],q[4];
-cx q[1],q[5];
-cx q[3],q[4];
-rz(2.6968363140714637) q[4];
-cx q[3],q[4];
-cx q[4],q[6];
-rz(2.6968363140714637) q[5];
-cx q[1],q[5];
-cx q[1],q[9];
-cx q[3],q[5];
-rz(2.6968363140714637) q[5];
-cx q[3],q[5];
-cx q[3],q[7];
-rz(2.6968363140714637) q[6];
-cx q[4],q[6];
-cx q[5],q[6];
-rz(2.6968363140714637) q[6];
-cx q[5],q[6];
-rz(2.6968363140714637) q[7];
-cx q[3],q[7];
-cx q[3],q[8];
-cx q[4],q[7];
-rz(2.6968363140714637) q[7];
-cx q[4],q[7];
-cx q[4],q[10];
-rx(0.3743392225324573) q[7];
-rz(2.6968363140714637) q[8];
-cx q[3],q[8];
-cx q[5],q[8];
-rz(2.6968363140714637) q[8];
-cx q[5],q[8];
-cx q[5],q[11];
-rx(0.3743392225324573) q[8];
-rz(2.6968363140714637) q[9];
-cx q[1],q[9];
-rx(0.3743392225324573) q[1];
-cx q[3],q[9];
-rz(2.6968363140714637) q[9];
-cx q[3],q[9];
-cx q[3],q[12];
-rx(0.3743392225324573) q[9];
-rz(2.6968363140714637) q[10];
-cx q[4],q[10];
-cx q[4],q[13];
-cx q[6],q[10];
-rz(2.6968363140714637) q[10];
-cx q[6],q[10];
-rx(0.3743392225324573) q[10];
-rz(2.6968363140714637) q[11];
-cx q[5],q[11];
-cx q[6],q[11];
-rz(2.6968363140714637) q[11];
-cx q[6],q[11];
-rx(0.3743392225324573) q[6];
-rx(0.3743392225324573) q[11];
-rz(2.6968363140714637) q[12];
-cx q[3],q[12];
-cx q[3],q[14];
-cx q[5],q[12];
-rz(2.6968363140714637) q[12];
-cx q[5],q[12];
-rx(0.3743392225324573) q[12];
-rz(2.6968363140714637) q[13];
-cx q[4],q[13];
-cx q[5],q[13];
-rz(2.6968363140714637) q[13];
-cx q[5],q[13];
-rx(0.3743392225324573) q[5];
-rx(0.3743392225324573) q[13];
-rz(2.6968363140714637) q[14];
-cx q[3],q[14];
-cx q[4],q[14];
-rz(2.6968363140714637) q[14];
-cx q[4],q[14];
-rx(0.3743392225324573) q[4];
-rx(0.3743392225324573) q[14];
-rz(2.6968363140714637) q[15];
-cx q[0],q[15];
-cx q[3],q[15];
-rz(2.6968363140714637) q[15];
-cx q[3],q[15];
-rx(0.3743392225324573) q[15];
-rx(9.834761531915337) q[16];
-cx q[0],q[16];
-rz(2.6968363140714637) q[16];
-cx q[0],q[16];
-rx(0.3743392225324573) q[0];
-cx q[0],q[1];
-rz(3.780666608741882) q[1];
-cx q[0],q[1];
-cx q[0],q[2];
-rz(3.780666608741882) q[2];
-cx q[0],q[2];
-rx(2.231161442545072) q[2];
-cx q[3],q[16];
-rz(2.6968363140714637) q[16];
-cx q[3],q[16];
-rx(0.3743392225324573) q[3];
-cx q[0],q[3];
-rz(3.780666608741882) q[3];
-cx q[0],q[3];
-cx q[0],q[15];
-cx q[1],q[3];
-rz(3.780666608741882) q[3];
-cx q[1],q[3];
-cx q[1],q[4];
-rz(3.780666608741882) q[4];
-cx q[1],q[4];
-cx q[1],q[5];
-cx q[3],q[4];
-rz(3.780666608741882) q[4];
-cx q[3],q[4];
-cx q[4],q[6];
-rz(3.780666608741882) q[5];
-cx q[1],q[5];
-cx q[1],q[9];
-cx q[3],q[5];
-rz(3.780666608741882) q[5];
-cx q[3],q[5];
-cx q[3],q[7];
-rz(3.780666608741882) q[6];
-cx q[4],q[6];
-cx q[5],q[6];
-rz(3.780666608741882) q[6];
-cx q[5],q[6];
-rz(3.780666608741882) q[7];
-cx q[3],q[7];
-cx q[3],q[8];
-cx q[4],q[7];
-rz(3.780666608741882) q[7];
-cx q[4],q[7];
-cx q[4],q[10];
-rx(2.231161442545072) q[7];
-rz(3.780666608741882) q[8];
-cx q[3],q[8];
-cx q[5],q[8];
-rz(3.780666608741882) q[8];
-cx q[5],q[8];
-cx q[5],q[11];
-rx(2.231161442545072) q[8];
-rz(3.780666608741882) q[9];
-cx q[1],q[9];
-rx(2.231161442545072) q[1];
-cx q[3],q[9];
-rz(3.780666608741882) q[9];
-cx q[3],q[9];
-cx q[3],q[12];
-rx(2.231161442545072) q[9];
-rz(3.780666608741882) q[10];
-cx q[4],q[10];
-cx q[4],q[13];
-cx q[6],q[10];
-rz(3.780666608741882) q[10];
-cx q[6],q[10];
-rx(2.231161442545072) q[10];
-rz(3.780666608741882) q[11];
-cx q[5],q[11];
-cx q[6],q[11];
-rz(3.780666608741882) q[11];
-cx q[6],q[11];
-rx(2.231161442545072) q[6];
-rx(2.231161442545072) q[11];
-rz(3.780666608741882) q[12];
-cx q[3],q[12];
-cx q[3],q[14];
-cx q[5],q[12];
-rz(3.780666608741882) q[12];
-cx q[5],q[12];
-rx(2.231161442545072) q[12];
-rz(3.780666608741882) q[13];
-cx q[4],q[13];
-cx q[5],q[13];
-rz(3.780666608741882) q[13];
-cx q[5],q[13];
-rx(2.231161442545072) q[5];
-rx(2.231161442545072) q[13];
-rz(3.780666608741882) q[14];
-cx q[3],q[14];
-cx q[4],q[14];
-rz(3.780666608741882) q[14];
-cx q[4],q[14];
-rx(2.231161442545072) q[4];
-rx(2.231161442545072) q[14];
-rz(3.780666608741882) q[15];
-cx q[0],q[15];
-cx q[3],q[15];
-rz(3.780666608741882) q[15];
-cx q[3],q[15];
-rx(2.231161442545072) q[15];
-rx(0.3743392225324573) q[16];
-cx q[0],q[16];
-rz(3.780666608741882) q[16];
-cx q[0],q[16];
-rx(2.231161442545072) q[0];
-cx q[3],q[16];
-rz(3.780666608741882) q[16];
-cx q[3],q[16];
-rx(2.231161442545072) q[3];
-rx(2.231161442545072) q[16];
\ No newline at end of file
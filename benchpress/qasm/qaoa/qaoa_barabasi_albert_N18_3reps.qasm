@@ -1,381 +0,0 @@
-OPENQASM 2.0;
-include "qelib1.inc";
-qreg q[18];
-ry(pi/2) q[0];
-rx(pi) q[0];
-ry(pi/2) q[1];
-rx(pi) q[1];
-cx q[0],q[1];
-rz(1.2210703216973684) q[1];
-cx q[0],q[1];
-ry(pi/2) q[2];
-rx(pi) q[2];
-cx q[0],q[2];
-rz(1.2210703216973684) q[2];
-cx q[0],q[2];
-rx(1.8166069630317916) q[2];
-ry(pi/2) q[3];
-rx(pi) q[3];
-cx q[0],q[3];
-rz(1.2210703216973684) q[3];
-cx q[0],q[3];
-cx q[1],q[3];
-rz(1.2210703216973684) q[3];
-cx q[1],q[3];
-ry(pi/2) q[4];
-rx(pi) q[4];
-cx q[1],q[4];
-rz(1.2210703216973684) q[4];
-cx q[1],q[4];
-cx q[3],q[4];
-rz(1.2210703216973684) q[4];
-cx q[3],q[4];
-ry(pi/2) q[5];
-rx(pi) q[5];
-cx q[1],q[5];
-rz(1.2210703216973684) q[5];
-cx q[1],q[5];
-cx q[3],q[5];
-rz(1.2210703216973684) q[5];
-cx q[3],q[5];
-ry(pi/2) q[6];
-rx(pi) q[6];
-cx q[4],q[6];
-rz(1.2210703216973684) q[6];
-cx q[4],q[6];
-cx q[5],q[6];
-rz(1.2210703216973684) q[6];
-cx q[5],q[6];
-ry(pi/2) q[7];
-rx(pi) q[7];
-cx q[3],q[7];
-rz(1.2210703216973684) q[7];
-cx q[3],q[7];
-cx q[4],q[7];
-rz(1.2210703216973684) q[7];
-cx q[4],q[7];
-rx(1.8166069630317916) q[7];
-ry(pi/2) q[8];
-rx(pi) q[8];
-cx q[3],q[8];
-rz(1.2210703216973684) q[8];
-cx q[3],q[8];
-cx q[5],q[8];
-rz(1.2210703216973684) q[8];
-cx q[5],q[8];
-rx(1.8166069630317916) q[8];
-ry(pi/2) q[9];
-rx(pi) q[9];
-cx q[1],q[9];
-rz(1.2210703216973684) q[9];
-cx q[1],q[9];
-cx q[3],q[9];
-rz(1.2210703216973684) q[9];
-cx q[3],q[9];
-rx(1.8166069630317916) q[9];
-ry(pi/2) q[10];
-rx(pi) q[10];
-cx q[4],q[10];
-rz(1.2210703216973684) q[10];
-cx q[4],q[10];
-cx q[6],q[10];
-rz(1.2210703216973684) q[10];
-cx q[6],q[10];
-rx(1.8166069630317916) q[10];
-ry(pi/2) q[11];
-rx(pi) q[11];
-cx q[5],q[11];
-rz(1.2210703216973684) q[11];
-cx q[5],q[11];
-cx q[6],q[11];
-rz(1.2210703216973684) q[11];
-cx q[6],q[11];
-rx(1.8166069630317916) q[6];
-rx(1.8166069630317916) q[11];
-ry(pi/2) q[12];
-rx(pi) q[12];
-cx q[3],q[12];
-rz(1.2210703216973684) q[12];
-cx q[3],q[12];
-cx q[5],q[12];
-rz(1.2210703216973684) q[12];
-cx q[5],q[12];
-rx(1.8166069630317916) q[12];
-ry(pi/2) q[13];
-rx(pi) q[13];
-cx q[4],q[13];
-rz(1.2210703216973684) q[13];
-cx q[4],q[13];
-cx q[5],q[13];
-rz(1.2210703216973684) q[13];
-cx q[5],q[13];
-rx(1.8166069630317916) q[5];
-rx(1.8166069630317916) q[13];
-ry(pi/2) q[14];
-rx(pi) q[14];
-cx q[3],q[14];
-rz(1.2210703216973684) q[14];
-cx q[3],q[14];
-cx q[4],q[14];
-rz(1.2210703216973684) q[14];
-cx q[4],q[14];
-rx(1.8166069630317916) q[4];
-rx(1.8166069630317916) q[14];
-ry(pi/2) q[15];
-rx(pi) q[15];
-cx q[0],q[15];
-rz(1.2210703216973684) q[15];
-cx q[0],q[15];
-cx q[3],q[15];
-rz(1.2210703216973684) q[15];
-cx q[3],q[15];
-rx(1.8166069630317916) q[15];
-ry(pi/2) q[16];
-rx(pi) q[16];
-cx q[0],q[16];
-rz(1.2210703216973684) q[16];
-cx q[0],q[16];
-rx(1.8166069630317916) q[0];
-cx q[3],q[16];
-rz(1.2210703216973684) q[16];
-cx q[3],q[16];
-rx(1.8166069630317916) q[16];
-ry(pi/2) q[17];
-rx(pi) q[17];
-cx q[1],q[17];
-rz(1.2210703216973684) q[17];
-cx q[1],q[17];
-rx(1.8166069630317916) q[1];
-cx q[0],q[1];
-rz(4.689185839844369) q[1];
-cx q[0],q[1];
-cx q[0],q[2];
-rz(4.689185839844369) q[2];
-cx q[0],q[2];
-rx(1.9272782151204646) q[2];
-cx q[3],q[17];
-rz(1.2210703216973684) q[17];
-cx q[3],q[17];
-rx(1.8166069630317916) q[3];
-cx q[0],q[3];
-rz(4.689185839844369) q[3];
-cx q[0],q[3];
-cx q[0],q[15];
-cx q[1],q[3];
-rz(4.689185839844369) q[3];
-cx q[1],q[3];
-cx q[1],q[4];
-rz(4.689185839844369) q[4];
-cx q[1],q[4];
-cx q[1],q[5];
-cx q[3],q[4];
-rz(4.689185839844369) q[4];
-cx q[3],q[4];
-cx q[4],q[6];
-rz(4.689185839844369) q[5];
-cx q[1],q[5];
-cx q[1],q[9];
-cx q[3],q[5];
-rz(4.689185839844369) q[5];
-cx q[3],q[5];
-cx q[3],q[7];
-rz(4.689185839844369) q[6];
-cx q[4],q[6];
-cx q[5],q[6];
-rz(4.689185839844369) q[6];
-cx q[5],q[6];
-rz(4.689185839844369) q[7];
-cx q[3],q[7];
-cx q[3],q[8];
-cx q[4],q[7];
-rz(4.689185839844369) q[7];
-cx q[4],q[7];
-cx q[4],q[10];
-rx(1.9272782151204646) q[7];
-rz(4.689185839844369) q[8];
-cx q[3],q[8];
-cx q[5],q[8];
-rz(4.689185839844369) q[8];
-cx q[5],q[8];
-cx q[5],q[11];
-rx(1.9272782151204646) q[8];
-rz(4.689185839844369) q[9];
-cx q[1],q[9];
-cx q[3],q[9];
-rz(4.689185839844369) q[9];
-cx q[3],q[9];
-cx q[3],q[12];
-rx(1.9272782151204646) q[9];
-rz(4.689185839844369) q[10];
-cx q[4],q[10];
-cx q[4],q[13];
-cx q[6],q[10];
-rz(4.689185839844369) q[10];
-cx q[6],q[10];
-rx(1.9272782151204646) q[10];
-rz(4.689185839844369) q[11];
-cx q[5],q[11];
-cx q[6],q[11];
-rz(4.689185839844369) q[11];
-cx q[6],q[11];
-rx(1.9272782151204646) q[6];
-rx(1.9272782151204646) q[11];
-rz(4.689185839844369) q[12];
-cx q[3],q[12];
-cx q[3],q[14];
-cx q[5],q[12];
-rz(4.689185839844369) q[12];
-cx q[5],q[12];
-rx(1.9272782151204646) q[12];
-rz(4.689185839844369) q[13];
-cx q[4],q[13];
-cx q[5],q[13];
-rz(4.689185839844369) q[13];
-cx q[5],q[13];
-rx(1.9272782151204646) q[5];
-rx(1.9272782151204646) q[13];
-rz(4.689185839844369) q[14];
-cx q[3],q[14];
-cx q[4],q[14];
-rz(4.689185839844369) q[14];
-cx q[4],q[14];
-rx(1.9272782151204646) q[4];
-rx(1.9272782151204646) q[14];
-rz(4.689185839844369) q[15];
-cx q[0],q[15];
-cx q[0],q[16];
-cx q[3],q[15];
-rz(4.689185839844369) q[15];
-cx q[3],q[15];
-rx(1.9272782151204646) q[15];
-rz(4.689185839844369) q[16];
-cx q[0],q[16];
-rx(1.9272782151204646) q[0];
-cx q[3],q[16];
-rz(4.689185839844369) q[16];
-cx q[3],q[16];
-rx(1.9272782151204646) q[16];
-rx(1.8166069630317916) q[17];
-cx q[1],q[17];
-rz(4.689185839844369) q[17];
-cx q[1],q[17];
-rx(1.9272782151204646) q[1];
-cx q[0],q[1];
-rz(2.3217771248351737) q[1];
-cx q[0],q[1];
-cx q[0],q[2];
-rz(2.3217771248351737) q[2];
-cx q[0],q[2];
-rx(8.172152689555368) q[2];
-cx q[3],q[17];
-rz(4.689185839844369) q[17];
-cx q[3],q[17];
-rx(1.9272782151204646) q[3];
-cx q[0],q[3];
-rz(2.3217771248351737) q[3];
-cx q[0],q[3];
-cx q[0],q[15];
-cx q[1],q[3];
-rz(2.3217771248351737) q[3];
-cx q[1],q[3];
-cx q[1],q[4];
-rz(2.3217771248351737) q[4];
-cx q[1],q[4];
-cx q[1],q[5];
-cx q[3],q[4];
-rz(2.3217771248351737) q[4];
-cx q[3],q[4];
-cx q[4],q[6];
-rz(2.3217771248351737) q[5];
-cx q[1],q[5];
-cx q[1],q[9];
-cx q[3],q[5];
-rz(2.3217771248351737) q[5];
-cx q[3],q[5];
-cx q[3],q[7];
-rz(2.3217771248351737) q[6];
-cx q[4],q[6];
-cx q[5],q[6];
-rz(2.3217771248351737) q[6];
-cx q[5],q[6];
-rz(2.3217771248351737) q[7];
-cx q[3],q[7];
-cx q[3],q[8];
-cx q[4],q[7];
-rz(2.3217771248351737) q[7];
-cx q[4],q[7];
-cx q[4],q[10];
-rx(8.172152689555368) q[7];
-rz(2.3217771248351737) q[8];
-cx q[3],q[8];
-cx q[5],q[8];
-rz(2.3217771248351737) q[8];
-cx q[5],q[8];
-cx q[5],q[11];
-rx(8.172152689555368) q[8];
-rz(2.3217771248351737) q[9];
-cx q[1],q[9];
-cx q[3],q[9];
-rz(2.3217771248351737) q[9];
-cx q[3],q[9];
-cx q[3],q[12];
-rx(8.172152689555368) q[9];
-rz(2.3217771248351737) q[10];
-cx q[4],q[10];
-cx q[4],q[13];
-cx q[6],q[10];
-rz(2.3217771248351737) q[10];
-cx q[6],q[10];
-rx(8.172152689555368) q[10];
-rz(2.3217771248351737) q[11];
-cx q[5],q[11];
-cx q[6],q[11];
-rz(2.3217771248351737) q[11];
-cx q[6],q[11];
-rx(8.172152689555368) q[6];
-rx(8.172152689555368) q[11];
-rz(2.3217771248351737) q[12];
-cx q[3],q[12];
-cx q[3],q[14];
-cx q[5],q[12];
-rz(2.3217771248351737) q[12];
-cx q[5],q[12];
-rx(8.172152689555368) q[12];
-rz(2.3217771248351737) q[13];
-cx q[4],q[13];
-cx q[5],q[13];
-rz(2.3217771248351737) q[13];
-cx q[5],q[13];
-rx(8.172152689555368) q[5];
-rx(8.172152689555368) q[13];
-rz(2.3217771248351737) q[14];
-cx q[3],q[14];
-cx q[4],q[14];
-rz(2.3217771248351737) q[14];
-cx q[4],q[14];
-rx(8.172152689555368) q[4];
-rx(8.172152689555368) q[14];
-rz(2.3217771248351737) q[15];
-cx q[0],q[15];
-cx q[0],q[16];
-cx q[3],q[15];
-rz(2.3217771248351737) q[15];
-cx q[3],q[15];
-rx(8.172152689555368) q[15];
-rz(2.3217771248351737) q[16];
-cx q[0],q[16];
-rx(8.172152689555368) q[0];
-cx q[3],q[16];
-rz(2.3217771248351737) q[16];
-cx q[3],q[16];
-rx(8.172152689555368) q[16];
-rx(1.9272782151204646) q[17];
-cx q[1],q[17];
-rz(2.3217771248351737) q[17];
-cx q[1],q[17];
-rx(8.172152689555368) q[1];
-cx q[3],q[17];
-rz(2.3217771248351737) q[17];
-cx q[3],q[17];
-rx(8.172152689555368) q[3];
-rx(8.172152689555368) q[17];
\ No newline at end of file
@@ -1,404 +0,0 @@
-OPENQASM 2.0;
-include "qelib1.inc";
-qreg q[19];
-ry(pi/2) q[0];
-rx(pi) q[0];
-ry(pi/2) q[1];
-rx(pi) q[1];
-cx q[0],q[1];
-rz(4.619093393606219) q[1];
-cx q[0],q[1];
-ry(pi/2) q[2];
-rx(pi) q[2];
-cx q[0],q[2];
-rz(4.619093393606219) q[2];
-cx q[0],q[2];
-rx(2.3555974702718507) q[2];
-ry(pi/2) q[3];
-rx(pi) q[3];
-cx q[0],q[3];
-rz(4.619093393606219) q[3];
-cx q[0],q[3];
-cx q[1],q[3];
-rz(4.619093393606219) q[3];
-cx q[1],q[3];
-ry(pi/2) q[4];
-rx(pi) q[4];
-cx q[1],q[4];
-rz(4.619093393606219) q[4];
-cx q[1],q[4];
-cx q[3],q[4];
-rz(4.619093393606219) q[4];
-cx q[3],q[4];
-ry(pi/2) q[5];
-rx(pi) q[5];
-cx q[1],q[5];
-rz(4.619093393606219) q[5];
-cx q[1],q[5];
-cx q[3],q[5];
-rz(4.619093393606219) q[5];
-cx q[3],q[5];
-ry(pi/2) q[6];
-rx(pi) q[6];
-cx q[4],q[6];
-rz(4.619093393606219) q[6];
-cx q[4],q[6];
-cx q[5],q[6];
-rz(4.619093393606219) q[6];
-cx q[5],q[6];
-ry(pi/2) q[7];
-rx(pi) q[7];
-cx q[3],q[7];
-rz(4.619093393606219) q[7];
-cx q[3],q[7];
-cx q[4],q[7];
-rz(4.619093393606219) q[7];
-cx q[4],q[7];
-rx(2.3555974702718507) q[7];
-ry(pi/2) q[8];
-rx(pi) q[8];
-cx q[3],q[8];
-rz(4.619093393606219) q[8];
-cx q[3],q[8];
-cx q[5],q[8];
-rz(4.619093393606219) q[8];
-cx q[5],q[8];
-rx(2.3555974702718507) q[8];
-ry(pi/2) q[9];
-rx(pi) q[9];
-cx q[1],q[9];
-rz(4.619093393606219) q[9];
-cx q[1],q[9];
-cx q[3],q[9];
-rz(4.619093393606219) q[9];
-cx q[3],q[9];
-rx(2.3555974702718507) q[9];
-ry(pi/2) q[10];
-rx(pi) q[10];
-cx q[4],q[10];
-rz(4.619093393606219) q[10];
-cx q[4],q[10];
-cx q[6],q[10];
-rz(4.619093393606219) q[10];
-cx q[6],q[10];
-rx(2.3555974702718507) q[10];
-ry(pi/2) q[11];
-rx(pi) q[11];
-cx q[5],q[11];
-rz(4.619093393606219) q[11];
-cx q[5],q[11];
-cx q[6],q[11];
-rz(4.619093393606219) q[11];
-cx q[6],q[11];
-rx(2.3555974702718507) q[6];
-rx(2.3555974702718507) q[11];
-ry(pi/2) q[12];
-rx(pi) q[12];
-cx q[3],q[12];
-rz(4.619093393606219) q[12];
-cx q[3],q[12];
-cx q[5],q[12];
-rz(4.619093393606219) q[12];
-cx q[5],q[12];
-rx(2.3555974702718507) q[12];
-ry(pi/2) q[13];
-rx(pi) q[13];
-cx q[4],q[13];
-rz(4.619093393606219) q[13];
-cx q[4],q[13];
-cx q[5],q[13];
-rz(4.619093393606219) q[13];
-cx q[5],q[13];
-rx(2.3555974702718507) q[5];
-rx(2.3555974702718507) q[13];
-ry(pi/2) q[14];
-rx(pi) q[14];
-cx q[3],q[14];
-rz(4.619093393606219) q[14];
-cx q[3],q[14];
-cx q[4],q[14];
-rz(4.619093393606219) q[14];
-cx q[4],q[14];
-rx(2.3555974702718507) q[14];
-ry(pi/2) q[15];
-rx(pi) q[15];
-cx q[0],q[15];
-rz(4.619093393606219) q[15];
-cx q[0],q[15];
-cx q[3],q[15];
-rz(4.619093393606219) q[15];
-cx q[3],q[15];
-rx(2.3555974702718507) q[15];
-ry(pi/2) q[16];
-rx(pi) q[16];
-cx q[0],q[16];
-rz(4.619093393606219) q[16];
-cx q[0],q[16];
-rx(2.3555974702718507) q[0];
-cx q[3],q[16];
-rz(4.619093393606219) q[16];
-cx q[3],q[16];
-rx(2.3555974702718507) q[16];
-ry(pi/2) q[17];
-rx(pi) q[17];
-cx q[1],q[17];
-rz(4.619093393606219) q[17];
-cx q[1],q[17];
-rx(2.3555974702718507) q[1];
-cx q[0],q[1];
-rz(0.6447330215524137) q[1];
-cx q[0],q[1];
-cx q[0],q[2];
-rz(0.6447330215524137) q[2];
-cx q[0],q[2];
-rx(7.700754974148575) q[2];
-cx q[3],q[17];
-rz(4.619093393606219) q[17];
-cx q[3],q[17];
-rx(2.3555974702718507) q[17];
-ry(pi/2) q[18];
-rx(pi) q[18];
-cx q[3],q[18];
-rz(4.619093393606219) q[18];
-cx q[3],q[18];
-rx(2.3555974702718507) q[3];
-cx q[0],q[3];
-rz(0.6447330215524137) q[3];
-cx q[0],q[3];
-cx q[0],q[15];
-cx q[1],q[3];
-rz(0.6447330215524137) q[3];
-cx q[1],q[3];
-cx q[4],q[18];
-rz(0.6447330215524137) q[15];
-cx q[0],q[15];
-cx q[0],q[16];
-rz(0.6447330215524137) q[16];
-cx q[0],q[16];
-rx(7.700754974148575) q[0];
-rz(4.619093393606219) q[18];
-cx q[4],q[18];
-rx(2.3555974702718507) q[4];
-cx q[1],q[4];
-rz(0.6447330215524137) q[4];
-cx q[1],q[4];
-cx q[1],q[5];
-cx q[3],q[4];
-rz(0.6447330215524137) q[4];
-cx q[3],q[4];
-cx q[4],q[6];
-rz(0.6447330215524137) q[5];
-cx q[1],q[5];
-cx q[1],q[9];
-cx q[3],q[5];
-rz(0.6447330215524137) q[5];
-cx q[3],q[5];
-cx q[3],q[7];
-rz(0.6447330215524137) q[6];
-cx q[4],q[6];
-cx q[5],q[6];
-rz(0.6447330215524137) q[6];
-cx q[5],q[6];
-rz(0.6447330215524137) q[7];
-cx q[3],q[7];
-cx q[3],q[8];
-cx q[4],q[7];
-rz(0.6447330215524137) q[7];
-cx q[4],q[7];
-cx q[4],q[10];
-rx(7.700754974148575) q[7];
-rz(0.6447330215524137) q[8];
-cx q[3],q[8];
-cx q[5],q[8];
-rz(0.6447330215524137) q[8];
-cx q[5],q[8];
-cx q[5],q[11];
-rx(7.700754974148575) q[8];
-rz(0.6447330215524137) q[9];
-cx q[1],q[9];
-cx q[1],q[17];
-cx q[3],q[9];
-rz(0.6447330215524137) q[9];
-cx q[3],q[9];
-cx q[3],q[12];
-rx(7.700754974148575) q[9];
-rz(0.6447330215524137) q[10];
-cx q[4],q[10];
-cx q[4],q[13];
-cx q[6],q[10];
-rz(0.6447330215524137) q[10];
-cx q[6],q[10];
-rx(7.700754974148575) q[10];
-rz(0.6447330215524137) q[11];
-cx q[5],q[11];
-cx q[6],q[11];
-rz(0.6447330215524137) q[11];
-cx q[6],q[11];
-rx(7.700754974148575) q[6];
-rx(7.700754974148575) q[11];
-rz(0.6447330215524137) q[12];
-cx q[3],q[12];
-cx q[3],q[14];
-cx q[5],q[12];
-rz(0.6447330215524137) q[12];
-cx q[5],q[12];
-rx(7.700754974148575) q[12];
-rz(0.6447330215524137) q[13];
-cx q[4],q[13];
-cx q[5],q[13];
-rz(0.6447330215524137) q[13];
-cx q[5],q[13];
-rx(7.700754974148575) q[5];
-rx(7.700754974148575) q[13];
-rz(0.6447330215524137) q[14];
-cx q[3],q[14];
-cx q[3],q[15];
-cx q[4],q[14];
-rz(0.6447330215524137) q[14];
-cx q[4],q[14];
-rx(7.700754974148575) q[14];
-rz(0.6447330215524137) q[15];
-cx q[3],q[15];
-cx q[3],q[16];
-rx(7.700754974148575) q[15];
-rz(0.6447330215524137) q[16];
-cx q[3],q[16];
-rx(7.700754974148575) q[16];
-rz(0.6447330215524137) q[17];
-cx q[1],q[17];
-rx(7.700754974148575) q[1];
-cx q[0],q[1];
-rz(2.8670207752579464) q[1];
-cx q[0],q[1];
-cx q[0],q[2];
-rz(2.8670207752579464) q[2];
-cx q[0],q[2];
-rx(10.68827117953729) q[2];
-cx q[3],q[17];
-rz(0.6447330215524137) q[17];
-cx q[3],q[17];
-rx(7.700754974148575) q[17];
-rx(2.3555974702718507) q[18];
-cx q[3],q[18];
-rz(0.6447330215524137) q[18];
-cx q[3],q[18];
-rx(7.700754974148575) q[3];
-cx q[0],q[3];
-rz(2.8670207752579464) q[3];
-cx q[0],q[3];
-cx q[0],q[15];
-cx q[1],q[3];
-rz(2.8670207752579464) q[3];
-cx q[1],q[3];
-cx q[4],q[18];
-rz(2.8670207752579464) q[15];
-cx q[0],q[15];
-cx q[0],q[16];
-rz(2.8670207752579464) q[16];
-cx q[0],q[16];
-rx(10.68827117953729) q[0];
-rz(0.6447330215524137) q[18];
-cx q[4],q[18];
-rx(7.700754974148575) q[4];
-cx q[1],q[4];
-rz(2.8670207752579464) q[4];
-cx q[1],q[4];
-cx q[1],q[5];
-cx q[3],q[4];
-rz(2.8670207752579464) q[4];
-cx q[3],q[4];
-cx q[4],q[6];
-rz(2.8670207752579464) q[5];
-cx q[1],q[5];
-cx q[1],q[9];
-cx q[3],q[5];
-rz(2.8670207752579464) q[5];
-cx q[3],q[5];
-cx q[3],q[7];
-rz(2.8670207752579464) q[6];
-cx q[4],q[6];
-cx q[5],q[6];
-rz(2.8670207752579464) q[6];
-cx q[5],q[6];
-rz(2.8670207752579464) q[7];
-cx q[3],q[7];
-cx q[3],q[8];
-cx q[4],q[7];
-rz(2.8670207752579464) q[7];
-cx q[4],q[7];
-cx q[4],q[10];
-rx(10.68827117953729) q[7];
-rz(2.8670207752579464) q[8];
-cx q[3],q[8];
-cx q[5],q[8];
-rz(2.8670207752579464) q[8];
-cx q[5],q[8];
-cx q[5],q[11];
-rx(10.68827117953729) q[8];
-rz(2.8670207752579464) q[9];
-cx q[1],q[9];
-cx q[1],q[17];
-cx q[3],q[9];
-rz(2.8670207752579464) q[9];
-cx q[3],q[9];
-cx q[3],q[12];
-rx(10.68827117953729) q[9];
-rz(2.8670207752579464) q[10];
-cx q[4],q[10];
-cx q[4],q[13];
-cx q[6],q[10];
-rz(2.8670207752579464) q[10];
-cx q[6],q[10];
-rx(10.68827117953729) q[10];
-rz(2.8670207752579464) q[11];
-cx q[5],q[11];
-cx q[6],q[11];
-rz(2.8670207752579464) q[11];
-cx q[6],q[11];
-rx(10.68827117953729) q[6];
-rx(10.68827117953729) q[11];
-rz(2.8670207752579464) q[12];
-cx q[3],q[12];
-cx q[3],q[14];
-cx q[5],q[12];
-rz(2.8670207752579464) q[12];
-cx q[5],q[12];
-rx(10.68827117953729) q[12];
-rz(2.8670207752579464) q[13];
-cx q[4],q[13];
-cx q[5],q[13];
-rz(2.8670207752579464) q[13];
-cx q[5],q[13];
-rx(10.68827117953729) q[5];
-rx(10.68827117953729) q[13];
-rz(2.8670207752579464) q[14];
-cx q[3],q[14];
-cx q[3],q[15];
-cx q[4],q[14];
-rz(2.8670207752579464) q[14];
-cx q[4],q[14];
-rx(10.68827117953729) q[14];
-rz(2.8670207752579464) q[15];
-cx q[3],q[15];
-cx q[3],q[16];
-rx(10.68827117953729) q[15];
-rz(2.8670207752579464) q[16];
-cx q[3],q[16];
-rx(10.68827117953729) q[16];
-rz(2.8670207752579464) q[17];
-cx q[1],q[17];
-rx(10.68827117953729) q[1];
-cx q[3],q[17];
-rz(2.8670207752579464) q[17];
-cx q[3],q[17];
-rx(10.68827117953729) q[17];
-rx(7.700754974148575) q[18];
-cx q[3],q[18];
-rz(2.8670207752579464) q[18];
-cx q[3],q[18];
-rx(10.68827117953729) q[3];
-cx q[4],q[18];
-rz(2.8670207752579464) q[18];
-cx q[4],q[18];
-rx(10.68827117953729) q[4];
-rx(10.68827117953729) q[18];
\ No newline at end of file
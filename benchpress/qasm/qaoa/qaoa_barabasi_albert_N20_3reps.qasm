@@ -1,427 +0,0 @@
-OPENQASM 2.0;
-include "qelib1.inc";
-qreg q[20];
-ry(pi/2) q[0];
-rx(pi) q[0];
-ry(pi/2) q[1];
-rx(pi) q[1];
-cx q[0],q[1];
-rz(6.090573760019522) q[1];
-cx q[0],q[1];
-ry(pi/2) q[2];
-rx(pi) q[2];
-cx q[0],q[2];
-rz(6.090573760019522) q[2];
-cx q[0],q[2];
-rx(11.864826110553503) q[2];
-ry(pi/2) q[3];
-rx(pi) q[3];
-cx q[0],q[3];
-rz(6.090573760019522) q[3];
-cx q[0],q[3];
-cx q[1],q[3];
-rz(6.090573760019522) q[3];
-cx q[1],q[3];
-ry(pi/2) q[4];
-rx(pi) q[4];
-cx q[1],q[4];
-rz(6.090573760019522) q[4];
-cx q[1],q[4];
-cx q[3],q[4];
-rz(6.090573760019522) q[4];
-cx q[3],q[4];
-ry(pi/2) q[5];
-rx(pi) q[5];
-cx q[1],q[5];
-rz(6.090573760019522) q[5];
-cx q[1],q[5];
-cx q[3],q[5];
-rz(6.090573760019522) q[5];
-cx q[3],q[5];
-ry(pi/2) q[6];
-rx(pi) q[6];
-cx q[4],q[6];
-rz(6.090573760019522) q[6];
-cx q[4],q[6];
-cx q[5],q[6];
-rz(6.090573760019522) q[6];
-cx q[5],q[6];
-ry(pi/2) q[7];
-rx(pi) q[7];
-cx q[3],q[7];
-rz(6.090573760019522) q[7];
-cx q[3],q[7];
-cx q[4],q[7];
-rz(6.090573760019522) q[7];
-cx q[4],q[7];
-ry(pi/2) q[8];
-rx(pi) q[8];
-cx q[3],q[8];
-rz(6.090573760019522) q[8];
-cx q[3],q[8];
-cx q[5],q[8];
-rz(6.090573760019522) q[8];
-cx q[5],q[8];
-rx(11.864826110553503) q[8];
-ry(pi/2) q[9];
-rx(pi) q[9];
-cx q[1],q[9];
-rz(6.090573760019522) q[9];
-cx q[1],q[9];
-cx q[3],q[9];
-rz(6.090573760019522) q[9];
-cx q[3],q[9];
-rx(11.864826110553503) q[9];
-ry(pi/2) q[10];
-rx(pi) q[10];
-cx q[4],q[10];
-rz(6.090573760019522) q[10];
-cx q[4],q[10];
-cx q[6],q[10];
-rz(6.090573760019522) q[10];
-cx q[6],q[10];
-rx(11.864826110553503) q[10];
-ry(pi/2) q[11];
-rx(pi) q[11];
-cx q[5],q[11];
-rz(6.090573760019522) q[11];
-cx q[5],q[11];
-cx q[6],q[11];
-rz(6.090573760019522) q[11];
-cx q[6],q[11];
-rx(11.864826110553503) q[6];
-rx(11.864826110553503) q[11];
-ry(pi/2) q[12];
-rx(pi) q[12];
-cx q[3],q[12];
-rz(6.090573760019522) q[12];
-cx q[3],q[12];
-cx q[5],q[12];
-rz(6.090573760019522) q[12];
-cx q[5],q[12];
-rx(11.864826110553503) q[12];
-ry(pi/2) q[13];
-rx(pi) q[13];
-cx q[4],q[13];
-rz(6.090573760019522) q[13];
-cx q[4],q[13];
-cx q[5],q[13];
-rz(6.090573760019522) q[13];
-cx q[5],q[13];
-rx(11.864826110553503) q[5];
-rx(11.864826110553503) q[13];
-ry(pi/2) q[14];
-rx(pi) q[14];
-cx q[3],q[14];
-rz(6.090573760019522) q[14];
-cx q[3],q[14];
-cx q[4],q[14];
-rz(6.090573760019522) q[14];
-cx q[4],q[14];
-rx(11.864826110553503) q[14];
-ry(pi/2) q[15];
-rx(pi) q[15];
-cx q[0],q[15];
-rz(6.090573760019522) q[15];
-cx q[0],q[15];
-cx q[3],q[15];
-rz(6.090573760019522) q[15];
-cx q[3],q[15];
-rx(11.864826110553503) q[15];
-ry(pi/2) q[16];
-rx(pi) q[16];
-cx q[0],q[16];
-rz(6.090573760019522) q[16];
-cx q[0],q[16];
-rx(11.864826110553503) q[0];
-cx q[3],q[16];
-rz(6.090573760019522) q[16];
-cx q[3],q[16];
-rx(11.864826110553503) q[16];
-ry(pi/2) q[17];
-rx(pi) q[17];
-cx q[1],q[17];
-rz(6.090573760019522) q[17];
-cx q[1],q[17];
-rx(11.864826110553503) q[1];
-cx q[0],q[1];
-rz(3.7501502076206275) q[1];
-cx q[0],q[1];
-cx q[0],q[2];
-rz(3.7501502076206275) q[2];
-cx q[0],q[2];
-rx(3.90954626215964) q[2];
-cx q[3],q[17];
-rz(6.090573760019522) q[17];
-cx q[3],q[17];
-rx(11.864826110553503) q[17];
-ry(pi/2) q[18];
-rx(pi) q[18];
-cx q[3],q[18];
-rz(6.090573760019522) q[18];
-cx q[3],q[18];
-cx q[4],q[18];
-rz(6.090573760019522) q[18];
-cx q[4],q[18];
-rx(11.864826110553503) q[4];
-rx(11.864826110553503) q[18];
-ry(pi/2) q[19];
-rx(pi) q[19];
-cx q[3],q[19];
-rz(6.090573760019522) q[19];
-cx q[3],q[19];
-rx(11.864826110553503) q[3];
-cx q[0],q[3];
-rz(3.7501502076206275) q[3];
-cx q[0],q[3];
-cx q[0],q[15];
-cx q[1],q[3];
-rz(3.7501502076206275) q[3];
-cx q[1],q[3];
-cx q[1],q[4];
-rz(3.7501502076206275) q[4];
-cx q[1],q[4];
-cx q[1],q[5];
-cx q[3],q[4];
-rz(3.7501502076206275) q[4];
-cx q[3],q[4];
-cx q[4],q[6];
-rz(3.7501502076206275) q[5];
-cx q[1],q[5];
-cx q[1],q[9];
-cx q[3],q[5];
-rz(3.7501502076206275) q[5];
-cx q[3],q[5];
-rz(3.7501502076206275) q[6];
-cx q[4],q[6];
-cx q[5],q[6];
-rz(3.7501502076206275) q[6];
-cx q[5],q[6];
-cx q[7],q[19];
-rz(3.7501502076206275) q[9];
-cx q[1],q[9];
-cx q[1],q[17];
-rz(3.7501502076206275) q[15];
-cx q[0],q[15];
-cx q[0],q[16];
-rz(3.7501502076206275) q[16];
-cx q[0],q[16];
-rx(3.90954626215964) q[0];
-rz(3.7501502076206275) q[17];
-cx q[1],q[17];
-rx(3.90954626215964) q[1];
-cx q[0],q[1];
-rz(3.225940503367584) q[1];
-cx q[0],q[1];
-cx q[0],q[2];
-rz(3.225940503367584) q[2];
-cx q[0],q[2];
-rx(10.89914130828454) q[2];
-rz(6.090573760019522) q[19];
-cx q[7],q[19];
-rx(11.864826110553503) q[7];
-cx q[3],q[7];
-rz(3.7501502076206275) q[7];
-cx q[3],q[7];
-cx q[3],q[8];
-cx q[4],q[7];
-rz(3.7501502076206275) q[7];
-cx q[4],q[7];
-cx q[4],q[10];
-rz(3.7501502076206275) q[8];
-cx q[3],q[8];
-cx q[3],q[9];
-cx q[5],q[8];
-rz(3.7501502076206275) q[8];
-cx q[5],q[8];
-cx q[5],q[11];
-rx(3.90954626215964) q[8];
-rz(3.7501502076206275) q[9];
-cx q[3],q[9];
-cx q[3],q[12];
-rx(3.90954626215964) q[9];
-rz(3.7501502076206275) q[10];
-cx q[4],q[10];
-cx q[4],q[13];
-cx q[6],q[10];
-rz(3.7501502076206275) q[10];
-cx q[6],q[10];
-rx(3.90954626215964) q[10];
-rz(3.7501502076206275) q[11];
-cx q[5],q[11];
-cx q[6],q[11];
-rz(3.7501502076206275) q[11];
-cx q[6],q[11];
-rx(3.90954626215964) q[6];
-rx(3.90954626215964) q[11];
-rz(3.7501502076206275) q[12];
-cx q[3],q[12];
-cx q[3],q[14];
-cx q[5],q[12];
-rz(3.7501502076206275) q[12];
-cx q[5],q[12];
-rx(3.90954626215964) q[12];
-rz(3.7501502076206275) q[13];
-cx q[4],q[13];
-cx q[5],q[13];
-rz(3.7501502076206275) q[13];
-cx q[5],q[13];
-rx(3.90954626215964) q[5];
-rx(3.90954626215964) q[13];
-rz(3.7501502076206275) q[14];
-cx q[3],q[14];
-cx q[3],q[15];
-cx q[4],q[14];
-rz(3.7501502076206275) q[14];
-cx q[4],q[14];
-rx(3.90954626215964) q[14];
-rz(3.7501502076206275) q[15];
-cx q[3],q[15];
-cx q[3],q[16];
-rx(3.90954626215964) q[15];
-rz(3.7501502076206275) q[16];
-cx q[3],q[16];
-cx q[3],q[17];
-rx(3.90954626215964) q[16];
-rz(3.7501502076206275) q[17];
-cx q[3],q[17];
-cx q[3],q[18];
-rx(3.90954626215964) q[17];
-rz(3.7501502076206275) q[18];
-cx q[3],q[18];
-cx q[4],q[18];
-rz(3.7501502076206275) q[18];
-cx q[4],q[18];
-rx(3.90954626215964) q[4];
-rx(3.90954626215964) q[18];
-rx(11.864826110553503) q[19];
-cx q[3],q[19];
-rz(3.7501502076206275) q[19];
-cx q[3],q[19];
-rx(3.90954626215964) q[3];
-cx q[0],q[3];
-rz(3.225940503367584) q[3];
-cx q[0],q[3];
-cx q[0],q[15];
-cx q[1],q[3];
-rz(3.225940503367584) q[3];
-cx q[1],q[3];
-cx q[1],q[4];
-rz(3.225940503367584) q[4];
-cx q[1],q[4];
-cx q[1],q[5];
-cx q[3],q[4];
-rz(3.225940503367584) q[4];
-cx q[3],q[4];
-cx q[4],q[6];
-rz(3.225940503367584) q[5];
-cx q[1],q[5];
-cx q[1],q[9];
-cx q[3],q[5];
-rz(3.225940503367584) q[5];
-cx q[3],q[5];
-rz(3.225940503367584) q[6];
-cx q[4],q[6];
-cx q[5],q[6];
-rz(3.225940503367584) q[6];
-cx q[5],q[6];
-cx q[7],q[19];
-rz(3.225940503367584) q[9];
-cx q[1],q[9];
-cx q[1],q[17];
-rz(3.225940503367584) q[15];
-cx q[0],q[15];
-cx q[0],q[16];
-rz(3.225940503367584) q[16];
-cx q[0],q[16];
-rx(10.89914130828454) q[0];
-rz(3.225940503367584) q[17];
-cx q[1],q[17];
-rx(10.89914130828454) q[1];
-rz(3.7501502076206275) q[19];
-cx q[7],q[19];
-rx(3.90954626215964) q[7];
-cx q[3],q[7];
-rz(3.225940503367584) q[7];
-cx q[3],q[7];
-cx q[3],q[8];
-cx q[4],q[7];
-rz(3.225940503367584) q[7];
-cx q[4],q[7];
-cx q[4],q[10];
-rz(3.225940503367584) q[8];
-cx q[3],q[8];
-cx q[3],q[9];
-cx q[5],q[8];
-rz(3.225940503367584) q[8];
-cx q[5],q[8];
-cx q[5],q[11];
-rx(10.89914130828454) q[8];
-rz(3.225940503367584) q[9];
-cx q[3],q[9];
-cx q[3],q[12];
-rx(10.89914130828454) q[9];
-rz(3.225940503367584) q[10];
-cx q[4],q[10];
-cx q[4],q[13];
-cx q[6],q[10];
-rz(3.225940503367584) q[10];
-cx q[6],q[10];
-rx(10.89914130828454) q[10];
-rz(3.225940503367584) q[11];
-cx q[5],q[11];
-cx q[6],q[11];
-rz(3.225940503367584) q[11];
-cx q[6],q[11];
-rx(10.89914130828454) q[6];
-rx(10.89914130828454) q[11];
-rz(3.225940503367584) q[12];
-cx q[3],q[12];
-cx q[3],q[14];
-cx q[5],q[12];
-rz(3.225940503367584) q[12];
-cx q[5],q[12];
-rx(10.89914130828454) q[12];
-rz(3.225940503367584) q[13];
-cx q[4],q[13];
-cx q[5],q[13];
-rz(3.225940503367584) q[13];
-cx q[5],q[13];
-rx(10.89914130828454) q[5];
-rx(10.89914130828454) q[13];
-rz(3.225940503367584) q[14];
-cx q[3],q[14];
-cx q[3],q[15];
-cx q[4],q[14];
-rz(3.225940503367584) q[14];
-cx q[4],q[14];
-rx(10.89914130828454) q[14];
-rz(3.225940503367584) q[15];
-cx q[3],q[15];
-cx q[3],q[16];
-rx(10.89914130828454) q[15];
-rz(3.225940503367584) q[16];
-cx q[3],q[16];
-cx q[3],q[17];
-rx(10.89914130828454) q[16];
-rz(3.225940503367584) q[17];
-cx q[3],q[17];
-cx q[3],q[18];
-rx(10.89914130828454) q[17];
-rz(3.225940503367584) q[18];
-cx q[3],q[18];
-cx q[4],q[18];
-rz(3.225940503367584) q[18];
-cx q[4],q[18];
-rx(10.89914130828454) q[4];
-rx(10.89914130828454) q[18];
-rx(3.90954626215964) q[19];
-cx q[3],q[19];
-rz(3.225940503367584) q[19];
-cx q[3],q[19];
-rx(10.89914130828454) q[3];
-cx q[7],q[19];
-rz(3.225940503367584) q[19];
-cx q[7],q[19];
-rx(10.89914130828454) q[7];
-rx(10.89914130828454) q[19];
\ No newline at end of file
@@ -1,473 +0,0 @@
-OPENQASM 2.0;
-include "qelib1.inc";
-qreg q[22];
-ry(pi/2) q[0];
-rx(pi) q[0];
-ry(pi/2) q[1];
-rx(pi) q[1];
-cx q[0],q[1];
-rz(0.8493086851727482) q[1];
-cx q[0],q[1];
-ry(pi/2) q[2];
-rx(pi) q[2];
-cx q[0],q[2];
-rz(0.8493086851727482) q[2];
-cx q[0],q[2];
-rx(0.7208843914236391) q[2];
-ry(pi/2) q[3];
-rx(pi) q[3];
-cx q[0],q[3];
-rz(0.8493086851727482) q[3];
-cx q[0],q[3];
-cx q[1],q[3];
-rz(0.8493086851727482) q[3];
-cx q[1],q[3];
-ry(pi/2) q[4];
-rx(pi) q[4];
-cx q[1],q[4];
-rz(0.8493086851727482) q[4];
-cx q[1],q[4];
-cx q[3],q[4];
-rz(0.8493086851727482) q[4];
-cx q[3],q[4];
-ry(pi/2) q[5];
-rx(pi) q[5];
-cx q[1],q[5];
-rz(0.8493086851727482) q[5];
-cx q[1],q[5];
-cx q[3],q[5];
-rz(0.8493086851727482) q[5];
-cx q[3],q[5];
-ry(pi/2) q[6];
-rx(pi) q[6];
-cx q[4],q[6];
-rz(0.8493086851727482) q[6];
-cx q[4],q[6];
-cx q[5],q[6];
-rz(0.8493086851727482) q[6];
-cx q[5],q[6];
-ry(pi/2) q[7];
-rx(pi) q[7];
-cx q[3],q[7];
-rz(0.8493086851727482) q[7];
-cx q[3],q[7];
-cx q[4],q[7];
-rz(0.8493086851727482) q[7];
-cx q[4],q[7];
-ry(pi/2) q[8];
-rx(pi) q[8];
-cx q[3],q[8];
-rz(0.8493086851727482) q[8];
-cx q[3],q[8];
-cx q[5],q[8];
-rz(0.8493086851727482) q[8];
-cx q[5],q[8];
-rx(0.7208843914236391) q[8];
-ry(pi/2) q[9];
-rx(pi) q[9];
-cx q[1],q[9];
-rz(0.8493086851727482) q[9];
-cx q[1],q[9];
-cx q[3],q[9];
-rz(0.8493086851727482) q[9];
-cx q[3],q[9];
-rx(0.7208843914236391) q[9];
-ry(pi/2) q[10];
-rx(pi) q[10];
-cx q[4],q[10];
-rz(0.8493086851727482) q[10];
-cx q[4],q[10];
-cx q[6],q[10];
-rz(0.8493086851727482) q[10];
-cx q[6],q[10];
-rx(0.7208843914236391) q[10];
-ry(pi/2) q[11];
-rx(pi) q[11];
-cx q[5],q[11];
-rz(0.8493086851727482) q[11];
-cx q[5],q[11];
-cx q[6],q[11];
-rz(0.8493086851727482) q[11];
-cx q[6],q[11];
-rx(0.7208843914236391) q[6];
-rx(0.7208843914236391) q[11];
-ry(pi/2) q[12];
-rx(pi) q[12];
-cx q[3],q[12];
-rz(0.8493086851727482) q[12];
-cx q[3],q[12];
-cx q[5],q[12];
-rz(0.8493086851727482) q[12];
-cx q[5],q[12];
-rx(0.7208843914236391) q[12];
-ry(pi/2) q[13];
-rx(pi) q[13];
-cx q[4],q[13];
-rz(0.8493086851727482) q[13];
-cx q[4],q[13];
-cx q[5],q[13];
-rz(0.8493086851727482) q[13];
-cx q[5],q[13];
-rx(0.7208843914236391) q[5];
-rx(0.7208843914236391) q[13];
-ry(pi/2) q[14];
-rx(pi) q[14];
-cx q[3],q[14];
-rz(0.8493086851727482) q[14];
-cx q[3],q[14];
-cx q[4],q[14];
-rz(0.8493086851727482) q[14];
-cx q[4],q[14];
-rx(0.7208843914236391) q[14];
-ry(pi/2) q[15];
-rx(pi) q[15];
-cx q[0],q[15];
-rz(0.8493086851727482) q[15];
-cx q[0],q[15];
-cx q[3],q[15];
-rz(0.8493086851727482) q[15];
-cx q[3],q[15];
-ry(pi/2) q[16];
-rx(pi) q[16];
-cx q[0],q[16];
-rz(0.8493086851727482) q[16];
-cx q[0],q[16];
-cx q[3],q[16];
-rz(0.8493086851727482) q[16];
-cx q[3],q[16];
-rx(0.7208843914236391) q[16];
-ry(pi/2) q[17];
-rx(pi) q[17];
-cx q[1],q[17];
-rz(0.8493086851727482) q[17];
-cx q[1],q[17];
-rx(0.7208843914236391) q[1];
-cx q[3],q[17];
-rz(0.8493086851727482) q[17];
-cx q[3],q[17];
-rx(0.7208843914236391) q[17];
-ry(pi/2) q[18];
-rx(pi) q[18];
-cx q[3],q[18];
-rz(0.8493086851727482) q[18];
-cx q[3],q[18];
-cx q[4],q[18];
-rz(0.8493086851727482) q[18];
-cx q[4],q[18];
-rx(0.7208843914236391) q[18];
-ry(pi/2) q[19];
-rx(pi) q[19];
-cx q[3],q[19];
-rz(0.8493086851727482) q[19];
-cx q[3],q[19];
-rx(0.7208843914236391) q[3];
-cx q[7],q[19];
-rz(0.8493086851727482) q[19];
-cx q[7],q[19];
-rx(0.7208843914236391) q[7];
-rx(0.7208843914236391) q[19];
-ry(pi/2) q[20];
-rx(pi) q[20];
-cx q[0],q[20];
-rz(0.8493086851727482) q[20];
-cx q[0],q[20];
-rx(0.7208843914236391) q[0];
-cx q[0],q[1];
-rz(3.504734701982715) q[1];
-cx q[0],q[1];
-cx q[0],q[2];
-rz(3.504734701982715) q[2];
-cx q[0],q[2];
-cx q[0],q[3];
-rx(8.734442997464193) q[2];
-rz(3.504734701982715) q[3];
-cx q[0],q[3];
-cx q[1],q[3];
-rz(3.504734701982715) q[3];
-cx q[1],q[3];
-cx q[15],q[20];
-rz(0.8493086851727482) q[20];
-cx q[15],q[20];
-rx(0.7208843914236391) q[20];
-ry(pi/2) q[21];
-rx(pi) q[21];
-cx q[4],q[21];
-rz(0.8493086851727482) q[21];
-cx q[4],q[21];
-rx(0.7208843914236391) q[4];
-cx q[1],q[4];
-rz(3.504734701982715) q[4];
-cx q[1],q[4];
-cx q[1],q[5];
-cx q[3],q[4];
-rz(3.504734701982715) q[4];
-cx q[3],q[4];
-cx q[4],q[6];
-rz(3.504734701982715) q[5];
-cx q[1],q[5];
-cx q[1],q[9];
-cx q[3],q[5];
-rz(3.504734701982715) q[5];
-cx q[3],q[5];
-cx q[3],q[7];
-rz(3.504734701982715) q[6];
-cx q[4],q[6];
-cx q[5],q[6];
-rz(3.504734701982715) q[6];
-cx q[5],q[6];
-rz(3.504734701982715) q[7];
-cx q[3],q[7];
-cx q[3],q[8];
-cx q[4],q[7];
-rz(3.504734701982715) q[7];
-cx q[4],q[7];
-cx q[4],q[10];
-rz(3.504734701982715) q[8];
-cx q[3],q[8];
-cx q[5],q[8];
-rz(3.504734701982715) q[8];
-cx q[5],q[8];
-cx q[5],q[11];
-rx(8.734442997464193) q[8];
-rz(3.504734701982715) q[9];
-cx q[1],q[9];
-cx q[1],q[17];
-cx q[3],q[9];
-rz(3.504734701982715) q[9];
-cx q[3],q[9];
-cx q[3],q[12];
-rx(8.734442997464193) q[9];
-rz(3.504734701982715) q[10];
-cx q[4],q[10];
-cx q[4],q[13];
-cx q[6],q[10];
-rz(3.504734701982715) q[10];
-cx q[6],q[10];
-rx(8.734442997464193) q[10];
-rz(3.504734701982715) q[11];
-cx q[5],q[11];
-cx q[6],q[11];
-rz(3.504734701982715) q[11];
-cx q[6],q[11];
-rx(8.734442997464193) q[6];
-rx(8.734442997464193) q[11];
-rz(3.504734701982715) q[12];
-cx q[3],q[12];
-cx q[3],q[14];
-cx q[5],q[12];
-rz(3.504734701982715) q[12];
-cx q[5],q[12];
-rx(8.734442997464193) q[12];
-rz(3.504734701982715) q[13];
-cx q[4],q[13];
-cx q[5],q[13];
-rz(3.504734701982715) q[13];
-cx q[5],q[13];
-rx(8.734442997464193) q[5];
-rx(8.734442997464193) q[13];
-rz(3.504734701982715) q[14];
-cx q[3],q[14];
-cx q[4],q[14];
-rz(3.504734701982715) q[14];
-cx q[4],q[14];
-rx(8.734442997464193) q[14];
-cx q[15],q[21];
-rz(3.504734701982715) q[17];
-cx q[1],q[17];
-rx(8.734442997464193) q[1];
-rz(0.8493086851727482) q[21];
-cx q[15],q[21];
-rx(0.7208843914236391) q[15];
-cx q[0],q[15];
-rz(3.504734701982715) q[15];
-cx q[0],q[15];
-cx q[0],q[16];
-cx q[3],q[15];
-rz(3.504734701982715) q[15];
-cx q[3],q[15];
-rz(3.504734701982715) q[16];
-cx q[0],q[16];
-cx q[0],q[20];
-cx q[3],q[16];
-rz(3.504734701982715) q[16];
-cx q[3],q[16];
-cx q[3],q[17];
-rx(8.734442997464193) q[16];
-rz(3.504734701982715) q[17];
-cx q[3],q[17];
-cx q[3],q[18];
-rx(8.734442997464193) q[17];
-rz(3.504734701982715) q[18];
-cx q[3],q[18];
-cx q[3],q[19];
-cx q[4],q[18];
-rz(3.504734701982715) q[18];
-cx q[4],q[18];
-rx(8.734442997464193) q[18];
-rz(3.504734701982715) q[19];
-cx q[3],q[19];
-rx(8.734442997464193) q[3];
-cx q[7],q[19];
-rz(3.504734701982715) q[19];
-cx q[7],q[19];
-rx(8.734442997464193) q[7];
-rx(8.734442997464193) q[19];
-rz(3.504734701982715) q[20];
-cx q[0],q[20];
-rx(8.734442997464193) q[0];
-cx q[0],q[1];
-rz(4.69281390462514) q[1];
-cx q[0],q[1];
-cx q[0],q[2];
-rz(4.69281390462514) q[2];
-cx q[0],q[2];
-cx q[0],q[3];
-rx(9.53117886225584) q[2];
-rz(4.69281390462514) q[3];
-cx q[0],q[3];
-cx q[1],q[3];
-rz(4.69281390462514) q[3];
-cx q[1],q[3];
-cx q[15],q[20];
-rz(3.504734701982715) q[20];
-cx q[15],q[20];
-rx(8.734442997464193) q[20];
-rx(0.7208843914236391) q[21];
-cx q[4],q[21];
-rz(3.504734701982715) q[21];
-cx q[4],q[21];
-rx(8.734442997464193) q[4];
-cx q[1],q[4];
-rz(4.69281390462514) q[4];
-cx q[1],q[4];
-cx q[1],q[5];
-cx q[3],q[4];
-rz(4.69281390462514) q[4];
-cx q[3],q[4];
-cx q[4],q[6];
-rz(4.69281390462514) q[5];
-cx q[1],q[5];
-cx q[1],q[9];
-cx q[3],q[5];
-rz(4.69281390462514) q[5];
-cx q[3],q[5];
-cx q[3],q[7];
-rz(4.69281390462514) q[6];
-cx q[4],q[6];
-cx q[5],q[6];
-rz(4.69281390462514) q[6];
-cx q[5],q[6];
-rz(4.69281390462514) q[7];
-cx q[3],q[7];
-cx q[3],q[8];
-cx q[4],q[7];
-rz(4.69281390462514) q[7];
-cx q[4],q[7];
-cx q[4],q[10];
-rz(4.69281390462514) q[8];
-cx q[3],q[8];
-cx q[5],q[8];
-rz(4.69281390462514) q[8];
-cx q[5],q[8];
-cx q[5],q[11];
-rx(9.53117886225584) q[8];
-rz(4.69281390462514) q[9];
-cx q[1],q[9];
-cx q[1],q[17];
-cx q[3],q[9];
-rz(4.69281390462514) q[9];
-cx q[3],q[9];
-cx q[3],q[12];
-rx(9.53117886225584) q[9];
-rz(4.69281390462514) q[10];
-cx q[4],q[10];
-cx q[4],q[13];
-cx q[6],q[10];
-rz(4.69281390462514) q[10];
-cx q[6],q[10];
-rx(9.53117886225584) q[10];
-rz(4.69281390462514) q[11];
-cx q[5],q[11];
-cx q[6],q[11];
-rz(4.69281390462514) q[11];
-cx q[6],q[11];
-rx(9.53117886225584) q[6];
-rx(9.53117886225584) q[11];
-rz(4.69281390462514) q[12];
-cx q[3],q[12];
-cx q[3],q[14];
-cx q[5],q[12];
-rz(4.69281390462514) q[12];
-cx q[5],q[12];
-rx(9.53117886225584) q[12];
-rz(4.69281390462514) q[13];
-cx q[4],q[13];
-cx q[5],q[13];
-rz(4.69281390462514) q[13];
-cx q[5],q[13];
-rx(9.53117886225584) q[5];
-rx(9.53117886225584) q[13];
-rz(4.69281390462514) q[14];
-cx q[3],q[14];
-cx q[4],q[14];
-rz(4.69281390462514) q[14];
-cx q[4],q[14];
-rx(9.53117886225584) q[14];
-cx q[15],q[21];
-rz(4.69281390462514) q[17];
-cx q[1],q[17];
-rx(9.53117886225584) q[1];
-rz(3.504734701982715) q[21];
-cx q[15],q[21];
-rx(8.734442997464193) q[15];
-cx q[0],q[15];
-rz(4.69281390462514) q[15];
-cx q[0],q[15];
-cx q[0],q[16];
-cx q[3],q[15];
-rz(4.69281390462514) q[15];
-cx q[3],q[15];
-rz(4.69281390462514) q[16];
-cx q[0],q[16];
-cx q[0],q[20];
-cx q[3],q[16];
-rz(4.69281390462514) q[16];
-cx q[3],q[16];
-cx q[3],q[17];
-rx(9.53117886225584) q[16];
-rz(4.69281390462514) q[17];
-cx q[3],q[17];
-cx q[3],q[18];
-rx(9.53117886225584) q[17];
-rz(4.69281390462514) q[18];
-cx q[3],q[18];
-cx q[3],q[19];
-cx q[4],q[18];
-rz(4.69281390462514) q[18];
-cx q[4],q[18];
-rx(9.53117886225584) q[18];
-rz(4.69281390462514) q[19];
-cx q[3],q[19];
-rx(9.53117886225584) q[3];
-cx q[7],q[19];
-rz(4.69281390462514) q[19];
-cx q[7],q[19];
-rx(9.53117886225584) q[7];
-rx(9.53117886225584) q[19];
-rz(4.69281390462514) q[20];
-cx q[0],q[20];
-rx(9.53117886225584) q[0];
-cx q[15],q[20];
-rz(4.69281390462514) q[20];
-cx q[15],q[20];
-rx(9.53117886225584) q[20];
-rx(8.734442997464193) q[21];
-cx q[4],q[21];
-rz(4.69281390462514) q[21];
-cx q[4],q[21];
-rx(9.53117886225584) q[4];
-cx q[15],q[21];
-rz(4.69281390462514) q[21];
-cx q[15],q[21];
-rx(9.53117886225584) q[15];
-rx(9.53117886225584) q[21];
\ No newline at end of file
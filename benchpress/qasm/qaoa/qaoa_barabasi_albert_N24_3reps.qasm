@@ -1,519 +0,0 @@
-OPENQASM 2.0;
-include "qelib1.inc";
-qreg q[24];
-ry(pi/2) q[0];
-rx(pi) q[0];
-ry(pi/2) q[1];
-rx(pi) q[1];
-cx q[0],q[1];
-rz(4.025476218961138) q[1];
-cx q[0],q[1];
-ry(pi/2) q[2];
-rx(pi) q[2];
-cx q[0],q[2];
-rz(4.025476218961138) q[2];
-cx q[0],q[2];
-rx(11.035310474051688) q[2];
-ry(pi/2) q[3];
-rx(pi) q[3];
-cx q[0],q[3];
-rz(4.025476218961138) q[3];
-cx q[0],q[3];
-cx q[1],q[3];
-rz(4.025476218961138) q[3];
-cx q[1],q[3];
-ry(pi/2) q[4];
-rx(pi) q[4];
-cx q[1],q[4];
-rz(4.025476218961138) q[4];
-cx q[1],q[4];
-cx q[3],q[4];
-rz(4.025476218961138) q[4];
-cx q[3],q[4];
-ry(pi/2) q[5];
-rx(pi) q[5];
-cx q[1],q[5];
-rz(4.025476218961138) q[5];
-cx q[1],q[5];
-cx q[3],q[5];
-rz(4.025476218961138) q[5];
-cx q[3],q[5];
-ry(pi/2) q[6];
-rx(pi) q[6];
-cx q[4],q[6];
-rz(4.025476218961138) q[6];
-cx q[4],q[6];
-cx q[5],q[6];
-rz(4.025476218961138) q[6];
-cx q[5],q[6];
-ry(pi/2) q[7];
-rx(pi) q[7];
-cx q[3],q[7];
-rz(4.025476218961138) q[7];
-cx q[3],q[7];
-cx q[4],q[7];
-rz(4.025476218961138) q[7];
-cx q[4],q[7];
-ry(pi/2) q[8];
-rx(pi) q[8];
-cx q[3],q[8];
-rz(4.025476218961138) q[8];
-cx q[3],q[8];
-cx q[5],q[8];
-rz(4.025476218961138) q[8];
-cx q[5],q[8];
-rx(11.035310474051688) q[8];
-ry(pi/2) q[9];
-rx(pi) q[9];
-cx q[1],q[9];
-rz(4.025476218961138) q[9];
-cx q[1],q[9];
-cx q[3],q[9];
-rz(4.025476218961138) q[9];
-cx q[3],q[9];
-ry(pi/2) q[10];
-rx(pi) q[10];
-cx q[4],q[10];
-rz(4.025476218961138) q[10];
-cx q[4],q[10];
-cx q[6],q[10];
-rz(4.025476218961138) q[10];
-cx q[6],q[10];
-rx(11.035310474051688) q[10];
-ry(pi/2) q[11];
-rx(pi) q[11];
-cx q[5],q[11];
-rz(4.025476218961138) q[11];
-cx q[5],q[11];
-cx q[6],q[11];
-rz(4.025476218961138) q[11];
-cx q[6],q[11];
-rx(11.035310474051688) q[6];
-rx(11.035310474051688) q[11];
-ry(pi/2) q[12];
-rx(pi) q[12];
-cx q[3],q[12];
-rz(4.025476218961138) q[12];
-cx q[3],q[12];
-cx q[5],q[12];
-rz(4.025476218961138) q[12];
-cx q[5],q[12];
-rx(11.035310474051688) q[12];
-ry(pi/2) q[13];
-rx(pi) q[13];
-cx q[4],q[13];
-rz(4.025476218961138) q[13];
-cx q[4],q[13];
-cx q[5],q[13];
-rz(4.025476218961138) q[13];
-cx q[5],q[13];
-rx(11.035310474051688) q[5];
-rx(11.035310474051688) q[13];
-ry(pi/2) q[14];
-rx(pi) q[14];
-cx q[3],q[14];
-rz(4.025476218961138) q[14];
-cx q[3],q[14];
-cx q[4],q[14];
-rz(4.025476218961138) q[14];
-cx q[4],q[14];
-rx(11.035310474051688) q[14];
-ry(pi/2) q[15];
-rx(pi) q[15];
-cx q[0],q[15];
-rz(4.025476218961138) q[15];
-cx q[0],q[15];
-cx q[3],q[15];
-rz(4.025476218961138) q[15];
-cx q[3],q[15];
-ry(pi/2) q[16];
-rx(pi) q[16];
-cx q[0],q[16];
-rz(4.025476218961138) q[16];
-cx q[0],q[16];
-cx q[3],q[16];
-rz(4.025476218961138) q[16];
-cx q[3],q[16];
-rx(11.035310474051688) q[16];
-ry(pi/2) q[17];
-rx(pi) q[17];
-cx q[1],q[17];
-rz(4.025476218961138) q[17];
-cx q[1],q[17];
-rx(11.035310474051688) q[1];
-cx q[3],q[17];
-rz(4.025476218961138) q[17];
-cx q[3],q[17];
-ry(pi/2) q[18];
-rx(pi) q[18];
-cx q[3],q[18];
-rz(4.025476218961138) q[18];
-cx q[3],q[18];
-cx q[4],q[18];
-rz(4.025476218961138) q[18];
-cx q[4],q[18];
-rx(11.035310474051688) q[18];
-ry(pi/2) q[19];
-rx(pi) q[19];
-cx q[3],q[19];
-rz(4.025476218961138) q[19];
-cx q[3],q[19];
-cx q[7],q[19];
-rz(4.025476218961138) q[19];
-cx q[7],q[19];
-rx(11.035310474051688) q[7];
-rx(11.035310474051688) q[19];
-ry(pi/2) q[20];
-rx(pi) q[20];
-cx q[0],q[20];
-rz(4.025476218961138) q[20];
-cx q[0],q[20];
-rx(11.035310474051688) q[0];
-cx q[0],q[1];
-rz(2.6524291223271126) q[1];
-cx q[0],q[1];
-cx q[0],q[2];
-rz(2.6524291223271126) q[2];
-cx q[0],q[2];
-rx(7.469893830216912) q[2];
-cx q[15],q[20];
-rz(4.025476218961138) q[20];
-cx q[15],q[20];
-rx(11.035310474051688) q[20];
-ry(pi/2) q[21];
-rx(pi) q[21];
-cx q[4],q[21];
-rz(4.025476218961138) q[21];
-cx q[4],q[21];
-rx(11.035310474051688) q[4];
-cx q[15],q[21];
-rz(4.025476218961138) q[21];
-cx q[15],q[21];
-rx(11.035310474051688) q[15];
-rx(11.035310474051688) q[21];
-ry(pi/2) q[22];
-rx(pi) q[22];
-cx q[3],q[22];
-rz(4.025476218961138) q[22];
-cx q[3],q[22];
-cx q[9],q[22];
-rz(4.025476218961138) q[22];
-cx q[9],q[22];
-rx(11.035310474051688) q[9];
-rx(11.035310474051688) q[22];
-ry(pi/2) q[23];
-rx(pi) q[23];
-cx q[3],q[23];
-rz(4.025476218961138) q[23];
-cx q[3],q[23];
-rx(11.035310474051688) q[3];
-cx q[0],q[3];
-rz(2.6524291223271126) q[3];
-cx q[0],q[3];
-cx q[0],q[15];
-cx q[1],q[3];
-rz(2.6524291223271126) q[3];
-cx q[1],q[3];
-cx q[1],q[4];
-rz(2.6524291223271126) q[4];
-cx q[1],q[4];
-cx q[1],q[5];
-cx q[3],q[4];
-rz(2.6524291223271126) q[4];
-cx q[3],q[4];
-cx q[4],q[6];
-rz(2.6524291223271126) q[5];
-cx q[1],q[5];
-cx q[1],q[9];
-cx q[3],q[5];
-rz(2.6524291223271126) q[5];
-cx q[3],q[5];
-cx q[3],q[7];
-rz(2.6524291223271126) q[6];
-cx q[4],q[6];
-cx q[5],q[6];
-rz(2.6524291223271126) q[6];
-cx q[5],q[6];
-rz(2.6524291223271126) q[7];
-cx q[3],q[7];
-cx q[3],q[8];
-cx q[4],q[7];
-rz(2.6524291223271126) q[7];
-cx q[4],q[7];
-cx q[4],q[10];
-rz(2.6524291223271126) q[8];
-cx q[3],q[8];
-cx q[5],q[8];
-rz(2.6524291223271126) q[8];
-cx q[5],q[8];
-cx q[5],q[11];
-rx(7.469893830216912) q[8];
-rz(2.6524291223271126) q[9];
-cx q[1],q[9];
-cx q[3],q[9];
-rz(2.6524291223271126) q[9];
-cx q[3],q[9];
-cx q[3],q[12];
-rz(2.6524291223271126) q[10];
-cx q[4],q[10];
-cx q[4],q[13];
-cx q[6],q[10];
-rz(2.6524291223271126) q[10];
-cx q[6],q[10];
-rx(7.469893830216912) q[10];
-rz(2.6524291223271126) q[11];
-cx q[5],q[11];
-cx q[6],q[11];
-rz(2.6524291223271126) q[11];
-cx q[6],q[11];
-rx(7.469893830216912) q[6];
-rx(7.469893830216912) q[11];
-rz(2.6524291223271126) q[12];
-cx q[3],q[12];
-cx q[3],q[14];
-cx q[5],q[12];
-rz(2.6524291223271126) q[12];
-cx q[5],q[12];
-rx(7.469893830216912) q[12];
-rz(2.6524291223271126) q[13];
-cx q[4],q[13];
-cx q[5],q[13];
-rz(2.6524291223271126) q[13];
-cx q[5],q[13];
-rx(7.469893830216912) q[5];
-rx(7.469893830216912) q[13];
-rz(2.6524291223271126) q[14];
-cx q[3],q[14];
-cx q[4],q[14];
-rz(2.6524291223271126) q[14];
-cx q[4],q[14];
-rx(7.469893830216912) q[14];
-rz(2.6524291223271126) q[15];
-cx q[0],q[15];
-cx q[0],q[16];
-cx q[3],q[15];
-rz(2.6524291223271126) q[15];
-cx q[3],q[15];
-rz(2.6524291223271126) q[16];
-cx q[0],q[16];
-cx q[0],q[20];
-cx q[3],q[16];
-rz(2.6524291223271126) q[16];
-cx q[3],q[16];
-rx(7.469893830216912) q[16];
-cx q[17],q[23];
-rz(2.6524291223271126) q[20];
-cx q[0],q[20];
-rx(7.469893830216912) q[0];
-cx q[15],q[20];
-rz(2.6524291223271126) q[20];
-cx q[15],q[20];
-rx(7.469893830216912) q[20];
-rz(4.025476218961138) q[23];
-cx q[17],q[23];
-rx(11.035310474051688) q[17];
-cx q[1],q[17];
-rz(2.6524291223271126) q[17];
-cx q[1],q[17];
-rx(7.469893830216912) q[1];
-cx q[0],q[1];
-rz(1.7014633044231688) q[1];
-cx q[0],q[1];
-cx q[0],q[2];
-rz(1.7014633044231688) q[2];
-cx q[0],q[2];
-rx(9.577696178063379) q[2];
-cx q[3],q[17];
-rz(2.6524291223271126) q[17];
-cx q[3],q[17];
-cx q[3],q[18];
-rz(2.6524291223271126) q[18];
-cx q[3],q[18];
-cx q[3],q[19];
-cx q[4],q[18];
-rz(2.6524291223271126) q[18];
-cx q[4],q[18];
-cx q[4],q[21];
-rx(7.469893830216912) q[18];
-rz(2.6524291223271126) q[19];
-cx q[3],q[19];
-cx q[3],q[22];
-cx q[7],q[19];
-rz(2.6524291223271126) q[19];
-cx q[7],q[19];
-rx(7.469893830216912) q[7];
-rx(7.469893830216912) q[19];
-rz(2.6524291223271126) q[21];
-cx q[4],q[21];
-rx(7.469893830216912) q[4];
-cx q[15],q[21];
-rz(2.6524291223271126) q[21];
-cx q[15],q[21];
-rx(7.469893830216912) q[15];
-rx(7.469893830216912) q[21];
-rz(2.6524291223271126) q[22];
-cx q[3],q[22];
-cx q[9],q[22];
-rz(2.6524291223271126) q[22];
-cx q[9],q[22];
-rx(7.469893830216912) q[9];
-rx(7.469893830216912) q[22];
-rx(11.035310474051688) q[23];
-cx q[3],q[23];
-rz(2.6524291223271126) q[23];
-cx q[3],q[23];
-rx(7.469893830216912) q[3];
-cx q[0],q[3];
-rz(1.7014633044231688) q[3];
-cx q[0],q[3];
-cx q[0],q[15];
-cx q[1],q[3];
-rz(1.7014633044231688) q[3];
-cx q[1],q[3];
-cx q[1],q[4];
-rz(1.7014633044231688) q[4];
-cx q[1],q[4];
-cx q[1],q[5];
-cx q[3],q[4];
-rz(1.7014633044231688) q[4];
-cx q[3],q[4];
-cx q[4],q[6];
-rz(1.7014633044231688) q[5];
-cx q[1],q[5];
-cx q[1],q[9];
-cx q[3],q[5];
-rz(1.7014633044231688) q[5];
-cx q[3],q[5];
-cx q[3],q[7];
-rz(1.7014633044231688) q[6];
-cx q[4],q[6];
-cx q[5],q[6];
-rz(1.7014633044231688) q[6];
-cx q[5],q[6];
-rz(1.7014633044231688) q[7];
-cx q[3],q[7];
-cx q[3],q[8];
-cx q[4],q[7];
-rz(1.7014633044231688) q[7];
-cx q[4],q[7];
-cx q[4],q[10];
-rz(1.7014633044231688) q[8];
-cx q[3],q[8];
-cx q[5],q[8];
-rz(1.7014633044231688) q[8];
-cx q[5],q[8];
-cx q[5],q[11];
-rx(9.577696178063379) q[8];
-rz(1.7014633044231688) q[9];
-cx q[1],q[9];
-cx q[3],q[9];
-rz(1.7014633044231688) q[9];
-cx q[3],q[9];
-cx q[3],q[12];
-rz(1.7014633044231688) q[10];
-cx q[4],q[10];
-cx q[4],q[13];
-cx q[6],q[10];
-rz(1.7014633044231688) q[10];
-cx q[6],q[10];
-rx(9.577696178063379) q[10];
-rz(1.7014633044231688) q[11];
-cx q[5],q[11];
-cx q[6],q[11];
-rz(1.7014633044231688) q[11];
-cx q[6],q[11];
-rx(9.577696178063379) q[6];
-rx(9.577696178063379) q[11];
-rz(1.7014633044231688) q[12];
-cx q[3],q[12];
-cx q[3],q[14];
-cx q[5],q[12];
-rz(1.7014633044231688) q[12];
-cx q[5],q[12];
-rx(9.577696178063379) q[12];
-rz(1.7014633044231688) q[13];
-cx q[4],q[13];
-cx q[5],q[13];
-rz(1.7014633044231688) q[13];
-cx q[5],q[13];
-rx(9.577696178063379) q[5];
-rx(9.577696178063379) q[13];
-rz(1.7014633044231688) q[14];
-cx q[3],q[14];
-cx q[4],q[14];
-rz(1.7014633044231688) q[14];
-cx q[4],q[14];
-rx(9.577696178063379) q[14];
-rz(1.7014633044231688) q[15];
-cx q[0],q[15];
-cx q[0],q[16];
-cx q[3],q[15];
-rz(1.7014633044231688) q[15];
-cx q[3],q[15];
-rz(1.7014633044231688) q[16];
-cx q[0],q[16];
-cx q[0],q[20];
-cx q[3],q[16];
-rz(1.7014633044231688) q[16];
-cx q[3],q[16];
-rx(9.577696178063379) q[16];
-cx q[17],q[23];
-rz(1.7014633044231688) q[20];
-cx q[0],q[20];
-rx(9.577696178063379) q[0];
-cx q[15],q[20];
-rz(1.7014633044231688) q[20];
-cx q[15],q[20];
-rx(9.577696178063379) q[20];
-rz(2.6524291223271126) q[23];
-cx q[17],q[23];
-rx(7.469893830216912) q[17];
-cx q[1],q[17];
-rz(1.7014633044231688) q[17];
-cx q[1],q[17];
-rx(9.577696178063379) q[1];
-cx q[3],q[17];
-rz(1.7014633044231688) q[17];
-cx q[3],q[17];
-cx q[3],q[18];
-rz(1.7014633044231688) q[18];
-cx q[3],q[18];
-cx q[3],q[19];
-cx q[4],q[18];
-rz(1.7014633044231688) q[18];
-cx q[4],q[18];
-cx q[4],q[21];
-rx(9.577696178063379) q[18];
-rz(1.7014633044231688) q[19];
-cx q[3],q[19];
-cx q[3],q[22];
-cx q[7],q[19];
-rz(1.7014633044231688) q[19];
-cx q[7],q[19];
-rx(9.577696178063379) q[7];
-rx(9.577696178063379) q[19];
-rz(1.7014633044231688) q[21];
-cx q[4],q[21];
-rx(9.577696178063379) q[4];
-cx q[15],q[21];
-rz(1.7014633044231688) q[21];
-cx q[15],q[21];
-rx(9.577696178063379) q[15];
-rx(9.577696178063379) q[21];
-rz(1.7014633044231688) q[22];
-cx q[3],q[22];
-cx q[9],q[22];
-rz(1.7014633044231688) q[22];
-cx q[9],q[22];
-rx(9.577696178063379) q[9];
-rx(9.577696178063379) q[22];
-rx(7.469893830216912) q[23];
-cx q[3],q[23];
-rz(1.7014633044231688) q[23];
-cx q[3],q[23];
-rx(9.577696178063379) q[3];
-cx q[17],q[23];
-rz(1.7014633044231688) q[23];
-cx q[17],q[23];
-rx(9.577696178063379) q[17];
-rx(9.577696178063379) q[23];
\ No newline at end of file
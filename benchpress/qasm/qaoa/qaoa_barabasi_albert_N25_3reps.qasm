@@ -1,542 +0,0 @@
-OPENQASM 2.0;
-include "qelib1.inc";
-qreg q[25];
-ry(pi/2) q[0];
-rx(pi) q[0];
-ry(pi/2) q[1];
-rx(pi) q[1];
-cx q[0],q[1];
-rz(4.518803981299676) q[1];
-cx q[0],q[1];
-ry(pi/2) q[2];
-rx(pi) q[2];
-cx q[0],q[2];
-rz(4.518803981299676) q[2];
-cx q[0],q[2];
-rx(5.321535547733308) q[2];
-ry(pi/2) q[3];
-rx(pi) q[3];
-cx q[0],q[3];
-rz(4.518803981299676) q[3];
-cx q[0],q[3];
-cx q[1],q[3];
-rz(4.518803981299676) q[3];
-cx q[1],q[3];
-ry(pi/2) q[4];
-rx(pi) q[4];
-cx q[1],q[4];
-rz(4.518803981299676) q[4];
-cx q[1],q[4];
-cx q[3],q[4];
-rz(4.518803981299676) q[4];
-cx q[3],q[4];
-ry(pi/2) q[5];
-rx(pi) q[5];
-cx q[1],q[5];
-rz(4.518803981299676) q[5];
-cx q[1],q[5];
-cx q[3],q[5];
-rz(4.518803981299676) q[5];
-cx q[3],q[5];
-ry(pi/2) q[6];
-rx(pi) q[6];
-cx q[4],q[6];
-rz(4.518803981299676) q[6];
-cx q[4],q[6];
-cx q[5],q[6];
-rz(4.518803981299676) q[6];
-cx q[5],q[6];
-ry(pi/2) q[7];
-rx(pi) q[7];
-cx q[3],q[7];
-rz(4.518803981299676) q[7];
-cx q[3],q[7];
-cx q[4],q[7];
-rz(4.518803981299676) q[7];
-cx q[4],q[7];
-ry(pi/2) q[8];
-rx(pi) q[8];
-cx q[3],q[8];
-rz(4.518803981299676) q[8];
-cx q[3],q[8];
-cx q[5],q[8];
-rz(4.518803981299676) q[8];
-cx q[5],q[8];
-rx(5.321535547733308) q[8];
-ry(pi/2) q[9];
-rx(pi) q[9];
-cx q[1],q[9];
-rz(4.518803981299676) q[9];
-cx q[1],q[9];
-cx q[3],q[9];
-rz(4.518803981299676) q[9];
-cx q[3],q[9];
-ry(pi/2) q[10];
-rx(pi) q[10];
-cx q[4],q[10];
-rz(4.518803981299676) q[10];
-cx q[4],q[10];
-cx q[6],q[10];
-rz(4.518803981299676) q[10];
-cx q[6],q[10];
-rx(5.321535547733308) q[10];
-ry(pi/2) q[11];
-rx(pi) q[11];
-cx q[5],q[11];
-rz(4.518803981299676) q[11];
-cx q[5],q[11];
-cx q[6],q[11];
-rz(4.518803981299676) q[11];
-cx q[6],q[11];
-rx(5.321535547733308) q[6];
-rx(5.321535547733308) q[11];
-ry(pi/2) q[12];
-rx(pi) q[12];
-cx q[3],q[12];
-rz(4.518803981299676) q[12];
-cx q[3],q[12];
-cx q[5],q[12];
-rz(4.518803981299676) q[12];
-cx q[5],q[12];
-rx(5.321535547733308) q[12];
-ry(pi/2) q[13];
-rx(pi) q[13];
-cx q[4],q[13];
-rz(4.518803981299676) q[13];
-cx q[4],q[13];
-cx q[5],q[13];
-rz(4.518803981299676) q[13];
-cx q[5],q[13];
-rx(5.321535547733308) q[13];
-ry(pi/2) q[14];
-rx(pi) q[14];
-cx q[3],q[14];
-rz(4.518803981299676) q[14];
-cx q[3],q[14];
-cx q[4],q[14];
-rz(4.518803981299676) q[14];
-cx q[4],q[14];
-rx(5.321535547733308) q[14];
-ry(pi/2) q[15];
-rx(pi) q[15];
-cx q[0],q[15];
-rz(4.518803981299676) q[15];
-cx q[0],q[15];
-cx q[3],q[15];
-rz(4.518803981299676) q[15];
-cx q[3],q[15];
-ry(pi/2) q[16];
-rx(pi) q[16];
-cx q[0],q[16];
-rz(4.518803981299676) q[16];
-cx q[0],q[16];
-cx q[3],q[16];
-rz(4.518803981299676) q[16];
-cx q[3],q[16];
-rx(5.321535547733308) q[16];
-ry(pi/2) q[17];
-rx(pi) q[17];
-cx q[1],q[17];
-rz(4.518803981299676) q[17];
-cx q[1],q[17];
-rx(5.321535547733308) q[1];
-cx q[3],q[17];
-rz(4.518803981299676) q[17];
-cx q[3],q[17];
-ry(pi/2) q[18];
-rx(pi) q[18];
-cx q[3],q[18];
-rz(4.518803981299676) q[18];
-cx q[3],q[18];
-cx q[4],q[18];
-rz(4.518803981299676) q[18];
-cx q[4],q[18];
-rx(5.321535547733308) q[18];
-ry(pi/2) q[19];
-rx(pi) q[19];
-cx q[3],q[19];
-rz(4.518803981299676) q[19];
-cx q[3],q[19];
-cx q[7],q[19];
-rz(4.518803981299676) q[19];
-cx q[7],q[19];
-rx(5.321535547733308) q[7];
-rx(5.321535547733308) q[19];
-ry(pi/2) q[20];
-rx(pi) q[20];
-cx q[0],q[20];
-rz(4.518803981299676) q[20];
-cx q[0],q[20];
-rx(5.321535547733308) q[0];
-cx q[0],q[1];
-rz(1.0396602723702757) q[1];
-cx q[0],q[1];
-cx q[0],q[2];
-rz(1.0396602723702757) q[2];
-cx q[0],q[2];
-rx(6.946799221515127) q[2];
-cx q[15],q[20];
-rz(4.518803981299676) q[20];
-cx q[15],q[20];
-rx(5.321535547733308) q[20];
-ry(pi/2) q[21];
-rx(pi) q[21];
-cx q[4],q[21];
-rz(4.518803981299676) q[21];
-cx q[4],q[21];
-rx(5.321535547733308) q[4];
-cx q[15],q[21];
-rz(4.518803981299676) q[21];
-cx q[15],q[21];
-rx(5.321535547733308) q[15];
-rx(5.321535547733308) q[21];
-ry(pi/2) q[22];
-rx(pi) q[22];
-cx q[3],q[22];
-rz(4.518803981299676) q[22];
-cx q[3],q[22];
-cx q[9],q[22];
-rz(4.518803981299676) q[22];
-cx q[9],q[22];
-rx(5.321535547733308) q[9];
-rx(5.321535547733308) q[22];
-ry(pi/2) q[23];
-rx(pi) q[23];
-cx q[3],q[23];
-rz(4.518803981299676) q[23];
-cx q[3],q[23];
-cx q[17],q[23];
-rz(4.518803981299676) q[23];
-cx q[17],q[23];
-rx(5.321535547733308) q[17];
-rx(5.321535547733308) q[23];
-ry(pi/2) q[24];
-rx(pi) q[24];
-cx q[3],q[24];
-rz(4.518803981299676) q[24];
-cx q[3],q[24];
-rx(5.321535547733308) q[3];
-cx q[0],q[3];
-rz(1.0396602723702757) q[3];
-cx q[0],q[3];
-cx q[0],q[15];
-cx q[1],q[3];
-rz(1.0396602723702757) q[3];
-cx q[1],q[3];
-cx q[1],q[4];
-rz(1.0396602723702757) q[4];
-cx q[1],q[4];
-cx q[3],q[4];
-rz(1.0396602723702757) q[4];
-cx q[3],q[4];
-cx q[4],q[6];
-cx q[5],q[24];
-rz(1.0396602723702757) q[6];
-cx q[4],q[6];
-rz(1.0396602723702757) q[15];
-cx q[0],q[15];
-cx q[0],q[16];
-rz(1.0396602723702757) q[16];
-cx q[0],q[16];
-cx q[0],q[20];
-rz(1.0396602723702757) q[20];
-cx q[0],q[20];
-rx(6.946799221515127) q[0];
-rz(4.518803981299676) q[24];
-cx q[5],q[24];
-rx(5.321535547733308) q[5];
-cx q[1],q[5];
-rz(1.0396602723702757) q[5];
-cx q[1],q[5];
-cx q[1],q[9];
-cx q[3],q[5];
-rz(1.0396602723702757) q[5];
-cx q[3],q[5];
-cx q[3],q[7];
-cx q[5],q[6];
-rz(1.0396602723702757) q[6];
-cx q[5],q[6];
-rz(1.0396602723702757) q[7];
-cx q[3],q[7];
-cx q[3],q[8];
-cx q[4],q[7];
-rz(1.0396602723702757) q[7];
-cx q[4],q[7];
-cx q[4],q[10];
-rz(1.0396602723702757) q[8];
-cx q[3],q[8];
-cx q[5],q[8];
-rz(1.0396602723702757) q[8];
-cx q[5],q[8];
-cx q[5],q[11];
-rx(6.946799221515127) q[8];
-rz(1.0396602723702757) q[9];
-cx q[1],q[9];
-cx q[1],q[17];
-cx q[3],q[9];
-rz(1.0396602723702757) q[9];
-cx q[3],q[9];
-cx q[3],q[12];
-rz(1.0396602723702757) q[10];
-cx q[4],q[10];
-cx q[4],q[13];
-cx q[6],q[10];
-rz(1.0396602723702757) q[10];
-cx q[6],q[10];
-rx(6.946799221515127) q[10];
-rz(1.0396602723702757) q[11];
-cx q[5],q[11];
-cx q[6],q[11];
-rz(1.0396602723702757) q[11];
-cx q[6],q[11];
-rx(6.946799221515127) q[6];
-rx(6.946799221515127) q[11];
-rz(1.0396602723702757) q[12];
-cx q[3],q[12];
-cx q[3],q[14];
-cx q[5],q[12];
-rz(1.0396602723702757) q[12];
-cx q[5],q[12];
-rx(6.946799221515127) q[12];
-rz(1.0396602723702757) q[13];
-cx q[4],q[13];
-cx q[5],q[13];
-rz(1.0396602723702757) q[13];
-cx q[5],q[13];
-rx(6.946799221515127) q[13];
-rz(1.0396602723702757) q[14];
-cx q[3],q[14];
-cx q[3],q[15];
-cx q[4],q[14];
-rz(1.0396602723702757) q[14];
-cx q[4],q[14];
-rx(6.946799221515127) q[14];
-rz(1.0396602723702757) q[15];
-cx q[3],q[15];
-cx q[3],q[16];
-cx q[15],q[20];
-rz(1.0396602723702757) q[16];
-cx q[3],q[16];
-rx(6.946799221515127) q[16];
-rz(1.0396602723702757) q[17];
-cx q[1],q[17];
-rx(6.946799221515127) q[1];
-cx q[0],q[1];
-rz(4.544032137528854) q[1];
-cx q[0],q[1];
-cx q[0],q[2];
-rz(4.544032137528854) q[2];
-cx q[0],q[2];
-rx(4.89236023028999) q[2];
-cx q[3],q[17];
-rz(1.0396602723702757) q[17];
-cx q[3],q[17];
-cx q[3],q[18];
-rz(1.0396602723702757) q[18];
-cx q[3],q[18];
-cx q[3],q[19];
-cx q[4],q[18];
-rz(1.0396602723702757) q[18];
-cx q[4],q[18];
-cx q[4],q[21];
-rx(6.946799221515127) q[18];
-rz(1.0396602723702757) q[19];
-cx q[3],q[19];
-cx q[3],q[22];
-cx q[7],q[19];
-rz(1.0396602723702757) q[19];
-cx q[7],q[19];
-rx(6.946799221515127) q[7];
-rx(6.946799221515127) q[19];
-rz(1.0396602723702757) q[20];
-cx q[15],q[20];
-rx(6.946799221515127) q[20];
-rz(1.0396602723702757) q[21];
-cx q[4],q[21];
-rx(6.946799221515127) q[4];
-cx q[15],q[21];
-rz(1.0396602723702757) q[21];
-cx q[15],q[21];
-rx(6.946799221515127) q[15];
-rx(6.946799221515127) q[21];
-rz(1.0396602723702757) q[22];
-cx q[3],q[22];
-cx q[3],q[23];
-cx q[9],q[22];
-rz(1.0396602723702757) q[22];
-cx q[9],q[22];
-rx(6.946799221515127) q[9];
-rx(6.946799221515127) q[22];
-rz(1.0396602723702757) q[23];
-cx q[3],q[23];
-cx q[17],q[23];
-rz(1.0396602723702757) q[23];
-cx q[17],q[23];
-rx(6.946799221515127) q[17];
-rx(6.946799221515127) q[23];
-rx(5.321535547733308) q[24];
-cx q[3],q[24];
-rz(1.0396602723702757) q[24];
-cx q[3],q[24];
-rx(6.946799221515127) q[3];
-cx q[0],q[3];
-rz(4.544032137528854) q[3];
-cx q[0],q[3];
-cx q[0],q[15];
-cx q[1],q[3];
-rz(4.544032137528854) q[3];
-cx q[1],q[3];
-cx q[1],q[4];
-rz(4.544032137528854) q[4];
-cx q[1],q[4];
-cx q[3],q[4];
-rz(4.544032137528854) q[4];
-cx q[3],q[4];
-cx q[4],q[6];
-cx q[5],q[24];
-rz(4.544032137528854) q[6];
-cx q[4],q[6];
-rz(4.544032137528854) q[15];
-cx q[0],q[15];
-cx q[0],q[16];
-rz(4.544032137528854) q[16];
-cx q[0],q[16];
-cx q[0],q[20];
-rz(4.544032137528854) q[20];
-cx q[0],q[20];
-rx(4.89236023028999) q[0];
-rz(1.0396602723702757) q[24];
-cx q[5],q[24];
-rx(6.946799221515127) q[5];
-cx q[1],q[5];
-rz(4.544032137528854) q[5];
-cx q[1],q[5];
-cx q[1],q[9];
-cx q[3],q[5];
-rz(4.544032137528854) q[5];
-cx q[3],q[5];
-cx q[3],q[7];
-cx q[5],q[6];
-rz(4.544032137528854) q[6];
-cx q[5],q[6];
-rz(4.544032137528854) q[7];
-cx q[3],q[7];
-cx q[3],q[8];
-cx q[4],q[7];
-rz(4.544032137528854) q[7];
-cx q[4],q[7];
-cx q[4],q[10];
-rz(4.544032137528854) q[8];
-cx q[3],q[8];
-cx q[5],q[8];
-rz(4.544032137528854) q[8];
-cx q[5],q[8];
-cx q[5],q[11];
-rx(4.89236023028999) q[8];
-rz(4.544032137528854) q[9];
-cx q[1],q[9];
-cx q[1],q[17];
-cx q[3],q[9];
-rz(4.544032137528854) q[9];
-cx q[3],q[9];
-cx q[3],q[12];
-rz(4.544032137528854) q[10];
-cx q[4],q[10];
-cx q[4],q[13];
-cx q[6],q[10];
-rz(4.544032137528854) q[10];
-cx q[6],q[10];
-rx(4.89236023028999) q[10];
-rz(4.544032137528854) q[11];
-cx q[5],q[11];
-cx q[6],q[11];
-rz(4.544032137528854) q[11];
-cx q[6],q[11];
-rx(4.89236023028999) q[6];
-rx(4.89236023028999) q[11];
-rz(4.544032137528854) q[12];
-cx q[3],q[12];
-cx q[3],q[14];
-cx q[5],q[12];
-rz(4.544032137528854) q[12];
-cx q[5],q[12];
-rx(4.89236023028999) q[12];
-rz(4.544032137528854) q[13];
-cx q[4],q[13];
-cx q[5],q[13];
-rz(4.544032137528854) q[13];
-cx q[5],q[13];
-rx(4.89236023028999) q[13];
-rz(4.544032137528854) q[14];
-cx q[3],q[14];
-cx q[3],q[15];
-cx q[4],q[14];
-rz(4.544032137528854) q[14];
-cx q[4],q[14];
-rx(4.89236023028999) q[14];
-rz(4.544032137528854) q[15];
-cx q[3],q[15];
-cx q[3],q[16];
-cx q[15],q[20];
-rz(4.544032137528854) q[16];
-cx q[3],q[16];
-rx(4.89236023028999) q[16];
-rz(4.544032137528854) q[17];
-cx q[1],q[17];
-rx(4.89236023028999) q[1];
-cx q[3],q[17];
-rz(4.544032137528854) q[17];
-cx q[3],q[17];
-cx q[3],q[18];
-rz(4.544032137528854) q[18];
-cx q[3],q[18];
-cx q[3],q[19];
-cx q[4],q[18];
-rz(4.544032137528854) q[18];
-cx q[4],q[18];
-cx q[4],q[21];
-rx(4.89236023028999) q[18];
-rz(4.544032137528854) q[19];
-cx q[3],q[19];
-cx q[3],q[22];
-cx q[7],q[19];
-rz(4.544032137528854) q[19];
-cx q[7],q[19];
-rx(4.89236023028999) q[7];
-rx(4.89236023028999) q[19];
-rz(4.544032137528854) q[20];
-cx q[15],q[20];
-rx(4.89236023028999) q[20];
-rz(4.544032137528854) q[21];
-cx q[4],q[21];
-rx(4.89236023028999) q[4];
-cx q[15],q[21];
-rz(4.544032137528854) q[21];
-cx q[15],q[21];
-rx(4.89236023028999) q[15];
-rx(4.89236023028999) q[21];
-rz(4.544032137528854) q[22];
-cx q[3],q[22];
-cx q[3],q[23];
-cx q[9],q[22];
-rz(4.544032137528854) q[22];
-cx q[9],q[22];
-rx(4.89236023028999) q[9];
-rx(4.89236023028999) q[22];
-rz(4.544032137528854) q[23];
-cx q[3],q[23];
-cx q[17],q[23];
-rz(4.544032137528854) q[23];
-cx q[17],q[23];
-rx(4.89236023028999) q[17];
-rx(4.89236023028999) q[23];
-rx(6.946799221515127) q[24];
-cx q[3],q[24];
-rz(4.544032137528854) q[24];
-cx q[3],q[24];
-rx(4.89236023028999) q[3];
-cx q[5],q[24];
-rz(4.544032137528854) q[24];
-cx q[5],q[24];
-rx(4.89236023028999) q[5];
-rx(4.89236023028999) q[24];
\ No newline at end of file
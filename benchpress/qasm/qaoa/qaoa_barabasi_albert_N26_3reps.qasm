@@ -1,565 +0,0 @@
-OPENQASM 2.0;
-include "qelib1.inc";
-qreg q[26];
-ry(pi/2) q[0];
-rx(pi) q[0];
-ry(pi/2) q[1];
-rx(pi) q[1];
-cx q[0],q[1];
-rz(3.92801643157092) q[1];
-cx q[0],q[1];
-ry(pi/2) q[2];
-rx(pi) q[2];
-cx q[0],q[2];
-rz(3.92801643157092) q[2];
-cx q[0],q[2];
-rx(2.0952848666921375) q[2];
-ry(pi/2) q[3];
-rx(pi) q[3];
-cx q[0],q[3];
-rz(3.92801643157092) q[3];
-cx q[0],q[3];
-cx q[1],q[3];
-rz(3.92801643157092) q[3];
-cx q[1],q[3];
-ry(pi/2) q[4];
-rx(pi) q[4];
-cx q[1],q[4];
-rz(3.92801643157092) q[4];
-cx q[1],q[4];
-cx q[3],q[4];
-rz(3.92801643157092) q[4];
-cx q[3],q[4];
-ry(pi/2) q[5];
-rx(pi) q[5];
-cx q[1],q[5];
-rz(3.92801643157092) q[5];
-cx q[1],q[5];
-cx q[3],q[5];
-rz(3.92801643157092) q[5];
-cx q[3],q[5];
-ry(pi/2) q[6];
-rx(pi) q[6];
-cx q[4],q[6];
-rz(3.92801643157092) q[6];
-cx q[4],q[6];
-cx q[5],q[6];
-rz(3.92801643157092) q[6];
-cx q[5],q[6];
-ry(pi/2) q[7];
-rx(pi) q[7];
-cx q[3],q[7];
-rz(3.92801643157092) q[7];
-cx q[3],q[7];
-cx q[4],q[7];
-rz(3.92801643157092) q[7];
-cx q[4],q[7];
-ry(pi/2) q[8];
-rx(pi) q[8];
-cx q[3],q[8];
-rz(3.92801643157092) q[8];
-cx q[3],q[8];
-cx q[5],q[8];
-rz(3.92801643157092) q[8];
-cx q[5],q[8];
-rx(2.0952848666921375) q[8];
-ry(pi/2) q[9];
-rx(pi) q[9];
-cx q[1],q[9];
-rz(3.92801643157092) q[9];
-cx q[1],q[9];
-cx q[3],q[9];
-rz(3.92801643157092) q[9];
-cx q[3],q[9];
-ry(pi/2) q[10];
-rx(pi) q[10];
-cx q[4],q[10];
-rz(3.92801643157092) q[10];
-cx q[4],q[10];
-cx q[6],q[10];
-rz(3.92801643157092) q[10];
-cx q[6],q[10];
-rx(2.0952848666921375) q[10];
-ry(pi/2) q[11];
-rx(pi) q[11];
-cx q[5],q[11];
-rz(3.92801643157092) q[11];
-cx q[5],q[11];
-cx q[6],q[11];
-rz(3.92801643157092) q[11];
-cx q[6],q[11];
-rx(2.0952848666921375) q[6];
-rx(2.0952848666921375) q[11];
-ry(pi/2) q[12];
-rx(pi) q[12];
-cx q[3],q[12];
-rz(3.92801643157092) q[12];
-cx q[3],q[12];
-cx q[5],q[12];
-rz(3.92801643157092) q[12];
-cx q[5],q[12];
-ry(pi/2) q[13];
-rx(pi) q[13];
-cx q[4],q[13];
-rz(3.92801643157092) q[13];
-cx q[4],q[13];
-cx q[5],q[13];
-rz(3.92801643157092) q[13];
-cx q[5],q[13];
-rx(2.0952848666921375) q[13];
-ry(pi/2) q[14];
-rx(pi) q[14];
-cx q[3],q[14];
-rz(3.92801643157092) q[14];
-cx q[3],q[14];
-cx q[4],q[14];
-rz(3.92801643157092) q[14];
-cx q[4],q[14];
-rx(2.0952848666921375) q[14];
-ry(pi/2) q[15];
-rx(pi) q[15];
-cx q[0],q[15];
-rz(3.92801643157092) q[15];
-cx q[0],q[15];
-cx q[3],q[15];
-rz(3.92801643157092) q[15];
-cx q[3],q[15];
-ry(pi/2) q[16];
-rx(pi) q[16];
-cx q[0],q[16];
-rz(3.92801643157092) q[16];
-cx q[0],q[16];
-cx q[3],q[16];
-rz(3.92801643157092) q[16];
-cx q[3],q[16];
-rx(2.0952848666921375) q[16];
-ry(pi/2) q[17];
-rx(pi) q[17];
-cx q[1],q[17];
-rz(3.92801643157092) q[17];
-cx q[1],q[17];
-rx(2.0952848666921375) q[1];
-cx q[3],q[17];
-rz(3.92801643157092) q[17];
-cx q[3],q[17];
-ry(pi/2) q[18];
-rx(pi) q[18];
-cx q[3],q[18];
-rz(3.92801643157092) q[18];
-cx q[3],q[18];
-cx q[4],q[18];
-rz(3.92801643157092) q[18];
-cx q[4],q[18];
-rx(2.0952848666921375) q[18];
-ry(pi/2) q[19];
-rx(pi) q[19];
-cx q[3],q[19];
-rz(3.92801643157092) q[19];
-cx q[3],q[19];
-cx q[7],q[19];
-rz(3.92801643157092) q[19];
-cx q[7],q[19];
-rx(2.0952848666921375) q[7];
-rx(2.0952848666921375) q[19];
-ry(pi/2) q[20];
-rx(pi) q[20];
-cx q[0],q[20];
-rz(3.92801643157092) q[20];
-cx q[0],q[20];
-rx(2.0952848666921375) q[0];
-cx q[0],q[1];
-rz(3.3141214646556114) q[1];
-cx q[0],q[1];
-cx q[0],q[2];
-rz(3.3141214646556114) q[2];
-cx q[0],q[2];
-rx(7.986509796090233) q[2];
-cx q[15],q[20];
-rz(3.92801643157092) q[20];
-cx q[15],q[20];
-rx(2.0952848666921375) q[20];
-ry(pi/2) q[21];
-rx(pi) q[21];
-cx q[4],q[21];
-rz(3.92801643157092) q[21];
-cx q[4],q[21];
-rx(2.0952848666921375) q[4];
-cx q[15],q[21];
-rz(3.92801643157092) q[21];
-cx q[15],q[21];
-rx(2.0952848666921375) q[15];
-rx(2.0952848666921375) q[21];
-ry(pi/2) q[22];
-rx(pi) q[22];
-cx q[3],q[22];
-rz(3.92801643157092) q[22];
-cx q[3],q[22];
-cx q[9],q[22];
-rz(3.92801643157092) q[22];
-cx q[9],q[22];
-rx(2.0952848666921375) q[9];
-rx(2.0952848666921375) q[22];
-ry(pi/2) q[23];
-rx(pi) q[23];
-cx q[3],q[23];
-rz(3.92801643157092) q[23];
-cx q[3],q[23];
-cx q[17],q[23];
-rz(3.92801643157092) q[23];
-cx q[17],q[23];
-rx(2.0952848666921375) q[17];
-rx(2.0952848666921375) q[23];
-ry(pi/2) q[24];
-rx(pi) q[24];
-cx q[3],q[24];
-rz(3.92801643157092) q[24];
-cx q[3],q[24];
-cx q[5],q[24];
-rz(3.92801643157092) q[24];
-cx q[5],q[24];
-rx(2.0952848666921375) q[5];
-rx(2.0952848666921375) q[24];
-ry(pi/2) q[25];
-rx(pi) q[25];
-cx q[3],q[25];
-rz(3.92801643157092) q[25];
-cx q[3],q[25];
-rx(2.0952848666921375) q[3];
-cx q[0],q[3];
-rz(3.3141214646556114) q[3];
-cx q[0],q[3];
-cx q[0],q[15];
-cx q[1],q[3];
-rz(3.3141214646556114) q[3];
-cx q[1],q[3];
-cx q[1],q[4];
-rz(3.3141214646556114) q[4];
-cx q[1],q[4];
-cx q[1],q[5];
-cx q[3],q[4];
-rz(3.3141214646556114) q[4];
-cx q[3],q[4];
-cx q[4],q[6];
-rz(3.3141214646556114) q[5];
-cx q[1],q[5];
-cx q[1],q[9];
-cx q[3],q[5];
-rz(3.3141214646556114) q[5];
-cx q[3],q[5];
-cx q[3],q[7];
-rz(3.3141214646556114) q[6];
-cx q[4],q[6];
-cx q[5],q[6];
-rz(3.3141214646556114) q[6];
-cx q[5],q[6];
-rz(3.3141214646556114) q[7];
-cx q[3],q[7];
-cx q[3],q[8];
-cx q[4],q[7];
-rz(3.3141214646556114) q[7];
-cx q[4],q[7];
-cx q[4],q[10];
-rz(3.3141214646556114) q[8];
-cx q[3],q[8];
-cx q[5],q[8];
-rz(3.3141214646556114) q[8];
-cx q[5],q[8];
-cx q[5],q[11];
-rx(7.986509796090233) q[8];
-rz(3.3141214646556114) q[9];
-cx q[1],q[9];
-cx q[1],q[17];
-cx q[3],q[9];
-rz(3.3141214646556114) q[9];
-cx q[3],q[9];
-rz(3.3141214646556114) q[10];
-cx q[4],q[10];
-cx q[4],q[13];
-cx q[6],q[10];
-rz(3.3141214646556114) q[10];
-cx q[6],q[10];
-rx(7.986509796090233) q[10];
-rz(3.3141214646556114) q[11];
-cx q[5],q[11];
-cx q[6],q[11];
-rz(3.3141214646556114) q[11];
-cx q[6],q[11];
-rx(7.986509796090233) q[6];
-rx(7.986509796090233) q[11];
-cx q[12],q[25];
-rz(3.3141214646556114) q[13];
-cx q[4],q[13];
-rz(3.3141214646556114) q[15];
-cx q[0],q[15];
-cx q[0],q[16];
-rz(3.3141214646556114) q[16];
-cx q[0],q[16];
-cx q[0],q[20];
-rz(3.3141214646556114) q[17];
-cx q[1],q[17];
-rx(7.986509796090233) q[1];
-rz(3.3141214646556114) q[20];
-cx q[0],q[20];
-rx(7.986509796090233) q[0];
-cx q[0],q[1];
-rz(1.340620054213019) q[1];
-cx q[0],q[1];
-cx q[0],q[2];
-rz(1.340620054213019) q[2];
-cx q[0],q[2];
-rx(3.2236460895488195) q[2];
-rz(3.92801643157092) q[25];
-cx q[12],q[25];
-rx(2.0952848666921375) q[12];
-cx q[3],q[12];
-rz(3.3141214646556114) q[12];
-cx q[3],q[12];
-cx q[3],q[14];
-cx q[5],q[12];
-rz(3.3141214646556114) q[12];
-cx q[5],q[12];
-cx q[5],q[13];
-rz(3.3141214646556114) q[13];
-cx q[5],q[13];
-rx(7.986509796090233) q[13];
-rz(3.3141214646556114) q[14];
-cx q[3],q[14];
-cx q[3],q[15];
-cx q[4],q[14];
-rz(3.3141214646556114) q[14];
-cx q[4],q[14];
-rx(7.986509796090233) q[14];
-rz(3.3141214646556114) q[15];
-cx q[3],q[15];
-cx q[3],q[16];
-cx q[15],q[20];
-rz(3.3141214646556114) q[16];
-cx q[3],q[16];
-cx q[3],q[17];
-rx(7.986509796090233) q[16];
-rz(3.3141214646556114) q[17];
-cx q[3],q[17];
-cx q[3],q[18];
-rz(3.3141214646556114) q[18];
-cx q[3],q[18];
-cx q[3],q[19];
-cx q[4],q[18];
-rz(3.3141214646556114) q[18];
-cx q[4],q[18];
-cx q[4],q[21];
-rx(7.986509796090233) q[18];
-rz(3.3141214646556114) q[19];
-cx q[3],q[19];
-cx q[3],q[22];
-cx q[7],q[19];
-rz(3.3141214646556114) q[19];
-cx q[7],q[19];
-rx(7.986509796090233) q[7];
-rx(7.986509796090233) q[19];
-rz(3.3141214646556114) q[20];
-cx q[15],q[20];
-rx(7.986509796090233) q[20];
-rz(3.3141214646556114) q[21];
-cx q[4],q[21];
-rx(7.986509796090233) q[4];
-cx q[15],q[21];
-rz(3.3141214646556114) q[21];
-cx q[15],q[21];
-rx(7.986509796090233) q[15];
-rx(7.986509796090233) q[21];
-rz(3.3141214646556114) q[22];
-cx q[3],q[22];
-cx q[3],q[23];
-cx q[9],q[22];
-rz(3.3141214646556114) q[22];
-cx q[9],q[22];
-rx(7.986509796090233) q[9];
-rx(7.986509796090233) q[22];
-rz(3.3141214646556114) q[23];
-cx q[3],q[23];
-cx q[3],q[24];
-cx q[17],q[23];
-rz(3.3141214646556114) q[23];
-cx q[17],q[23];
-rx(7.986509796090233) q[17];
-rx(7.986509796090233) q[23];
-rz(3.3141214646556114) q[24];
-cx q[3],q[24];
-cx q[5],q[24];
-rz(3.3141214646556114) q[24];
-cx q[5],q[24];
-rx(7.986509796090233) q[5];
-rx(7.986509796090233) q[24];
-rx(2.0952848666921375) q[25];
-cx q[3],q[25];
-rz(3.3141214646556114) q[25];
-cx q[3],q[25];
-rx(7.986509796090233) q[3];
-cx q[0],q[3];
-rz(1.340620054213019) q[3];
-cx q[0],q[3];
-cx q[0],q[15];
-cx q[1],q[3];
-rz(1.340620054213019) q[3];
-cx q[1],q[3];
-cx q[1],q[4];
-rz(1.340620054213019) q[4];
-cx q[1],q[4];
-cx q[1],q[5];
-cx q[3],q[4];
-rz(1.340620054213019) q[4];
-cx q[3],q[4];
-cx q[4],q[6];
-rz(1.340620054213019) q[5];
-cx q[1],q[5];
-cx q[1],q[9];
-cx q[3],q[5];
-rz(1.340620054213019) q[5];
-cx q[3],q[5];
-cx q[3],q[7];
-rz(1.340620054213019) q[6];
-cx q[4],q[6];
-cx q[5],q[6];
-rz(1.340620054213019) q[6];
-cx q[5],q[6];
-rz(1.340620054213019) q[7];
-cx q[3],q[7];
-cx q[3],q[8];
-cx q[4],q[7];
-rz(1.340620054213019) q[7];
-cx q[4],q[7];
-cx q[4],q[10];
-rz(1.340620054213019) q[8];
-cx q[3],q[8];
-cx q[5],q[8];
-rz(1.340620054213019) q[8];
-cx q[5],q[8];
-cx q[5],q[11];
-rx(3.2236460895488195) q[8];
-rz(1.340620054213019) q[9];
-cx q[1],q[9];
-cx q[1],q[17];
-cx q[3],q[9];
-rz(1.340620054213019) q[9];
-cx q[3],q[9];
-rz(1.340620054213019) q[10];
-cx q[4],q[10];
-cx q[4],q[13];
-cx q[6],q[10];
-rz(1.340620054213019) q[10];
-cx q[6],q[10];
-rx(3.2236460895488195) q[10];
-rz(1.340620054213019) q[11];
-cx q[5],q[11];
-cx q[6],q[11];
-rz(1.340620054213019) q[11];
-cx q[6],q[11];
-rx(3.2236460895488195) q[6];
-rx(3.2236460895488195) q[11];
-cx q[12],q[25];
-rz(1.340620054213019) q[13];
-cx q[4],q[13];
-rz(1.340620054213019) q[15];
-cx q[0],q[15];
-cx q[0],q[16];
-rz(1.340620054213019) q[16];
-cx q[0],q[16];
-cx q[0],q[20];
-rz(1.340620054213019) q[17];
-cx q[1],q[17];
-rx(3.2236460895488195) q[1];
-rz(1.340620054213019) q[20];
-cx q[0],q[20];
-rx(3.2236460895488195) q[0];
-rz(3.3141214646556114) q[25];
-cx q[12],q[25];
-rx(7.986509796090233) q[12];
-cx q[3],q[12];
-rz(1.340620054213019) q[12];
-cx q[3],q[12];
-cx q[3],q[14];
-cx q[5],q[12];
-rz(1.340620054213019) q[12];
-cx q[5],q[12];
-cx q[5],q[13];
-rz(1.340620054213019) q[13];
-cx q[5],q[13];
-rx(3.2236460895488195) q[13];
-rz(1.340620054213019) q[14];
-cx q[3],q[14];
-cx q[3],q[15];
-cx q[4],q[14];
-rz(1.340620054213019) q[14];
-cx q[4],q[14];
-rx(3.2236460895488195) q[14];
-rz(1.340620054213019) q[15];
-cx q[3],q[15];
-cx q[3],q[16];
-cx q[15],q[20];
-rz(1.340620054213019) q[16];
-cx q[3],q[16];
-cx q[3],q[17];
-rx(3.2236460895488195) q[16];
-rz(1.340620054213019) q[17];
-cx q[3],q[17];
-cx q[3],q[18];
-rz(1.340620054213019) q[18];
-cx q[3],q[18];
-cx q[3],q[19];
-cx q[4],q[18];
-rz(1.340620054213019) q[18];
-cx q[4],q[18];
-cx q[4],q[21];
-rx(3.2236460895488195) q[18];
-rz(1.340620054213019) q[19];
-cx q[3],q[19];
-cx q[3],q[22];
-cx q[7],q[19];
-rz(1.340620054213019) q[19];
-cx q[7],q[19];
-rx(3.2236460895488195) q[7];
-rx(3.2236460895488195) q[19];
-rz(1.340620054213019) q[20];
-cx q[15],q[20];
-rx(3.2236460895488195) q[20];
-rz(1.340620054213019) q[21];
-cx q[4],q[21];
-rx(3.2236460895488195) q[4];
-cx q[15],q[21];
-rz(1.340620054213019) q[21];
-cx q[15],q[21];
-rx(3.2236460895488195) q[15];
-rx(3.2236460895488195) q[21];
-rz(1.340620054213019) q[22];
-cx q[3],q[22];
-cx q[3],q[23];
-cx q[9],q[22];
-rz(1.340620054213019) q[22];
-cx q[9],q[22];
-rx(3.2236460895488195) q[9];
-rx(3.2236460895488195) q[22];
-rz(1.340620054213019) q[23];
-cx q[3],q[23];
-cx q[3],q[24];
-cx q[17],q[23];
-rz(1.340620054213019) q[23];
-cx q[17],q[23];
-rx(3.2236460895488195) q[17];
-rx(3.2236460895488195) q[23];
-rz(1.340620054213019) q[24];
-cx q[3],q[24];
-cx q[5],q[24];
-rz(1.340620054213019) q[24];
-cx q[5],q[24];
-rx(3.2236460895488195) q[5];
-rx(3.2236460895488195) q[24];
-rx(7.986509796090233) q[25];
-cx q[3],q[25];
-rz(1.340620054213019) q[25];
-cx q[3],q[25];
-rx(3.2236460895488195) q[3];
-cx q[12],q[25];
-rz(1.340620054213019) q[25];
-cx q[12],q[25];
-rx(3.2236460895488195) q[12];
-rx(3.2236460895488195) q[25];
\ No newline at end of file
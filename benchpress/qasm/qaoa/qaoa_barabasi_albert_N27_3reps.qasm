@@ -1,588 +0,0 @@
-OPENQASM 2.0;
-include "qelib1.inc";
-qreg q[27];
-ry(pi/2) q[0];
-rx(pi) q[0];
-ry(pi/2) q[1];
-rx(pi) q[1];
-cx q[0],q[1];
-rz(5.286325005680611) q[1];
-cx q[0],q[1];
-ry(pi/2) q[2];
-rx(pi) q[2];
-cx q[0],q[2];
-rz(5.286325005680611) q[2];
-cx q[0],q[2];
-rx(12.09190238080453) q[2];
-ry(pi/2) q[3];
-rx(pi) q[3];
-cx q[0],q[3];
-rz(5.286325005680611) q[3];
-cx q[0],q[3];
-cx q[1],q[3];
-rz(5.286325005680611) q[3];
-cx q[1],q[3];
-ry(pi/2) q[4];
-rx(pi) q[4];
-cx q[1],q[4];
-rz(5.286325005680611) q[4];
-cx q[1],q[4];
-cx q[3],q[4];
-rz(5.286325005680611) q[4];
-cx q[3],q[4];
-ry(pi/2) q[5];
-rx(pi) q[5];
-cx q[1],q[5];
-rz(5.286325005680611) q[5];
-cx q[1],q[5];
-cx q[3],q[5];
-rz(5.286325005680611) q[5];
-cx q[3],q[5];
-ry(pi/2) q[6];
-rx(pi) q[6];
-cx q[4],q[6];
-rz(5.286325005680611) q[6];
-cx q[4],q[6];
-cx q[5],q[6];
-rz(5.286325005680611) q[6];
-cx q[5],q[6];
-ry(pi/2) q[7];
-rx(pi) q[7];
-cx q[3],q[7];
-rz(5.286325005680611) q[7];
-cx q[3],q[7];
-cx q[4],q[7];
-rz(5.286325005680611) q[7];
-cx q[4],q[7];
-ry(pi/2) q[8];
-rx(pi) q[8];
-cx q[3],q[8];
-rz(5.286325005680611) q[8];
-cx q[3],q[8];
-cx q[5],q[8];
-rz(5.286325005680611) q[8];
-cx q[5],q[8];
-rx(12.09190238080453) q[8];
-ry(pi/2) q[9];
-rx(pi) q[9];
-cx q[1],q[9];
-rz(5.286325005680611) q[9];
-cx q[1],q[9];
-cx q[3],q[9];
-rz(5.286325005680611) q[9];
-cx q[3],q[9];
-ry(pi/2) q[10];
-rx(pi) q[10];
-cx q[4],q[10];
-rz(5.286325005680611) q[10];
-cx q[4],q[10];
-cx q[6],q[10];
-rz(5.286325005680611) q[10];
-cx q[6],q[10];
-rx(12.09190238080453) q[10];
-ry(pi/2) q[11];
-rx(pi) q[11];
-cx q[5],q[11];
-rz(5.286325005680611) q[11];
-cx q[5],q[11];
-cx q[6],q[11];
-rz(5.286325005680611) q[11];
-cx q[6],q[11];
-rx(12.09190238080453) q[6];
-rx(12.09190238080453) q[11];
-ry(pi/2) q[12];
-rx(pi) q[12];
-cx q[3],q[12];
-rz(5.286325005680611) q[12];
-cx q[3],q[12];
-cx q[5],q[12];
-rz(5.286325005680611) q[12];
-cx q[5],q[12];
-ry(pi/2) q[13];
-rx(pi) q[13];
-cx q[4],q[13];
-rz(5.286325005680611) q[13];
-cx q[4],q[13];
-cx q[5],q[13];
-rz(5.286325005680611) q[13];
-cx q[5],q[13];
-rx(12.09190238080453) q[13];
-ry(pi/2) q[14];
-rx(pi) q[14];
-cx q[3],q[14];
-rz(5.286325005680611) q[14];
-cx q[3],q[14];
-cx q[4],q[14];
-rz(5.286325005680611) q[14];
-cx q[4],q[14];
-rx(12.09190238080453) q[14];
-ry(pi/2) q[15];
-rx(pi) q[15];
-cx q[0],q[15];
-rz(5.286325005680611) q[15];
-cx q[0],q[15];
-cx q[3],q[15];
-rz(5.286325005680611) q[15];
-cx q[3],q[15];
-ry(pi/2) q[16];
-rx(pi) q[16];
-cx q[0],q[16];
-rz(5.286325005680611) q[16];
-cx q[0],q[16];
-cx q[3],q[16];
-rz(5.286325005680611) q[16];
-cx q[3],q[16];
-rx(12.09190238080453) q[16];
-ry(pi/2) q[17];
-rx(pi) q[17];
-cx q[1],q[17];
-rz(5.286325005680611) q[17];
-cx q[1],q[17];
-rx(12.09190238080453) q[1];
-cx q[3],q[17];
-rz(5.286325005680611) q[17];
-cx q[3],q[17];
-ry(pi/2) q[18];
-rx(pi) q[18];
-cx q[3],q[18];
-rz(5.286325005680611) q[18];
-cx q[3],q[18];
-cx q[4],q[18];
-rz(5.286325005680611) q[18];
-cx q[4],q[18];
-rx(12.09190238080453) q[18];
-ry(pi/2) q[19];
-rx(pi) q[19];
-cx q[3],q[19];
-rz(5.286325005680611) q[19];
-cx q[3],q[19];
-cx q[7],q[19];
-rz(5.286325005680611) q[19];
-cx q[7],q[19];
-rx(12.09190238080453) q[7];
-rx(12.09190238080453) q[19];
-ry(pi/2) q[20];
-rx(pi) q[20];
-cx q[0],q[20];
-rz(5.286325005680611) q[20];
-cx q[0],q[20];
-rx(12.09190238080453) q[0];
-cx q[0],q[1];
-rz(1.7874663820573942) q[1];
-cx q[0],q[1];
-cx q[0],q[2];
-rz(1.7874663820573942) q[2];
-cx q[0],q[2];
-rx(5.563394815365419) q[2];
-cx q[15],q[20];
-rz(5.286325005680611) q[20];
-cx q[15],q[20];
-rx(12.09190238080453) q[20];
-ry(pi/2) q[21];
-rx(pi) q[21];
-cx q[4],q[21];
-rz(5.286325005680611) q[21];
-cx q[4],q[21];
-rx(12.09190238080453) q[4];
-cx q[15],q[21];
-rz(5.286325005680611) q[21];
-cx q[15],q[21];
-rx(12.09190238080453) q[15];
-ry(pi/2) q[22];
-rx(pi) q[22];
-cx q[3],q[22];
-rz(5.286325005680611) q[22];
-cx q[3],q[22];
-cx q[9],q[22];
-rz(5.286325005680611) q[22];
-cx q[9],q[22];
-rx(12.09190238080453) q[9];
-rx(12.09190238080453) q[22];
-ry(pi/2) q[23];
-rx(pi) q[23];
-cx q[3],q[23];
-rz(5.286325005680611) q[23];
-cx q[3],q[23];
-cx q[17],q[23];
-rz(5.286325005680611) q[23];
-cx q[17],q[23];
-rx(12.09190238080453) q[17];
-rx(12.09190238080453) q[23];
-ry(pi/2) q[24];
-rx(pi) q[24];
-cx q[3],q[24];
-rz(5.286325005680611) q[24];
-cx q[3],q[24];
-cx q[5],q[24];
-rz(5.286325005680611) q[24];
-cx q[5],q[24];
-rx(12.09190238080453) q[5];
-rx(12.09190238080453) q[24];
-ry(pi/2) q[25];
-rx(pi) q[25];
-cx q[3],q[25];
-rz(5.286325005680611) q[25];
-cx q[3],q[25];
-cx q[12],q[25];
-rz(5.286325005680611) q[25];
-cx q[12],q[25];
-rx(12.09190238080453) q[12];
-rx(12.09190238080453) q[25];
-ry(pi/2) q[26];
-rx(pi) q[26];
-cx q[3],q[26];
-rz(5.286325005680611) q[26];
-cx q[3],q[26];
-rx(12.09190238080453) q[3];
-cx q[0],q[3];
-rz(1.7874663820573942) q[3];
-cx q[0],q[3];
-cx q[0],q[15];
-cx q[1],q[3];
-rz(1.7874663820573942) q[3];
-cx q[1],q[3];
-cx q[1],q[4];
-rz(1.7874663820573942) q[4];
-cx q[1],q[4];
-cx q[1],q[5];
-cx q[3],q[4];
-rz(1.7874663820573942) q[4];
-cx q[3],q[4];
-cx q[4],q[6];
-rz(1.7874663820573942) q[5];
-cx q[1],q[5];
-cx q[1],q[9];
-cx q[3],q[5];
-rz(1.7874663820573942) q[5];
-cx q[3],q[5];
-cx q[3],q[7];
-rz(1.7874663820573942) q[6];
-cx q[4],q[6];
-cx q[5],q[6];
-rz(1.7874663820573942) q[6];
-cx q[5],q[6];
-rz(1.7874663820573942) q[7];
-cx q[3],q[7];
-cx q[3],q[8];
-cx q[4],q[7];
-rz(1.7874663820573942) q[7];
-cx q[4],q[7];
-cx q[4],q[10];
-rz(1.7874663820573942) q[8];
-cx q[3],q[8];
-cx q[5],q[8];
-rz(1.7874663820573942) q[8];
-cx q[5],q[8];
-cx q[5],q[11];
-rx(5.563394815365419) q[8];
-rz(1.7874663820573942) q[9];
-cx q[1],q[9];
-cx q[1],q[17];
-cx q[3],q[9];
-rz(1.7874663820573942) q[9];
-cx q[3],q[9];
-cx q[3],q[12];
-rz(1.7874663820573942) q[10];
-cx q[4],q[10];
-cx q[4],q[13];
-cx q[6],q[10];
-rz(1.7874663820573942) q[10];
-cx q[6],q[10];
-rx(5.563394815365419) q[10];
-rz(1.7874663820573942) q[11];
-cx q[5],q[11];
-cx q[6],q[11];
-rz(1.7874663820573942) q[11];
-cx q[6],q[11];
-rx(5.563394815365419) q[6];
-rx(5.563394815365419) q[11];
-rz(1.7874663820573942) q[12];
-cx q[3],q[12];
-cx q[3],q[14];
-cx q[5],q[12];
-rz(1.7874663820573942) q[12];
-cx q[5],q[12];
-rz(1.7874663820573942) q[13];
-cx q[4],q[13];
-cx q[5],q[13];
-rz(1.7874663820573942) q[13];
-cx q[5],q[13];
-rx(5.563394815365419) q[13];
-rz(1.7874663820573942) q[14];
-cx q[3],q[14];
-cx q[4],q[14];
-rz(1.7874663820573942) q[14];
-cx q[4],q[14];
-rx(5.563394815365419) q[14];
-rz(1.7874663820573942) q[15];
-cx q[0],q[15];
-cx q[0],q[16];
-cx q[3],q[15];
-rz(1.7874663820573942) q[15];
-cx q[3],q[15];
-rz(1.7874663820573942) q[16];
-cx q[0],q[16];
-cx q[0],q[20];
-cx q[3],q[16];
-rz(1.7874663820573942) q[16];
-cx q[3],q[16];
-rx(5.563394815365419) q[16];
-rz(1.7874663820573942) q[17];
-cx q[1],q[17];
-rx(5.563394815365419) q[1];
-cx q[3],q[17];
-rz(1.7874663820573942) q[17];
-cx q[3],q[17];
-cx q[3],q[18];
-rz(1.7874663820573942) q[18];
-cx q[3],q[18];
-cx q[3],q[19];
-cx q[4],q[18];
-rz(1.7874663820573942) q[18];
-cx q[4],q[18];
-rx(5.563394815365419) q[18];
-rz(1.7874663820573942) q[19];
-cx q[3],q[19];
-cx q[3],q[22];
-cx q[7],q[19];
-rz(1.7874663820573942) q[19];
-cx q[7],q[19];
-rx(5.563394815365419) q[7];
-rx(5.563394815365419) q[19];
-rz(1.7874663820573942) q[20];
-cx q[0],q[20];
-rx(5.563394815365419) q[0];
-cx q[0],q[1];
-rz(4.767255368572561) q[1];
-cx q[0],q[1];
-cx q[0],q[2];
-rz(4.767255368572561) q[2];
-cx q[0],q[2];
-rx(6.321752996246448) q[2];
-cx q[15],q[20];
-rz(1.7874663820573942) q[20];
-cx q[15],q[20];
-rx(5.563394815365419) q[20];
-cx q[21],q[26];
-rz(1.7874663820573942) q[22];
-cx q[3],q[22];
-cx q[3],q[23];
-cx q[9],q[22];
-rz(1.7874663820573942) q[22];
-cx q[9],q[22];
-rx(5.563394815365419) q[9];
-rx(5.563394815365419) q[22];
-rz(1.7874663820573942) q[23];
-cx q[3],q[23];
-cx q[3],q[24];
-cx q[17],q[23];
-rz(1.7874663820573942) q[23];
-cx q[17],q[23];
-rx(5.563394815365419) q[17];
-rx(5.563394815365419) q[23];
-rz(1.7874663820573942) q[24];
-cx q[3],q[24];
-cx q[3],q[25];
-cx q[5],q[24];
-rz(1.7874663820573942) q[24];
-cx q[5],q[24];
-rx(5.563394815365419) q[5];
-rx(5.563394815365419) q[24];
-rz(1.7874663820573942) q[25];
-cx q[3],q[25];
-cx q[12],q[25];
-rz(1.7874663820573942) q[25];
-cx q[12],q[25];
-rx(5.563394815365419) q[12];
-rx(5.563394815365419) q[25];
-rz(5.286325005680611) q[26];
-cx q[21],q[26];
-rx(12.09190238080453) q[21];
-cx q[4],q[21];
-rz(1.7874663820573942) q[21];
-cx q[4],q[21];
-rx(5.563394815365419) q[4];
-cx q[15],q[21];
-rz(1.7874663820573942) q[21];
-cx q[15],q[21];
-rx(5.563394815365419) q[15];
-rx(12.09190238080453) q[26];
-cx q[3],q[26];
-rz(1.7874663820573942) q[26];
-cx q[3],q[26];
-rx(5.563394815365419) q[3];
-cx q[0],q[3];
-rz(4.767255368572561) q[3];
-cx q[0],q[3];
-cx q[0],q[15];
-cx q[1],q[3];
-rz(4.767255368572561) q[3];
-cx q[1],q[3];
-cx q[1],q[4];
-rz(4.767255368572561) q[4];
-cx q[1],q[4];
-cx q[1],q[5];
-cx q[3],q[4];
-rz(4.767255368572561) q[4];
-cx q[3],q[4];
-cx q[4],q[6];
-rz(4.767255368572561) q[5];
-cx q[1],q[5];
-cx q[1],q[9];
-cx q[3],q[5];
-rz(4.767255368572561) q[5];
-cx q[3],q[5];
-cx q[3],q[7];
-rz(4.767255368572561) q[6];
-cx q[4],q[6];
-cx q[5],q[6];
-rz(4.767255368572561) q[6];
-cx q[5],q[6];
-rz(4.767255368572561) q[7];
-cx q[3],q[7];
-cx q[3],q[8];
-cx q[4],q[7];
-rz(4.767255368572561) q[7];
-cx q[4],q[7];
-cx q[4],q[10];
-rz(4.767255368572561) q[8];
-cx q[3],q[8];
-cx q[5],q[8];
-rz(4.767255368572561) q[8];
-cx q[5],q[8];
-cx q[5],q[11];
-rx(6.321752996246448) q[8];
-rz(4.767255368572561) q[9];
-cx q[1],q[9];
-cx q[1],q[17];
-cx q[3],q[9];
-rz(4.767255368572561) q[9];
-cx q[3],q[9];
-cx q[3],q[12];
-rz(4.767255368572561) q[10];
-cx q[4],q[10];
-cx q[4],q[13];
-cx q[6],q[10];
-rz(4.767255368572561) q[10];
-cx q[6],q[10];
-rx(6.321752996246448) q[10];
-rz(4.767255368572561) q[11];
-cx q[5],q[11];
-cx q[6],q[11];
-rz(4.767255368572561) q[11];
-cx q[6],q[11];
-rx(6.321752996246448) q[6];
-rx(6.321752996246448) q[11];
-rz(4.767255368572561) q[12];
-cx q[3],q[12];
-cx q[3],q[14];
-cx q[5],q[12];
-rz(4.767255368572561) q[12];
-cx q[5],q[12];
-rz(4.767255368572561) q[13];
-cx q[4],q[13];
-cx q[5],q[13];
-rz(4.767255368572561) q[13];
-cx q[5],q[13];
-rx(6.321752996246448) q[13];
-rz(4.767255368572561) q[14];
-cx q[3],q[14];
-cx q[4],q[14];
-rz(4.767255368572561) q[14];
-cx q[4],q[14];
-rx(6.321752996246448) q[14];
-rz(4.767255368572561) q[15];
-cx q[0],q[15];
-cx q[0],q[16];
-cx q[3],q[15];
-rz(4.767255368572561) q[15];
-cx q[3],q[15];
-rz(4.767255368572561) q[16];
-cx q[0],q[16];
-cx q[0],q[20];
-cx q[3],q[16];
-rz(4.767255368572561) q[16];
-cx q[3],q[16];
-rx(6.321752996246448) q[16];
-rz(4.767255368572561) q[17];
-cx q[1],q[17];
-rx(6.321752996246448) q[1];
-cx q[3],q[17];
-rz(4.767255368572561) q[17];
-cx q[3],q[17];
-cx q[3],q[18];
-rz(4.767255368572561) q[18];
-cx q[3],q[18];
-cx q[3],q[19];
-cx q[4],q[18];
-rz(4.767255368572561) q[18];
-cx q[4],q[18];
-rx(6.321752996246448) q[18];
-rz(4.767255368572561) q[19];
-cx q[3],q[19];
-cx q[3],q[22];
-cx q[7],q[19];
-rz(4.767255368572561) q[19];
-cx q[7],q[19];
-rx(6.321752996246448) q[7];
-rx(6.321752996246448) q[19];
-rz(4.767255368572561) q[20];
-cx q[0],q[20];
-rx(6.321752996246448) q[0];
-cx q[15],q[20];
-rz(4.767255368572561) q[20];
-cx q[15],q[20];
-rx(6.321752996246448) q[20];
-cx q[21],q[26];
-rz(4.767255368572561) q[22];
-cx q[3],q[22];
-cx q[3],q[23];
-cx q[9],q[22];
-rz(4.767255368572561) q[22];
-cx q[9],q[22];
-rx(6.321752996246448) q[9];
-rx(6.321752996246448) q[22];
-rz(4.767255368572561) q[23];
-cx q[3],q[23];
-cx q[3],q[24];
-cx q[17],q[23];
-rz(4.767255368572561) q[23];
-cx q[17],q[23];
-rx(6.321752996246448) q[17];
-rx(6.321752996246448) q[23];
-rz(4.767255368572561) q[24];
-cx q[3],q[24];
-cx q[3],q[25];
-cx q[5],q[24];
-rz(4.767255368572561) q[24];
-cx q[5],q[24];
-rx(6.321752996246448) q[5];
-rx(6.321752996246448) q[24];
-rz(4.767255368572561) q[25];
-cx q[3],q[25];
-cx q[12],q[25];
-rz(4.767255368572561) q[25];
-cx q[12],q[25];
-rx(6.321752996246448) q[12];
-rx(6.321752996246448) q[25];
-rz(1.7874663820573942) q[26];
-cx q[21],q[26];
-rx(5.563394815365419) q[21];
-cx q[4],q[21];
-rz(4.767255368572561) q[21];
-cx q[4],q[21];
-rx(6.321752996246448) q[4];
-cx q[15],q[21];
-rz(4.767255368572561) q[21];
-cx q[15],q[21];
-rx(6.321752996246448) q[15];
-rx(5.563394815365419) q[26];
-cx q[3],q[26];
-rz(4.767255368572561) q[26];
-cx q[3],q[26];
-rx(6.321752996246448) q[3];
-cx q[21],q[26];
-rz(4.767255368572561) q[26];
-cx q[21],q[26];
-rx(6.321752996246448) q[21];
-rx(6.321752996246448) q[26];
\ No newline at end of file
@@ -1,611 +0,0 @@
-OPENQASM 2.0;
-include "qelib1.inc";
-qreg q[28];
-ry(pi/2) q[0];
-rx(pi) q[0];
-ry(pi/2) q[1];
-rx(pi) q[1];
-cx q[0],q[1];
-rz(5.0948292049280415) q[1];
-cx q[0],q[1];
-ry(pi/2) q[2];
-rx(pi) q[2];
-cx q[0],q[2];
-rz(5.0948292049280415) q[2];
-cx q[0],q[2];
-rx(0.17628126427032476) q[2];
-ry(pi/2) q[3];
-rx(pi) q[3];
-cx q[0],q[3];
-rz(5.0948292049280415) q[3];
-cx q[0],q[3];
-cx q[1],q[3];
-rz(5.0948292049280415) q[3];
-cx q[1],q[3];
-ry(pi/2) q[4];
-rx(pi) q[4];
-cx q[1],q[4];
-rz(5.0948292049280415) q[4];
-cx q[1],q[4];
-cx q[3],q[4];
-rz(5.0948292049280415) q[4];
-cx q[3],q[4];
-ry(pi/2) q[5];
-rx(pi) q[5];
-cx q[1],q[5];
-rz(5.0948292049280415) q[5];
-cx q[1],q[5];
-cx q[3],q[5];
-rz(5.0948292049280415) q[5];
-cx q[3],q[5];
-ry(pi/2) q[6];
-rx(pi) q[6];
-cx q[4],q[6];
-rz(5.0948292049280415) q[6];
-cx q[4],q[6];
-cx q[5],q[6];
-rz(5.0948292049280415) q[6];
-cx q[5],q[6];
-ry(pi/2) q[7];
-rx(pi) q[7];
-cx q[3],q[7];
-rz(5.0948292049280415) q[7];
-cx q[3],q[7];
-cx q[4],q[7];
-rz(5.0948292049280415) q[7];
-cx q[4],q[7];
-ry(pi/2) q[8];
-rx(pi) q[8];
-cx q[3],q[8];
-rz(5.0948292049280415) q[8];
-cx q[3],q[8];
-cx q[5],q[8];
-rz(5.0948292049280415) q[8];
-cx q[5],q[8];
-rx(0.17628126427032476) q[8];
-ry(pi/2) q[9];
-rx(pi) q[9];
-cx q[1],q[9];
-rz(5.0948292049280415) q[9];
-cx q[1],q[9];
-cx q[3],q[9];
-rz(5.0948292049280415) q[9];
-cx q[3],q[9];
-ry(pi/2) q[10];
-rx(pi) q[10];
-cx q[4],q[10];
-rz(5.0948292049280415) q[10];
-cx q[4],q[10];
-cx q[6],q[10];
-rz(5.0948292049280415) q[10];
-cx q[6],q[10];
-rx(0.17628126427032476) q[10];
-ry(pi/2) q[11];
-rx(pi) q[11];
-cx q[5],q[11];
-rz(5.0948292049280415) q[11];
-cx q[5],q[11];
-cx q[6],q[11];
-rz(5.0948292049280415) q[11];
-cx q[6],q[11];
-rx(0.17628126427032476) q[11];
-ry(pi/2) q[12];
-rx(pi) q[12];
-cx q[3],q[12];
-rz(5.0948292049280415) q[12];
-cx q[3],q[12];
-cx q[5],q[12];
-rz(5.0948292049280415) q[12];
-cx q[5],q[12];
-ry(pi/2) q[13];
-rx(pi) q[13];
-cx q[4],q[13];
-rz(5.0948292049280415) q[13];
-cx q[4],q[13];
-cx q[5],q[13];
-rz(5.0948292049280415) q[13];
-cx q[5],q[13];
-rx(0.17628126427032476) q[13];
-ry(pi/2) q[14];
-rx(pi) q[14];
-cx q[3],q[14];
-rz(5.0948292049280415) q[14];
-cx q[3],q[14];
-cx q[4],q[14];
-rz(5.0948292049280415) q[14];
-cx q[4],q[14];
-rx(0.17628126427032476) q[14];
-ry(pi/2) q[15];
-rx(pi) q[15];
-cx q[0],q[15];
-rz(5.0948292049280415) q[15];
-cx q[0],q[15];
-cx q[3],q[15];
-rz(5.0948292049280415) q[15];
-cx q[3],q[15];
-ry(pi/2) q[16];
-rx(pi) q[16];
-cx q[0],q[16];
-rz(5.0948292049280415) q[16];
-cx q[0],q[16];
-cx q[3],q[16];
-rz(5.0948292049280415) q[16];
-cx q[3],q[16];
-rx(0.17628126427032476) q[16];
-ry(pi/2) q[17];
-rx(pi) q[17];
-cx q[1],q[17];
-rz(5.0948292049280415) q[17];
-cx q[1],q[17];
-rx(0.17628126427032476) q[1];
-cx q[3],q[17];
-rz(5.0948292049280415) q[17];
-cx q[3],q[17];
-ry(pi/2) q[18];
-rx(pi) q[18];
-cx q[3],q[18];
-rz(5.0948292049280415) q[18];
-cx q[3],q[18];
-cx q[4],q[18];
-rz(5.0948292049280415) q[18];
-cx q[4],q[18];
-rx(0.17628126427032476) q[18];
-ry(pi/2) q[19];
-rx(pi) q[19];
-cx q[3],q[19];
-rz(5.0948292049280415) q[19];
-cx q[3],q[19];
-cx q[7],q[19];
-rz(5.0948292049280415) q[19];
-cx q[7],q[19];
-rx(0.17628126427032476) q[7];
-rx(0.17628126427032476) q[19];
-ry(pi/2) q[20];
-rx(pi) q[20];
-cx q[0],q[20];
-rz(5.0948292049280415) q[20];
-cx q[0],q[20];
-rx(0.17628126427032476) q[0];
-cx q[0],q[1];
-rz(4.0760784153945595) q[1];
-cx q[0],q[1];
-cx q[0],q[2];
-rz(4.0760784153945595) q[2];
-cx q[0],q[2];
-rx(9.728764933501468) q[2];
-cx q[15],q[20];
-rz(5.0948292049280415) q[20];
-cx q[15],q[20];
-rx(0.17628126427032476) q[20];
-ry(pi/2) q[21];
-rx(pi) q[21];
-cx q[4],q[21];
-rz(5.0948292049280415) q[21];
-cx q[4],q[21];
-cx q[15],q[21];
-rz(5.0948292049280415) q[21];
-cx q[15],q[21];
-rx(0.17628126427032476) q[15];
-ry(pi/2) q[22];
-rx(pi) q[22];
-cx q[3],q[22];
-rz(5.0948292049280415) q[22];
-cx q[3],q[22];
-cx q[9],q[22];
-rz(5.0948292049280415) q[22];
-cx q[9],q[22];
-rx(0.17628126427032476) q[9];
-rx(0.17628126427032476) q[22];
-ry(pi/2) q[23];
-rx(pi) q[23];
-cx q[3],q[23];
-rz(5.0948292049280415) q[23];
-cx q[3],q[23];
-cx q[17],q[23];
-rz(5.0948292049280415) q[23];
-cx q[17],q[23];
-rx(0.17628126427032476) q[17];
-rx(0.17628126427032476) q[23];
-ry(pi/2) q[24];
-rx(pi) q[24];
-cx q[3],q[24];
-rz(5.0948292049280415) q[24];
-cx q[3],q[24];
-cx q[5],q[24];
-rz(5.0948292049280415) q[24];
-cx q[5],q[24];
-rx(0.17628126427032476) q[5];
-rx(0.17628126427032476) q[24];
-ry(pi/2) q[25];
-rx(pi) q[25];
-cx q[3],q[25];
-rz(5.0948292049280415) q[25];
-cx q[3],q[25];
-cx q[12],q[25];
-rz(5.0948292049280415) q[25];
-cx q[12],q[25];
-rx(0.17628126427032476) q[12];
-rx(0.17628126427032476) q[25];
-ry(pi/2) q[26];
-rx(pi) q[26];
-cx q[3],q[26];
-rz(5.0948292049280415) q[26];
-cx q[3],q[26];
-rx(0.17628126427032476) q[3];
-cx q[0],q[3];
-rz(4.0760784153945595) q[3];
-cx q[0],q[3];
-cx q[0],q[15];
-cx q[1],q[3];
-rz(4.0760784153945595) q[3];
-cx q[1],q[3];
-rz(4.0760784153945595) q[15];
-cx q[0],q[15];
-cx q[0],q[16];
-rz(4.0760784153945595) q[16];
-cx q[0],q[16];
-cx q[0],q[20];
-rz(4.0760784153945595) q[20];
-cx q[0],q[20];
-rx(9.728764933501468) q[0];
-cx q[21],q[26];
-rz(5.0948292049280415) q[26];
-cx q[21],q[26];
-rx(0.17628126427032476) q[21];
-rx(0.17628126427032476) q[26];
-ry(pi/2) q[27];
-rx(pi) q[27];
-cx q[4],q[27];
-rz(5.0948292049280415) q[27];
-cx q[4],q[27];
-rx(0.17628126427032476) q[4];
-cx q[1],q[4];
-rz(4.0760784153945595) q[4];
-cx q[1],q[4];
-cx q[1],q[5];
-cx q[3],q[4];
-rz(4.0760784153945595) q[4];
-cx q[3],q[4];
-rz(4.0760784153945595) q[5];
-cx q[1],q[5];
-cx q[1],q[9];
-cx q[3],q[5];
-rz(4.0760784153945595) q[5];
-cx q[3],q[5];
-cx q[3],q[7];
-cx q[6],q[27];
-rz(4.0760784153945595) q[7];
-cx q[3],q[7];
-cx q[3],q[8];
-rz(4.0760784153945595) q[8];
-cx q[3],q[8];
-rz(4.0760784153945595) q[9];
-cx q[1],q[9];
-cx q[1],q[17];
-cx q[3],q[9];
-rz(4.0760784153945595) q[9];
-cx q[3],q[9];
-cx q[3],q[12];
-rz(4.0760784153945595) q[12];
-cx q[3],q[12];
-cx q[3],q[14];
-rz(4.0760784153945595) q[14];
-cx q[3],q[14];
-cx q[3],q[15];
-rz(4.0760784153945595) q[15];
-cx q[3],q[15];
-cx q[3],q[16];
-cx q[15],q[20];
-rz(4.0760784153945595) q[16];
-cx q[3],q[16];
-rx(9.728764933501468) q[16];
-rz(4.0760784153945595) q[17];
-cx q[1],q[17];
-rx(9.728764933501468) q[1];
-cx q[0],q[1];
-rz(3.3986272096303405) q[1];
-cx q[0],q[1];
-cx q[0],q[2];
-rz(3.3986272096303405) q[2];
-cx q[0],q[2];
-rx(6.998066820459358) q[2];
-cx q[3],q[17];
-rz(4.0760784153945595) q[17];
-cx q[3],q[17];
-cx q[3],q[18];
-rz(4.0760784153945595) q[18];
-cx q[3],q[18];
-cx q[3],q[19];
-rz(4.0760784153945595) q[19];
-cx q[3],q[19];
-cx q[3],q[22];
-rz(4.0760784153945595) q[20];
-cx q[15],q[20];
-rx(9.728764933501468) q[20];
-rz(4.0760784153945595) q[22];
-cx q[3],q[22];
-cx q[3],q[23];
-cx q[9],q[22];
-rz(4.0760784153945595) q[22];
-cx q[9],q[22];
-rx(9.728764933501468) q[9];
-rx(9.728764933501468) q[22];
-rz(4.0760784153945595) q[23];
-cx q[3],q[23];
-cx q[3],q[24];
-cx q[17],q[23];
-rz(4.0760784153945595) q[23];
-cx q[17],q[23];
-rx(9.728764933501468) q[17];
-rx(9.728764933501468) q[23];
-rz(4.0760784153945595) q[24];
-cx q[3],q[24];
-cx q[3],q[25];
-rz(4.0760784153945595) q[25];
-cx q[3],q[25];
-cx q[3],q[26];
-rz(4.0760784153945595) q[26];
-cx q[3],q[26];
-rx(9.728764933501468) q[3];
-cx q[0],q[3];
-rz(3.3986272096303405) q[3];
-cx q[0],q[3];
-cx q[1],q[3];
-rz(3.3986272096303405) q[3];
-cx q[1],q[3];
-rz(5.0948292049280415) q[27];
-cx q[6],q[27];
-rx(0.17628126427032476) q[6];
-cx q[4],q[6];
-rz(4.0760784153945595) q[6];
-cx q[4],q[6];
-cx q[4],q[7];
-cx q[5],q[6];
-rz(4.0760784153945595) q[6];
-cx q[5],q[6];
-cx q[5],q[8];
-rz(4.0760784153945595) q[7];
-cx q[4],q[7];
-cx q[4],q[10];
-cx q[7],q[19];
-rz(4.0760784153945595) q[8];
-cx q[5],q[8];
-cx q[5],q[11];
-rx(9.728764933501468) q[8];
-rz(4.0760784153945595) q[10];
-cx q[4],q[10];
-cx q[4],q[13];
-cx q[6],q[10];
-rz(4.0760784153945595) q[10];
-cx q[6],q[10];
-rx(9.728764933501468) q[10];
-rz(4.0760784153945595) q[11];
-cx q[5],q[11];
-cx q[5],q[12];
-cx q[6],q[11];
-rz(4.0760784153945595) q[11];
-cx q[6],q[11];
-rx(9.728764933501468) q[11];
-rz(4.0760784153945595) q[12];
-cx q[5],q[12];
-cx q[12],q[25];
-rz(4.0760784153945595) q[13];
-cx q[4],q[13];
-cx q[4],q[14];
-cx q[5],q[13];
-rz(4.0760784153945595) q[13];
-cx q[5],q[13];
-cx q[5],q[24];
-rx(9.728764933501468) q[13];
-rz(4.0760784153945595) q[14];
-cx q[4],q[14];
-cx q[4],q[18];
-rx(9.728764933501468) q[14];
-rz(4.0760784153945595) q[18];
-cx q[4],q[18];
-cx q[4],q[21];
-rx(9.728764933501468) q[18];
-rz(4.0760784153945595) q[19];
-cx q[7],q[19];
-rx(9.728764933501468) q[7];
-rx(9.728764933501468) q[19];
-rz(4.0760784153945595) q[21];
-cx q[4],q[21];
-cx q[15],q[21];
-rz(4.0760784153945595) q[21];
-cx q[15],q[21];
-rx(9.728764933501468) q[15];
-cx q[0],q[15];
-rz(3.3986272096303405) q[15];
-cx q[0],q[15];
-cx q[0],q[16];
-rz(3.3986272096303405) q[16];
-cx q[0],q[16];
-cx q[0],q[20];
-rz(3.3986272096303405) q[20];
-cx q[0],q[20];
-rx(6.998066820459358) q[0];
-cx q[21],q[26];
-rz(4.0760784153945595) q[24];
-cx q[5],q[24];
-rx(9.728764933501468) q[5];
-rx(9.728764933501468) q[24];
-rz(4.0760784153945595) q[25];
-cx q[12],q[25];
-rx(9.728764933501468) q[12];
-rx(9.728764933501468) q[25];
-rz(4.0760784153945595) q[26];
-cx q[21],q[26];
-rx(9.728764933501468) q[21];
-rx(9.728764933501468) q[26];
-rx(0.17628126427032476) q[27];
-cx q[4],q[27];
-rz(4.0760784153945595) q[27];
-cx q[4],q[27];
-rx(9.728764933501468) q[4];
-cx q[1],q[4];
-rz(3.3986272096303405) q[4];
-cx q[1],q[4];
-cx q[1],q[5];
-cx q[3],q[4];
-rz(3.3986272096303405) q[4];
-cx q[3],q[4];
-rz(3.3986272096303405) q[5];
-cx q[1],q[5];
-cx q[1],q[9];
-cx q[3],q[5];
-rz(3.3986272096303405) q[5];
-cx q[3],q[5];
-cx q[3],q[7];
-cx q[6],q[27];
-rz(3.3986272096303405) q[7];
-cx q[3],q[7];
-cx q[3],q[8];
-rz(3.3986272096303405) q[8];
-cx q[3],q[8];
-rz(3.3986272096303405) q[9];
-cx q[1],q[9];
-cx q[1],q[17];
-cx q[3],q[9];
-rz(3.3986272096303405) q[9];
-cx q[3],q[9];
-cx q[3],q[12];
-rz(3.3986272096303405) q[12];
-cx q[3],q[12];
-cx q[3],q[14];
-rz(3.3986272096303405) q[14];
-cx q[3],q[14];
-cx q[3],q[15];
-rz(3.3986272096303405) q[15];
-cx q[3],q[15];
-cx q[3],q[16];
-cx q[15],q[20];
-rz(3.3986272096303405) q[16];
-cx q[3],q[16];
-rx(6.998066820459358) q[16];
-rz(3.3986272096303405) q[17];
-cx q[1],q[17];
-rx(6.998066820459358) q[1];
-cx q[3],q[17];
-rz(3.3986272096303405) q[17];
-cx q[3],q[17];
-cx q[3],q[18];
-rz(3.3986272096303405) q[18];
-cx q[3],q[18];
-cx q[3],q[19];
-rz(3.3986272096303405) q[19];
-cx q[3],q[19];
-cx q[3],q[22];
-rz(3.3986272096303405) q[20];
-cx q[15],q[20];
-rx(6.998066820459358) q[20];
-rz(3.3986272096303405) q[22];
-cx q[3],q[22];
-cx q[3],q[23];
-cx q[9],q[22];
-rz(3.3986272096303405) q[22];
-cx q[9],q[22];
-rx(6.998066820459358) q[9];
-rx(6.998066820459358) q[22];
-rz(3.3986272096303405) q[23];
-cx q[3],q[23];
-cx q[3],q[24];
-cx q[17],q[23];
-rz(3.3986272096303405) q[23];
-cx q[17],q[23];
-rx(6.998066820459358) q[17];
-rx(6.998066820459358) q[23];
-rz(3.3986272096303405) q[24];
-cx q[3],q[24];
-cx q[3],q[25];
-rz(3.3986272096303405) q[25];
-cx q[3],q[25];
-cx q[3],q[26];
-rz(3.3986272096303405) q[26];
-cx q[3],q[26];
-rx(6.998066820459358) q[3];
-rz(4.0760784153945595) q[27];
-cx q[6],q[27];
-rx(9.728764933501468) q[6];
-cx q[4],q[6];
-rz(3.3986272096303405) q[6];
-cx q[4],q[6];
-cx q[4],q[7];
-cx q[5],q[6];
-rz(3.3986272096303405) q[6];
-cx q[5],q[6];
-cx q[5],q[8];
-rz(3.3986272096303405) q[7];
-cx q[4],q[7];
-cx q[4],q[10];
-cx q[7],q[19];
-rz(3.3986272096303405) q[8];
-cx q[5],q[8];
-cx q[5],q[11];
-rx(6.998066820459358) q[8];
-rz(3.3986272096303405) q[10];
-cx q[4],q[10];
-cx q[4],q[13];
-cx q[6],q[10];
-rz(3.3986272096303405) q[10];
-cx q[6],q[10];
-rx(6.998066820459358) q[10];
-rz(3.3986272096303405) q[11];
-cx q[5],q[11];
-cx q[5],q[12];
-cx q[6],q[11];
-rz(3.3986272096303405) q[11];
-cx q[6],q[11];
-rx(6.998066820459358) q[11];
-rz(3.3986272096303405) q[12];
-cx q[5],q[12];
-cx q[12],q[25];
-rz(3.3986272096303405) q[13];
-cx q[4],q[13];
-cx q[4],q[14];
-cx q[5],q[13];
-rz(3.3986272096303405) q[13];
-cx q[5],q[13];
-cx q[5],q[24];
-rx(6.998066820459358) q[13];
-rz(3.3986272096303405) q[14];
-cx q[4],q[14];
-cx q[4],q[18];
-rx(6.998066820459358) q[14];
-rz(3.3986272096303405) q[18];
-cx q[4],q[18];
-cx q[4],q[21];
-rx(6.998066820459358) q[18];
-rz(3.3986272096303405) q[19];
-cx q[7],q[19];
-rx(6.998066820459358) q[7];
-rx(6.998066820459358) q[19];
-rz(3.3986272096303405) q[21];
-cx q[4],q[21];
-cx q[15],q[21];
-rz(3.3986272096303405) q[21];
-cx q[15],q[21];
-rx(6.998066820459358) q[15];
-cx q[21],q[26];
-rz(3.3986272096303405) q[24];
-cx q[5],q[24];
-rx(6.998066820459358) q[5];
-rx(6.998066820459358) q[24];
-rz(3.3986272096303405) q[25];
-cx q[12],q[25];
-rx(6.998066820459358) q[12];
-rx(6.998066820459358) q[25];
-rz(3.3986272096303405) q[26];
-cx q[21],q[26];
-rx(6.998066820459358) q[21];
-rx(6.998066820459358) q[26];
-rx(9.728764933501468) q[27];
-cx q[4],q[27];
-rz(3.3986272096303405) q[27];
-cx q[4],q[27];
-rx(6.998066820459358) q[4];
-cx q[6],q[27];
-rz(3.3986272096303405) q[27];
-cx q[6],q[27];
-rx(6.998066820459358) q[6];
-rx(6.998066820459358) q[27];
\ No newline at end of file
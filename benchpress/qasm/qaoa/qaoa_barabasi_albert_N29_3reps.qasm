@@ -1,634 +0,0 @@
-OPENQASM 2.0;
-include "qelib1.inc";
-qreg q[29];
-ry(pi/2) q[0];
-rx(pi) q[0];
-ry(pi/2) q[1];
-rx(pi) q[1];
-cx q[0],q[1];
-rz(2.633248061668779) q[1];
-cx q[0],q[1];
-ry(pi/2) q[2];
-rx(pi) q[2];
-cx q[0],q[2];
-rz(2.633248061668779) q[2];
-cx q[0],q[2];
-rx(10.802416526632983) q[2];
-ry(pi/2) q[3];
-rx(pi) q[3];
-cx q[0],q[3];
-rz(2.633248061668779) q[3];
-cx q[0],q[3];
-cx q[1],q[3];
-rz(2.633248061668779) q[3];
-cx q[1],q[3];
-ry(pi/2) q[4];
-rx(pi) q[4];
-cx q[1],q[4];
-rz(2.633248061668779) q[4];
-cx q[1],q[4];
-cx q[3],q[4];
-rz(2.633248061668779) q[4];
-cx q[3],q[4];
-ry(pi/2) q[5];
-rx(pi) q[5];
-cx q[1],q[5];
-rz(2.633248061668779) q[5];
-cx q[1],q[5];
-cx q[3],q[5];
-rz(2.633248061668779) q[5];
-cx q[3],q[5];
-ry(pi/2) q[6];
-rx(pi) q[6];
-cx q[4],q[6];
-rz(2.633248061668779) q[6];
-cx q[4],q[6];
-cx q[5],q[6];
-rz(2.633248061668779) q[6];
-cx q[5],q[6];
-ry(pi/2) q[7];
-rx(pi) q[7];
-cx q[3],q[7];
-rz(2.633248061668779) q[7];
-cx q[3],q[7];
-cx q[4],q[7];
-rz(2.633248061668779) q[7];
-cx q[4],q[7];
-ry(pi/2) q[8];
-rx(pi) q[8];
-cx q[3],q[8];
-rz(2.633248061668779) q[8];
-cx q[3],q[8];
-cx q[5],q[8];
-rz(2.633248061668779) q[8];
-cx q[5],q[8];
-rx(10.802416526632983) q[8];
-ry(pi/2) q[9];
-rx(pi) q[9];
-cx q[1],q[9];
-rz(2.633248061668779) q[9];
-cx q[1],q[9];
-cx q[3],q[9];
-rz(2.633248061668779) q[9];
-cx q[3],q[9];
-ry(pi/2) q[10];
-rx(pi) q[10];
-cx q[4],q[10];
-rz(2.633248061668779) q[10];
-cx q[4],q[10];
-cx q[6],q[10];
-rz(2.633248061668779) q[10];
-cx q[6],q[10];
-rx(10.802416526632983) q[10];
-ry(pi/2) q[11];
-rx(pi) q[11];
-cx q[5],q[11];
-rz(2.633248061668779) q[11];
-cx q[5],q[11];
-cx q[6],q[11];
-rz(2.633248061668779) q[11];
-cx q[6],q[11];
-rx(10.802416526632983) q[11];
-ry(pi/2) q[12];
-rx(pi) q[12];
-cx q[3],q[12];
-rz(2.633248061668779) q[12];
-cx q[3],q[12];
-cx q[5],q[12];
-rz(2.633248061668779) q[12];
-cx q[5],q[12];
-ry(pi/2) q[13];
-rx(pi) q[13];
-cx q[4],q[13];
-rz(2.633248061668779) q[13];
-cx q[4],q[13];
-cx q[5],q[13];
-rz(2.633248061668779) q[13];
-cx q[5],q[13];
-rx(10.802416526632983) q[13];
-ry(pi/2) q[14];
-rx(pi) q[14];
-cx q[3],q[14];
-rz(2.633248061668779) q[14];
-cx q[3],q[14];
-cx q[4],q[14];
-rz(2.633248061668779) q[14];
-cx q[4],q[14];
-rx(10.802416526632983) q[14];
-ry(pi/2) q[15];
-rx(pi) q[15];
-cx q[0],q[15];
-rz(2.633248061668779) q[15];
-cx q[0],q[15];
-cx q[3],q[15];
-rz(2.633248061668779) q[15];
-cx q[3],q[15];
-ry(pi/2) q[16];
-rx(pi) q[16];
-cx q[0],q[16];
-rz(2.633248061668779) q[16];
-cx q[0],q[16];
-cx q[3],q[16];
-rz(2.633248061668779) q[16];
-cx q[3],q[16];
-rx(10.802416526632983) q[16];
-ry(pi/2) q[17];
-rx(pi) q[17];
-cx q[1],q[17];
-rz(2.633248061668779) q[17];
-cx q[1],q[17];
-cx q[3],q[17];
-rz(2.633248061668779) q[17];
-cx q[3],q[17];
-ry(pi/2) q[18];
-rx(pi) q[18];
-cx q[3],q[18];
-rz(2.633248061668779) q[18];
-cx q[3],q[18];
-cx q[4],q[18];
-rz(2.633248061668779) q[18];
-cx q[4],q[18];
-rx(10.802416526632983) q[18];
-ry(pi/2) q[19];
-rx(pi) q[19];
-cx q[3],q[19];
-rz(2.633248061668779) q[19];
-cx q[3],q[19];
-cx q[7],q[19];
-rz(2.633248061668779) q[19];
-cx q[7],q[19];
-rx(10.802416526632983) q[7];
-rx(10.802416526632983) q[19];
-ry(pi/2) q[20];
-rx(pi) q[20];
-cx q[0],q[20];
-rz(2.633248061668779) q[20];
-cx q[0],q[20];
-rx(10.802416526632983) q[0];
-cx q[15],q[20];
-rz(2.633248061668779) q[20];
-cx q[15],q[20];
-rx(10.802416526632983) q[20];
-ry(pi/2) q[21];
-rx(pi) q[21];
-cx q[4],q[21];
-rz(2.633248061668779) q[21];
-cx q[4],q[21];
-cx q[15],q[21];
-rz(2.633248061668779) q[21];
-cx q[15],q[21];
-rx(10.802416526632983) q[15];
-ry(pi/2) q[22];
-rx(pi) q[22];
-cx q[3],q[22];
-rz(2.633248061668779) q[22];
-cx q[3],q[22];
-cx q[9],q[22];
-rz(2.633248061668779) q[22];
-cx q[9],q[22];
-rx(10.802416526632983) q[9];
-rx(10.802416526632983) q[22];
-ry(pi/2) q[23];
-rx(pi) q[23];
-cx q[3],q[23];
-rz(2.633248061668779) q[23];
-cx q[3],q[23];
-cx q[17],q[23];
-rz(2.633248061668779) q[23];
-cx q[17],q[23];
-rx(10.802416526632983) q[17];
-rx(10.802416526632983) q[23];
-ry(pi/2) q[24];
-rx(pi) q[24];
-cx q[3],q[24];
-rz(2.633248061668779) q[24];
-cx q[3],q[24];
-cx q[5],q[24];
-rz(2.633248061668779) q[24];
-cx q[5],q[24];
-rx(10.802416526632983) q[5];
-rx(10.802416526632983) q[24];
-ry(pi/2) q[25];
-rx(pi) q[25];
-cx q[3],q[25];
-rz(2.633248061668779) q[25];
-cx q[3],q[25];
-cx q[12],q[25];
-rz(2.633248061668779) q[25];
-cx q[12],q[25];
-rx(10.802416526632983) q[12];
-rx(10.802416526632983) q[25];
-ry(pi/2) q[26];
-rx(pi) q[26];
-cx q[3],q[26];
-rz(2.633248061668779) q[26];
-cx q[3],q[26];
-cx q[21],q[26];
-rz(2.633248061668779) q[26];
-cx q[21],q[26];
-rx(10.802416526632983) q[21];
-rx(10.802416526632983) q[26];
-ry(pi/2) q[27];
-rx(pi) q[27];
-cx q[4],q[27];
-rz(2.633248061668779) q[27];
-cx q[4],q[27];
-rx(10.802416526632983) q[4];
-cx q[6],q[27];
-rz(2.633248061668779) q[27];
-cx q[6],q[27];
-rx(10.802416526632983) q[6];
-rx(10.802416526632983) q[27];
-ry(pi/2) q[28];
-rx(pi) q[28];
-cx q[1],q[28];
-rz(2.633248061668779) q[28];
-cx q[1],q[28];
-rx(10.802416526632983) q[1];
-cx q[0],q[1];
-rz(5.447656170740557) q[1];
-cx q[0],q[1];
-cx q[0],q[2];
-rz(5.447656170740557) q[2];
-cx q[0],q[2];
-rx(3.1798399577892664) q[2];
-cx q[3],q[28];
-rz(2.633248061668779) q[28];
-cx q[3],q[28];
-rx(10.802416526632983) q[3];
-cx q[0],q[3];
-rz(5.447656170740557) q[3];
-cx q[0],q[3];
-cx q[0],q[15];
-cx q[1],q[3];
-rz(5.447656170740557) q[3];
-cx q[1],q[3];
-cx q[1],q[4];
-rz(5.447656170740557) q[4];
-cx q[1],q[4];
-cx q[1],q[5];
-cx q[3],q[4];
-rz(5.447656170740557) q[4];
-cx q[3],q[4];
-cx q[4],q[6];
-rz(5.447656170740557) q[5];
-cx q[1],q[5];
-cx q[1],q[9];
-cx q[3],q[5];
-rz(5.447656170740557) q[5];
-cx q[3],q[5];
-cx q[3],q[7];
-rz(5.447656170740557) q[6];
-cx q[4],q[6];
-cx q[5],q[6];
-rz(5.447656170740557) q[6];
-cx q[5],q[6];
-rz(5.447656170740557) q[7];
-cx q[3],q[7];
-cx q[3],q[8];
-cx q[4],q[7];
-rz(5.447656170740557) q[7];
-cx q[4],q[7];
-cx q[4],q[10];
-rz(5.447656170740557) q[8];
-cx q[3],q[8];
-cx q[5],q[8];
-rz(5.447656170740557) q[8];
-cx q[5],q[8];
-cx q[5],q[11];
-rx(3.1798399577892664) q[8];
-rz(5.447656170740557) q[9];
-cx q[1],q[9];
-cx q[1],q[17];
-cx q[3],q[9];
-rz(5.447656170740557) q[9];
-cx q[3],q[9];
-cx q[3],q[12];
-rz(5.447656170740557) q[10];
-cx q[4],q[10];
-cx q[4],q[13];
-cx q[6],q[10];
-rz(5.447656170740557) q[10];
-cx q[6],q[10];
-rx(3.1798399577892664) q[10];
-rz(5.447656170740557) q[11];
-cx q[5],q[11];
-cx q[6],q[11];
-rz(5.447656170740557) q[11];
-cx q[6],q[11];
-rx(3.1798399577892664) q[11];
-rz(5.447656170740557) q[12];
-cx q[3],q[12];
-cx q[3],q[14];
-cx q[5],q[12];
-rz(5.447656170740557) q[12];
-cx q[5],q[12];
-rz(5.447656170740557) q[13];
-cx q[4],q[13];
-cx q[5],q[13];
-rz(5.447656170740557) q[13];
-cx q[5],q[13];
-rx(3.1798399577892664) q[13];
-rz(5.447656170740557) q[14];
-cx q[3],q[14];
-cx q[4],q[14];
-rz(5.447656170740557) q[14];
-cx q[4],q[14];
-rx(3.1798399577892664) q[14];
-rz(5.447656170740557) q[15];
-cx q[0],q[15];
-cx q[0],q[16];
-cx q[3],q[15];
-rz(5.447656170740557) q[15];
-cx q[3],q[15];
-rz(5.447656170740557) q[16];
-cx q[0],q[16];
-cx q[0],q[20];
-cx q[3],q[16];
-rz(5.447656170740557) q[16];
-cx q[3],q[16];
-rx(3.1798399577892664) q[16];
-rz(5.447656170740557) q[17];
-cx q[1],q[17];
-cx q[3],q[17];
-rz(5.447656170740557) q[17];
-cx q[3],q[17];
-cx q[3],q[18];
-rz(5.447656170740557) q[18];
-cx q[3],q[18];
-cx q[3],q[19];
-cx q[4],q[18];
-rz(5.447656170740557) q[18];
-cx q[4],q[18];
-cx q[4],q[21];
-rx(3.1798399577892664) q[18];
-rz(5.447656170740557) q[19];
-cx q[3],q[19];
-cx q[3],q[22];
-cx q[7],q[19];
-rz(5.447656170740557) q[19];
-cx q[7],q[19];
-rx(3.1798399577892664) q[7];
-rx(3.1798399577892664) q[19];
-rz(5.447656170740557) q[20];
-cx q[0],q[20];
-rx(3.1798399577892664) q[0];
-cx q[15],q[20];
-rz(5.447656170740557) q[20];
-cx q[15],q[20];
-rx(3.1798399577892664) q[20];
-rz(5.447656170740557) q[21];
-cx q[4],q[21];
-cx q[4],q[27];
-cx q[15],q[21];
-rz(5.447656170740557) q[21];
-cx q[15],q[21];
-rx(3.1798399577892664) q[15];
-rz(5.447656170740557) q[22];
-cx q[3],q[22];
-cx q[3],q[23];
-cx q[9],q[22];
-rz(5.447656170740557) q[22];
-cx q[9],q[22];
-rx(3.1798399577892664) q[9];
-rx(3.1798399577892664) q[22];
-rz(5.447656170740557) q[23];
-cx q[3],q[23];
-cx q[3],q[24];
-cx q[17],q[23];
-rz(5.447656170740557) q[23];
-cx q[17],q[23];
-rx(3.1798399577892664) q[17];
-rx(3.1798399577892664) q[23];
-rz(5.447656170740557) q[24];
-cx q[3],q[24];
-cx q[3],q[25];
-cx q[5],q[24];
-rz(5.447656170740557) q[24];
-cx q[5],q[24];
-rx(3.1798399577892664) q[5];
-rx(3.1798399577892664) q[24];
-rz(5.447656170740557) q[25];
-cx q[3],q[25];
-cx q[3],q[26];
-cx q[12],q[25];
-rz(5.447656170740557) q[25];
-cx q[12],q[25];
-rx(3.1798399577892664) q[12];
-rx(3.1798399577892664) q[25];
-rz(5.447656170740557) q[26];
-cx q[3],q[26];
-cx q[21],q[26];
-rz(5.447656170740557) q[26];
-cx q[21],q[26];
-rx(3.1798399577892664) q[21];
-rx(3.1798399577892664) q[26];
-rz(5.447656170740557) q[27];
-cx q[4],q[27];
-rx(3.1798399577892664) q[4];
-cx q[6],q[27];
-rz(5.447656170740557) q[27];
-cx q[6],q[27];
-rx(3.1798399577892664) q[6];
-rx(3.1798399577892664) q[27];
-rx(10.802416526632983) q[28];
-cx q[1],q[28];
-rz(5.447656170740557) q[28];
-cx q[1],q[28];
-rx(3.1798399577892664) q[1];
-cx q[0],q[1];
-rz(5.2402174663635845) q[1];
-cx q[0],q[1];
-cx q[0],q[2];
-rz(5.2402174663635845) q[2];
-cx q[0],q[2];
-rx(9.155179030720339) q[2];
-cx q[3],q[28];
-rz(5.447656170740557) q[28];
-cx q[3],q[28];
-rx(3.1798399577892664) q[3];
-cx q[0],q[3];
-rz(5.2402174663635845) q[3];
-cx q[0],q[3];
-cx q[0],q[15];
-cx q[1],q[3];
-rz(5.2402174663635845) q[3];
-cx q[1],q[3];
-cx q[1],q[4];
-rz(5.2402174663635845) q[4];
-cx q[1],q[4];
-cx q[1],q[5];
-cx q[3],q[4];
-rz(5.2402174663635845) q[4];
-cx q[3],q[4];
-cx q[4],q[6];
-rz(5.2402174663635845) q[5];
-cx q[1],q[5];
-cx q[1],q[9];
-cx q[3],q[5];
-rz(5.2402174663635845) q[5];
-cx q[3],q[5];
-cx q[3],q[7];
-rz(5.2402174663635845) q[6];
-cx q[4],q[6];
-cx q[5],q[6];
-rz(5.2402174663635845) q[6];
-cx q[5],q[6];
-rz(5.2402174663635845) q[7];
-cx q[3],q[7];
-cx q[3],q[8];
-cx q[4],q[7];
-rz(5.2402174663635845) q[7];
-cx q[4],q[7];
-cx q[4],q[10];
-rz(5.2402174663635845) q[8];
-cx q[3],q[8];
-cx q[5],q[8];
-rz(5.2402174663635845) q[8];
-cx q[5],q[8];
-cx q[5],q[11];
-rx(9.155179030720339) q[8];
-rz(5.2402174663635845) q[9];
-cx q[1],q[9];
-cx q[1],q[17];
-cx q[3],q[9];
-rz(5.2402174663635845) q[9];
-cx q[3],q[9];
-cx q[3],q[12];
-rz(5.2402174663635845) q[10];
-cx q[4],q[10];
-cx q[4],q[13];
-cx q[6],q[10];
-rz(5.2402174663635845) q[10];
-cx q[6],q[10];
-rx(9.155179030720339) q[10];
-rz(5.2402174663635845) q[11];
-cx q[5],q[11];
-cx q[6],q[11];
-rz(5.2402174663635845) q[11];
-cx q[6],q[11];
-rx(9.155179030720339) q[11];
-rz(5.2402174663635845) q[12];
-cx q[3],q[12];
-cx q[3],q[14];
-cx q[5],q[12];
-rz(5.2402174663635845) q[12];
-cx q[5],q[12];
-rz(5.2402174663635845) q[13];
-cx q[4],q[13];
-cx q[5],q[13];
-rz(5.2402174663635845) q[13];
-cx q[5],q[13];
-rx(9.155179030720339) q[13];
-rz(5.2402174663635845) q[14];
-cx q[3],q[14];
-cx q[4],q[14];
-rz(5.2402174663635845) q[14];
-cx q[4],q[14];
-rx(9.155179030720339) q[14];
-rz(5.2402174663635845) q[15];
-cx q[0],q[15];
-cx q[0],q[16];
-cx q[3],q[15];
-rz(5.2402174663635845) q[15];
-cx q[3],q[15];
-rz(5.2402174663635845) q[16];
-cx q[0],q[16];
-cx q[0],q[20];
-cx q[3],q[16];
-rz(5.2402174663635845) q[16];
-cx q[3],q[16];
-rx(9.155179030720339) q[16];
-rz(5.2402174663635845) q[17];
-cx q[1],q[17];
-cx q[3],q[17];
-rz(5.2402174663635845) q[17];
-cx q[3],q[17];
-cx q[3],q[18];
-rz(5.2402174663635845) q[18];
-cx q[3],q[18];
-cx q[3],q[19];
-cx q[4],q[18];
-rz(5.2402174663635845) q[18];
-cx q[4],q[18];
-cx q[4],q[21];
-rx(9.155179030720339) q[18];
-rz(5.2402174663635845) q[19];
-cx q[3],q[19];
-cx q[3],q[22];
-cx q[7],q[19];
-rz(5.2402174663635845) q[19];
-cx q[7],q[19];
-rx(9.155179030720339) q[7];
-rx(9.155179030720339) q[19];
-rz(5.2402174663635845) q[20];
-cx q[0],q[20];
-rx(9.155179030720339) q[0];
-cx q[15],q[20];
-rz(5.2402174663635845) q[20];
-cx q[15],q[20];
-rx(9.155179030720339) q[20];
-rz(5.2402174663635845) q[21];
-cx q[4],q[21];
-cx q[4],q[27];
-cx q[15],q[21];
-rz(5.2402174663635845) q[21];
-cx q[15],q[21];
-rx(9.155179030720339) q[15];
-rz(5.2402174663635845) q[22];
-cx q[3],q[22];
-cx q[3],q[23];
-cx q[9],q[22];
-rz(5.2402174663635845) q[22];
-cx q[9],q[22];
-rx(9.155179030720339) q[9];
-rx(9.155179030720339) q[22];
-rz(5.2402174663635845) q[23];
-cx q[3],q[23];
-cx q[3],q[24];
-cx q[17],q[23];
-rz(5.2402174663635845) q[23];
-cx q[17],q[23];
-rx(9.155179030720339) q[17];
-rx(9.155179030720339) q[23];
-rz(5.2402174663635845) q[24];
-cx q[3],q[24];
-cx q[3],q[25];
-cx q[5],q[24];
-rz(5.2402174663635845) q[24];
-cx q[5],q[24];
-rx(9.155179030720339) q[5];
-rx(9.155179030720339) q[24];
-rz(5.2402174663635845) q[25];
-cx q[3],q[25];
-cx q[3],q[26];
-cx q[12],q[25];
-rz(5.2402174663635845) q[25];
-cx q[12],q[25];
-rx(9.155179030720339) q[12];
-rx(9.155179030720339) q[25];
-rz(5.2402174663635845) q[26];
-cx q[3],q[26];
-cx q[21],q[26];
-rz(5.2402174663635845) q[26];
-cx q[21],q[26];
-rx(9.155179030720339) q[21];
-rx(9.155179030720339) q[26];
-rz(5.2402174663635845) q[27];
-cx q[4],q[27];
-rx(9.155179030720339) q[4];
-cx q[6],q[27];
-rz(5.2402174663635845) q[27];
-cx q[6],q[27];
-rx(9.155179030720339) q[6];
-rx(9.155179030720339) q[27];
-rx(3.1798399577892664) q[28];
-cx q[1],q[28];
-rz(5.2402174663635845) q[28];
-cx q[1],q[28];
-rx(9.155179030720339) q[1];
-cx q[3],q[28];
-rz(5.2402174663635845) q[28];
-cx q[3],q[28];
-rx(9.155179030720339) q[3];
-rx(9.155179030720339) q[28];
\ No newline at end of file
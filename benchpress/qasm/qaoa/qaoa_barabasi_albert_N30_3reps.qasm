@@ -1,657 +0,0 @@
-OPENQASM 2.0;
-include "qelib1.inc";
-qreg q[30];
-ry(pi/2) q[0];
-rx(pi) q[0];
-ry(pi/2) q[1];
-rx(pi) q[1];
-cx q[0],q[1];
-rz(1.158093774560294) q[1];
-cx q[0],q[1];
-ry(pi/2) q[2];
-rx(pi) q[2];
-cx q[0],q[2];
-rz(1.158093774560294) q[2];
-cx q[0],q[2];
-rx(10.465494368969964) q[2];
-ry(pi/2) q[3];
-rx(pi) q[3];
-cx q[0],q[3];
-rz(1.158093774560294) q[3];
-cx q[0],q[3];
-cx q[1],q[3];
-rz(1.158093774560294) q[3];
-cx q[1],q[3];
-ry(pi/2) q[4];
-rx(pi) q[4];
-cx q[1],q[4];
-rz(1.158093774560294) q[4];
-cx q[1],q[4];
-cx q[3],q[4];
-rz(1.158093774560294) q[4];
-cx q[3],q[4];
-ry(pi/2) q[5];
-rx(pi) q[5];
-cx q[1],q[5];
-rz(1.158093774560294) q[5];
-cx q[1],q[5];
-cx q[3],q[5];
-rz(1.158093774560294) q[5];
-cx q[3],q[5];
-ry(pi/2) q[6];
-rx(pi) q[6];
-cx q[4],q[6];
-rz(1.158093774560294) q[6];
-cx q[4],q[6];
-cx q[5],q[6];
-rz(1.158093774560294) q[6];
-cx q[5],q[6];
-ry(pi/2) q[7];
-rx(pi) q[7];
-cx q[3],q[7];
-rz(1.158093774560294) q[7];
-cx q[3],q[7];
-cx q[4],q[7];
-rz(1.158093774560294) q[7];
-cx q[4],q[7];
-ry(pi/2) q[8];
-rx(pi) q[8];
-cx q[3],q[8];
-rz(1.158093774560294) q[8];
-cx q[3],q[8];
-cx q[5],q[8];
-rz(1.158093774560294) q[8];
-cx q[5],q[8];
-rx(10.465494368969964) q[8];
-ry(pi/2) q[9];
-rx(pi) q[9];
-cx q[1],q[9];
-rz(1.158093774560294) q[9];
-cx q[1],q[9];
-cx q[3],q[9];
-rz(1.158093774560294) q[9];
-cx q[3],q[9];
-ry(pi/2) q[10];
-rx(pi) q[10];
-cx q[4],q[10];
-rz(1.158093774560294) q[10];
-cx q[4],q[10];
-cx q[6],q[10];
-rz(1.158093774560294) q[10];
-cx q[6],q[10];
-rx(10.465494368969964) q[10];
-ry(pi/2) q[11];
-rx(pi) q[11];
-cx q[5],q[11];
-rz(1.158093774560294) q[11];
-cx q[5],q[11];
-cx q[6],q[11];
-rz(1.158093774560294) q[11];
-cx q[6],q[11];
-rx(10.465494368969964) q[11];
-ry(pi/2) q[12];
-rx(pi) q[12];
-cx q[3],q[12];
-rz(1.158093774560294) q[12];
-cx q[3],q[12];
-cx q[5],q[12];
-rz(1.158093774560294) q[12];
-cx q[5],q[12];
-ry(pi/2) q[13];
-rx(pi) q[13];
-cx q[4],q[13];
-rz(1.158093774560294) q[13];
-cx q[4],q[13];
-cx q[5],q[13];
-rz(1.158093774560294) q[13];
-cx q[5],q[13];
-rx(10.465494368969964) q[13];
-ry(pi/2) q[14];
-rx(pi) q[14];
-cx q[3],q[14];
-rz(1.158093774560294) q[14];
-cx q[3],q[14];
-cx q[4],q[14];
-rz(1.158093774560294) q[14];
-cx q[4],q[14];
-rx(10.465494368969964) q[14];
-ry(pi/2) q[15];
-rx(pi) q[15];
-cx q[0],q[15];
-rz(1.158093774560294) q[15];
-cx q[0],q[15];
-cx q[3],q[15];
-rz(1.158093774560294) q[15];
-cx q[3],q[15];
-ry(pi/2) q[16];
-rx(pi) q[16];
-cx q[0],q[16];
-rz(1.158093774560294) q[16];
-cx q[0],q[16];
-cx q[3],q[16];
-rz(1.158093774560294) q[16];
-cx q[3],q[16];
-rx(10.465494368969964) q[16];
-ry(pi/2) q[17];
-rx(pi) q[17];
-cx q[1],q[17];
-rz(1.158093774560294) q[17];
-cx q[1],q[17];
-cx q[3],q[17];
-rz(1.158093774560294) q[17];
-cx q[3],q[17];
-ry(pi/2) q[18];
-rx(pi) q[18];
-cx q[3],q[18];
-rz(1.158093774560294) q[18];
-cx q[3],q[18];
-cx q[4],q[18];
-rz(1.158093774560294) q[18];
-cx q[4],q[18];
-rx(10.465494368969964) q[18];
-ry(pi/2) q[19];
-rx(pi) q[19];
-cx q[3],q[19];
-rz(1.158093774560294) q[19];
-cx q[3],q[19];
-cx q[7],q[19];
-rz(1.158093774560294) q[19];
-cx q[7],q[19];
-rx(10.465494368969964) q[7];
-rx(10.465494368969964) q[19];
-ry(pi/2) q[20];
-rx(pi) q[20];
-cx q[0],q[20];
-rz(1.158093774560294) q[20];
-cx q[0],q[20];
-rx(10.465494368969964) q[0];
-cx q[15],q[20];
-rz(1.158093774560294) q[20];
-cx q[15],q[20];
-rx(10.465494368969964) q[20];
-ry(pi/2) q[21];
-rx(pi) q[21];
-cx q[4],q[21];
-rz(1.158093774560294) q[21];
-cx q[4],q[21];
-cx q[15],q[21];
-rz(1.158093774560294) q[21];
-cx q[15],q[21];
-rx(10.465494368969964) q[15];
-ry(pi/2) q[22];
-rx(pi) q[22];
-cx q[3],q[22];
-rz(1.158093774560294) q[22];
-cx q[3],q[22];
-cx q[9],q[22];
-rz(1.158093774560294) q[22];
-cx q[9],q[22];
-rx(10.465494368969964) q[9];
-rx(10.465494368969964) q[22];
-ry(pi/2) q[23];
-rx(pi) q[23];
-cx q[3],q[23];
-rz(1.158093774560294) q[23];
-cx q[3],q[23];
-cx q[17],q[23];
-rz(1.158093774560294) q[23];
-cx q[17],q[23];
-rx(10.465494368969964) q[17];
-rx(10.465494368969964) q[23];
-ry(pi/2) q[24];
-rx(pi) q[24];
-cx q[3],q[24];
-rz(1.158093774560294) q[24];
-cx q[3],q[24];
-cx q[5],q[24];
-rz(1.158093774560294) q[24];
-cx q[5],q[24];
-rx(10.465494368969964) q[5];
-rx(10.465494368969964) q[24];
-ry(pi/2) q[25];
-rx(pi) q[25];
-cx q[3],q[25];
-rz(1.158093774560294) q[25];
-cx q[3],q[25];
-cx q[12],q[25];
-rz(1.158093774560294) q[25];
-cx q[12],q[25];
-rx(10.465494368969964) q[12];
-rx(10.465494368969964) q[25];
-ry(pi/2) q[26];
-rx(pi) q[26];
-cx q[3],q[26];
-rz(1.158093774560294) q[26];
-cx q[3],q[26];
-cx q[21],q[26];
-rz(1.158093774560294) q[26];
-cx q[21],q[26];
-rx(10.465494368969964) q[21];
-rx(10.465494368969964) q[26];
-ry(pi/2) q[27];
-rx(pi) q[27];
-cx q[4],q[27];
-rz(1.158093774560294) q[27];
-cx q[4],q[27];
-rx(10.465494368969964) q[4];
-cx q[6],q[27];
-rz(1.158093774560294) q[27];
-cx q[6],q[27];
-rx(10.465494368969964) q[6];
-rx(10.465494368969964) q[27];
-ry(pi/2) q[28];
-rx(pi) q[28];
-cx q[1],q[28];
-rz(1.158093774560294) q[28];
-cx q[1],q[28];
-cx q[3],q[28];
-rz(1.158093774560294) q[28];
-cx q[3],q[28];
-rx(10.465494368969964) q[28];
-ry(pi/2) q[29];
-rx(pi) q[29];
-cx q[1],q[29];
-rz(1.158093774560294) q[29];
-cx q[1],q[29];
-rx(10.465494368969964) q[1];
-cx q[0],q[1];
-rz(5.169353682300575) q[1];
-cx q[0],q[1];
-cx q[0],q[2];
-rz(5.169353682300575) q[2];
-cx q[0],q[2];
-rx(2.613979166407553) q[2];
-cx q[3],q[29];
-rz(1.158093774560294) q[29];
-cx q[3],q[29];
-rx(10.465494368969964) q[3];
-cx q[0],q[3];
-rz(5.169353682300575) q[3];
-cx q[0],q[3];
-cx q[0],q[15];
-cx q[1],q[3];
-rz(5.169353682300575) q[3];
-cx q[1],q[3];
-cx q[1],q[4];
-rz(5.169353682300575) q[4];
-cx q[1],q[4];
-cx q[1],q[5];
-cx q[3],q[4];
-rz(5.169353682300575) q[4];
-cx q[3],q[4];
-cx q[4],q[6];
-rz(5.169353682300575) q[5];
-cx q[1],q[5];
-cx q[1],q[9];
-cx q[3],q[5];
-rz(5.169353682300575) q[5];
-cx q[3],q[5];
-cx q[3],q[7];
-rz(5.169353682300575) q[6];
-cx q[4],q[6];
-cx q[5],q[6];
-rz(5.169353682300575) q[6];
-cx q[5],q[6];
-rz(5.169353682300575) q[7];
-cx q[3],q[7];
-cx q[3],q[8];
-cx q[4],q[7];
-rz(5.169353682300575) q[7];
-cx q[4],q[7];
-cx q[4],q[10];
-rz(5.169353682300575) q[8];
-cx q[3],q[8];
-cx q[5],q[8];
-rz(5.169353682300575) q[8];
-cx q[5],q[8];
-cx q[5],q[11];
-rx(2.613979166407553) q[8];
-rz(5.169353682300575) q[9];
-cx q[1],q[9];
-cx q[1],q[17];
-cx q[3],q[9];
-rz(5.169353682300575) q[9];
-cx q[3],q[9];
-cx q[3],q[12];
-rz(5.169353682300575) q[10];
-cx q[4],q[10];
-cx q[4],q[13];
-cx q[6],q[10];
-rz(5.169353682300575) q[10];
-cx q[6],q[10];
-rx(2.613979166407553) q[10];
-rz(5.169353682300575) q[11];
-cx q[5],q[11];
-cx q[6],q[11];
-rz(5.169353682300575) q[11];
-cx q[6],q[11];
-rx(2.613979166407553) q[11];
-rz(5.169353682300575) q[12];
-cx q[3],q[12];
-cx q[3],q[14];
-cx q[5],q[12];
-rz(5.169353682300575) q[12];
-cx q[5],q[12];
-rz(5.169353682300575) q[13];
-cx q[4],q[13];
-cx q[5],q[13];
-rz(5.169353682300575) q[13];
-cx q[5],q[13];
-rx(2.613979166407553) q[13];
-rz(5.169353682300575) q[14];
-cx q[3],q[14];
-cx q[4],q[14];
-rz(5.169353682300575) q[14];
-cx q[4],q[14];
-rx(2.613979166407553) q[14];
-rz(5.169353682300575) q[15];
-cx q[0],q[15];
-cx q[0],q[16];
-cx q[3],q[15];
-rz(5.169353682300575) q[15];
-cx q[3],q[15];
-rz(5.169353682300575) q[16];
-cx q[0],q[16];
-cx q[0],q[20];
-cx q[3],q[16];
-rz(5.169353682300575) q[16];
-cx q[3],q[16];
-rx(2.613979166407553) q[16];
-rz(5.169353682300575) q[17];
-cx q[1],q[17];
-cx q[1],q[28];
-cx q[3],q[17];
-rz(5.169353682300575) q[17];
-cx q[3],q[17];
-cx q[3],q[18];
-rz(5.169353682300575) q[18];
-cx q[3],q[18];
-cx q[3],q[19];
-cx q[4],q[18];
-rz(5.169353682300575) q[18];
-cx q[4],q[18];
-cx q[4],q[21];
-rx(2.613979166407553) q[18];
-rz(5.169353682300575) q[19];
-cx q[3],q[19];
-cx q[3],q[22];
-cx q[7],q[19];
-rz(5.169353682300575) q[19];
-cx q[7],q[19];
-rx(2.613979166407553) q[7];
-rx(2.613979166407553) q[19];
-rz(5.169353682300575) q[20];
-cx q[0],q[20];
-rx(2.613979166407553) q[0];
-cx q[15],q[20];
-rz(5.169353682300575) q[20];
-cx q[15],q[20];
-rx(2.613979166407553) q[20];
-rz(5.169353682300575) q[21];
-cx q[4],q[21];
-cx q[4],q[27];
-cx q[15],q[21];
-rz(5.169353682300575) q[21];
-cx q[15],q[21];
-rx(2.613979166407553) q[15];
-rz(5.169353682300575) q[22];
-cx q[3],q[22];
-cx q[3],q[23];
-cx q[9],q[22];
-rz(5.169353682300575) q[22];
-cx q[9],q[22];
-rx(2.613979166407553) q[9];
-rx(2.613979166407553) q[22];
-rz(5.169353682300575) q[23];
-cx q[3],q[23];
-cx q[3],q[24];
-cx q[17],q[23];
-rz(5.169353682300575) q[23];
-cx q[17],q[23];
-rx(2.613979166407553) q[17];
-rx(2.613979166407553) q[23];
-rz(5.169353682300575) q[24];
-cx q[3],q[24];
-cx q[3],q[25];
-cx q[5],q[24];
-rz(5.169353682300575) q[24];
-cx q[5],q[24];
-rx(2.613979166407553) q[5];
-rx(2.613979166407553) q[24];
-rz(5.169353682300575) q[25];
-cx q[3],q[25];
-cx q[3],q[26];
-cx q[12],q[25];
-rz(5.169353682300575) q[25];
-cx q[12],q[25];
-rx(2.613979166407553) q[12];
-rx(2.613979166407553) q[25];
-rz(5.169353682300575) q[26];
-cx q[3],q[26];
-cx q[21],q[26];
-rz(5.169353682300575) q[26];
-cx q[21],q[26];
-rx(2.613979166407553) q[21];
-rx(2.613979166407553) q[26];
-rz(5.169353682300575) q[27];
-cx q[4],q[27];
-rx(2.613979166407553) q[4];
-cx q[6],q[27];
-rz(5.169353682300575) q[27];
-cx q[6],q[27];
-rx(2.613979166407553) q[6];
-rx(2.613979166407553) q[27];
-rz(5.169353682300575) q[28];
-cx q[1],q[28];
-cx q[3],q[28];
-rz(5.169353682300575) q[28];
-cx q[3],q[28];
-rx(2.613979166407553) q[28];
-rx(10.465494368969964) q[29];
-cx q[1],q[29];
-rz(5.169353682300575) q[29];
-cx q[1],q[29];
-rx(2.613979166407553) q[1];
-cx q[0],q[1];
-rz(1.7651967982986498) q[1];
-cx q[0],q[1];
-cx q[0],q[2];
-rz(1.7651967982986498) q[2];
-cx q[0],q[2];
-rx(1.9069732959745684) q[2];
-cx q[3],q[29];
-rz(5.169353682300575) q[29];
-cx q[3],q[29];
-rx(2.613979166407553) q[3];
-cx q[0],q[3];
-rz(1.7651967982986498) q[3];
-cx q[0],q[3];
-cx q[0],q[15];
-cx q[1],q[3];
-rz(1.7651967982986498) q[3];
-cx q[1],q[3];
-cx q[1],q[4];
-rz(1.7651967982986498) q[4];
-cx q[1],q[4];
-cx q[1],q[5];
-cx q[3],q[4];
-rz(1.7651967982986498) q[4];
-cx q[3],q[4];
-cx q[4],q[6];
-rz(1.7651967982986498) q[5];
-cx q[1],q[5];
-cx q[1],q[9];
-cx q[3],q[5];
-rz(1.7651967982986498) q[5];
-cx q[3],q[5];
-cx q[3],q[7];
-rz(1.7651967982986498) q[6];
-cx q[4],q[6];
-cx q[5],q[6];
-rz(1.7651967982986498) q[6];
-cx q[5],q[6];
-rz(1.7651967982986498) q[7];
-cx q[3],q[7];
-cx q[3],q[8];
-cx q[4],q[7];
-rz(1.7651967982986498) q[7];
-cx q[4],q[7];
-cx q[4],q[10];
-rz(1.7651967982986498) q[8];
-cx q[3],q[8];
-cx q[5],q[8];
-rz(1.7651967982986498) q[8];
-cx q[5],q[8];
-cx q[5],q[11];
-rx(1.9069732959745684) q[8];
-rz(1.7651967982986498) q[9];
-cx q[1],q[9];
-cx q[1],q[17];
-cx q[3],q[9];
-rz(1.7651967982986498) q[9];
-cx q[3],q[9];
-cx q[3],q[12];
-rz(1.7651967982986498) q[10];
-cx q[4],q[10];
-cx q[4],q[13];
-cx q[6],q[10];
-rz(1.7651967982986498) q[10];
-cx q[6],q[10];
-rx(1.9069732959745684) q[10];
-rz(1.7651967982986498) q[11];
-cx q[5],q[11];
-cx q[6],q[11];
-rz(1.7651967982986498) q[11];
-cx q[6],q[11];
-rx(1.9069732959745684) q[11];
-rz(1.7651967982986498) q[12];
-cx q[3],q[12];
-cx q[3],q[14];
-cx q[5],q[12];
-rz(1.7651967982986498) q[12];
-cx q[5],q[12];
-rz(1.7651967982986498) q[13];
-cx q[4],q[13];
-cx q[5],q[13];
-rz(1.7651967982986498) q[13];
-cx q[5],q[13];
-rx(1.9069732959745684) q[13];
-rz(1.7651967982986498) q[14];
-cx q[3],q[14];
-cx q[4],q[14];
-rz(1.7651967982986498) q[14];
-cx q[4],q[14];
-rx(1.9069732959745684) q[14];
-rz(1.7651967982986498) q[15];
-cx q[0],q[15];
-cx q[0],q[16];
-cx q[3],q[15];
-rz(1.7651967982986498) q[15];
-cx q[3],q[15];
-rz(1.7651967982986498) q[16];
-cx q[0],q[16];
-cx q[0],q[20];
-cx q[3],q[16];
-rz(1.7651967982986498) q[16];
-cx q[3],q[16];
-rx(1.9069732959745684) q[16];
-rz(1.7651967982986498) q[17];
-cx q[1],q[17];
-cx q[1],q[28];
-cx q[3],q[17];
-rz(1.7651967982986498) q[17];
-cx q[3],q[17];
-cx q[3],q[18];
-rz(1.7651967982986498) q[18];
-cx q[3],q[18];
-cx q[3],q[19];
-cx q[4],q[18];
-rz(1.7651967982986498) q[18];
-cx q[4],q[18];
-cx q[4],q[21];
-rx(1.9069732959745684) q[18];
-rz(1.7651967982986498) q[19];
-cx q[3],q[19];
-cx q[3],q[22];
-cx q[7],q[19];
-rz(1.7651967982986498) q[19];
-cx q[7],q[19];
-rx(1.9069732959745684) q[7];
-rx(1.9069732959745684) q[19];
-rz(1.7651967982986498) q[20];
-cx q[0],q[20];
-rx(1.9069732959745684) q[0];
-cx q[15],q[20];
-rz(1.7651967982986498) q[20];
-cx q[15],q[20];
-rx(1.9069732959745684) q[20];
-rz(1.7651967982986498) q[21];
-cx q[4],q[21];
-cx q[4],q[27];
-cx q[15],q[21];
-rz(1.7651967982986498) q[21];
-cx q[15],q[21];
-rx(1.9069732959745684) q[15];
-rz(1.7651967982986498) q[22];
-cx q[3],q[22];
-cx q[3],q[23];
-cx q[9],q[22];
-rz(1.7651967982986498) q[22];
-cx q[9],q[22];
-rx(1.9069732959745684) q[9];
-rx(1.9069732959745684) q[22];
-rz(1.7651967982986498) q[23];
-cx q[3],q[23];
-cx q[3],q[24];
-cx q[17],q[23];
-rz(1.7651967982986498) q[23];
-cx q[17],q[23];
-rx(1.9069732959745684) q[17];
-rx(1.9069732959745684) q[23];
-rz(1.7651967982986498) q[24];
-cx q[3],q[24];
-cx q[3],q[25];
-cx q[5],q[24];
-rz(1.7651967982986498) q[24];
-cx q[5],q[24];
-rx(1.9069732959745684) q[5];
-rx(1.9069732959745684) q[24];
-rz(1.7651967982986498) q[25];
-cx q[3],q[25];
-cx q[3],q[26];
-cx q[12],q[25];
-rz(1.7651967982986498) q[25];
-cx q[12],q[25];
-rx(1.9069732959745684) q[12];
-rx(1.9069732959745684) q[25];
-rz(1.7651967982986498) q[26];
-cx q[3],q[26];
-cx q[21],q[26];
-rz(1.7651967982986498) q[26];
-cx q[21],q[26];
-rx(1.9069732959745684) q[21];
-rx(1.9069732959745684) q[26];
-rz(1.7651967982986498) q[27];
-cx q[4],q[27];
-rx(1.9069732959745684) q[4];
-cx q[6],q[27];
-rz(1.7651967982986498) q[27];
-cx q[6],q[27];
-rx(1.9069732959745684) q[6];
-rx(1.9069732959745684) q[27];
-rz(1.7651967982986498) q[28];
-cx q[1],q[28];
-cx q[3],q[28];
-rz(1.7651967982986498) q[28];
-cx q[3],q[28];
-rx(1.9069732959745684) q[28];
-rx(2.613979166407553) q[29];
-cx q[1],q[29];
-rz(1.7651967982986498) q[29];
-cx q[1],q[29];
-rx(1.9069732959745684) q[1];
-cx q[3],q[29];
-rz(1.7651967982986498) q[29];
-cx q[3],q[29];
-rx(1.9069732959745684) q[3];
-rx(1.9069732959745684) q[29];
\ No newline at end of file
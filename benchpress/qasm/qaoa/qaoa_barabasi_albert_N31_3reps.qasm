@@ -1,680 +0,0 @@
-OPENQASM 2.0;
-include "qelib1.inc";
-qreg q[31];
-ry(pi/2) q[0];
-rx(pi) q[0];
-ry(pi/2) q[1];
-rx(pi) q[1];
-cx q[0],q[1];
-rz(1.0767590150066737) q[1];
-cx q[0],q[1];
-ry(pi/2) q[2];
-rx(pi) q[2];
-cx q[0],q[2];
-rz(1.0767590150066737) q[2];
-cx q[0],q[2];
-rx(12.04594760416668) q[2];
-ry(pi/2) q[3];
-rx(pi) q[3];
-cx q[0],q[3];
-rz(1.0767590150066737) q[3];
-cx q[0],q[3];
-cx q[1],q[3];
-rz(1.0767590150066737) q[3];
-cx q[1],q[3];
-ry(pi/2) q[4];
-rx(pi) q[4];
-cx q[1],q[4];
-rz(1.0767590150066737) q[4];
-cx q[1],q[4];
-cx q[3],q[4];
-rz(1.0767590150066737) q[4];
-cx q[3],q[4];
-ry(pi/2) q[5];
-rx(pi) q[5];
-cx q[1],q[5];
-rz(1.0767590150066737) q[5];
-cx q[1],q[5];
-cx q[3],q[5];
-rz(1.0767590150066737) q[5];
-cx q[3],q[5];
-ry(pi/2) q[6];
-rx(pi) q[6];
-cx q[4],q[6];
-rz(1.0767590150066737) q[6];
-cx q[4],q[6];
-cx q[5],q[6];
-rz(1.0767590150066737) q[6];
-cx q[5],q[6];
-ry(pi/2) q[7];
-rx(pi) q[7];
-cx q[3],q[7];
-rz(1.0767590150066737) q[7];
-cx q[3],q[7];
-cx q[4],q[7];
-rz(1.0767590150066737) q[7];
-cx q[4],q[7];
-ry(pi/2) q[8];
-rx(pi) q[8];
-cx q[3],q[8];
-rz(1.0767590150066737) q[8];
-cx q[3],q[8];
-cx q[5],q[8];
-rz(1.0767590150066737) q[8];
-cx q[5],q[8];
-rx(12.04594760416668) q[8];
-ry(pi/2) q[9];
-rx(pi) q[9];
-cx q[1],q[9];
-rz(1.0767590150066737) q[9];
-cx q[1],q[9];
-cx q[3],q[9];
-rz(1.0767590150066737) q[9];
-cx q[3],q[9];
-ry(pi/2) q[10];
-rx(pi) q[10];
-cx q[4],q[10];
-rz(1.0767590150066737) q[10];
-cx q[4],q[10];
-cx q[6],q[10];
-rz(1.0767590150066737) q[10];
-cx q[6],q[10];
-rx(12.04594760416668) q[10];
-ry(pi/2) q[11];
-rx(pi) q[11];
-cx q[5],q[11];
-rz(1.0767590150066737) q[11];
-cx q[5],q[11];
-cx q[6],q[11];
-rz(1.0767590150066737) q[11];
-cx q[6],q[11];
-rx(12.04594760416668) q[11];
-ry(pi/2) q[12];
-rx(pi) q[12];
-cx q[3],q[12];
-rz(1.0767590150066737) q[12];
-cx q[3],q[12];
-cx q[5],q[12];
-rz(1.0767590150066737) q[12];
-cx q[5],q[12];
-ry(pi/2) q[13];
-rx(pi) q[13];
-cx q[4],q[13];
-rz(1.0767590150066737) q[13];
-cx q[4],q[13];
-cx q[5],q[13];
-rz(1.0767590150066737) q[13];
-cx q[5],q[13];
-rx(12.04594760416668) q[13];
-ry(pi/2) q[14];
-rx(pi) q[14];
-cx q[3],q[14];
-rz(1.0767590150066737) q[14];
-cx q[3],q[14];
-cx q[4],q[14];
-rz(1.0767590150066737) q[14];
-cx q[4],q[14];
-rx(12.04594760416668) q[14];
-ry(pi/2) q[15];
-rx(pi) q[15];
-cx q[0],q[15];
-rz(1.0767590150066737) q[15];
-cx q[0],q[15];
-cx q[3],q[15];
-rz(1.0767590150066737) q[15];
-cx q[3],q[15];
-ry(pi/2) q[16];
-rx(pi) q[16];
-cx q[0],q[16];
-rz(1.0767590150066737) q[16];
-cx q[0],q[16];
-cx q[3],q[16];
-rz(1.0767590150066737) q[16];
-cx q[3],q[16];
-rx(12.04594760416668) q[16];
-ry(pi/2) q[17];
-rx(pi) q[17];
-cx q[1],q[17];
-rz(1.0767590150066737) q[17];
-cx q[1],q[17];
-cx q[3],q[17];
-rz(1.0767590150066737) q[17];
-cx q[3],q[17];
-ry(pi/2) q[18];
-rx(pi) q[18];
-cx q[3],q[18];
-rz(1.0767590150066737) q[18];
-cx q[3],q[18];
-cx q[4],q[18];
-rz(1.0767590150066737) q[18];
-cx q[4],q[18];
-ry(pi/2) q[19];
-rx(pi) q[19];
-cx q[3],q[19];
-rz(1.0767590150066737) q[19];
-cx q[3],q[19];
-cx q[7],q[19];
-rz(1.0767590150066737) q[19];
-cx q[7],q[19];
-rx(12.04594760416668) q[7];
-rx(12.04594760416668) q[19];
-ry(pi/2) q[20];
-rx(pi) q[20];
-cx q[0],q[20];
-rz(1.0767590150066737) q[20];
-cx q[0],q[20];
-rx(12.04594760416668) q[0];
-cx q[15],q[20];
-rz(1.0767590150066737) q[20];
-cx q[15],q[20];
-rx(12.04594760416668) q[20];
-ry(pi/2) q[21];
-rx(pi) q[21];
-cx q[4],q[21];
-rz(1.0767590150066737) q[21];
-cx q[4],q[21];
-cx q[15],q[21];
-rz(1.0767590150066737) q[21];
-cx q[15],q[21];
-rx(12.04594760416668) q[15];
-ry(pi/2) q[22];
-rx(pi) q[22];
-cx q[3],q[22];
-rz(1.0767590150066737) q[22];
-cx q[3],q[22];
-cx q[9],q[22];
-rz(1.0767590150066737) q[22];
-cx q[9],q[22];
-rx(12.04594760416668) q[9];
-rx(12.04594760416668) q[22];
-ry(pi/2) q[23];
-rx(pi) q[23];
-cx q[3],q[23];
-rz(1.0767590150066737) q[23];
-cx q[3],q[23];
-cx q[17],q[23];
-rz(1.0767590150066737) q[23];
-cx q[17],q[23];
-rx(12.04594760416668) q[17];
-rx(12.04594760416668) q[23];
-ry(pi/2) q[24];
-rx(pi) q[24];
-cx q[3],q[24];
-rz(1.0767590150066737) q[24];
-cx q[3],q[24];
-cx q[5],q[24];
-rz(1.0767590150066737) q[24];
-cx q[5],q[24];
-rx(12.04594760416668) q[5];
-rx(12.04594760416668) q[24];
-ry(pi/2) q[25];
-rx(pi) q[25];
-cx q[3],q[25];
-rz(1.0767590150066737) q[25];
-cx q[3],q[25];
-cx q[12],q[25];
-rz(1.0767590150066737) q[25];
-cx q[12],q[25];
-rx(12.04594760416668) q[12];
-rx(12.04594760416668) q[25];
-ry(pi/2) q[26];
-rx(pi) q[26];
-cx q[3],q[26];
-rz(1.0767590150066737) q[26];
-cx q[3],q[26];
-cx q[21],q[26];
-rz(1.0767590150066737) q[26];
-cx q[21],q[26];
-rx(12.04594760416668) q[21];
-rx(12.04594760416668) q[26];
-ry(pi/2) q[27];
-rx(pi) q[27];
-cx q[4],q[27];
-rz(1.0767590150066737) q[27];
-cx q[4],q[27];
-rx(12.04594760416668) q[4];
-cx q[6],q[27];
-rz(1.0767590150066737) q[27];
-cx q[6],q[27];
-rx(12.04594760416668) q[6];
-rx(12.04594760416668) q[27];
-ry(pi/2) q[28];
-rx(pi) q[28];
-cx q[1],q[28];
-rz(1.0767590150066737) q[28];
-cx q[1],q[28];
-cx q[3],q[28];
-rz(1.0767590150066737) q[28];
-cx q[3],q[28];
-rx(12.04594760416668) q[28];
-ry(pi/2) q[29];
-rx(pi) q[29];
-cx q[1],q[29];
-rz(1.0767590150066737) q[29];
-cx q[1],q[29];
-rx(12.04594760416668) q[1];
-cx q[0],q[1];
-rz(2.983871935893066) q[1];
-cx q[0],q[1];
-cx q[0],q[2];
-rz(2.983871935893066) q[2];
-cx q[0],q[2];
-rx(9.992119175655365) q[2];
-cx q[3],q[29];
-rz(1.0767590150066737) q[29];
-cx q[3],q[29];
-rx(12.04594760416668) q[29];
-ry(pi/2) q[30];
-rx(pi) q[30];
-cx q[3],q[30];
-rz(1.0767590150066737) q[30];
-cx q[3],q[30];
-rx(12.04594760416668) q[3];
-cx q[0],q[3];
-rz(2.983871935893066) q[3];
-cx q[0],q[3];
-cx q[0],q[15];
-cx q[1],q[3];
-rz(2.983871935893066) q[3];
-cx q[1],q[3];
-cx q[1],q[4];
-rz(2.983871935893066) q[4];
-cx q[1],q[4];
-cx q[1],q[5];
-cx q[3],q[4];
-rz(2.983871935893066) q[4];
-cx q[3],q[4];
-cx q[4],q[6];
-rz(2.983871935893066) q[5];
-cx q[1],q[5];
-cx q[1],q[9];
-cx q[3],q[5];
-rz(2.983871935893066) q[5];
-cx q[3],q[5];
-cx q[3],q[7];
-rz(2.983871935893066) q[6];
-cx q[4],q[6];
-cx q[5],q[6];
-rz(2.983871935893066) q[6];
-cx q[5],q[6];
-rz(2.983871935893066) q[7];
-cx q[3],q[7];
-cx q[3],q[8];
-cx q[4],q[7];
-rz(2.983871935893066) q[7];
-cx q[4],q[7];
-cx q[4],q[10];
-rz(2.983871935893066) q[8];
-cx q[3],q[8];
-cx q[5],q[8];
-rz(2.983871935893066) q[8];
-cx q[5],q[8];
-cx q[5],q[11];
-rx(9.992119175655365) q[8];
-rz(2.983871935893066) q[9];
-cx q[1],q[9];
-cx q[1],q[17];
-cx q[3],q[9];
-rz(2.983871935893066) q[9];
-cx q[3],q[9];
-cx q[3],q[12];
-rz(2.983871935893066) q[10];
-cx q[4],q[10];
-cx q[4],q[13];
-cx q[6],q[10];
-rz(2.983871935893066) q[10];
-cx q[6],q[10];
-rx(9.992119175655365) q[10];
-rz(2.983871935893066) q[11];
-cx q[5],q[11];
-cx q[6],q[11];
-rz(2.983871935893066) q[11];
-cx q[6],q[11];
-rx(9.992119175655365) q[11];
-rz(2.983871935893066) q[12];
-cx q[3],q[12];
-cx q[3],q[14];
-cx q[5],q[12];
-rz(2.983871935893066) q[12];
-cx q[5],q[12];
-rz(2.983871935893066) q[13];
-cx q[4],q[13];
-cx q[5],q[13];
-rz(2.983871935893066) q[13];
-cx q[5],q[13];
-rx(9.992119175655365) q[13];
-rz(2.983871935893066) q[14];
-cx q[3],q[14];
-cx q[4],q[14];
-rz(2.983871935893066) q[14];
-cx q[4],q[14];
-rx(9.992119175655365) q[14];
-rz(2.983871935893066) q[15];
-cx q[0],q[15];
-cx q[0],q[16];
-cx q[3],q[15];
-rz(2.983871935893066) q[15];
-cx q[3],q[15];
-rz(2.983871935893066) q[16];
-cx q[0],q[16];
-cx q[0],q[20];
-cx q[3],q[16];
-rz(2.983871935893066) q[16];
-cx q[3],q[16];
-rx(9.992119175655365) q[16];
-rz(2.983871935893066) q[17];
-cx q[1],q[17];
-cx q[1],q[28];
-cx q[3],q[17];
-rz(2.983871935893066) q[17];
-cx q[3],q[17];
-cx q[18],q[30];
-rz(2.983871935893066) q[20];
-cx q[0],q[20];
-rx(9.992119175655365) q[0];
-cx q[15],q[20];
-rz(2.983871935893066) q[20];
-cx q[15],q[20];
-rx(9.992119175655365) q[20];
-rz(2.983871935893066) q[28];
-cx q[1],q[28];
-cx q[1],q[29];
-rz(2.983871935893066) q[29];
-cx q[1],q[29];
-rx(9.992119175655365) q[1];
-cx q[0],q[1];
-rz(1.7677987264532602) q[1];
-cx q[0],q[1];
-cx q[0],q[2];
-rz(1.7677987264532602) q[2];
-cx q[0],q[2];
-rx(10.587589203949362) q[2];
-rz(1.0767590150066737) q[30];
-cx q[18],q[30];
-rx(12.04594760416668) q[18];
-cx q[3],q[18];
-rz(2.983871935893066) q[18];
-cx q[3],q[18];
-cx q[3],q[19];
-cx q[4],q[18];
-rz(2.983871935893066) q[18];
-cx q[4],q[18];
-cx q[4],q[21];
-rz(2.983871935893066) q[19];
-cx q[3],q[19];
-cx q[3],q[22];
-cx q[7],q[19];
-rz(2.983871935893066) q[19];
-cx q[7],q[19];
-rx(9.992119175655365) q[7];
-rx(9.992119175655365) q[19];
-rz(2.983871935893066) q[21];
-cx q[4],q[21];
-cx q[4],q[27];
-cx q[15],q[21];
-rz(2.983871935893066) q[21];
-cx q[15],q[21];
-rx(9.992119175655365) q[15];
-rz(2.983871935893066) q[22];
-cx q[3],q[22];
-cx q[3],q[23];
-cx q[9],q[22];
-rz(2.983871935893066) q[22];
-cx q[9],q[22];
-rx(9.992119175655365) q[9];
-rx(9.992119175655365) q[22];
-rz(2.983871935893066) q[23];
-cx q[3],q[23];
-cx q[3],q[24];
-cx q[17],q[23];
-rz(2.983871935893066) q[23];
-cx q[17],q[23];
-rx(9.992119175655365) q[17];
-rx(9.992119175655365) q[23];
-rz(2.983871935893066) q[24];
-cx q[3],q[24];
-cx q[3],q[25];
-cx q[5],q[24];
-rz(2.983871935893066) q[24];
-cx q[5],q[24];
-rx(9.992119175655365) q[5];
-rx(9.992119175655365) q[24];
-rz(2.983871935893066) q[25];
-cx q[3],q[25];
-cx q[3],q[26];
-cx q[12],q[25];
-rz(2.983871935893066) q[25];
-cx q[12],q[25];
-rx(9.992119175655365) q[12];
-rx(9.992119175655365) q[25];
-rz(2.983871935893066) q[26];
-cx q[3],q[26];
-cx q[3],q[28];
-cx q[21],q[26];
-rz(2.983871935893066) q[26];
-cx q[21],q[26];
-rx(9.992119175655365) q[21];
-rx(9.992119175655365) q[26];
-rz(2.983871935893066) q[27];
-cx q[4],q[27];
-rx(9.992119175655365) q[4];
-cx q[6],q[27];
-rz(2.983871935893066) q[27];
-cx q[6],q[27];
-rx(9.992119175655365) q[6];
-rx(9.992119175655365) q[27];
-rz(2.983871935893066) q[28];
-cx q[3],q[28];
-cx q[3],q[29];
-rx(9.992119175655365) q[28];
-rz(2.983871935893066) q[29];
-cx q[3],q[29];
-rx(9.992119175655365) q[29];
-rx(12.04594760416668) q[30];
-cx q[3],q[30];
-rz(2.983871935893066) q[30];
-cx q[3],q[30];
-rx(9.992119175655365) q[3];
-cx q[0],q[3];
-rz(1.7677987264532602) q[3];
-cx q[0],q[3];
-cx q[0],q[15];
-cx q[1],q[3];
-rz(1.7677987264532602) q[3];
-cx q[1],q[3];
-cx q[1],q[4];
-rz(1.7677987264532602) q[4];
-cx q[1],q[4];
-cx q[1],q[5];
-cx q[3],q[4];
-rz(1.7677987264532602) q[4];
-cx q[3],q[4];
-cx q[4],q[6];
-rz(1.7677987264532602) q[5];
-cx q[1],q[5];
-cx q[1],q[9];
-cx q[3],q[5];
-rz(1.7677987264532602) q[5];
-cx q[3],q[5];
-cx q[3],q[7];
-rz(1.7677987264532602) q[6];
-cx q[4],q[6];
-cx q[5],q[6];
-rz(1.7677987264532602) q[6];
-cx q[5],q[6];
-rz(1.7677987264532602) q[7];
-cx q[3],q[7];
-cx q[3],q[8];
-cx q[4],q[7];
-rz(1.7677987264532602) q[7];
-cx q[4],q[7];
-cx q[4],q[10];
-rz(1.7677987264532602) q[8];
-cx q[3],q[8];
-cx q[5],q[8];
-rz(1.7677987264532602) q[8];
-cx q[5],q[8];
-cx q[5],q[11];
-rx(10.587589203949362) q[8];
-rz(1.7677987264532602) q[9];
-cx q[1],q[9];
-cx q[1],q[17];
-cx q[3],q[9];
-rz(1.7677987264532602) q[9];
-cx q[3],q[9];
-cx q[3],q[12];
-rz(1.7677987264532602) q[10];
-cx q[4],q[10];
-cx q[4],q[13];
-cx q[6],q[10];
-rz(1.7677987264532602) q[10];
-cx q[6],q[10];
-rx(10.587589203949362) q[10];
-rz(1.7677987264532602) q[11];
-cx q[5],q[11];
-cx q[6],q[11];
-rz(1.7677987264532602) q[11];
-cx q[6],q[11];
-rx(10.587589203949362) q[11];
-rz(1.7677987264532602) q[12];
-cx q[3],q[12];
-cx q[3],q[14];
-cx q[5],q[12];
-rz(1.7677987264532602) q[12];
-cx q[5],q[12];
-rz(1.7677987264532602) q[13];
-cx q[4],q[13];
-cx q[5],q[13];
-rz(1.7677987264532602) q[13];
-cx q[5],q[13];
-rx(10.587589203949362) q[13];
-rz(1.7677987264532602) q[14];
-cx q[3],q[14];
-cx q[4],q[14];
-rz(1.7677987264532602) q[14];
-cx q[4],q[14];
-rx(10.587589203949362) q[14];
-rz(1.7677987264532602) q[15];
-cx q[0],q[15];
-cx q[0],q[16];
-cx q[3],q[15];
-rz(1.7677987264532602) q[15];
-cx q[3],q[15];
-rz(1.7677987264532602) q[16];
-cx q[0],q[16];
-cx q[0],q[20];
-cx q[3],q[16];
-rz(1.7677987264532602) q[16];
-cx q[3],q[16];
-rx(10.587589203949362) q[16];
-rz(1.7677987264532602) q[17];
-cx q[1],q[17];
-cx q[1],q[28];
-cx q[3],q[17];
-rz(1.7677987264532602) q[17];
-cx q[3],q[17];
-cx q[18],q[30];
-rz(1.7677987264532602) q[20];
-cx q[0],q[20];
-rx(10.587589203949362) q[0];
-cx q[15],q[20];
-rz(1.7677987264532602) q[20];
-cx q[15],q[20];
-rx(10.587589203949362) q[20];
-rz(1.7677987264532602) q[28];
-cx q[1],q[28];
-cx q[1],q[29];
-rz(1.7677987264532602) q[29];
-cx q[1],q[29];
-rx(10.587589203949362) q[1];
-rz(2.983871935893066) q[30];
-cx q[18],q[30];
-rx(9.992119175655365) q[18];
-cx q[3],q[18];
-rz(1.7677987264532602) q[18];
-cx q[3],q[18];
-cx q[3],q[19];
-cx q[4],q[18];
-rz(1.7677987264532602) q[18];
-cx q[4],q[18];
-cx q[4],q[21];
-rz(1.7677987264532602) q[19];
-cx q[3],q[19];
-cx q[3],q[22];
-cx q[7],q[19];
-rz(1.7677987264532602) q[19];
-cx q[7],q[19];
-rx(10.587589203949362) q[7];
-rx(10.587589203949362) q[19];
-rz(1.7677987264532602) q[21];
-cx q[4],q[21];
-cx q[4],q[27];
-cx q[15],q[21];
-rz(1.7677987264532602) q[21];
-cx q[15],q[21];
-rx(10.587589203949362) q[15];
-rz(1.7677987264532602) q[22];
-cx q[3],q[22];
-cx q[3],q[23];
-cx q[9],q[22];
-rz(1.7677987264532602) q[22];
-cx q[9],q[22];
-rx(10.587589203949362) q[9];
-rx(10.587589203949362) q[22];
-rz(1.7677987264532602) q[23];
-cx q[3],q[23];
-cx q[3],q[24];
-cx q[17],q[23];
-rz(1.7677987264532602) q[23];
-cx q[17],q[23];
-rx(10.587589203949362) q[17];
-rx(10.587589203949362) q[23];
-rz(1.7677987264532602) q[24];
-cx q[3],q[24];
-cx q[3],q[25];
-cx q[5],q[24];
-rz(1.7677987264532602) q[24];
-cx q[5],q[24];
-rx(10.587589203949362) q[5];
-rx(10.587589203949362) q[24];
-rz(1.7677987264532602) q[25];
-cx q[3],q[25];
-cx q[3],q[26];
-cx q[12],q[25];
-rz(1.7677987264532602) q[25];
-cx q[12],q[25];
-rx(10.587589203949362) q[12];
-rx(10.587589203949362) q[25];
-rz(1.7677987264532602) q[26];
-cx q[3],q[26];
-cx q[3],q[28];
-cx q[21],q[26];
-rz(1.7677987264532602) q[26];
-cx q[21],q[26];
-rx(10.587589203949362) q[21];
-rx(10.587589203949362) q[26];
-rz(1.7677987264532602) q[27];
-cx q[4],q[27];
-rx(10.587589203949362) q[4];
-cx q[6],q[27];
-rz(1.7677987264532602) q[27];
-cx q[6],q[27];
-rx(10.587589203949362) q[6];
-rx(10.587589203949362) q[27];
-rz(1.7677987264532602) q[28];
-cx q[3],q[28];
-cx q[3],q[29];
-rx(10.587589203949362) q[28];
-rz(1.7677987264532602) q[29];
-cx q[3],q[29];
-rx(10.587589203949362) q[29];
-rx(9.992119175655365) q[30];
-cx q[3],q[30];
-rz(1.7677987264532602) q[30];
-cx q[3],q[30];
-rx(10.587589203949362) q[3];
-cx q[18],q[30];
-rz(1.7677987264532602) q[30];
-cx q[18],q[30];
-rx(10.587589203949362) q[18];
-rx(10.587589203949362) q[30];
\ No newline at end of file
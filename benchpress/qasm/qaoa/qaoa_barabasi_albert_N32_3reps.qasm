@@ -1,703 +0,0 @@
-OPENQASM 2.0;
-include "qelib1.inc";
-qreg q[32];
-ry(pi/2) q[0];
-rx(pi) q[0];
-ry(pi/2) q[1];
-rx(pi) q[1];
-cx q[0],q[1];
-rz(2.289879098201004) q[1];
-cx q[0],q[1];
-ry(pi/2) q[2];
-rx(pi) q[2];
-cx q[0],q[2];
-rz(2.289879098201004) q[2];
-cx q[0],q[2];
-rx(11.379585572691123) q[2];
-ry(pi/2) q[3];
-rx(pi) q[3];
-cx q[0],q[3];
-rz(2.289879098201004) q[3];
-cx q[0],q[3];
-cx q[1],q[3];
-rz(2.289879098201004) q[3];
-cx q[1],q[3];
-ry(pi/2) q[4];
-rx(pi) q[4];
-cx q[1],q[4];
-rz(2.289879098201004) q[4];
-cx q[1],q[4];
-cx q[3],q[4];
-rz(2.289879098201004) q[4];
-cx q[3],q[4];
-ry(pi/2) q[5];
-rx(pi) q[5];
-cx q[1],q[5];
-rz(2.289879098201004) q[5];
-cx q[1],q[5];
-cx q[3],q[5];
-rz(2.289879098201004) q[5];
-cx q[3],q[5];
-ry(pi/2) q[6];
-rx(pi) q[6];
-cx q[4],q[6];
-rz(2.289879098201004) q[6];
-cx q[4],q[6];
-cx q[5],q[6];
-rz(2.289879098201004) q[6];
-cx q[5],q[6];
-ry(pi/2) q[7];
-rx(pi) q[7];
-cx q[3],q[7];
-rz(2.289879098201004) q[7];
-cx q[3],q[7];
-cx q[4],q[7];
-rz(2.289879098201004) q[7];
-cx q[4],q[7];
-ry(pi/2) q[8];
-rx(pi) q[8];
-cx q[3],q[8];
-rz(2.289879098201004) q[8];
-cx q[3],q[8];
-cx q[5],q[8];
-rz(2.289879098201004) q[8];
-cx q[5],q[8];
-rx(11.379585572691123) q[8];
-ry(pi/2) q[9];
-rx(pi) q[9];
-cx q[1],q[9];
-rz(2.289879098201004) q[9];
-cx q[1],q[9];
-cx q[3],q[9];
-rz(2.289879098201004) q[9];
-cx q[3],q[9];
-ry(pi/2) q[10];
-rx(pi) q[10];
-cx q[4],q[10];
-rz(2.289879098201004) q[10];
-cx q[4],q[10];
-cx q[6],q[10];
-rz(2.289879098201004) q[10];
-cx q[6],q[10];
-rx(11.379585572691123) q[10];
-ry(pi/2) q[11];
-rx(pi) q[11];
-cx q[5],q[11];
-rz(2.289879098201004) q[11];
-cx q[5],q[11];
-cx q[6],q[11];
-rz(2.289879098201004) q[11];
-cx q[6],q[11];
-rx(11.379585572691123) q[11];
-ry(pi/2) q[12];
-rx(pi) q[12];
-cx q[3],q[12];
-rz(2.289879098201004) q[12];
-cx q[3],q[12];
-cx q[5],q[12];
-rz(2.289879098201004) q[12];
-cx q[5],q[12];
-ry(pi/2) q[13];
-rx(pi) q[13];
-cx q[4],q[13];
-rz(2.289879098201004) q[13];
-cx q[4],q[13];
-cx q[5],q[13];
-rz(2.289879098201004) q[13];
-cx q[5],q[13];
-rx(11.379585572691123) q[13];
-ry(pi/2) q[14];
-rx(pi) q[14];
-cx q[3],q[14];
-rz(2.289879098201004) q[14];
-cx q[3],q[14];
-cx q[4],q[14];
-rz(2.289879098201004) q[14];
-cx q[4],q[14];
-rx(11.379585572691123) q[14];
-ry(pi/2) q[15];
-rx(pi) q[15];
-cx q[0],q[15];
-rz(2.289879098201004) q[15];
-cx q[0],q[15];
-cx q[3],q[15];
-rz(2.289879098201004) q[15];
-cx q[3],q[15];
-ry(pi/2) q[16];
-rx(pi) q[16];
-cx q[0],q[16];
-rz(2.289879098201004) q[16];
-cx q[0],q[16];
-cx q[3],q[16];
-rz(2.289879098201004) q[16];
-cx q[3],q[16];
-rx(11.379585572691123) q[16];
-ry(pi/2) q[17];
-rx(pi) q[17];
-cx q[1],q[17];
-rz(2.289879098201004) q[17];
-cx q[1],q[17];
-cx q[3],q[17];
-rz(2.289879098201004) q[17];
-cx q[3],q[17];
-ry(pi/2) q[18];
-rx(pi) q[18];
-cx q[3],q[18];
-rz(2.289879098201004) q[18];
-cx q[3],q[18];
-cx q[4],q[18];
-rz(2.289879098201004) q[18];
-cx q[4],q[18];
-ry(pi/2) q[19];
-rx(pi) q[19];
-cx q[3],q[19];
-rz(2.289879098201004) q[19];
-cx q[3],q[19];
-cx q[7],q[19];
-rz(2.289879098201004) q[19];
-cx q[7],q[19];
-rx(11.379585572691123) q[7];
-rx(11.379585572691123) q[19];
-ry(pi/2) q[20];
-rx(pi) q[20];
-cx q[0],q[20];
-rz(2.289879098201004) q[20];
-cx q[0],q[20];
-rx(11.379585572691123) q[0];
-cx q[15],q[20];
-rz(2.289879098201004) q[20];
-cx q[15],q[20];
-rx(11.379585572691123) q[20];
-ry(pi/2) q[21];
-rx(pi) q[21];
-cx q[4],q[21];
-rz(2.289879098201004) q[21];
-cx q[4],q[21];
-cx q[15],q[21];
-rz(2.289879098201004) q[21];
-cx q[15],q[21];
-rx(11.379585572691123) q[15];
-ry(pi/2) q[22];
-rx(pi) q[22];
-cx q[3],q[22];
-rz(2.289879098201004) q[22];
-cx q[3],q[22];
-cx q[9],q[22];
-rz(2.289879098201004) q[22];
-cx q[9],q[22];
-rx(11.379585572691123) q[9];
-rx(11.379585572691123) q[22];
-ry(pi/2) q[23];
-rx(pi) q[23];
-cx q[3],q[23];
-rz(2.289879098201004) q[23];
-cx q[3],q[23];
-cx q[17],q[23];
-rz(2.289879098201004) q[23];
-cx q[17],q[23];
-rx(11.379585572691123) q[17];
-rx(11.379585572691123) q[23];
-ry(pi/2) q[24];
-rx(pi) q[24];
-cx q[3],q[24];
-rz(2.289879098201004) q[24];
-cx q[3],q[24];
-cx q[5],q[24];
-rz(2.289879098201004) q[24];
-cx q[5],q[24];
-rx(11.379585572691123) q[5];
-rx(11.379585572691123) q[24];
-ry(pi/2) q[25];
-rx(pi) q[25];
-cx q[3],q[25];
-rz(2.289879098201004) q[25];
-cx q[3],q[25];
-cx q[12],q[25];
-rz(2.289879098201004) q[25];
-cx q[12],q[25];
-rx(11.379585572691123) q[25];
-ry(pi/2) q[26];
-rx(pi) q[26];
-cx q[3],q[26];
-rz(2.289879098201004) q[26];
-cx q[3],q[26];
-cx q[21],q[26];
-rz(2.289879098201004) q[26];
-cx q[21],q[26];
-rx(11.379585572691123) q[21];
-ry(pi/2) q[27];
-rx(pi) q[27];
-cx q[4],q[27];
-rz(2.289879098201004) q[27];
-cx q[4],q[27];
-rx(11.379585572691123) q[4];
-cx q[6],q[27];
-rz(2.289879098201004) q[27];
-cx q[6],q[27];
-rx(11.379585572691123) q[6];
-rx(11.379585572691123) q[27];
-ry(pi/2) q[28];
-rx(pi) q[28];
-cx q[1],q[28];
-rz(2.289879098201004) q[28];
-cx q[1],q[28];
-cx q[3],q[28];
-rz(2.289879098201004) q[28];
-cx q[3],q[28];
-rx(11.379585572691123) q[28];
-ry(pi/2) q[29];
-rx(pi) q[29];
-cx q[1],q[29];
-rz(2.289879098201004) q[29];
-cx q[1],q[29];
-rx(11.379585572691123) q[1];
-cx q[0],q[1];
-rz(0.10819896426505718) q[1];
-cx q[0],q[1];
-cx q[0],q[2];
-rz(0.10819896426505718) q[2];
-cx q[0],q[2];
-rx(6.177663782064633) q[2];
-cx q[3],q[29];
-rz(2.289879098201004) q[29];
-cx q[3],q[29];
-rx(11.379585572691123) q[29];
-ry(pi/2) q[30];
-rx(pi) q[30];
-cx q[3],q[30];
-rz(2.289879098201004) q[30];
-cx q[3],q[30];
-rx(11.379585572691123) q[3];
-cx q[0],q[3];
-rz(0.10819896426505718) q[3];
-cx q[0],q[3];
-cx q[0],q[15];
-cx q[1],q[3];
-rz(0.10819896426505718) q[3];
-cx q[1],q[3];
-cx q[1],q[4];
-rz(0.10819896426505718) q[4];
-cx q[1],q[4];
-cx q[1],q[5];
-cx q[3],q[4];
-rz(0.10819896426505718) q[4];
-cx q[3],q[4];
-cx q[4],q[6];
-rz(0.10819896426505718) q[5];
-cx q[1],q[5];
-cx q[1],q[9];
-cx q[3],q[5];
-rz(0.10819896426505718) q[5];
-cx q[3],q[5];
-cx q[3],q[7];
-rz(0.10819896426505718) q[6];
-cx q[4],q[6];
-cx q[5],q[6];
-rz(0.10819896426505718) q[6];
-cx q[5],q[6];
-rz(0.10819896426505718) q[7];
-cx q[3],q[7];
-cx q[3],q[8];
-cx q[4],q[7];
-rz(0.10819896426505718) q[7];
-cx q[4],q[7];
-cx q[4],q[10];
-rz(0.10819896426505718) q[8];
-cx q[3],q[8];
-cx q[5],q[8];
-rz(0.10819896426505718) q[8];
-cx q[5],q[8];
-cx q[5],q[11];
-rx(6.177663782064633) q[8];
-rz(0.10819896426505718) q[9];
-cx q[1],q[9];
-cx q[1],q[17];
-cx q[3],q[9];
-rz(0.10819896426505718) q[9];
-cx q[3],q[9];
-rz(0.10819896426505718) q[10];
-cx q[4],q[10];
-cx q[4],q[13];
-cx q[6],q[10];
-rz(0.10819896426505718) q[10];
-cx q[6],q[10];
-rx(6.177663782064633) q[10];
-rz(0.10819896426505718) q[11];
-cx q[5],q[11];
-cx q[6],q[11];
-rz(0.10819896426505718) q[11];
-cx q[6],q[11];
-rx(6.177663782064633) q[11];
-rz(0.10819896426505718) q[13];
-cx q[4],q[13];
-rz(0.10819896426505718) q[15];
-cx q[0],q[15];
-cx q[0],q[16];
-rz(0.10819896426505718) q[16];
-cx q[0],q[16];
-cx q[0],q[20];
-rz(0.10819896426505718) q[17];
-cx q[1],q[17];
-cx q[1],q[28];
-cx q[18],q[30];
-rz(0.10819896426505718) q[20];
-cx q[0],q[20];
-rx(6.177663782064633) q[0];
-rz(0.10819896426505718) q[28];
-cx q[1],q[28];
-cx q[1],q[29];
-rz(0.10819896426505718) q[29];
-cx q[1],q[29];
-rx(6.177663782064633) q[1];
-cx q[0],q[1];
-rz(5.1619485689032585) q[1];
-cx q[0],q[1];
-cx q[0],q[2];
-rz(5.1619485689032585) q[2];
-cx q[0],q[2];
-rx(8.263716647004406) q[2];
-rz(2.289879098201004) q[30];
-cx q[18],q[30];
-rx(11.379585572691123) q[18];
-rx(11.379585572691123) q[30];
-ry(pi/2) q[31];
-rx(pi) q[31];
-cx q[12],q[31];
-rz(2.289879098201004) q[31];
-cx q[12],q[31];
-rx(11.379585572691123) q[12];
-cx q[3],q[12];
-rz(0.10819896426505718) q[12];
-cx q[3],q[12];
-cx q[3],q[14];
-cx q[5],q[12];
-rz(0.10819896426505718) q[12];
-cx q[5],q[12];
-cx q[5],q[13];
-rz(0.10819896426505718) q[13];
-cx q[5],q[13];
-rx(6.177663782064633) q[13];
-rz(0.10819896426505718) q[14];
-cx q[3],q[14];
-cx q[3],q[15];
-cx q[4],q[14];
-rz(0.10819896426505718) q[14];
-cx q[4],q[14];
-rx(6.177663782064633) q[14];
-rz(0.10819896426505718) q[15];
-cx q[3],q[15];
-cx q[3],q[16];
-cx q[15],q[20];
-rz(0.10819896426505718) q[16];
-cx q[3],q[16];
-cx q[3],q[17];
-rx(6.177663782064633) q[16];
-rz(0.10819896426505718) q[17];
-cx q[3],q[17];
-cx q[3],q[18];
-rz(0.10819896426505718) q[18];
-cx q[3],q[18];
-cx q[3],q[19];
-cx q[4],q[18];
-rz(0.10819896426505718) q[18];
-cx q[4],q[18];
-cx q[4],q[21];
-rz(0.10819896426505718) q[19];
-cx q[3],q[19];
-cx q[3],q[22];
-cx q[7],q[19];
-rz(0.10819896426505718) q[19];
-cx q[7],q[19];
-rx(6.177663782064633) q[7];
-rx(6.177663782064633) q[19];
-rz(0.10819896426505718) q[20];
-cx q[15],q[20];
-rx(6.177663782064633) q[20];
-rz(0.10819896426505718) q[21];
-cx q[4],q[21];
-cx q[4],q[27];
-cx q[15],q[21];
-rz(0.10819896426505718) q[21];
-cx q[15],q[21];
-rx(6.177663782064633) q[15];
-rz(0.10819896426505718) q[22];
-cx q[3],q[22];
-cx q[3],q[23];
-cx q[9],q[22];
-rz(0.10819896426505718) q[22];
-cx q[9],q[22];
-rx(6.177663782064633) q[9];
-rx(6.177663782064633) q[22];
-rz(0.10819896426505718) q[23];
-cx q[3],q[23];
-cx q[3],q[24];
-cx q[17],q[23];
-rz(0.10819896426505718) q[23];
-cx q[17],q[23];
-rx(6.177663782064633) q[17];
-rx(6.177663782064633) q[23];
-rz(0.10819896426505718) q[24];
-cx q[3],q[24];
-cx q[3],q[25];
-cx q[5],q[24];
-rz(0.10819896426505718) q[24];
-cx q[5],q[24];
-rx(6.177663782064633) q[5];
-rx(6.177663782064633) q[24];
-rz(0.10819896426505718) q[25];
-cx q[3],q[25];
-cx q[12],q[25];
-rz(0.10819896426505718) q[25];
-cx q[12],q[25];
-rx(6.177663782064633) q[25];
-cx q[26],q[31];
-rz(0.10819896426505718) q[27];
-cx q[4],q[27];
-rx(6.177663782064633) q[4];
-cx q[6],q[27];
-rz(0.10819896426505718) q[27];
-cx q[6],q[27];
-rx(6.177663782064633) q[6];
-rx(6.177663782064633) q[27];
-rz(2.289879098201004) q[31];
-cx q[26],q[31];
-rx(11.379585572691123) q[26];
-cx q[3],q[26];
-rz(0.10819896426505718) q[26];
-cx q[3],q[26];
-cx q[3],q[28];
-cx q[21],q[26];
-rz(0.10819896426505718) q[26];
-cx q[21],q[26];
-rx(6.177663782064633) q[21];
-rz(0.10819896426505718) q[28];
-cx q[3],q[28];
-cx q[3],q[29];
-rx(6.177663782064633) q[28];
-rz(0.10819896426505718) q[29];
-cx q[3],q[29];
-cx q[3],q[30];
-rx(6.177663782064633) q[29];
-rz(0.10819896426505718) q[30];
-cx q[3],q[30];
-rx(6.177663782064633) q[3];
-cx q[0],q[3];
-rz(5.1619485689032585) q[3];
-cx q[0],q[3];
-cx q[0],q[15];
-cx q[1],q[3];
-rz(5.1619485689032585) q[3];
-cx q[1],q[3];
-cx q[1],q[4];
-rz(5.1619485689032585) q[4];
-cx q[1],q[4];
-cx q[1],q[5];
-cx q[3],q[4];
-rz(5.1619485689032585) q[4];
-cx q[3],q[4];
-cx q[4],q[6];
-rz(5.1619485689032585) q[5];
-cx q[1],q[5];
-cx q[1],q[9];
-cx q[3],q[5];
-rz(5.1619485689032585) q[5];
-cx q[3],q[5];
-cx q[3],q[7];
-rz(5.1619485689032585) q[6];
-cx q[4],q[6];
-cx q[5],q[6];
-rz(5.1619485689032585) q[6];
-cx q[5],q[6];
-rz(5.1619485689032585) q[7];
-cx q[3],q[7];
-cx q[3],q[8];
-cx q[4],q[7];
-rz(5.1619485689032585) q[7];
-cx q[4],q[7];
-cx q[4],q[10];
-rz(5.1619485689032585) q[8];
-cx q[3],q[8];
-cx q[5],q[8];
-rz(5.1619485689032585) q[8];
-cx q[5],q[8];
-cx q[5],q[11];
-rx(8.263716647004406) q[8];
-rz(5.1619485689032585) q[9];
-cx q[1],q[9];
-cx q[1],q[17];
-cx q[3],q[9];
-rz(5.1619485689032585) q[9];
-cx q[3],q[9];
-rz(5.1619485689032585) q[10];
-cx q[4],q[10];
-cx q[4],q[13];
-cx q[6],q[10];
-rz(5.1619485689032585) q[10];
-cx q[6],q[10];
-rx(8.263716647004406) q[10];
-rz(5.1619485689032585) q[11];
-cx q[5],q[11];
-cx q[6],q[11];
-rz(5.1619485689032585) q[11];
-cx q[6],q[11];
-rx(8.263716647004406) q[11];
-rz(5.1619485689032585) q[13];
-cx q[4],q[13];
-rz(5.1619485689032585) q[15];
-cx q[0],q[15];
-cx q[0],q[16];
-rz(5.1619485689032585) q[16];
-cx q[0],q[16];
-cx q[0],q[20];
-rz(5.1619485689032585) q[17];
-cx q[1],q[17];
-cx q[1],q[28];
-cx q[18],q[30];
-rz(5.1619485689032585) q[20];
-cx q[0],q[20];
-rx(8.263716647004406) q[0];
-rz(5.1619485689032585) q[28];
-cx q[1],q[28];
-cx q[1],q[29];
-rz(5.1619485689032585) q[29];
-cx q[1],q[29];
-rx(8.263716647004406) q[1];
-rz(0.10819896426505718) q[30];
-cx q[18],q[30];
-rx(6.177663782064633) q[18];
-rx(6.177663782064633) q[30];
-rx(11.379585572691123) q[31];
-cx q[12],q[31];
-rz(0.10819896426505718) q[31];
-cx q[12],q[31];
-rx(6.177663782064633) q[12];
-cx q[3],q[12];
-rz(5.1619485689032585) q[12];
-cx q[3],q[12];
-cx q[3],q[14];
-cx q[5],q[12];
-rz(5.1619485689032585) q[12];
-cx q[5],q[12];
-cx q[5],q[13];
-rz(5.1619485689032585) q[13];
-cx q[5],q[13];
-rx(8.263716647004406) q[13];
-rz(5.1619485689032585) q[14];
-cx q[3],q[14];
-cx q[3],q[15];
-cx q[4],q[14];
-rz(5.1619485689032585) q[14];
-cx q[4],q[14];
-rx(8.263716647004406) q[14];
-rz(5.1619485689032585) q[15];
-cx q[3],q[15];
-cx q[3],q[16];
-cx q[15],q[20];
-rz(5.1619485689032585) q[16];
-cx q[3],q[16];
-cx q[3],q[17];
-rx(8.263716647004406) q[16];
-rz(5.1619485689032585) q[17];
-cx q[3],q[17];
-cx q[3],q[18];
-rz(5.1619485689032585) q[18];
-cx q[3],q[18];
-cx q[3],q[19];
-cx q[4],q[18];
-rz(5.1619485689032585) q[18];
-cx q[4],q[18];
-cx q[4],q[21];
-rz(5.1619485689032585) q[19];
-cx q[3],q[19];
-cx q[3],q[22];
-cx q[7],q[19];
-rz(5.1619485689032585) q[19];
-cx q[7],q[19];
-rx(8.263716647004406) q[7];
-rx(8.263716647004406) q[19];
-rz(5.1619485689032585) q[20];
-cx q[15],q[20];
-rx(8.263716647004406) q[20];
-rz(5.1619485689032585) q[21];
-cx q[4],q[21];
-cx q[4],q[27];
-cx q[15],q[21];
-rz(5.1619485689032585) q[21];
-cx q[15],q[21];
-rx(8.263716647004406) q[15];
-rz(5.1619485689032585) q[22];
-cx q[3],q[22];
-cx q[3],q[23];
-cx q[9],q[22];
-rz(5.1619485689032585) q[22];
-cx q[9],q[22];
-rx(8.263716647004406) q[9];
-rx(8.263716647004406) q[22];
-rz(5.1619485689032585) q[23];
-cx q[3],q[23];
-cx q[3],q[24];
-cx q[17],q[23];
-rz(5.1619485689032585) q[23];
-cx q[17],q[23];
-rx(8.263716647004406) q[17];
-rx(8.263716647004406) q[23];
-rz(5.1619485689032585) q[24];
-cx q[3],q[24];
-cx q[3],q[25];
-cx q[5],q[24];
-rz(5.1619485689032585) q[24];
-cx q[5],q[24];
-rx(8.263716647004406) q[5];
-rx(8.263716647004406) q[24];
-rz(5.1619485689032585) q[25];
-cx q[3],q[25];
-cx q[12],q[25];
-rz(5.1619485689032585) q[25];
-cx q[12],q[25];
-rx(8.263716647004406) q[25];
-cx q[26],q[31];
-rz(5.1619485689032585) q[27];
-cx q[4],q[27];
-rx(8.263716647004406) q[4];
-cx q[6],q[27];
-rz(5.1619485689032585) q[27];
-cx q[6],q[27];
-rx(8.263716647004406) q[6];
-rx(8.263716647004406) q[27];
-rz(0.10819896426505718) q[31];
-cx q[26],q[31];
-rx(6.177663782064633) q[26];
-cx q[3],q[26];
-rz(5.1619485689032585) q[26];
-cx q[3],q[26];
-cx q[3],q[28];
-cx q[21],q[26];
-rz(5.1619485689032585) q[26];
-cx q[21],q[26];
-rx(8.263716647004406) q[21];
-rz(5.1619485689032585) q[28];
-cx q[3],q[28];
-cx q[3],q[29];
-rx(8.263716647004406) q[28];
-rz(5.1619485689032585) q[29];
-cx q[3],q[29];
-cx q[3],q[30];
-rx(8.263716647004406) q[29];
-rz(5.1619485689032585) q[30];
-cx q[3],q[30];
-rx(8.263716647004406) q[3];
-cx q[18],q[30];
-rz(5.1619485689032585) q[30];
-cx q[18],q[30];
-rx(8.263716647004406) q[18];
-rx(8.263716647004406) q[30];
-rx(6.177663782064633) q[31];
-cx q[12],q[31];
-rz(5.1619485689032585) q[31];
-cx q[12],q[31];
-rx(8.263716647004406) q[12];
-cx q[26],q[31];
-rz(5.1619485689032585) q[31];
-cx q[26],q[31];
-rx(8.263716647004406) q[26];
-rx(8.263716647004406) q[31];
\ No newline at end of file
@@ -1,726 +0,0 @@
-OPENQASM 2.0;
-include "qelib1.inc";
-qreg q[33];
-ry(pi/2) q[0];
-rx(pi) q[0];
-ry(pi/2) q[1];
-rx(pi) q[1];
-cx q[0],q[1];
-rz(5.934390303367457) q[1];
-cx q[0],q[1];
-ry(pi/2) q[2];
-rx(pi) q[2];
-cx q[0],q[2];
-rz(5.934390303367457) q[2];
-cx q[0],q[2];
-rx(4.224807822163879) q[2];
-ry(pi/2) q[3];
-rx(pi) q[3];
-cx q[0],q[3];
-rz(5.934390303367457) q[3];
-cx q[0],q[3];
-cx q[1],q[3];
-rz(5.934390303367457) q[3];
-cx q[1],q[3];
-ry(pi/2) q[4];
-rx(pi) q[4];
-cx q[1],q[4];
-rz(5.934390303367457) q[4];
-cx q[1],q[4];
-cx q[3],q[4];
-rz(5.934390303367457) q[4];
-cx q[3],q[4];
-ry(pi/2) q[5];
-rx(pi) q[5];
-cx q[1],q[5];
-rz(5.934390303367457) q[5];
-cx q[1],q[5];
-cx q[3],q[5];
-rz(5.934390303367457) q[5];
-cx q[3],q[5];
-ry(pi/2) q[6];
-rx(pi) q[6];
-cx q[4],q[6];
-rz(5.934390303367457) q[6];
-cx q[4],q[6];
-cx q[5],q[6];
-rz(5.934390303367457) q[6];
-cx q[5],q[6];
-ry(pi/2) q[7];
-rx(pi) q[7];
-cx q[3],q[7];
-rz(5.934390303367457) q[7];
-cx q[3],q[7];
-cx q[4],q[7];
-rz(5.934390303367457) q[7];
-cx q[4],q[7];
-ry(pi/2) q[8];
-rx(pi) q[8];
-cx q[3],q[8];
-rz(5.934390303367457) q[8];
-cx q[3],q[8];
-cx q[5],q[8];
-rz(5.934390303367457) q[8];
-cx q[5],q[8];
-rx(4.224807822163879) q[8];
-ry(pi/2) q[9];
-rx(pi) q[9];
-cx q[1],q[9];
-rz(5.934390303367457) q[9];
-cx q[1],q[9];
-cx q[3],q[9];
-rz(5.934390303367457) q[9];
-cx q[3],q[9];
-ry(pi/2) q[10];
-rx(pi) q[10];
-cx q[4],q[10];
-rz(5.934390303367457) q[10];
-cx q[4],q[10];
-cx q[6],q[10];
-rz(5.934390303367457) q[10];
-cx q[6],q[10];
-rx(4.224807822163879) q[10];
-ry(pi/2) q[11];
-rx(pi) q[11];
-cx q[5],q[11];
-rz(5.934390303367457) q[11];
-cx q[5],q[11];
-cx q[6],q[11];
-rz(5.934390303367457) q[11];
-cx q[6],q[11];
-rx(4.224807822163879) q[11];
-ry(pi/2) q[12];
-rx(pi) q[12];
-cx q[3],q[12];
-rz(5.934390303367457) q[12];
-cx q[3],q[12];
-cx q[5],q[12];
-rz(5.934390303367457) q[12];
-cx q[5],q[12];
-ry(pi/2) q[13];
-rx(pi) q[13];
-cx q[4],q[13];
-rz(5.934390303367457) q[13];
-cx q[4],q[13];
-cx q[5],q[13];
-rz(5.934390303367457) q[13];
-cx q[5],q[13];
-rx(4.224807822163879) q[13];
-ry(pi/2) q[14];
-rx(pi) q[14];
-cx q[3],q[14];
-rz(5.934390303367457) q[14];
-cx q[3],q[14];
-cx q[4],q[14];
-rz(5.934390303367457) q[14];
-cx q[4],q[14];
-rx(4.224807822163879) q[14];
-ry(pi/2) q[15];
-rx(pi) q[15];
-cx q[0],q[15];
-rz(5.934390303367457) q[15];
-cx q[0],q[15];
-cx q[3],q[15];
-rz(5.934390303367457) q[15];
-cx q[3],q[15];
-ry(pi/2) q[16];
-rx(pi) q[16];
-cx q[0],q[16];
-rz(5.934390303367457) q[16];
-cx q[0],q[16];
-cx q[3],q[16];
-rz(5.934390303367457) q[16];
-cx q[3],q[16];
-rx(4.224807822163879) q[16];
-ry(pi/2) q[17];
-rx(pi) q[17];
-cx q[1],q[17];
-rz(5.934390303367457) q[17];
-cx q[1],q[17];
-cx q[3],q[17];
-rz(5.934390303367457) q[17];
-cx q[3],q[17];
-ry(pi/2) q[18];
-rx(pi) q[18];
-cx q[3],q[18];
-rz(5.934390303367457) q[18];
-cx q[3],q[18];
-cx q[4],q[18];
-rz(5.934390303367457) q[18];
-cx q[4],q[18];
-ry(pi/2) q[19];
-rx(pi) q[19];
-cx q[3],q[19];
-rz(5.934390303367457) q[19];
-cx q[3],q[19];
-cx q[7],q[19];
-rz(5.934390303367457) q[19];
-cx q[7],q[19];
-rx(4.224807822163879) q[7];
-rx(4.224807822163879) q[19];
-ry(pi/2) q[20];
-rx(pi) q[20];
-cx q[0],q[20];
-rz(5.934390303367457) q[20];
-cx q[0],q[20];
-cx q[15],q[20];
-rz(5.934390303367457) q[20];
-cx q[15],q[20];
-rx(4.224807822163879) q[20];
-ry(pi/2) q[21];
-rx(pi) q[21];
-cx q[4],q[21];
-rz(5.934390303367457) q[21];
-cx q[4],q[21];
-cx q[15],q[21];
-rz(5.934390303367457) q[21];
-cx q[15],q[21];
-rx(4.224807822163879) q[15];
-ry(pi/2) q[22];
-rx(pi) q[22];
-cx q[3],q[22];
-rz(5.934390303367457) q[22];
-cx q[3],q[22];
-cx q[9],q[22];
-rz(5.934390303367457) q[22];
-cx q[9],q[22];
-rx(4.224807822163879) q[9];
-rx(4.224807822163879) q[22];
-ry(pi/2) q[23];
-rx(pi) q[23];
-cx q[3],q[23];
-rz(5.934390303367457) q[23];
-cx q[3],q[23];
-cx q[17],q[23];
-rz(5.934390303367457) q[23];
-cx q[17],q[23];
-rx(4.224807822163879) q[17];
-rx(4.224807822163879) q[23];
-ry(pi/2) q[24];
-rx(pi) q[24];
-cx q[3],q[24];
-rz(5.934390303367457) q[24];
-cx q[3],q[24];
-cx q[5],q[24];
-rz(5.934390303367457) q[24];
-cx q[5],q[24];
-rx(4.224807822163879) q[5];
-rx(4.224807822163879) q[24];
-ry(pi/2) q[25];
-rx(pi) q[25];
-cx q[3],q[25];
-rz(5.934390303367457) q[25];
-cx q[3],q[25];
-cx q[12],q[25];
-rz(5.934390303367457) q[25];
-cx q[12],q[25];
-rx(4.224807822163879) q[25];
-ry(pi/2) q[26];
-rx(pi) q[26];
-cx q[3],q[26];
-rz(5.934390303367457) q[26];
-cx q[3],q[26];
-cx q[21],q[26];
-rz(5.934390303367457) q[26];
-cx q[21],q[26];
-ry(pi/2) q[27];
-rx(pi) q[27];
-cx q[4],q[27];
-rz(5.934390303367457) q[27];
-cx q[4],q[27];
-rx(4.224807822163879) q[4];
-cx q[6],q[27];
-rz(5.934390303367457) q[27];
-cx q[6],q[27];
-rx(4.224807822163879) q[6];
-rx(4.224807822163879) q[27];
-ry(pi/2) q[28];
-rx(pi) q[28];
-cx q[1],q[28];
-rz(5.934390303367457) q[28];
-cx q[1],q[28];
-cx q[3],q[28];
-rz(5.934390303367457) q[28];
-cx q[3],q[28];
-rx(4.224807822163879) q[28];
-ry(pi/2) q[29];
-rx(pi) q[29];
-cx q[1],q[29];
-rz(5.934390303367457) q[29];
-cx q[1],q[29];
-rx(4.224807822163879) q[1];
-cx q[3],q[29];
-rz(5.934390303367457) q[29];
-cx q[3],q[29];
-rx(4.224807822163879) q[29];
-ry(pi/2) q[30];
-rx(pi) q[30];
-cx q[3],q[30];
-rz(5.934390303367457) q[30];
-cx q[3],q[30];
-rx(4.224807822163879) q[3];
-cx q[18],q[30];
-rz(5.934390303367457) q[30];
-cx q[18],q[30];
-rx(4.224807822163879) q[18];
-rx(4.224807822163879) q[30];
-ry(pi/2) q[31];
-rx(pi) q[31];
-cx q[12],q[31];
-rz(5.934390303367457) q[31];
-cx q[12],q[31];
-rx(4.224807822163879) q[12];
-cx q[26],q[31];
-rz(5.934390303367457) q[31];
-cx q[26],q[31];
-rx(4.224807822163879) q[26];
-rx(4.224807822163879) q[31];
-ry(pi/2) q[32];
-rx(pi) q[32];
-cx q[0],q[32];
-rz(5.934390303367457) q[32];
-cx q[0],q[32];
-rx(4.224807822163879) q[0];
-cx q[0],q[1];
-rz(3.491986774391591) q[1];
-cx q[0],q[1];
-cx q[0],q[2];
-rz(3.491986774391591) q[2];
-cx q[0],q[2];
-cx q[0],q[3];
-rx(5.558196138122725) q[2];
-rz(3.491986774391591) q[3];
-cx q[0],q[3];
-cx q[0],q[15];
-cx q[1],q[3];
-rz(3.491986774391591) q[3];
-cx q[1],q[3];
-cx q[1],q[4];
-rz(3.491986774391591) q[4];
-cx q[1],q[4];
-cx q[1],q[5];
-cx q[3],q[4];
-rz(3.491986774391591) q[4];
-cx q[3],q[4];
-cx q[4],q[6];
-rz(3.491986774391591) q[5];
-cx q[1],q[5];
-cx q[1],q[9];
-cx q[3],q[5];
-rz(3.491986774391591) q[5];
-cx q[3],q[5];
-cx q[3],q[7];
-rz(3.491986774391591) q[6];
-cx q[4],q[6];
-cx q[5],q[6];
-rz(3.491986774391591) q[6];
-cx q[5],q[6];
-rz(3.491986774391591) q[7];
-cx q[3],q[7];
-cx q[3],q[8];
-cx q[4],q[7];
-rz(3.491986774391591) q[7];
-cx q[4],q[7];
-cx q[4],q[10];
-rz(3.491986774391591) q[8];
-cx q[3],q[8];
-cx q[5],q[8];
-rz(3.491986774391591) q[8];
-cx q[5],q[8];
-cx q[5],q[11];
-rx(5.558196138122725) q[8];
-rz(3.491986774391591) q[9];
-cx q[1],q[9];
-cx q[1],q[17];
-cx q[3],q[9];
-rz(3.491986774391591) q[9];
-cx q[3],q[9];
-cx q[3],q[12];
-rz(3.491986774391591) q[10];
-cx q[4],q[10];
-cx q[4],q[13];
-cx q[6],q[10];
-rz(3.491986774391591) q[10];
-cx q[6],q[10];
-rx(5.558196138122725) q[10];
-rz(3.491986774391591) q[11];
-cx q[5],q[11];
-cx q[6],q[11];
-rz(3.491986774391591) q[11];
-cx q[6],q[11];
-rx(5.558196138122725) q[11];
-rz(3.491986774391591) q[12];
-cx q[3],q[12];
-cx q[3],q[14];
-cx q[5],q[12];
-rz(3.491986774391591) q[12];
-cx q[5],q[12];
-rz(3.491986774391591) q[13];
-cx q[4],q[13];
-cx q[5],q[13];
-rz(3.491986774391591) q[13];
-cx q[5],q[13];
-rx(5.558196138122725) q[13];
-rz(3.491986774391591) q[14];
-cx q[3],q[14];
-cx q[4],q[14];
-rz(3.491986774391591) q[14];
-cx q[4],q[14];
-rx(5.558196138122725) q[14];
-rz(3.491986774391591) q[15];
-cx q[0],q[15];
-cx q[0],q[16];
-cx q[3],q[15];
-rz(3.491986774391591) q[15];
-cx q[3],q[15];
-rz(3.491986774391591) q[16];
-cx q[0],q[16];
-cx q[0],q[20];
-cx q[3],q[16];
-rz(3.491986774391591) q[16];
-cx q[3],q[16];
-rx(5.558196138122725) q[16];
-rz(3.491986774391591) q[17];
-cx q[1],q[17];
-cx q[1],q[28];
-cx q[3],q[17];
-rz(3.491986774391591) q[17];
-cx q[3],q[17];
-cx q[3],q[18];
-rz(3.491986774391591) q[18];
-cx q[3],q[18];
-cx q[3],q[19];
-cx q[4],q[18];
-rz(3.491986774391591) q[18];
-cx q[4],q[18];
-rz(3.491986774391591) q[19];
-cx q[3],q[19];
-cx q[3],q[22];
-cx q[7],q[19];
-rz(3.491986774391591) q[19];
-cx q[7],q[19];
-rx(5.558196138122725) q[7];
-rx(5.558196138122725) q[19];
-rz(3.491986774391591) q[20];
-cx q[0],q[20];
-cx q[15],q[20];
-rz(3.491986774391591) q[20];
-cx q[15],q[20];
-rx(5.558196138122725) q[20];
-cx q[21],q[32];
-rz(3.491986774391591) q[22];
-cx q[3],q[22];
-cx q[3],q[23];
-cx q[9],q[22];
-rz(3.491986774391591) q[22];
-cx q[9],q[22];
-rx(5.558196138122725) q[9];
-rx(5.558196138122725) q[22];
-rz(3.491986774391591) q[23];
-cx q[3],q[23];
-cx q[3],q[24];
-cx q[17],q[23];
-rz(3.491986774391591) q[23];
-cx q[17],q[23];
-rx(5.558196138122725) q[17];
-rx(5.558196138122725) q[23];
-rz(3.491986774391591) q[24];
-cx q[3],q[24];
-cx q[3],q[25];
-cx q[5],q[24];
-rz(3.491986774391591) q[24];
-cx q[5],q[24];
-rx(5.558196138122725) q[5];
-rx(5.558196138122725) q[24];
-rz(3.491986774391591) q[25];
-cx q[3],q[25];
-cx q[3],q[26];
-cx q[12],q[25];
-rz(3.491986774391591) q[25];
-cx q[12],q[25];
-cx q[12],q[31];
-rx(5.558196138122725) q[25];
-rz(3.491986774391591) q[26];
-cx q[3],q[26];
-rz(3.491986774391591) q[28];
-cx q[1],q[28];
-cx q[1],q[29];
-cx q[3],q[28];
-rz(3.491986774391591) q[28];
-cx q[3],q[28];
-rx(5.558196138122725) q[28];
-rz(3.491986774391591) q[29];
-cx q[1],q[29];
-rx(5.558196138122725) q[1];
-cx q[3],q[29];
-rz(3.491986774391591) q[29];
-cx q[3],q[29];
-cx q[3],q[30];
-rx(5.558196138122725) q[29];
-rz(3.491986774391591) q[30];
-cx q[3],q[30];
-rx(5.558196138122725) q[3];
-cx q[18],q[30];
-rz(3.491986774391591) q[30];
-cx q[18],q[30];
-rx(5.558196138122725) q[18];
-rx(5.558196138122725) q[30];
-rz(3.491986774391591) q[31];
-cx q[12],q[31];
-rx(5.558196138122725) q[12];
-rz(5.934390303367457) q[32];
-cx q[21],q[32];
-rx(4.224807822163879) q[21];
-cx q[4],q[21];
-rz(3.491986774391591) q[21];
-cx q[4],q[21];
-cx q[4],q[27];
-cx q[15],q[21];
-rz(3.491986774391591) q[21];
-cx q[15],q[21];
-rx(5.558196138122725) q[15];
-cx q[21],q[26];
-rz(3.491986774391591) q[26];
-cx q[21],q[26];
-cx q[26],q[31];
-rz(3.491986774391591) q[27];
-cx q[4],q[27];
-rx(5.558196138122725) q[4];
-cx q[6],q[27];
-rz(3.491986774391591) q[27];
-cx q[6],q[27];
-rx(5.558196138122725) q[6];
-rx(5.558196138122725) q[27];
-rz(3.491986774391591) q[31];
-cx q[26],q[31];
-rx(5.558196138122725) q[26];
-rx(5.558196138122725) q[31];
-rx(4.224807822163879) q[32];
-cx q[0],q[32];
-rz(3.491986774391591) q[32];
-cx q[0],q[32];
-rx(5.558196138122725) q[0];
-cx q[0],q[1];
-rz(3.666366047189787) q[1];
-cx q[0],q[1];
-cx q[0],q[2];
-rz(3.666366047189787) q[2];
-cx q[0],q[2];
-cx q[0],q[3];
-rx(5.860900995309953) q[2];
-rz(3.666366047189787) q[3];
-cx q[0],q[3];
-cx q[0],q[15];
-cx q[1],q[3];
-rz(3.666366047189787) q[3];
-cx q[1],q[3];
-cx q[1],q[4];
-rz(3.666366047189787) q[4];
-cx q[1],q[4];
-cx q[1],q[5];
-cx q[3],q[4];
-rz(3.666366047189787) q[4];
-cx q[3],q[4];
-cx q[4],q[6];
-rz(3.666366047189787) q[5];
-cx q[1],q[5];
-cx q[1],q[9];
-cx q[3],q[5];
-rz(3.666366047189787) q[5];
-cx q[3],q[5];
-cx q[3],q[7];
-rz(3.666366047189787) q[6];
-cx q[4],q[6];
-cx q[5],q[6];
-rz(3.666366047189787) q[6];
-cx q[5],q[6];
-rz(3.666366047189787) q[7];
-cx q[3],q[7];
-cx q[3],q[8];
-cx q[4],q[7];
-rz(3.666366047189787) q[7];
-cx q[4],q[7];
-cx q[4],q[10];
-rz(3.666366047189787) q[8];
-cx q[3],q[8];
-cx q[5],q[8];
-rz(3.666366047189787) q[8];
-cx q[5],q[8];
-cx q[5],q[11];
-rx(5.860900995309953) q[8];
-rz(3.666366047189787) q[9];
-cx q[1],q[9];
-cx q[1],q[17];
-cx q[3],q[9];
-rz(3.666366047189787) q[9];
-cx q[3],q[9];
-cx q[3],q[12];
-rz(3.666366047189787) q[10];
-cx q[4],q[10];
-cx q[4],q[13];
-cx q[6],q[10];
-rz(3.666366047189787) q[10];
-cx q[6],q[10];
-rx(5.860900995309953) q[10];
-rz(3.666366047189787) q[11];
-cx q[5],q[11];
-cx q[6],q[11];
-rz(3.666366047189787) q[11];
-cx q[6],q[11];
-rx(5.860900995309953) q[11];
-rz(3.666366047189787) q[12];
-cx q[3],q[12];
-cx q[3],q[14];
-cx q[5],q[12];
-rz(3.666366047189787) q[12];
-cx q[5],q[12];
-rz(3.666366047189787) q[13];
-cx q[4],q[13];
-cx q[5],q[13];
-rz(3.666366047189787) q[13];
-cx q[5],q[13];
-rx(5.860900995309953) q[13];
-rz(3.666366047189787) q[14];
-cx q[3],q[14];
-cx q[4],q[14];
-rz(3.666366047189787) q[14];
-cx q[4],q[14];
-rx(5.860900995309953) q[14];
-rz(3.666366047189787) q[15];
-cx q[0],q[15];
-cx q[0],q[16];
-cx q[3],q[15];
-rz(3.666366047189787) q[15];
-cx q[3],q[15];
-rz(3.666366047189787) q[16];
-cx q[0],q[16];
-cx q[0],q[20];
-cx q[3],q[16];
-rz(3.666366047189787) q[16];
-cx q[3],q[16];
-rx(5.860900995309953) q[16];
-rz(3.666366047189787) q[17];
-cx q[1],q[17];
-cx q[1],q[28];
-cx q[3],q[17];
-rz(3.666366047189787) q[17];
-cx q[3],q[17];
-cx q[3],q[18];
-rz(3.666366047189787) q[18];
-cx q[3],q[18];
-cx q[3],q[19];
-cx q[4],q[18];
-rz(3.666366047189787) q[18];
-cx q[4],q[18];
-rz(3.666366047189787) q[19];
-cx q[3],q[19];
-cx q[3],q[22];
-cx q[7],q[19];
-rz(3.666366047189787) q[19];
-cx q[7],q[19];
-rx(5.860900995309953) q[7];
-rx(5.860900995309953) q[19];
-rz(3.666366047189787) q[20];
-cx q[0],q[20];
-cx q[15],q[20];
-rz(3.666366047189787) q[20];
-cx q[15],q[20];
-rx(5.860900995309953) q[20];
-cx q[21],q[32];
-rz(3.666366047189787) q[22];
-cx q[3],q[22];
-cx q[3],q[23];
-cx q[9],q[22];
-rz(3.666366047189787) q[22];
-cx q[9],q[22];
-rx(5.860900995309953) q[9];
-rx(5.860900995309953) q[22];
-rz(3.666366047189787) q[23];
-cx q[3],q[23];
-cx q[3],q[24];
-cx q[17],q[23];
-rz(3.666366047189787) q[23];
-cx q[17],q[23];
-rx(5.860900995309953) q[17];
-rx(5.860900995309953) q[23];
-rz(3.666366047189787) q[24];
-cx q[3],q[24];
-cx q[3],q[25];
-cx q[5],q[24];
-rz(3.666366047189787) q[24];
-cx q[5],q[24];
-rx(5.860900995309953) q[5];
-rx(5.860900995309953) q[24];
-rz(3.666366047189787) q[25];
-cx q[3],q[25];
-cx q[3],q[26];
-cx q[12],q[25];
-rz(3.666366047189787) q[25];
-cx q[12],q[25];
-cx q[12],q[31];
-rx(5.860900995309953) q[25];
-rz(3.666366047189787) q[26];
-cx q[3],q[26];
-rz(3.666366047189787) q[28];
-cx q[1],q[28];
-cx q[1],q[29];
-cx q[3],q[28];
-rz(3.666366047189787) q[28];
-cx q[3],q[28];
-rx(5.860900995309953) q[28];
-rz(3.666366047189787) q[29];
-cx q[1],q[29];
-rx(5.860900995309953) q[1];
-cx q[3],q[29];
-rz(3.666366047189787) q[29];
-cx q[3],q[29];
-cx q[3],q[30];
-rx(5.860900995309953) q[29];
-rz(3.666366047189787) q[30];
-cx q[3],q[30];
-rx(5.860900995309953) q[3];
-cx q[18],q[30];
-rz(3.666366047189787) q[30];
-cx q[18],q[30];
-rx(5.860900995309953) q[18];
-rx(5.860900995309953) q[30];
-rz(3.666366047189787) q[31];
-cx q[12],q[31];
-rx(5.860900995309953) q[12];
-rz(3.491986774391591) q[32];
-cx q[21],q[32];
-rx(5.558196138122725) q[21];
-cx q[4],q[21];
-rz(3.666366047189787) q[21];
-cx q[4],q[21];
-cx q[4],q[27];
-cx q[15],q[21];
-rz(3.666366047189787) q[21];
-cx q[15],q[21];
-rx(5.860900995309953) q[15];
-cx q[21],q[26];
-rz(3.666366047189787) q[26];
-cx q[21],q[26];
-cx q[26],q[31];
-rz(3.666366047189787) q[27];
-cx q[4],q[27];
-rx(5.860900995309953) q[4];
-cx q[6],q[27];
-rz(3.666366047189787) q[27];
-cx q[6],q[27];
-rx(5.860900995309953) q[6];
-rx(5.860900995309953) q[27];
-rz(3.666366047189787) q[31];
-cx q[26],q[31];
-rx(5.860900995309953) q[26];
-rx(5.860900995309953) q[31];
-rx(5.558196138122725) q[32];
-cx q[0],q[32];
-rz(3.666366047189787) q[32];
-cx q[0],q[32];
-rx(5.860900995309953) q[0];
-cx q[21],q[32];
-rz(3.666366047189787) q[32];
-cx q[21],q[32];
-rx(5.860900995309953) q[21];
-rx(5.860900995309953) q[32];
\ No newline at end of file
@@ -1,749 +0,0 @@
-OPENQASM 2.0;
-include "qelib1.inc";
-qreg q[34];
-ry(pi/2) q[0];
-rx(pi) q[0];
-ry(pi/2) q[1];
-rx(pi) q[1];
-cx q[0],q[1];
-rz(3.087742031804801) q[1];
-cx q[0],q[1];
-ry(pi/2) q[2];
-rx(pi) q[2];
-cx q[0],q[2];
-rz(3.087742031804801) q[2];
-cx q[0],q[2];
-rx(11.463959218522026) q[2];
-ry(pi/2) q[3];
-rx(pi) q[3];
-cx q[0],q[3];
-rz(3.087742031804801) q[3];
-cx q[0],q[3];
-cx q[1],q[3];
-rz(3.087742031804801) q[3];
-cx q[1],q[3];
-ry(pi/2) q[4];
-rx(pi) q[4];
-cx q[1],q[4];
-rz(3.087742031804801) q[4];
-cx q[1],q[4];
-cx q[3],q[4];
-rz(3.087742031804801) q[4];
-cx q[3],q[4];
-ry(pi/2) q[5];
-rx(pi) q[5];
-cx q[1],q[5];
-rz(3.087742031804801) q[5];
-cx q[1],q[5];
-cx q[3],q[5];
-rz(3.087742031804801) q[5];
-cx q[3],q[5];
-ry(pi/2) q[6];
-rx(pi) q[6];
-cx q[4],q[6];
-rz(3.087742031804801) q[6];
-cx q[4],q[6];
-cx q[5],q[6];
-rz(3.087742031804801) q[6];
-cx q[5],q[6];
-ry(pi/2) q[7];
-rx(pi) q[7];
-cx q[3],q[7];
-rz(3.087742031804801) q[7];
-cx q[3],q[7];
-cx q[4],q[7];
-rz(3.087742031804801) q[7];
-cx q[4],q[7];
-ry(pi/2) q[8];
-rx(pi) q[8];
-cx q[3],q[8];
-rz(3.087742031804801) q[8];
-cx q[3],q[8];
-cx q[5],q[8];
-rz(3.087742031804801) q[8];
-cx q[5],q[8];
-rx(11.463959218522026) q[8];
-ry(pi/2) q[9];
-rx(pi) q[9];
-cx q[1],q[9];
-rz(3.087742031804801) q[9];
-cx q[1],q[9];
-cx q[3],q[9];
-rz(3.087742031804801) q[9];
-cx q[3],q[9];
-ry(pi/2) q[10];
-rx(pi) q[10];
-cx q[4],q[10];
-rz(3.087742031804801) q[10];
-cx q[4],q[10];
-cx q[6],q[10];
-rz(3.087742031804801) q[10];
-cx q[6],q[10];
-rx(11.463959218522026) q[10];
-ry(pi/2) q[11];
-rx(pi) q[11];
-cx q[5],q[11];
-rz(3.087742031804801) q[11];
-cx q[5],q[11];
-cx q[6],q[11];
-rz(3.087742031804801) q[11];
-cx q[6],q[11];
-rx(11.463959218522026) q[11];
-ry(pi/2) q[12];
-rx(pi) q[12];
-cx q[3],q[12];
-rz(3.087742031804801) q[12];
-cx q[3],q[12];
-cx q[5],q[12];
-rz(3.087742031804801) q[12];
-cx q[5],q[12];
-ry(pi/2) q[13];
-rx(pi) q[13];
-cx q[4],q[13];
-rz(3.087742031804801) q[13];
-cx q[4],q[13];
-cx q[5],q[13];
-rz(3.087742031804801) q[13];
-cx q[5],q[13];
-rx(11.463959218522026) q[13];
-ry(pi/2) q[14];
-rx(pi) q[14];
-cx q[3],q[14];
-rz(3.087742031804801) q[14];
-cx q[3],q[14];
-cx q[4],q[14];
-rz(3.087742031804801) q[14];
-cx q[4],q[14];
-rx(11.463959218522026) q[14];
-ry(pi/2) q[15];
-rx(pi) q[15];
-cx q[0],q[15];
-rz(3.087742031804801) q[15];
-cx q[0],q[15];
-cx q[3],q[15];
-rz(3.087742031804801) q[15];
-cx q[3],q[15];
-ry(pi/2) q[16];
-rx(pi) q[16];
-cx q[0],q[16];
-rz(3.087742031804801) q[16];
-cx q[0],q[16];
-cx q[3],q[16];
-rz(3.087742031804801) q[16];
-cx q[3],q[16];
-rx(11.463959218522026) q[16];
-ry(pi/2) q[17];
-rx(pi) q[17];
-cx q[1],q[17];
-rz(3.087742031804801) q[17];
-cx q[1],q[17];
-cx q[3],q[17];
-rz(3.087742031804801) q[17];
-cx q[3],q[17];
-ry(pi/2) q[18];
-rx(pi) q[18];
-cx q[3],q[18];
-rz(3.087742031804801) q[18];
-cx q[3],q[18];
-cx q[4],q[18];
-rz(3.087742031804801) q[18];
-cx q[4],q[18];
-ry(pi/2) q[19];
-rx(pi) q[19];
-cx q[3],q[19];
-rz(3.087742031804801) q[19];
-cx q[3],q[19];
-cx q[7],q[19];
-rz(3.087742031804801) q[19];
-cx q[7],q[19];
-rx(11.463959218522026) q[7];
-rx(11.463959218522026) q[19];
-ry(pi/2) q[20];
-rx(pi) q[20];
-cx q[0],q[20];
-rz(3.087742031804801) q[20];
-cx q[0],q[20];
-cx q[15],q[20];
-rz(3.087742031804801) q[20];
-cx q[15],q[20];
-rx(11.463959218522026) q[20];
-ry(pi/2) q[21];
-rx(pi) q[21];
-cx q[4],q[21];
-rz(3.087742031804801) q[21];
-cx q[4],q[21];
-cx q[15],q[21];
-rz(3.087742031804801) q[21];
-cx q[15],q[21];
-rx(11.463959218522026) q[15];
-ry(pi/2) q[22];
-rx(pi) q[22];
-cx q[3],q[22];
-rz(3.087742031804801) q[22];
-cx q[3],q[22];
-cx q[9],q[22];
-rz(3.087742031804801) q[22];
-cx q[9],q[22];
-rx(11.463959218522026) q[9];
-rx(11.463959218522026) q[22];
-ry(pi/2) q[23];
-rx(pi) q[23];
-cx q[3],q[23];
-rz(3.087742031804801) q[23];
-cx q[3],q[23];
-cx q[17],q[23];
-rz(3.087742031804801) q[23];
-cx q[17],q[23];
-rx(11.463959218522026) q[17];
-rx(11.463959218522026) q[23];
-ry(pi/2) q[24];
-rx(pi) q[24];
-cx q[3],q[24];
-rz(3.087742031804801) q[24];
-cx q[3],q[24];
-cx q[5],q[24];
-rz(3.087742031804801) q[24];
-cx q[5],q[24];
-rx(11.463959218522026) q[24];
-ry(pi/2) q[25];
-rx(pi) q[25];
-cx q[3],q[25];
-rz(3.087742031804801) q[25];
-cx q[3],q[25];
-cx q[12],q[25];
-rz(3.087742031804801) q[25];
-cx q[12],q[25];
-rx(11.463959218522026) q[25];
-ry(pi/2) q[26];
-rx(pi) q[26];
-cx q[3],q[26];
-rz(3.087742031804801) q[26];
-cx q[3],q[26];
-cx q[21],q[26];
-rz(3.087742031804801) q[26];
-cx q[21],q[26];
-ry(pi/2) q[27];
-rx(pi) q[27];
-cx q[4],q[27];
-rz(3.087742031804801) q[27];
-cx q[4],q[27];
-rx(11.463959218522026) q[4];
-cx q[6],q[27];
-rz(3.087742031804801) q[27];
-cx q[6],q[27];
-rx(11.463959218522026) q[6];
-rx(11.463959218522026) q[27];
-ry(pi/2) q[28];
-rx(pi) q[28];
-cx q[1],q[28];
-rz(3.087742031804801) q[28];
-cx q[1],q[28];
-cx q[3],q[28];
-rz(3.087742031804801) q[28];
-cx q[3],q[28];
-rx(11.463959218522026) q[28];
-ry(pi/2) q[29];
-rx(pi) q[29];
-cx q[1],q[29];
-rz(3.087742031804801) q[29];
-cx q[1],q[29];
-rx(11.463959218522026) q[1];
-cx q[3],q[29];
-rz(3.087742031804801) q[29];
-cx q[3],q[29];
-rx(11.463959218522026) q[29];
-ry(pi/2) q[30];
-rx(pi) q[30];
-cx q[3],q[30];
-rz(3.087742031804801) q[30];
-cx q[3],q[30];
-rx(11.463959218522026) q[3];
-cx q[18],q[30];
-rz(3.087742031804801) q[30];
-cx q[18],q[30];
-rx(11.463959218522026) q[18];
-ry(pi/2) q[31];
-rx(pi) q[31];
-cx q[12],q[31];
-rz(3.087742031804801) q[31];
-cx q[12],q[31];
-rx(11.463959218522026) q[12];
-cx q[26],q[31];
-rz(3.087742031804801) q[31];
-cx q[26],q[31];
-rx(11.463959218522026) q[26];
-rx(11.463959218522026) q[31];
-ry(pi/2) q[32];
-rx(pi) q[32];
-cx q[0],q[32];
-rz(3.087742031804801) q[32];
-cx q[0],q[32];
-rx(11.463959218522026) q[0];
-cx q[0],q[1];
-rz(2.7978507441358462) q[1];
-cx q[0],q[1];
-cx q[0],q[2];
-rz(2.7978507441358462) q[2];
-cx q[0],q[2];
-cx q[0],q[3];
-rx(9.476348553449329) q[2];
-rz(2.7978507441358462) q[3];
-cx q[0],q[3];
-cx q[0],q[15];
-cx q[1],q[3];
-rz(2.7978507441358462) q[3];
-cx q[1],q[3];
-cx q[1],q[4];
-rz(2.7978507441358462) q[4];
-cx q[1],q[4];
-cx q[3],q[4];
-rz(2.7978507441358462) q[4];
-cx q[3],q[4];
-cx q[4],q[6];
-rz(2.7978507441358462) q[6];
-cx q[4],q[6];
-rz(2.7978507441358462) q[15];
-cx q[0],q[15];
-cx q[0],q[16];
-rz(2.7978507441358462) q[16];
-cx q[0],q[16];
-cx q[0],q[20];
-rz(2.7978507441358462) q[20];
-cx q[0],q[20];
-cx q[21],q[32];
-rz(3.087742031804801) q[32];
-cx q[21],q[32];
-rx(11.463959218522026) q[21];
-rx(11.463959218522026) q[32];
-cx q[0],q[32];
-rz(2.7978507441358462) q[32];
-cx q[0],q[32];
-rx(9.476348553449329) q[0];
-ry(pi/2) q[33];
-rx(pi) q[33];
-cx q[5],q[33];
-rz(3.087742031804801) q[33];
-cx q[5],q[33];
-rx(11.463959218522026) q[5];
-cx q[1],q[5];
-rz(2.7978507441358462) q[5];
-cx q[1],q[5];
-cx q[1],q[9];
-cx q[3],q[5];
-rz(2.7978507441358462) q[5];
-cx q[3],q[5];
-cx q[3],q[7];
-cx q[5],q[6];
-rz(2.7978507441358462) q[6];
-cx q[5],q[6];
-rz(2.7978507441358462) q[7];
-cx q[3],q[7];
-cx q[3],q[8];
-cx q[4],q[7];
-rz(2.7978507441358462) q[7];
-cx q[4],q[7];
-cx q[4],q[10];
-rz(2.7978507441358462) q[8];
-cx q[3],q[8];
-cx q[5],q[8];
-rz(2.7978507441358462) q[8];
-cx q[5],q[8];
-cx q[5],q[11];
-rx(9.476348553449329) q[8];
-rz(2.7978507441358462) q[9];
-cx q[1],q[9];
-cx q[1],q[17];
-cx q[3],q[9];
-rz(2.7978507441358462) q[9];
-cx q[3],q[9];
-cx q[3],q[12];
-rz(2.7978507441358462) q[10];
-cx q[4],q[10];
-cx q[4],q[13];
-cx q[6],q[10];
-rz(2.7978507441358462) q[10];
-cx q[6],q[10];
-rx(9.476348553449329) q[10];
-rz(2.7978507441358462) q[11];
-cx q[5],q[11];
-cx q[6],q[11];
-rz(2.7978507441358462) q[11];
-cx q[6],q[11];
-rx(9.476348553449329) q[11];
-rz(2.7978507441358462) q[12];
-cx q[3],q[12];
-cx q[3],q[14];
-cx q[5],q[12];
-rz(2.7978507441358462) q[12];
-cx q[5],q[12];
-rz(2.7978507441358462) q[13];
-cx q[4],q[13];
-cx q[5],q[13];
-rz(2.7978507441358462) q[13];
-cx q[5],q[13];
-rx(9.476348553449329) q[13];
-rz(2.7978507441358462) q[14];
-cx q[3],q[14];
-cx q[3],q[15];
-cx q[4],q[14];
-rz(2.7978507441358462) q[14];
-cx q[4],q[14];
-rx(9.476348553449329) q[14];
-rz(2.7978507441358462) q[15];
-cx q[3],q[15];
-cx q[3],q[16];
-cx q[15],q[20];
-rz(2.7978507441358462) q[16];
-cx q[3],q[16];
-rx(9.476348553449329) q[16];
-rz(2.7978507441358462) q[17];
-cx q[1],q[17];
-cx q[1],q[28];
-cx q[3],q[17];
-rz(2.7978507441358462) q[17];
-cx q[3],q[17];
-cx q[3],q[18];
-rz(2.7978507441358462) q[18];
-cx q[3],q[18];
-cx q[3],q[19];
-cx q[4],q[18];
-rz(2.7978507441358462) q[18];
-cx q[4],q[18];
-cx q[4],q[21];
-rz(2.7978507441358462) q[19];
-cx q[3],q[19];
-cx q[3],q[22];
-cx q[7],q[19];
-rz(2.7978507441358462) q[19];
-cx q[7],q[19];
-rx(9.476348553449329) q[7];
-rx(9.476348553449329) q[19];
-rz(2.7978507441358462) q[20];
-cx q[15],q[20];
-rx(9.476348553449329) q[20];
-rz(2.7978507441358462) q[21];
-cx q[4],q[21];
-cx q[4],q[27];
-cx q[15],q[21];
-rz(2.7978507441358462) q[21];
-cx q[15],q[21];
-rx(9.476348553449329) q[15];
-rz(2.7978507441358462) q[22];
-cx q[3],q[22];
-cx q[3],q[23];
-cx q[9],q[22];
-rz(2.7978507441358462) q[22];
-cx q[9],q[22];
-rx(9.476348553449329) q[9];
-rx(9.476348553449329) q[22];
-rz(2.7978507441358462) q[23];
-cx q[3],q[23];
-cx q[3],q[24];
-cx q[17],q[23];
-rz(2.7978507441358462) q[23];
-cx q[17],q[23];
-rx(9.476348553449329) q[17];
-rx(9.476348553449329) q[23];
-rz(2.7978507441358462) q[24];
-cx q[3],q[24];
-cx q[3],q[25];
-cx q[5],q[24];
-rz(2.7978507441358462) q[24];
-cx q[5],q[24];
-rx(9.476348553449329) q[24];
-rz(2.7978507441358462) q[25];
-cx q[3],q[25];
-cx q[3],q[26];
-cx q[12],q[25];
-rz(2.7978507441358462) q[25];
-cx q[12],q[25];
-cx q[12],q[31];
-rx(9.476348553449329) q[25];
-rz(2.7978507441358462) q[26];
-cx q[3],q[26];
-cx q[21],q[26];
-rz(2.7978507441358462) q[26];
-cx q[21],q[26];
-cx q[21],q[32];
-rz(2.7978507441358462) q[27];
-cx q[4],q[27];
-rx(9.476348553449329) q[4];
-cx q[6],q[27];
-rz(2.7978507441358462) q[27];
-cx q[6],q[27];
-rx(9.476348553449329) q[6];
-rx(9.476348553449329) q[27];
-rz(2.7978507441358462) q[28];
-cx q[1],q[28];
-cx q[1],q[29];
-cx q[3],q[28];
-rz(2.7978507441358462) q[28];
-cx q[3],q[28];
-rx(9.476348553449329) q[28];
-rz(2.7978507441358462) q[29];
-cx q[1],q[29];
-rx(9.476348553449329) q[1];
-cx q[0],q[1];
-rz(6.155032797901899) q[1];
-cx q[0],q[1];
-cx q[0],q[2];
-rz(6.155032797901899) q[2];
-cx q[0],q[2];
-rx(0.20053834648228228) q[2];
-cx q[3],q[29];
-rz(2.7978507441358462) q[29];
-cx q[3],q[29];
-rx(9.476348553449329) q[29];
-cx q[30],q[33];
-rz(2.7978507441358462) q[31];
-cx q[12],q[31];
-rx(9.476348553449329) q[12];
-cx q[26],q[31];
-rz(2.7978507441358462) q[31];
-cx q[26],q[31];
-rx(9.476348553449329) q[26];
-rx(9.476348553449329) q[31];
-rz(2.7978507441358462) q[32];
-cx q[21],q[32];
-rx(9.476348553449329) q[21];
-rx(9.476348553449329) q[32];
-rz(3.087742031804801) q[33];
-cx q[30],q[33];
-rx(11.463959218522026) q[30];
-cx q[3],q[30];
-rz(2.7978507441358462) q[30];
-cx q[3],q[30];
-rx(9.476348553449329) q[3];
-cx q[0],q[3];
-rz(6.155032797901899) q[3];
-cx q[0],q[3];
-cx q[0],q[15];
-cx q[1],q[3];
-rz(6.155032797901899) q[3];
-cx q[1],q[3];
-cx q[1],q[4];
-rz(6.155032797901899) q[4];
-cx q[1],q[4];
-cx q[3],q[4];
-rz(6.155032797901899) q[4];
-cx q[3],q[4];
-cx q[4],q[6];
-rz(6.155032797901899) q[6];
-cx q[4],q[6];
-rz(6.155032797901899) q[15];
-cx q[0],q[15];
-cx q[0],q[16];
-rz(6.155032797901899) q[16];
-cx q[0],q[16];
-cx q[0],q[20];
-cx q[18],q[30];
-rz(6.155032797901899) q[20];
-cx q[0],q[20];
-cx q[0],q[32];
-rz(2.7978507441358462) q[30];
-cx q[18],q[30];
-rx(9.476348553449329) q[18];
-rz(6.155032797901899) q[32];
-cx q[0],q[32];
-rx(0.20053834648228228) q[0];
-rx(11.463959218522026) q[33];
-cx q[5],q[33];
-rz(2.7978507441358462) q[33];
-cx q[5],q[33];
-rx(9.476348553449329) q[5];
-cx q[1],q[5];
-rz(6.155032797901899) q[5];
-cx q[1],q[5];
-cx q[1],q[9];
-cx q[3],q[5];
-rz(6.155032797901899) q[5];
-cx q[3],q[5];
-cx q[3],q[7];
-cx q[5],q[6];
-rz(6.155032797901899) q[6];
-cx q[5],q[6];
-rz(6.155032797901899) q[7];
-cx q[3],q[7];
-cx q[3],q[8];
-cx q[4],q[7];
-rz(6.155032797901899) q[7];
-cx q[4],q[7];
-cx q[4],q[10];
-rz(6.155032797901899) q[8];
-cx q[3],q[8];
-cx q[5],q[8];
-rz(6.155032797901899) q[8];
-cx q[5],q[8];
-cx q[5],q[11];
-rx(0.20053834648228228) q[8];
-rz(6.155032797901899) q[9];
-cx q[1],q[9];
-cx q[1],q[17];
-cx q[3],q[9];
-rz(6.155032797901899) q[9];
-cx q[3],q[9];
-cx q[3],q[12];
-rz(6.155032797901899) q[10];
-cx q[4],q[10];
-cx q[4],q[13];
-cx q[6],q[10];
-rz(6.155032797901899) q[10];
-cx q[6],q[10];
-rx(0.20053834648228228) q[10];
-rz(6.155032797901899) q[11];
-cx q[5],q[11];
-cx q[6],q[11];
-rz(6.155032797901899) q[11];
-cx q[6],q[11];
-rx(0.20053834648228228) q[11];
-rz(6.155032797901899) q[12];
-cx q[3],q[12];
-cx q[3],q[14];
-cx q[5],q[12];
-rz(6.155032797901899) q[12];
-cx q[5],q[12];
-rz(6.155032797901899) q[13];
-cx q[4],q[13];
-cx q[5],q[13];
-rz(6.155032797901899) q[13];
-cx q[5],q[13];
-rx(0.20053834648228228) q[13];
-rz(6.155032797901899) q[14];
-cx q[3],q[14];
-cx q[3],q[15];
-cx q[4],q[14];
-rz(6.155032797901899) q[14];
-cx q[4],q[14];
-rx(0.20053834648228228) q[14];
-rz(6.155032797901899) q[15];
-cx q[3],q[15];
-cx q[3],q[16];
-cx q[15],q[20];
-rz(6.155032797901899) q[16];
-cx q[3],q[16];
-rx(0.20053834648228228) q[16];
-rz(6.155032797901899) q[17];
-cx q[1],q[17];
-cx q[1],q[28];
-cx q[3],q[17];
-rz(6.155032797901899) q[17];
-cx q[3],q[17];
-cx q[3],q[18];
-rz(6.155032797901899) q[18];
-cx q[3],q[18];
-cx q[3],q[19];
-cx q[4],q[18];
-rz(6.155032797901899) q[18];
-cx q[4],q[18];
-cx q[4],q[21];
-rz(6.155032797901899) q[19];
-cx q[3],q[19];
-cx q[3],q[22];
-cx q[7],q[19];
-rz(6.155032797901899) q[19];
-cx q[7],q[19];
-rx(0.20053834648228228) q[7];
-rx(0.20053834648228228) q[19];
-rz(6.155032797901899) q[20];
-cx q[15],q[20];
-rx(0.20053834648228228) q[20];
-rz(6.155032797901899) q[21];
-cx q[4],q[21];
-cx q[4],q[27];
-cx q[15],q[21];
-rz(6.155032797901899) q[21];
-cx q[15],q[21];
-rx(0.20053834648228228) q[15];
-rz(6.155032797901899) q[22];
-cx q[3],q[22];
-cx q[3],q[23];
-cx q[9],q[22];
-rz(6.155032797901899) q[22];
-cx q[9],q[22];
-rx(0.20053834648228228) q[9];
-rx(0.20053834648228228) q[22];
-rz(6.155032797901899) q[23];
-cx q[3],q[23];
-cx q[3],q[24];
-cx q[17],q[23];
-rz(6.155032797901899) q[23];
-cx q[17],q[23];
-rx(0.20053834648228228) q[17];
-rx(0.20053834648228228) q[23];
-rz(6.155032797901899) q[24];
-cx q[3],q[24];
-cx q[3],q[25];
-cx q[5],q[24];
-rz(6.155032797901899) q[24];
-cx q[5],q[24];
-rx(0.20053834648228228) q[24];
-rz(6.155032797901899) q[25];
-cx q[3],q[25];
-cx q[3],q[26];
-cx q[12],q[25];
-rz(6.155032797901899) q[25];
-cx q[12],q[25];
-cx q[12],q[31];
-rx(0.20053834648228228) q[25];
-rz(6.155032797901899) q[26];
-cx q[3],q[26];
-cx q[21],q[26];
-rz(6.155032797901899) q[26];
-cx q[21],q[26];
-cx q[21],q[32];
-rz(6.155032797901899) q[27];
-cx q[4],q[27];
-rx(0.20053834648228228) q[4];
-cx q[6],q[27];
-rz(6.155032797901899) q[27];
-cx q[6],q[27];
-rx(0.20053834648228228) q[6];
-rx(0.20053834648228228) q[27];
-rz(6.155032797901899) q[28];
-cx q[1],q[28];
-cx q[1],q[29];
-cx q[3],q[28];
-rz(6.155032797901899) q[28];
-cx q[3],q[28];
-rx(0.20053834648228228) q[28];
-rz(6.155032797901899) q[29];
-cx q[1],q[29];
-rx(0.20053834648228228) q[1];
-cx q[3],q[29];
-rz(6.155032797901899) q[29];
-cx q[3],q[29];
-rx(0.20053834648228228) q[29];
-cx q[30],q[33];
-rz(6.155032797901899) q[31];
-cx q[12],q[31];
-rx(0.20053834648228228) q[12];
-cx q[26],q[31];
-rz(6.155032797901899) q[31];
-cx q[26],q[31];
-rx(0.20053834648228228) q[26];
-rx(0.20053834648228228) q[31];
-rz(6.155032797901899) q[32];
-cx q[21],q[32];
-rx(0.20053834648228228) q[21];
-rx(0.20053834648228228) q[32];
-rz(2.7978507441358462) q[33];
-cx q[30],q[33];
-rx(9.476348553449329) q[30];
-cx q[3],q[30];
-rz(6.155032797901899) q[30];
-cx q[3],q[30];
-rx(0.20053834648228228) q[3];
-cx q[18],q[30];
-rz(6.155032797901899) q[30];
-cx q[18],q[30];
-rx(0.20053834648228228) q[18];
-rx(9.476348553449329) q[33];
-cx q[5],q[33];
-rz(6.155032797901899) q[33];
-cx q[5],q[33];
-rx(0.20053834648228228) q[5];
-cx q[30],q[33];
-rz(6.155032797901899) q[33];
-cx q[30],q[33];
-rx(0.20053834648228228) q[30];
-rx(0.20053834648228228) q[33];
\ No newline at end of file
@@ -1,772 +0,0 @@
-OPENQASM 2.0;
-include "qelib1.inc";
-qreg q[35];
-ry(pi/2) q[0];
-rx(pi) q[0];
-ry(pi/2) q[1];
-rx(pi) q[1];
-cx q[0],q[1];
-rz(3.1411408097137756) q[1];
-cx q[0],q[1];
-ry(pi/2) q[2];
-rx(pi) q[2];
-cx q[0],q[2];
-rz(3.1411408097137756) q[2];
-cx q[0],q[2];
-rx(7.580695866087952) q[2];
-ry(pi/2) q[3];
-rx(pi) q[3];
-cx q[0],q[3];
-rz(3.1411408097137756) q[3];
-cx q[0],q[3];
-cx q[1],q[3];
-rz(3.1411408097137756) q[3];
-cx q[1],q[3];
-ry(pi/2) q[4];
-rx(pi) q[4];
-cx q[1],q[4];
-rz(3.1411408097137756) q[4];
-cx q[1],q[4];
-cx q[3],q[4];
-rz(3.1411408097137756) q[4];
-cx q[3],q[4];
-ry(pi/2) q[5];
-rx(pi) q[5];
-cx q[1],q[5];
-rz(3.1411408097137756) q[5];
-cx q[1],q[5];
-cx q[3],q[5];
-rz(3.1411408097137756) q[5];
-cx q[3],q[5];
-ry(pi/2) q[6];
-rx(pi) q[6];
-cx q[4],q[6];
-rz(3.1411408097137756) q[6];
-cx q[4],q[6];
-cx q[5],q[6];
-rz(3.1411408097137756) q[6];
-cx q[5],q[6];
-ry(pi/2) q[7];
-rx(pi) q[7];
-cx q[3],q[7];
-rz(3.1411408097137756) q[7];
-cx q[3],q[7];
-cx q[4],q[7];
-rz(3.1411408097137756) q[7];
-cx q[4],q[7];
-ry(pi/2) q[8];
-rx(pi) q[8];
-cx q[3],q[8];
-rz(3.1411408097137756) q[8];
-cx q[3],q[8];
-cx q[5],q[8];
-rz(3.1411408097137756) q[8];
-cx q[5],q[8];
-rx(7.580695866087952) q[8];
-ry(pi/2) q[9];
-rx(pi) q[9];
-cx q[1],q[9];
-rz(3.1411408097137756) q[9];
-cx q[1],q[9];
-cx q[3],q[9];
-rz(3.1411408097137756) q[9];
-cx q[3],q[9];
-ry(pi/2) q[10];
-rx(pi) q[10];
-cx q[4],q[10];
-rz(3.1411408097137756) q[10];
-cx q[4],q[10];
-cx q[6],q[10];
-rz(3.1411408097137756) q[10];
-cx q[6],q[10];
-rx(7.580695866087952) q[10];
-ry(pi/2) q[11];
-rx(pi) q[11];
-cx q[5],q[11];
-rz(3.1411408097137756) q[11];
-cx q[5],q[11];
-cx q[6],q[11];
-rz(3.1411408097137756) q[11];
-cx q[6],q[11];
-rx(7.580695866087952) q[11];
-ry(pi/2) q[12];
-rx(pi) q[12];
-cx q[3],q[12];
-rz(3.1411408097137756) q[12];
-cx q[3],q[12];
-cx q[5],q[12];
-rz(3.1411408097137756) q[12];
-cx q[5],q[12];
-ry(pi/2) q[13];
-rx(pi) q[13];
-cx q[4],q[13];
-rz(3.1411408097137756) q[13];
-cx q[4],q[13];
-cx q[5],q[13];
-rz(3.1411408097137756) q[13];
-cx q[5],q[13];
-rx(7.580695866087952) q[13];
-ry(pi/2) q[14];
-rx(pi) q[14];
-cx q[3],q[14];
-rz(3.1411408097137756) q[14];
-cx q[3],q[14];
-cx q[4],q[14];
-rz(3.1411408097137756) q[14];
-cx q[4],q[14];
-rx(7.580695866087952) q[14];
-ry(pi/2) q[15];
-rx(pi) q[15];
-cx q[0],q[15];
-rz(3.1411408097137756) q[15];
-cx q[0],q[15];
-cx q[3],q[15];
-rz(3.1411408097137756) q[15];
-cx q[3],q[15];
-ry(pi/2) q[16];
-rx(pi) q[16];
-cx q[0],q[16];
-rz(3.1411408097137756) q[16];
-cx q[0],q[16];
-cx q[3],q[16];
-rz(3.1411408097137756) q[16];
-cx q[3],q[16];
-rx(7.580695866087952) q[16];
-ry(pi/2) q[17];
-rx(pi) q[17];
-cx q[1],q[17];
-rz(3.1411408097137756) q[17];
-cx q[1],q[17];
-cx q[3],q[17];
-rz(3.1411408097137756) q[17];
-cx q[3],q[17];
-ry(pi/2) q[18];
-rx(pi) q[18];
-cx q[3],q[18];
-rz(3.1411408097137756) q[18];
-cx q[3],q[18];
-cx q[4],q[18];
-rz(3.1411408097137756) q[18];
-cx q[4],q[18];
-ry(pi/2) q[19];
-rx(pi) q[19];
-cx q[3],q[19];
-rz(3.1411408097137756) q[19];
-cx q[3],q[19];
-cx q[7],q[19];
-rz(3.1411408097137756) q[19];
-cx q[7],q[19];
-rx(7.580695866087952) q[7];
-rx(7.580695866087952) q[19];
-ry(pi/2) q[20];
-rx(pi) q[20];
-cx q[0],q[20];
-rz(3.1411408097137756) q[20];
-cx q[0],q[20];
-cx q[15],q[20];
-rz(3.1411408097137756) q[20];
-cx q[15],q[20];
-rx(7.580695866087952) q[20];
-ry(pi/2) q[21];
-rx(pi) q[21];
-cx q[4],q[21];
-rz(3.1411408097137756) q[21];
-cx q[4],q[21];
-cx q[15],q[21];
-rz(3.1411408097137756) q[21];
-cx q[15],q[21];
-rx(7.580695866087952) q[15];
-ry(pi/2) q[22];
-rx(pi) q[22];
-cx q[3],q[22];
-rz(3.1411408097137756) q[22];
-cx q[3],q[22];
-cx q[9],q[22];
-rz(3.1411408097137756) q[22];
-cx q[9],q[22];
-rx(7.580695866087952) q[9];
-rx(7.580695866087952) q[22];
-ry(pi/2) q[23];
-rx(pi) q[23];
-cx q[3],q[23];
-rz(3.1411408097137756) q[23];
-cx q[3],q[23];
-cx q[17],q[23];
-rz(3.1411408097137756) q[23];
-cx q[17],q[23];
-rx(7.580695866087952) q[17];
-rx(7.580695866087952) q[23];
-ry(pi/2) q[24];
-rx(pi) q[24];
-cx q[3],q[24];
-rz(3.1411408097137756) q[24];
-cx q[3],q[24];
-cx q[5],q[24];
-rz(3.1411408097137756) q[24];
-cx q[5],q[24];
-rx(7.580695866087952) q[24];
-ry(pi/2) q[25];
-rx(pi) q[25];
-cx q[3],q[25];
-rz(3.1411408097137756) q[25];
-cx q[3],q[25];
-cx q[12],q[25];
-rz(3.1411408097137756) q[25];
-cx q[12],q[25];
-rx(7.580695866087952) q[25];
-ry(pi/2) q[26];
-rx(pi) q[26];
-cx q[3],q[26];
-rz(3.1411408097137756) q[26];
-cx q[3],q[26];
-cx q[21],q[26];
-rz(3.1411408097137756) q[26];
-cx q[21],q[26];
-ry(pi/2) q[27];
-rx(pi) q[27];
-cx q[4],q[27];
-rz(3.1411408097137756) q[27];
-cx q[4],q[27];
-rx(7.580695866087952) q[4];
-cx q[6],q[27];
-rz(3.1411408097137756) q[27];
-cx q[6],q[27];
-rx(7.580695866087952) q[6];
-rx(7.580695866087952) q[27];
-ry(pi/2) q[28];
-rx(pi) q[28];
-cx q[1],q[28];
-rz(3.1411408097137756) q[28];
-cx q[1],q[28];
-cx q[3],q[28];
-rz(3.1411408097137756) q[28];
-cx q[3],q[28];
-rx(7.580695866087952) q[28];
-ry(pi/2) q[29];
-rx(pi) q[29];
-cx q[1],q[29];
-rz(3.1411408097137756) q[29];
-cx q[1],q[29];
-rx(7.580695866087952) q[1];
-cx q[3],q[29];
-rz(3.1411408097137756) q[29];
-cx q[3],q[29];
-rx(7.580695866087952) q[29];
-ry(pi/2) q[30];
-rx(pi) q[30];
-cx q[3],q[30];
-rz(3.1411408097137756) q[30];
-cx q[3],q[30];
-cx q[18],q[30];
-rz(3.1411408097137756) q[30];
-cx q[18],q[30];
-rx(7.580695866087952) q[18];
-ry(pi/2) q[31];
-rx(pi) q[31];
-cx q[12],q[31];
-rz(3.1411408097137756) q[31];
-cx q[12],q[31];
-cx q[26],q[31];
-rz(3.1411408097137756) q[31];
-cx q[26],q[31];
-rx(7.580695866087952) q[26];
-rx(7.580695866087952) q[31];
-ry(pi/2) q[32];
-rx(pi) q[32];
-cx q[0],q[32];
-rz(3.1411408097137756) q[32];
-cx q[0],q[32];
-rx(7.580695866087952) q[0];
-cx q[0],q[1];
-rz(1.6113824297032528) q[1];
-cx q[0],q[1];
-cx q[0],q[2];
-rz(1.6113824297032528) q[2];
-cx q[0],q[2];
-rx(1.592761098264021) q[2];
-cx q[21],q[32];
-rz(3.1411408097137756) q[32];
-cx q[21],q[32];
-rx(7.580695866087952) q[21];
-rx(7.580695866087952) q[32];
-ry(pi/2) q[33];
-rx(pi) q[33];
-cx q[5],q[33];
-rz(3.1411408097137756) q[33];
-cx q[5],q[33];
-rx(7.580695866087952) q[5];
-cx q[30],q[33];
-rz(3.1411408097137756) q[33];
-cx q[30],q[33];
-rx(7.580695866087952) q[30];
-rx(7.580695866087952) q[33];
-ry(pi/2) q[34];
-rx(pi) q[34];
-cx q[3],q[34];
-rz(3.1411408097137756) q[34];
-cx q[3],q[34];
-rx(7.580695866087952) q[3];
-cx q[0],q[3];
-rz(1.6113824297032528) q[3];
-cx q[0],q[3];
-cx q[0],q[15];
-cx q[1],q[3];
-rz(1.6113824297032528) q[3];
-cx q[1],q[3];
-cx q[1],q[4];
-rz(1.6113824297032528) q[4];
-cx q[1],q[4];
-cx q[1],q[5];
-cx q[3],q[4];
-rz(1.6113824297032528) q[4];
-cx q[3],q[4];
-cx q[4],q[6];
-rz(1.6113824297032528) q[5];
-cx q[1],q[5];
-cx q[1],q[9];
-cx q[3],q[5];
-rz(1.6113824297032528) q[5];
-cx q[3],q[5];
-cx q[3],q[7];
-rz(1.6113824297032528) q[6];
-cx q[4],q[6];
-cx q[5],q[6];
-rz(1.6113824297032528) q[6];
-cx q[5],q[6];
-rz(1.6113824297032528) q[7];
-cx q[3],q[7];
-cx q[3],q[8];
-cx q[4],q[7];
-rz(1.6113824297032528) q[7];
-cx q[4],q[7];
-cx q[4],q[10];
-rz(1.6113824297032528) q[8];
-cx q[3],q[8];
-cx q[5],q[8];
-rz(1.6113824297032528) q[8];
-cx q[5],q[8];
-cx q[5],q[11];
-rx(1.592761098264021) q[8];
-rz(1.6113824297032528) q[9];
-cx q[1],q[9];
-cx q[1],q[17];
-cx q[3],q[9];
-rz(1.6113824297032528) q[9];
-cx q[3],q[9];
-rz(1.6113824297032528) q[10];
-cx q[4],q[10];
-cx q[4],q[13];
-cx q[6],q[10];
-rz(1.6113824297032528) q[10];
-cx q[6],q[10];
-rx(1.592761098264021) q[10];
-rz(1.6113824297032528) q[11];
-cx q[5],q[11];
-cx q[6],q[11];
-rz(1.6113824297032528) q[11];
-cx q[6],q[11];
-rx(1.592761098264021) q[11];
-cx q[12],q[34];
-rz(1.6113824297032528) q[13];
-cx q[4],q[13];
-rz(1.6113824297032528) q[15];
-cx q[0],q[15];
-cx q[0],q[16];
-rz(1.6113824297032528) q[16];
-cx q[0],q[16];
-cx q[0],q[20];
-rz(1.6113824297032528) q[17];
-cx q[1],q[17];
-cx q[1],q[28];
-rz(1.6113824297032528) q[20];
-cx q[0],q[20];
-cx q[0],q[32];
-rz(1.6113824297032528) q[28];
-cx q[1],q[28];
-cx q[1],q[29];
-rz(1.6113824297032528) q[29];
-cx q[1],q[29];
-rx(1.592761098264021) q[1];
-rz(1.6113824297032528) q[32];
-cx q[0],q[32];
-rx(1.592761098264021) q[0];
-cx q[0],q[1];
-rz(1.8160343317678356) q[1];
-cx q[0],q[1];
-cx q[0],q[2];
-rz(1.8160343317678356) q[2];
-cx q[0],q[2];
-rx(9.837111324125107) q[2];
-rz(3.1411408097137756) q[34];
-cx q[12],q[34];
-rx(7.580695866087952) q[12];
-cx q[3],q[12];
-rz(1.6113824297032528) q[12];
-cx q[3],q[12];
-cx q[3],q[14];
-cx q[5],q[12];
-rz(1.6113824297032528) q[12];
-cx q[5],q[12];
-cx q[5],q[13];
-rz(1.6113824297032528) q[13];
-cx q[5],q[13];
-rx(1.592761098264021) q[13];
-rz(1.6113824297032528) q[14];
-cx q[3],q[14];
-cx q[3],q[15];
-cx q[4],q[14];
-rz(1.6113824297032528) q[14];
-cx q[4],q[14];
-rx(1.592761098264021) q[14];
-rz(1.6113824297032528) q[15];
-cx q[3],q[15];
-cx q[3],q[16];
-cx q[15],q[20];
-rz(1.6113824297032528) q[16];
-cx q[3],q[16];
-cx q[3],q[17];
-rx(1.592761098264021) q[16];
-rz(1.6113824297032528) q[17];
-cx q[3],q[17];
-cx q[3],q[18];
-rz(1.6113824297032528) q[18];
-cx q[3],q[18];
-cx q[3],q[19];
-cx q[4],q[18];
-rz(1.6113824297032528) q[18];
-cx q[4],q[18];
-cx q[4],q[21];
-rz(1.6113824297032528) q[19];
-cx q[3],q[19];
-cx q[3],q[22];
-cx q[7],q[19];
-rz(1.6113824297032528) q[19];
-cx q[7],q[19];
-rx(1.592761098264021) q[7];
-rx(1.592761098264021) q[19];
-rz(1.6113824297032528) q[20];
-cx q[15],q[20];
-rx(1.592761098264021) q[20];
-rz(1.6113824297032528) q[21];
-cx q[4],q[21];
-cx q[4],q[27];
-cx q[15],q[21];
-rz(1.6113824297032528) q[21];
-cx q[15],q[21];
-rx(1.592761098264021) q[15];
-rz(1.6113824297032528) q[22];
-cx q[3],q[22];
-cx q[3],q[23];
-cx q[9],q[22];
-rz(1.6113824297032528) q[22];
-cx q[9],q[22];
-rx(1.592761098264021) q[9];
-rx(1.592761098264021) q[22];
-rz(1.6113824297032528) q[23];
-cx q[3],q[23];
-cx q[3],q[24];
-cx q[17],q[23];
-rz(1.6113824297032528) q[23];
-cx q[17],q[23];
-rx(1.592761098264021) q[17];
-rx(1.592761098264021) q[23];
-rz(1.6113824297032528) q[24];
-cx q[3],q[24];
-cx q[3],q[25];
-cx q[5],q[24];
-rz(1.6113824297032528) q[24];
-cx q[5],q[24];
-cx q[5],q[33];
-rx(1.592761098264021) q[24];
-rz(1.6113824297032528) q[25];
-cx q[3],q[25];
-cx q[3],q[26];
-cx q[12],q[25];
-rz(1.6113824297032528) q[25];
-cx q[12],q[25];
-cx q[12],q[31];
-rx(1.592761098264021) q[25];
-rz(1.6113824297032528) q[26];
-cx q[3],q[26];
-cx q[3],q[28];
-cx q[21],q[26];
-rz(1.6113824297032528) q[26];
-cx q[21],q[26];
-cx q[21],q[32];
-rz(1.6113824297032528) q[27];
-cx q[4],q[27];
-rx(1.592761098264021) q[4];
-cx q[6],q[27];
-rz(1.6113824297032528) q[27];
-cx q[6],q[27];
-rx(1.592761098264021) q[6];
-rx(1.592761098264021) q[27];
-rz(1.6113824297032528) q[28];
-cx q[3],q[28];
-cx q[3],q[29];
-rx(1.592761098264021) q[28];
-rz(1.6113824297032528) q[29];
-cx q[3],q[29];
-cx q[3],q[30];
-rx(1.592761098264021) q[29];
-rz(1.6113824297032528) q[30];
-cx q[3],q[30];
-cx q[18],q[30];
-rz(1.6113824297032528) q[30];
-cx q[18],q[30];
-rx(1.592761098264021) q[18];
-rz(1.6113824297032528) q[31];
-cx q[12],q[31];
-cx q[26],q[31];
-rz(1.6113824297032528) q[31];
-cx q[26],q[31];
-rx(1.592761098264021) q[26];
-rx(1.592761098264021) q[31];
-rz(1.6113824297032528) q[32];
-cx q[21],q[32];
-rx(1.592761098264021) q[21];
-rx(1.592761098264021) q[32];
-rz(1.6113824297032528) q[33];
-cx q[5],q[33];
-rx(1.592761098264021) q[5];
-cx q[30],q[33];
-rz(1.6113824297032528) q[33];
-cx q[30],q[33];
-rx(1.592761098264021) q[30];
-rx(1.592761098264021) q[33];
-rx(7.580695866087952) q[34];
-cx q[3],q[34];
-rz(1.6113824297032528) q[34];
-cx q[3],q[34];
-rx(1.592761098264021) q[3];
-cx q[0],q[3];
-rz(1.8160343317678356) q[3];
-cx q[0],q[3];
-cx q[0],q[15];
-cx q[1],q[3];
-rz(1.8160343317678356) q[3];
-cx q[1],q[3];
-cx q[1],q[4];
-rz(1.8160343317678356) q[4];
-cx q[1],q[4];
-cx q[1],q[5];
-cx q[3],q[4];
-rz(1.8160343317678356) q[4];
-cx q[3],q[4];
-cx q[4],q[6];
-rz(1.8160343317678356) q[5];
-cx q[1],q[5];
-cx q[1],q[9];
-cx q[3],q[5];
-rz(1.8160343317678356) q[5];
-cx q[3],q[5];
-cx q[3],q[7];
-rz(1.8160343317678356) q[6];
-cx q[4],q[6];
-cx q[5],q[6];
-rz(1.8160343317678356) q[6];
-cx q[5],q[6];
-rz(1.8160343317678356) q[7];
-cx q[3],q[7];
-cx q[3],q[8];
-cx q[4],q[7];
-rz(1.8160343317678356) q[7];
-cx q[4],q[7];
-cx q[4],q[10];
-rz(1.8160343317678356) q[8];
-cx q[3],q[8];
-cx q[5],q[8];
-rz(1.8160343317678356) q[8];
-cx q[5],q[8];
-cx q[5],q[11];
-rx(9.837111324125107) q[8];
-rz(1.8160343317678356) q[9];
-cx q[1],q[9];
-cx q[1],q[17];
-cx q[3],q[9];
-rz(1.8160343317678356) q[9];
-cx q[3],q[9];
-rz(1.8160343317678356) q[10];
-cx q[4],q[10];
-cx q[4],q[13];
-cx q[6],q[10];
-rz(1.8160343317678356) q[10];
-cx q[6],q[10];
-rx(9.837111324125107) q[10];
-rz(1.8160343317678356) q[11];
-cx q[5],q[11];
-cx q[6],q[11];
-rz(1.8160343317678356) q[11];
-cx q[6],q[11];
-rx(9.837111324125107) q[11];
-cx q[12],q[34];
-rz(1.8160343317678356) q[13];
-cx q[4],q[13];
-rz(1.8160343317678356) q[15];
-cx q[0],q[15];
-cx q[0],q[16];
-rz(1.8160343317678356) q[16];
-cx q[0],q[16];
-cx q[0],q[20];
-rz(1.8160343317678356) q[17];
-cx q[1],q[17];
-cx q[1],q[28];
-rz(1.8160343317678356) q[20];
-cx q[0],q[20];
-cx q[0],q[32];
-rz(1.8160343317678356) q[28];
-cx q[1],q[28];
-cx q[1],q[29];
-rz(1.8160343317678356) q[29];
-cx q[1],q[29];
-rx(9.837111324125107) q[1];
-rz(1.8160343317678356) q[32];
-cx q[0],q[32];
-rx(9.837111324125107) q[0];
-rz(1.6113824297032528) q[34];
-cx q[12],q[34];
-rx(1.592761098264021) q[12];
-cx q[3],q[12];
-rz(1.8160343317678356) q[12];
-cx q[3],q[12];
-cx q[3],q[14];
-cx q[5],q[12];
-rz(1.8160343317678356) q[12];
-cx q[5],q[12];
-cx q[5],q[13];
-rz(1.8160343317678356) q[13];
-cx q[5],q[13];
-rx(9.837111324125107) q[13];
-rz(1.8160343317678356) q[14];
-cx q[3],q[14];
-cx q[3],q[15];
-cx q[4],q[14];
-rz(1.8160343317678356) q[14];
-cx q[4],q[14];
-rx(9.837111324125107) q[14];
-rz(1.8160343317678356) q[15];
-cx q[3],q[15];
-cx q[3],q[16];
-cx q[15],q[20];
-rz(1.8160343317678356) q[16];
-cx q[3],q[16];
-cx q[3],q[17];
-rx(9.837111324125107) q[16];
-rz(1.8160343317678356) q[17];
-cx q[3],q[17];
-cx q[3],q[18];
-rz(1.8160343317678356) q[18];
-cx q[3],q[18];
-cx q[3],q[19];
-cx q[4],q[18];
-rz(1.8160343317678356) q[18];
-cx q[4],q[18];
-cx q[4],q[21];
-rz(1.8160343317678356) q[19];
-cx q[3],q[19];
-cx q[3],q[22];
-cx q[7],q[19];
-rz(1.8160343317678356) q[19];
-cx q[7],q[19];
-rx(9.837111324125107) q[7];
-rx(9.837111324125107) q[19];
-rz(1.8160343317678356) q[20];
-cx q[15],q[20];
-rx(9.837111324125107) q[20];
-rz(1.8160343317678356) q[21];
-cx q[4],q[21];
-cx q[4],q[27];
-cx q[15],q[21];
-rz(1.8160343317678356) q[21];
-cx q[15],q[21];
-rx(9.837111324125107) q[15];
-rz(1.8160343317678356) q[22];
-cx q[3],q[22];
-cx q[3],q[23];
-cx q[9],q[22];
-rz(1.8160343317678356) q[22];
-cx q[9],q[22];
-rx(9.837111324125107) q[9];
-rx(9.837111324125107) q[22];
-rz(1.8160343317678356) q[23];
-cx q[3],q[23];
-cx q[3],q[24];
-cx q[17],q[23];
-rz(1.8160343317678356) q[23];
-cx q[17],q[23];
-rx(9.837111324125107) q[17];
-rx(9.837111324125107) q[23];
-rz(1.8160343317678356) q[24];
-cx q[3],q[24];
-cx q[3],q[25];
-cx q[5],q[24];
-rz(1.8160343317678356) q[24];
-cx q[5],q[24];
-cx q[5],q[33];
-rx(9.837111324125107) q[24];
-rz(1.8160343317678356) q[25];
-cx q[3],q[25];
-cx q[3],q[26];
-cx q[12],q[25];
-rz(1.8160343317678356) q[25];
-cx q[12],q[25];
-cx q[12],q[31];
-rx(9.837111324125107) q[25];
-rz(1.8160343317678356) q[26];
-cx q[3],q[26];
-cx q[3],q[28];
-cx q[21],q[26];
-rz(1.8160343317678356) q[26];
-cx q[21],q[26];
-cx q[21],q[32];
-rz(1.8160343317678356) q[27];
-cx q[4],q[27];
-rx(9.837111324125107) q[4];
-cx q[6],q[27];
-rz(1.8160343317678356) q[27];
-cx q[6],q[27];
-rx(9.837111324125107) q[6];
-rx(9.837111324125107) q[27];
-rz(1.8160343317678356) q[28];
-cx q[3],q[28];
-cx q[3],q[29];
-rx(9.837111324125107) q[28];
-rz(1.8160343317678356) q[29];
-cx q[3],q[29];
-cx q[3],q[30];
-rx(9.837111324125107) q[29];
-rz(1.8160343317678356) q[30];
-cx q[3],q[30];
-cx q[18],q[30];
-rz(1.8160343317678356) q[30];
-cx q[18],q[30];
-rx(9.837111324125107) q[18];
-rz(1.8160343317678356) q[31];
-cx q[12],q[31];
-cx q[26],q[31];
-rz(1.8160343317678356) q[31];
-cx q[26],q[31];
-rx(9.837111324125107) q[26];
-rx(9.837111324125107) q[31];
-rz(1.8160343317678356) q[32];
-cx q[21],q[32];
-rx(9.837111324125107) q[21];
-rx(9.837111324125107) q[32];
-rz(1.8160343317678356) q[33];
-cx q[5],q[33];
-rx(9.837111324125107) q[5];
-cx q[30],q[33];
-rz(1.8160343317678356) q[33];
-cx q[30],q[33];
-rx(9.837111324125107) q[30];
-rx(9.837111324125107) q[33];
-rx(1.592761098264021) q[34];
-cx q[3],q[34];
-rz(1.8160343317678356) q[34];
-cx q[3],q[34];
-rx(9.837111324125107) q[3];
-cx q[12],q[34];
-rz(1.8160343317678356) q[34];
-cx q[12],q[34];
-rx(9.837111324125107) q[12];
-rx(9.837111324125107) q[34];
\ No newline at end of file
@@ -1,795 +0,0 @@
-OPENQASM 2.0;
-include "qelib1.inc";
-qreg q[36];
-ry(pi/2) q[0];
-rx(pi) q[0];
-ry(pi/2) q[1];
-rx(pi) q[1];
-cx q[0],q[1];
-rz(0.01944416774051989) q[1];
-cx q[0],q[1];
-ry(pi/2) q[2];
-rx(pi) q[2];
-cx q[0],q[2];
-rz(0.01944416774051989) q[2];
-cx q[0],q[2];
-rx(1.3150703795195686) q[2];
-ry(pi/2) q[3];
-rx(pi) q[3];
-cx q[0],q[3];
-rz(0.01944416774051989) q[3];
-cx q[0],q[3];
-cx q[1],q[3];
-rz(0.01944416774051989) q[3];
-cx q[1],q[3];
-ry(pi/2) q[4];
-rx(pi) q[4];
-cx q[1],q[4];
-rz(0.01944416774051989) q[4];
-cx q[1],q[4];
-cx q[3],q[4];
-rz(0.01944416774051989) q[4];
-cx q[3],q[4];
-ry(pi/2) q[5];
-rx(pi) q[5];
-cx q[1],q[5];
-rz(0.01944416774051989) q[5];
-cx q[1],q[5];
-cx q[3],q[5];
-rz(0.01944416774051989) q[5];
-cx q[3],q[5];
-ry(pi/2) q[6];
-rx(pi) q[6];
-cx q[4],q[6];
-rz(0.01944416774051989) q[6];
-cx q[4],q[6];
-cx q[5],q[6];
-rz(0.01944416774051989) q[6];
-cx q[5],q[6];
-ry(pi/2) q[7];
-rx(pi) q[7];
-cx q[3],q[7];
-rz(0.01944416774051989) q[7];
-cx q[3],q[7];
-cx q[4],q[7];
-rz(0.01944416774051989) q[7];
-cx q[4],q[7];
-ry(pi/2) q[8];
-rx(pi) q[8];
-cx q[3],q[8];
-rz(0.01944416774051989) q[8];
-cx q[3],q[8];
-cx q[5],q[8];
-rz(0.01944416774051989) q[8];
-cx q[5],q[8];
-rx(1.3150703795195686) q[8];
-ry(pi/2) q[9];
-rx(pi) q[9];
-cx q[1],q[9];
-rz(0.01944416774051989) q[9];
-cx q[1],q[9];
-cx q[3],q[9];
-rz(0.01944416774051989) q[9];
-cx q[3],q[9];
-ry(pi/2) q[10];
-rx(pi) q[10];
-cx q[4],q[10];
-rz(0.01944416774051989) q[10];
-cx q[4],q[10];
-cx q[6],q[10];
-rz(0.01944416774051989) q[10];
-cx q[6],q[10];
-rx(1.3150703795195686) q[10];
-ry(pi/2) q[11];
-rx(pi) q[11];
-cx q[5],q[11];
-rz(0.01944416774051989) q[11];
-cx q[5],q[11];
-cx q[6],q[11];
-rz(0.01944416774051989) q[11];
-cx q[6],q[11];
-rx(1.3150703795195686) q[11];
-ry(pi/2) q[12];
-rx(pi) q[12];
-cx q[3],q[12];
-rz(0.01944416774051989) q[12];
-cx q[3],q[12];
-cx q[5],q[12];
-rz(0.01944416774051989) q[12];
-cx q[5],q[12];
-ry(pi/2) q[13];
-rx(pi) q[13];
-cx q[4],q[13];
-rz(0.01944416774051989) q[13];
-cx q[4],q[13];
-cx q[5],q[13];
-rz(0.01944416774051989) q[13];
-cx q[5],q[13];
-rx(1.3150703795195686) q[13];
-ry(pi/2) q[14];
-rx(pi) q[14];
-cx q[3],q[14];
-rz(0.01944416774051989) q[14];
-cx q[3],q[14];
-cx q[4],q[14];
-rz(0.01944416774051989) q[14];
-cx q[4],q[14];
-rx(1.3150703795195686) q[14];
-ry(pi/2) q[15];
-rx(pi) q[15];
-cx q[0],q[15];
-rz(0.01944416774051989) q[15];
-cx q[0],q[15];
-cx q[3],q[15];
-rz(0.01944416774051989) q[15];
-cx q[3],q[15];
-ry(pi/2) q[16];
-rx(pi) q[16];
-cx q[0],q[16];
-rz(0.01944416774051989) q[16];
-cx q[0],q[16];
-cx q[3],q[16];
-rz(0.01944416774051989) q[16];
-cx q[3],q[16];
-rx(1.3150703795195686) q[16];
-ry(pi/2) q[17];
-rx(pi) q[17];
-cx q[1],q[17];
-rz(0.01944416774051989) q[17];
-cx q[1],q[17];
-cx q[3],q[17];
-rz(0.01944416774051989) q[17];
-cx q[3],q[17];
-ry(pi/2) q[18];
-rx(pi) q[18];
-cx q[3],q[18];
-rz(0.01944416774051989) q[18];
-cx q[3],q[18];
-cx q[4],q[18];
-rz(0.01944416774051989) q[18];
-cx q[4],q[18];
-ry(pi/2) q[19];
-rx(pi) q[19];
-cx q[3],q[19];
-rz(0.01944416774051989) q[19];
-cx q[3],q[19];
-cx q[7],q[19];
-rz(0.01944416774051989) q[19];
-cx q[7],q[19];
-rx(1.3150703795195686) q[7];
-rx(1.3150703795195686) q[19];
-ry(pi/2) q[20];
-rx(pi) q[20];
-cx q[0],q[20];
-rz(0.01944416774051989) q[20];
-cx q[0],q[20];
-cx q[15],q[20];
-rz(0.01944416774051989) q[20];
-cx q[15],q[20];
-rx(1.3150703795195686) q[20];
-ry(pi/2) q[21];
-rx(pi) q[21];
-cx q[4],q[21];
-rz(0.01944416774051989) q[21];
-cx q[4],q[21];
-cx q[15],q[21];
-rz(0.01944416774051989) q[21];
-cx q[15],q[21];
-rx(1.3150703795195686) q[15];
-ry(pi/2) q[22];
-rx(pi) q[22];
-cx q[3],q[22];
-rz(0.01944416774051989) q[22];
-cx q[3],q[22];
-cx q[9],q[22];
-rz(0.01944416774051989) q[22];
-cx q[9],q[22];
-rx(1.3150703795195686) q[9];
-rx(1.3150703795195686) q[22];
-ry(pi/2) q[23];
-rx(pi) q[23];
-cx q[3],q[23];
-rz(0.01944416774051989) q[23];
-cx q[3],q[23];
-cx q[17],q[23];
-rz(0.01944416774051989) q[23];
-cx q[17],q[23];
-rx(1.3150703795195686) q[17];
-rx(1.3150703795195686) q[23];
-ry(pi/2) q[24];
-rx(pi) q[24];
-cx q[3],q[24];
-rz(0.01944416774051989) q[24];
-cx q[3],q[24];
-cx q[5],q[24];
-rz(0.01944416774051989) q[24];
-cx q[5],q[24];
-rx(1.3150703795195686) q[24];
-ry(pi/2) q[25];
-rx(pi) q[25];
-cx q[3],q[25];
-rz(0.01944416774051989) q[25];
-cx q[3],q[25];
-cx q[12],q[25];
-rz(0.01944416774051989) q[25];
-cx q[12],q[25];
-rx(1.3150703795195686) q[25];
-ry(pi/2) q[26];
-rx(pi) q[26];
-cx q[3],q[26];
-rz(0.01944416774051989) q[26];
-cx q[3],q[26];
-cx q[21],q[26];
-rz(0.01944416774051989) q[26];
-cx q[21],q[26];
-ry(pi/2) q[27];
-rx(pi) q[27];
-cx q[4],q[27];
-rz(0.01944416774051989) q[27];
-cx q[4],q[27];
-rx(1.3150703795195686) q[4];
-cx q[6],q[27];
-rz(0.01944416774051989) q[27];
-cx q[6],q[27];
-rx(1.3150703795195686) q[6];
-rx(1.3150703795195686) q[27];
-ry(pi/2) q[28];
-rx(pi) q[28];
-cx q[1],q[28];
-rz(0.01944416774051989) q[28];
-cx q[1],q[28];
-cx q[3],q[28];
-rz(0.01944416774051989) q[28];
-cx q[3],q[28];
-rx(1.3150703795195686) q[28];
-ry(pi/2) q[29];
-rx(pi) q[29];
-cx q[1],q[29];
-rz(0.01944416774051989) q[29];
-cx q[1],q[29];
-rx(1.3150703795195686) q[1];
-cx q[3],q[29];
-rz(0.01944416774051989) q[29];
-cx q[3],q[29];
-rx(1.3150703795195686) q[29];
-ry(pi/2) q[30];
-rx(pi) q[30];
-cx q[3],q[30];
-rz(0.01944416774051989) q[30];
-cx q[3],q[30];
-cx q[18],q[30];
-rz(0.01944416774051989) q[30];
-cx q[18],q[30];
-rx(1.3150703795195686) q[18];
-ry(pi/2) q[31];
-rx(pi) q[31];
-cx q[12],q[31];
-rz(0.01944416774051989) q[31];
-cx q[12],q[31];
-cx q[26],q[31];
-rz(0.01944416774051989) q[31];
-cx q[26],q[31];
-rx(1.3150703795195686) q[26];
-rx(1.3150703795195686) q[31];
-ry(pi/2) q[32];
-rx(pi) q[32];
-cx q[0],q[32];
-rz(0.01944416774051989) q[32];
-cx q[0],q[32];
-rx(1.3150703795195686) q[0];
-cx q[0],q[1];
-rz(2.676595448543915) q[1];
-cx q[0],q[1];
-cx q[0],q[2];
-rz(2.676595448543915) q[2];
-cx q[0],q[2];
-rx(8.516644460761265) q[2];
-cx q[21],q[32];
-rz(0.01944416774051989) q[32];
-cx q[21],q[32];
-rx(1.3150703795195686) q[21];
-ry(pi/2) q[33];
-rx(pi) q[33];
-cx q[5],q[33];
-rz(0.01944416774051989) q[33];
-cx q[5],q[33];
-rx(1.3150703795195686) q[5];
-cx q[30],q[33];
-rz(0.01944416774051989) q[33];
-cx q[30],q[33];
-rx(1.3150703795195686) q[30];
-rx(1.3150703795195686) q[33];
-ry(pi/2) q[34];
-rx(pi) q[34];
-cx q[3],q[34];
-rz(0.01944416774051989) q[34];
-cx q[3],q[34];
-cx q[12],q[34];
-rz(0.01944416774051989) q[34];
-cx q[12],q[34];
-rx(1.3150703795195686) q[12];
-rx(1.3150703795195686) q[34];
-ry(pi/2) q[35];
-rx(pi) q[35];
-cx q[3],q[35];
-rz(0.01944416774051989) q[35];
-cx q[3],q[35];
-rx(1.3150703795195686) q[3];
-cx q[0],q[3];
-rz(2.676595448543915) q[3];
-cx q[0],q[3];
-cx q[0],q[15];
-cx q[1],q[3];
-rz(2.676595448543915) q[3];
-cx q[1],q[3];
-cx q[1],q[4];
-rz(2.676595448543915) q[4];
-cx q[1],q[4];
-cx q[1],q[5];
-cx q[3],q[4];
-rz(2.676595448543915) q[4];
-cx q[3],q[4];
-cx q[4],q[6];
-rz(2.676595448543915) q[5];
-cx q[1],q[5];
-cx q[1],q[9];
-cx q[3],q[5];
-rz(2.676595448543915) q[5];
-cx q[3],q[5];
-cx q[3],q[7];
-rz(2.676595448543915) q[6];
-cx q[4],q[6];
-cx q[5],q[6];
-rz(2.676595448543915) q[6];
-cx q[5],q[6];
-rz(2.676595448543915) q[7];
-cx q[3],q[7];
-cx q[3],q[8];
-cx q[4],q[7];
-rz(2.676595448543915) q[7];
-cx q[4],q[7];
-cx q[4],q[10];
-rz(2.676595448543915) q[8];
-cx q[3],q[8];
-cx q[5],q[8];
-rz(2.676595448543915) q[8];
-cx q[5],q[8];
-cx q[5],q[11];
-rx(8.516644460761265) q[8];
-rz(2.676595448543915) q[9];
-cx q[1],q[9];
-cx q[1],q[17];
-cx q[3],q[9];
-rz(2.676595448543915) q[9];
-cx q[3],q[9];
-cx q[3],q[12];
-rz(2.676595448543915) q[10];
-cx q[4],q[10];
-cx q[4],q[13];
-cx q[6],q[10];
-rz(2.676595448543915) q[10];
-cx q[6],q[10];
-rx(8.516644460761265) q[10];
-rz(2.676595448543915) q[11];
-cx q[5],q[11];
-cx q[6],q[11];
-rz(2.676595448543915) q[11];
-cx q[6],q[11];
-rx(8.516644460761265) q[11];
-rz(2.676595448543915) q[12];
-cx q[3],q[12];
-cx q[3],q[14];
-cx q[5],q[12];
-rz(2.676595448543915) q[12];
-cx q[5],q[12];
-rz(2.676595448543915) q[13];
-cx q[4],q[13];
-cx q[5],q[13];
-rz(2.676595448543915) q[13];
-cx q[5],q[13];
-rx(8.516644460761265) q[13];
-rz(2.676595448543915) q[14];
-cx q[3],q[14];
-cx q[4],q[14];
-rz(2.676595448543915) q[14];
-cx q[4],q[14];
-rx(8.516644460761265) q[14];
-rz(2.676595448543915) q[15];
-cx q[0],q[15];
-cx q[0],q[16];
-cx q[3],q[15];
-rz(2.676595448543915) q[15];
-cx q[3],q[15];
-rz(2.676595448543915) q[16];
-cx q[0],q[16];
-cx q[0],q[20];
-cx q[3],q[16];
-rz(2.676595448543915) q[16];
-cx q[3],q[16];
-rx(8.516644460761265) q[16];
-rz(2.676595448543915) q[17];
-cx q[1],q[17];
-cx q[1],q[28];
-cx q[3],q[17];
-rz(2.676595448543915) q[17];
-cx q[3],q[17];
-cx q[3],q[18];
-rz(2.676595448543915) q[18];
-cx q[3],q[18];
-cx q[3],q[19];
-cx q[4],q[18];
-rz(2.676595448543915) q[18];
-cx q[4],q[18];
-cx q[4],q[21];
-rz(2.676595448543915) q[19];
-cx q[3],q[19];
-cx q[3],q[22];
-cx q[7],q[19];
-rz(2.676595448543915) q[19];
-cx q[7],q[19];
-rx(8.516644460761265) q[7];
-rx(8.516644460761265) q[19];
-rz(2.676595448543915) q[20];
-cx q[0],q[20];
-cx q[15],q[20];
-rz(2.676595448543915) q[20];
-cx q[15],q[20];
-rx(8.516644460761265) q[20];
-rz(2.676595448543915) q[21];
-cx q[4],q[21];
-cx q[4],q[27];
-cx q[15],q[21];
-rz(2.676595448543915) q[21];
-cx q[15],q[21];
-rx(8.516644460761265) q[15];
-rz(2.676595448543915) q[22];
-cx q[3],q[22];
-cx q[3],q[23];
-cx q[9],q[22];
-rz(2.676595448543915) q[22];
-cx q[9],q[22];
-rx(8.516644460761265) q[9];
-rx(8.516644460761265) q[22];
-rz(2.676595448543915) q[23];
-cx q[3],q[23];
-cx q[3],q[24];
-cx q[17],q[23];
-rz(2.676595448543915) q[23];
-cx q[17],q[23];
-rx(8.516644460761265) q[17];
-rx(8.516644460761265) q[23];
-rz(2.676595448543915) q[24];
-cx q[3],q[24];
-cx q[3],q[25];
-cx q[5],q[24];
-rz(2.676595448543915) q[24];
-cx q[5],q[24];
-cx q[5],q[33];
-rx(8.516644460761265) q[24];
-rz(2.676595448543915) q[25];
-cx q[3],q[25];
-cx q[3],q[26];
-cx q[12],q[25];
-rz(2.676595448543915) q[25];
-cx q[12],q[25];
-cx q[12],q[31];
-rx(8.516644460761265) q[25];
-rz(2.676595448543915) q[26];
-cx q[3],q[26];
-cx q[21],q[26];
-rz(2.676595448543915) q[26];
-cx q[21],q[26];
-rz(2.676595448543915) q[27];
-cx q[4],q[27];
-rx(8.516644460761265) q[4];
-cx q[6],q[27];
-rz(2.676595448543915) q[27];
-cx q[6],q[27];
-rx(8.516644460761265) q[6];
-rx(8.516644460761265) q[27];
-rz(2.676595448543915) q[28];
-cx q[1],q[28];
-cx q[1],q[29];
-cx q[3],q[28];
-rz(2.676595448543915) q[28];
-cx q[3],q[28];
-rx(8.516644460761265) q[28];
-rz(2.676595448543915) q[29];
-cx q[1],q[29];
-rx(8.516644460761265) q[1];
-cx q[3],q[29];
-rz(2.676595448543915) q[29];
-cx q[3],q[29];
-cx q[3],q[30];
-rx(8.516644460761265) q[29];
-rz(2.676595448543915) q[30];
-cx q[3],q[30];
-cx q[3],q[34];
-cx q[18],q[30];
-rz(2.676595448543915) q[30];
-cx q[18],q[30];
-rx(8.516644460761265) q[18];
-rz(2.676595448543915) q[31];
-cx q[12],q[31];
-cx q[26],q[31];
-rz(2.676595448543915) q[31];
-cx q[26],q[31];
-rx(8.516644460761265) q[26];
-rx(8.516644460761265) q[31];
-cx q[32],q[35];
-rz(2.676595448543915) q[33];
-cx q[5],q[33];
-rx(8.516644460761265) q[5];
-cx q[30],q[33];
-rz(2.676595448543915) q[33];
-cx q[30],q[33];
-rx(8.516644460761265) q[30];
-rx(8.516644460761265) q[33];
-rz(2.676595448543915) q[34];
-cx q[3],q[34];
-cx q[12],q[34];
-rz(2.676595448543915) q[34];
-cx q[12],q[34];
-rx(8.516644460761265) q[12];
-rx(8.516644460761265) q[34];
-rz(0.01944416774051989) q[35];
-cx q[32],q[35];
-rx(1.3150703795195686) q[32];
-cx q[0],q[32];
-rz(2.676595448543915) q[32];
-cx q[0],q[32];
-rx(8.516644460761265) q[0];
-cx q[0],q[1];
-rz(5.504594016587362) q[1];
-cx q[0],q[1];
-cx q[0],q[2];
-rz(5.504594016587362) q[2];
-cx q[0],q[2];
-rx(9.1768209750072) q[2];
-cx q[21],q[32];
-rz(2.676595448543915) q[32];
-cx q[21],q[32];
-rx(8.516644460761265) q[21];
-rx(1.3150703795195686) q[35];
-cx q[3],q[35];
-rz(2.676595448543915) q[35];
-cx q[3],q[35];
-rx(8.516644460761265) q[3];
-cx q[0],q[3];
-rz(5.504594016587362) q[3];
-cx q[0],q[3];
-cx q[0],q[15];
-cx q[1],q[3];
-rz(5.504594016587362) q[3];
-cx q[1],q[3];
-cx q[1],q[4];
-rz(5.504594016587362) q[4];
-cx q[1],q[4];
-cx q[1],q[5];
-cx q[3],q[4];
-rz(5.504594016587362) q[4];
-cx q[3],q[4];
-cx q[4],q[6];
-rz(5.504594016587362) q[5];
-cx q[1],q[5];
-cx q[1],q[9];
-cx q[3],q[5];
-rz(5.504594016587362) q[5];
-cx q[3],q[5];
-cx q[3],q[7];
-rz(5.504594016587362) q[6];
-cx q[4],q[6];
-cx q[5],q[6];
-rz(5.504594016587362) q[6];
-cx q[5],q[6];
-rz(5.504594016587362) q[7];
-cx q[3],q[7];
-cx q[3],q[8];
-cx q[4],q[7];
-rz(5.504594016587362) q[7];
-cx q[4],q[7];
-cx q[4],q[10];
-rz(5.504594016587362) q[8];
-cx q[3],q[8];
-cx q[5],q[8];
-rz(5.504594016587362) q[8];
-cx q[5],q[8];
-cx q[5],q[11];
-rx(9.1768209750072) q[8];
-rz(5.504594016587362) q[9];
-cx q[1],q[9];
-cx q[1],q[17];
-cx q[3],q[9];
-rz(5.504594016587362) q[9];
-cx q[3],q[9];
-cx q[3],q[12];
-rz(5.504594016587362) q[10];
-cx q[4],q[10];
-cx q[4],q[13];
-cx q[6],q[10];
-rz(5.504594016587362) q[10];
-cx q[6],q[10];
-rx(9.1768209750072) q[10];
-rz(5.504594016587362) q[11];
-cx q[5],q[11];
-cx q[6],q[11];
-rz(5.504594016587362) q[11];
-cx q[6],q[11];
-rx(9.1768209750072) q[11];
-rz(5.504594016587362) q[12];
-cx q[3],q[12];
-cx q[3],q[14];
-cx q[5],q[12];
-rz(5.504594016587362) q[12];
-cx q[5],q[12];
-rz(5.504594016587362) q[13];
-cx q[4],q[13];
-cx q[5],q[13];
-rz(5.504594016587362) q[13];
-cx q[5],q[13];
-rx(9.1768209750072) q[13];
-rz(5.504594016587362) q[14];
-cx q[3],q[14];
-cx q[4],q[14];
-rz(5.504594016587362) q[14];
-cx q[4],q[14];
-rx(9.1768209750072) q[14];
-rz(5.504594016587362) q[15];
-cx q[0],q[15];
-cx q[0],q[16];
-cx q[3],q[15];
-rz(5.504594016587362) q[15];
-cx q[3],q[15];
-rz(5.504594016587362) q[16];
-cx q[0],q[16];
-cx q[0],q[20];
-cx q[3],q[16];
-rz(5.504594016587362) q[16];
-cx q[3],q[16];
-rx(9.1768209750072) q[16];
-rz(5.504594016587362) q[17];
-cx q[1],q[17];
-cx q[1],q[28];
-cx q[3],q[17];
-rz(5.504594016587362) q[17];
-cx q[3],q[17];
-cx q[3],q[18];
-rz(5.504594016587362) q[18];
-cx q[3],q[18];
-cx q[3],q[19];
-cx q[4],q[18];
-rz(5.504594016587362) q[18];
-cx q[4],q[18];
-cx q[4],q[21];
-rz(5.504594016587362) q[19];
-cx q[3],q[19];
-cx q[3],q[22];
-cx q[7],q[19];
-rz(5.504594016587362) q[19];
-cx q[7],q[19];
-rx(9.1768209750072) q[7];
-rx(9.1768209750072) q[19];
-rz(5.504594016587362) q[20];
-cx q[0],q[20];
-cx q[15],q[20];
-rz(5.504594016587362) q[20];
-cx q[15],q[20];
-rx(9.1768209750072) q[20];
-rz(5.504594016587362) q[21];
-cx q[4],q[21];
-cx q[4],q[27];
-cx q[15],q[21];
-rz(5.504594016587362) q[21];
-cx q[15],q[21];
-rx(9.1768209750072) q[15];
-rz(5.504594016587362) q[22];
-cx q[3],q[22];
-cx q[3],q[23];
-cx q[9],q[22];
-rz(5.504594016587362) q[22];
-cx q[9],q[22];
-rx(9.1768209750072) q[9];
-rx(9.1768209750072) q[22];
-rz(5.504594016587362) q[23];
-cx q[3],q[23];
-cx q[3],q[24];
-cx q[17],q[23];
-rz(5.504594016587362) q[23];
-cx q[17],q[23];
-rx(9.1768209750072) q[17];
-rx(9.1768209750072) q[23];
-rz(5.504594016587362) q[24];
-cx q[3],q[24];
-cx q[3],q[25];
-cx q[5],q[24];
-rz(5.504594016587362) q[24];
-cx q[5],q[24];
-cx q[5],q[33];
-rx(9.1768209750072) q[24];
-rz(5.504594016587362) q[25];
-cx q[3],q[25];
-cx q[3],q[26];
-cx q[12],q[25];
-rz(5.504594016587362) q[25];
-cx q[12],q[25];
-cx q[12],q[31];
-rx(9.1768209750072) q[25];
-rz(5.504594016587362) q[26];
-cx q[3],q[26];
-cx q[21],q[26];
-rz(5.504594016587362) q[26];
-cx q[21],q[26];
-rz(5.504594016587362) q[27];
-cx q[4],q[27];
-rx(9.1768209750072) q[4];
-cx q[6],q[27];
-rz(5.504594016587362) q[27];
-cx q[6],q[27];
-rx(9.1768209750072) q[6];
-rx(9.1768209750072) q[27];
-rz(5.504594016587362) q[28];
-cx q[1],q[28];
-cx q[1],q[29];
-cx q[3],q[28];
-rz(5.504594016587362) q[28];
-cx q[3],q[28];
-rx(9.1768209750072) q[28];
-rz(5.504594016587362) q[29];
-cx q[1],q[29];
-rx(9.1768209750072) q[1];
-cx q[3],q[29];
-rz(5.504594016587362) q[29];
-cx q[3],q[29];
-cx q[3],q[30];
-rx(9.1768209750072) q[29];
-rz(5.504594016587362) q[30];
-cx q[3],q[30];
-cx q[3],q[34];
-cx q[18],q[30];
-rz(5.504594016587362) q[30];
-cx q[18],q[30];
-rx(9.1768209750072) q[18];
-rz(5.504594016587362) q[31];
-cx q[12],q[31];
-cx q[26],q[31];
-rz(5.504594016587362) q[31];
-cx q[26],q[31];
-rx(9.1768209750072) q[26];
-rx(9.1768209750072) q[31];
-cx q[32],q[35];
-rz(5.504594016587362) q[33];
-cx q[5],q[33];
-rx(9.1768209750072) q[5];
-cx q[30],q[33];
-rz(5.504594016587362) q[33];
-cx q[30],q[33];
-rx(9.1768209750072) q[30];
-rx(9.1768209750072) q[33];
-rz(5.504594016587362) q[34];
-cx q[3],q[34];
-cx q[12],q[34];
-rz(5.504594016587362) q[34];
-cx q[12],q[34];
-rx(9.1768209750072) q[12];
-rx(9.1768209750072) q[34];
-rz(2.676595448543915) q[35];
-cx q[32],q[35];
-rx(8.516644460761265) q[32];
-cx q[0],q[32];
-rz(5.504594016587362) q[32];
-cx q[0],q[32];
-rx(9.1768209750072) q[0];
-cx q[21],q[32];
-rz(5.504594016587362) q[32];
-cx q[21],q[32];
-rx(9.1768209750072) q[21];
-rx(8.516644460761265) q[35];
-cx q[3],q[35];
-rz(5.504594016587362) q[35];
-cx q[3],q[35];
-rx(9.1768209750072) q[3];
-cx q[32],q[35];
-rz(5.504594016587362) q[35];
-cx q[32],q[35];
-rx(9.1768209750072) q[32];
-rx(9.1768209750072) q[35];
\ No newline at end of file
@@ -1,818 +0,0 @@
-OPENQASM 2.0;
-include "qelib1.inc";
-qreg q[37];
-ry(pi/2) q[0];
-rx(pi) q[0];
-ry(pi/2) q[1];
-rx(pi) q[1];
-cx q[0],q[1];
-rz(1.6637634388084455) q[1];
-cx q[0],q[1];
-ry(pi/2) q[2];
-rx(pi) q[2];
-cx q[0],q[2];
-rz(1.6637634388084455) q[2];
-cx q[0],q[2];
-rx(10.977677838484285) q[2];
-ry(pi/2) q[3];
-rx(pi) q[3];
-cx q[0],q[3];
-rz(1.6637634388084455) q[3];
-cx q[0],q[3];
-cx q[1],q[3];
-rz(1.6637634388084455) q[3];
-cx q[1],q[3];
-ry(pi/2) q[4];
-rx(pi) q[4];
-cx q[1],q[4];
-rz(1.6637634388084455) q[4];
-cx q[1],q[4];
-cx q[3],q[4];
-rz(1.6637634388084455) q[4];
-cx q[3],q[4];
-ry(pi/2) q[5];
-rx(pi) q[5];
-cx q[1],q[5];
-rz(1.6637634388084455) q[5];
-cx q[1],q[5];
-cx q[3],q[5];
-rz(1.6637634388084455) q[5];
-cx q[3],q[5];
-ry(pi/2) q[6];
-rx(pi) q[6];
-cx q[4],q[6];
-rz(1.6637634388084455) q[6];
-cx q[4],q[6];
-cx q[5],q[6];
-rz(1.6637634388084455) q[6];
-cx q[5],q[6];
-ry(pi/2) q[7];
-rx(pi) q[7];
-cx q[3],q[7];
-rz(1.6637634388084455) q[7];
-cx q[3],q[7];
-cx q[4],q[7];
-rz(1.6637634388084455) q[7];
-cx q[4],q[7];
-ry(pi/2) q[8];
-rx(pi) q[8];
-cx q[3],q[8];
-rz(1.6637634388084455) q[8];
-cx q[3],q[8];
-cx q[5],q[8];
-rz(1.6637634388084455) q[8];
-cx q[5],q[8];
-rx(10.977677838484285) q[8];
-ry(pi/2) q[9];
-rx(pi) q[9];
-cx q[1],q[9];
-rz(1.6637634388084455) q[9];
-cx q[1],q[9];
-cx q[3],q[9];
-rz(1.6637634388084455) q[9];
-cx q[3],q[9];
-ry(pi/2) q[10];
-rx(pi) q[10];
-cx q[4],q[10];
-rz(1.6637634388084455) q[10];
-cx q[4],q[10];
-cx q[6],q[10];
-rz(1.6637634388084455) q[10];
-cx q[6],q[10];
-rx(10.977677838484285) q[10];
-ry(pi/2) q[11];
-rx(pi) q[11];
-cx q[5],q[11];
-rz(1.6637634388084455) q[11];
-cx q[5],q[11];
-cx q[6],q[11];
-rz(1.6637634388084455) q[11];
-cx q[6],q[11];
-rx(10.977677838484285) q[11];
-ry(pi/2) q[12];
-rx(pi) q[12];
-cx q[3],q[12];
-rz(1.6637634388084455) q[12];
-cx q[3],q[12];
-cx q[5],q[12];
-rz(1.6637634388084455) q[12];
-cx q[5],q[12];
-ry(pi/2) q[13];
-rx(pi) q[13];
-cx q[4],q[13];
-rz(1.6637634388084455) q[13];
-cx q[4],q[13];
-cx q[5],q[13];
-rz(1.6637634388084455) q[13];
-cx q[5],q[13];
-rx(10.977677838484285) q[13];
-ry(pi/2) q[14];
-rx(pi) q[14];
-cx q[3],q[14];
-rz(1.6637634388084455) q[14];
-cx q[3],q[14];
-cx q[4],q[14];
-rz(1.6637634388084455) q[14];
-cx q[4],q[14];
-rx(10.977677838484285) q[14];
-ry(pi/2) q[15];
-rx(pi) q[15];
-cx q[0],q[15];
-rz(1.6637634388084455) q[15];
-cx q[0],q[15];
-cx q[3],q[15];
-rz(1.6637634388084455) q[15];
-cx q[3],q[15];
-ry(pi/2) q[16];
-rx(pi) q[16];
-cx q[0],q[16];
-rz(1.6637634388084455) q[16];
-cx q[0],q[16];
-cx q[3],q[16];
-rz(1.6637634388084455) q[16];
-cx q[3],q[16];
-rx(10.977677838484285) q[16];
-ry(pi/2) q[17];
-rx(pi) q[17];
-cx q[1],q[17];
-rz(1.6637634388084455) q[17];
-cx q[1],q[17];
-cx q[3],q[17];
-rz(1.6637634388084455) q[17];
-cx q[3],q[17];
-ry(pi/2) q[18];
-rx(pi) q[18];
-cx q[3],q[18];
-rz(1.6637634388084455) q[18];
-cx q[3],q[18];
-cx q[4],q[18];
-rz(1.6637634388084455) q[18];
-cx q[4],q[18];
-ry(pi/2) q[19];
-rx(pi) q[19];
-cx q[3],q[19];
-rz(1.6637634388084455) q[19];
-cx q[3],q[19];
-cx q[7],q[19];
-rz(1.6637634388084455) q[19];
-cx q[7],q[19];
-rx(10.977677838484285) q[7];
-rx(10.977677838484285) q[19];
-ry(pi/2) q[20];
-rx(pi) q[20];
-cx q[0],q[20];
-rz(1.6637634388084455) q[20];
-cx q[0],q[20];
-cx q[15],q[20];
-rz(1.6637634388084455) q[20];
-cx q[15],q[20];
-ry(pi/2) q[21];
-rx(pi) q[21];
-cx q[4],q[21];
-rz(1.6637634388084455) q[21];
-cx q[4],q[21];
-cx q[15],q[21];
-rz(1.6637634388084455) q[21];
-cx q[15],q[21];
-ry(pi/2) q[22];
-rx(pi) q[22];
-cx q[3],q[22];
-rz(1.6637634388084455) q[22];
-cx q[3],q[22];
-cx q[9],q[22];
-rz(1.6637634388084455) q[22];
-cx q[9],q[22];
-rx(10.977677838484285) q[9];
-rx(10.977677838484285) q[22];
-ry(pi/2) q[23];
-rx(pi) q[23];
-cx q[3],q[23];
-rz(1.6637634388084455) q[23];
-cx q[3],q[23];
-cx q[17],q[23];
-rz(1.6637634388084455) q[23];
-cx q[17],q[23];
-rx(10.977677838484285) q[17];
-rx(10.977677838484285) q[23];
-ry(pi/2) q[24];
-rx(pi) q[24];
-cx q[3],q[24];
-rz(1.6637634388084455) q[24];
-cx q[3],q[24];
-cx q[5],q[24];
-rz(1.6637634388084455) q[24];
-cx q[5],q[24];
-rx(10.977677838484285) q[24];
-ry(pi/2) q[25];
-rx(pi) q[25];
-cx q[3],q[25];
-rz(1.6637634388084455) q[25];
-cx q[3],q[25];
-cx q[12],q[25];
-rz(1.6637634388084455) q[25];
-cx q[12],q[25];
-rx(10.977677838484285) q[25];
-ry(pi/2) q[26];
-rx(pi) q[26];
-cx q[3],q[26];
-rz(1.6637634388084455) q[26];
-cx q[3],q[26];
-cx q[21],q[26];
-rz(1.6637634388084455) q[26];
-cx q[21],q[26];
-ry(pi/2) q[27];
-rx(pi) q[27];
-cx q[4],q[27];
-rz(1.6637634388084455) q[27];
-cx q[4],q[27];
-rx(10.977677838484285) q[4];
-cx q[6],q[27];
-rz(1.6637634388084455) q[27];
-cx q[6],q[27];
-rx(10.977677838484285) q[6];
-rx(10.977677838484285) q[27];
-ry(pi/2) q[28];
-rx(pi) q[28];
-cx q[1],q[28];
-rz(1.6637634388084455) q[28];
-cx q[1],q[28];
-cx q[3],q[28];
-rz(1.6637634388084455) q[28];
-cx q[3],q[28];
-rx(10.977677838484285) q[28];
-ry(pi/2) q[29];
-rx(pi) q[29];
-cx q[1],q[29];
-rz(1.6637634388084455) q[29];
-cx q[1],q[29];
-rx(10.977677838484285) q[1];
-cx q[3],q[29];
-rz(1.6637634388084455) q[29];
-cx q[3],q[29];
-rx(10.977677838484285) q[29];
-ry(pi/2) q[30];
-rx(pi) q[30];
-cx q[3],q[30];
-rz(1.6637634388084455) q[30];
-cx q[3],q[30];
-cx q[18],q[30];
-rz(1.6637634388084455) q[30];
-cx q[18],q[30];
-rx(10.977677838484285) q[18];
-ry(pi/2) q[31];
-rx(pi) q[31];
-cx q[12],q[31];
-rz(1.6637634388084455) q[31];
-cx q[12],q[31];
-cx q[26],q[31];
-rz(1.6637634388084455) q[31];
-cx q[26],q[31];
-rx(10.977677838484285) q[26];
-rx(10.977677838484285) q[31];
-ry(pi/2) q[32];
-rx(pi) q[32];
-cx q[0],q[32];
-rz(1.6637634388084455) q[32];
-cx q[0],q[32];
-rx(10.977677838484285) q[0];
-cx q[0],q[1];
-rz(5.420121879987083) q[1];
-cx q[0],q[1];
-cx q[0],q[2];
-rz(5.420121879987083) q[2];
-cx q[0],q[2];
-rx(2.0933933353261085) q[2];
-cx q[21],q[32];
-rz(1.6637634388084455) q[32];
-cx q[21],q[32];
-rx(10.977677838484285) q[21];
-ry(pi/2) q[33];
-rx(pi) q[33];
-cx q[5],q[33];
-rz(1.6637634388084455) q[33];
-cx q[5],q[33];
-rx(10.977677838484285) q[5];
-cx q[30],q[33];
-rz(1.6637634388084455) q[33];
-cx q[30],q[33];
-rx(10.977677838484285) q[30];
-rx(10.977677838484285) q[33];
-ry(pi/2) q[34];
-rx(pi) q[34];
-cx q[3],q[34];
-rz(1.6637634388084455) q[34];
-cx q[3],q[34];
-cx q[12],q[34];
-rz(1.6637634388084455) q[34];
-cx q[12],q[34];
-rx(10.977677838484285) q[12];
-rx(10.977677838484285) q[34];
-ry(pi/2) q[35];
-rx(pi) q[35];
-cx q[3],q[35];
-rz(1.6637634388084455) q[35];
-cx q[3],q[35];
-rx(10.977677838484285) q[3];
-cx q[0],q[3];
-rz(5.420121879987083) q[3];
-cx q[0],q[3];
-cx q[1],q[3];
-rz(5.420121879987083) q[3];
-cx q[1],q[3];
-cx q[1],q[4];
-rz(5.420121879987083) q[4];
-cx q[1],q[4];
-cx q[1],q[5];
-cx q[3],q[4];
-rz(5.420121879987083) q[4];
-cx q[3],q[4];
-cx q[4],q[6];
-rz(5.420121879987083) q[5];
-cx q[1],q[5];
-cx q[1],q[9];
-cx q[3],q[5];
-rz(5.420121879987083) q[5];
-cx q[3],q[5];
-cx q[3],q[7];
-rz(5.420121879987083) q[6];
-cx q[4],q[6];
-cx q[5],q[6];
-rz(5.420121879987083) q[6];
-cx q[5],q[6];
-rz(5.420121879987083) q[7];
-cx q[3],q[7];
-cx q[3],q[8];
-cx q[4],q[7];
-rz(5.420121879987083) q[7];
-cx q[4],q[7];
-cx q[4],q[10];
-rz(5.420121879987083) q[8];
-cx q[3],q[8];
-cx q[5],q[8];
-rz(5.420121879987083) q[8];
-cx q[5],q[8];
-cx q[5],q[11];
-rx(2.0933933353261085) q[8];
-rz(5.420121879987083) q[9];
-cx q[1],q[9];
-cx q[1],q[17];
-cx q[3],q[9];
-rz(5.420121879987083) q[9];
-cx q[3],q[9];
-cx q[3],q[12];
-rz(5.420121879987083) q[10];
-cx q[4],q[10];
-cx q[4],q[13];
-cx q[6],q[10];
-rz(5.420121879987083) q[10];
-cx q[6],q[10];
-rx(2.0933933353261085) q[10];
-rz(5.420121879987083) q[11];
-cx q[5],q[11];
-cx q[6],q[11];
-rz(5.420121879987083) q[11];
-cx q[6],q[11];
-rx(2.0933933353261085) q[11];
-rz(5.420121879987083) q[12];
-cx q[3],q[12];
-cx q[3],q[14];
-cx q[5],q[12];
-rz(5.420121879987083) q[12];
-cx q[5],q[12];
-rz(5.420121879987083) q[13];
-cx q[4],q[13];
-cx q[5],q[13];
-rz(5.420121879987083) q[13];
-cx q[5],q[13];
-rx(2.0933933353261085) q[13];
-rz(5.420121879987083) q[14];
-cx q[3],q[14];
-cx q[4],q[14];
-rz(5.420121879987083) q[14];
-cx q[4],q[14];
-rx(2.0933933353261085) q[14];
-rz(5.420121879987083) q[17];
-cx q[1],q[17];
-cx q[1],q[28];
-rz(5.420121879987083) q[28];
-cx q[1],q[28];
-cx q[1],q[29];
-rz(5.420121879987083) q[29];
-cx q[1],q[29];
-rx(2.0933933353261085) q[1];
-cx q[32],q[35];
-rz(1.6637634388084455) q[35];
-cx q[32],q[35];
-rx(10.977677838484285) q[32];
-rx(10.977677838484285) q[35];
-ry(pi/2) q[36];
-rx(pi) q[36];
-cx q[15],q[36];
-rz(1.6637634388084455) q[36];
-cx q[15],q[36];
-rx(10.977677838484285) q[15];
-cx q[0],q[15];
-rz(5.420121879987083) q[15];
-cx q[0],q[15];
-cx q[0],q[16];
-cx q[3],q[15];
-rz(5.420121879987083) q[15];
-cx q[3],q[15];
-rz(5.420121879987083) q[16];
-cx q[0],q[16];
-cx q[3],q[16];
-rz(5.420121879987083) q[16];
-cx q[3],q[16];
-cx q[3],q[17];
-rx(2.0933933353261085) q[16];
-rz(5.420121879987083) q[17];
-cx q[3],q[17];
-cx q[3],q[18];
-rz(5.420121879987083) q[18];
-cx q[3],q[18];
-cx q[3],q[19];
-cx q[4],q[18];
-rz(5.420121879987083) q[18];
-cx q[4],q[18];
-cx q[4],q[21];
-rz(5.420121879987083) q[19];
-cx q[3],q[19];
-cx q[3],q[22];
-cx q[7],q[19];
-rz(5.420121879987083) q[19];
-cx q[7],q[19];
-rx(2.0933933353261085) q[7];
-rx(2.0933933353261085) q[19];
-cx q[20],q[36];
-rz(5.420121879987083) q[21];
-cx q[4],q[21];
-cx q[4],q[27];
-rz(5.420121879987083) q[22];
-cx q[3],q[22];
-cx q[3],q[23];
-cx q[9],q[22];
-rz(5.420121879987083) q[22];
-cx q[9],q[22];
-rx(2.0933933353261085) q[9];
-rx(2.0933933353261085) q[22];
-rz(5.420121879987083) q[23];
-cx q[3],q[23];
-cx q[3],q[24];
-cx q[17],q[23];
-rz(5.420121879987083) q[23];
-cx q[17],q[23];
-rx(2.0933933353261085) q[17];
-rx(2.0933933353261085) q[23];
-rz(5.420121879987083) q[24];
-cx q[3],q[24];
-cx q[3],q[25];
-cx q[5],q[24];
-rz(5.420121879987083) q[24];
-cx q[5],q[24];
-cx q[5],q[33];
-rx(2.0933933353261085) q[24];
-rz(5.420121879987083) q[25];
-cx q[3],q[25];
-cx q[3],q[26];
-cx q[12],q[25];
-rz(5.420121879987083) q[25];
-cx q[12],q[25];
-cx q[12],q[31];
-rx(2.0933933353261085) q[25];
-rz(5.420121879987083) q[26];
-cx q[3],q[26];
-cx q[3],q[28];
-rz(5.420121879987083) q[27];
-cx q[4],q[27];
-rx(2.0933933353261085) q[4];
-cx q[6],q[27];
-rz(5.420121879987083) q[27];
-cx q[6],q[27];
-rx(2.0933933353261085) q[6];
-rx(2.0933933353261085) q[27];
-rz(5.420121879987083) q[28];
-cx q[3],q[28];
-cx q[3],q[29];
-rx(2.0933933353261085) q[28];
-rz(5.420121879987083) q[29];
-cx q[3],q[29];
-cx q[3],q[30];
-rx(2.0933933353261085) q[29];
-rz(5.420121879987083) q[30];
-cx q[3],q[30];
-cx q[3],q[34];
-cx q[18],q[30];
-rz(5.420121879987083) q[30];
-cx q[18],q[30];
-rx(2.0933933353261085) q[18];
-rz(5.420121879987083) q[31];
-cx q[12],q[31];
-rz(5.420121879987083) q[33];
-cx q[5],q[33];
-rx(2.0933933353261085) q[5];
-cx q[30],q[33];
-rz(5.420121879987083) q[33];
-cx q[30],q[33];
-rx(2.0933933353261085) q[30];
-rx(2.0933933353261085) q[33];
-rz(5.420121879987083) q[34];
-cx q[3],q[34];
-cx q[3],q[35];
-cx q[12],q[34];
-rz(5.420121879987083) q[34];
-cx q[12],q[34];
-rx(2.0933933353261085) q[12];
-rx(2.0933933353261085) q[34];
-rz(5.420121879987083) q[35];
-cx q[3],q[35];
-rx(2.0933933353261085) q[3];
-rz(1.6637634388084455) q[36];
-cx q[20],q[36];
-rx(10.977677838484285) q[20];
-cx q[0],q[20];
-rz(5.420121879987083) q[20];
-cx q[0],q[20];
-cx q[0],q[32];
-cx q[15],q[20];
-rz(5.420121879987083) q[20];
-cx q[15],q[20];
-cx q[15],q[21];
-rz(5.420121879987083) q[21];
-cx q[15],q[21];
-cx q[21],q[26];
-rz(5.420121879987083) q[26];
-cx q[21],q[26];
-cx q[26],q[31];
-rz(5.420121879987083) q[31];
-cx q[26],q[31];
-rx(2.0933933353261085) q[26];
-rx(2.0933933353261085) q[31];
-rz(5.420121879987083) q[32];
-cx q[0],q[32];
-rx(2.0933933353261085) q[0];
-cx q[0],q[1];
-rz(3.4147764437488872) q[1];
-cx q[0],q[1];
-cx q[0],q[2];
-rz(3.4147764437488872) q[2];
-cx q[0],q[2];
-cx q[0],q[3];
-rx(1.3833774201290876) q[2];
-rz(3.4147764437488872) q[3];
-cx q[0],q[3];
-cx q[1],q[3];
-rz(3.4147764437488872) q[3];
-cx q[1],q[3];
-cx q[1],q[4];
-rz(3.4147764437488872) q[4];
-cx q[1],q[4];
-cx q[1],q[5];
-cx q[3],q[4];
-rz(3.4147764437488872) q[4];
-cx q[3],q[4];
-cx q[4],q[6];
-rz(3.4147764437488872) q[5];
-cx q[1],q[5];
-cx q[1],q[9];
-cx q[3],q[5];
-rz(3.4147764437488872) q[5];
-cx q[3],q[5];
-cx q[3],q[7];
-rz(3.4147764437488872) q[6];
-cx q[4],q[6];
-cx q[5],q[6];
-rz(3.4147764437488872) q[6];
-cx q[5],q[6];
-rz(3.4147764437488872) q[7];
-cx q[3],q[7];
-cx q[3],q[8];
-cx q[4],q[7];
-rz(3.4147764437488872) q[7];
-cx q[4],q[7];
-cx q[4],q[10];
-rz(3.4147764437488872) q[8];
-cx q[3],q[8];
-cx q[5],q[8];
-rz(3.4147764437488872) q[8];
-cx q[5],q[8];
-cx q[5],q[11];
-rx(1.3833774201290876) q[8];
-rz(3.4147764437488872) q[9];
-cx q[1],q[9];
-cx q[1],q[17];
-cx q[3],q[9];
-rz(3.4147764437488872) q[9];
-cx q[3],q[9];
-cx q[3],q[12];
-rz(3.4147764437488872) q[10];
-cx q[4],q[10];
-cx q[4],q[13];
-cx q[6],q[10];
-rz(3.4147764437488872) q[10];
-cx q[6],q[10];
-rx(1.3833774201290876) q[10];
-rz(3.4147764437488872) q[11];
-cx q[5],q[11];
-cx q[6],q[11];
-rz(3.4147764437488872) q[11];
-cx q[6],q[11];
-rx(1.3833774201290876) q[11];
-rz(3.4147764437488872) q[12];
-cx q[3],q[12];
-cx q[3],q[14];
-cx q[5],q[12];
-rz(3.4147764437488872) q[12];
-cx q[5],q[12];
-rz(3.4147764437488872) q[13];
-cx q[4],q[13];
-cx q[5],q[13];
-rz(3.4147764437488872) q[13];
-cx q[5],q[13];
-rx(1.3833774201290876) q[13];
-rz(3.4147764437488872) q[14];
-cx q[3],q[14];
-cx q[4],q[14];
-rz(3.4147764437488872) q[14];
-cx q[4],q[14];
-rx(1.3833774201290876) q[14];
-rz(3.4147764437488872) q[17];
-cx q[1],q[17];
-cx q[1],q[28];
-cx q[21],q[32];
-rz(3.4147764437488872) q[28];
-cx q[1],q[28];
-cx q[1],q[29];
-rz(3.4147764437488872) q[29];
-cx q[1],q[29];
-rx(1.3833774201290876) q[1];
-rz(5.420121879987083) q[32];
-cx q[21],q[32];
-rx(2.0933933353261085) q[21];
-cx q[32],q[35];
-rz(5.420121879987083) q[35];
-cx q[32],q[35];
-rx(2.0933933353261085) q[32];
-rx(2.0933933353261085) q[35];
-rx(10.977677838484285) q[36];
-cx q[15],q[36];
-rz(5.420121879987083) q[36];
-cx q[15],q[36];
-rx(2.0933933353261085) q[15];
-cx q[0],q[15];
-rz(3.4147764437488872) q[15];
-cx q[0],q[15];
-cx q[0],q[16];
-cx q[3],q[15];
-rz(3.4147764437488872) q[15];
-cx q[3],q[15];
-rz(3.4147764437488872) q[16];
-cx q[0],q[16];
-cx q[3],q[16];
-rz(3.4147764437488872) q[16];
-cx q[3],q[16];
-cx q[3],q[17];
-rx(1.3833774201290876) q[16];
-rz(3.4147764437488872) q[17];
-cx q[3],q[17];
-cx q[3],q[18];
-rz(3.4147764437488872) q[18];
-cx q[3],q[18];
-cx q[3],q[19];
-cx q[4],q[18];
-rz(3.4147764437488872) q[18];
-cx q[4],q[18];
-cx q[4],q[21];
-rz(3.4147764437488872) q[19];
-cx q[3],q[19];
-cx q[3],q[22];
-cx q[7],q[19];
-rz(3.4147764437488872) q[19];
-cx q[7],q[19];
-rx(1.3833774201290876) q[7];
-rx(1.3833774201290876) q[19];
-cx q[20],q[36];
-rz(3.4147764437488872) q[21];
-cx q[4],q[21];
-cx q[4],q[27];
-rz(3.4147764437488872) q[22];
-cx q[3],q[22];
-cx q[3],q[23];
-cx q[9],q[22];
-rz(3.4147764437488872) q[22];
-cx q[9],q[22];
-rx(1.3833774201290876) q[9];
-rx(1.3833774201290876) q[22];
-rz(3.4147764437488872) q[23];
-cx q[3],q[23];
-cx q[3],q[24];
-cx q[17],q[23];
-rz(3.4147764437488872) q[23];
-cx q[17],q[23];
-rx(1.3833774201290876) q[17];
-rx(1.3833774201290876) q[23];
-rz(3.4147764437488872) q[24];
-cx q[3],q[24];
-cx q[3],q[25];
-cx q[5],q[24];
-rz(3.4147764437488872) q[24];
-cx q[5],q[24];
-cx q[5],q[33];
-rx(1.3833774201290876) q[24];
-rz(3.4147764437488872) q[25];
-cx q[3],q[25];
-cx q[3],q[26];
-cx q[12],q[25];
-rz(3.4147764437488872) q[25];
-cx q[12],q[25];
-cx q[12],q[31];
-rx(1.3833774201290876) q[25];
-rz(3.4147764437488872) q[26];
-cx q[3],q[26];
-cx q[3],q[28];
-rz(3.4147764437488872) q[27];
-cx q[4],q[27];
-rx(1.3833774201290876) q[4];
-cx q[6],q[27];
-rz(3.4147764437488872) q[27];
-cx q[6],q[27];
-rx(1.3833774201290876) q[6];
-rx(1.3833774201290876) q[27];
-rz(3.4147764437488872) q[28];
-cx q[3],q[28];
-cx q[3],q[29];
-rx(1.3833774201290876) q[28];
-rz(3.4147764437488872) q[29];
-cx q[3],q[29];
-cx q[3],q[30];
-rx(1.3833774201290876) q[29];
-rz(3.4147764437488872) q[30];
-cx q[3],q[30];
-cx q[3],q[34];
-cx q[18],q[30];
-rz(3.4147764437488872) q[30];
-cx q[18],q[30];
-rx(1.3833774201290876) q[18];
-rz(3.4147764437488872) q[31];
-cx q[12],q[31];
-rz(3.4147764437488872) q[33];
-cx q[5],q[33];
-rx(1.3833774201290876) q[5];
-cx q[30],q[33];
-rz(3.4147764437488872) q[33];
-cx q[30],q[33];
-rx(1.3833774201290876) q[30];
-rx(1.3833774201290876) q[33];
-rz(3.4147764437488872) q[34];
-cx q[3],q[34];
-cx q[3],q[35];
-cx q[12],q[34];
-rz(3.4147764437488872) q[34];
-cx q[12],q[34];
-rx(1.3833774201290876) q[12];
-rx(1.3833774201290876) q[34];
-rz(3.4147764437488872) q[35];
-cx q[3],q[35];
-rx(1.3833774201290876) q[3];
-rz(5.420121879987083) q[36];
-cx q[20],q[36];
-rx(2.0933933353261085) q[20];
-cx q[0],q[20];
-rz(3.4147764437488872) q[20];
-cx q[0],q[20];
-cx q[0],q[32];
-cx q[15],q[20];
-rz(3.4147764437488872) q[20];
-cx q[15],q[20];
-cx q[15],q[21];
-rz(3.4147764437488872) q[21];
-cx q[15],q[21];
-cx q[21],q[26];
-rz(3.4147764437488872) q[26];
-cx q[21],q[26];
-cx q[26],q[31];
-rz(3.4147764437488872) q[31];
-cx q[26],q[31];
-rx(1.3833774201290876) q[26];
-rx(1.3833774201290876) q[31];
-rz(3.4147764437488872) q[32];
-cx q[0],q[32];
-rx(1.3833774201290876) q[0];
-cx q[21],q[32];
-rz(3.4147764437488872) q[32];
-cx q[21],q[32];
-rx(1.3833774201290876) q[21];
-cx q[32],q[35];
-rz(3.4147764437488872) q[35];
-cx q[32],q[35];
-rx(1.3833774201290876) q[32];
-rx(1.3833774201290876) q[35];
-rx(2.0933933353261085) q[36];
-cx q[15],q[36];
-rz(3.4147764437488872) q[36];
-cx q[15],q[36];
-rx(1.3833774201290876) q[15];
-cx q[20],q[36];
-rz(3.4147764437488872) q[36];
-cx q[20],q[36];
-rx(1.3833774201290876) q[20];
-rx(1.3833774201290876) q[36];
\ No newline at end of file
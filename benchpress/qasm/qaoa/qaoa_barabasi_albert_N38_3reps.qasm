@@ -1,841 +0,0 @@
-OPENQASM 2.0;
-include "qelib1.inc";
-qreg q[38];
-ry(pi/2) q[0];
-rx(pi) q[0];
-ry(pi/2) q[1];
-rx(pi) q[1];
-cx q[0],q[1];
-rz(2.385453772230209) q[1];
-cx q[0],q[1];
-ry(pi/2) q[2];
-rx(pi) q[2];
-cx q[0],q[2];
-rz(2.385453772230209) q[2];
-cx q[0],q[2];
-rx(12.15536814514516) q[2];
-ry(pi/2) q[3];
-rx(pi) q[3];
-cx q[0],q[3];
-rz(2.385453772230209) q[3];
-cx q[0],q[3];
-cx q[1],q[3];
-rz(2.385453772230209) q[3];
-cx q[1],q[3];
-ry(pi/2) q[4];
-rx(pi) q[4];
-cx q[1],q[4];
-rz(2.385453772230209) q[4];
-cx q[1],q[4];
-cx q[3],q[4];
-rz(2.385453772230209) q[4];
-cx q[3],q[4];
-ry(pi/2) q[5];
-rx(pi) q[5];
-cx q[1],q[5];
-rz(2.385453772230209) q[5];
-cx q[1],q[5];
-cx q[3],q[5];
-rz(2.385453772230209) q[5];
-cx q[3],q[5];
-ry(pi/2) q[6];
-rx(pi) q[6];
-cx q[4],q[6];
-rz(2.385453772230209) q[6];
-cx q[4],q[6];
-cx q[5],q[6];
-rz(2.385453772230209) q[6];
-cx q[5],q[6];
-ry(pi/2) q[7];
-rx(pi) q[7];
-cx q[3],q[7];
-rz(2.385453772230209) q[7];
-cx q[3],q[7];
-cx q[4],q[7];
-rz(2.385453772230209) q[7];
-cx q[4],q[7];
-ry(pi/2) q[8];
-rx(pi) q[8];
-cx q[3],q[8];
-rz(2.385453772230209) q[8];
-cx q[3],q[8];
-cx q[5],q[8];
-rz(2.385453772230209) q[8];
-cx q[5],q[8];
-rx(12.15536814514516) q[8];
-ry(pi/2) q[9];
-rx(pi) q[9];
-cx q[1],q[9];
-rz(2.385453772230209) q[9];
-cx q[1],q[9];
-cx q[3],q[9];
-rz(2.385453772230209) q[9];
-cx q[3],q[9];
-ry(pi/2) q[10];
-rx(pi) q[10];
-cx q[4],q[10];
-rz(2.385453772230209) q[10];
-cx q[4],q[10];
-cx q[6],q[10];
-rz(2.385453772230209) q[10];
-cx q[6],q[10];
-ry(pi/2) q[11];
-rx(pi) q[11];
-cx q[5],q[11];
-rz(2.385453772230209) q[11];
-cx q[5],q[11];
-cx q[6],q[11];
-rz(2.385453772230209) q[11];
-cx q[6],q[11];
-rx(12.15536814514516) q[11];
-ry(pi/2) q[12];
-rx(pi) q[12];
-cx q[3],q[12];
-rz(2.385453772230209) q[12];
-cx q[3],q[12];
-cx q[5],q[12];
-rz(2.385453772230209) q[12];
-cx q[5],q[12];
-ry(pi/2) q[13];
-rx(pi) q[13];
-cx q[4],q[13];
-rz(2.385453772230209) q[13];
-cx q[4],q[13];
-cx q[5],q[13];
-rz(2.385453772230209) q[13];
-cx q[5],q[13];
-rx(12.15536814514516) q[13];
-ry(pi/2) q[14];
-rx(pi) q[14];
-cx q[3],q[14];
-rz(2.385453772230209) q[14];
-cx q[3],q[14];
-cx q[4],q[14];
-rz(2.385453772230209) q[14];
-cx q[4],q[14];
-rx(12.15536814514516) q[14];
-ry(pi/2) q[15];
-rx(pi) q[15];
-cx q[0],q[15];
-rz(2.385453772230209) q[15];
-cx q[0],q[15];
-cx q[3],q[15];
-rz(2.385453772230209) q[15];
-cx q[3],q[15];
-ry(pi/2) q[16];
-rx(pi) q[16];
-cx q[0],q[16];
-rz(2.385453772230209) q[16];
-cx q[0],q[16];
-cx q[3],q[16];
-rz(2.385453772230209) q[16];
-cx q[3],q[16];
-rx(12.15536814514516) q[16];
-ry(pi/2) q[17];
-rx(pi) q[17];
-cx q[1],q[17];
-rz(2.385453772230209) q[17];
-cx q[1],q[17];
-cx q[3],q[17];
-rz(2.385453772230209) q[17];
-cx q[3],q[17];
-ry(pi/2) q[18];
-rx(pi) q[18];
-cx q[3],q[18];
-rz(2.385453772230209) q[18];
-cx q[3],q[18];
-cx q[4],q[18];
-rz(2.385453772230209) q[18];
-cx q[4],q[18];
-ry(pi/2) q[19];
-rx(pi) q[19];
-cx q[3],q[19];
-rz(2.385453772230209) q[19];
-cx q[3],q[19];
-cx q[7],q[19];
-rz(2.385453772230209) q[19];
-cx q[7],q[19];
-rx(12.15536814514516) q[7];
-rx(12.15536814514516) q[19];
-ry(pi/2) q[20];
-rx(pi) q[20];
-cx q[0],q[20];
-rz(2.385453772230209) q[20];
-cx q[0],q[20];
-cx q[15],q[20];
-rz(2.385453772230209) q[20];
-cx q[15],q[20];
-ry(pi/2) q[21];
-rx(pi) q[21];
-cx q[4],q[21];
-rz(2.385453772230209) q[21];
-cx q[4],q[21];
-cx q[15],q[21];
-rz(2.385453772230209) q[21];
-cx q[15],q[21];
-ry(pi/2) q[22];
-rx(pi) q[22];
-cx q[3],q[22];
-rz(2.385453772230209) q[22];
-cx q[3],q[22];
-cx q[9],q[22];
-rz(2.385453772230209) q[22];
-cx q[9],q[22];
-rx(12.15536814514516) q[9];
-rx(12.15536814514516) q[22];
-ry(pi/2) q[23];
-rx(pi) q[23];
-cx q[3],q[23];
-rz(2.385453772230209) q[23];
-cx q[3],q[23];
-cx q[17],q[23];
-rz(2.385453772230209) q[23];
-cx q[17],q[23];
-rx(12.15536814514516) q[17];
-rx(12.15536814514516) q[23];
-ry(pi/2) q[24];
-rx(pi) q[24];
-cx q[3],q[24];
-rz(2.385453772230209) q[24];
-cx q[3],q[24];
-cx q[5],q[24];
-rz(2.385453772230209) q[24];
-cx q[5],q[24];
-rx(12.15536814514516) q[24];
-ry(pi/2) q[25];
-rx(pi) q[25];
-cx q[3],q[25];
-rz(2.385453772230209) q[25];
-cx q[3],q[25];
-cx q[12],q[25];
-rz(2.385453772230209) q[25];
-cx q[12],q[25];
-rx(12.15536814514516) q[25];
-ry(pi/2) q[26];
-rx(pi) q[26];
-cx q[3],q[26];
-rz(2.385453772230209) q[26];
-cx q[3],q[26];
-cx q[21],q[26];
-rz(2.385453772230209) q[26];
-cx q[21],q[26];
-ry(pi/2) q[27];
-rx(pi) q[27];
-cx q[4],q[27];
-rz(2.385453772230209) q[27];
-cx q[4],q[27];
-rx(12.15536814514516) q[4];
-cx q[6],q[27];
-rz(2.385453772230209) q[27];
-cx q[6],q[27];
-rx(12.15536814514516) q[6];
-rx(12.15536814514516) q[27];
-ry(pi/2) q[28];
-rx(pi) q[28];
-cx q[1],q[28];
-rz(2.385453772230209) q[28];
-cx q[1],q[28];
-cx q[3],q[28];
-rz(2.385453772230209) q[28];
-cx q[3],q[28];
-rx(12.15536814514516) q[28];
-ry(pi/2) q[29];
-rx(pi) q[29];
-cx q[1],q[29];
-rz(2.385453772230209) q[29];
-cx q[1],q[29];
-rx(12.15536814514516) q[1];
-cx q[3],q[29];
-rz(2.385453772230209) q[29];
-cx q[3],q[29];
-rx(12.15536814514516) q[29];
-ry(pi/2) q[30];
-rx(pi) q[30];
-cx q[3],q[30];
-rz(2.385453772230209) q[30];
-cx q[3],q[30];
-cx q[18],q[30];
-rz(2.385453772230209) q[30];
-cx q[18],q[30];
-rx(12.15536814514516) q[18];
-ry(pi/2) q[31];
-rx(pi) q[31];
-cx q[12],q[31];
-rz(2.385453772230209) q[31];
-cx q[12],q[31];
-cx q[26],q[31];
-rz(2.385453772230209) q[31];
-cx q[26],q[31];
-rx(12.15536814514516) q[26];
-rx(12.15536814514516) q[31];
-ry(pi/2) q[32];
-rx(pi) q[32];
-cx q[0],q[32];
-rz(2.385453772230209) q[32];
-cx q[0],q[32];
-rx(12.15536814514516) q[0];
-cx q[0],q[1];
-rz(1.880788908122777) q[1];
-cx q[0],q[1];
-cx q[0],q[2];
-rz(1.880788908122777) q[2];
-cx q[0],q[2];
-rx(3.9335312912272973) q[2];
-cx q[21],q[32];
-rz(2.385453772230209) q[32];
-cx q[21],q[32];
-rx(12.15536814514516) q[21];
-ry(pi/2) q[33];
-rx(pi) q[33];
-cx q[5],q[33];
-rz(2.385453772230209) q[33];
-cx q[5],q[33];
-rx(12.15536814514516) q[5];
-cx q[30],q[33];
-rz(2.385453772230209) q[33];
-cx q[30],q[33];
-rx(12.15536814514516) q[30];
-rx(12.15536814514516) q[33];
-ry(pi/2) q[34];
-rx(pi) q[34];
-cx q[3],q[34];
-rz(2.385453772230209) q[34];
-cx q[3],q[34];
-cx q[12],q[34];
-rz(2.385453772230209) q[34];
-cx q[12],q[34];
-rx(12.15536814514516) q[12];
-ry(pi/2) q[35];
-rx(pi) q[35];
-cx q[3],q[35];
-rz(2.385453772230209) q[35];
-cx q[3],q[35];
-rx(12.15536814514516) q[3];
-cx q[0],q[3];
-rz(1.880788908122777) q[3];
-cx q[0],q[3];
-cx q[1],q[3];
-rz(1.880788908122777) q[3];
-cx q[1],q[3];
-cx q[1],q[4];
-rz(1.880788908122777) q[4];
-cx q[1],q[4];
-cx q[1],q[5];
-cx q[3],q[4];
-rz(1.880788908122777) q[4];
-cx q[3],q[4];
-cx q[4],q[6];
-rz(1.880788908122777) q[5];
-cx q[1],q[5];
-cx q[1],q[9];
-cx q[3],q[5];
-rz(1.880788908122777) q[5];
-cx q[3],q[5];
-cx q[3],q[7];
-rz(1.880788908122777) q[6];
-cx q[4],q[6];
-cx q[5],q[6];
-rz(1.880788908122777) q[6];
-cx q[5],q[6];
-rz(1.880788908122777) q[7];
-cx q[3],q[7];
-cx q[3],q[8];
-cx q[4],q[7];
-rz(1.880788908122777) q[7];
-cx q[4],q[7];
-rz(1.880788908122777) q[8];
-cx q[3],q[8];
-cx q[5],q[8];
-rz(1.880788908122777) q[8];
-cx q[5],q[8];
-cx q[5],q[11];
-rx(3.9335312912272973) q[8];
-rz(1.880788908122777) q[9];
-cx q[1],q[9];
-cx q[1],q[17];
-cx q[3],q[9];
-rz(1.880788908122777) q[9];
-cx q[3],q[9];
-cx q[3],q[12];
-rz(1.880788908122777) q[11];
-cx q[5],q[11];
-rz(1.880788908122777) q[12];
-cx q[3],q[12];
-cx q[3],q[14];
-cx q[5],q[12];
-rz(1.880788908122777) q[12];
-cx q[5],q[12];
-rz(1.880788908122777) q[14];
-cx q[3],q[14];
-rz(1.880788908122777) q[17];
-cx q[1],q[17];
-cx q[1],q[28];
-rz(1.880788908122777) q[28];
-cx q[1],q[28];
-cx q[1],q[29];
-rz(1.880788908122777) q[29];
-cx q[1],q[29];
-rx(3.9335312912272973) q[1];
-cx q[32],q[35];
-rz(2.385453772230209) q[35];
-cx q[32],q[35];
-rx(12.15536814514516) q[32];
-rx(12.15536814514516) q[35];
-ry(pi/2) q[36];
-rx(pi) q[36];
-cx q[15],q[36];
-rz(2.385453772230209) q[36];
-cx q[15],q[36];
-rx(12.15536814514516) q[15];
-cx q[0],q[15];
-rz(1.880788908122777) q[15];
-cx q[0],q[15];
-cx q[0],q[16];
-cx q[3],q[15];
-rz(1.880788908122777) q[15];
-cx q[3],q[15];
-rz(1.880788908122777) q[16];
-cx q[0],q[16];
-cx q[3],q[16];
-rz(1.880788908122777) q[16];
-cx q[3],q[16];
-cx q[3],q[17];
-rx(3.9335312912272973) q[16];
-rz(1.880788908122777) q[17];
-cx q[3],q[17];
-cx q[3],q[18];
-rz(1.880788908122777) q[18];
-cx q[3],q[18];
-cx q[3],q[19];
-rz(1.880788908122777) q[19];
-cx q[3],q[19];
-cx q[3],q[22];
-cx q[7],q[19];
-rz(1.880788908122777) q[19];
-cx q[7],q[19];
-rx(3.9335312912272973) q[7];
-rx(3.9335312912272973) q[19];
-cx q[20],q[36];
-rz(1.880788908122777) q[22];
-cx q[3],q[22];
-cx q[3],q[23];
-cx q[9],q[22];
-rz(1.880788908122777) q[22];
-cx q[9],q[22];
-rx(3.9335312912272973) q[9];
-rx(3.9335312912272973) q[22];
-rz(1.880788908122777) q[23];
-cx q[3],q[23];
-cx q[3],q[24];
-cx q[17],q[23];
-rz(1.880788908122777) q[23];
-cx q[17],q[23];
-rx(3.9335312912272973) q[17];
-rx(3.9335312912272973) q[23];
-rz(1.880788908122777) q[24];
-cx q[3],q[24];
-cx q[3],q[25];
-rz(1.880788908122777) q[25];
-cx q[3],q[25];
-cx q[3],q[26];
-cx q[12],q[25];
-rz(1.880788908122777) q[25];
-cx q[12],q[25];
-cx q[12],q[31];
-rx(3.9335312912272973) q[25];
-rz(1.880788908122777) q[26];
-cx q[3],q[26];
-cx q[3],q[28];
-rz(1.880788908122777) q[28];
-cx q[3],q[28];
-cx q[3],q[29];
-rx(3.9335312912272973) q[28];
-rz(1.880788908122777) q[29];
-cx q[3],q[29];
-cx q[3],q[30];
-rx(3.9335312912272973) q[29];
-rz(1.880788908122777) q[30];
-cx q[3],q[30];
-rz(1.880788908122777) q[31];
-cx q[12],q[31];
-rz(2.385453772230209) q[36];
-cx q[20],q[36];
-rx(12.15536814514516) q[20];
-cx q[0],q[20];
-rz(1.880788908122777) q[20];
-cx q[0],q[20];
-cx q[0],q[32];
-cx q[15],q[20];
-rz(1.880788908122777) q[20];
-cx q[15],q[20];
-rz(1.880788908122777) q[32];
-cx q[0],q[32];
-rx(3.9335312912272973) q[0];
-cx q[0],q[1];
-rz(3.684392831081591) q[1];
-cx q[0],q[1];
-cx q[0],q[2];
-rz(3.684392831081591) q[2];
-cx q[0],q[2];
-rx(4.730501081727813) q[2];
-rx(12.15536814514516) q[36];
-ry(pi/2) q[37];
-rx(pi) q[37];
-cx q[10],q[37];
-rz(2.385453772230209) q[37];
-cx q[10],q[37];
-rx(12.15536814514516) q[10];
-cx q[4],q[10];
-rz(1.880788908122777) q[10];
-cx q[4],q[10];
-cx q[4],q[13];
-cx q[6],q[10];
-rz(1.880788908122777) q[10];
-cx q[6],q[10];
-cx q[6],q[11];
-rz(1.880788908122777) q[11];
-cx q[6],q[11];
-rx(3.9335312912272973) q[11];
-rz(1.880788908122777) q[13];
-cx q[4],q[13];
-cx q[4],q[14];
-cx q[5],q[13];
-rz(1.880788908122777) q[13];
-cx q[5],q[13];
-cx q[5],q[24];
-rx(3.9335312912272973) q[13];
-rz(1.880788908122777) q[14];
-cx q[4],q[14];
-cx q[4],q[18];
-rx(3.9335312912272973) q[14];
-rz(1.880788908122777) q[18];
-cx q[4],q[18];
-cx q[4],q[21];
-cx q[18],q[30];
-rz(1.880788908122777) q[21];
-cx q[4],q[21];
-cx q[4],q[27];
-cx q[15],q[21];
-rz(1.880788908122777) q[21];
-cx q[15],q[21];
-cx q[15],q[36];
-cx q[21],q[26];
-rz(1.880788908122777) q[24];
-cx q[5],q[24];
-cx q[5],q[33];
-rx(3.9335312912272973) q[24];
-rz(1.880788908122777) q[26];
-cx q[21],q[26];
-cx q[21],q[32];
-cx q[26],q[31];
-rz(1.880788908122777) q[27];
-cx q[4],q[27];
-rx(3.9335312912272973) q[4];
-cx q[6],q[27];
-rz(1.880788908122777) q[27];
-cx q[6],q[27];
-rx(3.9335312912272973) q[6];
-rx(3.9335312912272973) q[27];
-rz(1.880788908122777) q[30];
-cx q[18],q[30];
-rx(3.9335312912272973) q[18];
-rz(1.880788908122777) q[31];
-cx q[26],q[31];
-rx(3.9335312912272973) q[26];
-rx(3.9335312912272973) q[31];
-rz(1.880788908122777) q[32];
-cx q[21],q[32];
-rx(3.9335312912272973) q[21];
-rz(1.880788908122777) q[33];
-cx q[5],q[33];
-rx(3.9335312912272973) q[5];
-cx q[30],q[33];
-rz(1.880788908122777) q[33];
-cx q[30],q[33];
-rx(3.9335312912272973) q[30];
-rx(3.9335312912272973) q[33];
-cx q[34],q[37];
-rz(1.880788908122777) q[36];
-cx q[15],q[36];
-rx(3.9335312912272973) q[15];
-cx q[20],q[36];
-rz(1.880788908122777) q[36];
-cx q[20],q[36];
-rx(3.9335312912272973) q[20];
-rx(3.9335312912272973) q[36];
-rz(2.385453772230209) q[37];
-cx q[34],q[37];
-rx(12.15536814514516) q[34];
-cx q[3],q[34];
-rz(1.880788908122777) q[34];
-cx q[3],q[34];
-cx q[3],q[35];
-cx q[12],q[34];
-rz(1.880788908122777) q[34];
-cx q[12],q[34];
-rx(3.9335312912272973) q[12];
-rz(1.880788908122777) q[35];
-cx q[3],q[35];
-rx(3.9335312912272973) q[3];
-cx q[0],q[3];
-rz(3.684392831081591) q[3];
-cx q[0],q[3];
-cx q[0],q[15];
-cx q[1],q[3];
-rz(3.684392831081591) q[3];
-cx q[1],q[3];
-cx q[1],q[4];
-rz(3.684392831081591) q[4];
-cx q[1],q[4];
-cx q[1],q[5];
-cx q[3],q[4];
-rz(3.684392831081591) q[4];
-cx q[3],q[4];
-cx q[4],q[6];
-rz(3.684392831081591) q[5];
-cx q[1],q[5];
-cx q[1],q[9];
-cx q[3],q[5];
-rz(3.684392831081591) q[5];
-cx q[3],q[5];
-cx q[3],q[7];
-rz(3.684392831081591) q[6];
-cx q[4],q[6];
-cx q[5],q[6];
-rz(3.684392831081591) q[6];
-cx q[5],q[6];
-rz(3.684392831081591) q[7];
-cx q[3],q[7];
-cx q[3],q[8];
-cx q[4],q[7];
-rz(3.684392831081591) q[7];
-cx q[4],q[7];
-rz(3.684392831081591) q[8];
-cx q[3],q[8];
-cx q[5],q[8];
-rz(3.684392831081591) q[8];
-cx q[5],q[8];
-cx q[5],q[11];
-rx(4.730501081727813) q[8];
-rz(3.684392831081591) q[9];
-cx q[1],q[9];
-cx q[1],q[17];
-cx q[3],q[9];
-rz(3.684392831081591) q[9];
-cx q[3],q[9];
-cx q[3],q[12];
-rz(3.684392831081591) q[11];
-cx q[5],q[11];
-rz(3.684392831081591) q[12];
-cx q[3],q[12];
-cx q[3],q[14];
-cx q[5],q[12];
-rz(3.684392831081591) q[12];
-cx q[5],q[12];
-rz(3.684392831081591) q[14];
-cx q[3],q[14];
-rz(3.684392831081591) q[15];
-cx q[0],q[15];
-cx q[0],q[16];
-cx q[3],q[15];
-rz(3.684392831081591) q[15];
-cx q[3],q[15];
-rz(3.684392831081591) q[16];
-cx q[0],q[16];
-cx q[0],q[20];
-cx q[3],q[16];
-rz(3.684392831081591) q[16];
-cx q[3],q[16];
-rx(4.730501081727813) q[16];
-rz(3.684392831081591) q[17];
-cx q[1],q[17];
-cx q[1],q[28];
-cx q[3],q[17];
-rz(3.684392831081591) q[17];
-cx q[3],q[17];
-cx q[3],q[18];
-rz(3.684392831081591) q[18];
-cx q[3],q[18];
-cx q[3],q[19];
-rz(3.684392831081591) q[19];
-cx q[3],q[19];
-cx q[3],q[22];
-cx q[7],q[19];
-rz(3.684392831081591) q[19];
-cx q[7],q[19];
-rx(4.730501081727813) q[7];
-rx(4.730501081727813) q[19];
-rz(3.684392831081591) q[20];
-cx q[0],q[20];
-cx q[15],q[20];
-rz(3.684392831081591) q[20];
-cx q[15],q[20];
-rz(3.684392831081591) q[22];
-cx q[3],q[22];
-cx q[3],q[23];
-cx q[9],q[22];
-rz(3.684392831081591) q[22];
-cx q[9],q[22];
-rx(4.730501081727813) q[9];
-rx(4.730501081727813) q[22];
-rz(3.684392831081591) q[23];
-cx q[3],q[23];
-cx q[3],q[24];
-cx q[17],q[23];
-rz(3.684392831081591) q[23];
-cx q[17],q[23];
-rx(4.730501081727813) q[17];
-rx(4.730501081727813) q[23];
-rz(3.684392831081591) q[24];
-cx q[3],q[24];
-cx q[3],q[25];
-rz(3.684392831081591) q[25];
-cx q[3],q[25];
-cx q[3],q[26];
-cx q[12],q[25];
-rz(3.684392831081591) q[25];
-cx q[12],q[25];
-cx q[12],q[31];
-rx(4.730501081727813) q[25];
-rz(3.684392831081591) q[26];
-cx q[3],q[26];
-rz(3.684392831081591) q[28];
-cx q[1],q[28];
-cx q[1],q[29];
-cx q[3],q[28];
-rz(3.684392831081591) q[28];
-cx q[3],q[28];
-rx(4.730501081727813) q[28];
-rz(3.684392831081591) q[29];
-cx q[1],q[29];
-rx(4.730501081727813) q[1];
-cx q[3],q[29];
-rz(3.684392831081591) q[29];
-cx q[3],q[29];
-cx q[3],q[30];
-rx(4.730501081727813) q[29];
-rz(3.684392831081591) q[30];
-cx q[3],q[30];
-rz(3.684392831081591) q[31];
-cx q[12],q[31];
-cx q[32],q[35];
-rz(1.880788908122777) q[35];
-cx q[32],q[35];
-rx(3.9335312912272973) q[32];
-cx q[0],q[32];
-rz(3.684392831081591) q[32];
-cx q[0],q[32];
-rx(4.730501081727813) q[0];
-rx(3.9335312912272973) q[35];
-rx(12.15536814514516) q[37];
-cx q[10],q[37];
-rz(1.880788908122777) q[37];
-cx q[10],q[37];
-rx(3.9335312912272973) q[10];
-cx q[4],q[10];
-rz(3.684392831081591) q[10];
-cx q[4],q[10];
-cx q[4],q[13];
-cx q[6],q[10];
-rz(3.684392831081591) q[10];
-cx q[6],q[10];
-cx q[6],q[11];
-rz(3.684392831081591) q[11];
-cx q[6],q[11];
-rx(4.730501081727813) q[11];
-rz(3.684392831081591) q[13];
-cx q[4],q[13];
-cx q[4],q[14];
-cx q[5],q[13];
-rz(3.684392831081591) q[13];
-cx q[5],q[13];
-cx q[5],q[24];
-rx(4.730501081727813) q[13];
-rz(3.684392831081591) q[14];
-cx q[4],q[14];
-cx q[4],q[18];
-rx(4.730501081727813) q[14];
-rz(3.684392831081591) q[18];
-cx q[4],q[18];
-cx q[4],q[21];
-cx q[18],q[30];
-rz(3.684392831081591) q[21];
-cx q[4],q[21];
-cx q[4],q[27];
-cx q[15],q[21];
-rz(3.684392831081591) q[21];
-cx q[15],q[21];
-cx q[15],q[36];
-cx q[21],q[26];
-rz(3.684392831081591) q[24];
-cx q[5],q[24];
-cx q[5],q[33];
-rx(4.730501081727813) q[24];
-rz(3.684392831081591) q[26];
-cx q[21],q[26];
-cx q[21],q[32];
-cx q[26],q[31];
-rz(3.684392831081591) q[27];
-cx q[4],q[27];
-rx(4.730501081727813) q[4];
-cx q[6],q[27];
-rz(3.684392831081591) q[27];
-cx q[6],q[27];
-rx(4.730501081727813) q[6];
-rx(4.730501081727813) q[27];
-rz(3.684392831081591) q[30];
-cx q[18],q[30];
-rx(4.730501081727813) q[18];
-rz(3.684392831081591) q[31];
-cx q[26],q[31];
-rx(4.730501081727813) q[26];
-rx(4.730501081727813) q[31];
-rz(3.684392831081591) q[32];
-cx q[21],q[32];
-rx(4.730501081727813) q[21];
-rz(3.684392831081591) q[33];
-cx q[5],q[33];
-rx(4.730501081727813) q[5];
-cx q[30],q[33];
-rz(3.684392831081591) q[33];
-cx q[30],q[33];
-rx(4.730501081727813) q[30];
-rx(4.730501081727813) q[33];
-cx q[34],q[37];
-rz(3.684392831081591) q[36];
-cx q[15],q[36];
-rx(4.730501081727813) q[15];
-cx q[20],q[36];
-rz(3.684392831081591) q[36];
-cx q[20],q[36];
-rx(4.730501081727813) q[20];
-rx(4.730501081727813) q[36];
-rz(1.880788908122777) q[37];
-cx q[34],q[37];
-rx(3.9335312912272973) q[34];
-cx q[3],q[34];
-rz(3.684392831081591) q[34];
-cx q[3],q[34];
-cx q[3],q[35];
-cx q[12],q[34];
-rz(3.684392831081591) q[34];
-cx q[12],q[34];
-rx(4.730501081727813) q[12];
-rz(3.684392831081591) q[35];
-cx q[3],q[35];
-rx(4.730501081727813) q[3];
-cx q[32],q[35];
-rz(3.684392831081591) q[35];
-cx q[32],q[35];
-rx(4.730501081727813) q[32];
-rx(4.730501081727813) q[35];
-rx(3.9335312912272973) q[37];
-cx q[10],q[37];
-rz(3.684392831081591) q[37];
-cx q[10],q[37];
-rx(4.730501081727813) q[10];
-cx q[34],q[37];
-rz(3.684392831081591) q[37];
-cx q[34],q[37];
-rx(4.730501081727813) q[34];
-rx(4.730501081727813) q[37];
\ No newline at end of file
@@ -1,864 +0,0 @@
-OPENQASM 2.0;
-include "qelib1.inc";
-qreg q[39];
-ry(pi/2) q[0];
-rx(pi) q[0];
-ry(pi/2) q[1];
-rx(pi) q[1];
-cx q[0],q[1];
-rz(0.4175006978420499) q[1];
-cx q[0],q[1];
-ry(pi/2) q[2];
-rx(pi) q[2];
-cx q[0],q[2];
-rz(0.4175006978420499) q[2];
-cx q[0],q[2];
-rx(5.084658814413635) q[2];
-ry(pi/2) q[3];
-rx(pi) q[3];
-cx q[0],q[3];
-rz(0.4175006978420499) q[3];
-cx q[0],q[3];
-cx q[1],q[3];
-rz(0.4175006978420499) q[3];
-cx q[1],q[3];
-ry(pi/2) q[4];
-rx(pi) q[4];
-cx q[1],q[4];
-rz(0.4175006978420499) q[4];
-cx q[1],q[4];
-cx q[3],q[4];
-rz(0.4175006978420499) q[4];
-cx q[3],q[4];
-ry(pi/2) q[5];
-rx(pi) q[5];
-cx q[1],q[5];
-rz(0.4175006978420499) q[5];
-cx q[1],q[5];
-cx q[3],q[5];
-rz(0.4175006978420499) q[5];
-cx q[3],q[5];
-ry(pi/2) q[6];
-rx(pi) q[6];
-cx q[4],q[6];
-rz(0.4175006978420499) q[6];
-cx q[4],q[6];
-cx q[5],q[6];
-rz(0.4175006978420499) q[6];
-cx q[5],q[6];
-ry(pi/2) q[7];
-rx(pi) q[7];
-cx q[3],q[7];
-rz(0.4175006978420499) q[7];
-cx q[3],q[7];
-cx q[4],q[7];
-rz(0.4175006978420499) q[7];
-cx q[4],q[7];
-ry(pi/2) q[8];
-rx(pi) q[8];
-cx q[3],q[8];
-rz(0.4175006978420499) q[8];
-cx q[3],q[8];
-cx q[5],q[8];
-rz(0.4175006978420499) q[8];
-cx q[5],q[8];
-rx(5.084658814413635) q[8];
-ry(pi/2) q[9];
-rx(pi) q[9];
-cx q[1],q[9];
-rz(0.4175006978420499) q[9];
-cx q[1],q[9];
-cx q[3],q[9];
-rz(0.4175006978420499) q[9];
-cx q[3],q[9];
-ry(pi/2) q[10];
-rx(pi) q[10];
-cx q[4],q[10];
-rz(0.4175006978420499) q[10];
-cx q[4],q[10];
-cx q[6],q[10];
-rz(0.4175006978420499) q[10];
-cx q[6],q[10];
-ry(pi/2) q[11];
-rx(pi) q[11];
-cx q[5],q[11];
-rz(0.4175006978420499) q[11];
-cx q[5],q[11];
-cx q[6],q[11];
-rz(0.4175006978420499) q[11];
-cx q[6],q[11];
-rx(5.084658814413635) q[11];
-ry(pi/2) q[12];
-rx(pi) q[12];
-cx q[3],q[12];
-rz(0.4175006978420499) q[12];
-cx q[3],q[12];
-cx q[5],q[12];
-rz(0.4175006978420499) q[12];
-cx q[5],q[12];
-ry(pi/2) q[13];
-rx(pi) q[13];
-cx q[4],q[13];
-rz(0.4175006978420499) q[13];
-cx q[4],q[13];
-cx q[5],q[13];
-rz(0.4175006978420499) q[13];
-cx q[5],q[13];
-rx(5.084658814413635) q[13];
-ry(pi/2) q[14];
-rx(pi) q[14];
-cx q[3],q[14];
-rz(0.4175006978420499) q[14];
-cx q[3],q[14];
-cx q[4],q[14];
-rz(0.4175006978420499) q[14];
-cx q[4],q[14];
-rx(5.084658814413635) q[14];
-ry(pi/2) q[15];
-rx(pi) q[15];
-cx q[0],q[15];
-rz(0.4175006978420499) q[15];
-cx q[0],q[15];
-cx q[3],q[15];
-rz(0.4175006978420499) q[15];
-cx q[3],q[15];
-ry(pi/2) q[16];
-rx(pi) q[16];
-cx q[0],q[16];
-rz(0.4175006978420499) q[16];
-cx q[0],q[16];
-cx q[3],q[16];
-rz(0.4175006978420499) q[16];
-cx q[3],q[16];
-rx(5.084658814413635) q[16];
-ry(pi/2) q[17];
-rx(pi) q[17];
-cx q[1],q[17];
-rz(0.4175006978420499) q[17];
-cx q[1],q[17];
-cx q[3],q[17];
-rz(0.4175006978420499) q[17];
-cx q[3],q[17];
-ry(pi/2) q[18];
-rx(pi) q[18];
-cx q[3],q[18];
-rz(0.4175006978420499) q[18];
-cx q[3],q[18];
-cx q[4],q[18];
-rz(0.4175006978420499) q[18];
-cx q[4],q[18];
-ry(pi/2) q[19];
-rx(pi) q[19];
-cx q[3],q[19];
-rz(0.4175006978420499) q[19];
-cx q[3],q[19];
-cx q[7],q[19];
-rz(0.4175006978420499) q[19];
-cx q[7],q[19];
-rx(5.084658814413635) q[7];
-ry(pi/2) q[20];
-rx(pi) q[20];
-cx q[0],q[20];
-rz(0.4175006978420499) q[20];
-cx q[0],q[20];
-cx q[15],q[20];
-rz(0.4175006978420499) q[20];
-cx q[15],q[20];
-ry(pi/2) q[21];
-rx(pi) q[21];
-cx q[4],q[21];
-rz(0.4175006978420499) q[21];
-cx q[4],q[21];
-cx q[15],q[21];
-rz(0.4175006978420499) q[21];
-cx q[15],q[21];
-ry(pi/2) q[22];
-rx(pi) q[22];
-cx q[3],q[22];
-rz(0.4175006978420499) q[22];
-cx q[3],q[22];
-cx q[9],q[22];
-rz(0.4175006978420499) q[22];
-cx q[9],q[22];
-rx(5.084658814413635) q[9];
-rx(5.084658814413635) q[22];
-ry(pi/2) q[23];
-rx(pi) q[23];
-cx q[3],q[23];
-rz(0.4175006978420499) q[23];
-cx q[3],q[23];
-cx q[17],q[23];
-rz(0.4175006978420499) q[23];
-cx q[17],q[23];
-rx(5.084658814413635) q[17];
-rx(5.084658814413635) q[23];
-ry(pi/2) q[24];
-rx(pi) q[24];
-cx q[3],q[24];
-rz(0.4175006978420499) q[24];
-cx q[3],q[24];
-cx q[5],q[24];
-rz(0.4175006978420499) q[24];
-cx q[5],q[24];
-rx(5.084658814413635) q[24];
-ry(pi/2) q[25];
-rx(pi) q[25];
-cx q[3],q[25];
-rz(0.4175006978420499) q[25];
-cx q[3],q[25];
-cx q[12],q[25];
-rz(0.4175006978420499) q[25];
-cx q[12],q[25];
-rx(5.084658814413635) q[25];
-ry(pi/2) q[26];
-rx(pi) q[26];
-cx q[3],q[26];
-rz(0.4175006978420499) q[26];
-cx q[3],q[26];
-cx q[21],q[26];
-rz(0.4175006978420499) q[26];
-cx q[21],q[26];
-ry(pi/2) q[27];
-rx(pi) q[27];
-cx q[4],q[27];
-rz(0.4175006978420499) q[27];
-cx q[4],q[27];
-rx(5.084658814413635) q[4];
-cx q[6],q[27];
-rz(0.4175006978420499) q[27];
-cx q[6],q[27];
-rx(5.084658814413635) q[6];
-rx(5.084658814413635) q[27];
-ry(pi/2) q[28];
-rx(pi) q[28];
-cx q[1],q[28];
-rz(0.4175006978420499) q[28];
-cx q[1],q[28];
-cx q[3],q[28];
-rz(0.4175006978420499) q[28];
-cx q[3],q[28];
-rx(5.084658814413635) q[28];
-ry(pi/2) q[29];
-rx(pi) q[29];
-cx q[1],q[29];
-rz(0.4175006978420499) q[29];
-cx q[1],q[29];
-rx(5.084658814413635) q[1];
-cx q[3],q[29];
-rz(0.4175006978420499) q[29];
-cx q[3],q[29];
-rx(5.084658814413635) q[29];
-ry(pi/2) q[30];
-rx(pi) q[30];
-cx q[3],q[30];
-rz(0.4175006978420499) q[30];
-cx q[3],q[30];
-cx q[18],q[30];
-rz(0.4175006978420499) q[30];
-cx q[18],q[30];
-rx(5.084658814413635) q[18];
-ry(pi/2) q[31];
-rx(pi) q[31];
-cx q[12],q[31];
-rz(0.4175006978420499) q[31];
-cx q[12],q[31];
-cx q[26],q[31];
-rz(0.4175006978420499) q[31];
-cx q[26],q[31];
-rx(5.084658814413635) q[26];
-rx(5.084658814413635) q[31];
-ry(pi/2) q[32];
-rx(pi) q[32];
-cx q[0],q[32];
-rz(0.4175006978420499) q[32];
-cx q[0],q[32];
-rx(5.084658814413635) q[0];
-cx q[0],q[1];
-rz(4.354007999292935) q[1];
-cx q[0],q[1];
-cx q[0],q[2];
-rz(4.354007999292935) q[2];
-cx q[0],q[2];
-rx(1.6379581503031504) q[2];
-cx q[21],q[32];
-rz(0.4175006978420499) q[32];
-cx q[21],q[32];
-ry(pi/2) q[33];
-rx(pi) q[33];
-cx q[5],q[33];
-rz(0.4175006978420499) q[33];
-cx q[5],q[33];
-rx(5.084658814413635) q[5];
-cx q[30],q[33];
-rz(0.4175006978420499) q[33];
-cx q[30],q[33];
-rx(5.084658814413635) q[30];
-rx(5.084658814413635) q[33];
-ry(pi/2) q[34];
-rx(pi) q[34];
-cx q[3],q[34];
-rz(0.4175006978420499) q[34];
-cx q[3],q[34];
-cx q[12],q[34];
-rz(0.4175006978420499) q[34];
-cx q[12],q[34];
-rx(5.084658814413635) q[12];
-ry(pi/2) q[35];
-rx(pi) q[35];
-cx q[3],q[35];
-rz(0.4175006978420499) q[35];
-cx q[3],q[35];
-rx(5.084658814413635) q[3];
-cx q[0],q[3];
-rz(4.354007999292935) q[3];
-cx q[0],q[3];
-cx q[1],q[3];
-rz(4.354007999292935) q[3];
-cx q[1],q[3];
-cx q[1],q[4];
-rz(4.354007999292935) q[4];
-cx q[1],q[4];
-cx q[1],q[5];
-cx q[3],q[4];
-rz(4.354007999292935) q[4];
-cx q[3],q[4];
-cx q[4],q[6];
-rz(4.354007999292935) q[5];
-cx q[1],q[5];
-cx q[1],q[9];
-cx q[3],q[5];
-rz(4.354007999292935) q[5];
-cx q[3],q[5];
-cx q[3],q[7];
-rz(4.354007999292935) q[6];
-cx q[4],q[6];
-cx q[5],q[6];
-rz(4.354007999292935) q[6];
-cx q[5],q[6];
-rz(4.354007999292935) q[7];
-cx q[3],q[7];
-cx q[3],q[8];
-cx q[4],q[7];
-rz(4.354007999292935) q[7];
-cx q[4],q[7];
-rz(4.354007999292935) q[8];
-cx q[3],q[8];
-cx q[5],q[8];
-rz(4.354007999292935) q[8];
-cx q[5],q[8];
-cx q[5],q[11];
-rx(1.6379581503031504) q[8];
-rz(4.354007999292935) q[9];
-cx q[1],q[9];
-cx q[1],q[17];
-cx q[3],q[9];
-rz(4.354007999292935) q[9];
-cx q[3],q[9];
-cx q[3],q[12];
-rz(4.354007999292935) q[11];
-cx q[5],q[11];
-rz(4.354007999292935) q[12];
-cx q[3],q[12];
-cx q[3],q[14];
-cx q[5],q[12];
-rz(4.354007999292935) q[12];
-cx q[5],q[12];
-rz(4.354007999292935) q[14];
-cx q[3],q[14];
-rz(4.354007999292935) q[17];
-cx q[1],q[17];
-cx q[1],q[28];
-rz(4.354007999292935) q[28];
-cx q[1],q[28];
-cx q[1],q[29];
-rz(4.354007999292935) q[29];
-cx q[1],q[29];
-rx(1.6379581503031504) q[1];
-cx q[32],q[35];
-rz(0.4175006978420499) q[35];
-cx q[32],q[35];
-rx(5.084658814413635) q[32];
-rx(5.084658814413635) q[35];
-ry(pi/2) q[36];
-rx(pi) q[36];
-cx q[15],q[36];
-rz(0.4175006978420499) q[36];
-cx q[15],q[36];
-rx(5.084658814413635) q[15];
-cx q[0],q[15];
-rz(4.354007999292935) q[15];
-cx q[0],q[15];
-cx q[0],q[16];
-cx q[3],q[15];
-rz(4.354007999292935) q[15];
-cx q[3],q[15];
-rz(4.354007999292935) q[16];
-cx q[0],q[16];
-cx q[3],q[16];
-rz(4.354007999292935) q[16];
-cx q[3],q[16];
-cx q[3],q[17];
-rx(1.6379581503031504) q[16];
-rz(4.354007999292935) q[17];
-cx q[3],q[17];
-cx q[3],q[18];
-rz(4.354007999292935) q[18];
-cx q[3],q[18];
-cx q[20],q[36];
-rz(0.4175006978420499) q[36];
-cx q[20],q[36];
-rx(5.084658814413635) q[20];
-cx q[0],q[20];
-rz(4.354007999292935) q[20];
-cx q[0],q[20];
-cx q[0],q[32];
-cx q[15],q[20];
-rz(4.354007999292935) q[20];
-cx q[15],q[20];
-rz(4.354007999292935) q[32];
-cx q[0],q[32];
-rx(1.6379581503031504) q[0];
-cx q[0],q[1];
-rz(1.3891754774497829) q[1];
-cx q[0],q[1];
-cx q[0],q[2];
-rz(1.3891754774497829) q[2];
-cx q[0],q[2];
-rx(2.689771836536133) q[2];
-rx(5.084658814413635) q[36];
-ry(pi/2) q[37];
-rx(pi) q[37];
-cx q[10],q[37];
-rz(0.4175006978420499) q[37];
-cx q[10],q[37];
-rx(5.084658814413635) q[10];
-cx q[4],q[10];
-rz(4.354007999292935) q[10];
-cx q[4],q[10];
-cx q[4],q[13];
-cx q[6],q[10];
-rz(4.354007999292935) q[10];
-cx q[6],q[10];
-cx q[6],q[11];
-rz(4.354007999292935) q[11];
-cx q[6],q[11];
-rx(1.6379581503031504) q[11];
-rz(4.354007999292935) q[13];
-cx q[4],q[13];
-cx q[4],q[14];
-cx q[5],q[13];
-rz(4.354007999292935) q[13];
-cx q[5],q[13];
-rx(1.6379581503031504) q[13];
-rz(4.354007999292935) q[14];
-cx q[4],q[14];
-cx q[4],q[18];
-rx(1.6379581503031504) q[14];
-rz(4.354007999292935) q[18];
-cx q[4],q[18];
-cx q[34],q[37];
-rz(0.4175006978420499) q[37];
-cx q[34],q[37];
-rx(5.084658814413635) q[34];
-rx(5.084658814413635) q[37];
-cx q[10],q[37];
-rz(4.354007999292935) q[37];
-cx q[10],q[37];
-rx(1.6379581503031504) q[10];
-ry(pi/2) q[38];
-rx(pi) q[38];
-cx q[19],q[38];
-rz(0.4175006978420499) q[38];
-cx q[19],q[38];
-rx(5.084658814413635) q[19];
-cx q[3],q[19];
-rz(4.354007999292935) q[19];
-cx q[3],q[19];
-cx q[3],q[22];
-cx q[7],q[19];
-rz(4.354007999292935) q[19];
-cx q[7],q[19];
-rx(1.6379581503031504) q[7];
-cx q[21],q[38];
-rz(4.354007999292935) q[22];
-cx q[3],q[22];
-cx q[3],q[23];
-cx q[9],q[22];
-rz(4.354007999292935) q[22];
-cx q[9],q[22];
-rx(1.6379581503031504) q[9];
-rx(1.6379581503031504) q[22];
-rz(4.354007999292935) q[23];
-cx q[3],q[23];
-cx q[3],q[24];
-cx q[17],q[23];
-rz(4.354007999292935) q[23];
-cx q[17],q[23];
-rx(1.6379581503031504) q[17];
-rx(1.6379581503031504) q[23];
-rz(4.354007999292935) q[24];
-cx q[3],q[24];
-cx q[3],q[25];
-cx q[5],q[24];
-rz(4.354007999292935) q[24];
-cx q[5],q[24];
-cx q[5],q[33];
-rx(1.6379581503031504) q[24];
-rz(4.354007999292935) q[25];
-cx q[3],q[25];
-cx q[3],q[26];
-cx q[12],q[25];
-rz(4.354007999292935) q[25];
-cx q[12],q[25];
-cx q[12],q[31];
-rx(1.6379581503031504) q[25];
-rz(4.354007999292935) q[26];
-cx q[3],q[26];
-cx q[3],q[28];
-rz(4.354007999292935) q[28];
-cx q[3],q[28];
-cx q[3],q[29];
-rx(1.6379581503031504) q[28];
-rz(4.354007999292935) q[29];
-cx q[3],q[29];
-cx q[3],q[30];
-rx(1.6379581503031504) q[29];
-rz(4.354007999292935) q[30];
-cx q[3],q[30];
-cx q[3],q[34];
-cx q[18],q[30];
-rz(4.354007999292935) q[30];
-cx q[18],q[30];
-rx(1.6379581503031504) q[18];
-rz(4.354007999292935) q[31];
-cx q[12],q[31];
-rz(4.354007999292935) q[33];
-cx q[5],q[33];
-rx(1.6379581503031504) q[5];
-cx q[30],q[33];
-rz(4.354007999292935) q[33];
-cx q[30],q[33];
-rx(1.6379581503031504) q[30];
-rx(1.6379581503031504) q[33];
-rz(4.354007999292935) q[34];
-cx q[3],q[34];
-cx q[3],q[35];
-cx q[12],q[34];
-rz(4.354007999292935) q[34];
-cx q[12],q[34];
-rx(1.6379581503031504) q[12];
-cx q[34],q[37];
-rz(4.354007999292935) q[35];
-cx q[3],q[35];
-rx(1.6379581503031504) q[3];
-cx q[0],q[3];
-rz(1.3891754774497829) q[3];
-cx q[0],q[3];
-cx q[1],q[3];
-rz(1.3891754774497829) q[3];
-cx q[1],q[3];
-rz(4.354007999292935) q[37];
-cx q[34],q[37];
-rx(1.6379581503031504) q[34];
-rx(1.6379581503031504) q[37];
-rz(0.4175006978420499) q[38];
-cx q[21],q[38];
-rx(5.084658814413635) q[21];
-cx q[4],q[21];
-rz(4.354007999292935) q[21];
-cx q[4],q[21];
-cx q[4],q[27];
-cx q[15],q[21];
-rz(4.354007999292935) q[21];
-cx q[15],q[21];
-cx q[15],q[36];
-cx q[21],q[26];
-rz(4.354007999292935) q[26];
-cx q[21],q[26];
-cx q[21],q[32];
-cx q[26],q[31];
-rz(4.354007999292935) q[27];
-cx q[4],q[27];
-rx(1.6379581503031504) q[4];
-cx q[1],q[4];
-rz(1.3891754774497829) q[4];
-cx q[1],q[4];
-cx q[1],q[5];
-cx q[3],q[4];
-rz(1.3891754774497829) q[4];
-cx q[3],q[4];
-rz(1.3891754774497829) q[5];
-cx q[1],q[5];
-cx q[1],q[9];
-cx q[3],q[5];
-rz(1.3891754774497829) q[5];
-cx q[3],q[5];
-cx q[3],q[7];
-cx q[6],q[27];
-rz(1.3891754774497829) q[7];
-cx q[3],q[7];
-cx q[3],q[8];
-rz(1.3891754774497829) q[8];
-cx q[3],q[8];
-rz(1.3891754774497829) q[9];
-cx q[1],q[9];
-cx q[1],q[17];
-cx q[3],q[9];
-rz(1.3891754774497829) q[9];
-cx q[3],q[9];
-cx q[3],q[12];
-rz(1.3891754774497829) q[12];
-cx q[3],q[12];
-cx q[3],q[14];
-rz(1.3891754774497829) q[14];
-cx q[3],q[14];
-rz(1.3891754774497829) q[17];
-cx q[1],q[17];
-cx q[1],q[28];
-rz(4.354007999292935) q[27];
-cx q[6],q[27];
-rx(1.6379581503031504) q[6];
-cx q[4],q[6];
-rz(1.3891754774497829) q[6];
-cx q[4],q[6];
-cx q[4],q[7];
-cx q[5],q[6];
-rz(1.3891754774497829) q[6];
-cx q[5],q[6];
-cx q[5],q[8];
-rz(1.3891754774497829) q[7];
-cx q[4],q[7];
-cx q[4],q[10];
-rz(1.3891754774497829) q[8];
-cx q[5],q[8];
-cx q[5],q[11];
-rx(2.689771836536133) q[8];
-rz(1.3891754774497829) q[10];
-cx q[4],q[10];
-cx q[4],q[13];
-cx q[6],q[10];
-rz(1.3891754774497829) q[10];
-cx q[6],q[10];
-cx q[10],q[37];
-rz(1.3891754774497829) q[11];
-cx q[5],q[11];
-cx q[5],q[12];
-cx q[6],q[11];
-rz(1.3891754774497829) q[11];
-cx q[6],q[11];
-rx(2.689771836536133) q[11];
-rz(1.3891754774497829) q[12];
-cx q[5],q[12];
-rz(1.3891754774497829) q[13];
-cx q[4],q[13];
-cx q[4],q[14];
-cx q[5],q[13];
-rz(1.3891754774497829) q[13];
-cx q[5],q[13];
-rx(2.689771836536133) q[13];
-rz(1.3891754774497829) q[14];
-cx q[4],q[14];
-rx(2.689771836536133) q[14];
-rx(1.6379581503031504) q[27];
-rz(1.3891754774497829) q[28];
-cx q[1],q[28];
-cx q[1],q[29];
-rz(1.3891754774497829) q[29];
-cx q[1],q[29];
-rx(2.689771836536133) q[1];
-rz(4.354007999292935) q[31];
-cx q[26],q[31];
-rx(1.6379581503031504) q[26];
-rx(1.6379581503031504) q[31];
-rz(4.354007999292935) q[32];
-cx q[21],q[32];
-cx q[32],q[35];
-rz(4.354007999292935) q[35];
-cx q[32],q[35];
-rx(1.6379581503031504) q[32];
-rx(1.6379581503031504) q[35];
-rz(4.354007999292935) q[36];
-cx q[15],q[36];
-rx(1.6379581503031504) q[15];
-cx q[0],q[15];
-rz(1.3891754774497829) q[15];
-cx q[0],q[15];
-cx q[0],q[16];
-cx q[3],q[15];
-rz(1.3891754774497829) q[15];
-cx q[3],q[15];
-rz(1.3891754774497829) q[16];
-cx q[0],q[16];
-cx q[3],q[16];
-rz(1.3891754774497829) q[16];
-cx q[3],q[16];
-cx q[3],q[17];
-rx(2.689771836536133) q[16];
-rz(1.3891754774497829) q[17];
-cx q[3],q[17];
-cx q[3],q[18];
-rz(1.3891754774497829) q[18];
-cx q[3],q[18];
-cx q[4],q[18];
-rz(1.3891754774497829) q[18];
-cx q[4],q[18];
-cx q[20],q[36];
-rz(4.354007999292935) q[36];
-cx q[20],q[36];
-rx(1.6379581503031504) q[20];
-cx q[0],q[20];
-rz(1.3891754774497829) q[20];
-cx q[0],q[20];
-cx q[0],q[32];
-cx q[15],q[20];
-rz(1.3891754774497829) q[20];
-cx q[15],q[20];
-rz(1.3891754774497829) q[32];
-cx q[0],q[32];
-rx(2.689771836536133) q[0];
-rx(1.6379581503031504) q[36];
-rz(1.3891754774497829) q[37];
-cx q[10],q[37];
-rx(2.689771836536133) q[10];
-rx(5.084658814413635) q[38];
-cx q[19],q[38];
-rz(4.354007999292935) q[38];
-cx q[19],q[38];
-rx(1.6379581503031504) q[19];
-cx q[3],q[19];
-rz(1.3891754774497829) q[19];
-cx q[3],q[19];
-cx q[3],q[22];
-cx q[7],q[19];
-rz(1.3891754774497829) q[19];
-cx q[7],q[19];
-rx(2.689771836536133) q[7];
-cx q[21],q[38];
-rz(1.3891754774497829) q[22];
-cx q[3],q[22];
-cx q[3],q[23];
-cx q[9],q[22];
-rz(1.3891754774497829) q[22];
-cx q[9],q[22];
-rx(2.689771836536133) q[9];
-rx(2.689771836536133) q[22];
-rz(1.3891754774497829) q[23];
-cx q[3],q[23];
-cx q[3],q[24];
-cx q[17],q[23];
-rz(1.3891754774497829) q[23];
-cx q[17],q[23];
-rx(2.689771836536133) q[17];
-rx(2.689771836536133) q[23];
-rz(1.3891754774497829) q[24];
-cx q[3],q[24];
-cx q[3],q[25];
-cx q[5],q[24];
-rz(1.3891754774497829) q[24];
-cx q[5],q[24];
-cx q[5],q[33];
-rx(2.689771836536133) q[24];
-rz(1.3891754774497829) q[25];
-cx q[3],q[25];
-cx q[3],q[26];
-cx q[12],q[25];
-rz(1.3891754774497829) q[25];
-cx q[12],q[25];
-cx q[12],q[31];
-rx(2.689771836536133) q[25];
-rz(1.3891754774497829) q[26];
-cx q[3],q[26];
-cx q[3],q[28];
-rz(1.3891754774497829) q[28];
-cx q[3],q[28];
-cx q[3],q[29];
-rx(2.689771836536133) q[28];
-rz(1.3891754774497829) q[29];
-cx q[3],q[29];
-cx q[3],q[30];
-rx(2.689771836536133) q[29];
-rz(1.3891754774497829) q[30];
-cx q[3],q[30];
-cx q[3],q[34];
-cx q[18],q[30];
-rz(1.3891754774497829) q[30];
-cx q[18],q[30];
-rx(2.689771836536133) q[18];
-rz(1.3891754774497829) q[31];
-cx q[12],q[31];
-rz(1.3891754774497829) q[33];
-cx q[5],q[33];
-rx(2.689771836536133) q[5];
-cx q[30],q[33];
-rz(1.3891754774497829) q[33];
-cx q[30],q[33];
-rx(2.689771836536133) q[30];
-rx(2.689771836536133) q[33];
-rz(1.3891754774497829) q[34];
-cx q[3],q[34];
-cx q[3],q[35];
-cx q[12],q[34];
-rz(1.3891754774497829) q[34];
-cx q[12],q[34];
-rx(2.689771836536133) q[12];
-cx q[34],q[37];
-rz(1.3891754774497829) q[35];
-cx q[3],q[35];
-rx(2.689771836536133) q[3];
-rz(1.3891754774497829) q[37];
-cx q[34],q[37];
-rx(2.689771836536133) q[34];
-rx(2.689771836536133) q[37];
-rz(4.354007999292935) q[38];
-cx q[21],q[38];
-rx(1.6379581503031504) q[21];
-cx q[4],q[21];
-rz(1.3891754774497829) q[21];
-cx q[4],q[21];
-cx q[4],q[27];
-cx q[15],q[21];
-rz(1.3891754774497829) q[21];
-cx q[15],q[21];
-cx q[15],q[36];
-cx q[21],q[26];
-rz(1.3891754774497829) q[26];
-cx q[21],q[26];
-cx q[21],q[32];
-cx q[26],q[31];
-rz(1.3891754774497829) q[27];
-cx q[4],q[27];
-rx(2.689771836536133) q[4];
-cx q[6],q[27];
-rz(1.3891754774497829) q[27];
-cx q[6],q[27];
-rx(2.689771836536133) q[6];
-rx(2.689771836536133) q[27];
-rz(1.3891754774497829) q[31];
-cx q[26],q[31];
-rx(2.689771836536133) q[26];
-rx(2.689771836536133) q[31];
-rz(1.3891754774497829) q[32];
-cx q[21],q[32];
-cx q[32],q[35];
-rz(1.3891754774497829) q[35];
-cx q[32],q[35];
-rx(2.689771836536133) q[32];
-rx(2.689771836536133) q[35];
-rz(1.3891754774497829) q[36];
-cx q[15],q[36];
-rx(2.689771836536133) q[15];
-cx q[20],q[36];
-rz(1.3891754774497829) q[36];
-cx q[20],q[36];
-rx(2.689771836536133) q[20];
-rx(2.689771836536133) q[36];
-rx(1.6379581503031504) q[38];
-cx q[19],q[38];
-rz(1.3891754774497829) q[38];
-cx q[19],q[38];
-rx(2.689771836536133) q[19];
-cx q[21],q[38];
-rz(1.3891754774497829) q[38];
-cx q[21],q[38];
-rx(2.689771836536133) q[21];
-rx(2.689771836536133) q[38];
\ No newline at end of file
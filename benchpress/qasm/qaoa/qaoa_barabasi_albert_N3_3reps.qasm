@@ -1,36 +0,0 @@
-OPENQASM 2.0;
-include "qelib1.inc";
-qreg q[3];
-ry(pi/2) q[0];
-rx(pi) q[0];
-ry(pi/2) q[1];
-rx(pi) q[1];
-cx q[0],q[1];
-rz(5.519070831920059) q[1];
-cx q[0],q[1];
-rx(2.8160110446884863) q[1];
-ry(pi/2) q[2];
-rx(pi) q[2];
-cx q[0],q[2];
-rz(5.519070831920059) q[2];
-cx q[0],q[2];
-rx(2.8160110446884863) q[0];
-cx q[0],q[1];
-rz(4.644782666800014) q[1];
-cx q[0],q[1];
-rx(4.019063011520075) q[1];
-rx(2.8160110446884863) q[2];
-cx q[0],q[2];
-rz(4.644782666800014) q[2];
-cx q[0],q[2];
-rx(4.019063011520075) q[0];
-cx q[0],q[1];
-rz(6.1255763956676015) q[1];
-cx q[0],q[1];
-rx(9.862165464952156) q[1];
-rx(4.019063011520075) q[2];
-cx q[0],q[2];
-rz(6.1255763956676015) q[2];
-cx q[0],q[2];
-rx(9.862165464952156) q[0];
-rx(9.862165464952156) q[2];
\ No newline at end of file
@@ -1,887 +0,0 @@
-OPENQASM 2.0;
-include "qelib1.inc";
-qreg q[40];
-ry(pi/2) q[0];
-rx(pi) q[0];
-ry(pi/2) q[1];
-rx(pi) q[1];
-cx q[0],q[1];
-rz(2.0829074063961284) q[1];
-cx q[0],q[1];
-ry(pi/2) q[2];
-rx(pi) q[2];
-cx q[0],q[2];
-rz(2.0829074063961284) q[2];
-cx q[0],q[2];
-rx(7.7082437234380725) q[2];
-ry(pi/2) q[3];
-rx(pi) q[3];
-cx q[0],q[3];
-rz(2.0829074063961284) q[3];
-cx q[0],q[3];
-cx q[1],q[3];
-rz(2.0829074063961284) q[3];
-cx q[1],q[3];
-ry(pi/2) q[4];
-rx(pi) q[4];
-cx q[1],q[4];
-rz(2.0829074063961284) q[4];
-cx q[1],q[4];
-cx q[3],q[4];
-rz(2.0829074063961284) q[4];
-cx q[3],q[4];
-ry(pi/2) q[5];
-rx(pi) q[5];
-cx q[1],q[5];
-rz(2.0829074063961284) q[5];
-cx q[1],q[5];
-cx q[3],q[5];
-rz(2.0829074063961284) q[5];
-cx q[3],q[5];
-ry(pi/2) q[6];
-rx(pi) q[6];
-cx q[4],q[6];
-rz(2.0829074063961284) q[6];
-cx q[4],q[6];
-cx q[5],q[6];
-rz(2.0829074063961284) q[6];
-cx q[5],q[6];
-ry(pi/2) q[7];
-rx(pi) q[7];
-cx q[3],q[7];
-rz(2.0829074063961284) q[7];
-cx q[3],q[7];
-cx q[4],q[7];
-rz(2.0829074063961284) q[7];
-cx q[4],q[7];
-ry(pi/2) q[8];
-rx(pi) q[8];
-cx q[3],q[8];
-rz(2.0829074063961284) q[8];
-cx q[3],q[8];
-cx q[5],q[8];
-rz(2.0829074063961284) q[8];
-cx q[5],q[8];
-rx(7.7082437234380725) q[8];
-ry(pi/2) q[9];
-rx(pi) q[9];
-cx q[1],q[9];
-rz(2.0829074063961284) q[9];
-cx q[1],q[9];
-cx q[3],q[9];
-rz(2.0829074063961284) q[9];
-cx q[3],q[9];
-ry(pi/2) q[10];
-rx(pi) q[10];
-cx q[4],q[10];
-rz(2.0829074063961284) q[10];
-cx q[4],q[10];
-cx q[6],q[10];
-rz(2.0829074063961284) q[10];
-cx q[6],q[10];
-ry(pi/2) q[11];
-rx(pi) q[11];
-cx q[5],q[11];
-rz(2.0829074063961284) q[11];
-cx q[5],q[11];
-cx q[6],q[11];
-rz(2.0829074063961284) q[11];
-cx q[6],q[11];
-rx(7.7082437234380725) q[11];
-ry(pi/2) q[12];
-rx(pi) q[12];
-cx q[3],q[12];
-rz(2.0829074063961284) q[12];
-cx q[3],q[12];
-cx q[5],q[12];
-rz(2.0829074063961284) q[12];
-cx q[5],q[12];
-ry(pi/2) q[13];
-rx(pi) q[13];
-cx q[4],q[13];
-rz(2.0829074063961284) q[13];
-cx q[4],q[13];
-cx q[5],q[13];
-rz(2.0829074063961284) q[13];
-cx q[5],q[13];
-ry(pi/2) q[14];
-rx(pi) q[14];
-cx q[3],q[14];
-rz(2.0829074063961284) q[14];
-cx q[3],q[14];
-cx q[4],q[14];
-rz(2.0829074063961284) q[14];
-cx q[4],q[14];
-rx(7.7082437234380725) q[14];
-ry(pi/2) q[15];
-rx(pi) q[15];
-cx q[0],q[15];
-rz(2.0829074063961284) q[15];
-cx q[0],q[15];
-cx q[3],q[15];
-rz(2.0829074063961284) q[15];
-cx q[3],q[15];
-ry(pi/2) q[16];
-rx(pi) q[16];
-cx q[0],q[16];
-rz(2.0829074063961284) q[16];
-cx q[0],q[16];
-cx q[3],q[16];
-rz(2.0829074063961284) q[16];
-cx q[3],q[16];
-rx(7.7082437234380725) q[16];
-ry(pi/2) q[17];
-rx(pi) q[17];
-cx q[1],q[17];
-rz(2.0829074063961284) q[17];
-cx q[1],q[17];
-cx q[3],q[17];
-rz(2.0829074063961284) q[17];
-cx q[3],q[17];
-ry(pi/2) q[18];
-rx(pi) q[18];
-cx q[3],q[18];
-rz(2.0829074063961284) q[18];
-cx q[3],q[18];
-cx q[4],q[18];
-rz(2.0829074063961284) q[18];
-cx q[4],q[18];
-ry(pi/2) q[19];
-rx(pi) q[19];
-cx q[3],q[19];
-rz(2.0829074063961284) q[19];
-cx q[3],q[19];
-cx q[7],q[19];
-rz(2.0829074063961284) q[19];
-cx q[7],q[19];
-rx(7.7082437234380725) q[7];
-ry(pi/2) q[20];
-rx(pi) q[20];
-cx q[0],q[20];
-rz(2.0829074063961284) q[20];
-cx q[0],q[20];
-cx q[15],q[20];
-rz(2.0829074063961284) q[20];
-cx q[15],q[20];
-ry(pi/2) q[21];
-rx(pi) q[21];
-cx q[4],q[21];
-rz(2.0829074063961284) q[21];
-cx q[4],q[21];
-cx q[15],q[21];
-rz(2.0829074063961284) q[21];
-cx q[15],q[21];
-ry(pi/2) q[22];
-rx(pi) q[22];
-cx q[3],q[22];
-rz(2.0829074063961284) q[22];
-cx q[3],q[22];
-cx q[9],q[22];
-rz(2.0829074063961284) q[22];
-cx q[9],q[22];
-rx(7.7082437234380725) q[9];
-rx(7.7082437234380725) q[22];
-ry(pi/2) q[23];
-rx(pi) q[23];
-cx q[3],q[23];
-rz(2.0829074063961284) q[23];
-cx q[3],q[23];
-cx q[17],q[23];
-rz(2.0829074063961284) q[23];
-cx q[17],q[23];
-rx(7.7082437234380725) q[17];
-rx(7.7082437234380725) q[23];
-ry(pi/2) q[24];
-rx(pi) q[24];
-cx q[3],q[24];
-rz(2.0829074063961284) q[24];
-cx q[3],q[24];
-cx q[5],q[24];
-rz(2.0829074063961284) q[24];
-cx q[5],q[24];
-rx(7.7082437234380725) q[24];
-ry(pi/2) q[25];
-rx(pi) q[25];
-cx q[3],q[25];
-rz(2.0829074063961284) q[25];
-cx q[3],q[25];
-cx q[12],q[25];
-rz(2.0829074063961284) q[25];
-cx q[12],q[25];
-rx(7.7082437234380725) q[25];
-ry(pi/2) q[26];
-rx(pi) q[26];
-cx q[3],q[26];
-rz(2.0829074063961284) q[26];
-cx q[3],q[26];
-cx q[21],q[26];
-rz(2.0829074063961284) q[26];
-cx q[21],q[26];
-ry(pi/2) q[27];
-rx(pi) q[27];
-cx q[4],q[27];
-rz(2.0829074063961284) q[27];
-cx q[4],q[27];
-rx(7.7082437234380725) q[4];
-cx q[6],q[27];
-rz(2.0829074063961284) q[27];
-cx q[6],q[27];
-rx(7.7082437234380725) q[6];
-rx(7.7082437234380725) q[27];
-ry(pi/2) q[28];
-rx(pi) q[28];
-cx q[1],q[28];
-rz(2.0829074063961284) q[28];
-cx q[1],q[28];
-cx q[3],q[28];
-rz(2.0829074063961284) q[28];
-cx q[3],q[28];
-rx(7.7082437234380725) q[28];
-ry(pi/2) q[29];
-rx(pi) q[29];
-cx q[1],q[29];
-rz(2.0829074063961284) q[29];
-cx q[1],q[29];
-rx(7.7082437234380725) q[1];
-cx q[3],q[29];
-rz(2.0829074063961284) q[29];
-cx q[3],q[29];
-rx(7.7082437234380725) q[29];
-ry(pi/2) q[30];
-rx(pi) q[30];
-cx q[3],q[30];
-rz(2.0829074063961284) q[30];
-cx q[3],q[30];
-cx q[18],q[30];
-rz(2.0829074063961284) q[30];
-cx q[18],q[30];
-rx(7.7082437234380725) q[18];
-ry(pi/2) q[31];
-rx(pi) q[31];
-cx q[12],q[31];
-rz(2.0829074063961284) q[31];
-cx q[12],q[31];
-cx q[26],q[31];
-rz(2.0829074063961284) q[31];
-cx q[26],q[31];
-rx(7.7082437234380725) q[26];
-rx(7.7082437234380725) q[31];
-ry(pi/2) q[32];
-rx(pi) q[32];
-cx q[0],q[32];
-rz(2.0829074063961284) q[32];
-cx q[0],q[32];
-rx(7.7082437234380725) q[0];
-cx q[0],q[1];
-rz(0.6364507575827141) q[1];
-cx q[0],q[1];
-cx q[0],q[2];
-rz(0.6364507575827141) q[2];
-cx q[0],q[2];
-rx(4.982856290954853) q[2];
-cx q[21],q[32];
-rz(2.0829074063961284) q[32];
-cx q[21],q[32];
-ry(pi/2) q[33];
-rx(pi) q[33];
-cx q[5],q[33];
-rz(2.0829074063961284) q[33];
-cx q[5],q[33];
-rx(7.7082437234380725) q[5];
-cx q[30],q[33];
-rz(2.0829074063961284) q[33];
-cx q[30],q[33];
-rx(7.7082437234380725) q[30];
-rx(7.7082437234380725) q[33];
-ry(pi/2) q[34];
-rx(pi) q[34];
-cx q[3],q[34];
-rz(2.0829074063961284) q[34];
-cx q[3],q[34];
-cx q[12],q[34];
-rz(2.0829074063961284) q[34];
-cx q[12],q[34];
-rx(7.7082437234380725) q[12];
-ry(pi/2) q[35];
-rx(pi) q[35];
-cx q[3],q[35];
-rz(2.0829074063961284) q[35];
-cx q[3],q[35];
-cx q[32],q[35];
-rz(2.0829074063961284) q[35];
-cx q[32],q[35];
-rx(7.7082437234380725) q[32];
-rx(7.7082437234380725) q[35];
-ry(pi/2) q[36];
-rx(pi) q[36];
-cx q[15],q[36];
-rz(2.0829074063961284) q[36];
-cx q[15],q[36];
-rx(7.7082437234380725) q[15];
-cx q[20],q[36];
-rz(2.0829074063961284) q[36];
-cx q[20],q[36];
-rx(7.7082437234380725) q[20];
-rx(7.7082437234380725) q[36];
-ry(pi/2) q[37];
-rx(pi) q[37];
-cx q[10],q[37];
-rz(2.0829074063961284) q[37];
-cx q[10],q[37];
-rx(7.7082437234380725) q[10];
-cx q[34],q[37];
-rz(2.0829074063961284) q[37];
-cx q[34],q[37];
-rx(7.7082437234380725) q[34];
-rx(7.7082437234380725) q[37];
-ry(pi/2) q[38];
-rx(pi) q[38];
-cx q[19],q[38];
-rz(2.0829074063961284) q[38];
-cx q[19],q[38];
-rx(7.7082437234380725) q[19];
-cx q[21],q[38];
-rz(2.0829074063961284) q[38];
-cx q[21],q[38];
-rx(7.7082437234380725) q[21];
-rx(7.7082437234380725) q[38];
-ry(pi/2) q[39];
-rx(pi) q[39];
-cx q[3],q[39];
-rz(2.0829074063961284) q[39];
-cx q[3],q[39];
-rx(7.7082437234380725) q[3];
-cx q[0],q[3];
-rz(0.6364507575827141) q[3];
-cx q[0],q[3];
-cx q[0],q[15];
-cx q[1],q[3];
-rz(0.6364507575827141) q[3];
-cx q[1],q[3];
-cx q[1],q[4];
-rz(0.6364507575827141) q[4];
-cx q[1],q[4];
-cx q[1],q[5];
-cx q[3],q[4];
-rz(0.6364507575827141) q[4];
-cx q[3],q[4];
-cx q[4],q[6];
-rz(0.6364507575827141) q[5];
-cx q[1],q[5];
-cx q[1],q[9];
-cx q[3],q[5];
-rz(0.6364507575827141) q[5];
-cx q[3],q[5];
-cx q[3],q[7];
-rz(0.6364507575827141) q[6];
-cx q[4],q[6];
-cx q[5],q[6];
-rz(0.6364507575827141) q[6];
-cx q[5],q[6];
-rz(0.6364507575827141) q[7];
-cx q[3],q[7];
-cx q[3],q[8];
-cx q[4],q[7];
-rz(0.6364507575827141) q[7];
-cx q[4],q[7];
-cx q[4],q[10];
-rz(0.6364507575827141) q[8];
-cx q[3],q[8];
-cx q[5],q[8];
-rz(0.6364507575827141) q[8];
-cx q[5],q[8];
-cx q[5],q[11];
-rx(4.982856290954853) q[8];
-rz(0.6364507575827141) q[9];
-cx q[1],q[9];
-cx q[1],q[17];
-cx q[3],q[9];
-rz(0.6364507575827141) q[9];
-cx q[3],q[9];
-cx q[3],q[12];
-rz(0.6364507575827141) q[10];
-cx q[4],q[10];
-cx q[6],q[10];
-rz(0.6364507575827141) q[10];
-cx q[6],q[10];
-cx q[10],q[37];
-rz(0.6364507575827141) q[11];
-cx q[5],q[11];
-cx q[6],q[11];
-rz(0.6364507575827141) q[11];
-cx q[6],q[11];
-rx(4.982856290954853) q[11];
-rz(0.6364507575827141) q[12];
-cx q[3],q[12];
-cx q[3],q[14];
-cx q[5],q[12];
-rz(0.6364507575827141) q[12];
-cx q[5],q[12];
-cx q[13],q[39];
-rz(0.6364507575827141) q[14];
-cx q[3],q[14];
-rz(0.6364507575827141) q[15];
-cx q[0],q[15];
-cx q[0],q[16];
-cx q[3],q[15];
-rz(0.6364507575827141) q[15];
-cx q[3],q[15];
-rz(0.6364507575827141) q[16];
-cx q[0],q[16];
-cx q[0],q[20];
-cx q[3],q[16];
-rz(0.6364507575827141) q[16];
-cx q[3],q[16];
-rx(4.982856290954853) q[16];
-rz(0.6364507575827141) q[17];
-cx q[1],q[17];
-cx q[1],q[28];
-cx q[3],q[17];
-rz(0.6364507575827141) q[17];
-cx q[3],q[17];
-cx q[3],q[18];
-rz(0.6364507575827141) q[18];
-cx q[3],q[18];
-cx q[3],q[19];
-rz(0.6364507575827141) q[19];
-cx q[3],q[19];
-cx q[3],q[22];
-cx q[7],q[19];
-rz(0.6364507575827141) q[19];
-cx q[7],q[19];
-rx(4.982856290954853) q[7];
-cx q[19],q[38];
-rz(0.6364507575827141) q[20];
-cx q[0],q[20];
-cx q[0],q[32];
-cx q[15],q[20];
-rz(0.6364507575827141) q[20];
-cx q[15],q[20];
-rz(0.6364507575827141) q[22];
-cx q[3],q[22];
-cx q[3],q[23];
-cx q[9],q[22];
-rz(0.6364507575827141) q[22];
-cx q[9],q[22];
-rx(4.982856290954853) q[9];
-rx(4.982856290954853) q[22];
-rz(0.6364507575827141) q[23];
-cx q[3],q[23];
-cx q[3],q[24];
-cx q[17],q[23];
-rz(0.6364507575827141) q[23];
-cx q[17],q[23];
-rx(4.982856290954853) q[17];
-rx(4.982856290954853) q[23];
-rz(0.6364507575827141) q[24];
-cx q[3],q[24];
-cx q[3],q[25];
-rz(0.6364507575827141) q[25];
-cx q[3],q[25];
-cx q[3],q[26];
-cx q[12],q[25];
-rz(0.6364507575827141) q[25];
-cx q[12],q[25];
-cx q[12],q[31];
-rx(4.982856290954853) q[25];
-rz(0.6364507575827141) q[26];
-cx q[3],q[26];
-rz(0.6364507575827141) q[28];
-cx q[1],q[28];
-cx q[1],q[29];
-cx q[3],q[28];
-rz(0.6364507575827141) q[28];
-cx q[3],q[28];
-rx(4.982856290954853) q[28];
-rz(0.6364507575827141) q[29];
-cx q[1],q[29];
-rx(4.982856290954853) q[1];
-cx q[3],q[29];
-rz(0.6364507575827141) q[29];
-cx q[3],q[29];
-cx q[3],q[30];
-rx(4.982856290954853) q[29];
-rz(0.6364507575827141) q[30];
-cx q[3],q[30];
-cx q[3],q[34];
-rz(0.6364507575827141) q[31];
-cx q[12],q[31];
-rz(0.6364507575827141) q[32];
-cx q[0],q[32];
-rx(4.982856290954853) q[0];
-cx q[0],q[1];
-rz(2.4497408686266477) q[1];
-cx q[0],q[1];
-cx q[0],q[2];
-rz(2.4497408686266477) q[2];
-cx q[0],q[2];
-rx(5.305523135035764) q[2];
-rz(0.6364507575827141) q[34];
-cx q[3],q[34];
-cx q[3],q[35];
-cx q[12],q[34];
-rz(0.6364507575827141) q[34];
-cx q[12],q[34];
-rx(4.982856290954853) q[12];
-rz(0.6364507575827141) q[35];
-cx q[3],q[35];
-rz(0.6364507575827141) q[37];
-cx q[10],q[37];
-rx(4.982856290954853) q[10];
-cx q[34],q[37];
-rz(0.6364507575827141) q[37];
-cx q[34],q[37];
-rx(4.982856290954853) q[34];
-rx(4.982856290954853) q[37];
-rz(0.6364507575827141) q[38];
-cx q[19],q[38];
-rx(4.982856290954853) q[19];
-rz(2.0829074063961284) q[39];
-cx q[13],q[39];
-rx(7.7082437234380725) q[13];
-cx q[4],q[13];
-rz(0.6364507575827141) q[13];
-cx q[4],q[13];
-cx q[4],q[14];
-cx q[5],q[13];
-rz(0.6364507575827141) q[13];
-cx q[5],q[13];
-cx q[5],q[24];
-rz(0.6364507575827141) q[14];
-cx q[4],q[14];
-cx q[4],q[18];
-rx(4.982856290954853) q[14];
-rz(0.6364507575827141) q[18];
-cx q[4],q[18];
-cx q[4],q[21];
-cx q[18],q[30];
-rz(0.6364507575827141) q[21];
-cx q[4],q[21];
-cx q[4],q[27];
-cx q[15],q[21];
-rz(0.6364507575827141) q[21];
-cx q[15],q[21];
-cx q[15],q[36];
-cx q[21],q[26];
-rz(0.6364507575827141) q[24];
-cx q[5],q[24];
-cx q[5],q[33];
-rx(4.982856290954853) q[24];
-rz(0.6364507575827141) q[26];
-cx q[21],q[26];
-cx q[21],q[32];
-cx q[26],q[31];
-rz(0.6364507575827141) q[27];
-cx q[4],q[27];
-rx(4.982856290954853) q[4];
-cx q[6],q[27];
-rz(0.6364507575827141) q[27];
-cx q[6],q[27];
-rx(4.982856290954853) q[6];
-rx(4.982856290954853) q[27];
-rz(0.6364507575827141) q[30];
-cx q[18],q[30];
-rx(4.982856290954853) q[18];
-rz(0.6364507575827141) q[31];
-cx q[26],q[31];
-rx(4.982856290954853) q[26];
-rx(4.982856290954853) q[31];
-rz(0.6364507575827141) q[32];
-cx q[21],q[32];
-cx q[21],q[38];
-cx q[32],q[35];
-rz(0.6364507575827141) q[33];
-cx q[5],q[33];
-rx(4.982856290954853) q[5];
-cx q[30],q[33];
-rz(0.6364507575827141) q[33];
-cx q[30],q[33];
-rx(4.982856290954853) q[30];
-rx(4.982856290954853) q[33];
-rz(0.6364507575827141) q[35];
-cx q[32],q[35];
-rx(4.982856290954853) q[32];
-rx(4.982856290954853) q[35];
-rz(0.6364507575827141) q[36];
-cx q[15],q[36];
-rx(4.982856290954853) q[15];
-cx q[20],q[36];
-rz(0.6364507575827141) q[36];
-cx q[20],q[36];
-rx(4.982856290954853) q[20];
-rx(4.982856290954853) q[36];
-rz(0.6364507575827141) q[38];
-cx q[21],q[38];
-rx(4.982856290954853) q[21];
-rx(4.982856290954853) q[38];
-rx(7.7082437234380725) q[39];
-cx q[3],q[39];
-rz(0.6364507575827141) q[39];
-cx q[3],q[39];
-rx(4.982856290954853) q[3];
-cx q[0],q[3];
-rz(2.4497408686266477) q[3];
-cx q[0],q[3];
-cx q[0],q[15];
-cx q[1],q[3];
-rz(2.4497408686266477) q[3];
-cx q[1],q[3];
-cx q[1],q[4];
-rz(2.4497408686266477) q[4];
-cx q[1],q[4];
-cx q[1],q[5];
-cx q[3],q[4];
-rz(2.4497408686266477) q[4];
-cx q[3],q[4];
-cx q[4],q[6];
-rz(2.4497408686266477) q[5];
-cx q[1],q[5];
-cx q[1],q[9];
-cx q[3],q[5];
-rz(2.4497408686266477) q[5];
-cx q[3],q[5];
-cx q[3],q[7];
-rz(2.4497408686266477) q[6];
-cx q[4],q[6];
-cx q[5],q[6];
-rz(2.4497408686266477) q[6];
-cx q[5],q[6];
-rz(2.4497408686266477) q[7];
-cx q[3],q[7];
-cx q[3],q[8];
-cx q[4],q[7];
-rz(2.4497408686266477) q[7];
-cx q[4],q[7];
-cx q[4],q[10];
-rz(2.4497408686266477) q[8];
-cx q[3],q[8];
-cx q[5],q[8];
-rz(2.4497408686266477) q[8];
-cx q[5],q[8];
-cx q[5],q[11];
-rx(5.305523135035764) q[8];
-rz(2.4497408686266477) q[9];
-cx q[1],q[9];
-cx q[1],q[17];
-cx q[3],q[9];
-rz(2.4497408686266477) q[9];
-cx q[3],q[9];
-cx q[3],q[12];
-rz(2.4497408686266477) q[10];
-cx q[4],q[10];
-cx q[6],q[10];
-rz(2.4497408686266477) q[10];
-cx q[6],q[10];
-cx q[10],q[37];
-rz(2.4497408686266477) q[11];
-cx q[5],q[11];
-cx q[6],q[11];
-rz(2.4497408686266477) q[11];
-cx q[6],q[11];
-rx(5.305523135035764) q[11];
-rz(2.4497408686266477) q[12];
-cx q[3],q[12];
-cx q[3],q[14];
-cx q[5],q[12];
-rz(2.4497408686266477) q[12];
-cx q[5],q[12];
-cx q[13],q[39];
-rz(2.4497408686266477) q[14];
-cx q[3],q[14];
-rz(2.4497408686266477) q[15];
-cx q[0],q[15];
-cx q[0],q[16];
-cx q[3],q[15];
-rz(2.4497408686266477) q[15];
-cx q[3],q[15];
-rz(2.4497408686266477) q[16];
-cx q[0],q[16];
-cx q[0],q[20];
-cx q[3],q[16];
-rz(2.4497408686266477) q[16];
-cx q[3],q[16];
-rx(5.305523135035764) q[16];
-rz(2.4497408686266477) q[17];
-cx q[1],q[17];
-cx q[1],q[28];
-cx q[3],q[17];
-rz(2.4497408686266477) q[17];
-cx q[3],q[17];
-cx q[3],q[18];
-rz(2.4497408686266477) q[18];
-cx q[3],q[18];
-cx q[3],q[19];
-rz(2.4497408686266477) q[19];
-cx q[3],q[19];
-cx q[3],q[22];
-cx q[7],q[19];
-rz(2.4497408686266477) q[19];
-cx q[7],q[19];
-rx(5.305523135035764) q[7];
-cx q[19],q[38];
-rz(2.4497408686266477) q[20];
-cx q[0],q[20];
-cx q[0],q[32];
-cx q[15],q[20];
-rz(2.4497408686266477) q[20];
-cx q[15],q[20];
-rz(2.4497408686266477) q[22];
-cx q[3],q[22];
-cx q[3],q[23];
-cx q[9],q[22];
-rz(2.4497408686266477) q[22];
-cx q[9],q[22];
-rx(5.305523135035764) q[9];
-rx(5.305523135035764) q[22];
-rz(2.4497408686266477) q[23];
-cx q[3],q[23];
-cx q[3],q[24];
-cx q[17],q[23];
-rz(2.4497408686266477) q[23];
-cx q[17],q[23];
-rx(5.305523135035764) q[17];
-rx(5.305523135035764) q[23];
-rz(2.4497408686266477) q[24];
-cx q[3],q[24];
-cx q[3],q[25];
-rz(2.4497408686266477) q[25];
-cx q[3],q[25];
-cx q[3],q[26];
-cx q[12],q[25];
-rz(2.4497408686266477) q[25];
-cx q[12],q[25];
-cx q[12],q[31];
-rx(5.305523135035764) q[25];
-rz(2.4497408686266477) q[26];
-cx q[3],q[26];
-rz(2.4497408686266477) q[28];
-cx q[1],q[28];
-cx q[1],q[29];
-cx q[3],q[28];
-rz(2.4497408686266477) q[28];
-cx q[3],q[28];
-rx(5.305523135035764) q[28];
-rz(2.4497408686266477) q[29];
-cx q[1],q[29];
-rx(5.305523135035764) q[1];
-cx q[3],q[29];
-rz(2.4497408686266477) q[29];
-cx q[3],q[29];
-cx q[3],q[30];
-rx(5.305523135035764) q[29];
-rz(2.4497408686266477) q[30];
-cx q[3],q[30];
-cx q[3],q[34];
-rz(2.4497408686266477) q[31];
-cx q[12],q[31];
-rz(2.4497408686266477) q[32];
-cx q[0],q[32];
-rx(5.305523135035764) q[0];
-rz(2.4497408686266477) q[34];
-cx q[3],q[34];
-cx q[3],q[35];
-cx q[12],q[34];
-rz(2.4497408686266477) q[34];
-cx q[12],q[34];
-rx(5.305523135035764) q[12];
-rz(2.4497408686266477) q[35];
-cx q[3],q[35];
-rz(2.4497408686266477) q[37];
-cx q[10],q[37];
-rx(5.305523135035764) q[10];
-cx q[34],q[37];
-rz(2.4497408686266477) q[37];
-cx q[34],q[37];
-rx(5.305523135035764) q[34];
-rx(5.305523135035764) q[37];
-rz(2.4497408686266477) q[38];
-cx q[19],q[38];
-rx(5.305523135035764) q[19];
-rz(0.6364507575827141) q[39];
-cx q[13],q[39];
-rx(4.982856290954853) q[13];
-cx q[4],q[13];
-rz(2.4497408686266477) q[13];
-cx q[4],q[13];
-cx q[4],q[14];
-cx q[5],q[13];
-rz(2.4497408686266477) q[13];
-cx q[5],q[13];
-cx q[5],q[24];
-rz(2.4497408686266477) q[14];
-cx q[4],q[14];
-cx q[4],q[18];
-rx(5.305523135035764) q[14];
-rz(2.4497408686266477) q[18];
-cx q[4],q[18];
-cx q[4],q[21];
-cx q[18],q[30];
-rz(2.4497408686266477) q[21];
-cx q[4],q[21];
-cx q[4],q[27];
-cx q[15],q[21];
-rz(2.4497408686266477) q[21];
-cx q[15],q[21];
-cx q[15],q[36];
-cx q[21],q[26];
-rz(2.4497408686266477) q[24];
-cx q[5],q[24];
-cx q[5],q[33];
-rx(5.305523135035764) q[24];
-rz(2.4497408686266477) q[26];
-cx q[21],q[26];
-cx q[21],q[32];
-cx q[26],q[31];
-rz(2.4497408686266477) q[27];
-cx q[4],q[27];
-rx(5.305523135035764) q[4];
-cx q[6],q[27];
-rz(2.4497408686266477) q[27];
-cx q[6],q[27];
-rx(5.305523135035764) q[6];
-rx(5.305523135035764) q[27];
-rz(2.4497408686266477) q[30];
-cx q[18],q[30];
-rx(5.305523135035764) q[18];
-rz(2.4497408686266477) q[31];
-cx q[26],q[31];
-rx(5.305523135035764) q[26];
-rx(5.305523135035764) q[31];
-rz(2.4497408686266477) q[32];
-cx q[21],q[32];
-cx q[21],q[38];
-cx q[32],q[35];
-rz(2.4497408686266477) q[33];
-cx q[5],q[33];
-rx(5.305523135035764) q[5];
-cx q[30],q[33];
-rz(2.4497408686266477) q[33];
-cx q[30],q[33];
-rx(5.305523135035764) q[30];
-rx(5.305523135035764) q[33];
-rz(2.4497408686266477) q[35];
-cx q[32],q[35];
-rx(5.305523135035764) q[32];
-rx(5.305523135035764) q[35];
-rz(2.4497408686266477) q[36];
-cx q[15],q[36];
-rx(5.305523135035764) q[15];
-cx q[20],q[36];
-rz(2.4497408686266477) q[36];
-cx q[20],q[36];
-rx(5.305523135035764) q[20];
-rx(5.305523135035764) q[36];
-rz(2.4497408686266477) q[38];
-cx q[21],q[38];
-rx(5.305523135035764) q[21];
-rx(5.305523135035764) q[38];
-rx(4.982856290954853) q[39];
-cx q[3],q[39];
-rz(2.4497408686266477) q[39];
-cx q[3],q[39];
-rx(5.305523135035764) q[3];
-cx q[13],q[39];
-rz(2.4497408686266477) q[39];
-cx q[13],q[39];
-rx(5.305523135035764) q[13];
-rx(5.305523135035764) q[39];
\ No newline at end of file
@@ -1,910 +0,0 @@
-OPENQASM 2.0;
-include "qelib1.inc";
-qreg q[41];
-ry(pi/2) q[0];
-rx(pi) q[0];
-ry(pi/2) q[1];
-rx(pi) q[1];
-cx q[0],q[1];
-rz(6.110987814142871) q[1];
-cx q[0],q[1];
-ry(pi/2) q[2];
-rx(pi) q[2];
-cx q[0],q[2];
-rz(6.110987814142871) q[2];
-cx q[0],q[2];
-rx(1.4667211948344834) q[2];
-ry(pi/2) q[3];
-rx(pi) q[3];
-cx q[0],q[3];
-rz(6.110987814142871) q[3];
-cx q[0],q[3];
-cx q[1],q[3];
-rz(6.110987814142871) q[3];
-cx q[1],q[3];
-ry(pi/2) q[4];
-rx(pi) q[4];
-cx q[1],q[4];
-rz(6.110987814142871) q[4];
-cx q[1],q[4];
-cx q[3],q[4];
-rz(6.110987814142871) q[4];
-cx q[3],q[4];
-ry(pi/2) q[5];
-rx(pi) q[5];
-cx q[1],q[5];
-rz(6.110987814142871) q[5];
-cx q[1],q[5];
-cx q[3],q[5];
-rz(6.110987814142871) q[5];
-cx q[3],q[5];
-ry(pi/2) q[6];
-rx(pi) q[6];
-cx q[4],q[6];
-rz(6.110987814142871) q[6];
-cx q[4],q[6];
-cx q[5],q[6];
-rz(6.110987814142871) q[6];
-cx q[5],q[6];
-ry(pi/2) q[7];
-rx(pi) q[7];
-cx q[3],q[7];
-rz(6.110987814142871) q[7];
-cx q[3],q[7];
-cx q[4],q[7];
-rz(6.110987814142871) q[7];
-cx q[4],q[7];
-ry(pi/2) q[8];
-rx(pi) q[8];
-cx q[3],q[8];
-rz(6.110987814142871) q[8];
-cx q[3],q[8];
-cx q[5],q[8];
-rz(6.110987814142871) q[8];
-cx q[5],q[8];
-rx(1.4667211948344834) q[8];
-ry(pi/2) q[9];
-rx(pi) q[9];
-cx q[1],q[9];
-rz(6.110987814142871) q[9];
-cx q[1],q[9];
-cx q[3],q[9];
-rz(6.110987814142871) q[9];
-cx q[3],q[9];
-ry(pi/2) q[10];
-rx(pi) q[10];
-cx q[4],q[10];
-rz(6.110987814142871) q[10];
-cx q[4],q[10];
-cx q[6],q[10];
-rz(6.110987814142871) q[10];
-cx q[6],q[10];
-ry(pi/2) q[11];
-rx(pi) q[11];
-cx q[5],q[11];
-rz(6.110987814142871) q[11];
-cx q[5],q[11];
-cx q[6],q[11];
-rz(6.110987814142871) q[11];
-cx q[6],q[11];
-rx(1.4667211948344834) q[11];
-ry(pi/2) q[12];
-rx(pi) q[12];
-cx q[3],q[12];
-rz(6.110987814142871) q[12];
-cx q[3],q[12];
-cx q[5],q[12];
-rz(6.110987814142871) q[12];
-cx q[5],q[12];
-ry(pi/2) q[13];
-rx(pi) q[13];
-cx q[4],q[13];
-rz(6.110987814142871) q[13];
-cx q[4],q[13];
-cx q[5],q[13];
-rz(6.110987814142871) q[13];
-cx q[5],q[13];
-ry(pi/2) q[14];
-rx(pi) q[14];
-cx q[3],q[14];
-rz(6.110987814142871) q[14];
-cx q[3],q[14];
-cx q[4],q[14];
-rz(6.110987814142871) q[14];
-cx q[4],q[14];
-rx(1.4667211948344834) q[14];
-ry(pi/2) q[15];
-rx(pi) q[15];
-cx q[0],q[15];
-rz(6.110987814142871) q[15];
-cx q[0],q[15];
-cx q[3],q[15];
-rz(6.110987814142871) q[15];
-cx q[3],q[15];
-ry(pi/2) q[16];
-rx(pi) q[16];
-cx q[0],q[16];
-rz(6.110987814142871) q[16];
-cx q[0],q[16];
-cx q[3],q[16];
-rz(6.110987814142871) q[16];
-cx q[3],q[16];
-rx(1.4667211948344834) q[16];
-ry(pi/2) q[17];
-rx(pi) q[17];
-cx q[1],q[17];
-rz(6.110987814142871) q[17];
-cx q[1],q[17];
-cx q[3],q[17];
-rz(6.110987814142871) q[17];
-cx q[3],q[17];
-ry(pi/2) q[18];
-rx(pi) q[18];
-cx q[3],q[18];
-rz(6.110987814142871) q[18];
-cx q[3],q[18];
-cx q[4],q[18];
-rz(6.110987814142871) q[18];
-cx q[4],q[18];
-ry(pi/2) q[19];
-rx(pi) q[19];
-cx q[3],q[19];
-rz(6.110987814142871) q[19];
-cx q[3],q[19];
-cx q[7],q[19];
-rz(6.110987814142871) q[19];
-cx q[7],q[19];
-rx(1.4667211948344834) q[7];
-ry(pi/2) q[20];
-rx(pi) q[20];
-cx q[0],q[20];
-rz(6.110987814142871) q[20];
-cx q[0],q[20];
-cx q[15],q[20];
-rz(6.110987814142871) q[20];
-cx q[15],q[20];
-ry(pi/2) q[21];
-rx(pi) q[21];
-cx q[4],q[21];
-rz(6.110987814142871) q[21];
-cx q[4],q[21];
-cx q[15],q[21];
-rz(6.110987814142871) q[21];
-cx q[15],q[21];
-ry(pi/2) q[22];
-rx(pi) q[22];
-cx q[3],q[22];
-rz(6.110987814142871) q[22];
-cx q[3],q[22];
-cx q[9],q[22];
-rz(6.110987814142871) q[22];
-cx q[9],q[22];
-rx(1.4667211948344834) q[9];
-rx(1.4667211948344834) q[22];
-ry(pi/2) q[23];
-rx(pi) q[23];
-cx q[3],q[23];
-rz(6.110987814142871) q[23];
-cx q[3],q[23];
-cx q[17],q[23];
-rz(6.110987814142871) q[23];
-cx q[17],q[23];
-rx(1.4667211948344834) q[17];
-ry(pi/2) q[24];
-rx(pi) q[24];
-cx q[3],q[24];
-rz(6.110987814142871) q[24];
-cx q[3],q[24];
-cx q[5],q[24];
-rz(6.110987814142871) q[24];
-cx q[5],q[24];
-rx(1.4667211948344834) q[24];
-ry(pi/2) q[25];
-rx(pi) q[25];
-cx q[3],q[25];
-rz(6.110987814142871) q[25];
-cx q[3],q[25];
-cx q[12],q[25];
-rz(6.110987814142871) q[25];
-cx q[12],q[25];
-rx(1.4667211948344834) q[25];
-ry(pi/2) q[26];
-rx(pi) q[26];
-cx q[3],q[26];
-rz(6.110987814142871) q[26];
-cx q[3],q[26];
-cx q[21],q[26];
-rz(6.110987814142871) q[26];
-cx q[21],q[26];
-ry(pi/2) q[27];
-rx(pi) q[27];
-cx q[4],q[27];
-rz(6.110987814142871) q[27];
-cx q[4],q[27];
-rx(1.4667211948344834) q[4];
-cx q[6],q[27];
-rz(6.110987814142871) q[27];
-cx q[6],q[27];
-rx(1.4667211948344834) q[6];
-rx(1.4667211948344834) q[27];
-ry(pi/2) q[28];
-rx(pi) q[28];
-cx q[1],q[28];
-rz(6.110987814142871) q[28];
-cx q[1],q[28];
-cx q[3],q[28];
-rz(6.110987814142871) q[28];
-cx q[3],q[28];
-rx(1.4667211948344834) q[28];
-ry(pi/2) q[29];
-rx(pi) q[29];
-cx q[1],q[29];
-rz(6.110987814142871) q[29];
-cx q[1],q[29];
-rx(1.4667211948344834) q[1];
-cx q[3],q[29];
-rz(6.110987814142871) q[29];
-cx q[3],q[29];
-rx(1.4667211948344834) q[29];
-ry(pi/2) q[30];
-rx(pi) q[30];
-cx q[3],q[30];
-rz(6.110987814142871) q[30];
-cx q[3],q[30];
-cx q[18],q[30];
-rz(6.110987814142871) q[30];
-cx q[18],q[30];
-rx(1.4667211948344834) q[18];
-ry(pi/2) q[31];
-rx(pi) q[31];
-cx q[12],q[31];
-rz(6.110987814142871) q[31];
-cx q[12],q[31];
-cx q[26],q[31];
-rz(6.110987814142871) q[31];
-cx q[26],q[31];
-rx(1.4667211948344834) q[26];
-rx(1.4667211948344834) q[31];
-ry(pi/2) q[32];
-rx(pi) q[32];
-cx q[0],q[32];
-rz(6.110987814142871) q[32];
-cx q[0],q[32];
-rx(1.4667211948344834) q[0];
-cx q[0],q[1];
-rz(4.257551194209495) q[1];
-cx q[0],q[1];
-cx q[0],q[2];
-rz(4.257551194209495) q[2];
-cx q[0],q[2];
-rx(1.3247853147856214) q[2];
-cx q[21],q[32];
-rz(6.110987814142871) q[32];
-cx q[21],q[32];
-ry(pi/2) q[33];
-rx(pi) q[33];
-cx q[5],q[33];
-rz(6.110987814142871) q[33];
-cx q[5],q[33];
-rx(1.4667211948344834) q[5];
-cx q[30],q[33];
-rz(6.110987814142871) q[33];
-cx q[30],q[33];
-rx(1.4667211948344834) q[30];
-rx(1.4667211948344834) q[33];
-ry(pi/2) q[34];
-rx(pi) q[34];
-cx q[3],q[34];
-rz(6.110987814142871) q[34];
-cx q[3],q[34];
-cx q[12],q[34];
-rz(6.110987814142871) q[34];
-cx q[12],q[34];
-rx(1.4667211948344834) q[12];
-ry(pi/2) q[35];
-rx(pi) q[35];
-cx q[3],q[35];
-rz(6.110987814142871) q[35];
-cx q[3],q[35];
-cx q[32],q[35];
-rz(6.110987814142871) q[35];
-cx q[32],q[35];
-rx(1.4667211948344834) q[32];
-rx(1.4667211948344834) q[35];
-ry(pi/2) q[36];
-rx(pi) q[36];
-cx q[15],q[36];
-rz(6.110987814142871) q[36];
-cx q[15],q[36];
-rx(1.4667211948344834) q[15];
-cx q[20],q[36];
-rz(6.110987814142871) q[36];
-cx q[20],q[36];
-rx(1.4667211948344834) q[20];
-rx(1.4667211948344834) q[36];
-ry(pi/2) q[37];
-rx(pi) q[37];
-cx q[10],q[37];
-rz(6.110987814142871) q[37];
-cx q[10],q[37];
-rx(1.4667211948344834) q[10];
-cx q[34],q[37];
-rz(6.110987814142871) q[37];
-cx q[34],q[37];
-rx(1.4667211948344834) q[34];
-rx(1.4667211948344834) q[37];
-ry(pi/2) q[38];
-rx(pi) q[38];
-cx q[19],q[38];
-rz(6.110987814142871) q[38];
-cx q[19],q[38];
-rx(1.4667211948344834) q[19];
-cx q[21],q[38];
-rz(6.110987814142871) q[38];
-cx q[21],q[38];
-rx(1.4667211948344834) q[21];
-rx(1.4667211948344834) q[38];
-ry(pi/2) q[39];
-rx(pi) q[39];
-cx q[3],q[39];
-rz(6.110987814142871) q[39];
-cx q[3],q[39];
-cx q[13],q[39];
-rz(6.110987814142871) q[39];
-cx q[13],q[39];
-rx(1.4667211948344834) q[13];
-rx(1.4667211948344834) q[39];
-ry(pi/2) q[40];
-rx(pi) q[40];
-cx q[3],q[40];
-rz(6.110987814142871) q[40];
-cx q[3],q[40];
-rx(1.4667211948344834) q[3];
-cx q[0],q[3];
-rz(4.257551194209495) q[3];
-cx q[0],q[3];
-cx q[0],q[15];
-cx q[1],q[3];
-rz(4.257551194209495) q[3];
-cx q[1],q[3];
-cx q[1],q[4];
-rz(4.257551194209495) q[4];
-cx q[1],q[4];
-cx q[1],q[5];
-cx q[3],q[4];
-rz(4.257551194209495) q[4];
-cx q[3],q[4];
-cx q[4],q[6];
-rz(4.257551194209495) q[5];
-cx q[1],q[5];
-cx q[1],q[9];
-cx q[3],q[5];
-rz(4.257551194209495) q[5];
-cx q[3],q[5];
-cx q[3],q[7];
-rz(4.257551194209495) q[6];
-cx q[4],q[6];
-cx q[5],q[6];
-rz(4.257551194209495) q[6];
-cx q[5],q[6];
-rz(4.257551194209495) q[7];
-cx q[3],q[7];
-cx q[3],q[8];
-cx q[4],q[7];
-rz(4.257551194209495) q[7];
-cx q[4],q[7];
-cx q[4],q[10];
-rz(4.257551194209495) q[8];
-cx q[3],q[8];
-cx q[5],q[8];
-rz(4.257551194209495) q[8];
-cx q[5],q[8];
-cx q[5],q[11];
-rx(1.3247853147856214) q[8];
-rz(4.257551194209495) q[9];
-cx q[1],q[9];
-cx q[1],q[17];
-cx q[3],q[9];
-rz(4.257551194209495) q[9];
-cx q[3],q[9];
-cx q[3],q[12];
-rz(4.257551194209495) q[10];
-cx q[4],q[10];
-cx q[4],q[13];
-cx q[6],q[10];
-rz(4.257551194209495) q[10];
-cx q[6],q[10];
-cx q[10],q[37];
-rz(4.257551194209495) q[11];
-cx q[5],q[11];
-cx q[6],q[11];
-rz(4.257551194209495) q[11];
-cx q[6],q[11];
-rx(1.3247853147856214) q[11];
-rz(4.257551194209495) q[12];
-cx q[3],q[12];
-cx q[3],q[14];
-cx q[5],q[12];
-rz(4.257551194209495) q[12];
-cx q[5],q[12];
-rz(4.257551194209495) q[13];
-cx q[4],q[13];
-cx q[5],q[13];
-rz(4.257551194209495) q[13];
-cx q[5],q[13];
-rz(4.257551194209495) q[14];
-cx q[3],q[14];
-cx q[4],q[14];
-rz(4.257551194209495) q[14];
-cx q[4],q[14];
-rx(1.3247853147856214) q[14];
-rz(4.257551194209495) q[15];
-cx q[0],q[15];
-cx q[0],q[16];
-cx q[3],q[15];
-rz(4.257551194209495) q[15];
-cx q[3],q[15];
-rz(4.257551194209495) q[16];
-cx q[0],q[16];
-cx q[0],q[20];
-cx q[3],q[16];
-rz(4.257551194209495) q[16];
-cx q[3],q[16];
-rx(1.3247853147856214) q[16];
-rz(4.257551194209495) q[17];
-cx q[1],q[17];
-cx q[1],q[28];
-cx q[3],q[17];
-rz(4.257551194209495) q[17];
-cx q[3],q[17];
-cx q[3],q[18];
-rz(4.257551194209495) q[18];
-cx q[3],q[18];
-cx q[3],q[19];
-cx q[4],q[18];
-rz(4.257551194209495) q[18];
-cx q[4],q[18];
-cx q[4],q[21];
-rz(4.257551194209495) q[19];
-cx q[3],q[19];
-cx q[3],q[22];
-cx q[7],q[19];
-rz(4.257551194209495) q[19];
-cx q[7],q[19];
-rx(1.3247853147856214) q[7];
-cx q[19],q[38];
-rz(4.257551194209495) q[20];
-cx q[0],q[20];
-cx q[0],q[32];
-cx q[15],q[20];
-rz(4.257551194209495) q[20];
-cx q[15],q[20];
-rz(4.257551194209495) q[21];
-cx q[4],q[21];
-cx q[4],q[27];
-cx q[15],q[21];
-rz(4.257551194209495) q[21];
-cx q[15],q[21];
-cx q[15],q[36];
-rz(4.257551194209495) q[22];
-cx q[3],q[22];
-cx q[9],q[22];
-rz(4.257551194209495) q[22];
-cx q[9],q[22];
-rx(1.3247853147856214) q[9];
-rx(1.3247853147856214) q[22];
-cx q[23],q[40];
-rz(4.257551194209495) q[27];
-cx q[4],q[27];
-rx(1.3247853147856214) q[4];
-cx q[6],q[27];
-rz(4.257551194209495) q[27];
-cx q[6],q[27];
-rx(1.3247853147856214) q[6];
-rx(1.3247853147856214) q[27];
-rz(4.257551194209495) q[28];
-cx q[1],q[28];
-cx q[1],q[29];
-rz(4.257551194209495) q[29];
-cx q[1],q[29];
-rx(1.3247853147856214) q[1];
-rz(4.257551194209495) q[32];
-cx q[0],q[32];
-rx(1.3247853147856214) q[0];
-cx q[0],q[1];
-rz(0.5191194915298409) q[1];
-cx q[0],q[1];
-cx q[0],q[2];
-rz(0.5191194915298409) q[2];
-cx q[0],q[2];
-rx(10.625666814487902) q[2];
-rz(4.257551194209495) q[36];
-cx q[15],q[36];
-rx(1.3247853147856214) q[15];
-cx q[20],q[36];
-rz(4.257551194209495) q[36];
-cx q[20],q[36];
-rx(1.3247853147856214) q[20];
-rx(1.3247853147856214) q[36];
-rz(4.257551194209495) q[37];
-cx q[10],q[37];
-rx(1.3247853147856214) q[10];
-rz(4.257551194209495) q[38];
-cx q[19],q[38];
-rx(1.3247853147856214) q[19];
-rz(6.110987814142871) q[40];
-cx q[23],q[40];
-rx(1.4667211948344834) q[23];
-cx q[3],q[23];
-rz(4.257551194209495) q[23];
-cx q[3],q[23];
-cx q[3],q[24];
-cx q[17],q[23];
-rz(4.257551194209495) q[23];
-cx q[17],q[23];
-rx(1.3247853147856214) q[17];
-rz(4.257551194209495) q[24];
-cx q[3],q[24];
-cx q[3],q[25];
-cx q[5],q[24];
-rz(4.257551194209495) q[24];
-cx q[5],q[24];
-cx q[5],q[33];
-rx(1.3247853147856214) q[24];
-rz(4.257551194209495) q[25];
-cx q[3],q[25];
-cx q[3],q[26];
-cx q[12],q[25];
-rz(4.257551194209495) q[25];
-cx q[12],q[25];
-cx q[12],q[31];
-rx(1.3247853147856214) q[25];
-rz(4.257551194209495) q[26];
-cx q[3],q[26];
-cx q[3],q[28];
-cx q[21],q[26];
-rz(4.257551194209495) q[26];
-cx q[21],q[26];
-cx q[21],q[32];
-rz(4.257551194209495) q[28];
-cx q[3],q[28];
-cx q[3],q[29];
-rx(1.3247853147856214) q[28];
-rz(4.257551194209495) q[29];
-cx q[3],q[29];
-cx q[3],q[30];
-rx(1.3247853147856214) q[29];
-rz(4.257551194209495) q[30];
-cx q[3],q[30];
-cx q[3],q[34];
-cx q[18],q[30];
-rz(4.257551194209495) q[30];
-cx q[18],q[30];
-rx(1.3247853147856214) q[18];
-rz(4.257551194209495) q[31];
-cx q[12],q[31];
-cx q[26],q[31];
-rz(4.257551194209495) q[31];
-cx q[26],q[31];
-rx(1.3247853147856214) q[26];
-rx(1.3247853147856214) q[31];
-rz(4.257551194209495) q[32];
-cx q[21],q[32];
-cx q[21],q[38];
-rz(4.257551194209495) q[33];
-cx q[5],q[33];
-rx(1.3247853147856214) q[5];
-cx q[30],q[33];
-rz(4.257551194209495) q[33];
-cx q[30],q[33];
-rx(1.3247853147856214) q[30];
-rx(1.3247853147856214) q[33];
-rz(4.257551194209495) q[34];
-cx q[3],q[34];
-cx q[3],q[35];
-cx q[12],q[34];
-rz(4.257551194209495) q[34];
-cx q[12],q[34];
-rx(1.3247853147856214) q[12];
-cx q[34],q[37];
-rz(4.257551194209495) q[35];
-cx q[3],q[35];
-cx q[3],q[39];
-cx q[32],q[35];
-rz(4.257551194209495) q[35];
-cx q[32],q[35];
-rx(1.3247853147856214) q[32];
-rx(1.3247853147856214) q[35];
-rz(4.257551194209495) q[37];
-cx q[34],q[37];
-rx(1.3247853147856214) q[34];
-rx(1.3247853147856214) q[37];
-rz(4.257551194209495) q[38];
-cx q[21],q[38];
-rx(1.3247853147856214) q[21];
-rx(1.3247853147856214) q[38];
-rz(4.257551194209495) q[39];
-cx q[3],q[39];
-cx q[13],q[39];
-rz(4.257551194209495) q[39];
-cx q[13],q[39];
-rx(1.3247853147856214) q[13];
-rx(1.3247853147856214) q[39];
-rx(1.4667211948344834) q[40];
-cx q[3],q[40];
-rz(4.257551194209495) q[40];
-cx q[3],q[40];
-rx(1.3247853147856214) q[3];
-cx q[0],q[3];
-rz(0.5191194915298409) q[3];
-cx q[0],q[3];
-cx q[0],q[15];
-cx q[1],q[3];
-rz(0.5191194915298409) q[3];
-cx q[1],q[3];
-cx q[1],q[4];
-rz(0.5191194915298409) q[4];
-cx q[1],q[4];
-cx q[1],q[5];
-cx q[3],q[4];
-rz(0.5191194915298409) q[4];
-cx q[3],q[4];
-cx q[4],q[6];
-rz(0.5191194915298409) q[5];
-cx q[1],q[5];
-cx q[1],q[9];
-cx q[3],q[5];
-rz(0.5191194915298409) q[5];
-cx q[3],q[5];
-cx q[3],q[7];
-rz(0.5191194915298409) q[6];
-cx q[4],q[6];
-cx q[5],q[6];
-rz(0.5191194915298409) q[6];
-cx q[5],q[6];
-rz(0.5191194915298409) q[7];
-cx q[3],q[7];
-cx q[3],q[8];
-cx q[4],q[7];
-rz(0.5191194915298409) q[7];
-cx q[4],q[7];
-cx q[4],q[10];
-rz(0.5191194915298409) q[8];
-cx q[3],q[8];
-cx q[5],q[8];
-rz(0.5191194915298409) q[8];
-cx q[5],q[8];
-cx q[5],q[11];
-rx(10.625666814487902) q[8];
-rz(0.5191194915298409) q[9];
-cx q[1],q[9];
-cx q[1],q[17];
-cx q[3],q[9];
-rz(0.5191194915298409) q[9];
-cx q[3],q[9];
-cx q[3],q[12];
-rz(0.5191194915298409) q[10];
-cx q[4],q[10];
-cx q[4],q[13];
-cx q[6],q[10];
-rz(0.5191194915298409) q[10];
-cx q[6],q[10];
-cx q[10],q[37];
-rz(0.5191194915298409) q[11];
-cx q[5],q[11];
-cx q[6],q[11];
-rz(0.5191194915298409) q[11];
-cx q[6],q[11];
-rx(10.625666814487902) q[11];
-rz(0.5191194915298409) q[12];
-cx q[3],q[12];
-cx q[3],q[14];
-cx q[5],q[12];
-rz(0.5191194915298409) q[12];
-cx q[5],q[12];
-rz(0.5191194915298409) q[13];
-cx q[4],q[13];
-cx q[5],q[13];
-rz(0.5191194915298409) q[13];
-cx q[5],q[13];
-rz(0.5191194915298409) q[14];
-cx q[3],q[14];
-cx q[4],q[14];
-rz(0.5191194915298409) q[14];
-cx q[4],q[14];
-rx(10.625666814487902) q[14];
-rz(0.5191194915298409) q[15];
-cx q[0],q[15];
-cx q[0],q[16];
-cx q[3],q[15];
-rz(0.5191194915298409) q[15];
-cx q[3],q[15];
-rz(0.5191194915298409) q[16];
-cx q[0],q[16];
-cx q[0],q[20];
-cx q[3],q[16];
-rz(0.5191194915298409) q[16];
-cx q[3],q[16];
-rx(10.625666814487902) q[16];
-rz(0.5191194915298409) q[17];
-cx q[1],q[17];
-cx q[1],q[28];
-cx q[3],q[17];
-rz(0.5191194915298409) q[17];
-cx q[3],q[17];
-cx q[3],q[18];
-rz(0.5191194915298409) q[18];
-cx q[3],q[18];
-cx q[3],q[19];
-cx q[4],q[18];
-rz(0.5191194915298409) q[18];
-cx q[4],q[18];
-cx q[4],q[21];
-rz(0.5191194915298409) q[19];
-cx q[3],q[19];
-cx q[3],q[22];
-cx q[7],q[19];
-rz(0.5191194915298409) q[19];
-cx q[7],q[19];
-rx(10.625666814487902) q[7];
-cx q[19],q[38];
-rz(0.5191194915298409) q[20];
-cx q[0],q[20];
-cx q[0],q[32];
-cx q[15],q[20];
-rz(0.5191194915298409) q[20];
-cx q[15],q[20];
-rz(0.5191194915298409) q[21];
-cx q[4],q[21];
-cx q[4],q[27];
-cx q[15],q[21];
-rz(0.5191194915298409) q[21];
-cx q[15],q[21];
-cx q[15],q[36];
-rz(0.5191194915298409) q[22];
-cx q[3],q[22];
-cx q[9],q[22];
-rz(0.5191194915298409) q[22];
-cx q[9],q[22];
-rx(10.625666814487902) q[9];
-rx(10.625666814487902) q[22];
-cx q[23],q[40];
-rz(0.5191194915298409) q[27];
-cx q[4],q[27];
-rx(10.625666814487902) q[4];
-cx q[6],q[27];
-rz(0.5191194915298409) q[27];
-cx q[6],q[27];
-rx(10.625666814487902) q[6];
-rx(10.625666814487902) q[27];
-rz(0.5191194915298409) q[28];
-cx q[1],q[28];
-cx q[1],q[29];
-rz(0.5191194915298409) q[29];
-cx q[1],q[29];
-rx(10.625666814487902) q[1];
-rz(0.5191194915298409) q[32];
-cx q[0],q[32];
-rx(10.625666814487902) q[0];
-rz(0.5191194915298409) q[36];
-cx q[15],q[36];
-rx(10.625666814487902) q[15];
-cx q[20],q[36];
-rz(0.5191194915298409) q[36];
-cx q[20],q[36];
-rx(10.625666814487902) q[20];
-rx(10.625666814487902) q[36];
-rz(0.5191194915298409) q[37];
-cx q[10],q[37];
-rx(10.625666814487902) q[10];
-rz(0.5191194915298409) q[38];
-cx q[19],q[38];
-rx(10.625666814487902) q[19];
-rz(4.257551194209495) q[40];
-cx q[23],q[40];
-rx(1.3247853147856214) q[23];
-cx q[3],q[23];
-rz(0.5191194915298409) q[23];
-cx q[3],q[23];
-cx q[3],q[24];
-cx q[17],q[23];
-rz(0.5191194915298409) q[23];
-cx q[17],q[23];
-rx(10.625666814487902) q[17];
-rz(0.5191194915298409) q[24];
-cx q[3],q[24];
-cx q[3],q[25];
-cx q[5],q[24];
-rz(0.5191194915298409) q[24];
-cx q[5],q[24];
-cx q[5],q[33];
-rx(10.625666814487902) q[24];
-rz(0.5191194915298409) q[25];
-cx q[3],q[25];
-cx q[3],q[26];
-cx q[12],q[25];
-rz(0.5191194915298409) q[25];
-cx q[12],q[25];
-cx q[12],q[31];
-rx(10.625666814487902) q[25];
-rz(0.5191194915298409) q[26];
-cx q[3],q[26];
-cx q[3],q[28];
-cx q[21],q[26];
-rz(0.5191194915298409) q[26];
-cx q[21],q[26];
-cx q[21],q[32];
-rz(0.5191194915298409) q[28];
-cx q[3],q[28];
-cx q[3],q[29];
-rx(10.625666814487902) q[28];
-rz(0.5191194915298409) q[29];
-cx q[3],q[29];
-cx q[3],q[30];
-rx(10.625666814487902) q[29];
-rz(0.5191194915298409) q[30];
-cx q[3],q[30];
-cx q[3],q[34];
-cx q[18],q[30];
-rz(0.5191194915298409) q[30];
-cx q[18],q[30];
-rx(10.625666814487902) q[18];
-rz(0.5191194915298409) q[31];
-cx q[12],q[31];
-cx q[26],q[31];
-rz(0.5191194915298409) q[31];
-cx q[26],q[31];
-rx(10.625666814487902) q[26];
-rx(10.625666814487902) q[31];
-rz(0.5191194915298409) q[32];
-cx q[21],q[32];
-cx q[21],q[38];
-rz(0.5191194915298409) q[33];
-cx q[5],q[33];
-rx(10.625666814487902) q[5];
-cx q[30],q[33];
-rz(0.5191194915298409) q[33];
-cx q[30],q[33];
-rx(10.625666814487902) q[30];
-rx(10.625666814487902) q[33];
-rz(0.5191194915298409) q[34];
-cx q[3],q[34];
-cx q[3],q[35];
-cx q[12],q[34];
-rz(0.5191194915298409) q[34];
-cx q[12],q[34];
-rx(10.625666814487902) q[12];
-cx q[34],q[37];
-rz(0.5191194915298409) q[35];
-cx q[3],q[35];
-cx q[3],q[39];
-cx q[32],q[35];
-rz(0.5191194915298409) q[35];
-cx q[32],q[35];
-rx(10.625666814487902) q[32];
-rx(10.625666814487902) q[35];
-rz(0.5191194915298409) q[37];
-cx q[34],q[37];
-rx(10.625666814487902) q[34];
-rx(10.625666814487902) q[37];
-rz(0.5191194915298409) q[38];
-cx q[21],q[38];
-rx(10.625666814487902) q[21];
-rx(10.625666814487902) q[38];
-rz(0.5191194915298409) q[39];
-cx q[3],q[39];
-cx q[13],q[39];
-rz(0.5191194915298409) q[39];
-cx q[13],q[39];
-rx(10.625666814487902) q[13];
-rx(10.625666814487902) q[39];
-rx(1.3247853147856214) q[40];
-cx q[3],q[40];
-rz(0.5191194915298409) q[40];
-cx q[3],q[40];
-rx(10.625666814487902) q[3];
-cx q[23],q[40];
-rz(0.5191194915298409) q[40];
-cx q[23],q[40];
-rx(10.625666814487902) q[23];
-rx(10.625666814487902) q[40];
\ No newline at end of file
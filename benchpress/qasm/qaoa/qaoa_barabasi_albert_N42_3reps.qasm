@@ -1,933 +0,0 @@
-OPENQASM 2.0;
-include "qelib1.inc";
-qreg q[42];
-ry(pi/2) q[0];
-rx(pi) q[0];
-ry(pi/2) q[1];
-rx(pi) q[1];
-cx q[0],q[1];
-rz(4.969409306571455) q[1];
-cx q[0],q[1];
-ry(pi/2) q[2];
-rx(pi) q[2];
-cx q[0],q[2];
-rz(4.969409306571455) q[2];
-cx q[0],q[2];
-rx(9.320139201104377) q[2];
-ry(pi/2) q[3];
-rx(pi) q[3];
-cx q[0],q[3];
-rz(4.969409306571455) q[3];
-cx q[0],q[3];
-cx q[1],q[3];
-rz(4.969409306571455) q[3];
-cx q[1],q[3];
-ry(pi/2) q[4];
-rx(pi) q[4];
-cx q[1],q[4];
-rz(4.969409306571455) q[4];
-cx q[1],q[4];
-cx q[3],q[4];
-rz(4.969409306571455) q[4];
-cx q[3],q[4];
-ry(pi/2) q[5];
-rx(pi) q[5];
-cx q[1],q[5];
-rz(4.969409306571455) q[5];
-cx q[1],q[5];
-cx q[3],q[5];
-rz(4.969409306571455) q[5];
-cx q[3],q[5];
-ry(pi/2) q[6];
-rx(pi) q[6];
-cx q[4],q[6];
-rz(4.969409306571455) q[6];
-cx q[4],q[6];
-cx q[5],q[6];
-rz(4.969409306571455) q[6];
-cx q[5],q[6];
-ry(pi/2) q[7];
-rx(pi) q[7];
-cx q[3],q[7];
-rz(4.969409306571455) q[7];
-cx q[3],q[7];
-cx q[4],q[7];
-rz(4.969409306571455) q[7];
-cx q[4],q[7];
-ry(pi/2) q[8];
-rx(pi) q[8];
-cx q[3],q[8];
-rz(4.969409306571455) q[8];
-cx q[3],q[8];
-cx q[5],q[8];
-rz(4.969409306571455) q[8];
-cx q[5],q[8];
-rx(9.320139201104377) q[8];
-ry(pi/2) q[9];
-rx(pi) q[9];
-cx q[1],q[9];
-rz(4.969409306571455) q[9];
-cx q[1],q[9];
-cx q[3],q[9];
-rz(4.969409306571455) q[9];
-cx q[3],q[9];
-ry(pi/2) q[10];
-rx(pi) q[10];
-cx q[4],q[10];
-rz(4.969409306571455) q[10];
-cx q[4],q[10];
-cx q[6],q[10];
-rz(4.969409306571455) q[10];
-cx q[6],q[10];
-ry(pi/2) q[11];
-rx(pi) q[11];
-cx q[5],q[11];
-rz(4.969409306571455) q[11];
-cx q[5],q[11];
-cx q[6],q[11];
-rz(4.969409306571455) q[11];
-cx q[6],q[11];
-rx(9.320139201104377) q[11];
-ry(pi/2) q[12];
-rx(pi) q[12];
-cx q[3],q[12];
-rz(4.969409306571455) q[12];
-cx q[3],q[12];
-cx q[5],q[12];
-rz(4.969409306571455) q[12];
-cx q[5],q[12];
-ry(pi/2) q[13];
-rx(pi) q[13];
-cx q[4],q[13];
-rz(4.969409306571455) q[13];
-cx q[4],q[13];
-cx q[5],q[13];
-rz(4.969409306571455) q[13];
-cx q[5],q[13];
-ry(pi/2) q[14];
-rx(pi) q[14];
-cx q[3],q[14];
-rz(4.969409306571455) q[14];
-cx q[3],q[14];
-cx q[4],q[14];
-rz(4.969409306571455) q[14];
-cx q[4],q[14];
-rx(9.320139201104377) q[14];
-ry(pi/2) q[15];
-rx(pi) q[15];
-cx q[0],q[15];
-rz(4.969409306571455) q[15];
-cx q[0],q[15];
-cx q[3],q[15];
-rz(4.969409306571455) q[15];
-cx q[3],q[15];
-ry(pi/2) q[16];
-rx(pi) q[16];
-cx q[0],q[16];
-rz(4.969409306571455) q[16];
-cx q[0],q[16];
-cx q[3],q[16];
-rz(4.969409306571455) q[16];
-cx q[3],q[16];
-rx(9.320139201104377) q[16];
-ry(pi/2) q[17];
-rx(pi) q[17];
-cx q[1],q[17];
-rz(4.969409306571455) q[17];
-cx q[1],q[17];
-cx q[3],q[17];
-rz(4.969409306571455) q[17];
-cx q[3],q[17];
-ry(pi/2) q[18];
-rx(pi) q[18];
-cx q[3],q[18];
-rz(4.969409306571455) q[18];
-cx q[3],q[18];
-cx q[4],q[18];
-rz(4.969409306571455) q[18];
-cx q[4],q[18];
-ry(pi/2) q[19];
-rx(pi) q[19];
-cx q[3],q[19];
-rz(4.969409306571455) q[19];
-cx q[3],q[19];
-cx q[7],q[19];
-rz(4.969409306571455) q[19];
-cx q[7],q[19];
-rx(9.320139201104377) q[7];
-ry(pi/2) q[20];
-rx(pi) q[20];
-cx q[0],q[20];
-rz(4.969409306571455) q[20];
-cx q[0],q[20];
-cx q[15],q[20];
-rz(4.969409306571455) q[20];
-cx q[15],q[20];
-ry(pi/2) q[21];
-rx(pi) q[21];
-cx q[4],q[21];
-rz(4.969409306571455) q[21];
-cx q[4],q[21];
-cx q[15],q[21];
-rz(4.969409306571455) q[21];
-cx q[15],q[21];
-ry(pi/2) q[22];
-rx(pi) q[22];
-cx q[3],q[22];
-rz(4.969409306571455) q[22];
-cx q[3],q[22];
-cx q[9],q[22];
-rz(4.969409306571455) q[22];
-cx q[9],q[22];
-rx(9.320139201104377) q[9];
-rx(9.320139201104377) q[22];
-ry(pi/2) q[23];
-rx(pi) q[23];
-cx q[3],q[23];
-rz(4.969409306571455) q[23];
-cx q[3],q[23];
-cx q[17],q[23];
-rz(4.969409306571455) q[23];
-cx q[17],q[23];
-rx(9.320139201104377) q[17];
-ry(pi/2) q[24];
-rx(pi) q[24];
-cx q[3],q[24];
-rz(4.969409306571455) q[24];
-cx q[3],q[24];
-cx q[5],q[24];
-rz(4.969409306571455) q[24];
-cx q[5],q[24];
-rx(9.320139201104377) q[24];
-ry(pi/2) q[25];
-rx(pi) q[25];
-cx q[3],q[25];
-rz(4.969409306571455) q[25];
-cx q[3],q[25];
-cx q[12],q[25];
-rz(4.969409306571455) q[25];
-cx q[12],q[25];
-rx(9.320139201104377) q[25];
-ry(pi/2) q[26];
-rx(pi) q[26];
-cx q[3],q[26];
-rz(4.969409306571455) q[26];
-cx q[3],q[26];
-cx q[21],q[26];
-rz(4.969409306571455) q[26];
-cx q[21],q[26];
-ry(pi/2) q[27];
-rx(pi) q[27];
-cx q[4],q[27];
-rz(4.969409306571455) q[27];
-cx q[4],q[27];
-rx(9.320139201104377) q[4];
-cx q[6],q[27];
-rz(4.969409306571455) q[27];
-cx q[6],q[27];
-rx(9.320139201104377) q[6];
-ry(pi/2) q[28];
-rx(pi) q[28];
-cx q[1],q[28];
-rz(4.969409306571455) q[28];
-cx q[1],q[28];
-cx q[3],q[28];
-rz(4.969409306571455) q[28];
-cx q[3],q[28];
-rx(9.320139201104377) q[28];
-ry(pi/2) q[29];
-rx(pi) q[29];
-cx q[1],q[29];
-rz(4.969409306571455) q[29];
-cx q[1],q[29];
-rx(9.320139201104377) q[1];
-cx q[3],q[29];
-rz(4.969409306571455) q[29];
-cx q[3],q[29];
-rx(9.320139201104377) q[29];
-ry(pi/2) q[30];
-rx(pi) q[30];
-cx q[3],q[30];
-rz(4.969409306571455) q[30];
-cx q[3],q[30];
-cx q[18],q[30];
-rz(4.969409306571455) q[30];
-cx q[18],q[30];
-rx(9.320139201104377) q[18];
-ry(pi/2) q[31];
-rx(pi) q[31];
-cx q[12],q[31];
-rz(4.969409306571455) q[31];
-cx q[12],q[31];
-cx q[26],q[31];
-rz(4.969409306571455) q[31];
-cx q[26],q[31];
-rx(9.320139201104377) q[26];
-rx(9.320139201104377) q[31];
-ry(pi/2) q[32];
-rx(pi) q[32];
-cx q[0],q[32];
-rz(4.969409306571455) q[32];
-cx q[0],q[32];
-rx(9.320139201104377) q[0];
-cx q[0],q[1];
-rz(1.6754362436099635) q[1];
-cx q[0],q[1];
-cx q[0],q[2];
-rz(1.6754362436099635) q[2];
-cx q[0],q[2];
-rx(12.533775883725674) q[2];
-cx q[21],q[32];
-rz(4.969409306571455) q[32];
-cx q[21],q[32];
-ry(pi/2) q[33];
-rx(pi) q[33];
-cx q[5],q[33];
-rz(4.969409306571455) q[33];
-cx q[5],q[33];
-rx(9.320139201104377) q[5];
-cx q[30],q[33];
-rz(4.969409306571455) q[33];
-cx q[30],q[33];
-rx(9.320139201104377) q[30];
-rx(9.320139201104377) q[33];
-ry(pi/2) q[34];
-rx(pi) q[34];
-cx q[3],q[34];
-rz(4.969409306571455) q[34];
-cx q[3],q[34];
-cx q[12],q[34];
-rz(4.969409306571455) q[34];
-cx q[12],q[34];
-rx(9.320139201104377) q[12];
-ry(pi/2) q[35];
-rx(pi) q[35];
-cx q[3],q[35];
-rz(4.969409306571455) q[35];
-cx q[3],q[35];
-cx q[32],q[35];
-rz(4.969409306571455) q[35];
-cx q[32],q[35];
-rx(9.320139201104377) q[32];
-rx(9.320139201104377) q[35];
-ry(pi/2) q[36];
-rx(pi) q[36];
-cx q[15],q[36];
-rz(4.969409306571455) q[36];
-cx q[15],q[36];
-rx(9.320139201104377) q[15];
-cx q[20],q[36];
-rz(4.969409306571455) q[36];
-cx q[20],q[36];
-rx(9.320139201104377) q[20];
-rx(9.320139201104377) q[36];
-ry(pi/2) q[37];
-rx(pi) q[37];
-cx q[10],q[37];
-rz(4.969409306571455) q[37];
-cx q[10],q[37];
-cx q[34],q[37];
-rz(4.969409306571455) q[37];
-cx q[34],q[37];
-rx(9.320139201104377) q[34];
-rx(9.320139201104377) q[37];
-ry(pi/2) q[38];
-rx(pi) q[38];
-cx q[19],q[38];
-rz(4.969409306571455) q[38];
-cx q[19],q[38];
-rx(9.320139201104377) q[19];
-cx q[21],q[38];
-rz(4.969409306571455) q[38];
-cx q[21],q[38];
-rx(9.320139201104377) q[21];
-rx(9.320139201104377) q[38];
-ry(pi/2) q[39];
-rx(pi) q[39];
-cx q[3],q[39];
-rz(4.969409306571455) q[39];
-cx q[3],q[39];
-cx q[13],q[39];
-rz(4.969409306571455) q[39];
-cx q[13],q[39];
-rx(9.320139201104377) q[13];
-rx(9.320139201104377) q[39];
-ry(pi/2) q[40];
-rx(pi) q[40];
-cx q[3],q[40];
-rz(4.969409306571455) q[40];
-cx q[3],q[40];
-rx(9.320139201104377) q[3];
-cx q[0],q[3];
-rz(1.6754362436099635) q[3];
-cx q[0],q[3];
-cx q[0],q[15];
-cx q[1],q[3];
-rz(1.6754362436099635) q[3];
-cx q[1],q[3];
-cx q[1],q[4];
-rz(1.6754362436099635) q[4];
-cx q[1],q[4];
-cx q[1],q[5];
-cx q[3],q[4];
-rz(1.6754362436099635) q[4];
-cx q[3],q[4];
-cx q[4],q[6];
-rz(1.6754362436099635) q[5];
-cx q[1],q[5];
-cx q[1],q[9];
-cx q[3],q[5];
-rz(1.6754362436099635) q[5];
-cx q[3],q[5];
-cx q[3],q[7];
-rz(1.6754362436099635) q[6];
-cx q[4],q[6];
-cx q[5],q[6];
-rz(1.6754362436099635) q[6];
-cx q[5],q[6];
-rz(1.6754362436099635) q[7];
-cx q[3],q[7];
-cx q[3],q[8];
-cx q[4],q[7];
-rz(1.6754362436099635) q[7];
-cx q[4],q[7];
-rz(1.6754362436099635) q[8];
-cx q[3],q[8];
-cx q[5],q[8];
-rz(1.6754362436099635) q[8];
-cx q[5],q[8];
-cx q[5],q[11];
-rx(12.533775883725674) q[8];
-rz(1.6754362436099635) q[9];
-cx q[1],q[9];
-cx q[1],q[17];
-cx q[3],q[9];
-rz(1.6754362436099635) q[9];
-cx q[3],q[9];
-cx q[3],q[12];
-rz(1.6754362436099635) q[11];
-cx q[5],q[11];
-rz(1.6754362436099635) q[12];
-cx q[3],q[12];
-cx q[3],q[14];
-cx q[5],q[12];
-rz(1.6754362436099635) q[12];
-cx q[5],q[12];
-rz(1.6754362436099635) q[14];
-cx q[3],q[14];
-rz(1.6754362436099635) q[15];
-cx q[0],q[15];
-cx q[0],q[16];
-cx q[3],q[15];
-rz(1.6754362436099635) q[15];
-cx q[3],q[15];
-rz(1.6754362436099635) q[16];
-cx q[0],q[16];
-cx q[0],q[20];
-cx q[3],q[16];
-rz(1.6754362436099635) q[16];
-cx q[3],q[16];
-rx(12.533775883725674) q[16];
-rz(1.6754362436099635) q[17];
-cx q[1],q[17];
-cx q[1],q[28];
-cx q[3],q[17];
-rz(1.6754362436099635) q[17];
-cx q[3],q[17];
-cx q[3],q[18];
-rz(1.6754362436099635) q[18];
-cx q[3],q[18];
-cx q[3],q[19];
-rz(1.6754362436099635) q[19];
-cx q[3],q[19];
-cx q[3],q[22];
-cx q[7],q[19];
-rz(1.6754362436099635) q[19];
-cx q[7],q[19];
-rx(12.533775883725674) q[7];
-cx q[19],q[38];
-rz(1.6754362436099635) q[20];
-cx q[0],q[20];
-cx q[0],q[32];
-cx q[15],q[20];
-rz(1.6754362436099635) q[20];
-cx q[15],q[20];
-rz(1.6754362436099635) q[22];
-cx q[3],q[22];
-cx q[9],q[22];
-rz(1.6754362436099635) q[22];
-cx q[9],q[22];
-rx(12.533775883725674) q[9];
-rx(12.533775883725674) q[22];
-cx q[23],q[40];
-rz(1.6754362436099635) q[28];
-cx q[1],q[28];
-cx q[1],q[29];
-rz(1.6754362436099635) q[29];
-cx q[1],q[29];
-rx(12.533775883725674) q[1];
-rz(1.6754362436099635) q[32];
-cx q[0],q[32];
-rx(12.533775883725674) q[0];
-cx q[0],q[1];
-rz(2.2120110654613643) q[1];
-cx q[0],q[1];
-cx q[0],q[2];
-rz(2.2120110654613643) q[2];
-cx q[0],q[2];
-rx(6.3041200561724855) q[2];
-rz(1.6754362436099635) q[38];
-cx q[19],q[38];
-rx(12.533775883725674) q[19];
-rz(4.969409306571455) q[40];
-cx q[23],q[40];
-rx(9.320139201104377) q[23];
-cx q[3],q[23];
-rz(1.6754362436099635) q[23];
-cx q[3],q[23];
-cx q[3],q[24];
-cx q[17],q[23];
-rz(1.6754362436099635) q[23];
-cx q[17],q[23];
-rx(12.533775883725674) q[17];
-rz(1.6754362436099635) q[24];
-cx q[3],q[24];
-cx q[3],q[25];
-rz(1.6754362436099635) q[25];
-cx q[3],q[25];
-cx q[3],q[26];
-cx q[12],q[25];
-rz(1.6754362436099635) q[25];
-cx q[12],q[25];
-cx q[12],q[31];
-rx(12.533775883725674) q[25];
-rz(1.6754362436099635) q[26];
-cx q[3],q[26];
-cx q[3],q[28];
-rz(1.6754362436099635) q[28];
-cx q[3],q[28];
-cx q[3],q[29];
-rx(12.533775883725674) q[28];
-rz(1.6754362436099635) q[29];
-cx q[3],q[29];
-cx q[3],q[30];
-rx(12.533775883725674) q[29];
-rz(1.6754362436099635) q[30];
-cx q[3],q[30];
-cx q[3],q[34];
-rz(1.6754362436099635) q[31];
-cx q[12],q[31];
-rz(1.6754362436099635) q[34];
-cx q[3],q[34];
-cx q[3],q[35];
-cx q[12],q[34];
-rz(1.6754362436099635) q[34];
-cx q[12],q[34];
-rx(12.533775883725674) q[12];
-rz(1.6754362436099635) q[35];
-cx q[3],q[35];
-cx q[3],q[39];
-rz(1.6754362436099635) q[39];
-cx q[3],q[39];
-rx(9.320139201104377) q[40];
-cx q[3],q[40];
-rz(1.6754362436099635) q[40];
-cx q[3],q[40];
-rx(12.533775883725674) q[3];
-cx q[0],q[3];
-rz(2.2120110654613643) q[3];
-cx q[0],q[3];
-cx q[1],q[3];
-rz(2.2120110654613643) q[3];
-cx q[1],q[3];
-cx q[23],q[40];
-rz(1.6754362436099635) q[40];
-cx q[23],q[40];
-rx(12.533775883725674) q[23];
-rx(12.533775883725674) q[40];
-ry(pi/2) q[41];
-rx(pi) q[41];
-cx q[10],q[41];
-rz(4.969409306571455) q[41];
-cx q[10],q[41];
-rx(9.320139201104377) q[10];
-cx q[4],q[10];
-rz(1.6754362436099635) q[10];
-cx q[4],q[10];
-cx q[4],q[13];
-cx q[6],q[10];
-rz(1.6754362436099635) q[10];
-cx q[6],q[10];
-cx q[6],q[11];
-cx q[10],q[37];
-rz(1.6754362436099635) q[11];
-cx q[6],q[11];
-rx(12.533775883725674) q[11];
-rz(1.6754362436099635) q[13];
-cx q[4],q[13];
-cx q[4],q[14];
-cx q[5],q[13];
-rz(1.6754362436099635) q[13];
-cx q[5],q[13];
-cx q[5],q[24];
-cx q[13],q[39];
-rz(1.6754362436099635) q[14];
-cx q[4],q[14];
-cx q[4],q[18];
-rx(12.533775883725674) q[14];
-rz(1.6754362436099635) q[18];
-cx q[4],q[18];
-cx q[4],q[21];
-cx q[18],q[30];
-rz(1.6754362436099635) q[21];
-cx q[4],q[21];
-cx q[15],q[21];
-rz(1.6754362436099635) q[21];
-cx q[15],q[21];
-cx q[15],q[36];
-cx q[21],q[26];
-rz(1.6754362436099635) q[24];
-cx q[5],q[24];
-cx q[5],q[33];
-rx(12.533775883725674) q[24];
-rz(1.6754362436099635) q[26];
-cx q[21],q[26];
-cx q[21],q[32];
-cx q[26],q[31];
-cx q[27],q[41];
-rz(1.6754362436099635) q[30];
-cx q[18],q[30];
-rx(12.533775883725674) q[18];
-rz(1.6754362436099635) q[31];
-cx q[26],q[31];
-rx(12.533775883725674) q[26];
-rx(12.533775883725674) q[31];
-rz(1.6754362436099635) q[32];
-cx q[21],q[32];
-cx q[21],q[38];
-cx q[32],q[35];
-rz(1.6754362436099635) q[33];
-cx q[5],q[33];
-rx(12.533775883725674) q[5];
-cx q[30],q[33];
-rz(1.6754362436099635) q[33];
-cx q[30],q[33];
-rx(12.533775883725674) q[30];
-rx(12.533775883725674) q[33];
-rz(1.6754362436099635) q[35];
-cx q[32],q[35];
-rx(12.533775883725674) q[32];
-rx(12.533775883725674) q[35];
-rz(1.6754362436099635) q[36];
-cx q[15],q[36];
-rx(12.533775883725674) q[15];
-cx q[0],q[15];
-rz(2.2120110654613643) q[15];
-cx q[0],q[15];
-cx q[0],q[16];
-rz(2.2120110654613643) q[16];
-cx q[0],q[16];
-cx q[20],q[36];
-rz(1.6754362436099635) q[36];
-cx q[20],q[36];
-rx(12.533775883725674) q[20];
-cx q[0],q[20];
-rz(2.2120110654613643) q[20];
-cx q[0],q[20];
-cx q[0],q[32];
-rz(2.2120110654613643) q[32];
-cx q[0],q[32];
-rx(6.3041200561724855) q[0];
-rx(12.533775883725674) q[36];
-rz(1.6754362436099635) q[37];
-cx q[10],q[37];
-cx q[34],q[37];
-rz(1.6754362436099635) q[37];
-cx q[34],q[37];
-rx(12.533775883725674) q[34];
-rx(12.533775883725674) q[37];
-rz(1.6754362436099635) q[38];
-cx q[21],q[38];
-rx(12.533775883725674) q[21];
-rx(12.533775883725674) q[38];
-rz(1.6754362436099635) q[39];
-cx q[13],q[39];
-rx(12.533775883725674) q[13];
-rx(12.533775883725674) q[39];
-rz(4.969409306571455) q[41];
-cx q[27],q[41];
-rx(9.320139201104377) q[27];
-cx q[4],q[27];
-rz(1.6754362436099635) q[27];
-cx q[4],q[27];
-rx(12.533775883725674) q[4];
-cx q[1],q[4];
-rz(2.2120110654613643) q[4];
-cx q[1],q[4];
-cx q[1],q[5];
-cx q[3],q[4];
-rz(2.2120110654613643) q[4];
-cx q[3],q[4];
-rz(2.2120110654613643) q[5];
-cx q[1],q[5];
-cx q[1],q[9];
-cx q[3],q[5];
-rz(2.2120110654613643) q[5];
-cx q[3],q[5];
-cx q[3],q[7];
-cx q[6],q[27];
-rz(2.2120110654613643) q[7];
-cx q[3],q[7];
-cx q[3],q[8];
-rz(2.2120110654613643) q[8];
-cx q[3],q[8];
-rz(2.2120110654613643) q[9];
-cx q[1],q[9];
-cx q[1],q[17];
-cx q[3],q[9];
-rz(2.2120110654613643) q[9];
-cx q[3],q[9];
-cx q[3],q[12];
-rz(2.2120110654613643) q[12];
-cx q[3],q[12];
-cx q[3],q[14];
-rz(2.2120110654613643) q[14];
-cx q[3],q[14];
-cx q[3],q[15];
-rz(2.2120110654613643) q[15];
-cx q[3],q[15];
-cx q[3],q[16];
-cx q[15],q[20];
-rz(2.2120110654613643) q[16];
-cx q[3],q[16];
-rx(6.3041200561724855) q[16];
-rz(2.2120110654613643) q[17];
-cx q[1],q[17];
-cx q[1],q[28];
-cx q[3],q[17];
-rz(2.2120110654613643) q[17];
-cx q[3],q[17];
-cx q[3],q[18];
-rz(2.2120110654613643) q[18];
-cx q[3],q[18];
-cx q[3],q[19];
-rz(2.2120110654613643) q[19];
-cx q[3],q[19];
-cx q[3],q[22];
-rz(2.2120110654613643) q[20];
-cx q[15],q[20];
-rz(2.2120110654613643) q[22];
-cx q[3],q[22];
-cx q[3],q[23];
-cx q[9],q[22];
-rz(2.2120110654613643) q[22];
-cx q[9],q[22];
-rx(6.3041200561724855) q[9];
-rx(6.3041200561724855) q[22];
-rz(2.2120110654613643) q[23];
-cx q[3],q[23];
-cx q[3],q[24];
-cx q[17],q[23];
-rz(2.2120110654613643) q[23];
-cx q[17],q[23];
-rx(6.3041200561724855) q[17];
-rz(2.2120110654613643) q[24];
-cx q[3],q[24];
-cx q[3],q[25];
-rz(2.2120110654613643) q[25];
-cx q[3],q[25];
-cx q[3],q[26];
-rz(2.2120110654613643) q[26];
-cx q[3],q[26];
-rz(1.6754362436099635) q[27];
-cx q[6],q[27];
-rx(12.533775883725674) q[6];
-cx q[4],q[6];
-rz(2.2120110654613643) q[6];
-cx q[4],q[6];
-cx q[4],q[7];
-cx q[5],q[6];
-rz(2.2120110654613643) q[6];
-cx q[5],q[6];
-cx q[5],q[8];
-rz(2.2120110654613643) q[7];
-cx q[4],q[7];
-cx q[7],q[19];
-rz(2.2120110654613643) q[8];
-cx q[5],q[8];
-cx q[5],q[11];
-rx(6.3041200561724855) q[8];
-rz(2.2120110654613643) q[11];
-cx q[5],q[11];
-cx q[5],q[12];
-rz(2.2120110654613643) q[12];
-cx q[5],q[12];
-cx q[12],q[25];
-rz(2.2120110654613643) q[19];
-cx q[7],q[19];
-rx(6.3041200561724855) q[7];
-cx q[19],q[38];
-rz(2.2120110654613643) q[25];
-cx q[12],q[25];
-cx q[12],q[31];
-rx(6.3041200561724855) q[25];
-rz(2.2120110654613643) q[28];
-cx q[1],q[28];
-cx q[1],q[29];
-cx q[3],q[28];
-rz(2.2120110654613643) q[28];
-cx q[3],q[28];
-rx(6.3041200561724855) q[28];
-rz(2.2120110654613643) q[29];
-cx q[1],q[29];
-rx(6.3041200561724855) q[1];
-cx q[3],q[29];
-rz(2.2120110654613643) q[29];
-cx q[3],q[29];
-cx q[3],q[30];
-rx(6.3041200561724855) q[29];
-rz(2.2120110654613643) q[30];
-cx q[3],q[30];
-cx q[3],q[34];
-rz(2.2120110654613643) q[31];
-cx q[12],q[31];
-rz(2.2120110654613643) q[34];
-cx q[3],q[34];
-cx q[3],q[35];
-cx q[12],q[34];
-rz(2.2120110654613643) q[34];
-cx q[12],q[34];
-rx(6.3041200561724855) q[12];
-rz(2.2120110654613643) q[35];
-cx q[3],q[35];
-cx q[3],q[39];
-rz(2.2120110654613643) q[38];
-cx q[19],q[38];
-rx(6.3041200561724855) q[19];
-rz(2.2120110654613643) q[39];
-cx q[3],q[39];
-cx q[3],q[40];
-rz(2.2120110654613643) q[40];
-cx q[3],q[40];
-rx(6.3041200561724855) q[3];
-cx q[23],q[40];
-rz(2.2120110654613643) q[40];
-cx q[23],q[40];
-rx(6.3041200561724855) q[23];
-rx(6.3041200561724855) q[40];
-rx(9.320139201104377) q[41];
-cx q[10],q[41];
-rz(1.6754362436099635) q[41];
-cx q[10],q[41];
-rx(12.533775883725674) q[10];
-cx q[4],q[10];
-rz(2.2120110654613643) q[10];
-cx q[4],q[10];
-cx q[4],q[13];
-cx q[6],q[10];
-rz(2.2120110654613643) q[10];
-cx q[6],q[10];
-cx q[6],q[11];
-cx q[10],q[37];
-rz(2.2120110654613643) q[11];
-cx q[6],q[11];
-rx(6.3041200561724855) q[11];
-rz(2.2120110654613643) q[13];
-cx q[4],q[13];
-cx q[4],q[14];
-cx q[5],q[13];
-rz(2.2120110654613643) q[13];
-cx q[5],q[13];
-cx q[5],q[24];
-cx q[13],q[39];
-rz(2.2120110654613643) q[14];
-cx q[4],q[14];
-cx q[4],q[18];
-rx(6.3041200561724855) q[14];
-rz(2.2120110654613643) q[18];
-cx q[4],q[18];
-cx q[4],q[21];
-cx q[18],q[30];
-rz(2.2120110654613643) q[21];
-cx q[4],q[21];
-cx q[15],q[21];
-rz(2.2120110654613643) q[21];
-cx q[15],q[21];
-cx q[15],q[36];
-cx q[21],q[26];
-rz(2.2120110654613643) q[24];
-cx q[5],q[24];
-cx q[5],q[33];
-rx(6.3041200561724855) q[24];
-rz(2.2120110654613643) q[26];
-cx q[21],q[26];
-cx q[21],q[32];
-cx q[26],q[31];
-cx q[27],q[41];
-rz(2.2120110654613643) q[30];
-cx q[18],q[30];
-rx(6.3041200561724855) q[18];
-rz(2.2120110654613643) q[31];
-cx q[26],q[31];
-rx(6.3041200561724855) q[26];
-rx(6.3041200561724855) q[31];
-rz(2.2120110654613643) q[32];
-cx q[21],q[32];
-cx q[21],q[38];
-cx q[32],q[35];
-rz(2.2120110654613643) q[33];
-cx q[5],q[33];
-rx(6.3041200561724855) q[5];
-cx q[30],q[33];
-rz(2.2120110654613643) q[33];
-cx q[30],q[33];
-rx(6.3041200561724855) q[30];
-rx(6.3041200561724855) q[33];
-rz(2.2120110654613643) q[35];
-cx q[32],q[35];
-rx(6.3041200561724855) q[32];
-rx(6.3041200561724855) q[35];
-rz(2.2120110654613643) q[36];
-cx q[15],q[36];
-rx(6.3041200561724855) q[15];
-cx q[20],q[36];
-rz(2.2120110654613643) q[36];
-cx q[20],q[36];
-rx(6.3041200561724855) q[20];
-rx(6.3041200561724855) q[36];
-rz(2.2120110654613643) q[37];
-cx q[10],q[37];
-cx q[34],q[37];
-rz(2.2120110654613643) q[37];
-cx q[34],q[37];
-rx(6.3041200561724855) q[34];
-rx(6.3041200561724855) q[37];
-rz(2.2120110654613643) q[38];
-cx q[21],q[38];
-rx(6.3041200561724855) q[21];
-rx(6.3041200561724855) q[38];
-rz(2.2120110654613643) q[39];
-cx q[13],q[39];
-rx(6.3041200561724855) q[13];
-rx(6.3041200561724855) q[39];
-rz(1.6754362436099635) q[41];
-cx q[27],q[41];
-rx(12.533775883725674) q[27];
-cx q[4],q[27];
-rz(2.2120110654613643) q[27];
-cx q[4],q[27];
-rx(6.3041200561724855) q[4];
-cx q[6],q[27];
-rz(2.2120110654613643) q[27];
-cx q[6],q[27];
-rx(6.3041200561724855) q[6];
-rx(12.533775883725674) q[41];
-cx q[10],q[41];
-rz(2.2120110654613643) q[41];
-cx q[10],q[41];
-rx(6.3041200561724855) q[10];
-cx q[27],q[41];
-rz(2.2120110654613643) q[41];
-cx q[27],q[41];
-rx(6.3041200561724855) q[27];
-rx(6.3041200561724855) q[41];
\ No newline at end of file
@@ -1,956 +0,0 @@
-OPENQASM 2.0;
-include "qelib1.inc";
-qreg q[43];
-ry(pi/2) q[0];
-rx(pi) q[0];
-ry(pi/2) q[1];
-rx(pi) q[1];
-cx q[0],q[1];
-rz(0.1773126001036407) q[1];
-cx q[0],q[1];
-ry(pi/2) q[2];
-rx(pi) q[2];
-cx q[0],q[2];
-rz(0.1773126001036407) q[2];
-cx q[0],q[2];
-rx(10.67212478793888) q[2];
-ry(pi/2) q[3];
-rx(pi) q[3];
-cx q[0],q[3];
-rz(0.1773126001036407) q[3];
-cx q[0],q[3];
-cx q[1],q[3];
-rz(0.1773126001036407) q[3];
-cx q[1],q[3];
-ry(pi/2) q[4];
-rx(pi) q[4];
-cx q[1],q[4];
-rz(0.1773126001036407) q[4];
-cx q[1],q[4];
-cx q[3],q[4];
-rz(0.1773126001036407) q[4];
-cx q[3],q[4];
-ry(pi/2) q[5];
-rx(pi) q[5];
-cx q[1],q[5];
-rz(0.1773126001036407) q[5];
-cx q[1],q[5];
-cx q[3],q[5];
-rz(0.1773126001036407) q[5];
-cx q[3],q[5];
-ry(pi/2) q[6];
-rx(pi) q[6];
-cx q[4],q[6];
-rz(0.1773126001036407) q[6];
-cx q[4],q[6];
-cx q[5],q[6];
-rz(0.1773126001036407) q[6];
-cx q[5],q[6];
-ry(pi/2) q[7];
-rx(pi) q[7];
-cx q[3],q[7];
-rz(0.1773126001036407) q[7];
-cx q[3],q[7];
-cx q[4],q[7];
-rz(0.1773126001036407) q[7];
-cx q[4],q[7];
-ry(pi/2) q[8];
-rx(pi) q[8];
-cx q[3],q[8];
-rz(0.1773126001036407) q[8];
-cx q[3],q[8];
-cx q[5],q[8];
-rz(0.1773126001036407) q[8];
-cx q[5],q[8];
-rx(10.67212478793888) q[8];
-ry(pi/2) q[9];
-rx(pi) q[9];
-cx q[1],q[9];
-rz(0.1773126001036407) q[9];
-cx q[1],q[9];
-cx q[3],q[9];
-rz(0.1773126001036407) q[9];
-cx q[3],q[9];
-ry(pi/2) q[10];
-rx(pi) q[10];
-cx q[4],q[10];
-rz(0.1773126001036407) q[10];
-cx q[4],q[10];
-cx q[6],q[10];
-rz(0.1773126001036407) q[10];
-cx q[6],q[10];
-ry(pi/2) q[11];
-rx(pi) q[11];
-cx q[5],q[11];
-rz(0.1773126001036407) q[11];
-cx q[5],q[11];
-cx q[6],q[11];
-rz(0.1773126001036407) q[11];
-cx q[6],q[11];
-rx(10.67212478793888) q[11];
-ry(pi/2) q[12];
-rx(pi) q[12];
-cx q[3],q[12];
-rz(0.1773126001036407) q[12];
-cx q[3],q[12];
-cx q[5],q[12];
-rz(0.1773126001036407) q[12];
-cx q[5],q[12];
-ry(pi/2) q[13];
-rx(pi) q[13];
-cx q[4],q[13];
-rz(0.1773126001036407) q[13];
-cx q[4],q[13];
-cx q[5],q[13];
-rz(0.1773126001036407) q[13];
-cx q[5],q[13];
-ry(pi/2) q[14];
-rx(pi) q[14];
-cx q[3],q[14];
-rz(0.1773126001036407) q[14];
-cx q[3],q[14];
-cx q[4],q[14];
-rz(0.1773126001036407) q[14];
-cx q[4],q[14];
-rx(10.67212478793888) q[14];
-ry(pi/2) q[15];
-rx(pi) q[15];
-cx q[0],q[15];
-rz(0.1773126001036407) q[15];
-cx q[0],q[15];
-cx q[3],q[15];
-rz(0.1773126001036407) q[15];
-cx q[3],q[15];
-ry(pi/2) q[16];
-rx(pi) q[16];
-cx q[0],q[16];
-rz(0.1773126001036407) q[16];
-cx q[0],q[16];
-cx q[3],q[16];
-rz(0.1773126001036407) q[16];
-cx q[3],q[16];
-rx(10.67212478793888) q[16];
-ry(pi/2) q[17];
-rx(pi) q[17];
-cx q[1],q[17];
-rz(0.1773126001036407) q[17];
-cx q[1],q[17];
-cx q[3],q[17];
-rz(0.1773126001036407) q[17];
-cx q[3],q[17];
-ry(pi/2) q[18];
-rx(pi) q[18];
-cx q[3],q[18];
-rz(0.1773126001036407) q[18];
-cx q[3],q[18];
-cx q[4],q[18];
-rz(0.1773126001036407) q[18];
-cx q[4],q[18];
-ry(pi/2) q[19];
-rx(pi) q[19];
-cx q[3],q[19];
-rz(0.1773126001036407) q[19];
-cx q[3],q[19];
-cx q[7],q[19];
-rz(0.1773126001036407) q[19];
-cx q[7],q[19];
-rx(10.67212478793888) q[7];
-ry(pi/2) q[20];
-rx(pi) q[20];
-cx q[0],q[20];
-rz(0.1773126001036407) q[20];
-cx q[0],q[20];
-cx q[15],q[20];
-rz(0.1773126001036407) q[20];
-cx q[15],q[20];
-ry(pi/2) q[21];
-rx(pi) q[21];
-cx q[4],q[21];
-rz(0.1773126001036407) q[21];
-cx q[4],q[21];
-cx q[15],q[21];
-rz(0.1773126001036407) q[21];
-cx q[15],q[21];
-ry(pi/2) q[22];
-rx(pi) q[22];
-cx q[3],q[22];
-rz(0.1773126001036407) q[22];
-cx q[3],q[22];
-cx q[9],q[22];
-rz(0.1773126001036407) q[22];
-cx q[9],q[22];
-rx(10.67212478793888) q[9];
-rx(10.67212478793888) q[22];
-ry(pi/2) q[23];
-rx(pi) q[23];
-cx q[3],q[23];
-rz(0.1773126001036407) q[23];
-cx q[3],q[23];
-cx q[17],q[23];
-rz(0.1773126001036407) q[23];
-cx q[17],q[23];
-rx(10.67212478793888) q[17];
-ry(pi/2) q[24];
-rx(pi) q[24];
-cx q[3],q[24];
-rz(0.1773126001036407) q[24];
-cx q[3],q[24];
-cx q[5],q[24];
-rz(0.1773126001036407) q[24];
-cx q[5],q[24];
-rx(10.67212478793888) q[24];
-ry(pi/2) q[25];
-rx(pi) q[25];
-cx q[3],q[25];
-rz(0.1773126001036407) q[25];
-cx q[3],q[25];
-cx q[12],q[25];
-rz(0.1773126001036407) q[25];
-cx q[12],q[25];
-rx(10.67212478793888) q[25];
-ry(pi/2) q[26];
-rx(pi) q[26];
-cx q[3],q[26];
-rz(0.1773126001036407) q[26];
-cx q[3],q[26];
-cx q[21],q[26];
-rz(0.1773126001036407) q[26];
-cx q[21],q[26];
-ry(pi/2) q[27];
-rx(pi) q[27];
-cx q[4],q[27];
-rz(0.1773126001036407) q[27];
-cx q[4],q[27];
-rx(10.67212478793888) q[4];
-cx q[6],q[27];
-rz(0.1773126001036407) q[27];
-cx q[6],q[27];
-rx(10.67212478793888) q[6];
-ry(pi/2) q[28];
-rx(pi) q[28];
-cx q[1],q[28];
-rz(0.1773126001036407) q[28];
-cx q[1],q[28];
-cx q[3],q[28];
-rz(0.1773126001036407) q[28];
-cx q[3],q[28];
-rx(10.67212478793888) q[28];
-ry(pi/2) q[29];
-rx(pi) q[29];
-cx q[1],q[29];
-rz(0.1773126001036407) q[29];
-cx q[1],q[29];
-rx(10.67212478793888) q[1];
-cx q[3],q[29];
-rz(0.1773126001036407) q[29];
-cx q[3],q[29];
-rx(10.67212478793888) q[29];
-ry(pi/2) q[30];
-rx(pi) q[30];
-cx q[3],q[30];
-rz(0.1773126001036407) q[30];
-cx q[3],q[30];
-cx q[18],q[30];
-rz(0.1773126001036407) q[30];
-cx q[18],q[30];
-rx(10.67212478793888) q[18];
-ry(pi/2) q[31];
-rx(pi) q[31];
-cx q[12],q[31];
-rz(0.1773126001036407) q[31];
-cx q[12],q[31];
-cx q[26],q[31];
-rz(0.1773126001036407) q[31];
-cx q[26],q[31];
-rx(10.67212478793888) q[26];
-rx(10.67212478793888) q[31];
-ry(pi/2) q[32];
-rx(pi) q[32];
-cx q[0],q[32];
-rz(0.1773126001036407) q[32];
-cx q[0],q[32];
-cx q[21],q[32];
-rz(0.1773126001036407) q[32];
-cx q[21],q[32];
-ry(pi/2) q[33];
-rx(pi) q[33];
-cx q[5],q[33];
-rz(0.1773126001036407) q[33];
-cx q[5],q[33];
-rx(10.67212478793888) q[5];
-cx q[30],q[33];
-rz(0.1773126001036407) q[33];
-cx q[30],q[33];
-rx(10.67212478793888) q[30];
-rx(10.67212478793888) q[33];
-ry(pi/2) q[34];
-rx(pi) q[34];
-cx q[3],q[34];
-rz(0.1773126001036407) q[34];
-cx q[3],q[34];
-cx q[12],q[34];
-rz(0.1773126001036407) q[34];
-cx q[12],q[34];
-rx(10.67212478793888) q[12];
-ry(pi/2) q[35];
-rx(pi) q[35];
-cx q[3],q[35];
-rz(0.1773126001036407) q[35];
-cx q[3],q[35];
-cx q[32],q[35];
-rz(0.1773126001036407) q[35];
-cx q[32],q[35];
-rx(10.67212478793888) q[32];
-rx(10.67212478793888) q[35];
-ry(pi/2) q[36];
-rx(pi) q[36];
-cx q[15],q[36];
-rz(0.1773126001036407) q[36];
-cx q[15],q[36];
-rx(10.67212478793888) q[15];
-cx q[20],q[36];
-rz(0.1773126001036407) q[36];
-cx q[20],q[36];
-rx(10.67212478793888) q[20];
-rx(10.67212478793888) q[36];
-ry(pi/2) q[37];
-rx(pi) q[37];
-cx q[10],q[37];
-rz(0.1773126001036407) q[37];
-cx q[10],q[37];
-cx q[34],q[37];
-rz(0.1773126001036407) q[37];
-cx q[34],q[37];
-rx(10.67212478793888) q[34];
-rx(10.67212478793888) q[37];
-ry(pi/2) q[38];
-rx(pi) q[38];
-cx q[19],q[38];
-rz(0.1773126001036407) q[38];
-cx q[19],q[38];
-rx(10.67212478793888) q[19];
-cx q[21],q[38];
-rz(0.1773126001036407) q[38];
-cx q[21],q[38];
-rx(10.67212478793888) q[21];
-rx(10.67212478793888) q[38];
-ry(pi/2) q[39];
-rx(pi) q[39];
-cx q[3],q[39];
-rz(0.1773126001036407) q[39];
-cx q[3],q[39];
-cx q[13],q[39];
-rz(0.1773126001036407) q[39];
-cx q[13],q[39];
-rx(10.67212478793888) q[13];
-rx(10.67212478793888) q[39];
-ry(pi/2) q[40];
-rx(pi) q[40];
-cx q[3],q[40];
-rz(0.1773126001036407) q[40];
-cx q[3],q[40];
-cx q[23],q[40];
-rz(0.1773126001036407) q[40];
-cx q[23],q[40];
-rx(10.67212478793888) q[23];
-rx(10.67212478793888) q[40];
-ry(pi/2) q[41];
-rx(pi) q[41];
-cx q[10],q[41];
-rz(0.1773126001036407) q[41];
-cx q[10],q[41];
-rx(10.67212478793888) q[10];
-cx q[27],q[41];
-rz(0.1773126001036407) q[41];
-cx q[27],q[41];
-rx(10.67212478793888) q[27];
-rx(10.67212478793888) q[41];
-ry(pi/2) q[42];
-rx(pi) q[42];
-cx q[0],q[42];
-rz(0.1773126001036407) q[42];
-cx q[0],q[42];
-rx(10.67212478793888) q[0];
-cx q[0],q[1];
-rz(5.941326939220104) q[1];
-cx q[0],q[1];
-cx q[0],q[2];
-rz(5.941326939220104) q[2];
-cx q[0],q[2];
-rx(5.85320899867255) q[2];
-cx q[3],q[42];
-rz(0.1773126001036407) q[42];
-cx q[3],q[42];
-rx(10.67212478793888) q[3];
-cx q[0],q[3];
-rz(5.941326939220104) q[3];
-cx q[0],q[3];
-cx q[0],q[15];
-cx q[1],q[3];
-rz(5.941326939220104) q[3];
-cx q[1],q[3];
-cx q[1],q[4];
-rz(5.941326939220104) q[4];
-cx q[1],q[4];
-cx q[1],q[5];
-cx q[3],q[4];
-rz(5.941326939220104) q[4];
-cx q[3],q[4];
-cx q[4],q[6];
-rz(5.941326939220104) q[5];
-cx q[1],q[5];
-cx q[1],q[9];
-cx q[3],q[5];
-rz(5.941326939220104) q[5];
-cx q[3],q[5];
-cx q[3],q[7];
-rz(5.941326939220104) q[6];
-cx q[4],q[6];
-cx q[5],q[6];
-rz(5.941326939220104) q[6];
-cx q[5],q[6];
-rz(5.941326939220104) q[7];
-cx q[3],q[7];
-cx q[3],q[8];
-cx q[4],q[7];
-rz(5.941326939220104) q[7];
-cx q[4],q[7];
-cx q[4],q[10];
-rz(5.941326939220104) q[8];
-cx q[3],q[8];
-cx q[5],q[8];
-rz(5.941326939220104) q[8];
-cx q[5],q[8];
-cx q[5],q[11];
-rx(5.85320899867255) q[8];
-rz(5.941326939220104) q[9];
-cx q[1],q[9];
-cx q[1],q[17];
-cx q[3],q[9];
-rz(5.941326939220104) q[9];
-cx q[3],q[9];
-cx q[3],q[12];
-rz(5.941326939220104) q[10];
-cx q[4],q[10];
-cx q[4],q[13];
-cx q[6],q[10];
-rz(5.941326939220104) q[10];
-cx q[6],q[10];
-cx q[10],q[37];
-rz(5.941326939220104) q[11];
-cx q[5],q[11];
-cx q[6],q[11];
-rz(5.941326939220104) q[11];
-cx q[6],q[11];
-rx(5.85320899867255) q[11];
-rz(5.941326939220104) q[12];
-cx q[3],q[12];
-cx q[3],q[14];
-cx q[5],q[12];
-rz(5.941326939220104) q[12];
-cx q[5],q[12];
-rz(5.941326939220104) q[13];
-cx q[4],q[13];
-cx q[5],q[13];
-rz(5.941326939220104) q[13];
-cx q[5],q[13];
-rz(5.941326939220104) q[14];
-cx q[3],q[14];
-cx q[4],q[14];
-rz(5.941326939220104) q[14];
-cx q[4],q[14];
-rx(5.85320899867255) q[14];
-rz(5.941326939220104) q[15];
-cx q[0],q[15];
-cx q[0],q[16];
-cx q[3],q[15];
-rz(5.941326939220104) q[15];
-cx q[3],q[15];
-rz(5.941326939220104) q[16];
-cx q[0],q[16];
-cx q[0],q[20];
-cx q[3],q[16];
-rz(5.941326939220104) q[16];
-cx q[3],q[16];
-rx(5.85320899867255) q[16];
-rz(5.941326939220104) q[17];
-cx q[1],q[17];
-cx q[1],q[28];
-cx q[3],q[17];
-rz(5.941326939220104) q[17];
-cx q[3],q[17];
-cx q[3],q[18];
-rz(5.941326939220104) q[18];
-cx q[3],q[18];
-cx q[3],q[19];
-cx q[4],q[18];
-rz(5.941326939220104) q[18];
-cx q[4],q[18];
-cx q[4],q[21];
-rz(5.941326939220104) q[19];
-cx q[3],q[19];
-cx q[3],q[22];
-cx q[7],q[19];
-rz(5.941326939220104) q[19];
-cx q[7],q[19];
-rx(5.85320899867255) q[7];
-cx q[19],q[38];
-rz(5.941326939220104) q[20];
-cx q[0],q[20];
-cx q[0],q[32];
-cx q[15],q[20];
-rz(5.941326939220104) q[20];
-cx q[15],q[20];
-rz(5.941326939220104) q[21];
-cx q[4],q[21];
-cx q[4],q[27];
-cx q[15],q[21];
-rz(5.941326939220104) q[21];
-cx q[15],q[21];
-cx q[15],q[36];
-rz(5.941326939220104) q[22];
-cx q[3],q[22];
-cx q[3],q[23];
-cx q[9],q[22];
-rz(5.941326939220104) q[22];
-cx q[9],q[22];
-rx(5.85320899867255) q[9];
-rx(5.85320899867255) q[22];
-rz(5.941326939220104) q[23];
-cx q[3],q[23];
-cx q[3],q[24];
-cx q[17],q[23];
-rz(5.941326939220104) q[23];
-cx q[17],q[23];
-rx(5.85320899867255) q[17];
-rz(5.941326939220104) q[24];
-cx q[3],q[24];
-cx q[3],q[25];
-cx q[5],q[24];
-rz(5.941326939220104) q[24];
-cx q[5],q[24];
-cx q[5],q[33];
-rx(5.85320899867255) q[24];
-rz(5.941326939220104) q[25];
-cx q[3],q[25];
-cx q[3],q[26];
-cx q[12],q[25];
-rz(5.941326939220104) q[25];
-cx q[12],q[25];
-cx q[12],q[31];
-rx(5.85320899867255) q[25];
-rz(5.941326939220104) q[26];
-cx q[3],q[26];
-cx q[21],q[26];
-rz(5.941326939220104) q[26];
-cx q[21],q[26];
-rz(5.941326939220104) q[27];
-cx q[4],q[27];
-rx(5.85320899867255) q[4];
-cx q[6],q[27];
-rz(5.941326939220104) q[27];
-cx q[6],q[27];
-rx(5.85320899867255) q[6];
-rz(5.941326939220104) q[28];
-cx q[1],q[28];
-cx q[1],q[29];
-cx q[3],q[28];
-rz(5.941326939220104) q[28];
-cx q[3],q[28];
-rx(5.85320899867255) q[28];
-rz(5.941326939220104) q[29];
-cx q[1],q[29];
-rx(5.85320899867255) q[1];
-cx q[3],q[29];
-rz(5.941326939220104) q[29];
-cx q[3],q[29];
-cx q[3],q[30];
-rx(5.85320899867255) q[29];
-rz(5.941326939220104) q[30];
-cx q[3],q[30];
-cx q[3],q[34];
-cx q[18],q[30];
-rz(5.941326939220104) q[30];
-cx q[18],q[30];
-rx(5.85320899867255) q[18];
-rz(5.941326939220104) q[31];
-cx q[12],q[31];
-cx q[26],q[31];
-rz(5.941326939220104) q[31];
-cx q[26],q[31];
-rx(5.85320899867255) q[26];
-rx(5.85320899867255) q[31];
-rz(5.941326939220104) q[32];
-cx q[0],q[32];
-cx q[21],q[32];
-rz(5.941326939220104) q[32];
-cx q[21],q[32];
-rz(5.941326939220104) q[33];
-cx q[5],q[33];
-rx(5.85320899867255) q[5];
-cx q[30],q[33];
-rz(5.941326939220104) q[33];
-cx q[30],q[33];
-rx(5.85320899867255) q[30];
-rx(5.85320899867255) q[33];
-rz(5.941326939220104) q[34];
-cx q[3],q[34];
-cx q[3],q[35];
-cx q[12],q[34];
-rz(5.941326939220104) q[34];
-cx q[12],q[34];
-rx(5.85320899867255) q[12];
-rz(5.941326939220104) q[35];
-cx q[3],q[35];
-cx q[3],q[39];
-cx q[32],q[35];
-rz(5.941326939220104) q[35];
-cx q[32],q[35];
-rx(5.85320899867255) q[32];
-rx(5.85320899867255) q[35];
-rz(5.941326939220104) q[36];
-cx q[15],q[36];
-rx(5.85320899867255) q[15];
-cx q[20],q[36];
-rz(5.941326939220104) q[36];
-cx q[20],q[36];
-rx(5.85320899867255) q[20];
-rx(5.85320899867255) q[36];
-rz(5.941326939220104) q[37];
-cx q[10],q[37];
-cx q[10],q[41];
-cx q[34],q[37];
-rz(5.941326939220104) q[37];
-cx q[34],q[37];
-rx(5.85320899867255) q[34];
-rx(5.85320899867255) q[37];
-rz(5.941326939220104) q[38];
-cx q[19],q[38];
-rx(5.85320899867255) q[19];
-cx q[21],q[38];
-rz(5.941326939220104) q[38];
-cx q[21],q[38];
-rx(5.85320899867255) q[21];
-rx(5.85320899867255) q[38];
-rz(5.941326939220104) q[39];
-cx q[3],q[39];
-cx q[3],q[40];
-cx q[13],q[39];
-rz(5.941326939220104) q[39];
-cx q[13],q[39];
-rx(5.85320899867255) q[13];
-rx(5.85320899867255) q[39];
-rz(5.941326939220104) q[40];
-cx q[3],q[40];
-cx q[23],q[40];
-rz(5.941326939220104) q[40];
-cx q[23],q[40];
-rx(5.85320899867255) q[23];
-rx(5.85320899867255) q[40];
-rz(5.941326939220104) q[41];
-cx q[10],q[41];
-rx(5.85320899867255) q[10];
-cx q[27],q[41];
-rz(5.941326939220104) q[41];
-cx q[27],q[41];
-rx(5.85320899867255) q[27];
-rx(5.85320899867255) q[41];
-rx(10.67212478793888) q[42];
-cx q[0],q[42];
-rz(5.941326939220104) q[42];
-cx q[0],q[42];
-rx(5.85320899867255) q[0];
-cx q[0],q[1];
-rz(4.432893117762378) q[1];
-cx q[0],q[1];
-cx q[0],q[2];
-rz(4.432893117762378) q[2];
-cx q[0],q[2];
-rx(5.0310475912018084) q[2];
-cx q[3],q[42];
-rz(5.941326939220104) q[42];
-cx q[3],q[42];
-rx(5.85320899867255) q[3];
-cx q[0],q[3];
-rz(4.432893117762378) q[3];
-cx q[0],q[3];
-cx q[0],q[15];
-cx q[1],q[3];
-rz(4.432893117762378) q[3];
-cx q[1],q[3];
-cx q[1],q[4];
-rz(4.432893117762378) q[4];
-cx q[1],q[4];
-cx q[1],q[5];
-cx q[3],q[4];
-rz(4.432893117762378) q[4];
-cx q[3],q[4];
-cx q[4],q[6];
-rz(4.432893117762378) q[5];
-cx q[1],q[5];
-cx q[1],q[9];
-cx q[3],q[5];
-rz(4.432893117762378) q[5];
-cx q[3],q[5];
-cx q[3],q[7];
-rz(4.432893117762378) q[6];
-cx q[4],q[6];
-cx q[5],q[6];
-rz(4.432893117762378) q[6];
-cx q[5],q[6];
-rz(4.432893117762378) q[7];
-cx q[3],q[7];
-cx q[3],q[8];
-cx q[4],q[7];
-rz(4.432893117762378) q[7];
-cx q[4],q[7];
-cx q[4],q[10];
-rz(4.432893117762378) q[8];
-cx q[3],q[8];
-cx q[5],q[8];
-rz(4.432893117762378) q[8];
-cx q[5],q[8];
-cx q[5],q[11];
-rx(5.0310475912018084) q[8];
-rz(4.432893117762378) q[9];
-cx q[1],q[9];
-cx q[1],q[17];
-cx q[3],q[9];
-rz(4.432893117762378) q[9];
-cx q[3],q[9];
-cx q[3],q[12];
-rz(4.432893117762378) q[10];
-cx q[4],q[10];
-cx q[4],q[13];
-cx q[6],q[10];
-rz(4.432893117762378) q[10];
-cx q[6],q[10];
-cx q[10],q[37];
-rz(4.432893117762378) q[11];
-cx q[5],q[11];
-cx q[6],q[11];
-rz(4.432893117762378) q[11];
-cx q[6],q[11];
-rx(5.0310475912018084) q[11];
-rz(4.432893117762378) q[12];
-cx q[3],q[12];
-cx q[3],q[14];
-cx q[5],q[12];
-rz(4.432893117762378) q[12];
-cx q[5],q[12];
-rz(4.432893117762378) q[13];
-cx q[4],q[13];
-cx q[5],q[13];
-rz(4.432893117762378) q[13];
-cx q[5],q[13];
-rz(4.432893117762378) q[14];
-cx q[3],q[14];
-cx q[4],q[14];
-rz(4.432893117762378) q[14];
-cx q[4],q[14];
-rx(5.0310475912018084) q[14];
-rz(4.432893117762378) q[15];
-cx q[0],q[15];
-cx q[0],q[16];
-cx q[3],q[15];
-rz(4.432893117762378) q[15];
-cx q[3],q[15];
-rz(4.432893117762378) q[16];
-cx q[0],q[16];
-cx q[0],q[20];
-cx q[3],q[16];
-rz(4.432893117762378) q[16];
-cx q[3],q[16];
-rx(5.0310475912018084) q[16];
-rz(4.432893117762378) q[17];
-cx q[1],q[17];
-cx q[1],q[28];
-cx q[3],q[17];
-rz(4.432893117762378) q[17];
-cx q[3],q[17];
-cx q[3],q[18];
-rz(4.432893117762378) q[18];
-cx q[3],q[18];
-cx q[3],q[19];
-cx q[4],q[18];
-rz(4.432893117762378) q[18];
-cx q[4],q[18];
-cx q[4],q[21];
-rz(4.432893117762378) q[19];
-cx q[3],q[19];
-cx q[3],q[22];
-cx q[7],q[19];
-rz(4.432893117762378) q[19];
-cx q[7],q[19];
-rx(5.0310475912018084) q[7];
-cx q[19],q[38];
-rz(4.432893117762378) q[20];
-cx q[0],q[20];
-cx q[0],q[32];
-cx q[15],q[20];
-rz(4.432893117762378) q[20];
-cx q[15],q[20];
-rz(4.432893117762378) q[21];
-cx q[4],q[21];
-cx q[4],q[27];
-cx q[15],q[21];
-rz(4.432893117762378) q[21];
-cx q[15],q[21];
-cx q[15],q[36];
-rz(4.432893117762378) q[22];
-cx q[3],q[22];
-cx q[3],q[23];
-cx q[9],q[22];
-rz(4.432893117762378) q[22];
-cx q[9],q[22];
-rx(5.0310475912018084) q[9];
-rx(5.0310475912018084) q[22];
-rz(4.432893117762378) q[23];
-cx q[3],q[23];
-cx q[3],q[24];
-cx q[17],q[23];
-rz(4.432893117762378) q[23];
-cx q[17],q[23];
-rx(5.0310475912018084) q[17];
-rz(4.432893117762378) q[24];
-cx q[3],q[24];
-cx q[3],q[25];
-cx q[5],q[24];
-rz(4.432893117762378) q[24];
-cx q[5],q[24];
-cx q[5],q[33];
-rx(5.0310475912018084) q[24];
-rz(4.432893117762378) q[25];
-cx q[3],q[25];
-cx q[3],q[26];
-cx q[12],q[25];
-rz(4.432893117762378) q[25];
-cx q[12],q[25];
-cx q[12],q[31];
-rx(5.0310475912018084) q[25];
-rz(4.432893117762378) q[26];
-cx q[3],q[26];
-cx q[21],q[26];
-rz(4.432893117762378) q[26];
-cx q[21],q[26];
-rz(4.432893117762378) q[27];
-cx q[4],q[27];
-rx(5.0310475912018084) q[4];
-cx q[6],q[27];
-rz(4.432893117762378) q[27];
-cx q[6],q[27];
-rx(5.0310475912018084) q[6];
-rz(4.432893117762378) q[28];
-cx q[1],q[28];
-cx q[1],q[29];
-cx q[3],q[28];
-rz(4.432893117762378) q[28];
-cx q[3],q[28];
-rx(5.0310475912018084) q[28];
-rz(4.432893117762378) q[29];
-cx q[1],q[29];
-rx(5.0310475912018084) q[1];
-cx q[3],q[29];
-rz(4.432893117762378) q[29];
-cx q[3],q[29];
-cx q[3],q[30];
-rx(5.0310475912018084) q[29];
-rz(4.432893117762378) q[30];
-cx q[3],q[30];
-cx q[3],q[34];
-cx q[18],q[30];
-rz(4.432893117762378) q[30];
-cx q[18],q[30];
-rx(5.0310475912018084) q[18];
-rz(4.432893117762378) q[31];
-cx q[12],q[31];
-cx q[26],q[31];
-rz(4.432893117762378) q[31];
-cx q[26],q[31];
-rx(5.0310475912018084) q[26];
-rx(5.0310475912018084) q[31];
-rz(4.432893117762378) q[32];
-cx q[0],q[32];
-cx q[21],q[32];
-rz(4.432893117762378) q[32];
-cx q[21],q[32];
-rz(4.432893117762378) q[33];
-cx q[5],q[33];
-rx(5.0310475912018084) q[5];
-cx q[30],q[33];
-rz(4.432893117762378) q[33];
-cx q[30],q[33];
-rx(5.0310475912018084) q[30];
-rx(5.0310475912018084) q[33];
-rz(4.432893117762378) q[34];
-cx q[3],q[34];
-cx q[3],q[35];
-cx q[12],q[34];
-rz(4.432893117762378) q[34];
-cx q[12],q[34];
-rx(5.0310475912018084) q[12];
-rz(4.432893117762378) q[35];
-cx q[3],q[35];
-cx q[3],q[39];
-cx q[32],q[35];
-rz(4.432893117762378) q[35];
-cx q[32],q[35];
-rx(5.0310475912018084) q[32];
-rx(5.0310475912018084) q[35];
-rz(4.432893117762378) q[36];
-cx q[15],q[36];
-rx(5.0310475912018084) q[15];
-cx q[20],q[36];
-rz(4.432893117762378) q[36];
-cx q[20],q[36];
-rx(5.0310475912018084) q[20];
-rx(5.0310475912018084) q[36];
-rz(4.432893117762378) q[37];
-cx q[10],q[37];
-cx q[10],q[41];
-cx q[34],q[37];
-rz(4.432893117762378) q[37];
-cx q[34],q[37];
-rx(5.0310475912018084) q[34];
-rx(5.0310475912018084) q[37];
-rz(4.432893117762378) q[38];
-cx q[19],q[38];
-rx(5.0310475912018084) q[19];
-cx q[21],q[38];
-rz(4.432893117762378) q[38];
-cx q[21],q[38];
-rx(5.0310475912018084) q[21];
-rx(5.0310475912018084) q[38];
-rz(4.432893117762378) q[39];
-cx q[3],q[39];
-cx q[3],q[40];
-cx q[13],q[39];
-rz(4.432893117762378) q[39];
-cx q[13],q[39];
-rx(5.0310475912018084) q[13];
-rx(5.0310475912018084) q[39];
-rz(4.432893117762378) q[40];
-cx q[3],q[40];
-cx q[23],q[40];
-rz(4.432893117762378) q[40];
-cx q[23],q[40];
-rx(5.0310475912018084) q[23];
-rx(5.0310475912018084) q[40];
-rz(4.432893117762378) q[41];
-cx q[10],q[41];
-rx(5.0310475912018084) q[10];
-cx q[27],q[41];
-rz(4.432893117762378) q[41];
-cx q[27],q[41];
-rx(5.0310475912018084) q[27];
-rx(5.0310475912018084) q[41];
-rx(5.85320899867255) q[42];
-cx q[0],q[42];
-rz(4.432893117762378) q[42];
-cx q[0],q[42];
-rx(5.0310475912018084) q[0];
-cx q[3],q[42];
-rz(4.432893117762378) q[42];
-cx q[3],q[42];
-rx(5.0310475912018084) q[3];
-rx(5.0310475912018084) q[42];
\ No newline at end of file
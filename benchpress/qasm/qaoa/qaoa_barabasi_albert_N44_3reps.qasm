@@ -1,979 +0,0 @@
-OPENQASM 2.0;
-include "qelib1.inc";
-qreg q[44];
-ry(pi/2) q[0];
-rx(pi) q[0];
-ry(pi/2) q[1];
-rx(pi) q[1];
-cx q[0],q[1];
-rz(4.908410879596265) q[1];
-cx q[0],q[1];
-ry(pi/2) q[2];
-rx(pi) q[2];
-cx q[0],q[2];
-rz(4.908410879596265) q[2];
-cx q[0],q[2];
-rx(7.765180072772087) q[2];
-ry(pi/2) q[3];
-rx(pi) q[3];
-cx q[0],q[3];
-rz(4.908410879596265) q[3];
-cx q[0],q[3];
-cx q[1],q[3];
-rz(4.908410879596265) q[3];
-cx q[1],q[3];
-ry(pi/2) q[4];
-rx(pi) q[4];
-cx q[1],q[4];
-rz(4.908410879596265) q[4];
-cx q[1],q[4];
-cx q[3],q[4];
-rz(4.908410879596265) q[4];
-cx q[3],q[4];
-ry(pi/2) q[5];
-rx(pi) q[5];
-cx q[1],q[5];
-rz(4.908410879596265) q[5];
-cx q[1],q[5];
-cx q[3],q[5];
-rz(4.908410879596265) q[5];
-cx q[3],q[5];
-ry(pi/2) q[6];
-rx(pi) q[6];
-cx q[4],q[6];
-rz(4.908410879596265) q[6];
-cx q[4],q[6];
-cx q[5],q[6];
-rz(4.908410879596265) q[6];
-cx q[5],q[6];
-ry(pi/2) q[7];
-rx(pi) q[7];
-cx q[3],q[7];
-rz(4.908410879596265) q[7];
-cx q[3],q[7];
-cx q[4],q[7];
-rz(4.908410879596265) q[7];
-cx q[4],q[7];
-ry(pi/2) q[8];
-rx(pi) q[8];
-cx q[3],q[8];
-rz(4.908410879596265) q[8];
-cx q[3],q[8];
-cx q[5],q[8];
-rz(4.908410879596265) q[8];
-cx q[5],q[8];
-rx(7.765180072772087) q[8];
-ry(pi/2) q[9];
-rx(pi) q[9];
-cx q[1],q[9];
-rz(4.908410879596265) q[9];
-cx q[1],q[9];
-cx q[3],q[9];
-rz(4.908410879596265) q[9];
-cx q[3],q[9];
-ry(pi/2) q[10];
-rx(pi) q[10];
-cx q[4],q[10];
-rz(4.908410879596265) q[10];
-cx q[4],q[10];
-cx q[6],q[10];
-rz(4.908410879596265) q[10];
-cx q[6],q[10];
-ry(pi/2) q[11];
-rx(pi) q[11];
-cx q[5],q[11];
-rz(4.908410879596265) q[11];
-cx q[5],q[11];
-cx q[6],q[11];
-rz(4.908410879596265) q[11];
-cx q[6],q[11];
-rx(7.765180072772087) q[11];
-ry(pi/2) q[12];
-rx(pi) q[12];
-cx q[3],q[12];
-rz(4.908410879596265) q[12];
-cx q[3],q[12];
-cx q[5],q[12];
-rz(4.908410879596265) q[12];
-cx q[5],q[12];
-ry(pi/2) q[13];
-rx(pi) q[13];
-cx q[4],q[13];
-rz(4.908410879596265) q[13];
-cx q[4],q[13];
-cx q[5],q[13];
-rz(4.908410879596265) q[13];
-cx q[5],q[13];
-ry(pi/2) q[14];
-rx(pi) q[14];
-cx q[3],q[14];
-rz(4.908410879596265) q[14];
-cx q[3],q[14];
-cx q[4],q[14];
-rz(4.908410879596265) q[14];
-cx q[4],q[14];
-rx(7.765180072772087) q[14];
-ry(pi/2) q[15];
-rx(pi) q[15];
-cx q[0],q[15];
-rz(4.908410879596265) q[15];
-cx q[0],q[15];
-cx q[3],q[15];
-rz(4.908410879596265) q[15];
-cx q[3],q[15];
-ry(pi/2) q[16];
-rx(pi) q[16];
-cx q[0],q[16];
-rz(4.908410879596265) q[16];
-cx q[0],q[16];
-cx q[3],q[16];
-rz(4.908410879596265) q[16];
-cx q[3],q[16];
-rx(7.765180072772087) q[16];
-ry(pi/2) q[17];
-rx(pi) q[17];
-cx q[1],q[17];
-rz(4.908410879596265) q[17];
-cx q[1],q[17];
-cx q[3],q[17];
-rz(4.908410879596265) q[17];
-cx q[3],q[17];
-ry(pi/2) q[18];
-rx(pi) q[18];
-cx q[3],q[18];
-rz(4.908410879596265) q[18];
-cx q[3],q[18];
-cx q[4],q[18];
-rz(4.908410879596265) q[18];
-cx q[4],q[18];
-ry(pi/2) q[19];
-rx(pi) q[19];
-cx q[3],q[19];
-rz(4.908410879596265) q[19];
-cx q[3],q[19];
-cx q[7],q[19];
-rz(4.908410879596265) q[19];
-cx q[7],q[19];
-rx(7.765180072772087) q[7];
-ry(pi/2) q[20];
-rx(pi) q[20];
-cx q[0],q[20];
-rz(4.908410879596265) q[20];
-cx q[0],q[20];
-cx q[15],q[20];
-rz(4.908410879596265) q[20];
-cx q[15],q[20];
-ry(pi/2) q[21];
-rx(pi) q[21];
-cx q[4],q[21];
-rz(4.908410879596265) q[21];
-cx q[4],q[21];
-cx q[15],q[21];
-rz(4.908410879596265) q[21];
-cx q[15],q[21];
-ry(pi/2) q[22];
-rx(pi) q[22];
-cx q[3],q[22];
-rz(4.908410879596265) q[22];
-cx q[3],q[22];
-cx q[9],q[22];
-rz(4.908410879596265) q[22];
-cx q[9],q[22];
-rx(7.765180072772087) q[9];
-rx(7.765180072772087) q[22];
-ry(pi/2) q[23];
-rx(pi) q[23];
-cx q[3],q[23];
-rz(4.908410879596265) q[23];
-cx q[3],q[23];
-cx q[17],q[23];
-rz(4.908410879596265) q[23];
-cx q[17],q[23];
-rx(7.765180072772087) q[17];
-ry(pi/2) q[24];
-rx(pi) q[24];
-cx q[3],q[24];
-rz(4.908410879596265) q[24];
-cx q[3],q[24];
-cx q[5],q[24];
-rz(4.908410879596265) q[24];
-cx q[5],q[24];
-rx(7.765180072772087) q[24];
-ry(pi/2) q[25];
-rx(pi) q[25];
-cx q[3],q[25];
-rz(4.908410879596265) q[25];
-cx q[3],q[25];
-cx q[12],q[25];
-rz(4.908410879596265) q[25];
-cx q[12],q[25];
-rx(7.765180072772087) q[25];
-ry(pi/2) q[26];
-rx(pi) q[26];
-cx q[3],q[26];
-rz(4.908410879596265) q[26];
-cx q[3],q[26];
-cx q[21],q[26];
-rz(4.908410879596265) q[26];
-cx q[21],q[26];
-ry(pi/2) q[27];
-rx(pi) q[27];
-cx q[4],q[27];
-rz(4.908410879596265) q[27];
-cx q[4],q[27];
-rx(7.765180072772087) q[4];
-cx q[6],q[27];
-rz(4.908410879596265) q[27];
-cx q[6],q[27];
-rx(7.765180072772087) q[6];
-ry(pi/2) q[28];
-rx(pi) q[28];
-cx q[1],q[28];
-rz(4.908410879596265) q[28];
-cx q[1],q[28];
-cx q[3],q[28];
-rz(4.908410879596265) q[28];
-cx q[3],q[28];
-rx(7.765180072772087) q[28];
-ry(pi/2) q[29];
-rx(pi) q[29];
-cx q[1],q[29];
-rz(4.908410879596265) q[29];
-cx q[1],q[29];
-rx(7.765180072772087) q[1];
-cx q[3],q[29];
-rz(4.908410879596265) q[29];
-cx q[3],q[29];
-rx(7.765180072772087) q[29];
-ry(pi/2) q[30];
-rx(pi) q[30];
-cx q[3],q[30];
-rz(4.908410879596265) q[30];
-cx q[3],q[30];
-cx q[18],q[30];
-rz(4.908410879596265) q[30];
-cx q[18],q[30];
-rx(7.765180072772087) q[18];
-ry(pi/2) q[31];
-rx(pi) q[31];
-cx q[12],q[31];
-rz(4.908410879596265) q[31];
-cx q[12],q[31];
-cx q[26],q[31];
-rz(4.908410879596265) q[31];
-cx q[26],q[31];
-rx(7.765180072772087) q[26];
-rx(7.765180072772087) q[31];
-ry(pi/2) q[32];
-rx(pi) q[32];
-cx q[0],q[32];
-rz(4.908410879596265) q[32];
-cx q[0],q[32];
-cx q[21],q[32];
-rz(4.908410879596265) q[32];
-cx q[21],q[32];
-ry(pi/2) q[33];
-rx(pi) q[33];
-cx q[5],q[33];
-rz(4.908410879596265) q[33];
-cx q[5],q[33];
-rx(7.765180072772087) q[5];
-cx q[30],q[33];
-rz(4.908410879596265) q[33];
-cx q[30],q[33];
-rx(7.765180072772087) q[30];
-rx(7.765180072772087) q[33];
-ry(pi/2) q[34];
-rx(pi) q[34];
-cx q[3],q[34];
-rz(4.908410879596265) q[34];
-cx q[3],q[34];
-cx q[12],q[34];
-rz(4.908410879596265) q[34];
-cx q[12],q[34];
-rx(7.765180072772087) q[12];
-ry(pi/2) q[35];
-rx(pi) q[35];
-cx q[3],q[35];
-rz(4.908410879596265) q[35];
-cx q[3],q[35];
-cx q[32],q[35];
-rz(4.908410879596265) q[35];
-cx q[32],q[35];
-rx(7.765180072772087) q[32];
-rx(7.765180072772087) q[35];
-ry(pi/2) q[36];
-rx(pi) q[36];
-cx q[15],q[36];
-rz(4.908410879596265) q[36];
-cx q[15],q[36];
-rx(7.765180072772087) q[15];
-cx q[20],q[36];
-rz(4.908410879596265) q[36];
-cx q[20],q[36];
-rx(7.765180072772087) q[36];
-ry(pi/2) q[37];
-rx(pi) q[37];
-cx q[10],q[37];
-rz(4.908410879596265) q[37];
-cx q[10],q[37];
-cx q[34],q[37];
-rz(4.908410879596265) q[37];
-cx q[34],q[37];
-rx(7.765180072772087) q[34];
-rx(7.765180072772087) q[37];
-ry(pi/2) q[38];
-rx(pi) q[38];
-cx q[19],q[38];
-rz(4.908410879596265) q[38];
-cx q[19],q[38];
-rx(7.765180072772087) q[19];
-cx q[21],q[38];
-rz(4.908410879596265) q[38];
-cx q[21],q[38];
-rx(7.765180072772087) q[21];
-rx(7.765180072772087) q[38];
-ry(pi/2) q[39];
-rx(pi) q[39];
-cx q[3],q[39];
-rz(4.908410879596265) q[39];
-cx q[3],q[39];
-cx q[13],q[39];
-rz(4.908410879596265) q[39];
-cx q[13],q[39];
-rx(7.765180072772087) q[13];
-rx(7.765180072772087) q[39];
-ry(pi/2) q[40];
-rx(pi) q[40];
-cx q[3],q[40];
-rz(4.908410879596265) q[40];
-cx q[3],q[40];
-cx q[23],q[40];
-rz(4.908410879596265) q[40];
-cx q[23],q[40];
-rx(7.765180072772087) q[23];
-rx(7.765180072772087) q[40];
-ry(pi/2) q[41];
-rx(pi) q[41];
-cx q[10],q[41];
-rz(4.908410879596265) q[41];
-cx q[10],q[41];
-rx(7.765180072772087) q[10];
-cx q[27],q[41];
-rz(4.908410879596265) q[41];
-cx q[27],q[41];
-rx(7.765180072772087) q[27];
-rx(7.765180072772087) q[41];
-ry(pi/2) q[42];
-rx(pi) q[42];
-cx q[0],q[42];
-rz(4.908410879596265) q[42];
-cx q[0],q[42];
-rx(7.765180072772087) q[0];
-cx q[0],q[1];
-rz(4.056582371699209) q[1];
-cx q[0],q[1];
-cx q[0],q[2];
-rz(4.056582371699209) q[2];
-cx q[0],q[2];
-rx(3.6919870318391905) q[2];
-cx q[3],q[42];
-rz(4.908410879596265) q[42];
-cx q[3],q[42];
-rx(7.765180072772087) q[42];
-ry(pi/2) q[43];
-rx(pi) q[43];
-cx q[3],q[43];
-rz(4.908410879596265) q[43];
-cx q[3],q[43];
-rx(7.765180072772087) q[3];
-cx q[0],q[3];
-rz(4.056582371699209) q[3];
-cx q[0],q[3];
-cx q[0],q[15];
-cx q[1],q[3];
-rz(4.056582371699209) q[3];
-cx q[1],q[3];
-cx q[1],q[4];
-rz(4.056582371699209) q[4];
-cx q[1],q[4];
-cx q[1],q[5];
-cx q[3],q[4];
-rz(4.056582371699209) q[4];
-cx q[3],q[4];
-cx q[4],q[6];
-rz(4.056582371699209) q[5];
-cx q[1],q[5];
-cx q[1],q[9];
-cx q[3],q[5];
-rz(4.056582371699209) q[5];
-cx q[3],q[5];
-cx q[3],q[7];
-rz(4.056582371699209) q[6];
-cx q[4],q[6];
-cx q[5],q[6];
-rz(4.056582371699209) q[6];
-cx q[5],q[6];
-rz(4.056582371699209) q[7];
-cx q[3],q[7];
-cx q[3],q[8];
-cx q[4],q[7];
-rz(4.056582371699209) q[7];
-cx q[4],q[7];
-cx q[4],q[10];
-rz(4.056582371699209) q[8];
-cx q[3],q[8];
-cx q[5],q[8];
-rz(4.056582371699209) q[8];
-cx q[5],q[8];
-cx q[5],q[11];
-rx(3.6919870318391905) q[8];
-rz(4.056582371699209) q[9];
-cx q[1],q[9];
-cx q[1],q[17];
-cx q[3],q[9];
-rz(4.056582371699209) q[9];
-cx q[3],q[9];
-cx q[3],q[12];
-rz(4.056582371699209) q[10];
-cx q[4],q[10];
-cx q[4],q[13];
-cx q[6],q[10];
-rz(4.056582371699209) q[10];
-cx q[6],q[10];
-cx q[10],q[37];
-rz(4.056582371699209) q[11];
-cx q[5],q[11];
-cx q[6],q[11];
-rz(4.056582371699209) q[11];
-cx q[6],q[11];
-rx(3.6919870318391905) q[11];
-rz(4.056582371699209) q[12];
-cx q[3],q[12];
-cx q[3],q[14];
-cx q[5],q[12];
-rz(4.056582371699209) q[12];
-cx q[5],q[12];
-rz(4.056582371699209) q[13];
-cx q[4],q[13];
-cx q[5],q[13];
-rz(4.056582371699209) q[13];
-cx q[5],q[13];
-rz(4.056582371699209) q[14];
-cx q[3],q[14];
-cx q[4],q[14];
-rz(4.056582371699209) q[14];
-cx q[4],q[14];
-rx(3.6919870318391905) q[14];
-rz(4.056582371699209) q[15];
-cx q[0],q[15];
-cx q[0],q[16];
-cx q[3],q[15];
-rz(4.056582371699209) q[15];
-cx q[3],q[15];
-rz(4.056582371699209) q[16];
-cx q[0],q[16];
-cx q[3],q[16];
-rz(4.056582371699209) q[16];
-cx q[3],q[16];
-rx(3.6919870318391905) q[16];
-rz(4.056582371699209) q[17];
-cx q[1],q[17];
-cx q[1],q[28];
-cx q[3],q[17];
-rz(4.056582371699209) q[17];
-cx q[3],q[17];
-cx q[3],q[18];
-rz(4.056582371699209) q[18];
-cx q[3],q[18];
-cx q[3],q[19];
-cx q[4],q[18];
-rz(4.056582371699209) q[18];
-cx q[4],q[18];
-cx q[4],q[21];
-rz(4.056582371699209) q[19];
-cx q[3],q[19];
-cx q[3],q[22];
-cx q[7],q[19];
-rz(4.056582371699209) q[19];
-cx q[7],q[19];
-rx(3.6919870318391905) q[7];
-cx q[19],q[38];
-cx q[20],q[43];
-rz(4.056582371699209) q[21];
-cx q[4],q[21];
-cx q[4],q[27];
-rz(4.056582371699209) q[22];
-cx q[3],q[22];
-cx q[3],q[23];
-cx q[9],q[22];
-rz(4.056582371699209) q[22];
-cx q[9],q[22];
-rx(3.6919870318391905) q[9];
-rx(3.6919870318391905) q[22];
-rz(4.056582371699209) q[23];
-cx q[3],q[23];
-cx q[3],q[24];
-cx q[17],q[23];
-rz(4.056582371699209) q[23];
-cx q[17],q[23];
-rx(3.6919870318391905) q[17];
-rz(4.056582371699209) q[24];
-cx q[3],q[24];
-cx q[3],q[25];
-cx q[5],q[24];
-rz(4.056582371699209) q[24];
-cx q[5],q[24];
-cx q[5],q[33];
-rx(3.6919870318391905) q[24];
-rz(4.056582371699209) q[25];
-cx q[3],q[25];
-cx q[3],q[26];
-cx q[12],q[25];
-rz(4.056582371699209) q[25];
-cx q[12],q[25];
-cx q[12],q[31];
-rx(3.6919870318391905) q[25];
-rz(4.056582371699209) q[26];
-cx q[3],q[26];
-rz(4.056582371699209) q[27];
-cx q[4],q[27];
-rx(3.6919870318391905) q[4];
-cx q[6],q[27];
-rz(4.056582371699209) q[27];
-cx q[6],q[27];
-rx(3.6919870318391905) q[6];
-rz(4.056582371699209) q[28];
-cx q[1],q[28];
-cx q[1],q[29];
-cx q[3],q[28];
-rz(4.056582371699209) q[28];
-cx q[3],q[28];
-rx(3.6919870318391905) q[28];
-rz(4.056582371699209) q[29];
-cx q[1],q[29];
-rx(3.6919870318391905) q[1];
-cx q[3],q[29];
-rz(4.056582371699209) q[29];
-cx q[3],q[29];
-cx q[3],q[30];
-rx(3.6919870318391905) q[29];
-rz(4.056582371699209) q[30];
-cx q[3],q[30];
-cx q[3],q[34];
-cx q[18],q[30];
-rz(4.056582371699209) q[30];
-cx q[18],q[30];
-rx(3.6919870318391905) q[18];
-rz(4.056582371699209) q[31];
-cx q[12],q[31];
-rz(4.056582371699209) q[33];
-cx q[5],q[33];
-rx(3.6919870318391905) q[5];
-cx q[30],q[33];
-rz(4.056582371699209) q[33];
-cx q[30],q[33];
-rx(3.6919870318391905) q[30];
-rx(3.6919870318391905) q[33];
-rz(4.056582371699209) q[34];
-cx q[3],q[34];
-cx q[3],q[35];
-cx q[12],q[34];
-rz(4.056582371699209) q[34];
-cx q[12],q[34];
-rx(3.6919870318391905) q[12];
-rz(4.056582371699209) q[35];
-cx q[3],q[35];
-cx q[3],q[39];
-rz(4.056582371699209) q[37];
-cx q[10],q[37];
-cx q[10],q[41];
-cx q[34],q[37];
-rz(4.056582371699209) q[37];
-cx q[34],q[37];
-rx(3.6919870318391905) q[34];
-rx(3.6919870318391905) q[37];
-rz(4.056582371699209) q[38];
-cx q[19],q[38];
-rx(3.6919870318391905) q[19];
-rz(4.056582371699209) q[39];
-cx q[3],q[39];
-cx q[3],q[40];
-cx q[13],q[39];
-rz(4.056582371699209) q[39];
-cx q[13],q[39];
-rx(3.6919870318391905) q[13];
-rx(3.6919870318391905) q[39];
-rz(4.056582371699209) q[40];
-cx q[3],q[40];
-cx q[23],q[40];
-rz(4.056582371699209) q[40];
-cx q[23],q[40];
-rx(3.6919870318391905) q[23];
-rx(3.6919870318391905) q[40];
-rz(4.056582371699209) q[41];
-cx q[10],q[41];
-rx(3.6919870318391905) q[10];
-cx q[27],q[41];
-rz(4.056582371699209) q[41];
-cx q[27],q[41];
-rx(3.6919870318391905) q[27];
-rx(3.6919870318391905) q[41];
-rz(4.908410879596265) q[43];
-cx q[20],q[43];
-rx(7.765180072772087) q[20];
-cx q[0],q[20];
-rz(4.056582371699209) q[20];
-cx q[0],q[20];
-cx q[0],q[32];
-cx q[15],q[20];
-rz(4.056582371699209) q[20];
-cx q[15],q[20];
-cx q[15],q[21];
-rz(4.056582371699209) q[21];
-cx q[15],q[21];
-cx q[15],q[36];
-cx q[21],q[26];
-rz(4.056582371699209) q[26];
-cx q[21],q[26];
-cx q[26],q[31];
-rz(4.056582371699209) q[31];
-cx q[26],q[31];
-rx(3.6919870318391905) q[26];
-rx(3.6919870318391905) q[31];
-rz(4.056582371699209) q[32];
-cx q[0],q[32];
-cx q[0],q[42];
-cx q[21],q[32];
-rz(4.056582371699209) q[32];
-cx q[21],q[32];
-cx q[21],q[38];
-cx q[32],q[35];
-rz(4.056582371699209) q[35];
-cx q[32],q[35];
-rx(3.6919870318391905) q[32];
-rx(3.6919870318391905) q[35];
-rz(4.056582371699209) q[36];
-cx q[15],q[36];
-rx(3.6919870318391905) q[15];
-cx q[20],q[36];
-rz(4.056582371699209) q[36];
-cx q[20],q[36];
-rx(3.6919870318391905) q[36];
-rz(4.056582371699209) q[38];
-cx q[21],q[38];
-rx(3.6919870318391905) q[21];
-rx(3.6919870318391905) q[38];
-rz(4.056582371699209) q[42];
-cx q[0],q[42];
-rx(3.6919870318391905) q[0];
-cx q[0],q[1];
-rz(0.15689007245246428) q[1];
-cx q[0],q[1];
-cx q[0],q[2];
-rz(0.15689007245246428) q[2];
-cx q[0],q[2];
-rx(8.388145208913759) q[2];
-cx q[3],q[42];
-rz(4.056582371699209) q[42];
-cx q[3],q[42];
-rx(3.6919870318391905) q[42];
-rx(7.765180072772087) q[43];
-cx q[3],q[43];
-rz(4.056582371699209) q[43];
-cx q[3],q[43];
-rx(3.6919870318391905) q[3];
-cx q[0],q[3];
-rz(0.15689007245246428) q[3];
-cx q[0],q[3];
-cx q[0],q[15];
-cx q[1],q[3];
-rz(0.15689007245246428) q[3];
-cx q[1],q[3];
-cx q[1],q[4];
-rz(0.15689007245246428) q[4];
-cx q[1],q[4];
-cx q[1],q[5];
-cx q[3],q[4];
-rz(0.15689007245246428) q[4];
-cx q[3],q[4];
-cx q[4],q[6];
-rz(0.15689007245246428) q[5];
-cx q[1],q[5];
-cx q[1],q[9];
-cx q[3],q[5];
-rz(0.15689007245246428) q[5];
-cx q[3],q[5];
-cx q[3],q[7];
-rz(0.15689007245246428) q[6];
-cx q[4],q[6];
-cx q[5],q[6];
-rz(0.15689007245246428) q[6];
-cx q[5],q[6];
-rz(0.15689007245246428) q[7];
-cx q[3],q[7];
-cx q[3],q[8];
-cx q[4],q[7];
-rz(0.15689007245246428) q[7];
-cx q[4],q[7];
-cx q[4],q[10];
-rz(0.15689007245246428) q[8];
-cx q[3],q[8];
-cx q[5],q[8];
-rz(0.15689007245246428) q[8];
-cx q[5],q[8];
-cx q[5],q[11];
-rx(8.388145208913759) q[8];
-rz(0.15689007245246428) q[9];
-cx q[1],q[9];
-cx q[1],q[17];
-cx q[3],q[9];
-rz(0.15689007245246428) q[9];
-cx q[3],q[9];
-cx q[3],q[12];
-rz(0.15689007245246428) q[10];
-cx q[4],q[10];
-cx q[4],q[13];
-cx q[6],q[10];
-rz(0.15689007245246428) q[10];
-cx q[6],q[10];
-cx q[10],q[37];
-rz(0.15689007245246428) q[11];
-cx q[5],q[11];
-cx q[6],q[11];
-rz(0.15689007245246428) q[11];
-cx q[6],q[11];
-rx(8.388145208913759) q[11];
-rz(0.15689007245246428) q[12];
-cx q[3],q[12];
-cx q[3],q[14];
-cx q[5],q[12];
-rz(0.15689007245246428) q[12];
-cx q[5],q[12];
-rz(0.15689007245246428) q[13];
-cx q[4],q[13];
-cx q[5],q[13];
-rz(0.15689007245246428) q[13];
-cx q[5],q[13];
-rz(0.15689007245246428) q[14];
-cx q[3],q[14];
-cx q[4],q[14];
-rz(0.15689007245246428) q[14];
-cx q[4],q[14];
-rx(8.388145208913759) q[14];
-rz(0.15689007245246428) q[15];
-cx q[0],q[15];
-cx q[0],q[16];
-cx q[3],q[15];
-rz(0.15689007245246428) q[15];
-cx q[3],q[15];
-rz(0.15689007245246428) q[16];
-cx q[0],q[16];
-cx q[3],q[16];
-rz(0.15689007245246428) q[16];
-cx q[3],q[16];
-rx(8.388145208913759) q[16];
-rz(0.15689007245246428) q[17];
-cx q[1],q[17];
-cx q[1],q[28];
-cx q[3],q[17];
-rz(0.15689007245246428) q[17];
-cx q[3],q[17];
-cx q[3],q[18];
-rz(0.15689007245246428) q[18];
-cx q[3],q[18];
-cx q[3],q[19];
-cx q[4],q[18];
-rz(0.15689007245246428) q[18];
-cx q[4],q[18];
-cx q[4],q[21];
-rz(0.15689007245246428) q[19];
-cx q[3],q[19];
-cx q[3],q[22];
-cx q[7],q[19];
-rz(0.15689007245246428) q[19];
-cx q[7],q[19];
-rx(8.388145208913759) q[7];
-cx q[19],q[38];
-cx q[20],q[43];
-rz(0.15689007245246428) q[21];
-cx q[4],q[21];
-cx q[4],q[27];
-rz(0.15689007245246428) q[22];
-cx q[3],q[22];
-cx q[3],q[23];
-cx q[9],q[22];
-rz(0.15689007245246428) q[22];
-cx q[9],q[22];
-rx(8.388145208913759) q[9];
-rx(8.388145208913759) q[22];
-rz(0.15689007245246428) q[23];
-cx q[3],q[23];
-cx q[3],q[24];
-cx q[17],q[23];
-rz(0.15689007245246428) q[23];
-cx q[17],q[23];
-rx(8.388145208913759) q[17];
-rz(0.15689007245246428) q[24];
-cx q[3],q[24];
-cx q[3],q[25];
-cx q[5],q[24];
-rz(0.15689007245246428) q[24];
-cx q[5],q[24];
-cx q[5],q[33];
-rx(8.388145208913759) q[24];
-rz(0.15689007245246428) q[25];
-cx q[3],q[25];
-cx q[3],q[26];
-cx q[12],q[25];
-rz(0.15689007245246428) q[25];
-cx q[12],q[25];
-cx q[12],q[31];
-rx(8.388145208913759) q[25];
-rz(0.15689007245246428) q[26];
-cx q[3],q[26];
-rz(0.15689007245246428) q[27];
-cx q[4],q[27];
-rx(8.388145208913759) q[4];
-cx q[6],q[27];
-rz(0.15689007245246428) q[27];
-cx q[6],q[27];
-rx(8.388145208913759) q[6];
-rz(0.15689007245246428) q[28];
-cx q[1],q[28];
-cx q[1],q[29];
-cx q[3],q[28];
-rz(0.15689007245246428) q[28];
-cx q[3],q[28];
-rx(8.388145208913759) q[28];
-rz(0.15689007245246428) q[29];
-cx q[1],q[29];
-rx(8.388145208913759) q[1];
-cx q[3],q[29];
-rz(0.15689007245246428) q[29];
-cx q[3],q[29];
-cx q[3],q[30];
-rx(8.388145208913759) q[29];
-rz(0.15689007245246428) q[30];
-cx q[3],q[30];
-cx q[3],q[34];
-cx q[18],q[30];
-rz(0.15689007245246428) q[30];
-cx q[18],q[30];
-rx(8.388145208913759) q[18];
-rz(0.15689007245246428) q[31];
-cx q[12],q[31];
-rz(0.15689007245246428) q[33];
-cx q[5],q[33];
-rx(8.388145208913759) q[5];
-cx q[30],q[33];
-rz(0.15689007245246428) q[33];
-cx q[30],q[33];
-rx(8.388145208913759) q[30];
-rx(8.388145208913759) q[33];
-rz(0.15689007245246428) q[34];
-cx q[3],q[34];
-cx q[3],q[35];
-cx q[12],q[34];
-rz(0.15689007245246428) q[34];
-cx q[12],q[34];
-rx(8.388145208913759) q[12];
-rz(0.15689007245246428) q[35];
-cx q[3],q[35];
-cx q[3],q[39];
-rz(0.15689007245246428) q[37];
-cx q[10],q[37];
-cx q[10],q[41];
-cx q[34],q[37];
-rz(0.15689007245246428) q[37];
-cx q[34],q[37];
-rx(8.388145208913759) q[34];
-rx(8.388145208913759) q[37];
-rz(0.15689007245246428) q[38];
-cx q[19],q[38];
-rx(8.388145208913759) q[19];
-rz(0.15689007245246428) q[39];
-cx q[3],q[39];
-cx q[3],q[40];
-cx q[13],q[39];
-rz(0.15689007245246428) q[39];
-cx q[13],q[39];
-rx(8.388145208913759) q[13];
-rx(8.388145208913759) q[39];
-rz(0.15689007245246428) q[40];
-cx q[3],q[40];
-cx q[23],q[40];
-rz(0.15689007245246428) q[40];
-cx q[23],q[40];
-rx(8.388145208913759) q[23];
-rx(8.388145208913759) q[40];
-rz(0.15689007245246428) q[41];
-cx q[10],q[41];
-rx(8.388145208913759) q[10];
-cx q[27],q[41];
-rz(0.15689007245246428) q[41];
-cx q[27],q[41];
-rx(8.388145208913759) q[27];
-rx(8.388145208913759) q[41];
-rz(4.056582371699209) q[43];
-cx q[20],q[43];
-rx(3.6919870318391905) q[20];
-cx q[0],q[20];
-rz(0.15689007245246428) q[20];
-cx q[0],q[20];
-cx q[0],q[32];
-cx q[15],q[20];
-rz(0.15689007245246428) q[20];
-cx q[15],q[20];
-cx q[15],q[21];
-rz(0.15689007245246428) q[21];
-cx q[15],q[21];
-cx q[15],q[36];
-cx q[21],q[26];
-rz(0.15689007245246428) q[26];
-cx q[21],q[26];
-cx q[26],q[31];
-rz(0.15689007245246428) q[31];
-cx q[26],q[31];
-rx(8.388145208913759) q[26];
-rx(8.388145208913759) q[31];
-rz(0.15689007245246428) q[32];
-cx q[0],q[32];
-cx q[0],q[42];
-cx q[21],q[32];
-rz(0.15689007245246428) q[32];
-cx q[21],q[32];
-cx q[21],q[38];
-cx q[32],q[35];
-rz(0.15689007245246428) q[35];
-cx q[32],q[35];
-rx(8.388145208913759) q[32];
-rx(8.388145208913759) q[35];
-rz(0.15689007245246428) q[36];
-cx q[15],q[36];
-rx(8.388145208913759) q[15];
-cx q[20],q[36];
-rz(0.15689007245246428) q[36];
-cx q[20],q[36];
-rx(8.388145208913759) q[36];
-rz(0.15689007245246428) q[38];
-cx q[21],q[38];
-rx(8.388145208913759) q[21];
-rx(8.388145208913759) q[38];
-rz(0.15689007245246428) q[42];
-cx q[0],q[42];
-rx(8.388145208913759) q[0];
-cx q[3],q[42];
-rz(0.15689007245246428) q[42];
-cx q[3],q[42];
-rx(8.388145208913759) q[42];
-rx(3.6919870318391905) q[43];
-cx q[3],q[43];
-rz(0.15689007245246428) q[43];
-cx q[3],q[43];
-rx(8.388145208913759) q[3];
-cx q[20],q[43];
-rz(0.15689007245246428) q[43];
-cx q[20],q[43];
-rx(8.388145208913759) q[20];
-rx(8.388145208913759) q[43];
\ No newline at end of file
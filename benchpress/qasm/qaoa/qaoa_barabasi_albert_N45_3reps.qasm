@@ -1,1002 +0,0 @@
-OPENQASM 2.0;
-include "qelib1.inc";
-qreg q[45];
-ry(pi/2) q[0];
-rx(pi) q[0];
-ry(pi/2) q[1];
-rx(pi) q[1];
-cx q[0],q[1];
-rz(5.676671686845332) q[1];
-cx q[0],q[1];
-ry(pi/2) q[2];
-rx(pi) q[2];
-cx q[0],q[2];
-rz(5.676671686845332) q[2];
-cx q[0],q[2];
-rx(11.503713795950812) q[2];
-ry(pi/2) q[3];
-rx(pi) q[3];
-cx q[0],q[3];
-rz(5.676671686845332) q[3];
-cx q[0],q[3];
-cx q[1],q[3];
-rz(5.676671686845332) q[3];
-cx q[1],q[3];
-ry(pi/2) q[4];
-rx(pi) q[4];
-cx q[1],q[4];
-rz(5.676671686845332) q[4];
-cx q[1],q[4];
-cx q[3],q[4];
-rz(5.676671686845332) q[4];
-cx q[3],q[4];
-ry(pi/2) q[5];
-rx(pi) q[5];
-cx q[1],q[5];
-rz(5.676671686845332) q[5];
-cx q[1],q[5];
-cx q[3],q[5];
-rz(5.676671686845332) q[5];
-cx q[3],q[5];
-ry(pi/2) q[6];
-rx(pi) q[6];
-cx q[4],q[6];
-rz(5.676671686845332) q[6];
-cx q[4],q[6];
-cx q[5],q[6];
-rz(5.676671686845332) q[6];
-cx q[5],q[6];
-ry(pi/2) q[7];
-rx(pi) q[7];
-cx q[3],q[7];
-rz(5.676671686845332) q[7];
-cx q[3],q[7];
-cx q[4],q[7];
-rz(5.676671686845332) q[7];
-cx q[4],q[7];
-ry(pi/2) q[8];
-rx(pi) q[8];
-cx q[3],q[8];
-rz(5.676671686845332) q[8];
-cx q[3],q[8];
-cx q[5],q[8];
-rz(5.676671686845332) q[8];
-cx q[5],q[8];
-rx(11.503713795950812) q[8];
-ry(pi/2) q[9];
-rx(pi) q[9];
-cx q[1],q[9];
-rz(5.676671686845332) q[9];
-cx q[1],q[9];
-cx q[3],q[9];
-rz(5.676671686845332) q[9];
-cx q[3],q[9];
-ry(pi/2) q[10];
-rx(pi) q[10];
-cx q[4],q[10];
-rz(5.676671686845332) q[10];
-cx q[4],q[10];
-cx q[6],q[10];
-rz(5.676671686845332) q[10];
-cx q[6],q[10];
-ry(pi/2) q[11];
-rx(pi) q[11];
-cx q[5],q[11];
-rz(5.676671686845332) q[11];
-cx q[5],q[11];
-cx q[6],q[11];
-rz(5.676671686845332) q[11];
-cx q[6],q[11];
-rx(11.503713795950812) q[11];
-ry(pi/2) q[12];
-rx(pi) q[12];
-cx q[3],q[12];
-rz(5.676671686845332) q[12];
-cx q[3],q[12];
-cx q[5],q[12];
-rz(5.676671686845332) q[12];
-cx q[5],q[12];
-ry(pi/2) q[13];
-rx(pi) q[13];
-cx q[4],q[13];
-rz(5.676671686845332) q[13];
-cx q[4],q[13];
-cx q[5],q[13];
-rz(5.676671686845332) q[13];
-cx q[5],q[13];
-ry(pi/2) q[14];
-rx(pi) q[14];
-cx q[3],q[14];
-rz(5.676671686845332) q[14];
-cx q[3],q[14];
-cx q[4],q[14];
-rz(5.676671686845332) q[14];
-cx q[4],q[14];
-rx(11.503713795950812) q[14];
-ry(pi/2) q[15];
-rx(pi) q[15];
-cx q[0],q[15];
-rz(5.676671686845332) q[15];
-cx q[0],q[15];
-cx q[3],q[15];
-rz(5.676671686845332) q[15];
-cx q[3],q[15];
-ry(pi/2) q[16];
-rx(pi) q[16];
-cx q[0],q[16];
-rz(5.676671686845332) q[16];
-cx q[0],q[16];
-cx q[3],q[16];
-rz(5.676671686845332) q[16];
-cx q[3],q[16];
-rx(11.503713795950812) q[16];
-ry(pi/2) q[17];
-rx(pi) q[17];
-cx q[1],q[17];
-rz(5.676671686845332) q[17];
-cx q[1],q[17];
-cx q[3],q[17];
-rz(5.676671686845332) q[17];
-cx q[3],q[17];
-ry(pi/2) q[18];
-rx(pi) q[18];
-cx q[3],q[18];
-rz(5.676671686845332) q[18];
-cx q[3],q[18];
-cx q[4],q[18];
-rz(5.676671686845332) q[18];
-cx q[4],q[18];
-ry(pi/2) q[19];
-rx(pi) q[19];
-cx q[3],q[19];
-rz(5.676671686845332) q[19];
-cx q[3],q[19];
-cx q[7],q[19];
-rz(5.676671686845332) q[19];
-cx q[7],q[19];
-rx(11.503713795950812) q[7];
-ry(pi/2) q[20];
-rx(pi) q[20];
-cx q[0],q[20];
-rz(5.676671686845332) q[20];
-cx q[0],q[20];
-cx q[15],q[20];
-rz(5.676671686845332) q[20];
-cx q[15],q[20];
-ry(pi/2) q[21];
-rx(pi) q[21];
-cx q[4],q[21];
-rz(5.676671686845332) q[21];
-cx q[4],q[21];
-cx q[15],q[21];
-rz(5.676671686845332) q[21];
-cx q[15],q[21];
-ry(pi/2) q[22];
-rx(pi) q[22];
-cx q[3],q[22];
-rz(5.676671686845332) q[22];
-cx q[3],q[22];
-cx q[9],q[22];
-rz(5.676671686845332) q[22];
-cx q[9],q[22];
-rx(11.503713795950812) q[9];
-rx(11.503713795950812) q[22];
-ry(pi/2) q[23];
-rx(pi) q[23];
-cx q[3],q[23];
-rz(5.676671686845332) q[23];
-cx q[3],q[23];
-cx q[17],q[23];
-rz(5.676671686845332) q[23];
-cx q[17],q[23];
-rx(11.503713795950812) q[17];
-ry(pi/2) q[24];
-rx(pi) q[24];
-cx q[3],q[24];
-rz(5.676671686845332) q[24];
-cx q[3],q[24];
-cx q[5],q[24];
-rz(5.676671686845332) q[24];
-cx q[5],q[24];
-rx(11.503713795950812) q[24];
-ry(pi/2) q[25];
-rx(pi) q[25];
-cx q[3],q[25];
-rz(5.676671686845332) q[25];
-cx q[3],q[25];
-cx q[12],q[25];
-rz(5.676671686845332) q[25];
-cx q[12],q[25];
-rx(11.503713795950812) q[25];
-ry(pi/2) q[26];
-rx(pi) q[26];
-cx q[3],q[26];
-rz(5.676671686845332) q[26];
-cx q[3],q[26];
-cx q[21],q[26];
-rz(5.676671686845332) q[26];
-cx q[21],q[26];
-ry(pi/2) q[27];
-rx(pi) q[27];
-cx q[4],q[27];
-rz(5.676671686845332) q[27];
-cx q[4],q[27];
-rx(11.503713795950812) q[4];
-cx q[6],q[27];
-rz(5.676671686845332) q[27];
-cx q[6],q[27];
-rx(11.503713795950812) q[6];
-ry(pi/2) q[28];
-rx(pi) q[28];
-cx q[1],q[28];
-rz(5.676671686845332) q[28];
-cx q[1],q[28];
-cx q[3],q[28];
-rz(5.676671686845332) q[28];
-cx q[3],q[28];
-rx(11.503713795950812) q[28];
-ry(pi/2) q[29];
-rx(pi) q[29];
-cx q[1],q[29];
-rz(5.676671686845332) q[29];
-cx q[1],q[29];
-rx(11.503713795950812) q[1];
-cx q[3],q[29];
-rz(5.676671686845332) q[29];
-cx q[3],q[29];
-rx(11.503713795950812) q[29];
-ry(pi/2) q[30];
-rx(pi) q[30];
-cx q[3],q[30];
-rz(5.676671686845332) q[30];
-cx q[3],q[30];
-cx q[18],q[30];
-rz(5.676671686845332) q[30];
-cx q[18],q[30];
-rx(11.503713795950812) q[18];
-ry(pi/2) q[31];
-rx(pi) q[31];
-cx q[12],q[31];
-rz(5.676671686845332) q[31];
-cx q[12],q[31];
-cx q[26],q[31];
-rz(5.676671686845332) q[31];
-cx q[26],q[31];
-rx(11.503713795950812) q[26];
-rx(11.503713795950812) q[31];
-ry(pi/2) q[32];
-rx(pi) q[32];
-cx q[0],q[32];
-rz(5.676671686845332) q[32];
-cx q[0],q[32];
-cx q[21],q[32];
-rz(5.676671686845332) q[32];
-cx q[21],q[32];
-ry(pi/2) q[33];
-rx(pi) q[33];
-cx q[5],q[33];
-rz(5.676671686845332) q[33];
-cx q[5],q[33];
-rx(11.503713795950812) q[5];
-cx q[30],q[33];
-rz(5.676671686845332) q[33];
-cx q[30],q[33];
-rx(11.503713795950812) q[30];
-rx(11.503713795950812) q[33];
-ry(pi/2) q[34];
-rx(pi) q[34];
-cx q[3],q[34];
-rz(5.676671686845332) q[34];
-cx q[3],q[34];
-cx q[12],q[34];
-rz(5.676671686845332) q[34];
-cx q[12],q[34];
-ry(pi/2) q[35];
-rx(pi) q[35];
-cx q[3],q[35];
-rz(5.676671686845332) q[35];
-cx q[3],q[35];
-cx q[32],q[35];
-rz(5.676671686845332) q[35];
-cx q[32],q[35];
-rx(11.503713795950812) q[32];
-rx(11.503713795950812) q[35];
-ry(pi/2) q[36];
-rx(pi) q[36];
-cx q[15],q[36];
-rz(5.676671686845332) q[36];
-cx q[15],q[36];
-rx(11.503713795950812) q[15];
-cx q[20],q[36];
-rz(5.676671686845332) q[36];
-cx q[20],q[36];
-rx(11.503713795950812) q[36];
-ry(pi/2) q[37];
-rx(pi) q[37];
-cx q[10],q[37];
-rz(5.676671686845332) q[37];
-cx q[10],q[37];
-cx q[34],q[37];
-rz(5.676671686845332) q[37];
-cx q[34],q[37];
-rx(11.503713795950812) q[34];
-rx(11.503713795950812) q[37];
-ry(pi/2) q[38];
-rx(pi) q[38];
-cx q[19],q[38];
-rz(5.676671686845332) q[38];
-cx q[19],q[38];
-rx(11.503713795950812) q[19];
-cx q[21],q[38];
-rz(5.676671686845332) q[38];
-cx q[21],q[38];
-rx(11.503713795950812) q[21];
-rx(11.503713795950812) q[38];
-ry(pi/2) q[39];
-rx(pi) q[39];
-cx q[3],q[39];
-rz(5.676671686845332) q[39];
-cx q[3],q[39];
-cx q[13],q[39];
-rz(5.676671686845332) q[39];
-cx q[13],q[39];
-rx(11.503713795950812) q[13];
-rx(11.503713795950812) q[39];
-ry(pi/2) q[40];
-rx(pi) q[40];
-cx q[3],q[40];
-rz(5.676671686845332) q[40];
-cx q[3],q[40];
-cx q[23],q[40];
-rz(5.676671686845332) q[40];
-cx q[23],q[40];
-rx(11.503713795950812) q[23];
-rx(11.503713795950812) q[40];
-ry(pi/2) q[41];
-rx(pi) q[41];
-cx q[10],q[41];
-rz(5.676671686845332) q[41];
-cx q[10],q[41];
-rx(11.503713795950812) q[10];
-cx q[27],q[41];
-rz(5.676671686845332) q[41];
-cx q[27],q[41];
-rx(11.503713795950812) q[27];
-rx(11.503713795950812) q[41];
-ry(pi/2) q[42];
-rx(pi) q[42];
-cx q[0],q[42];
-rz(5.676671686845332) q[42];
-cx q[0],q[42];
-rx(11.503713795950812) q[0];
-cx q[0],q[1];
-rz(4.515420008305071) q[1];
-cx q[0],q[1];
-cx q[0],q[2];
-rz(4.515420008305071) q[2];
-cx q[0],q[2];
-rx(0.4630241403577339) q[2];
-cx q[3],q[42];
-rz(5.676671686845332) q[42];
-cx q[3],q[42];
-rx(11.503713795950812) q[42];
-ry(pi/2) q[43];
-rx(pi) q[43];
-cx q[3],q[43];
-rz(5.676671686845332) q[43];
-cx q[3],q[43];
-cx q[20],q[43];
-rz(5.676671686845332) q[43];
-cx q[20],q[43];
-rx(11.503713795950812) q[20];
-rx(11.503713795950812) q[43];
-ry(pi/2) q[44];
-rx(pi) q[44];
-cx q[3],q[44];
-rz(5.676671686845332) q[44];
-cx q[3],q[44];
-rx(11.503713795950812) q[3];
-cx q[0],q[3];
-rz(4.515420008305071) q[3];
-cx q[0],q[3];
-cx q[0],q[15];
-cx q[1],q[3];
-rz(4.515420008305071) q[3];
-cx q[1],q[3];
-cx q[1],q[4];
-rz(4.515420008305071) q[4];
-cx q[1],q[4];
-cx q[1],q[5];
-cx q[3],q[4];
-rz(4.515420008305071) q[4];
-cx q[3],q[4];
-cx q[4],q[6];
-rz(4.515420008305071) q[5];
-cx q[1],q[5];
-cx q[1],q[9];
-cx q[3],q[5];
-rz(4.515420008305071) q[5];
-cx q[3],q[5];
-cx q[3],q[7];
-rz(4.515420008305071) q[6];
-cx q[4],q[6];
-cx q[5],q[6];
-rz(4.515420008305071) q[6];
-cx q[5],q[6];
-rz(4.515420008305071) q[7];
-cx q[3],q[7];
-cx q[3],q[8];
-cx q[4],q[7];
-rz(4.515420008305071) q[7];
-cx q[4],q[7];
-cx q[4],q[10];
-rz(4.515420008305071) q[8];
-cx q[3],q[8];
-cx q[5],q[8];
-rz(4.515420008305071) q[8];
-cx q[5],q[8];
-cx q[5],q[11];
-rx(0.4630241403577339) q[8];
-rz(4.515420008305071) q[9];
-cx q[1],q[9];
-cx q[1],q[17];
-cx q[3],q[9];
-rz(4.515420008305071) q[9];
-cx q[3],q[9];
-rz(4.515420008305071) q[10];
-cx q[4],q[10];
-cx q[4],q[13];
-cx q[6],q[10];
-rz(4.515420008305071) q[10];
-cx q[6],q[10];
-cx q[10],q[37];
-rz(4.515420008305071) q[11];
-cx q[5],q[11];
-cx q[6],q[11];
-rz(4.515420008305071) q[11];
-cx q[6],q[11];
-rx(0.4630241403577339) q[11];
-cx q[12],q[44];
-rz(4.515420008305071) q[13];
-cx q[4],q[13];
-rz(4.515420008305071) q[15];
-cx q[0],q[15];
-cx q[0],q[16];
-rz(4.515420008305071) q[16];
-cx q[0],q[16];
-cx q[0],q[20];
-rz(4.515420008305071) q[17];
-cx q[1],q[17];
-cx q[1],q[28];
-rz(4.515420008305071) q[20];
-cx q[0],q[20];
-cx q[0],q[32];
-rz(4.515420008305071) q[28];
-cx q[1],q[28];
-cx q[1],q[29];
-rz(4.515420008305071) q[29];
-cx q[1],q[29];
-rx(0.4630241403577339) q[1];
-rz(4.515420008305071) q[32];
-cx q[0],q[32];
-cx q[0],q[42];
-rz(4.515420008305071) q[37];
-cx q[10],q[37];
-cx q[10],q[41];
-rz(4.515420008305071) q[41];
-cx q[10],q[41];
-rx(0.4630241403577339) q[10];
-rz(4.515420008305071) q[42];
-cx q[0],q[42];
-rx(0.4630241403577339) q[0];
-cx q[0],q[1];
-rz(2.0731521878061483) q[1];
-cx q[0],q[1];
-cx q[0],q[2];
-rz(2.0731521878061483) q[2];
-cx q[0],q[2];
-rx(6.5969896083538435) q[2];
-rz(5.676671686845332) q[44];
-cx q[12],q[44];
-rx(11.503713795950812) q[12];
-cx q[3],q[12];
-rz(4.515420008305071) q[12];
-cx q[3],q[12];
-cx q[3],q[14];
-cx q[5],q[12];
-rz(4.515420008305071) q[12];
-cx q[5],q[12];
-cx q[5],q[13];
-rz(4.515420008305071) q[13];
-cx q[5],q[13];
-rz(4.515420008305071) q[14];
-cx q[3],q[14];
-cx q[3],q[15];
-cx q[4],q[14];
-rz(4.515420008305071) q[14];
-cx q[4],q[14];
-rx(0.4630241403577339) q[14];
-rz(4.515420008305071) q[15];
-cx q[3],q[15];
-cx q[3],q[16];
-cx q[15],q[20];
-rz(4.515420008305071) q[16];
-cx q[3],q[16];
-cx q[3],q[17];
-rx(0.4630241403577339) q[16];
-rz(4.515420008305071) q[17];
-cx q[3],q[17];
-cx q[3],q[18];
-rz(4.515420008305071) q[18];
-cx q[3],q[18];
-cx q[3],q[19];
-cx q[4],q[18];
-rz(4.515420008305071) q[18];
-cx q[4],q[18];
-cx q[4],q[21];
-rz(4.515420008305071) q[19];
-cx q[3],q[19];
-cx q[3],q[22];
-cx q[7],q[19];
-rz(4.515420008305071) q[19];
-cx q[7],q[19];
-rx(0.4630241403577339) q[7];
-cx q[19],q[38];
-rz(4.515420008305071) q[20];
-cx q[15],q[20];
-rz(4.515420008305071) q[21];
-cx q[4],q[21];
-cx q[4],q[27];
-cx q[15],q[21];
-rz(4.515420008305071) q[21];
-cx q[15],q[21];
-cx q[15],q[36];
-rz(4.515420008305071) q[22];
-cx q[3],q[22];
-cx q[3],q[23];
-cx q[9],q[22];
-rz(4.515420008305071) q[22];
-cx q[9],q[22];
-rx(0.4630241403577339) q[9];
-rx(0.4630241403577339) q[22];
-rz(4.515420008305071) q[23];
-cx q[3],q[23];
-cx q[3],q[24];
-cx q[17],q[23];
-rz(4.515420008305071) q[23];
-cx q[17],q[23];
-rx(0.4630241403577339) q[17];
-rz(4.515420008305071) q[24];
-cx q[3],q[24];
-cx q[3],q[25];
-cx q[5],q[24];
-rz(4.515420008305071) q[24];
-cx q[5],q[24];
-cx q[5],q[33];
-rx(0.4630241403577339) q[24];
-rz(4.515420008305071) q[25];
-cx q[3],q[25];
-cx q[3],q[26];
-cx q[12],q[25];
-rz(4.515420008305071) q[25];
-cx q[12],q[25];
-cx q[12],q[31];
-rx(0.4630241403577339) q[25];
-rz(4.515420008305071) q[26];
-cx q[3],q[26];
-cx q[3],q[28];
-cx q[21],q[26];
-rz(4.515420008305071) q[26];
-cx q[21],q[26];
-cx q[21],q[32];
-rz(4.515420008305071) q[27];
-cx q[4],q[27];
-rx(0.4630241403577339) q[4];
-cx q[6],q[27];
-rz(4.515420008305071) q[27];
-cx q[6],q[27];
-rx(0.4630241403577339) q[6];
-cx q[27],q[41];
-rz(4.515420008305071) q[28];
-cx q[3],q[28];
-cx q[3],q[29];
-rx(0.4630241403577339) q[28];
-rz(4.515420008305071) q[29];
-cx q[3],q[29];
-cx q[3],q[30];
-rx(0.4630241403577339) q[29];
-rz(4.515420008305071) q[30];
-cx q[3],q[30];
-cx q[3],q[34];
-cx q[18],q[30];
-rz(4.515420008305071) q[30];
-cx q[18],q[30];
-rx(0.4630241403577339) q[18];
-rz(4.515420008305071) q[31];
-cx q[12],q[31];
-cx q[26],q[31];
-rz(4.515420008305071) q[31];
-cx q[26],q[31];
-rx(0.4630241403577339) q[26];
-rx(0.4630241403577339) q[31];
-rz(4.515420008305071) q[32];
-cx q[21],q[32];
-rz(4.515420008305071) q[33];
-cx q[5],q[33];
-rx(0.4630241403577339) q[5];
-cx q[30],q[33];
-rz(4.515420008305071) q[33];
-cx q[30],q[33];
-rx(0.4630241403577339) q[30];
-rx(0.4630241403577339) q[33];
-rz(4.515420008305071) q[34];
-cx q[3],q[34];
-cx q[3],q[35];
-cx q[12],q[34];
-rz(4.515420008305071) q[34];
-cx q[12],q[34];
-cx q[34],q[37];
-rz(4.515420008305071) q[35];
-cx q[3],q[35];
-cx q[3],q[39];
-cx q[32],q[35];
-rz(4.515420008305071) q[35];
-cx q[32],q[35];
-rx(0.4630241403577339) q[32];
-rx(0.4630241403577339) q[35];
-rz(4.515420008305071) q[36];
-cx q[15],q[36];
-rx(0.4630241403577339) q[15];
-cx q[20],q[36];
-rz(4.515420008305071) q[36];
-cx q[20],q[36];
-rx(0.4630241403577339) q[36];
-rz(4.515420008305071) q[37];
-cx q[34],q[37];
-rx(0.4630241403577339) q[34];
-rx(0.4630241403577339) q[37];
-rz(4.515420008305071) q[38];
-cx q[19],q[38];
-rx(0.4630241403577339) q[19];
-cx q[21],q[38];
-rz(4.515420008305071) q[38];
-cx q[21],q[38];
-rx(0.4630241403577339) q[21];
-rx(0.4630241403577339) q[38];
-rz(4.515420008305071) q[39];
-cx q[3],q[39];
-cx q[3],q[40];
-cx q[13],q[39];
-rz(4.515420008305071) q[39];
-cx q[13],q[39];
-rx(0.4630241403577339) q[13];
-rx(0.4630241403577339) q[39];
-rz(4.515420008305071) q[40];
-cx q[3],q[40];
-cx q[3],q[42];
-cx q[23],q[40];
-rz(4.515420008305071) q[40];
-cx q[23],q[40];
-rx(0.4630241403577339) q[23];
-rx(0.4630241403577339) q[40];
-rz(4.515420008305071) q[41];
-cx q[27],q[41];
-rx(0.4630241403577339) q[27];
-rx(0.4630241403577339) q[41];
-rz(4.515420008305071) q[42];
-cx q[3],q[42];
-cx q[3],q[43];
-rx(0.4630241403577339) q[42];
-rz(4.515420008305071) q[43];
-cx q[3],q[43];
-cx q[20],q[43];
-rz(4.515420008305071) q[43];
-cx q[20],q[43];
-rx(0.4630241403577339) q[20];
-rx(0.4630241403577339) q[43];
-rx(11.503713795950812) q[44];
-cx q[3],q[44];
-rz(4.515420008305071) q[44];
-cx q[3],q[44];
-rx(0.4630241403577339) q[3];
-cx q[0],q[3];
-rz(2.0731521878061483) q[3];
-cx q[0],q[3];
-cx q[0],q[15];
-cx q[1],q[3];
-rz(2.0731521878061483) q[3];
-cx q[1],q[3];
-cx q[1],q[4];
-rz(2.0731521878061483) q[4];
-cx q[1],q[4];
-cx q[1],q[5];
-cx q[3],q[4];
-rz(2.0731521878061483) q[4];
-cx q[3],q[4];
-cx q[4],q[6];
-rz(2.0731521878061483) q[5];
-cx q[1],q[5];
-cx q[1],q[9];
-cx q[3],q[5];
-rz(2.0731521878061483) q[5];
-cx q[3],q[5];
-cx q[3],q[7];
-rz(2.0731521878061483) q[6];
-cx q[4],q[6];
-cx q[5],q[6];
-rz(2.0731521878061483) q[6];
-cx q[5],q[6];
-rz(2.0731521878061483) q[7];
-cx q[3],q[7];
-cx q[3],q[8];
-cx q[4],q[7];
-rz(2.0731521878061483) q[7];
-cx q[4],q[7];
-cx q[4],q[10];
-rz(2.0731521878061483) q[8];
-cx q[3],q[8];
-cx q[5],q[8];
-rz(2.0731521878061483) q[8];
-cx q[5],q[8];
-cx q[5],q[11];
-rx(6.5969896083538435) q[8];
-rz(2.0731521878061483) q[9];
-cx q[1],q[9];
-cx q[1],q[17];
-cx q[3],q[9];
-rz(2.0731521878061483) q[9];
-cx q[3],q[9];
-rz(2.0731521878061483) q[10];
-cx q[4],q[10];
-cx q[4],q[13];
-cx q[6],q[10];
-rz(2.0731521878061483) q[10];
-cx q[6],q[10];
-cx q[10],q[37];
-rz(2.0731521878061483) q[11];
-cx q[5],q[11];
-cx q[6],q[11];
-rz(2.0731521878061483) q[11];
-cx q[6],q[11];
-rx(6.5969896083538435) q[11];
-cx q[12],q[44];
-rz(2.0731521878061483) q[13];
-cx q[4],q[13];
-rz(2.0731521878061483) q[15];
-cx q[0],q[15];
-cx q[0],q[16];
-rz(2.0731521878061483) q[16];
-cx q[0],q[16];
-cx q[0],q[20];
-rz(2.0731521878061483) q[17];
-cx q[1],q[17];
-cx q[1],q[28];
-rz(2.0731521878061483) q[20];
-cx q[0],q[20];
-cx q[0],q[32];
-rz(2.0731521878061483) q[28];
-cx q[1],q[28];
-cx q[1],q[29];
-rz(2.0731521878061483) q[29];
-cx q[1],q[29];
-rx(6.5969896083538435) q[1];
-rz(2.0731521878061483) q[32];
-cx q[0],q[32];
-cx q[0],q[42];
-rz(2.0731521878061483) q[37];
-cx q[10],q[37];
-cx q[10],q[41];
-rz(2.0731521878061483) q[41];
-cx q[10],q[41];
-rx(6.5969896083538435) q[10];
-rz(2.0731521878061483) q[42];
-cx q[0],q[42];
-rx(6.5969896083538435) q[0];
-rz(4.515420008305071) q[44];
-cx q[12],q[44];
-rx(0.4630241403577339) q[12];
-cx q[3],q[12];
-rz(2.0731521878061483) q[12];
-cx q[3],q[12];
-cx q[3],q[14];
-cx q[5],q[12];
-rz(2.0731521878061483) q[12];
-cx q[5],q[12];
-cx q[5],q[13];
-rz(2.0731521878061483) q[13];
-cx q[5],q[13];
-rz(2.0731521878061483) q[14];
-cx q[3],q[14];
-cx q[3],q[15];
-cx q[4],q[14];
-rz(2.0731521878061483) q[14];
-cx q[4],q[14];
-rx(6.5969896083538435) q[14];
-rz(2.0731521878061483) q[15];
-cx q[3],q[15];
-cx q[3],q[16];
-cx q[15],q[20];
-rz(2.0731521878061483) q[16];
-cx q[3],q[16];
-cx q[3],q[17];
-rx(6.5969896083538435) q[16];
-rz(2.0731521878061483) q[17];
-cx q[3],q[17];
-cx q[3],q[18];
-rz(2.0731521878061483) q[18];
-cx q[3],q[18];
-cx q[3],q[19];
-cx q[4],q[18];
-rz(2.0731521878061483) q[18];
-cx q[4],q[18];
-cx q[4],q[21];
-rz(2.0731521878061483) q[19];
-cx q[3],q[19];
-cx q[3],q[22];
-cx q[7],q[19];
-rz(2.0731521878061483) q[19];
-cx q[7],q[19];
-rx(6.5969896083538435) q[7];
-cx q[19],q[38];
-rz(2.0731521878061483) q[20];
-cx q[15],q[20];
-rz(2.0731521878061483) q[21];
-cx q[4],q[21];
-cx q[4],q[27];
-cx q[15],q[21];
-rz(2.0731521878061483) q[21];
-cx q[15],q[21];
-cx q[15],q[36];
-rz(2.0731521878061483) q[22];
-cx q[3],q[22];
-cx q[3],q[23];
-cx q[9],q[22];
-rz(2.0731521878061483) q[22];
-cx q[9],q[22];
-rx(6.5969896083538435) q[9];
-rx(6.5969896083538435) q[22];
-rz(2.0731521878061483) q[23];
-cx q[3],q[23];
-cx q[3],q[24];
-cx q[17],q[23];
-rz(2.0731521878061483) q[23];
-cx q[17],q[23];
-rx(6.5969896083538435) q[17];
-rz(2.0731521878061483) q[24];
-cx q[3],q[24];
-cx q[3],q[25];
-cx q[5],q[24];
-rz(2.0731521878061483) q[24];
-cx q[5],q[24];
-cx q[5],q[33];
-rx(6.5969896083538435) q[24];
-rz(2.0731521878061483) q[25];
-cx q[3],q[25];
-cx q[3],q[26];
-cx q[12],q[25];
-rz(2.0731521878061483) q[25];
-cx q[12],q[25];
-cx q[12],q[31];
-rx(6.5969896083538435) q[25];
-rz(2.0731521878061483) q[26];
-cx q[3],q[26];
-cx q[3],q[28];
-cx q[21],q[26];
-rz(2.0731521878061483) q[26];
-cx q[21],q[26];
-cx q[21],q[32];
-rz(2.0731521878061483) q[27];
-cx q[4],q[27];
-rx(6.5969896083538435) q[4];
-cx q[6],q[27];
-rz(2.0731521878061483) q[27];
-cx q[6],q[27];
-rx(6.5969896083538435) q[6];
-cx q[27],q[41];
-rz(2.0731521878061483) q[28];
-cx q[3],q[28];
-cx q[3],q[29];
-rx(6.5969896083538435) q[28];
-rz(2.0731521878061483) q[29];
-cx q[3],q[29];
-cx q[3],q[30];
-rx(6.5969896083538435) q[29];
-rz(2.0731521878061483) q[30];
-cx q[3],q[30];
-cx q[3],q[34];
-cx q[18],q[30];
-rz(2.0731521878061483) q[30];
-cx q[18],q[30];
-rx(6.5969896083538435) q[18];
-rz(2.0731521878061483) q[31];
-cx q[12],q[31];
-cx q[26],q[31];
-rz(2.0731521878061483) q[31];
-cx q[26],q[31];
-rx(6.5969896083538435) q[26];
-rx(6.5969896083538435) q[31];
-rz(2.0731521878061483) q[32];
-cx q[21],q[32];
-rz(2.0731521878061483) q[33];
-cx q[5],q[33];
-rx(6.5969896083538435) q[5];
-cx q[30],q[33];
-rz(2.0731521878061483) q[33];
-cx q[30],q[33];
-rx(6.5969896083538435) q[30];
-rx(6.5969896083538435) q[33];
-rz(2.0731521878061483) q[34];
-cx q[3],q[34];
-cx q[3],q[35];
-cx q[12],q[34];
-rz(2.0731521878061483) q[34];
-cx q[12],q[34];
-cx q[34],q[37];
-rz(2.0731521878061483) q[35];
-cx q[3],q[35];
-cx q[3],q[39];
-cx q[32],q[35];
-rz(2.0731521878061483) q[35];
-cx q[32],q[35];
-rx(6.5969896083538435) q[32];
-rx(6.5969896083538435) q[35];
-rz(2.0731521878061483) q[36];
-cx q[15],q[36];
-rx(6.5969896083538435) q[15];
-cx q[20],q[36];
-rz(2.0731521878061483) q[36];
-cx q[20],q[36];
-rx(6.5969896083538435) q[36];
-rz(2.0731521878061483) q[37];
-cx q[34],q[37];
-rx(6.5969896083538435) q[34];
-rx(6.5969896083538435) q[37];
-rz(2.0731521878061483) q[38];
-cx q[19],q[38];
-rx(6.5969896083538435) q[19];
-cx q[21],q[38];
-rz(2.0731521878061483) q[38];
-cx q[21],q[38];
-rx(6.5969896083538435) q[21];
-rx(6.5969896083538435) q[38];
-rz(2.0731521878061483) q[39];
-cx q[3],q[39];
-cx q[3],q[40];
-cx q[13],q[39];
-rz(2.0731521878061483) q[39];
-cx q[13],q[39];
-rx(6.5969896083538435) q[13];
-rx(6.5969896083538435) q[39];
-rz(2.0731521878061483) q[40];
-cx q[3],q[40];
-cx q[3],q[42];
-cx q[23],q[40];
-rz(2.0731521878061483) q[40];
-cx q[23],q[40];
-rx(6.5969896083538435) q[23];
-rx(6.5969896083538435) q[40];
-rz(2.0731521878061483) q[41];
-cx q[27],q[41];
-rx(6.5969896083538435) q[27];
-rx(6.5969896083538435) q[41];
-rz(2.0731521878061483) q[42];
-cx q[3],q[42];
-cx q[3],q[43];
-rx(6.5969896083538435) q[42];
-rz(2.0731521878061483) q[43];
-cx q[3],q[43];
-cx q[20],q[43];
-rz(2.0731521878061483) q[43];
-cx q[20],q[43];
-rx(6.5969896083538435) q[20];
-rx(6.5969896083538435) q[43];
-rx(0.4630241403577339) q[44];
-cx q[3],q[44];
-rz(2.0731521878061483) q[44];
-cx q[3],q[44];
-rx(6.5969896083538435) q[3];
-cx q[12],q[44];
-rz(2.0731521878061483) q[44];
-cx q[12],q[44];
-rx(6.5969896083538435) q[12];
-rx(6.5969896083538435) q[44];
\ No newline at end of file
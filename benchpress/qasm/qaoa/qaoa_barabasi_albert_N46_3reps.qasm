@@ -1,1025 +0,0 @@
-OPENQASM 2.0;
-include "qelib1.inc";
-qreg q[46];
-ry(pi/2) q[0];
-rx(pi) q[0];
-ry(pi/2) q[1];
-rx(pi) q[1];
-cx q[0],q[1];
-rz(0.6337745411793452) q[1];
-cx q[0],q[1];
-ry(pi/2) q[2];
-rx(pi) q[2];
-cx q[0],q[2];
-rz(0.6337745411793452) q[2];
-cx q[0],q[2];
-rx(7.047099392320972) q[2];
-ry(pi/2) q[3];
-rx(pi) q[3];
-cx q[0],q[3];
-rz(0.6337745411793452) q[3];
-cx q[0],q[3];
-cx q[1],q[3];
-rz(0.6337745411793452) q[3];
-cx q[1],q[3];
-ry(pi/2) q[4];
-rx(pi) q[4];
-cx q[1],q[4];
-rz(0.6337745411793452) q[4];
-cx q[1],q[4];
-cx q[3],q[4];
-rz(0.6337745411793452) q[4];
-cx q[3],q[4];
-ry(pi/2) q[5];
-rx(pi) q[5];
-cx q[1],q[5];
-rz(0.6337745411793452) q[5];
-cx q[1],q[5];
-cx q[3],q[5];
-rz(0.6337745411793452) q[5];
-cx q[3],q[5];
-ry(pi/2) q[6];
-rx(pi) q[6];
-cx q[4],q[6];
-rz(0.6337745411793452) q[6];
-cx q[4],q[6];
-cx q[5],q[6];
-rz(0.6337745411793452) q[6];
-cx q[5],q[6];
-ry(pi/2) q[7];
-rx(pi) q[7];
-cx q[3],q[7];
-rz(0.6337745411793452) q[7];
-cx q[3],q[7];
-cx q[4],q[7];
-rz(0.6337745411793452) q[7];
-cx q[4],q[7];
-ry(pi/2) q[8];
-rx(pi) q[8];
-cx q[3],q[8];
-rz(0.6337745411793452) q[8];
-cx q[3],q[8];
-cx q[5],q[8];
-rz(0.6337745411793452) q[8];
-cx q[5],q[8];
-rx(7.047099392320972) q[8];
-ry(pi/2) q[9];
-rx(pi) q[9];
-cx q[1],q[9];
-rz(0.6337745411793452) q[9];
-cx q[1],q[9];
-cx q[3],q[9];
-rz(0.6337745411793452) q[9];
-cx q[3],q[9];
-ry(pi/2) q[10];
-rx(pi) q[10];
-cx q[4],q[10];
-rz(0.6337745411793452) q[10];
-cx q[4],q[10];
-cx q[6],q[10];
-rz(0.6337745411793452) q[10];
-cx q[6],q[10];
-ry(pi/2) q[11];
-rx(pi) q[11];
-cx q[5],q[11];
-rz(0.6337745411793452) q[11];
-cx q[5],q[11];
-cx q[6],q[11];
-rz(0.6337745411793452) q[11];
-cx q[6],q[11];
-rx(7.047099392320972) q[11];
-ry(pi/2) q[12];
-rx(pi) q[12];
-cx q[3],q[12];
-rz(0.6337745411793452) q[12];
-cx q[3],q[12];
-cx q[5],q[12];
-rz(0.6337745411793452) q[12];
-cx q[5],q[12];
-ry(pi/2) q[13];
-rx(pi) q[13];
-cx q[4],q[13];
-rz(0.6337745411793452) q[13];
-cx q[4],q[13];
-cx q[5],q[13];
-rz(0.6337745411793452) q[13];
-cx q[5],q[13];
-ry(pi/2) q[14];
-rx(pi) q[14];
-cx q[3],q[14];
-rz(0.6337745411793452) q[14];
-cx q[3],q[14];
-cx q[4],q[14];
-rz(0.6337745411793452) q[14];
-cx q[4],q[14];
-rx(7.047099392320972) q[14];
-ry(pi/2) q[15];
-rx(pi) q[15];
-cx q[0],q[15];
-rz(0.6337745411793452) q[15];
-cx q[0],q[15];
-cx q[3],q[15];
-rz(0.6337745411793452) q[15];
-cx q[3],q[15];
-ry(pi/2) q[16];
-rx(pi) q[16];
-cx q[0],q[16];
-rz(0.6337745411793452) q[16];
-cx q[0],q[16];
-cx q[3],q[16];
-rz(0.6337745411793452) q[16];
-cx q[3],q[16];
-ry(pi/2) q[17];
-rx(pi) q[17];
-cx q[1],q[17];
-rz(0.6337745411793452) q[17];
-cx q[1],q[17];
-cx q[3],q[17];
-rz(0.6337745411793452) q[17];
-cx q[3],q[17];
-ry(pi/2) q[18];
-rx(pi) q[18];
-cx q[3],q[18];
-rz(0.6337745411793452) q[18];
-cx q[3],q[18];
-cx q[4],q[18];
-rz(0.6337745411793452) q[18];
-cx q[4],q[18];
-ry(pi/2) q[19];
-rx(pi) q[19];
-cx q[3],q[19];
-rz(0.6337745411793452) q[19];
-cx q[3],q[19];
-cx q[7],q[19];
-rz(0.6337745411793452) q[19];
-cx q[7],q[19];
-rx(7.047099392320972) q[7];
-ry(pi/2) q[20];
-rx(pi) q[20];
-cx q[0],q[20];
-rz(0.6337745411793452) q[20];
-cx q[0],q[20];
-cx q[15],q[20];
-rz(0.6337745411793452) q[20];
-cx q[15],q[20];
-ry(pi/2) q[21];
-rx(pi) q[21];
-cx q[4],q[21];
-rz(0.6337745411793452) q[21];
-cx q[4],q[21];
-cx q[15],q[21];
-rz(0.6337745411793452) q[21];
-cx q[15],q[21];
-ry(pi/2) q[22];
-rx(pi) q[22];
-cx q[3],q[22];
-rz(0.6337745411793452) q[22];
-cx q[3],q[22];
-cx q[9],q[22];
-rz(0.6337745411793452) q[22];
-cx q[9],q[22];
-rx(7.047099392320972) q[9];
-rx(7.047099392320972) q[22];
-ry(pi/2) q[23];
-rx(pi) q[23];
-cx q[3],q[23];
-rz(0.6337745411793452) q[23];
-cx q[3],q[23];
-cx q[17],q[23];
-rz(0.6337745411793452) q[23];
-cx q[17],q[23];
-rx(7.047099392320972) q[17];
-ry(pi/2) q[24];
-rx(pi) q[24];
-cx q[3],q[24];
-rz(0.6337745411793452) q[24];
-cx q[3],q[24];
-cx q[5],q[24];
-rz(0.6337745411793452) q[24];
-cx q[5],q[24];
-rx(7.047099392320972) q[24];
-ry(pi/2) q[25];
-rx(pi) q[25];
-cx q[3],q[25];
-rz(0.6337745411793452) q[25];
-cx q[3],q[25];
-cx q[12],q[25];
-rz(0.6337745411793452) q[25];
-cx q[12],q[25];
-rx(7.047099392320972) q[25];
-ry(pi/2) q[26];
-rx(pi) q[26];
-cx q[3],q[26];
-rz(0.6337745411793452) q[26];
-cx q[3],q[26];
-cx q[21],q[26];
-rz(0.6337745411793452) q[26];
-cx q[21],q[26];
-ry(pi/2) q[27];
-rx(pi) q[27];
-cx q[4],q[27];
-rz(0.6337745411793452) q[27];
-cx q[4],q[27];
-rx(7.047099392320972) q[4];
-cx q[6],q[27];
-rz(0.6337745411793452) q[27];
-cx q[6],q[27];
-rx(7.047099392320972) q[6];
-ry(pi/2) q[28];
-rx(pi) q[28];
-cx q[1],q[28];
-rz(0.6337745411793452) q[28];
-cx q[1],q[28];
-cx q[3],q[28];
-rz(0.6337745411793452) q[28];
-cx q[3],q[28];
-rx(7.047099392320972) q[28];
-ry(pi/2) q[29];
-rx(pi) q[29];
-cx q[1],q[29];
-rz(0.6337745411793452) q[29];
-cx q[1],q[29];
-cx q[3],q[29];
-rz(0.6337745411793452) q[29];
-cx q[3],q[29];
-rx(7.047099392320972) q[29];
-ry(pi/2) q[30];
-rx(pi) q[30];
-cx q[3],q[30];
-rz(0.6337745411793452) q[30];
-cx q[3],q[30];
-cx q[18],q[30];
-rz(0.6337745411793452) q[30];
-cx q[18],q[30];
-rx(7.047099392320972) q[18];
-ry(pi/2) q[31];
-rx(pi) q[31];
-cx q[12],q[31];
-rz(0.6337745411793452) q[31];
-cx q[12],q[31];
-cx q[26],q[31];
-rz(0.6337745411793452) q[31];
-cx q[26],q[31];
-rx(7.047099392320972) q[26];
-rx(7.047099392320972) q[31];
-ry(pi/2) q[32];
-rx(pi) q[32];
-cx q[0],q[32];
-rz(0.6337745411793452) q[32];
-cx q[0],q[32];
-cx q[21],q[32];
-rz(0.6337745411793452) q[32];
-cx q[21],q[32];
-ry(pi/2) q[33];
-rx(pi) q[33];
-cx q[5],q[33];
-rz(0.6337745411793452) q[33];
-cx q[5],q[33];
-rx(7.047099392320972) q[5];
-cx q[30],q[33];
-rz(0.6337745411793452) q[33];
-cx q[30],q[33];
-rx(7.047099392320972) q[30];
-rx(7.047099392320972) q[33];
-ry(pi/2) q[34];
-rx(pi) q[34];
-cx q[3],q[34];
-rz(0.6337745411793452) q[34];
-cx q[3],q[34];
-cx q[12],q[34];
-rz(0.6337745411793452) q[34];
-cx q[12],q[34];
-ry(pi/2) q[35];
-rx(pi) q[35];
-cx q[3],q[35];
-rz(0.6337745411793452) q[35];
-cx q[3],q[35];
-cx q[32],q[35];
-rz(0.6337745411793452) q[35];
-cx q[32],q[35];
-rx(7.047099392320972) q[32];
-rx(7.047099392320972) q[35];
-ry(pi/2) q[36];
-rx(pi) q[36];
-cx q[15],q[36];
-rz(0.6337745411793452) q[36];
-cx q[15],q[36];
-rx(7.047099392320972) q[15];
-cx q[20],q[36];
-rz(0.6337745411793452) q[36];
-cx q[20],q[36];
-rx(7.047099392320972) q[36];
-ry(pi/2) q[37];
-rx(pi) q[37];
-cx q[10],q[37];
-rz(0.6337745411793452) q[37];
-cx q[10],q[37];
-cx q[34],q[37];
-rz(0.6337745411793452) q[37];
-cx q[34],q[37];
-rx(7.047099392320972) q[34];
-rx(7.047099392320972) q[37];
-ry(pi/2) q[38];
-rx(pi) q[38];
-cx q[19],q[38];
-rz(0.6337745411793452) q[38];
-cx q[19],q[38];
-rx(7.047099392320972) q[19];
-cx q[21],q[38];
-rz(0.6337745411793452) q[38];
-cx q[21],q[38];
-rx(7.047099392320972) q[21];
-rx(7.047099392320972) q[38];
-ry(pi/2) q[39];
-rx(pi) q[39];
-cx q[3],q[39];
-rz(0.6337745411793452) q[39];
-cx q[3],q[39];
-cx q[13],q[39];
-rz(0.6337745411793452) q[39];
-cx q[13],q[39];
-rx(7.047099392320972) q[13];
-rx(7.047099392320972) q[39];
-ry(pi/2) q[40];
-rx(pi) q[40];
-cx q[3],q[40];
-rz(0.6337745411793452) q[40];
-cx q[3],q[40];
-cx q[23],q[40];
-rz(0.6337745411793452) q[40];
-cx q[23],q[40];
-rx(7.047099392320972) q[23];
-rx(7.047099392320972) q[40];
-ry(pi/2) q[41];
-rx(pi) q[41];
-cx q[10],q[41];
-rz(0.6337745411793452) q[41];
-cx q[10],q[41];
-rx(7.047099392320972) q[10];
-cx q[27],q[41];
-rz(0.6337745411793452) q[41];
-cx q[27],q[41];
-rx(7.047099392320972) q[27];
-rx(7.047099392320972) q[41];
-ry(pi/2) q[42];
-rx(pi) q[42];
-cx q[0],q[42];
-rz(0.6337745411793452) q[42];
-cx q[0],q[42];
-rx(7.047099392320972) q[0];
-cx q[3],q[42];
-rz(0.6337745411793452) q[42];
-cx q[3],q[42];
-rx(7.047099392320972) q[42];
-ry(pi/2) q[43];
-rx(pi) q[43];
-cx q[3],q[43];
-rz(0.6337745411793452) q[43];
-cx q[3],q[43];
-cx q[20],q[43];
-rz(0.6337745411793452) q[43];
-cx q[20],q[43];
-rx(7.047099392320972) q[20];
-rx(7.047099392320972) q[43];
-ry(pi/2) q[44];
-rx(pi) q[44];
-cx q[3],q[44];
-rz(0.6337745411793452) q[44];
-cx q[3],q[44];
-rx(7.047099392320972) q[3];
-cx q[12],q[44];
-rz(0.6337745411793452) q[44];
-cx q[12],q[44];
-rx(7.047099392320972) q[12];
-rx(7.047099392320972) q[44];
-ry(pi/2) q[45];
-rx(pi) q[45];
-cx q[1],q[45];
-rz(0.6337745411793452) q[45];
-cx q[1],q[45];
-rx(7.047099392320972) q[1];
-cx q[0],q[1];
-rz(5.49194276927249) q[1];
-cx q[0],q[1];
-cx q[0],q[2];
-rz(5.49194276927249) q[2];
-cx q[0],q[2];
-cx q[0],q[3];
-rx(2.397893477560831) q[2];
-rz(5.49194276927249) q[3];
-cx q[0],q[3];
-cx q[0],q[15];
-cx q[1],q[3];
-rz(5.49194276927249) q[3];
-cx q[1],q[3];
-cx q[1],q[4];
-rz(5.49194276927249) q[4];
-cx q[1],q[4];
-cx q[1],q[5];
-cx q[3],q[4];
-rz(5.49194276927249) q[4];
-cx q[3],q[4];
-cx q[4],q[6];
-rz(5.49194276927249) q[5];
-cx q[1],q[5];
-cx q[1],q[9];
-cx q[3],q[5];
-rz(5.49194276927249) q[5];
-cx q[3],q[5];
-cx q[3],q[7];
-rz(5.49194276927249) q[6];
-cx q[4],q[6];
-cx q[5],q[6];
-rz(5.49194276927249) q[6];
-cx q[5],q[6];
-rz(5.49194276927249) q[7];
-cx q[3],q[7];
-cx q[3],q[8];
-cx q[4],q[7];
-rz(5.49194276927249) q[7];
-cx q[4],q[7];
-cx q[4],q[10];
-rz(5.49194276927249) q[8];
-cx q[3],q[8];
-cx q[5],q[8];
-rz(5.49194276927249) q[8];
-cx q[5],q[8];
-cx q[5],q[11];
-rx(2.397893477560831) q[8];
-rz(5.49194276927249) q[9];
-cx q[1],q[9];
-cx q[1],q[17];
-cx q[3],q[9];
-rz(5.49194276927249) q[9];
-cx q[3],q[9];
-cx q[3],q[12];
-rz(5.49194276927249) q[10];
-cx q[4],q[10];
-cx q[4],q[13];
-cx q[6],q[10];
-rz(5.49194276927249) q[10];
-cx q[6],q[10];
-cx q[10],q[37];
-rz(5.49194276927249) q[11];
-cx q[5],q[11];
-cx q[6],q[11];
-rz(5.49194276927249) q[11];
-cx q[6],q[11];
-rx(2.397893477560831) q[11];
-rz(5.49194276927249) q[12];
-cx q[3],q[12];
-cx q[3],q[14];
-cx q[5],q[12];
-rz(5.49194276927249) q[12];
-cx q[5],q[12];
-rz(5.49194276927249) q[13];
-cx q[4],q[13];
-cx q[5],q[13];
-rz(5.49194276927249) q[13];
-cx q[5],q[13];
-rz(5.49194276927249) q[14];
-cx q[3],q[14];
-cx q[4],q[14];
-rz(5.49194276927249) q[14];
-cx q[4],q[14];
-rx(2.397893477560831) q[14];
-rz(5.49194276927249) q[15];
-cx q[0],q[15];
-cx q[3],q[15];
-rz(5.49194276927249) q[15];
-cx q[3],q[15];
-cx q[16],q[45];
-rz(5.49194276927249) q[17];
-cx q[1],q[17];
-cx q[1],q[28];
-rz(5.49194276927249) q[28];
-cx q[1],q[28];
-cx q[1],q[29];
-rz(5.49194276927249) q[29];
-cx q[1],q[29];
-rz(5.49194276927249) q[37];
-cx q[10],q[37];
-cx q[10],q[41];
-rz(5.49194276927249) q[41];
-cx q[10],q[41];
-rx(2.397893477560831) q[10];
-rz(0.6337745411793452) q[45];
-cx q[16],q[45];
-rx(7.047099392320972) q[16];
-cx q[0],q[16];
-rz(5.49194276927249) q[16];
-cx q[0],q[16];
-cx q[0],q[20];
-cx q[3],q[16];
-rz(5.49194276927249) q[16];
-cx q[3],q[16];
-cx q[3],q[17];
-rz(5.49194276927249) q[17];
-cx q[3],q[17];
-cx q[3],q[18];
-rz(5.49194276927249) q[18];
-cx q[3],q[18];
-cx q[3],q[19];
-cx q[4],q[18];
-rz(5.49194276927249) q[18];
-cx q[4],q[18];
-cx q[4],q[21];
-rz(5.49194276927249) q[19];
-cx q[3],q[19];
-cx q[3],q[22];
-cx q[7],q[19];
-rz(5.49194276927249) q[19];
-cx q[7],q[19];
-rx(2.397893477560831) q[7];
-cx q[19],q[38];
-rz(5.49194276927249) q[20];
-cx q[0],q[20];
-cx q[0],q[32];
-cx q[15],q[20];
-rz(5.49194276927249) q[20];
-cx q[15],q[20];
-rz(5.49194276927249) q[21];
-cx q[4],q[21];
-cx q[4],q[27];
-cx q[15],q[21];
-rz(5.49194276927249) q[21];
-cx q[15],q[21];
-cx q[15],q[36];
-rz(5.49194276927249) q[22];
-cx q[3],q[22];
-cx q[3],q[23];
-cx q[9],q[22];
-rz(5.49194276927249) q[22];
-cx q[9],q[22];
-rx(2.397893477560831) q[9];
-rx(2.397893477560831) q[22];
-rz(5.49194276927249) q[23];
-cx q[3],q[23];
-cx q[3],q[24];
-cx q[17],q[23];
-rz(5.49194276927249) q[23];
-cx q[17],q[23];
-rx(2.397893477560831) q[17];
-rz(5.49194276927249) q[24];
-cx q[3],q[24];
-cx q[3],q[25];
-cx q[5],q[24];
-rz(5.49194276927249) q[24];
-cx q[5],q[24];
-cx q[5],q[33];
-rx(2.397893477560831) q[24];
-rz(5.49194276927249) q[25];
-cx q[3],q[25];
-cx q[3],q[26];
-cx q[12],q[25];
-rz(5.49194276927249) q[25];
-cx q[12],q[25];
-cx q[12],q[31];
-rx(2.397893477560831) q[25];
-rz(5.49194276927249) q[26];
-cx q[3],q[26];
-cx q[3],q[28];
-cx q[21],q[26];
-rz(5.49194276927249) q[26];
-cx q[21],q[26];
-rz(5.49194276927249) q[27];
-cx q[4],q[27];
-rx(2.397893477560831) q[4];
-cx q[6],q[27];
-rz(5.49194276927249) q[27];
-cx q[6],q[27];
-rx(2.397893477560831) q[6];
-cx q[27],q[41];
-rz(5.49194276927249) q[28];
-cx q[3],q[28];
-cx q[3],q[29];
-rx(2.397893477560831) q[28];
-rz(5.49194276927249) q[29];
-cx q[3],q[29];
-cx q[3],q[30];
-rx(2.397893477560831) q[29];
-rz(5.49194276927249) q[30];
-cx q[3],q[30];
-cx q[3],q[34];
-cx q[18],q[30];
-rz(5.49194276927249) q[30];
-cx q[18],q[30];
-rx(2.397893477560831) q[18];
-rz(5.49194276927249) q[31];
-cx q[12],q[31];
-cx q[26],q[31];
-rz(5.49194276927249) q[31];
-cx q[26],q[31];
-rx(2.397893477560831) q[26];
-rx(2.397893477560831) q[31];
-rz(5.49194276927249) q[32];
-cx q[0],q[32];
-cx q[0],q[42];
-cx q[21],q[32];
-rz(5.49194276927249) q[32];
-cx q[21],q[32];
-rz(5.49194276927249) q[33];
-cx q[5],q[33];
-rx(2.397893477560831) q[5];
-cx q[30],q[33];
-rz(5.49194276927249) q[33];
-cx q[30],q[33];
-rx(2.397893477560831) q[30];
-rx(2.397893477560831) q[33];
-rz(5.49194276927249) q[34];
-cx q[3],q[34];
-cx q[3],q[35];
-cx q[12],q[34];
-rz(5.49194276927249) q[34];
-cx q[12],q[34];
-cx q[34],q[37];
-rz(5.49194276927249) q[35];
-cx q[3],q[35];
-cx q[3],q[39];
-cx q[32],q[35];
-rz(5.49194276927249) q[35];
-cx q[32],q[35];
-rx(2.397893477560831) q[32];
-rx(2.397893477560831) q[35];
-rz(5.49194276927249) q[36];
-cx q[15],q[36];
-rx(2.397893477560831) q[15];
-cx q[20],q[36];
-rz(5.49194276927249) q[36];
-cx q[20],q[36];
-rx(2.397893477560831) q[36];
-rz(5.49194276927249) q[37];
-cx q[34],q[37];
-rx(2.397893477560831) q[34];
-rx(2.397893477560831) q[37];
-rz(5.49194276927249) q[38];
-cx q[19],q[38];
-rx(2.397893477560831) q[19];
-cx q[21],q[38];
-rz(5.49194276927249) q[38];
-cx q[21],q[38];
-rx(2.397893477560831) q[21];
-rx(2.397893477560831) q[38];
-rz(5.49194276927249) q[39];
-cx q[3],q[39];
-cx q[3],q[40];
-cx q[13],q[39];
-rz(5.49194276927249) q[39];
-cx q[13],q[39];
-rx(2.397893477560831) q[13];
-rx(2.397893477560831) q[39];
-rz(5.49194276927249) q[40];
-cx q[3],q[40];
-cx q[23],q[40];
-rz(5.49194276927249) q[40];
-cx q[23],q[40];
-rx(2.397893477560831) q[23];
-rx(2.397893477560831) q[40];
-rz(5.49194276927249) q[41];
-cx q[27],q[41];
-rx(2.397893477560831) q[27];
-rx(2.397893477560831) q[41];
-rz(5.49194276927249) q[42];
-cx q[0],q[42];
-rx(2.397893477560831) q[0];
-cx q[3],q[42];
-rz(5.49194276927249) q[42];
-cx q[3],q[42];
-cx q[3],q[43];
-rx(2.397893477560831) q[42];
-rz(5.49194276927249) q[43];
-cx q[3],q[43];
-cx q[3],q[44];
-cx q[20],q[43];
-rz(5.49194276927249) q[43];
-cx q[20],q[43];
-rx(2.397893477560831) q[20];
-rx(2.397893477560831) q[43];
-rz(5.49194276927249) q[44];
-cx q[3],q[44];
-rx(2.397893477560831) q[3];
-cx q[12],q[44];
-rz(5.49194276927249) q[44];
-cx q[12],q[44];
-rx(2.397893477560831) q[12];
-rx(2.397893477560831) q[44];
-rx(7.047099392320972) q[45];
-cx q[1],q[45];
-rz(5.49194276927249) q[45];
-cx q[1],q[45];
-rx(2.397893477560831) q[1];
-cx q[0],q[1];
-rz(2.7078413529851586) q[1];
-cx q[0],q[1];
-cx q[0],q[2];
-rz(2.7078413529851586) q[2];
-cx q[0],q[2];
-cx q[0],q[3];
-rx(7.347592117289243) q[2];
-rz(2.7078413529851586) q[3];
-cx q[0],q[3];
-cx q[0],q[15];
-cx q[1],q[3];
-rz(2.7078413529851586) q[3];
-cx q[1],q[3];
-cx q[1],q[4];
-rz(2.7078413529851586) q[4];
-cx q[1],q[4];
-cx q[1],q[5];
-cx q[3],q[4];
-rz(2.7078413529851586) q[4];
-cx q[3],q[4];
-cx q[4],q[6];
-rz(2.7078413529851586) q[5];
-cx q[1],q[5];
-cx q[1],q[9];
-cx q[3],q[5];
-rz(2.7078413529851586) q[5];
-cx q[3],q[5];
-cx q[3],q[7];
-rz(2.7078413529851586) q[6];
-cx q[4],q[6];
-cx q[5],q[6];
-rz(2.7078413529851586) q[6];
-cx q[5],q[6];
-rz(2.7078413529851586) q[7];
-cx q[3],q[7];
-cx q[3],q[8];
-cx q[4],q[7];
-rz(2.7078413529851586) q[7];
-cx q[4],q[7];
-cx q[4],q[10];
-rz(2.7078413529851586) q[8];
-cx q[3],q[8];
-cx q[5],q[8];
-rz(2.7078413529851586) q[8];
-cx q[5],q[8];
-cx q[5],q[11];
-rx(7.347592117289243) q[8];
-rz(2.7078413529851586) q[9];
-cx q[1],q[9];
-cx q[1],q[17];
-cx q[3],q[9];
-rz(2.7078413529851586) q[9];
-cx q[3],q[9];
-cx q[3],q[12];
-rz(2.7078413529851586) q[10];
-cx q[4],q[10];
-cx q[4],q[13];
-cx q[6],q[10];
-rz(2.7078413529851586) q[10];
-cx q[6],q[10];
-cx q[10],q[37];
-rz(2.7078413529851586) q[11];
-cx q[5],q[11];
-cx q[6],q[11];
-rz(2.7078413529851586) q[11];
-cx q[6],q[11];
-rx(7.347592117289243) q[11];
-rz(2.7078413529851586) q[12];
-cx q[3],q[12];
-cx q[3],q[14];
-cx q[5],q[12];
-rz(2.7078413529851586) q[12];
-cx q[5],q[12];
-rz(2.7078413529851586) q[13];
-cx q[4],q[13];
-cx q[5],q[13];
-rz(2.7078413529851586) q[13];
-cx q[5],q[13];
-rz(2.7078413529851586) q[14];
-cx q[3],q[14];
-cx q[4],q[14];
-rz(2.7078413529851586) q[14];
-cx q[4],q[14];
-rx(7.347592117289243) q[14];
-rz(2.7078413529851586) q[15];
-cx q[0],q[15];
-cx q[3],q[15];
-rz(2.7078413529851586) q[15];
-cx q[3],q[15];
-cx q[16],q[45];
-rz(2.7078413529851586) q[17];
-cx q[1],q[17];
-cx q[1],q[28];
-rz(2.7078413529851586) q[28];
-cx q[1],q[28];
-cx q[1],q[29];
-rz(2.7078413529851586) q[29];
-cx q[1],q[29];
-rz(2.7078413529851586) q[37];
-cx q[10],q[37];
-cx q[10],q[41];
-rz(2.7078413529851586) q[41];
-cx q[10],q[41];
-rx(7.347592117289243) q[10];
-rz(5.49194276927249) q[45];
-cx q[16],q[45];
-rx(2.397893477560831) q[16];
-cx q[0],q[16];
-rz(2.7078413529851586) q[16];
-cx q[0],q[16];
-cx q[0],q[20];
-cx q[3],q[16];
-rz(2.7078413529851586) q[16];
-cx q[3],q[16];
-cx q[3],q[17];
-rz(2.7078413529851586) q[17];
-cx q[3],q[17];
-cx q[3],q[18];
-rz(2.7078413529851586) q[18];
-cx q[3],q[18];
-cx q[3],q[19];
-cx q[4],q[18];
-rz(2.7078413529851586) q[18];
-cx q[4],q[18];
-cx q[4],q[21];
-rz(2.7078413529851586) q[19];
-cx q[3],q[19];
-cx q[3],q[22];
-cx q[7],q[19];
-rz(2.7078413529851586) q[19];
-cx q[7],q[19];
-rx(7.347592117289243) q[7];
-cx q[19],q[38];
-rz(2.7078413529851586) q[20];
-cx q[0],q[20];
-cx q[0],q[32];
-cx q[15],q[20];
-rz(2.7078413529851586) q[20];
-cx q[15],q[20];
-rz(2.7078413529851586) q[21];
-cx q[4],q[21];
-cx q[4],q[27];
-cx q[15],q[21];
-rz(2.7078413529851586) q[21];
-cx q[15],q[21];
-cx q[15],q[36];
-rz(2.7078413529851586) q[22];
-cx q[3],q[22];
-cx q[3],q[23];
-cx q[9],q[22];
-rz(2.7078413529851586) q[22];
-cx q[9],q[22];
-rx(7.347592117289243) q[9];
-rx(7.347592117289243) q[22];
-rz(2.7078413529851586) q[23];
-cx q[3],q[23];
-cx q[3],q[24];
-cx q[17],q[23];
-rz(2.7078413529851586) q[23];
-cx q[17],q[23];
-rx(7.347592117289243) q[17];
-rz(2.7078413529851586) q[24];
-cx q[3],q[24];
-cx q[3],q[25];
-cx q[5],q[24];
-rz(2.7078413529851586) q[24];
-cx q[5],q[24];
-cx q[5],q[33];
-rx(7.347592117289243) q[24];
-rz(2.7078413529851586) q[25];
-cx q[3],q[25];
-cx q[3],q[26];
-cx q[12],q[25];
-rz(2.7078413529851586) q[25];
-cx q[12],q[25];
-cx q[12],q[31];
-rx(7.347592117289243) q[25];
-rz(2.7078413529851586) q[26];
-cx q[3],q[26];
-cx q[3],q[28];
-cx q[21],q[26];
-rz(2.7078413529851586) q[26];
-cx q[21],q[26];
-rz(2.7078413529851586) q[27];
-cx q[4],q[27];
-rx(7.347592117289243) q[4];
-cx q[6],q[27];
-rz(2.7078413529851586) q[27];
-cx q[6],q[27];
-rx(7.347592117289243) q[6];
-cx q[27],q[41];
-rz(2.7078413529851586) q[28];
-cx q[3],q[28];
-cx q[3],q[29];
-rx(7.347592117289243) q[28];
-rz(2.7078413529851586) q[29];
-cx q[3],q[29];
-cx q[3],q[30];
-rx(7.347592117289243) q[29];
-rz(2.7078413529851586) q[30];
-cx q[3],q[30];
-cx q[3],q[34];
-cx q[18],q[30];
-rz(2.7078413529851586) q[30];
-cx q[18],q[30];
-rx(7.347592117289243) q[18];
-rz(2.7078413529851586) q[31];
-cx q[12],q[31];
-cx q[26],q[31];
-rz(2.7078413529851586) q[31];
-cx q[26],q[31];
-rx(7.347592117289243) q[26];
-rx(7.347592117289243) q[31];
-rz(2.7078413529851586) q[32];
-cx q[0],q[32];
-cx q[0],q[42];
-cx q[21],q[32];
-rz(2.7078413529851586) q[32];
-cx q[21],q[32];
-rz(2.7078413529851586) q[33];
-cx q[5],q[33];
-rx(7.347592117289243) q[5];
-cx q[30],q[33];
-rz(2.7078413529851586) q[33];
-cx q[30],q[33];
-rx(7.347592117289243) q[30];
-rx(7.347592117289243) q[33];
-rz(2.7078413529851586) q[34];
-cx q[3],q[34];
-cx q[3],q[35];
-cx q[12],q[34];
-rz(2.7078413529851586) q[34];
-cx q[12],q[34];
-cx q[34],q[37];
-rz(2.7078413529851586) q[35];
-cx q[3],q[35];
-cx q[3],q[39];
-cx q[32],q[35];
-rz(2.7078413529851586) q[35];
-cx q[32],q[35];
-rx(7.347592117289243) q[32];
-rx(7.347592117289243) q[35];
-rz(2.7078413529851586) q[36];
-cx q[15],q[36];
-rx(7.347592117289243) q[15];
-cx q[20],q[36];
-rz(2.7078413529851586) q[36];
-cx q[20],q[36];
-rx(7.347592117289243) q[36];
-rz(2.7078413529851586) q[37];
-cx q[34],q[37];
-rx(7.347592117289243) q[34];
-rx(7.347592117289243) q[37];
-rz(2.7078413529851586) q[38];
-cx q[19],q[38];
-rx(7.347592117289243) q[19];
-cx q[21],q[38];
-rz(2.7078413529851586) q[38];
-cx q[21],q[38];
-rx(7.347592117289243) q[21];
-rx(7.347592117289243) q[38];
-rz(2.7078413529851586) q[39];
-cx q[3],q[39];
-cx q[3],q[40];
-cx q[13],q[39];
-rz(2.7078413529851586) q[39];
-cx q[13],q[39];
-rx(7.347592117289243) q[13];
-rx(7.347592117289243) q[39];
-rz(2.7078413529851586) q[40];
-cx q[3],q[40];
-cx q[23],q[40];
-rz(2.7078413529851586) q[40];
-cx q[23],q[40];
-rx(7.347592117289243) q[23];
-rx(7.347592117289243) q[40];
-rz(2.7078413529851586) q[41];
-cx q[27],q[41];
-rx(7.347592117289243) q[27];
-rx(7.347592117289243) q[41];
-rz(2.7078413529851586) q[42];
-cx q[0],q[42];
-rx(7.347592117289243) q[0];
-cx q[3],q[42];
-rz(2.7078413529851586) q[42];
-cx q[3],q[42];
-cx q[3],q[43];
-rx(7.347592117289243) q[42];
-rz(2.7078413529851586) q[43];
-cx q[3],q[43];
-cx q[3],q[44];
-cx q[20],q[43];
-rz(2.7078413529851586) q[43];
-cx q[20],q[43];
-rx(7.347592117289243) q[20];
-rx(7.347592117289243) q[43];
-rz(2.7078413529851586) q[44];
-cx q[3],q[44];
-rx(7.347592117289243) q[3];
-cx q[12],q[44];
-rz(2.7078413529851586) q[44];
-cx q[12],q[44];
-rx(7.347592117289243) q[12];
-rx(7.347592117289243) q[44];
-rx(2.397893477560831) q[45];
-cx q[1],q[45];
-rz(2.7078413529851586) q[45];
-cx q[1],q[45];
-rx(7.347592117289243) q[1];
-cx q[16],q[45];
-rz(2.7078413529851586) q[45];
-cx q[16],q[45];
-rx(7.347592117289243) q[16];
-rx(7.347592117289243) q[45];
\ No newline at end of file
@@ -1,1048 +0,0 @@
-OPENQASM 2.0;
-include "qelib1.inc";
-qreg q[47];
-ry(pi/2) q[0];
-rx(pi) q[0];
-ry(pi/2) q[1];
-rx(pi) q[1];
-cx q[0],q[1];
-rz(4.778798713907163) q[1];
-cx q[0],q[1];
-ry(pi/2) q[2];
-rx(pi) q[2];
-cx q[0],q[2];
-rz(4.778798713907163) q[2];
-cx q[0],q[2];
-rx(8.328197694850846) q[2];
-ry(pi/2) q[3];
-rx(pi) q[3];
-cx q[0],q[3];
-rz(4.778798713907163) q[3];
-cx q[0],q[3];
-cx q[1],q[3];
-rz(4.778798713907163) q[3];
-cx q[1],q[3];
-ry(pi/2) q[4];
-rx(pi) q[4];
-cx q[1],q[4];
-rz(4.778798713907163) q[4];
-cx q[1],q[4];
-cx q[3],q[4];
-rz(4.778798713907163) q[4];
-cx q[3],q[4];
-ry(pi/2) q[5];
-rx(pi) q[5];
-cx q[1],q[5];
-rz(4.778798713907163) q[5];
-cx q[1],q[5];
-cx q[3],q[5];
-rz(4.778798713907163) q[5];
-cx q[3],q[5];
-ry(pi/2) q[6];
-rx(pi) q[6];
-cx q[4],q[6];
-rz(4.778798713907163) q[6];
-cx q[4],q[6];
-cx q[5],q[6];
-rz(4.778798713907163) q[6];
-cx q[5],q[6];
-ry(pi/2) q[7];
-rx(pi) q[7];
-cx q[3],q[7];
-rz(4.778798713907163) q[7];
-cx q[3],q[7];
-cx q[4],q[7];
-rz(4.778798713907163) q[7];
-cx q[4],q[7];
-ry(pi/2) q[8];
-rx(pi) q[8];
-cx q[3],q[8];
-rz(4.778798713907163) q[8];
-cx q[3],q[8];
-cx q[5],q[8];
-rz(4.778798713907163) q[8];
-cx q[5],q[8];
-rx(8.328197694850846) q[8];
-ry(pi/2) q[9];
-rx(pi) q[9];
-cx q[1],q[9];
-rz(4.778798713907163) q[9];
-cx q[1],q[9];
-cx q[3],q[9];
-rz(4.778798713907163) q[9];
-cx q[3],q[9];
-ry(pi/2) q[10];
-rx(pi) q[10];
-cx q[4],q[10];
-rz(4.778798713907163) q[10];
-cx q[4],q[10];
-cx q[6],q[10];
-rz(4.778798713907163) q[10];
-cx q[6],q[10];
-ry(pi/2) q[11];
-rx(pi) q[11];
-cx q[5],q[11];
-rz(4.778798713907163) q[11];
-cx q[5],q[11];
-cx q[6],q[11];
-rz(4.778798713907163) q[11];
-cx q[6],q[11];
-rx(8.328197694850846) q[11];
-ry(pi/2) q[12];
-rx(pi) q[12];
-cx q[3],q[12];
-rz(4.778798713907163) q[12];
-cx q[3],q[12];
-cx q[5],q[12];
-rz(4.778798713907163) q[12];
-cx q[5],q[12];
-ry(pi/2) q[13];
-rx(pi) q[13];
-cx q[4],q[13];
-rz(4.778798713907163) q[13];
-cx q[4],q[13];
-cx q[5],q[13];
-rz(4.778798713907163) q[13];
-cx q[5],q[13];
-ry(pi/2) q[14];
-rx(pi) q[14];
-cx q[3],q[14];
-rz(4.778798713907163) q[14];
-cx q[3],q[14];
-cx q[4],q[14];
-rz(4.778798713907163) q[14];
-cx q[4],q[14];
-rx(8.328197694850846) q[14];
-ry(pi/2) q[15];
-rx(pi) q[15];
-cx q[0],q[15];
-rz(4.778798713907163) q[15];
-cx q[0],q[15];
-cx q[3],q[15];
-rz(4.778798713907163) q[15];
-cx q[3],q[15];
-ry(pi/2) q[16];
-rx(pi) q[16];
-cx q[0],q[16];
-rz(4.778798713907163) q[16];
-cx q[0],q[16];
-cx q[3],q[16];
-rz(4.778798713907163) q[16];
-cx q[3],q[16];
-ry(pi/2) q[17];
-rx(pi) q[17];
-cx q[1],q[17];
-rz(4.778798713907163) q[17];
-cx q[1],q[17];
-cx q[3],q[17];
-rz(4.778798713907163) q[17];
-cx q[3],q[17];
-ry(pi/2) q[18];
-rx(pi) q[18];
-cx q[3],q[18];
-rz(4.778798713907163) q[18];
-cx q[3],q[18];
-cx q[4],q[18];
-rz(4.778798713907163) q[18];
-cx q[4],q[18];
-ry(pi/2) q[19];
-rx(pi) q[19];
-cx q[3],q[19];
-rz(4.778798713907163) q[19];
-cx q[3],q[19];
-cx q[7],q[19];
-rz(4.778798713907163) q[19];
-cx q[7],q[19];
-rx(8.328197694850846) q[7];
-ry(pi/2) q[20];
-rx(pi) q[20];
-cx q[0],q[20];
-rz(4.778798713907163) q[20];
-cx q[0],q[20];
-cx q[15],q[20];
-rz(4.778798713907163) q[20];
-cx q[15],q[20];
-ry(pi/2) q[21];
-rx(pi) q[21];
-cx q[4],q[21];
-rz(4.778798713907163) q[21];
-cx q[4],q[21];
-cx q[15],q[21];
-rz(4.778798713907163) q[21];
-cx q[15],q[21];
-ry(pi/2) q[22];
-rx(pi) q[22];
-cx q[3],q[22];
-rz(4.778798713907163) q[22];
-cx q[3],q[22];
-cx q[9],q[22];
-rz(4.778798713907163) q[22];
-cx q[9],q[22];
-rx(8.328197694850846) q[9];
-rx(8.328197694850846) q[22];
-ry(pi/2) q[23];
-rx(pi) q[23];
-cx q[3],q[23];
-rz(4.778798713907163) q[23];
-cx q[3],q[23];
-cx q[17],q[23];
-rz(4.778798713907163) q[23];
-cx q[17],q[23];
-rx(8.328197694850846) q[17];
-ry(pi/2) q[24];
-rx(pi) q[24];
-cx q[3],q[24];
-rz(4.778798713907163) q[24];
-cx q[3],q[24];
-cx q[5],q[24];
-rz(4.778798713907163) q[24];
-cx q[5],q[24];
-rx(8.328197694850846) q[24];
-ry(pi/2) q[25];
-rx(pi) q[25];
-cx q[3],q[25];
-rz(4.778798713907163) q[25];
-cx q[3],q[25];
-cx q[12],q[25];
-rz(4.778798713907163) q[25];
-cx q[12],q[25];
-rx(8.328197694850846) q[25];
-ry(pi/2) q[26];
-rx(pi) q[26];
-cx q[3],q[26];
-rz(4.778798713907163) q[26];
-cx q[3],q[26];
-cx q[21],q[26];
-rz(4.778798713907163) q[26];
-cx q[21],q[26];
-ry(pi/2) q[27];
-rx(pi) q[27];
-cx q[4],q[27];
-rz(4.778798713907163) q[27];
-cx q[4],q[27];
-rx(8.328197694850846) q[4];
-cx q[6],q[27];
-rz(4.778798713907163) q[27];
-cx q[6],q[27];
-rx(8.328197694850846) q[6];
-ry(pi/2) q[28];
-rx(pi) q[28];
-cx q[1],q[28];
-rz(4.778798713907163) q[28];
-cx q[1],q[28];
-cx q[3],q[28];
-rz(4.778798713907163) q[28];
-cx q[3],q[28];
-rx(8.328197694850846) q[28];
-ry(pi/2) q[29];
-rx(pi) q[29];
-cx q[1],q[29];
-rz(4.778798713907163) q[29];
-cx q[1],q[29];
-cx q[3],q[29];
-rz(4.778798713907163) q[29];
-cx q[3],q[29];
-rx(8.328197694850846) q[29];
-ry(pi/2) q[30];
-rx(pi) q[30];
-cx q[3],q[30];
-rz(4.778798713907163) q[30];
-cx q[3],q[30];
-cx q[18],q[30];
-rz(4.778798713907163) q[30];
-cx q[18],q[30];
-rx(8.328197694850846) q[18];
-ry(pi/2) q[31];
-rx(pi) q[31];
-cx q[12],q[31];
-rz(4.778798713907163) q[31];
-cx q[12],q[31];
-cx q[26],q[31];
-rz(4.778798713907163) q[31];
-cx q[26],q[31];
-rx(8.328197694850846) q[26];
-rx(8.328197694850846) q[31];
-ry(pi/2) q[32];
-rx(pi) q[32];
-cx q[0],q[32];
-rz(4.778798713907163) q[32];
-cx q[0],q[32];
-cx q[21],q[32];
-rz(4.778798713907163) q[32];
-cx q[21],q[32];
-ry(pi/2) q[33];
-rx(pi) q[33];
-cx q[5],q[33];
-rz(4.778798713907163) q[33];
-cx q[5],q[33];
-cx q[30],q[33];
-rz(4.778798713907163) q[33];
-cx q[30],q[33];
-rx(8.328197694850846) q[30];
-rx(8.328197694850846) q[33];
-ry(pi/2) q[34];
-rx(pi) q[34];
-cx q[3],q[34];
-rz(4.778798713907163) q[34];
-cx q[3],q[34];
-cx q[12],q[34];
-rz(4.778798713907163) q[34];
-cx q[12],q[34];
-ry(pi/2) q[35];
-rx(pi) q[35];
-cx q[3],q[35];
-rz(4.778798713907163) q[35];
-cx q[3],q[35];
-cx q[32],q[35];
-rz(4.778798713907163) q[35];
-cx q[32],q[35];
-rx(8.328197694850846) q[32];
-rx(8.328197694850846) q[35];
-ry(pi/2) q[36];
-rx(pi) q[36];
-cx q[15],q[36];
-rz(4.778798713907163) q[36];
-cx q[15],q[36];
-rx(8.328197694850846) q[15];
-cx q[20],q[36];
-rz(4.778798713907163) q[36];
-cx q[20],q[36];
-rx(8.328197694850846) q[36];
-ry(pi/2) q[37];
-rx(pi) q[37];
-cx q[10],q[37];
-rz(4.778798713907163) q[37];
-cx q[10],q[37];
-cx q[34],q[37];
-rz(4.778798713907163) q[37];
-cx q[34],q[37];
-rx(8.328197694850846) q[34];
-rx(8.328197694850846) q[37];
-ry(pi/2) q[38];
-rx(pi) q[38];
-cx q[19],q[38];
-rz(4.778798713907163) q[38];
-cx q[19],q[38];
-rx(8.328197694850846) q[19];
-cx q[21],q[38];
-rz(4.778798713907163) q[38];
-cx q[21],q[38];
-rx(8.328197694850846) q[21];
-ry(pi/2) q[39];
-rx(pi) q[39];
-cx q[3],q[39];
-rz(4.778798713907163) q[39];
-cx q[3],q[39];
-cx q[13],q[39];
-rz(4.778798713907163) q[39];
-cx q[13],q[39];
-rx(8.328197694850846) q[13];
-rx(8.328197694850846) q[39];
-ry(pi/2) q[40];
-rx(pi) q[40];
-cx q[3],q[40];
-rz(4.778798713907163) q[40];
-cx q[3],q[40];
-cx q[23],q[40];
-rz(4.778798713907163) q[40];
-cx q[23],q[40];
-rx(8.328197694850846) q[23];
-rx(8.328197694850846) q[40];
-ry(pi/2) q[41];
-rx(pi) q[41];
-cx q[10],q[41];
-rz(4.778798713907163) q[41];
-cx q[10],q[41];
-rx(8.328197694850846) q[10];
-cx q[27],q[41];
-rz(4.778798713907163) q[41];
-cx q[27],q[41];
-rx(8.328197694850846) q[27];
-rx(8.328197694850846) q[41];
-ry(pi/2) q[42];
-rx(pi) q[42];
-cx q[0],q[42];
-rz(4.778798713907163) q[42];
-cx q[0],q[42];
-rx(8.328197694850846) q[0];
-cx q[3],q[42];
-rz(4.778798713907163) q[42];
-cx q[3],q[42];
-rx(8.328197694850846) q[42];
-ry(pi/2) q[43];
-rx(pi) q[43];
-cx q[3],q[43];
-rz(4.778798713907163) q[43];
-cx q[3],q[43];
-cx q[20],q[43];
-rz(4.778798713907163) q[43];
-cx q[20],q[43];
-rx(8.328197694850846) q[20];
-rx(8.328197694850846) q[43];
-ry(pi/2) q[44];
-rx(pi) q[44];
-cx q[3],q[44];
-rz(4.778798713907163) q[44];
-cx q[3],q[44];
-rx(8.328197694850846) q[3];
-cx q[12],q[44];
-rz(4.778798713907163) q[44];
-cx q[12],q[44];
-rx(8.328197694850846) q[12];
-rx(8.328197694850846) q[44];
-ry(pi/2) q[45];
-rx(pi) q[45];
-cx q[1],q[45];
-rz(4.778798713907163) q[45];
-cx q[1],q[45];
-rx(8.328197694850846) q[1];
-cx q[0],q[1];
-rz(1.0257962109503498) q[1];
-cx q[0],q[1];
-cx q[0],q[2];
-rz(1.0257962109503498) q[2];
-cx q[0],q[2];
-cx q[0],q[3];
-rx(1.0053164350407748) q[2];
-rz(1.0257962109503498) q[3];
-cx q[0],q[3];
-cx q[0],q[15];
-cx q[1],q[3];
-rz(1.0257962109503498) q[3];
-cx q[1],q[3];
-cx q[1],q[4];
-rz(1.0257962109503498) q[4];
-cx q[1],q[4];
-cx q[3],q[4];
-rz(1.0257962109503498) q[4];
-cx q[3],q[4];
-cx q[4],q[6];
-rz(1.0257962109503498) q[6];
-cx q[4],q[6];
-rz(1.0257962109503498) q[15];
-cx q[0],q[15];
-cx q[16],q[45];
-rz(4.778798713907163) q[45];
-cx q[16],q[45];
-rx(8.328197694850846) q[16];
-cx q[0],q[16];
-rz(1.0257962109503498) q[16];
-cx q[0],q[16];
-cx q[0],q[20];
-rz(1.0257962109503498) q[20];
-cx q[0],q[20];
-cx q[0],q[32];
-rz(1.0257962109503498) q[32];
-cx q[0],q[32];
-cx q[0],q[42];
-rz(1.0257962109503498) q[42];
-cx q[0],q[42];
-rx(1.0053164350407748) q[0];
-rx(8.328197694850846) q[45];
-ry(pi/2) q[46];
-rx(pi) q[46];
-cx q[5],q[46];
-rz(4.778798713907163) q[46];
-cx q[5],q[46];
-rx(8.328197694850846) q[5];
-cx q[1],q[5];
-rz(1.0257962109503498) q[5];
-cx q[1],q[5];
-cx q[1],q[9];
-cx q[3],q[5];
-rz(1.0257962109503498) q[5];
-cx q[3],q[5];
-cx q[3],q[7];
-cx q[5],q[6];
-rz(1.0257962109503498) q[6];
-cx q[5],q[6];
-rz(1.0257962109503498) q[7];
-cx q[3],q[7];
-cx q[3],q[8];
-cx q[4],q[7];
-rz(1.0257962109503498) q[7];
-cx q[4],q[7];
-cx q[4],q[10];
-rz(1.0257962109503498) q[8];
-cx q[3],q[8];
-cx q[5],q[8];
-rz(1.0257962109503498) q[8];
-cx q[5],q[8];
-cx q[5],q[11];
-rx(1.0053164350407748) q[8];
-rz(1.0257962109503498) q[9];
-cx q[1],q[9];
-cx q[1],q[17];
-cx q[3],q[9];
-rz(1.0257962109503498) q[9];
-cx q[3],q[9];
-cx q[3],q[12];
-rz(1.0257962109503498) q[10];
-cx q[4],q[10];
-cx q[4],q[13];
-cx q[6],q[10];
-rz(1.0257962109503498) q[10];
-cx q[6],q[10];
-cx q[10],q[37];
-rz(1.0257962109503498) q[11];
-cx q[5],q[11];
-cx q[6],q[11];
-rz(1.0257962109503498) q[11];
-cx q[6],q[11];
-rx(1.0053164350407748) q[11];
-rz(1.0257962109503498) q[12];
-cx q[3],q[12];
-cx q[3],q[14];
-cx q[5],q[12];
-rz(1.0257962109503498) q[12];
-cx q[5],q[12];
-rz(1.0257962109503498) q[13];
-cx q[4],q[13];
-cx q[5],q[13];
-rz(1.0257962109503498) q[13];
-cx q[5],q[13];
-rz(1.0257962109503498) q[14];
-cx q[3],q[14];
-cx q[3],q[15];
-cx q[4],q[14];
-rz(1.0257962109503498) q[14];
-cx q[4],q[14];
-rx(1.0053164350407748) q[14];
-rz(1.0257962109503498) q[15];
-cx q[3],q[15];
-cx q[3],q[16];
-cx q[15],q[20];
-rz(1.0257962109503498) q[16];
-cx q[3],q[16];
-rz(1.0257962109503498) q[17];
-cx q[1],q[17];
-cx q[1],q[28];
-cx q[3],q[17];
-rz(1.0257962109503498) q[17];
-cx q[3],q[17];
-cx q[3],q[18];
-rz(1.0257962109503498) q[18];
-cx q[3],q[18];
-cx q[3],q[19];
-cx q[4],q[18];
-rz(1.0257962109503498) q[18];
-cx q[4],q[18];
-cx q[4],q[21];
-rz(1.0257962109503498) q[19];
-cx q[3],q[19];
-cx q[3],q[22];
-cx q[7],q[19];
-rz(1.0257962109503498) q[19];
-cx q[7],q[19];
-rx(1.0053164350407748) q[7];
-rz(1.0257962109503498) q[20];
-cx q[15],q[20];
-rz(1.0257962109503498) q[21];
-cx q[4],q[21];
-cx q[4],q[27];
-cx q[15],q[21];
-rz(1.0257962109503498) q[21];
-cx q[15],q[21];
-cx q[15],q[36];
-rz(1.0257962109503498) q[22];
-cx q[3],q[22];
-cx q[3],q[23];
-cx q[9],q[22];
-rz(1.0257962109503498) q[22];
-cx q[9],q[22];
-rx(1.0053164350407748) q[9];
-rx(1.0053164350407748) q[22];
-rz(1.0257962109503498) q[23];
-cx q[3],q[23];
-cx q[3],q[24];
-cx q[17],q[23];
-rz(1.0257962109503498) q[23];
-cx q[17],q[23];
-rx(1.0053164350407748) q[17];
-rz(1.0257962109503498) q[24];
-cx q[3],q[24];
-cx q[3],q[25];
-cx q[5],q[24];
-rz(1.0257962109503498) q[24];
-cx q[5],q[24];
-cx q[5],q[33];
-rx(1.0053164350407748) q[24];
-rz(1.0257962109503498) q[25];
-cx q[3],q[25];
-cx q[3],q[26];
-cx q[12],q[25];
-rz(1.0257962109503498) q[25];
-cx q[12],q[25];
-cx q[12],q[31];
-rx(1.0053164350407748) q[25];
-rz(1.0257962109503498) q[26];
-cx q[3],q[26];
-cx q[21],q[26];
-rz(1.0257962109503498) q[26];
-cx q[21],q[26];
-cx q[21],q[32];
-rz(1.0257962109503498) q[27];
-cx q[4],q[27];
-rx(1.0053164350407748) q[4];
-cx q[6],q[27];
-rz(1.0257962109503498) q[27];
-cx q[6],q[27];
-rx(1.0053164350407748) q[6];
-rz(1.0257962109503498) q[28];
-cx q[1],q[28];
-cx q[1],q[29];
-cx q[3],q[28];
-rz(1.0257962109503498) q[28];
-cx q[3],q[28];
-rx(1.0053164350407748) q[28];
-rz(1.0257962109503498) q[29];
-cx q[1],q[29];
-cx q[1],q[45];
-cx q[3],q[29];
-rz(1.0257962109503498) q[29];
-cx q[3],q[29];
-cx q[3],q[30];
-rx(1.0053164350407748) q[29];
-rz(1.0257962109503498) q[30];
-cx q[3],q[30];
-cx q[3],q[34];
-cx q[18],q[30];
-rz(1.0257962109503498) q[30];
-cx q[18],q[30];
-rx(1.0053164350407748) q[18];
-rz(1.0257962109503498) q[31];
-cx q[12],q[31];
-cx q[26],q[31];
-rz(1.0257962109503498) q[31];
-cx q[26],q[31];
-rx(1.0053164350407748) q[26];
-rx(1.0053164350407748) q[31];
-rz(1.0257962109503498) q[32];
-cx q[21],q[32];
-rz(1.0257962109503498) q[33];
-cx q[5],q[33];
-cx q[30],q[33];
-rz(1.0257962109503498) q[33];
-cx q[30],q[33];
-rx(1.0053164350407748) q[30];
-rx(1.0053164350407748) q[33];
-rz(1.0257962109503498) q[34];
-cx q[3],q[34];
-cx q[3],q[35];
-cx q[12],q[34];
-rz(1.0257962109503498) q[34];
-cx q[12],q[34];
-rz(1.0257962109503498) q[35];
-cx q[3],q[35];
-cx q[3],q[39];
-cx q[32],q[35];
-rz(1.0257962109503498) q[35];
-cx q[32],q[35];
-rx(1.0053164350407748) q[32];
-rx(1.0053164350407748) q[35];
-rz(1.0257962109503498) q[36];
-cx q[15],q[36];
-rx(1.0053164350407748) q[15];
-cx q[20],q[36];
-rz(1.0257962109503498) q[36];
-cx q[20],q[36];
-rx(1.0053164350407748) q[36];
-rz(1.0257962109503498) q[37];
-cx q[10],q[37];
-cx q[10],q[41];
-cx q[34],q[37];
-rz(1.0257962109503498) q[37];
-cx q[34],q[37];
-rx(1.0053164350407748) q[34];
-rx(1.0053164350407748) q[37];
-cx q[38],q[46];
-rz(1.0257962109503498) q[39];
-cx q[3],q[39];
-cx q[3],q[40];
-cx q[13],q[39];
-rz(1.0257962109503498) q[39];
-cx q[13],q[39];
-rx(1.0053164350407748) q[13];
-rx(1.0053164350407748) q[39];
-rz(1.0257962109503498) q[40];
-cx q[3],q[40];
-cx q[3],q[42];
-cx q[23],q[40];
-rz(1.0257962109503498) q[40];
-cx q[23],q[40];
-rx(1.0053164350407748) q[23];
-rx(1.0053164350407748) q[40];
-rz(1.0257962109503498) q[41];
-cx q[10],q[41];
-rx(1.0053164350407748) q[10];
-cx q[27],q[41];
-rz(1.0257962109503498) q[41];
-cx q[27],q[41];
-rx(1.0053164350407748) q[27];
-rx(1.0053164350407748) q[41];
-rz(1.0257962109503498) q[42];
-cx q[3],q[42];
-cx q[3],q[43];
-rx(1.0053164350407748) q[42];
-rz(1.0257962109503498) q[43];
-cx q[3],q[43];
-cx q[3],q[44];
-cx q[20],q[43];
-rz(1.0257962109503498) q[43];
-cx q[20],q[43];
-rx(1.0053164350407748) q[20];
-rx(1.0053164350407748) q[43];
-rz(1.0257962109503498) q[44];
-cx q[3],q[44];
-rx(1.0053164350407748) q[3];
-cx q[12],q[44];
-rz(1.0257962109503498) q[44];
-cx q[12],q[44];
-rx(1.0053164350407748) q[12];
-rx(1.0053164350407748) q[44];
-rz(1.0257962109503498) q[45];
-cx q[1],q[45];
-rx(1.0053164350407748) q[1];
-cx q[0],q[1];
-rz(4.962529594138638) q[1];
-cx q[0],q[1];
-cx q[0],q[2];
-rz(4.962529594138638) q[2];
-cx q[0],q[2];
-cx q[0],q[3];
-rx(5.586831630650752) q[2];
-rz(4.962529594138638) q[3];
-cx q[0],q[3];
-cx q[0],q[15];
-cx q[1],q[3];
-rz(4.962529594138638) q[3];
-cx q[1],q[3];
-cx q[1],q[4];
-rz(4.962529594138638) q[4];
-cx q[1],q[4];
-cx q[3],q[4];
-rz(4.962529594138638) q[4];
-cx q[3],q[4];
-cx q[4],q[6];
-rz(4.962529594138638) q[6];
-cx q[4],q[6];
-rz(4.962529594138638) q[15];
-cx q[0],q[15];
-cx q[16],q[45];
-rz(1.0257962109503498) q[45];
-cx q[16],q[45];
-rx(1.0053164350407748) q[16];
-cx q[0],q[16];
-rz(4.962529594138638) q[16];
-cx q[0],q[16];
-cx q[0],q[20];
-rz(4.962529594138638) q[20];
-cx q[0],q[20];
-cx q[0],q[32];
-rz(4.962529594138638) q[32];
-cx q[0],q[32];
-cx q[0],q[42];
-rz(4.962529594138638) q[42];
-cx q[0],q[42];
-rx(5.586831630650752) q[0];
-rx(1.0053164350407748) q[45];
-rz(4.778798713907163) q[46];
-cx q[38],q[46];
-rx(8.328197694850846) q[38];
-cx q[19],q[38];
-rz(1.0257962109503498) q[38];
-cx q[19],q[38];
-rx(1.0053164350407748) q[19];
-cx q[21],q[38];
-rz(1.0257962109503498) q[38];
-cx q[21],q[38];
-rx(1.0053164350407748) q[21];
-rx(8.328197694850846) q[46];
-cx q[5],q[46];
-rz(1.0257962109503498) q[46];
-cx q[5],q[46];
-rx(1.0053164350407748) q[5];
-cx q[1],q[5];
-rz(4.962529594138638) q[5];
-cx q[1],q[5];
-cx q[1],q[9];
-cx q[3],q[5];
-rz(4.962529594138638) q[5];
-cx q[3],q[5];
-cx q[3],q[7];
-cx q[5],q[6];
-rz(4.962529594138638) q[6];
-cx q[5],q[6];
-rz(4.962529594138638) q[7];
-cx q[3],q[7];
-cx q[3],q[8];
-cx q[4],q[7];
-rz(4.962529594138638) q[7];
-cx q[4],q[7];
-cx q[4],q[10];
-rz(4.962529594138638) q[8];
-cx q[3],q[8];
-cx q[5],q[8];
-rz(4.962529594138638) q[8];
-cx q[5],q[8];
-cx q[5],q[11];
-rx(5.586831630650752) q[8];
-rz(4.962529594138638) q[9];
-cx q[1],q[9];
-cx q[1],q[17];
-cx q[3],q[9];
-rz(4.962529594138638) q[9];
-cx q[3],q[9];
-cx q[3],q[12];
-rz(4.962529594138638) q[10];
-cx q[4],q[10];
-cx q[4],q[13];
-cx q[6],q[10];
-rz(4.962529594138638) q[10];
-cx q[6],q[10];
-cx q[10],q[37];
-rz(4.962529594138638) q[11];
-cx q[5],q[11];
-cx q[6],q[11];
-rz(4.962529594138638) q[11];
-cx q[6],q[11];
-rx(5.586831630650752) q[11];
-rz(4.962529594138638) q[12];
-cx q[3],q[12];
-cx q[3],q[14];
-cx q[5],q[12];
-rz(4.962529594138638) q[12];
-cx q[5],q[12];
-rz(4.962529594138638) q[13];
-cx q[4],q[13];
-cx q[5],q[13];
-rz(4.962529594138638) q[13];
-cx q[5],q[13];
-rz(4.962529594138638) q[14];
-cx q[3],q[14];
-cx q[3],q[15];
-cx q[4],q[14];
-rz(4.962529594138638) q[14];
-cx q[4],q[14];
-rx(5.586831630650752) q[14];
-rz(4.962529594138638) q[15];
-cx q[3],q[15];
-cx q[3],q[16];
-cx q[15],q[20];
-rz(4.962529594138638) q[16];
-cx q[3],q[16];
-rz(4.962529594138638) q[17];
-cx q[1],q[17];
-cx q[1],q[28];
-cx q[3],q[17];
-rz(4.962529594138638) q[17];
-cx q[3],q[17];
-cx q[3],q[18];
-rz(4.962529594138638) q[18];
-cx q[3],q[18];
-cx q[3],q[19];
-cx q[4],q[18];
-rz(4.962529594138638) q[18];
-cx q[4],q[18];
-cx q[4],q[21];
-rz(4.962529594138638) q[19];
-cx q[3],q[19];
-cx q[3],q[22];
-cx q[7],q[19];
-rz(4.962529594138638) q[19];
-cx q[7],q[19];
-rx(5.586831630650752) q[7];
-rz(4.962529594138638) q[20];
-cx q[15],q[20];
-rz(4.962529594138638) q[21];
-cx q[4],q[21];
-cx q[4],q[27];
-cx q[15],q[21];
-rz(4.962529594138638) q[21];
-cx q[15],q[21];
-cx q[15],q[36];
-rz(4.962529594138638) q[22];
-cx q[3],q[22];
-cx q[3],q[23];
-cx q[9],q[22];
-rz(4.962529594138638) q[22];
-cx q[9],q[22];
-rx(5.586831630650752) q[9];
-rx(5.586831630650752) q[22];
-rz(4.962529594138638) q[23];
-cx q[3],q[23];
-cx q[3],q[24];
-cx q[17],q[23];
-rz(4.962529594138638) q[23];
-cx q[17],q[23];
-rx(5.586831630650752) q[17];
-rz(4.962529594138638) q[24];
-cx q[3],q[24];
-cx q[3],q[25];
-cx q[5],q[24];
-rz(4.962529594138638) q[24];
-cx q[5],q[24];
-cx q[5],q[33];
-rx(5.586831630650752) q[24];
-rz(4.962529594138638) q[25];
-cx q[3],q[25];
-cx q[3],q[26];
-cx q[12],q[25];
-rz(4.962529594138638) q[25];
-cx q[12],q[25];
-cx q[12],q[31];
-rx(5.586831630650752) q[25];
-rz(4.962529594138638) q[26];
-cx q[3],q[26];
-cx q[21],q[26];
-rz(4.962529594138638) q[26];
-cx q[21],q[26];
-cx q[21],q[32];
-rz(4.962529594138638) q[27];
-cx q[4],q[27];
-rx(5.586831630650752) q[4];
-cx q[6],q[27];
-rz(4.962529594138638) q[27];
-cx q[6],q[27];
-rx(5.586831630650752) q[6];
-rz(4.962529594138638) q[28];
-cx q[1],q[28];
-cx q[1],q[29];
-cx q[3],q[28];
-rz(4.962529594138638) q[28];
-cx q[3],q[28];
-rx(5.586831630650752) q[28];
-rz(4.962529594138638) q[29];
-cx q[1],q[29];
-cx q[1],q[45];
-cx q[3],q[29];
-rz(4.962529594138638) q[29];
-cx q[3],q[29];
-cx q[3],q[30];
-rx(5.586831630650752) q[29];
-rz(4.962529594138638) q[30];
-cx q[3],q[30];
-cx q[3],q[34];
-cx q[18],q[30];
-rz(4.962529594138638) q[30];
-cx q[18],q[30];
-rx(5.586831630650752) q[18];
-rz(4.962529594138638) q[31];
-cx q[12],q[31];
-cx q[26],q[31];
-rz(4.962529594138638) q[31];
-cx q[26],q[31];
-rx(5.586831630650752) q[26];
-rx(5.586831630650752) q[31];
-rz(4.962529594138638) q[32];
-cx q[21],q[32];
-rz(4.962529594138638) q[33];
-cx q[5],q[33];
-cx q[30],q[33];
-rz(4.962529594138638) q[33];
-cx q[30],q[33];
-rx(5.586831630650752) q[30];
-rx(5.586831630650752) q[33];
-rz(4.962529594138638) q[34];
-cx q[3],q[34];
-cx q[3],q[35];
-cx q[12],q[34];
-rz(4.962529594138638) q[34];
-cx q[12],q[34];
-rz(4.962529594138638) q[35];
-cx q[3],q[35];
-cx q[3],q[39];
-cx q[32],q[35];
-rz(4.962529594138638) q[35];
-cx q[32],q[35];
-rx(5.586831630650752) q[32];
-rx(5.586831630650752) q[35];
-rz(4.962529594138638) q[36];
-cx q[15],q[36];
-rx(5.586831630650752) q[15];
-cx q[20],q[36];
-rz(4.962529594138638) q[36];
-cx q[20],q[36];
-rx(5.586831630650752) q[36];
-rz(4.962529594138638) q[37];
-cx q[10],q[37];
-cx q[10],q[41];
-cx q[34],q[37];
-rz(4.962529594138638) q[37];
-cx q[34],q[37];
-rx(5.586831630650752) q[34];
-rx(5.586831630650752) q[37];
-cx q[38],q[46];
-rz(4.962529594138638) q[39];
-cx q[3],q[39];
-cx q[3],q[40];
-cx q[13],q[39];
-rz(4.962529594138638) q[39];
-cx q[13],q[39];
-rx(5.586831630650752) q[13];
-rx(5.586831630650752) q[39];
-rz(4.962529594138638) q[40];
-cx q[3],q[40];
-cx q[3],q[42];
-cx q[23],q[40];
-rz(4.962529594138638) q[40];
-cx q[23],q[40];
-rx(5.586831630650752) q[23];
-rx(5.586831630650752) q[40];
-rz(4.962529594138638) q[41];
-cx q[10],q[41];
-rx(5.586831630650752) q[10];
-cx q[27],q[41];
-rz(4.962529594138638) q[41];
-cx q[27],q[41];
-rx(5.586831630650752) q[27];
-rx(5.586831630650752) q[41];
-rz(4.962529594138638) q[42];
-cx q[3],q[42];
-cx q[3],q[43];
-rx(5.586831630650752) q[42];
-rz(4.962529594138638) q[43];
-cx q[3],q[43];
-cx q[3],q[44];
-cx q[20],q[43];
-rz(4.962529594138638) q[43];
-cx q[20],q[43];
-rx(5.586831630650752) q[20];
-rx(5.586831630650752) q[43];
-rz(4.962529594138638) q[44];
-cx q[3],q[44];
-rx(5.586831630650752) q[3];
-cx q[12],q[44];
-rz(4.962529594138638) q[44];
-cx q[12],q[44];
-rx(5.586831630650752) q[12];
-rx(5.586831630650752) q[44];
-rz(4.962529594138638) q[45];
-cx q[1],q[45];
-rx(5.586831630650752) q[1];
-cx q[16],q[45];
-rz(4.962529594138638) q[45];
-cx q[16],q[45];
-rx(5.586831630650752) q[16];
-rx(5.586831630650752) q[45];
-rz(1.0257962109503498) q[46];
-cx q[38],q[46];
-rx(1.0053164350407748) q[38];
-cx q[19],q[38];
-rz(4.962529594138638) q[38];
-cx q[19],q[38];
-rx(5.586831630650752) q[19];
-cx q[21],q[38];
-rz(4.962529594138638) q[38];
-cx q[21],q[38];
-rx(5.586831630650752) q[21];
-rx(1.0053164350407748) q[46];
-cx q[5],q[46];
-rz(4.962529594138638) q[46];
-cx q[5],q[46];
-rx(5.586831630650752) q[5];
-cx q[38],q[46];
-rz(4.962529594138638) q[46];
-cx q[38],q[46];
-rx(5.586831630650752) q[38];
-rx(5.586831630650752) q[46];
\ No newline at end of file
@@ -1,1071 +0,0 @@
-OPENQASM 2.0;
-include "qelib1.inc";
-qreg q[48];
-ry(pi/2) q[0];
-rx(pi) q[0];
-ry(pi/2) q[1];
-rx(pi) q[1];
-cx q[0],q[1];
-rz(1.0843850228648324) q[1];
-cx q[0],q[1];
-ry(pi/2) q[2];
-rx(pi) q[2];
-cx q[0],q[2];
-rz(1.0843850228648324) q[2];
-cx q[0],q[2];
-rx(6.8330547512864515) q[2];
-ry(pi/2) q[3];
-rx(pi) q[3];
-cx q[0],q[3];
-rz(1.0843850228648324) q[3];
-cx q[0],q[3];
-cx q[1],q[3];
-rz(1.0843850228648324) q[3];
-cx q[1],q[3];
-ry(pi/2) q[4];
-rx(pi) q[4];
-cx q[1],q[4];
-rz(1.0843850228648324) q[4];
-cx q[1],q[4];
-cx q[3],q[4];
-rz(1.0843850228648324) q[4];
-cx q[3],q[4];
-ry(pi/2) q[5];
-rx(pi) q[5];
-cx q[1],q[5];
-rz(1.0843850228648324) q[5];
-cx q[1],q[5];
-cx q[3],q[5];
-rz(1.0843850228648324) q[5];
-cx q[3],q[5];
-ry(pi/2) q[6];
-rx(pi) q[6];
-cx q[4],q[6];
-rz(1.0843850228648324) q[6];
-cx q[4],q[6];
-cx q[5],q[6];
-rz(1.0843850228648324) q[6];
-cx q[5],q[6];
-ry(pi/2) q[7];
-rx(pi) q[7];
-cx q[3],q[7];
-rz(1.0843850228648324) q[7];
-cx q[3],q[7];
-cx q[4],q[7];
-rz(1.0843850228648324) q[7];
-cx q[4],q[7];
-ry(pi/2) q[8];
-rx(pi) q[8];
-cx q[3],q[8];
-rz(1.0843850228648324) q[8];
-cx q[3],q[8];
-cx q[5],q[8];
-rz(1.0843850228648324) q[8];
-cx q[5],q[8];
-rx(6.8330547512864515) q[8];
-ry(pi/2) q[9];
-rx(pi) q[9];
-cx q[1],q[9];
-rz(1.0843850228648324) q[9];
-cx q[1],q[9];
-cx q[3],q[9];
-rz(1.0843850228648324) q[9];
-cx q[3],q[9];
-ry(pi/2) q[10];
-rx(pi) q[10];
-cx q[4],q[10];
-rz(1.0843850228648324) q[10];
-cx q[4],q[10];
-cx q[6],q[10];
-rz(1.0843850228648324) q[10];
-cx q[6],q[10];
-ry(pi/2) q[11];
-rx(pi) q[11];
-cx q[5],q[11];
-rz(1.0843850228648324) q[11];
-cx q[5],q[11];
-cx q[6],q[11];
-rz(1.0843850228648324) q[11];
-cx q[6],q[11];
-rx(6.8330547512864515) q[11];
-ry(pi/2) q[12];
-rx(pi) q[12];
-cx q[3],q[12];
-rz(1.0843850228648324) q[12];
-cx q[3],q[12];
-cx q[5],q[12];
-rz(1.0843850228648324) q[12];
-cx q[5],q[12];
-ry(pi/2) q[13];
-rx(pi) q[13];
-cx q[4],q[13];
-rz(1.0843850228648324) q[13];
-cx q[4],q[13];
-cx q[5],q[13];
-rz(1.0843850228648324) q[13];
-cx q[5],q[13];
-ry(pi/2) q[14];
-rx(pi) q[14];
-cx q[3],q[14];
-rz(1.0843850228648324) q[14];
-cx q[3],q[14];
-cx q[4],q[14];
-rz(1.0843850228648324) q[14];
-cx q[4],q[14];
-rx(6.8330547512864515) q[14];
-ry(pi/2) q[15];
-rx(pi) q[15];
-cx q[0],q[15];
-rz(1.0843850228648324) q[15];
-cx q[0],q[15];
-cx q[3],q[15];
-rz(1.0843850228648324) q[15];
-cx q[3],q[15];
-ry(pi/2) q[16];
-rx(pi) q[16];
-cx q[0],q[16];
-rz(1.0843850228648324) q[16];
-cx q[0],q[16];
-cx q[3],q[16];
-rz(1.0843850228648324) q[16];
-cx q[3],q[16];
-ry(pi/2) q[17];
-rx(pi) q[17];
-cx q[1],q[17];
-rz(1.0843850228648324) q[17];
-cx q[1],q[17];
-cx q[3],q[17];
-rz(1.0843850228648324) q[17];
-cx q[3],q[17];
-ry(pi/2) q[18];
-rx(pi) q[18];
-cx q[3],q[18];
-rz(1.0843850228648324) q[18];
-cx q[3],q[18];
-cx q[4],q[18];
-rz(1.0843850228648324) q[18];
-cx q[4],q[18];
-ry(pi/2) q[19];
-rx(pi) q[19];
-cx q[3],q[19];
-rz(1.0843850228648324) q[19];
-cx q[3],q[19];
-cx q[7],q[19];
-rz(1.0843850228648324) q[19];
-cx q[7],q[19];
-rx(6.8330547512864515) q[7];
-ry(pi/2) q[20];
-rx(pi) q[20];
-cx q[0],q[20];
-rz(1.0843850228648324) q[20];
-cx q[0],q[20];
-cx q[15],q[20];
-rz(1.0843850228648324) q[20];
-cx q[15],q[20];
-ry(pi/2) q[21];
-rx(pi) q[21];
-cx q[4],q[21];
-rz(1.0843850228648324) q[21];
-cx q[4],q[21];
-cx q[15],q[21];
-rz(1.0843850228648324) q[21];
-cx q[15],q[21];
-ry(pi/2) q[22];
-rx(pi) q[22];
-cx q[3],q[22];
-rz(1.0843850228648324) q[22];
-cx q[3],q[22];
-cx q[9],q[22];
-rz(1.0843850228648324) q[22];
-cx q[9],q[22];
-rx(6.8330547512864515) q[9];
-rx(6.8330547512864515) q[22];
-ry(pi/2) q[23];
-rx(pi) q[23];
-cx q[3],q[23];
-rz(1.0843850228648324) q[23];
-cx q[3],q[23];
-cx q[17],q[23];
-rz(1.0843850228648324) q[23];
-cx q[17],q[23];
-ry(pi/2) q[24];
-rx(pi) q[24];
-cx q[3],q[24];
-rz(1.0843850228648324) q[24];
-cx q[3],q[24];
-cx q[5],q[24];
-rz(1.0843850228648324) q[24];
-cx q[5],q[24];
-rx(6.8330547512864515) q[24];
-ry(pi/2) q[25];
-rx(pi) q[25];
-cx q[3],q[25];
-rz(1.0843850228648324) q[25];
-cx q[3],q[25];
-cx q[12],q[25];
-rz(1.0843850228648324) q[25];
-cx q[12],q[25];
-rx(6.8330547512864515) q[25];
-ry(pi/2) q[26];
-rx(pi) q[26];
-cx q[3],q[26];
-rz(1.0843850228648324) q[26];
-cx q[3],q[26];
-cx q[21],q[26];
-rz(1.0843850228648324) q[26];
-cx q[21],q[26];
-ry(pi/2) q[27];
-rx(pi) q[27];
-cx q[4],q[27];
-rz(1.0843850228648324) q[27];
-cx q[4],q[27];
-cx q[6],q[27];
-rz(1.0843850228648324) q[27];
-cx q[6],q[27];
-rx(6.8330547512864515) q[6];
-ry(pi/2) q[28];
-rx(pi) q[28];
-cx q[1],q[28];
-rz(1.0843850228648324) q[28];
-cx q[1],q[28];
-cx q[3],q[28];
-rz(1.0843850228648324) q[28];
-cx q[3],q[28];
-rx(6.8330547512864515) q[28];
-ry(pi/2) q[29];
-rx(pi) q[29];
-cx q[1],q[29];
-rz(1.0843850228648324) q[29];
-cx q[1],q[29];
-cx q[3],q[29];
-rz(1.0843850228648324) q[29];
-cx q[3],q[29];
-rx(6.8330547512864515) q[29];
-ry(pi/2) q[30];
-rx(pi) q[30];
-cx q[3],q[30];
-rz(1.0843850228648324) q[30];
-cx q[3],q[30];
-cx q[18],q[30];
-rz(1.0843850228648324) q[30];
-cx q[18],q[30];
-rx(6.8330547512864515) q[18];
-ry(pi/2) q[31];
-rx(pi) q[31];
-cx q[12],q[31];
-rz(1.0843850228648324) q[31];
-cx q[12],q[31];
-cx q[26],q[31];
-rz(1.0843850228648324) q[31];
-cx q[26],q[31];
-rx(6.8330547512864515) q[26];
-rx(6.8330547512864515) q[31];
-ry(pi/2) q[32];
-rx(pi) q[32];
-cx q[0],q[32];
-rz(1.0843850228648324) q[32];
-cx q[0],q[32];
-cx q[21],q[32];
-rz(1.0843850228648324) q[32];
-cx q[21],q[32];
-ry(pi/2) q[33];
-rx(pi) q[33];
-cx q[5],q[33];
-rz(1.0843850228648324) q[33];
-cx q[5],q[33];
-cx q[30],q[33];
-rz(1.0843850228648324) q[33];
-cx q[30],q[33];
-rx(6.8330547512864515) q[30];
-rx(6.8330547512864515) q[33];
-ry(pi/2) q[34];
-rx(pi) q[34];
-cx q[3],q[34];
-rz(1.0843850228648324) q[34];
-cx q[3],q[34];
-cx q[12],q[34];
-rz(1.0843850228648324) q[34];
-cx q[12],q[34];
-ry(pi/2) q[35];
-rx(pi) q[35];
-cx q[3],q[35];
-rz(1.0843850228648324) q[35];
-cx q[3],q[35];
-cx q[32],q[35];
-rz(1.0843850228648324) q[35];
-cx q[32],q[35];
-rx(6.8330547512864515) q[32];
-rx(6.8330547512864515) q[35];
-ry(pi/2) q[36];
-rx(pi) q[36];
-cx q[15],q[36];
-rz(1.0843850228648324) q[36];
-cx q[15],q[36];
-rx(6.8330547512864515) q[15];
-cx q[20],q[36];
-rz(1.0843850228648324) q[36];
-cx q[20],q[36];
-rx(6.8330547512864515) q[36];
-ry(pi/2) q[37];
-rx(pi) q[37];
-cx q[10],q[37];
-rz(1.0843850228648324) q[37];
-cx q[10],q[37];
-cx q[34],q[37];
-rz(1.0843850228648324) q[37];
-cx q[34],q[37];
-rx(6.8330547512864515) q[34];
-rx(6.8330547512864515) q[37];
-ry(pi/2) q[38];
-rx(pi) q[38];
-cx q[19],q[38];
-rz(1.0843850228648324) q[38];
-cx q[19],q[38];
-rx(6.8330547512864515) q[19];
-cx q[21],q[38];
-rz(1.0843850228648324) q[38];
-cx q[21],q[38];
-rx(6.8330547512864515) q[21];
-ry(pi/2) q[39];
-rx(pi) q[39];
-cx q[3],q[39];
-rz(1.0843850228648324) q[39];
-cx q[3],q[39];
-cx q[13],q[39];
-rz(1.0843850228648324) q[39];
-cx q[13],q[39];
-rx(6.8330547512864515) q[13];
-rx(6.8330547512864515) q[39];
-ry(pi/2) q[40];
-rx(pi) q[40];
-cx q[3],q[40];
-rz(1.0843850228648324) q[40];
-cx q[3],q[40];
-cx q[23],q[40];
-rz(1.0843850228648324) q[40];
-cx q[23],q[40];
-rx(6.8330547512864515) q[23];
-rx(6.8330547512864515) q[40];
-ry(pi/2) q[41];
-rx(pi) q[41];
-cx q[10],q[41];
-rz(1.0843850228648324) q[41];
-cx q[10],q[41];
-rx(6.8330547512864515) q[10];
-cx q[27],q[41];
-rz(1.0843850228648324) q[41];
-cx q[27],q[41];
-rx(6.8330547512864515) q[27];
-rx(6.8330547512864515) q[41];
-ry(pi/2) q[42];
-rx(pi) q[42];
-cx q[0],q[42];
-rz(1.0843850228648324) q[42];
-cx q[0],q[42];
-rx(6.8330547512864515) q[0];
-cx q[3],q[42];
-rz(1.0843850228648324) q[42];
-cx q[3],q[42];
-rx(6.8330547512864515) q[42];
-ry(pi/2) q[43];
-rx(pi) q[43];
-cx q[3],q[43];
-rz(1.0843850228648324) q[43];
-cx q[3],q[43];
-cx q[20],q[43];
-rz(1.0843850228648324) q[43];
-cx q[20],q[43];
-rx(6.8330547512864515) q[20];
-rx(6.8330547512864515) q[43];
-ry(pi/2) q[44];
-rx(pi) q[44];
-cx q[3],q[44];
-rz(1.0843850228648324) q[44];
-cx q[3],q[44];
-rx(6.8330547512864515) q[3];
-cx q[12],q[44];
-rz(1.0843850228648324) q[44];
-cx q[12],q[44];
-rx(6.8330547512864515) q[12];
-rx(6.8330547512864515) q[44];
-ry(pi/2) q[45];
-rx(pi) q[45];
-cx q[1],q[45];
-rz(1.0843850228648324) q[45];
-cx q[1],q[45];
-rx(6.8330547512864515) q[1];
-cx q[0],q[1];
-rz(5.139991931142516) q[1];
-cx q[0],q[1];
-cx q[0],q[2];
-rz(5.139991931142516) q[2];
-cx q[0],q[2];
-cx q[0],q[3];
-rx(5.941182099109104) q[2];
-rz(5.139991931142516) q[3];
-cx q[0],q[3];
-cx q[0],q[15];
-cx q[1],q[3];
-rz(5.139991931142516) q[3];
-cx q[1],q[3];
-rz(5.139991931142516) q[15];
-cx q[0],q[15];
-cx q[16],q[45];
-rz(1.0843850228648324) q[45];
-cx q[16],q[45];
-rx(6.8330547512864515) q[16];
-cx q[0],q[16];
-rz(5.139991931142516) q[16];
-cx q[0],q[16];
-cx q[0],q[20];
-rz(5.139991931142516) q[20];
-cx q[0],q[20];
-cx q[0],q[32];
-rz(5.139991931142516) q[32];
-cx q[0],q[32];
-cx q[0],q[42];
-rz(5.139991931142516) q[42];
-cx q[0],q[42];
-rx(5.941182099109104) q[0];
-rx(6.8330547512864515) q[45];
-ry(pi/2) q[46];
-rx(pi) q[46];
-cx q[5],q[46];
-rz(1.0843850228648324) q[46];
-cx q[5],q[46];
-rx(6.8330547512864515) q[5];
-cx q[38],q[46];
-rz(1.0843850228648324) q[46];
-cx q[38],q[46];
-rx(6.8330547512864515) q[38];
-rx(6.8330547512864515) q[46];
-ry(pi/2) q[47];
-rx(pi) q[47];
-cx q[4],q[47];
-rz(1.0843850228648324) q[47];
-cx q[4],q[47];
-rx(6.8330547512864515) q[4];
-cx q[1],q[4];
-rz(5.139991931142516) q[4];
-cx q[1],q[4];
-cx q[1],q[5];
-cx q[3],q[4];
-rz(5.139991931142516) q[4];
-cx q[3],q[4];
-cx q[4],q[6];
-rz(5.139991931142516) q[5];
-cx q[1],q[5];
-cx q[1],q[9];
-cx q[3],q[5];
-rz(5.139991931142516) q[5];
-cx q[3],q[5];
-cx q[3],q[7];
-rz(5.139991931142516) q[6];
-cx q[4],q[6];
-cx q[5],q[6];
-rz(5.139991931142516) q[6];
-cx q[5],q[6];
-rz(5.139991931142516) q[7];
-cx q[3],q[7];
-cx q[3],q[8];
-cx q[4],q[7];
-rz(5.139991931142516) q[7];
-cx q[4],q[7];
-cx q[4],q[10];
-rz(5.139991931142516) q[8];
-cx q[3],q[8];
-cx q[5],q[8];
-rz(5.139991931142516) q[8];
-cx q[5],q[8];
-cx q[5],q[11];
-rx(5.941182099109104) q[8];
-rz(5.139991931142516) q[9];
-cx q[1],q[9];
-cx q[3],q[9];
-rz(5.139991931142516) q[9];
-cx q[3],q[9];
-cx q[3],q[12];
-rz(5.139991931142516) q[10];
-cx q[4],q[10];
-cx q[4],q[13];
-cx q[6],q[10];
-rz(5.139991931142516) q[10];
-cx q[6],q[10];
-cx q[10],q[37];
-rz(5.139991931142516) q[11];
-cx q[5],q[11];
-cx q[6],q[11];
-rz(5.139991931142516) q[11];
-cx q[6],q[11];
-rx(5.941182099109104) q[11];
-rz(5.139991931142516) q[12];
-cx q[3],q[12];
-cx q[3],q[14];
-cx q[5],q[12];
-rz(5.139991931142516) q[12];
-cx q[5],q[12];
-rz(5.139991931142516) q[13];
-cx q[4],q[13];
-cx q[5],q[13];
-rz(5.139991931142516) q[13];
-cx q[5],q[13];
-rz(5.139991931142516) q[14];
-cx q[3],q[14];
-cx q[3],q[15];
-cx q[4],q[14];
-rz(5.139991931142516) q[14];
-cx q[4],q[14];
-rx(5.941182099109104) q[14];
-rz(5.139991931142516) q[15];
-cx q[3],q[15];
-cx q[3],q[16];
-cx q[15],q[20];
-rz(5.139991931142516) q[16];
-cx q[3],q[16];
-cx q[17],q[47];
-rz(5.139991931142516) q[20];
-cx q[15],q[20];
-rz(5.139991931142516) q[37];
-cx q[10],q[37];
-cx q[10],q[41];
-rz(5.139991931142516) q[41];
-cx q[10],q[41];
-rx(5.941182099109104) q[10];
-rz(1.0843850228648324) q[47];
-cx q[17],q[47];
-rx(6.8330547512864515) q[17];
-cx q[1],q[17];
-rz(5.139991931142516) q[17];
-cx q[1],q[17];
-cx q[1],q[28];
-cx q[3],q[17];
-rz(5.139991931142516) q[17];
-cx q[3],q[17];
-cx q[3],q[18];
-rz(5.139991931142516) q[18];
-cx q[3],q[18];
-cx q[3],q[19];
-cx q[4],q[18];
-rz(5.139991931142516) q[18];
-cx q[4],q[18];
-cx q[4],q[21];
-rz(5.139991931142516) q[19];
-cx q[3],q[19];
-cx q[3],q[22];
-cx q[7],q[19];
-rz(5.139991931142516) q[19];
-cx q[7],q[19];
-rx(5.941182099109104) q[7];
-cx q[19],q[38];
-rz(5.139991931142516) q[21];
-cx q[4],q[21];
-cx q[4],q[27];
-cx q[15],q[21];
-rz(5.139991931142516) q[21];
-cx q[15],q[21];
-cx q[15],q[36];
-rz(5.139991931142516) q[22];
-cx q[3],q[22];
-cx q[3],q[23];
-cx q[9],q[22];
-rz(5.139991931142516) q[22];
-cx q[9],q[22];
-rx(5.941182099109104) q[9];
-rx(5.941182099109104) q[22];
-rz(5.139991931142516) q[23];
-cx q[3],q[23];
-cx q[3],q[24];
-cx q[17],q[23];
-rz(5.139991931142516) q[23];
-cx q[17],q[23];
-rz(5.139991931142516) q[24];
-cx q[3],q[24];
-cx q[3],q[25];
-cx q[5],q[24];
-rz(5.139991931142516) q[24];
-cx q[5],q[24];
-cx q[5],q[33];
-rx(5.941182099109104) q[24];
-rz(5.139991931142516) q[25];
-cx q[3],q[25];
-cx q[3],q[26];
-cx q[12],q[25];
-rz(5.139991931142516) q[25];
-cx q[12],q[25];
-cx q[12],q[31];
-rx(5.941182099109104) q[25];
-rz(5.139991931142516) q[26];
-cx q[3],q[26];
-cx q[21],q[26];
-rz(5.139991931142516) q[26];
-cx q[21],q[26];
-cx q[21],q[32];
-rz(5.139991931142516) q[27];
-cx q[4],q[27];
-cx q[6],q[27];
-rz(5.139991931142516) q[27];
-cx q[6],q[27];
-rx(5.941182099109104) q[6];
-cx q[27],q[41];
-rz(5.139991931142516) q[28];
-cx q[1],q[28];
-cx q[1],q[29];
-cx q[3],q[28];
-rz(5.139991931142516) q[28];
-cx q[3],q[28];
-rx(5.941182099109104) q[28];
-rz(5.139991931142516) q[29];
-cx q[1],q[29];
-cx q[1],q[45];
-cx q[3],q[29];
-rz(5.139991931142516) q[29];
-cx q[3],q[29];
-cx q[3],q[30];
-rx(5.941182099109104) q[29];
-rz(5.139991931142516) q[30];
-cx q[3],q[30];
-cx q[3],q[34];
-cx q[18],q[30];
-rz(5.139991931142516) q[30];
-cx q[18],q[30];
-rx(5.941182099109104) q[18];
-rz(5.139991931142516) q[31];
-cx q[12],q[31];
-cx q[26],q[31];
-rz(5.139991931142516) q[31];
-cx q[26],q[31];
-rx(5.941182099109104) q[26];
-rx(5.941182099109104) q[31];
-rz(5.139991931142516) q[32];
-cx q[21],q[32];
-rz(5.139991931142516) q[33];
-cx q[5],q[33];
-cx q[5],q[46];
-cx q[30],q[33];
-rz(5.139991931142516) q[33];
-cx q[30],q[33];
-rx(5.941182099109104) q[30];
-rx(5.941182099109104) q[33];
-rz(5.139991931142516) q[34];
-cx q[3],q[34];
-cx q[3],q[35];
-cx q[12],q[34];
-rz(5.139991931142516) q[34];
-cx q[12],q[34];
-cx q[34],q[37];
-rz(5.139991931142516) q[35];
-cx q[3],q[35];
-cx q[3],q[39];
-cx q[32],q[35];
-rz(5.139991931142516) q[35];
-cx q[32],q[35];
-rx(5.941182099109104) q[32];
-rx(5.941182099109104) q[35];
-rz(5.139991931142516) q[36];
-cx q[15],q[36];
-rx(5.941182099109104) q[15];
-cx q[20],q[36];
-rz(5.139991931142516) q[36];
-cx q[20],q[36];
-rx(5.941182099109104) q[36];
-rz(5.139991931142516) q[37];
-cx q[34],q[37];
-rx(5.941182099109104) q[34];
-rx(5.941182099109104) q[37];
-rz(5.139991931142516) q[38];
-cx q[19],q[38];
-rx(5.941182099109104) q[19];
-cx q[21],q[38];
-rz(5.139991931142516) q[38];
-cx q[21],q[38];
-rx(5.941182099109104) q[21];
-rz(5.139991931142516) q[39];
-cx q[3],q[39];
-cx q[3],q[40];
-cx q[13],q[39];
-rz(5.139991931142516) q[39];
-cx q[13],q[39];
-rx(5.941182099109104) q[13];
-rx(5.941182099109104) q[39];
-rz(5.139991931142516) q[40];
-cx q[3],q[40];
-cx q[3],q[42];
-cx q[23],q[40];
-rz(5.139991931142516) q[40];
-cx q[23],q[40];
-rx(5.941182099109104) q[23];
-rx(5.941182099109104) q[40];
-rz(5.139991931142516) q[41];
-cx q[27],q[41];
-rx(5.941182099109104) q[27];
-rx(5.941182099109104) q[41];
-rz(5.139991931142516) q[42];
-cx q[3],q[42];
-cx q[3],q[43];
-rx(5.941182099109104) q[42];
-rz(5.139991931142516) q[43];
-cx q[3],q[43];
-cx q[3],q[44];
-cx q[20],q[43];
-rz(5.139991931142516) q[43];
-cx q[20],q[43];
-rx(5.941182099109104) q[20];
-rx(5.941182099109104) q[43];
-rz(5.139991931142516) q[44];
-cx q[3],q[44];
-rx(5.941182099109104) q[3];
-cx q[12],q[44];
-rz(5.139991931142516) q[44];
-cx q[12],q[44];
-rx(5.941182099109104) q[12];
-rx(5.941182099109104) q[44];
-rz(5.139991931142516) q[45];
-cx q[1],q[45];
-rx(5.941182099109104) q[1];
-cx q[0],q[1];
-rz(4.252055950981468) q[1];
-cx q[0],q[1];
-cx q[0],q[2];
-rz(4.252055950981468) q[2];
-cx q[0],q[2];
-cx q[0],q[3];
-rx(10.15615426210302) q[2];
-rz(4.252055950981468) q[3];
-cx q[0],q[3];
-cx q[0],q[15];
-cx q[1],q[3];
-rz(4.252055950981468) q[3];
-cx q[1],q[3];
-rz(4.252055950981468) q[15];
-cx q[0],q[15];
-cx q[16],q[45];
-rz(5.139991931142516) q[45];
-cx q[16],q[45];
-rx(5.941182099109104) q[16];
-cx q[0],q[16];
-rz(4.252055950981468) q[16];
-cx q[0],q[16];
-cx q[0],q[20];
-rz(4.252055950981468) q[20];
-cx q[0],q[20];
-cx q[0],q[32];
-rz(4.252055950981468) q[32];
-cx q[0],q[32];
-cx q[0],q[42];
-rz(4.252055950981468) q[42];
-cx q[0],q[42];
-rx(10.15615426210302) q[0];
-rx(5.941182099109104) q[45];
-rz(5.139991931142516) q[46];
-cx q[5],q[46];
-rx(5.941182099109104) q[5];
-cx q[38],q[46];
-rz(5.139991931142516) q[46];
-cx q[38],q[46];
-rx(5.941182099109104) q[38];
-rx(5.941182099109104) q[46];
-rx(6.8330547512864515) q[47];
-cx q[4],q[47];
-rz(5.139991931142516) q[47];
-cx q[4],q[47];
-rx(5.941182099109104) q[4];
-cx q[1],q[4];
-rz(4.252055950981468) q[4];
-cx q[1],q[4];
-cx q[1],q[5];
-cx q[3],q[4];
-rz(4.252055950981468) q[4];
-cx q[3],q[4];
-cx q[4],q[6];
-rz(4.252055950981468) q[5];
-cx q[1],q[5];
-cx q[1],q[9];
-cx q[3],q[5];
-rz(4.252055950981468) q[5];
-cx q[3],q[5];
-cx q[3],q[7];
-rz(4.252055950981468) q[6];
-cx q[4],q[6];
-cx q[5],q[6];
-rz(4.252055950981468) q[6];
-cx q[5],q[6];
-rz(4.252055950981468) q[7];
-cx q[3],q[7];
-cx q[3],q[8];
-cx q[4],q[7];
-rz(4.252055950981468) q[7];
-cx q[4],q[7];
-cx q[4],q[10];
-rz(4.252055950981468) q[8];
-cx q[3],q[8];
-cx q[5],q[8];
-rz(4.252055950981468) q[8];
-cx q[5],q[8];
-cx q[5],q[11];
-rx(10.15615426210302) q[8];
-rz(4.252055950981468) q[9];
-cx q[1],q[9];
-cx q[3],q[9];
-rz(4.252055950981468) q[9];
-cx q[3],q[9];
-cx q[3],q[12];
-rz(4.252055950981468) q[10];
-cx q[4],q[10];
-cx q[4],q[13];
-cx q[6],q[10];
-rz(4.252055950981468) q[10];
-cx q[6],q[10];
-cx q[10],q[37];
-rz(4.252055950981468) q[11];
-cx q[5],q[11];
-cx q[6],q[11];
-rz(4.252055950981468) q[11];
-cx q[6],q[11];
-rx(10.15615426210302) q[11];
-rz(4.252055950981468) q[12];
-cx q[3],q[12];
-cx q[3],q[14];
-cx q[5],q[12];
-rz(4.252055950981468) q[12];
-cx q[5],q[12];
-rz(4.252055950981468) q[13];
-cx q[4],q[13];
-cx q[5],q[13];
-rz(4.252055950981468) q[13];
-cx q[5],q[13];
-rz(4.252055950981468) q[14];
-cx q[3],q[14];
-cx q[3],q[15];
-cx q[4],q[14];
-rz(4.252055950981468) q[14];
-cx q[4],q[14];
-rx(10.15615426210302) q[14];
-rz(4.252055950981468) q[15];
-cx q[3],q[15];
-cx q[3],q[16];
-cx q[15],q[20];
-rz(4.252055950981468) q[16];
-cx q[3],q[16];
-cx q[17],q[47];
-rz(4.252055950981468) q[20];
-cx q[15],q[20];
-rz(4.252055950981468) q[37];
-cx q[10],q[37];
-cx q[10],q[41];
-rz(4.252055950981468) q[41];
-cx q[10],q[41];
-rx(10.15615426210302) q[10];
-rz(5.139991931142516) q[47];
-cx q[17],q[47];
-rx(5.941182099109104) q[17];
-cx q[1],q[17];
-rz(4.252055950981468) q[17];
-cx q[1],q[17];
-cx q[1],q[28];
-cx q[3],q[17];
-rz(4.252055950981468) q[17];
-cx q[3],q[17];
-cx q[3],q[18];
-rz(4.252055950981468) q[18];
-cx q[3],q[18];
-cx q[3],q[19];
-cx q[4],q[18];
-rz(4.252055950981468) q[18];
-cx q[4],q[18];
-cx q[4],q[21];
-rz(4.252055950981468) q[19];
-cx q[3],q[19];
-cx q[3],q[22];
-cx q[7],q[19];
-rz(4.252055950981468) q[19];
-cx q[7],q[19];
-rx(10.15615426210302) q[7];
-cx q[19],q[38];
-rz(4.252055950981468) q[21];
-cx q[4],q[21];
-cx q[4],q[27];
-cx q[15],q[21];
-rz(4.252055950981468) q[21];
-cx q[15],q[21];
-cx q[15],q[36];
-rz(4.252055950981468) q[22];
-cx q[3],q[22];
-cx q[3],q[23];
-cx q[9],q[22];
-rz(4.252055950981468) q[22];
-cx q[9],q[22];
-rx(10.15615426210302) q[9];
-rx(10.15615426210302) q[22];
-rz(4.252055950981468) q[23];
-cx q[3],q[23];
-cx q[3],q[24];
-cx q[17],q[23];
-rz(4.252055950981468) q[23];
-cx q[17],q[23];
-rz(4.252055950981468) q[24];
-cx q[3],q[24];
-cx q[3],q[25];
-cx q[5],q[24];
-rz(4.252055950981468) q[24];
-cx q[5],q[24];
-cx q[5],q[33];
-rx(10.15615426210302) q[24];
-rz(4.252055950981468) q[25];
-cx q[3],q[25];
-cx q[3],q[26];
-cx q[12],q[25];
-rz(4.252055950981468) q[25];
-cx q[12],q[25];
-cx q[12],q[31];
-rx(10.15615426210302) q[25];
-rz(4.252055950981468) q[26];
-cx q[3],q[26];
-cx q[21],q[26];
-rz(4.252055950981468) q[26];
-cx q[21],q[26];
-cx q[21],q[32];
-rz(4.252055950981468) q[27];
-cx q[4],q[27];
-cx q[6],q[27];
-rz(4.252055950981468) q[27];
-cx q[6],q[27];
-rx(10.15615426210302) q[6];
-cx q[27],q[41];
-rz(4.252055950981468) q[28];
-cx q[1],q[28];
-cx q[1],q[29];
-cx q[3],q[28];
-rz(4.252055950981468) q[28];
-cx q[3],q[28];
-rx(10.15615426210302) q[28];
-rz(4.252055950981468) q[29];
-cx q[1],q[29];
-cx q[1],q[45];
-cx q[3],q[29];
-rz(4.252055950981468) q[29];
-cx q[3],q[29];
-cx q[3],q[30];
-rx(10.15615426210302) q[29];
-rz(4.252055950981468) q[30];
-cx q[3],q[30];
-cx q[3],q[34];
-cx q[18],q[30];
-rz(4.252055950981468) q[30];
-cx q[18],q[30];
-rx(10.15615426210302) q[18];
-rz(4.252055950981468) q[31];
-cx q[12],q[31];
-cx q[26],q[31];
-rz(4.252055950981468) q[31];
-cx q[26],q[31];
-rx(10.15615426210302) q[26];
-rx(10.15615426210302) q[31];
-rz(4.252055950981468) q[32];
-cx q[21],q[32];
-rz(4.252055950981468) q[33];
-cx q[5],q[33];
-cx q[5],q[46];
-cx q[30],q[33];
-rz(4.252055950981468) q[33];
-cx q[30],q[33];
-rx(10.15615426210302) q[30];
-rx(10.15615426210302) q[33];
-rz(4.252055950981468) q[34];
-cx q[3],q[34];
-cx q[3],q[35];
-cx q[12],q[34];
-rz(4.252055950981468) q[34];
-cx q[12],q[34];
-cx q[34],q[37];
-rz(4.252055950981468) q[35];
-cx q[3],q[35];
-cx q[3],q[39];
-cx q[32],q[35];
-rz(4.252055950981468) q[35];
-cx q[32],q[35];
-rx(10.15615426210302) q[32];
-rx(10.15615426210302) q[35];
-rz(4.252055950981468) q[36];
-cx q[15],q[36];
-rx(10.15615426210302) q[15];
-cx q[20],q[36];
-rz(4.252055950981468) q[36];
-cx q[20],q[36];
-rx(10.15615426210302) q[36];
-rz(4.252055950981468) q[37];
-cx q[34],q[37];
-rx(10.15615426210302) q[34];
-rx(10.15615426210302) q[37];
-rz(4.252055950981468) q[38];
-cx q[19],q[38];
-rx(10.15615426210302) q[19];
-cx q[21],q[38];
-rz(4.252055950981468) q[38];
-cx q[21],q[38];
-rx(10.15615426210302) q[21];
-rz(4.252055950981468) q[39];
-cx q[3],q[39];
-cx q[3],q[40];
-cx q[13],q[39];
-rz(4.252055950981468) q[39];
-cx q[13],q[39];
-rx(10.15615426210302) q[13];
-rx(10.15615426210302) q[39];
-rz(4.252055950981468) q[40];
-cx q[3],q[40];
-cx q[3],q[42];
-cx q[23],q[40];
-rz(4.252055950981468) q[40];
-cx q[23],q[40];
-rx(10.15615426210302) q[23];
-rx(10.15615426210302) q[40];
-rz(4.252055950981468) q[41];
-cx q[27],q[41];
-rx(10.15615426210302) q[27];
-rx(10.15615426210302) q[41];
-rz(4.252055950981468) q[42];
-cx q[3],q[42];
-cx q[3],q[43];
-rx(10.15615426210302) q[42];
-rz(4.252055950981468) q[43];
-cx q[3],q[43];
-cx q[3],q[44];
-cx q[20],q[43];
-rz(4.252055950981468) q[43];
-cx q[20],q[43];
-rx(10.15615426210302) q[20];
-rx(10.15615426210302) q[43];
-rz(4.252055950981468) q[44];
-cx q[3],q[44];
-rx(10.15615426210302) q[3];
-cx q[12],q[44];
-rz(4.252055950981468) q[44];
-cx q[12],q[44];
-rx(10.15615426210302) q[12];
-rx(10.15615426210302) q[44];
-rz(4.252055950981468) q[45];
-cx q[1],q[45];
-rx(10.15615426210302) q[1];
-cx q[16],q[45];
-rz(4.252055950981468) q[45];
-cx q[16],q[45];
-rx(10.15615426210302) q[16];
-rx(10.15615426210302) q[45];
-rz(4.252055950981468) q[46];
-cx q[5],q[46];
-rx(10.15615426210302) q[5];
-cx q[38],q[46];
-rz(4.252055950981468) q[46];
-cx q[38],q[46];
-rx(10.15615426210302) q[38];
-rx(10.15615426210302) q[46];
-rx(5.941182099109104) q[47];
-cx q[4],q[47];
-rz(4.252055950981468) q[47];
-cx q[4],q[47];
-rx(10.15615426210302) q[4];
-cx q[17],q[47];
-rz(4.252055950981468) q[47];
-cx q[17],q[47];
-rx(10.15615426210302) q[17];
-rx(10.15615426210302) q[47];
\ No newline at end of file
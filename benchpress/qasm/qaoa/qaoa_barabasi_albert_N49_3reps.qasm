@@ -1,1094 +0,0 @@
-OPENQASM 2.0;
-include "qelib1.inc";
-qreg q[49];
-ry(pi/2) q[0];
-rx(pi) q[0];
-ry(pi/2) q[1];
-rx(pi) q[1];
-cx q[0],q[1];
-rz(5.68208727936501) q[1];
-cx q[0],q[1];
-ry(pi/2) q[2];
-rx(pi) q[2];
-cx q[0],q[2];
-rz(5.68208727936501) q[2];
-cx q[0],q[2];
-rx(11.934800864728826) q[2];
-ry(pi/2) q[3];
-rx(pi) q[3];
-cx q[0],q[3];
-rz(5.68208727936501) q[3];
-cx q[0],q[3];
-cx q[1],q[3];
-rz(5.68208727936501) q[3];
-cx q[1],q[3];
-ry(pi/2) q[4];
-rx(pi) q[4];
-cx q[1],q[4];
-rz(5.68208727936501) q[4];
-cx q[1],q[4];
-cx q[3],q[4];
-rz(5.68208727936501) q[4];
-cx q[3],q[4];
-ry(pi/2) q[5];
-rx(pi) q[5];
-cx q[1],q[5];
-rz(5.68208727936501) q[5];
-cx q[1],q[5];
-cx q[3],q[5];
-rz(5.68208727936501) q[5];
-cx q[3],q[5];
-ry(pi/2) q[6];
-rx(pi) q[6];
-cx q[4],q[6];
-rz(5.68208727936501) q[6];
-cx q[4],q[6];
-cx q[5],q[6];
-rz(5.68208727936501) q[6];
-cx q[5],q[6];
-ry(pi/2) q[7];
-rx(pi) q[7];
-cx q[3],q[7];
-rz(5.68208727936501) q[7];
-cx q[3],q[7];
-cx q[4],q[7];
-rz(5.68208727936501) q[7];
-cx q[4],q[7];
-ry(pi/2) q[8];
-rx(pi) q[8];
-cx q[3],q[8];
-rz(5.68208727936501) q[8];
-cx q[3],q[8];
-cx q[5],q[8];
-rz(5.68208727936501) q[8];
-cx q[5],q[8];
-rx(11.934800864728826) q[8];
-ry(pi/2) q[9];
-rx(pi) q[9];
-cx q[1],q[9];
-rz(5.68208727936501) q[9];
-cx q[1],q[9];
-cx q[3],q[9];
-rz(5.68208727936501) q[9];
-cx q[3],q[9];
-ry(pi/2) q[10];
-rx(pi) q[10];
-cx q[4],q[10];
-rz(5.68208727936501) q[10];
-cx q[4],q[10];
-cx q[6],q[10];
-rz(5.68208727936501) q[10];
-cx q[6],q[10];
-ry(pi/2) q[11];
-rx(pi) q[11];
-cx q[5],q[11];
-rz(5.68208727936501) q[11];
-cx q[5],q[11];
-cx q[6],q[11];
-rz(5.68208727936501) q[11];
-cx q[6],q[11];
-rx(11.934800864728826) q[11];
-ry(pi/2) q[12];
-rx(pi) q[12];
-cx q[3],q[12];
-rz(5.68208727936501) q[12];
-cx q[3],q[12];
-cx q[5],q[12];
-rz(5.68208727936501) q[12];
-cx q[5],q[12];
-ry(pi/2) q[13];
-rx(pi) q[13];
-cx q[4],q[13];
-rz(5.68208727936501) q[13];
-cx q[4],q[13];
-cx q[5],q[13];
-rz(5.68208727936501) q[13];
-cx q[5],q[13];
-ry(pi/2) q[14];
-rx(pi) q[14];
-cx q[3],q[14];
-rz(5.68208727936501) q[14];
-cx q[3],q[14];
-cx q[4],q[14];
-rz(5.68208727936501) q[14];
-cx q[4],q[14];
-rx(11.934800864728826) q[14];
-ry(pi/2) q[15];
-rx(pi) q[15];
-cx q[0],q[15];
-rz(5.68208727936501) q[15];
-cx q[0],q[15];
-cx q[3],q[15];
-rz(5.68208727936501) q[15];
-cx q[3],q[15];
-ry(pi/2) q[16];
-rx(pi) q[16];
-cx q[0],q[16];
-rz(5.68208727936501) q[16];
-cx q[0],q[16];
-cx q[3],q[16];
-rz(5.68208727936501) q[16];
-cx q[3],q[16];
-ry(pi/2) q[17];
-rx(pi) q[17];
-cx q[1],q[17];
-rz(5.68208727936501) q[17];
-cx q[1],q[17];
-cx q[3],q[17];
-rz(5.68208727936501) q[17];
-cx q[3],q[17];
-ry(pi/2) q[18];
-rx(pi) q[18];
-cx q[3],q[18];
-rz(5.68208727936501) q[18];
-cx q[3],q[18];
-cx q[4],q[18];
-rz(5.68208727936501) q[18];
-cx q[4],q[18];
-ry(pi/2) q[19];
-rx(pi) q[19];
-cx q[3],q[19];
-rz(5.68208727936501) q[19];
-cx q[3],q[19];
-cx q[7],q[19];
-rz(5.68208727936501) q[19];
-cx q[7],q[19];
-rx(11.934800864728826) q[7];
-ry(pi/2) q[20];
-rx(pi) q[20];
-cx q[0],q[20];
-rz(5.68208727936501) q[20];
-cx q[0],q[20];
-cx q[15],q[20];
-rz(5.68208727936501) q[20];
-cx q[15],q[20];
-ry(pi/2) q[21];
-rx(pi) q[21];
-cx q[4],q[21];
-rz(5.68208727936501) q[21];
-cx q[4],q[21];
-cx q[15],q[21];
-rz(5.68208727936501) q[21];
-cx q[15],q[21];
-ry(pi/2) q[22];
-rx(pi) q[22];
-cx q[3],q[22];
-rz(5.68208727936501) q[22];
-cx q[3],q[22];
-cx q[9],q[22];
-rz(5.68208727936501) q[22];
-cx q[9],q[22];
-rx(11.934800864728826) q[9];
-rx(11.934800864728826) q[22];
-ry(pi/2) q[23];
-rx(pi) q[23];
-cx q[3],q[23];
-rz(5.68208727936501) q[23];
-cx q[3],q[23];
-cx q[17],q[23];
-rz(5.68208727936501) q[23];
-cx q[17],q[23];
-ry(pi/2) q[24];
-rx(pi) q[24];
-cx q[3],q[24];
-rz(5.68208727936501) q[24];
-cx q[3],q[24];
-cx q[5],q[24];
-rz(5.68208727936501) q[24];
-cx q[5],q[24];
-rx(11.934800864728826) q[24];
-ry(pi/2) q[25];
-rx(pi) q[25];
-cx q[3],q[25];
-rz(5.68208727936501) q[25];
-cx q[3],q[25];
-cx q[12],q[25];
-rz(5.68208727936501) q[25];
-cx q[12],q[25];
-rx(11.934800864728826) q[25];
-ry(pi/2) q[26];
-rx(pi) q[26];
-cx q[3],q[26];
-rz(5.68208727936501) q[26];
-cx q[3],q[26];
-cx q[21],q[26];
-rz(5.68208727936501) q[26];
-cx q[21],q[26];
-ry(pi/2) q[27];
-rx(pi) q[27];
-cx q[4],q[27];
-rz(5.68208727936501) q[27];
-cx q[4],q[27];
-cx q[6],q[27];
-rz(5.68208727936501) q[27];
-cx q[6],q[27];
-rx(11.934800864728826) q[6];
-ry(pi/2) q[28];
-rx(pi) q[28];
-cx q[1],q[28];
-rz(5.68208727936501) q[28];
-cx q[1],q[28];
-cx q[3],q[28];
-rz(5.68208727936501) q[28];
-cx q[3],q[28];
-rx(11.934800864728826) q[28];
-ry(pi/2) q[29];
-rx(pi) q[29];
-cx q[1],q[29];
-rz(5.68208727936501) q[29];
-cx q[1],q[29];
-cx q[3],q[29];
-rz(5.68208727936501) q[29];
-cx q[3],q[29];
-rx(11.934800864728826) q[29];
-ry(pi/2) q[30];
-rx(pi) q[30];
-cx q[3],q[30];
-rz(5.68208727936501) q[30];
-cx q[3],q[30];
-cx q[18],q[30];
-rz(5.68208727936501) q[30];
-cx q[18],q[30];
-rx(11.934800864728826) q[18];
-ry(pi/2) q[31];
-rx(pi) q[31];
-cx q[12],q[31];
-rz(5.68208727936501) q[31];
-cx q[12],q[31];
-cx q[26],q[31];
-rz(5.68208727936501) q[31];
-cx q[26],q[31];
-rx(11.934800864728826) q[26];
-rx(11.934800864728826) q[31];
-ry(pi/2) q[32];
-rx(pi) q[32];
-cx q[0],q[32];
-rz(5.68208727936501) q[32];
-cx q[0],q[32];
-cx q[21],q[32];
-rz(5.68208727936501) q[32];
-cx q[21],q[32];
-ry(pi/2) q[33];
-rx(pi) q[33];
-cx q[5],q[33];
-rz(5.68208727936501) q[33];
-cx q[5],q[33];
-cx q[30],q[33];
-rz(5.68208727936501) q[33];
-cx q[30],q[33];
-rx(11.934800864728826) q[33];
-ry(pi/2) q[34];
-rx(pi) q[34];
-cx q[3],q[34];
-rz(5.68208727936501) q[34];
-cx q[3],q[34];
-cx q[12],q[34];
-rz(5.68208727936501) q[34];
-cx q[12],q[34];
-ry(pi/2) q[35];
-rx(pi) q[35];
-cx q[3],q[35];
-rz(5.68208727936501) q[35];
-cx q[3],q[35];
-cx q[32],q[35];
-rz(5.68208727936501) q[35];
-cx q[32],q[35];
-rx(11.934800864728826) q[32];
-rx(11.934800864728826) q[35];
-ry(pi/2) q[36];
-rx(pi) q[36];
-cx q[15],q[36];
-rz(5.68208727936501) q[36];
-cx q[15],q[36];
-rx(11.934800864728826) q[15];
-cx q[20],q[36];
-rz(5.68208727936501) q[36];
-cx q[20],q[36];
-rx(11.934800864728826) q[36];
-ry(pi/2) q[37];
-rx(pi) q[37];
-cx q[10],q[37];
-rz(5.68208727936501) q[37];
-cx q[10],q[37];
-cx q[34],q[37];
-rz(5.68208727936501) q[37];
-cx q[34],q[37];
-rx(11.934800864728826) q[34];
-rx(11.934800864728826) q[37];
-ry(pi/2) q[38];
-rx(pi) q[38];
-cx q[19],q[38];
-rz(5.68208727936501) q[38];
-cx q[19],q[38];
-rx(11.934800864728826) q[19];
-cx q[21],q[38];
-rz(5.68208727936501) q[38];
-cx q[21],q[38];
-rx(11.934800864728826) q[21];
-ry(pi/2) q[39];
-rx(pi) q[39];
-cx q[3],q[39];
-rz(5.68208727936501) q[39];
-cx q[3],q[39];
-cx q[13],q[39];
-rz(5.68208727936501) q[39];
-cx q[13],q[39];
-rx(11.934800864728826) q[13];
-rx(11.934800864728826) q[39];
-ry(pi/2) q[40];
-rx(pi) q[40];
-cx q[3],q[40];
-rz(5.68208727936501) q[40];
-cx q[3],q[40];
-cx q[23],q[40];
-rz(5.68208727936501) q[40];
-cx q[23],q[40];
-rx(11.934800864728826) q[23];
-rx(11.934800864728826) q[40];
-ry(pi/2) q[41];
-rx(pi) q[41];
-cx q[10],q[41];
-rz(5.68208727936501) q[41];
-cx q[10],q[41];
-rx(11.934800864728826) q[10];
-cx q[27],q[41];
-rz(5.68208727936501) q[41];
-cx q[27],q[41];
-rx(11.934800864728826) q[27];
-rx(11.934800864728826) q[41];
-ry(pi/2) q[42];
-rx(pi) q[42];
-cx q[0],q[42];
-rz(5.68208727936501) q[42];
-cx q[0],q[42];
-cx q[3],q[42];
-rz(5.68208727936501) q[42];
-cx q[3],q[42];
-rx(11.934800864728826) q[42];
-ry(pi/2) q[43];
-rx(pi) q[43];
-cx q[3],q[43];
-rz(5.68208727936501) q[43];
-cx q[3],q[43];
-cx q[20],q[43];
-rz(5.68208727936501) q[43];
-cx q[20],q[43];
-rx(11.934800864728826) q[20];
-rx(11.934800864728826) q[43];
-ry(pi/2) q[44];
-rx(pi) q[44];
-cx q[3],q[44];
-rz(5.68208727936501) q[44];
-cx q[3],q[44];
-rx(11.934800864728826) q[3];
-cx q[12],q[44];
-rz(5.68208727936501) q[44];
-cx q[12],q[44];
-rx(11.934800864728826) q[12];
-rx(11.934800864728826) q[44];
-ry(pi/2) q[45];
-rx(pi) q[45];
-cx q[1],q[45];
-rz(5.68208727936501) q[45];
-cx q[1],q[45];
-rx(11.934800864728826) q[1];
-cx q[16],q[45];
-rz(5.68208727936501) q[45];
-cx q[16],q[45];
-rx(11.934800864728826) q[16];
-rx(11.934800864728826) q[45];
-ry(pi/2) q[46];
-rx(pi) q[46];
-cx q[5],q[46];
-rz(5.68208727936501) q[46];
-cx q[5],q[46];
-rx(11.934800864728826) q[5];
-cx q[38],q[46];
-rz(5.68208727936501) q[46];
-cx q[38],q[46];
-rx(11.934800864728826) q[38];
-rx(11.934800864728826) q[46];
-ry(pi/2) q[47];
-rx(pi) q[47];
-cx q[4],q[47];
-rz(5.68208727936501) q[47];
-cx q[4],q[47];
-rx(11.934800864728826) q[4];
-cx q[17],q[47];
-rz(5.68208727936501) q[47];
-cx q[17],q[47];
-rx(11.934800864728826) q[17];
-rx(11.934800864728826) q[47];
-ry(pi/2) q[48];
-rx(pi) q[48];
-cx q[0],q[48];
-rz(5.68208727936501) q[48];
-cx q[0],q[48];
-rx(11.934800864728826) q[0];
-cx q[0],q[1];
-rz(2.259034458002518) q[1];
-cx q[0],q[1];
-cx q[0],q[2];
-rz(2.259034458002518) q[2];
-cx q[0],q[2];
-cx q[0],q[3];
-rx(10.867146382570818) q[2];
-rz(2.259034458002518) q[3];
-cx q[0],q[3];
-cx q[0],q[15];
-cx q[1],q[3];
-rz(2.259034458002518) q[3];
-cx q[1],q[3];
-cx q[1],q[4];
-rz(2.259034458002518) q[4];
-cx q[1],q[4];
-cx q[1],q[5];
-cx q[3],q[4];
-rz(2.259034458002518) q[4];
-cx q[3],q[4];
-cx q[4],q[6];
-rz(2.259034458002518) q[5];
-cx q[1],q[5];
-cx q[1],q[9];
-cx q[3],q[5];
-rz(2.259034458002518) q[5];
-cx q[3],q[5];
-cx q[3],q[7];
-rz(2.259034458002518) q[6];
-cx q[4],q[6];
-cx q[5],q[6];
-rz(2.259034458002518) q[6];
-cx q[5],q[6];
-rz(2.259034458002518) q[7];
-cx q[3],q[7];
-cx q[3],q[8];
-cx q[4],q[7];
-rz(2.259034458002518) q[7];
-cx q[4],q[7];
-cx q[4],q[10];
-rz(2.259034458002518) q[8];
-cx q[3],q[8];
-cx q[5],q[8];
-rz(2.259034458002518) q[8];
-cx q[5],q[8];
-cx q[5],q[11];
-rx(10.867146382570818) q[8];
-rz(2.259034458002518) q[9];
-cx q[1],q[9];
-cx q[1],q[17];
-cx q[3],q[9];
-rz(2.259034458002518) q[9];
-cx q[3],q[9];
-cx q[3],q[12];
-rz(2.259034458002518) q[10];
-cx q[4],q[10];
-cx q[4],q[13];
-cx q[6],q[10];
-rz(2.259034458002518) q[10];
-cx q[6],q[10];
-cx q[10],q[37];
-rz(2.259034458002518) q[11];
-cx q[5],q[11];
-cx q[6],q[11];
-rz(2.259034458002518) q[11];
-cx q[6],q[11];
-rx(10.867146382570818) q[11];
-rz(2.259034458002518) q[12];
-cx q[3],q[12];
-cx q[3],q[14];
-cx q[5],q[12];
-rz(2.259034458002518) q[12];
-cx q[5],q[12];
-rz(2.259034458002518) q[13];
-cx q[4],q[13];
-cx q[5],q[13];
-rz(2.259034458002518) q[13];
-cx q[5],q[13];
-rz(2.259034458002518) q[14];
-cx q[3],q[14];
-cx q[4],q[14];
-rz(2.259034458002518) q[14];
-cx q[4],q[14];
-rx(10.867146382570818) q[14];
-rz(2.259034458002518) q[15];
-cx q[0],q[15];
-cx q[0],q[16];
-cx q[3],q[15];
-rz(2.259034458002518) q[15];
-cx q[3],q[15];
-rz(2.259034458002518) q[16];
-cx q[0],q[16];
-cx q[0],q[20];
-cx q[3],q[16];
-rz(2.259034458002518) q[16];
-cx q[3],q[16];
-rz(2.259034458002518) q[17];
-cx q[1],q[17];
-cx q[1],q[28];
-cx q[3],q[17];
-rz(2.259034458002518) q[17];
-cx q[3],q[17];
-cx q[3],q[18];
-rz(2.259034458002518) q[18];
-cx q[3],q[18];
-cx q[3],q[19];
-cx q[4],q[18];
-rz(2.259034458002518) q[18];
-cx q[4],q[18];
-cx q[4],q[21];
-rz(2.259034458002518) q[19];
-cx q[3],q[19];
-cx q[3],q[22];
-cx q[7],q[19];
-rz(2.259034458002518) q[19];
-cx q[7],q[19];
-rx(10.867146382570818) q[7];
-cx q[19],q[38];
-rz(2.259034458002518) q[20];
-cx q[0],q[20];
-cx q[0],q[32];
-cx q[15],q[20];
-rz(2.259034458002518) q[20];
-cx q[15],q[20];
-rz(2.259034458002518) q[21];
-cx q[4],q[21];
-cx q[4],q[27];
-cx q[15],q[21];
-rz(2.259034458002518) q[21];
-cx q[15],q[21];
-cx q[15],q[36];
-rz(2.259034458002518) q[22];
-cx q[3],q[22];
-cx q[3],q[23];
-cx q[9],q[22];
-rz(2.259034458002518) q[22];
-cx q[9],q[22];
-rx(10.867146382570818) q[9];
-rx(10.867146382570818) q[22];
-rz(2.259034458002518) q[23];
-cx q[3],q[23];
-cx q[3],q[24];
-cx q[17],q[23];
-rz(2.259034458002518) q[23];
-cx q[17],q[23];
-rz(2.259034458002518) q[24];
-cx q[3],q[24];
-cx q[3],q[25];
-cx q[5],q[24];
-rz(2.259034458002518) q[24];
-cx q[5],q[24];
-cx q[5],q[33];
-rx(10.867146382570818) q[24];
-rz(2.259034458002518) q[25];
-cx q[3],q[25];
-cx q[3],q[26];
-cx q[12],q[25];
-rz(2.259034458002518) q[25];
-cx q[12],q[25];
-cx q[12],q[31];
-rx(10.867146382570818) q[25];
-rz(2.259034458002518) q[26];
-cx q[3],q[26];
-cx q[21],q[26];
-rz(2.259034458002518) q[26];
-cx q[21],q[26];
-rz(2.259034458002518) q[27];
-cx q[4],q[27];
-cx q[4],q[47];
-cx q[6],q[27];
-rz(2.259034458002518) q[27];
-cx q[6],q[27];
-rx(10.867146382570818) q[6];
-rz(2.259034458002518) q[28];
-cx q[1],q[28];
-cx q[1],q[29];
-cx q[3],q[28];
-rz(2.259034458002518) q[28];
-cx q[3],q[28];
-rx(10.867146382570818) q[28];
-rz(2.259034458002518) q[29];
-cx q[1],q[29];
-cx q[1],q[45];
-cx q[3],q[29];
-rz(2.259034458002518) q[29];
-cx q[3],q[29];
-rx(10.867146382570818) q[29];
-cx q[30],q[48];
-rz(2.259034458002518) q[31];
-cx q[12],q[31];
-cx q[26],q[31];
-rz(2.259034458002518) q[31];
-cx q[26],q[31];
-rx(10.867146382570818) q[26];
-rx(10.867146382570818) q[31];
-rz(2.259034458002518) q[32];
-cx q[0],q[32];
-cx q[0],q[42];
-cx q[21],q[32];
-rz(2.259034458002518) q[32];
-cx q[21],q[32];
-rz(2.259034458002518) q[33];
-cx q[5],q[33];
-cx q[5],q[46];
-rz(2.259034458002518) q[36];
-cx q[15],q[36];
-rx(10.867146382570818) q[15];
-cx q[20],q[36];
-rz(2.259034458002518) q[36];
-cx q[20],q[36];
-rx(10.867146382570818) q[36];
-rz(2.259034458002518) q[37];
-cx q[10],q[37];
-cx q[10],q[41];
-rz(2.259034458002518) q[38];
-cx q[19],q[38];
-rx(10.867146382570818) q[19];
-cx q[21],q[38];
-rz(2.259034458002518) q[38];
-cx q[21],q[38];
-rx(10.867146382570818) q[21];
-rz(2.259034458002518) q[41];
-cx q[10],q[41];
-rx(10.867146382570818) q[10];
-cx q[27],q[41];
-rz(2.259034458002518) q[41];
-cx q[27],q[41];
-rx(10.867146382570818) q[27];
-rx(10.867146382570818) q[41];
-rz(2.259034458002518) q[42];
-cx q[0],q[42];
-rz(2.259034458002518) q[45];
-cx q[1],q[45];
-rx(10.867146382570818) q[1];
-cx q[16],q[45];
-rz(2.259034458002518) q[45];
-cx q[16],q[45];
-rx(10.867146382570818) q[16];
-rx(10.867146382570818) q[45];
-rz(2.259034458002518) q[46];
-cx q[5],q[46];
-rx(10.867146382570818) q[5];
-cx q[38],q[46];
-rz(2.259034458002518) q[46];
-cx q[38],q[46];
-rx(10.867146382570818) q[38];
-rx(10.867146382570818) q[46];
-rz(2.259034458002518) q[47];
-cx q[4],q[47];
-rx(10.867146382570818) q[4];
-cx q[17],q[47];
-rz(2.259034458002518) q[47];
-cx q[17],q[47];
-rx(10.867146382570818) q[17];
-rx(10.867146382570818) q[47];
-rz(5.68208727936501) q[48];
-cx q[30],q[48];
-rx(11.934800864728826) q[30];
-cx q[3],q[30];
-rz(2.259034458002518) q[30];
-cx q[3],q[30];
-cx q[3],q[34];
-cx q[18],q[30];
-rz(2.259034458002518) q[30];
-cx q[18],q[30];
-rx(10.867146382570818) q[18];
-cx q[30],q[33];
-rz(2.259034458002518) q[33];
-cx q[30],q[33];
-rx(10.867146382570818) q[33];
-rz(2.259034458002518) q[34];
-cx q[3],q[34];
-cx q[3],q[35];
-cx q[12],q[34];
-rz(2.259034458002518) q[34];
-cx q[12],q[34];
-cx q[34],q[37];
-rz(2.259034458002518) q[35];
-cx q[3],q[35];
-cx q[3],q[39];
-cx q[32],q[35];
-rz(2.259034458002518) q[35];
-cx q[32],q[35];
-rx(10.867146382570818) q[32];
-rx(10.867146382570818) q[35];
-rz(2.259034458002518) q[37];
-cx q[34],q[37];
-rx(10.867146382570818) q[34];
-rx(10.867146382570818) q[37];
-rz(2.259034458002518) q[39];
-cx q[3],q[39];
-cx q[3],q[40];
-cx q[13],q[39];
-rz(2.259034458002518) q[39];
-cx q[13],q[39];
-rx(10.867146382570818) q[13];
-rx(10.867146382570818) q[39];
-rz(2.259034458002518) q[40];
-cx q[3],q[40];
-cx q[3],q[42];
-cx q[23],q[40];
-rz(2.259034458002518) q[40];
-cx q[23],q[40];
-rx(10.867146382570818) q[23];
-rx(10.867146382570818) q[40];
-rz(2.259034458002518) q[42];
-cx q[3],q[42];
-cx q[3],q[43];
-rx(10.867146382570818) q[42];
-rz(2.259034458002518) q[43];
-cx q[3],q[43];
-cx q[3],q[44];
-cx q[20],q[43];
-rz(2.259034458002518) q[43];
-cx q[20],q[43];
-rx(10.867146382570818) q[20];
-rx(10.867146382570818) q[43];
-rz(2.259034458002518) q[44];
-cx q[3],q[44];
-rx(10.867146382570818) q[3];
-cx q[12],q[44];
-rz(2.259034458002518) q[44];
-cx q[12],q[44];
-rx(10.867146382570818) q[12];
-rx(10.867146382570818) q[44];
-rx(11.934800864728826) q[48];
-cx q[0],q[48];
-rz(2.259034458002518) q[48];
-cx q[0],q[48];
-rx(10.867146382570818) q[0];
-cx q[0],q[1];
-rz(3.6105686741697434) q[1];
-cx q[0],q[1];
-cx q[0],q[2];
-rz(3.6105686741697434) q[2];
-cx q[0],q[2];
-cx q[0],q[3];
-rx(11.189102902174069) q[2];
-rz(3.6105686741697434) q[3];
-cx q[0],q[3];
-cx q[0],q[15];
-cx q[1],q[3];
-rz(3.6105686741697434) q[3];
-cx q[1],q[3];
-cx q[1],q[4];
-rz(3.6105686741697434) q[4];
-cx q[1],q[4];
-cx q[1],q[5];
-cx q[3],q[4];
-rz(3.6105686741697434) q[4];
-cx q[3],q[4];
-cx q[4],q[6];
-rz(3.6105686741697434) q[5];
-cx q[1],q[5];
-cx q[1],q[9];
-cx q[3],q[5];
-rz(3.6105686741697434) q[5];
-cx q[3],q[5];
-cx q[3],q[7];
-rz(3.6105686741697434) q[6];
-cx q[4],q[6];
-cx q[5],q[6];
-rz(3.6105686741697434) q[6];
-cx q[5],q[6];
-rz(3.6105686741697434) q[7];
-cx q[3],q[7];
-cx q[3],q[8];
-cx q[4],q[7];
-rz(3.6105686741697434) q[7];
-cx q[4],q[7];
-cx q[4],q[10];
-rz(3.6105686741697434) q[8];
-cx q[3],q[8];
-cx q[5],q[8];
-rz(3.6105686741697434) q[8];
-cx q[5],q[8];
-cx q[5],q[11];
-rx(11.189102902174069) q[8];
-rz(3.6105686741697434) q[9];
-cx q[1],q[9];
-cx q[1],q[17];
-cx q[3],q[9];
-rz(3.6105686741697434) q[9];
-cx q[3],q[9];
-cx q[3],q[12];
-rz(3.6105686741697434) q[10];
-cx q[4],q[10];
-cx q[4],q[13];
-cx q[6],q[10];
-rz(3.6105686741697434) q[10];
-cx q[6],q[10];
-cx q[10],q[37];
-rz(3.6105686741697434) q[11];
-cx q[5],q[11];
-cx q[6],q[11];
-rz(3.6105686741697434) q[11];
-cx q[6],q[11];
-rx(11.189102902174069) q[11];
-rz(3.6105686741697434) q[12];
-cx q[3],q[12];
-cx q[3],q[14];
-cx q[5],q[12];
-rz(3.6105686741697434) q[12];
-cx q[5],q[12];
-rz(3.6105686741697434) q[13];
-cx q[4],q[13];
-cx q[5],q[13];
-rz(3.6105686741697434) q[13];
-cx q[5],q[13];
-rz(3.6105686741697434) q[14];
-cx q[3],q[14];
-cx q[4],q[14];
-rz(3.6105686741697434) q[14];
-cx q[4],q[14];
-rx(11.189102902174069) q[14];
-rz(3.6105686741697434) q[15];
-cx q[0],q[15];
-cx q[0],q[16];
-cx q[3],q[15];
-rz(3.6105686741697434) q[15];
-cx q[3],q[15];
-rz(3.6105686741697434) q[16];
-cx q[0],q[16];
-cx q[0],q[20];
-cx q[3],q[16];
-rz(3.6105686741697434) q[16];
-cx q[3],q[16];
-rz(3.6105686741697434) q[17];
-cx q[1],q[17];
-cx q[1],q[28];
-cx q[3],q[17];
-rz(3.6105686741697434) q[17];
-cx q[3],q[17];
-cx q[3],q[18];
-rz(3.6105686741697434) q[18];
-cx q[3],q[18];
-cx q[3],q[19];
-cx q[4],q[18];
-rz(3.6105686741697434) q[18];
-cx q[4],q[18];
-cx q[4],q[21];
-rz(3.6105686741697434) q[19];
-cx q[3],q[19];
-cx q[3],q[22];
-cx q[7],q[19];
-rz(3.6105686741697434) q[19];
-cx q[7],q[19];
-rx(11.189102902174069) q[7];
-cx q[19],q[38];
-rz(3.6105686741697434) q[20];
-cx q[0],q[20];
-cx q[0],q[32];
-cx q[15],q[20];
-rz(3.6105686741697434) q[20];
-cx q[15],q[20];
-rz(3.6105686741697434) q[21];
-cx q[4],q[21];
-cx q[4],q[27];
-cx q[15],q[21];
-rz(3.6105686741697434) q[21];
-cx q[15],q[21];
-cx q[15],q[36];
-rz(3.6105686741697434) q[22];
-cx q[3],q[22];
-cx q[3],q[23];
-cx q[9],q[22];
-rz(3.6105686741697434) q[22];
-cx q[9],q[22];
-rx(11.189102902174069) q[9];
-rx(11.189102902174069) q[22];
-rz(3.6105686741697434) q[23];
-cx q[3],q[23];
-cx q[3],q[24];
-cx q[17],q[23];
-rz(3.6105686741697434) q[23];
-cx q[17],q[23];
-rz(3.6105686741697434) q[24];
-cx q[3],q[24];
-cx q[3],q[25];
-cx q[5],q[24];
-rz(3.6105686741697434) q[24];
-cx q[5],q[24];
-cx q[5],q[33];
-rx(11.189102902174069) q[24];
-rz(3.6105686741697434) q[25];
-cx q[3],q[25];
-cx q[3],q[26];
-cx q[12],q[25];
-rz(3.6105686741697434) q[25];
-cx q[12],q[25];
-cx q[12],q[31];
-rx(11.189102902174069) q[25];
-rz(3.6105686741697434) q[26];
-cx q[3],q[26];
-cx q[21],q[26];
-rz(3.6105686741697434) q[26];
-cx q[21],q[26];
-rz(3.6105686741697434) q[27];
-cx q[4],q[27];
-cx q[4],q[47];
-cx q[6],q[27];
-rz(3.6105686741697434) q[27];
-cx q[6],q[27];
-rx(11.189102902174069) q[6];
-rz(3.6105686741697434) q[28];
-cx q[1],q[28];
-cx q[1],q[29];
-cx q[3],q[28];
-rz(3.6105686741697434) q[28];
-cx q[3],q[28];
-rx(11.189102902174069) q[28];
-rz(3.6105686741697434) q[29];
-cx q[1],q[29];
-cx q[1],q[45];
-cx q[3],q[29];
-rz(3.6105686741697434) q[29];
-cx q[3],q[29];
-rx(11.189102902174069) q[29];
-cx q[30],q[48];
-rz(3.6105686741697434) q[31];
-cx q[12],q[31];
-cx q[26],q[31];
-rz(3.6105686741697434) q[31];
-cx q[26],q[31];
-rx(11.189102902174069) q[26];
-rx(11.189102902174069) q[31];
-rz(3.6105686741697434) q[32];
-cx q[0],q[32];
-cx q[0],q[42];
-cx q[21],q[32];
-rz(3.6105686741697434) q[32];
-cx q[21],q[32];
-rz(3.6105686741697434) q[33];
-cx q[5],q[33];
-cx q[5],q[46];
-rz(3.6105686741697434) q[36];
-cx q[15],q[36];
-rx(11.189102902174069) q[15];
-cx q[20],q[36];
-rz(3.6105686741697434) q[36];
-cx q[20],q[36];
-rx(11.189102902174069) q[36];
-rz(3.6105686741697434) q[37];
-cx q[10],q[37];
-cx q[10],q[41];
-rz(3.6105686741697434) q[38];
-cx q[19],q[38];
-rx(11.189102902174069) q[19];
-cx q[21],q[38];
-rz(3.6105686741697434) q[38];
-cx q[21],q[38];
-rx(11.189102902174069) q[21];
-rz(3.6105686741697434) q[41];
-cx q[10],q[41];
-rx(11.189102902174069) q[10];
-cx q[27],q[41];
-rz(3.6105686741697434) q[41];
-cx q[27],q[41];
-rx(11.189102902174069) q[27];
-rx(11.189102902174069) q[41];
-rz(3.6105686741697434) q[42];
-cx q[0],q[42];
-rz(3.6105686741697434) q[45];
-cx q[1],q[45];
-rx(11.189102902174069) q[1];
-cx q[16],q[45];
-rz(3.6105686741697434) q[45];
-cx q[16],q[45];
-rx(11.189102902174069) q[16];
-rx(11.189102902174069) q[45];
-rz(3.6105686741697434) q[46];
-cx q[5],q[46];
-rx(11.189102902174069) q[5];
-cx q[38],q[46];
-rz(3.6105686741697434) q[46];
-cx q[38],q[46];
-rx(11.189102902174069) q[38];
-rx(11.189102902174069) q[46];
-rz(3.6105686741697434) q[47];
-cx q[4],q[47];
-rx(11.189102902174069) q[4];
-cx q[17],q[47];
-rz(3.6105686741697434) q[47];
-cx q[17],q[47];
-rx(11.189102902174069) q[17];
-rx(11.189102902174069) q[47];
-rz(2.259034458002518) q[48];
-cx q[30],q[48];
-rx(10.867146382570818) q[30];
-cx q[3],q[30];
-rz(3.6105686741697434) q[30];
-cx q[3],q[30];
-cx q[3],q[34];
-cx q[18],q[30];
-rz(3.6105686741697434) q[30];
-cx q[18],q[30];
-rx(11.189102902174069) q[18];
-cx q[30],q[33];
-rz(3.6105686741697434) q[33];
-cx q[30],q[33];
-rx(11.189102902174069) q[33];
-rz(3.6105686741697434) q[34];
-cx q[3],q[34];
-cx q[3],q[35];
-cx q[12],q[34];
-rz(3.6105686741697434) q[34];
-cx q[12],q[34];
-cx q[34],q[37];
-rz(3.6105686741697434) q[35];
-cx q[3],q[35];
-cx q[3],q[39];
-cx q[32],q[35];
-rz(3.6105686741697434) q[35];
-cx q[32],q[35];
-rx(11.189102902174069) q[32];
-rx(11.189102902174069) q[35];
-rz(3.6105686741697434) q[37];
-cx q[34],q[37];
-rx(11.189102902174069) q[34];
-rx(11.189102902174069) q[37];
-rz(3.6105686741697434) q[39];
-cx q[3],q[39];
-cx q[3],q[40];
-cx q[13],q[39];
-rz(3.6105686741697434) q[39];
-cx q[13],q[39];
-rx(11.189102902174069) q[13];
-rx(11.189102902174069) q[39];
-rz(3.6105686741697434) q[40];
-cx q[3],q[40];
-cx q[3],q[42];
-cx q[23],q[40];
-rz(3.6105686741697434) q[40];
-cx q[23],q[40];
-rx(11.189102902174069) q[23];
-rx(11.189102902174069) q[40];
-rz(3.6105686741697434) q[42];
-cx q[3],q[42];
-cx q[3],q[43];
-rx(11.189102902174069) q[42];
-rz(3.6105686741697434) q[43];
-cx q[3],q[43];
-cx q[3],q[44];
-cx q[20],q[43];
-rz(3.6105686741697434) q[43];
-cx q[20],q[43];
-rx(11.189102902174069) q[20];
-rx(11.189102902174069) q[43];
-rz(3.6105686741697434) q[44];
-cx q[3],q[44];
-rx(11.189102902174069) q[3];
-cx q[12],q[44];
-rz(3.6105686741697434) q[44];
-cx q[12],q[44];
-rx(11.189102902174069) q[12];
-rx(11.189102902174069) q[44];
-rx(10.867146382570818) q[48];
-cx q[0],q[48];
-rz(3.6105686741697434) q[48];
-cx q[0],q[48];
-rx(11.189102902174069) q[0];
-cx q[30],q[48];
-rz(3.6105686741697434) q[48];
-cx q[30],q[48];
-rx(11.189102902174069) q[30];
-rx(11.189102902174069) q[48];
\ No newline at end of file
@@ -1,59 +0,0 @@
-OPENQASM 2.0;
-include "qelib1.inc";
-qreg q[4];
-ry(pi/2) q[0];
-rx(pi) q[0];
-ry(pi/2) q[1];
-rx(pi) q[1];
-cx q[0],q[1];
-rz(4.21498087912943) q[1];
-cx q[0],q[1];
-ry(pi/2) q[2];
-rx(pi) q[2];
-cx q[0],q[2];
-rz(4.21498087912943) q[2];
-cx q[0],q[2];
-rx(1.9798574050191566) q[2];
-ry(pi/2) q[3];
-rx(pi) q[3];
-cx q[0],q[3];
-rz(4.21498087912943) q[3];
-cx q[0],q[3];
-rx(1.9798574050191566) q[0];
-cx q[1],q[3];
-rz(4.21498087912943) q[3];
-cx q[1],q[3];
-rx(1.9798574050191566) q[1];
-cx q[0],q[1];
-rz(4.770939108338561) q[1];
-cx q[0],q[1];
-cx q[0],q[2];
-rz(4.770939108338561) q[2];
-cx q[0],q[2];
-rx(4.10572834687141) q[2];
-rx(1.9798574050191566) q[3];
-cx q[0],q[3];
-rz(4.770939108338561) q[3];
-cx q[0],q[3];
-rx(4.10572834687141) q[0];
-cx q[1],q[3];
-rz(4.770939108338561) q[3];
-cx q[1],q[3];
-rx(4.10572834687141) q[1];
-cx q[0],q[1];
-rz(0.281399125653107) q[1];
-cx q[0],q[1];
-cx q[0],q[2];
-rz(0.281399125653107) q[2];
-cx q[0],q[2];
-rx(8.43487357693012) q[2];
-rx(4.10572834687141) q[3];
-cx q[0],q[3];
-rz(0.281399125653107) q[3];
-cx q[0],q[3];
-rx(8.43487357693012) q[0];
-cx q[1],q[3];
-rz(0.281399125653107) q[3];
-cx q[1],q[3];
-rx(8.43487357693012) q[1];
-rx(8.43487357693012) q[3];
\ No newline at end of file
@@ -1,1140 +0,0 @@
-OPENQASM 2.0;
-include "qelib1.inc";
-qreg q[51];
-ry(pi/2) q[0];
-rx(pi) q[0];
-ry(pi/2) q[1];
-rx(pi) q[1];
-cx q[0],q[1];
-rz(4.497021559395162) q[1];
-cx q[0],q[1];
-ry(pi/2) q[2];
-rx(pi) q[2];
-cx q[0],q[2];
-rz(4.497021559395162) q[2];
-cx q[0],q[2];
-rx(7.6700902313748855) q[2];
-ry(pi/2) q[3];
-rx(pi) q[3];
-cx q[0],q[3];
-rz(4.497021559395162) q[3];
-cx q[0],q[3];
-cx q[1],q[3];
-rz(4.497021559395162) q[3];
-cx q[1],q[3];
-ry(pi/2) q[4];
-rx(pi) q[4];
-cx q[1],q[4];
-rz(4.497021559395162) q[4];
-cx q[1],q[4];
-cx q[3],q[4];
-rz(4.497021559395162) q[4];
-cx q[3],q[4];
-ry(pi/2) q[5];
-rx(pi) q[5];
-cx q[1],q[5];
-rz(4.497021559395162) q[5];
-cx q[1],q[5];
-cx q[3],q[5];
-rz(4.497021559395162) q[5];
-cx q[3],q[5];
-ry(pi/2) q[6];
-rx(pi) q[6];
-cx q[4],q[6];
-rz(4.497021559395162) q[6];
-cx q[4],q[6];
-cx q[5],q[6];
-rz(4.497021559395162) q[6];
-cx q[5],q[6];
-ry(pi/2) q[7];
-rx(pi) q[7];
-cx q[3],q[7];
-rz(4.497021559395162) q[7];
-cx q[3],q[7];
-cx q[4],q[7];
-rz(4.497021559395162) q[7];
-cx q[4],q[7];
-ry(pi/2) q[8];
-rx(pi) q[8];
-cx q[3],q[8];
-rz(4.497021559395162) q[8];
-cx q[3],q[8];
-cx q[5],q[8];
-rz(4.497021559395162) q[8];
-cx q[5],q[8];
-rx(7.6700902313748855) q[8];
-ry(pi/2) q[9];
-rx(pi) q[9];
-cx q[1],q[9];
-rz(4.497021559395162) q[9];
-cx q[1],q[9];
-cx q[3],q[9];
-rz(4.497021559395162) q[9];
-cx q[3],q[9];
-ry(pi/2) q[10];
-rx(pi) q[10];
-cx q[4],q[10];
-rz(4.497021559395162) q[10];
-cx q[4],q[10];
-cx q[6],q[10];
-rz(4.497021559395162) q[10];
-cx q[6],q[10];
-ry(pi/2) q[11];
-rx(pi) q[11];
-cx q[5],q[11];
-rz(4.497021559395162) q[11];
-cx q[5],q[11];
-cx q[6],q[11];
-rz(4.497021559395162) q[11];
-cx q[6],q[11];
-rx(7.6700902313748855) q[11];
-ry(pi/2) q[12];
-rx(pi) q[12];
-cx q[3],q[12];
-rz(4.497021559395162) q[12];
-cx q[3],q[12];
-cx q[5],q[12];
-rz(4.497021559395162) q[12];
-cx q[5],q[12];
-ry(pi/2) q[13];
-rx(pi) q[13];
-cx q[4],q[13];
-rz(4.497021559395162) q[13];
-cx q[4],q[13];
-cx q[5],q[13];
-rz(4.497021559395162) q[13];
-cx q[5],q[13];
-ry(pi/2) q[14];
-rx(pi) q[14];
-cx q[3],q[14];
-rz(4.497021559395162) q[14];
-cx q[3],q[14];
-cx q[4],q[14];
-rz(4.497021559395162) q[14];
-cx q[4],q[14];
-rx(7.6700902313748855) q[14];
-ry(pi/2) q[15];
-rx(pi) q[15];
-cx q[0],q[15];
-rz(4.497021559395162) q[15];
-cx q[0],q[15];
-cx q[3],q[15];
-rz(4.497021559395162) q[15];
-cx q[3],q[15];
-ry(pi/2) q[16];
-rx(pi) q[16];
-cx q[0],q[16];
-rz(4.497021559395162) q[16];
-cx q[0],q[16];
-cx q[3],q[16];
-rz(4.497021559395162) q[16];
-cx q[3],q[16];
-ry(pi/2) q[17];
-rx(pi) q[17];
-cx q[1],q[17];
-rz(4.497021559395162) q[17];
-cx q[1],q[17];
-cx q[3],q[17];
-rz(4.497021559395162) q[17];
-cx q[3],q[17];
-ry(pi/2) q[18];
-rx(pi) q[18];
-cx q[3],q[18];
-rz(4.497021559395162) q[18];
-cx q[3],q[18];
-cx q[4],q[18];
-rz(4.497021559395162) q[18];
-cx q[4],q[18];
-ry(pi/2) q[19];
-rx(pi) q[19];
-cx q[3],q[19];
-rz(4.497021559395162) q[19];
-cx q[3],q[19];
-cx q[7],q[19];
-rz(4.497021559395162) q[19];
-cx q[7],q[19];
-rx(7.6700902313748855) q[7];
-ry(pi/2) q[20];
-rx(pi) q[20];
-cx q[0],q[20];
-rz(4.497021559395162) q[20];
-cx q[0],q[20];
-cx q[15],q[20];
-rz(4.497021559395162) q[20];
-cx q[15],q[20];
-ry(pi/2) q[21];
-rx(pi) q[21];
-cx q[4],q[21];
-rz(4.497021559395162) q[21];
-cx q[4],q[21];
-cx q[15],q[21];
-rz(4.497021559395162) q[21];
-cx q[15],q[21];
-ry(pi/2) q[22];
-rx(pi) q[22];
-cx q[3],q[22];
-rz(4.497021559395162) q[22];
-cx q[3],q[22];
-cx q[9],q[22];
-rz(4.497021559395162) q[22];
-cx q[9],q[22];
-rx(7.6700902313748855) q[9];
-rx(7.6700902313748855) q[22];
-ry(pi/2) q[23];
-rx(pi) q[23];
-cx q[3],q[23];
-rz(4.497021559395162) q[23];
-cx q[3],q[23];
-cx q[17],q[23];
-rz(4.497021559395162) q[23];
-cx q[17],q[23];
-ry(pi/2) q[24];
-rx(pi) q[24];
-cx q[3],q[24];
-rz(4.497021559395162) q[24];
-cx q[3],q[24];
-cx q[5],q[24];
-rz(4.497021559395162) q[24];
-cx q[5],q[24];
-rx(7.6700902313748855) q[24];
-ry(pi/2) q[25];
-rx(pi) q[25];
-cx q[3],q[25];
-rz(4.497021559395162) q[25];
-cx q[3],q[25];
-cx q[12],q[25];
-rz(4.497021559395162) q[25];
-cx q[12],q[25];
-rx(7.6700902313748855) q[25];
-ry(pi/2) q[26];
-rx(pi) q[26];
-cx q[3],q[26];
-rz(4.497021559395162) q[26];
-cx q[3],q[26];
-cx q[21],q[26];
-rz(4.497021559395162) q[26];
-cx q[21],q[26];
-ry(pi/2) q[27];
-rx(pi) q[27];
-cx q[4],q[27];
-rz(4.497021559395162) q[27];
-cx q[4],q[27];
-cx q[6],q[27];
-rz(4.497021559395162) q[27];
-cx q[6],q[27];
-rx(7.6700902313748855) q[6];
-ry(pi/2) q[28];
-rx(pi) q[28];
-cx q[1],q[28];
-rz(4.497021559395162) q[28];
-cx q[1],q[28];
-cx q[3],q[28];
-rz(4.497021559395162) q[28];
-cx q[3],q[28];
-rx(7.6700902313748855) q[28];
-ry(pi/2) q[29];
-rx(pi) q[29];
-cx q[1],q[29];
-rz(4.497021559395162) q[29];
-cx q[1],q[29];
-cx q[3],q[29];
-rz(4.497021559395162) q[29];
-cx q[3],q[29];
-rx(7.6700902313748855) q[29];
-ry(pi/2) q[30];
-rx(pi) q[30];
-cx q[3],q[30];
-rz(4.497021559395162) q[30];
-cx q[3],q[30];
-cx q[18],q[30];
-rz(4.497021559395162) q[30];
-cx q[18],q[30];
-rx(7.6700902313748855) q[18];
-ry(pi/2) q[31];
-rx(pi) q[31];
-cx q[12],q[31];
-rz(4.497021559395162) q[31];
-cx q[12],q[31];
-cx q[26],q[31];
-rz(4.497021559395162) q[31];
-cx q[26],q[31];
-rx(7.6700902313748855) q[26];
-rx(7.6700902313748855) q[31];
-ry(pi/2) q[32];
-rx(pi) q[32];
-cx q[0],q[32];
-rz(4.497021559395162) q[32];
-cx q[0],q[32];
-cx q[21],q[32];
-rz(4.497021559395162) q[32];
-cx q[21],q[32];
-ry(pi/2) q[33];
-rx(pi) q[33];
-cx q[5],q[33];
-rz(4.497021559395162) q[33];
-cx q[5],q[33];
-cx q[30],q[33];
-rz(4.497021559395162) q[33];
-cx q[30],q[33];
-rx(7.6700902313748855) q[33];
-ry(pi/2) q[34];
-rx(pi) q[34];
-cx q[3],q[34];
-rz(4.497021559395162) q[34];
-cx q[3],q[34];
-cx q[12],q[34];
-rz(4.497021559395162) q[34];
-cx q[12],q[34];
-ry(pi/2) q[35];
-rx(pi) q[35];
-cx q[3],q[35];
-rz(4.497021559395162) q[35];
-cx q[3],q[35];
-cx q[32],q[35];
-rz(4.497021559395162) q[35];
-cx q[32],q[35];
-rx(7.6700902313748855) q[32];
-rx(7.6700902313748855) q[35];
-ry(pi/2) q[36];
-rx(pi) q[36];
-cx q[15],q[36];
-rz(4.497021559395162) q[36];
-cx q[15],q[36];
-rx(7.6700902313748855) q[15];
-cx q[20],q[36];
-rz(4.497021559395162) q[36];
-cx q[20],q[36];
-rx(7.6700902313748855) q[36];
-ry(pi/2) q[37];
-rx(pi) q[37];
-cx q[10],q[37];
-rz(4.497021559395162) q[37];
-cx q[10],q[37];
-cx q[34],q[37];
-rz(4.497021559395162) q[37];
-cx q[34],q[37];
-rx(7.6700902313748855) q[34];
-rx(7.6700902313748855) q[37];
-ry(pi/2) q[38];
-rx(pi) q[38];
-cx q[19],q[38];
-rz(4.497021559395162) q[38];
-cx q[19],q[38];
-rx(7.6700902313748855) q[19];
-cx q[21],q[38];
-rz(4.497021559395162) q[38];
-cx q[21],q[38];
-rx(7.6700902313748855) q[21];
-ry(pi/2) q[39];
-rx(pi) q[39];
-cx q[3],q[39];
-rz(4.497021559395162) q[39];
-cx q[3],q[39];
-cx q[13],q[39];
-rz(4.497021559395162) q[39];
-cx q[13],q[39];
-rx(7.6700902313748855) q[13];
-rx(7.6700902313748855) q[39];
-ry(pi/2) q[40];
-rx(pi) q[40];
-cx q[3],q[40];
-rz(4.497021559395162) q[40];
-cx q[3],q[40];
-cx q[23],q[40];
-rz(4.497021559395162) q[40];
-cx q[23],q[40];
-rx(7.6700902313748855) q[23];
-rx(7.6700902313748855) q[40];
-ry(pi/2) q[41];
-rx(pi) q[41];
-cx q[10],q[41];
-rz(4.497021559395162) q[41];
-cx q[10],q[41];
-rx(7.6700902313748855) q[10];
-cx q[27],q[41];
-rz(4.497021559395162) q[41];
-cx q[27],q[41];
-rx(7.6700902313748855) q[27];
-rx(7.6700902313748855) q[41];
-ry(pi/2) q[42];
-rx(pi) q[42];
-cx q[0],q[42];
-rz(4.497021559395162) q[42];
-cx q[0],q[42];
-cx q[3],q[42];
-rz(4.497021559395162) q[42];
-cx q[3],q[42];
-rx(7.6700902313748855) q[42];
-ry(pi/2) q[43];
-rx(pi) q[43];
-cx q[3],q[43];
-rz(4.497021559395162) q[43];
-cx q[3],q[43];
-cx q[20],q[43];
-rz(4.497021559395162) q[43];
-cx q[20],q[43];
-rx(7.6700902313748855) q[20];
-rx(7.6700902313748855) q[43];
-ry(pi/2) q[44];
-rx(pi) q[44];
-cx q[3],q[44];
-rz(4.497021559395162) q[44];
-cx q[3],q[44];
-cx q[12],q[44];
-rz(4.497021559395162) q[44];
-cx q[12],q[44];
-rx(7.6700902313748855) q[44];
-ry(pi/2) q[45];
-rx(pi) q[45];
-cx q[1],q[45];
-rz(4.497021559395162) q[45];
-cx q[1],q[45];
-rx(7.6700902313748855) q[1];
-cx q[16],q[45];
-rz(4.497021559395162) q[45];
-cx q[16],q[45];
-rx(7.6700902313748855) q[16];
-rx(7.6700902313748855) q[45];
-ry(pi/2) q[46];
-rx(pi) q[46];
-cx q[5],q[46];
-rz(4.497021559395162) q[46];
-cx q[5],q[46];
-rx(7.6700902313748855) q[5];
-cx q[38],q[46];
-rz(4.497021559395162) q[46];
-cx q[38],q[46];
-rx(7.6700902313748855) q[38];
-rx(7.6700902313748855) q[46];
-ry(pi/2) q[47];
-rx(pi) q[47];
-cx q[4],q[47];
-rz(4.497021559395162) q[47];
-cx q[4],q[47];
-cx q[17],q[47];
-rz(4.497021559395162) q[47];
-cx q[17],q[47];
-rx(7.6700902313748855) q[17];
-rx(7.6700902313748855) q[47];
-ry(pi/2) q[48];
-rx(pi) q[48];
-cx q[0],q[48];
-rz(4.497021559395162) q[48];
-cx q[0],q[48];
-rx(7.6700902313748855) q[0];
-cx q[0],q[1];
-rz(4.190168984837896) q[1];
-cx q[0],q[1];
-cx q[0],q[2];
-rz(4.190168984837896) q[2];
-cx q[0],q[2];
-rx(12.125406473365363) q[2];
-cx q[30],q[48];
-rz(4.497021559395162) q[48];
-cx q[30],q[48];
-rx(7.6700902313748855) q[30];
-rx(7.6700902313748855) q[48];
-ry(pi/2) q[49];
-rx(pi) q[49];
-cx q[3],q[49];
-rz(4.497021559395162) q[49];
-cx q[3],q[49];
-cx q[4],q[49];
-rz(4.497021559395162) q[49];
-cx q[4],q[49];
-rx(7.6700902313748855) q[4];
-rx(7.6700902313748855) q[49];
-ry(pi/2) q[50];
-rx(pi) q[50];
-cx q[3],q[50];
-rz(4.497021559395162) q[50];
-cx q[3],q[50];
-rx(7.6700902313748855) q[3];
-cx q[0],q[3];
-rz(4.190168984837896) q[3];
-cx q[0],q[3];
-cx q[0],q[15];
-cx q[1],q[3];
-rz(4.190168984837896) q[3];
-cx q[1],q[3];
-cx q[1],q[4];
-rz(4.190168984837896) q[4];
-cx q[1],q[4];
-cx q[1],q[5];
-cx q[3],q[4];
-rz(4.190168984837896) q[4];
-cx q[3],q[4];
-cx q[4],q[6];
-rz(4.190168984837896) q[5];
-cx q[1],q[5];
-cx q[1],q[9];
-cx q[3],q[5];
-rz(4.190168984837896) q[5];
-cx q[3],q[5];
-cx q[3],q[7];
-rz(4.190168984837896) q[6];
-cx q[4],q[6];
-cx q[5],q[6];
-rz(4.190168984837896) q[6];
-cx q[5],q[6];
-rz(4.190168984837896) q[7];
-cx q[3],q[7];
-cx q[3],q[8];
-cx q[4],q[7];
-rz(4.190168984837896) q[7];
-cx q[4],q[7];
-cx q[4],q[10];
-rz(4.190168984837896) q[8];
-cx q[3],q[8];
-cx q[5],q[8];
-rz(4.190168984837896) q[8];
-cx q[5],q[8];
-cx q[5],q[11];
-rx(12.125406473365363) q[8];
-rz(4.190168984837896) q[9];
-cx q[1],q[9];
-cx q[1],q[17];
-cx q[3],q[9];
-rz(4.190168984837896) q[9];
-cx q[3],q[9];
-rz(4.190168984837896) q[10];
-cx q[4],q[10];
-cx q[4],q[13];
-cx q[6],q[10];
-rz(4.190168984837896) q[10];
-cx q[6],q[10];
-cx q[10],q[37];
-rz(4.190168984837896) q[11];
-cx q[5],q[11];
-cx q[6],q[11];
-rz(4.190168984837896) q[11];
-cx q[6],q[11];
-rx(12.125406473365363) q[11];
-cx q[12],q[50];
-rz(4.190168984837896) q[13];
-cx q[4],q[13];
-rz(4.190168984837896) q[15];
-cx q[0],q[15];
-cx q[0],q[16];
-rz(4.190168984837896) q[16];
-cx q[0],q[16];
-cx q[0],q[20];
-rz(4.190168984837896) q[17];
-cx q[1],q[17];
-cx q[1],q[28];
-rz(4.190168984837896) q[20];
-cx q[0],q[20];
-cx q[0],q[32];
-rz(4.190168984837896) q[28];
-cx q[1],q[28];
-cx q[1],q[29];
-rz(4.190168984837896) q[29];
-cx q[1],q[29];
-cx q[1],q[45];
-rz(4.190168984837896) q[32];
-cx q[0],q[32];
-cx q[0],q[42];
-rz(4.190168984837896) q[37];
-cx q[10],q[37];
-cx q[10],q[41];
-rz(4.190168984837896) q[41];
-cx q[10],q[41];
-rx(12.125406473365363) q[10];
-rz(4.190168984837896) q[42];
-cx q[0],q[42];
-cx q[0],q[48];
-rz(4.190168984837896) q[45];
-cx q[1],q[45];
-rx(12.125406473365363) q[1];
-rz(4.190168984837896) q[48];
-cx q[0],q[48];
-rx(12.125406473365363) q[0];
-cx q[0],q[1];
-rz(2.0871325308730375) q[1];
-cx q[0],q[1];
-cx q[0],q[2];
-rz(2.0871325308730375) q[2];
-cx q[0],q[2];
-rx(3.2683649427041925) q[2];
-rz(4.497021559395162) q[50];
-cx q[12],q[50];
-rx(7.6700902313748855) q[12];
-cx q[3],q[12];
-rz(4.190168984837896) q[12];
-cx q[3],q[12];
-cx q[3],q[14];
-cx q[5],q[12];
-rz(4.190168984837896) q[12];
-cx q[5],q[12];
-cx q[5],q[13];
-rz(4.190168984837896) q[13];
-cx q[5],q[13];
-rz(4.190168984837896) q[14];
-cx q[3],q[14];
-cx q[3],q[15];
-cx q[4],q[14];
-rz(4.190168984837896) q[14];
-cx q[4],q[14];
-rx(12.125406473365363) q[14];
-rz(4.190168984837896) q[15];
-cx q[3],q[15];
-cx q[3],q[16];
-cx q[15],q[20];
-rz(4.190168984837896) q[16];
-cx q[3],q[16];
-cx q[3],q[17];
-cx q[16],q[45];
-rz(4.190168984837896) q[17];
-cx q[3],q[17];
-cx q[3],q[18];
-rz(4.190168984837896) q[18];
-cx q[3],q[18];
-cx q[3],q[19];
-cx q[4],q[18];
-rz(4.190168984837896) q[18];
-cx q[4],q[18];
-cx q[4],q[21];
-rz(4.190168984837896) q[19];
-cx q[3],q[19];
-cx q[3],q[22];
-cx q[7],q[19];
-rz(4.190168984837896) q[19];
-cx q[7],q[19];
-rx(12.125406473365363) q[7];
-cx q[19],q[38];
-rz(4.190168984837896) q[20];
-cx q[15],q[20];
-rz(4.190168984837896) q[21];
-cx q[4],q[21];
-cx q[4],q[27];
-cx q[15],q[21];
-rz(4.190168984837896) q[21];
-cx q[15],q[21];
-cx q[15],q[36];
-rz(4.190168984837896) q[22];
-cx q[3],q[22];
-cx q[3],q[23];
-cx q[9],q[22];
-rz(4.190168984837896) q[22];
-cx q[9],q[22];
-rx(12.125406473365363) q[9];
-rx(12.125406473365363) q[22];
-rz(4.190168984837896) q[23];
-cx q[3],q[23];
-cx q[3],q[24];
-cx q[17],q[23];
-rz(4.190168984837896) q[23];
-cx q[17],q[23];
-rz(4.190168984837896) q[24];
-cx q[3],q[24];
-cx q[3],q[25];
-cx q[5],q[24];
-rz(4.190168984837896) q[24];
-cx q[5],q[24];
-cx q[5],q[33];
-rx(12.125406473365363) q[24];
-rz(4.190168984837896) q[25];
-cx q[3],q[25];
-cx q[3],q[26];
-cx q[12],q[25];
-rz(4.190168984837896) q[25];
-cx q[12],q[25];
-cx q[12],q[31];
-rx(12.125406473365363) q[25];
-rz(4.190168984837896) q[26];
-cx q[3],q[26];
-cx q[3],q[28];
-cx q[21],q[26];
-rz(4.190168984837896) q[26];
-cx q[21],q[26];
-cx q[21],q[32];
-rz(4.190168984837896) q[27];
-cx q[4],q[27];
-cx q[4],q[47];
-cx q[6],q[27];
-rz(4.190168984837896) q[27];
-cx q[6],q[27];
-rx(12.125406473365363) q[6];
-cx q[27],q[41];
-rz(4.190168984837896) q[28];
-cx q[3],q[28];
-cx q[3],q[29];
-rx(12.125406473365363) q[28];
-rz(4.190168984837896) q[29];
-cx q[3],q[29];
-cx q[3],q[30];
-rx(12.125406473365363) q[29];
-rz(4.190168984837896) q[30];
-cx q[3],q[30];
-cx q[3],q[34];
-cx q[18],q[30];
-rz(4.190168984837896) q[30];
-cx q[18],q[30];
-rx(12.125406473365363) q[18];
-rz(4.190168984837896) q[31];
-cx q[12],q[31];
-cx q[26],q[31];
-rz(4.190168984837896) q[31];
-cx q[26],q[31];
-rx(12.125406473365363) q[26];
-rx(12.125406473365363) q[31];
-rz(4.190168984837896) q[32];
-cx q[21],q[32];
-rz(4.190168984837896) q[33];
-cx q[5],q[33];
-cx q[5],q[46];
-cx q[30],q[33];
-rz(4.190168984837896) q[33];
-cx q[30],q[33];
-cx q[30],q[48];
-rx(12.125406473365363) q[33];
-rz(4.190168984837896) q[34];
-cx q[3],q[34];
-cx q[3],q[35];
-cx q[12],q[34];
-rz(4.190168984837896) q[34];
-cx q[12],q[34];
-cx q[34],q[37];
-rz(4.190168984837896) q[35];
-cx q[3],q[35];
-cx q[3],q[39];
-cx q[32],q[35];
-rz(4.190168984837896) q[35];
-cx q[32],q[35];
-rx(12.125406473365363) q[32];
-rx(12.125406473365363) q[35];
-rz(4.190168984837896) q[36];
-cx q[15],q[36];
-rx(12.125406473365363) q[15];
-cx q[20],q[36];
-rz(4.190168984837896) q[36];
-cx q[20],q[36];
-rx(12.125406473365363) q[36];
-rz(4.190168984837896) q[37];
-cx q[34],q[37];
-rx(12.125406473365363) q[34];
-rx(12.125406473365363) q[37];
-rz(4.190168984837896) q[38];
-cx q[19],q[38];
-rx(12.125406473365363) q[19];
-cx q[21],q[38];
-rz(4.190168984837896) q[38];
-cx q[21],q[38];
-rx(12.125406473365363) q[21];
-rz(4.190168984837896) q[39];
-cx q[3],q[39];
-cx q[3],q[40];
-cx q[13],q[39];
-rz(4.190168984837896) q[39];
-cx q[13],q[39];
-rx(12.125406473365363) q[13];
-rx(12.125406473365363) q[39];
-rz(4.190168984837896) q[40];
-cx q[3],q[40];
-cx q[3],q[42];
-cx q[23],q[40];
-rz(4.190168984837896) q[40];
-cx q[23],q[40];
-rx(12.125406473365363) q[23];
-rx(12.125406473365363) q[40];
-rz(4.190168984837896) q[41];
-cx q[27],q[41];
-rx(12.125406473365363) q[27];
-rx(12.125406473365363) q[41];
-rz(4.190168984837896) q[42];
-cx q[3],q[42];
-cx q[3],q[43];
-rx(12.125406473365363) q[42];
-rz(4.190168984837896) q[43];
-cx q[3],q[43];
-cx q[3],q[44];
-cx q[20],q[43];
-rz(4.190168984837896) q[43];
-cx q[20],q[43];
-rx(12.125406473365363) q[20];
-rx(12.125406473365363) q[43];
-rz(4.190168984837896) q[44];
-cx q[3],q[44];
-cx q[3],q[49];
-cx q[12],q[44];
-rz(4.190168984837896) q[44];
-cx q[12],q[44];
-rx(12.125406473365363) q[44];
-rz(4.190168984837896) q[45];
-cx q[16],q[45];
-rx(12.125406473365363) q[16];
-rx(12.125406473365363) q[45];
-rz(4.190168984837896) q[46];
-cx q[5],q[46];
-rx(12.125406473365363) q[5];
-cx q[38],q[46];
-rz(4.190168984837896) q[46];
-cx q[38],q[46];
-rx(12.125406473365363) q[38];
-rx(12.125406473365363) q[46];
-rz(4.190168984837896) q[47];
-cx q[4],q[47];
-cx q[17],q[47];
-rz(4.190168984837896) q[47];
-cx q[17],q[47];
-rx(12.125406473365363) q[17];
-rx(12.125406473365363) q[47];
-rz(4.190168984837896) q[48];
-cx q[30],q[48];
-rx(12.125406473365363) q[30];
-rx(12.125406473365363) q[48];
-rz(4.190168984837896) q[49];
-cx q[3],q[49];
-cx q[4],q[49];
-rz(4.190168984837896) q[49];
-cx q[4],q[49];
-rx(12.125406473365363) q[4];
-rx(12.125406473365363) q[49];
-rx(7.6700902313748855) q[50];
-cx q[3],q[50];
-rz(4.190168984837896) q[50];
-cx q[3],q[50];
-rx(12.125406473365363) q[3];
-cx q[0],q[3];
-rz(2.0871325308730375) q[3];
-cx q[0],q[3];
-cx q[0],q[15];
-cx q[1],q[3];
-rz(2.0871325308730375) q[3];
-cx q[1],q[3];
-cx q[1],q[4];
-rz(2.0871325308730375) q[4];
-cx q[1],q[4];
-cx q[1],q[5];
-cx q[3],q[4];
-rz(2.0871325308730375) q[4];
-cx q[3],q[4];
-cx q[4],q[6];
-rz(2.0871325308730375) q[5];
-cx q[1],q[5];
-cx q[1],q[9];
-cx q[3],q[5];
-rz(2.0871325308730375) q[5];
-cx q[3],q[5];
-cx q[3],q[7];
-rz(2.0871325308730375) q[6];
-cx q[4],q[6];
-cx q[5],q[6];
-rz(2.0871325308730375) q[6];
-cx q[5],q[6];
-rz(2.0871325308730375) q[7];
-cx q[3],q[7];
-cx q[3],q[8];
-cx q[4],q[7];
-rz(2.0871325308730375) q[7];
-cx q[4],q[7];
-cx q[4],q[10];
-rz(2.0871325308730375) q[8];
-cx q[3],q[8];
-cx q[5],q[8];
-rz(2.0871325308730375) q[8];
-cx q[5],q[8];
-cx q[5],q[11];
-rx(3.2683649427041925) q[8];
-rz(2.0871325308730375) q[9];
-cx q[1],q[9];
-cx q[1],q[17];
-cx q[3],q[9];
-rz(2.0871325308730375) q[9];
-cx q[3],q[9];
-rz(2.0871325308730375) q[10];
-cx q[4],q[10];
-cx q[4],q[13];
-cx q[6],q[10];
-rz(2.0871325308730375) q[10];
-cx q[6],q[10];
-cx q[10],q[37];
-rz(2.0871325308730375) q[11];
-cx q[5],q[11];
-cx q[6],q[11];
-rz(2.0871325308730375) q[11];
-cx q[6],q[11];
-rx(3.2683649427041925) q[11];
-cx q[12],q[50];
-rz(2.0871325308730375) q[13];
-cx q[4],q[13];
-rz(2.0871325308730375) q[15];
-cx q[0],q[15];
-cx q[0],q[16];
-rz(2.0871325308730375) q[16];
-cx q[0],q[16];
-cx q[0],q[20];
-rz(2.0871325308730375) q[17];
-cx q[1],q[17];
-cx q[1],q[28];
-rz(2.0871325308730375) q[20];
-cx q[0],q[20];
-cx q[0],q[32];
-rz(2.0871325308730375) q[28];
-cx q[1],q[28];
-cx q[1],q[29];
-rz(2.0871325308730375) q[29];
-cx q[1],q[29];
-cx q[1],q[45];
-rz(2.0871325308730375) q[32];
-cx q[0],q[32];
-cx q[0],q[42];
-rz(2.0871325308730375) q[37];
-cx q[10],q[37];
-cx q[10],q[41];
-rz(2.0871325308730375) q[41];
-cx q[10],q[41];
-rx(3.2683649427041925) q[10];
-rz(2.0871325308730375) q[42];
-cx q[0],q[42];
-cx q[0],q[48];
-rz(2.0871325308730375) q[45];
-cx q[1],q[45];
-rx(3.2683649427041925) q[1];
-rz(2.0871325308730375) q[48];
-cx q[0],q[48];
-rx(3.2683649427041925) q[0];
-rz(4.190168984837896) q[50];
-cx q[12],q[50];
-rx(12.125406473365363) q[12];
-cx q[3],q[12];
-rz(2.0871325308730375) q[12];
-cx q[3],q[12];
-cx q[3],q[14];
-cx q[5],q[12];
-rz(2.0871325308730375) q[12];
-cx q[5],q[12];
-cx q[5],q[13];
-rz(2.0871325308730375) q[13];
-cx q[5],q[13];
-rz(2.0871325308730375) q[14];
-cx q[3],q[14];
-cx q[3],q[15];
-cx q[4],q[14];
-rz(2.0871325308730375) q[14];
-cx q[4],q[14];
-rx(3.2683649427041925) q[14];
-rz(2.0871325308730375) q[15];
-cx q[3],q[15];
-cx q[3],q[16];
-cx q[15],q[20];
-rz(2.0871325308730375) q[16];
-cx q[3],q[16];
-cx q[3],q[17];
-cx q[16],q[45];
-rz(2.0871325308730375) q[17];
-cx q[3],q[17];
-cx q[3],q[18];
-rz(2.0871325308730375) q[18];
-cx q[3],q[18];
-cx q[3],q[19];
-cx q[4],q[18];
-rz(2.0871325308730375) q[18];
-cx q[4],q[18];
-cx q[4],q[21];
-rz(2.0871325308730375) q[19];
-cx q[3],q[19];
-cx q[3],q[22];
-cx q[7],q[19];
-rz(2.0871325308730375) q[19];
-cx q[7],q[19];
-rx(3.2683649427041925) q[7];
-cx q[19],q[38];
-rz(2.0871325308730375) q[20];
-cx q[15],q[20];
-rz(2.0871325308730375) q[21];
-cx q[4],q[21];
-cx q[4],q[27];
-cx q[15],q[21];
-rz(2.0871325308730375) q[21];
-cx q[15],q[21];
-cx q[15],q[36];
-rz(2.0871325308730375) q[22];
-cx q[3],q[22];
-cx q[3],q[23];
-cx q[9],q[22];
-rz(2.0871325308730375) q[22];
-cx q[9],q[22];
-rx(3.2683649427041925) q[9];
-rx(3.2683649427041925) q[22];
-rz(2.0871325308730375) q[23];
-cx q[3],q[23];
-cx q[3],q[24];
-cx q[17],q[23];
-rz(2.0871325308730375) q[23];
-cx q[17],q[23];
-rz(2.0871325308730375) q[24];
-cx q[3],q[24];
-cx q[3],q[25];
-cx q[5],q[24];
-rz(2.0871325308730375) q[24];
-cx q[5],q[24];
-cx q[5],q[33];
-rx(3.2683649427041925) q[24];
-rz(2.0871325308730375) q[25];
-cx q[3],q[25];
-cx q[3],q[26];
-cx q[12],q[25];
-rz(2.0871325308730375) q[25];
-cx q[12],q[25];
-cx q[12],q[31];
-rx(3.2683649427041925) q[25];
-rz(2.0871325308730375) q[26];
-cx q[3],q[26];
-cx q[3],q[28];
-cx q[21],q[26];
-rz(2.0871325308730375) q[26];
-cx q[21],q[26];
-cx q[21],q[32];
-rz(2.0871325308730375) q[27];
-cx q[4],q[27];
-cx q[4],q[47];
-cx q[6],q[27];
-rz(2.0871325308730375) q[27];
-cx q[6],q[27];
-rx(3.2683649427041925) q[6];
-cx q[27],q[41];
-rz(2.0871325308730375) q[28];
-cx q[3],q[28];
-cx q[3],q[29];
-rx(3.2683649427041925) q[28];
-rz(2.0871325308730375) q[29];
-cx q[3],q[29];
-cx q[3],q[30];
-rx(3.2683649427041925) q[29];
-rz(2.0871325308730375) q[30];
-cx q[3],q[30];
-cx q[3],q[34];
-cx q[18],q[30];
-rz(2.0871325308730375) q[30];
-cx q[18],q[30];
-rx(3.2683649427041925) q[18];
-rz(2.0871325308730375) q[31];
-cx q[12],q[31];
-cx q[26],q[31];
-rz(2.0871325308730375) q[31];
-cx q[26],q[31];
-rx(3.2683649427041925) q[26];
-rx(3.2683649427041925) q[31];
-rz(2.0871325308730375) q[32];
-cx q[21],q[32];
-rz(2.0871325308730375) q[33];
-cx q[5],q[33];
-cx q[5],q[46];
-cx q[30],q[33];
-rz(2.0871325308730375) q[33];
-cx q[30],q[33];
-cx q[30],q[48];
-rx(3.2683649427041925) q[33];
-rz(2.0871325308730375) q[34];
-cx q[3],q[34];
-cx q[3],q[35];
-cx q[12],q[34];
-rz(2.0871325308730375) q[34];
-cx q[12],q[34];
-cx q[34],q[37];
-rz(2.0871325308730375) q[35];
-cx q[3],q[35];
-cx q[3],q[39];
-cx q[32],q[35];
-rz(2.0871325308730375) q[35];
-cx q[32],q[35];
-rx(3.2683649427041925) q[32];
-rx(3.2683649427041925) q[35];
-rz(2.0871325308730375) q[36];
-cx q[15],q[36];
-rx(3.2683649427041925) q[15];
-cx q[20],q[36];
-rz(2.0871325308730375) q[36];
-cx q[20],q[36];
-rx(3.2683649427041925) q[36];
-rz(2.0871325308730375) q[37];
-cx q[34],q[37];
-rx(3.2683649427041925) q[34];
-rx(3.2683649427041925) q[37];
-rz(2.0871325308730375) q[38];
-cx q[19],q[38];
-rx(3.2683649427041925) q[19];
-cx q[21],q[38];
-rz(2.0871325308730375) q[38];
-cx q[21],q[38];
-rx(3.2683649427041925) q[21];
-rz(2.0871325308730375) q[39];
-cx q[3],q[39];
-cx q[3],q[40];
-cx q[13],q[39];
-rz(2.0871325308730375) q[39];
-cx q[13],q[39];
-rx(3.2683649427041925) q[13];
-rx(3.2683649427041925) q[39];
-rz(2.0871325308730375) q[40];
-cx q[3],q[40];
-cx q[3],q[42];
-cx q[23],q[40];
-rz(2.0871325308730375) q[40];
-cx q[23],q[40];
-rx(3.2683649427041925) q[23];
-rx(3.2683649427041925) q[40];
-rz(2.0871325308730375) q[41];
-cx q[27],q[41];
-rx(3.2683649427041925) q[27];
-rx(3.2683649427041925) q[41];
-rz(2.0871325308730375) q[42];
-cx q[3],q[42];
-cx q[3],q[43];
-rx(3.2683649427041925) q[42];
-rz(2.0871325308730375) q[43];
-cx q[3],q[43];
-cx q[3],q[44];
-cx q[20],q[43];
-rz(2.0871325308730375) q[43];
-cx q[20],q[43];
-rx(3.2683649427041925) q[20];
-rx(3.2683649427041925) q[43];
-rz(2.0871325308730375) q[44];
-cx q[3],q[44];
-cx q[3],q[49];
-cx q[12],q[44];
-rz(2.0871325308730375) q[44];
-cx q[12],q[44];
-rx(3.2683649427041925) q[44];
-rz(2.0871325308730375) q[45];
-cx q[16],q[45];
-rx(3.2683649427041925) q[16];
-rx(3.2683649427041925) q[45];
-rz(2.0871325308730375) q[46];
-cx q[5],q[46];
-rx(3.2683649427041925) q[5];
-cx q[38],q[46];
-rz(2.0871325308730375) q[46];
-cx q[38],q[46];
-rx(3.2683649427041925) q[38];
-rx(3.2683649427041925) q[46];
-rz(2.0871325308730375) q[47];
-cx q[4],q[47];
-cx q[17],q[47];
-rz(2.0871325308730375) q[47];
-cx q[17],q[47];
-rx(3.2683649427041925) q[17];
-rx(3.2683649427041925) q[47];
-rz(2.0871325308730375) q[48];
-cx q[30],q[48];
-rx(3.2683649427041925) q[30];
-rx(3.2683649427041925) q[48];
-rz(2.0871325308730375) q[49];
-cx q[3],q[49];
-cx q[4],q[49];
-rz(2.0871325308730375) q[49];
-cx q[4],q[49];
-rx(3.2683649427041925) q[4];
-rx(3.2683649427041925) q[49];
-rx(12.125406473365363) q[50];
-cx q[3],q[50];
-rz(2.0871325308730375) q[50];
-cx q[3],q[50];
-rx(3.2683649427041925) q[3];
-cx q[12],q[50];
-rz(2.0871325308730375) q[50];
-cx q[12],q[50];
-rx(3.2683649427041925) q[12];
-rx(3.2683649427041925) q[50];
\ No newline at end of file
@@ -1,1186 +0,0 @@
-OPENQASM 2.0;
-include "qelib1.inc";
-qreg q[53];
-ry(pi/2) q[0];
-rx(pi) q[0];
-ry(pi/2) q[1];
-rx(pi) q[1];
-cx q[0],q[1];
-rz(2.06403085877189) q[1];
-cx q[0],q[1];
-ry(pi/2) q[2];
-rx(pi) q[2];
-cx q[0],q[2];
-rz(2.06403085877189) q[2];
-cx q[0],q[2];
-rx(10.515414094017396) q[2];
-ry(pi/2) q[3];
-rx(pi) q[3];
-cx q[0],q[3];
-rz(2.06403085877189) q[3];
-cx q[0],q[3];
-cx q[1],q[3];
-rz(2.06403085877189) q[3];
-cx q[1],q[3];
-ry(pi/2) q[4];
-rx(pi) q[4];
-cx q[1],q[4];
-rz(2.06403085877189) q[4];
-cx q[1],q[4];
-cx q[3],q[4];
-rz(2.06403085877189) q[4];
-cx q[3],q[4];
-ry(pi/2) q[5];
-rx(pi) q[5];
-cx q[1],q[5];
-rz(2.06403085877189) q[5];
-cx q[1],q[5];
-cx q[3],q[5];
-rz(2.06403085877189) q[5];
-cx q[3],q[5];
-ry(pi/2) q[6];
-rx(pi) q[6];
-cx q[4],q[6];
-rz(2.06403085877189) q[6];
-cx q[4],q[6];
-cx q[5],q[6];
-rz(2.06403085877189) q[6];
-cx q[5],q[6];
-ry(pi/2) q[7];
-rx(pi) q[7];
-cx q[3],q[7];
-rz(2.06403085877189) q[7];
-cx q[3],q[7];
-cx q[4],q[7];
-rz(2.06403085877189) q[7];
-cx q[4],q[7];
-ry(pi/2) q[8];
-rx(pi) q[8];
-cx q[3],q[8];
-rz(2.06403085877189) q[8];
-cx q[3],q[8];
-cx q[5],q[8];
-rz(2.06403085877189) q[8];
-cx q[5],q[8];
-rx(10.515414094017396) q[8];
-ry(pi/2) q[9];
-rx(pi) q[9];
-cx q[1],q[9];
-rz(2.06403085877189) q[9];
-cx q[1],q[9];
-cx q[3],q[9];
-rz(2.06403085877189) q[9];
-cx q[3],q[9];
-ry(pi/2) q[10];
-rx(pi) q[10];
-cx q[4],q[10];
-rz(2.06403085877189) q[10];
-cx q[4],q[10];
-cx q[6],q[10];
-rz(2.06403085877189) q[10];
-cx q[6],q[10];
-ry(pi/2) q[11];
-rx(pi) q[11];
-cx q[5],q[11];
-rz(2.06403085877189) q[11];
-cx q[5],q[11];
-cx q[6],q[11];
-rz(2.06403085877189) q[11];
-cx q[6],q[11];
-rx(10.515414094017396) q[11];
-ry(pi/2) q[12];
-rx(pi) q[12];
-cx q[3],q[12];
-rz(2.06403085877189) q[12];
-cx q[3],q[12];
-cx q[5],q[12];
-rz(2.06403085877189) q[12];
-cx q[5],q[12];
-ry(pi/2) q[13];
-rx(pi) q[13];
-cx q[4],q[13];
-rz(2.06403085877189) q[13];
-cx q[4],q[13];
-cx q[5],q[13];
-rz(2.06403085877189) q[13];
-cx q[5],q[13];
-ry(pi/2) q[14];
-rx(pi) q[14];
-cx q[3],q[14];
-rz(2.06403085877189) q[14];
-cx q[3],q[14];
-cx q[4],q[14];
-rz(2.06403085877189) q[14];
-cx q[4],q[14];
-rx(10.515414094017396) q[14];
-ry(pi/2) q[15];
-rx(pi) q[15];
-cx q[0],q[15];
-rz(2.06403085877189) q[15];
-cx q[0],q[15];
-cx q[3],q[15];
-rz(2.06403085877189) q[15];
-cx q[3],q[15];
-ry(pi/2) q[16];
-rx(pi) q[16];
-cx q[0],q[16];
-rz(2.06403085877189) q[16];
-cx q[0],q[16];
-cx q[3],q[16];
-rz(2.06403085877189) q[16];
-cx q[3],q[16];
-ry(pi/2) q[17];
-rx(pi) q[17];
-cx q[1],q[17];
-rz(2.06403085877189) q[17];
-cx q[1],q[17];
-cx q[3],q[17];
-rz(2.06403085877189) q[17];
-cx q[3],q[17];
-ry(pi/2) q[18];
-rx(pi) q[18];
-cx q[3],q[18];
-rz(2.06403085877189) q[18];
-cx q[3],q[18];
-cx q[4],q[18];
-rz(2.06403085877189) q[18];
-cx q[4],q[18];
-ry(pi/2) q[19];
-rx(pi) q[19];
-cx q[3],q[19];
-rz(2.06403085877189) q[19];
-cx q[3],q[19];
-cx q[7],q[19];
-rz(2.06403085877189) q[19];
-cx q[7],q[19];
-rx(10.515414094017396) q[7];
-ry(pi/2) q[20];
-rx(pi) q[20];
-cx q[0],q[20];
-rz(2.06403085877189) q[20];
-cx q[0],q[20];
-cx q[15],q[20];
-rz(2.06403085877189) q[20];
-cx q[15],q[20];
-ry(pi/2) q[21];
-rx(pi) q[21];
-cx q[4],q[21];
-rz(2.06403085877189) q[21];
-cx q[4],q[21];
-cx q[15],q[21];
-rz(2.06403085877189) q[21];
-cx q[15],q[21];
-ry(pi/2) q[22];
-rx(pi) q[22];
-cx q[3],q[22];
-rz(2.06403085877189) q[22];
-cx q[3],q[22];
-cx q[9],q[22];
-rz(2.06403085877189) q[22];
-cx q[9],q[22];
-rx(10.515414094017396) q[9];
-rx(10.515414094017396) q[22];
-ry(pi/2) q[23];
-rx(pi) q[23];
-cx q[3],q[23];
-rz(2.06403085877189) q[23];
-cx q[3],q[23];
-cx q[17],q[23];
-rz(2.06403085877189) q[23];
-cx q[17],q[23];
-ry(pi/2) q[24];
-rx(pi) q[24];
-cx q[3],q[24];
-rz(2.06403085877189) q[24];
-cx q[3],q[24];
-cx q[5],q[24];
-rz(2.06403085877189) q[24];
-cx q[5],q[24];
-rx(10.515414094017396) q[24];
-ry(pi/2) q[25];
-rx(pi) q[25];
-cx q[3],q[25];
-rz(2.06403085877189) q[25];
-cx q[3],q[25];
-cx q[12],q[25];
-rz(2.06403085877189) q[25];
-cx q[12],q[25];
-rx(10.515414094017396) q[25];
-ry(pi/2) q[26];
-rx(pi) q[26];
-cx q[3],q[26];
-rz(2.06403085877189) q[26];
-cx q[3],q[26];
-cx q[21],q[26];
-rz(2.06403085877189) q[26];
-cx q[21],q[26];
-ry(pi/2) q[27];
-rx(pi) q[27];
-cx q[4],q[27];
-rz(2.06403085877189) q[27];
-cx q[4],q[27];
-cx q[6],q[27];
-rz(2.06403085877189) q[27];
-cx q[6],q[27];
-rx(10.515414094017396) q[6];
-ry(pi/2) q[28];
-rx(pi) q[28];
-cx q[1],q[28];
-rz(2.06403085877189) q[28];
-cx q[1],q[28];
-cx q[3],q[28];
-rz(2.06403085877189) q[28];
-cx q[3],q[28];
-ry(pi/2) q[29];
-rx(pi) q[29];
-cx q[1],q[29];
-rz(2.06403085877189) q[29];
-cx q[1],q[29];
-cx q[3],q[29];
-rz(2.06403085877189) q[29];
-cx q[3],q[29];
-rx(10.515414094017396) q[29];
-ry(pi/2) q[30];
-rx(pi) q[30];
-cx q[3],q[30];
-rz(2.06403085877189) q[30];
-cx q[3],q[30];
-cx q[18],q[30];
-rz(2.06403085877189) q[30];
-cx q[18],q[30];
-rx(10.515414094017396) q[18];
-ry(pi/2) q[31];
-rx(pi) q[31];
-cx q[12],q[31];
-rz(2.06403085877189) q[31];
-cx q[12],q[31];
-cx q[26],q[31];
-rz(2.06403085877189) q[31];
-cx q[26],q[31];
-rx(10.515414094017396) q[26];
-rx(10.515414094017396) q[31];
-ry(pi/2) q[32];
-rx(pi) q[32];
-cx q[0],q[32];
-rz(2.06403085877189) q[32];
-cx q[0],q[32];
-cx q[21],q[32];
-rz(2.06403085877189) q[32];
-cx q[21],q[32];
-ry(pi/2) q[33];
-rx(pi) q[33];
-cx q[5],q[33];
-rz(2.06403085877189) q[33];
-cx q[5],q[33];
-cx q[30],q[33];
-rz(2.06403085877189) q[33];
-cx q[30],q[33];
-rx(10.515414094017396) q[33];
-ry(pi/2) q[34];
-rx(pi) q[34];
-cx q[3],q[34];
-rz(2.06403085877189) q[34];
-cx q[3],q[34];
-cx q[12],q[34];
-rz(2.06403085877189) q[34];
-cx q[12],q[34];
-ry(pi/2) q[35];
-rx(pi) q[35];
-cx q[3],q[35];
-rz(2.06403085877189) q[35];
-cx q[3],q[35];
-cx q[32],q[35];
-rz(2.06403085877189) q[35];
-cx q[32],q[35];
-rx(10.515414094017396) q[32];
-rx(10.515414094017396) q[35];
-ry(pi/2) q[36];
-rx(pi) q[36];
-cx q[15],q[36];
-rz(2.06403085877189) q[36];
-cx q[15],q[36];
-rx(10.515414094017396) q[15];
-cx q[20],q[36];
-rz(2.06403085877189) q[36];
-cx q[20],q[36];
-rx(10.515414094017396) q[36];
-ry(pi/2) q[37];
-rx(pi) q[37];
-cx q[10],q[37];
-rz(2.06403085877189) q[37];
-cx q[10],q[37];
-cx q[34],q[37];
-rz(2.06403085877189) q[37];
-cx q[34],q[37];
-rx(10.515414094017396) q[34];
-rx(10.515414094017396) q[37];
-ry(pi/2) q[38];
-rx(pi) q[38];
-cx q[19],q[38];
-rz(2.06403085877189) q[38];
-cx q[19],q[38];
-rx(10.515414094017396) q[19];
-cx q[21],q[38];
-rz(2.06403085877189) q[38];
-cx q[21],q[38];
-rx(10.515414094017396) q[21];
-ry(pi/2) q[39];
-rx(pi) q[39];
-cx q[3],q[39];
-rz(2.06403085877189) q[39];
-cx q[3],q[39];
-cx q[13],q[39];
-rz(2.06403085877189) q[39];
-cx q[13],q[39];
-rx(10.515414094017396) q[13];
-rx(10.515414094017396) q[39];
-ry(pi/2) q[40];
-rx(pi) q[40];
-cx q[3],q[40];
-rz(2.06403085877189) q[40];
-cx q[3],q[40];
-cx q[23],q[40];
-rz(2.06403085877189) q[40];
-cx q[23],q[40];
-rx(10.515414094017396) q[23];
-rx(10.515414094017396) q[40];
-ry(pi/2) q[41];
-rx(pi) q[41];
-cx q[10],q[41];
-rz(2.06403085877189) q[41];
-cx q[10],q[41];
-cx q[27],q[41];
-rz(2.06403085877189) q[41];
-cx q[27],q[41];
-rx(10.515414094017396) q[27];
-rx(10.515414094017396) q[41];
-ry(pi/2) q[42];
-rx(pi) q[42];
-cx q[0],q[42];
-rz(2.06403085877189) q[42];
-cx q[0],q[42];
-cx q[3],q[42];
-rz(2.06403085877189) q[42];
-cx q[3],q[42];
-rx(10.515414094017396) q[42];
-ry(pi/2) q[43];
-rx(pi) q[43];
-cx q[3],q[43];
-rz(2.06403085877189) q[43];
-cx q[3],q[43];
-cx q[20],q[43];
-rz(2.06403085877189) q[43];
-cx q[20],q[43];
-rx(10.515414094017396) q[20];
-rx(10.515414094017396) q[43];
-ry(pi/2) q[44];
-rx(pi) q[44];
-cx q[3],q[44];
-rz(2.06403085877189) q[44];
-cx q[3],q[44];
-cx q[12],q[44];
-rz(2.06403085877189) q[44];
-cx q[12],q[44];
-rx(10.515414094017396) q[44];
-ry(pi/2) q[45];
-rx(pi) q[45];
-cx q[1],q[45];
-rz(2.06403085877189) q[45];
-cx q[1],q[45];
-rx(10.515414094017396) q[1];
-cx q[16],q[45];
-rz(2.06403085877189) q[45];
-cx q[16],q[45];
-rx(10.515414094017396) q[16];
-rx(10.515414094017396) q[45];
-ry(pi/2) q[46];
-rx(pi) q[46];
-cx q[5],q[46];
-rz(2.06403085877189) q[46];
-cx q[5],q[46];
-rx(10.515414094017396) q[5];
-cx q[38],q[46];
-rz(2.06403085877189) q[46];
-cx q[38],q[46];
-rx(10.515414094017396) q[38];
-rx(10.515414094017396) q[46];
-ry(pi/2) q[47];
-rx(pi) q[47];
-cx q[4],q[47];
-rz(2.06403085877189) q[47];
-cx q[4],q[47];
-cx q[17],q[47];
-rz(2.06403085877189) q[47];
-cx q[17],q[47];
-rx(10.515414094017396) q[17];
-rx(10.515414094017396) q[47];
-ry(pi/2) q[48];
-rx(pi) q[48];
-cx q[0],q[48];
-rz(2.06403085877189) q[48];
-cx q[0],q[48];
-cx q[30],q[48];
-rz(2.06403085877189) q[48];
-cx q[30],q[48];
-rx(10.515414094017396) q[30];
-rx(10.515414094017396) q[48];
-ry(pi/2) q[49];
-rx(pi) q[49];
-cx q[3],q[49];
-rz(2.06403085877189) q[49];
-cx q[3],q[49];
-cx q[4],q[49];
-rz(2.06403085877189) q[49];
-cx q[4],q[49];
-rx(10.515414094017396) q[4];
-rx(10.515414094017396) q[49];
-ry(pi/2) q[50];
-rx(pi) q[50];
-cx q[3],q[50];
-rz(2.06403085877189) q[50];
-cx q[3],q[50];
-cx q[12],q[50];
-rz(2.06403085877189) q[50];
-cx q[12],q[50];
-rx(10.515414094017396) q[12];
-rx(10.515414094017396) q[50];
-ry(pi/2) q[51];
-rx(pi) q[51];
-cx q[0],q[51];
-rz(2.06403085877189) q[51];
-cx q[0],q[51];
-rx(10.515414094017396) q[0];
-cx q[0],q[1];
-rz(4.729686424173932) q[1];
-cx q[0],q[1];
-cx q[0],q[2];
-rz(4.729686424173932) q[2];
-cx q[0],q[2];
-rx(5.487124544933388) q[2];
-cx q[28],q[51];
-rz(2.06403085877189) q[51];
-cx q[28],q[51];
-rx(10.515414094017396) q[28];
-rx(10.515414094017396) q[51];
-ry(pi/2) q[52];
-rx(pi) q[52];
-cx q[3],q[52];
-rz(2.06403085877189) q[52];
-cx q[3],q[52];
-rx(10.515414094017396) q[3];
-cx q[0],q[3];
-rz(4.729686424173932) q[3];
-cx q[0],q[3];
-cx q[0],q[15];
-cx q[1],q[3];
-rz(4.729686424173932) q[3];
-cx q[1],q[3];
-cx q[1],q[4];
-rz(4.729686424173932) q[4];
-cx q[1],q[4];
-cx q[1],q[5];
-cx q[3],q[4];
-rz(4.729686424173932) q[4];
-cx q[3],q[4];
-cx q[4],q[6];
-rz(4.729686424173932) q[5];
-cx q[1],q[5];
-cx q[1],q[9];
-cx q[3],q[5];
-rz(4.729686424173932) q[5];
-cx q[3],q[5];
-cx q[3],q[7];
-rz(4.729686424173932) q[6];
-cx q[4],q[6];
-cx q[5],q[6];
-rz(4.729686424173932) q[6];
-cx q[5],q[6];
-rz(4.729686424173932) q[7];
-cx q[3],q[7];
-cx q[3],q[8];
-cx q[4],q[7];
-rz(4.729686424173932) q[7];
-cx q[4],q[7];
-rz(4.729686424173932) q[8];
-cx q[3],q[8];
-cx q[5],q[8];
-rz(4.729686424173932) q[8];
-cx q[5],q[8];
-cx q[5],q[11];
-rx(5.487124544933388) q[8];
-rz(4.729686424173932) q[9];
-cx q[1],q[9];
-cx q[1],q[17];
-cx q[3],q[9];
-rz(4.729686424173932) q[9];
-cx q[3],q[9];
-cx q[3],q[12];
-cx q[10],q[52];
-rz(4.729686424173932) q[11];
-cx q[5],q[11];
-rz(4.729686424173932) q[12];
-cx q[3],q[12];
-cx q[3],q[14];
-cx q[5],q[12];
-rz(4.729686424173932) q[12];
-cx q[5],q[12];
-rz(4.729686424173932) q[14];
-cx q[3],q[14];
-rz(4.729686424173932) q[15];
-cx q[0],q[15];
-cx q[0],q[16];
-cx q[3],q[15];
-rz(4.729686424173932) q[15];
-cx q[3],q[15];
-rz(4.729686424173932) q[16];
-cx q[0],q[16];
-cx q[0],q[20];
-cx q[3],q[16];
-rz(4.729686424173932) q[16];
-cx q[3],q[16];
-rz(4.729686424173932) q[17];
-cx q[1],q[17];
-cx q[1],q[28];
-cx q[3],q[17];
-rz(4.729686424173932) q[17];
-cx q[3],q[17];
-cx q[3],q[18];
-rz(4.729686424173932) q[18];
-cx q[3],q[18];
-cx q[3],q[19];
-rz(4.729686424173932) q[19];
-cx q[3],q[19];
-cx q[3],q[22];
-cx q[7],q[19];
-rz(4.729686424173932) q[19];
-cx q[7],q[19];
-rx(5.487124544933388) q[7];
-cx q[19],q[38];
-rz(4.729686424173932) q[20];
-cx q[0],q[20];
-cx q[0],q[32];
-cx q[15],q[20];
-rz(4.729686424173932) q[20];
-cx q[15],q[20];
-rz(4.729686424173932) q[22];
-cx q[3],q[22];
-cx q[3],q[23];
-cx q[9],q[22];
-rz(4.729686424173932) q[22];
-cx q[9],q[22];
-rx(5.487124544933388) q[9];
-rx(5.487124544933388) q[22];
-rz(4.729686424173932) q[23];
-cx q[3],q[23];
-cx q[3],q[24];
-cx q[17],q[23];
-rz(4.729686424173932) q[23];
-cx q[17],q[23];
-rz(4.729686424173932) q[24];
-cx q[3],q[24];
-cx q[3],q[25];
-rz(4.729686424173932) q[25];
-cx q[3],q[25];
-cx q[3],q[26];
-cx q[12],q[25];
-rz(4.729686424173932) q[25];
-cx q[12],q[25];
-cx q[12],q[31];
-rx(5.487124544933388) q[25];
-rz(4.729686424173932) q[26];
-cx q[3],q[26];
-rz(4.729686424173932) q[28];
-cx q[1],q[28];
-cx q[1],q[29];
-cx q[3],q[28];
-rz(4.729686424173932) q[28];
-cx q[3],q[28];
-rz(4.729686424173932) q[29];
-cx q[1],q[29];
-cx q[1],q[45];
-cx q[3],q[29];
-rz(4.729686424173932) q[29];
-cx q[3],q[29];
-cx q[3],q[30];
-rx(5.487124544933388) q[29];
-rz(4.729686424173932) q[30];
-cx q[3],q[30];
-cx q[3],q[34];
-rz(4.729686424173932) q[31];
-cx q[12],q[31];
-rz(4.729686424173932) q[32];
-cx q[0],q[32];
-cx q[0],q[42];
-rz(4.729686424173932) q[34];
-cx q[3],q[34];
-cx q[3],q[35];
-cx q[12],q[34];
-rz(4.729686424173932) q[34];
-cx q[12],q[34];
-rz(4.729686424173932) q[35];
-cx q[3],q[35];
-cx q[3],q[39];
-rz(4.729686424173932) q[38];
-cx q[19],q[38];
-rx(5.487124544933388) q[19];
-rz(4.729686424173932) q[39];
-cx q[3],q[39];
-cx q[3],q[40];
-rz(4.729686424173932) q[40];
-cx q[3],q[40];
-cx q[23],q[40];
-rz(4.729686424173932) q[40];
-cx q[23],q[40];
-rx(5.487124544933388) q[23];
-rx(5.487124544933388) q[40];
-rz(4.729686424173932) q[42];
-cx q[0],q[42];
-cx q[0],q[48];
-cx q[3],q[42];
-rz(4.729686424173932) q[42];
-cx q[3],q[42];
-cx q[3],q[43];
-rx(5.487124544933388) q[42];
-rz(4.729686424173932) q[43];
-cx q[3],q[43];
-cx q[3],q[44];
-rz(4.729686424173932) q[44];
-cx q[3],q[44];
-cx q[3],q[49];
-cx q[12],q[44];
-rz(4.729686424173932) q[44];
-cx q[12],q[44];
-rx(5.487124544933388) q[44];
-rz(4.729686424173932) q[45];
-cx q[1],q[45];
-rx(5.487124544933388) q[1];
-cx q[16],q[45];
-rz(4.729686424173932) q[45];
-cx q[16],q[45];
-rx(5.487124544933388) q[16];
-rx(5.487124544933388) q[45];
-rz(4.729686424173932) q[48];
-cx q[0],q[48];
-cx q[0],q[51];
-rz(4.729686424173932) q[49];
-cx q[3],q[49];
-cx q[3],q[50];
-rz(4.729686424173932) q[50];
-cx q[3],q[50];
-cx q[12],q[50];
-rz(4.729686424173932) q[50];
-cx q[12],q[50];
-rx(5.487124544933388) q[12];
-rx(5.487124544933388) q[50];
-rz(4.729686424173932) q[51];
-cx q[0],q[51];
-rx(5.487124544933388) q[0];
-cx q[0],q[1];
-rz(3.5201017250009565) q[1];
-cx q[0],q[1];
-cx q[0],q[2];
-rz(3.5201017250009565) q[2];
-cx q[0],q[2];
-rx(9.478641289157935) q[2];
-cx q[28],q[51];
-rz(4.729686424173932) q[51];
-cx q[28],q[51];
-rx(5.487124544933388) q[28];
-rx(5.487124544933388) q[51];
-rz(2.06403085877189) q[52];
-cx q[10],q[52];
-rx(10.515414094017396) q[10];
-cx q[4],q[10];
-rz(4.729686424173932) q[10];
-cx q[4],q[10];
-cx q[4],q[13];
-cx q[6],q[10];
-rz(4.729686424173932) q[10];
-cx q[6],q[10];
-cx q[6],q[11];
-cx q[10],q[37];
-rz(4.729686424173932) q[11];
-cx q[6],q[11];
-rx(5.487124544933388) q[11];
-rz(4.729686424173932) q[13];
-cx q[4],q[13];
-cx q[4],q[14];
-cx q[5],q[13];
-rz(4.729686424173932) q[13];
-cx q[5],q[13];
-cx q[5],q[24];
-cx q[13],q[39];
-rz(4.729686424173932) q[14];
-cx q[4],q[14];
-cx q[4],q[18];
-rx(5.487124544933388) q[14];
-rz(4.729686424173932) q[18];
-cx q[4],q[18];
-cx q[4],q[21];
-cx q[18],q[30];
-rz(4.729686424173932) q[21];
-cx q[4],q[21];
-cx q[4],q[27];
-cx q[15],q[21];
-rz(4.729686424173932) q[21];
-cx q[15],q[21];
-cx q[15],q[36];
-cx q[21],q[26];
-rz(4.729686424173932) q[24];
-cx q[5],q[24];
-cx q[5],q[33];
-rx(5.487124544933388) q[24];
-rz(4.729686424173932) q[26];
-cx q[21],q[26];
-cx q[21],q[32];
-cx q[26],q[31];
-rz(4.729686424173932) q[27];
-cx q[4],q[27];
-cx q[4],q[47];
-cx q[6],q[27];
-rz(4.729686424173932) q[27];
-cx q[6],q[27];
-rx(5.487124544933388) q[6];
-rz(4.729686424173932) q[30];
-cx q[18],q[30];
-rx(5.487124544933388) q[18];
-rz(4.729686424173932) q[31];
-cx q[26],q[31];
-rx(5.487124544933388) q[26];
-rx(5.487124544933388) q[31];
-rz(4.729686424173932) q[32];
-cx q[21],q[32];
-cx q[21],q[38];
-cx q[32],q[35];
-rz(4.729686424173932) q[33];
-cx q[5],q[33];
-cx q[5],q[46];
-cx q[30],q[33];
-rz(4.729686424173932) q[33];
-cx q[30],q[33];
-cx q[30],q[48];
-rx(5.487124544933388) q[33];
-rz(4.729686424173932) q[35];
-cx q[32],q[35];
-rx(5.487124544933388) q[32];
-rx(5.487124544933388) q[35];
-rz(4.729686424173932) q[36];
-cx q[15],q[36];
-rx(5.487124544933388) q[15];
-cx q[20],q[36];
-rz(4.729686424173932) q[36];
-cx q[20],q[36];
-cx q[20],q[43];
-rx(5.487124544933388) q[36];
-rz(4.729686424173932) q[37];
-cx q[10],q[37];
-cx q[10],q[41];
-cx q[34],q[37];
-rz(4.729686424173932) q[37];
-cx q[34],q[37];
-rx(5.487124544933388) q[34];
-rx(5.487124544933388) q[37];
-rz(4.729686424173932) q[38];
-cx q[21],q[38];
-rx(5.487124544933388) q[21];
-rz(4.729686424173932) q[39];
-cx q[13],q[39];
-rx(5.487124544933388) q[13];
-rx(5.487124544933388) q[39];
-rz(4.729686424173932) q[41];
-cx q[10],q[41];
-cx q[27],q[41];
-rz(4.729686424173932) q[41];
-cx q[27],q[41];
-rx(5.487124544933388) q[27];
-rx(5.487124544933388) q[41];
-rz(4.729686424173932) q[43];
-cx q[20],q[43];
-rx(5.487124544933388) q[20];
-rx(5.487124544933388) q[43];
-rz(4.729686424173932) q[46];
-cx q[5],q[46];
-rx(5.487124544933388) q[5];
-cx q[38],q[46];
-rz(4.729686424173932) q[46];
-cx q[38],q[46];
-rx(5.487124544933388) q[38];
-rx(5.487124544933388) q[46];
-rz(4.729686424173932) q[47];
-cx q[4],q[47];
-cx q[4],q[49];
-cx q[17],q[47];
-rz(4.729686424173932) q[47];
-cx q[17],q[47];
-rx(5.487124544933388) q[17];
-rx(5.487124544933388) q[47];
-rz(4.729686424173932) q[48];
-cx q[30],q[48];
-rx(5.487124544933388) q[30];
-rx(5.487124544933388) q[48];
-rz(4.729686424173932) q[49];
-cx q[4],q[49];
-rx(5.487124544933388) q[4];
-rx(5.487124544933388) q[49];
-rx(10.515414094017396) q[52];
-cx q[3],q[52];
-rz(4.729686424173932) q[52];
-cx q[3],q[52];
-rx(5.487124544933388) q[3];
-cx q[0],q[3];
-rz(3.5201017250009565) q[3];
-cx q[0],q[3];
-cx q[0],q[15];
-cx q[1],q[3];
-rz(3.5201017250009565) q[3];
-cx q[1],q[3];
-cx q[1],q[4];
-rz(3.5201017250009565) q[4];
-cx q[1],q[4];
-cx q[1],q[5];
-cx q[3],q[4];
-rz(3.5201017250009565) q[4];
-cx q[3],q[4];
-cx q[4],q[6];
-rz(3.5201017250009565) q[5];
-cx q[1],q[5];
-cx q[1],q[9];
-cx q[3],q[5];
-rz(3.5201017250009565) q[5];
-cx q[3],q[5];
-cx q[3],q[7];
-rz(3.5201017250009565) q[6];
-cx q[4],q[6];
-cx q[5],q[6];
-rz(3.5201017250009565) q[6];
-cx q[5],q[6];
-rz(3.5201017250009565) q[7];
-cx q[3],q[7];
-cx q[3],q[8];
-cx q[4],q[7];
-rz(3.5201017250009565) q[7];
-cx q[4],q[7];
-rz(3.5201017250009565) q[8];
-cx q[3],q[8];
-cx q[5],q[8];
-rz(3.5201017250009565) q[8];
-cx q[5],q[8];
-cx q[5],q[11];
-rx(9.478641289157935) q[8];
-rz(3.5201017250009565) q[9];
-cx q[1],q[9];
-cx q[1],q[17];
-cx q[3],q[9];
-rz(3.5201017250009565) q[9];
-cx q[3],q[9];
-cx q[3],q[12];
-cx q[10],q[52];
-rz(3.5201017250009565) q[11];
-cx q[5],q[11];
-rz(3.5201017250009565) q[12];
-cx q[3],q[12];
-cx q[3],q[14];
-cx q[5],q[12];
-rz(3.5201017250009565) q[12];
-cx q[5],q[12];
-rz(3.5201017250009565) q[14];
-cx q[3],q[14];
-rz(3.5201017250009565) q[15];
-cx q[0],q[15];
-cx q[0],q[16];
-cx q[3],q[15];
-rz(3.5201017250009565) q[15];
-cx q[3],q[15];
-rz(3.5201017250009565) q[16];
-cx q[0],q[16];
-cx q[0],q[20];
-cx q[3],q[16];
-rz(3.5201017250009565) q[16];
-cx q[3],q[16];
-rz(3.5201017250009565) q[17];
-cx q[1],q[17];
-cx q[1],q[28];
-cx q[3],q[17];
-rz(3.5201017250009565) q[17];
-cx q[3],q[17];
-cx q[3],q[18];
-rz(3.5201017250009565) q[18];
-cx q[3],q[18];
-cx q[3],q[19];
-rz(3.5201017250009565) q[19];
-cx q[3],q[19];
-cx q[3],q[22];
-cx q[7],q[19];
-rz(3.5201017250009565) q[19];
-cx q[7],q[19];
-rx(9.478641289157935) q[7];
-cx q[19],q[38];
-rz(3.5201017250009565) q[20];
-cx q[0],q[20];
-cx q[0],q[32];
-cx q[15],q[20];
-rz(3.5201017250009565) q[20];
-cx q[15],q[20];
-rz(3.5201017250009565) q[22];
-cx q[3],q[22];
-cx q[3],q[23];
-cx q[9],q[22];
-rz(3.5201017250009565) q[22];
-cx q[9],q[22];
-rx(9.478641289157935) q[9];
-rx(9.478641289157935) q[22];
-rz(3.5201017250009565) q[23];
-cx q[3],q[23];
-cx q[3],q[24];
-cx q[17],q[23];
-rz(3.5201017250009565) q[23];
-cx q[17],q[23];
-rz(3.5201017250009565) q[24];
-cx q[3],q[24];
-cx q[3],q[25];
-rz(3.5201017250009565) q[25];
-cx q[3],q[25];
-cx q[3],q[26];
-cx q[12],q[25];
-rz(3.5201017250009565) q[25];
-cx q[12],q[25];
-cx q[12],q[31];
-rx(9.478641289157935) q[25];
-rz(3.5201017250009565) q[26];
-cx q[3],q[26];
-rz(3.5201017250009565) q[28];
-cx q[1],q[28];
-cx q[1],q[29];
-cx q[3],q[28];
-rz(3.5201017250009565) q[28];
-cx q[3],q[28];
-rz(3.5201017250009565) q[29];
-cx q[1],q[29];
-cx q[1],q[45];
-cx q[3],q[29];
-rz(3.5201017250009565) q[29];
-cx q[3],q[29];
-cx q[3],q[30];
-rx(9.478641289157935) q[29];
-rz(3.5201017250009565) q[30];
-cx q[3],q[30];
-cx q[3],q[34];
-rz(3.5201017250009565) q[31];
-cx q[12],q[31];
-rz(3.5201017250009565) q[32];
-cx q[0],q[32];
-cx q[0],q[42];
-rz(3.5201017250009565) q[34];
-cx q[3],q[34];
-cx q[3],q[35];
-cx q[12],q[34];
-rz(3.5201017250009565) q[34];
-cx q[12],q[34];
-rz(3.5201017250009565) q[35];
-cx q[3],q[35];
-cx q[3],q[39];
-rz(3.5201017250009565) q[38];
-cx q[19],q[38];
-rx(9.478641289157935) q[19];
-rz(3.5201017250009565) q[39];
-cx q[3],q[39];
-cx q[3],q[40];
-rz(3.5201017250009565) q[40];
-cx q[3],q[40];
-cx q[23],q[40];
-rz(3.5201017250009565) q[40];
-cx q[23],q[40];
-rx(9.478641289157935) q[23];
-rx(9.478641289157935) q[40];
-rz(3.5201017250009565) q[42];
-cx q[0],q[42];
-cx q[0],q[48];
-cx q[3],q[42];
-rz(3.5201017250009565) q[42];
-cx q[3],q[42];
-cx q[3],q[43];
-rx(9.478641289157935) q[42];
-rz(3.5201017250009565) q[43];
-cx q[3],q[43];
-cx q[3],q[44];
-rz(3.5201017250009565) q[44];
-cx q[3],q[44];
-cx q[3],q[49];
-cx q[12],q[44];
-rz(3.5201017250009565) q[44];
-cx q[12],q[44];
-rx(9.478641289157935) q[44];
-rz(3.5201017250009565) q[45];
-cx q[1],q[45];
-rx(9.478641289157935) q[1];
-cx q[16],q[45];
-rz(3.5201017250009565) q[45];
-cx q[16],q[45];
-rx(9.478641289157935) q[16];
-rx(9.478641289157935) q[45];
-rz(3.5201017250009565) q[48];
-cx q[0],q[48];
-cx q[0],q[51];
-rz(3.5201017250009565) q[49];
-cx q[3],q[49];
-cx q[3],q[50];
-rz(3.5201017250009565) q[50];
-cx q[3],q[50];
-cx q[12],q[50];
-rz(3.5201017250009565) q[50];
-cx q[12],q[50];
-rx(9.478641289157935) q[12];
-rx(9.478641289157935) q[50];
-rz(3.5201017250009565) q[51];
-cx q[0],q[51];
-rx(9.478641289157935) q[0];
-cx q[28],q[51];
-rz(3.5201017250009565) q[51];
-cx q[28],q[51];
-rx(9.478641289157935) q[28];
-rx(9.478641289157935) q[51];
-rz(4.729686424173932) q[52];
-cx q[10],q[52];
-rx(5.487124544933388) q[10];
-cx q[4],q[10];
-rz(3.5201017250009565) q[10];
-cx q[4],q[10];
-cx q[4],q[13];
-cx q[6],q[10];
-rz(3.5201017250009565) q[10];
-cx q[6],q[10];
-cx q[6],q[11];
-cx q[10],q[37];
-rz(3.5201017250009565) q[11];
-cx q[6],q[11];
-rx(9.478641289157935) q[11];
-rz(3.5201017250009565) q[13];
-cx q[4],q[13];
-cx q[4],q[14];
-cx q[5],q[13];
-rz(3.5201017250009565) q[13];
-cx q[5],q[13];
-cx q[5],q[24];
-cx q[13],q[39];
-rz(3.5201017250009565) q[14];
-cx q[4],q[14];
-cx q[4],q[18];
-rx(9.478641289157935) q[14];
-rz(3.5201017250009565) q[18];
-cx q[4],q[18];
-cx q[4],q[21];
-cx q[18],q[30];
-rz(3.5201017250009565) q[21];
-cx q[4],q[21];
-cx q[4],q[27];
-cx q[15],q[21];
-rz(3.5201017250009565) q[21];
-cx q[15],q[21];
-cx q[15],q[36];
-cx q[21],q[26];
-rz(3.5201017250009565) q[24];
-cx q[5],q[24];
-cx q[5],q[33];
-rx(9.478641289157935) q[24];
-rz(3.5201017250009565) q[26];
-cx q[21],q[26];
-cx q[21],q[32];
-cx q[26],q[31];
-rz(3.5201017250009565) q[27];
-cx q[4],q[27];
-cx q[4],q[47];
-cx q[6],q[27];
-rz(3.5201017250009565) q[27];
-cx q[6],q[27];
-rx(9.478641289157935) q[6];
-rz(3.5201017250009565) q[30];
-cx q[18],q[30];
-rx(9.478641289157935) q[18];
-rz(3.5201017250009565) q[31];
-cx q[26],q[31];
-rx(9.478641289157935) q[26];
-rx(9.478641289157935) q[31];
-rz(3.5201017250009565) q[32];
-cx q[21],q[32];
-cx q[21],q[38];
-cx q[32],q[35];
-rz(3.5201017250009565) q[33];
-cx q[5],q[33];
-cx q[5],q[46];
-cx q[30],q[33];
-rz(3.5201017250009565) q[33];
-cx q[30],q[33];
-cx q[30],q[48];
-rx(9.478641289157935) q[33];
-rz(3.5201017250009565) q[35];
-cx q[32],q[35];
-rx(9.478641289157935) q[32];
-rx(9.478641289157935) q[35];
-rz(3.5201017250009565) q[36];
-cx q[15],q[36];
-rx(9.478641289157935) q[15];
-cx q[20],q[36];
-rz(3.5201017250009565) q[36];
-cx q[20],q[36];
-cx q[20],q[43];
-rx(9.478641289157935) q[36];
-rz(3.5201017250009565) q[37];
-cx q[10],q[37];
-cx q[10],q[41];
-cx q[34],q[37];
-rz(3.5201017250009565) q[37];
-cx q[34],q[37];
-rx(9.478641289157935) q[34];
-rx(9.478641289157935) q[37];
-rz(3.5201017250009565) q[38];
-cx q[21],q[38];
-rx(9.478641289157935) q[21];
-rz(3.5201017250009565) q[39];
-cx q[13],q[39];
-rx(9.478641289157935) q[13];
-rx(9.478641289157935) q[39];
-rz(3.5201017250009565) q[41];
-cx q[10],q[41];
-cx q[27],q[41];
-rz(3.5201017250009565) q[41];
-cx q[27],q[41];
-rx(9.478641289157935) q[27];
-rx(9.478641289157935) q[41];
-rz(3.5201017250009565) q[43];
-cx q[20],q[43];
-rx(9.478641289157935) q[20];
-rx(9.478641289157935) q[43];
-rz(3.5201017250009565) q[46];
-cx q[5],q[46];
-rx(9.478641289157935) q[5];
-cx q[38],q[46];
-rz(3.5201017250009565) q[46];
-cx q[38],q[46];
-rx(9.478641289157935) q[38];
-rx(9.478641289157935) q[46];
-rz(3.5201017250009565) q[47];
-cx q[4],q[47];
-cx q[4],q[49];
-cx q[17],q[47];
-rz(3.5201017250009565) q[47];
-cx q[17],q[47];
-rx(9.478641289157935) q[17];
-rx(9.478641289157935) q[47];
-rz(3.5201017250009565) q[48];
-cx q[30],q[48];
-rx(9.478641289157935) q[30];
-rx(9.478641289157935) q[48];
-rz(3.5201017250009565) q[49];
-cx q[4],q[49];
-rx(9.478641289157935) q[4];
-rx(9.478641289157935) q[49];
-rx(5.487124544933388) q[52];
-cx q[3],q[52];
-rz(3.5201017250009565) q[52];
-cx q[3],q[52];
-rx(9.478641289157935) q[3];
-cx q[10],q[52];
-rz(3.5201017250009565) q[52];
-cx q[10],q[52];
-rx(9.478641289157935) q[10];
-rx(9.478641289157935) q[52];
\ No newline at end of file
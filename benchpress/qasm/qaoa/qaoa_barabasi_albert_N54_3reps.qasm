@@ -1,1209 +0,0 @@
-OPENQASM 2.0;
-include "qelib1.inc";
-qreg q[54];
-ry(pi/2) q[0];
-rx(pi) q[0];
-ry(pi/2) q[1];
-rx(pi) q[1];
-cx q[0],q[1];
-rz(5.02891910408278) q[1];
-cx q[0],q[1];
-ry(pi/2) q[2];
-rx(pi) q[2];
-cx q[0],q[2];
-rz(5.02891910408278) q[2];
-cx q[0],q[2];
-rx(2.526534060916508) q[2];
-ry(pi/2) q[3];
-rx(pi) q[3];
-cx q[0],q[3];
-rz(5.02891910408278) q[3];
-cx q[0],q[3];
-cx q[1],q[3];
-rz(5.02891910408278) q[3];
-cx q[1],q[3];
-ry(pi/2) q[4];
-rx(pi) q[4];
-cx q[1],q[4];
-rz(5.02891910408278) q[4];
-cx q[1],q[4];
-cx q[3],q[4];
-rz(5.02891910408278) q[4];
-cx q[3],q[4];
-ry(pi/2) q[5];
-rx(pi) q[5];
-cx q[1],q[5];
-rz(5.02891910408278) q[5];
-cx q[1],q[5];
-cx q[3],q[5];
-rz(5.02891910408278) q[5];
-cx q[3],q[5];
-ry(pi/2) q[6];
-rx(pi) q[6];
-cx q[4],q[6];
-rz(5.02891910408278) q[6];
-cx q[4],q[6];
-cx q[5],q[6];
-rz(5.02891910408278) q[6];
-cx q[5],q[6];
-ry(pi/2) q[7];
-rx(pi) q[7];
-cx q[3],q[7];
-rz(5.02891910408278) q[7];
-cx q[3],q[7];
-cx q[4],q[7];
-rz(5.02891910408278) q[7];
-cx q[4],q[7];
-ry(pi/2) q[8];
-rx(pi) q[8];
-cx q[3],q[8];
-rz(5.02891910408278) q[8];
-cx q[3],q[8];
-cx q[5],q[8];
-rz(5.02891910408278) q[8];
-cx q[5],q[8];
-rx(2.526534060916508) q[8];
-ry(pi/2) q[9];
-rx(pi) q[9];
-cx q[1],q[9];
-rz(5.02891910408278) q[9];
-cx q[1],q[9];
-cx q[3],q[9];
-rz(5.02891910408278) q[9];
-cx q[3],q[9];
-ry(pi/2) q[10];
-rx(pi) q[10];
-cx q[4],q[10];
-rz(5.02891910408278) q[10];
-cx q[4],q[10];
-cx q[6],q[10];
-rz(5.02891910408278) q[10];
-cx q[6],q[10];
-ry(pi/2) q[11];
-rx(pi) q[11];
-cx q[5],q[11];
-rz(5.02891910408278) q[11];
-cx q[5],q[11];
-cx q[6],q[11];
-rz(5.02891910408278) q[11];
-cx q[6],q[11];
-rx(2.526534060916508) q[11];
-ry(pi/2) q[12];
-rx(pi) q[12];
-cx q[3],q[12];
-rz(5.02891910408278) q[12];
-cx q[3],q[12];
-cx q[5],q[12];
-rz(5.02891910408278) q[12];
-cx q[5],q[12];
-ry(pi/2) q[13];
-rx(pi) q[13];
-cx q[4],q[13];
-rz(5.02891910408278) q[13];
-cx q[4],q[13];
-cx q[5],q[13];
-rz(5.02891910408278) q[13];
-cx q[5],q[13];
-ry(pi/2) q[14];
-rx(pi) q[14];
-cx q[3],q[14];
-rz(5.02891910408278) q[14];
-cx q[3],q[14];
-cx q[4],q[14];
-rz(5.02891910408278) q[14];
-cx q[4],q[14];
-rx(2.526534060916508) q[14];
-ry(pi/2) q[15];
-rx(pi) q[15];
-cx q[0],q[15];
-rz(5.02891910408278) q[15];
-cx q[0],q[15];
-cx q[3],q[15];
-rz(5.02891910408278) q[15];
-cx q[3],q[15];
-ry(pi/2) q[16];
-rx(pi) q[16];
-cx q[0],q[16];
-rz(5.02891910408278) q[16];
-cx q[0],q[16];
-cx q[3],q[16];
-rz(5.02891910408278) q[16];
-cx q[3],q[16];
-ry(pi/2) q[17];
-rx(pi) q[17];
-cx q[1],q[17];
-rz(5.02891910408278) q[17];
-cx q[1],q[17];
-cx q[3],q[17];
-rz(5.02891910408278) q[17];
-cx q[3],q[17];
-ry(pi/2) q[18];
-rx(pi) q[18];
-cx q[3],q[18];
-rz(5.02891910408278) q[18];
-cx q[3],q[18];
-cx q[4],q[18];
-rz(5.02891910408278) q[18];
-cx q[4],q[18];
-ry(pi/2) q[19];
-rx(pi) q[19];
-cx q[3],q[19];
-rz(5.02891910408278) q[19];
-cx q[3],q[19];
-cx q[7],q[19];
-rz(5.02891910408278) q[19];
-cx q[7],q[19];
-rx(2.526534060916508) q[7];
-ry(pi/2) q[20];
-rx(pi) q[20];
-cx q[0],q[20];
-rz(5.02891910408278) q[20];
-cx q[0],q[20];
-cx q[15],q[20];
-rz(5.02891910408278) q[20];
-cx q[15],q[20];
-ry(pi/2) q[21];
-rx(pi) q[21];
-cx q[4],q[21];
-rz(5.02891910408278) q[21];
-cx q[4],q[21];
-cx q[15],q[21];
-rz(5.02891910408278) q[21];
-cx q[15],q[21];
-ry(pi/2) q[22];
-rx(pi) q[22];
-cx q[3],q[22];
-rz(5.02891910408278) q[22];
-cx q[3],q[22];
-cx q[9],q[22];
-rz(5.02891910408278) q[22];
-cx q[9],q[22];
-rx(2.526534060916508) q[9];
-rx(2.526534060916508) q[22];
-ry(pi/2) q[23];
-rx(pi) q[23];
-cx q[3],q[23];
-rz(5.02891910408278) q[23];
-cx q[3],q[23];
-cx q[17],q[23];
-rz(5.02891910408278) q[23];
-cx q[17],q[23];
-ry(pi/2) q[24];
-rx(pi) q[24];
-cx q[3],q[24];
-rz(5.02891910408278) q[24];
-cx q[3],q[24];
-cx q[5],q[24];
-rz(5.02891910408278) q[24];
-cx q[5],q[24];
-rx(2.526534060916508) q[24];
-ry(pi/2) q[25];
-rx(pi) q[25];
-cx q[3],q[25];
-rz(5.02891910408278) q[25];
-cx q[3],q[25];
-cx q[12],q[25];
-rz(5.02891910408278) q[25];
-cx q[12],q[25];
-rx(2.526534060916508) q[25];
-ry(pi/2) q[26];
-rx(pi) q[26];
-cx q[3],q[26];
-rz(5.02891910408278) q[26];
-cx q[3],q[26];
-cx q[21],q[26];
-rz(5.02891910408278) q[26];
-cx q[21],q[26];
-ry(pi/2) q[27];
-rx(pi) q[27];
-cx q[4],q[27];
-rz(5.02891910408278) q[27];
-cx q[4],q[27];
-cx q[6],q[27];
-rz(5.02891910408278) q[27];
-cx q[6],q[27];
-rx(2.526534060916508) q[6];
-ry(pi/2) q[28];
-rx(pi) q[28];
-cx q[1],q[28];
-rz(5.02891910408278) q[28];
-cx q[1],q[28];
-cx q[3],q[28];
-rz(5.02891910408278) q[28];
-cx q[3],q[28];
-ry(pi/2) q[29];
-rx(pi) q[29];
-cx q[1],q[29];
-rz(5.02891910408278) q[29];
-cx q[1],q[29];
-cx q[3],q[29];
-rz(5.02891910408278) q[29];
-cx q[3],q[29];
-rx(2.526534060916508) q[29];
-ry(pi/2) q[30];
-rx(pi) q[30];
-cx q[3],q[30];
-rz(5.02891910408278) q[30];
-cx q[3],q[30];
-cx q[18],q[30];
-rz(5.02891910408278) q[30];
-cx q[18],q[30];
-rx(2.526534060916508) q[18];
-ry(pi/2) q[31];
-rx(pi) q[31];
-cx q[12],q[31];
-rz(5.02891910408278) q[31];
-cx q[12],q[31];
-cx q[26],q[31];
-rz(5.02891910408278) q[31];
-cx q[26],q[31];
-rx(2.526534060916508) q[26];
-rx(2.526534060916508) q[31];
-ry(pi/2) q[32];
-rx(pi) q[32];
-cx q[0],q[32];
-rz(5.02891910408278) q[32];
-cx q[0],q[32];
-cx q[21],q[32];
-rz(5.02891910408278) q[32];
-cx q[21],q[32];
-ry(pi/2) q[33];
-rx(pi) q[33];
-cx q[5],q[33];
-rz(5.02891910408278) q[33];
-cx q[5],q[33];
-cx q[30],q[33];
-rz(5.02891910408278) q[33];
-cx q[30],q[33];
-rx(2.526534060916508) q[33];
-ry(pi/2) q[34];
-rx(pi) q[34];
-cx q[3],q[34];
-rz(5.02891910408278) q[34];
-cx q[3],q[34];
-cx q[12],q[34];
-rz(5.02891910408278) q[34];
-cx q[12],q[34];
-ry(pi/2) q[35];
-rx(pi) q[35];
-cx q[3],q[35];
-rz(5.02891910408278) q[35];
-cx q[3],q[35];
-cx q[32],q[35];
-rz(5.02891910408278) q[35];
-cx q[32],q[35];
-rx(2.526534060916508) q[32];
-rx(2.526534060916508) q[35];
-ry(pi/2) q[36];
-rx(pi) q[36];
-cx q[15],q[36];
-rz(5.02891910408278) q[36];
-cx q[15],q[36];
-rx(2.526534060916508) q[15];
-cx q[20],q[36];
-rz(5.02891910408278) q[36];
-cx q[20],q[36];
-rx(2.526534060916508) q[36];
-ry(pi/2) q[37];
-rx(pi) q[37];
-cx q[10],q[37];
-rz(5.02891910408278) q[37];
-cx q[10],q[37];
-cx q[34],q[37];
-rz(5.02891910408278) q[37];
-cx q[34],q[37];
-rx(2.526534060916508) q[34];
-rx(2.526534060916508) q[37];
-ry(pi/2) q[38];
-rx(pi) q[38];
-cx q[19],q[38];
-rz(5.02891910408278) q[38];
-cx q[19],q[38];
-rx(2.526534060916508) q[19];
-cx q[21],q[38];
-rz(5.02891910408278) q[38];
-cx q[21],q[38];
-ry(pi/2) q[39];
-rx(pi) q[39];
-cx q[3],q[39];
-rz(5.02891910408278) q[39];
-cx q[3],q[39];
-cx q[13],q[39];
-rz(5.02891910408278) q[39];
-cx q[13],q[39];
-rx(2.526534060916508) q[13];
-rx(2.526534060916508) q[39];
-ry(pi/2) q[40];
-rx(pi) q[40];
-cx q[3],q[40];
-rz(5.02891910408278) q[40];
-cx q[3],q[40];
-cx q[23],q[40];
-rz(5.02891910408278) q[40];
-cx q[23],q[40];
-rx(2.526534060916508) q[23];
-rx(2.526534060916508) q[40];
-ry(pi/2) q[41];
-rx(pi) q[41];
-cx q[10],q[41];
-rz(5.02891910408278) q[41];
-cx q[10],q[41];
-cx q[27],q[41];
-rz(5.02891910408278) q[41];
-cx q[27],q[41];
-rx(2.526534060916508) q[27];
-rx(2.526534060916508) q[41];
-ry(pi/2) q[42];
-rx(pi) q[42];
-cx q[0],q[42];
-rz(5.02891910408278) q[42];
-cx q[0],q[42];
-cx q[3],q[42];
-rz(5.02891910408278) q[42];
-cx q[3],q[42];
-rx(2.526534060916508) q[42];
-ry(pi/2) q[43];
-rx(pi) q[43];
-cx q[3],q[43];
-rz(5.02891910408278) q[43];
-cx q[3],q[43];
-cx q[20],q[43];
-rz(5.02891910408278) q[43];
-cx q[20],q[43];
-rx(2.526534060916508) q[20];
-rx(2.526534060916508) q[43];
-ry(pi/2) q[44];
-rx(pi) q[44];
-cx q[3],q[44];
-rz(5.02891910408278) q[44];
-cx q[3],q[44];
-cx q[12],q[44];
-rz(5.02891910408278) q[44];
-cx q[12],q[44];
-rx(2.526534060916508) q[44];
-ry(pi/2) q[45];
-rx(pi) q[45];
-cx q[1],q[45];
-rz(5.02891910408278) q[45];
-cx q[1],q[45];
-rx(2.526534060916508) q[1];
-cx q[16],q[45];
-rz(5.02891910408278) q[45];
-cx q[16],q[45];
-rx(2.526534060916508) q[16];
-rx(2.526534060916508) q[45];
-ry(pi/2) q[46];
-rx(pi) q[46];
-cx q[5],q[46];
-rz(5.02891910408278) q[46];
-cx q[5],q[46];
-rx(2.526534060916508) q[5];
-cx q[38],q[46];
-rz(5.02891910408278) q[46];
-cx q[38],q[46];
-rx(2.526534060916508) q[38];
-rx(2.526534060916508) q[46];
-ry(pi/2) q[47];
-rx(pi) q[47];
-cx q[4],q[47];
-rz(5.02891910408278) q[47];
-cx q[4],q[47];
-cx q[17],q[47];
-rz(5.02891910408278) q[47];
-cx q[17],q[47];
-rx(2.526534060916508) q[47];
-ry(pi/2) q[48];
-rx(pi) q[48];
-cx q[0],q[48];
-rz(5.02891910408278) q[48];
-cx q[0],q[48];
-cx q[30],q[48];
-rz(5.02891910408278) q[48];
-cx q[30],q[48];
-rx(2.526534060916508) q[30];
-rx(2.526534060916508) q[48];
-ry(pi/2) q[49];
-rx(pi) q[49];
-cx q[3],q[49];
-rz(5.02891910408278) q[49];
-cx q[3],q[49];
-cx q[4],q[49];
-rz(5.02891910408278) q[49];
-cx q[4],q[49];
-rx(2.526534060916508) q[4];
-rx(2.526534060916508) q[49];
-ry(pi/2) q[50];
-rx(pi) q[50];
-cx q[3],q[50];
-rz(5.02891910408278) q[50];
-cx q[3],q[50];
-cx q[12],q[50];
-rz(5.02891910408278) q[50];
-cx q[12],q[50];
-rx(2.526534060916508) q[12];
-rx(2.526534060916508) q[50];
-ry(pi/2) q[51];
-rx(pi) q[51];
-cx q[0],q[51];
-rz(5.02891910408278) q[51];
-cx q[0],q[51];
-rx(2.526534060916508) q[0];
-cx q[0],q[1];
-rz(1.2228899556704538) q[1];
-cx q[0],q[1];
-cx q[0],q[2];
-rz(1.2228899556704538) q[2];
-cx q[0],q[2];
-rx(2.508914570949334) q[2];
-cx q[28],q[51];
-rz(5.02891910408278) q[51];
-cx q[28],q[51];
-rx(2.526534060916508) q[28];
-rx(2.526534060916508) q[51];
-ry(pi/2) q[52];
-rx(pi) q[52];
-cx q[3],q[52];
-rz(5.02891910408278) q[52];
-cx q[3],q[52];
-rx(2.526534060916508) q[3];
-cx q[0],q[3];
-rz(1.2228899556704538) q[3];
-cx q[0],q[3];
-cx q[0],q[15];
-cx q[1],q[3];
-rz(1.2228899556704538) q[3];
-cx q[1],q[3];
-cx q[1],q[4];
-rz(1.2228899556704538) q[4];
-cx q[1],q[4];
-cx q[1],q[5];
-cx q[3],q[4];
-rz(1.2228899556704538) q[4];
-cx q[3],q[4];
-cx q[4],q[6];
-rz(1.2228899556704538) q[5];
-cx q[1],q[5];
-cx q[1],q[9];
-cx q[3],q[5];
-rz(1.2228899556704538) q[5];
-cx q[3],q[5];
-cx q[3],q[7];
-rz(1.2228899556704538) q[6];
-cx q[4],q[6];
-cx q[5],q[6];
-rz(1.2228899556704538) q[6];
-cx q[5],q[6];
-rz(1.2228899556704538) q[7];
-cx q[3],q[7];
-cx q[3],q[8];
-cx q[4],q[7];
-rz(1.2228899556704538) q[7];
-cx q[4],q[7];
-rz(1.2228899556704538) q[8];
-cx q[3],q[8];
-cx q[5],q[8];
-rz(1.2228899556704538) q[8];
-cx q[5],q[8];
-cx q[5],q[11];
-rx(2.508914570949334) q[8];
-rz(1.2228899556704538) q[9];
-cx q[1],q[9];
-cx q[3],q[9];
-rz(1.2228899556704538) q[9];
-cx q[3],q[9];
-cx q[3],q[12];
-cx q[10],q[52];
-rz(1.2228899556704538) q[11];
-cx q[5],q[11];
-rz(1.2228899556704538) q[12];
-cx q[3],q[12];
-cx q[3],q[14];
-cx q[5],q[12];
-rz(1.2228899556704538) q[12];
-cx q[5],q[12];
-rz(1.2228899556704538) q[14];
-cx q[3],q[14];
-rz(1.2228899556704538) q[15];
-cx q[0],q[15];
-cx q[0],q[16];
-cx q[3],q[15];
-rz(1.2228899556704538) q[15];
-cx q[3],q[15];
-rz(1.2228899556704538) q[16];
-cx q[0],q[16];
-cx q[0],q[20];
-cx q[3],q[16];
-rz(1.2228899556704538) q[16];
-cx q[3],q[16];
-rz(1.2228899556704538) q[20];
-cx q[0],q[20];
-cx q[0],q[32];
-cx q[15],q[20];
-rz(1.2228899556704538) q[20];
-cx q[15],q[20];
-rz(1.2228899556704538) q[32];
-cx q[0],q[32];
-cx q[0],q[42];
-rz(1.2228899556704538) q[42];
-cx q[0],q[42];
-cx q[0],q[48];
-rz(1.2228899556704538) q[48];
-cx q[0],q[48];
-cx q[0],q[51];
-rz(1.2228899556704538) q[51];
-cx q[0],q[51];
-rx(2.508914570949334) q[0];
-rz(5.02891910408278) q[52];
-cx q[10],q[52];
-rx(2.526534060916508) q[10];
-cx q[4],q[10];
-rz(1.2228899556704538) q[10];
-cx q[4],q[10];
-cx q[4],q[13];
-cx q[6],q[10];
-rz(1.2228899556704538) q[10];
-cx q[6],q[10];
-cx q[6],q[11];
-cx q[10],q[37];
-rz(1.2228899556704538) q[11];
-cx q[6],q[11];
-rx(2.508914570949334) q[11];
-rz(1.2228899556704538) q[13];
-cx q[4],q[13];
-cx q[4],q[14];
-cx q[5],q[13];
-rz(1.2228899556704538) q[13];
-cx q[5],q[13];
-rz(1.2228899556704538) q[14];
-cx q[4],q[14];
-rx(2.508914570949334) q[14];
-rz(1.2228899556704538) q[37];
-cx q[10],q[37];
-cx q[10],q[41];
-rz(1.2228899556704538) q[41];
-cx q[10],q[41];
-rx(2.526534060916508) q[52];
-ry(pi/2) q[53];
-rx(pi) q[53];
-cx q[17],q[53];
-rz(5.02891910408278) q[53];
-cx q[17],q[53];
-rx(2.526534060916508) q[17];
-cx q[1],q[17];
-rz(1.2228899556704538) q[17];
-cx q[1],q[17];
-cx q[1],q[28];
-cx q[3],q[17];
-rz(1.2228899556704538) q[17];
-cx q[3],q[17];
-cx q[3],q[18];
-rz(1.2228899556704538) q[18];
-cx q[3],q[18];
-cx q[3],q[19];
-cx q[4],q[18];
-rz(1.2228899556704538) q[18];
-cx q[4],q[18];
-rz(1.2228899556704538) q[19];
-cx q[3],q[19];
-cx q[3],q[22];
-cx q[7],q[19];
-rz(1.2228899556704538) q[19];
-cx q[7],q[19];
-rx(2.508914570949334) q[7];
-cx q[19],q[38];
-cx q[21],q[53];
-rz(1.2228899556704538) q[22];
-cx q[3],q[22];
-cx q[3],q[23];
-cx q[9],q[22];
-rz(1.2228899556704538) q[22];
-cx q[9],q[22];
-rx(2.508914570949334) q[9];
-rx(2.508914570949334) q[22];
-rz(1.2228899556704538) q[23];
-cx q[3],q[23];
-cx q[3],q[24];
-cx q[17],q[23];
-rz(1.2228899556704538) q[23];
-cx q[17],q[23];
-rz(1.2228899556704538) q[24];
-cx q[3],q[24];
-cx q[3],q[25];
-cx q[5],q[24];
-rz(1.2228899556704538) q[24];
-cx q[5],q[24];
-cx q[5],q[33];
-rx(2.508914570949334) q[24];
-rz(1.2228899556704538) q[25];
-cx q[3],q[25];
-cx q[3],q[26];
-cx q[12],q[25];
-rz(1.2228899556704538) q[25];
-cx q[12],q[25];
-cx q[12],q[31];
-rx(2.508914570949334) q[25];
-rz(1.2228899556704538) q[26];
-cx q[3],q[26];
-rz(1.2228899556704538) q[28];
-cx q[1],q[28];
-cx q[1],q[29];
-cx q[3],q[28];
-rz(1.2228899556704538) q[28];
-cx q[3],q[28];
-cx q[28],q[51];
-rz(1.2228899556704538) q[29];
-cx q[1],q[29];
-cx q[1],q[45];
-cx q[3],q[29];
-rz(1.2228899556704538) q[29];
-cx q[3],q[29];
-cx q[3],q[30];
-rx(2.508914570949334) q[29];
-rz(1.2228899556704538) q[30];
-cx q[3],q[30];
-cx q[3],q[34];
-cx q[18],q[30];
-rz(1.2228899556704538) q[30];
-cx q[18],q[30];
-rx(2.508914570949334) q[18];
-rz(1.2228899556704538) q[31];
-cx q[12],q[31];
-rz(1.2228899556704538) q[33];
-cx q[5],q[33];
-cx q[5],q[46];
-cx q[30],q[33];
-rz(1.2228899556704538) q[33];
-cx q[30],q[33];
-cx q[30],q[48];
-rx(2.508914570949334) q[33];
-rz(1.2228899556704538) q[34];
-cx q[3],q[34];
-cx q[3],q[35];
-cx q[12],q[34];
-rz(1.2228899556704538) q[34];
-cx q[12],q[34];
-cx q[34],q[37];
-rz(1.2228899556704538) q[35];
-cx q[3],q[35];
-cx q[3],q[39];
-rz(1.2228899556704538) q[37];
-cx q[34],q[37];
-rx(2.508914570949334) q[34];
-rx(2.508914570949334) q[37];
-rz(1.2228899556704538) q[38];
-cx q[19],q[38];
-rx(2.508914570949334) q[19];
-rz(1.2228899556704538) q[39];
-cx q[3],q[39];
-cx q[3],q[40];
-cx q[13],q[39];
-rz(1.2228899556704538) q[39];
-cx q[13],q[39];
-rx(2.508914570949334) q[13];
-rx(2.508914570949334) q[39];
-rz(1.2228899556704538) q[40];
-cx q[3],q[40];
-cx q[3],q[42];
-cx q[23],q[40];
-rz(1.2228899556704538) q[40];
-cx q[23],q[40];
-rx(2.508914570949334) q[23];
-rx(2.508914570949334) q[40];
-rz(1.2228899556704538) q[42];
-cx q[3],q[42];
-cx q[3],q[43];
-rx(2.508914570949334) q[42];
-rz(1.2228899556704538) q[43];
-cx q[3],q[43];
-cx q[3],q[44];
-rz(1.2228899556704538) q[44];
-cx q[3],q[44];
-cx q[3],q[49];
-cx q[12],q[44];
-rz(1.2228899556704538) q[44];
-cx q[12],q[44];
-rx(2.508914570949334) q[44];
-rz(1.2228899556704538) q[45];
-cx q[1],q[45];
-rx(2.508914570949334) q[1];
-cx q[0],q[1];
-rz(2.902887987294992) q[1];
-cx q[0],q[1];
-cx q[0],q[2];
-rz(2.902887987294992) q[2];
-cx q[0],q[2];
-rx(4.905379137606956) q[2];
-cx q[16],q[45];
-rz(1.2228899556704538) q[45];
-cx q[16],q[45];
-rx(2.508914570949334) q[16];
-rx(2.508914570949334) q[45];
-rz(1.2228899556704538) q[46];
-cx q[5],q[46];
-rx(2.508914570949334) q[5];
-rz(1.2228899556704538) q[48];
-cx q[30],q[48];
-rx(2.508914570949334) q[30];
-rx(2.508914570949334) q[48];
-rz(1.2228899556704538) q[49];
-cx q[3],q[49];
-cx q[3],q[50];
-rz(1.2228899556704538) q[50];
-cx q[3],q[50];
-cx q[3],q[52];
-cx q[12],q[50];
-rz(1.2228899556704538) q[50];
-cx q[12],q[50];
-rx(2.508914570949334) q[12];
-rx(2.508914570949334) q[50];
-rz(1.2228899556704538) q[51];
-cx q[28],q[51];
-rx(2.508914570949334) q[28];
-rx(2.508914570949334) q[51];
-rz(1.2228899556704538) q[52];
-cx q[3],q[52];
-rx(2.508914570949334) q[3];
-cx q[0],q[3];
-rz(2.902887987294992) q[3];
-cx q[0],q[3];
-cx q[1],q[3];
-rz(2.902887987294992) q[3];
-cx q[1],q[3];
-cx q[10],q[52];
-rz(1.2228899556704538) q[52];
-cx q[10],q[52];
-rx(2.508914570949334) q[10];
-rx(2.508914570949334) q[52];
-rz(5.02891910408278) q[53];
-cx q[21],q[53];
-rx(2.526534060916508) q[21];
-cx q[4],q[21];
-rz(1.2228899556704538) q[21];
-cx q[4],q[21];
-cx q[4],q[27];
-cx q[15],q[21];
-rz(1.2228899556704538) q[21];
-cx q[15],q[21];
-cx q[15],q[36];
-cx q[21],q[26];
-rz(1.2228899556704538) q[26];
-cx q[21],q[26];
-cx q[21],q[32];
-cx q[26],q[31];
-rz(1.2228899556704538) q[27];
-cx q[4],q[27];
-cx q[4],q[47];
-cx q[6],q[27];
-rz(1.2228899556704538) q[27];
-cx q[6],q[27];
-rx(2.508914570949334) q[6];
-cx q[27],q[41];
-rz(1.2228899556704538) q[31];
-cx q[26],q[31];
-rx(2.508914570949334) q[26];
-rx(2.508914570949334) q[31];
-rz(1.2228899556704538) q[32];
-cx q[21],q[32];
-cx q[21],q[38];
-cx q[32],q[35];
-rz(1.2228899556704538) q[35];
-cx q[32],q[35];
-rx(2.508914570949334) q[32];
-rx(2.508914570949334) q[35];
-rz(1.2228899556704538) q[36];
-cx q[15],q[36];
-rx(2.508914570949334) q[15];
-cx q[0],q[15];
-rz(2.902887987294992) q[15];
-cx q[0],q[15];
-cx q[0],q[16];
-rz(2.902887987294992) q[16];
-cx q[0],q[16];
-cx q[20],q[36];
-rz(1.2228899556704538) q[36];
-cx q[20],q[36];
-cx q[20],q[43];
-rx(2.508914570949334) q[36];
-rz(1.2228899556704538) q[38];
-cx q[21],q[38];
-cx q[38],q[46];
-rz(1.2228899556704538) q[41];
-cx q[27],q[41];
-rx(2.508914570949334) q[27];
-rx(2.508914570949334) q[41];
-rz(1.2228899556704538) q[43];
-cx q[20],q[43];
-rx(2.508914570949334) q[20];
-cx q[0],q[20];
-rz(2.902887987294992) q[20];
-cx q[0],q[20];
-cx q[0],q[32];
-rz(2.902887987294992) q[32];
-cx q[0],q[32];
-cx q[0],q[42];
-rz(2.902887987294992) q[42];
-cx q[0],q[42];
-cx q[0],q[48];
-rx(2.508914570949334) q[43];
-rz(1.2228899556704538) q[46];
-cx q[38],q[46];
-rx(2.508914570949334) q[38];
-rx(2.508914570949334) q[46];
-rz(1.2228899556704538) q[47];
-cx q[4],q[47];
-cx q[4],q[49];
-cx q[17],q[47];
-rz(1.2228899556704538) q[47];
-cx q[17],q[47];
-rx(2.508914570949334) q[47];
-rz(2.902887987294992) q[48];
-cx q[0],q[48];
-cx q[0],q[51];
-rz(1.2228899556704538) q[49];
-cx q[4],q[49];
-rx(2.508914570949334) q[4];
-cx q[1],q[4];
-rz(2.902887987294992) q[4];
-cx q[1],q[4];
-cx q[1],q[5];
-cx q[3],q[4];
-rz(2.902887987294992) q[4];
-cx q[3],q[4];
-cx q[4],q[6];
-rz(2.902887987294992) q[5];
-cx q[1],q[5];
-cx q[1],q[9];
-cx q[3],q[5];
-rz(2.902887987294992) q[5];
-cx q[3],q[5];
-cx q[3],q[7];
-rz(2.902887987294992) q[6];
-cx q[4],q[6];
-cx q[5],q[6];
-rz(2.902887987294992) q[6];
-cx q[5],q[6];
-rz(2.902887987294992) q[7];
-cx q[3],q[7];
-cx q[3],q[8];
-cx q[4],q[7];
-rz(2.902887987294992) q[7];
-cx q[4],q[7];
-cx q[4],q[10];
-rz(2.902887987294992) q[8];
-cx q[3],q[8];
-cx q[5],q[8];
-rz(2.902887987294992) q[8];
-cx q[5],q[8];
-cx q[5],q[11];
-rx(4.905379137606956) q[8];
-rz(2.902887987294992) q[9];
-cx q[1],q[9];
-cx q[3],q[9];
-rz(2.902887987294992) q[9];
-cx q[3],q[9];
-cx q[3],q[12];
-rz(2.902887987294992) q[10];
-cx q[4],q[10];
-cx q[4],q[13];
-cx q[6],q[10];
-rz(2.902887987294992) q[10];
-cx q[6],q[10];
-cx q[10],q[37];
-rz(2.902887987294992) q[11];
-cx q[5],q[11];
-cx q[6],q[11];
-rz(2.902887987294992) q[11];
-cx q[6],q[11];
-rx(4.905379137606956) q[11];
-rz(2.902887987294992) q[12];
-cx q[3],q[12];
-cx q[3],q[14];
-cx q[5],q[12];
-rz(2.902887987294992) q[12];
-cx q[5],q[12];
-rz(2.902887987294992) q[13];
-cx q[4],q[13];
-cx q[5],q[13];
-rz(2.902887987294992) q[13];
-cx q[5],q[13];
-rz(2.902887987294992) q[14];
-cx q[3],q[14];
-cx q[3],q[15];
-cx q[4],q[14];
-rz(2.902887987294992) q[14];
-cx q[4],q[14];
-rx(4.905379137606956) q[14];
-rz(2.902887987294992) q[15];
-cx q[3],q[15];
-cx q[3],q[16];
-cx q[15],q[20];
-rz(2.902887987294992) q[16];
-cx q[3],q[16];
-rz(2.902887987294992) q[20];
-cx q[15],q[20];
-rz(2.902887987294992) q[37];
-cx q[10],q[37];
-cx q[10],q[41];
-rz(2.902887987294992) q[41];
-cx q[10],q[41];
-rx(2.508914570949334) q[49];
-rz(2.902887987294992) q[51];
-cx q[0],q[51];
-rx(4.905379137606956) q[0];
-rx(2.526534060916508) q[53];
-cx q[17],q[53];
-rz(1.2228899556704538) q[53];
-cx q[17],q[53];
-rx(2.508914570949334) q[17];
-cx q[1],q[17];
-rz(2.902887987294992) q[17];
-cx q[1],q[17];
-cx q[1],q[28];
-cx q[3],q[17];
-rz(2.902887987294992) q[17];
-cx q[3],q[17];
-cx q[3],q[18];
-rz(2.902887987294992) q[18];
-cx q[3],q[18];
-cx q[3],q[19];
-cx q[4],q[18];
-rz(2.902887987294992) q[18];
-cx q[4],q[18];
-rz(2.902887987294992) q[19];
-cx q[3],q[19];
-cx q[3],q[22];
-cx q[7],q[19];
-rz(2.902887987294992) q[19];
-cx q[7],q[19];
-rx(4.905379137606956) q[7];
-cx q[19],q[38];
-cx q[21],q[53];
-rz(2.902887987294992) q[22];
-cx q[3],q[22];
-cx q[3],q[23];
-cx q[9],q[22];
-rz(2.902887987294992) q[22];
-cx q[9],q[22];
-rx(4.905379137606956) q[9];
-rx(4.905379137606956) q[22];
-rz(2.902887987294992) q[23];
-cx q[3],q[23];
-cx q[3],q[24];
-cx q[17],q[23];
-rz(2.902887987294992) q[23];
-cx q[17],q[23];
-rz(2.902887987294992) q[24];
-cx q[3],q[24];
-cx q[3],q[25];
-cx q[5],q[24];
-rz(2.902887987294992) q[24];
-cx q[5],q[24];
-cx q[5],q[33];
-rx(4.905379137606956) q[24];
-rz(2.902887987294992) q[25];
-cx q[3],q[25];
-cx q[3],q[26];
-cx q[12],q[25];
-rz(2.902887987294992) q[25];
-cx q[12],q[25];
-cx q[12],q[31];
-rx(4.905379137606956) q[25];
-rz(2.902887987294992) q[26];
-cx q[3],q[26];
-rz(2.902887987294992) q[28];
-cx q[1],q[28];
-cx q[1],q[29];
-cx q[3],q[28];
-rz(2.902887987294992) q[28];
-cx q[3],q[28];
-cx q[28],q[51];
-rz(2.902887987294992) q[29];
-cx q[1],q[29];
-cx q[1],q[45];
-cx q[3],q[29];
-rz(2.902887987294992) q[29];
-cx q[3],q[29];
-cx q[3],q[30];
-rx(4.905379137606956) q[29];
-rz(2.902887987294992) q[30];
-cx q[3],q[30];
-cx q[3],q[34];
-cx q[18],q[30];
-rz(2.902887987294992) q[30];
-cx q[18],q[30];
-rx(4.905379137606956) q[18];
-rz(2.902887987294992) q[31];
-cx q[12],q[31];
-rz(2.902887987294992) q[33];
-cx q[5],q[33];
-cx q[5],q[46];
-cx q[30],q[33];
-rz(2.902887987294992) q[33];
-cx q[30],q[33];
-cx q[30],q[48];
-rx(4.905379137606956) q[33];
-rz(2.902887987294992) q[34];
-cx q[3],q[34];
-cx q[3],q[35];
-cx q[12],q[34];
-rz(2.902887987294992) q[34];
-cx q[12],q[34];
-cx q[34],q[37];
-rz(2.902887987294992) q[35];
-cx q[3],q[35];
-cx q[3],q[39];
-rz(2.902887987294992) q[37];
-cx q[34],q[37];
-rx(4.905379137606956) q[34];
-rx(4.905379137606956) q[37];
-rz(2.902887987294992) q[38];
-cx q[19],q[38];
-rx(4.905379137606956) q[19];
-rz(2.902887987294992) q[39];
-cx q[3],q[39];
-cx q[3],q[40];
-cx q[13],q[39];
-rz(2.902887987294992) q[39];
-cx q[13],q[39];
-rx(4.905379137606956) q[13];
-rx(4.905379137606956) q[39];
-rz(2.902887987294992) q[40];
-cx q[3],q[40];
-cx q[3],q[42];
-cx q[23],q[40];
-rz(2.902887987294992) q[40];
-cx q[23],q[40];
-rx(4.905379137606956) q[23];
-rx(4.905379137606956) q[40];
-rz(2.902887987294992) q[42];
-cx q[3],q[42];
-cx q[3],q[43];
-rx(4.905379137606956) q[42];
-rz(2.902887987294992) q[43];
-cx q[3],q[43];
-cx q[3],q[44];
-rz(2.902887987294992) q[44];
-cx q[3],q[44];
-cx q[3],q[49];
-cx q[12],q[44];
-rz(2.902887987294992) q[44];
-cx q[12],q[44];
-rx(4.905379137606956) q[44];
-rz(2.902887987294992) q[45];
-cx q[1],q[45];
-rx(4.905379137606956) q[1];
-cx q[16],q[45];
-rz(2.902887987294992) q[45];
-cx q[16],q[45];
-rx(4.905379137606956) q[16];
-rx(4.905379137606956) q[45];
-rz(2.902887987294992) q[46];
-cx q[5],q[46];
-rx(4.905379137606956) q[5];
-rz(2.902887987294992) q[48];
-cx q[30],q[48];
-rx(4.905379137606956) q[30];
-rx(4.905379137606956) q[48];
-rz(2.902887987294992) q[49];
-cx q[3],q[49];
-cx q[3],q[50];
-rz(2.902887987294992) q[50];
-cx q[3],q[50];
-cx q[3],q[52];
-cx q[12],q[50];
-rz(2.902887987294992) q[50];
-cx q[12],q[50];
-rx(4.905379137606956) q[12];
-rx(4.905379137606956) q[50];
-rz(2.902887987294992) q[51];
-cx q[28],q[51];
-rx(4.905379137606956) q[28];
-rx(4.905379137606956) q[51];
-rz(2.902887987294992) q[52];
-cx q[3],q[52];
-rx(4.905379137606956) q[3];
-cx q[10],q[52];
-rz(2.902887987294992) q[52];
-cx q[10],q[52];
-rx(4.905379137606956) q[10];
-rx(4.905379137606956) q[52];
-rz(1.2228899556704538) q[53];
-cx q[21],q[53];
-rx(2.508914570949334) q[21];
-cx q[4],q[21];
-rz(2.902887987294992) q[21];
-cx q[4],q[21];
-cx q[4],q[27];
-cx q[15],q[21];
-rz(2.902887987294992) q[21];
-cx q[15],q[21];
-cx q[15],q[36];
-cx q[21],q[26];
-rz(2.902887987294992) q[26];
-cx q[21],q[26];
-cx q[21],q[32];
-cx q[26],q[31];
-rz(2.902887987294992) q[27];
-cx q[4],q[27];
-cx q[4],q[47];
-cx q[6],q[27];
-rz(2.902887987294992) q[27];
-cx q[6],q[27];
-rx(4.905379137606956) q[6];
-cx q[27],q[41];
-rz(2.902887987294992) q[31];
-cx q[26],q[31];
-rx(4.905379137606956) q[26];
-rx(4.905379137606956) q[31];
-rz(2.902887987294992) q[32];
-cx q[21],q[32];
-cx q[21],q[38];
-cx q[32],q[35];
-rz(2.902887987294992) q[35];
-cx q[32],q[35];
-rx(4.905379137606956) q[32];
-rx(4.905379137606956) q[35];
-rz(2.902887987294992) q[36];
-cx q[15],q[36];
-rx(4.905379137606956) q[15];
-cx q[20],q[36];
-rz(2.902887987294992) q[36];
-cx q[20],q[36];
-cx q[20],q[43];
-rx(4.905379137606956) q[36];
-rz(2.902887987294992) q[38];
-cx q[21],q[38];
-cx q[38],q[46];
-rz(2.902887987294992) q[41];
-cx q[27],q[41];
-rx(4.905379137606956) q[27];
-rx(4.905379137606956) q[41];
-rz(2.902887987294992) q[43];
-cx q[20],q[43];
-rx(4.905379137606956) q[20];
-rx(4.905379137606956) q[43];
-rz(2.902887987294992) q[46];
-cx q[38],q[46];
-rx(4.905379137606956) q[38];
-rx(4.905379137606956) q[46];
-rz(2.902887987294992) q[47];
-cx q[4],q[47];
-cx q[4],q[49];
-cx q[17],q[47];
-rz(2.902887987294992) q[47];
-cx q[17],q[47];
-rx(4.905379137606956) q[47];
-rz(2.902887987294992) q[49];
-cx q[4],q[49];
-rx(4.905379137606956) q[4];
-rx(4.905379137606956) q[49];
-rx(2.508914570949334) q[53];
-cx q[17],q[53];
-rz(2.902887987294992) q[53];
-cx q[17],q[53];
-rx(4.905379137606956) q[17];
-cx q[21],q[53];
-rz(2.902887987294992) q[53];
-cx q[21],q[53];
-rx(4.905379137606956) q[21];
-rx(4.905379137606956) q[53];
\ No newline at end of file
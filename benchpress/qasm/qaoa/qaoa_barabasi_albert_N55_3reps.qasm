@@ -1,1232 +0,0 @@
-OPENQASM 2.0;
-include "qelib1.inc";
-qreg q[55];
-ry(pi/2) q[0];
-rx(pi) q[0];
-ry(pi/2) q[1];
-rx(pi) q[1];
-cx q[0],q[1];
-rz(4.77409652217838) q[1];
-cx q[0],q[1];
-ry(pi/2) q[2];
-rx(pi) q[2];
-cx q[0],q[2];
-rz(4.77409652217838) q[2];
-cx q[0],q[2];
-rx(1.924112387435804) q[2];
-ry(pi/2) q[3];
-rx(pi) q[3];
-cx q[0],q[3];
-rz(4.77409652217838) q[3];
-cx q[0],q[3];
-cx q[1],q[3];
-rz(4.77409652217838) q[3];
-cx q[1],q[3];
-ry(pi/2) q[4];
-rx(pi) q[4];
-cx q[1],q[4];
-rz(4.77409652217838) q[4];
-cx q[1],q[4];
-cx q[3],q[4];
-rz(4.77409652217838) q[4];
-cx q[3],q[4];
-ry(pi/2) q[5];
-rx(pi) q[5];
-cx q[1],q[5];
-rz(4.77409652217838) q[5];
-cx q[1],q[5];
-cx q[3],q[5];
-rz(4.77409652217838) q[5];
-cx q[3],q[5];
-ry(pi/2) q[6];
-rx(pi) q[6];
-cx q[4],q[6];
-rz(4.77409652217838) q[6];
-cx q[4],q[6];
-cx q[5],q[6];
-rz(4.77409652217838) q[6];
-cx q[5],q[6];
-ry(pi/2) q[7];
-rx(pi) q[7];
-cx q[3],q[7];
-rz(4.77409652217838) q[7];
-cx q[3],q[7];
-cx q[4],q[7];
-rz(4.77409652217838) q[7];
-cx q[4],q[7];
-ry(pi/2) q[8];
-rx(pi) q[8];
-cx q[3],q[8];
-rz(4.77409652217838) q[8];
-cx q[3],q[8];
-cx q[5],q[8];
-rz(4.77409652217838) q[8];
-cx q[5],q[8];
-rx(1.924112387435804) q[8];
-ry(pi/2) q[9];
-rx(pi) q[9];
-cx q[1],q[9];
-rz(4.77409652217838) q[9];
-cx q[1],q[9];
-cx q[3],q[9];
-rz(4.77409652217838) q[9];
-cx q[3],q[9];
-ry(pi/2) q[10];
-rx(pi) q[10];
-cx q[4],q[10];
-rz(4.77409652217838) q[10];
-cx q[4],q[10];
-cx q[6],q[10];
-rz(4.77409652217838) q[10];
-cx q[6],q[10];
-ry(pi/2) q[11];
-rx(pi) q[11];
-cx q[5],q[11];
-rz(4.77409652217838) q[11];
-cx q[5],q[11];
-cx q[6],q[11];
-rz(4.77409652217838) q[11];
-cx q[6],q[11];
-rx(1.924112387435804) q[11];
-ry(pi/2) q[12];
-rx(pi) q[12];
-cx q[3],q[12];
-rz(4.77409652217838) q[12];
-cx q[3],q[12];
-cx q[5],q[12];
-rz(4.77409652217838) q[12];
-cx q[5],q[12];
-ry(pi/2) q[13];
-rx(pi) q[13];
-cx q[4],q[13];
-rz(4.77409652217838) q[13];
-cx q[4],q[13];
-cx q[5],q[13];
-rz(4.77409652217838) q[13];
-cx q[5],q[13];
-ry(pi/2) q[14];
-rx(pi) q[14];
-cx q[3],q[14];
-rz(4.77409652217838) q[14];
-cx q[3],q[14];
-cx q[4],q[14];
-rz(4.77409652217838) q[14];
-cx q[4],q[14];
-rx(1.924112387435804) q[14];
-ry(pi/2) q[15];
-rx(pi) q[15];
-cx q[0],q[15];
-rz(4.77409652217838) q[15];
-cx q[0],q[15];
-cx q[3],q[15];
-rz(4.77409652217838) q[15];
-cx q[3],q[15];
-ry(pi/2) q[16];
-rx(pi) q[16];
-cx q[0],q[16];
-rz(4.77409652217838) q[16];
-cx q[0],q[16];
-cx q[3],q[16];
-rz(4.77409652217838) q[16];
-cx q[3],q[16];
-ry(pi/2) q[17];
-rx(pi) q[17];
-cx q[1],q[17];
-rz(4.77409652217838) q[17];
-cx q[1],q[17];
-cx q[3],q[17];
-rz(4.77409652217838) q[17];
-cx q[3],q[17];
-ry(pi/2) q[18];
-rx(pi) q[18];
-cx q[3],q[18];
-rz(4.77409652217838) q[18];
-cx q[3],q[18];
-cx q[4],q[18];
-rz(4.77409652217838) q[18];
-cx q[4],q[18];
-ry(pi/2) q[19];
-rx(pi) q[19];
-cx q[3],q[19];
-rz(4.77409652217838) q[19];
-cx q[3],q[19];
-cx q[7],q[19];
-rz(4.77409652217838) q[19];
-cx q[7],q[19];
-rx(1.924112387435804) q[7];
-ry(pi/2) q[20];
-rx(pi) q[20];
-cx q[0],q[20];
-rz(4.77409652217838) q[20];
-cx q[0],q[20];
-cx q[15],q[20];
-rz(4.77409652217838) q[20];
-cx q[15],q[20];
-ry(pi/2) q[21];
-rx(pi) q[21];
-cx q[4],q[21];
-rz(4.77409652217838) q[21];
-cx q[4],q[21];
-cx q[15],q[21];
-rz(4.77409652217838) q[21];
-cx q[15],q[21];
-ry(pi/2) q[22];
-rx(pi) q[22];
-cx q[3],q[22];
-rz(4.77409652217838) q[22];
-cx q[3],q[22];
-cx q[9],q[22];
-rz(4.77409652217838) q[22];
-cx q[9],q[22];
-rx(1.924112387435804) q[9];
-rx(1.924112387435804) q[22];
-ry(pi/2) q[23];
-rx(pi) q[23];
-cx q[3],q[23];
-rz(4.77409652217838) q[23];
-cx q[3],q[23];
-cx q[17],q[23];
-rz(4.77409652217838) q[23];
-cx q[17],q[23];
-ry(pi/2) q[24];
-rx(pi) q[24];
-cx q[3],q[24];
-rz(4.77409652217838) q[24];
-cx q[3],q[24];
-cx q[5],q[24];
-rz(4.77409652217838) q[24];
-cx q[5],q[24];
-ry(pi/2) q[25];
-rx(pi) q[25];
-cx q[3],q[25];
-rz(4.77409652217838) q[25];
-cx q[3],q[25];
-cx q[12],q[25];
-rz(4.77409652217838) q[25];
-cx q[12],q[25];
-rx(1.924112387435804) q[25];
-ry(pi/2) q[26];
-rx(pi) q[26];
-cx q[3],q[26];
-rz(4.77409652217838) q[26];
-cx q[3],q[26];
-cx q[21],q[26];
-rz(4.77409652217838) q[26];
-cx q[21],q[26];
-ry(pi/2) q[27];
-rx(pi) q[27];
-cx q[4],q[27];
-rz(4.77409652217838) q[27];
-cx q[4],q[27];
-cx q[6],q[27];
-rz(4.77409652217838) q[27];
-cx q[6],q[27];
-rx(1.924112387435804) q[6];
-ry(pi/2) q[28];
-rx(pi) q[28];
-cx q[1],q[28];
-rz(4.77409652217838) q[28];
-cx q[1],q[28];
-cx q[3],q[28];
-rz(4.77409652217838) q[28];
-cx q[3],q[28];
-ry(pi/2) q[29];
-rx(pi) q[29];
-cx q[1],q[29];
-rz(4.77409652217838) q[29];
-cx q[1],q[29];
-cx q[3],q[29];
-rz(4.77409652217838) q[29];
-cx q[3],q[29];
-rx(1.924112387435804) q[29];
-ry(pi/2) q[30];
-rx(pi) q[30];
-cx q[3],q[30];
-rz(4.77409652217838) q[30];
-cx q[3],q[30];
-cx q[18],q[30];
-rz(4.77409652217838) q[30];
-cx q[18],q[30];
-rx(1.924112387435804) q[18];
-ry(pi/2) q[31];
-rx(pi) q[31];
-cx q[12],q[31];
-rz(4.77409652217838) q[31];
-cx q[12],q[31];
-cx q[26],q[31];
-rz(4.77409652217838) q[31];
-cx q[26],q[31];
-rx(1.924112387435804) q[26];
-rx(1.924112387435804) q[31];
-ry(pi/2) q[32];
-rx(pi) q[32];
-cx q[0],q[32];
-rz(4.77409652217838) q[32];
-cx q[0],q[32];
-cx q[21],q[32];
-rz(4.77409652217838) q[32];
-cx q[21],q[32];
-ry(pi/2) q[33];
-rx(pi) q[33];
-cx q[5],q[33];
-rz(4.77409652217838) q[33];
-cx q[5],q[33];
-cx q[30],q[33];
-rz(4.77409652217838) q[33];
-cx q[30],q[33];
-rx(1.924112387435804) q[33];
-ry(pi/2) q[34];
-rx(pi) q[34];
-cx q[3],q[34];
-rz(4.77409652217838) q[34];
-cx q[3],q[34];
-cx q[12],q[34];
-rz(4.77409652217838) q[34];
-cx q[12],q[34];
-ry(pi/2) q[35];
-rx(pi) q[35];
-cx q[3],q[35];
-rz(4.77409652217838) q[35];
-cx q[3],q[35];
-cx q[32],q[35];
-rz(4.77409652217838) q[35];
-cx q[32],q[35];
-rx(1.924112387435804) q[32];
-rx(1.924112387435804) q[35];
-ry(pi/2) q[36];
-rx(pi) q[36];
-cx q[15],q[36];
-rz(4.77409652217838) q[36];
-cx q[15],q[36];
-rx(1.924112387435804) q[15];
-cx q[20],q[36];
-rz(4.77409652217838) q[36];
-cx q[20],q[36];
-rx(1.924112387435804) q[36];
-ry(pi/2) q[37];
-rx(pi) q[37];
-cx q[10],q[37];
-rz(4.77409652217838) q[37];
-cx q[10],q[37];
-cx q[34],q[37];
-rz(4.77409652217838) q[37];
-cx q[34],q[37];
-rx(1.924112387435804) q[34];
-rx(1.924112387435804) q[37];
-ry(pi/2) q[38];
-rx(pi) q[38];
-cx q[19],q[38];
-rz(4.77409652217838) q[38];
-cx q[19],q[38];
-rx(1.924112387435804) q[19];
-cx q[21],q[38];
-rz(4.77409652217838) q[38];
-cx q[21],q[38];
-ry(pi/2) q[39];
-rx(pi) q[39];
-cx q[3],q[39];
-rz(4.77409652217838) q[39];
-cx q[3],q[39];
-cx q[13],q[39];
-rz(4.77409652217838) q[39];
-cx q[13],q[39];
-rx(1.924112387435804) q[13];
-rx(1.924112387435804) q[39];
-ry(pi/2) q[40];
-rx(pi) q[40];
-cx q[3],q[40];
-rz(4.77409652217838) q[40];
-cx q[3],q[40];
-cx q[23],q[40];
-rz(4.77409652217838) q[40];
-cx q[23],q[40];
-rx(1.924112387435804) q[23];
-rx(1.924112387435804) q[40];
-ry(pi/2) q[41];
-rx(pi) q[41];
-cx q[10],q[41];
-rz(4.77409652217838) q[41];
-cx q[10],q[41];
-cx q[27],q[41];
-rz(4.77409652217838) q[41];
-cx q[27],q[41];
-rx(1.924112387435804) q[27];
-rx(1.924112387435804) q[41];
-ry(pi/2) q[42];
-rx(pi) q[42];
-cx q[0],q[42];
-rz(4.77409652217838) q[42];
-cx q[0],q[42];
-cx q[3],q[42];
-rz(4.77409652217838) q[42];
-cx q[3],q[42];
-rx(1.924112387435804) q[42];
-ry(pi/2) q[43];
-rx(pi) q[43];
-cx q[3],q[43];
-rz(4.77409652217838) q[43];
-cx q[3],q[43];
-cx q[20],q[43];
-rz(4.77409652217838) q[43];
-cx q[20],q[43];
-rx(1.924112387435804) q[20];
-rx(1.924112387435804) q[43];
-ry(pi/2) q[44];
-rx(pi) q[44];
-cx q[3],q[44];
-rz(4.77409652217838) q[44];
-cx q[3],q[44];
-cx q[12],q[44];
-rz(4.77409652217838) q[44];
-cx q[12],q[44];
-rx(1.924112387435804) q[44];
-ry(pi/2) q[45];
-rx(pi) q[45];
-cx q[1],q[45];
-rz(4.77409652217838) q[45];
-cx q[1],q[45];
-rx(1.924112387435804) q[1];
-cx q[16],q[45];
-rz(4.77409652217838) q[45];
-cx q[16],q[45];
-rx(1.924112387435804) q[16];
-rx(1.924112387435804) q[45];
-ry(pi/2) q[46];
-rx(pi) q[46];
-cx q[5],q[46];
-rz(4.77409652217838) q[46];
-cx q[5],q[46];
-rx(1.924112387435804) q[5];
-cx q[38],q[46];
-rz(4.77409652217838) q[46];
-cx q[38],q[46];
-rx(1.924112387435804) q[38];
-rx(1.924112387435804) q[46];
-ry(pi/2) q[47];
-rx(pi) q[47];
-cx q[4],q[47];
-rz(4.77409652217838) q[47];
-cx q[4],q[47];
-cx q[17],q[47];
-rz(4.77409652217838) q[47];
-cx q[17],q[47];
-rx(1.924112387435804) q[47];
-ry(pi/2) q[48];
-rx(pi) q[48];
-cx q[0],q[48];
-rz(4.77409652217838) q[48];
-cx q[0],q[48];
-cx q[30],q[48];
-rz(4.77409652217838) q[48];
-cx q[30],q[48];
-rx(1.924112387435804) q[30];
-rx(1.924112387435804) q[48];
-ry(pi/2) q[49];
-rx(pi) q[49];
-cx q[3],q[49];
-rz(4.77409652217838) q[49];
-cx q[3],q[49];
-cx q[4],q[49];
-rz(4.77409652217838) q[49];
-cx q[4],q[49];
-rx(1.924112387435804) q[4];
-rx(1.924112387435804) q[49];
-ry(pi/2) q[50];
-rx(pi) q[50];
-cx q[3],q[50];
-rz(4.77409652217838) q[50];
-cx q[3],q[50];
-cx q[12],q[50];
-rz(4.77409652217838) q[50];
-cx q[12],q[50];
-rx(1.924112387435804) q[12];
-rx(1.924112387435804) q[50];
-ry(pi/2) q[51];
-rx(pi) q[51];
-cx q[0],q[51];
-rz(4.77409652217838) q[51];
-cx q[0],q[51];
-rx(1.924112387435804) q[0];
-cx q[0],q[1];
-rz(5.5143479808247635) q[1];
-cx q[0],q[1];
-cx q[0],q[2];
-rz(5.5143479808247635) q[2];
-cx q[0],q[2];
-rx(11.461896666608423) q[2];
-cx q[28],q[51];
-rz(4.77409652217838) q[51];
-cx q[28],q[51];
-rx(1.924112387435804) q[51];
-ry(pi/2) q[52];
-rx(pi) q[52];
-cx q[3],q[52];
-rz(4.77409652217838) q[52];
-cx q[3],q[52];
-rx(1.924112387435804) q[3];
-cx q[0],q[3];
-rz(5.5143479808247635) q[3];
-cx q[0],q[3];
-cx q[0],q[15];
-cx q[1],q[3];
-rz(5.5143479808247635) q[3];
-cx q[1],q[3];
-cx q[1],q[4];
-rz(5.5143479808247635) q[4];
-cx q[1],q[4];
-cx q[1],q[5];
-cx q[3],q[4];
-rz(5.5143479808247635) q[4];
-cx q[3],q[4];
-cx q[4],q[6];
-rz(5.5143479808247635) q[5];
-cx q[1],q[5];
-cx q[1],q[9];
-cx q[3],q[5];
-rz(5.5143479808247635) q[5];
-cx q[3],q[5];
-cx q[3],q[7];
-rz(5.5143479808247635) q[6];
-cx q[4],q[6];
-cx q[5],q[6];
-rz(5.5143479808247635) q[6];
-cx q[5],q[6];
-rz(5.5143479808247635) q[7];
-cx q[3],q[7];
-cx q[3],q[8];
-cx q[4],q[7];
-rz(5.5143479808247635) q[7];
-cx q[4],q[7];
-rz(5.5143479808247635) q[8];
-cx q[3],q[8];
-cx q[5],q[8];
-rz(5.5143479808247635) q[8];
-cx q[5],q[8];
-cx q[5],q[11];
-rx(11.461896666608423) q[8];
-rz(5.5143479808247635) q[9];
-cx q[1],q[9];
-cx q[3],q[9];
-rz(5.5143479808247635) q[9];
-cx q[3],q[9];
-cx q[3],q[12];
-cx q[10],q[52];
-rz(5.5143479808247635) q[11];
-cx q[5],q[11];
-rz(5.5143479808247635) q[12];
-cx q[3],q[12];
-cx q[3],q[14];
-cx q[5],q[12];
-rz(5.5143479808247635) q[12];
-cx q[5],q[12];
-rz(5.5143479808247635) q[14];
-cx q[3],q[14];
-rz(5.5143479808247635) q[15];
-cx q[0],q[15];
-cx q[0],q[16];
-cx q[3],q[15];
-rz(5.5143479808247635) q[15];
-cx q[3],q[15];
-rz(5.5143479808247635) q[16];
-cx q[0],q[16];
-cx q[0],q[20];
-cx q[3],q[16];
-rz(5.5143479808247635) q[16];
-cx q[3],q[16];
-rz(5.5143479808247635) q[20];
-cx q[0],q[20];
-cx q[0],q[32];
-cx q[15],q[20];
-rz(5.5143479808247635) q[20];
-cx q[15],q[20];
-rz(5.5143479808247635) q[32];
-cx q[0],q[32];
-cx q[0],q[42];
-rz(5.5143479808247635) q[42];
-cx q[0],q[42];
-cx q[0],q[48];
-rz(5.5143479808247635) q[48];
-cx q[0],q[48];
-cx q[0],q[51];
-rz(5.5143479808247635) q[51];
-cx q[0],q[51];
-rx(11.461896666608423) q[0];
-rz(4.77409652217838) q[52];
-cx q[10],q[52];
-rx(1.924112387435804) q[10];
-cx q[4],q[10];
-rz(5.5143479808247635) q[10];
-cx q[4],q[10];
-cx q[4],q[13];
-cx q[6],q[10];
-rz(5.5143479808247635) q[10];
-cx q[6],q[10];
-cx q[6],q[11];
-cx q[10],q[37];
-rz(5.5143479808247635) q[11];
-cx q[6],q[11];
-rx(11.461896666608423) q[11];
-rz(5.5143479808247635) q[13];
-cx q[4],q[13];
-cx q[4],q[14];
-cx q[5],q[13];
-rz(5.5143479808247635) q[13];
-cx q[5],q[13];
-rz(5.5143479808247635) q[14];
-cx q[4],q[14];
-rx(11.461896666608423) q[14];
-rz(5.5143479808247635) q[37];
-cx q[10],q[37];
-cx q[10],q[41];
-rz(5.5143479808247635) q[41];
-cx q[10],q[41];
-rx(1.924112387435804) q[52];
-ry(pi/2) q[53];
-rx(pi) q[53];
-cx q[17],q[53];
-rz(4.77409652217838) q[53];
-cx q[17],q[53];
-rx(1.924112387435804) q[17];
-cx q[1],q[17];
-rz(5.5143479808247635) q[17];
-cx q[1],q[17];
-cx q[3],q[17];
-rz(5.5143479808247635) q[17];
-cx q[3],q[17];
-cx q[3],q[18];
-rz(5.5143479808247635) q[18];
-cx q[3],q[18];
-cx q[3],q[19];
-cx q[4],q[18];
-rz(5.5143479808247635) q[18];
-cx q[4],q[18];
-rz(5.5143479808247635) q[19];
-cx q[3],q[19];
-cx q[3],q[22];
-cx q[7],q[19];
-rz(5.5143479808247635) q[19];
-cx q[7],q[19];
-rx(11.461896666608423) q[7];
-cx q[19],q[38];
-cx q[21],q[53];
-rz(5.5143479808247635) q[22];
-cx q[3],q[22];
-cx q[3],q[23];
-cx q[9],q[22];
-rz(5.5143479808247635) q[22];
-cx q[9],q[22];
-rx(11.461896666608423) q[9];
-rx(11.461896666608423) q[22];
-rz(5.5143479808247635) q[23];
-cx q[3],q[23];
-cx q[17],q[23];
-rz(5.5143479808247635) q[23];
-cx q[17],q[23];
-rz(5.5143479808247635) q[38];
-cx q[19],q[38];
-rx(11.461896666608423) q[19];
-rz(4.77409652217838) q[53];
-cx q[21],q[53];
-rx(1.924112387435804) q[21];
-cx q[4],q[21];
-rz(5.5143479808247635) q[21];
-cx q[4],q[21];
-cx q[4],q[27];
-cx q[15],q[21];
-rz(5.5143479808247635) q[21];
-cx q[15],q[21];
-cx q[15],q[36];
-rz(5.5143479808247635) q[27];
-cx q[4],q[27];
-cx q[4],q[47];
-cx q[6],q[27];
-rz(5.5143479808247635) q[27];
-cx q[6],q[27];
-rx(11.461896666608423) q[6];
-cx q[27],q[41];
-rz(5.5143479808247635) q[36];
-cx q[15],q[36];
-rx(11.461896666608423) q[15];
-cx q[20],q[36];
-rz(5.5143479808247635) q[36];
-cx q[20],q[36];
-rx(11.461896666608423) q[36];
-rz(5.5143479808247635) q[41];
-cx q[27],q[41];
-rx(11.461896666608423) q[27];
-rx(11.461896666608423) q[41];
-rz(5.5143479808247635) q[47];
-cx q[4],q[47];
-cx q[17],q[47];
-rz(5.5143479808247635) q[47];
-cx q[17],q[47];
-rx(11.461896666608423) q[47];
-rx(1.924112387435804) q[53];
-cx q[17],q[53];
-rz(5.5143479808247635) q[53];
-cx q[17],q[53];
-rx(11.461896666608423) q[17];
-ry(pi/2) q[54];
-rx(pi) q[54];
-cx q[24],q[54];
-rz(4.77409652217838) q[54];
-cx q[24],q[54];
-rx(1.924112387435804) q[24];
-cx q[3],q[24];
-rz(5.5143479808247635) q[24];
-cx q[3],q[24];
-cx q[3],q[25];
-cx q[5],q[24];
-rz(5.5143479808247635) q[24];
-cx q[5],q[24];
-cx q[5],q[33];
-rz(5.5143479808247635) q[25];
-cx q[3],q[25];
-cx q[3],q[26];
-cx q[12],q[25];
-rz(5.5143479808247635) q[25];
-cx q[12],q[25];
-cx q[12],q[31];
-rx(11.461896666608423) q[25];
-rz(5.5143479808247635) q[26];
-cx q[3],q[26];
-cx q[21],q[26];
-rz(5.5143479808247635) q[26];
-cx q[21],q[26];
-cx q[21],q[32];
-cx q[28],q[54];
-rz(5.5143479808247635) q[31];
-cx q[12],q[31];
-cx q[26],q[31];
-rz(5.5143479808247635) q[31];
-cx q[26],q[31];
-rx(11.461896666608423) q[26];
-rx(11.461896666608423) q[31];
-rz(5.5143479808247635) q[32];
-cx q[21],q[32];
-cx q[21],q[38];
-rz(5.5143479808247635) q[33];
-cx q[5],q[33];
-cx q[5],q[46];
-rz(5.5143479808247635) q[38];
-cx q[21],q[38];
-cx q[21],q[53];
-rz(5.5143479808247635) q[46];
-cx q[5],q[46];
-rx(11.461896666608423) q[5];
-cx q[38],q[46];
-rz(5.5143479808247635) q[46];
-cx q[38],q[46];
-rx(11.461896666608423) q[38];
-rx(11.461896666608423) q[46];
-rz(5.5143479808247635) q[53];
-cx q[21],q[53];
-rx(11.461896666608423) q[21];
-rx(11.461896666608423) q[53];
-rz(4.77409652217838) q[54];
-cx q[28],q[54];
-rx(1.924112387435804) q[28];
-cx q[1],q[28];
-rz(5.5143479808247635) q[28];
-cx q[1],q[28];
-cx q[1],q[29];
-cx q[3],q[28];
-rz(5.5143479808247635) q[28];
-cx q[3],q[28];
-cx q[28],q[51];
-rz(5.5143479808247635) q[29];
-cx q[1],q[29];
-cx q[1],q[45];
-cx q[3],q[29];
-rz(5.5143479808247635) q[29];
-cx q[3],q[29];
-cx q[3],q[30];
-rx(11.461896666608423) q[29];
-rz(5.5143479808247635) q[30];
-cx q[3],q[30];
-cx q[3],q[34];
-cx q[18],q[30];
-rz(5.5143479808247635) q[30];
-cx q[18],q[30];
-rx(11.461896666608423) q[18];
-cx q[30],q[33];
-rz(5.5143479808247635) q[33];
-cx q[30],q[33];
-cx q[30],q[48];
-rx(11.461896666608423) q[33];
-rz(5.5143479808247635) q[34];
-cx q[3],q[34];
-cx q[3],q[35];
-cx q[12],q[34];
-rz(5.5143479808247635) q[34];
-cx q[12],q[34];
-cx q[34],q[37];
-rz(5.5143479808247635) q[35];
-cx q[3],q[35];
-cx q[3],q[39];
-cx q[32],q[35];
-rz(5.5143479808247635) q[35];
-cx q[32],q[35];
-rx(11.461896666608423) q[32];
-rx(11.461896666608423) q[35];
-rz(5.5143479808247635) q[37];
-cx q[34],q[37];
-rx(11.461896666608423) q[34];
-rx(11.461896666608423) q[37];
-rz(5.5143479808247635) q[39];
-cx q[3],q[39];
-cx q[3],q[40];
-cx q[13],q[39];
-rz(5.5143479808247635) q[39];
-cx q[13],q[39];
-rx(11.461896666608423) q[13];
-rx(11.461896666608423) q[39];
-rz(5.5143479808247635) q[40];
-cx q[3],q[40];
-cx q[3],q[42];
-cx q[23],q[40];
-rz(5.5143479808247635) q[40];
-cx q[23],q[40];
-rx(11.461896666608423) q[23];
-rx(11.461896666608423) q[40];
-rz(5.5143479808247635) q[42];
-cx q[3],q[42];
-cx q[3],q[43];
-rx(11.461896666608423) q[42];
-rz(5.5143479808247635) q[43];
-cx q[3],q[43];
-cx q[3],q[44];
-cx q[20],q[43];
-rz(5.5143479808247635) q[43];
-cx q[20],q[43];
-rx(11.461896666608423) q[20];
-rx(11.461896666608423) q[43];
-rz(5.5143479808247635) q[44];
-cx q[3],q[44];
-cx q[3],q[49];
-cx q[12],q[44];
-rz(5.5143479808247635) q[44];
-cx q[12],q[44];
-rx(11.461896666608423) q[44];
-rz(5.5143479808247635) q[45];
-cx q[1],q[45];
-rx(11.461896666608423) q[1];
-cx q[0],q[1];
-rz(5.7584802164535605) q[1];
-cx q[0],q[1];
-cx q[0],q[2];
-rz(5.7584802164535605) q[2];
-cx q[0],q[2];
-rx(2.018137560136407) q[2];
-cx q[16],q[45];
-rz(5.5143479808247635) q[45];
-cx q[16],q[45];
-rx(11.461896666608423) q[16];
-rx(11.461896666608423) q[45];
-rz(5.5143479808247635) q[48];
-cx q[30],q[48];
-rx(11.461896666608423) q[30];
-rx(11.461896666608423) q[48];
-rz(5.5143479808247635) q[49];
-cx q[3],q[49];
-cx q[3],q[50];
-cx q[4],q[49];
-rz(5.5143479808247635) q[49];
-cx q[4],q[49];
-rx(11.461896666608423) q[4];
-rx(11.461896666608423) q[49];
-rz(5.5143479808247635) q[50];
-cx q[3],q[50];
-cx q[3],q[52];
-cx q[12],q[50];
-rz(5.5143479808247635) q[50];
-cx q[12],q[50];
-rx(11.461896666608423) q[12];
-rx(11.461896666608423) q[50];
-rz(5.5143479808247635) q[51];
-cx q[28],q[51];
-rx(11.461896666608423) q[51];
-rz(5.5143479808247635) q[52];
-cx q[3],q[52];
-rx(11.461896666608423) q[3];
-cx q[0],q[3];
-rz(5.7584802164535605) q[3];
-cx q[0],q[3];
-cx q[0],q[15];
-cx q[1],q[3];
-rz(5.7584802164535605) q[3];
-cx q[1],q[3];
-cx q[1],q[4];
-rz(5.7584802164535605) q[4];
-cx q[1],q[4];
-cx q[1],q[5];
-cx q[3],q[4];
-rz(5.7584802164535605) q[4];
-cx q[3],q[4];
-cx q[4],q[6];
-rz(5.7584802164535605) q[5];
-cx q[1],q[5];
-cx q[1],q[9];
-cx q[3],q[5];
-rz(5.7584802164535605) q[5];
-cx q[3],q[5];
-cx q[3],q[7];
-rz(5.7584802164535605) q[6];
-cx q[4],q[6];
-cx q[5],q[6];
-rz(5.7584802164535605) q[6];
-cx q[5],q[6];
-rz(5.7584802164535605) q[7];
-cx q[3],q[7];
-cx q[3],q[8];
-cx q[4],q[7];
-rz(5.7584802164535605) q[7];
-cx q[4],q[7];
-rz(5.7584802164535605) q[8];
-cx q[3],q[8];
-cx q[5],q[8];
-rz(5.7584802164535605) q[8];
-cx q[5],q[8];
-cx q[5],q[11];
-rx(2.018137560136407) q[8];
-rz(5.7584802164535605) q[9];
-cx q[1],q[9];
-cx q[1],q[17];
-cx q[3],q[9];
-rz(5.7584802164535605) q[9];
-cx q[3],q[9];
-cx q[3],q[12];
-cx q[10],q[52];
-rz(5.7584802164535605) q[11];
-cx q[5],q[11];
-rz(5.7584802164535605) q[12];
-cx q[3],q[12];
-cx q[3],q[14];
-cx q[5],q[12];
-rz(5.7584802164535605) q[12];
-cx q[5],q[12];
-rz(5.7584802164535605) q[14];
-cx q[3],q[14];
-rz(5.7584802164535605) q[15];
-cx q[0],q[15];
-cx q[0],q[16];
-cx q[3],q[15];
-rz(5.7584802164535605) q[15];
-cx q[3],q[15];
-rz(5.7584802164535605) q[16];
-cx q[0],q[16];
-cx q[0],q[20];
-cx q[3],q[16];
-rz(5.7584802164535605) q[16];
-cx q[3],q[16];
-rz(5.7584802164535605) q[17];
-cx q[1],q[17];
-cx q[3],q[17];
-rz(5.7584802164535605) q[17];
-cx q[3],q[17];
-cx q[3],q[18];
-rz(5.7584802164535605) q[18];
-cx q[3],q[18];
-cx q[3],q[19];
-rz(5.7584802164535605) q[19];
-cx q[3],q[19];
-cx q[3],q[22];
-cx q[7],q[19];
-rz(5.7584802164535605) q[19];
-cx q[7],q[19];
-rx(2.018137560136407) q[7];
-cx q[19],q[38];
-rz(5.7584802164535605) q[20];
-cx q[0],q[20];
-cx q[0],q[32];
-cx q[15],q[20];
-rz(5.7584802164535605) q[20];
-cx q[15],q[20];
-rz(5.7584802164535605) q[22];
-cx q[3],q[22];
-cx q[3],q[23];
-cx q[9],q[22];
-rz(5.7584802164535605) q[22];
-cx q[9],q[22];
-rx(2.018137560136407) q[9];
-rx(2.018137560136407) q[22];
-rz(5.7584802164535605) q[23];
-cx q[3],q[23];
-cx q[17],q[23];
-rz(5.7584802164535605) q[23];
-cx q[17],q[23];
-rz(5.7584802164535605) q[32];
-cx q[0],q[32];
-cx q[0],q[42];
-rz(5.7584802164535605) q[38];
-cx q[19],q[38];
-rx(2.018137560136407) q[19];
-rz(5.7584802164535605) q[42];
-cx q[0],q[42];
-cx q[0],q[48];
-rz(5.7584802164535605) q[48];
-cx q[0],q[48];
-cx q[0],q[51];
-rz(5.7584802164535605) q[51];
-cx q[0],q[51];
-rx(2.018137560136407) q[0];
-rz(5.5143479808247635) q[52];
-cx q[10],q[52];
-rx(11.461896666608423) q[10];
-cx q[4],q[10];
-rz(5.7584802164535605) q[10];
-cx q[4],q[10];
-cx q[4],q[13];
-cx q[6],q[10];
-rz(5.7584802164535605) q[10];
-cx q[6],q[10];
-cx q[6],q[11];
-cx q[10],q[37];
-rz(5.7584802164535605) q[11];
-cx q[6],q[11];
-rx(2.018137560136407) q[11];
-rz(5.7584802164535605) q[13];
-cx q[4],q[13];
-cx q[4],q[14];
-cx q[5],q[13];
-rz(5.7584802164535605) q[13];
-cx q[5],q[13];
-rz(5.7584802164535605) q[14];
-cx q[4],q[14];
-cx q[4],q[18];
-rx(2.018137560136407) q[14];
-rz(5.7584802164535605) q[18];
-cx q[4],q[18];
-cx q[4],q[21];
-rz(5.7584802164535605) q[21];
-cx q[4],q[21];
-cx q[4],q[27];
-cx q[15],q[21];
-rz(5.7584802164535605) q[21];
-cx q[15],q[21];
-cx q[15],q[36];
-rz(5.7584802164535605) q[27];
-cx q[4],q[27];
-cx q[4],q[47];
-cx q[6],q[27];
-rz(5.7584802164535605) q[27];
-cx q[6],q[27];
-rx(2.018137560136407) q[6];
-rz(5.7584802164535605) q[36];
-cx q[15],q[36];
-rx(2.018137560136407) q[15];
-cx q[20],q[36];
-rz(5.7584802164535605) q[36];
-cx q[20],q[36];
-rx(2.018137560136407) q[36];
-rz(5.7584802164535605) q[37];
-cx q[10],q[37];
-cx q[10],q[41];
-rz(5.7584802164535605) q[41];
-cx q[10],q[41];
-cx q[27],q[41];
-rz(5.7584802164535605) q[41];
-cx q[27],q[41];
-rx(2.018137560136407) q[27];
-rx(2.018137560136407) q[41];
-rz(5.7584802164535605) q[47];
-cx q[4],q[47];
-cx q[17],q[47];
-rz(5.7584802164535605) q[47];
-cx q[17],q[47];
-cx q[17],q[53];
-rx(2.018137560136407) q[47];
-rx(11.461896666608423) q[52];
-rz(5.7584802164535605) q[53];
-cx q[17],q[53];
-rx(2.018137560136407) q[17];
-rx(1.924112387435804) q[54];
-cx q[24],q[54];
-rz(5.5143479808247635) q[54];
-cx q[24],q[54];
-rx(11.461896666608423) q[24];
-cx q[3],q[24];
-rz(5.7584802164535605) q[24];
-cx q[3],q[24];
-cx q[3],q[25];
-cx q[5],q[24];
-rz(5.7584802164535605) q[24];
-cx q[5],q[24];
-cx q[5],q[33];
-rz(5.7584802164535605) q[25];
-cx q[3],q[25];
-cx q[3],q[26];
-cx q[12],q[25];
-rz(5.7584802164535605) q[25];
-cx q[12],q[25];
-cx q[12],q[31];
-rx(2.018137560136407) q[25];
-rz(5.7584802164535605) q[26];
-cx q[3],q[26];
-cx q[21],q[26];
-rz(5.7584802164535605) q[26];
-cx q[21],q[26];
-cx q[21],q[32];
-cx q[28],q[54];
-rz(5.7584802164535605) q[31];
-cx q[12],q[31];
-cx q[26],q[31];
-rz(5.7584802164535605) q[31];
-cx q[26],q[31];
-rx(2.018137560136407) q[26];
-rx(2.018137560136407) q[31];
-rz(5.7584802164535605) q[32];
-cx q[21],q[32];
-cx q[21],q[38];
-rz(5.7584802164535605) q[33];
-cx q[5],q[33];
-cx q[5],q[46];
-rz(5.7584802164535605) q[38];
-cx q[21],q[38];
-cx q[21],q[53];
-rz(5.7584802164535605) q[46];
-cx q[5],q[46];
-rx(2.018137560136407) q[5];
-cx q[38],q[46];
-rz(5.7584802164535605) q[46];
-cx q[38],q[46];
-rx(2.018137560136407) q[38];
-rx(2.018137560136407) q[46];
-rz(5.7584802164535605) q[53];
-cx q[21],q[53];
-rx(2.018137560136407) q[21];
-rx(2.018137560136407) q[53];
-rz(5.5143479808247635) q[54];
-cx q[28],q[54];
-rx(11.461896666608423) q[28];
-cx q[1],q[28];
-rz(5.7584802164535605) q[28];
-cx q[1],q[28];
-cx q[1],q[29];
-cx q[3],q[28];
-rz(5.7584802164535605) q[28];
-cx q[3],q[28];
-cx q[28],q[51];
-rz(5.7584802164535605) q[29];
-cx q[1],q[29];
-cx q[1],q[45];
-cx q[3],q[29];
-rz(5.7584802164535605) q[29];
-cx q[3],q[29];
-cx q[3],q[30];
-rx(2.018137560136407) q[29];
-rz(5.7584802164535605) q[30];
-cx q[3],q[30];
-cx q[3],q[34];
-cx q[18],q[30];
-rz(5.7584802164535605) q[30];
-cx q[18],q[30];
-rx(2.018137560136407) q[18];
-cx q[30],q[33];
-rz(5.7584802164535605) q[33];
-cx q[30],q[33];
-cx q[30],q[48];
-rx(2.018137560136407) q[33];
-rz(5.7584802164535605) q[34];
-cx q[3],q[34];
-cx q[3],q[35];
-cx q[12],q[34];
-rz(5.7584802164535605) q[34];
-cx q[12],q[34];
-cx q[34],q[37];
-rz(5.7584802164535605) q[35];
-cx q[3],q[35];
-cx q[3],q[39];
-cx q[32],q[35];
-rz(5.7584802164535605) q[35];
-cx q[32],q[35];
-rx(2.018137560136407) q[32];
-rx(2.018137560136407) q[35];
-rz(5.7584802164535605) q[37];
-cx q[34],q[37];
-rx(2.018137560136407) q[34];
-rx(2.018137560136407) q[37];
-rz(5.7584802164535605) q[39];
-cx q[3],q[39];
-cx q[3],q[40];
-cx q[13],q[39];
-rz(5.7584802164535605) q[39];
-cx q[13],q[39];
-rx(2.018137560136407) q[13];
-rx(2.018137560136407) q[39];
-rz(5.7584802164535605) q[40];
-cx q[3],q[40];
-cx q[3],q[42];
-cx q[23],q[40];
-rz(5.7584802164535605) q[40];
-cx q[23],q[40];
-rx(2.018137560136407) q[23];
-rx(2.018137560136407) q[40];
-rz(5.7584802164535605) q[42];
-cx q[3],q[42];
-cx q[3],q[43];
-rx(2.018137560136407) q[42];
-rz(5.7584802164535605) q[43];
-cx q[3],q[43];
-cx q[3],q[44];
-cx q[20],q[43];
-rz(5.7584802164535605) q[43];
-cx q[20],q[43];
-rx(2.018137560136407) q[20];
-rx(2.018137560136407) q[43];
-rz(5.7584802164535605) q[44];
-cx q[3],q[44];
-cx q[3],q[49];
-cx q[12],q[44];
-rz(5.7584802164535605) q[44];
-cx q[12],q[44];
-rx(2.018137560136407) q[44];
-rz(5.7584802164535605) q[45];
-cx q[1],q[45];
-rx(2.018137560136407) q[1];
-cx q[16],q[45];
-rz(5.7584802164535605) q[45];
-cx q[16],q[45];
-rx(2.018137560136407) q[16];
-rx(2.018137560136407) q[45];
-rz(5.7584802164535605) q[48];
-cx q[30],q[48];
-rx(2.018137560136407) q[30];
-rx(2.018137560136407) q[48];
-rz(5.7584802164535605) q[49];
-cx q[3],q[49];
-cx q[3],q[50];
-cx q[4],q[49];
-rz(5.7584802164535605) q[49];
-cx q[4],q[49];
-rx(2.018137560136407) q[4];
-rx(2.018137560136407) q[49];
-rz(5.7584802164535605) q[50];
-cx q[3],q[50];
-cx q[3],q[52];
-cx q[12],q[50];
-rz(5.7584802164535605) q[50];
-cx q[12],q[50];
-rx(2.018137560136407) q[12];
-rx(2.018137560136407) q[50];
-rz(5.7584802164535605) q[51];
-cx q[28],q[51];
-rx(2.018137560136407) q[51];
-rz(5.7584802164535605) q[52];
-cx q[3],q[52];
-rx(2.018137560136407) q[3];
-cx q[10],q[52];
-rz(5.7584802164535605) q[52];
-cx q[10],q[52];
-rx(2.018137560136407) q[10];
-rx(2.018137560136407) q[52];
-rx(11.461896666608423) q[54];
-cx q[24],q[54];
-rz(5.7584802164535605) q[54];
-cx q[24],q[54];
-rx(2.018137560136407) q[24];
-cx q[28],q[54];
-rz(5.7584802164535605) q[54];
-cx q[28],q[54];
-rx(2.018137560136407) q[28];
-rx(2.018137560136407) q[54];
\ No newline at end of file
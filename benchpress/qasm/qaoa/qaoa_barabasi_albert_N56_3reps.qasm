@@ -1,1255 +0,0 @@
-OPENQASM 2.0;
-include "qelib1.inc";
-qreg q[56];
-ry(pi/2) q[0];
-rx(pi) q[0];
-ry(pi/2) q[1];
-rx(pi) q[1];
-cx q[0],q[1];
-rz(1.5875748564044727) q[1];
-cx q[0],q[1];
-ry(pi/2) q[2];
-rx(pi) q[2];
-cx q[0],q[2];
-rz(1.5875748564044727) q[2];
-cx q[0],q[2];
-rx(12.178139388832212) q[2];
-ry(pi/2) q[3];
-rx(pi) q[3];
-cx q[0],q[3];
-rz(1.5875748564044727) q[3];
-cx q[0],q[3];
-cx q[1],q[3];
-rz(1.5875748564044727) q[3];
-cx q[1],q[3];
-ry(pi/2) q[4];
-rx(pi) q[4];
-cx q[1],q[4];
-rz(1.5875748564044727) q[4];
-cx q[1],q[4];
-cx q[3],q[4];
-rz(1.5875748564044727) q[4];
-cx q[3],q[4];
-ry(pi/2) q[5];
-rx(pi) q[5];
-cx q[1],q[5];
-rz(1.5875748564044727) q[5];
-cx q[1],q[5];
-cx q[3],q[5];
-rz(1.5875748564044727) q[5];
-cx q[3],q[5];
-ry(pi/2) q[6];
-rx(pi) q[6];
-cx q[4],q[6];
-rz(1.5875748564044727) q[6];
-cx q[4],q[6];
-cx q[5],q[6];
-rz(1.5875748564044727) q[6];
-cx q[5],q[6];
-ry(pi/2) q[7];
-rx(pi) q[7];
-cx q[3],q[7];
-rz(1.5875748564044727) q[7];
-cx q[3],q[7];
-cx q[4],q[7];
-rz(1.5875748564044727) q[7];
-cx q[4],q[7];
-ry(pi/2) q[8];
-rx(pi) q[8];
-cx q[3],q[8];
-rz(1.5875748564044727) q[8];
-cx q[3],q[8];
-cx q[5],q[8];
-rz(1.5875748564044727) q[8];
-cx q[5],q[8];
-rx(12.178139388832212) q[8];
-ry(pi/2) q[9];
-rx(pi) q[9];
-cx q[1],q[9];
-rz(1.5875748564044727) q[9];
-cx q[1],q[9];
-cx q[3],q[9];
-rz(1.5875748564044727) q[9];
-cx q[3],q[9];
-ry(pi/2) q[10];
-rx(pi) q[10];
-cx q[4],q[10];
-rz(1.5875748564044727) q[10];
-cx q[4],q[10];
-cx q[6],q[10];
-rz(1.5875748564044727) q[10];
-cx q[6],q[10];
-ry(pi/2) q[11];
-rx(pi) q[11];
-cx q[5],q[11];
-rz(1.5875748564044727) q[11];
-cx q[5],q[11];
-cx q[6],q[11];
-rz(1.5875748564044727) q[11];
-cx q[6],q[11];
-rx(12.178139388832212) q[11];
-ry(pi/2) q[12];
-rx(pi) q[12];
-cx q[3],q[12];
-rz(1.5875748564044727) q[12];
-cx q[3],q[12];
-cx q[5],q[12];
-rz(1.5875748564044727) q[12];
-cx q[5],q[12];
-ry(pi/2) q[13];
-rx(pi) q[13];
-cx q[4],q[13];
-rz(1.5875748564044727) q[13];
-cx q[4],q[13];
-cx q[5],q[13];
-rz(1.5875748564044727) q[13];
-cx q[5],q[13];
-ry(pi/2) q[14];
-rx(pi) q[14];
-cx q[3],q[14];
-rz(1.5875748564044727) q[14];
-cx q[3],q[14];
-cx q[4],q[14];
-rz(1.5875748564044727) q[14];
-cx q[4],q[14];
-rx(12.178139388832212) q[14];
-ry(pi/2) q[15];
-rx(pi) q[15];
-cx q[0],q[15];
-rz(1.5875748564044727) q[15];
-cx q[0],q[15];
-cx q[3],q[15];
-rz(1.5875748564044727) q[15];
-cx q[3],q[15];
-ry(pi/2) q[16];
-rx(pi) q[16];
-cx q[0],q[16];
-rz(1.5875748564044727) q[16];
-cx q[0],q[16];
-cx q[3],q[16];
-rz(1.5875748564044727) q[16];
-cx q[3],q[16];
-ry(pi/2) q[17];
-rx(pi) q[17];
-cx q[1],q[17];
-rz(1.5875748564044727) q[17];
-cx q[1],q[17];
-cx q[3],q[17];
-rz(1.5875748564044727) q[17];
-cx q[3],q[17];
-ry(pi/2) q[18];
-rx(pi) q[18];
-cx q[3],q[18];
-rz(1.5875748564044727) q[18];
-cx q[3],q[18];
-cx q[4],q[18];
-rz(1.5875748564044727) q[18];
-cx q[4],q[18];
-ry(pi/2) q[19];
-rx(pi) q[19];
-cx q[3],q[19];
-rz(1.5875748564044727) q[19];
-cx q[3],q[19];
-cx q[7],q[19];
-rz(1.5875748564044727) q[19];
-cx q[7],q[19];
-rx(12.178139388832212) q[7];
-ry(pi/2) q[20];
-rx(pi) q[20];
-cx q[0],q[20];
-rz(1.5875748564044727) q[20];
-cx q[0],q[20];
-cx q[15],q[20];
-rz(1.5875748564044727) q[20];
-cx q[15],q[20];
-ry(pi/2) q[21];
-rx(pi) q[21];
-cx q[4],q[21];
-rz(1.5875748564044727) q[21];
-cx q[4],q[21];
-cx q[15],q[21];
-rz(1.5875748564044727) q[21];
-cx q[15],q[21];
-ry(pi/2) q[22];
-rx(pi) q[22];
-cx q[3],q[22];
-rz(1.5875748564044727) q[22];
-cx q[3],q[22];
-cx q[9],q[22];
-rz(1.5875748564044727) q[22];
-cx q[9],q[22];
-rx(12.178139388832212) q[22];
-ry(pi/2) q[23];
-rx(pi) q[23];
-cx q[3],q[23];
-rz(1.5875748564044727) q[23];
-cx q[3],q[23];
-cx q[17],q[23];
-rz(1.5875748564044727) q[23];
-cx q[17],q[23];
-ry(pi/2) q[24];
-rx(pi) q[24];
-cx q[3],q[24];
-rz(1.5875748564044727) q[24];
-cx q[3],q[24];
-cx q[5],q[24];
-rz(1.5875748564044727) q[24];
-cx q[5],q[24];
-ry(pi/2) q[25];
-rx(pi) q[25];
-cx q[3],q[25];
-rz(1.5875748564044727) q[25];
-cx q[3],q[25];
-cx q[12],q[25];
-rz(1.5875748564044727) q[25];
-cx q[12],q[25];
-rx(12.178139388832212) q[25];
-ry(pi/2) q[26];
-rx(pi) q[26];
-cx q[3],q[26];
-rz(1.5875748564044727) q[26];
-cx q[3],q[26];
-cx q[21],q[26];
-rz(1.5875748564044727) q[26];
-cx q[21],q[26];
-ry(pi/2) q[27];
-rx(pi) q[27];
-cx q[4],q[27];
-rz(1.5875748564044727) q[27];
-cx q[4],q[27];
-cx q[6],q[27];
-rz(1.5875748564044727) q[27];
-cx q[6],q[27];
-rx(12.178139388832212) q[6];
-ry(pi/2) q[28];
-rx(pi) q[28];
-cx q[1],q[28];
-rz(1.5875748564044727) q[28];
-cx q[1],q[28];
-cx q[3],q[28];
-rz(1.5875748564044727) q[28];
-cx q[3],q[28];
-ry(pi/2) q[29];
-rx(pi) q[29];
-cx q[1],q[29];
-rz(1.5875748564044727) q[29];
-cx q[1],q[29];
-cx q[3],q[29];
-rz(1.5875748564044727) q[29];
-cx q[3],q[29];
-rx(12.178139388832212) q[29];
-ry(pi/2) q[30];
-rx(pi) q[30];
-cx q[3],q[30];
-rz(1.5875748564044727) q[30];
-cx q[3],q[30];
-cx q[18],q[30];
-rz(1.5875748564044727) q[30];
-cx q[18],q[30];
-rx(12.178139388832212) q[18];
-ry(pi/2) q[31];
-rx(pi) q[31];
-cx q[12],q[31];
-rz(1.5875748564044727) q[31];
-cx q[12],q[31];
-cx q[26],q[31];
-rz(1.5875748564044727) q[31];
-cx q[26],q[31];
-rx(12.178139388832212) q[26];
-rx(12.178139388832212) q[31];
-ry(pi/2) q[32];
-rx(pi) q[32];
-cx q[0],q[32];
-rz(1.5875748564044727) q[32];
-cx q[0],q[32];
-cx q[21],q[32];
-rz(1.5875748564044727) q[32];
-cx q[21],q[32];
-ry(pi/2) q[33];
-rx(pi) q[33];
-cx q[5],q[33];
-rz(1.5875748564044727) q[33];
-cx q[5],q[33];
-cx q[30],q[33];
-rz(1.5875748564044727) q[33];
-cx q[30],q[33];
-rx(12.178139388832212) q[33];
-ry(pi/2) q[34];
-rx(pi) q[34];
-cx q[3],q[34];
-rz(1.5875748564044727) q[34];
-cx q[3],q[34];
-cx q[12],q[34];
-rz(1.5875748564044727) q[34];
-cx q[12],q[34];
-ry(pi/2) q[35];
-rx(pi) q[35];
-cx q[3],q[35];
-rz(1.5875748564044727) q[35];
-cx q[3],q[35];
-cx q[32],q[35];
-rz(1.5875748564044727) q[35];
-cx q[32],q[35];
-rx(12.178139388832212) q[32];
-rx(12.178139388832212) q[35];
-ry(pi/2) q[36];
-rx(pi) q[36];
-cx q[15],q[36];
-rz(1.5875748564044727) q[36];
-cx q[15],q[36];
-cx q[20],q[36];
-rz(1.5875748564044727) q[36];
-cx q[20],q[36];
-rx(12.178139388832212) q[36];
-ry(pi/2) q[37];
-rx(pi) q[37];
-cx q[10],q[37];
-rz(1.5875748564044727) q[37];
-cx q[10],q[37];
-cx q[34],q[37];
-rz(1.5875748564044727) q[37];
-cx q[34],q[37];
-rx(12.178139388832212) q[34];
-rx(12.178139388832212) q[37];
-ry(pi/2) q[38];
-rx(pi) q[38];
-cx q[19],q[38];
-rz(1.5875748564044727) q[38];
-cx q[19],q[38];
-rx(12.178139388832212) q[19];
-cx q[21],q[38];
-rz(1.5875748564044727) q[38];
-cx q[21],q[38];
-ry(pi/2) q[39];
-rx(pi) q[39];
-cx q[3],q[39];
-rz(1.5875748564044727) q[39];
-cx q[3],q[39];
-cx q[13],q[39];
-rz(1.5875748564044727) q[39];
-cx q[13],q[39];
-rx(12.178139388832212) q[13];
-rx(12.178139388832212) q[39];
-ry(pi/2) q[40];
-rx(pi) q[40];
-cx q[3],q[40];
-rz(1.5875748564044727) q[40];
-cx q[3],q[40];
-cx q[23],q[40];
-rz(1.5875748564044727) q[40];
-cx q[23],q[40];
-rx(12.178139388832212) q[23];
-rx(12.178139388832212) q[40];
-ry(pi/2) q[41];
-rx(pi) q[41];
-cx q[10],q[41];
-rz(1.5875748564044727) q[41];
-cx q[10],q[41];
-cx q[27],q[41];
-rz(1.5875748564044727) q[41];
-cx q[27],q[41];
-rx(12.178139388832212) q[27];
-rx(12.178139388832212) q[41];
-ry(pi/2) q[42];
-rx(pi) q[42];
-cx q[0],q[42];
-rz(1.5875748564044727) q[42];
-cx q[0],q[42];
-cx q[3],q[42];
-rz(1.5875748564044727) q[42];
-cx q[3],q[42];
-rx(12.178139388832212) q[42];
-ry(pi/2) q[43];
-rx(pi) q[43];
-cx q[3],q[43];
-rz(1.5875748564044727) q[43];
-cx q[3],q[43];
-cx q[20],q[43];
-rz(1.5875748564044727) q[43];
-cx q[20],q[43];
-rx(12.178139388832212) q[20];
-rx(12.178139388832212) q[43];
-ry(pi/2) q[44];
-rx(pi) q[44];
-cx q[3],q[44];
-rz(1.5875748564044727) q[44];
-cx q[3],q[44];
-cx q[12],q[44];
-rz(1.5875748564044727) q[44];
-cx q[12],q[44];
-rx(12.178139388832212) q[44];
-ry(pi/2) q[45];
-rx(pi) q[45];
-cx q[1],q[45];
-rz(1.5875748564044727) q[45];
-cx q[1],q[45];
-rx(12.178139388832212) q[1];
-cx q[16],q[45];
-rz(1.5875748564044727) q[45];
-cx q[16],q[45];
-rx(12.178139388832212) q[16];
-rx(12.178139388832212) q[45];
-ry(pi/2) q[46];
-rx(pi) q[46];
-cx q[5],q[46];
-rz(1.5875748564044727) q[46];
-cx q[5],q[46];
-rx(12.178139388832212) q[5];
-cx q[38],q[46];
-rz(1.5875748564044727) q[46];
-cx q[38],q[46];
-rx(12.178139388832212) q[38];
-rx(12.178139388832212) q[46];
-ry(pi/2) q[47];
-rx(pi) q[47];
-cx q[4],q[47];
-rz(1.5875748564044727) q[47];
-cx q[4],q[47];
-cx q[17],q[47];
-rz(1.5875748564044727) q[47];
-cx q[17],q[47];
-rx(12.178139388832212) q[47];
-ry(pi/2) q[48];
-rx(pi) q[48];
-cx q[0],q[48];
-rz(1.5875748564044727) q[48];
-cx q[0],q[48];
-cx q[30],q[48];
-rz(1.5875748564044727) q[48];
-cx q[30],q[48];
-rx(12.178139388832212) q[30];
-rx(12.178139388832212) q[48];
-ry(pi/2) q[49];
-rx(pi) q[49];
-cx q[3],q[49];
-rz(1.5875748564044727) q[49];
-cx q[3],q[49];
-cx q[4],q[49];
-rz(1.5875748564044727) q[49];
-cx q[4],q[49];
-rx(12.178139388832212) q[4];
-rx(12.178139388832212) q[49];
-ry(pi/2) q[50];
-rx(pi) q[50];
-cx q[3],q[50];
-rz(1.5875748564044727) q[50];
-cx q[3],q[50];
-cx q[12],q[50];
-rz(1.5875748564044727) q[50];
-cx q[12],q[50];
-rx(12.178139388832212) q[12];
-rx(12.178139388832212) q[50];
-ry(pi/2) q[51];
-rx(pi) q[51];
-cx q[0],q[51];
-rz(1.5875748564044727) q[51];
-cx q[0],q[51];
-rx(12.178139388832212) q[0];
-cx q[0],q[1];
-rz(4.45863335626889) q[1];
-cx q[0],q[1];
-cx q[0],q[2];
-rz(4.45863335626889) q[2];
-cx q[0],q[2];
-rx(10.662276110314489) q[2];
-cx q[28],q[51];
-rz(1.5875748564044727) q[51];
-cx q[28],q[51];
-rx(12.178139388832212) q[51];
-ry(pi/2) q[52];
-rx(pi) q[52];
-cx q[3],q[52];
-rz(1.5875748564044727) q[52];
-cx q[3],q[52];
-rx(12.178139388832212) q[3];
-cx q[0],q[3];
-rz(4.45863335626889) q[3];
-cx q[0],q[3];
-cx q[1],q[3];
-rz(4.45863335626889) q[3];
-cx q[1],q[3];
-cx q[1],q[4];
-rz(4.45863335626889) q[4];
-cx q[1],q[4];
-cx q[1],q[5];
-cx q[3],q[4];
-rz(4.45863335626889) q[4];
-cx q[3],q[4];
-cx q[4],q[6];
-rz(4.45863335626889) q[5];
-cx q[1],q[5];
-cx q[3],q[5];
-rz(4.45863335626889) q[5];
-cx q[3],q[5];
-cx q[3],q[7];
-rz(4.45863335626889) q[6];
-cx q[4],q[6];
-cx q[5],q[6];
-rz(4.45863335626889) q[6];
-cx q[5],q[6];
-rz(4.45863335626889) q[7];
-cx q[3],q[7];
-cx q[3],q[8];
-cx q[4],q[7];
-rz(4.45863335626889) q[7];
-cx q[4],q[7];
-rz(4.45863335626889) q[8];
-cx q[3],q[8];
-cx q[5],q[8];
-rz(4.45863335626889) q[8];
-cx q[5],q[8];
-cx q[5],q[11];
-rx(10.662276110314489) q[8];
-cx q[10],q[52];
-rz(4.45863335626889) q[11];
-cx q[5],q[11];
-rz(1.5875748564044727) q[52];
-cx q[10],q[52];
-rx(12.178139388832212) q[10];
-cx q[4],q[10];
-rz(4.45863335626889) q[10];
-cx q[4],q[10];
-cx q[4],q[13];
-cx q[6],q[10];
-rz(4.45863335626889) q[10];
-cx q[6],q[10];
-cx q[6],q[11];
-cx q[10],q[37];
-rz(4.45863335626889) q[11];
-cx q[6],q[11];
-rx(10.662276110314489) q[11];
-rz(4.45863335626889) q[13];
-cx q[4],q[13];
-rz(4.45863335626889) q[37];
-cx q[10],q[37];
-cx q[10],q[41];
-rz(4.45863335626889) q[41];
-cx q[10],q[41];
-rx(12.178139388832212) q[52];
-ry(pi/2) q[53];
-rx(pi) q[53];
-cx q[17],q[53];
-rz(1.5875748564044727) q[53];
-cx q[17],q[53];
-rx(12.178139388832212) q[17];
-cx q[21],q[53];
-rz(1.5875748564044727) q[53];
-cx q[21],q[53];
-rx(12.178139388832212) q[21];
-rx(12.178139388832212) q[53];
-ry(pi/2) q[54];
-rx(pi) q[54];
-cx q[24],q[54];
-rz(1.5875748564044727) q[54];
-cx q[24],q[54];
-rx(12.178139388832212) q[24];
-cx q[28],q[54];
-rz(1.5875748564044727) q[54];
-cx q[28],q[54];
-rx(12.178139388832212) q[28];
-rx(12.178139388832212) q[54];
-ry(pi/2) q[55];
-rx(pi) q[55];
-cx q[9],q[55];
-rz(1.5875748564044727) q[55];
-cx q[9],q[55];
-rx(12.178139388832212) q[9];
-cx q[1],q[9];
-rz(4.45863335626889) q[9];
-cx q[1],q[9];
-cx q[1],q[17];
-cx q[3],q[9];
-rz(4.45863335626889) q[9];
-cx q[3],q[9];
-cx q[3],q[12];
-rz(4.45863335626889) q[12];
-cx q[3],q[12];
-cx q[3],q[14];
-cx q[5],q[12];
-rz(4.45863335626889) q[12];
-cx q[5],q[12];
-cx q[5],q[13];
-rz(4.45863335626889) q[13];
-cx q[5],q[13];
-rz(4.45863335626889) q[14];
-cx q[3],q[14];
-cx q[4],q[14];
-rz(4.45863335626889) q[14];
-cx q[4],q[14];
-rx(10.662276110314489) q[14];
-cx q[15],q[55];
-rz(4.45863335626889) q[17];
-cx q[1],q[17];
-cx q[1],q[28];
-rz(4.45863335626889) q[28];
-cx q[1],q[28];
-cx q[1],q[29];
-rz(4.45863335626889) q[29];
-cx q[1],q[29];
-cx q[1],q[45];
-rz(4.45863335626889) q[45];
-cx q[1],q[45];
-rx(10.662276110314489) q[1];
-rz(1.5875748564044727) q[55];
-cx q[15],q[55];
-rx(12.178139388832212) q[15];
-cx q[0],q[15];
-rz(4.45863335626889) q[15];
-cx q[0],q[15];
-cx q[0],q[16];
-cx q[3],q[15];
-rz(4.45863335626889) q[15];
-cx q[3],q[15];
-rz(4.45863335626889) q[16];
-cx q[0],q[16];
-cx q[0],q[20];
-cx q[3],q[16];
-rz(4.45863335626889) q[16];
-cx q[3],q[16];
-cx q[3],q[17];
-cx q[16],q[45];
-rz(4.45863335626889) q[17];
-cx q[3],q[17];
-cx q[3],q[18];
-rz(4.45863335626889) q[18];
-cx q[3],q[18];
-cx q[3],q[19];
-cx q[4],q[18];
-rz(4.45863335626889) q[18];
-cx q[4],q[18];
-cx q[4],q[21];
-rz(4.45863335626889) q[19];
-cx q[3],q[19];
-cx q[3],q[22];
-cx q[7],q[19];
-rz(4.45863335626889) q[19];
-cx q[7],q[19];
-rx(10.662276110314489) q[7];
-cx q[19],q[38];
-rz(4.45863335626889) q[20];
-cx q[0],q[20];
-cx q[0],q[32];
-cx q[15],q[20];
-rz(4.45863335626889) q[20];
-cx q[15],q[20];
-rz(4.45863335626889) q[21];
-cx q[4],q[21];
-cx q[4],q[27];
-cx q[15],q[21];
-rz(4.45863335626889) q[21];
-cx q[15],q[21];
-cx q[15],q[36];
-rz(4.45863335626889) q[22];
-cx q[3],q[22];
-cx q[3],q[23];
-cx q[9],q[22];
-rz(4.45863335626889) q[22];
-cx q[9],q[22];
-rx(10.662276110314489) q[22];
-rz(4.45863335626889) q[23];
-cx q[3],q[23];
-cx q[3],q[24];
-cx q[17],q[23];
-rz(4.45863335626889) q[23];
-cx q[17],q[23];
-rz(4.45863335626889) q[24];
-cx q[3],q[24];
-cx q[3],q[25];
-cx q[5],q[24];
-rz(4.45863335626889) q[24];
-cx q[5],q[24];
-cx q[5],q[33];
-cx q[24],q[54];
-rz(4.45863335626889) q[25];
-cx q[3],q[25];
-cx q[3],q[26];
-cx q[12],q[25];
-rz(4.45863335626889) q[25];
-cx q[12],q[25];
-cx q[12],q[31];
-rx(10.662276110314489) q[25];
-rz(4.45863335626889) q[26];
-cx q[3],q[26];
-cx q[3],q[28];
-cx q[21],q[26];
-rz(4.45863335626889) q[26];
-cx q[21],q[26];
-rz(4.45863335626889) q[27];
-cx q[4],q[27];
-cx q[4],q[47];
-cx q[6],q[27];
-rz(4.45863335626889) q[27];
-cx q[6],q[27];
-rx(10.662276110314489) q[6];
-cx q[27],q[41];
-rz(4.45863335626889) q[28];
-cx q[3],q[28];
-cx q[3],q[29];
-rz(4.45863335626889) q[29];
-cx q[3],q[29];
-cx q[3],q[30];
-rx(10.662276110314489) q[29];
-rz(4.45863335626889) q[30];
-cx q[3],q[30];
-cx q[3],q[34];
-cx q[18],q[30];
-rz(4.45863335626889) q[30];
-cx q[18],q[30];
-rx(10.662276110314489) q[18];
-rz(4.45863335626889) q[31];
-cx q[12],q[31];
-cx q[26],q[31];
-rz(4.45863335626889) q[31];
-cx q[26],q[31];
-rx(10.662276110314489) q[26];
-rx(10.662276110314489) q[31];
-rz(4.45863335626889) q[32];
-cx q[0],q[32];
-cx q[0],q[42];
-cx q[21],q[32];
-rz(4.45863335626889) q[32];
-cx q[21],q[32];
-rz(4.45863335626889) q[33];
-cx q[5],q[33];
-cx q[5],q[46];
-cx q[30],q[33];
-rz(4.45863335626889) q[33];
-cx q[30],q[33];
-rx(10.662276110314489) q[33];
-rz(4.45863335626889) q[34];
-cx q[3],q[34];
-cx q[3],q[35];
-cx q[12],q[34];
-rz(4.45863335626889) q[34];
-cx q[12],q[34];
-cx q[34],q[37];
-rz(4.45863335626889) q[35];
-cx q[3],q[35];
-cx q[3],q[39];
-cx q[32],q[35];
-rz(4.45863335626889) q[35];
-cx q[32],q[35];
-rx(10.662276110314489) q[32];
-rx(10.662276110314489) q[35];
-rz(4.45863335626889) q[36];
-cx q[15],q[36];
-cx q[20],q[36];
-rz(4.45863335626889) q[36];
-cx q[20],q[36];
-rx(10.662276110314489) q[36];
-rz(4.45863335626889) q[37];
-cx q[34],q[37];
-rx(10.662276110314489) q[34];
-rx(10.662276110314489) q[37];
-rz(4.45863335626889) q[38];
-cx q[19],q[38];
-rx(10.662276110314489) q[19];
-cx q[21],q[38];
-rz(4.45863335626889) q[38];
-cx q[21],q[38];
-rz(4.45863335626889) q[39];
-cx q[3],q[39];
-cx q[3],q[40];
-cx q[13],q[39];
-rz(4.45863335626889) q[39];
-cx q[13],q[39];
-rx(10.662276110314489) q[13];
-rx(10.662276110314489) q[39];
-rz(4.45863335626889) q[40];
-cx q[3],q[40];
-cx q[23],q[40];
-rz(4.45863335626889) q[40];
-cx q[23],q[40];
-rx(10.662276110314489) q[23];
-rx(10.662276110314489) q[40];
-rz(4.45863335626889) q[41];
-cx q[27],q[41];
-rx(10.662276110314489) q[27];
-rx(10.662276110314489) q[41];
-rz(4.45863335626889) q[42];
-cx q[0],q[42];
-cx q[0],q[48];
-cx q[3],q[42];
-rz(4.45863335626889) q[42];
-cx q[3],q[42];
-cx q[3],q[43];
-rx(10.662276110314489) q[42];
-rz(4.45863335626889) q[43];
-cx q[3],q[43];
-cx q[3],q[44];
-cx q[20],q[43];
-rz(4.45863335626889) q[43];
-cx q[20],q[43];
-rx(10.662276110314489) q[20];
-rx(10.662276110314489) q[43];
-rz(4.45863335626889) q[44];
-cx q[3],q[44];
-cx q[3],q[49];
-cx q[12],q[44];
-rz(4.45863335626889) q[44];
-cx q[12],q[44];
-rx(10.662276110314489) q[44];
-rz(4.45863335626889) q[45];
-cx q[16],q[45];
-rx(10.662276110314489) q[16];
-rx(10.662276110314489) q[45];
-rz(4.45863335626889) q[46];
-cx q[5],q[46];
-rx(10.662276110314489) q[5];
-cx q[38],q[46];
-rz(4.45863335626889) q[46];
-cx q[38],q[46];
-rx(10.662276110314489) q[38];
-rx(10.662276110314489) q[46];
-rz(4.45863335626889) q[47];
-cx q[4],q[47];
-cx q[17],q[47];
-rz(4.45863335626889) q[47];
-cx q[17],q[47];
-cx q[17],q[53];
-rx(10.662276110314489) q[47];
-rz(4.45863335626889) q[48];
-cx q[0],q[48];
-cx q[0],q[51];
-cx q[30],q[48];
-rz(4.45863335626889) q[48];
-cx q[30],q[48];
-rx(10.662276110314489) q[30];
-rx(10.662276110314489) q[48];
-rz(4.45863335626889) q[49];
-cx q[3],q[49];
-cx q[3],q[50];
-cx q[4],q[49];
-rz(4.45863335626889) q[49];
-cx q[4],q[49];
-rx(10.662276110314489) q[4];
-rx(10.662276110314489) q[49];
-rz(4.45863335626889) q[50];
-cx q[3],q[50];
-cx q[3],q[52];
-cx q[12],q[50];
-rz(4.45863335626889) q[50];
-cx q[12],q[50];
-rx(10.662276110314489) q[12];
-rx(10.662276110314489) q[50];
-rz(4.45863335626889) q[51];
-cx q[0],q[51];
-rx(10.662276110314489) q[0];
-cx q[0],q[1];
-rz(4.864451920658482) q[1];
-cx q[0],q[1];
-cx q[0],q[2];
-rz(4.864451920658482) q[2];
-cx q[0],q[2];
-rx(8.875543240035283) q[2];
-cx q[28],q[51];
-rz(4.45863335626889) q[51];
-cx q[28],q[51];
-rx(10.662276110314489) q[51];
-rz(4.45863335626889) q[52];
-cx q[3],q[52];
-rx(10.662276110314489) q[3];
-cx q[0],q[3];
-rz(4.864451920658482) q[3];
-cx q[0],q[3];
-cx q[1],q[3];
-rz(4.864451920658482) q[3];
-cx q[1],q[3];
-cx q[1],q[4];
-rz(4.864451920658482) q[4];
-cx q[1],q[4];
-cx q[1],q[5];
-cx q[3],q[4];
-rz(4.864451920658482) q[4];
-cx q[3],q[4];
-cx q[4],q[6];
-rz(4.864451920658482) q[5];
-cx q[1],q[5];
-cx q[3],q[5];
-rz(4.864451920658482) q[5];
-cx q[3],q[5];
-cx q[3],q[7];
-rz(4.864451920658482) q[6];
-cx q[4],q[6];
-cx q[5],q[6];
-rz(4.864451920658482) q[6];
-cx q[5],q[6];
-rz(4.864451920658482) q[7];
-cx q[3],q[7];
-cx q[3],q[8];
-cx q[4],q[7];
-rz(4.864451920658482) q[7];
-cx q[4],q[7];
-rz(4.864451920658482) q[8];
-cx q[3],q[8];
-cx q[5],q[8];
-rz(4.864451920658482) q[8];
-cx q[5],q[8];
-cx q[5],q[11];
-rx(8.875543240035283) q[8];
-cx q[10],q[52];
-rz(4.864451920658482) q[11];
-cx q[5],q[11];
-rz(4.45863335626889) q[52];
-cx q[10],q[52];
-rx(10.662276110314489) q[10];
-cx q[4],q[10];
-rz(4.864451920658482) q[10];
-cx q[4],q[10];
-cx q[4],q[13];
-cx q[6],q[10];
-rz(4.864451920658482) q[10];
-cx q[6],q[10];
-cx q[6],q[11];
-cx q[10],q[37];
-rz(4.864451920658482) q[11];
-cx q[6],q[11];
-rx(8.875543240035283) q[11];
-rz(4.864451920658482) q[13];
-cx q[4],q[13];
-rz(4.864451920658482) q[37];
-cx q[10],q[37];
-cx q[10],q[41];
-rz(4.864451920658482) q[41];
-cx q[10],q[41];
-rx(10.662276110314489) q[52];
-rz(4.45863335626889) q[53];
-cx q[17],q[53];
-rx(10.662276110314489) q[17];
-cx q[21],q[53];
-rz(4.45863335626889) q[53];
-cx q[21],q[53];
-rx(10.662276110314489) q[21];
-rx(10.662276110314489) q[53];
-rz(4.45863335626889) q[54];
-cx q[24],q[54];
-rx(10.662276110314489) q[24];
-cx q[28],q[54];
-rz(4.45863335626889) q[54];
-cx q[28],q[54];
-rx(10.662276110314489) q[28];
-rx(10.662276110314489) q[54];
-rx(12.178139388832212) q[55];
-cx q[9],q[55];
-rz(4.45863335626889) q[55];
-cx q[9],q[55];
-rx(10.662276110314489) q[9];
-cx q[1],q[9];
-rz(4.864451920658482) q[9];
-cx q[1],q[9];
-cx q[1],q[17];
-cx q[3],q[9];
-rz(4.864451920658482) q[9];
-cx q[3],q[9];
-cx q[3],q[12];
-rz(4.864451920658482) q[12];
-cx q[3],q[12];
-cx q[3],q[14];
-cx q[5],q[12];
-rz(4.864451920658482) q[12];
-cx q[5],q[12];
-cx q[5],q[13];
-rz(4.864451920658482) q[13];
-cx q[5],q[13];
-rz(4.864451920658482) q[14];
-cx q[3],q[14];
-cx q[4],q[14];
-rz(4.864451920658482) q[14];
-cx q[4],q[14];
-rx(8.875543240035283) q[14];
-cx q[15],q[55];
-rz(4.864451920658482) q[17];
-cx q[1],q[17];
-cx q[1],q[28];
-rz(4.864451920658482) q[28];
-cx q[1],q[28];
-cx q[1],q[29];
-rz(4.864451920658482) q[29];
-cx q[1],q[29];
-cx q[1],q[45];
-rz(4.864451920658482) q[45];
-cx q[1],q[45];
-rx(8.875543240035283) q[1];
-rz(4.45863335626889) q[55];
-cx q[15],q[55];
-rx(10.662276110314489) q[15];
-cx q[0],q[15];
-rz(4.864451920658482) q[15];
-cx q[0],q[15];
-cx q[0],q[16];
-cx q[3],q[15];
-rz(4.864451920658482) q[15];
-cx q[3],q[15];
-rz(4.864451920658482) q[16];
-cx q[0],q[16];
-cx q[0],q[20];
-cx q[3],q[16];
-rz(4.864451920658482) q[16];
-cx q[3],q[16];
-cx q[3],q[17];
-cx q[16],q[45];
-rz(4.864451920658482) q[17];
-cx q[3],q[17];
-cx q[3],q[18];
-rz(4.864451920658482) q[18];
-cx q[3],q[18];
-cx q[3],q[19];
-cx q[4],q[18];
-rz(4.864451920658482) q[18];
-cx q[4],q[18];
-cx q[4],q[21];
-rz(4.864451920658482) q[19];
-cx q[3],q[19];
-cx q[3],q[22];
-cx q[7],q[19];
-rz(4.864451920658482) q[19];
-cx q[7],q[19];
-rx(8.875543240035283) q[7];
-cx q[19],q[38];
-rz(4.864451920658482) q[20];
-cx q[0],q[20];
-cx q[0],q[32];
-cx q[15],q[20];
-rz(4.864451920658482) q[20];
-cx q[15],q[20];
-rz(4.864451920658482) q[21];
-cx q[4],q[21];
-cx q[4],q[27];
-cx q[15],q[21];
-rz(4.864451920658482) q[21];
-cx q[15],q[21];
-cx q[15],q[36];
-rz(4.864451920658482) q[22];
-cx q[3],q[22];
-cx q[3],q[23];
-cx q[9],q[22];
-rz(4.864451920658482) q[22];
-cx q[9],q[22];
-rx(8.875543240035283) q[22];
-rz(4.864451920658482) q[23];
-cx q[3],q[23];
-cx q[3],q[24];
-cx q[17],q[23];
-rz(4.864451920658482) q[23];
-cx q[17],q[23];
-rz(4.864451920658482) q[24];
-cx q[3],q[24];
-cx q[3],q[25];
-cx q[5],q[24];
-rz(4.864451920658482) q[24];
-cx q[5],q[24];
-cx q[5],q[33];
-cx q[24],q[54];
-rz(4.864451920658482) q[25];
-cx q[3],q[25];
-cx q[3],q[26];
-cx q[12],q[25];
-rz(4.864451920658482) q[25];
-cx q[12],q[25];
-cx q[12],q[31];
-rx(8.875543240035283) q[25];
-rz(4.864451920658482) q[26];
-cx q[3],q[26];
-cx q[3],q[28];
-cx q[21],q[26];
-rz(4.864451920658482) q[26];
-cx q[21],q[26];
-rz(4.864451920658482) q[27];
-cx q[4],q[27];
-cx q[4],q[47];
-cx q[6],q[27];
-rz(4.864451920658482) q[27];
-cx q[6],q[27];
-rx(8.875543240035283) q[6];
-cx q[27],q[41];
-rz(4.864451920658482) q[28];
-cx q[3],q[28];
-cx q[3],q[29];
-rz(4.864451920658482) q[29];
-cx q[3],q[29];
-cx q[3],q[30];
-rx(8.875543240035283) q[29];
-rz(4.864451920658482) q[30];
-cx q[3],q[30];
-cx q[3],q[34];
-cx q[18],q[30];
-rz(4.864451920658482) q[30];
-cx q[18],q[30];
-rx(8.875543240035283) q[18];
-rz(4.864451920658482) q[31];
-cx q[12],q[31];
-cx q[26],q[31];
-rz(4.864451920658482) q[31];
-cx q[26],q[31];
-rx(8.875543240035283) q[26];
-rx(8.875543240035283) q[31];
-rz(4.864451920658482) q[32];
-cx q[0],q[32];
-cx q[0],q[42];
-cx q[21],q[32];
-rz(4.864451920658482) q[32];
-cx q[21],q[32];
-rz(4.864451920658482) q[33];
-cx q[5],q[33];
-cx q[5],q[46];
-cx q[30],q[33];
-rz(4.864451920658482) q[33];
-cx q[30],q[33];
-rx(8.875543240035283) q[33];
-rz(4.864451920658482) q[34];
-cx q[3],q[34];
-cx q[3],q[35];
-cx q[12],q[34];
-rz(4.864451920658482) q[34];
-cx q[12],q[34];
-cx q[34],q[37];
-rz(4.864451920658482) q[35];
-cx q[3],q[35];
-cx q[3],q[39];
-cx q[32],q[35];
-rz(4.864451920658482) q[35];
-cx q[32],q[35];
-rx(8.875543240035283) q[32];
-rx(8.875543240035283) q[35];
-rz(4.864451920658482) q[36];
-cx q[15],q[36];
-cx q[20],q[36];
-rz(4.864451920658482) q[36];
-cx q[20],q[36];
-rx(8.875543240035283) q[36];
-rz(4.864451920658482) q[37];
-cx q[34],q[37];
-rx(8.875543240035283) q[34];
-rx(8.875543240035283) q[37];
-rz(4.864451920658482) q[38];
-cx q[19],q[38];
-rx(8.875543240035283) q[19];
-cx q[21],q[38];
-rz(4.864451920658482) q[38];
-cx q[21],q[38];
-rz(4.864451920658482) q[39];
-cx q[3],q[39];
-cx q[3],q[40];
-cx q[13],q[39];
-rz(4.864451920658482) q[39];
-cx q[13],q[39];
-rx(8.875543240035283) q[13];
-rx(8.875543240035283) q[39];
-rz(4.864451920658482) q[40];
-cx q[3],q[40];
-cx q[23],q[40];
-rz(4.864451920658482) q[40];
-cx q[23],q[40];
-rx(8.875543240035283) q[23];
-rx(8.875543240035283) q[40];
-rz(4.864451920658482) q[41];
-cx q[27],q[41];
-rx(8.875543240035283) q[27];
-rx(8.875543240035283) q[41];
-rz(4.864451920658482) q[42];
-cx q[0],q[42];
-cx q[0],q[48];
-cx q[3],q[42];
-rz(4.864451920658482) q[42];
-cx q[3],q[42];
-cx q[3],q[43];
-rx(8.875543240035283) q[42];
-rz(4.864451920658482) q[43];
-cx q[3],q[43];
-cx q[3],q[44];
-cx q[20],q[43];
-rz(4.864451920658482) q[43];
-cx q[20],q[43];
-rx(8.875543240035283) q[20];
-rx(8.875543240035283) q[43];
-rz(4.864451920658482) q[44];
-cx q[3],q[44];
-cx q[3],q[49];
-cx q[12],q[44];
-rz(4.864451920658482) q[44];
-cx q[12],q[44];
-rx(8.875543240035283) q[44];
-rz(4.864451920658482) q[45];
-cx q[16],q[45];
-rx(8.875543240035283) q[16];
-rx(8.875543240035283) q[45];
-rz(4.864451920658482) q[46];
-cx q[5],q[46];
-rx(8.875543240035283) q[5];
-cx q[38],q[46];
-rz(4.864451920658482) q[46];
-cx q[38],q[46];
-rx(8.875543240035283) q[38];
-rx(8.875543240035283) q[46];
-rz(4.864451920658482) q[47];
-cx q[4],q[47];
-cx q[17],q[47];
-rz(4.864451920658482) q[47];
-cx q[17],q[47];
-cx q[17],q[53];
-rx(8.875543240035283) q[47];
-rz(4.864451920658482) q[48];
-cx q[0],q[48];
-cx q[0],q[51];
-cx q[30],q[48];
-rz(4.864451920658482) q[48];
-cx q[30],q[48];
-rx(8.875543240035283) q[30];
-rx(8.875543240035283) q[48];
-rz(4.864451920658482) q[49];
-cx q[3],q[49];
-cx q[3],q[50];
-cx q[4],q[49];
-rz(4.864451920658482) q[49];
-cx q[4],q[49];
-rx(8.875543240035283) q[4];
-rx(8.875543240035283) q[49];
-rz(4.864451920658482) q[50];
-cx q[3],q[50];
-cx q[3],q[52];
-cx q[12],q[50];
-rz(4.864451920658482) q[50];
-cx q[12],q[50];
-rx(8.875543240035283) q[12];
-rx(8.875543240035283) q[50];
-rz(4.864451920658482) q[51];
-cx q[0],q[51];
-rx(8.875543240035283) q[0];
-cx q[28],q[51];
-rz(4.864451920658482) q[51];
-cx q[28],q[51];
-rx(8.875543240035283) q[51];
-rz(4.864451920658482) q[52];
-cx q[3],q[52];
-rx(8.875543240035283) q[3];
-cx q[10],q[52];
-rz(4.864451920658482) q[52];
-cx q[10],q[52];
-rx(8.875543240035283) q[10];
-rx(8.875543240035283) q[52];
-rz(4.864451920658482) q[53];
-cx q[17],q[53];
-rx(8.875543240035283) q[17];
-cx q[21],q[53];
-rz(4.864451920658482) q[53];
-cx q[21],q[53];
-rx(8.875543240035283) q[21];
-rx(8.875543240035283) q[53];
-rz(4.864451920658482) q[54];
-cx q[24],q[54];
-rx(8.875543240035283) q[24];
-cx q[28],q[54];
-rz(4.864451920658482) q[54];
-cx q[28],q[54];
-rx(8.875543240035283) q[28];
-rx(8.875543240035283) q[54];
-rx(10.662276110314489) q[55];
-cx q[9],q[55];
-rz(4.864451920658482) q[55];
-cx q[9],q[55];
-rx(8.875543240035283) q[9];
-cx q[15],q[55];
-rz(4.864451920658482) q[55];
-cx q[15],q[55];
-rx(8.875543240035283) q[15];
-rx(8.875543240035283) q[55];
\ No newline at end of file
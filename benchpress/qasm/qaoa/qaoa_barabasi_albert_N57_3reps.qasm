@@ -1,1278 +0,0 @@
-OPENQASM 2.0;
-include "qelib1.inc";
-qreg q[57];
-ry(pi/2) q[0];
-rx(pi) q[0];
-ry(pi/2) q[1];
-rx(pi) q[1];
-cx q[0],q[1];
-rz(3.295758784317271) q[1];
-cx q[0],q[1];
-ry(pi/2) q[2];
-rx(pi) q[2];
-cx q[0],q[2];
-rz(3.295758784317271) q[2];
-cx q[0],q[2];
-rx(7.092769717455467) q[2];
-ry(pi/2) q[3];
-rx(pi) q[3];
-cx q[0],q[3];
-rz(3.295758784317271) q[3];
-cx q[0],q[3];
-cx q[1],q[3];
-rz(3.295758784317271) q[3];
-cx q[1],q[3];
-ry(pi/2) q[4];
-rx(pi) q[4];
-cx q[1],q[4];
-rz(3.295758784317271) q[4];
-cx q[1],q[4];
-cx q[3],q[4];
-rz(3.295758784317271) q[4];
-cx q[3],q[4];
-ry(pi/2) q[5];
-rx(pi) q[5];
-cx q[1],q[5];
-rz(3.295758784317271) q[5];
-cx q[1],q[5];
-cx q[3],q[5];
-rz(3.295758784317271) q[5];
-cx q[3],q[5];
-ry(pi/2) q[6];
-rx(pi) q[6];
-cx q[4],q[6];
-rz(3.295758784317271) q[6];
-cx q[4],q[6];
-cx q[5],q[6];
-rz(3.295758784317271) q[6];
-cx q[5],q[6];
-ry(pi/2) q[7];
-rx(pi) q[7];
-cx q[3],q[7];
-rz(3.295758784317271) q[7];
-cx q[3],q[7];
-cx q[4],q[7];
-rz(3.295758784317271) q[7];
-cx q[4],q[7];
-ry(pi/2) q[8];
-rx(pi) q[8];
-cx q[3],q[8];
-rz(3.295758784317271) q[8];
-cx q[3],q[8];
-cx q[5],q[8];
-rz(3.295758784317271) q[8];
-cx q[5],q[8];
-rx(7.092769717455467) q[8];
-ry(pi/2) q[9];
-rx(pi) q[9];
-cx q[1],q[9];
-rz(3.295758784317271) q[9];
-cx q[1],q[9];
-cx q[3],q[9];
-rz(3.295758784317271) q[9];
-cx q[3],q[9];
-ry(pi/2) q[10];
-rx(pi) q[10];
-cx q[4],q[10];
-rz(3.295758784317271) q[10];
-cx q[4],q[10];
-cx q[6],q[10];
-rz(3.295758784317271) q[10];
-cx q[6],q[10];
-ry(pi/2) q[11];
-rx(pi) q[11];
-cx q[5],q[11];
-rz(3.295758784317271) q[11];
-cx q[5],q[11];
-cx q[6],q[11];
-rz(3.295758784317271) q[11];
-cx q[6],q[11];
-rx(7.092769717455467) q[11];
-ry(pi/2) q[12];
-rx(pi) q[12];
-cx q[3],q[12];
-rz(3.295758784317271) q[12];
-cx q[3],q[12];
-cx q[5],q[12];
-rz(3.295758784317271) q[12];
-cx q[5],q[12];
-ry(pi/2) q[13];
-rx(pi) q[13];
-cx q[4],q[13];
-rz(3.295758784317271) q[13];
-cx q[4],q[13];
-cx q[5],q[13];
-rz(3.295758784317271) q[13];
-cx q[5],q[13];
-ry(pi/2) q[14];
-rx(pi) q[14];
-cx q[3],q[14];
-rz(3.295758784317271) q[14];
-cx q[3],q[14];
-cx q[4],q[14];
-rz(3.295758784317271) q[14];
-cx q[4],q[14];
-rx(7.092769717455467) q[14];
-ry(pi/2) q[15];
-rx(pi) q[15];
-cx q[0],q[15];
-rz(3.295758784317271) q[15];
-cx q[0],q[15];
-cx q[3],q[15];
-rz(3.295758784317271) q[15];
-cx q[3],q[15];
-ry(pi/2) q[16];
-rx(pi) q[16];
-cx q[0],q[16];
-rz(3.295758784317271) q[16];
-cx q[0],q[16];
-cx q[3],q[16];
-rz(3.295758784317271) q[16];
-cx q[3],q[16];
-ry(pi/2) q[17];
-rx(pi) q[17];
-cx q[1],q[17];
-rz(3.295758784317271) q[17];
-cx q[1],q[17];
-cx q[3],q[17];
-rz(3.295758784317271) q[17];
-cx q[3],q[17];
-ry(pi/2) q[18];
-rx(pi) q[18];
-cx q[3],q[18];
-rz(3.295758784317271) q[18];
-cx q[3],q[18];
-cx q[4],q[18];
-rz(3.295758784317271) q[18];
-cx q[4],q[18];
-ry(pi/2) q[19];
-rx(pi) q[19];
-cx q[3],q[19];
-rz(3.295758784317271) q[19];
-cx q[3],q[19];
-cx q[7],q[19];
-rz(3.295758784317271) q[19];
-cx q[7],q[19];
-rx(7.092769717455467) q[7];
-ry(pi/2) q[20];
-rx(pi) q[20];
-cx q[0],q[20];
-rz(3.295758784317271) q[20];
-cx q[0],q[20];
-cx q[15],q[20];
-rz(3.295758784317271) q[20];
-cx q[15],q[20];
-ry(pi/2) q[21];
-rx(pi) q[21];
-cx q[4],q[21];
-rz(3.295758784317271) q[21];
-cx q[4],q[21];
-cx q[15],q[21];
-rz(3.295758784317271) q[21];
-cx q[15],q[21];
-ry(pi/2) q[22];
-rx(pi) q[22];
-cx q[3],q[22];
-rz(3.295758784317271) q[22];
-cx q[3],q[22];
-cx q[9],q[22];
-rz(3.295758784317271) q[22];
-cx q[9],q[22];
-rx(7.092769717455467) q[22];
-ry(pi/2) q[23];
-rx(pi) q[23];
-cx q[3],q[23];
-rz(3.295758784317271) q[23];
-cx q[3],q[23];
-cx q[17],q[23];
-rz(3.295758784317271) q[23];
-cx q[17],q[23];
-ry(pi/2) q[24];
-rx(pi) q[24];
-cx q[3],q[24];
-rz(3.295758784317271) q[24];
-cx q[3],q[24];
-cx q[5],q[24];
-rz(3.295758784317271) q[24];
-cx q[5],q[24];
-ry(pi/2) q[25];
-rx(pi) q[25];
-cx q[3],q[25];
-rz(3.295758784317271) q[25];
-cx q[3],q[25];
-cx q[12],q[25];
-rz(3.295758784317271) q[25];
-cx q[12],q[25];
-rx(7.092769717455467) q[25];
-ry(pi/2) q[26];
-rx(pi) q[26];
-cx q[3],q[26];
-rz(3.295758784317271) q[26];
-cx q[3],q[26];
-cx q[21],q[26];
-rz(3.295758784317271) q[26];
-cx q[21],q[26];
-ry(pi/2) q[27];
-rx(pi) q[27];
-cx q[4],q[27];
-rz(3.295758784317271) q[27];
-cx q[4],q[27];
-cx q[6],q[27];
-rz(3.295758784317271) q[27];
-cx q[6],q[27];
-rx(7.092769717455467) q[6];
-ry(pi/2) q[28];
-rx(pi) q[28];
-cx q[1],q[28];
-rz(3.295758784317271) q[28];
-cx q[1],q[28];
-cx q[3],q[28];
-rz(3.295758784317271) q[28];
-cx q[3],q[28];
-ry(pi/2) q[29];
-rx(pi) q[29];
-cx q[1],q[29];
-rz(3.295758784317271) q[29];
-cx q[1],q[29];
-cx q[3],q[29];
-rz(3.295758784317271) q[29];
-cx q[3],q[29];
-rx(7.092769717455467) q[29];
-ry(pi/2) q[30];
-rx(pi) q[30];
-cx q[3],q[30];
-rz(3.295758784317271) q[30];
-cx q[3],q[30];
-cx q[18],q[30];
-rz(3.295758784317271) q[30];
-cx q[18],q[30];
-rx(7.092769717455467) q[18];
-ry(pi/2) q[31];
-rx(pi) q[31];
-cx q[12],q[31];
-rz(3.295758784317271) q[31];
-cx q[12],q[31];
-cx q[26],q[31];
-rz(3.295758784317271) q[31];
-cx q[26],q[31];
-rx(7.092769717455467) q[26];
-rx(7.092769717455467) q[31];
-ry(pi/2) q[32];
-rx(pi) q[32];
-cx q[0],q[32];
-rz(3.295758784317271) q[32];
-cx q[0],q[32];
-cx q[21],q[32];
-rz(3.295758784317271) q[32];
-cx q[21],q[32];
-ry(pi/2) q[33];
-rx(pi) q[33];
-cx q[5],q[33];
-rz(3.295758784317271) q[33];
-cx q[5],q[33];
-cx q[30],q[33];
-rz(3.295758784317271) q[33];
-cx q[30],q[33];
-rx(7.092769717455467) q[33];
-ry(pi/2) q[34];
-rx(pi) q[34];
-cx q[3],q[34];
-rz(3.295758784317271) q[34];
-cx q[3],q[34];
-cx q[12],q[34];
-rz(3.295758784317271) q[34];
-cx q[12],q[34];
-ry(pi/2) q[35];
-rx(pi) q[35];
-cx q[3],q[35];
-rz(3.295758784317271) q[35];
-cx q[3],q[35];
-cx q[32],q[35];
-rz(3.295758784317271) q[35];
-cx q[32],q[35];
-rx(7.092769717455467) q[32];
-rx(7.092769717455467) q[35];
-ry(pi/2) q[36];
-rx(pi) q[36];
-cx q[15],q[36];
-rz(3.295758784317271) q[36];
-cx q[15],q[36];
-cx q[20],q[36];
-rz(3.295758784317271) q[36];
-cx q[20],q[36];
-rx(7.092769717455467) q[36];
-ry(pi/2) q[37];
-rx(pi) q[37];
-cx q[10],q[37];
-rz(3.295758784317271) q[37];
-cx q[10],q[37];
-cx q[34],q[37];
-rz(3.295758784317271) q[37];
-cx q[34],q[37];
-rx(7.092769717455467) q[34];
-rx(7.092769717455467) q[37];
-ry(pi/2) q[38];
-rx(pi) q[38];
-cx q[19],q[38];
-rz(3.295758784317271) q[38];
-cx q[19],q[38];
-rx(7.092769717455467) q[19];
-cx q[21],q[38];
-rz(3.295758784317271) q[38];
-cx q[21],q[38];
-ry(pi/2) q[39];
-rx(pi) q[39];
-cx q[3],q[39];
-rz(3.295758784317271) q[39];
-cx q[3],q[39];
-cx q[13],q[39];
-rz(3.295758784317271) q[39];
-cx q[13],q[39];
-rx(7.092769717455467) q[39];
-ry(pi/2) q[40];
-rx(pi) q[40];
-cx q[3],q[40];
-rz(3.295758784317271) q[40];
-cx q[3],q[40];
-cx q[23],q[40];
-rz(3.295758784317271) q[40];
-cx q[23],q[40];
-rx(7.092769717455467) q[23];
-rx(7.092769717455467) q[40];
-ry(pi/2) q[41];
-rx(pi) q[41];
-cx q[10],q[41];
-rz(3.295758784317271) q[41];
-cx q[10],q[41];
-cx q[27],q[41];
-rz(3.295758784317271) q[41];
-cx q[27],q[41];
-rx(7.092769717455467) q[27];
-rx(7.092769717455467) q[41];
-ry(pi/2) q[42];
-rx(pi) q[42];
-cx q[0],q[42];
-rz(3.295758784317271) q[42];
-cx q[0],q[42];
-cx q[3],q[42];
-rz(3.295758784317271) q[42];
-cx q[3],q[42];
-rx(7.092769717455467) q[42];
-ry(pi/2) q[43];
-rx(pi) q[43];
-cx q[3],q[43];
-rz(3.295758784317271) q[43];
-cx q[3],q[43];
-cx q[20],q[43];
-rz(3.295758784317271) q[43];
-cx q[20],q[43];
-rx(7.092769717455467) q[20];
-rx(7.092769717455467) q[43];
-ry(pi/2) q[44];
-rx(pi) q[44];
-cx q[3],q[44];
-rz(3.295758784317271) q[44];
-cx q[3],q[44];
-cx q[12],q[44];
-rz(3.295758784317271) q[44];
-cx q[12],q[44];
-rx(7.092769717455467) q[44];
-ry(pi/2) q[45];
-rx(pi) q[45];
-cx q[1],q[45];
-rz(3.295758784317271) q[45];
-cx q[1],q[45];
-rx(7.092769717455467) q[1];
-cx q[16],q[45];
-rz(3.295758784317271) q[45];
-cx q[16],q[45];
-rx(7.092769717455467) q[16];
-ry(pi/2) q[46];
-rx(pi) q[46];
-cx q[5],q[46];
-rz(3.295758784317271) q[46];
-cx q[5],q[46];
-rx(7.092769717455467) q[5];
-cx q[38],q[46];
-rz(3.295758784317271) q[46];
-cx q[38],q[46];
-rx(7.092769717455467) q[38];
-rx(7.092769717455467) q[46];
-ry(pi/2) q[47];
-rx(pi) q[47];
-cx q[4],q[47];
-rz(3.295758784317271) q[47];
-cx q[4],q[47];
-cx q[17],q[47];
-rz(3.295758784317271) q[47];
-cx q[17],q[47];
-rx(7.092769717455467) q[47];
-ry(pi/2) q[48];
-rx(pi) q[48];
-cx q[0],q[48];
-rz(3.295758784317271) q[48];
-cx q[0],q[48];
-cx q[30],q[48];
-rz(3.295758784317271) q[48];
-cx q[30],q[48];
-rx(7.092769717455467) q[30];
-rx(7.092769717455467) q[48];
-ry(pi/2) q[49];
-rx(pi) q[49];
-cx q[3],q[49];
-rz(3.295758784317271) q[49];
-cx q[3],q[49];
-cx q[4],q[49];
-rz(3.295758784317271) q[49];
-cx q[4],q[49];
-rx(7.092769717455467) q[4];
-rx(7.092769717455467) q[49];
-ry(pi/2) q[50];
-rx(pi) q[50];
-cx q[3],q[50];
-rz(3.295758784317271) q[50];
-cx q[3],q[50];
-cx q[12],q[50];
-rz(3.295758784317271) q[50];
-cx q[12],q[50];
-rx(7.092769717455467) q[12];
-rx(7.092769717455467) q[50];
-ry(pi/2) q[51];
-rx(pi) q[51];
-cx q[0],q[51];
-rz(3.295758784317271) q[51];
-cx q[0],q[51];
-rx(7.092769717455467) q[0];
-cx q[0],q[1];
-rz(5.403056551629339) q[1];
-cx q[0],q[1];
-cx q[0],q[2];
-rz(5.403056551629339) q[2];
-cx q[0],q[2];
-rx(6.844145006334985) q[2];
-cx q[28],q[51];
-rz(3.295758784317271) q[51];
-cx q[28],q[51];
-rx(7.092769717455467) q[51];
-ry(pi/2) q[52];
-rx(pi) q[52];
-cx q[3],q[52];
-rz(3.295758784317271) q[52];
-cx q[3],q[52];
-rx(7.092769717455467) q[3];
-cx q[0],q[3];
-rz(5.403056551629339) q[3];
-cx q[0],q[3];
-cx q[1],q[3];
-rz(5.403056551629339) q[3];
-cx q[1],q[3];
-cx q[1],q[4];
-rz(5.403056551629339) q[4];
-cx q[1],q[4];
-cx q[1],q[5];
-cx q[3],q[4];
-rz(5.403056551629339) q[4];
-cx q[3],q[4];
-cx q[4],q[6];
-rz(5.403056551629339) q[5];
-cx q[1],q[5];
-cx q[3],q[5];
-rz(5.403056551629339) q[5];
-cx q[3],q[5];
-cx q[3],q[7];
-rz(5.403056551629339) q[6];
-cx q[4],q[6];
-cx q[5],q[6];
-rz(5.403056551629339) q[6];
-cx q[5],q[6];
-rz(5.403056551629339) q[7];
-cx q[3],q[7];
-cx q[3],q[8];
-cx q[4],q[7];
-rz(5.403056551629339) q[7];
-cx q[4],q[7];
-rz(5.403056551629339) q[8];
-cx q[3],q[8];
-cx q[5],q[8];
-rz(5.403056551629339) q[8];
-cx q[5],q[8];
-cx q[5],q[11];
-rx(6.844145006334985) q[8];
-cx q[10],q[52];
-rz(5.403056551629339) q[11];
-cx q[5],q[11];
-rz(3.295758784317271) q[52];
-cx q[10],q[52];
-rx(7.092769717455467) q[10];
-cx q[4],q[10];
-rz(5.403056551629339) q[10];
-cx q[4],q[10];
-cx q[6],q[10];
-rz(5.403056551629339) q[10];
-cx q[6],q[10];
-cx q[6],q[11];
-cx q[10],q[37];
-rz(5.403056551629339) q[11];
-cx q[6],q[11];
-rx(6.844145006334985) q[11];
-rz(5.403056551629339) q[37];
-cx q[10],q[37];
-cx q[10],q[41];
-rz(5.403056551629339) q[41];
-cx q[10],q[41];
-rx(7.092769717455467) q[52];
-ry(pi/2) q[53];
-rx(pi) q[53];
-cx q[17],q[53];
-rz(3.295758784317271) q[53];
-cx q[17],q[53];
-rx(7.092769717455467) q[17];
-cx q[21],q[53];
-rz(3.295758784317271) q[53];
-cx q[21],q[53];
-rx(7.092769717455467) q[21];
-rx(7.092769717455467) q[53];
-ry(pi/2) q[54];
-rx(pi) q[54];
-cx q[24],q[54];
-rz(3.295758784317271) q[54];
-cx q[24],q[54];
-rx(7.092769717455467) q[24];
-cx q[28],q[54];
-rz(3.295758784317271) q[54];
-cx q[28],q[54];
-rx(7.092769717455467) q[28];
-rx(7.092769717455467) q[54];
-ry(pi/2) q[55];
-rx(pi) q[55];
-cx q[9],q[55];
-rz(3.295758784317271) q[55];
-cx q[9],q[55];
-rx(7.092769717455467) q[9];
-cx q[1],q[9];
-rz(5.403056551629339) q[9];
-cx q[1],q[9];
-cx q[1],q[17];
-cx q[3],q[9];
-rz(5.403056551629339) q[9];
-cx q[3],q[9];
-cx q[3],q[12];
-rz(5.403056551629339) q[12];
-cx q[3],q[12];
-cx q[3],q[14];
-cx q[5],q[12];
-rz(5.403056551629339) q[12];
-cx q[5],q[12];
-rz(5.403056551629339) q[14];
-cx q[3],q[14];
-cx q[15],q[55];
-rz(5.403056551629339) q[17];
-cx q[1],q[17];
-cx q[1],q[28];
-rz(5.403056551629339) q[28];
-cx q[1],q[28];
-cx q[1],q[29];
-rz(5.403056551629339) q[29];
-cx q[1],q[29];
-rz(3.295758784317271) q[55];
-cx q[15],q[55];
-rx(7.092769717455467) q[15];
-cx q[0],q[15];
-rz(5.403056551629339) q[15];
-cx q[0],q[15];
-cx q[0],q[16];
-cx q[3],q[15];
-rz(5.403056551629339) q[15];
-cx q[3],q[15];
-rz(5.403056551629339) q[16];
-cx q[0],q[16];
-cx q[0],q[20];
-cx q[3],q[16];
-rz(5.403056551629339) q[16];
-cx q[3],q[16];
-cx q[3],q[17];
-rz(5.403056551629339) q[17];
-cx q[3],q[17];
-cx q[3],q[18];
-rz(5.403056551629339) q[18];
-cx q[3],q[18];
-cx q[3],q[19];
-rz(5.403056551629339) q[19];
-cx q[3],q[19];
-cx q[3],q[22];
-cx q[7],q[19];
-rz(5.403056551629339) q[19];
-cx q[7],q[19];
-rx(6.844145006334985) q[7];
-cx q[19],q[38];
-rz(5.403056551629339) q[20];
-cx q[0],q[20];
-cx q[0],q[32];
-cx q[15],q[20];
-rz(5.403056551629339) q[20];
-cx q[15],q[20];
-rz(5.403056551629339) q[22];
-cx q[3],q[22];
-cx q[3],q[23];
-cx q[9],q[22];
-rz(5.403056551629339) q[22];
-cx q[9],q[22];
-rx(6.844145006334985) q[22];
-rz(5.403056551629339) q[23];
-cx q[3],q[23];
-cx q[3],q[24];
-cx q[17],q[23];
-rz(5.403056551629339) q[23];
-cx q[17],q[23];
-rz(5.403056551629339) q[24];
-cx q[3],q[24];
-cx q[3],q[25];
-rz(5.403056551629339) q[25];
-cx q[3],q[25];
-cx q[3],q[26];
-cx q[12],q[25];
-rz(5.403056551629339) q[25];
-cx q[12],q[25];
-cx q[12],q[31];
-rx(6.844145006334985) q[25];
-rz(5.403056551629339) q[26];
-cx q[3],q[26];
-cx q[3],q[28];
-rz(5.403056551629339) q[28];
-cx q[3],q[28];
-cx q[3],q[29];
-rz(5.403056551629339) q[29];
-cx q[3],q[29];
-cx q[3],q[30];
-rx(6.844145006334985) q[29];
-rz(5.403056551629339) q[30];
-cx q[3],q[30];
-cx q[3],q[34];
-rz(5.403056551629339) q[31];
-cx q[12],q[31];
-rz(5.403056551629339) q[32];
-cx q[0],q[32];
-cx q[0],q[42];
-rz(5.403056551629339) q[34];
-cx q[3],q[34];
-cx q[3],q[35];
-cx q[12],q[34];
-rz(5.403056551629339) q[34];
-cx q[12],q[34];
-cx q[34],q[37];
-rz(5.403056551629339) q[35];
-cx q[3],q[35];
-cx q[3],q[39];
-rz(5.403056551629339) q[37];
-cx q[34],q[37];
-rx(6.844145006334985) q[34];
-rx(6.844145006334985) q[37];
-rz(5.403056551629339) q[38];
-cx q[19],q[38];
-rx(6.844145006334985) q[19];
-rz(5.403056551629339) q[39];
-cx q[3],q[39];
-cx q[3],q[40];
-rz(5.403056551629339) q[40];
-cx q[3],q[40];
-cx q[23],q[40];
-rz(5.403056551629339) q[40];
-cx q[23],q[40];
-rx(6.844145006334985) q[23];
-rx(6.844145006334985) q[40];
-rz(5.403056551629339) q[42];
-cx q[0],q[42];
-cx q[0],q[48];
-cx q[3],q[42];
-rz(5.403056551629339) q[42];
-cx q[3],q[42];
-cx q[3],q[43];
-rx(6.844145006334985) q[42];
-rz(5.403056551629339) q[43];
-cx q[3],q[43];
-cx q[3],q[44];
-rz(5.403056551629339) q[44];
-cx q[3],q[44];
-cx q[3],q[49];
-cx q[12],q[44];
-rz(5.403056551629339) q[44];
-cx q[12],q[44];
-rx(6.844145006334985) q[44];
-rz(5.403056551629339) q[48];
-cx q[0],q[48];
-cx q[0],q[51];
-rz(5.403056551629339) q[49];
-cx q[3],q[49];
-cx q[3],q[50];
-rz(5.403056551629339) q[50];
-cx q[3],q[50];
-cx q[3],q[52];
-cx q[12],q[50];
-rz(5.403056551629339) q[50];
-cx q[12],q[50];
-rx(6.844145006334985) q[12];
-rx(6.844145006334985) q[50];
-rz(5.403056551629339) q[51];
-cx q[0],q[51];
-rx(6.844145006334985) q[0];
-cx q[28],q[51];
-rz(5.403056551629339) q[51];
-cx q[28],q[51];
-rx(6.844145006334985) q[51];
-rz(5.403056551629339) q[52];
-cx q[3],q[52];
-rx(6.844145006334985) q[3];
-cx q[10],q[52];
-rz(5.403056551629339) q[52];
-cx q[10],q[52];
-rx(6.844145006334985) q[10];
-rx(6.844145006334985) q[52];
-rx(7.092769717455467) q[55];
-cx q[9],q[55];
-rz(5.403056551629339) q[55];
-cx q[9],q[55];
-rx(6.844145006334985) q[9];
-ry(pi/2) q[56];
-rx(pi) q[56];
-cx q[13],q[56];
-rz(3.295758784317271) q[56];
-cx q[13],q[56];
-rx(7.092769717455467) q[13];
-cx q[4],q[13];
-rz(5.403056551629339) q[13];
-cx q[4],q[13];
-cx q[4],q[14];
-cx q[5],q[13];
-rz(5.403056551629339) q[13];
-cx q[5],q[13];
-cx q[5],q[24];
-cx q[13],q[39];
-rz(5.403056551629339) q[14];
-cx q[4],q[14];
-cx q[4],q[18];
-rx(6.844145006334985) q[14];
-rz(5.403056551629339) q[18];
-cx q[4],q[18];
-cx q[4],q[21];
-cx q[18],q[30];
-rz(5.403056551629339) q[21];
-cx q[4],q[21];
-cx q[4],q[27];
-cx q[15],q[21];
-rz(5.403056551629339) q[21];
-cx q[15],q[21];
-cx q[15],q[36];
-cx q[21],q[26];
-rz(5.403056551629339) q[24];
-cx q[5],q[24];
-cx q[5],q[33];
-cx q[24],q[54];
-rz(5.403056551629339) q[26];
-cx q[21],q[26];
-cx q[21],q[32];
-cx q[26],q[31];
-rz(5.403056551629339) q[27];
-cx q[4],q[27];
-cx q[4],q[47];
-cx q[6],q[27];
-rz(5.403056551629339) q[27];
-cx q[6],q[27];
-rx(6.844145006334985) q[6];
-cx q[27],q[41];
-rz(5.403056551629339) q[30];
-cx q[18],q[30];
-rx(6.844145006334985) q[18];
-rz(5.403056551629339) q[31];
-cx q[26],q[31];
-rx(6.844145006334985) q[26];
-rx(6.844145006334985) q[31];
-rz(5.403056551629339) q[32];
-cx q[21],q[32];
-cx q[21],q[38];
-cx q[32],q[35];
-rz(5.403056551629339) q[33];
-cx q[5],q[33];
-cx q[5],q[46];
-cx q[30],q[33];
-rz(5.403056551629339) q[33];
-cx q[30],q[33];
-cx q[30],q[48];
-rx(6.844145006334985) q[33];
-rz(5.403056551629339) q[35];
-cx q[32],q[35];
-rx(6.844145006334985) q[32];
-rx(6.844145006334985) q[35];
-rz(5.403056551629339) q[36];
-cx q[15],q[36];
-cx q[15],q[55];
-cx q[20],q[36];
-rz(5.403056551629339) q[36];
-cx q[20],q[36];
-cx q[20],q[43];
-rx(6.844145006334985) q[36];
-rz(5.403056551629339) q[38];
-cx q[21],q[38];
-rz(5.403056551629339) q[39];
-cx q[13],q[39];
-rx(6.844145006334985) q[39];
-rz(5.403056551629339) q[41];
-cx q[27],q[41];
-rx(6.844145006334985) q[27];
-rx(6.844145006334985) q[41];
-rz(5.403056551629339) q[43];
-cx q[20],q[43];
-rx(6.844145006334985) q[20];
-rx(6.844145006334985) q[43];
-cx q[45],q[56];
-rz(5.403056551629339) q[46];
-cx q[5],q[46];
-rx(6.844145006334985) q[5];
-cx q[38],q[46];
-rz(5.403056551629339) q[46];
-cx q[38],q[46];
-rx(6.844145006334985) q[38];
-rx(6.844145006334985) q[46];
-rz(5.403056551629339) q[47];
-cx q[4],q[47];
-cx q[4],q[49];
-cx q[17],q[47];
-rz(5.403056551629339) q[47];
-cx q[17],q[47];
-cx q[17],q[53];
-rx(6.844145006334985) q[47];
-rz(5.403056551629339) q[48];
-cx q[30],q[48];
-rx(6.844145006334985) q[30];
-rx(6.844145006334985) q[48];
-rz(5.403056551629339) q[49];
-cx q[4],q[49];
-rx(6.844145006334985) q[4];
-rx(6.844145006334985) q[49];
-rz(5.403056551629339) q[53];
-cx q[17],q[53];
-rx(6.844145006334985) q[17];
-cx q[21],q[53];
-rz(5.403056551629339) q[53];
-cx q[21],q[53];
-rx(6.844145006334985) q[21];
-rx(6.844145006334985) q[53];
-rz(5.403056551629339) q[54];
-cx q[24],q[54];
-rx(6.844145006334985) q[24];
-cx q[28],q[54];
-rz(5.403056551629339) q[54];
-cx q[28],q[54];
-rx(6.844145006334985) q[28];
-rx(6.844145006334985) q[54];
-rz(5.403056551629339) q[55];
-cx q[15],q[55];
-rx(6.844145006334985) q[15];
-rx(6.844145006334985) q[55];
-rz(3.295758784317271) q[56];
-cx q[45],q[56];
-rx(7.092769717455467) q[45];
-cx q[1],q[45];
-rz(5.403056551629339) q[45];
-cx q[1],q[45];
-rx(6.844145006334985) q[1];
-cx q[0],q[1];
-rz(4.404812047113897) q[1];
-cx q[0],q[1];
-cx q[0],q[2];
-rz(4.404812047113897) q[2];
-cx q[0],q[2];
-cx q[0],q[3];
-rx(2.671589049449633) q[2];
-rz(4.404812047113897) q[3];
-cx q[0],q[3];
-cx q[0],q[15];
-cx q[1],q[3];
-rz(4.404812047113897) q[3];
-cx q[1],q[3];
-cx q[1],q[4];
-rz(4.404812047113897) q[4];
-cx q[1],q[4];
-cx q[1],q[5];
-cx q[3],q[4];
-rz(4.404812047113897) q[4];
-cx q[3],q[4];
-cx q[4],q[6];
-rz(4.404812047113897) q[5];
-cx q[1],q[5];
-cx q[1],q[9];
-cx q[3],q[5];
-rz(4.404812047113897) q[5];
-cx q[3],q[5];
-cx q[3],q[7];
-rz(4.404812047113897) q[6];
-cx q[4],q[6];
-cx q[5],q[6];
-rz(4.404812047113897) q[6];
-cx q[5],q[6];
-rz(4.404812047113897) q[7];
-cx q[3],q[7];
-cx q[3],q[8];
-cx q[4],q[7];
-rz(4.404812047113897) q[7];
-cx q[4],q[7];
-cx q[4],q[10];
-rz(4.404812047113897) q[8];
-cx q[3],q[8];
-cx q[5],q[8];
-rz(4.404812047113897) q[8];
-cx q[5],q[8];
-cx q[5],q[11];
-rx(2.671589049449633) q[8];
-rz(4.404812047113897) q[9];
-cx q[1],q[9];
-cx q[1],q[17];
-cx q[3],q[9];
-rz(4.404812047113897) q[9];
-cx q[3],q[9];
-cx q[3],q[12];
-rz(4.404812047113897) q[10];
-cx q[4],q[10];
-cx q[6],q[10];
-rz(4.404812047113897) q[10];
-cx q[6],q[10];
-cx q[10],q[37];
-rz(4.404812047113897) q[11];
-cx q[5],q[11];
-cx q[6],q[11];
-rz(4.404812047113897) q[11];
-cx q[6],q[11];
-rx(2.671589049449633) q[11];
-rz(4.404812047113897) q[12];
-cx q[3],q[12];
-cx q[3],q[14];
-cx q[5],q[12];
-rz(4.404812047113897) q[12];
-cx q[5],q[12];
-rz(4.404812047113897) q[14];
-cx q[3],q[14];
-rz(4.404812047113897) q[15];
-cx q[0],q[15];
-cx q[3],q[15];
-rz(4.404812047113897) q[15];
-cx q[3],q[15];
-cx q[16],q[45];
-rz(4.404812047113897) q[17];
-cx q[1],q[17];
-cx q[1],q[28];
-rz(4.404812047113897) q[28];
-cx q[1],q[28];
-cx q[1],q[29];
-rz(4.404812047113897) q[29];
-cx q[1],q[29];
-rz(4.404812047113897) q[37];
-cx q[10],q[37];
-cx q[10],q[41];
-rz(4.404812047113897) q[41];
-cx q[10],q[41];
-rz(5.403056551629339) q[45];
-cx q[16],q[45];
-rx(6.844145006334985) q[16];
-cx q[0],q[16];
-rz(4.404812047113897) q[16];
-cx q[0],q[16];
-cx q[0],q[20];
-cx q[3],q[16];
-rz(4.404812047113897) q[16];
-cx q[3],q[16];
-cx q[3],q[17];
-rz(4.404812047113897) q[17];
-cx q[3],q[17];
-cx q[3],q[18];
-rz(4.404812047113897) q[18];
-cx q[3],q[18];
-cx q[3],q[19];
-rz(4.404812047113897) q[19];
-cx q[3],q[19];
-cx q[3],q[22];
-cx q[7],q[19];
-rz(4.404812047113897) q[19];
-cx q[7],q[19];
-rx(2.671589049449633) q[7];
-cx q[19],q[38];
-rz(4.404812047113897) q[20];
-cx q[0],q[20];
-cx q[0],q[32];
-cx q[15],q[20];
-rz(4.404812047113897) q[20];
-cx q[15],q[20];
-rz(4.404812047113897) q[22];
-cx q[3],q[22];
-cx q[3],q[23];
-cx q[9],q[22];
-rz(4.404812047113897) q[22];
-cx q[9],q[22];
-cx q[9],q[55];
-rx(2.671589049449633) q[22];
-rz(4.404812047113897) q[23];
-cx q[3],q[23];
-cx q[3],q[24];
-cx q[17],q[23];
-rz(4.404812047113897) q[23];
-cx q[17],q[23];
-rz(4.404812047113897) q[24];
-cx q[3],q[24];
-cx q[3],q[25];
-rz(4.404812047113897) q[25];
-cx q[3],q[25];
-cx q[3],q[26];
-cx q[12],q[25];
-rz(4.404812047113897) q[25];
-cx q[12],q[25];
-cx q[12],q[31];
-rx(2.671589049449633) q[25];
-rz(4.404812047113897) q[26];
-cx q[3],q[26];
-cx q[3],q[28];
-rz(4.404812047113897) q[28];
-cx q[3],q[28];
-cx q[3],q[29];
-rz(4.404812047113897) q[29];
-cx q[3],q[29];
-cx q[3],q[30];
-rx(2.671589049449633) q[29];
-rz(4.404812047113897) q[30];
-cx q[3],q[30];
-cx q[3],q[34];
-rz(4.404812047113897) q[31];
-cx q[12],q[31];
-rz(4.404812047113897) q[32];
-cx q[0],q[32];
-cx q[0],q[42];
-rz(4.404812047113897) q[34];
-cx q[3],q[34];
-cx q[3],q[35];
-cx q[12],q[34];
-rz(4.404812047113897) q[34];
-cx q[12],q[34];
-cx q[34],q[37];
-rz(4.404812047113897) q[35];
-cx q[3],q[35];
-cx q[3],q[39];
-rz(4.404812047113897) q[37];
-cx q[34],q[37];
-rx(2.671589049449633) q[34];
-rx(2.671589049449633) q[37];
-rz(4.404812047113897) q[38];
-cx q[19],q[38];
-rx(2.671589049449633) q[19];
-rz(4.404812047113897) q[39];
-cx q[3],q[39];
-cx q[3],q[40];
-rz(4.404812047113897) q[40];
-cx q[3],q[40];
-cx q[23],q[40];
-rz(4.404812047113897) q[40];
-cx q[23],q[40];
-rx(2.671589049449633) q[23];
-rx(2.671589049449633) q[40];
-rz(4.404812047113897) q[42];
-cx q[0],q[42];
-cx q[0],q[48];
-cx q[3],q[42];
-rz(4.404812047113897) q[42];
-cx q[3],q[42];
-cx q[3],q[43];
-rx(2.671589049449633) q[42];
-rz(4.404812047113897) q[43];
-cx q[3],q[43];
-cx q[3],q[44];
-rz(4.404812047113897) q[44];
-cx q[3],q[44];
-cx q[3],q[49];
-cx q[12],q[44];
-rz(4.404812047113897) q[44];
-cx q[12],q[44];
-rx(2.671589049449633) q[44];
-rz(4.404812047113897) q[48];
-cx q[0],q[48];
-cx q[0],q[51];
-rz(4.404812047113897) q[49];
-cx q[3],q[49];
-cx q[3],q[50];
-rz(4.404812047113897) q[50];
-cx q[3],q[50];
-cx q[3],q[52];
-cx q[12],q[50];
-rz(4.404812047113897) q[50];
-cx q[12],q[50];
-rx(2.671589049449633) q[12];
-rx(2.671589049449633) q[50];
-rz(4.404812047113897) q[51];
-cx q[0],q[51];
-rx(2.671589049449633) q[0];
-cx q[28],q[51];
-rz(4.404812047113897) q[51];
-cx q[28],q[51];
-rx(2.671589049449633) q[51];
-rz(4.404812047113897) q[52];
-cx q[3],q[52];
-rx(2.671589049449633) q[3];
-cx q[10],q[52];
-rz(4.404812047113897) q[52];
-cx q[10],q[52];
-rx(2.671589049449633) q[10];
-rx(2.671589049449633) q[52];
-rz(4.404812047113897) q[55];
-cx q[9],q[55];
-rx(2.671589049449633) q[9];
-rx(7.092769717455467) q[56];
-cx q[13],q[56];
-rz(5.403056551629339) q[56];
-cx q[13],q[56];
-rx(6.844145006334985) q[13];
-cx q[4],q[13];
-rz(4.404812047113897) q[13];
-cx q[4],q[13];
-cx q[4],q[14];
-cx q[5],q[13];
-rz(4.404812047113897) q[13];
-cx q[5],q[13];
-cx q[5],q[24];
-cx q[13],q[39];
-rz(4.404812047113897) q[14];
-cx q[4],q[14];
-cx q[4],q[18];
-rx(2.671589049449633) q[14];
-rz(4.404812047113897) q[18];
-cx q[4],q[18];
-cx q[4],q[21];
-cx q[18],q[30];
-rz(4.404812047113897) q[21];
-cx q[4],q[21];
-cx q[4],q[27];
-cx q[15],q[21];
-rz(4.404812047113897) q[21];
-cx q[15],q[21];
-cx q[15],q[36];
-cx q[21],q[26];
-rz(4.404812047113897) q[24];
-cx q[5],q[24];
-cx q[5],q[33];
-cx q[24],q[54];
-rz(4.404812047113897) q[26];
-cx q[21],q[26];
-cx q[21],q[32];
-cx q[26],q[31];
-rz(4.404812047113897) q[27];
-cx q[4],q[27];
-cx q[4],q[47];
-cx q[6],q[27];
-rz(4.404812047113897) q[27];
-cx q[6],q[27];
-rx(2.671589049449633) q[6];
-cx q[27],q[41];
-rz(4.404812047113897) q[30];
-cx q[18],q[30];
-rx(2.671589049449633) q[18];
-rz(4.404812047113897) q[31];
-cx q[26],q[31];
-rx(2.671589049449633) q[26];
-rx(2.671589049449633) q[31];
-rz(4.404812047113897) q[32];
-cx q[21],q[32];
-cx q[21],q[38];
-cx q[32],q[35];
-rz(4.404812047113897) q[33];
-cx q[5],q[33];
-cx q[5],q[46];
-cx q[30],q[33];
-rz(4.404812047113897) q[33];
-cx q[30],q[33];
-cx q[30],q[48];
-rx(2.671589049449633) q[33];
-rz(4.404812047113897) q[35];
-cx q[32],q[35];
-rx(2.671589049449633) q[32];
-rx(2.671589049449633) q[35];
-rz(4.404812047113897) q[36];
-cx q[15],q[36];
-cx q[15],q[55];
-cx q[20],q[36];
-rz(4.404812047113897) q[36];
-cx q[20],q[36];
-cx q[20],q[43];
-rx(2.671589049449633) q[36];
-rz(4.404812047113897) q[38];
-cx q[21],q[38];
-rz(4.404812047113897) q[39];
-cx q[13],q[39];
-rx(2.671589049449633) q[39];
-rz(4.404812047113897) q[41];
-cx q[27],q[41];
-rx(2.671589049449633) q[27];
-rx(2.671589049449633) q[41];
-rz(4.404812047113897) q[43];
-cx q[20],q[43];
-rx(2.671589049449633) q[20];
-rx(2.671589049449633) q[43];
-cx q[45],q[56];
-rz(4.404812047113897) q[46];
-cx q[5],q[46];
-rx(2.671589049449633) q[5];
-cx q[38],q[46];
-rz(4.404812047113897) q[46];
-cx q[38],q[46];
-rx(2.671589049449633) q[38];
-rx(2.671589049449633) q[46];
-rz(4.404812047113897) q[47];
-cx q[4],q[47];
-cx q[4],q[49];
-cx q[17],q[47];
-rz(4.404812047113897) q[47];
-cx q[17],q[47];
-cx q[17],q[53];
-rx(2.671589049449633) q[47];
-rz(4.404812047113897) q[48];
-cx q[30],q[48];
-rx(2.671589049449633) q[30];
-rx(2.671589049449633) q[48];
-rz(4.404812047113897) q[49];
-cx q[4],q[49];
-rx(2.671589049449633) q[4];
-rx(2.671589049449633) q[49];
-rz(4.404812047113897) q[53];
-cx q[17],q[53];
-rx(2.671589049449633) q[17];
-cx q[21],q[53];
-rz(4.404812047113897) q[53];
-cx q[21],q[53];
-rx(2.671589049449633) q[21];
-rx(2.671589049449633) q[53];
-rz(4.404812047113897) q[54];
-cx q[24],q[54];
-rx(2.671589049449633) q[24];
-cx q[28],q[54];
-rz(4.404812047113897) q[54];
-cx q[28],q[54];
-rx(2.671589049449633) q[28];
-rx(2.671589049449633) q[54];
-rz(4.404812047113897) q[55];
-cx q[15],q[55];
-rx(2.671589049449633) q[15];
-rx(2.671589049449633) q[55];
-rz(5.403056551629339) q[56];
-cx q[45],q[56];
-rx(6.844145006334985) q[45];
-cx q[1],q[45];
-rz(4.404812047113897) q[45];
-cx q[1],q[45];
-rx(2.671589049449633) q[1];
-cx q[16],q[45];
-rz(4.404812047113897) q[45];
-cx q[16],q[45];
-rx(2.671589049449633) q[16];
-rx(6.844145006334985) q[56];
-cx q[13],q[56];
-rz(4.404812047113897) q[56];
-cx q[13],q[56];
-rx(2.671589049449633) q[13];
-cx q[45],q[56];
-rz(4.404812047113897) q[56];
-cx q[45],q[56];
-rx(2.671589049449633) q[45];
-rx(2.671589049449633) q[56];
\ No newline at end of file
@@ -1,1301 +0,0 @@
-OPENQASM 2.0;
-include "qelib1.inc";
-qreg q[58];
-ry(pi/2) q[0];
-rx(pi) q[0];
-ry(pi/2) q[1];
-rx(pi) q[1];
-cx q[0],q[1];
-rz(1.156027940075795) q[1];
-cx q[0],q[1];
-ry(pi/2) q[2];
-rx(pi) q[2];
-cx q[0],q[2];
-rz(1.156027940075795) q[2];
-cx q[0],q[2];
-rx(8.088423157063545) q[2];
-ry(pi/2) q[3];
-rx(pi) q[3];
-cx q[0],q[3];
-rz(1.156027940075795) q[3];
-cx q[0],q[3];
-cx q[1],q[3];
-rz(1.156027940075795) q[3];
-cx q[1],q[3];
-ry(pi/2) q[4];
-rx(pi) q[4];
-cx q[1],q[4];
-rz(1.156027940075795) q[4];
-cx q[1],q[4];
-cx q[3],q[4];
-rz(1.156027940075795) q[4];
-cx q[3],q[4];
-ry(pi/2) q[5];
-rx(pi) q[5];
-cx q[1],q[5];
-rz(1.156027940075795) q[5];
-cx q[1],q[5];
-cx q[3],q[5];
-rz(1.156027940075795) q[5];
-cx q[3],q[5];
-ry(pi/2) q[6];
-rx(pi) q[6];
-cx q[4],q[6];
-rz(1.156027940075795) q[6];
-cx q[4],q[6];
-cx q[5],q[6];
-rz(1.156027940075795) q[6];
-cx q[5],q[6];
-ry(pi/2) q[7];
-rx(pi) q[7];
-cx q[3],q[7];
-rz(1.156027940075795) q[7];
-cx q[3],q[7];
-cx q[4],q[7];
-rz(1.156027940075795) q[7];
-cx q[4],q[7];
-ry(pi/2) q[8];
-rx(pi) q[8];
-cx q[3],q[8];
-rz(1.156027940075795) q[8];
-cx q[3],q[8];
-cx q[5],q[8];
-rz(1.156027940075795) q[8];
-cx q[5],q[8];
-rx(8.088423157063545) q[8];
-ry(pi/2) q[9];
-rx(pi) q[9];
-cx q[1],q[9];
-rz(1.156027940075795) q[9];
-cx q[1],q[9];
-cx q[3],q[9];
-rz(1.156027940075795) q[9];
-cx q[3],q[9];
-ry(pi/2) q[10];
-rx(pi) q[10];
-cx q[4],q[10];
-rz(1.156027940075795) q[10];
-cx q[4],q[10];
-cx q[6],q[10];
-rz(1.156027940075795) q[10];
-cx q[6],q[10];
-ry(pi/2) q[11];
-rx(pi) q[11];
-cx q[5],q[11];
-rz(1.156027940075795) q[11];
-cx q[5],q[11];
-cx q[6],q[11];
-rz(1.156027940075795) q[11];
-cx q[6],q[11];
-rx(8.088423157063545) q[11];
-ry(pi/2) q[12];
-rx(pi) q[12];
-cx q[3],q[12];
-rz(1.156027940075795) q[12];
-cx q[3],q[12];
-cx q[5],q[12];
-rz(1.156027940075795) q[12];
-cx q[5],q[12];
-ry(pi/2) q[13];
-rx(pi) q[13];
-cx q[4],q[13];
-rz(1.156027940075795) q[13];
-cx q[4],q[13];
-cx q[5],q[13];
-rz(1.156027940075795) q[13];
-cx q[5],q[13];
-ry(pi/2) q[14];
-rx(pi) q[14];
-cx q[3],q[14];
-rz(1.156027940075795) q[14];
-cx q[3],q[14];
-cx q[4],q[14];
-rz(1.156027940075795) q[14];
-cx q[4],q[14];
-rx(8.088423157063545) q[14];
-ry(pi/2) q[15];
-rx(pi) q[15];
-cx q[0],q[15];
-rz(1.156027940075795) q[15];
-cx q[0],q[15];
-cx q[3],q[15];
-rz(1.156027940075795) q[15];
-cx q[3],q[15];
-ry(pi/2) q[16];
-rx(pi) q[16];
-cx q[0],q[16];
-rz(1.156027940075795) q[16];
-cx q[0],q[16];
-cx q[3],q[16];
-rz(1.156027940075795) q[16];
-cx q[3],q[16];
-ry(pi/2) q[17];
-rx(pi) q[17];
-cx q[1],q[17];
-rz(1.156027940075795) q[17];
-cx q[1],q[17];
-cx q[3],q[17];
-rz(1.156027940075795) q[17];
-cx q[3],q[17];
-ry(pi/2) q[18];
-rx(pi) q[18];
-cx q[3],q[18];
-rz(1.156027940075795) q[18];
-cx q[3],q[18];
-cx q[4],q[18];
-rz(1.156027940075795) q[18];
-cx q[4],q[18];
-ry(pi/2) q[19];
-rx(pi) q[19];
-cx q[3],q[19];
-rz(1.156027940075795) q[19];
-cx q[3],q[19];
-cx q[7],q[19];
-rz(1.156027940075795) q[19];
-cx q[7],q[19];
-rx(8.088423157063545) q[7];
-ry(pi/2) q[20];
-rx(pi) q[20];
-cx q[0],q[20];
-rz(1.156027940075795) q[20];
-cx q[0],q[20];
-cx q[15],q[20];
-rz(1.156027940075795) q[20];
-cx q[15],q[20];
-ry(pi/2) q[21];
-rx(pi) q[21];
-cx q[4],q[21];
-rz(1.156027940075795) q[21];
-cx q[4],q[21];
-cx q[15],q[21];
-rz(1.156027940075795) q[21];
-cx q[15],q[21];
-ry(pi/2) q[22];
-rx(pi) q[22];
-cx q[3],q[22];
-rz(1.156027940075795) q[22];
-cx q[3],q[22];
-cx q[9],q[22];
-rz(1.156027940075795) q[22];
-cx q[9],q[22];
-rx(8.088423157063545) q[22];
-ry(pi/2) q[23];
-rx(pi) q[23];
-cx q[3],q[23];
-rz(1.156027940075795) q[23];
-cx q[3],q[23];
-cx q[17],q[23];
-rz(1.156027940075795) q[23];
-cx q[17],q[23];
-ry(pi/2) q[24];
-rx(pi) q[24];
-cx q[3],q[24];
-rz(1.156027940075795) q[24];
-cx q[3],q[24];
-cx q[5],q[24];
-rz(1.156027940075795) q[24];
-cx q[5],q[24];
-ry(pi/2) q[25];
-rx(pi) q[25];
-cx q[3],q[25];
-rz(1.156027940075795) q[25];
-cx q[3],q[25];
-cx q[12],q[25];
-rz(1.156027940075795) q[25];
-cx q[12],q[25];
-rx(8.088423157063545) q[25];
-ry(pi/2) q[26];
-rx(pi) q[26];
-cx q[3],q[26];
-rz(1.156027940075795) q[26];
-cx q[3],q[26];
-cx q[21],q[26];
-rz(1.156027940075795) q[26];
-cx q[21],q[26];
-ry(pi/2) q[27];
-rx(pi) q[27];
-cx q[4],q[27];
-rz(1.156027940075795) q[27];
-cx q[4],q[27];
-cx q[6],q[27];
-rz(1.156027940075795) q[27];
-cx q[6],q[27];
-rx(8.088423157063545) q[6];
-ry(pi/2) q[28];
-rx(pi) q[28];
-cx q[1],q[28];
-rz(1.156027940075795) q[28];
-cx q[1],q[28];
-cx q[3],q[28];
-rz(1.156027940075795) q[28];
-cx q[3],q[28];
-ry(pi/2) q[29];
-rx(pi) q[29];
-cx q[1],q[29];
-rz(1.156027940075795) q[29];
-cx q[1],q[29];
-cx q[3],q[29];
-rz(1.156027940075795) q[29];
-cx q[3],q[29];
-rx(8.088423157063545) q[29];
-ry(pi/2) q[30];
-rx(pi) q[30];
-cx q[3],q[30];
-rz(1.156027940075795) q[30];
-cx q[3],q[30];
-cx q[18],q[30];
-rz(1.156027940075795) q[30];
-cx q[18],q[30];
-rx(8.088423157063545) q[18];
-ry(pi/2) q[31];
-rx(pi) q[31];
-cx q[12],q[31];
-rz(1.156027940075795) q[31];
-cx q[12],q[31];
-cx q[26],q[31];
-rz(1.156027940075795) q[31];
-cx q[26],q[31];
-rx(8.088423157063545) q[26];
-rx(8.088423157063545) q[31];
-ry(pi/2) q[32];
-rx(pi) q[32];
-cx q[0],q[32];
-rz(1.156027940075795) q[32];
-cx q[0],q[32];
-cx q[21],q[32];
-rz(1.156027940075795) q[32];
-cx q[21],q[32];
-ry(pi/2) q[33];
-rx(pi) q[33];
-cx q[5],q[33];
-rz(1.156027940075795) q[33];
-cx q[5],q[33];
-cx q[30],q[33];
-rz(1.156027940075795) q[33];
-cx q[30],q[33];
-rx(8.088423157063545) q[33];
-ry(pi/2) q[34];
-rx(pi) q[34];
-cx q[3],q[34];
-rz(1.156027940075795) q[34];
-cx q[3],q[34];
-cx q[12],q[34];
-rz(1.156027940075795) q[34];
-cx q[12],q[34];
-ry(pi/2) q[35];
-rx(pi) q[35];
-cx q[3],q[35];
-rz(1.156027940075795) q[35];
-cx q[3],q[35];
-cx q[32],q[35];
-rz(1.156027940075795) q[35];
-cx q[32],q[35];
-rx(8.088423157063545) q[32];
-rx(8.088423157063545) q[35];
-ry(pi/2) q[36];
-rx(pi) q[36];
-cx q[15],q[36];
-rz(1.156027940075795) q[36];
-cx q[15],q[36];
-cx q[20],q[36];
-rz(1.156027940075795) q[36];
-cx q[20],q[36];
-rx(8.088423157063545) q[36];
-ry(pi/2) q[37];
-rx(pi) q[37];
-cx q[10],q[37];
-rz(1.156027940075795) q[37];
-cx q[10],q[37];
-cx q[34],q[37];
-rz(1.156027940075795) q[37];
-cx q[34],q[37];
-rx(8.088423157063545) q[34];
-rx(8.088423157063545) q[37];
-ry(pi/2) q[38];
-rx(pi) q[38];
-cx q[19],q[38];
-rz(1.156027940075795) q[38];
-cx q[19],q[38];
-rx(8.088423157063545) q[19];
-cx q[21],q[38];
-rz(1.156027940075795) q[38];
-cx q[21],q[38];
-ry(pi/2) q[39];
-rx(pi) q[39];
-cx q[3],q[39];
-rz(1.156027940075795) q[39];
-cx q[3],q[39];
-cx q[13],q[39];
-rz(1.156027940075795) q[39];
-cx q[13],q[39];
-rx(8.088423157063545) q[39];
-ry(pi/2) q[40];
-rx(pi) q[40];
-cx q[3],q[40];
-rz(1.156027940075795) q[40];
-cx q[3],q[40];
-cx q[23],q[40];
-rz(1.156027940075795) q[40];
-cx q[23],q[40];
-rx(8.088423157063545) q[23];
-rx(8.088423157063545) q[40];
-ry(pi/2) q[41];
-rx(pi) q[41];
-cx q[10],q[41];
-rz(1.156027940075795) q[41];
-cx q[10],q[41];
-cx q[27],q[41];
-rz(1.156027940075795) q[41];
-cx q[27],q[41];
-rx(8.088423157063545) q[27];
-rx(8.088423157063545) q[41];
-ry(pi/2) q[42];
-rx(pi) q[42];
-cx q[0],q[42];
-rz(1.156027940075795) q[42];
-cx q[0],q[42];
-cx q[3],q[42];
-rz(1.156027940075795) q[42];
-cx q[3],q[42];
-rx(8.088423157063545) q[42];
-ry(pi/2) q[43];
-rx(pi) q[43];
-cx q[3],q[43];
-rz(1.156027940075795) q[43];
-cx q[3],q[43];
-cx q[20],q[43];
-rz(1.156027940075795) q[43];
-cx q[20],q[43];
-rx(8.088423157063545) q[20];
-rx(8.088423157063545) q[43];
-ry(pi/2) q[44];
-rx(pi) q[44];
-cx q[3],q[44];
-rz(1.156027940075795) q[44];
-cx q[3],q[44];
-cx q[12],q[44];
-rz(1.156027940075795) q[44];
-cx q[12],q[44];
-rx(8.088423157063545) q[44];
-ry(pi/2) q[45];
-rx(pi) q[45];
-cx q[1],q[45];
-rz(1.156027940075795) q[45];
-cx q[1],q[45];
-cx q[16],q[45];
-rz(1.156027940075795) q[45];
-cx q[16],q[45];
-rx(8.088423157063545) q[16];
-ry(pi/2) q[46];
-rx(pi) q[46];
-cx q[5],q[46];
-rz(1.156027940075795) q[46];
-cx q[5],q[46];
-rx(8.088423157063545) q[5];
-cx q[38],q[46];
-rz(1.156027940075795) q[46];
-cx q[38],q[46];
-rx(8.088423157063545) q[38];
-rx(8.088423157063545) q[46];
-ry(pi/2) q[47];
-rx(pi) q[47];
-cx q[4],q[47];
-rz(1.156027940075795) q[47];
-cx q[4],q[47];
-cx q[17],q[47];
-rz(1.156027940075795) q[47];
-cx q[17],q[47];
-rx(8.088423157063545) q[47];
-ry(pi/2) q[48];
-rx(pi) q[48];
-cx q[0],q[48];
-rz(1.156027940075795) q[48];
-cx q[0],q[48];
-cx q[30],q[48];
-rz(1.156027940075795) q[48];
-cx q[30],q[48];
-rx(8.088423157063545) q[30];
-rx(8.088423157063545) q[48];
-ry(pi/2) q[49];
-rx(pi) q[49];
-cx q[3],q[49];
-rz(1.156027940075795) q[49];
-cx q[3],q[49];
-cx q[4],q[49];
-rz(1.156027940075795) q[49];
-cx q[4],q[49];
-rx(8.088423157063545) q[4];
-rx(8.088423157063545) q[49];
-ry(pi/2) q[50];
-rx(pi) q[50];
-cx q[3],q[50];
-rz(1.156027940075795) q[50];
-cx q[3],q[50];
-cx q[12],q[50];
-rz(1.156027940075795) q[50];
-cx q[12],q[50];
-rx(8.088423157063545) q[12];
-rx(8.088423157063545) q[50];
-ry(pi/2) q[51];
-rx(pi) q[51];
-cx q[0],q[51];
-rz(1.156027940075795) q[51];
-cx q[0],q[51];
-rx(8.088423157063545) q[0];
-cx q[28],q[51];
-rz(1.156027940075795) q[51];
-cx q[28],q[51];
-rx(8.088423157063545) q[51];
-ry(pi/2) q[52];
-rx(pi) q[52];
-cx q[3],q[52];
-rz(1.156027940075795) q[52];
-cx q[3],q[52];
-cx q[10],q[52];
-rz(1.156027940075795) q[52];
-cx q[10],q[52];
-rx(8.088423157063545) q[10];
-rx(8.088423157063545) q[52];
-ry(pi/2) q[53];
-rx(pi) q[53];
-cx q[17],q[53];
-rz(1.156027940075795) q[53];
-cx q[17],q[53];
-rx(8.088423157063545) q[17];
-cx q[21],q[53];
-rz(1.156027940075795) q[53];
-cx q[21],q[53];
-rx(8.088423157063545) q[21];
-rx(8.088423157063545) q[53];
-ry(pi/2) q[54];
-rx(pi) q[54];
-cx q[24],q[54];
-rz(1.156027940075795) q[54];
-cx q[24],q[54];
-rx(8.088423157063545) q[24];
-cx q[28],q[54];
-rz(1.156027940075795) q[54];
-cx q[28],q[54];
-rx(8.088423157063545) q[28];
-rx(8.088423157063545) q[54];
-ry(pi/2) q[55];
-rx(pi) q[55];
-cx q[9],q[55];
-rz(1.156027940075795) q[55];
-cx q[9],q[55];
-rx(8.088423157063545) q[9];
-cx q[15],q[55];
-rz(1.156027940075795) q[55];
-cx q[15],q[55];
-rx(8.088423157063545) q[15];
-rx(8.088423157063545) q[55];
-ry(pi/2) q[56];
-rx(pi) q[56];
-cx q[13],q[56];
-rz(1.156027940075795) q[56];
-cx q[13],q[56];
-rx(8.088423157063545) q[13];
-cx q[45],q[56];
-rz(1.156027940075795) q[56];
-cx q[45],q[56];
-rx(8.088423157063545) q[45];
-rx(8.088423157063545) q[56];
-ry(pi/2) q[57];
-rx(pi) q[57];
-cx q[1],q[57];
-rz(1.156027940075795) q[57];
-cx q[1],q[57];
-rx(8.088423157063545) q[1];
-cx q[0],q[1];
-rz(1.0987095403625382) q[1];
-cx q[0],q[1];
-cx q[0],q[2];
-rz(1.0987095403625382) q[2];
-cx q[0],q[2];
-rx(1.1062699733894783) q[2];
-cx q[3],q[57];
-rz(1.156027940075795) q[57];
-cx q[3],q[57];
-rx(8.088423157063545) q[3];
-cx q[0],q[3];
-rz(1.0987095403625382) q[3];
-cx q[0],q[3];
-cx q[0],q[15];
-cx q[1],q[3];
-rz(1.0987095403625382) q[3];
-cx q[1],q[3];
-cx q[1],q[4];
-rz(1.0987095403625382) q[4];
-cx q[1],q[4];
-cx q[1],q[5];
-cx q[3],q[4];
-rz(1.0987095403625382) q[4];
-cx q[3],q[4];
-cx q[4],q[6];
-rz(1.0987095403625382) q[5];
-cx q[1],q[5];
-cx q[1],q[9];
-cx q[3],q[5];
-rz(1.0987095403625382) q[5];
-cx q[3],q[5];
-cx q[3],q[7];
-rz(1.0987095403625382) q[6];
-cx q[4],q[6];
-cx q[5],q[6];
-rz(1.0987095403625382) q[6];
-cx q[5],q[6];
-rz(1.0987095403625382) q[7];
-cx q[3],q[7];
-cx q[3],q[8];
-cx q[4],q[7];
-rz(1.0987095403625382) q[7];
-cx q[4],q[7];
-cx q[4],q[10];
-rz(1.0987095403625382) q[8];
-cx q[3],q[8];
-cx q[5],q[8];
-rz(1.0987095403625382) q[8];
-cx q[5],q[8];
-cx q[5],q[11];
-rx(1.1062699733894783) q[8];
-rz(1.0987095403625382) q[9];
-cx q[1],q[9];
-cx q[1],q[17];
-cx q[3],q[9];
-rz(1.0987095403625382) q[9];
-cx q[3],q[9];
-cx q[3],q[12];
-rz(1.0987095403625382) q[10];
-cx q[4],q[10];
-cx q[4],q[13];
-cx q[6],q[10];
-rz(1.0987095403625382) q[10];
-cx q[6],q[10];
-cx q[10],q[37];
-rz(1.0987095403625382) q[11];
-cx q[5],q[11];
-cx q[6],q[11];
-rz(1.0987095403625382) q[11];
-cx q[6],q[11];
-rx(1.1062699733894783) q[11];
-rz(1.0987095403625382) q[12];
-cx q[3],q[12];
-cx q[3],q[14];
-cx q[5],q[12];
-rz(1.0987095403625382) q[12];
-cx q[5],q[12];
-rz(1.0987095403625382) q[13];
-cx q[4],q[13];
-cx q[5],q[13];
-rz(1.0987095403625382) q[13];
-cx q[5],q[13];
-rz(1.0987095403625382) q[14];
-cx q[3],q[14];
-cx q[4],q[14];
-rz(1.0987095403625382) q[14];
-cx q[4],q[14];
-rx(1.1062699733894783) q[14];
-rz(1.0987095403625382) q[15];
-cx q[0],q[15];
-cx q[0],q[16];
-cx q[3],q[15];
-rz(1.0987095403625382) q[15];
-cx q[3],q[15];
-rz(1.0987095403625382) q[16];
-cx q[0],q[16];
-cx q[0],q[20];
-cx q[3],q[16];
-rz(1.0987095403625382) q[16];
-cx q[3],q[16];
-rz(1.0987095403625382) q[17];
-cx q[1],q[17];
-cx q[1],q[28];
-cx q[3],q[17];
-rz(1.0987095403625382) q[17];
-cx q[3],q[17];
-cx q[3],q[18];
-rz(1.0987095403625382) q[18];
-cx q[3],q[18];
-cx q[3],q[19];
-cx q[4],q[18];
-rz(1.0987095403625382) q[18];
-cx q[4],q[18];
-cx q[4],q[21];
-rz(1.0987095403625382) q[19];
-cx q[3],q[19];
-cx q[3],q[22];
-cx q[7],q[19];
-rz(1.0987095403625382) q[19];
-cx q[7],q[19];
-rx(1.1062699733894783) q[7];
-cx q[19],q[38];
-rz(1.0987095403625382) q[20];
-cx q[0],q[20];
-cx q[0],q[32];
-cx q[15],q[20];
-rz(1.0987095403625382) q[20];
-cx q[15],q[20];
-rz(1.0987095403625382) q[21];
-cx q[4],q[21];
-cx q[4],q[27];
-cx q[15],q[21];
-rz(1.0987095403625382) q[21];
-cx q[15],q[21];
-cx q[15],q[36];
-rz(1.0987095403625382) q[22];
-cx q[3],q[22];
-cx q[3],q[23];
-cx q[9],q[22];
-rz(1.0987095403625382) q[22];
-cx q[9],q[22];
-cx q[9],q[55];
-rx(1.1062699733894783) q[22];
-rz(1.0987095403625382) q[23];
-cx q[3],q[23];
-cx q[3],q[24];
-cx q[17],q[23];
-rz(1.0987095403625382) q[23];
-cx q[17],q[23];
-rz(1.0987095403625382) q[24];
-cx q[3],q[24];
-cx q[3],q[25];
-cx q[5],q[24];
-rz(1.0987095403625382) q[24];
-cx q[5],q[24];
-cx q[5],q[33];
-cx q[24],q[54];
-rz(1.0987095403625382) q[25];
-cx q[3],q[25];
-cx q[3],q[26];
-cx q[12],q[25];
-rz(1.0987095403625382) q[25];
-cx q[12],q[25];
-cx q[12],q[31];
-rx(1.1062699733894783) q[25];
-rz(1.0987095403625382) q[26];
-cx q[3],q[26];
-cx q[21],q[26];
-rz(1.0987095403625382) q[26];
-cx q[21],q[26];
-rz(1.0987095403625382) q[27];
-cx q[4],q[27];
-cx q[4],q[47];
-cx q[6],q[27];
-rz(1.0987095403625382) q[27];
-cx q[6],q[27];
-rx(1.1062699733894783) q[6];
-rz(1.0987095403625382) q[28];
-cx q[1],q[28];
-cx q[1],q[29];
-cx q[3],q[28];
-rz(1.0987095403625382) q[28];
-cx q[3],q[28];
-rz(1.0987095403625382) q[29];
-cx q[1],q[29];
-cx q[1],q[45];
-cx q[3],q[29];
-rz(1.0987095403625382) q[29];
-cx q[3],q[29];
-cx q[3],q[30];
-rx(1.1062699733894783) q[29];
-rz(1.0987095403625382) q[30];
-cx q[3],q[30];
-cx q[3],q[34];
-cx q[18],q[30];
-rz(1.0987095403625382) q[30];
-cx q[18],q[30];
-rx(1.1062699733894783) q[18];
-rz(1.0987095403625382) q[31];
-cx q[12],q[31];
-cx q[26],q[31];
-rz(1.0987095403625382) q[31];
-cx q[26],q[31];
-rx(1.1062699733894783) q[26];
-rx(1.1062699733894783) q[31];
-rz(1.0987095403625382) q[32];
-cx q[0],q[32];
-cx q[0],q[42];
-cx q[21],q[32];
-rz(1.0987095403625382) q[32];
-cx q[21],q[32];
-rz(1.0987095403625382) q[33];
-cx q[5],q[33];
-cx q[5],q[46];
-cx q[30],q[33];
-rz(1.0987095403625382) q[33];
-cx q[30],q[33];
-rx(1.1062699733894783) q[33];
-rz(1.0987095403625382) q[34];
-cx q[3],q[34];
-cx q[3],q[35];
-cx q[12],q[34];
-rz(1.0987095403625382) q[34];
-cx q[12],q[34];
-rz(1.0987095403625382) q[35];
-cx q[3],q[35];
-cx q[3],q[39];
-cx q[32],q[35];
-rz(1.0987095403625382) q[35];
-cx q[32],q[35];
-rx(1.1062699733894783) q[32];
-rx(1.1062699733894783) q[35];
-rz(1.0987095403625382) q[36];
-cx q[15],q[36];
-cx q[20],q[36];
-rz(1.0987095403625382) q[36];
-cx q[20],q[36];
-rx(1.1062699733894783) q[36];
-rz(1.0987095403625382) q[37];
-cx q[10],q[37];
-cx q[10],q[41];
-cx q[34],q[37];
-rz(1.0987095403625382) q[37];
-cx q[34],q[37];
-rx(1.1062699733894783) q[34];
-rx(1.1062699733894783) q[37];
-rz(1.0987095403625382) q[38];
-cx q[19],q[38];
-rx(1.1062699733894783) q[19];
-cx q[21],q[38];
-rz(1.0987095403625382) q[38];
-cx q[21],q[38];
-rz(1.0987095403625382) q[39];
-cx q[3],q[39];
-cx q[3],q[40];
-cx q[13],q[39];
-rz(1.0987095403625382) q[39];
-cx q[13],q[39];
-cx q[13],q[56];
-rx(1.1062699733894783) q[39];
-rz(1.0987095403625382) q[40];
-cx q[3],q[40];
-cx q[23],q[40];
-rz(1.0987095403625382) q[40];
-cx q[23],q[40];
-rx(1.1062699733894783) q[23];
-rx(1.1062699733894783) q[40];
-rz(1.0987095403625382) q[41];
-cx q[10],q[41];
-cx q[27],q[41];
-rz(1.0987095403625382) q[41];
-cx q[27],q[41];
-rx(1.1062699733894783) q[27];
-rx(1.1062699733894783) q[41];
-rz(1.0987095403625382) q[42];
-cx q[0],q[42];
-cx q[0],q[48];
-cx q[3],q[42];
-rz(1.0987095403625382) q[42];
-cx q[3],q[42];
-cx q[3],q[43];
-rx(1.1062699733894783) q[42];
-rz(1.0987095403625382) q[43];
-cx q[3],q[43];
-cx q[3],q[44];
-cx q[20],q[43];
-rz(1.0987095403625382) q[43];
-cx q[20],q[43];
-rx(1.1062699733894783) q[20];
-rx(1.1062699733894783) q[43];
-rz(1.0987095403625382) q[44];
-cx q[3],q[44];
-cx q[3],q[49];
-cx q[12],q[44];
-rz(1.0987095403625382) q[44];
-cx q[12],q[44];
-rx(1.1062699733894783) q[44];
-rz(1.0987095403625382) q[45];
-cx q[1],q[45];
-cx q[16],q[45];
-rz(1.0987095403625382) q[45];
-cx q[16],q[45];
-rx(1.1062699733894783) q[16];
-rz(1.0987095403625382) q[46];
-cx q[5],q[46];
-rx(1.1062699733894783) q[5];
-cx q[38],q[46];
-rz(1.0987095403625382) q[46];
-cx q[38],q[46];
-rx(1.1062699733894783) q[38];
-rx(1.1062699733894783) q[46];
-rz(1.0987095403625382) q[47];
-cx q[4],q[47];
-cx q[17],q[47];
-rz(1.0987095403625382) q[47];
-cx q[17],q[47];
-cx q[17],q[53];
-rx(1.1062699733894783) q[47];
-rz(1.0987095403625382) q[48];
-cx q[0],q[48];
-cx q[0],q[51];
-cx q[30],q[48];
-rz(1.0987095403625382) q[48];
-cx q[30],q[48];
-rx(1.1062699733894783) q[30];
-rx(1.1062699733894783) q[48];
-rz(1.0987095403625382) q[49];
-cx q[3],q[49];
-cx q[3],q[50];
-cx q[4],q[49];
-rz(1.0987095403625382) q[49];
-cx q[4],q[49];
-rx(1.1062699733894783) q[4];
-rx(1.1062699733894783) q[49];
-rz(1.0987095403625382) q[50];
-cx q[3],q[50];
-cx q[3],q[52];
-cx q[12],q[50];
-rz(1.0987095403625382) q[50];
-cx q[12],q[50];
-rx(1.1062699733894783) q[12];
-rx(1.1062699733894783) q[50];
-rz(1.0987095403625382) q[51];
-cx q[0],q[51];
-rx(1.1062699733894783) q[0];
-cx q[28],q[51];
-rz(1.0987095403625382) q[51];
-cx q[28],q[51];
-rx(1.1062699733894783) q[51];
-rz(1.0987095403625382) q[52];
-cx q[3],q[52];
-cx q[10],q[52];
-rz(1.0987095403625382) q[52];
-cx q[10],q[52];
-rx(1.1062699733894783) q[10];
-rx(1.1062699733894783) q[52];
-rz(1.0987095403625382) q[53];
-cx q[17],q[53];
-rx(1.1062699733894783) q[17];
-cx q[21],q[53];
-rz(1.0987095403625382) q[53];
-cx q[21],q[53];
-rx(1.1062699733894783) q[21];
-rx(1.1062699733894783) q[53];
-rz(1.0987095403625382) q[54];
-cx q[24],q[54];
-rx(1.1062699733894783) q[24];
-cx q[28],q[54];
-rz(1.0987095403625382) q[54];
-cx q[28],q[54];
-rx(1.1062699733894783) q[28];
-rx(1.1062699733894783) q[54];
-rz(1.0987095403625382) q[55];
-cx q[9],q[55];
-rx(1.1062699733894783) q[9];
-cx q[15],q[55];
-rz(1.0987095403625382) q[55];
-cx q[15],q[55];
-rx(1.1062699733894783) q[15];
-rx(1.1062699733894783) q[55];
-rz(1.0987095403625382) q[56];
-cx q[13],q[56];
-rx(1.1062699733894783) q[13];
-cx q[45],q[56];
-rz(1.0987095403625382) q[56];
-cx q[45],q[56];
-rx(1.1062699733894783) q[45];
-rx(1.1062699733894783) q[56];
-rx(8.088423157063545) q[57];
-cx q[1],q[57];
-rz(1.0987095403625382) q[57];
-cx q[1],q[57];
-rx(1.1062699733894783) q[1];
-cx q[0],q[1];
-rz(2.89880008736672) q[1];
-cx q[0],q[1];
-cx q[0],q[2];
-rz(2.89880008736672) q[2];
-cx q[0],q[2];
-rx(2.852059567657495) q[2];
-cx q[3],q[57];
-rz(1.0987095403625382) q[57];
-cx q[3],q[57];
-rx(1.1062699733894783) q[3];
-cx q[0],q[3];
-rz(2.89880008736672) q[3];
-cx q[0],q[3];
-cx q[0],q[15];
-cx q[1],q[3];
-rz(2.89880008736672) q[3];
-cx q[1],q[3];
-cx q[1],q[4];
-rz(2.89880008736672) q[4];
-cx q[1],q[4];
-cx q[1],q[5];
-cx q[3],q[4];
-rz(2.89880008736672) q[4];
-cx q[3],q[4];
-cx q[4],q[6];
-rz(2.89880008736672) q[5];
-cx q[1],q[5];
-cx q[1],q[9];
-cx q[3],q[5];
-rz(2.89880008736672) q[5];
-cx q[3],q[5];
-cx q[3],q[7];
-rz(2.89880008736672) q[6];
-cx q[4],q[6];
-cx q[5],q[6];
-rz(2.89880008736672) q[6];
-cx q[5],q[6];
-rz(2.89880008736672) q[7];
-cx q[3],q[7];
-cx q[3],q[8];
-cx q[4],q[7];
-rz(2.89880008736672) q[7];
-cx q[4],q[7];
-cx q[4],q[10];
-rz(2.89880008736672) q[8];
-cx q[3],q[8];
-cx q[5],q[8];
-rz(2.89880008736672) q[8];
-cx q[5],q[8];
-cx q[5],q[11];
-rx(2.852059567657495) q[8];
-rz(2.89880008736672) q[9];
-cx q[1],q[9];
-cx q[1],q[17];
-cx q[3],q[9];
-rz(2.89880008736672) q[9];
-cx q[3],q[9];
-cx q[3],q[12];
-rz(2.89880008736672) q[10];
-cx q[4],q[10];
-cx q[4],q[13];
-cx q[6],q[10];
-rz(2.89880008736672) q[10];
-cx q[6],q[10];
-cx q[10],q[37];
-rz(2.89880008736672) q[11];
-cx q[5],q[11];
-cx q[6],q[11];
-rz(2.89880008736672) q[11];
-cx q[6],q[11];
-rx(2.852059567657495) q[11];
-rz(2.89880008736672) q[12];
-cx q[3],q[12];
-cx q[3],q[14];
-cx q[5],q[12];
-rz(2.89880008736672) q[12];
-cx q[5],q[12];
-rz(2.89880008736672) q[13];
-cx q[4],q[13];
-cx q[5],q[13];
-rz(2.89880008736672) q[13];
-cx q[5],q[13];
-rz(2.89880008736672) q[14];
-cx q[3],q[14];
-cx q[4],q[14];
-rz(2.89880008736672) q[14];
-cx q[4],q[14];
-rx(2.852059567657495) q[14];
-rz(2.89880008736672) q[15];
-cx q[0],q[15];
-cx q[0],q[16];
-cx q[3],q[15];
-rz(2.89880008736672) q[15];
-cx q[3],q[15];
-rz(2.89880008736672) q[16];
-cx q[0],q[16];
-cx q[0],q[20];
-cx q[3],q[16];
-rz(2.89880008736672) q[16];
-cx q[3],q[16];
-rz(2.89880008736672) q[17];
-cx q[1],q[17];
-cx q[1],q[28];
-cx q[3],q[17];
-rz(2.89880008736672) q[17];
-cx q[3],q[17];
-cx q[3],q[18];
-rz(2.89880008736672) q[18];
-cx q[3],q[18];
-cx q[3],q[19];
-cx q[4],q[18];
-rz(2.89880008736672) q[18];
-cx q[4],q[18];
-cx q[4],q[21];
-rz(2.89880008736672) q[19];
-cx q[3],q[19];
-cx q[3],q[22];
-cx q[7],q[19];
-rz(2.89880008736672) q[19];
-cx q[7],q[19];
-rx(2.852059567657495) q[7];
-cx q[19],q[38];
-rz(2.89880008736672) q[20];
-cx q[0],q[20];
-cx q[0],q[32];
-cx q[15],q[20];
-rz(2.89880008736672) q[20];
-cx q[15],q[20];
-rz(2.89880008736672) q[21];
-cx q[4],q[21];
-cx q[4],q[27];
-cx q[15],q[21];
-rz(2.89880008736672) q[21];
-cx q[15],q[21];
-cx q[15],q[36];
-rz(2.89880008736672) q[22];
-cx q[3],q[22];
-cx q[3],q[23];
-cx q[9],q[22];
-rz(2.89880008736672) q[22];
-cx q[9],q[22];
-cx q[9],q[55];
-rx(2.852059567657495) q[22];
-rz(2.89880008736672) q[23];
-cx q[3],q[23];
-cx q[3],q[24];
-cx q[17],q[23];
-rz(2.89880008736672) q[23];
-cx q[17],q[23];
-rz(2.89880008736672) q[24];
-cx q[3],q[24];
-cx q[3],q[25];
-cx q[5],q[24];
-rz(2.89880008736672) q[24];
-cx q[5],q[24];
-cx q[5],q[33];
-cx q[24],q[54];
-rz(2.89880008736672) q[25];
-cx q[3],q[25];
-cx q[3],q[26];
-cx q[12],q[25];
-rz(2.89880008736672) q[25];
-cx q[12],q[25];
-cx q[12],q[31];
-rx(2.852059567657495) q[25];
-rz(2.89880008736672) q[26];
-cx q[3],q[26];
-cx q[21],q[26];
-rz(2.89880008736672) q[26];
-cx q[21],q[26];
-rz(2.89880008736672) q[27];
-cx q[4],q[27];
-cx q[4],q[47];
-cx q[6],q[27];
-rz(2.89880008736672) q[27];
-cx q[6],q[27];
-rx(2.852059567657495) q[6];
-rz(2.89880008736672) q[28];
-cx q[1],q[28];
-cx q[1],q[29];
-cx q[3],q[28];
-rz(2.89880008736672) q[28];
-cx q[3],q[28];
-rz(2.89880008736672) q[29];
-cx q[1],q[29];
-cx q[1],q[45];
-cx q[3],q[29];
-rz(2.89880008736672) q[29];
-cx q[3],q[29];
-cx q[3],q[30];
-rx(2.852059567657495) q[29];
-rz(2.89880008736672) q[30];
-cx q[3],q[30];
-cx q[3],q[34];
-cx q[18],q[30];
-rz(2.89880008736672) q[30];
-cx q[18],q[30];
-rx(2.852059567657495) q[18];
-rz(2.89880008736672) q[31];
-cx q[12],q[31];
-cx q[26],q[31];
-rz(2.89880008736672) q[31];
-cx q[26],q[31];
-rx(2.852059567657495) q[26];
-rx(2.852059567657495) q[31];
-rz(2.89880008736672) q[32];
-cx q[0],q[32];
-cx q[0],q[42];
-cx q[21],q[32];
-rz(2.89880008736672) q[32];
-cx q[21],q[32];
-rz(2.89880008736672) q[33];
-cx q[5],q[33];
-cx q[5],q[46];
-cx q[30],q[33];
-rz(2.89880008736672) q[33];
-cx q[30],q[33];
-rx(2.852059567657495) q[33];
-rz(2.89880008736672) q[34];
-cx q[3],q[34];
-cx q[3],q[35];
-cx q[12],q[34];
-rz(2.89880008736672) q[34];
-cx q[12],q[34];
-rz(2.89880008736672) q[35];
-cx q[3],q[35];
-cx q[3],q[39];
-cx q[32],q[35];
-rz(2.89880008736672) q[35];
-cx q[32],q[35];
-rx(2.852059567657495) q[32];
-rx(2.852059567657495) q[35];
-rz(2.89880008736672) q[36];
-cx q[15],q[36];
-cx q[20],q[36];
-rz(2.89880008736672) q[36];
-cx q[20],q[36];
-rx(2.852059567657495) q[36];
-rz(2.89880008736672) q[37];
-cx q[10],q[37];
-cx q[10],q[41];
-cx q[34],q[37];
-rz(2.89880008736672) q[37];
-cx q[34],q[37];
-rx(2.852059567657495) q[34];
-rx(2.852059567657495) q[37];
-rz(2.89880008736672) q[38];
-cx q[19],q[38];
-rx(2.852059567657495) q[19];
-cx q[21],q[38];
-rz(2.89880008736672) q[38];
-cx q[21],q[38];
-rz(2.89880008736672) q[39];
-cx q[3],q[39];
-cx q[3],q[40];
-cx q[13],q[39];
-rz(2.89880008736672) q[39];
-cx q[13],q[39];
-cx q[13],q[56];
-rx(2.852059567657495) q[39];
-rz(2.89880008736672) q[40];
-cx q[3],q[40];
-cx q[23],q[40];
-rz(2.89880008736672) q[40];
-cx q[23],q[40];
-rx(2.852059567657495) q[23];
-rx(2.852059567657495) q[40];
-rz(2.89880008736672) q[41];
-cx q[10],q[41];
-cx q[27],q[41];
-rz(2.89880008736672) q[41];
-cx q[27],q[41];
-rx(2.852059567657495) q[27];
-rx(2.852059567657495) q[41];
-rz(2.89880008736672) q[42];
-cx q[0],q[42];
-cx q[0],q[48];
-cx q[3],q[42];
-rz(2.89880008736672) q[42];
-cx q[3],q[42];
-cx q[3],q[43];
-rx(2.852059567657495) q[42];
-rz(2.89880008736672) q[43];
-cx q[3],q[43];
-cx q[3],q[44];
-cx q[20],q[43];
-rz(2.89880008736672) q[43];
-cx q[20],q[43];
-rx(2.852059567657495) q[20];
-rx(2.852059567657495) q[43];
-rz(2.89880008736672) q[44];
-cx q[3],q[44];
-cx q[3],q[49];
-cx q[12],q[44];
-rz(2.89880008736672) q[44];
-cx q[12],q[44];
-rx(2.852059567657495) q[44];
-rz(2.89880008736672) q[45];
-cx q[1],q[45];
-cx q[16],q[45];
-rz(2.89880008736672) q[45];
-cx q[16],q[45];
-rx(2.852059567657495) q[16];
-rz(2.89880008736672) q[46];
-cx q[5],q[46];
-rx(2.852059567657495) q[5];
-cx q[38],q[46];
-rz(2.89880008736672) q[46];
-cx q[38],q[46];
-rx(2.852059567657495) q[38];
-rx(2.852059567657495) q[46];
-rz(2.89880008736672) q[47];
-cx q[4],q[47];
-cx q[17],q[47];
-rz(2.89880008736672) q[47];
-cx q[17],q[47];
-cx q[17],q[53];
-rx(2.852059567657495) q[47];
-rz(2.89880008736672) q[48];
-cx q[0],q[48];
-cx q[0],q[51];
-cx q[30],q[48];
-rz(2.89880008736672) q[48];
-cx q[30],q[48];
-rx(2.852059567657495) q[30];
-rx(2.852059567657495) q[48];
-rz(2.89880008736672) q[49];
-cx q[3],q[49];
-cx q[3],q[50];
-cx q[4],q[49];
-rz(2.89880008736672) q[49];
-cx q[4],q[49];
-rx(2.852059567657495) q[4];
-rx(2.852059567657495) q[49];
-rz(2.89880008736672) q[50];
-cx q[3],q[50];
-cx q[3],q[52];
-cx q[12],q[50];
-rz(2.89880008736672) q[50];
-cx q[12],q[50];
-rx(2.852059567657495) q[12];
-rx(2.852059567657495) q[50];
-rz(2.89880008736672) q[51];
-cx q[0],q[51];
-rx(2.852059567657495) q[0];
-cx q[28],q[51];
-rz(2.89880008736672) q[51];
-cx q[28],q[51];
-rx(2.852059567657495) q[51];
-rz(2.89880008736672) q[52];
-cx q[3],q[52];
-cx q[10],q[52];
-rz(2.89880008736672) q[52];
-cx q[10],q[52];
-rx(2.852059567657495) q[10];
-rx(2.852059567657495) q[52];
-rz(2.89880008736672) q[53];
-cx q[17],q[53];
-rx(2.852059567657495) q[17];
-cx q[21],q[53];
-rz(2.89880008736672) q[53];
-cx q[21],q[53];
-rx(2.852059567657495) q[21];
-rx(2.852059567657495) q[53];
-rz(2.89880008736672) q[54];
-cx q[24],q[54];
-rx(2.852059567657495) q[24];
-cx q[28],q[54];
-rz(2.89880008736672) q[54];
-cx q[28],q[54];
-rx(2.852059567657495) q[28];
-rx(2.852059567657495) q[54];
-rz(2.89880008736672) q[55];
-cx q[9],q[55];
-rx(2.852059567657495) q[9];
-cx q[15],q[55];
-rz(2.89880008736672) q[55];
-cx q[15],q[55];
-rx(2.852059567657495) q[15];
-rx(2.852059567657495) q[55];
-rz(2.89880008736672) q[56];
-cx q[13],q[56];
-rx(2.852059567657495) q[13];
-cx q[45],q[56];
-rz(2.89880008736672) q[56];
-cx q[45],q[56];
-rx(2.852059567657495) q[45];
-rx(2.852059567657495) q[56];
-rx(1.1062699733894783) q[57];
-cx q[1],q[57];
-rz(2.89880008736672) q[57];
-cx q[1],q[57];
-rx(2.852059567657495) q[1];
-cx q[3],q[57];
-rz(2.89880008736672) q[57];
-cx q[3],q[57];
-rx(2.852059567657495) q[3];
-rx(2.852059567657495) q[57];
\ No newline at end of file
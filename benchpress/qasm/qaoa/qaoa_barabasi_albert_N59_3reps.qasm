@@ -1,1324 +0,0 @@
-OPENQASM 2.0;
-include "qelib1.inc";
-qreg q[59];
-ry(pi/2) q[0];
-rx(pi) q[0];
-ry(pi/2) q[1];
-rx(pi) q[1];
-cx q[0],q[1];
-rz(0.4001025712194339) q[1];
-cx q[0],q[1];
-ry(pi/2) q[2];
-rx(pi) q[2];
-cx q[0],q[2];
-rz(0.4001025712194339) q[2];
-cx q[0],q[2];
-rx(12.064931432516962) q[2];
-ry(pi/2) q[3];
-rx(pi) q[3];
-cx q[0],q[3];
-rz(0.4001025712194339) q[3];
-cx q[0],q[3];
-cx q[1],q[3];
-rz(0.4001025712194339) q[3];
-cx q[1],q[3];
-ry(pi/2) q[4];
-rx(pi) q[4];
-cx q[1],q[4];
-rz(0.4001025712194339) q[4];
-cx q[1],q[4];
-cx q[3],q[4];
-rz(0.4001025712194339) q[4];
-cx q[3],q[4];
-ry(pi/2) q[5];
-rx(pi) q[5];
-cx q[1],q[5];
-rz(0.4001025712194339) q[5];
-cx q[1],q[5];
-cx q[3],q[5];
-rz(0.4001025712194339) q[5];
-cx q[3],q[5];
-ry(pi/2) q[6];
-rx(pi) q[6];
-cx q[4],q[6];
-rz(0.4001025712194339) q[6];
-cx q[4],q[6];
-cx q[5],q[6];
-rz(0.4001025712194339) q[6];
-cx q[5],q[6];
-ry(pi/2) q[7];
-rx(pi) q[7];
-cx q[3],q[7];
-rz(0.4001025712194339) q[7];
-cx q[3],q[7];
-cx q[4],q[7];
-rz(0.4001025712194339) q[7];
-cx q[4],q[7];
-ry(pi/2) q[8];
-rx(pi) q[8];
-cx q[3],q[8];
-rz(0.4001025712194339) q[8];
-cx q[3],q[8];
-cx q[5],q[8];
-rz(0.4001025712194339) q[8];
-cx q[5],q[8];
-rx(12.064931432516962) q[8];
-ry(pi/2) q[9];
-rx(pi) q[9];
-cx q[1],q[9];
-rz(0.4001025712194339) q[9];
-cx q[1],q[9];
-cx q[3],q[9];
-rz(0.4001025712194339) q[9];
-cx q[3],q[9];
-ry(pi/2) q[10];
-rx(pi) q[10];
-cx q[4],q[10];
-rz(0.4001025712194339) q[10];
-cx q[4],q[10];
-cx q[6],q[10];
-rz(0.4001025712194339) q[10];
-cx q[6],q[10];
-ry(pi/2) q[11];
-rx(pi) q[11];
-cx q[5],q[11];
-rz(0.4001025712194339) q[11];
-cx q[5],q[11];
-cx q[6],q[11];
-rz(0.4001025712194339) q[11];
-cx q[6],q[11];
-rx(12.064931432516962) q[11];
-ry(pi/2) q[12];
-rx(pi) q[12];
-cx q[3],q[12];
-rz(0.4001025712194339) q[12];
-cx q[3],q[12];
-cx q[5],q[12];
-rz(0.4001025712194339) q[12];
-cx q[5],q[12];
-ry(pi/2) q[13];
-rx(pi) q[13];
-cx q[4],q[13];
-rz(0.4001025712194339) q[13];
-cx q[4],q[13];
-cx q[5],q[13];
-rz(0.4001025712194339) q[13];
-cx q[5],q[13];
-ry(pi/2) q[14];
-rx(pi) q[14];
-cx q[3],q[14];
-rz(0.4001025712194339) q[14];
-cx q[3],q[14];
-cx q[4],q[14];
-rz(0.4001025712194339) q[14];
-cx q[4],q[14];
-rx(12.064931432516962) q[14];
-ry(pi/2) q[15];
-rx(pi) q[15];
-cx q[0],q[15];
-rz(0.4001025712194339) q[15];
-cx q[0],q[15];
-cx q[3],q[15];
-rz(0.4001025712194339) q[15];
-cx q[3],q[15];
-ry(pi/2) q[16];
-rx(pi) q[16];
-cx q[0],q[16];
-rz(0.4001025712194339) q[16];
-cx q[0],q[16];
-cx q[3],q[16];
-rz(0.4001025712194339) q[16];
-cx q[3],q[16];
-ry(pi/2) q[17];
-rx(pi) q[17];
-cx q[1],q[17];
-rz(0.4001025712194339) q[17];
-cx q[1],q[17];
-cx q[3],q[17];
-rz(0.4001025712194339) q[17];
-cx q[3],q[17];
-ry(pi/2) q[18];
-rx(pi) q[18];
-cx q[3],q[18];
-rz(0.4001025712194339) q[18];
-cx q[3],q[18];
-cx q[4],q[18];
-rz(0.4001025712194339) q[18];
-cx q[4],q[18];
-ry(pi/2) q[19];
-rx(pi) q[19];
-cx q[3],q[19];
-rz(0.4001025712194339) q[19];
-cx q[3],q[19];
-cx q[7],q[19];
-rz(0.4001025712194339) q[19];
-cx q[7],q[19];
-rx(12.064931432516962) q[7];
-ry(pi/2) q[20];
-rx(pi) q[20];
-cx q[0],q[20];
-rz(0.4001025712194339) q[20];
-cx q[0],q[20];
-cx q[15],q[20];
-rz(0.4001025712194339) q[20];
-cx q[15],q[20];
-ry(pi/2) q[21];
-rx(pi) q[21];
-cx q[4],q[21];
-rz(0.4001025712194339) q[21];
-cx q[4],q[21];
-cx q[15],q[21];
-rz(0.4001025712194339) q[21];
-cx q[15],q[21];
-ry(pi/2) q[22];
-rx(pi) q[22];
-cx q[3],q[22];
-rz(0.4001025712194339) q[22];
-cx q[3],q[22];
-cx q[9],q[22];
-rz(0.4001025712194339) q[22];
-cx q[9],q[22];
-rx(12.064931432516962) q[22];
-ry(pi/2) q[23];
-rx(pi) q[23];
-cx q[3],q[23];
-rz(0.4001025712194339) q[23];
-cx q[3],q[23];
-cx q[17],q[23];
-rz(0.4001025712194339) q[23];
-cx q[17],q[23];
-ry(pi/2) q[24];
-rx(pi) q[24];
-cx q[3],q[24];
-rz(0.4001025712194339) q[24];
-cx q[3],q[24];
-cx q[5],q[24];
-rz(0.4001025712194339) q[24];
-cx q[5],q[24];
-ry(pi/2) q[25];
-rx(pi) q[25];
-cx q[3],q[25];
-rz(0.4001025712194339) q[25];
-cx q[3],q[25];
-cx q[12],q[25];
-rz(0.4001025712194339) q[25];
-cx q[12],q[25];
-rx(12.064931432516962) q[25];
-ry(pi/2) q[26];
-rx(pi) q[26];
-cx q[3],q[26];
-rz(0.4001025712194339) q[26];
-cx q[3],q[26];
-cx q[21],q[26];
-rz(0.4001025712194339) q[26];
-cx q[21],q[26];
-ry(pi/2) q[27];
-rx(pi) q[27];
-cx q[4],q[27];
-rz(0.4001025712194339) q[27];
-cx q[4],q[27];
-cx q[6],q[27];
-rz(0.4001025712194339) q[27];
-cx q[6],q[27];
-rx(12.064931432516962) q[6];
-ry(pi/2) q[28];
-rx(pi) q[28];
-cx q[1],q[28];
-rz(0.4001025712194339) q[28];
-cx q[1],q[28];
-cx q[3],q[28];
-rz(0.4001025712194339) q[28];
-cx q[3],q[28];
-ry(pi/2) q[29];
-rx(pi) q[29];
-cx q[1],q[29];
-rz(0.4001025712194339) q[29];
-cx q[1],q[29];
-cx q[3],q[29];
-rz(0.4001025712194339) q[29];
-cx q[3],q[29];
-rx(12.064931432516962) q[29];
-ry(pi/2) q[30];
-rx(pi) q[30];
-cx q[3],q[30];
-rz(0.4001025712194339) q[30];
-cx q[3],q[30];
-cx q[18],q[30];
-rz(0.4001025712194339) q[30];
-cx q[18],q[30];
-rx(12.064931432516962) q[18];
-ry(pi/2) q[31];
-rx(pi) q[31];
-cx q[12],q[31];
-rz(0.4001025712194339) q[31];
-cx q[12],q[31];
-cx q[26],q[31];
-rz(0.4001025712194339) q[31];
-cx q[26],q[31];
-rx(12.064931432516962) q[26];
-rx(12.064931432516962) q[31];
-ry(pi/2) q[32];
-rx(pi) q[32];
-cx q[0],q[32];
-rz(0.4001025712194339) q[32];
-cx q[0],q[32];
-cx q[21],q[32];
-rz(0.4001025712194339) q[32];
-cx q[21],q[32];
-ry(pi/2) q[33];
-rx(pi) q[33];
-cx q[5],q[33];
-rz(0.4001025712194339) q[33];
-cx q[5],q[33];
-cx q[30],q[33];
-rz(0.4001025712194339) q[33];
-cx q[30],q[33];
-rx(12.064931432516962) q[33];
-ry(pi/2) q[34];
-rx(pi) q[34];
-cx q[3],q[34];
-rz(0.4001025712194339) q[34];
-cx q[3],q[34];
-cx q[12],q[34];
-rz(0.4001025712194339) q[34];
-cx q[12],q[34];
-ry(pi/2) q[35];
-rx(pi) q[35];
-cx q[3],q[35];
-rz(0.4001025712194339) q[35];
-cx q[3],q[35];
-cx q[32],q[35];
-rz(0.4001025712194339) q[35];
-cx q[32],q[35];
-rx(12.064931432516962) q[32];
-rx(12.064931432516962) q[35];
-ry(pi/2) q[36];
-rx(pi) q[36];
-cx q[15],q[36];
-rz(0.4001025712194339) q[36];
-cx q[15],q[36];
-cx q[20],q[36];
-rz(0.4001025712194339) q[36];
-cx q[20],q[36];
-rx(12.064931432516962) q[36];
-ry(pi/2) q[37];
-rx(pi) q[37];
-cx q[10],q[37];
-rz(0.4001025712194339) q[37];
-cx q[10],q[37];
-cx q[34],q[37];
-rz(0.4001025712194339) q[37];
-cx q[34],q[37];
-rx(12.064931432516962) q[34];
-rx(12.064931432516962) q[37];
-ry(pi/2) q[38];
-rx(pi) q[38];
-cx q[19],q[38];
-rz(0.4001025712194339) q[38];
-cx q[19],q[38];
-rx(12.064931432516962) q[19];
-cx q[21],q[38];
-rz(0.4001025712194339) q[38];
-cx q[21],q[38];
-ry(pi/2) q[39];
-rx(pi) q[39];
-cx q[3],q[39];
-rz(0.4001025712194339) q[39];
-cx q[3],q[39];
-cx q[13],q[39];
-rz(0.4001025712194339) q[39];
-cx q[13],q[39];
-rx(12.064931432516962) q[39];
-ry(pi/2) q[40];
-rx(pi) q[40];
-cx q[3],q[40];
-rz(0.4001025712194339) q[40];
-cx q[3],q[40];
-cx q[23],q[40];
-rz(0.4001025712194339) q[40];
-cx q[23],q[40];
-rx(12.064931432516962) q[23];
-rx(12.064931432516962) q[40];
-ry(pi/2) q[41];
-rx(pi) q[41];
-cx q[10],q[41];
-rz(0.4001025712194339) q[41];
-cx q[10],q[41];
-cx q[27],q[41];
-rz(0.4001025712194339) q[41];
-cx q[27],q[41];
-rx(12.064931432516962) q[27];
-rx(12.064931432516962) q[41];
-ry(pi/2) q[42];
-rx(pi) q[42];
-cx q[0],q[42];
-rz(0.4001025712194339) q[42];
-cx q[0],q[42];
-cx q[3],q[42];
-rz(0.4001025712194339) q[42];
-cx q[3],q[42];
-rx(12.064931432516962) q[42];
-ry(pi/2) q[43];
-rx(pi) q[43];
-cx q[3],q[43];
-rz(0.4001025712194339) q[43];
-cx q[3],q[43];
-cx q[20],q[43];
-rz(0.4001025712194339) q[43];
-cx q[20],q[43];
-rx(12.064931432516962) q[20];
-rx(12.064931432516962) q[43];
-ry(pi/2) q[44];
-rx(pi) q[44];
-cx q[3],q[44];
-rz(0.4001025712194339) q[44];
-cx q[3],q[44];
-cx q[12],q[44];
-rz(0.4001025712194339) q[44];
-cx q[12],q[44];
-rx(12.064931432516962) q[44];
-ry(pi/2) q[45];
-rx(pi) q[45];
-cx q[1],q[45];
-rz(0.4001025712194339) q[45];
-cx q[1],q[45];
-cx q[16],q[45];
-rz(0.4001025712194339) q[45];
-cx q[16],q[45];
-rx(12.064931432516962) q[16];
-ry(pi/2) q[46];
-rx(pi) q[46];
-cx q[5],q[46];
-rz(0.4001025712194339) q[46];
-cx q[5],q[46];
-rx(12.064931432516962) q[5];
-cx q[38],q[46];
-rz(0.4001025712194339) q[46];
-cx q[38],q[46];
-rx(12.064931432516962) q[38];
-rx(12.064931432516962) q[46];
-ry(pi/2) q[47];
-rx(pi) q[47];
-cx q[4],q[47];
-rz(0.4001025712194339) q[47];
-cx q[4],q[47];
-cx q[17],q[47];
-rz(0.4001025712194339) q[47];
-cx q[17],q[47];
-rx(12.064931432516962) q[47];
-ry(pi/2) q[48];
-rx(pi) q[48];
-cx q[0],q[48];
-rz(0.4001025712194339) q[48];
-cx q[0],q[48];
-cx q[30],q[48];
-rz(0.4001025712194339) q[48];
-cx q[30],q[48];
-rx(12.064931432516962) q[30];
-rx(12.064931432516962) q[48];
-ry(pi/2) q[49];
-rx(pi) q[49];
-cx q[3],q[49];
-rz(0.4001025712194339) q[49];
-cx q[3],q[49];
-cx q[4],q[49];
-rz(0.4001025712194339) q[49];
-cx q[4],q[49];
-rx(12.064931432516962) q[4];
-rx(12.064931432516962) q[49];
-ry(pi/2) q[50];
-rx(pi) q[50];
-cx q[3],q[50];
-rz(0.4001025712194339) q[50];
-cx q[3],q[50];
-cx q[12],q[50];
-rz(0.4001025712194339) q[50];
-cx q[12],q[50];
-rx(12.064931432516962) q[12];
-rx(12.064931432516962) q[50];
-ry(pi/2) q[51];
-rx(pi) q[51];
-cx q[0],q[51];
-rz(0.4001025712194339) q[51];
-cx q[0],q[51];
-rx(12.064931432516962) q[0];
-cx q[28],q[51];
-rz(0.4001025712194339) q[51];
-cx q[28],q[51];
-rx(12.064931432516962) q[51];
-ry(pi/2) q[52];
-rx(pi) q[52];
-cx q[3],q[52];
-rz(0.4001025712194339) q[52];
-cx q[3],q[52];
-cx q[10],q[52];
-rz(0.4001025712194339) q[52];
-cx q[10],q[52];
-rx(12.064931432516962) q[10];
-rx(12.064931432516962) q[52];
-ry(pi/2) q[53];
-rx(pi) q[53];
-cx q[17],q[53];
-rz(0.4001025712194339) q[53];
-cx q[17],q[53];
-rx(12.064931432516962) q[17];
-cx q[21],q[53];
-rz(0.4001025712194339) q[53];
-cx q[21],q[53];
-rx(12.064931432516962) q[21];
-rx(12.064931432516962) q[53];
-ry(pi/2) q[54];
-rx(pi) q[54];
-cx q[24],q[54];
-rz(0.4001025712194339) q[54];
-cx q[24],q[54];
-cx q[28],q[54];
-rz(0.4001025712194339) q[54];
-cx q[28],q[54];
-rx(12.064931432516962) q[54];
-ry(pi/2) q[55];
-rx(pi) q[55];
-cx q[9],q[55];
-rz(0.4001025712194339) q[55];
-cx q[9],q[55];
-rx(12.064931432516962) q[9];
-cx q[15],q[55];
-rz(0.4001025712194339) q[55];
-cx q[15],q[55];
-rx(12.064931432516962) q[15];
-rx(12.064931432516962) q[55];
-ry(pi/2) q[56];
-rx(pi) q[56];
-cx q[13],q[56];
-rz(0.4001025712194339) q[56];
-cx q[13],q[56];
-rx(12.064931432516962) q[13];
-cx q[45],q[56];
-rz(0.4001025712194339) q[56];
-cx q[45],q[56];
-rx(12.064931432516962) q[45];
-rx(12.064931432516962) q[56];
-ry(pi/2) q[57];
-rx(pi) q[57];
-cx q[1],q[57];
-rz(0.4001025712194339) q[57];
-cx q[1],q[57];
-rx(12.064931432516962) q[1];
-cx q[0],q[1];
-rz(5.300564007867757) q[1];
-cx q[0],q[1];
-cx q[0],q[2];
-rz(5.300564007867757) q[2];
-cx q[0],q[2];
-rx(5.8455533053177335) q[2];
-cx q[3],q[57];
-rz(0.4001025712194339) q[57];
-cx q[3],q[57];
-rx(12.064931432516962) q[3];
-cx q[0],q[3];
-rz(5.300564007867757) q[3];
-cx q[0],q[3];
-cx q[0],q[15];
-cx q[1],q[3];
-rz(5.300564007867757) q[3];
-cx q[1],q[3];
-cx q[1],q[4];
-rz(5.300564007867757) q[4];
-cx q[1],q[4];
-cx q[1],q[5];
-cx q[3],q[4];
-rz(5.300564007867757) q[4];
-cx q[3],q[4];
-cx q[4],q[6];
-rz(5.300564007867757) q[5];
-cx q[1],q[5];
-cx q[1],q[9];
-cx q[3],q[5];
-rz(5.300564007867757) q[5];
-cx q[3],q[5];
-cx q[3],q[7];
-rz(5.300564007867757) q[6];
-cx q[4],q[6];
-cx q[5],q[6];
-rz(5.300564007867757) q[6];
-cx q[5],q[6];
-rz(5.300564007867757) q[7];
-cx q[3],q[7];
-cx q[3],q[8];
-cx q[4],q[7];
-rz(5.300564007867757) q[7];
-cx q[4],q[7];
-cx q[4],q[10];
-rz(5.300564007867757) q[8];
-cx q[3],q[8];
-cx q[5],q[8];
-rz(5.300564007867757) q[8];
-cx q[5],q[8];
-cx q[5],q[11];
-rx(5.8455533053177335) q[8];
-rz(5.300564007867757) q[9];
-cx q[1],q[9];
-cx q[1],q[17];
-cx q[3],q[9];
-rz(5.300564007867757) q[9];
-cx q[3],q[9];
-cx q[3],q[12];
-rz(5.300564007867757) q[10];
-cx q[4],q[10];
-cx q[4],q[13];
-cx q[6],q[10];
-rz(5.300564007867757) q[10];
-cx q[6],q[10];
-cx q[10],q[37];
-rz(5.300564007867757) q[11];
-cx q[5],q[11];
-cx q[6],q[11];
-rz(5.300564007867757) q[11];
-cx q[6],q[11];
-rx(5.8455533053177335) q[11];
-rz(5.300564007867757) q[12];
-cx q[3],q[12];
-cx q[3],q[14];
-cx q[5],q[12];
-rz(5.300564007867757) q[12];
-cx q[5],q[12];
-rz(5.300564007867757) q[13];
-cx q[4],q[13];
-cx q[5],q[13];
-rz(5.300564007867757) q[13];
-cx q[5],q[13];
-rz(5.300564007867757) q[14];
-cx q[3],q[14];
-cx q[4],q[14];
-rz(5.300564007867757) q[14];
-cx q[4],q[14];
-rx(5.8455533053177335) q[14];
-rz(5.300564007867757) q[15];
-cx q[0],q[15];
-cx q[0],q[16];
-cx q[3],q[15];
-rz(5.300564007867757) q[15];
-cx q[3],q[15];
-rz(5.300564007867757) q[16];
-cx q[0],q[16];
-cx q[0],q[20];
-cx q[3],q[16];
-rz(5.300564007867757) q[16];
-cx q[3],q[16];
-rz(5.300564007867757) q[17];
-cx q[1],q[17];
-cx q[3],q[17];
-rz(5.300564007867757) q[17];
-cx q[3],q[17];
-cx q[3],q[18];
-rz(5.300564007867757) q[18];
-cx q[3],q[18];
-cx q[3],q[19];
-cx q[4],q[18];
-rz(5.300564007867757) q[18];
-cx q[4],q[18];
-cx q[4],q[21];
-rz(5.300564007867757) q[19];
-cx q[3],q[19];
-cx q[3],q[22];
-cx q[7],q[19];
-rz(5.300564007867757) q[19];
-cx q[7],q[19];
-rx(5.8455533053177335) q[7];
-cx q[19],q[38];
-rz(5.300564007867757) q[20];
-cx q[0],q[20];
-cx q[0],q[32];
-cx q[15],q[20];
-rz(5.300564007867757) q[20];
-cx q[15],q[20];
-rz(5.300564007867757) q[21];
-cx q[4],q[21];
-cx q[4],q[27];
-cx q[15],q[21];
-rz(5.300564007867757) q[21];
-cx q[15],q[21];
-cx q[15],q[36];
-rz(5.300564007867757) q[22];
-cx q[3],q[22];
-cx q[3],q[23];
-cx q[9],q[22];
-rz(5.300564007867757) q[22];
-cx q[9],q[22];
-cx q[9],q[55];
-rx(5.8455533053177335) q[22];
-rz(5.300564007867757) q[23];
-cx q[3],q[23];
-cx q[17],q[23];
-rz(5.300564007867757) q[23];
-cx q[17],q[23];
-rz(5.300564007867757) q[27];
-cx q[4],q[27];
-cx q[4],q[47];
-cx q[6],q[27];
-rz(5.300564007867757) q[27];
-cx q[6],q[27];
-rx(5.8455533053177335) q[6];
-rz(5.300564007867757) q[32];
-cx q[0],q[32];
-cx q[0],q[42];
-rz(5.300564007867757) q[36];
-cx q[15],q[36];
-cx q[20],q[36];
-rz(5.300564007867757) q[36];
-cx q[20],q[36];
-rx(5.8455533053177335) q[36];
-rz(5.300564007867757) q[37];
-cx q[10],q[37];
-cx q[10],q[41];
-rz(5.300564007867757) q[38];
-cx q[19],q[38];
-rx(5.8455533053177335) q[19];
-rz(5.300564007867757) q[41];
-cx q[10],q[41];
-cx q[27],q[41];
-rz(5.300564007867757) q[41];
-cx q[27],q[41];
-rx(5.8455533053177335) q[27];
-rx(5.8455533053177335) q[41];
-rz(5.300564007867757) q[42];
-cx q[0],q[42];
-cx q[0],q[48];
-rz(5.300564007867757) q[47];
-cx q[4],q[47];
-cx q[17],q[47];
-rz(5.300564007867757) q[47];
-cx q[17],q[47];
-cx q[17],q[53];
-rx(5.8455533053177335) q[47];
-rz(5.300564007867757) q[48];
-cx q[0],q[48];
-cx q[0],q[51];
-rz(5.300564007867757) q[51];
-cx q[0],q[51];
-rx(5.8455533053177335) q[0];
-rz(5.300564007867757) q[53];
-cx q[17],q[53];
-rx(5.8455533053177335) q[17];
-rz(5.300564007867757) q[55];
-cx q[9],q[55];
-rx(5.8455533053177335) q[9];
-cx q[15],q[55];
-rz(5.300564007867757) q[55];
-cx q[15],q[55];
-rx(5.8455533053177335) q[15];
-rx(5.8455533053177335) q[55];
-rx(12.064931432516962) q[57];
-ry(pi/2) q[58];
-rx(pi) q[58];
-cx q[24],q[58];
-rz(0.4001025712194339) q[58];
-cx q[24],q[58];
-rx(12.064931432516962) q[24];
-cx q[3],q[24];
-rz(5.300564007867757) q[24];
-cx q[3],q[24];
-cx q[3],q[25];
-cx q[5],q[24];
-rz(5.300564007867757) q[24];
-cx q[5],q[24];
-cx q[5],q[33];
-cx q[24],q[54];
-rz(5.300564007867757) q[25];
-cx q[3],q[25];
-cx q[3],q[26];
-cx q[12],q[25];
-rz(5.300564007867757) q[25];
-cx q[12],q[25];
-cx q[12],q[31];
-rx(5.8455533053177335) q[25];
-rz(5.300564007867757) q[26];
-cx q[3],q[26];
-cx q[21],q[26];
-rz(5.300564007867757) q[26];
-cx q[21],q[26];
-cx q[21],q[32];
-cx q[28],q[58];
-rz(5.300564007867757) q[31];
-cx q[12],q[31];
-cx q[26],q[31];
-rz(5.300564007867757) q[31];
-cx q[26],q[31];
-rx(5.8455533053177335) q[26];
-rx(5.8455533053177335) q[31];
-rz(5.300564007867757) q[32];
-cx q[21],q[32];
-cx q[21],q[38];
-rz(5.300564007867757) q[33];
-cx q[5],q[33];
-cx q[5],q[46];
-rz(5.300564007867757) q[38];
-cx q[21],q[38];
-cx q[21],q[53];
-rz(5.300564007867757) q[46];
-cx q[5],q[46];
-rx(5.8455533053177335) q[5];
-cx q[38],q[46];
-rz(5.300564007867757) q[46];
-cx q[38],q[46];
-rx(5.8455533053177335) q[38];
-rx(5.8455533053177335) q[46];
-rz(5.300564007867757) q[53];
-cx q[21],q[53];
-rx(5.8455533053177335) q[21];
-rx(5.8455533053177335) q[53];
-rz(5.300564007867757) q[54];
-cx q[24],q[54];
-rz(0.4001025712194339) q[58];
-cx q[28],q[58];
-rx(12.064931432516962) q[28];
-cx q[1],q[28];
-rz(5.300564007867757) q[28];
-cx q[1],q[28];
-cx q[1],q[29];
-cx q[3],q[28];
-rz(5.300564007867757) q[28];
-cx q[3],q[28];
-cx q[28],q[51];
-rz(5.300564007867757) q[29];
-cx q[1],q[29];
-cx q[1],q[45];
-cx q[3],q[29];
-rz(5.300564007867757) q[29];
-cx q[3],q[29];
-cx q[3],q[30];
-rx(5.8455533053177335) q[29];
-rz(5.300564007867757) q[30];
-cx q[3],q[30];
-cx q[3],q[34];
-cx q[18],q[30];
-rz(5.300564007867757) q[30];
-cx q[18],q[30];
-rx(5.8455533053177335) q[18];
-cx q[30],q[33];
-rz(5.300564007867757) q[33];
-cx q[30],q[33];
-cx q[30],q[48];
-rx(5.8455533053177335) q[33];
-rz(5.300564007867757) q[34];
-cx q[3],q[34];
-cx q[3],q[35];
-cx q[12],q[34];
-rz(5.300564007867757) q[34];
-cx q[12],q[34];
-cx q[34],q[37];
-rz(5.300564007867757) q[35];
-cx q[3],q[35];
-cx q[3],q[39];
-cx q[32],q[35];
-rz(5.300564007867757) q[35];
-cx q[32],q[35];
-rx(5.8455533053177335) q[32];
-rx(5.8455533053177335) q[35];
-rz(5.300564007867757) q[37];
-cx q[34],q[37];
-rx(5.8455533053177335) q[34];
-rx(5.8455533053177335) q[37];
-rz(5.300564007867757) q[39];
-cx q[3],q[39];
-cx q[3],q[40];
-cx q[13],q[39];
-rz(5.300564007867757) q[39];
-cx q[13],q[39];
-cx q[13],q[56];
-rx(5.8455533053177335) q[39];
-rz(5.300564007867757) q[40];
-cx q[3],q[40];
-cx q[3],q[42];
-cx q[23],q[40];
-rz(5.300564007867757) q[40];
-cx q[23],q[40];
-rx(5.8455533053177335) q[23];
-rx(5.8455533053177335) q[40];
-rz(5.300564007867757) q[42];
-cx q[3],q[42];
-cx q[3],q[43];
-rx(5.8455533053177335) q[42];
-rz(5.300564007867757) q[43];
-cx q[3],q[43];
-cx q[3],q[44];
-cx q[20],q[43];
-rz(5.300564007867757) q[43];
-cx q[20],q[43];
-rx(5.8455533053177335) q[20];
-rx(5.8455533053177335) q[43];
-rz(5.300564007867757) q[44];
-cx q[3],q[44];
-cx q[3],q[49];
-cx q[12],q[44];
-rz(5.300564007867757) q[44];
-cx q[12],q[44];
-rx(5.8455533053177335) q[44];
-rz(5.300564007867757) q[45];
-cx q[1],q[45];
-cx q[1],q[57];
-cx q[16],q[45];
-rz(5.300564007867757) q[45];
-cx q[16],q[45];
-rx(5.8455533053177335) q[16];
-rz(5.300564007867757) q[48];
-cx q[30],q[48];
-rx(5.8455533053177335) q[30];
-rx(5.8455533053177335) q[48];
-rz(5.300564007867757) q[49];
-cx q[3],q[49];
-cx q[3],q[50];
-cx q[4],q[49];
-rz(5.300564007867757) q[49];
-cx q[4],q[49];
-rx(5.8455533053177335) q[4];
-rx(5.8455533053177335) q[49];
-rz(5.300564007867757) q[50];
-cx q[3],q[50];
-cx q[3],q[52];
-cx q[12],q[50];
-rz(5.300564007867757) q[50];
-cx q[12],q[50];
-rx(5.8455533053177335) q[12];
-rx(5.8455533053177335) q[50];
-rz(5.300564007867757) q[51];
-cx q[28],q[51];
-cx q[28],q[54];
-rx(5.8455533053177335) q[51];
-rz(5.300564007867757) q[52];
-cx q[3],q[52];
-cx q[10],q[52];
-rz(5.300564007867757) q[52];
-cx q[10],q[52];
-rx(5.8455533053177335) q[10];
-rx(5.8455533053177335) q[52];
-rz(5.300564007867757) q[54];
-cx q[28],q[54];
-rx(5.8455533053177335) q[54];
-rz(5.300564007867757) q[56];
-cx q[13],q[56];
-rx(5.8455533053177335) q[13];
-cx q[45],q[56];
-rz(5.300564007867757) q[56];
-cx q[45],q[56];
-rx(5.8455533053177335) q[45];
-rx(5.8455533053177335) q[56];
-rz(5.300564007867757) q[57];
-cx q[1],q[57];
-rx(5.8455533053177335) q[1];
-cx q[0],q[1];
-rz(3.1232182761480565) q[1];
-cx q[0],q[1];
-cx q[0],q[2];
-rz(3.1232182761480565) q[2];
-cx q[0],q[2];
-rx(2.315562251074619) q[2];
-cx q[3],q[57];
-rz(5.300564007867757) q[57];
-cx q[3],q[57];
-rx(5.8455533053177335) q[3];
-cx q[0],q[3];
-rz(3.1232182761480565) q[3];
-cx q[0],q[3];
-cx q[0],q[15];
-cx q[1],q[3];
-rz(3.1232182761480565) q[3];
-cx q[1],q[3];
-cx q[1],q[4];
-rz(3.1232182761480565) q[4];
-cx q[1],q[4];
-cx q[1],q[5];
-cx q[3],q[4];
-rz(3.1232182761480565) q[4];
-cx q[3],q[4];
-cx q[4],q[6];
-rz(3.1232182761480565) q[5];
-cx q[1],q[5];
-cx q[1],q[9];
-cx q[3],q[5];
-rz(3.1232182761480565) q[5];
-cx q[3],q[5];
-cx q[3],q[7];
-rz(3.1232182761480565) q[6];
-cx q[4],q[6];
-cx q[5],q[6];
-rz(3.1232182761480565) q[6];
-cx q[5],q[6];
-rz(3.1232182761480565) q[7];
-cx q[3],q[7];
-cx q[3],q[8];
-cx q[4],q[7];
-rz(3.1232182761480565) q[7];
-cx q[4],q[7];
-cx q[4],q[10];
-rz(3.1232182761480565) q[8];
-cx q[3],q[8];
-cx q[5],q[8];
-rz(3.1232182761480565) q[8];
-cx q[5],q[8];
-cx q[5],q[11];
-rx(2.315562251074619) q[8];
-rz(3.1232182761480565) q[9];
-cx q[1],q[9];
-cx q[1],q[17];
-cx q[3],q[9];
-rz(3.1232182761480565) q[9];
-cx q[3],q[9];
-cx q[3],q[12];
-rz(3.1232182761480565) q[10];
-cx q[4],q[10];
-cx q[4],q[13];
-cx q[6],q[10];
-rz(3.1232182761480565) q[10];
-cx q[6],q[10];
-cx q[10],q[37];
-rz(3.1232182761480565) q[11];
-cx q[5],q[11];
-cx q[6],q[11];
-rz(3.1232182761480565) q[11];
-cx q[6],q[11];
-rx(2.315562251074619) q[11];
-rz(3.1232182761480565) q[12];
-cx q[3],q[12];
-cx q[3],q[14];
-cx q[5],q[12];
-rz(3.1232182761480565) q[12];
-cx q[5],q[12];
-rz(3.1232182761480565) q[13];
-cx q[4],q[13];
-cx q[5],q[13];
-rz(3.1232182761480565) q[13];
-cx q[5],q[13];
-rz(3.1232182761480565) q[14];
-cx q[3],q[14];
-cx q[4],q[14];
-rz(3.1232182761480565) q[14];
-cx q[4],q[14];
-rx(2.315562251074619) q[14];
-rz(3.1232182761480565) q[15];
-cx q[0],q[15];
-cx q[0],q[16];
-cx q[3],q[15];
-rz(3.1232182761480565) q[15];
-cx q[3],q[15];
-rz(3.1232182761480565) q[16];
-cx q[0],q[16];
-cx q[0],q[20];
-cx q[3],q[16];
-rz(3.1232182761480565) q[16];
-cx q[3],q[16];
-rz(3.1232182761480565) q[17];
-cx q[1],q[17];
-cx q[3],q[17];
-rz(3.1232182761480565) q[17];
-cx q[3],q[17];
-cx q[3],q[18];
-rz(3.1232182761480565) q[18];
-cx q[3],q[18];
-cx q[3],q[19];
-cx q[4],q[18];
-rz(3.1232182761480565) q[18];
-cx q[4],q[18];
-cx q[4],q[21];
-rz(3.1232182761480565) q[19];
-cx q[3],q[19];
-cx q[3],q[22];
-cx q[7],q[19];
-rz(3.1232182761480565) q[19];
-cx q[7],q[19];
-rx(2.315562251074619) q[7];
-cx q[19],q[38];
-rz(3.1232182761480565) q[20];
-cx q[0],q[20];
-cx q[0],q[32];
-cx q[15],q[20];
-rz(3.1232182761480565) q[20];
-cx q[15],q[20];
-rz(3.1232182761480565) q[21];
-cx q[4],q[21];
-cx q[4],q[27];
-cx q[15],q[21];
-rz(3.1232182761480565) q[21];
-cx q[15],q[21];
-cx q[15],q[36];
-rz(3.1232182761480565) q[22];
-cx q[3],q[22];
-cx q[3],q[23];
-cx q[9],q[22];
-rz(3.1232182761480565) q[22];
-cx q[9],q[22];
-cx q[9],q[55];
-rx(2.315562251074619) q[22];
-rz(3.1232182761480565) q[23];
-cx q[3],q[23];
-cx q[17],q[23];
-rz(3.1232182761480565) q[23];
-cx q[17],q[23];
-rz(3.1232182761480565) q[27];
-cx q[4],q[27];
-cx q[4],q[47];
-cx q[6],q[27];
-rz(3.1232182761480565) q[27];
-cx q[6],q[27];
-rx(2.315562251074619) q[6];
-rz(3.1232182761480565) q[32];
-cx q[0],q[32];
-cx q[0],q[42];
-rz(3.1232182761480565) q[36];
-cx q[15],q[36];
-cx q[20],q[36];
-rz(3.1232182761480565) q[36];
-cx q[20],q[36];
-rx(2.315562251074619) q[36];
-rz(3.1232182761480565) q[37];
-cx q[10],q[37];
-cx q[10],q[41];
-rz(3.1232182761480565) q[38];
-cx q[19],q[38];
-rx(2.315562251074619) q[19];
-rz(3.1232182761480565) q[41];
-cx q[10],q[41];
-cx q[27],q[41];
-rz(3.1232182761480565) q[41];
-cx q[27],q[41];
-rx(2.315562251074619) q[27];
-rx(2.315562251074619) q[41];
-rz(3.1232182761480565) q[42];
-cx q[0],q[42];
-cx q[0],q[48];
-rz(3.1232182761480565) q[47];
-cx q[4],q[47];
-cx q[17],q[47];
-rz(3.1232182761480565) q[47];
-cx q[17],q[47];
-cx q[17],q[53];
-rx(2.315562251074619) q[47];
-rz(3.1232182761480565) q[48];
-cx q[0],q[48];
-cx q[0],q[51];
-rz(3.1232182761480565) q[51];
-cx q[0],q[51];
-rx(2.315562251074619) q[0];
-rz(3.1232182761480565) q[53];
-cx q[17],q[53];
-rx(2.315562251074619) q[17];
-rz(3.1232182761480565) q[55];
-cx q[9],q[55];
-rx(2.315562251074619) q[9];
-cx q[15],q[55];
-rz(3.1232182761480565) q[55];
-cx q[15],q[55];
-rx(2.315562251074619) q[15];
-rx(2.315562251074619) q[55];
-rx(5.8455533053177335) q[57];
-rx(12.064931432516962) q[58];
-cx q[24],q[58];
-rz(5.300564007867757) q[58];
-cx q[24],q[58];
-rx(5.8455533053177335) q[24];
-cx q[3],q[24];
-rz(3.1232182761480565) q[24];
-cx q[3],q[24];
-cx q[3],q[25];
-cx q[5],q[24];
-rz(3.1232182761480565) q[24];
-cx q[5],q[24];
-cx q[5],q[33];
-cx q[24],q[54];
-rz(3.1232182761480565) q[25];
-cx q[3],q[25];
-cx q[3],q[26];
-cx q[12],q[25];
-rz(3.1232182761480565) q[25];
-cx q[12],q[25];
-cx q[12],q[31];
-rx(2.315562251074619) q[25];
-rz(3.1232182761480565) q[26];
-cx q[3],q[26];
-cx q[21],q[26];
-rz(3.1232182761480565) q[26];
-cx q[21],q[26];
-cx q[21],q[32];
-cx q[28],q[58];
-rz(3.1232182761480565) q[31];
-cx q[12],q[31];
-cx q[26],q[31];
-rz(3.1232182761480565) q[31];
-cx q[26],q[31];
-rx(2.315562251074619) q[26];
-rx(2.315562251074619) q[31];
-rz(3.1232182761480565) q[32];
-cx q[21],q[32];
-cx q[21],q[38];
-rz(3.1232182761480565) q[33];
-cx q[5],q[33];
-cx q[5],q[46];
-rz(3.1232182761480565) q[38];
-cx q[21],q[38];
-cx q[21],q[53];
-rz(3.1232182761480565) q[46];
-cx q[5],q[46];
-rx(2.315562251074619) q[5];
-cx q[38],q[46];
-rz(3.1232182761480565) q[46];
-cx q[38],q[46];
-rx(2.315562251074619) q[38];
-rx(2.315562251074619) q[46];
-rz(3.1232182761480565) q[53];
-cx q[21],q[53];
-rx(2.315562251074619) q[21];
-rx(2.315562251074619) q[53];
-rz(3.1232182761480565) q[54];
-cx q[24],q[54];
-rz(5.300564007867757) q[58];
-cx q[28],q[58];
-rx(5.8455533053177335) q[28];
-cx q[1],q[28];
-rz(3.1232182761480565) q[28];
-cx q[1],q[28];
-cx q[1],q[29];
-cx q[3],q[28];
-rz(3.1232182761480565) q[28];
-cx q[3],q[28];
-cx q[28],q[51];
-rz(3.1232182761480565) q[29];
-cx q[1],q[29];
-cx q[1],q[45];
-cx q[3],q[29];
-rz(3.1232182761480565) q[29];
-cx q[3],q[29];
-cx q[3],q[30];
-rx(2.315562251074619) q[29];
-rz(3.1232182761480565) q[30];
-cx q[3],q[30];
-cx q[3],q[34];
-cx q[18],q[30];
-rz(3.1232182761480565) q[30];
-cx q[18],q[30];
-rx(2.315562251074619) q[18];
-cx q[30],q[33];
-rz(3.1232182761480565) q[33];
-cx q[30],q[33];
-cx q[30],q[48];
-rx(2.315562251074619) q[33];
-rz(3.1232182761480565) q[34];
-cx q[3],q[34];
-cx q[3],q[35];
-cx q[12],q[34];
-rz(3.1232182761480565) q[34];
-cx q[12],q[34];
-cx q[34],q[37];
-rz(3.1232182761480565) q[35];
-cx q[3],q[35];
-cx q[3],q[39];
-cx q[32],q[35];
-rz(3.1232182761480565) q[35];
-cx q[32],q[35];
-rx(2.315562251074619) q[32];
-rx(2.315562251074619) q[35];
-rz(3.1232182761480565) q[37];
-cx q[34],q[37];
-rx(2.315562251074619) q[34];
-rx(2.315562251074619) q[37];
-rz(3.1232182761480565) q[39];
-cx q[3],q[39];
-cx q[3],q[40];
-cx q[13],q[39];
-rz(3.1232182761480565) q[39];
-cx q[13],q[39];
-cx q[13],q[56];
-rx(2.315562251074619) q[39];
-rz(3.1232182761480565) q[40];
-cx q[3],q[40];
-cx q[3],q[42];
-cx q[23],q[40];
-rz(3.1232182761480565) q[40];
-cx q[23],q[40];
-rx(2.315562251074619) q[23];
-rx(2.315562251074619) q[40];
-rz(3.1232182761480565) q[42];
-cx q[3],q[42];
-cx q[3],q[43];
-rx(2.315562251074619) q[42];
-rz(3.1232182761480565) q[43];
-cx q[3],q[43];
-cx q[3],q[44];
-cx q[20],q[43];
-rz(3.1232182761480565) q[43];
-cx q[20],q[43];
-rx(2.315562251074619) q[20];
-rx(2.315562251074619) q[43];
-rz(3.1232182761480565) q[44];
-cx q[3],q[44];
-cx q[3],q[49];
-cx q[12],q[44];
-rz(3.1232182761480565) q[44];
-cx q[12],q[44];
-rx(2.315562251074619) q[44];
-rz(3.1232182761480565) q[45];
-cx q[1],q[45];
-cx q[1],q[57];
-cx q[16],q[45];
-rz(3.1232182761480565) q[45];
-cx q[16],q[45];
-rx(2.315562251074619) q[16];
-rz(3.1232182761480565) q[48];
-cx q[30],q[48];
-rx(2.315562251074619) q[30];
-rx(2.315562251074619) q[48];
-rz(3.1232182761480565) q[49];
-cx q[3],q[49];
-cx q[3],q[50];
-cx q[4],q[49];
-rz(3.1232182761480565) q[49];
-cx q[4],q[49];
-rx(2.315562251074619) q[4];
-rx(2.315562251074619) q[49];
-rz(3.1232182761480565) q[50];
-cx q[3],q[50];
-cx q[3],q[52];
-cx q[12],q[50];
-rz(3.1232182761480565) q[50];
-cx q[12],q[50];
-rx(2.315562251074619) q[12];
-rx(2.315562251074619) q[50];
-rz(3.1232182761480565) q[51];
-cx q[28],q[51];
-cx q[28],q[54];
-rx(2.315562251074619) q[51];
-rz(3.1232182761480565) q[52];
-cx q[3],q[52];
-cx q[10],q[52];
-rz(3.1232182761480565) q[52];
-cx q[10],q[52];
-rx(2.315562251074619) q[10];
-rx(2.315562251074619) q[52];
-rz(3.1232182761480565) q[54];
-cx q[28],q[54];
-rx(2.315562251074619) q[54];
-rz(3.1232182761480565) q[56];
-cx q[13],q[56];
-rx(2.315562251074619) q[13];
-cx q[45],q[56];
-rz(3.1232182761480565) q[56];
-cx q[45],q[56];
-rx(2.315562251074619) q[45];
-rx(2.315562251074619) q[56];
-rz(3.1232182761480565) q[57];
-cx q[1],q[57];
-rx(2.315562251074619) q[1];
-cx q[3],q[57];
-rz(3.1232182761480565) q[57];
-cx q[3],q[57];
-rx(2.315562251074619) q[3];
-rx(2.315562251074619) q[57];
-rx(5.8455533053177335) q[58];
-cx q[24],q[58];
-rz(3.1232182761480565) q[58];
-cx q[24],q[58];
-rx(2.315562251074619) q[24];
-cx q[28],q[58];
-rz(3.1232182761480565) q[58];
-cx q[28],q[58];
-rx(2.315562251074619) q[28];
-rx(2.315562251074619) q[58];
\ No newline at end of file
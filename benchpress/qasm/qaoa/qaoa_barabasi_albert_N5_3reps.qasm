@@ -1,82 +0,0 @@
-OPENQASM 2.0;
-include "qelib1.inc";
-qreg q[5];
-ry(pi/2) q[0];
-rx(pi) q[0];
-ry(pi/2) q[1];
-rx(pi) q[1];
-cx q[0],q[1];
-rz(1.462252844468992) q[1];
-cx q[0],q[1];
-ry(pi/2) q[2];
-rx(pi) q[2];
-cx q[0],q[2];
-rz(1.462252844468992) q[2];
-cx q[0],q[2];
-rx(2.935967916397429) q[2];
-ry(pi/2) q[3];
-rx(pi) q[3];
-cx q[0],q[3];
-rz(1.462252844468992) q[3];
-cx q[0],q[3];
-rx(2.935967916397429) q[0];
-cx q[1],q[3];
-rz(1.462252844468992) q[3];
-cx q[1],q[3];
-ry(pi/2) q[4];
-rx(pi) q[4];
-cx q[1],q[4];
-rz(1.462252844468992) q[4];
-cx q[1],q[4];
-rx(2.935967916397429) q[1];
-cx q[0],q[1];
-rz(1.1569342661124338) q[1];
-cx q[0],q[1];
-cx q[0],q[2];
-rz(1.1569342661124338) q[2];
-cx q[0],q[2];
-rx(7.353148367687835) q[2];
-cx q[3],q[4];
-rz(1.462252844468992) q[4];
-cx q[3],q[4];
-rx(2.935967916397429) q[3];
-cx q[0],q[3];
-rz(1.1569342661124338) q[3];
-cx q[0],q[3];
-rx(7.353148367687835) q[0];
-cx q[1],q[3];
-rz(1.1569342661124338) q[3];
-cx q[1],q[3];
-rx(2.935967916397429) q[4];
-cx q[1],q[4];
-rz(1.1569342661124338) q[4];
-cx q[1],q[4];
-rx(7.353148367687835) q[1];
-cx q[0],q[1];
-rz(3.983975510262587) q[1];
-cx q[0],q[1];
-cx q[0],q[2];
-rz(3.983975510262587) q[2];
-cx q[0],q[2];
-rx(4.569020993895625) q[2];
-cx q[3],q[4];
-rz(1.1569342661124338) q[4];
-cx q[3],q[4];
-rx(7.353148367687835) q[3];
-cx q[0],q[3];
-rz(3.983975510262587) q[3];
-cx q[0],q[3];
-rx(4.569020993895625) q[0];
-cx q[1],q[3];
-rz(3.983975510262587) q[3];
-cx q[1],q[3];
-rx(7.353148367687835) q[4];
-cx q[1],q[4];
-rz(3.983975510262587) q[4];
-cx q[1],q[4];
-rx(4.569020993895625) q[1];
-cx q[3],q[4];
-rz(3.983975510262587) q[4];
-cx q[3],q[4];
-rx(4.569020993895625) q[3];
-rx(4.569020993895625) q[4];
\ No newline at end of file
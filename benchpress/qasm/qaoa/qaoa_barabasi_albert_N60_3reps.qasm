@@ -1,1347 +0,0 @@
-OPENQASM 2.0;
-include "qelib1.inc";
-qreg q[60];
-ry(pi/2) q[0];
-rx(pi) q[0];
-ry(pi/2) q[1];
-rx(pi) q[1];
-cx q[0],q[1];
-rz(5.500802569806137) q[1];
-cx q[0],q[1];
-ry(pi/2) q[2];
-rx(pi) q[2];
-cx q[0],q[2];
-rz(5.500802569806137) q[2];
-cx q[0],q[2];
-rx(3.970747044065281) q[2];
-ry(pi/2) q[3];
-rx(pi) q[3];
-cx q[0],q[3];
-rz(5.500802569806137) q[3];
-cx q[0],q[3];
-cx q[1],q[3];
-rz(5.500802569806137) q[3];
-cx q[1],q[3];
-ry(pi/2) q[4];
-rx(pi) q[4];
-cx q[1],q[4];
-rz(5.500802569806137) q[4];
-cx q[1],q[4];
-cx q[3],q[4];
-rz(5.500802569806137) q[4];
-cx q[3],q[4];
-ry(pi/2) q[5];
-rx(pi) q[5];
-cx q[1],q[5];
-rz(5.500802569806137) q[5];
-cx q[1],q[5];
-cx q[3],q[5];
-rz(5.500802569806137) q[5];
-cx q[3],q[5];
-ry(pi/2) q[6];
-rx(pi) q[6];
-cx q[4],q[6];
-rz(5.500802569806137) q[6];
-cx q[4],q[6];
-cx q[5],q[6];
-rz(5.500802569806137) q[6];
-cx q[5],q[6];
-ry(pi/2) q[7];
-rx(pi) q[7];
-cx q[3],q[7];
-rz(5.500802569806137) q[7];
-cx q[3],q[7];
-cx q[4],q[7];
-rz(5.500802569806137) q[7];
-cx q[4],q[7];
-ry(pi/2) q[8];
-rx(pi) q[8];
-cx q[3],q[8];
-rz(5.500802569806137) q[8];
-cx q[3],q[8];
-cx q[5],q[8];
-rz(5.500802569806137) q[8];
-cx q[5],q[8];
-rx(3.970747044065281) q[8];
-ry(pi/2) q[9];
-rx(pi) q[9];
-cx q[1],q[9];
-rz(5.500802569806137) q[9];
-cx q[1],q[9];
-cx q[3],q[9];
-rz(5.500802569806137) q[9];
-cx q[3],q[9];
-ry(pi/2) q[10];
-rx(pi) q[10];
-cx q[4],q[10];
-rz(5.500802569806137) q[10];
-cx q[4],q[10];
-cx q[6],q[10];
-rz(5.500802569806137) q[10];
-cx q[6],q[10];
-ry(pi/2) q[11];
-rx(pi) q[11];
-cx q[5],q[11];
-rz(5.500802569806137) q[11];
-cx q[5],q[11];
-cx q[6],q[11];
-rz(5.500802569806137) q[11];
-cx q[6],q[11];
-rx(3.970747044065281) q[11];
-ry(pi/2) q[12];
-rx(pi) q[12];
-cx q[3],q[12];
-rz(5.500802569806137) q[12];
-cx q[3],q[12];
-cx q[5],q[12];
-rz(5.500802569806137) q[12];
-cx q[5],q[12];
-ry(pi/2) q[13];
-rx(pi) q[13];
-cx q[4],q[13];
-rz(5.500802569806137) q[13];
-cx q[4],q[13];
-cx q[5],q[13];
-rz(5.500802569806137) q[13];
-cx q[5],q[13];
-ry(pi/2) q[14];
-rx(pi) q[14];
-cx q[3],q[14];
-rz(5.500802569806137) q[14];
-cx q[3],q[14];
-cx q[4],q[14];
-rz(5.500802569806137) q[14];
-cx q[4],q[14];
-rx(3.970747044065281) q[14];
-ry(pi/2) q[15];
-rx(pi) q[15];
-cx q[0],q[15];
-rz(5.500802569806137) q[15];
-cx q[0],q[15];
-cx q[3],q[15];
-rz(5.500802569806137) q[15];
-cx q[3],q[15];
-ry(pi/2) q[16];
-rx(pi) q[16];
-cx q[0],q[16];
-rz(5.500802569806137) q[16];
-cx q[0],q[16];
-cx q[3],q[16];
-rz(5.500802569806137) q[16];
-cx q[3],q[16];
-ry(pi/2) q[17];
-rx(pi) q[17];
-cx q[1],q[17];
-rz(5.500802569806137) q[17];
-cx q[1],q[17];
-cx q[3],q[17];
-rz(5.500802569806137) q[17];
-cx q[3],q[17];
-ry(pi/2) q[18];
-rx(pi) q[18];
-cx q[3],q[18];
-rz(5.500802569806137) q[18];
-cx q[3],q[18];
-cx q[4],q[18];
-rz(5.500802569806137) q[18];
-cx q[4],q[18];
-ry(pi/2) q[19];
-rx(pi) q[19];
-cx q[3],q[19];
-rz(5.500802569806137) q[19];
-cx q[3],q[19];
-cx q[7],q[19];
-rz(5.500802569806137) q[19];
-cx q[7],q[19];
-rx(3.970747044065281) q[7];
-ry(pi/2) q[20];
-rx(pi) q[20];
-cx q[0],q[20];
-rz(5.500802569806137) q[20];
-cx q[0],q[20];
-cx q[15],q[20];
-rz(5.500802569806137) q[20];
-cx q[15],q[20];
-ry(pi/2) q[21];
-rx(pi) q[21];
-cx q[4],q[21];
-rz(5.500802569806137) q[21];
-cx q[4],q[21];
-cx q[15],q[21];
-rz(5.500802569806137) q[21];
-cx q[15],q[21];
-ry(pi/2) q[22];
-rx(pi) q[22];
-cx q[3],q[22];
-rz(5.500802569806137) q[22];
-cx q[3],q[22];
-cx q[9],q[22];
-rz(5.500802569806137) q[22];
-cx q[9],q[22];
-rx(3.970747044065281) q[22];
-ry(pi/2) q[23];
-rx(pi) q[23];
-cx q[3],q[23];
-rz(5.500802569806137) q[23];
-cx q[3],q[23];
-cx q[17],q[23];
-rz(5.500802569806137) q[23];
-cx q[17],q[23];
-ry(pi/2) q[24];
-rx(pi) q[24];
-cx q[3],q[24];
-rz(5.500802569806137) q[24];
-cx q[3],q[24];
-cx q[5],q[24];
-rz(5.500802569806137) q[24];
-cx q[5],q[24];
-ry(pi/2) q[25];
-rx(pi) q[25];
-cx q[3],q[25];
-rz(5.500802569806137) q[25];
-cx q[3],q[25];
-cx q[12],q[25];
-rz(5.500802569806137) q[25];
-cx q[12],q[25];
-rx(3.970747044065281) q[25];
-ry(pi/2) q[26];
-rx(pi) q[26];
-cx q[3],q[26];
-rz(5.500802569806137) q[26];
-cx q[3],q[26];
-cx q[21],q[26];
-rz(5.500802569806137) q[26];
-cx q[21],q[26];
-ry(pi/2) q[27];
-rx(pi) q[27];
-cx q[4],q[27];
-rz(5.500802569806137) q[27];
-cx q[4],q[27];
-cx q[6],q[27];
-rz(5.500802569806137) q[27];
-cx q[6],q[27];
-rx(3.970747044065281) q[6];
-ry(pi/2) q[28];
-rx(pi) q[28];
-cx q[1],q[28];
-rz(5.500802569806137) q[28];
-cx q[1],q[28];
-cx q[3],q[28];
-rz(5.500802569806137) q[28];
-cx q[3],q[28];
-ry(pi/2) q[29];
-rx(pi) q[29];
-cx q[1],q[29];
-rz(5.500802569806137) q[29];
-cx q[1],q[29];
-cx q[3],q[29];
-rz(5.500802569806137) q[29];
-cx q[3],q[29];
-rx(3.970747044065281) q[29];
-ry(pi/2) q[30];
-rx(pi) q[30];
-cx q[3],q[30];
-rz(5.500802569806137) q[30];
-cx q[3],q[30];
-cx q[18],q[30];
-rz(5.500802569806137) q[30];
-cx q[18],q[30];
-rx(3.970747044065281) q[18];
-ry(pi/2) q[31];
-rx(pi) q[31];
-cx q[12],q[31];
-rz(5.500802569806137) q[31];
-cx q[12],q[31];
-cx q[26],q[31];
-rz(5.500802569806137) q[31];
-cx q[26],q[31];
-rx(3.970747044065281) q[26];
-rx(3.970747044065281) q[31];
-ry(pi/2) q[32];
-rx(pi) q[32];
-cx q[0],q[32];
-rz(5.500802569806137) q[32];
-cx q[0],q[32];
-cx q[21],q[32];
-rz(5.500802569806137) q[32];
-cx q[21],q[32];
-ry(pi/2) q[33];
-rx(pi) q[33];
-cx q[5],q[33];
-rz(5.500802569806137) q[33];
-cx q[5],q[33];
-cx q[30],q[33];
-rz(5.500802569806137) q[33];
-cx q[30],q[33];
-rx(3.970747044065281) q[33];
-ry(pi/2) q[34];
-rx(pi) q[34];
-cx q[3],q[34];
-rz(5.500802569806137) q[34];
-cx q[3],q[34];
-cx q[12],q[34];
-rz(5.500802569806137) q[34];
-cx q[12],q[34];
-ry(pi/2) q[35];
-rx(pi) q[35];
-cx q[3],q[35];
-rz(5.500802569806137) q[35];
-cx q[3],q[35];
-cx q[32],q[35];
-rz(5.500802569806137) q[35];
-cx q[32],q[35];
-rx(3.970747044065281) q[35];
-ry(pi/2) q[36];
-rx(pi) q[36];
-cx q[15],q[36];
-rz(5.500802569806137) q[36];
-cx q[15],q[36];
-cx q[20],q[36];
-rz(5.500802569806137) q[36];
-cx q[20],q[36];
-rx(3.970747044065281) q[36];
-ry(pi/2) q[37];
-rx(pi) q[37];
-cx q[10],q[37];
-rz(5.500802569806137) q[37];
-cx q[10],q[37];
-cx q[34],q[37];
-rz(5.500802569806137) q[37];
-cx q[34],q[37];
-rx(3.970747044065281) q[34];
-rx(3.970747044065281) q[37];
-ry(pi/2) q[38];
-rx(pi) q[38];
-cx q[19],q[38];
-rz(5.500802569806137) q[38];
-cx q[19],q[38];
-rx(3.970747044065281) q[19];
-cx q[21],q[38];
-rz(5.500802569806137) q[38];
-cx q[21],q[38];
-ry(pi/2) q[39];
-rx(pi) q[39];
-cx q[3],q[39];
-rz(5.500802569806137) q[39];
-cx q[3],q[39];
-cx q[13],q[39];
-rz(5.500802569806137) q[39];
-cx q[13],q[39];
-rx(3.970747044065281) q[39];
-ry(pi/2) q[40];
-rx(pi) q[40];
-cx q[3],q[40];
-rz(5.500802569806137) q[40];
-cx q[3],q[40];
-cx q[23],q[40];
-rz(5.500802569806137) q[40];
-cx q[23],q[40];
-rx(3.970747044065281) q[23];
-rx(3.970747044065281) q[40];
-ry(pi/2) q[41];
-rx(pi) q[41];
-cx q[10],q[41];
-rz(5.500802569806137) q[41];
-cx q[10],q[41];
-cx q[27],q[41];
-rz(5.500802569806137) q[41];
-cx q[27],q[41];
-rx(3.970747044065281) q[27];
-rx(3.970747044065281) q[41];
-ry(pi/2) q[42];
-rx(pi) q[42];
-cx q[0],q[42];
-rz(5.500802569806137) q[42];
-cx q[0],q[42];
-cx q[3],q[42];
-rz(5.500802569806137) q[42];
-cx q[3],q[42];
-rx(3.970747044065281) q[42];
-ry(pi/2) q[43];
-rx(pi) q[43];
-cx q[3],q[43];
-rz(5.500802569806137) q[43];
-cx q[3],q[43];
-cx q[20],q[43];
-rz(5.500802569806137) q[43];
-cx q[20],q[43];
-rx(3.970747044065281) q[20];
-rx(3.970747044065281) q[43];
-ry(pi/2) q[44];
-rx(pi) q[44];
-cx q[3],q[44];
-rz(5.500802569806137) q[44];
-cx q[3],q[44];
-cx q[12],q[44];
-rz(5.500802569806137) q[44];
-cx q[12],q[44];
-rx(3.970747044065281) q[44];
-ry(pi/2) q[45];
-rx(pi) q[45];
-cx q[1],q[45];
-rz(5.500802569806137) q[45];
-cx q[1],q[45];
-cx q[16],q[45];
-rz(5.500802569806137) q[45];
-cx q[16],q[45];
-ry(pi/2) q[46];
-rx(pi) q[46];
-cx q[5],q[46];
-rz(5.500802569806137) q[46];
-cx q[5],q[46];
-rx(3.970747044065281) q[5];
-cx q[38],q[46];
-rz(5.500802569806137) q[46];
-cx q[38],q[46];
-rx(3.970747044065281) q[38];
-rx(3.970747044065281) q[46];
-ry(pi/2) q[47];
-rx(pi) q[47];
-cx q[4],q[47];
-rz(5.500802569806137) q[47];
-cx q[4],q[47];
-cx q[17],q[47];
-rz(5.500802569806137) q[47];
-cx q[17],q[47];
-rx(3.970747044065281) q[47];
-ry(pi/2) q[48];
-rx(pi) q[48];
-cx q[0],q[48];
-rz(5.500802569806137) q[48];
-cx q[0],q[48];
-cx q[30],q[48];
-rz(5.500802569806137) q[48];
-cx q[30],q[48];
-rx(3.970747044065281) q[30];
-rx(3.970747044065281) q[48];
-ry(pi/2) q[49];
-rx(pi) q[49];
-cx q[3],q[49];
-rz(5.500802569806137) q[49];
-cx q[3],q[49];
-cx q[4],q[49];
-rz(5.500802569806137) q[49];
-cx q[4],q[49];
-rx(3.970747044065281) q[4];
-rx(3.970747044065281) q[49];
-ry(pi/2) q[50];
-rx(pi) q[50];
-cx q[3],q[50];
-rz(5.500802569806137) q[50];
-cx q[3],q[50];
-cx q[12],q[50];
-rz(5.500802569806137) q[50];
-cx q[12],q[50];
-rx(3.970747044065281) q[12];
-rx(3.970747044065281) q[50];
-ry(pi/2) q[51];
-rx(pi) q[51];
-cx q[0],q[51];
-rz(5.500802569806137) q[51];
-cx q[0],q[51];
-rx(3.970747044065281) q[0];
-cx q[28],q[51];
-rz(5.500802569806137) q[51];
-cx q[28],q[51];
-rx(3.970747044065281) q[51];
-ry(pi/2) q[52];
-rx(pi) q[52];
-cx q[3],q[52];
-rz(5.500802569806137) q[52];
-cx q[3],q[52];
-cx q[10],q[52];
-rz(5.500802569806137) q[52];
-cx q[10],q[52];
-rx(3.970747044065281) q[10];
-rx(3.970747044065281) q[52];
-ry(pi/2) q[53];
-rx(pi) q[53];
-cx q[17],q[53];
-rz(5.500802569806137) q[53];
-cx q[17],q[53];
-rx(3.970747044065281) q[17];
-cx q[21],q[53];
-rz(5.500802569806137) q[53];
-cx q[21],q[53];
-rx(3.970747044065281) q[21];
-rx(3.970747044065281) q[53];
-ry(pi/2) q[54];
-rx(pi) q[54];
-cx q[24],q[54];
-rz(5.500802569806137) q[54];
-cx q[24],q[54];
-cx q[28],q[54];
-rz(5.500802569806137) q[54];
-cx q[28],q[54];
-rx(3.970747044065281) q[54];
-ry(pi/2) q[55];
-rx(pi) q[55];
-cx q[9],q[55];
-rz(5.500802569806137) q[55];
-cx q[9],q[55];
-rx(3.970747044065281) q[9];
-cx q[15],q[55];
-rz(5.500802569806137) q[55];
-cx q[15],q[55];
-rx(3.970747044065281) q[15];
-rx(3.970747044065281) q[55];
-ry(pi/2) q[56];
-rx(pi) q[56];
-cx q[13],q[56];
-rz(5.500802569806137) q[56];
-cx q[13],q[56];
-rx(3.970747044065281) q[13];
-cx q[45],q[56];
-rz(5.500802569806137) q[56];
-cx q[45],q[56];
-rx(3.970747044065281) q[45];
-rx(3.970747044065281) q[56];
-ry(pi/2) q[57];
-rx(pi) q[57];
-cx q[1],q[57];
-rz(5.500802569806137) q[57];
-cx q[1],q[57];
-rx(3.970747044065281) q[1];
-cx q[0],q[1];
-rz(3.9622398519479645) q[1];
-cx q[0],q[1];
-cx q[0],q[2];
-rz(3.9622398519479645) q[2];
-cx q[0],q[2];
-rx(6.503818773119884) q[2];
-cx q[3],q[57];
-rz(5.500802569806137) q[57];
-cx q[3],q[57];
-rx(3.970747044065281) q[3];
-cx q[0],q[3];
-rz(3.9622398519479645) q[3];
-cx q[0],q[3];
-cx q[0],q[15];
-cx q[1],q[3];
-rz(3.9622398519479645) q[3];
-cx q[1],q[3];
-cx q[1],q[4];
-rz(3.9622398519479645) q[4];
-cx q[1],q[4];
-cx q[1],q[5];
-cx q[3],q[4];
-rz(3.9622398519479645) q[4];
-cx q[3],q[4];
-cx q[4],q[6];
-rz(3.9622398519479645) q[5];
-cx q[1],q[5];
-cx q[1],q[9];
-cx q[3],q[5];
-rz(3.9622398519479645) q[5];
-cx q[3],q[5];
-cx q[3],q[7];
-rz(3.9622398519479645) q[6];
-cx q[4],q[6];
-cx q[5],q[6];
-rz(3.9622398519479645) q[6];
-cx q[5],q[6];
-rz(3.9622398519479645) q[7];
-cx q[3],q[7];
-cx q[3],q[8];
-cx q[4],q[7];
-rz(3.9622398519479645) q[7];
-cx q[4],q[7];
-cx q[4],q[10];
-rz(3.9622398519479645) q[8];
-cx q[3],q[8];
-cx q[5],q[8];
-rz(3.9622398519479645) q[8];
-cx q[5],q[8];
-cx q[5],q[11];
-rx(6.503818773119884) q[8];
-rz(3.9622398519479645) q[9];
-cx q[1],q[9];
-cx q[1],q[17];
-cx q[3],q[9];
-rz(3.9622398519479645) q[9];
-cx q[3],q[9];
-cx q[3],q[12];
-rz(3.9622398519479645) q[10];
-cx q[4],q[10];
-cx q[4],q[13];
-cx q[6],q[10];
-rz(3.9622398519479645) q[10];
-cx q[6],q[10];
-cx q[10],q[37];
-rz(3.9622398519479645) q[11];
-cx q[5],q[11];
-cx q[6],q[11];
-rz(3.9622398519479645) q[11];
-cx q[6],q[11];
-rx(6.503818773119884) q[11];
-rz(3.9622398519479645) q[12];
-cx q[3],q[12];
-cx q[3],q[14];
-cx q[5],q[12];
-rz(3.9622398519479645) q[12];
-cx q[5],q[12];
-rz(3.9622398519479645) q[13];
-cx q[4],q[13];
-cx q[5],q[13];
-rz(3.9622398519479645) q[13];
-cx q[5],q[13];
-rz(3.9622398519479645) q[14];
-cx q[3],q[14];
-cx q[4],q[14];
-rz(3.9622398519479645) q[14];
-cx q[4],q[14];
-rx(6.503818773119884) q[14];
-rz(3.9622398519479645) q[15];
-cx q[0],q[15];
-cx q[3],q[15];
-rz(3.9622398519479645) q[15];
-cx q[3],q[15];
-rz(3.9622398519479645) q[17];
-cx q[1],q[17];
-rz(3.9622398519479645) q[37];
-cx q[10],q[37];
-cx q[10],q[41];
-rz(3.9622398519479645) q[41];
-cx q[10],q[41];
-rx(3.970747044065281) q[57];
-ry(pi/2) q[58];
-rx(pi) q[58];
-cx q[24],q[58];
-rz(5.500802569806137) q[58];
-cx q[24],q[58];
-rx(3.970747044065281) q[24];
-cx q[28],q[58];
-rz(5.500802569806137) q[58];
-cx q[28],q[58];
-rx(3.970747044065281) q[28];
-cx q[1],q[28];
-rz(3.9622398519479645) q[28];
-cx q[1],q[28];
-cx q[1],q[29];
-rz(3.9622398519479645) q[29];
-cx q[1],q[29];
-cx q[1],q[45];
-rz(3.9622398519479645) q[45];
-cx q[1],q[45];
-cx q[1],q[57];
-rz(3.9622398519479645) q[57];
-cx q[1],q[57];
-rx(6.503818773119884) q[1];
-rx(3.970747044065281) q[58];
-ry(pi/2) q[59];
-rx(pi) q[59];
-cx q[16],q[59];
-rz(5.500802569806137) q[59];
-cx q[16],q[59];
-rx(3.970747044065281) q[16];
-cx q[0],q[16];
-rz(3.9622398519479645) q[16];
-cx q[0],q[16];
-cx q[0],q[20];
-cx q[3],q[16];
-rz(3.9622398519479645) q[16];
-cx q[3],q[16];
-cx q[3],q[17];
-cx q[16],q[45];
-rz(3.9622398519479645) q[17];
-cx q[3],q[17];
-cx q[3],q[18];
-rz(3.9622398519479645) q[18];
-cx q[3],q[18];
-cx q[3],q[19];
-cx q[4],q[18];
-rz(3.9622398519479645) q[18];
-cx q[4],q[18];
-cx q[4],q[21];
-rz(3.9622398519479645) q[19];
-cx q[3],q[19];
-cx q[3],q[22];
-cx q[7],q[19];
-rz(3.9622398519479645) q[19];
-cx q[7],q[19];
-rx(6.503818773119884) q[7];
-cx q[19],q[38];
-rz(3.9622398519479645) q[20];
-cx q[0],q[20];
-cx q[15],q[20];
-rz(3.9622398519479645) q[20];
-cx q[15],q[20];
-rz(3.9622398519479645) q[21];
-cx q[4],q[21];
-cx q[4],q[27];
-cx q[15],q[21];
-rz(3.9622398519479645) q[21];
-cx q[15],q[21];
-cx q[15],q[36];
-rz(3.9622398519479645) q[22];
-cx q[3],q[22];
-cx q[3],q[23];
-cx q[9],q[22];
-rz(3.9622398519479645) q[22];
-cx q[9],q[22];
-cx q[9],q[55];
-rx(6.503818773119884) q[22];
-rz(3.9622398519479645) q[23];
-cx q[3],q[23];
-cx q[3],q[24];
-cx q[17],q[23];
-rz(3.9622398519479645) q[23];
-cx q[17],q[23];
-rz(3.9622398519479645) q[24];
-cx q[3],q[24];
-cx q[3],q[25];
-cx q[5],q[24];
-rz(3.9622398519479645) q[24];
-cx q[5],q[24];
-cx q[5],q[33];
-cx q[24],q[54];
-rz(3.9622398519479645) q[25];
-cx q[3],q[25];
-cx q[3],q[26];
-cx q[12],q[25];
-rz(3.9622398519479645) q[25];
-cx q[12],q[25];
-cx q[12],q[31];
-rx(6.503818773119884) q[25];
-rz(3.9622398519479645) q[26];
-cx q[3],q[26];
-cx q[3],q[28];
-cx q[21],q[26];
-rz(3.9622398519479645) q[26];
-cx q[21],q[26];
-rz(3.9622398519479645) q[27];
-cx q[4],q[27];
-cx q[4],q[47];
-cx q[6],q[27];
-rz(3.9622398519479645) q[27];
-cx q[6],q[27];
-rx(6.503818773119884) q[6];
-cx q[27],q[41];
-rz(3.9622398519479645) q[28];
-cx q[3],q[28];
-cx q[3],q[29];
-rz(3.9622398519479645) q[29];
-cx q[3],q[29];
-cx q[3],q[30];
-rx(6.503818773119884) q[29];
-rz(3.9622398519479645) q[30];
-cx q[3],q[30];
-cx q[3],q[34];
-cx q[18],q[30];
-rz(3.9622398519479645) q[30];
-cx q[18],q[30];
-rx(6.503818773119884) q[18];
-rz(3.9622398519479645) q[31];
-cx q[12],q[31];
-cx q[26],q[31];
-rz(3.9622398519479645) q[31];
-cx q[26],q[31];
-rx(6.503818773119884) q[26];
-rx(6.503818773119884) q[31];
-cx q[32],q[59];
-rz(3.9622398519479645) q[33];
-cx q[5],q[33];
-cx q[5],q[46];
-cx q[30],q[33];
-rz(3.9622398519479645) q[33];
-cx q[30],q[33];
-rx(6.503818773119884) q[33];
-rz(3.9622398519479645) q[34];
-cx q[3],q[34];
-cx q[3],q[35];
-cx q[12],q[34];
-rz(3.9622398519479645) q[34];
-cx q[12],q[34];
-cx q[34],q[37];
-rz(3.9622398519479645) q[35];
-cx q[3],q[35];
-cx q[3],q[39];
-rz(3.9622398519479645) q[36];
-cx q[15],q[36];
-cx q[20],q[36];
-rz(3.9622398519479645) q[36];
-cx q[20],q[36];
-rx(6.503818773119884) q[36];
-rz(3.9622398519479645) q[37];
-cx q[34],q[37];
-rx(6.503818773119884) q[34];
-rx(6.503818773119884) q[37];
-rz(3.9622398519479645) q[38];
-cx q[19],q[38];
-rx(6.503818773119884) q[19];
-rz(3.9622398519479645) q[39];
-cx q[3],q[39];
-cx q[3],q[40];
-cx q[13],q[39];
-rz(3.9622398519479645) q[39];
-cx q[13],q[39];
-cx q[13],q[56];
-rx(6.503818773119884) q[39];
-rz(3.9622398519479645) q[40];
-cx q[3],q[40];
-cx q[23],q[40];
-rz(3.9622398519479645) q[40];
-cx q[23],q[40];
-rx(6.503818773119884) q[23];
-rx(6.503818773119884) q[40];
-rz(3.9622398519479645) q[41];
-cx q[27],q[41];
-rx(6.503818773119884) q[27];
-rx(6.503818773119884) q[41];
-rz(3.9622398519479645) q[45];
-cx q[16],q[45];
-rz(3.9622398519479645) q[46];
-cx q[5],q[46];
-rx(6.503818773119884) q[5];
-rz(3.9622398519479645) q[47];
-cx q[4],q[47];
-cx q[17],q[47];
-rz(3.9622398519479645) q[47];
-cx q[17],q[47];
-cx q[17],q[53];
-rx(6.503818773119884) q[47];
-rz(3.9622398519479645) q[53];
-cx q[17],q[53];
-rx(6.503818773119884) q[17];
-rz(3.9622398519479645) q[54];
-cx q[24],q[54];
-cx q[24],q[58];
-rz(3.9622398519479645) q[55];
-cx q[9],q[55];
-rx(6.503818773119884) q[9];
-cx q[15],q[55];
-rz(3.9622398519479645) q[55];
-cx q[15],q[55];
-rx(6.503818773119884) q[15];
-rx(6.503818773119884) q[55];
-rz(3.9622398519479645) q[56];
-cx q[13],q[56];
-rx(6.503818773119884) q[13];
-cx q[45],q[56];
-rz(3.9622398519479645) q[56];
-cx q[45],q[56];
-rx(6.503818773119884) q[45];
-rx(6.503818773119884) q[56];
-rz(3.9622398519479645) q[58];
-cx q[24],q[58];
-rx(6.503818773119884) q[24];
-rz(5.500802569806137) q[59];
-cx q[32],q[59];
-rx(3.970747044065281) q[32];
-cx q[0],q[32];
-rz(3.9622398519479645) q[32];
-cx q[0],q[32];
-cx q[0],q[42];
-cx q[21],q[32];
-rz(3.9622398519479645) q[32];
-cx q[21],q[32];
-cx q[21],q[38];
-cx q[32],q[35];
-rz(3.9622398519479645) q[35];
-cx q[32],q[35];
-rx(6.503818773119884) q[35];
-rz(3.9622398519479645) q[38];
-cx q[21],q[38];
-cx q[21],q[53];
-cx q[38],q[46];
-rz(3.9622398519479645) q[42];
-cx q[0],q[42];
-cx q[0],q[48];
-cx q[3],q[42];
-rz(3.9622398519479645) q[42];
-cx q[3],q[42];
-cx q[3],q[43];
-rx(6.503818773119884) q[42];
-rz(3.9622398519479645) q[43];
-cx q[3],q[43];
-cx q[3],q[44];
-cx q[20],q[43];
-rz(3.9622398519479645) q[43];
-cx q[20],q[43];
-rx(6.503818773119884) q[20];
-rx(6.503818773119884) q[43];
-rz(3.9622398519479645) q[44];
-cx q[3],q[44];
-cx q[3],q[49];
-cx q[12],q[44];
-rz(3.9622398519479645) q[44];
-cx q[12],q[44];
-rx(6.503818773119884) q[44];
-rz(3.9622398519479645) q[46];
-cx q[38],q[46];
-rx(6.503818773119884) q[38];
-rx(6.503818773119884) q[46];
-rz(3.9622398519479645) q[48];
-cx q[0],q[48];
-cx q[0],q[51];
-cx q[30],q[48];
-rz(3.9622398519479645) q[48];
-cx q[30],q[48];
-rx(6.503818773119884) q[30];
-rx(6.503818773119884) q[48];
-rz(3.9622398519479645) q[49];
-cx q[3],q[49];
-cx q[3],q[50];
-cx q[4],q[49];
-rz(3.9622398519479645) q[49];
-cx q[4],q[49];
-rx(6.503818773119884) q[4];
-rx(6.503818773119884) q[49];
-rz(3.9622398519479645) q[50];
-cx q[3],q[50];
-cx q[3],q[52];
-cx q[12],q[50];
-rz(3.9622398519479645) q[50];
-cx q[12],q[50];
-rx(6.503818773119884) q[12];
-rx(6.503818773119884) q[50];
-rz(3.9622398519479645) q[51];
-cx q[0],q[51];
-rx(6.503818773119884) q[0];
-cx q[0],q[1];
-rz(6.191302765721446) q[1];
-cx q[0],q[1];
-cx q[0],q[2];
-rz(6.191302765721446) q[2];
-cx q[0],q[2];
-rx(10.717691761318035) q[2];
-cx q[28],q[51];
-rz(3.9622398519479645) q[51];
-cx q[28],q[51];
-cx q[28],q[54];
-rx(6.503818773119884) q[51];
-rz(3.9622398519479645) q[52];
-cx q[3],q[52];
-cx q[3],q[57];
-cx q[10],q[52];
-rz(3.9622398519479645) q[52];
-cx q[10],q[52];
-rx(6.503818773119884) q[10];
-rx(6.503818773119884) q[52];
-rz(3.9622398519479645) q[53];
-cx q[21],q[53];
-rx(6.503818773119884) q[21];
-rx(6.503818773119884) q[53];
-rz(3.9622398519479645) q[54];
-cx q[28],q[54];
-cx q[28],q[58];
-rx(6.503818773119884) q[54];
-rz(3.9622398519479645) q[57];
-cx q[3],q[57];
-rx(6.503818773119884) q[3];
-cx q[0],q[3];
-rz(6.191302765721446) q[3];
-cx q[0],q[3];
-cx q[0],q[15];
-cx q[1],q[3];
-rz(6.191302765721446) q[3];
-cx q[1],q[3];
-cx q[1],q[4];
-rz(6.191302765721446) q[4];
-cx q[1],q[4];
-cx q[1],q[5];
-cx q[3],q[4];
-rz(6.191302765721446) q[4];
-cx q[3],q[4];
-cx q[4],q[6];
-rz(6.191302765721446) q[5];
-cx q[1],q[5];
-cx q[1],q[9];
-cx q[3],q[5];
-rz(6.191302765721446) q[5];
-cx q[3],q[5];
-cx q[3],q[7];
-rz(6.191302765721446) q[6];
-cx q[4],q[6];
-cx q[5],q[6];
-rz(6.191302765721446) q[6];
-cx q[5],q[6];
-rz(6.191302765721446) q[7];
-cx q[3],q[7];
-cx q[3],q[8];
-cx q[4],q[7];
-rz(6.191302765721446) q[7];
-cx q[4],q[7];
-cx q[4],q[10];
-rz(6.191302765721446) q[8];
-cx q[3],q[8];
-cx q[5],q[8];
-rz(6.191302765721446) q[8];
-cx q[5],q[8];
-cx q[5],q[11];
-rx(10.717691761318035) q[8];
-rz(6.191302765721446) q[9];
-cx q[1],q[9];
-cx q[1],q[17];
-cx q[3],q[9];
-rz(6.191302765721446) q[9];
-cx q[3],q[9];
-cx q[3],q[12];
-rz(6.191302765721446) q[10];
-cx q[4],q[10];
-cx q[4],q[13];
-cx q[6],q[10];
-rz(6.191302765721446) q[10];
-cx q[6],q[10];
-cx q[10],q[37];
-rz(6.191302765721446) q[11];
-cx q[5],q[11];
-cx q[6],q[11];
-rz(6.191302765721446) q[11];
-cx q[6],q[11];
-rx(10.717691761318035) q[11];
-rz(6.191302765721446) q[12];
-cx q[3],q[12];
-cx q[3],q[14];
-cx q[5],q[12];
-rz(6.191302765721446) q[12];
-cx q[5],q[12];
-rz(6.191302765721446) q[13];
-cx q[4],q[13];
-cx q[5],q[13];
-rz(6.191302765721446) q[13];
-cx q[5],q[13];
-rz(6.191302765721446) q[14];
-cx q[3],q[14];
-cx q[4],q[14];
-rz(6.191302765721446) q[14];
-cx q[4],q[14];
-rx(10.717691761318035) q[14];
-rz(6.191302765721446) q[15];
-cx q[0],q[15];
-cx q[3],q[15];
-rz(6.191302765721446) q[15];
-cx q[3],q[15];
-rz(6.191302765721446) q[17];
-cx q[1],q[17];
-rz(6.191302765721446) q[37];
-cx q[10],q[37];
-cx q[10],q[41];
-rz(6.191302765721446) q[41];
-cx q[10],q[41];
-rx(6.503818773119884) q[57];
-rz(3.9622398519479645) q[58];
-cx q[28],q[58];
-rx(6.503818773119884) q[28];
-cx q[1],q[28];
-rz(6.191302765721446) q[28];
-cx q[1],q[28];
-cx q[1],q[29];
-rz(6.191302765721446) q[29];
-cx q[1],q[29];
-cx q[1],q[45];
-rz(6.191302765721446) q[45];
-cx q[1],q[45];
-cx q[1],q[57];
-rz(6.191302765721446) q[57];
-cx q[1],q[57];
-rx(10.717691761318035) q[1];
-rx(6.503818773119884) q[58];
-rx(3.970747044065281) q[59];
-cx q[16],q[59];
-rz(3.9622398519479645) q[59];
-cx q[16],q[59];
-rx(6.503818773119884) q[16];
-cx q[0],q[16];
-rz(6.191302765721446) q[16];
-cx q[0],q[16];
-cx q[0],q[20];
-cx q[3],q[16];
-rz(6.191302765721446) q[16];
-cx q[3],q[16];
-cx q[3],q[17];
-cx q[16],q[45];
-rz(6.191302765721446) q[17];
-cx q[3],q[17];
-cx q[3],q[18];
-rz(6.191302765721446) q[18];
-cx q[3],q[18];
-cx q[3],q[19];
-cx q[4],q[18];
-rz(6.191302765721446) q[18];
-cx q[4],q[18];
-cx q[4],q[21];
-rz(6.191302765721446) q[19];
-cx q[3],q[19];
-cx q[3],q[22];
-cx q[7],q[19];
-rz(6.191302765721446) q[19];
-cx q[7],q[19];
-rx(10.717691761318035) q[7];
-cx q[19],q[38];
-rz(6.191302765721446) q[20];
-cx q[0],q[20];
-cx q[15],q[20];
-rz(6.191302765721446) q[20];
-cx q[15],q[20];
-rz(6.191302765721446) q[21];
-cx q[4],q[21];
-cx q[4],q[27];
-cx q[15],q[21];
-rz(6.191302765721446) q[21];
-cx q[15],q[21];
-cx q[15],q[36];
-rz(6.191302765721446) q[22];
-cx q[3],q[22];
-cx q[3],q[23];
-cx q[9],q[22];
-rz(6.191302765721446) q[22];
-cx q[9],q[22];
-cx q[9],q[55];
-rx(10.717691761318035) q[22];
-rz(6.191302765721446) q[23];
-cx q[3],q[23];
-cx q[3],q[24];
-cx q[17],q[23];
-rz(6.191302765721446) q[23];
-cx q[17],q[23];
-rz(6.191302765721446) q[24];
-cx q[3],q[24];
-cx q[3],q[25];
-cx q[5],q[24];
-rz(6.191302765721446) q[24];
-cx q[5],q[24];
-cx q[5],q[33];
-cx q[24],q[54];
-rz(6.191302765721446) q[25];
-cx q[3],q[25];
-cx q[3],q[26];
-cx q[12],q[25];
-rz(6.191302765721446) q[25];
-cx q[12],q[25];
-cx q[12],q[31];
-rx(10.717691761318035) q[25];
-rz(6.191302765721446) q[26];
-cx q[3],q[26];
-cx q[3],q[28];
-cx q[21],q[26];
-rz(6.191302765721446) q[26];
-cx q[21],q[26];
-rz(6.191302765721446) q[27];
-cx q[4],q[27];
-cx q[4],q[47];
-cx q[6],q[27];
-rz(6.191302765721446) q[27];
-cx q[6],q[27];
-rx(10.717691761318035) q[6];
-cx q[27],q[41];
-rz(6.191302765721446) q[28];
-cx q[3],q[28];
-cx q[3],q[29];
-rz(6.191302765721446) q[29];
-cx q[3],q[29];
-cx q[3],q[30];
-rx(10.717691761318035) q[29];
-rz(6.191302765721446) q[30];
-cx q[3],q[30];
-cx q[3],q[34];
-cx q[18],q[30];
-rz(6.191302765721446) q[30];
-cx q[18],q[30];
-rx(10.717691761318035) q[18];
-rz(6.191302765721446) q[31];
-cx q[12],q[31];
-cx q[26],q[31];
-rz(6.191302765721446) q[31];
-cx q[26],q[31];
-rx(10.717691761318035) q[26];
-rx(10.717691761318035) q[31];
-cx q[32],q[59];
-rz(6.191302765721446) q[33];
-cx q[5],q[33];
-cx q[5],q[46];
-cx q[30],q[33];
-rz(6.191302765721446) q[33];
-cx q[30],q[33];
-rx(10.717691761318035) q[33];
-rz(6.191302765721446) q[34];
-cx q[3],q[34];
-cx q[3],q[35];
-cx q[12],q[34];
-rz(6.191302765721446) q[34];
-cx q[12],q[34];
-cx q[34],q[37];
-rz(6.191302765721446) q[35];
-cx q[3],q[35];
-cx q[3],q[39];
-rz(6.191302765721446) q[36];
-cx q[15],q[36];
-cx q[20],q[36];
-rz(6.191302765721446) q[36];
-cx q[20],q[36];
-rx(10.717691761318035) q[36];
-rz(6.191302765721446) q[37];
-cx q[34],q[37];
-rx(10.717691761318035) q[34];
-rx(10.717691761318035) q[37];
-rz(6.191302765721446) q[38];
-cx q[19],q[38];
-rx(10.717691761318035) q[19];
-rz(6.191302765721446) q[39];
-cx q[3],q[39];
-cx q[3],q[40];
-cx q[13],q[39];
-rz(6.191302765721446) q[39];
-cx q[13],q[39];
-cx q[13],q[56];
-rx(10.717691761318035) q[39];
-rz(6.191302765721446) q[40];
-cx q[3],q[40];
-cx q[23],q[40];
-rz(6.191302765721446) q[40];
-cx q[23],q[40];
-rx(10.717691761318035) q[23];
-rx(10.717691761318035) q[40];
-rz(6.191302765721446) q[41];
-cx q[27],q[41];
-rx(10.717691761318035) q[27];
-rx(10.717691761318035) q[41];
-rz(6.191302765721446) q[45];
-cx q[16],q[45];
-rz(6.191302765721446) q[46];
-cx q[5],q[46];
-rx(10.717691761318035) q[5];
-rz(6.191302765721446) q[47];
-cx q[4],q[47];
-cx q[17],q[47];
-rz(6.191302765721446) q[47];
-cx q[17],q[47];
-cx q[17],q[53];
-rx(10.717691761318035) q[47];
-rz(6.191302765721446) q[53];
-cx q[17],q[53];
-rx(10.717691761318035) q[17];
-rz(6.191302765721446) q[54];
-cx q[24],q[54];
-cx q[24],q[58];
-rz(6.191302765721446) q[55];
-cx q[9],q[55];
-rx(10.717691761318035) q[9];
-cx q[15],q[55];
-rz(6.191302765721446) q[55];
-cx q[15],q[55];
-rx(10.717691761318035) q[15];
-rx(10.717691761318035) q[55];
-rz(6.191302765721446) q[56];
-cx q[13],q[56];
-rx(10.717691761318035) q[13];
-cx q[45],q[56];
-rz(6.191302765721446) q[56];
-cx q[45],q[56];
-rx(10.717691761318035) q[45];
-rx(10.717691761318035) q[56];
-rz(6.191302765721446) q[58];
-cx q[24],q[58];
-rx(10.717691761318035) q[24];
-rz(3.9622398519479645) q[59];
-cx q[32],q[59];
-rx(6.503818773119884) q[32];
-cx q[0],q[32];
-rz(6.191302765721446) q[32];
-cx q[0],q[32];
-cx q[0],q[42];
-cx q[21],q[32];
-rz(6.191302765721446) q[32];
-cx q[21],q[32];
-cx q[21],q[38];
-cx q[32],q[35];
-rz(6.191302765721446) q[35];
-cx q[32],q[35];
-rx(10.717691761318035) q[35];
-rz(6.191302765721446) q[38];
-cx q[21],q[38];
-cx q[21],q[53];
-cx q[38],q[46];
-rz(6.191302765721446) q[42];
-cx q[0],q[42];
-cx q[0],q[48];
-cx q[3],q[42];
-rz(6.191302765721446) q[42];
-cx q[3],q[42];
-cx q[3],q[43];
-rx(10.717691761318035) q[42];
-rz(6.191302765721446) q[43];
-cx q[3],q[43];
-cx q[3],q[44];
-cx q[20],q[43];
-rz(6.191302765721446) q[43];
-cx q[20],q[43];
-rx(10.717691761318035) q[20];
-rx(10.717691761318035) q[43];
-rz(6.191302765721446) q[44];
-cx q[3],q[44];
-cx q[3],q[49];
-cx q[12],q[44];
-rz(6.191302765721446) q[44];
-cx q[12],q[44];
-rx(10.717691761318035) q[44];
-rz(6.191302765721446) q[46];
-cx q[38],q[46];
-rx(10.717691761318035) q[38];
-rx(10.717691761318035) q[46];
-rz(6.191302765721446) q[48];
-cx q[0],q[48];
-cx q[0],q[51];
-cx q[30],q[48];
-rz(6.191302765721446) q[48];
-cx q[30],q[48];
-rx(10.717691761318035) q[30];
-rx(10.717691761318035) q[48];
-rz(6.191302765721446) q[49];
-cx q[3],q[49];
-cx q[3],q[50];
-cx q[4],q[49];
-rz(6.191302765721446) q[49];
-cx q[4],q[49];
-rx(10.717691761318035) q[4];
-rx(10.717691761318035) q[49];
-rz(6.191302765721446) q[50];
-cx q[3],q[50];
-cx q[3],q[52];
-cx q[12],q[50];
-rz(6.191302765721446) q[50];
-cx q[12],q[50];
-rx(10.717691761318035) q[12];
-rx(10.717691761318035) q[50];
-rz(6.191302765721446) q[51];
-cx q[0],q[51];
-rx(10.717691761318035) q[0];
-cx q[28],q[51];
-rz(6.191302765721446) q[51];
-cx q[28],q[51];
-cx q[28],q[54];
-rx(10.717691761318035) q[51];
-rz(6.191302765721446) q[52];
-cx q[3],q[52];
-cx q[3],q[57];
-cx q[10],q[52];
-rz(6.191302765721446) q[52];
-cx q[10],q[52];
-rx(10.717691761318035) q[10];
-rx(10.717691761318035) q[52];
-rz(6.191302765721446) q[53];
-cx q[21],q[53];
-rx(10.717691761318035) q[21];
-rx(10.717691761318035) q[53];
-rz(6.191302765721446) q[54];
-cx q[28],q[54];
-cx q[28],q[58];
-rx(10.717691761318035) q[54];
-rz(6.191302765721446) q[57];
-cx q[3],q[57];
-rx(10.717691761318035) q[3];
-rx(10.717691761318035) q[57];
-rz(6.191302765721446) q[58];
-cx q[28],q[58];
-rx(10.717691761318035) q[28];
-rx(10.717691761318035) q[58];
-rx(6.503818773119884) q[59];
-cx q[16],q[59];
-rz(6.191302765721446) q[59];
-cx q[16],q[59];
-rx(10.717691761318035) q[16];
-cx q[32],q[59];
-rz(6.191302765721446) q[59];
-cx q[32],q[59];
-rx(10.717691761318035) q[32];
-rx(10.717691761318035) q[59];
\ No newline at end of file
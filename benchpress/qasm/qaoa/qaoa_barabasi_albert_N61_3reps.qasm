@@ -1,1370 +0,0 @@
-OPENQASM 2.0;
-include "qelib1.inc";
-qreg q[61];
-ry(pi/2) q[0];
-rx(pi) q[0];
-ry(pi/2) q[1];
-rx(pi) q[1];
-cx q[0],q[1];
-rz(1.854880992769599) q[1];
-cx q[0],q[1];
-ry(pi/2) q[2];
-rx(pi) q[2];
-cx q[0],q[2];
-rz(1.854880992769599) q[2];
-cx q[0],q[2];
-rx(3.0742962404123704) q[2];
-ry(pi/2) q[3];
-rx(pi) q[3];
-cx q[0],q[3];
-rz(1.854880992769599) q[3];
-cx q[0],q[3];
-cx q[1],q[3];
-rz(1.854880992769599) q[3];
-cx q[1],q[3];
-ry(pi/2) q[4];
-rx(pi) q[4];
-cx q[1],q[4];
-rz(1.854880992769599) q[4];
-cx q[1],q[4];
-cx q[3],q[4];
-rz(1.854880992769599) q[4];
-cx q[3],q[4];
-ry(pi/2) q[5];
-rx(pi) q[5];
-cx q[1],q[5];
-rz(1.854880992769599) q[5];
-cx q[1],q[5];
-cx q[3],q[5];
-rz(1.854880992769599) q[5];
-cx q[3],q[5];
-ry(pi/2) q[6];
-rx(pi) q[6];
-cx q[4],q[6];
-rz(1.854880992769599) q[6];
-cx q[4],q[6];
-cx q[5],q[6];
-rz(1.854880992769599) q[6];
-cx q[5],q[6];
-ry(pi/2) q[7];
-rx(pi) q[7];
-cx q[3],q[7];
-rz(1.854880992769599) q[7];
-cx q[3],q[7];
-cx q[4],q[7];
-rz(1.854880992769599) q[7];
-cx q[4],q[7];
-ry(pi/2) q[8];
-rx(pi) q[8];
-cx q[3],q[8];
-rz(1.854880992769599) q[8];
-cx q[3],q[8];
-cx q[5],q[8];
-rz(1.854880992769599) q[8];
-cx q[5],q[8];
-rx(3.0742962404123704) q[8];
-ry(pi/2) q[9];
-rx(pi) q[9];
-cx q[1],q[9];
-rz(1.854880992769599) q[9];
-cx q[1],q[9];
-cx q[3],q[9];
-rz(1.854880992769599) q[9];
-cx q[3],q[9];
-ry(pi/2) q[10];
-rx(pi) q[10];
-cx q[4],q[10];
-rz(1.854880992769599) q[10];
-cx q[4],q[10];
-cx q[6],q[10];
-rz(1.854880992769599) q[10];
-cx q[6],q[10];
-ry(pi/2) q[11];
-rx(pi) q[11];
-cx q[5],q[11];
-rz(1.854880992769599) q[11];
-cx q[5],q[11];
-cx q[6],q[11];
-rz(1.854880992769599) q[11];
-cx q[6],q[11];
-rx(3.0742962404123704) q[11];
-ry(pi/2) q[12];
-rx(pi) q[12];
-cx q[3],q[12];
-rz(1.854880992769599) q[12];
-cx q[3],q[12];
-cx q[5],q[12];
-rz(1.854880992769599) q[12];
-cx q[5],q[12];
-ry(pi/2) q[13];
-rx(pi) q[13];
-cx q[4],q[13];
-rz(1.854880992769599) q[13];
-cx q[4],q[13];
-cx q[5],q[13];
-rz(1.854880992769599) q[13];
-cx q[5],q[13];
-ry(pi/2) q[14];
-rx(pi) q[14];
-cx q[3],q[14];
-rz(1.854880992769599) q[14];
-cx q[3],q[14];
-cx q[4],q[14];
-rz(1.854880992769599) q[14];
-cx q[4],q[14];
-rx(3.0742962404123704) q[14];
-ry(pi/2) q[15];
-rx(pi) q[15];
-cx q[0],q[15];
-rz(1.854880992769599) q[15];
-cx q[0],q[15];
-cx q[3],q[15];
-rz(1.854880992769599) q[15];
-cx q[3],q[15];
-ry(pi/2) q[16];
-rx(pi) q[16];
-cx q[0],q[16];
-rz(1.854880992769599) q[16];
-cx q[0],q[16];
-cx q[3],q[16];
-rz(1.854880992769599) q[16];
-cx q[3],q[16];
-ry(pi/2) q[17];
-rx(pi) q[17];
-cx q[1],q[17];
-rz(1.854880992769599) q[17];
-cx q[1],q[17];
-cx q[3],q[17];
-rz(1.854880992769599) q[17];
-cx q[3],q[17];
-ry(pi/2) q[18];
-rx(pi) q[18];
-cx q[3],q[18];
-rz(1.854880992769599) q[18];
-cx q[3],q[18];
-cx q[4],q[18];
-rz(1.854880992769599) q[18];
-cx q[4],q[18];
-ry(pi/2) q[19];
-rx(pi) q[19];
-cx q[3],q[19];
-rz(1.854880992769599) q[19];
-cx q[3],q[19];
-cx q[7],q[19];
-rz(1.854880992769599) q[19];
-cx q[7],q[19];
-ry(pi/2) q[20];
-rx(pi) q[20];
-cx q[0],q[20];
-rz(1.854880992769599) q[20];
-cx q[0],q[20];
-cx q[15],q[20];
-rz(1.854880992769599) q[20];
-cx q[15],q[20];
-ry(pi/2) q[21];
-rx(pi) q[21];
-cx q[4],q[21];
-rz(1.854880992769599) q[21];
-cx q[4],q[21];
-cx q[15],q[21];
-rz(1.854880992769599) q[21];
-cx q[15],q[21];
-ry(pi/2) q[22];
-rx(pi) q[22];
-cx q[3],q[22];
-rz(1.854880992769599) q[22];
-cx q[3],q[22];
-cx q[9],q[22];
-rz(1.854880992769599) q[22];
-cx q[9],q[22];
-rx(3.0742962404123704) q[22];
-ry(pi/2) q[23];
-rx(pi) q[23];
-cx q[3],q[23];
-rz(1.854880992769599) q[23];
-cx q[3],q[23];
-cx q[17],q[23];
-rz(1.854880992769599) q[23];
-cx q[17],q[23];
-ry(pi/2) q[24];
-rx(pi) q[24];
-cx q[3],q[24];
-rz(1.854880992769599) q[24];
-cx q[3],q[24];
-cx q[5],q[24];
-rz(1.854880992769599) q[24];
-cx q[5],q[24];
-ry(pi/2) q[25];
-rx(pi) q[25];
-cx q[3],q[25];
-rz(1.854880992769599) q[25];
-cx q[3],q[25];
-cx q[12],q[25];
-rz(1.854880992769599) q[25];
-cx q[12],q[25];
-rx(3.0742962404123704) q[25];
-ry(pi/2) q[26];
-rx(pi) q[26];
-cx q[3],q[26];
-rz(1.854880992769599) q[26];
-cx q[3],q[26];
-cx q[21],q[26];
-rz(1.854880992769599) q[26];
-cx q[21],q[26];
-ry(pi/2) q[27];
-rx(pi) q[27];
-cx q[4],q[27];
-rz(1.854880992769599) q[27];
-cx q[4],q[27];
-cx q[6],q[27];
-rz(1.854880992769599) q[27];
-cx q[6],q[27];
-rx(3.0742962404123704) q[6];
-ry(pi/2) q[28];
-rx(pi) q[28];
-cx q[1],q[28];
-rz(1.854880992769599) q[28];
-cx q[1],q[28];
-cx q[3],q[28];
-rz(1.854880992769599) q[28];
-cx q[3],q[28];
-ry(pi/2) q[29];
-rx(pi) q[29];
-cx q[1],q[29];
-rz(1.854880992769599) q[29];
-cx q[1],q[29];
-cx q[3],q[29];
-rz(1.854880992769599) q[29];
-cx q[3],q[29];
-rx(3.0742962404123704) q[29];
-ry(pi/2) q[30];
-rx(pi) q[30];
-cx q[3],q[30];
-rz(1.854880992769599) q[30];
-cx q[3],q[30];
-cx q[18],q[30];
-rz(1.854880992769599) q[30];
-cx q[18],q[30];
-rx(3.0742962404123704) q[18];
-ry(pi/2) q[31];
-rx(pi) q[31];
-cx q[12],q[31];
-rz(1.854880992769599) q[31];
-cx q[12],q[31];
-cx q[26],q[31];
-rz(1.854880992769599) q[31];
-cx q[26],q[31];
-rx(3.0742962404123704) q[26];
-rx(3.0742962404123704) q[31];
-ry(pi/2) q[32];
-rx(pi) q[32];
-cx q[0],q[32];
-rz(1.854880992769599) q[32];
-cx q[0],q[32];
-cx q[21],q[32];
-rz(1.854880992769599) q[32];
-cx q[21],q[32];
-ry(pi/2) q[33];
-rx(pi) q[33];
-cx q[5],q[33];
-rz(1.854880992769599) q[33];
-cx q[5],q[33];
-cx q[30],q[33];
-rz(1.854880992769599) q[33];
-cx q[30],q[33];
-rx(3.0742962404123704) q[33];
-ry(pi/2) q[34];
-rx(pi) q[34];
-cx q[3],q[34];
-rz(1.854880992769599) q[34];
-cx q[3],q[34];
-cx q[12],q[34];
-rz(1.854880992769599) q[34];
-cx q[12],q[34];
-ry(pi/2) q[35];
-rx(pi) q[35];
-cx q[3],q[35];
-rz(1.854880992769599) q[35];
-cx q[3],q[35];
-cx q[32],q[35];
-rz(1.854880992769599) q[35];
-cx q[32],q[35];
-rx(3.0742962404123704) q[35];
-ry(pi/2) q[36];
-rx(pi) q[36];
-cx q[15],q[36];
-rz(1.854880992769599) q[36];
-cx q[15],q[36];
-cx q[20],q[36];
-rz(1.854880992769599) q[36];
-cx q[20],q[36];
-rx(3.0742962404123704) q[36];
-ry(pi/2) q[37];
-rx(pi) q[37];
-cx q[10],q[37];
-rz(1.854880992769599) q[37];
-cx q[10],q[37];
-cx q[34],q[37];
-rz(1.854880992769599) q[37];
-cx q[34],q[37];
-rx(3.0742962404123704) q[34];
-rx(3.0742962404123704) q[37];
-ry(pi/2) q[38];
-rx(pi) q[38];
-cx q[19],q[38];
-rz(1.854880992769599) q[38];
-cx q[19],q[38];
-rx(3.0742962404123704) q[19];
-cx q[21],q[38];
-rz(1.854880992769599) q[38];
-cx q[21],q[38];
-ry(pi/2) q[39];
-rx(pi) q[39];
-cx q[3],q[39];
-rz(1.854880992769599) q[39];
-cx q[3],q[39];
-cx q[13],q[39];
-rz(1.854880992769599) q[39];
-cx q[13],q[39];
-rx(3.0742962404123704) q[39];
-ry(pi/2) q[40];
-rx(pi) q[40];
-cx q[3],q[40];
-rz(1.854880992769599) q[40];
-cx q[3],q[40];
-cx q[23],q[40];
-rz(1.854880992769599) q[40];
-cx q[23],q[40];
-rx(3.0742962404123704) q[23];
-rx(3.0742962404123704) q[40];
-ry(pi/2) q[41];
-rx(pi) q[41];
-cx q[10],q[41];
-rz(1.854880992769599) q[41];
-cx q[10],q[41];
-cx q[27],q[41];
-rz(1.854880992769599) q[41];
-cx q[27],q[41];
-rx(3.0742962404123704) q[27];
-rx(3.0742962404123704) q[41];
-ry(pi/2) q[42];
-rx(pi) q[42];
-cx q[0],q[42];
-rz(1.854880992769599) q[42];
-cx q[0],q[42];
-cx q[3],q[42];
-rz(1.854880992769599) q[42];
-cx q[3],q[42];
-rx(3.0742962404123704) q[42];
-ry(pi/2) q[43];
-rx(pi) q[43];
-cx q[3],q[43];
-rz(1.854880992769599) q[43];
-cx q[3],q[43];
-cx q[20],q[43];
-rz(1.854880992769599) q[43];
-cx q[20],q[43];
-rx(3.0742962404123704) q[20];
-rx(3.0742962404123704) q[43];
-ry(pi/2) q[44];
-rx(pi) q[44];
-cx q[3],q[44];
-rz(1.854880992769599) q[44];
-cx q[3],q[44];
-cx q[12],q[44];
-rz(1.854880992769599) q[44];
-cx q[12],q[44];
-rx(3.0742962404123704) q[44];
-ry(pi/2) q[45];
-rx(pi) q[45];
-cx q[1],q[45];
-rz(1.854880992769599) q[45];
-cx q[1],q[45];
-cx q[16],q[45];
-rz(1.854880992769599) q[45];
-cx q[16],q[45];
-ry(pi/2) q[46];
-rx(pi) q[46];
-cx q[5],q[46];
-rz(1.854880992769599) q[46];
-cx q[5],q[46];
-rx(3.0742962404123704) q[5];
-cx q[38],q[46];
-rz(1.854880992769599) q[46];
-cx q[38],q[46];
-rx(3.0742962404123704) q[38];
-rx(3.0742962404123704) q[46];
-ry(pi/2) q[47];
-rx(pi) q[47];
-cx q[4],q[47];
-rz(1.854880992769599) q[47];
-cx q[4],q[47];
-cx q[17],q[47];
-rz(1.854880992769599) q[47];
-cx q[17],q[47];
-rx(3.0742962404123704) q[47];
-ry(pi/2) q[48];
-rx(pi) q[48];
-cx q[0],q[48];
-rz(1.854880992769599) q[48];
-cx q[0],q[48];
-cx q[30],q[48];
-rz(1.854880992769599) q[48];
-cx q[30],q[48];
-rx(3.0742962404123704) q[30];
-rx(3.0742962404123704) q[48];
-ry(pi/2) q[49];
-rx(pi) q[49];
-cx q[3],q[49];
-rz(1.854880992769599) q[49];
-cx q[3],q[49];
-cx q[4],q[49];
-rz(1.854880992769599) q[49];
-cx q[4],q[49];
-rx(3.0742962404123704) q[4];
-rx(3.0742962404123704) q[49];
-ry(pi/2) q[50];
-rx(pi) q[50];
-cx q[3],q[50];
-rz(1.854880992769599) q[50];
-cx q[3],q[50];
-cx q[12],q[50];
-rz(1.854880992769599) q[50];
-cx q[12],q[50];
-rx(3.0742962404123704) q[12];
-rx(3.0742962404123704) q[50];
-ry(pi/2) q[51];
-rx(pi) q[51];
-cx q[0],q[51];
-rz(1.854880992769599) q[51];
-cx q[0],q[51];
-rx(3.0742962404123704) q[0];
-cx q[28],q[51];
-rz(1.854880992769599) q[51];
-cx q[28],q[51];
-rx(3.0742962404123704) q[51];
-ry(pi/2) q[52];
-rx(pi) q[52];
-cx q[3],q[52];
-rz(1.854880992769599) q[52];
-cx q[3],q[52];
-cx q[10],q[52];
-rz(1.854880992769599) q[52];
-cx q[10],q[52];
-rx(3.0742962404123704) q[10];
-rx(3.0742962404123704) q[52];
-ry(pi/2) q[53];
-rx(pi) q[53];
-cx q[17],q[53];
-rz(1.854880992769599) q[53];
-cx q[17],q[53];
-rx(3.0742962404123704) q[17];
-cx q[21],q[53];
-rz(1.854880992769599) q[53];
-cx q[21],q[53];
-rx(3.0742962404123704) q[21];
-rx(3.0742962404123704) q[53];
-ry(pi/2) q[54];
-rx(pi) q[54];
-cx q[24],q[54];
-rz(1.854880992769599) q[54];
-cx q[24],q[54];
-cx q[28],q[54];
-rz(1.854880992769599) q[54];
-cx q[28],q[54];
-rx(3.0742962404123704) q[54];
-ry(pi/2) q[55];
-rx(pi) q[55];
-cx q[9],q[55];
-rz(1.854880992769599) q[55];
-cx q[9],q[55];
-rx(3.0742962404123704) q[9];
-cx q[15],q[55];
-rz(1.854880992769599) q[55];
-cx q[15],q[55];
-rx(3.0742962404123704) q[15];
-rx(3.0742962404123704) q[55];
-ry(pi/2) q[56];
-rx(pi) q[56];
-cx q[13],q[56];
-rz(1.854880992769599) q[56];
-cx q[13],q[56];
-rx(3.0742962404123704) q[13];
-cx q[45],q[56];
-rz(1.854880992769599) q[56];
-cx q[45],q[56];
-rx(3.0742962404123704) q[45];
-rx(3.0742962404123704) q[56];
-ry(pi/2) q[57];
-rx(pi) q[57];
-cx q[1],q[57];
-rz(1.854880992769599) q[57];
-cx q[1],q[57];
-cx q[3],q[57];
-rz(1.854880992769599) q[57];
-cx q[3],q[57];
-rx(3.0742962404123704) q[3];
-rx(3.0742962404123704) q[57];
-ry(pi/2) q[58];
-rx(pi) q[58];
-cx q[24],q[58];
-rz(1.854880992769599) q[58];
-cx q[24],q[58];
-rx(3.0742962404123704) q[24];
-cx q[28],q[58];
-rz(1.854880992769599) q[58];
-cx q[28],q[58];
-rx(3.0742962404123704) q[28];
-rx(3.0742962404123704) q[58];
-ry(pi/2) q[59];
-rx(pi) q[59];
-cx q[16],q[59];
-rz(1.854880992769599) q[59];
-cx q[16],q[59];
-rx(3.0742962404123704) q[16];
-cx q[32],q[59];
-rz(1.854880992769599) q[59];
-cx q[32],q[59];
-rx(3.0742962404123704) q[32];
-rx(3.0742962404123704) q[59];
-ry(pi/2) q[60];
-rx(pi) q[60];
-cx q[1],q[60];
-rz(1.854880992769599) q[60];
-cx q[1],q[60];
-rx(3.0742962404123704) q[1];
-cx q[0],q[1];
-rz(5.194128148336528) q[1];
-cx q[0],q[1];
-cx q[0],q[2];
-rz(5.194128148336528) q[2];
-cx q[0],q[2];
-cx q[0],q[3];
-rx(11.270731304346485) q[2];
-rz(5.194128148336528) q[3];
-cx q[0],q[3];
-cx q[0],q[15];
-cx q[1],q[3];
-rz(5.194128148336528) q[3];
-cx q[1],q[3];
-cx q[1],q[4];
-rz(5.194128148336528) q[4];
-cx q[1],q[4];
-cx q[1],q[5];
-cx q[3],q[4];
-rz(5.194128148336528) q[4];
-cx q[3],q[4];
-cx q[4],q[6];
-rz(5.194128148336528) q[5];
-cx q[1],q[5];
-cx q[1],q[9];
-cx q[3],q[5];
-rz(5.194128148336528) q[5];
-cx q[3],q[5];
-rz(5.194128148336528) q[6];
-cx q[4],q[6];
-cx q[5],q[6];
-rz(5.194128148336528) q[6];
-cx q[5],q[6];
-cx q[7],q[60];
-rz(5.194128148336528) q[9];
-cx q[1],q[9];
-cx q[1],q[17];
-rz(5.194128148336528) q[15];
-cx q[0],q[15];
-cx q[0],q[16];
-rz(5.194128148336528) q[16];
-cx q[0],q[16];
-cx q[0],q[20];
-rz(5.194128148336528) q[17];
-cx q[1],q[17];
-cx q[1],q[28];
-rz(5.194128148336528) q[20];
-cx q[0],q[20];
-cx q[0],q[32];
-rz(5.194128148336528) q[28];
-cx q[1],q[28];
-cx q[1],q[29];
-rz(5.194128148336528) q[29];
-cx q[1],q[29];
-cx q[1],q[45];
-rz(5.194128148336528) q[32];
-cx q[0],q[32];
-cx q[0],q[42];
-rz(5.194128148336528) q[42];
-cx q[0],q[42];
-cx q[0],q[48];
-rz(5.194128148336528) q[45];
-cx q[1],q[45];
-cx q[1],q[57];
-rz(5.194128148336528) q[48];
-cx q[0],q[48];
-cx q[0],q[51];
-rz(5.194128148336528) q[51];
-cx q[0],q[51];
-rx(11.270731304346485) q[0];
-rz(5.194128148336528) q[57];
-cx q[1],q[57];
-rz(1.854880992769599) q[60];
-cx q[7],q[60];
-rx(3.0742962404123704) q[7];
-cx q[3],q[7];
-rz(5.194128148336528) q[7];
-cx q[3],q[7];
-cx q[3],q[8];
-cx q[4],q[7];
-rz(5.194128148336528) q[7];
-cx q[4],q[7];
-cx q[4],q[10];
-rz(5.194128148336528) q[8];
-cx q[3],q[8];
-cx q[3],q[9];
-cx q[5],q[8];
-rz(5.194128148336528) q[8];
-cx q[5],q[8];
-cx q[5],q[11];
-rx(11.270731304346485) q[8];
-rz(5.194128148336528) q[9];
-cx q[3],q[9];
-cx q[3],q[12];
-rz(5.194128148336528) q[10];
-cx q[4],q[10];
-cx q[4],q[13];
-cx q[6],q[10];
-rz(5.194128148336528) q[10];
-cx q[6],q[10];
-cx q[10],q[37];
-rz(5.194128148336528) q[11];
-cx q[5],q[11];
-cx q[6],q[11];
-rz(5.194128148336528) q[11];
-cx q[6],q[11];
-rx(11.270731304346485) q[11];
-rz(5.194128148336528) q[12];
-cx q[3],q[12];
-cx q[3],q[14];
-cx q[5],q[12];
-rz(5.194128148336528) q[12];
-cx q[5],q[12];
-rz(5.194128148336528) q[13];
-cx q[4],q[13];
-cx q[5],q[13];
-rz(5.194128148336528) q[13];
-cx q[5],q[13];
-rz(5.194128148336528) q[14];
-cx q[3],q[14];
-cx q[3],q[15];
-cx q[4],q[14];
-rz(5.194128148336528) q[14];
-cx q[4],q[14];
-rx(11.270731304346485) q[14];
-rz(5.194128148336528) q[15];
-cx q[3],q[15];
-cx q[3],q[16];
-cx q[15],q[20];
-rz(5.194128148336528) q[16];
-cx q[3],q[16];
-cx q[3],q[17];
-cx q[16],q[45];
-rz(5.194128148336528) q[17];
-cx q[3],q[17];
-cx q[3],q[18];
-rz(5.194128148336528) q[18];
-cx q[3],q[18];
-cx q[3],q[19];
-cx q[4],q[18];
-rz(5.194128148336528) q[18];
-cx q[4],q[18];
-cx q[4],q[21];
-rz(5.194128148336528) q[19];
-cx q[3],q[19];
-cx q[3],q[22];
-cx q[7],q[19];
-rz(5.194128148336528) q[19];
-cx q[7],q[19];
-cx q[19],q[38];
-rz(5.194128148336528) q[20];
-cx q[15],q[20];
-rz(5.194128148336528) q[21];
-cx q[4],q[21];
-cx q[4],q[27];
-cx q[15],q[21];
-rz(5.194128148336528) q[21];
-cx q[15],q[21];
-cx q[15],q[36];
-rz(5.194128148336528) q[22];
-cx q[3],q[22];
-cx q[3],q[23];
-cx q[9],q[22];
-rz(5.194128148336528) q[22];
-cx q[9],q[22];
-cx q[9],q[55];
-rx(11.270731304346485) q[22];
-rz(5.194128148336528) q[23];
-cx q[3],q[23];
-cx q[3],q[24];
-cx q[17],q[23];
-rz(5.194128148336528) q[23];
-cx q[17],q[23];
-rz(5.194128148336528) q[24];
-cx q[3],q[24];
-cx q[3],q[25];
-cx q[5],q[24];
-rz(5.194128148336528) q[24];
-cx q[5],q[24];
-cx q[5],q[33];
-cx q[24],q[54];
-rz(5.194128148336528) q[25];
-cx q[3],q[25];
-cx q[3],q[26];
-cx q[12],q[25];
-rz(5.194128148336528) q[25];
-cx q[12],q[25];
-cx q[12],q[31];
-rx(11.270731304346485) q[25];
-rz(5.194128148336528) q[26];
-cx q[3],q[26];
-cx q[3],q[28];
-cx q[21],q[26];
-rz(5.194128148336528) q[26];
-cx q[21],q[26];
-cx q[21],q[32];
-rz(5.194128148336528) q[27];
-cx q[4],q[27];
-cx q[4],q[47];
-cx q[6],q[27];
-rz(5.194128148336528) q[27];
-cx q[6],q[27];
-rx(11.270731304346485) q[6];
-rz(5.194128148336528) q[28];
-cx q[3],q[28];
-cx q[3],q[29];
-cx q[28],q[51];
-rz(5.194128148336528) q[29];
-cx q[3],q[29];
-cx q[3],q[30];
-rx(11.270731304346485) q[29];
-rz(5.194128148336528) q[30];
-cx q[3],q[30];
-cx q[3],q[34];
-cx q[18],q[30];
-rz(5.194128148336528) q[30];
-cx q[18],q[30];
-rx(11.270731304346485) q[18];
-rz(5.194128148336528) q[31];
-cx q[12],q[31];
-cx q[26],q[31];
-rz(5.194128148336528) q[31];
-cx q[26],q[31];
-rx(11.270731304346485) q[26];
-rx(11.270731304346485) q[31];
-rz(5.194128148336528) q[32];
-cx q[21],q[32];
-rz(5.194128148336528) q[33];
-cx q[5],q[33];
-cx q[5],q[46];
-cx q[30],q[33];
-rz(5.194128148336528) q[33];
-cx q[30],q[33];
-cx q[30],q[48];
-rx(11.270731304346485) q[33];
-rz(5.194128148336528) q[34];
-cx q[3],q[34];
-cx q[3],q[35];
-cx q[12],q[34];
-rz(5.194128148336528) q[34];
-cx q[12],q[34];
-rz(5.194128148336528) q[35];
-cx q[3],q[35];
-cx q[3],q[39];
-cx q[32],q[35];
-rz(5.194128148336528) q[35];
-cx q[32],q[35];
-rx(11.270731304346485) q[35];
-rz(5.194128148336528) q[36];
-cx q[15],q[36];
-cx q[20],q[36];
-rz(5.194128148336528) q[36];
-cx q[20],q[36];
-rx(11.270731304346485) q[36];
-rz(5.194128148336528) q[37];
-cx q[10],q[37];
-cx q[10],q[41];
-cx q[34],q[37];
-rz(5.194128148336528) q[37];
-cx q[34],q[37];
-rx(11.270731304346485) q[34];
-rx(11.270731304346485) q[37];
-rz(5.194128148336528) q[38];
-cx q[19],q[38];
-rx(11.270731304346485) q[19];
-cx q[21],q[38];
-rz(5.194128148336528) q[38];
-cx q[21],q[38];
-rz(5.194128148336528) q[39];
-cx q[3],q[39];
-cx q[3],q[40];
-cx q[13],q[39];
-rz(5.194128148336528) q[39];
-cx q[13],q[39];
-cx q[13],q[56];
-rx(11.270731304346485) q[39];
-rz(5.194128148336528) q[40];
-cx q[3],q[40];
-cx q[3],q[42];
-cx q[23],q[40];
-rz(5.194128148336528) q[40];
-cx q[23],q[40];
-rx(11.270731304346485) q[23];
-rx(11.270731304346485) q[40];
-rz(5.194128148336528) q[41];
-cx q[10],q[41];
-cx q[27],q[41];
-rz(5.194128148336528) q[41];
-cx q[27],q[41];
-rx(11.270731304346485) q[27];
-rx(11.270731304346485) q[41];
-rz(5.194128148336528) q[42];
-cx q[3],q[42];
-cx q[3],q[43];
-rx(11.270731304346485) q[42];
-rz(5.194128148336528) q[43];
-cx q[3],q[43];
-cx q[3],q[44];
-cx q[20],q[43];
-rz(5.194128148336528) q[43];
-cx q[20],q[43];
-rx(11.270731304346485) q[20];
-rx(11.270731304346485) q[43];
-rz(5.194128148336528) q[44];
-cx q[3],q[44];
-cx q[3],q[49];
-cx q[12],q[44];
-rz(5.194128148336528) q[44];
-cx q[12],q[44];
-rx(11.270731304346485) q[44];
-rz(5.194128148336528) q[45];
-cx q[16],q[45];
-cx q[16],q[59];
-rz(5.194128148336528) q[46];
-cx q[5],q[46];
-rx(11.270731304346485) q[5];
-cx q[38],q[46];
-rz(5.194128148336528) q[46];
-cx q[38],q[46];
-rx(11.270731304346485) q[38];
-rx(11.270731304346485) q[46];
-rz(5.194128148336528) q[47];
-cx q[4],q[47];
-cx q[17],q[47];
-rz(5.194128148336528) q[47];
-cx q[17],q[47];
-cx q[17],q[53];
-rx(11.270731304346485) q[47];
-rz(5.194128148336528) q[48];
-cx q[30],q[48];
-rx(11.270731304346485) q[30];
-rx(11.270731304346485) q[48];
-rz(5.194128148336528) q[49];
-cx q[3],q[49];
-cx q[3],q[50];
-cx q[4],q[49];
-rz(5.194128148336528) q[49];
-cx q[4],q[49];
-rx(11.270731304346485) q[4];
-rx(11.270731304346485) q[49];
-rz(5.194128148336528) q[50];
-cx q[3],q[50];
-cx q[3],q[52];
-cx q[12],q[50];
-rz(5.194128148336528) q[50];
-cx q[12],q[50];
-rx(11.270731304346485) q[12];
-rx(11.270731304346485) q[50];
-rz(5.194128148336528) q[51];
-cx q[28],q[51];
-rx(11.270731304346485) q[51];
-rz(5.194128148336528) q[52];
-cx q[3],q[52];
-cx q[3],q[57];
-cx q[10],q[52];
-rz(5.194128148336528) q[52];
-cx q[10],q[52];
-rx(11.270731304346485) q[10];
-rx(11.270731304346485) q[52];
-rz(5.194128148336528) q[53];
-cx q[17],q[53];
-rx(11.270731304346485) q[17];
-cx q[21],q[53];
-rz(5.194128148336528) q[53];
-cx q[21],q[53];
-rx(11.270731304346485) q[21];
-rx(11.270731304346485) q[53];
-rz(5.194128148336528) q[54];
-cx q[24],q[54];
-cx q[24],q[58];
-cx q[28],q[54];
-rz(5.194128148336528) q[54];
-cx q[28],q[54];
-rx(11.270731304346485) q[54];
-rz(5.194128148336528) q[55];
-cx q[9],q[55];
-rx(11.270731304346485) q[9];
-cx q[15],q[55];
-rz(5.194128148336528) q[55];
-cx q[15],q[55];
-rx(11.270731304346485) q[15];
-rx(11.270731304346485) q[55];
-rz(5.194128148336528) q[56];
-cx q[13],q[56];
-rx(11.270731304346485) q[13];
-cx q[45],q[56];
-rz(5.194128148336528) q[56];
-cx q[45],q[56];
-rx(11.270731304346485) q[45];
-rx(11.270731304346485) q[56];
-rz(5.194128148336528) q[57];
-cx q[3],q[57];
-rx(11.270731304346485) q[3];
-rx(11.270731304346485) q[57];
-rz(5.194128148336528) q[58];
-cx q[24],q[58];
-rx(11.270731304346485) q[24];
-cx q[28],q[58];
-rz(5.194128148336528) q[58];
-cx q[28],q[58];
-rx(11.270731304346485) q[28];
-rx(11.270731304346485) q[58];
-rz(5.194128148336528) q[59];
-cx q[16],q[59];
-rx(11.270731304346485) q[16];
-cx q[32],q[59];
-rz(5.194128148336528) q[59];
-cx q[32],q[59];
-rx(11.270731304346485) q[32];
-rx(11.270731304346485) q[59];
-rx(3.0742962404123704) q[60];
-cx q[1],q[60];
-rz(5.194128148336528) q[60];
-cx q[1],q[60];
-rx(11.270731304346485) q[1];
-cx q[0],q[1];
-rz(1.3277837652563047) q[1];
-cx q[0],q[1];
-cx q[0],q[2];
-rz(1.3277837652563047) q[2];
-cx q[0],q[2];
-cx q[0],q[3];
-rx(8.10164644655247) q[2];
-rz(1.3277837652563047) q[3];
-cx q[0],q[3];
-cx q[0],q[15];
-cx q[1],q[3];
-rz(1.3277837652563047) q[3];
-cx q[1],q[3];
-cx q[1],q[4];
-rz(1.3277837652563047) q[4];
-cx q[1],q[4];
-cx q[1],q[5];
-cx q[3],q[4];
-rz(1.3277837652563047) q[4];
-cx q[3],q[4];
-cx q[4],q[6];
-rz(1.3277837652563047) q[5];
-cx q[1],q[5];
-cx q[1],q[9];
-cx q[3],q[5];
-rz(1.3277837652563047) q[5];
-cx q[3],q[5];
-rz(1.3277837652563047) q[6];
-cx q[4],q[6];
-cx q[5],q[6];
-rz(1.3277837652563047) q[6];
-cx q[5],q[6];
-cx q[7],q[60];
-rz(1.3277837652563047) q[9];
-cx q[1],q[9];
-cx q[1],q[17];
-rz(1.3277837652563047) q[15];
-cx q[0],q[15];
-cx q[0],q[16];
-rz(1.3277837652563047) q[16];
-cx q[0],q[16];
-cx q[0],q[20];
-rz(1.3277837652563047) q[17];
-cx q[1],q[17];
-cx q[1],q[28];
-rz(1.3277837652563047) q[20];
-cx q[0],q[20];
-cx q[0],q[32];
-rz(1.3277837652563047) q[28];
-cx q[1],q[28];
-cx q[1],q[29];
-rz(1.3277837652563047) q[29];
-cx q[1],q[29];
-cx q[1],q[45];
-rz(1.3277837652563047) q[32];
-cx q[0],q[32];
-cx q[0],q[42];
-rz(1.3277837652563047) q[42];
-cx q[0],q[42];
-cx q[0],q[48];
-rz(1.3277837652563047) q[45];
-cx q[1],q[45];
-cx q[1],q[57];
-rz(1.3277837652563047) q[48];
-cx q[0],q[48];
-cx q[0],q[51];
-rz(1.3277837652563047) q[51];
-cx q[0],q[51];
-rx(8.10164644655247) q[0];
-rz(1.3277837652563047) q[57];
-cx q[1],q[57];
-rz(5.194128148336528) q[60];
-cx q[7],q[60];
-rx(11.270731304346485) q[7];
-cx q[3],q[7];
-rz(1.3277837652563047) q[7];
-cx q[3],q[7];
-cx q[3],q[8];
-cx q[4],q[7];
-rz(1.3277837652563047) q[7];
-cx q[4],q[7];
-cx q[4],q[10];
-rz(1.3277837652563047) q[8];
-cx q[3],q[8];
-cx q[3],q[9];
-cx q[5],q[8];
-rz(1.3277837652563047) q[8];
-cx q[5],q[8];
-cx q[5],q[11];
-rx(8.10164644655247) q[8];
-rz(1.3277837652563047) q[9];
-cx q[3],q[9];
-cx q[3],q[12];
-rz(1.3277837652563047) q[10];
-cx q[4],q[10];
-cx q[4],q[13];
-cx q[6],q[10];
-rz(1.3277837652563047) q[10];
-cx q[6],q[10];
-cx q[10],q[37];
-rz(1.3277837652563047) q[11];
-cx q[5],q[11];
-cx q[6],q[11];
-rz(1.3277837652563047) q[11];
-cx q[6],q[11];
-rx(8.10164644655247) q[11];
-rz(1.3277837652563047) q[12];
-cx q[3],q[12];
-cx q[3],q[14];
-cx q[5],q[12];
-rz(1.3277837652563047) q[12];
-cx q[5],q[12];
-rz(1.3277837652563047) q[13];
-cx q[4],q[13];
-cx q[5],q[13];
-rz(1.3277837652563047) q[13];
-cx q[5],q[13];
-rz(1.3277837652563047) q[14];
-cx q[3],q[14];
-cx q[3],q[15];
-cx q[4],q[14];
-rz(1.3277837652563047) q[14];
-cx q[4],q[14];
-rx(8.10164644655247) q[14];
-rz(1.3277837652563047) q[15];
-cx q[3],q[15];
-cx q[3],q[16];
-cx q[15],q[20];
-rz(1.3277837652563047) q[16];
-cx q[3],q[16];
-cx q[3],q[17];
-cx q[16],q[45];
-rz(1.3277837652563047) q[17];
-cx q[3],q[17];
-cx q[3],q[18];
-rz(1.3277837652563047) q[18];
-cx q[3],q[18];
-cx q[3],q[19];
-cx q[4],q[18];
-rz(1.3277837652563047) q[18];
-cx q[4],q[18];
-cx q[4],q[21];
-rz(1.3277837652563047) q[19];
-cx q[3],q[19];
-cx q[3],q[22];
-cx q[7],q[19];
-rz(1.3277837652563047) q[19];
-cx q[7],q[19];
-cx q[19],q[38];
-rz(1.3277837652563047) q[20];
-cx q[15],q[20];
-rz(1.3277837652563047) q[21];
-cx q[4],q[21];
-cx q[4],q[27];
-cx q[15],q[21];
-rz(1.3277837652563047) q[21];
-cx q[15],q[21];
-cx q[15],q[36];
-rz(1.3277837652563047) q[22];
-cx q[3],q[22];
-cx q[3],q[23];
-cx q[9],q[22];
-rz(1.3277837652563047) q[22];
-cx q[9],q[22];
-cx q[9],q[55];
-rx(8.10164644655247) q[22];
-rz(1.3277837652563047) q[23];
-cx q[3],q[23];
-cx q[3],q[24];
-cx q[17],q[23];
-rz(1.3277837652563047) q[23];
-cx q[17],q[23];
-rz(1.3277837652563047) q[24];
-cx q[3],q[24];
-cx q[3],q[25];
-cx q[5],q[24];
-rz(1.3277837652563047) q[24];
-cx q[5],q[24];
-cx q[5],q[33];
-cx q[24],q[54];
-rz(1.3277837652563047) q[25];
-cx q[3],q[25];
-cx q[3],q[26];
-cx q[12],q[25];
-rz(1.3277837652563047) q[25];
-cx q[12],q[25];
-cx q[12],q[31];
-rx(8.10164644655247) q[25];
-rz(1.3277837652563047) q[26];
-cx q[3],q[26];
-cx q[3],q[28];
-cx q[21],q[26];
-rz(1.3277837652563047) q[26];
-cx q[21],q[26];
-cx q[21],q[32];
-rz(1.3277837652563047) q[27];
-cx q[4],q[27];
-cx q[4],q[47];
-cx q[6],q[27];
-rz(1.3277837652563047) q[27];
-cx q[6],q[27];
-rx(8.10164644655247) q[6];
-rz(1.3277837652563047) q[28];
-cx q[3],q[28];
-cx q[3],q[29];
-cx q[28],q[51];
-rz(1.3277837652563047) q[29];
-cx q[3],q[29];
-cx q[3],q[30];
-rx(8.10164644655247) q[29];
-rz(1.3277837652563047) q[30];
-cx q[3],q[30];
-cx q[3],q[34];
-cx q[18],q[30];
-rz(1.3277837652563047) q[30];
-cx q[18],q[30];
-rx(8.10164644655247) q[18];
-rz(1.3277837652563047) q[31];
-cx q[12],q[31];
-cx q[26],q[31];
-rz(1.3277837652563047) q[31];
-cx q[26],q[31];
-rx(8.10164644655247) q[26];
-rx(8.10164644655247) q[31];
-rz(1.3277837652563047) q[32];
-cx q[21],q[32];
-rz(1.3277837652563047) q[33];
-cx q[5],q[33];
-cx q[5],q[46];
-cx q[30],q[33];
-rz(1.3277837652563047) q[33];
-cx q[30],q[33];
-cx q[30],q[48];
-rx(8.10164644655247) q[33];
-rz(1.3277837652563047) q[34];
-cx q[3],q[34];
-cx q[3],q[35];
-cx q[12],q[34];
-rz(1.3277837652563047) q[34];
-cx q[12],q[34];
-rz(1.3277837652563047) q[35];
-cx q[3],q[35];
-cx q[3],q[39];
-cx q[32],q[35];
-rz(1.3277837652563047) q[35];
-cx q[32],q[35];
-rx(8.10164644655247) q[35];
-rz(1.3277837652563047) q[36];
-cx q[15],q[36];
-cx q[20],q[36];
-rz(1.3277837652563047) q[36];
-cx q[20],q[36];
-rx(8.10164644655247) q[36];
-rz(1.3277837652563047) q[37];
-cx q[10],q[37];
-cx q[10],q[41];
-cx q[34],q[37];
-rz(1.3277837652563047) q[37];
-cx q[34],q[37];
-rx(8.10164644655247) q[34];
-rx(8.10164644655247) q[37];
-rz(1.3277837652563047) q[38];
-cx q[19],q[38];
-rx(8.10164644655247) q[19];
-cx q[21],q[38];
-rz(1.3277837652563047) q[38];
-cx q[21],q[38];
-rz(1.3277837652563047) q[39];
-cx q[3],q[39];
-cx q[3],q[40];
-cx q[13],q[39];
-rz(1.3277837652563047) q[39];
-cx q[13],q[39];
-cx q[13],q[56];
-rx(8.10164644655247) q[39];
-rz(1.3277837652563047) q[40];
-cx q[3],q[40];
-cx q[3],q[42];
-cx q[23],q[40];
-rz(1.3277837652563047) q[40];
-cx q[23],q[40];
-rx(8.10164644655247) q[23];
-rx(8.10164644655247) q[40];
-rz(1.3277837652563047) q[41];
-cx q[10],q[41];
-cx q[27],q[41];
-rz(1.3277837652563047) q[41];
-cx q[27],q[41];
-rx(8.10164644655247) q[27];
-rx(8.10164644655247) q[41];
-rz(1.3277837652563047) q[42];
-cx q[3],q[42];
-cx q[3],q[43];
-rx(8.10164644655247) q[42];
-rz(1.3277837652563047) q[43];
-cx q[3],q[43];
-cx q[3],q[44];
-cx q[20],q[43];
-rz(1.3277837652563047) q[43];
-cx q[20],q[43];
-rx(8.10164644655247) q[20];
-rx(8.10164644655247) q[43];
-rz(1.3277837652563047) q[44];
-cx q[3],q[44];
-cx q[3],q[49];
-cx q[12],q[44];
-rz(1.3277837652563047) q[44];
-cx q[12],q[44];
-rx(8.10164644655247) q[44];
-rz(1.3277837652563047) q[45];
-cx q[16],q[45];
-cx q[16],q[59];
-rz(1.3277837652563047) q[46];
-cx q[5],q[46];
-rx(8.10164644655247) q[5];
-cx q[38],q[46];
-rz(1.3277837652563047) q[46];
-cx q[38],q[46];
-rx(8.10164644655247) q[38];
-rx(8.10164644655247) q[46];
-rz(1.3277837652563047) q[47];
-cx q[4],q[47];
-cx q[17],q[47];
-rz(1.3277837652563047) q[47];
-cx q[17],q[47];
-cx q[17],q[53];
-rx(8.10164644655247) q[47];
-rz(1.3277837652563047) q[48];
-cx q[30],q[48];
-rx(8.10164644655247) q[30];
-rx(8.10164644655247) q[48];
-rz(1.3277837652563047) q[49];
-cx q[3],q[49];
-cx q[3],q[50];
-cx q[4],q[49];
-rz(1.3277837652563047) q[49];
-cx q[4],q[49];
-rx(8.10164644655247) q[4];
-rx(8.10164644655247) q[49];
-rz(1.3277837652563047) q[50];
-cx q[3],q[50];
-cx q[3],q[52];
-cx q[12],q[50];
-rz(1.3277837652563047) q[50];
-cx q[12],q[50];
-rx(8.10164644655247) q[12];
-rx(8.10164644655247) q[50];
-rz(1.3277837652563047) q[51];
-cx q[28],q[51];
-rx(8.10164644655247) q[51];
-rz(1.3277837652563047) q[52];
-cx q[3],q[52];
-cx q[3],q[57];
-cx q[10],q[52];
-rz(1.3277837652563047) q[52];
-cx q[10],q[52];
-rx(8.10164644655247) q[10];
-rx(8.10164644655247) q[52];
-rz(1.3277837652563047) q[53];
-cx q[17],q[53];
-rx(8.10164644655247) q[17];
-cx q[21],q[53];
-rz(1.3277837652563047) q[53];
-cx q[21],q[53];
-rx(8.10164644655247) q[21];
-rx(8.10164644655247) q[53];
-rz(1.3277837652563047) q[54];
-cx q[24],q[54];
-cx q[24],q[58];
-cx q[28],q[54];
-rz(1.3277837652563047) q[54];
-cx q[28],q[54];
-rx(8.10164644655247) q[54];
-rz(1.3277837652563047) q[55];
-cx q[9],q[55];
-rx(8.10164644655247) q[9];
-cx q[15],q[55];
-rz(1.3277837652563047) q[55];
-cx q[15],q[55];
-rx(8.10164644655247) q[15];
-rx(8.10164644655247) q[55];
-rz(1.3277837652563047) q[56];
-cx q[13],q[56];
-rx(8.10164644655247) q[13];
-cx q[45],q[56];
-rz(1.3277837652563047) q[56];
-cx q[45],q[56];
-rx(8.10164644655247) q[45];
-rx(8.10164644655247) q[56];
-rz(1.3277837652563047) q[57];
-cx q[3],q[57];
-rx(8.10164644655247) q[3];
-rx(8.10164644655247) q[57];
-rz(1.3277837652563047) q[58];
-cx q[24],q[58];
-rx(8.10164644655247) q[24];
-cx q[28],q[58];
-rz(1.3277837652563047) q[58];
-cx q[28],q[58];
-rx(8.10164644655247) q[28];
-rx(8.10164644655247) q[58];
-rz(1.3277837652563047) q[59];
-cx q[16],q[59];
-rx(8.10164644655247) q[16];
-cx q[32],q[59];
-rz(1.3277837652563047) q[59];
-cx q[32],q[59];
-rx(8.10164644655247) q[32];
-rx(8.10164644655247) q[59];
-rx(11.270731304346485) q[60];
-cx q[1],q[60];
-rz(1.3277837652563047) q[60];
-cx q[1],q[60];
-rx(8.10164644655247) q[1];
-cx q[7],q[60];
-rz(1.3277837652563047) q[60];
-cx q[7],q[60];
-rx(8.10164644655247) q[7];
-rx(8.10164644655247) q[60];
\ No newline at end of file
@@ -1,1393 +0,0 @@
-OPENQASM 2.0;
-include "qelib1.inc";
-qreg q[62];
-ry(pi/2) q[0];
-rx(pi) q[0];
-ry(pi/2) q[1];
-rx(pi) q[1];
-cx q[0],q[1];
-rz(4.055756747240184) q[1];
-cx q[0],q[1];
-ry(pi/2) q[2];
-rx(pi) q[2];
-cx q[0],q[2];
-rz(4.055756747240184) q[2];
-cx q[0],q[2];
-rx(3.624759426308456) q[2];
-ry(pi/2) q[3];
-rx(pi) q[3];
-cx q[0],q[3];
-rz(4.055756747240184) q[3];
-cx q[0],q[3];
-cx q[1],q[3];
-rz(4.055756747240184) q[3];
-cx q[1],q[3];
-ry(pi/2) q[4];
-rx(pi) q[4];
-cx q[1],q[4];
-rz(4.055756747240184) q[4];
-cx q[1],q[4];
-cx q[3],q[4];
-rz(4.055756747240184) q[4];
-cx q[3],q[4];
-ry(pi/2) q[5];
-rx(pi) q[5];
-cx q[1],q[5];
-rz(4.055756747240184) q[5];
-cx q[1],q[5];
-cx q[3],q[5];
-rz(4.055756747240184) q[5];
-cx q[3],q[5];
-ry(pi/2) q[6];
-rx(pi) q[6];
-cx q[4],q[6];
-rz(4.055756747240184) q[6];
-cx q[4],q[6];
-cx q[5],q[6];
-rz(4.055756747240184) q[6];
-cx q[5],q[6];
-ry(pi/2) q[7];
-rx(pi) q[7];
-cx q[3],q[7];
-rz(4.055756747240184) q[7];
-cx q[3],q[7];
-cx q[4],q[7];
-rz(4.055756747240184) q[7];
-cx q[4],q[7];
-ry(pi/2) q[8];
-rx(pi) q[8];
-cx q[3],q[8];
-rz(4.055756747240184) q[8];
-cx q[3],q[8];
-cx q[5],q[8];
-rz(4.055756747240184) q[8];
-cx q[5],q[8];
-rx(3.624759426308456) q[8];
-ry(pi/2) q[9];
-rx(pi) q[9];
-cx q[1],q[9];
-rz(4.055756747240184) q[9];
-cx q[1],q[9];
-cx q[3],q[9];
-rz(4.055756747240184) q[9];
-cx q[3],q[9];
-ry(pi/2) q[10];
-rx(pi) q[10];
-cx q[4],q[10];
-rz(4.055756747240184) q[10];
-cx q[4],q[10];
-cx q[6],q[10];
-rz(4.055756747240184) q[10];
-cx q[6],q[10];
-ry(pi/2) q[11];
-rx(pi) q[11];
-cx q[5],q[11];
-rz(4.055756747240184) q[11];
-cx q[5],q[11];
-cx q[6],q[11];
-rz(4.055756747240184) q[11];
-cx q[6],q[11];
-rx(3.624759426308456) q[11];
-ry(pi/2) q[12];
-rx(pi) q[12];
-cx q[3],q[12];
-rz(4.055756747240184) q[12];
-cx q[3],q[12];
-cx q[5],q[12];
-rz(4.055756747240184) q[12];
-cx q[5],q[12];
-ry(pi/2) q[13];
-rx(pi) q[13];
-cx q[4],q[13];
-rz(4.055756747240184) q[13];
-cx q[4],q[13];
-cx q[5],q[13];
-rz(4.055756747240184) q[13];
-cx q[5],q[13];
-ry(pi/2) q[14];
-rx(pi) q[14];
-cx q[3],q[14];
-rz(4.055756747240184) q[14];
-cx q[3],q[14];
-cx q[4],q[14];
-rz(4.055756747240184) q[14];
-cx q[4],q[14];
-rx(3.624759426308456) q[14];
-ry(pi/2) q[15];
-rx(pi) q[15];
-cx q[0],q[15];
-rz(4.055756747240184) q[15];
-cx q[0],q[15];
-cx q[3],q[15];
-rz(4.055756747240184) q[15];
-cx q[3],q[15];
-ry(pi/2) q[16];
-rx(pi) q[16];
-cx q[0],q[16];
-rz(4.055756747240184) q[16];
-cx q[0],q[16];
-cx q[3],q[16];
-rz(4.055756747240184) q[16];
-cx q[3],q[16];
-ry(pi/2) q[17];
-rx(pi) q[17];
-cx q[1],q[17];
-rz(4.055756747240184) q[17];
-cx q[1],q[17];
-cx q[3],q[17];
-rz(4.055756747240184) q[17];
-cx q[3],q[17];
-ry(pi/2) q[18];
-rx(pi) q[18];
-cx q[3],q[18];
-rz(4.055756747240184) q[18];
-cx q[3],q[18];
-cx q[4],q[18];
-rz(4.055756747240184) q[18];
-cx q[4],q[18];
-ry(pi/2) q[19];
-rx(pi) q[19];
-cx q[3],q[19];
-rz(4.055756747240184) q[19];
-cx q[3],q[19];
-cx q[7],q[19];
-rz(4.055756747240184) q[19];
-cx q[7],q[19];
-ry(pi/2) q[20];
-rx(pi) q[20];
-cx q[0],q[20];
-rz(4.055756747240184) q[20];
-cx q[0],q[20];
-cx q[15],q[20];
-rz(4.055756747240184) q[20];
-cx q[15],q[20];
-ry(pi/2) q[21];
-rx(pi) q[21];
-cx q[4],q[21];
-rz(4.055756747240184) q[21];
-cx q[4],q[21];
-cx q[15],q[21];
-rz(4.055756747240184) q[21];
-cx q[15],q[21];
-ry(pi/2) q[22];
-rx(pi) q[22];
-cx q[3],q[22];
-rz(4.055756747240184) q[22];
-cx q[3],q[22];
-cx q[9],q[22];
-rz(4.055756747240184) q[22];
-cx q[9],q[22];
-rx(3.624759426308456) q[22];
-ry(pi/2) q[23];
-rx(pi) q[23];
-cx q[3],q[23];
-rz(4.055756747240184) q[23];
-cx q[3],q[23];
-cx q[17],q[23];
-rz(4.055756747240184) q[23];
-cx q[17],q[23];
-ry(pi/2) q[24];
-rx(pi) q[24];
-cx q[3],q[24];
-rz(4.055756747240184) q[24];
-cx q[3],q[24];
-cx q[5],q[24];
-rz(4.055756747240184) q[24];
-cx q[5],q[24];
-ry(pi/2) q[25];
-rx(pi) q[25];
-cx q[3],q[25];
-rz(4.055756747240184) q[25];
-cx q[3],q[25];
-cx q[12],q[25];
-rz(4.055756747240184) q[25];
-cx q[12],q[25];
-rx(3.624759426308456) q[25];
-ry(pi/2) q[26];
-rx(pi) q[26];
-cx q[3],q[26];
-rz(4.055756747240184) q[26];
-cx q[3],q[26];
-cx q[21],q[26];
-rz(4.055756747240184) q[26];
-cx q[21],q[26];
-ry(pi/2) q[27];
-rx(pi) q[27];
-cx q[4],q[27];
-rz(4.055756747240184) q[27];
-cx q[4],q[27];
-cx q[6],q[27];
-rz(4.055756747240184) q[27];
-cx q[6],q[27];
-rx(3.624759426308456) q[6];
-ry(pi/2) q[28];
-rx(pi) q[28];
-cx q[1],q[28];
-rz(4.055756747240184) q[28];
-cx q[1],q[28];
-cx q[3],q[28];
-rz(4.055756747240184) q[28];
-cx q[3],q[28];
-ry(pi/2) q[29];
-rx(pi) q[29];
-cx q[1],q[29];
-rz(4.055756747240184) q[29];
-cx q[1],q[29];
-cx q[3],q[29];
-rz(4.055756747240184) q[29];
-cx q[3],q[29];
-rx(3.624759426308456) q[29];
-ry(pi/2) q[30];
-rx(pi) q[30];
-cx q[3],q[30];
-rz(4.055756747240184) q[30];
-cx q[3],q[30];
-cx q[18],q[30];
-rz(4.055756747240184) q[30];
-cx q[18],q[30];
-rx(3.624759426308456) q[18];
-ry(pi/2) q[31];
-rx(pi) q[31];
-cx q[12],q[31];
-rz(4.055756747240184) q[31];
-cx q[12],q[31];
-cx q[26],q[31];
-rz(4.055756747240184) q[31];
-cx q[26],q[31];
-rx(3.624759426308456) q[26];
-rx(3.624759426308456) q[31];
-ry(pi/2) q[32];
-rx(pi) q[32];
-cx q[0],q[32];
-rz(4.055756747240184) q[32];
-cx q[0],q[32];
-cx q[21],q[32];
-rz(4.055756747240184) q[32];
-cx q[21],q[32];
-ry(pi/2) q[33];
-rx(pi) q[33];
-cx q[5],q[33];
-rz(4.055756747240184) q[33];
-cx q[5],q[33];
-cx q[30],q[33];
-rz(4.055756747240184) q[33];
-cx q[30],q[33];
-rx(3.624759426308456) q[33];
-ry(pi/2) q[34];
-rx(pi) q[34];
-cx q[3],q[34];
-rz(4.055756747240184) q[34];
-cx q[3],q[34];
-cx q[12],q[34];
-rz(4.055756747240184) q[34];
-cx q[12],q[34];
-ry(pi/2) q[35];
-rx(pi) q[35];
-cx q[3],q[35];
-rz(4.055756747240184) q[35];
-cx q[3],q[35];
-cx q[32],q[35];
-rz(4.055756747240184) q[35];
-cx q[32],q[35];
-rx(3.624759426308456) q[35];
-ry(pi/2) q[36];
-rx(pi) q[36];
-cx q[15],q[36];
-rz(4.055756747240184) q[36];
-cx q[15],q[36];
-cx q[20],q[36];
-rz(4.055756747240184) q[36];
-cx q[20],q[36];
-rx(3.624759426308456) q[36];
-ry(pi/2) q[37];
-rx(pi) q[37];
-cx q[10],q[37];
-rz(4.055756747240184) q[37];
-cx q[10],q[37];
-cx q[34],q[37];
-rz(4.055756747240184) q[37];
-cx q[34],q[37];
-rx(3.624759426308456) q[34];
-rx(3.624759426308456) q[37];
-ry(pi/2) q[38];
-rx(pi) q[38];
-cx q[19],q[38];
-rz(4.055756747240184) q[38];
-cx q[19],q[38];
-rx(3.624759426308456) q[19];
-cx q[21],q[38];
-rz(4.055756747240184) q[38];
-cx q[21],q[38];
-ry(pi/2) q[39];
-rx(pi) q[39];
-cx q[3],q[39];
-rz(4.055756747240184) q[39];
-cx q[3],q[39];
-cx q[13],q[39];
-rz(4.055756747240184) q[39];
-cx q[13],q[39];
-rx(3.624759426308456) q[39];
-ry(pi/2) q[40];
-rx(pi) q[40];
-cx q[3],q[40];
-rz(4.055756747240184) q[40];
-cx q[3],q[40];
-cx q[23],q[40];
-rz(4.055756747240184) q[40];
-cx q[23],q[40];
-rx(3.624759426308456) q[23];
-rx(3.624759426308456) q[40];
-ry(pi/2) q[41];
-rx(pi) q[41];
-cx q[10],q[41];
-rz(4.055756747240184) q[41];
-cx q[10],q[41];
-cx q[27],q[41];
-rz(4.055756747240184) q[41];
-cx q[27],q[41];
-rx(3.624759426308456) q[27];
-rx(3.624759426308456) q[41];
-ry(pi/2) q[42];
-rx(pi) q[42];
-cx q[0],q[42];
-rz(4.055756747240184) q[42];
-cx q[0],q[42];
-cx q[3],q[42];
-rz(4.055756747240184) q[42];
-cx q[3],q[42];
-rx(3.624759426308456) q[42];
-ry(pi/2) q[43];
-rx(pi) q[43];
-cx q[3],q[43];
-rz(4.055756747240184) q[43];
-cx q[3],q[43];
-cx q[20],q[43];
-rz(4.055756747240184) q[43];
-cx q[20],q[43];
-rx(3.624759426308456) q[20];
-rx(3.624759426308456) q[43];
-ry(pi/2) q[44];
-rx(pi) q[44];
-cx q[3],q[44];
-rz(4.055756747240184) q[44];
-cx q[3],q[44];
-cx q[12],q[44];
-rz(4.055756747240184) q[44];
-cx q[12],q[44];
-rx(3.624759426308456) q[44];
-ry(pi/2) q[45];
-rx(pi) q[45];
-cx q[1],q[45];
-rz(4.055756747240184) q[45];
-cx q[1],q[45];
-cx q[16],q[45];
-rz(4.055756747240184) q[45];
-cx q[16],q[45];
-ry(pi/2) q[46];
-rx(pi) q[46];
-cx q[5],q[46];
-rz(4.055756747240184) q[46];
-cx q[5],q[46];
-rx(3.624759426308456) q[5];
-cx q[38],q[46];
-rz(4.055756747240184) q[46];
-cx q[38],q[46];
-rx(3.624759426308456) q[38];
-rx(3.624759426308456) q[46];
-ry(pi/2) q[47];
-rx(pi) q[47];
-cx q[4],q[47];
-rz(4.055756747240184) q[47];
-cx q[4],q[47];
-cx q[17],q[47];
-rz(4.055756747240184) q[47];
-cx q[17],q[47];
-rx(3.624759426308456) q[47];
-ry(pi/2) q[48];
-rx(pi) q[48];
-cx q[0],q[48];
-rz(4.055756747240184) q[48];
-cx q[0],q[48];
-cx q[30],q[48];
-rz(4.055756747240184) q[48];
-cx q[30],q[48];
-rx(3.624759426308456) q[30];
-rx(3.624759426308456) q[48];
-ry(pi/2) q[49];
-rx(pi) q[49];
-cx q[3],q[49];
-rz(4.055756747240184) q[49];
-cx q[3],q[49];
-cx q[4],q[49];
-rz(4.055756747240184) q[49];
-cx q[4],q[49];
-rx(3.624759426308456) q[49];
-ry(pi/2) q[50];
-rx(pi) q[50];
-cx q[3],q[50];
-rz(4.055756747240184) q[50];
-cx q[3],q[50];
-cx q[12],q[50];
-rz(4.055756747240184) q[50];
-cx q[12],q[50];
-rx(3.624759426308456) q[12];
-rx(3.624759426308456) q[50];
-ry(pi/2) q[51];
-rx(pi) q[51];
-cx q[0],q[51];
-rz(4.055756747240184) q[51];
-cx q[0],q[51];
-rx(3.624759426308456) q[0];
-cx q[28],q[51];
-rz(4.055756747240184) q[51];
-cx q[28],q[51];
-rx(3.624759426308456) q[51];
-ry(pi/2) q[52];
-rx(pi) q[52];
-cx q[3],q[52];
-rz(4.055756747240184) q[52];
-cx q[3],q[52];
-cx q[10],q[52];
-rz(4.055756747240184) q[52];
-cx q[10],q[52];
-rx(3.624759426308456) q[10];
-rx(3.624759426308456) q[52];
-ry(pi/2) q[53];
-rx(pi) q[53];
-cx q[17],q[53];
-rz(4.055756747240184) q[53];
-cx q[17],q[53];
-rx(3.624759426308456) q[17];
-cx q[21],q[53];
-rz(4.055756747240184) q[53];
-cx q[21],q[53];
-rx(3.624759426308456) q[21];
-rx(3.624759426308456) q[53];
-ry(pi/2) q[54];
-rx(pi) q[54];
-cx q[24],q[54];
-rz(4.055756747240184) q[54];
-cx q[24],q[54];
-cx q[28],q[54];
-rz(4.055756747240184) q[54];
-cx q[28],q[54];
-rx(3.624759426308456) q[54];
-ry(pi/2) q[55];
-rx(pi) q[55];
-cx q[9],q[55];
-rz(4.055756747240184) q[55];
-cx q[9],q[55];
-rx(3.624759426308456) q[9];
-cx q[15],q[55];
-rz(4.055756747240184) q[55];
-cx q[15],q[55];
-rx(3.624759426308456) q[15];
-rx(3.624759426308456) q[55];
-ry(pi/2) q[56];
-rx(pi) q[56];
-cx q[13],q[56];
-rz(4.055756747240184) q[56];
-cx q[13],q[56];
-rx(3.624759426308456) q[13];
-cx q[45],q[56];
-rz(4.055756747240184) q[56];
-cx q[45],q[56];
-rx(3.624759426308456) q[45];
-rx(3.624759426308456) q[56];
-ry(pi/2) q[57];
-rx(pi) q[57];
-cx q[1],q[57];
-rz(4.055756747240184) q[57];
-cx q[1],q[57];
-cx q[3],q[57];
-rz(4.055756747240184) q[57];
-cx q[3],q[57];
-rx(3.624759426308456) q[3];
-rx(3.624759426308456) q[57];
-ry(pi/2) q[58];
-rx(pi) q[58];
-cx q[24],q[58];
-rz(4.055756747240184) q[58];
-cx q[24],q[58];
-rx(3.624759426308456) q[24];
-cx q[28],q[58];
-rz(4.055756747240184) q[58];
-cx q[28],q[58];
-rx(3.624759426308456) q[28];
-rx(3.624759426308456) q[58];
-ry(pi/2) q[59];
-rx(pi) q[59];
-cx q[16],q[59];
-rz(4.055756747240184) q[59];
-cx q[16],q[59];
-rx(3.624759426308456) q[16];
-cx q[32],q[59];
-rz(4.055756747240184) q[59];
-cx q[32],q[59];
-rx(3.624759426308456) q[32];
-rx(3.624759426308456) q[59];
-ry(pi/2) q[60];
-rx(pi) q[60];
-cx q[1],q[60];
-rz(4.055756747240184) q[60];
-cx q[1],q[60];
-rx(3.624759426308456) q[1];
-cx q[0],q[1];
-rz(3.181578718388249) q[1];
-cx q[0],q[1];
-cx q[0],q[2];
-rz(3.181578718388249) q[2];
-cx q[0],q[2];
-cx q[0],q[3];
-rx(7.15262148147782) q[2];
-rz(3.181578718388249) q[3];
-cx q[0],q[3];
-cx q[0],q[15];
-cx q[1],q[3];
-rz(3.181578718388249) q[3];
-cx q[1],q[3];
-cx q[7],q[60];
-rz(3.181578718388249) q[15];
-cx q[0],q[15];
-cx q[0],q[16];
-rz(3.181578718388249) q[16];
-cx q[0],q[16];
-cx q[0],q[20];
-rz(3.181578718388249) q[20];
-cx q[0],q[20];
-cx q[0],q[32];
-rz(3.181578718388249) q[32];
-cx q[0],q[32];
-cx q[0],q[42];
-rz(3.181578718388249) q[42];
-cx q[0],q[42];
-cx q[0],q[48];
-rz(3.181578718388249) q[48];
-cx q[0],q[48];
-cx q[0],q[51];
-rz(3.181578718388249) q[51];
-cx q[0],q[51];
-rx(7.15262148147782) q[0];
-rz(4.055756747240184) q[60];
-cx q[7],q[60];
-rx(3.624759426308456) q[60];
-ry(pi/2) q[61];
-rx(pi) q[61];
-cx q[4],q[61];
-rz(4.055756747240184) q[61];
-cx q[4],q[61];
-rx(3.624759426308456) q[4];
-cx q[1],q[4];
-rz(3.181578718388249) q[4];
-cx q[1],q[4];
-cx q[1],q[5];
-cx q[3],q[4];
-rz(3.181578718388249) q[4];
-cx q[3],q[4];
-cx q[4],q[6];
-rz(3.181578718388249) q[5];
-cx q[1],q[5];
-cx q[1],q[9];
-cx q[3],q[5];
-rz(3.181578718388249) q[5];
-cx q[3],q[5];
-rz(3.181578718388249) q[6];
-cx q[4],q[6];
-cx q[5],q[6];
-rz(3.181578718388249) q[6];
-cx q[5],q[6];
-cx q[7],q[61];
-rz(3.181578718388249) q[9];
-cx q[1],q[9];
-cx q[1],q[17];
-rz(3.181578718388249) q[17];
-cx q[1],q[17];
-cx q[1],q[28];
-rz(3.181578718388249) q[28];
-cx q[1],q[28];
-cx q[1],q[29];
-rz(3.181578718388249) q[29];
-cx q[1],q[29];
-cx q[1],q[45];
-rz(3.181578718388249) q[45];
-cx q[1],q[45];
-cx q[1],q[57];
-rz(3.181578718388249) q[57];
-cx q[1],q[57];
-cx q[1],q[60];
-rz(3.181578718388249) q[60];
-cx q[1],q[60];
-rx(7.15262148147782) q[1];
-cx q[0],q[1];
-rz(3.227171050991028) q[1];
-cx q[0],q[1];
-cx q[0],q[2];
-rz(3.227171050991028) q[2];
-cx q[0],q[2];
-rx(9.398905689591338) q[2];
-rz(4.055756747240184) q[61];
-cx q[7],q[61];
-rx(3.624759426308456) q[7];
-cx q[3],q[7];
-rz(3.181578718388249) q[7];
-cx q[3],q[7];
-cx q[3],q[8];
-cx q[4],q[7];
-rz(3.181578718388249) q[7];
-cx q[4],q[7];
-cx q[4],q[10];
-rz(3.181578718388249) q[8];
-cx q[3],q[8];
-cx q[3],q[9];
-cx q[5],q[8];
-rz(3.181578718388249) q[8];
-cx q[5],q[8];
-cx q[5],q[11];
-rx(7.15262148147782) q[8];
-rz(3.181578718388249) q[9];
-cx q[3],q[9];
-cx q[3],q[12];
-rz(3.181578718388249) q[10];
-cx q[4],q[10];
-cx q[4],q[13];
-cx q[6],q[10];
-rz(3.181578718388249) q[10];
-cx q[6],q[10];
-cx q[10],q[37];
-rz(3.181578718388249) q[11];
-cx q[5],q[11];
-cx q[6],q[11];
-rz(3.181578718388249) q[11];
-cx q[6],q[11];
-rx(7.15262148147782) q[11];
-rz(3.181578718388249) q[12];
-cx q[3],q[12];
-cx q[3],q[14];
-cx q[5],q[12];
-rz(3.181578718388249) q[12];
-cx q[5],q[12];
-rz(3.181578718388249) q[13];
-cx q[4],q[13];
-cx q[5],q[13];
-rz(3.181578718388249) q[13];
-cx q[5],q[13];
-rz(3.181578718388249) q[14];
-cx q[3],q[14];
-cx q[3],q[15];
-cx q[4],q[14];
-rz(3.181578718388249) q[14];
-cx q[4],q[14];
-rx(7.15262148147782) q[14];
-rz(3.181578718388249) q[15];
-cx q[3],q[15];
-cx q[3],q[16];
-cx q[15],q[20];
-rz(3.181578718388249) q[16];
-cx q[3],q[16];
-cx q[3],q[17];
-cx q[16],q[45];
-rz(3.181578718388249) q[17];
-cx q[3],q[17];
-cx q[3],q[18];
-rz(3.181578718388249) q[18];
-cx q[3],q[18];
-cx q[3],q[19];
-cx q[4],q[18];
-rz(3.181578718388249) q[18];
-cx q[4],q[18];
-cx q[4],q[21];
-rz(3.181578718388249) q[19];
-cx q[3],q[19];
-cx q[3],q[22];
-cx q[7],q[19];
-rz(3.181578718388249) q[19];
-cx q[7],q[19];
-cx q[7],q[60];
-cx q[19],q[38];
-rz(3.181578718388249) q[20];
-cx q[15],q[20];
-rz(3.181578718388249) q[21];
-cx q[4],q[21];
-cx q[4],q[27];
-cx q[15],q[21];
-rz(3.181578718388249) q[21];
-cx q[15],q[21];
-cx q[15],q[36];
-rz(3.181578718388249) q[22];
-cx q[3],q[22];
-cx q[3],q[23];
-cx q[9],q[22];
-rz(3.181578718388249) q[22];
-cx q[9],q[22];
-cx q[9],q[55];
-rx(7.15262148147782) q[22];
-rz(3.181578718388249) q[23];
-cx q[3],q[23];
-cx q[3],q[24];
-cx q[17],q[23];
-rz(3.181578718388249) q[23];
-cx q[17],q[23];
-rz(3.181578718388249) q[24];
-cx q[3],q[24];
-cx q[3],q[25];
-cx q[5],q[24];
-rz(3.181578718388249) q[24];
-cx q[5],q[24];
-cx q[5],q[33];
-cx q[24],q[54];
-rz(3.181578718388249) q[25];
-cx q[3],q[25];
-cx q[3],q[26];
-cx q[12],q[25];
-rz(3.181578718388249) q[25];
-cx q[12],q[25];
-cx q[12],q[31];
-rx(7.15262148147782) q[25];
-rz(3.181578718388249) q[26];
-cx q[3],q[26];
-cx q[3],q[28];
-cx q[21],q[26];
-rz(3.181578718388249) q[26];
-cx q[21],q[26];
-cx q[21],q[32];
-rz(3.181578718388249) q[27];
-cx q[4],q[27];
-cx q[4],q[47];
-cx q[6],q[27];
-rz(3.181578718388249) q[27];
-cx q[6],q[27];
-rx(7.15262148147782) q[6];
-rz(3.181578718388249) q[28];
-cx q[3],q[28];
-cx q[3],q[29];
-cx q[28],q[51];
-rz(3.181578718388249) q[29];
-cx q[3],q[29];
-cx q[3],q[30];
-rx(7.15262148147782) q[29];
-rz(3.181578718388249) q[30];
-cx q[3],q[30];
-cx q[3],q[34];
-cx q[18],q[30];
-rz(3.181578718388249) q[30];
-cx q[18],q[30];
-rx(7.15262148147782) q[18];
-rz(3.181578718388249) q[31];
-cx q[12],q[31];
-cx q[26],q[31];
-rz(3.181578718388249) q[31];
-cx q[26],q[31];
-rx(7.15262148147782) q[26];
-rx(7.15262148147782) q[31];
-rz(3.181578718388249) q[32];
-cx q[21],q[32];
-rz(3.181578718388249) q[33];
-cx q[5],q[33];
-cx q[5],q[46];
-cx q[30],q[33];
-rz(3.181578718388249) q[33];
-cx q[30],q[33];
-cx q[30],q[48];
-rx(7.15262148147782) q[33];
-rz(3.181578718388249) q[34];
-cx q[3],q[34];
-cx q[3],q[35];
-cx q[12],q[34];
-rz(3.181578718388249) q[34];
-cx q[12],q[34];
-rz(3.181578718388249) q[35];
-cx q[3],q[35];
-cx q[3],q[39];
-cx q[32],q[35];
-rz(3.181578718388249) q[35];
-cx q[32],q[35];
-rx(7.15262148147782) q[35];
-rz(3.181578718388249) q[36];
-cx q[15],q[36];
-cx q[20],q[36];
-rz(3.181578718388249) q[36];
-cx q[20],q[36];
-rx(7.15262148147782) q[36];
-rz(3.181578718388249) q[37];
-cx q[10],q[37];
-cx q[10],q[41];
-cx q[34],q[37];
-rz(3.181578718388249) q[37];
-cx q[34],q[37];
-rx(7.15262148147782) q[34];
-rx(7.15262148147782) q[37];
-rz(3.181578718388249) q[38];
-cx q[19],q[38];
-rx(7.15262148147782) q[19];
-cx q[21],q[38];
-rz(3.181578718388249) q[38];
-cx q[21],q[38];
-rz(3.181578718388249) q[39];
-cx q[3],q[39];
-cx q[3],q[40];
-cx q[13],q[39];
-rz(3.181578718388249) q[39];
-cx q[13],q[39];
-cx q[13],q[56];
-rx(7.15262148147782) q[39];
-rz(3.181578718388249) q[40];
-cx q[3],q[40];
-cx q[3],q[42];
-cx q[23],q[40];
-rz(3.181578718388249) q[40];
-cx q[23],q[40];
-rx(7.15262148147782) q[23];
-rx(7.15262148147782) q[40];
-rz(3.181578718388249) q[41];
-cx q[10],q[41];
-cx q[27],q[41];
-rz(3.181578718388249) q[41];
-cx q[27],q[41];
-rx(7.15262148147782) q[27];
-rx(7.15262148147782) q[41];
-rz(3.181578718388249) q[42];
-cx q[3],q[42];
-cx q[3],q[43];
-rx(7.15262148147782) q[42];
-rz(3.181578718388249) q[43];
-cx q[3],q[43];
-cx q[3],q[44];
-cx q[20],q[43];
-rz(3.181578718388249) q[43];
-cx q[20],q[43];
-rx(7.15262148147782) q[20];
-rx(7.15262148147782) q[43];
-rz(3.181578718388249) q[44];
-cx q[3],q[44];
-cx q[3],q[49];
-cx q[12],q[44];
-rz(3.181578718388249) q[44];
-cx q[12],q[44];
-rx(7.15262148147782) q[44];
-rz(3.181578718388249) q[45];
-cx q[16],q[45];
-cx q[16],q[59];
-rz(3.181578718388249) q[46];
-cx q[5],q[46];
-rx(7.15262148147782) q[5];
-cx q[38],q[46];
-rz(3.181578718388249) q[46];
-cx q[38],q[46];
-rx(7.15262148147782) q[38];
-rx(7.15262148147782) q[46];
-rz(3.181578718388249) q[47];
-cx q[4],q[47];
-cx q[17],q[47];
-rz(3.181578718388249) q[47];
-cx q[17],q[47];
-cx q[17],q[53];
-rx(7.15262148147782) q[47];
-rz(3.181578718388249) q[48];
-cx q[30],q[48];
-rx(7.15262148147782) q[30];
-rx(7.15262148147782) q[48];
-rz(3.181578718388249) q[49];
-cx q[3],q[49];
-cx q[3],q[50];
-cx q[4],q[49];
-rz(3.181578718388249) q[49];
-cx q[4],q[49];
-rx(7.15262148147782) q[49];
-rz(3.181578718388249) q[50];
-cx q[3],q[50];
-cx q[3],q[52];
-cx q[12],q[50];
-rz(3.181578718388249) q[50];
-cx q[12],q[50];
-rx(7.15262148147782) q[12];
-rx(7.15262148147782) q[50];
-rz(3.181578718388249) q[51];
-cx q[28],q[51];
-rx(7.15262148147782) q[51];
-rz(3.181578718388249) q[52];
-cx q[3],q[52];
-cx q[3],q[57];
-cx q[10],q[52];
-rz(3.181578718388249) q[52];
-cx q[10],q[52];
-rx(7.15262148147782) q[10];
-rx(7.15262148147782) q[52];
-rz(3.181578718388249) q[53];
-cx q[17],q[53];
-rx(7.15262148147782) q[17];
-cx q[21],q[53];
-rz(3.181578718388249) q[53];
-cx q[21],q[53];
-rx(7.15262148147782) q[21];
-rx(7.15262148147782) q[53];
-rz(3.181578718388249) q[54];
-cx q[24],q[54];
-cx q[24],q[58];
-cx q[28],q[54];
-rz(3.181578718388249) q[54];
-cx q[28],q[54];
-rx(7.15262148147782) q[54];
-rz(3.181578718388249) q[55];
-cx q[9],q[55];
-rx(7.15262148147782) q[9];
-cx q[15],q[55];
-rz(3.181578718388249) q[55];
-cx q[15],q[55];
-rx(7.15262148147782) q[15];
-rx(7.15262148147782) q[55];
-rz(3.181578718388249) q[56];
-cx q[13],q[56];
-rx(7.15262148147782) q[13];
-cx q[45],q[56];
-rz(3.181578718388249) q[56];
-cx q[45],q[56];
-rx(7.15262148147782) q[45];
-rx(7.15262148147782) q[56];
-rz(3.181578718388249) q[57];
-cx q[3],q[57];
-rx(7.15262148147782) q[3];
-cx q[0],q[3];
-rz(3.227171050991028) q[3];
-cx q[0],q[3];
-cx q[0],q[15];
-cx q[1],q[3];
-rz(3.227171050991028) q[3];
-cx q[1],q[3];
-rz(3.227171050991028) q[15];
-cx q[0],q[15];
-rx(7.15262148147782) q[57];
-rz(3.181578718388249) q[58];
-cx q[24],q[58];
-rx(7.15262148147782) q[24];
-cx q[28],q[58];
-rz(3.181578718388249) q[58];
-cx q[28],q[58];
-rx(7.15262148147782) q[28];
-rx(7.15262148147782) q[58];
-rz(3.181578718388249) q[59];
-cx q[16],q[59];
-rx(7.15262148147782) q[16];
-cx q[0],q[16];
-rz(3.227171050991028) q[16];
-cx q[0],q[16];
-cx q[0],q[20];
-rz(3.227171050991028) q[20];
-cx q[0],q[20];
-cx q[32],q[59];
-rz(3.181578718388249) q[59];
-cx q[32],q[59];
-rx(7.15262148147782) q[32];
-cx q[0],q[32];
-rz(3.227171050991028) q[32];
-cx q[0],q[32];
-cx q[0],q[42];
-rz(3.227171050991028) q[42];
-cx q[0],q[42];
-cx q[0],q[48];
-rz(3.227171050991028) q[48];
-cx q[0],q[48];
-cx q[0],q[51];
-rz(3.227171050991028) q[51];
-cx q[0],q[51];
-rx(9.398905689591338) q[0];
-rx(7.15262148147782) q[59];
-rz(3.181578718388249) q[60];
-cx q[7],q[60];
-rx(7.15262148147782) q[60];
-rx(3.624759426308456) q[61];
-cx q[4],q[61];
-rz(3.181578718388249) q[61];
-cx q[4],q[61];
-rx(7.15262148147782) q[4];
-cx q[1],q[4];
-rz(3.227171050991028) q[4];
-cx q[1],q[4];
-cx q[1],q[5];
-cx q[3],q[4];
-rz(3.227171050991028) q[4];
-cx q[3],q[4];
-cx q[4],q[6];
-rz(3.227171050991028) q[5];
-cx q[1],q[5];
-cx q[1],q[9];
-cx q[3],q[5];
-rz(3.227171050991028) q[5];
-cx q[3],q[5];
-rz(3.227171050991028) q[6];
-cx q[4],q[6];
-cx q[5],q[6];
-rz(3.227171050991028) q[6];
-cx q[5],q[6];
-cx q[7],q[61];
-rz(3.227171050991028) q[9];
-cx q[1],q[9];
-cx q[1],q[17];
-rz(3.227171050991028) q[17];
-cx q[1],q[17];
-cx q[1],q[28];
-rz(3.227171050991028) q[28];
-cx q[1],q[28];
-cx q[1],q[29];
-rz(3.227171050991028) q[29];
-cx q[1],q[29];
-cx q[1],q[45];
-rz(3.227171050991028) q[45];
-cx q[1],q[45];
-cx q[1],q[57];
-rz(3.227171050991028) q[57];
-cx q[1],q[57];
-cx q[1],q[60];
-rz(3.227171050991028) q[60];
-cx q[1],q[60];
-rx(9.398905689591338) q[1];
-rz(3.181578718388249) q[61];
-cx q[7],q[61];
-rx(7.15262148147782) q[7];
-cx q[3],q[7];
-rz(3.227171050991028) q[7];
-cx q[3],q[7];
-cx q[3],q[8];
-cx q[4],q[7];
-rz(3.227171050991028) q[7];
-cx q[4],q[7];
-cx q[4],q[10];
-rz(3.227171050991028) q[8];
-cx q[3],q[8];
-cx q[3],q[9];
-cx q[5],q[8];
-rz(3.227171050991028) q[8];
-cx q[5],q[8];
-cx q[5],q[11];
-rx(9.398905689591338) q[8];
-rz(3.227171050991028) q[9];
-cx q[3],q[9];
-cx q[3],q[12];
-rz(3.227171050991028) q[10];
-cx q[4],q[10];
-cx q[4],q[13];
-cx q[6],q[10];
-rz(3.227171050991028) q[10];
-cx q[6],q[10];
-cx q[10],q[37];
-rz(3.227171050991028) q[11];
-cx q[5],q[11];
-cx q[6],q[11];
-rz(3.227171050991028) q[11];
-cx q[6],q[11];
-rx(9.398905689591338) q[11];
-rz(3.227171050991028) q[12];
-cx q[3],q[12];
-cx q[3],q[14];
-cx q[5],q[12];
-rz(3.227171050991028) q[12];
-cx q[5],q[12];
-rz(3.227171050991028) q[13];
-cx q[4],q[13];
-cx q[5],q[13];
-rz(3.227171050991028) q[13];
-cx q[5],q[13];
-rz(3.227171050991028) q[14];
-cx q[3],q[14];
-cx q[3],q[15];
-cx q[4],q[14];
-rz(3.227171050991028) q[14];
-cx q[4],q[14];
-rx(9.398905689591338) q[14];
-rz(3.227171050991028) q[15];
-cx q[3],q[15];
-cx q[3],q[16];
-cx q[15],q[20];
-rz(3.227171050991028) q[16];
-cx q[3],q[16];
-cx q[3],q[17];
-cx q[16],q[45];
-rz(3.227171050991028) q[17];
-cx q[3],q[17];
-cx q[3],q[18];
-rz(3.227171050991028) q[18];
-cx q[3],q[18];
-cx q[3],q[19];
-cx q[4],q[18];
-rz(3.227171050991028) q[18];
-cx q[4],q[18];
-cx q[4],q[21];
-rz(3.227171050991028) q[19];
-cx q[3],q[19];
-cx q[3],q[22];
-cx q[7],q[19];
-rz(3.227171050991028) q[19];
-cx q[7],q[19];
-cx q[7],q[60];
-cx q[19],q[38];
-rz(3.227171050991028) q[20];
-cx q[15],q[20];
-rz(3.227171050991028) q[21];
-cx q[4],q[21];
-cx q[4],q[27];
-cx q[15],q[21];
-rz(3.227171050991028) q[21];
-cx q[15],q[21];
-cx q[15],q[36];
-rz(3.227171050991028) q[22];
-cx q[3],q[22];
-cx q[3],q[23];
-cx q[9],q[22];
-rz(3.227171050991028) q[22];
-cx q[9],q[22];
-cx q[9],q[55];
-rx(9.398905689591338) q[22];
-rz(3.227171050991028) q[23];
-cx q[3],q[23];
-cx q[3],q[24];
-cx q[17],q[23];
-rz(3.227171050991028) q[23];
-cx q[17],q[23];
-rz(3.227171050991028) q[24];
-cx q[3],q[24];
-cx q[3],q[25];
-cx q[5],q[24];
-rz(3.227171050991028) q[24];
-cx q[5],q[24];
-cx q[5],q[33];
-cx q[24],q[54];
-rz(3.227171050991028) q[25];
-cx q[3],q[25];
-cx q[3],q[26];
-cx q[12],q[25];
-rz(3.227171050991028) q[25];
-cx q[12],q[25];
-cx q[12],q[31];
-rx(9.398905689591338) q[25];
-rz(3.227171050991028) q[26];
-cx q[3],q[26];
-cx q[3],q[28];
-cx q[21],q[26];
-rz(3.227171050991028) q[26];
-cx q[21],q[26];
-cx q[21],q[32];
-rz(3.227171050991028) q[27];
-cx q[4],q[27];
-cx q[4],q[47];
-cx q[6],q[27];
-rz(3.227171050991028) q[27];
-cx q[6],q[27];
-rx(9.398905689591338) q[6];
-rz(3.227171050991028) q[28];
-cx q[3],q[28];
-cx q[3],q[29];
-cx q[28],q[51];
-rz(3.227171050991028) q[29];
-cx q[3],q[29];
-cx q[3],q[30];
-rx(9.398905689591338) q[29];
-rz(3.227171050991028) q[30];
-cx q[3],q[30];
-cx q[3],q[34];
-cx q[18],q[30];
-rz(3.227171050991028) q[30];
-cx q[18],q[30];
-rx(9.398905689591338) q[18];
-rz(3.227171050991028) q[31];
-cx q[12],q[31];
-cx q[26],q[31];
-rz(3.227171050991028) q[31];
-cx q[26],q[31];
-rx(9.398905689591338) q[26];
-rx(9.398905689591338) q[31];
-rz(3.227171050991028) q[32];
-cx q[21],q[32];
-rz(3.227171050991028) q[33];
-cx q[5],q[33];
-cx q[5],q[46];
-cx q[30],q[33];
-rz(3.227171050991028) q[33];
-cx q[30],q[33];
-cx q[30],q[48];
-rx(9.398905689591338) q[33];
-rz(3.227171050991028) q[34];
-cx q[3],q[34];
-cx q[3],q[35];
-cx q[12],q[34];
-rz(3.227171050991028) q[34];
-cx q[12],q[34];
-rz(3.227171050991028) q[35];
-cx q[3],q[35];
-cx q[3],q[39];
-cx q[32],q[35];
-rz(3.227171050991028) q[35];
-cx q[32],q[35];
-rx(9.398905689591338) q[35];
-rz(3.227171050991028) q[36];
-cx q[15],q[36];
-cx q[20],q[36];
-rz(3.227171050991028) q[36];
-cx q[20],q[36];
-rx(9.398905689591338) q[36];
-rz(3.227171050991028) q[37];
-cx q[10],q[37];
-cx q[10],q[41];
-cx q[34],q[37];
-rz(3.227171050991028) q[37];
-cx q[34],q[37];
-rx(9.398905689591338) q[34];
-rx(9.398905689591338) q[37];
-rz(3.227171050991028) q[38];
-cx q[19],q[38];
-rx(9.398905689591338) q[19];
-cx q[21],q[38];
-rz(3.227171050991028) q[38];
-cx q[21],q[38];
-rz(3.227171050991028) q[39];
-cx q[3],q[39];
-cx q[3],q[40];
-cx q[13],q[39];
-rz(3.227171050991028) q[39];
-cx q[13],q[39];
-cx q[13],q[56];
-rx(9.398905689591338) q[39];
-rz(3.227171050991028) q[40];
-cx q[3],q[40];
-cx q[3],q[42];
-cx q[23],q[40];
-rz(3.227171050991028) q[40];
-cx q[23],q[40];
-rx(9.398905689591338) q[23];
-rx(9.398905689591338) q[40];
-rz(3.227171050991028) q[41];
-cx q[10],q[41];
-cx q[27],q[41];
-rz(3.227171050991028) q[41];
-cx q[27],q[41];
-rx(9.398905689591338) q[27];
-rx(9.398905689591338) q[41];
-rz(3.227171050991028) q[42];
-cx q[3],q[42];
-cx q[3],q[43];
-rx(9.398905689591338) q[42];
-rz(3.227171050991028) q[43];
-cx q[3],q[43];
-cx q[3],q[44];
-cx q[20],q[43];
-rz(3.227171050991028) q[43];
-cx q[20],q[43];
-rx(9.398905689591338) q[20];
-rx(9.398905689591338) q[43];
-rz(3.227171050991028) q[44];
-cx q[3],q[44];
-cx q[3],q[49];
-cx q[12],q[44];
-rz(3.227171050991028) q[44];
-cx q[12],q[44];
-rx(9.398905689591338) q[44];
-rz(3.227171050991028) q[45];
-cx q[16],q[45];
-cx q[16],q[59];
-rz(3.227171050991028) q[46];
-cx q[5],q[46];
-rx(9.398905689591338) q[5];
-cx q[38],q[46];
-rz(3.227171050991028) q[46];
-cx q[38],q[46];
-rx(9.398905689591338) q[38];
-rx(9.398905689591338) q[46];
-rz(3.227171050991028) q[47];
-cx q[4],q[47];
-cx q[17],q[47];
-rz(3.227171050991028) q[47];
-cx q[17],q[47];
-cx q[17],q[53];
-rx(9.398905689591338) q[47];
-rz(3.227171050991028) q[48];
-cx q[30],q[48];
-rx(9.398905689591338) q[30];
-rx(9.398905689591338) q[48];
-rz(3.227171050991028) q[49];
-cx q[3],q[49];
-cx q[3],q[50];
-cx q[4],q[49];
-rz(3.227171050991028) q[49];
-cx q[4],q[49];
-rx(9.398905689591338) q[49];
-rz(3.227171050991028) q[50];
-cx q[3],q[50];
-cx q[3],q[52];
-cx q[12],q[50];
-rz(3.227171050991028) q[50];
-cx q[12],q[50];
-rx(9.398905689591338) q[12];
-rx(9.398905689591338) q[50];
-rz(3.227171050991028) q[51];
-cx q[28],q[51];
-rx(9.398905689591338) q[51];
-rz(3.227171050991028) q[52];
-cx q[3],q[52];
-cx q[3],q[57];
-cx q[10],q[52];
-rz(3.227171050991028) q[52];
-cx q[10],q[52];
-rx(9.398905689591338) q[10];
-rx(9.398905689591338) q[52];
-rz(3.227171050991028) q[53];
-cx q[17],q[53];
-rx(9.398905689591338) q[17];
-cx q[21],q[53];
-rz(3.227171050991028) q[53];
-cx q[21],q[53];
-rx(9.398905689591338) q[21];
-rx(9.398905689591338) q[53];
-rz(3.227171050991028) q[54];
-cx q[24],q[54];
-cx q[24],q[58];
-cx q[28],q[54];
-rz(3.227171050991028) q[54];
-cx q[28],q[54];
-rx(9.398905689591338) q[54];
-rz(3.227171050991028) q[55];
-cx q[9],q[55];
-rx(9.398905689591338) q[9];
-cx q[15],q[55];
-rz(3.227171050991028) q[55];
-cx q[15],q[55];
-rx(9.398905689591338) q[15];
-rx(9.398905689591338) q[55];
-rz(3.227171050991028) q[56];
-cx q[13],q[56];
-rx(9.398905689591338) q[13];
-cx q[45],q[56];
-rz(3.227171050991028) q[56];
-cx q[45],q[56];
-rx(9.398905689591338) q[45];
-rx(9.398905689591338) q[56];
-rz(3.227171050991028) q[57];
-cx q[3],q[57];
-rx(9.398905689591338) q[3];
-rx(9.398905689591338) q[57];
-rz(3.227171050991028) q[58];
-cx q[24],q[58];
-rx(9.398905689591338) q[24];
-cx q[28],q[58];
-rz(3.227171050991028) q[58];
-cx q[28],q[58];
-rx(9.398905689591338) q[28];
-rx(9.398905689591338) q[58];
-rz(3.227171050991028) q[59];
-cx q[16],q[59];
-rx(9.398905689591338) q[16];
-cx q[32],q[59];
-rz(3.227171050991028) q[59];
-cx q[32],q[59];
-rx(9.398905689591338) q[32];
-rx(9.398905689591338) q[59];
-rz(3.227171050991028) q[60];
-cx q[7],q[60];
-rx(9.398905689591338) q[60];
-rx(7.15262148147782) q[61];
-cx q[4],q[61];
-rz(3.227171050991028) q[61];
-cx q[4],q[61];
-rx(9.398905689591338) q[4];
-cx q[7],q[61];
-rz(3.227171050991028) q[61];
-cx q[7],q[61];
-rx(9.398905689591338) q[7];
-rx(9.398905689591338) q[61];
\ No newline at end of file
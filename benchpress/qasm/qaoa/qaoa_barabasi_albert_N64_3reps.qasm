@@ -1,1439 +0,0 @@
-OPENQASM 2.0;
-include "qelib1.inc";
-qreg q[64];
-ry(pi/2) q[0];
-rx(pi) q[0];
-ry(pi/2) q[1];
-rx(pi) q[1];
-cx q[0],q[1];
-rz(3.3781071100227233) q[1];
-cx q[0],q[1];
-ry(pi/2) q[2];
-rx(pi) q[2];
-cx q[0],q[2];
-rz(3.3781071100227233) q[2];
-cx q[0],q[2];
-rx(4.454668582348128) q[2];
-ry(pi/2) q[3];
-rx(pi) q[3];
-cx q[0],q[3];
-rz(3.3781071100227233) q[3];
-cx q[0],q[3];
-cx q[1],q[3];
-rz(3.3781071100227233) q[3];
-cx q[1],q[3];
-ry(pi/2) q[4];
-rx(pi) q[4];
-cx q[1],q[4];
-rz(3.3781071100227233) q[4];
-cx q[1],q[4];
-cx q[3],q[4];
-rz(3.3781071100227233) q[4];
-cx q[3],q[4];
-ry(pi/2) q[5];
-rx(pi) q[5];
-cx q[1],q[5];
-rz(3.3781071100227233) q[5];
-cx q[1],q[5];
-cx q[3],q[5];
-rz(3.3781071100227233) q[5];
-cx q[3],q[5];
-ry(pi/2) q[6];
-rx(pi) q[6];
-cx q[4],q[6];
-rz(3.3781071100227233) q[6];
-cx q[4],q[6];
-cx q[5],q[6];
-rz(3.3781071100227233) q[6];
-cx q[5],q[6];
-ry(pi/2) q[7];
-rx(pi) q[7];
-cx q[3],q[7];
-rz(3.3781071100227233) q[7];
-cx q[3],q[7];
-cx q[4],q[7];
-rz(3.3781071100227233) q[7];
-cx q[4],q[7];
-ry(pi/2) q[8];
-rx(pi) q[8];
-cx q[3],q[8];
-rz(3.3781071100227233) q[8];
-cx q[3],q[8];
-cx q[5],q[8];
-rz(3.3781071100227233) q[8];
-cx q[5],q[8];
-rx(4.454668582348128) q[8];
-ry(pi/2) q[9];
-rx(pi) q[9];
-cx q[1],q[9];
-rz(3.3781071100227233) q[9];
-cx q[1],q[9];
-cx q[3],q[9];
-rz(3.3781071100227233) q[9];
-cx q[3],q[9];
-ry(pi/2) q[10];
-rx(pi) q[10];
-cx q[4],q[10];
-rz(3.3781071100227233) q[10];
-cx q[4],q[10];
-cx q[6],q[10];
-rz(3.3781071100227233) q[10];
-cx q[6],q[10];
-ry(pi/2) q[11];
-rx(pi) q[11];
-cx q[5],q[11];
-rz(3.3781071100227233) q[11];
-cx q[5],q[11];
-cx q[6],q[11];
-rz(3.3781071100227233) q[11];
-cx q[6],q[11];
-rx(4.454668582348128) q[11];
-ry(pi/2) q[12];
-rx(pi) q[12];
-cx q[3],q[12];
-rz(3.3781071100227233) q[12];
-cx q[3],q[12];
-cx q[5],q[12];
-rz(3.3781071100227233) q[12];
-cx q[5],q[12];
-ry(pi/2) q[13];
-rx(pi) q[13];
-cx q[4],q[13];
-rz(3.3781071100227233) q[13];
-cx q[4],q[13];
-cx q[5],q[13];
-rz(3.3781071100227233) q[13];
-cx q[5],q[13];
-ry(pi/2) q[14];
-rx(pi) q[14];
-cx q[3],q[14];
-rz(3.3781071100227233) q[14];
-cx q[3],q[14];
-cx q[4],q[14];
-rz(3.3781071100227233) q[14];
-cx q[4],q[14];
-rx(4.454668582348128) q[14];
-ry(pi/2) q[15];
-rx(pi) q[15];
-cx q[0],q[15];
-rz(3.3781071100227233) q[15];
-cx q[0],q[15];
-cx q[3],q[15];
-rz(3.3781071100227233) q[15];
-cx q[3],q[15];
-ry(pi/2) q[16];
-rx(pi) q[16];
-cx q[0],q[16];
-rz(3.3781071100227233) q[16];
-cx q[0],q[16];
-cx q[3],q[16];
-rz(3.3781071100227233) q[16];
-cx q[3],q[16];
-ry(pi/2) q[17];
-rx(pi) q[17];
-cx q[1],q[17];
-rz(3.3781071100227233) q[17];
-cx q[1],q[17];
-cx q[3],q[17];
-rz(3.3781071100227233) q[17];
-cx q[3],q[17];
-ry(pi/2) q[18];
-rx(pi) q[18];
-cx q[3],q[18];
-rz(3.3781071100227233) q[18];
-cx q[3],q[18];
-cx q[4],q[18];
-rz(3.3781071100227233) q[18];
-cx q[4],q[18];
-ry(pi/2) q[19];
-rx(pi) q[19];
-cx q[3],q[19];
-rz(3.3781071100227233) q[19];
-cx q[3],q[19];
-cx q[7],q[19];
-rz(3.3781071100227233) q[19];
-cx q[7],q[19];
-ry(pi/2) q[20];
-rx(pi) q[20];
-cx q[0],q[20];
-rz(3.3781071100227233) q[20];
-cx q[0],q[20];
-cx q[15],q[20];
-rz(3.3781071100227233) q[20];
-cx q[15],q[20];
-ry(pi/2) q[21];
-rx(pi) q[21];
-cx q[4],q[21];
-rz(3.3781071100227233) q[21];
-cx q[4],q[21];
-cx q[15],q[21];
-rz(3.3781071100227233) q[21];
-cx q[15],q[21];
-ry(pi/2) q[22];
-rx(pi) q[22];
-cx q[3],q[22];
-rz(3.3781071100227233) q[22];
-cx q[3],q[22];
-cx q[9],q[22];
-rz(3.3781071100227233) q[22];
-cx q[9],q[22];
-rx(4.454668582348128) q[22];
-ry(pi/2) q[23];
-rx(pi) q[23];
-cx q[3],q[23];
-rz(3.3781071100227233) q[23];
-cx q[3],q[23];
-cx q[17],q[23];
-rz(3.3781071100227233) q[23];
-cx q[17],q[23];
-ry(pi/2) q[24];
-rx(pi) q[24];
-cx q[3],q[24];
-rz(3.3781071100227233) q[24];
-cx q[3],q[24];
-cx q[5],q[24];
-rz(3.3781071100227233) q[24];
-cx q[5],q[24];
-ry(pi/2) q[25];
-rx(pi) q[25];
-cx q[3],q[25];
-rz(3.3781071100227233) q[25];
-cx q[3],q[25];
-cx q[12],q[25];
-rz(3.3781071100227233) q[25];
-cx q[12],q[25];
-rx(4.454668582348128) q[25];
-ry(pi/2) q[26];
-rx(pi) q[26];
-cx q[3],q[26];
-rz(3.3781071100227233) q[26];
-cx q[3],q[26];
-cx q[21],q[26];
-rz(3.3781071100227233) q[26];
-cx q[21],q[26];
-ry(pi/2) q[27];
-rx(pi) q[27];
-cx q[4],q[27];
-rz(3.3781071100227233) q[27];
-cx q[4],q[27];
-cx q[6],q[27];
-rz(3.3781071100227233) q[27];
-cx q[6],q[27];
-rx(4.454668582348128) q[6];
-ry(pi/2) q[28];
-rx(pi) q[28];
-cx q[1],q[28];
-rz(3.3781071100227233) q[28];
-cx q[1],q[28];
-cx q[3],q[28];
-rz(3.3781071100227233) q[28];
-cx q[3],q[28];
-ry(pi/2) q[29];
-rx(pi) q[29];
-cx q[1],q[29];
-rz(3.3781071100227233) q[29];
-cx q[1],q[29];
-cx q[3],q[29];
-rz(3.3781071100227233) q[29];
-cx q[3],q[29];
-rx(4.454668582348128) q[29];
-ry(pi/2) q[30];
-rx(pi) q[30];
-cx q[3],q[30];
-rz(3.3781071100227233) q[30];
-cx q[3],q[30];
-cx q[18],q[30];
-rz(3.3781071100227233) q[30];
-cx q[18],q[30];
-rx(4.454668582348128) q[18];
-ry(pi/2) q[31];
-rx(pi) q[31];
-cx q[12],q[31];
-rz(3.3781071100227233) q[31];
-cx q[12],q[31];
-cx q[26],q[31];
-rz(3.3781071100227233) q[31];
-cx q[26],q[31];
-rx(4.454668582348128) q[26];
-rx(4.454668582348128) q[31];
-ry(pi/2) q[32];
-rx(pi) q[32];
-cx q[0],q[32];
-rz(3.3781071100227233) q[32];
-cx q[0],q[32];
-cx q[21],q[32];
-rz(3.3781071100227233) q[32];
-cx q[21],q[32];
-ry(pi/2) q[33];
-rx(pi) q[33];
-cx q[5],q[33];
-rz(3.3781071100227233) q[33];
-cx q[5],q[33];
-cx q[30],q[33];
-rz(3.3781071100227233) q[33];
-cx q[30],q[33];
-rx(4.454668582348128) q[33];
-ry(pi/2) q[34];
-rx(pi) q[34];
-cx q[3],q[34];
-rz(3.3781071100227233) q[34];
-cx q[3],q[34];
-cx q[12],q[34];
-rz(3.3781071100227233) q[34];
-cx q[12],q[34];
-ry(pi/2) q[35];
-rx(pi) q[35];
-cx q[3],q[35];
-rz(3.3781071100227233) q[35];
-cx q[3],q[35];
-cx q[32],q[35];
-rz(3.3781071100227233) q[35];
-cx q[32],q[35];
-rx(4.454668582348128) q[35];
-ry(pi/2) q[36];
-rx(pi) q[36];
-cx q[15],q[36];
-rz(3.3781071100227233) q[36];
-cx q[15],q[36];
-cx q[20],q[36];
-rz(3.3781071100227233) q[36];
-cx q[20],q[36];
-rx(4.454668582348128) q[36];
-ry(pi/2) q[37];
-rx(pi) q[37];
-cx q[10],q[37];
-rz(3.3781071100227233) q[37];
-cx q[10],q[37];
-cx q[34],q[37];
-rz(3.3781071100227233) q[37];
-cx q[34],q[37];
-rx(4.454668582348128) q[34];
-rx(4.454668582348128) q[37];
-ry(pi/2) q[38];
-rx(pi) q[38];
-cx q[19],q[38];
-rz(3.3781071100227233) q[38];
-cx q[19],q[38];
-rx(4.454668582348128) q[19];
-cx q[21],q[38];
-rz(3.3781071100227233) q[38];
-cx q[21],q[38];
-ry(pi/2) q[39];
-rx(pi) q[39];
-cx q[3],q[39];
-rz(3.3781071100227233) q[39];
-cx q[3],q[39];
-cx q[13],q[39];
-rz(3.3781071100227233) q[39];
-cx q[13],q[39];
-rx(4.454668582348128) q[39];
-ry(pi/2) q[40];
-rx(pi) q[40];
-cx q[3],q[40];
-rz(3.3781071100227233) q[40];
-cx q[3],q[40];
-cx q[23],q[40];
-rz(3.3781071100227233) q[40];
-cx q[23],q[40];
-rx(4.454668582348128) q[23];
-rx(4.454668582348128) q[40];
-ry(pi/2) q[41];
-rx(pi) q[41];
-cx q[10],q[41];
-rz(3.3781071100227233) q[41];
-cx q[10],q[41];
-cx q[27],q[41];
-rz(3.3781071100227233) q[41];
-cx q[27],q[41];
-rx(4.454668582348128) q[27];
-rx(4.454668582348128) q[41];
-ry(pi/2) q[42];
-rx(pi) q[42];
-cx q[0],q[42];
-rz(3.3781071100227233) q[42];
-cx q[0],q[42];
-cx q[3],q[42];
-rz(3.3781071100227233) q[42];
-cx q[3],q[42];
-rx(4.454668582348128) q[42];
-ry(pi/2) q[43];
-rx(pi) q[43];
-cx q[3],q[43];
-rz(3.3781071100227233) q[43];
-cx q[3],q[43];
-cx q[20],q[43];
-rz(3.3781071100227233) q[43];
-cx q[20],q[43];
-rx(4.454668582348128) q[20];
-rx(4.454668582348128) q[43];
-ry(pi/2) q[44];
-rx(pi) q[44];
-cx q[3],q[44];
-rz(3.3781071100227233) q[44];
-cx q[3],q[44];
-cx q[12],q[44];
-rz(3.3781071100227233) q[44];
-cx q[12],q[44];
-rx(4.454668582348128) q[44];
-ry(pi/2) q[45];
-rx(pi) q[45];
-cx q[1],q[45];
-rz(3.3781071100227233) q[45];
-cx q[1],q[45];
-cx q[16],q[45];
-rz(3.3781071100227233) q[45];
-cx q[16],q[45];
-ry(pi/2) q[46];
-rx(pi) q[46];
-cx q[5],q[46];
-rz(3.3781071100227233) q[46];
-cx q[5],q[46];
-rx(4.454668582348128) q[5];
-cx q[38],q[46];
-rz(3.3781071100227233) q[46];
-cx q[38],q[46];
-rx(4.454668582348128) q[38];
-rx(4.454668582348128) q[46];
-ry(pi/2) q[47];
-rx(pi) q[47];
-cx q[4],q[47];
-rz(3.3781071100227233) q[47];
-cx q[4],q[47];
-cx q[17],q[47];
-rz(3.3781071100227233) q[47];
-cx q[17],q[47];
-rx(4.454668582348128) q[47];
-ry(pi/2) q[48];
-rx(pi) q[48];
-cx q[0],q[48];
-rz(3.3781071100227233) q[48];
-cx q[0],q[48];
-cx q[30],q[48];
-rz(3.3781071100227233) q[48];
-cx q[30],q[48];
-rx(4.454668582348128) q[30];
-rx(4.454668582348128) q[48];
-ry(pi/2) q[49];
-rx(pi) q[49];
-cx q[3],q[49];
-rz(3.3781071100227233) q[49];
-cx q[3],q[49];
-cx q[4],q[49];
-rz(3.3781071100227233) q[49];
-cx q[4],q[49];
-rx(4.454668582348128) q[49];
-ry(pi/2) q[50];
-rx(pi) q[50];
-cx q[3],q[50];
-rz(3.3781071100227233) q[50];
-cx q[3],q[50];
-cx q[12],q[50];
-rz(3.3781071100227233) q[50];
-cx q[12],q[50];
-rx(4.454668582348128) q[50];
-ry(pi/2) q[51];
-rx(pi) q[51];
-cx q[0],q[51];
-rz(3.3781071100227233) q[51];
-cx q[0],q[51];
-cx q[28],q[51];
-rz(3.3781071100227233) q[51];
-cx q[28],q[51];
-rx(4.454668582348128) q[51];
-ry(pi/2) q[52];
-rx(pi) q[52];
-cx q[3],q[52];
-rz(3.3781071100227233) q[52];
-cx q[3],q[52];
-cx q[10],q[52];
-rz(3.3781071100227233) q[52];
-cx q[10],q[52];
-rx(4.454668582348128) q[10];
-rx(4.454668582348128) q[52];
-ry(pi/2) q[53];
-rx(pi) q[53];
-cx q[17],q[53];
-rz(3.3781071100227233) q[53];
-cx q[17],q[53];
-cx q[21],q[53];
-rz(3.3781071100227233) q[53];
-cx q[21],q[53];
-rx(4.454668582348128) q[21];
-rx(4.454668582348128) q[53];
-ry(pi/2) q[54];
-rx(pi) q[54];
-cx q[24],q[54];
-rz(3.3781071100227233) q[54];
-cx q[24],q[54];
-cx q[28],q[54];
-rz(3.3781071100227233) q[54];
-cx q[28],q[54];
-rx(4.454668582348128) q[54];
-ry(pi/2) q[55];
-rx(pi) q[55];
-cx q[9],q[55];
-rz(3.3781071100227233) q[55];
-cx q[9],q[55];
-rx(4.454668582348128) q[9];
-cx q[15],q[55];
-rz(3.3781071100227233) q[55];
-cx q[15],q[55];
-rx(4.454668582348128) q[15];
-rx(4.454668582348128) q[55];
-ry(pi/2) q[56];
-rx(pi) q[56];
-cx q[13],q[56];
-rz(3.3781071100227233) q[56];
-cx q[13],q[56];
-rx(4.454668582348128) q[13];
-cx q[45],q[56];
-rz(3.3781071100227233) q[56];
-cx q[45],q[56];
-rx(4.454668582348128) q[45];
-rx(4.454668582348128) q[56];
-ry(pi/2) q[57];
-rx(pi) q[57];
-cx q[1],q[57];
-rz(3.3781071100227233) q[57];
-cx q[1],q[57];
-cx q[3],q[57];
-rz(3.3781071100227233) q[57];
-cx q[3],q[57];
-rx(4.454668582348128) q[3];
-rx(4.454668582348128) q[57];
-ry(pi/2) q[58];
-rx(pi) q[58];
-cx q[24],q[58];
-rz(3.3781071100227233) q[58];
-cx q[24],q[58];
-rx(4.454668582348128) q[24];
-cx q[28],q[58];
-rz(3.3781071100227233) q[58];
-cx q[28],q[58];
-rx(4.454668582348128) q[28];
-rx(4.454668582348128) q[58];
-ry(pi/2) q[59];
-rx(pi) q[59];
-cx q[16],q[59];
-rz(3.3781071100227233) q[59];
-cx q[16],q[59];
-rx(4.454668582348128) q[16];
-cx q[32],q[59];
-rz(3.3781071100227233) q[59];
-cx q[32],q[59];
-rx(4.454668582348128) q[32];
-rx(4.454668582348128) q[59];
-ry(pi/2) q[60];
-rx(pi) q[60];
-cx q[1],q[60];
-rz(3.3781071100227233) q[60];
-cx q[1],q[60];
-rx(4.454668582348128) q[1];
-cx q[7],q[60];
-rz(3.3781071100227233) q[60];
-cx q[7],q[60];
-rx(4.454668582348128) q[60];
-ry(pi/2) q[61];
-rx(pi) q[61];
-cx q[4],q[61];
-rz(3.3781071100227233) q[61];
-cx q[4],q[61];
-rx(4.454668582348128) q[4];
-cx q[7],q[61];
-rz(3.3781071100227233) q[61];
-cx q[7],q[61];
-rx(4.454668582348128) q[7];
-rx(4.454668582348128) q[61];
-ry(pi/2) q[62];
-rx(pi) q[62];
-cx q[0],q[62];
-rz(3.3781071100227233) q[62];
-cx q[0],q[62];
-rx(4.454668582348128) q[0];
-cx q[0],q[1];
-rz(3.9926163494543623) q[1];
-cx q[0],q[1];
-cx q[0],q[2];
-rz(3.9926163494543623) q[2];
-cx q[0],q[2];
-cx q[0],q[3];
-rx(2.916853680830299) q[2];
-rz(3.9926163494543623) q[3];
-cx q[0],q[3];
-cx q[0],q[15];
-cx q[1],q[3];
-rz(3.9926163494543623) q[3];
-cx q[1],q[3];
-cx q[1],q[4];
-rz(3.9926163494543623) q[4];
-cx q[1],q[4];
-cx q[1],q[5];
-cx q[3],q[4];
-rz(3.9926163494543623) q[4];
-cx q[3],q[4];
-cx q[4],q[6];
-rz(3.9926163494543623) q[5];
-cx q[1],q[5];
-cx q[1],q[9];
-cx q[3],q[5];
-rz(3.9926163494543623) q[5];
-cx q[3],q[5];
-cx q[3],q[7];
-rz(3.9926163494543623) q[6];
-cx q[4],q[6];
-cx q[5],q[6];
-rz(3.9926163494543623) q[6];
-cx q[5],q[6];
-rz(3.9926163494543623) q[7];
-cx q[3],q[7];
-cx q[3],q[8];
-cx q[4],q[7];
-rz(3.9926163494543623) q[7];
-cx q[4],q[7];
-cx q[4],q[10];
-rz(3.9926163494543623) q[8];
-cx q[3],q[8];
-cx q[5],q[8];
-rz(3.9926163494543623) q[8];
-cx q[5],q[8];
-cx q[5],q[11];
-rx(2.916853680830299) q[8];
-rz(3.9926163494543623) q[9];
-cx q[1],q[9];
-cx q[3],q[9];
-rz(3.9926163494543623) q[9];
-cx q[3],q[9];
-rz(3.9926163494543623) q[10];
-cx q[4],q[10];
-cx q[4],q[13];
-cx q[6],q[10];
-rz(3.9926163494543623) q[10];
-cx q[6],q[10];
-cx q[10],q[37];
-rz(3.9926163494543623) q[11];
-cx q[5],q[11];
-cx q[6],q[11];
-rz(3.9926163494543623) q[11];
-cx q[6],q[11];
-rx(2.916853680830299) q[11];
-rz(3.9926163494543623) q[13];
-cx q[4],q[13];
-rz(3.9926163494543623) q[15];
-cx q[0],q[15];
-cx q[0],q[16];
-rz(3.9926163494543623) q[16];
-cx q[0],q[16];
-cx q[0],q[20];
-cx q[17],q[62];
-rz(3.9926163494543623) q[20];
-cx q[0],q[20];
-cx q[0],q[32];
-rz(3.9926163494543623) q[32];
-cx q[0],q[32];
-cx q[0],q[42];
-rz(3.9926163494543623) q[37];
-cx q[10],q[37];
-cx q[10],q[41];
-rz(3.9926163494543623) q[41];
-cx q[10],q[41];
-rz(3.9926163494543623) q[42];
-cx q[0],q[42];
-cx q[0],q[48];
-rz(3.9926163494543623) q[48];
-cx q[0],q[48];
-cx q[0],q[51];
-rz(3.9926163494543623) q[51];
-cx q[0],q[51];
-rz(3.3781071100227233) q[62];
-cx q[17],q[62];
-rx(4.454668582348128) q[62];
-cx q[0],q[62];
-rz(3.9926163494543623) q[62];
-cx q[0],q[62];
-rx(2.916853680830299) q[0];
-ry(pi/2) q[63];
-rx(pi) q[63];
-cx q[12],q[63];
-rz(3.3781071100227233) q[63];
-cx q[12],q[63];
-rx(4.454668582348128) q[12];
-cx q[3],q[12];
-rz(3.9926163494543623) q[12];
-cx q[3],q[12];
-cx q[3],q[14];
-cx q[5],q[12];
-rz(3.9926163494543623) q[12];
-cx q[5],q[12];
-cx q[5],q[13];
-rz(3.9926163494543623) q[13];
-cx q[5],q[13];
-rz(3.9926163494543623) q[14];
-cx q[3],q[14];
-cx q[3],q[15];
-cx q[4],q[14];
-rz(3.9926163494543623) q[14];
-cx q[4],q[14];
-rx(2.916853680830299) q[14];
-rz(3.9926163494543623) q[15];
-cx q[3],q[15];
-cx q[3],q[16];
-cx q[15],q[20];
-rz(3.9926163494543623) q[16];
-cx q[3],q[16];
-cx q[17],q[63];
-rz(3.9926163494543623) q[20];
-cx q[15],q[20];
-rz(3.3781071100227233) q[63];
-cx q[17],q[63];
-rx(4.454668582348128) q[17];
-cx q[1],q[17];
-rz(3.9926163494543623) q[17];
-cx q[1],q[17];
-cx q[1],q[28];
-cx q[3],q[17];
-rz(3.9926163494543623) q[17];
-cx q[3],q[17];
-cx q[3],q[18];
-rz(3.9926163494543623) q[18];
-cx q[3],q[18];
-cx q[3],q[19];
-cx q[4],q[18];
-rz(3.9926163494543623) q[18];
-cx q[4],q[18];
-cx q[4],q[21];
-rz(3.9926163494543623) q[19];
-cx q[3],q[19];
-cx q[3],q[22];
-cx q[7],q[19];
-rz(3.9926163494543623) q[19];
-cx q[7],q[19];
-cx q[19],q[38];
-rz(3.9926163494543623) q[21];
-cx q[4],q[21];
-cx q[4],q[27];
-cx q[15],q[21];
-rz(3.9926163494543623) q[21];
-cx q[15],q[21];
-cx q[15],q[36];
-rz(3.9926163494543623) q[22];
-cx q[3],q[22];
-cx q[3],q[23];
-cx q[9],q[22];
-rz(3.9926163494543623) q[22];
-cx q[9],q[22];
-cx q[9],q[55];
-rx(2.916853680830299) q[22];
-rz(3.9926163494543623) q[23];
-cx q[3],q[23];
-cx q[3],q[24];
-cx q[17],q[23];
-rz(3.9926163494543623) q[23];
-cx q[17],q[23];
-rz(3.9926163494543623) q[24];
-cx q[3],q[24];
-cx q[3],q[25];
-cx q[5],q[24];
-rz(3.9926163494543623) q[24];
-cx q[5],q[24];
-cx q[5],q[33];
-cx q[24],q[54];
-rz(3.9926163494543623) q[25];
-cx q[3],q[25];
-cx q[3],q[26];
-cx q[12],q[25];
-rz(3.9926163494543623) q[25];
-cx q[12],q[25];
-cx q[12],q[31];
-rx(2.916853680830299) q[25];
-rz(3.9926163494543623) q[26];
-cx q[3],q[26];
-cx q[21],q[26];
-rz(3.9926163494543623) q[26];
-cx q[21],q[26];
-cx q[21],q[32];
-rz(3.9926163494543623) q[27];
-cx q[4],q[27];
-cx q[4],q[47];
-cx q[6],q[27];
-rz(3.9926163494543623) q[27];
-cx q[6],q[27];
-rx(2.916853680830299) q[6];
-cx q[27],q[41];
-rz(3.9926163494543623) q[28];
-cx q[1],q[28];
-cx q[1],q[29];
-cx q[3],q[28];
-rz(3.9926163494543623) q[28];
-cx q[3],q[28];
-cx q[28],q[51];
-rz(3.9926163494543623) q[29];
-cx q[1],q[29];
-cx q[1],q[45];
-cx q[3],q[29];
-rz(3.9926163494543623) q[29];
-cx q[3],q[29];
-cx q[3],q[30];
-rx(2.916853680830299) q[29];
-rz(3.9926163494543623) q[30];
-cx q[3],q[30];
-cx q[3],q[34];
-cx q[18],q[30];
-rz(3.9926163494543623) q[30];
-cx q[18],q[30];
-rx(2.916853680830299) q[18];
-rz(3.9926163494543623) q[31];
-cx q[12],q[31];
-cx q[26],q[31];
-rz(3.9926163494543623) q[31];
-cx q[26],q[31];
-rx(2.916853680830299) q[26];
-rx(2.916853680830299) q[31];
-rz(3.9926163494543623) q[32];
-cx q[21],q[32];
-rz(3.9926163494543623) q[33];
-cx q[5],q[33];
-cx q[5],q[46];
-cx q[30],q[33];
-rz(3.9926163494543623) q[33];
-cx q[30],q[33];
-cx q[30],q[48];
-rx(2.916853680830299) q[33];
-rz(3.9926163494543623) q[34];
-cx q[3],q[34];
-cx q[3],q[35];
-cx q[12],q[34];
-rz(3.9926163494543623) q[34];
-cx q[12],q[34];
-cx q[34],q[37];
-rz(3.9926163494543623) q[35];
-cx q[3],q[35];
-cx q[3],q[39];
-cx q[32],q[35];
-rz(3.9926163494543623) q[35];
-cx q[32],q[35];
-rx(2.916853680830299) q[35];
-rz(3.9926163494543623) q[36];
-cx q[15],q[36];
-cx q[20],q[36];
-rz(3.9926163494543623) q[36];
-cx q[20],q[36];
-rx(2.916853680830299) q[36];
-rz(3.9926163494543623) q[37];
-cx q[34],q[37];
-rx(2.916853680830299) q[34];
-rx(2.916853680830299) q[37];
-rz(3.9926163494543623) q[38];
-cx q[19],q[38];
-rx(2.916853680830299) q[19];
-cx q[21],q[38];
-rz(3.9926163494543623) q[38];
-cx q[21],q[38];
-rz(3.9926163494543623) q[39];
-cx q[3],q[39];
-cx q[3],q[40];
-cx q[13],q[39];
-rz(3.9926163494543623) q[39];
-cx q[13],q[39];
-cx q[13],q[56];
-rx(2.916853680830299) q[39];
-rz(3.9926163494543623) q[40];
-cx q[3],q[40];
-cx q[3],q[42];
-cx q[23],q[40];
-rz(3.9926163494543623) q[40];
-cx q[23],q[40];
-rx(2.916853680830299) q[23];
-rx(2.916853680830299) q[40];
-rz(3.9926163494543623) q[41];
-cx q[27],q[41];
-rx(2.916853680830299) q[27];
-rx(2.916853680830299) q[41];
-rz(3.9926163494543623) q[42];
-cx q[3],q[42];
-cx q[3],q[43];
-rx(2.916853680830299) q[42];
-rz(3.9926163494543623) q[43];
-cx q[3],q[43];
-cx q[3],q[44];
-cx q[20],q[43];
-rz(3.9926163494543623) q[43];
-cx q[20],q[43];
-rx(2.916853680830299) q[20];
-rx(2.916853680830299) q[43];
-rz(3.9926163494543623) q[44];
-cx q[3],q[44];
-cx q[3],q[49];
-cx q[12],q[44];
-rz(3.9926163494543623) q[44];
-cx q[12],q[44];
-rx(2.916853680830299) q[44];
-rz(3.9926163494543623) q[45];
-cx q[1],q[45];
-cx q[1],q[57];
-cx q[16],q[45];
-rz(3.9926163494543623) q[45];
-cx q[16],q[45];
-cx q[16],q[59];
-rz(3.9926163494543623) q[46];
-cx q[5],q[46];
-rx(2.916853680830299) q[5];
-cx q[38],q[46];
-rz(3.9926163494543623) q[46];
-cx q[38],q[46];
-rx(2.916853680830299) q[38];
-rx(2.916853680830299) q[46];
-rz(3.9926163494543623) q[47];
-cx q[4],q[47];
-cx q[17],q[47];
-rz(3.9926163494543623) q[47];
-cx q[17],q[47];
-cx q[17],q[53];
-rx(2.916853680830299) q[47];
-rz(3.9926163494543623) q[48];
-cx q[30],q[48];
-rx(2.916853680830299) q[30];
-rx(2.916853680830299) q[48];
-rz(3.9926163494543623) q[49];
-cx q[3],q[49];
-cx q[3],q[50];
-cx q[4],q[49];
-rz(3.9926163494543623) q[49];
-cx q[4],q[49];
-cx q[4],q[61];
-rx(2.916853680830299) q[49];
-rz(3.9926163494543623) q[50];
-cx q[3],q[50];
-cx q[3],q[52];
-cx q[12],q[50];
-rz(3.9926163494543623) q[50];
-cx q[12],q[50];
-rx(2.916853680830299) q[50];
-rz(3.9926163494543623) q[51];
-cx q[28],q[51];
-rx(2.916853680830299) q[51];
-rz(3.9926163494543623) q[52];
-cx q[3],q[52];
-cx q[10],q[52];
-rz(3.9926163494543623) q[52];
-cx q[10],q[52];
-rx(2.916853680830299) q[10];
-rx(2.916853680830299) q[52];
-rz(3.9926163494543623) q[53];
-cx q[17],q[53];
-cx q[17],q[62];
-cx q[21],q[53];
-rz(3.9926163494543623) q[53];
-cx q[21],q[53];
-rx(2.916853680830299) q[21];
-rx(2.916853680830299) q[53];
-rz(3.9926163494543623) q[54];
-cx q[24],q[54];
-cx q[24],q[58];
-cx q[28],q[54];
-rz(3.9926163494543623) q[54];
-cx q[28],q[54];
-rx(2.916853680830299) q[54];
-rz(3.9926163494543623) q[55];
-cx q[9],q[55];
-rx(2.916853680830299) q[9];
-cx q[15],q[55];
-rz(3.9926163494543623) q[55];
-cx q[15],q[55];
-rx(2.916853680830299) q[15];
-rx(2.916853680830299) q[55];
-rz(3.9926163494543623) q[56];
-cx q[13],q[56];
-rx(2.916853680830299) q[13];
-cx q[45],q[56];
-rz(3.9926163494543623) q[56];
-cx q[45],q[56];
-rx(2.916853680830299) q[45];
-rx(2.916853680830299) q[56];
-rz(3.9926163494543623) q[57];
-cx q[1],q[57];
-cx q[1],q[60];
-cx q[3],q[57];
-rz(3.9926163494543623) q[57];
-cx q[3],q[57];
-rx(2.916853680830299) q[3];
-rx(2.916853680830299) q[57];
-rz(3.9926163494543623) q[58];
-cx q[24],q[58];
-rx(2.916853680830299) q[24];
-cx q[28],q[58];
-rz(3.9926163494543623) q[58];
-cx q[28],q[58];
-rx(2.916853680830299) q[28];
-rx(2.916853680830299) q[58];
-rz(3.9926163494543623) q[59];
-cx q[16],q[59];
-rx(2.916853680830299) q[16];
-cx q[32],q[59];
-rz(3.9926163494543623) q[59];
-cx q[32],q[59];
-rx(2.916853680830299) q[32];
-rx(2.916853680830299) q[59];
-rz(3.9926163494543623) q[60];
-cx q[1],q[60];
-rx(2.916853680830299) q[1];
-cx q[0],q[1];
-rz(4.6142398973758185) q[1];
-cx q[0],q[1];
-cx q[0],q[2];
-rz(4.6142398973758185) q[2];
-cx q[0],q[2];
-cx q[0],q[3];
-rx(9.490953906308016) q[2];
-rz(4.6142398973758185) q[3];
-cx q[0],q[3];
-cx q[0],q[15];
-cx q[1],q[3];
-rz(4.6142398973758185) q[3];
-cx q[1],q[3];
-cx q[7],q[60];
-rz(4.6142398973758185) q[15];
-cx q[0],q[15];
-cx q[0],q[16];
-rz(4.6142398973758185) q[16];
-cx q[0],q[16];
-cx q[0],q[20];
-rz(4.6142398973758185) q[20];
-cx q[0],q[20];
-cx q[0],q[32];
-rz(4.6142398973758185) q[32];
-cx q[0],q[32];
-cx q[0],q[42];
-rz(4.6142398973758185) q[42];
-cx q[0],q[42];
-cx q[0],q[48];
-rz(4.6142398973758185) q[48];
-cx q[0],q[48];
-cx q[0],q[51];
-rz(4.6142398973758185) q[51];
-cx q[0],q[51];
-rz(3.9926163494543623) q[60];
-cx q[7],q[60];
-rx(2.916853680830299) q[60];
-rz(3.9926163494543623) q[61];
-cx q[4],q[61];
-rx(2.916853680830299) q[4];
-cx q[1],q[4];
-rz(4.6142398973758185) q[4];
-cx q[1],q[4];
-cx q[1],q[5];
-cx q[3],q[4];
-rz(4.6142398973758185) q[4];
-cx q[3],q[4];
-cx q[4],q[6];
-rz(4.6142398973758185) q[5];
-cx q[1],q[5];
-cx q[1],q[9];
-cx q[3],q[5];
-rz(4.6142398973758185) q[5];
-cx q[3],q[5];
-rz(4.6142398973758185) q[6];
-cx q[4],q[6];
-cx q[5],q[6];
-rz(4.6142398973758185) q[6];
-cx q[5],q[6];
-cx q[7],q[61];
-rz(4.6142398973758185) q[9];
-cx q[1],q[9];
-rz(3.9926163494543623) q[61];
-cx q[7],q[61];
-rx(2.916853680830299) q[7];
-cx q[3],q[7];
-rz(4.6142398973758185) q[7];
-cx q[3],q[7];
-cx q[3],q[8];
-cx q[4],q[7];
-rz(4.6142398973758185) q[7];
-cx q[4],q[7];
-cx q[4],q[10];
-rz(4.6142398973758185) q[8];
-cx q[3],q[8];
-cx q[3],q[9];
-cx q[5],q[8];
-rz(4.6142398973758185) q[8];
-cx q[5],q[8];
-cx q[5],q[11];
-rx(9.490953906308016) q[8];
-rz(4.6142398973758185) q[9];
-cx q[3],q[9];
-rz(4.6142398973758185) q[10];
-cx q[4],q[10];
-cx q[4],q[13];
-cx q[6],q[10];
-rz(4.6142398973758185) q[10];
-cx q[6],q[10];
-cx q[10],q[37];
-rz(4.6142398973758185) q[11];
-cx q[5],q[11];
-cx q[6],q[11];
-rz(4.6142398973758185) q[11];
-cx q[6],q[11];
-rx(9.490953906308016) q[11];
-rz(4.6142398973758185) q[13];
-cx q[4],q[13];
-rz(4.6142398973758185) q[37];
-cx q[10],q[37];
-cx q[10],q[41];
-rz(4.6142398973758185) q[41];
-cx q[10],q[41];
-rx(2.916853680830299) q[61];
-rz(3.9926163494543623) q[62];
-cx q[17],q[62];
-rx(2.916853680830299) q[62];
-cx q[0],q[62];
-rz(4.6142398973758185) q[62];
-cx q[0],q[62];
-rx(9.490953906308016) q[0];
-rx(4.454668582348128) q[63];
-cx q[12],q[63];
-rz(3.9926163494543623) q[63];
-cx q[12],q[63];
-rx(2.916853680830299) q[12];
-cx q[3],q[12];
-rz(4.6142398973758185) q[12];
-cx q[3],q[12];
-cx q[3],q[14];
-cx q[5],q[12];
-rz(4.6142398973758185) q[12];
-cx q[5],q[12];
-cx q[5],q[13];
-rz(4.6142398973758185) q[13];
-cx q[5],q[13];
-rz(4.6142398973758185) q[14];
-cx q[3],q[14];
-cx q[3],q[15];
-cx q[4],q[14];
-rz(4.6142398973758185) q[14];
-cx q[4],q[14];
-rx(9.490953906308016) q[14];
-rz(4.6142398973758185) q[15];
-cx q[3],q[15];
-cx q[3],q[16];
-cx q[15],q[20];
-rz(4.6142398973758185) q[16];
-cx q[3],q[16];
-cx q[17],q[63];
-rz(4.6142398973758185) q[20];
-cx q[15],q[20];
-rz(3.9926163494543623) q[63];
-cx q[17],q[63];
-rx(2.916853680830299) q[17];
-cx q[1],q[17];
-rz(4.6142398973758185) q[17];
-cx q[1],q[17];
-cx q[1],q[28];
-cx q[3],q[17];
-rz(4.6142398973758185) q[17];
-cx q[3],q[17];
-cx q[3],q[18];
-rz(4.6142398973758185) q[18];
-cx q[3],q[18];
-cx q[3],q[19];
-cx q[4],q[18];
-rz(4.6142398973758185) q[18];
-cx q[4],q[18];
-cx q[4],q[21];
-rz(4.6142398973758185) q[19];
-cx q[3],q[19];
-cx q[3],q[22];
-cx q[7],q[19];
-rz(4.6142398973758185) q[19];
-cx q[7],q[19];
-cx q[19],q[38];
-rz(4.6142398973758185) q[21];
-cx q[4],q[21];
-cx q[4],q[27];
-cx q[15],q[21];
-rz(4.6142398973758185) q[21];
-cx q[15],q[21];
-cx q[15],q[36];
-rz(4.6142398973758185) q[22];
-cx q[3],q[22];
-cx q[3],q[23];
-cx q[9],q[22];
-rz(4.6142398973758185) q[22];
-cx q[9],q[22];
-cx q[9],q[55];
-rx(9.490953906308016) q[22];
-rz(4.6142398973758185) q[23];
-cx q[3],q[23];
-cx q[3],q[24];
-cx q[17],q[23];
-rz(4.6142398973758185) q[23];
-cx q[17],q[23];
-rz(4.6142398973758185) q[24];
-cx q[3],q[24];
-cx q[3],q[25];
-cx q[5],q[24];
-rz(4.6142398973758185) q[24];
-cx q[5],q[24];
-cx q[5],q[33];
-cx q[24],q[54];
-rz(4.6142398973758185) q[25];
-cx q[3],q[25];
-cx q[3],q[26];
-cx q[12],q[25];
-rz(4.6142398973758185) q[25];
-cx q[12],q[25];
-cx q[12],q[31];
-rx(9.490953906308016) q[25];
-rz(4.6142398973758185) q[26];
-cx q[3],q[26];
-cx q[21],q[26];
-rz(4.6142398973758185) q[26];
-cx q[21],q[26];
-cx q[21],q[32];
-rz(4.6142398973758185) q[27];
-cx q[4],q[27];
-cx q[4],q[47];
-cx q[6],q[27];
-rz(4.6142398973758185) q[27];
-cx q[6],q[27];
-rx(9.490953906308016) q[6];
-cx q[27],q[41];
-rz(4.6142398973758185) q[28];
-cx q[1],q[28];
-cx q[1],q[29];
-cx q[3],q[28];
-rz(4.6142398973758185) q[28];
-cx q[3],q[28];
-cx q[28],q[51];
-rz(4.6142398973758185) q[29];
-cx q[1],q[29];
-cx q[1],q[45];
-cx q[3],q[29];
-rz(4.6142398973758185) q[29];
-cx q[3],q[29];
-cx q[3],q[30];
-rx(9.490953906308016) q[29];
-rz(4.6142398973758185) q[30];
-cx q[3],q[30];
-cx q[3],q[34];
-cx q[18],q[30];
-rz(4.6142398973758185) q[30];
-cx q[18],q[30];
-rx(9.490953906308016) q[18];
-rz(4.6142398973758185) q[31];
-cx q[12],q[31];
-cx q[26],q[31];
-rz(4.6142398973758185) q[31];
-cx q[26],q[31];
-rx(9.490953906308016) q[26];
-rx(9.490953906308016) q[31];
-rz(4.6142398973758185) q[32];
-cx q[21],q[32];
-rz(4.6142398973758185) q[33];
-cx q[5],q[33];
-cx q[5],q[46];
-cx q[30],q[33];
-rz(4.6142398973758185) q[33];
-cx q[30],q[33];
-cx q[30],q[48];
-rx(9.490953906308016) q[33];
-rz(4.6142398973758185) q[34];
-cx q[3],q[34];
-cx q[3],q[35];
-cx q[12],q[34];
-rz(4.6142398973758185) q[34];
-cx q[12],q[34];
-cx q[34],q[37];
-rz(4.6142398973758185) q[35];
-cx q[3],q[35];
-cx q[3],q[39];
-cx q[32],q[35];
-rz(4.6142398973758185) q[35];
-cx q[32],q[35];
-rx(9.490953906308016) q[35];
-rz(4.6142398973758185) q[36];
-cx q[15],q[36];
-cx q[20],q[36];
-rz(4.6142398973758185) q[36];
-cx q[20],q[36];
-rx(9.490953906308016) q[36];
-rz(4.6142398973758185) q[37];
-cx q[34],q[37];
-rx(9.490953906308016) q[34];
-rx(9.490953906308016) q[37];
-rz(4.6142398973758185) q[38];
-cx q[19],q[38];
-rx(9.490953906308016) q[19];
-cx q[21],q[38];
-rz(4.6142398973758185) q[38];
-cx q[21],q[38];
-rz(4.6142398973758185) q[39];
-cx q[3],q[39];
-cx q[3],q[40];
-cx q[13],q[39];
-rz(4.6142398973758185) q[39];
-cx q[13],q[39];
-cx q[13],q[56];
-rx(9.490953906308016) q[39];
-rz(4.6142398973758185) q[40];
-cx q[3],q[40];
-cx q[3],q[42];
-cx q[23],q[40];
-rz(4.6142398973758185) q[40];
-cx q[23],q[40];
-rx(9.490953906308016) q[23];
-rx(9.490953906308016) q[40];
-rz(4.6142398973758185) q[41];
-cx q[27],q[41];
-rx(9.490953906308016) q[27];
-rx(9.490953906308016) q[41];
-rz(4.6142398973758185) q[42];
-cx q[3],q[42];
-cx q[3],q[43];
-rx(9.490953906308016) q[42];
-rz(4.6142398973758185) q[43];
-cx q[3],q[43];
-cx q[3],q[44];
-cx q[20],q[43];
-rz(4.6142398973758185) q[43];
-cx q[20],q[43];
-rx(9.490953906308016) q[20];
-rx(9.490953906308016) q[43];
-rz(4.6142398973758185) q[44];
-cx q[3],q[44];
-cx q[3],q[49];
-cx q[12],q[44];
-rz(4.6142398973758185) q[44];
-cx q[12],q[44];
-rx(9.490953906308016) q[44];
-rz(4.6142398973758185) q[45];
-cx q[1],q[45];
-cx q[1],q[57];
-cx q[16],q[45];
-rz(4.6142398973758185) q[45];
-cx q[16],q[45];
-cx q[16],q[59];
-rz(4.6142398973758185) q[46];
-cx q[5],q[46];
-rx(9.490953906308016) q[5];
-cx q[38],q[46];
-rz(4.6142398973758185) q[46];
-cx q[38],q[46];
-rx(9.490953906308016) q[38];
-rx(9.490953906308016) q[46];
-rz(4.6142398973758185) q[47];
-cx q[4],q[47];
-cx q[17],q[47];
-rz(4.6142398973758185) q[47];
-cx q[17],q[47];
-cx q[17],q[53];
-rx(9.490953906308016) q[47];
-rz(4.6142398973758185) q[48];
-cx q[30],q[48];
-rx(9.490953906308016) q[30];
-rx(9.490953906308016) q[48];
-rz(4.6142398973758185) q[49];
-cx q[3],q[49];
-cx q[3],q[50];
-cx q[4],q[49];
-rz(4.6142398973758185) q[49];
-cx q[4],q[49];
-cx q[4],q[61];
-rx(9.490953906308016) q[49];
-rz(4.6142398973758185) q[50];
-cx q[3],q[50];
-cx q[3],q[52];
-cx q[12],q[50];
-rz(4.6142398973758185) q[50];
-cx q[12],q[50];
-rx(9.490953906308016) q[50];
-rz(4.6142398973758185) q[51];
-cx q[28],q[51];
-rx(9.490953906308016) q[51];
-rz(4.6142398973758185) q[52];
-cx q[3],q[52];
-cx q[10],q[52];
-rz(4.6142398973758185) q[52];
-cx q[10],q[52];
-rx(9.490953906308016) q[10];
-rx(9.490953906308016) q[52];
-rz(4.6142398973758185) q[53];
-cx q[17],q[53];
-cx q[17],q[62];
-cx q[21],q[53];
-rz(4.6142398973758185) q[53];
-cx q[21],q[53];
-rx(9.490953906308016) q[21];
-rx(9.490953906308016) q[53];
-rz(4.6142398973758185) q[54];
-cx q[24],q[54];
-cx q[24],q[58];
-cx q[28],q[54];
-rz(4.6142398973758185) q[54];
-cx q[28],q[54];
-rx(9.490953906308016) q[54];
-rz(4.6142398973758185) q[55];
-cx q[9],q[55];
-rx(9.490953906308016) q[9];
-cx q[15],q[55];
-rz(4.6142398973758185) q[55];
-cx q[15],q[55];
-rx(9.490953906308016) q[15];
-rx(9.490953906308016) q[55];
-rz(4.6142398973758185) q[56];
-cx q[13],q[56];
-rx(9.490953906308016) q[13];
-cx q[45],q[56];
-rz(4.6142398973758185) q[56];
-cx q[45],q[56];
-rx(9.490953906308016) q[45];
-rx(9.490953906308016) q[56];
-rz(4.6142398973758185) q[57];
-cx q[1],q[57];
-cx q[1],q[60];
-cx q[3],q[57];
-rz(4.6142398973758185) q[57];
-cx q[3],q[57];
-rx(9.490953906308016) q[3];
-rx(9.490953906308016) q[57];
-rz(4.6142398973758185) q[58];
-cx q[24],q[58];
-rx(9.490953906308016) q[24];
-cx q[28],q[58];
-rz(4.6142398973758185) q[58];
-cx q[28],q[58];
-rx(9.490953906308016) q[28];
-rx(9.490953906308016) q[58];
-rz(4.6142398973758185) q[59];
-cx q[16],q[59];
-rx(9.490953906308016) q[16];
-cx q[32],q[59];
-rz(4.6142398973758185) q[59];
-cx q[32],q[59];
-rx(9.490953906308016) q[32];
-rx(9.490953906308016) q[59];
-rz(4.6142398973758185) q[60];
-cx q[1],q[60];
-rx(9.490953906308016) q[1];
-cx q[7],q[60];
-rz(4.6142398973758185) q[60];
-cx q[7],q[60];
-rx(9.490953906308016) q[60];
-rz(4.6142398973758185) q[61];
-cx q[4],q[61];
-rx(9.490953906308016) q[4];
-cx q[7],q[61];
-rz(4.6142398973758185) q[61];
-cx q[7],q[61];
-rx(9.490953906308016) q[7];
-rx(9.490953906308016) q[61];
-rz(4.6142398973758185) q[62];
-cx q[17],q[62];
-rx(9.490953906308016) q[62];
-rx(2.916853680830299) q[63];
-cx q[12],q[63];
-rz(4.6142398973758185) q[63];
-cx q[12],q[63];
-rx(9.490953906308016) q[12];
-cx q[17],q[63];
-rz(4.6142398973758185) q[63];
-cx q[17],q[63];
-rx(9.490953906308016) q[17];
-rx(9.490953906308016) q[63];
\ No newline at end of file
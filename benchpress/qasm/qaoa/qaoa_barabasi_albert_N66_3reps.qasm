@@ -1,1485 +0,0 @@
-OPENQASM 2.0;
-include "qelib1.inc";
-qreg q[66];
-ry(pi/2) q[0];
-rx(pi) q[0];
-ry(pi/2) q[1];
-rx(pi) q[1];
-cx q[0],q[1];
-rz(5.40641348736204) q[1];
-cx q[0],q[1];
-ry(pi/2) q[2];
-rx(pi) q[2];
-cx q[0],q[2];
-rz(5.40641348736204) q[2];
-cx q[0],q[2];
-rx(6.014208949587977) q[2];
-ry(pi/2) q[3];
-rx(pi) q[3];
-cx q[0],q[3];
-rz(5.40641348736204) q[3];
-cx q[0],q[3];
-cx q[1],q[3];
-rz(5.40641348736204) q[3];
-cx q[1],q[3];
-ry(pi/2) q[4];
-rx(pi) q[4];
-cx q[1],q[4];
-rz(5.40641348736204) q[4];
-cx q[1],q[4];
-cx q[3],q[4];
-rz(5.40641348736204) q[4];
-cx q[3],q[4];
-ry(pi/2) q[5];
-rx(pi) q[5];
-cx q[1],q[5];
-rz(5.40641348736204) q[5];
-cx q[1],q[5];
-cx q[3],q[5];
-rz(5.40641348736204) q[5];
-cx q[3],q[5];
-ry(pi/2) q[6];
-rx(pi) q[6];
-cx q[4],q[6];
-rz(5.40641348736204) q[6];
-cx q[4],q[6];
-cx q[5],q[6];
-rz(5.40641348736204) q[6];
-cx q[5],q[6];
-ry(pi/2) q[7];
-rx(pi) q[7];
-cx q[3],q[7];
-rz(5.40641348736204) q[7];
-cx q[3],q[7];
-cx q[4],q[7];
-rz(5.40641348736204) q[7];
-cx q[4],q[7];
-ry(pi/2) q[8];
-rx(pi) q[8];
-cx q[3],q[8];
-rz(5.40641348736204) q[8];
-cx q[3],q[8];
-cx q[5],q[8];
-rz(5.40641348736204) q[8];
-cx q[5],q[8];
-rx(6.014208949587977) q[8];
-ry(pi/2) q[9];
-rx(pi) q[9];
-cx q[1],q[9];
-rz(5.40641348736204) q[9];
-cx q[1],q[9];
-cx q[3],q[9];
-rz(5.40641348736204) q[9];
-cx q[3],q[9];
-ry(pi/2) q[10];
-rx(pi) q[10];
-cx q[4],q[10];
-rz(5.40641348736204) q[10];
-cx q[4],q[10];
-cx q[6],q[10];
-rz(5.40641348736204) q[10];
-cx q[6],q[10];
-ry(pi/2) q[11];
-rx(pi) q[11];
-cx q[5],q[11];
-rz(5.40641348736204) q[11];
-cx q[5],q[11];
-cx q[6],q[11];
-rz(5.40641348736204) q[11];
-cx q[6],q[11];
-rx(6.014208949587977) q[11];
-ry(pi/2) q[12];
-rx(pi) q[12];
-cx q[3],q[12];
-rz(5.40641348736204) q[12];
-cx q[3],q[12];
-cx q[5],q[12];
-rz(5.40641348736204) q[12];
-cx q[5],q[12];
-ry(pi/2) q[13];
-rx(pi) q[13];
-cx q[4],q[13];
-rz(5.40641348736204) q[13];
-cx q[4],q[13];
-cx q[5],q[13];
-rz(5.40641348736204) q[13];
-cx q[5],q[13];
-ry(pi/2) q[14];
-rx(pi) q[14];
-cx q[3],q[14];
-rz(5.40641348736204) q[14];
-cx q[3],q[14];
-cx q[4],q[14];
-rz(5.40641348736204) q[14];
-cx q[4],q[14];
-rx(6.014208949587977) q[14];
-ry(pi/2) q[15];
-rx(pi) q[15];
-cx q[0],q[15];
-rz(5.40641348736204) q[15];
-cx q[0],q[15];
-cx q[3],q[15];
-rz(5.40641348736204) q[15];
-cx q[3],q[15];
-ry(pi/2) q[16];
-rx(pi) q[16];
-cx q[0],q[16];
-rz(5.40641348736204) q[16];
-cx q[0],q[16];
-cx q[3],q[16];
-rz(5.40641348736204) q[16];
-cx q[3],q[16];
-ry(pi/2) q[17];
-rx(pi) q[17];
-cx q[1],q[17];
-rz(5.40641348736204) q[17];
-cx q[1],q[17];
-cx q[3],q[17];
-rz(5.40641348736204) q[17];
-cx q[3],q[17];
-ry(pi/2) q[18];
-rx(pi) q[18];
-cx q[3],q[18];
-rz(5.40641348736204) q[18];
-cx q[3],q[18];
-cx q[4],q[18];
-rz(5.40641348736204) q[18];
-cx q[4],q[18];
-ry(pi/2) q[19];
-rx(pi) q[19];
-cx q[3],q[19];
-rz(5.40641348736204) q[19];
-cx q[3],q[19];
-cx q[7],q[19];
-rz(5.40641348736204) q[19];
-cx q[7],q[19];
-ry(pi/2) q[20];
-rx(pi) q[20];
-cx q[0],q[20];
-rz(5.40641348736204) q[20];
-cx q[0],q[20];
-cx q[15],q[20];
-rz(5.40641348736204) q[20];
-cx q[15],q[20];
-ry(pi/2) q[21];
-rx(pi) q[21];
-cx q[4],q[21];
-rz(5.40641348736204) q[21];
-cx q[4],q[21];
-cx q[15],q[21];
-rz(5.40641348736204) q[21];
-cx q[15],q[21];
-ry(pi/2) q[22];
-rx(pi) q[22];
-cx q[3],q[22];
-rz(5.40641348736204) q[22];
-cx q[3],q[22];
-cx q[9],q[22];
-rz(5.40641348736204) q[22];
-cx q[9],q[22];
-rx(6.014208949587977) q[22];
-ry(pi/2) q[23];
-rx(pi) q[23];
-cx q[3],q[23];
-rz(5.40641348736204) q[23];
-cx q[3],q[23];
-cx q[17],q[23];
-rz(5.40641348736204) q[23];
-cx q[17],q[23];
-ry(pi/2) q[24];
-rx(pi) q[24];
-cx q[3],q[24];
-rz(5.40641348736204) q[24];
-cx q[3],q[24];
-cx q[5],q[24];
-rz(5.40641348736204) q[24];
-cx q[5],q[24];
-ry(pi/2) q[25];
-rx(pi) q[25];
-cx q[3],q[25];
-rz(5.40641348736204) q[25];
-cx q[3],q[25];
-cx q[12],q[25];
-rz(5.40641348736204) q[25];
-cx q[12],q[25];
-rx(6.014208949587977) q[25];
-ry(pi/2) q[26];
-rx(pi) q[26];
-cx q[3],q[26];
-rz(5.40641348736204) q[26];
-cx q[3],q[26];
-cx q[21],q[26];
-rz(5.40641348736204) q[26];
-cx q[21],q[26];
-ry(pi/2) q[27];
-rx(pi) q[27];
-cx q[4],q[27];
-rz(5.40641348736204) q[27];
-cx q[4],q[27];
-cx q[6],q[27];
-rz(5.40641348736204) q[27];
-cx q[6],q[27];
-rx(6.014208949587977) q[6];
-ry(pi/2) q[28];
-rx(pi) q[28];
-cx q[1],q[28];
-rz(5.40641348736204) q[28];
-cx q[1],q[28];
-cx q[3],q[28];
-rz(5.40641348736204) q[28];
-cx q[3],q[28];
-ry(pi/2) q[29];
-rx(pi) q[29];
-cx q[1],q[29];
-rz(5.40641348736204) q[29];
-cx q[1],q[29];
-cx q[3],q[29];
-rz(5.40641348736204) q[29];
-cx q[3],q[29];
-rx(6.014208949587977) q[29];
-ry(pi/2) q[30];
-rx(pi) q[30];
-cx q[3],q[30];
-rz(5.40641348736204) q[30];
-cx q[3],q[30];
-cx q[18],q[30];
-rz(5.40641348736204) q[30];
-cx q[18],q[30];
-rx(6.014208949587977) q[18];
-ry(pi/2) q[31];
-rx(pi) q[31];
-cx q[12],q[31];
-rz(5.40641348736204) q[31];
-cx q[12],q[31];
-cx q[26],q[31];
-rz(5.40641348736204) q[31];
-cx q[26],q[31];
-rx(6.014208949587977) q[26];
-rx(6.014208949587977) q[31];
-ry(pi/2) q[32];
-rx(pi) q[32];
-cx q[0],q[32];
-rz(5.40641348736204) q[32];
-cx q[0],q[32];
-cx q[21],q[32];
-rz(5.40641348736204) q[32];
-cx q[21],q[32];
-ry(pi/2) q[33];
-rx(pi) q[33];
-cx q[5],q[33];
-rz(5.40641348736204) q[33];
-cx q[5],q[33];
-cx q[30],q[33];
-rz(5.40641348736204) q[33];
-cx q[30],q[33];
-rx(6.014208949587977) q[33];
-ry(pi/2) q[34];
-rx(pi) q[34];
-cx q[3],q[34];
-rz(5.40641348736204) q[34];
-cx q[3],q[34];
-cx q[12],q[34];
-rz(5.40641348736204) q[34];
-cx q[12],q[34];
-ry(pi/2) q[35];
-rx(pi) q[35];
-cx q[3],q[35];
-rz(5.40641348736204) q[35];
-cx q[3],q[35];
-cx q[32],q[35];
-rz(5.40641348736204) q[35];
-cx q[32],q[35];
-rx(6.014208949587977) q[35];
-ry(pi/2) q[36];
-rx(pi) q[36];
-cx q[15],q[36];
-rz(5.40641348736204) q[36];
-cx q[15],q[36];
-cx q[20],q[36];
-rz(5.40641348736204) q[36];
-cx q[20],q[36];
-rx(6.014208949587977) q[36];
-ry(pi/2) q[37];
-rx(pi) q[37];
-cx q[10],q[37];
-rz(5.40641348736204) q[37];
-cx q[10],q[37];
-cx q[34],q[37];
-rz(5.40641348736204) q[37];
-cx q[34],q[37];
-rx(6.014208949587977) q[34];
-rx(6.014208949587977) q[37];
-ry(pi/2) q[38];
-rx(pi) q[38];
-cx q[19],q[38];
-rz(5.40641348736204) q[38];
-cx q[19],q[38];
-rx(6.014208949587977) q[19];
-cx q[21],q[38];
-rz(5.40641348736204) q[38];
-cx q[21],q[38];
-ry(pi/2) q[39];
-rx(pi) q[39];
-cx q[3],q[39];
-rz(5.40641348736204) q[39];
-cx q[3],q[39];
-cx q[13],q[39];
-rz(5.40641348736204) q[39];
-cx q[13],q[39];
-rx(6.014208949587977) q[39];
-ry(pi/2) q[40];
-rx(pi) q[40];
-cx q[3],q[40];
-rz(5.40641348736204) q[40];
-cx q[3],q[40];
-cx q[23],q[40];
-rz(5.40641348736204) q[40];
-cx q[23],q[40];
-rx(6.014208949587977) q[40];
-ry(pi/2) q[41];
-rx(pi) q[41];
-cx q[10],q[41];
-rz(5.40641348736204) q[41];
-cx q[10],q[41];
-cx q[27],q[41];
-rz(5.40641348736204) q[41];
-cx q[27],q[41];
-rx(6.014208949587977) q[27];
-rx(6.014208949587977) q[41];
-ry(pi/2) q[42];
-rx(pi) q[42];
-cx q[0],q[42];
-rz(5.40641348736204) q[42];
-cx q[0],q[42];
-cx q[3],q[42];
-rz(5.40641348736204) q[42];
-cx q[3],q[42];
-rx(6.014208949587977) q[42];
-ry(pi/2) q[43];
-rx(pi) q[43];
-cx q[3],q[43];
-rz(5.40641348736204) q[43];
-cx q[3],q[43];
-cx q[20],q[43];
-rz(5.40641348736204) q[43];
-cx q[20],q[43];
-rx(6.014208949587977) q[20];
-rx(6.014208949587977) q[43];
-ry(pi/2) q[44];
-rx(pi) q[44];
-cx q[3],q[44];
-rz(5.40641348736204) q[44];
-cx q[3],q[44];
-cx q[12],q[44];
-rz(5.40641348736204) q[44];
-cx q[12],q[44];
-rx(6.014208949587977) q[44];
-ry(pi/2) q[45];
-rx(pi) q[45];
-cx q[1],q[45];
-rz(5.40641348736204) q[45];
-cx q[1],q[45];
-cx q[16],q[45];
-rz(5.40641348736204) q[45];
-cx q[16],q[45];
-ry(pi/2) q[46];
-rx(pi) q[46];
-cx q[5],q[46];
-rz(5.40641348736204) q[46];
-cx q[5],q[46];
-cx q[38],q[46];
-rz(5.40641348736204) q[46];
-cx q[38],q[46];
-rx(6.014208949587977) q[38];
-rx(6.014208949587977) q[46];
-ry(pi/2) q[47];
-rx(pi) q[47];
-cx q[4],q[47];
-rz(5.40641348736204) q[47];
-cx q[4],q[47];
-cx q[17],q[47];
-rz(5.40641348736204) q[47];
-cx q[17],q[47];
-rx(6.014208949587977) q[47];
-ry(pi/2) q[48];
-rx(pi) q[48];
-cx q[0],q[48];
-rz(5.40641348736204) q[48];
-cx q[0],q[48];
-cx q[30],q[48];
-rz(5.40641348736204) q[48];
-cx q[30],q[48];
-rx(6.014208949587977) q[30];
-rx(6.014208949587977) q[48];
-ry(pi/2) q[49];
-rx(pi) q[49];
-cx q[3],q[49];
-rz(5.40641348736204) q[49];
-cx q[3],q[49];
-cx q[4],q[49];
-rz(5.40641348736204) q[49];
-cx q[4],q[49];
-rx(6.014208949587977) q[49];
-ry(pi/2) q[50];
-rx(pi) q[50];
-cx q[3],q[50];
-rz(5.40641348736204) q[50];
-cx q[3],q[50];
-cx q[12],q[50];
-rz(5.40641348736204) q[50];
-cx q[12],q[50];
-rx(6.014208949587977) q[50];
-ry(pi/2) q[51];
-rx(pi) q[51];
-cx q[0],q[51];
-rz(5.40641348736204) q[51];
-cx q[0],q[51];
-cx q[28],q[51];
-rz(5.40641348736204) q[51];
-cx q[28],q[51];
-rx(6.014208949587977) q[51];
-ry(pi/2) q[52];
-rx(pi) q[52];
-cx q[3],q[52];
-rz(5.40641348736204) q[52];
-cx q[3],q[52];
-cx q[10],q[52];
-rz(5.40641348736204) q[52];
-cx q[10],q[52];
-rx(6.014208949587977) q[52];
-ry(pi/2) q[53];
-rx(pi) q[53];
-cx q[17],q[53];
-rz(5.40641348736204) q[53];
-cx q[17],q[53];
-cx q[21],q[53];
-rz(5.40641348736204) q[53];
-cx q[21],q[53];
-rx(6.014208949587977) q[21];
-rx(6.014208949587977) q[53];
-ry(pi/2) q[54];
-rx(pi) q[54];
-cx q[24],q[54];
-rz(5.40641348736204) q[54];
-cx q[24],q[54];
-cx q[28],q[54];
-rz(5.40641348736204) q[54];
-cx q[28],q[54];
-rx(6.014208949587977) q[54];
-ry(pi/2) q[55];
-rx(pi) q[55];
-cx q[9],q[55];
-rz(5.40641348736204) q[55];
-cx q[9],q[55];
-rx(6.014208949587977) q[9];
-cx q[15],q[55];
-rz(5.40641348736204) q[55];
-cx q[15],q[55];
-rx(6.014208949587977) q[15];
-rx(6.014208949587977) q[55];
-ry(pi/2) q[56];
-rx(pi) q[56];
-cx q[13],q[56];
-rz(5.40641348736204) q[56];
-cx q[13],q[56];
-rx(6.014208949587977) q[13];
-cx q[45],q[56];
-rz(5.40641348736204) q[56];
-cx q[45],q[56];
-rx(6.014208949587977) q[45];
-rx(6.014208949587977) q[56];
-ry(pi/2) q[57];
-rx(pi) q[57];
-cx q[1],q[57];
-rz(5.40641348736204) q[57];
-cx q[1],q[57];
-cx q[3],q[57];
-rz(5.40641348736204) q[57];
-cx q[3],q[57];
-rx(6.014208949587977) q[3];
-rx(6.014208949587977) q[57];
-ry(pi/2) q[58];
-rx(pi) q[58];
-cx q[24],q[58];
-rz(5.40641348736204) q[58];
-cx q[24],q[58];
-rx(6.014208949587977) q[24];
-cx q[28],q[58];
-rz(5.40641348736204) q[58];
-cx q[28],q[58];
-rx(6.014208949587977) q[28];
-rx(6.014208949587977) q[58];
-ry(pi/2) q[59];
-rx(pi) q[59];
-cx q[16],q[59];
-rz(5.40641348736204) q[59];
-cx q[16],q[59];
-rx(6.014208949587977) q[16];
-cx q[32],q[59];
-rz(5.40641348736204) q[59];
-cx q[32],q[59];
-rx(6.014208949587977) q[32];
-rx(6.014208949587977) q[59];
-ry(pi/2) q[60];
-rx(pi) q[60];
-cx q[1],q[60];
-rz(5.40641348736204) q[60];
-cx q[1],q[60];
-rx(6.014208949587977) q[1];
-cx q[7],q[60];
-rz(5.40641348736204) q[60];
-cx q[7],q[60];
-rx(6.014208949587977) q[60];
-ry(pi/2) q[61];
-rx(pi) q[61];
-cx q[4],q[61];
-rz(5.40641348736204) q[61];
-cx q[4],q[61];
-rx(6.014208949587977) q[4];
-cx q[7],q[61];
-rz(5.40641348736204) q[61];
-cx q[7],q[61];
-rx(6.014208949587977) q[7];
-rx(6.014208949587977) q[61];
-ry(pi/2) q[62];
-rx(pi) q[62];
-cx q[0],q[62];
-rz(5.40641348736204) q[62];
-cx q[0],q[62];
-cx q[17],q[62];
-rz(5.40641348736204) q[62];
-cx q[17],q[62];
-rx(6.014208949587977) q[62];
-ry(pi/2) q[63];
-rx(pi) q[63];
-cx q[12],q[63];
-rz(5.40641348736204) q[63];
-cx q[12],q[63];
-rx(6.014208949587977) q[12];
-cx q[17],q[63];
-rz(5.40641348736204) q[63];
-cx q[17],q[63];
-rx(6.014208949587977) q[17];
-rx(6.014208949587977) q[63];
-ry(pi/2) q[64];
-rx(pi) q[64];
-cx q[0],q[64];
-rz(5.40641348736204) q[64];
-cx q[0],q[64];
-rx(6.014208949587977) q[0];
-cx q[0],q[1];
-rz(1.9891316337404368) q[1];
-cx q[0],q[1];
-cx q[0],q[2];
-rz(1.9891316337404368) q[2];
-cx q[0],q[2];
-cx q[0],q[3];
-rx(12.47063986790331) q[2];
-rz(1.9891316337404368) q[3];
-cx q[0],q[3];
-cx q[0],q[15];
-cx q[1],q[3];
-rz(1.9891316337404368) q[3];
-cx q[1],q[3];
-cx q[1],q[4];
-rz(1.9891316337404368) q[4];
-cx q[1],q[4];
-cx q[3],q[4];
-rz(1.9891316337404368) q[4];
-cx q[3],q[4];
-cx q[4],q[6];
-rz(1.9891316337404368) q[6];
-cx q[4],q[6];
-cx q[10],q[64];
-rz(1.9891316337404368) q[15];
-cx q[0],q[15];
-cx q[0],q[16];
-rz(1.9891316337404368) q[16];
-cx q[0],q[16];
-cx q[0],q[20];
-rz(1.9891316337404368) q[20];
-cx q[0],q[20];
-cx q[0],q[32];
-rz(1.9891316337404368) q[32];
-cx q[0],q[32];
-cx q[0],q[42];
-rz(1.9891316337404368) q[42];
-cx q[0],q[42];
-cx q[0],q[48];
-rz(1.9891316337404368) q[48];
-cx q[0],q[48];
-cx q[0],q[51];
-rz(1.9891316337404368) q[51];
-cx q[0],q[51];
-cx q[0],q[62];
-rz(1.9891316337404368) q[62];
-cx q[0],q[62];
-rz(5.40641348736204) q[64];
-cx q[10],q[64];
-rx(6.014208949587977) q[10];
-rx(6.014208949587977) q[64];
-cx q[0],q[64];
-rz(1.9891316337404368) q[64];
-cx q[0],q[64];
-rx(12.47063986790331) q[0];
-ry(pi/2) q[65];
-rx(pi) q[65];
-cx q[5],q[65];
-rz(5.40641348736204) q[65];
-cx q[5],q[65];
-rx(6.014208949587977) q[5];
-cx q[1],q[5];
-rz(1.9891316337404368) q[5];
-cx q[1],q[5];
-cx q[1],q[9];
-cx q[3],q[5];
-rz(1.9891316337404368) q[5];
-cx q[3],q[5];
-cx q[3],q[7];
-cx q[5],q[6];
-rz(1.9891316337404368) q[6];
-cx q[5],q[6];
-rz(1.9891316337404368) q[7];
-cx q[3],q[7];
-cx q[3],q[8];
-cx q[4],q[7];
-rz(1.9891316337404368) q[7];
-cx q[4],q[7];
-cx q[4],q[10];
-rz(1.9891316337404368) q[8];
-cx q[3],q[8];
-cx q[5],q[8];
-rz(1.9891316337404368) q[8];
-cx q[5],q[8];
-cx q[5],q[11];
-rx(12.47063986790331) q[8];
-rz(1.9891316337404368) q[9];
-cx q[1],q[9];
-cx q[1],q[17];
-cx q[3],q[9];
-rz(1.9891316337404368) q[9];
-cx q[3],q[9];
-cx q[3],q[12];
-rz(1.9891316337404368) q[10];
-cx q[4],q[10];
-cx q[4],q[13];
-cx q[6],q[10];
-rz(1.9891316337404368) q[10];
-cx q[6],q[10];
-cx q[10],q[37];
-rz(1.9891316337404368) q[11];
-cx q[5],q[11];
-cx q[6],q[11];
-rz(1.9891316337404368) q[11];
-cx q[6],q[11];
-rx(12.47063986790331) q[11];
-rz(1.9891316337404368) q[12];
-cx q[3],q[12];
-cx q[3],q[14];
-cx q[5],q[12];
-rz(1.9891316337404368) q[12];
-cx q[5],q[12];
-rz(1.9891316337404368) q[13];
-cx q[4],q[13];
-cx q[5],q[13];
-rz(1.9891316337404368) q[13];
-cx q[5],q[13];
-rz(1.9891316337404368) q[14];
-cx q[3],q[14];
-cx q[3],q[15];
-cx q[4],q[14];
-rz(1.9891316337404368) q[14];
-cx q[4],q[14];
-rx(12.47063986790331) q[14];
-rz(1.9891316337404368) q[15];
-cx q[3],q[15];
-cx q[3],q[16];
-cx q[15],q[20];
-rz(1.9891316337404368) q[16];
-cx q[3],q[16];
-rz(1.9891316337404368) q[17];
-cx q[1],q[17];
-cx q[1],q[28];
-cx q[3],q[17];
-rz(1.9891316337404368) q[17];
-cx q[3],q[17];
-cx q[3],q[18];
-rz(1.9891316337404368) q[18];
-cx q[3],q[18];
-cx q[3],q[19];
-cx q[4],q[18];
-rz(1.9891316337404368) q[18];
-cx q[4],q[18];
-cx q[4],q[21];
-rz(1.9891316337404368) q[19];
-cx q[3],q[19];
-cx q[3],q[22];
-cx q[7],q[19];
-rz(1.9891316337404368) q[19];
-cx q[7],q[19];
-cx q[19],q[38];
-rz(1.9891316337404368) q[20];
-cx q[15],q[20];
-rz(1.9891316337404368) q[21];
-cx q[4],q[21];
-cx q[4],q[27];
-cx q[15],q[21];
-rz(1.9891316337404368) q[21];
-cx q[15],q[21];
-cx q[15],q[36];
-rz(1.9891316337404368) q[22];
-cx q[3],q[22];
-cx q[9],q[22];
-rz(1.9891316337404368) q[22];
-cx q[9],q[22];
-cx q[9],q[55];
-rx(12.47063986790331) q[22];
-cx q[23],q[65];
-rz(1.9891316337404368) q[27];
-cx q[4],q[27];
-cx q[4],q[47];
-cx q[6],q[27];
-rz(1.9891316337404368) q[27];
-cx q[6],q[27];
-rx(12.47063986790331) q[6];
-rz(1.9891316337404368) q[28];
-cx q[1],q[28];
-cx q[1],q[29];
-rz(1.9891316337404368) q[29];
-cx q[1],q[29];
-cx q[1],q[45];
-rz(1.9891316337404368) q[36];
-cx q[15],q[36];
-cx q[20],q[36];
-rz(1.9891316337404368) q[36];
-cx q[20],q[36];
-rx(12.47063986790331) q[36];
-rz(1.9891316337404368) q[37];
-cx q[10],q[37];
-cx q[10],q[41];
-rz(1.9891316337404368) q[38];
-cx q[19],q[38];
-rx(12.47063986790331) q[19];
-rz(1.9891316337404368) q[41];
-cx q[10],q[41];
-cx q[27],q[41];
-rz(1.9891316337404368) q[41];
-cx q[27],q[41];
-rx(12.47063986790331) q[27];
-rx(12.47063986790331) q[41];
-rz(1.9891316337404368) q[45];
-cx q[1],q[45];
-cx q[1],q[57];
-cx q[16],q[45];
-rz(1.9891316337404368) q[45];
-cx q[16],q[45];
-cx q[16],q[59];
-rz(1.9891316337404368) q[47];
-cx q[4],q[47];
-rz(1.9891316337404368) q[55];
-cx q[9],q[55];
-rx(12.47063986790331) q[9];
-cx q[15],q[55];
-rz(1.9891316337404368) q[55];
-cx q[15],q[55];
-rx(12.47063986790331) q[15];
-rx(12.47063986790331) q[55];
-rz(1.9891316337404368) q[57];
-cx q[1],q[57];
-cx q[1],q[60];
-rz(1.9891316337404368) q[59];
-cx q[16],q[59];
-rx(12.47063986790331) q[16];
-rz(1.9891316337404368) q[60];
-cx q[1],q[60];
-rx(12.47063986790331) q[1];
-cx q[0],q[1];
-rz(0.3312796418412478) q[1];
-cx q[0],q[1];
-cx q[0],q[2];
-rz(0.3312796418412478) q[2];
-cx q[0],q[2];
-rx(11.0751995807344) q[2];
-cx q[7],q[60];
-rz(1.9891316337404368) q[60];
-cx q[7],q[60];
-rx(12.47063986790331) q[60];
-rz(5.40641348736204) q[65];
-cx q[23],q[65];
-rx(6.014208949587977) q[23];
-cx q[3],q[23];
-rz(1.9891316337404368) q[23];
-cx q[3],q[23];
-cx q[3],q[24];
-cx q[17],q[23];
-rz(1.9891316337404368) q[23];
-cx q[17],q[23];
-cx q[17],q[47];
-rz(1.9891316337404368) q[24];
-cx q[3],q[24];
-cx q[3],q[25];
-cx q[5],q[24];
-rz(1.9891316337404368) q[24];
-cx q[5],q[24];
-cx q[5],q[33];
-cx q[24],q[54];
-rz(1.9891316337404368) q[25];
-cx q[3],q[25];
-cx q[3],q[26];
-cx q[12],q[25];
-rz(1.9891316337404368) q[25];
-cx q[12],q[25];
-cx q[12],q[31];
-rx(12.47063986790331) q[25];
-rz(1.9891316337404368) q[26];
-cx q[3],q[26];
-cx q[3],q[28];
-cx q[21],q[26];
-rz(1.9891316337404368) q[26];
-cx q[21],q[26];
-cx q[21],q[32];
-rz(1.9891316337404368) q[28];
-cx q[3],q[28];
-cx q[3],q[29];
-cx q[28],q[51];
-rz(1.9891316337404368) q[29];
-cx q[3],q[29];
-cx q[3],q[30];
-rx(12.47063986790331) q[29];
-rz(1.9891316337404368) q[30];
-cx q[3],q[30];
-cx q[3],q[34];
-cx q[18],q[30];
-rz(1.9891316337404368) q[30];
-cx q[18],q[30];
-rx(12.47063986790331) q[18];
-rz(1.9891316337404368) q[31];
-cx q[12],q[31];
-cx q[26],q[31];
-rz(1.9891316337404368) q[31];
-cx q[26],q[31];
-rx(12.47063986790331) q[26];
-rx(12.47063986790331) q[31];
-rz(1.9891316337404368) q[32];
-cx q[21],q[32];
-cx q[21],q[38];
-rz(1.9891316337404368) q[33];
-cx q[5],q[33];
-cx q[5],q[46];
-cx q[30],q[33];
-rz(1.9891316337404368) q[33];
-cx q[30],q[33];
-cx q[30],q[48];
-rx(12.47063986790331) q[33];
-rz(1.9891316337404368) q[34];
-cx q[3],q[34];
-cx q[3],q[35];
-cx q[12],q[34];
-rz(1.9891316337404368) q[34];
-cx q[12],q[34];
-cx q[34],q[37];
-rz(1.9891316337404368) q[35];
-cx q[3],q[35];
-cx q[3],q[39];
-cx q[32],q[35];
-rz(1.9891316337404368) q[35];
-cx q[32],q[35];
-cx q[32],q[59];
-rx(12.47063986790331) q[35];
-rz(1.9891316337404368) q[37];
-cx q[34],q[37];
-rx(12.47063986790331) q[34];
-rx(12.47063986790331) q[37];
-rz(1.9891316337404368) q[38];
-cx q[21],q[38];
-rz(1.9891316337404368) q[39];
-cx q[3],q[39];
-cx q[3],q[40];
-cx q[13],q[39];
-rz(1.9891316337404368) q[39];
-cx q[13],q[39];
-cx q[13],q[56];
-rx(12.47063986790331) q[39];
-rz(1.9891316337404368) q[40];
-cx q[3],q[40];
-cx q[3],q[42];
-cx q[23],q[40];
-rz(1.9891316337404368) q[40];
-cx q[23],q[40];
-rx(12.47063986790331) q[40];
-rz(1.9891316337404368) q[42];
-cx q[3],q[42];
-cx q[3],q[43];
-rx(12.47063986790331) q[42];
-rz(1.9891316337404368) q[43];
-cx q[3],q[43];
-cx q[3],q[44];
-cx q[20],q[43];
-rz(1.9891316337404368) q[43];
-cx q[20],q[43];
-rx(12.47063986790331) q[20];
-rx(12.47063986790331) q[43];
-rz(1.9891316337404368) q[44];
-cx q[3],q[44];
-cx q[3],q[49];
-cx q[12],q[44];
-rz(1.9891316337404368) q[44];
-cx q[12],q[44];
-rx(12.47063986790331) q[44];
-rz(1.9891316337404368) q[46];
-cx q[5],q[46];
-cx q[38],q[46];
-rz(1.9891316337404368) q[46];
-cx q[38],q[46];
-rx(12.47063986790331) q[38];
-rx(12.47063986790331) q[46];
-rz(1.9891316337404368) q[47];
-cx q[17],q[47];
-cx q[17],q[53];
-rx(12.47063986790331) q[47];
-rz(1.9891316337404368) q[48];
-cx q[30],q[48];
-rx(12.47063986790331) q[30];
-rx(12.47063986790331) q[48];
-rz(1.9891316337404368) q[49];
-cx q[3],q[49];
-cx q[3],q[50];
-cx q[4],q[49];
-rz(1.9891316337404368) q[49];
-cx q[4],q[49];
-cx q[4],q[61];
-rx(12.47063986790331) q[49];
-rz(1.9891316337404368) q[50];
-cx q[3],q[50];
-cx q[3],q[52];
-cx q[12],q[50];
-rz(1.9891316337404368) q[50];
-cx q[12],q[50];
-cx q[12],q[63];
-rx(12.47063986790331) q[50];
-rz(1.9891316337404368) q[51];
-cx q[28],q[51];
-rx(12.47063986790331) q[51];
-rz(1.9891316337404368) q[52];
-cx q[3],q[52];
-cx q[3],q[57];
-cx q[10],q[52];
-rz(1.9891316337404368) q[52];
-cx q[10],q[52];
-cx q[10],q[64];
-rx(12.47063986790331) q[52];
-rz(1.9891316337404368) q[53];
-cx q[17],q[53];
-cx q[17],q[62];
-cx q[21],q[53];
-rz(1.9891316337404368) q[53];
-cx q[21],q[53];
-rx(12.47063986790331) q[21];
-rx(12.47063986790331) q[53];
-rz(1.9891316337404368) q[54];
-cx q[24],q[54];
-cx q[24],q[58];
-cx q[28],q[54];
-rz(1.9891316337404368) q[54];
-cx q[28],q[54];
-rx(12.47063986790331) q[54];
-rz(1.9891316337404368) q[56];
-cx q[13],q[56];
-rx(12.47063986790331) q[13];
-cx q[45],q[56];
-rz(1.9891316337404368) q[56];
-cx q[45],q[56];
-rx(12.47063986790331) q[45];
-rx(12.47063986790331) q[56];
-rz(1.9891316337404368) q[57];
-cx q[3],q[57];
-rx(12.47063986790331) q[3];
-cx q[0],q[3];
-rz(0.3312796418412478) q[3];
-cx q[0],q[3];
-cx q[0],q[15];
-cx q[1],q[3];
-rz(0.3312796418412478) q[3];
-cx q[1],q[3];
-rz(0.3312796418412478) q[15];
-cx q[0],q[15];
-cx q[0],q[16];
-rz(0.3312796418412478) q[16];
-cx q[0],q[16];
-cx q[0],q[20];
-rz(0.3312796418412478) q[20];
-cx q[0],q[20];
-rx(12.47063986790331) q[57];
-rz(1.9891316337404368) q[58];
-cx q[24],q[58];
-rx(12.47063986790331) q[24];
-cx q[28],q[58];
-rz(1.9891316337404368) q[58];
-cx q[28],q[58];
-rx(12.47063986790331) q[28];
-rx(12.47063986790331) q[58];
-rz(1.9891316337404368) q[59];
-cx q[32],q[59];
-rx(12.47063986790331) q[32];
-cx q[0],q[32];
-rz(0.3312796418412478) q[32];
-cx q[0],q[32];
-cx q[0],q[42];
-rz(0.3312796418412478) q[42];
-cx q[0],q[42];
-cx q[0],q[48];
-rz(0.3312796418412478) q[48];
-cx q[0],q[48];
-cx q[0],q[51];
-rz(0.3312796418412478) q[51];
-cx q[0],q[51];
-rx(12.47063986790331) q[59];
-rz(1.9891316337404368) q[61];
-cx q[4],q[61];
-rx(12.47063986790331) q[4];
-cx q[1],q[4];
-rz(0.3312796418412478) q[4];
-cx q[1],q[4];
-cx q[3],q[4];
-rz(0.3312796418412478) q[4];
-cx q[3],q[4];
-cx q[4],q[6];
-rz(0.3312796418412478) q[6];
-cx q[4],q[6];
-cx q[7],q[61];
-rz(1.9891316337404368) q[61];
-cx q[7],q[61];
-rx(12.47063986790331) q[7];
-rx(12.47063986790331) q[61];
-rz(1.9891316337404368) q[62];
-cx q[17],q[62];
-rx(12.47063986790331) q[62];
-cx q[0],q[62];
-rz(0.3312796418412478) q[62];
-cx q[0],q[62];
-rz(1.9891316337404368) q[63];
-cx q[12],q[63];
-rx(12.47063986790331) q[12];
-cx q[17],q[63];
-rz(1.9891316337404368) q[63];
-cx q[17],q[63];
-rx(12.47063986790331) q[17];
-rx(12.47063986790331) q[63];
-rz(1.9891316337404368) q[64];
-cx q[10],q[64];
-rx(12.47063986790331) q[10];
-rx(12.47063986790331) q[64];
-cx q[0],q[64];
-rz(0.3312796418412478) q[64];
-cx q[0],q[64];
-rx(11.0751995807344) q[0];
-rx(6.014208949587977) q[65];
-cx q[5],q[65];
-rz(1.9891316337404368) q[65];
-cx q[5],q[65];
-rx(12.47063986790331) q[5];
-cx q[1],q[5];
-rz(0.3312796418412478) q[5];
-cx q[1],q[5];
-cx q[1],q[9];
-cx q[3],q[5];
-rz(0.3312796418412478) q[5];
-cx q[3],q[5];
-cx q[3],q[7];
-cx q[5],q[6];
-rz(0.3312796418412478) q[6];
-cx q[5],q[6];
-rz(0.3312796418412478) q[7];
-cx q[3],q[7];
-cx q[3],q[8];
-cx q[4],q[7];
-rz(0.3312796418412478) q[7];
-cx q[4],q[7];
-cx q[4],q[10];
-rz(0.3312796418412478) q[8];
-cx q[3],q[8];
-cx q[5],q[8];
-rz(0.3312796418412478) q[8];
-cx q[5],q[8];
-cx q[5],q[11];
-rx(11.0751995807344) q[8];
-rz(0.3312796418412478) q[9];
-cx q[1],q[9];
-cx q[1],q[17];
-cx q[3],q[9];
-rz(0.3312796418412478) q[9];
-cx q[3],q[9];
-cx q[3],q[12];
-rz(0.3312796418412478) q[10];
-cx q[4],q[10];
-cx q[4],q[13];
-cx q[6],q[10];
-rz(0.3312796418412478) q[10];
-cx q[6],q[10];
-cx q[10],q[37];
-rz(0.3312796418412478) q[11];
-cx q[5],q[11];
-cx q[6],q[11];
-rz(0.3312796418412478) q[11];
-cx q[6],q[11];
-rx(11.0751995807344) q[11];
-rz(0.3312796418412478) q[12];
-cx q[3],q[12];
-cx q[3],q[14];
-cx q[5],q[12];
-rz(0.3312796418412478) q[12];
-cx q[5],q[12];
-rz(0.3312796418412478) q[13];
-cx q[4],q[13];
-cx q[5],q[13];
-rz(0.3312796418412478) q[13];
-cx q[5],q[13];
-rz(0.3312796418412478) q[14];
-cx q[3],q[14];
-cx q[3],q[15];
-cx q[4],q[14];
-rz(0.3312796418412478) q[14];
-cx q[4],q[14];
-rx(11.0751995807344) q[14];
-rz(0.3312796418412478) q[15];
-cx q[3],q[15];
-cx q[3],q[16];
-cx q[15],q[20];
-rz(0.3312796418412478) q[16];
-cx q[3],q[16];
-rz(0.3312796418412478) q[17];
-cx q[1],q[17];
-cx q[1],q[28];
-cx q[3],q[17];
-rz(0.3312796418412478) q[17];
-cx q[3],q[17];
-cx q[3],q[18];
-rz(0.3312796418412478) q[18];
-cx q[3],q[18];
-cx q[3],q[19];
-cx q[4],q[18];
-rz(0.3312796418412478) q[18];
-cx q[4],q[18];
-cx q[4],q[21];
-rz(0.3312796418412478) q[19];
-cx q[3],q[19];
-cx q[3],q[22];
-cx q[7],q[19];
-rz(0.3312796418412478) q[19];
-cx q[7],q[19];
-cx q[19],q[38];
-rz(0.3312796418412478) q[20];
-cx q[15],q[20];
-rz(0.3312796418412478) q[21];
-cx q[4],q[21];
-cx q[4],q[27];
-cx q[15],q[21];
-rz(0.3312796418412478) q[21];
-cx q[15],q[21];
-cx q[15],q[36];
-rz(0.3312796418412478) q[22];
-cx q[3],q[22];
-cx q[9],q[22];
-rz(0.3312796418412478) q[22];
-cx q[9],q[22];
-cx q[9],q[55];
-rx(11.0751995807344) q[22];
-cx q[23],q[65];
-rz(0.3312796418412478) q[27];
-cx q[4],q[27];
-cx q[4],q[47];
-cx q[6],q[27];
-rz(0.3312796418412478) q[27];
-cx q[6],q[27];
-rx(11.0751995807344) q[6];
-rz(0.3312796418412478) q[28];
-cx q[1],q[28];
-cx q[1],q[29];
-rz(0.3312796418412478) q[29];
-cx q[1],q[29];
-cx q[1],q[45];
-rz(0.3312796418412478) q[36];
-cx q[15],q[36];
-cx q[20],q[36];
-rz(0.3312796418412478) q[36];
-cx q[20],q[36];
-rx(11.0751995807344) q[36];
-rz(0.3312796418412478) q[37];
-cx q[10],q[37];
-cx q[10],q[41];
-rz(0.3312796418412478) q[38];
-cx q[19],q[38];
-rx(11.0751995807344) q[19];
-rz(0.3312796418412478) q[41];
-cx q[10],q[41];
-cx q[27],q[41];
-rz(0.3312796418412478) q[41];
-cx q[27],q[41];
-rx(11.0751995807344) q[27];
-rx(11.0751995807344) q[41];
-rz(0.3312796418412478) q[45];
-cx q[1],q[45];
-cx q[1],q[57];
-cx q[16],q[45];
-rz(0.3312796418412478) q[45];
-cx q[16],q[45];
-cx q[16],q[59];
-rz(0.3312796418412478) q[47];
-cx q[4],q[47];
-rz(0.3312796418412478) q[55];
-cx q[9],q[55];
-rx(11.0751995807344) q[9];
-cx q[15],q[55];
-rz(0.3312796418412478) q[55];
-cx q[15],q[55];
-rx(11.0751995807344) q[15];
-rx(11.0751995807344) q[55];
-rz(0.3312796418412478) q[57];
-cx q[1],q[57];
-cx q[1],q[60];
-rz(0.3312796418412478) q[59];
-cx q[16],q[59];
-rx(11.0751995807344) q[16];
-rz(0.3312796418412478) q[60];
-cx q[1],q[60];
-rx(11.0751995807344) q[1];
-cx q[7],q[60];
-rz(0.3312796418412478) q[60];
-cx q[7],q[60];
-rx(11.0751995807344) q[60];
-rz(1.9891316337404368) q[65];
-cx q[23],q[65];
-rx(12.47063986790331) q[23];
-cx q[3],q[23];
-rz(0.3312796418412478) q[23];
-cx q[3],q[23];
-cx q[3],q[24];
-cx q[17],q[23];
-rz(0.3312796418412478) q[23];
-cx q[17],q[23];
-cx q[17],q[47];
-rz(0.3312796418412478) q[24];
-cx q[3],q[24];
-cx q[3],q[25];
-cx q[5],q[24];
-rz(0.3312796418412478) q[24];
-cx q[5],q[24];
-cx q[5],q[33];
-cx q[24],q[54];
-rz(0.3312796418412478) q[25];
-cx q[3],q[25];
-cx q[3],q[26];
-cx q[12],q[25];
-rz(0.3312796418412478) q[25];
-cx q[12],q[25];
-cx q[12],q[31];
-rx(11.0751995807344) q[25];
-rz(0.3312796418412478) q[26];
-cx q[3],q[26];
-cx q[3],q[28];
-cx q[21],q[26];
-rz(0.3312796418412478) q[26];
-cx q[21],q[26];
-cx q[21],q[32];
-rz(0.3312796418412478) q[28];
-cx q[3],q[28];
-cx q[3],q[29];
-cx q[28],q[51];
-rz(0.3312796418412478) q[29];
-cx q[3],q[29];
-cx q[3],q[30];
-rx(11.0751995807344) q[29];
-rz(0.3312796418412478) q[30];
-cx q[3],q[30];
-cx q[3],q[34];
-cx q[18],q[30];
-rz(0.3312796418412478) q[30];
-cx q[18],q[30];
-rx(11.0751995807344) q[18];
-rz(0.3312796418412478) q[31];
-cx q[12],q[31];
-cx q[26],q[31];
-rz(0.3312796418412478) q[31];
-cx q[26],q[31];
-rx(11.0751995807344) q[26];
-rx(11.0751995807344) q[31];
-rz(0.3312796418412478) q[32];
-cx q[21],q[32];
-cx q[21],q[38];
-rz(0.3312796418412478) q[33];
-cx q[5],q[33];
-cx q[5],q[46];
-cx q[30],q[33];
-rz(0.3312796418412478) q[33];
-cx q[30],q[33];
-cx q[30],q[48];
-rx(11.0751995807344) q[33];
-rz(0.3312796418412478) q[34];
-cx q[3],q[34];
-cx q[3],q[35];
-cx q[12],q[34];
-rz(0.3312796418412478) q[34];
-cx q[12],q[34];
-cx q[34],q[37];
-rz(0.3312796418412478) q[35];
-cx q[3],q[35];
-cx q[3],q[39];
-cx q[32],q[35];
-rz(0.3312796418412478) q[35];
-cx q[32],q[35];
-cx q[32],q[59];
-rx(11.0751995807344) q[35];
-rz(0.3312796418412478) q[37];
-cx q[34],q[37];
-rx(11.0751995807344) q[34];
-rx(11.0751995807344) q[37];
-rz(0.3312796418412478) q[38];
-cx q[21],q[38];
-rz(0.3312796418412478) q[39];
-cx q[3],q[39];
-cx q[3],q[40];
-cx q[13],q[39];
-rz(0.3312796418412478) q[39];
-cx q[13],q[39];
-cx q[13],q[56];
-rx(11.0751995807344) q[39];
-rz(0.3312796418412478) q[40];
-cx q[3],q[40];
-cx q[3],q[42];
-cx q[23],q[40];
-rz(0.3312796418412478) q[40];
-cx q[23],q[40];
-rx(11.0751995807344) q[40];
-rz(0.3312796418412478) q[42];
-cx q[3],q[42];
-cx q[3],q[43];
-rx(11.0751995807344) q[42];
-rz(0.3312796418412478) q[43];
-cx q[3],q[43];
-cx q[3],q[44];
-cx q[20],q[43];
-rz(0.3312796418412478) q[43];
-cx q[20],q[43];
-rx(11.0751995807344) q[20];
-rx(11.0751995807344) q[43];
-rz(0.3312796418412478) q[44];
-cx q[3],q[44];
-cx q[3],q[49];
-cx q[12],q[44];
-rz(0.3312796418412478) q[44];
-cx q[12],q[44];
-rx(11.0751995807344) q[44];
-rz(0.3312796418412478) q[46];
-cx q[5],q[46];
-cx q[38],q[46];
-rz(0.3312796418412478) q[46];
-cx q[38],q[46];
-rx(11.0751995807344) q[38];
-rx(11.0751995807344) q[46];
-rz(0.3312796418412478) q[47];
-cx q[17],q[47];
-cx q[17],q[53];
-rx(11.0751995807344) q[47];
-rz(0.3312796418412478) q[48];
-cx q[30],q[48];
-rx(11.0751995807344) q[30];
-rx(11.0751995807344) q[48];
-rz(0.3312796418412478) q[49];
-cx q[3],q[49];
-cx q[3],q[50];
-cx q[4],q[49];
-rz(0.3312796418412478) q[49];
-cx q[4],q[49];
-cx q[4],q[61];
-rx(11.0751995807344) q[49];
-rz(0.3312796418412478) q[50];
-cx q[3],q[50];
-cx q[3],q[52];
-cx q[12],q[50];
-rz(0.3312796418412478) q[50];
-cx q[12],q[50];
-cx q[12],q[63];
-rx(11.0751995807344) q[50];
-rz(0.3312796418412478) q[51];
-cx q[28],q[51];
-rx(11.0751995807344) q[51];
-rz(0.3312796418412478) q[52];
-cx q[3],q[52];
-cx q[3],q[57];
-cx q[10],q[52];
-rz(0.3312796418412478) q[52];
-cx q[10],q[52];
-cx q[10],q[64];
-rx(11.0751995807344) q[52];
-rz(0.3312796418412478) q[53];
-cx q[17],q[53];
-cx q[17],q[62];
-cx q[21],q[53];
-rz(0.3312796418412478) q[53];
-cx q[21],q[53];
-rx(11.0751995807344) q[21];
-rx(11.0751995807344) q[53];
-rz(0.3312796418412478) q[54];
-cx q[24],q[54];
-cx q[24],q[58];
-cx q[28],q[54];
-rz(0.3312796418412478) q[54];
-cx q[28],q[54];
-rx(11.0751995807344) q[54];
-rz(0.3312796418412478) q[56];
-cx q[13],q[56];
-rx(11.0751995807344) q[13];
-cx q[45],q[56];
-rz(0.3312796418412478) q[56];
-cx q[45],q[56];
-rx(11.0751995807344) q[45];
-rx(11.0751995807344) q[56];
-rz(0.3312796418412478) q[57];
-cx q[3],q[57];
-rx(11.0751995807344) q[3];
-rx(11.0751995807344) q[57];
-rz(0.3312796418412478) q[58];
-cx q[24],q[58];
-rx(11.0751995807344) q[24];
-cx q[28],q[58];
-rz(0.3312796418412478) q[58];
-cx q[28],q[58];
-rx(11.0751995807344) q[28];
-rx(11.0751995807344) q[58];
-rz(0.3312796418412478) q[59];
-cx q[32],q[59];
-rx(11.0751995807344) q[32];
-rx(11.0751995807344) q[59];
-rz(0.3312796418412478) q[61];
-cx q[4],q[61];
-rx(11.0751995807344) q[4];
-cx q[7],q[61];
-rz(0.3312796418412478) q[61];
-cx q[7],q[61];
-rx(11.0751995807344) q[7];
-rx(11.0751995807344) q[61];
-rz(0.3312796418412478) q[62];
-cx q[17],q[62];
-rx(11.0751995807344) q[62];
-rz(0.3312796418412478) q[63];
-cx q[12],q[63];
-rx(11.0751995807344) q[12];
-cx q[17],q[63];
-rz(0.3312796418412478) q[63];
-cx q[17],q[63];
-rx(11.0751995807344) q[17];
-rx(11.0751995807344) q[63];
-rz(0.3312796418412478) q[64];
-cx q[10],q[64];
-rx(11.0751995807344) q[10];
-rx(11.0751995807344) q[64];
-rx(12.47063986790331) q[65];
-cx q[5],q[65];
-rz(0.3312796418412478) q[65];
-cx q[5],q[65];
-rx(11.0751995807344) q[5];
-cx q[23],q[65];
-rz(0.3312796418412478) q[65];
-cx q[23],q[65];
-rx(11.0751995807344) q[23];
-rx(11.0751995807344) q[65];
\ No newline at end of file
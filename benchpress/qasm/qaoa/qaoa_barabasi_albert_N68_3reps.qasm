@@ -1,1531 +0,0 @@
-OPENQASM 2.0;
-include "qelib1.inc";
-qreg q[68];
-ry(pi/2) q[0];
-rx(pi) q[0];
-ry(pi/2) q[1];
-rx(pi) q[1];
-cx q[0],q[1];
-rz(5.520826239102277) q[1];
-cx q[0],q[1];
-ry(pi/2) q[2];
-rx(pi) q[2];
-cx q[0],q[2];
-rz(5.520826239102277) q[2];
-cx q[0],q[2];
-rx(11.731533223806276) q[2];
-ry(pi/2) q[3];
-rx(pi) q[3];
-cx q[0],q[3];
-rz(5.520826239102277) q[3];
-cx q[0],q[3];
-cx q[1],q[3];
-rz(5.520826239102277) q[3];
-cx q[1],q[3];
-ry(pi/2) q[4];
-rx(pi) q[4];
-cx q[1],q[4];
-rz(5.520826239102277) q[4];
-cx q[1],q[4];
-cx q[3],q[4];
-rz(5.520826239102277) q[4];
-cx q[3],q[4];
-ry(pi/2) q[5];
-rx(pi) q[5];
-cx q[1],q[5];
-rz(5.520826239102277) q[5];
-cx q[1],q[5];
-cx q[3],q[5];
-rz(5.520826239102277) q[5];
-cx q[3],q[5];
-ry(pi/2) q[6];
-rx(pi) q[6];
-cx q[4],q[6];
-rz(5.520826239102277) q[6];
-cx q[4],q[6];
-cx q[5],q[6];
-rz(5.520826239102277) q[6];
-cx q[5],q[6];
-ry(pi/2) q[7];
-rx(pi) q[7];
-cx q[3],q[7];
-rz(5.520826239102277) q[7];
-cx q[3],q[7];
-cx q[4],q[7];
-rz(5.520826239102277) q[7];
-cx q[4],q[7];
-ry(pi/2) q[8];
-rx(pi) q[8];
-cx q[3],q[8];
-rz(5.520826239102277) q[8];
-cx q[3],q[8];
-cx q[5],q[8];
-rz(5.520826239102277) q[8];
-cx q[5],q[8];
-rx(11.731533223806276) q[8];
-ry(pi/2) q[9];
-rx(pi) q[9];
-cx q[1],q[9];
-rz(5.520826239102277) q[9];
-cx q[1],q[9];
-cx q[3],q[9];
-rz(5.520826239102277) q[9];
-cx q[3],q[9];
-ry(pi/2) q[10];
-rx(pi) q[10];
-cx q[4],q[10];
-rz(5.520826239102277) q[10];
-cx q[4],q[10];
-cx q[6],q[10];
-rz(5.520826239102277) q[10];
-cx q[6],q[10];
-ry(pi/2) q[11];
-rx(pi) q[11];
-cx q[5],q[11];
-rz(5.520826239102277) q[11];
-cx q[5],q[11];
-cx q[6],q[11];
-rz(5.520826239102277) q[11];
-cx q[6],q[11];
-rx(11.731533223806276) q[11];
-ry(pi/2) q[12];
-rx(pi) q[12];
-cx q[3],q[12];
-rz(5.520826239102277) q[12];
-cx q[3],q[12];
-cx q[5],q[12];
-rz(5.520826239102277) q[12];
-cx q[5],q[12];
-ry(pi/2) q[13];
-rx(pi) q[13];
-cx q[4],q[13];
-rz(5.520826239102277) q[13];
-cx q[4],q[13];
-cx q[5],q[13];
-rz(5.520826239102277) q[13];
-cx q[5],q[13];
-ry(pi/2) q[14];
-rx(pi) q[14];
-cx q[3],q[14];
-rz(5.520826239102277) q[14];
-cx q[3],q[14];
-cx q[4],q[14];
-rz(5.520826239102277) q[14];
-cx q[4],q[14];
-rx(11.731533223806276) q[14];
-ry(pi/2) q[15];
-rx(pi) q[15];
-cx q[0],q[15];
-rz(5.520826239102277) q[15];
-cx q[0],q[15];
-cx q[3],q[15];
-rz(5.520826239102277) q[15];
-cx q[3],q[15];
-ry(pi/2) q[16];
-rx(pi) q[16];
-cx q[0],q[16];
-rz(5.520826239102277) q[16];
-cx q[0],q[16];
-cx q[3],q[16];
-rz(5.520826239102277) q[16];
-cx q[3],q[16];
-ry(pi/2) q[17];
-rx(pi) q[17];
-cx q[1],q[17];
-rz(5.520826239102277) q[17];
-cx q[1],q[17];
-cx q[3],q[17];
-rz(5.520826239102277) q[17];
-cx q[3],q[17];
-ry(pi/2) q[18];
-rx(pi) q[18];
-cx q[3],q[18];
-rz(5.520826239102277) q[18];
-cx q[3],q[18];
-cx q[4],q[18];
-rz(5.520826239102277) q[18];
-cx q[4],q[18];
-ry(pi/2) q[19];
-rx(pi) q[19];
-cx q[3],q[19];
-rz(5.520826239102277) q[19];
-cx q[3],q[19];
-cx q[7],q[19];
-rz(5.520826239102277) q[19];
-cx q[7],q[19];
-ry(pi/2) q[20];
-rx(pi) q[20];
-cx q[0],q[20];
-rz(5.520826239102277) q[20];
-cx q[0],q[20];
-cx q[15],q[20];
-rz(5.520826239102277) q[20];
-cx q[15],q[20];
-ry(pi/2) q[21];
-rx(pi) q[21];
-cx q[4],q[21];
-rz(5.520826239102277) q[21];
-cx q[4],q[21];
-cx q[15],q[21];
-rz(5.520826239102277) q[21];
-cx q[15],q[21];
-ry(pi/2) q[22];
-rx(pi) q[22];
-cx q[3],q[22];
-rz(5.520826239102277) q[22];
-cx q[3],q[22];
-cx q[9],q[22];
-rz(5.520826239102277) q[22];
-cx q[9],q[22];
-rx(11.731533223806276) q[22];
-ry(pi/2) q[23];
-rx(pi) q[23];
-cx q[3],q[23];
-rz(5.520826239102277) q[23];
-cx q[3],q[23];
-cx q[17],q[23];
-rz(5.520826239102277) q[23];
-cx q[17],q[23];
-ry(pi/2) q[24];
-rx(pi) q[24];
-cx q[3],q[24];
-rz(5.520826239102277) q[24];
-cx q[3],q[24];
-cx q[5],q[24];
-rz(5.520826239102277) q[24];
-cx q[5],q[24];
-ry(pi/2) q[25];
-rx(pi) q[25];
-cx q[3],q[25];
-rz(5.520826239102277) q[25];
-cx q[3],q[25];
-cx q[12],q[25];
-rz(5.520826239102277) q[25];
-cx q[12],q[25];
-rx(11.731533223806276) q[25];
-ry(pi/2) q[26];
-rx(pi) q[26];
-cx q[3],q[26];
-rz(5.520826239102277) q[26];
-cx q[3],q[26];
-cx q[21],q[26];
-rz(5.520826239102277) q[26];
-cx q[21],q[26];
-ry(pi/2) q[27];
-rx(pi) q[27];
-cx q[4],q[27];
-rz(5.520826239102277) q[27];
-cx q[4],q[27];
-cx q[6],q[27];
-rz(5.520826239102277) q[27];
-cx q[6],q[27];
-rx(11.731533223806276) q[6];
-ry(pi/2) q[28];
-rx(pi) q[28];
-cx q[1],q[28];
-rz(5.520826239102277) q[28];
-cx q[1],q[28];
-cx q[3],q[28];
-rz(5.520826239102277) q[28];
-cx q[3],q[28];
-ry(pi/2) q[29];
-rx(pi) q[29];
-cx q[1],q[29];
-rz(5.520826239102277) q[29];
-cx q[1],q[29];
-cx q[3],q[29];
-rz(5.520826239102277) q[29];
-cx q[3],q[29];
-rx(11.731533223806276) q[29];
-ry(pi/2) q[30];
-rx(pi) q[30];
-cx q[3],q[30];
-rz(5.520826239102277) q[30];
-cx q[3],q[30];
-cx q[18],q[30];
-rz(5.520826239102277) q[30];
-cx q[18],q[30];
-rx(11.731533223806276) q[18];
-ry(pi/2) q[31];
-rx(pi) q[31];
-cx q[12],q[31];
-rz(5.520826239102277) q[31];
-cx q[12],q[31];
-cx q[26],q[31];
-rz(5.520826239102277) q[31];
-cx q[26],q[31];
-rx(11.731533223806276) q[26];
-rx(11.731533223806276) q[31];
-ry(pi/2) q[32];
-rx(pi) q[32];
-cx q[0],q[32];
-rz(5.520826239102277) q[32];
-cx q[0],q[32];
-cx q[21],q[32];
-rz(5.520826239102277) q[32];
-cx q[21],q[32];
-ry(pi/2) q[33];
-rx(pi) q[33];
-cx q[5],q[33];
-rz(5.520826239102277) q[33];
-cx q[5],q[33];
-cx q[30],q[33];
-rz(5.520826239102277) q[33];
-cx q[30],q[33];
-rx(11.731533223806276) q[33];
-ry(pi/2) q[34];
-rx(pi) q[34];
-cx q[3],q[34];
-rz(5.520826239102277) q[34];
-cx q[3],q[34];
-cx q[12],q[34];
-rz(5.520826239102277) q[34];
-cx q[12],q[34];
-ry(pi/2) q[35];
-rx(pi) q[35];
-cx q[3],q[35];
-rz(5.520826239102277) q[35];
-cx q[3],q[35];
-cx q[32],q[35];
-rz(5.520826239102277) q[35];
-cx q[32],q[35];
-rx(11.731533223806276) q[35];
-ry(pi/2) q[36];
-rx(pi) q[36];
-cx q[15],q[36];
-rz(5.520826239102277) q[36];
-cx q[15],q[36];
-cx q[20],q[36];
-rz(5.520826239102277) q[36];
-cx q[20],q[36];
-rx(11.731533223806276) q[36];
-ry(pi/2) q[37];
-rx(pi) q[37];
-cx q[10],q[37];
-rz(5.520826239102277) q[37];
-cx q[10],q[37];
-cx q[34],q[37];
-rz(5.520826239102277) q[37];
-cx q[34],q[37];
-rx(11.731533223806276) q[34];
-rx(11.731533223806276) q[37];
-ry(pi/2) q[38];
-rx(pi) q[38];
-cx q[19],q[38];
-rz(5.520826239102277) q[38];
-cx q[19],q[38];
-rx(11.731533223806276) q[19];
-cx q[21],q[38];
-rz(5.520826239102277) q[38];
-cx q[21],q[38];
-ry(pi/2) q[39];
-rx(pi) q[39];
-cx q[3],q[39];
-rz(5.520826239102277) q[39];
-cx q[3],q[39];
-cx q[13],q[39];
-rz(5.520826239102277) q[39];
-cx q[13],q[39];
-rx(11.731533223806276) q[39];
-ry(pi/2) q[40];
-rx(pi) q[40];
-cx q[3],q[40];
-rz(5.520826239102277) q[40];
-cx q[3],q[40];
-cx q[23],q[40];
-rz(5.520826239102277) q[40];
-cx q[23],q[40];
-rx(11.731533223806276) q[40];
-ry(pi/2) q[41];
-rx(pi) q[41];
-cx q[10],q[41];
-rz(5.520826239102277) q[41];
-cx q[10],q[41];
-cx q[27],q[41];
-rz(5.520826239102277) q[41];
-cx q[27],q[41];
-rx(11.731533223806276) q[27];
-ry(pi/2) q[42];
-rx(pi) q[42];
-cx q[0],q[42];
-rz(5.520826239102277) q[42];
-cx q[0],q[42];
-cx q[3],q[42];
-rz(5.520826239102277) q[42];
-cx q[3],q[42];
-rx(11.731533223806276) q[42];
-ry(pi/2) q[43];
-rx(pi) q[43];
-cx q[3],q[43];
-rz(5.520826239102277) q[43];
-cx q[3],q[43];
-cx q[20],q[43];
-rz(5.520826239102277) q[43];
-cx q[20],q[43];
-rx(11.731533223806276) q[20];
-rx(11.731533223806276) q[43];
-ry(pi/2) q[44];
-rx(pi) q[44];
-cx q[3],q[44];
-rz(5.520826239102277) q[44];
-cx q[3],q[44];
-cx q[12],q[44];
-rz(5.520826239102277) q[44];
-cx q[12],q[44];
-rx(11.731533223806276) q[44];
-ry(pi/2) q[45];
-rx(pi) q[45];
-cx q[1],q[45];
-rz(5.520826239102277) q[45];
-cx q[1],q[45];
-cx q[16],q[45];
-rz(5.520826239102277) q[45];
-cx q[16],q[45];
-ry(pi/2) q[46];
-rx(pi) q[46];
-cx q[5],q[46];
-rz(5.520826239102277) q[46];
-cx q[5],q[46];
-cx q[38],q[46];
-rz(5.520826239102277) q[46];
-cx q[38],q[46];
-rx(11.731533223806276) q[38];
-rx(11.731533223806276) q[46];
-ry(pi/2) q[47];
-rx(pi) q[47];
-cx q[4],q[47];
-rz(5.520826239102277) q[47];
-cx q[4],q[47];
-cx q[17],q[47];
-rz(5.520826239102277) q[47];
-cx q[17],q[47];
-ry(pi/2) q[48];
-rx(pi) q[48];
-cx q[0],q[48];
-rz(5.520826239102277) q[48];
-cx q[0],q[48];
-cx q[30],q[48];
-rz(5.520826239102277) q[48];
-cx q[30],q[48];
-rx(11.731533223806276) q[30];
-rx(11.731533223806276) q[48];
-ry(pi/2) q[49];
-rx(pi) q[49];
-cx q[3],q[49];
-rz(5.520826239102277) q[49];
-cx q[3],q[49];
-cx q[4],q[49];
-rz(5.520826239102277) q[49];
-cx q[4],q[49];
-rx(11.731533223806276) q[49];
-ry(pi/2) q[50];
-rx(pi) q[50];
-cx q[3],q[50];
-rz(5.520826239102277) q[50];
-cx q[3],q[50];
-cx q[12],q[50];
-rz(5.520826239102277) q[50];
-cx q[12],q[50];
-rx(11.731533223806276) q[50];
-ry(pi/2) q[51];
-rx(pi) q[51];
-cx q[0],q[51];
-rz(5.520826239102277) q[51];
-cx q[0],q[51];
-cx q[28],q[51];
-rz(5.520826239102277) q[51];
-cx q[28],q[51];
-rx(11.731533223806276) q[51];
-ry(pi/2) q[52];
-rx(pi) q[52];
-cx q[3],q[52];
-rz(5.520826239102277) q[52];
-cx q[3],q[52];
-cx q[10],q[52];
-rz(5.520826239102277) q[52];
-cx q[10],q[52];
-rx(11.731533223806276) q[52];
-ry(pi/2) q[53];
-rx(pi) q[53];
-cx q[17],q[53];
-rz(5.520826239102277) q[53];
-cx q[17],q[53];
-cx q[21],q[53];
-rz(5.520826239102277) q[53];
-cx q[21],q[53];
-rx(11.731533223806276) q[21];
-rx(11.731533223806276) q[53];
-ry(pi/2) q[54];
-rx(pi) q[54];
-cx q[24],q[54];
-rz(5.520826239102277) q[54];
-cx q[24],q[54];
-cx q[28],q[54];
-rz(5.520826239102277) q[54];
-cx q[28],q[54];
-rx(11.731533223806276) q[54];
-ry(pi/2) q[55];
-rx(pi) q[55];
-cx q[9],q[55];
-rz(5.520826239102277) q[55];
-cx q[9],q[55];
-rx(11.731533223806276) q[9];
-cx q[15],q[55];
-rz(5.520826239102277) q[55];
-cx q[15],q[55];
-rx(11.731533223806276) q[15];
-rx(11.731533223806276) q[55];
-ry(pi/2) q[56];
-rx(pi) q[56];
-cx q[13],q[56];
-rz(5.520826239102277) q[56];
-cx q[13],q[56];
-rx(11.731533223806276) q[13];
-cx q[45],q[56];
-rz(5.520826239102277) q[56];
-cx q[45],q[56];
-rx(11.731533223806276) q[45];
-ry(pi/2) q[57];
-rx(pi) q[57];
-cx q[1],q[57];
-rz(5.520826239102277) q[57];
-cx q[1],q[57];
-cx q[3],q[57];
-rz(5.520826239102277) q[57];
-cx q[3],q[57];
-rx(11.731533223806276) q[3];
-rx(11.731533223806276) q[57];
-ry(pi/2) q[58];
-rx(pi) q[58];
-cx q[24],q[58];
-rz(5.520826239102277) q[58];
-cx q[24],q[58];
-rx(11.731533223806276) q[24];
-cx q[28],q[58];
-rz(5.520826239102277) q[58];
-cx q[28],q[58];
-rx(11.731533223806276) q[28];
-rx(11.731533223806276) q[58];
-ry(pi/2) q[59];
-rx(pi) q[59];
-cx q[16],q[59];
-rz(5.520826239102277) q[59];
-cx q[16],q[59];
-rx(11.731533223806276) q[16];
-cx q[32],q[59];
-rz(5.520826239102277) q[59];
-cx q[32],q[59];
-rx(11.731533223806276) q[32];
-rx(11.731533223806276) q[59];
-ry(pi/2) q[60];
-rx(pi) q[60];
-cx q[1],q[60];
-rz(5.520826239102277) q[60];
-cx q[1],q[60];
-rx(11.731533223806276) q[1];
-cx q[7],q[60];
-rz(5.520826239102277) q[60];
-cx q[7],q[60];
-rx(11.731533223806276) q[60];
-ry(pi/2) q[61];
-rx(pi) q[61];
-cx q[4],q[61];
-rz(5.520826239102277) q[61];
-cx q[4],q[61];
-rx(11.731533223806276) q[4];
-cx q[7],q[61];
-rz(5.520826239102277) q[61];
-cx q[7],q[61];
-rx(11.731533223806276) q[7];
-rx(11.731533223806276) q[61];
-ry(pi/2) q[62];
-rx(pi) q[62];
-cx q[0],q[62];
-rz(5.520826239102277) q[62];
-cx q[0],q[62];
-cx q[17],q[62];
-rz(5.520826239102277) q[62];
-cx q[17],q[62];
-rx(11.731533223806276) q[62];
-ry(pi/2) q[63];
-rx(pi) q[63];
-cx q[12],q[63];
-rz(5.520826239102277) q[63];
-cx q[12],q[63];
-rx(11.731533223806276) q[12];
-cx q[17],q[63];
-rz(5.520826239102277) q[63];
-cx q[17],q[63];
-rx(11.731533223806276) q[63];
-ry(pi/2) q[64];
-rx(pi) q[64];
-cx q[0],q[64];
-rz(5.520826239102277) q[64];
-cx q[0],q[64];
-rx(11.731533223806276) q[0];
-cx q[0],q[1];
-rz(1.2432835551034862) q[1];
-cx q[0],q[1];
-cx q[0],q[2];
-rz(1.2432835551034862) q[2];
-cx q[0],q[2];
-cx q[0],q[3];
-rx(3.629392455493781) q[2];
-rz(1.2432835551034862) q[3];
-cx q[0],q[3];
-cx q[0],q[15];
-cx q[1],q[3];
-rz(1.2432835551034862) q[3];
-cx q[1],q[3];
-cx q[1],q[4];
-rz(1.2432835551034862) q[4];
-cx q[1],q[4];
-cx q[3],q[4];
-rz(1.2432835551034862) q[4];
-cx q[3],q[4];
-cx q[4],q[6];
-rz(1.2432835551034862) q[6];
-cx q[4],q[6];
-cx q[10],q[64];
-rz(1.2432835551034862) q[15];
-cx q[0],q[15];
-cx q[0],q[16];
-rz(1.2432835551034862) q[16];
-cx q[0],q[16];
-cx q[0],q[20];
-rz(1.2432835551034862) q[20];
-cx q[0],q[20];
-cx q[0],q[32];
-rz(1.2432835551034862) q[32];
-cx q[0],q[32];
-cx q[0],q[42];
-rz(1.2432835551034862) q[42];
-cx q[0],q[42];
-cx q[0],q[48];
-rz(1.2432835551034862) q[48];
-cx q[0],q[48];
-cx q[0],q[51];
-rz(1.2432835551034862) q[51];
-cx q[0],q[51];
-cx q[0],q[62];
-rz(1.2432835551034862) q[62];
-cx q[0],q[62];
-rz(5.520826239102277) q[64];
-cx q[10],q[64];
-rx(11.731533223806276) q[10];
-rx(11.731533223806276) q[64];
-cx q[0],q[64];
-rz(1.2432835551034862) q[64];
-cx q[0],q[64];
-rx(3.629392455493781) q[0];
-ry(pi/2) q[65];
-rx(pi) q[65];
-cx q[5],q[65];
-rz(5.520826239102277) q[65];
-cx q[5],q[65];
-rx(11.731533223806276) q[5];
-cx q[1],q[5];
-rz(1.2432835551034862) q[5];
-cx q[1],q[5];
-cx q[1],q[9];
-cx q[3],q[5];
-rz(1.2432835551034862) q[5];
-cx q[3],q[5];
-cx q[3],q[7];
-cx q[5],q[6];
-rz(1.2432835551034862) q[6];
-cx q[5],q[6];
-rz(1.2432835551034862) q[7];
-cx q[3],q[7];
-cx q[3],q[8];
-cx q[4],q[7];
-rz(1.2432835551034862) q[7];
-cx q[4],q[7];
-cx q[4],q[10];
-rz(1.2432835551034862) q[8];
-cx q[3],q[8];
-cx q[5],q[8];
-rz(1.2432835551034862) q[8];
-cx q[5],q[8];
-cx q[5],q[11];
-rx(3.629392455493781) q[8];
-rz(1.2432835551034862) q[9];
-cx q[1],q[9];
-cx q[3],q[9];
-rz(1.2432835551034862) q[9];
-cx q[3],q[9];
-cx q[3],q[12];
-rz(1.2432835551034862) q[10];
-cx q[4],q[10];
-cx q[4],q[13];
-cx q[6],q[10];
-rz(1.2432835551034862) q[10];
-cx q[6],q[10];
-cx q[10],q[37];
-rz(1.2432835551034862) q[11];
-cx q[5],q[11];
-cx q[6],q[11];
-rz(1.2432835551034862) q[11];
-cx q[6],q[11];
-rx(3.629392455493781) q[11];
-rz(1.2432835551034862) q[12];
-cx q[3],q[12];
-cx q[3],q[14];
-cx q[5],q[12];
-rz(1.2432835551034862) q[12];
-cx q[5],q[12];
-rz(1.2432835551034862) q[13];
-cx q[4],q[13];
-cx q[5],q[13];
-rz(1.2432835551034862) q[13];
-cx q[5],q[13];
-rz(1.2432835551034862) q[14];
-cx q[3],q[14];
-cx q[3],q[15];
-cx q[4],q[14];
-rz(1.2432835551034862) q[14];
-cx q[4],q[14];
-rx(3.629392455493781) q[14];
-rz(1.2432835551034862) q[15];
-cx q[3],q[15];
-cx q[3],q[16];
-cx q[15],q[20];
-rz(1.2432835551034862) q[16];
-cx q[3],q[16];
-rz(1.2432835551034862) q[20];
-cx q[15],q[20];
-cx q[23],q[65];
-rz(1.2432835551034862) q[37];
-cx q[10],q[37];
-rz(5.520826239102277) q[65];
-cx q[23],q[65];
-rx(11.731533223806276) q[23];
-rx(11.731533223806276) q[65];
-ry(pi/2) q[66];
-rx(pi) q[66];
-cx q[17],q[66];
-rz(5.520826239102277) q[66];
-cx q[17],q[66];
-rx(11.731533223806276) q[17];
-cx q[1],q[17];
-rz(1.2432835551034862) q[17];
-cx q[1],q[17];
-cx q[1],q[28];
-cx q[3],q[17];
-rz(1.2432835551034862) q[17];
-cx q[3],q[17];
-cx q[3],q[18];
-rz(1.2432835551034862) q[18];
-cx q[3],q[18];
-cx q[3],q[19];
-cx q[4],q[18];
-rz(1.2432835551034862) q[18];
-cx q[4],q[18];
-cx q[4],q[21];
-rz(1.2432835551034862) q[19];
-cx q[3],q[19];
-cx q[3],q[22];
-cx q[7],q[19];
-rz(1.2432835551034862) q[19];
-cx q[7],q[19];
-cx q[19],q[38];
-rz(1.2432835551034862) q[21];
-cx q[4],q[21];
-cx q[4],q[27];
-cx q[15],q[21];
-rz(1.2432835551034862) q[21];
-cx q[15],q[21];
-cx q[15],q[36];
-rz(1.2432835551034862) q[22];
-cx q[3],q[22];
-cx q[3],q[23];
-cx q[9],q[22];
-rz(1.2432835551034862) q[22];
-cx q[9],q[22];
-cx q[9],q[55];
-rx(3.629392455493781) q[22];
-rz(1.2432835551034862) q[23];
-cx q[3],q[23];
-cx q[3],q[24];
-cx q[17],q[23];
-rz(1.2432835551034862) q[23];
-cx q[17],q[23];
-rz(1.2432835551034862) q[24];
-cx q[3],q[24];
-cx q[3],q[25];
-cx q[5],q[24];
-rz(1.2432835551034862) q[24];
-cx q[5],q[24];
-cx q[5],q[33];
-cx q[24],q[54];
-rz(1.2432835551034862) q[25];
-cx q[3],q[25];
-cx q[3],q[26];
-cx q[12],q[25];
-rz(1.2432835551034862) q[25];
-cx q[12],q[25];
-cx q[12],q[31];
-rx(3.629392455493781) q[25];
-rz(1.2432835551034862) q[26];
-cx q[3],q[26];
-cx q[21],q[26];
-rz(1.2432835551034862) q[26];
-cx q[21],q[26];
-cx q[21],q[32];
-rz(1.2432835551034862) q[27];
-cx q[4],q[27];
-cx q[6],q[27];
-rz(1.2432835551034862) q[27];
-cx q[6],q[27];
-rx(3.629392455493781) q[6];
-rz(1.2432835551034862) q[28];
-cx q[1],q[28];
-cx q[1],q[29];
-cx q[3],q[28];
-rz(1.2432835551034862) q[28];
-cx q[3],q[28];
-cx q[28],q[51];
-rz(1.2432835551034862) q[29];
-cx q[1],q[29];
-cx q[1],q[45];
-cx q[3],q[29];
-rz(1.2432835551034862) q[29];
-cx q[3],q[29];
-cx q[3],q[30];
-rx(3.629392455493781) q[29];
-rz(1.2432835551034862) q[30];
-cx q[3],q[30];
-cx q[3],q[34];
-cx q[18],q[30];
-rz(1.2432835551034862) q[30];
-cx q[18],q[30];
-rx(3.629392455493781) q[18];
-rz(1.2432835551034862) q[31];
-cx q[12],q[31];
-cx q[26],q[31];
-rz(1.2432835551034862) q[31];
-cx q[26],q[31];
-rx(3.629392455493781) q[26];
-rx(3.629392455493781) q[31];
-rz(1.2432835551034862) q[32];
-cx q[21],q[32];
-rz(1.2432835551034862) q[33];
-cx q[5],q[33];
-cx q[5],q[46];
-cx q[30],q[33];
-rz(1.2432835551034862) q[33];
-cx q[30],q[33];
-cx q[30],q[48];
-rx(3.629392455493781) q[33];
-rz(1.2432835551034862) q[34];
-cx q[3],q[34];
-cx q[3],q[35];
-cx q[12],q[34];
-rz(1.2432835551034862) q[34];
-cx q[12],q[34];
-cx q[34],q[37];
-rz(1.2432835551034862) q[35];
-cx q[3],q[35];
-cx q[3],q[39];
-cx q[32],q[35];
-rz(1.2432835551034862) q[35];
-cx q[32],q[35];
-rx(3.629392455493781) q[35];
-rz(1.2432835551034862) q[36];
-cx q[15],q[36];
-cx q[20],q[36];
-rz(1.2432835551034862) q[36];
-cx q[20],q[36];
-rx(3.629392455493781) q[36];
-rz(1.2432835551034862) q[37];
-cx q[34],q[37];
-rx(3.629392455493781) q[34];
-rx(3.629392455493781) q[37];
-rz(1.2432835551034862) q[38];
-cx q[19],q[38];
-rx(3.629392455493781) q[19];
-cx q[21],q[38];
-rz(1.2432835551034862) q[38];
-cx q[21],q[38];
-rz(1.2432835551034862) q[39];
-cx q[3],q[39];
-cx q[3],q[40];
-cx q[13],q[39];
-rz(1.2432835551034862) q[39];
-cx q[13],q[39];
-rx(3.629392455493781) q[39];
-rz(1.2432835551034862) q[40];
-cx q[3],q[40];
-cx q[3],q[42];
-cx q[23],q[40];
-rz(1.2432835551034862) q[40];
-cx q[23],q[40];
-rx(3.629392455493781) q[40];
-rz(1.2432835551034862) q[42];
-cx q[3],q[42];
-cx q[3],q[43];
-rx(3.629392455493781) q[42];
-rz(1.2432835551034862) q[43];
-cx q[3],q[43];
-cx q[3],q[44];
-cx q[20],q[43];
-rz(1.2432835551034862) q[43];
-cx q[20],q[43];
-rx(3.629392455493781) q[20];
-rx(3.629392455493781) q[43];
-rz(1.2432835551034862) q[44];
-cx q[3],q[44];
-cx q[3],q[49];
-cx q[12],q[44];
-rz(1.2432835551034862) q[44];
-cx q[12],q[44];
-rx(3.629392455493781) q[44];
-rz(1.2432835551034862) q[45];
-cx q[1],q[45];
-cx q[1],q[57];
-cx q[16],q[45];
-rz(1.2432835551034862) q[45];
-cx q[16],q[45];
-cx q[16],q[59];
-rz(1.2432835551034862) q[46];
-cx q[5],q[46];
-cx q[5],q[65];
-cx q[38],q[46];
-rz(1.2432835551034862) q[46];
-cx q[38],q[46];
-rx(3.629392455493781) q[38];
-rx(3.629392455493781) q[46];
-cx q[47],q[66];
-rz(1.2432835551034862) q[48];
-cx q[30],q[48];
-rx(3.629392455493781) q[30];
-rx(3.629392455493781) q[48];
-rz(1.2432835551034862) q[49];
-cx q[3],q[49];
-cx q[3],q[50];
-rz(1.2432835551034862) q[50];
-cx q[3],q[50];
-cx q[3],q[52];
-cx q[12],q[50];
-rz(1.2432835551034862) q[50];
-cx q[12],q[50];
-cx q[12],q[63];
-rx(3.629392455493781) q[50];
-rz(1.2432835551034862) q[51];
-cx q[28],q[51];
-rx(3.629392455493781) q[51];
-rz(1.2432835551034862) q[52];
-cx q[3],q[52];
-rz(1.2432835551034862) q[54];
-cx q[24],q[54];
-cx q[24],q[58];
-cx q[28],q[54];
-rz(1.2432835551034862) q[54];
-cx q[28],q[54];
-rx(3.629392455493781) q[54];
-rz(1.2432835551034862) q[55];
-cx q[9],q[55];
-rx(3.629392455493781) q[9];
-cx q[15],q[55];
-rz(1.2432835551034862) q[55];
-cx q[15],q[55];
-rx(3.629392455493781) q[15];
-rx(3.629392455493781) q[55];
-rz(1.2432835551034862) q[57];
-cx q[1],q[57];
-cx q[1],q[60];
-cx q[3],q[57];
-rz(1.2432835551034862) q[57];
-cx q[3],q[57];
-rx(3.629392455493781) q[3];
-rx(3.629392455493781) q[57];
-rz(1.2432835551034862) q[58];
-cx q[24],q[58];
-rx(3.629392455493781) q[24];
-cx q[28],q[58];
-rz(1.2432835551034862) q[58];
-cx q[28],q[58];
-rx(3.629392455493781) q[28];
-rx(3.629392455493781) q[58];
-rz(1.2432835551034862) q[59];
-cx q[16],q[59];
-rx(3.629392455493781) q[16];
-cx q[32],q[59];
-rz(1.2432835551034862) q[59];
-cx q[32],q[59];
-rx(3.629392455493781) q[32];
-rx(3.629392455493781) q[59];
-rz(1.2432835551034862) q[60];
-cx q[1],q[60];
-rx(3.629392455493781) q[1];
-cx q[0],q[1];
-rz(5.359759356886408) q[1];
-cx q[0],q[1];
-cx q[0],q[2];
-rz(5.359759356886408) q[2];
-cx q[0],q[2];
-cx q[0],q[3];
-rx(4.86550571915007) q[2];
-rz(5.359759356886408) q[3];
-cx q[0],q[3];
-cx q[0],q[15];
-cx q[1],q[3];
-rz(5.359759356886408) q[3];
-cx q[1],q[3];
-cx q[7],q[60];
-rz(5.359759356886408) q[15];
-cx q[0],q[15];
-cx q[0],q[16];
-rz(5.359759356886408) q[16];
-cx q[0],q[16];
-cx q[0],q[20];
-rz(5.359759356886408) q[20];
-cx q[0],q[20];
-cx q[0],q[32];
-rz(5.359759356886408) q[32];
-cx q[0],q[32];
-cx q[0],q[42];
-rz(5.359759356886408) q[42];
-cx q[0],q[42];
-cx q[0],q[48];
-rz(5.359759356886408) q[48];
-cx q[0],q[48];
-cx q[0],q[51];
-rz(5.359759356886408) q[51];
-cx q[0],q[51];
-rz(1.2432835551034862) q[60];
-cx q[7],q[60];
-rx(3.629392455493781) q[60];
-rz(1.2432835551034862) q[63];
-cx q[12],q[63];
-rx(3.629392455493781) q[12];
-rz(1.2432835551034862) q[65];
-cx q[5],q[65];
-rx(3.629392455493781) q[5];
-cx q[23],q[65];
-rz(1.2432835551034862) q[65];
-cx q[23],q[65];
-rx(3.629392455493781) q[23];
-rx(3.629392455493781) q[65];
-rz(5.520826239102277) q[66];
-cx q[47],q[66];
-rx(11.731533223806276) q[47];
-cx q[4],q[47];
-rz(1.2432835551034862) q[47];
-cx q[4],q[47];
-cx q[4],q[49];
-cx q[17],q[47];
-rz(1.2432835551034862) q[47];
-cx q[17],q[47];
-cx q[17],q[53];
-rz(1.2432835551034862) q[49];
-cx q[4],q[49];
-cx q[4],q[61];
-rx(3.629392455493781) q[49];
-rz(1.2432835551034862) q[53];
-cx q[17],q[53];
-cx q[17],q[62];
-cx q[21],q[53];
-rz(1.2432835551034862) q[53];
-cx q[21],q[53];
-rx(3.629392455493781) q[21];
-rx(3.629392455493781) q[53];
-rz(1.2432835551034862) q[61];
-cx q[4],q[61];
-rx(3.629392455493781) q[4];
-cx q[1],q[4];
-rz(5.359759356886408) q[4];
-cx q[1],q[4];
-cx q[1],q[5];
-cx q[3],q[4];
-rz(5.359759356886408) q[4];
-cx q[3],q[4];
-cx q[4],q[6];
-rz(5.359759356886408) q[5];
-cx q[1],q[5];
-cx q[1],q[9];
-cx q[3],q[5];
-rz(5.359759356886408) q[5];
-cx q[3],q[5];
-rz(5.359759356886408) q[6];
-cx q[4],q[6];
-cx q[5],q[6];
-rz(5.359759356886408) q[6];
-cx q[5],q[6];
-cx q[7],q[61];
-rz(5.359759356886408) q[9];
-cx q[1],q[9];
-rz(1.2432835551034862) q[61];
-cx q[7],q[61];
-rx(3.629392455493781) q[7];
-cx q[3],q[7];
-rz(5.359759356886408) q[7];
-cx q[3],q[7];
-cx q[3],q[8];
-cx q[4],q[7];
-rz(5.359759356886408) q[7];
-cx q[4],q[7];
-rz(5.359759356886408) q[8];
-cx q[3],q[8];
-cx q[3],q[9];
-cx q[5],q[8];
-rz(5.359759356886408) q[8];
-cx q[5],q[8];
-cx q[5],q[11];
-rx(4.86550571915007) q[8];
-rz(5.359759356886408) q[9];
-cx q[3],q[9];
-cx q[3],q[12];
-rz(5.359759356886408) q[11];
-cx q[5],q[11];
-rz(5.359759356886408) q[12];
-cx q[3],q[12];
-cx q[3],q[14];
-cx q[5],q[12];
-rz(5.359759356886408) q[12];
-cx q[5],q[12];
-rz(5.359759356886408) q[14];
-cx q[3],q[14];
-cx q[3],q[15];
-rz(5.359759356886408) q[15];
-cx q[3],q[15];
-cx q[3],q[16];
-cx q[15],q[20];
-rz(5.359759356886408) q[16];
-cx q[3],q[16];
-rz(5.359759356886408) q[20];
-cx q[15],q[20];
-rx(3.629392455493781) q[61];
-rz(1.2432835551034862) q[62];
-cx q[17],q[62];
-cx q[17],q[63];
-rx(3.629392455493781) q[62];
-cx q[0],q[62];
-rz(5.359759356886408) q[62];
-cx q[0],q[62];
-rz(1.2432835551034862) q[63];
-cx q[17],q[63];
-rx(3.629392455493781) q[63];
-rx(11.731533223806276) q[66];
-cx q[17],q[66];
-rz(1.2432835551034862) q[66];
-cx q[17],q[66];
-rx(3.629392455493781) q[17];
-cx q[1],q[17];
-rz(5.359759356886408) q[17];
-cx q[1],q[17];
-cx q[1],q[28];
-cx q[3],q[17];
-rz(5.359759356886408) q[17];
-cx q[3],q[17];
-cx q[3],q[18];
-rz(5.359759356886408) q[18];
-cx q[3],q[18];
-cx q[3],q[19];
-rz(5.359759356886408) q[19];
-cx q[3],q[19];
-cx q[3],q[22];
-cx q[7],q[19];
-rz(5.359759356886408) q[19];
-cx q[7],q[19];
-cx q[19],q[38];
-rz(5.359759356886408) q[22];
-cx q[3],q[22];
-cx q[3],q[23];
-cx q[9],q[22];
-rz(5.359759356886408) q[22];
-cx q[9],q[22];
-cx q[9],q[55];
-rx(4.86550571915007) q[22];
-rz(5.359759356886408) q[23];
-cx q[3],q[23];
-cx q[3],q[24];
-cx q[17],q[23];
-rz(5.359759356886408) q[23];
-cx q[17],q[23];
-rz(5.359759356886408) q[24];
-cx q[3],q[24];
-cx q[3],q[25];
-rz(5.359759356886408) q[25];
-cx q[3],q[25];
-cx q[3],q[26];
-cx q[12],q[25];
-rz(5.359759356886408) q[25];
-cx q[12],q[25];
-cx q[12],q[31];
-rx(4.86550571915007) q[25];
-rz(5.359759356886408) q[26];
-cx q[3],q[26];
-rz(5.359759356886408) q[28];
-cx q[1],q[28];
-cx q[1],q[29];
-cx q[3],q[28];
-rz(5.359759356886408) q[28];
-cx q[3],q[28];
-cx q[28],q[51];
-rz(5.359759356886408) q[29];
-cx q[1],q[29];
-cx q[3],q[29];
-rz(5.359759356886408) q[29];
-cx q[3],q[29];
-cx q[3],q[30];
-rx(4.86550571915007) q[29];
-rz(5.359759356886408) q[30];
-cx q[3],q[30];
-cx q[3],q[34];
-rz(5.359759356886408) q[31];
-cx q[12],q[31];
-rz(5.359759356886408) q[34];
-cx q[3],q[34];
-cx q[3],q[35];
-cx q[12],q[34];
-rz(5.359759356886408) q[34];
-cx q[12],q[34];
-rz(5.359759356886408) q[35];
-cx q[3],q[35];
-cx q[3],q[39];
-rz(5.359759356886408) q[38];
-cx q[19],q[38];
-rx(4.86550571915007) q[19];
-rz(5.359759356886408) q[39];
-cx q[3],q[39];
-cx q[3],q[40];
-rz(5.359759356886408) q[40];
-cx q[3],q[40];
-cx q[3],q[42];
-cx q[23],q[40];
-rz(5.359759356886408) q[40];
-cx q[23],q[40];
-rx(4.86550571915007) q[40];
-rz(5.359759356886408) q[42];
-cx q[3],q[42];
-cx q[3],q[43];
-rx(4.86550571915007) q[42];
-rz(5.359759356886408) q[43];
-cx q[3],q[43];
-cx q[3],q[44];
-rz(5.359759356886408) q[44];
-cx q[3],q[44];
-cx q[3],q[49];
-cx q[12],q[44];
-rz(5.359759356886408) q[44];
-cx q[12],q[44];
-rx(4.86550571915007) q[44];
-cx q[47],q[66];
-rz(5.359759356886408) q[49];
-cx q[3],q[49];
-cx q[3],q[50];
-rz(5.359759356886408) q[50];
-cx q[3],q[50];
-cx q[12],q[50];
-rz(5.359759356886408) q[50];
-cx q[12],q[50];
-cx q[12],q[63];
-rx(4.86550571915007) q[50];
-rz(5.359759356886408) q[51];
-cx q[28],q[51];
-rx(4.86550571915007) q[51];
-rz(5.359759356886408) q[55];
-cx q[9],q[55];
-rx(4.86550571915007) q[9];
-rz(5.359759356886408) q[63];
-cx q[12],q[63];
-rx(4.86550571915007) q[12];
-rz(1.2432835551034862) q[66];
-cx q[47],q[66];
-rx(3.629392455493781) q[47];
-rx(3.629392455493781) q[66];
-ry(pi/2) q[67];
-rx(pi) q[67];
-cx q[41],q[67];
-rz(5.520826239102277) q[67];
-cx q[41],q[67];
-rx(11.731533223806276) q[41];
-cx q[10],q[41];
-rz(1.2432835551034862) q[41];
-cx q[10],q[41];
-cx q[10],q[52];
-cx q[27],q[41];
-rz(1.2432835551034862) q[41];
-cx q[27],q[41];
-rx(3.629392455493781) q[27];
-rz(1.2432835551034862) q[52];
-cx q[10],q[52];
-cx q[10],q[64];
-rx(3.629392455493781) q[52];
-cx q[3],q[52];
-rz(5.359759356886408) q[52];
-cx q[3],q[52];
-cx q[56],q[67];
-rz(1.2432835551034862) q[64];
-cx q[10],q[64];
-rx(3.629392455493781) q[10];
-cx q[4],q[10];
-rz(5.359759356886408) q[10];
-cx q[4],q[10];
-cx q[6],q[10];
-rz(5.359759356886408) q[10];
-cx q[6],q[10];
-cx q[6],q[11];
-cx q[10],q[37];
-rz(5.359759356886408) q[11];
-cx q[6],q[11];
-rx(4.86550571915007) q[11];
-rz(5.359759356886408) q[37];
-cx q[10],q[37];
-cx q[34],q[37];
-rz(5.359759356886408) q[37];
-cx q[34],q[37];
-rx(4.86550571915007) q[34];
-rx(4.86550571915007) q[37];
-rx(3.629392455493781) q[64];
-cx q[0],q[64];
-rz(5.359759356886408) q[64];
-cx q[0],q[64];
-rx(4.86550571915007) q[0];
-rz(5.520826239102277) q[67];
-cx q[56],q[67];
-rx(11.731533223806276) q[56];
-cx q[13],q[56];
-rz(1.2432835551034862) q[56];
-cx q[13],q[56];
-rx(3.629392455493781) q[13];
-cx q[4],q[13];
-rz(5.359759356886408) q[13];
-cx q[4],q[13];
-cx q[4],q[14];
-cx q[5],q[13];
-rz(5.359759356886408) q[13];
-cx q[5],q[13];
-cx q[5],q[24];
-cx q[13],q[39];
-rz(5.359759356886408) q[14];
-cx q[4],q[14];
-cx q[4],q[18];
-rx(4.86550571915007) q[14];
-rz(5.359759356886408) q[18];
-cx q[4],q[18];
-cx q[4],q[21];
-cx q[18],q[30];
-rz(5.359759356886408) q[21];
-cx q[4],q[21];
-cx q[4],q[27];
-cx q[15],q[21];
-rz(5.359759356886408) q[21];
-cx q[15],q[21];
-cx q[15],q[36];
-cx q[21],q[26];
-rz(5.359759356886408) q[24];
-cx q[5],q[24];
-cx q[5],q[33];
-cx q[24],q[54];
-rz(5.359759356886408) q[26];
-cx q[21],q[26];
-cx q[21],q[32];
-cx q[26],q[31];
-rz(5.359759356886408) q[27];
-cx q[4],q[27];
-cx q[4],q[47];
-cx q[6],q[27];
-rz(5.359759356886408) q[27];
-cx q[6],q[27];
-rx(4.86550571915007) q[6];
-rz(5.359759356886408) q[30];
-cx q[18],q[30];
-rx(4.86550571915007) q[18];
-rz(5.359759356886408) q[31];
-cx q[26],q[31];
-rx(4.86550571915007) q[26];
-rx(4.86550571915007) q[31];
-rz(5.359759356886408) q[32];
-cx q[21],q[32];
-cx q[21],q[38];
-cx q[32],q[35];
-rz(5.359759356886408) q[33];
-cx q[5],q[33];
-cx q[5],q[46];
-cx q[30],q[33];
-rz(5.359759356886408) q[33];
-cx q[30],q[33];
-cx q[30],q[48];
-rx(4.86550571915007) q[33];
-rz(5.359759356886408) q[35];
-cx q[32],q[35];
-rx(4.86550571915007) q[35];
-rz(5.359759356886408) q[36];
-cx q[15],q[36];
-cx q[15],q[55];
-cx q[20],q[36];
-rz(5.359759356886408) q[36];
-cx q[20],q[36];
-cx q[20],q[43];
-rx(4.86550571915007) q[36];
-rz(5.359759356886408) q[38];
-cx q[21],q[38];
-rz(5.359759356886408) q[39];
-cx q[13],q[39];
-rx(4.86550571915007) q[39];
-rz(5.359759356886408) q[43];
-cx q[20],q[43];
-rx(4.86550571915007) q[20];
-rx(4.86550571915007) q[43];
-cx q[45],q[56];
-rz(5.359759356886408) q[46];
-cx q[5],q[46];
-cx q[5],q[65];
-cx q[38],q[46];
-rz(5.359759356886408) q[46];
-cx q[38],q[46];
-rx(4.86550571915007) q[38];
-rx(4.86550571915007) q[46];
-rz(5.359759356886408) q[47];
-cx q[4],q[47];
-cx q[4],q[49];
-cx q[17],q[47];
-rz(5.359759356886408) q[47];
-cx q[17],q[47];
-cx q[17],q[53];
-rz(5.359759356886408) q[48];
-cx q[30],q[48];
-rx(4.86550571915007) q[30];
-rx(4.86550571915007) q[48];
-rz(5.359759356886408) q[49];
-cx q[4],q[49];
-cx q[4],q[61];
-rx(4.86550571915007) q[49];
-rz(5.359759356886408) q[53];
-cx q[17],q[53];
-cx q[17],q[62];
-cx q[21],q[53];
-rz(5.359759356886408) q[53];
-cx q[21],q[53];
-rx(4.86550571915007) q[21];
-rx(4.86550571915007) q[53];
-rz(5.359759356886408) q[54];
-cx q[24],q[54];
-cx q[24],q[58];
-cx q[28],q[54];
-rz(5.359759356886408) q[54];
-cx q[28],q[54];
-rx(4.86550571915007) q[54];
-rz(5.359759356886408) q[55];
-cx q[15],q[55];
-rx(4.86550571915007) q[15];
-rx(4.86550571915007) q[55];
-rz(1.2432835551034862) q[56];
-cx q[45],q[56];
-rx(3.629392455493781) q[45];
-cx q[1],q[45];
-rz(5.359759356886408) q[45];
-cx q[1],q[45];
-cx q[1],q[57];
-cx q[16],q[45];
-rz(5.359759356886408) q[45];
-cx q[16],q[45];
-cx q[16],q[59];
-rz(5.359759356886408) q[57];
-cx q[1],q[57];
-cx q[1],q[60];
-cx q[3],q[57];
-rz(5.359759356886408) q[57];
-cx q[3],q[57];
-rx(4.86550571915007) q[3];
-rx(4.86550571915007) q[57];
-rz(5.359759356886408) q[58];
-cx q[24],q[58];
-rx(4.86550571915007) q[24];
-cx q[28],q[58];
-rz(5.359759356886408) q[58];
-cx q[28],q[58];
-rx(4.86550571915007) q[28];
-rx(4.86550571915007) q[58];
-rz(5.359759356886408) q[59];
-cx q[16],q[59];
-rx(4.86550571915007) q[16];
-cx q[32],q[59];
-rz(5.359759356886408) q[59];
-cx q[32],q[59];
-rx(4.86550571915007) q[32];
-rx(4.86550571915007) q[59];
-rz(5.359759356886408) q[60];
-cx q[1],q[60];
-rx(4.86550571915007) q[1];
-cx q[7],q[60];
-rz(5.359759356886408) q[60];
-cx q[7],q[60];
-rx(4.86550571915007) q[60];
-rz(5.359759356886408) q[61];
-cx q[4],q[61];
-rx(4.86550571915007) q[4];
-cx q[7],q[61];
-rz(5.359759356886408) q[61];
-cx q[7],q[61];
-rx(4.86550571915007) q[7];
-rx(4.86550571915007) q[61];
-rz(5.359759356886408) q[62];
-cx q[17],q[62];
-cx q[17],q[63];
-rx(4.86550571915007) q[62];
-rz(5.359759356886408) q[63];
-cx q[17],q[63];
-cx q[17],q[66];
-rx(4.86550571915007) q[63];
-rz(5.359759356886408) q[65];
-cx q[5],q[65];
-rx(4.86550571915007) q[5];
-cx q[23],q[65];
-rz(5.359759356886408) q[65];
-cx q[23],q[65];
-rx(4.86550571915007) q[23];
-rx(4.86550571915007) q[65];
-rz(5.359759356886408) q[66];
-cx q[17],q[66];
-rx(4.86550571915007) q[17];
-cx q[47],q[66];
-rz(5.359759356886408) q[66];
-cx q[47],q[66];
-rx(4.86550571915007) q[47];
-rx(4.86550571915007) q[66];
-rx(11.731533223806276) q[67];
-cx q[41],q[67];
-rz(1.2432835551034862) q[67];
-cx q[41],q[67];
-rx(3.629392455493781) q[41];
-cx q[10],q[41];
-rz(5.359759356886408) q[41];
-cx q[10],q[41];
-cx q[10],q[52];
-cx q[27],q[41];
-rz(5.359759356886408) q[41];
-cx q[27],q[41];
-rx(4.86550571915007) q[27];
-rz(5.359759356886408) q[52];
-cx q[10],q[52];
-cx q[10],q[64];
-rx(4.86550571915007) q[52];
-cx q[56],q[67];
-rz(5.359759356886408) q[64];
-cx q[10],q[64];
-rx(4.86550571915007) q[10];
-rx(4.86550571915007) q[64];
-rz(1.2432835551034862) q[67];
-cx q[56],q[67];
-rx(3.629392455493781) q[56];
-cx q[13],q[56];
-rz(5.359759356886408) q[56];
-cx q[13],q[56];
-rx(4.86550571915007) q[13];
-cx q[45],q[56];
-rz(5.359759356886408) q[56];
-cx q[45],q[56];
-rx(4.86550571915007) q[45];
-rx(3.629392455493781) q[67];
-cx q[41],q[67];
-rz(5.359759356886408) q[67];
-cx q[41],q[67];
-rx(4.86550571915007) q[41];
-cx q[56],q[67];
-rz(5.359759356886408) q[67];
-cx q[56],q[67];
-rx(4.86550571915007) q[56];
-rx(4.86550571915007) q[67];
\ No newline at end of file
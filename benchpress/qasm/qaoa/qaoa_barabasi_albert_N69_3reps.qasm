@@ -1,1554 +0,0 @@
-OPENQASM 2.0;
-include "qelib1.inc";
-qreg q[69];
-ry(pi/2) q[0];
-rx(pi) q[0];
-ry(pi/2) q[1];
-rx(pi) q[1];
-cx q[0],q[1];
-rz(5.582848795151529) q[1];
-cx q[0],q[1];
-ry(pi/2) q[2];
-rx(pi) q[2];
-cx q[0],q[2];
-rz(5.582848795151529) q[2];
-cx q[0],q[2];
-rx(11.450693178397591) q[2];
-ry(pi/2) q[3];
-rx(pi) q[3];
-cx q[0],q[3];
-rz(5.582848795151529) q[3];
-cx q[0],q[3];
-cx q[1],q[3];
-rz(5.582848795151529) q[3];
-cx q[1],q[3];
-ry(pi/2) q[4];
-rx(pi) q[4];
-cx q[1],q[4];
-rz(5.582848795151529) q[4];
-cx q[1],q[4];
-cx q[3],q[4];
-rz(5.582848795151529) q[4];
-cx q[3],q[4];
-ry(pi/2) q[5];
-rx(pi) q[5];
-cx q[1],q[5];
-rz(5.582848795151529) q[5];
-cx q[1],q[5];
-cx q[3],q[5];
-rz(5.582848795151529) q[5];
-cx q[3],q[5];
-ry(pi/2) q[6];
-rx(pi) q[6];
-cx q[4],q[6];
-rz(5.582848795151529) q[6];
-cx q[4],q[6];
-cx q[5],q[6];
-rz(5.582848795151529) q[6];
-cx q[5],q[6];
-ry(pi/2) q[7];
-rx(pi) q[7];
-cx q[3],q[7];
-rz(5.582848795151529) q[7];
-cx q[3],q[7];
-cx q[4],q[7];
-rz(5.582848795151529) q[7];
-cx q[4],q[7];
-ry(pi/2) q[8];
-rx(pi) q[8];
-cx q[3],q[8];
-rz(5.582848795151529) q[8];
-cx q[3],q[8];
-cx q[5],q[8];
-rz(5.582848795151529) q[8];
-cx q[5],q[8];
-rx(11.450693178397591) q[8];
-ry(pi/2) q[9];
-rx(pi) q[9];
-cx q[1],q[9];
-rz(5.582848795151529) q[9];
-cx q[1],q[9];
-cx q[3],q[9];
-rz(5.582848795151529) q[9];
-cx q[3],q[9];
-ry(pi/2) q[10];
-rx(pi) q[10];
-cx q[4],q[10];
-rz(5.582848795151529) q[10];
-cx q[4],q[10];
-cx q[6],q[10];
-rz(5.582848795151529) q[10];
-cx q[6],q[10];
-ry(pi/2) q[11];
-rx(pi) q[11];
-cx q[5],q[11];
-rz(5.582848795151529) q[11];
-cx q[5],q[11];
-cx q[6],q[11];
-rz(5.582848795151529) q[11];
-cx q[6],q[11];
-rx(11.450693178397591) q[11];
-ry(pi/2) q[12];
-rx(pi) q[12];
-cx q[3],q[12];
-rz(5.582848795151529) q[12];
-cx q[3],q[12];
-cx q[5],q[12];
-rz(5.582848795151529) q[12];
-cx q[5],q[12];
-ry(pi/2) q[13];
-rx(pi) q[13];
-cx q[4],q[13];
-rz(5.582848795151529) q[13];
-cx q[4],q[13];
-cx q[5],q[13];
-rz(5.582848795151529) q[13];
-cx q[5],q[13];
-ry(pi/2) q[14];
-rx(pi) q[14];
-cx q[3],q[14];
-rz(5.582848795151529) q[14];
-cx q[3],q[14];
-cx q[4],q[14];
-rz(5.582848795151529) q[14];
-cx q[4],q[14];
-rx(11.450693178397591) q[14];
-ry(pi/2) q[15];
-rx(pi) q[15];
-cx q[0],q[15];
-rz(5.582848795151529) q[15];
-cx q[0],q[15];
-cx q[3],q[15];
-rz(5.582848795151529) q[15];
-cx q[3],q[15];
-ry(pi/2) q[16];
-rx(pi) q[16];
-cx q[0],q[16];
-rz(5.582848795151529) q[16];
-cx q[0],q[16];
-cx q[3],q[16];
-rz(5.582848795151529) q[16];
-cx q[3],q[16];
-ry(pi/2) q[17];
-rx(pi) q[17];
-cx q[1],q[17];
-rz(5.582848795151529) q[17];
-cx q[1],q[17];
-cx q[3],q[17];
-rz(5.582848795151529) q[17];
-cx q[3],q[17];
-ry(pi/2) q[18];
-rx(pi) q[18];
-cx q[3],q[18];
-rz(5.582848795151529) q[18];
-cx q[3],q[18];
-cx q[4],q[18];
-rz(5.582848795151529) q[18];
-cx q[4],q[18];
-ry(pi/2) q[19];
-rx(pi) q[19];
-cx q[3],q[19];
-rz(5.582848795151529) q[19];
-cx q[3],q[19];
-cx q[7],q[19];
-rz(5.582848795151529) q[19];
-cx q[7],q[19];
-ry(pi/2) q[20];
-rx(pi) q[20];
-cx q[0],q[20];
-rz(5.582848795151529) q[20];
-cx q[0],q[20];
-cx q[15],q[20];
-rz(5.582848795151529) q[20];
-cx q[15],q[20];
-ry(pi/2) q[21];
-rx(pi) q[21];
-cx q[4],q[21];
-rz(5.582848795151529) q[21];
-cx q[4],q[21];
-cx q[15],q[21];
-rz(5.582848795151529) q[21];
-cx q[15],q[21];
-ry(pi/2) q[22];
-rx(pi) q[22];
-cx q[3],q[22];
-rz(5.582848795151529) q[22];
-cx q[3],q[22];
-cx q[9],q[22];
-rz(5.582848795151529) q[22];
-cx q[9],q[22];
-rx(11.450693178397591) q[22];
-ry(pi/2) q[23];
-rx(pi) q[23];
-cx q[3],q[23];
-rz(5.582848795151529) q[23];
-cx q[3],q[23];
-cx q[17],q[23];
-rz(5.582848795151529) q[23];
-cx q[17],q[23];
-ry(pi/2) q[24];
-rx(pi) q[24];
-cx q[3],q[24];
-rz(5.582848795151529) q[24];
-cx q[3],q[24];
-cx q[5],q[24];
-rz(5.582848795151529) q[24];
-cx q[5],q[24];
-ry(pi/2) q[25];
-rx(pi) q[25];
-cx q[3],q[25];
-rz(5.582848795151529) q[25];
-cx q[3],q[25];
-cx q[12],q[25];
-rz(5.582848795151529) q[25];
-cx q[12],q[25];
-rx(11.450693178397591) q[25];
-ry(pi/2) q[26];
-rx(pi) q[26];
-cx q[3],q[26];
-rz(5.582848795151529) q[26];
-cx q[3],q[26];
-cx q[21],q[26];
-rz(5.582848795151529) q[26];
-cx q[21],q[26];
-ry(pi/2) q[27];
-rx(pi) q[27];
-cx q[4],q[27];
-rz(5.582848795151529) q[27];
-cx q[4],q[27];
-cx q[6],q[27];
-rz(5.582848795151529) q[27];
-cx q[6],q[27];
-rx(11.450693178397591) q[6];
-ry(pi/2) q[28];
-rx(pi) q[28];
-cx q[1],q[28];
-rz(5.582848795151529) q[28];
-cx q[1],q[28];
-cx q[3],q[28];
-rz(5.582848795151529) q[28];
-cx q[3],q[28];
-ry(pi/2) q[29];
-rx(pi) q[29];
-cx q[1],q[29];
-rz(5.582848795151529) q[29];
-cx q[1],q[29];
-cx q[3],q[29];
-rz(5.582848795151529) q[29];
-cx q[3],q[29];
-rx(11.450693178397591) q[29];
-ry(pi/2) q[30];
-rx(pi) q[30];
-cx q[3],q[30];
-rz(5.582848795151529) q[30];
-cx q[3],q[30];
-cx q[18],q[30];
-rz(5.582848795151529) q[30];
-cx q[18],q[30];
-rx(11.450693178397591) q[18];
-ry(pi/2) q[31];
-rx(pi) q[31];
-cx q[12],q[31];
-rz(5.582848795151529) q[31];
-cx q[12],q[31];
-cx q[26],q[31];
-rz(5.582848795151529) q[31];
-cx q[26],q[31];
-rx(11.450693178397591) q[26];
-rx(11.450693178397591) q[31];
-ry(pi/2) q[32];
-rx(pi) q[32];
-cx q[0],q[32];
-rz(5.582848795151529) q[32];
-cx q[0],q[32];
-cx q[21],q[32];
-rz(5.582848795151529) q[32];
-cx q[21],q[32];
-ry(pi/2) q[33];
-rx(pi) q[33];
-cx q[5],q[33];
-rz(5.582848795151529) q[33];
-cx q[5],q[33];
-cx q[30],q[33];
-rz(5.582848795151529) q[33];
-cx q[30],q[33];
-rx(11.450693178397591) q[33];
-ry(pi/2) q[34];
-rx(pi) q[34];
-cx q[3],q[34];
-rz(5.582848795151529) q[34];
-cx q[3],q[34];
-cx q[12],q[34];
-rz(5.582848795151529) q[34];
-cx q[12],q[34];
-ry(pi/2) q[35];
-rx(pi) q[35];
-cx q[3],q[35];
-rz(5.582848795151529) q[35];
-cx q[3],q[35];
-cx q[32],q[35];
-rz(5.582848795151529) q[35];
-cx q[32],q[35];
-rx(11.450693178397591) q[35];
-ry(pi/2) q[36];
-rx(pi) q[36];
-cx q[15],q[36];
-rz(5.582848795151529) q[36];
-cx q[15],q[36];
-cx q[20],q[36];
-rz(5.582848795151529) q[36];
-cx q[20],q[36];
-rx(11.450693178397591) q[36];
-ry(pi/2) q[37];
-rx(pi) q[37];
-cx q[10],q[37];
-rz(5.582848795151529) q[37];
-cx q[10],q[37];
-cx q[34],q[37];
-rz(5.582848795151529) q[37];
-cx q[34],q[37];
-rx(11.450693178397591) q[34];
-rx(11.450693178397591) q[37];
-ry(pi/2) q[38];
-rx(pi) q[38];
-cx q[19],q[38];
-rz(5.582848795151529) q[38];
-cx q[19],q[38];
-rx(11.450693178397591) q[19];
-cx q[21],q[38];
-rz(5.582848795151529) q[38];
-cx q[21],q[38];
-ry(pi/2) q[39];
-rx(pi) q[39];
-cx q[3],q[39];
-rz(5.582848795151529) q[39];
-cx q[3],q[39];
-cx q[13],q[39];
-rz(5.582848795151529) q[39];
-cx q[13],q[39];
-rx(11.450693178397591) q[39];
-ry(pi/2) q[40];
-rx(pi) q[40];
-cx q[3],q[40];
-rz(5.582848795151529) q[40];
-cx q[3],q[40];
-cx q[23],q[40];
-rz(5.582848795151529) q[40];
-cx q[23],q[40];
-rx(11.450693178397591) q[40];
-ry(pi/2) q[41];
-rx(pi) q[41];
-cx q[10],q[41];
-rz(5.582848795151529) q[41];
-cx q[10],q[41];
-cx q[27],q[41];
-rz(5.582848795151529) q[41];
-cx q[27],q[41];
-rx(11.450693178397591) q[27];
-ry(pi/2) q[42];
-rx(pi) q[42];
-cx q[0],q[42];
-rz(5.582848795151529) q[42];
-cx q[0],q[42];
-cx q[3],q[42];
-rz(5.582848795151529) q[42];
-cx q[3],q[42];
-rx(11.450693178397591) q[42];
-ry(pi/2) q[43];
-rx(pi) q[43];
-cx q[3],q[43];
-rz(5.582848795151529) q[43];
-cx q[3],q[43];
-cx q[20],q[43];
-rz(5.582848795151529) q[43];
-cx q[20],q[43];
-rx(11.450693178397591) q[20];
-rx(11.450693178397591) q[43];
-ry(pi/2) q[44];
-rx(pi) q[44];
-cx q[3],q[44];
-rz(5.582848795151529) q[44];
-cx q[3],q[44];
-cx q[12],q[44];
-rz(5.582848795151529) q[44];
-cx q[12],q[44];
-rx(11.450693178397591) q[44];
-ry(pi/2) q[45];
-rx(pi) q[45];
-cx q[1],q[45];
-rz(5.582848795151529) q[45];
-cx q[1],q[45];
-cx q[16],q[45];
-rz(5.582848795151529) q[45];
-cx q[16],q[45];
-ry(pi/2) q[46];
-rx(pi) q[46];
-cx q[5],q[46];
-rz(5.582848795151529) q[46];
-cx q[5],q[46];
-cx q[38],q[46];
-rz(5.582848795151529) q[46];
-cx q[38],q[46];
-rx(11.450693178397591) q[38];
-rx(11.450693178397591) q[46];
-ry(pi/2) q[47];
-rx(pi) q[47];
-cx q[4],q[47];
-rz(5.582848795151529) q[47];
-cx q[4],q[47];
-cx q[17],q[47];
-rz(5.582848795151529) q[47];
-cx q[17],q[47];
-ry(pi/2) q[48];
-rx(pi) q[48];
-cx q[0],q[48];
-rz(5.582848795151529) q[48];
-cx q[0],q[48];
-cx q[30],q[48];
-rz(5.582848795151529) q[48];
-cx q[30],q[48];
-rx(11.450693178397591) q[30];
-rx(11.450693178397591) q[48];
-ry(pi/2) q[49];
-rx(pi) q[49];
-cx q[3],q[49];
-rz(5.582848795151529) q[49];
-cx q[3],q[49];
-cx q[4],q[49];
-rz(5.582848795151529) q[49];
-cx q[4],q[49];
-rx(11.450693178397591) q[49];
-ry(pi/2) q[50];
-rx(pi) q[50];
-cx q[3],q[50];
-rz(5.582848795151529) q[50];
-cx q[3],q[50];
-cx q[12],q[50];
-rz(5.582848795151529) q[50];
-cx q[12],q[50];
-rx(11.450693178397591) q[50];
-ry(pi/2) q[51];
-rx(pi) q[51];
-cx q[0],q[51];
-rz(5.582848795151529) q[51];
-cx q[0],q[51];
-cx q[28],q[51];
-rz(5.582848795151529) q[51];
-cx q[28],q[51];
-rx(11.450693178397591) q[51];
-ry(pi/2) q[52];
-rx(pi) q[52];
-cx q[3],q[52];
-rz(5.582848795151529) q[52];
-cx q[3],q[52];
-cx q[10],q[52];
-rz(5.582848795151529) q[52];
-cx q[10],q[52];
-rx(11.450693178397591) q[52];
-ry(pi/2) q[53];
-rx(pi) q[53];
-cx q[17],q[53];
-rz(5.582848795151529) q[53];
-cx q[17],q[53];
-cx q[21],q[53];
-rz(5.582848795151529) q[53];
-cx q[21],q[53];
-rx(11.450693178397591) q[21];
-rx(11.450693178397591) q[53];
-ry(pi/2) q[54];
-rx(pi) q[54];
-cx q[24],q[54];
-rz(5.582848795151529) q[54];
-cx q[24],q[54];
-cx q[28],q[54];
-rz(5.582848795151529) q[54];
-cx q[28],q[54];
-rx(11.450693178397591) q[54];
-ry(pi/2) q[55];
-rx(pi) q[55];
-cx q[9],q[55];
-rz(5.582848795151529) q[55];
-cx q[9],q[55];
-rx(11.450693178397591) q[9];
-cx q[15],q[55];
-rz(5.582848795151529) q[55];
-cx q[15],q[55];
-rx(11.450693178397591) q[15];
-rx(11.450693178397591) q[55];
-ry(pi/2) q[56];
-rx(pi) q[56];
-cx q[13],q[56];
-rz(5.582848795151529) q[56];
-cx q[13],q[56];
-cx q[45],q[56];
-rz(5.582848795151529) q[56];
-cx q[45],q[56];
-rx(11.450693178397591) q[45];
-ry(pi/2) q[57];
-rx(pi) q[57];
-cx q[1],q[57];
-rz(5.582848795151529) q[57];
-cx q[1],q[57];
-cx q[3],q[57];
-rz(5.582848795151529) q[57];
-cx q[3],q[57];
-rx(11.450693178397591) q[3];
-rx(11.450693178397591) q[57];
-ry(pi/2) q[58];
-rx(pi) q[58];
-cx q[24],q[58];
-rz(5.582848795151529) q[58];
-cx q[24],q[58];
-rx(11.450693178397591) q[24];
-cx q[28],q[58];
-rz(5.582848795151529) q[58];
-cx q[28],q[58];
-rx(11.450693178397591) q[28];
-rx(11.450693178397591) q[58];
-ry(pi/2) q[59];
-rx(pi) q[59];
-cx q[16],q[59];
-rz(5.582848795151529) q[59];
-cx q[16],q[59];
-rx(11.450693178397591) q[16];
-cx q[32],q[59];
-rz(5.582848795151529) q[59];
-cx q[32],q[59];
-rx(11.450693178397591) q[59];
-ry(pi/2) q[60];
-rx(pi) q[60];
-cx q[1],q[60];
-rz(5.582848795151529) q[60];
-cx q[1],q[60];
-rx(11.450693178397591) q[1];
-cx q[7],q[60];
-rz(5.582848795151529) q[60];
-cx q[7],q[60];
-rx(11.450693178397591) q[60];
-ry(pi/2) q[61];
-rx(pi) q[61];
-cx q[4],q[61];
-rz(5.582848795151529) q[61];
-cx q[4],q[61];
-rx(11.450693178397591) q[4];
-cx q[7],q[61];
-rz(5.582848795151529) q[61];
-cx q[7],q[61];
-rx(11.450693178397591) q[7];
-rx(11.450693178397591) q[61];
-ry(pi/2) q[62];
-rx(pi) q[62];
-cx q[0],q[62];
-rz(5.582848795151529) q[62];
-cx q[0],q[62];
-cx q[17],q[62];
-rz(5.582848795151529) q[62];
-cx q[17],q[62];
-rx(11.450693178397591) q[62];
-ry(pi/2) q[63];
-rx(pi) q[63];
-cx q[12],q[63];
-rz(5.582848795151529) q[63];
-cx q[12],q[63];
-rx(11.450693178397591) q[12];
-cx q[17],q[63];
-rz(5.582848795151529) q[63];
-cx q[17],q[63];
-rx(11.450693178397591) q[63];
-ry(pi/2) q[64];
-rx(pi) q[64];
-cx q[0],q[64];
-rz(5.582848795151529) q[64];
-cx q[0],q[64];
-rx(11.450693178397591) q[0];
-cx q[0],q[1];
-rz(6.137261617452012) q[1];
-cx q[0],q[1];
-cx q[0],q[2];
-rz(6.137261617452012) q[2];
-cx q[0],q[2];
-cx q[0],q[3];
-rx(11.922691790460021) q[2];
-rz(6.137261617452012) q[3];
-cx q[0],q[3];
-cx q[0],q[15];
-cx q[1],q[3];
-rz(6.137261617452012) q[3];
-cx q[1],q[3];
-cx q[1],q[4];
-rz(6.137261617452012) q[4];
-cx q[1],q[4];
-cx q[3],q[4];
-rz(6.137261617452012) q[4];
-cx q[3],q[4];
-cx q[4],q[6];
-rz(6.137261617452012) q[6];
-cx q[4],q[6];
-cx q[10],q[64];
-rz(6.137261617452012) q[15];
-cx q[0],q[15];
-cx q[0],q[16];
-rz(6.137261617452012) q[16];
-cx q[0],q[16];
-cx q[0],q[20];
-rz(6.137261617452012) q[20];
-cx q[0],q[20];
-rz(5.582848795151529) q[64];
-cx q[10],q[64];
-rx(11.450693178397591) q[10];
-rx(11.450693178397591) q[64];
-ry(pi/2) q[65];
-rx(pi) q[65];
-cx q[5],q[65];
-rz(5.582848795151529) q[65];
-cx q[5],q[65];
-rx(11.450693178397591) q[5];
-cx q[1],q[5];
-rz(6.137261617452012) q[5];
-cx q[1],q[5];
-cx q[1],q[9];
-cx q[3],q[5];
-rz(6.137261617452012) q[5];
-cx q[3],q[5];
-cx q[3],q[7];
-cx q[5],q[6];
-rz(6.137261617452012) q[6];
-cx q[5],q[6];
-rz(6.137261617452012) q[7];
-cx q[3],q[7];
-cx q[3],q[8];
-cx q[4],q[7];
-rz(6.137261617452012) q[7];
-cx q[4],q[7];
-cx q[4],q[10];
-rz(6.137261617452012) q[8];
-cx q[3],q[8];
-cx q[5],q[8];
-rz(6.137261617452012) q[8];
-cx q[5],q[8];
-cx q[5],q[11];
-rx(11.922691790460021) q[8];
-rz(6.137261617452012) q[9];
-cx q[1],q[9];
-cx q[3],q[9];
-rz(6.137261617452012) q[9];
-cx q[3],q[9];
-cx q[3],q[12];
-rz(6.137261617452012) q[10];
-cx q[4],q[10];
-cx q[6],q[10];
-rz(6.137261617452012) q[10];
-cx q[6],q[10];
-cx q[10],q[37];
-rz(6.137261617452012) q[11];
-cx q[5],q[11];
-cx q[6],q[11];
-rz(6.137261617452012) q[11];
-cx q[6],q[11];
-rx(11.922691790460021) q[11];
-rz(6.137261617452012) q[12];
-cx q[3],q[12];
-cx q[3],q[14];
-cx q[5],q[12];
-rz(6.137261617452012) q[12];
-cx q[5],q[12];
-rz(6.137261617452012) q[14];
-cx q[3],q[14];
-cx q[3],q[15];
-rz(6.137261617452012) q[15];
-cx q[3],q[15];
-cx q[3],q[16];
-cx q[15],q[20];
-rz(6.137261617452012) q[16];
-cx q[3],q[16];
-rz(6.137261617452012) q[20];
-cx q[15],q[20];
-cx q[23],q[65];
-rz(6.137261617452012) q[37];
-cx q[10],q[37];
-rz(5.582848795151529) q[65];
-cx q[23],q[65];
-rx(11.450693178397591) q[23];
-rx(11.450693178397591) q[65];
-ry(pi/2) q[66];
-rx(pi) q[66];
-cx q[17],q[66];
-rz(5.582848795151529) q[66];
-cx q[17],q[66];
-rx(11.450693178397591) q[17];
-cx q[1],q[17];
-rz(6.137261617452012) q[17];
-cx q[1],q[17];
-cx q[1],q[28];
-cx q[3],q[17];
-rz(6.137261617452012) q[17];
-cx q[3],q[17];
-cx q[3],q[18];
-rz(6.137261617452012) q[18];
-cx q[3],q[18];
-cx q[3],q[19];
-rz(6.137261617452012) q[19];
-cx q[3],q[19];
-cx q[3],q[22];
-cx q[7],q[19];
-rz(6.137261617452012) q[19];
-cx q[7],q[19];
-cx q[19],q[38];
-rz(6.137261617452012) q[22];
-cx q[3],q[22];
-cx q[3],q[23];
-cx q[9],q[22];
-rz(6.137261617452012) q[22];
-cx q[9],q[22];
-cx q[9],q[55];
-rx(11.922691790460021) q[22];
-rz(6.137261617452012) q[23];
-cx q[3],q[23];
-cx q[3],q[24];
-cx q[17],q[23];
-rz(6.137261617452012) q[23];
-cx q[17],q[23];
-rz(6.137261617452012) q[24];
-cx q[3],q[24];
-cx q[3],q[25];
-rz(6.137261617452012) q[25];
-cx q[3],q[25];
-cx q[3],q[26];
-cx q[12],q[25];
-rz(6.137261617452012) q[25];
-cx q[12],q[25];
-cx q[12],q[31];
-rx(11.922691790460021) q[25];
-rz(6.137261617452012) q[26];
-cx q[3],q[26];
-rz(6.137261617452012) q[28];
-cx q[1],q[28];
-cx q[1],q[29];
-cx q[3],q[28];
-rz(6.137261617452012) q[28];
-cx q[3],q[28];
-rz(6.137261617452012) q[29];
-cx q[1],q[29];
-cx q[1],q[45];
-cx q[3],q[29];
-rz(6.137261617452012) q[29];
-cx q[3],q[29];
-cx q[3],q[30];
-rx(11.922691790460021) q[29];
-rz(6.137261617452012) q[30];
-cx q[3],q[30];
-cx q[3],q[34];
-rz(6.137261617452012) q[31];
-cx q[12],q[31];
-rz(6.137261617452012) q[34];
-cx q[3],q[34];
-cx q[3],q[35];
-cx q[12],q[34];
-rz(6.137261617452012) q[34];
-cx q[12],q[34];
-cx q[34],q[37];
-rz(6.137261617452012) q[35];
-cx q[3],q[35];
-cx q[3],q[39];
-rz(6.137261617452012) q[37];
-cx q[34],q[37];
-rx(11.922691790460021) q[34];
-rx(11.922691790460021) q[37];
-rz(6.137261617452012) q[38];
-cx q[19],q[38];
-rx(11.922691790460021) q[19];
-rz(6.137261617452012) q[39];
-cx q[3],q[39];
-cx q[3],q[40];
-rz(6.137261617452012) q[40];
-cx q[3],q[40];
-cx q[23],q[40];
-rz(6.137261617452012) q[40];
-cx q[23],q[40];
-rx(11.922691790460021) q[40];
-rz(6.137261617452012) q[45];
-cx q[1],q[45];
-cx q[1],q[57];
-cx q[16],q[45];
-rz(6.137261617452012) q[45];
-cx q[16],q[45];
-cx q[16],q[59];
-cx q[47],q[66];
-rz(6.137261617452012) q[55];
-cx q[9],q[55];
-rx(11.922691790460021) q[9];
-rz(6.137261617452012) q[57];
-cx q[1],q[57];
-cx q[1],q[60];
-rz(6.137261617452012) q[59];
-cx q[16],q[59];
-rx(11.922691790460021) q[16];
-rz(6.137261617452012) q[60];
-cx q[1],q[60];
-rx(11.922691790460021) q[1];
-cx q[7],q[60];
-rz(6.137261617452012) q[60];
-cx q[7],q[60];
-rx(11.922691790460021) q[60];
-rz(5.582848795151529) q[66];
-cx q[47],q[66];
-rx(11.450693178397591) q[47];
-rx(11.450693178397591) q[66];
-ry(pi/2) q[67];
-rx(pi) q[67];
-cx q[41],q[67];
-rz(5.582848795151529) q[67];
-cx q[41],q[67];
-rx(11.450693178397591) q[41];
-cx q[10],q[41];
-rz(6.137261617452012) q[41];
-cx q[10],q[41];
-cx q[56],q[67];
-rz(5.582848795151529) q[67];
-cx q[56],q[67];
-rx(11.450693178397591) q[56];
-rx(11.450693178397591) q[67];
-ry(pi/2) q[68];
-rx(pi) q[68];
-cx q[13],q[68];
-rz(5.582848795151529) q[68];
-cx q[13],q[68];
-rx(11.450693178397591) q[13];
-cx q[4],q[13];
-rz(6.137261617452012) q[13];
-cx q[4],q[13];
-cx q[4],q[14];
-cx q[5],q[13];
-rz(6.137261617452012) q[13];
-cx q[5],q[13];
-cx q[5],q[24];
-cx q[13],q[39];
-rz(6.137261617452012) q[14];
-cx q[4],q[14];
-cx q[4],q[18];
-rx(11.922691790460021) q[14];
-rz(6.137261617452012) q[18];
-cx q[4],q[18];
-cx q[4],q[21];
-cx q[18],q[30];
-rz(6.137261617452012) q[21];
-cx q[4],q[21];
-cx q[4],q[27];
-cx q[15],q[21];
-rz(6.137261617452012) q[21];
-cx q[15],q[21];
-cx q[15],q[36];
-cx q[21],q[26];
-rz(6.137261617452012) q[24];
-cx q[5],q[24];
-cx q[5],q[33];
-cx q[24],q[54];
-rz(6.137261617452012) q[26];
-cx q[21],q[26];
-cx q[26],q[31];
-rz(6.137261617452012) q[27];
-cx q[4],q[27];
-cx q[4],q[47];
-cx q[6],q[27];
-rz(6.137261617452012) q[27];
-cx q[6],q[27];
-rx(11.922691790460021) q[6];
-cx q[27],q[41];
-rz(6.137261617452012) q[30];
-cx q[18],q[30];
-rx(11.922691790460021) q[18];
-rz(6.137261617452012) q[31];
-cx q[26],q[31];
-rx(11.922691790460021) q[26];
-rx(11.922691790460021) q[31];
-cx q[32],q[68];
-rz(6.137261617452012) q[33];
-cx q[5],q[33];
-cx q[5],q[46];
-cx q[30],q[33];
-rz(6.137261617452012) q[33];
-cx q[30],q[33];
-rx(11.922691790460021) q[33];
-rz(6.137261617452012) q[36];
-cx q[15],q[36];
-cx q[15],q[55];
-cx q[20],q[36];
-rz(6.137261617452012) q[36];
-cx q[20],q[36];
-rx(11.922691790460021) q[36];
-rz(6.137261617452012) q[39];
-cx q[13],q[39];
-cx q[13],q[56];
-rx(11.922691790460021) q[39];
-rz(6.137261617452012) q[41];
-cx q[27],q[41];
-rx(11.922691790460021) q[27];
-cx q[41],q[67];
-rz(6.137261617452012) q[46];
-cx q[5],q[46];
-cx q[5],q[65];
-rz(6.137261617452012) q[47];
-cx q[4],q[47];
-cx q[17],q[47];
-rz(6.137261617452012) q[47];
-cx q[17],q[47];
-cx q[17],q[53];
-rz(6.137261617452012) q[53];
-cx q[17],q[53];
-rz(6.137261617452012) q[54];
-cx q[24],q[54];
-cx q[24],q[58];
-rz(6.137261617452012) q[55];
-cx q[15],q[55];
-rx(11.922691790460021) q[15];
-rx(11.922691790460021) q[55];
-rz(6.137261617452012) q[56];
-cx q[13],q[56];
-cx q[45],q[56];
-rz(6.137261617452012) q[56];
-cx q[45],q[56];
-rx(11.922691790460021) q[45];
-rz(6.137261617452012) q[58];
-cx q[24],q[58];
-rx(11.922691790460021) q[24];
-rz(6.137261617452012) q[65];
-cx q[5],q[65];
-rx(11.922691790460021) q[5];
-cx q[23],q[65];
-rz(6.137261617452012) q[65];
-cx q[23],q[65];
-rx(11.922691790460021) q[23];
-rx(11.922691790460021) q[65];
-rz(6.137261617452012) q[67];
-cx q[41],q[67];
-rx(11.922691790460021) q[41];
-cx q[56],q[67];
-rz(6.137261617452012) q[67];
-cx q[56],q[67];
-rx(11.922691790460021) q[56];
-rx(11.922691790460021) q[67];
-rz(5.582848795151529) q[68];
-cx q[32],q[68];
-rx(11.450693178397591) q[32];
-cx q[0],q[32];
-rz(6.137261617452012) q[32];
-cx q[0],q[32];
-cx q[0],q[42];
-cx q[21],q[32];
-rz(6.137261617452012) q[32];
-cx q[21],q[32];
-cx q[21],q[38];
-cx q[32],q[35];
-rz(6.137261617452012) q[35];
-cx q[32],q[35];
-cx q[32],q[59];
-rx(11.922691790460021) q[35];
-rz(6.137261617452012) q[38];
-cx q[21],q[38];
-cx q[21],q[53];
-cx q[38],q[46];
-rz(6.137261617452012) q[42];
-cx q[0],q[42];
-cx q[0],q[48];
-cx q[3],q[42];
-rz(6.137261617452012) q[42];
-cx q[3],q[42];
-cx q[3],q[43];
-rx(11.922691790460021) q[42];
-rz(6.137261617452012) q[43];
-cx q[3],q[43];
-cx q[3],q[44];
-cx q[20],q[43];
-rz(6.137261617452012) q[43];
-cx q[20],q[43];
-rx(11.922691790460021) q[20];
-rx(11.922691790460021) q[43];
-rz(6.137261617452012) q[44];
-cx q[3],q[44];
-cx q[3],q[49];
-cx q[12],q[44];
-rz(6.137261617452012) q[44];
-cx q[12],q[44];
-rx(11.922691790460021) q[44];
-rz(6.137261617452012) q[46];
-cx q[38],q[46];
-rx(11.922691790460021) q[38];
-rx(11.922691790460021) q[46];
-rz(6.137261617452012) q[48];
-cx q[0],q[48];
-cx q[0],q[51];
-cx q[30],q[48];
-rz(6.137261617452012) q[48];
-cx q[30],q[48];
-rx(11.922691790460021) q[30];
-rx(11.922691790460021) q[48];
-rz(6.137261617452012) q[49];
-cx q[3],q[49];
-cx q[3],q[50];
-cx q[4],q[49];
-rz(6.137261617452012) q[49];
-cx q[4],q[49];
-cx q[4],q[61];
-rx(11.922691790460021) q[49];
-rz(6.137261617452012) q[50];
-cx q[3],q[50];
-cx q[3],q[52];
-cx q[12],q[50];
-rz(6.137261617452012) q[50];
-cx q[12],q[50];
-cx q[12],q[63];
-rx(11.922691790460021) q[50];
-rz(6.137261617452012) q[51];
-cx q[0],q[51];
-cx q[0],q[62];
-cx q[28],q[51];
-rz(6.137261617452012) q[51];
-cx q[28],q[51];
-cx q[28],q[54];
-rx(11.922691790460021) q[51];
-rz(6.137261617452012) q[52];
-cx q[3],q[52];
-cx q[3],q[57];
-cx q[10],q[52];
-rz(6.137261617452012) q[52];
-cx q[10],q[52];
-rx(11.922691790460021) q[52];
-rz(6.137261617452012) q[53];
-cx q[21],q[53];
-rx(11.922691790460021) q[21];
-rx(11.922691790460021) q[53];
-rz(6.137261617452012) q[54];
-cx q[28],q[54];
-cx q[28],q[58];
-rx(11.922691790460021) q[54];
-rz(6.137261617452012) q[57];
-cx q[3],q[57];
-rx(11.922691790460021) q[3];
-rx(11.922691790460021) q[57];
-rz(6.137261617452012) q[58];
-cx q[28],q[58];
-rx(11.922691790460021) q[28];
-rx(11.922691790460021) q[58];
-rz(6.137261617452012) q[59];
-cx q[32],q[59];
-rx(11.922691790460021) q[59];
-rz(6.137261617452012) q[61];
-cx q[4],q[61];
-rx(11.922691790460021) q[4];
-cx q[7],q[61];
-rz(6.137261617452012) q[61];
-cx q[7],q[61];
-rx(11.922691790460021) q[7];
-rx(11.922691790460021) q[61];
-rz(6.137261617452012) q[62];
-cx q[0],q[62];
-cx q[0],q[64];
-cx q[17],q[62];
-rz(6.137261617452012) q[62];
-cx q[17],q[62];
-rx(11.922691790460021) q[62];
-rz(6.137261617452012) q[63];
-cx q[12],q[63];
-rx(11.922691790460021) q[12];
-cx q[17],q[63];
-rz(6.137261617452012) q[63];
-cx q[17],q[63];
-cx q[17],q[66];
-rx(11.922691790460021) q[63];
-rz(6.137261617452012) q[64];
-cx q[0],q[64];
-rx(11.922691790460021) q[0];
-cx q[0],q[1];
-rz(2.4578269255202176) q[1];
-cx q[0],q[1];
-cx q[0],q[2];
-rz(2.4578269255202176) q[2];
-cx q[0],q[2];
-cx q[0],q[3];
-rx(5.779396202125528) q[2];
-rz(2.4578269255202176) q[3];
-cx q[0],q[3];
-cx q[0],q[15];
-cx q[1],q[3];
-rz(2.4578269255202176) q[3];
-cx q[1],q[3];
-cx q[1],q[4];
-rz(2.4578269255202176) q[4];
-cx q[1],q[4];
-cx q[1],q[5];
-cx q[3],q[4];
-rz(2.4578269255202176) q[4];
-cx q[3],q[4];
-cx q[4],q[6];
-rz(2.4578269255202176) q[5];
-cx q[1],q[5];
-cx q[1],q[9];
-cx q[3],q[5];
-rz(2.4578269255202176) q[5];
-cx q[3],q[5];
-cx q[3],q[7];
-rz(2.4578269255202176) q[6];
-cx q[4],q[6];
-cx q[5],q[6];
-rz(2.4578269255202176) q[6];
-cx q[5],q[6];
-rz(2.4578269255202176) q[7];
-cx q[3],q[7];
-cx q[3],q[8];
-cx q[4],q[7];
-rz(2.4578269255202176) q[7];
-cx q[4],q[7];
-rz(2.4578269255202176) q[8];
-cx q[3],q[8];
-cx q[5],q[8];
-rz(2.4578269255202176) q[8];
-cx q[5],q[8];
-cx q[5],q[11];
-rx(5.779396202125528) q[8];
-rz(2.4578269255202176) q[9];
-cx q[1],q[9];
-cx q[3],q[9];
-rz(2.4578269255202176) q[9];
-cx q[3],q[9];
-cx q[3],q[12];
-cx q[10],q[64];
-rz(2.4578269255202176) q[11];
-cx q[5],q[11];
-rz(2.4578269255202176) q[12];
-cx q[3],q[12];
-cx q[3],q[14];
-cx q[5],q[12];
-rz(2.4578269255202176) q[12];
-cx q[5],q[12];
-rz(2.4578269255202176) q[14];
-cx q[3],q[14];
-rz(2.4578269255202176) q[15];
-cx q[0],q[15];
-cx q[0],q[16];
-cx q[3],q[15];
-rz(2.4578269255202176) q[15];
-cx q[3],q[15];
-rz(2.4578269255202176) q[16];
-cx q[0],q[16];
-cx q[0],q[20];
-cx q[3],q[16];
-rz(2.4578269255202176) q[16];
-cx q[3],q[16];
-rz(2.4578269255202176) q[20];
-cx q[0],q[20];
-cx q[15],q[20];
-rz(2.4578269255202176) q[20];
-cx q[15],q[20];
-rz(6.137261617452012) q[64];
-cx q[10],q[64];
-rx(11.922691790460021) q[10];
-cx q[4],q[10];
-rz(2.4578269255202176) q[10];
-cx q[4],q[10];
-cx q[6],q[10];
-rz(2.4578269255202176) q[10];
-cx q[6],q[10];
-cx q[6],q[11];
-cx q[10],q[37];
-rz(2.4578269255202176) q[11];
-cx q[6],q[11];
-rx(5.779396202125528) q[11];
-rz(2.4578269255202176) q[37];
-cx q[10],q[37];
-cx q[10],q[41];
-rz(2.4578269255202176) q[41];
-cx q[10],q[41];
-rx(11.922691790460021) q[64];
-rz(6.137261617452012) q[66];
-cx q[17],q[66];
-rx(11.922691790460021) q[17];
-cx q[1],q[17];
-rz(2.4578269255202176) q[17];
-cx q[1],q[17];
-cx q[1],q[28];
-cx q[3],q[17];
-rz(2.4578269255202176) q[17];
-cx q[3],q[17];
-cx q[3],q[18];
-rz(2.4578269255202176) q[18];
-cx q[3],q[18];
-cx q[3],q[19];
-rz(2.4578269255202176) q[19];
-cx q[3],q[19];
-cx q[3],q[22];
-cx q[7],q[19];
-rz(2.4578269255202176) q[19];
-cx q[7],q[19];
-cx q[19],q[38];
-rz(2.4578269255202176) q[22];
-cx q[3],q[22];
-cx q[3],q[23];
-cx q[9],q[22];
-rz(2.4578269255202176) q[22];
-cx q[9],q[22];
-cx q[9],q[55];
-rx(5.779396202125528) q[22];
-rz(2.4578269255202176) q[23];
-cx q[3],q[23];
-cx q[3],q[24];
-cx q[17],q[23];
-rz(2.4578269255202176) q[23];
-cx q[17],q[23];
-rz(2.4578269255202176) q[24];
-cx q[3],q[24];
-cx q[3],q[25];
-rz(2.4578269255202176) q[25];
-cx q[3],q[25];
-cx q[3],q[26];
-cx q[12],q[25];
-rz(2.4578269255202176) q[25];
-cx q[12],q[25];
-cx q[12],q[31];
-rx(5.779396202125528) q[25];
-rz(2.4578269255202176) q[26];
-cx q[3],q[26];
-rz(2.4578269255202176) q[28];
-cx q[1],q[28];
-cx q[1],q[29];
-cx q[3],q[28];
-rz(2.4578269255202176) q[28];
-cx q[3],q[28];
-rz(2.4578269255202176) q[29];
-cx q[1],q[29];
-cx q[1],q[45];
-cx q[3],q[29];
-rz(2.4578269255202176) q[29];
-cx q[3],q[29];
-cx q[3],q[30];
-rx(5.779396202125528) q[29];
-rz(2.4578269255202176) q[30];
-cx q[3],q[30];
-cx q[3],q[34];
-rz(2.4578269255202176) q[31];
-cx q[12],q[31];
-rz(2.4578269255202176) q[34];
-cx q[3],q[34];
-cx q[3],q[35];
-cx q[12],q[34];
-rz(2.4578269255202176) q[34];
-cx q[12],q[34];
-cx q[34],q[37];
-rz(2.4578269255202176) q[35];
-cx q[3],q[35];
-cx q[3],q[39];
-rz(2.4578269255202176) q[37];
-cx q[34],q[37];
-rx(5.779396202125528) q[34];
-rx(5.779396202125528) q[37];
-rz(2.4578269255202176) q[38];
-cx q[19],q[38];
-rx(5.779396202125528) q[19];
-rz(2.4578269255202176) q[39];
-cx q[3],q[39];
-cx q[3],q[40];
-rz(2.4578269255202176) q[40];
-cx q[3],q[40];
-cx q[23],q[40];
-rz(2.4578269255202176) q[40];
-cx q[23],q[40];
-rx(5.779396202125528) q[40];
-rz(2.4578269255202176) q[45];
-cx q[1],q[45];
-cx q[1],q[57];
-cx q[16],q[45];
-rz(2.4578269255202176) q[45];
-cx q[16],q[45];
-cx q[16],q[59];
-cx q[47],q[66];
-rz(2.4578269255202176) q[55];
-cx q[9],q[55];
-rx(5.779396202125528) q[9];
-rz(2.4578269255202176) q[57];
-cx q[1],q[57];
-cx q[1],q[60];
-rz(2.4578269255202176) q[59];
-cx q[16],q[59];
-rx(5.779396202125528) q[16];
-rz(2.4578269255202176) q[60];
-cx q[1],q[60];
-rx(5.779396202125528) q[1];
-cx q[7],q[60];
-rz(2.4578269255202176) q[60];
-cx q[7],q[60];
-rx(5.779396202125528) q[60];
-rz(6.137261617452012) q[66];
-cx q[47],q[66];
-rx(11.922691790460021) q[47];
-rx(11.922691790460021) q[66];
-rx(11.450693178397591) q[68];
-cx q[13],q[68];
-rz(6.137261617452012) q[68];
-cx q[13],q[68];
-rx(11.922691790460021) q[13];
-cx q[4],q[13];
-rz(2.4578269255202176) q[13];
-cx q[4],q[13];
-cx q[4],q[14];
-cx q[5],q[13];
-rz(2.4578269255202176) q[13];
-cx q[5],q[13];
-cx q[5],q[24];
-cx q[13],q[39];
-rz(2.4578269255202176) q[14];
-cx q[4],q[14];
-cx q[4],q[18];
-rx(5.779396202125528) q[14];
-rz(2.4578269255202176) q[18];
-cx q[4],q[18];
-cx q[4],q[21];
-cx q[18],q[30];
-rz(2.4578269255202176) q[21];
-cx q[4],q[21];
-cx q[4],q[27];
-cx q[15],q[21];
-rz(2.4578269255202176) q[21];
-cx q[15],q[21];
-cx q[15],q[36];
-cx q[21],q[26];
-rz(2.4578269255202176) q[24];
-cx q[5],q[24];
-cx q[5],q[33];
-cx q[24],q[54];
-rz(2.4578269255202176) q[26];
-cx q[21],q[26];
-cx q[26],q[31];
-rz(2.4578269255202176) q[27];
-cx q[4],q[27];
-cx q[4],q[47];
-cx q[6],q[27];
-rz(2.4578269255202176) q[27];
-cx q[6],q[27];
-rx(5.779396202125528) q[6];
-cx q[27],q[41];
-rz(2.4578269255202176) q[30];
-cx q[18],q[30];
-rx(5.779396202125528) q[18];
-rz(2.4578269255202176) q[31];
-cx q[26],q[31];
-rx(5.779396202125528) q[26];
-rx(5.779396202125528) q[31];
-cx q[32],q[68];
-rz(2.4578269255202176) q[33];
-cx q[5],q[33];
-cx q[5],q[46];
-cx q[30],q[33];
-rz(2.4578269255202176) q[33];
-cx q[30],q[33];
-rx(5.779396202125528) q[33];
-rz(2.4578269255202176) q[36];
-cx q[15],q[36];
-cx q[15],q[55];
-cx q[20],q[36];
-rz(2.4578269255202176) q[36];
-cx q[20],q[36];
-rx(5.779396202125528) q[36];
-rz(2.4578269255202176) q[39];
-cx q[13],q[39];
-cx q[13],q[56];
-rx(5.779396202125528) q[39];
-rz(2.4578269255202176) q[41];
-cx q[27],q[41];
-rx(5.779396202125528) q[27];
-cx q[41],q[67];
-rz(2.4578269255202176) q[46];
-cx q[5],q[46];
-cx q[5],q[65];
-rz(2.4578269255202176) q[47];
-cx q[4],q[47];
-cx q[17],q[47];
-rz(2.4578269255202176) q[47];
-cx q[17],q[47];
-cx q[17],q[53];
-rz(2.4578269255202176) q[53];
-cx q[17],q[53];
-rz(2.4578269255202176) q[54];
-cx q[24],q[54];
-cx q[24],q[58];
-rz(2.4578269255202176) q[55];
-cx q[15],q[55];
-rx(5.779396202125528) q[15];
-rx(5.779396202125528) q[55];
-rz(2.4578269255202176) q[56];
-cx q[13],q[56];
-cx q[45],q[56];
-rz(2.4578269255202176) q[56];
-cx q[45],q[56];
-rx(5.779396202125528) q[45];
-rz(2.4578269255202176) q[58];
-cx q[24],q[58];
-rx(5.779396202125528) q[24];
-rz(2.4578269255202176) q[65];
-cx q[5],q[65];
-rx(5.779396202125528) q[5];
-cx q[23],q[65];
-rz(2.4578269255202176) q[65];
-cx q[23],q[65];
-rx(5.779396202125528) q[23];
-rx(5.779396202125528) q[65];
-rz(2.4578269255202176) q[67];
-cx q[41],q[67];
-rx(5.779396202125528) q[41];
-cx q[56],q[67];
-rz(2.4578269255202176) q[67];
-cx q[56],q[67];
-rx(5.779396202125528) q[56];
-rx(5.779396202125528) q[67];
-rz(6.137261617452012) q[68];
-cx q[32],q[68];
-rx(11.922691790460021) q[32];
-cx q[0],q[32];
-rz(2.4578269255202176) q[32];
-cx q[0],q[32];
-cx q[0],q[42];
-cx q[21],q[32];
-rz(2.4578269255202176) q[32];
-cx q[21],q[32];
-cx q[21],q[38];
-cx q[32],q[35];
-rz(2.4578269255202176) q[35];
-cx q[32],q[35];
-cx q[32],q[59];
-rx(5.779396202125528) q[35];
-rz(2.4578269255202176) q[38];
-cx q[21],q[38];
-cx q[21],q[53];
-cx q[38],q[46];
-rz(2.4578269255202176) q[42];
-cx q[0],q[42];
-cx q[0],q[48];
-cx q[3],q[42];
-rz(2.4578269255202176) q[42];
-cx q[3],q[42];
-cx q[3],q[43];
-rx(5.779396202125528) q[42];
-rz(2.4578269255202176) q[43];
-cx q[3],q[43];
-cx q[3],q[44];
-cx q[20],q[43];
-rz(2.4578269255202176) q[43];
-cx q[20],q[43];
-rx(5.779396202125528) q[20];
-rx(5.779396202125528) q[43];
-rz(2.4578269255202176) q[44];
-cx q[3],q[44];
-cx q[3],q[49];
-cx q[12],q[44];
-rz(2.4578269255202176) q[44];
-cx q[12],q[44];
-rx(5.779396202125528) q[44];
-rz(2.4578269255202176) q[46];
-cx q[38],q[46];
-rx(5.779396202125528) q[38];
-rx(5.779396202125528) q[46];
-rz(2.4578269255202176) q[48];
-cx q[0],q[48];
-cx q[0],q[51];
-cx q[30],q[48];
-rz(2.4578269255202176) q[48];
-cx q[30],q[48];
-rx(5.779396202125528) q[30];
-rx(5.779396202125528) q[48];
-rz(2.4578269255202176) q[49];
-cx q[3],q[49];
-cx q[3],q[50];
-cx q[4],q[49];
-rz(2.4578269255202176) q[49];
-cx q[4],q[49];
-cx q[4],q[61];
-rx(5.779396202125528) q[49];
-rz(2.4578269255202176) q[50];
-cx q[3],q[50];
-cx q[3],q[52];
-cx q[12],q[50];
-rz(2.4578269255202176) q[50];
-cx q[12],q[50];
-cx q[12],q[63];
-rx(5.779396202125528) q[50];
-rz(2.4578269255202176) q[51];
-cx q[0],q[51];
-cx q[0],q[62];
-cx q[28],q[51];
-rz(2.4578269255202176) q[51];
-cx q[28],q[51];
-cx q[28],q[54];
-rx(5.779396202125528) q[51];
-rz(2.4578269255202176) q[52];
-cx q[3],q[52];
-cx q[3],q[57];
-cx q[10],q[52];
-rz(2.4578269255202176) q[52];
-cx q[10],q[52];
-rx(5.779396202125528) q[52];
-rz(2.4578269255202176) q[53];
-cx q[21],q[53];
-rx(5.779396202125528) q[21];
-rx(5.779396202125528) q[53];
-rz(2.4578269255202176) q[54];
-cx q[28],q[54];
-cx q[28],q[58];
-rx(5.779396202125528) q[54];
-rz(2.4578269255202176) q[57];
-cx q[3],q[57];
-rx(5.779396202125528) q[3];
-rx(5.779396202125528) q[57];
-rz(2.4578269255202176) q[58];
-cx q[28],q[58];
-rx(5.779396202125528) q[28];
-rx(5.779396202125528) q[58];
-rz(2.4578269255202176) q[59];
-cx q[32],q[59];
-rx(5.779396202125528) q[59];
-rz(2.4578269255202176) q[61];
-cx q[4],q[61];
-rx(5.779396202125528) q[4];
-cx q[7],q[61];
-rz(2.4578269255202176) q[61];
-cx q[7],q[61];
-rx(5.779396202125528) q[7];
-rx(5.779396202125528) q[61];
-rz(2.4578269255202176) q[62];
-cx q[0],q[62];
-cx q[0],q[64];
-cx q[17],q[62];
-rz(2.4578269255202176) q[62];
-cx q[17],q[62];
-rx(5.779396202125528) q[62];
-rz(2.4578269255202176) q[63];
-cx q[12],q[63];
-rx(5.779396202125528) q[12];
-cx q[17],q[63];
-rz(2.4578269255202176) q[63];
-cx q[17],q[63];
-cx q[17],q[66];
-rx(5.779396202125528) q[63];
-rz(2.4578269255202176) q[64];
-cx q[0],q[64];
-rx(5.779396202125528) q[0];
-cx q[10],q[64];
-rz(2.4578269255202176) q[64];
-cx q[10],q[64];
-rx(5.779396202125528) q[10];
-rx(5.779396202125528) q[64];
-rz(2.4578269255202176) q[66];
-cx q[17],q[66];
-rx(5.779396202125528) q[17];
-cx q[47],q[66];
-rz(2.4578269255202176) q[66];
-cx q[47],q[66];
-rx(5.779396202125528) q[47];
-rx(5.779396202125528) q[66];
-rx(11.922691790460021) q[68];
-cx q[13],q[68];
-rz(2.4578269255202176) q[68];
-cx q[13],q[68];
-rx(5.779396202125528) q[13];
-cx q[32],q[68];
-rz(2.4578269255202176) q[68];
-cx q[32],q[68];
-rx(5.779396202125528) q[32];
-rx(5.779396202125528) q[68];
\ No newline at end of file
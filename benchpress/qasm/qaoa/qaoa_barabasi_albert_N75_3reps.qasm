@@ -1,1692 +0,0 @@
-OPENQASM 2.0;
-include "qelib1.inc";
-qreg q[75];
-ry(pi/2) q[0];
-rx(pi) q[0];
-ry(pi/2) q[1];
-rx(pi) q[1];
-cx q[0],q[1];
-rz(5.38828136711869) q[1];
-cx q[0],q[1];
-ry(pi/2) q[2];
-rx(pi) q[2];
-cx q[0],q[2];
-rz(5.38828136711869) q[2];
-cx q[0],q[2];
-rx(8.904299473126851) q[2];
-ry(pi/2) q[3];
-rx(pi) q[3];
-cx q[0],q[3];
-rz(5.38828136711869) q[3];
-cx q[0],q[3];
-cx q[1],q[3];
-rz(5.38828136711869) q[3];
-cx q[1],q[3];
-ry(pi/2) q[4];
-rx(pi) q[4];
-cx q[1],q[4];
-rz(5.38828136711869) q[4];
-cx q[1],q[4];
-cx q[3],q[4];
-rz(5.38828136711869) q[4];
-cx q[3],q[4];
-ry(pi/2) q[5];
-rx(pi) q[5];
-cx q[1],q[5];
-rz(5.38828136711869) q[5];
-cx q[1],q[5];
-cx q[3],q[5];
-rz(5.38828136711869) q[5];
-cx q[3],q[5];
-ry(pi/2) q[6];
-rx(pi) q[6];
-cx q[4],q[6];
-rz(5.38828136711869) q[6];
-cx q[4],q[6];
-cx q[5],q[6];
-rz(5.38828136711869) q[6];
-cx q[5],q[6];
-ry(pi/2) q[7];
-rx(pi) q[7];
-cx q[3],q[7];
-rz(5.38828136711869) q[7];
-cx q[3],q[7];
-cx q[4],q[7];
-rz(5.38828136711869) q[7];
-cx q[4],q[7];
-ry(pi/2) q[8];
-rx(pi) q[8];
-cx q[3],q[8];
-rz(5.38828136711869) q[8];
-cx q[3],q[8];
-cx q[5],q[8];
-rz(5.38828136711869) q[8];
-cx q[5],q[8];
-rx(8.904299473126851) q[8];
-ry(pi/2) q[9];
-rx(pi) q[9];
-cx q[1],q[9];
-rz(5.38828136711869) q[9];
-cx q[1],q[9];
-cx q[3],q[9];
-rz(5.38828136711869) q[9];
-cx q[3],q[9];
-ry(pi/2) q[10];
-rx(pi) q[10];
-cx q[4],q[10];
-rz(5.38828136711869) q[10];
-cx q[4],q[10];
-cx q[6],q[10];
-rz(5.38828136711869) q[10];
-cx q[6],q[10];
-ry(pi/2) q[11];
-rx(pi) q[11];
-cx q[5],q[11];
-rz(5.38828136711869) q[11];
-cx q[5],q[11];
-cx q[6],q[11];
-rz(5.38828136711869) q[11];
-cx q[6],q[11];
-rx(8.904299473126851) q[11];
-ry(pi/2) q[12];
-rx(pi) q[12];
-cx q[3],q[12];
-rz(5.38828136711869) q[12];
-cx q[3],q[12];
-cx q[5],q[12];
-rz(5.38828136711869) q[12];
-cx q[5],q[12];
-ry(pi/2) q[13];
-rx(pi) q[13];
-cx q[4],q[13];
-rz(5.38828136711869) q[13];
-cx q[4],q[13];
-cx q[5],q[13];
-rz(5.38828136711869) q[13];
-cx q[5],q[13];
-ry(pi/2) q[14];
-rx(pi) q[14];
-cx q[3],q[14];
-rz(5.38828136711869) q[14];
-cx q[3],q[14];
-cx q[4],q[14];
-rz(5.38828136711869) q[14];
-cx q[4],q[14];
-rx(8.904299473126851) q[14];
-ry(pi/2) q[15];
-rx(pi) q[15];
-cx q[0],q[15];
-rz(5.38828136711869) q[15];
-cx q[0],q[15];
-cx q[3],q[15];
-rz(5.38828136711869) q[15];
-cx q[3],q[15];
-ry(pi/2) q[16];
-rx(pi) q[16];
-cx q[0],q[16];
-rz(5.38828136711869) q[16];
-cx q[0],q[16];
-cx q[3],q[16];
-rz(5.38828136711869) q[16];
-cx q[3],q[16];
-ry(pi/2) q[17];
-rx(pi) q[17];
-cx q[1],q[17];
-rz(5.38828136711869) q[17];
-cx q[1],q[17];
-cx q[3],q[17];
-rz(5.38828136711869) q[17];
-cx q[3],q[17];
-ry(pi/2) q[18];
-rx(pi) q[18];
-cx q[3],q[18];
-rz(5.38828136711869) q[18];
-cx q[3],q[18];
-cx q[4],q[18];
-rz(5.38828136711869) q[18];
-cx q[4],q[18];
-ry(pi/2) q[19];
-rx(pi) q[19];
-cx q[3],q[19];
-rz(5.38828136711869) q[19];
-cx q[3],q[19];
-cx q[7],q[19];
-rz(5.38828136711869) q[19];
-cx q[7],q[19];
-ry(pi/2) q[20];
-rx(pi) q[20];
-cx q[0],q[20];
-rz(5.38828136711869) q[20];
-cx q[0],q[20];
-cx q[15],q[20];
-rz(5.38828136711869) q[20];
-cx q[15],q[20];
-ry(pi/2) q[21];
-rx(pi) q[21];
-cx q[4],q[21];
-rz(5.38828136711869) q[21];
-cx q[4],q[21];
-cx q[15],q[21];
-rz(5.38828136711869) q[21];
-cx q[15],q[21];
-ry(pi/2) q[22];
-rx(pi) q[22];
-cx q[3],q[22];
-rz(5.38828136711869) q[22];
-cx q[3],q[22];
-cx q[9],q[22];
-rz(5.38828136711869) q[22];
-cx q[9],q[22];
-rx(8.904299473126851) q[22];
-ry(pi/2) q[23];
-rx(pi) q[23];
-cx q[3],q[23];
-rz(5.38828136711869) q[23];
-cx q[3],q[23];
-cx q[17],q[23];
-rz(5.38828136711869) q[23];
-cx q[17],q[23];
-ry(pi/2) q[24];
-rx(pi) q[24];
-cx q[3],q[24];
-rz(5.38828136711869) q[24];
-cx q[3],q[24];
-cx q[5],q[24];
-rz(5.38828136711869) q[24];
-cx q[5],q[24];
-ry(pi/2) q[25];
-rx(pi) q[25];
-cx q[3],q[25];
-rz(5.38828136711869) q[25];
-cx q[3],q[25];
-cx q[12],q[25];
-rz(5.38828136711869) q[25];
-cx q[12],q[25];
-rx(8.904299473126851) q[25];
-ry(pi/2) q[26];
-rx(pi) q[26];
-cx q[3],q[26];
-rz(5.38828136711869) q[26];
-cx q[3],q[26];
-cx q[21],q[26];
-rz(5.38828136711869) q[26];
-cx q[21],q[26];
-ry(pi/2) q[27];
-rx(pi) q[27];
-cx q[4],q[27];
-rz(5.38828136711869) q[27];
-cx q[4],q[27];
-cx q[6],q[27];
-rz(5.38828136711869) q[27];
-cx q[6],q[27];
-ry(pi/2) q[28];
-rx(pi) q[28];
-cx q[1],q[28];
-rz(5.38828136711869) q[28];
-cx q[1],q[28];
-cx q[3],q[28];
-rz(5.38828136711869) q[28];
-cx q[3],q[28];
-ry(pi/2) q[29];
-rx(pi) q[29];
-cx q[1],q[29];
-rz(5.38828136711869) q[29];
-cx q[1],q[29];
-cx q[3],q[29];
-rz(5.38828136711869) q[29];
-cx q[3],q[29];
-rx(8.904299473126851) q[29];
-ry(pi/2) q[30];
-rx(pi) q[30];
-cx q[3],q[30];
-rz(5.38828136711869) q[30];
-cx q[3],q[30];
-cx q[18],q[30];
-rz(5.38828136711869) q[30];
-cx q[18],q[30];
-rx(8.904299473126851) q[18];
-ry(pi/2) q[31];
-rx(pi) q[31];
-cx q[12],q[31];
-rz(5.38828136711869) q[31];
-cx q[12],q[31];
-cx q[26],q[31];
-rz(5.38828136711869) q[31];
-cx q[26],q[31];
-rx(8.904299473126851) q[26];
-rx(8.904299473126851) q[31];
-ry(pi/2) q[32];
-rx(pi) q[32];
-cx q[0],q[32];
-rz(5.38828136711869) q[32];
-cx q[0],q[32];
-cx q[21],q[32];
-rz(5.38828136711869) q[32];
-cx q[21],q[32];
-ry(pi/2) q[33];
-rx(pi) q[33];
-cx q[5],q[33];
-rz(5.38828136711869) q[33];
-cx q[5],q[33];
-cx q[30],q[33];
-rz(5.38828136711869) q[33];
-cx q[30],q[33];
-rx(8.904299473126851) q[33];
-ry(pi/2) q[34];
-rx(pi) q[34];
-cx q[3],q[34];
-rz(5.38828136711869) q[34];
-cx q[3],q[34];
-cx q[12],q[34];
-rz(5.38828136711869) q[34];
-cx q[12],q[34];
-ry(pi/2) q[35];
-rx(pi) q[35];
-cx q[3],q[35];
-rz(5.38828136711869) q[35];
-cx q[3],q[35];
-cx q[32],q[35];
-rz(5.38828136711869) q[35];
-cx q[32],q[35];
-rx(8.904299473126851) q[35];
-ry(pi/2) q[36];
-rx(pi) q[36];
-cx q[15],q[36];
-rz(5.38828136711869) q[36];
-cx q[15],q[36];
-cx q[20],q[36];
-rz(5.38828136711869) q[36];
-cx q[20],q[36];
-rx(8.904299473126851) q[36];
-ry(pi/2) q[37];
-rx(pi) q[37];
-cx q[10],q[37];
-rz(5.38828136711869) q[37];
-cx q[10],q[37];
-cx q[34],q[37];
-rz(5.38828136711869) q[37];
-cx q[34],q[37];
-rx(8.904299473126851) q[34];
-rx(8.904299473126851) q[37];
-ry(pi/2) q[38];
-rx(pi) q[38];
-cx q[19],q[38];
-rz(5.38828136711869) q[38];
-cx q[19],q[38];
-rx(8.904299473126851) q[19];
-cx q[21],q[38];
-rz(5.38828136711869) q[38];
-cx q[21],q[38];
-ry(pi/2) q[39];
-rx(pi) q[39];
-cx q[3],q[39];
-rz(5.38828136711869) q[39];
-cx q[3],q[39];
-cx q[13],q[39];
-rz(5.38828136711869) q[39];
-cx q[13],q[39];
-rx(8.904299473126851) q[39];
-ry(pi/2) q[40];
-rx(pi) q[40];
-cx q[3],q[40];
-rz(5.38828136711869) q[40];
-cx q[3],q[40];
-cx q[23],q[40];
-rz(5.38828136711869) q[40];
-cx q[23],q[40];
-rx(8.904299473126851) q[40];
-ry(pi/2) q[41];
-rx(pi) q[41];
-cx q[10],q[41];
-rz(5.38828136711869) q[41];
-cx q[10],q[41];
-cx q[27],q[41];
-rz(5.38828136711869) q[41];
-cx q[27],q[41];
-ry(pi/2) q[42];
-rx(pi) q[42];
-cx q[0],q[42];
-rz(5.38828136711869) q[42];
-cx q[0],q[42];
-cx q[3],q[42];
-rz(5.38828136711869) q[42];
-cx q[3],q[42];
-rx(8.904299473126851) q[42];
-ry(pi/2) q[43];
-rx(pi) q[43];
-cx q[3],q[43];
-rz(5.38828136711869) q[43];
-cx q[3],q[43];
-cx q[20],q[43];
-rz(5.38828136711869) q[43];
-cx q[20],q[43];
-rx(8.904299473126851) q[20];
-rx(8.904299473126851) q[43];
-ry(pi/2) q[44];
-rx(pi) q[44];
-cx q[3],q[44];
-rz(5.38828136711869) q[44];
-cx q[3],q[44];
-cx q[12],q[44];
-rz(5.38828136711869) q[44];
-cx q[12],q[44];
-ry(pi/2) q[45];
-rx(pi) q[45];
-cx q[1],q[45];
-rz(5.38828136711869) q[45];
-cx q[1],q[45];
-cx q[16],q[45];
-rz(5.38828136711869) q[45];
-cx q[16],q[45];
-ry(pi/2) q[46];
-rx(pi) q[46];
-cx q[5],q[46];
-rz(5.38828136711869) q[46];
-cx q[5],q[46];
-cx q[38],q[46];
-rz(5.38828136711869) q[46];
-cx q[38],q[46];
-rx(8.904299473126851) q[38];
-rx(8.904299473126851) q[46];
-ry(pi/2) q[47];
-rx(pi) q[47];
-cx q[4],q[47];
-rz(5.38828136711869) q[47];
-cx q[4],q[47];
-cx q[17],q[47];
-rz(5.38828136711869) q[47];
-cx q[17],q[47];
-ry(pi/2) q[48];
-rx(pi) q[48];
-cx q[0],q[48];
-rz(5.38828136711869) q[48];
-cx q[0],q[48];
-cx q[30],q[48];
-rz(5.38828136711869) q[48];
-cx q[30],q[48];
-rx(8.904299473126851) q[30];
-rx(8.904299473126851) q[48];
-ry(pi/2) q[49];
-rx(pi) q[49];
-cx q[3],q[49];
-rz(5.38828136711869) q[49];
-cx q[3],q[49];
-cx q[4],q[49];
-rz(5.38828136711869) q[49];
-cx q[4],q[49];
-rx(8.904299473126851) q[49];
-ry(pi/2) q[50];
-rx(pi) q[50];
-cx q[3],q[50];
-rz(5.38828136711869) q[50];
-cx q[3],q[50];
-cx q[12],q[50];
-rz(5.38828136711869) q[50];
-cx q[12],q[50];
-rx(8.904299473126851) q[50];
-ry(pi/2) q[51];
-rx(pi) q[51];
-cx q[0],q[51];
-rz(5.38828136711869) q[51];
-cx q[0],q[51];
-cx q[28],q[51];
-rz(5.38828136711869) q[51];
-cx q[28],q[51];
-rx(8.904299473126851) q[51];
-ry(pi/2) q[52];
-rx(pi) q[52];
-cx q[3],q[52];
-rz(5.38828136711869) q[52];
-cx q[3],q[52];
-cx q[10],q[52];
-rz(5.38828136711869) q[52];
-cx q[10],q[52];
-rx(8.904299473126851) q[52];
-ry(pi/2) q[53];
-rx(pi) q[53];
-cx q[17],q[53];
-rz(5.38828136711869) q[53];
-cx q[17],q[53];
-cx q[21],q[53];
-rz(5.38828136711869) q[53];
-cx q[21],q[53];
-rx(8.904299473126851) q[21];
-ry(pi/2) q[54];
-rx(pi) q[54];
-cx q[24],q[54];
-rz(5.38828136711869) q[54];
-cx q[24],q[54];
-cx q[28],q[54];
-rz(5.38828136711869) q[54];
-cx q[28],q[54];
-rx(8.904299473126851) q[54];
-ry(pi/2) q[55];
-rx(pi) q[55];
-cx q[9],q[55];
-rz(5.38828136711869) q[55];
-cx q[9],q[55];
-rx(8.904299473126851) q[9];
-cx q[15],q[55];
-rz(5.38828136711869) q[55];
-cx q[15],q[55];
-rx(8.904299473126851) q[55];
-ry(pi/2) q[56];
-rx(pi) q[56];
-cx q[13],q[56];
-rz(5.38828136711869) q[56];
-cx q[13],q[56];
-cx q[45],q[56];
-rz(5.38828136711869) q[56];
-cx q[45],q[56];
-rx(8.904299473126851) q[45];
-ry(pi/2) q[57];
-rx(pi) q[57];
-cx q[1],q[57];
-rz(5.38828136711869) q[57];
-cx q[1],q[57];
-cx q[3],q[57];
-rz(5.38828136711869) q[57];
-cx q[3],q[57];
-rx(8.904299473126851) q[57];
-ry(pi/2) q[58];
-rx(pi) q[58];
-cx q[24],q[58];
-rz(5.38828136711869) q[58];
-cx q[24],q[58];
-rx(8.904299473126851) q[24];
-cx q[28],q[58];
-rz(5.38828136711869) q[58];
-cx q[28],q[58];
-rx(8.904299473126851) q[28];
-rx(8.904299473126851) q[58];
-ry(pi/2) q[59];
-rx(pi) q[59];
-cx q[16],q[59];
-rz(5.38828136711869) q[59];
-cx q[16],q[59];
-cx q[32],q[59];
-rz(5.38828136711869) q[59];
-cx q[32],q[59];
-ry(pi/2) q[60];
-rx(pi) q[60];
-cx q[1],q[60];
-rz(5.38828136711869) q[60];
-cx q[1],q[60];
-rx(8.904299473126851) q[1];
-cx q[7],q[60];
-rz(5.38828136711869) q[60];
-cx q[7],q[60];
-rx(8.904299473126851) q[60];
-ry(pi/2) q[61];
-rx(pi) q[61];
-cx q[4],q[61];
-rz(5.38828136711869) q[61];
-cx q[4],q[61];
-rx(8.904299473126851) q[4];
-cx q[7],q[61];
-rz(5.38828136711869) q[61];
-cx q[7],q[61];
-rx(8.904299473126851) q[7];
-rx(8.904299473126851) q[61];
-ry(pi/2) q[62];
-rx(pi) q[62];
-cx q[0],q[62];
-rz(5.38828136711869) q[62];
-cx q[0],q[62];
-cx q[17],q[62];
-rz(5.38828136711869) q[62];
-cx q[17],q[62];
-rx(8.904299473126851) q[62];
-ry(pi/2) q[63];
-rx(pi) q[63];
-cx q[12],q[63];
-rz(5.38828136711869) q[63];
-cx q[12],q[63];
-rx(8.904299473126851) q[12];
-cx q[17],q[63];
-rz(5.38828136711869) q[63];
-cx q[17],q[63];
-ry(pi/2) q[64];
-rx(pi) q[64];
-cx q[0],q[64];
-rz(5.38828136711869) q[64];
-cx q[0],q[64];
-rx(8.904299473126851) q[0];
-cx q[0],q[1];
-rz(5.323484153529744) q[1];
-cx q[0],q[1];
-cx q[0],q[2];
-rz(5.323484153529744) q[2];
-cx q[0],q[2];
-rx(10.290150808082098) q[2];
-cx q[10],q[64];
-rz(5.38828136711869) q[64];
-cx q[10],q[64];
-rx(8.904299473126851) q[10];
-rx(8.904299473126851) q[64];
-ry(pi/2) q[65];
-rx(pi) q[65];
-cx q[5],q[65];
-rz(5.38828136711869) q[65];
-cx q[5],q[65];
-rx(8.904299473126851) q[5];
-cx q[23],q[65];
-rz(5.38828136711869) q[65];
-cx q[23],q[65];
-rx(8.904299473126851) q[23];
-rx(8.904299473126851) q[65];
-ry(pi/2) q[66];
-rx(pi) q[66];
-cx q[17],q[66];
-rz(5.38828136711869) q[66];
-cx q[17],q[66];
-rx(8.904299473126851) q[17];
-cx q[47],q[66];
-rz(5.38828136711869) q[66];
-cx q[47],q[66];
-rx(8.904299473126851) q[47];
-rx(8.904299473126851) q[66];
-ry(pi/2) q[67];
-rx(pi) q[67];
-cx q[41],q[67];
-rz(5.38828136711869) q[67];
-cx q[41],q[67];
-rx(8.904299473126851) q[41];
-cx q[56],q[67];
-rz(5.38828136711869) q[67];
-cx q[56],q[67];
-rx(8.904299473126851) q[67];
-ry(pi/2) q[68];
-rx(pi) q[68];
-cx q[13],q[68];
-rz(5.38828136711869) q[68];
-cx q[13],q[68];
-rx(8.904299473126851) q[13];
-cx q[32],q[68];
-rz(5.38828136711869) q[68];
-cx q[32],q[68];
-rx(8.904299473126851) q[32];
-rx(8.904299473126851) q[68];
-ry(pi/2) q[69];
-rx(pi) q[69];
-cx q[6],q[69];
-rz(5.38828136711869) q[69];
-cx q[6],q[69];
-rx(8.904299473126851) q[6];
-cx q[59],q[69];
-rz(5.38828136711869) q[69];
-cx q[59],q[69];
-rx(8.904299473126851) q[69];
-ry(pi/2) q[70];
-rx(pi) q[70];
-cx q[3],q[70];
-rz(5.38828136711869) q[70];
-cx q[3],q[70];
-cx q[15],q[70];
-rz(5.38828136711869) q[70];
-cx q[15],q[70];
-rx(8.904299473126851) q[15];
-rx(8.904299473126851) q[70];
-ry(pi/2) q[71];
-rx(pi) q[71];
-cx q[3],q[71];
-rz(5.38828136711869) q[71];
-cx q[3],q[71];
-rx(8.904299473126851) q[3];
-cx q[0],q[3];
-rz(5.323484153529744) q[3];
-cx q[0],q[3];
-cx q[0],q[15];
-cx q[1],q[3];
-rz(5.323484153529744) q[3];
-cx q[1],q[3];
-cx q[1],q[4];
-rz(5.323484153529744) q[4];
-cx q[1],q[4];
-cx q[1],q[5];
-cx q[3],q[4];
-rz(5.323484153529744) q[4];
-cx q[3],q[4];
-cx q[4],q[6];
-rz(5.323484153529744) q[5];
-cx q[1],q[5];
-cx q[1],q[9];
-cx q[3],q[5];
-rz(5.323484153529744) q[5];
-cx q[3],q[5];
-cx q[3],q[7];
-rz(5.323484153529744) q[6];
-cx q[4],q[6];
-cx q[5],q[6];
-rz(5.323484153529744) q[6];
-cx q[5],q[6];
-rz(5.323484153529744) q[7];
-cx q[3],q[7];
-cx q[3],q[8];
-cx q[4],q[7];
-rz(5.323484153529744) q[7];
-cx q[4],q[7];
-cx q[4],q[10];
-rz(5.323484153529744) q[8];
-cx q[3],q[8];
-cx q[5],q[8];
-rz(5.323484153529744) q[8];
-cx q[5],q[8];
-cx q[5],q[11];
-rx(10.290150808082098) q[8];
-rz(5.323484153529744) q[9];
-cx q[1],q[9];
-cx q[1],q[17];
-cx q[3],q[9];
-rz(5.323484153529744) q[9];
-cx q[3],q[9];
-cx q[3],q[12];
-rz(5.323484153529744) q[10];
-cx q[4],q[10];
-cx q[4],q[13];
-cx q[6],q[10];
-rz(5.323484153529744) q[10];
-cx q[6],q[10];
-cx q[10],q[37];
-rz(5.323484153529744) q[11];
-cx q[5],q[11];
-cx q[6],q[11];
-rz(5.323484153529744) q[11];
-cx q[6],q[11];
-rx(10.290150808082098) q[11];
-rz(5.323484153529744) q[12];
-cx q[3],q[12];
-cx q[3],q[14];
-cx q[5],q[12];
-rz(5.323484153529744) q[12];
-cx q[5],q[12];
-rz(5.323484153529744) q[13];
-cx q[4],q[13];
-cx q[5],q[13];
-rz(5.323484153529744) q[13];
-cx q[5],q[13];
-rz(5.323484153529744) q[14];
-cx q[3],q[14];
-cx q[4],q[14];
-rz(5.323484153529744) q[14];
-cx q[4],q[14];
-rx(10.290150808082098) q[14];
-rz(5.323484153529744) q[15];
-cx q[0],q[15];
-cx q[3],q[15];
-rz(5.323484153529744) q[15];
-cx q[3],q[15];
-rz(5.323484153529744) q[17];
-cx q[1],q[17];
-cx q[1],q[28];
-rz(5.323484153529744) q[28];
-cx q[1],q[28];
-cx q[1],q[29];
-rz(5.323484153529744) q[29];
-cx q[1],q[29];
-cx q[1],q[45];
-rz(5.323484153529744) q[37];
-cx q[10],q[37];
-cx q[10],q[41];
-rz(5.323484153529744) q[41];
-cx q[10],q[41];
-rz(5.323484153529744) q[45];
-cx q[1],q[45];
-cx q[1],q[57];
-cx q[53],q[71];
-rz(5.323484153529744) q[57];
-cx q[1],q[57];
-cx q[1],q[60];
-rz(5.323484153529744) q[60];
-cx q[1],q[60];
-rx(10.290150808082098) q[1];
-rz(5.38828136711869) q[71];
-cx q[53],q[71];
-rx(8.904299473126851) q[53];
-rx(8.904299473126851) q[71];
-ry(pi/2) q[72];
-rx(pi) q[72];
-cx q[27],q[72];
-rz(5.38828136711869) q[72];
-cx q[27],q[72];
-rx(8.904299473126851) q[27];
-cx q[44],q[72];
-rz(5.38828136711869) q[72];
-cx q[44],q[72];
-rx(8.904299473126851) q[44];
-rx(8.904299473126851) q[72];
-ry(pi/2) q[73];
-rx(pi) q[73];
-cx q[16],q[73];
-rz(5.38828136711869) q[73];
-cx q[16],q[73];
-rx(8.904299473126851) q[16];
-cx q[0],q[16];
-rz(5.323484153529744) q[16];
-cx q[0],q[16];
-cx q[0],q[20];
-cx q[3],q[16];
-rz(5.323484153529744) q[16];
-cx q[3],q[16];
-cx q[3],q[17];
-cx q[16],q[45];
-rz(5.323484153529744) q[17];
-cx q[3],q[17];
-cx q[3],q[18];
-rz(5.323484153529744) q[18];
-cx q[3],q[18];
-cx q[3],q[19];
-cx q[4],q[18];
-rz(5.323484153529744) q[18];
-cx q[4],q[18];
-cx q[4],q[21];
-rz(5.323484153529744) q[19];
-cx q[3],q[19];
-cx q[3],q[22];
-cx q[7],q[19];
-rz(5.323484153529744) q[19];
-cx q[7],q[19];
-cx q[7],q[60];
-cx q[19],q[38];
-rz(5.323484153529744) q[20];
-cx q[0],q[20];
-cx q[0],q[32];
-cx q[15],q[20];
-rz(5.323484153529744) q[20];
-cx q[15],q[20];
-rz(5.323484153529744) q[21];
-cx q[4],q[21];
-cx q[4],q[27];
-cx q[15],q[21];
-rz(5.323484153529744) q[21];
-cx q[15],q[21];
-cx q[15],q[36];
-rz(5.323484153529744) q[22];
-cx q[3],q[22];
-cx q[3],q[23];
-cx q[9],q[22];
-rz(5.323484153529744) q[22];
-cx q[9],q[22];
-cx q[9],q[55];
-rx(10.290150808082098) q[22];
-rz(5.323484153529744) q[23];
-cx q[3],q[23];
-cx q[3],q[24];
-cx q[17],q[23];
-rz(5.323484153529744) q[23];
-cx q[17],q[23];
-rz(5.323484153529744) q[24];
-cx q[3],q[24];
-cx q[3],q[25];
-cx q[5],q[24];
-rz(5.323484153529744) q[24];
-cx q[5],q[24];
-cx q[5],q[33];
-cx q[24],q[54];
-rz(5.323484153529744) q[25];
-cx q[3],q[25];
-cx q[3],q[26];
-cx q[12],q[25];
-rz(5.323484153529744) q[25];
-cx q[12],q[25];
-cx q[12],q[31];
-rx(10.290150808082098) q[25];
-rz(5.323484153529744) q[26];
-cx q[3],q[26];
-cx q[3],q[28];
-cx q[21],q[26];
-rz(5.323484153529744) q[26];
-cx q[21],q[26];
-rz(5.323484153529744) q[27];
-cx q[4],q[27];
-cx q[4],q[47];
-cx q[6],q[27];
-rz(5.323484153529744) q[27];
-cx q[6],q[27];
-cx q[6],q[69];
-cx q[27],q[41];
-rz(5.323484153529744) q[28];
-cx q[3],q[28];
-cx q[3],q[29];
-rz(5.323484153529744) q[29];
-cx q[3],q[29];
-cx q[3],q[30];
-rx(10.290150808082098) q[29];
-rz(5.323484153529744) q[30];
-cx q[3],q[30];
-cx q[3],q[34];
-cx q[18],q[30];
-rz(5.323484153529744) q[30];
-cx q[18],q[30];
-rx(10.290150808082098) q[18];
-rz(5.323484153529744) q[31];
-cx q[12],q[31];
-cx q[26],q[31];
-rz(5.323484153529744) q[31];
-cx q[26],q[31];
-rx(10.290150808082098) q[26];
-rx(10.290150808082098) q[31];
-rz(5.323484153529744) q[32];
-cx q[0],q[32];
-cx q[0],q[42];
-cx q[21],q[32];
-rz(5.323484153529744) q[32];
-cx q[21],q[32];
-rz(5.323484153529744) q[33];
-cx q[5],q[33];
-cx q[5],q[46];
-cx q[30],q[33];
-rz(5.323484153529744) q[33];
-cx q[30],q[33];
-rx(10.290150808082098) q[33];
-rz(5.323484153529744) q[34];
-cx q[3],q[34];
-cx q[3],q[35];
-cx q[12],q[34];
-rz(5.323484153529744) q[34];
-cx q[12],q[34];
-cx q[34],q[37];
-rz(5.323484153529744) q[35];
-cx q[3],q[35];
-cx q[3],q[39];
-cx q[32],q[35];
-rz(5.323484153529744) q[35];
-cx q[32],q[35];
-rx(10.290150808082098) q[35];
-rz(5.323484153529744) q[36];
-cx q[15],q[36];
-cx q[20],q[36];
-rz(5.323484153529744) q[36];
-cx q[20],q[36];
-rx(10.290150808082098) q[36];
-rz(5.323484153529744) q[37];
-cx q[34],q[37];
-rx(10.290150808082098) q[34];
-rx(10.290150808082098) q[37];
-rz(5.323484153529744) q[38];
-cx q[19],q[38];
-rx(10.290150808082098) q[19];
-cx q[21],q[38];
-rz(5.323484153529744) q[38];
-cx q[21],q[38];
-rz(5.323484153529744) q[39];
-cx q[3],q[39];
-cx q[3],q[40];
-cx q[13],q[39];
-rz(5.323484153529744) q[39];
-cx q[13],q[39];
-rx(10.290150808082098) q[39];
-rz(5.323484153529744) q[40];
-cx q[3],q[40];
-cx q[23],q[40];
-rz(5.323484153529744) q[40];
-cx q[23],q[40];
-rx(10.290150808082098) q[40];
-rz(5.323484153529744) q[41];
-cx q[27],q[41];
-cx q[27],q[72];
-cx q[41],q[67];
-rz(5.323484153529744) q[42];
-cx q[0],q[42];
-cx q[0],q[48];
-cx q[3],q[42];
-rz(5.323484153529744) q[42];
-cx q[3],q[42];
-cx q[3],q[43];
-rx(10.290150808082098) q[42];
-rz(5.323484153529744) q[43];
-cx q[3],q[43];
-cx q[3],q[44];
-cx q[20],q[43];
-rz(5.323484153529744) q[43];
-cx q[20],q[43];
-rx(10.290150808082098) q[20];
-rx(10.290150808082098) q[43];
-rz(5.323484153529744) q[44];
-cx q[3],q[44];
-cx q[3],q[49];
-cx q[12],q[44];
-rz(5.323484153529744) q[44];
-cx q[12],q[44];
-rz(5.323484153529744) q[45];
-cx q[16],q[45];
-rz(5.323484153529744) q[46];
-cx q[5],q[46];
-cx q[5],q[65];
-cx q[38],q[46];
-rz(5.323484153529744) q[46];
-cx q[38],q[46];
-rx(10.290150808082098) q[38];
-rx(10.290150808082098) q[46];
-rz(5.323484153529744) q[47];
-cx q[4],q[47];
-cx q[17],q[47];
-rz(5.323484153529744) q[47];
-cx q[17],q[47];
-cx q[17],q[53];
-rz(5.323484153529744) q[48];
-cx q[0],q[48];
-cx q[0],q[51];
-cx q[30],q[48];
-rz(5.323484153529744) q[48];
-cx q[30],q[48];
-rx(10.290150808082098) q[30];
-rx(10.290150808082098) q[48];
-rz(5.323484153529744) q[49];
-cx q[3],q[49];
-cx q[3],q[50];
-cx q[4],q[49];
-rz(5.323484153529744) q[49];
-cx q[4],q[49];
-cx q[4],q[61];
-rx(10.290150808082098) q[49];
-rz(5.323484153529744) q[50];
-cx q[3],q[50];
-cx q[3],q[52];
-cx q[12],q[50];
-rz(5.323484153529744) q[50];
-cx q[12],q[50];
-rx(10.290150808082098) q[50];
-rz(5.323484153529744) q[51];
-cx q[0],q[51];
-cx q[0],q[62];
-cx q[28],q[51];
-rz(5.323484153529744) q[51];
-cx q[28],q[51];
-rx(10.290150808082098) q[51];
-rz(5.323484153529744) q[52];
-cx q[3],q[52];
-cx q[3],q[57];
-cx q[10],q[52];
-rz(5.323484153529744) q[52];
-cx q[10],q[52];
-rx(10.290150808082098) q[52];
-rz(5.323484153529744) q[53];
-cx q[17],q[53];
-cx q[21],q[53];
-rz(5.323484153529744) q[53];
-cx q[21],q[53];
-rx(10.290150808082098) q[21];
-rz(5.323484153529744) q[54];
-cx q[24],q[54];
-cx q[24],q[58];
-cx q[28],q[54];
-rz(5.323484153529744) q[54];
-cx q[28],q[54];
-rx(10.290150808082098) q[54];
-rz(5.323484153529744) q[55];
-cx q[9],q[55];
-rx(10.290150808082098) q[9];
-cx q[15],q[55];
-rz(5.323484153529744) q[55];
-cx q[15],q[55];
-rx(10.290150808082098) q[55];
-rz(5.323484153529744) q[57];
-cx q[3],q[57];
-cx q[3],q[70];
-rx(10.290150808082098) q[57];
-rz(5.323484153529744) q[58];
-cx q[24],q[58];
-rx(10.290150808082098) q[24];
-cx q[28],q[58];
-rz(5.323484153529744) q[58];
-cx q[28],q[58];
-rx(10.290150808082098) q[28];
-rx(10.290150808082098) q[58];
-cx q[59],q[73];
-rz(5.323484153529744) q[60];
-cx q[7],q[60];
-rx(10.290150808082098) q[60];
-rz(5.323484153529744) q[61];
-cx q[4],q[61];
-rx(10.290150808082098) q[4];
-cx q[7],q[61];
-rz(5.323484153529744) q[61];
-cx q[7],q[61];
-rx(10.290150808082098) q[7];
-rx(10.290150808082098) q[61];
-rz(5.323484153529744) q[62];
-cx q[0],q[62];
-cx q[0],q[64];
-cx q[17],q[62];
-rz(5.323484153529744) q[62];
-cx q[17],q[62];
-rx(10.290150808082098) q[62];
-rz(5.323484153529744) q[64];
-cx q[0],q[64];
-rx(10.290150808082098) q[0];
-cx q[0],q[1];
-rz(2.343313350816996) q[1];
-cx q[0],q[1];
-cx q[0],q[2];
-rz(2.343313350816996) q[2];
-cx q[0],q[2];
-rx(10.841108337985759) q[2];
-cx q[10],q[64];
-rz(5.323484153529744) q[64];
-cx q[10],q[64];
-rx(10.290150808082098) q[10];
-rx(10.290150808082098) q[64];
-rz(5.323484153529744) q[65];
-cx q[5],q[65];
-rx(10.290150808082098) q[5];
-cx q[23],q[65];
-rz(5.323484153529744) q[65];
-cx q[23],q[65];
-rx(10.290150808082098) q[23];
-rx(10.290150808082098) q[65];
-rz(5.323484153529744) q[67];
-cx q[41],q[67];
-rx(10.290150808082098) q[41];
-rz(5.323484153529744) q[69];
-cx q[6],q[69];
-rx(10.290150808082098) q[6];
-rz(5.323484153529744) q[70];
-cx q[3],q[70];
-cx q[3],q[71];
-cx q[15],q[70];
-rz(5.323484153529744) q[70];
-cx q[15],q[70];
-rx(10.290150808082098) q[15];
-rx(10.290150808082098) q[70];
-rz(5.323484153529744) q[71];
-cx q[3],q[71];
-rx(10.290150808082098) q[3];
-cx q[0],q[3];
-rz(2.343313350816996) q[3];
-cx q[0],q[3];
-cx q[0],q[15];
-cx q[1],q[3];
-rz(2.343313350816996) q[3];
-cx q[1],q[3];
-cx q[1],q[4];
-rz(2.343313350816996) q[4];
-cx q[1],q[4];
-cx q[1],q[5];
-cx q[3],q[4];
-rz(2.343313350816996) q[4];
-cx q[3],q[4];
-cx q[4],q[6];
-rz(2.343313350816996) q[5];
-cx q[1],q[5];
-cx q[1],q[9];
-cx q[3],q[5];
-rz(2.343313350816996) q[5];
-cx q[3],q[5];
-cx q[3],q[7];
-rz(2.343313350816996) q[6];
-cx q[4],q[6];
-cx q[5],q[6];
-rz(2.343313350816996) q[6];
-cx q[5],q[6];
-rz(2.343313350816996) q[7];
-cx q[3],q[7];
-cx q[3],q[8];
-cx q[4],q[7];
-rz(2.343313350816996) q[7];
-cx q[4],q[7];
-cx q[4],q[10];
-rz(2.343313350816996) q[8];
-cx q[3],q[8];
-cx q[5],q[8];
-rz(2.343313350816996) q[8];
-cx q[5],q[8];
-cx q[5],q[11];
-rx(10.841108337985759) q[8];
-rz(2.343313350816996) q[9];
-cx q[1],q[9];
-cx q[3],q[9];
-rz(2.343313350816996) q[9];
-cx q[3],q[9];
-rz(2.343313350816996) q[10];
-cx q[4],q[10];
-cx q[6],q[10];
-rz(2.343313350816996) q[10];
-cx q[6],q[10];
-cx q[10],q[37];
-rz(2.343313350816996) q[11];
-cx q[5],q[11];
-cx q[6],q[11];
-rz(2.343313350816996) q[11];
-cx q[6],q[11];
-rx(10.841108337985759) q[11];
-rz(2.343313350816996) q[15];
-cx q[0],q[15];
-rz(2.343313350816996) q[37];
-cx q[10],q[37];
-cx q[10],q[41];
-rz(2.343313350816996) q[41];
-cx q[10],q[41];
-cx q[53],q[71];
-rz(5.323484153529744) q[71];
-cx q[53],q[71];
-rx(10.290150808082098) q[53];
-rx(10.290150808082098) q[71];
-rz(5.323484153529744) q[72];
-cx q[27],q[72];
-rx(10.290150808082098) q[27];
-cx q[44],q[72];
-rz(5.323484153529744) q[72];
-cx q[44],q[72];
-rx(10.290150808082098) q[44];
-rx(10.290150808082098) q[72];
-rz(5.38828136711869) q[73];
-cx q[59],q[73];
-rx(8.904299473126851) q[59];
-cx q[16],q[59];
-rz(5.323484153529744) q[59];
-cx q[16],q[59];
-cx q[32],q[59];
-rz(5.323484153529744) q[59];
-cx q[32],q[59];
-cx q[59],q[69];
-rz(5.323484153529744) q[69];
-cx q[59],q[69];
-rx(10.290150808082098) q[69];
-rx(8.904299473126851) q[73];
-cx q[16],q[73];
-rz(5.323484153529744) q[73];
-cx q[16],q[73];
-rx(10.290150808082098) q[16];
-cx q[0],q[16];
-rz(2.343313350816996) q[16];
-cx q[0],q[16];
-cx q[0],q[20];
-rz(2.343313350816996) q[20];
-cx q[0],q[20];
-cx q[59],q[73];
-rz(5.323484153529744) q[73];
-cx q[59],q[73];
-rx(10.290150808082098) q[59];
-rx(10.290150808082098) q[73];
-ry(pi/2) q[74];
-rx(pi) q[74];
-cx q[56],q[74];
-rz(5.38828136711869) q[74];
-cx q[56],q[74];
-rx(8.904299473126851) q[56];
-cx q[13],q[56];
-rz(5.323484153529744) q[56];
-cx q[13],q[56];
-cx q[13],q[68];
-cx q[45],q[56];
-rz(5.323484153529744) q[56];
-cx q[45],q[56];
-rx(10.290150808082098) q[45];
-cx q[56],q[67];
-cx q[63],q[74];
-rz(5.323484153529744) q[67];
-cx q[56],q[67];
-rx(10.290150808082098) q[67];
-rz(5.323484153529744) q[68];
-cx q[13],q[68];
-rx(10.290150808082098) q[13];
-cx q[4],q[13];
-rz(2.343313350816996) q[13];
-cx q[4],q[13];
-cx q[32],q[68];
-rz(5.323484153529744) q[68];
-cx q[32],q[68];
-rx(10.290150808082098) q[32];
-cx q[0],q[32];
-rz(2.343313350816996) q[32];
-cx q[0],q[32];
-cx q[0],q[42];
-rz(2.343313350816996) q[42];
-cx q[0],q[42];
-cx q[0],q[48];
-rz(2.343313350816996) q[48];
-cx q[0],q[48];
-cx q[0],q[51];
-rz(2.343313350816996) q[51];
-cx q[0],q[51];
-cx q[0],q[62];
-rz(2.343313350816996) q[62];
-cx q[0],q[62];
-cx q[0],q[64];
-rz(2.343313350816996) q[64];
-cx q[0],q[64];
-rx(10.841108337985759) q[0];
-rx(10.290150808082098) q[68];
-rz(5.38828136711869) q[74];
-cx q[63],q[74];
-rx(8.904299473126851) q[63];
-cx q[12],q[63];
-rz(5.323484153529744) q[63];
-cx q[12],q[63];
-rx(10.290150808082098) q[12];
-cx q[3],q[12];
-rz(2.343313350816996) q[12];
-cx q[3],q[12];
-cx q[3],q[14];
-cx q[5],q[12];
-rz(2.343313350816996) q[12];
-cx q[5],q[12];
-cx q[5],q[13];
-rz(2.343313350816996) q[13];
-cx q[5],q[13];
-rz(2.343313350816996) q[14];
-cx q[3],q[14];
-cx q[3],q[15];
-cx q[4],q[14];
-rz(2.343313350816996) q[14];
-cx q[4],q[14];
-rx(10.841108337985759) q[14];
-rz(2.343313350816996) q[15];
-cx q[3],q[15];
-cx q[3],q[16];
-cx q[15],q[20];
-rz(2.343313350816996) q[16];
-cx q[3],q[16];
-cx q[17],q[63];
-rz(2.343313350816996) q[20];
-cx q[15],q[20];
-rz(5.323484153529744) q[63];
-cx q[17],q[63];
-cx q[17],q[66];
-rz(5.323484153529744) q[66];
-cx q[17],q[66];
-rx(10.290150808082098) q[17];
-cx q[1],q[17];
-rz(2.343313350816996) q[17];
-cx q[1],q[17];
-cx q[1],q[28];
-cx q[3],q[17];
-rz(2.343313350816996) q[17];
-cx q[3],q[17];
-cx q[3],q[18];
-rz(2.343313350816996) q[18];
-cx q[3],q[18];
-cx q[3],q[19];
-cx q[4],q[18];
-rz(2.343313350816996) q[18];
-cx q[4],q[18];
-cx q[4],q[21];
-rz(2.343313350816996) q[19];
-cx q[3],q[19];
-cx q[3],q[22];
-cx q[7],q[19];
-rz(2.343313350816996) q[19];
-cx q[7],q[19];
-cx q[19],q[38];
-rz(2.343313350816996) q[21];
-cx q[4],q[21];
-cx q[4],q[27];
-cx q[15],q[21];
-rz(2.343313350816996) q[21];
-cx q[15],q[21];
-cx q[15],q[36];
-rz(2.343313350816996) q[22];
-cx q[3],q[22];
-cx q[3],q[23];
-cx q[9],q[22];
-rz(2.343313350816996) q[22];
-cx q[9],q[22];
-cx q[9],q[55];
-rx(10.841108337985759) q[22];
-rz(2.343313350816996) q[23];
-cx q[3],q[23];
-cx q[3],q[24];
-cx q[17],q[23];
-rz(2.343313350816996) q[23];
-cx q[17],q[23];
-rz(2.343313350816996) q[24];
-cx q[3],q[24];
-cx q[3],q[25];
-cx q[5],q[24];
-rz(2.343313350816996) q[24];
-cx q[5],q[24];
-cx q[5],q[33];
-cx q[24],q[54];
-rz(2.343313350816996) q[25];
-cx q[3],q[25];
-cx q[3],q[26];
-cx q[12],q[25];
-rz(2.343313350816996) q[25];
-cx q[12],q[25];
-cx q[12],q[31];
-rx(10.841108337985759) q[25];
-rz(2.343313350816996) q[26];
-cx q[3],q[26];
-cx q[21],q[26];
-rz(2.343313350816996) q[26];
-cx q[21],q[26];
-cx q[21],q[32];
-rz(2.343313350816996) q[27];
-cx q[4],q[27];
-cx q[6],q[27];
-rz(2.343313350816996) q[27];
-cx q[6],q[27];
-cx q[6],q[69];
-cx q[27],q[41];
-rz(2.343313350816996) q[28];
-cx q[1],q[28];
-cx q[1],q[29];
-cx q[3],q[28];
-rz(2.343313350816996) q[28];
-cx q[3],q[28];
-cx q[28],q[51];
-rz(2.343313350816996) q[29];
-cx q[1],q[29];
-cx q[1],q[45];
-cx q[3],q[29];
-rz(2.343313350816996) q[29];
-cx q[3],q[29];
-cx q[3],q[30];
-rx(10.841108337985759) q[29];
-rz(2.343313350816996) q[30];
-cx q[3],q[30];
-cx q[3],q[34];
-cx q[18],q[30];
-rz(2.343313350816996) q[30];
-cx q[18],q[30];
-rx(10.841108337985759) q[18];
-rz(2.343313350816996) q[31];
-cx q[12],q[31];
-cx q[26],q[31];
-rz(2.343313350816996) q[31];
-cx q[26],q[31];
-rx(10.841108337985759) q[26];
-rx(10.841108337985759) q[31];
-rz(2.343313350816996) q[32];
-cx q[21],q[32];
-rz(2.343313350816996) q[33];
-cx q[5],q[33];
-cx q[5],q[46];
-cx q[30],q[33];
-rz(2.343313350816996) q[33];
-cx q[30],q[33];
-cx q[30],q[48];
-rx(10.841108337985759) q[33];
-rz(2.343313350816996) q[34];
-cx q[3],q[34];
-cx q[3],q[35];
-cx q[12],q[34];
-rz(2.343313350816996) q[34];
-cx q[12],q[34];
-cx q[34],q[37];
-rz(2.343313350816996) q[35];
-cx q[3],q[35];
-cx q[3],q[39];
-cx q[32],q[35];
-rz(2.343313350816996) q[35];
-cx q[32],q[35];
-rx(10.841108337985759) q[35];
-rz(2.343313350816996) q[36];
-cx q[15],q[36];
-cx q[20],q[36];
-rz(2.343313350816996) q[36];
-cx q[20],q[36];
-rx(10.841108337985759) q[36];
-rz(2.343313350816996) q[37];
-cx q[34],q[37];
-rx(10.841108337985759) q[34];
-rx(10.841108337985759) q[37];
-rz(2.343313350816996) q[38];
-cx q[19],q[38];
-rx(10.841108337985759) q[19];
-cx q[21],q[38];
-rz(2.343313350816996) q[38];
-cx q[21],q[38];
-rz(2.343313350816996) q[39];
-cx q[3],q[39];
-cx q[3],q[40];
-cx q[13],q[39];
-rz(2.343313350816996) q[39];
-cx q[13],q[39];
-rx(10.841108337985759) q[39];
-rz(2.343313350816996) q[40];
-cx q[3],q[40];
-cx q[3],q[42];
-cx q[23],q[40];
-rz(2.343313350816996) q[40];
-cx q[23],q[40];
-rx(10.841108337985759) q[40];
-rz(2.343313350816996) q[41];
-cx q[27],q[41];
-cx q[27],q[72];
-cx q[41],q[67];
-rz(2.343313350816996) q[42];
-cx q[3],q[42];
-cx q[3],q[43];
-rx(10.841108337985759) q[42];
-rz(2.343313350816996) q[43];
-cx q[3],q[43];
-cx q[3],q[44];
-cx q[20],q[43];
-rz(2.343313350816996) q[43];
-cx q[20],q[43];
-rx(10.841108337985759) q[20];
-rx(10.841108337985759) q[43];
-rz(2.343313350816996) q[44];
-cx q[3],q[44];
-cx q[3],q[49];
-cx q[12],q[44];
-rz(2.343313350816996) q[44];
-cx q[12],q[44];
-rz(2.343313350816996) q[45];
-cx q[1],q[45];
-cx q[1],q[57];
-cx q[16],q[45];
-rz(2.343313350816996) q[45];
-cx q[16],q[45];
-cx q[16],q[59];
-rz(2.343313350816996) q[46];
-cx q[5],q[46];
-cx q[5],q[65];
-cx q[38],q[46];
-rz(2.343313350816996) q[46];
-cx q[38],q[46];
-rx(10.841108337985759) q[38];
-rx(10.841108337985759) q[46];
-cx q[47],q[66];
-rz(2.343313350816996) q[48];
-cx q[30],q[48];
-rx(10.841108337985759) q[30];
-rx(10.841108337985759) q[48];
-rz(2.343313350816996) q[49];
-cx q[3],q[49];
-cx q[3],q[50];
-rz(2.343313350816996) q[50];
-cx q[3],q[50];
-cx q[3],q[52];
-cx q[12],q[50];
-rz(2.343313350816996) q[50];
-cx q[12],q[50];
-rx(10.841108337985759) q[50];
-rz(2.343313350816996) q[51];
-cx q[28],q[51];
-rx(10.841108337985759) q[51];
-rz(2.343313350816996) q[52];
-cx q[3],q[52];
-cx q[10],q[52];
-rz(2.343313350816996) q[52];
-cx q[10],q[52];
-cx q[10],q[64];
-rx(10.841108337985759) q[52];
-rz(2.343313350816996) q[54];
-cx q[24],q[54];
-cx q[24],q[58];
-cx q[28],q[54];
-rz(2.343313350816996) q[54];
-cx q[28],q[54];
-rx(10.841108337985759) q[54];
-rz(2.343313350816996) q[55];
-cx q[9],q[55];
-rx(10.841108337985759) q[9];
-cx q[15],q[55];
-rz(2.343313350816996) q[55];
-cx q[15],q[55];
-rx(10.841108337985759) q[55];
-rz(2.343313350816996) q[57];
-cx q[1],q[57];
-cx q[1],q[60];
-cx q[3],q[57];
-rz(2.343313350816996) q[57];
-cx q[3],q[57];
-cx q[3],q[70];
-rx(10.841108337985759) q[57];
-rz(2.343313350816996) q[58];
-cx q[24],q[58];
-rx(10.841108337985759) q[24];
-cx q[28],q[58];
-rz(2.343313350816996) q[58];
-cx q[28],q[58];
-rx(10.841108337985759) q[28];
-rx(10.841108337985759) q[58];
-rz(2.343313350816996) q[59];
-cx q[16],q[59];
-cx q[16],q[73];
-cx q[32],q[59];
-rz(2.343313350816996) q[59];
-cx q[32],q[59];
-rz(2.343313350816996) q[60];
-cx q[1],q[60];
-rx(10.841108337985759) q[1];
-cx q[7],q[60];
-rz(2.343313350816996) q[60];
-cx q[7],q[60];
-rx(10.841108337985759) q[60];
-rz(2.343313350816996) q[64];
-cx q[10],q[64];
-rx(10.841108337985759) q[10];
-rx(10.841108337985759) q[64];
-rz(2.343313350816996) q[65];
-cx q[5],q[65];
-rx(10.841108337985759) q[5];
-cx q[23],q[65];
-rz(2.343313350816996) q[65];
-cx q[23],q[65];
-rx(10.841108337985759) q[23];
-rx(10.841108337985759) q[65];
-rz(5.323484153529744) q[66];
-cx q[47],q[66];
-rx(10.290150808082098) q[47];
-cx q[4],q[47];
-rz(2.343313350816996) q[47];
-cx q[4],q[47];
-cx q[4],q[49];
-cx q[17],q[47];
-rz(2.343313350816996) q[47];
-cx q[17],q[47];
-cx q[17],q[53];
-rz(2.343313350816996) q[49];
-cx q[4],q[49];
-cx q[4],q[61];
-rx(10.841108337985759) q[49];
-rz(2.343313350816996) q[53];
-cx q[17],q[53];
-cx q[17],q[62];
-cx q[21],q[53];
-rz(2.343313350816996) q[53];
-cx q[21],q[53];
-rx(10.841108337985759) q[21];
-rz(2.343313350816996) q[61];
-cx q[4],q[61];
-rx(10.841108337985759) q[4];
-cx q[7],q[61];
-rz(2.343313350816996) q[61];
-cx q[7],q[61];
-rx(10.841108337985759) q[7];
-rx(10.841108337985759) q[61];
-rz(2.343313350816996) q[62];
-cx q[17],q[62];
-rx(10.841108337985759) q[62];
-rx(10.290150808082098) q[66];
-rz(2.343313350816996) q[67];
-cx q[41],q[67];
-rx(10.841108337985759) q[41];
-rz(2.343313350816996) q[69];
-cx q[6],q[69];
-rx(10.841108337985759) q[6];
-cx q[59],q[69];
-rz(2.343313350816996) q[69];
-cx q[59],q[69];
-rx(10.841108337985759) q[69];
-rz(2.343313350816996) q[70];
-cx q[3],q[70];
-cx q[3],q[71];
-cx q[15],q[70];
-rz(2.343313350816996) q[70];
-cx q[15],q[70];
-rx(10.841108337985759) q[15];
-rx(10.841108337985759) q[70];
-rz(2.343313350816996) q[71];
-cx q[3],q[71];
-rx(10.841108337985759) q[3];
-cx q[53],q[71];
-rz(2.343313350816996) q[71];
-cx q[53],q[71];
-rx(10.841108337985759) q[53];
-rx(10.841108337985759) q[71];
-rz(2.343313350816996) q[72];
-cx q[27],q[72];
-rx(10.841108337985759) q[27];
-cx q[44],q[72];
-rz(2.343313350816996) q[72];
-cx q[44],q[72];
-rx(10.841108337985759) q[44];
-rx(10.841108337985759) q[72];
-rz(2.343313350816996) q[73];
-cx q[16],q[73];
-rx(10.841108337985759) q[16];
-cx q[59],q[73];
-rz(2.343313350816996) q[73];
-cx q[59],q[73];
-rx(10.841108337985759) q[59];
-rx(10.841108337985759) q[73];
-rx(8.904299473126851) q[74];
-cx q[56],q[74];
-rz(5.323484153529744) q[74];
-cx q[56],q[74];
-rx(10.290150808082098) q[56];
-cx q[13],q[56];
-rz(2.343313350816996) q[56];
-cx q[13],q[56];
-cx q[13],q[68];
-cx q[45],q[56];
-rz(2.343313350816996) q[56];
-cx q[45],q[56];
-rx(10.841108337985759) q[45];
-cx q[56],q[67];
-cx q[63],q[74];
-rz(2.343313350816996) q[67];
-cx q[56],q[67];
-rx(10.841108337985759) q[67];
-rz(2.343313350816996) q[68];
-cx q[13],q[68];
-rx(10.841108337985759) q[13];
-cx q[32],q[68];
-rz(2.343313350816996) q[68];
-cx q[32],q[68];
-rx(10.841108337985759) q[32];
-rx(10.841108337985759) q[68];
-rz(5.323484153529744) q[74];
-cx q[63],q[74];
-rx(10.290150808082098) q[63];
-cx q[12],q[63];
-rz(2.343313350816996) q[63];
-cx q[12],q[63];
-rx(10.841108337985759) q[12];
-cx q[17],q[63];
-rz(2.343313350816996) q[63];
-cx q[17],q[63];
-cx q[17],q[66];
-rz(2.343313350816996) q[66];
-cx q[17],q[66];
-rx(10.841108337985759) q[17];
-cx q[47],q[66];
-rz(2.343313350816996) q[66];
-cx q[47],q[66];
-rx(10.841108337985759) q[47];
-rx(10.841108337985759) q[66];
-rx(10.290150808082098) q[74];
-cx q[56],q[74];
-rz(2.343313350816996) q[74];
-cx q[56],q[74];
-rx(10.841108337985759) q[56];
-cx q[63],q[74];
-rz(2.343313350816996) q[74];
-cx q[63],q[74];
-rx(10.841108337985759) q[63];
-rx(10.841108337985759) q[74];
\ No newline at end of file
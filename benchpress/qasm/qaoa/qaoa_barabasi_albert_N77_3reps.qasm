@@ -1,1738 +0,0 @@
-OPENQASM 2.0;
-include "qelib1.inc";
-qreg q[77];
-ry(pi/2) q[0];
-rx(pi) q[0];
-ry(pi/2) q[1];
-rx(pi) q[1];
-cx q[0],q[1];
-rz(0.00023162815463955623) q[1];
-cx q[0],q[1];
-ry(pi/2) q[2];
-rx(pi) q[2];
-cx q[0],q[2];
-rz(0.00023162815463955623) q[2];
-cx q[0],q[2];
-rx(2.0466199162217285) q[2];
-ry(pi/2) q[3];
-rx(pi) q[3];
-cx q[0],q[3];
-rz(0.00023162815463955623) q[3];
-cx q[0],q[3];
-cx q[1],q[3];
-rz(0.00023162815463955623) q[3];
-cx q[1],q[3];
-ry(pi/2) q[4];
-rx(pi) q[4];
-cx q[1],q[4];
-rz(0.00023162815463955623) q[4];
-cx q[1],q[4];
-cx q[3],q[4];
-rz(0.00023162815463955623) q[4];
-cx q[3],q[4];
-ry(pi/2) q[5];
-rx(pi) q[5];
-cx q[1],q[5];
-rz(0.00023162815463955623) q[5];
-cx q[1],q[5];
-cx q[3],q[5];
-rz(0.00023162815463955623) q[5];
-cx q[3],q[5];
-ry(pi/2) q[6];
-rx(pi) q[6];
-cx q[4],q[6];
-rz(0.00023162815463955623) q[6];
-cx q[4],q[6];
-cx q[5],q[6];
-rz(0.00023162815463955623) q[6];
-cx q[5],q[6];
-ry(pi/2) q[7];
-rx(pi) q[7];
-cx q[3],q[7];
-rz(0.00023162815463955623) q[7];
-cx q[3],q[7];
-cx q[4],q[7];
-rz(0.00023162815463955623) q[7];
-cx q[4],q[7];
-ry(pi/2) q[8];
-rx(pi) q[8];
-cx q[3],q[8];
-rz(0.00023162815463955623) q[8];
-cx q[3],q[8];
-cx q[5],q[8];
-rz(0.00023162815463955623) q[8];
-cx q[5],q[8];
-rx(2.0466199162217285) q[8];
-ry(pi/2) q[9];
-rx(pi) q[9];
-cx q[1],q[9];
-rz(0.00023162815463955623) q[9];
-cx q[1],q[9];
-cx q[3],q[9];
-rz(0.00023162815463955623) q[9];
-cx q[3],q[9];
-ry(pi/2) q[10];
-rx(pi) q[10];
-cx q[4],q[10];
-rz(0.00023162815463955623) q[10];
-cx q[4],q[10];
-cx q[6],q[10];
-rz(0.00023162815463955623) q[10];
-cx q[6],q[10];
-ry(pi/2) q[11];
-rx(pi) q[11];
-cx q[5],q[11];
-rz(0.00023162815463955623) q[11];
-cx q[5],q[11];
-cx q[6],q[11];
-rz(0.00023162815463955623) q[11];
-cx q[6],q[11];
-rx(2.0466199162217285) q[11];
-ry(pi/2) q[12];
-rx(pi) q[12];
-cx q[3],q[12];
-rz(0.00023162815463955623) q[12];
-cx q[3],q[12];
-cx q[5],q[12];
-rz(0.00023162815463955623) q[12];
-cx q[5],q[12];
-ry(pi/2) q[13];
-rx(pi) q[13];
-cx q[4],q[13];
-rz(0.00023162815463955623) q[13];
-cx q[4],q[13];
-cx q[5],q[13];
-rz(0.00023162815463955623) q[13];
-cx q[5],q[13];
-ry(pi/2) q[14];
-rx(pi) q[14];
-cx q[3],q[14];
-rz(0.00023162815463955623) q[14];
-cx q[3],q[14];
-cx q[4],q[14];
-rz(0.00023162815463955623) q[14];
-cx q[4],q[14];
-rx(2.0466199162217285) q[14];
-ry(pi/2) q[15];
-rx(pi) q[15];
-cx q[0],q[15];
-rz(0.00023162815463955623) q[15];
-cx q[0],q[15];
-cx q[3],q[15];
-rz(0.00023162815463955623) q[15];
-cx q[3],q[15];
-ry(pi/2) q[16];
-rx(pi) q[16];
-cx q[0],q[16];
-rz(0.00023162815463955623) q[16];
-cx q[0],q[16];
-cx q[3],q[16];
-rz(0.00023162815463955623) q[16];
-cx q[3],q[16];
-ry(pi/2) q[17];
-rx(pi) q[17];
-cx q[1],q[17];
-rz(0.00023162815463955623) q[17];
-cx q[1],q[17];
-cx q[3],q[17];
-rz(0.00023162815463955623) q[17];
-cx q[3],q[17];
-ry(pi/2) q[18];
-rx(pi) q[18];
-cx q[3],q[18];
-rz(0.00023162815463955623) q[18];
-cx q[3],q[18];
-cx q[4],q[18];
-rz(0.00023162815463955623) q[18];
-cx q[4],q[18];
-ry(pi/2) q[19];
-rx(pi) q[19];
-cx q[3],q[19];
-rz(0.00023162815463955623) q[19];
-cx q[3],q[19];
-cx q[7],q[19];
-rz(0.00023162815463955623) q[19];
-cx q[7],q[19];
-ry(pi/2) q[20];
-rx(pi) q[20];
-cx q[0],q[20];
-rz(0.00023162815463955623) q[20];
-cx q[0],q[20];
-cx q[15],q[20];
-rz(0.00023162815463955623) q[20];
-cx q[15],q[20];
-ry(pi/2) q[21];
-rx(pi) q[21];
-cx q[4],q[21];
-rz(0.00023162815463955623) q[21];
-cx q[4],q[21];
-cx q[15],q[21];
-rz(0.00023162815463955623) q[21];
-cx q[15],q[21];
-ry(pi/2) q[22];
-rx(pi) q[22];
-cx q[3],q[22];
-rz(0.00023162815463955623) q[22];
-cx q[3],q[22];
-cx q[9],q[22];
-rz(0.00023162815463955623) q[22];
-cx q[9],q[22];
-rx(2.0466199162217285) q[22];
-ry(pi/2) q[23];
-rx(pi) q[23];
-cx q[3],q[23];
-rz(0.00023162815463955623) q[23];
-cx q[3],q[23];
-cx q[17],q[23];
-rz(0.00023162815463955623) q[23];
-cx q[17],q[23];
-ry(pi/2) q[24];
-rx(pi) q[24];
-cx q[3],q[24];
-rz(0.00023162815463955623) q[24];
-cx q[3],q[24];
-cx q[5],q[24];
-rz(0.00023162815463955623) q[24];
-cx q[5],q[24];
-ry(pi/2) q[25];
-rx(pi) q[25];
-cx q[3],q[25];
-rz(0.00023162815463955623) q[25];
-cx q[3],q[25];
-cx q[12],q[25];
-rz(0.00023162815463955623) q[25];
-cx q[12],q[25];
-rx(2.0466199162217285) q[25];
-ry(pi/2) q[26];
-rx(pi) q[26];
-cx q[3],q[26];
-rz(0.00023162815463955623) q[26];
-cx q[3],q[26];
-cx q[21],q[26];
-rz(0.00023162815463955623) q[26];
-cx q[21],q[26];
-ry(pi/2) q[27];
-rx(pi) q[27];
-cx q[4],q[27];
-rz(0.00023162815463955623) q[27];
-cx q[4],q[27];
-cx q[6],q[27];
-rz(0.00023162815463955623) q[27];
-cx q[6],q[27];
-ry(pi/2) q[28];
-rx(pi) q[28];
-cx q[1],q[28];
-rz(0.00023162815463955623) q[28];
-cx q[1],q[28];
-cx q[3],q[28];
-rz(0.00023162815463955623) q[28];
-cx q[3],q[28];
-ry(pi/2) q[29];
-rx(pi) q[29];
-cx q[1],q[29];
-rz(0.00023162815463955623) q[29];
-cx q[1],q[29];
-cx q[3],q[29];
-rz(0.00023162815463955623) q[29];
-cx q[3],q[29];
-rx(2.0466199162217285) q[29];
-ry(pi/2) q[30];
-rx(pi) q[30];
-cx q[3],q[30];
-rz(0.00023162815463955623) q[30];
-cx q[3],q[30];
-cx q[18],q[30];
-rz(0.00023162815463955623) q[30];
-cx q[18],q[30];
-rx(2.0466199162217285) q[18];
-ry(pi/2) q[31];
-rx(pi) q[31];
-cx q[12],q[31];
-rz(0.00023162815463955623) q[31];
-cx q[12],q[31];
-cx q[26],q[31];
-rz(0.00023162815463955623) q[31];
-cx q[26],q[31];
-rx(2.0466199162217285) q[26];
-rx(2.0466199162217285) q[31];
-ry(pi/2) q[32];
-rx(pi) q[32];
-cx q[0],q[32];
-rz(0.00023162815463955623) q[32];
-cx q[0],q[32];
-cx q[21],q[32];
-rz(0.00023162815463955623) q[32];
-cx q[21],q[32];
-ry(pi/2) q[33];
-rx(pi) q[33];
-cx q[5],q[33];
-rz(0.00023162815463955623) q[33];
-cx q[5],q[33];
-cx q[30],q[33];
-rz(0.00023162815463955623) q[33];
-cx q[30],q[33];
-rx(2.0466199162217285) q[33];
-ry(pi/2) q[34];
-rx(pi) q[34];
-cx q[3],q[34];
-rz(0.00023162815463955623) q[34];
-cx q[3],q[34];
-cx q[12],q[34];
-rz(0.00023162815463955623) q[34];
-cx q[12],q[34];
-ry(pi/2) q[35];
-rx(pi) q[35];
-cx q[3],q[35];
-rz(0.00023162815463955623) q[35];
-cx q[3],q[35];
-cx q[32],q[35];
-rz(0.00023162815463955623) q[35];
-cx q[32],q[35];
-rx(2.0466199162217285) q[35];
-ry(pi/2) q[36];
-rx(pi) q[36];
-cx q[15],q[36];
-rz(0.00023162815463955623) q[36];
-cx q[15],q[36];
-cx q[20],q[36];
-rz(0.00023162815463955623) q[36];
-cx q[20],q[36];
-rx(2.0466199162217285) q[36];
-ry(pi/2) q[37];
-rx(pi) q[37];
-cx q[10],q[37];
-rz(0.00023162815463955623) q[37];
-cx q[10],q[37];
-cx q[34],q[37];
-rz(0.00023162815463955623) q[37];
-cx q[34],q[37];
-rx(2.0466199162217285) q[34];
-rx(2.0466199162217285) q[37];
-ry(pi/2) q[38];
-rx(pi) q[38];
-cx q[19],q[38];
-rz(0.00023162815463955623) q[38];
-cx q[19],q[38];
-rx(2.0466199162217285) q[19];
-cx q[21],q[38];
-rz(0.00023162815463955623) q[38];
-cx q[21],q[38];
-ry(pi/2) q[39];
-rx(pi) q[39];
-cx q[3],q[39];
-rz(0.00023162815463955623) q[39];
-cx q[3],q[39];
-cx q[13],q[39];
-rz(0.00023162815463955623) q[39];
-cx q[13],q[39];
-rx(2.0466199162217285) q[39];
-ry(pi/2) q[40];
-rx(pi) q[40];
-cx q[3],q[40];
-rz(0.00023162815463955623) q[40];
-cx q[3],q[40];
-cx q[23],q[40];
-rz(0.00023162815463955623) q[40];
-cx q[23],q[40];
-rx(2.0466199162217285) q[40];
-ry(pi/2) q[41];
-rx(pi) q[41];
-cx q[10],q[41];
-rz(0.00023162815463955623) q[41];
-cx q[10],q[41];
-cx q[27],q[41];
-rz(0.00023162815463955623) q[41];
-cx q[27],q[41];
-ry(pi/2) q[42];
-rx(pi) q[42];
-cx q[0],q[42];
-rz(0.00023162815463955623) q[42];
-cx q[0],q[42];
-cx q[3],q[42];
-rz(0.00023162815463955623) q[42];
-cx q[3],q[42];
-rx(2.0466199162217285) q[42];
-ry(pi/2) q[43];
-rx(pi) q[43];
-cx q[3],q[43];
-rz(0.00023162815463955623) q[43];
-cx q[3],q[43];
-cx q[20],q[43];
-rz(0.00023162815463955623) q[43];
-cx q[20],q[43];
-rx(2.0466199162217285) q[20];
-rx(2.0466199162217285) q[43];
-ry(pi/2) q[44];
-rx(pi) q[44];
-cx q[3],q[44];
-rz(0.00023162815463955623) q[44];
-cx q[3],q[44];
-cx q[12],q[44];
-rz(0.00023162815463955623) q[44];
-cx q[12],q[44];
-ry(pi/2) q[45];
-rx(pi) q[45];
-cx q[1],q[45];
-rz(0.00023162815463955623) q[45];
-cx q[1],q[45];
-cx q[16],q[45];
-rz(0.00023162815463955623) q[45];
-cx q[16],q[45];
-ry(pi/2) q[46];
-rx(pi) q[46];
-cx q[5],q[46];
-rz(0.00023162815463955623) q[46];
-cx q[5],q[46];
-cx q[38],q[46];
-rz(0.00023162815463955623) q[46];
-cx q[38],q[46];
-rx(2.0466199162217285) q[38];
-rx(2.0466199162217285) q[46];
-ry(pi/2) q[47];
-rx(pi) q[47];
-cx q[4],q[47];
-rz(0.00023162815463955623) q[47];
-cx q[4],q[47];
-cx q[17],q[47];
-rz(0.00023162815463955623) q[47];
-cx q[17],q[47];
-ry(pi/2) q[48];
-rx(pi) q[48];
-cx q[0],q[48];
-rz(0.00023162815463955623) q[48];
-cx q[0],q[48];
-cx q[30],q[48];
-rz(0.00023162815463955623) q[48];
-cx q[30],q[48];
-rx(2.0466199162217285) q[30];
-rx(2.0466199162217285) q[48];
-ry(pi/2) q[49];
-rx(pi) q[49];
-cx q[3],q[49];
-rz(0.00023162815463955623) q[49];
-cx q[3],q[49];
-cx q[4],q[49];
-rz(0.00023162815463955623) q[49];
-cx q[4],q[49];
-rx(2.0466199162217285) q[49];
-ry(pi/2) q[50];
-rx(pi) q[50];
-cx q[3],q[50];
-rz(0.00023162815463955623) q[50];
-cx q[3],q[50];
-cx q[12],q[50];
-rz(0.00023162815463955623) q[50];
-cx q[12],q[50];
-rx(2.0466199162217285) q[50];
-ry(pi/2) q[51];
-rx(pi) q[51];
-cx q[0],q[51];
-rz(0.00023162815463955623) q[51];
-cx q[0],q[51];
-cx q[28],q[51];
-rz(0.00023162815463955623) q[51];
-cx q[28],q[51];
-rx(2.0466199162217285) q[51];
-ry(pi/2) q[52];
-rx(pi) q[52];
-cx q[3],q[52];
-rz(0.00023162815463955623) q[52];
-cx q[3],q[52];
-cx q[10],q[52];
-rz(0.00023162815463955623) q[52];
-cx q[10],q[52];
-rx(2.0466199162217285) q[52];
-ry(pi/2) q[53];
-rx(pi) q[53];
-cx q[17],q[53];
-rz(0.00023162815463955623) q[53];
-cx q[17],q[53];
-cx q[21],q[53];
-rz(0.00023162815463955623) q[53];
-cx q[21],q[53];
-ry(pi/2) q[54];
-rx(pi) q[54];
-cx q[24],q[54];
-rz(0.00023162815463955623) q[54];
-cx q[24],q[54];
-cx q[28],q[54];
-rz(0.00023162815463955623) q[54];
-cx q[28],q[54];
-rx(2.0466199162217285) q[54];
-ry(pi/2) q[55];
-rx(pi) q[55];
-cx q[9],q[55];
-rz(0.00023162815463955623) q[55];
-cx q[9],q[55];
-rx(2.0466199162217285) q[9];
-cx q[15],q[55];
-rz(0.00023162815463955623) q[55];
-cx q[15],q[55];
-rx(2.0466199162217285) q[55];
-ry(pi/2) q[56];
-rx(pi) q[56];
-cx q[13],q[56];
-rz(0.00023162815463955623) q[56];
-cx q[13],q[56];
-cx q[45],q[56];
-rz(0.00023162815463955623) q[56];
-cx q[45],q[56];
-rx(2.0466199162217285) q[45];
-ry(pi/2) q[57];
-rx(pi) q[57];
-cx q[1],q[57];
-rz(0.00023162815463955623) q[57];
-cx q[1],q[57];
-cx q[3],q[57];
-rz(0.00023162815463955623) q[57];
-cx q[3],q[57];
-rx(2.0466199162217285) q[57];
-ry(pi/2) q[58];
-rx(pi) q[58];
-cx q[24],q[58];
-rz(0.00023162815463955623) q[58];
-cx q[24],q[58];
-rx(2.0466199162217285) q[24];
-cx q[28],q[58];
-rz(0.00023162815463955623) q[58];
-cx q[28],q[58];
-rx(2.0466199162217285) q[28];
-rx(2.0466199162217285) q[58];
-ry(pi/2) q[59];
-rx(pi) q[59];
-cx q[16],q[59];
-rz(0.00023162815463955623) q[59];
-cx q[16],q[59];
-cx q[32],q[59];
-rz(0.00023162815463955623) q[59];
-cx q[32],q[59];
-ry(pi/2) q[60];
-rx(pi) q[60];
-cx q[1],q[60];
-rz(0.00023162815463955623) q[60];
-cx q[1],q[60];
-rx(2.0466199162217285) q[1];
-cx q[7],q[60];
-rz(0.00023162815463955623) q[60];
-cx q[7],q[60];
-rx(2.0466199162217285) q[60];
-ry(pi/2) q[61];
-rx(pi) q[61];
-cx q[4],q[61];
-rz(0.00023162815463955623) q[61];
-cx q[4],q[61];
-rx(2.0466199162217285) q[4];
-cx q[7],q[61];
-rz(0.00023162815463955623) q[61];
-cx q[7],q[61];
-rx(2.0466199162217285) q[7];
-rx(2.0466199162217285) q[61];
-ry(pi/2) q[62];
-rx(pi) q[62];
-cx q[0],q[62];
-rz(0.00023162815463955623) q[62];
-cx q[0],q[62];
-cx q[17],q[62];
-rz(0.00023162815463955623) q[62];
-cx q[17],q[62];
-rx(2.0466199162217285) q[62];
-ry(pi/2) q[63];
-rx(pi) q[63];
-cx q[12],q[63];
-rz(0.00023162815463955623) q[63];
-cx q[12],q[63];
-rx(2.0466199162217285) q[12];
-cx q[17],q[63];
-rz(0.00023162815463955623) q[63];
-cx q[17],q[63];
-ry(pi/2) q[64];
-rx(pi) q[64];
-cx q[0],q[64];
-rz(0.00023162815463955623) q[64];
-cx q[0],q[64];
-cx q[10],q[64];
-rz(0.00023162815463955623) q[64];
-cx q[10],q[64];
-rx(2.0466199162217285) q[10];
-rx(2.0466199162217285) q[64];
-ry(pi/2) q[65];
-rx(pi) q[65];
-cx q[5],q[65];
-rz(0.00023162815463955623) q[65];
-cx q[5],q[65];
-cx q[23],q[65];
-rz(0.00023162815463955623) q[65];
-cx q[23],q[65];
-rx(2.0466199162217285) q[23];
-rx(2.0466199162217285) q[65];
-ry(pi/2) q[66];
-rx(pi) q[66];
-cx q[17],q[66];
-rz(0.00023162815463955623) q[66];
-cx q[17],q[66];
-rx(2.0466199162217285) q[17];
-cx q[47],q[66];
-rz(0.00023162815463955623) q[66];
-cx q[47],q[66];
-rx(2.0466199162217285) q[47];
-rx(2.0466199162217285) q[66];
-ry(pi/2) q[67];
-rx(pi) q[67];
-cx q[41],q[67];
-rz(0.00023162815463955623) q[67];
-cx q[41],q[67];
-rx(2.0466199162217285) q[41];
-cx q[56],q[67];
-rz(0.00023162815463955623) q[67];
-cx q[56],q[67];
-rx(2.0466199162217285) q[67];
-ry(pi/2) q[68];
-rx(pi) q[68];
-cx q[13],q[68];
-rz(0.00023162815463955623) q[68];
-cx q[13],q[68];
-rx(2.0466199162217285) q[13];
-cx q[32],q[68];
-rz(0.00023162815463955623) q[68];
-cx q[32],q[68];
-rx(2.0466199162217285) q[32];
-rx(2.0466199162217285) q[68];
-ry(pi/2) q[69];
-rx(pi) q[69];
-cx q[6],q[69];
-rz(0.00023162815463955623) q[69];
-cx q[6],q[69];
-cx q[59],q[69];
-rz(0.00023162815463955623) q[69];
-cx q[59],q[69];
-rx(2.0466199162217285) q[69];
-ry(pi/2) q[70];
-rx(pi) q[70];
-cx q[3],q[70];
-rz(0.00023162815463955623) q[70];
-cx q[3],q[70];
-cx q[15],q[70];
-rz(0.00023162815463955623) q[70];
-cx q[15],q[70];
-rx(2.0466199162217285) q[15];
-rx(2.0466199162217285) q[70];
-ry(pi/2) q[71];
-rx(pi) q[71];
-cx q[3],q[71];
-rz(0.00023162815463955623) q[71];
-cx q[3],q[71];
-rx(2.0466199162217285) q[3];
-cx q[53],q[71];
-rz(0.00023162815463955623) q[71];
-cx q[53],q[71];
-rx(2.0466199162217285) q[53];
-rx(2.0466199162217285) q[71];
-ry(pi/2) q[72];
-rx(pi) q[72];
-cx q[27],q[72];
-rz(0.00023162815463955623) q[72];
-cx q[27],q[72];
-rx(2.0466199162217285) q[27];
-cx q[44],q[72];
-rz(0.00023162815463955623) q[72];
-cx q[44],q[72];
-rx(2.0466199162217285) q[44];
-rx(2.0466199162217285) q[72];
-ry(pi/2) q[73];
-rx(pi) q[73];
-cx q[16],q[73];
-rz(0.00023162815463955623) q[73];
-cx q[16],q[73];
-rx(2.0466199162217285) q[16];
-cx q[59],q[73];
-rz(0.00023162815463955623) q[73];
-cx q[59],q[73];
-rx(2.0466199162217285) q[59];
-rx(2.0466199162217285) q[73];
-ry(pi/2) q[74];
-rx(pi) q[74];
-cx q[56],q[74];
-rz(0.00023162815463955623) q[74];
-cx q[56],q[74];
-rx(2.0466199162217285) q[56];
-cx q[63],q[74];
-rz(0.00023162815463955623) q[74];
-cx q[63],q[74];
-rx(2.0466199162217285) q[63];
-rx(2.0466199162217285) q[74];
-ry(pi/2) q[75];
-rx(pi) q[75];
-cx q[0],q[75];
-rz(0.00023162815463955623) q[75];
-cx q[0],q[75];
-rx(2.0466199162217285) q[0];
-cx q[0],q[1];
-rz(1.4914993860796162) q[1];
-cx q[0],q[1];
-cx q[0],q[2];
-rz(1.4914993860796162) q[2];
-cx q[0],q[2];
-cx q[0],q[3];
-rx(11.744590366627444) q[2];
-rz(1.4914993860796162) q[3];
-cx q[0],q[3];
-cx q[0],q[15];
-cx q[1],q[3];
-rz(1.4914993860796162) q[3];
-cx q[1],q[3];
-cx q[1],q[4];
-rz(1.4914993860796162) q[4];
-cx q[1],q[4];
-cx q[3],q[4];
-rz(1.4914993860796162) q[4];
-cx q[3],q[4];
-rz(1.4914993860796162) q[15];
-cx q[0],q[15];
-cx q[0],q[16];
-rz(1.4914993860796162) q[16];
-cx q[0],q[16];
-cx q[0],q[20];
-rz(1.4914993860796162) q[20];
-cx q[0],q[20];
-cx q[0],q[32];
-cx q[21],q[75];
-rz(1.4914993860796162) q[32];
-cx q[0],q[32];
-cx q[0],q[42];
-rz(1.4914993860796162) q[42];
-cx q[0],q[42];
-cx q[0],q[48];
-rz(1.4914993860796162) q[48];
-cx q[0],q[48];
-cx q[0],q[51];
-rz(1.4914993860796162) q[51];
-cx q[0],q[51];
-cx q[0],q[62];
-rz(1.4914993860796162) q[62];
-cx q[0],q[62];
-cx q[0],q[64];
-rz(1.4914993860796162) q[64];
-cx q[0],q[64];
-rz(0.00023162815463955623) q[75];
-cx q[21],q[75];
-rx(2.0466199162217285) q[21];
-rx(2.0466199162217285) q[75];
-cx q[0],q[75];
-rz(1.4914993860796162) q[75];
-cx q[0],q[75];
-rx(11.744590366627444) q[0];
-ry(pi/2) q[76];
-rx(pi) q[76];
-cx q[5],q[76];
-rz(0.00023162815463955623) q[76];
-cx q[5],q[76];
-rx(2.0466199162217285) q[5];
-cx q[1],q[5];
-rz(1.4914993860796162) q[5];
-cx q[1],q[5];
-cx q[1],q[9];
-cx q[3],q[5];
-rz(1.4914993860796162) q[5];
-cx q[3],q[5];
-cx q[3],q[7];
-cx q[6],q[76];
-rz(1.4914993860796162) q[7];
-cx q[3],q[7];
-cx q[3],q[8];
-rz(1.4914993860796162) q[8];
-cx q[3],q[8];
-rz(1.4914993860796162) q[9];
-cx q[1],q[9];
-cx q[1],q[17];
-cx q[3],q[9];
-rz(1.4914993860796162) q[9];
-cx q[3],q[9];
-cx q[3],q[12];
-rz(1.4914993860796162) q[12];
-cx q[3],q[12];
-cx q[3],q[14];
-rz(1.4914993860796162) q[14];
-cx q[3],q[14];
-cx q[3],q[15];
-rz(1.4914993860796162) q[15];
-cx q[3],q[15];
-cx q[3],q[16];
-cx q[15],q[20];
-rz(1.4914993860796162) q[16];
-cx q[3],q[16];
-rz(1.4914993860796162) q[17];
-cx q[1],q[17];
-cx q[1],q[28];
-cx q[3],q[17];
-rz(1.4914993860796162) q[17];
-cx q[3],q[17];
-cx q[3],q[18];
-rz(1.4914993860796162) q[18];
-cx q[3],q[18];
-cx q[3],q[19];
-rz(1.4914993860796162) q[19];
-cx q[3],q[19];
-cx q[3],q[22];
-rz(1.4914993860796162) q[20];
-cx q[15],q[20];
-rz(1.4914993860796162) q[22];
-cx q[3],q[22];
-cx q[3],q[23];
-cx q[9],q[22];
-rz(1.4914993860796162) q[22];
-cx q[9],q[22];
-cx q[9],q[55];
-rx(11.744590366627444) q[22];
-rz(1.4914993860796162) q[23];
-cx q[3],q[23];
-cx q[3],q[24];
-cx q[17],q[23];
-rz(1.4914993860796162) q[23];
-cx q[17],q[23];
-rz(1.4914993860796162) q[24];
-cx q[3],q[24];
-cx q[3],q[25];
-rz(1.4914993860796162) q[25];
-cx q[3],q[25];
-cx q[3],q[26];
-rz(1.4914993860796162) q[26];
-cx q[3],q[26];
-rz(1.4914993860796162) q[28];
-cx q[1],q[28];
-cx q[1],q[29];
-cx q[3],q[28];
-rz(1.4914993860796162) q[28];
-cx q[3],q[28];
-cx q[28],q[51];
-rz(1.4914993860796162) q[29];
-cx q[1],q[29];
-cx q[1],q[45];
-cx q[3],q[29];
-rz(1.4914993860796162) q[29];
-cx q[3],q[29];
-cx q[3],q[30];
-rx(11.744590366627444) q[29];
-rz(1.4914993860796162) q[30];
-cx q[3],q[30];
-cx q[3],q[34];
-rz(1.4914993860796162) q[34];
-cx q[3],q[34];
-cx q[3],q[35];
-rz(1.4914993860796162) q[35];
-cx q[3],q[35];
-cx q[3],q[39];
-rz(1.4914993860796162) q[39];
-cx q[3],q[39];
-cx q[3],q[40];
-rz(1.4914993860796162) q[40];
-cx q[3],q[40];
-cx q[3],q[42];
-cx q[23],q[40];
-rz(1.4914993860796162) q[40];
-cx q[23],q[40];
-rx(11.744590366627444) q[40];
-rz(1.4914993860796162) q[42];
-cx q[3],q[42];
-cx q[3],q[43];
-rx(11.744590366627444) q[42];
-rz(1.4914993860796162) q[43];
-cx q[3],q[43];
-cx q[3],q[44];
-rz(1.4914993860796162) q[44];
-cx q[3],q[44];
-cx q[3],q[49];
-rz(1.4914993860796162) q[45];
-cx q[1],q[45];
-cx q[1],q[57];
-cx q[16],q[45];
-rz(1.4914993860796162) q[45];
-cx q[16],q[45];
-cx q[16],q[59];
-rz(1.4914993860796162) q[49];
-cx q[3],q[49];
-cx q[3],q[50];
-rz(1.4914993860796162) q[50];
-cx q[3],q[50];
-cx q[3],q[52];
-rz(1.4914993860796162) q[51];
-cx q[28],q[51];
-rx(11.744590366627444) q[51];
-rz(1.4914993860796162) q[52];
-cx q[3],q[52];
-rz(1.4914993860796162) q[55];
-cx q[9],q[55];
-rx(11.744590366627444) q[9];
-rz(1.4914993860796162) q[57];
-cx q[1],q[57];
-cx q[1],q[60];
-cx q[3],q[57];
-rz(1.4914993860796162) q[57];
-cx q[3],q[57];
-cx q[3],q[70];
-rx(11.744590366627444) q[57];
-rz(1.4914993860796162) q[59];
-cx q[16],q[59];
-cx q[16],q[73];
-rz(1.4914993860796162) q[60];
-cx q[1],q[60];
-rx(11.744590366627444) q[1];
-cx q[0],q[1];
-rz(4.096711442877084) q[1];
-cx q[0],q[1];
-cx q[0],q[2];
-rz(4.096711442877084) q[2];
-cx q[0],q[2];
-rx(10.278781847450702) q[2];
-rz(1.4914993860796162) q[70];
-cx q[3],q[70];
-cx q[3],q[71];
-rz(1.4914993860796162) q[71];
-cx q[3],q[71];
-rx(11.744590366627444) q[3];
-cx q[0],q[3];
-rz(4.096711442877084) q[3];
-cx q[0],q[3];
-cx q[1],q[3];
-rz(4.096711442877084) q[3];
-cx q[1],q[3];
-rz(1.4914993860796162) q[73];
-cx q[16],q[73];
-rx(11.744590366627444) q[16];
-rz(0.00023162815463955623) q[76];
-cx q[6],q[76];
-rx(2.0466199162217285) q[6];
-cx q[4],q[6];
-rz(1.4914993860796162) q[6];
-cx q[4],q[6];
-cx q[4],q[7];
-cx q[5],q[6];
-rz(1.4914993860796162) q[6];
-cx q[5],q[6];
-cx q[5],q[8];
-rz(1.4914993860796162) q[7];
-cx q[4],q[7];
-cx q[4],q[10];
-cx q[7],q[19];
-rz(1.4914993860796162) q[8];
-cx q[5],q[8];
-cx q[5],q[11];
-rx(11.744590366627444) q[8];
-rz(1.4914993860796162) q[10];
-cx q[4],q[10];
-cx q[4],q[13];
-cx q[6],q[10];
-rz(1.4914993860796162) q[10];
-cx q[6],q[10];
-cx q[10],q[37];
-rz(1.4914993860796162) q[11];
-cx q[5],q[11];
-cx q[5],q[12];
-cx q[6],q[11];
-rz(1.4914993860796162) q[11];
-cx q[6],q[11];
-rx(11.744590366627444) q[11];
-rz(1.4914993860796162) q[12];
-cx q[5],q[12];
-cx q[12],q[25];
-rz(1.4914993860796162) q[13];
-cx q[4],q[13];
-cx q[4],q[14];
-cx q[5],q[13];
-rz(1.4914993860796162) q[13];
-cx q[5],q[13];
-cx q[5],q[24];
-cx q[13],q[39];
-rz(1.4914993860796162) q[14];
-cx q[4],q[14];
-cx q[4],q[18];
-rx(11.744590366627444) q[14];
-rz(1.4914993860796162) q[18];
-cx q[4],q[18];
-cx q[4],q[21];
-cx q[18],q[30];
-rz(1.4914993860796162) q[19];
-cx q[7],q[19];
-cx q[7],q[60];
-cx q[19],q[38];
-rz(1.4914993860796162) q[21];
-cx q[4],q[21];
-cx q[4],q[27];
-cx q[15],q[21];
-rz(1.4914993860796162) q[21];
-cx q[15],q[21];
-cx q[15],q[36];
-cx q[21],q[26];
-rz(1.4914993860796162) q[24];
-cx q[5],q[24];
-cx q[5],q[33];
-cx q[24],q[54];
-rz(1.4914993860796162) q[25];
-cx q[12],q[25];
-cx q[12],q[31];
-rx(11.744590366627444) q[25];
-rz(1.4914993860796162) q[26];
-cx q[21],q[26];
-cx q[21],q[32];
-rz(1.4914993860796162) q[27];
-cx q[4],q[27];
-cx q[4],q[47];
-cx q[6],q[27];
-rz(1.4914993860796162) q[27];
-cx q[6],q[27];
-cx q[6],q[69];
-rz(1.4914993860796162) q[30];
-cx q[18],q[30];
-rx(11.744590366627444) q[18];
-rz(1.4914993860796162) q[31];
-cx q[12],q[31];
-cx q[12],q[34];
-cx q[26],q[31];
-rz(1.4914993860796162) q[31];
-cx q[26],q[31];
-rx(11.744590366627444) q[26];
-rx(11.744590366627444) q[31];
-rz(1.4914993860796162) q[32];
-cx q[21],q[32];
-cx q[32],q[35];
-rz(1.4914993860796162) q[33];
-cx q[5],q[33];
-cx q[5],q[46];
-cx q[30],q[33];
-rz(1.4914993860796162) q[33];
-cx q[30],q[33];
-cx q[30],q[48];
-rx(11.744590366627444) q[33];
-rz(1.4914993860796162) q[34];
-cx q[12],q[34];
-cx q[12],q[44];
-rz(1.4914993860796162) q[35];
-cx q[32],q[35];
-cx q[32],q[59];
-rx(11.744590366627444) q[35];
-rz(1.4914993860796162) q[36];
-cx q[15],q[36];
-cx q[15],q[55];
-cx q[20],q[36];
-rz(1.4914993860796162) q[36];
-cx q[20],q[36];
-cx q[20],q[43];
-rx(11.744590366627444) q[36];
-rz(1.4914993860796162) q[37];
-cx q[10],q[37];
-cx q[10],q[41];
-cx q[34],q[37];
-rz(1.4914993860796162) q[37];
-cx q[34],q[37];
-rx(11.744590366627444) q[34];
-rx(11.744590366627444) q[37];
-rz(1.4914993860796162) q[38];
-cx q[19],q[38];
-rx(11.744590366627444) q[19];
-cx q[21],q[38];
-rz(1.4914993860796162) q[38];
-cx q[21],q[38];
-rz(1.4914993860796162) q[39];
-cx q[13],q[39];
-cx q[13],q[56];
-rx(11.744590366627444) q[39];
-rz(1.4914993860796162) q[41];
-cx q[10],q[41];
-cx q[10],q[52];
-cx q[27],q[41];
-rz(1.4914993860796162) q[41];
-cx q[27],q[41];
-cx q[27],q[72];
-cx q[41],q[67];
-rz(1.4914993860796162) q[43];
-cx q[20],q[43];
-rx(11.744590366627444) q[20];
-rx(11.744590366627444) q[43];
-rz(1.4914993860796162) q[44];
-cx q[12],q[44];
-cx q[12],q[50];
-rz(1.4914993860796162) q[46];
-cx q[5],q[46];
-cx q[5],q[65];
-cx q[38],q[46];
-rz(1.4914993860796162) q[46];
-cx q[38],q[46];
-rx(11.744590366627444) q[38];
-rx(11.744590366627444) q[46];
-rz(1.4914993860796162) q[47];
-cx q[4],q[47];
-cx q[4],q[49];
-cx q[17],q[47];
-rz(1.4914993860796162) q[47];
-cx q[17],q[47];
-cx q[17],q[53];
-rz(1.4914993860796162) q[48];
-cx q[30],q[48];
-rx(11.744590366627444) q[30];
-rx(11.744590366627444) q[48];
-rz(1.4914993860796162) q[49];
-cx q[4],q[49];
-cx q[4],q[61];
-rx(11.744590366627444) q[49];
-rz(1.4914993860796162) q[50];
-cx q[12],q[50];
-cx q[12],q[63];
-rx(11.744590366627444) q[50];
-rz(1.4914993860796162) q[52];
-cx q[10],q[52];
-cx q[10],q[64];
-rx(11.744590366627444) q[52];
-rz(1.4914993860796162) q[53];
-cx q[17],q[53];
-cx q[17],q[62];
-cx q[21],q[53];
-rz(1.4914993860796162) q[53];
-cx q[21],q[53];
-cx q[21],q[75];
-cx q[53],q[71];
-rz(1.4914993860796162) q[54];
-cx q[24],q[54];
-cx q[24],q[58];
-cx q[28],q[54];
-rz(1.4914993860796162) q[54];
-cx q[28],q[54];
-rx(11.744590366627444) q[54];
-rz(1.4914993860796162) q[55];
-cx q[15],q[55];
-cx q[15],q[70];
-rx(11.744590366627444) q[55];
-rz(1.4914993860796162) q[56];
-cx q[13],q[56];
-cx q[13],q[68];
-cx q[45],q[56];
-rz(1.4914993860796162) q[56];
-cx q[45],q[56];
-rx(11.744590366627444) q[45];
-rz(1.4914993860796162) q[58];
-cx q[24],q[58];
-rx(11.744590366627444) q[24];
-cx q[28],q[58];
-rz(1.4914993860796162) q[58];
-cx q[28],q[58];
-rx(11.744590366627444) q[28];
-rx(11.744590366627444) q[58];
-rz(1.4914993860796162) q[59];
-cx q[32],q[59];
-rz(1.4914993860796162) q[60];
-cx q[7],q[60];
-rx(11.744590366627444) q[60];
-rz(1.4914993860796162) q[61];
-cx q[4],q[61];
-rx(11.744590366627444) q[4];
-cx q[1],q[4];
-rz(4.096711442877084) q[4];
-cx q[1],q[4];
-cx q[3],q[4];
-rz(4.096711442877084) q[4];
-cx q[3],q[4];
-cx q[7],q[61];
-rz(1.4914993860796162) q[61];
-cx q[7],q[61];
-rx(11.744590366627444) q[7];
-rx(11.744590366627444) q[61];
-rz(1.4914993860796162) q[62];
-cx q[17],q[62];
-rx(11.744590366627444) q[62];
-rz(1.4914993860796162) q[63];
-cx q[12],q[63];
-rx(11.744590366627444) q[12];
-cx q[17],q[63];
-rz(1.4914993860796162) q[63];
-cx q[17],q[63];
-cx q[17],q[66];
-rz(1.4914993860796162) q[64];
-cx q[10],q[64];
-rx(11.744590366627444) q[10];
-rx(11.744590366627444) q[64];
-rz(1.4914993860796162) q[65];
-cx q[5],q[65];
-cx q[23],q[65];
-rz(1.4914993860796162) q[65];
-cx q[23],q[65];
-rx(11.744590366627444) q[23];
-rx(11.744590366627444) q[65];
-rz(1.4914993860796162) q[66];
-cx q[17],q[66];
-rx(11.744590366627444) q[17];
-cx q[47],q[66];
-rz(1.4914993860796162) q[66];
-cx q[47],q[66];
-rx(11.744590366627444) q[47];
-rx(11.744590366627444) q[66];
-rz(1.4914993860796162) q[67];
-cx q[41],q[67];
-rx(11.744590366627444) q[41];
-cx q[56],q[67];
-rz(1.4914993860796162) q[67];
-cx q[56],q[67];
-cx q[56],q[74];
-rx(11.744590366627444) q[67];
-rz(1.4914993860796162) q[68];
-cx q[13],q[68];
-rx(11.744590366627444) q[13];
-cx q[32],q[68];
-rz(1.4914993860796162) q[68];
-cx q[32],q[68];
-rx(11.744590366627444) q[32];
-rx(11.744590366627444) q[68];
-rz(1.4914993860796162) q[69];
-cx q[6],q[69];
-cx q[59],q[69];
-rz(1.4914993860796162) q[69];
-cx q[59],q[69];
-cx q[59],q[73];
-rx(11.744590366627444) q[69];
-rz(1.4914993860796162) q[70];
-cx q[15],q[70];
-rx(11.744590366627444) q[15];
-cx q[0],q[15];
-rz(4.096711442877084) q[15];
-cx q[0],q[15];
-cx q[0],q[16];
-rz(4.096711442877084) q[16];
-cx q[0],q[16];
-cx q[0],q[20];
-rz(4.096711442877084) q[20];
-cx q[0],q[20];
-cx q[0],q[32];
-rz(4.096711442877084) q[32];
-cx q[0],q[32];
-cx q[0],q[42];
-rz(4.096711442877084) q[42];
-cx q[0],q[42];
-cx q[0],q[48];
-rz(4.096711442877084) q[48];
-cx q[0],q[48];
-cx q[0],q[51];
-rz(4.096711442877084) q[51];
-cx q[0],q[51];
-cx q[0],q[62];
-rz(4.096711442877084) q[62];
-cx q[0],q[62];
-cx q[0],q[64];
-rz(4.096711442877084) q[64];
-cx q[0],q[64];
-rx(11.744590366627444) q[70];
-rz(1.4914993860796162) q[71];
-cx q[53],q[71];
-rx(11.744590366627444) q[53];
-rx(11.744590366627444) q[71];
-rz(1.4914993860796162) q[72];
-cx q[27],q[72];
-rx(11.744590366627444) q[27];
-cx q[44],q[72];
-rz(1.4914993860796162) q[72];
-cx q[44],q[72];
-rx(11.744590366627444) q[44];
-rx(11.744590366627444) q[72];
-rz(1.4914993860796162) q[73];
-cx q[59],q[73];
-rx(11.744590366627444) q[59];
-rx(11.744590366627444) q[73];
-rz(1.4914993860796162) q[74];
-cx q[56],q[74];
-rx(11.744590366627444) q[56];
-cx q[63],q[74];
-rz(1.4914993860796162) q[74];
-cx q[63],q[74];
-rx(11.744590366627444) q[63];
-rx(11.744590366627444) q[74];
-rz(1.4914993860796162) q[75];
-cx q[21],q[75];
-rx(11.744590366627444) q[21];
-rx(11.744590366627444) q[75];
-cx q[0],q[75];
-rz(4.096711442877084) q[75];
-cx q[0],q[75];
-rx(10.278781847450702) q[0];
-rx(2.0466199162217285) q[76];
-cx q[5],q[76];
-rz(1.4914993860796162) q[76];
-cx q[5],q[76];
-rx(11.744590366627444) q[5];
-cx q[1],q[5];
-rz(4.096711442877084) q[5];
-cx q[1],q[5];
-cx q[1],q[9];
-cx q[3],q[5];
-rz(4.096711442877084) q[5];
-cx q[3],q[5];
-cx q[3],q[7];
-cx q[6],q[76];
-rz(4.096711442877084) q[7];
-cx q[3],q[7];
-cx q[3],q[8];
-rz(4.096711442877084) q[8];
-cx q[3],q[8];
-rz(4.096711442877084) q[9];
-cx q[1],q[9];
-cx q[1],q[17];
-cx q[3],q[9];
-rz(4.096711442877084) q[9];
-cx q[3],q[9];
-cx q[3],q[12];
-rz(4.096711442877084) q[12];
-cx q[3],q[12];
-cx q[3],q[14];
-rz(4.096711442877084) q[14];
-cx q[3],q[14];
-cx q[3],q[15];
-rz(4.096711442877084) q[15];
-cx q[3],q[15];
-cx q[3],q[16];
-cx q[15],q[20];
-rz(4.096711442877084) q[16];
-cx q[3],q[16];
-rz(4.096711442877084) q[17];
-cx q[1],q[17];
-cx q[1],q[28];
-cx q[3],q[17];
-rz(4.096711442877084) q[17];
-cx q[3],q[17];
-cx q[3],q[18];
-rz(4.096711442877084) q[18];
-cx q[3],q[18];
-cx q[3],q[19];
-rz(4.096711442877084) q[19];
-cx q[3],q[19];
-cx q[3],q[22];
-rz(4.096711442877084) q[20];
-cx q[15],q[20];
-rz(4.096711442877084) q[22];
-cx q[3],q[22];
-cx q[3],q[23];
-cx q[9],q[22];
-rz(4.096711442877084) q[22];
-cx q[9],q[22];
-cx q[9],q[55];
-rx(10.278781847450702) q[22];
-rz(4.096711442877084) q[23];
-cx q[3],q[23];
-cx q[3],q[24];
-cx q[17],q[23];
-rz(4.096711442877084) q[23];
-cx q[17],q[23];
-rz(4.096711442877084) q[24];
-cx q[3],q[24];
-cx q[3],q[25];
-rz(4.096711442877084) q[25];
-cx q[3],q[25];
-cx q[3],q[26];
-rz(4.096711442877084) q[26];
-cx q[3],q[26];
-rz(4.096711442877084) q[28];
-cx q[1],q[28];
-cx q[1],q[29];
-cx q[3],q[28];
-rz(4.096711442877084) q[28];
-cx q[3],q[28];
-cx q[28],q[51];
-rz(4.096711442877084) q[29];
-cx q[1],q[29];
-cx q[1],q[45];
-cx q[3],q[29];
-rz(4.096711442877084) q[29];
-cx q[3],q[29];
-cx q[3],q[30];
-rx(10.278781847450702) q[29];
-rz(4.096711442877084) q[30];
-cx q[3],q[30];
-cx q[3],q[34];
-rz(4.096711442877084) q[34];
-cx q[3],q[34];
-cx q[3],q[35];
-rz(4.096711442877084) q[35];
-cx q[3],q[35];
-cx q[3],q[39];
-rz(4.096711442877084) q[39];
-cx q[3],q[39];
-cx q[3],q[40];
-rz(4.096711442877084) q[40];
-cx q[3],q[40];
-cx q[3],q[42];
-cx q[23],q[40];
-rz(4.096711442877084) q[40];
-cx q[23],q[40];
-rx(10.278781847450702) q[40];
-rz(4.096711442877084) q[42];
-cx q[3],q[42];
-cx q[3],q[43];
-rx(10.278781847450702) q[42];
-rz(4.096711442877084) q[43];
-cx q[3],q[43];
-cx q[3],q[44];
-rz(4.096711442877084) q[44];
-cx q[3],q[44];
-cx q[3],q[49];
-rz(4.096711442877084) q[45];
-cx q[1],q[45];
-cx q[1],q[57];
-cx q[16],q[45];
-rz(4.096711442877084) q[45];
-cx q[16],q[45];
-cx q[16],q[59];
-rz(4.096711442877084) q[49];
-cx q[3],q[49];
-cx q[3],q[50];
-rz(4.096711442877084) q[50];
-cx q[3],q[50];
-cx q[3],q[52];
-rz(4.096711442877084) q[51];
-cx q[28],q[51];
-rx(10.278781847450702) q[51];
-rz(4.096711442877084) q[52];
-cx q[3],q[52];
-rz(4.096711442877084) q[55];
-cx q[9],q[55];
-rx(10.278781847450702) q[9];
-rz(4.096711442877084) q[57];
-cx q[1],q[57];
-cx q[1],q[60];
-cx q[3],q[57];
-rz(4.096711442877084) q[57];
-cx q[3],q[57];
-cx q[3],q[70];
-rx(10.278781847450702) q[57];
-rz(4.096711442877084) q[59];
-cx q[16],q[59];
-cx q[16],q[73];
-rz(4.096711442877084) q[60];
-cx q[1],q[60];
-rx(10.278781847450702) q[1];
-rz(4.096711442877084) q[70];
-cx q[3],q[70];
-cx q[3],q[71];
-rz(4.096711442877084) q[71];
-cx q[3],q[71];
-rx(10.278781847450702) q[3];
-rz(4.096711442877084) q[73];
-cx q[16],q[73];
-rx(10.278781847450702) q[16];
-rz(1.4914993860796162) q[76];
-cx q[6],q[76];
-rx(11.744590366627444) q[6];
-cx q[4],q[6];
-rz(4.096711442877084) q[6];
-cx q[4],q[6];
-cx q[4],q[7];
-cx q[5],q[6];
-rz(4.096711442877084) q[6];
-cx q[5],q[6];
-cx q[5],q[8];
-rz(4.096711442877084) q[7];
-cx q[4],q[7];
-cx q[4],q[10];
-cx q[7],q[19];
-rz(4.096711442877084) q[8];
-cx q[5],q[8];
-cx q[5],q[11];
-rx(10.278781847450702) q[8];
-rz(4.096711442877084) q[10];
-cx q[4],q[10];
-cx q[4],q[13];
-cx q[6],q[10];
-rz(4.096711442877084) q[10];
-cx q[6],q[10];
-cx q[10],q[37];
-rz(4.096711442877084) q[11];
-cx q[5],q[11];
-cx q[5],q[12];
-cx q[6],q[11];
-rz(4.096711442877084) q[11];
-cx q[6],q[11];
-rx(10.278781847450702) q[11];
-rz(4.096711442877084) q[12];
-cx q[5],q[12];
-cx q[12],q[25];
-rz(4.096711442877084) q[13];
-cx q[4],q[13];
-cx q[4],q[14];
-cx q[5],q[13];
-rz(4.096711442877084) q[13];
-cx q[5],q[13];
-cx q[5],q[24];
-cx q[13],q[39];
-rz(4.096711442877084) q[14];
-cx q[4],q[14];
-cx q[4],q[18];
-rx(10.278781847450702) q[14];
-rz(4.096711442877084) q[18];
-cx q[4],q[18];
-cx q[4],q[21];
-cx q[18],q[30];
-rz(4.096711442877084) q[19];
-cx q[7],q[19];
-cx q[7],q[60];
-cx q[19],q[38];
-rz(4.096711442877084) q[21];
-cx q[4],q[21];
-cx q[4],q[27];
-cx q[15],q[21];
-rz(4.096711442877084) q[21];
-cx q[15],q[21];
-cx q[15],q[36];
-cx q[21],q[26];
-rz(4.096711442877084) q[24];
-cx q[5],q[24];
-cx q[5],q[33];
-cx q[24],q[54];
-rz(4.096711442877084) q[25];
-cx q[12],q[25];
-cx q[12],q[31];
-rx(10.278781847450702) q[25];
-rz(4.096711442877084) q[26];
-cx q[21],q[26];
-cx q[21],q[32];
-rz(4.096711442877084) q[27];
-cx q[4],q[27];
-cx q[4],q[47];
-cx q[6],q[27];
-rz(4.096711442877084) q[27];
-cx q[6],q[27];
-cx q[6],q[69];
-rz(4.096711442877084) q[30];
-cx q[18],q[30];
-rx(10.278781847450702) q[18];
-rz(4.096711442877084) q[31];
-cx q[12],q[31];
-cx q[12],q[34];
-cx q[26],q[31];
-rz(4.096711442877084) q[31];
-cx q[26],q[31];
-rx(10.278781847450702) q[26];
-rx(10.278781847450702) q[31];
-rz(4.096711442877084) q[32];
-cx q[21],q[32];
-cx q[32],q[35];
-rz(4.096711442877084) q[33];
-cx q[5],q[33];
-cx q[5],q[46];
-cx q[30],q[33];
-rz(4.096711442877084) q[33];
-cx q[30],q[33];
-cx q[30],q[48];
-rx(10.278781847450702) q[33];
-rz(4.096711442877084) q[34];
-cx q[12],q[34];
-cx q[12],q[44];
-rz(4.096711442877084) q[35];
-cx q[32],q[35];
-cx q[32],q[59];
-rx(10.278781847450702) q[35];
-rz(4.096711442877084) q[36];
-cx q[15],q[36];
-cx q[15],q[55];
-cx q[20],q[36];
-rz(4.096711442877084) q[36];
-cx q[20],q[36];
-cx q[20],q[43];
-rx(10.278781847450702) q[36];
-rz(4.096711442877084) q[37];
-cx q[10],q[37];
-cx q[10],q[41];
-cx q[34],q[37];
-rz(4.096711442877084) q[37];
-cx q[34],q[37];
-rx(10.278781847450702) q[34];
-rx(10.278781847450702) q[37];
-rz(4.096711442877084) q[38];
-cx q[19],q[38];
-rx(10.278781847450702) q[19];
-cx q[21],q[38];
-rz(4.096711442877084) q[38];
-cx q[21],q[38];
-rz(4.096711442877084) q[39];
-cx q[13],q[39];
-cx q[13],q[56];
-rx(10.278781847450702) q[39];
-rz(4.096711442877084) q[41];
-cx q[10],q[41];
-cx q[10],q[52];
-cx q[27],q[41];
-rz(4.096711442877084) q[41];
-cx q[27],q[41];
-cx q[27],q[72];
-cx q[41],q[67];
-rz(4.096711442877084) q[43];
-cx q[20],q[43];
-rx(10.278781847450702) q[20];
-rx(10.278781847450702) q[43];
-rz(4.096711442877084) q[44];
-cx q[12],q[44];
-cx q[12],q[50];
-rz(4.096711442877084) q[46];
-cx q[5],q[46];
-cx q[5],q[65];
-cx q[38],q[46];
-rz(4.096711442877084) q[46];
-cx q[38],q[46];
-rx(10.278781847450702) q[38];
-rx(10.278781847450702) q[46];
-rz(4.096711442877084) q[47];
-cx q[4],q[47];
-cx q[4],q[49];
-cx q[17],q[47];
-rz(4.096711442877084) q[47];
-cx q[17],q[47];
-cx q[17],q[53];
-rz(4.096711442877084) q[48];
-cx q[30],q[48];
-rx(10.278781847450702) q[30];
-rx(10.278781847450702) q[48];
-rz(4.096711442877084) q[49];
-cx q[4],q[49];
-cx q[4],q[61];
-rx(10.278781847450702) q[49];
-rz(4.096711442877084) q[50];
-cx q[12],q[50];
-cx q[12],q[63];
-rx(10.278781847450702) q[50];
-rz(4.096711442877084) q[52];
-cx q[10],q[52];
-cx q[10],q[64];
-rx(10.278781847450702) q[52];
-rz(4.096711442877084) q[53];
-cx q[17],q[53];
-cx q[17],q[62];
-cx q[21],q[53];
-rz(4.096711442877084) q[53];
-cx q[21],q[53];
-cx q[21],q[75];
-cx q[53],q[71];
-rz(4.096711442877084) q[54];
-cx q[24],q[54];
-cx q[24],q[58];
-cx q[28],q[54];
-rz(4.096711442877084) q[54];
-cx q[28],q[54];
-rx(10.278781847450702) q[54];
-rz(4.096711442877084) q[55];
-cx q[15],q[55];
-cx q[15],q[70];
-rx(10.278781847450702) q[55];
-rz(4.096711442877084) q[56];
-cx q[13],q[56];
-cx q[13],q[68];
-cx q[45],q[56];
-rz(4.096711442877084) q[56];
-cx q[45],q[56];
-rx(10.278781847450702) q[45];
-rz(4.096711442877084) q[58];
-cx q[24],q[58];
-rx(10.278781847450702) q[24];
-cx q[28],q[58];
-rz(4.096711442877084) q[58];
-cx q[28],q[58];
-rx(10.278781847450702) q[28];
-rx(10.278781847450702) q[58];
-rz(4.096711442877084) q[59];
-cx q[32],q[59];
-rz(4.096711442877084) q[60];
-cx q[7],q[60];
-rx(10.278781847450702) q[60];
-rz(4.096711442877084) q[61];
-cx q[4],q[61];
-rx(10.278781847450702) q[4];
-cx q[7],q[61];
-rz(4.096711442877084) q[61];
-cx q[7],q[61];
-rx(10.278781847450702) q[7];
-rx(10.278781847450702) q[61];
-rz(4.096711442877084) q[62];
-cx q[17],q[62];
-rx(10.278781847450702) q[62];
-rz(4.096711442877084) q[63];
-cx q[12],q[63];
-rx(10.278781847450702) q[12];
-cx q[17],q[63];
-rz(4.096711442877084) q[63];
-cx q[17],q[63];
-cx q[17],q[66];
-rz(4.096711442877084) q[64];
-cx q[10],q[64];
-rx(10.278781847450702) q[10];
-rx(10.278781847450702) q[64];
-rz(4.096711442877084) q[65];
-cx q[5],q[65];
-cx q[23],q[65];
-rz(4.096711442877084) q[65];
-cx q[23],q[65];
-rx(10.278781847450702) q[23];
-rx(10.278781847450702) q[65];
-rz(4.096711442877084) q[66];
-cx q[17],q[66];
-rx(10.278781847450702) q[17];
-cx q[47],q[66];
-rz(4.096711442877084) q[66];
-cx q[47],q[66];
-rx(10.278781847450702) q[47];
-rx(10.278781847450702) q[66];
-rz(4.096711442877084) q[67];
-cx q[41],q[67];
-rx(10.278781847450702) q[41];
-cx q[56],q[67];
-rz(4.096711442877084) q[67];
-cx q[56],q[67];
-cx q[56],q[74];
-rx(10.278781847450702) q[67];
-rz(4.096711442877084) q[68];
-cx q[13],q[68];
-rx(10.278781847450702) q[13];
-cx q[32],q[68];
-rz(4.096711442877084) q[68];
-cx q[32],q[68];
-rx(10.278781847450702) q[32];
-rx(10.278781847450702) q[68];
-rz(4.096711442877084) q[69];
-cx q[6],q[69];
-cx q[59],q[69];
-rz(4.096711442877084) q[69];
-cx q[59],q[69];
-cx q[59],q[73];
-rx(10.278781847450702) q[69];
-rz(4.096711442877084) q[70];
-cx q[15],q[70];
-rx(10.278781847450702) q[15];
-rx(10.278781847450702) q[70];
-rz(4.096711442877084) q[71];
-cx q[53],q[71];
-rx(10.278781847450702) q[53];
-rx(10.278781847450702) q[71];
-rz(4.096711442877084) q[72];
-cx q[27],q[72];
-rx(10.278781847450702) q[27];
-cx q[44],q[72];
-rz(4.096711442877084) q[72];
-cx q[44],q[72];
-rx(10.278781847450702) q[44];
-rx(10.278781847450702) q[72];
-rz(4.096711442877084) q[73];
-cx q[59],q[73];
-rx(10.278781847450702) q[59];
-rx(10.278781847450702) q[73];
-rz(4.096711442877084) q[74];
-cx q[56],q[74];
-rx(10.278781847450702) q[56];
-cx q[63],q[74];
-rz(4.096711442877084) q[74];
-cx q[63],q[74];
-rx(10.278781847450702) q[63];
-rx(10.278781847450702) q[74];
-rz(4.096711442877084) q[75];
-cx q[21],q[75];
-rx(10.278781847450702) q[21];
-rx(10.278781847450702) q[75];
-rx(11.744590366627444) q[76];
-cx q[5],q[76];
-rz(4.096711442877084) q[76];
-cx q[5],q[76];
-rx(10.278781847450702) q[5];
-cx q[6],q[76];
-rz(4.096711442877084) q[76];
-cx q[6],q[76];
-rx(10.278781847450702) q[6];
-rx(10.278781847450702) q[76];
\ No newline at end of file
@@ -1,1784 +0,0 @@
-OPENQASM 2.0;
-include "qelib1.inc";
-qreg q[79];
-ry(pi/2) q[0];
-rx(pi) q[0];
-ry(pi/2) q[1];
-rx(pi) q[1];
-cx q[0],q[1];
-rz(0.18518819459006455) q[1];
-cx q[0],q[1];
-ry(pi/2) q[2];
-rx(pi) q[2];
-cx q[0],q[2];
-rz(0.18518819459006455) q[2];
-cx q[0],q[2];
-rx(6.345815249371433) q[2];
-ry(pi/2) q[3];
-rx(pi) q[3];
-cx q[0],q[3];
-rz(0.18518819459006455) q[3];
-cx q[0],q[3];
-cx q[1],q[3];
-rz(0.18518819459006455) q[3];
-cx q[1],q[3];
-ry(pi/2) q[4];
-rx(pi) q[4];
-cx q[1],q[4];
-rz(0.18518819459006455) q[4];
-cx q[1],q[4];
-cx q[3],q[4];
-rz(0.18518819459006455) q[4];
-cx q[3],q[4];
-ry(pi/2) q[5];
-rx(pi) q[5];
-cx q[1],q[5];
-rz(0.18518819459006455) q[5];
-cx q[1],q[5];
-cx q[3],q[5];
-rz(0.18518819459006455) q[5];
-cx q[3],q[5];
-ry(pi/2) q[6];
-rx(pi) q[6];
-cx q[4],q[6];
-rz(0.18518819459006455) q[6];
-cx q[4],q[6];
-cx q[5],q[6];
-rz(0.18518819459006455) q[6];
-cx q[5],q[6];
-ry(pi/2) q[7];
-rx(pi) q[7];
-cx q[3],q[7];
-rz(0.18518819459006455) q[7];
-cx q[3],q[7];
-cx q[4],q[7];
-rz(0.18518819459006455) q[7];
-cx q[4],q[7];
-ry(pi/2) q[8];
-rx(pi) q[8];
-cx q[3],q[8];
-rz(0.18518819459006455) q[8];
-cx q[3],q[8];
-cx q[5],q[8];
-rz(0.18518819459006455) q[8];
-cx q[5],q[8];
-rx(6.345815249371433) q[8];
-ry(pi/2) q[9];
-rx(pi) q[9];
-cx q[1],q[9];
-rz(0.18518819459006455) q[9];
-cx q[1],q[9];
-cx q[3],q[9];
-rz(0.18518819459006455) q[9];
-cx q[3],q[9];
-ry(pi/2) q[10];
-rx(pi) q[10];
-cx q[4],q[10];
-rz(0.18518819459006455) q[10];
-cx q[4],q[10];
-cx q[6],q[10];
-rz(0.18518819459006455) q[10];
-cx q[6],q[10];
-ry(pi/2) q[11];
-rx(pi) q[11];
-cx q[5],q[11];
-rz(0.18518819459006455) q[11];
-cx q[5],q[11];
-cx q[6],q[11];
-rz(0.18518819459006455) q[11];
-cx q[6],q[11];
-rx(6.345815249371433) q[11];
-ry(pi/2) q[12];
-rx(pi) q[12];
-cx q[3],q[12];
-rz(0.18518819459006455) q[12];
-cx q[3],q[12];
-cx q[5],q[12];
-rz(0.18518819459006455) q[12];
-cx q[5],q[12];
-ry(pi/2) q[13];
-rx(pi) q[13];
-cx q[4],q[13];
-rz(0.18518819459006455) q[13];
-cx q[4],q[13];
-cx q[5],q[13];
-rz(0.18518819459006455) q[13];
-cx q[5],q[13];
-ry(pi/2) q[14];
-rx(pi) q[14];
-cx q[3],q[14];
-rz(0.18518819459006455) q[14];
-cx q[3],q[14];
-cx q[4],q[14];
-rz(0.18518819459006455) q[14];
-cx q[4],q[14];
-rx(6.345815249371433) q[14];
-ry(pi/2) q[15];
-rx(pi) q[15];
-cx q[0],q[15];
-rz(0.18518819459006455) q[15];
-cx q[0],q[15];
-cx q[3],q[15];
-rz(0.18518819459006455) q[15];
-cx q[3],q[15];
-ry(pi/2) q[16];
-rx(pi) q[16];
-cx q[0],q[16];
-rz(0.18518819459006455) q[16];
-cx q[0],q[16];
-cx q[3],q[16];
-rz(0.18518819459006455) q[16];
-cx q[3],q[16];
-ry(pi/2) q[17];
-rx(pi) q[17];
-cx q[1],q[17];
-rz(0.18518819459006455) q[17];
-cx q[1],q[17];
-cx q[3],q[17];
-rz(0.18518819459006455) q[17];
-cx q[3],q[17];
-ry(pi/2) q[18];
-rx(pi) q[18];
-cx q[3],q[18];
-rz(0.18518819459006455) q[18];
-cx q[3],q[18];
-cx q[4],q[18];
-rz(0.18518819459006455) q[18];
-cx q[4],q[18];
-ry(pi/2) q[19];
-rx(pi) q[19];
-cx q[3],q[19];
-rz(0.18518819459006455) q[19];
-cx q[3],q[19];
-cx q[7],q[19];
-rz(0.18518819459006455) q[19];
-cx q[7],q[19];
-ry(pi/2) q[20];
-rx(pi) q[20];
-cx q[0],q[20];
-rz(0.18518819459006455) q[20];
-cx q[0],q[20];
-cx q[15],q[20];
-rz(0.18518819459006455) q[20];
-cx q[15],q[20];
-ry(pi/2) q[21];
-rx(pi) q[21];
-cx q[4],q[21];
-rz(0.18518819459006455) q[21];
-cx q[4],q[21];
-cx q[15],q[21];
-rz(0.18518819459006455) q[21];
-cx q[15],q[21];
-ry(pi/2) q[22];
-rx(pi) q[22];
-cx q[3],q[22];
-rz(0.18518819459006455) q[22];
-cx q[3],q[22];
-cx q[9],q[22];
-rz(0.18518819459006455) q[22];
-cx q[9],q[22];
-rx(6.345815249371433) q[22];
-ry(pi/2) q[23];
-rx(pi) q[23];
-cx q[3],q[23];
-rz(0.18518819459006455) q[23];
-cx q[3],q[23];
-cx q[17],q[23];
-rz(0.18518819459006455) q[23];
-cx q[17],q[23];
-ry(pi/2) q[24];
-rx(pi) q[24];
-cx q[3],q[24];
-rz(0.18518819459006455) q[24];
-cx q[3],q[24];
-cx q[5],q[24];
-rz(0.18518819459006455) q[24];
-cx q[5],q[24];
-ry(pi/2) q[25];
-rx(pi) q[25];
-cx q[3],q[25];
-rz(0.18518819459006455) q[25];
-cx q[3],q[25];
-cx q[12],q[25];
-rz(0.18518819459006455) q[25];
-cx q[12],q[25];
-rx(6.345815249371433) q[25];
-ry(pi/2) q[26];
-rx(pi) q[26];
-cx q[3],q[26];
-rz(0.18518819459006455) q[26];
-cx q[3],q[26];
-cx q[21],q[26];
-rz(0.18518819459006455) q[26];
-cx q[21],q[26];
-ry(pi/2) q[27];
-rx(pi) q[27];
-cx q[4],q[27];
-rz(0.18518819459006455) q[27];
-cx q[4],q[27];
-cx q[6],q[27];
-rz(0.18518819459006455) q[27];
-cx q[6],q[27];
-ry(pi/2) q[28];
-rx(pi) q[28];
-cx q[1],q[28];
-rz(0.18518819459006455) q[28];
-cx q[1],q[28];
-cx q[3],q[28];
-rz(0.18518819459006455) q[28];
-cx q[3],q[28];
-ry(pi/2) q[29];
-rx(pi) q[29];
-cx q[1],q[29];
-rz(0.18518819459006455) q[29];
-cx q[1],q[29];
-cx q[3],q[29];
-rz(0.18518819459006455) q[29];
-cx q[3],q[29];
-rx(6.345815249371433) q[29];
-ry(pi/2) q[30];
-rx(pi) q[30];
-cx q[3],q[30];
-rz(0.18518819459006455) q[30];
-cx q[3],q[30];
-cx q[18],q[30];
-rz(0.18518819459006455) q[30];
-cx q[18],q[30];
-rx(6.345815249371433) q[18];
-ry(pi/2) q[31];
-rx(pi) q[31];
-cx q[12],q[31];
-rz(0.18518819459006455) q[31];
-cx q[12],q[31];
-cx q[26],q[31];
-rz(0.18518819459006455) q[31];
-cx q[26],q[31];
-rx(6.345815249371433) q[26];
-rx(6.345815249371433) q[31];
-ry(pi/2) q[32];
-rx(pi) q[32];
-cx q[0],q[32];
-rz(0.18518819459006455) q[32];
-cx q[0],q[32];
-cx q[21],q[32];
-rz(0.18518819459006455) q[32];
-cx q[21],q[32];
-ry(pi/2) q[33];
-rx(pi) q[33];
-cx q[5],q[33];
-rz(0.18518819459006455) q[33];
-cx q[5],q[33];
-cx q[30],q[33];
-rz(0.18518819459006455) q[33];
-cx q[30],q[33];
-rx(6.345815249371433) q[33];
-ry(pi/2) q[34];
-rx(pi) q[34];
-cx q[3],q[34];
-rz(0.18518819459006455) q[34];
-cx q[3],q[34];
-cx q[12],q[34];
-rz(0.18518819459006455) q[34];
-cx q[12],q[34];
-ry(pi/2) q[35];
-rx(pi) q[35];
-cx q[3],q[35];
-rz(0.18518819459006455) q[35];
-cx q[3],q[35];
-cx q[32],q[35];
-rz(0.18518819459006455) q[35];
-cx q[32],q[35];
-rx(6.345815249371433) q[35];
-ry(pi/2) q[36];
-rx(pi) q[36];
-cx q[15],q[36];
-rz(0.18518819459006455) q[36];
-cx q[15],q[36];
-cx q[20],q[36];
-rz(0.18518819459006455) q[36];
-cx q[20],q[36];
-rx(6.345815249371433) q[36];
-ry(pi/2) q[37];
-rx(pi) q[37];
-cx q[10],q[37];
-rz(0.18518819459006455) q[37];
-cx q[10],q[37];
-cx q[34],q[37];
-rz(0.18518819459006455) q[37];
-cx q[34],q[37];
-rx(6.345815249371433) q[34];
-rx(6.345815249371433) q[37];
-ry(pi/2) q[38];
-rx(pi) q[38];
-cx q[19],q[38];
-rz(0.18518819459006455) q[38];
-cx q[19],q[38];
-rx(6.345815249371433) q[19];
-cx q[21],q[38];
-rz(0.18518819459006455) q[38];
-cx q[21],q[38];
-ry(pi/2) q[39];
-rx(pi) q[39];
-cx q[3],q[39];
-rz(0.18518819459006455) q[39];
-cx q[3],q[39];
-cx q[13],q[39];
-rz(0.18518819459006455) q[39];
-cx q[13],q[39];
-rx(6.345815249371433) q[39];
-ry(pi/2) q[40];
-rx(pi) q[40];
-cx q[3],q[40];
-rz(0.18518819459006455) q[40];
-cx q[3],q[40];
-cx q[23],q[40];
-rz(0.18518819459006455) q[40];
-cx q[23],q[40];
-rx(6.345815249371433) q[40];
-ry(pi/2) q[41];
-rx(pi) q[41];
-cx q[10],q[41];
-rz(0.18518819459006455) q[41];
-cx q[10],q[41];
-cx q[27],q[41];
-rz(0.18518819459006455) q[41];
-cx q[27],q[41];
-ry(pi/2) q[42];
-rx(pi) q[42];
-cx q[0],q[42];
-rz(0.18518819459006455) q[42];
-cx q[0],q[42];
-cx q[3],q[42];
-rz(0.18518819459006455) q[42];
-cx q[3],q[42];
-ry(pi/2) q[43];
-rx(pi) q[43];
-cx q[3],q[43];
-rz(0.18518819459006455) q[43];
-cx q[3],q[43];
-cx q[20],q[43];
-rz(0.18518819459006455) q[43];
-cx q[20],q[43];
-rx(6.345815249371433) q[20];
-rx(6.345815249371433) q[43];
-ry(pi/2) q[44];
-rx(pi) q[44];
-cx q[3],q[44];
-rz(0.18518819459006455) q[44];
-cx q[3],q[44];
-cx q[12],q[44];
-rz(0.18518819459006455) q[44];
-cx q[12],q[44];
-ry(pi/2) q[45];
-rx(pi) q[45];
-cx q[1],q[45];
-rz(0.18518819459006455) q[45];
-cx q[1],q[45];
-cx q[16],q[45];
-rz(0.18518819459006455) q[45];
-cx q[16],q[45];
-ry(pi/2) q[46];
-rx(pi) q[46];
-cx q[5],q[46];
-rz(0.18518819459006455) q[46];
-cx q[5],q[46];
-cx q[38],q[46];
-rz(0.18518819459006455) q[46];
-cx q[38],q[46];
-rx(6.345815249371433) q[38];
-rx(6.345815249371433) q[46];
-ry(pi/2) q[47];
-rx(pi) q[47];
-cx q[4],q[47];
-rz(0.18518819459006455) q[47];
-cx q[4],q[47];
-cx q[17],q[47];
-rz(0.18518819459006455) q[47];
-cx q[17],q[47];
-ry(pi/2) q[48];
-rx(pi) q[48];
-cx q[0],q[48];
-rz(0.18518819459006455) q[48];
-cx q[0],q[48];
-cx q[30],q[48];
-rz(0.18518819459006455) q[48];
-cx q[30],q[48];
-rx(6.345815249371433) q[48];
-ry(pi/2) q[49];
-rx(pi) q[49];
-cx q[3],q[49];
-rz(0.18518819459006455) q[49];
-cx q[3],q[49];
-cx q[4],q[49];
-rz(0.18518819459006455) q[49];
-cx q[4],q[49];
-rx(6.345815249371433) q[49];
-ry(pi/2) q[50];
-rx(pi) q[50];
-cx q[3],q[50];
-rz(0.18518819459006455) q[50];
-cx q[3],q[50];
-cx q[12],q[50];
-rz(0.18518819459006455) q[50];
-cx q[12],q[50];
-rx(6.345815249371433) q[50];
-ry(pi/2) q[51];
-rx(pi) q[51];
-cx q[0],q[51];
-rz(0.18518819459006455) q[51];
-cx q[0],q[51];
-cx q[28],q[51];
-rz(0.18518819459006455) q[51];
-cx q[28],q[51];
-rx(6.345815249371433) q[51];
-ry(pi/2) q[52];
-rx(pi) q[52];
-cx q[3],q[52];
-rz(0.18518819459006455) q[52];
-cx q[3],q[52];
-cx q[10],q[52];
-rz(0.18518819459006455) q[52];
-cx q[10],q[52];
-rx(6.345815249371433) q[52];
-ry(pi/2) q[53];
-rx(pi) q[53];
-cx q[17],q[53];
-rz(0.18518819459006455) q[53];
-cx q[17],q[53];
-cx q[21],q[53];
-rz(0.18518819459006455) q[53];
-cx q[21],q[53];
-ry(pi/2) q[54];
-rx(pi) q[54];
-cx q[24],q[54];
-rz(0.18518819459006455) q[54];
-cx q[24],q[54];
-cx q[28],q[54];
-rz(0.18518819459006455) q[54];
-cx q[28],q[54];
-rx(6.345815249371433) q[54];
-ry(pi/2) q[55];
-rx(pi) q[55];
-cx q[9],q[55];
-rz(0.18518819459006455) q[55];
-cx q[9],q[55];
-rx(6.345815249371433) q[9];
-cx q[15],q[55];
-rz(0.18518819459006455) q[55];
-cx q[15],q[55];
-rx(6.345815249371433) q[55];
-ry(pi/2) q[56];
-rx(pi) q[56];
-cx q[13],q[56];
-rz(0.18518819459006455) q[56];
-cx q[13],q[56];
-cx q[45],q[56];
-rz(0.18518819459006455) q[56];
-cx q[45],q[56];
-rx(6.345815249371433) q[45];
-ry(pi/2) q[57];
-rx(pi) q[57];
-cx q[1],q[57];
-rz(0.18518819459006455) q[57];
-cx q[1],q[57];
-cx q[3],q[57];
-rz(0.18518819459006455) q[57];
-cx q[3],q[57];
-rx(6.345815249371433) q[57];
-ry(pi/2) q[58];
-rx(pi) q[58];
-cx q[24],q[58];
-rz(0.18518819459006455) q[58];
-cx q[24],q[58];
-rx(6.345815249371433) q[24];
-cx q[28],q[58];
-rz(0.18518819459006455) q[58];
-cx q[28],q[58];
-rx(6.345815249371433) q[28];
-rx(6.345815249371433) q[58];
-ry(pi/2) q[59];
-rx(pi) q[59];
-cx q[16],q[59];
-rz(0.18518819459006455) q[59];
-cx q[16],q[59];
-cx q[32],q[59];
-rz(0.18518819459006455) q[59];
-cx q[32],q[59];
-ry(pi/2) q[60];
-rx(pi) q[60];
-cx q[1],q[60];
-rz(0.18518819459006455) q[60];
-cx q[1],q[60];
-rx(6.345815249371433) q[1];
-cx q[7],q[60];
-rz(0.18518819459006455) q[60];
-cx q[7],q[60];
-ry(pi/2) q[61];
-rx(pi) q[61];
-cx q[4],q[61];
-rz(0.18518819459006455) q[61];
-cx q[4],q[61];
-rx(6.345815249371433) q[4];
-cx q[7],q[61];
-rz(0.18518819459006455) q[61];
-cx q[7],q[61];
-rx(6.345815249371433) q[7];
-rx(6.345815249371433) q[61];
-ry(pi/2) q[62];
-rx(pi) q[62];
-cx q[0],q[62];
-rz(0.18518819459006455) q[62];
-cx q[0],q[62];
-cx q[17],q[62];
-rz(0.18518819459006455) q[62];
-cx q[17],q[62];
-rx(6.345815249371433) q[62];
-ry(pi/2) q[63];
-rx(pi) q[63];
-cx q[12],q[63];
-rz(0.18518819459006455) q[63];
-cx q[12],q[63];
-rx(6.345815249371433) q[12];
-cx q[17],q[63];
-rz(0.18518819459006455) q[63];
-cx q[17],q[63];
-ry(pi/2) q[64];
-rx(pi) q[64];
-cx q[0],q[64];
-rz(0.18518819459006455) q[64];
-cx q[0],q[64];
-cx q[10],q[64];
-rz(0.18518819459006455) q[64];
-cx q[10],q[64];
-rx(6.345815249371433) q[10];
-rx(6.345815249371433) q[64];
-ry(pi/2) q[65];
-rx(pi) q[65];
-cx q[5],q[65];
-rz(0.18518819459006455) q[65];
-cx q[5],q[65];
-cx q[23],q[65];
-rz(0.18518819459006455) q[65];
-cx q[23],q[65];
-rx(6.345815249371433) q[23];
-rx(6.345815249371433) q[65];
-ry(pi/2) q[66];
-rx(pi) q[66];
-cx q[17],q[66];
-rz(0.18518819459006455) q[66];
-cx q[17],q[66];
-rx(6.345815249371433) q[17];
-cx q[47],q[66];
-rz(0.18518819459006455) q[66];
-cx q[47],q[66];
-rx(6.345815249371433) q[47];
-rx(6.345815249371433) q[66];
-ry(pi/2) q[67];
-rx(pi) q[67];
-cx q[41],q[67];
-rz(0.18518819459006455) q[67];
-cx q[41],q[67];
-rx(6.345815249371433) q[41];
-cx q[56],q[67];
-rz(0.18518819459006455) q[67];
-cx q[56],q[67];
-rx(6.345815249371433) q[67];
-ry(pi/2) q[68];
-rx(pi) q[68];
-cx q[13],q[68];
-rz(0.18518819459006455) q[68];
-cx q[13],q[68];
-rx(6.345815249371433) q[13];
-cx q[32],q[68];
-rz(0.18518819459006455) q[68];
-cx q[32],q[68];
-rx(6.345815249371433) q[32];
-rx(6.345815249371433) q[68];
-ry(pi/2) q[69];
-rx(pi) q[69];
-cx q[6],q[69];
-rz(0.18518819459006455) q[69];
-cx q[6],q[69];
-cx q[59],q[69];
-rz(0.18518819459006455) q[69];
-cx q[59],q[69];
-rx(6.345815249371433) q[69];
-ry(pi/2) q[70];
-rx(pi) q[70];
-cx q[3],q[70];
-rz(0.18518819459006455) q[70];
-cx q[3],q[70];
-cx q[15],q[70];
-rz(0.18518819459006455) q[70];
-cx q[15],q[70];
-rx(6.345815249371433) q[15];
-rx(6.345815249371433) q[70];
-ry(pi/2) q[71];
-rx(pi) q[71];
-cx q[3],q[71];
-rz(0.18518819459006455) q[71];
-cx q[3],q[71];
-cx q[53],q[71];
-rz(0.18518819459006455) q[71];
-cx q[53],q[71];
-rx(6.345815249371433) q[53];
-rx(6.345815249371433) q[71];
-ry(pi/2) q[72];
-rx(pi) q[72];
-cx q[27],q[72];
-rz(0.18518819459006455) q[72];
-cx q[27],q[72];
-rx(6.345815249371433) q[27];
-cx q[44],q[72];
-rz(0.18518819459006455) q[72];
-cx q[44],q[72];
-rx(6.345815249371433) q[44];
-rx(6.345815249371433) q[72];
-ry(pi/2) q[73];
-rx(pi) q[73];
-cx q[16],q[73];
-rz(0.18518819459006455) q[73];
-cx q[16],q[73];
-rx(6.345815249371433) q[16];
-cx q[59],q[73];
-rz(0.18518819459006455) q[73];
-cx q[59],q[73];
-rx(6.345815249371433) q[59];
-rx(6.345815249371433) q[73];
-ry(pi/2) q[74];
-rx(pi) q[74];
-cx q[56],q[74];
-rz(0.18518819459006455) q[74];
-cx q[56],q[74];
-rx(6.345815249371433) q[56];
-cx q[63],q[74];
-rz(0.18518819459006455) q[74];
-cx q[63],q[74];
-rx(6.345815249371433) q[63];
-rx(6.345815249371433) q[74];
-ry(pi/2) q[75];
-rx(pi) q[75];
-cx q[0],q[75];
-rz(0.18518819459006455) q[75];
-cx q[0],q[75];
-rx(6.345815249371433) q[0];
-cx q[0],q[1];
-rz(0.09802602334562639) q[1];
-cx q[0],q[1];
-cx q[0],q[2];
-rz(0.09802602334562639) q[2];
-cx q[0],q[2];
-rx(3.706223595686673) q[2];
-cx q[21],q[75];
-rz(0.18518819459006455) q[75];
-cx q[21],q[75];
-rx(6.345815249371433) q[21];
-rx(6.345815249371433) q[75];
-ry(pi/2) q[76];
-rx(pi) q[76];
-cx q[5],q[76];
-rz(0.18518819459006455) q[76];
-cx q[5],q[76];
-rx(6.345815249371433) q[5];
-cx q[6],q[76];
-rz(0.18518819459006455) q[76];
-cx q[6],q[76];
-rx(6.345815249371433) q[6];
-rx(6.345815249371433) q[76];
-ry(pi/2) q[77];
-rx(pi) q[77];
-cx q[3],q[77];
-rz(0.18518819459006455) q[77];
-cx q[3],q[77];
-rx(6.345815249371433) q[3];
-cx q[0],q[3];
-rz(0.09802602334562639) q[3];
-cx q[0],q[3];
-cx q[0],q[15];
-cx q[1],q[3];
-rz(0.09802602334562639) q[3];
-cx q[1],q[3];
-cx q[1],q[4];
-rz(0.09802602334562639) q[4];
-cx q[1],q[4];
-cx q[1],q[5];
-cx q[3],q[4];
-rz(0.09802602334562639) q[4];
-cx q[3],q[4];
-cx q[4],q[6];
-rz(0.09802602334562639) q[5];
-cx q[1],q[5];
-cx q[1],q[9];
-cx q[3],q[5];
-rz(0.09802602334562639) q[5];
-cx q[3],q[5];
-cx q[3],q[7];
-rz(0.09802602334562639) q[6];
-cx q[4],q[6];
-cx q[5],q[6];
-rz(0.09802602334562639) q[6];
-cx q[5],q[6];
-rz(0.09802602334562639) q[7];
-cx q[3],q[7];
-cx q[3],q[8];
-cx q[4],q[7];
-rz(0.09802602334562639) q[7];
-cx q[4],q[7];
-cx q[4],q[10];
-rz(0.09802602334562639) q[8];
-cx q[3],q[8];
-cx q[5],q[8];
-rz(0.09802602334562639) q[8];
-cx q[5],q[8];
-cx q[5],q[11];
-rx(3.706223595686673) q[8];
-rz(0.09802602334562639) q[9];
-cx q[1],q[9];
-cx q[1],q[17];
-cx q[3],q[9];
-rz(0.09802602334562639) q[9];
-cx q[3],q[9];
-cx q[3],q[12];
-rz(0.09802602334562639) q[10];
-cx q[4],q[10];
-cx q[4],q[13];
-cx q[6],q[10];
-rz(0.09802602334562639) q[10];
-cx q[6],q[10];
-cx q[10],q[37];
-rz(0.09802602334562639) q[11];
-cx q[5],q[11];
-cx q[6],q[11];
-rz(0.09802602334562639) q[11];
-cx q[6],q[11];
-rx(3.706223595686673) q[11];
-rz(0.09802602334562639) q[12];
-cx q[3],q[12];
-cx q[3],q[14];
-cx q[5],q[12];
-rz(0.09802602334562639) q[12];
-cx q[5],q[12];
-rz(0.09802602334562639) q[13];
-cx q[4],q[13];
-cx q[5],q[13];
-rz(0.09802602334562639) q[13];
-cx q[5],q[13];
-rz(0.09802602334562639) q[14];
-cx q[3],q[14];
-cx q[4],q[14];
-rz(0.09802602334562639) q[14];
-cx q[4],q[14];
-rx(3.706223595686673) q[14];
-rz(0.09802602334562639) q[15];
-cx q[0],q[15];
-cx q[0],q[16];
-cx q[3],q[15];
-rz(0.09802602334562639) q[15];
-cx q[3],q[15];
-rz(0.09802602334562639) q[16];
-cx q[0],q[16];
-cx q[0],q[20];
-cx q[3],q[16];
-rz(0.09802602334562639) q[16];
-cx q[3],q[16];
-rz(0.09802602334562639) q[17];
-cx q[1],q[17];
-cx q[1],q[28];
-cx q[3],q[17];
-rz(0.09802602334562639) q[17];
-cx q[3],q[17];
-cx q[3],q[18];
-rz(0.09802602334562639) q[18];
-cx q[3],q[18];
-cx q[3],q[19];
-cx q[4],q[18];
-rz(0.09802602334562639) q[18];
-cx q[4],q[18];
-cx q[4],q[21];
-rz(0.09802602334562639) q[19];
-cx q[3],q[19];
-cx q[3],q[22];
-cx q[7],q[19];
-rz(0.09802602334562639) q[19];
-cx q[7],q[19];
-cx q[19],q[38];
-rz(0.09802602334562639) q[20];
-cx q[0],q[20];
-cx q[0],q[32];
-cx q[15],q[20];
-rz(0.09802602334562639) q[20];
-cx q[15],q[20];
-rz(0.09802602334562639) q[21];
-cx q[4],q[21];
-cx q[4],q[27];
-cx q[15],q[21];
-rz(0.09802602334562639) q[21];
-cx q[15],q[21];
-cx q[15],q[36];
-rz(0.09802602334562639) q[22];
-cx q[3],q[22];
-cx q[3],q[23];
-cx q[9],q[22];
-rz(0.09802602334562639) q[22];
-cx q[9],q[22];
-cx q[9],q[55];
-rx(3.706223595686673) q[22];
-rz(0.09802602334562639) q[23];
-cx q[3],q[23];
-cx q[3],q[24];
-cx q[17],q[23];
-rz(0.09802602334562639) q[23];
-cx q[17],q[23];
-rz(0.09802602334562639) q[24];
-cx q[3],q[24];
-cx q[3],q[25];
-cx q[5],q[24];
-rz(0.09802602334562639) q[24];
-cx q[5],q[24];
-cx q[5],q[33];
-cx q[24],q[54];
-rz(0.09802602334562639) q[25];
-cx q[3],q[25];
-cx q[3],q[26];
-cx q[12],q[25];
-rz(0.09802602334562639) q[25];
-cx q[12],q[25];
-cx q[12],q[31];
-rx(3.706223595686673) q[25];
-rz(0.09802602334562639) q[26];
-cx q[3],q[26];
-cx q[21],q[26];
-rz(0.09802602334562639) q[26];
-cx q[21],q[26];
-rz(0.09802602334562639) q[27];
-cx q[4],q[27];
-cx q[4],q[47];
-cx q[6],q[27];
-rz(0.09802602334562639) q[27];
-cx q[6],q[27];
-cx q[6],q[69];
-rz(0.09802602334562639) q[28];
-cx q[1],q[28];
-cx q[1],q[29];
-cx q[3],q[28];
-rz(0.09802602334562639) q[28];
-cx q[3],q[28];
-rz(0.09802602334562639) q[29];
-cx q[1],q[29];
-cx q[1],q[45];
-cx q[3],q[29];
-rz(0.09802602334562639) q[29];
-cx q[3],q[29];
-rx(3.706223595686673) q[29];
-cx q[30],q[77];
-rz(0.09802602334562639) q[31];
-cx q[12],q[31];
-cx q[26],q[31];
-rz(0.09802602334562639) q[31];
-cx q[26],q[31];
-rx(3.706223595686673) q[26];
-rx(3.706223595686673) q[31];
-rz(0.09802602334562639) q[32];
-cx q[0],q[32];
-cx q[21],q[32];
-rz(0.09802602334562639) q[32];
-cx q[21],q[32];
-rz(0.09802602334562639) q[33];
-cx q[5],q[33];
-cx q[5],q[46];
-rz(0.09802602334562639) q[36];
-cx q[15],q[36];
-cx q[20],q[36];
-rz(0.09802602334562639) q[36];
-cx q[20],q[36];
-rx(3.706223595686673) q[36];
-rz(0.09802602334562639) q[37];
-cx q[10],q[37];
-cx q[10],q[41];
-rz(0.09802602334562639) q[38];
-cx q[19],q[38];
-rx(3.706223595686673) q[19];
-cx q[21],q[38];
-rz(0.09802602334562639) q[38];
-cx q[21],q[38];
-rz(0.09802602334562639) q[41];
-cx q[10],q[41];
-cx q[27],q[41];
-rz(0.09802602334562639) q[41];
-cx q[27],q[41];
-cx q[27],q[72];
-cx q[41],q[67];
-rz(0.09802602334562639) q[45];
-cx q[1],q[45];
-cx q[1],q[57];
-cx q[16],q[45];
-rz(0.09802602334562639) q[45];
-cx q[16],q[45];
-cx q[16],q[59];
-rz(0.09802602334562639) q[46];
-cx q[5],q[46];
-cx q[5],q[65];
-cx q[38],q[46];
-rz(0.09802602334562639) q[46];
-cx q[38],q[46];
-rx(3.706223595686673) q[38];
-rx(3.706223595686673) q[46];
-rz(0.09802602334562639) q[47];
-cx q[4],q[47];
-cx q[17],q[47];
-rz(0.09802602334562639) q[47];
-cx q[17],q[47];
-cx q[17],q[53];
-rz(0.09802602334562639) q[53];
-cx q[17],q[53];
-cx q[21],q[53];
-rz(0.09802602334562639) q[53];
-cx q[21],q[53];
-rz(0.09802602334562639) q[54];
-cx q[24],q[54];
-cx q[24],q[58];
-rz(0.09802602334562639) q[55];
-cx q[9],q[55];
-rx(3.706223595686673) q[9];
-cx q[15],q[55];
-rz(0.09802602334562639) q[55];
-cx q[15],q[55];
-rx(3.706223595686673) q[55];
-rz(0.09802602334562639) q[57];
-cx q[1],q[57];
-rz(0.09802602334562639) q[58];
-cx q[24],q[58];
-rx(3.706223595686673) q[24];
-rz(0.09802602334562639) q[59];
-cx q[16],q[59];
-cx q[16],q[73];
-rz(0.09802602334562639) q[65];
-cx q[5],q[65];
-cx q[5],q[76];
-rz(0.09802602334562639) q[67];
-cx q[41],q[67];
-rx(3.706223595686673) q[41];
-rz(0.09802602334562639) q[69];
-cx q[6],q[69];
-rz(0.09802602334562639) q[72];
-cx q[27],q[72];
-rx(3.706223595686673) q[27];
-rz(0.09802602334562639) q[73];
-cx q[16],q[73];
-rx(3.706223595686673) q[16];
-rz(0.09802602334562639) q[76];
-cx q[5],q[76];
-rx(3.706223595686673) q[5];
-cx q[6],q[76];
-rz(0.09802602334562639) q[76];
-cx q[6],q[76];
-rx(3.706223595686673) q[6];
-rx(3.706223595686673) q[76];
-rz(0.18518819459006455) q[77];
-cx q[30],q[77];
-rx(6.345815249371433) q[30];
-cx q[3],q[30];
-rz(0.09802602334562639) q[30];
-cx q[3],q[30];
-cx q[3],q[34];
-cx q[18],q[30];
-rz(0.09802602334562639) q[30];
-cx q[18],q[30];
-rx(3.706223595686673) q[18];
-cx q[30],q[33];
-rz(0.09802602334562639) q[33];
-cx q[30],q[33];
-rx(3.706223595686673) q[33];
-rz(0.09802602334562639) q[34];
-cx q[3],q[34];
-cx q[3],q[35];
-cx q[12],q[34];
-rz(0.09802602334562639) q[34];
-cx q[12],q[34];
-cx q[34],q[37];
-rz(0.09802602334562639) q[35];
-cx q[3],q[35];
-cx q[3],q[39];
-cx q[32],q[35];
-rz(0.09802602334562639) q[35];
-cx q[32],q[35];
-cx q[32],q[59];
-rx(3.706223595686673) q[35];
-rz(0.09802602334562639) q[37];
-cx q[34],q[37];
-rx(3.706223595686673) q[34];
-rx(3.706223595686673) q[37];
-rz(0.09802602334562639) q[39];
-cx q[3],q[39];
-cx q[3],q[40];
-cx q[13],q[39];
-rz(0.09802602334562639) q[39];
-cx q[13],q[39];
-cx q[13],q[56];
-rx(3.706223595686673) q[39];
-rz(0.09802602334562639) q[40];
-cx q[3],q[40];
-cx q[23],q[40];
-rz(0.09802602334562639) q[40];
-cx q[23],q[40];
-cx q[23],q[65];
-rx(3.706223595686673) q[40];
-rz(0.09802602334562639) q[56];
-cx q[13],q[56];
-cx q[13],q[68];
-cx q[45],q[56];
-rz(0.09802602334562639) q[56];
-cx q[45],q[56];
-rx(3.706223595686673) q[45];
-cx q[56],q[67];
-rz(0.09802602334562639) q[59];
-cx q[32],q[59];
-cx q[59],q[69];
-rz(0.09802602334562639) q[65];
-cx q[23],q[65];
-rx(3.706223595686673) q[23];
-rx(3.706223595686673) q[65];
-rz(0.09802602334562639) q[67];
-cx q[56],q[67];
-cx q[56],q[74];
-rx(3.706223595686673) q[67];
-rz(0.09802602334562639) q[68];
-cx q[13],q[68];
-rx(3.706223595686673) q[13];
-cx q[32],q[68];
-rz(0.09802602334562639) q[68];
-cx q[32],q[68];
-rx(3.706223595686673) q[32];
-rx(3.706223595686673) q[68];
-rz(0.09802602334562639) q[69];
-cx q[59],q[69];
-cx q[59],q[73];
-rx(3.706223595686673) q[69];
-rz(0.09802602334562639) q[73];
-cx q[59],q[73];
-rx(3.706223595686673) q[59];
-rx(3.706223595686673) q[73];
-rz(0.09802602334562639) q[74];
-cx q[56],q[74];
-rx(3.706223595686673) q[56];
-rx(6.345815249371433) q[77];
-ry(pi/2) q[78];
-rx(pi) q[78];
-cx q[42],q[78];
-rz(0.18518819459006455) q[78];
-cx q[42],q[78];
-rx(6.345815249371433) q[42];
-cx q[0],q[42];
-rz(0.09802602334562639) q[42];
-cx q[0],q[42];
-cx q[0],q[48];
-cx q[3],q[42];
-rz(0.09802602334562639) q[42];
-cx q[3],q[42];
-cx q[3],q[43];
-rz(0.09802602334562639) q[43];
-cx q[3],q[43];
-cx q[3],q[44];
-cx q[20],q[43];
-rz(0.09802602334562639) q[43];
-cx q[20],q[43];
-rx(3.706223595686673) q[20];
-rx(3.706223595686673) q[43];
-rz(0.09802602334562639) q[44];
-cx q[3],q[44];
-cx q[3],q[49];
-cx q[12],q[44];
-rz(0.09802602334562639) q[44];
-cx q[12],q[44];
-cx q[44],q[72];
-rz(0.09802602334562639) q[48];
-cx q[0],q[48];
-cx q[0],q[51];
-cx q[30],q[48];
-rz(0.09802602334562639) q[48];
-cx q[30],q[48];
-rx(3.706223595686673) q[48];
-rz(0.09802602334562639) q[49];
-cx q[3],q[49];
-cx q[3],q[50];
-cx q[4],q[49];
-rz(0.09802602334562639) q[49];
-cx q[4],q[49];
-cx q[4],q[61];
-rx(3.706223595686673) q[49];
-rz(0.09802602334562639) q[50];
-cx q[3],q[50];
-cx q[3],q[52];
-cx q[12],q[50];
-rz(0.09802602334562639) q[50];
-cx q[12],q[50];
-cx q[12],q[63];
-rx(3.706223595686673) q[50];
-rz(0.09802602334562639) q[51];
-cx q[0],q[51];
-cx q[0],q[62];
-cx q[28],q[51];
-rz(0.09802602334562639) q[51];
-cx q[28],q[51];
-cx q[28],q[54];
-rx(3.706223595686673) q[51];
-rz(0.09802602334562639) q[52];
-cx q[3],q[52];
-cx q[3],q[57];
-cx q[10],q[52];
-rz(0.09802602334562639) q[52];
-cx q[10],q[52];
-rx(3.706223595686673) q[52];
-rz(0.09802602334562639) q[54];
-cx q[28],q[54];
-cx q[28],q[58];
-rx(3.706223595686673) q[54];
-rz(0.09802602334562639) q[57];
-cx q[3],q[57];
-cx q[3],q[70];
-rx(3.706223595686673) q[57];
-rz(0.09802602334562639) q[58];
-cx q[28],q[58];
-rx(3.706223595686673) q[28];
-rx(3.706223595686673) q[58];
-cx q[60],q[78];
-rz(0.09802602334562639) q[61];
-cx q[4],q[61];
-rx(3.706223595686673) q[4];
-rz(0.09802602334562639) q[62];
-cx q[0],q[62];
-cx q[0],q[64];
-cx q[17],q[62];
-rz(0.09802602334562639) q[62];
-cx q[17],q[62];
-rx(3.706223595686673) q[62];
-rz(0.09802602334562639) q[63];
-cx q[12],q[63];
-rx(3.706223595686673) q[12];
-cx q[17],q[63];
-rz(0.09802602334562639) q[63];
-cx q[17],q[63];
-cx q[17],q[66];
-cx q[63],q[74];
-rz(0.09802602334562639) q[64];
-cx q[0],q[64];
-cx q[0],q[75];
-cx q[10],q[64];
-rz(0.09802602334562639) q[64];
-cx q[10],q[64];
-rx(3.706223595686673) q[10];
-rx(3.706223595686673) q[64];
-rz(0.09802602334562639) q[66];
-cx q[17],q[66];
-rx(3.706223595686673) q[17];
-cx q[47],q[66];
-rz(0.09802602334562639) q[66];
-cx q[47],q[66];
-rx(3.706223595686673) q[47];
-rx(3.706223595686673) q[66];
-rz(0.09802602334562639) q[70];
-cx q[3],q[70];
-cx q[3],q[71];
-cx q[15],q[70];
-rz(0.09802602334562639) q[70];
-cx q[15],q[70];
-rx(3.706223595686673) q[15];
-rx(3.706223595686673) q[70];
-rz(0.09802602334562639) q[71];
-cx q[3],q[71];
-cx q[3],q[77];
-cx q[53],q[71];
-rz(0.09802602334562639) q[71];
-cx q[53],q[71];
-rx(3.706223595686673) q[53];
-rx(3.706223595686673) q[71];
-rz(0.09802602334562639) q[72];
-cx q[44],q[72];
-rx(3.706223595686673) q[44];
-rx(3.706223595686673) q[72];
-rz(0.09802602334562639) q[74];
-cx q[63],q[74];
-rx(3.706223595686673) q[63];
-rx(3.706223595686673) q[74];
-rz(0.09802602334562639) q[75];
-cx q[0],q[75];
-rx(3.706223595686673) q[0];
-cx q[21],q[75];
-rz(0.09802602334562639) q[75];
-cx q[21],q[75];
-rx(3.706223595686673) q[21];
-rx(3.706223595686673) q[75];
-rz(0.09802602334562639) q[77];
-cx q[3],q[77];
-rx(3.706223595686673) q[3];
-cx q[30],q[77];
-rz(0.09802602334562639) q[77];
-cx q[30],q[77];
-rx(3.706223595686673) q[30];
-rx(3.706223595686673) q[77];
-rz(0.18518819459006455) q[78];
-cx q[60],q[78];
-rx(6.345815249371433) q[60];
-cx q[1],q[60];
-rz(0.09802602334562639) q[60];
-cx q[1],q[60];
-rx(3.706223595686673) q[1];
-cx q[0],q[1];
-rz(5.395470989670104) q[1];
-cx q[0],q[1];
-cx q[0],q[2];
-rz(5.395470989670104) q[2];
-cx q[0],q[2];
-cx q[0],q[3];
-rx(3.758895428847857) q[2];
-rz(5.395470989670104) q[3];
-cx q[0],q[3];
-cx q[0],q[15];
-cx q[1],q[3];
-rz(5.395470989670104) q[3];
-cx q[1],q[3];
-cx q[1],q[4];
-rz(5.395470989670104) q[4];
-cx q[1],q[4];
-cx q[1],q[5];
-cx q[3],q[4];
-rz(5.395470989670104) q[4];
-cx q[3],q[4];
-cx q[4],q[6];
-rz(5.395470989670104) q[5];
-cx q[1],q[5];
-cx q[1],q[9];
-cx q[3],q[5];
-rz(5.395470989670104) q[5];
-cx q[3],q[5];
-rz(5.395470989670104) q[6];
-cx q[4],q[6];
-cx q[5],q[6];
-rz(5.395470989670104) q[6];
-cx q[5],q[6];
-cx q[7],q[60];
-rz(5.395470989670104) q[9];
-cx q[1],q[9];
-cx q[1],q[17];
-rz(5.395470989670104) q[15];
-cx q[0],q[15];
-cx q[0],q[16];
-rz(5.395470989670104) q[16];
-cx q[0],q[16];
-cx q[0],q[20];
-rz(5.395470989670104) q[17];
-cx q[1],q[17];
-cx q[1],q[28];
-rz(5.395470989670104) q[20];
-cx q[0],q[20];
-cx q[0],q[32];
-rz(5.395470989670104) q[28];
-cx q[1],q[28];
-cx q[1],q[29];
-rz(5.395470989670104) q[29];
-cx q[1],q[29];
-cx q[1],q[45];
-rz(5.395470989670104) q[32];
-cx q[0],q[32];
-rz(5.395470989670104) q[45];
-cx q[1],q[45];
-cx q[1],q[57];
-rz(5.395470989670104) q[57];
-cx q[1],q[57];
-rz(0.09802602334562639) q[60];
-cx q[7],q[60];
-cx q[7],q[61];
-rz(0.09802602334562639) q[61];
-cx q[7],q[61];
-rx(3.706223595686673) q[7];
-cx q[3],q[7];
-rz(5.395470989670104) q[7];
-cx q[3],q[7];
-cx q[3],q[8];
-cx q[4],q[7];
-rz(5.395470989670104) q[7];
-cx q[4],q[7];
-cx q[4],q[10];
-rz(5.395470989670104) q[8];
-cx q[3],q[8];
-cx q[3],q[9];
-cx q[5],q[8];
-rz(5.395470989670104) q[8];
-cx q[5],q[8];
-cx q[5],q[11];
-rx(3.758895428847857) q[8];
-rz(5.395470989670104) q[9];
-cx q[3],q[9];
-cx q[3],q[12];
-rz(5.395470989670104) q[10];
-cx q[4],q[10];
-cx q[4],q[13];
-cx q[6],q[10];
-rz(5.395470989670104) q[10];
-cx q[6],q[10];
-cx q[10],q[37];
-rz(5.395470989670104) q[11];
-cx q[5],q[11];
-cx q[6],q[11];
-rz(5.395470989670104) q[11];
-cx q[6],q[11];
-rx(3.758895428847857) q[11];
-rz(5.395470989670104) q[12];
-cx q[3],q[12];
-cx q[3],q[14];
-cx q[5],q[12];
-rz(5.395470989670104) q[12];
-cx q[5],q[12];
-rz(5.395470989670104) q[13];
-cx q[4],q[13];
-cx q[5],q[13];
-rz(5.395470989670104) q[13];
-cx q[5],q[13];
-rz(5.395470989670104) q[14];
-cx q[3],q[14];
-cx q[3],q[15];
-cx q[4],q[14];
-rz(5.395470989670104) q[14];
-cx q[4],q[14];
-rx(3.758895428847857) q[14];
-rz(5.395470989670104) q[15];
-cx q[3],q[15];
-cx q[3],q[16];
-cx q[15],q[20];
-rz(5.395470989670104) q[16];
-cx q[3],q[16];
-cx q[3],q[17];
-cx q[16],q[45];
-rz(5.395470989670104) q[17];
-cx q[3],q[17];
-cx q[3],q[18];
-rz(5.395470989670104) q[18];
-cx q[3],q[18];
-cx q[3],q[19];
-cx q[4],q[18];
-rz(5.395470989670104) q[18];
-cx q[4],q[18];
-cx q[4],q[21];
-rz(5.395470989670104) q[19];
-cx q[3],q[19];
-cx q[3],q[22];
-cx q[7],q[19];
-rz(5.395470989670104) q[19];
-cx q[7],q[19];
-cx q[19],q[38];
-rz(5.395470989670104) q[20];
-cx q[15],q[20];
-rz(5.395470989670104) q[21];
-cx q[4],q[21];
-cx q[4],q[27];
-cx q[15],q[21];
-rz(5.395470989670104) q[21];
-cx q[15],q[21];
-cx q[15],q[36];
-rz(5.395470989670104) q[22];
-cx q[3],q[22];
-cx q[3],q[23];
-cx q[9],q[22];
-rz(5.395470989670104) q[22];
-cx q[9],q[22];
-cx q[9],q[55];
-rx(3.758895428847857) q[22];
-rz(5.395470989670104) q[23];
-cx q[3],q[23];
-cx q[3],q[24];
-cx q[17],q[23];
-rz(5.395470989670104) q[23];
-cx q[17],q[23];
-rz(5.395470989670104) q[24];
-cx q[3],q[24];
-cx q[3],q[25];
-cx q[5],q[24];
-rz(5.395470989670104) q[24];
-cx q[5],q[24];
-cx q[5],q[33];
-cx q[24],q[54];
-rz(5.395470989670104) q[25];
-cx q[3],q[25];
-cx q[3],q[26];
-cx q[12],q[25];
-rz(5.395470989670104) q[25];
-cx q[12],q[25];
-cx q[12],q[31];
-rx(3.758895428847857) q[25];
-rz(5.395470989670104) q[26];
-cx q[3],q[26];
-cx q[3],q[28];
-cx q[21],q[26];
-rz(5.395470989670104) q[26];
-cx q[21],q[26];
-cx q[21],q[32];
-rz(5.395470989670104) q[27];
-cx q[4],q[27];
-cx q[4],q[47];
-cx q[6],q[27];
-rz(5.395470989670104) q[27];
-cx q[6],q[27];
-cx q[6],q[69];
-rz(5.395470989670104) q[28];
-cx q[3],q[28];
-cx q[3],q[29];
-rz(5.395470989670104) q[29];
-cx q[3],q[29];
-cx q[3],q[30];
-rx(3.758895428847857) q[29];
-rz(5.395470989670104) q[30];
-cx q[3],q[30];
-cx q[3],q[34];
-cx q[18],q[30];
-rz(5.395470989670104) q[30];
-cx q[18],q[30];
-rx(3.758895428847857) q[18];
-rz(5.395470989670104) q[31];
-cx q[12],q[31];
-cx q[26],q[31];
-rz(5.395470989670104) q[31];
-cx q[26],q[31];
-rx(3.758895428847857) q[26];
-rx(3.758895428847857) q[31];
-rz(5.395470989670104) q[32];
-cx q[21],q[32];
-rz(5.395470989670104) q[33];
-cx q[5],q[33];
-cx q[5],q[46];
-cx q[30],q[33];
-rz(5.395470989670104) q[33];
-cx q[30],q[33];
-rx(3.758895428847857) q[33];
-rz(5.395470989670104) q[34];
-cx q[3],q[34];
-cx q[3],q[35];
-cx q[12],q[34];
-rz(5.395470989670104) q[34];
-cx q[12],q[34];
-rz(5.395470989670104) q[35];
-cx q[3],q[35];
-cx q[3],q[39];
-cx q[32],q[35];
-rz(5.395470989670104) q[35];
-cx q[32],q[35];
-rx(3.758895428847857) q[35];
-rz(5.395470989670104) q[36];
-cx q[15],q[36];
-cx q[20],q[36];
-rz(5.395470989670104) q[36];
-cx q[20],q[36];
-rx(3.758895428847857) q[36];
-rz(5.395470989670104) q[37];
-cx q[10],q[37];
-cx q[10],q[41];
-cx q[34],q[37];
-rz(5.395470989670104) q[37];
-cx q[34],q[37];
-rx(3.758895428847857) q[34];
-rx(3.758895428847857) q[37];
-rz(5.395470989670104) q[38];
-cx q[19],q[38];
-rx(3.758895428847857) q[19];
-cx q[21],q[38];
-rz(5.395470989670104) q[38];
-cx q[21],q[38];
-rz(5.395470989670104) q[39];
-cx q[3],q[39];
-cx q[3],q[40];
-cx q[13],q[39];
-rz(5.395470989670104) q[39];
-cx q[13],q[39];
-cx q[13],q[56];
-rx(3.758895428847857) q[39];
-rz(5.395470989670104) q[40];
-cx q[3],q[40];
-cx q[23],q[40];
-rz(5.395470989670104) q[40];
-cx q[23],q[40];
-rx(3.758895428847857) q[40];
-rz(5.395470989670104) q[41];
-cx q[10],q[41];
-cx q[27],q[41];
-rz(5.395470989670104) q[41];
-cx q[27],q[41];
-cx q[27],q[72];
-cx q[41],q[67];
-rz(5.395470989670104) q[45];
-cx q[16],q[45];
-cx q[16],q[59];
-rz(5.395470989670104) q[46];
-cx q[5],q[46];
-cx q[5],q[65];
-cx q[38],q[46];
-rz(5.395470989670104) q[46];
-cx q[38],q[46];
-rx(3.758895428847857) q[38];
-rx(3.758895428847857) q[46];
-rz(5.395470989670104) q[47];
-cx q[4],q[47];
-cx q[17],q[47];
-rz(5.395470989670104) q[47];
-cx q[17],q[47];
-cx q[17],q[53];
-rz(5.395470989670104) q[53];
-cx q[17],q[53];
-cx q[21],q[53];
-rz(5.395470989670104) q[53];
-cx q[21],q[53];
-rz(5.395470989670104) q[54];
-cx q[24],q[54];
-cx q[24],q[58];
-rz(5.395470989670104) q[55];
-cx q[9],q[55];
-rx(3.758895428847857) q[9];
-cx q[15],q[55];
-rz(5.395470989670104) q[55];
-cx q[15],q[55];
-rx(3.758895428847857) q[55];
-rz(5.395470989670104) q[56];
-cx q[13],q[56];
-cx q[13],q[68];
-cx q[45],q[56];
-rz(5.395470989670104) q[56];
-cx q[45],q[56];
-rx(3.758895428847857) q[45];
-rz(5.395470989670104) q[58];
-cx q[24],q[58];
-rx(3.758895428847857) q[24];
-rz(5.395470989670104) q[59];
-cx q[16],q[59];
-cx q[16],q[73];
-cx q[32],q[59];
-rz(5.395470989670104) q[59];
-cx q[32],q[59];
-rx(3.706223595686673) q[61];
-rz(5.395470989670104) q[65];
-cx q[5],q[65];
-cx q[5],q[76];
-cx q[23],q[65];
-rz(5.395470989670104) q[65];
-cx q[23],q[65];
-rx(3.758895428847857) q[23];
-rx(3.758895428847857) q[65];
-rz(5.395470989670104) q[67];
-cx q[41],q[67];
-rx(3.758895428847857) q[41];
-cx q[56],q[67];
-rz(5.395470989670104) q[67];
-cx q[56],q[67];
-cx q[56],q[74];
-rx(3.758895428847857) q[67];
-rz(5.395470989670104) q[68];
-cx q[13],q[68];
-rx(3.758895428847857) q[13];
-cx q[32],q[68];
-rz(5.395470989670104) q[68];
-cx q[32],q[68];
-rx(3.758895428847857) q[32];
-rx(3.758895428847857) q[68];
-rz(5.395470989670104) q[69];
-cx q[6],q[69];
-cx q[59],q[69];
-rz(5.395470989670104) q[69];
-cx q[59],q[69];
-rx(3.758895428847857) q[69];
-rz(5.395470989670104) q[72];
-cx q[27],q[72];
-rx(3.758895428847857) q[27];
-rz(5.395470989670104) q[73];
-cx q[16],q[73];
-rx(3.758895428847857) q[16];
-cx q[59],q[73];
-rz(5.395470989670104) q[73];
-cx q[59],q[73];
-rx(3.758895428847857) q[59];
-rx(3.758895428847857) q[73];
-rz(5.395470989670104) q[74];
-cx q[56],q[74];
-rx(3.758895428847857) q[56];
-rz(5.395470989670104) q[76];
-cx q[5],q[76];
-rx(3.758895428847857) q[5];
-cx q[6],q[76];
-rz(5.395470989670104) q[76];
-cx q[6],q[76];
-rx(3.758895428847857) q[6];
-rx(3.758895428847857) q[76];
-rx(6.345815249371433) q[78];
-cx q[42],q[78];
-rz(0.09802602334562639) q[78];
-cx q[42],q[78];
-rx(3.706223595686673) q[42];
-cx q[0],q[42];
-rz(5.395470989670104) q[42];
-cx q[0],q[42];
-cx q[0],q[48];
-cx q[3],q[42];
-rz(5.395470989670104) q[42];
-cx q[3],q[42];
-cx q[3],q[43];
-rz(5.395470989670104) q[43];
-cx q[3],q[43];
-cx q[3],q[44];
-cx q[20],q[43];
-rz(5.395470989670104) q[43];
-cx q[20],q[43];
-rx(3.758895428847857) q[20];
-rx(3.758895428847857) q[43];
-rz(5.395470989670104) q[44];
-cx q[3],q[44];
-cx q[3],q[49];
-cx q[12],q[44];
-rz(5.395470989670104) q[44];
-cx q[12],q[44];
-cx q[44],q[72];
-rz(5.395470989670104) q[48];
-cx q[0],q[48];
-cx q[0],q[51];
-cx q[30],q[48];
-rz(5.395470989670104) q[48];
-cx q[30],q[48];
-rx(3.758895428847857) q[48];
-rz(5.395470989670104) q[49];
-cx q[3],q[49];
-cx q[3],q[50];
-cx q[4],q[49];
-rz(5.395470989670104) q[49];
-cx q[4],q[49];
-cx q[4],q[61];
-rx(3.758895428847857) q[49];
-rz(5.395470989670104) q[50];
-cx q[3],q[50];
-cx q[3],q[52];
-cx q[12],q[50];
-rz(5.395470989670104) q[50];
-cx q[12],q[50];
-cx q[12],q[63];
-rx(3.758895428847857) q[50];
-rz(5.395470989670104) q[51];
-cx q[0],q[51];
-cx q[0],q[62];
-cx q[28],q[51];
-rz(5.395470989670104) q[51];
-cx q[28],q[51];
-cx q[28],q[54];
-rx(3.758895428847857) q[51];
-rz(5.395470989670104) q[52];
-cx q[3],q[52];
-cx q[3],q[57];
-cx q[10],q[52];
-rz(5.395470989670104) q[52];
-cx q[10],q[52];
-rx(3.758895428847857) q[52];
-rz(5.395470989670104) q[54];
-cx q[28],q[54];
-cx q[28],q[58];
-rx(3.758895428847857) q[54];
-rz(5.395470989670104) q[57];
-cx q[3],q[57];
-cx q[3],q[70];
-rx(3.758895428847857) q[57];
-rz(5.395470989670104) q[58];
-cx q[28],q[58];
-rx(3.758895428847857) q[28];
-rx(3.758895428847857) q[58];
-cx q[60],q[78];
-rz(5.395470989670104) q[61];
-cx q[4],q[61];
-rx(3.758895428847857) q[4];
-rz(5.395470989670104) q[62];
-cx q[0],q[62];
-cx q[0],q[64];
-cx q[17],q[62];
-rz(5.395470989670104) q[62];
-cx q[17],q[62];
-rx(3.758895428847857) q[62];
-rz(5.395470989670104) q[63];
-cx q[12],q[63];
-rx(3.758895428847857) q[12];
-cx q[17],q[63];
-rz(5.395470989670104) q[63];
-cx q[17],q[63];
-cx q[17],q[66];
-cx q[63],q[74];
-rz(5.395470989670104) q[64];
-cx q[0],q[64];
-cx q[0],q[75];
-cx q[10],q[64];
-rz(5.395470989670104) q[64];
-cx q[10],q[64];
-rx(3.758895428847857) q[10];
-rx(3.758895428847857) q[64];
-rz(5.395470989670104) q[66];
-cx q[17],q[66];
-rx(3.758895428847857) q[17];
-cx q[47],q[66];
-rz(5.395470989670104) q[66];
-cx q[47],q[66];
-rx(3.758895428847857) q[47];
-rx(3.758895428847857) q[66];
-rz(5.395470989670104) q[70];
-cx q[3],q[70];
-cx q[3],q[71];
-cx q[15],q[70];
-rz(5.395470989670104) q[70];
-cx q[15],q[70];
-rx(3.758895428847857) q[15];
-rx(3.758895428847857) q[70];
-rz(5.395470989670104) q[71];
-cx q[3],q[71];
-cx q[3],q[77];
-cx q[53],q[71];
-rz(5.395470989670104) q[71];
-cx q[53],q[71];
-rx(3.758895428847857) q[53];
-rx(3.758895428847857) q[71];
-rz(5.395470989670104) q[72];
-cx q[44],q[72];
-rx(3.758895428847857) q[44];
-rx(3.758895428847857) q[72];
-rz(5.395470989670104) q[74];
-cx q[63],q[74];
-rx(3.758895428847857) q[63];
-rx(3.758895428847857) q[74];
-rz(5.395470989670104) q[75];
-cx q[0],q[75];
-rx(3.758895428847857) q[0];
-cx q[21],q[75];
-rz(5.395470989670104) q[75];
-cx q[21],q[75];
-rx(3.758895428847857) q[21];
-rx(3.758895428847857) q[75];
-rz(5.395470989670104) q[77];
-cx q[3],q[77];
-rx(3.758895428847857) q[3];
-cx q[30],q[77];
-rz(5.395470989670104) q[77];
-cx q[30],q[77];
-rx(3.758895428847857) q[30];
-rx(3.758895428847857) q[77];
-rz(0.09802602334562639) q[78];
-cx q[60],q[78];
-rx(3.706223595686673) q[60];
-cx q[1],q[60];
-rz(5.395470989670104) q[60];
-cx q[1],q[60];
-rx(3.758895428847857) q[1];
-cx q[7],q[60];
-rz(5.395470989670104) q[60];
-cx q[7],q[60];
-cx q[7],q[61];
-rz(5.395470989670104) q[61];
-cx q[7],q[61];
-rx(3.758895428847857) q[7];
-rx(3.758895428847857) q[61];
-rx(3.706223595686673) q[78];
-cx q[42],q[78];
-rz(5.395470989670104) q[78];
-cx q[42],q[78];
-rx(3.758895428847857) q[42];
-cx q[60],q[78];
-rz(5.395470989670104) q[78];
-cx q[60],q[78];
-rx(3.758895428847857) q[60];
-rx(3.758895428847857) q[78];
\ No newline at end of file
@@ -1,128 +0,0 @@
-OPENQASM 2.0;
-include "qelib1.inc";
-qreg q[7];
-ry(pi/2) q[0];
-rx(pi) q[0];
-ry(pi/2) q[1];
-rx(pi) q[1];
-cx q[0],q[1];
-rz(6.053970009199266) q[1];
-cx q[0],q[1];
-ry(pi/2) q[2];
-rx(pi) q[2];
-cx q[0],q[2];
-rz(6.053970009199266) q[2];
-cx q[0],q[2];
-rx(6.489693966439857) q[2];
-ry(pi/2) q[3];
-rx(pi) q[3];
-cx q[0],q[3];
-rz(6.053970009199266) q[3];
-cx q[0],q[3];
-rx(6.489693966439857) q[0];
-cx q[1],q[3];
-rz(6.053970009199266) q[3];
-cx q[1],q[3];
-ry(pi/2) q[4];
-rx(pi) q[4];
-cx q[1],q[4];
-rz(6.053970009199266) q[4];
-cx q[1],q[4];
-cx q[3],q[4];
-rz(6.053970009199266) q[4];
-cx q[3],q[4];
-ry(pi/2) q[5];
-rx(pi) q[5];
-cx q[1],q[5];
-rz(6.053970009199266) q[5];
-cx q[1],q[5];
-rx(6.489693966439857) q[1];
-cx q[0],q[1];
-rz(4.485562250371725) q[1];
-cx q[0],q[1];
-cx q[0],q[2];
-rz(4.485562250371725) q[2];
-cx q[0],q[2];
-rx(4.734529345637727) q[2];
-cx q[3],q[5];
-rz(6.053970009199266) q[5];
-cx q[3],q[5];
-rx(6.489693966439857) q[3];
-cx q[0],q[3];
-rz(4.485562250371725) q[3];
-cx q[0],q[3];
-rx(4.734529345637727) q[0];
-cx q[1],q[3];
-rz(4.485562250371725) q[3];
-cx q[1],q[3];
-ry(pi/2) q[6];
-rx(pi) q[6];
-cx q[4],q[6];
-rz(6.053970009199266) q[6];
-cx q[4],q[6];
-rx(6.489693966439857) q[4];
-cx q[1],q[4];
-rz(4.485562250371725) q[4];
-cx q[1],q[4];
-cx q[3],q[4];
-rz(4.485562250371725) q[4];
-cx q[3],q[4];
-cx q[5],q[6];
-rz(6.053970009199266) q[6];
-cx q[5],q[6];
-rx(6.489693966439857) q[5];
-cx q[1],q[5];
-rz(4.485562250371725) q[5];
-cx q[1],q[5];
-rx(4.734529345637727) q[1];
-cx q[0],q[1];
-rz(5.098203200466886) q[1];
-cx q[0],q[1];
-cx q[0],q[2];
-rz(5.098203200466886) q[2];
-cx q[0],q[2];
-rx(10.385551531156034) q[2];
-cx q[3],q[5];
-rz(4.485562250371725) q[5];
-cx q[3],q[5];
-rx(4.734529345637727) q[3];
-cx q[0],q[3];
-rz(5.098203200466886) q[3];
-cx q[0],q[3];
-rx(10.385551531156034) q[0];
-cx q[1],q[3];
-rz(5.098203200466886) q[3];
-cx q[1],q[3];
-rx(6.489693966439857) q[6];
-cx q[4],q[6];
-rz(4.485562250371725) q[6];
-cx q[4],q[6];
-rx(4.734529345637727) q[4];
-cx q[1],q[4];
-rz(5.098203200466886) q[4];
-cx q[1],q[4];
-cx q[3],q[4];
-rz(5.098203200466886) q[4];
-cx q[3],q[4];
-cx q[5],q[6];
-rz(4.485562250371725) q[6];
-cx q[5],q[6];
-rx(4.734529345637727) q[5];
-cx q[1],q[5];
-rz(5.098203200466886) q[5];
-cx q[1],q[5];
-rx(10.385551531156034) q[1];
-cx q[3],q[5];
-rz(5.098203200466886) q[5];
-cx q[3],q[5];
-rx(10.385551531156034) q[3];
-rx(4.734529345637727) q[6];
-cx q[4],q[6];
-rz(5.098203200466886) q[6];
-cx q[4],q[6];
-rx(10.385551531156034) q[4];
-cx q[5],q[6];
-rz(5.098203200466886) q[6];
-cx q[5],q[6];
-rx(10.385551531156034) q[5];
-rx(10.385551531156034) q[6];
\ No newline at end of file
@@ -1,1853 +0,0 @@
-OPENQASM 2.0;
-include "qelib1.inc";
-qreg q[82];
-ry(pi/2) q[0];
-rx(pi) q[0];
-ry(pi/2) q[1];
-rx(pi) q[1];
-cx q[0],q[1];
-rz(2.4381902678580882) q[1];
-cx q[0],q[1];
-ry(pi/2) q[2];
-rx(pi) q[2];
-cx q[0],q[2];
-rz(2.4381902678580882) q[2];
-cx q[0],q[2];
-rx(7.582816012520822) q[2];
-ry(pi/2) q[3];
-rx(pi) q[3];
-cx q[0],q[3];
-rz(2.4381902678580882) q[3];
-cx q[0],q[3];
-cx q[1],q[3];
-rz(2.4381902678580882) q[3];
-cx q[1],q[3];
-ry(pi/2) q[4];
-rx(pi) q[4];
-cx q[1],q[4];
-rz(2.4381902678580882) q[4];
-cx q[1],q[4];
-cx q[3],q[4];
-rz(2.4381902678580882) q[4];
-cx q[3],q[4];
-ry(pi/2) q[5];
-rx(pi) q[5];
-cx q[1],q[5];
-rz(2.4381902678580882) q[5];
-cx q[1],q[5];
-cx q[3],q[5];
-rz(2.4381902678580882) q[5];
-cx q[3],q[5];
-ry(pi/2) q[6];
-rx(pi) q[6];
-cx q[4],q[6];
-rz(2.4381902678580882) q[6];
-cx q[4],q[6];
-cx q[5],q[6];
-rz(2.4381902678580882) q[6];
-cx q[5],q[6];
-ry(pi/2) q[7];
-rx(pi) q[7];
-cx q[3],q[7];
-rz(2.4381902678580882) q[7];
-cx q[3],q[7];
-cx q[4],q[7];
-rz(2.4381902678580882) q[7];
-cx q[4],q[7];
-ry(pi/2) q[8];
-rx(pi) q[8];
-cx q[3],q[8];
-rz(2.4381902678580882) q[8];
-cx q[3],q[8];
-cx q[5],q[8];
-rz(2.4381902678580882) q[8];
-cx q[5],q[8];
-rx(7.582816012520822) q[8];
-ry(pi/2) q[9];
-rx(pi) q[9];
-cx q[1],q[9];
-rz(2.4381902678580882) q[9];
-cx q[1],q[9];
-cx q[3],q[9];
-rz(2.4381902678580882) q[9];
-cx q[3],q[9];
-ry(pi/2) q[10];
-rx(pi) q[10];
-cx q[4],q[10];
-rz(2.4381902678580882) q[10];
-cx q[4],q[10];
-cx q[6],q[10];
-rz(2.4381902678580882) q[10];
-cx q[6],q[10];
-ry(pi/2) q[11];
-rx(pi) q[11];
-cx q[5],q[11];
-rz(2.4381902678580882) q[11];
-cx q[5],q[11];
-cx q[6],q[11];
-rz(2.4381902678580882) q[11];
-cx q[6],q[11];
-rx(7.582816012520822) q[11];
-ry(pi/2) q[12];
-rx(pi) q[12];
-cx q[3],q[12];
-rz(2.4381902678580882) q[12];
-cx q[3],q[12];
-cx q[5],q[12];
-rz(2.4381902678580882) q[12];
-cx q[5],q[12];
-ry(pi/2) q[13];
-rx(pi) q[13];
-cx q[4],q[13];
-rz(2.4381902678580882) q[13];
-cx q[4],q[13];
-cx q[5],q[13];
-rz(2.4381902678580882) q[13];
-cx q[5],q[13];
-ry(pi/2) q[14];
-rx(pi) q[14];
-cx q[3],q[14];
-rz(2.4381902678580882) q[14];
-cx q[3],q[14];
-cx q[4],q[14];
-rz(2.4381902678580882) q[14];
-cx q[4],q[14];
-rx(7.582816012520822) q[14];
-ry(pi/2) q[15];
-rx(pi) q[15];
-cx q[0],q[15];
-rz(2.4381902678580882) q[15];
-cx q[0],q[15];
-cx q[3],q[15];
-rz(2.4381902678580882) q[15];
-cx q[3],q[15];
-ry(pi/2) q[16];
-rx(pi) q[16];
-cx q[0],q[16];
-rz(2.4381902678580882) q[16];
-cx q[0],q[16];
-cx q[3],q[16];
-rz(2.4381902678580882) q[16];
-cx q[3],q[16];
-ry(pi/2) q[17];
-rx(pi) q[17];
-cx q[1],q[17];
-rz(2.4381902678580882) q[17];
-cx q[1],q[17];
-cx q[3],q[17];
-rz(2.4381902678580882) q[17];
-cx q[3],q[17];
-ry(pi/2) q[18];
-rx(pi) q[18];
-cx q[3],q[18];
-rz(2.4381902678580882) q[18];
-cx q[3],q[18];
-cx q[4],q[18];
-rz(2.4381902678580882) q[18];
-cx q[4],q[18];
-ry(pi/2) q[19];
-rx(pi) q[19];
-cx q[3],q[19];
-rz(2.4381902678580882) q[19];
-cx q[3],q[19];
-cx q[7],q[19];
-rz(2.4381902678580882) q[19];
-cx q[7],q[19];
-ry(pi/2) q[20];
-rx(pi) q[20];
-cx q[0],q[20];
-rz(2.4381902678580882) q[20];
-cx q[0],q[20];
-cx q[15],q[20];
-rz(2.4381902678580882) q[20];
-cx q[15],q[20];
-ry(pi/2) q[21];
-rx(pi) q[21];
-cx q[4],q[21];
-rz(2.4381902678580882) q[21];
-cx q[4],q[21];
-cx q[15],q[21];
-rz(2.4381902678580882) q[21];
-cx q[15],q[21];
-ry(pi/2) q[22];
-rx(pi) q[22];
-cx q[3],q[22];
-rz(2.4381902678580882) q[22];
-cx q[3],q[22];
-cx q[9],q[22];
-rz(2.4381902678580882) q[22];
-cx q[9],q[22];
-rx(7.582816012520822) q[22];
-ry(pi/2) q[23];
-rx(pi) q[23];
-cx q[3],q[23];
-rz(2.4381902678580882) q[23];
-cx q[3],q[23];
-cx q[17],q[23];
-rz(2.4381902678580882) q[23];
-cx q[17],q[23];
-ry(pi/2) q[24];
-rx(pi) q[24];
-cx q[3],q[24];
-rz(2.4381902678580882) q[24];
-cx q[3],q[24];
-cx q[5],q[24];
-rz(2.4381902678580882) q[24];
-cx q[5],q[24];
-ry(pi/2) q[25];
-rx(pi) q[25];
-cx q[3],q[25];
-rz(2.4381902678580882) q[25];
-cx q[3],q[25];
-cx q[12],q[25];
-rz(2.4381902678580882) q[25];
-cx q[12],q[25];
-rx(7.582816012520822) q[25];
-ry(pi/2) q[26];
-rx(pi) q[26];
-cx q[3],q[26];
-rz(2.4381902678580882) q[26];
-cx q[3],q[26];
-cx q[21],q[26];
-rz(2.4381902678580882) q[26];
-cx q[21],q[26];
-ry(pi/2) q[27];
-rx(pi) q[27];
-cx q[4],q[27];
-rz(2.4381902678580882) q[27];
-cx q[4],q[27];
-cx q[6],q[27];
-rz(2.4381902678580882) q[27];
-cx q[6],q[27];
-ry(pi/2) q[28];
-rx(pi) q[28];
-cx q[1],q[28];
-rz(2.4381902678580882) q[28];
-cx q[1],q[28];
-cx q[3],q[28];
-rz(2.4381902678580882) q[28];
-cx q[3],q[28];
-ry(pi/2) q[29];
-rx(pi) q[29];
-cx q[1],q[29];
-rz(2.4381902678580882) q[29];
-cx q[1],q[29];
-cx q[3],q[29];
-rz(2.4381902678580882) q[29];
-cx q[3],q[29];
-rx(7.582816012520822) q[29];
-ry(pi/2) q[30];
-rx(pi) q[30];
-cx q[3],q[30];
-rz(2.4381902678580882) q[30];
-cx q[3],q[30];
-cx q[18],q[30];
-rz(2.4381902678580882) q[30];
-cx q[18],q[30];
-rx(7.582816012520822) q[18];
-ry(pi/2) q[31];
-rx(pi) q[31];
-cx q[12],q[31];
-rz(2.4381902678580882) q[31];
-cx q[12],q[31];
-cx q[26],q[31];
-rz(2.4381902678580882) q[31];
-cx q[26],q[31];
-rx(7.582816012520822) q[26];
-rx(7.582816012520822) q[31];
-ry(pi/2) q[32];
-rx(pi) q[32];
-cx q[0],q[32];
-rz(2.4381902678580882) q[32];
-cx q[0],q[32];
-cx q[21],q[32];
-rz(2.4381902678580882) q[32];
-cx q[21],q[32];
-ry(pi/2) q[33];
-rx(pi) q[33];
-cx q[5],q[33];
-rz(2.4381902678580882) q[33];
-cx q[5],q[33];
-cx q[30],q[33];
-rz(2.4381902678580882) q[33];
-cx q[30],q[33];
-rx(7.582816012520822) q[33];
-ry(pi/2) q[34];
-rx(pi) q[34];
-cx q[3],q[34];
-rz(2.4381902678580882) q[34];
-cx q[3],q[34];
-cx q[12],q[34];
-rz(2.4381902678580882) q[34];
-cx q[12],q[34];
-ry(pi/2) q[35];
-rx(pi) q[35];
-cx q[3],q[35];
-rz(2.4381902678580882) q[35];
-cx q[3],q[35];
-cx q[32],q[35];
-rz(2.4381902678580882) q[35];
-cx q[32],q[35];
-rx(7.582816012520822) q[35];
-ry(pi/2) q[36];
-rx(pi) q[36];
-cx q[15],q[36];
-rz(2.4381902678580882) q[36];
-cx q[15],q[36];
-cx q[20],q[36];
-rz(2.4381902678580882) q[36];
-cx q[20],q[36];
-rx(7.582816012520822) q[36];
-ry(pi/2) q[37];
-rx(pi) q[37];
-cx q[10],q[37];
-rz(2.4381902678580882) q[37];
-cx q[10],q[37];
-cx q[34],q[37];
-rz(2.4381902678580882) q[37];
-cx q[34],q[37];
-rx(7.582816012520822) q[34];
-rx(7.582816012520822) q[37];
-ry(pi/2) q[38];
-rx(pi) q[38];
-cx q[19],q[38];
-rz(2.4381902678580882) q[38];
-cx q[19],q[38];
-rx(7.582816012520822) q[19];
-cx q[21],q[38];
-rz(2.4381902678580882) q[38];
-cx q[21],q[38];
-ry(pi/2) q[39];
-rx(pi) q[39];
-cx q[3],q[39];
-rz(2.4381902678580882) q[39];
-cx q[3],q[39];
-cx q[13],q[39];
-rz(2.4381902678580882) q[39];
-cx q[13],q[39];
-rx(7.582816012520822) q[39];
-ry(pi/2) q[40];
-rx(pi) q[40];
-cx q[3],q[40];
-rz(2.4381902678580882) q[40];
-cx q[3],q[40];
-cx q[23],q[40];
-rz(2.4381902678580882) q[40];
-cx q[23],q[40];
-rx(7.582816012520822) q[40];
-ry(pi/2) q[41];
-rx(pi) q[41];
-cx q[10],q[41];
-rz(2.4381902678580882) q[41];
-cx q[10],q[41];
-cx q[27],q[41];
-rz(2.4381902678580882) q[41];
-cx q[27],q[41];
-ry(pi/2) q[42];
-rx(pi) q[42];
-cx q[0],q[42];
-rz(2.4381902678580882) q[42];
-cx q[0],q[42];
-cx q[3],q[42];
-rz(2.4381902678580882) q[42];
-cx q[3],q[42];
-ry(pi/2) q[43];
-rx(pi) q[43];
-cx q[3],q[43];
-rz(2.4381902678580882) q[43];
-cx q[3],q[43];
-cx q[20],q[43];
-rz(2.4381902678580882) q[43];
-cx q[20],q[43];
-rx(7.582816012520822) q[20];
-rx(7.582816012520822) q[43];
-ry(pi/2) q[44];
-rx(pi) q[44];
-cx q[3],q[44];
-rz(2.4381902678580882) q[44];
-cx q[3],q[44];
-cx q[12],q[44];
-rz(2.4381902678580882) q[44];
-cx q[12],q[44];
-ry(pi/2) q[45];
-rx(pi) q[45];
-cx q[1],q[45];
-rz(2.4381902678580882) q[45];
-cx q[1],q[45];
-cx q[16],q[45];
-rz(2.4381902678580882) q[45];
-cx q[16],q[45];
-ry(pi/2) q[46];
-rx(pi) q[46];
-cx q[5],q[46];
-rz(2.4381902678580882) q[46];
-cx q[5],q[46];
-cx q[38],q[46];
-rz(2.4381902678580882) q[46];
-cx q[38],q[46];
-rx(7.582816012520822) q[38];
-rx(7.582816012520822) q[46];
-ry(pi/2) q[47];
-rx(pi) q[47];
-cx q[4],q[47];
-rz(2.4381902678580882) q[47];
-cx q[4],q[47];
-cx q[17],q[47];
-rz(2.4381902678580882) q[47];
-cx q[17],q[47];
-ry(pi/2) q[48];
-rx(pi) q[48];
-cx q[0],q[48];
-rz(2.4381902678580882) q[48];
-cx q[0],q[48];
-cx q[30],q[48];
-rz(2.4381902678580882) q[48];
-cx q[30],q[48];
-rx(7.582816012520822) q[48];
-ry(pi/2) q[49];
-rx(pi) q[49];
-cx q[3],q[49];
-rz(2.4381902678580882) q[49];
-cx q[3],q[49];
-cx q[4],q[49];
-rz(2.4381902678580882) q[49];
-cx q[4],q[49];
-rx(7.582816012520822) q[49];
-ry(pi/2) q[50];
-rx(pi) q[50];
-cx q[3],q[50];
-rz(2.4381902678580882) q[50];
-cx q[3],q[50];
-cx q[12],q[50];
-rz(2.4381902678580882) q[50];
-cx q[12],q[50];
-ry(pi/2) q[51];
-rx(pi) q[51];
-cx q[0],q[51];
-rz(2.4381902678580882) q[51];
-cx q[0],q[51];
-cx q[28],q[51];
-rz(2.4381902678580882) q[51];
-cx q[28],q[51];
-rx(7.582816012520822) q[51];
-ry(pi/2) q[52];
-rx(pi) q[52];
-cx q[3],q[52];
-rz(2.4381902678580882) q[52];
-cx q[3],q[52];
-cx q[10],q[52];
-rz(2.4381902678580882) q[52];
-cx q[10],q[52];
-rx(7.582816012520822) q[52];
-ry(pi/2) q[53];
-rx(pi) q[53];
-cx q[17],q[53];
-rz(2.4381902678580882) q[53];
-cx q[17],q[53];
-cx q[21],q[53];
-rz(2.4381902678580882) q[53];
-cx q[21],q[53];
-ry(pi/2) q[54];
-rx(pi) q[54];
-cx q[24],q[54];
-rz(2.4381902678580882) q[54];
-cx q[24],q[54];
-cx q[28],q[54];
-rz(2.4381902678580882) q[54];
-cx q[28],q[54];
-rx(7.582816012520822) q[54];
-ry(pi/2) q[55];
-rx(pi) q[55];
-cx q[9],q[55];
-rz(2.4381902678580882) q[55];
-cx q[9],q[55];
-cx q[15],q[55];
-rz(2.4381902678580882) q[55];
-cx q[15],q[55];
-rx(7.582816012520822) q[55];
-ry(pi/2) q[56];
-rx(pi) q[56];
-cx q[13],q[56];
-rz(2.4381902678580882) q[56];
-cx q[13],q[56];
-cx q[45],q[56];
-rz(2.4381902678580882) q[56];
-cx q[45],q[56];
-rx(7.582816012520822) q[45];
-ry(pi/2) q[57];
-rx(pi) q[57];
-cx q[1],q[57];
-rz(2.4381902678580882) q[57];
-cx q[1],q[57];
-cx q[3],q[57];
-rz(2.4381902678580882) q[57];
-cx q[3],q[57];
-rx(7.582816012520822) q[57];
-ry(pi/2) q[58];
-rx(pi) q[58];
-cx q[24],q[58];
-rz(2.4381902678580882) q[58];
-cx q[24],q[58];
-rx(7.582816012520822) q[24];
-cx q[28],q[58];
-rz(2.4381902678580882) q[58];
-cx q[28],q[58];
-rx(7.582816012520822) q[28];
-rx(7.582816012520822) q[58];
-ry(pi/2) q[59];
-rx(pi) q[59];
-cx q[16],q[59];
-rz(2.4381902678580882) q[59];
-cx q[16],q[59];
-cx q[32],q[59];
-rz(2.4381902678580882) q[59];
-cx q[32],q[59];
-ry(pi/2) q[60];
-rx(pi) q[60];
-cx q[1],q[60];
-rz(2.4381902678580882) q[60];
-cx q[1],q[60];
-rx(7.582816012520822) q[1];
-cx q[7],q[60];
-rz(2.4381902678580882) q[60];
-cx q[7],q[60];
-ry(pi/2) q[61];
-rx(pi) q[61];
-cx q[4],q[61];
-rz(2.4381902678580882) q[61];
-cx q[4],q[61];
-rx(7.582816012520822) q[4];
-cx q[7],q[61];
-rz(2.4381902678580882) q[61];
-cx q[7],q[61];
-rx(7.582816012520822) q[7];
-rx(7.582816012520822) q[61];
-ry(pi/2) q[62];
-rx(pi) q[62];
-cx q[0],q[62];
-rz(2.4381902678580882) q[62];
-cx q[0],q[62];
-cx q[17],q[62];
-rz(2.4381902678580882) q[62];
-cx q[17],q[62];
-rx(7.582816012520822) q[62];
-ry(pi/2) q[63];
-rx(pi) q[63];
-cx q[12],q[63];
-rz(2.4381902678580882) q[63];
-cx q[12],q[63];
-rx(7.582816012520822) q[12];
-cx q[17],q[63];
-rz(2.4381902678580882) q[63];
-cx q[17],q[63];
-ry(pi/2) q[64];
-rx(pi) q[64];
-cx q[0],q[64];
-rz(2.4381902678580882) q[64];
-cx q[0],q[64];
-cx q[10],q[64];
-rz(2.4381902678580882) q[64];
-cx q[10],q[64];
-rx(7.582816012520822) q[10];
-rx(7.582816012520822) q[64];
-ry(pi/2) q[65];
-rx(pi) q[65];
-cx q[5],q[65];
-rz(2.4381902678580882) q[65];
-cx q[5],q[65];
-cx q[23],q[65];
-rz(2.4381902678580882) q[65];
-cx q[23],q[65];
-rx(7.582816012520822) q[23];
-rx(7.582816012520822) q[65];
-ry(pi/2) q[66];
-rx(pi) q[66];
-cx q[17],q[66];
-rz(2.4381902678580882) q[66];
-cx q[17],q[66];
-rx(7.582816012520822) q[17];
-cx q[47],q[66];
-rz(2.4381902678580882) q[66];
-cx q[47],q[66];
-rx(7.582816012520822) q[47];
-rx(7.582816012520822) q[66];
-ry(pi/2) q[67];
-rx(pi) q[67];
-cx q[41],q[67];
-rz(2.4381902678580882) q[67];
-cx q[41],q[67];
-rx(7.582816012520822) q[41];
-cx q[56],q[67];
-rz(2.4381902678580882) q[67];
-cx q[56],q[67];
-rx(7.582816012520822) q[67];
-ry(pi/2) q[68];
-rx(pi) q[68];
-cx q[13],q[68];
-rz(2.4381902678580882) q[68];
-cx q[13],q[68];
-rx(7.582816012520822) q[13];
-cx q[32],q[68];
-rz(2.4381902678580882) q[68];
-cx q[32],q[68];
-rx(7.582816012520822) q[32];
-rx(7.582816012520822) q[68];
-ry(pi/2) q[69];
-rx(pi) q[69];
-cx q[6],q[69];
-rz(2.4381902678580882) q[69];
-cx q[6],q[69];
-cx q[59],q[69];
-rz(2.4381902678580882) q[69];
-cx q[59],q[69];
-rx(7.582816012520822) q[69];
-ry(pi/2) q[70];
-rx(pi) q[70];
-cx q[3],q[70];
-rz(2.4381902678580882) q[70];
-cx q[3],q[70];
-cx q[15],q[70];
-rz(2.4381902678580882) q[70];
-cx q[15],q[70];
-rx(7.582816012520822) q[70];
-ry(pi/2) q[71];
-rx(pi) q[71];
-cx q[3],q[71];
-rz(2.4381902678580882) q[71];
-cx q[3],q[71];
-cx q[53],q[71];
-rz(2.4381902678580882) q[71];
-cx q[53],q[71];
-rx(7.582816012520822) q[53];
-rx(7.582816012520822) q[71];
-ry(pi/2) q[72];
-rx(pi) q[72];
-cx q[27],q[72];
-rz(2.4381902678580882) q[72];
-cx q[27],q[72];
-rx(7.582816012520822) q[27];
-cx q[44],q[72];
-rz(2.4381902678580882) q[72];
-cx q[44],q[72];
-rx(7.582816012520822) q[44];
-rx(7.582816012520822) q[72];
-ry(pi/2) q[73];
-rx(pi) q[73];
-cx q[16],q[73];
-rz(2.4381902678580882) q[73];
-cx q[16],q[73];
-rx(7.582816012520822) q[16];
-cx q[59],q[73];
-rz(2.4381902678580882) q[73];
-cx q[59],q[73];
-rx(7.582816012520822) q[59];
-rx(7.582816012520822) q[73];
-ry(pi/2) q[74];
-rx(pi) q[74];
-cx q[56],q[74];
-rz(2.4381902678580882) q[74];
-cx q[56],q[74];
-rx(7.582816012520822) q[56];
-cx q[63],q[74];
-rz(2.4381902678580882) q[74];
-cx q[63],q[74];
-rx(7.582816012520822) q[63];
-rx(7.582816012520822) q[74];
-ry(pi/2) q[75];
-rx(pi) q[75];
-cx q[0],q[75];
-rz(2.4381902678580882) q[75];
-cx q[0],q[75];
-rx(7.582816012520822) q[0];
-cx q[0],q[1];
-rz(5.628864897685783) q[1];
-cx q[0],q[1];
-cx q[0],q[2];
-rz(5.628864897685783) q[2];
-cx q[0],q[2];
-rx(7.894773538386668) q[2];
-cx q[21],q[75];
-rz(2.4381902678580882) q[75];
-cx q[21],q[75];
-rx(7.582816012520822) q[75];
-ry(pi/2) q[76];
-rx(pi) q[76];
-cx q[5],q[76];
-rz(2.4381902678580882) q[76];
-cx q[5],q[76];
-rx(7.582816012520822) q[5];
-cx q[6],q[76];
-rz(2.4381902678580882) q[76];
-cx q[6],q[76];
-rx(7.582816012520822) q[76];
-ry(pi/2) q[77];
-rx(pi) q[77];
-cx q[3],q[77];
-rz(2.4381902678580882) q[77];
-cx q[3],q[77];
-rx(7.582816012520822) q[3];
-cx q[0],q[3];
-rz(5.628864897685783) q[3];
-cx q[0],q[3];
-cx q[1],q[3];
-rz(5.628864897685783) q[3];
-cx q[1],q[3];
-cx q[1],q[4];
-rz(5.628864897685783) q[4];
-cx q[1],q[4];
-cx q[1],q[5];
-cx q[3],q[4];
-rz(5.628864897685783) q[4];
-cx q[3],q[4];
-rz(5.628864897685783) q[5];
-cx q[1],q[5];
-cx q[3],q[5];
-rz(5.628864897685783) q[5];
-cx q[3],q[5];
-cx q[3],q[7];
-rz(5.628864897685783) q[7];
-cx q[3],q[7];
-cx q[3],q[8];
-rz(5.628864897685783) q[8];
-cx q[3],q[8];
-cx q[30],q[77];
-rz(2.4381902678580882) q[77];
-cx q[30],q[77];
-rx(7.582816012520822) q[30];
-ry(pi/2) q[78];
-rx(pi) q[78];
-cx q[42],q[78];
-rz(2.4381902678580882) q[78];
-cx q[42],q[78];
-rx(7.582816012520822) q[42];
-cx q[60],q[78];
-rz(2.4381902678580882) q[78];
-cx q[60],q[78];
-rx(7.582816012520822) q[60];
-rx(7.582816012520822) q[78];
-ry(pi/2) q[79];
-rx(pi) q[79];
-cx q[6],q[79];
-rz(2.4381902678580882) q[79];
-cx q[6],q[79];
-rx(7.582816012520822) q[6];
-cx q[4],q[6];
-rz(5.628864897685783) q[6];
-cx q[4],q[6];
-cx q[4],q[7];
-cx q[5],q[6];
-rz(5.628864897685783) q[6];
-cx q[5],q[6];
-cx q[5],q[8];
-rz(5.628864897685783) q[7];
-cx q[4],q[7];
-cx q[4],q[10];
-rz(5.628864897685783) q[8];
-cx q[5],q[8];
-cx q[5],q[11];
-rx(7.894773538386668) q[8];
-rz(5.628864897685783) q[10];
-cx q[4],q[10];
-cx q[4],q[13];
-cx q[6],q[10];
-rz(5.628864897685783) q[10];
-cx q[6],q[10];
-cx q[10],q[37];
-rz(5.628864897685783) q[11];
-cx q[5],q[11];
-cx q[6],q[11];
-rz(5.628864897685783) q[11];
-cx q[6],q[11];
-rx(7.894773538386668) q[11];
-rz(5.628864897685783) q[13];
-cx q[4],q[13];
-rz(5.628864897685783) q[37];
-cx q[10],q[37];
-cx q[10],q[41];
-rz(5.628864897685783) q[41];
-cx q[10],q[41];
-cx q[50],q[79];
-rz(2.4381902678580882) q[79];
-cx q[50],q[79];
-rx(7.582816012520822) q[50];
-rx(7.582816012520822) q[79];
-ry(pi/2) q[80];
-rx(pi) q[80];
-cx q[9],q[80];
-rz(2.4381902678580882) q[80];
-cx q[9],q[80];
-rx(7.582816012520822) q[9];
-cx q[1],q[9];
-rz(5.628864897685783) q[9];
-cx q[1],q[9];
-cx q[1],q[17];
-cx q[3],q[9];
-rz(5.628864897685783) q[9];
-cx q[3],q[9];
-cx q[3],q[12];
-rz(5.628864897685783) q[12];
-cx q[3],q[12];
-cx q[3],q[14];
-cx q[5],q[12];
-rz(5.628864897685783) q[12];
-cx q[5],q[12];
-cx q[5],q[13];
-rz(5.628864897685783) q[13];
-cx q[5],q[13];
-rz(5.628864897685783) q[14];
-cx q[3],q[14];
-cx q[4],q[14];
-rz(5.628864897685783) q[14];
-cx q[4],q[14];
-rx(7.894773538386668) q[14];
-cx q[15],q[80];
-rz(5.628864897685783) q[17];
-cx q[1],q[17];
-cx q[1],q[28];
-rz(5.628864897685783) q[28];
-cx q[1],q[28];
-cx q[1],q[29];
-rz(5.628864897685783) q[29];
-cx q[1],q[29];
-cx q[1],q[45];
-rz(5.628864897685783) q[45];
-cx q[1],q[45];
-cx q[1],q[57];
-rz(5.628864897685783) q[57];
-cx q[1],q[57];
-cx q[1],q[60];
-rz(5.628864897685783) q[60];
-cx q[1],q[60];
-rx(7.894773538386668) q[1];
-rz(2.4381902678580882) q[80];
-cx q[15],q[80];
-rx(7.582816012520822) q[15];
-cx q[0],q[15];
-rz(5.628864897685783) q[15];
-cx q[0],q[15];
-cx q[0],q[16];
-cx q[3],q[15];
-rz(5.628864897685783) q[15];
-cx q[3],q[15];
-rz(5.628864897685783) q[16];
-cx q[0],q[16];
-cx q[0],q[20];
-cx q[3],q[16];
-rz(5.628864897685783) q[16];
-cx q[3],q[16];
-cx q[3],q[17];
-cx q[16],q[45];
-rz(5.628864897685783) q[17];
-cx q[3],q[17];
-cx q[3],q[18];
-rz(5.628864897685783) q[18];
-cx q[3],q[18];
-cx q[3],q[19];
-cx q[4],q[18];
-rz(5.628864897685783) q[18];
-cx q[4],q[18];
-rz(5.628864897685783) q[19];
-cx q[3],q[19];
-cx q[3],q[22];
-cx q[7],q[19];
-rz(5.628864897685783) q[19];
-cx q[7],q[19];
-cx q[7],q[60];
-cx q[19],q[38];
-rz(5.628864897685783) q[20];
-cx q[0],q[20];
-cx q[0],q[32];
-cx q[15],q[20];
-rz(5.628864897685783) q[20];
-cx q[15],q[20];
-rz(5.628864897685783) q[22];
-cx q[3],q[22];
-cx q[3],q[23];
-cx q[9],q[22];
-rz(5.628864897685783) q[22];
-cx q[9],q[22];
-cx q[9],q[55];
-rx(7.894773538386668) q[22];
-rz(5.628864897685783) q[23];
-cx q[3],q[23];
-cx q[3],q[24];
-cx q[17],q[23];
-rz(5.628864897685783) q[23];
-cx q[17],q[23];
-rz(5.628864897685783) q[24];
-cx q[3],q[24];
-cx q[3],q[25];
-cx q[5],q[24];
-rz(5.628864897685783) q[24];
-cx q[5],q[24];
-cx q[5],q[33];
-cx q[24],q[54];
-rz(5.628864897685783) q[25];
-cx q[3],q[25];
-cx q[3],q[26];
-cx q[12],q[25];
-rz(5.628864897685783) q[25];
-cx q[12],q[25];
-cx q[12],q[31];
-rx(7.894773538386668) q[25];
-rz(5.628864897685783) q[26];
-cx q[3],q[26];
-cx q[3],q[28];
-rz(5.628864897685783) q[28];
-cx q[3],q[28];
-cx q[3],q[29];
-rz(5.628864897685783) q[29];
-cx q[3],q[29];
-cx q[3],q[30];
-rx(7.894773538386668) q[29];
-rz(5.628864897685783) q[30];
-cx q[3],q[30];
-cx q[3],q[34];
-cx q[18],q[30];
-rz(5.628864897685783) q[30];
-cx q[18],q[30];
-rx(7.894773538386668) q[18];
-rz(5.628864897685783) q[31];
-cx q[12],q[31];
-rz(5.628864897685783) q[32];
-cx q[0],q[32];
-cx q[0],q[42];
-rz(5.628864897685783) q[33];
-cx q[5],q[33];
-cx q[5],q[46];
-cx q[30],q[33];
-rz(5.628864897685783) q[33];
-cx q[30],q[33];
-rx(7.894773538386668) q[33];
-rz(5.628864897685783) q[34];
-cx q[3],q[34];
-cx q[3],q[35];
-cx q[12],q[34];
-rz(5.628864897685783) q[34];
-cx q[12],q[34];
-cx q[34],q[37];
-rz(5.628864897685783) q[35];
-cx q[3],q[35];
-cx q[3],q[39];
-rz(5.628864897685783) q[37];
-cx q[34],q[37];
-rx(7.894773538386668) q[34];
-rx(7.894773538386668) q[37];
-rz(5.628864897685783) q[38];
-cx q[19],q[38];
-rx(7.894773538386668) q[19];
-rz(5.628864897685783) q[39];
-cx q[3],q[39];
-cx q[3],q[40];
-cx q[13],q[39];
-rz(5.628864897685783) q[39];
-cx q[13],q[39];
-cx q[13],q[56];
-rx(7.894773538386668) q[39];
-rz(5.628864897685783) q[40];
-cx q[3],q[40];
-cx q[23],q[40];
-rz(5.628864897685783) q[40];
-cx q[23],q[40];
-rx(7.894773538386668) q[40];
-rz(5.628864897685783) q[42];
-cx q[0],q[42];
-cx q[0],q[48];
-cx q[3],q[42];
-rz(5.628864897685783) q[42];
-cx q[3],q[42];
-cx q[3],q[43];
-cx q[42],q[78];
-rz(5.628864897685783) q[43];
-cx q[3],q[43];
-cx q[3],q[44];
-rz(5.628864897685783) q[44];
-cx q[3],q[44];
-cx q[3],q[49];
-cx q[12],q[44];
-rz(5.628864897685783) q[44];
-cx q[12],q[44];
-rz(5.628864897685783) q[45];
-cx q[16],q[45];
-cx q[16],q[59];
-rz(5.628864897685783) q[46];
-cx q[5],q[46];
-cx q[5],q[65];
-rz(5.628864897685783) q[48];
-cx q[0],q[48];
-cx q[0],q[51];
-cx q[30],q[48];
-rz(5.628864897685783) q[48];
-cx q[30],q[48];
-rx(7.894773538386668) q[48];
-rz(5.628864897685783) q[49];
-cx q[3],q[49];
-cx q[3],q[50];
-rz(5.628864897685783) q[50];
-cx q[3],q[50];
-cx q[3],q[52];
-cx q[12],q[50];
-rz(5.628864897685783) q[50];
-cx q[12],q[50];
-cx q[12],q[63];
-rz(5.628864897685783) q[51];
-cx q[0],q[51];
-cx q[0],q[62];
-cx q[28],q[51];
-rz(5.628864897685783) q[51];
-cx q[28],q[51];
-rx(7.894773538386668) q[51];
-rz(5.628864897685783) q[52];
-cx q[3],q[52];
-cx q[3],q[57];
-cx q[10],q[52];
-rz(5.628864897685783) q[52];
-cx q[10],q[52];
-rx(7.894773538386668) q[52];
-rz(5.628864897685783) q[54];
-cx q[24],q[54];
-cx q[24],q[58];
-cx q[28],q[54];
-rz(5.628864897685783) q[54];
-cx q[28],q[54];
-rx(7.894773538386668) q[54];
-rz(5.628864897685783) q[55];
-cx q[9],q[55];
-rz(5.628864897685783) q[56];
-cx q[13],q[56];
-cx q[13],q[68];
-cx q[45],q[56];
-rz(5.628864897685783) q[56];
-cx q[45],q[56];
-rx(7.894773538386668) q[45];
-rz(5.628864897685783) q[57];
-cx q[3],q[57];
-cx q[3],q[70];
-rx(7.894773538386668) q[57];
-rz(5.628864897685783) q[58];
-cx q[24],q[58];
-rx(7.894773538386668) q[24];
-cx q[28],q[58];
-rz(5.628864897685783) q[58];
-cx q[28],q[58];
-rx(7.894773538386668) q[28];
-rx(7.894773538386668) q[58];
-rz(5.628864897685783) q[59];
-cx q[16],q[59];
-cx q[16],q[73];
-rz(5.628864897685783) q[60];
-cx q[7],q[60];
-rz(5.628864897685783) q[62];
-cx q[0],q[62];
-cx q[0],q[64];
-rz(5.628864897685783) q[63];
-cx q[12],q[63];
-rx(7.894773538386668) q[12];
-rz(5.628864897685783) q[64];
-cx q[0],q[64];
-cx q[0],q[75];
-cx q[10],q[64];
-rz(5.628864897685783) q[64];
-cx q[10],q[64];
-rx(7.894773538386668) q[10];
-rx(7.894773538386668) q[64];
-rz(5.628864897685783) q[65];
-cx q[5],q[65];
-cx q[5],q[76];
-cx q[23],q[65];
-rz(5.628864897685783) q[65];
-cx q[23],q[65];
-rx(7.894773538386668) q[23];
-rx(7.894773538386668) q[65];
-rz(5.628864897685783) q[68];
-cx q[13],q[68];
-rx(7.894773538386668) q[13];
-rz(5.628864897685783) q[70];
-cx q[3],q[70];
-cx q[3],q[71];
-rz(5.628864897685783) q[71];
-cx q[3],q[71];
-rz(5.628864897685783) q[73];
-cx q[16],q[73];
-rx(7.894773538386668) q[16];
-rz(5.628864897685783) q[75];
-cx q[0],q[75];
-rx(7.894773538386668) q[0];
-cx q[0],q[1];
-rz(5.153843626926094) q[1];
-cx q[0],q[1];
-cx q[0],q[2];
-rz(5.153843626926094) q[2];
-cx q[0],q[2];
-rx(11.457351246255614) q[2];
-rz(5.628864897685783) q[76];
-cx q[5],q[76];
-rx(7.894773538386668) q[5];
-rz(5.628864897685783) q[78];
-cx q[42],q[78];
-rx(7.894773538386668) q[42];
-cx q[60],q[78];
-rz(5.628864897685783) q[78];
-cx q[60],q[78];
-rx(7.894773538386668) q[60];
-rx(7.894773538386668) q[78];
-rx(7.582816012520822) q[80];
-cx q[9],q[80];
-rz(5.628864897685783) q[80];
-cx q[9],q[80];
-rx(7.894773538386668) q[9];
-ry(pi/2) q[81];
-rx(pi) q[81];
-cx q[21],q[81];
-rz(2.4381902678580882) q[81];
-cx q[21],q[81];
-rx(7.582816012520822) q[21];
-cx q[4],q[21];
-rz(5.628864897685783) q[21];
-cx q[4],q[21];
-cx q[4],q[27];
-cx q[15],q[21];
-rz(5.628864897685783) q[21];
-cx q[15],q[21];
-cx q[15],q[36];
-cx q[21],q[26];
-rz(5.628864897685783) q[26];
-cx q[21],q[26];
-cx q[21],q[32];
-cx q[26],q[31];
-rz(5.628864897685783) q[27];
-cx q[4],q[27];
-cx q[4],q[47];
-cx q[6],q[27];
-rz(5.628864897685783) q[27];
-cx q[6],q[27];
-cx q[6],q[69];
-cx q[27],q[41];
-rz(5.628864897685783) q[31];
-cx q[26],q[31];
-rx(7.894773538386668) q[26];
-rx(7.894773538386668) q[31];
-rz(5.628864897685783) q[32];
-cx q[21],q[32];
-cx q[21],q[38];
-cx q[32],q[35];
-rz(5.628864897685783) q[35];
-cx q[32],q[35];
-cx q[32],q[59];
-rx(7.894773538386668) q[35];
-rz(5.628864897685783) q[36];
-cx q[15],q[36];
-cx q[15],q[55];
-cx q[20],q[36];
-rz(5.628864897685783) q[36];
-cx q[20],q[36];
-cx q[20],q[43];
-rx(7.894773538386668) q[36];
-rz(5.628864897685783) q[38];
-cx q[21],q[38];
-cx q[38],q[46];
-rz(5.628864897685783) q[41];
-cx q[27],q[41];
-cx q[27],q[72];
-cx q[41],q[67];
-rz(5.628864897685783) q[43];
-cx q[20],q[43];
-rx(7.894773538386668) q[20];
-rx(7.894773538386668) q[43];
-rz(5.628864897685783) q[46];
-cx q[38],q[46];
-rx(7.894773538386668) q[38];
-rx(7.894773538386668) q[46];
-rz(5.628864897685783) q[47];
-cx q[4],q[47];
-cx q[4],q[49];
-cx q[17],q[47];
-rz(5.628864897685783) q[47];
-cx q[17],q[47];
-cx q[17],q[53];
-rz(5.628864897685783) q[49];
-cx q[4],q[49];
-cx q[4],q[61];
-rx(7.894773538386668) q[49];
-rz(5.628864897685783) q[53];
-cx q[17],q[53];
-cx q[17],q[62];
-cx q[21],q[53];
-rz(5.628864897685783) q[53];
-cx q[21],q[53];
-cx q[21],q[75];
-cx q[53],q[71];
-rz(5.628864897685783) q[55];
-cx q[15],q[55];
-cx q[15],q[70];
-rx(7.894773538386668) q[55];
-rz(5.628864897685783) q[59];
-cx q[32],q[59];
-cx q[32],q[68];
-rz(5.628864897685783) q[61];
-cx q[4],q[61];
-rx(7.894773538386668) q[4];
-cx q[7],q[61];
-rz(5.628864897685783) q[61];
-cx q[7],q[61];
-rx(7.894773538386668) q[7];
-rx(7.894773538386668) q[61];
-rz(5.628864897685783) q[62];
-cx q[17],q[62];
-cx q[17],q[63];
-rx(7.894773538386668) q[62];
-rz(5.628864897685783) q[63];
-cx q[17],q[63];
-cx q[17],q[66];
-rz(5.628864897685783) q[66];
-cx q[17],q[66];
-rx(7.894773538386668) q[17];
-cx q[47],q[66];
-rz(5.628864897685783) q[66];
-cx q[47],q[66];
-rx(7.894773538386668) q[47];
-rx(7.894773538386668) q[66];
-rz(5.628864897685783) q[67];
-cx q[41],q[67];
-rx(7.894773538386668) q[41];
-cx q[56],q[67];
-rz(5.628864897685783) q[67];
-cx q[56],q[67];
-cx q[56],q[74];
-rx(7.894773538386668) q[67];
-rz(5.628864897685783) q[68];
-cx q[32],q[68];
-rx(7.894773538386668) q[32];
-rx(7.894773538386668) q[68];
-rz(5.628864897685783) q[69];
-cx q[6],q[69];
-cx q[6],q[76];
-cx q[59],q[69];
-rz(5.628864897685783) q[69];
-cx q[59],q[69];
-cx q[59],q[73];
-rx(7.894773538386668) q[69];
-rz(5.628864897685783) q[70];
-cx q[15],q[70];
-cx q[15],q[80];
-rx(7.894773538386668) q[70];
-rz(5.628864897685783) q[71];
-cx q[53],q[71];
-rx(7.894773538386668) q[53];
-rx(7.894773538386668) q[71];
-rz(5.628864897685783) q[72];
-cx q[27],q[72];
-rx(7.894773538386668) q[27];
-cx q[44],q[72];
-rz(5.628864897685783) q[72];
-cx q[44],q[72];
-rx(7.894773538386668) q[44];
-rx(7.894773538386668) q[72];
-rz(5.628864897685783) q[73];
-cx q[59],q[73];
-rx(7.894773538386668) q[59];
-rx(7.894773538386668) q[73];
-rz(5.628864897685783) q[74];
-cx q[56],q[74];
-rx(7.894773538386668) q[56];
-cx q[63],q[74];
-rz(5.628864897685783) q[74];
-cx q[63],q[74];
-rx(7.894773538386668) q[63];
-rx(7.894773538386668) q[74];
-rz(5.628864897685783) q[75];
-cx q[21],q[75];
-rx(7.894773538386668) q[75];
-rz(5.628864897685783) q[76];
-cx q[6],q[76];
-cx q[6],q[79];
-rx(7.894773538386668) q[76];
-cx q[77],q[81];
-rz(5.628864897685783) q[79];
-cx q[6],q[79];
-rx(7.894773538386668) q[6];
-cx q[50],q[79];
-rz(5.628864897685783) q[79];
-cx q[50],q[79];
-rx(7.894773538386668) q[50];
-rx(7.894773538386668) q[79];
-rz(5.628864897685783) q[80];
-cx q[15],q[80];
-rx(7.894773538386668) q[15];
-rx(7.894773538386668) q[80];
-rz(2.4381902678580882) q[81];
-cx q[77],q[81];
-rx(7.582816012520822) q[77];
-cx q[3],q[77];
-rz(5.628864897685783) q[77];
-cx q[3],q[77];
-rx(7.894773538386668) q[3];
-cx q[0],q[3];
-rz(5.153843626926094) q[3];
-cx q[0],q[3];
-cx q[0],q[15];
-cx q[1],q[3];
-rz(5.153843626926094) q[3];
-cx q[1],q[3];
-cx q[1],q[4];
-rz(5.153843626926094) q[4];
-cx q[1],q[4];
-cx q[1],q[5];
-cx q[3],q[4];
-rz(5.153843626926094) q[4];
-cx q[3],q[4];
-cx q[4],q[6];
-rz(5.153843626926094) q[5];
-cx q[1],q[5];
-cx q[1],q[9];
-cx q[3],q[5];
-rz(5.153843626926094) q[5];
-cx q[3],q[5];
-cx q[3],q[7];
-rz(5.153843626926094) q[6];
-cx q[4],q[6];
-cx q[5],q[6];
-rz(5.153843626926094) q[6];
-cx q[5],q[6];
-rz(5.153843626926094) q[7];
-cx q[3],q[7];
-cx q[3],q[8];
-cx q[4],q[7];
-rz(5.153843626926094) q[7];
-cx q[4],q[7];
-cx q[4],q[10];
-rz(5.153843626926094) q[8];
-cx q[3],q[8];
-cx q[5],q[8];
-rz(5.153843626926094) q[8];
-cx q[5],q[8];
-cx q[5],q[11];
-rx(11.457351246255614) q[8];
-rz(5.153843626926094) q[9];
-cx q[1],q[9];
-cx q[1],q[17];
-cx q[3],q[9];
-rz(5.153843626926094) q[9];
-cx q[3],q[9];
-cx q[3],q[12];
-rz(5.153843626926094) q[10];
-cx q[4],q[10];
-cx q[4],q[13];
-cx q[6],q[10];
-rz(5.153843626926094) q[10];
-cx q[6],q[10];
-cx q[10],q[37];
-rz(5.153843626926094) q[11];
-cx q[5],q[11];
-cx q[6],q[11];
-rz(5.153843626926094) q[11];
-cx q[6],q[11];
-rx(11.457351246255614) q[11];
-rz(5.153843626926094) q[12];
-cx q[3],q[12];
-cx q[3],q[14];
-cx q[5],q[12];
-rz(5.153843626926094) q[12];
-cx q[5],q[12];
-rz(5.153843626926094) q[13];
-cx q[4],q[13];
-cx q[5],q[13];
-rz(5.153843626926094) q[13];
-cx q[5],q[13];
-rz(5.153843626926094) q[14];
-cx q[3],q[14];
-cx q[4],q[14];
-rz(5.153843626926094) q[14];
-cx q[4],q[14];
-rx(11.457351246255614) q[14];
-rz(5.153843626926094) q[15];
-cx q[0],q[15];
-cx q[0],q[16];
-cx q[3],q[15];
-rz(5.153843626926094) q[15];
-cx q[3],q[15];
-rz(5.153843626926094) q[16];
-cx q[0],q[16];
-cx q[0],q[20];
-cx q[3],q[16];
-rz(5.153843626926094) q[16];
-cx q[3],q[16];
-rz(5.153843626926094) q[17];
-cx q[1],q[17];
-cx q[1],q[28];
-cx q[3],q[17];
-rz(5.153843626926094) q[17];
-cx q[3],q[17];
-cx q[3],q[18];
-rz(5.153843626926094) q[18];
-cx q[3],q[18];
-cx q[3],q[19];
-cx q[4],q[18];
-rz(5.153843626926094) q[18];
-cx q[4],q[18];
-rz(5.153843626926094) q[19];
-cx q[3],q[19];
-cx q[3],q[22];
-cx q[7],q[19];
-rz(5.153843626926094) q[19];
-cx q[7],q[19];
-cx q[19],q[38];
-rz(5.153843626926094) q[20];
-cx q[0],q[20];
-cx q[0],q[32];
-cx q[15],q[20];
-rz(5.153843626926094) q[20];
-cx q[15],q[20];
-rz(5.153843626926094) q[22];
-cx q[3],q[22];
-cx q[3],q[23];
-cx q[9],q[22];
-rz(5.153843626926094) q[22];
-cx q[9],q[22];
-cx q[9],q[55];
-rx(11.457351246255614) q[22];
-rz(5.153843626926094) q[23];
-cx q[3],q[23];
-cx q[3],q[24];
-cx q[17],q[23];
-rz(5.153843626926094) q[23];
-cx q[17],q[23];
-rz(5.153843626926094) q[24];
-cx q[3],q[24];
-cx q[3],q[25];
-cx q[5],q[24];
-rz(5.153843626926094) q[24];
-cx q[5],q[24];
-cx q[5],q[33];
-cx q[24],q[54];
-rz(5.153843626926094) q[25];
-cx q[3],q[25];
-cx q[3],q[26];
-cx q[12],q[25];
-rz(5.153843626926094) q[25];
-cx q[12],q[25];
-cx q[12],q[31];
-rx(11.457351246255614) q[25];
-rz(5.153843626926094) q[26];
-cx q[3],q[26];
-rz(5.153843626926094) q[28];
-cx q[1],q[28];
-cx q[1],q[29];
-cx q[3],q[28];
-rz(5.153843626926094) q[28];
-cx q[3],q[28];
-rz(5.153843626926094) q[29];
-cx q[1],q[29];
-cx q[1],q[45];
-cx q[3],q[29];
-rz(5.153843626926094) q[29];
-cx q[3],q[29];
-rx(11.457351246255614) q[29];
-cx q[30],q[77];
-rz(5.153843626926094) q[31];
-cx q[12],q[31];
-rz(5.153843626926094) q[32];
-cx q[0],q[32];
-cx q[0],q[42];
-rz(5.153843626926094) q[33];
-cx q[5],q[33];
-cx q[5],q[46];
-rz(5.153843626926094) q[37];
-cx q[10],q[37];
-cx q[10],q[41];
-rz(5.153843626926094) q[38];
-cx q[19],q[38];
-rx(11.457351246255614) q[19];
-rz(5.153843626926094) q[41];
-cx q[10],q[41];
-rz(5.153843626926094) q[42];
-cx q[0],q[42];
-cx q[0],q[48];
-rz(5.153843626926094) q[45];
-cx q[1],q[45];
-cx q[1],q[57];
-cx q[16],q[45];
-rz(5.153843626926094) q[45];
-cx q[16],q[45];
-cx q[16],q[59];
-rz(5.153843626926094) q[46];
-cx q[5],q[46];
-cx q[5],q[65];
-rz(5.153843626926094) q[48];
-cx q[0],q[48];
-cx q[0],q[51];
-rz(5.153843626926094) q[51];
-cx q[0],q[51];
-cx q[0],q[62];
-cx q[28],q[51];
-rz(5.153843626926094) q[51];
-cx q[28],q[51];
-rx(11.457351246255614) q[51];
-rz(5.153843626926094) q[54];
-cx q[24],q[54];
-cx q[24],q[58];
-cx q[28],q[54];
-rz(5.153843626926094) q[54];
-cx q[28],q[54];
-rx(11.457351246255614) q[54];
-rz(5.153843626926094) q[55];
-cx q[9],q[55];
-cx q[9],q[80];
-rz(5.153843626926094) q[57];
-cx q[1],q[57];
-cx q[1],q[60];
-rz(5.153843626926094) q[58];
-cx q[24],q[58];
-rx(11.457351246255614) q[24];
-cx q[28],q[58];
-rz(5.153843626926094) q[58];
-cx q[28],q[58];
-rx(11.457351246255614) q[28];
-rx(11.457351246255614) q[58];
-rz(5.153843626926094) q[59];
-cx q[16],q[59];
-cx q[16],q[73];
-rz(5.153843626926094) q[60];
-cx q[1],q[60];
-rx(11.457351246255614) q[1];
-cx q[7],q[60];
-rz(5.153843626926094) q[60];
-cx q[7],q[60];
-rz(5.153843626926094) q[62];
-cx q[0],q[62];
-cx q[0],q[64];
-rz(5.153843626926094) q[64];
-cx q[0],q[64];
-cx q[0],q[75];
-rz(5.153843626926094) q[65];
-cx q[5],q[65];
-cx q[5],q[76];
-rz(5.153843626926094) q[73];
-cx q[16],q[73];
-rx(11.457351246255614) q[16];
-rz(5.153843626926094) q[75];
-cx q[0],q[75];
-rx(11.457351246255614) q[0];
-rz(5.153843626926094) q[76];
-cx q[5],q[76];
-rx(11.457351246255614) q[5];
-rz(5.628864897685783) q[77];
-cx q[30],q[77];
-rx(7.894773538386668) q[30];
-cx q[3],q[30];
-rz(5.153843626926094) q[30];
-cx q[3],q[30];
-cx q[3],q[34];
-cx q[18],q[30];
-rz(5.153843626926094) q[30];
-cx q[18],q[30];
-rx(11.457351246255614) q[18];
-cx q[30],q[33];
-rz(5.153843626926094) q[33];
-cx q[30],q[33];
-cx q[30],q[48];
-rx(11.457351246255614) q[33];
-rz(5.153843626926094) q[34];
-cx q[3],q[34];
-cx q[3],q[35];
-cx q[12],q[34];
-rz(5.153843626926094) q[34];
-cx q[12],q[34];
-cx q[34],q[37];
-rz(5.153843626926094) q[35];
-cx q[3],q[35];
-cx q[3],q[39];
-rz(5.153843626926094) q[37];
-cx q[34],q[37];
-rx(11.457351246255614) q[34];
-rx(11.457351246255614) q[37];
-rz(5.153843626926094) q[39];
-cx q[3],q[39];
-cx q[3],q[40];
-cx q[13],q[39];
-rz(5.153843626926094) q[39];
-cx q[13],q[39];
-cx q[13],q[56];
-rx(11.457351246255614) q[39];
-rz(5.153843626926094) q[40];
-cx q[3],q[40];
-cx q[3],q[42];
-cx q[23],q[40];
-rz(5.153843626926094) q[40];
-cx q[23],q[40];
-cx q[23],q[65];
-rx(11.457351246255614) q[40];
-rz(5.153843626926094) q[42];
-cx q[3],q[42];
-cx q[3],q[43];
-cx q[42],q[78];
-rz(5.153843626926094) q[43];
-cx q[3],q[43];
-cx q[3],q[44];
-rz(5.153843626926094) q[44];
-cx q[3],q[44];
-cx q[3],q[49];
-cx q[12],q[44];
-rz(5.153843626926094) q[44];
-cx q[12],q[44];
-rz(5.153843626926094) q[48];
-cx q[30],q[48];
-rx(11.457351246255614) q[48];
-rz(5.153843626926094) q[49];
-cx q[3],q[49];
-cx q[3],q[50];
-rz(5.153843626926094) q[50];
-cx q[3],q[50];
-cx q[3],q[52];
-cx q[12],q[50];
-rz(5.153843626926094) q[50];
-cx q[12],q[50];
-cx q[12],q[63];
-rz(5.153843626926094) q[52];
-cx q[3],q[52];
-cx q[3],q[57];
-cx q[10],q[52];
-rz(5.153843626926094) q[52];
-cx q[10],q[52];
-cx q[10],q[64];
-rx(11.457351246255614) q[52];
-rz(5.153843626926094) q[56];
-cx q[13],q[56];
-cx q[13],q[68];
-cx q[45],q[56];
-rz(5.153843626926094) q[56];
-cx q[45],q[56];
-rx(11.457351246255614) q[45];
-rz(5.153843626926094) q[57];
-cx q[3],q[57];
-cx q[3],q[70];
-rx(11.457351246255614) q[57];
-rz(5.153843626926094) q[63];
-cx q[12],q[63];
-rx(11.457351246255614) q[12];
-rz(5.153843626926094) q[64];
-cx q[10],q[64];
-rx(11.457351246255614) q[10];
-rx(11.457351246255614) q[64];
-rz(5.153843626926094) q[65];
-cx q[23],q[65];
-rx(11.457351246255614) q[23];
-rx(11.457351246255614) q[65];
-rz(5.153843626926094) q[68];
-cx q[13],q[68];
-rx(11.457351246255614) q[13];
-rz(5.153843626926094) q[70];
-cx q[3],q[70];
-cx q[3],q[71];
-rz(5.153843626926094) q[71];
-cx q[3],q[71];
-rz(5.153843626926094) q[78];
-cx q[42],q[78];
-rx(11.457351246255614) q[42];
-cx q[60],q[78];
-rz(5.153843626926094) q[78];
-cx q[60],q[78];
-rx(11.457351246255614) q[60];
-rx(11.457351246255614) q[78];
-rz(5.153843626926094) q[80];
-cx q[9],q[80];
-rx(11.457351246255614) q[9];
-rx(7.582816012520822) q[81];
-cx q[21],q[81];
-rz(5.628864897685783) q[81];
-cx q[21],q[81];
-rx(7.894773538386668) q[21];
-cx q[4],q[21];
-rz(5.153843626926094) q[21];
-cx q[4],q[21];
-cx q[4],q[27];
-cx q[15],q[21];
-rz(5.153843626926094) q[21];
-cx q[15],q[21];
-cx q[15],q[36];
-cx q[21],q[26];
-rz(5.153843626926094) q[26];
-cx q[21],q[26];
-cx q[21],q[32];
-cx q[26],q[31];
-rz(5.153843626926094) q[27];
-cx q[4],q[27];
-cx q[4],q[47];
-cx q[6],q[27];
-rz(5.153843626926094) q[27];
-cx q[6],q[27];
-cx q[6],q[69];
-cx q[27],q[41];
-rz(5.153843626926094) q[31];
-cx q[26],q[31];
-rx(11.457351246255614) q[26];
-rx(11.457351246255614) q[31];
-rz(5.153843626926094) q[32];
-cx q[21],q[32];
-cx q[21],q[38];
-cx q[32],q[35];
-rz(5.153843626926094) q[35];
-cx q[32],q[35];
-cx q[32],q[59];
-rx(11.457351246255614) q[35];
-rz(5.153843626926094) q[36];
-cx q[15],q[36];
-cx q[15],q[55];
-cx q[20],q[36];
-rz(5.153843626926094) q[36];
-cx q[20],q[36];
-cx q[20],q[43];
-rx(11.457351246255614) q[36];
-rz(5.153843626926094) q[38];
-cx q[21],q[38];
-cx q[38],q[46];
-rz(5.153843626926094) q[41];
-cx q[27],q[41];
-cx q[27],q[72];
-cx q[41],q[67];
-rz(5.153843626926094) q[43];
-cx q[20],q[43];
-rx(11.457351246255614) q[20];
-rx(11.457351246255614) q[43];
-rz(5.153843626926094) q[46];
-cx q[38],q[46];
-rx(11.457351246255614) q[38];
-rx(11.457351246255614) q[46];
-rz(5.153843626926094) q[47];
-cx q[4],q[47];
-cx q[4],q[49];
-cx q[17],q[47];
-rz(5.153843626926094) q[47];
-cx q[17],q[47];
-cx q[17],q[53];
-rz(5.153843626926094) q[49];
-cx q[4],q[49];
-cx q[4],q[61];
-rx(11.457351246255614) q[49];
-rz(5.153843626926094) q[53];
-cx q[17],q[53];
-cx q[17],q[62];
-cx q[21],q[53];
-rz(5.153843626926094) q[53];
-cx q[21],q[53];
-cx q[21],q[75];
-cx q[53],q[71];
-rz(5.153843626926094) q[55];
-cx q[15],q[55];
-cx q[15],q[70];
-rx(11.457351246255614) q[55];
-rz(5.153843626926094) q[59];
-cx q[32],q[59];
-cx q[32],q[68];
-rz(5.153843626926094) q[61];
-cx q[4],q[61];
-rx(11.457351246255614) q[4];
-cx q[7],q[61];
-rz(5.153843626926094) q[61];
-cx q[7],q[61];
-rx(11.457351246255614) q[7];
-rx(11.457351246255614) q[61];
-rz(5.153843626926094) q[62];
-cx q[17],q[62];
-cx q[17],q[63];
-rx(11.457351246255614) q[62];
-rz(5.153843626926094) q[63];
-cx q[17],q[63];
-cx q[17],q[66];
-rz(5.153843626926094) q[66];
-cx q[17],q[66];
-rx(11.457351246255614) q[17];
-cx q[47],q[66];
-rz(5.153843626926094) q[66];
-cx q[47],q[66];
-rx(11.457351246255614) q[47];
-rx(11.457351246255614) q[66];
-rz(5.153843626926094) q[67];
-cx q[41],q[67];
-rx(11.457351246255614) q[41];
-cx q[56],q[67];
-rz(5.153843626926094) q[67];
-cx q[56],q[67];
-cx q[56],q[74];
-rx(11.457351246255614) q[67];
-rz(5.153843626926094) q[68];
-cx q[32],q[68];
-rx(11.457351246255614) q[32];
-rx(11.457351246255614) q[68];
-rz(5.153843626926094) q[69];
-cx q[6],q[69];
-cx q[6],q[76];
-cx q[59],q[69];
-rz(5.153843626926094) q[69];
-cx q[59],q[69];
-cx q[59],q[73];
-rx(11.457351246255614) q[69];
-rz(5.153843626926094) q[70];
-cx q[15],q[70];
-cx q[15],q[80];
-rx(11.457351246255614) q[70];
-rz(5.153843626926094) q[71];
-cx q[53],q[71];
-rx(11.457351246255614) q[53];
-rx(11.457351246255614) q[71];
-rz(5.153843626926094) q[72];
-cx q[27],q[72];
-rx(11.457351246255614) q[27];
-cx q[44],q[72];
-rz(5.153843626926094) q[72];
-cx q[44],q[72];
-rx(11.457351246255614) q[44];
-rx(11.457351246255614) q[72];
-rz(5.153843626926094) q[73];
-cx q[59],q[73];
-rx(11.457351246255614) q[59];
-rx(11.457351246255614) q[73];
-rz(5.153843626926094) q[74];
-cx q[56],q[74];
-rx(11.457351246255614) q[56];
-cx q[63],q[74];
-rz(5.153843626926094) q[74];
-cx q[63],q[74];
-rx(11.457351246255614) q[63];
-rx(11.457351246255614) q[74];
-rz(5.153843626926094) q[75];
-cx q[21],q[75];
-rx(11.457351246255614) q[75];
-rz(5.153843626926094) q[76];
-cx q[6],q[76];
-cx q[6],q[79];
-rx(11.457351246255614) q[76];
-cx q[77],q[81];
-rz(5.153843626926094) q[79];
-cx q[6],q[79];
-rx(11.457351246255614) q[6];
-cx q[50],q[79];
-rz(5.153843626926094) q[79];
-cx q[50],q[79];
-rx(11.457351246255614) q[50];
-rx(11.457351246255614) q[79];
-rz(5.153843626926094) q[80];
-cx q[15],q[80];
-rx(11.457351246255614) q[15];
-rx(11.457351246255614) q[80];
-rz(5.628864897685783) q[81];
-cx q[77],q[81];
-rx(7.894773538386668) q[77];
-cx q[3],q[77];
-rz(5.153843626926094) q[77];
-cx q[3],q[77];
-rx(11.457351246255614) q[3];
-cx q[30],q[77];
-rz(5.153843626926094) q[77];
-cx q[30],q[77];
-rx(11.457351246255614) q[30];
-rx(7.894773538386668) q[81];
-cx q[21],q[81];
-rz(5.153843626926094) q[81];
-cx q[21],q[81];
-rx(11.457351246255614) q[21];
-cx q[77],q[81];
-rz(5.153843626926094) q[81];
-cx q[77],q[81];
-rx(11.457351246255614) q[77];
-rx(11.457351246255614) q[81];
\ No newline at end of file
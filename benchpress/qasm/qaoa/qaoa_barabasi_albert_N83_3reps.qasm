@@ -1,1876 +0,0 @@
-OPENQASM 2.0;
-include "qelib1.inc";
-qreg q[83];
-ry(pi/2) q[0];
-rx(pi) q[0];
-ry(pi/2) q[1];
-rx(pi) q[1];
-cx q[0],q[1];
-rz(0.10948349984471521) q[1];
-cx q[0],q[1];
-ry(pi/2) q[2];
-rx(pi) q[2];
-cx q[0],q[2];
-rz(0.10948349984471521) q[2];
-cx q[0],q[2];
-rx(8.511632543491016) q[2];
-ry(pi/2) q[3];
-rx(pi) q[3];
-cx q[0],q[3];
-rz(0.10948349984471521) q[3];
-cx q[0],q[3];
-cx q[1],q[3];
-rz(0.10948349984471521) q[3];
-cx q[1],q[3];
-ry(pi/2) q[4];
-rx(pi) q[4];
-cx q[1],q[4];
-rz(0.10948349984471521) q[4];
-cx q[1],q[4];
-cx q[3],q[4];
-rz(0.10948349984471521) q[4];
-cx q[3],q[4];
-ry(pi/2) q[5];
-rx(pi) q[5];
-cx q[1],q[5];
-rz(0.10948349984471521) q[5];
-cx q[1],q[5];
-cx q[3],q[5];
-rz(0.10948349984471521) q[5];
-cx q[3],q[5];
-ry(pi/2) q[6];
-rx(pi) q[6];
-cx q[4],q[6];
-rz(0.10948349984471521) q[6];
-cx q[4],q[6];
-cx q[5],q[6];
-rz(0.10948349984471521) q[6];
-cx q[5],q[6];
-ry(pi/2) q[7];
-rx(pi) q[7];
-cx q[3],q[7];
-rz(0.10948349984471521) q[7];
-cx q[3],q[7];
-cx q[4],q[7];
-rz(0.10948349984471521) q[7];
-cx q[4],q[7];
-ry(pi/2) q[8];
-rx(pi) q[8];
-cx q[3],q[8];
-rz(0.10948349984471521) q[8];
-cx q[3],q[8];
-cx q[5],q[8];
-rz(0.10948349984471521) q[8];
-cx q[5],q[8];
-rx(8.511632543491016) q[8];
-ry(pi/2) q[9];
-rx(pi) q[9];
-cx q[1],q[9];
-rz(0.10948349984471521) q[9];
-cx q[1],q[9];
-cx q[3],q[9];
-rz(0.10948349984471521) q[9];
-cx q[3],q[9];
-ry(pi/2) q[10];
-rx(pi) q[10];
-cx q[4],q[10];
-rz(0.10948349984471521) q[10];
-cx q[4],q[10];
-cx q[6],q[10];
-rz(0.10948349984471521) q[10];
-cx q[6],q[10];
-ry(pi/2) q[11];
-rx(pi) q[11];
-cx q[5],q[11];
-rz(0.10948349984471521) q[11];
-cx q[5],q[11];
-cx q[6],q[11];
-rz(0.10948349984471521) q[11];
-cx q[6],q[11];
-rx(8.511632543491016) q[11];
-ry(pi/2) q[12];
-rx(pi) q[12];
-cx q[3],q[12];
-rz(0.10948349984471521) q[12];
-cx q[3],q[12];
-cx q[5],q[12];
-rz(0.10948349984471521) q[12];
-cx q[5],q[12];
-ry(pi/2) q[13];
-rx(pi) q[13];
-cx q[4],q[13];
-rz(0.10948349984471521) q[13];
-cx q[4],q[13];
-cx q[5],q[13];
-rz(0.10948349984471521) q[13];
-cx q[5],q[13];
-ry(pi/2) q[14];
-rx(pi) q[14];
-cx q[3],q[14];
-rz(0.10948349984471521) q[14];
-cx q[3],q[14];
-cx q[4],q[14];
-rz(0.10948349984471521) q[14];
-cx q[4],q[14];
-rx(8.511632543491016) q[14];
-ry(pi/2) q[15];
-rx(pi) q[15];
-cx q[0],q[15];
-rz(0.10948349984471521) q[15];
-cx q[0],q[15];
-cx q[3],q[15];
-rz(0.10948349984471521) q[15];
-cx q[3],q[15];
-ry(pi/2) q[16];
-rx(pi) q[16];
-cx q[0],q[16];
-rz(0.10948349984471521) q[16];
-cx q[0],q[16];
-cx q[3],q[16];
-rz(0.10948349984471521) q[16];
-cx q[3],q[16];
-ry(pi/2) q[17];
-rx(pi) q[17];
-cx q[1],q[17];
-rz(0.10948349984471521) q[17];
-cx q[1],q[17];
-cx q[3],q[17];
-rz(0.10948349984471521) q[17];
-cx q[3],q[17];
-ry(pi/2) q[18];
-rx(pi) q[18];
-cx q[3],q[18];
-rz(0.10948349984471521) q[18];
-cx q[3],q[18];
-cx q[4],q[18];
-rz(0.10948349984471521) q[18];
-cx q[4],q[18];
-ry(pi/2) q[19];
-rx(pi) q[19];
-cx q[3],q[19];
-rz(0.10948349984471521) q[19];
-cx q[3],q[19];
-cx q[7],q[19];
-rz(0.10948349984471521) q[19];
-cx q[7],q[19];
-ry(pi/2) q[20];
-rx(pi) q[20];
-cx q[0],q[20];
-rz(0.10948349984471521) q[20];
-cx q[0],q[20];
-cx q[15],q[20];
-rz(0.10948349984471521) q[20];
-cx q[15],q[20];
-ry(pi/2) q[21];
-rx(pi) q[21];
-cx q[4],q[21];
-rz(0.10948349984471521) q[21];
-cx q[4],q[21];
-cx q[15],q[21];
-rz(0.10948349984471521) q[21];
-cx q[15],q[21];
-ry(pi/2) q[22];
-rx(pi) q[22];
-cx q[3],q[22];
-rz(0.10948349984471521) q[22];
-cx q[3],q[22];
-cx q[9],q[22];
-rz(0.10948349984471521) q[22];
-cx q[9],q[22];
-rx(8.511632543491016) q[22];
-ry(pi/2) q[23];
-rx(pi) q[23];
-cx q[3],q[23];
-rz(0.10948349984471521) q[23];
-cx q[3],q[23];
-cx q[17],q[23];
-rz(0.10948349984471521) q[23];
-cx q[17],q[23];
-ry(pi/2) q[24];
-rx(pi) q[24];
-cx q[3],q[24];
-rz(0.10948349984471521) q[24];
-cx q[3],q[24];
-cx q[5],q[24];
-rz(0.10948349984471521) q[24];
-cx q[5],q[24];
-ry(pi/2) q[25];
-rx(pi) q[25];
-cx q[3],q[25];
-rz(0.10948349984471521) q[25];
-cx q[3],q[25];
-cx q[12],q[25];
-rz(0.10948349984471521) q[25];
-cx q[12],q[25];
-rx(8.511632543491016) q[25];
-ry(pi/2) q[26];
-rx(pi) q[26];
-cx q[3],q[26];
-rz(0.10948349984471521) q[26];
-cx q[3],q[26];
-cx q[21],q[26];
-rz(0.10948349984471521) q[26];
-cx q[21],q[26];
-ry(pi/2) q[27];
-rx(pi) q[27];
-cx q[4],q[27];
-rz(0.10948349984471521) q[27];
-cx q[4],q[27];
-cx q[6],q[27];
-rz(0.10948349984471521) q[27];
-cx q[6],q[27];
-ry(pi/2) q[28];
-rx(pi) q[28];
-cx q[1],q[28];
-rz(0.10948349984471521) q[28];
-cx q[1],q[28];
-cx q[3],q[28];
-rz(0.10948349984471521) q[28];
-cx q[3],q[28];
-ry(pi/2) q[29];
-rx(pi) q[29];
-cx q[1],q[29];
-rz(0.10948349984471521) q[29];
-cx q[1],q[29];
-cx q[3],q[29];
-rz(0.10948349984471521) q[29];
-cx q[3],q[29];
-rx(8.511632543491016) q[29];
-ry(pi/2) q[30];
-rx(pi) q[30];
-cx q[3],q[30];
-rz(0.10948349984471521) q[30];
-cx q[3],q[30];
-cx q[18],q[30];
-rz(0.10948349984471521) q[30];
-cx q[18],q[30];
-rx(8.511632543491016) q[18];
-ry(pi/2) q[31];
-rx(pi) q[31];
-cx q[12],q[31];
-rz(0.10948349984471521) q[31];
-cx q[12],q[31];
-cx q[26],q[31];
-rz(0.10948349984471521) q[31];
-cx q[26],q[31];
-rx(8.511632543491016) q[26];
-rx(8.511632543491016) q[31];
-ry(pi/2) q[32];
-rx(pi) q[32];
-cx q[0],q[32];
-rz(0.10948349984471521) q[32];
-cx q[0],q[32];
-cx q[21],q[32];
-rz(0.10948349984471521) q[32];
-cx q[21],q[32];
-ry(pi/2) q[33];
-rx(pi) q[33];
-cx q[5],q[33];
-rz(0.10948349984471521) q[33];
-cx q[5],q[33];
-cx q[30],q[33];
-rz(0.10948349984471521) q[33];
-cx q[30],q[33];
-rx(8.511632543491016) q[33];
-ry(pi/2) q[34];
-rx(pi) q[34];
-cx q[3],q[34];
-rz(0.10948349984471521) q[34];
-cx q[3],q[34];
-cx q[12],q[34];
-rz(0.10948349984471521) q[34];
-cx q[12],q[34];
-ry(pi/2) q[35];
-rx(pi) q[35];
-cx q[3],q[35];
-rz(0.10948349984471521) q[35];
-cx q[3],q[35];
-cx q[32],q[35];
-rz(0.10948349984471521) q[35];
-cx q[32],q[35];
-rx(8.511632543491016) q[35];
-ry(pi/2) q[36];
-rx(pi) q[36];
-cx q[15],q[36];
-rz(0.10948349984471521) q[36];
-cx q[15],q[36];
-cx q[20],q[36];
-rz(0.10948349984471521) q[36];
-cx q[20],q[36];
-rx(8.511632543491016) q[36];
-ry(pi/2) q[37];
-rx(pi) q[37];
-cx q[10],q[37];
-rz(0.10948349984471521) q[37];
-cx q[10],q[37];
-cx q[34],q[37];
-rz(0.10948349984471521) q[37];
-cx q[34],q[37];
-rx(8.511632543491016) q[34];
-rx(8.511632543491016) q[37];
-ry(pi/2) q[38];
-rx(pi) q[38];
-cx q[19],q[38];
-rz(0.10948349984471521) q[38];
-cx q[19],q[38];
-rx(8.511632543491016) q[19];
-cx q[21],q[38];
-rz(0.10948349984471521) q[38];
-cx q[21],q[38];
-ry(pi/2) q[39];
-rx(pi) q[39];
-cx q[3],q[39];
-rz(0.10948349984471521) q[39];
-cx q[3],q[39];
-cx q[13],q[39];
-rz(0.10948349984471521) q[39];
-cx q[13],q[39];
-rx(8.511632543491016) q[39];
-ry(pi/2) q[40];
-rx(pi) q[40];
-cx q[3],q[40];
-rz(0.10948349984471521) q[40];
-cx q[3],q[40];
-cx q[23],q[40];
-rz(0.10948349984471521) q[40];
-cx q[23],q[40];
-rx(8.511632543491016) q[40];
-ry(pi/2) q[41];
-rx(pi) q[41];
-cx q[10],q[41];
-rz(0.10948349984471521) q[41];
-cx q[10],q[41];
-cx q[27],q[41];
-rz(0.10948349984471521) q[41];
-cx q[27],q[41];
-ry(pi/2) q[42];
-rx(pi) q[42];
-cx q[0],q[42];
-rz(0.10948349984471521) q[42];
-cx q[0],q[42];
-cx q[3],q[42];
-rz(0.10948349984471521) q[42];
-cx q[3],q[42];
-ry(pi/2) q[43];
-rx(pi) q[43];
-cx q[3],q[43];
-rz(0.10948349984471521) q[43];
-cx q[3],q[43];
-cx q[20],q[43];
-rz(0.10948349984471521) q[43];
-cx q[20],q[43];
-rx(8.511632543491016) q[20];
-rx(8.511632543491016) q[43];
-ry(pi/2) q[44];
-rx(pi) q[44];
-cx q[3],q[44];
-rz(0.10948349984471521) q[44];
-cx q[3],q[44];
-cx q[12],q[44];
-rz(0.10948349984471521) q[44];
-cx q[12],q[44];
-ry(pi/2) q[45];
-rx(pi) q[45];
-cx q[1],q[45];
-rz(0.10948349984471521) q[45];
-cx q[1],q[45];
-cx q[16],q[45];
-rz(0.10948349984471521) q[45];
-cx q[16],q[45];
-ry(pi/2) q[46];
-rx(pi) q[46];
-cx q[5],q[46];
-rz(0.10948349984471521) q[46];
-cx q[5],q[46];
-cx q[38],q[46];
-rz(0.10948349984471521) q[46];
-cx q[38],q[46];
-rx(8.511632543491016) q[38];
-rx(8.511632543491016) q[46];
-ry(pi/2) q[47];
-rx(pi) q[47];
-cx q[4],q[47];
-rz(0.10948349984471521) q[47];
-cx q[4],q[47];
-cx q[17],q[47];
-rz(0.10948349984471521) q[47];
-cx q[17],q[47];
-ry(pi/2) q[48];
-rx(pi) q[48];
-cx q[0],q[48];
-rz(0.10948349984471521) q[48];
-cx q[0],q[48];
-cx q[30],q[48];
-rz(0.10948349984471521) q[48];
-cx q[30],q[48];
-rx(8.511632543491016) q[48];
-ry(pi/2) q[49];
-rx(pi) q[49];
-cx q[3],q[49];
-rz(0.10948349984471521) q[49];
-cx q[3],q[49];
-cx q[4],q[49];
-rz(0.10948349984471521) q[49];
-cx q[4],q[49];
-rx(8.511632543491016) q[49];
-ry(pi/2) q[50];
-rx(pi) q[50];
-cx q[3],q[50];
-rz(0.10948349984471521) q[50];
-cx q[3],q[50];
-cx q[12],q[50];
-rz(0.10948349984471521) q[50];
-cx q[12],q[50];
-ry(pi/2) q[51];
-rx(pi) q[51];
-cx q[0],q[51];
-rz(0.10948349984471521) q[51];
-cx q[0],q[51];
-cx q[28],q[51];
-rz(0.10948349984471521) q[51];
-cx q[28],q[51];
-rx(8.511632543491016) q[51];
-ry(pi/2) q[52];
-rx(pi) q[52];
-cx q[3],q[52];
-rz(0.10948349984471521) q[52];
-cx q[3],q[52];
-cx q[10],q[52];
-rz(0.10948349984471521) q[52];
-cx q[10],q[52];
-rx(8.511632543491016) q[52];
-ry(pi/2) q[53];
-rx(pi) q[53];
-cx q[17],q[53];
-rz(0.10948349984471521) q[53];
-cx q[17],q[53];
-cx q[21],q[53];
-rz(0.10948349984471521) q[53];
-cx q[21],q[53];
-ry(pi/2) q[54];
-rx(pi) q[54];
-cx q[24],q[54];
-rz(0.10948349984471521) q[54];
-cx q[24],q[54];
-cx q[28],q[54];
-rz(0.10948349984471521) q[54];
-cx q[28],q[54];
-rx(8.511632543491016) q[54];
-ry(pi/2) q[55];
-rx(pi) q[55];
-cx q[9],q[55];
-rz(0.10948349984471521) q[55];
-cx q[9],q[55];
-cx q[15],q[55];
-rz(0.10948349984471521) q[55];
-cx q[15],q[55];
-rx(8.511632543491016) q[55];
-ry(pi/2) q[56];
-rx(pi) q[56];
-cx q[13],q[56];
-rz(0.10948349984471521) q[56];
-cx q[13],q[56];
-cx q[45],q[56];
-rz(0.10948349984471521) q[56];
-cx q[45],q[56];
-rx(8.511632543491016) q[45];
-ry(pi/2) q[57];
-rx(pi) q[57];
-cx q[1],q[57];
-rz(0.10948349984471521) q[57];
-cx q[1],q[57];
-cx q[3],q[57];
-rz(0.10948349984471521) q[57];
-cx q[3],q[57];
-rx(8.511632543491016) q[57];
-ry(pi/2) q[58];
-rx(pi) q[58];
-cx q[24],q[58];
-rz(0.10948349984471521) q[58];
-cx q[24],q[58];
-rx(8.511632543491016) q[24];
-cx q[28],q[58];
-rz(0.10948349984471521) q[58];
-cx q[28],q[58];
-rx(8.511632543491016) q[28];
-rx(8.511632543491016) q[58];
-ry(pi/2) q[59];
-rx(pi) q[59];
-cx q[16],q[59];
-rz(0.10948349984471521) q[59];
-cx q[16],q[59];
-cx q[32],q[59];
-rz(0.10948349984471521) q[59];
-cx q[32],q[59];
-ry(pi/2) q[60];
-rx(pi) q[60];
-cx q[1],q[60];
-rz(0.10948349984471521) q[60];
-cx q[1],q[60];
-rx(8.511632543491016) q[1];
-cx q[7],q[60];
-rz(0.10948349984471521) q[60];
-cx q[7],q[60];
-ry(pi/2) q[61];
-rx(pi) q[61];
-cx q[4],q[61];
-rz(0.10948349984471521) q[61];
-cx q[4],q[61];
-rx(8.511632543491016) q[4];
-cx q[7],q[61];
-rz(0.10948349984471521) q[61];
-cx q[7],q[61];
-rx(8.511632543491016) q[7];
-rx(8.511632543491016) q[61];
-ry(pi/2) q[62];
-rx(pi) q[62];
-cx q[0],q[62];
-rz(0.10948349984471521) q[62];
-cx q[0],q[62];
-cx q[17],q[62];
-rz(0.10948349984471521) q[62];
-cx q[17],q[62];
-rx(8.511632543491016) q[62];
-ry(pi/2) q[63];
-rx(pi) q[63];
-cx q[12],q[63];
-rz(0.10948349984471521) q[63];
-cx q[12],q[63];
-rx(8.511632543491016) q[12];
-cx q[17],q[63];
-rz(0.10948349984471521) q[63];
-cx q[17],q[63];
-ry(pi/2) q[64];
-rx(pi) q[64];
-cx q[0],q[64];
-rz(0.10948349984471521) q[64];
-cx q[0],q[64];
-cx q[10],q[64];
-rz(0.10948349984471521) q[64];
-cx q[10],q[64];
-rx(8.511632543491016) q[10];
-rx(8.511632543491016) q[64];
-ry(pi/2) q[65];
-rx(pi) q[65];
-cx q[5],q[65];
-rz(0.10948349984471521) q[65];
-cx q[5],q[65];
-cx q[23],q[65];
-rz(0.10948349984471521) q[65];
-cx q[23],q[65];
-rx(8.511632543491016) q[23];
-rx(8.511632543491016) q[65];
-ry(pi/2) q[66];
-rx(pi) q[66];
-cx q[17],q[66];
-rz(0.10948349984471521) q[66];
-cx q[17],q[66];
-rx(8.511632543491016) q[17];
-cx q[47],q[66];
-rz(0.10948349984471521) q[66];
-cx q[47],q[66];
-rx(8.511632543491016) q[47];
-rx(8.511632543491016) q[66];
-ry(pi/2) q[67];
-rx(pi) q[67];
-cx q[41],q[67];
-rz(0.10948349984471521) q[67];
-cx q[41],q[67];
-rx(8.511632543491016) q[41];
-cx q[56],q[67];
-rz(0.10948349984471521) q[67];
-cx q[56],q[67];
-rx(8.511632543491016) q[67];
-ry(pi/2) q[68];
-rx(pi) q[68];
-cx q[13],q[68];
-rz(0.10948349984471521) q[68];
-cx q[13],q[68];
-rx(8.511632543491016) q[13];
-cx q[32],q[68];
-rz(0.10948349984471521) q[68];
-cx q[32],q[68];
-rx(8.511632543491016) q[32];
-rx(8.511632543491016) q[68];
-ry(pi/2) q[69];
-rx(pi) q[69];
-cx q[6],q[69];
-rz(0.10948349984471521) q[69];
-cx q[6],q[69];
-cx q[59],q[69];
-rz(0.10948349984471521) q[69];
-cx q[59],q[69];
-rx(8.511632543491016) q[69];
-ry(pi/2) q[70];
-rx(pi) q[70];
-cx q[3],q[70];
-rz(0.10948349984471521) q[70];
-cx q[3],q[70];
-cx q[15],q[70];
-rz(0.10948349984471521) q[70];
-cx q[15],q[70];
-rx(8.511632543491016) q[70];
-ry(pi/2) q[71];
-rx(pi) q[71];
-cx q[3],q[71];
-rz(0.10948349984471521) q[71];
-cx q[3],q[71];
-cx q[53],q[71];
-rz(0.10948349984471521) q[71];
-cx q[53],q[71];
-rx(8.511632543491016) q[53];
-rx(8.511632543491016) q[71];
-ry(pi/2) q[72];
-rx(pi) q[72];
-cx q[27],q[72];
-rz(0.10948349984471521) q[72];
-cx q[27],q[72];
-rx(8.511632543491016) q[27];
-cx q[44],q[72];
-rz(0.10948349984471521) q[72];
-cx q[44],q[72];
-rx(8.511632543491016) q[44];
-rx(8.511632543491016) q[72];
-ry(pi/2) q[73];
-rx(pi) q[73];
-cx q[16],q[73];
-rz(0.10948349984471521) q[73];
-cx q[16],q[73];
-rx(8.511632543491016) q[16];
-cx q[59],q[73];
-rz(0.10948349984471521) q[73];
-cx q[59],q[73];
-rx(8.511632543491016) q[59];
-rx(8.511632543491016) q[73];
-ry(pi/2) q[74];
-rx(pi) q[74];
-cx q[56],q[74];
-rz(0.10948349984471521) q[74];
-cx q[56],q[74];
-cx q[63],q[74];
-rz(0.10948349984471521) q[74];
-cx q[63],q[74];
-rx(8.511632543491016) q[63];
-rx(8.511632543491016) q[74];
-ry(pi/2) q[75];
-rx(pi) q[75];
-cx q[0],q[75];
-rz(0.10948349984471521) q[75];
-cx q[0],q[75];
-cx q[21],q[75];
-rz(0.10948349984471521) q[75];
-cx q[21],q[75];
-rx(8.511632543491016) q[75];
-ry(pi/2) q[76];
-rx(pi) q[76];
-cx q[5],q[76];
-rz(0.10948349984471521) q[76];
-cx q[5],q[76];
-rx(8.511632543491016) q[5];
-cx q[6],q[76];
-rz(0.10948349984471521) q[76];
-cx q[6],q[76];
-rx(8.511632543491016) q[76];
-ry(pi/2) q[77];
-rx(pi) q[77];
-cx q[3],q[77];
-rz(0.10948349984471521) q[77];
-cx q[3],q[77];
-rx(8.511632543491016) q[3];
-cx q[30],q[77];
-rz(0.10948349984471521) q[77];
-cx q[30],q[77];
-rx(8.511632543491016) q[30];
-ry(pi/2) q[78];
-rx(pi) q[78];
-cx q[42],q[78];
-rz(0.10948349984471521) q[78];
-cx q[42],q[78];
-rx(8.511632543491016) q[42];
-cx q[60],q[78];
-rz(0.10948349984471521) q[78];
-cx q[60],q[78];
-rx(8.511632543491016) q[60];
-rx(8.511632543491016) q[78];
-ry(pi/2) q[79];
-rx(pi) q[79];
-cx q[6],q[79];
-rz(0.10948349984471521) q[79];
-cx q[6],q[79];
-rx(8.511632543491016) q[6];
-cx q[50],q[79];
-rz(0.10948349984471521) q[79];
-cx q[50],q[79];
-rx(8.511632543491016) q[50];
-rx(8.511632543491016) q[79];
-ry(pi/2) q[80];
-rx(pi) q[80];
-cx q[9],q[80];
-rz(0.10948349984471521) q[80];
-cx q[9],q[80];
-rx(8.511632543491016) q[9];
-cx q[15],q[80];
-rz(0.10948349984471521) q[80];
-cx q[15],q[80];
-rx(8.511632543491016) q[15];
-rx(8.511632543491016) q[80];
-ry(pi/2) q[81];
-rx(pi) q[81];
-cx q[21],q[81];
-rz(0.10948349984471521) q[81];
-cx q[21],q[81];
-rx(8.511632543491016) q[21];
-cx q[77],q[81];
-rz(0.10948349984471521) q[81];
-cx q[77],q[81];
-rx(8.511632543491016) q[77];
-rx(8.511632543491016) q[81];
-ry(pi/2) q[82];
-rx(pi) q[82];
-cx q[0],q[82];
-rz(0.10948349984471521) q[82];
-cx q[0],q[82];
-rx(8.511632543491016) q[0];
-cx q[0],q[1];
-rz(1.7636572217451076) q[1];
-cx q[0],q[1];
-cx q[0],q[2];
-rz(1.7636572217451076) q[2];
-cx q[0],q[2];
-cx q[0],q[3];
-rx(5.1045304176783395) q[2];
-rz(1.7636572217451076) q[3];
-cx q[0],q[3];
-cx q[0],q[15];
-cx q[1],q[3];
-rz(1.7636572217451076) q[3];
-cx q[1],q[3];
-cx q[1],q[4];
-rz(1.7636572217451076) q[4];
-cx q[1],q[4];
-cx q[1],q[5];
-cx q[3],q[4];
-rz(1.7636572217451076) q[4];
-cx q[3],q[4];
-cx q[4],q[6];
-rz(1.7636572217451076) q[5];
-cx q[1],q[5];
-cx q[1],q[9];
-cx q[3],q[5];
-rz(1.7636572217451076) q[5];
-cx q[3],q[5];
-cx q[3],q[7];
-rz(1.7636572217451076) q[6];
-cx q[4],q[6];
-cx q[5],q[6];
-rz(1.7636572217451076) q[6];
-cx q[5],q[6];
-rz(1.7636572217451076) q[7];
-cx q[3],q[7];
-cx q[3],q[8];
-cx q[4],q[7];
-rz(1.7636572217451076) q[7];
-cx q[4],q[7];
-cx q[4],q[10];
-rz(1.7636572217451076) q[8];
-cx q[3],q[8];
-cx q[5],q[8];
-rz(1.7636572217451076) q[8];
-cx q[5],q[8];
-cx q[5],q[11];
-rx(5.1045304176783395) q[8];
-rz(1.7636572217451076) q[9];
-cx q[1],q[9];
-cx q[1],q[17];
-cx q[3],q[9];
-rz(1.7636572217451076) q[9];
-cx q[3],q[9];
-cx q[3],q[12];
-rz(1.7636572217451076) q[10];
-cx q[4],q[10];
-cx q[4],q[13];
-cx q[6],q[10];
-rz(1.7636572217451076) q[10];
-cx q[6],q[10];
-cx q[10],q[37];
-rz(1.7636572217451076) q[11];
-cx q[5],q[11];
-cx q[6],q[11];
-rz(1.7636572217451076) q[11];
-cx q[6],q[11];
-rx(5.1045304176783395) q[11];
-rz(1.7636572217451076) q[12];
-cx q[3],q[12];
-cx q[3],q[14];
-cx q[5],q[12];
-rz(1.7636572217451076) q[12];
-cx q[5],q[12];
-rz(1.7636572217451076) q[13];
-cx q[4],q[13];
-cx q[5],q[13];
-rz(1.7636572217451076) q[13];
-cx q[5],q[13];
-rz(1.7636572217451076) q[14];
-cx q[3],q[14];
-cx q[4],q[14];
-rz(1.7636572217451076) q[14];
-cx q[4],q[14];
-rx(5.1045304176783395) q[14];
-rz(1.7636572217451076) q[15];
-cx q[0],q[15];
-cx q[0],q[16];
-cx q[3],q[15];
-rz(1.7636572217451076) q[15];
-cx q[3],q[15];
-rz(1.7636572217451076) q[16];
-cx q[0],q[16];
-cx q[0],q[20];
-cx q[3],q[16];
-rz(1.7636572217451076) q[16];
-cx q[3],q[16];
-rz(1.7636572217451076) q[17];
-cx q[1],q[17];
-cx q[1],q[28];
-cx q[3],q[17];
-rz(1.7636572217451076) q[17];
-cx q[3],q[17];
-cx q[3],q[18];
-rz(1.7636572217451076) q[18];
-cx q[3],q[18];
-cx q[3],q[19];
-cx q[4],q[18];
-rz(1.7636572217451076) q[18];
-cx q[4],q[18];
-cx q[4],q[21];
-rz(1.7636572217451076) q[19];
-cx q[3],q[19];
-cx q[3],q[22];
-cx q[7],q[19];
-rz(1.7636572217451076) q[19];
-cx q[7],q[19];
-cx q[19],q[38];
-rz(1.7636572217451076) q[20];
-cx q[0],q[20];
-cx q[0],q[32];
-cx q[15],q[20];
-rz(1.7636572217451076) q[20];
-cx q[15],q[20];
-rz(1.7636572217451076) q[21];
-cx q[4],q[21];
-cx q[4],q[27];
-cx q[15],q[21];
-rz(1.7636572217451076) q[21];
-cx q[15],q[21];
-cx q[15],q[36];
-rz(1.7636572217451076) q[22];
-cx q[3],q[22];
-cx q[3],q[23];
-cx q[9],q[22];
-rz(1.7636572217451076) q[22];
-cx q[9],q[22];
-cx q[9],q[55];
-rx(5.1045304176783395) q[22];
-rz(1.7636572217451076) q[23];
-cx q[3],q[23];
-cx q[3],q[24];
-cx q[17],q[23];
-rz(1.7636572217451076) q[23];
-cx q[17],q[23];
-rz(1.7636572217451076) q[24];
-cx q[3],q[24];
-cx q[3],q[25];
-cx q[5],q[24];
-rz(1.7636572217451076) q[24];
-cx q[5],q[24];
-cx q[5],q[33];
-cx q[24],q[54];
-rz(1.7636572217451076) q[25];
-cx q[3],q[25];
-cx q[3],q[26];
-cx q[12],q[25];
-rz(1.7636572217451076) q[25];
-cx q[12],q[25];
-cx q[12],q[31];
-rx(5.1045304176783395) q[25];
-rz(1.7636572217451076) q[26];
-cx q[3],q[26];
-cx q[21],q[26];
-rz(1.7636572217451076) q[26];
-cx q[21],q[26];
-rz(1.7636572217451076) q[27];
-cx q[4],q[27];
-cx q[4],q[47];
-cx q[6],q[27];
-rz(1.7636572217451076) q[27];
-cx q[6],q[27];
-cx q[6],q[69];
-rz(1.7636572217451076) q[28];
-cx q[1],q[28];
-cx q[1],q[29];
-cx q[3],q[28];
-rz(1.7636572217451076) q[28];
-cx q[3],q[28];
-rz(1.7636572217451076) q[29];
-cx q[1],q[29];
-cx q[1],q[45];
-cx q[3],q[29];
-rz(1.7636572217451076) q[29];
-cx q[3],q[29];
-cx q[3],q[30];
-rx(5.1045304176783395) q[29];
-rz(1.7636572217451076) q[30];
-cx q[3],q[30];
-cx q[3],q[34];
-cx q[18],q[30];
-rz(1.7636572217451076) q[30];
-cx q[18],q[30];
-rx(5.1045304176783395) q[18];
-rz(1.7636572217451076) q[31];
-cx q[12],q[31];
-cx q[26],q[31];
-rz(1.7636572217451076) q[31];
-cx q[26],q[31];
-rx(5.1045304176783395) q[26];
-rx(5.1045304176783395) q[31];
-rz(1.7636572217451076) q[32];
-cx q[0],q[32];
-cx q[0],q[42];
-cx q[21],q[32];
-rz(1.7636572217451076) q[32];
-cx q[21],q[32];
-rz(1.7636572217451076) q[33];
-cx q[5],q[33];
-cx q[5],q[46];
-cx q[30],q[33];
-rz(1.7636572217451076) q[33];
-cx q[30],q[33];
-rx(5.1045304176783395) q[33];
-rz(1.7636572217451076) q[34];
-cx q[3],q[34];
-cx q[3],q[35];
-cx q[12],q[34];
-rz(1.7636572217451076) q[34];
-cx q[12],q[34];
-rz(1.7636572217451076) q[35];
-cx q[3],q[35];
-cx q[3],q[39];
-cx q[32],q[35];
-rz(1.7636572217451076) q[35];
-cx q[32],q[35];
-rx(5.1045304176783395) q[35];
-rz(1.7636572217451076) q[36];
-cx q[15],q[36];
-cx q[20],q[36];
-rz(1.7636572217451076) q[36];
-cx q[20],q[36];
-rx(5.1045304176783395) q[36];
-rz(1.7636572217451076) q[37];
-cx q[10],q[37];
-cx q[10],q[41];
-cx q[34],q[37];
-rz(1.7636572217451076) q[37];
-cx q[34],q[37];
-rx(5.1045304176783395) q[34];
-rx(5.1045304176783395) q[37];
-rz(1.7636572217451076) q[38];
-cx q[19],q[38];
-rx(5.1045304176783395) q[19];
-cx q[21],q[38];
-rz(1.7636572217451076) q[38];
-cx q[21],q[38];
-rz(1.7636572217451076) q[39];
-cx q[3],q[39];
-cx q[3],q[40];
-cx q[13],q[39];
-rz(1.7636572217451076) q[39];
-cx q[13],q[39];
-rx(5.1045304176783395) q[39];
-rz(1.7636572217451076) q[40];
-cx q[3],q[40];
-cx q[23],q[40];
-rz(1.7636572217451076) q[40];
-cx q[23],q[40];
-rx(5.1045304176783395) q[40];
-rz(1.7636572217451076) q[41];
-cx q[10],q[41];
-cx q[27],q[41];
-rz(1.7636572217451076) q[41];
-cx q[27],q[41];
-cx q[27],q[72];
-cx q[41],q[67];
-rz(1.7636572217451076) q[42];
-cx q[0],q[42];
-cx q[0],q[48];
-cx q[3],q[42];
-rz(1.7636572217451076) q[42];
-cx q[3],q[42];
-cx q[3],q[43];
-cx q[42],q[78];
-rz(1.7636572217451076) q[43];
-cx q[3],q[43];
-cx q[3],q[44];
-cx q[20],q[43];
-rz(1.7636572217451076) q[43];
-cx q[20],q[43];
-rx(5.1045304176783395) q[20];
-rx(5.1045304176783395) q[43];
-rz(1.7636572217451076) q[44];
-cx q[3],q[44];
-cx q[3],q[49];
-cx q[12],q[44];
-rz(1.7636572217451076) q[44];
-cx q[12],q[44];
-rz(1.7636572217451076) q[45];
-cx q[1],q[45];
-cx q[1],q[57];
-cx q[16],q[45];
-rz(1.7636572217451076) q[45];
-cx q[16],q[45];
-cx q[16],q[59];
-rz(1.7636572217451076) q[46];
-cx q[5],q[46];
-cx q[5],q[65];
-cx q[38],q[46];
-rz(1.7636572217451076) q[46];
-cx q[38],q[46];
-rx(5.1045304176783395) q[38];
-rx(5.1045304176783395) q[46];
-rz(1.7636572217451076) q[47];
-cx q[4],q[47];
-cx q[17],q[47];
-rz(1.7636572217451076) q[47];
-cx q[17],q[47];
-cx q[17],q[53];
-rz(1.7636572217451076) q[48];
-cx q[0],q[48];
-cx q[0],q[51];
-cx q[30],q[48];
-rz(1.7636572217451076) q[48];
-cx q[30],q[48];
-rx(5.1045304176783395) q[48];
-rz(1.7636572217451076) q[49];
-cx q[3],q[49];
-cx q[3],q[50];
-cx q[4],q[49];
-rz(1.7636572217451076) q[49];
-cx q[4],q[49];
-cx q[4],q[61];
-rx(5.1045304176783395) q[49];
-rz(1.7636572217451076) q[50];
-cx q[3],q[50];
-cx q[3],q[52];
-cx q[12],q[50];
-rz(1.7636572217451076) q[50];
-cx q[12],q[50];
-cx q[12],q[63];
-rz(1.7636572217451076) q[51];
-cx q[0],q[51];
-cx q[0],q[62];
-cx q[28],q[51];
-rz(1.7636572217451076) q[51];
-cx q[28],q[51];
-rx(5.1045304176783395) q[51];
-rz(1.7636572217451076) q[52];
-cx q[3],q[52];
-cx q[10],q[52];
-rz(1.7636572217451076) q[52];
-cx q[10],q[52];
-rx(5.1045304176783395) q[52];
-rz(1.7636572217451076) q[53];
-cx q[17],q[53];
-cx q[21],q[53];
-rz(1.7636572217451076) q[53];
-cx q[21],q[53];
-rz(1.7636572217451076) q[54];
-cx q[24],q[54];
-cx q[24],q[58];
-cx q[28],q[54];
-rz(1.7636572217451076) q[54];
-cx q[28],q[54];
-rx(5.1045304176783395) q[54];
-rz(1.7636572217451076) q[55];
-cx q[9],q[55];
-cx q[9],q[80];
-cx q[15],q[55];
-rz(1.7636572217451076) q[55];
-cx q[15],q[55];
-rx(5.1045304176783395) q[55];
-cx q[56],q[82];
-rz(1.7636572217451076) q[57];
-cx q[1],q[57];
-cx q[1],q[60];
-cx q[3],q[57];
-rz(1.7636572217451076) q[57];
-cx q[3],q[57];
-cx q[3],q[70];
-rx(5.1045304176783395) q[57];
-rz(1.7636572217451076) q[58];
-cx q[24],q[58];
-rx(5.1045304176783395) q[24];
-cx q[28],q[58];
-rz(1.7636572217451076) q[58];
-cx q[28],q[58];
-rx(5.1045304176783395) q[28];
-rx(5.1045304176783395) q[58];
-rz(1.7636572217451076) q[59];
-cx q[16],q[59];
-cx q[16],q[73];
-cx q[32],q[59];
-rz(1.7636572217451076) q[59];
-cx q[32],q[59];
-rz(1.7636572217451076) q[60];
-cx q[1],q[60];
-rx(5.1045304176783395) q[1];
-cx q[7],q[60];
-rz(1.7636572217451076) q[60];
-cx q[7],q[60];
-rz(1.7636572217451076) q[61];
-cx q[4],q[61];
-rx(5.1045304176783395) q[4];
-cx q[7],q[61];
-rz(1.7636572217451076) q[61];
-cx q[7],q[61];
-rx(5.1045304176783395) q[7];
-rx(5.1045304176783395) q[61];
-rz(1.7636572217451076) q[62];
-cx q[0],q[62];
-cx q[0],q[64];
-cx q[17],q[62];
-rz(1.7636572217451076) q[62];
-cx q[17],q[62];
-rx(5.1045304176783395) q[62];
-rz(1.7636572217451076) q[63];
-cx q[12],q[63];
-rx(5.1045304176783395) q[12];
-cx q[17],q[63];
-rz(1.7636572217451076) q[63];
-cx q[17],q[63];
-cx q[17],q[66];
-rz(1.7636572217451076) q[64];
-cx q[0],q[64];
-cx q[0],q[75];
-cx q[10],q[64];
-rz(1.7636572217451076) q[64];
-cx q[10],q[64];
-rx(5.1045304176783395) q[10];
-rx(5.1045304176783395) q[64];
-rz(1.7636572217451076) q[65];
-cx q[5],q[65];
-cx q[5],q[76];
-cx q[23],q[65];
-rz(1.7636572217451076) q[65];
-cx q[23],q[65];
-rx(5.1045304176783395) q[23];
-rx(5.1045304176783395) q[65];
-rz(1.7636572217451076) q[66];
-cx q[17],q[66];
-rx(5.1045304176783395) q[17];
-cx q[47],q[66];
-rz(1.7636572217451076) q[66];
-cx q[47],q[66];
-rx(5.1045304176783395) q[47];
-rx(5.1045304176783395) q[66];
-rz(1.7636572217451076) q[67];
-cx q[41],q[67];
-rx(5.1045304176783395) q[41];
-rz(1.7636572217451076) q[69];
-cx q[6],q[69];
-cx q[59],q[69];
-rz(1.7636572217451076) q[69];
-cx q[59],q[69];
-rx(5.1045304176783395) q[69];
-rz(1.7636572217451076) q[70];
-cx q[3],q[70];
-cx q[3],q[71];
-cx q[15],q[70];
-rz(1.7636572217451076) q[70];
-cx q[15],q[70];
-rx(5.1045304176783395) q[70];
-rz(1.7636572217451076) q[71];
-cx q[3],q[71];
-cx q[3],q[77];
-cx q[53],q[71];
-rz(1.7636572217451076) q[71];
-cx q[53],q[71];
-rx(5.1045304176783395) q[53];
-rx(5.1045304176783395) q[71];
-rz(1.7636572217451076) q[72];
-cx q[27],q[72];
-rx(5.1045304176783395) q[27];
-cx q[44],q[72];
-rz(1.7636572217451076) q[72];
-cx q[44],q[72];
-rx(5.1045304176783395) q[44];
-rx(5.1045304176783395) q[72];
-rz(1.7636572217451076) q[73];
-cx q[16],q[73];
-rx(5.1045304176783395) q[16];
-cx q[59],q[73];
-rz(1.7636572217451076) q[73];
-cx q[59],q[73];
-rx(5.1045304176783395) q[59];
-rx(5.1045304176783395) q[73];
-rz(1.7636572217451076) q[75];
-cx q[0],q[75];
-cx q[21],q[75];
-rz(1.7636572217451076) q[75];
-cx q[21],q[75];
-cx q[21],q[81];
-rx(5.1045304176783395) q[75];
-rz(1.7636572217451076) q[76];
-cx q[5],q[76];
-rx(5.1045304176783395) q[5];
-cx q[6],q[76];
-rz(1.7636572217451076) q[76];
-cx q[6],q[76];
-cx q[6],q[79];
-rx(5.1045304176783395) q[76];
-rz(1.7636572217451076) q[77];
-cx q[3],q[77];
-rx(5.1045304176783395) q[3];
-cx q[30],q[77];
-rz(1.7636572217451076) q[77];
-cx q[30],q[77];
-rx(5.1045304176783395) q[30];
-rz(1.7636572217451076) q[78];
-cx q[42],q[78];
-rx(5.1045304176783395) q[42];
-cx q[60],q[78];
-rz(1.7636572217451076) q[78];
-cx q[60],q[78];
-rx(5.1045304176783395) q[60];
-rx(5.1045304176783395) q[78];
-rz(1.7636572217451076) q[79];
-cx q[6],q[79];
-rx(5.1045304176783395) q[6];
-cx q[50],q[79];
-rz(1.7636572217451076) q[79];
-cx q[50],q[79];
-rx(5.1045304176783395) q[50];
-rx(5.1045304176783395) q[79];
-rz(1.7636572217451076) q[80];
-cx q[9],q[80];
-rx(5.1045304176783395) q[9];
-cx q[15],q[80];
-rz(1.7636572217451076) q[80];
-cx q[15],q[80];
-rx(5.1045304176783395) q[15];
-rx(5.1045304176783395) q[80];
-rz(1.7636572217451076) q[81];
-cx q[21],q[81];
-rx(5.1045304176783395) q[21];
-cx q[77],q[81];
-rz(1.7636572217451076) q[81];
-cx q[77],q[81];
-rx(5.1045304176783395) q[77];
-rx(5.1045304176783395) q[81];
-rz(0.10948349984471521) q[82];
-cx q[56],q[82];
-rx(8.511632543491016) q[56];
-cx q[13],q[56];
-rz(1.7636572217451076) q[56];
-cx q[13],q[56];
-cx q[13],q[68];
-cx q[45],q[56];
-rz(1.7636572217451076) q[56];
-cx q[45],q[56];
-rx(5.1045304176783395) q[45];
-cx q[56],q[67];
-rz(1.7636572217451076) q[67];
-cx q[56],q[67];
-cx q[56],q[74];
-rx(5.1045304176783395) q[67];
-rz(1.7636572217451076) q[68];
-cx q[13],q[68];
-rx(5.1045304176783395) q[13];
-cx q[32],q[68];
-rz(1.7636572217451076) q[68];
-cx q[32],q[68];
-rx(5.1045304176783395) q[32];
-rx(5.1045304176783395) q[68];
-rz(1.7636572217451076) q[74];
-cx q[56],q[74];
-cx q[63],q[74];
-rz(1.7636572217451076) q[74];
-cx q[63],q[74];
-rx(5.1045304176783395) q[63];
-rx(5.1045304176783395) q[74];
-rx(8.511632543491016) q[82];
-cx q[0],q[82];
-rz(1.7636572217451076) q[82];
-cx q[0],q[82];
-rx(5.1045304176783395) q[0];
-cx q[0],q[1];
-rz(2.247833355176214) q[1];
-cx q[0],q[1];
-cx q[0],q[2];
-rz(2.247833355176214) q[2];
-cx q[0],q[2];
-cx q[0],q[3];
-rx(7.479416771823032) q[2];
-rz(2.247833355176214) q[3];
-cx q[0],q[3];
-cx q[0],q[15];
-cx q[1],q[3];
-rz(2.247833355176214) q[3];
-cx q[1],q[3];
-cx q[1],q[4];
-rz(2.247833355176214) q[4];
-cx q[1],q[4];
-cx q[1],q[5];
-cx q[3],q[4];
-rz(2.247833355176214) q[4];
-cx q[3],q[4];
-cx q[4],q[6];
-rz(2.247833355176214) q[5];
-cx q[1],q[5];
-cx q[1],q[9];
-cx q[3],q[5];
-rz(2.247833355176214) q[5];
-cx q[3],q[5];
-cx q[3],q[7];
-rz(2.247833355176214) q[6];
-cx q[4],q[6];
-cx q[5],q[6];
-rz(2.247833355176214) q[6];
-cx q[5],q[6];
-rz(2.247833355176214) q[7];
-cx q[3],q[7];
-cx q[3],q[8];
-cx q[4],q[7];
-rz(2.247833355176214) q[7];
-cx q[4],q[7];
-cx q[4],q[10];
-rz(2.247833355176214) q[8];
-cx q[3],q[8];
-cx q[5],q[8];
-rz(2.247833355176214) q[8];
-cx q[5],q[8];
-cx q[5],q[11];
-rx(7.479416771823032) q[8];
-rz(2.247833355176214) q[9];
-cx q[1],q[9];
-cx q[1],q[17];
-cx q[3],q[9];
-rz(2.247833355176214) q[9];
-cx q[3],q[9];
-cx q[3],q[12];
-rz(2.247833355176214) q[10];
-cx q[4],q[10];
-cx q[4],q[13];
-cx q[6],q[10];
-rz(2.247833355176214) q[10];
-cx q[6],q[10];
-cx q[10],q[37];
-rz(2.247833355176214) q[11];
-cx q[5],q[11];
-cx q[6],q[11];
-rz(2.247833355176214) q[11];
-cx q[6],q[11];
-rx(7.479416771823032) q[11];
-rz(2.247833355176214) q[12];
-cx q[3],q[12];
-cx q[3],q[14];
-cx q[5],q[12];
-rz(2.247833355176214) q[12];
-cx q[5],q[12];
-rz(2.247833355176214) q[13];
-cx q[4],q[13];
-cx q[5],q[13];
-rz(2.247833355176214) q[13];
-cx q[5],q[13];
-rz(2.247833355176214) q[14];
-cx q[3],q[14];
-cx q[4],q[14];
-rz(2.247833355176214) q[14];
-cx q[4],q[14];
-rx(7.479416771823032) q[14];
-rz(2.247833355176214) q[15];
-cx q[0],q[15];
-cx q[0],q[16];
-cx q[3],q[15];
-rz(2.247833355176214) q[15];
-cx q[3],q[15];
-rz(2.247833355176214) q[16];
-cx q[0],q[16];
-cx q[0],q[20];
-cx q[3],q[16];
-rz(2.247833355176214) q[16];
-cx q[3],q[16];
-rz(2.247833355176214) q[17];
-cx q[1],q[17];
-cx q[1],q[28];
-cx q[3],q[17];
-rz(2.247833355176214) q[17];
-cx q[3],q[17];
-cx q[3],q[18];
-rz(2.247833355176214) q[18];
-cx q[3],q[18];
-cx q[3],q[19];
-cx q[4],q[18];
-rz(2.247833355176214) q[18];
-cx q[4],q[18];
-cx q[4],q[21];
-rz(2.247833355176214) q[19];
-cx q[3],q[19];
-cx q[3],q[22];
-cx q[7],q[19];
-rz(2.247833355176214) q[19];
-cx q[7],q[19];
-cx q[19],q[38];
-rz(2.247833355176214) q[20];
-cx q[0],q[20];
-cx q[0],q[32];
-cx q[15],q[20];
-rz(2.247833355176214) q[20];
-cx q[15],q[20];
-rz(2.247833355176214) q[21];
-cx q[4],q[21];
-cx q[4],q[27];
-cx q[15],q[21];
-rz(2.247833355176214) q[21];
-cx q[15],q[21];
-cx q[15],q[36];
-rz(2.247833355176214) q[22];
-cx q[3],q[22];
-cx q[3],q[23];
-cx q[9],q[22];
-rz(2.247833355176214) q[22];
-cx q[9],q[22];
-cx q[9],q[55];
-rx(7.479416771823032) q[22];
-rz(2.247833355176214) q[23];
-cx q[3],q[23];
-cx q[3],q[24];
-cx q[17],q[23];
-rz(2.247833355176214) q[23];
-cx q[17],q[23];
-rz(2.247833355176214) q[24];
-cx q[3],q[24];
-cx q[3],q[25];
-cx q[5],q[24];
-rz(2.247833355176214) q[24];
-cx q[5],q[24];
-cx q[5],q[33];
-cx q[24],q[54];
-rz(2.247833355176214) q[25];
-cx q[3],q[25];
-cx q[3],q[26];
-cx q[12],q[25];
-rz(2.247833355176214) q[25];
-cx q[12],q[25];
-cx q[12],q[31];
-rx(7.479416771823032) q[25];
-rz(2.247833355176214) q[26];
-cx q[3],q[26];
-cx q[21],q[26];
-rz(2.247833355176214) q[26];
-cx q[21],q[26];
-rz(2.247833355176214) q[27];
-cx q[4],q[27];
-cx q[4],q[47];
-cx q[6],q[27];
-rz(2.247833355176214) q[27];
-cx q[6],q[27];
-cx q[6],q[69];
-rz(2.247833355176214) q[28];
-cx q[1],q[28];
-cx q[1],q[29];
-cx q[3],q[28];
-rz(2.247833355176214) q[28];
-cx q[3],q[28];
-rz(2.247833355176214) q[29];
-cx q[1],q[29];
-cx q[1],q[45];
-cx q[3],q[29];
-rz(2.247833355176214) q[29];
-cx q[3],q[29];
-cx q[3],q[30];
-rx(7.479416771823032) q[29];
-rz(2.247833355176214) q[30];
-cx q[3],q[30];
-cx q[3],q[34];
-cx q[18],q[30];
-rz(2.247833355176214) q[30];
-cx q[18],q[30];
-rx(7.479416771823032) q[18];
-rz(2.247833355176214) q[31];
-cx q[12],q[31];
-cx q[26],q[31];
-rz(2.247833355176214) q[31];
-cx q[26],q[31];
-rx(7.479416771823032) q[26];
-rx(7.479416771823032) q[31];
-rz(2.247833355176214) q[32];
-cx q[0],q[32];
-cx q[0],q[42];
-cx q[21],q[32];
-rz(2.247833355176214) q[32];
-cx q[21],q[32];
-rz(2.247833355176214) q[33];
-cx q[5],q[33];
-cx q[5],q[46];
-cx q[30],q[33];
-rz(2.247833355176214) q[33];
-cx q[30],q[33];
-rx(7.479416771823032) q[33];
-rz(2.247833355176214) q[34];
-cx q[3],q[34];
-cx q[3],q[35];
-cx q[12],q[34];
-rz(2.247833355176214) q[34];
-cx q[12],q[34];
-rz(2.247833355176214) q[35];
-cx q[3],q[35];
-cx q[3],q[39];
-cx q[32],q[35];
-rz(2.247833355176214) q[35];
-cx q[32],q[35];
-rx(7.479416771823032) q[35];
-rz(2.247833355176214) q[36];
-cx q[15],q[36];
-cx q[20],q[36];
-rz(2.247833355176214) q[36];
-cx q[20],q[36];
-rx(7.479416771823032) q[36];
-rz(2.247833355176214) q[37];
-cx q[10],q[37];
-cx q[10],q[41];
-cx q[34],q[37];
-rz(2.247833355176214) q[37];
-cx q[34],q[37];
-rx(7.479416771823032) q[34];
-rx(7.479416771823032) q[37];
-rz(2.247833355176214) q[38];
-cx q[19],q[38];
-rx(7.479416771823032) q[19];
-cx q[21],q[38];
-rz(2.247833355176214) q[38];
-cx q[21],q[38];
-rz(2.247833355176214) q[39];
-cx q[3],q[39];
-cx q[3],q[40];
-cx q[13],q[39];
-rz(2.247833355176214) q[39];
-cx q[13],q[39];
-rx(7.479416771823032) q[39];
-rz(2.247833355176214) q[40];
-cx q[3],q[40];
-cx q[23],q[40];
-rz(2.247833355176214) q[40];
-cx q[23],q[40];
-rx(7.479416771823032) q[40];
-rz(2.247833355176214) q[41];
-cx q[10],q[41];
-cx q[27],q[41];
-rz(2.247833355176214) q[41];
-cx q[27],q[41];
-cx q[27],q[72];
-cx q[41],q[67];
-rz(2.247833355176214) q[42];
-cx q[0],q[42];
-cx q[0],q[48];
-cx q[3],q[42];
-rz(2.247833355176214) q[42];
-cx q[3],q[42];
-cx q[3],q[43];
-cx q[42],q[78];
-rz(2.247833355176214) q[43];
-cx q[3],q[43];
-cx q[3],q[44];
-cx q[20],q[43];
-rz(2.247833355176214) q[43];
-cx q[20],q[43];
-rx(7.479416771823032) q[20];
-rx(7.479416771823032) q[43];
-rz(2.247833355176214) q[44];
-cx q[3],q[44];
-cx q[3],q[49];
-cx q[12],q[44];
-rz(2.247833355176214) q[44];
-cx q[12],q[44];
-rz(2.247833355176214) q[45];
-cx q[1],q[45];
-cx q[1],q[57];
-cx q[16],q[45];
-rz(2.247833355176214) q[45];
-cx q[16],q[45];
-cx q[16],q[59];
-rz(2.247833355176214) q[46];
-cx q[5],q[46];
-cx q[5],q[65];
-cx q[38],q[46];
-rz(2.247833355176214) q[46];
-cx q[38],q[46];
-rx(7.479416771823032) q[38];
-rx(7.479416771823032) q[46];
-rz(2.247833355176214) q[47];
-cx q[4],q[47];
-cx q[17],q[47];
-rz(2.247833355176214) q[47];
-cx q[17],q[47];
-cx q[17],q[53];
-rz(2.247833355176214) q[48];
-cx q[0],q[48];
-cx q[0],q[51];
-cx q[30],q[48];
-rz(2.247833355176214) q[48];
-cx q[30],q[48];
-rx(7.479416771823032) q[48];
-rz(2.247833355176214) q[49];
-cx q[3],q[49];
-cx q[3],q[50];
-cx q[4],q[49];
-rz(2.247833355176214) q[49];
-cx q[4],q[49];
-cx q[4],q[61];
-rx(7.479416771823032) q[49];
-rz(2.247833355176214) q[50];
-cx q[3],q[50];
-cx q[3],q[52];
-cx q[12],q[50];
-rz(2.247833355176214) q[50];
-cx q[12],q[50];
-cx q[12],q[63];
-rz(2.247833355176214) q[51];
-cx q[0],q[51];
-cx q[0],q[62];
-cx q[28],q[51];
-rz(2.247833355176214) q[51];
-cx q[28],q[51];
-rx(7.479416771823032) q[51];
-rz(2.247833355176214) q[52];
-cx q[3],q[52];
-cx q[10],q[52];
-rz(2.247833355176214) q[52];
-cx q[10],q[52];
-rx(7.479416771823032) q[52];
-rz(2.247833355176214) q[53];
-cx q[17],q[53];
-cx q[21],q[53];
-rz(2.247833355176214) q[53];
-cx q[21],q[53];
-rz(2.247833355176214) q[54];
-cx q[24],q[54];
-cx q[24],q[58];
-cx q[28],q[54];
-rz(2.247833355176214) q[54];
-cx q[28],q[54];
-rx(7.479416771823032) q[54];
-rz(2.247833355176214) q[55];
-cx q[9],q[55];
-cx q[9],q[80];
-cx q[15],q[55];
-rz(2.247833355176214) q[55];
-cx q[15],q[55];
-rx(7.479416771823032) q[55];
-cx q[56],q[82];
-rz(2.247833355176214) q[57];
-cx q[1],q[57];
-cx q[1],q[60];
-cx q[3],q[57];
-rz(2.247833355176214) q[57];
-cx q[3],q[57];
-cx q[3],q[70];
-rx(7.479416771823032) q[57];
-rz(2.247833355176214) q[58];
-cx q[24],q[58];
-rx(7.479416771823032) q[24];
-cx q[28],q[58];
-rz(2.247833355176214) q[58];
-cx q[28],q[58];
-rx(7.479416771823032) q[28];
-rx(7.479416771823032) q[58];
-rz(2.247833355176214) q[59];
-cx q[16],q[59];
-cx q[16],q[73];
-cx q[32],q[59];
-rz(2.247833355176214) q[59];
-cx q[32],q[59];
-rz(2.247833355176214) q[60];
-cx q[1],q[60];
-rx(7.479416771823032) q[1];
-cx q[7],q[60];
-rz(2.247833355176214) q[60];
-cx q[7],q[60];
-rz(2.247833355176214) q[61];
-cx q[4],q[61];
-rx(7.479416771823032) q[4];
-cx q[7],q[61];
-rz(2.247833355176214) q[61];
-cx q[7],q[61];
-rx(7.479416771823032) q[7];
-rx(7.479416771823032) q[61];
-rz(2.247833355176214) q[62];
-cx q[0],q[62];
-cx q[0],q[64];
-cx q[17],q[62];
-rz(2.247833355176214) q[62];
-cx q[17],q[62];
-rx(7.479416771823032) q[62];
-rz(2.247833355176214) q[63];
-cx q[12],q[63];
-rx(7.479416771823032) q[12];
-cx q[17],q[63];
-rz(2.247833355176214) q[63];
-cx q[17],q[63];
-cx q[17],q[66];
-rz(2.247833355176214) q[64];
-cx q[0],q[64];
-cx q[0],q[75];
-cx q[10],q[64];
-rz(2.247833355176214) q[64];
-cx q[10],q[64];
-rx(7.479416771823032) q[10];
-rx(7.479416771823032) q[64];
-rz(2.247833355176214) q[65];
-cx q[5],q[65];
-cx q[5],q[76];
-cx q[23],q[65];
-rz(2.247833355176214) q[65];
-cx q[23],q[65];
-rx(7.479416771823032) q[23];
-rx(7.479416771823032) q[65];
-rz(2.247833355176214) q[66];
-cx q[17],q[66];
-rx(7.479416771823032) q[17];
-cx q[47],q[66];
-rz(2.247833355176214) q[66];
-cx q[47],q[66];
-rx(7.479416771823032) q[47];
-rx(7.479416771823032) q[66];
-rz(2.247833355176214) q[67];
-cx q[41],q[67];
-rx(7.479416771823032) q[41];
-rz(2.247833355176214) q[69];
-cx q[6],q[69];
-cx q[59],q[69];
-rz(2.247833355176214) q[69];
-cx q[59],q[69];
-rx(7.479416771823032) q[69];
-rz(2.247833355176214) q[70];
-cx q[3],q[70];
-cx q[3],q[71];
-cx q[15],q[70];
-rz(2.247833355176214) q[70];
-cx q[15],q[70];
-rx(7.479416771823032) q[70];
-rz(2.247833355176214) q[71];
-cx q[3],q[71];
-cx q[3],q[77];
-cx q[53],q[71];
-rz(2.247833355176214) q[71];
-cx q[53],q[71];
-rx(7.479416771823032) q[53];
-rx(7.479416771823032) q[71];
-rz(2.247833355176214) q[72];
-cx q[27],q[72];
-rx(7.479416771823032) q[27];
-cx q[44],q[72];
-rz(2.247833355176214) q[72];
-cx q[44],q[72];
-rx(7.479416771823032) q[44];
-rx(7.479416771823032) q[72];
-rz(2.247833355176214) q[73];
-cx q[16],q[73];
-rx(7.479416771823032) q[16];
-cx q[59],q[73];
-rz(2.247833355176214) q[73];
-cx q[59],q[73];
-rx(7.479416771823032) q[59];
-rx(7.479416771823032) q[73];
-rz(2.247833355176214) q[75];
-cx q[0],q[75];
-cx q[21],q[75];
-rz(2.247833355176214) q[75];
-cx q[21],q[75];
-cx q[21],q[81];
-rx(7.479416771823032) q[75];
-rz(2.247833355176214) q[76];
-cx q[5],q[76];
-rx(7.479416771823032) q[5];
-cx q[6],q[76];
-rz(2.247833355176214) q[76];
-cx q[6],q[76];
-cx q[6],q[79];
-rx(7.479416771823032) q[76];
-rz(2.247833355176214) q[77];
-cx q[3],q[77];
-rx(7.479416771823032) q[3];
-cx q[30],q[77];
-rz(2.247833355176214) q[77];
-cx q[30],q[77];
-rx(7.479416771823032) q[30];
-rz(2.247833355176214) q[78];
-cx q[42],q[78];
-rx(7.479416771823032) q[42];
-cx q[60],q[78];
-rz(2.247833355176214) q[78];
-cx q[60],q[78];
-rx(7.479416771823032) q[60];
-rx(7.479416771823032) q[78];
-rz(2.247833355176214) q[79];
-cx q[6],q[79];
-rx(7.479416771823032) q[6];
-cx q[50],q[79];
-rz(2.247833355176214) q[79];
-cx q[50],q[79];
-rx(7.479416771823032) q[50];
-rx(7.479416771823032) q[79];
-rz(2.247833355176214) q[80];
-cx q[9],q[80];
-rx(7.479416771823032) q[9];
-cx q[15],q[80];
-rz(2.247833355176214) q[80];
-cx q[15],q[80];
-rx(7.479416771823032) q[15];
-rx(7.479416771823032) q[80];
-rz(2.247833355176214) q[81];
-cx q[21],q[81];
-rx(7.479416771823032) q[21];
-cx q[77],q[81];
-rz(2.247833355176214) q[81];
-cx q[77],q[81];
-rx(7.479416771823032) q[77];
-rx(7.479416771823032) q[81];
-rz(1.7636572217451076) q[82];
-cx q[56],q[82];
-rx(5.1045304176783395) q[56];
-cx q[13],q[56];
-rz(2.247833355176214) q[56];
-cx q[13],q[56];
-cx q[13],q[68];
-cx q[45],q[56];
-rz(2.247833355176214) q[56];
-cx q[45],q[56];
-rx(7.479416771823032) q[45];
-cx q[56],q[67];
-rz(2.247833355176214) q[67];
-cx q[56],q[67];
-cx q[56],q[74];
-rx(7.479416771823032) q[67];
-rz(2.247833355176214) q[68];
-cx q[13],q[68];
-rx(7.479416771823032) q[13];
-cx q[32],q[68];
-rz(2.247833355176214) q[68];
-cx q[32],q[68];
-rx(7.479416771823032) q[32];
-rx(7.479416771823032) q[68];
-rz(2.247833355176214) q[74];
-cx q[56],q[74];
-cx q[63],q[74];
-rz(2.247833355176214) q[74];
-cx q[63],q[74];
-rx(7.479416771823032) q[63];
-rx(7.479416771823032) q[74];
-rx(5.1045304176783395) q[82];
-cx q[0],q[82];
-rz(2.247833355176214) q[82];
-cx q[0],q[82];
-rx(7.479416771823032) q[0];
-cx q[56],q[82];
-rz(2.247833355176214) q[82];
-cx q[56],q[82];
-rx(7.479416771823032) q[56];
-rx(7.479416771823032) q[82];
\ No newline at end of file
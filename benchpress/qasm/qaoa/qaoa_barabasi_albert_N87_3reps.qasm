@@ -1,1968 +0,0 @@
-OPENQASM 2.0;
-include "qelib1.inc";
-qreg q[87];
-ry(pi/2) q[0];
-rx(pi) q[0];
-ry(pi/2) q[1];
-rx(pi) q[1];
-cx q[0],q[1];
-rz(5.821743141243112) q[1];
-cx q[0],q[1];
-ry(pi/2) q[2];
-rx(pi) q[2];
-cx q[0],q[2];
-rz(5.821743141243112) q[2];
-cx q[0],q[2];
-rx(2.912230465699353) q[2];
-ry(pi/2) q[3];
-rx(pi) q[3];
-cx q[0],q[3];
-rz(5.821743141243112) q[3];
-cx q[0],q[3];
-cx q[1],q[3];
-rz(5.821743141243112) q[3];
-cx q[1],q[3];
-ry(pi/2) q[4];
-rx(pi) q[4];
-cx q[1],q[4];
-rz(5.821743141243112) q[4];
-cx q[1],q[4];
-cx q[3],q[4];
-rz(5.821743141243112) q[4];
-cx q[3],q[4];
-ry(pi/2) q[5];
-rx(pi) q[5];
-cx q[1],q[5];
-rz(5.821743141243112) q[5];
-cx q[1],q[5];
-cx q[3],q[5];
-rz(5.821743141243112) q[5];
-cx q[3],q[5];
-ry(pi/2) q[6];
-rx(pi) q[6];
-cx q[4],q[6];
-rz(5.821743141243112) q[6];
-cx q[4],q[6];
-cx q[5],q[6];
-rz(5.821743141243112) q[6];
-cx q[5],q[6];
-ry(pi/2) q[7];
-rx(pi) q[7];
-cx q[3],q[7];
-rz(5.821743141243112) q[7];
-cx q[3],q[7];
-cx q[4],q[7];
-rz(5.821743141243112) q[7];
-cx q[4],q[7];
-ry(pi/2) q[8];
-rx(pi) q[8];
-cx q[3],q[8];
-rz(5.821743141243112) q[8];
-cx q[3],q[8];
-cx q[5],q[8];
-rz(5.821743141243112) q[8];
-cx q[5],q[8];
-ry(pi/2) q[9];
-rx(pi) q[9];
-cx q[1],q[9];
-rz(5.821743141243112) q[9];
-cx q[1],q[9];
-cx q[3],q[9];
-rz(5.821743141243112) q[9];
-cx q[3],q[9];
-ry(pi/2) q[10];
-rx(pi) q[10];
-cx q[4],q[10];
-rz(5.821743141243112) q[10];
-cx q[4],q[10];
-cx q[6],q[10];
-rz(5.821743141243112) q[10];
-cx q[6],q[10];
-ry(pi/2) q[11];
-rx(pi) q[11];
-cx q[5],q[11];
-rz(5.821743141243112) q[11];
-cx q[5],q[11];
-cx q[6],q[11];
-rz(5.821743141243112) q[11];
-cx q[6],q[11];
-rx(2.912230465699353) q[11];
-ry(pi/2) q[12];
-rx(pi) q[12];
-cx q[3],q[12];
-rz(5.821743141243112) q[12];
-cx q[3],q[12];
-cx q[5],q[12];
-rz(5.821743141243112) q[12];
-cx q[5],q[12];
-ry(pi/2) q[13];
-rx(pi) q[13];
-cx q[4],q[13];
-rz(5.821743141243112) q[13];
-cx q[4],q[13];
-cx q[5],q[13];
-rz(5.821743141243112) q[13];
-cx q[5],q[13];
-ry(pi/2) q[14];
-rx(pi) q[14];
-cx q[3],q[14];
-rz(5.821743141243112) q[14];
-cx q[3],q[14];
-cx q[4],q[14];
-rz(5.821743141243112) q[14];
-cx q[4],q[14];
-rx(2.912230465699353) q[14];
-ry(pi/2) q[15];
-rx(pi) q[15];
-cx q[0],q[15];
-rz(5.821743141243112) q[15];
-cx q[0],q[15];
-cx q[3],q[15];
-rz(5.821743141243112) q[15];
-cx q[3],q[15];
-ry(pi/2) q[16];
-rx(pi) q[16];
-cx q[0],q[16];
-rz(5.821743141243112) q[16];
-cx q[0],q[16];
-cx q[3],q[16];
-rz(5.821743141243112) q[16];
-cx q[3],q[16];
-ry(pi/2) q[17];
-rx(pi) q[17];
-cx q[1],q[17];
-rz(5.821743141243112) q[17];
-cx q[1],q[17];
-cx q[3],q[17];
-rz(5.821743141243112) q[17];
-cx q[3],q[17];
-ry(pi/2) q[18];
-rx(pi) q[18];
-cx q[3],q[18];
-rz(5.821743141243112) q[18];
-cx q[3],q[18];
-cx q[4],q[18];
-rz(5.821743141243112) q[18];
-cx q[4],q[18];
-ry(pi/2) q[19];
-rx(pi) q[19];
-cx q[3],q[19];
-rz(5.821743141243112) q[19];
-cx q[3],q[19];
-cx q[7],q[19];
-rz(5.821743141243112) q[19];
-cx q[7],q[19];
-ry(pi/2) q[20];
-rx(pi) q[20];
-cx q[0],q[20];
-rz(5.821743141243112) q[20];
-cx q[0],q[20];
-cx q[15],q[20];
-rz(5.821743141243112) q[20];
-cx q[15],q[20];
-ry(pi/2) q[21];
-rx(pi) q[21];
-cx q[4],q[21];
-rz(5.821743141243112) q[21];
-cx q[4],q[21];
-cx q[15],q[21];
-rz(5.821743141243112) q[21];
-cx q[15],q[21];
-ry(pi/2) q[22];
-rx(pi) q[22];
-cx q[3],q[22];
-rz(5.821743141243112) q[22];
-cx q[3],q[22];
-cx q[9],q[22];
-rz(5.821743141243112) q[22];
-cx q[9],q[22];
-rx(2.912230465699353) q[22];
-ry(pi/2) q[23];
-rx(pi) q[23];
-cx q[3],q[23];
-rz(5.821743141243112) q[23];
-cx q[3],q[23];
-cx q[17],q[23];
-rz(5.821743141243112) q[23];
-cx q[17],q[23];
-ry(pi/2) q[24];
-rx(pi) q[24];
-cx q[3],q[24];
-rz(5.821743141243112) q[24];
-cx q[3],q[24];
-cx q[5],q[24];
-rz(5.821743141243112) q[24];
-cx q[5],q[24];
-ry(pi/2) q[25];
-rx(pi) q[25];
-cx q[3],q[25];
-rz(5.821743141243112) q[25];
-cx q[3],q[25];
-cx q[12],q[25];
-rz(5.821743141243112) q[25];
-cx q[12],q[25];
-rx(2.912230465699353) q[25];
-ry(pi/2) q[26];
-rx(pi) q[26];
-cx q[3],q[26];
-rz(5.821743141243112) q[26];
-cx q[3],q[26];
-cx q[21],q[26];
-rz(5.821743141243112) q[26];
-cx q[21],q[26];
-ry(pi/2) q[27];
-rx(pi) q[27];
-cx q[4],q[27];
-rz(5.821743141243112) q[27];
-cx q[4],q[27];
-cx q[6],q[27];
-rz(5.821743141243112) q[27];
-cx q[6],q[27];
-ry(pi/2) q[28];
-rx(pi) q[28];
-cx q[1],q[28];
-rz(5.821743141243112) q[28];
-cx q[1],q[28];
-cx q[3],q[28];
-rz(5.821743141243112) q[28];
-cx q[3],q[28];
-ry(pi/2) q[29];
-rx(pi) q[29];
-cx q[1],q[29];
-rz(5.821743141243112) q[29];
-cx q[1],q[29];
-cx q[3],q[29];
-rz(5.821743141243112) q[29];
-cx q[3],q[29];
-rx(2.912230465699353) q[29];
-ry(pi/2) q[30];
-rx(pi) q[30];
-cx q[3],q[30];
-rz(5.821743141243112) q[30];
-cx q[3],q[30];
-cx q[18],q[30];
-rz(5.821743141243112) q[30];
-cx q[18],q[30];
-rx(2.912230465699353) q[18];
-ry(pi/2) q[31];
-rx(pi) q[31];
-cx q[12],q[31];
-rz(5.821743141243112) q[31];
-cx q[12],q[31];
-cx q[26],q[31];
-rz(5.821743141243112) q[31];
-cx q[26],q[31];
-rx(2.912230465699353) q[26];
-rx(2.912230465699353) q[31];
-ry(pi/2) q[32];
-rx(pi) q[32];
-cx q[0],q[32];
-rz(5.821743141243112) q[32];
-cx q[0],q[32];
-cx q[21],q[32];
-rz(5.821743141243112) q[32];
-cx q[21],q[32];
-ry(pi/2) q[33];
-rx(pi) q[33];
-cx q[5],q[33];
-rz(5.821743141243112) q[33];
-cx q[5],q[33];
-cx q[30],q[33];
-rz(5.821743141243112) q[33];
-cx q[30],q[33];
-rx(2.912230465699353) q[33];
-ry(pi/2) q[34];
-rx(pi) q[34];
-cx q[3],q[34];
-rz(5.821743141243112) q[34];
-cx q[3],q[34];
-cx q[12],q[34];
-rz(5.821743141243112) q[34];
-cx q[12],q[34];
-ry(pi/2) q[35];
-rx(pi) q[35];
-cx q[3],q[35];
-rz(5.821743141243112) q[35];
-cx q[3],q[35];
-cx q[32],q[35];
-rz(5.821743141243112) q[35];
-cx q[32],q[35];
-rx(2.912230465699353) q[35];
-ry(pi/2) q[36];
-rx(pi) q[36];
-cx q[15],q[36];
-rz(5.821743141243112) q[36];
-cx q[15],q[36];
-cx q[20],q[36];
-rz(5.821743141243112) q[36];
-cx q[20],q[36];
-rx(2.912230465699353) q[36];
-ry(pi/2) q[37];
-rx(pi) q[37];
-cx q[10],q[37];
-rz(5.821743141243112) q[37];
-cx q[10],q[37];
-cx q[34],q[37];
-rz(5.821743141243112) q[37];
-cx q[34],q[37];
-rx(2.912230465699353) q[34];
-ry(pi/2) q[38];
-rx(pi) q[38];
-cx q[19],q[38];
-rz(5.821743141243112) q[38];
-cx q[19],q[38];
-rx(2.912230465699353) q[19];
-cx q[21],q[38];
-rz(5.821743141243112) q[38];
-cx q[21],q[38];
-ry(pi/2) q[39];
-rx(pi) q[39];
-cx q[3],q[39];
-rz(5.821743141243112) q[39];
-cx q[3],q[39];
-cx q[13],q[39];
-rz(5.821743141243112) q[39];
-cx q[13],q[39];
-rx(2.912230465699353) q[39];
-ry(pi/2) q[40];
-rx(pi) q[40];
-cx q[3],q[40];
-rz(5.821743141243112) q[40];
-cx q[3],q[40];
-cx q[23],q[40];
-rz(5.821743141243112) q[40];
-cx q[23],q[40];
-rx(2.912230465699353) q[40];
-ry(pi/2) q[41];
-rx(pi) q[41];
-cx q[10],q[41];
-rz(5.821743141243112) q[41];
-cx q[10],q[41];
-cx q[27],q[41];
-rz(5.821743141243112) q[41];
-cx q[27],q[41];
-ry(pi/2) q[42];
-rx(pi) q[42];
-cx q[0],q[42];
-rz(5.821743141243112) q[42];
-cx q[0],q[42];
-cx q[3],q[42];
-rz(5.821743141243112) q[42];
-cx q[3],q[42];
-ry(pi/2) q[43];
-rx(pi) q[43];
-cx q[3],q[43];
-rz(5.821743141243112) q[43];
-cx q[3],q[43];
-cx q[20],q[43];
-rz(5.821743141243112) q[43];
-cx q[20],q[43];
-rx(2.912230465699353) q[20];
-rx(2.912230465699353) q[43];
-ry(pi/2) q[44];
-rx(pi) q[44];
-cx q[3],q[44];
-rz(5.821743141243112) q[44];
-cx q[3],q[44];
-cx q[12],q[44];
-rz(5.821743141243112) q[44];
-cx q[12],q[44];
-ry(pi/2) q[45];
-rx(pi) q[45];
-cx q[1],q[45];
-rz(5.821743141243112) q[45];
-cx q[1],q[45];
-cx q[16],q[45];
-rz(5.821743141243112) q[45];
-cx q[16],q[45];
-ry(pi/2) q[46];
-rx(pi) q[46];
-cx q[5],q[46];
-rz(5.821743141243112) q[46];
-cx q[5],q[46];
-cx q[38],q[46];
-rz(5.821743141243112) q[46];
-cx q[38],q[46];
-rx(2.912230465699353) q[38];
-rx(2.912230465699353) q[46];
-ry(pi/2) q[47];
-rx(pi) q[47];
-cx q[4],q[47];
-rz(5.821743141243112) q[47];
-cx q[4],q[47];
-cx q[17],q[47];
-rz(5.821743141243112) q[47];
-cx q[17],q[47];
-ry(pi/2) q[48];
-rx(pi) q[48];
-cx q[0],q[48];
-rz(5.821743141243112) q[48];
-cx q[0],q[48];
-cx q[30],q[48];
-rz(5.821743141243112) q[48];
-cx q[30],q[48];
-rx(2.912230465699353) q[48];
-ry(pi/2) q[49];
-rx(pi) q[49];
-cx q[3],q[49];
-rz(5.821743141243112) q[49];
-cx q[3],q[49];
-cx q[4],q[49];
-rz(5.821743141243112) q[49];
-cx q[4],q[49];
-rx(2.912230465699353) q[49];
-ry(pi/2) q[50];
-rx(pi) q[50];
-cx q[3],q[50];
-rz(5.821743141243112) q[50];
-cx q[3],q[50];
-cx q[12],q[50];
-rz(5.821743141243112) q[50];
-cx q[12],q[50];
-ry(pi/2) q[51];
-rx(pi) q[51];
-cx q[0],q[51];
-rz(5.821743141243112) q[51];
-cx q[0],q[51];
-cx q[28],q[51];
-rz(5.821743141243112) q[51];
-cx q[28],q[51];
-rx(2.912230465699353) q[51];
-ry(pi/2) q[52];
-rx(pi) q[52];
-cx q[3],q[52];
-rz(5.821743141243112) q[52];
-cx q[3],q[52];
-cx q[10],q[52];
-rz(5.821743141243112) q[52];
-cx q[10],q[52];
-rx(2.912230465699353) q[52];
-ry(pi/2) q[53];
-rx(pi) q[53];
-cx q[17],q[53];
-rz(5.821743141243112) q[53];
-cx q[17],q[53];
-cx q[21],q[53];
-rz(5.821743141243112) q[53];
-cx q[21],q[53];
-ry(pi/2) q[54];
-rx(pi) q[54];
-cx q[24],q[54];
-rz(5.821743141243112) q[54];
-cx q[24],q[54];
-cx q[28],q[54];
-rz(5.821743141243112) q[54];
-cx q[28],q[54];
-rx(2.912230465699353) q[54];
-ry(pi/2) q[55];
-rx(pi) q[55];
-cx q[9],q[55];
-rz(5.821743141243112) q[55];
-cx q[9],q[55];
-cx q[15],q[55];
-rz(5.821743141243112) q[55];
-cx q[15],q[55];
-rx(2.912230465699353) q[55];
-ry(pi/2) q[56];
-rx(pi) q[56];
-cx q[13],q[56];
-rz(5.821743141243112) q[56];
-cx q[13],q[56];
-cx q[45],q[56];
-rz(5.821743141243112) q[56];
-cx q[45],q[56];
-rx(2.912230465699353) q[45];
-ry(pi/2) q[57];
-rx(pi) q[57];
-cx q[1],q[57];
-rz(5.821743141243112) q[57];
-cx q[1],q[57];
-cx q[3],q[57];
-rz(5.821743141243112) q[57];
-cx q[3],q[57];
-rx(2.912230465699353) q[57];
-ry(pi/2) q[58];
-rx(pi) q[58];
-cx q[24],q[58];
-rz(5.821743141243112) q[58];
-cx q[24],q[58];
-cx q[28],q[58];
-rz(5.821743141243112) q[58];
-cx q[28],q[58];
-rx(2.912230465699353) q[28];
-rx(2.912230465699353) q[58];
-ry(pi/2) q[59];
-rx(pi) q[59];
-cx q[16],q[59];
-rz(5.821743141243112) q[59];
-cx q[16],q[59];
-cx q[32],q[59];
-rz(5.821743141243112) q[59];
-cx q[32],q[59];
-ry(pi/2) q[60];
-rx(pi) q[60];
-cx q[1],q[60];
-rz(5.821743141243112) q[60];
-cx q[1],q[60];
-rx(2.912230465699353) q[1];
-cx q[7],q[60];
-rz(5.821743141243112) q[60];
-cx q[7],q[60];
-ry(pi/2) q[61];
-rx(pi) q[61];
-cx q[4],q[61];
-rz(5.821743141243112) q[61];
-cx q[4],q[61];
-rx(2.912230465699353) q[4];
-cx q[7],q[61];
-rz(5.821743141243112) q[61];
-cx q[7],q[61];
-rx(2.912230465699353) q[7];
-rx(2.912230465699353) q[61];
-ry(pi/2) q[62];
-rx(pi) q[62];
-cx q[0],q[62];
-rz(5.821743141243112) q[62];
-cx q[0],q[62];
-cx q[17],q[62];
-rz(5.821743141243112) q[62];
-cx q[17],q[62];
-rx(2.912230465699353) q[62];
-ry(pi/2) q[63];
-rx(pi) q[63];
-cx q[12],q[63];
-rz(5.821743141243112) q[63];
-cx q[12],q[63];
-rx(2.912230465699353) q[12];
-cx q[17],q[63];
-rz(5.821743141243112) q[63];
-cx q[17],q[63];
-ry(pi/2) q[64];
-rx(pi) q[64];
-cx q[0],q[64];
-rz(5.821743141243112) q[64];
-cx q[0],q[64];
-cx q[10],q[64];
-rz(5.821743141243112) q[64];
-cx q[10],q[64];
-rx(2.912230465699353) q[10];
-rx(2.912230465699353) q[64];
-ry(pi/2) q[65];
-rx(pi) q[65];
-cx q[5],q[65];
-rz(5.821743141243112) q[65];
-cx q[5],q[65];
-cx q[23],q[65];
-rz(5.821743141243112) q[65];
-cx q[23],q[65];
-rx(2.912230465699353) q[23];
-rx(2.912230465699353) q[65];
-ry(pi/2) q[66];
-rx(pi) q[66];
-cx q[17],q[66];
-rz(5.821743141243112) q[66];
-cx q[17],q[66];
-rx(2.912230465699353) q[17];
-cx q[47],q[66];
-rz(5.821743141243112) q[66];
-cx q[47],q[66];
-rx(2.912230465699353) q[47];
-rx(2.912230465699353) q[66];
-ry(pi/2) q[67];
-rx(pi) q[67];
-cx q[41],q[67];
-rz(5.821743141243112) q[67];
-cx q[41],q[67];
-rx(2.912230465699353) q[41];
-cx q[56],q[67];
-rz(5.821743141243112) q[67];
-cx q[56],q[67];
-rx(2.912230465699353) q[67];
-ry(pi/2) q[68];
-rx(pi) q[68];
-cx q[13],q[68];
-rz(5.821743141243112) q[68];
-cx q[13],q[68];
-rx(2.912230465699353) q[13];
-cx q[32],q[68];
-rz(5.821743141243112) q[68];
-cx q[32],q[68];
-rx(2.912230465699353) q[32];
-ry(pi/2) q[69];
-rx(pi) q[69];
-cx q[6],q[69];
-rz(5.821743141243112) q[69];
-cx q[6],q[69];
-cx q[59],q[69];
-rz(5.821743141243112) q[69];
-cx q[59],q[69];
-rx(2.912230465699353) q[69];
-ry(pi/2) q[70];
-rx(pi) q[70];
-cx q[3],q[70];
-rz(5.821743141243112) q[70];
-cx q[3],q[70];
-cx q[15],q[70];
-rz(5.821743141243112) q[70];
-cx q[15],q[70];
-ry(pi/2) q[71];
-rx(pi) q[71];
-cx q[3],q[71];
-rz(5.821743141243112) q[71];
-cx q[3],q[71];
-cx q[53],q[71];
-rz(5.821743141243112) q[71];
-cx q[53],q[71];
-rx(2.912230465699353) q[71];
-ry(pi/2) q[72];
-rx(pi) q[72];
-cx q[27],q[72];
-rz(5.821743141243112) q[72];
-cx q[27],q[72];
-rx(2.912230465699353) q[27];
-cx q[44],q[72];
-rz(5.821743141243112) q[72];
-cx q[44],q[72];
-rx(2.912230465699353) q[44];
-rx(2.912230465699353) q[72];
-ry(pi/2) q[73];
-rx(pi) q[73];
-cx q[16],q[73];
-rz(5.821743141243112) q[73];
-cx q[16],q[73];
-rx(2.912230465699353) q[16];
-cx q[59],q[73];
-rz(5.821743141243112) q[73];
-cx q[59],q[73];
-ry(pi/2) q[74];
-rx(pi) q[74];
-cx q[56],q[74];
-rz(5.821743141243112) q[74];
-cx q[56],q[74];
-cx q[63],q[74];
-rz(5.821743141243112) q[74];
-cx q[63],q[74];
-rx(2.912230465699353) q[63];
-rx(2.912230465699353) q[74];
-ry(pi/2) q[75];
-rx(pi) q[75];
-cx q[0],q[75];
-rz(5.821743141243112) q[75];
-cx q[0],q[75];
-cx q[21],q[75];
-rz(5.821743141243112) q[75];
-cx q[21],q[75];
-rx(2.912230465699353) q[75];
-ry(pi/2) q[76];
-rx(pi) q[76];
-cx q[5],q[76];
-rz(5.821743141243112) q[76];
-cx q[5],q[76];
-rx(2.912230465699353) q[5];
-cx q[6],q[76];
-rz(5.821743141243112) q[76];
-cx q[6],q[76];
-rx(2.912230465699353) q[76];
-ry(pi/2) q[77];
-rx(pi) q[77];
-cx q[3],q[77];
-rz(5.821743141243112) q[77];
-cx q[3],q[77];
-rx(2.912230465699353) q[3];
-cx q[30],q[77];
-rz(5.821743141243112) q[77];
-cx q[30],q[77];
-rx(2.912230465699353) q[30];
-ry(pi/2) q[78];
-rx(pi) q[78];
-cx q[42],q[78];
-rz(5.821743141243112) q[78];
-cx q[42],q[78];
-rx(2.912230465699353) q[42];
-cx q[60],q[78];
-rz(5.821743141243112) q[78];
-cx q[60],q[78];
-rx(2.912230465699353) q[60];
-rx(2.912230465699353) q[78];
-ry(pi/2) q[79];
-rx(pi) q[79];
-cx q[6],q[79];
-rz(5.821743141243112) q[79];
-cx q[6],q[79];
-rx(2.912230465699353) q[6];
-cx q[50],q[79];
-rz(5.821743141243112) q[79];
-cx q[50],q[79];
-rx(2.912230465699353) q[50];
-rx(2.912230465699353) q[79];
-ry(pi/2) q[80];
-rx(pi) q[80];
-cx q[9],q[80];
-rz(5.821743141243112) q[80];
-cx q[9],q[80];
-rx(2.912230465699353) q[9];
-cx q[15],q[80];
-rz(5.821743141243112) q[80];
-cx q[15],q[80];
-rx(2.912230465699353) q[15];
-rx(2.912230465699353) q[80];
-ry(pi/2) q[81];
-rx(pi) q[81];
-cx q[21],q[81];
-rz(5.821743141243112) q[81];
-cx q[21],q[81];
-rx(2.912230465699353) q[21];
-cx q[77],q[81];
-rz(5.821743141243112) q[81];
-cx q[77],q[81];
-rx(2.912230465699353) q[77];
-rx(2.912230465699353) q[81];
-ry(pi/2) q[82];
-rx(pi) q[82];
-cx q[0],q[82];
-rz(5.821743141243112) q[82];
-cx q[0],q[82];
-rx(2.912230465699353) q[0];
-cx q[0],q[1];
-rz(3.513099196263153) q[1];
-cx q[0],q[1];
-cx q[0],q[2];
-rz(3.513099196263153) q[2];
-cx q[0],q[2];
-cx q[0],q[3];
-rx(2.8350681484791953) q[2];
-rz(3.513099196263153) q[3];
-cx q[0],q[3];
-cx q[0],q[15];
-cx q[1],q[3];
-rz(3.513099196263153) q[3];
-cx q[1],q[3];
-cx q[1],q[4];
-rz(3.513099196263153) q[4];
-cx q[1],q[4];
-cx q[1],q[5];
-cx q[3],q[4];
-rz(3.513099196263153) q[4];
-cx q[3],q[4];
-cx q[4],q[6];
-rz(3.513099196263153) q[5];
-cx q[1],q[5];
-cx q[1],q[9];
-cx q[3],q[5];
-rz(3.513099196263153) q[5];
-cx q[3],q[5];
-cx q[3],q[7];
-rz(3.513099196263153) q[6];
-cx q[4],q[6];
-cx q[5],q[6];
-rz(3.513099196263153) q[6];
-cx q[5],q[6];
-rz(3.513099196263153) q[7];
-cx q[3],q[7];
-cx q[4],q[7];
-rz(3.513099196263153) q[7];
-cx q[4],q[7];
-cx q[4],q[10];
-rz(3.513099196263153) q[9];
-cx q[1],q[9];
-cx q[1],q[17];
-rz(3.513099196263153) q[10];
-cx q[4],q[10];
-cx q[4],q[13];
-cx q[6],q[10];
-rz(3.513099196263153) q[10];
-cx q[6],q[10];
-rz(3.513099196263153) q[13];
-cx q[4],q[13];
-rz(3.513099196263153) q[15];
-cx q[0],q[15];
-cx q[0],q[16];
-rz(3.513099196263153) q[16];
-cx q[0],q[16];
-cx q[0],q[20];
-rz(3.513099196263153) q[17];
-cx q[1],q[17];
-cx q[1],q[28];
-rz(3.513099196263153) q[20];
-cx q[0],q[20];
-cx q[0],q[32];
-rz(3.513099196263153) q[28];
-cx q[1],q[28];
-cx q[1],q[29];
-rz(3.513099196263153) q[29];
-cx q[1],q[29];
-cx q[1],q[45];
-rz(3.513099196263153) q[32];
-cx q[0],q[32];
-cx q[0],q[42];
-rz(3.513099196263153) q[42];
-cx q[0],q[42];
-cx q[0],q[48];
-rz(3.513099196263153) q[45];
-cx q[1],q[45];
-cx q[1],q[57];
-rz(3.513099196263153) q[48];
-cx q[0],q[48];
-cx q[0],q[51];
-rz(3.513099196263153) q[51];
-cx q[0],q[51];
-cx q[0],q[62];
-cx q[56],q[82];
-rz(3.513099196263153) q[57];
-cx q[1],q[57];
-cx q[1],q[60];
-rz(3.513099196263153) q[60];
-cx q[1],q[60];
-rx(2.8350681484791953) q[1];
-rz(3.513099196263153) q[62];
-cx q[0],q[62];
-cx q[0],q[64];
-rz(3.513099196263153) q[64];
-cx q[0],q[64];
-cx q[0],q[75];
-rz(3.513099196263153) q[75];
-cx q[0],q[75];
-rz(5.821743141243112) q[82];
-cx q[56],q[82];
-rx(2.912230465699353) q[56];
-rx(2.912230465699353) q[82];
-cx q[0],q[82];
-rz(3.513099196263153) q[82];
-cx q[0],q[82];
-rx(2.8350681484791953) q[0];
-cx q[0],q[1];
-rz(6.088738324346461) q[1];
-cx q[0],q[1];
-cx q[0],q[2];
-rz(6.088738324346461) q[2];
-cx q[0],q[2];
-rx(5.988137898250979) q[2];
-ry(pi/2) q[83];
-rx(pi) q[83];
-cx q[8],q[83];
-rz(5.821743141243112) q[83];
-cx q[8],q[83];
-rx(2.912230465699353) q[8];
-cx q[3],q[8];
-rz(3.513099196263153) q[8];
-cx q[3],q[8];
-cx q[3],q[9];
-cx q[5],q[8];
-rz(3.513099196263153) q[8];
-cx q[5],q[8];
-cx q[5],q[11];
-rz(3.513099196263153) q[9];
-cx q[3],q[9];
-cx q[3],q[12];
-rz(3.513099196263153) q[11];
-cx q[5],q[11];
-cx q[6],q[11];
-rz(3.513099196263153) q[11];
-cx q[6],q[11];
-rx(2.8350681484791953) q[11];
-rz(3.513099196263153) q[12];
-cx q[3],q[12];
-cx q[3],q[14];
-cx q[5],q[12];
-rz(3.513099196263153) q[12];
-cx q[5],q[12];
-cx q[5],q[13];
-rz(3.513099196263153) q[13];
-cx q[5],q[13];
-rz(3.513099196263153) q[14];
-cx q[3],q[14];
-cx q[3],q[15];
-cx q[4],q[14];
-rz(3.513099196263153) q[14];
-cx q[4],q[14];
-rx(2.8350681484791953) q[14];
-rz(3.513099196263153) q[15];
-cx q[3],q[15];
-cx q[3],q[16];
-cx q[15],q[20];
-rz(3.513099196263153) q[16];
-cx q[3],q[16];
-cx q[3],q[17];
-cx q[16],q[45];
-rz(3.513099196263153) q[17];
-cx q[3],q[17];
-cx q[3],q[18];
-rz(3.513099196263153) q[18];
-cx q[3],q[18];
-cx q[3],q[19];
-cx q[4],q[18];
-rz(3.513099196263153) q[18];
-cx q[4],q[18];
-cx q[4],q[21];
-rz(3.513099196263153) q[19];
-cx q[3],q[19];
-cx q[3],q[22];
-cx q[7],q[19];
-rz(3.513099196263153) q[19];
-cx q[7],q[19];
-cx q[7],q[60];
-cx q[19],q[38];
-rz(3.513099196263153) q[20];
-cx q[15],q[20];
-rz(3.513099196263153) q[21];
-cx q[4],q[21];
-cx q[4],q[27];
-cx q[15],q[21];
-rz(3.513099196263153) q[21];
-cx q[15],q[21];
-cx q[15],q[36];
-rz(3.513099196263153) q[22];
-cx q[3],q[22];
-cx q[3],q[23];
-cx q[9],q[22];
-rz(3.513099196263153) q[22];
-cx q[9],q[22];
-cx q[9],q[55];
-rx(2.8350681484791953) q[22];
-rz(3.513099196263153) q[23];
-cx q[3],q[23];
-cx q[17],q[23];
-rz(3.513099196263153) q[23];
-cx q[17],q[23];
-rz(3.513099196263153) q[27];
-cx q[4],q[27];
-cx q[4],q[47];
-cx q[6],q[27];
-rz(3.513099196263153) q[27];
-cx q[6],q[27];
-cx q[6],q[69];
-rz(3.513099196263153) q[36];
-cx q[15],q[36];
-cx q[20],q[36];
-rz(3.513099196263153) q[36];
-cx q[20],q[36];
-rx(2.8350681484791953) q[36];
-rz(3.513099196263153) q[38];
-cx q[19],q[38];
-rx(2.8350681484791953) q[19];
-rz(3.513099196263153) q[45];
-cx q[16],q[45];
-rz(3.513099196263153) q[47];
-cx q[4],q[47];
-cx q[17],q[47];
-rz(3.513099196263153) q[47];
-cx q[17],q[47];
-rz(3.513099196263153) q[55];
-cx q[9],q[55];
-cx q[9],q[80];
-cx q[15],q[55];
-rz(3.513099196263153) q[55];
-cx q[15],q[55];
-rx(2.8350681484791953) q[55];
-rz(3.513099196263153) q[60];
-cx q[7],q[60];
-cx q[68],q[83];
-rz(3.513099196263153) q[69];
-cx q[6],q[69];
-rz(3.513099196263153) q[80];
-cx q[9],q[80];
-rx(2.8350681484791953) q[9];
-rz(5.821743141243112) q[83];
-cx q[68],q[83];
-rx(2.912230465699353) q[68];
-rx(2.912230465699353) q[83];
-cx q[8],q[83];
-rz(3.513099196263153) q[83];
-cx q[8],q[83];
-rx(2.8350681484791953) q[8];
-ry(pi/2) q[84];
-rx(pi) q[84];
-cx q[70],q[84];
-rz(5.821743141243112) q[84];
-cx q[70],q[84];
-rx(2.912230465699353) q[70];
-cx q[73],q[84];
-rz(5.821743141243112) q[84];
-cx q[73],q[84];
-rx(2.912230465699353) q[73];
-rx(2.912230465699353) q[84];
-ry(pi/2) q[85];
-rx(pi) q[85];
-cx q[37],q[85];
-rz(5.821743141243112) q[85];
-cx q[37],q[85];
-rx(2.912230465699353) q[37];
-cx q[10],q[37];
-rz(3.513099196263153) q[37];
-cx q[10],q[37];
-cx q[10],q[41];
-rz(3.513099196263153) q[41];
-cx q[10],q[41];
-cx q[27],q[41];
-rz(3.513099196263153) q[41];
-cx q[27],q[41];
-cx q[27],q[72];
-cx q[41],q[67];
-cx q[59],q[85];
-rz(3.513099196263153) q[67];
-cx q[41],q[67];
-rx(2.8350681484791953) q[41];
-rz(3.513099196263153) q[72];
-cx q[27],q[72];
-rx(2.8350681484791953) q[27];
-rz(5.821743141243112) q[85];
-cx q[59],q[85];
-rx(2.912230465699353) q[59];
-cx q[16],q[59];
-rz(3.513099196263153) q[59];
-cx q[16],q[59];
-cx q[16],q[73];
-rz(3.513099196263153) q[73];
-cx q[16],q[73];
-rx(2.8350681484791953) q[16];
-rx(2.912230465699353) q[85];
-ry(pi/2) q[86];
-rx(pi) q[86];
-cx q[24],q[86];
-rz(5.821743141243112) q[86];
-cx q[24],q[86];
-rx(2.912230465699353) q[24];
-cx q[3],q[24];
-rz(3.513099196263153) q[24];
-cx q[3],q[24];
-cx q[3],q[25];
-cx q[5],q[24];
-rz(3.513099196263153) q[24];
-cx q[5],q[24];
-cx q[5],q[33];
-cx q[24],q[54];
-rz(3.513099196263153) q[25];
-cx q[3],q[25];
-cx q[3],q[26];
-cx q[12],q[25];
-rz(3.513099196263153) q[25];
-cx q[12],q[25];
-cx q[12],q[31];
-rx(2.8350681484791953) q[25];
-rz(3.513099196263153) q[26];
-cx q[3],q[26];
-cx q[3],q[28];
-cx q[21],q[26];
-rz(3.513099196263153) q[26];
-cx q[21],q[26];
-cx q[21],q[32];
-rz(3.513099196263153) q[28];
-cx q[3],q[28];
-cx q[3],q[29];
-cx q[28],q[51];
-rz(3.513099196263153) q[29];
-cx q[3],q[29];
-cx q[3],q[30];
-rx(2.8350681484791953) q[29];
-rz(3.513099196263153) q[30];
-cx q[3],q[30];
-cx q[3],q[34];
-cx q[18],q[30];
-rz(3.513099196263153) q[30];
-cx q[18],q[30];
-rx(2.8350681484791953) q[18];
-rz(3.513099196263153) q[31];
-cx q[12],q[31];
-cx q[26],q[31];
-rz(3.513099196263153) q[31];
-cx q[26],q[31];
-rx(2.8350681484791953) q[26];
-rx(2.8350681484791953) q[31];
-rz(3.513099196263153) q[32];
-cx q[21],q[32];
-cx q[21],q[38];
-rz(3.513099196263153) q[33];
-cx q[5],q[33];
-cx q[5],q[46];
-cx q[30],q[33];
-rz(3.513099196263153) q[33];
-cx q[30],q[33];
-cx q[30],q[48];
-rx(2.8350681484791953) q[33];
-rz(3.513099196263153) q[34];
-cx q[3],q[34];
-cx q[3],q[35];
-cx q[12],q[34];
-rz(3.513099196263153) q[34];
-cx q[12],q[34];
-cx q[34],q[37];
-rz(3.513099196263153) q[35];
-cx q[3],q[35];
-cx q[3],q[39];
-cx q[32],q[35];
-rz(3.513099196263153) q[35];
-cx q[32],q[35];
-cx q[32],q[59];
-rx(2.8350681484791953) q[35];
-rz(3.513099196263153) q[37];
-cx q[34],q[37];
-rx(2.8350681484791953) q[34];
-cx q[37],q[85];
-rz(3.513099196263153) q[38];
-cx q[21],q[38];
-rz(3.513099196263153) q[39];
-cx q[3],q[39];
-cx q[3],q[40];
-cx q[13],q[39];
-rz(3.513099196263153) q[39];
-cx q[13],q[39];
-cx q[13],q[56];
-rx(2.8350681484791953) q[39];
-rz(3.513099196263153) q[40];
-cx q[3],q[40];
-cx q[3],q[42];
-cx q[23],q[40];
-rz(3.513099196263153) q[40];
-cx q[23],q[40];
-rx(2.8350681484791953) q[40];
-rz(3.513099196263153) q[42];
-cx q[3],q[42];
-cx q[3],q[43];
-cx q[42],q[78];
-rz(3.513099196263153) q[43];
-cx q[3],q[43];
-cx q[3],q[44];
-cx q[20],q[43];
-rz(3.513099196263153) q[43];
-cx q[20],q[43];
-rx(2.8350681484791953) q[20];
-rx(2.8350681484791953) q[43];
-rz(3.513099196263153) q[44];
-cx q[3],q[44];
-cx q[3],q[49];
-cx q[12],q[44];
-rz(3.513099196263153) q[44];
-cx q[12],q[44];
-cx q[44],q[72];
-rz(3.513099196263153) q[46];
-cx q[5],q[46];
-cx q[5],q[65];
-cx q[38],q[46];
-rz(3.513099196263153) q[46];
-cx q[38],q[46];
-rx(2.8350681484791953) q[38];
-rx(2.8350681484791953) q[46];
-rz(3.513099196263153) q[48];
-cx q[30],q[48];
-rx(2.8350681484791953) q[48];
-rz(3.513099196263153) q[49];
-cx q[3],q[49];
-cx q[3],q[50];
-cx q[4],q[49];
-rz(3.513099196263153) q[49];
-cx q[4],q[49];
-cx q[4],q[61];
-rx(2.8350681484791953) q[49];
-rz(3.513099196263153) q[50];
-cx q[3],q[50];
-cx q[3],q[52];
-cx q[12],q[50];
-rz(3.513099196263153) q[50];
-cx q[12],q[50];
-cx q[12],q[63];
-rz(3.513099196263153) q[51];
-cx q[28],q[51];
-rx(2.8350681484791953) q[51];
-rz(3.513099196263153) q[52];
-cx q[3],q[52];
-cx q[3],q[57];
-cx q[10],q[52];
-rz(3.513099196263153) q[52];
-cx q[10],q[52];
-cx q[10],q[64];
-rx(2.8350681484791953) q[52];
-cx q[53],q[86];
-rz(3.513099196263153) q[54];
-cx q[24],q[54];
-cx q[24],q[58];
-cx q[28],q[54];
-rz(3.513099196263153) q[54];
-cx q[28],q[54];
-rx(2.8350681484791953) q[54];
-rz(3.513099196263153) q[56];
-cx q[13],q[56];
-cx q[13],q[68];
-cx q[45],q[56];
-rz(3.513099196263153) q[56];
-cx q[45],q[56];
-rx(2.8350681484791953) q[45];
-cx q[56],q[67];
-rz(3.513099196263153) q[57];
-cx q[3],q[57];
-cx q[3],q[70];
-rx(2.8350681484791953) q[57];
-rz(3.513099196263153) q[58];
-cx q[24],q[58];
-cx q[28],q[58];
-rz(3.513099196263153) q[58];
-cx q[28],q[58];
-rx(2.8350681484791953) q[28];
-rx(2.8350681484791953) q[58];
-rz(3.513099196263153) q[59];
-cx q[32],q[59];
-cx q[59],q[69];
-rz(3.513099196263153) q[61];
-cx q[4],q[61];
-rx(2.8350681484791953) q[4];
-cx q[7],q[61];
-rz(3.513099196263153) q[61];
-cx q[7],q[61];
-rx(2.8350681484791953) q[7];
-rx(2.8350681484791953) q[61];
-rz(3.513099196263153) q[63];
-cx q[12],q[63];
-rx(2.8350681484791953) q[12];
-rz(3.513099196263153) q[64];
-cx q[10],q[64];
-rx(2.8350681484791953) q[10];
-rx(2.8350681484791953) q[64];
-rz(3.513099196263153) q[65];
-cx q[5],q[65];
-cx q[5],q[76];
-cx q[23],q[65];
-rz(3.513099196263153) q[65];
-cx q[23],q[65];
-rx(2.8350681484791953) q[23];
-rx(2.8350681484791953) q[65];
-rz(3.513099196263153) q[67];
-cx q[56],q[67];
-cx q[56],q[74];
-rx(2.8350681484791953) q[67];
-rz(3.513099196263153) q[68];
-cx q[13],q[68];
-rx(2.8350681484791953) q[13];
-cx q[32],q[68];
-rz(3.513099196263153) q[68];
-cx q[32],q[68];
-rx(2.8350681484791953) q[32];
-cx q[68],q[83];
-rz(3.513099196263153) q[69];
-cx q[59],q[69];
-cx q[59],q[73];
-rx(2.8350681484791953) q[69];
-rz(3.513099196263153) q[70];
-cx q[3],q[70];
-cx q[3],q[71];
-cx q[15],q[70];
-rz(3.513099196263153) q[70];
-cx q[15],q[70];
-cx q[15],q[80];
-cx q[70],q[84];
-rz(3.513099196263153) q[71];
-cx q[3],q[71];
-cx q[3],q[77];
-rz(3.513099196263153) q[72];
-cx q[44],q[72];
-rx(2.8350681484791953) q[44];
-rx(2.8350681484791953) q[72];
-rz(3.513099196263153) q[73];
-cx q[59],q[73];
-rz(3.513099196263153) q[74];
-cx q[56],q[74];
-cx q[56],q[82];
-rz(3.513099196263153) q[76];
-cx q[5],q[76];
-rx(2.8350681484791953) q[5];
-cx q[6],q[76];
-rz(3.513099196263153) q[76];
-cx q[6],q[76];
-cx q[6],q[79];
-rx(2.8350681484791953) q[76];
-rz(3.513099196263153) q[77];
-cx q[3],q[77];
-rx(2.8350681484791953) q[3];
-cx q[0],q[3];
-rz(6.088738324346461) q[3];
-cx q[0],q[3];
-cx q[1],q[3];
-rz(6.088738324346461) q[3];
-cx q[1],q[3];
-cx q[1],q[4];
-rz(6.088738324346461) q[4];
-cx q[1],q[4];
-cx q[1],q[5];
-cx q[3],q[4];
-rz(6.088738324346461) q[4];
-cx q[3],q[4];
-rz(6.088738324346461) q[5];
-cx q[1],q[5];
-cx q[1],q[9];
-cx q[3],q[5];
-rz(6.088738324346461) q[5];
-cx q[3],q[5];
-cx q[3],q[7];
-rz(6.088738324346461) q[7];
-cx q[3],q[7];
-cx q[3],q[8];
-rz(6.088738324346461) q[8];
-cx q[3],q[8];
-rz(6.088738324346461) q[9];
-cx q[1],q[9];
-cx q[3],q[9];
-rz(6.088738324346461) q[9];
-cx q[3],q[9];
-cx q[3],q[12];
-rz(6.088738324346461) q[12];
-cx q[3],q[12];
-cx q[3],q[14];
-rz(6.088738324346461) q[14];
-cx q[3],q[14];
-cx q[30],q[77];
-rz(3.513099196263153) q[77];
-cx q[30],q[77];
-rx(2.8350681484791953) q[30];
-rz(3.513099196263153) q[78];
-cx q[42],q[78];
-rx(2.8350681484791953) q[42];
-cx q[60],q[78];
-rz(3.513099196263153) q[78];
-cx q[60],q[78];
-rx(2.8350681484791953) q[60];
-rx(2.8350681484791953) q[78];
-rz(3.513099196263153) q[79];
-cx q[6],q[79];
-rx(2.8350681484791953) q[6];
-cx q[4],q[6];
-rz(6.088738324346461) q[6];
-cx q[4],q[6];
-cx q[4],q[7];
-cx q[5],q[6];
-rz(6.088738324346461) q[6];
-cx q[5],q[6];
-cx q[5],q[8];
-rz(6.088738324346461) q[7];
-cx q[4],q[7];
-cx q[4],q[10];
-rz(6.088738324346461) q[8];
-cx q[5],q[8];
-cx q[5],q[11];
-rz(6.088738324346461) q[10];
-cx q[4],q[10];
-cx q[4],q[13];
-cx q[6],q[10];
-rz(6.088738324346461) q[10];
-cx q[6],q[10];
-rz(6.088738324346461) q[11];
-cx q[5],q[11];
-cx q[5],q[12];
-cx q[6],q[11];
-rz(6.088738324346461) q[11];
-cx q[6],q[11];
-rx(5.988137898250979) q[11];
-rz(6.088738324346461) q[12];
-cx q[5],q[12];
-rz(6.088738324346461) q[13];
-cx q[4],q[13];
-cx q[4],q[14];
-cx q[5],q[13];
-rz(6.088738324346461) q[13];
-cx q[5],q[13];
-rz(6.088738324346461) q[14];
-cx q[4],q[14];
-rx(5.988137898250979) q[14];
-cx q[50],q[79];
-rz(3.513099196263153) q[79];
-cx q[50],q[79];
-rx(2.8350681484791953) q[50];
-rx(2.8350681484791953) q[79];
-rz(3.513099196263153) q[80];
-cx q[15],q[80];
-rx(2.8350681484791953) q[15];
-cx q[0],q[15];
-rz(6.088738324346461) q[15];
-cx q[0],q[15];
-cx q[0],q[16];
-cx q[3],q[15];
-rz(6.088738324346461) q[15];
-cx q[3],q[15];
-rz(6.088738324346461) q[16];
-cx q[0],q[16];
-cx q[0],q[20];
-cx q[3],q[16];
-rz(6.088738324346461) q[16];
-cx q[3],q[16];
-rz(6.088738324346461) q[20];
-cx q[0],q[20];
-cx q[0],q[32];
-cx q[15],q[20];
-rz(6.088738324346461) q[20];
-cx q[15],q[20];
-rz(6.088738324346461) q[32];
-cx q[0],q[32];
-cx q[0],q[42];
-rz(6.088738324346461) q[42];
-cx q[0],q[42];
-cx q[0],q[48];
-rz(6.088738324346461) q[48];
-cx q[0],q[48];
-cx q[0],q[51];
-rz(6.088738324346461) q[51];
-cx q[0],q[51];
-rx(2.8350681484791953) q[80];
-rz(3.513099196263153) q[82];
-cx q[56],q[82];
-rx(2.8350681484791953) q[56];
-rx(2.8350681484791953) q[82];
-rz(3.513099196263153) q[83];
-cx q[68],q[83];
-rx(2.8350681484791953) q[68];
-rx(2.8350681484791953) q[83];
-cx q[8],q[83];
-rz(6.088738324346461) q[83];
-cx q[8],q[83];
-rx(5.988137898250979) q[8];
-rz(3.513099196263153) q[84];
-cx q[70],q[84];
-rx(2.8350681484791953) q[70];
-cx q[73],q[84];
-rz(3.513099196263153) q[84];
-cx q[73],q[84];
-rx(2.8350681484791953) q[73];
-rx(2.8350681484791953) q[84];
-rz(3.513099196263153) q[85];
-cx q[37],q[85];
-rx(2.8350681484791953) q[37];
-cx q[10],q[37];
-rz(6.088738324346461) q[37];
-cx q[10],q[37];
-cx q[10],q[41];
-rz(6.088738324346461) q[41];
-cx q[10],q[41];
-cx q[59],q[85];
-rz(3.513099196263153) q[85];
-cx q[59],q[85];
-rx(2.8350681484791953) q[59];
-rx(2.8350681484791953) q[85];
-rz(5.821743141243112) q[86];
-cx q[53],q[86];
-rx(2.912230465699353) q[53];
-cx q[17],q[53];
-rz(3.513099196263153) q[53];
-cx q[17],q[53];
-cx q[17],q[62];
-cx q[21],q[53];
-rz(3.513099196263153) q[53];
-cx q[21],q[53];
-cx q[21],q[75];
-cx q[53],q[71];
-rz(3.513099196263153) q[62];
-cx q[17],q[62];
-cx q[17],q[63];
-rx(2.8350681484791953) q[62];
-cx q[0],q[62];
-rz(6.088738324346461) q[62];
-cx q[0],q[62];
-cx q[0],q[64];
-rz(3.513099196263153) q[63];
-cx q[17],q[63];
-cx q[17],q[66];
-cx q[63],q[74];
-rz(6.088738324346461) q[64];
-cx q[0],q[64];
-rz(3.513099196263153) q[66];
-cx q[17],q[66];
-rx(2.8350681484791953) q[17];
-cx q[1],q[17];
-rz(6.088738324346461) q[17];
-cx q[1],q[17];
-cx q[1],q[28];
-cx q[3],q[17];
-rz(6.088738324346461) q[17];
-cx q[3],q[17];
-cx q[3],q[18];
-rz(6.088738324346461) q[18];
-cx q[3],q[18];
-cx q[3],q[19];
-cx q[4],q[18];
-rz(6.088738324346461) q[18];
-cx q[4],q[18];
-rz(6.088738324346461) q[19];
-cx q[3],q[19];
-cx q[3],q[22];
-cx q[7],q[19];
-rz(6.088738324346461) q[19];
-cx q[7],q[19];
-cx q[19],q[38];
-rz(6.088738324346461) q[22];
-cx q[3],q[22];
-cx q[3],q[23];
-cx q[9],q[22];
-rz(6.088738324346461) q[22];
-cx q[9],q[22];
-cx q[9],q[55];
-rx(5.988137898250979) q[22];
-rz(6.088738324346461) q[23];
-cx q[3],q[23];
-cx q[17],q[23];
-rz(6.088738324346461) q[23];
-cx q[17],q[23];
-rz(6.088738324346461) q[28];
-cx q[1],q[28];
-cx q[1],q[29];
-rz(6.088738324346461) q[29];
-cx q[1],q[29];
-cx q[1],q[45];
-rz(6.088738324346461) q[38];
-cx q[19],q[38];
-rx(5.988137898250979) q[19];
-rz(6.088738324346461) q[45];
-cx q[1],q[45];
-cx q[1],q[57];
-cx q[16],q[45];
-rz(6.088738324346461) q[45];
-cx q[16],q[45];
-cx q[16],q[59];
-cx q[47],q[66];
-rz(6.088738324346461) q[55];
-cx q[9],q[55];
-cx q[9],q[80];
-rz(6.088738324346461) q[57];
-cx q[1],q[57];
-cx q[1],q[60];
-rz(6.088738324346461) q[59];
-cx q[16],q[59];
-cx q[16],q[73];
-rz(6.088738324346461) q[60];
-cx q[1],q[60];
-rx(5.988137898250979) q[1];
-cx q[7],q[60];
-rz(6.088738324346461) q[60];
-cx q[7],q[60];
-rz(3.513099196263153) q[66];
-cx q[47],q[66];
-rx(2.8350681484791953) q[47];
-rx(2.8350681484791953) q[66];
-rz(3.513099196263153) q[71];
-cx q[53],q[71];
-rx(2.8350681484791953) q[71];
-rz(6.088738324346461) q[73];
-cx q[16],q[73];
-rx(5.988137898250979) q[16];
-rz(3.513099196263153) q[74];
-cx q[63],q[74];
-rx(2.8350681484791953) q[63];
-rx(2.8350681484791953) q[74];
-rz(3.513099196263153) q[75];
-cx q[21],q[75];
-cx q[21],q[81];
-rx(2.8350681484791953) q[75];
-cx q[0],q[75];
-rz(6.088738324346461) q[75];
-cx q[0],q[75];
-cx q[0],q[82];
-rz(6.088738324346461) q[80];
-cx q[9],q[80];
-rx(5.988137898250979) q[9];
-rz(3.513099196263153) q[81];
-cx q[21],q[81];
-rx(2.8350681484791953) q[21];
-cx q[4],q[21];
-rz(6.088738324346461) q[21];
-cx q[4],q[21];
-cx q[4],q[27];
-cx q[15],q[21];
-rz(6.088738324346461) q[21];
-cx q[15],q[21];
-cx q[15],q[36];
-rz(6.088738324346461) q[27];
-cx q[4],q[27];
-cx q[4],q[47];
-cx q[6],q[27];
-rz(6.088738324346461) q[27];
-cx q[6],q[27];
-cx q[6],q[69];
-cx q[27],q[41];
-rz(6.088738324346461) q[36];
-cx q[15],q[36];
-cx q[15],q[55];
-cx q[20],q[36];
-rz(6.088738324346461) q[36];
-cx q[20],q[36];
-rx(5.988137898250979) q[36];
-rz(6.088738324346461) q[41];
-cx q[27],q[41];
-cx q[27],q[72];
-cx q[41],q[67];
-rz(6.088738324346461) q[47];
-cx q[4],q[47];
-cx q[17],q[47];
-rz(6.088738324346461) q[47];
-cx q[17],q[47];
-rz(6.088738324346461) q[55];
-cx q[15],q[55];
-rx(5.988137898250979) q[55];
-rz(6.088738324346461) q[67];
-cx q[41],q[67];
-rx(5.988137898250979) q[41];
-rz(6.088738324346461) q[69];
-cx q[6],q[69];
-rz(6.088738324346461) q[72];
-cx q[27],q[72];
-rx(5.988137898250979) q[27];
-cx q[77],q[81];
-rz(3.513099196263153) q[81];
-cx q[77],q[81];
-rx(2.8350681484791953) q[77];
-rx(2.8350681484791953) q[81];
-rz(6.088738324346461) q[82];
-cx q[0],q[82];
-rx(5.988137898250979) q[0];
-rx(2.912230465699353) q[86];
-cx q[24],q[86];
-rz(3.513099196263153) q[86];
-cx q[24],q[86];
-rx(2.8350681484791953) q[24];
-cx q[3],q[24];
-rz(6.088738324346461) q[24];
-cx q[3],q[24];
-cx q[3],q[25];
-cx q[5],q[24];
-rz(6.088738324346461) q[24];
-cx q[5],q[24];
-cx q[5],q[33];
-cx q[24],q[54];
-rz(6.088738324346461) q[25];
-cx q[3],q[25];
-cx q[3],q[26];
-cx q[12],q[25];
-rz(6.088738324346461) q[25];
-cx q[12],q[25];
-cx q[12],q[31];
-rx(5.988137898250979) q[25];
-rz(6.088738324346461) q[26];
-cx q[3],q[26];
-cx q[3],q[28];
-cx q[21],q[26];
-rz(6.088738324346461) q[26];
-cx q[21],q[26];
-cx q[21],q[32];
-rz(6.088738324346461) q[28];
-cx q[3],q[28];
-cx q[3],q[29];
-cx q[28],q[51];
-rz(6.088738324346461) q[29];
-cx q[3],q[29];
-cx q[3],q[30];
-rx(5.988137898250979) q[29];
-rz(6.088738324346461) q[30];
-cx q[3],q[30];
-cx q[3],q[34];
-cx q[18],q[30];
-rz(6.088738324346461) q[30];
-cx q[18],q[30];
-rx(5.988137898250979) q[18];
-rz(6.088738324346461) q[31];
-cx q[12],q[31];
-cx q[26],q[31];
-rz(6.088738324346461) q[31];
-cx q[26],q[31];
-rx(5.988137898250979) q[26];
-rx(5.988137898250979) q[31];
-rz(6.088738324346461) q[32];
-cx q[21],q[32];
-cx q[21],q[38];
-rz(6.088738324346461) q[33];
-cx q[5],q[33];
-cx q[5],q[46];
-cx q[30],q[33];
-rz(6.088738324346461) q[33];
-cx q[30],q[33];
-cx q[30],q[48];
-rx(5.988137898250979) q[33];
-rz(6.088738324346461) q[34];
-cx q[3],q[34];
-cx q[3],q[35];
-cx q[12],q[34];
-rz(6.088738324346461) q[34];
-cx q[12],q[34];
-cx q[34],q[37];
-rz(6.088738324346461) q[35];
-cx q[3],q[35];
-cx q[3],q[39];
-cx q[32],q[35];
-rz(6.088738324346461) q[35];
-cx q[32],q[35];
-cx q[32],q[59];
-rx(5.988137898250979) q[35];
-rz(6.088738324346461) q[37];
-cx q[34],q[37];
-rx(5.988137898250979) q[34];
-cx q[37],q[85];
-rz(6.088738324346461) q[38];
-cx q[21],q[38];
-rz(6.088738324346461) q[39];
-cx q[3],q[39];
-cx q[3],q[40];
-cx q[13],q[39];
-rz(6.088738324346461) q[39];
-cx q[13],q[39];
-cx q[13],q[56];
-rx(5.988137898250979) q[39];
-rz(6.088738324346461) q[40];
-cx q[3],q[40];
-cx q[3],q[42];
-cx q[23],q[40];
-rz(6.088738324346461) q[40];
-cx q[23],q[40];
-rx(5.988137898250979) q[40];
-rz(6.088738324346461) q[42];
-cx q[3],q[42];
-cx q[3],q[43];
-cx q[42],q[78];
-rz(6.088738324346461) q[43];
-cx q[3],q[43];
-cx q[3],q[44];
-cx q[20],q[43];
-rz(6.088738324346461) q[43];
-cx q[20],q[43];
-rx(5.988137898250979) q[20];
-rx(5.988137898250979) q[43];
-rz(6.088738324346461) q[44];
-cx q[3],q[44];
-cx q[3],q[49];
-cx q[12],q[44];
-rz(6.088738324346461) q[44];
-cx q[12],q[44];
-cx q[44],q[72];
-rz(6.088738324346461) q[46];
-cx q[5],q[46];
-cx q[5],q[65];
-cx q[38],q[46];
-rz(6.088738324346461) q[46];
-cx q[38],q[46];
-rx(5.988137898250979) q[38];
-rx(5.988137898250979) q[46];
-rz(6.088738324346461) q[48];
-cx q[30],q[48];
-rx(5.988137898250979) q[48];
-rz(6.088738324346461) q[49];
-cx q[3],q[49];
-cx q[3],q[50];
-cx q[4],q[49];
-rz(6.088738324346461) q[49];
-cx q[4],q[49];
-cx q[4],q[61];
-rx(5.988137898250979) q[49];
-rz(6.088738324346461) q[50];
-cx q[3],q[50];
-cx q[3],q[52];
-cx q[12],q[50];
-rz(6.088738324346461) q[50];
-cx q[12],q[50];
-cx q[12],q[63];
-rz(6.088738324346461) q[51];
-cx q[28],q[51];
-rx(5.988137898250979) q[51];
-rz(6.088738324346461) q[52];
-cx q[3],q[52];
-cx q[3],q[57];
-cx q[10],q[52];
-rz(6.088738324346461) q[52];
-cx q[10],q[52];
-cx q[10],q[64];
-rx(5.988137898250979) q[52];
-cx q[53],q[86];
-rz(6.088738324346461) q[54];
-cx q[24],q[54];
-cx q[24],q[58];
-cx q[28],q[54];
-rz(6.088738324346461) q[54];
-cx q[28],q[54];
-rx(5.988137898250979) q[54];
-rz(6.088738324346461) q[56];
-cx q[13],q[56];
-cx q[13],q[68];
-cx q[45],q[56];
-rz(6.088738324346461) q[56];
-cx q[45],q[56];
-rx(5.988137898250979) q[45];
-cx q[56],q[67];
-rz(6.088738324346461) q[57];
-cx q[3],q[57];
-cx q[3],q[70];
-rx(5.988137898250979) q[57];
-rz(6.088738324346461) q[58];
-cx q[24],q[58];
-cx q[28],q[58];
-rz(6.088738324346461) q[58];
-cx q[28],q[58];
-rx(5.988137898250979) q[28];
-rx(5.988137898250979) q[58];
-rz(6.088738324346461) q[59];
-cx q[32],q[59];
-cx q[59],q[69];
-rz(6.088738324346461) q[61];
-cx q[4],q[61];
-rx(5.988137898250979) q[4];
-cx q[7],q[61];
-rz(6.088738324346461) q[61];
-cx q[7],q[61];
-rx(5.988137898250979) q[7];
-rx(5.988137898250979) q[61];
-rz(6.088738324346461) q[63];
-cx q[12],q[63];
-rx(5.988137898250979) q[12];
-rz(6.088738324346461) q[64];
-cx q[10],q[64];
-rx(5.988137898250979) q[10];
-rx(5.988137898250979) q[64];
-rz(6.088738324346461) q[65];
-cx q[5],q[65];
-cx q[5],q[76];
-cx q[23],q[65];
-rz(6.088738324346461) q[65];
-cx q[23],q[65];
-rx(5.988137898250979) q[23];
-rx(5.988137898250979) q[65];
-rz(6.088738324346461) q[67];
-cx q[56],q[67];
-cx q[56],q[74];
-rx(5.988137898250979) q[67];
-rz(6.088738324346461) q[68];
-cx q[13],q[68];
-rx(5.988137898250979) q[13];
-cx q[32],q[68];
-rz(6.088738324346461) q[68];
-cx q[32],q[68];
-rx(5.988137898250979) q[32];
-cx q[68],q[83];
-rz(6.088738324346461) q[69];
-cx q[59],q[69];
-cx q[59],q[73];
-rx(5.988137898250979) q[69];
-rz(6.088738324346461) q[70];
-cx q[3],q[70];
-cx q[3],q[71];
-cx q[15],q[70];
-rz(6.088738324346461) q[70];
-cx q[15],q[70];
-cx q[15],q[80];
-cx q[70],q[84];
-rz(6.088738324346461) q[71];
-cx q[3],q[71];
-cx q[3],q[77];
-rz(6.088738324346461) q[72];
-cx q[44],q[72];
-rx(5.988137898250979) q[44];
-rx(5.988137898250979) q[72];
-rz(6.088738324346461) q[73];
-cx q[59],q[73];
-rz(6.088738324346461) q[74];
-cx q[56],q[74];
-cx q[56],q[82];
-rz(6.088738324346461) q[76];
-cx q[5],q[76];
-rx(5.988137898250979) q[5];
-cx q[6],q[76];
-rz(6.088738324346461) q[76];
-cx q[6],q[76];
-cx q[6],q[79];
-rx(5.988137898250979) q[76];
-rz(6.088738324346461) q[77];
-cx q[3],q[77];
-rx(5.988137898250979) q[3];
-cx q[30],q[77];
-rz(6.088738324346461) q[77];
-cx q[30],q[77];
-rx(5.988137898250979) q[30];
-rz(6.088738324346461) q[78];
-cx q[42],q[78];
-rx(5.988137898250979) q[42];
-cx q[60],q[78];
-rz(6.088738324346461) q[78];
-cx q[60],q[78];
-rx(5.988137898250979) q[60];
-rx(5.988137898250979) q[78];
-rz(6.088738324346461) q[79];
-cx q[6],q[79];
-rx(5.988137898250979) q[6];
-cx q[50],q[79];
-rz(6.088738324346461) q[79];
-cx q[50],q[79];
-rx(5.988137898250979) q[50];
-rx(5.988137898250979) q[79];
-rz(6.088738324346461) q[80];
-cx q[15],q[80];
-rx(5.988137898250979) q[15];
-rx(5.988137898250979) q[80];
-rz(6.088738324346461) q[82];
-cx q[56],q[82];
-rx(5.988137898250979) q[56];
-rx(5.988137898250979) q[82];
-rz(6.088738324346461) q[83];
-cx q[68],q[83];
-rx(5.988137898250979) q[68];
-rx(5.988137898250979) q[83];
-rz(6.088738324346461) q[84];
-cx q[70],q[84];
-rx(5.988137898250979) q[70];
-cx q[73],q[84];
-rz(6.088738324346461) q[84];
-cx q[73],q[84];
-rx(5.988137898250979) q[73];
-rx(5.988137898250979) q[84];
-rz(6.088738324346461) q[85];
-cx q[37],q[85];
-rx(5.988137898250979) q[37];
-cx q[59],q[85];
-rz(6.088738324346461) q[85];
-cx q[59],q[85];
-rx(5.988137898250979) q[59];
-rx(5.988137898250979) q[85];
-rz(3.513099196263153) q[86];
-cx q[53],q[86];
-rx(2.8350681484791953) q[53];
-cx q[17],q[53];
-rz(6.088738324346461) q[53];
-cx q[17],q[53];
-cx q[17],q[62];
-cx q[21],q[53];
-rz(6.088738324346461) q[53];
-cx q[21],q[53];
-cx q[21],q[75];
-cx q[53],q[71];
-rz(6.088738324346461) q[62];
-cx q[17],q[62];
-cx q[17],q[63];
-rx(5.988137898250979) q[62];
-rz(6.088738324346461) q[63];
-cx q[17],q[63];
-cx q[17],q[66];
-cx q[63],q[74];
-rz(6.088738324346461) q[66];
-cx q[17],q[66];
-rx(5.988137898250979) q[17];
-cx q[47],q[66];
-rz(6.088738324346461) q[66];
-cx q[47],q[66];
-rx(5.988137898250979) q[47];
-rx(5.988137898250979) q[66];
-rz(6.088738324346461) q[71];
-cx q[53],q[71];
-rx(5.988137898250979) q[71];
-rz(6.088738324346461) q[74];
-cx q[63],q[74];
-rx(5.988137898250979) q[63];
-rx(5.988137898250979) q[74];
-rz(6.088738324346461) q[75];
-cx q[21],q[75];
-cx q[21],q[81];
-rx(5.988137898250979) q[75];
-rz(6.088738324346461) q[81];
-cx q[21],q[81];
-rx(5.988137898250979) q[21];
-cx q[77],q[81];
-rz(6.088738324346461) q[81];
-cx q[77],q[81];
-rx(5.988137898250979) q[77];
-rx(5.988137898250979) q[81];
-rx(2.8350681484791953) q[86];
-cx q[24],q[86];
-rz(6.088738324346461) q[86];
-cx q[24],q[86];
-rx(5.988137898250979) q[24];
-cx q[53],q[86];
-rz(6.088738324346461) q[86];
-cx q[53],q[86];
-rx(5.988137898250979) q[53];
-rx(5.988137898250979) q[86];
\ No newline at end of file
@@ -1,1991 +0,0 @@
-OPENQASM 2.0;
-include "qelib1.inc";
-qreg q[88];
-ry(pi/2) q[0];
-rx(pi) q[0];
-ry(pi/2) q[1];
-rx(pi) q[1];
-cx q[0],q[1];
-rz(5.166908153788953) q[1];
-cx q[0],q[1];
-ry(pi/2) q[2];
-rx(pi) q[2];
-cx q[0],q[2];
-rz(5.166908153788953) q[2];
-cx q[0],q[2];
-rx(0.519864779299322) q[2];
-ry(pi/2) q[3];
-rx(pi) q[3];
-cx q[0],q[3];
-rz(5.166908153788953) q[3];
-cx q[0],q[3];
-cx q[1],q[3];
-rz(5.166908153788953) q[3];
-cx q[1],q[3];
-ry(pi/2) q[4];
-rx(pi) q[4];
-cx q[1],q[4];
-rz(5.166908153788953) q[4];
-cx q[1],q[4];
-cx q[3],q[4];
-rz(5.166908153788953) q[4];
-cx q[3],q[4];
-ry(pi/2) q[5];
-rx(pi) q[5];
-cx q[1],q[5];
-rz(5.166908153788953) q[5];
-cx q[1],q[5];
-cx q[3],q[5];
-rz(5.166908153788953) q[5];
-cx q[3],q[5];
-ry(pi/2) q[6];
-rx(pi) q[6];
-cx q[4],q[6];
-rz(5.166908153788953) q[6];
-cx q[4],q[6];
-cx q[5],q[6];
-rz(5.166908153788953) q[6];
-cx q[5],q[6];
-ry(pi/2) q[7];
-rx(pi) q[7];
-cx q[3],q[7];
-rz(5.166908153788953) q[7];
-cx q[3],q[7];
-cx q[4],q[7];
-rz(5.166908153788953) q[7];
-cx q[4],q[7];
-ry(pi/2) q[8];
-rx(pi) q[8];
-cx q[3],q[8];
-rz(5.166908153788953) q[8];
-cx q[3],q[8];
-cx q[5],q[8];
-rz(5.166908153788953) q[8];
-cx q[5],q[8];
-ry(pi/2) q[9];
-rx(pi) q[9];
-cx q[1],q[9];
-rz(5.166908153788953) q[9];
-cx q[1],q[9];
-cx q[3],q[9];
-rz(5.166908153788953) q[9];
-cx q[3],q[9];
-ry(pi/2) q[10];
-rx(pi) q[10];
-cx q[4],q[10];
-rz(5.166908153788953) q[10];
-cx q[4],q[10];
-cx q[6],q[10];
-rz(5.166908153788953) q[10];
-cx q[6],q[10];
-ry(pi/2) q[11];
-rx(pi) q[11];
-cx q[5],q[11];
-rz(5.166908153788953) q[11];
-cx q[5],q[11];
-cx q[6],q[11];
-rz(5.166908153788953) q[11];
-cx q[6],q[11];
-rx(0.519864779299322) q[11];
-ry(pi/2) q[12];
-rx(pi) q[12];
-cx q[3],q[12];
-rz(5.166908153788953) q[12];
-cx q[3],q[12];
-cx q[5],q[12];
-rz(5.166908153788953) q[12];
-cx q[5],q[12];
-ry(pi/2) q[13];
-rx(pi) q[13];
-cx q[4],q[13];
-rz(5.166908153788953) q[13];
-cx q[4],q[13];
-cx q[5],q[13];
-rz(5.166908153788953) q[13];
-cx q[5],q[13];
-ry(pi/2) q[14];
-rx(pi) q[14];
-cx q[3],q[14];
-rz(5.166908153788953) q[14];
-cx q[3],q[14];
-cx q[4],q[14];
-rz(5.166908153788953) q[14];
-cx q[4],q[14];
-rx(0.519864779299322) q[14];
-ry(pi/2) q[15];
-rx(pi) q[15];
-cx q[0],q[15];
-rz(5.166908153788953) q[15];
-cx q[0],q[15];
-cx q[3],q[15];
-rz(5.166908153788953) q[15];
-cx q[3],q[15];
-ry(pi/2) q[16];
-rx(pi) q[16];
-cx q[0],q[16];
-rz(5.166908153788953) q[16];
-cx q[0],q[16];
-cx q[3],q[16];
-rz(5.166908153788953) q[16];
-cx q[3],q[16];
-ry(pi/2) q[17];
-rx(pi) q[17];
-cx q[1],q[17];
-rz(5.166908153788953) q[17];
-cx q[1],q[17];
-cx q[3],q[17];
-rz(5.166908153788953) q[17];
-cx q[3],q[17];
-ry(pi/2) q[18];
-rx(pi) q[18];
-cx q[3],q[18];
-rz(5.166908153788953) q[18];
-cx q[3],q[18];
-cx q[4],q[18];
-rz(5.166908153788953) q[18];
-cx q[4],q[18];
-ry(pi/2) q[19];
-rx(pi) q[19];
-cx q[3],q[19];
-rz(5.166908153788953) q[19];
-cx q[3],q[19];
-cx q[7],q[19];
-rz(5.166908153788953) q[19];
-cx q[7],q[19];
-ry(pi/2) q[20];
-rx(pi) q[20];
-cx q[0],q[20];
-rz(5.166908153788953) q[20];
-cx q[0],q[20];
-cx q[15],q[20];
-rz(5.166908153788953) q[20];
-cx q[15],q[20];
-ry(pi/2) q[21];
-rx(pi) q[21];
-cx q[4],q[21];
-rz(5.166908153788953) q[21];
-cx q[4],q[21];
-cx q[15],q[21];
-rz(5.166908153788953) q[21];
-cx q[15],q[21];
-ry(pi/2) q[22];
-rx(pi) q[22];
-cx q[3],q[22];
-rz(5.166908153788953) q[22];
-cx q[3],q[22];
-cx q[9],q[22];
-rz(5.166908153788953) q[22];
-cx q[9],q[22];
-rx(0.519864779299322) q[22];
-ry(pi/2) q[23];
-rx(pi) q[23];
-cx q[3],q[23];
-rz(5.166908153788953) q[23];
-cx q[3],q[23];
-cx q[17],q[23];
-rz(5.166908153788953) q[23];
-cx q[17],q[23];
-ry(pi/2) q[24];
-rx(pi) q[24];
-cx q[3],q[24];
-rz(5.166908153788953) q[24];
-cx q[3],q[24];
-cx q[5],q[24];
-rz(5.166908153788953) q[24];
-cx q[5],q[24];
-ry(pi/2) q[25];
-rx(pi) q[25];
-cx q[3],q[25];
-rz(5.166908153788953) q[25];
-cx q[3],q[25];
-cx q[12],q[25];
-rz(5.166908153788953) q[25];
-cx q[12],q[25];
-rx(0.519864779299322) q[25];
-ry(pi/2) q[26];
-rx(pi) q[26];
-cx q[3],q[26];
-rz(5.166908153788953) q[26];
-cx q[3],q[26];
-cx q[21],q[26];
-rz(5.166908153788953) q[26];
-cx q[21],q[26];
-ry(pi/2) q[27];
-rx(pi) q[27];
-cx q[4],q[27];
-rz(5.166908153788953) q[27];
-cx q[4],q[27];
-cx q[6],q[27];
-rz(5.166908153788953) q[27];
-cx q[6],q[27];
-ry(pi/2) q[28];
-rx(pi) q[28];
-cx q[1],q[28];
-rz(5.166908153788953) q[28];
-cx q[1],q[28];
-cx q[3],q[28];
-rz(5.166908153788953) q[28];
-cx q[3],q[28];
-ry(pi/2) q[29];
-rx(pi) q[29];
-cx q[1],q[29];
-rz(5.166908153788953) q[29];
-cx q[1],q[29];
-cx q[3],q[29];
-rz(5.166908153788953) q[29];
-cx q[3],q[29];
-rx(0.519864779299322) q[29];
-ry(pi/2) q[30];
-rx(pi) q[30];
-cx q[3],q[30];
-rz(5.166908153788953) q[30];
-cx q[3],q[30];
-cx q[18],q[30];
-rz(5.166908153788953) q[30];
-cx q[18],q[30];
-rx(0.519864779299322) q[18];
-ry(pi/2) q[31];
-rx(pi) q[31];
-cx q[12],q[31];
-rz(5.166908153788953) q[31];
-cx q[12],q[31];
-cx q[26],q[31];
-rz(5.166908153788953) q[31];
-cx q[26],q[31];
-rx(0.519864779299322) q[26];
-rx(0.519864779299322) q[31];
-ry(pi/2) q[32];
-rx(pi) q[32];
-cx q[0],q[32];
-rz(5.166908153788953) q[32];
-cx q[0],q[32];
-cx q[21],q[32];
-rz(5.166908153788953) q[32];
-cx q[21],q[32];
-ry(pi/2) q[33];
-rx(pi) q[33];
-cx q[5],q[33];
-rz(5.166908153788953) q[33];
-cx q[5],q[33];
-cx q[30],q[33];
-rz(5.166908153788953) q[33];
-cx q[30],q[33];
-rx(0.519864779299322) q[33];
-ry(pi/2) q[34];
-rx(pi) q[34];
-cx q[3],q[34];
-rz(5.166908153788953) q[34];
-cx q[3],q[34];
-cx q[12],q[34];
-rz(5.166908153788953) q[34];
-cx q[12],q[34];
-ry(pi/2) q[35];
-rx(pi) q[35];
-cx q[3],q[35];
-rz(5.166908153788953) q[35];
-cx q[3],q[35];
-cx q[32],q[35];
-rz(5.166908153788953) q[35];
-cx q[32],q[35];
-rx(0.519864779299322) q[35];
-ry(pi/2) q[36];
-rx(pi) q[36];
-cx q[15],q[36];
-rz(5.166908153788953) q[36];
-cx q[15],q[36];
-cx q[20],q[36];
-rz(5.166908153788953) q[36];
-cx q[20],q[36];
-rx(0.519864779299322) q[36];
-ry(pi/2) q[37];
-rx(pi) q[37];
-cx q[10],q[37];
-rz(5.166908153788953) q[37];
-cx q[10],q[37];
-cx q[34],q[37];
-rz(5.166908153788953) q[37];
-cx q[34],q[37];
-rx(0.519864779299322) q[34];
-ry(pi/2) q[38];
-rx(pi) q[38];
-cx q[19],q[38];
-rz(5.166908153788953) q[38];
-cx q[19],q[38];
-rx(0.519864779299322) q[19];
-cx q[21],q[38];
-rz(5.166908153788953) q[38];
-cx q[21],q[38];
-ry(pi/2) q[39];
-rx(pi) q[39];
-cx q[3],q[39];
-rz(5.166908153788953) q[39];
-cx q[3],q[39];
-cx q[13],q[39];
-rz(5.166908153788953) q[39];
-cx q[13],q[39];
-rx(0.519864779299322) q[39];
-ry(pi/2) q[40];
-rx(pi) q[40];
-cx q[3],q[40];
-rz(5.166908153788953) q[40];
-cx q[3],q[40];
-cx q[23],q[40];
-rz(5.166908153788953) q[40];
-cx q[23],q[40];
-rx(0.519864779299322) q[40];
-ry(pi/2) q[41];
-rx(pi) q[41];
-cx q[10],q[41];
-rz(5.166908153788953) q[41];
-cx q[10],q[41];
-cx q[27],q[41];
-rz(5.166908153788953) q[41];
-cx q[27],q[41];
-ry(pi/2) q[42];
-rx(pi) q[42];
-cx q[0],q[42];
-rz(5.166908153788953) q[42];
-cx q[0],q[42];
-cx q[3],q[42];
-rz(5.166908153788953) q[42];
-cx q[3],q[42];
-ry(pi/2) q[43];
-rx(pi) q[43];
-cx q[3],q[43];
-rz(5.166908153788953) q[43];
-cx q[3],q[43];
-cx q[20],q[43];
-rz(5.166908153788953) q[43];
-cx q[20],q[43];
-rx(0.519864779299322) q[20];
-rx(0.519864779299322) q[43];
-ry(pi/2) q[44];
-rx(pi) q[44];
-cx q[3],q[44];
-rz(5.166908153788953) q[44];
-cx q[3],q[44];
-cx q[12],q[44];
-rz(5.166908153788953) q[44];
-cx q[12],q[44];
-ry(pi/2) q[45];
-rx(pi) q[45];
-cx q[1],q[45];
-rz(5.166908153788953) q[45];
-cx q[1],q[45];
-cx q[16],q[45];
-rz(5.166908153788953) q[45];
-cx q[16],q[45];
-ry(pi/2) q[46];
-rx(pi) q[46];
-cx q[5],q[46];
-rz(5.166908153788953) q[46];
-cx q[5],q[46];
-cx q[38],q[46];
-rz(5.166908153788953) q[46];
-cx q[38],q[46];
-rx(0.519864779299322) q[38];
-rx(0.519864779299322) q[46];
-ry(pi/2) q[47];
-rx(pi) q[47];
-cx q[4],q[47];
-rz(5.166908153788953) q[47];
-cx q[4],q[47];
-cx q[17],q[47];
-rz(5.166908153788953) q[47];
-cx q[17],q[47];
-ry(pi/2) q[48];
-rx(pi) q[48];
-cx q[0],q[48];
-rz(5.166908153788953) q[48];
-cx q[0],q[48];
-cx q[30],q[48];
-rz(5.166908153788953) q[48];
-cx q[30],q[48];
-rx(0.519864779299322) q[48];
-ry(pi/2) q[49];
-rx(pi) q[49];
-cx q[3],q[49];
-rz(5.166908153788953) q[49];
-cx q[3],q[49];
-cx q[4],q[49];
-rz(5.166908153788953) q[49];
-cx q[4],q[49];
-rx(0.519864779299322) q[49];
-ry(pi/2) q[50];
-rx(pi) q[50];
-cx q[3],q[50];
-rz(5.166908153788953) q[50];
-cx q[3],q[50];
-cx q[12],q[50];
-rz(5.166908153788953) q[50];
-cx q[12],q[50];
-ry(pi/2) q[51];
-rx(pi) q[51];
-cx q[0],q[51];
-rz(5.166908153788953) q[51];
-cx q[0],q[51];
-cx q[28],q[51];
-rz(5.166908153788953) q[51];
-cx q[28],q[51];
-rx(0.519864779299322) q[51];
-ry(pi/2) q[52];
-rx(pi) q[52];
-cx q[3],q[52];
-rz(5.166908153788953) q[52];
-cx q[3],q[52];
-cx q[10],q[52];
-rz(5.166908153788953) q[52];
-cx q[10],q[52];
-rx(0.519864779299322) q[52];
-ry(pi/2) q[53];
-rx(pi) q[53];
-cx q[17],q[53];
-rz(5.166908153788953) q[53];
-cx q[17],q[53];
-cx q[21],q[53];
-rz(5.166908153788953) q[53];
-cx q[21],q[53];
-ry(pi/2) q[54];
-rx(pi) q[54];
-cx q[24],q[54];
-rz(5.166908153788953) q[54];
-cx q[24],q[54];
-cx q[28],q[54];
-rz(5.166908153788953) q[54];
-cx q[28],q[54];
-rx(0.519864779299322) q[54];
-ry(pi/2) q[55];
-rx(pi) q[55];
-cx q[9],q[55];
-rz(5.166908153788953) q[55];
-cx q[9],q[55];
-cx q[15],q[55];
-rz(5.166908153788953) q[55];
-cx q[15],q[55];
-rx(0.519864779299322) q[55];
-ry(pi/2) q[56];
-rx(pi) q[56];
-cx q[13],q[56];
-rz(5.166908153788953) q[56];
-cx q[13],q[56];
-cx q[45],q[56];
-rz(5.166908153788953) q[56];
-cx q[45],q[56];
-rx(0.519864779299322) q[45];
-ry(pi/2) q[57];
-rx(pi) q[57];
-cx q[1],q[57];
-rz(5.166908153788953) q[57];
-cx q[1],q[57];
-cx q[3],q[57];
-rz(5.166908153788953) q[57];
-cx q[3],q[57];
-rx(0.519864779299322) q[57];
-ry(pi/2) q[58];
-rx(pi) q[58];
-cx q[24],q[58];
-rz(5.166908153788953) q[58];
-cx q[24],q[58];
-cx q[28],q[58];
-rz(5.166908153788953) q[58];
-cx q[28],q[58];
-rx(0.519864779299322) q[58];
-ry(pi/2) q[59];
-rx(pi) q[59];
-cx q[16],q[59];
-rz(5.166908153788953) q[59];
-cx q[16],q[59];
-cx q[32],q[59];
-rz(5.166908153788953) q[59];
-cx q[32],q[59];
-ry(pi/2) q[60];
-rx(pi) q[60];
-cx q[1],q[60];
-rz(5.166908153788953) q[60];
-cx q[1],q[60];
-rx(0.519864779299322) q[1];
-cx q[7],q[60];
-rz(5.166908153788953) q[60];
-cx q[7],q[60];
-ry(pi/2) q[61];
-rx(pi) q[61];
-cx q[4],q[61];
-rz(5.166908153788953) q[61];
-cx q[4],q[61];
-rx(0.519864779299322) q[4];
-cx q[7],q[61];
-rz(5.166908153788953) q[61];
-cx q[7],q[61];
-rx(0.519864779299322) q[7];
-rx(0.519864779299322) q[61];
-ry(pi/2) q[62];
-rx(pi) q[62];
-cx q[0],q[62];
-rz(5.166908153788953) q[62];
-cx q[0],q[62];
-cx q[17],q[62];
-rz(5.166908153788953) q[62];
-cx q[17],q[62];
-rx(0.519864779299322) q[62];
-ry(pi/2) q[63];
-rx(pi) q[63];
-cx q[12],q[63];
-rz(5.166908153788953) q[63];
-cx q[12],q[63];
-rx(0.519864779299322) q[12];
-cx q[17],q[63];
-rz(5.166908153788953) q[63];
-cx q[17],q[63];
-ry(pi/2) q[64];
-rx(pi) q[64];
-cx q[0],q[64];
-rz(5.166908153788953) q[64];
-cx q[0],q[64];
-cx q[10],q[64];
-rz(5.166908153788953) q[64];
-cx q[10],q[64];
-rx(0.519864779299322) q[10];
-rx(0.519864779299322) q[64];
-ry(pi/2) q[65];
-rx(pi) q[65];
-cx q[5],q[65];
-rz(5.166908153788953) q[65];
-cx q[5],q[65];
-cx q[23],q[65];
-rz(5.166908153788953) q[65];
-cx q[23],q[65];
-rx(0.519864779299322) q[23];
-rx(0.519864779299322) q[65];
-ry(pi/2) q[66];
-rx(pi) q[66];
-cx q[17],q[66];
-rz(5.166908153788953) q[66];
-cx q[17],q[66];
-rx(0.519864779299322) q[17];
-cx q[47],q[66];
-rz(5.166908153788953) q[66];
-cx q[47],q[66];
-rx(0.519864779299322) q[47];
-rx(0.519864779299322) q[66];
-ry(pi/2) q[67];
-rx(pi) q[67];
-cx q[41],q[67];
-rz(5.166908153788953) q[67];
-cx q[41],q[67];
-rx(0.519864779299322) q[41];
-cx q[56],q[67];
-rz(5.166908153788953) q[67];
-cx q[56],q[67];
-rx(0.519864779299322) q[67];
-ry(pi/2) q[68];
-rx(pi) q[68];
-cx q[13],q[68];
-rz(5.166908153788953) q[68];
-cx q[13],q[68];
-rx(0.519864779299322) q[13];
-cx q[32],q[68];
-rz(5.166908153788953) q[68];
-cx q[32],q[68];
-ry(pi/2) q[69];
-rx(pi) q[69];
-cx q[6],q[69];
-rz(5.166908153788953) q[69];
-cx q[6],q[69];
-cx q[59],q[69];
-rz(5.166908153788953) q[69];
-cx q[59],q[69];
-rx(0.519864779299322) q[69];
-ry(pi/2) q[70];
-rx(pi) q[70];
-cx q[3],q[70];
-rz(5.166908153788953) q[70];
-cx q[3],q[70];
-cx q[15],q[70];
-rz(5.166908153788953) q[70];
-cx q[15],q[70];
-ry(pi/2) q[71];
-rx(pi) q[71];
-cx q[3],q[71];
-rz(5.166908153788953) q[71];
-cx q[3],q[71];
-cx q[53],q[71];
-rz(5.166908153788953) q[71];
-cx q[53],q[71];
-rx(0.519864779299322) q[71];
-ry(pi/2) q[72];
-rx(pi) q[72];
-cx q[27],q[72];
-rz(5.166908153788953) q[72];
-cx q[27],q[72];
-rx(0.519864779299322) q[27];
-cx q[44],q[72];
-rz(5.166908153788953) q[72];
-cx q[44],q[72];
-rx(0.519864779299322) q[44];
-rx(0.519864779299322) q[72];
-ry(pi/2) q[73];
-rx(pi) q[73];
-cx q[16],q[73];
-rz(5.166908153788953) q[73];
-cx q[16],q[73];
-rx(0.519864779299322) q[16];
-cx q[59],q[73];
-rz(5.166908153788953) q[73];
-cx q[59],q[73];
-ry(pi/2) q[74];
-rx(pi) q[74];
-cx q[56],q[74];
-rz(5.166908153788953) q[74];
-cx q[56],q[74];
-cx q[63],q[74];
-rz(5.166908153788953) q[74];
-cx q[63],q[74];
-rx(0.519864779299322) q[63];
-rx(0.519864779299322) q[74];
-ry(pi/2) q[75];
-rx(pi) q[75];
-cx q[0],q[75];
-rz(5.166908153788953) q[75];
-cx q[0],q[75];
-cx q[21],q[75];
-rz(5.166908153788953) q[75];
-cx q[21],q[75];
-rx(0.519864779299322) q[75];
-ry(pi/2) q[76];
-rx(pi) q[76];
-cx q[5],q[76];
-rz(5.166908153788953) q[76];
-cx q[5],q[76];
-rx(0.519864779299322) q[5];
-cx q[6],q[76];
-rz(5.166908153788953) q[76];
-cx q[6],q[76];
-rx(0.519864779299322) q[76];
-ry(pi/2) q[77];
-rx(pi) q[77];
-cx q[3],q[77];
-rz(5.166908153788953) q[77];
-cx q[3],q[77];
-rx(0.519864779299322) q[3];
-cx q[30],q[77];
-rz(5.166908153788953) q[77];
-cx q[30],q[77];
-rx(0.519864779299322) q[30];
-ry(pi/2) q[78];
-rx(pi) q[78];
-cx q[42],q[78];
-rz(5.166908153788953) q[78];
-cx q[42],q[78];
-rx(0.519864779299322) q[42];
-cx q[60],q[78];
-rz(5.166908153788953) q[78];
-cx q[60],q[78];
-rx(0.519864779299322) q[60];
-rx(0.519864779299322) q[78];
-ry(pi/2) q[79];
-rx(pi) q[79];
-cx q[6],q[79];
-rz(5.166908153788953) q[79];
-cx q[6],q[79];
-rx(0.519864779299322) q[6];
-cx q[50],q[79];
-rz(5.166908153788953) q[79];
-cx q[50],q[79];
-rx(0.519864779299322) q[50];
-rx(0.519864779299322) q[79];
-ry(pi/2) q[80];
-rx(pi) q[80];
-cx q[9],q[80];
-rz(5.166908153788953) q[80];
-cx q[9],q[80];
-rx(0.519864779299322) q[9];
-cx q[15],q[80];
-rz(5.166908153788953) q[80];
-cx q[15],q[80];
-rx(0.519864779299322) q[15];
-rx(0.519864779299322) q[80];
-ry(pi/2) q[81];
-rx(pi) q[81];
-cx q[21],q[81];
-rz(5.166908153788953) q[81];
-cx q[21],q[81];
-rx(0.519864779299322) q[21];
-cx q[77],q[81];
-rz(5.166908153788953) q[81];
-cx q[77],q[81];
-rx(0.519864779299322) q[77];
-rx(0.519864779299322) q[81];
-ry(pi/2) q[82];
-rx(pi) q[82];
-cx q[0],q[82];
-rz(5.166908153788953) q[82];
-cx q[0],q[82];
-rx(0.519864779299322) q[0];
-cx q[0],q[1];
-rz(1.085935868934114) q[1];
-cx q[0],q[1];
-cx q[0],q[2];
-rz(1.085935868934114) q[2];
-cx q[0],q[2];
-cx q[0],q[3];
-rx(7.710960105004434) q[2];
-rz(1.085935868934114) q[3];
-cx q[0],q[3];
-cx q[0],q[15];
-cx q[1],q[3];
-rz(1.085935868934114) q[3];
-cx q[1],q[3];
-cx q[1],q[4];
-rz(1.085935868934114) q[4];
-cx q[1],q[4];
-cx q[1],q[5];
-cx q[3],q[4];
-rz(1.085935868934114) q[4];
-cx q[3],q[4];
-cx q[4],q[6];
-rz(1.085935868934114) q[5];
-cx q[1],q[5];
-cx q[1],q[9];
-cx q[3],q[5];
-rz(1.085935868934114) q[5];
-cx q[3],q[5];
-cx q[3],q[7];
-rz(1.085935868934114) q[6];
-cx q[4],q[6];
-cx q[5],q[6];
-rz(1.085935868934114) q[6];
-cx q[5],q[6];
-rz(1.085935868934114) q[7];
-cx q[3],q[7];
-cx q[4],q[7];
-rz(1.085935868934114) q[7];
-cx q[4],q[7];
-cx q[4],q[10];
-rz(1.085935868934114) q[9];
-cx q[1],q[9];
-cx q[1],q[17];
-rz(1.085935868934114) q[10];
-cx q[4],q[10];
-cx q[4],q[13];
-cx q[6],q[10];
-rz(1.085935868934114) q[10];
-cx q[6],q[10];
-rz(1.085935868934114) q[13];
-cx q[4],q[13];
-rz(1.085935868934114) q[15];
-cx q[0],q[15];
-cx q[0],q[16];
-rz(1.085935868934114) q[16];
-cx q[0],q[16];
-cx q[0],q[20];
-rz(1.085935868934114) q[17];
-cx q[1],q[17];
-rz(1.085935868934114) q[20];
-cx q[0],q[20];
-cx q[56],q[82];
-rz(5.166908153788953) q[82];
-cx q[56],q[82];
-rx(0.519864779299322) q[56];
-rx(0.519864779299322) q[82];
-ry(pi/2) q[83];
-rx(pi) q[83];
-cx q[8],q[83];
-rz(5.166908153788953) q[83];
-cx q[8],q[83];
-rx(0.519864779299322) q[8];
-cx q[3],q[8];
-rz(1.085935868934114) q[8];
-cx q[3],q[8];
-cx q[3],q[9];
-cx q[5],q[8];
-rz(1.085935868934114) q[8];
-cx q[5],q[8];
-cx q[5],q[11];
-rz(1.085935868934114) q[9];
-cx q[3],q[9];
-cx q[3],q[12];
-rz(1.085935868934114) q[11];
-cx q[5],q[11];
-cx q[6],q[11];
-rz(1.085935868934114) q[11];
-cx q[6],q[11];
-rx(7.710960105004434) q[11];
-rz(1.085935868934114) q[12];
-cx q[3],q[12];
-cx q[3],q[14];
-cx q[5],q[12];
-rz(1.085935868934114) q[12];
-cx q[5],q[12];
-cx q[5],q[13];
-rz(1.085935868934114) q[13];
-cx q[5],q[13];
-rz(1.085935868934114) q[14];
-cx q[3],q[14];
-cx q[3],q[15];
-cx q[4],q[14];
-rz(1.085935868934114) q[14];
-cx q[4],q[14];
-rx(7.710960105004434) q[14];
-rz(1.085935868934114) q[15];
-cx q[3],q[15];
-cx q[3],q[16];
-cx q[15],q[20];
-rz(1.085935868934114) q[16];
-cx q[3],q[16];
-cx q[3],q[17];
-rz(1.085935868934114) q[17];
-cx q[3],q[17];
-cx q[3],q[18];
-rz(1.085935868934114) q[18];
-cx q[3],q[18];
-cx q[3],q[19];
-cx q[4],q[18];
-rz(1.085935868934114) q[18];
-cx q[4],q[18];
-cx q[4],q[21];
-rz(1.085935868934114) q[19];
-cx q[3],q[19];
-cx q[3],q[22];
-cx q[7],q[19];
-rz(1.085935868934114) q[19];
-cx q[7],q[19];
-cx q[19],q[38];
-rz(1.085935868934114) q[20];
-cx q[15],q[20];
-rz(1.085935868934114) q[21];
-cx q[4],q[21];
-cx q[4],q[27];
-cx q[15],q[21];
-rz(1.085935868934114) q[21];
-cx q[15],q[21];
-cx q[15],q[36];
-rz(1.085935868934114) q[22];
-cx q[3],q[22];
-cx q[3],q[23];
-cx q[9],q[22];
-rz(1.085935868934114) q[22];
-cx q[9],q[22];
-cx q[9],q[55];
-rx(7.710960105004434) q[22];
-rz(1.085935868934114) q[23];
-cx q[3],q[23];
-cx q[17],q[23];
-rz(1.085935868934114) q[23];
-cx q[17],q[23];
-rz(1.085935868934114) q[27];
-cx q[4],q[27];
-cx q[4],q[47];
-cx q[6],q[27];
-rz(1.085935868934114) q[27];
-cx q[6],q[27];
-cx q[6],q[69];
-rz(1.085935868934114) q[36];
-cx q[15],q[36];
-cx q[20],q[36];
-rz(1.085935868934114) q[36];
-cx q[20],q[36];
-rx(7.710960105004434) q[36];
-rz(1.085935868934114) q[38];
-cx q[19],q[38];
-rx(7.710960105004434) q[19];
-rz(1.085935868934114) q[47];
-cx q[4],q[47];
-cx q[17],q[47];
-rz(1.085935868934114) q[47];
-cx q[17],q[47];
-rz(1.085935868934114) q[55];
-cx q[9],q[55];
-cx q[9],q[80];
-cx q[15],q[55];
-rz(1.085935868934114) q[55];
-cx q[15],q[55];
-rx(7.710960105004434) q[55];
-cx q[68],q[83];
-rz(1.085935868934114) q[69];
-cx q[6],q[69];
-rz(1.085935868934114) q[80];
-cx q[9],q[80];
-rx(7.710960105004434) q[9];
-rz(5.166908153788953) q[83];
-cx q[68],q[83];
-rx(0.519864779299322) q[68];
-rx(0.519864779299322) q[83];
-cx q[8],q[83];
-rz(1.085935868934114) q[83];
-cx q[8],q[83];
-rx(7.710960105004434) q[8];
-ry(pi/2) q[84];
-rx(pi) q[84];
-cx q[70],q[84];
-rz(5.166908153788953) q[84];
-cx q[70],q[84];
-rx(0.519864779299322) q[70];
-cx q[73],q[84];
-rz(5.166908153788953) q[84];
-cx q[73],q[84];
-rx(0.519864779299322) q[73];
-rx(0.519864779299322) q[84];
-ry(pi/2) q[85];
-rx(pi) q[85];
-cx q[37],q[85];
-rz(5.166908153788953) q[85];
-cx q[37],q[85];
-rx(0.519864779299322) q[37];
-cx q[10],q[37];
-rz(1.085935868934114) q[37];
-cx q[10],q[37];
-cx q[10],q[41];
-rz(1.085935868934114) q[41];
-cx q[10],q[41];
-cx q[27],q[41];
-rz(1.085935868934114) q[41];
-cx q[27],q[41];
-cx q[27],q[72];
-cx q[41],q[67];
-cx q[59],q[85];
-rz(1.085935868934114) q[67];
-cx q[41],q[67];
-rx(7.710960105004434) q[41];
-rz(1.085935868934114) q[72];
-cx q[27],q[72];
-rx(7.710960105004434) q[27];
-rz(5.166908153788953) q[85];
-cx q[59],q[85];
-rx(0.519864779299322) q[59];
-rx(0.519864779299322) q[85];
-ry(pi/2) q[86];
-rx(pi) q[86];
-cx q[24],q[86];
-rz(5.166908153788953) q[86];
-cx q[24],q[86];
-rx(0.519864779299322) q[24];
-cx q[3],q[24];
-rz(1.085935868934114) q[24];
-cx q[3],q[24];
-cx q[3],q[25];
-cx q[5],q[24];
-rz(1.085935868934114) q[24];
-cx q[5],q[24];
-cx q[5],q[33];
-cx q[24],q[54];
-rz(1.085935868934114) q[25];
-cx q[3],q[25];
-cx q[3],q[26];
-cx q[12],q[25];
-rz(1.085935868934114) q[25];
-cx q[12],q[25];
-cx q[12],q[31];
-rx(7.710960105004434) q[25];
-rz(1.085935868934114) q[26];
-cx q[3],q[26];
-cx q[21],q[26];
-rz(1.085935868934114) q[26];
-cx q[21],q[26];
-rz(1.085935868934114) q[31];
-cx q[12],q[31];
-cx q[26],q[31];
-rz(1.085935868934114) q[31];
-cx q[26],q[31];
-rx(7.710960105004434) q[26];
-rx(7.710960105004434) q[31];
-rz(1.085935868934114) q[33];
-cx q[5],q[33];
-cx q[5],q[46];
-rz(1.085935868934114) q[46];
-cx q[5],q[46];
-cx q[5],q[65];
-cx q[53],q[86];
-rz(1.085935868934114) q[54];
-cx q[24],q[54];
-cx q[24],q[58];
-rz(1.085935868934114) q[58];
-cx q[24],q[58];
-rz(1.085935868934114) q[65];
-cx q[5],q[65];
-cx q[5],q[76];
-rz(1.085935868934114) q[76];
-cx q[5],q[76];
-rx(7.710960105004434) q[5];
-cx q[6],q[76];
-rz(1.085935868934114) q[76];
-cx q[6],q[76];
-cx q[6],q[79];
-rx(7.710960105004434) q[76];
-rz(1.085935868934114) q[79];
-cx q[6],q[79];
-rx(7.710960105004434) q[6];
-rz(5.166908153788953) q[86];
-cx q[53],q[86];
-rx(0.519864779299322) q[53];
-cx q[17],q[53];
-rz(1.085935868934114) q[53];
-cx q[17],q[53];
-rx(0.519864779299322) q[86];
-cx q[24],q[86];
-rz(1.085935868934114) q[86];
-cx q[24],q[86];
-rx(7.710960105004434) q[24];
-ry(pi/2) q[87];
-rx(pi) q[87];
-cx q[28],q[87];
-rz(5.166908153788953) q[87];
-cx q[28],q[87];
-rx(0.519864779299322) q[28];
-cx q[1],q[28];
-rz(1.085935868934114) q[28];
-cx q[1],q[28];
-cx q[1],q[29];
-cx q[3],q[28];
-rz(1.085935868934114) q[28];
-cx q[3],q[28];
-rz(1.085935868934114) q[29];
-cx q[1],q[29];
-cx q[1],q[45];
-cx q[3],q[29];
-rz(1.085935868934114) q[29];
-cx q[3],q[29];
-cx q[3],q[30];
-rx(7.710960105004434) q[29];
-rz(1.085935868934114) q[30];
-cx q[3],q[30];
-cx q[3],q[34];
-cx q[18],q[30];
-rz(1.085935868934114) q[30];
-cx q[18],q[30];
-rx(7.710960105004434) q[18];
-cx q[30],q[33];
-cx q[32],q[87];
-rz(1.085935868934114) q[33];
-cx q[30],q[33];
-rx(7.710960105004434) q[33];
-rz(1.085935868934114) q[34];
-cx q[3],q[34];
-cx q[3],q[35];
-cx q[12],q[34];
-rz(1.085935868934114) q[34];
-cx q[12],q[34];
-cx q[34],q[37];
-rz(1.085935868934114) q[35];
-cx q[3],q[35];
-cx q[3],q[39];
-rz(1.085935868934114) q[37];
-cx q[34],q[37];
-rx(7.710960105004434) q[34];
-cx q[37],q[85];
-rz(1.085935868934114) q[39];
-cx q[3],q[39];
-cx q[3],q[40];
-cx q[13],q[39];
-rz(1.085935868934114) q[39];
-cx q[13],q[39];
-cx q[13],q[56];
-rx(7.710960105004434) q[39];
-rz(1.085935868934114) q[40];
-cx q[3],q[40];
-cx q[23],q[40];
-rz(1.085935868934114) q[40];
-cx q[23],q[40];
-cx q[23],q[65];
-rx(7.710960105004434) q[40];
-rz(1.085935868934114) q[45];
-cx q[1],q[45];
-cx q[1],q[57];
-cx q[16],q[45];
-rz(1.085935868934114) q[45];
-cx q[16],q[45];
-cx q[16],q[59];
-rz(1.085935868934114) q[56];
-cx q[13],q[56];
-cx q[13],q[68];
-cx q[45],q[56];
-rz(1.085935868934114) q[56];
-cx q[45],q[56];
-rx(7.710960105004434) q[45];
-cx q[56],q[67];
-rz(1.085935868934114) q[57];
-cx q[1],q[57];
-cx q[1],q[60];
-rz(1.085935868934114) q[59];
-cx q[16],q[59];
-cx q[16],q[73];
-rz(1.085935868934114) q[60];
-cx q[1],q[60];
-rx(7.710960105004434) q[1];
-cx q[7],q[60];
-rz(1.085935868934114) q[60];
-cx q[7],q[60];
-rz(1.085935868934114) q[65];
-cx q[23],q[65];
-rx(7.710960105004434) q[23];
-rx(7.710960105004434) q[65];
-rz(1.085935868934114) q[67];
-cx q[56],q[67];
-cx q[56],q[74];
-rx(7.710960105004434) q[67];
-rz(1.085935868934114) q[68];
-cx q[13],q[68];
-rx(7.710960105004434) q[13];
-rz(1.085935868934114) q[73];
-cx q[16],q[73];
-rx(7.710960105004434) q[16];
-rz(1.085935868934114) q[74];
-cx q[56],q[74];
-rz(1.085935868934114) q[85];
-cx q[37],q[85];
-rx(7.710960105004434) q[37];
-rz(5.166908153788953) q[87];
-cx q[32],q[87];
-rx(0.519864779299322) q[32];
-cx q[0],q[32];
-rz(1.085935868934114) q[32];
-cx q[0],q[32];
-cx q[0],q[42];
-cx q[21],q[32];
-rz(1.085935868934114) q[32];
-cx q[21],q[32];
-cx q[21],q[38];
-cx q[32],q[35];
-rz(1.085935868934114) q[35];
-cx q[32],q[35];
-cx q[32],q[59];
-rx(7.710960105004434) q[35];
-rz(1.085935868934114) q[38];
-cx q[21],q[38];
-cx q[21],q[53];
-cx q[38],q[46];
-rz(1.085935868934114) q[42];
-cx q[0],q[42];
-cx q[0],q[48];
-cx q[3],q[42];
-rz(1.085935868934114) q[42];
-cx q[3],q[42];
-cx q[3],q[43];
-cx q[42],q[78];
-rz(1.085935868934114) q[43];
-cx q[3],q[43];
-cx q[3],q[44];
-cx q[20],q[43];
-rz(1.085935868934114) q[43];
-cx q[20],q[43];
-rx(7.710960105004434) q[20];
-rx(7.710960105004434) q[43];
-rz(1.085935868934114) q[44];
-cx q[3],q[44];
-cx q[3],q[49];
-cx q[12],q[44];
-rz(1.085935868934114) q[44];
-cx q[12],q[44];
-cx q[44],q[72];
-rz(1.085935868934114) q[46];
-cx q[38],q[46];
-rx(7.710960105004434) q[38];
-rx(7.710960105004434) q[46];
-rz(1.085935868934114) q[48];
-cx q[0],q[48];
-cx q[0],q[51];
-cx q[30],q[48];
-rz(1.085935868934114) q[48];
-cx q[30],q[48];
-rx(7.710960105004434) q[48];
-rz(1.085935868934114) q[49];
-cx q[3],q[49];
-cx q[3],q[50];
-cx q[4],q[49];
-rz(1.085935868934114) q[49];
-cx q[4],q[49];
-cx q[4],q[61];
-rx(7.710960105004434) q[49];
-rz(1.085935868934114) q[50];
-cx q[3],q[50];
-cx q[3],q[52];
-cx q[12],q[50];
-rz(1.085935868934114) q[50];
-cx q[12],q[50];
-cx q[12],q[63];
-cx q[50],q[79];
-rz(1.085935868934114) q[51];
-cx q[0],q[51];
-cx q[0],q[62];
-cx q[28],q[51];
-rz(1.085935868934114) q[51];
-cx q[28],q[51];
-cx q[28],q[54];
-rx(7.710960105004434) q[51];
-rz(1.085935868934114) q[52];
-cx q[3],q[52];
-cx q[3],q[57];
-cx q[10],q[52];
-rz(1.085935868934114) q[52];
-cx q[10],q[52];
-rx(7.710960105004434) q[52];
-rz(1.085935868934114) q[53];
-cx q[21],q[53];
-rz(1.085935868934114) q[54];
-cx q[28],q[54];
-cx q[28],q[58];
-rx(7.710960105004434) q[54];
-rz(1.085935868934114) q[57];
-cx q[3],q[57];
-cx q[3],q[70];
-rx(7.710960105004434) q[57];
-rz(1.085935868934114) q[58];
-cx q[28],q[58];
-rx(7.710960105004434) q[58];
-rz(1.085935868934114) q[59];
-cx q[32],q[59];
-cx q[32],q[68];
-cx q[59],q[69];
-rz(1.085935868934114) q[61];
-cx q[4],q[61];
-rx(7.710960105004434) q[4];
-cx q[7],q[61];
-rz(1.085935868934114) q[61];
-cx q[7],q[61];
-rx(7.710960105004434) q[7];
-rx(7.710960105004434) q[61];
-rz(1.085935868934114) q[62];
-cx q[0],q[62];
-cx q[0],q[64];
-cx q[17],q[62];
-rz(1.085935868934114) q[62];
-cx q[17],q[62];
-rx(7.710960105004434) q[62];
-rz(1.085935868934114) q[63];
-cx q[12],q[63];
-rx(7.710960105004434) q[12];
-cx q[17],q[63];
-rz(1.085935868934114) q[63];
-cx q[17],q[63];
-cx q[17],q[66];
-cx q[63],q[74];
-rz(1.085935868934114) q[64];
-cx q[0],q[64];
-cx q[0],q[75];
-cx q[10],q[64];
-rz(1.085935868934114) q[64];
-cx q[10],q[64];
-rx(7.710960105004434) q[10];
-rx(7.710960105004434) q[64];
-rz(1.085935868934114) q[66];
-cx q[17],q[66];
-rx(7.710960105004434) q[17];
-cx q[47],q[66];
-rz(1.085935868934114) q[66];
-cx q[47],q[66];
-rx(7.710960105004434) q[47];
-rx(7.710960105004434) q[66];
-rz(1.085935868934114) q[68];
-cx q[32],q[68];
-cx q[68],q[83];
-rz(1.085935868934114) q[69];
-cx q[59],q[69];
-cx q[59],q[73];
-rx(7.710960105004434) q[69];
-rz(1.085935868934114) q[70];
-cx q[3],q[70];
-cx q[3],q[71];
-cx q[15],q[70];
-rz(1.085935868934114) q[70];
-cx q[15],q[70];
-cx q[15],q[80];
-cx q[70],q[84];
-rz(1.085935868934114) q[71];
-cx q[3],q[71];
-cx q[3],q[77];
-cx q[53],q[71];
-rz(1.085935868934114) q[71];
-cx q[53],q[71];
-cx q[53],q[86];
-rx(7.710960105004434) q[71];
-rz(1.085935868934114) q[72];
-cx q[44],q[72];
-rx(7.710960105004434) q[44];
-rx(7.710960105004434) q[72];
-rz(1.085935868934114) q[73];
-cx q[59],q[73];
-cx q[59],q[85];
-rz(1.085935868934114) q[74];
-cx q[63],q[74];
-rx(7.710960105004434) q[63];
-rx(7.710960105004434) q[74];
-rz(1.085935868934114) q[75];
-cx q[0],q[75];
-cx q[0],q[82];
-cx q[21],q[75];
-rz(1.085935868934114) q[75];
-cx q[21],q[75];
-cx q[21],q[81];
-rx(7.710960105004434) q[75];
-rz(1.085935868934114) q[77];
-cx q[3],q[77];
-rx(7.710960105004434) q[3];
-cx q[30],q[77];
-rz(1.085935868934114) q[77];
-cx q[30],q[77];
-rx(7.710960105004434) q[30];
-rz(1.085935868934114) q[78];
-cx q[42],q[78];
-rx(7.710960105004434) q[42];
-cx q[60],q[78];
-rz(1.085935868934114) q[78];
-cx q[60],q[78];
-rx(7.710960105004434) q[60];
-rx(7.710960105004434) q[78];
-rz(1.085935868934114) q[79];
-cx q[50],q[79];
-rx(7.710960105004434) q[50];
-rx(7.710960105004434) q[79];
-rz(1.085935868934114) q[80];
-cx q[15],q[80];
-rx(7.710960105004434) q[15];
-rx(7.710960105004434) q[80];
-rz(1.085935868934114) q[81];
-cx q[21],q[81];
-rx(7.710960105004434) q[21];
-cx q[77],q[81];
-rz(1.085935868934114) q[81];
-cx q[77],q[81];
-rx(7.710960105004434) q[77];
-rx(7.710960105004434) q[81];
-rz(1.085935868934114) q[82];
-cx q[0],q[82];
-rx(7.710960105004434) q[0];
-cx q[0],q[1];
-rz(0.5021272028982785) q[1];
-cx q[0],q[1];
-cx q[0],q[2];
-rz(0.5021272028982785) q[2];
-cx q[0],q[2];
-cx q[0],q[3];
-rx(3.585608204762257) q[2];
-rz(0.5021272028982785) q[3];
-cx q[0],q[3];
-cx q[0],q[15];
-cx q[1],q[3];
-rz(0.5021272028982785) q[3];
-cx q[1],q[3];
-cx q[1],q[4];
-rz(0.5021272028982785) q[4];
-cx q[1],q[4];
-cx q[1],q[5];
-cx q[3],q[4];
-rz(0.5021272028982785) q[4];
-cx q[3],q[4];
-cx q[4],q[6];
-rz(0.5021272028982785) q[5];
-cx q[1],q[5];
-cx q[1],q[9];
-cx q[3],q[5];
-rz(0.5021272028982785) q[5];
-cx q[3],q[5];
-cx q[3],q[7];
-rz(0.5021272028982785) q[6];
-cx q[4],q[6];
-cx q[5],q[6];
-rz(0.5021272028982785) q[6];
-cx q[5],q[6];
-rz(0.5021272028982785) q[7];
-cx q[3],q[7];
-cx q[3],q[8];
-cx q[4],q[7];
-rz(0.5021272028982785) q[7];
-cx q[4],q[7];
-cx q[4],q[10];
-rz(0.5021272028982785) q[8];
-cx q[3],q[8];
-cx q[5],q[8];
-rz(0.5021272028982785) q[8];
-cx q[5],q[8];
-cx q[5],q[11];
-rz(0.5021272028982785) q[9];
-cx q[1],q[9];
-cx q[1],q[17];
-cx q[3],q[9];
-rz(0.5021272028982785) q[9];
-cx q[3],q[9];
-cx q[3],q[12];
-rz(0.5021272028982785) q[10];
-cx q[4],q[10];
-cx q[4],q[13];
-cx q[6],q[10];
-rz(0.5021272028982785) q[10];
-cx q[6],q[10];
-cx q[10],q[37];
-rz(0.5021272028982785) q[11];
-cx q[5],q[11];
-cx q[6],q[11];
-rz(0.5021272028982785) q[11];
-cx q[6],q[11];
-rx(3.585608204762257) q[11];
-rz(0.5021272028982785) q[12];
-cx q[3],q[12];
-cx q[3],q[14];
-cx q[5],q[12];
-rz(0.5021272028982785) q[12];
-cx q[5],q[12];
-rz(0.5021272028982785) q[13];
-cx q[4],q[13];
-cx q[5],q[13];
-rz(0.5021272028982785) q[13];
-cx q[5],q[13];
-rz(0.5021272028982785) q[14];
-cx q[3],q[14];
-cx q[4],q[14];
-rz(0.5021272028982785) q[14];
-cx q[4],q[14];
-rx(3.585608204762257) q[14];
-rz(0.5021272028982785) q[15];
-cx q[0],q[15];
-cx q[0],q[16];
-cx q[3],q[15];
-rz(0.5021272028982785) q[15];
-cx q[3],q[15];
-rz(0.5021272028982785) q[16];
-cx q[0],q[16];
-cx q[0],q[20];
-cx q[3],q[16];
-rz(0.5021272028982785) q[16];
-cx q[3],q[16];
-rz(0.5021272028982785) q[17];
-cx q[1],q[17];
-cx q[3],q[17];
-rz(0.5021272028982785) q[17];
-cx q[3],q[17];
-cx q[3],q[18];
-rz(0.5021272028982785) q[18];
-cx q[3],q[18];
-cx q[3],q[19];
-cx q[4],q[18];
-rz(0.5021272028982785) q[18];
-cx q[4],q[18];
-cx q[4],q[21];
-rz(0.5021272028982785) q[19];
-cx q[3],q[19];
-cx q[3],q[22];
-cx q[7],q[19];
-rz(0.5021272028982785) q[19];
-cx q[7],q[19];
-cx q[19],q[38];
-rz(0.5021272028982785) q[20];
-cx q[0],q[20];
-cx q[15],q[20];
-rz(0.5021272028982785) q[20];
-cx q[15],q[20];
-rz(0.5021272028982785) q[21];
-cx q[4],q[21];
-cx q[4],q[27];
-cx q[15],q[21];
-rz(0.5021272028982785) q[21];
-cx q[15],q[21];
-cx q[15],q[36];
-rz(0.5021272028982785) q[22];
-cx q[3],q[22];
-cx q[3],q[23];
-cx q[9],q[22];
-rz(0.5021272028982785) q[22];
-cx q[9],q[22];
-cx q[9],q[55];
-rx(3.585608204762257) q[22];
-rz(0.5021272028982785) q[23];
-cx q[3],q[23];
-cx q[3],q[24];
-cx q[17],q[23];
-rz(0.5021272028982785) q[23];
-cx q[17],q[23];
-rz(0.5021272028982785) q[24];
-cx q[3],q[24];
-cx q[3],q[25];
-cx q[5],q[24];
-rz(0.5021272028982785) q[24];
-cx q[5],q[24];
-cx q[5],q[33];
-cx q[24],q[54];
-rz(0.5021272028982785) q[25];
-cx q[3],q[25];
-cx q[3],q[26];
-cx q[12],q[25];
-rz(0.5021272028982785) q[25];
-cx q[12],q[25];
-cx q[12],q[31];
-rx(3.585608204762257) q[25];
-rz(0.5021272028982785) q[26];
-cx q[3],q[26];
-cx q[21],q[26];
-rz(0.5021272028982785) q[26];
-cx q[21],q[26];
-rz(0.5021272028982785) q[27];
-cx q[4],q[27];
-cx q[4],q[47];
-cx q[6],q[27];
-rz(0.5021272028982785) q[27];
-cx q[6],q[27];
-cx q[6],q[69];
-rz(0.5021272028982785) q[31];
-cx q[12],q[31];
-cx q[26],q[31];
-rz(0.5021272028982785) q[31];
-cx q[26],q[31];
-rx(3.585608204762257) q[26];
-rx(3.585608204762257) q[31];
-rz(0.5021272028982785) q[33];
-cx q[5],q[33];
-cx q[5],q[46];
-rz(0.5021272028982785) q[36];
-cx q[15],q[36];
-cx q[20],q[36];
-rz(0.5021272028982785) q[36];
-cx q[20],q[36];
-rx(3.585608204762257) q[36];
-rz(0.5021272028982785) q[37];
-cx q[10],q[37];
-cx q[10],q[41];
-rz(0.5021272028982785) q[38];
-cx q[19],q[38];
-rx(3.585608204762257) q[19];
-rz(0.5021272028982785) q[41];
-cx q[10],q[41];
-cx q[27],q[41];
-rz(0.5021272028982785) q[41];
-cx q[27],q[41];
-cx q[27],q[72];
-cx q[41],q[67];
-rz(0.5021272028982785) q[46];
-cx q[5],q[46];
-cx q[5],q[65];
-rz(0.5021272028982785) q[47];
-cx q[4],q[47];
-cx q[17],q[47];
-rz(0.5021272028982785) q[47];
-cx q[17],q[47];
-rz(0.5021272028982785) q[54];
-cx q[24],q[54];
-cx q[24],q[58];
-rz(0.5021272028982785) q[55];
-cx q[9],q[55];
-cx q[9],q[80];
-cx q[15],q[55];
-rz(0.5021272028982785) q[55];
-cx q[15],q[55];
-rx(3.585608204762257) q[55];
-cx q[56],q[82];
-rz(0.5021272028982785) q[58];
-cx q[24],q[58];
-rz(0.5021272028982785) q[65];
-cx q[5],q[65];
-cx q[5],q[76];
-rz(0.5021272028982785) q[67];
-cx q[41],q[67];
-rx(3.585608204762257) q[41];
-rz(0.5021272028982785) q[69];
-cx q[6],q[69];
-rz(0.5021272028982785) q[72];
-cx q[27],q[72];
-rx(3.585608204762257) q[27];
-rz(0.5021272028982785) q[76];
-cx q[5],q[76];
-rx(3.585608204762257) q[5];
-cx q[6],q[76];
-rz(0.5021272028982785) q[76];
-cx q[6],q[76];
-cx q[6],q[79];
-rx(3.585608204762257) q[76];
-rz(0.5021272028982785) q[79];
-cx q[6],q[79];
-rx(3.585608204762257) q[6];
-rz(0.5021272028982785) q[80];
-cx q[9],q[80];
-rx(3.585608204762257) q[9];
-rz(1.085935868934114) q[82];
-cx q[56],q[82];
-rx(7.710960105004434) q[56];
-rx(7.710960105004434) q[82];
-rz(1.085935868934114) q[83];
-cx q[68],q[83];
-rx(7.710960105004434) q[68];
-rx(7.710960105004434) q[83];
-cx q[8],q[83];
-rz(0.5021272028982785) q[83];
-cx q[8],q[83];
-rx(3.585608204762257) q[8];
-rz(1.085935868934114) q[84];
-cx q[70],q[84];
-rx(7.710960105004434) q[70];
-cx q[73],q[84];
-rz(1.085935868934114) q[84];
-cx q[73],q[84];
-rx(7.710960105004434) q[73];
-rx(7.710960105004434) q[84];
-rz(1.085935868934114) q[85];
-cx q[59],q[85];
-rx(7.710960105004434) q[59];
-rx(7.710960105004434) q[85];
-rz(1.085935868934114) q[86];
-cx q[53],q[86];
-rx(7.710960105004434) q[53];
-cx q[17],q[53];
-rz(0.5021272028982785) q[53];
-cx q[17],q[53];
-rx(7.710960105004434) q[86];
-cx q[24],q[86];
-rz(0.5021272028982785) q[86];
-cx q[24],q[86];
-rx(3.585608204762257) q[24];
-rx(0.519864779299322) q[87];
-cx q[28],q[87];
-rz(1.085935868934114) q[87];
-cx q[28],q[87];
-rx(7.710960105004434) q[28];
-cx q[1],q[28];
-rz(0.5021272028982785) q[28];
-cx q[1],q[28];
-cx q[1],q[29];
-cx q[3],q[28];
-rz(0.5021272028982785) q[28];
-cx q[3],q[28];
-rz(0.5021272028982785) q[29];
-cx q[1],q[29];
-cx q[1],q[45];
-cx q[3],q[29];
-rz(0.5021272028982785) q[29];
-cx q[3],q[29];
-cx q[3],q[30];
-rx(3.585608204762257) q[29];
-rz(0.5021272028982785) q[30];
-cx q[3],q[30];
-cx q[3],q[34];
-cx q[18],q[30];
-rz(0.5021272028982785) q[30];
-cx q[18],q[30];
-rx(3.585608204762257) q[18];
-cx q[30],q[33];
-cx q[32],q[87];
-rz(0.5021272028982785) q[33];
-cx q[30],q[33];
-rx(3.585608204762257) q[33];
-rz(0.5021272028982785) q[34];
-cx q[3],q[34];
-cx q[3],q[35];
-cx q[12],q[34];
-rz(0.5021272028982785) q[34];
-cx q[12],q[34];
-cx q[34],q[37];
-rz(0.5021272028982785) q[35];
-cx q[3],q[35];
-cx q[3],q[39];
-rz(0.5021272028982785) q[37];
-cx q[34],q[37];
-rx(3.585608204762257) q[34];
-cx q[37],q[85];
-rz(0.5021272028982785) q[39];
-cx q[3],q[39];
-cx q[3],q[40];
-cx q[13],q[39];
-rz(0.5021272028982785) q[39];
-cx q[13],q[39];
-cx q[13],q[56];
-rx(3.585608204762257) q[39];
-rz(0.5021272028982785) q[40];
-cx q[3],q[40];
-cx q[23],q[40];
-rz(0.5021272028982785) q[40];
-cx q[23],q[40];
-cx q[23],q[65];
-rx(3.585608204762257) q[40];
-rz(0.5021272028982785) q[45];
-cx q[1],q[45];
-cx q[1],q[57];
-cx q[16],q[45];
-rz(0.5021272028982785) q[45];
-cx q[16],q[45];
-cx q[16],q[59];
-rz(0.5021272028982785) q[56];
-cx q[13],q[56];
-cx q[13],q[68];
-cx q[45],q[56];
-rz(0.5021272028982785) q[56];
-cx q[45],q[56];
-rx(3.585608204762257) q[45];
-cx q[56],q[67];
-rz(0.5021272028982785) q[57];
-cx q[1],q[57];
-cx q[1],q[60];
-rz(0.5021272028982785) q[59];
-cx q[16],q[59];
-cx q[16],q[73];
-rz(0.5021272028982785) q[60];
-cx q[1],q[60];
-rx(3.585608204762257) q[1];
-cx q[7],q[60];
-rz(0.5021272028982785) q[60];
-cx q[7],q[60];
-rz(0.5021272028982785) q[65];
-cx q[23],q[65];
-rx(3.585608204762257) q[23];
-rx(3.585608204762257) q[65];
-rz(0.5021272028982785) q[67];
-cx q[56],q[67];
-cx q[56],q[74];
-rx(3.585608204762257) q[67];
-rz(0.5021272028982785) q[68];
-cx q[13],q[68];
-rx(3.585608204762257) q[13];
-rz(0.5021272028982785) q[73];
-cx q[16],q[73];
-rx(3.585608204762257) q[16];
-rz(0.5021272028982785) q[74];
-cx q[56],q[74];
-rz(0.5021272028982785) q[85];
-cx q[37],q[85];
-rx(3.585608204762257) q[37];
-rz(1.085935868934114) q[87];
-cx q[32],q[87];
-rx(7.710960105004434) q[32];
-cx q[0],q[32];
-rz(0.5021272028982785) q[32];
-cx q[0],q[32];
-cx q[0],q[42];
-cx q[21],q[32];
-rz(0.5021272028982785) q[32];
-cx q[21],q[32];
-cx q[21],q[38];
-cx q[32],q[35];
-rz(0.5021272028982785) q[35];
-cx q[32],q[35];
-cx q[32],q[59];
-rx(3.585608204762257) q[35];
-rz(0.5021272028982785) q[38];
-cx q[21],q[38];
-cx q[21],q[53];
-cx q[38],q[46];
-rz(0.5021272028982785) q[42];
-cx q[0],q[42];
-cx q[0],q[48];
-cx q[3],q[42];
-rz(0.5021272028982785) q[42];
-cx q[3],q[42];
-cx q[3],q[43];
-cx q[42],q[78];
-rz(0.5021272028982785) q[43];
-cx q[3],q[43];
-cx q[3],q[44];
-cx q[20],q[43];
-rz(0.5021272028982785) q[43];
-cx q[20],q[43];
-rx(3.585608204762257) q[20];
-rx(3.585608204762257) q[43];
-rz(0.5021272028982785) q[44];
-cx q[3],q[44];
-cx q[3],q[49];
-cx q[12],q[44];
-rz(0.5021272028982785) q[44];
-cx q[12],q[44];
-cx q[44],q[72];
-rz(0.5021272028982785) q[46];
-cx q[38],q[46];
-rx(3.585608204762257) q[38];
-rx(3.585608204762257) q[46];
-rz(0.5021272028982785) q[48];
-cx q[0],q[48];
-cx q[0],q[51];
-cx q[30],q[48];
-rz(0.5021272028982785) q[48];
-cx q[30],q[48];
-rx(3.585608204762257) q[48];
-rz(0.5021272028982785) q[49];
-cx q[3],q[49];
-cx q[3],q[50];
-cx q[4],q[49];
-rz(0.5021272028982785) q[49];
-cx q[4],q[49];
-cx q[4],q[61];
-rx(3.585608204762257) q[49];
-rz(0.5021272028982785) q[50];
-cx q[3],q[50];
-cx q[3],q[52];
-cx q[12],q[50];
-rz(0.5021272028982785) q[50];
-cx q[12],q[50];
-cx q[12],q[63];
-cx q[50],q[79];
-rz(0.5021272028982785) q[51];
-cx q[0],q[51];
-cx q[0],q[62];
-cx q[28],q[51];
-rz(0.5021272028982785) q[51];
-cx q[28],q[51];
-cx q[28],q[54];
-rx(3.585608204762257) q[51];
-rz(0.5021272028982785) q[52];
-cx q[3],q[52];
-cx q[3],q[57];
-cx q[10],q[52];
-rz(0.5021272028982785) q[52];
-cx q[10],q[52];
-rx(3.585608204762257) q[52];
-rz(0.5021272028982785) q[53];
-cx q[21],q[53];
-rz(0.5021272028982785) q[54];
-cx q[28],q[54];
-cx q[28],q[58];
-rx(3.585608204762257) q[54];
-rz(0.5021272028982785) q[57];
-cx q[3],q[57];
-cx q[3],q[70];
-rx(3.585608204762257) q[57];
-rz(0.5021272028982785) q[58];
-cx q[28],q[58];
-rx(3.585608204762257) q[58];
-rz(0.5021272028982785) q[59];
-cx q[32],q[59];
-cx q[32],q[68];
-cx q[59],q[69];
-rz(0.5021272028982785) q[61];
-cx q[4],q[61];
-rx(3.585608204762257) q[4];
-cx q[7],q[61];
-rz(0.5021272028982785) q[61];
-cx q[7],q[61];
-rx(3.585608204762257) q[7];
-rx(3.585608204762257) q[61];
-rz(0.5021272028982785) q[62];
-cx q[0],q[62];
-cx q[0],q[64];
-cx q[17],q[62];
-rz(0.5021272028982785) q[62];
-cx q[17],q[62];
-rx(3.585608204762257) q[62];
-rz(0.5021272028982785) q[63];
-cx q[12],q[63];
-rx(3.585608204762257) q[12];
-cx q[17],q[63];
-rz(0.5021272028982785) q[63];
-cx q[17],q[63];
-cx q[17],q[66];
-cx q[63],q[74];
-rz(0.5021272028982785) q[64];
-cx q[0],q[64];
-cx q[0],q[75];
-cx q[10],q[64];
-rz(0.5021272028982785) q[64];
-cx q[10],q[64];
-rx(3.585608204762257) q[10];
-rx(3.585608204762257) q[64];
-rz(0.5021272028982785) q[66];
-cx q[17],q[66];
-rx(3.585608204762257) q[17];
-cx q[47],q[66];
-rz(0.5021272028982785) q[66];
-cx q[47],q[66];
-rx(3.585608204762257) q[47];
-rx(3.585608204762257) q[66];
-rz(0.5021272028982785) q[68];
-cx q[32],q[68];
-cx q[68],q[83];
-rz(0.5021272028982785) q[69];
-cx q[59],q[69];
-cx q[59],q[73];
-rx(3.585608204762257) q[69];
-rz(0.5021272028982785) q[70];
-cx q[3],q[70];
-cx q[3],q[71];
-cx q[15],q[70];
-rz(0.5021272028982785) q[70];
-cx q[15],q[70];
-cx q[15],q[80];
-cx q[70],q[84];
-rz(0.5021272028982785) q[71];
-cx q[3],q[71];
-cx q[3],q[77];
-cx q[53],q[71];
-rz(0.5021272028982785) q[71];
-cx q[53],q[71];
-cx q[53],q[86];
-rx(3.585608204762257) q[71];
-rz(0.5021272028982785) q[72];
-cx q[44],q[72];
-rx(3.585608204762257) q[44];
-rx(3.585608204762257) q[72];
-rz(0.5021272028982785) q[73];
-cx q[59],q[73];
-cx q[59],q[85];
-rz(0.5021272028982785) q[74];
-cx q[63],q[74];
-rx(3.585608204762257) q[63];
-rx(3.585608204762257) q[74];
-rz(0.5021272028982785) q[75];
-cx q[0],q[75];
-cx q[0],q[82];
-cx q[21],q[75];
-rz(0.5021272028982785) q[75];
-cx q[21],q[75];
-cx q[21],q[81];
-rx(3.585608204762257) q[75];
-rz(0.5021272028982785) q[77];
-cx q[3],q[77];
-rx(3.585608204762257) q[3];
-cx q[30],q[77];
-rz(0.5021272028982785) q[77];
-cx q[30],q[77];
-rx(3.585608204762257) q[30];
-rz(0.5021272028982785) q[78];
-cx q[42],q[78];
-rx(3.585608204762257) q[42];
-cx q[60],q[78];
-rz(0.5021272028982785) q[78];
-cx q[60],q[78];
-rx(3.585608204762257) q[60];
-rx(3.585608204762257) q[78];
-rz(0.5021272028982785) q[79];
-cx q[50],q[79];
-rx(3.585608204762257) q[50];
-rx(3.585608204762257) q[79];
-rz(0.5021272028982785) q[80];
-cx q[15],q[80];
-rx(3.585608204762257) q[15];
-rx(3.585608204762257) q[80];
-rz(0.5021272028982785) q[81];
-cx q[21],q[81];
-rx(3.585608204762257) q[21];
-cx q[77],q[81];
-rz(0.5021272028982785) q[81];
-cx q[77],q[81];
-rx(3.585608204762257) q[77];
-rx(3.585608204762257) q[81];
-rz(0.5021272028982785) q[82];
-cx q[0],q[82];
-rx(3.585608204762257) q[0];
-cx q[56],q[82];
-rz(0.5021272028982785) q[82];
-cx q[56],q[82];
-rx(3.585608204762257) q[56];
-rx(3.585608204762257) q[82];
-rz(0.5021272028982785) q[83];
-cx q[68],q[83];
-rx(3.585608204762257) q[68];
-rx(3.585608204762257) q[83];
-rz(0.5021272028982785) q[84];
-cx q[70],q[84];
-rx(3.585608204762257) q[70];
-cx q[73],q[84];
-rz(0.5021272028982785) q[84];
-cx q[73],q[84];
-rx(3.585608204762257) q[73];
-rx(3.585608204762257) q[84];
-rz(0.5021272028982785) q[85];
-cx q[59],q[85];
-rx(3.585608204762257) q[59];
-rx(3.585608204762257) q[85];
-rz(0.5021272028982785) q[86];
-cx q[53],q[86];
-rx(3.585608204762257) q[53];
-rx(3.585608204762257) q[86];
-rx(7.710960105004434) q[87];
-cx q[28],q[87];
-rz(0.5021272028982785) q[87];
-cx q[28],q[87];
-rx(3.585608204762257) q[28];
-cx q[32],q[87];
-rz(0.5021272028982785) q[87];
-cx q[32],q[87];
-rx(3.585608204762257) q[32];
-rx(3.585608204762257) q[87];
\ No newline at end of file
@@ -1,2014 +0,0 @@
-OPENQASM 2.0;
-include "qelib1.inc";
-qreg q[89];
-ry(pi/2) q[0];
-rx(pi) q[0];
-ry(pi/2) q[1];
-rx(pi) q[1];
-cx q[0],q[1];
-rz(2.7011261283201207) q[1];
-cx q[0],q[1];
-ry(pi/2) q[2];
-rx(pi) q[2];
-cx q[0],q[2];
-rz(2.7011261283201207) q[2];
-cx q[0],q[2];
-rx(9.567706388343874) q[2];
-ry(pi/2) q[3];
-rx(pi) q[3];
-cx q[0],q[3];
-rz(2.7011261283201207) q[3];
-cx q[0],q[3];
-cx q[1],q[3];
-rz(2.7011261283201207) q[3];
-cx q[1],q[3];
-ry(pi/2) q[4];
-rx(pi) q[4];
-cx q[1],q[4];
-rz(2.7011261283201207) q[4];
-cx q[1],q[4];
-cx q[3],q[4];
-rz(2.7011261283201207) q[4];
-cx q[3],q[4];
-ry(pi/2) q[5];
-rx(pi) q[5];
-cx q[1],q[5];
-rz(2.7011261283201207) q[5];
-cx q[1],q[5];
-cx q[3],q[5];
-rz(2.7011261283201207) q[5];
-cx q[3],q[5];
-ry(pi/2) q[6];
-rx(pi) q[6];
-cx q[4],q[6];
-rz(2.7011261283201207) q[6];
-cx q[4],q[6];
-cx q[5],q[6];
-rz(2.7011261283201207) q[6];
-cx q[5],q[6];
-ry(pi/2) q[7];
-rx(pi) q[7];
-cx q[3],q[7];
-rz(2.7011261283201207) q[7];
-cx q[3],q[7];
-cx q[4],q[7];
-rz(2.7011261283201207) q[7];
-cx q[4],q[7];
-ry(pi/2) q[8];
-rx(pi) q[8];
-cx q[3],q[8];
-rz(2.7011261283201207) q[8];
-cx q[3],q[8];
-cx q[5],q[8];
-rz(2.7011261283201207) q[8];
-cx q[5],q[8];
-ry(pi/2) q[9];
-rx(pi) q[9];
-cx q[1],q[9];
-rz(2.7011261283201207) q[9];
-cx q[1],q[9];
-cx q[3],q[9];
-rz(2.7011261283201207) q[9];
-cx q[3],q[9];
-ry(pi/2) q[10];
-rx(pi) q[10];
-cx q[4],q[10];
-rz(2.7011261283201207) q[10];
-cx q[4],q[10];
-cx q[6],q[10];
-rz(2.7011261283201207) q[10];
-cx q[6],q[10];
-ry(pi/2) q[11];
-rx(pi) q[11];
-cx q[5],q[11];
-rz(2.7011261283201207) q[11];
-cx q[5],q[11];
-cx q[6],q[11];
-rz(2.7011261283201207) q[11];
-cx q[6],q[11];
-rx(9.567706388343874) q[11];
-ry(pi/2) q[12];
-rx(pi) q[12];
-cx q[3],q[12];
-rz(2.7011261283201207) q[12];
-cx q[3],q[12];
-cx q[5],q[12];
-rz(2.7011261283201207) q[12];
-cx q[5],q[12];
-ry(pi/2) q[13];
-rx(pi) q[13];
-cx q[4],q[13];
-rz(2.7011261283201207) q[13];
-cx q[4],q[13];
-cx q[5],q[13];
-rz(2.7011261283201207) q[13];
-cx q[5],q[13];
-ry(pi/2) q[14];
-rx(pi) q[14];
-cx q[3],q[14];
-rz(2.7011261283201207) q[14];
-cx q[3],q[14];
-cx q[4],q[14];
-rz(2.7011261283201207) q[14];
-cx q[4],q[14];
-rx(9.567706388343874) q[14];
-ry(pi/2) q[15];
-rx(pi) q[15];
-cx q[0],q[15];
-rz(2.7011261283201207) q[15];
-cx q[0],q[15];
-cx q[3],q[15];
-rz(2.7011261283201207) q[15];
-cx q[3],q[15];
-ry(pi/2) q[16];
-rx(pi) q[16];
-cx q[0],q[16];
-rz(2.7011261283201207) q[16];
-cx q[0],q[16];
-cx q[3],q[16];
-rz(2.7011261283201207) q[16];
-cx q[3],q[16];
-ry(pi/2) q[17];
-rx(pi) q[17];
-cx q[1],q[17];
-rz(2.7011261283201207) q[17];
-cx q[1],q[17];
-cx q[3],q[17];
-rz(2.7011261283201207) q[17];
-cx q[3],q[17];
-ry(pi/2) q[18];
-rx(pi) q[18];
-cx q[3],q[18];
-rz(2.7011261283201207) q[18];
-cx q[3],q[18];
-cx q[4],q[18];
-rz(2.7011261283201207) q[18];
-cx q[4],q[18];
-ry(pi/2) q[19];
-rx(pi) q[19];
-cx q[3],q[19];
-rz(2.7011261283201207) q[19];
-cx q[3],q[19];
-cx q[7],q[19];
-rz(2.7011261283201207) q[19];
-cx q[7],q[19];
-ry(pi/2) q[20];
-rx(pi) q[20];
-cx q[0],q[20];
-rz(2.7011261283201207) q[20];
-cx q[0],q[20];
-cx q[15],q[20];
-rz(2.7011261283201207) q[20];
-cx q[15],q[20];
-ry(pi/2) q[21];
-rx(pi) q[21];
-cx q[4],q[21];
-rz(2.7011261283201207) q[21];
-cx q[4],q[21];
-cx q[15],q[21];
-rz(2.7011261283201207) q[21];
-cx q[15],q[21];
-ry(pi/2) q[22];
-rx(pi) q[22];
-cx q[3],q[22];
-rz(2.7011261283201207) q[22];
-cx q[3],q[22];
-cx q[9],q[22];
-rz(2.7011261283201207) q[22];
-cx q[9],q[22];
-rx(9.567706388343874) q[22];
-ry(pi/2) q[23];
-rx(pi) q[23];
-cx q[3],q[23];
-rz(2.7011261283201207) q[23];
-cx q[3],q[23];
-cx q[17],q[23];
-rz(2.7011261283201207) q[23];
-cx q[17],q[23];
-ry(pi/2) q[24];
-rx(pi) q[24];
-cx q[3],q[24];
-rz(2.7011261283201207) q[24];
-cx q[3],q[24];
-cx q[5],q[24];
-rz(2.7011261283201207) q[24];
-cx q[5],q[24];
-ry(pi/2) q[25];
-rx(pi) q[25];
-cx q[3],q[25];
-rz(2.7011261283201207) q[25];
-cx q[3],q[25];
-cx q[12],q[25];
-rz(2.7011261283201207) q[25];
-cx q[12],q[25];
-rx(9.567706388343874) q[25];
-ry(pi/2) q[26];
-rx(pi) q[26];
-cx q[3],q[26];
-rz(2.7011261283201207) q[26];
-cx q[3],q[26];
-cx q[21],q[26];
-rz(2.7011261283201207) q[26];
-cx q[21],q[26];
-ry(pi/2) q[27];
-rx(pi) q[27];
-cx q[4],q[27];
-rz(2.7011261283201207) q[27];
-cx q[4],q[27];
-cx q[6],q[27];
-rz(2.7011261283201207) q[27];
-cx q[6],q[27];
-ry(pi/2) q[28];
-rx(pi) q[28];
-cx q[1],q[28];
-rz(2.7011261283201207) q[28];
-cx q[1],q[28];
-cx q[3],q[28];
-rz(2.7011261283201207) q[28];
-cx q[3],q[28];
-ry(pi/2) q[29];
-rx(pi) q[29];
-cx q[1],q[29];
-rz(2.7011261283201207) q[29];
-cx q[1],q[29];
-cx q[3],q[29];
-rz(2.7011261283201207) q[29];
-cx q[3],q[29];
-rx(9.567706388343874) q[29];
-ry(pi/2) q[30];
-rx(pi) q[30];
-cx q[3],q[30];
-rz(2.7011261283201207) q[30];
-cx q[3],q[30];
-cx q[18],q[30];
-rz(2.7011261283201207) q[30];
-cx q[18],q[30];
-rx(9.567706388343874) q[18];
-ry(pi/2) q[31];
-rx(pi) q[31];
-cx q[12],q[31];
-rz(2.7011261283201207) q[31];
-cx q[12],q[31];
-cx q[26],q[31];
-rz(2.7011261283201207) q[31];
-cx q[26],q[31];
-rx(9.567706388343874) q[26];
-rx(9.567706388343874) q[31];
-ry(pi/2) q[32];
-rx(pi) q[32];
-cx q[0],q[32];
-rz(2.7011261283201207) q[32];
-cx q[0],q[32];
-cx q[21],q[32];
-rz(2.7011261283201207) q[32];
-cx q[21],q[32];
-ry(pi/2) q[33];
-rx(pi) q[33];
-cx q[5],q[33];
-rz(2.7011261283201207) q[33];
-cx q[5],q[33];
-cx q[30],q[33];
-rz(2.7011261283201207) q[33];
-cx q[30],q[33];
-rx(9.567706388343874) q[33];
-ry(pi/2) q[34];
-rx(pi) q[34];
-cx q[3],q[34];
-rz(2.7011261283201207) q[34];
-cx q[3],q[34];
-cx q[12],q[34];
-rz(2.7011261283201207) q[34];
-cx q[12],q[34];
-ry(pi/2) q[35];
-rx(pi) q[35];
-cx q[3],q[35];
-rz(2.7011261283201207) q[35];
-cx q[3],q[35];
-cx q[32],q[35];
-rz(2.7011261283201207) q[35];
-cx q[32],q[35];
-rx(9.567706388343874) q[35];
-ry(pi/2) q[36];
-rx(pi) q[36];
-cx q[15],q[36];
-rz(2.7011261283201207) q[36];
-cx q[15],q[36];
-cx q[20],q[36];
-rz(2.7011261283201207) q[36];
-cx q[20],q[36];
-rx(9.567706388343874) q[36];
-ry(pi/2) q[37];
-rx(pi) q[37];
-cx q[10],q[37];
-rz(2.7011261283201207) q[37];
-cx q[10],q[37];
-cx q[34],q[37];
-rz(2.7011261283201207) q[37];
-cx q[34],q[37];
-rx(9.567706388343874) q[34];
-ry(pi/2) q[38];
-rx(pi) q[38];
-cx q[19],q[38];
-rz(2.7011261283201207) q[38];
-cx q[19],q[38];
-rx(9.567706388343874) q[19];
-cx q[21],q[38];
-rz(2.7011261283201207) q[38];
-cx q[21],q[38];
-ry(pi/2) q[39];
-rx(pi) q[39];
-cx q[3],q[39];
-rz(2.7011261283201207) q[39];
-cx q[3],q[39];
-cx q[13],q[39];
-rz(2.7011261283201207) q[39];
-cx q[13],q[39];
-rx(9.567706388343874) q[39];
-ry(pi/2) q[40];
-rx(pi) q[40];
-cx q[3],q[40];
-rz(2.7011261283201207) q[40];
-cx q[3],q[40];
-cx q[23],q[40];
-rz(2.7011261283201207) q[40];
-cx q[23],q[40];
-rx(9.567706388343874) q[40];
-ry(pi/2) q[41];
-rx(pi) q[41];
-cx q[10],q[41];
-rz(2.7011261283201207) q[41];
-cx q[10],q[41];
-cx q[27],q[41];
-rz(2.7011261283201207) q[41];
-cx q[27],q[41];
-ry(pi/2) q[42];
-rx(pi) q[42];
-cx q[0],q[42];
-rz(2.7011261283201207) q[42];
-cx q[0],q[42];
-cx q[3],q[42];
-rz(2.7011261283201207) q[42];
-cx q[3],q[42];
-ry(pi/2) q[43];
-rx(pi) q[43];
-cx q[3],q[43];
-rz(2.7011261283201207) q[43];
-cx q[3],q[43];
-cx q[20],q[43];
-rz(2.7011261283201207) q[43];
-cx q[20],q[43];
-rx(9.567706388343874) q[20];
-rx(9.567706388343874) q[43];
-ry(pi/2) q[44];
-rx(pi) q[44];
-cx q[3],q[44];
-rz(2.7011261283201207) q[44];
-cx q[3],q[44];
-cx q[12],q[44];
-rz(2.7011261283201207) q[44];
-cx q[12],q[44];
-ry(pi/2) q[45];
-rx(pi) q[45];
-cx q[1],q[45];
-rz(2.7011261283201207) q[45];
-cx q[1],q[45];
-cx q[16],q[45];
-rz(2.7011261283201207) q[45];
-cx q[16],q[45];
-ry(pi/2) q[46];
-rx(pi) q[46];
-cx q[5],q[46];
-rz(2.7011261283201207) q[46];
-cx q[5],q[46];
-cx q[38],q[46];
-rz(2.7011261283201207) q[46];
-cx q[38],q[46];
-rx(9.567706388343874) q[38];
-rx(9.567706388343874) q[46];
-ry(pi/2) q[47];
-rx(pi) q[47];
-cx q[4],q[47];
-rz(2.7011261283201207) q[47];
-cx q[4],q[47];
-cx q[17],q[47];
-rz(2.7011261283201207) q[47];
-cx q[17],q[47];
-ry(pi/2) q[48];
-rx(pi) q[48];
-cx q[0],q[48];
-rz(2.7011261283201207) q[48];
-cx q[0],q[48];
-cx q[30],q[48];
-rz(2.7011261283201207) q[48];
-cx q[30],q[48];
-rx(9.567706388343874) q[48];
-ry(pi/2) q[49];
-rx(pi) q[49];
-cx q[3],q[49];
-rz(2.7011261283201207) q[49];
-cx q[3],q[49];
-cx q[4],q[49];
-rz(2.7011261283201207) q[49];
-cx q[4],q[49];
-rx(9.567706388343874) q[49];
-ry(pi/2) q[50];
-rx(pi) q[50];
-cx q[3],q[50];
-rz(2.7011261283201207) q[50];
-cx q[3],q[50];
-cx q[12],q[50];
-rz(2.7011261283201207) q[50];
-cx q[12],q[50];
-ry(pi/2) q[51];
-rx(pi) q[51];
-cx q[0],q[51];
-rz(2.7011261283201207) q[51];
-cx q[0],q[51];
-cx q[28],q[51];
-rz(2.7011261283201207) q[51];
-cx q[28],q[51];
-rx(9.567706388343874) q[51];
-ry(pi/2) q[52];
-rx(pi) q[52];
-cx q[3],q[52];
-rz(2.7011261283201207) q[52];
-cx q[3],q[52];
-cx q[10],q[52];
-rz(2.7011261283201207) q[52];
-cx q[10],q[52];
-rx(9.567706388343874) q[52];
-ry(pi/2) q[53];
-rx(pi) q[53];
-cx q[17],q[53];
-rz(2.7011261283201207) q[53];
-cx q[17],q[53];
-cx q[21],q[53];
-rz(2.7011261283201207) q[53];
-cx q[21],q[53];
-ry(pi/2) q[54];
-rx(pi) q[54];
-cx q[24],q[54];
-rz(2.7011261283201207) q[54];
-cx q[24],q[54];
-cx q[28],q[54];
-rz(2.7011261283201207) q[54];
-cx q[28],q[54];
-rx(9.567706388343874) q[54];
-ry(pi/2) q[55];
-rx(pi) q[55];
-cx q[9],q[55];
-rz(2.7011261283201207) q[55];
-cx q[9],q[55];
-cx q[15],q[55];
-rz(2.7011261283201207) q[55];
-cx q[15],q[55];
-rx(9.567706388343874) q[55];
-ry(pi/2) q[56];
-rx(pi) q[56];
-cx q[13],q[56];
-rz(2.7011261283201207) q[56];
-cx q[13],q[56];
-cx q[45],q[56];
-rz(2.7011261283201207) q[56];
-cx q[45],q[56];
-rx(9.567706388343874) q[45];
-ry(pi/2) q[57];
-rx(pi) q[57];
-cx q[1],q[57];
-rz(2.7011261283201207) q[57];
-cx q[1],q[57];
-cx q[3],q[57];
-rz(2.7011261283201207) q[57];
-cx q[3],q[57];
-rx(9.567706388343874) q[57];
-ry(pi/2) q[58];
-rx(pi) q[58];
-cx q[24],q[58];
-rz(2.7011261283201207) q[58];
-cx q[24],q[58];
-cx q[28],q[58];
-rz(2.7011261283201207) q[58];
-cx q[28],q[58];
-rx(9.567706388343874) q[58];
-ry(pi/2) q[59];
-rx(pi) q[59];
-cx q[16],q[59];
-rz(2.7011261283201207) q[59];
-cx q[16],q[59];
-cx q[32],q[59];
-rz(2.7011261283201207) q[59];
-cx q[32],q[59];
-ry(pi/2) q[60];
-rx(pi) q[60];
-cx q[1],q[60];
-rz(2.7011261283201207) q[60];
-cx q[1],q[60];
-rx(9.567706388343874) q[1];
-cx q[7],q[60];
-rz(2.7011261283201207) q[60];
-cx q[7],q[60];
-ry(pi/2) q[61];
-rx(pi) q[61];
-cx q[4],q[61];
-rz(2.7011261283201207) q[61];
-cx q[4],q[61];
-rx(9.567706388343874) q[4];
-cx q[7],q[61];
-rz(2.7011261283201207) q[61];
-cx q[7],q[61];
-rx(9.567706388343874) q[7];
-rx(9.567706388343874) q[61];
-ry(pi/2) q[62];
-rx(pi) q[62];
-cx q[0],q[62];
-rz(2.7011261283201207) q[62];
-cx q[0],q[62];
-cx q[17],q[62];
-rz(2.7011261283201207) q[62];
-cx q[17],q[62];
-rx(9.567706388343874) q[62];
-ry(pi/2) q[63];
-rx(pi) q[63];
-cx q[12],q[63];
-rz(2.7011261283201207) q[63];
-cx q[12],q[63];
-rx(9.567706388343874) q[12];
-cx q[17],q[63];
-rz(2.7011261283201207) q[63];
-cx q[17],q[63];
-ry(pi/2) q[64];
-rx(pi) q[64];
-cx q[0],q[64];
-rz(2.7011261283201207) q[64];
-cx q[0],q[64];
-cx q[10],q[64];
-rz(2.7011261283201207) q[64];
-cx q[10],q[64];
-rx(9.567706388343874) q[10];
-rx(9.567706388343874) q[64];
-ry(pi/2) q[65];
-rx(pi) q[65];
-cx q[5],q[65];
-rz(2.7011261283201207) q[65];
-cx q[5],q[65];
-cx q[23],q[65];
-rz(2.7011261283201207) q[65];
-cx q[23],q[65];
-rx(9.567706388343874) q[23];
-rx(9.567706388343874) q[65];
-ry(pi/2) q[66];
-rx(pi) q[66];
-cx q[17],q[66];
-rz(2.7011261283201207) q[66];
-cx q[17],q[66];
-rx(9.567706388343874) q[17];
-cx q[47],q[66];
-rz(2.7011261283201207) q[66];
-cx q[47],q[66];
-rx(9.567706388343874) q[47];
-rx(9.567706388343874) q[66];
-ry(pi/2) q[67];
-rx(pi) q[67];
-cx q[41],q[67];
-rz(2.7011261283201207) q[67];
-cx q[41],q[67];
-rx(9.567706388343874) q[41];
-cx q[56],q[67];
-rz(2.7011261283201207) q[67];
-cx q[56],q[67];
-rx(9.567706388343874) q[67];
-ry(pi/2) q[68];
-rx(pi) q[68];
-cx q[13],q[68];
-rz(2.7011261283201207) q[68];
-cx q[13],q[68];
-rx(9.567706388343874) q[13];
-cx q[32],q[68];
-rz(2.7011261283201207) q[68];
-cx q[32],q[68];
-ry(pi/2) q[69];
-rx(pi) q[69];
-cx q[6],q[69];
-rz(2.7011261283201207) q[69];
-cx q[6],q[69];
-cx q[59],q[69];
-rz(2.7011261283201207) q[69];
-cx q[59],q[69];
-rx(9.567706388343874) q[69];
-ry(pi/2) q[70];
-rx(pi) q[70];
-cx q[3],q[70];
-rz(2.7011261283201207) q[70];
-cx q[3],q[70];
-cx q[15],q[70];
-rz(2.7011261283201207) q[70];
-cx q[15],q[70];
-ry(pi/2) q[71];
-rx(pi) q[71];
-cx q[3],q[71];
-rz(2.7011261283201207) q[71];
-cx q[3],q[71];
-cx q[53],q[71];
-rz(2.7011261283201207) q[71];
-cx q[53],q[71];
-rx(9.567706388343874) q[71];
-ry(pi/2) q[72];
-rx(pi) q[72];
-cx q[27],q[72];
-rz(2.7011261283201207) q[72];
-cx q[27],q[72];
-rx(9.567706388343874) q[27];
-cx q[44],q[72];
-rz(2.7011261283201207) q[72];
-cx q[44],q[72];
-rx(9.567706388343874) q[44];
-rx(9.567706388343874) q[72];
-ry(pi/2) q[73];
-rx(pi) q[73];
-cx q[16],q[73];
-rz(2.7011261283201207) q[73];
-cx q[16],q[73];
-rx(9.567706388343874) q[16];
-cx q[59],q[73];
-rz(2.7011261283201207) q[73];
-cx q[59],q[73];
-ry(pi/2) q[74];
-rx(pi) q[74];
-cx q[56],q[74];
-rz(2.7011261283201207) q[74];
-cx q[56],q[74];
-cx q[63],q[74];
-rz(2.7011261283201207) q[74];
-cx q[63],q[74];
-rx(9.567706388343874) q[63];
-rx(9.567706388343874) q[74];
-ry(pi/2) q[75];
-rx(pi) q[75];
-cx q[0],q[75];
-rz(2.7011261283201207) q[75];
-cx q[0],q[75];
-cx q[21],q[75];
-rz(2.7011261283201207) q[75];
-cx q[21],q[75];
-rx(9.567706388343874) q[75];
-ry(pi/2) q[76];
-rx(pi) q[76];
-cx q[5],q[76];
-rz(2.7011261283201207) q[76];
-cx q[5],q[76];
-rx(9.567706388343874) q[5];
-cx q[6],q[76];
-rz(2.7011261283201207) q[76];
-cx q[6],q[76];
-rx(9.567706388343874) q[76];
-ry(pi/2) q[77];
-rx(pi) q[77];
-cx q[3],q[77];
-rz(2.7011261283201207) q[77];
-cx q[3],q[77];
-cx q[30],q[77];
-rz(2.7011261283201207) q[77];
-cx q[30],q[77];
-rx(9.567706388343874) q[30];
-ry(pi/2) q[78];
-rx(pi) q[78];
-cx q[42],q[78];
-rz(2.7011261283201207) q[78];
-cx q[42],q[78];
-rx(9.567706388343874) q[42];
-cx q[60],q[78];
-rz(2.7011261283201207) q[78];
-cx q[60],q[78];
-rx(9.567706388343874) q[78];
-ry(pi/2) q[79];
-rx(pi) q[79];
-cx q[6],q[79];
-rz(2.7011261283201207) q[79];
-cx q[6],q[79];
-rx(9.567706388343874) q[6];
-cx q[50],q[79];
-rz(2.7011261283201207) q[79];
-cx q[50],q[79];
-rx(9.567706388343874) q[50];
-rx(9.567706388343874) q[79];
-ry(pi/2) q[80];
-rx(pi) q[80];
-cx q[9],q[80];
-rz(2.7011261283201207) q[80];
-cx q[9],q[80];
-rx(9.567706388343874) q[9];
-cx q[15],q[80];
-rz(2.7011261283201207) q[80];
-cx q[15],q[80];
-rx(9.567706388343874) q[15];
-rx(9.567706388343874) q[80];
-ry(pi/2) q[81];
-rx(pi) q[81];
-cx q[21],q[81];
-rz(2.7011261283201207) q[81];
-cx q[21],q[81];
-rx(9.567706388343874) q[21];
-cx q[77],q[81];
-rz(2.7011261283201207) q[81];
-cx q[77],q[81];
-rx(9.567706388343874) q[77];
-rx(9.567706388343874) q[81];
-ry(pi/2) q[82];
-rx(pi) q[82];
-cx q[0],q[82];
-rz(2.7011261283201207) q[82];
-cx q[0],q[82];
-rx(9.567706388343874) q[0];
-cx q[0],q[1];
-rz(2.8900147770416615) q[1];
-cx q[0],q[1];
-cx q[0],q[2];
-rz(2.8900147770416615) q[2];
-cx q[0],q[2];
-rx(4.458336684630771) q[2];
-cx q[56],q[82];
-rz(2.7011261283201207) q[82];
-cx q[56],q[82];
-rx(9.567706388343874) q[56];
-rx(9.567706388343874) q[82];
-ry(pi/2) q[83];
-rx(pi) q[83];
-cx q[8],q[83];
-rz(2.7011261283201207) q[83];
-cx q[8],q[83];
-rx(9.567706388343874) q[8];
-cx q[68],q[83];
-rz(2.7011261283201207) q[83];
-cx q[68],q[83];
-rx(9.567706388343874) q[68];
-rx(9.567706388343874) q[83];
-ry(pi/2) q[84];
-rx(pi) q[84];
-cx q[70],q[84];
-rz(2.7011261283201207) q[84];
-cx q[70],q[84];
-rx(9.567706388343874) q[70];
-cx q[73],q[84];
-rz(2.7011261283201207) q[84];
-cx q[73],q[84];
-rx(9.567706388343874) q[73];
-rx(9.567706388343874) q[84];
-ry(pi/2) q[85];
-rx(pi) q[85];
-cx q[37],q[85];
-rz(2.7011261283201207) q[85];
-cx q[37],q[85];
-rx(9.567706388343874) q[37];
-cx q[59],q[85];
-rz(2.7011261283201207) q[85];
-cx q[59],q[85];
-rx(9.567706388343874) q[59];
-rx(9.567706388343874) q[85];
-ry(pi/2) q[86];
-rx(pi) q[86];
-cx q[24],q[86];
-rz(2.7011261283201207) q[86];
-cx q[24],q[86];
-rx(9.567706388343874) q[24];
-cx q[53],q[86];
-rz(2.7011261283201207) q[86];
-cx q[53],q[86];
-rx(9.567706388343874) q[53];
-rx(9.567706388343874) q[86];
-ry(pi/2) q[87];
-rx(pi) q[87];
-cx q[28],q[87];
-rz(2.7011261283201207) q[87];
-cx q[28],q[87];
-rx(9.567706388343874) q[28];
-cx q[32],q[87];
-rz(2.7011261283201207) q[87];
-cx q[32],q[87];
-rx(9.567706388343874) q[32];
-rx(9.567706388343874) q[87];
-ry(pi/2) q[88];
-rx(pi) q[88];
-cx q[3],q[88];
-rz(2.7011261283201207) q[88];
-cx q[3],q[88];
-rx(9.567706388343874) q[3];
-cx q[0],q[3];
-rz(2.8900147770416615) q[3];
-cx q[0],q[3];
-cx q[0],q[15];
-cx q[1],q[3];
-rz(2.8900147770416615) q[3];
-cx q[1],q[3];
-cx q[1],q[4];
-rz(2.8900147770416615) q[4];
-cx q[1],q[4];
-cx q[1],q[5];
-cx q[3],q[4];
-rz(2.8900147770416615) q[4];
-cx q[3],q[4];
-cx q[4],q[6];
-rz(2.8900147770416615) q[5];
-cx q[1],q[5];
-cx q[1],q[9];
-cx q[3],q[5];
-rz(2.8900147770416615) q[5];
-cx q[3],q[5];
-cx q[3],q[7];
-rz(2.8900147770416615) q[6];
-cx q[4],q[6];
-cx q[5],q[6];
-rz(2.8900147770416615) q[6];
-cx q[5],q[6];
-rz(2.8900147770416615) q[7];
-cx q[3],q[7];
-cx q[3],q[8];
-cx q[4],q[7];
-rz(2.8900147770416615) q[7];
-cx q[4],q[7];
-cx q[4],q[10];
-rz(2.8900147770416615) q[8];
-cx q[3],q[8];
-cx q[5],q[8];
-rz(2.8900147770416615) q[8];
-cx q[5],q[8];
-cx q[5],q[11];
-cx q[8],q[83];
-rz(2.8900147770416615) q[9];
-cx q[1],q[9];
-cx q[1],q[17];
-cx q[3],q[9];
-rz(2.8900147770416615) q[9];
-cx q[3],q[9];
-cx q[3],q[12];
-rz(2.8900147770416615) q[10];
-cx q[4],q[10];
-cx q[4],q[13];
-cx q[6],q[10];
-rz(2.8900147770416615) q[10];
-cx q[6],q[10];
-cx q[10],q[37];
-rz(2.8900147770416615) q[11];
-cx q[5],q[11];
-cx q[6],q[11];
-rz(2.8900147770416615) q[11];
-cx q[6],q[11];
-rx(4.458336684630771) q[11];
-rz(2.8900147770416615) q[12];
-cx q[3],q[12];
-cx q[3],q[14];
-cx q[5],q[12];
-rz(2.8900147770416615) q[12];
-cx q[5],q[12];
-rz(2.8900147770416615) q[13];
-cx q[4],q[13];
-cx q[5],q[13];
-rz(2.8900147770416615) q[13];
-cx q[5],q[13];
-rz(2.8900147770416615) q[14];
-cx q[3],q[14];
-cx q[4],q[14];
-rz(2.8900147770416615) q[14];
-cx q[4],q[14];
-rx(4.458336684630771) q[14];
-rz(2.8900147770416615) q[15];
-cx q[0],q[15];
-cx q[0],q[16];
-cx q[3],q[15];
-rz(2.8900147770416615) q[15];
-cx q[3],q[15];
-rz(2.8900147770416615) q[16];
-cx q[0],q[16];
-cx q[0],q[20];
-cx q[3],q[16];
-rz(2.8900147770416615) q[16];
-cx q[3],q[16];
-rz(2.8900147770416615) q[17];
-cx q[1],q[17];
-cx q[1],q[28];
-cx q[3],q[17];
-rz(2.8900147770416615) q[17];
-cx q[3],q[17];
-cx q[3],q[18];
-rz(2.8900147770416615) q[18];
-cx q[3],q[18];
-cx q[3],q[19];
-cx q[4],q[18];
-rz(2.8900147770416615) q[18];
-cx q[4],q[18];
-cx q[4],q[21];
-rz(2.8900147770416615) q[19];
-cx q[3],q[19];
-cx q[3],q[22];
-cx q[7],q[19];
-rz(2.8900147770416615) q[19];
-cx q[7],q[19];
-cx q[19],q[38];
-rz(2.8900147770416615) q[20];
-cx q[0],q[20];
-cx q[0],q[32];
-cx q[15],q[20];
-rz(2.8900147770416615) q[20];
-cx q[15],q[20];
-rz(2.8900147770416615) q[21];
-cx q[4],q[21];
-cx q[4],q[27];
-cx q[15],q[21];
-rz(2.8900147770416615) q[21];
-cx q[15],q[21];
-cx q[15],q[36];
-rz(2.8900147770416615) q[22];
-cx q[3],q[22];
-cx q[3],q[23];
-cx q[9],q[22];
-rz(2.8900147770416615) q[22];
-cx q[9],q[22];
-cx q[9],q[55];
-rx(4.458336684630771) q[22];
-rz(2.8900147770416615) q[23];
-cx q[3],q[23];
-cx q[3],q[24];
-cx q[17],q[23];
-rz(2.8900147770416615) q[23];
-cx q[17],q[23];
-rz(2.8900147770416615) q[24];
-cx q[3],q[24];
-cx q[3],q[25];
-cx q[5],q[24];
-rz(2.8900147770416615) q[24];
-cx q[5],q[24];
-cx q[5],q[33];
-cx q[24],q[54];
-rz(2.8900147770416615) q[25];
-cx q[3],q[25];
-cx q[3],q[26];
-cx q[12],q[25];
-rz(2.8900147770416615) q[25];
-cx q[12],q[25];
-cx q[12],q[31];
-rx(4.458336684630771) q[25];
-rz(2.8900147770416615) q[26];
-cx q[3],q[26];
-cx q[21],q[26];
-rz(2.8900147770416615) q[26];
-cx q[21],q[26];
-rz(2.8900147770416615) q[27];
-cx q[4],q[27];
-cx q[4],q[47];
-cx q[6],q[27];
-rz(2.8900147770416615) q[27];
-cx q[6],q[27];
-cx q[6],q[69];
-rz(2.8900147770416615) q[28];
-cx q[1],q[28];
-cx q[1],q[29];
-cx q[3],q[28];
-rz(2.8900147770416615) q[28];
-cx q[3],q[28];
-rz(2.8900147770416615) q[29];
-cx q[1],q[29];
-cx q[1],q[45];
-cx q[3],q[29];
-rz(2.8900147770416615) q[29];
-cx q[3],q[29];
-cx q[3],q[30];
-rx(4.458336684630771) q[29];
-rz(2.8900147770416615) q[30];
-cx q[3],q[30];
-cx q[3],q[34];
-cx q[18],q[30];
-rz(2.8900147770416615) q[30];
-cx q[18],q[30];
-rx(4.458336684630771) q[18];
-rz(2.8900147770416615) q[31];
-cx q[12],q[31];
-cx q[26],q[31];
-rz(2.8900147770416615) q[31];
-cx q[26],q[31];
-rx(4.458336684630771) q[26];
-rx(4.458336684630771) q[31];
-rz(2.8900147770416615) q[32];
-cx q[0],q[32];
-cx q[0],q[42];
-cx q[21],q[32];
-rz(2.8900147770416615) q[32];
-cx q[21],q[32];
-rz(2.8900147770416615) q[33];
-cx q[5],q[33];
-cx q[5],q[46];
-cx q[30],q[33];
-rz(2.8900147770416615) q[33];
-cx q[30],q[33];
-rx(4.458336684630771) q[33];
-rz(2.8900147770416615) q[34];
-cx q[3],q[34];
-cx q[3],q[35];
-cx q[12],q[34];
-rz(2.8900147770416615) q[34];
-cx q[12],q[34];
-rz(2.8900147770416615) q[35];
-cx q[3],q[35];
-cx q[3],q[39];
-cx q[32],q[35];
-rz(2.8900147770416615) q[35];
-cx q[32],q[35];
-rx(4.458336684630771) q[35];
-rz(2.8900147770416615) q[36];
-cx q[15],q[36];
-cx q[20],q[36];
-rz(2.8900147770416615) q[36];
-cx q[20],q[36];
-rx(4.458336684630771) q[36];
-rz(2.8900147770416615) q[37];
-cx q[10],q[37];
-cx q[10],q[41];
-cx q[34],q[37];
-rz(2.8900147770416615) q[37];
-cx q[34],q[37];
-rx(4.458336684630771) q[34];
-cx q[37],q[85];
-rz(2.8900147770416615) q[38];
-cx q[19],q[38];
-rx(4.458336684630771) q[19];
-cx q[21],q[38];
-rz(2.8900147770416615) q[38];
-cx q[21],q[38];
-rz(2.8900147770416615) q[39];
-cx q[3],q[39];
-cx q[3],q[40];
-cx q[13],q[39];
-rz(2.8900147770416615) q[39];
-cx q[13],q[39];
-cx q[13],q[56];
-rx(4.458336684630771) q[39];
-rz(2.8900147770416615) q[40];
-cx q[3],q[40];
-cx q[23],q[40];
-rz(2.8900147770416615) q[40];
-cx q[23],q[40];
-rx(4.458336684630771) q[40];
-rz(2.8900147770416615) q[41];
-cx q[10],q[41];
-cx q[27],q[41];
-rz(2.8900147770416615) q[41];
-cx q[27],q[41];
-cx q[27],q[72];
-cx q[41],q[67];
-rz(2.8900147770416615) q[42];
-cx q[0],q[42];
-cx q[0],q[48];
-cx q[3],q[42];
-rz(2.8900147770416615) q[42];
-cx q[3],q[42];
-cx q[3],q[43];
-cx q[42],q[78];
-rz(2.8900147770416615) q[43];
-cx q[3],q[43];
-cx q[3],q[44];
-cx q[20],q[43];
-rz(2.8900147770416615) q[43];
-cx q[20],q[43];
-rx(4.458336684630771) q[20];
-rx(4.458336684630771) q[43];
-rz(2.8900147770416615) q[44];
-cx q[3],q[44];
-cx q[3],q[49];
-cx q[12],q[44];
-rz(2.8900147770416615) q[44];
-cx q[12],q[44];
-rz(2.8900147770416615) q[45];
-cx q[1],q[45];
-cx q[1],q[57];
-cx q[16],q[45];
-rz(2.8900147770416615) q[45];
-cx q[16],q[45];
-cx q[16],q[59];
-rz(2.8900147770416615) q[46];
-cx q[5],q[46];
-cx q[5],q[65];
-cx q[38],q[46];
-rz(2.8900147770416615) q[46];
-cx q[38],q[46];
-rx(4.458336684630771) q[38];
-rx(4.458336684630771) q[46];
-rz(2.8900147770416615) q[47];
-cx q[4],q[47];
-cx q[17],q[47];
-rz(2.8900147770416615) q[47];
-cx q[17],q[47];
-cx q[17],q[53];
-rz(2.8900147770416615) q[48];
-cx q[0],q[48];
-cx q[0],q[51];
-cx q[30],q[48];
-rz(2.8900147770416615) q[48];
-cx q[30],q[48];
-rx(4.458336684630771) q[48];
-rz(2.8900147770416615) q[49];
-cx q[3],q[49];
-cx q[3],q[50];
-cx q[4],q[49];
-rz(2.8900147770416615) q[49];
-cx q[4],q[49];
-cx q[4],q[61];
-rx(4.458336684630771) q[49];
-rz(2.8900147770416615) q[50];
-cx q[3],q[50];
-cx q[3],q[52];
-cx q[12],q[50];
-rz(2.8900147770416615) q[50];
-cx q[12],q[50];
-cx q[12],q[63];
-rz(2.8900147770416615) q[51];
-cx q[0],q[51];
-cx q[0],q[62];
-cx q[28],q[51];
-rz(2.8900147770416615) q[51];
-cx q[28],q[51];
-rx(4.458336684630771) q[51];
-rz(2.8900147770416615) q[52];
-cx q[3],q[52];
-cx q[10],q[52];
-rz(2.8900147770416615) q[52];
-cx q[10],q[52];
-rx(4.458336684630771) q[52];
-rz(2.8900147770416615) q[53];
-cx q[17],q[53];
-cx q[21],q[53];
-rz(2.8900147770416615) q[53];
-cx q[21],q[53];
-rz(2.8900147770416615) q[54];
-cx q[24],q[54];
-cx q[24],q[58];
-cx q[28],q[54];
-rz(2.8900147770416615) q[54];
-cx q[28],q[54];
-rx(4.458336684630771) q[54];
-rz(2.8900147770416615) q[55];
-cx q[9],q[55];
-cx q[9],q[80];
-cx q[15],q[55];
-rz(2.8900147770416615) q[55];
-cx q[15],q[55];
-rx(4.458336684630771) q[55];
-rz(2.8900147770416615) q[56];
-cx q[13],q[56];
-cx q[13],q[68];
-cx q[45],q[56];
-rz(2.8900147770416615) q[56];
-cx q[45],q[56];
-rx(4.458336684630771) q[45];
-rz(2.8900147770416615) q[57];
-cx q[1],q[57];
-cx q[3],q[57];
-rz(2.8900147770416615) q[57];
-cx q[3],q[57];
-cx q[3],q[70];
-rx(4.458336684630771) q[57];
-rz(2.8900147770416615) q[58];
-cx q[24],q[58];
-cx q[24],q[86];
-cx q[28],q[58];
-rz(2.8900147770416615) q[58];
-cx q[28],q[58];
-cx q[28],q[87];
-rx(4.458336684630771) q[58];
-rz(2.8900147770416615) q[59];
-cx q[16],q[59];
-cx q[16],q[73];
-cx q[32],q[59];
-rz(2.8900147770416615) q[59];
-cx q[32],q[59];
-cx q[60],q[88];
-rz(2.8900147770416615) q[61];
-cx q[4],q[61];
-rx(4.458336684630771) q[4];
-rz(2.8900147770416615) q[62];
-cx q[0],q[62];
-cx q[0],q[64];
-cx q[17],q[62];
-rz(2.8900147770416615) q[62];
-cx q[17],q[62];
-rx(4.458336684630771) q[62];
-rz(2.8900147770416615) q[63];
-cx q[12],q[63];
-rx(4.458336684630771) q[12];
-cx q[17],q[63];
-rz(2.8900147770416615) q[63];
-cx q[17],q[63];
-cx q[17],q[66];
-rz(2.8900147770416615) q[64];
-cx q[0],q[64];
-cx q[0],q[75];
-cx q[10],q[64];
-rz(2.8900147770416615) q[64];
-cx q[10],q[64];
-rx(4.458336684630771) q[10];
-rx(4.458336684630771) q[64];
-rz(2.8900147770416615) q[65];
-cx q[5],q[65];
-cx q[5],q[76];
-cx q[23],q[65];
-rz(2.8900147770416615) q[65];
-cx q[23],q[65];
-rx(4.458336684630771) q[23];
-rx(4.458336684630771) q[65];
-rz(2.8900147770416615) q[66];
-cx q[17],q[66];
-rx(4.458336684630771) q[17];
-cx q[47],q[66];
-rz(2.8900147770416615) q[66];
-cx q[47],q[66];
-rx(4.458336684630771) q[47];
-rx(4.458336684630771) q[66];
-rz(2.8900147770416615) q[67];
-cx q[41],q[67];
-rx(4.458336684630771) q[41];
-cx q[56],q[67];
-rz(2.8900147770416615) q[67];
-cx q[56],q[67];
-cx q[56],q[74];
-rx(4.458336684630771) q[67];
-rz(2.8900147770416615) q[68];
-cx q[13],q[68];
-rx(4.458336684630771) q[13];
-cx q[32],q[68];
-rz(2.8900147770416615) q[68];
-cx q[32],q[68];
-rz(2.8900147770416615) q[69];
-cx q[6],q[69];
-cx q[59],q[69];
-rz(2.8900147770416615) q[69];
-cx q[59],q[69];
-rx(4.458336684630771) q[69];
-rz(2.8900147770416615) q[70];
-cx q[3],q[70];
-cx q[3],q[71];
-cx q[15],q[70];
-rz(2.8900147770416615) q[70];
-cx q[15],q[70];
-cx q[70],q[84];
-rz(2.8900147770416615) q[71];
-cx q[3],q[71];
-cx q[3],q[77];
-cx q[53],q[71];
-rz(2.8900147770416615) q[71];
-cx q[53],q[71];
-rx(4.458336684630771) q[71];
-rz(2.8900147770416615) q[72];
-cx q[27],q[72];
-rx(4.458336684630771) q[27];
-cx q[44],q[72];
-rz(2.8900147770416615) q[72];
-cx q[44],q[72];
-rx(4.458336684630771) q[44];
-rx(4.458336684630771) q[72];
-rz(2.8900147770416615) q[73];
-cx q[16],q[73];
-rx(4.458336684630771) q[16];
-cx q[59],q[73];
-rz(2.8900147770416615) q[73];
-cx q[59],q[73];
-rz(2.8900147770416615) q[74];
-cx q[56],q[74];
-cx q[63],q[74];
-rz(2.8900147770416615) q[74];
-cx q[63],q[74];
-rx(4.458336684630771) q[63];
-rx(4.458336684630771) q[74];
-rz(2.8900147770416615) q[75];
-cx q[0],q[75];
-cx q[0],q[82];
-cx q[21],q[75];
-rz(2.8900147770416615) q[75];
-cx q[21],q[75];
-cx q[21],q[81];
-rx(4.458336684630771) q[75];
-rz(2.8900147770416615) q[76];
-cx q[5],q[76];
-rx(4.458336684630771) q[5];
-cx q[6],q[76];
-rz(2.8900147770416615) q[76];
-cx q[6],q[76];
-cx q[6],q[79];
-rx(4.458336684630771) q[76];
-rz(2.8900147770416615) q[77];
-cx q[3],q[77];
-cx q[30],q[77];
-rz(2.8900147770416615) q[77];
-cx q[30],q[77];
-rx(4.458336684630771) q[30];
-rz(2.8900147770416615) q[78];
-cx q[42],q[78];
-rx(4.458336684630771) q[42];
-rz(2.8900147770416615) q[79];
-cx q[6],q[79];
-rx(4.458336684630771) q[6];
-cx q[50],q[79];
-rz(2.8900147770416615) q[79];
-cx q[50],q[79];
-rx(4.458336684630771) q[50];
-rx(4.458336684630771) q[79];
-rz(2.8900147770416615) q[80];
-cx q[9],q[80];
-rx(4.458336684630771) q[9];
-cx q[15],q[80];
-rz(2.8900147770416615) q[80];
-cx q[15],q[80];
-rx(4.458336684630771) q[15];
-rx(4.458336684630771) q[80];
-rz(2.8900147770416615) q[81];
-cx q[21],q[81];
-rx(4.458336684630771) q[21];
-cx q[77],q[81];
-rz(2.8900147770416615) q[81];
-cx q[77],q[81];
-rx(4.458336684630771) q[77];
-rx(4.458336684630771) q[81];
-rz(2.8900147770416615) q[82];
-cx q[0],q[82];
-rx(4.458336684630771) q[0];
-cx q[56],q[82];
-rz(2.8900147770416615) q[82];
-cx q[56],q[82];
-rx(4.458336684630771) q[56];
-rx(4.458336684630771) q[82];
-rz(2.8900147770416615) q[83];
-cx q[8],q[83];
-rx(4.458336684630771) q[8];
-cx q[68],q[83];
-rz(2.8900147770416615) q[83];
-cx q[68],q[83];
-rx(4.458336684630771) q[68];
-rx(4.458336684630771) q[83];
-rz(2.8900147770416615) q[84];
-cx q[70],q[84];
-rx(4.458336684630771) q[70];
-cx q[73],q[84];
-rz(2.8900147770416615) q[84];
-cx q[73],q[84];
-rx(4.458336684630771) q[73];
-rx(4.458336684630771) q[84];
-rz(2.8900147770416615) q[85];
-cx q[37],q[85];
-rx(4.458336684630771) q[37];
-cx q[59],q[85];
-rz(2.8900147770416615) q[85];
-cx q[59],q[85];
-rx(4.458336684630771) q[59];
-rx(4.458336684630771) q[85];
-rz(2.8900147770416615) q[86];
-cx q[24],q[86];
-rx(4.458336684630771) q[24];
-cx q[53],q[86];
-rz(2.8900147770416615) q[86];
-cx q[53],q[86];
-rx(4.458336684630771) q[53];
-rx(4.458336684630771) q[86];
-rz(2.8900147770416615) q[87];
-cx q[28],q[87];
-rx(4.458336684630771) q[28];
-cx q[32],q[87];
-rz(2.8900147770416615) q[87];
-cx q[32],q[87];
-rx(4.458336684630771) q[32];
-rx(4.458336684630771) q[87];
-rz(2.7011261283201207) q[88];
-cx q[60],q[88];
-rx(9.567706388343874) q[60];
-cx q[1],q[60];
-rz(2.8900147770416615) q[60];
-cx q[1],q[60];
-rx(4.458336684630771) q[1];
-cx q[0],q[1];
-rz(3.4325914659035646) q[1];
-cx q[0],q[1];
-cx q[0],q[2];
-rz(3.4325914659035646) q[2];
-cx q[0],q[2];
-rx(1.5256137858239056) q[2];
-cx q[7],q[60];
-rz(2.8900147770416615) q[60];
-cx q[7],q[60];
-cx q[7],q[61];
-cx q[60],q[78];
-rz(2.8900147770416615) q[61];
-cx q[7],q[61];
-rx(4.458336684630771) q[7];
-rx(4.458336684630771) q[61];
-rz(2.8900147770416615) q[78];
-cx q[60],q[78];
-rx(4.458336684630771) q[78];
-rx(9.567706388343874) q[88];
-cx q[3],q[88];
-rz(2.8900147770416615) q[88];
-cx q[3],q[88];
-rx(4.458336684630771) q[3];
-cx q[0],q[3];
-rz(3.4325914659035646) q[3];
-cx q[0],q[3];
-cx q[0],q[15];
-cx q[1],q[3];
-rz(3.4325914659035646) q[3];
-cx q[1],q[3];
-cx q[1],q[4];
-rz(3.4325914659035646) q[4];
-cx q[1],q[4];
-cx q[1],q[5];
-cx q[3],q[4];
-rz(3.4325914659035646) q[4];
-cx q[3],q[4];
-cx q[4],q[6];
-rz(3.4325914659035646) q[5];
-cx q[1],q[5];
-cx q[1],q[9];
-cx q[3],q[5];
-rz(3.4325914659035646) q[5];
-cx q[3],q[5];
-cx q[3],q[7];
-rz(3.4325914659035646) q[6];
-cx q[4],q[6];
-cx q[5],q[6];
-rz(3.4325914659035646) q[6];
-cx q[5],q[6];
-rz(3.4325914659035646) q[7];
-cx q[3],q[7];
-cx q[3],q[8];
-cx q[4],q[7];
-rz(3.4325914659035646) q[7];
-cx q[4],q[7];
-cx q[4],q[10];
-rz(3.4325914659035646) q[8];
-cx q[3],q[8];
-cx q[5],q[8];
-rz(3.4325914659035646) q[8];
-cx q[5],q[8];
-cx q[5],q[11];
-cx q[8],q[83];
-rz(3.4325914659035646) q[9];
-cx q[1],q[9];
-cx q[1],q[17];
-cx q[3],q[9];
-rz(3.4325914659035646) q[9];
-cx q[3],q[9];
-cx q[3],q[12];
-rz(3.4325914659035646) q[10];
-cx q[4],q[10];
-cx q[4],q[13];
-cx q[6],q[10];
-rz(3.4325914659035646) q[10];
-cx q[6],q[10];
-cx q[10],q[37];
-rz(3.4325914659035646) q[11];
-cx q[5],q[11];
-cx q[6],q[11];
-rz(3.4325914659035646) q[11];
-cx q[6],q[11];
-rx(1.5256137858239056) q[11];
-rz(3.4325914659035646) q[12];
-cx q[3],q[12];
-cx q[3],q[14];
-cx q[5],q[12];
-rz(3.4325914659035646) q[12];
-cx q[5],q[12];
-rz(3.4325914659035646) q[13];
-cx q[4],q[13];
-cx q[5],q[13];
-rz(3.4325914659035646) q[13];
-cx q[5],q[13];
-rz(3.4325914659035646) q[14];
-cx q[3],q[14];
-cx q[4],q[14];
-rz(3.4325914659035646) q[14];
-cx q[4],q[14];
-rx(1.5256137858239056) q[14];
-rz(3.4325914659035646) q[15];
-cx q[0],q[15];
-cx q[0],q[16];
-cx q[3],q[15];
-rz(3.4325914659035646) q[15];
-cx q[3],q[15];
-rz(3.4325914659035646) q[16];
-cx q[0],q[16];
-cx q[0],q[20];
-cx q[3],q[16];
-rz(3.4325914659035646) q[16];
-cx q[3],q[16];
-rz(3.4325914659035646) q[17];
-cx q[1],q[17];
-cx q[1],q[28];
-cx q[3],q[17];
-rz(3.4325914659035646) q[17];
-cx q[3],q[17];
-cx q[3],q[18];
-rz(3.4325914659035646) q[18];
-cx q[3],q[18];
-cx q[3],q[19];
-cx q[4],q[18];
-rz(3.4325914659035646) q[18];
-cx q[4],q[18];
-cx q[4],q[21];
-rz(3.4325914659035646) q[19];
-cx q[3],q[19];
-cx q[3],q[22];
-cx q[7],q[19];
-rz(3.4325914659035646) q[19];
-cx q[7],q[19];
-cx q[19],q[38];
-rz(3.4325914659035646) q[20];
-cx q[0],q[20];
-cx q[0],q[32];
-cx q[15],q[20];
-rz(3.4325914659035646) q[20];
-cx q[15],q[20];
-rz(3.4325914659035646) q[21];
-cx q[4],q[21];
-cx q[4],q[27];
-cx q[15],q[21];
-rz(3.4325914659035646) q[21];
-cx q[15],q[21];
-cx q[15],q[36];
-rz(3.4325914659035646) q[22];
-cx q[3],q[22];
-cx q[3],q[23];
-cx q[9],q[22];
-rz(3.4325914659035646) q[22];
-cx q[9],q[22];
-cx q[9],q[55];
-rx(1.5256137858239056) q[22];
-rz(3.4325914659035646) q[23];
-cx q[3],q[23];
-cx q[3],q[24];
-cx q[17],q[23];
-rz(3.4325914659035646) q[23];
-cx q[17],q[23];
-rz(3.4325914659035646) q[24];
-cx q[3],q[24];
-cx q[3],q[25];
-cx q[5],q[24];
-rz(3.4325914659035646) q[24];
-cx q[5],q[24];
-cx q[5],q[33];
-cx q[24],q[54];
-rz(3.4325914659035646) q[25];
-cx q[3],q[25];
-cx q[3],q[26];
-cx q[12],q[25];
-rz(3.4325914659035646) q[25];
-cx q[12],q[25];
-cx q[12],q[31];
-rx(1.5256137858239056) q[25];
-rz(3.4325914659035646) q[26];
-cx q[3],q[26];
-cx q[21],q[26];
-rz(3.4325914659035646) q[26];
-cx q[21],q[26];
-rz(3.4325914659035646) q[27];
-cx q[4],q[27];
-cx q[4],q[47];
-cx q[6],q[27];
-rz(3.4325914659035646) q[27];
-cx q[6],q[27];
-cx q[6],q[69];
-rz(3.4325914659035646) q[28];
-cx q[1],q[28];
-cx q[1],q[29];
-cx q[3],q[28];
-rz(3.4325914659035646) q[28];
-cx q[3],q[28];
-rz(3.4325914659035646) q[29];
-cx q[1],q[29];
-cx q[1],q[45];
-cx q[3],q[29];
-rz(3.4325914659035646) q[29];
-cx q[3],q[29];
-cx q[3],q[30];
-rx(1.5256137858239056) q[29];
-rz(3.4325914659035646) q[30];
-cx q[3],q[30];
-cx q[3],q[34];
-cx q[18],q[30];
-rz(3.4325914659035646) q[30];
-cx q[18],q[30];
-rx(1.5256137858239056) q[18];
-rz(3.4325914659035646) q[31];
-cx q[12],q[31];
-cx q[26],q[31];
-rz(3.4325914659035646) q[31];
-cx q[26],q[31];
-rx(1.5256137858239056) q[26];
-rx(1.5256137858239056) q[31];
-rz(3.4325914659035646) q[32];
-cx q[0],q[32];
-cx q[0],q[42];
-cx q[21],q[32];
-rz(3.4325914659035646) q[32];
-cx q[21],q[32];
-rz(3.4325914659035646) q[33];
-cx q[5],q[33];
-cx q[5],q[46];
-cx q[30],q[33];
-rz(3.4325914659035646) q[33];
-cx q[30],q[33];
-rx(1.5256137858239056) q[33];
-rz(3.4325914659035646) q[34];
-cx q[3],q[34];
-cx q[3],q[35];
-cx q[12],q[34];
-rz(3.4325914659035646) q[34];
-cx q[12],q[34];
-rz(3.4325914659035646) q[35];
-cx q[3],q[35];
-cx q[3],q[39];
-cx q[32],q[35];
-rz(3.4325914659035646) q[35];
-cx q[32],q[35];
-rx(1.5256137858239056) q[35];
-rz(3.4325914659035646) q[36];
-cx q[15],q[36];
-cx q[20],q[36];
-rz(3.4325914659035646) q[36];
-cx q[20],q[36];
-rx(1.5256137858239056) q[36];
-rz(3.4325914659035646) q[37];
-cx q[10],q[37];
-cx q[10],q[41];
-cx q[34],q[37];
-rz(3.4325914659035646) q[37];
-cx q[34],q[37];
-rx(1.5256137858239056) q[34];
-cx q[37],q[85];
-rz(3.4325914659035646) q[38];
-cx q[19],q[38];
-rx(1.5256137858239056) q[19];
-cx q[21],q[38];
-rz(3.4325914659035646) q[38];
-cx q[21],q[38];
-rz(3.4325914659035646) q[39];
-cx q[3],q[39];
-cx q[3],q[40];
-cx q[13],q[39];
-rz(3.4325914659035646) q[39];
-cx q[13],q[39];
-cx q[13],q[56];
-rx(1.5256137858239056) q[39];
-rz(3.4325914659035646) q[40];
-cx q[3],q[40];
-cx q[23],q[40];
-rz(3.4325914659035646) q[40];
-cx q[23],q[40];
-rx(1.5256137858239056) q[40];
-rz(3.4325914659035646) q[41];
-cx q[10],q[41];
-cx q[27],q[41];
-rz(3.4325914659035646) q[41];
-cx q[27],q[41];
-cx q[27],q[72];
-cx q[41],q[67];
-rz(3.4325914659035646) q[42];
-cx q[0],q[42];
-cx q[0],q[48];
-cx q[3],q[42];
-rz(3.4325914659035646) q[42];
-cx q[3],q[42];
-cx q[3],q[43];
-cx q[42],q[78];
-rz(3.4325914659035646) q[43];
-cx q[3],q[43];
-cx q[3],q[44];
-cx q[20],q[43];
-rz(3.4325914659035646) q[43];
-cx q[20],q[43];
-rx(1.5256137858239056) q[20];
-rx(1.5256137858239056) q[43];
-rz(3.4325914659035646) q[44];
-cx q[3],q[44];
-cx q[3],q[49];
-cx q[12],q[44];
-rz(3.4325914659035646) q[44];
-cx q[12],q[44];
-rz(3.4325914659035646) q[45];
-cx q[1],q[45];
-cx q[1],q[57];
-cx q[16],q[45];
-rz(3.4325914659035646) q[45];
-cx q[16],q[45];
-cx q[16],q[59];
-rz(3.4325914659035646) q[46];
-cx q[5],q[46];
-cx q[5],q[65];
-cx q[38],q[46];
-rz(3.4325914659035646) q[46];
-cx q[38],q[46];
-rx(1.5256137858239056) q[38];
-rx(1.5256137858239056) q[46];
-rz(3.4325914659035646) q[47];
-cx q[4],q[47];
-cx q[17],q[47];
-rz(3.4325914659035646) q[47];
-cx q[17],q[47];
-cx q[17],q[53];
-rz(3.4325914659035646) q[48];
-cx q[0],q[48];
-cx q[0],q[51];
-cx q[30],q[48];
-rz(3.4325914659035646) q[48];
-cx q[30],q[48];
-rx(1.5256137858239056) q[48];
-rz(3.4325914659035646) q[49];
-cx q[3],q[49];
-cx q[3],q[50];
-cx q[4],q[49];
-rz(3.4325914659035646) q[49];
-cx q[4],q[49];
-cx q[4],q[61];
-rx(1.5256137858239056) q[49];
-rz(3.4325914659035646) q[50];
-cx q[3],q[50];
-cx q[3],q[52];
-cx q[12],q[50];
-rz(3.4325914659035646) q[50];
-cx q[12],q[50];
-cx q[12],q[63];
-rz(3.4325914659035646) q[51];
-cx q[0],q[51];
-cx q[0],q[62];
-cx q[28],q[51];
-rz(3.4325914659035646) q[51];
-cx q[28],q[51];
-rx(1.5256137858239056) q[51];
-rz(3.4325914659035646) q[52];
-cx q[3],q[52];
-cx q[10],q[52];
-rz(3.4325914659035646) q[52];
-cx q[10],q[52];
-rx(1.5256137858239056) q[52];
-rz(3.4325914659035646) q[53];
-cx q[17],q[53];
-cx q[21],q[53];
-rz(3.4325914659035646) q[53];
-cx q[21],q[53];
-rz(3.4325914659035646) q[54];
-cx q[24],q[54];
-cx q[24],q[58];
-cx q[28],q[54];
-rz(3.4325914659035646) q[54];
-cx q[28],q[54];
-rx(1.5256137858239056) q[54];
-rz(3.4325914659035646) q[55];
-cx q[9],q[55];
-cx q[9],q[80];
-cx q[15],q[55];
-rz(3.4325914659035646) q[55];
-cx q[15],q[55];
-rx(1.5256137858239056) q[55];
-rz(3.4325914659035646) q[56];
-cx q[13],q[56];
-cx q[13],q[68];
-cx q[45],q[56];
-rz(3.4325914659035646) q[56];
-cx q[45],q[56];
-rx(1.5256137858239056) q[45];
-rz(3.4325914659035646) q[57];
-cx q[1],q[57];
-cx q[3],q[57];
-rz(3.4325914659035646) q[57];
-cx q[3],q[57];
-cx q[3],q[70];
-rx(1.5256137858239056) q[57];
-rz(3.4325914659035646) q[58];
-cx q[24],q[58];
-cx q[24],q[86];
-cx q[28],q[58];
-rz(3.4325914659035646) q[58];
-cx q[28],q[58];
-cx q[28],q[87];
-rx(1.5256137858239056) q[58];
-rz(3.4325914659035646) q[59];
-cx q[16],q[59];
-cx q[16],q[73];
-cx q[32],q[59];
-rz(3.4325914659035646) q[59];
-cx q[32],q[59];
-cx q[60],q[88];
-rz(3.4325914659035646) q[61];
-cx q[4],q[61];
-rx(1.5256137858239056) q[4];
-rz(3.4325914659035646) q[62];
-cx q[0],q[62];
-cx q[0],q[64];
-cx q[17],q[62];
-rz(3.4325914659035646) q[62];
-cx q[17],q[62];
-rx(1.5256137858239056) q[62];
-rz(3.4325914659035646) q[63];
-cx q[12],q[63];
-rx(1.5256137858239056) q[12];
-cx q[17],q[63];
-rz(3.4325914659035646) q[63];
-cx q[17],q[63];
-cx q[17],q[66];
-rz(3.4325914659035646) q[64];
-cx q[0],q[64];
-cx q[0],q[75];
-cx q[10],q[64];
-rz(3.4325914659035646) q[64];
-cx q[10],q[64];
-rx(1.5256137858239056) q[10];
-rx(1.5256137858239056) q[64];
-rz(3.4325914659035646) q[65];
-cx q[5],q[65];
-cx q[5],q[76];
-cx q[23],q[65];
-rz(3.4325914659035646) q[65];
-cx q[23],q[65];
-rx(1.5256137858239056) q[23];
-rx(1.5256137858239056) q[65];
-rz(3.4325914659035646) q[66];
-cx q[17],q[66];
-rx(1.5256137858239056) q[17];
-cx q[47],q[66];
-rz(3.4325914659035646) q[66];
-cx q[47],q[66];
-rx(1.5256137858239056) q[47];
-rx(1.5256137858239056) q[66];
-rz(3.4325914659035646) q[67];
-cx q[41],q[67];
-rx(1.5256137858239056) q[41];
-cx q[56],q[67];
-rz(3.4325914659035646) q[67];
-cx q[56],q[67];
-cx q[56],q[74];
-rx(1.5256137858239056) q[67];
-rz(3.4325914659035646) q[68];
-cx q[13],q[68];
-rx(1.5256137858239056) q[13];
-cx q[32],q[68];
-rz(3.4325914659035646) q[68];
-cx q[32],q[68];
-rz(3.4325914659035646) q[69];
-cx q[6],q[69];
-cx q[59],q[69];
-rz(3.4325914659035646) q[69];
-cx q[59],q[69];
-rx(1.5256137858239056) q[69];
-rz(3.4325914659035646) q[70];
-cx q[3],q[70];
-cx q[3],q[71];
-cx q[15],q[70];
-rz(3.4325914659035646) q[70];
-cx q[15],q[70];
-cx q[70],q[84];
-rz(3.4325914659035646) q[71];
-cx q[3],q[71];
-cx q[3],q[77];
-cx q[53],q[71];
-rz(3.4325914659035646) q[71];
-cx q[53],q[71];
-rx(1.5256137858239056) q[71];
-rz(3.4325914659035646) q[72];
-cx q[27],q[72];
-rx(1.5256137858239056) q[27];
-cx q[44],q[72];
-rz(3.4325914659035646) q[72];
-cx q[44],q[72];
-rx(1.5256137858239056) q[44];
-rx(1.5256137858239056) q[72];
-rz(3.4325914659035646) q[73];
-cx q[16],q[73];
-rx(1.5256137858239056) q[16];
-cx q[59],q[73];
-rz(3.4325914659035646) q[73];
-cx q[59],q[73];
-rz(3.4325914659035646) q[74];
-cx q[56],q[74];
-cx q[63],q[74];
-rz(3.4325914659035646) q[74];
-cx q[63],q[74];
-rx(1.5256137858239056) q[63];
-rx(1.5256137858239056) q[74];
-rz(3.4325914659035646) q[75];
-cx q[0],q[75];
-cx q[0],q[82];
-cx q[21],q[75];
-rz(3.4325914659035646) q[75];
-cx q[21],q[75];
-cx q[21],q[81];
-rx(1.5256137858239056) q[75];
-rz(3.4325914659035646) q[76];
-cx q[5],q[76];
-rx(1.5256137858239056) q[5];
-cx q[6],q[76];
-rz(3.4325914659035646) q[76];
-cx q[6],q[76];
-cx q[6],q[79];
-rx(1.5256137858239056) q[76];
-rz(3.4325914659035646) q[77];
-cx q[3],q[77];
-cx q[30],q[77];
-rz(3.4325914659035646) q[77];
-cx q[30],q[77];
-rx(1.5256137858239056) q[30];
-rz(3.4325914659035646) q[78];
-cx q[42],q[78];
-rx(1.5256137858239056) q[42];
-rz(3.4325914659035646) q[79];
-cx q[6],q[79];
-rx(1.5256137858239056) q[6];
-cx q[50],q[79];
-rz(3.4325914659035646) q[79];
-cx q[50],q[79];
-rx(1.5256137858239056) q[50];
-rx(1.5256137858239056) q[79];
-rz(3.4325914659035646) q[80];
-cx q[9],q[80];
-rx(1.5256137858239056) q[9];
-cx q[15],q[80];
-rz(3.4325914659035646) q[80];
-cx q[15],q[80];
-rx(1.5256137858239056) q[15];
-rx(1.5256137858239056) q[80];
-rz(3.4325914659035646) q[81];
-cx q[21],q[81];
-rx(1.5256137858239056) q[21];
-cx q[77],q[81];
-rz(3.4325914659035646) q[81];
-cx q[77],q[81];
-rx(1.5256137858239056) q[77];
-rx(1.5256137858239056) q[81];
-rz(3.4325914659035646) q[82];
-cx q[0],q[82];
-rx(1.5256137858239056) q[0];
-cx q[56],q[82];
-rz(3.4325914659035646) q[82];
-cx q[56],q[82];
-rx(1.5256137858239056) q[56];
-rx(1.5256137858239056) q[82];
-rz(3.4325914659035646) q[83];
-cx q[8],q[83];
-rx(1.5256137858239056) q[8];
-cx q[68],q[83];
-rz(3.4325914659035646) q[83];
-cx q[68],q[83];
-rx(1.5256137858239056) q[68];
-rx(1.5256137858239056) q[83];
-rz(3.4325914659035646) q[84];
-cx q[70],q[84];
-rx(1.5256137858239056) q[70];
-cx q[73],q[84];
-rz(3.4325914659035646) q[84];
-cx q[73],q[84];
-rx(1.5256137858239056) q[73];
-rx(1.5256137858239056) q[84];
-rz(3.4325914659035646) q[85];
-cx q[37],q[85];
-rx(1.5256137858239056) q[37];
-cx q[59],q[85];
-rz(3.4325914659035646) q[85];
-cx q[59],q[85];
-rx(1.5256137858239056) q[59];
-rx(1.5256137858239056) q[85];
-rz(3.4325914659035646) q[86];
-cx q[24],q[86];
-rx(1.5256137858239056) q[24];
-cx q[53],q[86];
-rz(3.4325914659035646) q[86];
-cx q[53],q[86];
-rx(1.5256137858239056) q[53];
-rx(1.5256137858239056) q[86];
-rz(3.4325914659035646) q[87];
-cx q[28],q[87];
-rx(1.5256137858239056) q[28];
-cx q[32],q[87];
-rz(3.4325914659035646) q[87];
-cx q[32],q[87];
-rx(1.5256137858239056) q[32];
-rx(1.5256137858239056) q[87];
-rz(2.8900147770416615) q[88];
-cx q[60],q[88];
-rx(4.458336684630771) q[60];
-cx q[1],q[60];
-rz(3.4325914659035646) q[60];
-cx q[1],q[60];
-rx(1.5256137858239056) q[1];
-cx q[7],q[60];
-rz(3.4325914659035646) q[60];
-cx q[7],q[60];
-cx q[7],q[61];
-cx q[60],q[78];
-rz(3.4325914659035646) q[61];
-cx q[7],q[61];
-rx(1.5256137858239056) q[7];
-rx(1.5256137858239056) q[61];
-rz(3.4325914659035646) q[78];
-cx q[60],q[78];
-rx(1.5256137858239056) q[78];
-rx(4.458336684630771) q[88];
-cx q[3],q[88];
-rz(3.4325914659035646) q[88];
-cx q[3],q[88];
-rx(1.5256137858239056) q[3];
-cx q[60],q[88];
-rz(3.4325914659035646) q[88];
-cx q[60],q[88];
-rx(1.5256137858239056) q[60];
-rx(1.5256137858239056) q[88];
\ No newline at end of file
@@ -1,151 +0,0 @@
-OPENQASM 2.0;
-include "qelib1.inc";
-qreg q[8];
-ry(pi/2) q[0];
-rx(pi) q[0];
-ry(pi/2) q[1];
-rx(pi) q[1];
-cx q[0],q[1];
-rz(0.8312933787992296) q[1];
-cx q[0],q[1];
-ry(pi/2) q[2];
-rx(pi) q[2];
-cx q[0],q[2];
-rz(0.8312933787992296) q[2];
-cx q[0],q[2];
-rx(1.9716788696433019) q[2];
-ry(pi/2) q[3];
-rx(pi) q[3];
-cx q[0],q[3];
-rz(0.8312933787992296) q[3];
-cx q[0],q[3];
-rx(1.9716788696433019) q[0];
-cx q[1],q[3];
-rz(0.8312933787992296) q[3];
-cx q[1],q[3];
-ry(pi/2) q[4];
-rx(pi) q[4];
-cx q[1],q[4];
-rz(0.8312933787992296) q[4];
-cx q[1],q[4];
-cx q[3],q[4];
-rz(0.8312933787992296) q[4];
-cx q[3],q[4];
-ry(pi/2) q[5];
-rx(pi) q[5];
-cx q[1],q[5];
-rz(0.8312933787992296) q[5];
-cx q[1],q[5];
-rx(1.9716788696433019) q[1];
-cx q[0],q[1];
-rz(0.41478188160807755) q[1];
-cx q[0],q[1];
-cx q[0],q[2];
-rz(0.41478188160807755) q[2];
-cx q[0],q[2];
-rx(1.6700224095312106) q[2];
-cx q[3],q[5];
-rz(0.8312933787992296) q[5];
-cx q[3],q[5];
-ry(pi/2) q[6];
-rx(pi) q[6];
-cx q[4],q[6];
-rz(0.8312933787992296) q[6];
-cx q[4],q[6];
-cx q[5],q[6];
-rz(0.8312933787992296) q[6];
-cx q[5],q[6];
-rx(1.9716788696433019) q[5];
-rx(1.9716788696433019) q[6];
-ry(pi/2) q[7];
-rx(pi) q[7];
-cx q[3],q[7];
-rz(0.8312933787992296) q[7];
-cx q[3],q[7];
-rx(1.9716788696433019) q[3];
-cx q[0],q[3];
-rz(0.41478188160807755) q[3];
-cx q[0],q[3];
-rx(1.6700224095312106) q[0];
-cx q[1],q[3];
-rz(0.41478188160807755) q[3];
-cx q[1],q[3];
-cx q[4],q[7];
-rz(0.8312933787992296) q[7];
-cx q[4],q[7];
-rx(1.9716788696433019) q[4];
-cx q[1],q[4];
-rz(0.41478188160807755) q[4];
-cx q[1],q[4];
-cx q[1],q[5];
-cx q[3],q[4];
-rz(0.41478188160807755) q[4];
-cx q[3],q[4];
-cx q[4],q[6];
-rz(0.41478188160807755) q[5];
-cx q[1],q[5];
-rx(1.6700224095312106) q[1];
-cx q[0],q[1];
-rz(2.2113081478609895) q[1];
-cx q[0],q[1];
-cx q[0],q[2];
-rz(2.2113081478609895) q[2];
-cx q[0],q[2];
-rx(0.4936342202155362) q[2];
-cx q[3],q[5];
-rz(0.41478188160807755) q[5];
-cx q[3],q[5];
-rz(0.41478188160807755) q[6];
-cx q[4],q[6];
-cx q[5],q[6];
-rz(0.41478188160807755) q[6];
-cx q[5],q[6];
-rx(1.6700224095312106) q[5];
-rx(1.6700224095312106) q[6];
-rx(1.9716788696433019) q[7];
-cx q[3],q[7];
-rz(0.41478188160807755) q[7];
-cx q[3],q[7];
-rx(1.6700224095312106) q[3];
-cx q[0],q[3];
-rz(2.2113081478609895) q[3];
-cx q[0],q[3];
-rx(0.4936342202155362) q[0];
-cx q[1],q[3];
-rz(2.2113081478609895) q[3];
-cx q[1],q[3];
-cx q[4],q[7];
-rz(0.41478188160807755) q[7];
-cx q[4],q[7];
-rx(1.6700224095312106) q[4];
-cx q[1],q[4];
-rz(2.2113081478609895) q[4];
-cx q[1],q[4];
-cx q[1],q[5];
-cx q[3],q[4];
-rz(2.2113081478609895) q[4];
-cx q[3],q[4];
-cx q[4],q[6];
-rz(2.2113081478609895) q[5];
-cx q[1],q[5];
-rx(0.4936342202155362) q[1];
-cx q[3],q[5];
-rz(2.2113081478609895) q[5];
-cx q[3],q[5];
-rz(2.2113081478609895) q[6];
-cx q[4],q[6];
-cx q[5],q[6];
-rz(2.2113081478609895) q[6];
-cx q[5],q[6];
-rx(0.4936342202155362) q[5];
-rx(0.4936342202155362) q[6];
-rx(1.6700224095312106) q[7];
-cx q[3],q[7];
-rz(2.2113081478609895) q[7];
-cx q[3],q[7];
-rx(0.4936342202155362) q[3];
-cx q[4],q[7];
-rz(2.2113081478609895) q[7];
-cx q[4],q[7];
-rx(0.4936342202155362) q[4];
-rx(0.4936342202155362) q[7];
\ No newline at end of file
@@ -1,2083 +0,0 @@
-OPENQASM 2.0;
-include "qelib1.inc";
-qreg q[92];
-ry(pi/2) q[0];
-rx(pi) q[0];
-ry(pi/2) q[1];
-rx(pi) q[1];
-cx q[0],q[1];
-rz(6.056559074501046) q[1];
-cx q[0],q[1];
-ry(pi/2) q[2];
-rx(pi) q[2];
-cx q[0],q[2];
-rz(6.056559074501046) q[2];
-cx q[0],q[2];
-ry(pi/2) q[3];
-rx(pi) q[3];
-cx q[0],q[3];
-rz(6.056559074501046) q[3];
-cx q[0],q[3];
-cx q[1],q[3];
-rz(6.056559074501046) q[3];
-cx q[1],q[3];
-ry(pi/2) q[4];
-rx(pi) q[4];
-cx q[1],q[4];
-rz(6.056559074501046) q[4];
-cx q[1],q[4];
-cx q[3],q[4];
-rz(6.056559074501046) q[4];
-cx q[3],q[4];
-ry(pi/2) q[5];
-rx(pi) q[5];
-cx q[1],q[5];
-rz(6.056559074501046) q[5];
-cx q[1],q[5];
-cx q[3],q[5];
-rz(6.056559074501046) q[5];
-cx q[3],q[5];
-ry(pi/2) q[6];
-rx(pi) q[6];
-cx q[4],q[6];
-rz(6.056559074501046) q[6];
-cx q[4],q[6];
-cx q[5],q[6];
-rz(6.056559074501046) q[6];
-cx q[5],q[6];
-ry(pi/2) q[7];
-rx(pi) q[7];
-cx q[3],q[7];
-rz(6.056559074501046) q[7];
-cx q[3],q[7];
-cx q[4],q[7];
-rz(6.056559074501046) q[7];
-cx q[4],q[7];
-ry(pi/2) q[8];
-rx(pi) q[8];
-cx q[3],q[8];
-rz(6.056559074501046) q[8];
-cx q[3],q[8];
-cx q[5],q[8];
-rz(6.056559074501046) q[8];
-cx q[5],q[8];
-ry(pi/2) q[9];
-rx(pi) q[9];
-cx q[1],q[9];
-rz(6.056559074501046) q[9];
-cx q[1],q[9];
-cx q[3],q[9];
-rz(6.056559074501046) q[9];
-cx q[3],q[9];
-ry(pi/2) q[10];
-rx(pi) q[10];
-cx q[4],q[10];
-rz(6.056559074501046) q[10];
-cx q[4],q[10];
-cx q[6],q[10];
-rz(6.056559074501046) q[10];
-cx q[6],q[10];
-ry(pi/2) q[11];
-rx(pi) q[11];
-cx q[5],q[11];
-rz(6.056559074501046) q[11];
-cx q[5],q[11];
-cx q[6],q[11];
-rz(6.056559074501046) q[11];
-cx q[6],q[11];
-rx(4.511233421145919) q[11];
-ry(pi/2) q[12];
-rx(pi) q[12];
-cx q[3],q[12];
-rz(6.056559074501046) q[12];
-cx q[3],q[12];
-cx q[5],q[12];
-rz(6.056559074501046) q[12];
-cx q[5],q[12];
-ry(pi/2) q[13];
-rx(pi) q[13];
-cx q[4],q[13];
-rz(6.056559074501046) q[13];
-cx q[4],q[13];
-cx q[5],q[13];
-rz(6.056559074501046) q[13];
-cx q[5],q[13];
-ry(pi/2) q[14];
-rx(pi) q[14];
-cx q[3],q[14];
-rz(6.056559074501046) q[14];
-cx q[3],q[14];
-cx q[4],q[14];
-rz(6.056559074501046) q[14];
-cx q[4],q[14];
-rx(4.511233421145919) q[14];
-ry(pi/2) q[15];
-rx(pi) q[15];
-cx q[0],q[15];
-rz(6.056559074501046) q[15];
-cx q[0],q[15];
-cx q[3],q[15];
-rz(6.056559074501046) q[15];
-cx q[3],q[15];
-ry(pi/2) q[16];
-rx(pi) q[16];
-cx q[0],q[16];
-rz(6.056559074501046) q[16];
-cx q[0],q[16];
-cx q[3],q[16];
-rz(6.056559074501046) q[16];
-cx q[3],q[16];
-ry(pi/2) q[17];
-rx(pi) q[17];
-cx q[1],q[17];
-rz(6.056559074501046) q[17];
-cx q[1],q[17];
-cx q[3],q[17];
-rz(6.056559074501046) q[17];
-cx q[3],q[17];
-ry(pi/2) q[18];
-rx(pi) q[18];
-cx q[3],q[18];
-rz(6.056559074501046) q[18];
-cx q[3],q[18];
-cx q[4],q[18];
-rz(6.056559074501046) q[18];
-cx q[4],q[18];
-ry(pi/2) q[19];
-rx(pi) q[19];
-cx q[3],q[19];
-rz(6.056559074501046) q[19];
-cx q[3],q[19];
-cx q[7],q[19];
-rz(6.056559074501046) q[19];
-cx q[7],q[19];
-ry(pi/2) q[20];
-rx(pi) q[20];
-cx q[0],q[20];
-rz(6.056559074501046) q[20];
-cx q[0],q[20];
-cx q[15],q[20];
-rz(6.056559074501046) q[20];
-cx q[15],q[20];
-ry(pi/2) q[21];
-rx(pi) q[21];
-cx q[4],q[21];
-rz(6.056559074501046) q[21];
-cx q[4],q[21];
-cx q[15],q[21];
-rz(6.056559074501046) q[21];
-cx q[15],q[21];
-ry(pi/2) q[22];
-rx(pi) q[22];
-cx q[3],q[22];
-rz(6.056559074501046) q[22];
-cx q[3],q[22];
-cx q[9],q[22];
-rz(6.056559074501046) q[22];
-cx q[9],q[22];
-rx(4.511233421145919) q[22];
-ry(pi/2) q[23];
-rx(pi) q[23];
-cx q[3],q[23];
-rz(6.056559074501046) q[23];
-cx q[3],q[23];
-cx q[17],q[23];
-rz(6.056559074501046) q[23];
-cx q[17],q[23];
-ry(pi/2) q[24];
-rx(pi) q[24];
-cx q[3],q[24];
-rz(6.056559074501046) q[24];
-cx q[3],q[24];
-cx q[5],q[24];
-rz(6.056559074501046) q[24];
-cx q[5],q[24];
-ry(pi/2) q[25];
-rx(pi) q[25];
-cx q[3],q[25];
-rz(6.056559074501046) q[25];
-cx q[3],q[25];
-cx q[12],q[25];
-rz(6.056559074501046) q[25];
-cx q[12],q[25];
-rx(4.511233421145919) q[25];
-ry(pi/2) q[26];
-rx(pi) q[26];
-cx q[3],q[26];
-rz(6.056559074501046) q[26];
-cx q[3],q[26];
-cx q[21],q[26];
-rz(6.056559074501046) q[26];
-cx q[21],q[26];
-ry(pi/2) q[27];
-rx(pi) q[27];
-cx q[4],q[27];
-rz(6.056559074501046) q[27];
-cx q[4],q[27];
-cx q[6],q[27];
-rz(6.056559074501046) q[27];
-cx q[6],q[27];
-ry(pi/2) q[28];
-rx(pi) q[28];
-cx q[1],q[28];
-rz(6.056559074501046) q[28];
-cx q[1],q[28];
-cx q[3],q[28];
-rz(6.056559074501046) q[28];
-cx q[3],q[28];
-ry(pi/2) q[29];
-rx(pi) q[29];
-cx q[1],q[29];
-rz(6.056559074501046) q[29];
-cx q[1],q[29];
-cx q[3],q[29];
-rz(6.056559074501046) q[29];
-cx q[3],q[29];
-rx(4.511233421145919) q[29];
-ry(pi/2) q[30];
-rx(pi) q[30];
-cx q[3],q[30];
-rz(6.056559074501046) q[30];
-cx q[3],q[30];
-cx q[18],q[30];
-rz(6.056559074501046) q[30];
-cx q[18],q[30];
-rx(4.511233421145919) q[18];
-ry(pi/2) q[31];
-rx(pi) q[31];
-cx q[12],q[31];
-rz(6.056559074501046) q[31];
-cx q[12],q[31];
-cx q[26],q[31];
-rz(6.056559074501046) q[31];
-cx q[26],q[31];
-rx(4.511233421145919) q[26];
-rx(4.511233421145919) q[31];
-ry(pi/2) q[32];
-rx(pi) q[32];
-cx q[0],q[32];
-rz(6.056559074501046) q[32];
-cx q[0],q[32];
-cx q[21],q[32];
-rz(6.056559074501046) q[32];
-cx q[21],q[32];
-ry(pi/2) q[33];
-rx(pi) q[33];
-cx q[5],q[33];
-rz(6.056559074501046) q[33];
-cx q[5],q[33];
-cx q[30],q[33];
-rz(6.056559074501046) q[33];
-cx q[30],q[33];
-rx(4.511233421145919) q[33];
-ry(pi/2) q[34];
-rx(pi) q[34];
-cx q[3],q[34];
-rz(6.056559074501046) q[34];
-cx q[3],q[34];
-cx q[12],q[34];
-rz(6.056559074501046) q[34];
-cx q[12],q[34];
-ry(pi/2) q[35];
-rx(pi) q[35];
-cx q[3],q[35];
-rz(6.056559074501046) q[35];
-cx q[3],q[35];
-cx q[32],q[35];
-rz(6.056559074501046) q[35];
-cx q[32],q[35];
-rx(4.511233421145919) q[35];
-ry(pi/2) q[36];
-rx(pi) q[36];
-cx q[15],q[36];
-rz(6.056559074501046) q[36];
-cx q[15],q[36];
-cx q[20],q[36];
-rz(6.056559074501046) q[36];
-cx q[20],q[36];
-rx(4.511233421145919) q[36];
-ry(pi/2) q[37];
-rx(pi) q[37];
-cx q[10],q[37];
-rz(6.056559074501046) q[37];
-cx q[10],q[37];
-cx q[34],q[37];
-rz(6.056559074501046) q[37];
-cx q[34],q[37];
-rx(4.511233421145919) q[34];
-ry(pi/2) q[38];
-rx(pi) q[38];
-cx q[19],q[38];
-rz(6.056559074501046) q[38];
-cx q[19],q[38];
-rx(4.511233421145919) q[19];
-cx q[21],q[38];
-rz(6.056559074501046) q[38];
-cx q[21],q[38];
-ry(pi/2) q[39];
-rx(pi) q[39];
-cx q[3],q[39];
-rz(6.056559074501046) q[39];
-cx q[3],q[39];
-cx q[13],q[39];
-rz(6.056559074501046) q[39];
-cx q[13],q[39];
-rx(4.511233421145919) q[39];
-ry(pi/2) q[40];
-rx(pi) q[40];
-cx q[3],q[40];
-rz(6.056559074501046) q[40];
-cx q[3],q[40];
-cx q[23],q[40];
-rz(6.056559074501046) q[40];
-cx q[23],q[40];
-rx(4.511233421145919) q[40];
-ry(pi/2) q[41];
-rx(pi) q[41];
-cx q[10],q[41];
-rz(6.056559074501046) q[41];
-cx q[10],q[41];
-cx q[27],q[41];
-rz(6.056559074501046) q[41];
-cx q[27],q[41];
-ry(pi/2) q[42];
-rx(pi) q[42];
-cx q[0],q[42];
-rz(6.056559074501046) q[42];
-cx q[0],q[42];
-cx q[3],q[42];
-rz(6.056559074501046) q[42];
-cx q[3],q[42];
-ry(pi/2) q[43];
-rx(pi) q[43];
-cx q[3],q[43];
-rz(6.056559074501046) q[43];
-cx q[3],q[43];
-cx q[20],q[43];
-rz(6.056559074501046) q[43];
-cx q[20],q[43];
-rx(4.511233421145919) q[20];
-rx(4.511233421145919) q[43];
-ry(pi/2) q[44];
-rx(pi) q[44];
-cx q[3],q[44];
-rz(6.056559074501046) q[44];
-cx q[3],q[44];
-cx q[12],q[44];
-rz(6.056559074501046) q[44];
-cx q[12],q[44];
-ry(pi/2) q[45];
-rx(pi) q[45];
-cx q[1],q[45];
-rz(6.056559074501046) q[45];
-cx q[1],q[45];
-cx q[16],q[45];
-rz(6.056559074501046) q[45];
-cx q[16],q[45];
-ry(pi/2) q[46];
-rx(pi) q[46];
-cx q[5],q[46];
-rz(6.056559074501046) q[46];
-cx q[5],q[46];
-cx q[38],q[46];
-rz(6.056559074501046) q[46];
-cx q[38],q[46];
-rx(4.511233421145919) q[38];
-rx(4.511233421145919) q[46];
-ry(pi/2) q[47];
-rx(pi) q[47];
-cx q[4],q[47];
-rz(6.056559074501046) q[47];
-cx q[4],q[47];
-cx q[17],q[47];
-rz(6.056559074501046) q[47];
-cx q[17],q[47];
-ry(pi/2) q[48];
-rx(pi) q[48];
-cx q[0],q[48];
-rz(6.056559074501046) q[48];
-cx q[0],q[48];
-cx q[30],q[48];
-rz(6.056559074501046) q[48];
-cx q[30],q[48];
-rx(4.511233421145919) q[48];
-ry(pi/2) q[49];
-rx(pi) q[49];
-cx q[3],q[49];
-rz(6.056559074501046) q[49];
-cx q[3],q[49];
-cx q[4],q[49];
-rz(6.056559074501046) q[49];
-cx q[4],q[49];
-rx(4.511233421145919) q[49];
-ry(pi/2) q[50];
-rx(pi) q[50];
-cx q[3],q[50];
-rz(6.056559074501046) q[50];
-cx q[3],q[50];
-cx q[12],q[50];
-rz(6.056559074501046) q[50];
-cx q[12],q[50];
-ry(pi/2) q[51];
-rx(pi) q[51];
-cx q[0],q[51];
-rz(6.056559074501046) q[51];
-cx q[0],q[51];
-cx q[28],q[51];
-rz(6.056559074501046) q[51];
-cx q[28],q[51];
-rx(4.511233421145919) q[51];
-ry(pi/2) q[52];
-rx(pi) q[52];
-cx q[3],q[52];
-rz(6.056559074501046) q[52];
-cx q[3],q[52];
-cx q[10],q[52];
-rz(6.056559074501046) q[52];
-cx q[10],q[52];
-rx(4.511233421145919) q[52];
-ry(pi/2) q[53];
-rx(pi) q[53];
-cx q[17],q[53];
-rz(6.056559074501046) q[53];
-cx q[17],q[53];
-cx q[21],q[53];
-rz(6.056559074501046) q[53];
-cx q[21],q[53];
-ry(pi/2) q[54];
-rx(pi) q[54];
-cx q[24],q[54];
-rz(6.056559074501046) q[54];
-cx q[24],q[54];
-cx q[28],q[54];
-rz(6.056559074501046) q[54];
-cx q[28],q[54];
-rx(4.511233421145919) q[54];
-ry(pi/2) q[55];
-rx(pi) q[55];
-cx q[9],q[55];
-rz(6.056559074501046) q[55];
-cx q[9],q[55];
-cx q[15],q[55];
-rz(6.056559074501046) q[55];
-cx q[15],q[55];
-rx(4.511233421145919) q[55];
-ry(pi/2) q[56];
-rx(pi) q[56];
-cx q[13],q[56];
-rz(6.056559074501046) q[56];
-cx q[13],q[56];
-cx q[45],q[56];
-rz(6.056559074501046) q[56];
-cx q[45],q[56];
-rx(4.511233421145919) q[45];
-ry(pi/2) q[57];
-rx(pi) q[57];
-cx q[1],q[57];
-rz(6.056559074501046) q[57];
-cx q[1],q[57];
-cx q[3],q[57];
-rz(6.056559074501046) q[57];
-cx q[3],q[57];
-rx(4.511233421145919) q[57];
-ry(pi/2) q[58];
-rx(pi) q[58];
-cx q[24],q[58];
-rz(6.056559074501046) q[58];
-cx q[24],q[58];
-cx q[28],q[58];
-rz(6.056559074501046) q[58];
-cx q[28],q[58];
-rx(4.511233421145919) q[58];
-ry(pi/2) q[59];
-rx(pi) q[59];
-cx q[16],q[59];
-rz(6.056559074501046) q[59];
-cx q[16],q[59];
-cx q[32],q[59];
-rz(6.056559074501046) q[59];
-cx q[32],q[59];
-ry(pi/2) q[60];
-rx(pi) q[60];
-cx q[1],q[60];
-rz(6.056559074501046) q[60];
-cx q[1],q[60];
-rx(4.511233421145919) q[1];
-cx q[7],q[60];
-rz(6.056559074501046) q[60];
-cx q[7],q[60];
-ry(pi/2) q[61];
-rx(pi) q[61];
-cx q[4],q[61];
-rz(6.056559074501046) q[61];
-cx q[4],q[61];
-rx(4.511233421145919) q[4];
-cx q[7],q[61];
-rz(6.056559074501046) q[61];
-cx q[7],q[61];
-rx(4.511233421145919) q[7];
-rx(4.511233421145919) q[61];
-ry(pi/2) q[62];
-rx(pi) q[62];
-cx q[0],q[62];
-rz(6.056559074501046) q[62];
-cx q[0],q[62];
-cx q[17],q[62];
-rz(6.056559074501046) q[62];
-cx q[17],q[62];
-rx(4.511233421145919) q[62];
-ry(pi/2) q[63];
-rx(pi) q[63];
-cx q[12],q[63];
-rz(6.056559074501046) q[63];
-cx q[12],q[63];
-rx(4.511233421145919) q[12];
-cx q[17],q[63];
-rz(6.056559074501046) q[63];
-cx q[17],q[63];
-ry(pi/2) q[64];
-rx(pi) q[64];
-cx q[0],q[64];
-rz(6.056559074501046) q[64];
-cx q[0],q[64];
-cx q[10],q[64];
-rz(6.056559074501046) q[64];
-cx q[10],q[64];
-rx(4.511233421145919) q[10];
-rx(4.511233421145919) q[64];
-ry(pi/2) q[65];
-rx(pi) q[65];
-cx q[5],q[65];
-rz(6.056559074501046) q[65];
-cx q[5],q[65];
-cx q[23],q[65];
-rz(6.056559074501046) q[65];
-cx q[23],q[65];
-rx(4.511233421145919) q[23];
-rx(4.511233421145919) q[65];
-ry(pi/2) q[66];
-rx(pi) q[66];
-cx q[17],q[66];
-rz(6.056559074501046) q[66];
-cx q[17],q[66];
-rx(4.511233421145919) q[17];
-cx q[47],q[66];
-rz(6.056559074501046) q[66];
-cx q[47],q[66];
-rx(4.511233421145919) q[47];
-rx(4.511233421145919) q[66];
-ry(pi/2) q[67];
-rx(pi) q[67];
-cx q[41],q[67];
-rz(6.056559074501046) q[67];
-cx q[41],q[67];
-rx(4.511233421145919) q[41];
-cx q[56],q[67];
-rz(6.056559074501046) q[67];
-cx q[56],q[67];
-rx(4.511233421145919) q[67];
-ry(pi/2) q[68];
-rx(pi) q[68];
-cx q[13],q[68];
-rz(6.056559074501046) q[68];
-cx q[13],q[68];
-rx(4.511233421145919) q[13];
-cx q[32],q[68];
-rz(6.056559074501046) q[68];
-cx q[32],q[68];
-ry(pi/2) q[69];
-rx(pi) q[69];
-cx q[6],q[69];
-rz(6.056559074501046) q[69];
-cx q[6],q[69];
-cx q[59],q[69];
-rz(6.056559074501046) q[69];
-cx q[59],q[69];
-rx(4.511233421145919) q[69];
-ry(pi/2) q[70];
-rx(pi) q[70];
-cx q[3],q[70];
-rz(6.056559074501046) q[70];
-cx q[3],q[70];
-cx q[15],q[70];
-rz(6.056559074501046) q[70];
-cx q[15],q[70];
-ry(pi/2) q[71];
-rx(pi) q[71];
-cx q[3],q[71];
-rz(6.056559074501046) q[71];
-cx q[3],q[71];
-cx q[53],q[71];
-rz(6.056559074501046) q[71];
-cx q[53],q[71];
-rx(4.511233421145919) q[71];
-ry(pi/2) q[72];
-rx(pi) q[72];
-cx q[27],q[72];
-rz(6.056559074501046) q[72];
-cx q[27],q[72];
-cx q[44],q[72];
-rz(6.056559074501046) q[72];
-cx q[44],q[72];
-rx(4.511233421145919) q[44];
-rx(4.511233421145919) q[72];
-ry(pi/2) q[73];
-rx(pi) q[73];
-cx q[16],q[73];
-rz(6.056559074501046) q[73];
-cx q[16],q[73];
-rx(4.511233421145919) q[16];
-cx q[59],q[73];
-rz(6.056559074501046) q[73];
-cx q[59],q[73];
-ry(pi/2) q[74];
-rx(pi) q[74];
-cx q[56],q[74];
-rz(6.056559074501046) q[74];
-cx q[56],q[74];
-cx q[63],q[74];
-rz(6.056559074501046) q[74];
-cx q[63],q[74];
-rx(4.511233421145919) q[63];
-rx(4.511233421145919) q[74];
-ry(pi/2) q[75];
-rx(pi) q[75];
-cx q[0],q[75];
-rz(6.056559074501046) q[75];
-cx q[0],q[75];
-cx q[21],q[75];
-rz(6.056559074501046) q[75];
-cx q[21],q[75];
-rx(4.511233421145919) q[75];
-ry(pi/2) q[76];
-rx(pi) q[76];
-cx q[5],q[76];
-rz(6.056559074501046) q[76];
-cx q[5],q[76];
-cx q[6],q[76];
-rz(6.056559074501046) q[76];
-cx q[6],q[76];
-rx(4.511233421145919) q[76];
-ry(pi/2) q[77];
-rx(pi) q[77];
-cx q[3],q[77];
-rz(6.056559074501046) q[77];
-cx q[3],q[77];
-cx q[30],q[77];
-rz(6.056559074501046) q[77];
-cx q[30],q[77];
-rx(4.511233421145919) q[30];
-ry(pi/2) q[78];
-rx(pi) q[78];
-cx q[42],q[78];
-rz(6.056559074501046) q[78];
-cx q[42],q[78];
-rx(4.511233421145919) q[42];
-cx q[60],q[78];
-rz(6.056559074501046) q[78];
-cx q[60],q[78];
-rx(4.511233421145919) q[78];
-ry(pi/2) q[79];
-rx(pi) q[79];
-cx q[6],q[79];
-rz(6.056559074501046) q[79];
-cx q[6],q[79];
-cx q[50],q[79];
-rz(6.056559074501046) q[79];
-cx q[50],q[79];
-rx(4.511233421145919) q[50];
-rx(4.511233421145919) q[79];
-ry(pi/2) q[80];
-rx(pi) q[80];
-cx q[9],q[80];
-rz(6.056559074501046) q[80];
-cx q[9],q[80];
-rx(4.511233421145919) q[9];
-cx q[15],q[80];
-rz(6.056559074501046) q[80];
-cx q[15],q[80];
-rx(4.511233421145919) q[80];
-ry(pi/2) q[81];
-rx(pi) q[81];
-cx q[21],q[81];
-rz(6.056559074501046) q[81];
-cx q[21],q[81];
-rx(4.511233421145919) q[21];
-cx q[77],q[81];
-rz(6.056559074501046) q[81];
-cx q[77],q[81];
-rx(4.511233421145919) q[77];
-rx(4.511233421145919) q[81];
-ry(pi/2) q[82];
-rx(pi) q[82];
-cx q[0],q[82];
-rz(6.056559074501046) q[82];
-cx q[0],q[82];
-cx q[56],q[82];
-rz(6.056559074501046) q[82];
-cx q[56],q[82];
-rx(4.511233421145919) q[56];
-rx(4.511233421145919) q[82];
-ry(pi/2) q[83];
-rx(pi) q[83];
-cx q[8],q[83];
-rz(6.056559074501046) q[83];
-cx q[8],q[83];
-rx(4.511233421145919) q[8];
-cx q[68],q[83];
-rz(6.056559074501046) q[83];
-cx q[68],q[83];
-rx(4.511233421145919) q[68];
-rx(4.511233421145919) q[83];
-ry(pi/2) q[84];
-rx(pi) q[84];
-cx q[70],q[84];
-rz(6.056559074501046) q[84];
-cx q[70],q[84];
-rx(4.511233421145919) q[70];
-cx q[73],q[84];
-rz(6.056559074501046) q[84];
-cx q[73],q[84];
-rx(4.511233421145919) q[73];
-rx(4.511233421145919) q[84];
-ry(pi/2) q[85];
-rx(pi) q[85];
-cx q[37],q[85];
-rz(6.056559074501046) q[85];
-cx q[37],q[85];
-rx(4.511233421145919) q[37];
-cx q[59],q[85];
-rz(6.056559074501046) q[85];
-cx q[59],q[85];
-rx(4.511233421145919) q[59];
-rx(4.511233421145919) q[85];
-ry(pi/2) q[86];
-rx(pi) q[86];
-cx q[24],q[86];
-rz(6.056559074501046) q[86];
-cx q[24],q[86];
-rx(4.511233421145919) q[24];
-cx q[53],q[86];
-rz(6.056559074501046) q[86];
-cx q[53],q[86];
-rx(4.511233421145919) q[53];
-rx(4.511233421145919) q[86];
-ry(pi/2) q[87];
-rx(pi) q[87];
-cx q[28],q[87];
-rz(6.056559074501046) q[87];
-cx q[28],q[87];
-rx(4.511233421145919) q[28];
-cx q[32],q[87];
-rz(6.056559074501046) q[87];
-cx q[32],q[87];
-rx(4.511233421145919) q[32];
-rx(4.511233421145919) q[87];
-ry(pi/2) q[88];
-rx(pi) q[88];
-cx q[3],q[88];
-rz(6.056559074501046) q[88];
-cx q[3],q[88];
-rx(4.511233421145919) q[3];
-cx q[60],q[88];
-rz(6.056559074501046) q[88];
-cx q[60],q[88];
-rx(4.511233421145919) q[60];
-rx(4.511233421145919) q[88];
-ry(pi/2) q[89];
-rx(pi) q[89];
-cx q[2],q[89];
-rz(6.056559074501046) q[89];
-cx q[2],q[89];
-rx(4.511233421145919) q[2];
-cx q[5],q[89];
-rz(6.056559074501046) q[89];
-cx q[5],q[89];
-rx(4.511233421145919) q[5];
-rx(4.511233421145919) q[89];
-ry(pi/2) q[90];
-rx(pi) q[90];
-cx q[15],q[90];
-rz(6.056559074501046) q[90];
-cx q[15],q[90];
-rx(4.511233421145919) q[15];
-cx q[27],q[90];
-rz(6.056559074501046) q[90];
-cx q[27],q[90];
-rx(4.511233421145919) q[27];
-rx(4.511233421145919) q[90];
-ry(pi/2) q[91];
-rx(pi) q[91];
-cx q[0],q[91];
-rz(6.056559074501046) q[91];
-cx q[0],q[91];
-rx(4.511233421145919) q[0];
-cx q[0],q[1];
-rz(0.5434301734515466) q[1];
-cx q[0],q[1];
-cx q[0],q[2];
-rz(0.5434301734515466) q[2];
-cx q[0],q[2];
-cx q[0],q[3];
-cx q[2],q[89];
-rz(0.5434301734515466) q[3];
-cx q[0],q[3];
-cx q[0],q[15];
-cx q[1],q[3];
-rz(0.5434301734515466) q[3];
-cx q[1],q[3];
-cx q[1],q[4];
-rz(0.5434301734515466) q[4];
-cx q[1],q[4];
-cx q[1],q[5];
-cx q[3],q[4];
-rz(0.5434301734515466) q[4];
-cx q[3],q[4];
-rz(0.5434301734515466) q[5];
-cx q[1],q[5];
-cx q[1],q[9];
-cx q[3],q[5];
-rz(0.5434301734515466) q[5];
-cx q[3],q[5];
-cx q[3],q[7];
-cx q[6],q[91];
-rz(0.5434301734515466) q[7];
-cx q[3],q[7];
-cx q[3],q[8];
-rz(0.5434301734515466) q[8];
-cx q[3],q[8];
-rz(0.5434301734515466) q[9];
-cx q[1],q[9];
-cx q[1],q[17];
-cx q[3],q[9];
-rz(0.5434301734515466) q[9];
-cx q[3],q[9];
-cx q[3],q[12];
-rz(0.5434301734515466) q[12];
-cx q[3],q[12];
-cx q[3],q[14];
-rz(0.5434301734515466) q[14];
-cx q[3],q[14];
-rz(0.5434301734515466) q[15];
-cx q[0],q[15];
-cx q[0],q[16];
-cx q[3],q[15];
-rz(0.5434301734515466) q[15];
-cx q[3],q[15];
-rz(0.5434301734515466) q[16];
-cx q[0],q[16];
-cx q[0],q[20];
-cx q[3],q[16];
-rz(0.5434301734515466) q[16];
-cx q[3],q[16];
-rz(0.5434301734515466) q[17];
-cx q[1],q[17];
-cx q[1],q[28];
-cx q[3],q[17];
-rz(0.5434301734515466) q[17];
-cx q[3],q[17];
-cx q[3],q[18];
-rz(0.5434301734515466) q[18];
-cx q[3],q[18];
-cx q[3],q[19];
-rz(0.5434301734515466) q[19];
-cx q[3],q[19];
-cx q[3],q[22];
-rz(0.5434301734515466) q[20];
-cx q[0],q[20];
-cx q[0],q[32];
-cx q[15],q[20];
-rz(0.5434301734515466) q[20];
-cx q[15],q[20];
-rz(0.5434301734515466) q[22];
-cx q[3],q[22];
-cx q[3],q[23];
-cx q[9],q[22];
-rz(0.5434301734515466) q[22];
-cx q[9],q[22];
-cx q[9],q[55];
-rx(1.9199912407746784) q[22];
-rz(0.5434301734515466) q[23];
-cx q[3],q[23];
-cx q[3],q[24];
-cx q[17],q[23];
-rz(0.5434301734515466) q[23];
-cx q[17],q[23];
-rz(0.5434301734515466) q[24];
-cx q[3],q[24];
-cx q[3],q[25];
-rz(0.5434301734515466) q[25];
-cx q[3],q[25];
-cx q[3],q[26];
-rz(0.5434301734515466) q[26];
-cx q[3],q[26];
-rz(0.5434301734515466) q[28];
-cx q[1],q[28];
-cx q[1],q[29];
-cx q[3],q[28];
-rz(0.5434301734515466) q[28];
-cx q[3],q[28];
-rz(0.5434301734515466) q[29];
-cx q[1],q[29];
-cx q[1],q[45];
-cx q[3],q[29];
-rz(0.5434301734515466) q[29];
-cx q[3],q[29];
-cx q[3],q[30];
-rx(1.9199912407746784) q[29];
-rz(0.5434301734515466) q[30];
-cx q[3],q[30];
-cx q[3],q[34];
-rz(0.5434301734515466) q[32];
-cx q[0],q[32];
-cx q[0],q[42];
-rz(0.5434301734515466) q[34];
-cx q[3],q[34];
-cx q[3],q[35];
-rz(0.5434301734515466) q[35];
-cx q[3],q[35];
-cx q[3],q[39];
-rz(0.5434301734515466) q[39];
-cx q[3],q[39];
-cx q[3],q[40];
-rz(0.5434301734515466) q[40];
-cx q[3],q[40];
-cx q[23],q[40];
-rz(0.5434301734515466) q[40];
-cx q[23],q[40];
-rx(1.9199912407746784) q[40];
-rz(0.5434301734515466) q[42];
-cx q[0],q[42];
-cx q[0],q[48];
-cx q[3],q[42];
-rz(0.5434301734515466) q[42];
-cx q[3],q[42];
-cx q[3],q[43];
-cx q[42],q[78];
-rz(0.5434301734515466) q[43];
-cx q[3],q[43];
-cx q[3],q[44];
-rz(0.5434301734515466) q[44];
-cx q[3],q[44];
-cx q[3],q[49];
-rz(0.5434301734515466) q[45];
-cx q[1],q[45];
-cx q[1],q[57];
-cx q[16],q[45];
-rz(0.5434301734515466) q[45];
-cx q[16],q[45];
-cx q[16],q[59];
-rz(0.5434301734515466) q[48];
-cx q[0],q[48];
-cx q[0],q[51];
-rz(0.5434301734515466) q[49];
-cx q[3],q[49];
-cx q[3],q[50];
-rz(0.5434301734515466) q[50];
-cx q[3],q[50];
-cx q[3],q[52];
-rz(0.5434301734515466) q[51];
-cx q[0],q[51];
-cx q[0],q[62];
-cx q[28],q[51];
-rz(0.5434301734515466) q[51];
-cx q[28],q[51];
-rx(1.9199912407746784) q[51];
-rz(0.5434301734515466) q[52];
-cx q[3],q[52];
-rz(0.5434301734515466) q[55];
-cx q[9],q[55];
-cx q[9],q[80];
-rz(0.5434301734515466) q[57];
-cx q[1],q[57];
-cx q[1],q[60];
-cx q[3],q[57];
-rz(0.5434301734515466) q[57];
-cx q[3],q[57];
-cx q[3],q[70];
-rx(1.9199912407746784) q[57];
-rz(0.5434301734515466) q[59];
-cx q[16],q[59];
-cx q[16],q[73];
-rz(0.5434301734515466) q[60];
-cx q[1],q[60];
-rx(1.9199912407746784) q[1];
-rz(0.5434301734515466) q[62];
-cx q[0],q[62];
-cx q[0],q[64];
-rz(0.5434301734515466) q[64];
-cx q[0],q[64];
-cx q[0],q[75];
-rz(0.5434301734515466) q[70];
-cx q[3],q[70];
-cx q[3],q[71];
-rz(0.5434301734515466) q[71];
-cx q[3],q[71];
-cx q[3],q[77];
-rz(0.5434301734515466) q[73];
-cx q[16],q[73];
-rx(1.9199912407746784) q[16];
-rz(0.5434301734515466) q[75];
-cx q[0],q[75];
-cx q[0],q[82];
-rz(0.5434301734515466) q[77];
-cx q[3],q[77];
-cx q[3],q[88];
-rz(0.5434301734515466) q[78];
-cx q[42],q[78];
-rx(1.9199912407746784) q[42];
-rz(0.5434301734515466) q[80];
-cx q[9],q[80];
-rx(1.9199912407746784) q[9];
-rz(0.5434301734515466) q[82];
-cx q[0],q[82];
-rz(0.5434301734515466) q[88];
-cx q[3],q[88];
-rx(1.9199912407746784) q[3];
-rz(0.5434301734515466) q[89];
-cx q[2],q[89];
-rx(1.9199912407746784) q[2];
-rz(6.056559074501046) q[91];
-cx q[6],q[91];
-rx(4.511233421145919) q[6];
-cx q[4],q[6];
-rz(0.5434301734515466) q[6];
-cx q[4],q[6];
-cx q[4],q[7];
-cx q[5],q[6];
-rz(0.5434301734515466) q[6];
-cx q[5],q[6];
-cx q[5],q[8];
-rz(0.5434301734515466) q[7];
-cx q[4],q[7];
-cx q[4],q[10];
-cx q[7],q[19];
-rz(0.5434301734515466) q[8];
-cx q[5],q[8];
-cx q[5],q[11];
-cx q[8],q[83];
-rz(0.5434301734515466) q[10];
-cx q[4],q[10];
-cx q[4],q[13];
-cx q[6],q[10];
-rz(0.5434301734515466) q[10];
-cx q[6],q[10];
-cx q[10],q[37];
-rz(0.5434301734515466) q[11];
-cx q[5],q[11];
-cx q[5],q[12];
-cx q[6],q[11];
-rz(0.5434301734515466) q[11];
-cx q[6],q[11];
-rx(1.9199912407746784) q[11];
-rz(0.5434301734515466) q[12];
-cx q[5],q[12];
-cx q[12],q[25];
-rz(0.5434301734515466) q[13];
-cx q[4],q[13];
-cx q[4],q[14];
-cx q[5],q[13];
-rz(0.5434301734515466) q[13];
-cx q[5],q[13];
-cx q[5],q[24];
-cx q[13],q[39];
-rz(0.5434301734515466) q[14];
-cx q[4],q[14];
-cx q[4],q[18];
-rx(1.9199912407746784) q[14];
-rz(0.5434301734515466) q[18];
-cx q[4],q[18];
-cx q[4],q[21];
-cx q[18],q[30];
-rz(0.5434301734515466) q[19];
-cx q[7],q[19];
-cx q[7],q[60];
-cx q[19],q[38];
-rz(0.5434301734515466) q[21];
-cx q[4],q[21];
-cx q[4],q[27];
-cx q[15],q[21];
-rz(0.5434301734515466) q[21];
-cx q[15],q[21];
-cx q[15],q[36];
-cx q[21],q[26];
-rz(0.5434301734515466) q[24];
-cx q[5],q[24];
-cx q[5],q[33];
-cx q[24],q[54];
-rz(0.5434301734515466) q[25];
-cx q[12],q[25];
-cx q[12],q[31];
-rx(1.9199912407746784) q[25];
-rz(0.5434301734515466) q[26];
-cx q[21],q[26];
-cx q[21],q[32];
-rz(0.5434301734515466) q[27];
-cx q[4],q[27];
-cx q[4],q[47];
-cx q[6],q[27];
-rz(0.5434301734515466) q[27];
-cx q[6],q[27];
-cx q[6],q[69];
-rz(0.5434301734515466) q[30];
-cx q[18],q[30];
-rx(1.9199912407746784) q[18];
-rz(0.5434301734515466) q[31];
-cx q[12],q[31];
-cx q[12],q[34];
-cx q[26],q[31];
-rz(0.5434301734515466) q[31];
-cx q[26],q[31];
-rx(1.9199912407746784) q[26];
-rx(1.9199912407746784) q[31];
-rz(0.5434301734515466) q[32];
-cx q[21],q[32];
-cx q[32],q[35];
-rz(0.5434301734515466) q[33];
-cx q[5],q[33];
-cx q[5],q[46];
-cx q[30],q[33];
-rz(0.5434301734515466) q[33];
-cx q[30],q[33];
-cx q[30],q[48];
-rx(1.9199912407746784) q[33];
-rz(0.5434301734515466) q[34];
-cx q[12],q[34];
-cx q[12],q[44];
-rz(0.5434301734515466) q[35];
-cx q[32],q[35];
-cx q[32],q[59];
-rx(1.9199912407746784) q[35];
-rz(0.5434301734515466) q[36];
-cx q[15],q[36];
-cx q[15],q[55];
-cx q[20],q[36];
-rz(0.5434301734515466) q[36];
-cx q[20],q[36];
-cx q[20],q[43];
-rx(1.9199912407746784) q[36];
-rz(0.5434301734515466) q[37];
-cx q[10],q[37];
-cx q[10],q[41];
-cx q[34],q[37];
-rz(0.5434301734515466) q[37];
-cx q[34],q[37];
-rx(1.9199912407746784) q[34];
-cx q[37],q[85];
-rz(0.5434301734515466) q[38];
-cx q[19],q[38];
-rx(1.9199912407746784) q[19];
-cx q[21],q[38];
-rz(0.5434301734515466) q[38];
-cx q[21],q[38];
-rz(0.5434301734515466) q[39];
-cx q[13],q[39];
-cx q[13],q[56];
-rx(1.9199912407746784) q[39];
-rz(0.5434301734515466) q[41];
-cx q[10],q[41];
-cx q[10],q[52];
-cx q[27],q[41];
-rz(0.5434301734515466) q[41];
-cx q[27],q[41];
-cx q[27],q[72];
-cx q[41],q[67];
-rz(0.5434301734515466) q[43];
-cx q[20],q[43];
-rx(1.9199912407746784) q[20];
-rx(1.9199912407746784) q[43];
-rz(0.5434301734515466) q[44];
-cx q[12],q[44];
-cx q[12],q[50];
-rz(0.5434301734515466) q[46];
-cx q[5],q[46];
-cx q[5],q[65];
-cx q[38],q[46];
-rz(0.5434301734515466) q[46];
-cx q[38],q[46];
-rx(1.9199912407746784) q[38];
-rx(1.9199912407746784) q[46];
-rz(0.5434301734515466) q[47];
-cx q[4],q[47];
-cx q[4],q[49];
-cx q[17],q[47];
-rz(0.5434301734515466) q[47];
-cx q[17],q[47];
-cx q[17],q[53];
-rz(0.5434301734515466) q[48];
-cx q[30],q[48];
-cx q[30],q[77];
-rx(1.9199912407746784) q[48];
-rz(0.5434301734515466) q[49];
-cx q[4],q[49];
-cx q[4],q[61];
-rx(1.9199912407746784) q[49];
-rz(0.5434301734515466) q[50];
-cx q[12],q[50];
-cx q[12],q[63];
-rz(0.5434301734515466) q[52];
-cx q[10],q[52];
-cx q[10],q[64];
-rx(1.9199912407746784) q[52];
-rz(0.5434301734515466) q[53];
-cx q[17],q[53];
-cx q[17],q[62];
-cx q[21],q[53];
-rz(0.5434301734515466) q[53];
-cx q[21],q[53];
-cx q[21],q[75];
-cx q[53],q[71];
-rz(0.5434301734515466) q[54];
-cx q[24],q[54];
-cx q[24],q[58];
-cx q[28],q[54];
-rz(0.5434301734515466) q[54];
-cx q[28],q[54];
-rx(1.9199912407746784) q[54];
-rz(0.5434301734515466) q[55];
-cx q[15],q[55];
-cx q[15],q[70];
-rx(1.9199912407746784) q[55];
-rz(0.5434301734515466) q[56];
-cx q[13],q[56];
-cx q[13],q[68];
-cx q[45],q[56];
-rz(0.5434301734515466) q[56];
-cx q[45],q[56];
-rx(1.9199912407746784) q[45];
-rz(0.5434301734515466) q[58];
-cx q[24],q[58];
-cx q[24],q[86];
-cx q[28],q[58];
-rz(0.5434301734515466) q[58];
-cx q[28],q[58];
-cx q[28],q[87];
-rx(1.9199912407746784) q[58];
-rz(0.5434301734515466) q[59];
-cx q[32],q[59];
-rz(0.5434301734515466) q[60];
-cx q[7],q[60];
-cx q[60],q[78];
-rz(0.5434301734515466) q[61];
-cx q[4],q[61];
-rx(1.9199912407746784) q[4];
-cx q[7],q[61];
-rz(0.5434301734515466) q[61];
-cx q[7],q[61];
-rx(1.9199912407746784) q[7];
-rx(1.9199912407746784) q[61];
-rz(0.5434301734515466) q[62];
-cx q[17],q[62];
-rx(1.9199912407746784) q[62];
-rz(0.5434301734515466) q[63];
-cx q[12],q[63];
-rx(1.9199912407746784) q[12];
-cx q[17],q[63];
-rz(0.5434301734515466) q[63];
-cx q[17],q[63];
-cx q[17],q[66];
-rz(0.5434301734515466) q[64];
-cx q[10],q[64];
-rx(1.9199912407746784) q[10];
-rx(1.9199912407746784) q[64];
-rz(0.5434301734515466) q[65];
-cx q[5],q[65];
-cx q[5],q[76];
-cx q[23],q[65];
-rz(0.5434301734515466) q[65];
-cx q[23],q[65];
-rx(1.9199912407746784) q[23];
-rx(1.9199912407746784) q[65];
-rz(0.5434301734515466) q[66];
-cx q[17],q[66];
-rx(1.9199912407746784) q[17];
-cx q[47],q[66];
-rz(0.5434301734515466) q[66];
-cx q[47],q[66];
-rx(1.9199912407746784) q[47];
-rx(1.9199912407746784) q[66];
-rz(0.5434301734515466) q[67];
-cx q[41],q[67];
-rx(1.9199912407746784) q[41];
-cx q[56],q[67];
-rz(0.5434301734515466) q[67];
-cx q[56],q[67];
-cx q[56],q[74];
-rx(1.9199912407746784) q[67];
-rz(0.5434301734515466) q[68];
-cx q[13],q[68];
-rx(1.9199912407746784) q[13];
-cx q[32],q[68];
-rz(0.5434301734515466) q[68];
-cx q[32],q[68];
-rz(0.5434301734515466) q[69];
-cx q[6],q[69];
-cx q[59],q[69];
-rz(0.5434301734515466) q[69];
-cx q[59],q[69];
-cx q[59],q[73];
-rx(1.9199912407746784) q[69];
-rz(0.5434301734515466) q[70];
-cx q[15],q[70];
-cx q[15],q[80];
-cx q[70],q[84];
-rz(0.5434301734515466) q[71];
-cx q[53],q[71];
-rx(1.9199912407746784) q[71];
-rz(0.5434301734515466) q[72];
-cx q[27],q[72];
-cx q[44],q[72];
-rz(0.5434301734515466) q[72];
-cx q[44],q[72];
-rx(1.9199912407746784) q[44];
-rx(1.9199912407746784) q[72];
-rz(0.5434301734515466) q[73];
-cx q[59],q[73];
-rz(0.5434301734515466) q[74];
-cx q[56],q[74];
-cx q[56],q[82];
-cx q[63],q[74];
-rz(0.5434301734515466) q[74];
-cx q[63],q[74];
-rx(1.9199912407746784) q[63];
-rx(1.9199912407746784) q[74];
-rz(0.5434301734515466) q[75];
-cx q[21],q[75];
-cx q[21],q[81];
-rx(1.9199912407746784) q[75];
-rz(0.5434301734515466) q[76];
-cx q[5],q[76];
-cx q[5],q[89];
-cx q[6],q[76];
-rz(0.5434301734515466) q[76];
-cx q[6],q[76];
-cx q[6],q[79];
-rx(1.9199912407746784) q[76];
-rz(0.5434301734515466) q[77];
-cx q[30],q[77];
-rx(1.9199912407746784) q[30];
-rz(0.5434301734515466) q[78];
-cx q[60],q[78];
-cx q[60],q[88];
-rx(1.9199912407746784) q[78];
-rz(0.5434301734515466) q[79];
-cx q[6],q[79];
-cx q[50],q[79];
-rz(0.5434301734515466) q[79];
-cx q[50],q[79];
-rx(1.9199912407746784) q[50];
-rx(1.9199912407746784) q[79];
-rz(0.5434301734515466) q[80];
-cx q[15],q[80];
-cx q[15],q[90];
-rx(1.9199912407746784) q[80];
-rz(0.5434301734515466) q[81];
-cx q[21],q[81];
-rx(1.9199912407746784) q[21];
-cx q[77],q[81];
-rz(0.5434301734515466) q[81];
-cx q[77],q[81];
-rx(1.9199912407746784) q[77];
-rx(1.9199912407746784) q[81];
-rz(0.5434301734515466) q[82];
-cx q[56],q[82];
-rx(1.9199912407746784) q[56];
-rx(1.9199912407746784) q[82];
-rz(0.5434301734515466) q[83];
-cx q[8],q[83];
-rx(1.9199912407746784) q[8];
-cx q[68],q[83];
-rz(0.5434301734515466) q[83];
-cx q[68],q[83];
-rx(1.9199912407746784) q[68];
-rx(1.9199912407746784) q[83];
-rz(0.5434301734515466) q[84];
-cx q[70],q[84];
-rx(1.9199912407746784) q[70];
-cx q[73],q[84];
-rz(0.5434301734515466) q[84];
-cx q[73],q[84];
-rx(1.9199912407746784) q[73];
-rx(1.9199912407746784) q[84];
-rz(0.5434301734515466) q[85];
-cx q[37],q[85];
-rx(1.9199912407746784) q[37];
-cx q[59],q[85];
-rz(0.5434301734515466) q[85];
-cx q[59],q[85];
-rx(1.9199912407746784) q[59];
-rx(1.9199912407746784) q[85];
-rz(0.5434301734515466) q[86];
-cx q[24],q[86];
-rx(1.9199912407746784) q[24];
-cx q[53],q[86];
-rz(0.5434301734515466) q[86];
-cx q[53],q[86];
-rx(1.9199912407746784) q[53];
-rx(1.9199912407746784) q[86];
-rz(0.5434301734515466) q[87];
-cx q[28],q[87];
-rx(1.9199912407746784) q[28];
-cx q[32],q[87];
-rz(0.5434301734515466) q[87];
-cx q[32],q[87];
-rx(1.9199912407746784) q[32];
-rx(1.9199912407746784) q[87];
-rz(0.5434301734515466) q[88];
-cx q[60],q[88];
-rx(1.9199912407746784) q[60];
-rx(1.9199912407746784) q[88];
-rz(0.5434301734515466) q[89];
-cx q[5],q[89];
-rx(1.9199912407746784) q[5];
-rx(1.9199912407746784) q[89];
-rz(0.5434301734515466) q[90];
-cx q[15],q[90];
-rx(1.9199912407746784) q[15];
-cx q[27],q[90];
-rz(0.5434301734515466) q[90];
-cx q[27],q[90];
-rx(1.9199912407746784) q[27];
-rx(1.9199912407746784) q[90];
-rx(4.511233421145919) q[91];
-cx q[0],q[91];
-rz(0.5434301734515466) q[91];
-cx q[0],q[91];
-rx(1.9199912407746784) q[0];
-cx q[0],q[1];
-rz(0.6463668322711593) q[1];
-cx q[0],q[1];
-cx q[0],q[2];
-rz(0.6463668322711593) q[2];
-cx q[0],q[2];
-cx q[0],q[3];
-cx q[2],q[89];
-rz(0.6463668322711593) q[3];
-cx q[0],q[3];
-cx q[0],q[15];
-cx q[1],q[3];
-rz(0.6463668322711593) q[3];
-cx q[1],q[3];
-cx q[1],q[4];
-rz(0.6463668322711593) q[4];
-cx q[1],q[4];
-cx q[1],q[5];
-cx q[3],q[4];
-rz(0.6463668322711593) q[4];
-cx q[3],q[4];
-rz(0.6463668322711593) q[5];
-cx q[1],q[5];
-cx q[1],q[9];
-cx q[3],q[5];
-rz(0.6463668322711593) q[5];
-cx q[3],q[5];
-cx q[3],q[7];
-cx q[6],q[91];
-rz(0.6463668322711593) q[7];
-cx q[3],q[7];
-cx q[3],q[8];
-rz(0.6463668322711593) q[8];
-cx q[3],q[8];
-rz(0.6463668322711593) q[9];
-cx q[1],q[9];
-cx q[1],q[17];
-cx q[3],q[9];
-rz(0.6463668322711593) q[9];
-cx q[3],q[9];
-cx q[3],q[12];
-rz(0.6463668322711593) q[12];
-cx q[3],q[12];
-cx q[3],q[14];
-rz(0.6463668322711593) q[14];
-cx q[3],q[14];
-rz(0.6463668322711593) q[15];
-cx q[0],q[15];
-cx q[0],q[16];
-cx q[3],q[15];
-rz(0.6463668322711593) q[15];
-cx q[3],q[15];
-rz(0.6463668322711593) q[16];
-cx q[0],q[16];
-cx q[0],q[20];
-cx q[3],q[16];
-rz(0.6463668322711593) q[16];
-cx q[3],q[16];
-rz(0.6463668322711593) q[17];
-cx q[1],q[17];
-cx q[1],q[28];
-cx q[3],q[17];
-rz(0.6463668322711593) q[17];
-cx q[3],q[17];
-cx q[3],q[18];
-rz(0.6463668322711593) q[18];
-cx q[3],q[18];
-cx q[3],q[19];
-rz(0.6463668322711593) q[19];
-cx q[3],q[19];
-cx q[3],q[22];
-rz(0.6463668322711593) q[20];
-cx q[0],q[20];
-cx q[0],q[32];
-cx q[15],q[20];
-rz(0.6463668322711593) q[20];
-cx q[15],q[20];
-rz(0.6463668322711593) q[22];
-cx q[3],q[22];
-cx q[3],q[23];
-cx q[9],q[22];
-rz(0.6463668322711593) q[22];
-cx q[9],q[22];
-cx q[9],q[55];
-rx(12.481247801393234) q[22];
-rz(0.6463668322711593) q[23];
-cx q[3],q[23];
-cx q[3],q[24];
-cx q[17],q[23];
-rz(0.6463668322711593) q[23];
-cx q[17],q[23];
-rz(0.6463668322711593) q[24];
-cx q[3],q[24];
-cx q[3],q[25];
-rz(0.6463668322711593) q[25];
-cx q[3],q[25];
-cx q[3],q[26];
-rz(0.6463668322711593) q[26];
-cx q[3],q[26];
-rz(0.6463668322711593) q[28];
-cx q[1],q[28];
-cx q[1],q[29];
-cx q[3],q[28];
-rz(0.6463668322711593) q[28];
-cx q[3],q[28];
-rz(0.6463668322711593) q[29];
-cx q[1],q[29];
-cx q[1],q[45];
-cx q[3],q[29];
-rz(0.6463668322711593) q[29];
-cx q[3],q[29];
-cx q[3],q[30];
-rx(12.481247801393234) q[29];
-rz(0.6463668322711593) q[30];
-cx q[3],q[30];
-cx q[3],q[34];
-rz(0.6463668322711593) q[32];
-cx q[0],q[32];
-cx q[0],q[42];
-rz(0.6463668322711593) q[34];
-cx q[3],q[34];
-cx q[3],q[35];
-rz(0.6463668322711593) q[35];
-cx q[3],q[35];
-cx q[3],q[39];
-rz(0.6463668322711593) q[39];
-cx q[3],q[39];
-cx q[3],q[40];
-rz(0.6463668322711593) q[40];
-cx q[3],q[40];
-cx q[23],q[40];
-rz(0.6463668322711593) q[40];
-cx q[23],q[40];
-rx(12.481247801393234) q[40];
-rz(0.6463668322711593) q[42];
-cx q[0],q[42];
-cx q[0],q[48];
-cx q[3],q[42];
-rz(0.6463668322711593) q[42];
-cx q[3],q[42];
-cx q[3],q[43];
-cx q[42],q[78];
-rz(0.6463668322711593) q[43];
-cx q[3],q[43];
-cx q[3],q[44];
-rz(0.6463668322711593) q[44];
-cx q[3],q[44];
-cx q[3],q[49];
-rz(0.6463668322711593) q[45];
-cx q[1],q[45];
-cx q[1],q[57];
-cx q[16],q[45];
-rz(0.6463668322711593) q[45];
-cx q[16],q[45];
-cx q[16],q[59];
-rz(0.6463668322711593) q[48];
-cx q[0],q[48];
-cx q[0],q[51];
-rz(0.6463668322711593) q[49];
-cx q[3],q[49];
-cx q[3],q[50];
-rz(0.6463668322711593) q[50];
-cx q[3],q[50];
-cx q[3],q[52];
-rz(0.6463668322711593) q[51];
-cx q[0],q[51];
-cx q[0],q[62];
-cx q[28],q[51];
-rz(0.6463668322711593) q[51];
-cx q[28],q[51];
-rx(12.481247801393234) q[51];
-rz(0.6463668322711593) q[52];
-cx q[3],q[52];
-rz(0.6463668322711593) q[55];
-cx q[9],q[55];
-cx q[9],q[80];
-rz(0.6463668322711593) q[57];
-cx q[1],q[57];
-cx q[1],q[60];
-cx q[3],q[57];
-rz(0.6463668322711593) q[57];
-cx q[3],q[57];
-cx q[3],q[70];
-rx(12.481247801393234) q[57];
-rz(0.6463668322711593) q[59];
-cx q[16],q[59];
-cx q[16],q[73];
-rz(0.6463668322711593) q[60];
-cx q[1],q[60];
-rx(12.481247801393234) q[1];
-rz(0.6463668322711593) q[62];
-cx q[0],q[62];
-cx q[0],q[64];
-rz(0.6463668322711593) q[64];
-cx q[0],q[64];
-cx q[0],q[75];
-rz(0.6463668322711593) q[70];
-cx q[3],q[70];
-cx q[3],q[71];
-rz(0.6463668322711593) q[71];
-cx q[3],q[71];
-cx q[3],q[77];
-rz(0.6463668322711593) q[73];
-cx q[16],q[73];
-rx(12.481247801393234) q[16];
-rz(0.6463668322711593) q[75];
-cx q[0],q[75];
-cx q[0],q[82];
-rz(0.6463668322711593) q[77];
-cx q[3],q[77];
-cx q[3],q[88];
-rz(0.6463668322711593) q[78];
-cx q[42],q[78];
-rx(12.481247801393234) q[42];
-rz(0.6463668322711593) q[80];
-cx q[9],q[80];
-rx(12.481247801393234) q[9];
-rz(0.6463668322711593) q[82];
-cx q[0],q[82];
-rz(0.6463668322711593) q[88];
-cx q[3],q[88];
-rx(12.481247801393234) q[3];
-rz(0.6463668322711593) q[89];
-cx q[2],q[89];
-rx(12.481247801393234) q[2];
-rz(0.5434301734515466) q[91];
-cx q[6],q[91];
-rx(1.9199912407746784) q[6];
-cx q[4],q[6];
-rz(0.6463668322711593) q[6];
-cx q[4],q[6];
-cx q[4],q[7];
-cx q[5],q[6];
-rz(0.6463668322711593) q[6];
-cx q[5],q[6];
-cx q[5],q[8];
-rz(0.6463668322711593) q[7];
-cx q[4],q[7];
-cx q[4],q[10];
-cx q[7],q[19];
-rz(0.6463668322711593) q[8];
-cx q[5],q[8];
-cx q[5],q[11];
-cx q[8],q[83];
-rz(0.6463668322711593) q[10];
-cx q[4],q[10];
-cx q[4],q[13];
-cx q[6],q[10];
-rz(0.6463668322711593) q[10];
-cx q[6],q[10];
-cx q[10],q[37];
-rz(0.6463668322711593) q[11];
-cx q[5],q[11];
-cx q[5],q[12];
-cx q[6],q[11];
-rz(0.6463668322711593) q[11];
-cx q[6],q[11];
-rx(12.481247801393234) q[11];
-rz(0.6463668322711593) q[12];
-cx q[5],q[12];
-cx q[12],q[25];
-rz(0.6463668322711593) q[13];
-cx q[4],q[13];
-cx q[4],q[14];
-cx q[5],q[13];
-rz(0.6463668322711593) q[13];
-cx q[5],q[13];
-cx q[5],q[24];
-cx q[13],q[39];
-rz(0.6463668322711593) q[14];
-cx q[4],q[14];
-cx q[4],q[18];
-rx(12.481247801393234) q[14];
-rz(0.6463668322711593) q[18];
-cx q[4],q[18];
-cx q[4],q[21];
-cx q[18],q[30];
-rz(0.6463668322711593) q[19];
-cx q[7],q[19];
-cx q[7],q[60];
-cx q[19],q[38];
-rz(0.6463668322711593) q[21];
-cx q[4],q[21];
-cx q[4],q[27];
-cx q[15],q[21];
-rz(0.6463668322711593) q[21];
-cx q[15],q[21];
-cx q[15],q[36];
-cx q[21],q[26];
-rz(0.6463668322711593) q[24];
-cx q[5],q[24];
-cx q[5],q[33];
-cx q[24],q[54];
-rz(0.6463668322711593) q[25];
-cx q[12],q[25];
-cx q[12],q[31];
-rx(12.481247801393234) q[25];
-rz(0.6463668322711593) q[26];
-cx q[21],q[26];
-cx q[21],q[32];
-rz(0.6463668322711593) q[27];
-cx q[4],q[27];
-cx q[4],q[47];
-cx q[6],q[27];
-rz(0.6463668322711593) q[27];
-cx q[6],q[27];
-cx q[6],q[69];
-rz(0.6463668322711593) q[30];
-cx q[18],q[30];
-rx(12.481247801393234) q[18];
-rz(0.6463668322711593) q[31];
-cx q[12],q[31];
-cx q[12],q[34];
-cx q[26],q[31];
-rz(0.6463668322711593) q[31];
-cx q[26],q[31];
-rx(12.481247801393234) q[26];
-rx(12.481247801393234) q[31];
-rz(0.6463668322711593) q[32];
-cx q[21],q[32];
-cx q[32],q[35];
-rz(0.6463668322711593) q[33];
-cx q[5],q[33];
-cx q[5],q[46];
-cx q[30],q[33];
-rz(0.6463668322711593) q[33];
-cx q[30],q[33];
-cx q[30],q[48];
-rx(12.481247801393234) q[33];
-rz(0.6463668322711593) q[34];
-cx q[12],q[34];
-cx q[12],q[44];
-rz(0.6463668322711593) q[35];
-cx q[32],q[35];
-cx q[32],q[59];
-rx(12.481247801393234) q[35];
-rz(0.6463668322711593) q[36];
-cx q[15],q[36];
-cx q[15],q[55];
-cx q[20],q[36];
-rz(0.6463668322711593) q[36];
-cx q[20],q[36];
-cx q[20],q[43];
-rx(12.481247801393234) q[36];
-rz(0.6463668322711593) q[37];
-cx q[10],q[37];
-cx q[10],q[41];
-cx q[34],q[37];
-rz(0.6463668322711593) q[37];
-cx q[34],q[37];
-rx(12.481247801393234) q[34];
-cx q[37],q[85];
-rz(0.6463668322711593) q[38];
-cx q[19],q[38];
-rx(12.481247801393234) q[19];
-cx q[21],q[38];
-rz(0.6463668322711593) q[38];
-cx q[21],q[38];
-rz(0.6463668322711593) q[39];
-cx q[13],q[39];
-cx q[13],q[56];
-rx(12.481247801393234) q[39];
-rz(0.6463668322711593) q[41];
-cx q[10],q[41];
-cx q[10],q[52];
-cx q[27],q[41];
-rz(0.6463668322711593) q[41];
-cx q[27],q[41];
-cx q[27],q[72];
-cx q[41],q[67];
-rz(0.6463668322711593) q[43];
-cx q[20],q[43];
-rx(12.481247801393234) q[20];
-rx(12.481247801393234) q[43];
-rz(0.6463668322711593) q[44];
-cx q[12],q[44];
-cx q[12],q[50];
-rz(0.6463668322711593) q[46];
-cx q[5],q[46];
-cx q[5],q[65];
-cx q[38],q[46];
-rz(0.6463668322711593) q[46];
-cx q[38],q[46];
-rx(12.481247801393234) q[38];
-rx(12.481247801393234) q[46];
-rz(0.6463668322711593) q[47];
-cx q[4],q[47];
-cx q[4],q[49];
-cx q[17],q[47];
-rz(0.6463668322711593) q[47];
-cx q[17],q[47];
-cx q[17],q[53];
-rz(0.6463668322711593) q[48];
-cx q[30],q[48];
-cx q[30],q[77];
-rx(12.481247801393234) q[48];
-rz(0.6463668322711593) q[49];
-cx q[4],q[49];
-cx q[4],q[61];
-rx(12.481247801393234) q[49];
-rz(0.6463668322711593) q[50];
-cx q[12],q[50];
-cx q[12],q[63];
-rz(0.6463668322711593) q[52];
-cx q[10],q[52];
-cx q[10],q[64];
-rx(12.481247801393234) q[52];
-rz(0.6463668322711593) q[53];
-cx q[17],q[53];
-cx q[17],q[62];
-cx q[21],q[53];
-rz(0.6463668322711593) q[53];
-cx q[21],q[53];
-cx q[21],q[75];
-cx q[53],q[71];
-rz(0.6463668322711593) q[54];
-cx q[24],q[54];
-cx q[24],q[58];
-cx q[28],q[54];
-rz(0.6463668322711593) q[54];
-cx q[28],q[54];
-rx(12.481247801393234) q[54];
-rz(0.6463668322711593) q[55];
-cx q[15],q[55];
-cx q[15],q[70];
-rx(12.481247801393234) q[55];
-rz(0.6463668322711593) q[56];
-cx q[13],q[56];
-cx q[13],q[68];
-cx q[45],q[56];
-rz(0.6463668322711593) q[56];
-cx q[45],q[56];
-rx(12.481247801393234) q[45];
-rz(0.6463668322711593) q[58];
-cx q[24],q[58];
-cx q[24],q[86];
-cx q[28],q[58];
-rz(0.6463668322711593) q[58];
-cx q[28],q[58];
-cx q[28],q[87];
-rx(12.481247801393234) q[58];
-rz(0.6463668322711593) q[59];
-cx q[32],q[59];
-rz(0.6463668322711593) q[60];
-cx q[7],q[60];
-cx q[60],q[78];
-rz(0.6463668322711593) q[61];
-cx q[4],q[61];
-rx(12.481247801393234) q[4];
-cx q[7],q[61];
-rz(0.6463668322711593) q[61];
-cx q[7],q[61];
-rx(12.481247801393234) q[7];
-rx(12.481247801393234) q[61];
-rz(0.6463668322711593) q[62];
-cx q[17],q[62];
-rx(12.481247801393234) q[62];
-rz(0.6463668322711593) q[63];
-cx q[12],q[63];
-rx(12.481247801393234) q[12];
-cx q[17],q[63];
-rz(0.6463668322711593) q[63];
-cx q[17],q[63];
-cx q[17],q[66];
-rz(0.6463668322711593) q[64];
-cx q[10],q[64];
-rx(12.481247801393234) q[10];
-rx(12.481247801393234) q[64];
-rz(0.6463668322711593) q[65];
-cx q[5],q[65];
-cx q[5],q[76];
-cx q[23],q[65];
-rz(0.6463668322711593) q[65];
-cx q[23],q[65];
-rx(12.481247801393234) q[23];
-rx(12.481247801393234) q[65];
-rz(0.6463668322711593) q[66];
-cx q[17],q[66];
-rx(12.481247801393234) q[17];
-cx q[47],q[66];
-rz(0.6463668322711593) q[66];
-cx q[47],q[66];
-rx(12.481247801393234) q[47];
-rx(12.481247801393234) q[66];
-rz(0.6463668322711593) q[67];
-cx q[41],q[67];
-rx(12.481247801393234) q[41];
-cx q[56],q[67];
-rz(0.6463668322711593) q[67];
-cx q[56],q[67];
-cx q[56],q[74];
-rx(12.481247801393234) q[67];
-rz(0.6463668322711593) q[68];
-cx q[13],q[68];
-rx(12.481247801393234) q[13];
-cx q[32],q[68];
-rz(0.6463668322711593) q[68];
-cx q[32],q[68];
-rz(0.6463668322711593) q[69];
-cx q[6],q[69];
-cx q[59],q[69];
-rz(0.6463668322711593) q[69];
-cx q[59],q[69];
-cx q[59],q[73];
-rx(12.481247801393234) q[69];
-rz(0.6463668322711593) q[70];
-cx q[15],q[70];
-cx q[15],q[80];
-cx q[70],q[84];
-rz(0.6463668322711593) q[71];
-cx q[53],q[71];
-rx(12.481247801393234) q[71];
-rz(0.6463668322711593) q[72];
-cx q[27],q[72];
-cx q[44],q[72];
-rz(0.6463668322711593) q[72];
-cx q[44],q[72];
-rx(12.481247801393234) q[44];
-rx(12.481247801393234) q[72];
-rz(0.6463668322711593) q[73];
-cx q[59],q[73];
-rz(0.6463668322711593) q[74];
-cx q[56],q[74];
-cx q[56],q[82];
-cx q[63],q[74];
-rz(0.6463668322711593) q[74];
-cx q[63],q[74];
-rx(12.481247801393234) q[63];
-rx(12.481247801393234) q[74];
-rz(0.6463668322711593) q[75];
-cx q[21],q[75];
-cx q[21],q[81];
-rx(12.481247801393234) q[75];
-rz(0.6463668322711593) q[76];
-cx q[5],q[76];
-cx q[5],q[89];
-cx q[6],q[76];
-rz(0.6463668322711593) q[76];
-cx q[6],q[76];
-cx q[6],q[79];
-rx(12.481247801393234) q[76];
-rz(0.6463668322711593) q[77];
-cx q[30],q[77];
-rx(12.481247801393234) q[30];
-rz(0.6463668322711593) q[78];
-cx q[60],q[78];
-cx q[60],q[88];
-rx(12.481247801393234) q[78];
-rz(0.6463668322711593) q[79];
-cx q[6],q[79];
-cx q[50],q[79];
-rz(0.6463668322711593) q[79];
-cx q[50],q[79];
-rx(12.481247801393234) q[50];
-rx(12.481247801393234) q[79];
-rz(0.6463668322711593) q[80];
-cx q[15],q[80];
-cx q[15],q[90];
-rx(12.481247801393234) q[80];
-rz(0.6463668322711593) q[81];
-cx q[21],q[81];
-rx(12.481247801393234) q[21];
-cx q[77],q[81];
-rz(0.6463668322711593) q[81];
-cx q[77],q[81];
-rx(12.481247801393234) q[77];
-rx(12.481247801393234) q[81];
-rz(0.6463668322711593) q[82];
-cx q[56],q[82];
-rx(12.481247801393234) q[56];
-rx(12.481247801393234) q[82];
-rz(0.6463668322711593) q[83];
-cx q[8],q[83];
-rx(12.481247801393234) q[8];
-cx q[68],q[83];
-rz(0.6463668322711593) q[83];
-cx q[68],q[83];
-rx(12.481247801393234) q[68];
-rx(12.481247801393234) q[83];
-rz(0.6463668322711593) q[84];
-cx q[70],q[84];
-rx(12.481247801393234) q[70];
-cx q[73],q[84];
-rz(0.6463668322711593) q[84];
-cx q[73],q[84];
-rx(12.481247801393234) q[73];
-rx(12.481247801393234) q[84];
-rz(0.6463668322711593) q[85];
-cx q[37],q[85];
-rx(12.481247801393234) q[37];
-cx q[59],q[85];
-rz(0.6463668322711593) q[85];
-cx q[59],q[85];
-rx(12.481247801393234) q[59];
-rx(12.481247801393234) q[85];
-rz(0.6463668322711593) q[86];
-cx q[24],q[86];
-rx(12.481247801393234) q[24];
-cx q[53],q[86];
-rz(0.6463668322711593) q[86];
-cx q[53],q[86];
-rx(12.481247801393234) q[53];
-rx(12.481247801393234) q[86];
-rz(0.6463668322711593) q[87];
-cx q[28],q[87];
-rx(12.481247801393234) q[28];
-cx q[32],q[87];
-rz(0.6463668322711593) q[87];
-cx q[32],q[87];
-rx(12.481247801393234) q[32];
-rx(12.481247801393234) q[87];
-rz(0.6463668322711593) q[88];
-cx q[60],q[88];
-rx(12.481247801393234) q[60];
-rx(12.481247801393234) q[88];
-rz(0.6463668322711593) q[89];
-cx q[5],q[89];
-rx(12.481247801393234) q[5];
-rx(12.481247801393234) q[89];
-rz(0.6463668322711593) q[90];
-cx q[15],q[90];
-rx(12.481247801393234) q[15];
-cx q[27],q[90];
-rz(0.6463668322711593) q[90];
-cx q[27],q[90];
-rx(12.481247801393234) q[27];
-rx(12.481247801393234) q[90];
-rx(1.9199912407746784) q[91];
-cx q[0],q[91];
-rz(0.6463668322711593) q[91];
-cx q[0],q[91];
-rx(12.481247801393234) q[0];
-cx q[6],q[91];
-rz(0.6463668322711593) q[91];
-cx q[6],q[91];
-rx(12.481247801393234) q[6];
-rx(12.481247801393234) q[91];
\ No newline at end of file
@@ -1,2106 +0,0 @@
-OPENQASM 2.0;
-include "qelib1.inc";
-qreg q[93];
-ry(pi/2) q[0];
-rx(pi) q[0];
-ry(pi/2) q[1];
-rx(pi) q[1];
-cx q[0],q[1];
-rz(0.12480932710416147) q[1];
-cx q[0],q[1];
-ry(pi/2) q[2];
-rx(pi) q[2];
-cx q[0],q[2];
-rz(0.12480932710416147) q[2];
-cx q[0],q[2];
-ry(pi/2) q[3];
-rx(pi) q[3];
-cx q[0],q[3];
-rz(0.12480932710416147) q[3];
-cx q[0],q[3];
-cx q[1],q[3];
-rz(0.12480932710416147) q[3];
-cx q[1],q[3];
-ry(pi/2) q[4];
-rx(pi) q[4];
-cx q[1],q[4];
-rz(0.12480932710416147) q[4];
-cx q[1],q[4];
-cx q[3],q[4];
-rz(0.12480932710416147) q[4];
-cx q[3],q[4];
-ry(pi/2) q[5];
-rx(pi) q[5];
-cx q[1],q[5];
-rz(0.12480932710416147) q[5];
-cx q[1],q[5];
-cx q[3],q[5];
-rz(0.12480932710416147) q[5];
-cx q[3],q[5];
-ry(pi/2) q[6];
-rx(pi) q[6];
-cx q[4],q[6];
-rz(0.12480932710416147) q[6];
-cx q[4],q[6];
-cx q[5],q[6];
-rz(0.12480932710416147) q[6];
-cx q[5],q[6];
-ry(pi/2) q[7];
-rx(pi) q[7];
-cx q[3],q[7];
-rz(0.12480932710416147) q[7];
-cx q[3],q[7];
-cx q[4],q[7];
-rz(0.12480932710416147) q[7];
-cx q[4],q[7];
-ry(pi/2) q[8];
-rx(pi) q[8];
-cx q[3],q[8];
-rz(0.12480932710416147) q[8];
-cx q[3],q[8];
-cx q[5],q[8];
-rz(0.12480932710416147) q[8];
-cx q[5],q[8];
-ry(pi/2) q[9];
-rx(pi) q[9];
-cx q[1],q[9];
-rz(0.12480932710416147) q[9];
-cx q[1],q[9];
-cx q[3],q[9];
-rz(0.12480932710416147) q[9];
-cx q[3],q[9];
-ry(pi/2) q[10];
-rx(pi) q[10];
-cx q[4],q[10];
-rz(0.12480932710416147) q[10];
-cx q[4],q[10];
-cx q[6],q[10];
-rz(0.12480932710416147) q[10];
-cx q[6],q[10];
-ry(pi/2) q[11];
-rx(pi) q[11];
-cx q[5],q[11];
-rz(0.12480932710416147) q[11];
-cx q[5],q[11];
-cx q[6],q[11];
-rz(0.12480932710416147) q[11];
-cx q[6],q[11];
-rx(12.073418516158505) q[11];
-ry(pi/2) q[12];
-rx(pi) q[12];
-cx q[3],q[12];
-rz(0.12480932710416147) q[12];
-cx q[3],q[12];
-cx q[5],q[12];
-rz(0.12480932710416147) q[12];
-cx q[5],q[12];
-ry(pi/2) q[13];
-rx(pi) q[13];
-cx q[4],q[13];
-rz(0.12480932710416147) q[13];
-cx q[4],q[13];
-cx q[5],q[13];
-rz(0.12480932710416147) q[13];
-cx q[5],q[13];
-ry(pi/2) q[14];
-rx(pi) q[14];
-cx q[3],q[14];
-rz(0.12480932710416147) q[14];
-cx q[3],q[14];
-cx q[4],q[14];
-rz(0.12480932710416147) q[14];
-cx q[4],q[14];
-rx(12.073418516158505) q[14];
-ry(pi/2) q[15];
-rx(pi) q[15];
-cx q[0],q[15];
-rz(0.12480932710416147) q[15];
-cx q[0],q[15];
-cx q[3],q[15];
-rz(0.12480932710416147) q[15];
-cx q[3],q[15];
-ry(pi/2) q[16];
-rx(pi) q[16];
-cx q[0],q[16];
-rz(0.12480932710416147) q[16];
-cx q[0],q[16];
-cx q[3],q[16];
-rz(0.12480932710416147) q[16];
-cx q[3],q[16];
-ry(pi/2) q[17];
-rx(pi) q[17];
-cx q[1],q[17];
-rz(0.12480932710416147) q[17];
-cx q[1],q[17];
-cx q[3],q[17];
-rz(0.12480932710416147) q[17];
-cx q[3],q[17];
-ry(pi/2) q[18];
-rx(pi) q[18];
-cx q[3],q[18];
-rz(0.12480932710416147) q[18];
-cx q[3],q[18];
-cx q[4],q[18];
-rz(0.12480932710416147) q[18];
-cx q[4],q[18];
-ry(pi/2) q[19];
-rx(pi) q[19];
-cx q[3],q[19];
-rz(0.12480932710416147) q[19];
-cx q[3],q[19];
-cx q[7],q[19];
-rz(0.12480932710416147) q[19];
-cx q[7],q[19];
-ry(pi/2) q[20];
-rx(pi) q[20];
-cx q[0],q[20];
-rz(0.12480932710416147) q[20];
-cx q[0],q[20];
-cx q[15],q[20];
-rz(0.12480932710416147) q[20];
-cx q[15],q[20];
-ry(pi/2) q[21];
-rx(pi) q[21];
-cx q[4],q[21];
-rz(0.12480932710416147) q[21];
-cx q[4],q[21];
-cx q[15],q[21];
-rz(0.12480932710416147) q[21];
-cx q[15],q[21];
-ry(pi/2) q[22];
-rx(pi) q[22];
-cx q[3],q[22];
-rz(0.12480932710416147) q[22];
-cx q[3],q[22];
-cx q[9],q[22];
-rz(0.12480932710416147) q[22];
-cx q[9],q[22];
-rx(12.073418516158505) q[22];
-ry(pi/2) q[23];
-rx(pi) q[23];
-cx q[3],q[23];
-rz(0.12480932710416147) q[23];
-cx q[3],q[23];
-cx q[17],q[23];
-rz(0.12480932710416147) q[23];
-cx q[17],q[23];
-ry(pi/2) q[24];
-rx(pi) q[24];
-cx q[3],q[24];
-rz(0.12480932710416147) q[24];
-cx q[3],q[24];
-cx q[5],q[24];
-rz(0.12480932710416147) q[24];
-cx q[5],q[24];
-ry(pi/2) q[25];
-rx(pi) q[25];
-cx q[3],q[25];
-rz(0.12480932710416147) q[25];
-cx q[3],q[25];
-cx q[12],q[25];
-rz(0.12480932710416147) q[25];
-cx q[12],q[25];
-rx(12.073418516158505) q[25];
-ry(pi/2) q[26];
-rx(pi) q[26];
-cx q[3],q[26];
-rz(0.12480932710416147) q[26];
-cx q[3],q[26];
-cx q[21],q[26];
-rz(0.12480932710416147) q[26];
-cx q[21],q[26];
-ry(pi/2) q[27];
-rx(pi) q[27];
-cx q[4],q[27];
-rz(0.12480932710416147) q[27];
-cx q[4],q[27];
-cx q[6],q[27];
-rz(0.12480932710416147) q[27];
-cx q[6],q[27];
-ry(pi/2) q[28];
-rx(pi) q[28];
-cx q[1],q[28];
-rz(0.12480932710416147) q[28];
-cx q[1],q[28];
-cx q[3],q[28];
-rz(0.12480932710416147) q[28];
-cx q[3],q[28];
-ry(pi/2) q[29];
-rx(pi) q[29];
-cx q[1],q[29];
-rz(0.12480932710416147) q[29];
-cx q[1],q[29];
-cx q[3],q[29];
-rz(0.12480932710416147) q[29];
-cx q[3],q[29];
-rx(12.073418516158505) q[29];
-ry(pi/2) q[30];
-rx(pi) q[30];
-cx q[3],q[30];
-rz(0.12480932710416147) q[30];
-cx q[3],q[30];
-cx q[18],q[30];
-rz(0.12480932710416147) q[30];
-cx q[18],q[30];
-rx(12.073418516158505) q[18];
-ry(pi/2) q[31];
-rx(pi) q[31];
-cx q[12],q[31];
-rz(0.12480932710416147) q[31];
-cx q[12],q[31];
-cx q[26],q[31];
-rz(0.12480932710416147) q[31];
-cx q[26],q[31];
-rx(12.073418516158505) q[26];
-rx(12.073418516158505) q[31];
-ry(pi/2) q[32];
-rx(pi) q[32];
-cx q[0],q[32];
-rz(0.12480932710416147) q[32];
-cx q[0],q[32];
-cx q[21],q[32];
-rz(0.12480932710416147) q[32];
-cx q[21],q[32];
-ry(pi/2) q[33];
-rx(pi) q[33];
-cx q[5],q[33];
-rz(0.12480932710416147) q[33];
-cx q[5],q[33];
-cx q[30],q[33];
-rz(0.12480932710416147) q[33];
-cx q[30],q[33];
-rx(12.073418516158505) q[33];
-ry(pi/2) q[34];
-rx(pi) q[34];
-cx q[3],q[34];
-rz(0.12480932710416147) q[34];
-cx q[3],q[34];
-cx q[12],q[34];
-rz(0.12480932710416147) q[34];
-cx q[12],q[34];
-ry(pi/2) q[35];
-rx(pi) q[35];
-cx q[3],q[35];
-rz(0.12480932710416147) q[35];
-cx q[3],q[35];
-cx q[32],q[35];
-rz(0.12480932710416147) q[35];
-cx q[32],q[35];
-rx(12.073418516158505) q[35];
-ry(pi/2) q[36];
-rx(pi) q[36];
-cx q[15],q[36];
-rz(0.12480932710416147) q[36];
-cx q[15],q[36];
-cx q[20],q[36];
-rz(0.12480932710416147) q[36];
-cx q[20],q[36];
-rx(12.073418516158505) q[36];
-ry(pi/2) q[37];
-rx(pi) q[37];
-cx q[10],q[37];
-rz(0.12480932710416147) q[37];
-cx q[10],q[37];
-cx q[34],q[37];
-rz(0.12480932710416147) q[37];
-cx q[34],q[37];
-rx(12.073418516158505) q[34];
-ry(pi/2) q[38];
-rx(pi) q[38];
-cx q[19],q[38];
-rz(0.12480932710416147) q[38];
-cx q[19],q[38];
-rx(12.073418516158505) q[19];
-cx q[21],q[38];
-rz(0.12480932710416147) q[38];
-cx q[21],q[38];
-ry(pi/2) q[39];
-rx(pi) q[39];
-cx q[3],q[39];
-rz(0.12480932710416147) q[39];
-cx q[3],q[39];
-cx q[13],q[39];
-rz(0.12480932710416147) q[39];
-cx q[13],q[39];
-rx(12.073418516158505) q[39];
-ry(pi/2) q[40];
-rx(pi) q[40];
-cx q[3],q[40];
-rz(0.12480932710416147) q[40];
-cx q[3],q[40];
-cx q[23],q[40];
-rz(0.12480932710416147) q[40];
-cx q[23],q[40];
-rx(12.073418516158505) q[40];
-ry(pi/2) q[41];
-rx(pi) q[41];
-cx q[10],q[41];
-rz(0.12480932710416147) q[41];
-cx q[10],q[41];
-cx q[27],q[41];
-rz(0.12480932710416147) q[41];
-cx q[27],q[41];
-ry(pi/2) q[42];
-rx(pi) q[42];
-cx q[0],q[42];
-rz(0.12480932710416147) q[42];
-cx q[0],q[42];
-cx q[3],q[42];
-rz(0.12480932710416147) q[42];
-cx q[3],q[42];
-ry(pi/2) q[43];
-rx(pi) q[43];
-cx q[3],q[43];
-rz(0.12480932710416147) q[43];
-cx q[3],q[43];
-cx q[20],q[43];
-rz(0.12480932710416147) q[43];
-cx q[20],q[43];
-rx(12.073418516158505) q[20];
-rx(12.073418516158505) q[43];
-ry(pi/2) q[44];
-rx(pi) q[44];
-cx q[3],q[44];
-rz(0.12480932710416147) q[44];
-cx q[3],q[44];
-cx q[12],q[44];
-rz(0.12480932710416147) q[44];
-cx q[12],q[44];
-ry(pi/2) q[45];
-rx(pi) q[45];
-cx q[1],q[45];
-rz(0.12480932710416147) q[45];
-cx q[1],q[45];
-cx q[16],q[45];
-rz(0.12480932710416147) q[45];
-cx q[16],q[45];
-ry(pi/2) q[46];
-rx(pi) q[46];
-cx q[5],q[46];
-rz(0.12480932710416147) q[46];
-cx q[5],q[46];
-cx q[38],q[46];
-rz(0.12480932710416147) q[46];
-cx q[38],q[46];
-rx(12.073418516158505) q[38];
-rx(12.073418516158505) q[46];
-ry(pi/2) q[47];
-rx(pi) q[47];
-cx q[4],q[47];
-rz(0.12480932710416147) q[47];
-cx q[4],q[47];
-cx q[17],q[47];
-rz(0.12480932710416147) q[47];
-cx q[17],q[47];
-ry(pi/2) q[48];
-rx(pi) q[48];
-cx q[0],q[48];
-rz(0.12480932710416147) q[48];
-cx q[0],q[48];
-cx q[30],q[48];
-rz(0.12480932710416147) q[48];
-cx q[30],q[48];
-rx(12.073418516158505) q[48];
-ry(pi/2) q[49];
-rx(pi) q[49];
-cx q[3],q[49];
-rz(0.12480932710416147) q[49];
-cx q[3],q[49];
-cx q[4],q[49];
-rz(0.12480932710416147) q[49];
-cx q[4],q[49];
-rx(12.073418516158505) q[49];
-ry(pi/2) q[50];
-rx(pi) q[50];
-cx q[3],q[50];
-rz(0.12480932710416147) q[50];
-cx q[3],q[50];
-cx q[12],q[50];
-rz(0.12480932710416147) q[50];
-cx q[12],q[50];
-ry(pi/2) q[51];
-rx(pi) q[51];
-cx q[0],q[51];
-rz(0.12480932710416147) q[51];
-cx q[0],q[51];
-cx q[28],q[51];
-rz(0.12480932710416147) q[51];
-cx q[28],q[51];
-rx(12.073418516158505) q[51];
-ry(pi/2) q[52];
-rx(pi) q[52];
-cx q[3],q[52];
-rz(0.12480932710416147) q[52];
-cx q[3],q[52];
-cx q[10],q[52];
-rz(0.12480932710416147) q[52];
-cx q[10],q[52];
-rx(12.073418516158505) q[52];
-ry(pi/2) q[53];
-rx(pi) q[53];
-cx q[17],q[53];
-rz(0.12480932710416147) q[53];
-cx q[17],q[53];
-cx q[21],q[53];
-rz(0.12480932710416147) q[53];
-cx q[21],q[53];
-ry(pi/2) q[54];
-rx(pi) q[54];
-cx q[24],q[54];
-rz(0.12480932710416147) q[54];
-cx q[24],q[54];
-cx q[28],q[54];
-rz(0.12480932710416147) q[54];
-cx q[28],q[54];
-rx(12.073418516158505) q[54];
-ry(pi/2) q[55];
-rx(pi) q[55];
-cx q[9],q[55];
-rz(0.12480932710416147) q[55];
-cx q[9],q[55];
-cx q[15],q[55];
-rz(0.12480932710416147) q[55];
-cx q[15],q[55];
-rx(12.073418516158505) q[55];
-ry(pi/2) q[56];
-rx(pi) q[56];
-cx q[13],q[56];
-rz(0.12480932710416147) q[56];
-cx q[13],q[56];
-cx q[45],q[56];
-rz(0.12480932710416147) q[56];
-cx q[45],q[56];
-rx(12.073418516158505) q[45];
-ry(pi/2) q[57];
-rx(pi) q[57];
-cx q[1],q[57];
-rz(0.12480932710416147) q[57];
-cx q[1],q[57];
-cx q[3],q[57];
-rz(0.12480932710416147) q[57];
-cx q[3],q[57];
-rx(12.073418516158505) q[57];
-ry(pi/2) q[58];
-rx(pi) q[58];
-cx q[24],q[58];
-rz(0.12480932710416147) q[58];
-cx q[24],q[58];
-cx q[28],q[58];
-rz(0.12480932710416147) q[58];
-cx q[28],q[58];
-rx(12.073418516158505) q[58];
-ry(pi/2) q[59];
-rx(pi) q[59];
-cx q[16],q[59];
-rz(0.12480932710416147) q[59];
-cx q[16],q[59];
-cx q[32],q[59];
-rz(0.12480932710416147) q[59];
-cx q[32],q[59];
-ry(pi/2) q[60];
-rx(pi) q[60];
-cx q[1],q[60];
-rz(0.12480932710416147) q[60];
-cx q[1],q[60];
-rx(12.073418516158505) q[1];
-cx q[7],q[60];
-rz(0.12480932710416147) q[60];
-cx q[7],q[60];
-ry(pi/2) q[61];
-rx(pi) q[61];
-cx q[4],q[61];
-rz(0.12480932710416147) q[61];
-cx q[4],q[61];
-rx(12.073418516158505) q[4];
-cx q[7],q[61];
-rz(0.12480932710416147) q[61];
-cx q[7],q[61];
-rx(12.073418516158505) q[7];
-rx(12.073418516158505) q[61];
-ry(pi/2) q[62];
-rx(pi) q[62];
-cx q[0],q[62];
-rz(0.12480932710416147) q[62];
-cx q[0],q[62];
-cx q[17],q[62];
-rz(0.12480932710416147) q[62];
-cx q[17],q[62];
-rx(12.073418516158505) q[62];
-ry(pi/2) q[63];
-rx(pi) q[63];
-cx q[12],q[63];
-rz(0.12480932710416147) q[63];
-cx q[12],q[63];
-rx(12.073418516158505) q[12];
-cx q[17],q[63];
-rz(0.12480932710416147) q[63];
-cx q[17],q[63];
-ry(pi/2) q[64];
-rx(pi) q[64];
-cx q[0],q[64];
-rz(0.12480932710416147) q[64];
-cx q[0],q[64];
-cx q[10],q[64];
-rz(0.12480932710416147) q[64];
-cx q[10],q[64];
-rx(12.073418516158505) q[10];
-rx(12.073418516158505) q[64];
-ry(pi/2) q[65];
-rx(pi) q[65];
-cx q[5],q[65];
-rz(0.12480932710416147) q[65];
-cx q[5],q[65];
-cx q[23],q[65];
-rz(0.12480932710416147) q[65];
-cx q[23],q[65];
-rx(12.073418516158505) q[23];
-rx(12.073418516158505) q[65];
-ry(pi/2) q[66];
-rx(pi) q[66];
-cx q[17],q[66];
-rz(0.12480932710416147) q[66];
-cx q[17],q[66];
-rx(12.073418516158505) q[17];
-cx q[47],q[66];
-rz(0.12480932710416147) q[66];
-cx q[47],q[66];
-rx(12.073418516158505) q[47];
-rx(12.073418516158505) q[66];
-ry(pi/2) q[67];
-rx(pi) q[67];
-cx q[41],q[67];
-rz(0.12480932710416147) q[67];
-cx q[41],q[67];
-rx(12.073418516158505) q[41];
-cx q[56],q[67];
-rz(0.12480932710416147) q[67];
-cx q[56],q[67];
-rx(12.073418516158505) q[67];
-ry(pi/2) q[68];
-rx(pi) q[68];
-cx q[13],q[68];
-rz(0.12480932710416147) q[68];
-cx q[13],q[68];
-rx(12.073418516158505) q[13];
-cx q[32],q[68];
-rz(0.12480932710416147) q[68];
-cx q[32],q[68];
-ry(pi/2) q[69];
-rx(pi) q[69];
-cx q[6],q[69];
-rz(0.12480932710416147) q[69];
-cx q[6],q[69];
-cx q[59],q[69];
-rz(0.12480932710416147) q[69];
-cx q[59],q[69];
-rx(12.073418516158505) q[69];
-ry(pi/2) q[70];
-rx(pi) q[70];
-cx q[3],q[70];
-rz(0.12480932710416147) q[70];
-cx q[3],q[70];
-cx q[15],q[70];
-rz(0.12480932710416147) q[70];
-cx q[15],q[70];
-ry(pi/2) q[71];
-rx(pi) q[71];
-cx q[3],q[71];
-rz(0.12480932710416147) q[71];
-cx q[3],q[71];
-cx q[53],q[71];
-rz(0.12480932710416147) q[71];
-cx q[53],q[71];
-rx(12.073418516158505) q[71];
-ry(pi/2) q[72];
-rx(pi) q[72];
-cx q[27],q[72];
-rz(0.12480932710416147) q[72];
-cx q[27],q[72];
-cx q[44],q[72];
-rz(0.12480932710416147) q[72];
-cx q[44],q[72];
-rx(12.073418516158505) q[44];
-rx(12.073418516158505) q[72];
-ry(pi/2) q[73];
-rx(pi) q[73];
-cx q[16],q[73];
-rz(0.12480932710416147) q[73];
-cx q[16],q[73];
-rx(12.073418516158505) q[16];
-cx q[59],q[73];
-rz(0.12480932710416147) q[73];
-cx q[59],q[73];
-ry(pi/2) q[74];
-rx(pi) q[74];
-cx q[56],q[74];
-rz(0.12480932710416147) q[74];
-cx q[56],q[74];
-cx q[63],q[74];
-rz(0.12480932710416147) q[74];
-cx q[63],q[74];
-rx(12.073418516158505) q[63];
-rx(12.073418516158505) q[74];
-ry(pi/2) q[75];
-rx(pi) q[75];
-cx q[0],q[75];
-rz(0.12480932710416147) q[75];
-cx q[0],q[75];
-cx q[21],q[75];
-rz(0.12480932710416147) q[75];
-cx q[21],q[75];
-rx(12.073418516158505) q[75];
-ry(pi/2) q[76];
-rx(pi) q[76];
-cx q[5],q[76];
-rz(0.12480932710416147) q[76];
-cx q[5],q[76];
-cx q[6],q[76];
-rz(0.12480932710416147) q[76];
-cx q[6],q[76];
-rx(12.073418516158505) q[76];
-ry(pi/2) q[77];
-rx(pi) q[77];
-cx q[3],q[77];
-rz(0.12480932710416147) q[77];
-cx q[3],q[77];
-cx q[30],q[77];
-rz(0.12480932710416147) q[77];
-cx q[30],q[77];
-rx(12.073418516158505) q[30];
-ry(pi/2) q[78];
-rx(pi) q[78];
-cx q[42],q[78];
-rz(0.12480932710416147) q[78];
-cx q[42],q[78];
-rx(12.073418516158505) q[42];
-cx q[60],q[78];
-rz(0.12480932710416147) q[78];
-cx q[60],q[78];
-rx(12.073418516158505) q[78];
-ry(pi/2) q[79];
-rx(pi) q[79];
-cx q[6],q[79];
-rz(0.12480932710416147) q[79];
-cx q[6],q[79];
-cx q[50],q[79];
-rz(0.12480932710416147) q[79];
-cx q[50],q[79];
-rx(12.073418516158505) q[50];
-rx(12.073418516158505) q[79];
-ry(pi/2) q[80];
-rx(pi) q[80];
-cx q[9],q[80];
-rz(0.12480932710416147) q[80];
-cx q[9],q[80];
-rx(12.073418516158505) q[9];
-cx q[15],q[80];
-rz(0.12480932710416147) q[80];
-cx q[15],q[80];
-rx(12.073418516158505) q[80];
-ry(pi/2) q[81];
-rx(pi) q[81];
-cx q[21],q[81];
-rz(0.12480932710416147) q[81];
-cx q[21],q[81];
-rx(12.073418516158505) q[21];
-cx q[77],q[81];
-rz(0.12480932710416147) q[81];
-cx q[77],q[81];
-rx(12.073418516158505) q[77];
-rx(12.073418516158505) q[81];
-ry(pi/2) q[82];
-rx(pi) q[82];
-cx q[0],q[82];
-rz(0.12480932710416147) q[82];
-cx q[0],q[82];
-cx q[56],q[82];
-rz(0.12480932710416147) q[82];
-cx q[56],q[82];
-rx(12.073418516158505) q[56];
-rx(12.073418516158505) q[82];
-ry(pi/2) q[83];
-rx(pi) q[83];
-cx q[8],q[83];
-rz(0.12480932710416147) q[83];
-cx q[8],q[83];
-rx(12.073418516158505) q[8];
-cx q[68],q[83];
-rz(0.12480932710416147) q[83];
-cx q[68],q[83];
-rx(12.073418516158505) q[68];
-rx(12.073418516158505) q[83];
-ry(pi/2) q[84];
-rx(pi) q[84];
-cx q[70],q[84];
-rz(0.12480932710416147) q[84];
-cx q[70],q[84];
-rx(12.073418516158505) q[70];
-cx q[73],q[84];
-rz(0.12480932710416147) q[84];
-cx q[73],q[84];
-rx(12.073418516158505) q[73];
-rx(12.073418516158505) q[84];
-ry(pi/2) q[85];
-rx(pi) q[85];
-cx q[37],q[85];
-rz(0.12480932710416147) q[85];
-cx q[37],q[85];
-rx(12.073418516158505) q[37];
-cx q[59],q[85];
-rz(0.12480932710416147) q[85];
-cx q[59],q[85];
-rx(12.073418516158505) q[59];
-rx(12.073418516158505) q[85];
-ry(pi/2) q[86];
-rx(pi) q[86];
-cx q[24],q[86];
-rz(0.12480932710416147) q[86];
-cx q[24],q[86];
-rx(12.073418516158505) q[24];
-cx q[53],q[86];
-rz(0.12480932710416147) q[86];
-cx q[53],q[86];
-rx(12.073418516158505) q[53];
-rx(12.073418516158505) q[86];
-ry(pi/2) q[87];
-rx(pi) q[87];
-cx q[28],q[87];
-rz(0.12480932710416147) q[87];
-cx q[28],q[87];
-rx(12.073418516158505) q[28];
-cx q[32],q[87];
-rz(0.12480932710416147) q[87];
-cx q[32],q[87];
-rx(12.073418516158505) q[32];
-rx(12.073418516158505) q[87];
-ry(pi/2) q[88];
-rx(pi) q[88];
-cx q[3],q[88];
-rz(0.12480932710416147) q[88];
-cx q[3],q[88];
-rx(12.073418516158505) q[3];
-cx q[60],q[88];
-rz(0.12480932710416147) q[88];
-cx q[60],q[88];
-rx(12.073418516158505) q[60];
-rx(12.073418516158505) q[88];
-ry(pi/2) q[89];
-rx(pi) q[89];
-cx q[2],q[89];
-rz(0.12480932710416147) q[89];
-cx q[2],q[89];
-rx(12.073418516158505) q[2];
-cx q[5],q[89];
-rz(0.12480932710416147) q[89];
-cx q[5],q[89];
-rx(12.073418516158505) q[5];
-ry(pi/2) q[90];
-rx(pi) q[90];
-cx q[15],q[90];
-rz(0.12480932710416147) q[90];
-cx q[15],q[90];
-cx q[27],q[90];
-rz(0.12480932710416147) q[90];
-cx q[27],q[90];
-rx(12.073418516158505) q[27];
-rx(12.073418516158505) q[90];
-ry(pi/2) q[91];
-rx(pi) q[91];
-cx q[0],q[91];
-rz(0.12480932710416147) q[91];
-cx q[0],q[91];
-rx(12.073418516158505) q[0];
-cx q[0],q[1];
-rz(0.36060355057738264) q[1];
-cx q[0],q[1];
-cx q[0],q[2];
-rz(0.36060355057738264) q[2];
-cx q[0],q[2];
-cx q[0],q[3];
-rz(0.36060355057738264) q[3];
-cx q[0],q[3];
-cx q[1],q[3];
-rz(0.36060355057738264) q[3];
-cx q[1],q[3];
-cx q[1],q[4];
-rz(0.36060355057738264) q[4];
-cx q[1],q[4];
-cx q[1],q[5];
-cx q[3],q[4];
-rz(0.36060355057738264) q[4];
-cx q[3],q[4];
-rz(0.36060355057738264) q[5];
-cx q[1],q[5];
-cx q[1],q[9];
-cx q[3],q[5];
-rz(0.36060355057738264) q[5];
-cx q[3],q[5];
-cx q[3],q[7];
-cx q[6],q[91];
-rz(0.36060355057738264) q[7];
-cx q[3],q[7];
-cx q[3],q[8];
-rz(0.36060355057738264) q[8];
-cx q[3],q[8];
-rz(0.36060355057738264) q[9];
-cx q[1],q[9];
-cx q[1],q[17];
-cx q[3],q[9];
-rz(0.36060355057738264) q[9];
-cx q[3],q[9];
-cx q[3],q[12];
-rz(0.36060355057738264) q[12];
-cx q[3],q[12];
-cx q[3],q[14];
-rz(0.36060355057738264) q[14];
-cx q[3],q[14];
-rz(0.36060355057738264) q[17];
-cx q[1],q[17];
-cx q[1],q[28];
-rz(0.36060355057738264) q[28];
-cx q[1],q[28];
-cx q[1],q[29];
-rz(0.36060355057738264) q[29];
-cx q[1],q[29];
-cx q[1],q[45];
-rz(0.36060355057738264) q[45];
-cx q[1],q[45];
-cx q[1],q[57];
-rz(0.36060355057738264) q[57];
-cx q[1],q[57];
-cx q[1],q[60];
-rz(0.36060355057738264) q[60];
-cx q[1],q[60];
-rx(6.202457715349661) q[1];
-rz(0.12480932710416147) q[91];
-cx q[6],q[91];
-rx(12.073418516158505) q[6];
-cx q[4],q[6];
-rz(0.36060355057738264) q[6];
-cx q[4],q[6];
-cx q[4],q[7];
-cx q[5],q[6];
-rz(0.36060355057738264) q[6];
-cx q[5],q[6];
-cx q[5],q[8];
-rz(0.36060355057738264) q[7];
-cx q[4],q[7];
-cx q[4],q[10];
-rz(0.36060355057738264) q[8];
-cx q[5],q[8];
-cx q[5],q[11];
-cx q[8],q[83];
-rz(0.36060355057738264) q[10];
-cx q[4],q[10];
-cx q[4],q[13];
-cx q[6],q[10];
-rz(0.36060355057738264) q[10];
-cx q[6],q[10];
-cx q[10],q[37];
-rz(0.36060355057738264) q[11];
-cx q[5],q[11];
-cx q[5],q[12];
-cx q[6],q[11];
-rz(0.36060355057738264) q[11];
-cx q[6],q[11];
-rx(6.202457715349661) q[11];
-rz(0.36060355057738264) q[12];
-cx q[5],q[12];
-rz(0.36060355057738264) q[13];
-cx q[4],q[13];
-cx q[4],q[14];
-cx q[5],q[13];
-rz(0.36060355057738264) q[13];
-cx q[5],q[13];
-rz(0.36060355057738264) q[14];
-cx q[4],q[14];
-rx(6.202457715349661) q[14];
-rz(0.36060355057738264) q[37];
-cx q[10],q[37];
-cx q[10],q[41];
-rz(0.36060355057738264) q[41];
-cx q[10],q[41];
-rz(0.36060355057738264) q[83];
-cx q[8],q[83];
-rx(6.202457715349661) q[8];
-rx(12.073418516158505) q[91];
-ry(pi/2) q[92];
-rx(pi) q[92];
-cx q[15],q[92];
-rz(0.12480932710416147) q[92];
-cx q[15],q[92];
-rx(12.073418516158505) q[15];
-cx q[0],q[15];
-rz(0.36060355057738264) q[15];
-cx q[0],q[15];
-cx q[0],q[16];
-cx q[3],q[15];
-rz(0.36060355057738264) q[15];
-cx q[3],q[15];
-rz(0.36060355057738264) q[16];
-cx q[0],q[16];
-cx q[0],q[20];
-cx q[3],q[16];
-rz(0.36060355057738264) q[16];
-cx q[3],q[16];
-cx q[3],q[17];
-cx q[16],q[45];
-rz(0.36060355057738264) q[17];
-cx q[3],q[17];
-cx q[3],q[18];
-rz(0.36060355057738264) q[18];
-cx q[3],q[18];
-cx q[3],q[19];
-cx q[4],q[18];
-rz(0.36060355057738264) q[18];
-cx q[4],q[18];
-cx q[4],q[21];
-rz(0.36060355057738264) q[19];
-cx q[3],q[19];
-cx q[3],q[22];
-cx q[7],q[19];
-rz(0.36060355057738264) q[19];
-cx q[7],q[19];
-cx q[7],q[60];
-cx q[19],q[38];
-rz(0.36060355057738264) q[20];
-cx q[0],q[20];
-cx q[0],q[32];
-cx q[15],q[20];
-rz(0.36060355057738264) q[20];
-cx q[15],q[20];
-rz(0.36060355057738264) q[21];
-cx q[4],q[21];
-cx q[4],q[27];
-cx q[15],q[21];
-rz(0.36060355057738264) q[21];
-cx q[15],q[21];
-cx q[15],q[36];
-rz(0.36060355057738264) q[22];
-cx q[3],q[22];
-cx q[3],q[23];
-cx q[9],q[22];
-rz(0.36060355057738264) q[22];
-cx q[9],q[22];
-cx q[9],q[55];
-rx(6.202457715349661) q[22];
-rz(0.36060355057738264) q[23];
-cx q[3],q[23];
-cx q[3],q[24];
-cx q[17],q[23];
-rz(0.36060355057738264) q[23];
-cx q[17],q[23];
-rz(0.36060355057738264) q[24];
-cx q[3],q[24];
-cx q[3],q[25];
-cx q[5],q[24];
-rz(0.36060355057738264) q[24];
-cx q[5],q[24];
-cx q[5],q[33];
-cx q[24],q[54];
-rz(0.36060355057738264) q[25];
-cx q[3],q[25];
-cx q[3],q[26];
-cx q[12],q[25];
-rz(0.36060355057738264) q[25];
-cx q[12],q[25];
-cx q[12],q[31];
-rx(6.202457715349661) q[25];
-rz(0.36060355057738264) q[26];
-cx q[3],q[26];
-cx q[3],q[28];
-cx q[21],q[26];
-rz(0.36060355057738264) q[26];
-cx q[21],q[26];
-rz(0.36060355057738264) q[27];
-cx q[4],q[27];
-cx q[4],q[47];
-cx q[6],q[27];
-rz(0.36060355057738264) q[27];
-cx q[6],q[27];
-cx q[6],q[69];
-cx q[27],q[41];
-rz(0.36060355057738264) q[28];
-cx q[3],q[28];
-cx q[3],q[29];
-rz(0.36060355057738264) q[29];
-cx q[3],q[29];
-cx q[3],q[30];
-rx(6.202457715349661) q[29];
-rz(0.36060355057738264) q[30];
-cx q[3],q[30];
-cx q[3],q[34];
-cx q[18],q[30];
-rz(0.36060355057738264) q[30];
-cx q[18],q[30];
-rx(6.202457715349661) q[18];
-rz(0.36060355057738264) q[31];
-cx q[12],q[31];
-cx q[26],q[31];
-rz(0.36060355057738264) q[31];
-cx q[26],q[31];
-rx(6.202457715349661) q[26];
-rx(6.202457715349661) q[31];
-rz(0.36060355057738264) q[32];
-cx q[0],q[32];
-cx q[0],q[42];
-cx q[21],q[32];
-rz(0.36060355057738264) q[32];
-cx q[21],q[32];
-rz(0.36060355057738264) q[33];
-cx q[5],q[33];
-cx q[5],q[46];
-cx q[30],q[33];
-rz(0.36060355057738264) q[33];
-cx q[30],q[33];
-rx(6.202457715349661) q[33];
-rz(0.36060355057738264) q[34];
-cx q[3],q[34];
-cx q[3],q[35];
-cx q[12],q[34];
-rz(0.36060355057738264) q[34];
-cx q[12],q[34];
-cx q[34],q[37];
-rz(0.36060355057738264) q[35];
-cx q[3],q[35];
-cx q[3],q[39];
-cx q[32],q[35];
-rz(0.36060355057738264) q[35];
-cx q[32],q[35];
-rx(6.202457715349661) q[35];
-rz(0.36060355057738264) q[36];
-cx q[15],q[36];
-cx q[20],q[36];
-rz(0.36060355057738264) q[36];
-cx q[20],q[36];
-rx(6.202457715349661) q[36];
-rz(0.36060355057738264) q[37];
-cx q[34],q[37];
-rx(6.202457715349661) q[34];
-cx q[37],q[85];
-rz(0.36060355057738264) q[38];
-cx q[19],q[38];
-rx(6.202457715349661) q[19];
-cx q[21],q[38];
-rz(0.36060355057738264) q[38];
-cx q[21],q[38];
-rz(0.36060355057738264) q[39];
-cx q[3],q[39];
-cx q[3],q[40];
-cx q[13],q[39];
-rz(0.36060355057738264) q[39];
-cx q[13],q[39];
-cx q[13],q[56];
-rx(6.202457715349661) q[39];
-rz(0.36060355057738264) q[40];
-cx q[3],q[40];
-cx q[23],q[40];
-rz(0.36060355057738264) q[40];
-cx q[23],q[40];
-rx(6.202457715349661) q[40];
-rz(0.36060355057738264) q[41];
-cx q[27],q[41];
-cx q[27],q[72];
-cx q[41],q[67];
-rz(0.36060355057738264) q[42];
-cx q[0],q[42];
-cx q[0],q[48];
-cx q[3],q[42];
-rz(0.36060355057738264) q[42];
-cx q[3],q[42];
-cx q[3],q[43];
-cx q[42],q[78];
-rz(0.36060355057738264) q[43];
-cx q[3],q[43];
-cx q[3],q[44];
-cx q[20],q[43];
-rz(0.36060355057738264) q[43];
-cx q[20],q[43];
-rx(6.202457715349661) q[20];
-rx(6.202457715349661) q[43];
-rz(0.36060355057738264) q[44];
-cx q[3],q[44];
-cx q[3],q[49];
-cx q[12],q[44];
-rz(0.36060355057738264) q[44];
-cx q[12],q[44];
-rz(0.36060355057738264) q[45];
-cx q[16],q[45];
-cx q[16],q[59];
-rz(0.36060355057738264) q[46];
-cx q[5],q[46];
-cx q[5],q[65];
-cx q[38],q[46];
-rz(0.36060355057738264) q[46];
-cx q[38],q[46];
-rx(6.202457715349661) q[38];
-rx(6.202457715349661) q[46];
-rz(0.36060355057738264) q[47];
-cx q[4],q[47];
-cx q[17],q[47];
-rz(0.36060355057738264) q[47];
-cx q[17],q[47];
-cx q[17],q[53];
-rz(0.36060355057738264) q[48];
-cx q[0],q[48];
-cx q[0],q[51];
-cx q[30],q[48];
-rz(0.36060355057738264) q[48];
-cx q[30],q[48];
-rx(6.202457715349661) q[48];
-rz(0.36060355057738264) q[49];
-cx q[3],q[49];
-cx q[3],q[50];
-cx q[4],q[49];
-rz(0.36060355057738264) q[49];
-cx q[4],q[49];
-cx q[4],q[61];
-rx(6.202457715349661) q[49];
-rz(0.36060355057738264) q[50];
-cx q[3],q[50];
-cx q[3],q[52];
-cx q[12],q[50];
-rz(0.36060355057738264) q[50];
-cx q[12],q[50];
-cx q[12],q[63];
-rz(0.36060355057738264) q[51];
-cx q[0],q[51];
-cx q[0],q[62];
-cx q[28],q[51];
-rz(0.36060355057738264) q[51];
-cx q[28],q[51];
-rx(6.202457715349661) q[51];
-rz(0.36060355057738264) q[52];
-cx q[3],q[52];
-cx q[3],q[57];
-cx q[10],q[52];
-rz(0.36060355057738264) q[52];
-cx q[10],q[52];
-rx(6.202457715349661) q[52];
-rz(0.36060355057738264) q[53];
-cx q[17],q[53];
-cx q[21],q[53];
-rz(0.36060355057738264) q[53];
-cx q[21],q[53];
-rz(0.36060355057738264) q[54];
-cx q[24],q[54];
-cx q[24],q[58];
-cx q[28],q[54];
-rz(0.36060355057738264) q[54];
-cx q[28],q[54];
-rx(6.202457715349661) q[54];
-rz(0.36060355057738264) q[55];
-cx q[9],q[55];
-cx q[9],q[80];
-cx q[15],q[55];
-rz(0.36060355057738264) q[55];
-cx q[15],q[55];
-rx(6.202457715349661) q[55];
-rz(0.36060355057738264) q[56];
-cx q[13],q[56];
-cx q[13],q[68];
-cx q[45],q[56];
-rz(0.36060355057738264) q[56];
-cx q[45],q[56];
-rx(6.202457715349661) q[45];
-rz(0.36060355057738264) q[57];
-cx q[3],q[57];
-cx q[3],q[70];
-rx(6.202457715349661) q[57];
-rz(0.36060355057738264) q[58];
-cx q[24],q[58];
-cx q[24],q[86];
-cx q[28],q[58];
-rz(0.36060355057738264) q[58];
-cx q[28],q[58];
-cx q[28],q[87];
-rx(6.202457715349661) q[58];
-rz(0.36060355057738264) q[59];
-cx q[16],q[59];
-cx q[16],q[73];
-cx q[32],q[59];
-rz(0.36060355057738264) q[59];
-cx q[32],q[59];
-rz(0.36060355057738264) q[60];
-cx q[7],q[60];
-rz(0.36060355057738264) q[61];
-cx q[4],q[61];
-rx(6.202457715349661) q[4];
-cx q[7],q[61];
-rz(0.36060355057738264) q[61];
-cx q[7],q[61];
-rx(6.202457715349661) q[7];
-rx(6.202457715349661) q[61];
-rz(0.36060355057738264) q[62];
-cx q[0],q[62];
-cx q[0],q[64];
-cx q[17],q[62];
-rz(0.36060355057738264) q[62];
-cx q[17],q[62];
-rx(6.202457715349661) q[62];
-rz(0.36060355057738264) q[63];
-cx q[12],q[63];
-rx(6.202457715349661) q[12];
-cx q[17],q[63];
-rz(0.36060355057738264) q[63];
-cx q[17],q[63];
-cx q[17],q[66];
-rz(0.36060355057738264) q[64];
-cx q[0],q[64];
-cx q[0],q[75];
-cx q[10],q[64];
-rz(0.36060355057738264) q[64];
-cx q[10],q[64];
-rx(6.202457715349661) q[10];
-rx(6.202457715349661) q[64];
-rz(0.36060355057738264) q[65];
-cx q[5],q[65];
-cx q[5],q[76];
-cx q[23],q[65];
-rz(0.36060355057738264) q[65];
-cx q[23],q[65];
-rx(6.202457715349661) q[23];
-rx(6.202457715349661) q[65];
-rz(0.36060355057738264) q[66];
-cx q[17],q[66];
-rx(6.202457715349661) q[17];
-cx q[47],q[66];
-rz(0.36060355057738264) q[66];
-cx q[47],q[66];
-rx(6.202457715349661) q[47];
-rx(6.202457715349661) q[66];
-rz(0.36060355057738264) q[67];
-cx q[41],q[67];
-rx(6.202457715349661) q[41];
-cx q[56],q[67];
-rz(0.36060355057738264) q[67];
-cx q[56],q[67];
-cx q[56],q[74];
-rx(6.202457715349661) q[67];
-rz(0.36060355057738264) q[68];
-cx q[13],q[68];
-rx(6.202457715349661) q[13];
-cx q[32],q[68];
-rz(0.36060355057738264) q[68];
-cx q[32],q[68];
-cx q[68],q[83];
-rz(0.36060355057738264) q[69];
-cx q[6],q[69];
-cx q[59],q[69];
-rz(0.36060355057738264) q[69];
-cx q[59],q[69];
-rx(6.202457715349661) q[69];
-rz(0.36060355057738264) q[70];
-cx q[3],q[70];
-cx q[3],q[71];
-cx q[15],q[70];
-rz(0.36060355057738264) q[70];
-cx q[15],q[70];
-cx q[70],q[84];
-rz(0.36060355057738264) q[71];
-cx q[3],q[71];
-cx q[3],q[77];
-cx q[53],q[71];
-rz(0.36060355057738264) q[71];
-cx q[53],q[71];
-rx(6.202457715349661) q[71];
-rz(0.36060355057738264) q[72];
-cx q[27],q[72];
-cx q[44],q[72];
-rz(0.36060355057738264) q[72];
-cx q[44],q[72];
-rx(6.202457715349661) q[44];
-rx(6.202457715349661) q[72];
-rz(0.36060355057738264) q[73];
-cx q[16],q[73];
-rx(6.202457715349661) q[16];
-cx q[59],q[73];
-rz(0.36060355057738264) q[73];
-cx q[59],q[73];
-rz(0.36060355057738264) q[74];
-cx q[56],q[74];
-cx q[63],q[74];
-rz(0.36060355057738264) q[74];
-cx q[63],q[74];
-rx(6.202457715349661) q[63];
-rx(6.202457715349661) q[74];
-rz(0.36060355057738264) q[75];
-cx q[0],q[75];
-cx q[0],q[82];
-cx q[21],q[75];
-rz(0.36060355057738264) q[75];
-cx q[21],q[75];
-cx q[21],q[81];
-rx(6.202457715349661) q[75];
-rz(0.36060355057738264) q[76];
-cx q[5],q[76];
-cx q[6],q[76];
-rz(0.36060355057738264) q[76];
-cx q[6],q[76];
-cx q[6],q[79];
-rx(6.202457715349661) q[76];
-rz(0.36060355057738264) q[77];
-cx q[3],q[77];
-cx q[3],q[88];
-cx q[30],q[77];
-rz(0.36060355057738264) q[77];
-cx q[30],q[77];
-rx(6.202457715349661) q[30];
-rz(0.36060355057738264) q[78];
-cx q[42],q[78];
-rx(6.202457715349661) q[42];
-cx q[60],q[78];
-rz(0.36060355057738264) q[78];
-cx q[60],q[78];
-rx(6.202457715349661) q[78];
-rz(0.36060355057738264) q[79];
-cx q[6],q[79];
-cx q[50],q[79];
-rz(0.36060355057738264) q[79];
-cx q[50],q[79];
-rx(6.202457715349661) q[50];
-rx(6.202457715349661) q[79];
-rz(0.36060355057738264) q[80];
-cx q[9],q[80];
-rx(6.202457715349661) q[9];
-cx q[15],q[80];
-rz(0.36060355057738264) q[80];
-cx q[15],q[80];
-cx q[15],q[90];
-rx(6.202457715349661) q[80];
-rz(0.36060355057738264) q[81];
-cx q[21],q[81];
-rx(6.202457715349661) q[21];
-cx q[77],q[81];
-rz(0.36060355057738264) q[81];
-cx q[77],q[81];
-rx(6.202457715349661) q[77];
-rx(6.202457715349661) q[81];
-rz(0.36060355057738264) q[82];
-cx q[0],q[82];
-cx q[0],q[91];
-cx q[56],q[82];
-rz(0.36060355057738264) q[82];
-cx q[56],q[82];
-rx(6.202457715349661) q[56];
-rx(6.202457715349661) q[82];
-rz(0.36060355057738264) q[83];
-cx q[68],q[83];
-rx(6.202457715349661) q[68];
-rx(6.202457715349661) q[83];
-rz(0.36060355057738264) q[84];
-cx q[70],q[84];
-rx(6.202457715349661) q[70];
-cx q[73],q[84];
-rz(0.36060355057738264) q[84];
-cx q[73],q[84];
-rx(6.202457715349661) q[73];
-rx(6.202457715349661) q[84];
-rz(0.36060355057738264) q[85];
-cx q[37],q[85];
-rx(6.202457715349661) q[37];
-cx q[59],q[85];
-rz(0.36060355057738264) q[85];
-cx q[59],q[85];
-rx(6.202457715349661) q[59];
-rx(6.202457715349661) q[85];
-rz(0.36060355057738264) q[86];
-cx q[24],q[86];
-rx(6.202457715349661) q[24];
-cx q[53],q[86];
-rz(0.36060355057738264) q[86];
-cx q[53],q[86];
-rx(6.202457715349661) q[53];
-rx(6.202457715349661) q[86];
-rz(0.36060355057738264) q[87];
-cx q[28],q[87];
-rx(6.202457715349661) q[28];
-cx q[32],q[87];
-rz(0.36060355057738264) q[87];
-cx q[32],q[87];
-rx(6.202457715349661) q[32];
-rx(6.202457715349661) q[87];
-rz(0.36060355057738264) q[88];
-cx q[3],q[88];
-rx(6.202457715349661) q[3];
-cx q[60],q[88];
-rz(0.36060355057738264) q[88];
-cx q[60],q[88];
-rx(6.202457715349661) q[60];
-rx(6.202457715349661) q[88];
-cx q[89],q[92];
-rz(0.36060355057738264) q[90];
-cx q[15],q[90];
-cx q[27],q[90];
-rz(0.36060355057738264) q[90];
-cx q[27],q[90];
-rx(6.202457715349661) q[27];
-rx(6.202457715349661) q[90];
-rz(0.36060355057738264) q[91];
-cx q[0],q[91];
-rx(6.202457715349661) q[0];
-cx q[0],q[1];
-rz(3.0864345307619208) q[1];
-cx q[0],q[1];
-cx q[6],q[91];
-rz(0.36060355057738264) q[91];
-cx q[6],q[91];
-rx(6.202457715349661) q[6];
-rx(6.202457715349661) q[91];
-rz(0.12480932710416147) q[92];
-cx q[89],q[92];
-rx(12.073418516158505) q[89];
-cx q[2],q[89];
-rz(0.36060355057738264) q[89];
-cx q[2],q[89];
-rx(6.202457715349661) q[2];
-cx q[0],q[2];
-rz(3.0864345307619208) q[2];
-cx q[0],q[2];
-cx q[0],q[3];
-rz(3.0864345307619208) q[3];
-cx q[0],q[3];
-cx q[1],q[3];
-rz(3.0864345307619208) q[3];
-cx q[1],q[3];
-cx q[1],q[4];
-rz(3.0864345307619208) q[4];
-cx q[1],q[4];
-cx q[3],q[4];
-rz(3.0864345307619208) q[4];
-cx q[3],q[4];
-cx q[4],q[6];
-cx q[5],q[89];
-rz(3.0864345307619208) q[6];
-cx q[4],q[6];
-rz(0.36060355057738264) q[89];
-cx q[5],q[89];
-rx(6.202457715349661) q[5];
-cx q[1],q[5];
-rz(3.0864345307619208) q[5];
-cx q[1],q[5];
-cx q[1],q[9];
-cx q[3],q[5];
-rz(3.0864345307619208) q[5];
-cx q[3],q[5];
-cx q[3],q[7];
-cx q[5],q[6];
-rz(3.0864345307619208) q[6];
-cx q[5],q[6];
-rz(3.0864345307619208) q[7];
-cx q[3],q[7];
-cx q[3],q[8];
-cx q[4],q[7];
-rz(3.0864345307619208) q[7];
-cx q[4],q[7];
-cx q[4],q[10];
-rz(3.0864345307619208) q[8];
-cx q[3],q[8];
-cx q[5],q[8];
-rz(3.0864345307619208) q[8];
-cx q[5],q[8];
-cx q[5],q[11];
-cx q[8],q[83];
-rz(3.0864345307619208) q[9];
-cx q[1],q[9];
-cx q[1],q[17];
-cx q[3],q[9];
-rz(3.0864345307619208) q[9];
-cx q[3],q[9];
-cx q[3],q[12];
-rz(3.0864345307619208) q[10];
-cx q[4],q[10];
-cx q[4],q[13];
-cx q[6],q[10];
-rz(3.0864345307619208) q[10];
-cx q[6],q[10];
-cx q[10],q[37];
-rz(3.0864345307619208) q[11];
-cx q[5],q[11];
-cx q[6],q[11];
-rz(3.0864345307619208) q[11];
-cx q[6],q[11];
-rx(3.435117127150194) q[11];
-rz(3.0864345307619208) q[12];
-cx q[3],q[12];
-cx q[3],q[14];
-cx q[5],q[12];
-rz(3.0864345307619208) q[12];
-cx q[5],q[12];
-rz(3.0864345307619208) q[13];
-cx q[4],q[13];
-cx q[5],q[13];
-rz(3.0864345307619208) q[13];
-cx q[5],q[13];
-rz(3.0864345307619208) q[14];
-cx q[3],q[14];
-cx q[4],q[14];
-rz(3.0864345307619208) q[14];
-cx q[4],q[14];
-rx(3.435117127150194) q[14];
-rz(3.0864345307619208) q[17];
-cx q[1],q[17];
-cx q[1],q[28];
-rz(3.0864345307619208) q[28];
-cx q[1],q[28];
-cx q[1],q[29];
-rz(3.0864345307619208) q[29];
-cx q[1],q[29];
-cx q[1],q[45];
-rz(3.0864345307619208) q[37];
-cx q[10],q[37];
-cx q[10],q[41];
-rz(3.0864345307619208) q[41];
-cx q[10],q[41];
-rz(3.0864345307619208) q[45];
-cx q[1],q[45];
-cx q[1],q[57];
-rz(3.0864345307619208) q[57];
-cx q[1],q[57];
-cx q[1],q[60];
-rz(3.0864345307619208) q[60];
-cx q[1],q[60];
-rx(3.435117127150194) q[1];
-rz(3.0864345307619208) q[83];
-cx q[8],q[83];
-rx(3.435117127150194) q[8];
-rx(12.073418516158505) q[92];
-cx q[15],q[92];
-rz(0.36060355057738264) q[92];
-cx q[15],q[92];
-rx(6.202457715349661) q[15];
-cx q[0],q[15];
-rz(3.0864345307619208) q[15];
-cx q[0],q[15];
-cx q[0],q[16];
-cx q[3],q[15];
-rz(3.0864345307619208) q[15];
-cx q[3],q[15];
-rz(3.0864345307619208) q[16];
-cx q[0],q[16];
-cx q[0],q[20];
-cx q[3],q[16];
-rz(3.0864345307619208) q[16];
-cx q[3],q[16];
-cx q[3],q[17];
-cx q[16],q[45];
-rz(3.0864345307619208) q[17];
-cx q[3],q[17];
-cx q[3],q[18];
-rz(3.0864345307619208) q[18];
-cx q[3],q[18];
-cx q[3],q[19];
-cx q[4],q[18];
-rz(3.0864345307619208) q[18];
-cx q[4],q[18];
-cx q[4],q[21];
-rz(3.0864345307619208) q[19];
-cx q[3],q[19];
-cx q[3],q[22];
-cx q[7],q[19];
-rz(3.0864345307619208) q[19];
-cx q[7],q[19];
-cx q[7],q[60];
-cx q[19],q[38];
-rz(3.0864345307619208) q[20];
-cx q[0],q[20];
-cx q[0],q[32];
-cx q[15],q[20];
-rz(3.0864345307619208) q[20];
-cx q[15],q[20];
-rz(3.0864345307619208) q[21];
-cx q[4],q[21];
-cx q[4],q[27];
-cx q[15],q[21];
-rz(3.0864345307619208) q[21];
-cx q[15],q[21];
-cx q[15],q[36];
-rz(3.0864345307619208) q[22];
-cx q[3],q[22];
-cx q[3],q[23];
-cx q[9],q[22];
-rz(3.0864345307619208) q[22];
-cx q[9],q[22];
-cx q[9],q[55];
-rx(3.435117127150194) q[22];
-rz(3.0864345307619208) q[23];
-cx q[3],q[23];
-cx q[3],q[24];
-cx q[17],q[23];
-rz(3.0864345307619208) q[23];
-cx q[17],q[23];
-rz(3.0864345307619208) q[24];
-cx q[3],q[24];
-cx q[3],q[25];
-cx q[5],q[24];
-rz(3.0864345307619208) q[24];
-cx q[5],q[24];
-cx q[5],q[33];
-cx q[24],q[54];
-rz(3.0864345307619208) q[25];
-cx q[3],q[25];
-cx q[3],q[26];
-cx q[12],q[25];
-rz(3.0864345307619208) q[25];
-cx q[12],q[25];
-cx q[12],q[31];
-rx(3.435117127150194) q[25];
-rz(3.0864345307619208) q[26];
-cx q[3],q[26];
-cx q[3],q[28];
-cx q[21],q[26];
-rz(3.0864345307619208) q[26];
-cx q[21],q[26];
-rz(3.0864345307619208) q[27];
-cx q[4],q[27];
-cx q[4],q[47];
-cx q[6],q[27];
-rz(3.0864345307619208) q[27];
-cx q[6],q[27];
-cx q[6],q[69];
-cx q[27],q[41];
-rz(3.0864345307619208) q[28];
-cx q[3],q[28];
-cx q[3],q[29];
-rz(3.0864345307619208) q[29];
-cx q[3],q[29];
-cx q[3],q[30];
-rx(3.435117127150194) q[29];
-rz(3.0864345307619208) q[30];
-cx q[3],q[30];
-cx q[3],q[34];
-cx q[18],q[30];
-rz(3.0864345307619208) q[30];
-cx q[18],q[30];
-rx(3.435117127150194) q[18];
-rz(3.0864345307619208) q[31];
-cx q[12],q[31];
-cx q[26],q[31];
-rz(3.0864345307619208) q[31];
-cx q[26],q[31];
-rx(3.435117127150194) q[26];
-rx(3.435117127150194) q[31];
-rz(3.0864345307619208) q[32];
-cx q[0],q[32];
-cx q[0],q[42];
-cx q[21],q[32];
-rz(3.0864345307619208) q[32];
-cx q[21],q[32];
-rz(3.0864345307619208) q[33];
-cx q[5],q[33];
-cx q[5],q[46];
-cx q[30],q[33];
-rz(3.0864345307619208) q[33];
-cx q[30],q[33];
-rx(3.435117127150194) q[33];
-rz(3.0864345307619208) q[34];
-cx q[3],q[34];
-cx q[3],q[35];
-cx q[12],q[34];
-rz(3.0864345307619208) q[34];
-cx q[12],q[34];
-cx q[34],q[37];
-rz(3.0864345307619208) q[35];
-cx q[3],q[35];
-cx q[3],q[39];
-cx q[32],q[35];
-rz(3.0864345307619208) q[35];
-cx q[32],q[35];
-rx(3.435117127150194) q[35];
-rz(3.0864345307619208) q[36];
-cx q[15],q[36];
-cx q[20],q[36];
-rz(3.0864345307619208) q[36];
-cx q[20],q[36];
-rx(3.435117127150194) q[36];
-rz(3.0864345307619208) q[37];
-cx q[34],q[37];
-rx(3.435117127150194) q[34];
-cx q[37],q[85];
-rz(3.0864345307619208) q[38];
-cx q[19],q[38];
-rx(3.435117127150194) q[19];
-cx q[21],q[38];
-rz(3.0864345307619208) q[38];
-cx q[21],q[38];
-rz(3.0864345307619208) q[39];
-cx q[3],q[39];
-cx q[3],q[40];
-cx q[13],q[39];
-rz(3.0864345307619208) q[39];
-cx q[13],q[39];
-cx q[13],q[56];
-rx(3.435117127150194) q[39];
-rz(3.0864345307619208) q[40];
-cx q[3],q[40];
-cx q[23],q[40];
-rz(3.0864345307619208) q[40];
-cx q[23],q[40];
-rx(3.435117127150194) q[40];
-rz(3.0864345307619208) q[41];
-cx q[27],q[41];
-cx q[27],q[72];
-cx q[41],q[67];
-rz(3.0864345307619208) q[42];
-cx q[0],q[42];
-cx q[0],q[48];
-cx q[3],q[42];
-rz(3.0864345307619208) q[42];
-cx q[3],q[42];
-cx q[3],q[43];
-cx q[42],q[78];
-rz(3.0864345307619208) q[43];
-cx q[3],q[43];
-cx q[3],q[44];
-cx q[20],q[43];
-rz(3.0864345307619208) q[43];
-cx q[20],q[43];
-rx(3.435117127150194) q[20];
-rx(3.435117127150194) q[43];
-rz(3.0864345307619208) q[44];
-cx q[3],q[44];
-cx q[3],q[49];
-cx q[12],q[44];
-rz(3.0864345307619208) q[44];
-cx q[12],q[44];
-rz(3.0864345307619208) q[45];
-cx q[16],q[45];
-cx q[16],q[59];
-rz(3.0864345307619208) q[46];
-cx q[5],q[46];
-cx q[5],q[65];
-cx q[38],q[46];
-rz(3.0864345307619208) q[46];
-cx q[38],q[46];
-rx(3.435117127150194) q[38];
-rx(3.435117127150194) q[46];
-rz(3.0864345307619208) q[47];
-cx q[4],q[47];
-cx q[17],q[47];
-rz(3.0864345307619208) q[47];
-cx q[17],q[47];
-cx q[17],q[53];
-rz(3.0864345307619208) q[48];
-cx q[0],q[48];
-cx q[0],q[51];
-cx q[30],q[48];
-rz(3.0864345307619208) q[48];
-cx q[30],q[48];
-rx(3.435117127150194) q[48];
-rz(3.0864345307619208) q[49];
-cx q[3],q[49];
-cx q[3],q[50];
-cx q[4],q[49];
-rz(3.0864345307619208) q[49];
-cx q[4],q[49];
-cx q[4],q[61];
-rx(3.435117127150194) q[49];
-rz(3.0864345307619208) q[50];
-cx q[3],q[50];
-cx q[3],q[52];
-cx q[12],q[50];
-rz(3.0864345307619208) q[50];
-cx q[12],q[50];
-cx q[12],q[63];
-rz(3.0864345307619208) q[51];
-cx q[0],q[51];
-cx q[0],q[62];
-cx q[28],q[51];
-rz(3.0864345307619208) q[51];
-cx q[28],q[51];
-rx(3.435117127150194) q[51];
-rz(3.0864345307619208) q[52];
-cx q[3],q[52];
-cx q[3],q[57];
-cx q[10],q[52];
-rz(3.0864345307619208) q[52];
-cx q[10],q[52];
-rx(3.435117127150194) q[52];
-rz(3.0864345307619208) q[53];
-cx q[17],q[53];
-cx q[21],q[53];
-rz(3.0864345307619208) q[53];
-cx q[21],q[53];
-rz(3.0864345307619208) q[54];
-cx q[24],q[54];
-cx q[24],q[58];
-cx q[28],q[54];
-rz(3.0864345307619208) q[54];
-cx q[28],q[54];
-rx(3.435117127150194) q[54];
-rz(3.0864345307619208) q[55];
-cx q[9],q[55];
-cx q[9],q[80];
-cx q[15],q[55];
-rz(3.0864345307619208) q[55];
-cx q[15],q[55];
-rx(3.435117127150194) q[55];
-rz(3.0864345307619208) q[56];
-cx q[13],q[56];
-cx q[13],q[68];
-cx q[45],q[56];
-rz(3.0864345307619208) q[56];
-cx q[45],q[56];
-rx(3.435117127150194) q[45];
-rz(3.0864345307619208) q[57];
-cx q[3],q[57];
-cx q[3],q[70];
-rx(3.435117127150194) q[57];
-rz(3.0864345307619208) q[58];
-cx q[24],q[58];
-cx q[24],q[86];
-cx q[28],q[58];
-rz(3.0864345307619208) q[58];
-cx q[28],q[58];
-cx q[28],q[87];
-rx(3.435117127150194) q[58];
-rz(3.0864345307619208) q[59];
-cx q[16],q[59];
-cx q[16],q[73];
-cx q[32],q[59];
-rz(3.0864345307619208) q[59];
-cx q[32],q[59];
-rz(3.0864345307619208) q[60];
-cx q[7],q[60];
-rz(3.0864345307619208) q[61];
-cx q[4],q[61];
-rx(3.435117127150194) q[4];
-cx q[7],q[61];
-rz(3.0864345307619208) q[61];
-cx q[7],q[61];
-rx(3.435117127150194) q[7];
-rx(3.435117127150194) q[61];
-rz(3.0864345307619208) q[62];
-cx q[0],q[62];
-cx q[0],q[64];
-cx q[17],q[62];
-rz(3.0864345307619208) q[62];
-cx q[17],q[62];
-rx(3.435117127150194) q[62];
-rz(3.0864345307619208) q[63];
-cx q[12],q[63];
-rx(3.435117127150194) q[12];
-cx q[17],q[63];
-rz(3.0864345307619208) q[63];
-cx q[17],q[63];
-cx q[17],q[66];
-rz(3.0864345307619208) q[64];
-cx q[0],q[64];
-cx q[0],q[75];
-cx q[10],q[64];
-rz(3.0864345307619208) q[64];
-cx q[10],q[64];
-rx(3.435117127150194) q[10];
-rx(3.435117127150194) q[64];
-rz(3.0864345307619208) q[65];
-cx q[5],q[65];
-cx q[5],q[76];
-cx q[23],q[65];
-rz(3.0864345307619208) q[65];
-cx q[23],q[65];
-rx(3.435117127150194) q[23];
-rx(3.435117127150194) q[65];
-rz(3.0864345307619208) q[66];
-cx q[17],q[66];
-rx(3.435117127150194) q[17];
-cx q[47],q[66];
-rz(3.0864345307619208) q[66];
-cx q[47],q[66];
-rx(3.435117127150194) q[47];
-rx(3.435117127150194) q[66];
-rz(3.0864345307619208) q[67];
-cx q[41],q[67];
-rx(3.435117127150194) q[41];
-cx q[56],q[67];
-rz(3.0864345307619208) q[67];
-cx q[56],q[67];
-cx q[56],q[74];
-rx(3.435117127150194) q[67];
-rz(3.0864345307619208) q[68];
-cx q[13],q[68];
-rx(3.435117127150194) q[13];
-cx q[32],q[68];
-rz(3.0864345307619208) q[68];
-cx q[32],q[68];
-cx q[68],q[83];
-rz(3.0864345307619208) q[69];
-cx q[6],q[69];
-cx q[59],q[69];
-rz(3.0864345307619208) q[69];
-cx q[59],q[69];
-rx(3.435117127150194) q[69];
-rz(3.0864345307619208) q[70];
-cx q[3],q[70];
-cx q[3],q[71];
-cx q[15],q[70];
-rz(3.0864345307619208) q[70];
-cx q[15],q[70];
-cx q[70],q[84];
-rz(3.0864345307619208) q[71];
-cx q[3],q[71];
-cx q[3],q[77];
-cx q[53],q[71];
-rz(3.0864345307619208) q[71];
-cx q[53],q[71];
-rx(3.435117127150194) q[71];
-rz(3.0864345307619208) q[72];
-cx q[27],q[72];
-cx q[44],q[72];
-rz(3.0864345307619208) q[72];
-cx q[44],q[72];
-rx(3.435117127150194) q[44];
-rx(3.435117127150194) q[72];
-rz(3.0864345307619208) q[73];
-cx q[16],q[73];
-rx(3.435117127150194) q[16];
-cx q[59],q[73];
-rz(3.0864345307619208) q[73];
-cx q[59],q[73];
-rz(3.0864345307619208) q[74];
-cx q[56],q[74];
-cx q[63],q[74];
-rz(3.0864345307619208) q[74];
-cx q[63],q[74];
-rx(3.435117127150194) q[63];
-rx(3.435117127150194) q[74];
-rz(3.0864345307619208) q[75];
-cx q[0],q[75];
-cx q[0],q[82];
-cx q[21],q[75];
-rz(3.0864345307619208) q[75];
-cx q[21],q[75];
-cx q[21],q[81];
-rx(3.435117127150194) q[75];
-rz(3.0864345307619208) q[76];
-cx q[5],q[76];
-cx q[6],q[76];
-rz(3.0864345307619208) q[76];
-cx q[6],q[76];
-cx q[6],q[79];
-rx(3.435117127150194) q[76];
-rz(3.0864345307619208) q[77];
-cx q[3],q[77];
-cx q[3],q[88];
-cx q[30],q[77];
-rz(3.0864345307619208) q[77];
-cx q[30],q[77];
-rx(3.435117127150194) q[30];
-rz(3.0864345307619208) q[78];
-cx q[42],q[78];
-rx(3.435117127150194) q[42];
-cx q[60],q[78];
-rz(3.0864345307619208) q[78];
-cx q[60],q[78];
-rx(3.435117127150194) q[78];
-rz(3.0864345307619208) q[79];
-cx q[6],q[79];
-cx q[50],q[79];
-rz(3.0864345307619208) q[79];
-cx q[50],q[79];
-rx(3.435117127150194) q[50];
-rx(3.435117127150194) q[79];
-rz(3.0864345307619208) q[80];
-cx q[9],q[80];
-rx(3.435117127150194) q[9];
-cx q[15],q[80];
-rz(3.0864345307619208) q[80];
-cx q[15],q[80];
-cx q[15],q[90];
-rx(3.435117127150194) q[80];
-rz(3.0864345307619208) q[81];
-cx q[21],q[81];
-rx(3.435117127150194) q[21];
-cx q[77],q[81];
-rz(3.0864345307619208) q[81];
-cx q[77],q[81];
-rx(3.435117127150194) q[77];
-rx(3.435117127150194) q[81];
-rz(3.0864345307619208) q[82];
-cx q[0],q[82];
-cx q[0],q[91];
-cx q[56],q[82];
-rz(3.0864345307619208) q[82];
-cx q[56],q[82];
-rx(3.435117127150194) q[56];
-rx(3.435117127150194) q[82];
-rz(3.0864345307619208) q[83];
-cx q[68],q[83];
-rx(3.435117127150194) q[68];
-rx(3.435117127150194) q[83];
-rz(3.0864345307619208) q[84];
-cx q[70],q[84];
-rx(3.435117127150194) q[70];
-cx q[73],q[84];
-rz(3.0864345307619208) q[84];
-cx q[73],q[84];
-rx(3.435117127150194) q[73];
-rx(3.435117127150194) q[84];
-rz(3.0864345307619208) q[85];
-cx q[37],q[85];
-rx(3.435117127150194) q[37];
-cx q[59],q[85];
-rz(3.0864345307619208) q[85];
-cx q[59],q[85];
-rx(3.435117127150194) q[59];
-rx(3.435117127150194) q[85];
-rz(3.0864345307619208) q[86];
-cx q[24],q[86];
-rx(3.435117127150194) q[24];
-cx q[53],q[86];
-rz(3.0864345307619208) q[86];
-cx q[53],q[86];
-rx(3.435117127150194) q[53];
-rx(3.435117127150194) q[86];
-rz(3.0864345307619208) q[87];
-cx q[28],q[87];
-rx(3.435117127150194) q[28];
-cx q[32],q[87];
-rz(3.0864345307619208) q[87];
-cx q[32],q[87];
-rx(3.435117127150194) q[32];
-rx(3.435117127150194) q[87];
-rz(3.0864345307619208) q[88];
-cx q[3],q[88];
-rx(3.435117127150194) q[3];
-cx q[60],q[88];
-rz(3.0864345307619208) q[88];
-cx q[60],q[88];
-rx(3.435117127150194) q[60];
-rx(3.435117127150194) q[88];
-cx q[89],q[92];
-rz(3.0864345307619208) q[90];
-cx q[15],q[90];
-cx q[27],q[90];
-rz(3.0864345307619208) q[90];
-cx q[27],q[90];
-rx(3.435117127150194) q[27];
-rx(3.435117127150194) q[90];
-rz(3.0864345307619208) q[91];
-cx q[0],q[91];
-rx(3.435117127150194) q[0];
-cx q[6],q[91];
-rz(3.0864345307619208) q[91];
-cx q[6],q[91];
-rx(3.435117127150194) q[6];
-rx(3.435117127150194) q[91];
-rz(0.36060355057738264) q[92];
-cx q[89],q[92];
-rx(6.202457715349661) q[89];
-cx q[2],q[89];
-rz(3.0864345307619208) q[89];
-cx q[2],q[89];
-rx(3.435117127150194) q[2];
-cx q[5],q[89];
-rz(3.0864345307619208) q[89];
-cx q[5],q[89];
-rx(3.435117127150194) q[5];
-rx(6.202457715349661) q[92];
-cx q[15],q[92];
-rz(3.0864345307619208) q[92];
-cx q[15],q[92];
-rx(3.435117127150194) q[15];
-cx q[89],q[92];
-rz(3.0864345307619208) q[92];
-cx q[89],q[92];
-rx(3.435117127150194) q[89];
-rx(3.435117127150194) q[92];
\ No newline at end of file
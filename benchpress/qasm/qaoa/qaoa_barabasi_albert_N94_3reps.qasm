@@ -1,2129 +0,0 @@
-OPENQASM 2.0;
-include "qelib1.inc";
-qreg q[94];
-ry(pi/2) q[0];
-rx(pi) q[0];
-ry(pi/2) q[1];
-rx(pi) q[1];
-cx q[0],q[1];
-rz(4.291589323265829) q[1];
-cx q[0],q[1];
-ry(pi/2) q[2];
-rx(pi) q[2];
-cx q[0],q[2];
-rz(4.291589323265829) q[2];
-cx q[0],q[2];
-ry(pi/2) q[3];
-rx(pi) q[3];
-cx q[0],q[3];
-rz(4.291589323265829) q[3];
-cx q[0],q[3];
-cx q[1],q[3];
-rz(4.291589323265829) q[3];
-cx q[1],q[3];
-ry(pi/2) q[4];
-rx(pi) q[4];
-cx q[1],q[4];
-rz(4.291589323265829) q[4];
-cx q[1],q[4];
-cx q[3],q[4];
-rz(4.291589323265829) q[4];
-cx q[3],q[4];
-ry(pi/2) q[5];
-rx(pi) q[5];
-cx q[1],q[5];
-rz(4.291589323265829) q[5];
-cx q[1],q[5];
-cx q[3],q[5];
-rz(4.291589323265829) q[5];
-cx q[3],q[5];
-ry(pi/2) q[6];
-rx(pi) q[6];
-cx q[4],q[6];
-rz(4.291589323265829) q[6];
-cx q[4],q[6];
-cx q[5],q[6];
-rz(4.291589323265829) q[6];
-cx q[5],q[6];
-ry(pi/2) q[7];
-rx(pi) q[7];
-cx q[3],q[7];
-rz(4.291589323265829) q[7];
-cx q[3],q[7];
-cx q[4],q[7];
-rz(4.291589323265829) q[7];
-cx q[4],q[7];
-ry(pi/2) q[8];
-rx(pi) q[8];
-cx q[3],q[8];
-rz(4.291589323265829) q[8];
-cx q[3],q[8];
-cx q[5],q[8];
-rz(4.291589323265829) q[8];
-cx q[5],q[8];
-ry(pi/2) q[9];
-rx(pi) q[9];
-cx q[1],q[9];
-rz(4.291589323265829) q[9];
-cx q[1],q[9];
-cx q[3],q[9];
-rz(4.291589323265829) q[9];
-cx q[3],q[9];
-ry(pi/2) q[10];
-rx(pi) q[10];
-cx q[4],q[10];
-rz(4.291589323265829) q[10];
-cx q[4],q[10];
-cx q[6],q[10];
-rz(4.291589323265829) q[10];
-cx q[6],q[10];
-ry(pi/2) q[11];
-rx(pi) q[11];
-cx q[5],q[11];
-rz(4.291589323265829) q[11];
-cx q[5],q[11];
-cx q[6],q[11];
-rz(4.291589323265829) q[11];
-cx q[6],q[11];
-rx(12.188412650161391) q[11];
-ry(pi/2) q[12];
-rx(pi) q[12];
-cx q[3],q[12];
-rz(4.291589323265829) q[12];
-cx q[3],q[12];
-cx q[5],q[12];
-rz(4.291589323265829) q[12];
-cx q[5],q[12];
-ry(pi/2) q[13];
-rx(pi) q[13];
-cx q[4],q[13];
-rz(4.291589323265829) q[13];
-cx q[4],q[13];
-cx q[5],q[13];
-rz(4.291589323265829) q[13];
-cx q[5],q[13];
-ry(pi/2) q[14];
-rx(pi) q[14];
-cx q[3],q[14];
-rz(4.291589323265829) q[14];
-cx q[3],q[14];
-cx q[4],q[14];
-rz(4.291589323265829) q[14];
-cx q[4],q[14];
-rx(12.188412650161391) q[14];
-ry(pi/2) q[15];
-rx(pi) q[15];
-cx q[0],q[15];
-rz(4.291589323265829) q[15];
-cx q[0],q[15];
-cx q[3],q[15];
-rz(4.291589323265829) q[15];
-cx q[3],q[15];
-ry(pi/2) q[16];
-rx(pi) q[16];
-cx q[0],q[16];
-rz(4.291589323265829) q[16];
-cx q[0],q[16];
-cx q[3],q[16];
-rz(4.291589323265829) q[16];
-cx q[3],q[16];
-ry(pi/2) q[17];
-rx(pi) q[17];
-cx q[1],q[17];
-rz(4.291589323265829) q[17];
-cx q[1],q[17];
-cx q[3],q[17];
-rz(4.291589323265829) q[17];
-cx q[3],q[17];
-ry(pi/2) q[18];
-rx(pi) q[18];
-cx q[3],q[18];
-rz(4.291589323265829) q[18];
-cx q[3],q[18];
-cx q[4],q[18];
-rz(4.291589323265829) q[18];
-cx q[4],q[18];
-ry(pi/2) q[19];
-rx(pi) q[19];
-cx q[3],q[19];
-rz(4.291589323265829) q[19];
-cx q[3],q[19];
-cx q[7],q[19];
-rz(4.291589323265829) q[19];
-cx q[7],q[19];
-ry(pi/2) q[20];
-rx(pi) q[20];
-cx q[0],q[20];
-rz(4.291589323265829) q[20];
-cx q[0],q[20];
-cx q[15],q[20];
-rz(4.291589323265829) q[20];
-cx q[15],q[20];
-ry(pi/2) q[21];
-rx(pi) q[21];
-cx q[4],q[21];
-rz(4.291589323265829) q[21];
-cx q[4],q[21];
-cx q[15],q[21];
-rz(4.291589323265829) q[21];
-cx q[15],q[21];
-ry(pi/2) q[22];
-rx(pi) q[22];
-cx q[3],q[22];
-rz(4.291589323265829) q[22];
-cx q[3],q[22];
-cx q[9],q[22];
-rz(4.291589323265829) q[22];
-cx q[9],q[22];
-rx(12.188412650161391) q[22];
-ry(pi/2) q[23];
-rx(pi) q[23];
-cx q[3],q[23];
-rz(4.291589323265829) q[23];
-cx q[3],q[23];
-cx q[17],q[23];
-rz(4.291589323265829) q[23];
-cx q[17],q[23];
-ry(pi/2) q[24];
-rx(pi) q[24];
-cx q[3],q[24];
-rz(4.291589323265829) q[24];
-cx q[3],q[24];
-cx q[5],q[24];
-rz(4.291589323265829) q[24];
-cx q[5],q[24];
-ry(pi/2) q[25];
-rx(pi) q[25];
-cx q[3],q[25];
-rz(4.291589323265829) q[25];
-cx q[3],q[25];
-cx q[12],q[25];
-rz(4.291589323265829) q[25];
-cx q[12],q[25];
-rx(12.188412650161391) q[25];
-ry(pi/2) q[26];
-rx(pi) q[26];
-cx q[3],q[26];
-rz(4.291589323265829) q[26];
-cx q[3],q[26];
-cx q[21],q[26];
-rz(4.291589323265829) q[26];
-cx q[21],q[26];
-ry(pi/2) q[27];
-rx(pi) q[27];
-cx q[4],q[27];
-rz(4.291589323265829) q[27];
-cx q[4],q[27];
-cx q[6],q[27];
-rz(4.291589323265829) q[27];
-cx q[6],q[27];
-ry(pi/2) q[28];
-rx(pi) q[28];
-cx q[1],q[28];
-rz(4.291589323265829) q[28];
-cx q[1],q[28];
-cx q[3],q[28];
-rz(4.291589323265829) q[28];
-cx q[3],q[28];
-ry(pi/2) q[29];
-rx(pi) q[29];
-cx q[1],q[29];
-rz(4.291589323265829) q[29];
-cx q[1],q[29];
-cx q[3],q[29];
-rz(4.291589323265829) q[29];
-cx q[3],q[29];
-rx(12.188412650161391) q[29];
-ry(pi/2) q[30];
-rx(pi) q[30];
-cx q[3],q[30];
-rz(4.291589323265829) q[30];
-cx q[3],q[30];
-cx q[18],q[30];
-rz(4.291589323265829) q[30];
-cx q[18],q[30];
-rx(12.188412650161391) q[18];
-ry(pi/2) q[31];
-rx(pi) q[31];
-cx q[12],q[31];
-rz(4.291589323265829) q[31];
-cx q[12],q[31];
-cx q[26],q[31];
-rz(4.291589323265829) q[31];
-cx q[26],q[31];
-rx(12.188412650161391) q[26];
-rx(12.188412650161391) q[31];
-ry(pi/2) q[32];
-rx(pi) q[32];
-cx q[0],q[32];
-rz(4.291589323265829) q[32];
-cx q[0],q[32];
-cx q[21],q[32];
-rz(4.291589323265829) q[32];
-cx q[21],q[32];
-ry(pi/2) q[33];
-rx(pi) q[33];
-cx q[5],q[33];
-rz(4.291589323265829) q[33];
-cx q[5],q[33];
-cx q[30],q[33];
-rz(4.291589323265829) q[33];
-cx q[30],q[33];
-rx(12.188412650161391) q[33];
-ry(pi/2) q[34];
-rx(pi) q[34];
-cx q[3],q[34];
-rz(4.291589323265829) q[34];
-cx q[3],q[34];
-cx q[12],q[34];
-rz(4.291589323265829) q[34];
-cx q[12],q[34];
-ry(pi/2) q[35];
-rx(pi) q[35];
-cx q[3],q[35];
-rz(4.291589323265829) q[35];
-cx q[3],q[35];
-cx q[32],q[35];
-rz(4.291589323265829) q[35];
-cx q[32],q[35];
-rx(12.188412650161391) q[35];
-ry(pi/2) q[36];
-rx(pi) q[36];
-cx q[15],q[36];
-rz(4.291589323265829) q[36];
-cx q[15],q[36];
-cx q[20],q[36];
-rz(4.291589323265829) q[36];
-cx q[20],q[36];
-rx(12.188412650161391) q[36];
-ry(pi/2) q[37];
-rx(pi) q[37];
-cx q[10],q[37];
-rz(4.291589323265829) q[37];
-cx q[10],q[37];
-cx q[34],q[37];
-rz(4.291589323265829) q[37];
-cx q[34],q[37];
-rx(12.188412650161391) q[34];
-ry(pi/2) q[38];
-rx(pi) q[38];
-cx q[19],q[38];
-rz(4.291589323265829) q[38];
-cx q[19],q[38];
-rx(12.188412650161391) q[19];
-cx q[21],q[38];
-rz(4.291589323265829) q[38];
-cx q[21],q[38];
-ry(pi/2) q[39];
-rx(pi) q[39];
-cx q[3],q[39];
-rz(4.291589323265829) q[39];
-cx q[3],q[39];
-cx q[13],q[39];
-rz(4.291589323265829) q[39];
-cx q[13],q[39];
-rx(12.188412650161391) q[39];
-ry(pi/2) q[40];
-rx(pi) q[40];
-cx q[3],q[40];
-rz(4.291589323265829) q[40];
-cx q[3],q[40];
-cx q[23],q[40];
-rz(4.291589323265829) q[40];
-cx q[23],q[40];
-rx(12.188412650161391) q[40];
-ry(pi/2) q[41];
-rx(pi) q[41];
-cx q[10],q[41];
-rz(4.291589323265829) q[41];
-cx q[10],q[41];
-cx q[27],q[41];
-rz(4.291589323265829) q[41];
-cx q[27],q[41];
-ry(pi/2) q[42];
-rx(pi) q[42];
-cx q[0],q[42];
-rz(4.291589323265829) q[42];
-cx q[0],q[42];
-cx q[3],q[42];
-rz(4.291589323265829) q[42];
-cx q[3],q[42];
-ry(pi/2) q[43];
-rx(pi) q[43];
-cx q[3],q[43];
-rz(4.291589323265829) q[43];
-cx q[3],q[43];
-cx q[20],q[43];
-rz(4.291589323265829) q[43];
-cx q[20],q[43];
-rx(12.188412650161391) q[20];
-rx(12.188412650161391) q[43];
-ry(pi/2) q[44];
-rx(pi) q[44];
-cx q[3],q[44];
-rz(4.291589323265829) q[44];
-cx q[3],q[44];
-cx q[12],q[44];
-rz(4.291589323265829) q[44];
-cx q[12],q[44];
-ry(pi/2) q[45];
-rx(pi) q[45];
-cx q[1],q[45];
-rz(4.291589323265829) q[45];
-cx q[1],q[45];
-cx q[16],q[45];
-rz(4.291589323265829) q[45];
-cx q[16],q[45];
-ry(pi/2) q[46];
-rx(pi) q[46];
-cx q[5],q[46];
-rz(4.291589323265829) q[46];
-cx q[5],q[46];
-cx q[38],q[46];
-rz(4.291589323265829) q[46];
-cx q[38],q[46];
-rx(12.188412650161391) q[38];
-rx(12.188412650161391) q[46];
-ry(pi/2) q[47];
-rx(pi) q[47];
-cx q[4],q[47];
-rz(4.291589323265829) q[47];
-cx q[4],q[47];
-cx q[17],q[47];
-rz(4.291589323265829) q[47];
-cx q[17],q[47];
-ry(pi/2) q[48];
-rx(pi) q[48];
-cx q[0],q[48];
-rz(4.291589323265829) q[48];
-cx q[0],q[48];
-cx q[30],q[48];
-rz(4.291589323265829) q[48];
-cx q[30],q[48];
-rx(12.188412650161391) q[48];
-ry(pi/2) q[49];
-rx(pi) q[49];
-cx q[3],q[49];
-rz(4.291589323265829) q[49];
-cx q[3],q[49];
-cx q[4],q[49];
-rz(4.291589323265829) q[49];
-cx q[4],q[49];
-rx(12.188412650161391) q[49];
-ry(pi/2) q[50];
-rx(pi) q[50];
-cx q[3],q[50];
-rz(4.291589323265829) q[50];
-cx q[3],q[50];
-cx q[12],q[50];
-rz(4.291589323265829) q[50];
-cx q[12],q[50];
-ry(pi/2) q[51];
-rx(pi) q[51];
-cx q[0],q[51];
-rz(4.291589323265829) q[51];
-cx q[0],q[51];
-cx q[28],q[51];
-rz(4.291589323265829) q[51];
-cx q[28],q[51];
-rx(12.188412650161391) q[51];
-ry(pi/2) q[52];
-rx(pi) q[52];
-cx q[3],q[52];
-rz(4.291589323265829) q[52];
-cx q[3],q[52];
-cx q[10],q[52];
-rz(4.291589323265829) q[52];
-cx q[10],q[52];
-rx(12.188412650161391) q[52];
-ry(pi/2) q[53];
-rx(pi) q[53];
-cx q[17],q[53];
-rz(4.291589323265829) q[53];
-cx q[17],q[53];
-cx q[21],q[53];
-rz(4.291589323265829) q[53];
-cx q[21],q[53];
-ry(pi/2) q[54];
-rx(pi) q[54];
-cx q[24],q[54];
-rz(4.291589323265829) q[54];
-cx q[24],q[54];
-cx q[28],q[54];
-rz(4.291589323265829) q[54];
-cx q[28],q[54];
-rx(12.188412650161391) q[54];
-ry(pi/2) q[55];
-rx(pi) q[55];
-cx q[9],q[55];
-rz(4.291589323265829) q[55];
-cx q[9],q[55];
-cx q[15],q[55];
-rz(4.291589323265829) q[55];
-cx q[15],q[55];
-rx(12.188412650161391) q[55];
-ry(pi/2) q[56];
-rx(pi) q[56];
-cx q[13],q[56];
-rz(4.291589323265829) q[56];
-cx q[13],q[56];
-cx q[45],q[56];
-rz(4.291589323265829) q[56];
-cx q[45],q[56];
-rx(12.188412650161391) q[45];
-ry(pi/2) q[57];
-rx(pi) q[57];
-cx q[1],q[57];
-rz(4.291589323265829) q[57];
-cx q[1],q[57];
-cx q[3],q[57];
-rz(4.291589323265829) q[57];
-cx q[3],q[57];
-rx(12.188412650161391) q[57];
-ry(pi/2) q[58];
-rx(pi) q[58];
-cx q[24],q[58];
-rz(4.291589323265829) q[58];
-cx q[24],q[58];
-cx q[28],q[58];
-rz(4.291589323265829) q[58];
-cx q[28],q[58];
-rx(12.188412650161391) q[58];
-ry(pi/2) q[59];
-rx(pi) q[59];
-cx q[16],q[59];
-rz(4.291589323265829) q[59];
-cx q[16],q[59];
-cx q[32],q[59];
-rz(4.291589323265829) q[59];
-cx q[32],q[59];
-ry(pi/2) q[60];
-rx(pi) q[60];
-cx q[1],q[60];
-rz(4.291589323265829) q[60];
-cx q[1],q[60];
-rx(12.188412650161391) q[1];
-cx q[7],q[60];
-rz(4.291589323265829) q[60];
-cx q[7],q[60];
-ry(pi/2) q[61];
-rx(pi) q[61];
-cx q[4],q[61];
-rz(4.291589323265829) q[61];
-cx q[4],q[61];
-rx(12.188412650161391) q[4];
-cx q[7],q[61];
-rz(4.291589323265829) q[61];
-cx q[7],q[61];
-rx(12.188412650161391) q[7];
-rx(12.188412650161391) q[61];
-ry(pi/2) q[62];
-rx(pi) q[62];
-cx q[0],q[62];
-rz(4.291589323265829) q[62];
-cx q[0],q[62];
-cx q[17],q[62];
-rz(4.291589323265829) q[62];
-cx q[17],q[62];
-rx(12.188412650161391) q[62];
-ry(pi/2) q[63];
-rx(pi) q[63];
-cx q[12],q[63];
-rz(4.291589323265829) q[63];
-cx q[12],q[63];
-rx(12.188412650161391) q[12];
-cx q[17],q[63];
-rz(4.291589323265829) q[63];
-cx q[17],q[63];
-ry(pi/2) q[64];
-rx(pi) q[64];
-cx q[0],q[64];
-rz(4.291589323265829) q[64];
-cx q[0],q[64];
-cx q[10],q[64];
-rz(4.291589323265829) q[64];
-cx q[10],q[64];
-rx(12.188412650161391) q[10];
-rx(12.188412650161391) q[64];
-ry(pi/2) q[65];
-rx(pi) q[65];
-cx q[5],q[65];
-rz(4.291589323265829) q[65];
-cx q[5],q[65];
-cx q[23],q[65];
-rz(4.291589323265829) q[65];
-cx q[23],q[65];
-rx(12.188412650161391) q[23];
-rx(12.188412650161391) q[65];
-ry(pi/2) q[66];
-rx(pi) q[66];
-cx q[17],q[66];
-rz(4.291589323265829) q[66];
-cx q[17],q[66];
-rx(12.188412650161391) q[17];
-cx q[47],q[66];
-rz(4.291589323265829) q[66];
-cx q[47],q[66];
-rx(12.188412650161391) q[47];
-rx(12.188412650161391) q[66];
-ry(pi/2) q[67];
-rx(pi) q[67];
-cx q[41],q[67];
-rz(4.291589323265829) q[67];
-cx q[41],q[67];
-rx(12.188412650161391) q[41];
-cx q[56],q[67];
-rz(4.291589323265829) q[67];
-cx q[56],q[67];
-rx(12.188412650161391) q[67];
-ry(pi/2) q[68];
-rx(pi) q[68];
-cx q[13],q[68];
-rz(4.291589323265829) q[68];
-cx q[13],q[68];
-rx(12.188412650161391) q[13];
-cx q[32],q[68];
-rz(4.291589323265829) q[68];
-cx q[32],q[68];
-ry(pi/2) q[69];
-rx(pi) q[69];
-cx q[6],q[69];
-rz(4.291589323265829) q[69];
-cx q[6],q[69];
-cx q[59],q[69];
-rz(4.291589323265829) q[69];
-cx q[59],q[69];
-rx(12.188412650161391) q[69];
-ry(pi/2) q[70];
-rx(pi) q[70];
-cx q[3],q[70];
-rz(4.291589323265829) q[70];
-cx q[3],q[70];
-cx q[15],q[70];
-rz(4.291589323265829) q[70];
-cx q[15],q[70];
-ry(pi/2) q[71];
-rx(pi) q[71];
-cx q[3],q[71];
-rz(4.291589323265829) q[71];
-cx q[3],q[71];
-cx q[53],q[71];
-rz(4.291589323265829) q[71];
-cx q[53],q[71];
-rx(12.188412650161391) q[71];
-ry(pi/2) q[72];
-rx(pi) q[72];
-cx q[27],q[72];
-rz(4.291589323265829) q[72];
-cx q[27],q[72];
-cx q[44],q[72];
-rz(4.291589323265829) q[72];
-cx q[44],q[72];
-rx(12.188412650161391) q[44];
-rx(12.188412650161391) q[72];
-ry(pi/2) q[73];
-rx(pi) q[73];
-cx q[16],q[73];
-rz(4.291589323265829) q[73];
-cx q[16],q[73];
-rx(12.188412650161391) q[16];
-cx q[59],q[73];
-rz(4.291589323265829) q[73];
-cx q[59],q[73];
-ry(pi/2) q[74];
-rx(pi) q[74];
-cx q[56],q[74];
-rz(4.291589323265829) q[74];
-cx q[56],q[74];
-cx q[63],q[74];
-rz(4.291589323265829) q[74];
-cx q[63],q[74];
-rx(12.188412650161391) q[63];
-rx(12.188412650161391) q[74];
-ry(pi/2) q[75];
-rx(pi) q[75];
-cx q[0],q[75];
-rz(4.291589323265829) q[75];
-cx q[0],q[75];
-cx q[21],q[75];
-rz(4.291589323265829) q[75];
-cx q[21],q[75];
-rx(12.188412650161391) q[75];
-ry(pi/2) q[76];
-rx(pi) q[76];
-cx q[5],q[76];
-rz(4.291589323265829) q[76];
-cx q[5],q[76];
-cx q[6],q[76];
-rz(4.291589323265829) q[76];
-cx q[6],q[76];
-rx(12.188412650161391) q[76];
-ry(pi/2) q[77];
-rx(pi) q[77];
-cx q[3],q[77];
-rz(4.291589323265829) q[77];
-cx q[3],q[77];
-cx q[30],q[77];
-rz(4.291589323265829) q[77];
-cx q[30],q[77];
-rx(12.188412650161391) q[30];
-ry(pi/2) q[78];
-rx(pi) q[78];
-cx q[42],q[78];
-rz(4.291589323265829) q[78];
-cx q[42],q[78];
-rx(12.188412650161391) q[42];
-cx q[60],q[78];
-rz(4.291589323265829) q[78];
-cx q[60],q[78];
-rx(12.188412650161391) q[78];
-ry(pi/2) q[79];
-rx(pi) q[79];
-cx q[6],q[79];
-rz(4.291589323265829) q[79];
-cx q[6],q[79];
-cx q[50],q[79];
-rz(4.291589323265829) q[79];
-cx q[50],q[79];
-rx(12.188412650161391) q[50];
-rx(12.188412650161391) q[79];
-ry(pi/2) q[80];
-rx(pi) q[80];
-cx q[9],q[80];
-rz(4.291589323265829) q[80];
-cx q[9],q[80];
-rx(12.188412650161391) q[9];
-cx q[15],q[80];
-rz(4.291589323265829) q[80];
-cx q[15],q[80];
-rx(12.188412650161391) q[80];
-ry(pi/2) q[81];
-rx(pi) q[81];
-cx q[21],q[81];
-rz(4.291589323265829) q[81];
-cx q[21],q[81];
-rx(12.188412650161391) q[21];
-cx q[77],q[81];
-rz(4.291589323265829) q[81];
-cx q[77],q[81];
-rx(12.188412650161391) q[77];
-rx(12.188412650161391) q[81];
-ry(pi/2) q[82];
-rx(pi) q[82];
-cx q[0],q[82];
-rz(4.291589323265829) q[82];
-cx q[0],q[82];
-cx q[56],q[82];
-rz(4.291589323265829) q[82];
-cx q[56],q[82];
-rx(12.188412650161391) q[56];
-rx(12.188412650161391) q[82];
-ry(pi/2) q[83];
-rx(pi) q[83];
-cx q[8],q[83];
-rz(4.291589323265829) q[83];
-cx q[8],q[83];
-rx(12.188412650161391) q[8];
-cx q[68],q[83];
-rz(4.291589323265829) q[83];
-cx q[68],q[83];
-rx(12.188412650161391) q[68];
-rx(12.188412650161391) q[83];
-ry(pi/2) q[84];
-rx(pi) q[84];
-cx q[70],q[84];
-rz(4.291589323265829) q[84];
-cx q[70],q[84];
-rx(12.188412650161391) q[70];
-cx q[73],q[84];
-rz(4.291589323265829) q[84];
-cx q[73],q[84];
-rx(12.188412650161391) q[73];
-rx(12.188412650161391) q[84];
-ry(pi/2) q[85];
-rx(pi) q[85];
-cx q[37],q[85];
-rz(4.291589323265829) q[85];
-cx q[37],q[85];
-rx(12.188412650161391) q[37];
-cx q[59],q[85];
-rz(4.291589323265829) q[85];
-cx q[59],q[85];
-rx(12.188412650161391) q[59];
-rx(12.188412650161391) q[85];
-ry(pi/2) q[86];
-rx(pi) q[86];
-cx q[24],q[86];
-rz(4.291589323265829) q[86];
-cx q[24],q[86];
-rx(12.188412650161391) q[24];
-cx q[53],q[86];
-rz(4.291589323265829) q[86];
-cx q[53],q[86];
-rx(12.188412650161391) q[53];
-rx(12.188412650161391) q[86];
-ry(pi/2) q[87];
-rx(pi) q[87];
-cx q[28],q[87];
-rz(4.291589323265829) q[87];
-cx q[28],q[87];
-rx(12.188412650161391) q[28];
-cx q[32],q[87];
-rz(4.291589323265829) q[87];
-cx q[32],q[87];
-rx(12.188412650161391) q[87];
-ry(pi/2) q[88];
-rx(pi) q[88];
-cx q[3],q[88];
-rz(4.291589323265829) q[88];
-cx q[3],q[88];
-rx(12.188412650161391) q[3];
-cx q[60],q[88];
-rz(4.291589323265829) q[88];
-cx q[60],q[88];
-rx(12.188412650161391) q[60];
-rx(12.188412650161391) q[88];
-ry(pi/2) q[89];
-rx(pi) q[89];
-cx q[2],q[89];
-rz(4.291589323265829) q[89];
-cx q[2],q[89];
-rx(12.188412650161391) q[2];
-cx q[5],q[89];
-rz(4.291589323265829) q[89];
-cx q[5],q[89];
-rx(12.188412650161391) q[5];
-ry(pi/2) q[90];
-rx(pi) q[90];
-cx q[15],q[90];
-rz(4.291589323265829) q[90];
-cx q[15],q[90];
-cx q[27],q[90];
-rz(4.291589323265829) q[90];
-cx q[27],q[90];
-rx(12.188412650161391) q[27];
-rx(12.188412650161391) q[90];
-ry(pi/2) q[91];
-rx(pi) q[91];
-cx q[0],q[91];
-rz(4.291589323265829) q[91];
-cx q[0],q[91];
-cx q[6],q[91];
-rz(4.291589323265829) q[91];
-cx q[6],q[91];
-rx(12.188412650161391) q[6];
-rx(12.188412650161391) q[91];
-ry(pi/2) q[92];
-rx(pi) q[92];
-cx q[15],q[92];
-rz(4.291589323265829) q[92];
-cx q[15],q[92];
-rx(12.188412650161391) q[15];
-cx q[89],q[92];
-rz(4.291589323265829) q[92];
-cx q[89],q[92];
-rx(12.188412650161391) q[89];
-rx(12.188412650161391) q[92];
-ry(pi/2) q[93];
-rx(pi) q[93];
-cx q[0],q[93];
-rz(4.291589323265829) q[93];
-cx q[0],q[93];
-rx(12.188412650161391) q[0];
-cx q[0],q[1];
-rz(4.682882777790972) q[1];
-cx q[0],q[1];
-cx q[0],q[2];
-rz(4.682882777790972) q[2];
-cx q[0],q[2];
-cx q[0],q[3];
-cx q[2],q[89];
-rz(4.682882777790972) q[3];
-cx q[0],q[3];
-cx q[0],q[15];
-cx q[1],q[3];
-rz(4.682882777790972) q[3];
-cx q[1],q[3];
-cx q[1],q[4];
-rz(4.682882777790972) q[4];
-cx q[1],q[4];
-cx q[1],q[5];
-cx q[3],q[4];
-rz(4.682882777790972) q[4];
-cx q[3],q[4];
-cx q[4],q[6];
-rz(4.682882777790972) q[5];
-cx q[1],q[5];
-cx q[1],q[9];
-cx q[3],q[5];
-rz(4.682882777790972) q[5];
-cx q[3],q[5];
-cx q[3],q[7];
-rz(4.682882777790972) q[6];
-cx q[4],q[6];
-cx q[5],q[6];
-rz(4.682882777790972) q[6];
-cx q[5],q[6];
-rz(4.682882777790972) q[7];
-cx q[3],q[7];
-cx q[3],q[8];
-cx q[4],q[7];
-rz(4.682882777790972) q[7];
-cx q[4],q[7];
-cx q[4],q[10];
-rz(4.682882777790972) q[8];
-cx q[3],q[8];
-cx q[5],q[8];
-rz(4.682882777790972) q[8];
-cx q[5],q[8];
-cx q[5],q[11];
-cx q[8],q[83];
-rz(4.682882777790972) q[9];
-cx q[1],q[9];
-cx q[1],q[17];
-cx q[3],q[9];
-rz(4.682882777790972) q[9];
-cx q[3],q[9];
-cx q[3],q[12];
-rz(4.682882777790972) q[10];
-cx q[4],q[10];
-cx q[4],q[13];
-cx q[6],q[10];
-rz(4.682882777790972) q[10];
-cx q[6],q[10];
-cx q[10],q[37];
-rz(4.682882777790972) q[11];
-cx q[5],q[11];
-cx q[6],q[11];
-rz(4.682882777790972) q[11];
-cx q[6],q[11];
-rx(2.2627825335845464) q[11];
-rz(4.682882777790972) q[12];
-cx q[3],q[12];
-cx q[3],q[14];
-cx q[5],q[12];
-rz(4.682882777790972) q[12];
-cx q[5],q[12];
-rz(4.682882777790972) q[13];
-cx q[4],q[13];
-cx q[5],q[13];
-rz(4.682882777790972) q[13];
-cx q[5],q[13];
-rz(4.682882777790972) q[14];
-cx q[3],q[14];
-cx q[4],q[14];
-rz(4.682882777790972) q[14];
-cx q[4],q[14];
-rx(2.2627825335845464) q[14];
-rz(4.682882777790972) q[15];
-cx q[0],q[15];
-cx q[0],q[16];
-cx q[3],q[15];
-rz(4.682882777790972) q[15];
-cx q[3],q[15];
-rz(4.682882777790972) q[16];
-cx q[0],q[16];
-cx q[0],q[20];
-cx q[3],q[16];
-rz(4.682882777790972) q[16];
-cx q[3],q[16];
-rz(4.682882777790972) q[17];
-cx q[1],q[17];
-cx q[1],q[28];
-cx q[3],q[17];
-rz(4.682882777790972) q[17];
-cx q[3],q[17];
-cx q[3],q[18];
-rz(4.682882777790972) q[18];
-cx q[3],q[18];
-cx q[3],q[19];
-cx q[4],q[18];
-rz(4.682882777790972) q[18];
-cx q[4],q[18];
-cx q[4],q[21];
-rz(4.682882777790972) q[19];
-cx q[3],q[19];
-cx q[3],q[22];
-cx q[7],q[19];
-rz(4.682882777790972) q[19];
-cx q[7],q[19];
-cx q[19],q[38];
-rz(4.682882777790972) q[20];
-cx q[0],q[20];
-cx q[15],q[20];
-rz(4.682882777790972) q[20];
-cx q[15],q[20];
-rz(4.682882777790972) q[21];
-cx q[4],q[21];
-cx q[4],q[27];
-cx q[15],q[21];
-rz(4.682882777790972) q[21];
-cx q[15],q[21];
-cx q[15],q[36];
-rz(4.682882777790972) q[22];
-cx q[3],q[22];
-cx q[3],q[23];
-cx q[9],q[22];
-rz(4.682882777790972) q[22];
-cx q[9],q[22];
-cx q[9],q[55];
-rx(2.2627825335845464) q[22];
-rz(4.682882777790972) q[23];
-cx q[3],q[23];
-cx q[3],q[24];
-cx q[17],q[23];
-rz(4.682882777790972) q[23];
-cx q[17],q[23];
-rz(4.682882777790972) q[24];
-cx q[3],q[24];
-cx q[3],q[25];
-cx q[5],q[24];
-rz(4.682882777790972) q[24];
-cx q[5],q[24];
-cx q[5],q[33];
-cx q[24],q[54];
-rz(4.682882777790972) q[25];
-cx q[3],q[25];
-cx q[3],q[26];
-cx q[12],q[25];
-rz(4.682882777790972) q[25];
-cx q[12],q[25];
-cx q[12],q[31];
-rx(2.2627825335845464) q[25];
-rz(4.682882777790972) q[26];
-cx q[3],q[26];
-cx q[21],q[26];
-rz(4.682882777790972) q[26];
-cx q[21],q[26];
-rz(4.682882777790972) q[27];
-cx q[4],q[27];
-cx q[4],q[47];
-cx q[6],q[27];
-rz(4.682882777790972) q[27];
-cx q[6],q[27];
-cx q[6],q[69];
-rz(4.682882777790972) q[28];
-cx q[1],q[28];
-cx q[1],q[29];
-cx q[3],q[28];
-rz(4.682882777790972) q[28];
-cx q[3],q[28];
-rz(4.682882777790972) q[29];
-cx q[1],q[29];
-cx q[1],q[45];
-cx q[3],q[29];
-rz(4.682882777790972) q[29];
-cx q[3],q[29];
-cx q[3],q[30];
-rx(2.2627825335845464) q[29];
-rz(4.682882777790972) q[30];
-cx q[3],q[30];
-cx q[3],q[34];
-cx q[18],q[30];
-rz(4.682882777790972) q[30];
-cx q[18],q[30];
-rx(2.2627825335845464) q[18];
-rz(4.682882777790972) q[31];
-cx q[12],q[31];
-cx q[26],q[31];
-rz(4.682882777790972) q[31];
-cx q[26],q[31];
-rx(2.2627825335845464) q[26];
-rx(2.2627825335845464) q[31];
-cx q[32],q[93];
-rz(4.682882777790972) q[33];
-cx q[5],q[33];
-cx q[5],q[46];
-cx q[30],q[33];
-rz(4.682882777790972) q[33];
-cx q[30],q[33];
-rx(2.2627825335845464) q[33];
-rz(4.682882777790972) q[34];
-cx q[3],q[34];
-cx q[3],q[35];
-cx q[12],q[34];
-rz(4.682882777790972) q[34];
-cx q[12],q[34];
-rz(4.682882777790972) q[35];
-cx q[3],q[35];
-cx q[3],q[39];
-rz(4.682882777790972) q[36];
-cx q[15],q[36];
-cx q[20],q[36];
-rz(4.682882777790972) q[36];
-cx q[20],q[36];
-rx(2.2627825335845464) q[36];
-rz(4.682882777790972) q[37];
-cx q[10],q[37];
-cx q[10],q[41];
-cx q[34],q[37];
-rz(4.682882777790972) q[37];
-cx q[34],q[37];
-rx(2.2627825335845464) q[34];
-cx q[37],q[85];
-rz(4.682882777790972) q[38];
-cx q[19],q[38];
-rx(2.2627825335845464) q[19];
-rz(4.682882777790972) q[39];
-cx q[3],q[39];
-cx q[3],q[40];
-cx q[13],q[39];
-rz(4.682882777790972) q[39];
-cx q[13],q[39];
-cx q[13],q[56];
-rx(2.2627825335845464) q[39];
-rz(4.682882777790972) q[40];
-cx q[3],q[40];
-cx q[23],q[40];
-rz(4.682882777790972) q[40];
-cx q[23],q[40];
-rx(2.2627825335845464) q[40];
-rz(4.682882777790972) q[41];
-cx q[10],q[41];
-cx q[27],q[41];
-rz(4.682882777790972) q[41];
-cx q[27],q[41];
-cx q[27],q[72];
-cx q[41],q[67];
-rz(4.682882777790972) q[45];
-cx q[1],q[45];
-cx q[1],q[57];
-cx q[16],q[45];
-rz(4.682882777790972) q[45];
-cx q[16],q[45];
-cx q[16],q[59];
-rz(4.682882777790972) q[46];
-cx q[5],q[46];
-cx q[5],q[65];
-rz(4.682882777790972) q[47];
-cx q[4],q[47];
-cx q[17],q[47];
-rz(4.682882777790972) q[47];
-cx q[17],q[47];
-cx q[17],q[53];
-rz(4.682882777790972) q[53];
-cx q[17],q[53];
-rz(4.682882777790972) q[54];
-cx q[24],q[54];
-cx q[24],q[58];
-rz(4.682882777790972) q[55];
-cx q[9],q[55];
-cx q[9],q[80];
-cx q[15],q[55];
-rz(4.682882777790972) q[55];
-cx q[15],q[55];
-rx(2.2627825335845464) q[55];
-rz(4.682882777790972) q[56];
-cx q[13],q[56];
-cx q[13],q[68];
-cx q[45],q[56];
-rz(4.682882777790972) q[56];
-cx q[45],q[56];
-rx(2.2627825335845464) q[45];
-rz(4.682882777790972) q[57];
-cx q[1],q[57];
-cx q[1],q[60];
-rz(4.682882777790972) q[58];
-cx q[24],q[58];
-cx q[24],q[86];
-rz(4.682882777790972) q[59];
-cx q[16],q[59];
-cx q[16],q[73];
-rz(4.682882777790972) q[60];
-cx q[1],q[60];
-rx(2.2627825335845464) q[1];
-cx q[7],q[60];
-rz(4.682882777790972) q[60];
-cx q[7],q[60];
-rz(4.682882777790972) q[65];
-cx q[5],q[65];
-cx q[5],q[76];
-cx q[23],q[65];
-rz(4.682882777790972) q[65];
-cx q[23],q[65];
-rx(2.2627825335845464) q[23];
-rx(2.2627825335845464) q[65];
-rz(4.682882777790972) q[67];
-cx q[41],q[67];
-rx(2.2627825335845464) q[41];
-cx q[56],q[67];
-rz(4.682882777790972) q[67];
-cx q[56],q[67];
-cx q[56],q[74];
-rx(2.2627825335845464) q[67];
-rz(4.682882777790972) q[68];
-cx q[13],q[68];
-rx(2.2627825335845464) q[13];
-rz(4.682882777790972) q[69];
-cx q[6],q[69];
-rz(4.682882777790972) q[72];
-cx q[27],q[72];
-rz(4.682882777790972) q[73];
-cx q[16],q[73];
-rx(2.2627825335845464) q[16];
-rz(4.682882777790972) q[74];
-cx q[56],q[74];
-rz(4.682882777790972) q[76];
-cx q[5],q[76];
-cx q[6],q[76];
-rz(4.682882777790972) q[76];
-cx q[6],q[76];
-cx q[6],q[79];
-rx(2.2627825335845464) q[76];
-rz(4.682882777790972) q[79];
-cx q[6],q[79];
-rz(4.682882777790972) q[80];
-cx q[9],q[80];
-rx(2.2627825335845464) q[9];
-rz(4.682882777790972) q[83];
-cx q[8],q[83];
-rx(2.2627825335845464) q[8];
-rz(4.682882777790972) q[85];
-cx q[37],q[85];
-rx(2.2627825335845464) q[37];
-rz(4.682882777790972) q[86];
-cx q[24],q[86];
-rx(2.2627825335845464) q[24];
-rz(4.682882777790972) q[89];
-cx q[2],q[89];
-rx(2.2627825335845464) q[2];
-cx q[5],q[89];
-rz(4.682882777790972) q[89];
-cx q[5],q[89];
-rx(2.2627825335845464) q[5];
-rz(4.291589323265829) q[93];
-cx q[32],q[93];
-rx(12.188412650161391) q[32];
-cx q[0],q[32];
-rz(4.682882777790972) q[32];
-cx q[0],q[32];
-cx q[0],q[42];
-cx q[21],q[32];
-rz(4.682882777790972) q[32];
-cx q[21],q[32];
-cx q[21],q[38];
-cx q[32],q[35];
-rz(4.682882777790972) q[35];
-cx q[32],q[35];
-cx q[32],q[59];
-rx(2.2627825335845464) q[35];
-rz(4.682882777790972) q[38];
-cx q[21],q[38];
-cx q[21],q[53];
-cx q[38],q[46];
-rz(4.682882777790972) q[42];
-cx q[0],q[42];
-cx q[0],q[48];
-cx q[3],q[42];
-rz(4.682882777790972) q[42];
-cx q[3],q[42];
-cx q[3],q[43];
-cx q[42],q[78];
-rz(4.682882777790972) q[43];
-cx q[3],q[43];
-cx q[3],q[44];
-cx q[20],q[43];
-rz(4.682882777790972) q[43];
-cx q[20],q[43];
-rx(2.2627825335845464) q[20];
-rx(2.2627825335845464) q[43];
-rz(4.682882777790972) q[44];
-cx q[3],q[44];
-cx q[3],q[49];
-cx q[12],q[44];
-rz(4.682882777790972) q[44];
-cx q[12],q[44];
-cx q[44],q[72];
-rz(4.682882777790972) q[46];
-cx q[38],q[46];
-rx(2.2627825335845464) q[38];
-rx(2.2627825335845464) q[46];
-rz(4.682882777790972) q[48];
-cx q[0],q[48];
-cx q[0],q[51];
-cx q[30],q[48];
-rz(4.682882777790972) q[48];
-cx q[30],q[48];
-rx(2.2627825335845464) q[48];
-rz(4.682882777790972) q[49];
-cx q[3],q[49];
-cx q[3],q[50];
-cx q[4],q[49];
-rz(4.682882777790972) q[49];
-cx q[4],q[49];
-cx q[4],q[61];
-rx(2.2627825335845464) q[49];
-rz(4.682882777790972) q[50];
-cx q[3],q[50];
-cx q[3],q[52];
-cx q[12],q[50];
-rz(4.682882777790972) q[50];
-cx q[12],q[50];
-cx q[12],q[63];
-cx q[50],q[79];
-rz(4.682882777790972) q[51];
-cx q[0],q[51];
-cx q[0],q[62];
-cx q[28],q[51];
-rz(4.682882777790972) q[51];
-cx q[28],q[51];
-cx q[28],q[54];
-rx(2.2627825335845464) q[51];
-rz(4.682882777790972) q[52];
-cx q[3],q[52];
-cx q[3],q[57];
-cx q[10],q[52];
-rz(4.682882777790972) q[52];
-cx q[10],q[52];
-rx(2.2627825335845464) q[52];
-rz(4.682882777790972) q[53];
-cx q[21],q[53];
-rz(4.682882777790972) q[54];
-cx q[28],q[54];
-cx q[28],q[58];
-rx(2.2627825335845464) q[54];
-rz(4.682882777790972) q[57];
-cx q[3],q[57];
-cx q[3],q[70];
-rx(2.2627825335845464) q[57];
-rz(4.682882777790972) q[58];
-cx q[28],q[58];
-cx q[28],q[87];
-rx(2.2627825335845464) q[58];
-rz(4.682882777790972) q[59];
-cx q[32],q[59];
-cx q[32],q[68];
-cx q[59],q[69];
-rz(4.682882777790972) q[61];
-cx q[4],q[61];
-rx(2.2627825335845464) q[4];
-cx q[7],q[61];
-rz(4.682882777790972) q[61];
-cx q[7],q[61];
-rx(2.2627825335845464) q[7];
-rx(2.2627825335845464) q[61];
-rz(4.682882777790972) q[62];
-cx q[0],q[62];
-cx q[0],q[64];
-cx q[17],q[62];
-rz(4.682882777790972) q[62];
-cx q[17],q[62];
-rx(2.2627825335845464) q[62];
-rz(4.682882777790972) q[63];
-cx q[12],q[63];
-rx(2.2627825335845464) q[12];
-cx q[17],q[63];
-rz(4.682882777790972) q[63];
-cx q[17],q[63];
-cx q[17],q[66];
-cx q[63],q[74];
-rz(4.682882777790972) q[64];
-cx q[0],q[64];
-cx q[0],q[75];
-cx q[10],q[64];
-rz(4.682882777790972) q[64];
-cx q[10],q[64];
-rx(2.2627825335845464) q[10];
-rx(2.2627825335845464) q[64];
-rz(4.682882777790972) q[66];
-cx q[17],q[66];
-rx(2.2627825335845464) q[17];
-cx q[47],q[66];
-rz(4.682882777790972) q[66];
-cx q[47],q[66];
-rx(2.2627825335845464) q[47];
-rx(2.2627825335845464) q[66];
-rz(4.682882777790972) q[68];
-cx q[32],q[68];
-cx q[68],q[83];
-rz(4.682882777790972) q[69];
-cx q[59],q[69];
-cx q[59],q[73];
-rx(2.2627825335845464) q[69];
-rz(4.682882777790972) q[70];
-cx q[3],q[70];
-cx q[3],q[71];
-cx q[15],q[70];
-rz(4.682882777790972) q[70];
-cx q[15],q[70];
-cx q[15],q[80];
-cx q[70],q[84];
-rz(4.682882777790972) q[71];
-cx q[3],q[71];
-cx q[3],q[77];
-cx q[53],q[71];
-rz(4.682882777790972) q[71];
-cx q[53],q[71];
-cx q[53],q[86];
-rx(2.2627825335845464) q[71];
-rz(4.682882777790972) q[72];
-cx q[44],q[72];
-rx(2.2627825335845464) q[44];
-rx(2.2627825335845464) q[72];
-rz(4.682882777790972) q[73];
-cx q[59],q[73];
-cx q[59],q[85];
-rz(4.682882777790972) q[74];
-cx q[63],q[74];
-rx(2.2627825335845464) q[63];
-rx(2.2627825335845464) q[74];
-rz(4.682882777790972) q[75];
-cx q[0],q[75];
-cx q[0],q[82];
-cx q[21],q[75];
-rz(4.682882777790972) q[75];
-cx q[21],q[75];
-cx q[21],q[81];
-rx(2.2627825335845464) q[75];
-rz(4.682882777790972) q[77];
-cx q[3],q[77];
-cx q[3],q[88];
-cx q[30],q[77];
-rz(4.682882777790972) q[77];
-cx q[30],q[77];
-rx(2.2627825335845464) q[30];
-rz(4.682882777790972) q[78];
-cx q[42],q[78];
-rx(2.2627825335845464) q[42];
-cx q[60],q[78];
-rz(4.682882777790972) q[78];
-cx q[60],q[78];
-rx(2.2627825335845464) q[78];
-rz(4.682882777790972) q[79];
-cx q[50],q[79];
-rx(2.2627825335845464) q[50];
-rx(2.2627825335845464) q[79];
-rz(4.682882777790972) q[80];
-cx q[15],q[80];
-cx q[15],q[90];
-rx(2.2627825335845464) q[80];
-rz(4.682882777790972) q[81];
-cx q[21],q[81];
-rx(2.2627825335845464) q[21];
-cx q[77],q[81];
-rz(4.682882777790972) q[81];
-cx q[77],q[81];
-rx(2.2627825335845464) q[77];
-rx(2.2627825335845464) q[81];
-rz(4.682882777790972) q[82];
-cx q[0],q[82];
-cx q[0],q[91];
-cx q[56],q[82];
-rz(4.682882777790972) q[82];
-cx q[56],q[82];
-rx(2.2627825335845464) q[56];
-rx(2.2627825335845464) q[82];
-rz(4.682882777790972) q[83];
-cx q[68],q[83];
-rx(2.2627825335845464) q[68];
-rx(2.2627825335845464) q[83];
-rz(4.682882777790972) q[84];
-cx q[70],q[84];
-rx(2.2627825335845464) q[70];
-cx q[73],q[84];
-rz(4.682882777790972) q[84];
-cx q[73],q[84];
-rx(2.2627825335845464) q[73];
-rx(2.2627825335845464) q[84];
-rz(4.682882777790972) q[85];
-cx q[59],q[85];
-rx(2.2627825335845464) q[59];
-rx(2.2627825335845464) q[85];
-rz(4.682882777790972) q[86];
-cx q[53],q[86];
-rx(2.2627825335845464) q[53];
-rx(2.2627825335845464) q[86];
-rz(4.682882777790972) q[87];
-cx q[28],q[87];
-rx(2.2627825335845464) q[28];
-cx q[32],q[87];
-rz(4.682882777790972) q[87];
-cx q[32],q[87];
-rx(2.2627825335845464) q[87];
-rz(4.682882777790972) q[88];
-cx q[3],q[88];
-rx(2.2627825335845464) q[3];
-cx q[60],q[88];
-rz(4.682882777790972) q[88];
-cx q[60],q[88];
-rx(2.2627825335845464) q[60];
-rx(2.2627825335845464) q[88];
-rz(4.682882777790972) q[90];
-cx q[15],q[90];
-cx q[15],q[92];
-cx q[27],q[90];
-rz(4.682882777790972) q[90];
-cx q[27],q[90];
-rx(2.2627825335845464) q[27];
-rx(2.2627825335845464) q[90];
-rz(4.682882777790972) q[91];
-cx q[0],q[91];
-cx q[6],q[91];
-rz(4.682882777790972) q[91];
-cx q[6],q[91];
-rx(2.2627825335845464) q[6];
-rx(2.2627825335845464) q[91];
-rz(4.682882777790972) q[92];
-cx q[15],q[92];
-rx(2.2627825335845464) q[15];
-cx q[89],q[92];
-rz(4.682882777790972) q[92];
-cx q[89],q[92];
-rx(2.2627825335845464) q[89];
-rx(2.2627825335845464) q[92];
-rx(12.188412650161391) q[93];
-cx q[0],q[93];
-rz(4.682882777790972) q[93];
-cx q[0],q[93];
-rx(2.2627825335845464) q[0];
-cx q[0],q[1];
-rz(1.198919304972144) q[1];
-cx q[0],q[1];
-cx q[0],q[2];
-rz(1.198919304972144) q[2];
-cx q[0],q[2];
-cx q[0],q[3];
-cx q[2],q[89];
-rz(1.198919304972144) q[3];
-cx q[0],q[3];
-cx q[0],q[15];
-cx q[1],q[3];
-rz(1.198919304972144) q[3];
-cx q[1],q[3];
-cx q[1],q[4];
-rz(1.198919304972144) q[4];
-cx q[1],q[4];
-cx q[1],q[5];
-cx q[3],q[4];
-rz(1.198919304972144) q[4];
-cx q[3],q[4];
-cx q[4],q[6];
-rz(1.198919304972144) q[5];
-cx q[1],q[5];
-cx q[1],q[9];
-cx q[3],q[5];
-rz(1.198919304972144) q[5];
-cx q[3],q[5];
-cx q[3],q[7];
-rz(1.198919304972144) q[6];
-cx q[4],q[6];
-cx q[5],q[6];
-rz(1.198919304972144) q[6];
-cx q[5],q[6];
-rz(1.198919304972144) q[7];
-cx q[3],q[7];
-cx q[3],q[8];
-cx q[4],q[7];
-rz(1.198919304972144) q[7];
-cx q[4],q[7];
-cx q[4],q[10];
-rz(1.198919304972144) q[8];
-cx q[3],q[8];
-cx q[5],q[8];
-rz(1.198919304972144) q[8];
-cx q[5],q[8];
-cx q[5],q[11];
-cx q[8],q[83];
-rz(1.198919304972144) q[9];
-cx q[1],q[9];
-cx q[1],q[17];
-cx q[3],q[9];
-rz(1.198919304972144) q[9];
-cx q[3],q[9];
-cx q[3],q[12];
-rz(1.198919304972144) q[10];
-cx q[4],q[10];
-cx q[4],q[13];
-cx q[6],q[10];
-rz(1.198919304972144) q[10];
-cx q[6],q[10];
-cx q[10],q[37];
-rz(1.198919304972144) q[11];
-cx q[5],q[11];
-cx q[6],q[11];
-rz(1.198919304972144) q[11];
-cx q[6],q[11];
-rx(10.882962606156951) q[11];
-rz(1.198919304972144) q[12];
-cx q[3],q[12];
-cx q[3],q[14];
-cx q[5],q[12];
-rz(1.198919304972144) q[12];
-cx q[5],q[12];
-rz(1.198919304972144) q[13];
-cx q[4],q[13];
-cx q[5],q[13];
-rz(1.198919304972144) q[13];
-cx q[5],q[13];
-rz(1.198919304972144) q[14];
-cx q[3],q[14];
-cx q[4],q[14];
-rz(1.198919304972144) q[14];
-cx q[4],q[14];
-rx(10.882962606156951) q[14];
-rz(1.198919304972144) q[15];
-cx q[0],q[15];
-cx q[0],q[16];
-cx q[3],q[15];
-rz(1.198919304972144) q[15];
-cx q[3],q[15];
-rz(1.198919304972144) q[16];
-cx q[0],q[16];
-cx q[0],q[20];
-cx q[3],q[16];
-rz(1.198919304972144) q[16];
-cx q[3],q[16];
-rz(1.198919304972144) q[17];
-cx q[1],q[17];
-cx q[1],q[28];
-cx q[3],q[17];
-rz(1.198919304972144) q[17];
-cx q[3],q[17];
-cx q[3],q[18];
-rz(1.198919304972144) q[18];
-cx q[3],q[18];
-cx q[3],q[19];
-cx q[4],q[18];
-rz(1.198919304972144) q[18];
-cx q[4],q[18];
-cx q[4],q[21];
-rz(1.198919304972144) q[19];
-cx q[3],q[19];
-cx q[3],q[22];
-cx q[7],q[19];
-rz(1.198919304972144) q[19];
-cx q[7],q[19];
-cx q[19],q[38];
-rz(1.198919304972144) q[20];
-cx q[0],q[20];
-cx q[15],q[20];
-rz(1.198919304972144) q[20];
-cx q[15],q[20];
-rz(1.198919304972144) q[21];
-cx q[4],q[21];
-cx q[4],q[27];
-cx q[15],q[21];
-rz(1.198919304972144) q[21];
-cx q[15],q[21];
-cx q[15],q[36];
-rz(1.198919304972144) q[22];
-cx q[3],q[22];
-cx q[3],q[23];
-cx q[9],q[22];
-rz(1.198919304972144) q[22];
-cx q[9],q[22];
-cx q[9],q[55];
-rx(10.882962606156951) q[22];
-rz(1.198919304972144) q[23];
-cx q[3],q[23];
-cx q[3],q[24];
-cx q[17],q[23];
-rz(1.198919304972144) q[23];
-cx q[17],q[23];
-rz(1.198919304972144) q[24];
-cx q[3],q[24];
-cx q[3],q[25];
-cx q[5],q[24];
-rz(1.198919304972144) q[24];
-cx q[5],q[24];
-cx q[5],q[33];
-cx q[24],q[54];
-rz(1.198919304972144) q[25];
-cx q[3],q[25];
-cx q[3],q[26];
-cx q[12],q[25];
-rz(1.198919304972144) q[25];
-cx q[12],q[25];
-cx q[12],q[31];
-rx(10.882962606156951) q[25];
-rz(1.198919304972144) q[26];
-cx q[3],q[26];
-cx q[21],q[26];
-rz(1.198919304972144) q[26];
-cx q[21],q[26];
-rz(1.198919304972144) q[27];
-cx q[4],q[27];
-cx q[4],q[47];
-cx q[6],q[27];
-rz(1.198919304972144) q[27];
-cx q[6],q[27];
-cx q[6],q[69];
-rz(1.198919304972144) q[28];
-cx q[1],q[28];
-cx q[1],q[29];
-cx q[3],q[28];
-rz(1.198919304972144) q[28];
-cx q[3],q[28];
-rz(1.198919304972144) q[29];
-cx q[1],q[29];
-cx q[1],q[45];
-cx q[3],q[29];
-rz(1.198919304972144) q[29];
-cx q[3],q[29];
-cx q[3],q[30];
-rx(10.882962606156951) q[29];
-rz(1.198919304972144) q[30];
-cx q[3],q[30];
-cx q[3],q[34];
-cx q[18],q[30];
-rz(1.198919304972144) q[30];
-cx q[18],q[30];
-rx(10.882962606156951) q[18];
-rz(1.198919304972144) q[31];
-cx q[12],q[31];
-cx q[26],q[31];
-rz(1.198919304972144) q[31];
-cx q[26],q[31];
-rx(10.882962606156951) q[26];
-rx(10.882962606156951) q[31];
-cx q[32],q[93];
-rz(1.198919304972144) q[33];
-cx q[5],q[33];
-cx q[5],q[46];
-cx q[30],q[33];
-rz(1.198919304972144) q[33];
-cx q[30],q[33];
-rx(10.882962606156951) q[33];
-rz(1.198919304972144) q[34];
-cx q[3],q[34];
-cx q[3],q[35];
-cx q[12],q[34];
-rz(1.198919304972144) q[34];
-cx q[12],q[34];
-rz(1.198919304972144) q[35];
-cx q[3],q[35];
-cx q[3],q[39];
-rz(1.198919304972144) q[36];
-cx q[15],q[36];
-cx q[20],q[36];
-rz(1.198919304972144) q[36];
-cx q[20],q[36];
-rx(10.882962606156951) q[36];
-rz(1.198919304972144) q[37];
-cx q[10],q[37];
-cx q[10],q[41];
-cx q[34],q[37];
-rz(1.198919304972144) q[37];
-cx q[34],q[37];
-rx(10.882962606156951) q[34];
-cx q[37],q[85];
-rz(1.198919304972144) q[38];
-cx q[19],q[38];
-rx(10.882962606156951) q[19];
-rz(1.198919304972144) q[39];
-cx q[3],q[39];
-cx q[3],q[40];
-cx q[13],q[39];
-rz(1.198919304972144) q[39];
-cx q[13],q[39];
-cx q[13],q[56];
-rx(10.882962606156951) q[39];
-rz(1.198919304972144) q[40];
-cx q[3],q[40];
-cx q[23],q[40];
-rz(1.198919304972144) q[40];
-cx q[23],q[40];
-rx(10.882962606156951) q[40];
-rz(1.198919304972144) q[41];
-cx q[10],q[41];
-cx q[27],q[41];
-rz(1.198919304972144) q[41];
-cx q[27],q[41];
-cx q[27],q[72];
-cx q[41],q[67];
-rz(1.198919304972144) q[45];
-cx q[1],q[45];
-cx q[1],q[57];
-cx q[16],q[45];
-rz(1.198919304972144) q[45];
-cx q[16],q[45];
-cx q[16],q[59];
-rz(1.198919304972144) q[46];
-cx q[5],q[46];
-cx q[5],q[65];
-rz(1.198919304972144) q[47];
-cx q[4],q[47];
-cx q[17],q[47];
-rz(1.198919304972144) q[47];
-cx q[17],q[47];
-cx q[17],q[53];
-rz(1.198919304972144) q[53];
-cx q[17],q[53];
-rz(1.198919304972144) q[54];
-cx q[24],q[54];
-cx q[24],q[58];
-rz(1.198919304972144) q[55];
-cx q[9],q[55];
-cx q[9],q[80];
-cx q[15],q[55];
-rz(1.198919304972144) q[55];
-cx q[15],q[55];
-rx(10.882962606156951) q[55];
-rz(1.198919304972144) q[56];
-cx q[13],q[56];
-cx q[13],q[68];
-cx q[45],q[56];
-rz(1.198919304972144) q[56];
-cx q[45],q[56];
-rx(10.882962606156951) q[45];
-rz(1.198919304972144) q[57];
-cx q[1],q[57];
-cx q[1],q[60];
-rz(1.198919304972144) q[58];
-cx q[24],q[58];
-cx q[24],q[86];
-rz(1.198919304972144) q[59];
-cx q[16],q[59];
-cx q[16],q[73];
-rz(1.198919304972144) q[60];
-cx q[1],q[60];
-rx(10.882962606156951) q[1];
-cx q[7],q[60];
-rz(1.198919304972144) q[60];
-cx q[7],q[60];
-rz(1.198919304972144) q[65];
-cx q[5],q[65];
-cx q[5],q[76];
-cx q[23],q[65];
-rz(1.198919304972144) q[65];
-cx q[23],q[65];
-rx(10.882962606156951) q[23];
-rx(10.882962606156951) q[65];
-rz(1.198919304972144) q[67];
-cx q[41],q[67];
-rx(10.882962606156951) q[41];
-cx q[56],q[67];
-rz(1.198919304972144) q[67];
-cx q[56],q[67];
-cx q[56],q[74];
-rx(10.882962606156951) q[67];
-rz(1.198919304972144) q[68];
-cx q[13],q[68];
-rx(10.882962606156951) q[13];
-rz(1.198919304972144) q[69];
-cx q[6],q[69];
-rz(1.198919304972144) q[72];
-cx q[27],q[72];
-rz(1.198919304972144) q[73];
-cx q[16],q[73];
-rx(10.882962606156951) q[16];
-rz(1.198919304972144) q[74];
-cx q[56],q[74];
-rz(1.198919304972144) q[76];
-cx q[5],q[76];
-cx q[6],q[76];
-rz(1.198919304972144) q[76];
-cx q[6],q[76];
-cx q[6],q[79];
-rx(10.882962606156951) q[76];
-rz(1.198919304972144) q[79];
-cx q[6],q[79];
-rz(1.198919304972144) q[80];
-cx q[9],q[80];
-rx(10.882962606156951) q[9];
-rz(1.198919304972144) q[83];
-cx q[8],q[83];
-rx(10.882962606156951) q[8];
-rz(1.198919304972144) q[85];
-cx q[37],q[85];
-rx(10.882962606156951) q[37];
-rz(1.198919304972144) q[86];
-cx q[24],q[86];
-rx(10.882962606156951) q[24];
-rz(1.198919304972144) q[89];
-cx q[2],q[89];
-rx(10.882962606156951) q[2];
-cx q[5],q[89];
-rz(1.198919304972144) q[89];
-cx q[5],q[89];
-rx(10.882962606156951) q[5];
-rz(4.682882777790972) q[93];
-cx q[32],q[93];
-rx(2.2627825335845464) q[32];
-cx q[0],q[32];
-rz(1.198919304972144) q[32];
-cx q[0],q[32];
-cx q[0],q[42];
-cx q[21],q[32];
-rz(1.198919304972144) q[32];
-cx q[21],q[32];
-cx q[21],q[38];
-cx q[32],q[35];
-rz(1.198919304972144) q[35];
-cx q[32],q[35];
-cx q[32],q[59];
-rx(10.882962606156951) q[35];
-rz(1.198919304972144) q[38];
-cx q[21],q[38];
-cx q[21],q[53];
-cx q[38],q[46];
-rz(1.198919304972144) q[42];
-cx q[0],q[42];
-cx q[0],q[48];
-cx q[3],q[42];
-rz(1.198919304972144) q[42];
-cx q[3],q[42];
-cx q[3],q[43];
-cx q[42],q[78];
-rz(1.198919304972144) q[43];
-cx q[3],q[43];
-cx q[3],q[44];
-cx q[20],q[43];
-rz(1.198919304972144) q[43];
-cx q[20],q[43];
-rx(10.882962606156951) q[20];
-rx(10.882962606156951) q[43];
-rz(1.198919304972144) q[44];
-cx q[3],q[44];
-cx q[3],q[49];
-cx q[12],q[44];
-rz(1.198919304972144) q[44];
-cx q[12],q[44];
-cx q[44],q[72];
-rz(1.198919304972144) q[46];
-cx q[38],q[46];
-rx(10.882962606156951) q[38];
-rx(10.882962606156951) q[46];
-rz(1.198919304972144) q[48];
-cx q[0],q[48];
-cx q[0],q[51];
-cx q[30],q[48];
-rz(1.198919304972144) q[48];
-cx q[30],q[48];
-rx(10.882962606156951) q[48];
-rz(1.198919304972144) q[49];
-cx q[3],q[49];
-cx q[3],q[50];
-cx q[4],q[49];
-rz(1.198919304972144) q[49];
-cx q[4],q[49];
-cx q[4],q[61];
-rx(10.882962606156951) q[49];
-rz(1.198919304972144) q[50];
-cx q[3],q[50];
-cx q[3],q[52];
-cx q[12],q[50];
-rz(1.198919304972144) q[50];
-cx q[12],q[50];
-cx q[12],q[63];
-cx q[50],q[79];
-rz(1.198919304972144) q[51];
-cx q[0],q[51];
-cx q[0],q[62];
-cx q[28],q[51];
-rz(1.198919304972144) q[51];
-cx q[28],q[51];
-cx q[28],q[54];
-rx(10.882962606156951) q[51];
-rz(1.198919304972144) q[52];
-cx q[3],q[52];
-cx q[3],q[57];
-cx q[10],q[52];
-rz(1.198919304972144) q[52];
-cx q[10],q[52];
-rx(10.882962606156951) q[52];
-rz(1.198919304972144) q[53];
-cx q[21],q[53];
-rz(1.198919304972144) q[54];
-cx q[28],q[54];
-cx q[28],q[58];
-rx(10.882962606156951) q[54];
-rz(1.198919304972144) q[57];
-cx q[3],q[57];
-cx q[3],q[70];
-rx(10.882962606156951) q[57];
-rz(1.198919304972144) q[58];
-cx q[28],q[58];
-cx q[28],q[87];
-rx(10.882962606156951) q[58];
-rz(1.198919304972144) q[59];
-cx q[32],q[59];
-cx q[32],q[68];
-cx q[59],q[69];
-rz(1.198919304972144) q[61];
-cx q[4],q[61];
-rx(10.882962606156951) q[4];
-cx q[7],q[61];
-rz(1.198919304972144) q[61];
-cx q[7],q[61];
-rx(10.882962606156951) q[7];
-rx(10.882962606156951) q[61];
-rz(1.198919304972144) q[62];
-cx q[0],q[62];
-cx q[0],q[64];
-cx q[17],q[62];
-rz(1.198919304972144) q[62];
-cx q[17],q[62];
-rx(10.882962606156951) q[62];
-rz(1.198919304972144) q[63];
-cx q[12],q[63];
-rx(10.882962606156951) q[12];
-cx q[17],q[63];
-rz(1.198919304972144) q[63];
-cx q[17],q[63];
-cx q[17],q[66];
-cx q[63],q[74];
-rz(1.198919304972144) q[64];
-cx q[0],q[64];
-cx q[0],q[75];
-cx q[10],q[64];
-rz(1.198919304972144) q[64];
-cx q[10],q[64];
-rx(10.882962606156951) q[10];
-rx(10.882962606156951) q[64];
-rz(1.198919304972144) q[66];
-cx q[17],q[66];
-rx(10.882962606156951) q[17];
-cx q[47],q[66];
-rz(1.198919304972144) q[66];
-cx q[47],q[66];
-rx(10.882962606156951) q[47];
-rx(10.882962606156951) q[66];
-rz(1.198919304972144) q[68];
-cx q[32],q[68];
-cx q[68],q[83];
-rz(1.198919304972144) q[69];
-cx q[59],q[69];
-cx q[59],q[73];
-rx(10.882962606156951) q[69];
-rz(1.198919304972144) q[70];
-cx q[3],q[70];
-cx q[3],q[71];
-cx q[15],q[70];
-rz(1.198919304972144) q[70];
-cx q[15],q[70];
-cx q[15],q[80];
-cx q[70],q[84];
-rz(1.198919304972144) q[71];
-cx q[3],q[71];
-cx q[3],q[77];
-cx q[53],q[71];
-rz(1.198919304972144) q[71];
-cx q[53],q[71];
-cx q[53],q[86];
-rx(10.882962606156951) q[71];
-rz(1.198919304972144) q[72];
-cx q[44],q[72];
-rx(10.882962606156951) q[44];
-rx(10.882962606156951) q[72];
-rz(1.198919304972144) q[73];
-cx q[59],q[73];
-cx q[59],q[85];
-rz(1.198919304972144) q[74];
-cx q[63],q[74];
-rx(10.882962606156951) q[63];
-rx(10.882962606156951) q[74];
-rz(1.198919304972144) q[75];
-cx q[0],q[75];
-cx q[0],q[82];
-cx q[21],q[75];
-rz(1.198919304972144) q[75];
-cx q[21],q[75];
-cx q[21],q[81];
-rx(10.882962606156951) q[75];
-rz(1.198919304972144) q[77];
-cx q[3],q[77];
-cx q[3],q[88];
-cx q[30],q[77];
-rz(1.198919304972144) q[77];
-cx q[30],q[77];
-rx(10.882962606156951) q[30];
-rz(1.198919304972144) q[78];
-cx q[42],q[78];
-rx(10.882962606156951) q[42];
-cx q[60],q[78];
-rz(1.198919304972144) q[78];
-cx q[60],q[78];
-rx(10.882962606156951) q[78];
-rz(1.198919304972144) q[79];
-cx q[50],q[79];
-rx(10.882962606156951) q[50];
-rx(10.882962606156951) q[79];
-rz(1.198919304972144) q[80];
-cx q[15],q[80];
-cx q[15],q[90];
-rx(10.882962606156951) q[80];
-rz(1.198919304972144) q[81];
-cx q[21],q[81];
-rx(10.882962606156951) q[21];
-cx q[77],q[81];
-rz(1.198919304972144) q[81];
-cx q[77],q[81];
-rx(10.882962606156951) q[77];
-rx(10.882962606156951) q[81];
-rz(1.198919304972144) q[82];
-cx q[0],q[82];
-cx q[0],q[91];
-cx q[56],q[82];
-rz(1.198919304972144) q[82];
-cx q[56],q[82];
-rx(10.882962606156951) q[56];
-rx(10.882962606156951) q[82];
-rz(1.198919304972144) q[83];
-cx q[68],q[83];
-rx(10.882962606156951) q[68];
-rx(10.882962606156951) q[83];
-rz(1.198919304972144) q[84];
-cx q[70],q[84];
-rx(10.882962606156951) q[70];
-cx q[73],q[84];
-rz(1.198919304972144) q[84];
-cx q[73],q[84];
-rx(10.882962606156951) q[73];
-rx(10.882962606156951) q[84];
-rz(1.198919304972144) q[85];
-cx q[59],q[85];
-rx(10.882962606156951) q[59];
-rx(10.882962606156951) q[85];
-rz(1.198919304972144) q[86];
-cx q[53],q[86];
-rx(10.882962606156951) q[53];
-rx(10.882962606156951) q[86];
-rz(1.198919304972144) q[87];
-cx q[28],q[87];
-rx(10.882962606156951) q[28];
-cx q[32],q[87];
-rz(1.198919304972144) q[87];
-cx q[32],q[87];
-rx(10.882962606156951) q[87];
-rz(1.198919304972144) q[88];
-cx q[3],q[88];
-rx(10.882962606156951) q[3];
-cx q[60],q[88];
-rz(1.198919304972144) q[88];
-cx q[60],q[88];
-rx(10.882962606156951) q[60];
-rx(10.882962606156951) q[88];
-rz(1.198919304972144) q[90];
-cx q[15],q[90];
-cx q[15],q[92];
-cx q[27],q[90];
-rz(1.198919304972144) q[90];
-cx q[27],q[90];
-rx(10.882962606156951) q[27];
-rx(10.882962606156951) q[90];
-rz(1.198919304972144) q[91];
-cx q[0],q[91];
-cx q[6],q[91];
-rz(1.198919304972144) q[91];
-cx q[6],q[91];
-rx(10.882962606156951) q[6];
-rx(10.882962606156951) q[91];
-rz(1.198919304972144) q[92];
-cx q[15],q[92];
-rx(10.882962606156951) q[15];
-cx q[89],q[92];
-rz(1.198919304972144) q[92];
-cx q[89],q[92];
-rx(10.882962606156951) q[89];
-rx(10.882962606156951) q[92];
-rx(2.2627825335845464) q[93];
-cx q[0],q[93];
-rz(1.198919304972144) q[93];
-cx q[0],q[93];
-rx(10.882962606156951) q[0];
-cx q[32],q[93];
-rz(1.198919304972144) q[93];
-cx q[32],q[93];
-rx(10.882962606156951) q[32];
-rx(10.882962606156951) q[93];
\ No newline at end of file
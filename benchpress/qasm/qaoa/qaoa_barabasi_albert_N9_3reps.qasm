@@ -1,174 +0,0 @@
-OPENQASM 2.0;
-include "qelib1.inc";
-qreg q[9];
-ry(pi/2) q[0];
-rx(pi) q[0];
-ry(pi/2) q[1];
-rx(pi) q[1];
-cx q[0],q[1];
-rz(5.134607820495565) q[1];
-cx q[0],q[1];
-ry(pi/2) q[2];
-rx(pi) q[2];
-cx q[0],q[2];
-rz(5.134607820495565) q[2];
-cx q[0],q[2];
-rx(2.9546755862529053) q[2];
-ry(pi/2) q[3];
-rx(pi) q[3];
-cx q[0],q[3];
-rz(5.134607820495565) q[3];
-cx q[0],q[3];
-rx(2.9546755862529053) q[0];
-cx q[1],q[3];
-rz(5.134607820495565) q[3];
-cx q[1],q[3];
-ry(pi/2) q[4];
-rx(pi) q[4];
-cx q[1],q[4];
-rz(5.134607820495565) q[4];
-cx q[1],q[4];
-cx q[3],q[4];
-rz(5.134607820495565) q[4];
-cx q[3],q[4];
-ry(pi/2) q[5];
-rx(pi) q[5];
-cx q[1],q[5];
-rz(5.134607820495565) q[5];
-cx q[1],q[5];
-rx(2.9546755862529053) q[1];
-cx q[0],q[1];
-rz(0.1213504814319813) q[1];
-cx q[0],q[1];
-cx q[0],q[2];
-rz(0.1213504814319813) q[2];
-cx q[0],q[2];
-rx(5.682510094842092) q[2];
-cx q[3],q[5];
-rz(5.134607820495565) q[5];
-cx q[3],q[5];
-ry(pi/2) q[6];
-rx(pi) q[6];
-cx q[4],q[6];
-rz(5.134607820495565) q[6];
-cx q[4],q[6];
-cx q[5],q[6];
-rz(5.134607820495565) q[6];
-cx q[5],q[6];
-rx(2.9546755862529053) q[6];
-ry(pi/2) q[7];
-rx(pi) q[7];
-cx q[3],q[7];
-rz(5.134607820495565) q[7];
-cx q[3],q[7];
-cx q[4],q[7];
-rz(5.134607820495565) q[7];
-cx q[4],q[7];
-rx(2.9546755862529053) q[4];
-rx(2.9546755862529053) q[7];
-ry(pi/2) q[8];
-rx(pi) q[8];
-cx q[3],q[8];
-rz(5.134607820495565) q[8];
-cx q[3],q[8];
-rx(2.9546755862529053) q[3];
-cx q[0],q[3];
-rz(0.1213504814319813) q[3];
-cx q[0],q[3];
-rx(5.682510094842092) q[0];
-cx q[1],q[3];
-rz(0.1213504814319813) q[3];
-cx q[1],q[3];
-cx q[1],q[4];
-rz(0.1213504814319813) q[4];
-cx q[1],q[4];
-cx q[3],q[4];
-rz(0.1213504814319813) q[4];
-cx q[3],q[4];
-cx q[4],q[6];
-cx q[5],q[8];
-rz(0.1213504814319813) q[6];
-cx q[4],q[6];
-rz(5.134607820495565) q[8];
-cx q[5],q[8];
-rx(2.9546755862529053) q[5];
-cx q[1],q[5];
-rz(0.1213504814319813) q[5];
-cx q[1],q[5];
-rx(5.682510094842092) q[1];
-cx q[0],q[1];
-rz(5.195417415595707) q[1];
-cx q[0],q[1];
-cx q[0],q[2];
-rz(5.195417415595707) q[2];
-cx q[0],q[2];
-rx(5.392105685412149) q[2];
-cx q[3],q[5];
-rz(0.1213504814319813) q[5];
-cx q[3],q[5];
-cx q[3],q[7];
-cx q[5],q[6];
-rz(0.1213504814319813) q[6];
-cx q[5],q[6];
-rx(5.682510094842092) q[6];
-rz(0.1213504814319813) q[7];
-cx q[3],q[7];
-cx q[4],q[7];
-rz(0.1213504814319813) q[7];
-cx q[4],q[7];
-rx(5.682510094842092) q[4];
-rx(5.682510094842092) q[7];
-rx(2.9546755862529053) q[8];
-cx q[3],q[8];
-rz(0.1213504814319813) q[8];
-cx q[3],q[8];
-rx(5.682510094842092) q[3];
-cx q[0],q[3];
-rz(5.195417415595707) q[3];
-cx q[0],q[3];
-rx(5.392105685412149) q[0];
-cx q[1],q[3];
-rz(5.195417415595707) q[3];
-cx q[1],q[3];
-cx q[1],q[4];
-rz(5.195417415595707) q[4];
-cx q[1],q[4];
-cx q[3],q[4];
-rz(5.195417415595707) q[4];
-cx q[3],q[4];
-cx q[4],q[6];
-cx q[5],q[8];
-rz(5.195417415595707) q[6];
-cx q[4],q[6];
-rz(0.1213504814319813) q[8];
-cx q[5],q[8];
-rx(5.682510094842092) q[5];
-cx q[1],q[5];
-rz(5.195417415595707) q[5];
-cx q[1],q[5];
-rx(5.392105685412149) q[1];
-cx q[3],q[5];
-rz(5.195417415595707) q[5];
-cx q[3],q[5];
-cx q[3],q[7];
-cx q[5],q[6];
-rz(5.195417415595707) q[6];
-cx q[5],q[6];
-rx(5.392105685412149) q[6];
-rz(5.195417415595707) q[7];
-cx q[3],q[7];
-cx q[4],q[7];
-rz(5.195417415595707) q[7];
-cx q[4],q[7];
-rx(5.392105685412149) q[4];
-rx(5.392105685412149) q[7];
-rx(5.682510094842092) q[8];
-cx q[3],q[8];
-rz(5.195417415595707) q[8];
-cx q[3],q[8];
-rx(5.392105685412149) q[3];
-cx q[5],q[8];
-rz(5.195417415595707) q[8];
-cx q[5],q[8];
-rx(5.392105685412149) q[5];
-rx(5.392105685412149) q[8];
\ No newline at end of file
@@ -1,5669 +0,0 @@
-OPENQASM 2.0;
-include "qelib1.inc";
-qreg q[32];
-creg meas[32];
-u3(2.1247660975131795,0.13915885806807538,-2.1436116595609764) q[0];
-u3(2.0011681089957505,2.7021946527461225,1.5524347872634268) q[1];
-u3(1.6303334502575468,1.6495806508436157,1.822338780904773) q[2];
-u3(0.4153292227830587,1.1672722636243709,-2.344600326498142) q[3];
-u3(1.6933238670644672,2.4800061967022318,1.1992972744555805) q[4];
-cx q[2],q[4];
-u3(1.1153751687197473,-pi/2,-pi/2) q[2];
-u3(0.883575101809152,-0.5307750047274276,-0.8242152327688785) q[4];
-cx q[2],q[4];
-u3(0.6500021773351283,-pi,-pi/2) q[2];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[4];
-cx q[2],q[4];
-u3(1.279153392181534,-1.6305749182994083,2.222880229633393) q[2];
-u3(2.3665593286736226,1.122237347566708,2.8064428262152177) q[2];
-u3(2.5796175553974994,0.5819658947431057,2.3172420042646333) q[4];
-u3(2.091000120789811,-1.5276896581575454,-0.11879243911006832) q[4];
-u3(1.7283950444389578,2.8818755638785882,1.5146225204075376) q[5];
-u3(1.4046998064329868,2.9703578168906697,-0.9333690033388393) q[6];
-u3(0.3863547066650217,1.685320757430409,-0.7232697741520293) q[7];
-u3(2.1444851502076308,-2.9939962802080093,-3.0689687422046887) q[8];
-u3(1.940638931159027,0.23099098301498922,-1.8763218224826321) q[9];
-u3(1.613119241700895,2.5298177738411427,1.4374009529904344) q[10];
-u3(2.004893594796604,-2.7639037826875708,-2.381851913105148) q[11];
-u3(2.0679655146360982,-1.6706199992518336,-0.027924315848731673) q[12];
-u3(1.76559498798698,1.9798793195849758,-2.3955003730592077) q[13];
-u3(1.817061671992331,1.8605691396892103,-0.24975290040522768) q[14];
-u3(0.7587208796257042,-0.9417028049820426,1.1339965973912634) q[15];
-cx q[0],q[15];
-u3(0.8487718079030521,-pi/2,-pi/2) q[0];
-u3(0.8849531349109385,-0.5326948168926275,-0.8211864656191601) q[15];
-cx q[0],q[15];
-u3(0.7596050754803605,0,pi/2) q[0];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[15];
-cx q[0],q[15];
-u3(0.954363695632911,1.1448134741590295,2.211782202987945) q[0];
-u3(1.5652105247955108,1.060282022885767,-2.1251926541718955) q[0];
-u3(1.7528950148857125,-2.758089440458625,2.151133110363327) q[15];
-u3(1.7472770688103672,0.10284855076292665,0.2934312229680076) q[15];
-u3(0.9827303163550665,-0.32088063329079386,1.9896007583627968) q[16];
-u3(2.2966127621646955,-1.5591351480195885,-2.729121545031914) q[17];
-u3(1.7920182964018865,0.06196577499376721,-0.07191378552074035) q[18];
-cx q[9],q[18];
-u3(0.8601329172999226,-0.49582437598724516,-0.8785247450645777) q[18];
-u3(0.9228854327227451,-pi/2,-pi/2) q[9];
-cx q[9],q[18];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[18];
-u3(0.1349647062215042,-pi,-pi/2) q[9];
-cx q[9],q[18];
-u3(0.781106622949999,-2.7235655328462753,1.1343956708754774) q[18];
-u3(0.853422039339564,-3.0973887811561345,-2.7709936768813797) q[18];
-u3(1.5082484885320206,2.7586838337777433,-0.2468984002148531) q[9];
-u3(1.421141634251735,-1.6438924707811338,1.462001387285472) q[9];
-u3(1.7072267651961301,-0.3135164666138759,2.1324096618131296) q[19];
-cx q[3],q[19];
-u3(0.78630622290151,-0.34243318826885893,-1.1034811784542047) q[19];
-u3(0.6345562833664202,-pi/2,-pi/2) q[3];
-cx q[3],q[19];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[19];
-u3(0.3979826790540893,0,pi/2) q[3];
-cx q[3],q[19];
-u3(0.23806669006384834,0.5111789333409025,-0.1165320591428376) q[19];
-u3(1.7300547134734467,-2.703590044804826,-2.680632225520662) q[19];
-u3(0.6108124875464671,-1.1458748059689796,1.1322621317361854) q[3];
-u3(2.300489908528284,3.006270074244819,2.576354609990239) q[3];
-u3(2.3391715294986897,0.0913276710186679,2.8267748693822083) q[20];
-cx q[20],q[5];
-u3(0.936993077902743,-pi/2,-pi/2) q[20];
-u3(0.7518432270122184,-0.21910956314252816,-1.274880057439356) q[5];
-cx q[20],q[5];
-u3(0.39825773410472487,0,pi/2) q[20];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[5];
-cx q[20],q[5];
-u3(2.191513844658657,2.283604402039292,-1.565261873136322) q[20];
-u3(1.727513866902166,2.9183822763413385,3.1072212069771687) q[20];
-cx q[19],q[20];
-u3(0.8883020848405692,-pi/2,-pi/2) q[19];
-u3(0.8139054609486137,-0.41022906722724617,-1.006210251013755) q[20];
-cx q[19],q[20];
-u3(0.14214050517459298,-pi,-pi/2) q[19];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[20];
-cx q[19],q[20];
-u3(1.8702441263757952,-0.9618537277503756,-0.8767455154119519) q[19];
-u3(1.4489439856826973,1.2927233777999918,-0.1792075986609607) q[19];
-u3(2.3096486222397483,-2.398126729584253,2.5227682427410842) q[20];
-u3(2.3974922524697617,2.921316346681312,-0.6100487844819664) q[20];
-u3(1.2853734951127418,-0.03357029877733453,-0.12646631375880446) q[5];
-u3(2.167786457842956,-0.7538316124297815,0.6071477490928645) q[5];
-u3(1.8818634097758602,-0.8509681214153715,-0.6882001490778453) q[21];
-cx q[16],q[21];
-u3(0.5234127648347859,-pi/2,-pi/2) q[16];
-u3(0.7300593683857742,0.027755141686508722,-1.6080371522884107) q[21];
-cx q[16],q[21];
-u3(0.06946786269204024,0,pi/2) q[16];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[21];
-cx q[16],q[21];
-u3(1.7139845739588422,2.8310087128661667,-2.859338021648952) q[16];
-u3(2.474608413679199,1.6892095451913365,1.6844609477680734) q[16];
-u3(0.9881949519013382,-0.369294159592946,-1.9110330615196398) q[21];
-u3(1.2663489965832906,2.8347911168795683,-0.17583500385172446) q[21];
-u3(2.204091078748573,-2.2324806479418484,3.101908461073319) q[22];
-cx q[11],q[22];
-u3(0.8634831277021264,-pi/2,-pi/2) q[11];
-u3(0.872739439761849,-0.5151795013269482,-0.8486366862741832) q[22];
-cx q[11],q[22];
-u3(0.024380509882373044,0,pi/2) q[11];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[22];
-cx q[11],q[22];
-u3(1.5424578235028108,2.95319922203535,0.10867214560176741) q[11];
-u3(0.9943170599358462,-2.3331785065686965,1.5770128388995603) q[11];
-u3(2.690698434556137,-0.17997116495105647,-2.246288312349643) q[22];
-u3(0.2533569869147598,1.7020252033450198,2.753623625584952) q[22];
-u3(1.6584268594662002,1.1757004510800773,2.7920033110397835) q[23];
-cx q[23],q[14];
-u3(0.9527624678763543,-0.6129322358410096,-0.6891377210191365) q[14];
-u3(1.135203941754062,-pi/2,-pi/2) q[23];
-cx q[23],q[14];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[14];
-u3(0.3386769294123757,-pi,-pi/2) q[23];
-cx q[23],q[14];
-u3(0.45621799679516667,1.18269113913051,-1.0847203546129203) q[14];
-u3(1.5921300049861806,1.2898615385016896,0.3816134175604504) q[14];
-cx q[16],q[14];
-u3(0.9550337746512046,-0.61521718745538,-0.6851879941084107) q[14];
-u3(0.9275267049642871,-pi/2,-pi/2) q[16];
-cx q[16],q[14];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[14];
-u3(0.4030076351992405,0,pi/2) q[16];
-cx q[16],q[14];
-u3(1.4059857756950194,-1.2771905169464173,-2.096257571960771) q[14];
-u3(1.0888490459470435,0.06345062196445195,0.2911203634591333) q[14];
-u3(2.246039897526255,-1.6248798556682178,1.90162519981848) q[16];
-u3(1.4495382743350953,3.0445625643332512,0.9298091276443232) q[16];
-u3(0.6473565336204402,2.8616251346318204,2.4487844607984393) q[23];
-u3(1.4909111026710058,0.13680740716735373,1.4215163497973649) q[23];
-cx q[23],q[21];
-u3(0.8767183555819038,-0.5210119907626196,-0.839540601614857) q[21];
-u3(1.0228011493462539,-pi/2,-pi/2) q[23];
-cx q[23],q[21];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[21];
-u3(0.6562732476534594,0,pi/2) q[23];
-cx q[23],q[21];
-u3(2.274128058632258,1.9710183465753426,-0.8083885536854671) q[21];
-u3(1.2663489965832906,2.8347911168795683,-0.17583500385172446) q[21];
-u3(2.373038073591245,-3.1307063648431015,-0.9347767310978599) q[23];
-u3(1.9787069809507791,1.1566071905322062,0.9197017875579876) q[23];
-u3(1.3203068752093083,-3.0980255980987996,-2.8029008183001345) q[24];
-cx q[6],q[24];
-u3(0.8249752066789483,-0.4332752347886215,-0.9724516471415825) q[24];
-u3(0.7283050241248039,-pi/2,-pi/2) q[6];
-cx q[6],q[24];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[24];
-u3(0.22709512541093727,0,pi/2) q[6];
-cx q[6],q[24];
-u3(1.4763213945307125,-0.7336620516131753,0.8322831780150501) q[24];
-u3(1.7556040824278771,1.325321672519233,0.42154596496463625) q[24];
-cx q[24],q[5];
-u3(0.9196179775644282,-pi/2,-pi/2) q[24];
-u3(0.7920574239785357,-0.35805771343995163,-1.0813012308125387) q[5];
-cx q[24],q[5];
-u3(0.14633245453397764,-pi,-pi/2) q[24];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[5];
-cx q[24],q[5];
-u3(0.46403431639471576,-2.77636804122052,1.802337131902176) q[24];
-u3(2.420444214635306,1.7293846394848087,-0.4646839320983309) q[24];
-u3(1.611894393153681,1.6535190635768728,-0.22023843484090833) q[5];
-u3(1.4791107285314498,-0.3735677789708256,1.696809103989965) q[5];
-u3(2.599760428786004,1.1233212244926118,0.03348988027816091) q[6];
-u3(2.421964122241247,0.5686140556287862,2.30556001134574) q[6];
-cx q[9],q[6];
-u3(0.9678303199526166,-0.6276897201375129,-0.6633970853099704) q[6];
-u3(0.658951717190285,-pi/2,-pi/2) q[9];
-cx q[9],q[6];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[6];
-u3(0.1841405184103595,0,pi/2) q[9];
-cx q[9],q[6];
-u3(1.5728620962935098,3.1204251950220216,-0.2867143642440926) q[6];
-u3(2.1225472645795804,3.140395481673801,0.5777848194890312) q[6];
-cx q[5],q[6];
-u3(0.5196361787412125,-pi/2,-pi/2) q[5];
-u3(0.895930629423275,-0.5475111770110881,-0.7976346251418125) q[6];
-cx q[5],q[6];
-u3(0.0307192636975347,0,pi/2) q[5];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[6];
-cx q[5],q[6];
-u3(0.5648351929221682,1.3491860245926315,1.8397935081830639) q[5];
-u3(2.1901992212433874,-3.0159831773894488,-1.7195214932044744) q[5];
-u3(1.1246806037220505,-3.0435145327088957,1.1390910937906957) q[6];
-u3(0.19334817004524643,-3.0481286137299612,-2.773492793663057) q[6];
-cx q[6],q[5];
-u3(0.8464149105307616,-0.47307742811172515,-0.9131170399676698) q[5];
-u3(0.9002164115764354,-pi/2,-pi/2) q[6];
-cx q[6],q[5];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[5];
-u3(0.5353655871074887,0,pi/2) q[6];
-cx q[6],q[5];
-u3(1.2236975902396414,0.011352723646361973,2.961243520401834) q[5];
-u3(0.9538531257224552,1.0080794723980286,-2.799339084496099) q[5];
-u3(1.8213270544587696,-1.338944863201826,-2.3339351336479144) q[6];
-u3(1.1981108609627118,0.2767957038106861,1.1404453880490575) q[6];
-u3(1.9979074130083943,2.6237952739994705,2.346459373032288) q[9];
-u3(2.5403112486935697,1.8594219434672876,-0.6348059142376705) q[9];
-u3(2.2517251012802513,-2.428097751843885,2.527570151684877) q[25];
-cx q[25],q[13];
-u3(0.7300124505003464,0.025797799525053122,-1.6054103785310145) q[13];
-u3(0.5139536065507995,-pi/2,-pi/2) q[25];
-cx q[25],q[13];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[13];
-u3(0.03186050960421233,-pi,-pi/2) q[25];
-cx q[25],q[13];
-u3(1.3968930349513395,2.5534115393247543,0.3355841308514824) q[13];
-u3(2.1652996826716167,0.5672189193428583,-0.10835092802986157) q[13];
-cx q[11],q[13];
-u3(0.8648350409850196,-pi/2,-pi/2) q[11];
-u3(0.9342083103915909,-0.5934028238587503,-0.7224058572497647) q[13];
-cx q[11],q[13];
-u3(0.3975309002074095,-pi,-pi/2) q[11];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[13];
-cx q[11],q[13];
-u3(0.1371277092687991,0.5391423262490505,-0.7274080428224732) q[11];
-u3(0.24023513856961765,3.087349022140037,-1.2121062756408696) q[11];
-u3(1.7267303397373053,0.7603958544192864,0.03599600798425717) q[13];
-u3(0.4990917787814183,-1.12919850033605,-0.44138672876445106) q[13];
-u3(0.7282134309461886,-2.3166033783804854,0.9906650287732663) q[25];
-u3(0.9207788597423964,0.8040246416491015,-1.3163901593522134) q[25];
-u3(1.531329892379101,2.5171816825161644,0.580321058481081) q[26];
-cx q[17],q[26];
-u3(1.0382875031338787,-pi/2,-pi/2) q[17];
-u3(0.8326216998787189,-0.44813793345978814,-0.9504583032751519) q[26];
-cx q[17],q[26];
-u3(0.09956204553077593,-pi,-pi/2) q[17];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[26];
-cx q[17],q[26];
-u3(1.1338850539207095,0.6278992753967749,3.1340734081426076) q[17];
-u3(2.127337442172053,-3.0199264663749688,-1.4823093566477707) q[17];
-cx q[25],q[17];
-u3(0.9517969292227744,-0.6119541769301504,-0.6908245314685804) q[17];
-u3(0.9423289861667814,-pi/2,-pi/2) q[25];
-cx q[25],q[17];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[17];
-u3(0.0775751867048078,0,pi/2) q[25];
-cx q[25],q[17];
-u3(2.719260933338091,-2.352597986867047,1.1460890512671655) q[17];
-u3(0.7050914456656793,-3.0428199700099636,-0.406226554078295) q[17];
-cx q[17],q[13];
-u3(0.9358426420657577,-0.5951875705467096,-0.7194002131779964) q[13];
-u3(0.9627526557588071,-pi/2,-pi/2) q[17];
-cx q[17],q[13];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[13];
-u3(0.24916921502401132,0,pi/2) q[17];
-cx q[17],q[13];
-u3(1.2337353481564455,-2.9122545251209395,-0.8017608972726054) q[13];
-u3(1.423538892329271,-0.3635584297389416,-2.785420373482823) q[13];
-u3(1.0785086569804838,1.9910077670836737,2.6673012948098007) q[17];
-u3(1.0273910190074134,0.5216979108582476,-0.5637756429862364) q[17];
-u3(2.1723060173668136,-0.5576845002079591,-1.2512198310903688) q[25];
-u3(1.6332590532214328,3.0211083091854434,-2.2437483471003485) q[25];
-cx q[20],q[25];
-u3(1.2428036593980392,-pi/2,-pi/2) q[20];
-u3(0.8829001992819575,-0.5298296951552426,-0.825704724300449) q[25];
-cx q[20],q[25];
-u3(0.19736751699400373,-pi,-pi/2) q[20];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[25];
-cx q[20],q[25];
-u3(1.0566596188431345,-2.924366095612785,2.5075912561355143) q[20];
-u3(1.3689061713516937,1.2835076550452715,-0.6632270050816742) q[20];
-u3(0.7460522287432881,1.535166134477186,-2.452386165617157) q[25];
-u3(2.20116000272397,1.9871257801898672,0.49069605735738975) q[25];
-u3(1.4341965121470215,-0.270111857447203,-1.9696250639936468) q[26];
-u3(1.2342909478824475,2.8627814182897957,2.653154266626337) q[26];
-u3(2.1309708567378913,-2.0738417079231617,2.662055747923019) q[27];
-cx q[10],q[27];
-u3(0.7762553385632521,-pi/2,-pi/2) q[10];
-u3(0.9752225978943381,-0.6345985041439612,-0.6511485189627422) q[27];
-cx q[10],q[27];
-u3(0.40777034460295386,0,pi/2) q[10];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[27];
-cx q[10],q[27];
-u3(2.1313392709994963,-2.106339651791158,-0.09340570733062403) q[10];
-u3(0.3845491842913452,2.875803369655589,-1.518676794770602) q[10];
-cx q[10],q[18];
-u3(0.6012200506357838,-pi/2,-pi/2) q[10];
-u3(0.9549613736524768,-0.615144691507846,-0.6853135041494127) q[18];
-cx q[10],q[18];
-u3(0.2753619621598677,-pi,-pi/2) q[10];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[18];
-cx q[10],q[18];
-u3(1.9000727775394775,-0.2486242340858813,0.34590858451268147) q[10];
-u3(1.2115989388683923,0.16380272520520478,2.266411407989824) q[10];
-u3(2.688498321457216,1.7818405404218813,1.4530160212601295) q[18];
-u3(2.9132401985421312,1.6005199564909294,-0.3517973269592254) q[18];
-u3(1.640965270734147,-1.7822791613586597,-0.23795142713976114) q[27];
-u3(2.311879452105867,-1.9236159609971715,-0.6713634617096034) q[27];
-u3(1.9811227508408709,0.6080068115995951,0.21456624582257255) q[28];
-cx q[28],q[7];
-u3(0.7366386423231739,-pi/2,-pi/2) q[28];
-u3(0.8213684113191396,-0.4259763910387897,-0.983186766836539) q[7];
-cx q[28],q[7];
-u3(0.20268862925662612,0,pi/2) q[28];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[7];
-cx q[28],q[7];
-u3(0.86393554650288,3.132359212230967,-0.9950516075827309) q[28];
-u3(1.439188840057826,-3.034381391964895,-2.8683405643125903) q[28];
-cx q[28],q[22];
-u3(0.8277898698914311,-0.4388397359475058,-0.964238888709346) q[22];
-u3(1.0429562981779206,-pi/2,-pi/2) q[28];
-cx q[28],q[22];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[22];
-u3(0.20811000880427663,-pi,-pi/2) q[28];
-cx q[28],q[22];
-u3(2.2446251508559456,-1.1664581700456857,-2.329016175973087) q[22];
-u3(1.5252881428965888,-0.5324257781423518,1.551590737147496) q[22];
-u3(1.3568823393857947,0.11784505707209281,-2.169785734216208) q[28];
-u3(1.9284698957979096,1.1103714127259012,-0.6611041906143194) q[28];
-cx q[28],q[24];
-u3(0.7849912081512487,-0.3387243894163574,-1.1087275195861608) q[24];
-u3(0.4355621620341642,-pi/2,-pi/2) q[28];
-cx q[28],q[24];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[24];
-u3(0.1449577246695774,-pi,-pi/2) q[28];
-cx q[28],q[24];
-u3(2.4317179695728424,3.077714197126503,1.8428729843552834) q[24];
-u3(1.0585131685171063,-0.7963721128955576,-0.48387321983718756) q[24];
-u3(2.899857187161569,0.5727204695541039,-1.9515954356355625) q[28];
-u3(2.1120499997654454,-3.0286155843710816,2.5653186434438915) q[28];
-u3(2.226423802515547,0.4367761257164773,0.9116749658683663) q[7];
-u3(2.6325493843983594,0.04303426574740543,1.3434159342697214) q[7];
-cx q[7],q[15];
-u3(0.9711819271531866,-0.630848134653498,-0.6578139737018844) q[15];
-u3(1.0238801835382993,-pi/2,-pi/2) q[7];
-cx q[7],q[15];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[15];
-u3(0.3354198256658074,-pi,-pi/2) q[7];
-cx q[7],q[15];
-u3(1.252637818362669,-0.012056591620543067,2.1189846806978787) q[15];
-u3(1.4140339094355185,2.785397267040663,-0.49796608827500544) q[15];
-cx q[23],q[15];
-u3(0.8474229723805237,-0.4748146241643356,-0.9104940457847643) q[15];
-u3(0.47815922939987054,-pi/2,-pi/2) q[23];
-cx q[23],q[15];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[15];
-u3(0.0022004958010658896,-pi,-pi/2) q[23];
-cx q[23],q[15];
-u3(1.847703072778759,-1.433342271159339,0.9139672400552454) q[15];
-u3(2.28520989168784,1.3630864168278949,-2.5200193974503646) q[15];
-cx q[15],q[17];
-u3(0.8553338554045652,-pi/2,-pi/2) q[15];
-u3(0.7832190676151304,-0.33363999799145283,-1.1159086373003184) q[17];
-cx q[15],q[17];
-u3(0.5527033676397226,-pi,-pi/2) q[15];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[17];
-cx q[15],q[17];
-u3(2.0647742606030963,-1.1507047922719011,-1.5448478258284162) q[15];
-u3(2.117558413339784,0.9427899579680625,-1.9901070778420904) q[15];
-u3(0.42731962970959764,-2.788719651517794,0.7362682343381213) q[17];
-u3(1.3973450557954548,-0.21526529223575697,0.9747908869303217) q[17];
-u3(0.7451050382533579,-0.5101278518509087,3.1259738956380323) q[23];
-u3(0.7966230100910476,-0.9861864201624568,-0.478817103332946) q[23];
-u3(0.6809662782571905,2.211093630164674,-1.306725051290717) q[7];
-u3(1.761604552725573,2.897471779386751,-3.0107667310938435) q[7];
-cx q[7],q[11];
-u3(0.9219773888949654,-0.5796214745526562,-0.7453981547369395) q[11];
-u3(0.9277850586264131,-pi/2,-pi/2) q[7];
-cx q[7],q[11];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[11];
-u3(0.10259619789706435,0,pi/2) q[7];
-cx q[7],q[11];
-u3(1.6684996102784238,1.5610591118358688,2.48311437748011) q[11];
-u3(2.2966127621646955,-1.5591351480195885,-2.729121545031914) q[11];
-u3(1.439586715653899,-2.826406615935574,0.7934095770005891) q[7];
-u3(2.448950329828103,-2.5016661713361854,0.141685170407988) q[7];
-cx q[9],q[22];
-u3(0.929951420936696,-0.5886925315572524,-0.7303067948275324) q[22];
-u3(0.8236346698412244,-pi/2,-pi/2) q[9];
-cx q[9],q[22];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[22];
-u3(0.05187088777064887,-pi,-pi/2) q[9];
-cx q[9],q[22];
-u3(1.863839921454656,1.0975412824278719,-0.8803245346230222) q[22];
-u3(0.6441975364307025,1.3679978221062274,-1.2112583817943305) q[22];
-u3(1.7986417457908008,-0.7673687168569803,2.9153302268742927) q[9];
-u3(1.4211503154309664,2.2285732107125122,-1.7206176398412794) q[9];
-u3(1.1486718304490653,-0.6293730880653037,1.233869732104691) q[29];
-cx q[12],q[29];
-u3(0.6546473593894165,-pi/2,-pi/2) q[12];
-u3(0.9282631341351741,-0.5867993167664736,-0.7334697972534503) q[29];
-cx q[12],q[29];
-u3(0.23787225207304247,-pi,-pi/2) q[12];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[29];
-cx q[12],q[29];
-u3(1.6839217112104121,2.280245269507052,-2.245480328069521) q[12];
-u3(0.7722392728653273,1.6935784394956652,1.2225560762204264) q[12];
-cx q[12],q[2];
-u3(1.1503782035909107,-pi/2,-pi/2) q[12];
-u3(0.9596322050924065,-0.6197764402228461,-0.6772685862254821) q[2];
-cx q[12],q[2];
-u3(0.23739871026381315,0,pi/2) q[12];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[2];
-cx q[12],q[2];
-u3(0.9434299814820397,1.9692996203580826,1.3287953633618672) q[12];
-u3(1.3407357650122507,-2.9550480007855353,-1.2013086368260484) q[12];
-u3(0.9896143773940471,2.300423649556892,2.8303931973889185) q[2];
-u3(0.45005811991056244,-3.068952637896648,0.4983574004741467) q[2];
-cx q[2],q[19];
-u3(0.8092431710033213,-0.3999106585703176,-1.0211999643979368) q[19];
-u3(1.1273714720390982,-pi/2,-pi/2) q[2];
-cx q[2],q[19];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[19];
-u3(0.17013394718129352,0,pi/2) q[2];
-cx q[2],q[19];
-u3(1.7559566930766022,-0.2670177954557902,1.7395481891586497) q[19];
-u3(2.03982083755133,-0.09072861599018234,1.4483550853273375) q[19];
-u3(0.31796797147563366,2.005149991848869,3.1056899800870355) q[2];
-u3(1.7868104918560392,0.5417833948569148,0.4720223774986918) q[2];
-cx q[25],q[2];
-u3(0.9253041057008031,-0.5834459765704261,-0.7390548731514421) q[2];
-u3(0.994000254287311,-pi/2,-pi/2) q[25];
-cx q[25],q[2];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[2];
-u3(0.37894529825795664,0,pi/2) q[25];
-cx q[25],q[2];
-u3(2.1238488375627926,1.005648876853889,-2.763342651893205) q[2];
-u3(0.3563101759371103,0.7331944224586975,0.8060182840676555) q[2];
-u3(1.8572437744428443,1.7711804628141117,1.4686698106768663) q[25];
-u3(2.302519345122299,-0.09738354795323367,2.3540740174978385) q[25];
-u3(0.6938343181636832,2.3575344044935456,-2.275027772346241) q[29];
-u3(2.7539273240866486,-0.21224537726831372,-3.046282507605614) q[29];
-cx q[0],q[29];
-u3(0.7648162202909743,-pi/2,-pi/2) q[0];
-u3(0.7658483175722167,-0.2773637425097797,-1.1946216712048976) q[29];
-cx q[0],q[29];
-u3(0.4513698744704195,0,pi/2) q[0];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[29];
-cx q[0],q[29];
-u3(1.5723987584723127,2.5575051914538873,2.609151327657419) q[0];
-u3(0.6970497211519835,1.8896910561151445,0.8852762471829569) q[0];
-cx q[0],q[18];
-u3(0.8573338574059444,-pi/2,-pi/2) q[0];
-u3(0.7910913521480792,-0.35549764279973317,-1.0849442846425301) q[18];
-cx q[0],q[18];
-u3(0.5241866287845852,-pi,-pi/2) q[0];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[18];
-cx q[0],q[18];
-u3(2.1855389112471126,0.03695379949310862,-0.7748186906187557) q[0];
-u3(0.5073823504227253,-3.0331236627059943,-2.7329698327092014) q[0];
-u3(0.5650828796085174,0.5919530062428944,-0.9639028653619537) q[18];
-u3(2.2806669054455364,-0.25417726409718977,-1.1008638293038722) q[18];
-cx q[18],q[9];
-u3(1.0091761332605846,-pi/2,-pi/2) q[18];
-cx q[22],q[0];
-u3(0.7613291704522647,-0.26022673162819077,-1.218344755086962) q[0];
-u3(0.5854064392101106,-pi/2,-pi/2) q[22];
-cx q[22],q[0];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[0];
-u3(0.29648071540750087,-pi,-pi/2) q[22];
-cx q[22],q[0];
-u3(1.6488612304377446,-2.2488331690322867,-3.050502352900075) q[0];
-u3(1.817061671992331,1.8605691396892103,-0.24975290040522768) q[0];
-u3(0.7901991541326815,2.9766841604771743,1.5399442817063056) q[22];
-u3(1.1854843077124781,0.5320353033369805,2.294993962363172) q[22];
-u3(2.082793700751798,2.5013578913431394,-1.8152926819922088) q[29];
-u3(1.0762050114729773,-2.3332048954131093,-0.17605586676201312) q[29];
-cx q[29],q[16];
-u3(0.8398276298532583,-0.46144771188505374,-0.930601433214612) q[16];
-u3(0.6907133785815134,-pi/2,-pi/2) q[29];
-cx q[29],q[16];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[16];
-u3(0.11787477722872444,-pi,-pi/2) q[29];
-cx q[29],q[16];
-u3(0.47614754073984694,-2.651909043120485,-1.3649573069235552) q[16];
-u3(0.8879507871529495,1.037003939022541,0.6580199184945972) q[16];
-u3(1.1900151123697125,2.6304519720741535,1.5668941683182478) q[29];
-u3(1.661703126116811,1.2966323967910016,-0.0175384896469577) q[29];
-cx q[23],q[29];
-u3(0.7113475003819899,-pi/2,-pi/2) q[23];
-u3(0.7655112960424535,-0.27612945300331937,-1.1963337946990187) q[29];
-cx q[23],q[29];
-u3(0.348389121227653,0,pi/2) q[23];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[29];
-cx q[23],q[29];
-u3(1.9258914040365929,-0.2556669376735843,1.1625773921918174) q[23];
-u3(0.9531682215472906,3.0146183530570134,-0.17032585483997575) q[23];
-cx q[2],q[23];
-u3(0.39994070189990777,-pi/2,-pi/2) q[2];
-u3(0.812007369303908,-0.406075264639858,-1.0122534154772982) q[23];
-cx q[2],q[23];
-u3(0.25700808722354673,0,pi/2) q[2];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[23];
-cx q[2],q[23];
-u3(2.341722409074223,0.40327096308759636,1.635669683610498) q[2];
-u3(2.496275042592073,0.922003708519048,1.6340477080315488) q[2];
-u3(2.608298970112273,-0.12611071485875813,-2.816927531239724) q[23];
-u3(1.7004455508519734,-0.6529974008667212,-3.007703672008149) q[23];
-u3(1.0175977748707192,-1.6389395807363467,2.468388724804889) q[29];
-u3(2.419398855712748,-0.41517798935869576,-0.6068726354518006) q[29];
-u3(0.9514654984652964,-0.6116175171309832,-0.6914046238612581) q[9];
-cx q[18],q[9];
-u3(0.1586559734483737,-pi,-pi/2) q[18];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[9];
-cx q[18],q[9];
-u3(1.3261052533926647,-1.8129779429072272,0.8442444491406711) q[18];
-u3(2.9402916090702207,-1.8637821988284013,1.726137877497596) q[18];
-cx q[18],q[25];
-u3(0.66928791803199,-pi/2,-pi/2) q[18];
-u3(0.8665003488473308,-0.5057727110412236,-0.8632179898600256) q[25];
-cx q[18],q[25];
-u3(0.026623046620421902,0,pi/2) q[18];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[25];
-cx q[18],q[25];
-u3(0.5043666447411205,1.7971281652447386,2.281853448107533) q[18];
-u3(2.0136939749465497,-0.5448424323500891,0.3183746493646207) q[18];
-u3(1.7495847638019346,2.891810872093254,1.4351851823105584) q[25];
-u3(0.6948780781004879,0.6185743321000139,2.786010135614328) q[25];
-u3(1.1196381146353562,2.0434630588982046,-1.6800117010946995) q[9];
-u3(0.2071812609431337,-2.631625131684898,-1.0805836722416187) q[9];
-u3(0.8388819555720766,-1.2754490246226986,0.5916884420532043) q[30];
-cx q[1],q[30];
-u3(1.081613134781843,-pi/2,-pi/2) q[1];
-u3(0.9552174682661069,-0.6154010220293138,-0.684869669266245) q[30];
-cx q[1],q[30];
-u3(0.3076434293739927,-pi,-pi/2) q[1];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[30];
-cx q[1],q[30];
-u3(1.5922550548562648,1.6873580129921573,0.9867375569895387) q[1];
-u3(0.8911218343139033,0.03188951581309141,1.1276859925284288) q[1];
-cx q[27],q[1];
-u3(0.9132910933672217,-0.5693532756381132,-0.7622945457704464) q[1];
-u3(1.0071031636813608,-pi/2,-pi/2) q[27];
-cx q[27],q[1];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[1];
-u3(0.05530170613039043,-pi,-pi/2) q[27];
-cx q[27],q[1];
-u3(1.2588785813288632,-3.0702068505187237,0.9996453719322203) q[1];
-u3(1.5285247169878677,-1.2460050901343622,-3.0560826516571638) q[1];
-u3(1.8404918789543643,-2.090661819549384,0.988724725075457) q[27];
-u3(0.11399019847417168,2.9418667501463354,-0.8226437084580409) q[27];
-cx q[27],q[14];
-u3(0.796572050812283,-0.36970248089546853,-1.0646844542325429) q[14];
-u3(0.4765312547910905,-pi/2,-pi/2) q[27];
-cx q[27],q[14];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[14];
-u3(0.036790999924771056,-pi,-pi/2) q[27];
-cx q[27],q[14];
-u3(1.2729730147117284,0.1360894329089204,1.3172716774089341) q[14];
-u3(2.807770563940739,0.40522765755962187,1.194959292524027) q[14];
-u3(2.683495486392455,1.1755717712313682,0.6721076846346339) q[27];
-u3(1.531329892379101,2.5171816825161644,0.580321058481081) q[27];
-cx q[11],q[27];
-u3(1.0382875031338787,-pi/2,-pi/2) q[11];
-u3(0.8326216998787189,-0.44813793345978814,-0.9504583032751519) q[27];
-cx q[11],q[27];
-u3(0.09956204553077593,-pi,-pi/2) q[11];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[27];
-cx q[11],q[27];
-u3(1.1338850539207095,0.6278992753967749,3.1340734081426076) q[11];
-u3(1.083768640371864,-0.14360140161927903,-2.840168237994048) q[11];
-u3(1.4341965121470215,-0.270111857447203,-1.9696250639936468) q[27];
-u3(0.6798696033553676,2.786222893886542,0.2323873835610879) q[27];
-cx q[11],q[27];
-u3(0.8803762347028278,-pi/2,-pi/2) q[11];
-u3(0.919934771384593,-0.5772440528678691,-0.7493273874856836) q[27];
-cx q[11],q[27];
-u3(0.28927326221621424,0,pi/2) q[11];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[27];
-cx q[11],q[27];
-u3(1.5034234498695027,-1.543905609564927,-1.1379760928559577) q[11];
-u3(0.9079471464006423,-2.974247552774461,0.7161818193893863) q[11];
-u3(1.2303011321411097,2.5648056817050566,1.0436532654936368) q[27];
-u3(0.9201306877796598,-1.4214597991901652,-0.962551425015346) q[27];
-u3(1.0637654740248057,-1.289461905817247,-1.846994050179366) q[30];
-u3(1.371839422289654,1.6466581204154789,-0.18531561268508323) q[30];
-cx q[30],q[26];
-u3(0.810741500678954,-0.4032694719632892,-1.0163286234860323) q[26];
-u3(0.8045939803738013,-pi/2,-pi/2) q[30];
-cx q[30],q[26];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[26];
-u3(0.24085242107553312,-pi,-pi/2) q[30];
-cx q[30],q[26];
-u3(0.2554136828413706,1.7546312982683823,-0.48174188141573104) q[26];
-u3(1.44500403144896,-1.6978532522306367,0.3825248895908353) q[26];
-cx q[26],q[12];
-u3(0.9396059212701161,-0.5992483985024615,-0.7125363798237796) q[12];
-u3(1.0099208048466282,-pi/2,-pi/2) q[26];
-cx q[26],q[12];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[12];
-u3(0.6916076117867407,-pi,-pi/2) q[26];
-cx q[26],q[12];
-u3(1.4931930137374516,0.370126379404049,-0.9130261873977257) q[12];
-u3(2.8500056024485727,2.3828599907301005,2.4359616095815895) q[12];
-cx q[14],q[12];
-u3(0.955218644294291,-0.6154021984982974,-0.6848676318461742) q[12];
-u3(0.5540375577759512,-pi/2,-pi/2) q[14];
-cx q[14],q[12];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[12];
-u3(0.4129934008609942,-pi,-pi/2) q[14];
-cx q[14],q[12];
-u3(0.7767136835013522,0.21252240807536005,-2.813722351510137) q[12];
-u3(1.6584268594662002,1.1757004510800773,2.7920033110397835) q[12];
-cx q[12],q[0];
-u3(0.9527624678763543,-0.6129322358410096,-0.6891377210191365) q[0];
-u3(1.135203941754062,-pi/2,-pi/2) q[12];
-cx q[12],q[0];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[0];
-u3(0.3386769294123757,-pi,-pi/2) q[12];
-cx q[12],q[0];
-u3(0.45621799679516667,1.18269113913051,-1.0847203546129203) q[0];
-u3(1.4031213850382358,1.1226667923444502,3.120980156921517) q[0];
-u3(0.6473565336204402,2.8616251346318204,2.4487844607984393) q[12];
-u3(1.6652876239099008,-1.8135811278172307,-0.29634088862131325) q[12];
-u3(0.6326501421283695,0.3480187189005033,-0.7501087648729081) q[14];
-u3(2.164382284948622,0.6855341879179662,0.2396160804236085) q[14];
-u3(1.345199560306548,-1.1747390159009414,2.560672655776383) q[26];
-u3(2.0543645640447887,1.182639843770299,-1.4985184489598906) q[26];
-cx q[26],q[28];
-u3(0.9370983355809189,-pi/2,-pi/2) q[26];
-u3(0.8159415598325943,-0.41461584611384694,-0.9998148364416011) q[28];
-cx q[26],q[28];
-u3(0.04966422611558994,-pi,-pi/2) q[26];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[28];
-cx q[26],q[28];
-u3(1.0153581442045156,0.04954642592043257,0.639564718394241) q[26];
-u3(1.3918778298989825,-1.608198948996133,2.4140484394439836) q[26];
-u3(1.3734950816742169,-3.0841571180786613,-2.0081241121219287) q[28];
-u3(0.8283664809531595,-0.31159563980027105,1.1859232237701) q[28];
-u3(1.0896309525188952,-1.4334437762958179,-2.357592682967283) q[30];
-u3(0.835758067847413,-1.5903229400120447,-1.5200327829796745) q[30];
-u3(1.1203800121095602,1.512258539119225,2.3340247516178483) q[31];
-cx q[8],q[31];
-u3(0.9625467306701615,-0.6226207723161101,-0.6723014359983566) q[31];
-u3(0.7161281682373544,-pi/2,-pi/2) q[8];
-cx q[8],q[31];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[31];
-u3(0.23223730495654737,-pi,-pi/2) q[8];
-cx q[8],q[31];
-u3(1.8864092804357238,-2.217803481481905,0.19968176842456398) q[31];
-u3(1.5688151517562698,-1.1789709934289956,2.433684452103946) q[31];
-cx q[4],q[31];
-u3(0.9098211062113555,-0.5651327276199187,-0.7691850238319642) q[31];
-u3(1.337710947424499,-pi/2,-pi/2) q[4];
-cx q[4],q[31];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[31];
-u3(0.8347134705218127,0,pi/2) q[4];
-cx q[4],q[31];
-u3(0.815888818464578,0.11143673495387452,3.0137904135173557) q[31];
-u3(1.4909111026710058,0.13680740716735373,1.4215163497973649) q[31];
-cx q[31],q[21];
-u3(0.8767183555819038,-0.5210119907626196,-0.839540601614857) q[21];
-u3(1.0228011493462539,-pi/2,-pi/2) q[31];
-cx q[31],q[21];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[21];
-u3(0.6562732476534594,0,pi/2) q[31];
-cx q[31],q[21];
-u3(2.274128058632258,1.9710183465753426,-0.8083885536854671) q[21];
-u3(0.853422039339564,-3.0973887811561345,-2.7709936768813797) q[21];
-u3(2.373038073591245,-3.1307063648431015,-0.9347767310978599) q[31];
-u3(1.810211673932035,0.34929329843340007,-2.966207975531214) q[31];
-cx q[31],q[7];
-u3(0.9572295539293383,-pi/2,-pi/2) q[31];
-u3(1.7800716381824475,0.7973227499279387,-2.1863291460530077) q[4];
-u3(0.6081119819408419,-0.5322790941155633,1.3696873403131384) q[4];
-cx q[4],q[1];
-u3(0.8419111234299398,-0.4651793865930518,-0.9250051791344536) q[1];
-u3(0.7792015386848513,-pi/2,-pi/2) q[4];
-cx q[4],q[1];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[1];
-u3(0.158128894471237,0,pi/2) q[4];
-cx q[4],q[1];
-u3(0.5669398723330893,-0.3522364571583356,0.7604160755961478) q[1];
-u3(0.6428886378078325,-0.8414084779757927,1.3251779873113243) q[1];
-cx q[1],q[24];
-u3(0.6156677166738704,-pi/2,-pi/2) q[1];
-u3(0.7690975373465156,-0.2889382086432466,-1.1785387862224077) q[24];
-cx q[1],q[24];
-u3(0.20422383972735525,0,pi/2) q[1];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[24];
-cx q[1],q[24];
-u3(2.815377184041272,2.6077331744761656,-3.135881003896573) q[1];
-u3(1.379402541459831,-2.171334538739208,2.6107710331548253) q[1];
-cx q[1],q[14];
-u3(0.8974836734594759,-pi/2,-pi/2) q[1];
-u3(0.8966106103822001,-0.548402127666435,-0.7962080245862886) q[14];
-cx q[1],q[14];
-u3(0.5284861354131857,0,pi/2) q[1];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[14];
-cx q[1],q[14];
-u3(1.4653008117915287,0.9297700375230349,-0.7564464048107973) q[1];
-u3(0.945729342936042,1.551142389334145,-0.6728566413051604) q[1];
-u3(1.025378780697144,-3.095598915769931,0.15103425883912713) q[14];
-u3(1.8140050101079872,0.6003865982323102,1.5528530918557477) q[14];
-cx q[14],q[0];
-u3(0.8517229255529735,-0.4821039848667539,-0.8994547321066726) q[0];
-u3(0.9543436955190888,-pi/2,-pi/2) q[14];
-cx q[14],q[0];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[0];
-u3(0.1508864504695422,-pi,-pi/2) q[14];
-cx q[14],q[0];
-u3(1.70304095174453,-0.9060521057229716,-1.7090443241164408) q[0];
-u3(1.531932863752957,0.8602316668270822,0.07460162433034245) q[0];
-u3(0.8250109722660722,0.05978896592874072,-2.448963266576505) q[14];
-u3(1.2248222255242154,0.8396318733842776,-0.0026364344561411457) q[14];
-u3(2.3278688980473423,1.2137628251333439,-2.9537839615272445) q[24];
-u3(2.139642039424517,-0.4071976702839821,2.9590743816801783) q[24];
-cx q[29],q[24];
-u3(0.8038335498612275,-0.3874258763364269,-1.0392411966332205) q[24];
-u3(0.30422481017572733,-pi/2,-pi/2) q[29];
-cx q[29],q[24];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[24];
-u3(0.05531743900236235,0,pi/2) q[29];
-cx q[29],q[24];
-u3(0.7866402136049983,1.7054792239367336,2.2791336164955247) q[24];
-u3(1.8137809790631847,0.741824467759006,-2.4748113686173756) q[24];
-cx q[24],q[1];
-u3(0.8510453168045183,-0.48096804039500807,-0.9011786215010353) q[1];
-u3(0.20879802788808505,-pi/2,-pi/2) q[24];
-cx q[24],q[1];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[1];
-u3(0.045936208203674674,-pi,-pi/2) q[24];
-cx q[24],q[1];
-u3(1.627948091836651,-2.652047855545126,0.010191273623208819) q[1];
-u3(2.186875189114975,0.804367479510927,2.7937338940170946) q[1];
-u3(2.1448305665563523,0.18597402371176575,-2.652731238297026) q[24];
-u3(2.0953542086884944,1.0418059528190398,-0.4850780674634043) q[24];
-u3(2.976438984199686,-1.0936726118120568,1.4285473078636048) q[29];
-u3(1.4420557440363586,1.4097626470883355,-0.4917014094428249) q[29];
-cx q[29],q[18];
-u3(0.7791301103352476,-0.32150515883935515,-1.132997624514088) q[18];
-u3(0.6105200431719121,-pi/2,-pi/2) q[29];
-cx q[29],q[18];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[18];
-u3(0.3199959688987282,-pi,-pi/2) q[29];
-cx q[29],q[18];
-u3(0.7286202636356861,-0.34824882367625687,2.060046378098626) q[18];
-u3(0.8698365749047314,-0.5467421295335564,0.5226009948484798) q[18];
-u3(0.6925777945111292,-0.6860243168994535,-0.8520264672706901) q[29];
-u3(1.2115989388683923,0.16380272520520478,2.266411407989824) q[29];
-u3(2.0007408318673563,2.323767825525466,-2.1649074437692146) q[4];
-u3(2.1533721283324794,1.7584533715887591,-1.0538853503424943) q[4];
-cx q[19],q[4];
-u3(0.7072463209230601,-pi/2,-pi/2) q[19];
-u3(0.8040796113731014,-0.38800643713597527,-1.0384044885379637) q[4];
-cx q[19],q[4];
-u3(0.4975547283987541,0,pi/2) q[19];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[4];
-cx q[19],q[4];
-u3(1.1262641136374492,-0.21485050769836533,-0.4800850801267966) q[19];
-u3(0.14366720014288728,2.6028912203339356,1.6639264350517795) q[19];
-cx q[17],q[19];
-u3(0.7174409681097824,-pi/2,-pi/2) q[17];
-u3(0.7712796252108235,-0.29640355245770866,-1.1681382272651426) q[19];
-cx q[17],q[19];
-u3(0.5785136848786777,0,pi/2) q[17];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[19];
-cx q[17],q[19];
-u3(1.7991431667211513,-1.177196297827076,1.1577788520169454) q[17];
-u3(2.1005711121085096,2.220946827449362,-2.996873314834091) q[17];
-u3(1.7100065015777905,0.5831382909176548,-1.593525640773933) q[19];
-u3(2.4755686252169506,-0.4803159460541062,-0.3636647523627623) q[19];
-cx q[27],q[19];
-u3(0.8288922114687245,-0.4409887959893184,-0.9610602733867175) q[19];
-u3(0.857859439604407,-pi/2,-pi/2) q[27];
-cx q[27],q[19];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[19];
-u3(0.500257444575271,-pi,-pi/2) q[27];
-cx q[27],q[19];
-u3(1.8096533742060192,-0.8825377057925312,1.970264416899111) q[19];
-u3(0.7061735795013634,-2.970721457031899,-2.1403702709544707) q[19];
-u3(2.0678573142042684,2.474914723284366,-1.0709721233312433) q[27];
-u3(2.3412658427629474,1.4298373352916274,1.5309727258273957) q[27];
-u3(0.916824966694932,-1.7688235215516084,0.7212656079630548) q[4];
-u3(1.7466817039912248,-1.2616836555192399,-1.0440720079099073) q[4];
-u3(0.9077039191733526,-0.5625230759334614,-0.773430270620997) q[7];
-cx q[31],q[7];
-u3(0.4649676751097121,-pi,-pi/2) q[31];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[7];
-cx q[31],q[7];
-u3(2.7872291389102766,0.06575033292326271,-0.3620179234382235) q[31];
-u3(2.041707165708048,-1.5509616593828899,0.8718886728556727) q[31];
-cx q[31],q[9];
-u3(0.7498231215096582,-pi/2,-pi/2) q[31];
-u3(2.321684417657693,-1.2056566495767607,-1.3283115542245856) q[7];
-u3(2.2323043055659424,1.3554844765688001,-3.0764517894345706) q[7];
-cx q[4],q[7];
-u3(0.8203894698946688,-pi/2,-pi/2) q[4];
-u3(0.8500215167283516,-0.47924278396817455,-0.9037943005879558) q[7];
-cx q[4],q[7];
-u3(0.002512194365258994,-pi,-pi/2) q[4];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[7];
-cx q[4],q[7];
-u3(1.0950286604813289,2.732317388674196,2.3555443893871155) q[4];
-u3(1.3111126526837575,3.0530698553092597,1.1946351732520535) q[4];
-u3(1.142241669095032,-1.0373089383249656,0.4829034483667085) q[7];
-u3(1.3567702629441363,-2.3502620307266158,0.19411849781926893) q[7];
-cx q[7],q[11];
-u3(0.8440221505013907,-0.4689095726972323,-0.919398002797486) q[11];
-u3(0.8572695808432993,-pi/2,-pi/2) q[7];
-cx q[7],q[11];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[11];
-u3(0.09147452979825785,0,pi/2) q[7];
-cx q[7],q[11];
-u3(0.9322981251535516,2.7401217284264723,1.3438252565874205) q[11];
-u3(0.5353013402058454,3.071339849754196,-2.930746261139792) q[11];
-u3(2.100165212153934,-2.238793370714599,-0.5075788228890712) q[7];
-u3(2.7165529370094785,-0.21484144953303863,-0.5977263799515615) q[7];
-u3(1.6411565109140487,-1.4757991489805804,1.326103162252756) q[8];
-u3(1.3381362694076875,0.5642832699823996,-0.7117787731056167) q[8];
-cx q[8],q[3];
-u3(0.9749538302197227,-0.6343509665376379,-0.6515896877225202) q[3];
-u3(0.5131445503134946,-pi/2,-pi/2) q[8];
-cx q[8],q[3];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[3];
-u3(0.273765596862814,-pi,-pi/2) q[8];
-cx q[8],q[3];
-u3(1.5197357861020009,0.18174279481659372,1.7563042959993682) q[3];
-u3(1.0055778656092815,1.4932426910181906,1.0222064494322494) q[3];
-cx q[30],q[3];
-u3(0.9714817277062998,-0.6311285352910803,-0.6573169860744112) q[3];
-u3(1.2466408097273063,-pi/2,-pi/2) q[30];
-cx q[30],q[3];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[3];
-u3(0.2976640449324587,-pi,-pi/2) q[30];
-cx q[30],q[3];
-u3(2.025861050252931,-0.5617109217768794,-3.1132041676326967) q[3];
-u3(1.6203035582737322,1.8331343710293755,2.192180465906537) q[3];
-cx q[20],q[3];
-u3(0.6446447834296744,-pi/2,-pi/2) q[20];
-u3(0.9538326942290452,-0.6140116433735483,-0.6872734522938426) q[3];
-cx q[20],q[3];
-u3(0.060832801129791614,0,pi/2) q[20];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[3];
-cx q[20],q[3];
-u3(2.8246687663832755,-1.1557496312411892,0.024457103608375608) q[20];
-u3(0.6303326605491231,1.7426646907954355,-0.29237153553812956) q[20];
-u3(0.5918109275355596,2.750065666540821,1.377289414774122) q[3];
-u3(0.40746888486152455,1.2457983710146685,-1.5895916094559848) q[3];
-cx q[15],q[3];
-u3(0.6601061705486292,-pi/2,-pi/2) q[15];
-u3(0.9556412221848162,-0.6158245550469528,-0.6841359716285371) q[3];
-cx q[15],q[3];
-u3(0.039594274726125284,-pi,-pi/2) q[15];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[3];
-cx q[15],q[3];
-u3(1.080151711520588,3.0451437262152776,-1.9148706154822732) q[15];
-u3(0.5885803786177347,2.440165682103788,-2.048680112601155) q[15];
-cx q[23],q[15];
-u3(0.905411522793782,-0.5596673430824262,-0.7780627345849087) q[15];
-u3(0.7129766810289924,-pi/2,-pi/2) q[23];
-cx q[23],q[15];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[15];
-u3(0.5492502701997958,0,pi/2) q[23];
-cx q[23],q[15];
-u3(0.8226610319192168,-1.0758907542250764,-0.8163408065914424) q[15];
-u3(1.3171766797209676,1.6689562395379642,0.5842581375828226) q[15];
-cx q[14],q[15];
-u3(0.8498226570428518,-pi/2,-pi/2) q[14];
-u3(0.9517949908842469,-0.6119522093967542,-0.690827922473753) q[15];
-cx q[14],q[15];
-u3(0.12967341909982727,0,pi/2) q[14];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[15];
-cx q[14],q[15];
-u3(1.3589703980124785,-1.3264639403330505,-0.5274354165004751) q[14];
-u3(0.8754613064783127,2.5743327336144244,-0.32115446935498637) q[14];
-u3(2.418674495061081,-1.693314681387998,2.2402511066933535) q[15];
-u3(1.512129424021636,-0.162138174884495,-1.3214891694144093) q[15];
-u3(1.9831760635512383,2.4622704564623197,-0.12244419437610432) q[23];
-u3(1.2783844865374447,-2.9527999334571127,-3.042798466517564) q[23];
-u3(1.0576642261986104,1.3082574585995346,-2.7792767435963377) q[3];
-u3(2.2505077258656154,-1.0820304026521264,0.6951850178325314) q[3];
-u3(0.5373852335891224,-1.6602939167793718,-0.6122697055286435) q[30];
-u3(0.3845491842913452,2.875803369655589,-1.518676794770602) q[30];
-cx q[30],q[21];
-u3(0.9549613736524768,-0.615144691507846,-0.6853135041494127) q[21];
-u3(0.6012200506357838,-pi/2,-pi/2) q[30];
-cx q[30],q[21];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[21];
-u3(0.2753619621598677,-pi,-pi/2) q[30];
-cx q[30],q[21];
-u3(2.688498321457216,1.7818405404218813,1.4530160212601295) q[21];
-u3(2.1670410532589797,-1.1234228108428956,-0.7053175183904119) q[21];
-cx q[22],q[21];
-u3(0.8776541386228937,-0.5223655454909615,-0.8374234145671693) q[21];
-u3(0.6748223722142686,-pi/2,-pi/2) q[22];
-cx q[22],q[21];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[21];
-u3(0.12285666282196829,-pi,-pi/2) q[22];
-cx q[22],q[21];
-u3(0.8602106637726902,-0.12886514761699308,2.123912497840154) q[21];
-u3(2.6653290809225862,-1.676564663774269,1.7424796912496223) q[21];
-u3(2.4266037086673133,0.18879623837235782,0.8607675450256167) q[22];
-u3(2.028491251288841,-0.8478280303298469,1.4110026104792475) q[22];
-cx q[22],q[25];
-u3(1.062006107469197,-pi/2,-pi/2) q[22];
-u3(0.9291567827678201,-0.5878032362262684,-0.7317934347384263) q[25];
-cx q[22],q[25];
-u3(0.09815090909392699,0,pi/2) q[22];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[25];
-cx q[22],q[25];
-u3(2.6274338020789516,-0.5919399242712764,2.997704633417383) q[22];
-u3(2.063271416913249,-2.147371981435265,0.062260691040555205) q[22];
-u3(1.7352926037973622,-2.9255386106112558,1.7125910978934673) q[25];
-u3(0.93958966794839,2.3153245132567584,1.0789671324108756) q[25];
-u3(1.9000727775394775,-0.2486242340858813,0.34590858451268147) q[30];
-u3(0.6303326605491231,1.7426646907954355,-0.29237153553812956) q[30];
-cx q[30],q[26];
-u3(0.8637893636495381,-0.5015814543227854,-0.8696806752005717) q[26];
-u3(0.7919694919865813,-pi/2,-pi/2) q[30];
-cx q[30],q[26];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[26];
-u3(0.08098705566300678,-pi,-pi/2) q[30];
-cx q[30],q[26];
-u3(1.1431339042709843,-1.9224724477128738,-2.310030693572232) q[26];
-u3(1.531329892379101,2.5171816825161644,0.580321058481081) q[26];
-u3(1.962712344297409,1.7666661166811233,-2.183358003894881) q[30];
-u3(1.9194199200646365,-2.943075215927636,-2.2464497139302324) q[30];
-cx q[30],q[3];
-u3(0.7416346552562652,-0.16193274046197859,-1.3527682343272769) q[3];
-u3(0.7637780644961804,-pi/2,-pi/2) q[30];
-cx q[30],q[3];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[3];
-u3(0.6810367350461329,-pi,-pi/2) q[30];
-cx q[30],q[3];
-u3(0.37415697817865134,2.392605755136918,1.4674017878073924) q[3];
-u3(1.43520372807537,1.3603171471651363,-0.6841146642294209) q[3];
-u3(1.0919607554294315,-0.6148103261990867,-2.8266037342673522) q[30];
-u3(1.644922069272799,-2.5948100780162187,3.0146248061355134) q[30];
-cx q[19],q[30];
-u3(0.3072165744885348,-pi/2,-pi/2) q[19];
-u3(0.7917675839943524,-0.35729226179236395,-1.082390864160928) q[30];
-cx q[19],q[30];
-u3(0.12912596546838462,0,pi/2) q[19];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[30];
-cx q[19],q[30];
-u3(1.8279840849360556,2.3777405348417187,0.34974616337164877) q[19];
-u3(2.6808023654057798,-0.5722921587591543,-0.6624788836841518) q[19];
-u3(1.261338842176597,-2.6733369310469213,-0.37418408822507043) q[30];
-u3(2.593046267918141,3.039213025025207,2.0728679784946404) q[30];
-u3(1.4067652950291745,-0.3123888150809955,-1.3127707727503992) q[8];
-u3(0.7870884449385788,-2.72541272831217,-2.0101749644033022) q[8];
-cx q[8],q[10];
-u3(0.813041923586726,-0.408347119726447,-1.0089497067273) q[10];
-u3(0.7551760644648395,-pi/2,-pi/2) q[8];
-cx q[8],q[10];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[10];
-u3(0.11481482909054487,0,pi/2) q[8];
-cx q[8],q[10];
-u3(1.1310616521517778,-0.6792292821514883,-2.9440936785017646) q[10];
-u3(0.6815093543206627,-1.6678636034465537,0.9250542136300695) q[10];
-cx q[16],q[10];
-u3(0.8981339433792022,-0.5503871580625326,-0.7930251860089363) q[10];
-u3(0.6547340271882253,-pi/2,-pi/2) q[16];
-cx q[16],q[10];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[10];
-u3(0.10027698146933495,-pi,-pi/2) q[16];
-cx q[16],q[10];
-u3(0.6263323466224197,-0.29916532505071913,0.07278718815331064) q[10];
-u3(1.5015540223300092,2.429552714788368,-2.182271797412914) q[10];
-cx q[10],q[6];
-u3(0.9551236100271171,-pi/2,-pi/2) q[10];
-u3(1.2968209240255837,0.9780742719587163,0.8933552116880481) q[16];
-u3(1.3918778298989825,-1.608198948996133,2.4140484394439836) q[16];
-cx q[20],q[16];
-u3(0.8637893636495381,-0.5015814543227854,-0.8696806752005717) q[16];
-u3(0.7919694919865813,-pi/2,-pi/2) q[20];
-cx q[20],q[16];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[16];
-u3(0.08098705566300678,-pi,-pi/2) q[20];
-cx q[20],q[16];
-u3(1.1431339042709843,-1.9224724477128738,-2.310030693572232) q[16];
-u3(0.7615692187638068,2.4070263253321933,-0.8279691204741937) q[16];
-u3(1.962712344297409,1.7666661166811233,-2.183358003894881) q[20];
-u3(0.7702221313934762,0.9839500385981985,-0.8922213113590094) q[20];
-cx q[2],q[20];
-u3(0.7672066062244709,-pi/2,-pi/2) q[2];
-u3(0.7672523367210434,-0.28243588003764897,-1.1875800620923123) q[20];
-cx q[2],q[20];
-u3(0.5554418201464864,-pi,-pi/2) q[2];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[20];
-cx q[2],q[20];
-u3(1.4917441226993293,2.4873266248833854,-1.0463578400346023) q[2];
-u3(2.529305926942434,-2.8194709326630507,2.753668016454645) q[2];
-cx q[1],q[2];
-u3(0.28284220935724114,-pi/2,-pi/2) q[1];
-u3(0.8198998699103606,-0.42294823288252603,-0.9876284561863056) q[2];
-cx q[1],q[2];
-u3(0.023667471232011048,-pi,-pi/2) q[1];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[2];
-cx q[1],q[2];
-u3(1.5874747071105846,-2.1897926336163582,3.0267590795156014) q[1];
-u3(0.4065647933003125,-1.965383147457185,-2.189188058601799) q[1];
-cx q[19],q[1];
-u3(0.7425783967790096,-0.1681127628017931,-1.3443834106057686) q[1];
-u3(0.3466449299027934,-pi/2,-pi/2) q[19];
-cx q[19],q[1];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[1];
-u3(0.08515296722553675,0,pi/2) q[19];
-cx q[19],q[1];
-u3(1.14482981497918,-0.42526844510488093,-2.1883159630292717) q[1];
-u3(1.4822076354045883,-0.5890043066281625,2.310785927971388) q[1];
-u3(1.3230674407536658,3.060120353110518,-0.4544413055677925) q[19];
-u3(2.117558413339784,0.9427899579680625,-1.9901070778420904) q[19];
-u3(1.7000564981779844,1.5948780215507394,1.6450199173347873) q[2];
-u3(1.3432960713537365,-0.549244867991268,-1.2659555227601824) q[2];
-u3(0.5329716042834095,2.0151818905331425,0.8055722251075701) q[20];
-u3(1.5159904381615594,1.2572428911519449,2.2632813937918232) q[20];
-cx q[20],q[27];
-u3(0.43873951813506357,-pi/2,-pi/2) q[20];
-u3(0.9786618552483209,-0.6377422845537173,-0.6455302235387776) q[27];
-cx q[20],q[27];
-u3(0.28067596007958945,-pi,-pi/2) q[20];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[27];
-cx q[20],q[27];
-u3(1.0282639089064487,-3.045465730548762,3.080218942611207) q[20];
-u3(2.197375189435065,1.2960653319516577,2.9702907828959635) q[20];
-cx q[15],q[20];
-u3(0.7747098692929945,-pi/2,-pi/2) q[15];
-u3(0.9193687046602352,-0.5765812178614667,-0.7504209991053763) q[20];
-cx q[15],q[20];
-u3(0.09147972790889564,0,pi/2) q[15];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[20];
-cx q[15],q[20];
-u3(1.5815934719168696,-1.6983677923378373,-0.7551125658004523) q[15];
-u3(1.1788077313568188,0.4867717651629566,-0.5287396197470855) q[15];
-u3(1.1135799038732037,-0.9233067453784947,2.7436367101370527) q[20];
-u3(2.495797771889595,0.39374199324008075,0.37444669946345277) q[20];
-u3(1.1906748469342174,-0.6399506544228726,2.3273437428754455) q[27];
-u3(0.7080954818257228,-3.0162700291100593,-0.03292801314932392) q[27];
-u3(0.9199685751375526,-0.5772835803312457,-0.7492621454258188) q[6];
-cx q[10],q[6];
-u3(0.44670081214063,-pi,-pi/2) q[10];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[6];
-cx q[10],q[6];
-u3(1.866842561476824,-1.736225072385922,-2.5611878631877896) q[10];
-u3(0.6320456925833787,-0.5015280984731629,2.782764370616995) q[10];
-u3(0.33371390438730597,-1.3935929951651964,-0.1755291753447379) q[6];
-u3(1.7398307532637307,-2.1909960015422865,0.254229474445002) q[6];
-cx q[12],q[6];
-u3(1.0718646790521928,-pi/2,-pi/2) q[12];
-u3(0.8981914067308667,-0.5504617437192518,-0.7929054751048721) q[6];
-cx q[12],q[6];
-u3(0.3077483280861726,-pi,-pi/2) q[12];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[6];
-cx q[12],q[6];
-u3(2.5351734280208427,1.3166238241831882,1.9633528118831576) q[12];
-u3(1.2306783275070974,0.6514608259237633,-1.7341966387545713) q[12];
-cx q[22],q[12];
-u3(0.7767875477864489,-0.31427933815023845,-1.1431412475482983) q[12];
-u3(0.8833579041610242,-pi/2,-pi/2) q[22];
-cx q[22],q[12];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[12];
-u3(0.05195332524161092,0,pi/2) q[22];
-cx q[22],q[12];
-u3(1.7395987722539523,-0.7088095518952686,-2.9566337440515937) q[12];
-u3(0.6256033017184685,-1.7808521762259142,2.250844988395606) q[12];
-u3(2.0430567959547714,-1.1114322112238426,2.3240622152058386) q[22];
-u3(1.3990577057190672,0.7167202611179784,-1.0487466053743995) q[22];
-cx q[22],q[2];
-u3(0.8529259865959545,-0.4841092957259767,-0.8964082373490836) q[2];
-u3(0.6329343239373644,-pi/2,-pi/2) q[22];
-cx q[22],q[2];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[2];
-u3(0.2580158754002542,0,pi/2) q[22];
-cx q[22],q[2];
-u3(1.6007439002346457,-2.631237357172921,2.427916791172426) q[2];
-u3(0.3563101759371103,0.7331944224586975,0.8060182840676555) q[2];
-u3(1.1361037593580994,-2.026075053927329,-0.6732860862653132) q[22];
-u3(1.3918778298989825,-1.608198948996133,2.4140484394439836) q[22];
-u3(1.089863775994735,0.20499264168815845,-1.2040554421406604) q[6];
-u3(2.2902941162889343,-1.7506654344270296,2.1308009156429044) q[6];
-u3(2.2585055299424805,1.6576841001662554,0.11790381217441803) q[8];
-u3(1.9063623002164853,-0.6159292097910027,-2.9300446740955115) q[8];
-cx q[13],q[8];
-u3(0.9786604379516032,-pi/2,-pi/2) q[13];
-u3(0.8864221927877192,-0.5347263102689785,-0.8179759262283071) q[8];
-cx q[13],q[8];
-u3(0.20671378472913896,-pi,-pi/2) q[13];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[8];
-cx q[13],q[8];
-u3(0.33149404386543063,0.9219230906147304,2.2741398780854176) q[13];
-u3(2.222622320834367,3.101691776948705,1.5292286806809061) q[13];
-cx q[13],q[28];
-u3(0.2535609760911409,-pi/2,-pi/2) q[13];
-u3(0.916703202791112,-0.5734364994793069,-0.7555984875750852) q[28];
-cx q[13],q[28];
-u3(0.14188256161900245,0,pi/2) q[13];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[28];
-cx q[13],q[28];
-u3(1.1967170940300333,-2.6958698218926958,-2.4670525966115977) q[13];
-u3(1.0060585405174667,-1.0354814511505586,1.87777356852951) q[13];
-cx q[21],q[13];
-u3(0.927604980731568,-0.5860573510299796,-0.7347074611233211) q[13];
-u3(0.526191808445792,-pi/2,-pi/2) q[21];
-cx q[21],q[13];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[13];
-u3(0.15658646651674263,0,pi/2) q[21];
-cx q[21],q[13];
-u3(2.1686933488098274,1.7378879223099535,2.7149694680581593) q[13];
-u3(0.16230205755714747,0.5992872600035617,-2.8029716256063524) q[13];
-cx q[13],q[6];
-u3(0.8503047657279037,-pi/2,-pi/2) q[13];
-u3(0.7348666810051734,-1.6826871785724102,-3.0624517977522525) q[21];
-u3(1.3414397502819326,3.067663818203897,-1.4586379549504593) q[21];
-cx q[18],q[21];
-u3(0.6118807677567396,-pi/2,-pi/2) q[18];
-u3(0.8510196526348283,-0.4809249244971019,-0.9012440271942133) q[21];
-cx q[18],q[21];
-u3(0.1790295360480071,-pi,-pi/2) q[18];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[21];
-cx q[18],q[21];
-u3(1.4922413218273518,2.0174257784654834,1.0603744032749889) q[18];
-u3(1.0651055101754823,-2.1278830093139045,-1.6454158112552357) q[18];
-u3(1.083325123609472,3.0140286977298176,1.6074714228355758) q[21];
-u3(2.11781087258667,-1.585846222966846,0.7300467868318075) q[21];
-u3(1.1385169612523096,-0.33738239020577065,-0.8015622235549866) q[28];
-u3(2.796424669787792,-2.0268292769697007,-2.5185661368241927) q[28];
-cx q[28],q[16];
-u3(0.9497465501152997,-0.6098637624775862,-0.6944221448517602) q[16];
-u3(0.7697168086826077,-pi/2,-pi/2) q[28];
-cx q[28],q[16];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[16];
-u3(0.34030598042709154,0,pi/2) q[28];
-cx q[28],q[16];
-u3(2.906304253909757,3.0260459061516567,-1.056057762260226) q[16];
-u3(1.0149707892510171,0.13012318042205084,-1.7747804815081232) q[16];
-cx q[16],q[23];
-u3(1.0806685855510378,-pi/2,-pi/2) q[16];
-u3(0.942378379026423,-0.6021973368097102,-0.707529590414282) q[23];
-cx q[16],q[23];
-u3(0.1375778748518479,-pi,-pi/2) q[16];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[23];
-cx q[16],q[23];
-u3(2.7286515418927104,0.32678675610713714,-0.5656962458741628) q[16];
-u3(1.0422954531045416,-0.12059699910155786,-2.628036027678866) q[16];
-u3(0.6795487631492642,-0.9217587866061887,0.4540999173455349) q[23];
-u3(2.306024371584456,0.06259582592129886,2.292591836229221) q[23];
-u3(2.31253055763591,0.7707421475327516,-0.18063570846211263) q[28];
-u3(0.6146043944910287,1.6687117745681022,-2.7599658399892295) q[28];
-cx q[28],q[24];
-u3(0.8825975439273333,-0.5294046878718595,-0.8263739953856728) q[24];
-u3(0.6536929006332752,-pi/2,-pi/2) q[28];
-cx q[28],q[24];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[24];
-u3(0.48570519339329316,0,pi/2) q[28];
-cx q[28],q[24];
-u3(0.9880998839116473,-0.5570141525543759,1.282041613131999) q[24];
-u3(1.5931030973115934,-1.3221376084813046,-2.8119502330768014) q[24];
-u3(1.0437267109473025,-0.9809277901719784,1.8092276120571427) q[28];
-u3(0.5117726651225993,-1.4905630699154235,-2.3420656435183087) q[28];
-cx q[30],q[18];
-u3(0.9777388526387599,-0.6369028924221909,-0.6470331197222983) q[18];
-u3(0.7286998582314803,-pi/2,-pi/2) q[30];
-cx q[30],q[18];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[18];
-u3(0.1921437310377576,0,pi/2) q[30];
-cx q[30],q[18];
-u3(1.9151255808016183,2.2435169998609705,-1.35071579262604) q[18];
-u3(0.21841956128205292,-0.5555320549163465,-0.35103136707615556) q[18];
-u3(0.38046315885669674,1.7346932605777594,-2.186918993158905) q[30];
-u3(2.6569600097028983,-0.18329511956422273,-2.658822773923517) q[30];
-cx q[15],q[30];
-u3(0.5170424069216429,-pi/2,-pi/2) q[15];
-u3(0.756524409664015,-0.2404132702717865,-1.2456511294109518) q[30];
-cx q[15],q[30];
-u3(0.2181743204295576,-pi,-pi/2) q[15];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[30];
-cx q[15],q[30];
-u3(2.052490156444743,-0.8846315983283759,-0.36658875036586025) q[15];
-u3(2.671394239056956,2.248156156369218,-1.6365590284723406) q[15];
-u3(1.284586355437922,1.5801154766938552,2.3974297262401336) q[30];
-u3(1.4967234119862187,-1.463750821652317,0.8839128816275164) q[30];
-u3(0.8966319964295641,-0.5484300998606395,-0.7961632155225828) q[6];
-cx q[13],q[6];
-u3(0.14327335948061978,0,pi/2) q[13];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[6];
-cx q[13],q[6];
-u3(1.7729184329878755,-1.190842172990047,-1.569565849773287) q[13];
-u3(0.16230205755714747,0.5992872600035617,-2.8029716256063524) q[13];
-u3(1.7849719963210249,1.55571839810729,-0.5031938924397186) q[6];
-u3(1.6095921056799891,0.5833666217950002,1.9648456266892191) q[6];
-cx q[6],q[27];
-u3(0.9213617490561177,-0.5789072843186536,-0.7465796283173773) q[27];
-u3(0.46233875021848647,-pi/2,-pi/2) q[6];
-cx q[6],q[27];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[27];
-u3(0.10644741727226556,-pi,-pi/2) q[6];
-cx q[6],q[27];
-u3(0.5798770473989432,2.6696895413031676,2.2530356911716503) q[27];
-u3(1.661703126116811,1.2966323967910016,-0.0175384896469577) q[27];
-u3(0.8919740708713003,2.025121708064928,-2.1898220635987724) q[6];
-u3(2.0595433957980402,1.1832014960400663,-1.2196360455931068) q[6];
-cx q[6],q[18];
-u3(0.898884486146781,-0.5513596671551357,-0.7914636177008774) q[18];
-u3(0.7051316331369685,-pi/2,-pi/2) q[6];
-cx q[6],q[18];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[18];
-u3(0.2757041250071131,-pi,-pi/2) q[6];
-cx q[6],q[18];
-u3(2.3489748628666947,-0.5475056458427972,-2.467795965896606) q[18];
-u3(0.582030616106118,-0.9182812987734685,-1.7878167109944736) q[18];
-u3(1.1574991060959328,-2.4278750214680684,-1.0899201350996064) q[6];
-u3(2.2800175791446735,0.4008453911535792,2.1626763205389725) q[6];
-u3(1.1932555060923082,-1.7880433794386388,2.6654221129233404) q[8];
-u3(0.5971430148712153,-0.7809354734575287,0.6563293560911783) q[8];
-cx q[5],q[8];
-u3(1.3803385783362272,-pi/2,-pi/2) q[5];
-u3(0.9033536456340125,-0.557076619853897,-0.7822536776374296) q[8];
-cx q[5],q[8];
-u3(0.06568499522882458,-pi,-pi/2) q[5];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[8];
-cx q[5],q[8];
-u3(2.189401515690963,1.6246327023428293,-1.3354697953105612) q[5];
-u3(1.3171533232076125,-2.691379440378618,-2.8132756916277875) q[5];
-cx q[4],q[5];
-u3(1.1180496573700862,-pi/2,-pi/2) q[4];
-u3(0.9306720278421472,-0.5894962286130583,-0.7289618846002135) q[5];
-cx q[4],q[5];
-u3(0.3053390140653252,0,pi/2) q[4];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[5];
-cx q[4],q[5];
-u3(2.1566992879353615,-1.6269680834117928,-0.11986266022465086) q[4];
-u3(0.7870884449385788,-2.72541272831217,-2.0101749644033022) q[4];
-cx q[4],q[29];
-u3(0.813041923586726,-0.408347119726447,-1.0089497067273) q[29];
-u3(0.7551760644648395,-pi/2,-pi/2) q[4];
-cx q[4],q[29];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[29];
-u3(0.11481482909054487,0,pi/2) q[4];
-cx q[4],q[29];
-u3(1.1310616521517778,-0.6792292821514883,-2.9440936785017646) q[29];
-u3(0.7508137618239342,3.086636232712644,0.8788971441161628) q[29];
-u3(2.2585055299424805,1.6576841001662554,0.11790381217441803) q[4];
-u3(1.324276679089571,-1.9708158478352025,-2.778431571305078) q[4];
-cx q[24],q[4];
-u3(0.9691349209014746,-pi/2,-pi/2) q[24];
-u3(0.8487456361973749,-0.47707747094699293,-0.9070728594245097) q[4];
-cx q[24],q[4];
-u3(0.11329053785909764,0,pi/2) q[24];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[4];
-cx q[24],q[4];
-u3(1.0172803670492976,2.8491202119303765,2.7145858399891676) q[24];
-u3(0.8233750081293676,1.303596621484857,-0.38760018653229666) q[24];
-u3(2.6665946767853854,1.016845487282489,-2.2536367762433986) q[4];
-u3(1.8710179363908255,2.0698691203390274,-0.8370164752851039) q[4];
-u3(1.4378241813032382,-2.3850008138729155,-2.2462966283576264) q[5];
-u3(0.9613315916574318,-3.0567294654069057,0.22870804532459932) q[5];
-cx q[0],q[5];
-u3(0.6186521054051746,-pi/2,-pi/2) q[0];
-u3(0.8471488558424493,-0.47434332228116505,-0.9112059608991547) q[5];
-cx q[0],q[5];
-u3(0.0922681121056145,0,pi/2) q[0];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[5];
-cx q[0],q[5];
-u3(0.7100830187421053,1.1937848338357222,-1.467163723003136) q[0];
-u3(2.626332287444954,-2.705794629674618,-2.690178264349733) q[0];
-cx q[16],q[0];
-u3(0.9378772756289653,-0.5973914541431355,-0.715679458290051) q[0];
-u3(0.7901119481958757,-pi/2,-pi/2) q[16];
-cx q[16],q[0];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[0];
-u3(0.015208352981236482,-pi,-pi/2) q[16];
-cx q[16],q[0];
-u3(2.02320718864396,-2.9733556311020184,0.4288562723129292) q[0];
-u3(1.4083910214784952,-0.6459761500363683,-1.201569332990593) q[0];
-u3(0.46150891017637813,0.6018719274196234,-2.23087808950746) q[16];
-u3(1.1981108609627118,0.2767957038106861,1.1404453880490575) q[16];
-u3(1.5600297782780301,2.3383072748490035,-1.752881713838203) q[5];
-u3(0.45005811991056244,-3.068952637896648,0.4983574004741467) q[5];
-u3(1.657537960916296,-1.633079064545103,-1.0252922885010465) q[8];
-u3(1.036662602113126,2.6854405545969957,3.055978991794456) q[8];
-cx q[17],q[8];
-u3(0.798500212722887,-pi/2,-pi/2) q[17];
-u3(0.87338402299244,-0.5161329691034937,-0.8471526515339178) q[8];
-cx q[17],q[8];
-u3(0.5635796289666749,-pi,-pi/2) q[17];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[8];
-cx q[17],q[8];
-u3(0.15134105995500038,-2.72729810007938,1.544671264653493) q[17];
-u3(1.5122896611490348,-1.480852260299108,0.5588473724731595) q[17];
-u3(1.8386334730356433,0.6279076883049131,-2.1874539642877666) q[8];
-u3(1.45640226442807,3.025885643918784,-1.668934158360559) q[8];
-cx q[17],q[8];
-u3(0.44973044269357365,-pi/2,-pi/2) q[17];
-u3(0.7712845739574656,-0.29642022016569713,-1.1681149813799667) q[8];
-cx q[17],q[8];
-u3(0.15992502861596924,-pi,-pi/2) q[17];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[8];
-cx q[17],q[8];
-u3(2.1852837197140165,2.059989323687879,-0.2249462829175135) q[17];
-u3(0.5030508360712105,-1.7450873667526405,-2.954657532558091) q[17];
-cx q[28],q[17];
-u3(0.9395105173675748,-0.5991462818946931,-0.712709416372471) q[17];
-u3(0.7525508349273087,-pi/2,-pi/2) q[28];
-cx q[28],q[17];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[17];
-u3(0.2565708131627373,0,pi/2) q[28];
-cx q[28],q[17];
-u3(1.1251173510046495,-0.6639343340898995,-1.795157883977227) q[17];
-u3(0.8535443244937669,-1.126097867709099,1.8507660341795464) q[17];
-u3(1.374436599636224,2.504727598611085,0.5342907057515114) q[28];
-u3(1.3589579038825101,0.6778131389152868,-0.18689372506480462) q[28];
-cx q[28],q[4];
-u3(0.3725816152371234,-pi/2,-pi/2) q[28];
-u3(0.9774453667882235,-0.636635331996223,-0.647511743198633) q[4];
-cx q[28],q[4];
-u3(0.25432773060833264,-pi,-pi/2) q[28];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[4];
-cx q[28],q[4];
-u3(0.7675266349199774,-2.067793362045142,0.7535390957150505) q[28];
-u3(0.7930660293798076,2.5435407085209976,-2.2805744931574248) q[28];
-u3(2.751154783689649,1.5323296246212008,-1.5058069354690478) q[4];
-u3(1.6930021116136242,2.4131819867599775,-1.9984048938305436) q[4];
-u3(0.5120908634254643,1.548305896612316,2.838813397830247) q[8];
-u3(2.2902941162889343,-1.7506654344270296,2.1308009156429044) q[8];
-cx q[13],q[8];
-u3(0.8503047657279037,-pi/2,-pi/2) q[13];
-u3(0.8966319964295641,-0.5484300998606395,-0.7961632155225828) q[8];
-cx q[13],q[8];
-u3(0.14327335948061978,0,pi/2) q[13];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[8];
-cx q[13],q[8];
-u3(1.7729184329878755,-1.190842172990047,-1.569565849773287) q[13];
-u3(0.6303326605491231,1.7426646907954355,-0.29237153553812956) q[13];
-cx q[13],q[22];
-u3(0.7919694919865813,-pi/2,-pi/2) q[13];
-u3(0.8637893636495381,-0.5015814543227854,-0.8696806752005717) q[22];
-cx q[13],q[22];
-u3(0.08098705566300678,-pi,-pi/2) q[13];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[22];
-cx q[13],q[22];
-u3(1.962712344297409,1.7666661166811233,-2.183358003894881) q[13];
-u3(2.187542641394061,-2.514536907596767,-0.8625160208242892) q[13];
-u3(1.1431339042709843,-1.9224724477128738,-2.310030693572232) q[22];
-u3(2.5436001054569797,0.9161505956666502,-1.7904041211934705) q[22];
-cx q[22],q[18];
-u3(0.8802568662139476,-0.5260947381488728,-0.8315778951447967) q[18];
-u3(0.8399181385211618,-pi/2,-pi/2) q[22];
-cx q[22],q[18];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[18];
-u3(0.41805777070171396,-pi,-pi/2) q[22];
-cx q[22],q[18];
-u3(1.1008640186768441,-3.033527415731707,-0.18534431074035584) q[18];
-u3(1.6881336975433796,-0.009777508131073365,-0.8112013181205171) q[18];
-u3(1.9296750227306272,-0.48908412835417536,0.04095207077690688) q[22];
-u3(0.7408588855734048,2.002642478049795,-2.5809478902258114) q[22];
-u3(1.7849719963210249,1.55571839810729,-0.5031938924397186) q[8];
-u3(0.9531682215472906,3.0146183530570134,-0.17032585483997575) q[8];
-cx q[2],q[8];
-u3(0.39994070189990777,-pi/2,-pi/2) q[2];
-u3(0.812007369303908,-0.406075264639858,-1.0122534154772982) q[8];
-cx q[2],q[8];
-u3(0.25700808722354673,0,pi/2) q[2];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[8];
-cx q[2],q[8];
-u3(2.341722409074223,0.40327096308759636,1.635669683610498) q[2];
-u3(2.431887110796234,2.938877978750334,-1.2613373909707637) q[2];
-u3(2.608298970112273,-0.12611071485875813,-2.816927531239724) q[8];
-u3(1.5005790863542325,-1.650855682334019,0.2853344441666281) q[8];
-u3(0.8156942495412222,-0.41408675038937526,-1.0005869312739577) q[9];
-cx q[31],q[9];
-u3(0.2722314333130512,0,pi/2) q[31];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[9];
-cx q[31],q[9];
-u3(1.635180290624231,1.9676334699353681,-2.496611387109641) q[31];
-u3(1.4265096822651278,2.7122422389017586,0.46859602923661914) q[31];
-cx q[10],q[31];
-u3(0.8159359548571795,-pi/2,-pi/2) q[10];
-u3(0.8608452787896179,-0.4969555581977043,-0.876789980933598) q[31];
-cx q[10],q[31];
-u3(0.47626563736655586,0,pi/2) q[10];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[31];
-cx q[10],q[31];
-u3(1.4819685779444065,1.768573944787323,1.1541041789663105) q[10];
-u3(1.8506535984397008,-2.091031218805337,0.7856665371022062) q[10];
-cx q[10],q[3];
-u3(0.543166683245238,-pi/2,-pi/2) q[10];
-u3(0.7940695644151798,-0.3633111725222524,-1.0738141285949645) q[3];
-cx q[10],q[3];
-u3(0.34318313683749296,-pi,-pi/2) q[10];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[3];
-cx q[10],q[3];
-u3(2.062998281420663,2.0488246867670528,1.614181608790111) q[10];
-u3(1.967661386637891,1.2138893108787583,-2.0133204024005993) q[10];
-u3(0.8811776227403589,-1.659554827745633,-0.9840074378137285) q[3];
-u3(1.1923448723333325,1.1995326324928381,-1.8171902335944514) q[3];
-cx q[29],q[3];
-u3(0.5606716799314448,-pi/2,-pi/2) q[29];
-u3(0.8384887265288892,-0.4590227329210559,-0.9342311522002511) q[3];
-cx q[29],q[3];
-u3(0.20861380476526098,-pi,-pi/2) q[29];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[3];
-cx q[29],q[3];
-u3(1.3835389447107302,-0.7326340951496326,2.606586169752223) q[29];
-u3(3.04075900477088,-2.025615406745438,-1.6192118491278558) q[29];
-u3(0.6100506549276309,-0.35071028303325136,-1.8803428867147183) q[3];
-u3(1.1652489077839456,-1.6999263434698777,0.6695566890907507) q[3];
-cx q[3],q[0];
-u3(0.8342999436653729,-0.45129556293665685,-0.9457616779084184) q[0];
-u3(0.6366285293205773,-pi/2,-pi/2) q[3];
-cx q[3],q[0];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[0];
-u3(0.08589480186476124,0,pi/2) q[3];
-cx q[3],q[0];
-u3(0.7305228470956939,2.3733757020793282,-0.5846676158920676) q[0];
-u3(1.7196166162269455,-1.7519232006450425,1.271940945711835) q[0];
-u3(1.907966057454383,-1.802853280867982,1.1658986841320305) q[3];
-u3(2.83506628670801,-2.012885366136869,-1.4420595371972653) q[3];
-u3(0.5195745599141207,-0.46968306916283176,1.7404082168460926) q[31];
-u3(2.5379964006665365,2.753836741257903,-1.0241277125081512) q[31];
-cx q[7],q[31];
-u3(0.869596792838038,-0.5104821043495242,-0.855931508755539) q[31];
-u3(1.0295700131854504,-pi/2,-pi/2) q[7];
-cx q[7],q[31];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[31];
-u3(0.22845413264896333,0,pi/2) q[7];
-cx q[7],q[31];
-u3(2.464015591275085,-1.1232532900473768,2.6124250127542084) q[31];
-u3(0.9417468850987485,-1.012345372106628,0.5394680676161911) q[31];
-cx q[31],q[14];
-u3(0.858747730082366,-0.4936112929496552,-0.8819145624278981) q[14];
-u3(0.5250043723791116,-pi/2,-pi/2) q[31];
-cx q[31],q[14];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[14];
-u3(0.23696267071873073,0,pi/2) q[31];
-cx q[31],q[14];
-u3(0.15363513117011432,2.9022826364247045,1.8057181802261066) q[14];
-u3(0.7966230100910476,-0.9861864201624568,-0.478817103332946) q[14];
-cx q[14],q[27];
-u3(0.7113475003819899,-pi/2,-pi/2) q[14];
-u3(0.7655112960424535,-0.27612945300331937,-1.1963337946990187) q[27];
-cx q[14],q[27];
-u3(0.348389121227653,0,pi/2) q[14];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[27];
-cx q[14],q[27];
-u3(1.9258914040365929,-0.2556669376735843,1.1625773921918174) q[14];
-u3(0.3455452596972752,3.0838733484549223,-1.6862422514051434) q[14];
-u3(1.0175977748707192,-1.6389395807363467,2.468388724804889) q[27];
-u3(2.194269621507799,0.5782362281491302,0.5645473669415568) q[27];
-cx q[27],q[13];
-u3(0.7640393265635099,-0.2706591285480511,-1.2039152537959872) q[13];
-u3(0.6522220936186238,-pi/2,-pi/2) q[27];
-cx q[27],q[13];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[13];
-u3(0.23941472987699297,0,pi/2) q[27];
-cx q[27],q[13];
-u3(2.4588589295201277,1.5552427676635396,1.936786941516302) q[13];
-u3(1.7522717689517313,1.5690805911952337,-2.4626263311475167) q[13];
-u3(2.895934290220637,0.8576790864966988,2.362905055968956) q[27];
-u3(1.8662664408199714,-2.1845981531855996,0.8033746733195817) q[27];
-u3(1.7456300761451247,-2.2580124633172494,2.873155346601555) q[31];
-u3(1.5015540223300092,2.429552714788368,-2.182271797412914) q[31];
-cx q[31],q[16];
-u3(0.9199685751375526,-0.5772835803312457,-0.7492621454258188) q[16];
-u3(0.9551236100271171,-pi/2,-pi/2) q[31];
-cx q[31],q[16];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[16];
-u3(0.44670081214063,-pi,-pi/2) q[31];
-cx q[31],q[16];
-u3(0.33371390438730597,-1.3935929951651964,-0.1755291753447379) q[16];
-u3(1.7343775491222815,0.6378004348555519,2.2895029536017777) q[16];
-cx q[3],q[16];
-u3(0.866981270380635,-0.506509528062574,-0.8620797220132062) q[16];
-u3(0.6601719631397863,-pi/2,-pi/2) q[3];
-cx q[3],q[16];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[16];
-u3(0.4182373921709391,-pi,-pi/2) q[3];
-cx q[3],q[16];
-u3(2.6217667432837666,1.317671974674088,1.8726910098506613) q[16];
-u3(2.4080743157747193,2.2859356089840794,2.9166506935253302) q[16];
-u3(0.9212125540457007,-0.47758096207094525,-2.5177639067072386) q[3];
-u3(1.7139466241865424,0.4327029127541726,-2.2419744146260006) q[3];
-u3(1.866842561476824,-1.736225072385922,-2.5611878631877896) q[31];
-u3(0.4738632970091426,-1.7058246012857108,-0.3569925026267482) q[31];
-u3(1.617843268172515,-0.30306295317210497,-1.3912550137985722) q[7];
-u3(1.301677494968985,-0.49242663667588715,1.8088894984256871) q[7];
-cx q[12],q[7];
-u3(0.7430072181404144,-pi/2,-pi/2) q[12];
-u3(0.9780462154565397,-0.6371827621269261,-0.6465322536783944) q[7];
-cx q[12],q[7];
-u3(0.23237787000271684,0,pi/2) q[12];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[7];
-cx q[12],q[7];
-u3(2.5614725720292553,2.370277636750675,0.3042676653205407) q[12];
-u3(0.9371061622298511,0.9326808095213597,0.6772100670642947) q[12];
-u3(0.4308056574551949,1.5283746043666913,-0.8094019611507339) q[7];
-u3(1.3973450557954548,-0.21526529223575697,0.9747908869303217) q[7];
-u3(1.2935048711297115,-2.028949495538096,-1.3081654655581507) q[9];
-u3(2.2966127621646955,-1.5591351480195885,-2.729121545031914) q[9];
-cx q[9],q[26];
-u3(0.8326216998787189,-0.44813793345978814,-0.9504583032751519) q[26];
-u3(1.0382875031338787,-pi/2,-pi/2) q[9];
-cx q[9],q[26];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[26];
-u3(0.09956204553077593,-pi,-pi/2) q[9];
-cx q[9],q[26];
-u3(1.4341965121470215,-0.270111857447203,-1.9696250639936468) q[26];
-u3(1.562408404214376,-0.4517307390480294,2.738498803123096) q[26];
-cx q[26],q[11];
-u3(0.9239843268942483,-0.5819356884744193,-0.7415631614443576) q[11];
-u3(0.9821066325418495,-pi/2,-pi/2) q[26];
-cx q[26],q[11];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[11];
-u3(0.3691148802306577,-pi,-pi/2) q[26];
-cx q[26],q[11];
-u3(1.1828829071337754,-3.056807502480458,-2.05629966156146) q[11];
-u3(0.3901179311297074,-0.32334392426417313,1.0979718976659774) q[11];
-cx q[11],q[23];
-u3(1.0339345430901232,-pi/2,-pi/2) q[11];
-u3(0.9580298769955913,-0.6181978031144868,-0.6800165385358916) q[23];
-cx q[11],q[23];
-u3(0.2529209193991585,-pi,-pi/2) q[11];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[23];
-cx q[11],q[23];
-u3(0.7131194472000758,2.7852184036869065,0.5860965934140552) q[11];
-u3(1.7865063056993402,0.150877296375167,-2.9327290987263757) q[11];
-cx q[1],q[11];
-u3(1.0127275150886235,-pi/2,-pi/2) q[1];
-u3(0.8587238049529808,-0.49357291045532525,-0.8819733055958494) q[11];
-cx q[1],q[11];
-u3(0.2732154790653097,0,pi/2) q[1];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[11];
-cx q[1],q[11];
-u3(1.0993658736942362,0.7066984490820989,2.1061173612258166) q[1];
-u3(2.921124742435977,2.6060515555470127,1.5520397518739406) q[1];
-u3(2.853336362179242,0.9479432884609711,-2.723616372875088) q[11];
-u3(1.8824404263614165,-2.693457077850824,1.8467664591316089) q[11];
-u3(1.5970340973002919,-1.7358727562781358,1.4396732529955072) q[23];
-u3(0.5969068422922746,-2.1711677567356285,0.062084391717452725) q[23];
-cx q[12],q[23];
-u3(0.9514554571701621,-pi/2,-pi/2) q[12];
-u3(0.9709395161968906,-0.6306211571305007,-0.6582161136234213) q[23];
-cx q[12],q[23];
-u3(0.22121204608486505,-pi,-pi/2) q[12];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[23];
-cx q[12],q[23];
-u3(1.00261872250327,3.0913590494463143,1.6274330162872452) q[12];
-u3(0.8060355142625434,-1.683246561039913,2.176614853706595) q[12];
-cx q[14],q[12];
-u3(0.9107824785821902,-0.5663090255894478,-0.7672676916158405) q[12];
-u3(0.5547273592669056,-pi/2,-pi/2) q[14];
-cx q[14],q[12];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[12];
-u3(0.12076214316578439,0,pi/2) q[14];
-cx q[14],q[12];
-u3(1.0082319239151094,2.8312058870045522,-2.756493085462217) q[12];
-u3(0.40262041594912773,2.828002592013327,-0.8967102246943499) q[12];
-u3(0.4313240254546597,-0.7750243113272575,0.05448190594373248) q[14];
-u3(0.3519831687184682,-2.5274395349230634,0.7700684147248738) q[14];
-u3(1.2480464765319972,1.3877509574750198,0.5500191997597623) q[23];
-u3(1.1946836915041041,-1.1348042862167822,-2.9965434397195043) q[23];
-cx q[23],q[2];
-u3(0.8831567975140896,-0.5301894969353063,-0.8251379413590065) q[2];
-u3(1.0773467978363922,-pi/2,-pi/2) q[23];
-cx q[23],q[2];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[2];
-u3(0.6458338174741368,-pi,-pi/2) q[23];
-cx q[23],q[2];
-u3(2.566807902358702,-0.2204905515729232,-1.4369584626111127) q[2];
-u3(1.4031213850382358,1.1226667923444502,3.120980156921517) q[2];
-u3(1.146299455685569,-2.4187625511810986,2.756304373591723) q[23];
-u3(2.2102306408004977,-1.8606623847672445,2.3275475452057792) q[23];
-u3(1.9330141231415308,1.042976563506386,-0.9637307527278511) q[26];
-u3(1.4489439856826973,1.2927233777999918,-0.1792075986609607) q[26];
-cx q[28],q[11];
-u3(0.9285603417875866,-0.5871336483119536,-0.7329117469129507) q[11];
-u3(0.837700340828648,-pi/2,-pi/2) q[28];
-cx q[28],q[11];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[11];
-u3(0.024237402089932046,-pi,-pi/2) q[28];
-cx q[28],q[11];
-u3(2.5316625266837787,-1.1998873662826517,-1.2463413858918155) q[11];
-u3(1.47937565282471,-0.3783995381041336,-1.7742058239529133) q[11];
-cx q[22],q[11];
-u3(0.8877472087556062,-0.536545390820836,-0.8150961539871506) q[11];
-u3(0.7843964749224657,-pi/2,-pi/2) q[22];
-cx q[22],q[11];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[11];
-u3(0.13679403731119794,0,pi/2) q[22];
-cx q[22],q[11];
-u3(1.8612300438644915,0.5483617222108093,0.964346210536406) q[11];
-u3(1.5688151517562698,-1.1789709934289956,2.433684452103946) q[11];
-u3(1.4224524927269244,2.8547956257566884,-1.9964727328545013) q[22];
-u3(0.6298543226375233,2.12658383372798,1.3367010377626674) q[22];
-u3(2.210395463156725,2.5908845234120825,-1.0699094394320445) q[28];
-u3(0.8845031284380758,1.56142680870152,2.0338886535872316) q[28];
-cx q[12],q[28];
-u3(0.4859200543344681,-pi/2,-pi/2) q[12];
-u3(0.7460011189366317,-0.1887202713580609,-1.3163685634768907) q[28];
-cx q[12],q[28];
-u3(0.04048592831486561,0,pi/2) q[12];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[28];
-cx q[12],q[28];
-u3(2.750728604166196,0.8882694226272001,-2.872149295509433) q[12];
-u3(1.642386311662898,2.0550577620555615,0.2809223552751239) q[12];
-u3(2.2607099486126563,1.8063095078009495,1.209934737188318) q[28];
-u3(2.1952926279348968,0.4527567122943048,-2.8147665488721785) q[28];
-cx q[5],q[26];
-u3(0.8092431710033213,-0.3999106585703176,-1.0211999643979368) q[26];
-u3(1.1273714720390982,-pi/2,-pi/2) q[5];
-cx q[5],q[26];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[26];
-u3(0.17013394718129352,0,pi/2) q[5];
-cx q[5],q[26];
-u3(1.7559566930766022,-0.2670177954557902,1.7395481891586497) q[26];
-u3(0.14366720014288728,2.6028912203339356,1.6639264350517795) q[26];
-u3(0.31796797147563366,2.005149991848869,3.1056899800870355) q[5];
-u3(1.5143693871502606,-1.9623512383275106,-2.5024456527127272) q[5];
-cx q[29],q[5];
-u3(1.1067607593456434,-pi/2,-pi/2) q[29];
-u3(0.7927345006439774,-0.3598371994909302,-1.0787668614169146) q[5];
-cx q[29],q[5];
-u3(0.35863491685397636,0,pi/2) q[29];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[5];
-cx q[29],q[5];
-u3(0.7373042734178731,0.9980852861274219,1.117528607729545) q[29];
-u3(1.5334456479750544,-2.6830719323125667,-2.9459368363756804) q[29];
-u3(0.848164714165858,-1.7825192755417194,-1.0604375480143382) q[5];
-u3(1.5702831380515958,1.8446804738197278,-1.5242665920336664) q[5];
-cx q[0],q[5];
-u3(0.9254319622616973,-pi/2,-pi/2) q[0];
-u3(0.9655295421545337,-0.625496089132477,-0.6672588673608342) q[5];
-cx q[0],q[5];
-u3(0.511180599674603,0,pi/2) q[0];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[5];
-cx q[0],q[5];
-u3(1.5379895757932023,0.9640183296295222,2.743098149835151) q[0];
-u3(1.8140050101079872,0.6003865982323102,1.5528530918557477) q[0];
-cx q[0],q[2];
-u3(0.9543436955190888,-pi/2,-pi/2) q[0];
-u3(0.8517229255529735,-0.4821039848667539,-0.8994547321066726) q[2];
-cx q[0],q[2];
-u3(0.1508864504695422,-pi,-pi/2) q[0];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[2];
-cx q[0],q[2];
-u3(0.8250109722660722,0.05978896592874072,-2.448963266576505) q[0];
-u3(1.0181301819839998,0.32418329909917354,-1.9519472235558615) q[0];
-u3(1.70304095174453,-0.9060521057229716,-1.7090443241164408) q[2];
-u3(1.4614369440401982,0.23733827119021322,-1.1439653458181331) q[2];
-u3(1.0113300643338843,-1.542388857944406,-2.5308382788516015) q[5];
-u3(2.958680735163666,2.305370583866752,-0.356892446431611) q[5];
-cx q[7],q[26];
-u3(0.7712796252108235,-0.29640355245770866,-1.1681382272651426) q[26];
-u3(0.7174409681097824,-pi/2,-pi/2) q[7];
-cx q[7],q[26];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[26];
-u3(0.5785136848786777,0,pi/2) q[7];
-cx q[7],q[26];
-u3(1.7100065015777905,0.5831382909176548,-1.593525640773933) q[26];
-u3(1.4126128300011198,2.7730581017457343,-2.864579468122801) q[26];
-u3(1.7991431667211513,-1.177196297827076,1.1577788520169454) q[7];
-u3(1.0694223506519736,1.4062876902203616,-0.9953594684418658) q[7];
-cx q[8],q[29];
-u3(0.8266180987946145,-0.43653681035584,-0.9676408686252511) q[29];
-u3(0.6845363459419971,-pi/2,-pi/2) q[8];
-cx q[8],q[29];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[29];
-u3(0.1428587548707903,0,pi/2) q[8];
-cx q[8],q[29];
-u3(2.0328118348863238,2.8995074874128193,0.20756346481896149) q[29];
-u3(0.7408588855734048,2.002642478049795,-2.5809478902258114) q[29];
-u3(0.10975777047670204,1.4557406795977936,2.504232771582873) q[8];
-u3(1.2924844656549441,1.8000403856272786,-2.6459722430382104) q[8];
-cx q[8],q[18];
-u3(0.9003160617720176,-0.5532046358008476,-0.7884970651851493) q[18];
-u3(0.5209317430970815,-pi/2,-pi/2) q[8];
-cx q[8],q[18];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[18];
-u3(0.2916927485518153,-pi,-pi/2) q[8];
-cx q[8],q[18];
-u3(2.5614714536146685,-2.0956235149226834,1.8045530965682932) q[18];
-u3(2.55522895880315,2.507112568474369,-1.005644542954657) q[18];
-u3(1.2353526636813144,2.9915402652325103,-0.3980498280396909) q[8];
-u3(1.278210055886697,-1.9688155030438144,-2.3207152160847744) q[8];
-cx q[8],q[0];
-u3(0.8137569091103904,-0.4099062424752917,-1.006680348655351) q[0];
-u3(0.3505022813809032,-pi/2,-pi/2) q[8];
-cx q[8],q[0];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[0];
-u3(0.006068818862291053,0,pi/2) q[8];
-cx q[8],q[0];
-u3(1.6467534229745744,1.3857084150366266,-0.6218148171723783) q[0];
-u3(0.7382316662209453,-2.2417052967285978,2.0569865092347497) q[0];
-u3(1.3292001451234812,2.7818457319866603,-0.12462890173835106) q[8];
-u3(0.20001315326236227,-2.694255047697027,-1.7319112036673077) q[8];
-u3(1.1338850539207095,0.6278992753967749,3.1340734081426076) q[9];
-u3(0.9574294065506532,0.36010370509533907,-1.731131085166865) q[9];
-cx q[9],q[25];
-u3(0.976706413581397,-0.6359602392257417,-0.6487184539402797) q[25];
-u3(0.7480847740490011,-pi/2,-pi/2) q[9];
-cx q[9],q[25];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[25];
-u3(0.05319644290350758,0,pi/2) q[9];
-cx q[9],q[25];
-u3(0.5798206862918458,-1.7437158112327409,1.5037487325313208) q[25];
-u3(1.0546402249827405,1.7126075289494427,-2.0902985100921345) q[25];
-cx q[10],q[25];
-u3(0.9957765097256509,-pi/2,-pi/2) q[10];
-u3(0.9605821168794585,-0.6207072958545945,-0.6756452811620832) q[25];
-cx q[10],q[25];
-u3(0.5459943869160424,-pi,-pi/2) q[10];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[25];
-cx q[10],q[25];
-u3(2.061751109448253,0.049187943737132755,1.5394061553210676) q[10];
-u3(2.193023752622446,0.2770595888938985,2.9574398259846104) q[10];
-cx q[10],q[20];
-u3(1.378902712252404,-pi/2,-pi/2) q[10];
-u3(0.9768655194745954,-0.6361057666724275,-0.6484584390593824) q[20];
-cx q[10],q[20];
-u3(0.7992995239928248,0,pi/2) q[10];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[20];
-cx q[10],q[20];
-u3(1.3419651744247543,2.656470540149213,2.105261681637481) q[10];
-u3(1.101268766657757,-2.9957171627567813,-0.9370594833105015) q[10];
-cx q[1],q[10];
-u3(0.9125204368059282,-pi/2,-pi/2) q[1];
-u3(0.8183835169971516,-0.4197860739635275,-0.9922592856887) q[10];
-cx q[1],q[10];
-u3(0.2626808658775965,-pi,-pi/2) q[1];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[10];
-cx q[1],q[10];
-u3(0.3987062290894324,-0.4708510653630942,2.3307443977749642) q[1];
-u3(1.4777663106516503,2.1723530128080997,-2.6553749435864757) q[1];
-u3(1.4107656246957538,2.9869496878070905,-2.9592551939076044) q[10];
-u3(1.3918778298989825,-1.608198948996133,2.4140484394439836) q[10];
-u3(2.3998893790539464,-1.3570417615880894,-0.49657579397300866) q[20];
-u3(1.4264749839169888,-1.0485187727217333,-1.6943805544432065) q[20];
-cx q[20],q[26];
-u3(0.7045017864069895,-pi/2,-pi/2) q[20];
-u3(0.89848439459233,-1.3496109499652822,-1.6536869302674688) q[25];
-u3(2.4932825563476277,1.0261868734303325,-2.8177834859932984) q[25];
-cx q[25],q[17];
-u3(0.7303376682115373,-0.03730726195433931,-1.5207346644382014) q[17];
-u3(0.6783444261831899,-pi/2,-pi/2) q[25];
-cx q[25],q[17];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[17];
-u3(0.162745310296119,-pi,-pi/2) q[25];
-cx q[25],q[17];
-u3(1.0316089444444785,-2.163339928650309,0.49283192950261867) q[17];
-u3(1.6792141028113385,-1.3349925756693957,-1.4525774902691937) q[17];
-cx q[17],q[7];
-u3(0.7171365340015148,-pi/2,-pi/2) q[17];
-u3(0.12290616818345718,1.8847275350837478,2.4565591981155306) q[25];
-u3(1.8449439956776377,-1.5398119329968445,0.31798823149137023) q[25];
-cx q[25],q[4];
-u3(0.6617473095293389,-pi/2,-pi/2) q[25];
-u3(0.8788055443206345,-0.5240216798148625,-0.8348296855856958) q[26];
-cx q[20],q[26];
-u3(0.499487227912331,0,pi/2) q[20];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[26];
-cx q[20],q[26];
-u3(1.819117560288525,-1.3667223344940116,1.7251746944239033) q[20];
-u3(1.5989914263555733,1.5733664127299516,-2.429784980911153) q[20];
-u3(2.2831693418546974,-1.5175291846892427,-1.9905007957915473) q[26];
-u3(0.256953358254802,-3.106717781776428,2.1130386702474) q[26];
-cx q[23],q[26];
-u3(0.6196243034130108,-pi/2,-pi/2) q[23];
-u3(0.818178928385639,-0.4193566293653159,-0.9928876091969663) q[26];
-cx q[23],q[26];
-u3(0.1241720283951671,0,pi/2) q[23];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[26];
-cx q[23],q[26];
-u3(0.25259363896371984,2.762697950516526,2.5412919820194473) q[23];
-u3(2.9833623086461607,-0.8745032000835247,-3.0025758781396226) q[23];
-u3(2.2027055061240812,1.3423481339200398,-0.3965473438087601) q[26];
-u3(1.2332575859672656,-0.46491642579975867,-0.9759034532953867) q[26];
-u3(0.7956423598726028,-0.3673460130792354,-1.068053270282805) q[4];
-cx q[25],q[4];
-u3(0.11178177469982813,-pi,-pi/2) q[25];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[4];
-cx q[25],q[4];
-u3(1.6451251674828222,-1.784502090955442,0.6193034148749827) q[25];
-u3(2.4111129434214047,1.292281527224481,2.3267380935808113) q[25];
-u3(2.1542280813370125,-0.983353702212197,2.619602694795666) q[4];
-u3(2.7949917622628955,1.1324832891224341,1.933415853569171) q[4];
-cx q[13],q[4];
-u3(0.7933467902496892,-pi/2,-pi/2) q[13];
-u3(0.9061463803153671,-0.5605862292706449,-0.776573629874969) q[4];
-cx q[13],q[4];
-u3(0.3297792825853334,0,pi/2) q[13];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[4];
-cx q[13],q[4];
-u3(1.5215773726339297,0.04258283029648302,2.86145987490434) q[13];
-u3(2.194046424805698,2.6977124166316875,-1.919383096105082) q[13];
-u3(1.60067848773065,0.3877118448929764,-0.14839143880221117) q[4];
-u3(0.51212936313912,-1.7999995697151523,-2.8615656223390005) q[4];
-cx q[5],q[1];
-u3(0.776271917846272,-0.31266019483643426,-1.1454110216105544) q[1];
-u3(0.8872170075346515,-pi/2,-pi/2) q[5];
-cx q[5],q[1];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[1];
-u3(0.5737240168168828,0,pi/2) q[5];
-cx q[5],q[1];
-u3(2.2205160367779797,-0.6663188414315275,-1.7743690339750398) q[1];
-u3(2.642474866087146,1.883779957723938,-2.9600545205451763) q[1];
-cx q[4],q[1];
-u3(0.9374973387024603,-0.5969814173112238,-0.7163724930002733) q[1];
-u3(0.34373644912376694,-pi/2,-pi/2) q[4];
-cx q[4],q[1];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[1];
-u3(0.14061285491294473,-pi,-pi/2) q[4];
-cx q[4],q[1];
-u3(1.7540228121517483,-0.8746983957608396,-1.3869750773803147) q[1];
-u3(0.853422039339564,-3.0973887811561345,-2.7709936768813797) q[1];
-u3(1.0845175048049638,2.242075773879349,-1.2766077810803447) q[4];
-u3(2.606158593010362,-0.9525980534243992,2.1829308493316404) q[4];
-u3(1.3829029172160134,0.9643972694866942,3.016282608096758) q[5];
-u3(2.2820874881407343,0.4820487917663332,0.6755892346817207) q[5];
-u3(0.8916277807473341,-0.5418022036632917,-0.8067474774924932) q[7];
-cx q[17],q[7];
-u3(0.234681927711746,0,pi/2) q[17];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[7];
-cx q[17],q[7];
-u3(1.9096023470307317,1.6430187529278744,0.4355037034432203) q[17];
-u3(0.7323606250657805,2.9575758101886525,1.991630155351145) q[17];
-cx q[17],q[3];
-u3(1.1049527296641963,-pi/2,-pi/2) q[17];
-u3(0.94886422825957,-0.608958537687748,-0.6959768511782283) q[3];
-cx q[17],q[3];
-u3(0.19191130618964333,-pi,-pi/2) q[17];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[3];
-cx q[17],q[3];
-u3(2.5937665910531917,-0.9121766898728274,-2.1370478063787672) q[17];
-u3(2.258865343601355,0.17834560257356147,0.2842381879928446) q[17];
-u3(1.1719398294693646,-1.2303144956400889,-0.6263582843359514) q[3];
-u3(1.63784215096953,-3.1355372011140896,-0.7639270409096373) q[3];
-cx q[26],q[3];
-u3(0.54310122401557,-pi/2,-pi/2) q[26];
-u3(0.8729247034046481,-0.5154538883839885,-0.848209730590753) q[3];
-cx q[26],q[3];
-u3(0.010406448625939872,0,pi/2) q[26];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[3];
-cx q[26],q[3];
-u3(0.9404829342961428,-1.0316444440365937,-2.149475811430099) q[26];
-u3(2.4350551388402106,-1.6873358039420783,2.0353397409904384) q[26];
-u3(1.986810954561825,-3.079805264369856,-2.314079174427856) q[3];
-u3(0.5057161960656568,1.2402609827799118,0.267230767453579) q[3];
-u3(1.7425625479272089,0.07604547634311576,-1.6465251342380043) q[7];
-u3(0.6303326605491231,1.7426646907954355,-0.29237153553812956) q[7];
-cx q[7],q[10];
-u3(0.8637893636495381,-0.5015814543227854,-0.8696806752005717) q[10];
-u3(0.7919694919865813,-pi/2,-pi/2) q[7];
-cx q[7],q[10];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[10];
-u3(0.08098705566300678,-pi,-pi/2) q[7];
-cx q[7],q[10];
-u3(1.1431339042709843,-1.9224724477128738,-2.310030693572232) q[10];
-u3(1.7663197852492167,-2.9999077445479454,-2.153798946358804) q[10];
-cx q[10],q[5];
-u3(0.8499966772438425,-pi/2,-pi/2) q[10];
-u3(0.800067016282177,-0.3783791907745626,-1.0522521575643342) q[5];
-cx q[10],q[5];
-u3(0.4123584093615694,-pi,-pi/2) q[10];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[5];
-cx q[10],q[5];
-u3(1.7862280633162657,-0.07929370696325488,-2.9099201018149667) q[10];
-u3(2.4225800390155396,-0.2553658051758987,0.049657220898547294) q[10];
-cx q[4],q[10];
-u3(0.9134505172300263,-0.5695455199915709,-0.7619799486049583) q[10];
-u3(1.1317490861618145,-pi/2,-pi/2) q[4];
-cx q[4],q[10];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[10];
-u3(0.2943260215584494,0,pi/2) q[4];
-cx q[4],q[10];
-u3(1.3923321302883345,1.1741169120167934,0.33378691941601435) q[10];
-u3(1.470993592390566,-0.18743133506883236,-2.7937591181259913) q[10];
-u3(0.9646615463961767,-0.09873538384480218,-2.3542038300108574) q[4];
-u3(1.6310056764708765,1.6356380431369733,-1.8461986629009255) q[4];
-u3(1.363429326605234,-2.6615163692818937,2.2426347451049233) q[5];
-u3(1.77425936920453,-0.596112976181189,2.430313962204681) q[5];
-u3(1.962712344297409,1.7666661166811233,-2.183358003894881) q[7];
-u3(1.8515098211490937,-0.855406627573954,-1.3230304186299071) q[7];
-cx q[22],q[7];
-u3(0.6496898397096303,-pi/2,-pi/2) q[22];
-u3(0.7297860786701296,-0.012632815337061842,-1.5538474621788243) q[7];
-cx q[22],q[7];
-u3(0.3227154138857428,-pi,-pi/2) q[22];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[7];
-cx q[22],q[7];
-u3(0.44997948031525,1.2310192136742089,-1.89379714096488) q[22];
-u3(0.8756501893440891,-2.0738338121405846,1.6747967886124657) q[22];
-u3(1.43390537365216,-0.7331697878049432,-0.05812040687860209) q[7];
-u3(2.034086185526125,0.036620111846460635,-2.1875584980755107) q[7];
-u3(1.3227760490779363,-1.5222756282400516,0.28021559075731073) q[9];
-u3(2.071467071077404,1.9418708977807224,-1.5284783053978968) q[9];
-cx q[9],q[21];
-u3(0.747493046993511,-0.19697505049935193,-1.3051208311832632) q[21];
-u3(0.6261342039609052,-pi/2,-pi/2) q[9];
-cx q[9],q[21];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[21];
-u3(0.17805913586879088,-pi,-pi/2) q[9];
-cx q[9],q[21];
-u3(1.7404874111045245,-0.13109906584567677,-1.2739007370067306) q[21];
-u3(0.40746888486152455,1.2457983710146685,-1.5895916094559848) q[21];
-cx q[19],q[21];
-u3(0.6601061705486292,-pi/2,-pi/2) q[19];
-u3(0.9556412221848162,-0.6158245550469528,-0.6841359716285371) q[21];
-cx q[19],q[21];
-u3(0.039594274726125284,-pi,-pi/2) q[19];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[21];
-cx q[19],q[21];
-u3(1.080151711520588,3.0451437262152776,-1.9148706154822732) q[19];
-u3(1.0443410640921502,2.7653393153056642,-2.815735232671897) q[19];
-cx q[19],q[30];
-u3(0.8858293302677429,-pi/2,-pi/2) q[19];
-u3(1.0576642261986104,1.3082574585995346,-2.7792767435963377) q[21];
-u3(2.1269512786319043,-2.5593136099836897,0.2870700778902773) q[21];
-u3(0.776371360893918,-0.3129732855274474,-1.1449722092738597) q[30];
-cx q[19],q[30];
-u3(0.23570046307785106,-pi,-pi/2) q[19];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[30];
-cx q[19],q[30];
-u3(1.2948511750936196,1.7248527468335393,-1.4092486130899489) q[19];
-u3(2.4298247265823014,2.7896399958215685,1.7779351326760775) q[19];
-cx q[20],q[19];
-u3(0.7472722971875767,-0.19577767791119838,-1.3067533066102826) q[19];
-u3(0.9757122617926224,-pi/2,-pi/2) q[20];
-cx q[20],q[19];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[19];
-u3(0.29724248200431425,-pi,-pi/2) q[20];
-cx q[20],q[19];
-u3(1.8930298197614075,2.9432715528544193,2.946534715181869) q[19];
-u3(0.6575127269313826,0.7990227443194255,-0.7149984851181546) q[19];
-cx q[19],q[2];
-u3(0.6610898827661431,-pi/2,-pi/2) q[19];
-u3(0.8270962412756104,-0.4374788454456775,-0.9662497778936157) q[2];
-cx q[19],q[2];
-u3(0.4160328322426386,-pi,-pi/2) q[19];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[2];
-cx q[19],q[2];
-u3(1.5673663736069448,-0.40546682203065654,-2.4888679960650646) q[19];
-u3(2.200690695236777,-0.4503089859350826,0.363042183362269) q[19];
-u3(1.704263436395995,0.11427150679700526,-1.9236563722971916) q[2];
-u3(1.2190706988115478,2.954582278857117,-2.3534204281210886) q[2];
-u3(0.29865603088983605,-1.6008087792720034,2.5149945839990453) q[20];
-u3(1.4016132114881166,-0.453649603044461,-0.1880366587876785) q[20];
-u3(2.036081031794139,2.033044045348955,2.7952356831035132) q[30];
-u3(2.1836179382009817,-2.5104673761963667,1.9394858086763422) q[30];
-cx q[25],q[30];
-u3(0.7338384307254824,-pi/2,-pi/2) q[25];
-u3(0.8389401277463865,-0.45984267963535785,-0.9330044576553753) q[30];
-cx q[25],q[30];
-u3(0.29111413193193486,-pi,-pi/2) q[25];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[30];
-cx q[25],q[30];
-u3(0.7499795330321712,1.3238696364863793,1.9208416294318331) q[25];
-u3(2.996716096460642,1.7424175247733977,-0.7498035952787347) q[25];
-cx q[25],q[17];
-u3(0.7877068361790966,-0.34632564074386885,-1.0979675526614692) q[17];
-u3(0.8402954510117465,-pi/2,-pi/2) q[25];
-cx q[25],q[17];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[17];
-u3(0.32143326685325574,-pi,-pi/2) q[25];
-cx q[25],q[17];
-u3(1.1302077309934275,-1.650373254671886,1.6782009306485595) q[17];
-u3(2.4317232789491614,-2.2224233682889523,-0.8343252896671465) q[17];
-u3(0.7010563906887821,1.9398692351947489,-0.025971245614473837) q[25];
-u3(0.489210215699232,-2.028505951889831,1.0154496280630791) q[25];
-cx q[26],q[17];
-u3(0.8981033560160913,-0.5503474479322876,-0.7930889177381335) q[17];
-u3(0.5886638077800513,-pi/2,-pi/2) q[26];
-cx q[26],q[17];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[17];
-u3(0.3529608467580851,-pi,-pi/2) q[26];
-cx q[26],q[17];
-u3(1.598903590842071,0.01940607092290625,1.1356992501815562) q[17];
-u3(0.9104481221720045,-2.883529680869051,2.9540086221194874) q[17];
-u3(1.0266384395711179,-0.12943370297342005,-1.7503792858794078) q[26];
-u3(2.2857465041046123,2.9040083872665763,-0.6633581636692183) q[26];
-u3(0.8139873470862816,-0.939442492675798,1.2834102702479413) q[30];
-u3(2.787185664068351,0.7469469228596592,2.1160177725999265) q[30];
-cx q[28],q[30];
-u3(0.916422852930071,-pi/2,-pi/2) q[28];
-u3(0.8389933479969826,-0.45993919109839476,-0.932860029552403) q[30];
-cx q[28],q[30];
-u3(0.13066534790742584,-pi,-pi/2) q[28];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[30];
-cx q[28],q[30];
-u3(0.6926574478896176,0.12579644214546892,2.3646900676824334) q[28];
-u3(1.3680325359911154,1.3580720737123304,1.7749719989989092) q[28];
-u3(1.066023330432219,2.8743143110377636,1.9081443211655538) q[30];
-u3(1.7445836607825542,0.13943660413527725,2.656339869992138) q[30];
-cx q[31],q[21];
-u3(0.9792263120519403,-0.6382540628756863,-0.6446128924103007) q[21];
-u3(1.0356704828129724,-pi/2,-pi/2) q[31];
-cx q[31],q[21];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[21];
-u3(0.4102782371823806,-pi,-pi/2) q[31];
-cx q[31],q[21];
-u3(1.2275745916504275,-2.4453584036088705,-2.6840725460594017) q[21];
-u3(1.6122071558273487,-0.746011202584258,-0.5486537782091427) q[21];
-cx q[21],q[16];
-u3(0.9530400691697581,-0.6132126916519658,-0.6886536095402747) q[16];
-u3(0.9456688576131768,-pi/2,-pi/2) q[21];
-cx q[21],q[16];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[16];
-u3(0.21246805796273932,0,pi/2) q[21];
-cx q[21],q[16];
-u3(0.361111090742611,1.231026946302773,-0.037772912876735454) q[16];
-u3(2.5466330332715,-0.10456590937930166,-0.036657541256277515) q[16];
-u3(1.4840866770250731,-2.198736596713796,-0.07077720778245311) q[21];
-u3(1.3799888990825724,0.8162656179726886,1.6477860237966429) q[21];
-cx q[21],q[12];
-u3(0.8885470761975035,-0.5376375030209664,-0.8133649807246037) q[12];
-u3(0.8106609749745736,-pi/2,-pi/2) q[21];
-cx q[21],q[12];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[12];
-u3(0.10297816944935974,0,pi/2) q[21];
-cx q[21],q[12];
-u3(2.5315302883859276,1.895217079092161,-0.7880432786147336) q[12];
-u3(1.8197332640039436,2.6063666699608863,-1.371869490681386) q[12];
-cx q[2],q[12];
-u3(0.7543167132794293,-0.23064519965174313,-1.2590690143385839) q[12];
-u3(0.6660376871304939,-pi/2,-pi/2) q[2];
-cx q[2],q[12];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[12];
-u3(0.3589913658506971,0,pi/2) q[2];
-cx q[2],q[12];
-u3(1.3790707427794309,-1.7635652328470588,-0.03767270802383038) q[12];
-u3(2.2083269088461415,2.2258340524351574,-2.915669692158871) q[12];
-u3(1.67006964795859,-2.128395567652785,-1.4862825856385915) q[2];
-u3(0.114879188179605,2.807154648821883,-1.587328079307298) q[2];
-u3(2.1657621983453317,-1.0733887039391452,-2.601597517542851) q[21];
-u3(0.7306270235327876,-3.028505446562348,-2.5014186833997405) q[21];
-cx q[19],q[21];
-u3(1.2059231042411167,-pi/2,-pi/2) q[19];
-u3(0.8803275303052855,-0.5261952659428641,-0.8314200623537751) q[21];
-cx q[19],q[21];
-u3(0.06849809148602035,-pi,-pi/2) q[19];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[21];
-cx q[19],q[21];
-u3(0.8491171591700664,-1.7175255742042916,2.918739116433593) q[19];
-u3(2.194269621507799,0.5782362281491302,0.5645473669415568) q[19];
-u3(1.4089843278284162,-2.104070583569136,2.3969146662999403) q[21];
-u3(1.7063072916275126,-1.0557953842482752,-0.49171403210458386) q[21];
-u3(1.1451766022148313,-1.787466990396958,-0.3683942506273379) q[31];
-u3(1.2935319591454089,1.2348663498131591,-2.6676332902929967) q[31];
-cx q[31],q[14];
-u3(0.9106877388233057,-0.5661933449454821,-0.7674563530748344) q[14];
-u3(0.6830012170569773,-pi/2,-pi/2) q[31];
-cx q[31],q[14];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[14];
-u3(0.02679003130540751,0,pi/2) q[31];
-cx q[31],q[14];
-u3(1.3170693652307908,-1.21168977331149,-1.427822702564594) q[14];
-u3(2.462492514084338,0.056171183809700764,2.456987308150417) q[14];
-cx q[18],q[14];
-u3(0.8152358295250784,-0.41310329530464873,-1.0020215221972268) q[14];
-u3(0.6545170312740037,-pi/2,-pi/2) q[18];
-cx q[18],q[14];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[14];
-u3(0.11652013881106517,-pi,-pi/2) q[18];
-cx q[18],q[14];
-u3(1.2847328419616781,-0.8008248412471977,-0.7001193673967689) q[14];
-u3(0.36276113578803043,2.9697766516942536,-0.03260091149231492) q[14];
-u3(1.0227562603640343,-2.2963669108476523,1.2695604759811374) q[18];
-u3(1.083768640371864,-0.14360140161927903,-2.840168237994048) q[18];
-u3(0.8362108215843963,-0.3950816469563545,2.9717664828344574) q[31];
-u3(0.6913223241062078,0.5534977343800476,-3.068950359973682) q[31];
-cx q[5],q[28];
-u3(0.9424767837080669,-0.6023013492564377,-0.7073526461002402) q[28];
-u3(0.2717309510266503,-pi/2,-pi/2) q[5];
-cx q[5],q[28];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[28];
-u3(0.0569578038540371,-pi,-pi/2) q[5];
-cx q[5],q[28];
-u3(1.1361455326745373,1.2684218332989587,1.6911102877051043) q[28];
-u3(1.0852046028829252,-0.41520066476055506,-1.8591054624275203) q[28];
-cx q[2],q[28];
-u3(0.6356592723137466,-pi/2,-pi/2) q[2];
-u3(0.7335541111432339,-0.092412893553381,-1.4466707618523316) q[28];
-cx q[2],q[28];
-u3(0.045964766305330994,-pi,-pi/2) q[2];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[28];
-cx q[2],q[28];
-u3(0.6828237417378008,1.553509446757686,-0.8201812918020037) q[2];
-u3(1.0364061952004469,-2.291798451800771,-1.3477486542140558) q[2];
-u3(1.429710367288842,-0.520392424235915,-2.100774970155874) q[28];
-u3(1.7199802320428523,0.22220241891190184,-1.0976375708154795) q[28];
-u3(1.2489552786190115,-1.3763890298234052,2.4573337412480303) q[5];
-u3(2.0769292552301564,1.2825884236511271,1.0681598467524713) q[5];
-cx q[5],q[21];
-u3(0.801500467129145,-0.3818581161792025,-1.0472547440800888) q[21];
-u3(0.7551941939884556,-pi/2,-pi/2) q[5];
-cx q[5],q[21];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[21];
-u3(0.05576154346752,-pi,-pi/2) q[5];
-cx q[5],q[21];
-u3(2.7005220712854006,0.3185993470879138,-2.8568879987919438) q[21];
-u3(2.03982083755133,-0.09072861599018234,1.4483550853273375) q[21];
-u3(1.9875484807382495,-1.5449335473748087,-0.9410005678467384) q[5];
-u3(1.4862392466086214,1.4277211052776781,-2.0982460372346043) q[5];
-cx q[7],q[25];
-u3(0.7740542605852208,-0.3055723868520386,-1.1553336123931839) q[25];
-u3(0.7310812395731134,-pi/2,-pi/2) q[7];
-cx q[7],q[25];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[25];
-u3(0.3610243406464957,-pi,-pi/2) q[7];
-cx q[7],q[25];
-u3(1.5911452157338462,-0.8853684463701512,-2.527130847331618) q[25];
-u3(1.0317647793219495,-2.3552367237158123,0.18978392088396623) q[25];
-u3(2.490378167777692,1.1005350554048592,1.2884410008088132) q[7];
-u3(1.4096638560239036,1.9776761035771413,1.5984050784440011) q[7];
-cx q[7],q[10];
-u3(0.8585568239411346,-0.4933048768294861,-0.8823834770396157) q[10];
-u3(1.0430930321139036,-pi/2,-pi/2) q[7];
-cx q[7],q[10];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[10];
-u3(0.06424685303074722,0,pi/2) q[7];
-cx q[7],q[10];
-u3(1.333507454704426,-1.4983678299204155,1.7012233215928898) q[10];
-u3(2.118490187042423,-1.8518420160469233,-1.859314025593568) q[10];
-u3(2.6165219955750088,-0.9795757637917122,0.6485579756228921) q[7];
-u3(1.1024879833950312,-0.6619603077734948,-0.8155564220017593) q[7];
-u3(0.888974738727483,1.852799531895716,1.0378202615175436) q[9];
-u3(1.6292393189021732,0.3771274173412489,1.4394183591917873) q[9];
-cx q[9],q[24];
-u3(0.8423897423044711,-0.46602954077408265,-0.9237284030560833) q[24];
-u3(1.0075943790733382,-pi/2,-pi/2) q[9];
-cx q[9],q[24];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[24];
-u3(0.09459702363623303,0,pi/2) q[9];
-cx q[9],q[24];
-u3(1.8534856807004059,-0.537677208105829,-0.8685654326087935) q[24];
-u3(1.6668905418569842,2.5984140152679673,-1.8292437507226724) q[24];
-cx q[24],q[15];
-u3(0.9608870478856372,-0.6210053234011932,-0.6751250889122211) q[15];
-u3(0.3052112302030512,-pi/2,-pi/2) q[24];
-cx q[24],q[15];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[15];
-u3(0.020337136912064537,-pi,-pi/2) q[24];
-cx q[24],q[15];
-u3(1.6752962777885951,-0.1578349533256831,1.4856680961498743) q[15];
-u3(1.7017539493912126,-3.0756901364849254,-0.37147094403368275) q[15];
-u3(1.1407704092947117,-2.3387805849945416,0.1908225264542418) q[24];
-u3(1.47937565282471,-0.3783995381041336,-1.7742058239529133) q[24];
-cx q[27],q[15];
-u3(0.7490161167922048,-0.20502710855109996,-1.2941339769791789) q[15];
-u3(0.8274952738317602,-pi/2,-pi/2) q[27];
-cx q[27],q[15];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[15];
-u3(0.04173857015740735,-pi,-pi/2) q[27];
-cx q[27],q[15];
-u3(2.1536297374157463,1.2191794802284255,1.1667751023612931) q[15];
-u3(2.091000120789811,-1.5276896581575454,-0.11879243911006832) q[15];
-cx q[15],q[11];
-u3(0.9098211062113555,-0.5651327276199187,-0.7691850238319642) q[11];
-u3(1.337710947424499,-pi/2,-pi/2) q[15];
-cx q[15],q[11];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[11];
-u3(0.8347134705218127,0,pi/2) q[15];
-cx q[15],q[11];
-u3(0.815888818464578,0.11143673495387452,3.0137904135173557) q[11];
-u3(1.6579509804809744,0.48371136901428624,0.9324009258949681) q[11];
-cx q[11],q[22];
-u3(1.1713962304705157,-pi/2,-pi/2) q[11];
-u3(1.7800716381824475,0.7973227499279387,-2.1863291460530077) q[15];
-u3(1.5251879923925513,-0.08414389667947608,1.0064311278733724) q[15];
-cx q[15],q[14];
-u3(0.8929544529510296,-0.5435756559876626,-0.8039218458632043) q[14];
-u3(0.890472810088654,-pi/2,-pi/2) q[15];
-cx q[15],q[14];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[14];
-u3(0.28043870133369475,0,pi/2) q[15];
-cx q[15],q[14];
-u3(1.984137925506197,-1.5549140029804884,0.4773427895506388) q[14];
-u3(2.1901992212433874,-3.0159831773894488,-1.7195214932044744) q[14];
-u3(2.1749972432224793,-0.43667041056671296,-2.2764559770467194) q[15];
-u3(0.8097949771937839,0.10625473967679877,-2.154151302985114) q[15];
-u3(0.836138864410208,-0.4547145374753305,-0.9406664581149684) q[22];
-cx q[11],q[22];
-u3(0.7048149267501235,-pi,-pi/2) q[11];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[22];
-cx q[11],q[22];
-u3(1.7665151504952836,-0.5248182390893348,-3.0616863505358882) q[11];
-u3(1.4759405120750542,-0.014770195565336763,-0.37379013604470046) q[11];
-u3(1.8230501419906842,-1.0387356447066214,-1.6589668334483851) q[22];
-u3(2.3211816105080776,2.548495728438918,2.8843164175259517) q[22];
-u3(1.3435683999819106,1.6510505865232021,-2.94695579670954) q[27];
-u3(1.8500535789886756,2.7774946871384447,2.9366827789535375) q[27];
-cx q[29],q[24];
-u3(0.8877472087556062,-0.536545390820836,-0.8150961539871506) q[24];
-u3(0.7843964749224657,-pi/2,-pi/2) q[29];
-cx q[29],q[24];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[24];
-u3(0.13679403731119794,0,pi/2) q[29];
-cx q[29],q[24];
-u3(1.8612300438644915,0.5483617222108093,0.964346210536406) q[24];
-u3(1.8760885347994654,1.6303057695538188,-1.1471942357247105) q[24];
-cx q[24],q[20];
-u3(0.854772913754408,-0.4871595976322758,-0.8917660803893188) q[20];
-u3(0.42651254437947783,-pi/2,-pi/2) q[24];
-cx q[24],q[20];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[20];
-u3(0.24126060742475935,0,pi/2) q[24];
-cx q[24],q[20];
-u3(2.5922489153835433,0.09009317783925619,1.8028560661265685) q[20];
-u3(1.5794187136091238,-2.3735886151600116,0.3848865503116552) q[20];
-u3(1.4341004286237122,-0.45605217129660947,-0.1414471713922203) q[24];
-u3(1.344353999302598,1.1797422935979434,0.3862331227718383) q[24];
-u3(1.4224524927269244,2.8547956257566884,-1.9964727328545013) q[29];
-u3(2.075268017061216,-0.238869061410226,1.0130024511671767) q[29];
-cx q[16],q[29];
-u3(0.8203941856496397,-pi/2,-pi/2) q[16];
-u3(0.8693265865404342,-0.5100743877602927,-0.8565633944176057) q[29];
-cx q[16],q[29];
-u3(0.29227965402808775,0,pi/2) q[16];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[29];
-cx q[16],q[29];
-u3(2.0393598621096913,-2.4272187733713433,-3.068976938930394) q[16];
-u3(0.3845491842913452,2.875803369655589,-1.518676794770602) q[16];
-cx q[16],q[1];
-u3(0.9549613736524768,-0.615144691507846,-0.6853135041494127) q[1];
-u3(0.6012200506357838,-pi/2,-pi/2) q[16];
-cx q[16],q[1];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[1];
-u3(0.2753619621598677,-pi,-pi/2) q[16];
-cx q[16],q[1];
-u3(2.688498321457216,1.7818405404218813,1.4530160212601295) q[1];
-u3(0.19334817004524643,-3.0481286137299612,-2.773492793663057) q[1];
-cx q[1],q[14];
-u3(0.9002164115764354,-pi/2,-pi/2) q[1];
-u3(0.8464149105307616,-0.47307742811172515,-0.9131170399676698) q[14];
-cx q[1],q[14];
-u3(0.5353655871074887,0,pi/2) q[1];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[14];
-cx q[1],q[14];
-u3(1.8213270544587696,-1.338944863201826,-2.3339351336479144) q[1];
-u3(1.8803530523576275,-1.0044735496475545,1.1266752092702355) q[1];
-u3(1.2236975902396414,0.011352723646361973,2.961243520401834) q[14];
-u3(0.6635575820841916,2.485198162101465,-0.84335164833481) q[14];
-u3(1.9000727775394775,-0.2486242340858813,0.34590858451268147) q[16];
-u3(1.781474841658028,0.3484000177447477,2.5360270438688888) q[16];
-cx q[16],q[26];
-u3(0.6422597301739519,-pi/2,-pi/2) q[16];
-u3(0.851582486932036,-0.4818689388484563,-0.8998115432954208) q[26];
-cx q[16],q[26];
-u3(0.2614235191762371,0,pi/2) q[16];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[26];
-cx q[16],q[26];
-u3(1.3688975083098642,2.6853647166797607,-1.5349198254943144) q[16];
-u3(1.9821360490163518,-2.655607656814247,2.5226671956360676) q[16];
-u3(0.848220907192899,2.5983228289736005,-1.2068897097436362) q[26];
-u3(1.1909741256510789,1.4531369626481485,0.7313886515047598) q[26];
-cx q[28],q[26];
-u3(0.7923697637197782,-0.35888009758591455,-1.0801301958385103) q[26];
-u3(0.7055896788433242,-pi/2,-pi/2) q[28];
-cx q[28],q[26];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[26];
-u3(0.35094770474940584,-pi,-pi/2) q[28];
-cx q[28],q[26];
-u3(1.5159362143703239,-2.6862843213167418,-0.2533872104018977) q[26];
-u3(1.0251429358149213,-2.904807381188879,2.7138756083762203) q[26];
-u3(1.1520593638617358,1.587168147266297,-0.2565510326710547) q[28];
-u3(0.698853716922938,2.5049231939996925,1.3410033309498681) q[28];
-u3(2.5216030213080267,-1.7065161749984838,-0.12298832316902741) q[29];
-u3(1.5264175706431318,-2.4745938712045237,-1.4668249707801913) q[29];
-cx q[3],q[29];
-u3(0.9218109733756615,-0.5794286193562144,-0.7457172865372321) q[29];
-u3(1.3702185883894804,-pi/2,-pi/2) q[3];
-cx q[3],q[29];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[29];
-u3(0.273228921104261,0,pi/2) q[3];
-cx q[3],q[29];
-u3(2.3966318351469673,2.3620553682045307,1.5934120690062432) q[29];
-u3(0.9207788597423964,0.8040246416491015,-1.3163901593522134) q[29];
-u3(0.7439914336737188,-2.3553605798550192,-1.4175491252747383) q[3];
-u3(2.0588969962015047,-0.7686890957764172,-1.723442588950129) q[3];
-cx q[31],q[27];
-u3(0.9167954716356725,-0.57354601123079,-0.7554184889260291) q[27];
-u3(1.0464187712923751,-pi/2,-pi/2) q[31];
-cx q[31],q[27];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[27];
-u3(0.12810703839161153,-pi,-pi/2) q[31];
-cx q[31],q[27];
-u3(1.621163225742175,0.7849158730342412,0.47699322436746083) q[27];
-u3(0.836432528236475,0.12069266367317688,2.468724006625732) q[27];
-cx q[0],q[27];
-u3(1.0601608124208535,-pi/2,-pi/2) q[0];
-u3(0.8912251807790484,-0.5412616548189888,-0.8076078090391263) q[27];
-cx q[0],q[27];
-u3(0.6882623409142596,0,pi/2) q[0];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[27];
-cx q[0],q[27];
-u3(2.5362865558374095,-1.9712059043389125,0.3359622304180312) q[0];
-u3(2.127337442172053,-3.0199264663749688,-1.4823093566477707) q[0];
-u3(0.5687237849563958,2.1212237374208947,-2.73481145060656) q[27];
-u3(0.778792634499191,0.573810691711726,2.5179194339872986) q[27];
-cx q[27],q[25];
-u3(0.9450783324677351,-0.6050350365131671,-0.7026934899836146) q[25];
-u3(0.8918083067818369,-pi/2,-pi/2) q[27];
-cx q[27],q[25];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[25];
-u3(0.38257317539832314,0,pi/2) q[27];
-cx q[27],q[25];
-u3(1.6767425128769538,0.2842828370768724,-0.6527447561774835) q[25];
-u3(0.9906787259124901,2.2377833456640204,-1.388919626731973) q[25];
-u3(0.04112940179055083,0.6333172120376362,-1.9692085323367028) q[27];
-u3(2.306024371584456,0.06259582592129886,2.292591836229221) q[27];
-cx q[29],q[0];
-u3(0.9517969292227744,-0.6119541769301504,-0.6908245314685804) q[0];
-u3(0.9423289861667814,-pi/2,-pi/2) q[29];
-cx q[29],q[0];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[0];
-u3(0.0775751867048078,0,pi/2) q[29];
-cx q[29],q[0];
-u3(2.719260933338091,-2.352597986867047,1.1460890512671655) q[0];
-u3(0.7306270235327876,-3.028505446562348,-2.5014186833997405) q[0];
-u3(2.1723060173668136,-0.5576845002079591,-1.2512198310903688) q[29];
-u3(3.052952151589036,1.4991065402280963,-1.1438821143959594) q[29];
-u3(0.5078589584069839,-0.4401915846609201,-0.48417449887069886) q[31];
-u3(1.2541904914238262,-0.37907557969416183,0.5830274468626744) q[31];
-cx q[8],q[31];
-u3(0.8710045485249127,-0.5125964057332779,-0.8526514737666044) q[31];
-u3(0.48373554277947844,-pi/2,-pi/2) q[8];
-cx q[8],q[31];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[31];
-u3(0.3243605019837163,-pi,-pi/2) q[8];
-cx q[8],q[31];
-u3(2.2686378871752506,-0.5647708514513003,2.414373653068745) q[31];
-u3(1.5873624511444775,2.606975587957507,1.2555801777240738) q[31];
-u3(2.2914781165642046,0.8097368866450623,-1.779495122325282) q[8];
-u3(2.187542641394061,-2.514536907596767,-0.8625160208242892) q[8];
-cx q[19],q[8];
-u3(0.6522220936186238,-pi/2,-pi/2) q[19];
-u3(0.7640393265635099,-0.2706591285480511,-1.2039152537959872) q[8];
-cx q[19],q[8];
-u3(0.23941472987699297,0,pi/2) q[19];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[8];
-cx q[19],q[8];
-u3(2.895934290220637,0.8576790864966988,2.362905055968956) q[19];
-u3(2.624550398449429,-0.2743827539417305,2.1221222108197404) q[19];
-u3(2.4588589295201277,1.5552427676635396,1.936786941516302) q[8];
-u3(0.37131848527992833,0.2311895275038771,2.381699902742149) q[8];
-cx q[8],q[14];
-u3(0.8905616754977257,-0.5403683816230958,-0.8090285950530713) q[14];
-u3(1.0522197609013766,-pi/2,-pi/2) q[8];
-cx q[8],q[14];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[14];
-u3(0.26378430643622,0,pi/2) q[8];
-cx q[8],q[14];
-u3(0.8970767894312404,1.778873748816908,3.039294650401981) q[14];
-u3(0.9417468850987485,-1.012345372106628,0.5394680676161911) q[14];
-u3(1.965132535213721,2.1799727796056425,-2.541990161096166) q[8];
-u3(1.2193805050511237,-1.5354982309015013,2.4958505264390736) q[8];
-u3(0.7284085523040928,2.8426292681276735,-1.1209297235467193) q[9];
-u3(2.6155120756502686,3.0488393948002095,2.8615024559995277) q[9];
-cx q[6],q[9];
-u3(0.8012387043327589,-pi/2,-pi/2) q[6];
-u3(0.790555850147598,-0.35406773011663084,-1.0869775473382965) q[9];
-cx q[6],q[9];
-u3(0.3650444439703462,0,pi/2) q[6];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[9];
-cx q[6],q[9];
-u3(2.160642363285156,-1.4371104237595054,1.0741708055023036) q[6];
-u3(0.937799136931252,-2.0711970745729347,3.1158632674134576) q[6];
-u3(2.285765790177171,2.965894259985909,-1.1078949131742597) q[9];
-u3(0.3756298487832267,2.1314189379438826,0.9007595468896135) q[9];
-cx q[6],q[9];
-u3(0.6616548336071426,-pi/2,-pi/2) q[6];
-u3(0.7309245839960997,-0.05197054905747667,-1.5010461661808359) q[9];
-cx q[6],q[9];
-u3(0.19497014589584646,0,pi/2) q[6];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[9];
-cx q[6],q[9];
-u3(0.6877321028849007,1.6457684804624595,-2.6457172499562223) q[6];
-u3(1.6145896621837217,-1.2124157899600458,1.0863490643273126) q[6];
-cx q[6],q[23];
-u3(0.8184103917837524,-0.41984243597530124,-0.9921768118236844) q[23];
-u3(0.9516344290336315,-pi/2,-pi/2) q[6];
-cx q[6],q[23];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[23];
-u3(0.4415862095374139,-pi,-pi/2) q[6];
-cx q[6],q[23];
-u3(0.416929450056479,0.27014459267582147,2.8939533927084033) q[23];
-u3(1.099838820671006,2.403538657491124,-2.1614282524912674) q[23];
-cx q[23],q[30];
-u3(0.8808155834716018,-pi/2,-pi/2) q[23];
-u3(0.8164398554761704,-0.41567880705466864,-0.9982630720274734) q[30];
-cx q[23],q[30];
-u3(0.02646183423769864,-pi,-pi/2) q[23];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[30];
-cx q[23],q[30];
-u3(0.5893813447672627,2.8631791135958657,1.855551629996131) q[23];
-u3(2.177795597233576,-1.278315980405706,-1.9024815284939134) q[23];
-cx q[23],q[4];
-u3(1.009903951148787,-pi/2,-pi/2) q[23];
-u3(1.048495665016148,-0.03364259570567496,1.0057564947182591) q[30];
-u3(1.3535984195071908,-1.01902251158418,-2.103654152435574) q[30];
-cx q[30],q[17];
-u3(0.7490823489334294,-0.2053693551845881,-1.2936666418465457) q[17];
-u3(0.7410806282135821,-pi/2,-pi/2) q[30];
-cx q[30],q[17];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[17];
-u3(0.40121553453250924,-pi,-pi/2) q[30];
-cx q[30],q[17];
-u3(2.172207639602261,3.0236844879221563,3.10086667382478) q[17];
-u3(2.4766699427467898,-0.524853935391123,-2.8760101452007603) q[17];
-cx q[16],q[17];
-u3(0.3393738421678407,-pi/2,-pi/2) q[16];
-u3(0.7313083178727562,-0.05962974186519121,-1.4907575311091144) q[17];
-cx q[16],q[17];
-u3(0.019861336500829746,0,pi/2) q[16];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[17];
-cx q[16],q[17];
-u3(1.5163596745276848,1.319483734555651,-2.439684057757024) q[16];
-u3(1.1709994615039792,-0.00514714214781975,-1.6436683387153757) q[16];
-u3(2.0701118073205884,2.477844203919088,-2.287257964649533) q[17];
-u3(2.733042692614301,0.5923603992642037,-2.5000355876019347) q[17];
-cx q[17],q[16];
-u3(0.8779029933400418,-0.522724354249581,-0.8368617769840618) q[16];
-u3(0.8829162513056794,-pi/2,-pi/2) q[17];
-cx q[17],q[16];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[16];
-u3(0.05953853319778417,-pi,-pi/2) q[17];
-cx q[17],q[16];
-u3(1.0046887140033849,2.2624735614469547,0.182702276453798) q[16];
-u3(1.4737517204772603,3.0545850116737574,-0.7683729127899168) q[16];
-u3(0.751575014330243,2.5232749663775964,-1.661912701112332) q[17];
-u3(0.4887017555253392,-1.1335760521631748,-2.4264528175115148) q[17];
-u3(0.9893029196475336,-0.9294115680006287,1.430970161514038) q[30];
-u3(0.11399019847417168,2.9418667501463354,-0.8226437084580409) q[30];
-u3(0.8330146595735061,-0.44888053518777093,-0.9493545445186324) q[4];
-cx q[23],q[4];
-u3(0.10424351070343699,-pi,-pi/2) q[23];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[4];
-cx q[23],q[4];
-u3(0.4958420134978105,-2.702412738991724,2.9220102431485007) q[23];
-u3(1.158427600529535,-1.7633448383717987,-2.795076025986015) q[23];
-cx q[25],q[23];
-u3(0.845445915438022,-0.4713971625011557,-0.915651242119532) q[23];
-u3(0.8982872515098482,-pi/2,-pi/2) q[25];
-cx q[25],q[23];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[23];
-u3(0.06624723182095398,-pi,-pi/2) q[25];
-cx q[25],q[23];
-u3(0.057463599538630485,2.057897447316564,-0.4058608041276859) q[23];
-u3(0.4978907717425876,0.9562207679189356,-1.1033334874669585) q[23];
-u3(1.052955288666946,0.8320699784392342,0.64553789150846) q[25];
-u3(1.5018708611951106,-1.9904532321199775,-0.9022801285341133) q[25];
-u3(1.7248141699807709,1.3657480702519837,0.2147565140335912) q[4];
-u3(2.0543645640447887,1.182639843770299,-1.4985184489598906) q[4];
-u3(1.614121756350328,-0.5281616115433234,2.719033456085935) q[6];
-u3(0.40492689238191587,2.0911069961850917,2.5232194201851534) q[6];
-cx q[24],q[6];
-u3(0.33013895661600084,-pi/2,-pi/2) q[24];
-u3(0.8726341723608594,-0.5150234694116094,-0.8488794352582758) q[6];
-cx q[24],q[6];
-u3(0.11303945812456308,0,pi/2) q[24];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[6];
-cx q[24],q[6];
-u3(1.540439648479896,-2.2855233022687944,-0.5974062826184743) q[24];
-u3(2.3780518155217716,-2.406338011377691,-2.447087201905052) q[24];
-cx q[31],q[24];
-u3(0.8900581454140869,-0.5396884614321174,-0.8101092550672035) q[24];
-u3(1.1766412742015218,-pi/2,-pi/2) q[31];
-cx q[31],q[24];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[24];
-u3(0.3859856700228247,0,pi/2) q[31];
-cx q[31],q[24];
-u3(1.9655736684880571,1.9268219112174645,0.25558211171476763) q[24];
-u3(1.0888490459470435,0.06345062196445195,0.2911203634591333) q[24];
-cx q[30],q[24];
-u3(0.796572050812283,-0.36970248089546853,-1.0646844542325429) q[24];
-u3(0.4765312547910905,-pi/2,-pi/2) q[30];
-cx q[30],q[24];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[24];
-u3(0.036790999924771056,-pi,-pi/2) q[30];
-cx q[30],q[24];
-u3(1.2729730147117284,0.1360894329089204,1.3172716774089341) q[24];
-u3(2.431887110796234,2.938877978750334,-1.2613373909707637) q[24];
-u3(2.683495486392455,1.1755717712313682,0.6721076846346339) q[30];
-u3(2.2057404100672278,0.1599435254949637,-0.9685376909845935) q[30];
-u3(2.3081592508715874,1.348022505205881,0.9235495360789159) q[31];
-u3(0.933800448670842,2.6986673344794303,1.7745243469975147) q[31];
-cx q[31],q[7];
-u3(0.708304991408972,-pi/2,-pi/2) q[31];
-u3(3.018332295212297,-2.4436595014595457,-2.511977154779858) q[6];
-u3(1.2252191401218455,-2.712928379182626,-1.7862788749895295) q[6];
-cx q[6],q[15];
-u3(0.8449377992367116,-0.47051196108275883,-0.9169852048009144) q[15];
-u3(0.8806975446921685,-pi/2,-pi/2) q[6];
-cx q[6],q[15];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[15];
-u3(0.12698301098704085,-pi,-pi/2) q[6];
-cx q[6],q[15];
-u3(1.119570279984606,1.4161921929073902,2.1296035773298083) q[15];
-u3(0.3901179311297074,-0.32334392426417313,1.0979718976659774) q[15];
-cx q[15],q[27];
-u3(1.0339345430901232,-pi/2,-pi/2) q[15];
-u3(0.9580298769955913,-0.6181978031144868,-0.6800165385358916) q[27];
-cx q[15],q[27];
-u3(0.2529209193991585,-pi,-pi/2) q[15];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[27];
-cx q[15],q[27];
-u3(0.7131194472000758,2.7852184036869065,0.5860965934140552) q[15];
-u3(0.6114247904318557,1.885344865977011,2.912817529582499) q[15];
-u3(1.5970340973002919,-1.7358727562781358,1.4396732529955072) q[27];
-u3(1.3429466068636036,-2.1743511723519138,0.7440548558988134) q[27];
-u3(1.2998931126467943,2.3325426060575163,-0.32129129025956527) q[6];
-u3(0.2829708400594975,-0.13930174924689798,-1.1883848751163892) q[6];
-cx q[6],q[19];
-u3(0.809203272999504,-0.3998206500078778,-1.021330400089635) q[19];
-u3(0.5473091432557278,-pi/2,-pi/2) q[6];
-cx q[6],q[19];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[19];
-u3(0.11754103734826428,0,pi/2) q[6];
-cx q[6],q[19];
-u3(2.2786893772969354,-2.800368379487421,1.0134923748690632) q[19];
-u3(2.6057792695829862,-1.2115696223773966,-2.281638970666021) q[19];
-u3(0.8548009387461422,-2.0867276428291426,1.6906128236526783) q[6];
-u3(1.3280566042142925,1.8355277245259582,0.0750355829836935) q[6];
-u3(0.7349224373047633,-0.10752680557424599,-1.42631129476462) q[7];
-cx q[31],q[7];
-u3(0.033933522546994985,-pi,-pi/2) q[31];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[7];
-cx q[31],q[7];
-u3(1.3691185365323184,-3.026535088803027,0.11238278866593365) q[31];
-u3(0.97846498120101,0.06412497510416415,-1.1018100651644378) q[31];
-cx q[6],q[31];
-u3(0.9603689881054043,-0.6204987656615968,-0.6760091254242226) q[31];
-u3(0.8945403755533486,-pi/2,-pi/2) q[6];
-cx q[6],q[31];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[31];
-u3(0.6195201416440872,-pi,-pi/2) q[6];
-cx q[6],q[31];
-u3(1.4016627004119306,0.023791959144805475,-2.6252061440423082) q[31];
-u3(2.1187330318994704,-2.2892360389222173,1.1317635387597926) q[31];
-u3(0.7706980716498446,-1.942346768971068,1.9978252210037537) q[6];
-u3(0.5887954479881625,-1.836331397916469,0.7008032635117716) q[6];
-u3(1.293857587032339,-2.815099092441071,3.0168425152511293) q[7];
-u3(1.2924844656549441,1.8000403856272786,-2.6459722430382104) q[7];
-u3(1.6838008477119442,-2.813736835679467,-0.03917682060946426) q[9];
-u3(2.2136344518865956,0.020557115927458902,0.6090572580225366) q[9];
-cx q[13],q[9];
-u3(0.6302209295582101,-pi/2,-pi/2) q[13];
-u3(0.8027880344532474,-0.38494504154961007,-1.0428141960162272) q[9];
-cx q[13],q[9];
-u3(0.10518849917497188,0,pi/2) q[13];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[9];
-cx q[13],q[9];
-u3(0.6186369672217111,-2.3184878209329716,-2.113175846565941) q[13];
-u3(1.0250793735921664,-1.3122905730140695,2.7771523690765623) q[13];
-cx q[20],q[13];
-u3(0.7585466274020063,-0.24897622094829241,-1.233865132760549) q[13];
-u3(0.9190720841820975,-pi/2,-pi/2) q[20];
-cx q[20],q[13];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[13];
-u3(0.57504286439241,0,pi/2) q[20];
-cx q[20],q[13];
-u3(1.7258180030531647,-0.87535755048442,2.504707156430568) q[13];
-u3(1.6597843688613607,-2.529841836537093,2.8370061817909393) q[13];
-cx q[13],q[11];
-u3(0.9501223767537346,-0.6102483038909141,-0.6937611214063075) q[11];
-u3(1.0117922589695318,-pi/2,-pi/2) q[13];
-cx q[13],q[11];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[11];
-u3(0.06428045277715787,-pi,-pi/2) q[13];
-cx q[13],q[11];
-u3(1.1096687185405227,-0.5258939671576117,2.293867150024366) q[11];
-u3(1.9060337033451142,2.8309182826858565,1.1174505428984336) q[11];
-cx q[11],q[1];
-u3(0.9025180426891604,-0.5560172203786844,-0.7839642965286213) q[1];
-u3(0.772889691901378,-pi/2,-pi/2) q[11];
-cx q[11],q[1];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[1];
-u3(0.37118355601883324,0,pi/2) q[11];
-cx q[11],q[1];
-u3(0.8728720081949437,-2.3051206862310902,0.05510905484815609) q[1];
-u3(1.280828773916562,0.231014529386532,2.7381824810712354) q[1];
-u3(2.323396082821364,2.329173908758757,1.2286195435220915) q[11];
-u3(1.8067055640828733,2.994905572909775,1.1072028002942726) q[11];
-u3(1.1555577949545701,2.775413021395523,-2.628447656606518) q[13];
-u3(0.5983428547478442,0.9674161289279049,0.005795238345795983) q[13];
-u3(1.0434620796950291,0.04565773660023664,1.6659860019198494) q[20];
-u3(2.611991502051752,1.581440618805388,-1.1758424916439736) q[20];
-cx q[12],q[20];
-u3(0.9484161359092546,-pi/2,-pi/2) q[12];
-u3(0.8962565368509803,-0.5479385776682779,-0.796950417620204) q[20];
-cx q[12],q[20];
-u3(0.16814348944955904,0,pi/2) q[12];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[20];
-cx q[12],q[20];
-u3(2.522180561169602,2.2625298886254743,2.44148802961314) q[12];
-u3(1.1772299253148875,-2.988118054517598,0.36749247711893895) q[12];
-cx q[10],q[12];
-u3(1.1155660419018398,-pi/2,-pi/2) q[10];
-u3(0.9304409105643133,-0.5892387460636237,-0.7293928986577072) q[12];
-cx q[10],q[12];
-u3(0.003957187124318778,0,pi/2) q[10];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[12];
-cx q[10],q[12];
-u3(1.8605402762900631,2.94866104109585,2.1521166539174033) q[10];
-u3(1.6337222698066696,-0.7683675691817822,1.3805525228588298) q[10];
-u3(1.598304386807774,1.6370154187183577,0.386748508801976) q[12];
-u3(1.148593130520123,1.032108574649019,-1.4624228397336374) q[12];
-cx q[12],q[23];
-u3(0.9114055232971406,-pi/2,-pi/2) q[12];
-u3(1.516389898264899,-0.008672927095289218,-0.725569082024526) q[20];
-u3(2.1533721283324794,1.7584533715887591,-1.0538853503424943) q[20];
-cx q[21],q[20];
-u3(0.8040796113731014,-0.38800643713597527,-1.0384044885379637) q[20];
-u3(0.7072463209230601,-pi/2,-pi/2) q[21];
-cx q[21],q[20];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[20];
-u3(0.4975547283987541,0,pi/2) q[21];
-cx q[21],q[20];
-u3(0.916824966694932,-1.7688235215516084,0.7212656079630548) q[20];
-u3(2.410406859990013,-1.346562446048518,-2.774242377498985) q[20];
-cx q[11],q[20];
-u3(0.3819761782631555,-pi/2,-pi/2) q[11];
-u3(0.8839914324792821,-0.5313564766036944,-0.8232984183393555) q[20];
-cx q[11],q[20];
-u3(0.0788101773928724,-pi,-pi/2) q[11];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[20];
-cx q[11],q[20];
-u3(2.044987056812924,-1.9077577084793178,0.9532803424517393) q[11];
-u3(1.7003952253335946,-0.31320577096093283,0.6526763504099513) q[11];
-u3(1.7010228485099694,0.40346848317552064,2.869978752657543) q[20];
-u3(0.8085529946391178,1.0341478619049136,-0.05137854286450505) q[20];
-u3(1.1262641136374492,-0.21485050769836533,-0.4800850801267966) q[21];
-u3(1.1946836915041041,-1.1348042862167822,-2.9965434397195043) q[21];
-cx q[21],q[24];
-u3(1.0773467978363922,-pi/2,-pi/2) q[21];
-u3(0.8780315677515896,-0.5229095503546359,-0.8365718265955504) q[23];
-cx q[12],q[23];
-u3(0.472406533583327,-pi,-pi/2) q[12];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[23];
-cx q[12],q[23];
-u3(3.0020165613520513,1.7245161207942328,1.8665071621453553) q[12];
-u3(1.3127479764630523,1.2426537491072809,0.8138858909664632) q[12];
-u3(1.6969884211015607,0.15249417126129217,-0.009258851970336046) q[23];
-u3(2.004893594796604,-2.7639037826875708,-2.381851913105148) q[23];
-u3(0.8831567975140896,-0.5301894969353063,-0.8251379413590065) q[24];
-cx q[21],q[24];
-u3(0.6458338174741368,-pi,-pi/2) q[21];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[24];
-cx q[21],q[24];
-u3(1.146299455685569,-2.4187625511810986,2.756304373591723) q[21];
-u3(0.45205794699148144,3.074758000626092,0.4789334883688965) q[21];
-cx q[21],q[31];
-u3(0.5149412305625257,-pi/2,-pi/2) q[21];
-u3(2.566807902358702,-0.2204905515729232,-1.4369584626111127) q[24];
-u3(0.43132833315648755,2.4083263517497784,-2.868784951086932) q[24];
-cx q[24],q[11];
-u3(0.9091909841590202,-0.5643588008733671,-0.7704452122603591) q[11];
-u3(1.1038276949575108,-pi/2,-pi/2) q[24];
-cx q[24],q[11];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[11];
-u3(0.2825306701717095,-pi,-pi/2) q[24];
-cx q[24],q[11];
-u3(2.094413321114477,1.025091798687649,2.774345603260226) q[11];
-u3(2.4557254709963603,-0.7255605158967069,1.1705182029512695) q[11];
-u3(1.6770272058653586,1.1794747050703496,-1.4586520357475852) q[24];
-u3(1.5500575400318855,2.6377063464741655,-2.488592106996915) q[24];
-cx q[26],q[10];
-u3(0.9595592342882217,-0.6197047794895312,-0.6773934630976015) q[10];
-u3(0.5055714741813904,-pi/2,-pi/2) q[26];
-cx q[26],q[10];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[10];
-u3(0.2137437120584871,-pi,-pi/2) q[26];
-cx q[26],q[10];
-u3(1.7398467216924405,-1.5367048262213405,-0.1812753430935632) q[10];
-u3(1.3574041730792898,-2.2497344194287865,-2.4534241352497106) q[10];
-u3(1.8615715498213072,-0.11220659152542156,-1.6114190990369024) q[26];
-u3(0.555016208522721,-1.248065677947347,2.36967988983754) q[26];
-cx q[28],q[1];
-u3(0.9242356421613281,-0.5822239839057319,-0.7410846986587689) q[1];
-u3(1.2621157170747774,-pi/2,-pi/2) q[28];
-cx q[28],q[1];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[1];
-u3(0.1478820833902451,0,pi/2) q[28];
-cx q[28],q[1];
-u3(2.2164393787413794,-0.20476631879511364,2.6836206533590383) q[1];
-u3(2.7191151090917005,3.0736793412331807,0.18322541537103731) q[1];
-cx q[1],q[12];
-u3(0.47275932267911047,-pi/2,-pi/2) q[1];
-u3(0.860235596213859,-0.4959877124804102,-0.8782743433499274) q[12];
-cx q[1],q[12];
-u3(0.09682946756475513,-pi,-pi/2) q[1];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[12];
-cx q[1],q[12];
-u3(1.6227367717853687,1.3210968522133841,1.3201377593781993) q[1];
-u3(1.4649220264768392,2.8224233461878416,-1.425840312068853) q[1];
-u3(1.4095081853168068,0.13721447475049153,3.033611220981552) q[12];
-u3(1.3075281575118776,0.19254569435690172,0.3126451309164615) q[12];
-u3(1.9864833304318088,-1.9021951218166517,-1.6846755197280538) q[28];
-u3(1.603307185822289,2.569198834852699,0.6509555414908919) q[28];
-u3(0.8709550805443813,-0.5125223893212136,-0.8527663922829305) q[31];
-cx q[21],q[31];
-u3(0.16060647526662553,-pi,-pi/2) q[21];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[31];
-cx q[21],q[31];
-u3(1.7246948163799423,-2.5176062495699725,3.1007720418331273) q[21];
-u3(2.5940472761285864,1.5067492044866055,-2.206570705131984) q[21];
-u3(0.8535649566053297,0.9715181211474668,2.826122136577145) q[31];
-u3(0.943185881153114,-2.3224815615320926,-1.2894535130263676) q[31];
-cx q[5],q[13];
-u3(0.868598560360047,-0.5089728004533729,-0.8582696435325516) q[13];
-u3(0.6397402185197673,-pi/2,-pi/2) q[5];
-cx q[5],q[13];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[13];
-u3(0.26755054667851597,0,pi/2) q[5];
-cx q[5],q[13];
-u3(1.7196931419804329,1.790675726308641,-0.9003826576631209) q[13];
-u3(0.40492689238191587,2.0911069961850917,2.5232194201851534) q[13];
-u3(1.2487822079519846,0.8628904334221952,-0.23330564062706483) q[5];
-u3(1.344353999302598,1.1797422935979434,0.3862331227718383) q[5];
-cx q[5],q[13];
-u3(0.8726341723608594,-0.5150234694116094,-0.8488794352582758) q[13];
-u3(0.33013895661600084,-pi/2,-pi/2) q[5];
-cx q[5],q[13];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[13];
-u3(0.11303945812456308,0,pi/2) q[5];
-cx q[5],q[13];
-u3(3.018332295212297,-2.4436595014595457,-2.511977154779858) q[13];
-u3(1.2624063452605432,2.0815022278900184,1.6185055861227147) q[13];
-u3(1.540439648479896,-2.2855233022687944,-0.5974062826184743) q[5];
-u3(1.2385253206875846,-1.2705663081817775,0.6412840352888525) q[5];
-u3(0.8903174930004107,1.905676599377097,1.2240565324398904) q[9];
-u3(0.6798696033553676,2.786222893886542,0.2323873835610879) q[9];
-cx q[18],q[9];
-u3(0.8803762347028278,-pi/2,-pi/2) q[18];
-u3(0.919934771384593,-0.5772440528678691,-0.7493273874856836) q[9];
-cx q[18],q[9];
-u3(0.28927326221621424,0,pi/2) q[18];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[9];
-cx q[18],q[9];
-u3(1.5034234498695027,-1.543905609564927,-1.1379760928559577) q[18];
-u3(1.418488478279767,-2.5811164481778683,-2.3447131965324606) q[18];
-cx q[3],q[18];
-u3(0.7341388055386039,-0.09916047087590396,-1.4375844144336636) q[18];
-u3(0.7600070910718288,-pi/2,-pi/2) q[3];
-cx q[3],q[18];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[18];
-u3(0.4015356518819859,0,pi/2) q[3];
-cx q[3],q[18];
-u3(0.41978877243282536,-2.0046952911335634,-2.3628107629471495) q[18];
-u3(1.9429448995970466,-3.075451176218902,2.1058441336289384) q[18];
-cx q[29],q[18];
-u3(0.8095709592653695,-0.40064901276203324,-1.0201297738934247) q[18];
-u3(0.7282455266093655,-pi/2,-pi/2) q[29];
-cx q[29],q[18];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[18];
-u3(0.1688267636995628,0,pi/2) q[29];
-cx q[29],q[18];
-u3(2.242638585487569,-1.943110303176734,1.9770711541667154) q[18];
-u3(1.5223430096209651,1.1580093222839478,0.6847002385803851) q[18];
-cx q[18],q[19];
-u3(0.778787625080688,-pi/2,-pi/2) q[18];
-u3(0.8620367916971335,-0.4988371861475156,-0.8739011467661921) q[19];
-cx q[18],q[19];
-u3(0.1427043299906267,-pi,-pi/2) q[18];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[19];
-cx q[18],q[19];
-u3(1.4524492484450198,-0.33998506363883596,1.2929524365697453) q[18];
-u3(1.4140339094355185,2.785397267040663,-0.49796608827500544) q[18];
-u3(1.7151780516669437,1.4609321678449056,-0.4836744221544129) q[19];
-u3(1.9282292384653577,-2.2269231085945242,2.58846106293913) q[19];
-u3(1.62683579130904,0.9447176413456937,-1.0754178943123476) q[29];
-u3(0.8754613064783127,2.5743327336144244,-0.32115446935498637) q[29];
-cx q[14],q[29];
-u3(0.5250043723791116,-pi/2,-pi/2) q[14];
-u3(0.858747730082366,-0.4936112929496552,-0.8819145624278981) q[29];
-cx q[14],q[29];
-u3(0.23696267071873073,0,pi/2) q[14];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[29];
-cx q[14],q[29];
-u3(1.7456300761451247,-2.2580124633172494,2.873155346601555) q[14];
-u3(1.386929541161186,-0.4470307625938119,0.12514347343295018) q[14];
-cx q[14],q[10];
-u3(0.8869393580746576,-0.5354377966250121,-0.8168501351085666) q[10];
-u3(0.7630799134091569,-pi/2,-pi/2) q[14];
-cx q[14],q[10];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[10];
-u3(0.08036733392056392,0,pi/2) q[14];
-cx q[14],q[10];
-u3(0.866337589418832,-1.5906451989813284,-2.254529050663428) q[10];
-u3(1.5396181223463015,3.027123009109294,-0.2946411452062825) q[10];
-u3(1.7184602578119987,-2.1624443591274645,1.5604771814130798) q[14];
-u3(1.3918847347437313,-1.791273268160987,1.353703774917527) q[14];
-u3(0.15363513117011432,2.9022826364247045,1.8057181802261066) q[29];
-u3(1.5396181223463015,3.027123009109294,-0.2946411452062825) q[29];
-u3(0.5883427110130985,-1.5266477965649354,2.9549453739406246) q[3];
-u3(1.4441733255184377,-1.0052430749301857,2.391464717918007) q[3];
-cx q[2],q[3];
-u3(0.9771376624748684,-pi/2,-pi/2) q[2];
-u3(0.913099942976162,-0.569122582275758,-0.7626719769003287) q[3];
-cx q[2],q[3];
-u3(0.50796939391676,0,pi/2) q[2];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[3];
-cx q[2],q[3];
-u3(2.3705153467719806,-1.53966068716315,-1.723714732858765) q[2];
-u3(2.464546522021222,-1.7924431654287287,-1.6800499975479852) q[2];
-cx q[2],q[15];
-u3(0.7774137450785685,-0.31623154157934996,-1.1404030417536415) q[15];
-u3(0.5224607839253124,-pi/2,-pi/2) q[2];
-cx q[2],q[15];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[15];
-u3(0.019829143691419197,-pi,-pi/2) q[2];
-cx q[2],q[15];
-u3(2.0577804761360294,0.14234700806350986,-0.056289240010869435) q[15];
-u3(0.6776430602868183,1.7246912682387148,-0.803068333204922) q[15];
-u3(0.7653243169023489,-2.2650233368818355,-1.5577432622870273) q[2];
-u3(0.9605102089605859,2.0579194153283353,1.8761175057204325) q[2];
-cx q[2],q[15];
-u3(0.7720092480890187,-0.2988485580343574,-1.164727061214089) q[15];
-u3(0.6166251749159339,-pi/2,-pi/2) q[2];
-cx q[2],q[15];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[15];
-u3(0.14321262525242975,0,pi/2) q[2];
-cx q[2],q[15];
-u3(0.5432367587597556,2.5863403146578037,1.842332726832316) q[15];
-u3(1.645244776516643,0.8107491355963408,3.106572526189499) q[15];
-u3(1.22202344133997,1.5710830898402328,2.970173757801934) q[2];
-u3(2.990703939593795,2.0986210391228237,-2.9521319905688355) q[2];
-cx q[21],q[15];
-u3(0.9631993851871234,-0.6232529665320174,-0.67119458385549) q[15];
-u3(0.7838684252030966,-pi/2,-pi/2) q[21];
-cx q[21],q[15];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[15];
-u3(0.26623019695315425,-pi,-pi/2) q[21];
-cx q[21],q[15];
-u3(1.3655662680425058,0.30015299960685526,0.9575945391216525) q[15];
-u3(0.9074571130517409,0.3172100445568402,2.719546467982523) q[15];
-u3(1.6617740096131242,1.7178321336807425,-0.1494867915266389) q[21];
-u3(1.0028544767910963,-2.4641534078708185,-1.3211106488447217) q[21];
-u3(0.23677512768658449,0.32067016839655604,-1.4554103116055175) q[3];
-u3(0.7121729797516213,0.16328909432556982,1.2122129641817594) q[3];
-cx q[25],q[3];
-u3(0.701776425008024,-pi/2,-pi/2) q[25];
-u3(0.7668737084110059,-0.28107895235510627,-1.189464808949019) q[3];
-cx q[25],q[3];
-u3(0.2498938740653306,0,pi/2) q[25];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[3];
-cx q[25],q[3];
-u3(2.073639333437374,0.20765272885526542,-2.9801206275752454) q[25];
-u3(1.4176944089571915,-2.3089255395098642,-2.698395354249279) q[25];
-u3(0.40457472729552985,0.5925834656596356,-2.097831164842292) q[3];
-u3(2.104584571722468,-2.703153520501157,2.677895782672649) q[3];
-cx q[3],q[16];
-u3(0.7729806078500238,-0.3020655883869994,-1.1602350830280912) q[16];
-u3(0.5170532928628491,-pi/2,-pi/2) q[3];
-cx q[3],q[16];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[16];
-u3(0.2424550815674846,-pi,-pi/2) q[3];
-cx q[3],q[16];
-u3(2.4087297276738564,-2.5947173737599725,-1.5460748771274526) q[16];
-u3(1.1380719020272718,0.2743498671303062,3.122986506641312) q[16];
-cx q[16],q[10];
-u3(0.8812456409939774,-0.5274979638588393,-0.8293735485449485) q[10];
-u3(1.034151584531233,-pi/2,-pi/2) q[16];
-cx q[16],q[10];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[10];
-u3(0.15839483977674074,-pi,-pi/2) q[16];
-cx q[16],q[10];
-u3(2.0907976634785412,-0.8462049480528062,-2.438547411341224) q[10];
-u3(1.421141634251735,-1.6438924707811338,1.462001387285472) q[10];
-u3(1.7405578266653365,-0.23283663340599237,0.3804844310050539) q[16];
-u3(0.23776263207454426,-2.7821988586713924,3.1132859422370682) q[16];
-u3(1.9716647026934266,-1.1483037037046466,-2.0913900591141514) q[3];
-u3(0.805040476109517,-1.2027218031332505,-2.1137614394358857) q[3];
-cx q[5],q[25];
-u3(0.7300366546861855,0.026825432910577263,-1.6067894595760803) q[25];
-u3(0.601839024085286,-pi/2,-pi/2) q[5];
-cx q[5],q[25];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[25];
-u3(0.06437894251676674,0,pi/2) q[5];
-cx q[5],q[25];
-u3(1.905313075266384,-2.222469733378925,-2.567148984135918) q[25];
-u3(1.6892912974442775,-1.7412625275498126,0.9406972490785002) q[25];
-cx q[25],q[24];
-u3(0.8429248825923578,-0.46697699885048927,-0.9223046855867985) q[24];
-u3(0.554599645608722,-pi/2,-pi/2) q[25];
-cx q[25],q[24];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[24];
-u3(0.16718095771644645,-pi,-pi/2) q[25];
-cx q[25],q[24];
-u3(1.2251987615440914,2.21259588525046,1.5332534581754897) q[24];
-u3(0.8879507871529495,1.037003939022541,0.6580199184945972) q[24];
-u3(0.350661533741517,-0.9708836204711857,-1.7618015407853487) q[25];
-u3(0.3455452596972752,3.0838733484549223,-1.6862422514051434) q[25];
-u3(2.2683704734512644,0.9470343127402723,2.071811789485575) q[5];
-u3(2.3749448456541633,1.646927518492106,2.125542526049875) q[5];
-cx q[5],q[3];
-u3(0.9638227679878153,-0.6238552004894875,-0.6701392185355317) q[3];
-u3(0.7325439334143445,-pi/2,-pi/2) q[5];
-cx q[5],q[3];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[3];
-u3(0.4164159157010234,0,pi/2) q[5];
-cx q[5],q[3];
-u3(1.2204136605919935,2.0130794983637523,-0.3515930797784801) q[3];
-u3(0.8060355142625434,-1.683246561039913,2.176614853706595) q[3];
-cx q[25],q[3];
-u3(0.5547273592669056,-pi/2,-pi/2) q[25];
-u3(0.9107824785821902,-0.5663090255894478,-0.7672676916158405) q[3];
-cx q[25],q[3];
-u3(0.12076214316578439,0,pi/2) q[25];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[3];
-cx q[25],q[3];
-u3(0.4313240254546597,-0.7750243113272575,0.05448190594373248) q[25];
-u3(2.34057181390314,0.7615884496622431,-1.747723624084644) q[25];
-u3(1.0082319239151094,2.8312058870045522,-2.756493085462217) q[3];
-u3(2.016354410880379,0.35597176400872854,0.31501120020123397) q[3];
-u3(2.5801407297627574,0.7676303889272331,0.20714397045512278) q[5];
-u3(2.9579024734250408,-0.7792650918489628,-0.8056805969893155) q[5];
-cx q[6],q[19];
-u3(0.8024126043086611,-0.3840486047447178,-1.04410433189436) q[19];
-u3(0.5969488755902486,-pi/2,-pi/2) q[6];
-cx q[6],q[19];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[19];
-u3(0.3849367009058415,-pi,-pi/2) q[6];
-cx q[6],q[19];
-u3(2.6371708456969403,-2.233170448371502,-2.1199036802310243) q[19];
-u3(2.2806669054455364,-0.25417726409718977,-1.1008638293038722) q[19];
-u3(2.1346970674796433,2.3612458048256935,-0.9117437352448894) q[6];
-u3(1.3628209325303653,-1.589060855160151,-2.6097050530927857) q[6];
-u3(1.2303011321411097,2.5648056817050566,1.0436532654936368) q[9];
-u3(0.9279269007584308,-2.3685992742921984,-1.9472466746292103) q[9];
-cx q[9],q[22];
-u3(0.8597741812913783,-0.4952529487971953,-0.8794005321838654) q[22];
-u3(1.0362298919465447,-pi/2,-pi/2) q[9];
-cx q[9],q[22];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[22];
-u3(0.09255108468720183,0,pi/2) q[9];
-cx q[9],q[22];
-u3(0.7493777594938859,-0.518236970142655,2.8535328954270263) q[22];
-u3(2.1120499997654454,-3.0286155843710816,2.5653186434438915) q[22];
-cx q[4],q[22];
-u3(0.8159415598325943,-0.41461584611384694,-0.9998148364416011) q[22];
-u3(0.9370983355809189,-pi/2,-pi/2) q[4];
-cx q[4],q[22];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[22];
-u3(0.04966422611558994,-pi,-pi/2) q[4];
-cx q[4],q[22];
-u3(1.3734950816742169,-3.0841571180786613,-2.0081241121219287) q[22];
-u3(1.4436325875615115,1.3147794786342821,0.7764055891874726) q[22];
-u3(1.0153581442045156,0.04954642592043257,0.639564718394241) q[4];
-u3(2.0824022920933243,-1.499939590580736,1.281555302305943) q[4];
-cx q[4],q[30];
-u3(0.9676404692945897,-0.6275095014008443,-0.6637148383073228) q[30];
-u3(0.46730552031728023,-pi/2,-pi/2) q[4];
-cx q[4],q[30];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[30];
-u3(0.18687267772128968,-pi,-pi/2) q[4];
-cx q[4],q[30];
-u3(2.1844999109137797,-1.0799429556863291,-2.2576949377722713) q[30];
-u3(1.4988183719568193,1.6931429986889643,0.7803979681312927) q[30];
-cx q[20],q[30];
-u3(0.43307889668388494,-pi/2,-pi/2) q[20];
-u3(0.7608618593673174,-0.2583773434468042,-1.2208988726927075) q[30];
-cx q[20],q[30];
-u3(0.16809910144908685,-pi,-pi/2) q[20];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[30];
-cx q[20],q[30];
-u3(2.7096907224081423,2.403351041440409,-0.9062555088513862) q[20];
-u3(1.865538863320232,-0.04481169900223314,-2.5087571843240295) q[20];
-cx q[2],q[20];
-u3(0.10591448408685263,-pi/2,-pi/2) q[2];
-u3(0.8343738744892413,-0.4514338372813249,-0.9455558111386058) q[20];
-cx q[2],q[20];
-u3(0.018282447652442083,-pi,-pi/2) q[2];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[20];
-cx q[2],q[20];
-u3(2.229970829726988,0.8281539172838741,0.7992507213910538) q[2];
-u3(1.0745429393312371,0.1818744230185172,1.6807377845936369) q[2];
-u3(1.842185141233964,2.8052923035336654,0.22397520692540684) q[20];
-u3(1.6357263186850985,-1.4000341036181567,-1.1339501542178185) q[20];
-u3(2.023586841610136,0.49526388028092105,-2.8126089311712157) q[30];
-u3(1.4211503154309664,2.2285732107125122,-1.7206176398412794) q[30];
-cx q[19],q[30];
-u3(1.0091761332605846,-pi/2,-pi/2) q[19];
-u3(0.9514654984652964,-0.6116175171309832,-0.6914046238612581) q[30];
-cx q[19],q[30];
-u3(0.1586559734483737,-pi,-pi/2) q[19];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[30];
-cx q[19],q[30];
-u3(1.3261052533926647,-1.8129779429072272,0.8442444491406711) q[19];
-u3(1.4161094854006215,-2.3136210821298073,3.015891970125386) q[19];
-u3(1.1196381146353562,2.0434630588982046,-1.6800117010946995) q[30];
-u3(2.593046267918141,3.039213025025207,2.0728679784946404) q[30];
-u3(1.6596722117550333,-0.6138649332079296,1.0690375845837004) q[4];
-u3(1.6935242483439537,2.372831304303352,2.7182516206854146) q[4];
-cx q[4],q[17];
-u3(0.7342429369416001,-0.10031349421656577,-1.4360312557427548) q[17];
-u3(0.5116465404740898,-pi/2,-pi/2) q[4];
-cx q[4],q[17];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[17];
-u3(0.1744592621137858,0,pi/2) q[4];
-cx q[4],q[17];
-u3(2.1649913098389466,1.3206942942167004,-2.01521764015511) q[17];
-u3(0.6305503005973255,-2.4053554829593367,0.14547044595457592) q[17];
-cx q[17],q[14];
-u3(0.7823455205402716,-0.33109597146023173,-1.1194970573106566) q[14];
-u3(0.8902750661555333,-pi/2,-pi/2) q[17];
-cx q[17],q[14];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[14];
-u3(0.6037090511858685,0,pi/2) q[17];
-cx q[17],q[14];
-u3(1.4577140059238296,-3.10873299216485,-0.6556014660977665) q[14];
-u3(1.376313063709177,0.6089682543933792,1.0684689101062768) q[14];
-u3(2.1425409253319385,-2.732942372715751,-2.6037863190715322) q[17];
-u3(0.20004354900714752,0.6284962538810088,0.2808389666858315) q[17];
-cx q[17],q[20];
-u3(1.0162754249830699,-pi/2,-pi/2) q[17];
-u3(0.875018501072042,-0.5185356908041938,-0.843407821659433) q[20];
-cx q[17],q[20];
-u3(0.14187087910365728,-pi,-pi/2) q[17];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[20];
-cx q[17],q[20];
-u3(0.8155695904742576,-2.3994904629901486,-1.6507299397953652) q[17];
-u3(0.7508137618239342,3.086636232712644,0.8788971441161628) q[17];
-u3(1.4443377706774727,2.1638382037969235,2.98526178034012) q[20];
-u3(2.2615208561097275,-1.3283965138065863,0.929470865243962) q[20];
-u3(1.9367285421800327,-0.32204168356320073,1.7254709957744794) q[4];
-u3(0.13393435446466745,3.1243929143814677,-1.1202420511810836) q[4];
-cx q[4],q[12];
-u3(0.7633063228736452,-0.26788508647559794,-1.2077558145462266) q[12];
-u3(0.4206814118412365,-pi/2,-pi/2) q[4];
-cx q[4],q[12];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[12];
-u3(0.12386155909002534,-pi,-pi/2) q[4];
-cx q[4],q[12];
-u3(0.8301693523663747,1.9414377821876485,-0.8424008437433272) q[12];
-u3(2.15848393503058,0.6404858648227032,-1.3685226194820825) q[12];
-u3(2.278095292417445,2.8996423670803395,2.2658010223237195) q[4];
-u3(0.2389143260372234,-0.7309856725646036,0.7660150163105612) q[4];
-cx q[4],q[12];
-u3(0.7421539982718348,-0.16536417212898913,-1.3481134924991505) q[12];
-u3(0.8879112325161315,-pi/2,-pi/2) q[4];
-cx q[4],q[12];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[12];
-u3(0.43596950384582756,0,pi/2) q[4];
-cx q[4],q[12];
-u3(2.5092226466303362,0.26211686613989027,-0.6603980254702364) q[12];
-u3(1.0347299376992025,0.6616309158667781,-3.0384988366907386) q[12];
-u3(0.63616568633706,0.0316482811040486,-1.0217002907838366) q[4];
-u3(1.0235393163778026,-0.6217260734839929,-2.9444417782757144) q[4];
-cx q[8],q[22];
-u3(0.8654174393891619,-0.5041062415334978,-0.865790058064368) q[22];
-u3(0.6294892427420865,-pi/2,-pi/2) q[8];
-cx q[8],q[22];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[22];
-u3(0.16433675987155116,0,pi/2) q[8];
-cx q[8],q[22];
-u3(1.4208896684583805,2.9405597517431,1.8377163624968649) q[22];
-u3(1.8395404009828207,-2.317181301624071,1.6305601757851758) q[22];
-cx q[22],q[13];
-u3(0.7432805001010412,-0.17255702956633412,-1.3383490317156177) q[13];
-u3(0.9635106735962945,-pi/2,-pi/2) q[22];
-cx q[22],q[13];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[13];
-u3(0.6646443157121458,0,pi/2) q[22];
-cx q[22],q[13];
-u3(0.9330989862213825,-3.088992130668606,-2.977182817418078) q[13];
-u3(1.416524064310065,1.8647995438542644,2.3091861377615555) q[13];
-u3(1.8017263687868232,1.2023704486393534,2.499122509636024) q[22];
-u3(1.6478934237996627,2.582097654760214,-2.0430740279164077) q[22];
-u3(0.860727496380076,0.19625048394450761,0.7627023968920454) q[8];
-u3(1.9787069809507791,1.1566071905322062,0.9197017875579876) q[8];
-cx q[8],q[18];
-u3(0.8474229723805237,-0.4748146241643356,-0.9104940457847643) q[18];
-u3(0.47815922939987054,-pi/2,-pi/2) q[8];
-cx q[8],q[18];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[18];
-u3(0.0022004958010658896,-pi,-pi/2) q[8];
-cx q[8],q[18];
-u3(1.847703072778759,-1.433342271159339,0.9139672400552454) q[18];
-u3(2.417991943819657,-1.536821116341469,-1.483946075912981) q[18];
-cx q[11],q[18];
-u3(0.597268105802865,-pi/2,-pi/2) q[11];
-u3(0.8762557730486036,-0.520340367163366,-0.8405902516032597) q[18];
-cx q[11],q[18];
-u3(0.22036352805304235,0,pi/2) q[11];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[18];
-cx q[11],q[18];
-u3(2.593414752276217,-1.9389896519971617,-2.7105881602124704) q[11];
-u3(1.660648006505114,-0.3349809718678536,2.922049414343334) q[11];
-u3(1.066680807693131,-2.1136693510238964,2.9181429723564687) q[18];
-u3(0.9038886091014993,2.736447233491818,0.5085741712417589) q[18];
-cx q[2],q[18];
-u3(0.8756591374414994,-0.5194716287456078,-0.8419471004248198) q[18];
-u3(0.43944712885862436,-pi/2,-pi/2) q[2];
-cx q[2],q[18];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[18];
-u3(0.287849898232931,-pi,-pi/2) q[2];
-cx q[2],q[18];
-u3(2.0567765078722613,0.2988175099216308,-1.737121222146948) q[18];
-u3(2.28520989168784,1.3630864168278949,-2.5200193974503646) q[18];
-u3(2.884404312626763,-1.7952674110069249,-1.9911600979794346) q[2];
-u3(0.8845031284380758,1.56142680870152,2.0338886535872316) q[2];
-cx q[5],q[11];
-u3(0.9331789121326098,-0.5922719986816287,-0.7243068215529362) q[11];
-u3(1.0343494767698844,-pi/2,-pi/2) q[5];
-cx q[5],q[11];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[11];
-u3(0.07290138249799417,0,pi/2) q[5];
-cx q[5],q[11];
-u3(2.288864552811489,-1.7819653036527745,-0.3780119715478092) q[11];
-u3(2.7023927385018016,-1.4038601342675028,0.47246506127798327) q[11];
-cx q[11],q[25];
-u3(0.9027456864986207,-pi/2,-pi/2) q[11];
-u3(0.9017154072540158,-0.554995534003226,-0.7856123090206495) q[25];
-cx q[11],q[25];
-u3(0.012109902348366144,-pi,-pi/2) q[11];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[25];
-cx q[11],q[25];
-u3(1.1470829321283744,0.3052757317847461,1.3215390180333308) q[11];
-u3(0.933800448670842,2.6986673344794303,1.7745243469975147) q[11];
-u3(2.279723703730385,2.626382866490294,-1.4330393758698423) q[25];
-u3(0.7615692187638068,2.4070263253321933,-0.8279691204741937) q[25];
-u3(1.1616325660120836,-2.615095692924328,-1.3504683172857193) q[5];
-u3(1.4759405120750542,-0.014770195565336763,-0.37379013604470046) q[5];
-u3(0.7451050382533579,-0.5101278518509087,3.1259738956380323) q[8];
-u3(2.0755790897473867,-0.8724892024745898,-2.7542910623693118) q[8];
-cx q[8],q[6];
-u3(0.8113186445852891,-0.40455229035712525,-1.0144660980086968) q[6];
-u3(0.9264560484658695,-pi/2,-pi/2) q[8];
-cx q[8],q[6];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[6];
-u3(0.6387043170430167,0,pi/2) q[8];
-cx q[8],q[6];
-u3(1.1523872739325411,-1.4209616876191369,0.1548060408592633) q[6];
-u3(1.7929658478685422,2.736881612437606,-2.274433729068016) q[6];
-cx q[6],q[15];
-u3(0.9484153166169161,-0.6084966531078067,-0.6967693928481093) q[15];
-u3(0.6013331993957037,-pi/2,-pi/2) q[6];
-cx q[6],q[15];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[15];
-u3(0.2926357072869837,0,pi/2) q[6];
-cx q[6],q[15];
-u3(0.424262907399232,0.5878093174259496,1.2105964663962077) q[15];
-u3(1.446522456220287,3.0331798302440065,0.3003066152840672) q[15];
-u3(0.46248708478823314,-1.8778032317381887,-2.113719619176483) q[6];
-u3(1.1923448723333325,1.1995326324928381,-1.8171902335944514) q[6];
-cx q[17],q[6];
-u3(0.5606716799314448,-pi/2,-pi/2) q[17];
-u3(0.8384887265288892,-0.4590227329210559,-0.9342311522002511) q[6];
-cx q[17],q[6];
-u3(0.20861380476526098,-pi,-pi/2) q[17];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[6];
-cx q[17],q[6];
-u3(1.3835389447107302,-0.7326340951496326,2.606586169752223) q[17];
-u3(2.751086730137619,-1.983971382984285,-2.9061273300389856) q[17];
-u3(0.6100506549276309,-0.35071028303325136,-1.8803428867147183) q[6];
-u3(1.9225347131310249,1.7325816141331218,-1.6704857193671883) q[6];
-u3(1.56661269855087,-1.4665040508183318,1.8228086460979753) q[8];
-u3(2.421964122241247,0.5686140556287862,2.30556001134574) q[8];
-cx q[10],q[8];
-u3(0.658951717190285,-pi/2,-pi/2) q[10];
-u3(0.9678303199526166,-0.6276897201375129,-0.6633970853099704) q[8];
-cx q[10],q[8];
-u3(0.1841405184103595,0,pi/2) q[10];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[8];
-cx q[10],q[8];
-u3(1.9979074130083943,2.6237952739994705,2.346459373032288) q[10];
-u3(1.786966672404075,-2.9130523135363715,-0.7039106796167376) q[10];
-u3(1.5728620962935098,3.1204251950220216,-0.2867143642440926) q[8];
-u3(0.8300594581554579,-2.429513777812065,-2.3019234213508475) q[8];
-cx q[12],q[8];
-u3(0.7327964347544992,-pi/2,-pi/2) q[12];
-u3(0.8632463792711872,-0.500734171841676,-0.8709846530907139) q[8];
-cx q[12],q[8];
-u3(0.14951599291458315,0,pi/2) q[12];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[8];
-cx q[12],q[8];
-u3(0.5259351490506772,-2.1919304770133397,2.7056292154684147) q[12];
-u3(2.0022310408910067,-1.6284810183247966,-2.207426384091199) q[12];
-u3(1.6811700147715658,-0.31836533697036407,-1.1361571121081813) q[8];
-u3(2.199039114553762,-0.40843037995579756,0.2126178600785047) q[8];
-u3(2.1460410165026214,-2.0224498532620414,0.5788353388229925) q[9];
-u3(2.200690695236777,-0.4503089859350826,0.363042183362269) q[9];
-cx q[9],q[0];
-u3(0.8803275303052855,-0.5261952659428641,-0.8314200623537751) q[0];
-u3(1.2059231042411167,-pi/2,-pi/2) q[9];
-cx q[9],q[0];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[0];
-u3(0.06849809148602035,-pi,-pi/2) q[9];
-cx q[9],q[0];
-u3(1.4089843278284162,-2.104070583569136,2.3969146662999403) q[0];
-u3(1.6881336975433796,-0.009777508131073365,-0.8112013181205171) q[0];
-cx q[7],q[0];
-u3(0.9003160617720176,-0.5532046358008476,-0.7884970651851493) q[0];
-u3(0.5209317430970815,-pi/2,-pi/2) q[7];
-cx q[7],q[0];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[0];
-u3(0.2916927485518153,-pi,-pi/2) q[7];
-cx q[7],q[0];
-u3(2.5614714536146685,-2.0956235149226834,1.8045530965682932) q[0];
-u3(2.204091078748573,-2.2324806479418484,3.101908461073319) q[0];
-cx q[23],q[0];
-u3(0.872739439761849,-0.5151795013269482,-0.8486366862741832) q[0];
-u3(0.8634831277021264,-pi/2,-pi/2) q[23];
-cx q[23],q[0];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[0];
-u3(0.024380509882373044,0,pi/2) q[23];
-cx q[23],q[0];
-u3(2.690698434556137,-0.17997116495105647,-2.246288312349643) q[0];
-u3(0.468398085738106,2.2351807537358805,-2.960369345324951) q[0];
-cx q[1],q[0];
-u3(0.932496544087467,-0.5915195259594204,-0.7255702990504886) q[0];
-u3(0.7478462423534967,-pi/2,-pi/2) q[1];
-cx q[1],q[0];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[0];
-u3(0.05399456763868543,-pi,-pi/2) q[1];
-cx q[1],q[0];
-u3(1.9897322581968602,-0.8635043489072389,3.0726212968368056) q[0];
-u3(2.1870243683935673,0.49155485893307294,-1.8671221852127102) q[0];
-cx q[0],q[21];
-u3(1.2106698371965585,-pi/2,-pi/2) q[0];
-u3(0.9217960165831838,2.915229758801127,2.6032268893059225) q[1];
-u3(1.319764611252982,-1.6237991281480109,2.761403457082803) q[1];
-u3(0.8959969902782374,-0.5475982602713629,-0.797495239863018) q[21];
-cx q[0],q[21];
-u3(0.22838114723869668,0,pi/2) q[0];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[21];
-cx q[0],q[21];
-u3(1.4372779821215378,-1.7118432686144263,1.4439982121524366) q[0];
-u3(0.5428232083207735,-1.233486074149646,-0.40842087295976004) q[0];
-cx q[0],q[10];
-u3(0.7431348062881662,-pi/2,-pi/2) q[0];
-u3(0.7686350093455753,-0.2873251423046148,-1.1807832098148747) q[10];
-cx q[0],q[10];
-u3(0.024194019900982692,0,pi/2) q[0];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[10];
-cx q[0],q[10];
-u3(1.4628216625881014,-0.45169262806507327,1.2581201843432064) q[0];
-u3(2.0136939749465497,-0.5448424323500891,0.3183746493646207) q[0];
-u3(0.8462993863356669,-1.025377072849432,-0.8756833238737571) q[10];
-u3(1.7286416971310714,-0.6961594248548559,1.717989276202073) q[10];
-u3(0.6777742980213977,-0.4374028468956048,1.0566019079670728) q[21];
-u3(1.7766064383228195,-0.649824796895988,0.6277153294751385) q[21];
-u3(1.5424578235028108,2.95319922203535,0.10867214560176741) q[23];
-u3(1.6685775340789049,-2.704189234474648,-0.786721850724577) q[23];
-u3(1.2353526636813144,2.9915402652325103,-0.3980498280396909) q[7];
-u3(1.619675932494767,2.8344330709358854,-1.5551921699937146) q[7];
-cx q[7],q[28];
-u3(0.783388838005315,-0.33413148418984395,-1.1152150219238166) q[28];
-u3(0.820503837044546,-pi/2,-pi/2) q[7];
-cx q[7],q[28];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[28];
-u3(0.1995594472460033,-pi,-pi/2) q[7];
-cx q[7],q[28];
-u3(2.218311073360417,2.7558663530171152,-0.36331471778741964) q[28];
-u3(2.1826120745137754,-1.1130554014692846,-2.3806379034718814) q[28];
-cx q[28],q[22];
-u3(0.7843358341433985,-0.3368558257321559,-1.1113681275925522) q[22];
-u3(0.9044218464700042,-pi/2,-pi/2) q[28];
-cx q[28],q[22];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[22];
-u3(0.018866536538876745,0,pi/2) q[28];
-cx q[28],q[22];
-u3(1.4913621474924035,2.1533790816315204,-0.5100059447871339) q[22];
-u3(1.463073074566485,1.1809912095408999,2.391473456287314) q[22];
-u3(0.775465813983252,-1.9301647955463965,-0.26133043672844014) q[28];
-u3(1.0322504501894623,1.7411994788513798,0.5474389463505345) q[28];
-cx q[19],q[28];
-u3(0.4997417926394914,-pi/2,-pi/2) q[19];
-u3(0.8381810972807074,-0.45846254147387944,-0.9350688820006869) q[28];
-cx q[19],q[28];
-u3(0.021776443676340407,-pi,-pi/2) q[19];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[28];
-cx q[19],q[28];
-u3(1.2105093009160364,-1.4771678840363989,2.832794029949712) q[19];
-u3(0.8535443244937669,-1.126097867709099,1.8507660341795464) q[19];
-u3(0.4706844135091724,3.0091655405177384,-2.100514925760968) q[28];
-u3(2.4932825563476277,1.0261868734303325,-2.8177834859932984) q[28];
-cx q[28],q[19];
-u3(0.7303376682115373,-0.03730726195433931,-1.5207346644382014) q[19];
-u3(0.6783444261831899,-pi/2,-pi/2) q[28];
-cx q[28],q[19];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[19];
-u3(0.162745310296119,-pi,-pi/2) q[28];
-cx q[28],q[19];
-u3(1.0316089444444785,-2.163339928650309,0.49283192950261867) q[19];
-u3(1.4420557440363586,1.4097626470883355,-0.4917014094428249) q[19];
-cx q[19],q[0];
-u3(0.7791301103352476,-0.32150515883935515,-1.132997624514088) q[0];
-u3(0.6105200431719121,-pi/2,-pi/2) q[19];
-cx q[19],q[0];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[0];
-u3(0.3199959688987282,-pi,-pi/2) q[19];
-cx q[19],q[0];
-u3(0.7286202636356861,-0.34824882367625687,2.060046378098626) q[0];
-u3(2.495797771889595,0.39374199324008075,0.37444669946345277) q[0];
-u3(0.6925777945111292,-0.6860243168994535,-0.8520264672706901) q[19];
-u3(2.193023752622446,0.2770595888938985,2.9574398259846104) q[19];
-cx q[19],q[0];
-u3(0.9768655194745954,-0.6361057666724275,-0.6484584390593824) q[0];
-u3(1.378902712252404,-pi/2,-pi/2) q[19];
-cx q[19],q[0];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[0];
-u3(0.7992995239928248,0,pi/2) q[19];
-cx q[19],q[0];
-u3(2.3998893790539464,-1.3570417615880894,-0.49657579397300866) q[0];
-u3(1.3983752705617911,-2.308485387155743,-2.2663590451414484) q[0];
-u3(1.3419651744247543,2.656470540149213,2.105261681637481) q[19];
-u3(2.431887110796234,2.938877978750334,-1.2613373909707637) q[19];
-u3(0.12290616818345718,1.8847275350837478,2.4565591981155306) q[28];
-u3(1.1929461558030099,-1.6742684838823658,-0.7172656873669165) q[28];
-u3(2.587042972266735,-1.0793654971724078,-2.3039780014659534) q[7];
-u3(1.541652878154723,-2.1748806280560493,-2.734368483205263) q[7];
-u3(0.8491171591700664,-1.7175255742042916,2.918739116433593) q[9];
-u3(2.052964020797984,-2.2215998046821372,0.15473314565028629) q[9];
-cx q[27],q[9];
-u3(0.9114277181760077,-pi/2,-pi/2) q[27];
-u3(0.9512190375615817,-0.6113668581544611,-0.6918363547742175) q[9];
-cx q[27],q[9];
-u3(0.043654058320413594,0,pi/2) q[27];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[9];
-cx q[27],q[9];
-u3(2.080074244812159,0.8274202249597256,1.7160324138850322) q[27];
-u3(1.9243918533307869,0.28356982875063963,-0.5486934680062063) q[27];
-cx q[26],q[27];
-u3(0.7559100772776863,-pi/2,-pi/2) q[26];
-u3(0.7315357919427715,0.06373365426006172,-1.6563494574498812) q[27];
-cx q[26],q[27];
-u3(0.2828131804313759,0,pi/2) q[26];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[27];
-cx q[26],q[27];
-u3(2.0030037371336564,-1.1377809393172957,-2.4909562019297704) q[26];
-u3(1.9492100271754125,3.021371278386157,-3.133553176031468) q[26];
-cx q[26],q[7];
-u3(1.0851168024540205,-pi/2,-pi/2) q[26];
-u3(1.6118451255892554,-1.1882851931816847,1.9752741780445806) q[27];
-u3(1.5435878065578694,-1.391019523420848,-0.736105004888798) q[27];
-cx q[27],q[31];
-u3(0.4337381766115791,-pi/2,-pi/2) q[27];
-u3(0.8194379134858927,-0.4219887318792237,-0.9890343939881472) q[31];
-cx q[27],q[31];
-u3(0.16282762344095203,-pi,-pi/2) q[27];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[31];
-cx q[27],q[31];
-u3(0.5577272265218104,-1.2741590686047033,-0.771662778321911) q[27];
-u3(1.4096638560239036,1.9776761035771413,1.5984050784440011) q[27];
-u3(0.8129221516763019,-2.7242936573952288,-2.520367394449924) q[31];
-u3(0.756875575441992,-2.175725984107368,3.0441403786182573) q[31];
-cx q[31],q[1];
-u3(0.8001781821372971,-0.37865060557743746,-1.0518625401473027) q[1];
-u3(0.5248181095852188,-pi/2,-pi/2) q[31];
-cx q[31],q[1];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[1];
-u3(0.3766003454839788,-pi,-pi/2) q[31];
-cx q[31],q[1];
-u3(1.874470521625719,-0.6993723590094687,0.04033854574996898) q[1];
-u3(2.472125927595236,-3.0517122329336814,1.6891609132674485) q[1];
-u3(1.945496016228864,-1.2454044095460723,-2.8094754558969504) q[31];
-u3(2.173261727797383,2.6334295569863997,-1.6745350393524148) q[31];
-u3(0.9707784926464738,-0.6304702602330381,-0.6584833813716884) q[7];
-cx q[26],q[7];
-u3(0.6414958502918735,-pi,-pi/2) q[26];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[7];
-cx q[26],q[7];
-u3(0.717522834796899,-2.124655441657492,2.8471015275673963) q[26];
-u3(1.6356287743577353,0.9022494945750514,-2.930029587118855) q[26];
-cx q[22],q[26];
-u3(1.1600268369925757,-pi/2,-pi/2) q[22];
-u3(0.8887314435039619,-0.5378885952284334,-0.8129667180509248) q[26];
-cx q[22],q[26];
-u3(0.11830777476281204,0,pi/2) q[22];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[26];
-cx q[22],q[26];
-u3(2.3903297666469716,-2.929824785309581,-2.5273540614266983) q[22];
-u3(0.40262041594912773,2.828002592013327,-0.8967102246943499) q[22];
-cx q[22],q[2];
-u3(0.7460011189366317,-0.1887202713580609,-1.3163685634768907) q[2];
-u3(0.4859200543344681,-pi/2,-pi/2) q[22];
-cx q[22],q[2];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[2];
-u3(0.04048592831486561,0,pi/2) q[22];
-cx q[22],q[2];
-u3(2.2607099486126563,1.8063095078009495,1.209934737188318) q[2];
-u3(1.976133644515131,1.906417047463421,-2.466204938728082) q[2];
-cx q[2],q[6];
-u3(0.6536709663934208,-pi/2,-pi/2) q[2];
-u3(2.750728604166196,0.8882694226272001,-2.872149295509433) q[22];
-u3(2.7539273240866486,-0.21224537726831372,-3.046282507605614) q[22];
-u3(1.4472459252959502,2.777815434397782,-2.306379804639701) q[26];
-u3(1.8928738106713785,2.103130524674749,-0.467935233276199) q[26];
-cx q[21],q[26];
-u3(0.8001314171131728,-pi/2,-pi/2) q[21];
-u3(0.8996214913965976,-0.5523111248620203,-0.789934422501652) q[26];
-cx q[21],q[26];
-u3(0.6664090399582002,0,pi/2) q[21];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[26];
-cx q[21],q[26];
-u3(0.6029902026606504,-0.0952247701039397,-0.28218166757591945) q[21];
-u3(2.2340447786179816,-2.942393509199287,-1.3863141716084142) q[21];
-u3(0.8155053868926949,-1.918200840796814,0.3252028749474727) q[26];
-u3(2.756388882659053,-0.931615211149091,1.6012733088293425) q[26];
-cx q[26],q[21];
-u3(0.9214776890362133,-0.5790419386960557,-0.7463569450030754) q[21];
-u3(0.9305593679199317,-pi/2,-pi/2) q[26];
-cx q[26],q[21];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[21];
-u3(0.10648584055537201,-pi,-pi/2) q[26];
-cx q[26],q[21];
-u3(2.0303420027235197,-2.155222210605874,3.0062442240720078) q[21];
-u3(1.9225347131310249,1.7325816141331218,-1.6704857193671883) q[21];
-u3(1.8187468402857918,-2.5127255490881835,-1.8714580437903692) q[26];
-u3(1.7292311331294787,-1.267857710222921,2.1260803013557474) q[26];
-u3(0.7544114374286058,-0.23107401776752834,-1.2584805501150242) q[6];
-cx q[2],q[6];
-u3(0.3739390046597695,0,pi/2) q[2];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[6];
-cx q[2],q[6];
-u3(2.589003089436089,2.038918378613767,1.3694112164025194) q[2];
-u3(0.3532189630520335,0.8184901766610779,-0.7512664954957158) q[2];
-u3(1.9757571258638311,1.6380521234812235,1.9636739092302156) q[6];
-u3(2.20116000272397,1.9871257801898672,0.49069605735738975) q[6];
-u3(1.2580925888295524,-0.26327707375608256,0.42880341456692816) q[7];
-u3(1.9384824492499693,-1.1986892617931875,-2.351605342039684) q[7];
-cx q[14],q[7];
-u3(1.122918150097798,-pi/2,-pi/2) q[14];
-u3(0.9123750101789676,-0.5682457860823065,-0.7641056288858099) q[7];
-cx q[14],q[7];
-u3(0.4270243283605921,-pi,-pi/2) q[14];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[7];
-cx q[14],q[7];
-u3(1.0350178280324693,-1.9419410587941184,-0.5705899098047338) q[14];
-u3(2.063757752548095,1.2273387167462442,-1.9110959280938342) q[14];
-u3(0.9802716968402105,-0.767532228806997,2.419726187544274) q[7];
-u3(1.9974623597185222,2.3126205821938566,2.615327447705617) q[7];
-cx q[3],q[7];
-u3(1.134518138819557,-pi/2,-pi/2) q[3];
-u3(0.9220631387455421,-0.5797207904365238,-0.7452337820498709) q[7];
-cx q[3],q[7];
-u3(0.03275592920767853,-pi,-pi/2) q[3];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[7];
-cx q[3],q[7];
-u3(0.7215996814887231,1.8620117473560427,0.46282395610212257) q[3];
-u3(2.1836179382009817,-2.5104673761963667,1.9394858086763422) q[3];
-u3(2.1928854119071732,-1.396746907708668,2.5313608771928484) q[7];
-u3(1.8354852346998205,0.3961962998695059,-2.860255912138401) q[7];
-u3(0.8095959761225042,2.503365375398105,1.5254882407385537) q[9];
-u3(1.1380719020272718,0.2743498671303062,3.122986506641312) q[9];
-cx q[9],q[29];
-u3(0.8812456409939774,-0.5274979638588393,-0.8293735485449485) q[29];
-u3(1.034151584531233,-pi/2,-pi/2) q[9];
-cx q[9],q[29];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[29];
-u3(0.15839483977674074,-pi,-pi/2) q[9];
-cx q[9],q[29];
-u3(2.0907976634785412,-0.8462049480528062,-2.438547411341224) q[29];
-u3(1.4500440479659118,-0.31638147004423,-2.2799555522856965) q[29];
-cx q[23],q[29];
-u3(1.1459314526875821,-pi/2,-pi/2) q[23];
-u3(0.8960738130908791,-0.5476990363379164,-0.7973339234742021) q[29];
-cx q[23],q[29];
-u3(0.33228514412663634,-pi,-pi/2) q[23];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[29];
-cx q[23],q[29];
-u3(0.14225425188374927,-1.4641852908728783,1.223364458152398) q[23];
-u3(1.0651055101754823,-2.1278830093139045,-1.6454158112552357) q[23];
-u3(1.9612323702783556,0.08482232615078589,-1.6998566339792998) q[29];
-u3(2.260906599156832,-1.0682444609789972,-1.4065790866168657) q[29];
-cx q[29],q[16];
-u3(0.8508718961485241,-0.4806765613938344,-0.9016207502834739) q[16];
-u3(1.0357322957382327,-pi/2,-pi/2) q[29];
-cx q[29],q[16];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[16];
-u3(0.16517176507370276,-pi,-pi/2) q[29];
-cx q[29],q[16];
-u3(0.10560769250892696,-2.5745466348014725,0.0014386070704786036) q[16];
-u3(1.910340105411933,-2.1906850426543687,1.905695557909059) q[16];
-cx q[16],q[15];
-u3(0.9597784768124411,-0.6199200196869294,-0.6770183437425157) q[15];
-u3(0.8739293246318955,-pi/2,-pi/2) q[16];
-cx q[16],q[15];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[15];
-u3(0.5957092533548793,0,pi/2) q[16];
-cx q[16],q[15];
-u3(2.7295645152760355,-1.6710367309315255,0.9678621603441684) q[15];
-u3(2.4111129434214047,1.292281527224481,2.3267380935808113) q[15];
-cx q[15],q[3];
-u3(0.7338384307254824,-pi/2,-pi/2) q[15];
-u3(0.28723704151900675,-0.2111323727310861,-0.3481384561071663) q[16];
-u3(1.5652105247955108,1.060282022885767,-2.1251926541718955) q[16];
-cx q[16],q[22];
-u3(0.7648162202909743,-pi/2,-pi/2) q[16];
-u3(0.7658483175722167,-0.2773637425097797,-1.1946216712048976) q[22];
-cx q[16],q[22];
-u3(0.4513698744704195,0,pi/2) q[16];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[22];
-cx q[16],q[22];
-u3(1.5723987584723127,2.5575051914538873,2.609151327657419) q[16];
-u3(1.2400075657031262,-2.3986604817929527,-0.34659418505538486) q[16];
-u3(2.082793700751798,2.5013578913431394,-1.8152926819922088) q[22];
-u3(2.20116000272397,1.9871257801898672,0.49069605735738975) q[22];
-u3(1.2114131340174459,-2.6271153152678623,1.287397808504176) q[29];
-u3(1.6597843688613607,-2.529841836537093,2.8370061817909393) q[29];
-cx q[29],q[5];
-u3(1.0117922589695318,-pi/2,-pi/2) q[29];
-u3(0.8389401277463865,-0.45984267963535785,-0.9330044576553753) q[3];
-cx q[15],q[3];
-u3(0.29111413193193486,-pi,-pi/2) q[15];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[3];
-cx q[15],q[3];
-u3(0.7499795330321712,1.3238696364863793,1.9208416294318331) q[15];
-u3(1.8216081068145096,-1.9846995823486457,-0.821334870502195) q[15];
-cx q[15],q[26];
-u3(0.972422012886182,-pi/2,-pi/2) q[15];
-u3(0.8073973604544485,-0.39571504359208864,-1.0272742672533113) q[26];
-cx q[15],q[26];
-u3(0.04790763547886077,-pi,-pi/2) q[15];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[26];
-cx q[15],q[26];
-u3(1.3971398119032976,2.919163828037888,-2.8208689193691168) q[15];
-u3(0.9943170599358462,-2.3331785065686965,1.5770128388995603) q[15];
-u3(1.8809969906685706,1.1199622138486403,-1.257848358990964) q[26];
-u3(1.9787069809507791,1.1566071905322062,0.9197017875579876) q[26];
-u3(0.8139873470862816,-0.939442492675798,1.2834102702479413) q[3];
-u3(1.3799888990825724,0.8162656179726886,1.6477860237966429) q[3];
-cx q[30],q[23];
-u3(0.9777388526387599,-0.6369028924221909,-0.6470331197222983) q[23];
-u3(0.7286998582314803,-pi/2,-pi/2) q[30];
-cx q[30],q[23];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[23];
-u3(0.1921437310377576,0,pi/2) q[30];
-cx q[30],q[23];
-u3(1.9151255808016183,2.2435169998609705,-1.35071579262604) q[23];
-u3(1.1270612285035335,-2.1716025172213587,-1.7732651243754098) q[23];
-cx q[14],q[23];
-u3(0.7292082769054857,-pi/2,-pi/2) q[14];
-u3(0.8008833248180032,-0.38036586316759013,-1.049399243714202) q[23];
-cx q[14],q[23];
-u3(0.22074822411836986,-pi,-pi/2) q[14];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[23];
-cx q[14],q[23];
-u3(1.705922882578992,-2.830500473099574,-3.137838171366053) q[14];
-u3(1.9525726647533885,-0.9246414708896267,-0.9671507086281679) q[14];
-u3(1.0552902998134481,-2.259983746931465,2.5368726266516903) q[23];
-u3(0.9265383362582983,1.6706284274835443,-0.0030461891848259093) q[23];
-cx q[14],q[23];
-u3(1.2117639065727681,-pi/2,-pi/2) q[14];
-u3(0.9003325621487956,-0.553225825069231,-0.7884629635235907) q[23];
-cx q[14],q[23];
-u3(0.5117403205073466,0,pi/2) q[14];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[23];
-cx q[14],q[23];
-u3(2.4351822528065123,-1.5109559536239858,-0.7874077229378944) q[14];
-u3(1.8415300603610678,3.1276153974643766,0.32523776711620966) q[14];
-u3(1.1318924998694804,-2.924491736058686,2.581632577347092) q[23];
-u3(1.7868104918560392,0.5417833948569148,0.4720223774986918) q[23];
-u3(0.38046315885669674,1.7346932605777594,-2.186918993158905) q[30];
-u3(1.0273910190074134,0.5216979108582476,-0.5637756429862364) q[30];
-cx q[18],q[30];
-u3(0.8553338554045652,-pi/2,-pi/2) q[18];
-u3(0.7832190676151304,-0.33363999799145283,-1.1159086373003184) q[30];
-cx q[18],q[30];
-u3(0.5527033676397226,-pi,-pi/2) q[18];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[30];
-cx q[18],q[30];
-u3(2.0647742606030963,-1.1507047922719011,-1.5448478258284162) q[18];
-u3(1.2865737314378054,-2.4985078956757674,-2.5173258119984387) q[18];
-cx q[18],q[17];
-u3(0.8447427676261816,-0.47017143514585946,-0.9174981603674581) q[17];
-u3(0.160796708691837,-pi/2,-pi/2) q[18];
-cx q[18],q[17];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[17];
-u3(0.06107990906620342,-pi,-pi/2) q[18];
-cx q[18],q[17];
-u3(2.0214927533209246,-0.18342684585276903,-0.4077216104537804) q[17];
-u3(1.0146049079080113,1.1667602214989392,2.7859601490282104) q[17];
-cx q[14],q[17];
-u3(0.6567336714819642,-pi/2,-pi/2) q[14];
-u3(0.8984854293668367,-0.550843043426958,-0.7922933492997082) q[17];
-cx q[14],q[17];
-u3(0.3486810688249076,0,pi/2) q[14];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[17];
-cx q[14],q[17];
-u3(2.041280537250883,0.46131742146040633,2.3068816420198806) q[14];
-u3(1.8240751593710467,-2.4156158588180165,1.3525363275240307) q[14];
-u3(1.5634943958839354,-1.6433206867277619,1.498139992952943) q[17];
-u3(2.0755790897473867,-0.8724892024745898,-2.7542910623693118) q[17];
-u3(0.893063291624352,-0.6184406438509402,-0.33648136494846925) q[18];
-u3(1.0928668556740353,-2.8001631486521963,-2.490971172614849) q[18];
-cx q[2],q[18];
-u3(0.9396449043252905,-0.5992901121146703,-0.7124656896274804) q[18];
-u3(0.7648133884464802,-pi/2,-pi/2) q[2];
-cx q[2],q[18];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[18];
-u3(0.08618568414557129,0,pi/2) q[2];
-cx q[2],q[18];
-u3(1.4198296824775012,0.7439046526578297,-2.8292973152348155) q[18];
-u3(1.0422954531045416,-0.12059699910155786,-2.628036027678866) q[18];
-u3(2.72036487826801,-2.5875234707806545,0.6877073735098551) q[2];
-u3(1.2076488091258002,-0.8351532199163643,0.2682838931458873) q[2];
-cx q[0],q[2];
-u3(0.7151834946278262,-pi/2,-pi/2) q[0];
-u3(0.9277142640962414,-0.5861807042886391,-0.7345017724075049) q[2];
-cx q[0],q[2];
-u3(0.3637116080743753,0,pi/2) q[0];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[2];
-cx q[0],q[2];
-u3(0.6787240618377055,2.424036846446242,1.3460630158888582) q[0];
-u3(1.2209778783274745,1.8776364011221967,-2.882570612548732) q[0];
-u3(2.116394718292286,2.2043174963071612,-0.5649662499166697) q[2];
-u3(1.5692417252108741,1.6950044850638966,-1.18490106581216) q[2];
-cx q[0],q[2];
-u3(1.1140824827102993,-pi/2,-pi/2) q[0];
-u3(0.9557522837990133,-0.6159354329496858,-0.6839438221563796) q[2];
-cx q[0],q[2];
-u3(0.0013506860983733037,0,pi/2) q[0];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[2];
-cx q[0],q[2];
-u3(1.8115870987919076,-2.557076957590798,0.45275379635862256) q[0];
-u3(2.0657409257603097,-1.79516064888081,-0.24451432019081) q[0];
-u3(2.2414404639063195,2.6653731288026794,0.9081580026163181) q[2];
-u3(2.111153580418452,-1.2492605416626839,2.3106415000186233) q[2];
-u3(0.42731962970959764,-2.788719651517794,0.7362682343381213) q[30];
-u3(0.1805269484325592,-2.760538382847062,-2.2338332709442605) q[30];
-u3(0.9501223767537346,-0.6102483038909141,-0.6937611214063075) q[5];
-cx q[29],q[5];
-u3(0.06428045277715787,-pi,-pi/2) q[29];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[5];
-cx q[29],q[5];
-u3(1.1555577949545701,2.775413021395523,-2.628447656606518) q[29];
-u3(2.184361638150768,-2.8183650314790074,1.5036955197128226) q[29];
-cx q[29],q[30];
-u3(1.1203021353985019,-pi/2,-pi/2) q[29];
-u3(0.815365706770617,-0.41338228155460444,-1.001614628801807) q[30];
-cx q[29],q[30];
-u3(0.3549649400771336,0,pi/2) q[29];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[30];
-cx q[29],q[30];
-u3(0.4566030476753362,-0.5472805597777484,0.2741013184913159) q[29];
-u3(1.642386311662898,2.0550577620555615,0.2809223552751239) q[29];
-cx q[3],q[29];
-u3(0.8885470761975035,-0.5376375030209664,-0.8133649807246037) q[29];
-u3(0.8106609749745736,-pi/2,-pi/2) q[3];
-cx q[3],q[29];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[29];
-u3(0.10297816944935974,0,pi/2) q[3];
-cx q[3],q[29];
-u3(2.5315302883859276,1.895217079092161,-0.7880432786147336) q[29];
-u3(1.6716613620742928,1.3448761422084878,1.970517838954084) q[29];
-u3(2.1657621983453317,-1.0733887039391452,-2.601597517542851) q[3];
-u3(1.3628209325303653,-1.589060855160151,-2.6097050530927857) q[3];
-cx q[17],q[3];
-u3(0.9264560484658695,-pi/2,-pi/2) q[17];
-u3(0.8113186445852891,-0.40455229035712525,-1.0144660980086968) q[3];
-cx q[17],q[3];
-u3(0.6387043170430167,0,pi/2) q[17];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[3];
-cx q[17],q[3];
-u3(1.56661269855087,-1.4665040508183318,1.8228086460979753) q[17];
-u3(2.4124860778848527,-2.7064151832784944,1.7404749615806345) q[17];
-u3(1.1523872739325411,-1.4209616876191369,0.1548060408592633) q[3];
-u3(2.36233150532585,-2.263576848105423,-1.2155436069991798) q[3];
-u3(0.993320728593607,2.010593514245846,-0.7033559011426456) q[30];
-u3(0.9005349277125205,1.3350545133332803,-0.08415184386689312) q[30];
-u3(1.1096687185405227,-0.5258939671576117,2.293867150024366) q[5];
-u3(1.8324402832737892,-3.054641309017706,0.4630846159671469) q[5];
-cx q[28],q[5];
-u3(1.0258961814038148,-pi/2,-pi/2) q[28];
-u3(0.9122452544506757,-0.5680885305511287,-0.7643626158525567) q[5];
-cx q[28],q[5];
-u3(0.12185430983897866,0,pi/2) q[28];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[5];
-cx q[28],q[5];
-u3(2.006535385175197,0.436079181653664,-3.0847385555811577) q[28];
-u3(2.028254641542446,1.3027737248904332,-2.4882412606405078) q[28];
-cx q[28],q[16];
-u3(0.980598980288947,-0.6394937530848503,-0.642387617797926) q[16];
-u3(0.24384219771607887,-pi/2,-pi/2) q[28];
-cx q[28],q[16];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[16];
-u3(0.1867116145620164,0,pi/2) q[28];
-cx q[28],q[16];
-u3(2.1109706690675143,-2.7352876028260287,2.082672108807693) q[16];
-u3(2.626332287444954,-2.705794629674618,-2.690178264349733) q[16];
-cx q[18],q[16];
-u3(0.9378772756289653,-0.5973914541431355,-0.715679458290051) q[16];
-u3(0.7901119481958757,-pi/2,-pi/2) q[18];
-cx q[18],q[16];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[16];
-u3(0.015208352981236482,-pi,-pi/2) q[18];
-cx q[18],q[16];
-u3(2.02320718864396,-2.9733556311020184,0.4288562723129292) q[16];
-u3(1.597040369069582,-2.2389101381921868,-0.3614378480185181) q[16];
-u3(0.46150891017637813,0.6018719274196234,-2.23087808950746) q[18];
-u3(1.0250908012042987,2.5261014015801315,-0.5709369133964612) q[18];
-u3(1.7622917324801863,-2.785837629100313,-2.3835661853221577) q[28];
-u3(1.8680661599455506,-1.4264484429442243,2.846958880225216) q[28];
-u3(1.9313441620700402,2.8041742302684654,-1.9550967677088535) q[5];
-u3(1.7868104918560392,0.5417833948569148,0.4720223774986918) q[5];
-cx q[22],q[5];
-u3(0.994000254287311,-pi/2,-pi/2) q[22];
-u3(0.9253041057008031,-0.5834459765704261,-0.7390548731514421) q[5];
-cx q[22],q[5];
-u3(0.37894529825795664,0,pi/2) q[22];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[5];
-cx q[22],q[5];
-u3(1.8572437744428443,1.7711804628141117,1.4686698106768663) q[22];
-u3(0.97846498120101,0.06412497510416415,-1.1018100651644378) q[22];
-u3(2.1238488375627926,1.005648876853889,-2.763342651893205) q[5];
-u3(1.1144188778306068,2.948390355897657,2.0322518563318424) q[5];
-cx q[6],q[23];
-u3(0.9253041057008031,-0.5834459765704261,-0.7390548731514421) q[23];
-u3(0.994000254287311,-pi/2,-pi/2) q[6];
-cx q[6],q[23];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[23];
-u3(0.37894529825795664,0,pi/2) q[6];
-cx q[6],q[23];
-u3(2.1238488375627926,1.005648876853889,-2.763342651893205) q[23];
-u3(2.638892826117332,-2.1277229887540403,-0.299011029294872) q[23];
-u3(1.8572437744428443,1.7711804628141117,1.4686698106768663) q[6];
-u3(2.1652996826716167,0.5672189193428583,-0.10835092802986157) q[6];
-cx q[15],q[6];
-u3(0.8648350409850196,-pi/2,-pi/2) q[15];
-u3(0.9342083103915909,-0.5934028238587503,-0.7224058572497647) q[6];
-cx q[15],q[6];
-u3(0.3975309002074095,-pi,-pi/2) q[15];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[6];
-cx q[15],q[6];
-u3(0.1371277092687991,0.5391423262490505,-0.7274080428224732) q[15];
-u3(2.9523839309434523,-1.445488767220138,1.875812453688134) q[15];
-u3(1.7267303397373053,0.7603958544192864,0.03599600798425717) q[6];
-u3(2.341008335438453,0.5667566113032043,2.796855131651234) q[6];
-cx q[17],q[6];
-u3(0.6137058071549457,-pi/2,-pi/2) q[17];
-u3(0.8352624920419722,-0.4530904406797629,-0.9430881036367218) q[6];
-cx q[17],q[6];
-u3(0.439114506450944,0,pi/2) q[17];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[6];
-cx q[17],q[6];
-u3(1.2852909417716358,1.5935688137496822,0.3016587698760316) q[17];
-u3(1.9290279293584276,-1.8829425536540132,2.831366141115348) q[17];
-u3(1.5129530227982984,0.18439426527578906,-1.1356993701820102) q[6];
-u3(1.2102334103090526,1.8500386871734031,0.3733022808527382) q[6];
-u3(1.7405578266653365,-0.23283663340599237,0.3804844310050539) q[9];
-u3(0.928012877344972,2.831529505868696,2.3312173707544215) q[9];
-cx q[13],q[9];
-u3(0.646962147363398,-pi/2,-pi/2) q[13];
-u3(0.9096879606860626,-0.5649693901375961,-0.7694510719913925) q[9];
-cx q[13],q[9];
-u3(0.28919227970631345,0,pi/2) q[13];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[9];
-cx q[13],q[9];
-u3(1.067236510545221,-2.7377566965396674,1.3214603037584425) q[13];
-u3(1.470993592390566,-0.18743133506883236,-2.7937591181259913) q[13];
-cx q[27],q[13];
-u3(0.8585568239411346,-0.4933048768294861,-0.8823834770396157) q[13];
-u3(1.0430930321139036,-pi/2,-pi/2) q[27];
-cx q[27],q[13];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[13];
-u3(0.06424685303074722,0,pi/2) q[27];
-cx q[27],q[13];
-u3(1.333507454704426,-1.4983678299204155,1.7012233215928898) q[13];
-u3(1.7167945237290771,-1.5119074716449403,2.484138724027651) q[13];
-cx q[13],q[20];
-u3(0.7617294961080813,-pi/2,-pi/2) q[13];
-u3(0.944998584712042,-0.604951696901963,-0.7028357777506233) q[20];
-cx q[13],q[20];
-u3(0.39514898131033827,0,pi/2) q[13];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[20];
-cx q[13],q[20];
-u3(0.58807737762737,-2.2514216322818372,0.13431122418074803) q[13];
-u3(0.2829708400594975,-0.13930174924689798,-1.1883848751163892) q[13];
-u3(0.41179087579564955,-2.0917423011838583,-2.6596836530832926) q[20];
-u3(1.1024879833950312,-0.6619603077734948,-0.8155564220017593) q[20];
-cx q[11],q[20];
-u3(0.708304991408972,-pi/2,-pi/2) q[11];
-u3(0.7349224373047633,-0.10752680557424599,-1.42631129476462) q[20];
-cx q[11],q[20];
-u3(0.033933522546994985,-pi,-pi/2) q[11];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[20];
-cx q[11],q[20];
-u3(1.3691185365323184,-3.026535088803027,0.11238278866593365) q[11];
-u3(1.2209778783274745,1.8776364011221967,-2.882570612548732) q[11];
-u3(1.293857587032339,-2.815099092441071,3.0168425152511293) q[20];
-u3(1.7827672856086256,1.1811336472489948,0.6115929538381182) q[20];
-u3(2.6165219955750088,-0.9795757637917122,0.6485579756228921) q[27];
-u3(1.7241457149054733,2.4072672254272547,-1.387140811018178) q[27];
-cx q[31],q[27];
-u3(0.9806932991957367,-0.6395786822388896,-0.6422350008725317) q[27];
-u3(0.7007605258748254,-pi/2,-pi/2) q[31];
-cx q[31],q[27];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[27];
-u3(0.005154944756735822,-pi,-pi/2) q[31];
-cx q[31],q[27];
-u3(2.118713345084425,-1.9042020868876768,2.2699557775905816) q[27];
-u3(2.796424669787792,-2.0268292769697007,-2.5185661368241927) q[27];
-cx q[27],q[25];
-u3(0.9497465501152997,-0.6098637624775862,-0.6944221448517602) q[25];
-u3(0.7697168086826077,-pi/2,-pi/2) q[27];
-cx q[27],q[25];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[25];
-u3(0.34030598042709154,0,pi/2) q[27];
-cx q[27],q[25];
-u3(2.906304253909757,3.0260459061516567,-1.056057762260226) q[25];
-u3(1.3731712642748195,3.0388235704201296,-0.15989120259998035) q[25];
-u3(2.31253055763591,0.7707421475327516,-0.18063570846211263) q[27];
-u3(1.5006370743060078,1.8019933453264283,-1.422434762887355) q[27];
-cx q[27],q[25];
-u3(0.9500239298326082,-0.6101476341085341,-0.6939342054848776) q[25];
-u3(0.7194156527415418,-pi/2,-pi/2) q[27];
-cx q[27],q[25];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[25];
-u3(0.2625055180585261,-pi,-pi/2) q[27];
-cx q[27],q[25];
-u3(1.3645553474750534,0.5333375633771329,-2.321937304002984) q[25];
-u3(0.6791916645672685,-0.6664666553126661,-2.7928103201233307) q[25];
-u3(1.1396272364913644,-2.1205337983081325,0.8246055046268475) q[27];
-u3(2.2776686254186864,-1.9852316459540855,0.149699933170099) q[27];
-u3(0.7155814268299782,-0.5893711591709145,2.8566335382910237) q[31];
-u3(2.624550398449429,-0.2743827539417305,2.1221222108197404) q[31];
-cx q[13],q[31];
-u3(0.5473091432557278,-pi/2,-pi/2) q[13];
-u3(0.809203272999504,-0.3998206500078778,-1.021330400089635) q[31];
-cx q[13],q[31];
-u3(0.11754103734826428,0,pi/2) q[13];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[31];
-cx q[13],q[31];
-u3(0.8548009387461422,-2.0867276428291426,1.6906128236526783) q[13];
-u3(1.0336133721565768,-3.0044137935018993,0.17188334506600622) q[13];
-u3(2.2786893772969354,-2.800368379487421,1.0134923748690632) q[31];
-u3(1.1767384003118566,0.03351246674060837,3.08302175910981) q[31];
-u3(2.3096469708848173,-0.012151113274851078,-0.6893517600276731) q[9];
-u3(0.6815093543206627,-1.6678636034465537,0.9250542136300695) q[9];
-cx q[24],q[9];
-u3(0.6547340271882253,-pi/2,-pi/2) q[24];
-u3(0.8981339433792022,-0.5503871580625326,-0.7930251860089363) q[9];
-cx q[24],q[9];
-u3(0.10027698146933495,-pi,-pi/2) q[24];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[9];
-cx q[24],q[9];
-u3(1.2968209240255837,0.9780742719587163,0.8933552116880481) q[24];
-u3(0.9724936564560237,-2.878318141319265,0.5990234261934573) q[24];
-cx q[4],q[24];
-u3(0.8895551039272195,-0.5390074512636684,-0.811190975060665) q[24];
-u3(1.0537733004059897,-pi/2,-pi/2) q[4];
-cx q[4],q[24];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[24];
-u3(0.03999716721583258,-pi,-pi/2) q[4];
-cx q[4],q[24];
-u3(2.382648173544741,1.4992968907205917,-0.2183688402892976) q[24];
-u3(0.512898017659523,2.4749041334342943,-1.2939445708332638) q[24];
-cx q[10],q[24];
-u3(0.16751509691647964,-pi/2,-pi/2) q[10];
-u3(0.7644520715468701,0.2722063230075382,-1.939820611355998) q[24];
-cx q[10],q[24];
-u3(0.11762296789262884,-pi,-pi/2) q[10];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[24];
-cx q[10],q[24];
-u3(1.6108395434509868,1.3401999704103638,-0.6266402450199244) q[10];
-u3(1.5692417252108741,1.6950044850638966,-1.18490106581216) q[10];
-cx q[11],q[10];
-u3(0.9557522837990133,-0.6159354329496858,-0.6839438221563796) q[10];
-u3(1.1140824827102993,-pi/2,-pi/2) q[11];
-cx q[11],q[10];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[10];
-u3(0.0013506860983733037,0,pi/2) q[11];
-cx q[11],q[10];
-u3(2.2414404639063195,2.6653731288026794,0.9081580026163181) q[10];
-u3(1.4140339094355185,2.785397267040663,-0.49796608827500544) q[10];
-u3(1.8115870987919076,-2.557076957590798,0.45275379635862256) q[11];
-u3(1.3280566042142925,1.8355277245259582,0.0750355829836935) q[11];
-cx q[11],q[22];
-u3(0.8945403755533486,-pi/2,-pi/2) q[11];
-u3(0.9603689881054043,-0.6204987656615968,-0.6760091254242226) q[22];
-cx q[11],q[22];
-u3(0.6195201416440872,-pi,-pi/2) q[11];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[22];
-cx q[11],q[22];
-u3(0.7706980716498446,-1.942346768971068,1.9978252210037537) q[11];
-u3(1.5500575400318855,2.6377063464741655,-2.488592106996915) q[11];
-u3(1.4016627004119306,0.023791959144805475,-2.6252061440423082) q[22];
-u3(2.0212092815253775,-1.2341416973408297,2.2657617189095927) q[22];
-u3(1.4516820513302975,-2.624277937980152,-2.8647075321344997) q[24];
-u3(1.0881669942400762,-1.2631855069928415,-2.999433182107202) q[24];
-cx q[24],q[31];
-u3(0.3251153797102209,-pi/2,-pi/2) q[24];
-cx q[26],q[10];
-u3(0.8474229723805237,-0.4748146241643356,-0.9104940457847643) q[10];
-u3(0.47815922939987054,-pi/2,-pi/2) q[26];
-cx q[26],q[10];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[10];
-u3(0.0022004958010658896,-pi,-pi/2) q[26];
-cx q[26],q[10];
-u3(1.847703072778759,-1.433342271159339,0.9139672400552454) q[10];
-u3(0.8856055599360536,1.6471767702091586,2.51391638674742) q[10];
-cx q[10],q[22];
-u3(0.6675940693981629,-pi/2,-pi/2) q[10];
-u3(0.8994895886667283,-0.5521410958965269,-0.790207799396704) q[22];
-cx q[10],q[22];
-u3(0.33463417910379234,0,pi/2) q[10];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[22];
-cx q[10],q[22];
-u3(0.23275029873588307,0.0676385565187263,1.4198882403210025) q[10];
-u3(2.810015471412842,-2.2532206900740848,-3.0717863055404866) q[10];
-u3(1.6932514922324342,2.5445428282636833,0.8743521996492749) q[22];
-u3(1.984144434694898,-2.3240682240024517,1.3253940172205398) q[22];
-cx q[10],q[22];
-u3(1.220144256049586,-pi/2,-pi/2) q[10];
-u3(0.977309441751177,-0.6365113058645147,-0.6477335357990803) q[22];
-cx q[10],q[22];
-u3(0.6381858766346367,-pi,-pi/2) q[10];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[22];
-cx q[10],q[22];
-u3(1.6548258774501448,-0.3310357452465795,-0.06214562835016446) q[10];
-u3(2.7291397236406882,2.344525310173811,1.0705662382951342) q[10];
-u3(2.1227295019970818,2.539281058423006,0.056466053811173644) q[22];
-u3(2.370244075464652,0.1459384525005505,-0.653752552798621) q[22];
-u3(0.7451050382533579,-0.5101278518509087,3.1259738956380323) q[26];
-u3(0.9605102089605859,2.0579194153283353,1.8761175057204325) q[26];
-u3(0.7370623474518917,0.1275349309956999,-1.7422761157642688) q[31];
-cx q[24],q[31];
-u3(0.01236624546315442,0,pi/2) q[24];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[31];
-cx q[24],q[31];
-u3(1.6515145708223558,-1.6981871726692583,0.612435586859335) q[24];
-u3(2.1475526513512606,1.9435959322592664,0.7102718348075632) q[24];
-cx q[24],q[27];
-u3(0.38839071325836033,-pi/2,-pi/2) q[24];
-u3(0.8351629207771574,-0.4529053089139814,-0.9433639996874401) q[27];
-cx q[24],q[27];
-u3(0.034338118688081586,0,pi/2) q[24];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[27];
-cx q[24],q[27];
-u3(1.7146248025757613,1.4001871292459995,-2.889834932451002) q[24];
-u3(1.6892912974442775,-1.7412625275498126,0.9406972490785002) q[24];
-cx q[24],q[11];
-u3(0.8429248825923578,-0.46697699885048927,-0.9223046855867985) q[11];
-u3(0.554599645608722,-pi/2,-pi/2) q[24];
-cx q[24],q[11];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[11];
-u3(0.16718095771644645,-pi,-pi/2) q[24];
-cx q[24],q[11];
-u3(1.2251987615440914,2.21259588525046,1.5332534581754897) q[11];
-u3(0.3716103058819472,-2.189655143963864,1.9990565941242613) q[11];
-u3(0.350661533741517,-0.9708836204711857,-1.7618015407853487) q[24];
-u3(2.184361638150768,-2.8183650314790074,1.5036955197128226) q[24];
-u3(0.8040852529620774,2.875288275248754,-3.0951657214101314) q[27];
-u3(0.6776430602868183,1.7246912682387148,-0.803068333204922) q[27];
-cx q[26],q[27];
-u3(0.6166251749159339,-pi/2,-pi/2) q[26];
-u3(0.7720092480890187,-0.2988485580343574,-1.164727061214089) q[27];
-cx q[26],q[27];
-u3(0.14321262525242975,0,pi/2) q[26];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[27];
-cx q[26],q[27];
-u3(1.22202344133997,1.5710830898402328,2.970173757801934) q[26];
-u3(2.1702111106596305,-2.396848704638927,0.724127623344343) q[26];
-u3(0.5432367587597556,2.5863403146578037,1.842332726832316) q[27];
-u3(0.3863547066650217,1.685320757430409,-0.7232697741520293) q[27];
-u3(2.2617297146660436,3.0844250321276903,1.3572790679978564) q[31];
-u3(0.5980953919568495,-2.077856829914852,1.5090348472843242) q[31];
-cx q[31],q[28];
-u3(0.8809682630367703,-0.5271050631704499,-0.8299910279879725) q[28];
-u3(0.6306770991766303,-pi/2,-pi/2) q[31];
-cx q[31],q[28];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[28];
-u3(0.16835729261639742,-pi,-pi/2) q[31];
-cx q[31],q[28];
-u3(1.9255665578795658,-2.042335748289885,1.7699931935229394) q[28];
-u3(1.298684360900962,-0.24164269122879922,-0.5852364479904288) q[28];
-u3(2.835419024246415,-1.8872337469935254,0.8971032023570409) q[31];
-u3(0.37851374183974507,-0.4530745616495415,2.1094312921612577) q[31];
-u3(1.9979185377305984,-1.1163617541920674,-0.7582971500858768) q[4];
-u3(0.45936135762457236,1.459433386429569,1.5905440389955814) q[4];
-cx q[4],q[8];
-u3(1.0461834340415856,-pi/2,-pi/2) q[4];
-u3(0.8476127558302798,-0.4751404559972445,-0.9100017380856489) q[8];
-cx q[4],q[8];
-u3(0.31531255330296154,0,pi/2) q[4];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[8];
-cx q[4],q[8];
-u3(1.9387414086126407,0.5904274285744879,2.321131045777527) q[4];
-u3(2.2555277470651895,-0.8890427462382497,1.7741335113262657) q[4];
-u3(1.2125849152943733,3.100471318690067,1.038290095019602) q[8];
-u3(2.7341097849973397,1.387667875816299,2.4235499298782415) q[8];
-cx q[8],q[13];
-u3(0.9482854880577046,-0.6083629061506675,-0.6969987949519911) q[13];
-u3(0.6950295644799799,-pi/2,-pi/2) q[8];
-cx q[8],q[13];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[13];
-u3(0.2705045898543906,0,pi/2) q[8];
-cx q[8],q[13];
-u3(0.8271049579653322,-2.6740692871883716,1.498520239398946) q[13];
-u3(1.707799607570427,-0.40852770793013926,-2.280589635835526) q[13];
-u3(2.692211635997826,-0.320285755812451,0.8326748407177069) q[8];
-u3(0.6970497211519835,1.8896910561151445,0.8852762471829569) q[8];
-u3(0.6263323466224197,-0.29916532505071913,0.07278718815331064) q[9];
-u3(2.4139523171683277,1.5365608147156733,1.1364465604845018) q[9];
-cx q[9],q[1];
-u3(0.8884244012964728,-0.5374702985930564,-0.8136301371001746) q[1];
-u3(0.7171564833105744,-pi/2,-pi/2) q[9];
-cx q[9],q[1];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[1];
-u3(0.21699082029512845,0,pi/2) q[9];
-cx q[9],q[1];
-u3(1.886031503427345,1.4252836077183257,-2.4016224553384458) q[1];
-u3(1.1049064265031523,-2.8144161822177227,-2.9346762393158947) q[1];
-cx q[1],q[7];
-u3(0.8850996633270504,-pi/2,-pi/2) q[1];
-u3(0.8282355442482923,-0.43971061341811923,-0.9629512579185189) q[7];
-cx q[1],q[7];
-u3(0.5880832684197322,0,pi/2) q[1];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[7];
-cx q[1],q[7];
-u3(1.3456177779878538,1.14497989862123,-0.2348582173699243) q[1];
-u3(0.7432705868995056,2.603534730115218,-0.049614222988060064) q[1];
-cx q[1],q[20];
-u3(0.7622491034936638,-pi/2,-pi/2) q[1];
-u3(0.7628796233948858,-0.2662543757622897,-1.2100122230678654) q[20];
-cx q[1],q[20];
-u3(0.41031044964554453,-pi,-pi/2) q[1];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[20];
-cx q[1],q[20];
-u3(2.43044841124968,0.4910321617353661,-2.075485350102542) q[1];
-u3(1.116477929335184,2.6460970834192024,2.6081450852755053) q[1];
-cx q[13],q[1];
-u3(0.9749517124760655,-0.6343490149966731,-0.6515931651211684) q[1];
-u3(0.46856150775023636,-pi/2,-pi/2) q[13];
-cx q[13],q[1];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[1];
-u3(0.14204863240985482,-pi,-pi/2) q[13];
-cx q[13],q[1];
-u3(1.1600232936459791,-1.2621968016791818,2.8414469678493512) q[1];
-u3(2.2334525793279867,0.842608626348214,2.80430843780176) q[1];
-u3(2.1096897102416965,0.30778176491308473,-0.4819850028181065) q[13];
-u3(1.3766801492918443,-3.0240387717033066,2.8559460218979638) q[13];
-cx q[18],q[1];
-u3(0.8024032429037506,-0.3840262137753241,-1.04413655016638) q[1];
-u3(0.8744810067495907,-pi/2,-pi/2) q[18];
-cx q[18],q[1];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[1];
-u3(0.27679938509541935,-pi,-pi/2) q[18];
-cx q[18],q[1];
-u3(1.7245998804841938,2.9842116923664035,2.945632451624615) q[1];
-u3(1.708968238760889,1.17056175179966,-1.5420752977312677) q[1];
-cx q[17],q[1];
-u3(0.9310721568720931,-0.589941371202197,-0.7282164203180113) q[1];
-u3(0.4959046286080313,-pi/2,-pi/2) q[17];
-cx q[17],q[1];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[1];
-u3(0.16471647732046588,-pi,-pi/2) q[17];
-cx q[17],q[1];
-u3(1.2256042330055907,-0.5260641516231352,2.080911036517363) q[1];
-u3(2.123350620341102,0.22204918567202503,0.012037768531189208) q[1];
-u3(2.5303887857099348,1.3243157682095594,-0.46868723256867195) q[17];
-u3(2.1816112680555935,0.8482799615573686,-0.5443374052958148) q[17];
-u3(1.7630907272562368,-2.4367136209191163,0.49953136205053816) q[18];
-u3(2.187542641394061,-2.514536907596767,-0.8625160208242892) q[18];
-u3(1.481742577824203,-2.0041800889777104,1.5174284240049465) q[20];
-u3(1.327772488833346,1.6665917392110208,2.700582366773988) q[20];
-cx q[29],q[20];
-u3(0.8233796662735242,-0.4300702789620492,-0.9771706340193855) q[20];
-u3(0.8003532082382704,-pi/2,-pi/2) q[29];
-cx q[29],q[20];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[20];
-u3(0.39705422424864195,0,pi/2) q[29];
-cx q[29],q[20];
-u3(1.7100649351294974,1.0648227751725496,-0.6100911542317555) q[20];
-u3(1.1844013171936894,2.578626212166532,2.3098213403340235) q[20];
-u3(0.7001686983830533,-0.6956734475792752,-0.6997032260167675) q[29];
-u3(0.9005349277125205,1.3350545133332803,-0.08415184386689312) q[29];
-cx q[20],q[29];
-u3(0.4833645491402921,-pi/2,-pi/2) q[20];
-u3(0.8361499069810182,-0.454734940780984,-0.9406360203623692) q[29];
-cx q[20],q[29];
-u3(0.30290145701608373,-pi,-pi/2) q[20];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[29];
-cx q[20],q[29];
-u3(2.269526021831618,0.17227331921447764,-0.14686640929071215) q[20];
-u3(0.37851374183974507,-0.4530745616495415,2.1094312921612577) q[20];
-cx q[20],q[2];
-u3(0.9374820808367579,-0.5969649362850107,-0.7164003413508713) q[2];
-u3(0.7413648283992179,-pi/2,-pi/2) q[20];
-cx q[20],q[2];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[2];
-u3(0.2625018545812961,-pi,-pi/2) q[20];
-cx q[20],q[2];
-u3(1.990308280392551,2.029732832701221,-0.741714332844654) q[2];
-u3(2.1059186623563866,0.7581001484774337,2.5578197496651356) q[2];
-u3(2.0502531690169152,0.2161714473780636,-0.5420937998375592) q[20];
-u3(1.7623641499652711,-1.9910088990630568,-0.9315089138071069) q[20];
-u3(1.14738507519778,-2.699711972826104,0.4593184256634002) q[29];
-u3(2.5403112486935697,1.8594219434672876,-0.6348059142376705) q[29];
-u3(2.7244479659082104,-2.8802129988908307,-0.26600352481240463) q[7];
-u3(1.1844013171936894,2.578626212166532,2.3098213403340235) q[7];
-cx q[7],q[30];
-u3(0.8361499069810182,-0.454734940780984,-0.9406360203623692) q[30];
-u3(0.4833645491402921,-pi/2,-pi/2) q[7];
-cx q[7],q[30];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[30];
-u3(0.30290145701608373,-pi,-pi/2) q[7];
-cx q[7],q[30];
-u3(1.14738507519778,-2.699711972826104,0.4593184256634002) q[30];
-u3(2.2729584330524966,-2.2880452636562207,1.7872708129599157) q[30];
-cx q[23],q[30];
-u3(1.1171879839786985,-pi/2,-pi/2) q[23];
-u3(0.8732011499793296,-0.5158628052776661,-0.8475732666899454) q[30];
-cx q[23],q[30];
-u3(0.3476609940036382,0,pi/2) q[23];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[30];
-cx q[23],q[30];
-u3(1.8141894621047925,0.21597099743842385,0.8012968673160534) q[23];
-u3(2.1059186623563866,0.7581001484774337,2.5578197496651356) q[23];
-u3(1.313101075764925,-0.9841259265447002,-1.8497644200204664) q[30];
-u3(2.111153580418452,-1.2492605416626839,2.3106415000186233) q[30];
-cx q[31],q[30];
-u3(0.9374820808367579,-0.5969649362850107,-0.7164003413508713) q[30];
-u3(0.7413648283992179,-pi/2,-pi/2) q[31];
-cx q[31],q[30];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[30];
-u3(0.2625018545812961,-pi,-pi/2) q[31];
-cx q[31],q[30];
-u3(1.990308280392551,2.029732832701221,-0.741714332844654) q[30];
-u3(2.2202894110171663,-1.015048015795787,2.8843918256898515) q[30];
-u3(2.0502531690169152,0.2161714473780636,-0.5420937998375592) q[31];
-u3(0.9860929461491171,-3.075975233596547,-2.867443031659014) q[31];
-cx q[6],q[31];
-u3(0.8084148469319856,-0.3980358480250503,-1.0239157178412306) q[31];
-u3(0.28115176749459936,-pi/2,-pi/2) q[6];
-cx q[6],q[31];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[31];
-u3(0.010896050647316097,-pi,-pi/2) q[6];
-cx q[6],q[31];
-u3(2.3876271101455577,-0.5628919282105285,0.9548174262602585) q[31];
-u3(2.40514344553006,-0.5745102452939617,2.347770626051865) q[31];
-u3(1.914623665793158,-2.4530863896488557,2.8162329197985745) q[6];
-u3(0.5971430148712153,-0.7809354734575287,0.6563293560911783) q[6];
-u3(2.269526021831618,0.17227331921447764,-0.14686640929071215) q[7];
-u3(2.891909734425715,-2.2152887885351906,-1.2569687155054323) q[7];
-cx q[14],q[7];
-u3(0.7820008952087624,-pi/2,-pi/2) q[14];
-u3(0.8513141527965105,-0.48141927969917386,-0.900493988256013) q[7];
-cx q[14],q[7];
-u3(0.021866381899258526,0,pi/2) q[14];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[7];
-cx q[14],q[7];
-u3(1.208134884855538,-2.1936498281498276,-1.3630164126773676) q[14];
-u3(0.822682352361966,-1.0340993619443868,2.8343853308547295) q[14];
-cx q[14],q[23];
-u3(0.7540025213824603,-pi/2,-pi/2) q[14];
-u3(0.9588190516814684,-0.6189766409257254,-0.6786615903736326) q[23];
-cx q[14],q[23];
-u3(0.23969290790349956,-pi,-pi/2) q[14];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[23];
-cx q[14],q[23];
-u3(1.288457901077035,-0.05109404944060181,3.0031889512715377) q[14];
-u3(2.194269621507799,0.5782362281491302,0.5645473669415568) q[14];
-cx q[14],q[18];
-u3(0.6522220936186238,-pi/2,-pi/2) q[14];
-u3(0.7640393265635099,-0.2706591285480511,-1.2039152537959872) q[18];
-cx q[14],q[18];
-u3(0.23941472987699297,0,pi/2) q[14];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[18];
-cx q[14],q[18];
-u3(2.895934290220637,0.8576790864966988,2.362905055968956) q[14];
-u3(2.244836173309238,0.9946875522345762,-2.363306820384227) q[14];
-u3(2.4588589295201277,1.5552427676635396,1.936786941516302) q[18];
-u3(1.1830139316552173,-1.3685080741432314,-2.8987208821063293) q[18];
-cx q[18],q[22];
-u3(1.381296980069167,-pi/2,-pi/2) q[18];
-u3(0.9609960031383047,-0.6211117195715596,-0.6749393246880686) q[22];
-cx q[18],q[22];
-u3(0.0420974515121612,-pi,-pi/2) q[18];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[22];
-cx q[18],q[22];
-u3(1.4704872023805924,-2.9498003844528506,2.2554663104988277) q[18];
-u3(1.1637854130225196,-0.8140286381595065,-1.473225385372194) q[18];
-u3(2.447943189981986,-0.23240077887634536,-2.879584126989359) q[22];
-u3(0.19680464956639082,3.1147266095159454,0.18365301789598565) q[22];
-u3(0.6220066415186557,0.41887822190506085,-1.4205549445416565) q[23];
-u3(1.091373145635276,-1.6545889366810478,0.387222614912341) q[23];
-cx q[26],q[23];
-u3(0.9109305204047934,-0.5664896855360295,-0.7669730105073906) q[23];
-u3(0.8605674155911777,-pi/2,-pi/2) q[26];
-cx q[26],q[23];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[23];
-u3(0.06292876937722654,0,pi/2) q[26];
-cx q[26],q[23];
-u3(1.4956993396470706,-1.173050408107302,1.7785891014886008) q[23];
-u3(2.1885279666467965,0.312482383695897,-2.917089126441719) q[23];
-u3(1.2183990087914922,1.092370000963312,-2.766424865928003) q[26];
-u3(1.619675932494767,2.8344330709358854,-1.5551921699937146) q[26];
-cx q[31],q[14];
-u3(0.9657417764238743,-0.625699317508595,-0.6669016333321149) q[14];
-u3(1.1587667300980435,-pi/2,-pi/2) q[31];
-cx q[31],q[14];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[14];
-u3(0.06635056235614617,-pi,-pi/2) q[31];
-cx q[31],q[14];
-u3(2.2378272373707735,-1.6013561566489436,1.0853146559001656) q[14];
-u3(1.9060337033451142,2.8309182826858565,1.1174505428984336) q[14];
-u3(2.0075423204711718,0.6642496280144541,-0.2549525558961152) q[31];
-u3(1.8907223518406904,2.7122455414625444,2.673210228310932) q[31];
-u3(3.121538477690945,-1.9332037707824257,-0.0587220739077825) q[7];
-u3(0.6877786985978807,-1.3444556064061182,0.4423110277406277) q[7];
-cx q[7],q[3];
-u3(0.8957090898025515,-0.5472202480519317,-0.7981002016455694) q[3];
-u3(0.6978326063192897,-pi/2,-pi/2) q[7];
-cx q[7],q[3];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[3];
-u3(0.2628278530741033,0,pi/2) q[7];
-cx q[7],q[3];
-u3(1.373869528334257,-1.0539328622730788,1.5267877629573832) q[3];
-u3(0.1805269484325592,-2.760538382847062,-2.2338332709442605) q[3];
-cx q[24],q[3];
-u3(1.1203021353985019,-pi/2,-pi/2) q[24];
-u3(0.815365706770617,-0.41338228155460444,-1.001614628801807) q[3];
-cx q[24],q[3];
-u3(0.3549649400771336,0,pi/2) q[24];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[3];
-cx q[24],q[3];
-u3(0.4566030476753362,-0.5472805597777484,0.2741013184913159) q[24];
-u3(0.822682352361966,-1.0340993619443868,2.8343853308547295) q[24];
-cx q[24],q[2];
-u3(0.9588190516814684,-0.6189766409257254,-0.6786615903736326) q[2];
-u3(0.7540025213824603,-pi/2,-pi/2) q[24];
-cx q[24],q[2];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[2];
-u3(0.23969290790349956,-pi,-pi/2) q[24];
-cx q[24],q[2];
-u3(0.6220066415186557,0.41887822190506085,-1.4205549445416565) q[2];
-u3(1.6655320314392819,1.5318339256981544,1.076529154919137) q[2];
-u3(1.288457901077035,-0.05109404944060181,3.0031889512715377) q[24];
-u3(1.124625269972375,1.3973913745956308,-2.5138139309765055) q[24];
-u3(0.993320728593607,2.010593514245846,-0.7033559011426456) q[3];
-u3(0.9538531257224552,1.0080794723980286,-2.799339084496099) q[3];
-cx q[3],q[6];
-u3(1.3803385783362272,-pi/2,-pi/2) q[3];
-u3(0.9033536456340125,-0.557076619853897,-0.7822536776374296) q[6];
-cx q[3],q[6];
-u3(0.06568499522882458,-pi,-pi/2) q[3];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[6];
-cx q[3],q[6];
-u3(2.189401515690963,1.6246327023428293,-1.3354697953105612) q[3];
-u3(2.1819870878519083,-2.7031638458263685,-2.859303596223038) q[3];
-u3(1.657537960916296,-1.633079064545103,-1.0252922885010465) q[6];
-u3(2.3635031576254213,2.3236757175588982,0.013994320994468623) q[6];
-u3(1.4595263239528264,2.235794830171004,0.2628672298349617) q[7];
-u3(1.362410195604909,-1.8649169315157395,-0.20193807225312987) q[7];
-u3(1.5153526955878802,-2.4129689787558917,-1.8387547105921294) q[9];
-u3(1.3553149225617651,-1.971557951934125,-2.5382834440297257) q[9];
-cx q[9],q[12];
-u3(0.9592254503710465,-0.6193767075772594,-0.6779649993409809) q[12];
-u3(0.9705414731656323,-pi/2,-pi/2) q[9];
-cx q[9],q[12];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[12];
-u3(0.4215310163746081,-pi,-pi/2) q[9];
-cx q[9],q[12];
-u3(1.0387566603113627,0.5293970927881126,-0.9363057793703469) q[12];
-u3(2.157513970272696,0.8285335614877645,-1.747863564131265) q[12];
-cx q[4],q[12];
-u3(0.9289562465469677,-0.5875783077701575,-0.7321691985182657) q[12];
-u3(1.294773894463876,-pi/2,-pi/2) q[4];
-cx q[4],q[12];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[12];
-u3(0.37778958324795275,-pi,-pi/2) q[4];
-cx q[4],q[12];
-u3(0.7315282356545909,2.8599336782603997,0.2283608523000069) q[12];
-u3(0.3054648036979971,0.8230324059561491,2.027155038479237) q[12];
-cx q[25],q[12];
-u3(0.8339993222821255,-0.4507325901197805,-0.9465996746995984) q[12];
-u3(0.8589954345762755,-pi/2,-pi/2) q[25];
-cx q[25],q[12];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[12];
-u3(0.5848420943372145,-pi,-pi/2) q[25];
-cx q[25],q[12];
-u3(0.8141132900447677,1.4492384460615995,1.3143011338343715) q[12];
-u3(1.241406147480624,2.028469247319398,-0.9996902052871404) q[12];
-u3(2.1286087208064934,-2.7556031950354134,2.9342448443979023) q[25];
-u3(1.7942323047962379,-0.5339317859188388,1.052376769063219) q[25];
-u3(2.5514680837523693,-2.4367199615127317,-1.3143233614308532) q[4];
-u3(2.9132401985421312,1.6005199564909294,-0.3517973269592254) q[4];
-cx q[8],q[4];
-u3(0.7910913521480792,-0.35549764279973317,-1.0849442846425301) q[4];
-u3(0.8573338574059444,-pi/2,-pi/2) q[8];
-cx q[8],q[4];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[4];
-u3(0.5241866287845852,-pi,-pi/2) q[8];
-cx q[8],q[4];
-u3(0.5650828796085174,0.5919530062428944,-0.9639028653619537) q[4];
-u3(2.2958115222313276,-0.300246845031491,-0.7103177711018578) q[4];
-cx q[4],q[15];
-u3(0.7532308342403939,-0.22566312068941974,-1.265902085023253) q[15];
-u3(0.8761894023696044,-pi/2,-pi/2) q[4];
-cx q[4],q[15];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[15];
-u3(0.33733319141419943,0,pi/2) q[4];
-cx q[4],q[15];
-u3(1.468896107801339,0.29607110662848113,-2.0811982564007487) q[15];
-u3(0.778792634499191,0.573810691711726,2.5179194339872986) q[15];
-u3(2.402255748356068,-0.2912977177021201,-0.04749144796727167) q[4];
-u3(1.9194199200646365,-2.943075215927636,-2.2464497139302324) q[4];
-u3(2.1855389112471126,0.03695379949310862,-0.7748186906187557) q[8];
-u3(1.5330399200825837,-0.006130155389328262,-1.335347512466332) q[8];
-cx q[8],q[12];
-u3(0.7349207254919696,-0.10750925808447986,-1.4263349473914904) q[12];
-u3(0.34035988188879707,-pi/2,-pi/2) q[8];
-cx q[8],q[12];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[12];
-u3(0.15403934783761683,0,pi/2) q[8];
-cx q[8],q[12];
-u3(0.8106956453940517,-0.26475390539413857,2.119045552579136) q[12];
-u3(2.2505077258656154,-1.0820304026521264,0.6951850178325314) q[12];
-cx q[4],q[12];
-u3(0.7416346552562652,-0.16193274046197859,-1.3527682343272769) q[12];
-u3(0.7637780644961804,-pi/2,-pi/2) q[4];
-cx q[4],q[12];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[12];
-u3(0.6810367350461329,-pi,-pi/2) q[4];
-cx q[4],q[12];
-u3(0.37415697817865134,2.392605755136918,1.4674017878073924) q[12];
-u3(1.1494165122834583,-2.2975891861669875,-2.462291311303185) q[12];
-cx q[10],q[12];
-u3(1.2626349627423563,-pi/2,-pi/2) q[10];
-u3(0.978913477206838,-0.6379705683550521,-0.6451211340350618) q[12];
-cx q[10],q[12];
-u3(0.4622898076573969,-pi,-pi/2) q[10];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[12];
-cx q[10],q[12];
-u3(0.2570705829453719,-0.8169811346887013,2.4612151734696397) q[10];
-u3(0.8481956380882539,2.3819369103005066,2.9359936144235963) q[10];
-cx q[10],q[18];
-u3(0.4759839724439991,-pi/2,-pi/2) q[10];
-u3(0.2822347436127359,-2.2482130982608695,-2.4078360365068425) q[12];
-u3(1.0928668556740353,-2.8001631486521963,-2.490971172614849) q[12];
-u3(0.7856758468807239,-0.3406619760661189,-1.1059875363808978) q[18];
-cx q[10],q[18];
-u3(0.33300147542023456,0,pi/2) q[10];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[18];
-cx q[10],q[18];
-u3(0.9116759358409183,-1.2189813379055194,2.180326026694784) q[10];
-u3(1.7472770688103672,0.10284855076292665,0.2934312229680076) q[10];
-u3(1.5632002650717913,0.41394538707076833,-3.121925561751455) q[18];
-u3(2.4350551388402106,-1.6873358039420783,2.0353397409904384) q[18];
-u3(1.0919607554294315,-0.6148103261990867,-2.8266037342673522) q[4];
-u3(2.463921227506926,-2.108379218277337,1.7253601175390605) q[4];
-u3(2.193023845404314,1.7577816134091773,2.830880421646201) q[8];
-u3(2.421058999526667,0.23525907904770982,2.9577644795660403) q[8];
-cx q[7],q[8];
-u3(0.5592163638712837,-pi/2,-pi/2) q[7];
-u3(0.8358389449715393,-0.45415980029116243,-0.9414938753583932) q[8];
-cx q[7],q[8];
-u3(0.24057597006952297,0,pi/2) q[7];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[8];
-cx q[7],q[8];
-u3(1.6629195108407846,2.7338614714331975,-2.3608624027061293) q[7];
-u3(0.728222914238256,3.0592836358263362,0.8872249384161393) q[7];
-cx q[7],q[23];
-u3(0.7535786867863143,-0.2272725867560741,-1.263695414357409) q[23];
-u3(0.9832638770929295,-pi/2,-pi/2) q[7];
-cx q[7],q[23];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[23];
-u3(0.020685225809811584,0,pi/2) q[7];
-cx q[7],q[23];
-u3(2.538035295014945,-1.496139621282971,2.214762135624456) q[23];
-u3(1.6303334502575468,1.6495806508436157,1.822338780904773) q[23];
-u3(2.7843031443986512,-1.3405023032383956,2.481295467227702) q[7];
-u3(0.3532189630520335,0.8184901766610779,-0.7512664954957158) q[7];
-cx q[7],q[12];
-u3(0.9396449043252905,-0.5992901121146703,-0.7124656896274804) q[12];
-u3(0.7648133884464802,-pi/2,-pi/2) q[7];
-cx q[7],q[12];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[12];
-u3(0.08618568414557129,0,pi/2) q[7];
-cx q[7],q[12];
-u3(1.4198296824775012,0.7439046526578297,-2.8292973152348155) q[12];
-u3(1.5899017321907722,-1.847782768450909,-2.776339889904211) q[12];
-u3(2.72036487826801,-2.5875234707806545,0.6877073735098551) q[7];
-u3(1.7868104918560392,0.5417833948569148,0.4720223774986918) q[7];
-u3(1.2646162454168028,-0.9284851029252059,-2.196455353695873) q[8];
-u3(1.2011270508677514,0.30961455572725205,-1.4912726239664433) q[8];
-cx q[8],q[4];
-u3(0.7735102367431853,-0.303801804749801,-1.157809006577164) q[4];
-u3(0.5200060012667155,-pi/2,-pi/2) q[8];
-cx q[8],q[4];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[4];
-u3(0.3534982924887842,-pi,-pi/2) q[8];
-cx q[8],q[4];
-u3(2.6371032310515816,-2.8062363072905185,-0.8649232631264501) q[4];
-u3(1.6933238670644672,2.4800061967022318,1.1992972744555805) q[4];
-cx q[23],q[4];
-u3(1.1153751687197473,-pi/2,-pi/2) q[23];
-u3(0.883575101809152,-0.5307750047274276,-0.8242152327688785) q[4];
-cx q[23],q[4];
-u3(0.6500021773351283,-pi,-pi/2) q[23];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[4];
-cx q[23],q[4];
-u3(1.279153392181534,-1.6305749182994083,2.222880229633393) q[23];
-u3(2.6351816079275,-0.21724798908549658,2.9296346762391394) q[23];
-u3(2.5796175553974994,0.5819658947431057,2.3172420042646333) q[4];
-u3(1.2102334103090526,1.8500386871734031,0.3733022808527382) q[4];
-u3(1.9100033584707772,1.3879483534878139,0.7800831799856933) q[8];
-u3(1.5571091206036107,-1.9965892653381214,1.8221612062453847) q[8];
-u3(1.0985350993450087,1.3713172442052786,-0.6355332664326623) q[9];
-u3(1.976133644515131,1.906417047463421,-2.466204938728082) q[9];
-cx q[9],q[21];
-u3(0.7544114374286058,-0.23107401776752834,-1.2584805501150242) q[21];
-u3(0.6536709663934208,-pi/2,-pi/2) q[9];
-cx q[9],q[21];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[21];
-u3(0.3739390046597695,0,pi/2) q[9];
-cx q[9],q[21];
-u3(1.9757571258638311,1.6380521234812235,1.9636739092302156) q[21];
-u3(1.1946836915041041,-1.1348042862167822,-2.9965434397195043) q[21];
-cx q[21],q[19];
-u3(0.8831567975140896,-0.5301894969353063,-0.8251379413590065) q[19];
-u3(1.0773467978363922,-pi/2,-pi/2) q[21];
-cx q[21],q[19];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[19];
-u3(0.6458338174741368,-pi,-pi/2) q[21];
-cx q[21],q[19];
-u3(2.566807902358702,-0.2204905515729232,-1.4369584626111127) q[19];
-u3(0.6933235598837221,1.0168524076087753,2.732715653111465) q[19];
-cx q[16],q[19];
-u3(0.7662539973818047,-pi/2,-pi/2) q[16];
-u3(0.8112482905571471,-0.4043962370336356,-1.0146927325062478) q[19];
-cx q[16],q[19];
-u3(0.04909254793068989,0,pi/2) q[16];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[19];
-cx q[16],q[19];
-u3(2.3695226316694717,-2.3831764504886146,0.7973422888724029) q[16];
-u3(1.0317647793219495,-2.3552367237158123,0.18978392088396623) q[16];
-cx q[15],q[16];
-u3(0.8918083067818369,-pi/2,-pi/2) q[15];
-u3(0.9450783324677351,-0.6050350365131671,-0.7026934899836146) q[16];
-cx q[15],q[16];
-u3(0.38257317539832314,0,pi/2) q[15];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[16];
-cx q[15],q[16];
-u3(0.04112940179055083,0.6333172120376362,-1.9692085323367028) q[15];
-u3(1.7868104918560392,0.5417833948569148,0.4720223774986918) q[15];
-u3(1.6767425128769538,0.2842828370768724,-0.6527447561774835) q[16];
-u3(2.3449735770366127,2.668251682259566,-0.8135227648857204) q[16];
-u3(1.6607496133873605,3.027123502435214,1.6861329706786847) q[19];
-u3(0.36084977909198007,-1.7022208181304306,-2.706035854811871) q[19];
-u3(1.146299455685569,-2.4187625511810986,2.756304373591723) q[21];
-u3(2.1136685354190456,3.0893328480783593,-0.8294816171808832) q[21];
-cx q[21],q[25];
-u3(0.7833772461154207,-pi/2,-pi/2) q[21];
-u3(0.9219777531075559,-0.5796218964683373,-0.7453974564849872) q[25];
-cx q[21],q[25];
-u3(0.1668557413294265,0,pi/2) q[21];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[25];
-cx q[21],q[25];
-u3(1.5975795080075144,1.4249862677680731,-2.4720391721420603) q[21];
-u3(1.9811227508408709,0.6080068115995951,0.21456624582257255) q[21];
-cx q[21],q[27];
-u3(0.7366386423231739,-pi/2,-pi/2) q[21];
-u3(0.7954703337630404,0.6272535030949768,2.7407720835563607) q[25];
-u3(1.2033189502727788,0.9582521617069144,0.4420529463875642) q[25];
-cx q[25],q[11];
-u3(0.9740552368238278,-0.6335213773885457,-0.6530669336957882) q[11];
-u3(0.5348491885405052,-pi/2,-pi/2) q[25];
-cx q[25],q[11];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[11];
-u3(0.29201775886607334,-pi,-pi/2) q[25];
-cx q[25],q[11];
-u3(2.4372105111364886,-3.1019811579866134,3.0683249331955373) q[11];
-u3(1.1755874232400796,-2.4241756936623586,-1.7310406447834357) q[11];
-u3(2.648796448143195,0.9926157365149377,-2.499235407278742) q[25];
-u3(2.333128098071259,-0.5779522653523355,3.1413241439037405) q[25];
-cx q[25],q[16];
-u3(0.9268361689166333,-0.5851878264613055,-0.7361565242555628) q[16];
-u3(0.7668009157754156,-pi/2,-pi/2) q[25];
-cx q[25],q[16];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[16];
-u3(0.26337925798593514,-pi,-pi/2) q[25];
-cx q[25],q[16];
-u3(0.8551103479642383,-2.381397602276504,1.6574026214986057) q[16];
-u3(0.5545153920795758,0.8846530916795974,2.065025589389635) q[16];
-cx q[2],q[16];
-u3(0.8647732888543334,-0.5031101042878894,-0.8673259614699855) q[16];
-u3(0.9476088457378113,-pi/2,-pi/2) q[2];
-cx q[2],q[16];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[16];
-u3(0.04826774042899223,0,pi/2) q[2];
-cx q[2],q[16];
-u3(2.398207911141973,-0.796561371698921,0.7287513003782462) q[16];
-u3(1.004415121169533,1.6688492969885367,0.116909638474743) q[16];
-u3(1.71770615281329,1.0581006129887411,2.2697419896512594) q[2];
-u3(2.1885279666467965,0.312482383695897,-2.917089126441719) q[2];
-u3(1.9348930809468154,1.037246934668759,-0.663923776719435) q[25];
-u3(2.5440538342089725,2.7787032833470464,3.1087068199201564) q[25];
-u3(0.8213684113191396,-0.4259763910387897,-0.983186766836539) q[27];
-cx q[21],q[27];
-u3(0.20268862925662612,0,pi/2) q[21];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[27];
-cx q[21],q[27];
-u3(0.86393554650288,3.132359212230967,-0.9950516075827309) q[21];
-u3(1.4261681718242718,-1.4544675539242986,-1.375693044626714) q[21];
-cx q[21],q[17];
-u3(0.8220628825570513,-0.4273968738205123,-0.981100784857734) q[17];
-u3(0.8033041827800788,-pi/2,-pi/2) q[21];
-cx q[21],q[17];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[17];
-u3(0.547344191371855,-pi,-pi/2) q[21];
-cx q[21],q[17];
-u3(1.684455554043147,-1.604604791396235,-2.4926290813076912) q[17];
-u3(2.479050342257013,-0.48321628425799945,-0.7913685076318124) q[17];
-cx q[17],q[31];
-u3(1.0800970089242714,-pi/2,-pi/2) q[17];
-u3(0.7244323097815504,-0.7319042600465582,-1.27064778522724) q[21];
-u3(1.57180308218161,1.8630861523824134,0.09977887936085406) q[21];
-u3(2.226423802515547,0.4367761257164773,0.9116749658683663) q[27];
-u3(2.6655958513045936,3.119843853630993,-1.5854238822036657) q[27];
-cx q[3],q[21];
-u3(0.8170658361326861,-0.4170083297867033,-0.9963210059048855) q[21];
-u3(0.6332452231289579,-pi/2,-pi/2) q[3];
-cx q[3],q[21];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[21];
-u3(0.2283364244068998,-pi,-pi/2) q[3];
-cx q[3],q[21];
-u3(0.8240660391178911,0.6093036524892299,-2.299896225042291) q[21];
-u3(1.1788077313568188,0.4867717651629566,-0.5287396197470855) q[21];
-u3(2.116682970055603,-1.0410567934136772,1.2202700779264672) q[3];
-u3(2.193343231961135,-1.6362783021464615,-2.9441303042848617) q[3];
-cx q[3],q[12];
-u3(0.8616020643769345,-0.49815217056098815,-0.8749533049585914) q[12];
-u3(0.8805429603815023,-pi/2,-pi/2) q[3];
-cx q[3],q[12];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[12];
-u3(0.5230923887128011,0,pi/2) q[3];
-cx q[3],q[12];
-u3(1.748594493871393,2.385865495022384,-2.8808565824849603) q[12];
-u3(2.1430938260665657,-2.080243649785917,-0.3264630330069238) q[12];
-u3(1.7601012823443023,-1.5795712577316552,-1.8696666327909286) q[3];
-u3(2.1870243683935673,0.49155485893307294,-1.8671221852127102) q[3];
-u3(0.82073258747884,-0.4246694028367908,-0.9851047103724895) q[31];
-cx q[17],q[31];
-u3(0.2406322658458323,0,pi/2) q[17];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[31];
-cx q[17],q[31];
-u3(1.4105337992447442,-2.688483551912141,-2.5914335540018105) q[17];
-u3(1.6716613620742928,1.3448761422084878,1.970517838954084) q[17];
-u3(2.1981054601458183,-2.579742892184401,-1.2343298484915235) q[31];
-u3(0.6430577340358545,1.0513623781955417,-0.9602792491260366) q[31];
-u3(2.589003089436089,2.038918378613767,1.3694112164025194) q[9];
-u3(0.303775554882319,1.023961993653483,1.872818803276206) q[9];
-cx q[9],q[5];
-u3(0.7427202366637087,-0.1690207129554513,-1.3431509207424366) q[5];
-u3(0.8484290484552759,-pi/2,-pi/2) q[9];
-cx q[9],q[5];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[5];
-u3(0.08494989246376496,-pi,-pi/2) q[9];
-cx q[9],q[5];
-u3(2.0414493007955854,-1.285168591420477,-1.8731215658042923) q[5];
-u3(0.9216265619821711,-0.32075328383816126,0.5588326905653238) q[5];
-cx q[5],q[28];
-u3(0.7297763673944475,-0.011742076818301861,-1.555042570503736) q[28];
-u3(0.8267999884132847,-pi/2,-pi/2) q[5];
-cx q[5],q[28];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[28];
-u3(0.5834384331294981,0,pi/2) q[5];
-cx q[5],q[28];
-u3(0.465445645791194,-2.6078040290830273,-2.496810665081875) q[28];
-u3(0.8714810666665205,1.9637548829209708,1.908936821222051) q[28];
-cx q[19],q[28];
-u3(1.1989975871458305,-pi/2,-pi/2) q[19];
-u3(0.8398287247927734,-0.46144968630964245,-0.9305984756773) q[28];
-cx q[19],q[28];
-u3(0.19287954355093792,-pi,-pi/2) q[19];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[28];
-cx q[19],q[28];
-u3(1.14430971103674,-2.2780142314874237,0.9257400387475432) q[19];
-u3(1.9298277263310784,2.5575478620333953,-2.3379589162783505) q[19];
-cx q[11],q[19];
-u3(0.8828658662471119,-pi/2,-pi/2) q[11];
-u3(0.7469312892261668,-0.1939120429148975,-1.309296216323343) q[19];
-cx q[11],q[19];
-u3(0.33072620377511464,0,pi/2) q[11];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[19];
-cx q[11],q[19];
-u3(0.9436167158218253,1.2563294769432467,2.96254987394148) q[11];
-u3(1.7483352443464892,0.1234517138521678,-2.7712695174180997) q[11];
-u3(2.647090918442908,3.1210684311711923,-2.525815746495724) q[19];
-u3(1.4126128300011198,2.7730581017457343,-2.864579468122801) q[19];
-u3(1.3758659949827095,-0.9303475459144641,-1.9719993992014673) q[28];
-u3(1.603307185822289,2.569198834852699,0.6509555414908919) q[28];
-cx q[26],q[28];
-u3(0.820503837044546,-pi/2,-pi/2) q[26];
-u3(0.783388838005315,-0.33413148418984395,-1.1152150219238166) q[28];
-cx q[26],q[28];
-u3(0.1995594472460033,-pi,-pi/2) q[26];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[28];
-cx q[26],q[28];
-u3(2.587042972266735,-1.0793654971724078,-2.3039780014659534) q[26];
-u3(1.440126005114395,-0.2881615038076655,-2.8104635370030726) q[26];
-u3(2.218311073360417,2.7558663530171152,-0.36331471778741964) q[28];
-u3(2.220571122314207,2.5586908832491586,0.9662514806066556) q[28];
-cx q[28],q[11];
-u3(0.8975898932367018,-0.5496799418960312,-0.794159848244119) q[11];
-u3(0.5172621482118489,-pi/2,-pi/2) q[28];
-cx q[28],q[11];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[11];
-u3(0.1393809956615951,0,pi/2) q[28];
-cx q[28],q[11];
-u3(1.9600781628968242,-0.7707911892420469,-1.8058498791694264) q[11];
-u3(1.603307185822289,2.569198834852699,0.6509555414908919) q[11];
-u3(2.0970219140179975,1.998495982603476,-0.5259817539031708) q[28];
-u3(1.034699080774679,0.6824104054974445,-0.4973499365186296) q[28];
-u3(0.2890054271421039,2.9152264824018266,0.5697658174136437) q[5];
-u3(1.2082515411863488,1.5524967271299994,1.6073233740172697) q[5];
-cx q[5],q[0];
-u3(0.9196527049986927,-0.5769139850596163,-0.749872067981908) q[0];
-u3(1.383627647454725,-pi/2,-pi/2) q[5];
-cx q[5],q[0];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[0];
-u3(0.14929587234116712,0,pi/2) q[5];
-cx q[5],q[0];
-u3(1.774564847910114,2.0997864051157507,1.637145754528233) q[0];
-u3(1.7214417253383925,0.21083152587116993,-1.1868598748039105) q[0];
-cx q[1],q[0];
-u3(0.9482457654063783,-0.6083219696698392,-0.6970690007034115) q[0];
-u3(0.821758709909856,-pi/2,-pi/2) q[1];
-cx q[1],q[0];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[0];
-u3(0.01018273715655497,0,pi/2) q[1];
-cx q[1],q[0];
-u3(0.5042174750345977,-1.1891918362607818,-1.3636047402718905) q[0];
-u3(1.3528522785754085,-1.8658026323411097,0.7042231134789292) q[0];
-cx q[0],q[6];
-u3(0.49690790986859296,-pi/2,-pi/2) q[0];
-u3(2.7362354899598547,2.431943254847596,3.049493206054718) q[1];
-u3(1.8803530523576275,-1.0044735496475545,1.1266752092702355) q[1];
-cx q[14],q[1];
-u3(0.9025180426891604,-0.5560172203786844,-0.7839642965286213) q[1];
-u3(0.772889691901378,-pi/2,-pi/2) q[14];
-cx q[14],q[1];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[1];
-u3(0.37118355601883324,0,pi/2) q[14];
-cx q[14],q[1];
-u3(0.8728720081949437,-2.3051206862310902,0.05510905484815609) q[1];
-u3(0.6877786985978807,-1.3444556064061182,0.4423110277406277) q[1];
-u3(2.323396082821364,2.329173908758757,1.2286195435220915) q[14];
-u3(2.439322734968814,-1.440510638850033,0.7491005473108512) q[14];
-cx q[16],q[14];
-u3(0.9251517656502971,-0.5832721108646202,-0.739343853405364) q[14];
-u3(1.0299887048611132,-pi/2,-pi/2) q[16];
-cx q[16],q[14];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[14];
-u3(0.008278388392770912,0,pi/2) q[16];
-cx q[16],q[14];
-u3(1.814295144443734,2.165738191529047,0.18641921180752874) q[14];
-u3(1.3766801492918443,-3.0240387717033066,2.8559460218979638) q[14];
-u3(1.3089579062490908,-2.1781074008430483,0.8720371409403604) q[16];
-u3(1.1946836915041041,-1.1348042862167822,-2.9965434397195043) q[16];
-u3(1.4703025410083206,0.8569005185101028,-1.0113280219190504) q[5];
-u3(2.20116000272397,1.9871257801898672,0.49069605735738975) q[5];
-cx q[5],q[15];
-u3(0.9253041057008031,-0.5834459765704261,-0.7390548731514421) q[15];
-u3(0.994000254287311,-pi/2,-pi/2) q[5];
-cx q[5],q[15];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[15];
-u3(0.37894529825795664,0,pi/2) q[5];
-cx q[5],q[15];
-u3(2.1238488375627926,1.005648876853889,-2.763342651893205) q[15];
-u3(2.0420637027698954,-0.07799665398812516,-1.139050532984831) q[15];
-cx q[15],q[26];
-u3(0.8396648507967587,-pi/2,-pi/2) q[15];
-u3(0.8585150275618508,-0.49323774523003916,-0.8824861960034482) q[26];
-cx q[15],q[26];
-u3(0.006905693337888434,0,pi/2) q[15];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[26];
-cx q[15],q[26];
-u3(1.7071507255473268,1.487871067527264,0.1601936035995175) q[15];
-u3(2.044676348255836,-2.7017553984745977,-0.00027496432545204286) q[15];
-u3(1.220544906823214,-2.5728264884659247,2.442305369425174) q[26];
-u3(2.6325493843983594,0.04303426574740543,1.3434159342697214) q[26];
-cx q[26],q[10];
-u3(0.9711819271531866,-0.630848134653498,-0.6578139737018844) q[10];
-u3(1.0238801835382993,-pi/2,-pi/2) q[26];
-cx q[26],q[10];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[10];
-u3(0.3354198256658074,-pi,-pi/2) q[26];
-cx q[26],q[10];
-u3(1.252637818362669,-0.012056591620543067,2.1189846806978787) q[10];
-u3(1.9081657662550837,-1.5448245225467991,-2.2421911986250684) q[10];
-u3(0.6809662782571905,2.211093630164674,-1.306725051290717) q[26];
-u3(1.6932791153189584,-2.4452133463934227,2.5626788309355604) q[26];
-u3(1.8572437744428443,1.7711804628141117,1.4686698106768663) q[5];
-u3(1.4932231337392727,-0.04140770595137688,-2.476229480345194) q[5];
-cx q[24],q[5];
-u3(0.522089834336999,-pi/2,-pi/2) q[24];
-u3(0.8256705179739682,-0.4346603248742924,-0.9704097049803995) q[5];
-cx q[24],q[5];
-u3(0.22212497671971382,0,pi/2) q[24];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[5];
-cx q[24],q[5];
-u3(2.9936951302000145,-0.576706574342237,0.020596029979200736) q[24];
-u3(2.36233150532585,-2.263576848105423,-1.2155436069991798) q[24];
-cx q[1],q[24];
-u3(0.6978326063192897,-pi/2,-pi/2) q[1];
-u3(0.8957090898025515,-0.5472202480519317,-0.7981002016455694) q[24];
-cx q[1],q[24];
-u3(0.2628278530741033,0,pi/2) q[1];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[24];
-cx q[1],q[24];
-u3(1.4595263239528264,2.235794830171004,0.2628672298349617) q[1];
-u3(0.7667229598058937,-2.4366125091010393,2.8813873927681666) q[1];
-u3(1.373869528334257,-1.0539328622730788,1.5267877629573832) q[24];
-u3(2.0543645640447887,1.182639843770299,-1.4985184489598906) q[24];
-u3(0.24522651887245175,-1.0937845152611612,-1.9731812569248923) q[5];
-u3(1.640176231092359,2.3318115878093995,-1.1580512034183499) q[5];
-cx q[23],q[5];
-u3(0.6457642651878631,-pi/2,-pi/2) q[23];
-u3(0.8011833252576643,-0.38109230144514017,-1.0483554582414385) q[5];
-cx q[23],q[5];
-u3(0.009467678011100693,0,pi/2) q[23];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[5];
-cx q[23],q[5];
-u3(1.1996545351777204,-0.9472797956662755,-2.9674956381634763) q[23];
-u3(1.1282503963294075,-1.2889531090147432,0.9510671263497281) q[23];
-u3(1.8920720627655818,1.1175137871398402,-1.4733307744349986) q[5];
-u3(1.7723593776759137,-1.957446865976868,-0.5295508567090992) q[5];
-u3(0.8631345753805357,-0.5005593834522535,-0.8712535515722379) q[6];
-cx q[0],q[6];
-u3(0.2062277899450609,0,pi/2) q[0];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[6];
-cx q[0],q[6];
-u3(2.4244766460367115,-2.159576825364165,-1.1182566299077523) q[0];
-u3(2.15711844288903,-0.6980571944951928,1.7386848578092247) q[0];
-u3(0.5557374975608809,-0.8650588525128704,2.363035505733162) q[6];
-u3(2.20116000272397,1.9871257801898672,0.49069605735738975) q[6];
-cx q[6],q[7];
-u3(0.994000254287311,-pi/2,-pi/2) q[6];
-u3(0.9253041057008031,-0.5834459765704261,-0.7390548731514421) q[7];
-cx q[6],q[7];
-u3(0.37894529825795664,0,pi/2) q[6];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[7];
-cx q[6],q[7];
-u3(1.8572437744428443,1.7711804628141117,1.4686698106768663) q[6];
-u3(0.949509077114075,-1.2448559203017509,-2.004886882259971) q[6];
-cx q[6],q[12];
-u3(0.9028951457395497,-0.5564958568585276,-0.7831916636325982) q[12];
-u3(0.4569215676763238,-pi/2,-pi/2) q[6];
-cx q[6],q[12];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[12];
-u3(0.10201151817363732,-pi,-pi/2) q[6];
-cx q[6],q[12];
-u3(0.5113700256197389,1.748273435702428,0.9183270618964903) q[12];
-u3(2.8340928293616896,-0.48712027617193066,-3.0063410339493446) q[12];
-u3(2.136162263581935,-0.6764408879730479,-3.09602441546985) q[6];
-u3(2.606158593010362,-0.9525980534243992,2.1829308493316404) q[6];
-u3(2.1238488375627926,1.005648876853889,-2.763342651893205) q[7];
-u3(2.1550434472681856,1.0522391302330654,2.0940716062401536) q[7];
-cx q[7],q[26];
-u3(0.774828798393823,-0.30807122512565144,-1.1518378150178386) q[26];
-u3(0.7673690784807619,-pi/2,-pi/2) q[7];
-cx q[7],q[26];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[26];
-u3(0.022710279435589082,-pi,-pi/2) q[7];
-cx q[7],q[26];
-u3(1.9730136446041797,1.6519427852243158,1.6567834506996038) q[26];
-u3(0.957705987371888,2.2710955171014264,0.8874525743013724) q[26];
-u3(2.7555216750951517,-1.7516843629957801,-1.0696533688362537) q[7];
-u3(2.512554301946338,2.451488154578354,0.7324244725082982) q[7];
-u3(0.2124085212105441,-0.3561835704697902,-0.5486224117416363) q[9];
-u3(2.746867434026479,-2.24981724420533,-1.298077686511097) q[9];
-cx q[9],q[13];
-u3(0.8773136096456339,-0.5218737791653769,-0.8381928954450721) q[13];
-u3(0.5185301017935566,-pi/2,-pi/2) q[9];
-cx q[9],q[13];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[13];
-u3(0.29821932081194397,0,pi/2) q[9];
-cx q[9],q[13];
-u3(1.1682350008593194,-0.012154185083926183,-0.9408509959480238) q[13];
-u3(1.5252881428965888,-0.5324257781423518,1.551590737147496) q[13];
-cx q[29],q[13];
-u3(0.929951420936696,-0.5886925315572524,-0.7303067948275324) q[13];
-u3(0.8236346698412244,-pi/2,-pi/2) q[29];
-cx q[29],q[13];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[13];
-u3(0.05187088777064887,-pi,-pi/2) q[29];
-cx q[29],q[13];
-u3(1.863839921454656,1.0975412824278719,-0.8803245346230222) q[13];
-u3(2.3867988835717227,-2.2769523340763183,2.509466560003931) q[13];
-cx q[27],q[13];
-u3(0.8324683139041842,-0.44784752700106356,-0.9508898164722552) q[13];
-u3(0.7276989893851669,-pi/2,-pi/2) q[27];
-cx q[27],q[13];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[13];
-u3(0.17258296399765366,0,pi/2) q[27];
-cx q[27],q[13];
-u3(1.899602956488921,-1.1919254510301787,3.061183812214283) q[13];
-u3(1.4264749839169888,-1.0485187727217333,-1.6943805544432065) q[13];
-cx q[13],q[19];
-u3(0.7045017864069895,-pi/2,-pi/2) q[13];
-u3(0.8788055443206345,-0.5240216798148625,-0.8348296855856958) q[19];
-cx q[13],q[19];
-u3(0.499487227912331,0,pi/2) q[13];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[19];
-cx q[13],q[19];
-u3(1.819117560288525,-1.3667223344940116,1.7251746944239033) q[13];
-u3(0.9860929461491171,-3.075975233596547,-2.867443031659014) q[13];
-u3(2.2831693418546974,-1.5175291846892427,-1.9905007957915473) q[19];
-u3(1.327772488833346,1.6665917392110208,2.700582366773988) q[19];
-cx q[17],q[19];
-u3(0.8003532082382704,-pi/2,-pi/2) q[17];
-u3(0.8233796662735242,-0.4300702789620492,-0.9771706340193855) q[19];
-cx q[17],q[19];
-u3(0.39705422424864195,0,pi/2) q[17];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[19];
-cx q[17],q[19];
-u3(0.7001686983830533,-0.6956734475792752,-0.6997032260167675) q[17];
-u3(2.1120499997654454,-3.0286155843710816,2.5653186434438915) q[17];
-u3(1.7100649351294974,1.0648227751725496,-0.6100911542317555) q[19];
-u3(0.3059740506606808,1.512959729071409,1.5323348652643478) q[19];
-cx q[24],q[17];
-u3(0.8159415598325943,-0.41461584611384694,-0.9998148364416011) q[17];
-u3(0.9370983355809189,-pi/2,-pi/2) q[24];
-cx q[24],q[17];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[17];
-u3(0.04966422611558994,-pi,-pi/2) q[24];
-cx q[24],q[17];
-u3(1.3734950816742169,-3.0841571180786613,-2.0081241121219287) q[17];
-u3(0.7615692187638068,2.4070263253321933,-0.8279691204741937) q[17];
-u3(1.0153581442045156,0.04954642592043257,0.639564718394241) q[24];
-u3(2.0606452397304027,0.688443584011746,-1.0008917397722308) q[24];
-u3(0.3323404357693078,-1.657968039864751,-1.4558474290761358) q[27];
-u3(2.9579024734250408,-0.7792650918489628,-0.8056805969893155) q[27];
-u3(1.7986417457908008,-0.7673687168569803,2.9153302268742927) q[29];
-u3(2.4105264807526763,1.0668504338259135,1.3196890776710974) q[29];
-cx q[4],q[13];
-u3(0.8084148469319856,-0.3980358480250503,-1.0239157178412306) q[13];
-u3(0.28115176749459936,-pi/2,-pi/2) q[4];
-cx q[4],q[13];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[13];
-u3(0.010896050647316097,-pi,-pi/2) q[4];
-cx q[4],q[13];
-u3(2.3876271101455577,-0.5628919282105285,0.9548174262602585) q[13];
-u3(2.1440914221777976,-0.5267733033831874,1.4861211143737245) q[13];
-u3(1.914623665793158,-2.4530863896488557,2.8162329197985745) q[4];
-u3(2.6351816079275,-0.21724798908549658,2.9296346762391394) q[4];
-u3(0.8554854733736436,-2.254422836889189,2.9125663225489458) q[9];
-u3(1.418008298032283,2.677183920460397,-2.310698890799721) q[9];
-cx q[9],q[30];
-u3(0.7300781691023713,0.028501712928317158,-1.6090390884284478) q[30];
-u3(0.3729574080738387,-pi/2,-pi/2) q[9];
-cx q[9],q[30];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[30];
-u3(0.18732477219992325,0,pi/2) q[9];
-cx q[9],q[30];
-u3(2.465510157135212,-2.283186592523911,2.4939560040197986) q[30];
-u3(2.5247953105557377,-1.202114667744672,-0.6187238990683195) q[30];
-cx q[30],q[29];
-u3(0.8698421250540348,-0.5108517575047347,-0.8553584394830391) q[29];
-u3(0.9390997836368987,-pi/2,-pi/2) q[30];
-cx q[30],q[29];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[29];
-u3(0.16573442469482147,0,pi/2) q[30];
-cx q[30],q[29];
-u3(2.7909061443205263,-1.4011003882000448,1.173266062985415) q[29];
-u3(1.200283226544327,2.559826103685089,-0.6782751534612466) q[29];
-cx q[29],q[8];
-u3(0.6280614803370098,-pi/2,-pi/2) q[29];
-u3(1.8869281177311295,-3.108028322177109,1.80396625828278) q[30];
-u3(1.660648006505114,-0.3349809718678536,2.922049414343334) q[30];
-cx q[27],q[30];
-u3(1.0343494767698844,-pi/2,-pi/2) q[27];
-u3(0.9331789121326098,-0.5922719986816287,-0.7243068215529362) q[30];
-cx q[27],q[30];
-u3(0.07290138249799417,0,pi/2) q[27];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[30];
-cx q[27],q[30];
-u3(1.1616325660120836,-2.615095692924328,-1.3504683172857193) q[27];
-u3(2.6569600097028983,-0.18329511956422273,-2.658822773923517) q[27];
-cx q[21],q[27];
-u3(0.5170424069216429,-pi/2,-pi/2) q[21];
-u3(0.756524409664015,-0.2404132702717865,-1.2456511294109518) q[27];
-cx q[21],q[27];
-u3(0.2181743204295576,-pi,-pi/2) q[21];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[27];
-cx q[21],q[27];
-u3(2.052490156444743,-0.8846315983283759,-0.36658875036586025) q[21];
-u3(1.8240751593710467,-2.4156158588180165,1.3525363275240307) q[21];
-u3(1.284586355437922,1.5801154766938552,2.3974297262401336) q[27];
-u3(1.0028544767910963,-2.4641534078708185,-1.3211106488447217) q[27];
-cx q[3],q[27];
-u3(0.8959969902782374,-0.5475982602713629,-0.797495239863018) q[27];
-u3(1.2106698371965585,-pi/2,-pi/2) q[3];
-cx q[3],q[27];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[27];
-u3(0.22838114723869668,0,pi/2) q[3];
-cx q[3],q[27];
-u3(0.6777742980213977,-0.4374028468956048,1.0566019079670728) q[27];
-u3(1.4225756450987348,-2.531130328898133,1.817693569322108) q[27];
-u3(1.4372779821215378,-1.7118432686144263,1.4439982121524366) q[3];
-u3(2.796424669787792,-2.0268292769697007,-2.5185661368241927) q[3];
-cx q[3],q[17];
-u3(0.9497465501152997,-0.6098637624775862,-0.6944221448517602) q[17];
-u3(0.7697168086826077,-pi/2,-pi/2) q[3];
-cx q[3],q[17];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[17];
-u3(0.34030598042709154,0,pi/2) q[3];
-cx q[3],q[17];
-u3(2.906304253909757,3.0260459061516567,-1.056057762260226) q[17];
-u3(0.6014374387944824,0.9649601151376448,0.28680740753972245) q[17];
-u3(2.31253055763591,0.7707421475327516,-0.18063570846211263) q[3];
-u3(1.8196159127709468,1.2283926423508502,0.6436126806002926) q[3];
-u3(2.288864552811489,-1.7819653036527745,-0.3780119715478092) q[30];
-u3(2.4317232789491614,-2.2224233682889523,-0.8343252896671465) q[30];
-cx q[18],q[30];
-u3(0.5886638077800513,-pi/2,-pi/2) q[18];
-u3(0.8981033560160913,-0.5503474479322876,-0.7930889177381335) q[30];
-cx q[18],q[30];
-u3(0.3529608467580851,-pi,-pi/2) q[18];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[30];
-cx q[18],q[30];
-u3(1.0266384395711179,-0.12943370297342005,-1.7503792858794078) q[18];
-u3(2.1666940572163322,-0.7300600616019812,2.5840963222183797) q[18];
-cx q[18],q[23];
-u3(0.7840975077540883,-pi/2,-pi/2) q[18];
-u3(0.9610975049287188,-0.6212107936193569,-0.6747663185930755) q[23];
-cx q[18],q[23];
-u3(0.29619815371407027,0,pi/2) q[18];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[23];
-cx q[18],q[23];
-u3(0.602023199385563,-1.4378207464007464,1.989090156430061) q[18];
-u3(1.7112248704192579,2.013701758106249,1.9786689526582641) q[18];
-u3(0.7515687772157739,-1.9814998519102536,2.4482924889093827) q[23];
-u3(1.4378593331093716,1.614541357582377,-3.0834170254047724) q[23];
-cx q[27],q[18];
-u3(0.7301862912610373,0.03246296719811781,-1.6143555874198237) q[18];
-u3(0.3457546292921792,-pi/2,-pi/2) q[27];
-cx q[27],q[18];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[18];
-u3(0.10293987712770278,-pi,-pi/2) q[27];
-cx q[27],q[18];
-u3(1.8183511349231556,1.1704200661627784,-2.8054140581599794) q[18];
-u3(2.173261727797383,2.6334295569863997,-1.6745350393524148) q[18];
-u3(2.7548240751688673,-2.1215249540389083,2.8117185307008006) q[27];
-u3(0.5798460178412188,-1.515306046054969,-2.5903667508006962) q[27];
-u3(1.598903590842071,0.01940607092290625,1.1356992501815562) q[30];
-u3(2.891909734425715,-2.2152887885351906,-1.2569687155054323) q[30];
-cx q[21],q[30];
-u3(0.7820008952087624,-pi/2,-pi/2) q[21];
-u3(0.8513141527965105,-0.48141927969917386,-0.900493988256013) q[30];
-cx q[21],q[30];
-u3(0.021866381899258526,0,pi/2) q[21];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[30];
-cx q[21],q[30];
-u3(1.208134884855538,-2.1936498281498276,-1.3630164126773676) q[21];
-u3(1.5334456479750544,-2.6830719323125667,-2.9459368363756804) q[21];
-u3(3.121538477690945,-1.9332037707824257,-0.0587220739077825) q[30];
-u3(2.4225800390155396,-0.2553658051758987,0.049657220898547294) q[30];
-cx q[6],q[30];
-u3(0.9134505172300263,-0.5695455199915709,-0.7619799486049583) q[30];
-u3(1.1317490861618145,-pi/2,-pi/2) q[6];
-cx q[6],q[30];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[30];
-u3(0.2943260215584494,0,pi/2) q[6];
-cx q[6],q[30];
-u3(1.3923321302883345,1.1741169120167934,0.33378691941601435) q[30];
-u3(1.1015443878325704,0.41179480425914905,-0.9894386088352807) q[30];
-u3(0.9646615463961767,-0.09873538384480218,-2.3542038300108574) q[6];
-u3(1.5745666718041191,-1.233578302664908,-1.5553947968394517) q[6];
-u3(0.7372402817106798,0.1290541877187743,-1.7443280936080576) q[8];
-cx q[29],q[8];
-u3(0.26763461770215746,0,pi/2) q[29];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[8];
-cx q[29],q[8];
-u3(1.627646624783156,-0.257908387268293,-3.0563862852247907) q[29];
-u3(0.5629801324656709,-2.744950979092845,-2.1844037623457964) q[29];
-cx q[29],q[0];
-u3(0.8387289662988294,-0.4594594191234691,-0.9335779174408394) q[0];
-u3(0.715826607646479,-pi/2,-pi/2) q[29];
-cx q[29],q[0];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[0];
-u3(0.36844171597137226,0,pi/2) q[29];
-cx q[29],q[0];
-u3(1.0231247239336394,-0.9999417710929053,2.8563689891987174) q[0];
-u3(1.6435152774069477,-2.8384575843295297,2.8970028145841473) q[0];
-u3(1.4458886043634893,2.7478530379139317,-0.28654025838232844) q[29];
-u3(0.5104107497252294,2.496513485933301,1.5660792601019775) q[29];
-cx q[29],q[13];
-u3(0.8581356170806823,-0.4926275971392067,-0.8834195641222102) q[13];
-u3(0.7916313316616782,-pi/2,-pi/2) q[29];
-cx q[29],q[13];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[13];
-u3(0.6770868416748643,0,pi/2) q[29];
-cx q[29],q[13];
-u3(1.240137690880461,0.4871778581319788,-0.9561217405618931) q[13];
-u3(2.575136996837599,1.333610896993056,0.34713639302746424) q[13];
-cx q[13],q[23];
-u3(0.9653765459908105,-pi/2,-pi/2) q[13];
-u3(0.9440643090841706,-0.603973188057243,-0.704505238422449) q[23];
-cx q[13],q[23];
-u3(0.2786581381379991,0,pi/2) q[13];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[23];
-cx q[13],q[23];
-u3(0.19020618160229222,-2.1702964583990596,2.9843300938489854) q[13];
-u3(1.3533901538947808,-2.377268137942748,-1.789920365390424) q[13];
-u3(2.4651612989725544,-3.0259790698150795,-1.7402431441289261) q[23];
-u3(2.781018591657808,1.1238677553172485,-0.6330464812478711) q[23];
-u3(0.6929330843503427,0.467896570790864,1.9886775885686703) q[29];
-u3(2.0659833421636566,-2.0113134706238895,-2.6574000366066137) q[29];
-cx q[12],q[29];
-u3(1.0353169044308277,-pi/2,-pi/2) q[12];
-u3(0.8069586023956148,-0.39470811538972717,-1.028730334312998) q[29];
-cx q[12],q[29];
-u3(0.06737885457377461,0,pi/2) q[12];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[29];
-cx q[12],q[29];
-u3(2.4828296247628105,2.59375677249277,2.4020796136471603) q[12];
-u3(0.6418546613161297,0.5929005601204267,1.8334709422142819) q[12];
-cx q[12],q[30];
-u3(0.5452570267004864,-pi/2,-pi/2) q[12];
-u3(0.8048680514384143,1.327025497438406,0.5226701393506987) q[29];
-u3(0.9488137952767245,1.4561563332206795,-2.1140535527838207) q[29];
-u3(0.7498009973010118,-0.20904296693629876,-1.288648527063975) q[30];
-cx q[12],q[30];
-u3(0.37445025574021107,0,pi/2) q[12];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[30];
-cx q[12],q[30];
-u3(1.0069032910368547,-1.1713667197246382,1.3066764522255667) q[12];
-u3(0.5088151355377422,1.5236427180818053,-0.1327230153318908) q[12];
-u3(1.0140894428106466,2.9527473495680994,1.9245550203038597) q[30];
-u3(1.8137809790631847,0.741824467759006,-2.4748113686173756) q[30];
-u3(1.3358473864513583,-1.031289048362261,0.8052671351439686) q[8];
-u3(1.466432537570114,0.168054532546686,2.3032789034952135) q[8];
-cx q[8],q[28];
-u3(0.8305072433096757,-0.4441074445984232,-0.9564407251724507) q[28];
-u3(0.784791321507485,-pi/2,-pi/2) q[8];
-cx q[8],q[28];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[28];
-u3(0.2467079834820539,0,pi/2) q[8];
-cx q[8],q[28];
-u3(0.6763561883328443,2.6226071751953004,2.962643159831728) q[28];
-u3(1.640176231092359,2.3318115878093995,-1.1580512034183499) q[28];
-cx q[4],q[28];
-u3(0.8011833252576643,-0.38109230144514017,-1.0483554582414385) q[28];
-u3(0.6457642651878631,-pi/2,-pi/2) q[4];
-cx q[4],q[28];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[28];
-u3(0.009467678011100693,0,pi/2) q[4];
-cx q[4],q[28];
-u3(1.8920720627655818,1.1175137871398402,-1.4733307744349986) q[28];
-u3(2.567074341821347,-1.939188321286728,-2.7855786892062) q[28];
-u3(1.1996545351777204,-0.9472797956662755,-2.9674956381634763) q[4];
-u3(2.6351616625877634,-0.3860528561271903,-3.112574704658581) q[4];
-cx q[4],q[7];
-u3(0.7764400295891425,-pi/2,-pi/2) q[4];
-u3(0.7729419039815986,-0.30193822145941995,-1.1604130080445323) q[7];
-cx q[4],q[7];
-u3(0.3903411195495165,0,pi/2) q[4];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[7];
-cx q[4],q[7];
-u3(2.184316326551384,1.6759098897432763,-2.549426666897518) q[4];
-u3(1.7241457149054733,2.4072672254272547,-1.387140811018178) q[4];
-cx q[18],q[4];
-u3(0.7007605258748254,-pi/2,-pi/2) q[18];
-u3(0.9806932991957367,-0.6395786822388896,-0.6422350008725317) q[4];
-cx q[18],q[4];
-u3(0.005154944756735822,-pi,-pi/2) q[18];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[4];
-cx q[18],q[4];
-u3(0.7155814268299782,-0.5893711591709145,2.8566335382910237) q[18];
-u3(0.9531682215472906,3.0146183530570134,-0.17032585483997575) q[18];
-u3(2.118713345084425,-1.9042020868876768,2.2699557775905816) q[4];
-u3(1.814308716512063,-0.506872811721828,-3.0007602076465734) q[4];
-u3(1.3572740733039912,-1.3718082266272766,-2.8680820580137913) q[7];
-u3(1.7409233035914942,1.0181705957792389,-1.2434429195034582) q[7];
-cx q[29],q[7];
-u3(0.728296920395933,-pi/2,-pi/2) q[29];
-u3(0.8808465731731847,-0.5269325095041761,-0.8302621463142614) q[7];
-cx q[29],q[7];
-u3(0.49488102090571806,0,pi/2) q[29];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[7];
-cx q[29],q[7];
-u3(1.5764477756106186,-0.15801963461792568,0.004255575639348308) q[29];
-u3(2.4755686252169506,-0.4803159460541062,-0.3636647523627623) q[29];
-u3(2.1481661513892303,2.3936968495224953,-2.130965926852527) q[7];
-u3(2.1884923399169516,1.1324104753923363,1.226861032229559) q[7];
-u3(0.8600217364020856,-1.2828911158761682,2.5732953488336543) q[8];
-u3(2.1225472645795804,3.140395481673801,0.5777848194890312) q[8];
-u3(2.2027042938740498,1.7342851429610633,2.2555570645533276) q[9];
-u3(1.7187107983205538,-0.7142358273818972,2.092869802973265) q[9];
-cx q[20],q[9];
-u3(1.3961917622179667,-pi/2,-pi/2) q[20];
-u3(0.9631619096933944,-0.6232167124850241,-0.67125808589579) q[9];
-cx q[20],q[9];
-u3(0.376247524358025,0,pi/2) q[20];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[9];
-cx q[20],q[9];
-u3(0.7596655678511199,2.072489954513779,2.476213942576945) q[20];
-u3(1.0088944275295517,2.8841053756072927,1.8208812832062042) q[20];
-cx q[20],q[25];
-u3(0.9433588056724174,-pi/2,-pi/2) q[20];
-u3(0.780480128797171,-0.3255764586821499,-1.1272718807609667) q[25];
-cx q[20],q[25];
-u3(0.21968381007245533,0,pi/2) q[20];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[25];
-cx q[20],q[25];
-u3(0.29363774712517854,-0.23570525750134852,1.1633893205434012) q[20];
-u3(0.728222914238256,3.0592836358263362,0.8872249384161393) q[20];
-cx q[20],q[2];
-u3(0.7535786867863143,-0.2272725867560741,-1.263695414357409) q[2];
-u3(0.9832638770929295,-pi/2,-pi/2) q[20];
-cx q[20],q[2];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[2];
-u3(0.020685225809811584,0,pi/2) q[20];
-cx q[20],q[2];
-u3(2.538035295014945,-1.496139621282971,2.214762135624456) q[2];
-u3(1.3943848222714315,-0.8414318932761287,-2.9431703307442376) q[2];
-cx q[2],q[0];
-u3(0.8223561753340042,-0.4279945841950634,-0.9802225791774362) q[0];
-u3(0.37867017671163683,-pi/2,-pi/2) q[2];
-cx q[2],q[0];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[0];
-u3(0.1993886999358346,0,pi/2) q[2];
-cx q[2],q[0];
-u3(2.055995116756036,-0.2724269442110909,0.26085528059070473) q[0];
-u3(1.5005790863542325,-1.650855682334019,0.2853344441666281) q[0];
-cx q[0],q[21];
-u3(0.6845363459419971,-pi/2,-pi/2) q[0];
-u3(2.1607915330944083,-2.1027106917471423,0.08695995303778581) q[2];
-u3(1.3632673072354842,0.10350348286152178,-3.0425026769843706) q[2];
-u3(2.7843031443986512,-1.3405023032383956,2.481295467227702) q[20];
-u3(2.596044149382864,2.222639295445477,-1.905093447732244) q[20];
-cx q[10],q[20];
-u3(0.5704497604888418,-pi/2,-pi/2) q[10];
-u3(0.9604566347093264,-0.6205845437396205,-0.6758594729352865) q[20];
-cx q[10],q[20];
-u3(0.14008447145693564,0,pi/2) q[10];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[20];
-cx q[10],q[20];
-u3(2.332842855106714,-0.112986505093704,0.20380457233578575) q[10];
-u3(1.0751260193735772,-1.9135895276843136,-3.1373305836934384) q[10];
-u3(0.922159196199391,0.8357232752205266,-0.9465582870782576) q[20];
-u3(0.19738093779724875,1.0513260162211395,2.118283819906525) q[20];
-u3(0.8266180987946145,-0.43653681035584,-0.9676408686252511) q[21];
-cx q[0],q[21];
-u3(0.1428587548707903,0,pi/2) q[0];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[21];
-cx q[0],q[21];
-u3(0.10975777047670204,1.4557406795977936,2.504232771582873) q[0];
-u3(1.6848799012670534,1.9856533303222363,-1.5180224450929491) q[0];
-cx q[0],q[17];
-u3(0.641347024971941,-pi/2,-pi/2) q[0];
-u3(0.9239957841961961,-0.5819488388956624,-0.7415413401202837) q[17];
-cx q[0],q[17];
-u3(0.08225482155417331,0,pi/2) q[0];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[17];
-cx q[0],q[17];
-u3(0.35589707459980846,2.4906841334237644,-3.096751086549598) q[0];
-u3(1.4374707575037837,-0.5058899281253626,2.5733931158573924) q[0];
-u3(2.3531872962270155,1.9805506723985573,2.7134998853936265) q[17];
-u3(0.7200257441837495,0.2807031851624564,-1.9484590111827726) q[17];
-cx q[17],q[12];
-u3(0.7362686968953259,0.12051588867188379,-1.7328000845445555) q[12];
-u3(0.6410414074730075,-pi/2,-pi/2) q[17];
-cx q[17],q[12];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[12];
-u3(0.06431628793519042,0,pi/2) q[17];
-cx q[17],q[12];
-u3(1.733796055797635,-0.8779475441155573,-2.69248059356301) q[12];
-u3(2.276628233827595,2.845026554983323,2.685156267567046) q[17];
-u3(2.0328118348863238,2.8995074874128193,0.20756346481896149) q[21];
-u3(1.489448725783043,0.8008380933986978,-1.7326036294241671) q[21];
-u3(1.2678137164193928,-1.100292897457905,1.5304884224687223) q[25];
-u3(1.902508603484631,-1.5063260563420289,-3.1131220667536486) q[25];
-cx q[25],q[31];
-u3(1.0569309119752697,-pi/2,-pi/2) q[25];
-u3(0.9804248767788284,-0.6393368970375723,-0.6426694302335143) q[31];
-cx q[25],q[31];
-u3(0.7251018719425953,0,pi/2) q[25];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[31];
-cx q[25],q[31];
-u3(0.7836478501774354,0.8026609507417253,0.8783958210152552) q[25];
-u3(2.746867434026479,-2.24981724420533,-1.298077686511097) q[25];
-cx q[25],q[14];
-u3(0.8773136096456339,-0.5218737791653769,-0.8381928954450721) q[14];
-u3(0.5185301017935566,-pi/2,-pi/2) q[25];
-cx q[25],q[14];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[14];
-u3(0.29821932081194397,0,pi/2) q[25];
-cx q[25],q[14];
-u3(1.1682350008593194,-0.012154185083926183,-0.9408509959480238) q[14];
-u3(1.7057460113914946,1.6878974521394543,2.043862431842811) q[14];
-cx q[14],q[10];
-u3(0.8755577571096658,-0.5193237336000878,-0.8421779954763124) q[10];
-u3(0.9971217527743377,-pi/2,-pi/2) q[14];
-cx q[14],q[10];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[10];
-u3(0.4580032431422045,-pi,-pi/2) q[14];
-cx q[14],q[10];
-u3(1.082889659786376,2.33364818262765,1.4126777885292938) q[10];
-u3(2.7081571388746712,0.8450169583256062,2.443739381381275) q[10];
-u3(0.5055362863968493,0.22459725625042326,-0.22772188922900227) q[14];
-u3(1.5950035362767265,2.5292498984179144,-1.9799231730633429) q[14];
-cx q[14],q[21];
-u3(0.785214781862848,-pi/2,-pi/2) q[14];
-u3(0.8528241711593697,-0.48394015175907557,-0.8966653652190306) q[21];
-cx q[14],q[21];
-u3(0.4783856661353523,-pi,-pi/2) q[14];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[21];
-cx q[14],q[21];
-u3(0.978065882892985,-0.2666755414173263,1.5171743884882032) q[14];
-u3(0.8898356328843201,1.0292841253340796,3.0505522735820874) q[14];
-u3(0.8264230545158235,2.3353581523491576,0.292648954956781) q[21];
-u3(0.6819670139961804,-2.247573042602255,2.0439267060602404) q[21];
-u3(0.8554854733736436,-2.254422836889189,2.9125663225489458) q[25];
-u3(1.4265096822651278,2.7122422389017586,0.46859602923661914) q[25];
-u3(1.6784517464180715,1.8192652555584239,0.7445255807361497) q[31];
-u3(0.9506505139655563,0.07937429631848003,2.940944705543659) q[31];
-cx q[1],q[31];
-u3(0.6670919524951611,-pi/2,-pi/2) q[1];
-u3(0.8887787999709414,-0.537953052223135,-0.8128644668575244) q[31];
-cx q[1],q[31];
-u3(0.3715492498088258,-pi,-pi/2) q[1];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[31];
-cx q[1],q[31];
-u3(0.3727432815313851,-3.0850205176769654,0.7314958587555171) q[1];
-u3(2.197294704477192,2.4580016201687185,2.5026416290399123) q[1];
-cx q[28],q[1];
-u3(0.9673196853872962,-0.6272046702283913,-0.6642521027636032) q[1];
-u3(0.734894184349075,-pi/2,-pi/2) q[28];
-cx q[28],q[1];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[1];
-u3(0.4392022583524008,0,pi/2) q[28];
-cx q[28],q[1];
-u3(2.2394858386101295,-1.4115833874772186,-0.2595468228596234) q[1];
-u3(0.489210215699232,-2.028505951889831,1.0154496280630791) q[1];
-u3(1.6233164999897394,-3.05404827580392,0.2262277059331841) q[28];
-u3(1.238194442665703,2.0452403819704976,-2.2091060975665835) q[28];
-cx q[28],q[27];
-u3(0.9736491720524189,-0.6331454938592289,-0.6537356255037992) q[27];
-u3(0.9788782037195316,-pi/2,-pi/2) q[28];
-cx q[28],q[27];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[27];
-u3(0.24857624869677894,0,pi/2) q[28];
-cx q[28],q[27];
-u3(0.9502649796261441,-0.7894770891148561,-2.5347221889269846) q[27];
-u3(0.9201306877796598,-1.4214597991901652,-0.962551425015346) q[27];
-cx q[27],q[29];
-u3(0.857859439604407,-pi/2,-pi/2) q[27];
-u3(2.302238680614763,-1.8599266733040523,1.1197588798673017) q[28];
-u3(0.937799136931252,-2.0711970745729347,3.1158632674134576) q[28];
-u3(0.8288922114687245,-0.4409887959893184,-0.9610602733867175) q[29];
-cx q[27],q[29];
-u3(0.500257444575271,-pi,-pi/2) q[27];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[29];
-cx q[27],q[29];
-u3(2.0678573142042684,2.474914723284366,-1.0709721233312433) q[27];
-u3(1.8096533742060192,-0.8825377057925312,1.970264416899111) q[29];
-u3(2.125330201047396,-2.591246819949358,-0.5168027008401905) q[31];
-u3(2.463921227506926,-2.108379218277337,1.7253601175390605) q[31];
-cx q[7],q[21];
-u3(0.7779087415608452,-0.31776392785265184,-1.1382524948586443) q[21];
-u3(0.8073189603009927,-pi/2,-pi/2) q[7];
-cx q[7],q[21];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[21];
-u3(0.5470181950815399,0,pi/2) q[7];
-cx q[7],q[21];
-u3(0.8356178903035701,-2.7335902892231836,-0.4266239607407609) q[21];
-u3(2.4772292601286905,1.9574945208675967,-2.49795435757286) q[7];
-u3(2.102149401106625,1.8375885285655853,-0.7032553142353999) q[9];
-u3(0.6979993399909284,-0.716880784330824,-0.17716815589655388) q[9];
-cx q[22],q[9];
-u3(1.0501887259906189,-pi/2,-pi/2) q[22];
-u3(0.9108269119855829,-0.5663632623964907,-0.7671792298623288) q[9];
-cx q[22],q[9];
-u3(0.3555716482811955,0,pi/2) q[22];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[9];
-cx q[22],q[9];
-u3(2.480774951925234,2.031420705238525,1.4306409722815365) q[22];
-u3(0.9986538712406239,1.240899807895036,0.08917253205845022) q[22];
-cx q[15],q[22];
-u3(1.1873902616700138,-pi/2,-pi/2) q[15];
-u3(0.8952827121290996,-0.5466594136395848,-0.798997347410717) q[22];
-cx q[15],q[22];
-u3(0.2271804792682486,-pi,-pi/2) q[15];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[22];
-cx q[15],q[22];
-u3(1.6184134523038636,0.4582023960499244,-1.6812518303935748) q[15];
-u3(2.431887110796234,2.938877978750334,-1.2613373909707637) q[15];
-cx q[16],q[15];
-u3(0.8831567975140896,-0.5301894969353063,-0.8251379413590065) q[15];
-u3(1.0773467978363922,-pi/2,-pi/2) q[16];
-cx q[16],q[15];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[15];
-u3(0.6458338174741368,-pi,-pi/2) q[16];
-cx q[16],q[15];
-u3(2.566807902358702,-0.2204905515729232,-1.4369584626111127) q[15];
-u3(0.6320456925833787,-0.5015280984731629,2.782764370616995) q[15];
-cx q[15],q[25];
-u3(0.8159359548571795,-pi/2,-pi/2) q[15];
-u3(1.146299455685569,-2.4187625511810986,2.756304373591723) q[16];
-u3(1.3738558842771456,-0.7761285101125321,2.44904661204096) q[16];
-cx q[16],q[20];
-u3(0.585894951397227,-pi/2,-pi/2) q[16];
-u3(0.9692648713005781,-0.6290469280075586,-0.6610012966738275) q[20];
-cx q[16],q[20];
-u3(0.1389388902219646,0,pi/2) q[16];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[20];
-cx q[16],q[20];
-u3(0.7438631520781855,2.389767990913932,-2.6800028374609504) q[16];
-u3(2.034086185526125,0.036620111846460635,-2.1875584980755107) q[16];
-cx q[16],q[1];
-u3(0.7740542605852208,-0.3055723868520386,-1.1553336123931839) q[1];
-u3(0.7310812395731134,-pi/2,-pi/2) q[16];
-cx q[16],q[1];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[1];
-u3(0.3610243406464957,-pi,-pi/2) q[16];
-cx q[16],q[1];
-u3(1.5911452157338462,-0.8853684463701512,-2.527130847331618) q[1];
-u3(0.3756298487832267,2.1314189379438826,0.9007595468896135) q[1];
-u3(2.490378167777692,1.1005350554048592,1.2884410008088132) q[16];
-u3(1.0691737754859367,-2.2993525650928865,-2.627392008888764) q[16];
-u3(1.0649457473893458,2.5131852013102023,-1.1619157100642998) q[20];
-u3(0.9461620346233542,-1.0903486543453007,1.3486369697002285) q[20];
-u3(2.152751045021377,1.6147148064868402,0.3067395852982102) q[22];
-u3(1.4791107285314498,-0.3735677789708256,1.696809103989965) q[22];
-cx q[22],q[8];
-u3(0.5196361787412125,-pi/2,-pi/2) q[22];
-u3(0.8608452787896179,-0.4969555581977043,-0.876789980933598) q[25];
-cx q[15],q[25];
-u3(0.47626563736655586,0,pi/2) q[15];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[25];
-cx q[15],q[25];
-u3(1.4819685779444065,1.768573944787323,1.1541041789663105) q[15];
-u3(1.5791583825796607,-1.4531145296696364,0.05493229883290507) q[15];
-cx q[15],q[13];
-u3(0.785489325949187,-0.34013555110185534,-1.1067321510212285) q[13];
-u3(0.859636219911783,-pi/2,-pi/2) q[15];
-cx q[15],q[13];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[13];
-u3(0.2876023515967139,-pi,-pi/2) q[15];
-cx q[15],q[13];
-u3(3.021457639617011,3.019754073654129,1.6167269692120474) q[13];
-u3(1.7734922734815917,-2.219716339793778,-0.3639426390055851) q[13];
-u3(2.4971429070454203,-1.2329949447279296,0.7109286404402901) q[15];
-u3(1.805064316859326,-0.5251051495245367,2.320585340897809) q[15];
-cx q[14],q[15];
-u3(0.5777173041030536,-pi/2,-pi/2) q[14];
-u3(0.8449334118840108,-0.47050430537311927,-0.9169967383150688) q[15];
-cx q[14],q[15];
-u3(0.560406405981464,-pi,-pi/2) q[14];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[15];
-cx q[14],q[15];
-u3(0.3891866719713246,1.0302258370049966,-0.2601626237607233) q[14];
-u3(2.270085608406017,0.8730511996580166,-2.475974385557376) q[15];
-u3(0.5195745599141207,-0.46968306916283176,1.7404082168460926) q[25];
-u3(2.0063699294731663,1.7385833014943364,-2.601634108440056) q[25];
-cx q[28],q[1];
-u3(0.7309245839960997,-0.05197054905747667,-1.5010461661808359) q[1];
-u3(0.6616548336071426,-pi/2,-pi/2) q[28];
-cx q[28],q[1];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[1];
-u3(0.19497014589584646,0,pi/2) q[28];
-cx q[28],q[1];
-u3(1.6838008477119442,-2.813736835679467,-0.03917682060946426) q[1];
-u3(0.6877321028849007,1.6457684804624595,-2.6457172499562223) q[28];
-u3(0.895930629423275,-0.5475111770110881,-0.7976346251418125) q[8];
-cx q[22],q[8];
-u3(0.0307192636975347,0,pi/2) q[22];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[8];
-cx q[22],q[8];
-u3(0.5648351929221682,1.3491860245926315,1.8397935081830639) q[22];
-u3(2.313378039918977,2.698329907179886,-2.224844376163065) q[22];
-cx q[26],q[22];
-u3(0.7569828982637755,-0.24238539182461016,-1.2429387020618048) q[22];
-u3(0.8574992540356084,-pi/2,-pi/2) q[26];
-cx q[26],q[22];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[22];
-u3(0.10695861506660424,0,pi/2) q[26];
-cx q[26],q[22];
-u3(2.727638476656721,-0.903831896584435,1.0154653389803752) q[22];
-u3(1.86975216037746,-1.2358199581943234,2.417996755706147) q[22];
-u3(1.1814516761871323,-0.33700635730167106,-1.4239337212431078) q[26];
-u3(1.3799500098852266,2.172016000340724,-1.3653742750002986) q[26];
-cx q[10],q[26];
-u3(1.2052695489813443,-pi/2,-pi/2) q[10];
-u3(0.8392878471839272,-0.4604726369497416,-0.9320615805000187) q[26];
-cx q[10],q[26];
-u3(0.3376577409342583,-pi,-pi/2) q[10];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[26];
-cx q[10],q[26];
-u3(1.2560271413018376,2.5897605154482006,-1.939124686118362) q[10];
-u3(2.349474770204123,1.364703432586328,-0.10799234553042059) q[10];
-cx q[16],q[10];
-u3(0.8805920898085009,-0.5265712974454111,-0.8308295575622413) q[10];
-u3(0.8604781688692148,-pi/2,-pi/2) q[16];
-cx q[16],q[10];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[10];
-u3(0.41320683134137387,-pi,-pi/2) q[16];
-cx q[16],q[10];
-u3(1.5038590534695075,-2.761996197074147,-0.3878106299433073) q[10];
-u3(1.2609894329293312,-1.2627201811031543,-2.5329463242948345) q[16];
-u3(1.7512720832548114,-1.4610858101448247,-0.09276564430974243) q[26];
-u3(2.6351816079275,-0.21724798908549658,2.9296346762391394) q[26];
-u3(1.1246806037220505,-3.0435145327088957,1.1390910937906957) q[8];
-u3(1.4860854734300657,2.0835103425927084,2.365615323075694) q[8];
-cx q[8],q[2];
-u3(0.9087159415272776,-0.5637738010220814,-0.7713970944362689) q[2];
-u3(1.0782444473797628,-pi/2,-pi/2) q[8];
-cx q[8],q[2];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[2];
-u3(0.35568947869386774,0,pi/2) q[8];
-cx q[8],q[2];
-u3(1.7575394984296042,0.9753435965148274,-0.36237847381536037) q[2];
-u3(2.992413002927203,0.4214433219491882,2.463717335430233) q[2];
-cx q[2],q[20];
-u3(0.39190138455090723,-pi/2,-pi/2) q[2];
-u3(0.9272140084718009,-0.585615541370216,-0.7354439227394671) q[20];
-cx q[2],q[20];
-u3(0.18206078734729503,0,pi/2) q[2];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[20];
-cx q[2],q[20];
-u3(1.8641434708070779,-0.49209428412419953,0.6289060896523346) q[2];
-u3(1.5159904381615594,1.2572428911519449,2.2632813937918232) q[2];
-u3(1.6110171048198352,2.9259531034465205,-2.2357361976975625) q[20];
-u3(1.4540675692462313,-0.31557888586881466,0.596032254490888) q[20];
-u3(0.32823618916724867,-0.2574051130014161,-1.1988107709848503) q[8];
-u3(1.0661282064127955,2.828082315019759,0.0240382204414753) q[8];
-cx q[22],q[8];
-u3(0.9670329339327112,-pi/2,-pi/2) q[22];
-u3(0.97683135439511,-0.6360745252607134,-0.6485142634666907) q[8];
-cx q[22],q[8];
-u3(0.21627111418983103,-pi,-pi/2) q[22];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[8];
-cx q[22],q[8];
-u3(0.968732068626679,-2.4616374781783015,-1.6586298969207403) q[22];
-u3(2.6697972908738983,1.7462525296996292,-0.9091040612813419) q[22];
-u3(2.362768716675059,-2.6660340214942506,1.7355602224353657) q[8];
-u3(2.3412658427629474,1.4298373352916274,1.5309727258273957) q[8];
-cx q[2],q[8];
-u3(0.43873951813506357,-pi/2,-pi/2) q[2];
-u3(0.9786618552483209,-0.6377422845537173,-0.6455302235387776) q[8];
-cx q[2],q[8];
-u3(0.28067596007958945,-pi,-pi/2) q[2];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[8];
-cx q[2],q[8];
-u3(1.0282639089064487,-3.045465730548762,3.080218942611207) q[2];
-u3(1.1906748469342174,-0.6399506544228726,2.3273437428754455) q[8];
-u3(1.165126294220483,1.1848639385309818,-1.0909362967742027) q[9];
-u3(1.619675932494767,2.8344330709358854,-1.5551921699937146) q[9];
-cx q[9],q[11];
-u3(0.783388838005315,-0.33413148418984395,-1.1152150219238166) q[11];
-u3(0.820503837044546,-pi/2,-pi/2) q[9];
-cx q[9],q[11];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[11];
-u3(0.1995594472460033,-pi,-pi/2) q[9];
-cx q[9],q[11];
-u3(2.218311073360417,2.7558663530171152,-0.36331471778741964) q[11];
-u3(2.5486045857078157,2.8291448747549977,2.952728124487007) q[11];
-cx q[5],q[11];
-u3(0.746664789549331,-0.1924402239076155,-1.3113017805102647) q[11];
-u3(0.8784285531104509,-pi/2,-pi/2) q[5];
-cx q[5],q[11];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[11];
-u3(0.17972212952204608,-pi,-pi/2) q[5];
-cx q[5],q[11];
-u3(1.5334566078456744,-0.23081111567863077,-0.9524733270466577) q[11];
-u3(1.079309015448427,-2.9763855989787578,-1.6666933524525316) q[11];
-u3(0.1780073130463552,0.4677135331554405,-0.5546109170060198) q[5];
-u3(1.2011270508677514,0.30961455572725205,-1.4912726239664433) q[5];
-cx q[5],q[31];
-u3(0.7735102367431853,-0.303801804749801,-1.157809006577164) q[31];
-u3(0.5200060012667155,-pi/2,-pi/2) q[5];
-cx q[5],q[31];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[31];
-u3(0.3534982924887842,-pi,-pi/2) q[5];
-cx q[5],q[31];
-u3(2.6371032310515816,-2.8062363072905185,-0.8649232631264501) q[31];
-u3(0.9754854541817114,3.0020994871153235,2.4489225256731952) q[31];
-cx q[31],q[23];
-u3(0.8593990778738045,-0.4946541693187281,-0.8803178494081152) q[23];
-u3(1.2399351392931346,-pi/2,-pi/2) q[31];
-cx q[31],q[23];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[23];
-u3(0.18898531501746407,-pi,-pi/2) q[31];
-cx q[31],q[23];
-u3(1.115354178177612,-1.5828804524503157,1.3241959932365583) q[23];
-u3(2.0894653307458704,1.1648593945842336,0.5288726867881386) q[23];
-cx q[23],q[20];
-u3(0.9699415734153266,-0.6296843614239673,-0.6598743462652603) q[20];
-u3(0.5095625119345544,-pi/2,-pi/2) q[23];
-cx q[23],q[20];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[20];
-u3(0.13534685185161335,-pi,-pi/2) q[23];
-cx q[23],q[20];
-u3(0.5729743722828564,-0.6225406771467963,1.0636119614431063) q[20];
-u3(2.864077818714752,2.760714120248899,-0.4321284856760883) q[23];
-u3(2.4436847701277737,0.16342379010750285,-0.6217152930618042) q[31];
-u3(1.6656133300028146,2.4256725039425255,-2.4039310207729296) q[31];
-cx q[13],q[31];
-u3(0.904024297337143,-pi/2,-pi/2) q[13];
-u3(0.9457396307886174,-0.6057250101676379,-0.701514876753329) q[31];
-cx q[13],q[31];
-u3(0.32834333086692147,-pi,-pi/2) q[13];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[31];
-cx q[13],q[31];
-u3(0.44063698861992273,-0.03381982624527646,2.08565109480665) q[13];
-u3(1.8118533209129035,2.8525205453782485,1.1717120508247927) q[31];
-u3(1.9100033584707772,1.3879483534878139,0.7800831799856933) q[5];
-u3(1.5251879923925513,-0.08414389667947608,1.0064311278733724) q[5];
-u3(2.587042972266735,-1.0793654971724078,-2.3039780014659534) q[9];
-u3(0.8664034715056179,1.2147618549262855,2.4936013168091646) q[9];
-cx q[19],q[9];
-u3(0.7358058612698997,-pi/2,-pi/2) q[19];
-u3(0.8878359015021138,-0.5366667108484,-0.8149039262705244) q[9];
-cx q[19],q[9];
-u3(0.35481988380069734,-pi,-pi/2) q[19];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[9];
-cx q[19],q[9];
-u3(1.1252765971516934,-3.0028122231744394,-2.324043882708953) q[19];
-u3(0.4004376830511662,0.9604138111523612,-0.5261747591682289) q[19];
-cx q[19],q[11];
-u3(0.7968616004370896,-0.3704321494760028,-1.0636406661964397) q[11];
-u3(0.7024113211376665,-pi/2,-pi/2) q[19];
-cx q[19],q[11];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[11];
-u3(0.3875225078056254,-pi,-pi/2) q[19];
-cx q[19],q[11];
-u3(0.48125514948991893,-2.4538768568552376,0.2762554617123172) q[11];
-u3(2.471283065049376,1.4645828894259223,0.8187048308021794) q[11];
-u3(2.2499306195770514,0.02134465026478871,0.47514525152634723) q[19];
-u3(2.688459996055605,1.551134602560042,2.180195661492604) q[19];
-cx q[19],q[3];
-u3(0.6451162550200334,-pi/2,-pi/2) q[19];
-cx q[25],q[11];
-u3(0.8620525002777775,-0.4988619065540143,-0.8738631671749086) q[11];
-u3(0.7303366519164675,-pi/2,-pi/2) q[25];
-cx q[25],q[11];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[11];
-u3(0.2197121409037609,-pi,-pi/2) q[25];
-cx q[25],q[11];
-u3(0.6774406440916878,-0.29932924178020537,0.8352965490584996) q[11];
-u3(1.640176231092359,2.3318115878093995,-1.1580512034183499) q[11];
-u3(1.1658147759866433,2.8040229020037852,0.04658821938919466) q[25];
-u3(0.945729342936042,1.551142389334145,-0.6728566413051604) q[25];
-cx q[26],q[11];
-u3(0.8011833252576643,-0.38109230144514017,-1.0483554582414385) q[11];
-u3(0.6457642651878631,-pi/2,-pi/2) q[26];
-cx q[26],q[11];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[11];
-u3(0.009467678011100693,0,pi/2) q[26];
-cx q[26],q[11];
-u3(1.8920720627655818,1.1175137871398402,-1.4733307744349986) q[11];
-u3(1.1996545351777204,-0.9472797956662755,-2.9674956381634763) q[26];
-u3(0.7943717259306172,-0.36409112423102297,-1.0727012488360401) q[3];
-cx q[19],q[3];
-u3(0.041371161692595054,-pi,-pi/2) q[19];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[3];
-cx q[19],q[3];
-u3(2.4186568301052254,1.5263412356792072,1.2674625382374174) q[19];
-u3(1.05520618750318,-2.880655392852236,-1.0513982965770152) q[19];
-u3(0.6609160267628847,0.35983285696437806,-2.6503246700545127) q[3];
-u3(0.3563101759371103,0.7331944224586975,0.8060182840676555) q[3];
-cx q[3],q[18];
-u3(0.812007369303908,-0.406075264639858,-1.0122534154772982) q[18];
-u3(0.39994070189990777,-pi/2,-pi/2) q[3];
-cx q[3],q[18];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[18];
-u3(0.25700808722354673,0,pi/2) q[3];
-cx q[3],q[18];
-u3(2.608298970112273,-0.12611071485875813,-2.816927531239724) q[18];
-u3(2.341722409074223,0.40327096308759636,1.635669683610498) q[3];
-cx q[30],q[25];
-u3(0.8510453168045183,-0.48096804039500807,-0.9011786215010353) q[25];
-u3(0.20879802788808505,-pi/2,-pi/2) q[30];
-cx q[30],q[25];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[25];
-u3(0.045936208203674674,-pi,-pi/2) q[30];
-cx q[30],q[25];
-u3(1.627948091836651,-2.652047855545126,0.010191273623208819) q[25];
-u3(2.1448305665563523,0.18597402371176575,-2.652731238297026) q[30];
-u3(1.5490786150122853,1.8273830025740727,-2.17238675723679) q[9];
-u3(1.2951213164794733,-0.5764341623713642,2.8240341631096486) q[9];
-cx q[24],q[9];
-u3(1.244016768032456,-pi/2,-pi/2) q[24];
-u3(0.9242723108481015,-0.5822660205471921,-0.7410149202173564) q[9];
-cx q[24],q[9];
-u3(0.04452249789212435,-pi,-pi/2) q[24];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[9];
-cx q[24],q[9];
-u3(1.0580261522888101,-0.10416711718887006,2.9069829187859124) q[24];
-u3(1.3600791962902208,-2.8057515481466897,1.631168049336245) q[24];
-cx q[24],q[6];
-u3(0.8986142475604112,-pi/2,-pi/2) q[24];
-u3(0.8791625175653679,-0.5245330665625132,-0.8340280558970097) q[6];
-cx q[24],q[6];
-u3(0.061626810771670384,-pi,-pi/2) q[24];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[6];
-cx q[24],q[6];
-u3(1.8529601738062738,0.32570953564847693,1.6088549907722207) q[24];
-u3(2.051693829855812,2.8732962212047983,-2.452652914039959) q[24];
-cx q[24],q[0];
-u3(0.9173662697291219,-0.5742224298296676,-0.7543062146353137) q[0];
-u3(1.238262320987184,-pi/2,-pi/2) q[24];
-cx q[24],q[0];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[0];
-u3(0.06972329663811305,0,pi/2) q[24];
-cx q[24],q[0];
-u3(1.0940222507996853,1.0968796049091267,-1.6421644522869832) q[0];
-u3(2.3068544436717833,-0.8565437609433197,3.054036554808828) q[24];
-u3(0.8376933592238944,2.0001552790170036,-2.599589765894213) q[6];
-u3(2.8638328726548985,0.8107960305939104,2.758790183642704) q[6];
-cx q[6],q[19];
-u3(0.9375654882731543,-0.5970550165879747,-0.7162481236275866) q[19];
-u3(0.657324538397264,-pi/2,-pi/2) q[6];
-cx q[6],q[19];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[19];
-u3(0.08084660909667488,0,pi/2) q[6];
-cx q[6],q[19];
-u3(1.8530942670338735,-1.9222911612890528,1.9498048884445938) q[19];
-u3(1.0333871041446867,1.8945534963804533,0.6047415839076025) q[6];
-u3(1.5762114211083411,-2.948964301762073,-0.7781853084282777) q[9];
-u3(0.36276113578803043,2.9697766516942536,-0.03260091149231492) q[9];
-cx q[5],q[9];
-u3(0.890472810088654,-pi/2,-pi/2) q[5];
-u3(0.8929544529510296,-0.5435756559876626,-0.8039218458632043) q[9];
-cx q[5],q[9];
-u3(0.28043870133369475,0,pi/2) q[5];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[9];
-cx q[5],q[9];
-u3(2.1749972432224793,-0.43667041056671296,-2.2764559770467194) q[5];
-u3(1.3454562450875922,1.3471073171887955,-1.428631369308139) q[5];
-cx q[5],q[4];
-u3(0.8800087490663965,-0.5257414638354194,-0.8321324434262483) q[4];
-u3(0.8704798754867815,-pi/2,-pi/2) q[5];
-cx q[5],q[4];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[4];
-u3(0.12269781720505636,0,pi/2) q[5];
-cx q[5],q[4];
-u3(2.0811900072317275,1.2699455854743302,0.5268203472346222) q[4];
-u3(0.4234343717822944,2.607723686379302,-2.414576997158047) q[5];
-u3(1.984137925506197,-1.5549140029804884,0.4773427895506388) q[9];
-u3(0.5672924638749043,2.5082695166931996,2.9054438801966045) q[9];
-cx q[22],q[9];
-u3(0.7112081837908167,-pi/2,-pi/2) q[22];
-u3(0.7439847273652904,-0.17689436938853564,-1.3324560293489984) q[9];
-cx q[22],q[9];
-u3(0.03158586375011365,-pi,-pi/2) q[22];
-u3(2.090822159332339,-2.446835860047982,2.603927236866438) q[9];
-cx q[22],q[9];
-u3(1.0333902215031547,1.3515995490804968,0.05831610000942655) q[22];
-u3(0.4131451423858735,0.44489967745283954,0.4770049123368185) q[9];
-barrier q[0],q[1],q[2],q[3],q[4],q[5],q[6],q[7],q[8],q[9],q[10],q[11],q[12],q[13],q[14],q[15],q[16],q[17],q[18],q[19],q[20],q[21],q[22],q[23],q[24],q[25],q[26],q[27],q[28],q[29],q[30],q[31];
-measure q[0] -> meas[0];
-measure q[1] -> meas[1];
-measure q[2] -> meas[2];
-measure q[3] -> meas[3];
-measure q[4] -> meas[4];
-measure q[5] -> meas[5];
-measure q[6] -> meas[6];
-measure q[7] -> meas[7];
-measure q[8] -> meas[8];
-measure q[9] -> meas[9];
-measure q[10] -> meas[10];
-measure q[11] -> meas[11];
-measure q[12] -> meas[12];
-measure q[13] -> meas[13];
-measure q[14] -> meas[14];
-measure q[15] -> meas[15];
-measure q[16] -> meas[16];
-measure q[17] -> meas[17];
-measure q[18] -> meas[18];
-measure q[19] -> meas[19];
-measure q[20] -> meas[20];
-measure q[21] -> meas[21];
-measure q[22] -> meas[22];
-measure q[23] -> meas[23];
-measure q[24] -> meas[24];
-measure q[25] -> meas[25];
-measure q[26] -> meas[26];
-measure q[27] -> meas[27];
-measure q[28] -> meas[28];
-measure q[29] -> meas[29];
-measure q[30] -> meas[30];
-measure q[31] -> meas[31];
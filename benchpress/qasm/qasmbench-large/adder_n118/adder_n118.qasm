@@ -1,502 +0,0 @@
-OPENQASM 2.0;
-include "qelib1.inc";
-qreg q[118];
-creg c[118];
-creg meas[118];
-x q[1];
-x q[2];
-x q[3];
-x q[4];
-x q[5];
-x q[6];
-x q[7];
-x q[8];
-x q[9];
-x q[10];
-x q[11];
-x q[12];
-x q[13];
-x q[14];
-x q[15];
-x q[16];
-x q[17];
-x q[18];
-x q[19];
-x q[20];
-x q[21];
-x q[22];
-x q[23];
-x q[24];
-x q[25];
-x q[26];
-x q[27];
-x q[28];
-x q[29];
-x q[30];
-x q[31];
-x q[32];
-x q[33];
-x q[34];
-x q[35];
-x q[36];
-x q[37];
-x q[38];
-x q[39];
-x q[40];
-x q[41];
-x q[42];
-x q[43];
-x q[44];
-x q[45];
-x q[46];
-x q[47];
-x q[48];
-x q[49];
-x q[50];
-x q[51];
-x q[52];
-x q[104];
-cx q[0],q[52];
-cx q[0],q[104];
-ccx q[104],q[52],q[0];
-cx q[1],q[53];
-cx q[1],q[0];
-ccx q[0],q[53],q[1];
-cx q[2],q[54];
-cx q[2],q[1];
-ccx q[1],q[54],q[2];
-cx q[3],q[55];
-cx q[3],q[2];
-ccx q[2],q[55],q[3];
-cx q[3],q[105];
-ccx q[2],q[55],q[3];
-cx q[3],q[2];
-cx q[2],q[55];
-ccx q[1],q[54],q[2];
-cx q[2],q[1];
-cx q[1],q[54];
-ccx q[0],q[53],q[1];
-cx q[1],q[0];
-cx q[0],q[53];
-ccx q[104],q[52],q[0];
-cx q[0],q[104];
-cx q[104],q[52];
-cx q[4],q[56];
-cx q[4],q[105];
-ccx q[105],q[56],q[4];
-cx q[5],q[57];
-cx q[5],q[4];
-ccx q[4],q[57],q[5];
-cx q[6],q[58];
-cx q[6],q[5];
-ccx q[5],q[58],q[6];
-cx q[7],q[59];
-cx q[7],q[6];
-ccx q[6],q[59],q[7];
-cx q[7],q[106];
-ccx q[6],q[59],q[7];
-cx q[7],q[6];
-cx q[6],q[59];
-ccx q[5],q[58],q[6];
-cx q[6],q[5];
-cx q[5],q[58];
-ccx q[4],q[57],q[5];
-cx q[5],q[4];
-cx q[4],q[57];
-ccx q[105],q[56],q[4];
-cx q[4],q[105];
-cx q[105],q[56];
-cx q[8],q[60];
-cx q[8],q[106];
-ccx q[106],q[60],q[8];
-cx q[9],q[61];
-cx q[9],q[8];
-ccx q[8],q[61],q[9];
-cx q[10],q[62];
-cx q[10],q[9];
-ccx q[9],q[62],q[10];
-cx q[11],q[63];
-cx q[11],q[10];
-ccx q[10],q[63],q[11];
-cx q[11],q[107];
-ccx q[10],q[63],q[11];
-cx q[11],q[10];
-cx q[10],q[63];
-ccx q[9],q[62],q[10];
-cx q[10],q[9];
-cx q[9],q[62];
-ccx q[8],q[61],q[9];
-cx q[9],q[8];
-cx q[8],q[61];
-ccx q[106],q[60],q[8];
-cx q[8],q[106];
-cx q[106],q[60];
-cx q[12],q[64];
-cx q[12],q[107];
-ccx q[107],q[64],q[12];
-cx q[13],q[65];
-cx q[13],q[12];
-ccx q[12],q[65],q[13];
-cx q[14],q[66];
-cx q[14],q[13];
-ccx q[13],q[66],q[14];
-cx q[15],q[67];
-cx q[15],q[14];
-ccx q[14],q[67],q[15];
-cx q[15],q[108];
-ccx q[14],q[67],q[15];
-cx q[15],q[14];
-cx q[14],q[67];
-ccx q[13],q[66],q[14];
-cx q[14],q[13];
-cx q[13],q[66];
-ccx q[12],q[65],q[13];
-cx q[13],q[12];
-cx q[12],q[65];
-ccx q[107],q[64],q[12];
-cx q[12],q[107];
-cx q[107],q[64];
-cx q[16],q[68];
-cx q[16],q[108];
-ccx q[108],q[68],q[16];
-cx q[17],q[69];
-cx q[17],q[16];
-ccx q[16],q[69],q[17];
-cx q[18],q[70];
-cx q[18],q[17];
-ccx q[17],q[70],q[18];
-cx q[19],q[71];
-cx q[19],q[18];
-ccx q[18],q[71],q[19];
-cx q[19],q[109];
-ccx q[18],q[71],q[19];
-cx q[19],q[18];
-cx q[18],q[71];
-ccx q[17],q[70],q[18];
-cx q[18],q[17];
-cx q[17],q[70];
-ccx q[16],q[69],q[17];
-cx q[17],q[16];
-cx q[16],q[69];
-ccx q[108],q[68],q[16];
-cx q[16],q[108];
-cx q[108],q[68];
-cx q[20],q[72];
-cx q[20],q[109];
-ccx q[109],q[72],q[20];
-cx q[21],q[73];
-cx q[21],q[20];
-ccx q[20],q[73],q[21];
-cx q[22],q[74];
-cx q[22],q[21];
-ccx q[21],q[74],q[22];
-cx q[23],q[75];
-cx q[23],q[22];
-ccx q[22],q[75],q[23];
-cx q[23],q[110];
-ccx q[22],q[75],q[23];
-cx q[23],q[22];
-cx q[22],q[75];
-ccx q[21],q[74],q[22];
-cx q[22],q[21];
-cx q[21],q[74];
-ccx q[20],q[73],q[21];
-cx q[21],q[20];
-cx q[20],q[73];
-ccx q[109],q[72],q[20];
-cx q[20],q[109];
-cx q[109],q[72];
-cx q[24],q[76];
-cx q[24],q[110];
-ccx q[110],q[76],q[24];
-cx q[25],q[77];
-cx q[25],q[24];
-ccx q[24],q[77],q[25];
-cx q[26],q[78];
-cx q[26],q[25];
-ccx q[25],q[78],q[26];
-cx q[27],q[79];
-cx q[27],q[26];
-ccx q[26],q[79],q[27];
-cx q[27],q[111];
-ccx q[26],q[79],q[27];
-cx q[27],q[26];
-cx q[26],q[79];
-ccx q[25],q[78],q[26];
-cx q[26],q[25];
-cx q[25],q[78];
-ccx q[24],q[77],q[25];
-cx q[25],q[24];
-cx q[24],q[77];
-ccx q[110],q[76],q[24];
-cx q[24],q[110];
-cx q[110],q[76];
-cx q[28],q[80];
-cx q[28],q[111];
-ccx q[111],q[80],q[28];
-cx q[29],q[81];
-cx q[29],q[28];
-ccx q[28],q[81],q[29];
-cx q[30],q[82];
-cx q[30],q[29];
-ccx q[29],q[82],q[30];
-cx q[31],q[83];
-cx q[31],q[30];
-ccx q[30],q[83],q[31];
-cx q[31],q[112];
-ccx q[30],q[83],q[31];
-cx q[31],q[30];
-cx q[30],q[83];
-ccx q[29],q[82],q[30];
-cx q[30],q[29];
-cx q[29],q[82];
-ccx q[28],q[81],q[29];
-cx q[29],q[28];
-cx q[28],q[81];
-ccx q[111],q[80],q[28];
-cx q[28],q[111];
-cx q[111],q[80];
-cx q[32],q[84];
-cx q[32],q[112];
-ccx q[112],q[84],q[32];
-cx q[33],q[85];
-cx q[33],q[32];
-ccx q[32],q[85],q[33];
-cx q[34],q[86];
-cx q[34],q[33];
-ccx q[33],q[86],q[34];
-cx q[35],q[87];
-cx q[35],q[34];
-ccx q[34],q[87],q[35];
-cx q[35],q[113];
-ccx q[34],q[87],q[35];
-cx q[35],q[34];
-cx q[34],q[87];
-ccx q[33],q[86],q[34];
-cx q[34],q[33];
-cx q[33],q[86];
-ccx q[32],q[85],q[33];
-cx q[33],q[32];
-cx q[32],q[85];
-ccx q[112],q[84],q[32];
-cx q[32],q[112];
-cx q[112],q[84];
-cx q[36],q[88];
-cx q[36],q[113];
-ccx q[113],q[88],q[36];
-cx q[37],q[89];
-cx q[37],q[36];
-ccx q[36],q[89],q[37];
-cx q[38],q[90];
-cx q[38],q[37];
-ccx q[37],q[90],q[38];
-cx q[39],q[91];
-cx q[39],q[38];
-ccx q[38],q[91],q[39];
-cx q[39],q[114];
-ccx q[38],q[91],q[39];
-cx q[39],q[38];
-cx q[38],q[91];
-ccx q[37],q[90],q[38];
-cx q[38],q[37];
-cx q[37],q[90];
-ccx q[36],q[89],q[37];
-cx q[37],q[36];
-cx q[36],q[89];
-ccx q[113],q[88],q[36];
-cx q[36],q[113];
-cx q[113],q[88];
-cx q[40],q[92];
-cx q[40],q[114];
-ccx q[114],q[92],q[40];
-cx q[41],q[93];
-cx q[41],q[40];
-ccx q[40],q[93],q[41];
-cx q[42],q[94];
-cx q[42],q[41];
-ccx q[41],q[94],q[42];
-cx q[43],q[95];
-cx q[43],q[42];
-ccx q[42],q[95],q[43];
-cx q[43],q[115];
-ccx q[42],q[95],q[43];
-cx q[43],q[42];
-cx q[42],q[95];
-ccx q[41],q[94],q[42];
-cx q[42],q[41];
-cx q[41],q[94];
-ccx q[40],q[93],q[41];
-cx q[41],q[40];
-cx q[40],q[93];
-ccx q[114],q[92],q[40];
-cx q[40],q[114];
-cx q[114],q[92];
-cx q[44],q[96];
-cx q[44],q[115];
-ccx q[115],q[96],q[44];
-cx q[45],q[97];
-cx q[45],q[44];
-ccx q[44],q[97],q[45];
-cx q[46],q[98];
-cx q[46],q[45];
-ccx q[45],q[98],q[46];
-cx q[47],q[99];
-cx q[47],q[46];
-ccx q[46],q[99],q[47];
-cx q[47],q[116];
-ccx q[46],q[99],q[47];
-cx q[47],q[46];
-cx q[46],q[99];
-ccx q[45],q[98],q[46];
-cx q[46],q[45];
-cx q[45],q[98];
-ccx q[44],q[97],q[45];
-cx q[45],q[44];
-cx q[44],q[97];
-ccx q[115],q[96],q[44];
-cx q[44],q[115];
-cx q[115],q[96];
-cx q[48],q[100];
-cx q[48],q[116];
-ccx q[116],q[100],q[48];
-cx q[49],q[101];
-cx q[49],q[48];
-ccx q[48],q[101],q[49];
-cx q[50],q[102];
-cx q[50],q[49];
-ccx q[49],q[102],q[50];
-cx q[51],q[103];
-cx q[51],q[50];
-ccx q[50],q[103],q[51];
-cx q[51],q[117];
-ccx q[50],q[103],q[51];
-cx q[51],q[50];
-cx q[50],q[103];
-ccx q[49],q[102],q[50];
-cx q[50],q[49];
-cx q[49],q[102];
-ccx q[48],q[101],q[49];
-cx q[49],q[48];
-cx q[48],q[101];
-ccx q[116],q[100],q[48];
-cx q[48],q[116];
-cx q[116],q[100];
-barrier q[0],q[1],q[2],q[3],q[4],q[5],q[6],q[7],q[8],q[9],q[10],q[11],q[12],q[13],q[14],q[15],q[16],q[17],q[18],q[19],q[20],q[21],q[22],q[23],q[24],q[25],q[26],q[27],q[28],q[29],q[30],q[31],q[32],q[33],q[34],q[35],q[36],q[37],q[38],q[39],q[40],q[41],q[42],q[43],q[44],q[45],q[46],q[47],q[48],q[49],q[50],q[51],q[52],q[53],q[54],q[55],q[56],q[57],q[58],q[59],q[60],q[61],q[62],q[63],q[64],q[65],q[66],q[67],q[68],q[69],q[70],q[71],q[72],q[73],q[74],q[75],q[76],q[77],q[78],q[79],q[80],q[81],q[82],q[83],q[84],q[85],q[86],q[87],q[88],q[89],q[90],q[91],q[92],q[93],q[94],q[95],q[96],q[97],q[98],q[99],q[100],q[101],q[102],q[103],q[104],q[105],q[106],q[107],q[108],q[109],q[110],q[111],q[112],q[113],q[114],q[115],q[116],q[117];
-measure q[0] -> meas[0];
-measure q[1] -> meas[1];
-measure q[2] -> meas[2];
-measure q[3] -> meas[3];
-measure q[4] -> meas[4];
-measure q[5] -> meas[5];
-measure q[6] -> meas[6];
-measure q[7] -> meas[7];
-measure q[8] -> meas[8];
-measure q[9] -> meas[9];
-measure q[10] -> meas[10];
-measure q[11] -> meas[11];
-measure q[12] -> meas[12];
-measure q[13] -> meas[13];
-measure q[14] -> meas[14];
-measure q[15] -> meas[15];
-measure q[16] -> meas[16];
-measure q[17] -> meas[17];
-measure q[18] -> meas[18];
-measure q[19] -> meas[19];
-measure q[20] -> meas[20];
-measure q[21] -> meas[21];
-measure q[22] -> meas[22];
-measure q[23] -> meas[23];
-measure q[24] -> meas[24];
-measure q[25] -> meas[25];
-measure q[26] -> meas[26];
-measure q[27] -> meas[27];
-measure q[28] -> meas[28];
-measure q[29] -> meas[29];
-measure q[30] -> meas[30];
-measure q[31] -> meas[31];
-measure q[32] -> meas[32];
-measure q[33] -> meas[33];
-measure q[34] -> meas[34];
-measure q[35] -> meas[35];
-measure q[36] -> meas[36];
-measure q[37] -> meas[37];
-measure q[38] -> meas[38];
-measure q[39] -> meas[39];
-measure q[40] -> meas[40];
-measure q[41] -> meas[41];
-measure q[42] -> meas[42];
-measure q[43] -> meas[43];
-measure q[44] -> meas[44];
-measure q[45] -> meas[45];
-measure q[46] -> meas[46];
-measure q[47] -> meas[47];
-measure q[48] -> meas[48];
-measure q[49] -> meas[49];
-measure q[50] -> meas[50];
-measure q[51] -> meas[51];
-measure q[52] -> meas[52];
-measure q[53] -> meas[53];
-measure q[54] -> meas[54];
-measure q[55] -> meas[55];
-measure q[56] -> meas[56];
-measure q[57] -> meas[57];
-measure q[58] -> meas[58];
-measure q[59] -> meas[59];
-measure q[60] -> meas[60];
-measure q[61] -> meas[61];
-measure q[62] -> meas[62];
-measure q[63] -> meas[63];
-measure q[64] -> meas[64];
-measure q[65] -> meas[65];
-measure q[66] -> meas[66];
-measure q[67] -> meas[67];
-measure q[68] -> meas[68];
-measure q[69] -> meas[69];
-measure q[70] -> meas[70];
-measure q[71] -> meas[71];
-measure q[72] -> meas[72];
-measure q[73] -> meas[73];
-measure q[74] -> meas[74];
-measure q[75] -> meas[75];
-measure q[76] -> meas[76];
-measure q[77] -> meas[77];
-measure q[78] -> meas[78];
-measure q[79] -> meas[79];
-measure q[80] -> meas[80];
-measure q[81] -> meas[81];
-measure q[82] -> meas[82];
-measure q[83] -> meas[83];
-measure q[84] -> meas[84];
-measure q[85] -> meas[85];
-measure q[86] -> meas[86];
-measure q[87] -> meas[87];
-measure q[88] -> meas[88];
-measure q[89] -> meas[89];
-measure q[90] -> meas[90];
-measure q[91] -> meas[91];
-measure q[92] -> meas[92];
-measure q[93] -> meas[93];
-measure q[94] -> meas[94];
-measure q[95] -> meas[95];
-measure q[96] -> meas[96];
-measure q[97] -> meas[97];
-measure q[98] -> meas[98];
-measure q[99] -> meas[99];
-measure q[100] -> meas[100];
-measure q[101] -> meas[101];
-measure q[102] -> meas[102];
-measure q[103] -> meas[103];
-measure q[104] -> meas[104];
-measure q[105] -> meas[105];
-measure q[106] -> meas[106];
-measure q[107] -> meas[107];
-measure q[108] -> meas[108];
-measure q[109] -> meas[109];
-measure q[110] -> meas[110];
-measure q[111] -> meas[111];
-measure q[112] -> meas[112];
-measure q[113] -> meas[113];
-measure q[114] -> meas[114];
-measure q[115] -> meas[115];
-measure q[116] -> meas[116];
-measure q[117] -> meas[117];
@@ -1,122 +0,0 @@
-OPENQASM 2.0;
-include "qelib1.inc";
-qreg q[28];
-creg c[28];
-creg meas[28];
-x q[1];
-x q[2];
-x q[3];
-x q[4];
-x q[5];
-x q[6];
-x q[7];
-x q[8];
-x q[9];
-x q[10];
-x q[11];
-x q[12];
-x q[24];
-cx q[0],q[12];
-cx q[0],q[24];
-ccx q[24],q[12],q[0];
-cx q[1],q[13];
-cx q[1],q[0];
-ccx q[0],q[13],q[1];
-cx q[2],q[14];
-cx q[2],q[1];
-ccx q[1],q[14],q[2];
-cx q[3],q[15];
-cx q[3],q[2];
-ccx q[2],q[15],q[3];
-cx q[3],q[25];
-ccx q[2],q[15],q[3];
-cx q[3],q[2];
-cx q[2],q[15];
-ccx q[1],q[14],q[2];
-cx q[2],q[1];
-cx q[1],q[14];
-ccx q[0],q[13],q[1];
-cx q[1],q[0];
-cx q[0],q[13];
-ccx q[24],q[12],q[0];
-cx q[0],q[24];
-cx q[24],q[12];
-cx q[4],q[16];
-cx q[4],q[25];
-ccx q[25],q[16],q[4];
-cx q[5],q[17];
-cx q[5],q[4];
-ccx q[4],q[17],q[5];
-cx q[6],q[18];
-cx q[6],q[5];
-ccx q[5],q[18],q[6];
-cx q[7],q[19];
-cx q[7],q[6];
-ccx q[6],q[19],q[7];
-cx q[7],q[26];
-ccx q[6],q[19],q[7];
-cx q[7],q[6];
-cx q[6],q[19];
-ccx q[5],q[18],q[6];
-cx q[6],q[5];
-cx q[5],q[18];
-ccx q[4],q[17],q[5];
-cx q[5],q[4];
-cx q[4],q[17];
-ccx q[25],q[16],q[4];
-cx q[4],q[25];
-cx q[25],q[16];
-cx q[8],q[20];
-cx q[8],q[26];
-ccx q[26],q[20],q[8];
-cx q[9],q[21];
-cx q[9],q[8];
-ccx q[8],q[21],q[9];
-cx q[10],q[22];
-cx q[10],q[9];
-ccx q[9],q[22],q[10];
-cx q[11],q[23];
-cx q[11],q[10];
-ccx q[10],q[23],q[11];
-cx q[11],q[27];
-ccx q[10],q[23],q[11];
-cx q[11],q[10];
-cx q[10],q[23];
-ccx q[9],q[22],q[10];
-cx q[10],q[9];
-cx q[9],q[22];
-ccx q[8],q[21],q[9];
-cx q[9],q[8];
-cx q[8],q[21];
-ccx q[26],q[20],q[8];
-cx q[8],q[26];
-cx q[26],q[20];
-barrier q[0],q[1],q[2],q[3],q[4],q[5],q[6],q[7],q[8],q[9],q[10],q[11],q[12],q[13],q[14],q[15],q[16],q[17],q[18],q[19],q[20],q[21],q[22],q[23],q[24],q[25],q[26],q[27];
-measure q[0] -> meas[0];
-measure q[1] -> meas[1];
-measure q[2] -> meas[2];
-measure q[3] -> meas[3];
-measure q[4] -> meas[4];
-measure q[5] -> meas[5];
-measure q[6] -> meas[6];
-measure q[7] -> meas[7];
-measure q[8] -> meas[8];
-measure q[9] -> meas[9];
-measure q[10] -> meas[10];
-measure q[11] -> meas[11];
-measure q[12] -> meas[12];
-measure q[13] -> meas[13];
-measure q[14] -> meas[14];
-measure q[15] -> meas[15];
-measure q[16] -> meas[16];
-measure q[17] -> meas[17];
-measure q[18] -> meas[18];
-measure q[19] -> meas[19];
-measure q[20] -> meas[20];
-measure q[21] -> meas[21];
-measure q[22] -> meas[22];
-measure q[23] -> meas[23];
-measure q[24] -> meas[24];
-measure q[25] -> meas[25];
-measure q[26] -> meas[26];
-measure q[27] -> meas[27];
@@ -1,1832 +0,0 @@
-OPENQASM 2.0;
-include "qelib1.inc";
-qreg q[433];
-creg c[433];
-creg meas[433];
-x q[1];
-x q[2];
-x q[3];
-x q[4];
-x q[5];
-x q[6];
-x q[7];
-x q[8];
-x q[9];
-x q[10];
-x q[11];
-x q[12];
-x q[13];
-x q[14];
-x q[15];
-x q[16];
-x q[17];
-x q[18];
-x q[19];
-x q[20];
-x q[21];
-x q[22];
-x q[23];
-x q[24];
-x q[25];
-x q[26];
-x q[27];
-x q[28];
-x q[29];
-x q[30];
-x q[31];
-x q[32];
-x q[33];
-x q[34];
-x q[35];
-x q[36];
-x q[37];
-x q[38];
-x q[39];
-x q[40];
-x q[41];
-x q[42];
-x q[43];
-x q[44];
-x q[45];
-x q[46];
-x q[47];
-x q[48];
-x q[49];
-x q[50];
-x q[51];
-x q[52];
-x q[53];
-x q[54];
-x q[55];
-x q[56];
-x q[57];
-x q[58];
-x q[59];
-x q[60];
-x q[61];
-x q[62];
-x q[63];
-x q[64];
-x q[65];
-x q[66];
-x q[67];
-x q[68];
-x q[69];
-x q[70];
-x q[71];
-x q[72];
-x q[73];
-x q[74];
-x q[75];
-x q[76];
-x q[77];
-x q[78];
-x q[79];
-x q[80];
-x q[81];
-x q[82];
-x q[83];
-x q[84];
-x q[85];
-x q[86];
-x q[87];
-x q[88];
-x q[89];
-x q[90];
-x q[91];
-x q[92];
-x q[93];
-x q[94];
-x q[95];
-x q[96];
-x q[97];
-x q[98];
-x q[99];
-x q[100];
-x q[101];
-x q[102];
-x q[103];
-x q[104];
-x q[105];
-x q[106];
-x q[107];
-x q[108];
-x q[109];
-x q[110];
-x q[111];
-x q[112];
-x q[113];
-x q[114];
-x q[115];
-x q[116];
-x q[117];
-x q[118];
-x q[119];
-x q[120];
-x q[121];
-x q[122];
-x q[123];
-x q[124];
-x q[125];
-x q[126];
-x q[127];
-x q[128];
-x q[129];
-x q[130];
-x q[131];
-x q[132];
-x q[133];
-x q[134];
-x q[135];
-x q[136];
-x q[137];
-x q[138];
-x q[139];
-x q[140];
-x q[141];
-x q[142];
-x q[143];
-x q[144];
-x q[145];
-x q[146];
-x q[147];
-x q[148];
-x q[149];
-x q[150];
-x q[151];
-x q[152];
-x q[153];
-x q[154];
-x q[155];
-x q[156];
-x q[157];
-x q[158];
-x q[159];
-x q[160];
-x q[161];
-x q[162];
-x q[163];
-x q[164];
-x q[165];
-x q[166];
-x q[167];
-x q[168];
-x q[169];
-x q[170];
-x q[171];
-x q[172];
-x q[173];
-x q[174];
-x q[175];
-x q[176];
-x q[177];
-x q[178];
-x q[179];
-x q[180];
-x q[181];
-x q[182];
-x q[183];
-x q[184];
-x q[185];
-x q[186];
-x q[187];
-x q[188];
-x q[189];
-x q[190];
-x q[191];
-x q[192];
-x q[384];
-cx q[0],q[192];
-cx q[0],q[384];
-ccx q[384],q[192],q[0];
-cx q[1],q[193];
-cx q[1],q[0];
-ccx q[0],q[193],q[1];
-cx q[2],q[194];
-cx q[2],q[1];
-ccx q[1],q[194],q[2];
-cx q[3],q[195];
-cx q[3],q[2];
-ccx q[2],q[195],q[3];
-cx q[3],q[385];
-ccx q[2],q[195],q[3];
-cx q[3],q[2];
-cx q[2],q[195];
-ccx q[1],q[194],q[2];
-cx q[2],q[1];
-cx q[1],q[194];
-ccx q[0],q[193],q[1];
-cx q[1],q[0];
-cx q[0],q[193];
-ccx q[384],q[192],q[0];
-cx q[0],q[384];
-cx q[384],q[192];
-cx q[4],q[196];
-cx q[4],q[385];
-ccx q[385],q[196],q[4];
-cx q[5],q[197];
-cx q[5],q[4];
-ccx q[4],q[197],q[5];
-cx q[6],q[198];
-cx q[6],q[5];
-ccx q[5],q[198],q[6];
-cx q[7],q[199];
-cx q[7],q[6];
-ccx q[6],q[199],q[7];
-cx q[7],q[386];
-ccx q[6],q[199],q[7];
-cx q[7],q[6];
-cx q[6],q[199];
-ccx q[5],q[198],q[6];
-cx q[6],q[5];
-cx q[5],q[198];
-ccx q[4],q[197],q[5];
-cx q[5],q[4];
-cx q[4],q[197];
-ccx q[385],q[196],q[4];
-cx q[4],q[385];
-cx q[385],q[196];
-cx q[8],q[200];
-cx q[8],q[386];
-ccx q[386],q[200],q[8];
-cx q[9],q[201];
-cx q[9],q[8];
-ccx q[8],q[201],q[9];
-cx q[10],q[202];
-cx q[10],q[9];
-ccx q[9],q[202],q[10];
-cx q[11],q[203];
-cx q[11],q[10];
-ccx q[10],q[203],q[11];
-cx q[11],q[387];
-ccx q[10],q[203],q[11];
-cx q[11],q[10];
-cx q[10],q[203];
-ccx q[9],q[202],q[10];
-cx q[10],q[9];
-cx q[9],q[202];
-ccx q[8],q[201],q[9];
-cx q[9],q[8];
-cx q[8],q[201];
-ccx q[386],q[200],q[8];
-cx q[8],q[386];
-cx q[386],q[200];
-cx q[12],q[204];
-cx q[12],q[387];
-ccx q[387],q[204],q[12];
-cx q[13],q[205];
-cx q[13],q[12];
-ccx q[12],q[205],q[13];
-cx q[14],q[206];
-cx q[14],q[13];
-ccx q[13],q[206],q[14];
-cx q[15],q[207];
-cx q[15],q[14];
-ccx q[14],q[207],q[15];
-cx q[15],q[388];
-ccx q[14],q[207],q[15];
-cx q[15],q[14];
-cx q[14],q[207];
-ccx q[13],q[206],q[14];
-cx q[14],q[13];
-cx q[13],q[206];
-ccx q[12],q[205],q[13];
-cx q[13],q[12];
-cx q[12],q[205];
-ccx q[387],q[204],q[12];
-cx q[12],q[387];
-cx q[387],q[204];
-cx q[16],q[208];
-cx q[16],q[388];
-ccx q[388],q[208],q[16];
-cx q[17],q[209];
-cx q[17],q[16];
-ccx q[16],q[209],q[17];
-cx q[18],q[210];
-cx q[18],q[17];
-ccx q[17],q[210],q[18];
-cx q[19],q[211];
-cx q[19],q[18];
-ccx q[18],q[211],q[19];
-cx q[19],q[389];
-ccx q[18],q[211],q[19];
-cx q[19],q[18];
-cx q[18],q[211];
-ccx q[17],q[210],q[18];
-cx q[18],q[17];
-cx q[17],q[210];
-ccx q[16],q[209],q[17];
-cx q[17],q[16];
-cx q[16],q[209];
-ccx q[388],q[208],q[16];
-cx q[16],q[388];
-cx q[388],q[208];
-cx q[20],q[212];
-cx q[20],q[389];
-ccx q[389],q[212],q[20];
-cx q[21],q[213];
-cx q[21],q[20];
-ccx q[20],q[213],q[21];
-cx q[22],q[214];
-cx q[22],q[21];
-ccx q[21],q[214],q[22];
-cx q[23],q[215];
-cx q[23],q[22];
-ccx q[22],q[215],q[23];
-cx q[23],q[390];
-ccx q[22],q[215],q[23];
-cx q[23],q[22];
-cx q[22],q[215];
-ccx q[21],q[214],q[22];
-cx q[22],q[21];
-cx q[21],q[214];
-ccx q[20],q[213],q[21];
-cx q[21],q[20];
-cx q[20],q[213];
-ccx q[389],q[212],q[20];
-cx q[20],q[389];
-cx q[389],q[212];
-cx q[24],q[216];
-cx q[24],q[390];
-ccx q[390],q[216],q[24];
-cx q[25],q[217];
-cx q[25],q[24];
-ccx q[24],q[217],q[25];
-cx q[26],q[218];
-cx q[26],q[25];
-ccx q[25],q[218],q[26];
-cx q[27],q[219];
-cx q[27],q[26];
-ccx q[26],q[219],q[27];
-cx q[27],q[391];
-ccx q[26],q[219],q[27];
-cx q[27],q[26];
-cx q[26],q[219];
-ccx q[25],q[218],q[26];
-cx q[26],q[25];
-cx q[25],q[218];
-ccx q[24],q[217],q[25];
-cx q[25],q[24];
-cx q[24],q[217];
-ccx q[390],q[216],q[24];
-cx q[24],q[390];
-cx q[390],q[216];
-cx q[28],q[220];
-cx q[28],q[391];
-ccx q[391],q[220],q[28];
-cx q[29],q[221];
-cx q[29],q[28];
-ccx q[28],q[221],q[29];
-cx q[30],q[222];
-cx q[30],q[29];
-ccx q[29],q[222],q[30];
-cx q[31],q[223];
-cx q[31],q[30];
-ccx q[30],q[223],q[31];
-cx q[31],q[392];
-ccx q[30],q[223],q[31];
-cx q[31],q[30];
-cx q[30],q[223];
-ccx q[29],q[222],q[30];
-cx q[30],q[29];
-cx q[29],q[222];
-ccx q[28],q[221],q[29];
-cx q[29],q[28];
-cx q[28],q[221];
-ccx q[391],q[220],q[28];
-cx q[28],q[391];
-cx q[391],q[220];
-cx q[32],q[224];
-cx q[32],q[392];
-ccx q[392],q[224],q[32];
-cx q[33],q[225];
-cx q[33],q[32];
-ccx q[32],q[225],q[33];
-cx q[34],q[226];
-cx q[34],q[33];
-ccx q[33],q[226],q[34];
-cx q[35],q[227];
-cx q[35],q[34];
-ccx q[34],q[227],q[35];
-cx q[35],q[393];
-ccx q[34],q[227],q[35];
-cx q[35],q[34];
-cx q[34],q[227];
-ccx q[33],q[226],q[34];
-cx q[34],q[33];
-cx q[33],q[226];
-ccx q[32],q[225],q[33];
-cx q[33],q[32];
-cx q[32],q[225];
-ccx q[392],q[224],q[32];
-cx q[32],q[392];
-cx q[392],q[224];
-cx q[36],q[228];
-cx q[36],q[393];
-ccx q[393],q[228],q[36];
-cx q[37],q[229];
-cx q[37],q[36];
-ccx q[36],q[229],q[37];
-cx q[38],q[230];
-cx q[38],q[37];
-ccx q[37],q[230],q[38];
-cx q[39],q[231];
-cx q[39],q[38];
-ccx q[38],q[231],q[39];
-cx q[39],q[394];
-ccx q[38],q[231],q[39];
-cx q[39],q[38];
-cx q[38],q[231];
-ccx q[37],q[230],q[38];
-cx q[38],q[37];
-cx q[37],q[230];
-ccx q[36],q[229],q[37];
-cx q[37],q[36];
-cx q[36],q[229];
-ccx q[393],q[228],q[36];
-cx q[36],q[393];
-cx q[393],q[228];
-cx q[40],q[232];
-cx q[40],q[394];
-ccx q[394],q[232],q[40];
-cx q[41],q[233];
-cx q[41],q[40];
-ccx q[40],q[233],q[41];
-cx q[42],q[234];
-cx q[42],q[41];
-ccx q[41],q[234],q[42];
-cx q[43],q[235];
-cx q[43],q[42];
-ccx q[42],q[235],q[43];
-cx q[43],q[395];
-ccx q[42],q[235],q[43];
-cx q[43],q[42];
-cx q[42],q[235];
-ccx q[41],q[234],q[42];
-cx q[42],q[41];
-cx q[41],q[234];
-ccx q[40],q[233],q[41];
-cx q[41],q[40];
-cx q[40],q[233];
-ccx q[394],q[232],q[40];
-cx q[40],q[394];
-cx q[394],q[232];
-cx q[44],q[236];
-cx q[44],q[395];
-ccx q[395],q[236],q[44];
-cx q[45],q[237];
-cx q[45],q[44];
-ccx q[44],q[237],q[45];
-cx q[46],q[238];
-cx q[46],q[45];
-ccx q[45],q[238],q[46];
-cx q[47],q[239];
-cx q[47],q[46];
-ccx q[46],q[239],q[47];
-cx q[47],q[396];
-ccx q[46],q[239],q[47];
-cx q[47],q[46];
-cx q[46],q[239];
-ccx q[45],q[238],q[46];
-cx q[46],q[45];
-cx q[45],q[238];
-ccx q[44],q[237],q[45];
-cx q[45],q[44];
-cx q[44],q[237];
-ccx q[395],q[236],q[44];
-cx q[44],q[395];
-cx q[395],q[236];
-cx q[48],q[240];
-cx q[48],q[396];
-ccx q[396],q[240],q[48];
-cx q[49],q[241];
-cx q[49],q[48];
-ccx q[48],q[241],q[49];
-cx q[50],q[242];
-cx q[50],q[49];
-ccx q[49],q[242],q[50];
-cx q[51],q[243];
-cx q[51],q[50];
-ccx q[50],q[243],q[51];
-cx q[51],q[397];
-ccx q[50],q[243],q[51];
-cx q[51],q[50];
-cx q[50],q[243];
-ccx q[49],q[242],q[50];
-cx q[50],q[49];
-cx q[49],q[242];
-ccx q[48],q[241],q[49];
-cx q[49],q[48];
-cx q[48],q[241];
-ccx q[396],q[240],q[48];
-cx q[48],q[396];
-cx q[396],q[240];
-cx q[52],q[244];
-cx q[52],q[397];
-ccx q[397],q[244],q[52];
-cx q[53],q[245];
-cx q[53],q[52];
-ccx q[52],q[245],q[53];
-cx q[54],q[246];
-cx q[54],q[53];
-ccx q[53],q[246],q[54];
-cx q[55],q[247];
-cx q[55],q[54];
-ccx q[54],q[247],q[55];
-cx q[55],q[398];
-ccx q[54],q[247],q[55];
-cx q[55],q[54];
-cx q[54],q[247];
-ccx q[53],q[246],q[54];
-cx q[54],q[53];
-cx q[53],q[246];
-ccx q[52],q[245],q[53];
-cx q[53],q[52];
-cx q[52],q[245];
-ccx q[397],q[244],q[52];
-cx q[52],q[397];
-cx q[397],q[244];
-cx q[56],q[248];
-cx q[56],q[398];
-ccx q[398],q[248],q[56];
-cx q[57],q[249];
-cx q[57],q[56];
-ccx q[56],q[249],q[57];
-cx q[58],q[250];
-cx q[58],q[57];
-ccx q[57],q[250],q[58];
-cx q[59],q[251];
-cx q[59],q[58];
-ccx q[58],q[251],q[59];
-cx q[59],q[399];
-ccx q[58],q[251],q[59];
-cx q[59],q[58];
-cx q[58],q[251];
-ccx q[57],q[250],q[58];
-cx q[58],q[57];
-cx q[57],q[250];
-ccx q[56],q[249],q[57];
-cx q[57],q[56];
-cx q[56],q[249];
-ccx q[398],q[248],q[56];
-cx q[56],q[398];
-cx q[398],q[248];
-cx q[60],q[252];
-cx q[60],q[399];
-ccx q[399],q[252],q[60];
-cx q[61],q[253];
-cx q[61],q[60];
-ccx q[60],q[253],q[61];
-cx q[62],q[254];
-cx q[62],q[61];
-ccx q[61],q[254],q[62];
-cx q[63],q[255];
-cx q[63],q[62];
-ccx q[62],q[255],q[63];
-cx q[63],q[400];
-ccx q[62],q[255],q[63];
-cx q[63],q[62];
-cx q[62],q[255];
-ccx q[61],q[254],q[62];
-cx q[62],q[61];
-cx q[61],q[254];
-ccx q[60],q[253],q[61];
-cx q[61],q[60];
-cx q[60],q[253];
-ccx q[399],q[252],q[60];
-cx q[60],q[399];
-cx q[399],q[252];
-cx q[64],q[256];
-cx q[64],q[400];
-ccx q[400],q[256],q[64];
-cx q[65],q[257];
-cx q[65],q[64];
-ccx q[64],q[257],q[65];
-cx q[66],q[258];
-cx q[66],q[65];
-ccx q[65],q[258],q[66];
-cx q[67],q[259];
-cx q[67],q[66];
-ccx q[66],q[259],q[67];
-cx q[67],q[401];
-ccx q[66],q[259],q[67];
-cx q[67],q[66];
-cx q[66],q[259];
-ccx q[65],q[258],q[66];
-cx q[66],q[65];
-cx q[65],q[258];
-ccx q[64],q[257],q[65];
-cx q[65],q[64];
-cx q[64],q[257];
-ccx q[400],q[256],q[64];
-cx q[64],q[400];
-cx q[400],q[256];
-cx q[68],q[260];
-cx q[68],q[401];
-ccx q[401],q[260],q[68];
-cx q[69],q[261];
-cx q[69],q[68];
-ccx q[68],q[261],q[69];
-cx q[70],q[262];
-cx q[70],q[69];
-ccx q[69],q[262],q[70];
-cx q[71],q[263];
-cx q[71],q[70];
-ccx q[70],q[263],q[71];
-cx q[71],q[402];
-ccx q[70],q[263],q[71];
-cx q[71],q[70];
-cx q[70],q[263];
-ccx q[69],q[262],q[70];
-cx q[70],q[69];
-cx q[69],q[262];
-ccx q[68],q[261],q[69];
-cx q[69],q[68];
-cx q[68],q[261];
-ccx q[401],q[260],q[68];
-cx q[68],q[401];
-cx q[401],q[260];
-cx q[72],q[264];
-cx q[72],q[402];
-ccx q[402],q[264],q[72];
-cx q[73],q[265];
-cx q[73],q[72];
-ccx q[72],q[265],q[73];
-cx q[74],q[266];
-cx q[74],q[73];
-ccx q[73],q[266],q[74];
-cx q[75],q[267];
-cx q[75],q[74];
-ccx q[74],q[267],q[75];
-cx q[75],q[403];
-ccx q[74],q[267],q[75];
-cx q[75],q[74];
-cx q[74],q[267];
-ccx q[73],q[266],q[74];
-cx q[74],q[73];
-cx q[73],q[266];
-ccx q[72],q[265],q[73];
-cx q[73],q[72];
-cx q[72],q[265];
-ccx q[402],q[264],q[72];
-cx q[72],q[402];
-cx q[402],q[264];
-cx q[76],q[268];
-cx q[76],q[403];
-ccx q[403],q[268],q[76];
-cx q[77],q[269];
-cx q[77],q[76];
-ccx q[76],q[269],q[77];
-cx q[78],q[270];
-cx q[78],q[77];
-ccx q[77],q[270],q[78];
-cx q[79],q[271];
-cx q[79],q[78];
-ccx q[78],q[271],q[79];
-cx q[79],q[404];
-ccx q[78],q[271],q[79];
-cx q[79],q[78];
-cx q[78],q[271];
-ccx q[77],q[270],q[78];
-cx q[78],q[77];
-cx q[77],q[270];
-ccx q[76],q[269],q[77];
-cx q[77],q[76];
-cx q[76],q[269];
-ccx q[403],q[268],q[76];
-cx q[76],q[403];
-cx q[403],q[268];
-cx q[80],q[272];
-cx q[80],q[404];
-ccx q[404],q[272],q[80];
-cx q[81],q[273];
-cx q[81],q[80];
-ccx q[80],q[273],q[81];
-cx q[82],q[274];
-cx q[82],q[81];
-ccx q[81],q[274],q[82];
-cx q[83],q[275];
-cx q[83],q[82];
-ccx q[82],q[275],q[83];
-cx q[83],q[405];
-ccx q[82],q[275],q[83];
-cx q[83],q[82];
-cx q[82],q[275];
-ccx q[81],q[274],q[82];
-cx q[82],q[81];
-cx q[81],q[274];
-ccx q[80],q[273],q[81];
-cx q[81],q[80];
-cx q[80],q[273];
-ccx q[404],q[272],q[80];
-cx q[80],q[404];
-cx q[404],q[272];
-cx q[84],q[276];
-cx q[84],q[405];
-ccx q[405],q[276],q[84];
-cx q[85],q[277];
-cx q[85],q[84];
-ccx q[84],q[277],q[85];
-cx q[86],q[278];
-cx q[86],q[85];
-ccx q[85],q[278],q[86];
-cx q[87],q[279];
-cx q[87],q[86];
-ccx q[86],q[279],q[87];
-cx q[87],q[406];
-ccx q[86],q[279],q[87];
-cx q[87],q[86];
-cx q[86],q[279];
-ccx q[85],q[278],q[86];
-cx q[86],q[85];
-cx q[85],q[278];
-ccx q[84],q[277],q[85];
-cx q[85],q[84];
-cx q[84],q[277];
-ccx q[405],q[276],q[84];
-cx q[84],q[405];
-cx q[405],q[276];
-cx q[88],q[280];
-cx q[88],q[406];
-ccx q[406],q[280],q[88];
-cx q[89],q[281];
-cx q[89],q[88];
-ccx q[88],q[281],q[89];
-cx q[90],q[282];
-cx q[90],q[89];
-ccx q[89],q[282],q[90];
-cx q[91],q[283];
-cx q[91],q[90];
-ccx q[90],q[283],q[91];
-cx q[91],q[407];
-ccx q[90],q[283],q[91];
-cx q[91],q[90];
-cx q[90],q[283];
-ccx q[89],q[282],q[90];
-cx q[90],q[89];
-cx q[89],q[282];
-ccx q[88],q[281],q[89];
-cx q[89],q[88];
-cx q[88],q[281];
-ccx q[406],q[280],q[88];
-cx q[88],q[406];
-cx q[406],q[280];
-cx q[92],q[284];
-cx q[92],q[407];
-ccx q[407],q[284],q[92];
-cx q[93],q[285];
-cx q[93],q[92];
-ccx q[92],q[285],q[93];
-cx q[94],q[286];
-cx q[94],q[93];
-ccx q[93],q[286],q[94];
-cx q[95],q[287];
-cx q[95],q[94];
-ccx q[94],q[287],q[95];
-cx q[95],q[408];
-ccx q[94],q[287],q[95];
-cx q[95],q[94];
-cx q[94],q[287];
-ccx q[93],q[286],q[94];
-cx q[94],q[93];
-cx q[93],q[286];
-ccx q[92],q[285],q[93];
-cx q[93],q[92];
-cx q[92],q[285];
-ccx q[407],q[284],q[92];
-cx q[92],q[407];
-cx q[407],q[284];
-cx q[96],q[288];
-cx q[96],q[408];
-ccx q[408],q[288],q[96];
-cx q[97],q[289];
-cx q[97],q[96];
-ccx q[96],q[289],q[97];
-cx q[98],q[290];
-cx q[98],q[97];
-ccx q[97],q[290],q[98];
-cx q[99],q[291];
-cx q[99],q[98];
-ccx q[98],q[291],q[99];
-cx q[99],q[409];
-ccx q[98],q[291],q[99];
-cx q[99],q[98];
-cx q[98],q[291];
-ccx q[97],q[290],q[98];
-cx q[98],q[97];
-cx q[97],q[290];
-ccx q[96],q[289],q[97];
-cx q[97],q[96];
-cx q[96],q[289];
-ccx q[408],q[288],q[96];
-cx q[96],q[408];
-cx q[408],q[288];
-cx q[100],q[292];
-cx q[100],q[409];
-ccx q[409],q[292],q[100];
-cx q[101],q[293];
-cx q[101],q[100];
-ccx q[100],q[293],q[101];
-cx q[102],q[294];
-cx q[102],q[101];
-ccx q[101],q[294],q[102];
-cx q[103],q[295];
-cx q[103],q[102];
-ccx q[102],q[295],q[103];
-cx q[103],q[410];
-ccx q[102],q[295],q[103];
-cx q[103],q[102];
-cx q[102],q[295];
-ccx q[101],q[294],q[102];
-cx q[102],q[101];
-cx q[101],q[294];
-ccx q[100],q[293],q[101];
-cx q[101],q[100];
-cx q[100],q[293];
-ccx q[409],q[292],q[100];
-cx q[100],q[409];
-cx q[409],q[292];
-cx q[104],q[296];
-cx q[104],q[410];
-ccx q[410],q[296],q[104];
-cx q[105],q[297];
-cx q[105],q[104];
-ccx q[104],q[297],q[105];
-cx q[106],q[298];
-cx q[106],q[105];
-ccx q[105],q[298],q[106];
-cx q[107],q[299];
-cx q[107],q[106];
-ccx q[106],q[299],q[107];
-cx q[107],q[411];
-ccx q[106],q[299],q[107];
-cx q[107],q[106];
-cx q[106],q[299];
-ccx q[105],q[298],q[106];
-cx q[106],q[105];
-cx q[105],q[298];
-ccx q[104],q[297],q[105];
-cx q[105],q[104];
-cx q[104],q[297];
-ccx q[410],q[296],q[104];
-cx q[104],q[410];
-cx q[410],q[296];
-cx q[108],q[300];
-cx q[108],q[411];
-ccx q[411],q[300],q[108];
-cx q[109],q[301];
-cx q[109],q[108];
-ccx q[108],q[301],q[109];
-cx q[110],q[302];
-cx q[110],q[109];
-ccx q[109],q[302],q[110];
-cx q[111],q[303];
-cx q[111],q[110];
-ccx q[110],q[303],q[111];
-cx q[111],q[412];
-ccx q[110],q[303],q[111];
-cx q[111],q[110];
-cx q[110],q[303];
-ccx q[109],q[302],q[110];
-cx q[110],q[109];
-cx q[109],q[302];
-ccx q[108],q[301],q[109];
-cx q[109],q[108];
-cx q[108],q[301];
-ccx q[411],q[300],q[108];
-cx q[108],q[411];
-cx q[411],q[300];
-cx q[112],q[304];
-cx q[112],q[412];
-ccx q[412],q[304],q[112];
-cx q[113],q[305];
-cx q[113],q[112];
-ccx q[112],q[305],q[113];
-cx q[114],q[306];
-cx q[114],q[113];
-ccx q[113],q[306],q[114];
-cx q[115],q[307];
-cx q[115],q[114];
-ccx q[114],q[307],q[115];
-cx q[115],q[413];
-ccx q[114],q[307],q[115];
-cx q[115],q[114];
-cx q[114],q[307];
-ccx q[113],q[306],q[114];
-cx q[114],q[113];
-cx q[113],q[306];
-ccx q[112],q[305],q[113];
-cx q[113],q[112];
-cx q[112],q[305];
-ccx q[412],q[304],q[112];
-cx q[112],q[412];
-cx q[412],q[304];
-cx q[116],q[308];
-cx q[116],q[413];
-ccx q[413],q[308],q[116];
-cx q[117],q[309];
-cx q[117],q[116];
-ccx q[116],q[309],q[117];
-cx q[118],q[310];
-cx q[118],q[117];
-ccx q[117],q[310],q[118];
-cx q[119],q[311];
-cx q[119],q[118];
-ccx q[118],q[311],q[119];
-cx q[119],q[414];
-ccx q[118],q[311],q[119];
-cx q[119],q[118];
-cx q[118],q[311];
-ccx q[117],q[310],q[118];
-cx q[118],q[117];
-cx q[117],q[310];
-ccx q[116],q[309],q[117];
-cx q[117],q[116];
-cx q[116],q[309];
-ccx q[413],q[308],q[116];
-cx q[116],q[413];
-cx q[413],q[308];
-cx q[120],q[312];
-cx q[120],q[414];
-ccx q[414],q[312],q[120];
-cx q[121],q[313];
-cx q[121],q[120];
-ccx q[120],q[313],q[121];
-cx q[122],q[314];
-cx q[122],q[121];
-ccx q[121],q[314],q[122];
-cx q[123],q[315];
-cx q[123],q[122];
-ccx q[122],q[315],q[123];
-cx q[123],q[415];
-ccx q[122],q[315],q[123];
-cx q[123],q[122];
-cx q[122],q[315];
-ccx q[121],q[314],q[122];
-cx q[122],q[121];
-cx q[121],q[314];
-ccx q[120],q[313],q[121];
-cx q[121],q[120];
-cx q[120],q[313];
-ccx q[414],q[312],q[120];
-cx q[120],q[414];
-cx q[414],q[312];
-cx q[124],q[316];
-cx q[124],q[415];
-ccx q[415],q[316],q[124];
-cx q[125],q[317];
-cx q[125],q[124];
-ccx q[124],q[317],q[125];
-cx q[126],q[318];
-cx q[126],q[125];
-ccx q[125],q[318],q[126];
-cx q[127],q[319];
-cx q[127],q[126];
-ccx q[126],q[319],q[127];
-cx q[127],q[416];
-ccx q[126],q[319],q[127];
-cx q[127],q[126];
-cx q[126],q[319];
-ccx q[125],q[318],q[126];
-cx q[126],q[125];
-cx q[125],q[318];
-ccx q[124],q[317],q[125];
-cx q[125],q[124];
-cx q[124],q[317];
-ccx q[415],q[316],q[124];
-cx q[124],q[415];
-cx q[415],q[316];
-cx q[128],q[320];
-cx q[128],q[416];
-ccx q[416],q[320],q[128];
-cx q[129],q[321];
-cx q[129],q[128];
-ccx q[128],q[321],q[129];
-cx q[130],q[322];
-cx q[130],q[129];
-ccx q[129],q[322],q[130];
-cx q[131],q[323];
-cx q[131],q[130];
-ccx q[130],q[323],q[131];
-cx q[131],q[417];
-ccx q[130],q[323],q[131];
-cx q[131],q[130];
-cx q[130],q[323];
-ccx q[129],q[322],q[130];
-cx q[130],q[129];
-cx q[129],q[322];
-ccx q[128],q[321],q[129];
-cx q[129],q[128];
-cx q[128],q[321];
-ccx q[416],q[320],q[128];
-cx q[128],q[416];
-cx q[416],q[320];
-cx q[132],q[324];
-cx q[132],q[417];
-ccx q[417],q[324],q[132];
-cx q[133],q[325];
-cx q[133],q[132];
-ccx q[132],q[325],q[133];
-cx q[134],q[326];
-cx q[134],q[133];
-ccx q[133],q[326],q[134];
-cx q[135],q[327];
-cx q[135],q[134];
-ccx q[134],q[327],q[135];
-cx q[135],q[418];
-ccx q[134],q[327],q[135];
-cx q[135],q[134];
-cx q[134],q[327];
-ccx q[133],q[326],q[134];
-cx q[134],q[133];
-cx q[133],q[326];
-ccx q[132],q[325],q[133];
-cx q[133],q[132];
-cx q[132],q[325];
-ccx q[417],q[324],q[132];
-cx q[132],q[417];
-cx q[417],q[324];
-cx q[136],q[328];
-cx q[136],q[418];
-ccx q[418],q[328],q[136];
-cx q[137],q[329];
-cx q[137],q[136];
-ccx q[136],q[329],q[137];
-cx q[138],q[330];
-cx q[138],q[137];
-ccx q[137],q[330],q[138];
-cx q[139],q[331];
-cx q[139],q[138];
-ccx q[138],q[331],q[139];
-cx q[139],q[419];
-ccx q[138],q[331],q[139];
-cx q[139],q[138];
-cx q[138],q[331];
-ccx q[137],q[330],q[138];
-cx q[138],q[137];
-cx q[137],q[330];
-ccx q[136],q[329],q[137];
-cx q[137],q[136];
-cx q[136],q[329];
-ccx q[418],q[328],q[136];
-cx q[136],q[418];
-cx q[418],q[328];
-cx q[140],q[332];
-cx q[140],q[419];
-ccx q[419],q[332],q[140];
-cx q[141],q[333];
-cx q[141],q[140];
-ccx q[140],q[333],q[141];
-cx q[142],q[334];
-cx q[142],q[141];
-ccx q[141],q[334],q[142];
-cx q[143],q[335];
-cx q[143],q[142];
-ccx q[142],q[335],q[143];
-cx q[143],q[420];
-ccx q[142],q[335],q[143];
-cx q[143],q[142];
-cx q[142],q[335];
-ccx q[141],q[334],q[142];
-cx q[142],q[141];
-cx q[141],q[334];
-ccx q[140],q[333],q[141];
-cx q[141],q[140];
-cx q[140],q[333];
-ccx q[419],q[332],q[140];
-cx q[140],q[419];
-cx q[419],q[332];
-cx q[144],q[336];
-cx q[144],q[420];
-ccx q[420],q[336],q[144];
-cx q[145],q[337];
-cx q[145],q[144];
-ccx q[144],q[337],q[145];
-cx q[146],q[338];
-cx q[146],q[145];
-ccx q[145],q[338],q[146];
-cx q[147],q[339];
-cx q[147],q[146];
-ccx q[146],q[339],q[147];
-cx q[147],q[421];
-ccx q[146],q[339],q[147];
-cx q[147],q[146];
-cx q[146],q[339];
-ccx q[145],q[338],q[146];
-cx q[146],q[145];
-cx q[145],q[338];
-ccx q[144],q[337],q[145];
-cx q[145],q[144];
-cx q[144],q[337];
-ccx q[420],q[336],q[144];
-cx q[144],q[420];
-cx q[420],q[336];
-cx q[148],q[340];
-cx q[148],q[421];
-ccx q[421],q[340],q[148];
-cx q[149],q[341];
-cx q[149],q[148];
-ccx q[148],q[341],q[149];
-cx q[150],q[342];
-cx q[150],q[149];
-ccx q[149],q[342],q[150];
-cx q[151],q[343];
-cx q[151],q[150];
-ccx q[150],q[343],q[151];
-cx q[151],q[422];
-ccx q[150],q[343],q[151];
-cx q[151],q[150];
-cx q[150],q[343];
-ccx q[149],q[342],q[150];
-cx q[150],q[149];
-cx q[149],q[342];
-ccx q[148],q[341],q[149];
-cx q[149],q[148];
-cx q[148],q[341];
-ccx q[421],q[340],q[148];
-cx q[148],q[421];
-cx q[421],q[340];
-cx q[152],q[344];
-cx q[152],q[422];
-ccx q[422],q[344],q[152];
-cx q[153],q[345];
-cx q[153],q[152];
-ccx q[152],q[345],q[153];
-cx q[154],q[346];
-cx q[154],q[153];
-ccx q[153],q[346],q[154];
-cx q[155],q[347];
-cx q[155],q[154];
-ccx q[154],q[347],q[155];
-cx q[155],q[423];
-ccx q[154],q[347],q[155];
-cx q[155],q[154];
-cx q[154],q[347];
-ccx q[153],q[346],q[154];
-cx q[154],q[153];
-cx q[153],q[346];
-ccx q[152],q[345],q[153];
-cx q[153],q[152];
-cx q[152],q[345];
-ccx q[422],q[344],q[152];
-cx q[152],q[422];
-cx q[422],q[344];
-cx q[156],q[348];
-cx q[156],q[423];
-ccx q[423],q[348],q[156];
-cx q[157],q[349];
-cx q[157],q[156];
-ccx q[156],q[349],q[157];
-cx q[158],q[350];
-cx q[158],q[157];
-ccx q[157],q[350],q[158];
-cx q[159],q[351];
-cx q[159],q[158];
-ccx q[158],q[351],q[159];
-cx q[159],q[424];
-ccx q[158],q[351],q[159];
-cx q[159],q[158];
-cx q[158],q[351];
-ccx q[157],q[350],q[158];
-cx q[158],q[157];
-cx q[157],q[350];
-ccx q[156],q[349],q[157];
-cx q[157],q[156];
-cx q[156],q[349];
-ccx q[423],q[348],q[156];
-cx q[156],q[423];
-cx q[423],q[348];
-cx q[160],q[352];
-cx q[160],q[424];
-ccx q[424],q[352],q[160];
-cx q[161],q[353];
-cx q[161],q[160];
-ccx q[160],q[353],q[161];
-cx q[162],q[354];
-cx q[162],q[161];
-ccx q[161],q[354],q[162];
-cx q[163],q[355];
-cx q[163],q[162];
-ccx q[162],q[355],q[163];
-cx q[163],q[425];
-ccx q[162],q[355],q[163];
-cx q[163],q[162];
-cx q[162],q[355];
-ccx q[161],q[354],q[162];
-cx q[162],q[161];
-cx q[161],q[354];
-ccx q[160],q[353],q[161];
-cx q[161],q[160];
-cx q[160],q[353];
-ccx q[424],q[352],q[160];
-cx q[160],q[424];
-cx q[424],q[352];
-cx q[164],q[356];
-cx q[164],q[425];
-ccx q[425],q[356],q[164];
-cx q[165],q[357];
-cx q[165],q[164];
-ccx q[164],q[357],q[165];
-cx q[166],q[358];
-cx q[166],q[165];
-ccx q[165],q[358],q[166];
-cx q[167],q[359];
-cx q[167],q[166];
-ccx q[166],q[359],q[167];
-cx q[167],q[426];
-ccx q[166],q[359],q[167];
-cx q[167],q[166];
-cx q[166],q[359];
-ccx q[165],q[358],q[166];
-cx q[166],q[165];
-cx q[165],q[358];
-ccx q[164],q[357],q[165];
-cx q[165],q[164];
-cx q[164],q[357];
-ccx q[425],q[356],q[164];
-cx q[164],q[425];
-cx q[425],q[356];
-cx q[168],q[360];
-cx q[168],q[426];
-ccx q[426],q[360],q[168];
-cx q[169],q[361];
-cx q[169],q[168];
-ccx q[168],q[361],q[169];
-cx q[170],q[362];
-cx q[170],q[169];
-ccx q[169],q[362],q[170];
-cx q[171],q[363];
-cx q[171],q[170];
-ccx q[170],q[363],q[171];
-cx q[171],q[427];
-ccx q[170],q[363],q[171];
-cx q[171],q[170];
-cx q[170],q[363];
-ccx q[169],q[362],q[170];
-cx q[170],q[169];
-cx q[169],q[362];
-ccx q[168],q[361],q[169];
-cx q[169],q[168];
-cx q[168],q[361];
-ccx q[426],q[360],q[168];
-cx q[168],q[426];
-cx q[426],q[360];
-cx q[172],q[364];
-cx q[172],q[427];
-ccx q[427],q[364],q[172];
-cx q[173],q[365];
-cx q[173],q[172];
-ccx q[172],q[365],q[173];
-cx q[174],q[366];
-cx q[174],q[173];
-ccx q[173],q[366],q[174];
-cx q[175],q[367];
-cx q[175],q[174];
-ccx q[174],q[367],q[175];
-cx q[175],q[428];
-ccx q[174],q[367],q[175];
-cx q[175],q[174];
-cx q[174],q[367];
-ccx q[173],q[366],q[174];
-cx q[174],q[173];
-cx q[173],q[366];
-ccx q[172],q[365],q[173];
-cx q[173],q[172];
-cx q[172],q[365];
-ccx q[427],q[364],q[172];
-cx q[172],q[427];
-cx q[427],q[364];
-cx q[176],q[368];
-cx q[176],q[428];
-ccx q[428],q[368],q[176];
-cx q[177],q[369];
-cx q[177],q[176];
-ccx q[176],q[369],q[177];
-cx q[178],q[370];
-cx q[178],q[177];
-ccx q[177],q[370],q[178];
-cx q[179],q[371];
-cx q[179],q[178];
-ccx q[178],q[371],q[179];
-cx q[179],q[429];
-ccx q[178],q[371],q[179];
-cx q[179],q[178];
-cx q[178],q[371];
-ccx q[177],q[370],q[178];
-cx q[178],q[177];
-cx q[177],q[370];
-ccx q[176],q[369],q[177];
-cx q[177],q[176];
-cx q[176],q[369];
-ccx q[428],q[368],q[176];
-cx q[176],q[428];
-cx q[428],q[368];
-cx q[180],q[372];
-cx q[180],q[429];
-ccx q[429],q[372],q[180];
-cx q[181],q[373];
-cx q[181],q[180];
-ccx q[180],q[373],q[181];
-cx q[182],q[374];
-cx q[182],q[181];
-ccx q[181],q[374],q[182];
-cx q[183],q[375];
-cx q[183],q[182];
-ccx q[182],q[375],q[183];
-cx q[183],q[430];
-ccx q[182],q[375],q[183];
-cx q[183],q[182];
-cx q[182],q[375];
-ccx q[181],q[374],q[182];
-cx q[182],q[181];
-cx q[181],q[374];
-ccx q[180],q[373],q[181];
-cx q[181],q[180];
-cx q[180],q[373];
-ccx q[429],q[372],q[180];
-cx q[180],q[429];
-cx q[429],q[372];
-cx q[184],q[376];
-cx q[184],q[430];
-ccx q[430],q[376],q[184];
-cx q[185],q[377];
-cx q[185],q[184];
-ccx q[184],q[377],q[185];
-cx q[186],q[378];
-cx q[186],q[185];
-ccx q[185],q[378],q[186];
-cx q[187],q[379];
-cx q[187],q[186];
-ccx q[186],q[379],q[187];
-cx q[187],q[431];
-ccx q[186],q[379],q[187];
-cx q[187],q[186];
-cx q[186],q[379];
-ccx q[185],q[378],q[186];
-cx q[186],q[185];
-cx q[185],q[378];
-ccx q[184],q[377],q[185];
-cx q[185],q[184];
-cx q[184],q[377];
-ccx q[430],q[376],q[184];
-cx q[184],q[430];
-cx q[430],q[376];
-cx q[188],q[380];
-cx q[188],q[431];
-ccx q[431],q[380],q[188];
-cx q[189],q[381];
-cx q[189],q[188];
-ccx q[188],q[381],q[189];
-cx q[190],q[382];
-cx q[190],q[189];
-ccx q[189],q[382],q[190];
-cx q[191],q[383];
-cx q[191],q[190];
-ccx q[190],q[383],q[191];
-cx q[191],q[432];
-ccx q[190],q[383],q[191];
-cx q[191],q[190];
-cx q[190],q[383];
-ccx q[189],q[382],q[190];
-cx q[190],q[189];
-cx q[189],q[382];
-ccx q[188],q[381],q[189];
-cx q[189],q[188];
-cx q[188],q[381];
-ccx q[431],q[380],q[188];
-cx q[188],q[431];
-cx q[431],q[380];
-barrier q[0],q[1],q[2],q[3],q[4],q[5],q[6],q[7],q[8],q[9],q[10],q[11],q[12],q[13],q[14],q[15],q[16],q[17],q[18],q[19],q[20],q[21],q[22],q[23],q[24],q[25],q[26],q[27],q[28],q[29],q[30],q[31],q[32],q[33],q[34],q[35],q[36],q[37],q[38],q[39],q[40],q[41],q[42],q[43],q[44],q[45],q[46],q[47],q[48],q[49],q[50],q[51],q[52],q[53],q[54],q[55],q[56],q[57],q[58],q[59],q[60],q[61],q[62],q[63],q[64],q[65],q[66],q[67],q[68],q[69],q[70],q[71],q[72],q[73],q[74],q[75],q[76],q[77],q[78],q[79],q[80],q[81],q[82],q[83],q[84],q[85],q[86],q[87],q[88],q[89],q[90],q[91],q[92],q[93],q[94],q[95],q[96],q[97],q[98],q[99],q[100],q[101],q[102],q[103],q[104],q[105],q[106],q[107],q[108],q[109],q[110],q[111],q[112],q[113],q[114],q[115],q[116],q[117],q[118],q[119],q[120],q[121],q[122],q[123],q[124],q[125],q[126],q[127],q[128],q[129],q[130],q[131],q[132],q[133],q[134],q[135],q[136],q[137],q[138],q[139],q[140],q[141],q[142],q[143],q[144],q[145],q[146],q[147],q[148],q[149],q[150],q[151],q[152],q[153],q[154],q[155],q[156],q[157],q[158],q[159],q[160],q[161],q[162],q[163],q[164],q[165],q[166],q[167],q[168],q[169],q[170],q[171],q[172],q[173],q[174],q[175],q[176],q[177],q[178],q[179],q[180],q[181],q[182],q[183],q[184],q[185],q[186],q[187],q[188],q[189],q[190],q[191],q[192],q[193],q[194],q[195],q[196],q[197],q[198],q[199],q[200],q[201],q[202],q[203],q[204],q[205],q[206],q[207],q[208],q[209],q[210],q[211],q[212],q[213],q[214],q[215],q[216],q[217],q[218],q[219],q[220],q[221],q[222],q[223],q[224],q[225],q[226],q[227],q[228],q[229],q[230],q[231],q[232],q[233],q[234],q[235],q[236],q[237],q[238],q[239],q[240],q[241],q[242],q[243],q[244],q[245],q[246],q[247],q[248],q[249],q[250],q[251],q[252],q[253],q[254],q[255],q[256],q[257],q[258],q[259],q[260],q[261],q[262],q[263],q[264],q[265],q[266],q[267],q[268],q[269],q[270],q[271],q[272],q[273],q[274],q[275],q[276],q[277],q[278],q[279],q[280],q[281],q[282],q[283],q[284],q[285],q[286],q[287],q[288],q[289],q[290],q[291],q[292],q[293],q[294],q[295],q[296],q[297],q[298],q[299],q[300],q[301],q[302],q[303],q[304],q[305],q[306],q[307],q[308],q[309],q[310],q[311],q[312],q[313],q[314],q[315],q[316],q[317],q[318],q[319],q[320],q[321],q[322],q[323],q[324],q[325],q[326],q[327],q[328],q[329],q[330],q[331],q[332],q[333],q[334],q[335],q[336],q[337],q[338],q[339],q[340],q[341],q[342],q[343],q[344],q[345],q[346],q[347],q[348],q[349],q[350],q[351],q[352],q[353],q[354],q[355],q[356],q[357],q[358],q[359],q[360],q[361],q[362],q[363],q[364],q[365],q[366],q[367],q[368],q[369],q[370],q[371],q[372],q[373],q[374],q[375],q[376],q[377],q[378],q[379],q[380],q[381],q[382],q[383],q[384],q[385],q[386],q[387],q[388],q[389],q[390],q[391],q[392],q[393],q[394],q[395],q[396],q[397],q[398],q[399],q[400],q[401],q[402],q[403],q[404],q[405],q[406],q[407],q[408],q[409],q[410],q[411],q[412],q[413],q[414],q[415],q[416],q[417],q[418],q[419],q[420],q[421],q[422],q[423],q[424],q[425],q[426],q[427],q[428],q[429],q[430],q[431],q[432];
-measure q[0] -> meas[0];
-measure q[1] -> meas[1];
-measure q[2] -> meas[2];
-measure q[3] -> meas[3];
-measure q[4] -> meas[4];
-measure q[5] -> meas[5];
-measure q[6] -> meas[6];
-measure q[7] -> meas[7];
-measure q[8] -> meas[8];
-measure q[9] -> meas[9];
-measure q[10] -> meas[10];
-measure q[11] -> meas[11];
-measure q[12] -> meas[12];
-measure q[13] -> meas[13];
-measure q[14] -> meas[14];
-measure q[15] -> meas[15];
-measure q[16] -> meas[16];
-measure q[17] -> meas[17];
-measure q[18] -> meas[18];
-measure q[19] -> meas[19];
-measure q[20] -> meas[20];
-measure q[21] -> meas[21];
-measure q[22] -> meas[22];
-measure q[23] -> meas[23];
-measure q[24] -> meas[24];
-measure q[25] -> meas[25];
-measure q[26] -> meas[26];
-measure q[27] -> meas[27];
-measure q[28] -> meas[28];
-measure q[29] -> meas[29];
-measure q[30] -> meas[30];
-measure q[31] -> meas[31];
-measure q[32] -> meas[32];
-measure q[33] -> meas[33];
-measure q[34] -> meas[34];
-measure q[35] -> meas[35];
-measure q[36] -> meas[36];
-measure q[37] -> meas[37];
-measure q[38] -> meas[38];
-measure q[39] -> meas[39];
-measure q[40] -> meas[40];
-measure q[41] -> meas[41];
-measure q[42] -> meas[42];
-measure q[43] -> meas[43];
-measure q[44] -> meas[44];
-measure q[45] -> meas[45];
-measure q[46] -> meas[46];
-measure q[47] -> meas[47];
-measure q[48] -> meas[48];
-measure q[49] -> meas[49];
-measure q[50] -> meas[50];
-measure q[51] -> meas[51];
-measure q[52] -> meas[52];
-measure q[53] -> meas[53];
-measure q[54] -> meas[54];
-measure q[55] -> meas[55];
-measure q[56] -> meas[56];
-measure q[57] -> meas[57];
-measure q[58] -> meas[58];
-measure q[59] -> meas[59];
-measure q[60] -> meas[60];
-measure q[61] -> meas[61];
-measure q[62] -> meas[62];
-measure q[63] -> meas[63];
-measure q[64] -> meas[64];
-measure q[65] -> meas[65];
-measure q[66] -> meas[66];
-measure q[67] -> meas[67];
-measure q[68] -> meas[68];
-measure q[69] -> meas[69];
-measure q[70] -> meas[70];
-measure q[71] -> meas[71];
-measure q[72] -> meas[72];
-measure q[73] -> meas[73];
-measure q[74] -> meas[74];
-measure q[75] -> meas[75];
-measure q[76] -> meas[76];
-measure q[77] -> meas[77];
-measure q[78] -> meas[78];
-measure q[79] -> meas[79];
-measure q[80] -> meas[80];
-measure q[81] -> meas[81];
-measure q[82] -> meas[82];
-measure q[83] -> meas[83];
-measure q[84] -> meas[84];
-measure q[85] -> meas[85];
-measure q[86] -> meas[86];
-measure q[87] -> meas[87];
-measure q[88] -> meas[88];
-measure q[89] -> meas[89];
-measure q[90] -> meas[90];
-measure q[91] -> meas[91];
-measure q[92] -> meas[92];
-measure q[93] -> meas[93];
-measure q[94] -> meas[94];
-measure q[95] -> meas[95];
-measure q[96] -> meas[96];
-measure q[97] -> meas[97];
-measure q[98] -> meas[98];
-measure q[99] -> meas[99];
-measure q[100] -> meas[100];
-measure q[101] -> meas[101];
-measure q[102] -> meas[102];
-measure q[103] -> meas[103];
-measure q[104] -> meas[104];
-measure q[105] -> meas[105];
-measure q[106] -> meas[106];
-measure q[107] -> meas[107];
-measure q[108] -> meas[108];
-measure q[109] -> meas[109];
-measure q[110] -> meas[110];
-measure q[111] -> meas[111];
-measure q[112] -> meas[112];
-measure q[113] -> meas[113];
-measure q[114] -> meas[114];
-measure q[115] -> meas[115];
-measure q[116] -> meas[116];
-measure q[117] -> meas[117];
-measure q[118] -> meas[118];
-measure q[119] -> meas[119];
-measure q[120] -> meas[120];
-measure q[121] -> meas[121];
-measure q[122] -> meas[122];
-measure q[123] -> meas[123];
-measure q[124] -> meas[124];
-measure q[125] -> meas[125];
-measure q[126] -> meas[126];
-measure q[127] -> meas[127];
-measure q[128] -> meas[128];
-measure q[129] -> meas[129];
-measure q[130] -> meas[130];
-measure q[131] -> meas[131];
-measure q[132] -> meas[132];
-measure q[133] -> meas[133];
-measure q[134] -> meas[134];
-measure q[135] -> meas[135];
-measure q[136] -> meas[136];
-measure q[137] -> meas[137];
-measure q[138] -> meas[138];
-measure q[139] -> meas[139];
-measure q[140] -> meas[140];
-measure q[141] -> meas[141];
-measure q[142] -> meas[142];
-measure q[143] -> meas[143];
-measure q[144] -> meas[144];
-measure q[145] -> meas[145];
-measure q[146] -> meas[146];
-measure q[147] -> meas[147];
-measure q[148] -> meas[148];
-measure q[149] -> meas[149];
-measure q[150] -> meas[150];
-measure q[151] -> meas[151];
-measure q[152] -> meas[152];
-measure q[153] -> meas[153];
-measure q[154] -> meas[154];
-measure q[155] -> meas[155];
-measure q[156] -> meas[156];
-measure q[157] -> meas[157];
-measure q[158] -> meas[158];
-measure q[159] -> meas[159];
-measure q[160] -> meas[160];
-measure q[161] -> meas[161];
-measure q[162] -> meas[162];
-measure q[163] -> meas[163];
-measure q[164] -> meas[164];
-measure q[165] -> meas[165];
-measure q[166] -> meas[166];
-measure q[167] -> meas[167];
-measure q[168] -> meas[168];
-measure q[169] -> meas[169];
-measure q[170] -> meas[170];
-measure q[171] -> meas[171];
-measure q[172] -> meas[172];
-measure q[173] -> meas[173];
-measure q[174] -> meas[174];
-measure q[175] -> meas[175];
-measure q[176] -> meas[176];
-measure q[177] -> meas[177];
-measure q[178] -> meas[178];
-measure q[179] -> meas[179];
-measure q[180] -> meas[180];
-measure q[181] -> meas[181];
-measure q[182] -> meas[182];
-measure q[183] -> meas[183];
-measure q[184] -> meas[184];
-measure q[185] -> meas[185];
-measure q[186] -> meas[186];
-measure q[187] -> meas[187];
-measure q[188] -> meas[188];
-measure q[189] -> meas[189];
-measure q[190] -> meas[190];
-measure q[191] -> meas[191];
-measure q[192] -> meas[192];
-measure q[193] -> meas[193];
-measure q[194] -> meas[194];
-measure q[195] -> meas[195];
-measure q[196] -> meas[196];
-measure q[197] -> meas[197];
-measure q[198] -> meas[198];
-measure q[199] -> meas[199];
-measure q[200] -> meas[200];
-measure q[201] -> meas[201];
-measure q[202] -> meas[202];
-measure q[203] -> meas[203];
-measure q[204] -> meas[204];
-measure q[205] -> meas[205];
-measure q[206] -> meas[206];
-measure q[207] -> meas[207];
-measure q[208] -> meas[208];
-measure q[209] -> meas[209];
-measure q[210] -> meas[210];
-measure q[211] -> meas[211];
-measure q[212] -> meas[212];
-measure q[213] -> meas[213];
-measure q[214] -> meas[214];
-measure q[215] -> meas[215];
-measure q[216] -> meas[216];
-measure q[217] -> meas[217];
-measure q[218] -> meas[218];
-measure q[219] -> meas[219];
-measure q[220] -> meas[220];
-measure q[221] -> meas[221];
-measure q[222] -> meas[222];
-measure q[223] -> meas[223];
-measure q[224] -> meas[224];
-measure q[225] -> meas[225];
-measure q[226] -> meas[226];
-measure q[227] -> meas[227];
-measure q[228] -> meas[228];
-measure q[229] -> meas[229];
-measure q[230] -> meas[230];
-measure q[231] -> meas[231];
-measure q[232] -> meas[232];
-measure q[233] -> meas[233];
-measure q[234] -> meas[234];
-measure q[235] -> meas[235];
-measure q[236] -> meas[236];
-measure q[237] -> meas[237];
-measure q[238] -> meas[238];
-measure q[239] -> meas[239];
-measure q[240] -> meas[240];
-measure q[241] -> meas[241];
-measure q[242] -> meas[242];
-measure q[243] -> meas[243];
-measure q[244] -> meas[244];
-measure q[245] -> meas[245];
-measure q[246] -> meas[246];
-measure q[247] -> meas[247];
-measure q[248] -> meas[248];
-measure q[249] -> meas[249];
-measure q[250] -> meas[250];
-measure q[251] -> meas[251];
-measure q[252] -> meas[252];
-measure q[253] -> meas[253];
-measure q[254] -> meas[254];
-measure q[255] -> meas[255];
-measure q[256] -> meas[256];
-measure q[257] -> meas[257];
-measure q[258] -> meas[258];
-measure q[259] -> meas[259];
-measure q[260] -> meas[260];
-measure q[261] -> meas[261];
-measure q[262] -> meas[262];
-measure q[263] -> meas[263];
-measure q[264] -> meas[264];
-measure q[265] -> meas[265];
-measure q[266] -> meas[266];
-measure q[267] -> meas[267];
-measure q[268] -> meas[268];
-measure q[269] -> meas[269];
-measure q[270] -> meas[270];
-measure q[271] -> meas[271];
-measure q[272] -> meas[272];
-measure q[273] -> meas[273];
-measure q[274] -> meas[274];
-measure q[275] -> meas[275];
-measure q[276] -> meas[276];
-measure q[277] -> meas[277];
-measure q[278] -> meas[278];
-measure q[279] -> meas[279];
-measure q[280] -> meas[280];
-measure q[281] -> meas[281];
-measure q[282] -> meas[282];
-measure q[283] -> meas[283];
-measure q[284] -> meas[284];
-measure q[285] -> meas[285];
-measure q[286] -> meas[286];
-measure q[287] -> meas[287];
-measure q[288] -> meas[288];
-measure q[289] -> meas[289];
-measure q[290] -> meas[290];
-measure q[291] -> meas[291];
-measure q[292] -> meas[292];
-measure q[293] -> meas[293];
-measure q[294] -> meas[294];
-measure q[295] -> meas[295];
-measure q[296] -> meas[296];
-measure q[297] -> meas[297];
-measure q[298] -> meas[298];
-measure q[299] -> meas[299];
-measure q[300] -> meas[300];
-measure q[301] -> meas[301];
-measure q[302] -> meas[302];
-measure q[303] -> meas[303];
-measure q[304] -> meas[304];
-measure q[305] -> meas[305];
-measure q[306] -> meas[306];
-measure q[307] -> meas[307];
-measure q[308] -> meas[308];
-measure q[309] -> meas[309];
-measure q[310] -> meas[310];
-measure q[311] -> meas[311];
-measure q[312] -> meas[312];
-measure q[313] -> meas[313];
-measure q[314] -> meas[314];
-measure q[315] -> meas[315];
-measure q[316] -> meas[316];
-measure q[317] -> meas[317];
-measure q[318] -> meas[318];
-measure q[319] -> meas[319];
-measure q[320] -> meas[320];
-measure q[321] -> meas[321];
-measure q[322] -> meas[322];
-measure q[323] -> meas[323];
-measure q[324] -> meas[324];
-measure q[325] -> meas[325];
-measure q[326] -> meas[326];
-measure q[327] -> meas[327];
-measure q[328] -> meas[328];
-measure q[329] -> meas[329];
-measure q[330] -> meas[330];
-measure q[331] -> meas[331];
-measure q[332] -> meas[332];
-measure q[333] -> meas[333];
-measure q[334] -> meas[334];
-measure q[335] -> meas[335];
-measure q[336] -> meas[336];
-measure q[337] -> meas[337];
-measure q[338] -> meas[338];
-measure q[339] -> meas[339];
-measure q[340] -> meas[340];
-measure q[341] -> meas[341];
-measure q[342] -> meas[342];
-measure q[343] -> meas[343];
-measure q[344] -> meas[344];
-measure q[345] -> meas[345];
-measure q[346] -> meas[346];
-measure q[347] -> meas[347];
-measure q[348] -> meas[348];
-measure q[349] -> meas[349];
-measure q[350] -> meas[350];
-measure q[351] -> meas[351];
-measure q[352] -> meas[352];
-measure q[353] -> meas[353];
-measure q[354] -> meas[354];
-measure q[355] -> meas[355];
-measure q[356] -> meas[356];
-measure q[357] -> meas[357];
-measure q[358] -> meas[358];
-measure q[359] -> meas[359];
-measure q[360] -> meas[360];
-measure q[361] -> meas[361];
-measure q[362] -> meas[362];
-measure q[363] -> meas[363];
-measure q[364] -> meas[364];
-measure q[365] -> meas[365];
-measure q[366] -> meas[366];
-measure q[367] -> meas[367];
-measure q[368] -> meas[368];
-measure q[369] -> meas[369];
-measure q[370] -> meas[370];
-measure q[371] -> meas[371];
-measure q[372] -> meas[372];
-measure q[373] -> meas[373];
-measure q[374] -> meas[374];
-measure q[375] -> meas[375];
-measure q[376] -> meas[376];
-measure q[377] -> meas[377];
-measure q[378] -> meas[378];
-measure q[379] -> meas[379];
-measure q[380] -> meas[380];
-measure q[381] -> meas[381];
-measure q[382] -> meas[382];
-measure q[383] -> meas[383];
-measure q[384] -> meas[384];
-measure q[385] -> meas[385];
-measure q[386] -> meas[386];
-measure q[387] -> meas[387];
-measure q[388] -> meas[388];
-measure q[389] -> meas[389];
-measure q[390] -> meas[390];
-measure q[391] -> meas[391];
-measure q[392] -> meas[392];
-measure q[393] -> meas[393];
-measure q[394] -> meas[394];
-measure q[395] -> meas[395];
-measure q[396] -> meas[396];
-measure q[397] -> meas[397];
-measure q[398] -> meas[398];
-measure q[399] -> meas[399];
-measure q[400] -> meas[400];
-measure q[401] -> meas[401];
-measure q[402] -> meas[402];
-measure q[403] -> meas[403];
-measure q[404] -> meas[404];
-measure q[405] -> meas[405];
-measure q[406] -> meas[406];
-measure q[407] -> meas[407];
-measure q[408] -> meas[408];
-measure q[409] -> meas[409];
-measure q[410] -> meas[410];
-measure q[411] -> meas[411];
-measure q[412] -> meas[412];
-measure q[413] -> meas[413];
-measure q[414] -> meas[414];
-measure q[415] -> meas[415];
-measure q[416] -> meas[416];
-measure q[417] -> meas[417];
-measure q[418] -> meas[418];
-measure q[419] -> meas[419];
-measure q[420] -> meas[420];
-measure q[421] -> meas[421];
-measure q[422] -> meas[422];
-measure q[423] -> meas[423];
-measure q[424] -> meas[424];
-measure q[425] -> meas[425];
-measure q[426] -> meas[426];
-measure q[427] -> meas[427];
-measure q[428] -> meas[428];
-measure q[429] -> meas[429];
-measure q[430] -> meas[430];
-measure q[431] -> meas[431];
-measure q[432] -> meas[432];
@@ -1,2114 +0,0 @@
-OPENQASM 2.0;
-include "qelib1.inc";
-qreg q0[280];
-creg c0[280];
-rz(pi/2) q0[0];
-sx q0[0];
-rz(pi/2) q0[0];
-rz(pi/2) q0[1];
-sx q0[1];
-rz(pi/2) q0[1];
-rz(pi/2) q0[2];
-sx q0[2];
-rz(pi/2) q0[2];
-rz(pi/2) q0[3];
-sx q0[3];
-rz(pi/2) q0[3];
-rz(pi/2) q0[4];
-sx q0[4];
-rz(pi/2) q0[4];
-rz(pi/2) q0[5];
-sx q0[5];
-rz(pi/2) q0[5];
-rz(pi/2) q0[6];
-sx q0[6];
-rz(pi/2) q0[6];
-rz(pi/2) q0[7];
-sx q0[7];
-rz(pi/2) q0[7];
-rz(pi/2) q0[8];
-sx q0[8];
-rz(pi/2) q0[8];
-rz(pi/2) q0[9];
-sx q0[9];
-rz(pi/2) q0[9];
-rz(pi/2) q0[10];
-sx q0[10];
-rz(pi/2) q0[10];
-rz(pi/2) q0[11];
-sx q0[11];
-rz(pi/2) q0[11];
-rz(pi/2) q0[12];
-sx q0[12];
-rz(pi/2) q0[12];
-rz(pi/2) q0[13];
-sx q0[13];
-rz(pi/2) q0[13];
-rz(pi/2) q0[14];
-sx q0[14];
-rz(pi/2) q0[14];
-rz(pi/2) q0[15];
-sx q0[15];
-rz(pi/2) q0[15];
-rz(pi/2) q0[16];
-sx q0[16];
-rz(pi/2) q0[16];
-rz(pi/2) q0[17];
-sx q0[17];
-rz(pi/2) q0[17];
-rz(pi/2) q0[18];
-sx q0[18];
-rz(pi/2) q0[18];
-rz(pi/2) q0[19];
-sx q0[19];
-rz(pi/2) q0[19];
-rz(pi/2) q0[20];
-sx q0[20];
-rz(pi/2) q0[20];
-rz(pi/2) q0[21];
-sx q0[21];
-rz(pi/2) q0[21];
-rz(pi/2) q0[22];
-sx q0[22];
-rz(pi/2) q0[22];
-rz(pi/2) q0[23];
-sx q0[23];
-rz(pi/2) q0[23];
-rz(pi/2) q0[24];
-sx q0[24];
-rz(pi/2) q0[24];
-rz(pi/2) q0[25];
-sx q0[25];
-rz(pi/2) q0[25];
-rz(pi/2) q0[26];
-sx q0[26];
-rz(pi/2) q0[26];
-rz(pi/2) q0[27];
-sx q0[27];
-rz(pi/2) q0[27];
-rz(pi/2) q0[28];
-sx q0[28];
-rz(pi/2) q0[28];
-rz(pi/2) q0[29];
-sx q0[29];
-rz(pi/2) q0[29];
-rz(pi/2) q0[30];
-sx q0[30];
-rz(pi/2) q0[30];
-rz(pi/2) q0[31];
-sx q0[31];
-rz(pi/2) q0[31];
-rz(pi/2) q0[32];
-sx q0[32];
-rz(pi/2) q0[32];
-rz(pi/2) q0[33];
-sx q0[33];
-rz(pi/2) q0[33];
-rz(pi/2) q0[34];
-sx q0[34];
-rz(pi/2) q0[34];
-rz(pi/2) q0[35];
-sx q0[35];
-rz(pi/2) q0[35];
-rz(pi/2) q0[36];
-sx q0[36];
-rz(pi/2) q0[36];
-rz(pi/2) q0[37];
-sx q0[37];
-rz(pi/2) q0[37];
-rz(pi/2) q0[38];
-sx q0[38];
-rz(pi/2) q0[38];
-rz(pi/2) q0[39];
-sx q0[39];
-rz(pi/2) q0[39];
-rz(pi/2) q0[40];
-sx q0[40];
-rz(pi/2) q0[40];
-rz(pi/2) q0[41];
-sx q0[41];
-rz(pi/2) q0[41];
-rz(pi/2) q0[42];
-sx q0[42];
-rz(pi/2) q0[42];
-rz(pi/2) q0[43];
-sx q0[43];
-rz(pi/2) q0[43];
-rz(pi/2) q0[44];
-sx q0[44];
-rz(pi/2) q0[44];
-rz(pi/2) q0[45];
-sx q0[45];
-rz(pi/2) q0[45];
-rz(pi/2) q0[46];
-sx q0[46];
-rz(pi/2) q0[46];
-rz(pi/2) q0[47];
-sx q0[47];
-rz(pi/2) q0[47];
-rz(pi/2) q0[48];
-sx q0[48];
-rz(pi/2) q0[48];
-rz(pi/2) q0[49];
-sx q0[49];
-rz(pi/2) q0[49];
-rz(pi/2) q0[50];
-sx q0[50];
-rz(pi/2) q0[50];
-rz(pi/2) q0[51];
-sx q0[51];
-rz(pi/2) q0[51];
-rz(pi/2) q0[52];
-sx q0[52];
-rz(pi/2) q0[52];
-rz(pi/2) q0[53];
-sx q0[53];
-rz(pi/2) q0[53];
-rz(pi/2) q0[54];
-sx q0[54];
-rz(pi/2) q0[54];
-rz(pi/2) q0[55];
-sx q0[55];
-rz(pi/2) q0[55];
-rz(pi/2) q0[56];
-sx q0[56];
-rz(pi/2) q0[56];
-rz(pi/2) q0[57];
-sx q0[57];
-rz(pi/2) q0[57];
-rz(pi/2) q0[58];
-sx q0[58];
-rz(pi/2) q0[58];
-rz(pi/2) q0[59];
-sx q0[59];
-rz(pi/2) q0[59];
-rz(pi/2) q0[60];
-sx q0[60];
-rz(pi/2) q0[60];
-rz(pi/2) q0[61];
-sx q0[61];
-rz(pi/2) q0[61];
-rz(pi/2) q0[62];
-sx q0[62];
-rz(pi/2) q0[62];
-rz(pi/2) q0[63];
-sx q0[63];
-rz(pi/2) q0[63];
-rz(pi/2) q0[64];
-sx q0[64];
-rz(pi/2) q0[64];
-rz(pi/2) q0[65];
-sx q0[65];
-rz(pi/2) q0[65];
-rz(pi/2) q0[66];
-sx q0[66];
-rz(pi/2) q0[66];
-rz(pi/2) q0[67];
-sx q0[67];
-rz(pi/2) q0[67];
-rz(pi/2) q0[68];
-sx q0[68];
-rz(pi/2) q0[68];
-rz(pi/2) q0[69];
-sx q0[69];
-rz(pi/2) q0[69];
-rz(pi/2) q0[70];
-sx q0[70];
-rz(pi/2) q0[70];
-rz(pi/2) q0[71];
-sx q0[71];
-rz(pi/2) q0[71];
-rz(pi/2) q0[72];
-sx q0[72];
-rz(pi/2) q0[72];
-rz(pi/2) q0[73];
-sx q0[73];
-rz(pi/2) q0[73];
-rz(pi/2) q0[74];
-sx q0[74];
-rz(pi/2) q0[74];
-rz(pi/2) q0[75];
-sx q0[75];
-rz(pi/2) q0[75];
-rz(pi/2) q0[76];
-sx q0[76];
-rz(pi/2) q0[76];
-rz(pi/2) q0[77];
-sx q0[77];
-rz(pi/2) q0[77];
-rz(pi/2) q0[78];
-sx q0[78];
-rz(pi/2) q0[78];
-rz(pi/2) q0[79];
-sx q0[79];
-rz(pi/2) q0[79];
-rz(pi/2) q0[80];
-sx q0[80];
-rz(pi/2) q0[80];
-rz(pi/2) q0[81];
-sx q0[81];
-rz(pi/2) q0[81];
-rz(pi/2) q0[82];
-sx q0[82];
-rz(pi/2) q0[82];
-rz(pi/2) q0[83];
-sx q0[83];
-rz(pi/2) q0[83];
-rz(pi/2) q0[84];
-sx q0[84];
-rz(pi/2) q0[84];
-rz(pi/2) q0[85];
-sx q0[85];
-rz(pi/2) q0[85];
-rz(pi/2) q0[86];
-sx q0[86];
-rz(pi/2) q0[86];
-rz(pi/2) q0[87];
-sx q0[87];
-rz(pi/2) q0[87];
-rz(pi/2) q0[88];
-sx q0[88];
-rz(pi/2) q0[88];
-rz(pi/2) q0[89];
-sx q0[89];
-rz(pi/2) q0[89];
-rz(pi/2) q0[90];
-sx q0[90];
-rz(pi/2) q0[90];
-rz(pi/2) q0[91];
-sx q0[91];
-rz(pi/2) q0[91];
-rz(pi/2) q0[92];
-sx q0[92];
-rz(pi/2) q0[92];
-rz(pi/2) q0[93];
-sx q0[93];
-rz(pi/2) q0[93];
-rz(pi/2) q0[94];
-sx q0[94];
-rz(pi/2) q0[94];
-rz(pi/2) q0[95];
-sx q0[95];
-rz(pi/2) q0[95];
-rz(pi/2) q0[96];
-sx q0[96];
-rz(pi/2) q0[96];
-rz(pi/2) q0[97];
-sx q0[97];
-rz(pi/2) q0[97];
-rz(pi/2) q0[98];
-sx q0[98];
-rz(pi/2) q0[98];
-rz(pi/2) q0[99];
-sx q0[99];
-rz(pi/2) q0[99];
-rz(pi/2) q0[100];
-sx q0[100];
-rz(pi/2) q0[100];
-rz(pi/2) q0[101];
-sx q0[101];
-rz(pi/2) q0[101];
-rz(pi/2) q0[102];
-sx q0[102];
-rz(pi/2) q0[102];
-rz(pi/2) q0[103];
-sx q0[103];
-rz(pi/2) q0[103];
-rz(pi/2) q0[104];
-sx q0[104];
-rz(pi/2) q0[104];
-rz(pi/2) q0[105];
-sx q0[105];
-rz(pi/2) q0[105];
-rz(pi/2) q0[106];
-sx q0[106];
-rz(pi/2) q0[106];
-rz(pi/2) q0[107];
-sx q0[107];
-rz(pi/2) q0[107];
-rz(pi/2) q0[108];
-sx q0[108];
-rz(pi/2) q0[108];
-rz(pi/2) q0[109];
-sx q0[109];
-rz(pi/2) q0[109];
-rz(pi/2) q0[110];
-sx q0[110];
-rz(pi/2) q0[110];
-rz(pi/2) q0[111];
-sx q0[111];
-rz(pi/2) q0[111];
-rz(pi/2) q0[112];
-sx q0[112];
-rz(pi/2) q0[112];
-rz(pi/2) q0[113];
-sx q0[113];
-rz(pi/2) q0[113];
-rz(pi/2) q0[114];
-sx q0[114];
-rz(pi/2) q0[114];
-rz(pi/2) q0[115];
-sx q0[115];
-rz(pi/2) q0[115];
-rz(pi/2) q0[116];
-sx q0[116];
-rz(pi/2) q0[116];
-rz(pi/2) q0[117];
-sx q0[117];
-rz(pi/2) q0[117];
-rz(pi/2) q0[118];
-sx q0[118];
-rz(pi/2) q0[118];
-rz(pi/2) q0[119];
-sx q0[119];
-rz(pi/2) q0[119];
-rz(pi/2) q0[120];
-sx q0[120];
-rz(pi/2) q0[120];
-rz(pi/2) q0[121];
-sx q0[121];
-rz(pi/2) q0[121];
-rz(pi/2) q0[122];
-sx q0[122];
-rz(pi/2) q0[122];
-rz(pi/2) q0[123];
-sx q0[123];
-rz(pi/2) q0[123];
-rz(pi/2) q0[124];
-sx q0[124];
-rz(pi/2) q0[124];
-rz(pi/2) q0[125];
-sx q0[125];
-rz(pi/2) q0[125];
-rz(pi/2) q0[126];
-sx q0[126];
-rz(pi/2) q0[126];
-rz(pi/2) q0[127];
-sx q0[127];
-rz(pi/2) q0[127];
-rz(pi/2) q0[128];
-sx q0[128];
-rz(pi/2) q0[128];
-rz(pi/2) q0[129];
-sx q0[129];
-rz(pi/2) q0[129];
-rz(pi/2) q0[130];
-sx q0[130];
-rz(pi/2) q0[130];
-rz(pi/2) q0[131];
-sx q0[131];
-rz(pi/2) q0[131];
-rz(pi/2) q0[132];
-sx q0[132];
-rz(pi/2) q0[132];
-rz(pi/2) q0[133];
-sx q0[133];
-rz(pi/2) q0[133];
-rz(pi/2) q0[134];
-sx q0[134];
-rz(pi/2) q0[134];
-rz(pi/2) q0[135];
-sx q0[135];
-rz(pi/2) q0[135];
-rz(pi/2) q0[136];
-sx q0[136];
-rz(pi/2) q0[136];
-rz(pi/2) q0[137];
-sx q0[137];
-rz(pi/2) q0[137];
-rz(pi/2) q0[138];
-sx q0[138];
-rz(pi/2) q0[138];
-rz(pi/2) q0[139];
-sx q0[139];
-rz(pi/2) q0[139];
-rz(pi/2) q0[140];
-sx q0[140];
-rz(pi/2) q0[140];
-rz(pi/2) q0[141];
-sx q0[141];
-rz(pi/2) q0[141];
-rz(pi/2) q0[142];
-sx q0[142];
-rz(pi/2) q0[142];
-rz(pi/2) q0[143];
-sx q0[143];
-rz(pi/2) q0[143];
-rz(pi/2) q0[144];
-sx q0[144];
-rz(pi/2) q0[144];
-rz(pi/2) q0[145];
-sx q0[145];
-rz(pi/2) q0[145];
-rz(pi/2) q0[146];
-sx q0[146];
-rz(pi/2) q0[146];
-rz(pi/2) q0[147];
-sx q0[147];
-rz(pi/2) q0[147];
-rz(pi/2) q0[148];
-sx q0[148];
-rz(pi/2) q0[148];
-rz(pi/2) q0[149];
-sx q0[149];
-rz(pi/2) q0[149];
-rz(pi/2) q0[150];
-sx q0[150];
-rz(pi/2) q0[150];
-rz(pi/2) q0[151];
-sx q0[151];
-rz(pi/2) q0[151];
-rz(pi/2) q0[152];
-sx q0[152];
-rz(pi/2) q0[152];
-rz(pi/2) q0[153];
-sx q0[153];
-rz(pi/2) q0[153];
-rz(pi/2) q0[154];
-sx q0[154];
-rz(pi/2) q0[154];
-rz(pi/2) q0[155];
-sx q0[155];
-rz(pi/2) q0[155];
-rz(pi/2) q0[156];
-sx q0[156];
-rz(pi/2) q0[156];
-rz(pi/2) q0[157];
-sx q0[157];
-rz(pi/2) q0[157];
-rz(pi/2) q0[158];
-sx q0[158];
-rz(pi/2) q0[158];
-rz(pi/2) q0[159];
-sx q0[159];
-rz(pi/2) q0[159];
-rz(pi/2) q0[160];
-sx q0[160];
-rz(pi/2) q0[160];
-rz(pi/2) q0[161];
-sx q0[161];
-rz(pi/2) q0[161];
-rz(pi/2) q0[162];
-sx q0[162];
-rz(pi/2) q0[162];
-rz(pi/2) q0[163];
-sx q0[163];
-rz(pi/2) q0[163];
-rz(pi/2) q0[164];
-sx q0[164];
-rz(pi/2) q0[164];
-rz(pi/2) q0[165];
-sx q0[165];
-rz(pi/2) q0[165];
-rz(pi/2) q0[166];
-sx q0[166];
-rz(pi/2) q0[166];
-rz(pi/2) q0[167];
-sx q0[167];
-rz(pi/2) q0[167];
-rz(pi/2) q0[168];
-sx q0[168];
-rz(pi/2) q0[168];
-rz(pi/2) q0[169];
-sx q0[169];
-rz(pi/2) q0[169];
-rz(pi/2) q0[170];
-sx q0[170];
-rz(pi/2) q0[170];
-rz(pi/2) q0[171];
-sx q0[171];
-rz(pi/2) q0[171];
-rz(pi/2) q0[172];
-sx q0[172];
-rz(pi/2) q0[172];
-rz(pi/2) q0[173];
-sx q0[173];
-rz(pi/2) q0[173];
-rz(pi/2) q0[174];
-sx q0[174];
-rz(pi/2) q0[174];
-rz(pi/2) q0[175];
-sx q0[175];
-rz(pi/2) q0[175];
-rz(pi/2) q0[176];
-sx q0[176];
-rz(pi/2) q0[176];
-rz(pi/2) q0[177];
-sx q0[177];
-rz(pi/2) q0[177];
-rz(pi/2) q0[178];
-sx q0[178];
-rz(pi/2) q0[178];
-rz(pi/2) q0[179];
-sx q0[179];
-rz(pi/2) q0[179];
-rz(pi/2) q0[180];
-sx q0[180];
-rz(pi/2) q0[180];
-rz(pi/2) q0[181];
-sx q0[181];
-rz(pi/2) q0[181];
-rz(pi/2) q0[182];
-sx q0[182];
-rz(pi/2) q0[182];
-rz(pi/2) q0[183];
-sx q0[183];
-rz(pi/2) q0[183];
-rz(pi/2) q0[184];
-sx q0[184];
-rz(pi/2) q0[184];
-rz(pi/2) q0[185];
-sx q0[185];
-rz(pi/2) q0[185];
-rz(pi/2) q0[186];
-sx q0[186];
-rz(pi/2) q0[186];
-rz(pi/2) q0[187];
-sx q0[187];
-rz(pi/2) q0[187];
-rz(pi/2) q0[188];
-sx q0[188];
-rz(pi/2) q0[188];
-rz(pi/2) q0[189];
-sx q0[189];
-rz(pi/2) q0[189];
-rz(pi/2) q0[190];
-sx q0[190];
-rz(pi/2) q0[190];
-rz(pi/2) q0[191];
-sx q0[191];
-rz(pi/2) q0[191];
-rz(pi/2) q0[192];
-sx q0[192];
-rz(pi/2) q0[192];
-rz(pi/2) q0[193];
-sx q0[193];
-rz(pi/2) q0[193];
-rz(pi/2) q0[194];
-sx q0[194];
-rz(pi/2) q0[194];
-rz(pi/2) q0[195];
-sx q0[195];
-rz(pi/2) q0[195];
-rz(pi/2) q0[196];
-sx q0[196];
-rz(pi/2) q0[196];
-rz(pi/2) q0[197];
-sx q0[197];
-rz(pi/2) q0[197];
-rz(pi/2) q0[198];
-sx q0[198];
-rz(pi/2) q0[198];
-rz(pi/2) q0[199];
-sx q0[199];
-rz(pi/2) q0[199];
-rz(pi/2) q0[200];
-sx q0[200];
-rz(pi/2) q0[200];
-rz(pi/2) q0[201];
-sx q0[201];
-rz(pi/2) q0[201];
-rz(pi/2) q0[202];
-sx q0[202];
-rz(pi/2) q0[202];
-rz(pi/2) q0[203];
-sx q0[203];
-rz(pi/2) q0[203];
-rz(pi/2) q0[204];
-sx q0[204];
-rz(pi/2) q0[204];
-rz(pi/2) q0[205];
-sx q0[205];
-rz(pi/2) q0[205];
-rz(pi/2) q0[206];
-sx q0[206];
-rz(pi/2) q0[206];
-rz(pi/2) q0[207];
-sx q0[207];
-rz(pi/2) q0[207];
-rz(pi/2) q0[208];
-sx q0[208];
-rz(pi/2) q0[208];
-rz(pi/2) q0[209];
-sx q0[209];
-rz(pi/2) q0[209];
-rz(pi/2) q0[210];
-sx q0[210];
-rz(pi/2) q0[210];
-rz(pi/2) q0[211];
-sx q0[211];
-rz(pi/2) q0[211];
-rz(pi/2) q0[212];
-sx q0[212];
-rz(pi/2) q0[212];
-rz(pi/2) q0[213];
-sx q0[213];
-rz(pi/2) q0[213];
-rz(pi/2) q0[214];
-sx q0[214];
-rz(pi/2) q0[214];
-rz(pi/2) q0[215];
-sx q0[215];
-rz(pi/2) q0[215];
-rz(pi/2) q0[216];
-sx q0[216];
-rz(pi/2) q0[216];
-rz(pi/2) q0[217];
-sx q0[217];
-rz(pi/2) q0[217];
-rz(pi/2) q0[218];
-sx q0[218];
-rz(pi/2) q0[218];
-rz(pi/2) q0[219];
-sx q0[219];
-rz(pi/2) q0[219];
-rz(pi/2) q0[220];
-sx q0[220];
-rz(pi/2) q0[220];
-rz(pi/2) q0[221];
-sx q0[221];
-rz(pi/2) q0[221];
-rz(pi/2) q0[222];
-sx q0[222];
-rz(pi/2) q0[222];
-rz(pi/2) q0[223];
-sx q0[223];
-rz(pi/2) q0[223];
-rz(pi/2) q0[224];
-sx q0[224];
-rz(pi/2) q0[224];
-rz(pi/2) q0[225];
-sx q0[225];
-rz(pi/2) q0[225];
-rz(pi/2) q0[226];
-sx q0[226];
-rz(pi/2) q0[226];
-rz(pi/2) q0[227];
-sx q0[227];
-rz(pi/2) q0[227];
-rz(pi/2) q0[228];
-sx q0[228];
-rz(pi/2) q0[228];
-rz(pi/2) q0[229];
-sx q0[229];
-rz(pi/2) q0[229];
-rz(pi/2) q0[230];
-sx q0[230];
-rz(pi/2) q0[230];
-rz(pi/2) q0[231];
-sx q0[231];
-rz(pi/2) q0[231];
-rz(pi/2) q0[232];
-sx q0[232];
-rz(pi/2) q0[232];
-rz(pi/2) q0[233];
-sx q0[233];
-rz(pi/2) q0[233];
-rz(pi/2) q0[234];
-sx q0[234];
-rz(pi/2) q0[234];
-rz(pi/2) q0[235];
-sx q0[235];
-rz(pi/2) q0[235];
-rz(pi/2) q0[236];
-sx q0[236];
-rz(pi/2) q0[236];
-rz(pi/2) q0[237];
-sx q0[237];
-rz(pi/2) q0[237];
-rz(pi/2) q0[238];
-sx q0[238];
-rz(pi/2) q0[238];
-rz(pi/2) q0[239];
-sx q0[239];
-rz(pi/2) q0[239];
-rz(pi/2) q0[240];
-sx q0[240];
-rz(pi/2) q0[240];
-rz(pi/2) q0[241];
-sx q0[241];
-rz(pi/2) q0[241];
-rz(pi/2) q0[242];
-sx q0[242];
-rz(pi/2) q0[242];
-rz(pi/2) q0[243];
-sx q0[243];
-rz(pi/2) q0[243];
-rz(pi/2) q0[244];
-sx q0[244];
-rz(pi/2) q0[244];
-rz(pi/2) q0[245];
-sx q0[245];
-rz(pi/2) q0[245];
-rz(pi/2) q0[246];
-sx q0[246];
-rz(pi/2) q0[246];
-rz(pi/2) q0[247];
-sx q0[247];
-rz(pi/2) q0[247];
-rz(pi/2) q0[248];
-sx q0[248];
-rz(pi/2) q0[248];
-rz(pi/2) q0[249];
-sx q0[249];
-rz(pi/2) q0[249];
-rz(pi/2) q0[250];
-sx q0[250];
-rz(pi/2) q0[250];
-rz(pi/2) q0[251];
-sx q0[251];
-rz(pi/2) q0[251];
-rz(pi/2) q0[252];
-sx q0[252];
-rz(pi/2) q0[252];
-rz(pi/2) q0[253];
-sx q0[253];
-rz(pi/2) q0[253];
-rz(pi/2) q0[254];
-sx q0[254];
-rz(pi/2) q0[254];
-rz(pi/2) q0[255];
-sx q0[255];
-rz(pi/2) q0[255];
-rz(pi/2) q0[256];
-sx q0[256];
-rz(pi/2) q0[256];
-rz(pi/2) q0[257];
-sx q0[257];
-rz(pi/2) q0[257];
-rz(pi/2) q0[258];
-sx q0[258];
-rz(pi/2) q0[258];
-rz(pi/2) q0[259];
-sx q0[259];
-rz(pi/2) q0[259];
-rz(pi/2) q0[260];
-sx q0[260];
-rz(pi/2) q0[260];
-rz(pi/2) q0[261];
-sx q0[261];
-rz(pi/2) q0[261];
-rz(pi/2) q0[262];
-sx q0[262];
-rz(pi/2) q0[262];
-rz(pi/2) q0[263];
-sx q0[263];
-rz(pi/2) q0[263];
-rz(pi/2) q0[264];
-sx q0[264];
-rz(pi/2) q0[264];
-rz(pi/2) q0[265];
-sx q0[265];
-rz(pi/2) q0[265];
-rz(pi/2) q0[266];
-sx q0[266];
-rz(pi/2) q0[266];
-rz(pi/2) q0[267];
-sx q0[267];
-rz(pi/2) q0[267];
-rz(pi/2) q0[268];
-sx q0[268];
-rz(pi/2) q0[268];
-rz(pi/2) q0[269];
-sx q0[269];
-rz(pi/2) q0[269];
-rz(pi/2) q0[270];
-sx q0[270];
-rz(pi/2) q0[270];
-rz(pi/2) q0[271];
-sx q0[271];
-rz(pi/2) q0[271];
-rz(pi/2) q0[272];
-sx q0[272];
-rz(pi/2) q0[272];
-rz(pi/2) q0[273];
-sx q0[273];
-rz(pi/2) q0[273];
-rz(pi/2) q0[274];
-sx q0[274];
-rz(pi/2) q0[274];
-rz(pi/2) q0[275];
-sx q0[275];
-rz(pi/2) q0[275];
-rz(pi/2) q0[276];
-sx q0[276];
-rz(pi/2) q0[276];
-rz(pi/2) q0[277];
-sx q0[277];
-rz(pi/2) q0[277];
-rz(pi/2) q0[278];
-sx q0[278];
-rz(pi/2) q0[278];
-rz(pi/2) q0[279];
-sx q0[279];
-rz(-pi/2) q0[279];
-barrier q0[0],q0[1],q0[2],q0[3],q0[4],q0[5],q0[6],q0[7],q0[8],q0[9],q0[10],q0[11],q0[12],q0[13],q0[14],q0[15],q0[16],q0[17],q0[18],q0[19],q0[20],q0[21],q0[22],q0[23],q0[24],q0[25],q0[26],q0[27],q0[28],q0[29],q0[30],q0[31],q0[32],q0[33],q0[34],q0[35],q0[36],q0[37],q0[38],q0[39],q0[40],q0[41],q0[42],q0[43],q0[44],q0[45],q0[46],q0[47],q0[48],q0[49],q0[50],q0[51],q0[52],q0[53],q0[54],q0[55],q0[56],q0[57],q0[58],q0[59],q0[60],q0[61],q0[62],q0[63],q0[64],q0[65],q0[66],q0[67],q0[68],q0[69],q0[70],q0[71],q0[72],q0[73],q0[74],q0[75],q0[76],q0[77],q0[78],q0[79],q0[80],q0[81],q0[82],q0[83],q0[84],q0[85],q0[86],q0[87],q0[88],q0[89],q0[90],q0[91],q0[92],q0[93],q0[94],q0[95],q0[96],q0[97],q0[98],q0[99],q0[100],q0[101],q0[102],q0[103],q0[104],q0[105],q0[106],q0[107],q0[108],q0[109],q0[110],q0[111],q0[112],q0[113],q0[114],q0[115],q0[116],q0[117],q0[118],q0[119],q0[120],q0[121],q0[122],q0[123],q0[124],q0[125],q0[126],q0[127],q0[128],q0[129],q0[130],q0[131],q0[132],q0[133],q0[134],q0[135],q0[136],q0[137],q0[138],q0[139],q0[140],q0[141],q0[142],q0[143],q0[144],q0[145],q0[146],q0[147],q0[148],q0[149],q0[150],q0[151],q0[152],q0[153],q0[154],q0[155],q0[156],q0[157],q0[158],q0[159],q0[160],q0[161],q0[162],q0[163],q0[164],q0[165],q0[166],q0[167],q0[168],q0[169],q0[170],q0[171],q0[172],q0[173],q0[174],q0[175],q0[176],q0[177],q0[178],q0[179],q0[180],q0[181],q0[182],q0[183],q0[184],q0[185],q0[186],q0[187],q0[188],q0[189],q0[190],q0[191],q0[192],q0[193],q0[194],q0[195],q0[196],q0[197],q0[198],q0[199],q0[200],q0[201],q0[202],q0[203],q0[204],q0[205],q0[206],q0[207],q0[208],q0[209],q0[210],q0[211],q0[212],q0[213],q0[214],q0[215],q0[216],q0[217],q0[218],q0[219],q0[220],q0[221],q0[222],q0[223],q0[224],q0[225],q0[226],q0[227],q0[228],q0[229],q0[230],q0[231],q0[232],q0[233],q0[234],q0[235],q0[236],q0[237],q0[238],q0[239],q0[240],q0[241],q0[242],q0[243],q0[244],q0[245],q0[246],q0[247],q0[248],q0[249],q0[250],q0[251],q0[252],q0[253],q0[254],q0[255],q0[256],q0[257],q0[258],q0[259],q0[260],q0[261],q0[262],q0[263],q0[264],q0[265],q0[266],q0[267],q0[268],q0[269],q0[270],q0[271],q0[272],q0[273],q0[274],q0[275],q0[276],q0[277],q0[278],q0[279];
-cx q0[1],q0[279];
-cx q0[2],q0[279];
-cx q0[3],q0[279];
-cx q0[4],q0[279];
-cx q0[5],q0[279];
-cx q0[7],q0[279];
-cx q0[9],q0[279];
-cx q0[12],q0[279];
-cx q0[14],q0[279];
-cx q0[15],q0[279];
-cx q0[16],q0[279];
-cx q0[17],q0[279];
-cx q0[19],q0[279];
-cx q0[20],q0[279];
-cx q0[23],q0[279];
-cx q0[25],q0[279];
-cx q0[26],q0[279];
-cx q0[33],q0[279];
-cx q0[36],q0[279];
-cx q0[37],q0[279];
-cx q0[41],q0[279];
-cx q0[43],q0[279];
-cx q0[47],q0[279];
-cx q0[48],q0[279];
-cx q0[51],q0[279];
-cx q0[52],q0[279];
-cx q0[53],q0[279];
-cx q0[56],q0[279];
-cx q0[57],q0[279];
-cx q0[58],q0[279];
-cx q0[60],q0[279];
-cx q0[62],q0[279];
-cx q0[63],q0[279];
-cx q0[67],q0[279];
-cx q0[70],q0[279];
-cx q0[71],q0[279];
-cx q0[73],q0[279];
-cx q0[74],q0[279];
-cx q0[76],q0[279];
-cx q0[78],q0[279];
-cx q0[80],q0[279];
-cx q0[82],q0[279];
-cx q0[83],q0[279];
-cx q0[86],q0[279];
-cx q0[87],q0[279];
-cx q0[88],q0[279];
-cx q0[92],q0[279];
-cx q0[93],q0[279];
-cx q0[94],q0[279];
-cx q0[95],q0[279];
-cx q0[96],q0[279];
-cx q0[98],q0[279];
-cx q0[99],q0[279];
-cx q0[100],q0[279];
-cx q0[102],q0[279];
-cx q0[103],q0[279];
-cx q0[105],q0[279];
-cx q0[106],q0[279];
-cx q0[107],q0[279];
-cx q0[108],q0[279];
-cx q0[110],q0[279];
-cx q0[115],q0[279];
-cx q0[117],q0[279];
-cx q0[118],q0[279];
-cx q0[119],q0[279];
-cx q0[120],q0[279];
-cx q0[121],q0[279];
-cx q0[122],q0[279];
-cx q0[123],q0[279];
-cx q0[126],q0[279];
-cx q0[129],q0[279];
-cx q0[132],q0[279];
-cx q0[138],q0[279];
-cx q0[139],q0[279];
-cx q0[140],q0[279];
-cx q0[141],q0[279];
-cx q0[143],q0[279];
-cx q0[146],q0[279];
-cx q0[152],q0[279];
-cx q0[156],q0[279];
-cx q0[157],q0[279];
-cx q0[158],q0[279];
-cx q0[159],q0[279];
-cx q0[160],q0[279];
-cx q0[163],q0[279];
-cx q0[165],q0[279];
-cx q0[168],q0[279];
-cx q0[171],q0[279];
-cx q0[172],q0[279];
-cx q0[174],q0[279];
-cx q0[176],q0[279];
-cx q0[179],q0[279];
-cx q0[180],q0[279];
-cx q0[182],q0[279];
-cx q0[183],q0[279];
-cx q0[184],q0[279];
-cx q0[185],q0[279];
-cx q0[188],q0[279];
-cx q0[189],q0[279];
-cx q0[190],q0[279];
-cx q0[191],q0[279];
-cx q0[192],q0[279];
-cx q0[198],q0[279];
-cx q0[201],q0[279];
-cx q0[203],q0[279];
-cx q0[204],q0[279];
-cx q0[206],q0[279];
-cx q0[208],q0[279];
-cx q0[209],q0[279];
-cx q0[214],q0[279];
-cx q0[216],q0[279];
-cx q0[217],q0[279];
-cx q0[220],q0[279];
-cx q0[222],q0[279];
-cx q0[223],q0[279];
-cx q0[225],q0[279];
-cx q0[226],q0[279];
-cx q0[227],q0[279];
-cx q0[228],q0[279];
-cx q0[229],q0[279];
-cx q0[230],q0[279];
-cx q0[231],q0[279];
-cx q0[232],q0[279];
-cx q0[233],q0[279];
-cx q0[236],q0[279];
-cx q0[238],q0[279];
-cx q0[239],q0[279];
-cx q0[241],q0[279];
-cx q0[245],q0[279];
-cx q0[246],q0[279];
-cx q0[248],q0[279];
-cx q0[250],q0[279];
-cx q0[251],q0[279];
-cx q0[252],q0[279];
-cx q0[254],q0[279];
-cx q0[255],q0[279];
-cx q0[256],q0[279];
-cx q0[258],q0[279];
-cx q0[260],q0[279];
-cx q0[261],q0[279];
-cx q0[263],q0[279];
-cx q0[264],q0[279];
-cx q0[266],q0[279];
-cx q0[267],q0[279];
-cx q0[268],q0[279];
-cx q0[269],q0[279];
-cx q0[270],q0[279];
-cx q0[272],q0[279];
-cx q0[274],q0[279];
-cx q0[275],q0[279];
-cx q0[277],q0[279];
-cx q0[278],q0[279];
-barrier q0[0],q0[1],q0[2],q0[3],q0[4],q0[5],q0[6],q0[7],q0[8],q0[9],q0[10],q0[11],q0[12],q0[13],q0[14],q0[15],q0[16],q0[17],q0[18],q0[19],q0[20],q0[21],q0[22],q0[23],q0[24],q0[25],q0[26],q0[27],q0[28],q0[29],q0[30],q0[31],q0[32],q0[33],q0[34],q0[35],q0[36],q0[37],q0[38],q0[39],q0[40],q0[41],q0[42],q0[43],q0[44],q0[45],q0[46],q0[47],q0[48],q0[49],q0[50],q0[51],q0[52],q0[53],q0[54],q0[55],q0[56],q0[57],q0[58],q0[59],q0[60],q0[61],q0[62],q0[63],q0[64],q0[65],q0[66],q0[67],q0[68],q0[69],q0[70],q0[71],q0[72],q0[73],q0[74],q0[75],q0[76],q0[77],q0[78],q0[79],q0[80],q0[81],q0[82],q0[83],q0[84],q0[85],q0[86],q0[87],q0[88],q0[89],q0[90],q0[91],q0[92],q0[93],q0[94],q0[95],q0[96],q0[97],q0[98],q0[99],q0[100],q0[101],q0[102],q0[103],q0[104],q0[105],q0[106],q0[107],q0[108],q0[109],q0[110],q0[111],q0[112],q0[113],q0[114],q0[115],q0[116],q0[117],q0[118],q0[119],q0[120],q0[121],q0[122],q0[123],q0[124],q0[125],q0[126],q0[127],q0[128],q0[129],q0[130],q0[131],q0[132],q0[133],q0[134],q0[135],q0[136],q0[137],q0[138],q0[139],q0[140],q0[141],q0[142],q0[143],q0[144],q0[145],q0[146],q0[147],q0[148],q0[149],q0[150],q0[151],q0[152],q0[153],q0[154],q0[155],q0[156],q0[157],q0[158],q0[159],q0[160],q0[161],q0[162],q0[163],q0[164],q0[165],q0[166],q0[167],q0[168],q0[169],q0[170],q0[171],q0[172],q0[173],q0[174],q0[175],q0[176],q0[177],q0[178],q0[179],q0[180],q0[181],q0[182],q0[183],q0[184],q0[185],q0[186],q0[187],q0[188],q0[189],q0[190],q0[191],q0[192],q0[193],q0[194],q0[195],q0[196],q0[197],q0[198],q0[199],q0[200],q0[201],q0[202],q0[203],q0[204],q0[205],q0[206],q0[207],q0[208],q0[209],q0[210],q0[211],q0[212],q0[213],q0[214],q0[215],q0[216],q0[217],q0[218],q0[219],q0[220],q0[221],q0[222],q0[223],q0[224],q0[225],q0[226],q0[227],q0[228],q0[229],q0[230],q0[231],q0[232],q0[233],q0[234],q0[235],q0[236],q0[237],q0[238],q0[239],q0[240],q0[241],q0[242],q0[243],q0[244],q0[245],q0[246],q0[247],q0[248],q0[249],q0[250],q0[251],q0[252],q0[253],q0[254],q0[255],q0[256],q0[257],q0[258],q0[259],q0[260],q0[261],q0[262],q0[263],q0[264],q0[265],q0[266],q0[267],q0[268],q0[269],q0[270],q0[271],q0[272],q0[273],q0[274],q0[275],q0[276],q0[277],q0[278],q0[279];
-rz(pi/2) q0[0];
-sx q0[0];
-rz(pi/2) q0[0];
-rz(pi/2) q0[1];
-sx q0[1];
-rz(pi/2) q0[1];
-rz(pi/2) q0[10];
-sx q0[10];
-rz(pi/2) q0[10];
-rz(pi/2) q0[100];
-sx q0[100];
-rz(pi/2) q0[100];
-rz(pi/2) q0[101];
-sx q0[101];
-rz(pi/2) q0[101];
-rz(pi/2) q0[102];
-sx q0[102];
-rz(pi/2) q0[102];
-rz(pi/2) q0[103];
-sx q0[103];
-rz(pi/2) q0[103];
-rz(pi/2) q0[104];
-sx q0[104];
-rz(pi/2) q0[104];
-rz(pi/2) q0[105];
-sx q0[105];
-rz(pi/2) q0[105];
-rz(pi/2) q0[106];
-sx q0[106];
-rz(pi/2) q0[106];
-rz(pi/2) q0[107];
-sx q0[107];
-rz(pi/2) q0[107];
-rz(pi/2) q0[108];
-sx q0[108];
-rz(pi/2) q0[108];
-rz(pi/2) q0[109];
-sx q0[109];
-rz(pi/2) q0[109];
-rz(pi/2) q0[11];
-sx q0[11];
-rz(pi/2) q0[11];
-rz(pi/2) q0[110];
-sx q0[110];
-rz(pi/2) q0[110];
-rz(pi/2) q0[111];
-sx q0[111];
-rz(pi/2) q0[111];
-rz(pi/2) q0[112];
-sx q0[112];
-rz(pi/2) q0[112];
-rz(pi/2) q0[113];
-sx q0[113];
-rz(pi/2) q0[113];
-rz(pi/2) q0[114];
-sx q0[114];
-rz(pi/2) q0[114];
-rz(pi/2) q0[115];
-sx q0[115];
-rz(pi/2) q0[115];
-rz(pi/2) q0[116];
-sx q0[116];
-rz(pi/2) q0[116];
-rz(pi/2) q0[117];
-sx q0[117];
-rz(pi/2) q0[117];
-rz(pi/2) q0[118];
-sx q0[118];
-rz(pi/2) q0[118];
-rz(pi/2) q0[119];
-sx q0[119];
-rz(pi/2) q0[119];
-rz(pi/2) q0[12];
-sx q0[12];
-rz(pi/2) q0[12];
-rz(pi/2) q0[120];
-sx q0[120];
-rz(pi/2) q0[120];
-rz(pi/2) q0[121];
-sx q0[121];
-rz(pi/2) q0[121];
-rz(pi/2) q0[122];
-sx q0[122];
-rz(pi/2) q0[122];
-rz(pi/2) q0[123];
-sx q0[123];
-rz(pi/2) q0[123];
-rz(pi/2) q0[124];
-sx q0[124];
-rz(pi/2) q0[124];
-rz(pi/2) q0[125];
-sx q0[125];
-rz(pi/2) q0[125];
-rz(pi/2) q0[126];
-sx q0[126];
-rz(pi/2) q0[126];
-rz(pi/2) q0[127];
-sx q0[127];
-rz(pi/2) q0[127];
-rz(pi/2) q0[128];
-sx q0[128];
-rz(pi/2) q0[128];
-rz(pi/2) q0[129];
-sx q0[129];
-rz(pi/2) q0[129];
-rz(pi/2) q0[13];
-sx q0[13];
-rz(pi/2) q0[13];
-rz(pi/2) q0[130];
-sx q0[130];
-rz(pi/2) q0[130];
-rz(pi/2) q0[131];
-sx q0[131];
-rz(pi/2) q0[131];
-rz(pi/2) q0[132];
-sx q0[132];
-rz(pi/2) q0[132];
-rz(pi/2) q0[133];
-sx q0[133];
-rz(pi/2) q0[133];
-rz(pi/2) q0[134];
-sx q0[134];
-rz(pi/2) q0[134];
-rz(pi/2) q0[135];
-sx q0[135];
-rz(pi/2) q0[135];
-rz(pi/2) q0[136];
-sx q0[136];
-rz(pi/2) q0[136];
-rz(pi/2) q0[137];
-sx q0[137];
-rz(pi/2) q0[137];
-rz(pi/2) q0[138];
-sx q0[138];
-rz(pi/2) q0[138];
-rz(pi/2) q0[139];
-sx q0[139];
-rz(pi/2) q0[139];
-rz(pi/2) q0[14];
-sx q0[14];
-rz(pi/2) q0[14];
-rz(pi/2) q0[140];
-sx q0[140];
-rz(pi/2) q0[140];
-rz(pi/2) q0[141];
-sx q0[141];
-rz(pi/2) q0[141];
-rz(pi/2) q0[142];
-sx q0[142];
-rz(pi/2) q0[142];
-rz(pi/2) q0[143];
-sx q0[143];
-rz(pi/2) q0[143];
-rz(pi/2) q0[144];
-sx q0[144];
-rz(pi/2) q0[144];
-rz(pi/2) q0[145];
-sx q0[145];
-rz(pi/2) q0[145];
-rz(pi/2) q0[146];
-sx q0[146];
-rz(pi/2) q0[146];
-rz(pi/2) q0[147];
-sx q0[147];
-rz(pi/2) q0[147];
-rz(pi/2) q0[148];
-sx q0[148];
-rz(pi/2) q0[148];
-rz(pi/2) q0[149];
-sx q0[149];
-rz(pi/2) q0[149];
-rz(pi/2) q0[15];
-sx q0[15];
-rz(pi/2) q0[15];
-rz(pi/2) q0[150];
-sx q0[150];
-rz(pi/2) q0[150];
-rz(pi/2) q0[151];
-sx q0[151];
-rz(pi/2) q0[151];
-rz(pi/2) q0[152];
-sx q0[152];
-rz(pi/2) q0[152];
-rz(pi/2) q0[153];
-sx q0[153];
-rz(pi/2) q0[153];
-rz(pi/2) q0[154];
-sx q0[154];
-rz(pi/2) q0[154];
-rz(pi/2) q0[155];
-sx q0[155];
-rz(pi/2) q0[155];
-rz(pi/2) q0[156];
-sx q0[156];
-rz(pi/2) q0[156];
-rz(pi/2) q0[157];
-sx q0[157];
-rz(pi/2) q0[157];
-rz(pi/2) q0[158];
-sx q0[158];
-rz(pi/2) q0[158];
-rz(pi/2) q0[159];
-sx q0[159];
-rz(pi/2) q0[159];
-rz(pi/2) q0[16];
-sx q0[16];
-rz(pi/2) q0[16];
-rz(pi/2) q0[160];
-sx q0[160];
-rz(pi/2) q0[160];
-rz(pi/2) q0[161];
-sx q0[161];
-rz(pi/2) q0[161];
-rz(pi/2) q0[162];
-sx q0[162];
-rz(pi/2) q0[162];
-rz(pi/2) q0[163];
-sx q0[163];
-rz(pi/2) q0[163];
-rz(pi/2) q0[164];
-sx q0[164];
-rz(pi/2) q0[164];
-rz(pi/2) q0[165];
-sx q0[165];
-rz(pi/2) q0[165];
-rz(pi/2) q0[166];
-sx q0[166];
-rz(pi/2) q0[166];
-rz(pi/2) q0[167];
-sx q0[167];
-rz(pi/2) q0[167];
-rz(pi/2) q0[168];
-sx q0[168];
-rz(pi/2) q0[168];
-rz(pi/2) q0[169];
-sx q0[169];
-rz(pi/2) q0[169];
-rz(pi/2) q0[17];
-sx q0[17];
-rz(pi/2) q0[17];
-rz(pi/2) q0[170];
-sx q0[170];
-rz(pi/2) q0[170];
-rz(pi/2) q0[171];
-sx q0[171];
-rz(pi/2) q0[171];
-rz(pi/2) q0[172];
-sx q0[172];
-rz(pi/2) q0[172];
-rz(pi/2) q0[173];
-sx q0[173];
-rz(pi/2) q0[173];
-rz(pi/2) q0[174];
-sx q0[174];
-rz(pi/2) q0[174];
-rz(pi/2) q0[175];
-sx q0[175];
-rz(pi/2) q0[175];
-rz(pi/2) q0[176];
-sx q0[176];
-rz(pi/2) q0[176];
-rz(pi/2) q0[177];
-sx q0[177];
-rz(pi/2) q0[177];
-rz(pi/2) q0[178];
-sx q0[178];
-rz(pi/2) q0[178];
-rz(pi/2) q0[179];
-sx q0[179];
-rz(pi/2) q0[179];
-rz(pi/2) q0[18];
-sx q0[18];
-rz(pi/2) q0[18];
-rz(pi/2) q0[180];
-sx q0[180];
-rz(pi/2) q0[180];
-rz(pi/2) q0[181];
-sx q0[181];
-rz(pi/2) q0[181];
-rz(pi/2) q0[182];
-sx q0[182];
-rz(pi/2) q0[182];
-rz(pi/2) q0[183];
-sx q0[183];
-rz(pi/2) q0[183];
-rz(pi/2) q0[184];
-sx q0[184];
-rz(pi/2) q0[184];
-rz(pi/2) q0[185];
-sx q0[185];
-rz(pi/2) q0[185];
-rz(pi/2) q0[186];
-sx q0[186];
-rz(pi/2) q0[186];
-rz(pi/2) q0[187];
-sx q0[187];
-rz(pi/2) q0[187];
-rz(pi/2) q0[188];
-sx q0[188];
-rz(pi/2) q0[188];
-rz(pi/2) q0[189];
-sx q0[189];
-rz(pi/2) q0[189];
-rz(pi/2) q0[19];
-sx q0[19];
-rz(pi/2) q0[19];
-rz(pi/2) q0[190];
-sx q0[190];
-rz(pi/2) q0[190];
-rz(pi/2) q0[191];
-sx q0[191];
-rz(pi/2) q0[191];
-rz(pi/2) q0[192];
-sx q0[192];
-rz(pi/2) q0[192];
-rz(pi/2) q0[193];
-sx q0[193];
-rz(pi/2) q0[193];
-rz(pi/2) q0[194];
-sx q0[194];
-rz(pi/2) q0[194];
-rz(pi/2) q0[195];
-sx q0[195];
-rz(pi/2) q0[195];
-rz(pi/2) q0[196];
-sx q0[196];
-rz(pi/2) q0[196];
-rz(pi/2) q0[197];
-sx q0[197];
-rz(pi/2) q0[197];
-rz(pi/2) q0[198];
-sx q0[198];
-rz(pi/2) q0[198];
-rz(pi/2) q0[199];
-sx q0[199];
-rz(pi/2) q0[199];
-rz(pi/2) q0[2];
-sx q0[2];
-rz(pi/2) q0[2];
-rz(pi/2) q0[20];
-sx q0[20];
-rz(pi/2) q0[20];
-rz(pi/2) q0[200];
-sx q0[200];
-rz(pi/2) q0[200];
-rz(pi/2) q0[201];
-sx q0[201];
-rz(pi/2) q0[201];
-rz(pi/2) q0[202];
-sx q0[202];
-rz(pi/2) q0[202];
-rz(pi/2) q0[203];
-sx q0[203];
-rz(pi/2) q0[203];
-rz(pi/2) q0[204];
-sx q0[204];
-rz(pi/2) q0[204];
-rz(pi/2) q0[205];
-sx q0[205];
-rz(pi/2) q0[205];
-rz(pi/2) q0[206];
-sx q0[206];
-rz(pi/2) q0[206];
-rz(pi/2) q0[207];
-sx q0[207];
-rz(pi/2) q0[207];
-rz(pi/2) q0[208];
-sx q0[208];
-rz(pi/2) q0[208];
-rz(pi/2) q0[209];
-sx q0[209];
-rz(pi/2) q0[209];
-rz(pi/2) q0[21];
-sx q0[21];
-rz(pi/2) q0[21];
-rz(pi/2) q0[210];
-sx q0[210];
-rz(pi/2) q0[210];
-rz(pi/2) q0[211];
-sx q0[211];
-rz(pi/2) q0[211];
-rz(pi/2) q0[212];
-sx q0[212];
-rz(pi/2) q0[212];
-rz(pi/2) q0[213];
-sx q0[213];
-rz(pi/2) q0[213];
-rz(pi/2) q0[214];
-sx q0[214];
-rz(pi/2) q0[214];
-rz(pi/2) q0[215];
-sx q0[215];
-rz(pi/2) q0[215];
-rz(pi/2) q0[216];
-sx q0[216];
-rz(pi/2) q0[216];
-rz(pi/2) q0[217];
-sx q0[217];
-rz(pi/2) q0[217];
-rz(pi/2) q0[218];
-sx q0[218];
-rz(pi/2) q0[218];
-rz(pi/2) q0[219];
-sx q0[219];
-rz(pi/2) q0[219];
-rz(pi/2) q0[22];
-sx q0[22];
-rz(pi/2) q0[22];
-rz(pi/2) q0[220];
-sx q0[220];
-rz(pi/2) q0[220];
-rz(pi/2) q0[221];
-sx q0[221];
-rz(pi/2) q0[221];
-rz(pi/2) q0[222];
-sx q0[222];
-rz(pi/2) q0[222];
-rz(pi/2) q0[223];
-sx q0[223];
-rz(pi/2) q0[223];
-rz(pi/2) q0[224];
-sx q0[224];
-rz(pi/2) q0[224];
-rz(pi/2) q0[225];
-sx q0[225];
-rz(pi/2) q0[225];
-rz(pi/2) q0[226];
-sx q0[226];
-rz(pi/2) q0[226];
-rz(pi/2) q0[227];
-sx q0[227];
-rz(pi/2) q0[227];
-rz(pi/2) q0[228];
-sx q0[228];
-rz(pi/2) q0[228];
-rz(pi/2) q0[229];
-sx q0[229];
-rz(pi/2) q0[229];
-rz(pi/2) q0[23];
-sx q0[23];
-rz(pi/2) q0[23];
-rz(pi/2) q0[230];
-sx q0[230];
-rz(pi/2) q0[230];
-rz(pi/2) q0[231];
-sx q0[231];
-rz(pi/2) q0[231];
-rz(pi/2) q0[232];
-sx q0[232];
-rz(pi/2) q0[232];
-rz(pi/2) q0[233];
-sx q0[233];
-rz(pi/2) q0[233];
-rz(pi/2) q0[234];
-sx q0[234];
-rz(pi/2) q0[234];
-rz(pi/2) q0[235];
-sx q0[235];
-rz(pi/2) q0[235];
-rz(pi/2) q0[236];
-sx q0[236];
-rz(pi/2) q0[236];
-rz(pi/2) q0[237];
-sx q0[237];
-rz(pi/2) q0[237];
-rz(pi/2) q0[238];
-sx q0[238];
-rz(pi/2) q0[238];
-rz(pi/2) q0[239];
-sx q0[239];
-rz(pi/2) q0[239];
-rz(pi/2) q0[24];
-sx q0[24];
-rz(pi/2) q0[24];
-rz(pi/2) q0[240];
-sx q0[240];
-rz(pi/2) q0[240];
-rz(pi/2) q0[241];
-sx q0[241];
-rz(pi/2) q0[241];
-rz(pi/2) q0[242];
-sx q0[242];
-rz(pi/2) q0[242];
-rz(pi/2) q0[243];
-sx q0[243];
-rz(pi/2) q0[243];
-rz(pi/2) q0[244];
-sx q0[244];
-rz(pi/2) q0[244];
-rz(pi/2) q0[245];
-sx q0[245];
-rz(pi/2) q0[245];
-rz(pi/2) q0[246];
-sx q0[246];
-rz(pi/2) q0[246];
-rz(pi/2) q0[247];
-sx q0[247];
-rz(pi/2) q0[247];
-rz(pi/2) q0[248];
-sx q0[248];
-rz(pi/2) q0[248];
-rz(pi/2) q0[249];
-sx q0[249];
-rz(pi/2) q0[249];
-rz(pi/2) q0[25];
-sx q0[25];
-rz(pi/2) q0[25];
-rz(pi/2) q0[250];
-sx q0[250];
-rz(pi/2) q0[250];
-rz(pi/2) q0[251];
-sx q0[251];
-rz(pi/2) q0[251];
-rz(pi/2) q0[252];
-sx q0[252];
-rz(pi/2) q0[252];
-rz(pi/2) q0[253];
-sx q0[253];
-rz(pi/2) q0[253];
-rz(pi/2) q0[254];
-sx q0[254];
-rz(pi/2) q0[254];
-rz(pi/2) q0[255];
-sx q0[255];
-rz(pi/2) q0[255];
-rz(pi/2) q0[256];
-sx q0[256];
-rz(pi/2) q0[256];
-rz(pi/2) q0[257];
-sx q0[257];
-rz(pi/2) q0[257];
-rz(pi/2) q0[258];
-sx q0[258];
-rz(pi/2) q0[258];
-rz(pi/2) q0[259];
-sx q0[259];
-rz(pi/2) q0[259];
-rz(pi/2) q0[26];
-sx q0[26];
-rz(pi/2) q0[26];
-rz(pi/2) q0[260];
-sx q0[260];
-rz(pi/2) q0[260];
-rz(pi/2) q0[261];
-sx q0[261];
-rz(pi/2) q0[261];
-rz(pi/2) q0[262];
-sx q0[262];
-rz(pi/2) q0[262];
-rz(pi/2) q0[263];
-sx q0[263];
-rz(pi/2) q0[263];
-rz(pi/2) q0[264];
-sx q0[264];
-rz(pi/2) q0[264];
-rz(pi/2) q0[265];
-sx q0[265];
-rz(pi/2) q0[265];
-rz(pi/2) q0[266];
-sx q0[266];
-rz(pi/2) q0[266];
-rz(pi/2) q0[267];
-sx q0[267];
-rz(pi/2) q0[267];
-rz(pi/2) q0[268];
-sx q0[268];
-rz(pi/2) q0[268];
-rz(pi/2) q0[269];
-sx q0[269];
-rz(pi/2) q0[269];
-rz(pi/2) q0[27];
-sx q0[27];
-rz(pi/2) q0[27];
-rz(pi/2) q0[270];
-sx q0[270];
-rz(pi/2) q0[270];
-rz(pi/2) q0[271];
-sx q0[271];
-rz(pi/2) q0[271];
-rz(pi/2) q0[272];
-sx q0[272];
-rz(pi/2) q0[272];
-rz(pi/2) q0[273];
-sx q0[273];
-rz(pi/2) q0[273];
-rz(pi/2) q0[274];
-sx q0[274];
-rz(pi/2) q0[274];
-rz(pi/2) q0[275];
-sx q0[275];
-rz(pi/2) q0[275];
-rz(pi/2) q0[276];
-sx q0[276];
-rz(pi/2) q0[276];
-rz(pi/2) q0[277];
-sx q0[277];
-rz(pi/2) q0[277];
-rz(pi/2) q0[278];
-sx q0[278];
-rz(pi/2) q0[278];
-rz(pi/2) q0[28];
-sx q0[28];
-rz(pi/2) q0[28];
-rz(pi/2) q0[29];
-sx q0[29];
-rz(pi/2) q0[29];
-rz(pi/2) q0[3];
-sx q0[3];
-rz(pi/2) q0[3];
-rz(pi/2) q0[30];
-sx q0[30];
-rz(pi/2) q0[30];
-rz(pi/2) q0[31];
-sx q0[31];
-rz(pi/2) q0[31];
-rz(pi/2) q0[32];
-sx q0[32];
-rz(pi/2) q0[32];
-rz(pi/2) q0[33];
-sx q0[33];
-rz(pi/2) q0[33];
-rz(pi/2) q0[34];
-sx q0[34];
-rz(pi/2) q0[34];
-rz(pi/2) q0[35];
-sx q0[35];
-rz(pi/2) q0[35];
-rz(pi/2) q0[36];
-sx q0[36];
-rz(pi/2) q0[36];
-rz(pi/2) q0[37];
-sx q0[37];
-rz(pi/2) q0[37];
-rz(pi/2) q0[38];
-sx q0[38];
-rz(pi/2) q0[38];
-rz(pi/2) q0[39];
-sx q0[39];
-rz(pi/2) q0[39];
-rz(pi/2) q0[4];
-sx q0[4];
-rz(pi/2) q0[4];
-rz(pi/2) q0[40];
-sx q0[40];
-rz(pi/2) q0[40];
-rz(pi/2) q0[41];
-sx q0[41];
-rz(pi/2) q0[41];
-rz(pi/2) q0[42];
-sx q0[42];
-rz(pi/2) q0[42];
-rz(pi/2) q0[43];
-sx q0[43];
-rz(pi/2) q0[43];
-rz(pi/2) q0[44];
-sx q0[44];
-rz(pi/2) q0[44];
-rz(pi/2) q0[45];
-sx q0[45];
-rz(pi/2) q0[45];
-rz(pi/2) q0[46];
-sx q0[46];
-rz(pi/2) q0[46];
-rz(pi/2) q0[47];
-sx q0[47];
-rz(pi/2) q0[47];
-rz(pi/2) q0[48];
-sx q0[48];
-rz(pi/2) q0[48];
-rz(pi/2) q0[49];
-sx q0[49];
-rz(pi/2) q0[49];
-rz(pi/2) q0[5];
-sx q0[5];
-rz(pi/2) q0[5];
-rz(pi/2) q0[50];
-sx q0[50];
-rz(pi/2) q0[50];
-rz(pi/2) q0[51];
-sx q0[51];
-rz(pi/2) q0[51];
-rz(pi/2) q0[52];
-sx q0[52];
-rz(pi/2) q0[52];
-rz(pi/2) q0[53];
-sx q0[53];
-rz(pi/2) q0[53];
-rz(pi/2) q0[54];
-sx q0[54];
-rz(pi/2) q0[54];
-rz(pi/2) q0[55];
-sx q0[55];
-rz(pi/2) q0[55];
-rz(pi/2) q0[56];
-sx q0[56];
-rz(pi/2) q0[56];
-rz(pi/2) q0[57];
-sx q0[57];
-rz(pi/2) q0[57];
-rz(pi/2) q0[58];
-sx q0[58];
-rz(pi/2) q0[58];
-rz(pi/2) q0[59];
-sx q0[59];
-rz(pi/2) q0[59];
-rz(pi/2) q0[6];
-sx q0[6];
-rz(pi/2) q0[6];
-rz(pi/2) q0[60];
-sx q0[60];
-rz(pi/2) q0[60];
-rz(pi/2) q0[61];
-sx q0[61];
-rz(pi/2) q0[61];
-rz(pi/2) q0[62];
-sx q0[62];
-rz(pi/2) q0[62];
-rz(pi/2) q0[63];
-sx q0[63];
-rz(pi/2) q0[63];
-rz(pi/2) q0[64];
-sx q0[64];
-rz(pi/2) q0[64];
-rz(pi/2) q0[65];
-sx q0[65];
-rz(pi/2) q0[65];
-rz(pi/2) q0[66];
-sx q0[66];
-rz(pi/2) q0[66];
-rz(pi/2) q0[67];
-sx q0[67];
-rz(pi/2) q0[67];
-rz(pi/2) q0[68];
-sx q0[68];
-rz(pi/2) q0[68];
-rz(pi/2) q0[69];
-sx q0[69];
-rz(pi/2) q0[69];
-rz(pi/2) q0[7];
-sx q0[7];
-rz(pi/2) q0[7];
-rz(pi/2) q0[70];
-sx q0[70];
-rz(pi/2) q0[70];
-rz(pi/2) q0[71];
-sx q0[71];
-rz(pi/2) q0[71];
-rz(pi/2) q0[72];
-sx q0[72];
-rz(pi/2) q0[72];
-rz(pi/2) q0[73];
-sx q0[73];
-rz(pi/2) q0[73];
-rz(pi/2) q0[74];
-sx q0[74];
-rz(pi/2) q0[74];
-rz(pi/2) q0[75];
-sx q0[75];
-rz(pi/2) q0[75];
-rz(pi/2) q0[76];
-sx q0[76];
-rz(pi/2) q0[76];
-rz(pi/2) q0[77];
-sx q0[77];
-rz(pi/2) q0[77];
-rz(pi/2) q0[78];
-sx q0[78];
-rz(pi/2) q0[78];
-rz(pi/2) q0[79];
-sx q0[79];
-rz(pi/2) q0[79];
-rz(pi/2) q0[8];
-sx q0[8];
-rz(pi/2) q0[8];
-rz(pi/2) q0[80];
-sx q0[80];
-rz(pi/2) q0[80];
-rz(pi/2) q0[81];
-sx q0[81];
-rz(pi/2) q0[81];
-rz(pi/2) q0[82];
-sx q0[82];
-rz(pi/2) q0[82];
-rz(pi/2) q0[83];
-sx q0[83];
-rz(pi/2) q0[83];
-rz(pi/2) q0[84];
-sx q0[84];
-rz(pi/2) q0[84];
-rz(pi/2) q0[85];
-sx q0[85];
-rz(pi/2) q0[85];
-rz(pi/2) q0[86];
-sx q0[86];
-rz(pi/2) q0[86];
-rz(pi/2) q0[87];
-sx q0[87];
-rz(pi/2) q0[87];
-rz(pi/2) q0[88];
-sx q0[88];
-rz(pi/2) q0[88];
-rz(pi/2) q0[89];
-sx q0[89];
-rz(pi/2) q0[89];
-rz(pi/2) q0[9];
-sx q0[9];
-rz(pi/2) q0[9];
-rz(pi/2) q0[90];
-sx q0[90];
-rz(pi/2) q0[90];
-rz(pi/2) q0[91];
-sx q0[91];
-rz(pi/2) q0[91];
-rz(pi/2) q0[92];
-sx q0[92];
-rz(pi/2) q0[92];
-rz(pi/2) q0[93];
-sx q0[93];
-rz(pi/2) q0[93];
-rz(pi/2) q0[94];
-sx q0[94];
-rz(pi/2) q0[94];
-rz(pi/2) q0[95];
-sx q0[95];
-rz(pi/2) q0[95];
-rz(pi/2) q0[96];
-sx q0[96];
-rz(pi/2) q0[96];
-rz(pi/2) q0[97];
-sx q0[97];
-rz(pi/2) q0[97];
-rz(pi/2) q0[98];
-sx q0[98];
-rz(pi/2) q0[98];
-rz(pi/2) q0[99];
-sx q0[99];
-rz(pi/2) q0[99];
-measure q0[0] -> c0[0];
-measure q0[1] -> c0[1];
-measure q0[2] -> c0[2];
-measure q0[3] -> c0[3];
-measure q0[4] -> c0[4];
-measure q0[5] -> c0[5];
-measure q0[6] -> c0[6];
-measure q0[7] -> c0[7];
-measure q0[8] -> c0[8];
-measure q0[9] -> c0[9];
-measure q0[10] -> c0[10];
-measure q0[11] -> c0[11];
-measure q0[12] -> c0[12];
-measure q0[13] -> c0[13];
-measure q0[14] -> c0[14];
-measure q0[15] -> c0[15];
-measure q0[16] -> c0[16];
-measure q0[17] -> c0[17];
-measure q0[18] -> c0[18];
-measure q0[19] -> c0[19];
-measure q0[20] -> c0[20];
-measure q0[21] -> c0[21];
-measure q0[22] -> c0[22];
-measure q0[23] -> c0[23];
-measure q0[24] -> c0[24];
-measure q0[25] -> c0[25];
-measure q0[26] -> c0[26];
-measure q0[27] -> c0[27];
-measure q0[28] -> c0[28];
-measure q0[29] -> c0[29];
-measure q0[30] -> c0[30];
-measure q0[31] -> c0[31];
-measure q0[32] -> c0[32];
-measure q0[33] -> c0[33];
-measure q0[34] -> c0[34];
-measure q0[35] -> c0[35];
-measure q0[36] -> c0[36];
-measure q0[37] -> c0[37];
-measure q0[38] -> c0[38];
-measure q0[39] -> c0[39];
-measure q0[40] -> c0[40];
-measure q0[41] -> c0[41];
-measure q0[42] -> c0[42];
-measure q0[43] -> c0[43];
-measure q0[44] -> c0[44];
-measure q0[45] -> c0[45];
-measure q0[46] -> c0[46];
-measure q0[47] -> c0[47];
-measure q0[48] -> c0[48];
-measure q0[49] -> c0[49];
-measure q0[50] -> c0[50];
-measure q0[51] -> c0[51];
-measure q0[52] -> c0[52];
-measure q0[53] -> c0[53];
-measure q0[54] -> c0[54];
-measure q0[55] -> c0[55];
-measure q0[56] -> c0[56];
-measure q0[57] -> c0[57];
-measure q0[58] -> c0[58];
-measure q0[59] -> c0[59];
-measure q0[60] -> c0[60];
-measure q0[61] -> c0[61];
-measure q0[62] -> c0[62];
-measure q0[63] -> c0[63];
-measure q0[64] -> c0[64];
-measure q0[65] -> c0[65];
-measure q0[66] -> c0[66];
-measure q0[67] -> c0[67];
-measure q0[68] -> c0[68];
-measure q0[69] -> c0[69];
-measure q0[70] -> c0[70];
-measure q0[71] -> c0[71];
-measure q0[72] -> c0[72];
-measure q0[73] -> c0[73];
-measure q0[74] -> c0[74];
-measure q0[75] -> c0[75];
-measure q0[76] -> c0[76];
-measure q0[77] -> c0[77];
-measure q0[78] -> c0[78];
-measure q0[79] -> c0[79];
-measure q0[80] -> c0[80];
-measure q0[81] -> c0[81];
-measure q0[82] -> c0[82];
-measure q0[83] -> c0[83];
-measure q0[84] -> c0[84];
-measure q0[85] -> c0[85];
-measure q0[86] -> c0[86];
-measure q0[87] -> c0[87];
-measure q0[88] -> c0[88];
-measure q0[89] -> c0[89];
-measure q0[90] -> c0[90];
-measure q0[91] -> c0[91];
-measure q0[92] -> c0[92];
-measure q0[93] -> c0[93];
-measure q0[94] -> c0[94];
-measure q0[95] -> c0[95];
-measure q0[96] -> c0[96];
-measure q0[97] -> c0[97];
-measure q0[98] -> c0[98];
-measure q0[99] -> c0[99];
-measure q0[100] -> c0[100];
-measure q0[101] -> c0[101];
-measure q0[102] -> c0[102];
-measure q0[103] -> c0[103];
-measure q0[104] -> c0[104];
-measure q0[105] -> c0[105];
-measure q0[106] -> c0[106];
-measure q0[107] -> c0[107];
-measure q0[108] -> c0[108];
-measure q0[109] -> c0[109];
-measure q0[110] -> c0[110];
-measure q0[111] -> c0[111];
-measure q0[112] -> c0[112];
-measure q0[113] -> c0[113];
-measure q0[114] -> c0[114];
-measure q0[115] -> c0[115];
-measure q0[116] -> c0[116];
-measure q0[117] -> c0[117];
-measure q0[118] -> c0[118];
-measure q0[119] -> c0[119];
-measure q0[120] -> c0[120];
-measure q0[121] -> c0[121];
-measure q0[122] -> c0[122];
-measure q0[123] -> c0[123];
-measure q0[124] -> c0[124];
-measure q0[125] -> c0[125];
-measure q0[126] -> c0[126];
-measure q0[127] -> c0[127];
-measure q0[128] -> c0[128];
-measure q0[129] -> c0[129];
-measure q0[130] -> c0[130];
-measure q0[131] -> c0[131];
-measure q0[132] -> c0[132];
-measure q0[133] -> c0[133];
-measure q0[134] -> c0[134];
-measure q0[135] -> c0[135];
-measure q0[136] -> c0[136];
-measure q0[137] -> c0[137];
-measure q0[138] -> c0[138];
-measure q0[139] -> c0[139];
-measure q0[140] -> c0[140];
-measure q0[141] -> c0[141];
-measure q0[142] -> c0[142];
-measure q0[143] -> c0[143];
-measure q0[144] -> c0[144];
-measure q0[145] -> c0[145];
-measure q0[146] -> c0[146];
-measure q0[147] -> c0[147];
-measure q0[148] -> c0[148];
-measure q0[149] -> c0[149];
-measure q0[150] -> c0[150];
-measure q0[151] -> c0[151];
-measure q0[152] -> c0[152];
-measure q0[153] -> c0[153];
-measure q0[154] -> c0[154];
-measure q0[155] -> c0[155];
-measure q0[156] -> c0[156];
-measure q0[157] -> c0[157];
-measure q0[158] -> c0[158];
-measure q0[159] -> c0[159];
-measure q0[160] -> c0[160];
-measure q0[161] -> c0[161];
-measure q0[162] -> c0[162];
-measure q0[163] -> c0[163];
-measure q0[164] -> c0[164];
-measure q0[165] -> c0[165];
-measure q0[166] -> c0[166];
-measure q0[167] -> c0[167];
-measure q0[168] -> c0[168];
-measure q0[169] -> c0[169];
-measure q0[170] -> c0[170];
-measure q0[171] -> c0[171];
-measure q0[172] -> c0[172];
-measure q0[173] -> c0[173];
-measure q0[174] -> c0[174];
-measure q0[175] -> c0[175];
-measure q0[176] -> c0[176];
-measure q0[177] -> c0[177];
-measure q0[178] -> c0[178];
-measure q0[179] -> c0[179];
-measure q0[180] -> c0[180];
-measure q0[181] -> c0[181];
-measure q0[182] -> c0[182];
-measure q0[183] -> c0[183];
-measure q0[184] -> c0[184];
-measure q0[185] -> c0[185];
-measure q0[186] -> c0[186];
-measure q0[187] -> c0[187];
-measure q0[188] -> c0[188];
-measure q0[189] -> c0[189];
-measure q0[190] -> c0[190];
-measure q0[191] -> c0[191];
-measure q0[192] -> c0[192];
-measure q0[193] -> c0[193];
-measure q0[194] -> c0[194];
-measure q0[195] -> c0[195];
-measure q0[196] -> c0[196];
-measure q0[197] -> c0[197];
-measure q0[198] -> c0[198];
-measure q0[199] -> c0[199];
-measure q0[200] -> c0[200];
-measure q0[201] -> c0[201];
-measure q0[202] -> c0[202];
-measure q0[203] -> c0[203];
-measure q0[204] -> c0[204];
-measure q0[205] -> c0[205];
-measure q0[206] -> c0[206];
-measure q0[207] -> c0[207];
-measure q0[208] -> c0[208];
-measure q0[209] -> c0[209];
-measure q0[210] -> c0[210];
-measure q0[211] -> c0[211];
-measure q0[212] -> c0[212];
-measure q0[213] -> c0[213];
-measure q0[214] -> c0[214];
-measure q0[215] -> c0[215];
-measure q0[216] -> c0[216];
-measure q0[217] -> c0[217];
-measure q0[218] -> c0[218];
-measure q0[219] -> c0[219];
-measure q0[220] -> c0[220];
-measure q0[221] -> c0[221];
-measure q0[222] -> c0[222];
-measure q0[223] -> c0[223];
-measure q0[224] -> c0[224];
-measure q0[225] -> c0[225];
-measure q0[226] -> c0[226];
-measure q0[227] -> c0[227];
-measure q0[228] -> c0[228];
-measure q0[229] -> c0[229];
-measure q0[230] -> c0[230];
-measure q0[231] -> c0[231];
-measure q0[232] -> c0[232];
-measure q0[233] -> c0[233];
-measure q0[234] -> c0[234];
-measure q0[235] -> c0[235];
-measure q0[236] -> c0[236];
-measure q0[237] -> c0[237];
-measure q0[238] -> c0[238];
-measure q0[239] -> c0[239];
-measure q0[240] -> c0[240];
-measure q0[241] -> c0[241];
-measure q0[242] -> c0[242];
-measure q0[243] -> c0[243];
-measure q0[244] -> c0[244];
-measure q0[245] -> c0[245];
-measure q0[246] -> c0[246];
-measure q0[247] -> c0[247];
-measure q0[248] -> c0[248];
-measure q0[249] -> c0[249];
-measure q0[250] -> c0[250];
-measure q0[251] -> c0[251];
-measure q0[252] -> c0[252];
-measure q0[253] -> c0[253];
-measure q0[254] -> c0[254];
-measure q0[255] -> c0[255];
-measure q0[256] -> c0[256];
-measure q0[257] -> c0[257];
-measure q0[258] -> c0[258];
-measure q0[259] -> c0[259];
-measure q0[260] -> c0[260];
-measure q0[261] -> c0[261];
-measure q0[262] -> c0[262];
-measure q0[263] -> c0[263];
-measure q0[264] -> c0[264];
-measure q0[265] -> c0[265];
-measure q0[266] -> c0[266];
-measure q0[267] -> c0[267];
-measure q0[268] -> c0[268];
-measure q0[269] -> c0[269];
-measure q0[270] -> c0[270];
-measure q0[271] -> c0[271];
-measure q0[272] -> c0[272];
-measure q0[273] -> c0[273];
-measure q0[274] -> c0[274];
-measure q0[275] -> c0[275];
-measure q0[276] -> c0[276];
-measure q0[277] -> c0[277];
-measure q0[278] -> c0[278];
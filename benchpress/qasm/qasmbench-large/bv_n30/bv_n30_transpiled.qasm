@@ -1,230 +0,0 @@
-OPENQASM 2.0;
-include "qelib1.inc";
-qreg q0[30];
-creg c0[30];
-rz(pi/2) q0[0];
-sx q0[0];
-rz(pi/2) q0[0];
-rz(pi/2) q0[1];
-sx q0[1];
-rz(pi/2) q0[1];
-rz(pi/2) q0[2];
-sx q0[2];
-rz(pi/2) q0[2];
-rz(pi/2) q0[3];
-sx q0[3];
-rz(pi/2) q0[3];
-rz(pi/2) q0[4];
-sx q0[4];
-rz(pi/2) q0[4];
-rz(pi/2) q0[5];
-sx q0[5];
-rz(pi/2) q0[5];
-rz(pi/2) q0[6];
-sx q0[6];
-rz(pi/2) q0[6];
-rz(pi/2) q0[7];
-sx q0[7];
-rz(pi/2) q0[7];
-rz(pi/2) q0[8];
-sx q0[8];
-rz(pi/2) q0[8];
-rz(pi/2) q0[9];
-sx q0[9];
-rz(pi/2) q0[9];
-rz(pi/2) q0[10];
-sx q0[10];
-rz(pi/2) q0[10];
-rz(pi/2) q0[11];
-sx q0[11];
-rz(pi/2) q0[11];
-rz(pi/2) q0[12];
-sx q0[12];
-rz(pi/2) q0[12];
-rz(pi/2) q0[13];
-sx q0[13];
-rz(pi/2) q0[13];
-rz(pi/2) q0[14];
-sx q0[14];
-rz(pi/2) q0[14];
-rz(pi/2) q0[15];
-sx q0[15];
-rz(pi/2) q0[15];
-rz(pi/2) q0[16];
-sx q0[16];
-rz(pi/2) q0[16];
-rz(pi/2) q0[17];
-sx q0[17];
-rz(pi/2) q0[17];
-rz(pi/2) q0[18];
-sx q0[18];
-rz(pi/2) q0[18];
-rz(pi/2) q0[19];
-sx q0[19];
-rz(pi/2) q0[19];
-rz(pi/2) q0[20];
-sx q0[20];
-rz(pi/2) q0[20];
-rz(pi/2) q0[21];
-sx q0[21];
-rz(pi/2) q0[21];
-rz(pi/2) q0[22];
-sx q0[22];
-rz(pi/2) q0[22];
-rz(pi/2) q0[23];
-sx q0[23];
-rz(pi/2) q0[23];
-rz(pi/2) q0[24];
-sx q0[24];
-rz(pi/2) q0[24];
-rz(pi/2) q0[25];
-sx q0[25];
-rz(pi/2) q0[25];
-rz(pi/2) q0[26];
-sx q0[26];
-rz(pi/2) q0[26];
-rz(pi/2) q0[27];
-sx q0[27];
-rz(pi/2) q0[27];
-rz(pi/2) q0[28];
-sx q0[28];
-rz(pi/2) q0[28];
-rz(pi/2) q0[29];
-sx q0[29];
-rz(-pi/2) q0[29];
-barrier q0[0],q0[1],q0[2],q0[3],q0[4],q0[5],q0[6],q0[7],q0[8],q0[9],q0[10],q0[11],q0[12],q0[13],q0[14],q0[15],q0[16],q0[17],q0[18],q0[19],q0[20],q0[21],q0[22],q0[23],q0[24],q0[25],q0[26],q0[27],q0[28],q0[29];
-cx q0[0],q0[29];
-cx q0[4],q0[29];
-cx q0[5],q0[29];
-cx q0[7],q0[29];
-cx q0[8],q0[29];
-cx q0[10],q0[29];
-cx q0[11],q0[29];
-cx q0[13],q0[29];
-cx q0[15],q0[29];
-cx q0[17],q0[29];
-cx q0[21],q0[29];
-cx q0[22],q0[29];
-cx q0[23],q0[29];
-cx q0[24],q0[29];
-cx q0[25],q0[29];
-cx q0[26],q0[29];
-cx q0[27],q0[29];
-cx q0[28],q0[29];
-barrier q0[0],q0[1],q0[2],q0[3],q0[4],q0[5],q0[6],q0[7],q0[8],q0[9],q0[10],q0[11],q0[12],q0[13],q0[14],q0[15],q0[16],q0[17],q0[18],q0[19],q0[20],q0[21],q0[22],q0[23],q0[24],q0[25],q0[26],q0[27],q0[28],q0[29];
-rz(pi/2) q0[0];
-sx q0[0];
-rz(pi/2) q0[0];
-rz(pi/2) q0[1];
-sx q0[1];
-rz(pi/2) q0[1];
-rz(pi/2) q0[10];
-sx q0[10];
-rz(pi/2) q0[10];
-rz(pi/2) q0[11];
-sx q0[11];
-rz(pi/2) q0[11];
-rz(pi/2) q0[12];
-sx q0[12];
-rz(pi/2) q0[12];
-rz(pi/2) q0[13];
-sx q0[13];
-rz(pi/2) q0[13];
-rz(pi/2) q0[14];
-sx q0[14];
-rz(pi/2) q0[14];
-rz(pi/2) q0[15];
-sx q0[15];
-rz(pi/2) q0[15];
-rz(pi/2) q0[16];
-sx q0[16];
-rz(pi/2) q0[16];
-rz(pi/2) q0[17];
-sx q0[17];
-rz(pi/2) q0[17];
-rz(pi/2) q0[18];
-sx q0[18];
-rz(pi/2) q0[18];
-rz(pi/2) q0[19];
-sx q0[19];
-rz(pi/2) q0[19];
-rz(pi/2) q0[2];
-sx q0[2];
-rz(pi/2) q0[2];
-rz(pi/2) q0[20];
-sx q0[20];
-rz(pi/2) q0[20];
-rz(pi/2) q0[21];
-sx q0[21];
-rz(pi/2) q0[21];
-rz(pi/2) q0[22];
-sx q0[22];
-rz(pi/2) q0[22];
-rz(pi/2) q0[23];
-sx q0[23];
-rz(pi/2) q0[23];
-rz(pi/2) q0[24];
-sx q0[24];
-rz(pi/2) q0[24];
-rz(pi/2) q0[25];
-sx q0[25];
-rz(pi/2) q0[25];
-rz(pi/2) q0[26];
-sx q0[26];
-rz(pi/2) q0[26];
-rz(pi/2) q0[27];
-sx q0[27];
-rz(pi/2) q0[27];
-rz(pi/2) q0[28];
-sx q0[28];
-rz(pi/2) q0[28];
-rz(pi/2) q0[3];
-sx q0[3];
-rz(pi/2) q0[3];
-rz(pi/2) q0[4];
-sx q0[4];
-rz(pi/2) q0[4];
-rz(pi/2) q0[5];
-sx q0[5];
-rz(pi/2) q0[5];
-rz(pi/2) q0[6];
-sx q0[6];
-rz(pi/2) q0[6];
-rz(pi/2) q0[7];
-sx q0[7];
-rz(pi/2) q0[7];
-rz(pi/2) q0[8];
-sx q0[8];
-rz(pi/2) q0[8];
-rz(pi/2) q0[9];
-sx q0[9];
-rz(pi/2) q0[9];
-measure q0[0] -> c0[0];
-measure q0[1] -> c0[1];
-measure q0[2] -> c0[2];
-measure q0[3] -> c0[3];
-measure q0[4] -> c0[4];
-measure q0[5] -> c0[5];
-measure q0[6] -> c0[6];
-measure q0[7] -> c0[7];
-measure q0[8] -> c0[8];
-measure q0[9] -> c0[9];
-measure q0[10] -> c0[10];
-measure q0[11] -> c0[11];
-measure q0[12] -> c0[12];
-measure q0[13] -> c0[13];
-measure q0[14] -> c0[14];
-measure q0[15] -> c0[15];
-measure q0[16] -> c0[16];
-measure q0[17] -> c0[17];
-measure q0[18] -> c0[18];
-measure q0[19] -> c0[19];
-measure q0[20] -> c0[20];
-measure q0[21] -> c0[21];
-measure q0[22] -> c0[22];
-measure q0[23] -> c0[23];
-measure q0[24] -> c0[24];
-measure q0[25] -> c0[25];
-measure q0[26] -> c0[26];
-measure q0[27] -> c0[27];
-measure q0[28] -> c0[28];
@@ -1,1662 +0,0 @@
-OPENQASM 2.0;
-include "qelib1.inc";
-qreg q0[151];
-creg c0[151];
-rz(pi/2) q0[0];
-sx q0[0];
-rz(pi/2) q0[0];
-rz(pi/2) q0[1];
-sx q0[1];
-rz(pi/2) q0[1];
-rz(pi/2) q0[2];
-sx q0[2];
-rz(pi/2) q0[2];
-rz(pi/2) q0[3];
-sx q0[3];
-rz(pi/2) q0[3];
-rz(pi/2) q0[4];
-sx q0[4];
-rz(pi/2) q0[4];
-rz(pi/2) q0[5];
-sx q0[5];
-rz(pi/2) q0[5];
-rz(pi/2) q0[6];
-sx q0[6];
-rz(pi/2) q0[6];
-rz(pi/2) q0[7];
-sx q0[7];
-rz(pi/2) q0[7];
-rz(pi/2) q0[8];
-sx q0[8];
-rz(pi/2) q0[8];
-rz(pi/2) q0[9];
-sx q0[9];
-rz(pi/2) q0[9];
-rz(pi/2) q0[10];
-sx q0[10];
-rz(pi/2) q0[10];
-rz(pi/2) q0[11];
-sx q0[11];
-rz(pi/2) q0[11];
-rz(pi/2) q0[12];
-sx q0[12];
-rz(pi/2) q0[12];
-rz(pi/2) q0[13];
-sx q0[13];
-rz(pi/2) q0[13];
-rz(pi/2) q0[14];
-sx q0[14];
-rz(pi/2) q0[14];
-rz(pi/2) q0[15];
-sx q0[15];
-rz(pi/2) q0[15];
-rz(pi/2) q0[16];
-sx q0[16];
-rz(pi/2) q0[16];
-rz(pi/2) q0[17];
-sx q0[17];
-rz(pi/2) q0[17];
-rz(pi/2) q0[18];
-sx q0[18];
-rz(pi/2) q0[18];
-rz(pi/2) q0[19];
-sx q0[19];
-rz(pi/2) q0[19];
-rz(pi/2) q0[20];
-sx q0[20];
-rz(pi/2) q0[20];
-rz(pi/2) q0[21];
-sx q0[21];
-rz(pi/2) q0[21];
-rz(pi/2) q0[22];
-sx q0[22];
-rz(pi/2) q0[22];
-rz(pi/2) q0[23];
-sx q0[23];
-rz(pi/2) q0[23];
-rz(pi/2) q0[24];
-sx q0[24];
-rz(pi/2) q0[24];
-rz(pi/2) q0[25];
-sx q0[25];
-rz(pi/2) q0[25];
-rz(pi/2) q0[26];
-sx q0[26];
-rz(pi/2) q0[26];
-rz(pi/2) q0[27];
-sx q0[27];
-rz(pi/2) q0[27];
-rz(pi/2) q0[28];
-sx q0[28];
-rz(pi/2) q0[28];
-rz(pi/2) q0[29];
-sx q0[29];
-rz(pi/2) q0[29];
-rz(pi/2) q0[30];
-sx q0[30];
-rz(pi/2) q0[30];
-rz(pi/2) q0[31];
-sx q0[31];
-rz(pi/2) q0[31];
-rz(pi/2) q0[32];
-sx q0[32];
-rz(pi/2) q0[32];
-rz(pi/2) q0[33];
-sx q0[33];
-rz(pi/2) q0[33];
-rz(pi/2) q0[34];
-sx q0[34];
-rz(pi/2) q0[34];
-rz(pi/2) q0[35];
-sx q0[35];
-rz(pi/2) q0[35];
-rz(pi/2) q0[36];
-sx q0[36];
-rz(pi/2) q0[36];
-rz(pi/2) q0[37];
-sx q0[37];
-rz(pi/2) q0[37];
-rz(pi/2) q0[38];
-sx q0[38];
-rz(pi/2) q0[38];
-rz(pi/2) q0[39];
-sx q0[39];
-rz(pi/2) q0[39];
-rz(pi/2) q0[40];
-sx q0[40];
-rz(pi/2) q0[40];
-rz(pi/2) q0[41];
-sx q0[41];
-rz(pi/2) q0[41];
-rz(pi/2) q0[42];
-sx q0[42];
-rz(pi/2) q0[42];
-rz(pi/2) q0[43];
-sx q0[43];
-rz(pi/2) q0[43];
-rz(pi/2) q0[44];
-sx q0[44];
-rz(pi/2) q0[44];
-rz(pi/2) q0[45];
-sx q0[45];
-rz(pi/2) q0[45];
-rz(pi/2) q0[46];
-sx q0[46];
-rz(pi/2) q0[46];
-rz(pi/2) q0[47];
-sx q0[47];
-rz(pi/2) q0[47];
-rz(pi/2) q0[48];
-sx q0[48];
-rz(pi/2) q0[48];
-rz(pi/2) q0[49];
-sx q0[49];
-rz(pi/2) q0[49];
-rz(pi/2) q0[50];
-sx q0[50];
-rz(pi/2) q0[50];
-rz(pi/2) q0[51];
-sx q0[51];
-rz(pi/2) q0[51];
-rz(pi/2) q0[52];
-sx q0[52];
-rz(pi/2) q0[52];
-rz(pi/2) q0[53];
-sx q0[53];
-rz(pi/2) q0[53];
-rz(pi/2) q0[54];
-sx q0[54];
-rz(pi/2) q0[54];
-rz(pi/2) q0[55];
-sx q0[55];
-rz(pi/2) q0[55];
-rz(pi/2) q0[56];
-sx q0[56];
-rz(pi/2) q0[56];
-rz(pi/2) q0[57];
-sx q0[57];
-rz(pi/2) q0[57];
-rz(pi/2) q0[58];
-sx q0[58];
-rz(pi/2) q0[58];
-rz(pi/2) q0[59];
-sx q0[59];
-rz(pi/2) q0[59];
-rz(pi/2) q0[60];
-sx q0[60];
-rz(pi/2) q0[60];
-rz(pi/2) q0[61];
-sx q0[61];
-rz(pi/2) q0[61];
-rz(pi/2) q0[62];
-sx q0[62];
-rz(pi/2) q0[62];
-rz(pi/2) q0[63];
-sx q0[63];
-rz(pi/2) q0[63];
-rz(pi/2) q0[64];
-sx q0[64];
-rz(pi/2) q0[64];
-rz(pi/2) q0[65];
-sx q0[65];
-rz(pi/2) q0[65];
-rz(pi/2) q0[66];
-sx q0[66];
-rz(pi/2) q0[66];
-rz(pi/2) q0[67];
-sx q0[67];
-rz(pi/2) q0[67];
-rz(pi/2) q0[68];
-sx q0[68];
-rz(pi/2) q0[68];
-rz(pi/2) q0[69];
-sx q0[69];
-rz(pi/2) q0[69];
-rz(pi/2) q0[70];
-sx q0[70];
-rz(pi/2) q0[70];
-rz(pi/2) q0[71];
-sx q0[71];
-rz(pi/2) q0[71];
-rz(pi/2) q0[72];
-sx q0[72];
-rz(pi/2) q0[72];
-rz(pi/2) q0[73];
-sx q0[73];
-rz(pi/2) q0[73];
-rz(pi/2) q0[74];
-sx q0[74];
-rz(pi/2) q0[74];
-rz(pi/2) q0[75];
-sx q0[75];
-rz(pi/2) q0[75];
-rz(pi/2) q0[76];
-sx q0[76];
-rz(pi/2) q0[76];
-rz(pi/2) q0[77];
-sx q0[77];
-rz(pi/2) q0[77];
-rz(pi/2) q0[78];
-sx q0[78];
-rz(pi/2) q0[78];
-rz(pi/2) q0[79];
-sx q0[79];
-rz(pi/2) q0[79];
-rz(pi/2) q0[80];
-sx q0[80];
-rz(pi/2) q0[80];
-rz(pi/2) q0[81];
-sx q0[81];
-rz(pi/2) q0[81];
-rz(pi/2) q0[82];
-sx q0[82];
-rz(pi/2) q0[82];
-rz(pi/2) q0[83];
-sx q0[83];
-rz(pi/2) q0[83];
-rz(pi/2) q0[84];
-sx q0[84];
-rz(pi/2) q0[84];
-rz(pi/2) q0[85];
-sx q0[85];
-rz(pi/2) q0[85];
-rz(pi/2) q0[86];
-sx q0[86];
-rz(pi/2) q0[86];
-rz(pi/2) q0[87];
-sx q0[87];
-rz(pi/2) q0[87];
-rz(pi/2) q0[88];
-sx q0[88];
-rz(pi/2) q0[88];
-rz(pi/2) q0[89];
-sx q0[89];
-rz(pi/2) q0[89];
-rz(pi/2) q0[90];
-sx q0[90];
-rz(pi/2) q0[90];
-rz(pi/2) q0[91];
-sx q0[91];
-rz(pi/2) q0[91];
-rz(pi/2) q0[92];
-sx q0[92];
-rz(pi/2) q0[92];
-rz(pi/2) q0[93];
-sx q0[93];
-rz(pi/2) q0[93];
-rz(pi/2) q0[94];
-sx q0[94];
-rz(pi/2) q0[94];
-rz(pi/2) q0[95];
-sx q0[95];
-rz(pi/2) q0[95];
-rz(pi/2) q0[96];
-sx q0[96];
-rz(pi/2) q0[96];
-rz(pi/2) q0[97];
-sx q0[97];
-rz(pi/2) q0[97];
-rz(pi/2) q0[98];
-sx q0[98];
-rz(pi/2) q0[98];
-rz(pi/2) q0[99];
-sx q0[99];
-rz(pi/2) q0[99];
-rz(pi/2) q0[100];
-sx q0[100];
-rz(pi/2) q0[100];
-rz(pi/2) q0[101];
-sx q0[101];
-rz(pi/2) q0[101];
-rz(pi/2) q0[102];
-sx q0[102];
-rz(pi/2) q0[102];
-rz(pi/2) q0[103];
-sx q0[103];
-rz(pi/2) q0[103];
-rz(pi/2) q0[104];
-sx q0[104];
-rz(pi/2) q0[104];
-rz(pi/2) q0[105];
-sx q0[105];
-rz(pi/2) q0[105];
-rz(pi/2) q0[106];
-sx q0[106];
-rz(pi/2) q0[106];
-rz(pi/2) q0[107];
-sx q0[107];
-rz(pi/2) q0[107];
-rz(pi/2) q0[108];
-sx q0[108];
-rz(pi/2) q0[108];
-rz(pi/2) q0[109];
-sx q0[109];
-rz(pi/2) q0[109];
-rz(pi/2) q0[110];
-sx q0[110];
-rz(pi/2) q0[110];
-rz(pi/2) q0[111];
-sx q0[111];
-rz(pi/2) q0[111];
-rz(pi/2) q0[112];
-sx q0[112];
-rz(pi/2) q0[112];
-rz(pi/2) q0[113];
-sx q0[113];
-rz(pi/2) q0[113];
-rz(pi/2) q0[114];
-sx q0[114];
-rz(pi/2) q0[114];
-rz(pi/2) q0[115];
-sx q0[115];
-rz(pi/2) q0[115];
-rz(pi/2) q0[116];
-sx q0[116];
-rz(pi/2) q0[116];
-rz(pi/2) q0[117];
-sx q0[117];
-rz(pi/2) q0[117];
-rz(pi/2) q0[118];
-sx q0[118];
-rz(pi/2) q0[118];
-rz(pi/2) q0[119];
-sx q0[119];
-rz(pi/2) q0[119];
-rz(pi/2) q0[120];
-sx q0[120];
-rz(pi/2) q0[120];
-rz(pi/2) q0[121];
-sx q0[121];
-rz(pi/2) q0[121];
-rz(pi/2) q0[122];
-sx q0[122];
-rz(pi/2) q0[122];
-rz(pi/2) q0[123];
-sx q0[123];
-rz(pi/2) q0[123];
-rz(pi/2) q0[124];
-sx q0[124];
-rz(pi/2) q0[124];
-rz(pi/2) q0[125];
-sx q0[125];
-rz(pi/2) q0[125];
-rz(pi/2) q0[126];
-sx q0[126];
-rz(pi/2) q0[126];
-rz(pi/2) q0[127];
-sx q0[127];
-rz(pi/2) q0[127];
-rz(pi/2) q0[128];
-sx q0[128];
-rz(pi/2) q0[128];
-rz(pi/2) q0[129];
-sx q0[129];
-rz(pi/2) q0[129];
-rz(pi/2) q0[130];
-sx q0[130];
-rz(pi/2) q0[130];
-rz(pi/2) q0[131];
-sx q0[131];
-rz(pi/2) q0[131];
-rz(pi/2) q0[132];
-sx q0[132];
-rz(pi/2) q0[132];
-rz(pi/2) q0[133];
-sx q0[133];
-rz(pi/2) q0[133];
-rz(pi/2) q0[134];
-sx q0[134];
-rz(pi/2) q0[134];
-rz(pi/2) q0[135];
-sx q0[135];
-rz(pi/2) q0[135];
-rz(pi/2) q0[136];
-sx q0[136];
-rz(pi/2) q0[136];
-rz(pi/2) q0[137];
-sx q0[137];
-rz(pi/2) q0[137];
-rz(pi/2) q0[138];
-sx q0[138];
-rz(pi/2) q0[138];
-rz(pi/2) q0[139];
-sx q0[139];
-rz(pi/2) q0[139];
-rz(pi/2) q0[140];
-sx q0[140];
-rz(pi/2) q0[140];
-rz(pi/2) q0[141];
-sx q0[141];
-rz(pi/2) q0[141];
-rz(pi/2) q0[142];
-sx q0[142];
-rz(pi/2) q0[142];
-rz(pi/2) q0[143];
-sx q0[143];
-rz(pi/2) q0[143];
-rz(pi/2) q0[144];
-sx q0[144];
-rz(pi/2) q0[144];
-rz(pi/2) q0[145];
-sx q0[145];
-rz(pi/2) q0[145];
-rz(pi/2) q0[146];
-sx q0[146];
-rz(pi/2) q0[146];
-rz(pi/2) q0[147];
-sx q0[147];
-rz(pi/2) q0[147];
-rz(pi/2) q0[148];
-sx q0[148];
-rz(pi/2) q0[148];
-rz(pi/2) q0[149];
-sx q0[149];
-rz(pi/2) q0[149];
-cx q0[0],q0[150];
-cx q0[1],q0[150];
-cx q0[2],q0[150];
-cx q0[3],q0[150];
-cx q0[4],q0[150];
-cx q0[5],q0[150];
-cx q0[6],q0[150];
-cx q0[7],q0[150];
-cx q0[8],q0[150];
-cx q0[9],q0[150];
-cx q0[10],q0[150];
-cx q0[11],q0[150];
-cx q0[12],q0[150];
-cx q0[13],q0[150];
-cx q0[14],q0[150];
-cx q0[15],q0[150];
-cx q0[16],q0[150];
-cx q0[17],q0[150];
-cx q0[18],q0[150];
-cx q0[19],q0[150];
-cx q0[20],q0[150];
-cx q0[21],q0[150];
-cx q0[22],q0[150];
-cx q0[23],q0[150];
-cx q0[24],q0[150];
-cx q0[25],q0[150];
-cx q0[26],q0[150];
-cx q0[27],q0[150];
-cx q0[28],q0[150];
-cx q0[29],q0[150];
-cx q0[30],q0[150];
-cx q0[31],q0[150];
-cx q0[32],q0[150];
-cx q0[33],q0[150];
-cx q0[34],q0[150];
-cx q0[35],q0[150];
-cx q0[36],q0[150];
-cx q0[37],q0[150];
-cx q0[38],q0[150];
-cx q0[39],q0[150];
-cx q0[40],q0[150];
-cx q0[41],q0[150];
-cx q0[42],q0[150];
-cx q0[43],q0[150];
-cx q0[44],q0[150];
-cx q0[45],q0[150];
-cx q0[46],q0[150];
-cx q0[47],q0[150];
-cx q0[48],q0[150];
-cx q0[49],q0[150];
-cx q0[50],q0[150];
-cx q0[51],q0[150];
-cx q0[52],q0[150];
-cx q0[53],q0[150];
-cx q0[54],q0[150];
-cx q0[55],q0[150];
-cx q0[56],q0[150];
-cx q0[57],q0[150];
-cx q0[58],q0[150];
-cx q0[59],q0[150];
-cx q0[60],q0[150];
-cx q0[61],q0[150];
-cx q0[62],q0[150];
-cx q0[63],q0[150];
-cx q0[64],q0[150];
-cx q0[65],q0[150];
-cx q0[66],q0[150];
-cx q0[67],q0[150];
-cx q0[68],q0[150];
-cx q0[69],q0[150];
-cx q0[70],q0[150];
-cx q0[71],q0[150];
-cx q0[72],q0[150];
-cx q0[73],q0[150];
-cx q0[74],q0[150];
-cx q0[75],q0[150];
-cx q0[76],q0[150];
-cx q0[77],q0[150];
-cx q0[78],q0[150];
-cx q0[79],q0[150];
-cx q0[80],q0[150];
-cx q0[81],q0[150];
-cx q0[82],q0[150];
-cx q0[83],q0[150];
-cx q0[84],q0[150];
-cx q0[85],q0[150];
-cx q0[86],q0[150];
-cx q0[87],q0[150];
-cx q0[88],q0[150];
-cx q0[89],q0[150];
-cx q0[90],q0[150];
-cx q0[91],q0[150];
-cx q0[92],q0[150];
-cx q0[93],q0[150];
-cx q0[94],q0[150];
-cx q0[95],q0[150];
-cx q0[96],q0[150];
-cx q0[97],q0[150];
-cx q0[98],q0[150];
-cx q0[99],q0[150];
-cx q0[100],q0[150];
-cx q0[101],q0[150];
-cx q0[102],q0[150];
-cx q0[103],q0[150];
-cx q0[104],q0[150];
-cx q0[105],q0[150];
-cx q0[106],q0[150];
-cx q0[107],q0[150];
-cx q0[108],q0[150];
-cx q0[109],q0[150];
-cx q0[110],q0[150];
-cx q0[111],q0[150];
-cx q0[112],q0[150];
-cx q0[113],q0[150];
-cx q0[114],q0[150];
-cx q0[115],q0[150];
-cx q0[116],q0[150];
-cx q0[117],q0[150];
-cx q0[118],q0[150];
-cx q0[119],q0[150];
-cx q0[120],q0[150];
-cx q0[121],q0[150];
-cx q0[122],q0[150];
-cx q0[123],q0[150];
-cx q0[124],q0[150];
-cx q0[125],q0[150];
-cx q0[126],q0[150];
-cx q0[127],q0[150];
-cx q0[128],q0[150];
-cx q0[129],q0[150];
-cx q0[130],q0[150];
-cx q0[131],q0[150];
-cx q0[132],q0[150];
-cx q0[133],q0[150];
-cx q0[134],q0[150];
-cx q0[135],q0[150];
-cx q0[136],q0[150];
-cx q0[137],q0[150];
-cx q0[138],q0[150];
-cx q0[139],q0[150];
-cx q0[140],q0[150];
-cx q0[141],q0[150];
-cx q0[142],q0[150];
-cx q0[143],q0[150];
-cx q0[144],q0[150];
-cx q0[145],q0[150];
-cx q0[146],q0[150];
-cx q0[147],q0[150];
-cx q0[148],q0[150];
-cx q0[149],q0[150];
-measure q0[150] -> c0[150];
-if(c0==0) x q0[150];
-if(c0==0) rz(pi/2) q0[150];
-if(c0==0) sx q0[150];
-if(c0==0) rz(pi/2) q0[150];
-if(c0==1427247692705959881058285969449495136382746624) rz(pi/2) q0[0];
-if(c0==1427247692705959881058285969449495136382746624) sx q0[0];
-if(c0==1427247692705959881058285969449495136382746624) rz(pi/2) q0[0];
-if(c0==1427247692705959881058285969449495136382746624) rz(pi/2) q0[1];
-if(c0==1427247692705959881058285969449495136382746624) sx q0[1];
-if(c0==1427247692705959881058285969449495136382746624) rz(pi/2) q0[1];
-if(c0==1427247692705959881058285969449495136382746624) rz(pi/2) q0[2];
-if(c0==1427247692705959881058285969449495136382746624) sx q0[2];
-if(c0==1427247692705959881058285969449495136382746624) rz(pi/2) q0[2];
-if(c0==1427247692705959881058285969449495136382746624) rz(pi/2) q0[3];
-if(c0==1427247692705959881058285969449495136382746624) sx q0[3];
-if(c0==1427247692705959881058285969449495136382746624) rz(pi/2) q0[3];
-if(c0==1427247692705959881058285969449495136382746624) rz(pi/2) q0[4];
-if(c0==1427247692705959881058285969449495136382746624) sx q0[4];
-if(c0==1427247692705959881058285969449495136382746624) rz(pi/2) q0[4];
-if(c0==1427247692705959881058285969449495136382746624) rz(pi/2) q0[5];
-if(c0==1427247692705959881058285969449495136382746624) sx q0[5];
-if(c0==1427247692705959881058285969449495136382746624) rz(pi/2) q0[5];
-if(c0==1427247692705959881058285969449495136382746624) rz(pi/2) q0[6];
-if(c0==1427247692705959881058285969449495136382746624) sx q0[6];
-if(c0==1427247692705959881058285969449495136382746624) rz(pi/2) q0[6];
-if(c0==1427247692705959881058285969449495136382746624) rz(pi/2) q0[7];
-if(c0==1427247692705959881058285969449495136382746624) sx q0[7];
-if(c0==1427247692705959881058285969449495136382746624) rz(pi/2) q0[7];
-if(c0==1427247692705959881058285969449495136382746624) rz(pi/2) q0[8];
-if(c0==1427247692705959881058285969449495136382746624) sx q0[8];
-if(c0==1427247692705959881058285969449495136382746624) rz(pi/2) q0[8];
-if(c0==1427247692705959881058285969449495136382746624) rz(pi/2) q0[9];
-if(c0==1427247692705959881058285969449495136382746624) sx q0[9];
-if(c0==1427247692705959881058285969449495136382746624) rz(pi/2) q0[9];
-if(c0==1427247692705959881058285969449495136382746624) rz(pi/2) q0[10];
-if(c0==1427247692705959881058285969449495136382746624) sx q0[10];
-if(c0==1427247692705959881058285969449495136382746624) rz(pi/2) q0[10];
-if(c0==1427247692705959881058285969449495136382746624) rz(pi/2) q0[11];
-if(c0==1427247692705959881058285969449495136382746624) sx q0[11];
-if(c0==1427247692705959881058285969449495136382746624) rz(pi/2) q0[11];
-if(c0==1427247692705959881058285969449495136382746624) rz(pi/2) q0[12];
-if(c0==1427247692705959881058285969449495136382746624) sx q0[12];
-if(c0==1427247692705959881058285969449495136382746624) rz(pi/2) q0[12];
-if(c0==1427247692705959881058285969449495136382746624) rz(pi/2) q0[13];
-if(c0==1427247692705959881058285969449495136382746624) sx q0[13];
-if(c0==1427247692705959881058285969449495136382746624) rz(pi/2) q0[13];
-if(c0==1427247692705959881058285969449495136382746624) rz(pi/2) q0[14];
-if(c0==1427247692705959881058285969449495136382746624) sx q0[14];
-if(c0==1427247692705959881058285969449495136382746624) rz(pi/2) q0[14];
-if(c0==1427247692705959881058285969449495136382746624) rz(pi/2) q0[15];
-if(c0==1427247692705959881058285969449495136382746624) sx q0[15];
-if(c0==1427247692705959881058285969449495136382746624) rz(pi/2) q0[15];
-if(c0==1427247692705959881058285969449495136382746624) rz(pi/2) q0[16];
-if(c0==1427247692705959881058285969449495136382746624) sx q0[16];
-if(c0==1427247692705959881058285969449495136382746624) rz(pi/2) q0[16];
-if(c0==1427247692705959881058285969449495136382746624) rz(pi/2) q0[17];
-if(c0==1427247692705959881058285969449495136382746624) sx q0[17];
-if(c0==1427247692705959881058285969449495136382746624) rz(pi/2) q0[17];
-if(c0==1427247692705959881058285969449495136382746624) rz(pi/2) q0[18];
-if(c0==1427247692705959881058285969449495136382746624) sx q0[18];
-if(c0==1427247692705959881058285969449495136382746624) rz(pi/2) q0[18];
-if(c0==1427247692705959881058285969449495136382746624) rz(pi/2) q0[19];
-if(c0==1427247692705959881058285969449495136382746624) sx q0[19];
-if(c0==1427247692705959881058285969449495136382746624) rz(pi/2) q0[19];
-if(c0==1427247692705959881058285969449495136382746624) rz(pi/2) q0[20];
-if(c0==1427247692705959881058285969449495136382746624) sx q0[20];
-if(c0==1427247692705959881058285969449495136382746624) rz(pi/2) q0[20];
-if(c0==1427247692705959881058285969449495136382746624) rz(pi/2) q0[21];
-if(c0==1427247692705959881058285969449495136382746624) sx q0[21];
-if(c0==1427247692705959881058285969449495136382746624) rz(pi/2) q0[21];
-if(c0==1427247692705959881058285969449495136382746624) rz(pi/2) q0[22];
-if(c0==1427247692705959881058285969449495136382746624) sx q0[22];
-if(c0==1427247692705959881058285969449495136382746624) rz(pi/2) q0[22];
-if(c0==1427247692705959881058285969449495136382746624) rz(pi/2) q0[23];
-if(c0==1427247692705959881058285969449495136382746624) sx q0[23];
-if(c0==1427247692705959881058285969449495136382746624) rz(pi/2) q0[23];
-if(c0==1427247692705959881058285969449495136382746624) rz(pi/2) q0[24];
-if(c0==1427247692705959881058285969449495136382746624) sx q0[24];
-if(c0==1427247692705959881058285969449495136382746624) rz(pi/2) q0[24];
-if(c0==1427247692705959881058285969449495136382746624) rz(pi/2) q0[25];
-if(c0==1427247692705959881058285969449495136382746624) sx q0[25];
-if(c0==1427247692705959881058285969449495136382746624) rz(pi/2) q0[25];
-if(c0==1427247692705959881058285969449495136382746624) rz(pi/2) q0[26];
-if(c0==1427247692705959881058285969449495136382746624) sx q0[26];
-if(c0==1427247692705959881058285969449495136382746624) rz(pi/2) q0[26];
-if(c0==1427247692705959881058285969449495136382746624) rz(pi/2) q0[27];
-if(c0==1427247692705959881058285969449495136382746624) sx q0[27];
-if(c0==1427247692705959881058285969449495136382746624) rz(pi/2) q0[27];
-if(c0==1427247692705959881058285969449495136382746624) rz(pi/2) q0[28];
-if(c0==1427247692705959881058285969449495136382746624) sx q0[28];
-if(c0==1427247692705959881058285969449495136382746624) rz(pi/2) q0[28];
-if(c0==1427247692705959881058285969449495136382746624) rz(pi/2) q0[29];
-if(c0==1427247692705959881058285969449495136382746624) sx q0[29];
-if(c0==1427247692705959881058285969449495136382746624) rz(pi/2) q0[29];
-if(c0==1427247692705959881058285969449495136382746624) rz(pi/2) q0[30];
-if(c0==1427247692705959881058285969449495136382746624) sx q0[30];
-if(c0==1427247692705959881058285969449495136382746624) rz(pi/2) q0[30];
-if(c0==1427247692705959881058285969449495136382746624) rz(pi/2) q0[31];
-if(c0==1427247692705959881058285969449495136382746624) sx q0[31];
-if(c0==1427247692705959881058285969449495136382746624) rz(pi/2) q0[31];
-if(c0==1427247692705959881058285969449495136382746624) rz(pi/2) q0[32];
-if(c0==1427247692705959881058285969449495136382746624) sx q0[32];
-if(c0==1427247692705959881058285969449495136382746624) rz(pi/2) q0[32];
-if(c0==1427247692705959881058285969449495136382746624) rz(pi/2) q0[33];
-if(c0==1427247692705959881058285969449495136382746624) sx q0[33];
-if(c0==1427247692705959881058285969449495136382746624) rz(pi/2) q0[33];
-if(c0==1427247692705959881058285969449495136382746624) rz(pi/2) q0[34];
-if(c0==1427247692705959881058285969449495136382746624) sx q0[34];
-if(c0==1427247692705959881058285969449495136382746624) rz(pi/2) q0[34];
-if(c0==1427247692705959881058285969449495136382746624) rz(pi/2) q0[35];
-if(c0==1427247692705959881058285969449495136382746624) sx q0[35];
-if(c0==1427247692705959881058285969449495136382746624) rz(pi/2) q0[35];
-if(c0==1427247692705959881058285969449495136382746624) rz(pi/2) q0[36];
-if(c0==1427247692705959881058285969449495136382746624) sx q0[36];
-if(c0==1427247692705959881058285969449495136382746624) rz(pi/2) q0[36];
-if(c0==1427247692705959881058285969449495136382746624) rz(pi/2) q0[37];
-if(c0==1427247692705959881058285969449495136382746624) sx q0[37];
-if(c0==1427247692705959881058285969449495136382746624) rz(pi/2) q0[37];
-if(c0==1427247692705959881058285969449495136382746624) rz(pi/2) q0[38];
-if(c0==1427247692705959881058285969449495136382746624) sx q0[38];
-if(c0==1427247692705959881058285969449495136382746624) rz(pi/2) q0[38];
-if(c0==1427247692705959881058285969449495136382746624) rz(pi/2) q0[39];
-if(c0==1427247692705959881058285969449495136382746624) sx q0[39];
-if(c0==1427247692705959881058285969449495136382746624) rz(pi/2) q0[39];
-if(c0==1427247692705959881058285969449495136382746624) rz(pi/2) q0[40];
-if(c0==1427247692705959881058285969449495136382746624) sx q0[40];
-if(c0==1427247692705959881058285969449495136382746624) rz(pi/2) q0[40];
-if(c0==1427247692705959881058285969449495136382746624) rz(pi/2) q0[41];
-if(c0==1427247692705959881058285969449495136382746624) sx q0[41];
-if(c0==1427247692705959881058285969449495136382746624) rz(pi/2) q0[41];
-if(c0==1427247692705959881058285969449495136382746624) rz(pi/2) q0[42];
-if(c0==1427247692705959881058285969449495136382746624) sx q0[42];
-if(c0==1427247692705959881058285969449495136382746624) rz(pi/2) q0[42];
-if(c0==1427247692705959881058285969449495136382746624) rz(pi/2) q0[43];
-if(c0==1427247692705959881058285969449495136382746624) sx q0[43];
-if(c0==1427247692705959881058285969449495136382746624) rz(pi/2) q0[43];
-if(c0==1427247692705959881058285969449495136382746624) rz(pi/2) q0[44];
-if(c0==1427247692705959881058285969449495136382746624) sx q0[44];
-if(c0==1427247692705959881058285969449495136382746624) rz(pi/2) q0[44];
-if(c0==1427247692705959881058285969449495136382746624) rz(pi/2) q0[45];
-if(c0==1427247692705959881058285969449495136382746624) sx q0[45];
-if(c0==1427247692705959881058285969449495136382746624) rz(pi/2) q0[45];
-if(c0==1427247692705959881058285969449495136382746624) rz(pi/2) q0[46];
-if(c0==1427247692705959881058285969449495136382746624) sx q0[46];
-if(c0==1427247692705959881058285969449495136382746624) rz(pi/2) q0[46];
-if(c0==1427247692705959881058285969449495136382746624) rz(pi/2) q0[47];
-if(c0==1427247692705959881058285969449495136382746624) sx q0[47];
-if(c0==1427247692705959881058285969449495136382746624) rz(pi/2) q0[47];
-if(c0==1427247692705959881058285969449495136382746624) rz(pi/2) q0[48];
-if(c0==1427247692705959881058285969449495136382746624) sx q0[48];
-if(c0==1427247692705959881058285969449495136382746624) rz(pi/2) q0[48];
-if(c0==1427247692705959881058285969449495136382746624) rz(pi/2) q0[49];
-if(c0==1427247692705959881058285969449495136382746624) sx q0[49];
-if(c0==1427247692705959881058285969449495136382746624) rz(pi/2) q0[49];
-if(c0==1427247692705959881058285969449495136382746624) rz(pi/2) q0[50];
-if(c0==1427247692705959881058285969449495136382746624) sx q0[50];
-if(c0==1427247692705959881058285969449495136382746624) rz(pi/2) q0[50];
-if(c0==1427247692705959881058285969449495136382746624) rz(pi/2) q0[51];
-if(c0==1427247692705959881058285969449495136382746624) sx q0[51];
-if(c0==1427247692705959881058285969449495136382746624) rz(pi/2) q0[51];
-if(c0==1427247692705959881058285969449495136382746624) rz(pi/2) q0[52];
-if(c0==1427247692705959881058285969449495136382746624) sx q0[52];
-if(c0==1427247692705959881058285969449495136382746624) rz(pi/2) q0[52];
-if(c0==1427247692705959881058285969449495136382746624) rz(pi/2) q0[53];
-if(c0==1427247692705959881058285969449495136382746624) sx q0[53];
-if(c0==1427247692705959881058285969449495136382746624) rz(pi/2) q0[53];
-if(c0==1427247692705959881058285969449495136382746624) rz(pi/2) q0[54];
-if(c0==1427247692705959881058285969449495136382746624) sx q0[54];
-if(c0==1427247692705959881058285969449495136382746624) rz(pi/2) q0[54];
-if(c0==1427247692705959881058285969449495136382746624) rz(pi/2) q0[55];
-if(c0==1427247692705959881058285969449495136382746624) sx q0[55];
-if(c0==1427247692705959881058285969449495136382746624) rz(pi/2) q0[55];
-if(c0==1427247692705959881058285969449495136382746624) rz(pi/2) q0[56];
-if(c0==1427247692705959881058285969449495136382746624) sx q0[56];
-if(c0==1427247692705959881058285969449495136382746624) rz(pi/2) q0[56];
-if(c0==1427247692705959881058285969449495136382746624) rz(pi/2) q0[57];
-if(c0==1427247692705959881058285969449495136382746624) sx q0[57];
-if(c0==1427247692705959881058285969449495136382746624) rz(pi/2) q0[57];
-if(c0==1427247692705959881058285969449495136382746624) rz(pi/2) q0[58];
-if(c0==1427247692705959881058285969449495136382746624) sx q0[58];
-if(c0==1427247692705959881058285969449495136382746624) rz(pi/2) q0[58];
-if(c0==1427247692705959881058285969449495136382746624) rz(pi/2) q0[59];
-if(c0==1427247692705959881058285969449495136382746624) sx q0[59];
-if(c0==1427247692705959881058285969449495136382746624) rz(pi/2) q0[59];
-if(c0==1427247692705959881058285969449495136382746624) rz(pi/2) q0[60];
-if(c0==1427247692705959881058285969449495136382746624) sx q0[60];
-if(c0==1427247692705959881058285969449495136382746624) rz(pi/2) q0[60];
-if(c0==1427247692705959881058285969449495136382746624) rz(pi/2) q0[61];
-if(c0==1427247692705959881058285969449495136382746624) sx q0[61];
-if(c0==1427247692705959881058285969449495136382746624) rz(pi/2) q0[61];
-if(c0==1427247692705959881058285969449495136382746624) rz(pi/2) q0[62];
-if(c0==1427247692705959881058285969449495136382746624) sx q0[62];
-if(c0==1427247692705959881058285969449495136382746624) rz(pi/2) q0[62];
-if(c0==1427247692705959881058285969449495136382746624) rz(pi/2) q0[63];
-if(c0==1427247692705959881058285969449495136382746624) sx q0[63];
-if(c0==1427247692705959881058285969449495136382746624) rz(pi/2) q0[63];
-if(c0==1427247692705959881058285969449495136382746624) rz(pi/2) q0[64];
-if(c0==1427247692705959881058285969449495136382746624) sx q0[64];
-if(c0==1427247692705959881058285969449495136382746624) rz(pi/2) q0[64];
-if(c0==1427247692705959881058285969449495136382746624) rz(pi/2) q0[65];
-if(c0==1427247692705959881058285969449495136382746624) sx q0[65];
-if(c0==1427247692705959881058285969449495136382746624) rz(pi/2) q0[65];
-if(c0==1427247692705959881058285969449495136382746624) rz(pi/2) q0[66];
-if(c0==1427247692705959881058285969449495136382746624) sx q0[66];
-if(c0==1427247692705959881058285969449495136382746624) rz(pi/2) q0[66];
-if(c0==1427247692705959881058285969449495136382746624) rz(pi/2) q0[67];
-if(c0==1427247692705959881058285969449495136382746624) sx q0[67];
-if(c0==1427247692705959881058285969449495136382746624) rz(pi/2) q0[67];
-if(c0==1427247692705959881058285969449495136382746624) rz(pi/2) q0[68];
-if(c0==1427247692705959881058285969449495136382746624) sx q0[68];
-if(c0==1427247692705959881058285969449495136382746624) rz(pi/2) q0[68];
-if(c0==1427247692705959881058285969449495136382746624) rz(pi/2) q0[69];
-if(c0==1427247692705959881058285969449495136382746624) sx q0[69];
-if(c0==1427247692705959881058285969449495136382746624) rz(pi/2) q0[69];
-if(c0==1427247692705959881058285969449495136382746624) rz(pi/2) q0[70];
-if(c0==1427247692705959881058285969449495136382746624) sx q0[70];
-if(c0==1427247692705959881058285969449495136382746624) rz(pi/2) q0[70];
-if(c0==1427247692705959881058285969449495136382746624) rz(pi/2) q0[71];
-if(c0==1427247692705959881058285969449495136382746624) sx q0[71];
-if(c0==1427247692705959881058285969449495136382746624) rz(pi/2) q0[71];
-if(c0==1427247692705959881058285969449495136382746624) rz(pi/2) q0[72];
-if(c0==1427247692705959881058285969449495136382746624) sx q0[72];
-if(c0==1427247692705959881058285969449495136382746624) rz(pi/2) q0[72];
-if(c0==1427247692705959881058285969449495136382746624) rz(pi/2) q0[73];
-if(c0==1427247692705959881058285969449495136382746624) sx q0[73];
-if(c0==1427247692705959881058285969449495136382746624) rz(pi/2) q0[73];
-if(c0==1427247692705959881058285969449495136382746624) rz(pi/2) q0[74];
-if(c0==1427247692705959881058285969449495136382746624) sx q0[74];
-if(c0==1427247692705959881058285969449495136382746624) rz(pi/2) q0[74];
-if(c0==1427247692705959881058285969449495136382746624) rz(pi/2) q0[75];
-if(c0==1427247692705959881058285969449495136382746624) sx q0[75];
-if(c0==1427247692705959881058285969449495136382746624) rz(pi/2) q0[75];
-if(c0==1427247692705959881058285969449495136382746624) rz(pi/2) q0[76];
-if(c0==1427247692705959881058285969449495136382746624) sx q0[76];
-if(c0==1427247692705959881058285969449495136382746624) rz(pi/2) q0[76];
-if(c0==1427247692705959881058285969449495136382746624) rz(pi/2) q0[77];
-if(c0==1427247692705959881058285969449495136382746624) sx q0[77];
-if(c0==1427247692705959881058285969449495136382746624) rz(pi/2) q0[77];
-if(c0==1427247692705959881058285969449495136382746624) rz(pi/2) q0[78];
-if(c0==1427247692705959881058285969449495136382746624) sx q0[78];
-if(c0==1427247692705959881058285969449495136382746624) rz(pi/2) q0[78];
-if(c0==1427247692705959881058285969449495136382746624) rz(pi/2) q0[79];
-if(c0==1427247692705959881058285969449495136382746624) sx q0[79];
-if(c0==1427247692705959881058285969449495136382746624) rz(pi/2) q0[79];
-if(c0==1427247692705959881058285969449495136382746624) rz(pi/2) q0[80];
-if(c0==1427247692705959881058285969449495136382746624) sx q0[80];
-if(c0==1427247692705959881058285969449495136382746624) rz(pi/2) q0[80];
-if(c0==1427247692705959881058285969449495136382746624) rz(pi/2) q0[81];
-if(c0==1427247692705959881058285969449495136382746624) sx q0[81];
-if(c0==1427247692705959881058285969449495136382746624) rz(pi/2) q0[81];
-if(c0==1427247692705959881058285969449495136382746624) rz(pi/2) q0[82];
-if(c0==1427247692705959881058285969449495136382746624) sx q0[82];
-if(c0==1427247692705959881058285969449495136382746624) rz(pi/2) q0[82];
-if(c0==1427247692705959881058285969449495136382746624) rz(pi/2) q0[83];
-if(c0==1427247692705959881058285969449495136382746624) sx q0[83];
-if(c0==1427247692705959881058285969449495136382746624) rz(pi/2) q0[83];
-if(c0==1427247692705959881058285969449495136382746624) rz(pi/2) q0[84];
-if(c0==1427247692705959881058285969449495136382746624) sx q0[84];
-if(c0==1427247692705959881058285969449495136382746624) rz(pi/2) q0[84];
-if(c0==1427247692705959881058285969449495136382746624) rz(pi/2) q0[85];
-if(c0==1427247692705959881058285969449495136382746624) sx q0[85];
-if(c0==1427247692705959881058285969449495136382746624) rz(pi/2) q0[85];
-if(c0==1427247692705959881058285969449495136382746624) rz(pi/2) q0[86];
-if(c0==1427247692705959881058285969449495136382746624) sx q0[86];
-if(c0==1427247692705959881058285969449495136382746624) rz(pi/2) q0[86];
-if(c0==1427247692705959881058285969449495136382746624) rz(pi/2) q0[87];
-if(c0==1427247692705959881058285969449495136382746624) sx q0[87];
-if(c0==1427247692705959881058285969449495136382746624) rz(pi/2) q0[87];
-if(c0==1427247692705959881058285969449495136382746624) rz(pi/2) q0[88];
-if(c0==1427247692705959881058285969449495136382746624) sx q0[88];
-if(c0==1427247692705959881058285969449495136382746624) rz(pi/2) q0[88];
-if(c0==1427247692705959881058285969449495136382746624) rz(pi/2) q0[89];
-if(c0==1427247692705959881058285969449495136382746624) sx q0[89];
-if(c0==1427247692705959881058285969449495136382746624) rz(pi/2) q0[89];
-if(c0==1427247692705959881058285969449495136382746624) rz(pi/2) q0[90];
-if(c0==1427247692705959881058285969449495136382746624) sx q0[90];
-if(c0==1427247692705959881058285969449495136382746624) rz(pi/2) q0[90];
-if(c0==1427247692705959881058285969449495136382746624) rz(pi/2) q0[91];
-if(c0==1427247692705959881058285969449495136382746624) sx q0[91];
-if(c0==1427247692705959881058285969449495136382746624) rz(pi/2) q0[91];
-if(c0==1427247692705959881058285969449495136382746624) rz(pi/2) q0[92];
-if(c0==1427247692705959881058285969449495136382746624) sx q0[92];
-if(c0==1427247692705959881058285969449495136382746624) rz(pi/2) q0[92];
-if(c0==1427247692705959881058285969449495136382746624) rz(pi/2) q0[93];
-if(c0==1427247692705959881058285969449495136382746624) sx q0[93];
-if(c0==1427247692705959881058285969449495136382746624) rz(pi/2) q0[93];
-if(c0==1427247692705959881058285969449495136382746624) rz(pi/2) q0[94];
-if(c0==1427247692705959881058285969449495136382746624) sx q0[94];
-if(c0==1427247692705959881058285969449495136382746624) rz(pi/2) q0[94];
-if(c0==1427247692705959881058285969449495136382746624) rz(pi/2) q0[95];
-if(c0==1427247692705959881058285969449495136382746624) sx q0[95];
-if(c0==1427247692705959881058285969449495136382746624) rz(pi/2) q0[95];
-if(c0==1427247692705959881058285969449495136382746624) rz(pi/2) q0[96];
-if(c0==1427247692705959881058285969449495136382746624) sx q0[96];
-if(c0==1427247692705959881058285969449495136382746624) rz(pi/2) q0[96];
-if(c0==1427247692705959881058285969449495136382746624) rz(pi/2) q0[97];
-if(c0==1427247692705959881058285969449495136382746624) sx q0[97];
-if(c0==1427247692705959881058285969449495136382746624) rz(pi/2) q0[97];
-if(c0==1427247692705959881058285969449495136382746624) rz(pi/2) q0[98];
-if(c0==1427247692705959881058285969449495136382746624) sx q0[98];
-if(c0==1427247692705959881058285969449495136382746624) rz(pi/2) q0[98];
-if(c0==1427247692705959881058285969449495136382746624) rz(pi/2) q0[99];
-if(c0==1427247692705959881058285969449495136382746624) sx q0[99];
-if(c0==1427247692705959881058285969449495136382746624) rz(pi/2) q0[99];
-if(c0==1427247692705959881058285969449495136382746624) rz(pi/2) q0[100];
-if(c0==1427247692705959881058285969449495136382746624) sx q0[100];
-if(c0==1427247692705959881058285969449495136382746624) rz(pi/2) q0[100];
-if(c0==1427247692705959881058285969449495136382746624) rz(pi/2) q0[101];
-if(c0==1427247692705959881058285969449495136382746624) sx q0[101];
-if(c0==1427247692705959881058285969449495136382746624) rz(pi/2) q0[101];
-if(c0==1427247692705959881058285969449495136382746624) rz(pi/2) q0[102];
-if(c0==1427247692705959881058285969449495136382746624) sx q0[102];
-if(c0==1427247692705959881058285969449495136382746624) rz(pi/2) q0[102];
-if(c0==1427247692705959881058285969449495136382746624) rz(pi/2) q0[103];
-if(c0==1427247692705959881058285969449495136382746624) sx q0[103];
-if(c0==1427247692705959881058285969449495136382746624) rz(pi/2) q0[103];
-if(c0==1427247692705959881058285969449495136382746624) rz(pi/2) q0[104];
-if(c0==1427247692705959881058285969449495136382746624) sx q0[104];
-if(c0==1427247692705959881058285969449495136382746624) rz(pi/2) q0[104];
-if(c0==1427247692705959881058285969449495136382746624) rz(pi/2) q0[105];
-if(c0==1427247692705959881058285969449495136382746624) sx q0[105];
-if(c0==1427247692705959881058285969449495136382746624) rz(pi/2) q0[105];
-if(c0==1427247692705959881058285969449495136382746624) rz(pi/2) q0[106];
-if(c0==1427247692705959881058285969449495136382746624) sx q0[106];
-if(c0==1427247692705959881058285969449495136382746624) rz(pi/2) q0[106];
-if(c0==1427247692705959881058285969449495136382746624) rz(pi/2) q0[107];
-if(c0==1427247692705959881058285969449495136382746624) sx q0[107];
-if(c0==1427247692705959881058285969449495136382746624) rz(pi/2) q0[107];
-if(c0==1427247692705959881058285969449495136382746624) rz(pi/2) q0[108];
-if(c0==1427247692705959881058285969449495136382746624) sx q0[108];
-if(c0==1427247692705959881058285969449495136382746624) rz(pi/2) q0[108];
-if(c0==1427247692705959881058285969449495136382746624) rz(pi/2) q0[109];
-if(c0==1427247692705959881058285969449495136382746624) sx q0[109];
-if(c0==1427247692705959881058285969449495136382746624) rz(pi/2) q0[109];
-if(c0==1427247692705959881058285969449495136382746624) rz(pi/2) q0[110];
-if(c0==1427247692705959881058285969449495136382746624) sx q0[110];
-if(c0==1427247692705959881058285969449495136382746624) rz(pi/2) q0[110];
-if(c0==1427247692705959881058285969449495136382746624) rz(pi/2) q0[111];
-if(c0==1427247692705959881058285969449495136382746624) sx q0[111];
-if(c0==1427247692705959881058285969449495136382746624) rz(pi/2) q0[111];
-if(c0==1427247692705959881058285969449495136382746624) rz(pi/2) q0[112];
-if(c0==1427247692705959881058285969449495136382746624) sx q0[112];
-if(c0==1427247692705959881058285969449495136382746624) rz(pi/2) q0[112];
-if(c0==1427247692705959881058285969449495136382746624) rz(pi/2) q0[113];
-if(c0==1427247692705959881058285969449495136382746624) sx q0[113];
-if(c0==1427247692705959881058285969449495136382746624) rz(pi/2) q0[113];
-if(c0==1427247692705959881058285969449495136382746624) rz(pi/2) q0[114];
-if(c0==1427247692705959881058285969449495136382746624) sx q0[114];
-if(c0==1427247692705959881058285969449495136382746624) rz(pi/2) q0[114];
-if(c0==1427247692705959881058285969449495136382746624) rz(pi/2) q0[115];
-if(c0==1427247692705959881058285969449495136382746624) sx q0[115];
-if(c0==1427247692705959881058285969449495136382746624) rz(pi/2) q0[115];
-if(c0==1427247692705959881058285969449495136382746624) rz(pi/2) q0[116];
-if(c0==1427247692705959881058285969449495136382746624) sx q0[116];
-if(c0==1427247692705959881058285969449495136382746624) rz(pi/2) q0[116];
-if(c0==1427247692705959881058285969449495136382746624) rz(pi/2) q0[117];
-if(c0==1427247692705959881058285969449495136382746624) sx q0[117];
-if(c0==1427247692705959881058285969449495136382746624) rz(pi/2) q0[117];
-if(c0==1427247692705959881058285969449495136382746624) rz(pi/2) q0[118];
-if(c0==1427247692705959881058285969449495136382746624) sx q0[118];
-if(c0==1427247692705959881058285969449495136382746624) rz(pi/2) q0[118];
-if(c0==1427247692705959881058285969449495136382746624) rz(pi/2) q0[119];
-if(c0==1427247692705959881058285969449495136382746624) sx q0[119];
-if(c0==1427247692705959881058285969449495136382746624) rz(pi/2) q0[119];
-if(c0==1427247692705959881058285969449495136382746624) rz(pi/2) q0[120];
-if(c0==1427247692705959881058285969449495136382746624) sx q0[120];
-if(c0==1427247692705959881058285969449495136382746624) rz(pi/2) q0[120];
-if(c0==1427247692705959881058285969449495136382746624) rz(pi/2) q0[121];
-if(c0==1427247692705959881058285969449495136382746624) sx q0[121];
-if(c0==1427247692705959881058285969449495136382746624) rz(pi/2) q0[121];
-if(c0==1427247692705959881058285969449495136382746624) rz(pi/2) q0[122];
-if(c0==1427247692705959881058285969449495136382746624) sx q0[122];
-if(c0==1427247692705959881058285969449495136382746624) rz(pi/2) q0[122];
-if(c0==1427247692705959881058285969449495136382746624) rz(pi/2) q0[123];
-if(c0==1427247692705959881058285969449495136382746624) sx q0[123];
-if(c0==1427247692705959881058285969449495136382746624) rz(pi/2) q0[123];
-if(c0==1427247692705959881058285969449495136382746624) rz(pi/2) q0[124];
-if(c0==1427247692705959881058285969449495136382746624) sx q0[124];
-if(c0==1427247692705959881058285969449495136382746624) rz(pi/2) q0[124];
-if(c0==1427247692705959881058285969449495136382746624) rz(pi/2) q0[125];
-if(c0==1427247692705959881058285969449495136382746624) sx q0[125];
-if(c0==1427247692705959881058285969449495136382746624) rz(pi/2) q0[125];
-if(c0==1427247692705959881058285969449495136382746624) rz(pi/2) q0[126];
-if(c0==1427247692705959881058285969449495136382746624) sx q0[126];
-if(c0==1427247692705959881058285969449495136382746624) rz(pi/2) q0[126];
-if(c0==1427247692705959881058285969449495136382746624) rz(pi/2) q0[127];
-if(c0==1427247692705959881058285969449495136382746624) sx q0[127];
-if(c0==1427247692705959881058285969449495136382746624) rz(pi/2) q0[127];
-if(c0==1427247692705959881058285969449495136382746624) rz(pi/2) q0[128];
-if(c0==1427247692705959881058285969449495136382746624) sx q0[128];
-if(c0==1427247692705959881058285969449495136382746624) rz(pi/2) q0[128];
-if(c0==1427247692705959881058285969449495136382746624) rz(pi/2) q0[129];
-if(c0==1427247692705959881058285969449495136382746624) sx q0[129];
-if(c0==1427247692705959881058285969449495136382746624) rz(pi/2) q0[129];
-if(c0==1427247692705959881058285969449495136382746624) rz(pi/2) q0[130];
-if(c0==1427247692705959881058285969449495136382746624) sx q0[130];
-if(c0==1427247692705959881058285969449495136382746624) rz(pi/2) q0[130];
-if(c0==1427247692705959881058285969449495136382746624) rz(pi/2) q0[131];
-if(c0==1427247692705959881058285969449495136382746624) sx q0[131];
-if(c0==1427247692705959881058285969449495136382746624) rz(pi/2) q0[131];
-if(c0==1427247692705959881058285969449495136382746624) rz(pi/2) q0[132];
-if(c0==1427247692705959881058285969449495136382746624) sx q0[132];
-if(c0==1427247692705959881058285969449495136382746624) rz(pi/2) q0[132];
-if(c0==1427247692705959881058285969449495136382746624) rz(pi/2) q0[133];
-if(c0==1427247692705959881058285969449495136382746624) sx q0[133];
-if(c0==1427247692705959881058285969449495136382746624) rz(pi/2) q0[133];
-if(c0==1427247692705959881058285969449495136382746624) rz(pi/2) q0[134];
-if(c0==1427247692705959881058285969449495136382746624) sx q0[134];
-if(c0==1427247692705959881058285969449495136382746624) rz(pi/2) q0[134];
-if(c0==1427247692705959881058285969449495136382746624) rz(pi/2) q0[135];
-if(c0==1427247692705959881058285969449495136382746624) sx q0[135];
-if(c0==1427247692705959881058285969449495136382746624) rz(pi/2) q0[135];
-if(c0==1427247692705959881058285969449495136382746624) rz(pi/2) q0[136];
-if(c0==1427247692705959881058285969449495136382746624) sx q0[136];
-if(c0==1427247692705959881058285969449495136382746624) rz(pi/2) q0[136];
-if(c0==1427247692705959881058285969449495136382746624) rz(pi/2) q0[137];
-if(c0==1427247692705959881058285969449495136382746624) sx q0[137];
-if(c0==1427247692705959881058285969449495136382746624) rz(pi/2) q0[137];
-if(c0==1427247692705959881058285969449495136382746624) rz(pi/2) q0[138];
-if(c0==1427247692705959881058285969449495136382746624) sx q0[138];
-if(c0==1427247692705959881058285969449495136382746624) rz(pi/2) q0[138];
-if(c0==1427247692705959881058285969449495136382746624) rz(pi/2) q0[139];
-if(c0==1427247692705959881058285969449495136382746624) sx q0[139];
-if(c0==1427247692705959881058285969449495136382746624) rz(pi/2) q0[139];
-if(c0==1427247692705959881058285969449495136382746624) rz(pi/2) q0[140];
-if(c0==1427247692705959881058285969449495136382746624) sx q0[140];
-if(c0==1427247692705959881058285969449495136382746624) rz(pi/2) q0[140];
-if(c0==1427247692705959881058285969449495136382746624) rz(pi/2) q0[141];
-if(c0==1427247692705959881058285969449495136382746624) sx q0[141];
-if(c0==1427247692705959881058285969449495136382746624) rz(pi/2) q0[141];
-if(c0==1427247692705959881058285969449495136382746624) rz(pi/2) q0[142];
-if(c0==1427247692705959881058285969449495136382746624) sx q0[142];
-if(c0==1427247692705959881058285969449495136382746624) rz(pi/2) q0[142];
-if(c0==1427247692705959881058285969449495136382746624) rz(pi/2) q0[143];
-if(c0==1427247692705959881058285969449495136382746624) sx q0[143];
-if(c0==1427247692705959881058285969449495136382746624) rz(pi/2) q0[143];
-if(c0==1427247692705959881058285969449495136382746624) rz(pi/2) q0[144];
-if(c0==1427247692705959881058285969449495136382746624) sx q0[144];
-if(c0==1427247692705959881058285969449495136382746624) rz(pi/2) q0[144];
-if(c0==1427247692705959881058285969449495136382746624) rz(pi/2) q0[145];
-if(c0==1427247692705959881058285969449495136382746624) sx q0[145];
-if(c0==1427247692705959881058285969449495136382746624) rz(pi/2) q0[145];
-if(c0==1427247692705959881058285969449495136382746624) rz(pi/2) q0[146];
-if(c0==1427247692705959881058285969449495136382746624) sx q0[146];
-if(c0==1427247692705959881058285969449495136382746624) rz(pi/2) q0[146];
-if(c0==1427247692705959881058285969449495136382746624) rz(pi/2) q0[147];
-if(c0==1427247692705959881058285969449495136382746624) sx q0[147];
-if(c0==1427247692705959881058285969449495136382746624) rz(pi/2) q0[147];
-if(c0==1427247692705959881058285969449495136382746624) rz(pi/2) q0[148];
-if(c0==1427247692705959881058285969449495136382746624) sx q0[148];
-if(c0==1427247692705959881058285969449495136382746624) rz(pi/2) q0[148];
-if(c0==1427247692705959881058285969449495136382746624) rz(pi/2) q0[149];
-if(c0==1427247692705959881058285969449495136382746624) sx q0[149];
-if(c0==1427247692705959881058285969449495136382746624) rz(pi/2) q0[149];
-barrier q0[0],q0[1],q0[2],q0[3],q0[4],q0[5],q0[6],q0[7],q0[8],q0[9],q0[10],q0[11],q0[12],q0[13],q0[14],q0[15],q0[16],q0[17],q0[18],q0[19],q0[20],q0[21],q0[22],q0[23],q0[24],q0[25],q0[26],q0[27],q0[28],q0[29],q0[30],q0[31],q0[32],q0[33],q0[34],q0[35],q0[36],q0[37],q0[38],q0[39],q0[40],q0[41],q0[42],q0[43],q0[44],q0[45],q0[46],q0[47],q0[48],q0[49],q0[50],q0[51],q0[52],q0[53],q0[54],q0[55],q0[56],q0[57],q0[58],q0[59],q0[60],q0[61],q0[62],q0[63],q0[64],q0[65],q0[66],q0[67],q0[68],q0[69],q0[70],q0[71],q0[72],q0[73],q0[74],q0[75],q0[76],q0[77],q0[78],q0[79],q0[80],q0[81],q0[82],q0[83],q0[84],q0[85],q0[86],q0[87],q0[88],q0[89],q0[90],q0[91],q0[92],q0[93],q0[94],q0[95],q0[96],q0[97],q0[98],q0[99],q0[100],q0[101],q0[102],q0[103],q0[104],q0[105],q0[106],q0[107],q0[108],q0[109],q0[110],q0[111],q0[112],q0[113],q0[114],q0[115],q0[116],q0[117],q0[118],q0[119],q0[120],q0[121],q0[122],q0[123],q0[124],q0[125],q0[126],q0[127],q0[128],q0[129],q0[130],q0[131],q0[132],q0[133],q0[134],q0[135],q0[136],q0[137],q0[138],q0[139],q0[140],q0[141],q0[142],q0[143],q0[144],q0[145],q0[146],q0[147],q0[148],q0[149],q0[150];
-if(c0==0) cx q0[49],q0[150];
-barrier q0[0],q0[1],q0[2],q0[3],q0[4],q0[5],q0[6],q0[7],q0[8],q0[9],q0[10],q0[11],q0[12],q0[13],q0[14],q0[15],q0[16],q0[17],q0[18],q0[19],q0[20],q0[21],q0[22],q0[23],q0[24],q0[25],q0[26],q0[27],q0[28],q0[29],q0[30],q0[31],q0[32],q0[33],q0[34],q0[35],q0[36],q0[37],q0[38],q0[39],q0[40],q0[41],q0[42],q0[43],q0[44],q0[45],q0[46],q0[47],q0[48],q0[49],q0[50],q0[51],q0[52],q0[53],q0[54],q0[55],q0[56],q0[57],q0[58],q0[59],q0[60],q0[61],q0[62],q0[63],q0[64],q0[65],q0[66],q0[67],q0[68],q0[69],q0[70],q0[71],q0[72],q0[73],q0[74],q0[75],q0[76],q0[77],q0[78],q0[79],q0[80],q0[81],q0[82],q0[83],q0[84],q0[85],q0[86],q0[87],q0[88],q0[89],q0[90],q0[91],q0[92],q0[93],q0[94],q0[95],q0[96],q0[97],q0[98],q0[99],q0[100],q0[101],q0[102],q0[103],q0[104],q0[105],q0[106],q0[107],q0[108],q0[109],q0[110],q0[111],q0[112],q0[113],q0[114],q0[115],q0[116],q0[117],q0[118],q0[119],q0[120],q0[121],q0[122],q0[123],q0[124],q0[125],q0[126],q0[127],q0[128],q0[129],q0[130],q0[131],q0[132],q0[133],q0[134],q0[135],q0[136],q0[137],q0[138],q0[139],q0[140],q0[141],q0[142],q0[143],q0[144],q0[145],q0[146],q0[147],q0[148],q0[149],q0[150];
-if(c0==0) rz(pi/2) q0[0];
-if(c0==0) sx q0[0];
-if(c0==0) rz(pi/2) q0[0];
-if(c0==0) rz(pi/2) q0[1];
-if(c0==0) sx q0[1];
-if(c0==0) rz(pi/2) q0[1];
-if(c0==0) rz(pi/2) q0[2];
-if(c0==0) sx q0[2];
-if(c0==0) rz(pi/2) q0[2];
-if(c0==0) rz(pi/2) q0[3];
-if(c0==0) sx q0[3];
-if(c0==0) rz(pi/2) q0[3];
-if(c0==0) rz(pi/2) q0[4];
-if(c0==0) sx q0[4];
-if(c0==0) rz(pi/2) q0[4];
-if(c0==0) rz(pi/2) q0[5];
-if(c0==0) sx q0[5];
-if(c0==0) rz(pi/2) q0[5];
-if(c0==0) rz(pi/2) q0[6];
-if(c0==0) sx q0[6];
-if(c0==0) rz(pi/2) q0[6];
-if(c0==0) rz(pi/2) q0[7];
-if(c0==0) sx q0[7];
-if(c0==0) rz(pi/2) q0[7];
-if(c0==0) rz(pi/2) q0[8];
-if(c0==0) sx q0[8];
-if(c0==0) rz(pi/2) q0[8];
-if(c0==0) rz(pi/2) q0[9];
-if(c0==0) sx q0[9];
-if(c0==0) rz(pi/2) q0[9];
-if(c0==0) rz(pi/2) q0[10];
-if(c0==0) sx q0[10];
-if(c0==0) rz(pi/2) q0[10];
-if(c0==0) rz(pi/2) q0[11];
-if(c0==0) sx q0[11];
-if(c0==0) rz(pi/2) q0[11];
-if(c0==0) rz(pi/2) q0[12];
-if(c0==0) sx q0[12];
-if(c0==0) rz(pi/2) q0[12];
-if(c0==0) rz(pi/2) q0[13];
-if(c0==0) sx q0[13];
-if(c0==0) rz(pi/2) q0[13];
-if(c0==0) rz(pi/2) q0[14];
-if(c0==0) sx q0[14];
-if(c0==0) rz(pi/2) q0[14];
-if(c0==0) rz(pi/2) q0[15];
-if(c0==0) sx q0[15];
-if(c0==0) rz(pi/2) q0[15];
-if(c0==0) rz(pi/2) q0[16];
-if(c0==0) sx q0[16];
-if(c0==0) rz(pi/2) q0[16];
-if(c0==0) rz(pi/2) q0[17];
-if(c0==0) sx q0[17];
-if(c0==0) rz(pi/2) q0[17];
-if(c0==0) rz(pi/2) q0[18];
-if(c0==0) sx q0[18];
-if(c0==0) rz(pi/2) q0[18];
-if(c0==0) rz(pi/2) q0[19];
-if(c0==0) sx q0[19];
-if(c0==0) rz(pi/2) q0[19];
-if(c0==0) rz(pi/2) q0[20];
-if(c0==0) sx q0[20];
-if(c0==0) rz(pi/2) q0[20];
-if(c0==0) rz(pi/2) q0[21];
-if(c0==0) sx q0[21];
-if(c0==0) rz(pi/2) q0[21];
-if(c0==0) rz(pi/2) q0[22];
-if(c0==0) sx q0[22];
-if(c0==0) rz(pi/2) q0[22];
-if(c0==0) rz(pi/2) q0[23];
-if(c0==0) sx q0[23];
-if(c0==0) rz(pi/2) q0[23];
-if(c0==0) rz(pi/2) q0[24];
-if(c0==0) sx q0[24];
-if(c0==0) rz(pi/2) q0[24];
-if(c0==0) rz(pi/2) q0[25];
-if(c0==0) sx q0[25];
-if(c0==0) rz(pi/2) q0[25];
-if(c0==0) rz(pi/2) q0[26];
-if(c0==0) sx q0[26];
-if(c0==0) rz(pi/2) q0[26];
-if(c0==0) rz(pi/2) q0[27];
-if(c0==0) sx q0[27];
-if(c0==0) rz(pi/2) q0[27];
-if(c0==0) rz(pi/2) q0[28];
-if(c0==0) sx q0[28];
-if(c0==0) rz(pi/2) q0[28];
-if(c0==0) rz(pi/2) q0[29];
-if(c0==0) sx q0[29];
-if(c0==0) rz(pi/2) q0[29];
-if(c0==0) rz(pi/2) q0[30];
-if(c0==0) sx q0[30];
-if(c0==0) rz(pi/2) q0[30];
-if(c0==0) rz(pi/2) q0[31];
-if(c0==0) sx q0[31];
-if(c0==0) rz(pi/2) q0[31];
-if(c0==0) rz(pi/2) q0[32];
-if(c0==0) sx q0[32];
-if(c0==0) rz(pi/2) q0[32];
-if(c0==0) rz(pi/2) q0[33];
-if(c0==0) sx q0[33];
-if(c0==0) rz(pi/2) q0[33];
-if(c0==0) rz(pi/2) q0[34];
-if(c0==0) sx q0[34];
-if(c0==0) rz(pi/2) q0[34];
-if(c0==0) rz(pi/2) q0[35];
-if(c0==0) sx q0[35];
-if(c0==0) rz(pi/2) q0[35];
-if(c0==0) rz(pi/2) q0[36];
-if(c0==0) sx q0[36];
-if(c0==0) rz(pi/2) q0[36];
-if(c0==0) rz(pi/2) q0[37];
-if(c0==0) sx q0[37];
-if(c0==0) rz(pi/2) q0[37];
-if(c0==0) rz(pi/2) q0[38];
-if(c0==0) sx q0[38];
-if(c0==0) rz(pi/2) q0[38];
-if(c0==0) rz(pi/2) q0[39];
-if(c0==0) sx q0[39];
-if(c0==0) rz(pi/2) q0[39];
-if(c0==0) rz(pi/2) q0[40];
-if(c0==0) sx q0[40];
-if(c0==0) rz(pi/2) q0[40];
-if(c0==0) rz(pi/2) q0[41];
-if(c0==0) sx q0[41];
-if(c0==0) rz(pi/2) q0[41];
-if(c0==0) rz(pi/2) q0[42];
-if(c0==0) sx q0[42];
-if(c0==0) rz(pi/2) q0[42];
-if(c0==0) rz(pi/2) q0[43];
-if(c0==0) sx q0[43];
-if(c0==0) rz(pi/2) q0[43];
-if(c0==0) rz(pi/2) q0[44];
-if(c0==0) sx q0[44];
-if(c0==0) rz(pi/2) q0[44];
-if(c0==0) rz(pi/2) q0[45];
-if(c0==0) sx q0[45];
-if(c0==0) rz(pi/2) q0[45];
-if(c0==0) rz(pi/2) q0[46];
-if(c0==0) sx q0[46];
-if(c0==0) rz(pi/2) q0[46];
-if(c0==0) rz(pi/2) q0[47];
-if(c0==0) sx q0[47];
-if(c0==0) rz(pi/2) q0[47];
-if(c0==0) rz(pi/2) q0[48];
-if(c0==0) sx q0[48];
-if(c0==0) rz(pi/2) q0[48];
-if(c0==0) rz(pi/2) q0[49];
-if(c0==0) sx q0[49];
-if(c0==0) rz(pi/2) q0[49];
-if(c0==0) rz(pi/2) q0[50];
-if(c0==0) sx q0[50];
-if(c0==0) rz(pi/2) q0[50];
-if(c0==0) rz(pi/2) q0[51];
-if(c0==0) sx q0[51];
-if(c0==0) rz(pi/2) q0[51];
-if(c0==0) rz(pi/2) q0[52];
-if(c0==0) sx q0[52];
-if(c0==0) rz(pi/2) q0[52];
-if(c0==0) rz(pi/2) q0[53];
-if(c0==0) sx q0[53];
-if(c0==0) rz(pi/2) q0[53];
-if(c0==0) rz(pi/2) q0[54];
-if(c0==0) sx q0[54];
-if(c0==0) rz(pi/2) q0[54];
-if(c0==0) rz(pi/2) q0[55];
-if(c0==0) sx q0[55];
-if(c0==0) rz(pi/2) q0[55];
-if(c0==0) rz(pi/2) q0[56];
-if(c0==0) sx q0[56];
-if(c0==0) rz(pi/2) q0[56];
-if(c0==0) rz(pi/2) q0[57];
-if(c0==0) sx q0[57];
-if(c0==0) rz(pi/2) q0[57];
-if(c0==0) rz(pi/2) q0[58];
-if(c0==0) sx q0[58];
-if(c0==0) rz(pi/2) q0[58];
-if(c0==0) rz(pi/2) q0[59];
-if(c0==0) sx q0[59];
-if(c0==0) rz(pi/2) q0[59];
-if(c0==0) rz(pi/2) q0[60];
-if(c0==0) sx q0[60];
-if(c0==0) rz(pi/2) q0[60];
-if(c0==0) rz(pi/2) q0[61];
-if(c0==0) sx q0[61];
-if(c0==0) rz(pi/2) q0[61];
-if(c0==0) rz(pi/2) q0[62];
-if(c0==0) sx q0[62];
-if(c0==0) rz(pi/2) q0[62];
-if(c0==0) rz(pi/2) q0[63];
-if(c0==0) sx q0[63];
-if(c0==0) rz(pi/2) q0[63];
-if(c0==0) rz(pi/2) q0[64];
-if(c0==0) sx q0[64];
-if(c0==0) rz(pi/2) q0[64];
-if(c0==0) rz(pi/2) q0[65];
-if(c0==0) sx q0[65];
-if(c0==0) rz(pi/2) q0[65];
-if(c0==0) rz(pi/2) q0[66];
-if(c0==0) sx q0[66];
-if(c0==0) rz(pi/2) q0[66];
-if(c0==0) rz(pi/2) q0[67];
-if(c0==0) sx q0[67];
-if(c0==0) rz(pi/2) q0[67];
-if(c0==0) rz(pi/2) q0[68];
-if(c0==0) sx q0[68];
-if(c0==0) rz(pi/2) q0[68];
-if(c0==0) rz(pi/2) q0[69];
-if(c0==0) sx q0[69];
-if(c0==0) rz(pi/2) q0[69];
-if(c0==0) rz(pi/2) q0[70];
-if(c0==0) sx q0[70];
-if(c0==0) rz(pi/2) q0[70];
-if(c0==0) rz(pi/2) q0[71];
-if(c0==0) sx q0[71];
-if(c0==0) rz(pi/2) q0[71];
-if(c0==0) rz(pi/2) q0[72];
-if(c0==0) sx q0[72];
-if(c0==0) rz(pi/2) q0[72];
-if(c0==0) rz(pi/2) q0[73];
-if(c0==0) sx q0[73];
-if(c0==0) rz(pi/2) q0[73];
-if(c0==0) rz(pi/2) q0[74];
-if(c0==0) sx q0[74];
-if(c0==0) rz(pi/2) q0[74];
-if(c0==0) rz(pi/2) q0[75];
-if(c0==0) sx q0[75];
-if(c0==0) rz(pi/2) q0[75];
-if(c0==0) rz(pi/2) q0[76];
-if(c0==0) sx q0[76];
-if(c0==0) rz(pi/2) q0[76];
-if(c0==0) rz(pi/2) q0[77];
-if(c0==0) sx q0[77];
-if(c0==0) rz(pi/2) q0[77];
-if(c0==0) rz(pi/2) q0[78];
-if(c0==0) sx q0[78];
-if(c0==0) rz(pi/2) q0[78];
-if(c0==0) rz(pi/2) q0[79];
-if(c0==0) sx q0[79];
-if(c0==0) rz(pi/2) q0[79];
-if(c0==0) rz(pi/2) q0[80];
-if(c0==0) sx q0[80];
-if(c0==0) rz(pi/2) q0[80];
-if(c0==0) rz(pi/2) q0[81];
-if(c0==0) sx q0[81];
-if(c0==0) rz(pi/2) q0[81];
-if(c0==0) rz(pi/2) q0[82];
-if(c0==0) sx q0[82];
-if(c0==0) rz(pi/2) q0[82];
-if(c0==0) rz(pi/2) q0[83];
-if(c0==0) sx q0[83];
-if(c0==0) rz(pi/2) q0[83];
-if(c0==0) rz(pi/2) q0[84];
-if(c0==0) sx q0[84];
-if(c0==0) rz(pi/2) q0[84];
-if(c0==0) rz(pi/2) q0[85];
-if(c0==0) sx q0[85];
-if(c0==0) rz(pi/2) q0[85];
-if(c0==0) rz(pi/2) q0[86];
-if(c0==0) sx q0[86];
-if(c0==0) rz(pi/2) q0[86];
-if(c0==0) rz(pi/2) q0[87];
-if(c0==0) sx q0[87];
-if(c0==0) rz(pi/2) q0[87];
-if(c0==0) rz(pi/2) q0[88];
-if(c0==0) sx q0[88];
-if(c0==0) rz(pi/2) q0[88];
-if(c0==0) rz(pi/2) q0[89];
-if(c0==0) sx q0[89];
-if(c0==0) rz(pi/2) q0[89];
-if(c0==0) rz(pi/2) q0[90];
-if(c0==0) sx q0[90];
-if(c0==0) rz(pi/2) q0[90];
-if(c0==0) rz(pi/2) q0[91];
-if(c0==0) sx q0[91];
-if(c0==0) rz(pi/2) q0[91];
-if(c0==0) rz(pi/2) q0[92];
-if(c0==0) sx q0[92];
-if(c0==0) rz(pi/2) q0[92];
-if(c0==0) rz(pi/2) q0[93];
-if(c0==0) sx q0[93];
-if(c0==0) rz(pi/2) q0[93];
-if(c0==0) rz(pi/2) q0[94];
-if(c0==0) sx q0[94];
-if(c0==0) rz(pi/2) q0[94];
-if(c0==0) rz(pi/2) q0[95];
-if(c0==0) sx q0[95];
-if(c0==0) rz(pi/2) q0[95];
-if(c0==0) rz(pi/2) q0[96];
-if(c0==0) sx q0[96];
-if(c0==0) rz(pi/2) q0[96];
-if(c0==0) rz(pi/2) q0[97];
-if(c0==0) sx q0[97];
-if(c0==0) rz(pi/2) q0[97];
-if(c0==0) rz(pi/2) q0[98];
-if(c0==0) sx q0[98];
-if(c0==0) rz(pi/2) q0[98];
-if(c0==0) rz(pi/2) q0[99];
-if(c0==0) sx q0[99];
-if(c0==0) rz(pi/2) q0[99];
-if(c0==0) rz(pi/2) q0[100];
-if(c0==0) sx q0[100];
-if(c0==0) rz(pi/2) q0[100];
-if(c0==0) rz(pi/2) q0[101];
-if(c0==0) sx q0[101];
-if(c0==0) rz(pi/2) q0[101];
-if(c0==0) rz(pi/2) q0[102];
-if(c0==0) sx q0[102];
-if(c0==0) rz(pi/2) q0[102];
-if(c0==0) rz(pi/2) q0[103];
-if(c0==0) sx q0[103];
-if(c0==0) rz(pi/2) q0[103];
-if(c0==0) rz(pi/2) q0[104];
-if(c0==0) sx q0[104];
-if(c0==0) rz(pi/2) q0[104];
-if(c0==0) rz(pi/2) q0[105];
-if(c0==0) sx q0[105];
-if(c0==0) rz(pi/2) q0[105];
-if(c0==0) rz(pi/2) q0[106];
-if(c0==0) sx q0[106];
-if(c0==0) rz(pi/2) q0[106];
-if(c0==0) rz(pi/2) q0[107];
-if(c0==0) sx q0[107];
-if(c0==0) rz(pi/2) q0[107];
-if(c0==0) rz(pi/2) q0[108];
-if(c0==0) sx q0[108];
-if(c0==0) rz(pi/2) q0[108];
-if(c0==0) rz(pi/2) q0[109];
-if(c0==0) sx q0[109];
-if(c0==0) rz(pi/2) q0[109];
-if(c0==0) rz(pi/2) q0[110];
-if(c0==0) sx q0[110];
-if(c0==0) rz(pi/2) q0[110];
-if(c0==0) rz(pi/2) q0[111];
-if(c0==0) sx q0[111];
-if(c0==0) rz(pi/2) q0[111];
-if(c0==0) rz(pi/2) q0[112];
-if(c0==0) sx q0[112];
-if(c0==0) rz(pi/2) q0[112];
-if(c0==0) rz(pi/2) q0[113];
-if(c0==0) sx q0[113];
-if(c0==0) rz(pi/2) q0[113];
-if(c0==0) rz(pi/2) q0[114];
-if(c0==0) sx q0[114];
-if(c0==0) rz(pi/2) q0[114];
-if(c0==0) rz(pi/2) q0[115];
-if(c0==0) sx q0[115];
-if(c0==0) rz(pi/2) q0[115];
-if(c0==0) rz(pi/2) q0[116];
-if(c0==0) sx q0[116];
-if(c0==0) rz(pi/2) q0[116];
-if(c0==0) rz(pi/2) q0[117];
-if(c0==0) sx q0[117];
-if(c0==0) rz(pi/2) q0[117];
-if(c0==0) rz(pi/2) q0[118];
-if(c0==0) sx q0[118];
-if(c0==0) rz(pi/2) q0[118];
-if(c0==0) rz(pi/2) q0[119];
-if(c0==0) sx q0[119];
-if(c0==0) rz(pi/2) q0[119];
-if(c0==0) rz(pi/2) q0[120];
-if(c0==0) sx q0[120];
-if(c0==0) rz(pi/2) q0[120];
-if(c0==0) rz(pi/2) q0[121];
-if(c0==0) sx q0[121];
-if(c0==0) rz(pi/2) q0[121];
-if(c0==0) rz(pi/2) q0[122];
-if(c0==0) sx q0[122];
-if(c0==0) rz(pi/2) q0[122];
-if(c0==0) rz(pi/2) q0[123];
-if(c0==0) sx q0[123];
-if(c0==0) rz(pi/2) q0[123];
-if(c0==0) rz(pi/2) q0[124];
-if(c0==0) sx q0[124];
-if(c0==0) rz(pi/2) q0[124];
-if(c0==0) rz(pi/2) q0[125];
-if(c0==0) sx q0[125];
-if(c0==0) rz(pi/2) q0[125];
-if(c0==0) rz(pi/2) q0[126];
-if(c0==0) sx q0[126];
-if(c0==0) rz(pi/2) q0[126];
-if(c0==0) rz(pi/2) q0[127];
-if(c0==0) sx q0[127];
-if(c0==0) rz(pi/2) q0[127];
-if(c0==0) rz(pi/2) q0[128];
-if(c0==0) sx q0[128];
-if(c0==0) rz(pi/2) q0[128];
-if(c0==0) rz(pi/2) q0[129];
-if(c0==0) sx q0[129];
-if(c0==0) rz(pi/2) q0[129];
-if(c0==0) rz(pi/2) q0[130];
-if(c0==0) sx q0[130];
-if(c0==0) rz(pi/2) q0[130];
-if(c0==0) rz(pi/2) q0[131];
-if(c0==0) sx q0[131];
-if(c0==0) rz(pi/2) q0[131];
-if(c0==0) rz(pi/2) q0[132];
-if(c0==0) sx q0[132];
-if(c0==0) rz(pi/2) q0[132];
-if(c0==0) rz(pi/2) q0[133];
-if(c0==0) sx q0[133];
-if(c0==0) rz(pi/2) q0[133];
-if(c0==0) rz(pi/2) q0[134];
-if(c0==0) sx q0[134];
-if(c0==0) rz(pi/2) q0[134];
-if(c0==0) rz(pi/2) q0[135];
-if(c0==0) sx q0[135];
-if(c0==0) rz(pi/2) q0[135];
-if(c0==0) rz(pi/2) q0[136];
-if(c0==0) sx q0[136];
-if(c0==0) rz(pi/2) q0[136];
-if(c0==0) rz(pi/2) q0[137];
-if(c0==0) sx q0[137];
-if(c0==0) rz(pi/2) q0[137];
-if(c0==0) rz(pi/2) q0[138];
-if(c0==0) sx q0[138];
-if(c0==0) rz(pi/2) q0[138];
-if(c0==0) rz(pi/2) q0[139];
-if(c0==0) sx q0[139];
-if(c0==0) rz(pi/2) q0[139];
-if(c0==0) rz(pi/2) q0[140];
-if(c0==0) sx q0[140];
-if(c0==0) rz(pi/2) q0[140];
-if(c0==0) rz(pi/2) q0[141];
-if(c0==0) sx q0[141];
-if(c0==0) rz(pi/2) q0[141];
-if(c0==0) rz(pi/2) q0[142];
-if(c0==0) sx q0[142];
-if(c0==0) rz(pi/2) q0[142];
-if(c0==0) rz(pi/2) q0[143];
-if(c0==0) sx q0[143];
-if(c0==0) rz(pi/2) q0[143];
-if(c0==0) rz(pi/2) q0[144];
-if(c0==0) sx q0[144];
-if(c0==0) rz(pi/2) q0[144];
-if(c0==0) rz(pi/2) q0[145];
-if(c0==0) sx q0[145];
-if(c0==0) rz(pi/2) q0[145];
-if(c0==0) rz(pi/2) q0[146];
-if(c0==0) sx q0[146];
-if(c0==0) rz(pi/2) q0[146];
-if(c0==0) rz(pi/2) q0[147];
-if(c0==0) sx q0[147];
-if(c0==0) rz(pi/2) q0[147];
-if(c0==0) rz(pi/2) q0[148];
-if(c0==0) sx q0[148];
-if(c0==0) rz(pi/2) q0[148];
-if(c0==0) rz(pi/2) q0[149];
-if(c0==0) sx q0[149];
-if(c0==0) rz(pi/2) q0[149];
-measure q0[0] -> c0[0];
-measure q0[1] -> c0[1];
-measure q0[10] -> c0[10];
-measure q0[100] -> c0[100];
-measure q0[101] -> c0[101];
-measure q0[102] -> c0[102];
-measure q0[103] -> c0[103];
-measure q0[104] -> c0[104];
-measure q0[105] -> c0[105];
-measure q0[106] -> c0[106];
-measure q0[107] -> c0[107];
-measure q0[108] -> c0[108];
-measure q0[109] -> c0[109];
-measure q0[11] -> c0[11];
-measure q0[110] -> c0[110];
-measure q0[111] -> c0[111];
-measure q0[112] -> c0[112];
-measure q0[113] -> c0[113];
-measure q0[114] -> c0[114];
-measure q0[115] -> c0[115];
-measure q0[116] -> c0[116];
-measure q0[117] -> c0[117];
-measure q0[118] -> c0[118];
-measure q0[119] -> c0[119];
-measure q0[12] -> c0[12];
-measure q0[120] -> c0[120];
-measure q0[121] -> c0[121];
-measure q0[122] -> c0[122];
-measure q0[123] -> c0[123];
-measure q0[124] -> c0[124];
-measure q0[125] -> c0[125];
-measure q0[126] -> c0[126];
-measure q0[127] -> c0[127];
-measure q0[128] -> c0[128];
-measure q0[129] -> c0[129];
-measure q0[13] -> c0[13];
-measure q0[130] -> c0[130];
-measure q0[131] -> c0[131];
-measure q0[132] -> c0[132];
-measure q0[133] -> c0[133];
-measure q0[134] -> c0[134];
-measure q0[135] -> c0[135];
-measure q0[136] -> c0[136];
-measure q0[137] -> c0[137];
-measure q0[138] -> c0[138];
-measure q0[139] -> c0[139];
-measure q0[14] -> c0[14];
-measure q0[140] -> c0[140];
-measure q0[141] -> c0[141];
-measure q0[142] -> c0[142];
-measure q0[143] -> c0[143];
-measure q0[144] -> c0[144];
-measure q0[145] -> c0[145];
-measure q0[146] -> c0[146];
-measure q0[147] -> c0[147];
-measure q0[148] -> c0[148];
-measure q0[149] -> c0[149];
-measure q0[15] -> c0[15];
-measure q0[16] -> c0[16];
-measure q0[17] -> c0[17];
-measure q0[18] -> c0[18];
-measure q0[19] -> c0[19];
-measure q0[2] -> c0[2];
-measure q0[20] -> c0[20];
-measure q0[21] -> c0[21];
-measure q0[22] -> c0[22];
-measure q0[23] -> c0[23];
-measure q0[24] -> c0[24];
-measure q0[25] -> c0[25];
-measure q0[26] -> c0[26];
-measure q0[27] -> c0[27];
-measure q0[28] -> c0[28];
-measure q0[29] -> c0[29];
-measure q0[3] -> c0[3];
-measure q0[30] -> c0[30];
-measure q0[31] -> c0[31];
-measure q0[32] -> c0[32];
-measure q0[33] -> c0[33];
-measure q0[34] -> c0[34];
-measure q0[35] -> c0[35];
-measure q0[36] -> c0[36];
-measure q0[37] -> c0[37];
-measure q0[38] -> c0[38];
-measure q0[39] -> c0[39];
-measure q0[4] -> c0[4];
-measure q0[40] -> c0[40];
-measure q0[41] -> c0[41];
-measure q0[42] -> c0[42];
-measure q0[43] -> c0[43];
-measure q0[44] -> c0[44];
-measure q0[45] -> c0[45];
-measure q0[46] -> c0[46];
-measure q0[47] -> c0[47];
-measure q0[48] -> c0[48];
-measure q0[49] -> c0[49];
-measure q0[5] -> c0[5];
-measure q0[50] -> c0[50];
-measure q0[51] -> c0[51];
-measure q0[52] -> c0[52];
-measure q0[53] -> c0[53];
-measure q0[54] -> c0[54];
-measure q0[55] -> c0[55];
-measure q0[56] -> c0[56];
-measure q0[57] -> c0[57];
-measure q0[58] -> c0[58];
-measure q0[59] -> c0[59];
-measure q0[6] -> c0[6];
-measure q0[60] -> c0[60];
-measure q0[61] -> c0[61];
-measure q0[62] -> c0[62];
-measure q0[63] -> c0[63];
-measure q0[64] -> c0[64];
-measure q0[65] -> c0[65];
-measure q0[66] -> c0[66];
-measure q0[67] -> c0[67];
-measure q0[68] -> c0[68];
-measure q0[69] -> c0[69];
-measure q0[7] -> c0[7];
-measure q0[70] -> c0[70];
-measure q0[71] -> c0[71];
-measure q0[72] -> c0[72];
-measure q0[73] -> c0[73];
-measure q0[74] -> c0[74];
-measure q0[75] -> c0[75];
-measure q0[76] -> c0[76];
-measure q0[77] -> c0[77];
-measure q0[78] -> c0[78];
-measure q0[79] -> c0[79];
-measure q0[8] -> c0[8];
-measure q0[80] -> c0[80];
-measure q0[81] -> c0[81];
-measure q0[82] -> c0[82];
-measure q0[83] -> c0[83];
-measure q0[84] -> c0[84];
-measure q0[85] -> c0[85];
-measure q0[86] -> c0[86];
-measure q0[87] -> c0[87];
-measure q0[88] -> c0[88];
-measure q0[89] -> c0[89];
-measure q0[9] -> c0[9];
-measure q0[90] -> c0[90];
-measure q0[91] -> c0[91];
-measure q0[92] -> c0[92];
-measure q0[93] -> c0[93];
-measure q0[94] -> c0[94];
-measure q0[95] -> c0[95];
-measure q0[96] -> c0[96];
-measure q0[97] -> c0[97];
-measure q0[98] -> c0[98];
-measure q0[99] -> c0[99];
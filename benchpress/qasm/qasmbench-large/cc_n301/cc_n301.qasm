@@ -1,1510 +0,0 @@
-OPENQASM 2.0;
-include "qelib1.inc";
-qreg q0[301];
-creg c0[301];
-h q0[0];
-h q0[1];
-h q0[2];
-h q0[3];
-h q0[4];
-h q0[5];
-h q0[6];
-h q0[7];
-h q0[8];
-h q0[9];
-h q0[10];
-h q0[11];
-h q0[12];
-h q0[13];
-h q0[14];
-h q0[15];
-h q0[16];
-h q0[17];
-h q0[18];
-h q0[19];
-h q0[20];
-h q0[21];
-h q0[22];
-h q0[23];
-h q0[24];
-h q0[25];
-h q0[26];
-h q0[27];
-h q0[28];
-h q0[29];
-h q0[30];
-h q0[31];
-h q0[32];
-h q0[33];
-h q0[34];
-h q0[35];
-h q0[36];
-h q0[37];
-h q0[38];
-h q0[39];
-h q0[40];
-h q0[41];
-h q0[42];
-h q0[43];
-h q0[44];
-h q0[45];
-h q0[46];
-h q0[47];
-h q0[48];
-h q0[49];
-h q0[50];
-h q0[51];
-h q0[52];
-h q0[53];
-h q0[54];
-h q0[55];
-h q0[56];
-h q0[57];
-h q0[58];
-h q0[59];
-h q0[60];
-h q0[61];
-h q0[62];
-h q0[63];
-h q0[64];
-h q0[65];
-h q0[66];
-h q0[67];
-h q0[68];
-h q0[69];
-h q0[70];
-h q0[71];
-h q0[72];
-h q0[73];
-h q0[74];
-h q0[75];
-h q0[76];
-h q0[77];
-h q0[78];
-h q0[79];
-h q0[80];
-h q0[81];
-h q0[82];
-h q0[83];
-h q0[84];
-h q0[85];
-h q0[86];
-h q0[87];
-h q0[88];
-h q0[89];
-h q0[90];
-h q0[91];
-h q0[92];
-h q0[93];
-h q0[94];
-h q0[95];
-h q0[96];
-h q0[97];
-h q0[98];
-h q0[99];
-h q0[100];
-h q0[101];
-h q0[102];
-h q0[103];
-h q0[104];
-h q0[105];
-h q0[106];
-h q0[107];
-h q0[108];
-h q0[109];
-h q0[110];
-h q0[111];
-h q0[112];
-h q0[113];
-h q0[114];
-h q0[115];
-h q0[116];
-h q0[117];
-h q0[118];
-h q0[119];
-h q0[120];
-h q0[121];
-h q0[122];
-h q0[123];
-h q0[124];
-h q0[125];
-h q0[126];
-h q0[127];
-h q0[128];
-h q0[129];
-h q0[130];
-h q0[131];
-h q0[132];
-h q0[133];
-h q0[134];
-h q0[135];
-h q0[136];
-h q0[137];
-h q0[138];
-h q0[139];
-h q0[140];
-h q0[141];
-h q0[142];
-h q0[143];
-h q0[144];
-h q0[145];
-h q0[146];
-h q0[147];
-h q0[148];
-h q0[149];
-h q0[150];
-h q0[151];
-h q0[152];
-h q0[153];
-h q0[154];
-h q0[155];
-h q0[156];
-h q0[157];
-h q0[158];
-h q0[159];
-h q0[160];
-h q0[161];
-h q0[162];
-h q0[163];
-h q0[164];
-h q0[165];
-h q0[166];
-h q0[167];
-h q0[168];
-h q0[169];
-h q0[170];
-h q0[171];
-h q0[172];
-h q0[173];
-h q0[174];
-h q0[175];
-h q0[176];
-h q0[177];
-h q0[178];
-h q0[179];
-h q0[180];
-h q0[181];
-h q0[182];
-h q0[183];
-h q0[184];
-h q0[185];
-h q0[186];
-h q0[187];
-h q0[188];
-h q0[189];
-h q0[190];
-h q0[191];
-h q0[192];
-h q0[193];
-h q0[194];
-h q0[195];
-h q0[196];
-h q0[197];
-h q0[198];
-h q0[199];
-h q0[200];
-h q0[201];
-h q0[202];
-h q0[203];
-h q0[204];
-h q0[205];
-h q0[206];
-h q0[207];
-h q0[208];
-h q0[209];
-h q0[210];
-h q0[211];
-h q0[212];
-h q0[213];
-h q0[214];
-h q0[215];
-h q0[216];
-h q0[217];
-h q0[218];
-h q0[219];
-h q0[220];
-h q0[221];
-h q0[222];
-h q0[223];
-h q0[224];
-h q0[225];
-h q0[226];
-h q0[227];
-h q0[228];
-h q0[229];
-h q0[230];
-h q0[231];
-h q0[232];
-h q0[233];
-h q0[234];
-h q0[235];
-h q0[236];
-h q0[237];
-h q0[238];
-h q0[239];
-h q0[240];
-h q0[241];
-h q0[242];
-h q0[243];
-h q0[244];
-h q0[245];
-h q0[246];
-h q0[247];
-h q0[248];
-h q0[249];
-h q0[250];
-h q0[251];
-h q0[252];
-h q0[253];
-h q0[254];
-h q0[255];
-h q0[256];
-h q0[257];
-h q0[258];
-h q0[259];
-h q0[260];
-h q0[261];
-h q0[262];
-h q0[263];
-h q0[264];
-h q0[265];
-h q0[266];
-h q0[267];
-h q0[268];
-h q0[269];
-h q0[270];
-h q0[271];
-h q0[272];
-h q0[273];
-h q0[274];
-h q0[275];
-h q0[276];
-h q0[277];
-h q0[278];
-h q0[279];
-h q0[280];
-h q0[281];
-h q0[282];
-h q0[283];
-h q0[284];
-h q0[285];
-h q0[286];
-h q0[287];
-h q0[288];
-h q0[289];
-h q0[290];
-h q0[291];
-h q0[292];
-h q0[293];
-h q0[294];
-h q0[295];
-h q0[296];
-h q0[297];
-h q0[298];
-h q0[299];
-cx q0[0],q0[300];
-cx q0[1],q0[300];
-cx q0[2],q0[300];
-cx q0[3],q0[300];
-cx q0[4],q0[300];
-cx q0[5],q0[300];
-cx q0[6],q0[300];
-cx q0[7],q0[300];
-cx q0[8],q0[300];
-cx q0[9],q0[300];
-cx q0[10],q0[300];
-cx q0[11],q0[300];
-cx q0[12],q0[300];
-cx q0[13],q0[300];
-cx q0[14],q0[300];
-cx q0[15],q0[300];
-cx q0[16],q0[300];
-cx q0[17],q0[300];
-cx q0[18],q0[300];
-cx q0[19],q0[300];
-cx q0[20],q0[300];
-cx q0[21],q0[300];
-cx q0[22],q0[300];
-cx q0[23],q0[300];
-cx q0[24],q0[300];
-cx q0[25],q0[300];
-cx q0[26],q0[300];
-cx q0[27],q0[300];
-cx q0[28],q0[300];
-cx q0[29],q0[300];
-cx q0[30],q0[300];
-cx q0[31],q0[300];
-cx q0[32],q0[300];
-cx q0[33],q0[300];
-cx q0[34],q0[300];
-cx q0[35],q0[300];
-cx q0[36],q0[300];
-cx q0[37],q0[300];
-cx q0[38],q0[300];
-cx q0[39],q0[300];
-cx q0[40],q0[300];
-cx q0[41],q0[300];
-cx q0[42],q0[300];
-cx q0[43],q0[300];
-cx q0[44],q0[300];
-cx q0[45],q0[300];
-cx q0[46],q0[300];
-cx q0[47],q0[300];
-cx q0[48],q0[300];
-cx q0[49],q0[300];
-cx q0[50],q0[300];
-cx q0[51],q0[300];
-cx q0[52],q0[300];
-cx q0[53],q0[300];
-cx q0[54],q0[300];
-cx q0[55],q0[300];
-cx q0[56],q0[300];
-cx q0[57],q0[300];
-cx q0[58],q0[300];
-cx q0[59],q0[300];
-cx q0[60],q0[300];
-cx q0[61],q0[300];
-cx q0[62],q0[300];
-cx q0[63],q0[300];
-cx q0[64],q0[300];
-cx q0[65],q0[300];
-cx q0[66],q0[300];
-cx q0[67],q0[300];
-cx q0[68],q0[300];
-cx q0[69],q0[300];
-cx q0[70],q0[300];
-cx q0[71],q0[300];
-cx q0[72],q0[300];
-cx q0[73],q0[300];
-cx q0[74],q0[300];
-cx q0[75],q0[300];
-cx q0[76],q0[300];
-cx q0[77],q0[300];
-cx q0[78],q0[300];
-cx q0[79],q0[300];
-cx q0[80],q0[300];
-cx q0[81],q0[300];
-cx q0[82],q0[300];
-cx q0[83],q0[300];
-cx q0[84],q0[300];
-cx q0[85],q0[300];
-cx q0[86],q0[300];
-cx q0[87],q0[300];
-cx q0[88],q0[300];
-cx q0[89],q0[300];
-cx q0[90],q0[300];
-cx q0[91],q0[300];
-cx q0[92],q0[300];
-cx q0[93],q0[300];
-cx q0[94],q0[300];
-cx q0[95],q0[300];
-cx q0[96],q0[300];
-cx q0[97],q0[300];
-cx q0[98],q0[300];
-cx q0[99],q0[300];
-cx q0[100],q0[300];
-cx q0[101],q0[300];
-cx q0[102],q0[300];
-cx q0[103],q0[300];
-cx q0[104],q0[300];
-cx q0[105],q0[300];
-cx q0[106],q0[300];
-cx q0[107],q0[300];
-cx q0[108],q0[300];
-cx q0[109],q0[300];
-cx q0[110],q0[300];
-cx q0[111],q0[300];
-cx q0[112],q0[300];
-cx q0[113],q0[300];
-cx q0[114],q0[300];
-cx q0[115],q0[300];
-cx q0[116],q0[300];
-cx q0[117],q0[300];
-cx q0[118],q0[300];
-cx q0[119],q0[300];
-cx q0[120],q0[300];
-cx q0[121],q0[300];
-cx q0[122],q0[300];
-cx q0[123],q0[300];
-cx q0[124],q0[300];
-cx q0[125],q0[300];
-cx q0[126],q0[300];
-cx q0[127],q0[300];
-cx q0[128],q0[300];
-cx q0[129],q0[300];
-cx q0[130],q0[300];
-cx q0[131],q0[300];
-cx q0[132],q0[300];
-cx q0[133],q0[300];
-cx q0[134],q0[300];
-cx q0[135],q0[300];
-cx q0[136],q0[300];
-cx q0[137],q0[300];
-cx q0[138],q0[300];
-cx q0[139],q0[300];
-cx q0[140],q0[300];
-cx q0[141],q0[300];
-cx q0[142],q0[300];
-cx q0[143],q0[300];
-cx q0[144],q0[300];
-cx q0[145],q0[300];
-cx q0[146],q0[300];
-cx q0[147],q0[300];
-cx q0[148],q0[300];
-cx q0[149],q0[300];
-cx q0[150],q0[300];
-cx q0[151],q0[300];
-cx q0[152],q0[300];
-cx q0[153],q0[300];
-cx q0[154],q0[300];
-cx q0[155],q0[300];
-cx q0[156],q0[300];
-cx q0[157],q0[300];
-cx q0[158],q0[300];
-cx q0[159],q0[300];
-cx q0[160],q0[300];
-cx q0[161],q0[300];
-cx q0[162],q0[300];
-cx q0[163],q0[300];
-cx q0[164],q0[300];
-cx q0[165],q0[300];
-cx q0[166],q0[300];
-cx q0[167],q0[300];
-cx q0[168],q0[300];
-cx q0[169],q0[300];
-cx q0[170],q0[300];
-cx q0[171],q0[300];
-cx q0[172],q0[300];
-cx q0[173],q0[300];
-cx q0[174],q0[300];
-cx q0[175],q0[300];
-cx q0[176],q0[300];
-cx q0[177],q0[300];
-cx q0[178],q0[300];
-cx q0[179],q0[300];
-cx q0[180],q0[300];
-cx q0[181],q0[300];
-cx q0[182],q0[300];
-cx q0[183],q0[300];
-cx q0[184],q0[300];
-cx q0[185],q0[300];
-cx q0[186],q0[300];
-cx q0[187],q0[300];
-cx q0[188],q0[300];
-cx q0[189],q0[300];
-cx q0[190],q0[300];
-cx q0[191],q0[300];
-cx q0[192],q0[300];
-cx q0[193],q0[300];
-cx q0[194],q0[300];
-cx q0[195],q0[300];
-cx q0[196],q0[300];
-cx q0[197],q0[300];
-cx q0[198],q0[300];
-cx q0[199],q0[300];
-cx q0[200],q0[300];
-cx q0[201],q0[300];
-cx q0[202],q0[300];
-cx q0[203],q0[300];
-cx q0[204],q0[300];
-cx q0[205],q0[300];
-cx q0[206],q0[300];
-cx q0[207],q0[300];
-cx q0[208],q0[300];
-cx q0[209],q0[300];
-cx q0[210],q0[300];
-cx q0[211],q0[300];
-cx q0[212],q0[300];
-cx q0[213],q0[300];
-cx q0[214],q0[300];
-cx q0[215],q0[300];
-cx q0[216],q0[300];
-cx q0[217],q0[300];
-cx q0[218],q0[300];
-cx q0[219],q0[300];
-cx q0[220],q0[300];
-cx q0[221],q0[300];
-cx q0[222],q0[300];
-cx q0[223],q0[300];
-cx q0[224],q0[300];
-cx q0[225],q0[300];
-cx q0[226],q0[300];
-cx q0[227],q0[300];
-cx q0[228],q0[300];
-cx q0[229],q0[300];
-cx q0[230],q0[300];
-cx q0[231],q0[300];
-cx q0[232],q0[300];
-cx q0[233],q0[300];
-cx q0[234],q0[300];
-cx q0[235],q0[300];
-cx q0[236],q0[300];
-cx q0[237],q0[300];
-cx q0[238],q0[300];
-cx q0[239],q0[300];
-cx q0[240],q0[300];
-cx q0[241],q0[300];
-cx q0[242],q0[300];
-cx q0[243],q0[300];
-cx q0[244],q0[300];
-cx q0[245],q0[300];
-cx q0[246],q0[300];
-cx q0[247],q0[300];
-cx q0[248],q0[300];
-cx q0[249],q0[300];
-cx q0[250],q0[300];
-cx q0[251],q0[300];
-cx q0[252],q0[300];
-cx q0[253],q0[300];
-cx q0[254],q0[300];
-cx q0[255],q0[300];
-cx q0[256],q0[300];
-cx q0[257],q0[300];
-cx q0[258],q0[300];
-cx q0[259],q0[300];
-cx q0[260],q0[300];
-cx q0[261],q0[300];
-cx q0[262],q0[300];
-cx q0[263],q0[300];
-cx q0[264],q0[300];
-cx q0[265],q0[300];
-cx q0[266],q0[300];
-cx q0[267],q0[300];
-cx q0[268],q0[300];
-cx q0[269],q0[300];
-cx q0[270],q0[300];
-cx q0[271],q0[300];
-cx q0[272],q0[300];
-cx q0[273],q0[300];
-cx q0[274],q0[300];
-cx q0[275],q0[300];
-cx q0[276],q0[300];
-cx q0[277],q0[300];
-cx q0[278],q0[300];
-cx q0[279],q0[300];
-cx q0[280],q0[300];
-cx q0[281],q0[300];
-cx q0[282],q0[300];
-cx q0[283],q0[300];
-cx q0[284],q0[300];
-cx q0[285],q0[300];
-cx q0[286],q0[300];
-cx q0[287],q0[300];
-cx q0[288],q0[300];
-cx q0[289],q0[300];
-cx q0[290],q0[300];
-cx q0[291],q0[300];
-cx q0[292],q0[300];
-cx q0[293],q0[300];
-cx q0[294],q0[300];
-cx q0[295],q0[300];
-cx q0[296],q0[300];
-cx q0[297],q0[300];
-cx q0[298],q0[300];
-cx q0[299],q0[300];
-measure q0[300] -> c0[300];
-if(c0==0) x q0[300];
-if(c0==0) h q0[300];
-if(c0==2037035976334486086268445688409378161051468393665936250636140449354381299763336706183397376) h q0[0];
-if(c0==2037035976334486086268445688409378161051468393665936250636140449354381299763336706183397376) h q0[1];
-if(c0==2037035976334486086268445688409378161051468393665936250636140449354381299763336706183397376) h q0[2];
-if(c0==2037035976334486086268445688409378161051468393665936250636140449354381299763336706183397376) h q0[3];
-if(c0==2037035976334486086268445688409378161051468393665936250636140449354381299763336706183397376) h q0[4];
-if(c0==2037035976334486086268445688409378161051468393665936250636140449354381299763336706183397376) h q0[5];
-if(c0==2037035976334486086268445688409378161051468393665936250636140449354381299763336706183397376) h q0[6];
-if(c0==2037035976334486086268445688409378161051468393665936250636140449354381299763336706183397376) h q0[7];
-if(c0==2037035976334486086268445688409378161051468393665936250636140449354381299763336706183397376) h q0[8];
-if(c0==2037035976334486086268445688409378161051468393665936250636140449354381299763336706183397376) h q0[9];
-if(c0==2037035976334486086268445688409378161051468393665936250636140449354381299763336706183397376) h q0[10];
-if(c0==2037035976334486086268445688409378161051468393665936250636140449354381299763336706183397376) h q0[11];
-if(c0==2037035976334486086268445688409378161051468393665936250636140449354381299763336706183397376) h q0[12];
-if(c0==2037035976334486086268445688409378161051468393665936250636140449354381299763336706183397376) h q0[13];
-if(c0==2037035976334486086268445688409378161051468393665936250636140449354381299763336706183397376) h q0[14];
-if(c0==2037035976334486086268445688409378161051468393665936250636140449354381299763336706183397376) h q0[15];
-if(c0==2037035976334486086268445688409378161051468393665936250636140449354381299763336706183397376) h q0[16];
-if(c0==2037035976334486086268445688409378161051468393665936250636140449354381299763336706183397376) h q0[17];
-if(c0==2037035976334486086268445688409378161051468393665936250636140449354381299763336706183397376) h q0[18];
-if(c0==2037035976334486086268445688409378161051468393665936250636140449354381299763336706183397376) h q0[19];
-if(c0==2037035976334486086268445688409378161051468393665936250636140449354381299763336706183397376) h q0[20];
-if(c0==2037035976334486086268445688409378161051468393665936250636140449354381299763336706183397376) h q0[21];
-if(c0==2037035976334486086268445688409378161051468393665936250636140449354381299763336706183397376) h q0[22];
-if(c0==2037035976334486086268445688409378161051468393665936250636140449354381299763336706183397376) h q0[23];
-if(c0==2037035976334486086268445688409378161051468393665936250636140449354381299763336706183397376) h q0[24];
-if(c0==2037035976334486086268445688409378161051468393665936250636140449354381299763336706183397376) h q0[25];
-if(c0==2037035976334486086268445688409378161051468393665936250636140449354381299763336706183397376) h q0[26];
-if(c0==2037035976334486086268445688409378161051468393665936250636140449354381299763336706183397376) h q0[27];
-if(c0==2037035976334486086268445688409378161051468393665936250636140449354381299763336706183397376) h q0[28];
-if(c0==2037035976334486086268445688409378161051468393665936250636140449354381299763336706183397376) h q0[29];
-if(c0==2037035976334486086268445688409378161051468393665936250636140449354381299763336706183397376) h q0[30];
-if(c0==2037035976334486086268445688409378161051468393665936250636140449354381299763336706183397376) h q0[31];
-if(c0==2037035976334486086268445688409378161051468393665936250636140449354381299763336706183397376) h q0[32];
-if(c0==2037035976334486086268445688409378161051468393665936250636140449354381299763336706183397376) h q0[33];
-if(c0==2037035976334486086268445688409378161051468393665936250636140449354381299763336706183397376) h q0[34];
-if(c0==2037035976334486086268445688409378161051468393665936250636140449354381299763336706183397376) h q0[35];
-if(c0==2037035976334486086268445688409378161051468393665936250636140449354381299763336706183397376) h q0[36];
-if(c0==2037035976334486086268445688409378161051468393665936250636140449354381299763336706183397376) h q0[37];
-if(c0==2037035976334486086268445688409378161051468393665936250636140449354381299763336706183397376) h q0[38];
-if(c0==2037035976334486086268445688409378161051468393665936250636140449354381299763336706183397376) h q0[39];
-if(c0==2037035976334486086268445688409378161051468393665936250636140449354381299763336706183397376) h q0[40];
-if(c0==2037035976334486086268445688409378161051468393665936250636140449354381299763336706183397376) h q0[41];
-if(c0==2037035976334486086268445688409378161051468393665936250636140449354381299763336706183397376) h q0[42];
-if(c0==2037035976334486086268445688409378161051468393665936250636140449354381299763336706183397376) h q0[43];
-if(c0==2037035976334486086268445688409378161051468393665936250636140449354381299763336706183397376) h q0[44];
-if(c0==2037035976334486086268445688409378161051468393665936250636140449354381299763336706183397376) h q0[45];
-if(c0==2037035976334486086268445688409378161051468393665936250636140449354381299763336706183397376) h q0[46];
-if(c0==2037035976334486086268445688409378161051468393665936250636140449354381299763336706183397376) h q0[47];
-if(c0==2037035976334486086268445688409378161051468393665936250636140449354381299763336706183397376) h q0[48];
-if(c0==2037035976334486086268445688409378161051468393665936250636140449354381299763336706183397376) h q0[49];
-if(c0==2037035976334486086268445688409378161051468393665936250636140449354381299763336706183397376) h q0[50];
-if(c0==2037035976334486086268445688409378161051468393665936250636140449354381299763336706183397376) h q0[51];
-if(c0==2037035976334486086268445688409378161051468393665936250636140449354381299763336706183397376) h q0[52];
-if(c0==2037035976334486086268445688409378161051468393665936250636140449354381299763336706183397376) h q0[53];
-if(c0==2037035976334486086268445688409378161051468393665936250636140449354381299763336706183397376) h q0[54];
-if(c0==2037035976334486086268445688409378161051468393665936250636140449354381299763336706183397376) h q0[55];
-if(c0==2037035976334486086268445688409378161051468393665936250636140449354381299763336706183397376) h q0[56];
-if(c0==2037035976334486086268445688409378161051468393665936250636140449354381299763336706183397376) h q0[57];
-if(c0==2037035976334486086268445688409378161051468393665936250636140449354381299763336706183397376) h q0[58];
-if(c0==2037035976334486086268445688409378161051468393665936250636140449354381299763336706183397376) h q0[59];
-if(c0==2037035976334486086268445688409378161051468393665936250636140449354381299763336706183397376) h q0[60];
-if(c0==2037035976334486086268445688409378161051468393665936250636140449354381299763336706183397376) h q0[61];
-if(c0==2037035976334486086268445688409378161051468393665936250636140449354381299763336706183397376) h q0[62];
-if(c0==2037035976334486086268445688409378161051468393665936250636140449354381299763336706183397376) h q0[63];
-if(c0==2037035976334486086268445688409378161051468393665936250636140449354381299763336706183397376) h q0[64];
-if(c0==2037035976334486086268445688409378161051468393665936250636140449354381299763336706183397376) h q0[65];
-if(c0==2037035976334486086268445688409378161051468393665936250636140449354381299763336706183397376) h q0[66];
-if(c0==2037035976334486086268445688409378161051468393665936250636140449354381299763336706183397376) h q0[67];
-if(c0==2037035976334486086268445688409378161051468393665936250636140449354381299763336706183397376) h q0[68];
-if(c0==2037035976334486086268445688409378161051468393665936250636140449354381299763336706183397376) h q0[69];
-if(c0==2037035976334486086268445688409378161051468393665936250636140449354381299763336706183397376) h q0[70];
-if(c0==2037035976334486086268445688409378161051468393665936250636140449354381299763336706183397376) h q0[71];
-if(c0==2037035976334486086268445688409378161051468393665936250636140449354381299763336706183397376) h q0[72];
-if(c0==2037035976334486086268445688409378161051468393665936250636140449354381299763336706183397376) h q0[73];
-if(c0==2037035976334486086268445688409378161051468393665936250636140449354381299763336706183397376) h q0[74];
-if(c0==2037035976334486086268445688409378161051468393665936250636140449354381299763336706183397376) h q0[75];
-if(c0==2037035976334486086268445688409378161051468393665936250636140449354381299763336706183397376) h q0[76];
-if(c0==2037035976334486086268445688409378161051468393665936250636140449354381299763336706183397376) h q0[77];
-if(c0==2037035976334486086268445688409378161051468393665936250636140449354381299763336706183397376) h q0[78];
-if(c0==2037035976334486086268445688409378161051468393665936250636140449354381299763336706183397376) h q0[79];
-if(c0==2037035976334486086268445688409378161051468393665936250636140449354381299763336706183397376) h q0[80];
-if(c0==2037035976334486086268445688409378161051468393665936250636140449354381299763336706183397376) h q0[81];
-if(c0==2037035976334486086268445688409378161051468393665936250636140449354381299763336706183397376) h q0[82];
-if(c0==2037035976334486086268445688409378161051468393665936250636140449354381299763336706183397376) h q0[83];
-if(c0==2037035976334486086268445688409378161051468393665936250636140449354381299763336706183397376) h q0[84];
-if(c0==2037035976334486086268445688409378161051468393665936250636140449354381299763336706183397376) h q0[85];
-if(c0==2037035976334486086268445688409378161051468393665936250636140449354381299763336706183397376) h q0[86];
-if(c0==2037035976334486086268445688409378161051468393665936250636140449354381299763336706183397376) h q0[87];
-if(c0==2037035976334486086268445688409378161051468393665936250636140449354381299763336706183397376) h q0[88];
-if(c0==2037035976334486086268445688409378161051468393665936250636140449354381299763336706183397376) h q0[89];
-if(c0==2037035976334486086268445688409378161051468393665936250636140449354381299763336706183397376) h q0[90];
-if(c0==2037035976334486086268445688409378161051468393665936250636140449354381299763336706183397376) h q0[91];
-if(c0==2037035976334486086268445688409378161051468393665936250636140449354381299763336706183397376) h q0[92];
-if(c0==2037035976334486086268445688409378161051468393665936250636140449354381299763336706183397376) h q0[93];
-if(c0==2037035976334486086268445688409378161051468393665936250636140449354381299763336706183397376) h q0[94];
-if(c0==2037035976334486086268445688409378161051468393665936250636140449354381299763336706183397376) h q0[95];
-if(c0==2037035976334486086268445688409378161051468393665936250636140449354381299763336706183397376) h q0[96];
-if(c0==2037035976334486086268445688409378161051468393665936250636140449354381299763336706183397376) h q0[97];
-if(c0==2037035976334486086268445688409378161051468393665936250636140449354381299763336706183397376) h q0[98];
-if(c0==2037035976334486086268445688409378161051468393665936250636140449354381299763336706183397376) h q0[99];
-if(c0==2037035976334486086268445688409378161051468393665936250636140449354381299763336706183397376) h q0[100];
-if(c0==2037035976334486086268445688409378161051468393665936250636140449354381299763336706183397376) h q0[101];
-if(c0==2037035976334486086268445688409378161051468393665936250636140449354381299763336706183397376) h q0[102];
-if(c0==2037035976334486086268445688409378161051468393665936250636140449354381299763336706183397376) h q0[103];
-if(c0==2037035976334486086268445688409378161051468393665936250636140449354381299763336706183397376) h q0[104];
-if(c0==2037035976334486086268445688409378161051468393665936250636140449354381299763336706183397376) h q0[105];
-if(c0==2037035976334486086268445688409378161051468393665936250636140449354381299763336706183397376) h q0[106];
-if(c0==2037035976334486086268445688409378161051468393665936250636140449354381299763336706183397376) h q0[107];
-if(c0==2037035976334486086268445688409378161051468393665936250636140449354381299763336706183397376) h q0[108];
-if(c0==2037035976334486086268445688409378161051468393665936250636140449354381299763336706183397376) h q0[109];
-if(c0==2037035976334486086268445688409378161051468393665936250636140449354381299763336706183397376) h q0[110];
-if(c0==2037035976334486086268445688409378161051468393665936250636140449354381299763336706183397376) h q0[111];
-if(c0==2037035976334486086268445688409378161051468393665936250636140449354381299763336706183397376) h q0[112];
-if(c0==2037035976334486086268445688409378161051468393665936250636140449354381299763336706183397376) h q0[113];
-if(c0==2037035976334486086268445688409378161051468393665936250636140449354381299763336706183397376) h q0[114];
-if(c0==2037035976334486086268445688409378161051468393665936250636140449354381299763336706183397376) h q0[115];
-if(c0==2037035976334486086268445688409378161051468393665936250636140449354381299763336706183397376) h q0[116];
-if(c0==2037035976334486086268445688409378161051468393665936250636140449354381299763336706183397376) h q0[117];
-if(c0==2037035976334486086268445688409378161051468393665936250636140449354381299763336706183397376) h q0[118];
-if(c0==2037035976334486086268445688409378161051468393665936250636140449354381299763336706183397376) h q0[119];
-if(c0==2037035976334486086268445688409378161051468393665936250636140449354381299763336706183397376) h q0[120];
-if(c0==2037035976334486086268445688409378161051468393665936250636140449354381299763336706183397376) h q0[121];
-if(c0==2037035976334486086268445688409378161051468393665936250636140449354381299763336706183397376) h q0[122];
-if(c0==2037035976334486086268445688409378161051468393665936250636140449354381299763336706183397376) h q0[123];
-if(c0==2037035976334486086268445688409378161051468393665936250636140449354381299763336706183397376) h q0[124];
-if(c0==2037035976334486086268445688409378161051468393665936250636140449354381299763336706183397376) h q0[125];
-if(c0==2037035976334486086268445688409378161051468393665936250636140449354381299763336706183397376) h q0[126];
-if(c0==2037035976334486086268445688409378161051468393665936250636140449354381299763336706183397376) h q0[127];
-if(c0==2037035976334486086268445688409378161051468393665936250636140449354381299763336706183397376) h q0[128];
-if(c0==2037035976334486086268445688409378161051468393665936250636140449354381299763336706183397376) h q0[129];
-if(c0==2037035976334486086268445688409378161051468393665936250636140449354381299763336706183397376) h q0[130];
-if(c0==2037035976334486086268445688409378161051468393665936250636140449354381299763336706183397376) h q0[131];
-if(c0==2037035976334486086268445688409378161051468393665936250636140449354381299763336706183397376) h q0[132];
-if(c0==2037035976334486086268445688409378161051468393665936250636140449354381299763336706183397376) h q0[133];
-if(c0==2037035976334486086268445688409378161051468393665936250636140449354381299763336706183397376) h q0[134];
-if(c0==2037035976334486086268445688409378161051468393665936250636140449354381299763336706183397376) h q0[135];
-if(c0==2037035976334486086268445688409378161051468393665936250636140449354381299763336706183397376) h q0[136];
-if(c0==2037035976334486086268445688409378161051468393665936250636140449354381299763336706183397376) h q0[137];
-if(c0==2037035976334486086268445688409378161051468393665936250636140449354381299763336706183397376) h q0[138];
-if(c0==2037035976334486086268445688409378161051468393665936250636140449354381299763336706183397376) h q0[139];
-if(c0==2037035976334486086268445688409378161051468393665936250636140449354381299763336706183397376) h q0[140];
-if(c0==2037035976334486086268445688409378161051468393665936250636140449354381299763336706183397376) h q0[141];
-if(c0==2037035976334486086268445688409378161051468393665936250636140449354381299763336706183397376) h q0[142];
-if(c0==2037035976334486086268445688409378161051468393665936250636140449354381299763336706183397376) h q0[143];
-if(c0==2037035976334486086268445688409378161051468393665936250636140449354381299763336706183397376) h q0[144];
-if(c0==2037035976334486086268445688409378161051468393665936250636140449354381299763336706183397376) h q0[145];
-if(c0==2037035976334486086268445688409378161051468393665936250636140449354381299763336706183397376) h q0[146];
-if(c0==2037035976334486086268445688409378161051468393665936250636140449354381299763336706183397376) h q0[147];
-if(c0==2037035976334486086268445688409378161051468393665936250636140449354381299763336706183397376) h q0[148];
-if(c0==2037035976334486086268445688409378161051468393665936250636140449354381299763336706183397376) h q0[149];
-if(c0==2037035976334486086268445688409378161051468393665936250636140449354381299763336706183397376) h q0[150];
-if(c0==2037035976334486086268445688409378161051468393665936250636140449354381299763336706183397376) h q0[151];
-if(c0==2037035976334486086268445688409378161051468393665936250636140449354381299763336706183397376) h q0[152];
-if(c0==2037035976334486086268445688409378161051468393665936250636140449354381299763336706183397376) h q0[153];
-if(c0==2037035976334486086268445688409378161051468393665936250636140449354381299763336706183397376) h q0[154];
-if(c0==2037035976334486086268445688409378161051468393665936250636140449354381299763336706183397376) h q0[155];
-if(c0==2037035976334486086268445688409378161051468393665936250636140449354381299763336706183397376) h q0[156];
-if(c0==2037035976334486086268445688409378161051468393665936250636140449354381299763336706183397376) h q0[157];
-if(c0==2037035976334486086268445688409378161051468393665936250636140449354381299763336706183397376) h q0[158];
-if(c0==2037035976334486086268445688409378161051468393665936250636140449354381299763336706183397376) h q0[159];
-if(c0==2037035976334486086268445688409378161051468393665936250636140449354381299763336706183397376) h q0[160];
-if(c0==2037035976334486086268445688409378161051468393665936250636140449354381299763336706183397376) h q0[161];
-if(c0==2037035976334486086268445688409378161051468393665936250636140449354381299763336706183397376) h q0[162];
-if(c0==2037035976334486086268445688409378161051468393665936250636140449354381299763336706183397376) h q0[163];
-if(c0==2037035976334486086268445688409378161051468393665936250636140449354381299763336706183397376) h q0[164];
-if(c0==2037035976334486086268445688409378161051468393665936250636140449354381299763336706183397376) h q0[165];
-if(c0==2037035976334486086268445688409378161051468393665936250636140449354381299763336706183397376) h q0[166];
-if(c0==2037035976334486086268445688409378161051468393665936250636140449354381299763336706183397376) h q0[167];
-if(c0==2037035976334486086268445688409378161051468393665936250636140449354381299763336706183397376) h q0[168];
-if(c0==2037035976334486086268445688409378161051468393665936250636140449354381299763336706183397376) h q0[169];
-if(c0==2037035976334486086268445688409378161051468393665936250636140449354381299763336706183397376) h q0[170];
-if(c0==2037035976334486086268445688409378161051468393665936250636140449354381299763336706183397376) h q0[171];
-if(c0==2037035976334486086268445688409378161051468393665936250636140449354381299763336706183397376) h q0[172];
-if(c0==2037035976334486086268445688409378161051468393665936250636140449354381299763336706183397376) h q0[173];
-if(c0==2037035976334486086268445688409378161051468393665936250636140449354381299763336706183397376) h q0[174];
-if(c0==2037035976334486086268445688409378161051468393665936250636140449354381299763336706183397376) h q0[175];
-if(c0==2037035976334486086268445688409378161051468393665936250636140449354381299763336706183397376) h q0[176];
-if(c0==2037035976334486086268445688409378161051468393665936250636140449354381299763336706183397376) h q0[177];
-if(c0==2037035976334486086268445688409378161051468393665936250636140449354381299763336706183397376) h q0[178];
-if(c0==2037035976334486086268445688409378161051468393665936250636140449354381299763336706183397376) h q0[179];
-if(c0==2037035976334486086268445688409378161051468393665936250636140449354381299763336706183397376) h q0[180];
-if(c0==2037035976334486086268445688409378161051468393665936250636140449354381299763336706183397376) h q0[181];
-if(c0==2037035976334486086268445688409378161051468393665936250636140449354381299763336706183397376) h q0[182];
-if(c0==2037035976334486086268445688409378161051468393665936250636140449354381299763336706183397376) h q0[183];
-if(c0==2037035976334486086268445688409378161051468393665936250636140449354381299763336706183397376) h q0[184];
-if(c0==2037035976334486086268445688409378161051468393665936250636140449354381299763336706183397376) h q0[185];
-if(c0==2037035976334486086268445688409378161051468393665936250636140449354381299763336706183397376) h q0[186];
-if(c0==2037035976334486086268445688409378161051468393665936250636140449354381299763336706183397376) h q0[187];
-if(c0==2037035976334486086268445688409378161051468393665936250636140449354381299763336706183397376) h q0[188];
-if(c0==2037035976334486086268445688409378161051468393665936250636140449354381299763336706183397376) h q0[189];
-if(c0==2037035976334486086268445688409378161051468393665936250636140449354381299763336706183397376) h q0[190];
-if(c0==2037035976334486086268445688409378161051468393665936250636140449354381299763336706183397376) h q0[191];
-if(c0==2037035976334486086268445688409378161051468393665936250636140449354381299763336706183397376) h q0[192];
-if(c0==2037035976334486086268445688409378161051468393665936250636140449354381299763336706183397376) h q0[193];
-if(c0==2037035976334486086268445688409378161051468393665936250636140449354381299763336706183397376) h q0[194];
-if(c0==2037035976334486086268445688409378161051468393665936250636140449354381299763336706183397376) h q0[195];
-if(c0==2037035976334486086268445688409378161051468393665936250636140449354381299763336706183397376) h q0[196];
-if(c0==2037035976334486086268445688409378161051468393665936250636140449354381299763336706183397376) h q0[197];
-if(c0==2037035976334486086268445688409378161051468393665936250636140449354381299763336706183397376) h q0[198];
-if(c0==2037035976334486086268445688409378161051468393665936250636140449354381299763336706183397376) h q0[199];
-if(c0==2037035976334486086268445688409378161051468393665936250636140449354381299763336706183397376) h q0[200];
-if(c0==2037035976334486086268445688409378161051468393665936250636140449354381299763336706183397376) h q0[201];
-if(c0==2037035976334486086268445688409378161051468393665936250636140449354381299763336706183397376) h q0[202];
-if(c0==2037035976334486086268445688409378161051468393665936250636140449354381299763336706183397376) h q0[203];
-if(c0==2037035976334486086268445688409378161051468393665936250636140449354381299763336706183397376) h q0[204];
-if(c0==2037035976334486086268445688409378161051468393665936250636140449354381299763336706183397376) h q0[205];
-if(c0==2037035976334486086268445688409378161051468393665936250636140449354381299763336706183397376) h q0[206];
-if(c0==2037035976334486086268445688409378161051468393665936250636140449354381299763336706183397376) h q0[207];
-if(c0==2037035976334486086268445688409378161051468393665936250636140449354381299763336706183397376) h q0[208];
-if(c0==2037035976334486086268445688409378161051468393665936250636140449354381299763336706183397376) h q0[209];
-if(c0==2037035976334486086268445688409378161051468393665936250636140449354381299763336706183397376) h q0[210];
-if(c0==2037035976334486086268445688409378161051468393665936250636140449354381299763336706183397376) h q0[211];
-if(c0==2037035976334486086268445688409378161051468393665936250636140449354381299763336706183397376) h q0[212];
-if(c0==2037035976334486086268445688409378161051468393665936250636140449354381299763336706183397376) h q0[213];
-if(c0==2037035976334486086268445688409378161051468393665936250636140449354381299763336706183397376) h q0[214];
-if(c0==2037035976334486086268445688409378161051468393665936250636140449354381299763336706183397376) h q0[215];
-if(c0==2037035976334486086268445688409378161051468393665936250636140449354381299763336706183397376) h q0[216];
-if(c0==2037035976334486086268445688409378161051468393665936250636140449354381299763336706183397376) h q0[217];
-if(c0==2037035976334486086268445688409378161051468393665936250636140449354381299763336706183397376) h q0[218];
-if(c0==2037035976334486086268445688409378161051468393665936250636140449354381299763336706183397376) h q0[219];
-if(c0==2037035976334486086268445688409378161051468393665936250636140449354381299763336706183397376) h q0[220];
-if(c0==2037035976334486086268445688409378161051468393665936250636140449354381299763336706183397376) h q0[221];
-if(c0==2037035976334486086268445688409378161051468393665936250636140449354381299763336706183397376) h q0[222];
-if(c0==2037035976334486086268445688409378161051468393665936250636140449354381299763336706183397376) h q0[223];
-if(c0==2037035976334486086268445688409378161051468393665936250636140449354381299763336706183397376) h q0[224];
-if(c0==2037035976334486086268445688409378161051468393665936250636140449354381299763336706183397376) h q0[225];
-if(c0==2037035976334486086268445688409378161051468393665936250636140449354381299763336706183397376) h q0[226];
-if(c0==2037035976334486086268445688409378161051468393665936250636140449354381299763336706183397376) h q0[227];
-if(c0==2037035976334486086268445688409378161051468393665936250636140449354381299763336706183397376) h q0[228];
-if(c0==2037035976334486086268445688409378161051468393665936250636140449354381299763336706183397376) h q0[229];
-if(c0==2037035976334486086268445688409378161051468393665936250636140449354381299763336706183397376) h q0[230];
-if(c0==2037035976334486086268445688409378161051468393665936250636140449354381299763336706183397376) h q0[231];
-if(c0==2037035976334486086268445688409378161051468393665936250636140449354381299763336706183397376) h q0[232];
-if(c0==2037035976334486086268445688409378161051468393665936250636140449354381299763336706183397376) h q0[233];
-if(c0==2037035976334486086268445688409378161051468393665936250636140449354381299763336706183397376) h q0[234];
-if(c0==2037035976334486086268445688409378161051468393665936250636140449354381299763336706183397376) h q0[235];
-if(c0==2037035976334486086268445688409378161051468393665936250636140449354381299763336706183397376) h q0[236];
-if(c0==2037035976334486086268445688409378161051468393665936250636140449354381299763336706183397376) h q0[237];
-if(c0==2037035976334486086268445688409378161051468393665936250636140449354381299763336706183397376) h q0[238];
-if(c0==2037035976334486086268445688409378161051468393665936250636140449354381299763336706183397376) h q0[239];
-if(c0==2037035976334486086268445688409378161051468393665936250636140449354381299763336706183397376) h q0[240];
-if(c0==2037035976334486086268445688409378161051468393665936250636140449354381299763336706183397376) h q0[241];
-if(c0==2037035976334486086268445688409378161051468393665936250636140449354381299763336706183397376) h q0[242];
-if(c0==2037035976334486086268445688409378161051468393665936250636140449354381299763336706183397376) h q0[243];
-if(c0==2037035976334486086268445688409378161051468393665936250636140449354381299763336706183397376) h q0[244];
-if(c0==2037035976334486086268445688409378161051468393665936250636140449354381299763336706183397376) h q0[245];
-if(c0==2037035976334486086268445688409378161051468393665936250636140449354381299763336706183397376) h q0[246];
-if(c0==2037035976334486086268445688409378161051468393665936250636140449354381299763336706183397376) h q0[247];
-if(c0==2037035976334486086268445688409378161051468393665936250636140449354381299763336706183397376) h q0[248];
-if(c0==2037035976334486086268445688409378161051468393665936250636140449354381299763336706183397376) h q0[249];
-if(c0==2037035976334486086268445688409378161051468393665936250636140449354381299763336706183397376) h q0[250];
-if(c0==2037035976334486086268445688409378161051468393665936250636140449354381299763336706183397376) h q0[251];
-if(c0==2037035976334486086268445688409378161051468393665936250636140449354381299763336706183397376) h q0[252];
-if(c0==2037035976334486086268445688409378161051468393665936250636140449354381299763336706183397376) h q0[253];
-if(c0==2037035976334486086268445688409378161051468393665936250636140449354381299763336706183397376) h q0[254];
-if(c0==2037035976334486086268445688409378161051468393665936250636140449354381299763336706183397376) h q0[255];
-if(c0==2037035976334486086268445688409378161051468393665936250636140449354381299763336706183397376) h q0[256];
-if(c0==2037035976334486086268445688409378161051468393665936250636140449354381299763336706183397376) h q0[257];
-if(c0==2037035976334486086268445688409378161051468393665936250636140449354381299763336706183397376) h q0[258];
-if(c0==2037035976334486086268445688409378161051468393665936250636140449354381299763336706183397376) h q0[259];
-if(c0==2037035976334486086268445688409378161051468393665936250636140449354381299763336706183397376) h q0[260];
-if(c0==2037035976334486086268445688409378161051468393665936250636140449354381299763336706183397376) h q0[261];
-if(c0==2037035976334486086268445688409378161051468393665936250636140449354381299763336706183397376) h q0[262];
-if(c0==2037035976334486086268445688409378161051468393665936250636140449354381299763336706183397376) h q0[263];
-if(c0==2037035976334486086268445688409378161051468393665936250636140449354381299763336706183397376) h q0[264];
-if(c0==2037035976334486086268445688409378161051468393665936250636140449354381299763336706183397376) h q0[265];
-if(c0==2037035976334486086268445688409378161051468393665936250636140449354381299763336706183397376) h q0[266];
-if(c0==2037035976334486086268445688409378161051468393665936250636140449354381299763336706183397376) h q0[267];
-if(c0==2037035976334486086268445688409378161051468393665936250636140449354381299763336706183397376) h q0[268];
-if(c0==2037035976334486086268445688409378161051468393665936250636140449354381299763336706183397376) h q0[269];
-if(c0==2037035976334486086268445688409378161051468393665936250636140449354381299763336706183397376) h q0[270];
-if(c0==2037035976334486086268445688409378161051468393665936250636140449354381299763336706183397376) h q0[271];
-if(c0==2037035976334486086268445688409378161051468393665936250636140449354381299763336706183397376) h q0[272];
-if(c0==2037035976334486086268445688409378161051468393665936250636140449354381299763336706183397376) h q0[273];
-if(c0==2037035976334486086268445688409378161051468393665936250636140449354381299763336706183397376) h q0[274];
-if(c0==2037035976334486086268445688409378161051468393665936250636140449354381299763336706183397376) h q0[275];
-if(c0==2037035976334486086268445688409378161051468393665936250636140449354381299763336706183397376) h q0[276];
-if(c0==2037035976334486086268445688409378161051468393665936250636140449354381299763336706183397376) h q0[277];
-if(c0==2037035976334486086268445688409378161051468393665936250636140449354381299763336706183397376) h q0[278];
-if(c0==2037035976334486086268445688409378161051468393665936250636140449354381299763336706183397376) h q0[279];
-if(c0==2037035976334486086268445688409378161051468393665936250636140449354381299763336706183397376) h q0[280];
-if(c0==2037035976334486086268445688409378161051468393665936250636140449354381299763336706183397376) h q0[281];
-if(c0==2037035976334486086268445688409378161051468393665936250636140449354381299763336706183397376) h q0[282];
-if(c0==2037035976334486086268445688409378161051468393665936250636140449354381299763336706183397376) h q0[283];
-if(c0==2037035976334486086268445688409378161051468393665936250636140449354381299763336706183397376) h q0[284];
-if(c0==2037035976334486086268445688409378161051468393665936250636140449354381299763336706183397376) h q0[285];
-if(c0==2037035976334486086268445688409378161051468393665936250636140449354381299763336706183397376) h q0[286];
-if(c0==2037035976334486086268445688409378161051468393665936250636140449354381299763336706183397376) h q0[287];
-if(c0==2037035976334486086268445688409378161051468393665936250636140449354381299763336706183397376) h q0[288];
-if(c0==2037035976334486086268445688409378161051468393665936250636140449354381299763336706183397376) h q0[289];
-if(c0==2037035976334486086268445688409378161051468393665936250636140449354381299763336706183397376) h q0[290];
-if(c0==2037035976334486086268445688409378161051468393665936250636140449354381299763336706183397376) h q0[291];
-if(c0==2037035976334486086268445688409378161051468393665936250636140449354381299763336706183397376) h q0[292];
-if(c0==2037035976334486086268445688409378161051468393665936250636140449354381299763336706183397376) h q0[293];
-if(c0==2037035976334486086268445688409378161051468393665936250636140449354381299763336706183397376) h q0[294];
-if(c0==2037035976334486086268445688409378161051468393665936250636140449354381299763336706183397376) h q0[295];
-if(c0==2037035976334486086268445688409378161051468393665936250636140449354381299763336706183397376) h q0[296];
-if(c0==2037035976334486086268445688409378161051468393665936250636140449354381299763336706183397376) h q0[297];
-if(c0==2037035976334486086268445688409378161051468393665936250636140449354381299763336706183397376) h q0[298];
-if(c0==2037035976334486086268445688409378161051468393665936250636140449354381299763336706183397376) h q0[299];
-barrier q0[0],q0[1],q0[2],q0[3],q0[4],q0[5],q0[6],q0[7],q0[8],q0[9],q0[10],q0[11],q0[12],q0[13],q0[14],q0[15],q0[16],q0[17],q0[18],q0[19],q0[20],q0[21],q0[22],q0[23],q0[24],q0[25],q0[26],q0[27],q0[28],q0[29],q0[30],q0[31],q0[32],q0[33],q0[34],q0[35],q0[36],q0[37],q0[38],q0[39],q0[40],q0[41],q0[42],q0[43],q0[44],q0[45],q0[46],q0[47],q0[48],q0[49],q0[50],q0[51],q0[52],q0[53],q0[54],q0[55],q0[56],q0[57],q0[58],q0[59],q0[60],q0[61],q0[62],q0[63],q0[64],q0[65],q0[66],q0[67],q0[68],q0[69],q0[70],q0[71],q0[72],q0[73],q0[74],q0[75],q0[76],q0[77],q0[78],q0[79],q0[80],q0[81],q0[82],q0[83],q0[84],q0[85],q0[86],q0[87],q0[88],q0[89],q0[90],q0[91],q0[92],q0[93],q0[94],q0[95],q0[96],q0[97],q0[98],q0[99],q0[100],q0[101],q0[102],q0[103],q0[104],q0[105],q0[106],q0[107],q0[108],q0[109],q0[110],q0[111],q0[112],q0[113],q0[114],q0[115],q0[116],q0[117],q0[118],q0[119],q0[120],q0[121],q0[122],q0[123],q0[124],q0[125],q0[126],q0[127],q0[128],q0[129],q0[130],q0[131],q0[132],q0[133],q0[134],q0[135],q0[136],q0[137],q0[138],q0[139],q0[140],q0[141],q0[142],q0[143],q0[144],q0[145],q0[146],q0[147],q0[148],q0[149],q0[150],q0[151],q0[152],q0[153],q0[154],q0[155],q0[156],q0[157],q0[158],q0[159],q0[160],q0[161],q0[162],q0[163],q0[164],q0[165],q0[166],q0[167],q0[168],q0[169],q0[170],q0[171],q0[172],q0[173],q0[174],q0[175],q0[176],q0[177],q0[178],q0[179],q0[180],q0[181],q0[182],q0[183],q0[184],q0[185],q0[186],q0[187],q0[188],q0[189],q0[190],q0[191],q0[192],q0[193],q0[194],q0[195],q0[196],q0[197],q0[198],q0[199],q0[200],q0[201],q0[202],q0[203],q0[204],q0[205],q0[206],q0[207],q0[208],q0[209],q0[210],q0[211],q0[212],q0[213],q0[214],q0[215],q0[216],q0[217],q0[218],q0[219],q0[220],q0[221],q0[222],q0[223],q0[224],q0[225],q0[226],q0[227],q0[228],q0[229],q0[230],q0[231],q0[232],q0[233],q0[234],q0[235],q0[236],q0[237],q0[238],q0[239],q0[240],q0[241],q0[242],q0[243],q0[244],q0[245],q0[246],q0[247],q0[248],q0[249],q0[250],q0[251],q0[252],q0[253],q0[254],q0[255],q0[256],q0[257],q0[258],q0[259],q0[260],q0[261],q0[262],q0[263],q0[264],q0[265],q0[266],q0[267],q0[268],q0[269],q0[270],q0[271],q0[272],q0[273],q0[274],q0[275],q0[276],q0[277],q0[278],q0[279],q0[280],q0[281],q0[282],q0[283],q0[284],q0[285],q0[286],q0[287],q0[288],q0[289],q0[290],q0[291],q0[292],q0[293],q0[294],q0[295],q0[296],q0[297],q0[298],q0[299],q0[300];
-if(c0==0) cx q0[98],q0[300];
-barrier q0[0],q0[1],q0[2],q0[3],q0[4],q0[5],q0[6],q0[7],q0[8],q0[9],q0[10],q0[11],q0[12],q0[13],q0[14],q0[15],q0[16],q0[17],q0[18],q0[19],q0[20],q0[21],q0[22],q0[23],q0[24],q0[25],q0[26],q0[27],q0[28],q0[29],q0[30],q0[31],q0[32],q0[33],q0[34],q0[35],q0[36],q0[37],q0[38],q0[39],q0[40],q0[41],q0[42],q0[43],q0[44],q0[45],q0[46],q0[47],q0[48],q0[49],q0[50],q0[51],q0[52],q0[53],q0[54],q0[55],q0[56],q0[57],q0[58],q0[59],q0[60],q0[61],q0[62],q0[63],q0[64],q0[65],q0[66],q0[67],q0[68],q0[69],q0[70],q0[71],q0[72],q0[73],q0[74],q0[75],q0[76],q0[77],q0[78],q0[79],q0[80],q0[81],q0[82],q0[83],q0[84],q0[85],q0[86],q0[87],q0[88],q0[89],q0[90],q0[91],q0[92],q0[93],q0[94],q0[95],q0[96],q0[97],q0[98],q0[99],q0[100],q0[101],q0[102],q0[103],q0[104],q0[105],q0[106],q0[107],q0[108],q0[109],q0[110],q0[111],q0[112],q0[113],q0[114],q0[115],q0[116],q0[117],q0[118],q0[119],q0[120],q0[121],q0[122],q0[123],q0[124],q0[125],q0[126],q0[127],q0[128],q0[129],q0[130],q0[131],q0[132],q0[133],q0[134],q0[135],q0[136],q0[137],q0[138],q0[139],q0[140],q0[141],q0[142],q0[143],q0[144],q0[145],q0[146],q0[147],q0[148],q0[149],q0[150],q0[151],q0[152],q0[153],q0[154],q0[155],q0[156],q0[157],q0[158],q0[159],q0[160],q0[161],q0[162],q0[163],q0[164],q0[165],q0[166],q0[167],q0[168],q0[169],q0[170],q0[171],q0[172],q0[173],q0[174],q0[175],q0[176],q0[177],q0[178],q0[179],q0[180],q0[181],q0[182],q0[183],q0[184],q0[185],q0[186],q0[187],q0[188],q0[189],q0[190],q0[191],q0[192],q0[193],q0[194],q0[195],q0[196],q0[197],q0[198],q0[199],q0[200],q0[201],q0[202],q0[203],q0[204],q0[205],q0[206],q0[207],q0[208],q0[209],q0[210],q0[211],q0[212],q0[213],q0[214],q0[215],q0[216],q0[217],q0[218],q0[219],q0[220],q0[221],q0[222],q0[223],q0[224],q0[225],q0[226],q0[227],q0[228],q0[229],q0[230],q0[231],q0[232],q0[233],q0[234],q0[235],q0[236],q0[237],q0[238],q0[239],q0[240],q0[241],q0[242],q0[243],q0[244],q0[245],q0[246],q0[247],q0[248],q0[249],q0[250],q0[251],q0[252],q0[253],q0[254],q0[255],q0[256],q0[257],q0[258],q0[259],q0[260],q0[261],q0[262],q0[263],q0[264],q0[265],q0[266],q0[267],q0[268],q0[269],q0[270],q0[271],q0[272],q0[273],q0[274],q0[275],q0[276],q0[277],q0[278],q0[279],q0[280],q0[281],q0[282],q0[283],q0[284],q0[285],q0[286],q0[287],q0[288],q0[289],q0[290],q0[291],q0[292],q0[293],q0[294],q0[295],q0[296],q0[297],q0[298],q0[299],q0[300];
-if(c0==0) h q0[0];
-if(c0==0) h q0[1];
-if(c0==0) h q0[2];
-if(c0==0) h q0[3];
-if(c0==0) h q0[4];
-if(c0==0) h q0[5];
-if(c0==0) h q0[6];
-if(c0==0) h q0[7];
-if(c0==0) h q0[8];
-if(c0==0) h q0[9];
-if(c0==0) h q0[10];
-if(c0==0) h q0[11];
-if(c0==0) h q0[12];
-if(c0==0) h q0[13];
-if(c0==0) h q0[14];
-if(c0==0) h q0[15];
-if(c0==0) h q0[16];
-if(c0==0) h q0[17];
-if(c0==0) h q0[18];
-if(c0==0) h q0[19];
-if(c0==0) h q0[20];
-if(c0==0) h q0[21];
-if(c0==0) h q0[22];
-if(c0==0) h q0[23];
-if(c0==0) h q0[24];
-if(c0==0) h q0[25];
-if(c0==0) h q0[26];
-if(c0==0) h q0[27];
-if(c0==0) h q0[28];
-if(c0==0) h q0[29];
-if(c0==0) h q0[30];
-if(c0==0) h q0[31];
-if(c0==0) h q0[32];
-if(c0==0) h q0[33];
-if(c0==0) h q0[34];
-if(c0==0) h q0[35];
-if(c0==0) h q0[36];
-if(c0==0) h q0[37];
-if(c0==0) h q0[38];
-if(c0==0) h q0[39];
-if(c0==0) h q0[40];
-if(c0==0) h q0[41];
-if(c0==0) h q0[42];
-if(c0==0) h q0[43];
-if(c0==0) h q0[44];
-if(c0==0) h q0[45];
-if(c0==0) h q0[46];
-if(c0==0) h q0[47];
-if(c0==0) h q0[48];
-if(c0==0) h q0[49];
-if(c0==0) h q0[50];
-if(c0==0) h q0[51];
-if(c0==0) h q0[52];
-if(c0==0) h q0[53];
-if(c0==0) h q0[54];
-if(c0==0) h q0[55];
-if(c0==0) h q0[56];
-if(c0==0) h q0[57];
-if(c0==0) h q0[58];
-if(c0==0) h q0[59];
-if(c0==0) h q0[60];
-if(c0==0) h q0[61];
-if(c0==0) h q0[62];
-if(c0==0) h q0[63];
-if(c0==0) h q0[64];
-if(c0==0) h q0[65];
-if(c0==0) h q0[66];
-if(c0==0) h q0[67];
-if(c0==0) h q0[68];
-if(c0==0) h q0[69];
-if(c0==0) h q0[70];
-if(c0==0) h q0[71];
-if(c0==0) h q0[72];
-if(c0==0) h q0[73];
-if(c0==0) h q0[74];
-if(c0==0) h q0[75];
-if(c0==0) h q0[76];
-if(c0==0) h q0[77];
-if(c0==0) h q0[78];
-if(c0==0) h q0[79];
-if(c0==0) h q0[80];
-if(c0==0) h q0[81];
-if(c0==0) h q0[82];
-if(c0==0) h q0[83];
-if(c0==0) h q0[84];
-if(c0==0) h q0[85];
-if(c0==0) h q0[86];
-if(c0==0) h q0[87];
-if(c0==0) h q0[88];
-if(c0==0) h q0[89];
-if(c0==0) h q0[90];
-if(c0==0) h q0[91];
-if(c0==0) h q0[92];
-if(c0==0) h q0[93];
-if(c0==0) h q0[94];
-if(c0==0) h q0[95];
-if(c0==0) h q0[96];
-if(c0==0) h q0[97];
-if(c0==0) h q0[98];
-if(c0==0) h q0[99];
-if(c0==0) h q0[100];
-if(c0==0) h q0[101];
-if(c0==0) h q0[102];
-if(c0==0) h q0[103];
-if(c0==0) h q0[104];
-if(c0==0) h q0[105];
-if(c0==0) h q0[106];
-if(c0==0) h q0[107];
-if(c0==0) h q0[108];
-if(c0==0) h q0[109];
-if(c0==0) h q0[110];
-if(c0==0) h q0[111];
-if(c0==0) h q0[112];
-if(c0==0) h q0[113];
-if(c0==0) h q0[114];
-if(c0==0) h q0[115];
-if(c0==0) h q0[116];
-if(c0==0) h q0[117];
-if(c0==0) h q0[118];
-if(c0==0) h q0[119];
-if(c0==0) h q0[120];
-if(c0==0) h q0[121];
-if(c0==0) h q0[122];
-if(c0==0) h q0[123];
-if(c0==0) h q0[124];
-if(c0==0) h q0[125];
-if(c0==0) h q0[126];
-if(c0==0) h q0[127];
-if(c0==0) h q0[128];
-if(c0==0) h q0[129];
-if(c0==0) h q0[130];
-if(c0==0) h q0[131];
-if(c0==0) h q0[132];
-if(c0==0) h q0[133];
-if(c0==0) h q0[134];
-if(c0==0) h q0[135];
-if(c0==0) h q0[136];
-if(c0==0) h q0[137];
-if(c0==0) h q0[138];
-if(c0==0) h q0[139];
-if(c0==0) h q0[140];
-if(c0==0) h q0[141];
-if(c0==0) h q0[142];
-if(c0==0) h q0[143];
-if(c0==0) h q0[144];
-if(c0==0) h q0[145];
-if(c0==0) h q0[146];
-if(c0==0) h q0[147];
-if(c0==0) h q0[148];
-if(c0==0) h q0[149];
-if(c0==0) h q0[150];
-if(c0==0) h q0[151];
-if(c0==0) h q0[152];
-if(c0==0) h q0[153];
-if(c0==0) h q0[154];
-if(c0==0) h q0[155];
-if(c0==0) h q0[156];
-if(c0==0) h q0[157];
-if(c0==0) h q0[158];
-if(c0==0) h q0[159];
-if(c0==0) h q0[160];
-if(c0==0) h q0[161];
-if(c0==0) h q0[162];
-if(c0==0) h q0[163];
-if(c0==0) h q0[164];
-if(c0==0) h q0[165];
-if(c0==0) h q0[166];
-if(c0==0) h q0[167];
-if(c0==0) h q0[168];
-if(c0==0) h q0[169];
-if(c0==0) h q0[170];
-if(c0==0) h q0[171];
-if(c0==0) h q0[172];
-if(c0==0) h q0[173];
-if(c0==0) h q0[174];
-if(c0==0) h q0[175];
-if(c0==0) h q0[176];
-if(c0==0) h q0[177];
-if(c0==0) h q0[178];
-if(c0==0) h q0[179];
-if(c0==0) h q0[180];
-if(c0==0) h q0[181];
-if(c0==0) h q0[182];
-if(c0==0) h q0[183];
-if(c0==0) h q0[184];
-if(c0==0) h q0[185];
-if(c0==0) h q0[186];
-if(c0==0) h q0[187];
-if(c0==0) h q0[188];
-if(c0==0) h q0[189];
-if(c0==0) h q0[190];
-if(c0==0) h q0[191];
-if(c0==0) h q0[192];
-if(c0==0) h q0[193];
-if(c0==0) h q0[194];
-if(c0==0) h q0[195];
-if(c0==0) h q0[196];
-if(c0==0) h q0[197];
-if(c0==0) h q0[198];
-if(c0==0) h q0[199];
-if(c0==0) h q0[200];
-if(c0==0) h q0[201];
-if(c0==0) h q0[202];
-if(c0==0) h q0[203];
-if(c0==0) h q0[204];
-if(c0==0) h q0[205];
-if(c0==0) h q0[206];
-if(c0==0) h q0[207];
-if(c0==0) h q0[208];
-if(c0==0) h q0[209];
-if(c0==0) h q0[210];
-if(c0==0) h q0[211];
-if(c0==0) h q0[212];
-if(c0==0) h q0[213];
-if(c0==0) h q0[214];
-if(c0==0) h q0[215];
-if(c0==0) h q0[216];
-if(c0==0) h q0[217];
-if(c0==0) h q0[218];
-if(c0==0) h q0[219];
-if(c0==0) h q0[220];
-if(c0==0) h q0[221];
-if(c0==0) h q0[222];
-if(c0==0) h q0[223];
-if(c0==0) h q0[224];
-if(c0==0) h q0[225];
-if(c0==0) h q0[226];
-if(c0==0) h q0[227];
-if(c0==0) h q0[228];
-if(c0==0) h q0[229];
-if(c0==0) h q0[230];
-if(c0==0) h q0[231];
-if(c0==0) h q0[232];
-if(c0==0) h q0[233];
-if(c0==0) h q0[234];
-if(c0==0) h q0[235];
-if(c0==0) h q0[236];
-if(c0==0) h q0[237];
-if(c0==0) h q0[238];
-if(c0==0) h q0[239];
-if(c0==0) h q0[240];
-if(c0==0) h q0[241];
-if(c0==0) h q0[242];
-if(c0==0) h q0[243];
-if(c0==0) h q0[244];
-if(c0==0) h q0[245];
-if(c0==0) h q0[246];
-if(c0==0) h q0[247];
-if(c0==0) h q0[248];
-if(c0==0) h q0[249];
-if(c0==0) h q0[250];
-if(c0==0) h q0[251];
-if(c0==0) h q0[252];
-if(c0==0) h q0[253];
-if(c0==0) h q0[254];
-if(c0==0) h q0[255];
-if(c0==0) h q0[256];
-if(c0==0) h q0[257];
-if(c0==0) h q0[258];
-if(c0==0) h q0[259];
-if(c0==0) h q0[260];
-if(c0==0) h q0[261];
-if(c0==0) h q0[262];
-if(c0==0) h q0[263];
-if(c0==0) h q0[264];
-if(c0==0) h q0[265];
-if(c0==0) h q0[266];
-if(c0==0) h q0[267];
-if(c0==0) h q0[268];
-if(c0==0) h q0[269];
-if(c0==0) h q0[270];
-if(c0==0) h q0[271];
-if(c0==0) h q0[272];
-if(c0==0) h q0[273];
-if(c0==0) h q0[274];
-if(c0==0) h q0[275];
-if(c0==0) h q0[276];
-if(c0==0) h q0[277];
-if(c0==0) h q0[278];
-if(c0==0) h q0[279];
-if(c0==0) h q0[280];
-if(c0==0) h q0[281];
-if(c0==0) h q0[282];
-if(c0==0) h q0[283];
-if(c0==0) h q0[284];
-if(c0==0) h q0[285];
-if(c0==0) h q0[286];
-if(c0==0) h q0[287];
-if(c0==0) h q0[288];
-if(c0==0) h q0[289];
-if(c0==0) h q0[290];
-if(c0==0) h q0[291];
-if(c0==0) h q0[292];
-if(c0==0) h q0[293];
-if(c0==0) h q0[294];
-if(c0==0) h q0[295];
-if(c0==0) h q0[296];
-if(c0==0) h q0[297];
-if(c0==0) h q0[298];
-if(c0==0) h q0[299];
-measure q0[0] -> c0[0];
-measure q0[1] -> c0[1];
-measure q0[2] -> c0[2];
-measure q0[3] -> c0[3];
-measure q0[4] -> c0[4];
-measure q0[5] -> c0[5];
-measure q0[6] -> c0[6];
-measure q0[7] -> c0[7];
-measure q0[8] -> c0[8];
-measure q0[9] -> c0[9];
-measure q0[10] -> c0[10];
-measure q0[11] -> c0[11];
-measure q0[12] -> c0[12];
-measure q0[13] -> c0[13];
-measure q0[14] -> c0[14];
-measure q0[15] -> c0[15];
-measure q0[16] -> c0[16];
-measure q0[17] -> c0[17];
-measure q0[18] -> c0[18];
-measure q0[19] -> c0[19];
-measure q0[20] -> c0[20];
-measure q0[21] -> c0[21];
-measure q0[22] -> c0[22];
-measure q0[23] -> c0[23];
-measure q0[24] -> c0[24];
-measure q0[25] -> c0[25];
-measure q0[26] -> c0[26];
-measure q0[27] -> c0[27];
-measure q0[28] -> c0[28];
-measure q0[29] -> c0[29];
-measure q0[30] -> c0[30];
-measure q0[31] -> c0[31];
-measure q0[32] -> c0[32];
-measure q0[33] -> c0[33];
-measure q0[34] -> c0[34];
-measure q0[35] -> c0[35];
-measure q0[36] -> c0[36];
-measure q0[37] -> c0[37];
-measure q0[38] -> c0[38];
-measure q0[39] -> c0[39];
-measure q0[40] -> c0[40];
-measure q0[41] -> c0[41];
-measure q0[42] -> c0[42];
-measure q0[43] -> c0[43];
-measure q0[44] -> c0[44];
-measure q0[45] -> c0[45];
-measure q0[46] -> c0[46];
-measure q0[47] -> c0[47];
-measure q0[48] -> c0[48];
-measure q0[49] -> c0[49];
-measure q0[50] -> c0[50];
-measure q0[51] -> c0[51];
-measure q0[52] -> c0[52];
-measure q0[53] -> c0[53];
-measure q0[54] -> c0[54];
-measure q0[55] -> c0[55];
-measure q0[56] -> c0[56];
-measure q0[57] -> c0[57];
-measure q0[58] -> c0[58];
-measure q0[59] -> c0[59];
-measure q0[60] -> c0[60];
-measure q0[61] -> c0[61];
-measure q0[62] -> c0[62];
-measure q0[63] -> c0[63];
-measure q0[64] -> c0[64];
-measure q0[65] -> c0[65];
-measure q0[66] -> c0[66];
-measure q0[67] -> c0[67];
-measure q0[68] -> c0[68];
-measure q0[69] -> c0[69];
-measure q0[70] -> c0[70];
-measure q0[71] -> c0[71];
-measure q0[72] -> c0[72];
-measure q0[73] -> c0[73];
-measure q0[74] -> c0[74];
-measure q0[75] -> c0[75];
-measure q0[76] -> c0[76];
-measure q0[77] -> c0[77];
-measure q0[78] -> c0[78];
-measure q0[79] -> c0[79];
-measure q0[80] -> c0[80];
-measure q0[81] -> c0[81];
-measure q0[82] -> c0[82];
-measure q0[83] -> c0[83];
-measure q0[84] -> c0[84];
-measure q0[85] -> c0[85];
-measure q0[86] -> c0[86];
-measure q0[87] -> c0[87];
-measure q0[88] -> c0[88];
-measure q0[89] -> c0[89];
-measure q0[90] -> c0[90];
-measure q0[91] -> c0[91];
-measure q0[92] -> c0[92];
-measure q0[93] -> c0[93];
-measure q0[94] -> c0[94];
-measure q0[95] -> c0[95];
-measure q0[96] -> c0[96];
-measure q0[97] -> c0[97];
-measure q0[98] -> c0[98];
-measure q0[99] -> c0[99];
-measure q0[100] -> c0[100];
-measure q0[101] -> c0[101];
-measure q0[102] -> c0[102];
-measure q0[103] -> c0[103];
-measure q0[104] -> c0[104];
-measure q0[105] -> c0[105];
-measure q0[106] -> c0[106];
-measure q0[107] -> c0[107];
-measure q0[108] -> c0[108];
-measure q0[109] -> c0[109];
-measure q0[110] -> c0[110];
-measure q0[111] -> c0[111];
-measure q0[112] -> c0[112];
-measure q0[113] -> c0[113];
-measure q0[114] -> c0[114];
-measure q0[115] -> c0[115];
-measure q0[116] -> c0[116];
-measure q0[117] -> c0[117];
-measure q0[118] -> c0[118];
-measure q0[119] -> c0[119];
-measure q0[120] -> c0[120];
-measure q0[121] -> c0[121];
-measure q0[122] -> c0[122];
-measure q0[123] -> c0[123];
-measure q0[124] -> c0[124];
-measure q0[125] -> c0[125];
-measure q0[126] -> c0[126];
-measure q0[127] -> c0[127];
-measure q0[128] -> c0[128];
-measure q0[129] -> c0[129];
-measure q0[130] -> c0[130];
-measure q0[131] -> c0[131];
-measure q0[132] -> c0[132];
-measure q0[133] -> c0[133];
-measure q0[134] -> c0[134];
-measure q0[135] -> c0[135];
-measure q0[136] -> c0[136];
-measure q0[137] -> c0[137];
-measure q0[138] -> c0[138];
-measure q0[139] -> c0[139];
-measure q0[140] -> c0[140];
-measure q0[141] -> c0[141];
-measure q0[142] -> c0[142];
-measure q0[143] -> c0[143];
-measure q0[144] -> c0[144];
-measure q0[145] -> c0[145];
-measure q0[146] -> c0[146];
-measure q0[147] -> c0[147];
-measure q0[148] -> c0[148];
-measure q0[149] -> c0[149];
-measure q0[150] -> c0[150];
-measure q0[151] -> c0[151];
-measure q0[152] -> c0[152];
-measure q0[153] -> c0[153];
-measure q0[154] -> c0[154];
-measure q0[155] -> c0[155];
-measure q0[156] -> c0[156];
-measure q0[157] -> c0[157];
-measure q0[158] -> c0[158];
-measure q0[159] -> c0[159];
-measure q0[160] -> c0[160];
-measure q0[161] -> c0[161];
-measure q0[162] -> c0[162];
-measure q0[163] -> c0[163];
-measure q0[164] -> c0[164];
-measure q0[165] -> c0[165];
-measure q0[166] -> c0[166];
-measure q0[167] -> c0[167];
-measure q0[168] -> c0[168];
-measure q0[169] -> c0[169];
-measure q0[170] -> c0[170];
-measure q0[171] -> c0[171];
-measure q0[172] -> c0[172];
-measure q0[173] -> c0[173];
-measure q0[174] -> c0[174];
-measure q0[175] -> c0[175];
-measure q0[176] -> c0[176];
-measure q0[177] -> c0[177];
-measure q0[178] -> c0[178];
-measure q0[179] -> c0[179];
-measure q0[180] -> c0[180];
-measure q0[181] -> c0[181];
-measure q0[182] -> c0[182];
-measure q0[183] -> c0[183];
-measure q0[184] -> c0[184];
-measure q0[185] -> c0[185];
-measure q0[186] -> c0[186];
-measure q0[187] -> c0[187];
-measure q0[188] -> c0[188];
-measure q0[189] -> c0[189];
-measure q0[190] -> c0[190];
-measure q0[191] -> c0[191];
-measure q0[192] -> c0[192];
-measure q0[193] -> c0[193];
-measure q0[194] -> c0[194];
-measure q0[195] -> c0[195];
-measure q0[196] -> c0[196];
-measure q0[197] -> c0[197];
-measure q0[198] -> c0[198];
-measure q0[199] -> c0[199];
-measure q0[200] -> c0[200];
-measure q0[201] -> c0[201];
-measure q0[202] -> c0[202];
-measure q0[203] -> c0[203];
-measure q0[204] -> c0[204];
-measure q0[205] -> c0[205];
-measure q0[206] -> c0[206];
-measure q0[207] -> c0[207];
-measure q0[208] -> c0[208];
-measure q0[209] -> c0[209];
-measure q0[210] -> c0[210];
-measure q0[211] -> c0[211];
-measure q0[212] -> c0[212];
-measure q0[213] -> c0[213];
-measure q0[214] -> c0[214];
-measure q0[215] -> c0[215];
-measure q0[216] -> c0[216];
-measure q0[217] -> c0[217];
-measure q0[218] -> c0[218];
-measure q0[219] -> c0[219];
-measure q0[220] -> c0[220];
-measure q0[221] -> c0[221];
-measure q0[222] -> c0[222];
-measure q0[223] -> c0[223];
-measure q0[224] -> c0[224];
-measure q0[225] -> c0[225];
-measure q0[226] -> c0[226];
-measure q0[227] -> c0[227];
-measure q0[228] -> c0[228];
-measure q0[229] -> c0[229];
-measure q0[230] -> c0[230];
-measure q0[231] -> c0[231];
-measure q0[232] -> c0[232];
-measure q0[233] -> c0[233];
-measure q0[234] -> c0[234];
-measure q0[235] -> c0[235];
-measure q0[236] -> c0[236];
-measure q0[237] -> c0[237];
-measure q0[238] -> c0[238];
-measure q0[239] -> c0[239];
-measure q0[240] -> c0[240];
-measure q0[241] -> c0[241];
-measure q0[242] -> c0[242];
-measure q0[243] -> c0[243];
-measure q0[244] -> c0[244];
-measure q0[245] -> c0[245];
-measure q0[246] -> c0[246];
-measure q0[247] -> c0[247];
-measure q0[248] -> c0[248];
-measure q0[249] -> c0[249];
-measure q0[250] -> c0[250];
-measure q0[251] -> c0[251];
-measure q0[252] -> c0[252];
-measure q0[253] -> c0[253];
-measure q0[254] -> c0[254];
-measure q0[255] -> c0[255];
-measure q0[256] -> c0[256];
-measure q0[257] -> c0[257];
-measure q0[258] -> c0[258];
-measure q0[259] -> c0[259];
-measure q0[260] -> c0[260];
-measure q0[261] -> c0[261];
-measure q0[262] -> c0[262];
-measure q0[263] -> c0[263];
-measure q0[264] -> c0[264];
-measure q0[265] -> c0[265];
-measure q0[266] -> c0[266];
-measure q0[267] -> c0[267];
-measure q0[268] -> c0[268];
-measure q0[269] -> c0[269];
-measure q0[270] -> c0[270];
-measure q0[271] -> c0[271];
-measure q0[272] -> c0[272];
-measure q0[273] -> c0[273];
-measure q0[274] -> c0[274];
-measure q0[275] -> c0[275];
-measure q0[276] -> c0[276];
-measure q0[277] -> c0[277];
-measure q0[278] -> c0[278];
-measure q0[279] -> c0[279];
-measure q0[280] -> c0[280];
-measure q0[281] -> c0[281];
-measure q0[282] -> c0[282];
-measure q0[283] -> c0[283];
-measure q0[284] -> c0[284];
-measure q0[285] -> c0[285];
-measure q0[286] -> c0[286];
-measure q0[287] -> c0[287];
-measure q0[288] -> c0[288];
-measure q0[289] -> c0[289];
-measure q0[290] -> c0[290];
-measure q0[291] -> c0[291];
-measure q0[292] -> c0[292];
-measure q0[293] -> c0[293];
-measure q0[294] -> c0[294];
-measure q0[295] -> c0[295];
-measure q0[296] -> c0[296];
-measure q0[297] -> c0[297];
-measure q0[298] -> c0[298];
-measure q0[299] -> c0[299];
@@ -1,325 +0,0 @@
-OPENQASM 2.0;
-include "qelib1.inc";
-qreg q0[64];
-creg c0[64];
-h q0[0];
-h q0[1];
-h q0[2];
-h q0[3];
-h q0[4];
-h q0[5];
-h q0[6];
-h q0[7];
-h q0[8];
-h q0[9];
-h q0[10];
-h q0[11];
-h q0[12];
-h q0[13];
-h q0[14];
-h q0[15];
-h q0[16];
-h q0[17];
-h q0[18];
-h q0[19];
-h q0[20];
-h q0[21];
-h q0[22];
-h q0[23];
-h q0[24];
-h q0[25];
-h q0[26];
-h q0[27];
-h q0[28];
-h q0[29];
-h q0[30];
-h q0[31];
-h q0[32];
-h q0[33];
-h q0[34];
-h q0[35];
-h q0[36];
-h q0[37];
-h q0[38];
-h q0[39];
-h q0[40];
-h q0[41];
-h q0[42];
-h q0[43];
-h q0[44];
-h q0[45];
-h q0[46];
-h q0[47];
-h q0[48];
-h q0[49];
-h q0[50];
-h q0[51];
-h q0[52];
-h q0[53];
-h q0[54];
-h q0[55];
-h q0[56];
-h q0[57];
-h q0[58];
-h q0[59];
-h q0[60];
-h q0[61];
-h q0[62];
-cx q0[0],q0[63];
-cx q0[1],q0[63];
-cx q0[2],q0[63];
-cx q0[3],q0[63];
-cx q0[4],q0[63];
-cx q0[5],q0[63];
-cx q0[6],q0[63];
-cx q0[7],q0[63];
-cx q0[8],q0[63];
-cx q0[9],q0[63];
-cx q0[10],q0[63];
-cx q0[11],q0[63];
-cx q0[12],q0[63];
-cx q0[13],q0[63];
-cx q0[14],q0[63];
-cx q0[15],q0[63];
-cx q0[16],q0[63];
-cx q0[17],q0[63];
-cx q0[18],q0[63];
-cx q0[19],q0[63];
-cx q0[20],q0[63];
-cx q0[21],q0[63];
-cx q0[22],q0[63];
-cx q0[23],q0[63];
-cx q0[24],q0[63];
-cx q0[25],q0[63];
-cx q0[26],q0[63];
-cx q0[27],q0[63];
-cx q0[28],q0[63];
-cx q0[29],q0[63];
-cx q0[30],q0[63];
-cx q0[31],q0[63];
-cx q0[32],q0[63];
-cx q0[33],q0[63];
-cx q0[34],q0[63];
-cx q0[35],q0[63];
-cx q0[36],q0[63];
-cx q0[37],q0[63];
-cx q0[38],q0[63];
-cx q0[39],q0[63];
-cx q0[40],q0[63];
-cx q0[41],q0[63];
-cx q0[42],q0[63];
-cx q0[43],q0[63];
-cx q0[44],q0[63];
-cx q0[45],q0[63];
-cx q0[46],q0[63];
-cx q0[47],q0[63];
-cx q0[48],q0[63];
-cx q0[49],q0[63];
-cx q0[50],q0[63];
-cx q0[51],q0[63];
-cx q0[52],q0[63];
-cx q0[53],q0[63];
-cx q0[54],q0[63];
-cx q0[55],q0[63];
-cx q0[56],q0[63];
-cx q0[57],q0[63];
-cx q0[58],q0[63];
-cx q0[59],q0[63];
-cx q0[60],q0[63];
-cx q0[61],q0[63];
-cx q0[62],q0[63];
-measure q0[63] -> c0[63];
-if(c0==0) x q0[63];
-if(c0==0) h q0[63];
-if(c0==9223372036854775808) h q0[0];
-if(c0==9223372036854775808) h q0[1];
-if(c0==9223372036854775808) h q0[2];
-if(c0==9223372036854775808) h q0[3];
-if(c0==9223372036854775808) h q0[4];
-if(c0==9223372036854775808) h q0[5];
-if(c0==9223372036854775808) h q0[6];
-if(c0==9223372036854775808) h q0[7];
-if(c0==9223372036854775808) h q0[8];
-if(c0==9223372036854775808) h q0[9];
-if(c0==9223372036854775808) h q0[10];
-if(c0==9223372036854775808) h q0[11];
-if(c0==9223372036854775808) h q0[12];
-if(c0==9223372036854775808) h q0[13];
-if(c0==9223372036854775808) h q0[14];
-if(c0==9223372036854775808) h q0[15];
-if(c0==9223372036854775808) h q0[16];
-if(c0==9223372036854775808) h q0[17];
-if(c0==9223372036854775808) h q0[18];
-if(c0==9223372036854775808) h q0[19];
-if(c0==9223372036854775808) h q0[20];
-if(c0==9223372036854775808) h q0[21];
-if(c0==9223372036854775808) h q0[22];
-if(c0==9223372036854775808) h q0[23];
-if(c0==9223372036854775808) h q0[24];
-if(c0==9223372036854775808) h q0[25];
-if(c0==9223372036854775808) h q0[26];
-if(c0==9223372036854775808) h q0[27];
-if(c0==9223372036854775808) h q0[28];
-if(c0==9223372036854775808) h q0[29];
-if(c0==9223372036854775808) h q0[30];
-if(c0==9223372036854775808) h q0[31];
-if(c0==9223372036854775808) h q0[32];
-if(c0==9223372036854775808) h q0[33];
-if(c0==9223372036854775808) h q0[34];
-if(c0==9223372036854775808) h q0[35];
-if(c0==9223372036854775808) h q0[36];
-if(c0==9223372036854775808) h q0[37];
-if(c0==9223372036854775808) h q0[38];
-if(c0==9223372036854775808) h q0[39];
-if(c0==9223372036854775808) h q0[40];
-if(c0==9223372036854775808) h q0[41];
-if(c0==9223372036854775808) h q0[42];
-if(c0==9223372036854775808) h q0[43];
-if(c0==9223372036854775808) h q0[44];
-if(c0==9223372036854775808) h q0[45];
-if(c0==9223372036854775808) h q0[46];
-if(c0==9223372036854775808) h q0[47];
-if(c0==9223372036854775808) h q0[48];
-if(c0==9223372036854775808) h q0[49];
-if(c0==9223372036854775808) h q0[50];
-if(c0==9223372036854775808) h q0[51];
-if(c0==9223372036854775808) h q0[52];
-if(c0==9223372036854775808) h q0[53];
-if(c0==9223372036854775808) h q0[54];
-if(c0==9223372036854775808) h q0[55];
-if(c0==9223372036854775808) h q0[56];
-if(c0==9223372036854775808) h q0[57];
-if(c0==9223372036854775808) h q0[58];
-if(c0==9223372036854775808) h q0[59];
-if(c0==9223372036854775808) h q0[60];
-if(c0==9223372036854775808) h q0[61];
-if(c0==9223372036854775808) h q0[62];
-barrier q0[0],q0[1],q0[2],q0[3],q0[4],q0[5],q0[6],q0[7],q0[8],q0[9],q0[10],q0[11],q0[12],q0[13],q0[14],q0[15],q0[16],q0[17],q0[18],q0[19],q0[20],q0[21],q0[22],q0[23],q0[24],q0[25],q0[26],q0[27],q0[28],q0[29],q0[30],q0[31],q0[32],q0[33],q0[34],q0[35],q0[36],q0[37],q0[38],q0[39],q0[40],q0[41],q0[42],q0[43],q0[44],q0[45],q0[46],q0[47],q0[48],q0[49],q0[50],q0[51],q0[52],q0[53],q0[54],q0[55],q0[56],q0[57],q0[58],q0[59],q0[60],q0[61],q0[62],q0[63];
-if(c0==0) cx q0[12],q0[63];
-barrier q0[0],q0[1],q0[2],q0[3],q0[4],q0[5],q0[6],q0[7],q0[8],q0[9],q0[10],q0[11],q0[12],q0[13],q0[14],q0[15],q0[16],q0[17],q0[18],q0[19],q0[20],q0[21],q0[22],q0[23],q0[24],q0[25],q0[26],q0[27],q0[28],q0[29],q0[30],q0[31],q0[32],q0[33],q0[34],q0[35],q0[36],q0[37],q0[38],q0[39],q0[40],q0[41],q0[42],q0[43],q0[44],q0[45],q0[46],q0[47],q0[48],q0[49],q0[50],q0[51],q0[52],q0[53],q0[54],q0[55],q0[56],q0[57],q0[58],q0[59],q0[60],q0[61],q0[62],q0[63];
-if(c0==0) h q0[0];
-if(c0==0) h q0[1];
-if(c0==0) h q0[2];
-if(c0==0) h q0[3];
-if(c0==0) h q0[4];
-if(c0==0) h q0[5];
-if(c0==0) h q0[6];
-if(c0==0) h q0[7];
-if(c0==0) h q0[8];
-if(c0==0) h q0[9];
-if(c0==0) h q0[10];
-if(c0==0) h q0[11];
-if(c0==0) h q0[12];
-if(c0==0) h q0[13];
-if(c0==0) h q0[14];
-if(c0==0) h q0[15];
-if(c0==0) h q0[16];
-if(c0==0) h q0[17];
-if(c0==0) h q0[18];
-if(c0==0) h q0[19];
-if(c0==0) h q0[20];
-if(c0==0) h q0[21];
-if(c0==0) h q0[22];
-if(c0==0) h q0[23];
-if(c0==0) h q0[24];
-if(c0==0) h q0[25];
-if(c0==0) h q0[26];
-if(c0==0) h q0[27];
-if(c0==0) h q0[28];
-if(c0==0) h q0[29];
-if(c0==0) h q0[30];
-if(c0==0) h q0[31];
-if(c0==0) h q0[32];
-if(c0==0) h q0[33];
-if(c0==0) h q0[34];
-if(c0==0) h q0[35];
-if(c0==0) h q0[36];
-if(c0==0) h q0[37];
-if(c0==0) h q0[38];
-if(c0==0) h q0[39];
-if(c0==0) h q0[40];
-if(c0==0) h q0[41];
-if(c0==0) h q0[42];
-if(c0==0) h q0[43];
-if(c0==0) h q0[44];
-if(c0==0) h q0[45];
-if(c0==0) h q0[46];
-if(c0==0) h q0[47];
-if(c0==0) h q0[48];
-if(c0==0) h q0[49];
-if(c0==0) h q0[50];
-if(c0==0) h q0[51];
-if(c0==0) h q0[52];
-if(c0==0) h q0[53];
-if(c0==0) h q0[54];
-if(c0==0) h q0[55];
-if(c0==0) h q0[56];
-if(c0==0) h q0[57];
-if(c0==0) h q0[58];
-if(c0==0) h q0[59];
-if(c0==0) h q0[60];
-if(c0==0) h q0[61];
-if(c0==0) h q0[62];
-measure q0[0] -> c0[0];
-measure q0[1] -> c0[1];
-measure q0[2] -> c0[2];
-measure q0[3] -> c0[3];
-measure q0[4] -> c0[4];
-measure q0[5] -> c0[5];
-measure q0[6] -> c0[6];
-measure q0[7] -> c0[7];
-measure q0[8] -> c0[8];
-measure q0[9] -> c0[9];
-measure q0[10] -> c0[10];
-measure q0[11] -> c0[11];
-measure q0[12] -> c0[12];
-measure q0[13] -> c0[13];
-measure q0[14] -> c0[14];
-measure q0[15] -> c0[15];
-measure q0[16] -> c0[16];
-measure q0[17] -> c0[17];
-measure q0[18] -> c0[18];
-measure q0[19] -> c0[19];
-measure q0[20] -> c0[20];
-measure q0[21] -> c0[21];
-measure q0[22] -> c0[22];
-measure q0[23] -> c0[23];
-measure q0[24] -> c0[24];
-measure q0[25] -> c0[25];
-measure q0[26] -> c0[26];
-measure q0[27] -> c0[27];
-measure q0[28] -> c0[28];
-measure q0[29] -> c0[29];
-measure q0[30] -> c0[30];
-measure q0[31] -> c0[31];
-measure q0[32] -> c0[32];
-measure q0[33] -> c0[33];
-measure q0[34] -> c0[34];
-measure q0[35] -> c0[35];
-measure q0[36] -> c0[36];
-measure q0[37] -> c0[37];
-measure q0[38] -> c0[38];
-measure q0[39] -> c0[39];
-measure q0[40] -> c0[40];
-measure q0[41] -> c0[41];
-measure q0[42] -> c0[42];
-measure q0[43] -> c0[43];
-measure q0[44] -> c0[44];
-measure q0[45] -> c0[45];
-measure q0[46] -> c0[46];
-measure q0[47] -> c0[47];
-measure q0[48] -> c0[48];
-measure q0[49] -> c0[49];
-measure q0[50] -> c0[50];
-measure q0[51] -> c0[51];
-measure q0[52] -> c0[52];
-measure q0[53] -> c0[53];
-measure q0[54] -> c0[54];
-measure q0[55] -> c0[55];
-measure q0[56] -> c0[56];
-measure q0[57] -> c0[57];
-measure q0[58] -> c0[58];
-measure q0[59] -> c0[59];
-measure q0[60] -> c0[60];
-measure q0[61] -> c0[61];
-measure q0[62] -> c0[62];
@@ -1,705 +0,0 @@
-OPENQASM 2.0;
-include "qelib1.inc";
-qreg q0[64];
-creg c0[64];
-rz(pi/2) q0[0];
-sx q0[0];
-rz(pi/2) q0[0];
-rz(pi/2) q0[1];
-sx q0[1];
-rz(pi/2) q0[1];
-rz(pi/2) q0[2];
-sx q0[2];
-rz(pi/2) q0[2];
-rz(pi/2) q0[3];
-sx q0[3];
-rz(pi/2) q0[3];
-rz(pi/2) q0[4];
-sx q0[4];
-rz(pi/2) q0[4];
-rz(pi/2) q0[5];
-sx q0[5];
-rz(pi/2) q0[5];
-rz(pi/2) q0[6];
-sx q0[6];
-rz(pi/2) q0[6];
-rz(pi/2) q0[7];
-sx q0[7];
-rz(pi/2) q0[7];
-rz(pi/2) q0[8];
-sx q0[8];
-rz(pi/2) q0[8];
-rz(pi/2) q0[9];
-sx q0[9];
-rz(pi/2) q0[9];
-rz(pi/2) q0[10];
-sx q0[10];
-rz(pi/2) q0[10];
-rz(pi/2) q0[11];
-sx q0[11];
-rz(pi/2) q0[11];
-rz(pi/2) q0[12];
-sx q0[12];
-rz(pi/2) q0[12];
-rz(pi/2) q0[13];
-sx q0[13];
-rz(pi/2) q0[13];
-rz(pi/2) q0[14];
-sx q0[14];
-rz(pi/2) q0[14];
-rz(pi/2) q0[15];
-sx q0[15];
-rz(pi/2) q0[15];
-rz(pi/2) q0[16];
-sx q0[16];
-rz(pi/2) q0[16];
-rz(pi/2) q0[17];
-sx q0[17];
-rz(pi/2) q0[17];
-rz(pi/2) q0[18];
-sx q0[18];
-rz(pi/2) q0[18];
-rz(pi/2) q0[19];
-sx q0[19];
-rz(pi/2) q0[19];
-rz(pi/2) q0[20];
-sx q0[20];
-rz(pi/2) q0[20];
-rz(pi/2) q0[21];
-sx q0[21];
-rz(pi/2) q0[21];
-rz(pi/2) q0[22];
-sx q0[22];
-rz(pi/2) q0[22];
-rz(pi/2) q0[23];
-sx q0[23];
-rz(pi/2) q0[23];
-rz(pi/2) q0[24];
-sx q0[24];
-rz(pi/2) q0[24];
-rz(pi/2) q0[25];
-sx q0[25];
-rz(pi/2) q0[25];
-rz(pi/2) q0[26];
-sx q0[26];
-rz(pi/2) q0[26];
-rz(pi/2) q0[27];
-sx q0[27];
-rz(pi/2) q0[27];
-rz(pi/2) q0[28];
-sx q0[28];
-rz(pi/2) q0[28];
-rz(pi/2) q0[29];
-sx q0[29];
-rz(pi/2) q0[29];
-rz(pi/2) q0[30];
-sx q0[30];
-rz(pi/2) q0[30];
-rz(pi/2) q0[31];
-sx q0[31];
-rz(pi/2) q0[31];
-rz(pi/2) q0[32];
-sx q0[32];
-rz(pi/2) q0[32];
-rz(pi/2) q0[33];
-sx q0[33];
-rz(pi/2) q0[33];
-rz(pi/2) q0[34];
-sx q0[34];
-rz(pi/2) q0[34];
-rz(pi/2) q0[35];
-sx q0[35];
-rz(pi/2) q0[35];
-rz(pi/2) q0[36];
-sx q0[36];
-rz(pi/2) q0[36];
-rz(pi/2) q0[37];
-sx q0[37];
-rz(pi/2) q0[37];
-rz(pi/2) q0[38];
-sx q0[38];
-rz(pi/2) q0[38];
-rz(pi/2) q0[39];
-sx q0[39];
-rz(pi/2) q0[39];
-rz(pi/2) q0[40];
-sx q0[40];
-rz(pi/2) q0[40];
-rz(pi/2) q0[41];
-sx q0[41];
-rz(pi/2) q0[41];
-rz(pi/2) q0[42];
-sx q0[42];
-rz(pi/2) q0[42];
-rz(pi/2) q0[43];
-sx q0[43];
-rz(pi/2) q0[43];
-rz(pi/2) q0[44];
-sx q0[44];
-rz(pi/2) q0[44];
-rz(pi/2) q0[45];
-sx q0[45];
-rz(pi/2) q0[45];
-rz(pi/2) q0[46];
-sx q0[46];
-rz(pi/2) q0[46];
-rz(pi/2) q0[47];
-sx q0[47];
-rz(pi/2) q0[47];
-rz(pi/2) q0[48];
-sx q0[48];
-rz(pi/2) q0[48];
-rz(pi/2) q0[49];
-sx q0[49];
-rz(pi/2) q0[49];
-rz(pi/2) q0[50];
-sx q0[50];
-rz(pi/2) q0[50];
-rz(pi/2) q0[51];
-sx q0[51];
-rz(pi/2) q0[51];
-rz(pi/2) q0[52];
-sx q0[52];
-rz(pi/2) q0[52];
-rz(pi/2) q0[53];
-sx q0[53];
-rz(pi/2) q0[53];
-rz(pi/2) q0[54];
-sx q0[54];
-rz(pi/2) q0[54];
-rz(pi/2) q0[55];
-sx q0[55];
-rz(pi/2) q0[55];
-rz(pi/2) q0[56];
-sx q0[56];
-rz(pi/2) q0[56];
-rz(pi/2) q0[57];
-sx q0[57];
-rz(pi/2) q0[57];
-rz(pi/2) q0[58];
-sx q0[58];
-rz(pi/2) q0[58];
-rz(pi/2) q0[59];
-sx q0[59];
-rz(pi/2) q0[59];
-rz(pi/2) q0[60];
-sx q0[60];
-rz(pi/2) q0[60];
-rz(pi/2) q0[61];
-sx q0[61];
-rz(pi/2) q0[61];
-rz(pi/2) q0[62];
-sx q0[62];
-rz(pi/2) q0[62];
-cx q0[0],q0[63];
-cx q0[1],q0[63];
-cx q0[2],q0[63];
-cx q0[3],q0[63];
-cx q0[4],q0[63];
-cx q0[5],q0[63];
-cx q0[6],q0[63];
-cx q0[7],q0[63];
-cx q0[8],q0[63];
-cx q0[9],q0[63];
-cx q0[10],q0[63];
-cx q0[11],q0[63];
-cx q0[12],q0[63];
-cx q0[13],q0[63];
-cx q0[14],q0[63];
-cx q0[15],q0[63];
-cx q0[16],q0[63];
-cx q0[17],q0[63];
-cx q0[18],q0[63];
-cx q0[19],q0[63];
-cx q0[20],q0[63];
-cx q0[21],q0[63];
-cx q0[22],q0[63];
-cx q0[23],q0[63];
-cx q0[24],q0[63];
-cx q0[25],q0[63];
-cx q0[26],q0[63];
-cx q0[27],q0[63];
-cx q0[28],q0[63];
-cx q0[29],q0[63];
-cx q0[30],q0[63];
-cx q0[31],q0[63];
-cx q0[32],q0[63];
-cx q0[33],q0[63];
-cx q0[34],q0[63];
-cx q0[35],q0[63];
-cx q0[36],q0[63];
-cx q0[37],q0[63];
-cx q0[38],q0[63];
-cx q0[39],q0[63];
-cx q0[40],q0[63];
-cx q0[41],q0[63];
-cx q0[42],q0[63];
-cx q0[43],q0[63];
-cx q0[44],q0[63];
-cx q0[45],q0[63];
-cx q0[46],q0[63];
-cx q0[47],q0[63];
-cx q0[48],q0[63];
-cx q0[49],q0[63];
-cx q0[50],q0[63];
-cx q0[51],q0[63];
-cx q0[52],q0[63];
-cx q0[53],q0[63];
-cx q0[54],q0[63];
-cx q0[55],q0[63];
-cx q0[56],q0[63];
-cx q0[57],q0[63];
-cx q0[58],q0[63];
-cx q0[59],q0[63];
-cx q0[60],q0[63];
-cx q0[61],q0[63];
-cx q0[62],q0[63];
-measure q0[63] -> c0[63];
-if(c0==0) x q0[63];
-if(c0==0) rz(pi/2) q0[63];
-if(c0==0) sx q0[63];
-if(c0==0) rz(pi/2) q0[63];
-if(c0==9223372036854775808) rz(pi/2) q0[0];
-if(c0==9223372036854775808) sx q0[0];
-if(c0==9223372036854775808) rz(pi/2) q0[0];
-if(c0==9223372036854775808) rz(pi/2) q0[1];
-if(c0==9223372036854775808) sx q0[1];
-if(c0==9223372036854775808) rz(pi/2) q0[1];
-if(c0==9223372036854775808) rz(pi/2) q0[2];
-if(c0==9223372036854775808) sx q0[2];
-if(c0==9223372036854775808) rz(pi/2) q0[2];
-if(c0==9223372036854775808) rz(pi/2) q0[3];
-if(c0==9223372036854775808) sx q0[3];
-if(c0==9223372036854775808) rz(pi/2) q0[3];
-if(c0==9223372036854775808) rz(pi/2) q0[4];
-if(c0==9223372036854775808) sx q0[4];
-if(c0==9223372036854775808) rz(pi/2) q0[4];
-if(c0==9223372036854775808) rz(pi/2) q0[5];
-if(c0==9223372036854775808) sx q0[5];
-if(c0==9223372036854775808) rz(pi/2) q0[5];
-if(c0==9223372036854775808) rz(pi/2) q0[6];
-if(c0==9223372036854775808) sx q0[6];
-if(c0==9223372036854775808) rz(pi/2) q0[6];
-if(c0==9223372036854775808) rz(pi/2) q0[7];
-if(c0==9223372036854775808) sx q0[7];
-if(c0==9223372036854775808) rz(pi/2) q0[7];
-if(c0==9223372036854775808) rz(pi/2) q0[8];
-if(c0==9223372036854775808) sx q0[8];
-if(c0==9223372036854775808) rz(pi/2) q0[8];
-if(c0==9223372036854775808) rz(pi/2) q0[9];
-if(c0==9223372036854775808) sx q0[9];
-if(c0==9223372036854775808) rz(pi/2) q0[9];
-if(c0==9223372036854775808) rz(pi/2) q0[10];
-if(c0==9223372036854775808) sx q0[10];
-if(c0==9223372036854775808) rz(pi/2) q0[10];
-if(c0==9223372036854775808) rz(pi/2) q0[11];
-if(c0==9223372036854775808) sx q0[11];
-if(c0==9223372036854775808) rz(pi/2) q0[11];
-if(c0==9223372036854775808) rz(pi/2) q0[12];
-if(c0==9223372036854775808) sx q0[12];
-if(c0==9223372036854775808) rz(pi/2) q0[12];
-if(c0==9223372036854775808) rz(pi/2) q0[13];
-if(c0==9223372036854775808) sx q0[13];
-if(c0==9223372036854775808) rz(pi/2) q0[13];
-if(c0==9223372036854775808) rz(pi/2) q0[14];
-if(c0==9223372036854775808) sx q0[14];
-if(c0==9223372036854775808) rz(pi/2) q0[14];
-if(c0==9223372036854775808) rz(pi/2) q0[15];
-if(c0==9223372036854775808) sx q0[15];
-if(c0==9223372036854775808) rz(pi/2) q0[15];
-if(c0==9223372036854775808) rz(pi/2) q0[16];
-if(c0==9223372036854775808) sx q0[16];
-if(c0==9223372036854775808) rz(pi/2) q0[16];
-if(c0==9223372036854775808) rz(pi/2) q0[17];
-if(c0==9223372036854775808) sx q0[17];
-if(c0==9223372036854775808) rz(pi/2) q0[17];
-if(c0==9223372036854775808) rz(pi/2) q0[18];
-if(c0==9223372036854775808) sx q0[18];
-if(c0==9223372036854775808) rz(pi/2) q0[18];
-if(c0==9223372036854775808) rz(pi/2) q0[19];
-if(c0==9223372036854775808) sx q0[19];
-if(c0==9223372036854775808) rz(pi/2) q0[19];
-if(c0==9223372036854775808) rz(pi/2) q0[20];
-if(c0==9223372036854775808) sx q0[20];
-if(c0==9223372036854775808) rz(pi/2) q0[20];
-if(c0==9223372036854775808) rz(pi/2) q0[21];
-if(c0==9223372036854775808) sx q0[21];
-if(c0==9223372036854775808) rz(pi/2) q0[21];
-if(c0==9223372036854775808) rz(pi/2) q0[22];
-if(c0==9223372036854775808) sx q0[22];
-if(c0==9223372036854775808) rz(pi/2) q0[22];
-if(c0==9223372036854775808) rz(pi/2) q0[23];
-if(c0==9223372036854775808) sx q0[23];
-if(c0==9223372036854775808) rz(pi/2) q0[23];
-if(c0==9223372036854775808) rz(pi/2) q0[24];
-if(c0==9223372036854775808) sx q0[24];
-if(c0==9223372036854775808) rz(pi/2) q0[24];
-if(c0==9223372036854775808) rz(pi/2) q0[25];
-if(c0==9223372036854775808) sx q0[25];
-if(c0==9223372036854775808) rz(pi/2) q0[25];
-if(c0==9223372036854775808) rz(pi/2) q0[26];
-if(c0==9223372036854775808) sx q0[26];
-if(c0==9223372036854775808) rz(pi/2) q0[26];
-if(c0==9223372036854775808) rz(pi/2) q0[27];
-if(c0==9223372036854775808) sx q0[27];
-if(c0==9223372036854775808) rz(pi/2) q0[27];
-if(c0==9223372036854775808) rz(pi/2) q0[28];
-if(c0==9223372036854775808) sx q0[28];
-if(c0==9223372036854775808) rz(pi/2) q0[28];
-if(c0==9223372036854775808) rz(pi/2) q0[29];
-if(c0==9223372036854775808) sx q0[29];
-if(c0==9223372036854775808) rz(pi/2) q0[29];
-if(c0==9223372036854775808) rz(pi/2) q0[30];
-if(c0==9223372036854775808) sx q0[30];
-if(c0==9223372036854775808) rz(pi/2) q0[30];
-if(c0==9223372036854775808) rz(pi/2) q0[31];
-if(c0==9223372036854775808) sx q0[31];
-if(c0==9223372036854775808) rz(pi/2) q0[31];
-if(c0==9223372036854775808) rz(pi/2) q0[32];
-if(c0==9223372036854775808) sx q0[32];
-if(c0==9223372036854775808) rz(pi/2) q0[32];
-if(c0==9223372036854775808) rz(pi/2) q0[33];
-if(c0==9223372036854775808) sx q0[33];
-if(c0==9223372036854775808) rz(pi/2) q0[33];
-if(c0==9223372036854775808) rz(pi/2) q0[34];
-if(c0==9223372036854775808) sx q0[34];
-if(c0==9223372036854775808) rz(pi/2) q0[34];
-if(c0==9223372036854775808) rz(pi/2) q0[35];
-if(c0==9223372036854775808) sx q0[35];
-if(c0==9223372036854775808) rz(pi/2) q0[35];
-if(c0==9223372036854775808) rz(pi/2) q0[36];
-if(c0==9223372036854775808) sx q0[36];
-if(c0==9223372036854775808) rz(pi/2) q0[36];
-if(c0==9223372036854775808) rz(pi/2) q0[37];
-if(c0==9223372036854775808) sx q0[37];
-if(c0==9223372036854775808) rz(pi/2) q0[37];
-if(c0==9223372036854775808) rz(pi/2) q0[38];
-if(c0==9223372036854775808) sx q0[38];
-if(c0==9223372036854775808) rz(pi/2) q0[38];
-if(c0==9223372036854775808) rz(pi/2) q0[39];
-if(c0==9223372036854775808) sx q0[39];
-if(c0==9223372036854775808) rz(pi/2) q0[39];
-if(c0==9223372036854775808) rz(pi/2) q0[40];
-if(c0==9223372036854775808) sx q0[40];
-if(c0==9223372036854775808) rz(pi/2) q0[40];
-if(c0==9223372036854775808) rz(pi/2) q0[41];
-if(c0==9223372036854775808) sx q0[41];
-if(c0==9223372036854775808) rz(pi/2) q0[41];
-if(c0==9223372036854775808) rz(pi/2) q0[42];
-if(c0==9223372036854775808) sx q0[42];
-if(c0==9223372036854775808) rz(pi/2) q0[42];
-if(c0==9223372036854775808) rz(pi/2) q0[43];
-if(c0==9223372036854775808) sx q0[43];
-if(c0==9223372036854775808) rz(pi/2) q0[43];
-if(c0==9223372036854775808) rz(pi/2) q0[44];
-if(c0==9223372036854775808) sx q0[44];
-if(c0==9223372036854775808) rz(pi/2) q0[44];
-if(c0==9223372036854775808) rz(pi/2) q0[45];
-if(c0==9223372036854775808) sx q0[45];
-if(c0==9223372036854775808) rz(pi/2) q0[45];
-if(c0==9223372036854775808) rz(pi/2) q0[46];
-if(c0==9223372036854775808) sx q0[46];
-if(c0==9223372036854775808) rz(pi/2) q0[46];
-if(c0==9223372036854775808) rz(pi/2) q0[47];
-if(c0==9223372036854775808) sx q0[47];
-if(c0==9223372036854775808) rz(pi/2) q0[47];
-if(c0==9223372036854775808) rz(pi/2) q0[48];
-if(c0==9223372036854775808) sx q0[48];
-if(c0==9223372036854775808) rz(pi/2) q0[48];
-if(c0==9223372036854775808) rz(pi/2) q0[49];
-if(c0==9223372036854775808) sx q0[49];
-if(c0==9223372036854775808) rz(pi/2) q0[49];
-if(c0==9223372036854775808) rz(pi/2) q0[50];
-if(c0==9223372036854775808) sx q0[50];
-if(c0==9223372036854775808) rz(pi/2) q0[50];
-if(c0==9223372036854775808) rz(pi/2) q0[51];
-if(c0==9223372036854775808) sx q0[51];
-if(c0==9223372036854775808) rz(pi/2) q0[51];
-if(c0==9223372036854775808) rz(pi/2) q0[52];
-if(c0==9223372036854775808) sx q0[52];
-if(c0==9223372036854775808) rz(pi/2) q0[52];
-if(c0==9223372036854775808) rz(pi/2) q0[53];
-if(c0==9223372036854775808) sx q0[53];
-if(c0==9223372036854775808) rz(pi/2) q0[53];
-if(c0==9223372036854775808) rz(pi/2) q0[54];
-if(c0==9223372036854775808) sx q0[54];
-if(c0==9223372036854775808) rz(pi/2) q0[54];
-if(c0==9223372036854775808) rz(pi/2) q0[55];
-if(c0==9223372036854775808) sx q0[55];
-if(c0==9223372036854775808) rz(pi/2) q0[55];
-if(c0==9223372036854775808) rz(pi/2) q0[56];
-if(c0==9223372036854775808) sx q0[56];
-if(c0==9223372036854775808) rz(pi/2) q0[56];
-if(c0==9223372036854775808) rz(pi/2) q0[57];
-if(c0==9223372036854775808) sx q0[57];
-if(c0==9223372036854775808) rz(pi/2) q0[57];
-if(c0==9223372036854775808) rz(pi/2) q0[58];
-if(c0==9223372036854775808) sx q0[58];
-if(c0==9223372036854775808) rz(pi/2) q0[58];
-if(c0==9223372036854775808) rz(pi/2) q0[59];
-if(c0==9223372036854775808) sx q0[59];
-if(c0==9223372036854775808) rz(pi/2) q0[59];
-if(c0==9223372036854775808) rz(pi/2) q0[60];
-if(c0==9223372036854775808) sx q0[60];
-if(c0==9223372036854775808) rz(pi/2) q0[60];
-if(c0==9223372036854775808) rz(pi/2) q0[61];
-if(c0==9223372036854775808) sx q0[61];
-if(c0==9223372036854775808) rz(pi/2) q0[61];
-if(c0==9223372036854775808) rz(pi/2) q0[62];
-if(c0==9223372036854775808) sx q0[62];
-if(c0==9223372036854775808) rz(pi/2) q0[62];
-barrier q0[0],q0[1],q0[2],q0[3],q0[4],q0[5],q0[6],q0[7],q0[8],q0[9],q0[10],q0[11],q0[12],q0[13],q0[14],q0[15],q0[16],q0[17],q0[18],q0[19],q0[20],q0[21],q0[22],q0[23],q0[24],q0[25],q0[26],q0[27],q0[28],q0[29],q0[30],q0[31],q0[32],q0[33],q0[34],q0[35],q0[36],q0[37],q0[38],q0[39],q0[40],q0[41],q0[42],q0[43],q0[44],q0[45],q0[46],q0[47],q0[48],q0[49],q0[50],q0[51],q0[52],q0[53],q0[54],q0[55],q0[56],q0[57],q0[58],q0[59],q0[60],q0[61],q0[62],q0[63];
-if(c0==0) cx q0[12],q0[63];
-barrier q0[0],q0[1],q0[2],q0[3],q0[4],q0[5],q0[6],q0[7],q0[8],q0[9],q0[10],q0[11],q0[12],q0[13],q0[14],q0[15],q0[16],q0[17],q0[18],q0[19],q0[20],q0[21],q0[22],q0[23],q0[24],q0[25],q0[26],q0[27],q0[28],q0[29],q0[30],q0[31],q0[32],q0[33],q0[34],q0[35],q0[36],q0[37],q0[38],q0[39],q0[40],q0[41],q0[42],q0[43],q0[44],q0[45],q0[46],q0[47],q0[48],q0[49],q0[50],q0[51],q0[52],q0[53],q0[54],q0[55],q0[56],q0[57],q0[58],q0[59],q0[60],q0[61],q0[62],q0[63];
-if(c0==0) rz(pi/2) q0[0];
-if(c0==0) sx q0[0];
-if(c0==0) rz(pi/2) q0[0];
-if(c0==0) rz(pi/2) q0[1];
-if(c0==0) sx q0[1];
-if(c0==0) rz(pi/2) q0[1];
-if(c0==0) rz(pi/2) q0[2];
-if(c0==0) sx q0[2];
-if(c0==0) rz(pi/2) q0[2];
-if(c0==0) rz(pi/2) q0[3];
-if(c0==0) sx q0[3];
-if(c0==0) rz(pi/2) q0[3];
-if(c0==0) rz(pi/2) q0[4];
-if(c0==0) sx q0[4];
-if(c0==0) rz(pi/2) q0[4];
-if(c0==0) rz(pi/2) q0[5];
-if(c0==0) sx q0[5];
-if(c0==0) rz(pi/2) q0[5];
-if(c0==0) rz(pi/2) q0[6];
-if(c0==0) sx q0[6];
-if(c0==0) rz(pi/2) q0[6];
-if(c0==0) rz(pi/2) q0[7];
-if(c0==0) sx q0[7];
-if(c0==0) rz(pi/2) q0[7];
-if(c0==0) rz(pi/2) q0[8];
-if(c0==0) sx q0[8];
-if(c0==0) rz(pi/2) q0[8];
-if(c0==0) rz(pi/2) q0[9];
-if(c0==0) sx q0[9];
-if(c0==0) rz(pi/2) q0[9];
-if(c0==0) rz(pi/2) q0[10];
-if(c0==0) sx q0[10];
-if(c0==0) rz(pi/2) q0[10];
-if(c0==0) rz(pi/2) q0[11];
-if(c0==0) sx q0[11];
-if(c0==0) rz(pi/2) q0[11];
-if(c0==0) rz(pi/2) q0[12];
-if(c0==0) sx q0[12];
-if(c0==0) rz(pi/2) q0[12];
-if(c0==0) rz(pi/2) q0[13];
-if(c0==0) sx q0[13];
-if(c0==0) rz(pi/2) q0[13];
-if(c0==0) rz(pi/2) q0[14];
-if(c0==0) sx q0[14];
-if(c0==0) rz(pi/2) q0[14];
-if(c0==0) rz(pi/2) q0[15];
-if(c0==0) sx q0[15];
-if(c0==0) rz(pi/2) q0[15];
-if(c0==0) rz(pi/2) q0[16];
-if(c0==0) sx q0[16];
-if(c0==0) rz(pi/2) q0[16];
-if(c0==0) rz(pi/2) q0[17];
-if(c0==0) sx q0[17];
-if(c0==0) rz(pi/2) q0[17];
-if(c0==0) rz(pi/2) q0[18];
-if(c0==0) sx q0[18];
-if(c0==0) rz(pi/2) q0[18];
-if(c0==0) rz(pi/2) q0[19];
-if(c0==0) sx q0[19];
-if(c0==0) rz(pi/2) q0[19];
-if(c0==0) rz(pi/2) q0[20];
-if(c0==0) sx q0[20];
-if(c0==0) rz(pi/2) q0[20];
-if(c0==0) rz(pi/2) q0[21];
-if(c0==0) sx q0[21];
-if(c0==0) rz(pi/2) q0[21];
-if(c0==0) rz(pi/2) q0[22];
-if(c0==0) sx q0[22];
-if(c0==0) rz(pi/2) q0[22];
-if(c0==0) rz(pi/2) q0[23];
-if(c0==0) sx q0[23];
-if(c0==0) rz(pi/2) q0[23];
-if(c0==0) rz(pi/2) q0[24];
-if(c0==0) sx q0[24];
-if(c0==0) rz(pi/2) q0[24];
-if(c0==0) rz(pi/2) q0[25];
-if(c0==0) sx q0[25];
-if(c0==0) rz(pi/2) q0[25];
-if(c0==0) rz(pi/2) q0[26];
-if(c0==0) sx q0[26];
-if(c0==0) rz(pi/2) q0[26];
-if(c0==0) rz(pi/2) q0[27];
-if(c0==0) sx q0[27];
-if(c0==0) rz(pi/2) q0[27];
-if(c0==0) rz(pi/2) q0[28];
-if(c0==0) sx q0[28];
-if(c0==0) rz(pi/2) q0[28];
-if(c0==0) rz(pi/2) q0[29];
-if(c0==0) sx q0[29];
-if(c0==0) rz(pi/2) q0[29];
-if(c0==0) rz(pi/2) q0[30];
-if(c0==0) sx q0[30];
-if(c0==0) rz(pi/2) q0[30];
-if(c0==0) rz(pi/2) q0[31];
-if(c0==0) sx q0[31];
-if(c0==0) rz(pi/2) q0[31];
-if(c0==0) rz(pi/2) q0[32];
-if(c0==0) sx q0[32];
-if(c0==0) rz(pi/2) q0[32];
-if(c0==0) rz(pi/2) q0[33];
-if(c0==0) sx q0[33];
-if(c0==0) rz(pi/2) q0[33];
-if(c0==0) rz(pi/2) q0[34];
-if(c0==0) sx q0[34];
-if(c0==0) rz(pi/2) q0[34];
-if(c0==0) rz(pi/2) q0[35];
-if(c0==0) sx q0[35];
-if(c0==0) rz(pi/2) q0[35];
-if(c0==0) rz(pi/2) q0[36];
-if(c0==0) sx q0[36];
-if(c0==0) rz(pi/2) q0[36];
-if(c0==0) rz(pi/2) q0[37];
-if(c0==0) sx q0[37];
-if(c0==0) rz(pi/2) q0[37];
-if(c0==0) rz(pi/2) q0[38];
-if(c0==0) sx q0[38];
-if(c0==0) rz(pi/2) q0[38];
-if(c0==0) rz(pi/2) q0[39];
-if(c0==0) sx q0[39];
-if(c0==0) rz(pi/2) q0[39];
-if(c0==0) rz(pi/2) q0[40];
-if(c0==0) sx q0[40];
-if(c0==0) rz(pi/2) q0[40];
-if(c0==0) rz(pi/2) q0[41];
-if(c0==0) sx q0[41];
-if(c0==0) rz(pi/2) q0[41];
-if(c0==0) rz(pi/2) q0[42];
-if(c0==0) sx q0[42];
-if(c0==0) rz(pi/2) q0[42];
-if(c0==0) rz(pi/2) q0[43];
-if(c0==0) sx q0[43];
-if(c0==0) rz(pi/2) q0[43];
-if(c0==0) rz(pi/2) q0[44];
-if(c0==0) sx q0[44];
-if(c0==0) rz(pi/2) q0[44];
-if(c0==0) rz(pi/2) q0[45];
-if(c0==0) sx q0[45];
-if(c0==0) rz(pi/2) q0[45];
-if(c0==0) rz(pi/2) q0[46];
-if(c0==0) sx q0[46];
-if(c0==0) rz(pi/2) q0[46];
-if(c0==0) rz(pi/2) q0[47];
-if(c0==0) sx q0[47];
-if(c0==0) rz(pi/2) q0[47];
-if(c0==0) rz(pi/2) q0[48];
-if(c0==0) sx q0[48];
-if(c0==0) rz(pi/2) q0[48];
-if(c0==0) rz(pi/2) q0[49];
-if(c0==0) sx q0[49];
-if(c0==0) rz(pi/2) q0[49];
-if(c0==0) rz(pi/2) q0[50];
-if(c0==0) sx q0[50];
-if(c0==0) rz(pi/2) q0[50];
-if(c0==0) rz(pi/2) q0[51];
-if(c0==0) sx q0[51];
-if(c0==0) rz(pi/2) q0[51];
-if(c0==0) rz(pi/2) q0[52];
-if(c0==0) sx q0[52];
-if(c0==0) rz(pi/2) q0[52];
-if(c0==0) rz(pi/2) q0[53];
-if(c0==0) sx q0[53];
-if(c0==0) rz(pi/2) q0[53];
-if(c0==0) rz(pi/2) q0[54];
-if(c0==0) sx q0[54];
-if(c0==0) rz(pi/2) q0[54];
-if(c0==0) rz(pi/2) q0[55];
-if(c0==0) sx q0[55];
-if(c0==0) rz(pi/2) q0[55];
-if(c0==0) rz(pi/2) q0[56];
-if(c0==0) sx q0[56];
-if(c0==0) rz(pi/2) q0[56];
-if(c0==0) rz(pi/2) q0[57];
-if(c0==0) sx q0[57];
-if(c0==0) rz(pi/2) q0[57];
-if(c0==0) rz(pi/2) q0[58];
-if(c0==0) sx q0[58];
-if(c0==0) rz(pi/2) q0[58];
-if(c0==0) rz(pi/2) q0[59];
-if(c0==0) sx q0[59];
-if(c0==0) rz(pi/2) q0[59];
-if(c0==0) rz(pi/2) q0[60];
-if(c0==0) sx q0[60];
-if(c0==0) rz(pi/2) q0[60];
-if(c0==0) rz(pi/2) q0[61];
-if(c0==0) sx q0[61];
-if(c0==0) rz(pi/2) q0[61];
-if(c0==0) rz(pi/2) q0[62];
-if(c0==0) sx q0[62];
-if(c0==0) rz(pi/2) q0[62];
-measure q0[0] -> c0[0];
-measure q0[1] -> c0[1];
-measure q0[10] -> c0[10];
-measure q0[11] -> c0[11];
-measure q0[12] -> c0[12];
-measure q0[13] -> c0[13];
-measure q0[14] -> c0[14];
-measure q0[15] -> c0[15];
-measure q0[16] -> c0[16];
-measure q0[17] -> c0[17];
-measure q0[18] -> c0[18];
-measure q0[19] -> c0[19];
-measure q0[2] -> c0[2];
-measure q0[20] -> c0[20];
-measure q0[21] -> c0[21];
-measure q0[22] -> c0[22];
-measure q0[23] -> c0[23];
-measure q0[24] -> c0[24];
-measure q0[25] -> c0[25];
-measure q0[26] -> c0[26];
-measure q0[27] -> c0[27];
-measure q0[28] -> c0[28];
-measure q0[29] -> c0[29];
-measure q0[3] -> c0[3];
-measure q0[30] -> c0[30];
-measure q0[31] -> c0[31];
-measure q0[32] -> c0[32];
-measure q0[33] -> c0[33];
-measure q0[34] -> c0[34];
-measure q0[35] -> c0[35];
-measure q0[36] -> c0[36];
-measure q0[37] -> c0[37];
-measure q0[38] -> c0[38];
-measure q0[39] -> c0[39];
-measure q0[4] -> c0[4];
-measure q0[40] -> c0[40];
-measure q0[41] -> c0[41];
-measure q0[42] -> c0[42];
-measure q0[43] -> c0[43];
-measure q0[44] -> c0[44];
-measure q0[45] -> c0[45];
-measure q0[46] -> c0[46];
-measure q0[47] -> c0[47];
-measure q0[48] -> c0[48];
-measure q0[49] -> c0[49];
-measure q0[5] -> c0[5];
-measure q0[50] -> c0[50];
-measure q0[51] -> c0[51];
-measure q0[52] -> c0[52];
-measure q0[53] -> c0[53];
-measure q0[54] -> c0[54];
-measure q0[55] -> c0[55];
-measure q0[56] -> c0[56];
-measure q0[57] -> c0[57];
-measure q0[58] -> c0[58];
-measure q0[59] -> c0[59];
-measure q0[6] -> c0[6];
-measure q0[60] -> c0[60];
-measure q0[61] -> c0[61];
-measure q0[62] -> c0[62];
-measure q0[7] -> c0[7];
-measure q0[8] -> c0[8];
-measure q0[9] -> c0[9];
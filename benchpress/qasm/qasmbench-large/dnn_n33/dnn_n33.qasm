@@ -1,359 +0,0 @@
-OPENQASM 2.0;
-include "qelib1.inc";
-gate cry(lambda) a,b
-{
-  ry(lambda/2) b;
-  cx a,b;
-  ry(-lambda/2) b;
-  cx a,b;
-}
-gate rzz(theta) a,b
-{
-  cx a,b;
-  u1(theta) b;
-  cx a,b;
-}
-gate ryy(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(4.0860617) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- 
-}
-gate ryy_140221959791232(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(5.9976247) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- 
-}
-gate ryy_140221959792960(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(3.7841355) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- 
-}
-gate ryy_140221959793056(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(4.4686657) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- 
-}
-gate ryy_140221959793152(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(5.7884126) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- 
-}
-gate ryy_140221959793248(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(5.2693954) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- 
-}
-gate ryy_140221959793344(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(4.6165576) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- 
-}
-gate ryy_140221959793440(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(3.9713219) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- 
-}
-gate ryy_140221959793536(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(2.8259274) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- 
-}
-gate ryy_140221959793632(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(4.2819414) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- 
-}
-gate ryy_140221959793728(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(0.73078809) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- 
-}
-gate ryy_140221959793824(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(3.7752619) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- 
-}
-gate ryy_140221959793920(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(4.3981828) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- 
-}
-gate ryy_140221959794016(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(6.1439235) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- 
-}
-gate ryy_140221959794112(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(1.5327306) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- 
-}
-qreg q[33];
-creg c[33];
-creg meas[33];
-h q[0];
-ry(2.5715826) q[1];
-rz(2.6217923) q[1];
-ry(2.4644602) q[2];
-rz(5.5738716) q[2];
-ry(3.5775205) q[3];
-rz(4.7796126) q[3];
-ry(1.5555192) q[4];
-rz(4.2675645) q[4];
-ry(1.2023211) q[5];
-rz(6.2501756) q[5];
-ry(0.1623173) q[6];
-rz(4.9516061) q[6];
-ry(3.4428318) q[7];
-rz(0.63921594) q[7];
-ry(2.46422) q[8];
-rz(1.7315225) q[8];
-ry(5.2351173) q[9];
-rz(3.2685828) q[9];
-ry(2.4811442) q[10];
-rz(4.5889674) q[10];
-ry(0.47273595) q[11];
-rz(1.6226202) q[11];
-ry(5.0391697) q[12];
-rz(3.6154039) q[12];
-ry(4.4137941) q[13];
-rz(5.6435806) q[13];
-ry(2.4002674) q[14];
-rz(5.1529404) q[14];
-ry(5.1921691) q[15];
-rz(5.8935818) q[15];
-ry(2.5612356) q[16];
-rz(5.1255662) q[16];
-ryy(4.0860617) q[1],q[2];
-rzz(3.9427064) q[1],q[2];
-ryy_140221959791232(5.9976247) q[2],q[3];
-rzz(0.78198438) q[2],q[3];
-ryy_140221959792960(3.7841355) q[3],q[4];
-rzz(4.5622627) q[3],q[4];
-ryy_140221959793056(4.4686657) q[4],q[5];
-rzz(0.50786355) q[4],q[5];
-ryy_140221959793152(5.7884126) q[5],q[6];
-rzz(0.2330381) q[5],q[6];
-ryy_140221959793248(5.2693954) q[6],q[7];
-rzz(0.84123948) q[6],q[7];
-ryy_140221959793344(4.6165576) q[7],q[8];
-rzz(4.5757694) q[7],q[8];
-ryy_140221959793440(3.9713219) q[8],q[9];
-rzz(2.8975677) q[8],q[9];
-ryy_140221959793536(2.8259274) q[9],q[10];
-rzz(2.2520794) q[9],q[10];
-ryy_140221959793632(4.2819414) q[10],q[11];
-rzz(3.9350358) q[10],q[11];
-ryy_140221959793728(0.73078809) q[11],q[12];
-rzz(3.1822069) q[11],q[12];
-ryy_140221959793824(3.7752619) q[12],q[13];
-rzz(0.4471419) q[12],q[13];
-ryy_140221959793920(4.3981828) q[13],q[14];
-rzz(4.8559331) q[13],q[14];
-ryy_140221959794016(6.1439235) q[14],q[15];
-rzz(2.3566993) q[14],q[15];
-ryy_140221959794112(1.5327306) q[15],q[16];
-rzz(1.3777821) q[15],q[16];
-cry(4.7136841) q[1],q[2];
-crz(5.7765275) q[1],q[2];
-cry(0.75540262) q[2],q[3];
-crz(1.7248286) q[2],q[3];
-cry(0.5032847) q[3],q[4];
-crz(2.0834139) q[3],q[4];
-cry(2.3544628) q[4],q[5];
-crz(3.6512151) q[4],q[5];
-cry(2.306475) q[5],q[6];
-crz(4.5379703) q[5],q[6];
-cry(5.9573963) q[6],q[7];
-crz(1.1291483) q[6],q[7];
-cry(3.5671269) q[7],q[8];
-crz(3.3994773) q[7],q[8];
-cry(4.8900239) q[8],q[9];
-crz(2.0922298) q[8],q[9];
-cry(1.9567173) q[9],q[10];
-crz(3.7551914) q[9],q[10];
-cry(2.5809011) q[10],q[11];
-crz(5.9607978) q[10],q[11];
-cry(3.5095189) q[11],q[12];
-crz(3.2731879) q[11],q[12];
-cry(0.22418943) q[12],q[13];
-crz(5.4432263) q[12],q[13];
-cry(6.0341127) q[13],q[14];
-crz(5.5657544) q[13],q[14];
-cry(3.3907865) q[14],q[15];
-crz(5.4888443) q[14],q[15];
-cry(0.73670833) q[15],q[16];
-crz(4.5942454) q[15],q[16];
-ry(0.32962971) q[17];
-rz(3.0816632) q[17];
-ry(0.22442695) q[18];
-rz(-1.3386052) q[18];
-ry(-1.8779856) q[19];
-rz(-2.8367303) q[19];
-ry(1.7709714) q[20];
-rz(-0.58703185) q[20];
-ry(2.2660223) q[21];
-rz(-0.25728645) q[21];
-ry(1.7599798) q[22];
-rz(-2.9292551) q[22];
-ry(-3.0100533) q[23];
-rz(0.60897317) q[23];
-ry(1.2306532) q[24];
-rz(0.61434179) q[24];
-ry(-1.1195912) q[25];
-rz(-1.1137434) q[25];
-ry(2.0774699) q[26];
-rz(1.9504633) q[26];
-ry(1.0520065) q[27];
-rz(0.58836452) q[27];
-ry(-2.2668868) q[28];
-rz(1.4253744) q[28];
-ry(0.28180767) q[29];
-rz(1.7173491) q[29];
-ry(-1.8301519) q[30];
-rz(-2.7255153) q[30];
-ry(-0.19044524) q[31];
-rz(-2.1166116) q[31];
-ry(1.6016855) q[32];
-rz(0.93765919) q[32];
-cswap q[0],q[1],q[17];
-cswap q[0],q[2],q[18];
-cswap q[0],q[3],q[19];
-cswap q[0],q[4],q[20];
-cswap q[0],q[5],q[21];
-cswap q[0],q[6],q[22];
-cswap q[0],q[7],q[23];
-cswap q[0],q[8],q[24];
-cswap q[0],q[9],q[25];
-cswap q[0],q[10],q[26];
-cswap q[0],q[11],q[27];
-cswap q[0],q[12],q[28];
-cswap q[0],q[13],q[29];
-cswap q[0],q[14],q[30];
-cswap q[0],q[15],q[31];
-cswap q[0],q[16],q[32];
-h q[0];
-barrier q[0],q[1],q[2],q[3],q[4],q[5],q[6],q[7],q[8],q[9],q[10],q[11],q[12],q[13],q[14],q[15],q[16],q[17],q[18],q[19],q[20],q[21],q[22],q[23],q[24],q[25],q[26],q[27],q[28],q[29],q[30],q[31],q[32];
-measure q[0] -> meas[0];
-measure q[1] -> meas[1];
-measure q[2] -> meas[2];
-measure q[3] -> meas[3];
-measure q[4] -> meas[4];
-measure q[5] -> meas[5];
-measure q[6] -> meas[6];
-measure q[7] -> meas[7];
-measure q[8] -> meas[8];
-measure q[9] -> meas[9];
-measure q[10] -> meas[10];
-measure q[11] -> meas[11];
-measure q[12] -> meas[12];
-measure q[13] -> meas[13];
-measure q[14] -> meas[14];
-measure q[15] -> meas[15];
-measure q[16] -> meas[16];
-measure q[17] -> meas[17];
-measure q[18] -> meas[18];
-measure q[19] -> meas[19];
-measure q[20] -> meas[20];
-measure q[21] -> meas[21];
-measure q[22] -> meas[22];
-measure q[23] -> meas[23];
-measure q[24] -> meas[24];
-measure q[25] -> meas[25];
-measure q[26] -> meas[26];
-measure q[27] -> meas[27];
-measure q[28] -> meas[28];
-measure q[29] -> meas[29];
-measure q[30] -> meas[30];
-measure q[31] -> meas[31];
-measure q[32] -> meas[32];
@@ -1,533 +0,0 @@
-OPENQASM 2.0;
-include "qelib1.inc";
-gate cry(lambda) a,b
-{
-  ry(lambda/2) b;
-  cx a,b;
-  ry(-lambda/2) b;
-  cx a,b;
-}
-gate rzz(theta) a,b
-{
-  cx a,b;
-  u1(theta) b;
-  cx a,b;
-}
-gate ryy(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(5.0565645) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140578989711904(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(5.7808481) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140578989712096(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(3.0641004) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140578989712192(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(1.5121559) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140578989712288(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(1.8949713) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140578989712384(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(4.3860331) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140578989712480(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(5.7802317) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140578989712576(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(5.7678339) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140578989712672(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(5.6404169) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140578989712768(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(1.4885864) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140578989712864(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(1.9532259) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140578989712960(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(1.6750183) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140578989713056(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(2.952932) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140578989713152(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(6.2701848) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140578989713248(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(6.0314839) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140578989713344(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(5.833329) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140578989713440(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(0.26531045) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140578989713536(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(3.4420595) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140578989713632(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(3.4776567) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140578989713728(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(0.072076001) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140578989713824(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(0.8923591) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140578989713920(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(4.7348011) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140578989714016(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(3.4636307) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140578989714112(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(3.7708347) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-qreg q[51];
-creg c[51];
-creg meas[51];
-h q[0];
-ry(5.2906137) q[1];
-rz(2.3094216) q[1];
-ry(2.370297) q[2];
-rz(1.9983717) q[2];
-ry(4.8278313) q[3];
-rz(3.9494396) q[3];
-ry(0.43099481) q[4];
-rz(4.751425) q[4];
-ry(1.8129674) q[5];
-rz(2.020226) q[5];
-ry(3.8224562) q[6];
-rz(1.5934094) q[6];
-ry(2.094284) q[7];
-rz(5.4246885) q[7];
-ry(1.2450271) q[8];
-rz(0.99346861) q[8];
-ry(2.9755521) q[9];
-rz(0.73661609) q[9];
-ry(4.8645537) q[10];
-rz(5.9859355) q[10];
-ry(2.2297495) q[11];
-rz(5.8942423) q[11];
-ry(5.2014407) q[12];
-rz(0.79749618) q[12];
-ry(2.2609982) q[13];
-rz(5.9547598) q[13];
-ry(5.6848946) q[14];
-rz(4.907782) q[14];
-ry(4.3180537) q[15];
-rz(5.5020987) q[15];
-ry(5.4406287) q[16];
-rz(5.1117918) q[16];
-ry(2.8026794) q[17];
-rz(6.2778588) q[17];
-ry(4.8255079) q[18];
-rz(5.0834566) q[18];
-ry(5.0316189) q[19];
-rz(3.2495603) q[19];
-ry(1.5404907) q[20];
-rz(2.0548981) q[20];
-ry(1.0084203) q[21];
-rz(3.1735099) q[21];
-ry(2.3266322) q[22];
-rz(2.8941114) q[22];
-ry(0.84688368) q[23];
-rz(0.0056452572) q[23];
-ry(6.122977) q[24];
-rz(2.9711079) q[24];
-ry(2.2955354) q[25];
-rz(5.8861424) q[25];
-ryy(5.0565645) q[1],q[2];
-rzz(1.1204827) q[1],q[2];
-ryy_140578989711904(5.7808481) q[2],q[3];
-rzz(0.3152806) q[2],q[3];
-ryy_140578989712096(3.0641004) q[3],q[4];
-rzz(5.5487989) q[3],q[4];
-ryy_140578989712192(1.5121559) q[4],q[5];
-rzz(2.1948925) q[4],q[5];
-ryy_140578989712288(1.8949713) q[5],q[6];
-rzz(2.9989077) q[5],q[6];
-ryy_140578989712384(4.3860331) q[6],q[7];
-rzz(3.1754376) q[6],q[7];
-ryy_140578989712480(5.7802317) q[7],q[8];
-rzz(5.6164423) q[7],q[8];
-ryy_140578989712576(5.7678339) q[8],q[9];
-rzz(4.5134759) q[8],q[9];
-ryy_140578989712672(5.6404169) q[9],q[10];
-rzz(6.2092958) q[9],q[10];
-ryy_140578989712768(1.4885864) q[10],q[11];
-rzz(3.6207166) q[10],q[11];
-ryy_140578989712864(1.9532259) q[11],q[12];
-rzz(1.3136171) q[11],q[12];
-ryy_140578989712960(1.6750183) q[12],q[13];
-rzz(0.51844509) q[12],q[13];
-ryy_140578989713056(2.952932) q[13],q[14];
-rzz(3.4823396) q[13],q[14];
-ryy_140578989713152(6.2701848) q[14],q[15];
-rzz(4.281304) q[14],q[15];
-ryy_140578989713248(6.0314839) q[15],q[16];
-rzz(1.471842) q[15],q[16];
-ryy_140578989713344(5.833329) q[16],q[17];
-rzz(3.9435853) q[16],q[17];
-ryy_140578989713440(0.26531045) q[17],q[18];
-rzz(0.65885687) q[17],q[18];
-ryy_140578989713536(3.4420595) q[18],q[19];
-rzz(0.52374898) q[18],q[19];
-ryy_140578989713632(3.4776567) q[19],q[20];
-rzz(5.1094958) q[19],q[20];
-ryy_140578989713728(0.072076001) q[20],q[21];
-rzz(3.1884671) q[20],q[21];
-ryy_140578989713824(0.8923591) q[21],q[22];
-rzz(4.0148142) q[21],q[22];
-ryy_140578989713920(4.7348011) q[22],q[23];
-rzz(0.096126513) q[22],q[23];
-ryy_140578989714016(3.4636307) q[23],q[24];
-rzz(4.6825826) q[23],q[24];
-ryy_140578989714112(3.7708347) q[24],q[25];
-rzz(2.1791043) q[24],q[25];
-cry(1.7470274) q[1],q[2];
-crz(4.0018927) q[1],q[2];
-cry(5.0273213) q[2],q[3];
-crz(1.2747353) q[2],q[3];
-cry(3.8054738) q[3],q[4];
-crz(0.43607398) q[3],q[4];
-cry(6.1478246) q[4],q[5];
-crz(0.4993185) q[4],q[5];
-cry(2.9654801) q[5],q[6];
-crz(3.5450072) q[5],q[6];
-cry(4.5902294) q[6],q[7];
-crz(1.0234267) q[6],q[7];
-cry(3.3441148) q[7],q[8];
-crz(1.7712996) q[7],q[8];
-cry(5.6635963) q[8],q[9];
-crz(2.2236158) q[8],q[9];
-cry(5.3118292) q[9],q[10];
-crz(0.12687726) q[9],q[10];
-cry(5.5340354) q[10],q[11];
-crz(6.2821789) q[10],q[11];
-cry(5.9546079) q[11],q[12];
-crz(5.3528911) q[11],q[12];
-cry(0.75485117) q[12],q[13];
-crz(0.24182556) q[12],q[13];
-cry(3.338796) q[13],q[14];
-crz(5.7334826) q[13],q[14];
-cry(6.242534) q[14],q[15];
-crz(5.0761396) q[14],q[15];
-cry(3.1985181) q[15],q[16];
-crz(3.7602813) q[15],q[16];
-cry(1.028891) q[16],q[17];
-crz(0.55386557) q[16],q[17];
-cry(4.2235377) q[17],q[18];
-crz(2.0562094) q[17],q[18];
-cry(5.7952215) q[18],q[19];
-crz(1.5877122) q[18],q[19];
-cry(5.40824) q[19],q[20];
-crz(5.6008261) q[19],q[20];
-cry(4.6817278) q[20],q[21];
-crz(0.36292824) q[20],q[21];
-cry(0.42515435) q[21],q[22];
-crz(4.593681) q[21],q[22];
-cry(2.0272908) q[22],q[23];
-crz(0.33913639) q[22],q[23];
-cry(5.3022692) q[23],q[24];
-crz(4.0681744) q[23],q[24];
-cry(2.2887228) q[24],q[25];
-crz(0.37612168) q[24],q[25];
-ry(0.60604959) q[26];
-rz(0.35387948) q[26];
-ry(-1.8210064) q[27];
-rz(-0.94711221) q[27];
-ry(2.6244992) q[28];
-rz(1.2244612) q[28];
-ry(-1.9614546) q[29];
-rz(1.8729795) q[29];
-ry(0.35807806) q[30];
-rz(-2.8096192) q[30];
-ry(0.30747814) q[31];
-rz(-1.9692242) q[31];
-ry(0.9008962) q[32];
-rz(1.6529334) q[32];
-ry(-0.29569678) q[33];
-rz(1.9260252) q[33];
-ry(-0.60092058) q[34];
-rz(-0.43072421) q[34];
-ry(-1.3540312) q[35];
-rz(1.6776469) q[35];
-ry(2.0730838) q[36];
-rz(0.59648172) q[36];
-ry(0.77323599) q[37];
-rz(0.16690742) q[37];
-ry(-2.7075559) q[38];
-rz(-0.14494545) q[38];
-ry(-2.908909) q[39];
-rz(1.2062325) q[39];
-ry(0.73448479) q[40];
-rz(-1.7371076) q[40];
-ry(-2.3992852) q[41];
-rz(0.53142251) q[41];
-ry(1.3222001) q[42];
-rz(-2.5426306) q[42];
-ry(2.3214473) q[43];
-rz(-1.1140177) q[43];
-ry(1.3187394) q[44];
-rz(-0.19641698) q[44];
-ry(-2.2003226) q[45];
-rz(-2.1621453) q[45];
-ry(-0.59551033) q[46];
-rz(-2.3901644) q[46];
-ry(-1.3980645) q[47];
-rz(1.115063) q[47];
-ry(-0.88998083) q[48];
-rz(2.8776228) q[48];
-ry(-1.0422147) q[49];
-rz(-1.7717792) q[49];
-ry(-0.76976815) q[50];
-rz(-1.578041) q[50];
-cswap q[0],q[1],q[26];
-cswap q[0],q[2],q[27];
-cswap q[0],q[3],q[28];
-cswap q[0],q[4],q[29];
-cswap q[0],q[5],q[30];
-cswap q[0],q[6],q[31];
-cswap q[0],q[7],q[32];
-cswap q[0],q[8],q[33];
-cswap q[0],q[9],q[34];
-cswap q[0],q[10],q[35];
-cswap q[0],q[11],q[36];
-cswap q[0],q[12],q[37];
-cswap q[0],q[13],q[38];
-cswap q[0],q[14],q[39];
-cswap q[0],q[15],q[40];
-cswap q[0],q[16],q[41];
-cswap q[0],q[17],q[42];
-cswap q[0],q[18],q[43];
-cswap q[0],q[19],q[44];
-cswap q[0],q[20],q[45];
-cswap q[0],q[21],q[46];
-cswap q[0],q[22],q[47];
-cswap q[0],q[23],q[48];
-cswap q[0],q[24],q[49];
-cswap q[0],q[25],q[50];
-h q[0];
-barrier q[0],q[1],q[2],q[3],q[4],q[5],q[6],q[7],q[8],q[9],q[10],q[11],q[12],q[13],q[14],q[15],q[16],q[17],q[18],q[19],q[20],q[21],q[22],q[23],q[24],q[25],q[26],q[27],q[28],q[29],q[30],q[31],q[32],q[33],q[34],q[35],q[36],q[37],q[38],q[39],q[40],q[41],q[42],q[43],q[44],q[45],q[46],q[47],q[48],q[49],q[50];
-measure q[0] -> meas[0];
-measure q[1] -> meas[1];
-measure q[2] -> meas[2];
-measure q[3] -> meas[3];
-measure q[4] -> meas[4];
-measure q[5] -> meas[5];
-measure q[6] -> meas[6];
-measure q[7] -> meas[7];
-measure q[8] -> meas[8];
-measure q[9] -> meas[9];
-measure q[10] -> meas[10];
-measure q[11] -> meas[11];
-measure q[12] -> meas[12];
-measure q[13] -> meas[13];
-measure q[14] -> meas[14];
-measure q[15] -> meas[15];
-measure q[16] -> meas[16];
-measure q[17] -> meas[17];
-measure q[18] -> meas[18];
-measure q[19] -> meas[19];
-measure q[20] -> meas[20];
-measure q[21] -> meas[21];
-measure q[22] -> meas[22];
-measure q[23] -> meas[23];
-measure q[24] -> meas[24];
-measure q[25] -> meas[25];
-measure q[26] -> meas[26];
-measure q[27] -> meas[27];
-measure q[28] -> meas[28];
-measure q[29] -> meas[29];
-measure q[30] -> meas[30];
-measure q[31] -> meas[31];
-measure q[32] -> meas[32];
-measure q[33] -> meas[33];
-measure q[34] -> meas[34];
-measure q[35] -> meas[35];
-measure q[36] -> meas[36];
-measure q[37] -> meas[37];
-measure q[38] -> meas[38];
-measure q[39] -> meas[39];
-measure q[40] -> meas[40];
-measure q[41] -> meas[41];
-measure q[42] -> meas[42];
-measure q[43] -> meas[43];
-measure q[44] -> meas[44];
-measure q[45] -> meas[45];
-measure q[46] -> meas[46];
-measure q[47] -> meas[47];
-measure q[48] -> meas[48];
-measure q[49] -> meas[49];
-measure q[50] -> meas[50];
@@ -1,1435 +0,0 @@
-OPENQASM 2.0;
-include "qelib1.inc";
-qreg q[51];
-creg c[51];
-creg meas[51];
-rz(pi/2) q[0];
-sx q[0];
-rz(pi/2) q[0];
-rz(-2.1113733) q[1];
-sx q[1];
-rz(-0.9030798) q[1];
-sx q[1];
-rz(2.3717584) q[1];
-rz(-0.56614508) q[2];
-sx q[2];
-rz(-2.2579129) q[2];
-sx q[2];
-rz(-1.1875929) q[2];
-cx q[1],q[2];
-rz(5.0565645) q[2];
-cx q[1],q[2];
-rz(-pi) q[1];
-sx q[1];
-rz(-pi) q[1];
-rz(-pi) q[2];
-sx q[2];
-rz(-pi) q[2];
-cx q[1],q[2];
-rz(1.1204827) q[2];
-cx q[1],q[2];
-sx q[2];
-rz(-1.4508969) q[3];
-sx q[3];
-rz(-2.3717066) q[3];
-sx q[3];
-rz(2.9753434) q[3];
-cx q[2],q[3];
-rz(5.7808481) q[3];
-cx q[2],q[3];
-rz(-pi) q[2];
-sx q[2];
-rz(-pi) q[2];
-rz(-pi) q[3];
-sx q[3];
-rz(-pi) q[3];
-cx q[2],q[3];
-rz(0.3152806) q[3];
-cx q[2],q[3];
-rz(-pi) q[2];
-sx q[2];
-rz(2.268079) q[2];
-sx q[2];
-cx q[1],q[2];
-sx q[2];
-rz(2.268079) q[2];
-sx q[2];
-rz(-pi) q[2];
-cx q[1],q[2];
-rz(2.00094635) q[2];
-cx q[1],q[2];
-rz(-2.00094635) q[2];
-cx q[1],q[2];
-sx q[3];
-rz(0.042960546) q[4];
-sx q[4];
-rz(-1.1401518) q[4];
-sx q[4];
-rz(1.5887396) q[4];
-cx q[3],q[4];
-rz(3.0641004) q[4];
-cx q[3],q[4];
-rz(-pi) q[3];
-sx q[3];
-rz(-pi) q[3];
-rz(-pi) q[4];
-sx q[4];
-rz(-pi) q[4];
-cx q[3],q[4];
-rz(5.5487989) q[4];
-cx q[3],q[4];
-rz(-pi) q[3];
-sx q[3];
-rz(0.627932) q[3];
-sx q[3];
-cx q[2],q[3];
-sx q[3];
-rz(0.627932) q[3];
-sx q[3];
-rz(-pi) q[3];
-cx q[2],q[3];
-rz(0.63736765) q[3];
-cx q[2],q[3];
-rz(-0.63736765) q[3];
-cx q[2],q[3];
-sx q[4];
-rz(-1.1094152) q[5];
-sx q[5];
-rz(-2.6350197) q[5];
-sx q[5];
-rz(-0.51699323) q[5];
-cx q[4],q[5];
-rz(1.5121559) q[5];
-cx q[4],q[5];
-rz(-pi) q[4];
-sx q[4];
-rz(-pi) q[4];
-rz(-pi) q[5];
-sx q[5];
-rz(-pi) q[5];
-cx q[4],q[5];
-rz(2.1948925) q[5];
-cx q[4],q[5];
-rz(-pi) q[4];
-sx q[4];
-rz(1.2388558) q[4];
-sx q[4];
-cx q[3],q[4];
-sx q[4];
-rz(1.2388558) q[4];
-sx q[4];
-rz(-pi) q[4];
-cx q[3],q[4];
-rz(0.21803699) q[4];
-cx q[3],q[4];
-rz(-0.21803699) q[4];
-cx q[3],q[4];
-sx q[5];
-rz(-0.029098697) q[6];
-sx q[6];
-rz(-0.89013987) q[6];
-sx q[6];
-rz(-1.5891114) q[6];
-cx q[5],q[6];
-rz(1.8949713) q[6];
-cx q[5],q[6];
-rz(-pi) q[5];
-sx q[5];
-rz(-pi) q[5];
-rz(-pi) q[6];
-sx q[6];
-rz(-pi) q[6];
-cx q[5],q[6];
-rz(2.9989077) q[6];
-cx q[5],q[6];
-rz(-pi) q[5];
-sx q[5];
-rz(0.067680354) q[5];
-sx q[5];
-cx q[4],q[5];
-sx q[5];
-rz(0.067680354) q[5];
-sx q[5];
-rz(-pi) q[5];
-cx q[4],q[5];
-rz(0.24965925) q[5];
-cx q[4],q[5];
-rz(-0.24965925) q[5];
-cx q[4],q[5];
-sx q[6];
-rz(2.0955596) q[7];
-sx q[7];
-rz(-0.85594802) q[7];
-sx q[7];
-rz(-2.4181683) q[7];
-cx q[6],q[7];
-rz(4.3860331) q[7];
-cx q[6],q[7];
-rz(-pi) q[6];
-sx q[6];
-rz(-pi) q[6];
-rz(-pi) q[7];
-sx q[7];
-rz(-pi) q[7];
-cx q[6],q[7];
-rz(3.1754376) q[7];
-cx q[6],q[7];
-rz(-pi) q[6];
-sx q[6];
-rz(1.6588526) q[6];
-sx q[6];
-cx q[5],q[6];
-sx q[6];
-rz(1.6588526) q[6];
-sx q[6];
-rz(-pi) q[6];
-cx q[5],q[6];
-rz(1.7725036) q[6];
-cx q[5],q[6];
-rz(-1.7725036) q[6];
-cx q[5],q[6];
-sx q[7];
-rz(2.0274926) q[8];
-sx q[8];
-rz(-2.487916) q[8];
-sx q[8];
-rz(2.5873692) q[8];
-cx q[7],q[8];
-rz(5.7802317) q[8];
-cx q[7],q[8];
-rz(-pi) q[7];
-sx q[7];
-rz(-pi) q[7];
-rz(-pi) q[8];
-sx q[8];
-rz(-pi) q[8];
-cx q[7],q[8];
-rz(5.6164423) q[8];
-cx q[7],q[8];
-rz(-pi) q[7];
-sx q[7];
-rz(0.84647795) q[7];
-sx q[7];
-cx q[6],q[7];
-sx q[7];
-rz(0.84647795) q[7];
-sx q[7];
-rz(-pi) q[7];
-cx q[6],q[7];
-rz(0.51171335) q[7];
-cx q[6],q[7];
-rz(-0.51171335) q[7];
-cx q[6],q[7];
-sx q[8];
-rz(0.84106671) q[9];
-sx q[9];
-rz(-1.6820575) q[9];
-sx q[9];
-rz(-1.6943013) q[9];
-cx q[8],q[9];
-rz(5.7678339) q[9];
-cx q[8],q[9];
-rz(-pi) q[8];
-sx q[8];
-rz(-pi) q[8];
-rz(-pi) q[9];
-sx q[9];
-rz(-pi) q[9];
-cx q[8],q[9];
-rz(4.5134759) q[9];
-cx q[8],q[9];
-rz(-pi) q[8];
-sx q[8];
-rz(1.4695353) q[8];
-sx q[8];
-cx q[7],q[8];
-sx q[8];
-rz(1.4695353) q[8];
-sx q[8];
-rz(-pi) q[8];
-cx q[7],q[8];
-rz(0.8856498) q[8];
-cx q[7],q[8];
-rz(-0.8856498) q[8];
-cx q[7],q[8];
-sx q[9];
-rz(1.5243974) q[10];
-sx q[10];
-rz(-1.8645085) q[10];
-sx q[10];
-rz(0.1590293) q[10];
-cx q[9],q[10];
-rz(5.6404169) q[10];
-cx q[9],q[10];
-rz(-pi) q[10];
-sx q[10];
-rz(-pi) q[10];
-rz(-pi) q[9];
-sx q[9];
-rz(-pi) q[9];
-cx q[9],q[10];
-rz(6.2092958) q[10];
-cx q[9],q[10];
-sx q[10];
-rz(-pi) q[9];
-sx q[9];
-rz(0.3097945) q[9];
-sx q[9];
-cx q[8],q[9];
-sx q[9];
-rz(0.3097945) q[9];
-sx q[9];
-rz(-pi) q[9];
-cx q[8],q[9];
-rz(1.1118079) q[9];
-cx q[8],q[9];
-rz(-1.1118079) q[9];
-cx q[8],q[9];
-rz(1.8166486) q[11];
-sx q[11];
-rz(-1.2662959) q[11];
-sx q[11];
-rz(-2.4447299) q[11];
-cx q[10],q[11];
-rz(1.4885864) q[11];
-cx q[10],q[11];
-rz(-pi) q[10];
-sx q[10];
-rz(-pi) q[10];
-rz(-pi) q[11];
-sx q[11];
-rz(-pi) q[11];
-cx q[10],q[11];
-rz(3.6207166) q[11];
-cx q[10],q[11];
-rz(-pi) q[10];
-sx q[10];
-rz(0.48567805) q[10];
-sx q[10];
-sx q[11];
-cx q[9],q[10];
-sx q[10];
-rz(0.48567805) q[10];
-sx q[10];
-rz(-pi) q[10];
-cx q[9],q[10];
-rz(0.06343863) q[10];
-cx q[9],q[10];
-rz(-0.06343863) q[10];
-cx q[9],q[10];
-rz(2.0193689) q[12];
-sx q[12];
-rz(-0.88702015) q[12];
-sx q[12];
-rz(0.65105835) q[12];
-cx q[11],q[12];
-rz(1.9532259) q[12];
-cx q[11],q[12];
-rz(-pi) q[11];
-sx q[11];
-rz(-pi) q[11];
-rz(-pi) q[12];
-sx q[12];
-rz(-pi) q[12];
-cx q[11],q[12];
-rz(1.3136171) q[12];
-cx q[11],q[12];
-rz(-pi) q[11];
-sx q[11];
-rz(0.37457495) q[11];
-sx q[11];
-cx q[10],q[11];
-sx q[11];
-rz(0.37457495) q[11];
-sx q[11];
-rz(-pi) q[11];
-cx q[10],q[11];
-rz(3.14108945) q[11];
-cx q[10],q[11];
-rz(-3.14108945) q[11];
-cx q[10],q[11];
-sx q[12];
-rz(1.7844486) q[13];
-sx q[13];
-rz(-1.3194313) q[13];
-sx q[13];
-rz(-2.4242946) q[13];
-cx q[12],q[13];
-rz(1.6750183) q[13];
-cx q[12],q[13];
-rz(-pi) q[12];
-sx q[12];
-rz(-pi) q[12];
-rz(-pi) q[13];
-sx q[13];
-rz(-pi) q[13];
-cx q[12],q[13];
-rz(0.51844509) q[13];
-cx q[12],q[13];
-rz(-pi) q[12];
-sx q[12];
-rz(0.1642887) q[12];
-sx q[12];
-cx q[11],q[12];
-sx q[12];
-rz(0.1642887) q[12];
-sx q[12];
-rz(-pi) q[12];
-cx q[11],q[12];
-rz(2.67644555) q[12];
-cx q[11],q[12];
-rz(-2.67644555) q[12];
-cx q[11],q[12];
-sx q[13];
-rz(0.23509442) q[14];
-sx q[14];
-rz(-2.1561731) q[14];
-sx q[14];
-rz(1.4392209) q[14];
-cx q[13],q[14];
-rz(2.952932) q[14];
-cx q[13],q[14];
-rz(-pi) q[13];
-sx q[13];
-rz(-pi) q[13];
-rz(-pi) q[14];
-sx q[14];
-rz(-pi) q[14];
-cx q[13],q[14];
-rz(3.4823396) q[14];
-cx q[13],q[14];
-rz(-pi) q[13];
-sx q[13];
-rz(2.7641671) q[13];
-sx q[13];
-cx q[12],q[13];
-sx q[13];
-rz(2.7641671) q[13];
-sx q[13];
-rz(-pi) q[13];
-cx q[12],q[13];
-rz(0.12091278) q[13];
-cx q[12],q[13];
-rz(-0.12091278) q[13];
-cx q[12],q[13];
-sx q[14];
-rz(1.9347259) q[15];
-sx q[15];
-rz(-2.2784032) q[15];
-sx q[15];
-rz(-0.53004555) q[15];
-cx q[14],q[15];
-rz(6.2701848) q[15];
-cx q[14],q[15];
-rz(-pi) q[14];
-sx q[14];
-rz(-pi) q[14];
-rz(-pi) q[15];
-sx q[15];
-rz(-pi) q[15];
-cx q[14],q[15];
-rz(4.281304) q[15];
-cx q[14],q[15];
-rz(-pi) q[14];
-sx q[14];
-rz(1.4721947) q[14];
-sx q[14];
-cx q[13],q[14];
-sx q[14];
-rz(1.4721947) q[14];
-sx q[14];
-rz(-pi) q[14];
-cx q[13],q[14];
-rz(2.8667413) q[14];
-cx q[13],q[14];
-rz(-2.8667413) q[14];
-cx q[13],q[14];
-sx q[15];
-rz(0.56518052) q[16];
-sx q[16];
-rz(-2.3289812) q[16];
-sx q[16];
-rz(1.1595851) q[16];
-cx q[15],q[16];
-rz(6.0314839) q[16];
-cx q[15],q[16];
-rz(-pi) q[15];
-sx q[15];
-rz(-pi) q[15];
-rz(-pi) q[16];
-sx q[16];
-rz(-pi) q[16];
-cx q[15],q[16];
-rz(1.471842) q[16];
-cx q[15],q[16];
-rz(-pi) q[15];
-sx q[15];
-rz(0.020325654) q[15];
-sx q[15];
-cx q[14],q[15];
-sx q[15];
-rz(0.020325654) q[15];
-sx q[15];
-rz(-pi) q[15];
-cx q[14],q[15];
-rz(2.5380698) q[15];
-cx q[14],q[15];
-rz(-2.5380698) q[15];
-cx q[14],q[15];
-sx q[16];
-rz(1.5758198) q[17];
-sx q[17];
-rz(-1.5690255) q[17];
-sx q[17];
-rz(-1.9097051) q[17];
-cx q[16],q[17];
-rz(5.833329) q[17];
-cx q[16],q[17];
-rz(-pi) q[16];
-sx q[16];
-rz(-pi) q[16];
-rz(-pi) q[17];
-sx q[17];
-rz(-pi) q[17];
-cx q[16],q[17];
-rz(3.9435853) q[17];
-cx q[16],q[17];
-rz(-pi) q[16];
-sx q[16];
-rz(1.5423336) q[16];
-sx q[16];
-cx q[15],q[16];
-sx q[16];
-rz(1.5423336) q[16];
-sx q[16];
-rz(-pi) q[16];
-cx q[15],q[16];
-rz(1.88014065) q[16];
-cx q[15],q[16];
-rz(-1.88014065) q[16];
-cx q[15],q[16];
-sx q[17];
-rz(1.2884413) q[18];
-sx q[18];
-rz(-2.7544314) q[18];
-sx q[18];
-rz(0.30360847) q[18];
-cx q[17],q[18];
-rz(0.26531045) q[18];
-cx q[17],q[18];
-rz(-pi) q[17];
-sx q[17];
-rz(-pi) q[17];
-rz(-pi) q[18];
-sx q[18];
-rz(-pi) q[18];
-cx q[17],q[18];
-rz(0.65885687) q[18];
-cx q[17],q[18];
-rz(-pi) q[17];
-sx q[17];
-rz(2.6271472) q[17];
-sx q[17];
-cx q[16],q[17];
-sx q[17];
-rz(2.6271472) q[17];
-sx q[17];
-rz(-pi) q[17];
-cx q[16],q[17];
-rz(0.276932785) q[17];
-cx q[16],q[17];
-rz(-0.276932785) q[17];
-cx q[16],q[17];
-sx q[18];
-rz(-1.5367931) q[19];
-sx q[19];
-rz(-1.6732895) q[19];
-sx q[19];
-rz(2.8206185) q[19];
-cx q[18],q[19];
-rz(3.4420595) q[19];
-cx q[18],q[19];
-rz(-pi) q[18];
-sx q[18];
-rz(-pi) q[18];
-rz(-pi) q[19];
-sx q[19];
-rz(-pi) q[19];
-cx q[18],q[19];
-rz(0.52374898) q[19];
-cx q[18],q[19];
-rz(-pi) q[18];
-sx q[18];
-rz(1.0298238) q[18];
-sx q[18];
-cx q[17],q[18];
-sx q[18];
-rz(1.0298238) q[18];
-sx q[18];
-rz(-pi) q[18];
-cx q[17],q[18];
-rz(1.0281047) q[18];
-cx q[17],q[18];
-rz(-1.0281047) q[18];
-cx q[17],q[18];
-sx q[19];
-rz(-1.6283571) q[20];
-sx q[20];
-rz(-2.6566184) q[20];
-sx q[20];
-rz(0.065043543) q[20];
-cx q[19],q[20];
-rz(3.4776567) q[20];
-cx q[19],q[20];
-rz(-pi) q[19];
-sx q[19];
-rz(-pi) q[19];
-rz(-pi) q[20];
-sx q[20];
-rz(-pi) q[20];
-cx q[19],q[20];
-rz(5.1094958) q[20];
-cx q[19],q[20];
-rz(-pi) q[19];
-sx q[19];
-rz(0.2439819) q[19];
-sx q[19];
-cx q[18],q[19];
-sx q[19];
-rz(0.2439819) q[19];
-sx q[19];
-rz(-pi) q[19];
-cx q[18],q[19];
-rz(0.7938561) q[19];
-cx q[18],q[19];
-rz(-0.7938561) q[19];
-cx q[18],q[19];
-sx q[20];
-rz(-1.553774) q[21];
-sx q[21];
-rz(-1.5437959) q[21];
-sx q[21];
-rz(0.56260585) q[21];
-cx q[20],q[21];
-rz(0.072076001) q[21];
-cx q[20],q[21];
-rz(-pi) q[20];
-sx q[20];
-rz(-pi) q[20];
-rz(-pi) q[21];
-sx q[21];
-rz(-pi) q[21];
-cx q[20],q[21];
-rz(3.1884671) q[21];
-cx q[20],q[21];
-rz(-pi) q[20];
-sx q[20];
-rz(0.43747265) q[20];
-sx q[20];
-cx q[19],q[20];
-sx q[20];
-rz(0.43747265) q[20];
-sx q[20];
-rz(-pi) q[20];
-cx q[19],q[20];
-rz(2.80041305) q[20];
-cx q[19],q[20];
-rz(-2.80041305) q[20];
-cx q[19],q[20];
-sx q[21];
-rz(-1.3992014) q[22];
-sx q[22];
-rz(-1.7500132) q[22];
-sx q[22];
-rz(-0.77129115) q[22];
-cx q[21],q[22];
-rz(0.8923591) q[22];
-cx q[21],q[22];
-rz(-pi) q[21];
-sx q[21];
-rz(-pi) q[21];
-rz(-pi) q[22];
-sx q[22];
-rz(-pi) q[22];
-cx q[21],q[22];
-rz(4.0148142) q[22];
-cx q[21],q[22];
-rz(-pi) q[21];
-sx q[21];
-rz(0.80072875) q[21];
-sx q[21];
-cx q[20],q[21];
-sx q[21];
-rz(0.80072875) q[21];
-sx q[21];
-rz(-pi) q[21];
-cx q[20],q[21];
-rz(0.18146412) q[21];
-cx q[20],q[21];
-rz(-0.18146412) q[21];
-cx q[20],q[21];
-sx q[22];
-rz(1.5745353) q[23];
-sx q[23];
-rz(-1.5750259) q[23];
-sx q[23];
-rz(2.4176721) q[23];
-cx q[22],q[23];
-rz(4.7348011) q[23];
-cx q[22],q[23];
-rz(-pi) q[22];
-sx q[22];
-rz(-pi) q[22];
-rz(-pi) q[23];
-sx q[23];
-rz(-pi) q[23];
-cx q[22],q[23];
-rz(0.096126513) q[23];
-cx q[22],q[23];
-rz(-pi) q[22];
-sx q[22];
-rz(2.9290155) q[22];
-sx q[22];
-cx q[21],q[22];
-sx q[22];
-rz(2.9290155) q[22];
-sx q[22];
-rz(-pi) q[22];
-cx q[21],q[22];
-rz(2.2968405) q[22];
-cx q[21],q[22];
-rz(-2.2968405) q[22];
-cx q[21],q[22];
-sx q[23];
-rz(-1.7391391) q[24];
-sx q[24];
-rz(-1.5437282) q[24];
-sx q[24];
-rz(1.7287207) q[24];
-cx q[23],q[24];
-rz(3.4636307) q[24];
-cx q[23],q[24];
-rz(-pi) q[23];
-sx q[23];
-rz(-pi) q[23];
-rz(-pi) q[24];
-sx q[24];
-rz(-pi) q[24];
-cx q[23],q[24];
-rz(4.6825826) q[24];
-cx q[23],q[24];
-rz(-pi) q[23];
-sx q[23];
-rz(2.1279473) q[23];
-sx q[23];
-cx q[22],q[23];
-sx q[23];
-rz(2.1279473) q[23];
-sx q[23];
-rz(-pi) q[23];
-cx q[22],q[23];
-rz(0.169568195) q[23];
-cx q[22],q[23];
-rz(-0.169568195) q[23];
-cx q[22],q[23];
-sx q[24];
-rz(1.8419297) q[25];
-sx q[25];
-rz(-1.2770852) q[25];
-sx q[25];
-rz(-2.3765054) q[25];
-cx q[24],q[25];
-rz(3.7708347) q[25];
-cx q[24],q[25];
-rz(-pi) q[24];
-sx q[24];
-rz(-pi) q[24];
-rz(-pi) q[25];
-sx q[25];
-rz(-pi) q[25];
-cx q[24],q[25];
-rz(2.1791043) q[25];
-cx q[24],q[25];
-rz(-pi) q[24];
-sx q[24];
-rz(0.49045805) q[24];
-sx q[24];
-cx q[23],q[24];
-sx q[24];
-rz(0.49045805) q[24];
-sx q[24];
-rz(-pi) q[24];
-cx q[23],q[24];
-rz(2.0340872) q[24];
-cx q[23],q[24];
-rz(-2.0340872) q[24];
-cx q[23],q[24];
-rz(-pi) q[25];
-sx q[25];
-rz(1.9972313) q[25];
-sx q[25];
-cx q[24],q[25];
-sx q[25];
-rz(1.9972313) q[25];
-sx q[25];
-rz(-pi) q[25];
-cx q[24],q[25];
-rz(0.18806084) q[25];
-cx q[24],q[25];
-rz(-0.18806084) q[25];
-cx q[24],q[25];
-sx q[26];
-rz(-2.5355431) q[26];
-sx q[26];
-rz(-2.7877132) q[26];
-cx q[26],q[1];
-rz(pi/2) q[26];
-sx q[26];
-rz(pi/2) q[26];
-cx q[1],q[26];
-rz(-pi/4) q[26];
-cx q[0],q[26];
-rz(pi/4) q[26];
-cx q[1],q[26];
-rz(pi/4) q[1];
-rz(-pi/4) q[26];
-cx q[0],q[26];
-cx q[0],q[1];
-rz(pi/4) q[0];
-rz(-pi/4) q[1];
-cx q[0],q[1];
-rz(3*pi/4) q[26];
-sx q[26];
-rz(pi/2) q[26];
-cx q[26],q[1];
-sx q[27];
-rz(1.3205863) q[27];
-sx q[27];
-rz(2.1944804) q[27];
-cx q[27],q[2];
-rz(pi/2) q[27];
-sx q[27];
-rz(pi/2) q[27];
-cx q[2],q[27];
-rz(-pi/4) q[27];
-cx q[0],q[27];
-rz(pi/4) q[27];
-cx q[2],q[27];
-rz(pi/4) q[2];
-rz(-pi/4) q[27];
-cx q[0],q[27];
-cx q[0],q[2];
-rz(pi/4) q[0];
-rz(-pi/4) q[2];
-cx q[0],q[2];
-rz(3*pi/4) q[27];
-sx q[27];
-rz(pi/2) q[27];
-cx q[27],q[2];
-sx q[28];
-rz(-0.51709345) q[28];
-sx q[28];
-rz(-1.9171315) q[28];
-cx q[28],q[3];
-rz(pi/2) q[28];
-sx q[28];
-rz(pi/2) q[28];
-cx q[3],q[28];
-rz(-pi/4) q[28];
-cx q[0],q[28];
-rz(pi/4) q[28];
-cx q[3],q[28];
-rz(-pi/4) q[28];
-cx q[0],q[28];
-rz(3*pi/4) q[28];
-sx q[28];
-rz(pi/2) q[28];
-rz(pi/4) q[3];
-cx q[0],q[3];
-rz(pi/4) q[0];
-rz(-pi/4) q[3];
-cx q[0],q[3];
-cx q[28],q[3];
-sx q[29];
-rz(1.1801381) q[29];
-sx q[29];
-rz(-1.2686132) q[29];
-cx q[29],q[4];
-rz(pi/2) q[29];
-sx q[29];
-rz(pi/2) q[29];
-cx q[4],q[29];
-rz(-pi/4) q[29];
-cx q[0],q[29];
-rz(pi/4) q[29];
-cx q[4],q[29];
-rz(-pi/4) q[29];
-cx q[0],q[29];
-rz(3*pi/4) q[29];
-sx q[29];
-rz(pi/2) q[29];
-rz(pi/4) q[4];
-cx q[0],q[4];
-rz(pi/4) q[0];
-rz(-pi/4) q[4];
-cx q[0],q[4];
-cx q[29],q[4];
-sx q[30];
-rz(-2.7835146) q[30];
-sx q[30];
-rz(0.33197345) q[30];
-cx q[30],q[5];
-rz(pi/2) q[30];
-sx q[30];
-rz(pi/2) q[30];
-cx q[5],q[30];
-rz(-pi/4) q[30];
-cx q[0],q[30];
-rz(pi/4) q[30];
-cx q[5],q[30];
-rz(-pi/4) q[30];
-cx q[0],q[30];
-rz(3*pi/4) q[30];
-sx q[30];
-rz(pi/2) q[30];
-rz(pi/4) q[5];
-cx q[0],q[5];
-rz(pi/4) q[0];
-rz(-pi/4) q[5];
-cx q[0],q[5];
-cx q[30],q[5];
-sx q[31];
-rz(-2.8341145) q[31];
-sx q[31];
-rz(1.1723685) q[31];
-cx q[31],q[6];
-rz(pi/2) q[31];
-sx q[31];
-rz(pi/2) q[31];
-cx q[6],q[31];
-rz(-pi/4) q[31];
-cx q[0],q[31];
-rz(pi/4) q[31];
-cx q[6],q[31];
-rz(-pi/4) q[31];
-cx q[0],q[31];
-rz(3*pi/4) q[31];
-sx q[31];
-rz(pi/2) q[31];
-rz(pi/4) q[6];
-cx q[0],q[6];
-rz(pi/4) q[0];
-rz(-pi/4) q[6];
-cx q[0],q[6];
-cx q[31],q[6];
-sx q[32];
-rz(-2.2406965) q[32];
-sx q[32];
-rz(-1.4886593) q[32];
-cx q[32],q[7];
-rz(pi/2) q[32];
-sx q[32];
-rz(pi/2) q[32];
-cx q[7],q[32];
-rz(-pi/4) q[32];
-cx q[0],q[32];
-rz(pi/4) q[32];
-cx q[7],q[32];
-rz(-pi/4) q[32];
-cx q[0],q[32];
-rz(3*pi/4) q[32];
-sx q[32];
-rz(pi/2) q[32];
-rz(pi/4) q[7];
-cx q[0],q[7];
-rz(pi/4) q[0];
-rz(-pi/4) q[7];
-cx q[0],q[7];
-cx q[32],q[7];
-sx q[33];
-rz(2.8458959) q[33];
-sx q[33];
-rz(-1.2155675) q[33];
-cx q[33],q[8];
-rz(pi/2) q[33];
-sx q[33];
-rz(pi/2) q[33];
-cx q[8],q[33];
-rz(-pi/4) q[33];
-cx q[0],q[33];
-rz(pi/4) q[33];
-cx q[8],q[33];
-rz(-pi/4) q[33];
-cx q[0],q[33];
-rz(3*pi/4) q[33];
-sx q[33];
-rz(pi/2) q[33];
-rz(pi/4) q[8];
-cx q[0],q[8];
-rz(pi/4) q[0];
-rz(-pi/4) q[8];
-cx q[0],q[8];
-cx q[33],q[8];
-sx q[34];
-rz(2.5406721) q[34];
-sx q[34];
-rz(2.7108684) q[34];
-cx q[34],q[9];
-rz(pi/2) q[34];
-sx q[34];
-rz(pi/2) q[34];
-cx q[9],q[34];
-rz(-pi/4) q[34];
-cx q[0],q[34];
-rz(pi/4) q[34];
-cx q[9],q[34];
-rz(-pi/4) q[34];
-cx q[0],q[34];
-rz(3*pi/4) q[34];
-sx q[34];
-rz(pi/2) q[34];
-rz(pi/4) q[9];
-cx q[0],q[9];
-rz(pi/4) q[0];
-rz(-pi/4) q[9];
-cx q[0],q[9];
-cx q[34],q[9];
-sx q[35];
-rz(1.7875615) q[35];
-sx q[35];
-rz(-1.4639458) q[35];
-cx q[35],q[10];
-rz(pi/2) q[35];
-sx q[35];
-rz(pi/2) q[35];
-cx q[10],q[35];
-rz(-pi/4) q[35];
-cx q[0],q[35];
-rz(pi/4) q[35];
-cx q[10],q[35];
-rz(pi/4) q[10];
-rz(-pi/4) q[35];
-cx q[0],q[35];
-cx q[0],q[10];
-rz(pi/4) q[0];
-rz(-pi/4) q[10];
-cx q[0],q[10];
-rz(3*pi/4) q[35];
-sx q[35];
-rz(pi/2) q[35];
-cx q[35],q[10];
-sx q[36];
-rz(-1.0685089) q[36];
-sx q[36];
-rz(-2.5451109) q[36];
-cx q[36],q[11];
-rz(pi/2) q[36];
-sx q[36];
-rz(pi/2) q[36];
-cx q[11],q[36];
-rz(-pi/4) q[36];
-cx q[0],q[36];
-rz(pi/4) q[36];
-cx q[11],q[36];
-rz(pi/4) q[11];
-rz(-pi/4) q[36];
-cx q[0],q[36];
-cx q[0],q[11];
-rz(pi/4) q[0];
-rz(-pi/4) q[11];
-cx q[0],q[11];
-rz(3*pi/4) q[36];
-sx q[36];
-rz(pi/2) q[36];
-cx q[36],q[11];
-sx q[37];
-rz(-2.3683567) q[37];
-sx q[37];
-rz(-2.9746852) q[37];
-cx q[37],q[12];
-rz(pi/2) q[37];
-sx q[37];
-rz(pi/2) q[37];
-cx q[12],q[37];
-rz(-pi/4) q[37];
-cx q[0],q[37];
-rz(pi/4) q[37];
-cx q[12],q[37];
-rz(pi/4) q[12];
-rz(-pi/4) q[37];
-cx q[0],q[37];
-cx q[0],q[12];
-rz(pi/4) q[0];
-rz(-pi/4) q[12];
-cx q[0],q[12];
-rz(3*pi/4) q[37];
-sx q[37];
-rz(pi/2) q[37];
-cx q[37],q[12];
-sx q[38];
-rz(0.43403675) q[38];
-sx q[38];
-rz(2.9966472) q[38];
-cx q[38],q[13];
-rz(pi/2) q[38];
-sx q[38];
-rz(pi/2) q[38];
-cx q[13],q[38];
-rz(-pi/4) q[38];
-cx q[0],q[38];
-rz(pi/4) q[38];
-cx q[13],q[38];
-rz(pi/4) q[13];
-rz(-pi/4) q[38];
-cx q[0],q[38];
-cx q[0],q[13];
-rz(pi/4) q[0];
-rz(-pi/4) q[13];
-cx q[0],q[13];
-rz(3*pi/4) q[38];
-sx q[38];
-rz(pi/2) q[38];
-cx q[38],q[13];
-sx q[39];
-rz(0.23268365) q[39];
-sx q[39];
-rz(-1.9353602) q[39];
-cx q[39],q[14];
-rz(pi/2) q[39];
-sx q[39];
-rz(pi/2) q[39];
-cx q[14],q[39];
-rz(-pi/4) q[39];
-cx q[0],q[39];
-rz(pi/4) q[39];
-cx q[14],q[39];
-rz(pi/4) q[14];
-rz(-pi/4) q[39];
-cx q[0],q[39];
-cx q[0],q[14];
-rz(pi/4) q[0];
-rz(-pi/4) q[14];
-cx q[0],q[14];
-rz(3*pi/4) q[39];
-sx q[39];
-rz(pi/2) q[39];
-cx q[39],q[14];
-sx q[40];
-rz(-2.4071079) q[40];
-sx q[40];
-rz(1.4044851) q[40];
-cx q[40],q[15];
-rz(pi/2) q[40];
-sx q[40];
-rz(pi/2) q[40];
-cx q[15],q[40];
-rz(-pi/4) q[40];
-cx q[0],q[40];
-rz(pi/4) q[40];
-cx q[15],q[40];
-rz(pi/4) q[15];
-rz(-pi/4) q[40];
-cx q[0],q[40];
-cx q[0],q[15];
-rz(pi/4) q[0];
-rz(-pi/4) q[15];
-cx q[0],q[15];
-rz(3*pi/4) q[40];
-sx q[40];
-rz(pi/2) q[40];
-cx q[40],q[15];
-sx q[41];
-rz(0.74230745) q[41];
-sx q[41];
-rz(-2.6101701) q[41];
-cx q[41],q[16];
-rz(pi/2) q[41];
-sx q[41];
-rz(pi/2) q[41];
-cx q[16],q[41];
-rz(-pi/4) q[41];
-cx q[0],q[41];
-rz(pi/4) q[41];
-cx q[16],q[41];
-rz(pi/4) q[16];
-rz(-pi/4) q[41];
-cx q[0],q[41];
-cx q[0],q[16];
-rz(pi/4) q[0];
-rz(-pi/4) q[16];
-cx q[0],q[16];
-rz(3*pi/4) q[41];
-sx q[41];
-rz(pi/2) q[41];
-cx q[41],q[16];
-sx q[42];
-rz(-1.8193926) q[42];
-sx q[42];
-rz(0.59896205) q[42];
-cx q[42],q[17];
-rz(pi/2) q[42];
-sx q[42];
-rz(pi/2) q[42];
-cx q[17],q[42];
-rz(-pi/4) q[42];
-cx q[0],q[42];
-rz(pi/4) q[42];
-cx q[17],q[42];
-rz(pi/4) q[17];
-rz(-pi/4) q[42];
-cx q[0],q[42];
-cx q[0],q[17];
-rz(pi/4) q[0];
-rz(-pi/4) q[17];
-cx q[0],q[17];
-rz(3*pi/4) q[42];
-sx q[42];
-rz(pi/2) q[42];
-cx q[42],q[17];
-sx q[43];
-rz(-0.82014535) q[43];
-sx q[43];
-rz(2.027575) q[43];
-cx q[43],q[18];
-rz(pi/2) q[43];
-sx q[43];
-rz(pi/2) q[43];
-cx q[18],q[43];
-rz(-pi/4) q[43];
-cx q[0],q[43];
-rz(pi/4) q[43];
-cx q[18],q[43];
-rz(pi/4) q[18];
-rz(-pi/4) q[43];
-cx q[0],q[43];
-cx q[0],q[18];
-rz(pi/4) q[0];
-rz(-pi/4) q[18];
-cx q[0],q[18];
-rz(3*pi/4) q[43];
-sx q[43];
-rz(pi/2) q[43];
-cx q[43],q[18];
-sx q[44];
-rz(-1.8228533) q[44];
-sx q[44];
-rz(2.9451757) q[44];
-cx q[44],q[19];
-rz(pi/2) q[44];
-sx q[44];
-rz(pi/2) q[44];
-cx q[19],q[44];
-rz(-pi/4) q[44];
-cx q[0],q[44];
-rz(pi/4) q[44];
-cx q[19],q[44];
-rz(pi/4) q[19];
-rz(-pi/4) q[44];
-cx q[0],q[44];
-cx q[0],q[19];
-rz(pi/4) q[0];
-rz(-pi/4) q[19];
-cx q[0],q[19];
-rz(3*pi/4) q[44];
-sx q[44];
-rz(pi/2) q[44];
-cx q[44],q[19];
-sx q[45];
-rz(0.94127005) q[45];
-sx q[45];
-rz(0.97944735) q[45];
-cx q[45],q[20];
-rz(pi/2) q[45];
-sx q[45];
-rz(pi/2) q[45];
-cx q[20],q[45];
-rz(-pi/4) q[45];
-cx q[0],q[45];
-rz(pi/4) q[45];
-cx q[20],q[45];
-rz(pi/4) q[20];
-rz(-pi/4) q[45];
-cx q[0],q[45];
-cx q[0],q[20];
-rz(pi/4) q[0];
-rz(-pi/4) q[20];
-cx q[0],q[20];
-rz(3*pi/4) q[45];
-sx q[45];
-rz(pi/2) q[45];
-cx q[45],q[20];
-sx q[46];
-rz(2.5460823) q[46];
-sx q[46];
-rz(0.75142825) q[46];
-cx q[46],q[21];
-rz(pi/2) q[46];
-sx q[46];
-rz(pi/2) q[46];
-cx q[21],q[46];
-rz(-pi/4) q[46];
-cx q[0],q[46];
-rz(pi/4) q[46];
-cx q[21],q[46];
-rz(pi/4) q[21];
-rz(-pi/4) q[46];
-cx q[0],q[46];
-cx q[0],q[21];
-rz(pi/4) q[0];
-rz(-pi/4) q[21];
-cx q[0],q[21];
-rz(3*pi/4) q[46];
-sx q[46];
-rz(pi/2) q[46];
-cx q[46],q[21];
-sx q[47];
-rz(1.7435282) q[47];
-sx q[47];
-rz(-2.0265297) q[47];
-cx q[47],q[22];
-rz(pi/2) q[47];
-sx q[47];
-rz(pi/2) q[47];
-cx q[22],q[47];
-rz(-pi/4) q[47];
-cx q[0],q[47];
-rz(pi/4) q[47];
-cx q[22],q[47];
-rz(pi/4) q[22];
-rz(-pi/4) q[47];
-cx q[0],q[47];
-cx q[0],q[22];
-rz(pi/4) q[0];
-rz(-pi/4) q[22];
-cx q[0],q[22];
-rz(3*pi/4) q[47];
-sx q[47];
-rz(pi/2) q[47];
-cx q[47],q[22];
-sx q[48];
-rz(2.2516118) q[48];
-sx q[48];
-rz(-0.26396985) q[48];
-cx q[48],q[23];
-rz(pi/2) q[48];
-sx q[48];
-rz(pi/2) q[48];
-cx q[23],q[48];
-rz(-pi/4) q[48];
-cx q[0],q[48];
-rz(pi/4) q[48];
-cx q[23],q[48];
-rz(pi/4) q[23];
-rz(-pi/4) q[48];
-cx q[0],q[48];
-cx q[0],q[23];
-rz(pi/4) q[0];
-rz(-pi/4) q[23];
-cx q[0],q[23];
-rz(3*pi/4) q[48];
-sx q[48];
-rz(pi/2) q[48];
-cx q[48],q[23];
-sx q[49];
-rz(2.099378) q[49];
-sx q[49];
-rz(1.3698135) q[49];
-cx q[49],q[24];
-rz(pi/2) q[49];
-sx q[49];
-rz(pi/2) q[49];
-cx q[24],q[49];
-rz(-pi/4) q[49];
-cx q[0],q[49];
-rz(pi/4) q[49];
-cx q[24],q[49];
-rz(pi/4) q[24];
-rz(-pi/4) q[49];
-cx q[0],q[49];
-cx q[0],q[24];
-rz(pi/4) q[0];
-rz(-pi/4) q[24];
-cx q[0],q[24];
-rz(3*pi/4) q[49];
-sx q[49];
-rz(pi/2) q[49];
-cx q[49],q[24];
-sx q[50];
-rz(2.3718245) q[50];
-sx q[50];
-rz(1.5635517) q[50];
-cx q[50],q[25];
-rz(pi/2) q[50];
-sx q[50];
-rz(pi/2) q[50];
-cx q[25],q[50];
-rz(-pi/4) q[50];
-cx q[0],q[50];
-rz(pi/4) q[50];
-cx q[25],q[50];
-rz(pi/4) q[25];
-rz(-pi/4) q[50];
-cx q[0],q[50];
-cx q[0],q[25];
-rz(pi/4) q[0];
-rz(-pi/4) q[25];
-cx q[0],q[25];
-rz(pi/2) q[0];
-sx q[0];
-rz(pi/2) q[0];
-rz(3*pi/4) q[50];
-sx q[50];
-rz(pi/2) q[50];
-cx q[50],q[25];
-barrier q[0],q[1],q[2],q[3],q[4],q[5],q[6],q[7],q[8],q[9],q[10],q[11],q[12],q[13],q[14],q[15],q[16],q[17],q[18],q[19],q[20],q[21],q[22],q[23],q[24],q[25],q[26],q[27],q[28],q[29],q[30],q[31],q[32],q[33],q[34],q[35],q[36],q[37],q[38],q[39],q[40],q[41],q[42],q[43],q[44],q[45],q[46],q[47],q[48],q[49],q[50];
-measure q[0] -> meas[0];
-measure q[1] -> meas[1];
-measure q[2] -> meas[2];
-measure q[3] -> meas[3];
-measure q[4] -> meas[4];
-measure q[5] -> meas[5];
-measure q[6] -> meas[6];
-measure q[7] -> meas[7];
-measure q[8] -> meas[8];
-measure q[9] -> meas[9];
-measure q[10] -> meas[10];
-measure q[11] -> meas[11];
-measure q[12] -> meas[12];
-measure q[13] -> meas[13];
-measure q[14] -> meas[14];
-measure q[15] -> meas[15];
-measure q[16] -> meas[16];
-measure q[17] -> meas[17];
-measure q[18] -> meas[18];
-measure q[19] -> meas[19];
-measure q[20] -> meas[20];
-measure q[21] -> meas[21];
-measure q[22] -> meas[22];
-measure q[23] -> meas[23];
-measure q[24] -> meas[24];
-measure q[25] -> meas[25];
-measure q[26] -> meas[26];
-measure q[27] -> meas[27];
-measure q[28] -> meas[28];
-measure q[29] -> meas[29];
-measure q[30] -> meas[30];
-measure q[31] -> meas[31];
-measure q[32] -> meas[32];
-measure q[33] -> meas[33];
-measure q[34] -> meas[34];
-measure q[35] -> meas[35];
-measure q[36] -> meas[36];
-measure q[37] -> meas[37];
-measure q[38] -> meas[38];
-measure q[39] -> meas[39];
-measure q[40] -> meas[40];
-measure q[41] -> meas[41];
-measure q[42] -> meas[42];
-measure q[43] -> meas[43];
-measure q[44] -> meas[44];
-measure q[45] -> meas[45];
-measure q[46] -> meas[46];
-measure q[47] -> meas[47];
-measure q[48] -> meas[48];
-measure q[49] -> meas[49];
-measure q[50] -> meas[50];
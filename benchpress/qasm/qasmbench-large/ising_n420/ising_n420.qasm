@@ -1,5040 +0,0 @@
-OPENQASM 2.0;
-include "qelib1.inc";
-qreg q[420];
-creg c[420];
-creg meas[420];
-h q[0];
-h q[1];
-h q[2];
-h q[3];
-h q[4];
-h q[5];
-h q[6];
-h q[7];
-h q[8];
-h q[9];
-h q[10];
-h q[11];
-h q[12];
-h q[13];
-h q[14];
-h q[15];
-h q[16];
-h q[17];
-h q[18];
-h q[19];
-h q[20];
-h q[21];
-h q[22];
-h q[23];
-h q[24];
-h q[25];
-h q[26];
-h q[27];
-h q[28];
-h q[29];
-h q[30];
-h q[31];
-h q[32];
-h q[33];
-h q[34];
-h q[35];
-h q[36];
-h q[37];
-h q[38];
-h q[39];
-h q[40];
-h q[41];
-h q[42];
-h q[43];
-h q[44];
-h q[45];
-h q[46];
-h q[47];
-h q[48];
-h q[49];
-h q[50];
-h q[51];
-h q[52];
-h q[53];
-h q[54];
-h q[55];
-h q[56];
-h q[57];
-h q[58];
-h q[59];
-h q[60];
-h q[61];
-h q[62];
-h q[63];
-h q[64];
-h q[65];
-h q[66];
-h q[67];
-h q[68];
-h q[69];
-h q[70];
-h q[71];
-h q[72];
-h q[73];
-h q[74];
-h q[75];
-h q[76];
-h q[77];
-h q[78];
-h q[79];
-h q[80];
-h q[81];
-h q[82];
-h q[83];
-h q[84];
-h q[85];
-h q[86];
-h q[87];
-h q[88];
-h q[89];
-h q[90];
-h q[91];
-h q[92];
-h q[93];
-h q[94];
-h q[95];
-h q[96];
-h q[97];
-h q[98];
-h q[99];
-h q[100];
-h q[101];
-h q[102];
-h q[103];
-h q[104];
-h q[105];
-h q[106];
-h q[107];
-h q[108];
-h q[109];
-h q[110];
-h q[111];
-h q[112];
-h q[113];
-h q[114];
-h q[115];
-h q[116];
-h q[117];
-h q[118];
-h q[119];
-h q[120];
-h q[121];
-h q[122];
-h q[123];
-h q[124];
-h q[125];
-h q[126];
-h q[127];
-h q[128];
-h q[129];
-h q[130];
-h q[131];
-h q[132];
-h q[133];
-h q[134];
-h q[135];
-h q[136];
-h q[137];
-h q[138];
-h q[139];
-h q[140];
-h q[141];
-h q[142];
-h q[143];
-h q[144];
-h q[145];
-h q[146];
-h q[147];
-h q[148];
-h q[149];
-h q[150];
-h q[151];
-h q[152];
-h q[153];
-h q[154];
-h q[155];
-h q[156];
-h q[157];
-h q[158];
-h q[159];
-h q[160];
-h q[161];
-h q[162];
-h q[163];
-h q[164];
-h q[165];
-h q[166];
-h q[167];
-h q[168];
-h q[169];
-h q[170];
-h q[171];
-h q[172];
-h q[173];
-h q[174];
-h q[175];
-h q[176];
-h q[177];
-h q[178];
-h q[179];
-h q[180];
-h q[181];
-h q[182];
-h q[183];
-h q[184];
-h q[185];
-h q[186];
-h q[187];
-h q[188];
-h q[189];
-h q[190];
-h q[191];
-h q[192];
-h q[193];
-h q[194];
-h q[195];
-h q[196];
-h q[197];
-h q[198];
-h q[199];
-h q[200];
-h q[201];
-h q[202];
-h q[203];
-h q[204];
-h q[205];
-h q[206];
-h q[207];
-h q[208];
-h q[209];
-h q[210];
-h q[211];
-h q[212];
-h q[213];
-h q[214];
-h q[215];
-h q[216];
-h q[217];
-h q[218];
-h q[219];
-h q[220];
-h q[221];
-h q[222];
-h q[223];
-h q[224];
-h q[225];
-h q[226];
-h q[227];
-h q[228];
-h q[229];
-h q[230];
-h q[231];
-h q[232];
-h q[233];
-h q[234];
-h q[235];
-h q[236];
-h q[237];
-h q[238];
-h q[239];
-h q[240];
-h q[241];
-h q[242];
-h q[243];
-h q[244];
-h q[245];
-h q[246];
-h q[247];
-h q[248];
-h q[249];
-h q[250];
-h q[251];
-h q[252];
-h q[253];
-h q[254];
-h q[255];
-h q[256];
-h q[257];
-h q[258];
-h q[259];
-h q[260];
-h q[261];
-h q[262];
-h q[263];
-h q[264];
-h q[265];
-h q[266];
-h q[267];
-h q[268];
-h q[269];
-h q[270];
-h q[271];
-h q[272];
-h q[273];
-h q[274];
-h q[275];
-h q[276];
-h q[277];
-h q[278];
-h q[279];
-h q[280];
-h q[281];
-h q[282];
-h q[283];
-h q[284];
-h q[285];
-h q[286];
-h q[287];
-h q[288];
-h q[289];
-h q[290];
-h q[291];
-h q[292];
-h q[293];
-h q[294];
-h q[295];
-h q[296];
-h q[297];
-h q[298];
-h q[299];
-h q[300];
-h q[301];
-h q[302];
-h q[303];
-h q[304];
-h q[305];
-h q[306];
-h q[307];
-h q[308];
-h q[309];
-h q[310];
-h q[311];
-h q[312];
-h q[313];
-h q[314];
-h q[315];
-h q[316];
-h q[317];
-h q[318];
-h q[319];
-h q[320];
-h q[321];
-h q[322];
-h q[323];
-h q[324];
-h q[325];
-h q[326];
-h q[327];
-h q[328];
-h q[329];
-h q[330];
-h q[331];
-h q[332];
-h q[333];
-h q[334];
-h q[335];
-h q[336];
-h q[337];
-h q[338];
-h q[339];
-h q[340];
-h q[341];
-h q[342];
-h q[343];
-h q[344];
-h q[345];
-h q[346];
-h q[347];
-h q[348];
-h q[349];
-h q[350];
-h q[351];
-h q[352];
-h q[353];
-h q[354];
-h q[355];
-h q[356];
-h q[357];
-h q[358];
-h q[359];
-h q[360];
-h q[361];
-h q[362];
-h q[363];
-h q[364];
-h q[365];
-h q[366];
-h q[367];
-h q[368];
-h q[369];
-h q[370];
-h q[371];
-h q[372];
-h q[373];
-h q[374];
-h q[375];
-h q[376];
-h q[377];
-h q[378];
-h q[379];
-h q[380];
-h q[381];
-h q[382];
-h q[383];
-h q[384];
-h q[385];
-h q[386];
-h q[387];
-h q[388];
-h q[389];
-h q[390];
-h q[391];
-h q[392];
-h q[393];
-h q[394];
-h q[395];
-h q[396];
-h q[397];
-h q[398];
-h q[399];
-h q[400];
-h q[401];
-h q[402];
-h q[403];
-h q[404];
-h q[405];
-h q[406];
-h q[407];
-h q[408];
-h q[409];
-h q[410];
-h q[411];
-h q[412];
-h q[413];
-h q[414];
-h q[415];
-h q[416];
-h q[417];
-h q[418];
-h q[419];
-rz(-1.5340591) q[0];
-rz(1.5340591) q[1];
-rz(1.5340591) q[1];
-cx q[0],q[1];
-rz(-1.5340591) q[1];
-cx q[0],q[1];
-rz(-0.39690641) q[2];
-rz(0.39690641) q[3];
-rz(0.39690641) q[3];
-cx q[2],q[3];
-rz(-0.39690641) q[3];
-cx q[2],q[3];
-rz(-0.82646017) q[4];
-rz(0.82646017) q[5];
-rz(0.82646017) q[5];
-cx q[4],q[5];
-rz(-0.82646017) q[5];
-cx q[4],q[5];
-rz(-0.84985844) q[6];
-rz(0.84985844) q[7];
-rz(0.84985844) q[7];
-cx q[6],q[7];
-rz(-0.84985844) q[7];
-cx q[6],q[7];
-rz(-0.91759798) q[8];
-rz(0.91759798) q[9];
-rz(0.91759798) q[9];
-cx q[8],q[9];
-rz(-0.91759798) q[9];
-cx q[8],q[9];
-rz(1.8749584) q[10];
-rz(-1.8749584) q[11];
-rz(-1.8749584) q[11];
-cx q[10],q[11];
-rz(1.8749584) q[11];
-cx q[10],q[11];
-rz(1.0472238) q[12];
-rz(-1.0472238) q[13];
-rz(-1.0472238) q[13];
-cx q[12],q[13];
-rz(1.0472238) q[13];
-cx q[12],q[13];
-rz(1.2816426) q[14];
-rz(-1.2816426) q[15];
-rz(-1.2816426) q[15];
-cx q[14],q[15];
-rz(1.2816426) q[15];
-cx q[14],q[15];
-rz(-0.024048236) q[16];
-rz(0.024048236) q[17];
-rz(0.024048236) q[17];
-cx q[16],q[17];
-rz(-0.024048236) q[17];
-cx q[16],q[17];
-rz(-0.38292184) q[18];
-rz(0.38292184) q[19];
-rz(0.38292184) q[19];
-cx q[18],q[19];
-rz(-0.38292184) q[19];
-cx q[18],q[19];
-rz(1.2269769) q[20];
-rz(-1.2269769) q[21];
-rz(-1.2269769) q[21];
-cx q[20],q[21];
-rz(1.2269769) q[21];
-cx q[20],q[21];
-rz(0.54094153) q[22];
-rz(-0.54094153) q[23];
-rz(-0.54094153) q[23];
-cx q[22],q[23];
-rz(0.54094153) q[23];
-cx q[22],q[23];
-rz(-1.1390701) q[24];
-rz(1.1390701) q[25];
-rz(1.1390701) q[25];
-cx q[24],q[25];
-rz(-1.1390701) q[25];
-cx q[24],q[25];
-rz(-0.74812835) q[26];
-rz(0.74812835) q[27];
-rz(0.74812835) q[27];
-cx q[26],q[27];
-rz(-0.74812835) q[27];
-cx q[26],q[27];
-rz(-0.63725277) q[28];
-rz(0.63725277) q[29];
-rz(0.63725277) q[29];
-cx q[28],q[29];
-rz(-0.63725277) q[29];
-cx q[28],q[29];
-rz(-1.5783581) q[30];
-rz(1.5783581) q[31];
-rz(1.5783581) q[31];
-cx q[30],q[31];
-rz(-1.5783581) q[31];
-cx q[30],q[31];
-rz(-1.6804921) q[32];
-rz(1.6804921) q[33];
-rz(1.6804921) q[33];
-cx q[32],q[33];
-rz(-1.6804921) q[33];
-cx q[32],q[33];
-rz(0.18006581) q[34];
-rz(-0.18006581) q[35];
-rz(-0.18006581) q[35];
-cx q[34],q[35];
-rz(0.18006581) q[35];
-cx q[34],q[35];
-rz(-0.8121404) q[36];
-rz(0.8121404) q[37];
-rz(0.8121404) q[37];
-cx q[36],q[37];
-rz(-0.8121404) q[37];
-cx q[36],q[37];
-rz(-0.48880991) q[38];
-rz(0.48880991) q[39];
-rz(0.48880991) q[39];
-cx q[38],q[39];
-rz(-0.48880991) q[39];
-cx q[38],q[39];
-rz(0.41540246) q[40];
-rz(-0.41540246) q[41];
-rz(-0.41540246) q[41];
-cx q[40],q[41];
-rz(0.41540246) q[41];
-cx q[40],q[41];
-rz(0.26587655) q[42];
-rz(-0.26587655) q[43];
-rz(-0.26587655) q[43];
-cx q[42],q[43];
-rz(0.26587655) q[43];
-cx q[42],q[43];
-rz(-0.25071149) q[44];
-rz(0.25071149) q[45];
-rz(0.25071149) q[45];
-cx q[44],q[45];
-rz(-0.25071149) q[45];
-cx q[44],q[45];
-rz(-0.93489911) q[46];
-rz(0.93489911) q[47];
-rz(0.93489911) q[47];
-cx q[46],q[47];
-rz(-0.93489911) q[47];
-cx q[46],q[47];
-rz(-0.60575571) q[48];
-rz(0.60575571) q[49];
-rz(0.60575571) q[49];
-cx q[48],q[49];
-rz(-0.60575571) q[49];
-cx q[48],q[49];
-rz(-0.91278952) q[50];
-rz(0.91278952) q[51];
-rz(0.91278952) q[51];
-cx q[50],q[51];
-rz(-0.91278952) q[51];
-cx q[50],q[51];
-rz(1.0983019) q[52];
-rz(-1.0983019) q[53];
-rz(-1.0983019) q[53];
-cx q[52],q[53];
-rz(1.0983019) q[53];
-cx q[52],q[53];
-rz(1.7101532) q[54];
-rz(-1.7101532) q[55];
-rz(-1.7101532) q[55];
-cx q[54],q[55];
-rz(1.7101532) q[55];
-cx q[54],q[55];
-rz(-1.350436) q[56];
-rz(1.350436) q[57];
-rz(1.350436) q[57];
-cx q[56],q[57];
-rz(-1.350436) q[57];
-cx q[56],q[57];
-rz(-1.7386243) q[58];
-rz(1.7386243) q[59];
-rz(1.7386243) q[59];
-cx q[58],q[59];
-rz(-1.7386243) q[59];
-cx q[58],q[59];
-rz(0.40573162) q[60];
-rz(-0.40573162) q[61];
-rz(-0.40573162) q[61];
-cx q[60],q[61];
-rz(0.40573162) q[61];
-cx q[60],q[61];
-rz(-1.6698598) q[62];
-rz(1.6698598) q[63];
-rz(1.6698598) q[63];
-cx q[62],q[63];
-rz(-1.6698598) q[63];
-cx q[62],q[63];
-rz(0.21739391) q[64];
-rz(-0.21739391) q[65];
-rz(-0.21739391) q[65];
-cx q[64],q[65];
-rz(0.21739391) q[65];
-cx q[64],q[65];
-rz(1.4739172) q[66];
-rz(-1.4739172) q[67];
-rz(-1.4739172) q[67];
-cx q[66],q[67];
-rz(1.4739172) q[67];
-cx q[66],q[67];
-rz(-1.5360568) q[68];
-rz(1.5360568) q[69];
-rz(1.5360568) q[69];
-cx q[68],q[69];
-rz(-1.5360568) q[69];
-cx q[68],q[69];
-rz(-1.9997513) q[70];
-rz(1.9997513) q[71];
-rz(1.9997513) q[71];
-cx q[70],q[71];
-rz(-1.9997513) q[71];
-cx q[70],q[71];
-rz(-0.45191642) q[72];
-rz(0.45191642) q[73];
-rz(0.45191642) q[73];
-cx q[72],q[73];
-rz(-0.45191642) q[73];
-cx q[72],q[73];
-rz(1.0075632) q[74];
-rz(-1.0075632) q[75];
-rz(-1.0075632) q[75];
-cx q[74],q[75];
-rz(1.0075632) q[75];
-cx q[74],q[75];
-rz(0.20417016) q[76];
-rz(-0.20417016) q[77];
-rz(-0.20417016) q[77];
-cx q[76],q[77];
-rz(0.20417016) q[77];
-cx q[76],q[77];
-rz(-1.2009439) q[78];
-rz(1.2009439) q[79];
-rz(1.2009439) q[79];
-cx q[78],q[79];
-rz(-1.2009439) q[79];
-cx q[78],q[79];
-rz(0.51539259) q[80];
-rz(-0.51539259) q[81];
-rz(-0.51539259) q[81];
-cx q[80],q[81];
-rz(0.51539259) q[81];
-cx q[80],q[81];
-rz(1.0409893) q[82];
-rz(-1.0409893) q[83];
-rz(-1.0409893) q[83];
-cx q[82],q[83];
-rz(1.0409893) q[83];
-cx q[82],q[83];
-rz(-1.5742776) q[84];
-rz(1.5742776) q[85];
-rz(1.5742776) q[85];
-cx q[84],q[85];
-rz(-1.5742776) q[85];
-cx q[84],q[85];
-rz(-1.4604381) q[86];
-rz(1.4604381) q[87];
-rz(1.4604381) q[87];
-cx q[86],q[87];
-rz(-1.4604381) q[87];
-cx q[86],q[87];
-rz(0.057093524) q[88];
-rz(-0.057093524) q[89];
-rz(-0.057093524) q[89];
-cx q[88],q[89];
-rz(0.057093524) q[89];
-cx q[88],q[89];
-rz(-1.2641491) q[90];
-rz(1.2641491) q[91];
-rz(1.2641491) q[91];
-cx q[90],q[91];
-rz(-1.2641491) q[91];
-cx q[90],q[91];
-rz(-0.058875376) q[92];
-rz(0.058875376) q[93];
-rz(0.058875376) q[93];
-cx q[92],q[93];
-rz(-0.058875376) q[93];
-cx q[92],q[93];
-rz(0.77472166) q[94];
-rz(-0.77472166) q[95];
-rz(-0.77472166) q[95];
-cx q[94],q[95];
-rz(0.77472166) q[95];
-cx q[94],q[95];
-rz(1.1623079) q[96];
-rz(-1.1623079) q[97];
-rz(-1.1623079) q[97];
-cx q[96],q[97];
-rz(1.1623079) q[97];
-cx q[96],q[97];
-rz(1.0275378) q[98];
-rz(-1.0275378) q[99];
-rz(-1.0275378) q[99];
-cx q[98],q[99];
-rz(1.0275378) q[99];
-cx q[98],q[99];
-rz(1.100402) q[100];
-rz(-1.100402) q[101];
-rz(-1.100402) q[101];
-cx q[100],q[101];
-rz(1.100402) q[101];
-cx q[100],q[101];
-rz(-1.8433884) q[102];
-rz(1.8433884) q[103];
-rz(1.8433884) q[103];
-cx q[102],q[103];
-rz(-1.8433884) q[103];
-cx q[102],q[103];
-rz(0.65728034) q[104];
-rz(-0.65728034) q[105];
-rz(-0.65728034) q[105];
-cx q[104],q[105];
-rz(0.65728034) q[105];
-cx q[104],q[105];
-rz(-1.1789731) q[106];
-rz(1.1789731) q[107];
-rz(1.1789731) q[107];
-cx q[106],q[107];
-rz(-1.1789731) q[107];
-cx q[106],q[107];
-rz(0.45917229) q[108];
-rz(-0.45917229) q[109];
-rz(-0.45917229) q[109];
-cx q[108],q[109];
-rz(0.45917229) q[109];
-cx q[108],q[109];
-rz(-1.6360408) q[110];
-rz(1.6360408) q[111];
-rz(1.6360408) q[111];
-cx q[110],q[111];
-rz(-1.6360408) q[111];
-cx q[110],q[111];
-rz(0.58852816) q[112];
-rz(-0.58852816) q[113];
-rz(-0.58852816) q[113];
-cx q[112],q[113];
-rz(0.58852816) q[113];
-cx q[112],q[113];
-rz(-0.33822156) q[114];
-rz(0.33822156) q[115];
-rz(0.33822156) q[115];
-cx q[114],q[115];
-rz(-0.33822156) q[115];
-cx q[114],q[115];
-rz(-0.2242547) q[116];
-rz(0.2242547) q[117];
-rz(0.2242547) q[117];
-cx q[116],q[117];
-rz(-0.2242547) q[117];
-cx q[116],q[117];
-rz(1.8877292) q[118];
-rz(-1.8877292) q[119];
-rz(-1.8877292) q[119];
-cx q[118],q[119];
-rz(1.8877292) q[119];
-cx q[118],q[119];
-rz(0.27612909) q[120];
-rz(-0.27612909) q[121];
-rz(-0.27612909) q[121];
-cx q[120],q[121];
-rz(0.27612909) q[121];
-cx q[120],q[121];
-rz(-1.1065458) q[122];
-rz(1.1065458) q[123];
-rz(1.1065458) q[123];
-cx q[122],q[123];
-rz(-1.1065458) q[123];
-cx q[122],q[123];
-rz(1.363942) q[124];
-rz(-1.363942) q[125];
-rz(-1.363942) q[125];
-cx q[124],q[125];
-rz(1.363942) q[125];
-cx q[124],q[125];
-rz(0.82976507) q[126];
-rz(-0.82976507) q[127];
-rz(-0.82976507) q[127];
-cx q[126],q[127];
-rz(0.82976507) q[127];
-cx q[126],q[127];
-rz(0.33312197) q[128];
-rz(-0.33312197) q[129];
-rz(-0.33312197) q[129];
-cx q[128],q[129];
-rz(0.33312197) q[129];
-cx q[128],q[129];
-rz(-0.9912842) q[130];
-rz(0.9912842) q[131];
-rz(0.9912842) q[131];
-cx q[130],q[131];
-rz(-0.9912842) q[131];
-cx q[130],q[131];
-rz(-0.18268048) q[132];
-rz(0.18268048) q[133];
-rz(0.18268048) q[133];
-cx q[132],q[133];
-rz(-0.18268048) q[133];
-cx q[132],q[133];
-rz(-0.17624495) q[134];
-rz(0.17624495) q[135];
-rz(0.17624495) q[135];
-cx q[134],q[135];
-rz(-0.17624495) q[135];
-cx q[134],q[135];
-rz(-0.10567858) q[136];
-rz(0.10567858) q[137];
-rz(0.10567858) q[137];
-cx q[136],q[137];
-rz(-0.10567858) q[137];
-cx q[136],q[137];
-rz(0.16649009) q[138];
-rz(-0.16649009) q[139];
-rz(-0.16649009) q[139];
-cx q[138],q[139];
-rz(0.16649009) q[139];
-cx q[138],q[139];
-rz(-1.5506179) q[140];
-rz(1.5506179) q[141];
-rz(1.5506179) q[141];
-cx q[140],q[141];
-rz(-1.5506179) q[141];
-cx q[140],q[141];
-rz(0.10329466) q[142];
-rz(-0.10329466) q[143];
-rz(-0.10329466) q[143];
-cx q[142],q[143];
-rz(0.10329466) q[143];
-cx q[142],q[143];
-rz(-1.7729176) q[144];
-rz(1.7729176) q[145];
-rz(1.7729176) q[145];
-cx q[144],q[145];
-rz(-1.7729176) q[145];
-cx q[144],q[145];
-rz(1.1975148) q[146];
-rz(-1.1975148) q[147];
-rz(-1.1975148) q[147];
-cx q[146],q[147];
-rz(1.1975148) q[147];
-cx q[146],q[147];
-rz(-1.1783896) q[148];
-rz(1.1783896) q[149];
-rz(1.1783896) q[149];
-cx q[148],q[149];
-rz(-1.1783896) q[149];
-cx q[148],q[149];
-rz(1.2756511) q[150];
-rz(-1.2756511) q[151];
-rz(-1.2756511) q[151];
-cx q[150],q[151];
-rz(1.2756511) q[151];
-cx q[150],q[151];
-rz(0.88010944) q[152];
-rz(-0.88010944) q[153];
-rz(-0.88010944) q[153];
-cx q[152],q[153];
-rz(0.88010944) q[153];
-cx q[152],q[153];
-rz(-0.84749937) q[154];
-rz(0.84749937) q[155];
-rz(0.84749937) q[155];
-cx q[154],q[155];
-rz(-0.84749937) q[155];
-cx q[154],q[155];
-rz(-0.6905112) q[156];
-rz(0.6905112) q[157];
-rz(0.6905112) q[157];
-cx q[156],q[157];
-rz(-0.6905112) q[157];
-cx q[156],q[157];
-rz(-1.5794905) q[158];
-rz(1.5794905) q[159];
-rz(1.5794905) q[159];
-cx q[158],q[159];
-rz(-1.5794905) q[159];
-cx q[158],q[159];
-rz(0.024461154) q[160];
-rz(-0.024461154) q[161];
-rz(-0.024461154) q[161];
-cx q[160],q[161];
-rz(0.024461154) q[161];
-cx q[160],q[161];
-rz(0.25464045) q[162];
-rz(-0.25464045) q[163];
-rz(-0.25464045) q[163];
-cx q[162],q[163];
-rz(0.25464045) q[163];
-cx q[162],q[163];
-rz(-1.8381637) q[164];
-rz(1.8381637) q[165];
-rz(1.8381637) q[165];
-cx q[164],q[165];
-rz(-1.8381637) q[165];
-cx q[164],q[165];
-rz(0.76178636) q[166];
-rz(-0.76178636) q[167];
-rz(-0.76178636) q[167];
-cx q[166],q[167];
-rz(0.76178636) q[167];
-cx q[166],q[167];
-rz(-1.3353163) q[168];
-rz(1.3353163) q[169];
-rz(1.3353163) q[169];
-cx q[168],q[169];
-rz(-1.3353163) q[169];
-cx q[168],q[169];
-rz(-1.9705346) q[170];
-rz(1.9705346) q[171];
-rz(1.9705346) q[171];
-cx q[170],q[171];
-rz(-1.9705346) q[171];
-cx q[170],q[171];
-rz(-0.68865035) q[172];
-rz(0.68865035) q[173];
-rz(0.68865035) q[173];
-cx q[172],q[173];
-rz(-0.68865035) q[173];
-cx q[172],q[173];
-rz(-0.359792) q[174];
-rz(0.359792) q[175];
-rz(0.359792) q[175];
-cx q[174],q[175];
-rz(-0.359792) q[175];
-cx q[174],q[175];
-rz(-1.1029204) q[176];
-rz(1.1029204) q[177];
-rz(1.1029204) q[177];
-cx q[176],q[177];
-rz(-1.1029204) q[177];
-cx q[176],q[177];
-rz(1.3342957) q[178];
-rz(-1.3342957) q[179];
-rz(-1.3342957) q[179];
-cx q[178],q[179];
-rz(1.3342957) q[179];
-cx q[178],q[179];
-rz(-0.92989442) q[180];
-rz(0.92989442) q[181];
-rz(0.92989442) q[181];
-cx q[180],q[181];
-rz(-0.92989442) q[181];
-cx q[180],q[181];
-rz(0.25434764) q[182];
-rz(-0.25434764) q[183];
-rz(-0.25434764) q[183];
-cx q[182],q[183];
-rz(0.25434764) q[183];
-cx q[182],q[183];
-rz(0.10946046) q[184];
-rz(-0.10946046) q[185];
-rz(-0.10946046) q[185];
-cx q[184],q[185];
-rz(0.10946046) q[185];
-cx q[184],q[185];
-rz(-0.78328218) q[186];
-rz(0.78328218) q[187];
-rz(0.78328218) q[187];
-cx q[186],q[187];
-rz(-0.78328218) q[187];
-cx q[186],q[187];
-rz(0.40244052) q[188];
-rz(-0.40244052) q[189];
-rz(-0.40244052) q[189];
-cx q[188],q[189];
-rz(0.40244052) q[189];
-cx q[188],q[189];
-rz(-1.1395091) q[190];
-rz(1.1395091) q[191];
-rz(1.1395091) q[191];
-cx q[190],q[191];
-rz(-1.1395091) q[191];
-cx q[190],q[191];
-rz(-1.7202672) q[192];
-rz(1.7202672) q[193];
-rz(1.7202672) q[193];
-cx q[192],q[193];
-rz(-1.7202672) q[193];
-cx q[192],q[193];
-rz(-0.59219541) q[194];
-rz(0.59219541) q[195];
-rz(0.59219541) q[195];
-cx q[194],q[195];
-rz(-0.59219541) q[195];
-cx q[194],q[195];
-rz(1.7529668) q[196];
-rz(-1.7529668) q[197];
-rz(-1.7529668) q[197];
-cx q[196],q[197];
-rz(1.7529668) q[197];
-cx q[196],q[197];
-rz(-1.926393) q[198];
-rz(1.926393) q[199];
-rz(1.926393) q[199];
-cx q[198],q[199];
-rz(-1.926393) q[199];
-cx q[198],q[199];
-rz(-1.1973736) q[200];
-rz(1.1973736) q[201];
-rz(1.1973736) q[201];
-cx q[200],q[201];
-rz(-1.1973736) q[201];
-cx q[200],q[201];
-rz(1.1860544) q[202];
-rz(-1.1860544) q[203];
-rz(-1.1860544) q[203];
-cx q[202],q[203];
-rz(1.1860544) q[203];
-cx q[202],q[203];
-rz(-1.7639939) q[204];
-rz(1.7639939) q[205];
-rz(1.7639939) q[205];
-cx q[204],q[205];
-rz(-1.7639939) q[205];
-cx q[204],q[205];
-rz(-0.11740031) q[206];
-rz(0.11740031) q[207];
-rz(0.11740031) q[207];
-cx q[206],q[207];
-rz(-0.11740031) q[207];
-cx q[206],q[207];
-rz(-0.74978215) q[208];
-rz(0.74978215) q[209];
-rz(0.74978215) q[209];
-cx q[208],q[209];
-rz(-0.74978215) q[209];
-cx q[208],q[209];
-rz(0.30617838) q[210];
-rz(-0.30617838) q[211];
-rz(-0.30617838) q[211];
-cx q[210],q[211];
-rz(0.30617838) q[211];
-cx q[210],q[211];
-rz(0.2145526) q[212];
-rz(-0.2145526) q[213];
-rz(-0.2145526) q[213];
-cx q[212],q[213];
-rz(0.2145526) q[213];
-cx q[212],q[213];
-rz(0.87876184) q[214];
-rz(-0.87876184) q[215];
-rz(-0.87876184) q[215];
-cx q[214],q[215];
-rz(0.87876184) q[215];
-cx q[214],q[215];
-rz(0.54825642) q[216];
-rz(-0.54825642) q[217];
-rz(-0.54825642) q[217];
-cx q[216],q[217];
-rz(0.54825642) q[217];
-cx q[216],q[217];
-rz(-1.0010769) q[218];
-rz(1.0010769) q[219];
-rz(1.0010769) q[219];
-cx q[218],q[219];
-rz(-1.0010769) q[219];
-cx q[218],q[219];
-rz(1.3409566) q[220];
-rz(-1.3409566) q[221];
-rz(-1.3409566) q[221];
-cx q[220],q[221];
-rz(1.3409566) q[221];
-cx q[220],q[221];
-rz(0.70274329) q[222];
-rz(-0.70274329) q[223];
-rz(-0.70274329) q[223];
-cx q[222],q[223];
-rz(0.70274329) q[223];
-cx q[222],q[223];
-rz(-1.9842874) q[224];
-rz(1.9842874) q[225];
-rz(1.9842874) q[225];
-cx q[224],q[225];
-rz(-1.9842874) q[225];
-cx q[224],q[225];
-rz(0.79922989) q[226];
-rz(-0.79922989) q[227];
-rz(-0.79922989) q[227];
-cx q[226],q[227];
-rz(0.79922989) q[227];
-cx q[226],q[227];
-rz(1.7998708) q[228];
-rz(-1.7998708) q[229];
-rz(-1.7998708) q[229];
-cx q[228],q[229];
-rz(1.7998708) q[229];
-cx q[228],q[229];
-rz(-0.0063589807) q[230];
-rz(0.0063589807) q[231];
-rz(0.0063589807) q[231];
-cx q[230],q[231];
-rz(-0.0063589807) q[231];
-cx q[230],q[231];
-rz(0.55356137) q[232];
-rz(-0.55356137) q[233];
-rz(-0.55356137) q[233];
-cx q[232],q[233];
-rz(0.55356137) q[233];
-cx q[232],q[233];
-rz(-0.98696287) q[234];
-rz(0.98696287) q[235];
-rz(0.98696287) q[235];
-cx q[234],q[235];
-rz(-0.98696287) q[235];
-cx q[234],q[235];
-rz(-1.5465877) q[236];
-rz(1.5465877) q[237];
-rz(1.5465877) q[237];
-cx q[236],q[237];
-rz(-1.5465877) q[237];
-cx q[236],q[237];
-rz(1.3100674) q[238];
-rz(-1.3100674) q[239];
-rz(-1.3100674) q[239];
-cx q[238],q[239];
-rz(1.3100674) q[239];
-cx q[238],q[239];
-rz(-0.62987724) q[240];
-rz(0.62987724) q[241];
-rz(0.62987724) q[241];
-cx q[240],q[241];
-rz(-0.62987724) q[241];
-cx q[240],q[241];
-rz(0.35658201) q[242];
-rz(-0.35658201) q[243];
-rz(-0.35658201) q[243];
-cx q[242],q[243];
-rz(0.35658201) q[243];
-cx q[242],q[243];
-rz(-0.3543439) q[244];
-rz(0.3543439) q[245];
-rz(0.3543439) q[245];
-cx q[244],q[245];
-rz(-0.3543439) q[245];
-cx q[244],q[245];
-rz(1.3062222) q[246];
-rz(-1.3062222) q[247];
-rz(-1.3062222) q[247];
-cx q[246],q[247];
-rz(1.3062222) q[247];
-cx q[246],q[247];
-rz(-1.4223866) q[248];
-rz(1.4223866) q[249];
-rz(1.4223866) q[249];
-cx q[248],q[249];
-rz(-1.4223866) q[249];
-cx q[248],q[249];
-rz(-0.77616788) q[250];
-rz(0.77616788) q[251];
-rz(0.77616788) q[251];
-cx q[250],q[251];
-rz(-0.77616788) q[251];
-cx q[250],q[251];
-rz(1.1107677) q[252];
-rz(-1.1107677) q[253];
-rz(-1.1107677) q[253];
-cx q[252],q[253];
-rz(1.1107677) q[253];
-cx q[252],q[253];
-rz(-0.14607863) q[254];
-rz(0.14607863) q[255];
-rz(0.14607863) q[255];
-cx q[254],q[255];
-rz(-0.14607863) q[255];
-cx q[254],q[255];
-rz(1.2344497) q[256];
-rz(-1.2344497) q[257];
-rz(-1.2344497) q[257];
-cx q[256],q[257];
-rz(1.2344497) q[257];
-cx q[256],q[257];
-rz(-0.95947679) q[258];
-rz(0.95947679) q[259];
-rz(0.95947679) q[259];
-cx q[258],q[259];
-rz(-0.95947679) q[259];
-cx q[258],q[259];
-rz(-0.25646763) q[260];
-rz(0.25646763) q[261];
-rz(0.25646763) q[261];
-cx q[260],q[261];
-rz(-0.25646763) q[261];
-cx q[260],q[261];
-rz(-0.40030545) q[262];
-rz(0.40030545) q[263];
-rz(0.40030545) q[263];
-cx q[262],q[263];
-rz(-0.40030545) q[263];
-cx q[262],q[263];
-rz(0.153543) q[264];
-rz(-0.153543) q[265];
-rz(-0.153543) q[265];
-cx q[264],q[265];
-rz(0.153543) q[265];
-cx q[264],q[265];
-rz(-0.16936555) q[266];
-rz(0.16936555) q[267];
-rz(0.16936555) q[267];
-cx q[266],q[267];
-rz(-0.16936555) q[267];
-cx q[266],q[267];
-rz(0.69846239) q[268];
-rz(-0.69846239) q[269];
-rz(-0.69846239) q[269];
-cx q[268],q[269];
-rz(0.69846239) q[269];
-cx q[268],q[269];
-rz(-1.8894585) q[270];
-rz(1.8894585) q[271];
-rz(1.8894585) q[271];
-cx q[270],q[271];
-rz(-1.8894585) q[271];
-cx q[270],q[271];
-rz(-1.4569561) q[272];
-rz(1.4569561) q[273];
-rz(1.4569561) q[273];
-cx q[272],q[273];
-rz(-1.4569561) q[273];
-cx q[272],q[273];
-rz(-1.8309728) q[274];
-rz(1.8309728) q[275];
-rz(1.8309728) q[275];
-cx q[274],q[275];
-rz(-1.8309728) q[275];
-cx q[274],q[275];
-rz(-1.3359169) q[276];
-rz(1.3359169) q[277];
-rz(1.3359169) q[277];
-cx q[276],q[277];
-rz(-1.3359169) q[277];
-cx q[276],q[277];
-rz(0.92064664) q[278];
-rz(-0.92064664) q[279];
-rz(-0.92064664) q[279];
-cx q[278],q[279];
-rz(0.92064664) q[279];
-cx q[278],q[279];
-rz(1.2166727) q[280];
-rz(-1.2166727) q[281];
-rz(-1.2166727) q[281];
-cx q[280],q[281];
-rz(1.2166727) q[281];
-cx q[280],q[281];
-rz(-1.4079732) q[282];
-rz(1.4079732) q[283];
-rz(1.4079732) q[283];
-cx q[282],q[283];
-rz(-1.4079732) q[283];
-cx q[282],q[283];
-rz(1.6368084) q[284];
-rz(-1.6368084) q[285];
-rz(-1.6368084) q[285];
-cx q[284],q[285];
-rz(1.6368084) q[285];
-cx q[284],q[285];
-rz(1.2876708) q[286];
-rz(-1.2876708) q[287];
-rz(-1.2876708) q[287];
-cx q[286],q[287];
-rz(1.2876708) q[287];
-cx q[286],q[287];
-rz(-0.12354676) q[288];
-rz(0.12354676) q[289];
-rz(0.12354676) q[289];
-cx q[288],q[289];
-rz(-0.12354676) q[289];
-cx q[288],q[289];
-rz(0.14838523) q[290];
-rz(-0.14838523) q[291];
-rz(-0.14838523) q[291];
-cx q[290],q[291];
-rz(0.14838523) q[291];
-cx q[290],q[291];
-rz(-1.022973) q[292];
-rz(1.022973) q[293];
-rz(1.022973) q[293];
-cx q[292],q[293];
-rz(-1.022973) q[293];
-cx q[292],q[293];
-rz(-0.11752405) q[294];
-rz(0.11752405) q[295];
-rz(0.11752405) q[295];
-cx q[294],q[295];
-rz(-0.11752405) q[295];
-cx q[294],q[295];
-rz(0.7931182) q[296];
-rz(-0.7931182) q[297];
-rz(-0.7931182) q[297];
-cx q[296],q[297];
-rz(0.7931182) q[297];
-cx q[296],q[297];
-rz(-1.3514718) q[298];
-rz(1.3514718) q[299];
-rz(1.3514718) q[299];
-cx q[298],q[299];
-rz(-1.3514718) q[299];
-cx q[298],q[299];
-rz(-1.0937534) q[300];
-rz(1.0937534) q[301];
-rz(1.0937534) q[301];
-cx q[300],q[301];
-rz(-1.0937534) q[301];
-cx q[300],q[301];
-rz(0.88958127) q[302];
-rz(-0.88958127) q[303];
-rz(-0.88958127) q[303];
-cx q[302],q[303];
-rz(0.88958127) q[303];
-cx q[302],q[303];
-rz(0.61532966) q[304];
-rz(-0.61532966) q[305];
-rz(-0.61532966) q[305];
-cx q[304],q[305];
-rz(0.61532966) q[305];
-cx q[304],q[305];
-rz(1.6244274) q[306];
-rz(-1.6244274) q[307];
-rz(-1.6244274) q[307];
-cx q[306],q[307];
-rz(1.6244274) q[307];
-cx q[306],q[307];
-rz(-0.2535018) q[308];
-rz(0.2535018) q[309];
-rz(0.2535018) q[309];
-cx q[308],q[309];
-rz(-0.2535018) q[309];
-cx q[308],q[309];
-rz(-1.7014829) q[310];
-rz(1.7014829) q[311];
-rz(1.7014829) q[311];
-cx q[310],q[311];
-rz(-1.7014829) q[311];
-cx q[310],q[311];
-rz(1.7444392) q[312];
-rz(-1.7444392) q[313];
-rz(-1.7444392) q[313];
-cx q[312],q[313];
-rz(1.7444392) q[313];
-cx q[312],q[313];
-rz(-0.26374276) q[314];
-rz(0.26374276) q[315];
-rz(0.26374276) q[315];
-cx q[314],q[315];
-rz(-0.26374276) q[315];
-cx q[314],q[315];
-rz(-0.54053246) q[316];
-rz(0.54053246) q[317];
-rz(0.54053246) q[317];
-cx q[316],q[317];
-rz(-0.54053246) q[317];
-cx q[316],q[317];
-rz(-0.66510401) q[318];
-rz(0.66510401) q[319];
-rz(0.66510401) q[319];
-cx q[318],q[319];
-rz(-0.66510401) q[319];
-cx q[318],q[319];
-rz(-1.3943824) q[320];
-rz(1.3943824) q[321];
-rz(1.3943824) q[321];
-cx q[320],q[321];
-rz(-1.3943824) q[321];
-cx q[320],q[321];
-rz(-0.70932219) q[322];
-rz(0.70932219) q[323];
-rz(0.70932219) q[323];
-cx q[322],q[323];
-rz(-0.70932219) q[323];
-cx q[322],q[323];
-rz(-0.061394025) q[324];
-rz(0.061394025) q[325];
-rz(0.061394025) q[325];
-cx q[324],q[325];
-rz(-0.061394025) q[325];
-cx q[324],q[325];
-rz(1.3859628) q[326];
-rz(-1.3859628) q[327];
-rz(-1.3859628) q[327];
-cx q[326],q[327];
-rz(1.3859628) q[327];
-cx q[326],q[327];
-rz(1.5797162) q[328];
-rz(-1.5797162) q[329];
-rz(-1.5797162) q[329];
-cx q[328],q[329];
-rz(1.5797162) q[329];
-cx q[328],q[329];
-rz(-0.75484532) q[330];
-rz(0.75484532) q[331];
-rz(0.75484532) q[331];
-cx q[330],q[331];
-rz(-0.75484532) q[331];
-cx q[330],q[331];
-rz(-0.12358433) q[332];
-rz(0.12358433) q[333];
-rz(0.12358433) q[333];
-cx q[332],q[333];
-rz(-0.12358433) q[333];
-cx q[332],q[333];
-rz(-1.7616715) q[334];
-rz(1.7616715) q[335];
-rz(1.7616715) q[335];
-cx q[334],q[335];
-rz(-1.7616715) q[335];
-cx q[334],q[335];
-rz(-1.1818872) q[336];
-rz(1.1818872) q[337];
-rz(1.1818872) q[337];
-cx q[336],q[337];
-rz(-1.1818872) q[337];
-cx q[336],q[337];
-rz(-1.2589693) q[338];
-rz(1.2589693) q[339];
-rz(1.2589693) q[339];
-cx q[338],q[339];
-rz(-1.2589693) q[339];
-cx q[338],q[339];
-rz(-0.65804773) q[340];
-rz(0.65804773) q[341];
-rz(0.65804773) q[341];
-cx q[340],q[341];
-rz(-0.65804773) q[341];
-cx q[340],q[341];
-rz(-0.70900862) q[342];
-rz(0.70900862) q[343];
-rz(0.70900862) q[343];
-cx q[342],q[343];
-rz(-0.70900862) q[343];
-cx q[342],q[343];
-rz(-0.35943606) q[344];
-rz(0.35943606) q[345];
-rz(0.35943606) q[345];
-cx q[344],q[345];
-rz(-0.35943606) q[345];
-cx q[344],q[345];
-rz(0.38910125) q[346];
-rz(-0.38910125) q[347];
-rz(-0.38910125) q[347];
-cx q[346],q[347];
-rz(0.38910125) q[347];
-cx q[346],q[347];
-rz(1.5815632) q[348];
-rz(-1.5815632) q[349];
-rz(-1.5815632) q[349];
-cx q[348],q[349];
-rz(1.5815632) q[349];
-cx q[348],q[349];
-rz(0.32867539) q[350];
-rz(-0.32867539) q[351];
-rz(-0.32867539) q[351];
-cx q[350],q[351];
-rz(0.32867539) q[351];
-cx q[350],q[351];
-rz(-0.84173338) q[352];
-rz(0.84173338) q[353];
-rz(0.84173338) q[353];
-cx q[352],q[353];
-rz(-0.84173338) q[353];
-cx q[352],q[353];
-rz(0.62869741) q[354];
-rz(-0.62869741) q[355];
-rz(-0.62869741) q[355];
-cx q[354],q[355];
-rz(0.62869741) q[355];
-cx q[354],q[355];
-rz(1.9476428) q[356];
-rz(-1.9476428) q[357];
-rz(-1.9476428) q[357];
-cx q[356],q[357];
-rz(1.9476428) q[357];
-cx q[356],q[357];
-rz(-1.2966494) q[358];
-rz(1.2966494) q[359];
-rz(1.2966494) q[359];
-cx q[358],q[359];
-rz(-1.2966494) q[359];
-cx q[358],q[359];
-rz(-0.51581866) q[360];
-rz(0.51581866) q[361];
-rz(0.51581866) q[361];
-cx q[360],q[361];
-rz(-0.51581866) q[361];
-cx q[360],q[361];
-rz(1.6682385) q[362];
-rz(-1.6682385) q[363];
-rz(-1.6682385) q[363];
-cx q[362],q[363];
-rz(1.6682385) q[363];
-cx q[362],q[363];
-rz(-1.4055587) q[364];
-rz(1.4055587) q[365];
-rz(1.4055587) q[365];
-cx q[364],q[365];
-rz(-1.4055587) q[365];
-cx q[364],q[365];
-rz(-0.20141337) q[366];
-rz(0.20141337) q[367];
-rz(0.20141337) q[367];
-cx q[366],q[367];
-rz(-0.20141337) q[367];
-cx q[366],q[367];
-rz(1.5750507) q[368];
-rz(-1.5750507) q[369];
-rz(-1.5750507) q[369];
-cx q[368],q[369];
-rz(1.5750507) q[369];
-cx q[368],q[369];
-rz(-1.7434788) q[370];
-rz(1.7434788) q[371];
-rz(1.7434788) q[371];
-cx q[370],q[371];
-rz(-1.7434788) q[371];
-cx q[370],q[371];
-rz(0.56719198) q[372];
-rz(-0.56719198) q[373];
-rz(-0.56719198) q[373];
-cx q[372],q[373];
-rz(0.56719198) q[373];
-cx q[372],q[373];
-rz(-0.065333286) q[374];
-rz(0.065333286) q[375];
-rz(0.065333286) q[375];
-cx q[374],q[375];
-rz(-0.065333286) q[375];
-cx q[374],q[375];
-rz(-1.218073) q[376];
-rz(1.218073) q[377];
-rz(1.218073) q[377];
-cx q[376],q[377];
-rz(-1.218073) q[377];
-cx q[376],q[377];
-rz(-1.584715) q[378];
-rz(1.584715) q[379];
-rz(1.584715) q[379];
-cx q[378],q[379];
-rz(-1.584715) q[379];
-cx q[378],q[379];
-rz(-1.0212047) q[380];
-rz(1.0212047) q[381];
-rz(1.0212047) q[381];
-cx q[380],q[381];
-rz(-1.0212047) q[381];
-cx q[380],q[381];
-rz(0.037812935) q[382];
-rz(-0.037812935) q[383];
-rz(-0.037812935) q[383];
-cx q[382],q[383];
-rz(0.037812935) q[383];
-cx q[382],q[383];
-rz(-1.2246269) q[384];
-rz(1.2246269) q[385];
-rz(1.2246269) q[385];
-cx q[384],q[385];
-rz(-1.2246269) q[385];
-cx q[384],q[385];
-rz(-1.3810027) q[386];
-rz(1.3810027) q[387];
-rz(1.3810027) q[387];
-cx q[386],q[387];
-rz(-1.3810027) q[387];
-cx q[386],q[387];
-rz(-0.88503766) q[388];
-rz(0.88503766) q[389];
-rz(0.88503766) q[389];
-cx q[388],q[389];
-rz(-0.88503766) q[389];
-cx q[388],q[389];
-rz(0.31929149) q[390];
-rz(-0.31929149) q[391];
-rz(-0.31929149) q[391];
-cx q[390],q[391];
-rz(0.31929149) q[391];
-cx q[390],q[391];
-rz(-1.8180106) q[392];
-rz(1.8180106) q[393];
-rz(1.8180106) q[393];
-cx q[392],q[393];
-rz(-1.8180106) q[393];
-cx q[392],q[393];
-rz(-1.2544885) q[394];
-rz(1.2544885) q[395];
-rz(1.2544885) q[395];
-cx q[394],q[395];
-rz(-1.2544885) q[395];
-cx q[394],q[395];
-rz(1.1921235) q[396];
-rz(-1.1921235) q[397];
-rz(-1.1921235) q[397];
-cx q[396],q[397];
-rz(1.1921235) q[397];
-cx q[396],q[397];
-rz(-0.58723094) q[398];
-rz(0.58723094) q[399];
-rz(0.58723094) q[399];
-cx q[398],q[399];
-rz(-0.58723094) q[399];
-cx q[398],q[399];
-rz(0.94306685) q[400];
-rz(-0.94306685) q[401];
-rz(-0.94306685) q[401];
-cx q[400],q[401];
-rz(0.94306685) q[401];
-cx q[400],q[401];
-rz(1.9545762) q[402];
-rz(-1.9545762) q[403];
-rz(-1.9545762) q[403];
-cx q[402],q[403];
-rz(1.9545762) q[403];
-cx q[402],q[403];
-rz(-1.8922651) q[404];
-rz(1.8922651) q[405];
-rz(1.8922651) q[405];
-cx q[404],q[405];
-rz(-1.8922651) q[405];
-cx q[404],q[405];
-rz(-1.1968483) q[406];
-rz(1.1968483) q[407];
-rz(1.1968483) q[407];
-cx q[406],q[407];
-rz(-1.1968483) q[407];
-cx q[406],q[407];
-rz(-1.0801415) q[408];
-rz(1.0801415) q[409];
-rz(1.0801415) q[409];
-cx q[408],q[409];
-rz(-1.0801415) q[409];
-cx q[408],q[409];
-rz(1.6261783) q[410];
-rz(-1.6261783) q[411];
-rz(-1.6261783) q[411];
-cx q[410],q[411];
-rz(1.6261783) q[411];
-cx q[410],q[411];
-rz(-1.3785422) q[412];
-rz(1.3785422) q[413];
-rz(1.3785422) q[413];
-cx q[412],q[413];
-rz(-1.3785422) q[413];
-cx q[412],q[413];
-rz(-1.5153818) q[414];
-rz(1.5153818) q[415];
-rz(1.5153818) q[415];
-cx q[414],q[415];
-rz(-1.5153818) q[415];
-cx q[414],q[415];
-rz(-0.082418304) q[416];
-rz(0.082418304) q[417];
-rz(0.082418304) q[417];
-cx q[416],q[417];
-rz(-0.082418304) q[417];
-cx q[416],q[417];
-rz(-0.51380049) q[418];
-rz(0.51380049) q[419];
-rz(0.51380049) q[419];
-cx q[418],q[419];
-rz(-0.51380049) q[419];
-cx q[418],q[419];
-rz(0.66194367) q[1];
-rz(-0.66194367) q[2];
-rz(-0.66194367) q[2];
-cx q[1],q[2];
-rz(0.66194367) q[2];
-cx q[1],q[2];
-rz(1.1622364) q[3];
-rz(-1.1622364) q[4];
-rz(-1.1622364) q[4];
-cx q[3],q[4];
-rz(1.1622364) q[4];
-cx q[3],q[4];
-rz(0.87189587) q[5];
-rz(-0.87189587) q[6];
-rz(-0.87189587) q[6];
-cx q[5],q[6];
-rz(0.87189587) q[6];
-cx q[5],q[6];
-rz(1.1035209) q[7];
-rz(-1.1035209) q[8];
-rz(-1.1035209) q[8];
-cx q[7],q[8];
-rz(1.1035209) q[8];
-cx q[7],q[8];
-rz(-0.5867462) q[9];
-rz(0.5867462) q[10];
-rz(0.5867462) q[10];
-cx q[9],q[10];
-rz(-0.5867462) q[10];
-cx q[9],q[10];
-rz(1.225402) q[11];
-rz(-1.225402) q[12];
-rz(-1.225402) q[12];
-cx q[11],q[12];
-rz(1.225402) q[12];
-cx q[11],q[12];
-rz(-0.09379511) q[13];
-rz(0.09379511) q[14];
-rz(0.09379511) q[14];
-cx q[13],q[14];
-rz(-0.09379511) q[14];
-cx q[13],q[14];
-rz(1.2280604) q[15];
-rz(-1.2280604) q[16];
-rz(-1.2280604) q[16];
-cx q[15],q[16];
-rz(1.2280604) q[16];
-cx q[15],q[16];
-rz(-0.35052766) q[17];
-rz(0.35052766) q[18];
-rz(0.35052766) q[18];
-cx q[17],q[18];
-rz(-0.35052766) q[18];
-cx q[17],q[18];
-rz(0.58161614) q[19];
-rz(-0.58161614) q[20];
-rz(-0.58161614) q[20];
-cx q[19],q[20];
-rz(0.58161614) q[20];
-cx q[19],q[20];
-rz(-0.34109207) q[21];
-rz(0.34109207) q[22];
-rz(0.34109207) q[22];
-cx q[21],q[22];
-rz(-0.34109207) q[22];
-cx q[21],q[22];
-rz(1.1964101) q[23];
-rz(-1.1964101) q[24];
-rz(-1.1964101) q[24];
-cx q[23],q[24];
-rz(1.1964101) q[24];
-cx q[23],q[24];
-rz(-1.4542567) q[25];
-rz(1.4542567) q[26];
-rz(1.4542567) q[26];
-cx q[25],q[26];
-rz(-1.4542567) q[26];
-cx q[25],q[26];
-rz(-1.7526827) q[27];
-rz(1.7526827) q[28];
-rz(1.7526827) q[28];
-cx q[27],q[28];
-rz(-1.7526827) q[28];
-cx q[27],q[28];
-rz(0.78758675) q[29];
-rz(-0.78758675) q[30];
-rz(-0.78758675) q[30];
-cx q[29],q[30];
-rz(0.78758675) q[30];
-cx q[29],q[30];
-rz(0.31825583) q[31];
-rz(-0.31825583) q[32];
-rz(-0.31825583) q[32];
-cx q[31],q[32];
-rz(0.31825583) q[32];
-cx q[31],q[32];
-rz(1.3198822) q[33];
-rz(-1.3198822) q[34];
-rz(-1.3198822) q[34];
-cx q[33],q[34];
-rz(1.3198822) q[34];
-cx q[33],q[34];
-rz(-0.33574444) q[35];
-rz(0.33574444) q[36];
-rz(0.33574444) q[36];
-cx q[35],q[36];
-rz(-0.33574444) q[36];
-cx q[35],q[36];
-rz(-1.9762233) q[37];
-rz(1.9762233) q[38];
-rz(1.9762233) q[38];
-cx q[37],q[38];
-rz(-1.9762233) q[38];
-cx q[37],q[38];
-rz(-0.51729742) q[39];
-rz(0.51729742) q[40];
-rz(0.51729742) q[40];
-cx q[39],q[40];
-rz(-0.51729742) q[40];
-cx q[39],q[40];
-rz(1.5037095) q[41];
-rz(-1.5037095) q[42];
-rz(-1.5037095) q[42];
-cx q[41],q[42];
-rz(1.5037095) q[42];
-cx q[41],q[42];
-rz(1.7162834) q[43];
-rz(-1.7162834) q[44];
-rz(-1.7162834) q[44];
-cx q[43],q[44];
-rz(1.7162834) q[44];
-cx q[43],q[44];
-rz(0.70907762) q[45];
-rz(-0.70907762) q[46];
-rz(-0.70907762) q[46];
-cx q[45],q[46];
-rz(0.70907762) q[46];
-cx q[45],q[46];
-rz(-0.94827693) q[47];
-rz(0.94827693) q[48];
-rz(0.94827693) q[48];
-cx q[47],q[48];
-rz(-0.94827693) q[48];
-cx q[47],q[48];
-rz(1.4072817) q[49];
-rz(-1.4072817) q[50];
-rz(-1.4072817) q[50];
-cx q[49],q[50];
-rz(1.4072817) q[50];
-cx q[49],q[50];
-rz(0.50920629) q[51];
-rz(-0.50920629) q[52];
-rz(-0.50920629) q[52];
-cx q[51],q[52];
-rz(0.50920629) q[52];
-cx q[51],q[52];
-rz(0.83249831) q[53];
-rz(-0.83249831) q[54];
-rz(-0.83249831) q[54];
-cx q[53],q[54];
-rz(0.83249831) q[54];
-cx q[53],q[54];
-rz(-0.4757236) q[55];
-rz(0.4757236) q[56];
-rz(0.4757236) q[56];
-cx q[55],q[56];
-rz(-0.4757236) q[56];
-cx q[55],q[56];
-rz(0.72233419) q[57];
-rz(-0.72233419) q[58];
-rz(-0.72233419) q[58];
-cx q[57],q[58];
-rz(0.72233419) q[58];
-cx q[57],q[58];
-rz(-1.3806044) q[59];
-rz(1.3806044) q[60];
-rz(1.3806044) q[60];
-cx q[59],q[60];
-rz(-1.3806044) q[60];
-cx q[59],q[60];
-rz(1.3779107) q[61];
-rz(-1.3779107) q[62];
-rz(-1.3779107) q[62];
-cx q[61],q[62];
-rz(1.3779107) q[62];
-cx q[61],q[62];
-rz(-0.55073908) q[63];
-rz(0.55073908) q[64];
-rz(0.55073908) q[64];
-cx q[63],q[64];
-rz(-0.55073908) q[64];
-cx q[63],q[64];
-rz(-0.73796434) q[65];
-rz(0.73796434) q[66];
-rz(0.73796434) q[66];
-cx q[65],q[66];
-rz(-0.73796434) q[66];
-cx q[65],q[66];
-rz(-1.2242633) q[67];
-rz(1.2242633) q[68];
-rz(1.2242633) q[68];
-cx q[67],q[68];
-rz(-1.2242633) q[68];
-cx q[67],q[68];
-rz(0.14442589) q[69];
-rz(-0.14442589) q[70];
-rz(-0.14442589) q[70];
-cx q[69],q[70];
-rz(0.14442589) q[70];
-cx q[69],q[70];
-rz(-0.70612296) q[71];
-rz(0.70612296) q[72];
-rz(0.70612296) q[72];
-cx q[71],q[72];
-rz(-0.70612296) q[72];
-cx q[71],q[72];
-rz(-1.8918136) q[73];
-rz(1.8918136) q[74];
-rz(1.8918136) q[74];
-cx q[73],q[74];
-rz(-1.8918136) q[74];
-cx q[73],q[74];
-rz(1.3661392) q[75];
-rz(-1.3661392) q[76];
-rz(-1.3661392) q[76];
-cx q[75],q[76];
-rz(1.3661392) q[76];
-cx q[75],q[76];
-rz(-1.6602674) q[77];
-rz(1.6602674) q[78];
-rz(1.6602674) q[78];
-cx q[77],q[78];
-rz(-1.6602674) q[78];
-cx q[77],q[78];
-rz(0.57509766) q[79];
-rz(-0.57509766) q[80];
-rz(-0.57509766) q[80];
-cx q[79],q[80];
-rz(0.57509766) q[80];
-cx q[79],q[80];
-rz(1.5722562) q[81];
-rz(-1.5722562) q[82];
-rz(-1.5722562) q[82];
-cx q[81],q[82];
-rz(1.5722562) q[82];
-cx q[81],q[82];
-rz(-1.0641233) q[83];
-rz(1.0641233) q[84];
-rz(1.0641233) q[84];
-cx q[83],q[84];
-rz(-1.0641233) q[84];
-cx q[83],q[84];
-rz(-1.8405637) q[85];
-rz(1.8405637) q[86];
-rz(1.8405637) q[86];
-cx q[85],q[86];
-rz(-1.8405637) q[86];
-cx q[85],q[86];
-rz(-0.44910596) q[87];
-rz(0.44910596) q[88];
-rz(0.44910596) q[88];
-cx q[87],q[88];
-rz(-0.44910596) q[88];
-cx q[87],q[88];
-rz(-0.31048256) q[89];
-rz(0.31048256) q[90];
-rz(0.31048256) q[90];
-cx q[89],q[90];
-rz(-0.31048256) q[90];
-cx q[89],q[90];
-rz(-1.3078539) q[91];
-rz(1.3078539) q[92];
-rz(1.3078539) q[92];
-cx q[91],q[92];
-rz(-1.3078539) q[92];
-cx q[91],q[92];
-rz(1.1066747) q[93];
-rz(-1.1066747) q[94];
-rz(-1.1066747) q[94];
-cx q[93],q[94];
-rz(1.1066747) q[94];
-cx q[93],q[94];
-rz(1.177511) q[95];
-rz(-1.177511) q[96];
-rz(-1.177511) q[96];
-cx q[95],q[96];
-rz(1.177511) q[96];
-cx q[95],q[96];
-rz(-0.5779187) q[97];
-rz(0.5779187) q[98];
-rz(0.5779187) q[98];
-cx q[97],q[98];
-rz(-0.5779187) q[98];
-cx q[97],q[98];
-rz(-0.89629203) q[99];
-rz(0.89629203) q[100];
-rz(0.89629203) q[100];
-cx q[99],q[100];
-rz(-0.89629203) q[100];
-cx q[99],q[100];
-rz(1.4819045) q[101];
-rz(-1.4819045) q[102];
-rz(-1.4819045) q[102];
-cx q[101],q[102];
-rz(1.4819045) q[102];
-cx q[101],q[102];
-rz(-0.43682976) q[103];
-rz(0.43682976) q[104];
-rz(0.43682976) q[104];
-cx q[103],q[104];
-rz(-0.43682976) q[104];
-cx q[103],q[104];
-rz(0.44513466) q[105];
-rz(-0.44513466) q[106];
-rz(-0.44513466) q[106];
-cx q[105],q[106];
-rz(0.44513466) q[106];
-cx q[105],q[106];
-rz(-0.10678698) q[107];
-rz(0.10678698) q[108];
-rz(0.10678698) q[108];
-cx q[107],q[108];
-rz(-0.10678698) q[108];
-cx q[107],q[108];
-rz(1.2316812) q[109];
-rz(-1.2316812) q[110];
-rz(-1.2316812) q[110];
-cx q[109],q[110];
-rz(1.2316812) q[110];
-cx q[109],q[110];
-rz(-0.93193973) q[111];
-rz(0.93193973) q[112];
-rz(0.93193973) q[112];
-cx q[111],q[112];
-rz(-0.93193973) q[112];
-cx q[111],q[112];
-rz(1.4032211) q[113];
-rz(-1.4032211) q[114];
-rz(-1.4032211) q[114];
-cx q[113],q[114];
-rz(1.4032211) q[114];
-cx q[113],q[114];
-rz(1.3823863) q[115];
-rz(-1.3823863) q[116];
-rz(-1.3823863) q[116];
-cx q[115],q[116];
-rz(1.3823863) q[116];
-cx q[115],q[116];
-rz(-1.3910375) q[117];
-rz(1.3910375) q[118];
-rz(1.3910375) q[118];
-cx q[117],q[118];
-rz(-1.3910375) q[118];
-cx q[117],q[118];
-rz(-1.9422048) q[119];
-rz(1.9422048) q[120];
-rz(1.9422048) q[120];
-cx q[119],q[120];
-rz(-1.9422048) q[120];
-cx q[119],q[120];
-rz(-1.253623) q[121];
-rz(1.253623) q[122];
-rz(1.253623) q[122];
-cx q[121],q[122];
-rz(-1.253623) q[122];
-cx q[121],q[122];
-rz(0.7409566) q[123];
-rz(-0.7409566) q[124];
-rz(-0.7409566) q[124];
-cx q[123],q[124];
-rz(0.7409566) q[124];
-cx q[123],q[124];
-rz(-0.49222458) q[125];
-rz(0.49222458) q[126];
-rz(0.49222458) q[126];
-cx q[125],q[126];
-rz(-0.49222458) q[126];
-cx q[125],q[126];
-rz(0.31679969) q[127];
-rz(-0.31679969) q[128];
-rz(-0.31679969) q[128];
-cx q[127],q[128];
-rz(0.31679969) q[128];
-cx q[127],q[128];
-rz(0.192143) q[129];
-rz(-0.192143) q[130];
-rz(-0.192143) q[130];
-cx q[129],q[130];
-rz(0.192143) q[130];
-cx q[129],q[130];
-rz(-1.4380623) q[131];
-rz(1.4380623) q[132];
-rz(1.4380623) q[132];
-cx q[131],q[132];
-rz(-1.4380623) q[132];
-cx q[131],q[132];
-rz(1.6987193) q[133];
-rz(-1.6987193) q[134];
-rz(-1.6987193) q[134];
-cx q[133],q[134];
-rz(1.6987193) q[134];
-cx q[133],q[134];
-rz(-0.58259414) q[135];
-rz(0.58259414) q[136];
-rz(0.58259414) q[136];
-cx q[135],q[136];
-rz(-0.58259414) q[136];
-cx q[135],q[136];
-rz(1.439966) q[137];
-rz(-1.439966) q[138];
-rz(-1.439966) q[138];
-cx q[137],q[138];
-rz(1.439966) q[138];
-cx q[137],q[138];
-rz(1.1185118) q[139];
-rz(-1.1185118) q[140];
-rz(-1.1185118) q[140];
-cx q[139],q[140];
-rz(1.1185118) q[140];
-cx q[139],q[140];
-rz(1.1270581) q[141];
-rz(-1.1270581) q[142];
-rz(-1.1270581) q[142];
-cx q[141],q[142];
-rz(1.1270581) q[142];
-cx q[141],q[142];
-rz(-0.047153686) q[143];
-rz(0.047153686) q[144];
-rz(0.047153686) q[144];
-cx q[143],q[144];
-rz(-0.047153686) q[144];
-cx q[143],q[144];
-rz(-1.7824366) q[145];
-rz(1.7824366) q[146];
-rz(1.7824366) q[146];
-cx q[145],q[146];
-rz(-1.7824366) q[146];
-cx q[145],q[146];
-rz(-1.2604616) q[147];
-rz(1.2604616) q[148];
-rz(1.2604616) q[148];
-cx q[147],q[148];
-rz(-1.2604616) q[148];
-cx q[147],q[148];
-rz(0.52547698) q[149];
-rz(-0.52547698) q[150];
-rz(-0.52547698) q[150];
-cx q[149],q[150];
-rz(0.52547698) q[150];
-cx q[149],q[150];
-rz(0.59192617) q[151];
-rz(-0.59192617) q[152];
-rz(-0.59192617) q[152];
-cx q[151],q[152];
-rz(0.59192617) q[152];
-cx q[151],q[152];
-rz(-1.7735506) q[153];
-rz(1.7735506) q[154];
-rz(1.7735506) q[154];
-cx q[153],q[154];
-rz(-1.7735506) q[154];
-cx q[153],q[154];
-rz(-0.048210143) q[155];
-rz(0.048210143) q[156];
-rz(0.048210143) q[156];
-cx q[155],q[156];
-rz(-0.048210143) q[156];
-cx q[155],q[156];
-rz(-0.41287507) q[157];
-rz(0.41287507) q[158];
-rz(0.41287507) q[158];
-cx q[157],q[158];
-rz(-0.41287507) q[158];
-cx q[157],q[158];
-rz(-0.043450507) q[159];
-rz(0.043450507) q[160];
-rz(0.043450507) q[160];
-cx q[159],q[160];
-rz(-0.043450507) q[160];
-cx q[159],q[160];
-rz(-0.61089109) q[161];
-rz(0.61089109) q[162];
-rz(0.61089109) q[162];
-cx q[161],q[162];
-rz(-0.61089109) q[162];
-cx q[161],q[162];
-rz(0.96102708) q[163];
-rz(-0.96102708) q[164];
-rz(-0.96102708) q[164];
-cx q[163],q[164];
-rz(0.96102708) q[164];
-cx q[163],q[164];
-rz(-0.082034744) q[165];
-rz(0.082034744) q[166];
-rz(0.082034744) q[166];
-cx q[165],q[166];
-rz(-0.082034744) q[166];
-cx q[165],q[166];
-rz(1.883446) q[167];
-rz(-1.883446) q[168];
-rz(-1.883446) q[168];
-cx q[167],q[168];
-rz(1.883446) q[168];
-cx q[167],q[168];
-rz(1.6389801) q[169];
-rz(-1.6389801) q[170];
-rz(-1.6389801) q[170];
-cx q[169],q[170];
-rz(1.6389801) q[170];
-cx q[169],q[170];
-rz(0.15946697) q[171];
-rz(-0.15946697) q[172];
-rz(-0.15946697) q[172];
-cx q[171],q[172];
-rz(0.15946697) q[172];
-cx q[171],q[172];
-rz(1.0226221) q[173];
-rz(-1.0226221) q[174];
-rz(-1.0226221) q[174];
-cx q[173],q[174];
-rz(1.0226221) q[174];
-cx q[173],q[174];
-rz(-1.1644835) q[175];
-rz(1.1644835) q[176];
-rz(1.1644835) q[176];
-cx q[175],q[176];
-rz(-1.1644835) q[176];
-cx q[175],q[176];
-rz(1.2493607) q[177];
-rz(-1.2493607) q[178];
-rz(-1.2493607) q[178];
-cx q[177],q[178];
-rz(1.2493607) q[178];
-cx q[177],q[178];
-rz(0.82256118) q[179];
-rz(-0.82256118) q[180];
-rz(-0.82256118) q[180];
-cx q[179],q[180];
-rz(0.82256118) q[180];
-cx q[179],q[180];
-rz(-1.4689224) q[181];
-rz(1.4689224) q[182];
-rz(1.4689224) q[182];
-cx q[181],q[182];
-rz(-1.4689224) q[182];
-cx q[181],q[182];
-rz(1.4388777) q[183];
-rz(-1.4388777) q[184];
-rz(-1.4388777) q[184];
-cx q[183],q[184];
-rz(1.4388777) q[184];
-cx q[183],q[184];
-rz(-0.77860842) q[185];
-rz(0.77860842) q[186];
-rz(0.77860842) q[186];
-cx q[185],q[186];
-rz(-0.77860842) q[186];
-cx q[185],q[186];
-rz(0.7606565) q[187];
-rz(-0.7606565) q[188];
-rz(-0.7606565) q[188];
-cx q[187],q[188];
-rz(0.7606565) q[188];
-cx q[187],q[188];
-rz(0.23007785) q[189];
-rz(-0.23007785) q[190];
-rz(-0.23007785) q[190];
-cx q[189],q[190];
-rz(0.23007785) q[190];
-cx q[189],q[190];
-rz(-1.8939681) q[191];
-rz(1.8939681) q[192];
-rz(1.8939681) q[192];
-cx q[191],q[192];
-rz(-1.8939681) q[192];
-cx q[191],q[192];
-rz(-0.94383604) q[193];
-rz(0.94383604) q[194];
-rz(0.94383604) q[194];
-cx q[193],q[194];
-rz(-0.94383604) q[194];
-cx q[193],q[194];
-rz(-0.99777733) q[195];
-rz(0.99777733) q[196];
-rz(0.99777733) q[196];
-cx q[195],q[196];
-rz(-0.99777733) q[196];
-cx q[195],q[196];
-rz(0.94425919) q[197];
-rz(-0.94425919) q[198];
-rz(-0.94425919) q[198];
-cx q[197],q[198];
-rz(0.94425919) q[198];
-cx q[197],q[198];
-rz(-1.7813741) q[199];
-rz(1.7813741) q[200];
-rz(1.7813741) q[200];
-cx q[199],q[200];
-rz(-1.7813741) q[200];
-cx q[199],q[200];
-rz(-1.7497616) q[201];
-rz(1.7497616) q[202];
-rz(1.7497616) q[202];
-cx q[201],q[202];
-rz(-1.7497616) q[202];
-cx q[201],q[202];
-rz(-1.4800042) q[203];
-rz(1.4800042) q[204];
-rz(1.4800042) q[204];
-cx q[203],q[204];
-rz(-1.4800042) q[204];
-cx q[203],q[204];
-rz(-0.88513373) q[205];
-rz(0.88513373) q[206];
-rz(0.88513373) q[206];
-cx q[205],q[206];
-rz(-0.88513373) q[206];
-cx q[205],q[206];
-rz(0.69609009) q[207];
-rz(-0.69609009) q[208];
-rz(-0.69609009) q[208];
-cx q[207],q[208];
-rz(0.69609009) q[208];
-cx q[207],q[208];
-rz(0.37336874) q[209];
-rz(-0.37336874) q[210];
-rz(-0.37336874) q[210];
-cx q[209],q[210];
-rz(0.37336874) q[210];
-cx q[209],q[210];
-rz(0.22015843) q[211];
-rz(-0.22015843) q[212];
-rz(-0.22015843) q[212];
-cx q[211],q[212];
-rz(0.22015843) q[212];
-cx q[211],q[212];
-rz(-0.2605847) q[213];
-rz(0.2605847) q[214];
-rz(0.2605847) q[214];
-cx q[213],q[214];
-rz(-0.2605847) q[214];
-cx q[213],q[214];
-rz(1.4802007) q[215];
-rz(-1.4802007) q[216];
-rz(-1.4802007) q[216];
-cx q[215],q[216];
-rz(1.4802007) q[216];
-cx q[215],q[216];
-rz(1.9339174) q[217];
-rz(-1.9339174) q[218];
-rz(-1.9339174) q[218];
-cx q[217],q[218];
-rz(1.9339174) q[218];
-cx q[217],q[218];
-rz(-0.34078049) q[219];
-rz(0.34078049) q[220];
-rz(0.34078049) q[220];
-cx q[219],q[220];
-rz(-0.34078049) q[220];
-cx q[219],q[220];
-rz(1.4851153) q[221];
-rz(-1.4851153) q[222];
-rz(-1.4851153) q[222];
-cx q[221],q[222];
-rz(1.4851153) q[222];
-cx q[221],q[222];
-rz(-0.37190474) q[223];
-rz(0.37190474) q[224];
-rz(0.37190474) q[224];
-cx q[223],q[224];
-rz(-0.37190474) q[224];
-cx q[223],q[224];
-rz(1.6982035) q[225];
-rz(-1.6982035) q[226];
-rz(-1.6982035) q[226];
-cx q[225],q[226];
-rz(1.6982035) q[226];
-cx q[225],q[226];
-rz(-1.9293349) q[227];
-rz(1.9293349) q[228];
-rz(1.9293349) q[228];
-cx q[227],q[228];
-rz(-1.9293349) q[228];
-cx q[227],q[228];
-rz(-0.036300806) q[229];
-rz(0.036300806) q[230];
-rz(0.036300806) q[230];
-cx q[229],q[230];
-rz(-0.036300806) q[230];
-cx q[229],q[230];
-rz(-1.2371119) q[231];
-rz(1.2371119) q[232];
-rz(1.2371119) q[232];
-cx q[231],q[232];
-rz(-1.2371119) q[232];
-cx q[231],q[232];
-rz(-1.0415018) q[233];
-rz(1.0415018) q[234];
-rz(1.0415018) q[234];
-cx q[233],q[234];
-rz(-1.0415018) q[234];
-cx q[233],q[234];
-rz(-0.11659851) q[235];
-rz(0.11659851) q[236];
-rz(0.11659851) q[236];
-cx q[235],q[236];
-rz(-0.11659851) q[236];
-cx q[235],q[236];
-rz(0.89636887) q[237];
-rz(-0.89636887) q[238];
-rz(-0.89636887) q[238];
-cx q[237],q[238];
-rz(0.89636887) q[238];
-cx q[237],q[238];
-rz(-0.11577424) q[239];
-rz(0.11577424) q[240];
-rz(0.11577424) q[240];
-cx q[239],q[240];
-rz(-0.11577424) q[240];
-cx q[239],q[240];
-rz(0.31685288) q[241];
-rz(-0.31685288) q[242];
-rz(-0.31685288) q[242];
-cx q[241],q[242];
-rz(0.31685288) q[242];
-cx q[241],q[242];
-rz(0.95582176) q[243];
-rz(-0.95582176) q[244];
-rz(-0.95582176) q[244];
-cx q[243],q[244];
-rz(0.95582176) q[244];
-cx q[243],q[244];
-rz(0.093807266) q[245];
-rz(-0.093807266) q[246];
-rz(-0.093807266) q[246];
-cx q[245],q[246];
-rz(0.093807266) q[246];
-cx q[245],q[246];
-rz(-1.6964935) q[247];
-rz(1.6964935) q[248];
-rz(1.6964935) q[248];
-cx q[247],q[248];
-rz(-1.6964935) q[248];
-cx q[247],q[248];
-rz(1.2865183) q[249];
-rz(-1.2865183) q[250];
-rz(-1.2865183) q[250];
-cx q[249],q[250];
-rz(1.2865183) q[250];
-cx q[249],q[250];
-rz(1.4468703) q[251];
-rz(-1.4468703) q[252];
-rz(-1.4468703) q[252];
-cx q[251],q[252];
-rz(1.4468703) q[252];
-cx q[251],q[252];
-rz(1.6197394) q[253];
-rz(-1.6197394) q[254];
-rz(-1.6197394) q[254];
-cx q[253],q[254];
-rz(1.6197394) q[254];
-cx q[253],q[254];
-rz(1.5770713) q[255];
-rz(-1.5770713) q[256];
-rz(-1.5770713) q[256];
-cx q[255],q[256];
-rz(1.5770713) q[256];
-cx q[255],q[256];
-rz(1.040756) q[257];
-rz(-1.040756) q[258];
-rz(-1.040756) q[258];
-cx q[257],q[258];
-rz(1.040756) q[258];
-cx q[257],q[258];
-rz(-1.5921404) q[259];
-rz(1.5921404) q[260];
-rz(1.5921404) q[260];
-cx q[259],q[260];
-rz(-1.5921404) q[260];
-cx q[259],q[260];
-rz(-0.93515789) q[261];
-rz(0.93515789) q[262];
-rz(0.93515789) q[262];
-cx q[261],q[262];
-rz(-0.93515789) q[262];
-cx q[261],q[262];
-rz(0.0049940372) q[263];
-rz(-0.0049940372) q[264];
-rz(-0.0049940372) q[264];
-cx q[263],q[264];
-rz(0.0049940372) q[264];
-cx q[263],q[264];
-rz(0.68442263) q[265];
-rz(-0.68442263) q[266];
-rz(-0.68442263) q[266];
-cx q[265],q[266];
-rz(0.68442263) q[266];
-cx q[265],q[266];
-rz(1.1543916) q[267];
-rz(-1.1543916) q[268];
-rz(-1.1543916) q[268];
-cx q[267],q[268];
-rz(1.1543916) q[268];
-cx q[267],q[268];
-rz(-1.8350512) q[269];
-rz(1.8350512) q[270];
-rz(1.8350512) q[270];
-cx q[269],q[270];
-rz(-1.8350512) q[270];
-cx q[269],q[270];
-rz(-1.6051296) q[271];
-rz(1.6051296) q[272];
-rz(1.6051296) q[272];
-cx q[271],q[272];
-rz(-1.6051296) q[272];
-cx q[271],q[272];
-rz(1.1773867) q[273];
-rz(-1.1773867) q[274];
-rz(-1.1773867) q[274];
-cx q[273],q[274];
-rz(1.1773867) q[274];
-cx q[273],q[274];
-rz(-0.92708571) q[275];
-rz(0.92708571) q[276];
-rz(0.92708571) q[276];
-cx q[275],q[276];
-rz(-0.92708571) q[276];
-cx q[275],q[276];
-rz(0.73417003) q[277];
-rz(-0.73417003) q[278];
-rz(-0.73417003) q[278];
-cx q[277],q[278];
-rz(0.73417003) q[278];
-cx q[277],q[278];
-rz(1.787265) q[279];
-rz(-1.787265) q[280];
-rz(-1.787265) q[280];
-cx q[279],q[280];
-rz(1.787265) q[280];
-cx q[279],q[280];
-rz(1.2389505) q[281];
-rz(-1.2389505) q[282];
-rz(-1.2389505) q[282];
-cx q[281],q[282];
-rz(1.2389505) q[282];
-cx q[281],q[282];
-rz(1.5115086) q[283];
-rz(-1.5115086) q[284];
-rz(-1.5115086) q[284];
-cx q[283],q[284];
-rz(1.5115086) q[284];
-cx q[283],q[284];
-rz(-1.5007035) q[285];
-rz(1.5007035) q[286];
-rz(1.5007035) q[286];
-cx q[285],q[286];
-rz(-1.5007035) q[286];
-cx q[285],q[286];
-rz(0.87387592) q[287];
-rz(-0.87387592) q[288];
-rz(-0.87387592) q[288];
-cx q[287],q[288];
-rz(0.87387592) q[288];
-cx q[287],q[288];
-rz(1.4064097) q[289];
-rz(-1.4064097) q[290];
-rz(-1.4064097) q[290];
-cx q[289],q[290];
-rz(1.4064097) q[290];
-cx q[289],q[290];
-rz(1.0788069) q[291];
-rz(-1.0788069) q[292];
-rz(-1.0788069) q[292];
-cx q[291],q[292];
-rz(1.0788069) q[292];
-cx q[291],q[292];
-rz(-0.51326939) q[293];
-rz(0.51326939) q[294];
-rz(0.51326939) q[294];
-cx q[293],q[294];
-rz(-0.51326939) q[294];
-cx q[293],q[294];
-rz(-1.5065262) q[295];
-rz(1.5065262) q[296];
-rz(1.5065262) q[296];
-cx q[295],q[296];
-rz(-1.5065262) q[296];
-cx q[295],q[296];
-rz(0.62264786) q[297];
-rz(-0.62264786) q[298];
-rz(-0.62264786) q[298];
-cx q[297],q[298];
-rz(0.62264786) q[298];
-cx q[297],q[298];
-rz(-0.76331051) q[299];
-rz(0.76331051) q[300];
-rz(0.76331051) q[300];
-cx q[299],q[300];
-rz(-0.76331051) q[300];
-cx q[299],q[300];
-rz(0.46584075) q[301];
-rz(-0.46584075) q[302];
-rz(-0.46584075) q[302];
-cx q[301],q[302];
-rz(0.46584075) q[302];
-cx q[301],q[302];
-rz(1.3603814) q[303];
-rz(-1.3603814) q[304];
-rz(-1.3603814) q[304];
-cx q[303],q[304];
-rz(1.3603814) q[304];
-cx q[303],q[304];
-rz(0.11999587) q[305];
-rz(-0.11999587) q[306];
-rz(-0.11999587) q[306];
-cx q[305],q[306];
-rz(0.11999587) q[306];
-cx q[305],q[306];
-rz(-0.40962271) q[307];
-rz(0.40962271) q[308];
-rz(0.40962271) q[308];
-cx q[307],q[308];
-rz(-0.40962271) q[308];
-cx q[307],q[308];
-rz(-1.3233647) q[309];
-rz(1.3233647) q[310];
-rz(1.3233647) q[310];
-cx q[309],q[310];
-rz(-1.3233647) q[310];
-cx q[309],q[310];
-rz(-1.216143) q[311];
-rz(1.216143) q[312];
-rz(1.216143) q[312];
-cx q[311],q[312];
-rz(-1.216143) q[312];
-cx q[311],q[312];
-rz(0.25460229) q[313];
-rz(-0.25460229) q[314];
-rz(-0.25460229) q[314];
-cx q[313],q[314];
-rz(0.25460229) q[314];
-cx q[313],q[314];
-rz(-0.87246628) q[315];
-rz(0.87246628) q[316];
-rz(0.87246628) q[316];
-cx q[315],q[316];
-rz(-0.87246628) q[316];
-cx q[315],q[316];
-rz(0.10933932) q[317];
-rz(-0.10933932) q[318];
-rz(-0.10933932) q[318];
-cx q[317],q[318];
-rz(0.10933932) q[318];
-cx q[317],q[318];
-rz(0.89953205) q[319];
-rz(-0.89953205) q[320];
-rz(-0.89953205) q[320];
-cx q[319],q[320];
-rz(0.89953205) q[320];
-cx q[319],q[320];
-rz(-1.2312721) q[321];
-rz(1.2312721) q[322];
-rz(1.2312721) q[322];
-cx q[321],q[322];
-rz(-1.2312721) q[322];
-cx q[321],q[322];
-rz(-0.28339958) q[323];
-rz(0.28339958) q[324];
-rz(0.28339958) q[324];
-cx q[323],q[324];
-rz(-0.28339958) q[324];
-cx q[323],q[324];
-rz(-1.28294) q[325];
-rz(1.28294) q[326];
-rz(1.28294) q[326];
-cx q[325],q[326];
-rz(-1.28294) q[326];
-cx q[325],q[326];
-rz(-0.0053381011) q[327];
-rz(0.0053381011) q[328];
-rz(0.0053381011) q[328];
-cx q[327],q[328];
-rz(-0.0053381011) q[328];
-cx q[327],q[328];
-rz(1.7674385) q[329];
-rz(-1.7674385) q[330];
-rz(-1.7674385) q[330];
-cx q[329],q[330];
-rz(1.7674385) q[330];
-cx q[329],q[330];
-rz(-1.7374591) q[331];
-rz(1.7374591) q[332];
-rz(1.7374591) q[332];
-cx q[331],q[332];
-rz(-1.7374591) q[332];
-cx q[331],q[332];
-rz(1.4162824) q[333];
-rz(-1.4162824) q[334];
-rz(-1.4162824) q[334];
-cx q[333],q[334];
-rz(1.4162824) q[334];
-cx q[333],q[334];
-rz(-1.3379557) q[335];
-rz(1.3379557) q[336];
-rz(1.3379557) q[336];
-cx q[335],q[336];
-rz(-1.3379557) q[336];
-cx q[335],q[336];
-rz(-1.6246723) q[337];
-rz(1.6246723) q[338];
-rz(1.6246723) q[338];
-cx q[337],q[338];
-rz(-1.6246723) q[338];
-cx q[337],q[338];
-rz(-1.520751) q[339];
-rz(1.520751) q[340];
-rz(1.520751) q[340];
-cx q[339],q[340];
-rz(-1.520751) q[340];
-cx q[339],q[340];
-rz(0.51578758) q[341];
-rz(-0.51578758) q[342];
-rz(-0.51578758) q[342];
-cx q[341],q[342];
-rz(0.51578758) q[342];
-cx q[341],q[342];
-rz(0.05867336) q[343];
-rz(-0.05867336) q[344];
-rz(-0.05867336) q[344];
-cx q[343],q[344];
-rz(0.05867336) q[344];
-cx q[343],q[344];
-rz(1.3571731) q[345];
-rz(-1.3571731) q[346];
-rz(-1.3571731) q[346];
-cx q[345],q[346];
-rz(1.3571731) q[346];
-cx q[345],q[346];
-rz(-1.2107105) q[347];
-rz(1.2107105) q[348];
-rz(1.2107105) q[348];
-cx q[347],q[348];
-rz(-1.2107105) q[348];
-cx q[347],q[348];
-rz(1.5900073) q[349];
-rz(-1.5900073) q[350];
-rz(-1.5900073) q[350];
-cx q[349],q[350];
-rz(1.5900073) q[350];
-cx q[349],q[350];
-rz(-1.2640365) q[351];
-rz(1.2640365) q[352];
-rz(1.2640365) q[352];
-cx q[351],q[352];
-rz(-1.2640365) q[352];
-cx q[351],q[352];
-rz(-0.78328028) q[353];
-rz(0.78328028) q[354];
-rz(0.78328028) q[354];
-cx q[353],q[354];
-rz(-0.78328028) q[354];
-cx q[353],q[354];
-rz(1.0829543) q[355];
-rz(-1.0829543) q[356];
-rz(-1.0829543) q[356];
-cx q[355],q[356];
-rz(1.0829543) q[356];
-cx q[355],q[356];
-rz(-0.24988973) q[357];
-rz(0.24988973) q[358];
-rz(0.24988973) q[358];
-cx q[357],q[358];
-rz(-0.24988973) q[358];
-cx q[357],q[358];
-rz(1.6716007) q[359];
-rz(-1.6716007) q[360];
-rz(-1.6716007) q[360];
-cx q[359],q[360];
-rz(1.6716007) q[360];
-cx q[359],q[360];
-rz(-0.89238778) q[361];
-rz(0.89238778) q[362];
-rz(0.89238778) q[362];
-cx q[361],q[362];
-rz(-0.89238778) q[362];
-cx q[361],q[362];
-rz(-0.42228276) q[363];
-rz(0.42228276) q[364];
-rz(0.42228276) q[364];
-cx q[363],q[364];
-rz(-0.42228276) q[364];
-cx q[363],q[364];
-rz(1.2665424) q[365];
-rz(-1.2665424) q[366];
-rz(-1.2665424) q[366];
-cx q[365],q[366];
-rz(1.2665424) q[366];
-cx q[365],q[366];
-rz(1.2023542) q[367];
-rz(-1.2023542) q[368];
-rz(-1.2023542) q[368];
-cx q[367],q[368];
-rz(1.2023542) q[368];
-cx q[367],q[368];
-rz(0.81065334) q[369];
-rz(-0.81065334) q[370];
-rz(-0.81065334) q[370];
-cx q[369],q[370];
-rz(0.81065334) q[370];
-cx q[369],q[370];
-rz(0.32793744) q[371];
-rz(-0.32793744) q[372];
-rz(-0.32793744) q[372];
-cx q[371],q[372];
-rz(0.32793744) q[372];
-cx q[371],q[372];
-rz(-0.11430562) q[373];
-rz(0.11430562) q[374];
-rz(0.11430562) q[374];
-cx q[373],q[374];
-rz(-0.11430562) q[374];
-cx q[373],q[374];
-rz(0.3487227) q[375];
-rz(-0.3487227) q[376];
-rz(-0.3487227) q[376];
-cx q[375],q[376];
-rz(0.3487227) q[376];
-cx q[375],q[376];
-rz(-0.81234259) q[377];
-rz(0.81234259) q[378];
-rz(0.81234259) q[378];
-cx q[377],q[378];
-rz(-0.81234259) q[378];
-cx q[377],q[378];
-rz(0.39377212) q[379];
-rz(-0.39377212) q[380];
-rz(-0.39377212) q[380];
-cx q[379],q[380];
-rz(0.39377212) q[380];
-cx q[379],q[380];
-rz(-0.79955193) q[381];
-rz(0.79955193) q[382];
-rz(0.79955193) q[382];
-cx q[381],q[382];
-rz(-0.79955193) q[382];
-cx q[381],q[382];
-rz(0.20182445) q[383];
-rz(-0.20182445) q[384];
-rz(-0.20182445) q[384];
-cx q[383],q[384];
-rz(0.20182445) q[384];
-cx q[383],q[384];
-rz(0.65304556) q[385];
-rz(-0.65304556) q[386];
-rz(-0.65304556) q[386];
-cx q[385],q[386];
-rz(0.65304556) q[386];
-cx q[385],q[386];
-rz(-0.070257145) q[387];
-rz(0.070257145) q[388];
-rz(0.070257145) q[388];
-cx q[387],q[388];
-rz(-0.070257145) q[388];
-cx q[387],q[388];
-rz(0.87596344) q[389];
-rz(-0.87596344) q[390];
-rz(-0.87596344) q[390];
-cx q[389],q[390];
-rz(0.87596344) q[390];
-cx q[389],q[390];
-rz(-1.4159584) q[391];
-rz(1.4159584) q[392];
-rz(1.4159584) q[392];
-cx q[391],q[392];
-rz(-1.4159584) q[392];
-cx q[391],q[392];
-rz(-1.462178) q[393];
-rz(1.462178) q[394];
-rz(1.462178) q[394];
-cx q[393],q[394];
-rz(-1.462178) q[394];
-cx q[393],q[394];
-rz(-0.70945333) q[395];
-rz(0.70945333) q[396];
-rz(0.70945333) q[396];
-cx q[395],q[396];
-rz(-0.70945333) q[396];
-cx q[395],q[396];
-rz(-1.825834) q[397];
-rz(1.825834) q[398];
-rz(1.825834) q[398];
-cx q[397],q[398];
-rz(-1.825834) q[398];
-cx q[397],q[398];
-rz(0.80852678) q[399];
-rz(-0.80852678) q[400];
-rz(-0.80852678) q[400];
-cx q[399],q[400];
-rz(0.80852678) q[400];
-cx q[399],q[400];
-rz(0.80154831) q[401];
-rz(-0.80154831) q[402];
-rz(-0.80154831) q[402];
-cx q[401],q[402];
-rz(0.80154831) q[402];
-cx q[401],q[402];
-rz(0.18869056) q[403];
-rz(-0.18869056) q[404];
-rz(-0.18869056) q[404];
-cx q[403],q[404];
-rz(0.18869056) q[404];
-cx q[403],q[404];
-rz(-1.0240708) q[405];
-rz(1.0240708) q[406];
-rz(1.0240708) q[406];
-cx q[405],q[406];
-rz(-1.0240708) q[406];
-cx q[405],q[406];
-rz(1.1215385) q[407];
-rz(-1.1215385) q[408];
-rz(-1.1215385) q[408];
-cx q[407],q[408];
-rz(1.1215385) q[408];
-cx q[407],q[408];
-rz(-0.51684967) q[409];
-rz(0.51684967) q[410];
-rz(0.51684967) q[410];
-cx q[409],q[410];
-rz(-0.51684967) q[410];
-cx q[409],q[410];
-rz(0.9355872) q[411];
-rz(-0.9355872) q[412];
-rz(-0.9355872) q[412];
-cx q[411],q[412];
-rz(0.9355872) q[412];
-cx q[411],q[412];
-rz(0.44814642) q[413];
-rz(-0.44814642) q[414];
-rz(-0.44814642) q[414];
-cx q[413],q[414];
-rz(0.44814642) q[414];
-cx q[413],q[414];
-rz(-0.18421223) q[415];
-rz(0.18421223) q[416];
-rz(0.18421223) q[416];
-cx q[415],q[416];
-rz(-0.18421223) q[416];
-cx q[415],q[416];
-rz(1.0266096) q[417];
-rz(-1.0266096) q[418];
-rz(-1.0266096) q[418];
-cx q[417],q[418];
-rz(1.0266096) q[418];
-cx q[417],q[418];
-h q[0];
-rz(0) q[0];
-h q[0];
-rz(0) q[0];
-h q[1];
-rz(0) q[1];
-h q[1];
-rz(0) q[1];
-h q[2];
-rz(0) q[2];
-h q[2];
-rz(0) q[2];
-h q[3];
-rz(0) q[3];
-h q[3];
-rz(0) q[3];
-h q[4];
-rz(0) q[4];
-h q[4];
-rz(0) q[4];
-h q[5];
-rz(0) q[5];
-h q[5];
-rz(0) q[5];
-h q[6];
-rz(0) q[6];
-h q[6];
-rz(0) q[6];
-h q[7];
-rz(0) q[7];
-h q[7];
-rz(0) q[7];
-h q[8];
-rz(0) q[8];
-h q[8];
-rz(0) q[8];
-h q[9];
-rz(0) q[9];
-h q[9];
-rz(0) q[9];
-h q[10];
-rz(0) q[10];
-h q[10];
-rz(0) q[10];
-h q[11];
-rz(0) q[11];
-h q[11];
-rz(0) q[11];
-h q[12];
-rz(0) q[12];
-h q[12];
-rz(0) q[12];
-h q[13];
-rz(0) q[13];
-h q[13];
-rz(0) q[13];
-h q[14];
-rz(0) q[14];
-h q[14];
-rz(0) q[14];
-h q[15];
-rz(0) q[15];
-h q[15];
-rz(0) q[15];
-h q[16];
-rz(0) q[16];
-h q[16];
-rz(0) q[16];
-h q[17];
-rz(0) q[17];
-h q[17];
-rz(0) q[17];
-h q[18];
-rz(0) q[18];
-h q[18];
-rz(0) q[18];
-h q[19];
-rz(0) q[19];
-h q[19];
-rz(0) q[19];
-h q[20];
-rz(0) q[20];
-h q[20];
-rz(0) q[20];
-h q[21];
-rz(0) q[21];
-h q[21];
-rz(0) q[21];
-h q[22];
-rz(0) q[22];
-h q[22];
-rz(0) q[22];
-h q[23];
-rz(0) q[23];
-h q[23];
-rz(0) q[23];
-h q[24];
-rz(0) q[24];
-h q[24];
-rz(0) q[24];
-h q[25];
-rz(0) q[25];
-h q[25];
-rz(0) q[25];
-h q[26];
-rz(0) q[26];
-h q[26];
-rz(0) q[26];
-h q[27];
-rz(0) q[27];
-h q[27];
-rz(0) q[27];
-h q[28];
-rz(0) q[28];
-h q[28];
-rz(0) q[28];
-h q[29];
-rz(0) q[29];
-h q[29];
-rz(0) q[29];
-h q[30];
-rz(0) q[30];
-h q[30];
-rz(0) q[30];
-h q[31];
-rz(0) q[31];
-h q[31];
-rz(0) q[31];
-h q[32];
-rz(0) q[32];
-h q[32];
-rz(0) q[32];
-h q[33];
-rz(0) q[33];
-h q[33];
-rz(0) q[33];
-h q[34];
-rz(0) q[34];
-h q[34];
-rz(0) q[34];
-h q[35];
-rz(0) q[35];
-h q[35];
-rz(0) q[35];
-h q[36];
-rz(0) q[36];
-h q[36];
-rz(0) q[36];
-h q[37];
-rz(0) q[37];
-h q[37];
-rz(0) q[37];
-h q[38];
-rz(0) q[38];
-h q[38];
-rz(0) q[38];
-h q[39];
-rz(0) q[39];
-h q[39];
-rz(0) q[39];
-h q[40];
-rz(0) q[40];
-h q[40];
-rz(0) q[40];
-h q[41];
-rz(0) q[41];
-h q[41];
-rz(0) q[41];
-h q[42];
-rz(0) q[42];
-h q[42];
-rz(0) q[42];
-h q[43];
-rz(0) q[43];
-h q[43];
-rz(0) q[43];
-h q[44];
-rz(0) q[44];
-h q[44];
-rz(0) q[44];
-h q[45];
-rz(0) q[45];
-h q[45];
-rz(0) q[45];
-h q[46];
-rz(0) q[46];
-h q[46];
-rz(0) q[46];
-h q[47];
-rz(0) q[47];
-h q[47];
-rz(0) q[47];
-h q[48];
-rz(0) q[48];
-h q[48];
-rz(0) q[48];
-h q[49];
-rz(0) q[49];
-h q[49];
-rz(0) q[49];
-h q[50];
-rz(0) q[50];
-h q[50];
-rz(0) q[50];
-h q[51];
-rz(0) q[51];
-h q[51];
-rz(0) q[51];
-h q[52];
-rz(0) q[52];
-h q[52];
-rz(0) q[52];
-h q[53];
-rz(0) q[53];
-h q[53];
-rz(0) q[53];
-h q[54];
-rz(0) q[54];
-h q[54];
-rz(0) q[54];
-h q[55];
-rz(0) q[55];
-h q[55];
-rz(0) q[55];
-h q[56];
-rz(0) q[56];
-h q[56];
-rz(0) q[56];
-h q[57];
-rz(0) q[57];
-h q[57];
-rz(0) q[57];
-h q[58];
-rz(0) q[58];
-h q[58];
-rz(0) q[58];
-h q[59];
-rz(0) q[59];
-h q[59];
-rz(0) q[59];
-h q[60];
-rz(0) q[60];
-h q[60];
-rz(0) q[60];
-h q[61];
-rz(0) q[61];
-h q[61];
-rz(0) q[61];
-h q[62];
-rz(0) q[62];
-h q[62];
-rz(0) q[62];
-h q[63];
-rz(0) q[63];
-h q[63];
-rz(0) q[63];
-h q[64];
-rz(0) q[64];
-h q[64];
-rz(0) q[64];
-h q[65];
-rz(0) q[65];
-h q[65];
-rz(0) q[65];
-h q[66];
-rz(0) q[66];
-h q[66];
-rz(0) q[66];
-h q[67];
-rz(0) q[67];
-h q[67];
-rz(0) q[67];
-h q[68];
-rz(0) q[68];
-h q[68];
-rz(0) q[68];
-h q[69];
-rz(0) q[69];
-h q[69];
-rz(0) q[69];
-h q[70];
-rz(0) q[70];
-h q[70];
-rz(0) q[70];
-h q[71];
-rz(0) q[71];
-h q[71];
-rz(0) q[71];
-h q[72];
-rz(0) q[72];
-h q[72];
-rz(0) q[72];
-h q[73];
-rz(0) q[73];
-h q[73];
-rz(0) q[73];
-h q[74];
-rz(0) q[74];
-h q[74];
-rz(0) q[74];
-h q[75];
-rz(0) q[75];
-h q[75];
-rz(0) q[75];
-h q[76];
-rz(0) q[76];
-h q[76];
-rz(0) q[76];
-h q[77];
-rz(0) q[77];
-h q[77];
-rz(0) q[77];
-h q[78];
-rz(0) q[78];
-h q[78];
-rz(0) q[78];
-h q[79];
-rz(0) q[79];
-h q[79];
-rz(0) q[79];
-h q[80];
-rz(0) q[80];
-h q[80];
-rz(0) q[80];
-h q[81];
-rz(0) q[81];
-h q[81];
-rz(0) q[81];
-h q[82];
-rz(0) q[82];
-h q[82];
-rz(0) q[82];
-h q[83];
-rz(0) q[83];
-h q[83];
-rz(0) q[83];
-h q[84];
-rz(0) q[84];
-h q[84];
-rz(0) q[84];
-h q[85];
-rz(0) q[85];
-h q[85];
-rz(0) q[85];
-h q[86];
-rz(0) q[86];
-h q[86];
-rz(0) q[86];
-h q[87];
-rz(0) q[87];
-h q[87];
-rz(0) q[87];
-h q[88];
-rz(0) q[88];
-h q[88];
-rz(0) q[88];
-h q[89];
-rz(0) q[89];
-h q[89];
-rz(0) q[89];
-h q[90];
-rz(0) q[90];
-h q[90];
-rz(0) q[90];
-h q[91];
-rz(0) q[91];
-h q[91];
-rz(0) q[91];
-h q[92];
-rz(0) q[92];
-h q[92];
-rz(0) q[92];
-h q[93];
-rz(0) q[93];
-h q[93];
-rz(0) q[93];
-h q[94];
-rz(0) q[94];
-h q[94];
-rz(0) q[94];
-h q[95];
-rz(0) q[95];
-h q[95];
-rz(0) q[95];
-h q[96];
-rz(0) q[96];
-h q[96];
-rz(0) q[96];
-h q[97];
-rz(0) q[97];
-h q[97];
-rz(0) q[97];
-h q[98];
-rz(0) q[98];
-h q[98];
-rz(0) q[98];
-h q[99];
-rz(0) q[99];
-h q[99];
-rz(0) q[99];
-h q[100];
-rz(0) q[100];
-h q[100];
-rz(0) q[100];
-h q[101];
-rz(0) q[101];
-h q[101];
-rz(0) q[101];
-h q[102];
-rz(0) q[102];
-h q[102];
-rz(0) q[102];
-h q[103];
-rz(0) q[103];
-h q[103];
-rz(0) q[103];
-h q[104];
-rz(0) q[104];
-h q[104];
-rz(0) q[104];
-h q[105];
-rz(0) q[105];
-h q[105];
-rz(0) q[105];
-h q[106];
-rz(0) q[106];
-h q[106];
-rz(0) q[106];
-h q[107];
-rz(0) q[107];
-h q[107];
-rz(0) q[107];
-h q[108];
-rz(0) q[108];
-h q[108];
-rz(0) q[108];
-h q[109];
-rz(0) q[109];
-h q[109];
-rz(0) q[109];
-h q[110];
-rz(0) q[110];
-h q[110];
-rz(0) q[110];
-h q[111];
-rz(0) q[111];
-h q[111];
-rz(0) q[111];
-h q[112];
-rz(0) q[112];
-h q[112];
-rz(0) q[112];
-h q[113];
-rz(0) q[113];
-h q[113];
-rz(0) q[113];
-h q[114];
-rz(0) q[114];
-h q[114];
-rz(0) q[114];
-h q[115];
-rz(0) q[115];
-h q[115];
-rz(0) q[115];
-h q[116];
-rz(0) q[116];
-h q[116];
-rz(0) q[116];
-h q[117];
-rz(0) q[117];
-h q[117];
-rz(0) q[117];
-h q[118];
-rz(0) q[118];
-h q[118];
-rz(0) q[118];
-h q[119];
-rz(0) q[119];
-h q[119];
-rz(0) q[119];
-h q[120];
-rz(0) q[120];
-h q[120];
-rz(0) q[120];
-h q[121];
-rz(0) q[121];
-h q[121];
-rz(0) q[121];
-h q[122];
-rz(0) q[122];
-h q[122];
-rz(0) q[122];
-h q[123];
-rz(0) q[123];
-h q[123];
-rz(0) q[123];
-h q[124];
-rz(0) q[124];
-h q[124];
-rz(0) q[124];
-h q[125];
-rz(0) q[125];
-h q[125];
-rz(0) q[125];
-h q[126];
-rz(0) q[126];
-h q[126];
-rz(0) q[126];
-h q[127];
-rz(0) q[127];
-h q[127];
-rz(0) q[127];
-h q[128];
-rz(0) q[128];
-h q[128];
-rz(0) q[128];
-h q[129];
-rz(0) q[129];
-h q[129];
-rz(0) q[129];
-h q[130];
-rz(0) q[130];
-h q[130];
-rz(0) q[130];
-h q[131];
-rz(0) q[131];
-h q[131];
-rz(0) q[131];
-h q[132];
-rz(0) q[132];
-h q[132];
-rz(0) q[132];
-h q[133];
-rz(0) q[133];
-h q[133];
-rz(0) q[133];
-h q[134];
-rz(0) q[134];
-h q[134];
-rz(0) q[134];
-h q[135];
-rz(0) q[135];
-h q[135];
-rz(0) q[135];
-h q[136];
-rz(0) q[136];
-h q[136];
-rz(0) q[136];
-h q[137];
-rz(0) q[137];
-h q[137];
-rz(0) q[137];
-h q[138];
-rz(0) q[138];
-h q[138];
-rz(0) q[138];
-h q[139];
-rz(0) q[139];
-h q[139];
-rz(0) q[139];
-h q[140];
-rz(0) q[140];
-h q[140];
-rz(0) q[140];
-h q[141];
-rz(0) q[141];
-h q[141];
-rz(0) q[141];
-h q[142];
-rz(0) q[142];
-h q[142];
-rz(0) q[142];
-h q[143];
-rz(0) q[143];
-h q[143];
-rz(0) q[143];
-h q[144];
-rz(0) q[144];
-h q[144];
-rz(0) q[144];
-h q[145];
-rz(0) q[145];
-h q[145];
-rz(0) q[145];
-h q[146];
-rz(0) q[146];
-h q[146];
-rz(0) q[146];
-h q[147];
-rz(0) q[147];
-h q[147];
-rz(0) q[147];
-h q[148];
-rz(0) q[148];
-h q[148];
-rz(0) q[148];
-h q[149];
-rz(0) q[149];
-h q[149];
-rz(0) q[149];
-h q[150];
-rz(0) q[150];
-h q[150];
-rz(0) q[150];
-h q[151];
-rz(0) q[151];
-h q[151];
-rz(0) q[151];
-h q[152];
-rz(0) q[152];
-h q[152];
-rz(0) q[152];
-h q[153];
-rz(0) q[153];
-h q[153];
-rz(0) q[153];
-h q[154];
-rz(0) q[154];
-h q[154];
-rz(0) q[154];
-h q[155];
-rz(0) q[155];
-h q[155];
-rz(0) q[155];
-h q[156];
-rz(0) q[156];
-h q[156];
-rz(0) q[156];
-h q[157];
-rz(0) q[157];
-h q[157];
-rz(0) q[157];
-h q[158];
-rz(0) q[158];
-h q[158];
-rz(0) q[158];
-h q[159];
-rz(0) q[159];
-h q[159];
-rz(0) q[159];
-h q[160];
-rz(0) q[160];
-h q[160];
-rz(0) q[160];
-h q[161];
-rz(0) q[161];
-h q[161];
-rz(0) q[161];
-h q[162];
-rz(0) q[162];
-h q[162];
-rz(0) q[162];
-h q[163];
-rz(0) q[163];
-h q[163];
-rz(0) q[163];
-h q[164];
-rz(0) q[164];
-h q[164];
-rz(0) q[164];
-h q[165];
-rz(0) q[165];
-h q[165];
-rz(0) q[165];
-h q[166];
-rz(0) q[166];
-h q[166];
-rz(0) q[166];
-h q[167];
-rz(0) q[167];
-h q[167];
-rz(0) q[167];
-h q[168];
-rz(0) q[168];
-h q[168];
-rz(0) q[168];
-h q[169];
-rz(0) q[169];
-h q[169];
-rz(0) q[169];
-h q[170];
-rz(0) q[170];
-h q[170];
-rz(0) q[170];
-h q[171];
-rz(0) q[171];
-h q[171];
-rz(0) q[171];
-h q[172];
-rz(0) q[172];
-h q[172];
-rz(0) q[172];
-h q[173];
-rz(0) q[173];
-h q[173];
-rz(0) q[173];
-h q[174];
-rz(0) q[174];
-h q[174];
-rz(0) q[174];
-h q[175];
-rz(0) q[175];
-h q[175];
-rz(0) q[175];
-h q[176];
-rz(0) q[176];
-h q[176];
-rz(0) q[176];
-h q[177];
-rz(0) q[177];
-h q[177];
-rz(0) q[177];
-h q[178];
-rz(0) q[178];
-h q[178];
-rz(0) q[178];
-h q[179];
-rz(0) q[179];
-h q[179];
-rz(0) q[179];
-h q[180];
-rz(0) q[180];
-h q[180];
-rz(0) q[180];
-h q[181];
-rz(0) q[181];
-h q[181];
-rz(0) q[181];
-h q[182];
-rz(0) q[182];
-h q[182];
-rz(0) q[182];
-h q[183];
-rz(0) q[183];
-h q[183];
-rz(0) q[183];
-h q[184];
-rz(0) q[184];
-h q[184];
-rz(0) q[184];
-h q[185];
-rz(0) q[185];
-h q[185];
-rz(0) q[185];
-h q[186];
-rz(0) q[186];
-h q[186];
-rz(0) q[186];
-h q[187];
-rz(0) q[187];
-h q[187];
-rz(0) q[187];
-h q[188];
-rz(0) q[188];
-h q[188];
-rz(0) q[188];
-h q[189];
-rz(0) q[189];
-h q[189];
-rz(0) q[189];
-h q[190];
-rz(0) q[190];
-h q[190];
-rz(0) q[190];
-h q[191];
-rz(0) q[191];
-h q[191];
-rz(0) q[191];
-h q[192];
-rz(0) q[192];
-h q[192];
-rz(0) q[192];
-h q[193];
-rz(0) q[193];
-h q[193];
-rz(0) q[193];
-h q[194];
-rz(0) q[194];
-h q[194];
-rz(0) q[194];
-h q[195];
-rz(0) q[195];
-h q[195];
-rz(0) q[195];
-h q[196];
-rz(0) q[196];
-h q[196];
-rz(0) q[196];
-h q[197];
-rz(0) q[197];
-h q[197];
-rz(0) q[197];
-h q[198];
-rz(0) q[198];
-h q[198];
-rz(0) q[198];
-h q[199];
-rz(0) q[199];
-h q[199];
-rz(0) q[199];
-h q[200];
-rz(0) q[200];
-h q[200];
-rz(0) q[200];
-h q[201];
-rz(0) q[201];
-h q[201];
-rz(0) q[201];
-h q[202];
-rz(0) q[202];
-h q[202];
-rz(0) q[202];
-h q[203];
-rz(0) q[203];
-h q[203];
-rz(0) q[203];
-h q[204];
-rz(0) q[204];
-h q[204];
-rz(0) q[204];
-h q[205];
-rz(0) q[205];
-h q[205];
-rz(0) q[205];
-h q[206];
-rz(0) q[206];
-h q[206];
-rz(0) q[206];
-h q[207];
-rz(0) q[207];
-h q[207];
-rz(0) q[207];
-h q[208];
-rz(0) q[208];
-h q[208];
-rz(0) q[208];
-h q[209];
-rz(0) q[209];
-h q[209];
-rz(0) q[209];
-h q[210];
-rz(0) q[210];
-h q[210];
-rz(0) q[210];
-h q[211];
-rz(0) q[211];
-h q[211];
-rz(0) q[211];
-h q[212];
-rz(0) q[212];
-h q[212];
-rz(0) q[212];
-h q[213];
-rz(0) q[213];
-h q[213];
-rz(0) q[213];
-h q[214];
-rz(0) q[214];
-h q[214];
-rz(0) q[214];
-h q[215];
-rz(0) q[215];
-h q[215];
-rz(0) q[215];
-h q[216];
-rz(0) q[216];
-h q[216];
-rz(0) q[216];
-h q[217];
-rz(0) q[217];
-h q[217];
-rz(0) q[217];
-h q[218];
-rz(0) q[218];
-h q[218];
-rz(0) q[218];
-h q[219];
-rz(0) q[219];
-h q[219];
-rz(0) q[219];
-h q[220];
-rz(0) q[220];
-h q[220];
-rz(0) q[220];
-h q[221];
-rz(0) q[221];
-h q[221];
-rz(0) q[221];
-h q[222];
-rz(0) q[222];
-h q[222];
-rz(0) q[222];
-h q[223];
-rz(0) q[223];
-h q[223];
-rz(0) q[223];
-h q[224];
-rz(0) q[224];
-h q[224];
-rz(0) q[224];
-h q[225];
-rz(0) q[225];
-h q[225];
-rz(0) q[225];
-h q[226];
-rz(0) q[226];
-h q[226];
-rz(0) q[226];
-h q[227];
-rz(0) q[227];
-h q[227];
-rz(0) q[227];
-h q[228];
-rz(0) q[228];
-h q[228];
-rz(0) q[228];
-h q[229];
-rz(0) q[229];
-h q[229];
-rz(0) q[229];
-h q[230];
-rz(0) q[230];
-h q[230];
-rz(0) q[230];
-h q[231];
-rz(0) q[231];
-h q[231];
-rz(0) q[231];
-h q[232];
-rz(0) q[232];
-h q[232];
-rz(0) q[232];
-h q[233];
-rz(0) q[233];
-h q[233];
-rz(0) q[233];
-h q[234];
-rz(0) q[234];
-h q[234];
-rz(0) q[234];
-h q[235];
-rz(0) q[235];
-h q[235];
-rz(0) q[235];
-h q[236];
-rz(0) q[236];
-h q[236];
-rz(0) q[236];
-h q[237];
-rz(0) q[237];
-h q[237];
-rz(0) q[237];
-h q[238];
-rz(0) q[238];
-h q[238];
-rz(0) q[238];
-h q[239];
-rz(0) q[239];
-h q[239];
-rz(0) q[239];
-h q[240];
-rz(0) q[240];
-h q[240];
-rz(0) q[240];
-h q[241];
-rz(0) q[241];
-h q[241];
-rz(0) q[241];
-h q[242];
-rz(0) q[242];
-h q[242];
-rz(0) q[242];
-h q[243];
-rz(0) q[243];
-h q[243];
-rz(0) q[243];
-h q[244];
-rz(0) q[244];
-h q[244];
-rz(0) q[244];
-h q[245];
-rz(0) q[245];
-h q[245];
-rz(0) q[245];
-h q[246];
-rz(0) q[246];
-h q[246];
-rz(0) q[246];
-h q[247];
-rz(0) q[247];
-h q[247];
-rz(0) q[247];
-h q[248];
-rz(0) q[248];
-h q[248];
-rz(0) q[248];
-h q[249];
-rz(0) q[249];
-h q[249];
-rz(0) q[249];
-h q[250];
-rz(0) q[250];
-h q[250];
-rz(0) q[250];
-h q[251];
-rz(0) q[251];
-h q[251];
-rz(0) q[251];
-h q[252];
-rz(0) q[252];
-h q[252];
-rz(0) q[252];
-h q[253];
-rz(0) q[253];
-h q[253];
-rz(0) q[253];
-h q[254];
-rz(0) q[254];
-h q[254];
-rz(0) q[254];
-h q[255];
-rz(0) q[255];
-h q[255];
-rz(0) q[255];
-h q[256];
-rz(0) q[256];
-h q[256];
-rz(0) q[256];
-h q[257];
-rz(0) q[257];
-h q[257];
-rz(0) q[257];
-h q[258];
-rz(0) q[258];
-h q[258];
-rz(0) q[258];
-h q[259];
-rz(0) q[259];
-h q[259];
-rz(0) q[259];
-h q[260];
-rz(0) q[260];
-h q[260];
-rz(0) q[260];
-h q[261];
-rz(0) q[261];
-h q[261];
-rz(0) q[261];
-h q[262];
-rz(0) q[262];
-h q[262];
-rz(0) q[262];
-h q[263];
-rz(0) q[263];
-h q[263];
-rz(0) q[263];
-h q[264];
-rz(0) q[264];
-h q[264];
-rz(0) q[264];
-h q[265];
-rz(0) q[265];
-h q[265];
-rz(0) q[265];
-h q[266];
-rz(0) q[266];
-h q[266];
-rz(0) q[266];
-h q[267];
-rz(0) q[267];
-h q[267];
-rz(0) q[267];
-h q[268];
-rz(0) q[268];
-h q[268];
-rz(0) q[268];
-h q[269];
-rz(0) q[269];
-h q[269];
-rz(0) q[269];
-h q[270];
-rz(0) q[270];
-h q[270];
-rz(0) q[270];
-h q[271];
-rz(0) q[271];
-h q[271];
-rz(0) q[271];
-h q[272];
-rz(0) q[272];
-h q[272];
-rz(0) q[272];
-h q[273];
-rz(0) q[273];
-h q[273];
-rz(0) q[273];
-h q[274];
-rz(0) q[274];
-h q[274];
-rz(0) q[274];
-h q[275];
-rz(0) q[275];
-h q[275];
-rz(0) q[275];
-h q[276];
-rz(0) q[276];
-h q[276];
-rz(0) q[276];
-h q[277];
-rz(0) q[277];
-h q[277];
-rz(0) q[277];
-h q[278];
-rz(0) q[278];
-h q[278];
-rz(0) q[278];
-h q[279];
-rz(0) q[279];
-h q[279];
-rz(0) q[279];
-h q[280];
-rz(0) q[280];
-h q[280];
-rz(0) q[280];
-h q[281];
-rz(0) q[281];
-h q[281];
-rz(0) q[281];
-h q[282];
-rz(0) q[282];
-h q[282];
-rz(0) q[282];
-h q[283];
-rz(0) q[283];
-h q[283];
-rz(0) q[283];
-h q[284];
-rz(0) q[284];
-h q[284];
-rz(0) q[284];
-h q[285];
-rz(0) q[285];
-h q[285];
-rz(0) q[285];
-h q[286];
-rz(0) q[286];
-h q[286];
-rz(0) q[286];
-h q[287];
-rz(0) q[287];
-h q[287];
-rz(0) q[287];
-h q[288];
-rz(0) q[288];
-h q[288];
-rz(0) q[288];
-h q[289];
-rz(0) q[289];
-h q[289];
-rz(0) q[289];
-h q[290];
-rz(0) q[290];
-h q[290];
-rz(0) q[290];
-h q[291];
-rz(0) q[291];
-h q[291];
-rz(0) q[291];
-h q[292];
-rz(0) q[292];
-h q[292];
-rz(0) q[292];
-h q[293];
-rz(0) q[293];
-h q[293];
-rz(0) q[293];
-h q[294];
-rz(0) q[294];
-h q[294];
-rz(0) q[294];
-h q[295];
-rz(0) q[295];
-h q[295];
-rz(0) q[295];
-h q[296];
-rz(0) q[296];
-h q[296];
-rz(0) q[296];
-h q[297];
-rz(0) q[297];
-h q[297];
-rz(0) q[297];
-h q[298];
-rz(0) q[298];
-h q[298];
-rz(0) q[298];
-h q[299];
-rz(0) q[299];
-h q[299];
-rz(0) q[299];
-h q[300];
-rz(0) q[300];
-h q[300];
-rz(0) q[300];
-h q[301];
-rz(0) q[301];
-h q[301];
-rz(0) q[301];
-h q[302];
-rz(0) q[302];
-h q[302];
-rz(0) q[302];
-h q[303];
-rz(0) q[303];
-h q[303];
-rz(0) q[303];
-h q[304];
-rz(0) q[304];
-h q[304];
-rz(0) q[304];
-h q[305];
-rz(0) q[305];
-h q[305];
-rz(0) q[305];
-h q[306];
-rz(0) q[306];
-h q[306];
-rz(0) q[306];
-h q[307];
-rz(0) q[307];
-h q[307];
-rz(0) q[307];
-h q[308];
-rz(0) q[308];
-h q[308];
-rz(0) q[308];
-h q[309];
-rz(0) q[309];
-h q[309];
-rz(0) q[309];
-h q[310];
-rz(0) q[310];
-h q[310];
-rz(0) q[310];
-h q[311];
-rz(0) q[311];
-h q[311];
-rz(0) q[311];
-h q[312];
-rz(0) q[312];
-h q[312];
-rz(0) q[312];
-h q[313];
-rz(0) q[313];
-h q[313];
-rz(0) q[313];
-h q[314];
-rz(0) q[314];
-h q[314];
-rz(0) q[314];
-h q[315];
-rz(0) q[315];
-h q[315];
-rz(0) q[315];
-h q[316];
-rz(0) q[316];
-h q[316];
-rz(0) q[316];
-h q[317];
-rz(0) q[317];
-h q[317];
-rz(0) q[317];
-h q[318];
-rz(0) q[318];
-h q[318];
-rz(0) q[318];
-h q[319];
-rz(0) q[319];
-h q[319];
-rz(0) q[319];
-h q[320];
-rz(0) q[320];
-h q[320];
-rz(0) q[320];
-h q[321];
-rz(0) q[321];
-h q[321];
-rz(0) q[321];
-h q[322];
-rz(0) q[322];
-h q[322];
-rz(0) q[322];
-h q[323];
-rz(0) q[323];
-h q[323];
-rz(0) q[323];
-h q[324];
-rz(0) q[324];
-h q[324];
-rz(0) q[324];
-h q[325];
-rz(0) q[325];
-h q[325];
-rz(0) q[325];
-h q[326];
-rz(0) q[326];
-h q[326];
-rz(0) q[326];
-h q[327];
-rz(0) q[327];
-h q[327];
-rz(0) q[327];
-h q[328];
-rz(0) q[328];
-h q[328];
-rz(0) q[328];
-h q[329];
-rz(0) q[329];
-h q[329];
-rz(0) q[329];
-h q[330];
-rz(0) q[330];
-h q[330];
-rz(0) q[330];
-h q[331];
-rz(0) q[331];
-h q[331];
-rz(0) q[331];
-h q[332];
-rz(0) q[332];
-h q[332];
-rz(0) q[332];
-h q[333];
-rz(0) q[333];
-h q[333];
-rz(0) q[333];
-h q[334];
-rz(0) q[334];
-h q[334];
-rz(0) q[334];
-h q[335];
-rz(0) q[335];
-h q[335];
-rz(0) q[335];
-h q[336];
-rz(0) q[336];
-h q[336];
-rz(0) q[336];
-h q[337];
-rz(0) q[337];
-h q[337];
-rz(0) q[337];
-h q[338];
-rz(0) q[338];
-h q[338];
-rz(0) q[338];
-h q[339];
-rz(0) q[339];
-h q[339];
-rz(0) q[339];
-h q[340];
-rz(0) q[340];
-h q[340];
-rz(0) q[340];
-h q[341];
-rz(0) q[341];
-h q[341];
-rz(0) q[341];
-h q[342];
-rz(0) q[342];
-h q[342];
-rz(0) q[342];
-h q[343];
-rz(0) q[343];
-h q[343];
-rz(0) q[343];
-h q[344];
-rz(0) q[344];
-h q[344];
-rz(0) q[344];
-h q[345];
-rz(0) q[345];
-h q[345];
-rz(0) q[345];
-h q[346];
-rz(0) q[346];
-h q[346];
-rz(0) q[346];
-h q[347];
-rz(0) q[347];
-h q[347];
-rz(0) q[347];
-h q[348];
-rz(0) q[348];
-h q[348];
-rz(0) q[348];
-h q[349];
-rz(0) q[349];
-h q[349];
-rz(0) q[349];
-h q[350];
-rz(0) q[350];
-h q[350];
-rz(0) q[350];
-h q[351];
-rz(0) q[351];
-h q[351];
-rz(0) q[351];
-h q[352];
-rz(0) q[352];
-h q[352];
-rz(0) q[352];
-h q[353];
-rz(0) q[353];
-h q[353];
-rz(0) q[353];
-h q[354];
-rz(0) q[354];
-h q[354];
-rz(0) q[354];
-h q[355];
-rz(0) q[355];
-h q[355];
-rz(0) q[355];
-h q[356];
-rz(0) q[356];
-h q[356];
-rz(0) q[356];
-h q[357];
-rz(0) q[357];
-h q[357];
-rz(0) q[357];
-h q[358];
-rz(0) q[358];
-h q[358];
-rz(0) q[358];
-h q[359];
-rz(0) q[359];
-h q[359];
-rz(0) q[359];
-h q[360];
-rz(0) q[360];
-h q[360];
-rz(0) q[360];
-h q[361];
-rz(0) q[361];
-h q[361];
-rz(0) q[361];
-h q[362];
-rz(0) q[362];
-h q[362];
-rz(0) q[362];
-h q[363];
-rz(0) q[363];
-h q[363];
-rz(0) q[363];
-h q[364];
-rz(0) q[364];
-h q[364];
-rz(0) q[364];
-h q[365];
-rz(0) q[365];
-h q[365];
-rz(0) q[365];
-h q[366];
-rz(0) q[366];
-h q[366];
-rz(0) q[366];
-h q[367];
-rz(0) q[367];
-h q[367];
-rz(0) q[367];
-h q[368];
-rz(0) q[368];
-h q[368];
-rz(0) q[368];
-h q[369];
-rz(0) q[369];
-h q[369];
-rz(0) q[369];
-h q[370];
-rz(0) q[370];
-h q[370];
-rz(0) q[370];
-h q[371];
-rz(0) q[371];
-h q[371];
-rz(0) q[371];
-h q[372];
-rz(0) q[372];
-h q[372];
-rz(0) q[372];
-h q[373];
-rz(0) q[373];
-h q[373];
-rz(0) q[373];
-h q[374];
-rz(0) q[374];
-h q[374];
-rz(0) q[374];
-h q[375];
-rz(0) q[375];
-h q[375];
-rz(0) q[375];
-h q[376];
-rz(0) q[376];
-h q[376];
-rz(0) q[376];
-h q[377];
-rz(0) q[377];
-h q[377];
-rz(0) q[377];
-h q[378];
-rz(0) q[378];
-h q[378];
-rz(0) q[378];
-h q[379];
-rz(0) q[379];
-h q[379];
-rz(0) q[379];
-h q[380];
-rz(0) q[380];
-h q[380];
-rz(0) q[380];
-h q[381];
-rz(0) q[381];
-h q[381];
-rz(0) q[381];
-h q[382];
-rz(0) q[382];
-h q[382];
-rz(0) q[382];
-h q[383];
-rz(0) q[383];
-h q[383];
-rz(0) q[383];
-h q[384];
-rz(0) q[384];
-h q[384];
-rz(0) q[384];
-h q[385];
-rz(0) q[385];
-h q[385];
-rz(0) q[385];
-h q[386];
-rz(0) q[386];
-h q[386];
-rz(0) q[386];
-h q[387];
-rz(0) q[387];
-h q[387];
-rz(0) q[387];
-h q[388];
-rz(0) q[388];
-h q[388];
-rz(0) q[388];
-h q[389];
-rz(0) q[389];
-h q[389];
-rz(0) q[389];
-h q[390];
-rz(0) q[390];
-h q[390];
-rz(0) q[390];
-h q[391];
-rz(0) q[391];
-h q[391];
-rz(0) q[391];
-h q[392];
-rz(0) q[392];
-h q[392];
-rz(0) q[392];
-h q[393];
-rz(0) q[393];
-h q[393];
-rz(0) q[393];
-h q[394];
-rz(0) q[394];
-h q[394];
-rz(0) q[394];
-h q[395];
-rz(0) q[395];
-h q[395];
-rz(0) q[395];
-h q[396];
-rz(0) q[396];
-h q[396];
-rz(0) q[396];
-h q[397];
-rz(0) q[397];
-h q[397];
-rz(0) q[397];
-h q[398];
-rz(0) q[398];
-h q[398];
-rz(0) q[398];
-h q[399];
-rz(0) q[399];
-h q[399];
-rz(0) q[399];
-h q[400];
-rz(0) q[400];
-h q[400];
-rz(0) q[400];
-h q[401];
-rz(0) q[401];
-h q[401];
-rz(0) q[401];
-h q[402];
-rz(0) q[402];
-h q[402];
-rz(0) q[402];
-h q[403];
-rz(0) q[403];
-h q[403];
-rz(0) q[403];
-h q[404];
-rz(0) q[404];
-h q[404];
-rz(0) q[404];
-h q[405];
-rz(0) q[405];
-h q[405];
-rz(0) q[405];
-h q[406];
-rz(0) q[406];
-h q[406];
-rz(0) q[406];
-h q[407];
-rz(0) q[407];
-h q[407];
-rz(0) q[407];
-h q[408];
-rz(0) q[408];
-h q[408];
-rz(0) q[408];
-h q[409];
-rz(0) q[409];
-h q[409];
-rz(0) q[409];
-h q[410];
-rz(0) q[410];
-h q[410];
-rz(0) q[410];
-h q[411];
-rz(0) q[411];
-h q[411];
-rz(0) q[411];
-h q[412];
-rz(0) q[412];
-h q[412];
-rz(0) q[412];
-h q[413];
-rz(0) q[413];
-h q[413];
-rz(0) q[413];
-h q[414];
-rz(0) q[414];
-h q[414];
-rz(0) q[414];
-h q[415];
-rz(0) q[415];
-h q[415];
-rz(0) q[415];
-h q[416];
-rz(0) q[416];
-h q[416];
-rz(0) q[416];
-h q[417];
-rz(0) q[417];
-h q[417];
-rz(0) q[417];
-h q[418];
-rz(0) q[418];
-h q[418];
-rz(0) q[418];
-h q[419];
-rz(0) q[419];
-h q[419];
-rz(0) q[419];
-barrier q[0],q[1],q[2],q[3],q[4],q[5],q[6],q[7],q[8],q[9],q[10],q[11],q[12],q[13],q[14],q[15],q[16],q[17],q[18],q[19],q[20],q[21],q[22],q[23],q[24],q[25],q[26],q[27],q[28],q[29],q[30],q[31],q[32],q[33],q[34],q[35],q[36],q[37],q[38],q[39],q[40],q[41],q[42],q[43],q[44],q[45],q[46],q[47],q[48],q[49],q[50],q[51],q[52],q[53],q[54],q[55],q[56],q[57],q[58],q[59],q[60],q[61],q[62],q[63],q[64],q[65],q[66],q[67],q[68],q[69],q[70],q[71],q[72],q[73],q[74],q[75],q[76],q[77],q[78],q[79],q[80],q[81],q[82],q[83],q[84],q[85],q[86],q[87],q[88],q[89],q[90],q[91],q[92],q[93],q[94],q[95],q[96],q[97],q[98],q[99],q[100],q[101],q[102],q[103],q[104],q[105],q[106],q[107],q[108],q[109],q[110],q[111],q[112],q[113],q[114],q[115],q[116],q[117],q[118],q[119],q[120],q[121],q[122],q[123],q[124],q[125],q[126],q[127],q[128],q[129],q[130],q[131],q[132],q[133],q[134],q[135],q[136],q[137],q[138],q[139],q[140],q[141],q[142],q[143],q[144],q[145],q[146],q[147],q[148],q[149],q[150],q[151],q[152],q[153],q[154],q[155],q[156],q[157],q[158],q[159],q[160],q[161],q[162],q[163],q[164],q[165],q[166],q[167],q[168],q[169],q[170],q[171],q[172],q[173],q[174],q[175],q[176],q[177],q[178],q[179],q[180],q[181],q[182],q[183],q[184],q[185],q[186],q[187],q[188],q[189],q[190],q[191],q[192],q[193],q[194],q[195],q[196],q[197],q[198],q[199],q[200],q[201],q[202],q[203],q[204],q[205],q[206],q[207],q[208],q[209],q[210],q[211],q[212],q[213],q[214],q[215],q[216],q[217],q[218],q[219],q[220],q[221],q[222],q[223],q[224],q[225],q[226],q[227],q[228],q[229],q[230],q[231],q[232],q[233],q[234],q[235],q[236],q[237],q[238],q[239],q[240],q[241],q[242],q[243],q[244],q[245],q[246],q[247],q[248],q[249],q[250],q[251],q[252],q[253],q[254],q[255],q[256],q[257],q[258],q[259],q[260],q[261],q[262],q[263],q[264],q[265],q[266],q[267],q[268],q[269],q[270],q[271],q[272],q[273],q[274],q[275],q[276],q[277],q[278],q[279],q[280],q[281],q[282],q[283],q[284],q[285],q[286],q[287],q[288],q[289],q[290],q[291],q[292],q[293],q[294],q[295],q[296],q[297],q[298],q[299],q[300],q[301],q[302],q[303],q[304],q[305],q[306],q[307],q[308],q[309],q[310],q[311],q[312],q[313],q[314],q[315],q[316],q[317],q[318],q[319],q[320],q[321],q[322],q[323],q[324],q[325],q[326],q[327],q[328],q[329],q[330],q[331],q[332],q[333],q[334],q[335],q[336],q[337],q[338],q[339],q[340],q[341],q[342],q[343],q[344],q[345],q[346],q[347],q[348],q[349],q[350],q[351],q[352],q[353],q[354],q[355],q[356],q[357],q[358],q[359],q[360],q[361],q[362],q[363],q[364],q[365],q[366],q[367],q[368],q[369],q[370],q[371],q[372],q[373],q[374],q[375],q[376],q[377],q[378],q[379],q[380],q[381],q[382],q[383],q[384],q[385],q[386],q[387],q[388],q[389],q[390],q[391],q[392],q[393],q[394],q[395],q[396],q[397],q[398],q[399],q[400],q[401],q[402],q[403],q[404],q[405],q[406],q[407],q[408],q[409],q[410],q[411],q[412],q[413],q[414],q[415],q[416],q[417],q[418],q[419];
-measure q[0] -> meas[0];
-measure q[1] -> meas[1];
-measure q[2] -> meas[2];
-measure q[3] -> meas[3];
-measure q[4] -> meas[4];
-measure q[5] -> meas[5];
-measure q[6] -> meas[6];
-measure q[7] -> meas[7];
-measure q[8] -> meas[8];
-measure q[9] -> meas[9];
-measure q[10] -> meas[10];
-measure q[11] -> meas[11];
-measure q[12] -> meas[12];
-measure q[13] -> meas[13];
-measure q[14] -> meas[14];
-measure q[15] -> meas[15];
-measure q[16] -> meas[16];
-measure q[17] -> meas[17];
-measure q[18] -> meas[18];
-measure q[19] -> meas[19];
-measure q[20] -> meas[20];
-measure q[21] -> meas[21];
-measure q[22] -> meas[22];
-measure q[23] -> meas[23];
-measure q[24] -> meas[24];
-measure q[25] -> meas[25];
-measure q[26] -> meas[26];
-measure q[27] -> meas[27];
-measure q[28] -> meas[28];
-measure q[29] -> meas[29];
-measure q[30] -> meas[30];
-measure q[31] -> meas[31];
-measure q[32] -> meas[32];
-measure q[33] -> meas[33];
-measure q[34] -> meas[34];
-measure q[35] -> meas[35];
-measure q[36] -> meas[36];
-measure q[37] -> meas[37];
-measure q[38] -> meas[38];
-measure q[39] -> meas[39];
-measure q[40] -> meas[40];
-measure q[41] -> meas[41];
-measure q[42] -> meas[42];
-measure q[43] -> meas[43];
-measure q[44] -> meas[44];
-measure q[45] -> meas[45];
-measure q[46] -> meas[46];
-measure q[47] -> meas[47];
-measure q[48] -> meas[48];
-measure q[49] -> meas[49];
-measure q[50] -> meas[50];
-measure q[51] -> meas[51];
-measure q[52] -> meas[52];
-measure q[53] -> meas[53];
-measure q[54] -> meas[54];
-measure q[55] -> meas[55];
-measure q[56] -> meas[56];
-measure q[57] -> meas[57];
-measure q[58] -> meas[58];
-measure q[59] -> meas[59];
-measure q[60] -> meas[60];
-measure q[61] -> meas[61];
-measure q[62] -> meas[62];
-measure q[63] -> meas[63];
-measure q[64] -> meas[64];
-measure q[65] -> meas[65];
-measure q[66] -> meas[66];
-measure q[67] -> meas[67];
-measure q[68] -> meas[68];
-measure q[69] -> meas[69];
-measure q[70] -> meas[70];
-measure q[71] -> meas[71];
-measure q[72] -> meas[72];
-measure q[73] -> meas[73];
-measure q[74] -> meas[74];
-measure q[75] -> meas[75];
-measure q[76] -> meas[76];
-measure q[77] -> meas[77];
-measure q[78] -> meas[78];
-measure q[79] -> meas[79];
-measure q[80] -> meas[80];
-measure q[81] -> meas[81];
-measure q[82] -> meas[82];
-measure q[83] -> meas[83];
-measure q[84] -> meas[84];
-measure q[85] -> meas[85];
-measure q[86] -> meas[86];
-measure q[87] -> meas[87];
-measure q[88] -> meas[88];
-measure q[89] -> meas[89];
-measure q[90] -> meas[90];
-measure q[91] -> meas[91];
-measure q[92] -> meas[92];
-measure q[93] -> meas[93];
-measure q[94] -> meas[94];
-measure q[95] -> meas[95];
-measure q[96] -> meas[96];
-measure q[97] -> meas[97];
-measure q[98] -> meas[98];
-measure q[99] -> meas[99];
-measure q[100] -> meas[100];
-measure q[101] -> meas[101];
-measure q[102] -> meas[102];
-measure q[103] -> meas[103];
-measure q[104] -> meas[104];
-measure q[105] -> meas[105];
-measure q[106] -> meas[106];
-measure q[107] -> meas[107];
-measure q[108] -> meas[108];
-measure q[109] -> meas[109];
-measure q[110] -> meas[110];
-measure q[111] -> meas[111];
-measure q[112] -> meas[112];
-measure q[113] -> meas[113];
-measure q[114] -> meas[114];
-measure q[115] -> meas[115];
-measure q[116] -> meas[116];
-measure q[117] -> meas[117];
-measure q[118] -> meas[118];
-measure q[119] -> meas[119];
-measure q[120] -> meas[120];
-measure q[121] -> meas[121];
-measure q[122] -> meas[122];
-measure q[123] -> meas[123];
-measure q[124] -> meas[124];
-measure q[125] -> meas[125];
-measure q[126] -> meas[126];
-measure q[127] -> meas[127];
-measure q[128] -> meas[128];
-measure q[129] -> meas[129];
-measure q[130] -> meas[130];
-measure q[131] -> meas[131];
-measure q[132] -> meas[132];
-measure q[133] -> meas[133];
-measure q[134] -> meas[134];
-measure q[135] -> meas[135];
-measure q[136] -> meas[136];
-measure q[137] -> meas[137];
-measure q[138] -> meas[138];
-measure q[139] -> meas[139];
-measure q[140] -> meas[140];
-measure q[141] -> meas[141];
-measure q[142] -> meas[142];
-measure q[143] -> meas[143];
-measure q[144] -> meas[144];
-measure q[145] -> meas[145];
-measure q[146] -> meas[146];
-measure q[147] -> meas[147];
-measure q[148] -> meas[148];
-measure q[149] -> meas[149];
-measure q[150] -> meas[150];
-measure q[151] -> meas[151];
-measure q[152] -> meas[152];
-measure q[153] -> meas[153];
-measure q[154] -> meas[154];
-measure q[155] -> meas[155];
-measure q[156] -> meas[156];
-measure q[157] -> meas[157];
-measure q[158] -> meas[158];
-measure q[159] -> meas[159];
-measure q[160] -> meas[160];
-measure q[161] -> meas[161];
-measure q[162] -> meas[162];
-measure q[163] -> meas[163];
-measure q[164] -> meas[164];
-measure q[165] -> meas[165];
-measure q[166] -> meas[166];
-measure q[167] -> meas[167];
-measure q[168] -> meas[168];
-measure q[169] -> meas[169];
-measure q[170] -> meas[170];
-measure q[171] -> meas[171];
-measure q[172] -> meas[172];
-measure q[173] -> meas[173];
-measure q[174] -> meas[174];
-measure q[175] -> meas[175];
-measure q[176] -> meas[176];
-measure q[177] -> meas[177];
-measure q[178] -> meas[178];
-measure q[179] -> meas[179];
-measure q[180] -> meas[180];
-measure q[181] -> meas[181];
-measure q[182] -> meas[182];
-measure q[183] -> meas[183];
-measure q[184] -> meas[184];
-measure q[185] -> meas[185];
-measure q[186] -> meas[186];
-measure q[187] -> meas[187];
-measure q[188] -> meas[188];
-measure q[189] -> meas[189];
-measure q[190] -> meas[190];
-measure q[191] -> meas[191];
-measure q[192] -> meas[192];
-measure q[193] -> meas[193];
-measure q[194] -> meas[194];
-measure q[195] -> meas[195];
-measure q[196] -> meas[196];
-measure q[197] -> meas[197];
-measure q[198] -> meas[198];
-measure q[199] -> meas[199];
-measure q[200] -> meas[200];
-measure q[201] -> meas[201];
-measure q[202] -> meas[202];
-measure q[203] -> meas[203];
-measure q[204] -> meas[204];
-measure q[205] -> meas[205];
-measure q[206] -> meas[206];
-measure q[207] -> meas[207];
-measure q[208] -> meas[208];
-measure q[209] -> meas[209];
-measure q[210] -> meas[210];
-measure q[211] -> meas[211];
-measure q[212] -> meas[212];
-measure q[213] -> meas[213];
-measure q[214] -> meas[214];
-measure q[215] -> meas[215];
-measure q[216] -> meas[216];
-measure q[217] -> meas[217];
-measure q[218] -> meas[218];
-measure q[219] -> meas[219];
-measure q[220] -> meas[220];
-measure q[221] -> meas[221];
-measure q[222] -> meas[222];
-measure q[223] -> meas[223];
-measure q[224] -> meas[224];
-measure q[225] -> meas[225];
-measure q[226] -> meas[226];
-measure q[227] -> meas[227];
-measure q[228] -> meas[228];
-measure q[229] -> meas[229];
-measure q[230] -> meas[230];
-measure q[231] -> meas[231];
-measure q[232] -> meas[232];
-measure q[233] -> meas[233];
-measure q[234] -> meas[234];
-measure q[235] -> meas[235];
-measure q[236] -> meas[236];
-measure q[237] -> meas[237];
-measure q[238] -> meas[238];
-measure q[239] -> meas[239];
-measure q[240] -> meas[240];
-measure q[241] -> meas[241];
-measure q[242] -> meas[242];
-measure q[243] -> meas[243];
-measure q[244] -> meas[244];
-measure q[245] -> meas[245];
-measure q[246] -> meas[246];
-measure q[247] -> meas[247];
-measure q[248] -> meas[248];
-measure q[249] -> meas[249];
-measure q[250] -> meas[250];
-measure q[251] -> meas[251];
-measure q[252] -> meas[252];
-measure q[253] -> meas[253];
-measure q[254] -> meas[254];
-measure q[255] -> meas[255];
-measure q[256] -> meas[256];
-measure q[257] -> meas[257];
-measure q[258] -> meas[258];
-measure q[259] -> meas[259];
-measure q[260] -> meas[260];
-measure q[261] -> meas[261];
-measure q[262] -> meas[262];
-measure q[263] -> meas[263];
-measure q[264] -> meas[264];
-measure q[265] -> meas[265];
-measure q[266] -> meas[266];
-measure q[267] -> meas[267];
-measure q[268] -> meas[268];
-measure q[269] -> meas[269];
-measure q[270] -> meas[270];
-measure q[271] -> meas[271];
-measure q[272] -> meas[272];
-measure q[273] -> meas[273];
-measure q[274] -> meas[274];
-measure q[275] -> meas[275];
-measure q[276] -> meas[276];
-measure q[277] -> meas[277];
-measure q[278] -> meas[278];
-measure q[279] -> meas[279];
-measure q[280] -> meas[280];
-measure q[281] -> meas[281];
-measure q[282] -> meas[282];
-measure q[283] -> meas[283];
-measure q[284] -> meas[284];
-measure q[285] -> meas[285];
-measure q[286] -> meas[286];
-measure q[287] -> meas[287];
-measure q[288] -> meas[288];
-measure q[289] -> meas[289];
-measure q[290] -> meas[290];
-measure q[291] -> meas[291];
-measure q[292] -> meas[292];
-measure q[293] -> meas[293];
-measure q[294] -> meas[294];
-measure q[295] -> meas[295];
-measure q[296] -> meas[296];
-measure q[297] -> meas[297];
-measure q[298] -> meas[298];
-measure q[299] -> meas[299];
-measure q[300] -> meas[300];
-measure q[301] -> meas[301];
-measure q[302] -> meas[302];
-measure q[303] -> meas[303];
-measure q[304] -> meas[304];
-measure q[305] -> meas[305];
-measure q[306] -> meas[306];
-measure q[307] -> meas[307];
-measure q[308] -> meas[308];
-measure q[309] -> meas[309];
-measure q[310] -> meas[310];
-measure q[311] -> meas[311];
-measure q[312] -> meas[312];
-measure q[313] -> meas[313];
-measure q[314] -> meas[314];
-measure q[315] -> meas[315];
-measure q[316] -> meas[316];
-measure q[317] -> meas[317];
-measure q[318] -> meas[318];
-measure q[319] -> meas[319];
-measure q[320] -> meas[320];
-measure q[321] -> meas[321];
-measure q[322] -> meas[322];
-measure q[323] -> meas[323];
-measure q[324] -> meas[324];
-measure q[325] -> meas[325];
-measure q[326] -> meas[326];
-measure q[327] -> meas[327];
-measure q[328] -> meas[328];
-measure q[329] -> meas[329];
-measure q[330] -> meas[330];
-measure q[331] -> meas[331];
-measure q[332] -> meas[332];
-measure q[333] -> meas[333];
-measure q[334] -> meas[334];
-measure q[335] -> meas[335];
-measure q[336] -> meas[336];
-measure q[337] -> meas[337];
-measure q[338] -> meas[338];
-measure q[339] -> meas[339];
-measure q[340] -> meas[340];
-measure q[341] -> meas[341];
-measure q[342] -> meas[342];
-measure q[343] -> meas[343];
-measure q[344] -> meas[344];
-measure q[345] -> meas[345];
-measure q[346] -> meas[346];
-measure q[347] -> meas[347];
-measure q[348] -> meas[348];
-measure q[349] -> meas[349];
-measure q[350] -> meas[350];
-measure q[351] -> meas[351];
-measure q[352] -> meas[352];
-measure q[353] -> meas[353];
-measure q[354] -> meas[354];
-measure q[355] -> meas[355];
-measure q[356] -> meas[356];
-measure q[357] -> meas[357];
-measure q[358] -> meas[358];
-measure q[359] -> meas[359];
-measure q[360] -> meas[360];
-measure q[361] -> meas[361];
-measure q[362] -> meas[362];
-measure q[363] -> meas[363];
-measure q[364] -> meas[364];
-measure q[365] -> meas[365];
-measure q[366] -> meas[366];
-measure q[367] -> meas[367];
-measure q[368] -> meas[368];
-measure q[369] -> meas[369];
-measure q[370] -> meas[370];
-measure q[371] -> meas[371];
-measure q[372] -> meas[372];
-measure q[373] -> meas[373];
-measure q[374] -> meas[374];
-measure q[375] -> meas[375];
-measure q[376] -> meas[376];
-measure q[377] -> meas[377];
-measure q[378] -> meas[378];
-measure q[379] -> meas[379];
-measure q[380] -> meas[380];
-measure q[381] -> meas[381];
-measure q[382] -> meas[382];
-measure q[383] -> meas[383];
-measure q[384] -> meas[384];
-measure q[385] -> meas[385];
-measure q[386] -> meas[386];
-measure q[387] -> meas[387];
-measure q[388] -> meas[388];
-measure q[389] -> meas[389];
-measure q[390] -> meas[390];
-measure q[391] -> meas[391];
-measure q[392] -> meas[392];
-measure q[393] -> meas[393];
-measure q[394] -> meas[394];
-measure q[395] -> meas[395];
-measure q[396] -> meas[396];
-measure q[397] -> meas[397];
-measure q[398] -> meas[398];
-measure q[399] -> meas[399];
-measure q[400] -> meas[400];
-measure q[401] -> meas[401];
-measure q[402] -> meas[402];
-measure q[403] -> meas[403];
-measure q[404] -> meas[404];
-measure q[405] -> meas[405];
-measure q[406] -> meas[406];
-measure q[407] -> meas[407];
-measure q[408] -> meas[408];
-measure q[409] -> meas[409];
-measure q[410] -> meas[410];
-measure q[411] -> meas[411];
-measure q[412] -> meas[412];
-measure q[413] -> meas[413];
-measure q[414] -> meas[414];
-measure q[415] -> meas[415];
-measure q[416] -> meas[416];
-measure q[417] -> meas[417];
-measure q[418] -> meas[418];
-measure q[419] -> meas[419];
@@ -1,3361 +0,0 @@
-OPENQASM 2.0;
-include "qelib1.inc";
-qreg q[420];
-creg c[420];
-creg meas[420];
-rz(pi/2) q[0];
-sx q[0];
-rz(0.036737227) q[0];
-rz(pi/2) q[1];
-sx q[1];
-rz(-1.6442708) q[1];
-cx q[0],q[1];
-rz(-1.5340591) q[1];
-cx q[0],q[1];
-rz(0.66194367) q[1];
-rz(pi/2) q[2];
-sx q[2];
-rz(1.1738899) q[2];
-rz(pi/2) q[3];
-sx q[3];
-rz(2.3646091) q[3];
-cx q[2],q[3];
-rz(-0.39690641) q[3];
-cx q[2],q[3];
-rz(-1.3238873) q[2];
-cx q[1],q[2];
-rz(0.66194367) q[2];
-cx q[1],q[2];
-rz(1.1622364) q[3];
-rz(pi/2) q[4];
-sx q[4];
-rz(0.74433616) q[4];
-rz(pi/2) q[5];
-sx q[5];
-rz(-3.0594686) q[5];
-cx q[4],q[5];
-rz(-0.82646017) q[5];
-cx q[4],q[5];
-rz(-2.3244728) q[4];
-cx q[3],q[4];
-rz(1.1622364) q[4];
-cx q[3],q[4];
-rz(0.87189587) q[5];
-rz(pi/2) q[6];
-sx q[6];
-rz(0.72093789) q[6];
-rz(pi/2) q[7];
-sx q[7];
-rz(-3.0126721) q[7];
-cx q[6],q[7];
-rz(-0.84985844) q[7];
-cx q[6],q[7];
-rz(-1.7437917) q[6];
-cx q[5],q[6];
-rz(0.87189587) q[6];
-cx q[5],q[6];
-rz(1.1035209) q[7];
-rz(pi/2) q[8];
-sx q[8];
-rz(0.65319835) q[8];
-rz(pi/2) q[9];
-sx q[9];
-rz(-2.877193) q[9];
-cx q[8],q[9];
-rz(-0.91759798) q[9];
-cx q[8],q[9];
-rz(-2.2070418) q[8];
-cx q[7],q[8];
-rz(1.1035209) q[8];
-cx q[7],q[8];
-rz(-0.5867462) q[9];
-rz(pi/2) q[10];
-sx q[10];
-rz(-2.8374306) q[10];
-rz(pi/2) q[11];
-sx q[11];
-rz(-2.1791205) q[11];
-cx q[10],q[11];
-rz(1.8749584) q[11];
-cx q[10],q[11];
-rz(1.1734924) q[10];
-rz(1.225402) q[11];
-cx q[9],q[10];
-rz(-0.5867462) q[10];
-cx q[9],q[10];
-rz(pi/2) q[12];
-sx q[12];
-rz(2.6180201) q[12];
-rz(pi/2) q[13];
-sx q[13];
-rz(-0.52365127) q[13];
-cx q[12],q[13];
-rz(1.0472238) q[13];
-cx q[12],q[13];
-rz(-2.450804) q[12];
-cx q[11],q[12];
-rz(1.225402) q[12];
-cx q[11],q[12];
-rz(-0.09379511) q[13];
-rz(pi/2) q[14];
-sx q[14];
-rz(2.8524389) q[14];
-rz(pi/2) q[15];
-sx q[15];
-rz(-0.99248887) q[15];
-cx q[14],q[15];
-rz(1.2816426) q[15];
-cx q[14],q[15];
-rz(0.18759022) q[14];
-cx q[13],q[14];
-rz(-0.09379511) q[14];
-cx q[13],q[14];
-rz(1.2280604) q[15];
-rz(pi/2) q[16];
-sx q[16];
-rz(1.5467481) q[16];
-rz(pi/2) q[17];
-sx q[17];
-rz(1.6188928) q[17];
-cx q[16],q[17];
-rz(-0.024048236) q[17];
-cx q[16],q[17];
-rz(-2.4561208) q[16];
-cx q[15],q[16];
-rz(1.2280604) q[16];
-cx q[15],q[16];
-rz(-0.35052766) q[17];
-rz(pi/2) q[18];
-sx q[18];
-rz(1.1878745) q[18];
-rz(pi/2) q[19];
-sx q[19];
-rz(2.33664) q[19];
-cx q[18],q[19];
-rz(-0.38292184) q[19];
-cx q[18],q[19];
-rz(0.70105532) q[18];
-cx q[17],q[18];
-rz(-0.35052766) q[18];
-cx q[17],q[18];
-rz(0.58161614) q[19];
-rz(pi/2) q[20];
-sx q[20];
-rz(2.7977732) q[20];
-rz(pi/2) q[21];
-sx q[21];
-rz(-0.88315747) q[21];
-cx q[20],q[21];
-rz(1.2269769) q[21];
-cx q[20],q[21];
-rz(-1.1632323) q[20];
-cx q[19],q[20];
-rz(0.58161614) q[20];
-cx q[19],q[20];
-rz(-0.34109207) q[21];
-rz(pi/2) q[22];
-sx q[22];
-rz(2.1117379) q[22];
-rz(pi/2) q[23];
-sx q[23];
-rz(0.48891327) q[23];
-cx q[22],q[23];
-rz(0.54094153) q[23];
-cx q[22],q[23];
-rz(0.68218414) q[22];
-cx q[21],q[22];
-rz(-0.34109207) q[22];
-cx q[21],q[22];
-rz(1.1964101) q[23];
-rz(pi/2) q[24];
-sx q[24];
-rz(0.43172623) q[24];
-rz(pi/2) q[25];
-sx q[25];
-rz(-2.4342488) q[25];
-cx q[24],q[25];
-rz(-1.1390701) q[25];
-cx q[24],q[25];
-rz(-2.3928202) q[24];
-cx q[23],q[24];
-rz(1.1964101) q[24];
-cx q[23],q[24];
-rz(-1.4542567) q[25];
-rz(pi/2) q[26];
-sx q[26];
-rz(0.82266798) q[26];
-rz(pi/2) q[27];
-sx q[27];
-rz(3.067053) q[27];
-cx q[26],q[27];
-rz(-0.74812835) q[27];
-cx q[26],q[27];
-rz(2.9085134) q[26];
-cx q[25],q[26];
-rz(-1.4542567) q[26];
-cx q[25],q[26];
-rz(-1.7526827) q[27];
-rz(pi/2) q[28];
-sx q[28];
-rz(0.93354356) q[28];
-rz(pi/2) q[29];
-sx q[29];
-rz(2.8453019) q[29];
-cx q[28],q[29];
-rz(-0.63725277) q[29];
-cx q[28],q[29];
-rz(-2.7778199) q[28];
-cx q[27],q[28];
-rz(-1.7526827) q[28];
-cx q[27],q[28];
-rz(0.78758675) q[29];
-rz(pi/2) q[30];
-sx q[30];
-rz(-0.0075617732) q[30];
-rz(pi/2) q[31];
-sx q[31];
-rz(-1.5556728) q[31];
-cx q[30],q[31];
-rz(-1.5783581) q[31];
-cx q[30],q[31];
-rz(-1.5751735) q[30];
-cx q[29],q[30];
-rz(0.78758675) q[30];
-cx q[29],q[30];
-rz(0.31825583) q[31];
-rz(pi/2) q[32];
-sx q[32];
-rz(-0.10969577) q[32];
-rz(pi/2) q[33];
-sx q[33];
-rz(-1.3514048) q[33];
-cx q[32],q[33];
-rz(-1.6804921) q[33];
-cx q[32],q[33];
-rz(-0.63651166) q[32];
-cx q[31],q[32];
-rz(0.31825583) q[32];
-cx q[31],q[32];
-rz(1.3198822) q[33];
-rz(pi/2) q[34];
-sx q[34];
-rz(1.7508621) q[34];
-rz(pi/2) q[35];
-sx q[35];
-rz(1.2106647) q[35];
-cx q[34],q[35];
-rz(0.18006581) q[35];
-cx q[34],q[35];
-rz(-2.6397644) q[34];
-cx q[33],q[34];
-rz(1.3198822) q[34];
-cx q[33],q[34];
-rz(-0.33574444) q[35];
-rz(pi/2) q[36];
-sx q[36];
-rz(0.75865593) q[36];
-rz(pi/2) q[37];
-sx q[37];
-rz(-3.0881082) q[37];
-cx q[36],q[37];
-rz(-0.8121404) q[37];
-cx q[36],q[37];
-rz(0.67148888) q[36];
-cx q[35],q[36];
-rz(-0.33574444) q[36];
-cx q[35],q[36];
-rz(-1.9762233) q[37];
-rz(pi/2) q[38];
-sx q[38];
-rz(1.0819864) q[38];
-rz(pi/2) q[39];
-sx q[39];
-rz(2.5484161) q[39];
-cx q[38],q[39];
-rz(-0.48880991) q[39];
-cx q[38],q[39];
-rz(-2.3307387) q[38];
-cx q[37],q[38];
-rz(-1.9762233) q[38];
-cx q[37],q[38];
-rz(-0.51729742) q[39];
-rz(pi/2) q[40];
-sx q[40];
-rz(1.9861988) q[40];
-rz(pi/2) q[41];
-sx q[41];
-rz(0.73999141) q[41];
-cx q[40],q[41];
-rz(0.41540246) q[41];
-cx q[40],q[41];
-rz(1.0345948) q[40];
-cx q[39],q[40];
-rz(-0.51729742) q[40];
-cx q[39],q[40];
-rz(1.5037095) q[41];
-rz(pi/2) q[42];
-sx q[42];
-rz(1.8366729) q[42];
-rz(pi/2) q[43];
-sx q[43];
-rz(1.0390432) q[43];
-cx q[42],q[43];
-rz(0.26587655) q[43];
-cx q[42],q[43];
-rz(-3.007419) q[42];
-cx q[41],q[42];
-rz(1.5037095) q[42];
-cx q[41],q[42];
-rz(1.7162834) q[43];
-rz(pi/2) q[44];
-sx q[44];
-rz(1.3200848) q[44];
-rz(pi/2) q[45];
-sx q[45];
-rz(2.0722193) q[45];
-cx q[44],q[45];
-rz(-0.25071149) q[45];
-cx q[44],q[45];
-rz(2.8506185) q[44];
-cx q[43],q[44];
-rz(1.7162834) q[44];
-cx q[43],q[44];
-rz(0.70907762) q[45];
-rz(pi/2) q[46];
-sx q[46];
-rz(0.63589722) q[46];
-rz(pi/2) q[47];
-sx q[47];
-rz(-2.8425908) q[47];
-cx q[46],q[47];
-rz(-0.93489911) q[47];
-cx q[46],q[47];
-rz(-1.4181552) q[46];
-cx q[45],q[46];
-rz(0.70907762) q[46];
-cx q[45],q[46];
-rz(-0.94827693) q[47];
-rz(pi/2) q[48];
-sx q[48];
-rz(0.96504062) q[48];
-rz(pi/2) q[49];
-sx q[49];
-rz(2.7823077) q[49];
-cx q[48],q[49];
-rz(-0.60575571) q[49];
-cx q[48],q[49];
-rz(1.8965539) q[48];
-cx q[47],q[48];
-rz(-0.94827693) q[48];
-cx q[47],q[48];
-rz(1.4072817) q[49];
-rz(pi/2) q[50];
-sx q[50];
-rz(0.65800681) q[50];
-rz(pi/2) q[51];
-sx q[51];
-rz(-2.8868099) q[51];
-cx q[50],q[51];
-rz(-0.91278952) q[51];
-cx q[50],q[51];
-rz(-2.8145634) q[50];
-cx q[49],q[50];
-rz(1.4072817) q[50];
-cx q[49],q[50];
-rz(0.50920629) q[51];
-rz(pi/2) q[52];
-sx q[52];
-rz(2.6690982) q[52];
-rz(pi/2) q[53];
-sx q[53];
-rz(-0.62580747) q[53];
-cx q[52],q[53];
-rz(1.0983019) q[53];
-cx q[52],q[53];
-rz(-1.0184126) q[52];
-cx q[51],q[52];
-rz(0.50920629) q[52];
-cx q[51],q[52];
-rz(0.83249831) q[53];
-rz(pi/2) q[54];
-sx q[54];
-rz(-3.0022358) q[54];
-rz(pi/2) q[55];
-sx q[55];
-rz(-1.8495101) q[55];
-cx q[54],q[55];
-rz(1.7101532) q[55];
-cx q[54],q[55];
-rz(-1.6649966) q[54];
-cx q[53],q[54];
-rz(0.83249831) q[54];
-cx q[53],q[54];
-rz(-0.4757236) q[55];
-rz(pi/2) q[56];
-sx q[56];
-rz(0.22036033) q[56];
-rz(pi/2) q[57];
-sx q[57];
-rz(-2.011517) q[57];
-cx q[56],q[57];
-rz(-1.350436) q[57];
-cx q[56],q[57];
-rz(0.9514472) q[56];
-cx q[55],q[56];
-rz(-0.4757236) q[56];
-cx q[55],q[56];
-rz(0.72233419) q[57];
-rz(pi/2) q[58];
-sx q[58];
-rz(-0.16782797) q[58];
-rz(pi/2) q[59];
-sx q[59];
-rz(-1.2351404) q[59];
-cx q[58],q[59];
-rz(-1.7386243) q[59];
-cx q[58],q[59];
-rz(-1.4446684) q[58];
-cx q[57],q[58];
-rz(0.72233419) q[58];
-cx q[57],q[58];
-rz(-1.3806044) q[59];
-rz(pi/2) q[60];
-sx q[60];
-rz(1.9765279) q[60];
-rz(pi/2) q[61];
-sx q[61];
-rz(0.75933309) q[61];
-cx q[60],q[61];
-rz(0.40573162) q[61];
-cx q[60],q[61];
-rz(2.7612088) q[60];
-cx q[59],q[60];
-rz(-1.3806044) q[60];
-cx q[59],q[60];
-rz(1.3779107) q[61];
-rz(pi/2) q[62];
-sx q[62];
-rz(-0.099063473) q[62];
-rz(pi/2) q[63];
-sx q[63];
-rz(-1.3726694) q[63];
-cx q[62],q[63];
-rz(-1.6698598) q[63];
-cx q[62],q[63];
-rz(-2.7558214) q[62];
-cx q[61],q[62];
-rz(1.3779107) q[62];
-cx q[61],q[62];
-rz(-0.55073908) q[63];
-rz(pi/2) q[64];
-sx q[64];
-rz(1.7881902) q[64];
-rz(pi/2) q[65];
-sx q[65];
-rz(1.1360085) q[65];
-cx q[64],q[65];
-rz(0.21739391) q[65];
-cx q[64],q[65];
-rz(1.1014782) q[64];
-cx q[63],q[64];
-rz(-0.55073908) q[64];
-cx q[63],q[64];
-rz(-0.73796434) q[65];
-rz(pi/2) q[66];
-sx q[66];
-rz(3.0447135) q[66];
-rz(pi/2) q[67];
-sx q[67];
-rz(-1.3770381) q[67];
-cx q[66],q[67];
-rz(1.4739172) q[67];
-cx q[66],q[67];
-rz(1.4759287) q[66];
-cx q[65],q[66];
-rz(-0.73796434) q[66];
-cx q[65],q[66];
-rz(-1.2242633) q[67];
-rz(pi/2) q[68];
-sx q[68];
-rz(0.034739527) q[68];
-rz(pi/2) q[69];
-sx q[69];
-rz(-1.6402754) q[69];
-cx q[68],q[69];
-rz(-1.5360568) q[69];
-cx q[68],q[69];
-rz(2.4485266) q[68];
-cx q[67],q[68];
-rz(-1.2242633) q[68];
-cx q[67],q[68];
-rz(0.14442589) q[69];
-rz(pi/2) q[70];
-sx q[70];
-rz(-0.42895497) q[70];
-rz(pi/2) q[71];
-sx q[71];
-rz(-0.71288638) q[71];
-cx q[70],q[71];
-rz(-1.9997513) q[71];
-cx q[70],q[71];
-rz(-0.28885178) q[70];
-cx q[69],q[70];
-rz(0.14442589) q[70];
-cx q[69],q[70];
-rz(-0.70612296) q[71];
-rz(pi/2) q[72];
-sx q[72];
-rz(1.1188799) q[72];
-rz(pi/2) q[73];
-sx q[73];
-rz(2.4746292) q[73];
-cx q[72],q[73];
-rz(-0.45191642) q[73];
-cx q[72],q[73];
-rz(1.4122459) q[72];
-cx q[71],q[72];
-rz(-0.70612296) q[72];
-cx q[71],q[72];
-rz(-1.8918136) q[73];
-rz(pi/2) q[74];
-sx q[74];
-rz(2.5783595) q[74];
-rz(pi/2) q[75];
-sx q[75];
-rz(-0.44433007) q[75];
-cx q[74],q[75];
-rz(1.0075632) q[75];
-cx q[74],q[75];
-rz(-2.4995581) q[74];
-cx q[73],q[74];
-rz(-1.8918136) q[74];
-cx q[73],q[74];
-rz(1.3661392) q[75];
-rz(pi/2) q[76];
-sx q[76];
-rz(1.7749665) q[76];
-rz(pi/2) q[77];
-sx q[77];
-rz(1.162456) q[77];
-cx q[76],q[77];
-rz(0.20417016) q[77];
-cx q[76],q[77];
-rz(-2.7322784) q[76];
-cx q[75],q[76];
-rz(1.3661392) q[76];
-cx q[75],q[76];
-rz(-1.6602674) q[77];
-rz(pi/2) q[78];
-sx q[78];
-rz(0.36985243) q[78];
-rz(pi/2) q[79];
-sx q[79];
-rz(-2.3105012) q[79];
-cx q[78],q[79];
-rz(-1.2009439) q[79];
-cx q[78],q[79];
-rz(-2.9626505) q[78];
-cx q[77],q[78];
-rz(-1.6602674) q[78];
-cx q[77],q[78];
-rz(0.57509766) q[79];
-rz(pi/2) q[80];
-sx q[80];
-rz(2.0861889) q[80];
-rz(pi/2) q[81];
-sx q[81];
-rz(0.54001115) q[81];
-cx q[80],q[81];
-rz(0.51539259) q[81];
-cx q[80],q[81];
-rz(-1.1501953) q[80];
-cx q[79],q[80];
-rz(0.57509766) q[80];
-cx q[79],q[80];
-rz(1.5722562) q[81];
-rz(pi/2) q[82];
-sx q[82];
-rz(2.6117856) q[82];
-rz(pi/2) q[83];
-sx q[83];
-rz(-0.51118227) q[83];
-cx q[82],q[83];
-rz(1.0409893) q[83];
-cx q[82],q[83];
-rz(3.1386729) q[82];
-cx q[81],q[82];
-rz(1.5722562) q[82];
-cx q[81],q[82];
-rz(-1.0641233) q[83];
-rz(pi/2) q[84];
-sx q[84];
-rz(-0.0034812732) q[84];
-rz(pi/2) q[85];
-sx q[85];
-rz(-1.5638338) q[85];
-cx q[84],q[85];
-rz(-1.5742776) q[85];
-cx q[84],q[85];
-rz(2.1282466) q[84];
-cx q[83],q[84];
-rz(-1.0641233) q[84];
-cx q[83],q[84];
-rz(-1.8405637) q[85];
-rz(pi/2) q[86];
-sx q[86];
-rz(0.11035823) q[86];
-rz(pi/2) q[87];
-sx q[87];
-rz(-1.7915128) q[87];
-cx q[86],q[87];
-rz(-1.4604381) q[87];
-cx q[86],q[87];
-rz(-2.6020579) q[86];
-cx q[85],q[86];
-rz(-1.8405637) q[86];
-cx q[85],q[86];
-rz(-0.44910596) q[87];
-rz(pi/2) q[88];
-sx q[88];
-rz(1.6278899) q[88];
-rz(pi/2) q[89];
-sx q[89];
-rz(1.4566093) q[89];
-cx q[88],q[89];
-rz(0.057093524) q[89];
-cx q[88],q[89];
-rz(0.89821192) q[88];
-cx q[87],q[88];
-rz(-0.44910596) q[88];
-cx q[87],q[88];
-rz(-0.31048256) q[89];
-rz(pi/2) q[90];
-sx q[90];
-rz(0.30664723) q[90];
-rz(pi/2) q[91];
-sx q[91];
-rz(-2.1840908) q[91];
-cx q[90],q[91];
-rz(-1.2641491) q[91];
-cx q[90],q[91];
-rz(0.62096512) q[90];
-cx q[89],q[90];
-rz(-0.31048256) q[90];
-cx q[89],q[90];
-rz(-1.3078539) q[91];
-rz(pi/2) q[92];
-sx q[92];
-rz(1.511921) q[92];
-rz(pi/2) q[93];
-sx q[93];
-rz(1.6885471) q[93];
-cx q[92],q[93];
-rz(-0.058875376) q[93];
-cx q[92],q[93];
-rz(2.6157078) q[92];
-cx q[91],q[92];
-rz(-1.3078539) q[92];
-cx q[91],q[92];
-rz(1.1066747) q[93];
-rz(pi/2) q[94];
-sx q[94];
-rz(2.345518) q[94];
-rz(pi/2) q[95];
-sx q[95];
-rz(0.021353007) q[95];
-cx q[94],q[95];
-rz(0.77472166) q[95];
-cx q[94],q[95];
-rz(-2.2133494) q[94];
-cx q[93],q[94];
-rz(1.1066747) q[94];
-cx q[93],q[94];
-rz(1.177511) q[95];
-rz(pi/2) q[96];
-sx q[96];
-rz(2.7331042) q[96];
-rz(pi/2) q[97];
-sx q[97];
-rz(-0.75381947) q[97];
-cx q[96],q[97];
-rz(1.1623079) q[97];
-cx q[96],q[97];
-rz(-2.355022) q[96];
-cx q[95],q[96];
-rz(1.177511) q[96];
-cx q[95],q[96];
-rz(-0.5779187) q[97];
-rz(pi/2) q[98];
-sx q[98];
-rz(2.5983341) q[98];
-rz(pi/2) q[99];
-sx q[99];
-rz(-0.48427927) q[99];
-cx q[98],q[99];
-rz(1.0275378) q[99];
-cx q[98],q[99];
-rz(1.1558374) q[98];
-cx q[97],q[98];
-rz(-0.5779187) q[98];
-cx q[97],q[98];
-rz(-0.89629203) q[99];
-rz(pi/2) q[100];
-sx q[100];
-rz(2.6711983) q[100];
-rz(pi/2) q[101];
-sx q[101];
-rz(-0.63000767) q[101];
-cx q[100],q[101];
-rz(1.100402) q[101];
-cx q[100],q[101];
-rz(1.7925841) q[100];
-rz(1.4819045) q[101];
-cx q[99],q[100];
-rz(-0.89629203) q[100];
-cx q[99],q[100];
-rz(pi/2) q[102];
-sx q[102];
-rz(-0.27259207) q[102];
-rz(pi/2) q[103];
-sx q[103];
-rz(-1.0256122) q[103];
-cx q[102],q[103];
-rz(-1.8433884) q[103];
-cx q[102],q[103];
-rz(-2.963809) q[102];
-cx q[101],q[102];
-rz(1.4819045) q[102];
-cx q[101],q[102];
-rz(-0.43682976) q[103];
-rz(pi/2) q[104];
-sx q[104];
-rz(2.2280767) q[104];
-rz(pi/2) q[105];
-sx q[105];
-rz(0.25623565) q[105];
-cx q[104],q[105];
-rz(0.65728034) q[105];
-cx q[104],q[105];
-rz(0.87365952) q[104];
-cx q[103],q[104];
-rz(-0.43682976) q[104];
-cx q[103],q[104];
-rz(0.44513466) q[105];
-rz(pi/2) q[106];
-sx q[106];
-rz(0.39182323) q[106];
-rz(pi/2) q[107];
-sx q[107];
-rz(-2.3544428) q[107];
-cx q[106],q[107];
-rz(-1.1789731) q[107];
-cx q[106],q[107];
-rz(-0.89026932) q[106];
-cx q[105],q[106];
-rz(0.44513466) q[106];
-cx q[105],q[106];
-rz(-0.10678698) q[107];
-rz(pi/2) q[108];
-sx q[108];
-rz(2.0299686) q[108];
-rz(pi/2) q[109];
-sx q[109];
-rz(0.65245175) q[109];
-cx q[108],q[109];
-rz(0.45917229) q[109];
-cx q[108],q[109];
-rz(0.21357396) q[108];
-cx q[107],q[108];
-rz(-0.10678698) q[108];
-cx q[107],q[108];
-rz(1.2316812) q[109];
-rz(pi/2) q[110];
-sx q[110];
-rz(-0.065244473) q[110];
-rz(pi/2) q[111];
-sx q[111];
-rz(-1.4403074) q[111];
-cx q[110],q[111];
-rz(-1.6360408) q[111];
-cx q[110],q[111];
-rz(-2.4633624) q[110];
-cx q[109],q[110];
-rz(1.2316812) q[110];
-cx q[109],q[110];
-rz(-0.93193973) q[111];
-rz(pi/2) q[112];
-sx q[112];
-rz(2.1593245) q[112];
-rz(pi/2) q[113];
-sx q[113];
-rz(0.39374001) q[113];
-cx q[112],q[113];
-rz(0.58852816) q[113];
-cx q[112],q[113];
-rz(1.8638795) q[112];
-cx q[111],q[112];
-rz(-0.93193973) q[112];
-cx q[111],q[112];
-rz(1.4032211) q[113];
-rz(pi/2) q[114];
-sx q[114];
-rz(1.2325748) q[114];
-rz(pi/2) q[115];
-sx q[115];
-rz(2.2472394) q[115];
-cx q[114],q[115];
-rz(-0.33822156) q[115];
-cx q[114],q[115];
-rz(-2.8064422) q[114];
-cx q[113],q[114];
-rz(1.4032211) q[114];
-cx q[113],q[114];
-rz(1.3823863) q[115];
-rz(pi/2) q[116];
-sx q[116];
-rz(1.3465416) q[116];
-rz(pi/2) q[117];
-sx q[117];
-rz(2.0193057) q[117];
-cx q[116],q[117];
-rz(-0.2242547) q[117];
-cx q[116],q[117];
-rz(-2.7647726) q[116];
-cx q[115],q[116];
-rz(1.3823863) q[116];
-cx q[115],q[116];
-rz(-1.3910375) q[117];
-rz(pi/2) q[118];
-sx q[118];
-rz(-2.8246598) q[118];
-rz(pi/2) q[119];
-sx q[119];
-rz(-2.2046621) q[119];
-cx q[118],q[119];
-rz(1.8877292) q[119];
-cx q[118],q[119];
-rz(2.782075) q[118];
-cx q[117],q[118];
-rz(-1.3910375) q[118];
-cx q[117],q[118];
-rz(-1.9422048) q[119];
-rz(pi/2) q[120];
-sx q[120];
-rz(1.8469254) q[120];
-rz(pi/2) q[121];
-sx q[121];
-rz(1.0185381) q[121];
-cx q[120],q[121];
-rz(0.27612909) q[121];
-cx q[120],q[121];
-rz(-2.3987757) q[120];
-cx q[119],q[120];
-rz(-1.9422048) q[120];
-cx q[119],q[120];
-rz(-1.253623) q[121];
-rz(pi/2) q[122];
-sx q[122];
-rz(0.46425053) q[122];
-rz(pi/2) q[123];
-sx q[123];
-rz(-2.4992974) q[123];
-cx q[122],q[123];
-rz(-1.1065458) q[123];
-cx q[122],q[123];
-rz(2.507246) q[122];
-cx q[121],q[122];
-rz(-1.253623) q[122];
-cx q[121],q[122];
-rz(0.7409566) q[123];
-rz(pi/2) q[124];
-sx q[124];
-rz(2.9347383) q[124];
-rz(pi/2) q[125];
-sx q[125];
-rz(-1.1570877) q[125];
-cx q[124],q[125];
-rz(1.363942) q[125];
-cx q[124],q[125];
-rz(-1.4819132) q[124];
-cx q[123],q[124];
-rz(0.7409566) q[124];
-cx q[123],q[124];
-rz(-0.49222458) q[125];
-rz(pi/2) q[126];
-sx q[126];
-rz(2.4005614) q[126];
-rz(pi/2) q[127];
-sx q[127];
-rz(-0.088733813) q[127];
-cx q[126],q[127];
-rz(0.82976507) q[127];
-cx q[126],q[127];
-rz(0.98444916) q[126];
-cx q[125],q[126];
-rz(-0.49222458) q[126];
-cx q[125],q[126];
-rz(0.31679969) q[127];
-rz(pi/2) q[128];
-sx q[128];
-rz(1.9039183) q[128];
-rz(pi/2) q[129];
-sx q[129];
-rz(0.90455239) q[129];
-cx q[128],q[129];
-rz(0.33312197) q[129];
-cx q[128],q[129];
-rz(-0.63359938) q[128];
-cx q[127],q[128];
-rz(0.31679969) q[128];
-cx q[127],q[128];
-rz(0.192143) q[129];
-rz(pi/2) q[130];
-sx q[130];
-rz(0.57951213) q[130];
-rz(pi/2) q[131];
-sx q[131];
-rz(-2.7298206) q[131];
-cx q[130],q[131];
-rz(-0.9912842) q[131];
-cx q[130],q[131];
-rz(-0.384286) q[130];
-cx q[129],q[130];
-rz(0.192143) q[130];
-cx q[129],q[130];
-rz(-1.4380623) q[131];
-rz(pi/2) q[132];
-sx q[132];
-rz(1.3881158) q[132];
-rz(pi/2) q[133];
-sx q[133];
-rz(1.9361573) q[133];
-cx q[132],q[133];
-rz(-0.18268048) q[133];
-cx q[132],q[133];
-rz(2.8761246) q[132];
-cx q[131],q[132];
-rz(-1.4380623) q[132];
-cx q[131],q[132];
-rz(1.6987193) q[133];
-rz(pi/2) q[134];
-sx q[134];
-rz(1.3945514) q[134];
-rz(pi/2) q[135];
-sx q[135];
-rz(1.9232862) q[135];
-cx q[134],q[135];
-rz(-0.17624495) q[135];
-cx q[134],q[135];
-rz(2.8857467) q[134];
-cx q[133],q[134];
-rz(1.6987193) q[134];
-cx q[133],q[134];
-rz(-0.58259414) q[135];
-rz(pi/2) q[136];
-sx q[136];
-rz(1.4651177) q[136];
-rz(pi/2) q[137];
-sx q[137];
-rz(1.7821535) q[137];
-cx q[136],q[137];
-rz(-0.10567858) q[137];
-cx q[136],q[137];
-rz(1.1651883) q[136];
-cx q[135],q[136];
-rz(-0.58259414) q[136];
-cx q[135],q[136];
-rz(1.439966) q[137];
-rz(pi/2) q[138];
-sx q[138];
-rz(1.7372864) q[138];
-rz(pi/2) q[139];
-sx q[139];
-rz(1.2378161) q[139];
-cx q[138],q[139];
-rz(0.16649009) q[139];
-cx q[138],q[139];
-rz(-2.879932) q[138];
-cx q[137],q[138];
-rz(1.439966) q[138];
-cx q[137],q[138];
-rz(1.1185118) q[139];
-rz(pi/2) q[140];
-sx q[140];
-rz(0.020178427) q[140];
-rz(pi/2) q[141];
-sx q[141];
-rz(-1.6111532) q[141];
-cx q[140],q[141];
-rz(-1.5506179) q[141];
-cx q[140],q[141];
-rz(-2.2370236) q[140];
-cx q[139],q[140];
-rz(1.1185118) q[140];
-cx q[139],q[140];
-rz(1.1270581) q[141];
-rz(pi/2) q[142];
-sx q[142];
-rz(1.674091) q[142];
-rz(pi/2) q[143];
-sx q[143];
-rz(1.364207) q[143];
-cx q[142],q[143];
-rz(0.10329466) q[143];
-cx q[142],q[143];
-rz(-2.2541162) q[142];
-cx q[141],q[142];
-rz(1.1270581) q[142];
-cx q[141],q[142];
-rz(-0.047153686) q[143];
-rz(pi/2) q[144];
-sx q[144];
-rz(-0.20212127) q[144];
-rz(pi/2) q[145];
-sx q[145];
-rz(-1.1665538) q[145];
-cx q[144],q[145];
-rz(-1.7729176) q[145];
-cx q[144],q[145];
-rz(0.094307372) q[144];
-cx q[143],q[144];
-rz(-0.047153686) q[144];
-cx q[143],q[144];
-rz(-1.7824366) q[145];
-rz(pi/2) q[146];
-sx q[146];
-rz(2.7683111) q[146];
-rz(pi/2) q[147];
-sx q[147];
-rz(-0.82423327) q[147];
-cx q[146],q[147];
-rz(1.1975148) q[147];
-cx q[146],q[147];
-rz(-2.7183121) q[146];
-cx q[145],q[146];
-rz(-1.7824366) q[146];
-cx q[145],q[146];
-rz(-1.2604616) q[147];
-rz(pi/2) q[148];
-sx q[148];
-rz(0.39240673) q[148];
-rz(pi/2) q[149];
-sx q[149];
-rz(-2.3556098) q[149];
-cx q[148],q[149];
-rz(-1.1783896) q[149];
-cx q[148],q[149];
-rz(2.5209232) q[148];
-cx q[147],q[148];
-rz(-1.2604616) q[148];
-cx q[147],q[148];
-rz(0.52547698) q[149];
-rz(pi/2) q[150];
-sx q[150];
-rz(2.8464474) q[150];
-rz(pi/2) q[151];
-sx q[151];
-rz(-0.98050587) q[151];
-cx q[150],q[151];
-rz(1.2756511) q[151];
-cx q[150],q[151];
-rz(-1.050954) q[150];
-cx q[149],q[150];
-rz(0.52547698) q[150];
-cx q[149],q[150];
-rz(0.59192617) q[151];
-rz(pi/2) q[152];
-sx q[152];
-rz(2.4509058) q[152];
-rz(pi/2) q[153];
-sx q[153];
-rz(-0.18942255) q[153];
-cx q[152],q[153];
-rz(0.88010944) q[153];
-cx q[152],q[153];
-rz(-1.1838523) q[152];
-cx q[151],q[152];
-rz(0.59192617) q[152];
-cx q[151],q[152];
-rz(-1.7735506) q[153];
-rz(pi/2) q[154];
-sx q[154];
-rz(0.72329696) q[154];
-rz(pi/2) q[155];
-sx q[155];
-rz(-3.0173902) q[155];
-cx q[154],q[155];
-rz(-0.84749937) q[155];
-cx q[154],q[155];
-rz(-2.7360841) q[154];
-cx q[153],q[154];
-rz(-1.7735506) q[154];
-cx q[153],q[154];
-rz(-0.048210143) q[155];
-rz(pi/2) q[156];
-sx q[156];
-rz(0.88028513) q[156];
-rz(pi/2) q[157];
-sx q[157];
-rz(2.9518187) q[157];
-cx q[156],q[157];
-rz(-0.6905112) q[157];
-cx q[156],q[157];
-rz(0.096420286) q[156];
-cx q[155],q[156];
-rz(-0.048210143) q[156];
-cx q[155],q[156];
-rz(-0.41287507) q[157];
-rz(pi/2) q[158];
-sx q[158];
-rz(-0.0086941732) q[158];
-rz(pi/2) q[159];
-sx q[159];
-rz(-1.553408) q[159];
-cx q[158],q[159];
-rz(-1.5794905) q[159];
-cx q[158],q[159];
-rz(0.82575014) q[158];
-cx q[157],q[158];
-rz(-0.41287507) q[158];
-cx q[157],q[158];
-rz(-0.043450507) q[159];
-rz(pi/2) q[160];
-sx q[160];
-rz(1.5952575) q[160];
-rz(pi/2) q[161];
-sx q[161];
-rz(1.521874) q[161];
-cx q[160],q[161];
-rz(0.024461154) q[161];
-cx q[160],q[161];
-rz(0.086901014) q[160];
-cx q[159],q[160];
-rz(-0.043450507) q[160];
-cx q[159],q[160];
-rz(-0.61089109) q[161];
-rz(pi/2) q[162];
-sx q[162];
-rz(1.8254368) q[162];
-rz(pi/2) q[163];
-sx q[163];
-rz(1.0615154) q[163];
-cx q[162],q[163];
-rz(0.25464045) q[163];
-cx q[162],q[163];
-rz(1.2217822) q[162];
-cx q[161],q[162];
-rz(-0.61089109) q[162];
-cx q[161],q[162];
-rz(0.96102708) q[163];
-rz(pi/2) q[164];
-sx q[164];
-rz(-0.26736737) q[164];
-rz(pi/2) q[165];
-sx q[165];
-rz(-1.0360616) q[165];
-cx q[164],q[165];
-rz(-1.8381637) q[165];
-cx q[164],q[165];
-rz(-1.9220542) q[164];
-cx q[163],q[164];
-rz(0.96102708) q[164];
-cx q[163],q[164];
-rz(-0.082034744) q[165];
-rz(pi/2) q[166];
-sx q[166];
-rz(2.3325827) q[166];
-rz(pi/2) q[167];
-sx q[167];
-rz(0.047223607) q[167];
-cx q[166],q[167];
-rz(0.76178636) q[167];
-cx q[166],q[167];
-rz(0.16406949) q[166];
-cx q[165],q[166];
-rz(-0.082034744) q[166];
-cx q[165],q[166];
-rz(1.883446) q[167];
-rz(pi/2) q[168];
-sx q[168];
-rz(0.23548003) q[168];
-rz(pi/2) q[169];
-sx q[169];
-rz(-2.0417564) q[169];
-cx q[168],q[169];
-rz(-1.3353163) q[169];
-cx q[168],q[169];
-rz(2.5162933) q[168];
-cx q[167],q[168];
-rz(1.883446) q[168];
-cx q[167],q[168];
-rz(1.6389801) q[169];
-rz(pi/2) q[170];
-sx q[170];
-rz(-0.39973827) q[170];
-rz(pi/2) q[171];
-sx q[171];
-rz(-0.77131978) q[171];
-cx q[170],q[171];
-rz(-1.9705346) q[171];
-cx q[170],q[171];
-rz(3.0052251) q[170];
-cx q[169],q[170];
-rz(1.6389801) q[170];
-cx q[169],q[170];
-rz(0.15946697) q[171];
-rz(pi/2) q[172];
-sx q[172];
-rz(0.88214598) q[172];
-rz(pi/2) q[173];
-sx q[173];
-rz(2.948097) q[173];
-cx q[172],q[173];
-rz(-0.68865035) q[173];
-cx q[172],q[173];
-rz(-0.31893394) q[172];
-cx q[171],q[172];
-rz(0.15946697) q[172];
-cx q[171],q[172];
-rz(1.0226221) q[173];
-rz(pi/2) q[174];
-sx q[174];
-rz(1.2110043) q[174];
-rz(pi/2) q[175];
-sx q[175];
-rz(2.2903803) q[175];
-cx q[174],q[175];
-rz(-0.359792) q[175];
-cx q[174],q[175];
-rz(-2.0452442) q[174];
-cx q[173],q[174];
-rz(1.0226221) q[174];
-cx q[173],q[174];
-rz(-1.1644835) q[175];
-rz(pi/2) q[176];
-sx q[176];
-rz(0.46787593) q[176];
-rz(pi/2) q[177];
-sx q[177];
-rz(-2.5065482) q[177];
-cx q[176],q[177];
-rz(-1.1029204) q[177];
-cx q[176],q[177];
-rz(2.328967) q[176];
-cx q[175],q[176];
-rz(-1.1644835) q[176];
-cx q[175],q[176];
-rz(1.2493607) q[177];
-rz(pi/2) q[178];
-sx q[178];
-rz(2.905092) q[178];
-rz(pi/2) q[179];
-sx q[179];
-rz(-1.0977951) q[179];
-cx q[178],q[179];
-rz(1.3342957) q[179];
-cx q[178],q[179];
-rz(-2.4987214) q[178];
-cx q[177],q[178];
-rz(1.2493607) q[178];
-cx q[177],q[178];
-rz(0.82256118) q[179];
-rz(pi/2) q[180];
-sx q[180];
-rz(0.64090191) q[180];
-rz(pi/2) q[181];
-sx q[181];
-rz(-2.8526001) q[181];
-cx q[180],q[181];
-rz(-0.92989442) q[181];
-cx q[180],q[181];
-rz(-1.6451224) q[180];
-cx q[179],q[180];
-rz(0.82256118) q[180];
-cx q[179],q[180];
-rz(-1.4689224) q[181];
-rz(pi/2) q[182];
-sx q[182];
-rz(1.825144) q[182];
-rz(pi/2) q[183];
-sx q[183];
-rz(1.062101) q[183];
-cx q[182],q[183];
-rz(0.25434764) q[183];
-cx q[182],q[183];
-rz(2.9378448) q[182];
-cx q[181],q[182];
-rz(-1.4689224) q[182];
-cx q[181],q[182];
-rz(1.4388777) q[183];
-rz(pi/2) q[184];
-sx q[184];
-rz(1.6802568) q[184];
-rz(pi/2) q[185];
-sx q[185];
-rz(1.3518754) q[185];
-cx q[184],q[185];
-rz(0.10946046) q[185];
-cx q[184],q[185];
-rz(-2.8777554) q[184];
-cx q[183],q[184];
-rz(1.4388777) q[184];
-cx q[183],q[184];
-rz(-0.77860842) q[185];
-rz(pi/2) q[186];
-sx q[186];
-rz(0.78751415) q[186];
-rz(pi/2) q[187];
-sx q[187];
-rz(3.1373607) q[187];
-cx q[186],q[187];
-rz(-0.78328218) q[187];
-cx q[186],q[187];
-rz(1.5572168) q[186];
-cx q[185],q[186];
-rz(-0.77860842) q[186];
-cx q[185],q[186];
-rz(0.7606565) q[187];
-rz(pi/2) q[188];
-sx q[188];
-rz(1.9732368) q[188];
-rz(pi/2) q[189];
-sx q[189];
-rz(0.76591529) q[189];
-cx q[188],q[189];
-rz(0.40244052) q[189];
-cx q[188],q[189];
-rz(-1.521313) q[188];
-cx q[187],q[188];
-rz(0.7606565) q[188];
-cx q[187],q[188];
-rz(0.23007785) q[189];
-rz(pi/2) q[190];
-sx q[190];
-rz(0.43128723) q[190];
-rz(pi/2) q[191];
-sx q[191];
-rz(-2.4333708) q[191];
-cx q[190],q[191];
-rz(-1.1395091) q[191];
-cx q[190],q[191];
-rz(-0.4601557) q[190];
-cx q[189],q[190];
-rz(0.23007785) q[190];
-cx q[189],q[190];
-rz(-1.8939681) q[191];
-rz(pi/2) q[192];
-sx q[192];
-rz(-0.14947087) q[192];
-rz(pi/2) q[193];
-sx q[193];
-rz(-1.2718546) q[193];
-cx q[192],q[193];
-rz(-1.7202672) q[193];
-cx q[192],q[193];
-rz(-2.4952491) q[192];
-cx q[191],q[192];
-rz(-1.8939681) q[192];
-cx q[191],q[192];
-rz(-0.94383604) q[193];
-rz(pi/2) q[194];
-sx q[194];
-rz(0.97860092) q[194];
-rz(pi/2) q[195];
-sx q[195];
-rz(2.7551871) q[195];
-cx q[194],q[195];
-rz(-0.59219541) q[195];
-cx q[194],q[195];
-rz(1.8876721) q[194];
-cx q[193],q[194];
-rz(-0.94383604) q[194];
-cx q[193],q[194];
-rz(-0.99777733) q[195];
-rz(pi/2) q[196];
-sx q[196];
-rz(-2.9594222) q[196];
-rz(pi/2) q[197];
-sx q[197];
-rz(-1.9351373) q[197];
-cx q[196],q[197];
-rz(1.7529668) q[197];
-cx q[196],q[197];
-rz(1.9955547) q[196];
-cx q[195],q[196];
-rz(-0.99777733) q[196];
-cx q[195],q[196];
-rz(0.94425919) q[197];
-rz(pi/2) q[198];
-sx q[198];
-rz(-0.35559667) q[198];
-rz(pi/2) q[199];
-sx q[199];
-rz(-0.85960298) q[199];
-cx q[198],q[199];
-rz(-1.926393) q[199];
-cx q[198],q[199];
-rz(-1.8885184) q[198];
-cx q[197],q[198];
-rz(0.94425919) q[198];
-cx q[197],q[198];
-rz(-1.7813741) q[199];
-rz(pi/2) q[200];
-sx q[200];
-rz(0.37342273) q[200];
-rz(pi/2) q[201];
-sx q[201];
-rz(-2.3176418) q[201];
-cx q[200],q[201];
-rz(-1.1973736) q[201];
-cx q[200],q[201];
-rz(-2.7204371) q[200];
-cx q[199],q[200];
-rz(-1.7813741) q[200];
-cx q[199],q[200];
-rz(-1.7497616) q[201];
-rz(pi/2) q[202];
-sx q[202];
-rz(2.7568507) q[202];
-rz(pi/2) q[203];
-sx q[203];
-rz(-0.80131247) q[203];
-cx q[202],q[203];
-rz(1.1860544) q[203];
-cx q[202],q[203];
-rz(-2.7836621) q[202];
-cx q[201],q[202];
-rz(-1.7497616) q[202];
-cx q[201],q[202];
-rz(-1.4800042) q[203];
-rz(pi/2) q[204];
-sx q[204];
-rz(-0.19319757) q[204];
-rz(pi/2) q[205];
-sx q[205];
-rz(-1.1844012) q[205];
-cx q[204],q[205];
-rz(-1.7639939) q[205];
-cx q[204],q[205];
-rz(2.9600084) q[204];
-cx q[203],q[204];
-rz(-1.4800042) q[204];
-cx q[203],q[204];
-rz(-0.88513373) q[205];
-rz(pi/2) q[206];
-sx q[206];
-rz(1.453396) q[206];
-rz(pi/2) q[207];
-sx q[207];
-rz(1.8055969) q[207];
-cx q[206],q[207];
-rz(-0.11740031) q[207];
-cx q[206],q[207];
-rz(1.7702675) q[206];
-cx q[205],q[206];
-rz(-0.88513373) q[206];
-cx q[205],q[206];
-rz(0.69609009) q[207];
-rz(pi/2) q[208];
-sx q[208];
-rz(0.82101418) q[208];
-rz(pi/2) q[209];
-sx q[209];
-rz(3.0703606) q[209];
-cx q[208],q[209];
-rz(-0.74978215) q[209];
-cx q[208],q[209];
-rz(-1.3921802) q[208];
-cx q[207],q[208];
-rz(0.69609009) q[208];
-cx q[207],q[208];
-rz(0.37336874) q[209];
-rz(pi/2) q[210];
-sx q[210];
-rz(1.8769747) q[210];
-rz(pi/2) q[211];
-sx q[211];
-rz(0.95843957) q[211];
-cx q[210],q[211];
-rz(0.30617838) q[211];
-cx q[210],q[211];
-rz(-0.74673748) q[210];
-cx q[209],q[210];
-rz(0.37336874) q[210];
-cx q[209],q[210];
-rz(0.22015843) q[211];
-rz(pi/2) q[212];
-sx q[212];
-rz(1.7853489) q[212];
-rz(pi/2) q[213];
-sx q[213];
-rz(1.1416911) q[213];
-cx q[212],q[213];
-rz(0.2145526) q[213];
-cx q[212],q[213];
-rz(-0.44031686) q[212];
-cx q[211],q[212];
-rz(0.22015843) q[212];
-cx q[211],q[212];
-rz(-0.2605847) q[213];
-rz(pi/2) q[214];
-sx q[214];
-rz(2.4495582) q[214];
-rz(pi/2) q[215];
-sx q[215];
-rz(-0.18672735) q[215];
-cx q[214],q[215];
-rz(0.87876184) q[215];
-cx q[214],q[215];
-rz(0.5211694) q[214];
-cx q[213],q[214];
-rz(-0.2605847) q[214];
-cx q[213],q[214];
-rz(1.4802007) q[215];
-rz(pi/2) q[216];
-sx q[216];
-rz(2.1190527) q[216];
-rz(pi/2) q[217];
-sx q[217];
-rz(0.47428349) q[217];
-cx q[216],q[217];
-rz(0.54825642) q[217];
-cx q[216],q[217];
-rz(-2.9604014) q[216];
-cx q[215],q[216];
-rz(1.4802007) q[216];
-cx q[215],q[216];
-rz(1.9339174) q[217];
-rz(pi/2) q[218];
-sx q[218];
-rz(0.56971943) q[218];
-rz(pi/2) q[219];
-sx q[219];
-rz(-2.7102352) q[219];
-cx q[218],q[219];
-rz(-1.0010769) q[219];
-cx q[218],q[219];
-rz(2.4153505) q[218];
-cx q[217],q[218];
-rz(1.9339174) q[218];
-cx q[217],q[218];
-rz(-0.34078049) q[219];
-rz(pi/2) q[220];
-sx q[220];
-rz(2.9117529) q[220];
-rz(pi/2) q[221];
-sx q[221];
-rz(-1.1111169) q[221];
-cx q[220],q[221];
-rz(1.3409566) q[221];
-cx q[220],q[221];
-rz(0.68156098) q[220];
-cx q[219],q[220];
-rz(-0.34078049) q[220];
-cx q[219],q[220];
-rz(1.4851153) q[221];
-rz(pi/2) q[222];
-sx q[222];
-rz(2.2735396) q[222];
-rz(pi/2) q[223];
-sx q[223];
-rz(0.16530975) q[223];
-cx q[222],q[223];
-rz(0.70274329) q[223];
-cx q[222],q[223];
-rz(-2.9702306) q[222];
-cx q[221],q[222];
-rz(1.4851153) q[222];
-cx q[221],q[222];
-rz(-0.37190474) q[223];
-rz(pi/2) q[224];
-sx q[224];
-rz(-0.41349107) q[224];
-rz(pi/2) q[225];
-sx q[225];
-rz(-0.74381418) q[225];
-cx q[224],q[225];
-rz(-1.9842874) q[225];
-cx q[224],q[225];
-rz(0.74380948) q[224];
-cx q[223],q[224];
-rz(-0.37190474) q[224];
-cx q[223],q[224];
-rz(1.6982035) q[225];
-rz(pi/2) q[226];
-sx q[226];
-rz(2.3700262) q[226];
-rz(pi/2) q[227];
-sx q[227];
-rz(-0.027663453) q[227];
-cx q[226],q[227];
-rz(0.79922989) q[227];
-cx q[226],q[227];
-rz(2.8867783) q[226];
-cx q[225],q[226];
-rz(1.6982035) q[226];
-cx q[225],q[226];
-rz(-1.9293349) q[227];
-rz(pi/2) q[228];
-sx q[228];
-rz(-2.9125182) q[228];
-rz(pi/2) q[229];
-sx q[229];
-rz(-2.0289453) q[229];
-cx q[228],q[229];
-rz(1.7998708) q[229];
-cx q[228],q[229];
-rz(-2.4245155) q[228];
-cx q[227],q[228];
-rz(-1.9293349) q[228];
-cx q[227],q[228];
-rz(-0.036300806) q[229];
-rz(pi/2) q[230];
-sx q[230];
-rz(1.5644373) q[230];
-rz(pi/2) q[231];
-sx q[231];
-rz(1.5835143) q[231];
-cx q[230],q[231];
-rz(-0.0063589807) q[231];
-cx q[230],q[231];
-rz(0.072601612) q[230];
-cx q[229],q[230];
-rz(-0.036300806) q[230];
-cx q[229],q[230];
-rz(-1.2371119) q[231];
-rz(pi/2) q[232];
-sx q[232];
-rz(2.1243577) q[232];
-rz(pi/2) q[233];
-sx q[233];
-rz(0.46367359) q[233];
-cx q[232],q[233];
-rz(0.55356137) q[233];
-cx q[232],q[233];
-rz(2.4742238) q[232];
-cx q[231],q[232];
-rz(-1.2371119) q[232];
-cx q[231],q[232];
-rz(-1.0415018) q[233];
-rz(pi/2) q[234];
-sx q[234];
-rz(0.58383346) q[234];
-rz(pi/2) q[235];
-sx q[235];
-rz(-2.7384632) q[235];
-cx q[234],q[235];
-rz(-0.98696287) q[235];
-cx q[234],q[235];
-rz(2.0830036) q[234];
-cx q[233],q[234];
-rz(-1.0415018) q[234];
-cx q[233],q[234];
-rz(-0.11659851) q[235];
-rz(pi/2) q[236];
-sx q[236];
-rz(0.024208627) q[236];
-rz(pi/2) q[237];
-sx q[237];
-rz(-1.6192136) q[237];
-cx q[236],q[237];
-rz(-1.5465877) q[237];
-cx q[236],q[237];
-rz(0.23319702) q[236];
-cx q[235],q[236];
-rz(-0.11659851) q[236];
-cx q[235],q[236];
-rz(0.89636887) q[237];
-rz(pi/2) q[238];
-sx q[238];
-rz(2.8808637) q[238];
-rz(pi/2) q[239];
-sx q[239];
-rz(-1.0493385) q[239];
-cx q[238],q[239];
-rz(1.3100674) q[239];
-cx q[238],q[239];
-rz(-1.7927377) q[238];
-cx q[237],q[238];
-rz(0.89636887) q[238];
-cx q[237],q[238];
-rz(-0.11577424) q[239];
-rz(pi/2) q[240];
-sx q[240];
-rz(0.94091909) q[240];
-rz(pi/2) q[241];
-sx q[241];
-rz(2.8305508) q[241];
-cx q[240],q[241];
-rz(-0.62987724) q[241];
-cx q[240],q[241];
-rz(0.23154848) q[240];
-cx q[239],q[240];
-rz(-0.11577424) q[240];
-cx q[239],q[240];
-rz(0.31685288) q[241];
-rz(pi/2) q[242];
-sx q[242];
-rz(1.9273783) q[242];
-rz(pi/2) q[243];
-sx q[243];
-rz(0.85763231) q[243];
-cx q[242],q[243];
-rz(0.35658201) q[243];
-cx q[242],q[243];
-rz(-0.63370576) q[242];
-cx q[241],q[242];
-rz(0.31685288) q[242];
-cx q[241],q[242];
-rz(0.95582176) q[243];
-rz(pi/2) q[244];
-sx q[244];
-rz(1.2164524) q[244];
-rz(pi/2) q[245];
-sx q[245];
-rz(2.2794841) q[245];
-cx q[244],q[245];
-rz(-0.3543439) q[245];
-cx q[244],q[245];
-rz(-1.9116435) q[244];
-cx q[243],q[244];
-rz(0.95582176) q[244];
-cx q[243],q[244];
-rz(0.093807266) q[245];
-rz(pi/2) q[246];
-sx q[246];
-rz(2.8770185) q[246];
-rz(pi/2) q[247];
-sx q[247];
-rz(-1.0416481) q[247];
-cx q[246],q[247];
-rz(1.3062222) q[247];
-cx q[246],q[247];
-rz(-0.18761453) q[246];
-cx q[245],q[246];
-rz(0.093807266) q[246];
-cx q[245],q[246];
-rz(-1.6964935) q[247];
-rz(pi/2) q[248];
-sx q[248];
-rz(0.14840973) q[248];
-rz(pi/2) q[249];
-sx q[249];
-rz(-1.8676158) q[249];
-cx q[248],q[249];
-rz(-1.4223866) q[249];
-cx q[248],q[249];
-rz(-2.8901983) q[248];
-cx q[247],q[248];
-rz(-1.6964935) q[248];
-cx q[247],q[248];
-rz(1.2865183) q[249];
-rz(pi/2) q[250];
-sx q[250];
-rz(0.79462845) q[250];
-rz(pi/2) q[251];
-sx q[251];
-rz(3.1231321) q[251];
-cx q[250],q[251];
-rz(-0.77616788) q[251];
-cx q[250],q[251];
-rz(-2.5730366) q[250];
-cx q[249],q[250];
-rz(1.2865183) q[250];
-cx q[249],q[250];
-rz(1.4468703) q[251];
-rz(pi/2) q[252];
-sx q[252];
-rz(2.681564) q[252];
-rz(pi/2) q[253];
-sx q[253];
-rz(-0.65073907) q[253];
-cx q[252],q[253];
-rz(1.1107677) q[253];
-cx q[252],q[253];
-rz(-2.8937406) q[252];
-cx q[251],q[252];
-rz(1.4468703) q[252];
-cx q[251],q[252];
-rz(1.6197394) q[253];
-rz(pi/2) q[254];
-sx q[254];
-rz(1.4247177) q[254];
-rz(pi/2) q[255];
-sx q[255];
-rz(1.8629536) q[255];
-cx q[254],q[255];
-rz(-0.14607863) q[255];
-cx q[254],q[255];
-rz(3.0437065) q[254];
-cx q[253],q[254];
-rz(1.6197394) q[254];
-cx q[253],q[254];
-rz(1.5770713) q[255];
-rz(pi/2) q[256];
-sx q[256];
-rz(2.805246) q[256];
-rz(pi/2) q[257];
-sx q[257];
-rz(-0.89810307) q[257];
-cx q[256],q[257];
-rz(1.2344497) q[257];
-cx q[256],q[257];
-rz(3.1290427) q[256];
-cx q[255],q[256];
-rz(1.5770713) q[256];
-cx q[255],q[256];
-rz(1.040756) q[257];
-rz(pi/2) q[258];
-sx q[258];
-rz(0.61131954) q[258];
-rz(pi/2) q[259];
-sx q[259];
-rz(-2.7934354) q[259];
-cx q[258],q[259];
-rz(-0.95947679) q[259];
-cx q[258],q[259];
-rz(-2.081512) q[258];
-cx q[257],q[258];
-rz(1.040756) q[258];
-cx q[257],q[258];
-rz(-1.5921404) q[259];
-rz(pi/2) q[260];
-sx q[260];
-rz(1.3143287) q[260];
-rz(pi/2) q[261];
-sx q[261];
-rz(2.0837316) q[261];
-cx q[260],q[261];
-rz(-0.25646763) q[261];
-cx q[260],q[261];
-rz(-3.0989045) q[260];
-cx q[259],q[260];
-rz(-1.5921404) q[260];
-cx q[259],q[260];
-rz(-0.93515789) q[261];
-rz(pi/2) q[262];
-sx q[262];
-rz(1.1704909) q[262];
-rz(pi/2) q[263];
-sx q[263];
-rz(2.3714072) q[263];
-cx q[262],q[263];
-rz(-0.40030545) q[263];
-cx q[262],q[263];
-rz(1.8703158) q[262];
-cx q[261],q[262];
-rz(-0.93515789) q[262];
-cx q[261],q[262];
-rz(0.0049940372) q[263];
-rz(pi/2) q[264];
-sx q[264];
-rz(1.7243393) q[264];
-rz(pi/2) q[265];
-sx q[265];
-rz(1.2637103) q[265];
-cx q[264],q[265];
-rz(0.153543) q[265];
-cx q[264],q[265];
-rz(-0.0099880744) q[264];
-cx q[263],q[264];
-rz(0.0049940372) q[264];
-cx q[263],q[264];
-rz(0.68442263) q[265];
-rz(pi/2) q[266];
-sx q[266];
-rz(1.4014308) q[266];
-rz(pi/2) q[267];
-sx q[267];
-rz(1.9095274) q[267];
-cx q[266],q[267];
-rz(-0.16936555) q[267];
-cx q[266],q[267];
-rz(-1.3688453) q[266];
-cx q[265],q[266];
-rz(0.68442263) q[266];
-cx q[265],q[266];
-rz(1.1543916) q[267];
-rz(pi/2) q[268];
-sx q[268];
-rz(2.2692587) q[268];
-rz(pi/2) q[269];
-sx q[269];
-rz(0.17387155) q[269];
-cx q[268],q[269];
-rz(0.69846239) q[269];
-cx q[268],q[269];
-rz(-2.3087832) q[268];
-cx q[267],q[268];
-rz(1.1543916) q[268];
-cx q[267],q[268];
-rz(-1.8350512) q[269];
-rz(pi/2) q[270];
-sx q[270];
-rz(-0.31866217) q[270];
-rz(pi/2) q[271];
-sx q[271];
-rz(-0.93347198) q[271];
-cx q[270],q[271];
-rz(-1.8894585) q[271];
-cx q[270],q[271];
-rz(-2.6130829) q[270];
-cx q[269],q[270];
-rz(-1.8350512) q[270];
-cx q[269],q[270];
-rz(-1.6051296) q[271];
-rz(pi/2) q[272];
-sx q[272];
-rz(0.11384023) q[272];
-rz(pi/2) q[273];
-sx q[273];
-rz(-1.7984768) q[273];
-cx q[272],q[273];
-rz(-1.4569561) q[273];
-cx q[272],q[273];
-rz(-3.0729261) q[272];
-cx q[271],q[272];
-rz(-1.6051296) q[272];
-cx q[271],q[272];
-rz(1.1773867) q[273];
-rz(pi/2) q[274];
-sx q[274];
-rz(-0.26017647) q[274];
-rz(pi/2) q[275];
-sx q[275];
-rz(-1.0504434) q[275];
-cx q[274],q[275];
-rz(-1.8309728) q[275];
-cx q[274],q[275];
-rz(-2.3547734) q[274];
-cx q[273],q[274];
-rz(1.1773867) q[274];
-cx q[273],q[274];
-rz(-0.92708571) q[275];
-rz(pi/2) q[276];
-sx q[276];
-rz(0.23487943) q[276];
-rz(pi/2) q[277];
-sx q[277];
-rz(-2.0405552) q[277];
-cx q[276],q[277];
-rz(-1.3359169) q[277];
-cx q[276],q[277];
-rz(1.8541714) q[276];
-cx q[275],q[276];
-rz(-0.92708571) q[276];
-cx q[275],q[276];
-rz(0.73417003) q[277];
-rz(pi/2) q[278];
-sx q[278];
-rz(2.491443) q[278];
-rz(pi/2) q[279];
-sx q[279];
-rz(-0.27049695) q[279];
-cx q[278],q[279];
-rz(0.92064664) q[279];
-cx q[278],q[279];
-rz(-1.4683401) q[278];
-cx q[277],q[278];
-rz(0.73417003) q[278];
-cx q[277],q[278];
-rz(1.787265) q[279];
-rz(pi/2) q[280];
-sx q[280];
-rz(2.787469) q[280];
-rz(pi/2) q[281];
-sx q[281];
-rz(-0.86254907) q[281];
-cx q[280],q[281];
-rz(1.2166727) q[281];
-cx q[280],q[281];
-rz(2.7086553) q[280];
-cx q[279],q[280];
-rz(1.787265) q[280];
-cx q[279],q[280];
-rz(1.2389505) q[281];
-rz(pi/2) q[282];
-sx q[282];
-rz(0.16282313) q[282];
-rz(pi/2) q[283];
-sx q[283];
-rz(-1.8964426) q[283];
-cx q[282],q[283];
-rz(-1.4079732) q[283];
-cx q[282],q[283];
-rz(-2.477901) q[282];
-cx q[281],q[282];
-rz(1.2389505) q[282];
-cx q[281],q[282];
-rz(1.5115086) q[283];
-rz(pi/2) q[284];
-sx q[284];
-rz(-3.0755806) q[284];
-rz(pi/2) q[285];
-sx q[285];
-rz(-1.7028205) q[285];
-cx q[284],q[285];
-rz(1.6368084) q[285];
-cx q[284],q[285];
-rz(-3.0230172) q[284];
-cx q[283],q[284];
-rz(1.5115086) q[284];
-cx q[283],q[284];
-rz(-1.5007035) q[285];
-rz(pi/2) q[286];
-sx q[286];
-rz(2.8584671) q[286];
-rz(pi/2) q[287];
-sx q[287];
-rz(-1.0045453) q[287];
-cx q[286],q[287];
-rz(1.2876708) q[287];
-cx q[286],q[287];
-rz(3.001407) q[286];
-cx q[285],q[286];
-rz(-1.5007035) q[286];
-cx q[285],q[286];
-rz(0.87387592) q[287];
-rz(pi/2) q[288];
-sx q[288];
-rz(1.4472496) q[288];
-rz(pi/2) q[289];
-sx q[289];
-rz(1.8178898) q[289];
-cx q[288],q[289];
-rz(-0.12354676) q[289];
-cx q[288],q[289];
-rz(-1.7477518) q[288];
-cx q[287],q[288];
-rz(0.87387592) q[288];
-cx q[287],q[288];
-rz(1.4064097) q[289];
-rz(pi/2) q[290];
-sx q[290];
-rz(1.7191816) q[290];
-rz(pi/2) q[291];
-sx q[291];
-rz(1.2740259) q[291];
-cx q[290],q[291];
-rz(0.14838523) q[291];
-cx q[290],q[291];
-rz(-2.8128194) q[290];
-cx q[289],q[290];
-rz(1.4064097) q[290];
-cx q[289],q[290];
-rz(1.0788069) q[291];
-rz(pi/2) q[292];
-sx q[292];
-rz(0.54782333) q[292];
-rz(pi/2) q[293];
-sx q[293];
-rz(-2.666443) q[293];
-cx q[292],q[293];
-rz(-1.022973) q[293];
-cx q[292],q[293];
-rz(-2.1576138) q[292];
-cx q[291],q[292];
-rz(1.0788069) q[292];
-cx q[291],q[292];
-rz(-0.51326939) q[293];
-rz(pi/2) q[294];
-sx q[294];
-rz(1.4532723) q[294];
-rz(pi/2) q[295];
-sx q[295];
-rz(1.8058444) q[295];
-cx q[294],q[295];
-rz(-0.11752405) q[295];
-cx q[294],q[295];
-rz(1.0265388) q[294];
-cx q[293],q[294];
-rz(-0.51326939) q[294];
-cx q[293],q[294];
-rz(-1.5065262) q[295];
-rz(pi/2) q[296];
-sx q[296];
-rz(2.3639145) q[296];
-rz(pi/2) q[297];
-sx q[297];
-rz(-0.015440073) q[297];
-cx q[296],q[297];
-rz(0.7931182) q[297];
-cx q[296],q[297];
-rz(3.0130524) q[296];
-cx q[295],q[296];
-rz(-1.5065262) q[296];
-cx q[295],q[296];
-rz(0.62264786) q[297];
-rz(pi/2) q[298];
-sx q[298];
-rz(0.21932453) q[298];
-rz(pi/2) q[299];
-sx q[299];
-rz(-2.0094454) q[299];
-cx q[298],q[299];
-rz(-1.3514718) q[299];
-cx q[298],q[299];
-rz(-1.2452957) q[298];
-cx q[297],q[298];
-rz(0.62264786) q[298];
-cx q[297],q[298];
-rz(-0.76331051) q[299];
-rz(pi/2) q[300];
-sx q[300];
-rz(0.47704293) q[300];
-rz(pi/2) q[301];
-sx q[301];
-rz(-2.5248822) q[301];
-cx q[300],q[301];
-rz(-1.0937534) q[301];
-cx q[300],q[301];
-rz(1.526621) q[300];
-cx q[299],q[300];
-rz(-0.76331051) q[300];
-cx q[299],q[300];
-rz(0.46584075) q[301];
-rz(pi/2) q[302];
-sx q[302];
-rz(2.4603776) q[302];
-rz(pi/2) q[303];
-sx q[303];
-rz(-0.20836621) q[303];
-cx q[302],q[303];
-rz(0.88958127) q[303];
-cx q[302],q[303];
-rz(-0.9316815) q[302];
-cx q[301],q[302];
-rz(0.46584075) q[302];
-cx q[301],q[302];
-rz(1.3603814) q[303];
-rz(pi/2) q[304];
-sx q[304];
-rz(2.186126) q[304];
-rz(pi/2) q[305];
-sx q[305];
-rz(0.34013701) q[305];
-cx q[304],q[305];
-rz(0.61532966) q[305];
-cx q[304],q[305];
-rz(-2.7207628) q[304];
-cx q[303],q[304];
-rz(1.3603814) q[304];
-cx q[303],q[304];
-rz(0.11999587) q[305];
-rz(pi/2) q[306];
-sx q[306];
-rz(-3.0879616) q[306];
-rz(pi/2) q[307];
-sx q[307];
-rz(-1.6780585) q[307];
-cx q[306],q[307];
-rz(1.6244274) q[307];
-cx q[306],q[307];
-rz(-0.23999174) q[306];
-cx q[305],q[306];
-rz(0.11999587) q[306];
-cx q[305],q[306];
-rz(-0.40962271) q[307];
-rz(pi/2) q[308];
-sx q[308];
-rz(1.3172945) q[308];
-rz(pi/2) q[309];
-sx q[309];
-rz(2.0777999) q[309];
-cx q[308],q[309];
-rz(-0.2535018) q[309];
-cx q[308],q[309];
-rz(0.81924542) q[308];
-cx q[307],q[308];
-rz(-0.40962271) q[308];
-cx q[307],q[308];
-rz(-1.3233647) q[309];
-rz(pi/2) q[310];
-sx q[310];
-rz(-0.13068657) q[310];
-rz(pi/2) q[311];
-sx q[311];
-rz(-1.3094232) q[311];
-cx q[310],q[311];
-rz(-1.7014829) q[311];
-cx q[310],q[311];
-rz(2.6467294) q[310];
-cx q[309],q[310];
-rz(-1.3233647) q[310];
-cx q[309],q[310];
-rz(-1.216143) q[311];
-rz(pi/2) q[312];
-sx q[312];
-rz(-2.9679498) q[312];
-rz(pi/2) q[313];
-sx q[313];
-rz(-1.9180821) q[313];
-cx q[312],q[313];
-rz(1.7444392) q[313];
-cx q[312],q[313];
-rz(2.432286) q[312];
-cx q[311],q[312];
-rz(-1.216143) q[312];
-cx q[311],q[312];
-rz(0.25460229) q[313];
-rz(pi/2) q[314];
-sx q[314];
-rz(1.3070536) q[314];
-rz(pi/2) q[315];
-sx q[315];
-rz(2.0982818) q[315];
-cx q[314],q[315];
-rz(-0.26374276) q[315];
-cx q[314],q[315];
-rz(-0.50920458) q[314];
-cx q[313],q[314];
-rz(0.25460229) q[314];
-cx q[313],q[314];
-rz(-0.87246628) q[315];
-rz(pi/2) q[316];
-sx q[316];
-rz(1.0302639) q[316];
-rz(pi/2) q[317];
-sx q[317];
-rz(2.6518612) q[317];
-cx q[316],q[317];
-rz(-0.54053246) q[317];
-cx q[316],q[317];
-rz(1.7449326) q[316];
-cx q[315],q[316];
-rz(-0.87246628) q[316];
-cx q[315],q[316];
-rz(0.10933932) q[317];
-rz(pi/2) q[318];
-sx q[318];
-rz(0.90569232) q[318];
-rz(pi/2) q[319];
-sx q[319];
-rz(2.9010043) q[319];
-cx q[318],q[319];
-rz(-0.66510401) q[319];
-cx q[318],q[319];
-rz(-0.21867864) q[318];
-cx q[317],q[318];
-rz(0.10933932) q[318];
-cx q[317],q[318];
-rz(0.89953205) q[319];
-rz(pi/2) q[320];
-sx q[320];
-rz(0.17641393) q[320];
-rz(pi/2) q[321];
-sx q[321];
-rz(-1.9236242) q[321];
-cx q[320],q[321];
-rz(-1.3943824) q[321];
-cx q[320],q[321];
-rz(-1.7990641) q[320];
-cx q[319],q[320];
-rz(0.89953205) q[320];
-cx q[319],q[320];
-rz(-1.2312721) q[321];
-rz(pi/2) q[322];
-sx q[322];
-rz(0.86147414) q[322];
-rz(pi/2) q[323];
-sx q[323];
-rz(2.9894407) q[323];
-cx q[322],q[323];
-rz(-0.70932219) q[323];
-cx q[322],q[323];
-rz(2.4625442) q[322];
-cx q[321],q[322];
-rz(-1.2312721) q[322];
-cx q[321],q[322];
-rz(-0.28339958) q[323];
-rz(pi/2) q[324];
-sx q[324];
-rz(1.5094023) q[324];
-rz(pi/2) q[325];
-sx q[325];
-rz(1.6935844) q[325];
-cx q[324],q[325];
-rz(-0.061394025) q[325];
-cx q[324],q[325];
-rz(0.56679916) q[324];
-cx q[323],q[324];
-rz(-0.28339958) q[324];
-cx q[323],q[324];
-rz(-1.28294) q[325];
-rz(pi/2) q[326];
-sx q[326];
-rz(2.9567591) q[326];
-rz(pi/2) q[327];
-sx q[327];
-rz(-1.2011293) q[327];
-cx q[326],q[327];
-rz(1.3859628) q[327];
-cx q[326],q[327];
-rz(2.56588) q[326];
-cx q[325],q[326];
-rz(-1.28294) q[326];
-cx q[325],q[326];
-rz(-0.0053381011) q[327];
-rz(pi/2) q[328];
-sx q[328];
-rz(-3.1326728) q[328];
-rz(pi/2) q[329];
-sx q[329];
-rz(-1.5886361) q[329];
-cx q[328],q[329];
-rz(1.5797162) q[329];
-cx q[328],q[329];
-rz(0.010676202) q[328];
-cx q[327],q[328];
-rz(-0.0053381011) q[328];
-cx q[327],q[328];
-rz(1.7674385) q[329];
-rz(pi/2) q[330];
-sx q[330];
-rz(0.81595101) q[330];
-rz(pi/2) q[331];
-sx q[331];
-rz(3.080487) q[331];
-cx q[330],q[331];
-rz(-0.75484532) q[331];
-cx q[330],q[331];
-rz(2.7483083) q[330];
-cx q[329],q[330];
-rz(1.7674385) q[330];
-cx q[329],q[330];
-rz(-1.7374591) q[331];
-rz(pi/2) q[332];
-sx q[332];
-rz(1.447212) q[332];
-rz(pi/2) q[333];
-sx q[333];
-rz(1.817965) q[333];
-cx q[332],q[333];
-rz(-0.12358433) q[333];
-cx q[332],q[333];
-rz(-2.8082671) q[332];
-cx q[331],q[332];
-rz(-1.7374591) q[332];
-cx q[331],q[332];
-rz(1.4162824) q[333];
-rz(pi/2) q[334];
-sx q[334];
-rz(-0.19087517) q[334];
-rz(pi/2) q[335];
-sx q[335];
-rz(-1.189046) q[335];
-cx q[334],q[335];
-rz(-1.7616715) q[335];
-cx q[334],q[335];
-rz(-2.8325648) q[334];
-cx q[333],q[334];
-rz(1.4162824) q[334];
-cx q[333],q[334];
-rz(-1.3379557) q[335];
-rz(pi/2) q[336];
-sx q[336];
-rz(0.38890913) q[336];
-rz(pi/2) q[337];
-sx q[337];
-rz(-2.3486146) q[337];
-cx q[336],q[337];
-rz(-1.1818872) q[337];
-cx q[336],q[337];
-rz(2.6759114) q[336];
-cx q[335],q[336];
-rz(-1.3379557) q[336];
-cx q[335],q[336];
-rz(-1.6246723) q[337];
-rz(pi/2) q[338];
-sx q[338];
-rz(0.31182703) q[338];
-rz(pi/2) q[339];
-sx q[339];
-rz(-2.1944504) q[339];
-cx q[338],q[339];
-rz(-1.2589693) q[339];
-cx q[338],q[339];
-rz(-3.0338407) q[338];
-cx q[337],q[338];
-rz(-1.6246723) q[338];
-cx q[337],q[338];
-rz(-1.520751) q[339];
-rz(pi/2) q[340];
-sx q[340];
-rz(0.9127486) q[340];
-rz(pi/2) q[341];
-sx q[341];
-rz(2.8868918) q[341];
-cx q[340],q[341];
-rz(-0.65804773) q[341];
-cx q[340],q[341];
-rz(3.041502) q[340];
-cx q[339],q[340];
-rz(-1.520751) q[340];
-cx q[339],q[340];
-rz(0.51578758) q[341];
-rz(pi/2) q[342];
-sx q[342];
-rz(0.86178771) q[342];
-rz(pi/2) q[343];
-sx q[343];
-rz(2.9888136) q[343];
-cx q[342],q[343];
-rz(-0.70900862) q[343];
-cx q[342],q[343];
-rz(-1.0315752) q[342];
-cx q[341],q[342];
-rz(0.51578758) q[342];
-cx q[341],q[342];
-rz(0.05867336) q[343];
-rz(pi/2) q[344];
-sx q[344];
-rz(1.2113603) q[344];
-rz(pi/2) q[345];
-sx q[345];
-rz(2.2896684) q[345];
-cx q[344],q[345];
-rz(-0.35943606) q[345];
-cx q[344],q[345];
-rz(-0.11734672) q[344];
-cx q[343],q[344];
-rz(0.05867336) q[344];
-cx q[343],q[344];
-rz(1.3571731) q[345];
-rz(pi/2) q[346];
-sx q[346];
-rz(1.9598976) q[346];
-rz(pi/2) q[347];
-sx q[347];
-rz(0.79259383) q[347];
-cx q[346],q[347];
-rz(0.38910125) q[347];
-cx q[346],q[347];
-rz(-2.7143462) q[346];
-cx q[345],q[346];
-rz(1.3571731) q[346];
-cx q[345],q[346];
-rz(-1.2107105) q[347];
-rz(pi/2) q[348];
-sx q[348];
-rz(-3.1308258) q[348];
-rz(pi/2) q[349];
-sx q[349];
-rz(-1.5923301) q[349];
-cx q[348],q[349];
-rz(1.5815632) q[349];
-cx q[348],q[349];
-rz(2.421421) q[348];
-cx q[347],q[348];
-rz(-1.2107105) q[348];
-cx q[347],q[348];
-rz(1.5900073) q[349];
-rz(pi/2) q[350];
-sx q[350];
-rz(1.8994717) q[350];
-rz(pi/2) q[351];
-sx q[351];
-rz(0.91344555) q[351];
-cx q[350],q[351];
-rz(0.32867539) q[351];
-cx q[350],q[351];
-rz(3.1031707) q[350];
-cx q[349],q[350];
-rz(1.5900073) q[350];
-cx q[349],q[350];
-rz(-1.2640365) q[351];
-rz(pi/2) q[352];
-sx q[352];
-rz(0.72906295) q[352];
-rz(pi/2) q[353];
-sx q[353];
-rz(-3.0289222) q[353];
-cx q[352],q[353];
-rz(-0.84173338) q[353];
-cx q[352],q[353];
-rz(2.528073) q[352];
-cx q[351],q[352];
-rz(-1.2640365) q[352];
-cx q[351],q[352];
-rz(-0.78328028) q[353];
-rz(pi/2) q[354];
-sx q[354];
-rz(2.1994937) q[354];
-rz(pi/2) q[355];
-sx q[355];
-rz(0.31340151) q[355];
-cx q[354],q[355];
-rz(0.62869741) q[355];
-cx q[354],q[355];
-rz(1.5665606) q[354];
-cx q[353],q[354];
-rz(-0.78328028) q[354];
-cx q[353],q[354];
-rz(1.0829543) q[355];
-rz(pi/2) q[356];
-sx q[356];
-rz(-2.7647462) q[356];
-rz(pi/2) q[357];
-sx q[357];
-rz(-2.3244893) q[357];
-cx q[356],q[357];
-rz(1.9476428) q[357];
-cx q[356],q[357];
-rz(-2.1659086) q[356];
-cx q[355],q[356];
-rz(1.0829543) q[356];
-cx q[355],q[356];
-rz(-0.24988973) q[357];
-rz(pi/2) q[358];
-sx q[358];
-rz(0.27414693) q[358];
-rz(pi/2) q[359];
-sx q[359];
-rz(-2.1190902) q[359];
-cx q[358],q[359];
-rz(-1.2966494) q[359];
-cx q[358],q[359];
-rz(0.49977946) q[358];
-cx q[357],q[358];
-rz(-0.24988973) q[358];
-cx q[357],q[358];
-rz(1.6716007) q[359];
-rz(pi/2) q[360];
-sx q[360];
-rz(1.0549777) q[360];
-rz(pi/2) q[361];
-sx q[361];
-rz(2.6024336) q[361];
-cx q[360],q[361];
-rz(-0.51581866) q[361];
-cx q[360],q[361];
-rz(2.9399839) q[360];
-cx q[359],q[360];
-rz(1.6716007) q[360];
-cx q[359],q[360];
-rz(-0.89238778) q[361];
-rz(pi/2) q[362];
-sx q[362];
-rz(-3.0441505) q[362];
-rz(pi/2) q[363];
-sx q[363];
-rz(-1.7656807) q[363];
-cx q[362],q[363];
-rz(1.6682385) q[363];
-cx q[362],q[363];
-rz(1.7847756) q[362];
-cx q[361],q[362];
-rz(-0.89238778) q[362];
-cx q[361],q[362];
-rz(-0.42228276) q[363];
-rz(pi/2) q[364];
-sx q[364];
-rz(0.16523763) q[364];
-rz(pi/2) q[365];
-sx q[365];
-rz(-1.9012716) q[365];
-cx q[364],q[365];
-rz(-1.4055587) q[365];
-cx q[364],q[365];
-rz(0.84456552) q[364];
-cx q[363],q[364];
-rz(-0.42228276) q[364];
-cx q[363],q[364];
-rz(1.2665424) q[365];
-rz(pi/2) q[366];
-sx q[366];
-rz(1.369383) q[366];
-rz(pi/2) q[367];
-sx q[367];
-rz(1.9736231) q[367];
-cx q[366],q[367];
-rz(-0.20141337) q[367];
-cx q[366],q[367];
-rz(-2.5330848) q[366];
-cx q[365],q[366];
-rz(1.2665424) q[366];
-cx q[365],q[366];
-rz(1.2023542) q[367];
-rz(pi/2) q[368];
-sx q[368];
-rz(-3.1373383) q[368];
-rz(pi/2) q[369];
-sx q[369];
-rz(-1.5793051) q[369];
-cx q[368],q[369];
-rz(1.5750507) q[369];
-cx q[368],q[369];
-rz(-2.4047084) q[368];
-cx q[367],q[368];
-rz(1.2023542) q[368];
-cx q[367],q[368];
-rz(0.81065334) q[369];
-rz(pi/2) q[370];
-sx q[370];
-rz(-0.17268247) q[370];
-rz(pi/2) q[371];
-sx q[371];
-rz(-1.2254314) q[371];
-cx q[370],q[371];
-rz(-1.7434788) q[371];
-cx q[370],q[371];
-rz(-1.6213067) q[370];
-cx q[369],q[370];
-rz(0.81065334) q[370];
-cx q[369],q[370];
-rz(0.32793744) q[371];
-rz(pi/2) q[372];
-sx q[372];
-rz(2.1379883) q[372];
-rz(pi/2) q[373];
-sx q[373];
-rz(0.43641237) q[373];
-cx q[372],q[373];
-rz(0.56719198) q[373];
-cx q[372],q[373];
-rz(-0.65587488) q[372];
-cx q[371],q[372];
-rz(0.32793744) q[372];
-cx q[371],q[372];
-rz(-0.11430562) q[373];
-rz(pi/2) q[374];
-sx q[374];
-rz(1.505463) q[374];
-rz(pi/2) q[375];
-sx q[375];
-rz(1.7014629) q[375];
-cx q[374],q[375];
-rz(-0.065333286) q[375];
-cx q[374],q[375];
-rz(0.22861124) q[374];
-cx q[373],q[374];
-rz(-0.11430562) q[374];
-cx q[373],q[374];
-rz(0.3487227) q[375];
-rz(pi/2) q[376];
-sx q[376];
-rz(0.35272333) q[376];
-rz(pi/2) q[377];
-sx q[377];
-rz(-2.276243) q[377];
-cx q[376],q[377];
-rz(-1.218073) q[377];
-cx q[376],q[377];
-rz(-0.6974454) q[376];
-cx q[375],q[376];
-rz(0.3487227) q[376];
-cx q[375],q[376];
-rz(-0.81234259) q[377];
-rz(pi/2) q[378];
-sx q[378];
-rz(-0.013918673) q[378];
-rz(pi/2) q[379];
-sx q[379];
-rz(-1.542959) q[379];
-cx q[378],q[379];
-rz(-1.584715) q[379];
-cx q[378],q[379];
-rz(1.6246852) q[378];
-cx q[377],q[378];
-rz(-0.81234259) q[378];
-cx q[377],q[378];
-rz(0.39377212) q[379];
-rz(pi/2) q[380];
-sx q[380];
-rz(0.54959163) q[380];
-rz(pi/2) q[381];
-sx q[381];
-rz(-2.6699796) q[381];
-cx q[380],q[381];
-rz(-1.0212047) q[381];
-cx q[380],q[381];
-rz(-0.78754424) q[380];
-cx q[379],q[380];
-rz(0.39377212) q[380];
-cx q[379],q[380];
-rz(-0.79955193) q[381];
-rz(pi/2) q[382];
-sx q[382];
-rz(1.6086093) q[382];
-rz(pi/2) q[383];
-sx q[383];
-rz(1.4951705) q[383];
-cx q[382],q[383];
-rz(0.037812935) q[383];
-cx q[382],q[383];
-rz(1.5991039) q[382];
-cx q[381],q[382];
-rz(-0.79955193) q[382];
-cx q[381],q[382];
-rz(0.20182445) q[383];
-rz(pi/2) q[384];
-sx q[384];
-rz(0.34616943) q[384];
-rz(pi/2) q[385];
-sx q[385];
-rz(-2.2631352) q[385];
-cx q[384],q[385];
-rz(-1.2246269) q[385];
-cx q[384],q[385];
-rz(-0.4036489) q[384];
-cx q[383],q[384];
-rz(0.20182445) q[384];
-cx q[383],q[384];
-rz(0.65304556) q[385];
-rz(pi/2) q[386];
-sx q[386];
-rz(0.18979363) q[386];
-rz(pi/2) q[387];
-sx q[387];
-rz(-1.9503836) q[387];
-cx q[386],q[387];
-rz(-1.3810027) q[387];
-cx q[386],q[387];
-rz(-1.3060911) q[386];
-cx q[385],q[386];
-rz(0.65304556) q[386];
-cx q[385],q[386];
-rz(-0.070257145) q[387];
-rz(pi/2) q[388];
-sx q[388];
-rz(0.68575867) q[388];
-rz(pi/2) q[389];
-sx q[389];
-rz(-2.9423137) q[389];
-cx q[388],q[389];
-rz(-0.88503766) q[389];
-cx q[388],q[389];
-rz(0.14051429) q[388];
-cx q[387],q[388];
-rz(-0.070257145) q[388];
-cx q[387],q[388];
-rz(0.87596344) q[389];
-rz(pi/2) q[390];
-sx q[390];
-rz(1.8900878) q[390];
-rz(pi/2) q[391];
-sx q[391];
-rz(0.93221335) q[391];
-cx q[390],q[391];
-rz(0.31929149) q[391];
-cx q[390],q[391];
-rz(-1.7519269) q[390];
-cx q[389],q[390];
-rz(0.87596344) q[390];
-cx q[389],q[390];
-rz(-1.4159584) q[391];
-rz(pi/2) q[392];
-sx q[392];
-rz(-0.24721427) q[392];
-rz(pi/2) q[393];
-sx q[393];
-rz(-1.0763678) q[393];
-cx q[392],q[393];
-rz(-1.8180106) q[393];
-cx q[392],q[393];
-rz(2.8319168) q[392];
-cx q[391],q[392];
-rz(-1.4159584) q[392];
-cx q[391],q[392];
-rz(-1.462178) q[393];
-rz(pi/2) q[394];
-sx q[394];
-rz(0.31630783) q[394];
-rz(pi/2) q[395];
-sx q[395];
-rz(-2.203412) q[395];
-cx q[394],q[395];
-rz(-1.2544885) q[395];
-cx q[394],q[395];
-rz(2.924356) q[394];
-cx q[393],q[394];
-rz(-1.462178) q[394];
-cx q[393],q[394];
-rz(-0.70945333) q[395];
-rz(pi/2) q[396];
-sx q[396];
-rz(2.7629198) q[396];
-rz(pi/2) q[397];
-sx q[397];
-rz(-0.81345067) q[397];
-cx q[396],q[397];
-rz(1.1921235) q[397];
-cx q[396],q[397];
-rz(1.4189067) q[396];
-cx q[395],q[396];
-rz(-0.70945333) q[396];
-cx q[395],q[396];
-rz(-1.825834) q[397];
-rz(pi/2) q[398];
-sx q[398];
-rz(0.98356539) q[398];
-rz(pi/2) q[399];
-sx q[399];
-rz(2.7452582) q[399];
-cx q[398],q[399];
-rz(-0.58723094) q[399];
-cx q[398],q[399];
-rz(-2.6315173) q[398];
-cx q[397],q[398];
-rz(-1.825834) q[398];
-cx q[397],q[398];
-rz(0.80852678) q[399];
-rz(pi/2) q[400];
-sx q[400];
-rz(2.5138632) q[400];
-rz(pi/2) q[401];
-sx q[401];
-rz(-0.31533737) q[401];
-cx q[400],q[401];
-rz(0.94306685) q[401];
-cx q[400],q[401];
-rz(-1.6170536) q[400];
-cx q[399],q[400];
-rz(0.80852678) q[400];
-cx q[399],q[400];
-rz(0.80154831) q[401];
-rz(pi/2) q[402];
-sx q[402];
-rz(-2.7578128) q[402];
-rz(pi/2) q[403];
-sx q[403];
-rz(-2.3383561) q[403];
-cx q[402],q[403];
-rz(1.9545762) q[403];
-cx q[402],q[403];
-rz(-1.6030966) q[402];
-cx q[401],q[402];
-rz(0.80154831) q[402];
-cx q[401],q[402];
-rz(0.18869056) q[403];
-rz(pi/2) q[404];
-sx q[404];
-rz(-0.32146877) q[404];
-rz(pi/2) q[405];
-sx q[405];
-rz(-0.92785878) q[405];
-cx q[404],q[405];
-rz(-1.8922651) q[405];
-cx q[404],q[405];
-rz(-0.37738112) q[404];
-cx q[403],q[404];
-rz(0.18869056) q[404];
-cx q[403],q[404];
-rz(-1.0240708) q[405];
-rz(pi/2) q[406];
-sx q[406];
-rz(0.37394803) q[406];
-rz(pi/2) q[407];
-sx q[407];
-rz(-2.3186924) q[407];
-cx q[406],q[407];
-rz(-1.1968483) q[407];
-cx q[406],q[407];
-rz(2.0481416) q[406];
-cx q[405],q[406];
-rz(-1.0240708) q[406];
-cx q[405],q[406];
-rz(1.1215385) q[407];
-rz(pi/2) q[408];
-sx q[408];
-rz(0.49065483) q[408];
-rz(pi/2) q[409];
-sx q[409];
-rz(-2.552106) q[409];
-cx q[408],q[409];
-rz(-1.0801415) q[409];
-cx q[408],q[409];
-rz(-2.243077) q[408];
-cx q[407],q[408];
-rz(1.1215385) q[408];
-cx q[407],q[408];
-rz(-0.51684967) q[409];
-rz(pi/2) q[410];
-sx q[410];
-rz(-3.0862107) q[410];
-rz(pi/2) q[411];
-sx q[411];
-rz(-1.6815603) q[411];
-cx q[410],q[411];
-rz(1.6261783) q[411];
-cx q[410],q[411];
-rz(1.0336993) q[410];
-cx q[409],q[410];
-rz(-0.51684967) q[410];
-cx q[409],q[410];
-rz(0.9355872) q[411];
-rz(pi/2) q[412];
-sx q[412];
-rz(0.19225413) q[412];
-rz(pi/2) q[413];
-sx q[413];
-rz(-1.9553046) q[413];
-cx q[412],q[413];
-rz(-1.3785422) q[413];
-cx q[412],q[413];
-rz(-1.8711744) q[412];
-cx q[411],q[412];
-rz(0.9355872) q[412];
-cx q[411],q[412];
-rz(0.44814642) q[413];
-rz(pi/2) q[414];
-sx q[414];
-rz(0.055414527) q[414];
-rz(pi/2) q[415];
-sx q[415];
-rz(-1.6816254) q[415];
-cx q[414],q[415];
-rz(-1.5153818) q[415];
-cx q[414],q[415];
-rz(-0.89629284) q[414];
-cx q[413],q[414];
-rz(0.44814642) q[414];
-cx q[413],q[414];
-rz(-0.18421223) q[415];
-rz(pi/2) q[416];
-sx q[416];
-rz(1.488378) q[416];
-rz(pi/2) q[417];
-sx q[417];
-rz(1.7356329) q[417];
-cx q[416],q[417];
-rz(-0.082418304) q[417];
-cx q[416],q[417];
-rz(0.36842446) q[416];
-cx q[415],q[416];
-rz(-0.18421223) q[416];
-cx q[415],q[416];
-rz(1.0266096) q[417];
-rz(pi/2) q[418];
-sx q[418];
-rz(1.0569958) q[418];
-rz(pi/2) q[419];
-sx q[419];
-rz(2.5983973) q[419];
-cx q[418],q[419];
-rz(-0.51380049) q[419];
-cx q[418],q[419];
-rz(-2.0532192) q[418];
-cx q[417],q[418];
-rz(1.0266096) q[418];
-cx q[417],q[418];
-barrier q[0],q[1],q[2],q[3],q[4],q[5],q[6],q[7],q[8],q[9],q[10],q[11],q[12],q[13],q[14],q[15],q[16],q[17],q[18],q[19],q[20],q[21],q[22],q[23],q[24],q[25],q[26],q[27],q[28],q[29],q[30],q[31],q[32],q[33],q[34],q[35],q[36],q[37],q[38],q[39],q[40],q[41],q[42],q[43],q[44],q[45],q[46],q[47],q[48],q[49],q[50],q[51],q[52],q[53],q[54],q[55],q[56],q[57],q[58],q[59],q[60],q[61],q[62],q[63],q[64],q[65],q[66],q[67],q[68],q[69],q[70],q[71],q[72],q[73],q[74],q[75],q[76],q[77],q[78],q[79],q[80],q[81],q[82],q[83],q[84],q[85],q[86],q[87],q[88],q[89],q[90],q[91],q[92],q[93],q[94],q[95],q[96],q[97],q[98],q[99],q[100],q[101],q[102],q[103],q[104],q[105],q[106],q[107],q[108],q[109],q[110],q[111],q[112],q[113],q[114],q[115],q[116],q[117],q[118],q[119],q[120],q[121],q[122],q[123],q[124],q[125],q[126],q[127],q[128],q[129],q[130],q[131],q[132],q[133],q[134],q[135],q[136],q[137],q[138],q[139],q[140],q[141],q[142],q[143],q[144],q[145],q[146],q[147],q[148],q[149],q[150],q[151],q[152],q[153],q[154],q[155],q[156],q[157],q[158],q[159],q[160],q[161],q[162],q[163],q[164],q[165],q[166],q[167],q[168],q[169],q[170],q[171],q[172],q[173],q[174],q[175],q[176],q[177],q[178],q[179],q[180],q[181],q[182],q[183],q[184],q[185],q[186],q[187],q[188],q[189],q[190],q[191],q[192],q[193],q[194],q[195],q[196],q[197],q[198],q[199],q[200],q[201],q[202],q[203],q[204],q[205],q[206],q[207],q[208],q[209],q[210],q[211],q[212],q[213],q[214],q[215],q[216],q[217],q[218],q[219],q[220],q[221],q[222],q[223],q[224],q[225],q[226],q[227],q[228],q[229],q[230],q[231],q[232],q[233],q[234],q[235],q[236],q[237],q[238],q[239],q[240],q[241],q[242],q[243],q[244],q[245],q[246],q[247],q[248],q[249],q[250],q[251],q[252],q[253],q[254],q[255],q[256],q[257],q[258],q[259],q[260],q[261],q[262],q[263],q[264],q[265],q[266],q[267],q[268],q[269],q[270],q[271],q[272],q[273],q[274],q[275],q[276],q[277],q[278],q[279],q[280],q[281],q[282],q[283],q[284],q[285],q[286],q[287],q[288],q[289],q[290],q[291],q[292],q[293],q[294],q[295],q[296],q[297],q[298],q[299],q[300],q[301],q[302],q[303],q[304],q[305],q[306],q[307],q[308],q[309],q[310],q[311],q[312],q[313],q[314],q[315],q[316],q[317],q[318],q[319],q[320],q[321],q[322],q[323],q[324],q[325],q[326],q[327],q[328],q[329],q[330],q[331],q[332],q[333],q[334],q[335],q[336],q[337],q[338],q[339],q[340],q[341],q[342],q[343],q[344],q[345],q[346],q[347],q[348],q[349],q[350],q[351],q[352],q[353],q[354],q[355],q[356],q[357],q[358],q[359],q[360],q[361],q[362],q[363],q[364],q[365],q[366],q[367],q[368],q[369],q[370],q[371],q[372],q[373],q[374],q[375],q[376],q[377],q[378],q[379],q[380],q[381],q[382],q[383],q[384],q[385],q[386],q[387],q[388],q[389],q[390],q[391],q[392],q[393],q[394],q[395],q[396],q[397],q[398],q[399],q[400],q[401],q[402],q[403],q[404],q[405],q[406],q[407],q[408],q[409],q[410],q[411],q[412],q[413],q[414],q[415],q[416],q[417],q[418],q[419];
-measure q[0] -> meas[0];
-measure q[1] -> meas[1];
-measure q[2] -> meas[2];
-measure q[3] -> meas[3];
-measure q[4] -> meas[4];
-measure q[5] -> meas[5];
-measure q[6] -> meas[6];
-measure q[7] -> meas[7];
-measure q[8] -> meas[8];
-measure q[9] -> meas[9];
-measure q[10] -> meas[10];
-measure q[11] -> meas[11];
-measure q[12] -> meas[12];
-measure q[13] -> meas[13];
-measure q[14] -> meas[14];
-measure q[15] -> meas[15];
-measure q[16] -> meas[16];
-measure q[17] -> meas[17];
-measure q[18] -> meas[18];
-measure q[19] -> meas[19];
-measure q[20] -> meas[20];
-measure q[21] -> meas[21];
-measure q[22] -> meas[22];
-measure q[23] -> meas[23];
-measure q[24] -> meas[24];
-measure q[25] -> meas[25];
-measure q[26] -> meas[26];
-measure q[27] -> meas[27];
-measure q[28] -> meas[28];
-measure q[29] -> meas[29];
-measure q[30] -> meas[30];
-measure q[31] -> meas[31];
-measure q[32] -> meas[32];
-measure q[33] -> meas[33];
-measure q[34] -> meas[34];
-measure q[35] -> meas[35];
-measure q[36] -> meas[36];
-measure q[37] -> meas[37];
-measure q[38] -> meas[38];
-measure q[39] -> meas[39];
-measure q[40] -> meas[40];
-measure q[41] -> meas[41];
-measure q[42] -> meas[42];
-measure q[43] -> meas[43];
-measure q[44] -> meas[44];
-measure q[45] -> meas[45];
-measure q[46] -> meas[46];
-measure q[47] -> meas[47];
-measure q[48] -> meas[48];
-measure q[49] -> meas[49];
-measure q[50] -> meas[50];
-measure q[51] -> meas[51];
-measure q[52] -> meas[52];
-measure q[53] -> meas[53];
-measure q[54] -> meas[54];
-measure q[55] -> meas[55];
-measure q[56] -> meas[56];
-measure q[57] -> meas[57];
-measure q[58] -> meas[58];
-measure q[59] -> meas[59];
-measure q[60] -> meas[60];
-measure q[61] -> meas[61];
-measure q[62] -> meas[62];
-measure q[63] -> meas[63];
-measure q[64] -> meas[64];
-measure q[65] -> meas[65];
-measure q[66] -> meas[66];
-measure q[67] -> meas[67];
-measure q[68] -> meas[68];
-measure q[69] -> meas[69];
-measure q[70] -> meas[70];
-measure q[71] -> meas[71];
-measure q[72] -> meas[72];
-measure q[73] -> meas[73];
-measure q[74] -> meas[74];
-measure q[75] -> meas[75];
-measure q[76] -> meas[76];
-measure q[77] -> meas[77];
-measure q[78] -> meas[78];
-measure q[79] -> meas[79];
-measure q[80] -> meas[80];
-measure q[81] -> meas[81];
-measure q[82] -> meas[82];
-measure q[83] -> meas[83];
-measure q[84] -> meas[84];
-measure q[85] -> meas[85];
-measure q[86] -> meas[86];
-measure q[87] -> meas[87];
-measure q[88] -> meas[88];
-measure q[89] -> meas[89];
-measure q[90] -> meas[90];
-measure q[91] -> meas[91];
-measure q[92] -> meas[92];
-measure q[93] -> meas[93];
-measure q[94] -> meas[94];
-measure q[95] -> meas[95];
-measure q[96] -> meas[96];
-measure q[97] -> meas[97];
-measure q[98] -> meas[98];
-measure q[99] -> meas[99];
-measure q[100] -> meas[100];
-measure q[101] -> meas[101];
-measure q[102] -> meas[102];
-measure q[103] -> meas[103];
-measure q[104] -> meas[104];
-measure q[105] -> meas[105];
-measure q[106] -> meas[106];
-measure q[107] -> meas[107];
-measure q[108] -> meas[108];
-measure q[109] -> meas[109];
-measure q[110] -> meas[110];
-measure q[111] -> meas[111];
-measure q[112] -> meas[112];
-measure q[113] -> meas[113];
-measure q[114] -> meas[114];
-measure q[115] -> meas[115];
-measure q[116] -> meas[116];
-measure q[117] -> meas[117];
-measure q[118] -> meas[118];
-measure q[119] -> meas[119];
-measure q[120] -> meas[120];
-measure q[121] -> meas[121];
-measure q[122] -> meas[122];
-measure q[123] -> meas[123];
-measure q[124] -> meas[124];
-measure q[125] -> meas[125];
-measure q[126] -> meas[126];
-measure q[127] -> meas[127];
-measure q[128] -> meas[128];
-measure q[129] -> meas[129];
-measure q[130] -> meas[130];
-measure q[131] -> meas[131];
-measure q[132] -> meas[132];
-measure q[133] -> meas[133];
-measure q[134] -> meas[134];
-measure q[135] -> meas[135];
-measure q[136] -> meas[136];
-measure q[137] -> meas[137];
-measure q[138] -> meas[138];
-measure q[139] -> meas[139];
-measure q[140] -> meas[140];
-measure q[141] -> meas[141];
-measure q[142] -> meas[142];
-measure q[143] -> meas[143];
-measure q[144] -> meas[144];
-measure q[145] -> meas[145];
-measure q[146] -> meas[146];
-measure q[147] -> meas[147];
-measure q[148] -> meas[148];
-measure q[149] -> meas[149];
-measure q[150] -> meas[150];
-measure q[151] -> meas[151];
-measure q[152] -> meas[152];
-measure q[153] -> meas[153];
-measure q[154] -> meas[154];
-measure q[155] -> meas[155];
-measure q[156] -> meas[156];
-measure q[157] -> meas[157];
-measure q[158] -> meas[158];
-measure q[159] -> meas[159];
-measure q[160] -> meas[160];
-measure q[161] -> meas[161];
-measure q[162] -> meas[162];
-measure q[163] -> meas[163];
-measure q[164] -> meas[164];
-measure q[165] -> meas[165];
-measure q[166] -> meas[166];
-measure q[167] -> meas[167];
-measure q[168] -> meas[168];
-measure q[169] -> meas[169];
-measure q[170] -> meas[170];
-measure q[171] -> meas[171];
-measure q[172] -> meas[172];
-measure q[173] -> meas[173];
-measure q[174] -> meas[174];
-measure q[175] -> meas[175];
-measure q[176] -> meas[176];
-measure q[177] -> meas[177];
-measure q[178] -> meas[178];
-measure q[179] -> meas[179];
-measure q[180] -> meas[180];
-measure q[181] -> meas[181];
-measure q[182] -> meas[182];
-measure q[183] -> meas[183];
-measure q[184] -> meas[184];
-measure q[185] -> meas[185];
-measure q[186] -> meas[186];
-measure q[187] -> meas[187];
-measure q[188] -> meas[188];
-measure q[189] -> meas[189];
-measure q[190] -> meas[190];
-measure q[191] -> meas[191];
-measure q[192] -> meas[192];
-measure q[193] -> meas[193];
-measure q[194] -> meas[194];
-measure q[195] -> meas[195];
-measure q[196] -> meas[196];
-measure q[197] -> meas[197];
-measure q[198] -> meas[198];
-measure q[199] -> meas[199];
-measure q[200] -> meas[200];
-measure q[201] -> meas[201];
-measure q[202] -> meas[202];
-measure q[203] -> meas[203];
-measure q[204] -> meas[204];
-measure q[205] -> meas[205];
-measure q[206] -> meas[206];
-measure q[207] -> meas[207];
-measure q[208] -> meas[208];
-measure q[209] -> meas[209];
-measure q[210] -> meas[210];
-measure q[211] -> meas[211];
-measure q[212] -> meas[212];
-measure q[213] -> meas[213];
-measure q[214] -> meas[214];
-measure q[215] -> meas[215];
-measure q[216] -> meas[216];
-measure q[217] -> meas[217];
-measure q[218] -> meas[218];
-measure q[219] -> meas[219];
-measure q[220] -> meas[220];
-measure q[221] -> meas[221];
-measure q[222] -> meas[222];
-measure q[223] -> meas[223];
-measure q[224] -> meas[224];
-measure q[225] -> meas[225];
-measure q[226] -> meas[226];
-measure q[227] -> meas[227];
-measure q[228] -> meas[228];
-measure q[229] -> meas[229];
-measure q[230] -> meas[230];
-measure q[231] -> meas[231];
-measure q[232] -> meas[232];
-measure q[233] -> meas[233];
-measure q[234] -> meas[234];
-measure q[235] -> meas[235];
-measure q[236] -> meas[236];
-measure q[237] -> meas[237];
-measure q[238] -> meas[238];
-measure q[239] -> meas[239];
-measure q[240] -> meas[240];
-measure q[241] -> meas[241];
-measure q[242] -> meas[242];
-measure q[243] -> meas[243];
-measure q[244] -> meas[244];
-measure q[245] -> meas[245];
-measure q[246] -> meas[246];
-measure q[247] -> meas[247];
-measure q[248] -> meas[248];
-measure q[249] -> meas[249];
-measure q[250] -> meas[250];
-measure q[251] -> meas[251];
-measure q[252] -> meas[252];
-measure q[253] -> meas[253];
-measure q[254] -> meas[254];
-measure q[255] -> meas[255];
-measure q[256] -> meas[256];
-measure q[257] -> meas[257];
-measure q[258] -> meas[258];
-measure q[259] -> meas[259];
-measure q[260] -> meas[260];
-measure q[261] -> meas[261];
-measure q[262] -> meas[262];
-measure q[263] -> meas[263];
-measure q[264] -> meas[264];
-measure q[265] -> meas[265];
-measure q[266] -> meas[266];
-measure q[267] -> meas[267];
-measure q[268] -> meas[268];
-measure q[269] -> meas[269];
-measure q[270] -> meas[270];
-measure q[271] -> meas[271];
-measure q[272] -> meas[272];
-measure q[273] -> meas[273];
-measure q[274] -> meas[274];
-measure q[275] -> meas[275];
-measure q[276] -> meas[276];
-measure q[277] -> meas[277];
-measure q[278] -> meas[278];
-measure q[279] -> meas[279];
-measure q[280] -> meas[280];
-measure q[281] -> meas[281];
-measure q[282] -> meas[282];
-measure q[283] -> meas[283];
-measure q[284] -> meas[284];
-measure q[285] -> meas[285];
-measure q[286] -> meas[286];
-measure q[287] -> meas[287];
-measure q[288] -> meas[288];
-measure q[289] -> meas[289];
-measure q[290] -> meas[290];
-measure q[291] -> meas[291];
-measure q[292] -> meas[292];
-measure q[293] -> meas[293];
-measure q[294] -> meas[294];
-measure q[295] -> meas[295];
-measure q[296] -> meas[296];
-measure q[297] -> meas[297];
-measure q[298] -> meas[298];
-measure q[299] -> meas[299];
-measure q[300] -> meas[300];
-measure q[301] -> meas[301];
-measure q[302] -> meas[302];
-measure q[303] -> meas[303];
-measure q[304] -> meas[304];
-measure q[305] -> meas[305];
-measure q[306] -> meas[306];
-measure q[307] -> meas[307];
-measure q[308] -> meas[308];
-measure q[309] -> meas[309];
-measure q[310] -> meas[310];
-measure q[311] -> meas[311];
-measure q[312] -> meas[312];
-measure q[313] -> meas[313];
-measure q[314] -> meas[314];
-measure q[315] -> meas[315];
-measure q[316] -> meas[316];
-measure q[317] -> meas[317];
-measure q[318] -> meas[318];
-measure q[319] -> meas[319];
-measure q[320] -> meas[320];
-measure q[321] -> meas[321];
-measure q[322] -> meas[322];
-measure q[323] -> meas[323];
-measure q[324] -> meas[324];
-measure q[325] -> meas[325];
-measure q[326] -> meas[326];
-measure q[327] -> meas[327];
-measure q[328] -> meas[328];
-measure q[329] -> meas[329];
-measure q[330] -> meas[330];
-measure q[331] -> meas[331];
-measure q[332] -> meas[332];
-measure q[333] -> meas[333];
-measure q[334] -> meas[334];
-measure q[335] -> meas[335];
-measure q[336] -> meas[336];
-measure q[337] -> meas[337];
-measure q[338] -> meas[338];
-measure q[339] -> meas[339];
-measure q[340] -> meas[340];
-measure q[341] -> meas[341];
-measure q[342] -> meas[342];
-measure q[343] -> meas[343];
-measure q[344] -> meas[344];
-measure q[345] -> meas[345];
-measure q[346] -> meas[346];
-measure q[347] -> meas[347];
-measure q[348] -> meas[348];
-measure q[349] -> meas[349];
-measure q[350] -> meas[350];
-measure q[351] -> meas[351];
-measure q[352] -> meas[352];
-measure q[353] -> meas[353];
-measure q[354] -> meas[354];
-measure q[355] -> meas[355];
-measure q[356] -> meas[356];
-measure q[357] -> meas[357];
-measure q[358] -> meas[358];
-measure q[359] -> meas[359];
-measure q[360] -> meas[360];
-measure q[361] -> meas[361];
-measure q[362] -> meas[362];
-measure q[363] -> meas[363];
-measure q[364] -> meas[364];
-measure q[365] -> meas[365];
-measure q[366] -> meas[366];
-measure q[367] -> meas[367];
-measure q[368] -> meas[368];
-measure q[369] -> meas[369];
-measure q[370] -> meas[370];
-measure q[371] -> meas[371];
-measure q[372] -> meas[372];
-measure q[373] -> meas[373];
-measure q[374] -> meas[374];
-measure q[375] -> meas[375];
-measure q[376] -> meas[376];
-measure q[377] -> meas[377];
-measure q[378] -> meas[378];
-measure q[379] -> meas[379];
-measure q[380] -> meas[380];
-measure q[381] -> meas[381];
-measure q[382] -> meas[382];
-measure q[383] -> meas[383];
-measure q[384] -> meas[384];
-measure q[385] -> meas[385];
-measure q[386] -> meas[386];
-measure q[387] -> meas[387];
-measure q[388] -> meas[388];
-measure q[389] -> meas[389];
-measure q[390] -> meas[390];
-measure q[391] -> meas[391];
-measure q[392] -> meas[392];
-measure q[393] -> meas[393];
-measure q[394] -> meas[394];
-measure q[395] -> meas[395];
-measure q[396] -> meas[396];
-measure q[397] -> meas[397];
-measure q[398] -> meas[398];
-measure q[399] -> meas[399];
-measure q[400] -> meas[400];
-measure q[401] -> meas[401];
-measure q[402] -> meas[402];
-measure q[403] -> meas[403];
-measure q[404] -> meas[404];
-measure q[405] -> meas[405];
-measure q[406] -> meas[406];
-measure q[407] -> meas[407];
-measure q[408] -> meas[408];
-measure q[409] -> meas[409];
-measure q[410] -> meas[410];
-measure q[411] -> meas[411];
-measure q[412] -> meas[412];
-measure q[413] -> meas[413];
-measure q[414] -> meas[414];
-measure q[415] -> meas[415];
-measure q[416] -> meas[416];
-measure q[417] -> meas[417];
-measure q[418] -> meas[418];
-measure q[419] -> meas[419];
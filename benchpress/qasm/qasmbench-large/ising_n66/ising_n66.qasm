@@ -1,792 +0,0 @@
-OPENQASM 2.0;
-include "qelib1.inc";
-qreg q[66];
-creg c[66];
-creg meas[66];
-h q[0];
-h q[1];
-h q[2];
-h q[3];
-h q[4];
-h q[5];
-h q[6];
-h q[7];
-h q[8];
-h q[9];
-h q[10];
-h q[11];
-h q[12];
-h q[13];
-h q[14];
-h q[15];
-h q[16];
-h q[17];
-h q[18];
-h q[19];
-h q[20];
-h q[21];
-h q[22];
-h q[23];
-h q[24];
-h q[25];
-h q[26];
-h q[27];
-h q[28];
-h q[29];
-h q[30];
-h q[31];
-h q[32];
-h q[33];
-h q[34];
-h q[35];
-h q[36];
-h q[37];
-h q[38];
-h q[39];
-h q[40];
-h q[41];
-h q[42];
-h q[43];
-h q[44];
-h q[45];
-h q[46];
-h q[47];
-h q[48];
-h q[49];
-h q[50];
-h q[51];
-h q[52];
-h q[53];
-h q[54];
-h q[55];
-h q[56];
-h q[57];
-h q[58];
-h q[59];
-h q[60];
-h q[61];
-h q[62];
-h q[63];
-h q[64];
-h q[65];
-rz(1.6845551) q[0];
-rz(-1.6845551) q[1];
-rz(-1.6845551) q[1];
-cx q[0],q[1];
-rz(1.6845551) q[1];
-cx q[0],q[1];
-rz(-1.2572348) q[2];
-rz(1.2572348) q[3];
-rz(1.2572348) q[3];
-cx q[2],q[3];
-rz(-1.2572348) q[3];
-cx q[2],q[3];
-rz(1.2928823) q[4];
-rz(-1.2928823) q[5];
-rz(-1.2928823) q[5];
-cx q[4],q[5];
-rz(1.2928823) q[5];
-cx q[4],q[5];
-rz(-1.5703962) q[6];
-rz(1.5703962) q[7];
-rz(1.5703962) q[7];
-cx q[6],q[7];
-rz(-1.5703962) q[7];
-cx q[6],q[7];
-rz(-1.0388736) q[8];
-rz(1.0388736) q[9];
-rz(1.0388736) q[9];
-cx q[8],q[9];
-rz(-1.0388736) q[9];
-cx q[8],q[9];
-rz(1.3780137) q[10];
-rz(-1.3780137) q[11];
-rz(-1.3780137) q[11];
-cx q[10],q[11];
-rz(1.3780137) q[11];
-cx q[10],q[11];
-rz(-0.0070144794) q[12];
-rz(0.0070144794) q[13];
-rz(0.0070144794) q[13];
-cx q[12],q[13];
-rz(-0.0070144794) q[13];
-cx q[12],q[13];
-rz(-1.3439775) q[14];
-rz(1.3439775) q[15];
-rz(1.3439775) q[15];
-cx q[14],q[15];
-rz(-1.3439775) q[15];
-cx q[14],q[15];
-rz(1.7769919) q[16];
-rz(-1.7769919) q[17];
-rz(-1.7769919) q[17];
-cx q[16],q[17];
-rz(1.7769919) q[17];
-cx q[16],q[17];
-rz(-1.532035) q[18];
-rz(1.532035) q[19];
-rz(1.532035) q[19];
-cx q[18],q[19];
-rz(-1.532035) q[19];
-cx q[18],q[19];
-rz(-1.4790855) q[20];
-rz(1.4790855) q[21];
-rz(1.4790855) q[21];
-cx q[20],q[21];
-rz(-1.4790855) q[21];
-cx q[20],q[21];
-rz(1.6621023) q[22];
-rz(-1.6621023) q[23];
-rz(-1.6621023) q[23];
-cx q[22],q[23];
-rz(1.6621023) q[23];
-cx q[22],q[23];
-rz(-1.346359) q[24];
-rz(1.346359) q[25];
-rz(1.346359) q[25];
-cx q[24],q[25];
-rz(-1.346359) q[25];
-cx q[24],q[25];
-rz(1.2437046) q[26];
-rz(-1.2437046) q[27];
-rz(-1.2437046) q[27];
-cx q[26],q[27];
-rz(1.2437046) q[27];
-cx q[26],q[27];
-rz(-1.4035615) q[28];
-rz(1.4035615) q[29];
-rz(1.4035615) q[29];
-cx q[28],q[29];
-rz(-1.4035615) q[29];
-cx q[28],q[29];
-rz(-0.94399531) q[30];
-rz(0.94399531) q[31];
-rz(0.94399531) q[31];
-cx q[30],q[31];
-rz(-0.94399531) q[31];
-cx q[30],q[31];
-rz(-0.10547849) q[32];
-rz(0.10547849) q[33];
-rz(0.10547849) q[33];
-cx q[32],q[33];
-rz(-0.10547849) q[33];
-cx q[32],q[33];
-rz(-0.32112909) q[34];
-rz(0.32112909) q[35];
-rz(0.32112909) q[35];
-cx q[34],q[35];
-rz(-0.32112909) q[35];
-cx q[34],q[35];
-rz(1.2551978) q[36];
-rz(-1.2551978) q[37];
-rz(-1.2551978) q[37];
-cx q[36],q[37];
-rz(1.2551978) q[37];
-cx q[36],q[37];
-rz(0.83274755) q[38];
-rz(-0.83274755) q[39];
-rz(-0.83274755) q[39];
-cx q[38],q[39];
-rz(0.83274755) q[39];
-cx q[38],q[39];
-rz(-0.51687854) q[40];
-rz(0.51687854) q[41];
-rz(0.51687854) q[41];
-cx q[40],q[41];
-rz(-0.51687854) q[41];
-cx q[40],q[41];
-rz(-1.6689561) q[42];
-rz(1.6689561) q[43];
-rz(1.6689561) q[43];
-cx q[42],q[43];
-rz(-1.6689561) q[43];
-cx q[42],q[43];
-rz(-0.87783496) q[44];
-rz(0.87783496) q[45];
-rz(0.87783496) q[45];
-cx q[44],q[45];
-rz(-0.87783496) q[45];
-cx q[44],q[45];
-rz(1.7917125) q[46];
-rz(-1.7917125) q[47];
-rz(-1.7917125) q[47];
-cx q[46],q[47];
-rz(1.7917125) q[47];
-cx q[46],q[47];
-rz(0.85318811) q[48];
-rz(-0.85318811) q[49];
-rz(-0.85318811) q[49];
-cx q[48],q[49];
-rz(0.85318811) q[49];
-cx q[48],q[49];
-rz(1.1007048) q[50];
-rz(-1.1007048) q[51];
-rz(-1.1007048) q[51];
-cx q[50],q[51];
-rz(1.1007048) q[51];
-cx q[50],q[51];
-rz(1.2374139) q[52];
-rz(-1.2374139) q[53];
-rz(-1.2374139) q[53];
-cx q[52],q[53];
-rz(1.2374139) q[53];
-cx q[52],q[53];
-rz(0.86900691) q[54];
-rz(-0.86900691) q[55];
-rz(-0.86900691) q[55];
-cx q[54],q[55];
-rz(0.86900691) q[55];
-cx q[54],q[55];
-rz(-0.075544295) q[56];
-rz(0.075544295) q[57];
-rz(0.075544295) q[57];
-cx q[56],q[57];
-rz(-0.075544295) q[57];
-cx q[56],q[57];
-rz(1.9666965) q[58];
-rz(-1.9666965) q[59];
-rz(-1.9666965) q[59];
-cx q[58],q[59];
-rz(1.9666965) q[59];
-cx q[58],q[59];
-rz(-0.8932567) q[60];
-rz(0.8932567) q[61];
-rz(0.8932567) q[61];
-cx q[60],q[61];
-rz(-0.8932567) q[61];
-cx q[60],q[61];
-rz(1.0753497) q[62];
-rz(-1.0753497) q[63];
-rz(-1.0753497) q[63];
-cx q[62],q[63];
-rz(1.0753497) q[63];
-cx q[62],q[63];
-rz(-0.23544851) q[64];
-rz(0.23544851) q[65];
-rz(0.23544851) q[65];
-cx q[64],q[65];
-rz(-0.23544851) q[65];
-cx q[64],q[65];
-rz(-0.27302102) q[1];
-rz(0.27302102) q[2];
-rz(0.27302102) q[2];
-cx q[1],q[2];
-rz(-0.27302102) q[2];
-cx q[1],q[2];
-rz(0.93575124) q[3];
-rz(-0.93575124) q[4];
-rz(-0.93575124) q[4];
-cx q[3],q[4];
-rz(0.93575124) q[4];
-cx q[3],q[4];
-rz(-0.79244696) q[5];
-rz(0.79244696) q[6];
-rz(0.79244696) q[6];
-cx q[5],q[6];
-rz(-0.79244696) q[6];
-cx q[5],q[6];
-rz(-0.45987014) q[7];
-rz(0.45987014) q[8];
-rz(0.45987014) q[8];
-cx q[7],q[8];
-rz(-0.45987014) q[8];
-cx q[7],q[8];
-rz(-0.66887293) q[9];
-rz(0.66887293) q[10];
-rz(0.66887293) q[10];
-cx q[9],q[10];
-rz(-0.66887293) q[10];
-cx q[9],q[10];
-rz(0.26174741) q[11];
-rz(-0.26174741) q[12];
-rz(-0.26174741) q[12];
-cx q[11],q[12];
-rz(0.26174741) q[12];
-cx q[11],q[12];
-rz(-0.95258407) q[13];
-rz(0.95258407) q[14];
-rz(0.95258407) q[14];
-cx q[13],q[14];
-rz(-0.95258407) q[14];
-cx q[13],q[14];
-rz(0.90853417) q[15];
-rz(-0.90853417) q[16];
-rz(-0.90853417) q[16];
-cx q[15],q[16];
-rz(0.90853417) q[16];
-cx q[15],q[16];
-rz(-1.998859) q[17];
-rz(1.998859) q[18];
-rz(1.998859) q[18];
-cx q[17],q[18];
-rz(-1.998859) q[18];
-cx q[17],q[18];
-rz(1.7129122) q[19];
-rz(-1.7129122) q[20];
-rz(-1.7129122) q[20];
-cx q[19],q[20];
-rz(1.7129122) q[20];
-cx q[19],q[20];
-rz(1.713981) q[21];
-rz(-1.713981) q[22];
-rz(-1.713981) q[22];
-cx q[21],q[22];
-rz(1.713981) q[22];
-cx q[21],q[22];
-rz(1.9973678) q[23];
-rz(-1.9973678) q[24];
-rz(-1.9973678) q[24];
-cx q[23],q[24];
-rz(1.9973678) q[24];
-cx q[23],q[24];
-rz(1.2910342) q[25];
-rz(-1.2910342) q[26];
-rz(-1.2910342) q[26];
-cx q[25],q[26];
-rz(1.2910342) q[26];
-cx q[25],q[26];
-rz(1.4634312) q[27];
-rz(-1.4634312) q[28];
-rz(-1.4634312) q[28];
-cx q[27],q[28];
-rz(1.4634312) q[28];
-cx q[27],q[28];
-rz(0.65619548) q[29];
-rz(-0.65619548) q[30];
-rz(-0.65619548) q[30];
-cx q[29],q[30];
-rz(0.65619548) q[30];
-cx q[29],q[30];
-rz(1.1369534) q[31];
-rz(-1.1369534) q[32];
-rz(-1.1369534) q[32];
-cx q[31],q[32];
-rz(1.1369534) q[32];
-cx q[31],q[32];
-rz(-0.3166508) q[33];
-rz(0.3166508) q[34];
-rz(0.3166508) q[34];
-cx q[33],q[34];
-rz(-0.3166508) q[34];
-cx q[33],q[34];
-rz(1.6679692) q[35];
-rz(-1.6679692) q[36];
-rz(-1.6679692) q[36];
-cx q[35],q[36];
-rz(1.6679692) q[36];
-cx q[35],q[36];
-rz(0.94889695) q[37];
-rz(-0.94889695) q[38];
-rz(-0.94889695) q[38];
-cx q[37],q[38];
-rz(0.94889695) q[38];
-cx q[37],q[38];
-rz(1.3389506) q[39];
-rz(-1.3389506) q[40];
-rz(-1.3389506) q[40];
-cx q[39],q[40];
-rz(1.3389506) q[40];
-cx q[39],q[40];
-rz(0.42250814) q[41];
-rz(-0.42250814) q[42];
-rz(-0.42250814) q[42];
-cx q[41],q[42];
-rz(0.42250814) q[42];
-cx q[41],q[42];
-rz(-0.16700096) q[43];
-rz(0.16700096) q[44];
-rz(0.16700096) q[44];
-cx q[43],q[44];
-rz(-0.16700096) q[44];
-cx q[43],q[44];
-rz(1.3028807) q[45];
-rz(-1.3028807) q[46];
-rz(-1.3028807) q[46];
-cx q[45],q[46];
-rz(1.3028807) q[46];
-cx q[45],q[46];
-rz(-1.8720307) q[47];
-rz(1.8720307) q[48];
-rz(1.8720307) q[48];
-cx q[47],q[48];
-rz(-1.8720307) q[48];
-cx q[47],q[48];
-rz(-1.1861875) q[49];
-rz(1.1861875) q[50];
-rz(1.1861875) q[50];
-cx q[49],q[50];
-rz(-1.1861875) q[50];
-cx q[49],q[50];
-rz(-0.11663793) q[51];
-rz(0.11663793) q[52];
-rz(0.11663793) q[52];
-cx q[51],q[52];
-rz(-0.11663793) q[52];
-cx q[51],q[52];
-rz(1.7434165) q[53];
-rz(-1.7434165) q[54];
-rz(-1.7434165) q[54];
-cx q[53],q[54];
-rz(1.7434165) q[54];
-cx q[53],q[54];
-rz(1.9586679) q[55];
-rz(-1.9586679) q[56];
-rz(-1.9586679) q[56];
-cx q[55],q[56];
-rz(1.9586679) q[56];
-cx q[55],q[56];
-rz(-0.91863643) q[57];
-rz(0.91863643) q[58];
-rz(0.91863643) q[58];
-cx q[57],q[58];
-rz(-0.91863643) q[58];
-cx q[57],q[58];
-rz(-1.378703) q[59];
-rz(1.378703) q[60];
-rz(1.378703) q[60];
-cx q[59],q[60];
-rz(-1.378703) q[60];
-cx q[59],q[60];
-rz(1.2285706) q[61];
-rz(-1.2285706) q[62];
-rz(-1.2285706) q[62];
-cx q[61],q[62];
-rz(1.2285706) q[62];
-cx q[61],q[62];
-rz(0.28670827) q[63];
-rz(-0.28670827) q[64];
-rz(-0.28670827) q[64];
-cx q[63],q[64];
-rz(0.28670827) q[64];
-cx q[63],q[64];
-h q[0];
-rz(0) q[0];
-h q[0];
-rz(0) q[0];
-h q[1];
-rz(0) q[1];
-h q[1];
-rz(0) q[1];
-h q[2];
-rz(0) q[2];
-h q[2];
-rz(0) q[2];
-h q[3];
-rz(0) q[3];
-h q[3];
-rz(0) q[3];
-h q[4];
-rz(0) q[4];
-h q[4];
-rz(0) q[4];
-h q[5];
-rz(0) q[5];
-h q[5];
-rz(0) q[5];
-h q[6];
-rz(0) q[6];
-h q[6];
-rz(0) q[6];
-h q[7];
-rz(0) q[7];
-h q[7];
-rz(0) q[7];
-h q[8];
-rz(0) q[8];
-h q[8];
-rz(0) q[8];
-h q[9];
-rz(0) q[9];
-h q[9];
-rz(0) q[9];
-h q[10];
-rz(0) q[10];
-h q[10];
-rz(0) q[10];
-h q[11];
-rz(0) q[11];
-h q[11];
-rz(0) q[11];
-h q[12];
-rz(0) q[12];
-h q[12];
-rz(0) q[12];
-h q[13];
-rz(0) q[13];
-h q[13];
-rz(0) q[13];
-h q[14];
-rz(0) q[14];
-h q[14];
-rz(0) q[14];
-h q[15];
-rz(0) q[15];
-h q[15];
-rz(0) q[15];
-h q[16];
-rz(0) q[16];
-h q[16];
-rz(0) q[16];
-h q[17];
-rz(0) q[17];
-h q[17];
-rz(0) q[17];
-h q[18];
-rz(0) q[18];
-h q[18];
-rz(0) q[18];
-h q[19];
-rz(0) q[19];
-h q[19];
-rz(0) q[19];
-h q[20];
-rz(0) q[20];
-h q[20];
-rz(0) q[20];
-h q[21];
-rz(0) q[21];
-h q[21];
-rz(0) q[21];
-h q[22];
-rz(0) q[22];
-h q[22];
-rz(0) q[22];
-h q[23];
-rz(0) q[23];
-h q[23];
-rz(0) q[23];
-h q[24];
-rz(0) q[24];
-h q[24];
-rz(0) q[24];
-h q[25];
-rz(0) q[25];
-h q[25];
-rz(0) q[25];
-h q[26];
-rz(0) q[26];
-h q[26];
-rz(0) q[26];
-h q[27];
-rz(0) q[27];
-h q[27];
-rz(0) q[27];
-h q[28];
-rz(0) q[28];
-h q[28];
-rz(0) q[28];
-h q[29];
-rz(0) q[29];
-h q[29];
-rz(0) q[29];
-h q[30];
-rz(0) q[30];
-h q[30];
-rz(0) q[30];
-h q[31];
-rz(0) q[31];
-h q[31];
-rz(0) q[31];
-h q[32];
-rz(0) q[32];
-h q[32];
-rz(0) q[32];
-h q[33];
-rz(0) q[33];
-h q[33];
-rz(0) q[33];
-h q[34];
-rz(0) q[34];
-h q[34];
-rz(0) q[34];
-h q[35];
-rz(0) q[35];
-h q[35];
-rz(0) q[35];
-h q[36];
-rz(0) q[36];
-h q[36];
-rz(0) q[36];
-h q[37];
-rz(0) q[37];
-h q[37];
-rz(0) q[37];
-h q[38];
-rz(0) q[38];
-h q[38];
-rz(0) q[38];
-h q[39];
-rz(0) q[39];
-h q[39];
-rz(0) q[39];
-h q[40];
-rz(0) q[40];
-h q[40];
-rz(0) q[40];
-h q[41];
-rz(0) q[41];
-h q[41];
-rz(0) q[41];
-h q[42];
-rz(0) q[42];
-h q[42];
-rz(0) q[42];
-h q[43];
-rz(0) q[43];
-h q[43];
-rz(0) q[43];
-h q[44];
-rz(0) q[44];
-h q[44];
-rz(0) q[44];
-h q[45];
-rz(0) q[45];
-h q[45];
-rz(0) q[45];
-h q[46];
-rz(0) q[46];
-h q[46];
-rz(0) q[46];
-h q[47];
-rz(0) q[47];
-h q[47];
-rz(0) q[47];
-h q[48];
-rz(0) q[48];
-h q[48];
-rz(0) q[48];
-h q[49];
-rz(0) q[49];
-h q[49];
-rz(0) q[49];
-h q[50];
-rz(0) q[50];
-h q[50];
-rz(0) q[50];
-h q[51];
-rz(0) q[51];
-h q[51];
-rz(0) q[51];
-h q[52];
-rz(0) q[52];
-h q[52];
-rz(0) q[52];
-h q[53];
-rz(0) q[53];
-h q[53];
-rz(0) q[53];
-h q[54];
-rz(0) q[54];
-h q[54];
-rz(0) q[54];
-h q[55];
-rz(0) q[55];
-h q[55];
-rz(0) q[55];
-h q[56];
-rz(0) q[56];
-h q[56];
-rz(0) q[56];
-h q[57];
-rz(0) q[57];
-h q[57];
-rz(0) q[57];
-h q[58];
-rz(0) q[58];
-h q[58];
-rz(0) q[58];
-h q[59];
-rz(0) q[59];
-h q[59];
-rz(0) q[59];
-h q[60];
-rz(0) q[60];
-h q[60];
-rz(0) q[60];
-h q[61];
-rz(0) q[61];
-h q[61];
-rz(0) q[61];
-h q[62];
-rz(0) q[62];
-h q[62];
-rz(0) q[62];
-h q[63];
-rz(0) q[63];
-h q[63];
-rz(0) q[63];
-h q[64];
-rz(0) q[64];
-h q[64];
-rz(0) q[64];
-h q[65];
-rz(0) q[65];
-h q[65];
-rz(0) q[65];
-barrier q[0],q[1],q[2],q[3],q[4],q[5],q[6],q[7],q[8],q[9],q[10],q[11],q[12],q[13],q[14],q[15],q[16],q[17],q[18],q[19],q[20],q[21],q[22],q[23],q[24],q[25],q[26],q[27],q[28],q[29],q[30],q[31],q[32],q[33],q[34],q[35],q[36],q[37],q[38],q[39],q[40],q[41],q[42],q[43],q[44],q[45],q[46],q[47],q[48],q[49],q[50],q[51],q[52],q[53],q[54],q[55],q[56],q[57],q[58],q[59],q[60],q[61],q[62],q[63],q[64],q[65];
-measure q[0] -> meas[0];
-measure q[1] -> meas[1];
-measure q[2] -> meas[2];
-measure q[3] -> meas[3];
-measure q[4] -> meas[4];
-measure q[5] -> meas[5];
-measure q[6] -> meas[6];
-measure q[7] -> meas[7];
-measure q[8] -> meas[8];
-measure q[9] -> meas[9];
-measure q[10] -> meas[10];
-measure q[11] -> meas[11];
-measure q[12] -> meas[12];
-measure q[13] -> meas[13];
-measure q[14] -> meas[14];
-measure q[15] -> meas[15];
-measure q[16] -> meas[16];
-measure q[17] -> meas[17];
-measure q[18] -> meas[18];
-measure q[19] -> meas[19];
-measure q[20] -> meas[20];
-measure q[21] -> meas[21];
-measure q[22] -> meas[22];
-measure q[23] -> meas[23];
-measure q[24] -> meas[24];
-measure q[25] -> meas[25];
-measure q[26] -> meas[26];
-measure q[27] -> meas[27];
-measure q[28] -> meas[28];
-measure q[29] -> meas[29];
-measure q[30] -> meas[30];
-measure q[31] -> meas[31];
-measure q[32] -> meas[32];
-measure q[33] -> meas[33];
-measure q[34] -> meas[34];
-measure q[35] -> meas[35];
-measure q[36] -> meas[36];
-measure q[37] -> meas[37];
-measure q[38] -> meas[38];
-measure q[39] -> meas[39];
-measure q[40] -> meas[40];
-measure q[41] -> meas[41];
-measure q[42] -> meas[42];
-measure q[43] -> meas[43];
-measure q[44] -> meas[44];
-measure q[45] -> meas[45];
-measure q[46] -> meas[46];
-measure q[47] -> meas[47];
-measure q[48] -> meas[48];
-measure q[49] -> meas[49];
-measure q[50] -> meas[50];
-measure q[51] -> meas[51];
-measure q[52] -> meas[52];
-measure q[53] -> meas[53];
-measure q[54] -> meas[54];
-measure q[55] -> meas[55];
-measure q[56] -> meas[56];
-measure q[57] -> meas[57];
-measure q[58] -> meas[58];
-measure q[59] -> meas[59];
-measure q[60] -> meas[60];
-measure q[61] -> meas[61];
-measure q[62] -> meas[62];
-measure q[63] -> meas[63];
-measure q[64] -> meas[64];
-measure q[65] -> meas[65];
@@ -1,529 +0,0 @@
-OPENQASM 2.0;
-include "qelib1.inc";
-qreg q[66];
-creg c[66];
-creg meas[66];
-rz(pi/2) q[0];
-sx q[0];
-rz(-3.0278339) q[0];
-rz(pi/2) q[1];
-sx q[1];
-rz(-1.7983139) q[1];
-cx q[0],q[1];
-rz(1.6845551) q[1];
-cx q[0],q[1];
-rz(-0.27302102) q[1];
-rz(pi/2) q[2];
-sx q[2];
-rz(0.31356153) q[2];
-rz(pi/2) q[3];
-sx q[3];
-rz(-2.1979194) q[3];
-cx q[2],q[3];
-rz(-1.2572348) q[3];
-cx q[2],q[3];
-rz(0.54604204) q[2];
-cx q[1],q[2];
-rz(-0.27302102) q[2];
-cx q[1],q[2];
-rz(0.93575124) q[3];
-rz(pi/2) q[4];
-sx q[4];
-rz(2.8636786) q[4];
-rz(pi/2) q[5];
-sx q[5];
-rz(-1.0149683) q[5];
-cx q[4],q[5];
-rz(1.2928823) q[5];
-cx q[4],q[5];
-rz(-1.8715025) q[4];
-cx q[3],q[4];
-rz(0.93575124) q[4];
-cx q[3],q[4];
-rz(-0.79244696) q[5];
-rz(pi/2) q[6];
-sx q[6];
-rz(0.00040012679) q[6];
-rz(pi/2) q[7];
-sx q[7];
-rz(-1.5715966) q[7];
-cx q[6],q[7];
-rz(-1.5703962) q[7];
-cx q[6],q[7];
-rz(1.5848939) q[6];
-cx q[5],q[6];
-rz(-0.79244696) q[6];
-cx q[5],q[6];
-rz(-0.45987014) q[7];
-rz(pi/2) q[8];
-sx q[8];
-rz(0.53192273) q[8];
-rz(pi/2) q[9];
-sx q[9];
-rz(-2.6346418) q[9];
-cx q[8],q[9];
-rz(-1.0388736) q[9];
-cx q[8],q[9];
-rz(0.91974028) q[8];
-cx q[7],q[8];
-rz(-0.45987014) q[8];
-cx q[7],q[8];
-rz(-0.66887293) q[9];
-rz(pi/2) q[10];
-sx q[10];
-rz(2.94881) q[10];
-rz(pi/2) q[11];
-sx q[11];
-rz(-1.1852311) q[11];
-cx q[10],q[11];
-rz(1.3780137) q[11];
-cx q[10],q[11];
-rz(1.3377459) q[10];
-rz(0.26174741) q[11];
-cx q[9],q[10];
-rz(-0.66887293) q[10];
-cx q[9],q[10];
-rz(pi/2) q[12];
-sx q[12];
-rz(1.5637818) q[12];
-rz(pi/2) q[13];
-sx q[13];
-rz(1.5848253) q[13];
-cx q[12],q[13];
-rz(-0.0070144794) q[13];
-cx q[12],q[13];
-rz(-0.52349482) q[12];
-cx q[11],q[12];
-rz(0.26174741) q[12];
-cx q[11],q[12];
-rz(-0.95258407) q[13];
-rz(pi/2) q[14];
-sx q[14];
-rz(0.22681883) q[14];
-rz(pi/2) q[15];
-sx q[15];
-rz(-2.024434) q[15];
-cx q[14],q[15];
-rz(-1.3439775) q[15];
-cx q[14],q[15];
-rz(1.9051681) q[14];
-cx q[13],q[14];
-rz(-0.95258407) q[14];
-cx q[13],q[14];
-rz(0.90853417) q[15];
-rz(pi/2) q[16];
-sx q[16];
-rz(-2.9353971) q[16];
-rz(pi/2) q[17];
-sx q[17];
-rz(-1.9831875) q[17];
-cx q[16],q[17];
-rz(1.7769919) q[17];
-cx q[16],q[17];
-rz(-1.8170683) q[16];
-cx q[15],q[16];
-rz(0.90853417) q[16];
-cx q[15],q[16];
-rz(-1.998859) q[17];
-rz(pi/2) q[18];
-sx q[18];
-rz(0.038761327) q[18];
-rz(pi/2) q[19];
-sx q[19];
-rz(-1.648319) q[19];
-cx q[18],q[19];
-rz(-1.532035) q[19];
-cx q[18],q[19];
-rz(-2.2854673) q[18];
-cx q[17],q[18];
-rz(-1.998859) q[18];
-cx q[17],q[18];
-rz(1.7129122) q[19];
-rz(pi/2) q[20];
-sx q[20];
-rz(0.091710827) q[20];
-rz(pi/2) q[21];
-sx q[21];
-rz(-1.754218) q[21];
-cx q[20],q[21];
-rz(-1.4790855) q[21];
-cx q[20],q[21];
-rz(2.8573609) q[20];
-cx q[19],q[20];
-rz(1.7129122) q[20];
-cx q[19],q[20];
-rz(1.713981) q[21];
-rz(pi/2) q[22];
-sx q[22];
-rz(-3.0502867) q[22];
-rz(pi/2) q[23];
-sx q[23];
-rz(-1.7534083) q[23];
-cx q[22],q[23];
-rz(1.6621023) q[23];
-cx q[22],q[23];
-rz(2.8552233) q[22];
-cx q[21],q[22];
-rz(1.713981) q[22];
-cx q[21],q[22];
-rz(1.9973678) q[23];
-rz(pi/2) q[24];
-sx q[24];
-rz(0.22443733) q[24];
-rz(pi/2) q[25];
-sx q[25];
-rz(-2.019671) q[25];
-cx q[24],q[25];
-rz(-1.346359) q[25];
-cx q[24],q[25];
-rz(2.2884497) q[24];
-cx q[23],q[24];
-rz(1.9973678) q[24];
-cx q[23],q[24];
-rz(1.2910342) q[25];
-rz(pi/2) q[26];
-sx q[26];
-rz(2.8145009) q[26];
-rz(pi/2) q[27];
-sx q[27];
-rz(-0.91661287) q[27];
-cx q[26],q[27];
-rz(1.2437046) q[27];
-cx q[26],q[27];
-rz(-2.5820684) q[26];
-cx q[25],q[26];
-rz(1.2910342) q[26];
-cx q[25],q[26];
-rz(1.4634312) q[27];
-rz(pi/2) q[28];
-sx q[28];
-rz(0.16723483) q[28];
-rz(pi/2) q[29];
-sx q[29];
-rz(-1.905266) q[29];
-cx q[28],q[29];
-rz(-1.4035615) q[29];
-cx q[28],q[29];
-rz(-2.9268624) q[28];
-cx q[27],q[28];
-rz(1.4634312) q[28];
-cx q[27],q[28];
-rz(0.65619548) q[29];
-rz(pi/2) q[30];
-sx q[30];
-rz(0.62680102) q[30];
-rz(pi/2) q[31];
-sx q[31];
-rz(-2.8243984) q[31];
-cx q[30],q[31];
-rz(-0.94399531) q[31];
-cx q[30],q[31];
-rz(-1.312391) q[30];
-cx q[29],q[30];
-rz(0.65619548) q[30];
-cx q[29],q[30];
-rz(1.1369534) q[31];
-rz(pi/2) q[32];
-sx q[32];
-rz(1.4653178) q[32];
-rz(pi/2) q[33];
-sx q[33];
-rz(1.7817533) q[33];
-cx q[32],q[33];
-rz(-0.10547849) q[33];
-cx q[32],q[33];
-rz(-2.2739068) q[32];
-cx q[31],q[32];
-rz(1.1369534) q[32];
-cx q[31],q[32];
-rz(-0.3166508) q[33];
-rz(pi/2) q[34];
-sx q[34];
-rz(1.2496672) q[34];
-rz(pi/2) q[35];
-sx q[35];
-rz(2.2130545) q[35];
-cx q[34],q[35];
-rz(-0.32112909) q[35];
-cx q[34],q[35];
-rz(0.6333016) q[34];
-cx q[33],q[34];
-rz(-0.3166508) q[34];
-cx q[33],q[34];
-rz(1.6679692) q[35];
-rz(pi/2) q[36];
-sx q[36];
-rz(2.8259941) q[36];
-rz(pi/2) q[37];
-sx q[37];
-rz(-0.93959927) q[37];
-cx q[36],q[37];
-rz(1.2551978) q[37];
-cx q[36],q[37];
-rz(2.9472469) q[36];
-cx q[35],q[36];
-rz(1.6679692) q[36];
-cx q[35],q[36];
-rz(0.94889695) q[37];
-rz(pi/2) q[38];
-sx q[38];
-rz(2.4035439) q[38];
-rz(pi/2) q[39];
-sx q[39];
-rz(-0.094698773) q[39];
-cx q[38],q[39];
-rz(0.83274755) q[39];
-cx q[38],q[39];
-rz(-1.8977939) q[38];
-cx q[37],q[38];
-rz(0.94889695) q[38];
-cx q[37],q[38];
-rz(1.3389506) q[39];
-rz(pi/2) q[40];
-sx q[40];
-rz(1.0539178) q[40];
-rz(pi/2) q[41];
-sx q[41];
-rz(2.6045534) q[41];
-cx q[40],q[41];
-rz(-0.51687854) q[41];
-cx q[40],q[41];
-rz(-2.6779012) q[40];
-cx q[39],q[40];
-rz(1.3389506) q[40];
-cx q[39],q[40];
-rz(0.42250814) q[41];
-rz(pi/2) q[42];
-sx q[42];
-rz(-0.098159773) q[42];
-rz(pi/2) q[43];
-sx q[43];
-rz(-1.3744768) q[43];
-cx q[42],q[43];
-rz(-1.6689561) q[43];
-cx q[42],q[43];
-rz(-0.84501628) q[42];
-cx q[41],q[42];
-rz(0.42250814) q[42];
-cx q[41],q[42];
-rz(-0.16700096) q[43];
-rz(pi/2) q[44];
-sx q[44];
-rz(0.69296137) q[44];
-rz(pi/2) q[45];
-sx q[45];
-rz(-2.9567191) q[45];
-cx q[44],q[45];
-rz(-0.87783496) q[45];
-cx q[44],q[45];
-rz(0.33400192) q[44];
-cx q[43],q[44];
-rz(-0.16700096) q[44];
-cx q[43],q[44];
-rz(1.3028807) q[45];
-rz(pi/2) q[46];
-sx q[46];
-rz(-2.9206765) q[46];
-rz(pi/2) q[47];
-sx q[47];
-rz(-2.0126287) q[47];
-cx q[46],q[47];
-rz(1.7917125) q[47];
-cx q[46],q[47];
-rz(-2.6057614) q[46];
-cx q[45],q[46];
-rz(1.3028807) q[46];
-cx q[45],q[46];
-rz(-1.8720307) q[47];
-rz(pi/2) q[48];
-sx q[48];
-rz(2.4239844) q[48];
-rz(pi/2) q[49];
-sx q[49];
-rz(-0.13557989) q[49];
-cx q[48],q[49];
-rz(0.85318811) q[49];
-cx q[48],q[49];
-rz(-2.5391239) q[48];
-cx q[47],q[48];
-rz(-1.8720307) q[48];
-cx q[47],q[48];
-rz(-1.1861875) q[49];
-rz(pi/2) q[50];
-sx q[50];
-rz(2.6715011) q[50];
-rz(pi/2) q[51];
-sx q[51];
-rz(-0.63061327) q[51];
-cx q[50],q[51];
-rz(1.1007048) q[51];
-cx q[50],q[51];
-rz(2.372375) q[50];
-cx q[49],q[50];
-rz(-1.1861875) q[50];
-cx q[49],q[50];
-rz(-0.11663793) q[51];
-rz(pi/2) q[52];
-sx q[52];
-rz(2.8082102) q[52];
-rz(pi/2) q[53];
-sx q[53];
-rz(-0.90403147) q[53];
-cx q[52],q[53];
-rz(1.2374139) q[53];
-cx q[52],q[53];
-rz(0.23327586) q[52];
-cx q[51],q[52];
-rz(-0.11663793) q[52];
-cx q[51],q[52];
-rz(1.7434165) q[53];
-rz(pi/2) q[54];
-sx q[54];
-rz(2.4398032) q[54];
-rz(pi/2) q[55];
-sx q[55];
-rz(-0.16721749) q[55];
-cx q[54],q[55];
-rz(0.86900691) q[55];
-cx q[54],q[55];
-rz(2.7963523) q[54];
-cx q[53],q[54];
-rz(1.7434165) q[54];
-cx q[53],q[54];
-rz(1.9586679) q[55];
-rz(pi/2) q[56];
-sx q[56];
-rz(1.495252) q[56];
-rz(pi/2) q[57];
-sx q[57];
-rz(1.7218849) q[57];
-cx q[56],q[57];
-rz(-0.075544295) q[57];
-cx q[56],q[57];
-rz(2.3658495) q[56];
-cx q[55],q[56];
-rz(1.9586679) q[56];
-cx q[55],q[56];
-rz(-0.91863643) q[57];
-rz(pi/2) q[58];
-sx q[58];
-rz(-2.7456925) q[58];
-rz(pi/2) q[59];
-sx q[59];
-rz(-2.3625967) q[59];
-cx q[58],q[59];
-rz(1.9666965) q[59];
-cx q[58],q[59];
-rz(1.8372729) q[58];
-cx q[57],q[58];
-rz(-0.91863643) q[58];
-cx q[57],q[58];
-rz(-1.378703) q[59];
-rz(pi/2) q[60];
-sx q[60];
-rz(0.67753963) q[60];
-rz(pi/2) q[61];
-sx q[61];
-rz(-2.9258756) q[61];
-cx q[60],q[61];
-rz(-0.8932567) q[61];
-cx q[60],q[61];
-rz(2.757406) q[60];
-cx q[59],q[60];
-rz(-1.378703) q[60];
-cx q[59],q[60];
-rz(1.2285706) q[61];
-rz(pi/2) q[62];
-sx q[62];
-rz(2.646146) q[62];
-rz(pi/2) q[63];
-sx q[63];
-rz(-0.57990307) q[63];
-cx q[62],q[63];
-rz(1.0753497) q[63];
-cx q[62],q[63];
-rz(-2.4571412) q[62];
-cx q[61],q[62];
-rz(1.2285706) q[62];
-cx q[61],q[62];
-rz(0.28670827) q[63];
-rz(pi/2) q[64];
-sx q[64];
-rz(1.3353478) q[64];
-rz(pi/2) q[65];
-sx q[65];
-rz(2.0416933) q[65];
-cx q[64],q[65];
-rz(-0.23544851) q[65];
-cx q[64],q[65];
-rz(-0.57341654) q[64];
-cx q[63],q[64];
-rz(0.28670827) q[64];
-cx q[63],q[64];
-barrier q[0],q[1],q[2],q[3],q[4],q[5],q[6],q[7],q[8],q[9],q[10],q[11],q[12],q[13],q[14],q[15],q[16],q[17],q[18],q[19],q[20],q[21],q[22],q[23],q[24],q[25],q[26],q[27],q[28],q[29],q[30],q[31],q[32],q[33],q[34],q[35],q[36],q[37],q[38],q[39],q[40],q[41],q[42],q[43],q[44],q[45],q[46],q[47],q[48],q[49],q[50],q[51],q[52],q[53],q[54],q[55],q[56],q[57],q[58],q[59],q[60],q[61],q[62],q[63],q[64],q[65];
-measure q[0] -> meas[0];
-measure q[1] -> meas[1];
-measure q[2] -> meas[2];
-measure q[3] -> meas[3];
-measure q[4] -> meas[4];
-measure q[5] -> meas[5];
-measure q[6] -> meas[6];
-measure q[7] -> meas[7];
-measure q[8] -> meas[8];
-measure q[9] -> meas[9];
-measure q[10] -> meas[10];
-measure q[11] -> meas[11];
-measure q[12] -> meas[12];
-measure q[13] -> meas[13];
-measure q[14] -> meas[14];
-measure q[15] -> meas[15];
-measure q[16] -> meas[16];
-measure q[17] -> meas[17];
-measure q[18] -> meas[18];
-measure q[19] -> meas[19];
-measure q[20] -> meas[20];
-measure q[21] -> meas[21];
-measure q[22] -> meas[22];
-measure q[23] -> meas[23];
-measure q[24] -> meas[24];
-measure q[25] -> meas[25];
-measure q[26] -> meas[26];
-measure q[27] -> meas[27];
-measure q[28] -> meas[28];
-measure q[29] -> meas[29];
-measure q[30] -> meas[30];
-measure q[31] -> meas[31];
-measure q[32] -> meas[32];
-measure q[33] -> meas[33];
-measure q[34] -> meas[34];
-measure q[35] -> meas[35];
-measure q[36] -> meas[36];
-measure q[37] -> meas[37];
-measure q[38] -> meas[38];
-measure q[39] -> meas[39];
-measure q[40] -> meas[40];
-measure q[41] -> meas[41];
-measure q[42] -> meas[42];
-measure q[43] -> meas[43];
-measure q[44] -> meas[44];
-measure q[45] -> meas[45];
-measure q[46] -> meas[46];
-measure q[47] -> meas[47];
-measure q[48] -> meas[48];
-measure q[49] -> meas[49];
-measure q[50] -> meas[50];
-measure q[51] -> meas[51];
-measure q[52] -> meas[52];
-measure q[53] -> meas[53];
-measure q[54] -> meas[54];
-measure q[55] -> meas[55];
-measure q[56] -> meas[56];
-measure q[57] -> meas[57];
-measure q[58] -> meas[58];
-measure q[59] -> meas[59];
-measure q[60] -> meas[60];
-measure q[61] -> meas[61];
-measure q[62] -> meas[62];
-measure q[63] -> meas[63];
-measure q[64] -> meas[64];
-measure q[65] -> meas[65];
@@ -1,1176 +0,0 @@
-OPENQASM 2.0;
-include "qelib1.inc";
-qreg q[98];
-creg c[98];
-creg meas[98];
-h q[0];
-h q[1];
-h q[2];
-h q[3];
-h q[4];
-h q[5];
-h q[6];
-h q[7];
-h q[8];
-h q[9];
-h q[10];
-h q[11];
-h q[12];
-h q[13];
-h q[14];
-h q[15];
-h q[16];
-h q[17];
-h q[18];
-h q[19];
-h q[20];
-h q[21];
-h q[22];
-h q[23];
-h q[24];
-h q[25];
-h q[26];
-h q[27];
-h q[28];
-h q[29];
-h q[30];
-h q[31];
-h q[32];
-h q[33];
-h q[34];
-h q[35];
-h q[36];
-h q[37];
-h q[38];
-h q[39];
-h q[40];
-h q[41];
-h q[42];
-h q[43];
-h q[44];
-h q[45];
-h q[46];
-h q[47];
-h q[48];
-h q[49];
-h q[50];
-h q[51];
-h q[52];
-h q[53];
-h q[54];
-h q[55];
-h q[56];
-h q[57];
-h q[58];
-h q[59];
-h q[60];
-h q[61];
-h q[62];
-h q[63];
-h q[64];
-h q[65];
-h q[66];
-h q[67];
-h q[68];
-h q[69];
-h q[70];
-h q[71];
-h q[72];
-h q[73];
-h q[74];
-h q[75];
-h q[76];
-h q[77];
-h q[78];
-h q[79];
-h q[80];
-h q[81];
-h q[82];
-h q[83];
-h q[84];
-h q[85];
-h q[86];
-h q[87];
-h q[88];
-h q[89];
-h q[90];
-h q[91];
-h q[92];
-h q[93];
-h q[94];
-h q[95];
-h q[96];
-h q[97];
-rz(-0.10547849) q[0];
-rz(0.10547849) q[1];
-rz(0.10547849) q[1];
-cx q[0],q[1];
-rz(-0.10547849) q[1];
-cx q[0],q[1];
-rz(-0.32112909) q[2];
-rz(0.32112909) q[3];
-rz(0.32112909) q[3];
-cx q[2],q[3];
-rz(-0.32112909) q[3];
-cx q[2],q[3];
-rz(1.2551978) q[4];
-rz(-1.2551978) q[5];
-rz(-1.2551978) q[5];
-cx q[4],q[5];
-rz(1.2551978) q[5];
-cx q[4],q[5];
-rz(0.83274755) q[6];
-rz(-0.83274755) q[7];
-rz(-0.83274755) q[7];
-cx q[6],q[7];
-rz(0.83274755) q[7];
-cx q[6],q[7];
-rz(-0.51687854) q[8];
-rz(0.51687854) q[9];
-rz(0.51687854) q[9];
-cx q[8],q[9];
-rz(-0.51687854) q[9];
-cx q[8],q[9];
-rz(-1.6689561) q[10];
-rz(1.6689561) q[11];
-rz(1.6689561) q[11];
-cx q[10],q[11];
-rz(-1.6689561) q[11];
-cx q[10],q[11];
-rz(-0.87783496) q[12];
-rz(0.87783496) q[13];
-rz(0.87783496) q[13];
-cx q[12],q[13];
-rz(-0.87783496) q[13];
-cx q[12],q[13];
-rz(1.7917125) q[14];
-rz(-1.7917125) q[15];
-rz(-1.7917125) q[15];
-cx q[14],q[15];
-rz(1.7917125) q[15];
-cx q[14],q[15];
-rz(0.85318811) q[16];
-rz(-0.85318811) q[17];
-rz(-0.85318811) q[17];
-cx q[16],q[17];
-rz(0.85318811) q[17];
-cx q[16],q[17];
-rz(1.1007048) q[18];
-rz(-1.1007048) q[19];
-rz(-1.1007048) q[19];
-cx q[18],q[19];
-rz(1.1007048) q[19];
-cx q[18],q[19];
-rz(1.2374139) q[20];
-rz(-1.2374139) q[21];
-rz(-1.2374139) q[21];
-cx q[20],q[21];
-rz(1.2374139) q[21];
-cx q[20],q[21];
-rz(0.86900691) q[22];
-rz(-0.86900691) q[23];
-rz(-0.86900691) q[23];
-cx q[22],q[23];
-rz(0.86900691) q[23];
-cx q[22],q[23];
-rz(-0.075544295) q[24];
-rz(0.075544295) q[25];
-rz(0.075544295) q[25];
-cx q[24],q[25];
-rz(-0.075544295) q[25];
-cx q[24],q[25];
-rz(1.9666965) q[26];
-rz(-1.9666965) q[27];
-rz(-1.9666965) q[27];
-cx q[26],q[27];
-rz(1.9666965) q[27];
-cx q[26],q[27];
-rz(-0.8932567) q[28];
-rz(0.8932567) q[29];
-rz(0.8932567) q[29];
-cx q[28],q[29];
-rz(-0.8932567) q[29];
-cx q[28],q[29];
-rz(1.0753497) q[30];
-rz(-1.0753497) q[31];
-rz(-1.0753497) q[31];
-cx q[30],q[31];
-rz(1.0753497) q[31];
-cx q[30],q[31];
-rz(-0.23544851) q[32];
-rz(0.23544851) q[33];
-rz(0.23544851) q[33];
-cx q[32],q[33];
-rz(-0.23544851) q[33];
-cx q[32],q[33];
-rz(-0.12767731) q[34];
-rz(0.12767731) q[35];
-rz(0.12767731) q[35];
-cx q[34],q[35];
-rz(-0.12767731) q[35];
-cx q[34],q[35];
-rz(-0.30930673) q[36];
-rz(0.30930673) q[37];
-rz(0.30930673) q[37];
-cx q[36],q[37];
-rz(-0.30930673) q[37];
-cx q[36],q[37];
-rz(0.70850212) q[38];
-rz(-0.70850212) q[39];
-rz(-0.70850212) q[39];
-cx q[38],q[39];
-rz(0.70850212) q[39];
-cx q[38],q[39];
-rz(0.38802256) q[40];
-rz(-0.38802256) q[41];
-rz(-0.38802256) q[41];
-cx q[40],q[41];
-rz(0.38802256) q[41];
-cx q[40],q[41];
-rz(1.4663664) q[42];
-rz(-1.4663664) q[43];
-rz(-1.4663664) q[43];
-cx q[42],q[43];
-rz(1.4663664) q[43];
-cx q[42],q[43];
-rz(-0.48835821) q[44];
-rz(0.48835821) q[45];
-rz(0.48835821) q[45];
-cx q[44],q[45];
-rz(-0.48835821) q[45];
-cx q[44],q[45];
-rz(-0.98827906) q[46];
-rz(0.98827906) q[47];
-rz(0.98827906) q[47];
-cx q[46],q[47];
-rz(-0.98827906) q[47];
-cx q[46],q[47];
-rz(-0.34934642) q[48];
-rz(0.34934642) q[49];
-rz(0.34934642) q[49];
-cx q[48],q[49];
-rz(-0.34934642) q[49];
-cx q[48],q[49];
-rz(1.0319207) q[50];
-rz(-1.0319207) q[51];
-rz(-1.0319207) q[51];
-cx q[50],q[51];
-rz(1.0319207) q[51];
-cx q[50],q[51];
-rz(1.9122996) q[52];
-rz(-1.9122996) q[53];
-rz(-1.9122996) q[53];
-cx q[52],q[53];
-rz(1.9122996) q[53];
-cx q[52],q[53];
-rz(1.9124291) q[54];
-rz(-1.9124291) q[55];
-rz(-1.9124291) q[55];
-cx q[54],q[55];
-rz(1.9124291) q[55];
-cx q[54],q[55];
-rz(-1.935039) q[56];
-rz(1.935039) q[57];
-rz(1.935039) q[57];
-cx q[56],q[57];
-rz(-1.935039) q[57];
-cx q[56],q[57];
-rz(1.3289371) q[58];
-rz(-1.3289371) q[59];
-rz(-1.3289371) q[59];
-cx q[58],q[59];
-rz(1.3289371) q[59];
-cx q[58],q[59];
-rz(0.94895207) q[60];
-rz(-0.94895207) q[61];
-rz(-0.94895207) q[61];
-cx q[60],q[61];
-rz(0.94895207) q[61];
-cx q[60],q[61];
-rz(0.59986361) q[62];
-rz(-0.59986361) q[63];
-rz(-0.59986361) q[63];
-cx q[62],q[63];
-rz(0.59986361) q[63];
-cx q[62],q[63];
-rz(-0.19204913) q[64];
-rz(0.19204913) q[65];
-rz(0.19204913) q[65];
-cx q[64],q[65];
-rz(-0.19204913) q[65];
-cx q[64],q[65];
-rz(0.65661787) q[66];
-rz(-0.65661787) q[67];
-rz(-0.65661787) q[67];
-cx q[66],q[67];
-rz(0.65661787) q[67];
-cx q[66],q[67];
-rz(1.6385177) q[68];
-rz(-1.6385177) q[69];
-rz(-1.6385177) q[69];
-cx q[68],q[69];
-rz(1.6385177) q[69];
-cx q[68],q[69];
-rz(-1.7755501) q[70];
-rz(1.7755501) q[71];
-rz(1.7755501) q[71];
-cx q[70],q[71];
-rz(-1.7755501) q[71];
-cx q[70],q[71];
-rz(0.17121033) q[72];
-rz(-0.17121033) q[73];
-rz(-0.17121033) q[73];
-cx q[72],q[73];
-rz(0.17121033) q[73];
-cx q[72],q[73];
-rz(0.42230428) q[74];
-rz(-0.42230428) q[75];
-rz(-0.42230428) q[75];
-cx q[74],q[75];
-rz(0.42230428) q[75];
-cx q[74],q[75];
-rz(1.8346869) q[76];
-rz(-1.8346869) q[77];
-rz(-1.8346869) q[77];
-cx q[76],q[77];
-rz(1.8346869) q[77];
-cx q[76],q[77];
-rz(0.4499326) q[78];
-rz(-0.4499326) q[79];
-rz(-0.4499326) q[79];
-cx q[78],q[79];
-rz(0.4499326) q[79];
-cx q[78],q[79];
-rz(1.5614571) q[80];
-rz(-1.5614571) q[81];
-rz(-1.5614571) q[81];
-cx q[80],q[81];
-rz(1.5614571) q[81];
-cx q[80],q[81];
-rz(1.5218396) q[82];
-rz(-1.5218396) q[83];
-rz(-1.5218396) q[83];
-cx q[82],q[83];
-rz(1.5218396) q[83];
-cx q[82],q[83];
-rz(1.4987176) q[84];
-rz(-1.4987176) q[85];
-rz(-1.4987176) q[85];
-cx q[84],q[85];
-rz(1.4987176) q[85];
-cx q[84],q[85];
-rz(-0.59128614) q[86];
-rz(0.59128614) q[87];
-rz(0.59128614) q[87];
-cx q[86],q[87];
-rz(-0.59128614) q[87];
-cx q[86],q[87];
-rz(-1.363435) q[88];
-rz(1.363435) q[89];
-rz(1.363435) q[89];
-cx q[88],q[89];
-rz(-1.363435) q[89];
-cx q[88],q[89];
-rz(-1.6723291) q[90];
-rz(1.6723291) q[91];
-rz(1.6723291) q[91];
-cx q[90],q[91];
-rz(-1.6723291) q[91];
-cx q[90],q[91];
-rz(-0.79271136) q[92];
-rz(0.79271136) q[93];
-rz(0.79271136) q[93];
-cx q[92],q[93];
-rz(-0.79271136) q[93];
-cx q[92],q[93];
-rz(-0.78315718) q[94];
-rz(0.78315718) q[95];
-rz(0.78315718) q[95];
-cx q[94],q[95];
-rz(-0.78315718) q[95];
-cx q[94],q[95];
-rz(-0.35141842) q[96];
-rz(0.35141842) q[97];
-rz(0.35141842) q[97];
-cx q[96],q[97];
-rz(-0.35141842) q[97];
-cx q[96],q[97];
-rz(-0.3166508) q[1];
-rz(0.3166508) q[2];
-rz(0.3166508) q[2];
-cx q[1],q[2];
-rz(-0.3166508) q[2];
-cx q[1],q[2];
-rz(1.6679692) q[3];
-rz(-1.6679692) q[4];
-rz(-1.6679692) q[4];
-cx q[3],q[4];
-rz(1.6679692) q[4];
-cx q[3],q[4];
-rz(0.94889695) q[5];
-rz(-0.94889695) q[6];
-rz(-0.94889695) q[6];
-cx q[5],q[6];
-rz(0.94889695) q[6];
-cx q[5],q[6];
-rz(1.3389506) q[7];
-rz(-1.3389506) q[8];
-rz(-1.3389506) q[8];
-cx q[7],q[8];
-rz(1.3389506) q[8];
-cx q[7],q[8];
-rz(0.42250814) q[9];
-rz(-0.42250814) q[10];
-rz(-0.42250814) q[10];
-cx q[9],q[10];
-rz(0.42250814) q[10];
-cx q[9],q[10];
-rz(-0.16700096) q[11];
-rz(0.16700096) q[12];
-rz(0.16700096) q[12];
-cx q[11],q[12];
-rz(-0.16700096) q[12];
-cx q[11],q[12];
-rz(1.3028807) q[13];
-rz(-1.3028807) q[14];
-rz(-1.3028807) q[14];
-cx q[13],q[14];
-rz(1.3028807) q[14];
-cx q[13],q[14];
-rz(-1.8720307) q[15];
-rz(1.8720307) q[16];
-rz(1.8720307) q[16];
-cx q[15],q[16];
-rz(-1.8720307) q[16];
-cx q[15],q[16];
-rz(-1.1861875) q[17];
-rz(1.1861875) q[18];
-rz(1.1861875) q[18];
-cx q[17],q[18];
-rz(-1.1861875) q[18];
-cx q[17],q[18];
-rz(-0.11663793) q[19];
-rz(0.11663793) q[20];
-rz(0.11663793) q[20];
-cx q[19],q[20];
-rz(-0.11663793) q[20];
-cx q[19],q[20];
-rz(1.7434165) q[21];
-rz(-1.7434165) q[22];
-rz(-1.7434165) q[22];
-cx q[21],q[22];
-rz(1.7434165) q[22];
-cx q[21],q[22];
-rz(1.9586679) q[23];
-rz(-1.9586679) q[24];
-rz(-1.9586679) q[24];
-cx q[23],q[24];
-rz(1.9586679) q[24];
-cx q[23],q[24];
-rz(-0.91863643) q[25];
-rz(0.91863643) q[26];
-rz(0.91863643) q[26];
-cx q[25],q[26];
-rz(-0.91863643) q[26];
-cx q[25],q[26];
-rz(-1.378703) q[27];
-rz(1.378703) q[28];
-rz(1.378703) q[28];
-cx q[27],q[28];
-rz(-1.378703) q[28];
-cx q[27],q[28];
-rz(1.2285706) q[29];
-rz(-1.2285706) q[30];
-rz(-1.2285706) q[30];
-cx q[29],q[30];
-rz(1.2285706) q[30];
-cx q[29],q[30];
-rz(0.28670827) q[31];
-rz(-0.28670827) q[32];
-rz(-0.28670827) q[32];
-cx q[31],q[32];
-rz(0.28670827) q[32];
-cx q[31],q[32];
-rz(0.19762375) q[33];
-rz(-0.19762375) q[34];
-rz(-0.19762375) q[34];
-cx q[33],q[34];
-rz(0.19762375) q[34];
-cx q[33],q[34];
-rz(-0.20921184) q[35];
-rz(0.20921184) q[36];
-rz(0.20921184) q[36];
-cx q[35],q[36];
-rz(-0.20921184) q[36];
-cx q[35],q[36];
-rz(0.018508709) q[37];
-rz(-0.018508709) q[38];
-rz(-0.018508709) q[38];
-cx q[37],q[38];
-rz(0.018508709) q[38];
-cx q[37],q[38];
-rz(-0.35743569) q[39];
-rz(0.35743569) q[40];
-rz(0.35743569) q[40];
-cx q[39],q[40];
-rz(-0.35743569) q[40];
-cx q[39],q[40];
-rz(0.78440702) q[41];
-rz(-0.78440702) q[42];
-rz(-0.78440702) q[42];
-cx q[41],q[42];
-rz(0.78440702) q[42];
-cx q[41],q[42];
-rz(1.9154828) q[43];
-rz(-1.9154828) q[44];
-rz(-1.9154828) q[44];
-cx q[43],q[44];
-rz(1.9154828) q[44];
-cx q[43],q[44];
-rz(1.0147279) q[45];
-rz(-1.0147279) q[46];
-rz(-1.0147279) q[46];
-cx q[45],q[46];
-rz(1.0147279) q[46];
-cx q[45],q[46];
-rz(0.37307477) q[47];
-rz(-0.37307477) q[48];
-rz(-0.37307477) q[48];
-cx q[47],q[48];
-rz(0.37307477) q[48];
-cx q[47],q[48];
-rz(1.8344785) q[49];
-rz(-1.8344785) q[50];
-rz(-1.8344785) q[50];
-cx q[49],q[50];
-rz(1.8344785) q[50];
-cx q[49],q[50];
-rz(-1.9106685) q[51];
-rz(1.9106685) q[52];
-rz(1.9106685) q[52];
-cx q[51],q[52];
-rz(-1.9106685) q[52];
-cx q[51],q[52];
-rz(1.3210816) q[53];
-rz(-1.3210816) q[54];
-rz(-1.3210816) q[54];
-cx q[53],q[54];
-rz(1.3210816) q[54];
-cx q[53],q[54];
-rz(-0.7303086) q[55];
-rz(0.7303086) q[56];
-rz(0.7303086) q[56];
-cx q[55],q[56];
-rz(-0.7303086) q[56];
-cx q[55],q[56];
-rz(0.33347611) q[57];
-rz(-0.33347611) q[58];
-rz(-0.33347611) q[58];
-cx q[57],q[58];
-rz(0.33347611) q[58];
-cx q[57],q[58];
-rz(-1.6503585) q[59];
-rz(1.6503585) q[60];
-rz(1.6503585) q[60];
-cx q[59],q[60];
-rz(-1.6503585) q[60];
-cx q[59],q[60];
-rz(-1.3871256) q[61];
-rz(1.3871256) q[62];
-rz(1.3871256) q[62];
-cx q[61],q[62];
-rz(-1.3871256) q[62];
-cx q[61],q[62];
-rz(1.7412821) q[63];
-rz(-1.7412821) q[64];
-rz(-1.7412821) q[64];
-cx q[63],q[64];
-rz(1.7412821) q[64];
-cx q[63],q[64];
-rz(1.3090213) q[65];
-rz(-1.3090213) q[66];
-rz(-1.3090213) q[66];
-cx q[65],q[66];
-rz(1.3090213) q[66];
-cx q[65],q[66];
-rz(-0.25871319) q[67];
-rz(0.25871319) q[68];
-rz(0.25871319) q[68];
-cx q[67],q[68];
-rz(-0.25871319) q[68];
-cx q[67],q[68];
-rz(-0.80006361) q[69];
-rz(0.80006361) q[70];
-rz(0.80006361) q[70];
-cx q[69],q[70];
-rz(-0.80006361) q[70];
-cx q[69],q[70];
-rz(-0.11523599) q[71];
-rz(0.11523599) q[72];
-rz(0.11523599) q[72];
-cx q[71],q[72];
-rz(-0.11523599) q[72];
-cx q[71],q[72];
-rz(0.17468742) q[73];
-rz(-0.17468742) q[74];
-rz(-0.17468742) q[74];
-cx q[73],q[74];
-rz(0.17468742) q[74];
-cx q[73],q[74];
-rz(1.0842291) q[75];
-rz(-1.0842291) q[76];
-rz(-1.0842291) q[76];
-cx q[75],q[76];
-rz(1.0842291) q[76];
-cx q[75],q[76];
-rz(-1.6278165) q[77];
-rz(1.6278165) q[78];
-rz(1.6278165) q[78];
-cx q[77],q[78];
-rz(-1.6278165) q[78];
-cx q[77],q[78];
-rz(1.7280133) q[79];
-rz(-1.7280133) q[80];
-rz(-1.7280133) q[80];
-cx q[79],q[80];
-rz(1.7280133) q[80];
-cx q[79],q[80];
-rz(-1.1939662) q[81];
-rz(1.1939662) q[82];
-rz(1.1939662) q[82];
-cx q[81],q[82];
-rz(-1.1939662) q[82];
-cx q[81],q[82];
-rz(1.4127416) q[83];
-rz(-1.4127416) q[84];
-rz(-1.4127416) q[84];
-cx q[83],q[84];
-rz(1.4127416) q[84];
-cx q[83],q[84];
-rz(0.56706812) q[85];
-rz(-0.56706812) q[86];
-rz(-0.56706812) q[86];
-cx q[85],q[86];
-rz(0.56706812) q[86];
-cx q[85],q[86];
-rz(1.1411538) q[87];
-rz(-1.1411538) q[88];
-rz(-1.1411538) q[88];
-cx q[87],q[88];
-rz(1.1411538) q[88];
-cx q[87],q[88];
-rz(-1.2546659) q[89];
-rz(1.2546659) q[90];
-rz(1.2546659) q[90];
-cx q[89],q[90];
-rz(-1.2546659) q[90];
-cx q[89],q[90];
-rz(0.61837496) q[91];
-rz(-0.61837496) q[92];
-rz(-0.61837496) q[92];
-cx q[91],q[92];
-rz(0.61837496) q[92];
-cx q[91],q[92];
-rz(-0.47237304) q[93];
-rz(0.47237304) q[94];
-rz(0.47237304) q[94];
-cx q[93],q[94];
-rz(-0.47237304) q[94];
-cx q[93],q[94];
-rz(-0.88586084) q[95];
-rz(0.88586084) q[96];
-rz(0.88586084) q[96];
-cx q[95],q[96];
-rz(-0.88586084) q[96];
-cx q[95],q[96];
-h q[0];
-rz(0) q[0];
-h q[0];
-rz(0) q[0];
-h q[1];
-rz(0) q[1];
-h q[1];
-rz(0) q[1];
-h q[2];
-rz(0) q[2];
-h q[2];
-rz(0) q[2];
-h q[3];
-rz(0) q[3];
-h q[3];
-rz(0) q[3];
-h q[4];
-rz(0) q[4];
-h q[4];
-rz(0) q[4];
-h q[5];
-rz(0) q[5];
-h q[5];
-rz(0) q[5];
-h q[6];
-rz(0) q[6];
-h q[6];
-rz(0) q[6];
-h q[7];
-rz(0) q[7];
-h q[7];
-rz(0) q[7];
-h q[8];
-rz(0) q[8];
-h q[8];
-rz(0) q[8];
-h q[9];
-rz(0) q[9];
-h q[9];
-rz(0) q[9];
-h q[10];
-rz(0) q[10];
-h q[10];
-rz(0) q[10];
-h q[11];
-rz(0) q[11];
-h q[11];
-rz(0) q[11];
-h q[12];
-rz(0) q[12];
-h q[12];
-rz(0) q[12];
-h q[13];
-rz(0) q[13];
-h q[13];
-rz(0) q[13];
-h q[14];
-rz(0) q[14];
-h q[14];
-rz(0) q[14];
-h q[15];
-rz(0) q[15];
-h q[15];
-rz(0) q[15];
-h q[16];
-rz(0) q[16];
-h q[16];
-rz(0) q[16];
-h q[17];
-rz(0) q[17];
-h q[17];
-rz(0) q[17];
-h q[18];
-rz(0) q[18];
-h q[18];
-rz(0) q[18];
-h q[19];
-rz(0) q[19];
-h q[19];
-rz(0) q[19];
-h q[20];
-rz(0) q[20];
-h q[20];
-rz(0) q[20];
-h q[21];
-rz(0) q[21];
-h q[21];
-rz(0) q[21];
-h q[22];
-rz(0) q[22];
-h q[22];
-rz(0) q[22];
-h q[23];
-rz(0) q[23];
-h q[23];
-rz(0) q[23];
-h q[24];
-rz(0) q[24];
-h q[24];
-rz(0) q[24];
-h q[25];
-rz(0) q[25];
-h q[25];
-rz(0) q[25];
-h q[26];
-rz(0) q[26];
-h q[26];
-rz(0) q[26];
-h q[27];
-rz(0) q[27];
-h q[27];
-rz(0) q[27];
-h q[28];
-rz(0) q[28];
-h q[28];
-rz(0) q[28];
-h q[29];
-rz(0) q[29];
-h q[29];
-rz(0) q[29];
-h q[30];
-rz(0) q[30];
-h q[30];
-rz(0) q[30];
-h q[31];
-rz(0) q[31];
-h q[31];
-rz(0) q[31];
-h q[32];
-rz(0) q[32];
-h q[32];
-rz(0) q[32];
-h q[33];
-rz(0) q[33];
-h q[33];
-rz(0) q[33];
-h q[34];
-rz(0) q[34];
-h q[34];
-rz(0) q[34];
-h q[35];
-rz(0) q[35];
-h q[35];
-rz(0) q[35];
-h q[36];
-rz(0) q[36];
-h q[36];
-rz(0) q[36];
-h q[37];
-rz(0) q[37];
-h q[37];
-rz(0) q[37];
-h q[38];
-rz(0) q[38];
-h q[38];
-rz(0) q[38];
-h q[39];
-rz(0) q[39];
-h q[39];
-rz(0) q[39];
-h q[40];
-rz(0) q[40];
-h q[40];
-rz(0) q[40];
-h q[41];
-rz(0) q[41];
-h q[41];
-rz(0) q[41];
-h q[42];
-rz(0) q[42];
-h q[42];
-rz(0) q[42];
-h q[43];
-rz(0) q[43];
-h q[43];
-rz(0) q[43];
-h q[44];
-rz(0) q[44];
-h q[44];
-rz(0) q[44];
-h q[45];
-rz(0) q[45];
-h q[45];
-rz(0) q[45];
-h q[46];
-rz(0) q[46];
-h q[46];
-rz(0) q[46];
-h q[47];
-rz(0) q[47];
-h q[47];
-rz(0) q[47];
-h q[48];
-rz(0) q[48];
-h q[48];
-rz(0) q[48];
-h q[49];
-rz(0) q[49];
-h q[49];
-rz(0) q[49];
-h q[50];
-rz(0) q[50];
-h q[50];
-rz(0) q[50];
-h q[51];
-rz(0) q[51];
-h q[51];
-rz(0) q[51];
-h q[52];
-rz(0) q[52];
-h q[52];
-rz(0) q[52];
-h q[53];
-rz(0) q[53];
-h q[53];
-rz(0) q[53];
-h q[54];
-rz(0) q[54];
-h q[54];
-rz(0) q[54];
-h q[55];
-rz(0) q[55];
-h q[55];
-rz(0) q[55];
-h q[56];
-rz(0) q[56];
-h q[56];
-rz(0) q[56];
-h q[57];
-rz(0) q[57];
-h q[57];
-rz(0) q[57];
-h q[58];
-rz(0) q[58];
-h q[58];
-rz(0) q[58];
-h q[59];
-rz(0) q[59];
-h q[59];
-rz(0) q[59];
-h q[60];
-rz(0) q[60];
-h q[60];
-rz(0) q[60];
-h q[61];
-rz(0) q[61];
-h q[61];
-rz(0) q[61];
-h q[62];
-rz(0) q[62];
-h q[62];
-rz(0) q[62];
-h q[63];
-rz(0) q[63];
-h q[63];
-rz(0) q[63];
-h q[64];
-rz(0) q[64];
-h q[64];
-rz(0) q[64];
-h q[65];
-rz(0) q[65];
-h q[65];
-rz(0) q[65];
-h q[66];
-rz(0) q[66];
-h q[66];
-rz(0) q[66];
-h q[67];
-rz(0) q[67];
-h q[67];
-rz(0) q[67];
-h q[68];
-rz(0) q[68];
-h q[68];
-rz(0) q[68];
-h q[69];
-rz(0) q[69];
-h q[69];
-rz(0) q[69];
-h q[70];
-rz(0) q[70];
-h q[70];
-rz(0) q[70];
-h q[71];
-rz(0) q[71];
-h q[71];
-rz(0) q[71];
-h q[72];
-rz(0) q[72];
-h q[72];
-rz(0) q[72];
-h q[73];
-rz(0) q[73];
-h q[73];
-rz(0) q[73];
-h q[74];
-rz(0) q[74];
-h q[74];
-rz(0) q[74];
-h q[75];
-rz(0) q[75];
-h q[75];
-rz(0) q[75];
-h q[76];
-rz(0) q[76];
-h q[76];
-rz(0) q[76];
-h q[77];
-rz(0) q[77];
-h q[77];
-rz(0) q[77];
-h q[78];
-rz(0) q[78];
-h q[78];
-rz(0) q[78];
-h q[79];
-rz(0) q[79];
-h q[79];
-rz(0) q[79];
-h q[80];
-rz(0) q[80];
-h q[80];
-rz(0) q[80];
-h q[81];
-rz(0) q[81];
-h q[81];
-rz(0) q[81];
-h q[82];
-rz(0) q[82];
-h q[82];
-rz(0) q[82];
-h q[83];
-rz(0) q[83];
-h q[83];
-rz(0) q[83];
-h q[84];
-rz(0) q[84];
-h q[84];
-rz(0) q[84];
-h q[85];
-rz(0) q[85];
-h q[85];
-rz(0) q[85];
-h q[86];
-rz(0) q[86];
-h q[86];
-rz(0) q[86];
-h q[87];
-rz(0) q[87];
-h q[87];
-rz(0) q[87];
-h q[88];
-rz(0) q[88];
-h q[88];
-rz(0) q[88];
-h q[89];
-rz(0) q[89];
-h q[89];
-rz(0) q[89];
-h q[90];
-rz(0) q[90];
-h q[90];
-rz(0) q[90];
-h q[91];
-rz(0) q[91];
-h q[91];
-rz(0) q[91];
-h q[92];
-rz(0) q[92];
-h q[92];
-rz(0) q[92];
-h q[93];
-rz(0) q[93];
-h q[93];
-rz(0) q[93];
-h q[94];
-rz(0) q[94];
-h q[94];
-rz(0) q[94];
-h q[95];
-rz(0) q[95];
-h q[95];
-rz(0) q[95];
-h q[96];
-rz(0) q[96];
-h q[96];
-rz(0) q[96];
-h q[97];
-rz(0) q[97];
-h q[97];
-rz(0) q[97];
-barrier q[0],q[1],q[2],q[3],q[4],q[5],q[6],q[7],q[8],q[9],q[10],q[11],q[12],q[13],q[14],q[15],q[16],q[17],q[18],q[19],q[20],q[21],q[22],q[23],q[24],q[25],q[26],q[27],q[28],q[29],q[30],q[31],q[32],q[33],q[34],q[35],q[36],q[37],q[38],q[39],q[40],q[41],q[42],q[43],q[44],q[45],q[46],q[47],q[48],q[49],q[50],q[51],q[52],q[53],q[54],q[55],q[56],q[57],q[58],q[59],q[60],q[61],q[62],q[63],q[64],q[65],q[66],q[67],q[68],q[69],q[70],q[71],q[72],q[73],q[74],q[75],q[76],q[77],q[78],q[79],q[80],q[81],q[82],q[83],q[84],q[85],q[86],q[87],q[88],q[89],q[90],q[91],q[92],q[93],q[94],q[95],q[96],q[97];
-measure q[0] -> meas[0];
-measure q[1] -> meas[1];
-measure q[2] -> meas[2];
-measure q[3] -> meas[3];
-measure q[4] -> meas[4];
-measure q[5] -> meas[5];
-measure q[6] -> meas[6];
-measure q[7] -> meas[7];
-measure q[8] -> meas[8];
-measure q[9] -> meas[9];
-measure q[10] -> meas[10];
-measure q[11] -> meas[11];
-measure q[12] -> meas[12];
-measure q[13] -> meas[13];
-measure q[14] -> meas[14];
-measure q[15] -> meas[15];
-measure q[16] -> meas[16];
-measure q[17] -> meas[17];
-measure q[18] -> meas[18];
-measure q[19] -> meas[19];
-measure q[20] -> meas[20];
-measure q[21] -> meas[21];
-measure q[22] -> meas[22];
-measure q[23] -> meas[23];
-measure q[24] -> meas[24];
-measure q[25] -> meas[25];
-measure q[26] -> meas[26];
-measure q[27] -> meas[27];
-measure q[28] -> meas[28];
-measure q[29] -> meas[29];
-measure q[30] -> meas[30];
-measure q[31] -> meas[31];
-measure q[32] -> meas[32];
-measure q[33] -> meas[33];
-measure q[34] -> meas[34];
-measure q[35] -> meas[35];
-measure q[36] -> meas[36];
-measure q[37] -> meas[37];
-measure q[38] -> meas[38];
-measure q[39] -> meas[39];
-measure q[40] -> meas[40];
-measure q[41] -> meas[41];
-measure q[42] -> meas[42];
-measure q[43] -> meas[43];
-measure q[44] -> meas[44];
-measure q[45] -> meas[45];
-measure q[46] -> meas[46];
-measure q[47] -> meas[47];
-measure q[48] -> meas[48];
-measure q[49] -> meas[49];
-measure q[50] -> meas[50];
-measure q[51] -> meas[51];
-measure q[52] -> meas[52];
-measure q[53] -> meas[53];
-measure q[54] -> meas[54];
-measure q[55] -> meas[55];
-measure q[56] -> meas[56];
-measure q[57] -> meas[57];
-measure q[58] -> meas[58];
-measure q[59] -> meas[59];
-measure q[60] -> meas[60];
-measure q[61] -> meas[61];
-measure q[62] -> meas[62];
-measure q[63] -> meas[63];
-measure q[64] -> meas[64];
-measure q[65] -> meas[65];
-measure q[66] -> meas[66];
-measure q[67] -> meas[67];
-measure q[68] -> meas[68];
-measure q[69] -> meas[69];
-measure q[70] -> meas[70];
-measure q[71] -> meas[71];
-measure q[72] -> meas[72];
-measure q[73] -> meas[73];
-measure q[74] -> meas[74];
-measure q[75] -> meas[75];
-measure q[76] -> meas[76];
-measure q[77] -> meas[77];
-measure q[78] -> meas[78];
-measure q[79] -> meas[79];
-measure q[80] -> meas[80];
-measure q[81] -> meas[81];
-measure q[82] -> meas[82];
-measure q[83] -> meas[83];
-measure q[84] -> meas[84];
-measure q[85] -> meas[85];
-measure q[86] -> meas[86];
-measure q[87] -> meas[87];
-measure q[88] -> meas[88];
-measure q[89] -> meas[89];
-measure q[90] -> meas[90];
-measure q[91] -> meas[91];
-measure q[92] -> meas[92];
-measure q[93] -> meas[93];
-measure q[94] -> meas[94];
-measure q[95] -> meas[95];
-measure q[96] -> meas[96];
-measure q[97] -> meas[97];
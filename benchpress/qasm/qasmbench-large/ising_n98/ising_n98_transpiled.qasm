@@ -1,785 +0,0 @@
-OPENQASM 2.0;
-include "qelib1.inc";
-qreg q[98];
-creg c[98];
-creg meas[98];
-rz(pi/2) q[0];
-sx q[0];
-rz(1.4653178) q[0];
-rz(pi/2) q[1];
-sx q[1];
-rz(1.7817533) q[1];
-cx q[0],q[1];
-rz(-0.10547849) q[1];
-cx q[0],q[1];
-rz(-0.3166508) q[1];
-rz(pi/2) q[2];
-sx q[2];
-rz(1.2496672) q[2];
-rz(pi/2) q[3];
-sx q[3];
-rz(2.2130545) q[3];
-cx q[2],q[3];
-rz(-0.32112909) q[3];
-cx q[2],q[3];
-rz(0.6333016) q[2];
-cx q[1],q[2];
-rz(-0.3166508) q[2];
-cx q[1],q[2];
-rz(1.6679692) q[3];
-rz(pi/2) q[4];
-sx q[4];
-rz(2.8259941) q[4];
-rz(pi/2) q[5];
-sx q[5];
-rz(-0.93959927) q[5];
-cx q[4],q[5];
-rz(1.2551978) q[5];
-cx q[4],q[5];
-rz(2.9472469) q[4];
-cx q[3],q[4];
-rz(1.6679692) q[4];
-cx q[3],q[4];
-rz(0.94889695) q[5];
-rz(pi/2) q[6];
-sx q[6];
-rz(2.4035439) q[6];
-rz(pi/2) q[7];
-sx q[7];
-rz(-0.094698773) q[7];
-cx q[6],q[7];
-rz(0.83274755) q[7];
-cx q[6],q[7];
-rz(-1.8977939) q[6];
-cx q[5],q[6];
-rz(0.94889695) q[6];
-cx q[5],q[6];
-rz(1.3389506) q[7];
-rz(pi/2) q[8];
-sx q[8];
-rz(1.0539178) q[8];
-rz(pi/2) q[9];
-sx q[9];
-rz(2.6045534) q[9];
-cx q[8],q[9];
-rz(-0.51687854) q[9];
-cx q[8],q[9];
-rz(-2.6779012) q[8];
-cx q[7],q[8];
-rz(1.3389506) q[8];
-cx q[7],q[8];
-rz(0.42250814) q[9];
-rz(pi/2) q[10];
-sx q[10];
-rz(-0.098159773) q[10];
-rz(pi/2) q[11];
-sx q[11];
-rz(-1.3744768) q[11];
-cx q[10],q[11];
-rz(-1.6689561) q[11];
-cx q[10],q[11];
-rz(-0.84501628) q[10];
-rz(-0.16700096) q[11];
-cx q[9],q[10];
-rz(0.42250814) q[10];
-cx q[9],q[10];
-rz(pi/2) q[12];
-sx q[12];
-rz(0.69296137) q[12];
-rz(pi/2) q[13];
-sx q[13];
-rz(-2.9567191) q[13];
-cx q[12],q[13];
-rz(-0.87783496) q[13];
-cx q[12],q[13];
-rz(0.33400192) q[12];
-cx q[11],q[12];
-rz(-0.16700096) q[12];
-cx q[11],q[12];
-rz(1.3028807) q[13];
-rz(pi/2) q[14];
-sx q[14];
-rz(-2.9206765) q[14];
-rz(pi/2) q[15];
-sx q[15];
-rz(-2.0126287) q[15];
-cx q[14],q[15];
-rz(1.7917125) q[15];
-cx q[14],q[15];
-rz(-2.6057614) q[14];
-cx q[13],q[14];
-rz(1.3028807) q[14];
-cx q[13],q[14];
-rz(-1.8720307) q[15];
-rz(pi/2) q[16];
-sx q[16];
-rz(2.4239844) q[16];
-rz(pi/2) q[17];
-sx q[17];
-rz(-0.13557989) q[17];
-cx q[16],q[17];
-rz(0.85318811) q[17];
-cx q[16],q[17];
-rz(-2.5391239) q[16];
-cx q[15],q[16];
-rz(-1.8720307) q[16];
-cx q[15],q[16];
-rz(-1.1861875) q[17];
-rz(pi/2) q[18];
-sx q[18];
-rz(2.6715011) q[18];
-rz(pi/2) q[19];
-sx q[19];
-rz(-0.63061327) q[19];
-cx q[18],q[19];
-rz(1.1007048) q[19];
-cx q[18],q[19];
-rz(2.372375) q[18];
-cx q[17],q[18];
-rz(-1.1861875) q[18];
-cx q[17],q[18];
-rz(-0.11663793) q[19];
-rz(pi/2) q[20];
-sx q[20];
-rz(2.8082102) q[20];
-rz(pi/2) q[21];
-sx q[21];
-rz(-0.90403147) q[21];
-cx q[20],q[21];
-rz(1.2374139) q[21];
-cx q[20],q[21];
-rz(0.23327586) q[20];
-cx q[19],q[20];
-rz(-0.11663793) q[20];
-cx q[19],q[20];
-rz(1.7434165) q[21];
-rz(pi/2) q[22];
-sx q[22];
-rz(2.4398032) q[22];
-rz(pi/2) q[23];
-sx q[23];
-rz(-0.16721749) q[23];
-cx q[22],q[23];
-rz(0.86900691) q[23];
-cx q[22],q[23];
-rz(2.7963523) q[22];
-cx q[21],q[22];
-rz(1.7434165) q[22];
-cx q[21],q[22];
-rz(1.9586679) q[23];
-rz(pi/2) q[24];
-sx q[24];
-rz(1.495252) q[24];
-rz(pi/2) q[25];
-sx q[25];
-rz(1.7218849) q[25];
-cx q[24],q[25];
-rz(-0.075544295) q[25];
-cx q[24],q[25];
-rz(2.3658495) q[24];
-cx q[23],q[24];
-rz(1.9586679) q[24];
-cx q[23],q[24];
-rz(-0.91863643) q[25];
-rz(pi/2) q[26];
-sx q[26];
-rz(-2.7456925) q[26];
-rz(pi/2) q[27];
-sx q[27];
-rz(-2.3625967) q[27];
-cx q[26],q[27];
-rz(1.9666965) q[27];
-cx q[26],q[27];
-rz(1.8372729) q[26];
-cx q[25],q[26];
-rz(-0.91863643) q[26];
-cx q[25],q[26];
-rz(-1.378703) q[27];
-rz(pi/2) q[28];
-sx q[28];
-rz(0.67753963) q[28];
-rz(pi/2) q[29];
-sx q[29];
-rz(-2.9258756) q[29];
-cx q[28],q[29];
-rz(-0.8932567) q[29];
-cx q[28],q[29];
-rz(2.757406) q[28];
-cx q[27],q[28];
-rz(-1.378703) q[28];
-cx q[27],q[28];
-rz(1.2285706) q[29];
-rz(pi/2) q[30];
-sx q[30];
-rz(2.646146) q[30];
-rz(pi/2) q[31];
-sx q[31];
-rz(-0.57990307) q[31];
-cx q[30],q[31];
-rz(1.0753497) q[31];
-cx q[30],q[31];
-rz(-2.4571412) q[30];
-cx q[29],q[30];
-rz(1.2285706) q[30];
-cx q[29],q[30];
-rz(0.28670827) q[31];
-rz(pi/2) q[32];
-sx q[32];
-rz(1.3353478) q[32];
-rz(pi/2) q[33];
-sx q[33];
-rz(2.0416933) q[33];
-cx q[32],q[33];
-rz(-0.23544851) q[33];
-cx q[32],q[33];
-rz(-0.57341654) q[32];
-cx q[31],q[32];
-rz(0.28670827) q[32];
-cx q[31],q[32];
-rz(0.19762375) q[33];
-rz(pi/2) q[34];
-sx q[34];
-rz(1.443119) q[34];
-rz(pi/2) q[35];
-sx q[35];
-rz(1.8261509) q[35];
-cx q[34],q[35];
-rz(-0.12767731) q[35];
-cx q[34],q[35];
-rz(-0.3952475) q[34];
-cx q[33],q[34];
-rz(0.19762375) q[34];
-cx q[33],q[34];
-rz(-0.20921184) q[35];
-rz(pi/2) q[36];
-sx q[36];
-rz(1.2614896) q[36];
-rz(pi/2) q[37];
-sx q[37];
-rz(2.1894098) q[37];
-cx q[36],q[37];
-rz(-0.30930673) q[37];
-cx q[36],q[37];
-rz(0.41842368) q[36];
-cx q[35],q[36];
-rz(-0.20921184) q[36];
-cx q[35],q[36];
-rz(0.018508709) q[37];
-rz(pi/2) q[38];
-sx q[38];
-rz(2.2792984) q[38];
-rz(pi/2) q[39];
-sx q[39];
-rz(0.15379209) q[39];
-cx q[38],q[39];
-rz(0.70850212) q[39];
-cx q[38],q[39];
-rz(-0.037017418) q[38];
-cx q[37],q[38];
-rz(0.018508709) q[38];
-cx q[37],q[38];
-rz(-0.35743569) q[39];
-rz(pi/2) q[40];
-sx q[40];
-rz(1.9588189) q[40];
-rz(pi/2) q[41];
-sx q[41];
-rz(0.79475121) q[41];
-cx q[40],q[41];
-rz(0.38802256) q[41];
-cx q[40],q[41];
-rz(0.71487138) q[40];
-cx q[39],q[40];
-rz(-0.35743569) q[40];
-cx q[39],q[40];
-rz(0.78440702) q[41];
-rz(pi/2) q[42];
-sx q[42];
-rz(3.0371627) q[42];
-rz(pi/2) q[43];
-sx q[43];
-rz(-1.3619365) q[43];
-cx q[42],q[43];
-rz(1.4663664) q[43];
-cx q[42],q[43];
-rz(-1.568814) q[42];
-cx q[41],q[42];
-rz(0.78440702) q[42];
-cx q[41],q[42];
-rz(1.9154828) q[43];
-rz(pi/2) q[44];
-sx q[44];
-rz(1.0824381) q[44];
-rz(pi/2) q[45];
-sx q[45];
-rz(2.5475127) q[45];
-cx q[44],q[45];
-rz(-0.48835821) q[45];
-cx q[44],q[45];
-rz(2.4522197) q[44];
-cx q[43],q[44];
-rz(1.9154828) q[44];
-cx q[43],q[44];
-rz(1.0147279) q[45];
-rz(pi/2) q[46];
-sx q[46];
-rz(0.58251727) q[46];
-rz(pi/2) q[47];
-sx q[47];
-rz(-2.7358309) q[47];
-cx q[46],q[47];
-rz(-0.98827906) q[47];
-cx q[46],q[47];
-rz(-2.0294558) q[46];
-cx q[45],q[46];
-rz(1.0147279) q[46];
-cx q[45],q[46];
-rz(0.37307477) q[47];
-rz(pi/2) q[48];
-sx q[48];
-rz(1.2214499) q[48];
-rz(pi/2) q[49];
-sx q[49];
-rz(2.2694892) q[49];
-cx q[48],q[49];
-rz(-0.34934642) q[49];
-cx q[48],q[49];
-rz(-0.74614954) q[48];
-cx q[47],q[48];
-rz(0.37307477) q[48];
-cx q[47],q[48];
-rz(1.8344785) q[49];
-rz(pi/2) q[50];
-sx q[50];
-rz(2.602717) q[50];
-rz(pi/2) q[51];
-sx q[51];
-rz(-0.49304507) q[51];
-cx q[50],q[51];
-rz(1.0319207) q[51];
-cx q[50],q[51];
-rz(2.6142283) q[50];
-cx q[49],q[50];
-rz(1.8344785) q[50];
-cx q[49],q[50];
-rz(-1.9106685) q[51];
-rz(pi/2) q[52];
-sx q[52];
-rz(-2.8000894) q[52];
-rz(pi/2) q[53];
-sx q[53];
-rz(-2.2538029) q[53];
-cx q[52],q[53];
-rz(1.9122996) q[53];
-cx q[52],q[53];
-rz(-2.4618483) q[52];
-cx q[51],q[52];
-rz(-1.9106685) q[52];
-cx q[51],q[52];
-rz(1.3210816) q[53];
-rz(pi/2) q[54];
-sx q[54];
-rz(-2.7999599) q[54];
-rz(pi/2) q[55];
-sx q[55];
-rz(-2.2540619) q[55];
-cx q[54],q[55];
-rz(1.9124291) q[55];
-cx q[54],q[55];
-rz(-2.6421632) q[54];
-cx q[53],q[54];
-rz(1.3210816) q[54];
-cx q[53],q[54];
-rz(-0.7303086) q[55];
-rz(pi/2) q[56];
-sx q[56];
-rz(-0.36424267) q[56];
-rz(pi/2) q[57];
-sx q[57];
-rz(-0.84231098) q[57];
-cx q[56],q[57];
-rz(-1.935039) q[57];
-cx q[56],q[57];
-rz(1.4606172) q[56];
-cx q[55],q[56];
-rz(-0.7303086) q[56];
-cx q[55],q[56];
-rz(0.33347611) q[57];
-rz(pi/2) q[58];
-sx q[58];
-rz(2.8997334) q[58];
-rz(pi/2) q[59];
-sx q[59];
-rz(-1.0870779) q[59];
-cx q[58],q[59];
-rz(1.3289371) q[59];
-cx q[58],q[59];
-rz(-0.66695222) q[58];
-cx q[57],q[58];
-rz(0.33347611) q[58];
-cx q[57],q[58];
-rz(-1.6503585) q[59];
-rz(pi/2) q[60];
-sx q[60];
-rz(2.5197484) q[60];
-rz(pi/2) q[61];
-sx q[61];
-rz(-0.32710781) q[61];
-cx q[60],q[61];
-rz(0.94895207) q[61];
-cx q[60],q[61];
-rz(-2.9824683) q[60];
-cx q[59],q[60];
-rz(-1.6503585) q[60];
-cx q[59],q[60];
-rz(-1.3871256) q[61];
-rz(pi/2) q[62];
-sx q[62];
-rz(2.1706599) q[62];
-rz(pi/2) q[63];
-sx q[63];
-rz(0.37106911) q[63];
-cx q[62],q[63];
-rz(0.59986361) q[63];
-cx q[62],q[63];
-rz(2.7742512) q[62];
-cx q[61],q[62];
-rz(-1.3871256) q[62];
-cx q[61],q[62];
-rz(1.7412821) q[63];
-rz(pi/2) q[64];
-sx q[64];
-rz(1.3787472) q[64];
-rz(pi/2) q[65];
-sx q[65];
-rz(1.9548946) q[65];
-cx q[64],q[65];
-rz(-0.19204913) q[65];
-cx q[64],q[65];
-rz(2.8006211) q[64];
-cx q[63],q[64];
-rz(1.7412821) q[64];
-cx q[63],q[64];
-rz(1.3090213) q[65];
-rz(pi/2) q[66];
-sx q[66];
-rz(2.2274142) q[66];
-rz(pi/2) q[67];
-sx q[67];
-rz(0.25756059) q[67];
-cx q[66],q[67];
-rz(0.65661787) q[67];
-cx q[66],q[67];
-rz(-2.6180426) q[66];
-cx q[65],q[66];
-rz(1.3090213) q[66];
-cx q[65],q[66];
-rz(-0.25871319) q[67];
-rz(pi/2) q[68];
-sx q[68];
-rz(-3.0738713) q[68];
-rz(pi/2) q[69];
-sx q[69];
-rz(-1.7062391) q[69];
-cx q[68],q[69];
-rz(1.6385177) q[69];
-cx q[68],q[69];
-rz(0.51742638) q[68];
-cx q[67],q[68];
-rz(-0.25871319) q[68];
-cx q[67],q[68];
-rz(-0.80006361) q[69];
-rz(pi/2) q[70];
-sx q[70];
-rz(-0.20475377) q[70];
-rz(pi/2) q[71];
-sx q[71];
-rz(-1.1612888) q[71];
-cx q[70],q[71];
-rz(-1.7755501) q[71];
-cx q[70],q[71];
-rz(1.6001272) q[70];
-cx q[69],q[70];
-rz(-0.80006361) q[70];
-cx q[69],q[70];
-rz(-0.11523599) q[71];
-rz(pi/2) q[72];
-sx q[72];
-rz(1.7420067) q[72];
-rz(pi/2) q[73];
-sx q[73];
-rz(1.2283757) q[73];
-cx q[72],q[73];
-rz(0.17121033) q[73];
-cx q[72],q[73];
-rz(0.23047198) q[72];
-cx q[71],q[72];
-rz(-0.11523599) q[72];
-cx q[71],q[72];
-rz(0.17468742) q[73];
-rz(pi/2) q[74];
-sx q[74];
-rz(1.9931006) q[74];
-rz(pi/2) q[75];
-sx q[75];
-rz(0.72618777) q[75];
-cx q[74],q[75];
-rz(0.42230428) q[75];
-cx q[74],q[75];
-rz(-0.34937484) q[74];
-cx q[73],q[74];
-rz(0.17468742) q[74];
-cx q[73],q[74];
-rz(1.0842291) q[75];
-rz(pi/2) q[76];
-sx q[76];
-rz(-2.8777021) q[76];
-rz(pi/2) q[77];
-sx q[77];
-rz(-2.0985775) q[77];
-cx q[76],q[77];
-rz(1.8346869) q[77];
-cx q[76],q[77];
-rz(-2.1684582) q[76];
-cx q[75],q[76];
-rz(1.0842291) q[76];
-cx q[75],q[76];
-rz(-1.6278165) q[77];
-rz(pi/2) q[78];
-sx q[78];
-rz(2.0207289) q[78];
-rz(pi/2) q[79];
-sx q[79];
-rz(0.67093113) q[79];
-cx q[78],q[79];
-rz(0.4499326) q[79];
-cx q[78],q[79];
-rz(-3.0275523) q[78];
-cx q[77],q[78];
-rz(-1.6278165) q[78];
-cx q[77],q[78];
-rz(1.7280133) q[79];
-rz(pi/2) q[80];
-sx q[80];
-rz(3.1322534) q[80];
-rz(pi/2) q[81];
-sx q[81];
-rz(-1.5521179) q[81];
-cx q[80],q[81];
-rz(1.5614571) q[81];
-cx q[80],q[81];
-rz(2.8271587) q[80];
-cx q[79],q[80];
-rz(1.7280133) q[80];
-cx q[79],q[80];
-rz(-1.1939662) q[81];
-rz(pi/2) q[82];
-sx q[82];
-rz(3.0926359) q[82];
-rz(pi/2) q[83];
-sx q[83];
-rz(-1.4728829) q[83];
-cx q[82],q[83];
-rz(1.5218396) q[83];
-cx q[82],q[83];
-rz(2.3879324) q[82];
-cx q[81],q[82];
-rz(-1.1939662) q[82];
-cx q[81],q[82];
-rz(1.4127416) q[83];
-rz(pi/2) q[84];
-sx q[84];
-rz(3.0695139) q[84];
-rz(pi/2) q[85];
-sx q[85];
-rz(-1.4266389) q[85];
-cx q[84],q[85];
-rz(1.4987176) q[85];
-cx q[84],q[85];
-rz(-2.8254832) q[84];
-cx q[83],q[84];
-rz(1.4127416) q[84];
-cx q[83],q[84];
-rz(0.56706812) q[85];
-rz(pi/2) q[86];
-sx q[86];
-rz(0.97951019) q[86];
-rz(pi/2) q[87];
-sx q[87];
-rz(2.7533686) q[87];
-cx q[86],q[87];
-rz(-0.59128614) q[87];
-cx q[86],q[87];
-rz(-1.1341362) q[86];
-cx q[85],q[86];
-rz(0.56706812) q[86];
-cx q[85],q[86];
-rz(1.1411538) q[87];
-rz(pi/2) q[88];
-sx q[88];
-rz(0.20736133) q[88];
-rz(pi/2) q[89];
-sx q[89];
-rz(-1.985519) q[89];
-cx q[88],q[89];
-rz(-1.363435) q[89];
-cx q[88],q[89];
-rz(-2.2823076) q[88];
-cx q[87],q[88];
-rz(1.1411538) q[88];
-cx q[87],q[88];
-rz(-1.2546659) q[89];
-rz(pi/2) q[90];
-sx q[90];
-rz(-0.10153277) q[90];
-rz(pi/2) q[91];
-sx q[91];
-rz(-1.3677308) q[91];
-cx q[90],q[91];
-rz(-1.6723291) q[91];
-cx q[90],q[91];
-rz(2.5093318) q[90];
-cx q[89],q[90];
-rz(-1.2546659) q[90];
-cx q[89],q[90];
-rz(0.61837496) q[91];
-rz(pi/2) q[92];
-sx q[92];
-rz(0.77808497) q[92];
-rz(pi/2) q[93];
-sx q[93];
-rz(-3.1269663) q[93];
-cx q[92],q[93];
-rz(-0.79271136) q[93];
-cx q[92],q[93];
-rz(-1.2367499) q[92];
-cx q[91],q[92];
-rz(0.61837496) q[92];
-cx q[91],q[92];
-rz(-0.47237304) q[93];
-rz(pi/2) q[94];
-sx q[94];
-rz(0.78763915) q[94];
-rz(pi/2) q[95];
-sx q[95];
-rz(3.1371107) q[95];
-cx q[94],q[95];
-rz(-0.78315718) q[95];
-cx q[94],q[95];
-rz(0.94474608) q[94];
-cx q[93],q[94];
-rz(-0.47237304) q[94];
-cx q[93],q[94];
-rz(-0.88586084) q[95];
-rz(pi/2) q[96];
-sx q[96];
-rz(1.2193779) q[96];
-rz(pi/2) q[97];
-sx q[97];
-rz(2.2736332) q[97];
-cx q[96],q[97];
-rz(-0.35141842) q[97];
-cx q[96],q[97];
-rz(1.7717217) q[96];
-cx q[95],q[96];
-rz(-0.88586084) q[96];
-cx q[95],q[96];
-barrier q[0],q[1],q[2],q[3],q[4],q[5],q[6],q[7],q[8],q[9],q[10],q[11],q[12],q[13],q[14],q[15],q[16],q[17],q[18],q[19],q[20],q[21],q[22],q[23],q[24],q[25],q[26],q[27],q[28],q[29],q[30],q[31],q[32],q[33],q[34],q[35],q[36],q[37],q[38],q[39],q[40],q[41],q[42],q[43],q[44],q[45],q[46],q[47],q[48],q[49],q[50],q[51],q[52],q[53],q[54],q[55],q[56],q[57],q[58],q[59],q[60],q[61],q[62],q[63],q[64],q[65],q[66],q[67],q[68],q[69],q[70],q[71],q[72],q[73],q[74],q[75],q[76],q[77],q[78],q[79],q[80],q[81],q[82],q[83],q[84],q[85],q[86],q[87],q[88],q[89],q[90],q[91],q[92],q[93],q[94],q[95],q[96],q[97];
-measure q[0] -> meas[0];
-measure q[1] -> meas[1];
-measure q[2] -> meas[2];
-measure q[3] -> meas[3];
-measure q[4] -> meas[4];
-measure q[5] -> meas[5];
-measure q[6] -> meas[6];
-measure q[7] -> meas[7];
-measure q[8] -> meas[8];
-measure q[9] -> meas[9];
-measure q[10] -> meas[10];
-measure q[11] -> meas[11];
-measure q[12] -> meas[12];
-measure q[13] -> meas[13];
-measure q[14] -> meas[14];
-measure q[15] -> meas[15];
-measure q[16] -> meas[16];
-measure q[17] -> meas[17];
-measure q[18] -> meas[18];
-measure q[19] -> meas[19];
-measure q[20] -> meas[20];
-measure q[21] -> meas[21];
-measure q[22] -> meas[22];
-measure q[23] -> meas[23];
-measure q[24] -> meas[24];
-measure q[25] -> meas[25];
-measure q[26] -> meas[26];
-measure q[27] -> meas[27];
-measure q[28] -> meas[28];
-measure q[29] -> meas[29];
-measure q[30] -> meas[30];
-measure q[31] -> meas[31];
-measure q[32] -> meas[32];
-measure q[33] -> meas[33];
-measure q[34] -> meas[34];
-measure q[35] -> meas[35];
-measure q[36] -> meas[36];
-measure q[37] -> meas[37];
-measure q[38] -> meas[38];
-measure q[39] -> meas[39];
-measure q[40] -> meas[40];
-measure q[41] -> meas[41];
-measure q[42] -> meas[42];
-measure q[43] -> meas[43];
-measure q[44] -> meas[44];
-measure q[45] -> meas[45];
-measure q[46] -> meas[46];
-measure q[47] -> meas[47];
-measure q[48] -> meas[48];
-measure q[49] -> meas[49];
-measure q[50] -> meas[50];
-measure q[51] -> meas[51];
-measure q[52] -> meas[52];
-measure q[53] -> meas[53];
-measure q[54] -> meas[54];
-measure q[55] -> meas[55];
-measure q[56] -> meas[56];
-measure q[57] -> meas[57];
-measure q[58] -> meas[58];
-measure q[59] -> meas[59];
-measure q[60] -> meas[60];
-measure q[61] -> meas[61];
-measure q[62] -> meas[62];
-measure q[63] -> meas[63];
-measure q[64] -> meas[64];
-measure q[65] -> meas[65];
-measure q[66] -> meas[66];
-measure q[67] -> meas[67];
-measure q[68] -> meas[68];
-measure q[69] -> meas[69];
-measure q[70] -> meas[70];
-measure q[71] -> meas[71];
-measure q[72] -> meas[72];
-measure q[73] -> meas[73];
-measure q[74] -> meas[74];
-measure q[75] -> meas[75];
-measure q[76] -> meas[76];
-measure q[77] -> meas[77];
-measure q[78] -> meas[78];
-measure q[79] -> meas[79];
-measure q[80] -> meas[80];
-measure q[81] -> meas[81];
-measure q[82] -> meas[82];
-measure q[83] -> meas[83];
-measure q[84] -> meas[84];
-measure q[85] -> meas[85];
-measure q[86] -> meas[86];
-measure q[87] -> meas[87];
-measure q[88] -> meas[88];
-measure q[89] -> meas[89];
-measure q[90] -> meas[90];
-measure q[91] -> meas[91];
-measure q[92] -> meas[92];
-measure q[93] -> meas[93];
-measure q[94] -> meas[94];
-measure q[95] -> meas[95];
-measure q[96] -> meas[96];
-measure q[97] -> meas[97];
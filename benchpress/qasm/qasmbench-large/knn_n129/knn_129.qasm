@@ -1,199 +0,0 @@
-OPENQASM 2.0;
-include "qelib1.inc";
-qreg q0[129];
-creg c0[1];
-ry(0.12527089) q0[1];
-ry(2.9776809) q0[2];
-ry(1.372875) q0[3];
-ry(1.6631022) q0[4];
-ry(2.587961) q0[5];
-ry(1.9026696) q0[6];
-ry(2.6976597) q0[7];
-ry(1.0775908) q0[8];
-ry(0.45977376) q0[9];
-ry(0.16710234) q0[10];
-ry(1.5274567) q0[11];
-ry(2.160093) q0[12];
-ry(1.230101) q0[13];
-ry(2.8479298) q0[14];
-ry(1.7632078) q0[15];
-ry(2.539416) q0[16];
-ry(0.48029528) q0[17];
-ry(2.468495) q0[18];
-ry(1.5914321) q0[19];
-ry(0.99745241) q0[20];
-ry(0.71265096) q0[21];
-ry(1.2774682) q0[22];
-ry(1.9874609) q0[23];
-ry(0.71143873) q0[24];
-ry(1.143783) q0[25];
-ry(2.393516) q0[26];
-ry(1.6084423) q0[27];
-ry(0.68140384) q0[28];
-ry(0.76966433) q0[29];
-ry(1.7880396) q0[30];
-ry(1.8184654) q0[31];
-ry(0.52120638) q0[32];
-ry(2.7887675) q0[33];
-ry(2.513982) q0[34];
-ry(1.9351333) q0[35];
-ry(0.39309087) q0[36];
-ry(0.54857535) q0[37];
-ry(0.06435689) q0[38];
-ry(1.6710762) q0[39];
-ry(0.18466378) q0[40];
-ry(1.1348535) q0[41];
-ry(0.20244138) q0[42];
-ry(1.4001368) q0[43];
-ry(1.7894486) q0[44];
-ry(1.1995035) q0[45];
-ry(2.0765922) q0[46];
-ry(3.0885629) q0[47];
-ry(1.0835408) q0[48];
-ry(0.37223534) q0[49];
-ry(2.8508369) q0[50];
-ry(0.15801255) q0[51];
-ry(1.0813042) q0[52];
-ry(0.6008295) q0[53];
-ry(3.131449) q0[54];
-ry(2.273152) q0[55];
-ry(0.6825937) q0[56];
-ry(2.4298738) q0[57];
-ry(0.64050091) q0[58];
-ry(0.10711095) q0[59];
-ry(0.26150701) q0[60];
-ry(0.36173531) q0[61];
-ry(2.670907) q0[62];
-ry(2.3974344) q0[63];
-ry(1.3273585) q0[64];
-ry(0.90668244) q0[65];
-ry(2.7058294) q0[66];
-ry(2.2875362) q0[67];
-ry(0.92231719) q0[68];
-ry(2.3942431) q0[69];
-ry(1.4859495) q0[70];
-ry(1.7152258) q0[71];
-ry(1.3319348) q0[72];
-ry(2.3094375) q0[73];
-ry(2.1524812) q0[74];
-ry(0.40072885) q0[75];
-ry(1.5621889) q0[76];
-ry(1.0956474) q0[77];
-ry(2.8564561) q0[78];
-ry(2.0138234) q0[79];
-ry(2.3103419) q0[80];
-ry(1.6383181) q0[81];
-ry(1.4400956) q0[82];
-ry(0.79309266) q0[83];
-ry(0.24027045) q0[84];
-ry(1.2354798) q0[85];
-ry(1.5674029) q0[86];
-ry(1.2390676) q0[87];
-ry(3.133515) q0[88];
-ry(2.1034044) q0[89];
-ry(1.7919774) q0[90];
-ry(0.23591138) q0[91];
-ry(1.7660666) q0[92];
-ry(0.67846856) q0[93];
-ry(2.4524916) q0[94];
-ry(3.0742538) q0[95];
-ry(2.3126017) q0[96];
-ry(0.67745807) q0[97];
-ry(2.7757287) q0[98];
-ry(0.11694752) q0[99];
-ry(2.9080654) q0[100];
-ry(0.0069860817) q0[101];
-ry(2.6640267) q0[102];
-ry(1.3832552) q0[103];
-ry(0.93581829) q0[104];
-ry(2.0313615) q0[105];
-ry(1.0448418) q0[106];
-ry(2.3802547) q0[107];
-ry(3.1177471) q0[108];
-ry(0.91506249) q0[109];
-ry(0.2809242) q0[110];
-ry(1.4070774) q0[111];
-ry(2.5760879) q0[112];
-ry(0.94199617) q0[113];
-ry(2.3876998) q0[114];
-ry(2.320336) q0[115];
-ry(0.42509037) q0[116];
-ry(2.107956) q0[117];
-ry(2.9135984) q0[118];
-ry(0.61255846) q0[119];
-ry(1.5368759) q0[120];
-ry(0.73387932) q0[121];
-ry(1.3464331) q0[122];
-ry(0.42736654) q0[123];
-ry(2.1755444) q0[124];
-ry(0.28689572) q0[125];
-ry(2.8174316) q0[126];
-ry(2.8578425) q0[127];
-ry(0.82080911) q0[128];
-h q0[0];
-cswap q0[0],q0[1],q0[65];
-cswap q0[0],q0[2],q0[66];
-cswap q0[0],q0[3],q0[67];
-cswap q0[0],q0[4],q0[68];
-cswap q0[0],q0[5],q0[69];
-cswap q0[0],q0[6],q0[70];
-cswap q0[0],q0[7],q0[71];
-cswap q0[0],q0[8],q0[72];
-cswap q0[0],q0[9],q0[73];
-cswap q0[0],q0[10],q0[74];
-cswap q0[0],q0[11],q0[75];
-cswap q0[0],q0[12],q0[76];
-cswap q0[0],q0[13],q0[77];
-cswap q0[0],q0[14],q0[78];
-cswap q0[0],q0[15],q0[79];
-cswap q0[0],q0[16],q0[80];
-cswap q0[0],q0[17],q0[81];
-cswap q0[0],q0[18],q0[82];
-cswap q0[0],q0[19],q0[83];
-cswap q0[0],q0[20],q0[84];
-cswap q0[0],q0[21],q0[85];
-cswap q0[0],q0[22],q0[86];
-cswap q0[0],q0[23],q0[87];
-cswap q0[0],q0[24],q0[88];
-cswap q0[0],q0[25],q0[89];
-cswap q0[0],q0[26],q0[90];
-cswap q0[0],q0[27],q0[91];
-cswap q0[0],q0[28],q0[92];
-cswap q0[0],q0[29],q0[93];
-cswap q0[0],q0[30],q0[94];
-cswap q0[0],q0[31],q0[95];
-cswap q0[0],q0[32],q0[96];
-cswap q0[0],q0[33],q0[97];
-cswap q0[0],q0[34],q0[98];
-cswap q0[0],q0[35],q0[99];
-cswap q0[0],q0[36],q0[100];
-cswap q0[0],q0[37],q0[101];
-cswap q0[0],q0[38],q0[102];
-cswap q0[0],q0[39],q0[103];
-cswap q0[0],q0[40],q0[104];
-cswap q0[0],q0[41],q0[105];
-cswap q0[0],q0[42],q0[106];
-cswap q0[0],q0[43],q0[107];
-cswap q0[0],q0[44],q0[108];
-cswap q0[0],q0[45],q0[109];
-cswap q0[0],q0[46],q0[110];
-cswap q0[0],q0[47],q0[111];
-cswap q0[0],q0[48],q0[112];
-cswap q0[0],q0[49],q0[113];
-cswap q0[0],q0[50],q0[114];
-cswap q0[0],q0[51],q0[115];
-cswap q0[0],q0[52],q0[116];
-cswap q0[0],q0[53],q0[117];
-cswap q0[0],q0[54],q0[118];
-cswap q0[0],q0[55],q0[119];
-cswap q0[0],q0[56],q0[120];
-cswap q0[0],q0[57],q0[121];
-cswap q0[0],q0[58],q0[122];
-cswap q0[0],q0[59],q0[123];
-cswap q0[0],q0[60],q0[124];
-cswap q0[0],q0[61],q0[125];
-cswap q0[0],q0[62],q0[126];
-cswap q0[0],q0[63],q0[127];
-cswap q0[0],q0[64],q0[128];
-h q0[0];
-measure q0[0] -> c0[0];
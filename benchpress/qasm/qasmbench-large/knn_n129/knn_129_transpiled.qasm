@@ -1,1803 +0,0 @@
-OPENQASM 2.0;
-include "qelib1.inc";
-qreg q0[129];
-creg c0[1];
-rz(pi/2) q0[0];
-sx q0[0];
-rz(pi/2) q0[0];
-rz(-pi) q0[1];
-sx q0[1];
-rz(3.0163218) q0[1];
-sx q0[1];
-rz(-pi) q0[2];
-sx q0[2];
-rz(0.16391175) q0[2];
-sx q0[2];
-rz(-pi) q0[3];
-sx q0[3];
-rz(1.7687177) q0[3];
-sx q0[3];
-rz(-pi) q0[4];
-sx q0[4];
-rz(1.4784905) q0[4];
-sx q0[4];
-rz(-pi) q0[5];
-sx q0[5];
-rz(0.55363165) q0[5];
-sx q0[5];
-rz(-pi) q0[6];
-sx q0[6];
-rz(1.2389231) q0[6];
-sx q0[6];
-rz(-pi) q0[7];
-sx q0[7];
-rz(0.44393295) q0[7];
-sx q0[7];
-rz(-pi) q0[8];
-sx q0[8];
-rz(2.0640019) q0[8];
-sx q0[8];
-rz(-pi) q0[9];
-sx q0[9];
-rz(2.6818189) q0[9];
-sx q0[9];
-rz(-pi) q0[10];
-sx q0[10];
-rz(2.9744903) q0[10];
-sx q0[10];
-rz(-pi) q0[11];
-sx q0[11];
-rz(1.614136) q0[11];
-sx q0[11];
-rz(-pi) q0[12];
-sx q0[12];
-rz(0.98149965) q0[12];
-sx q0[12];
-rz(-pi) q0[13];
-sx q0[13];
-rz(1.9114917) q0[13];
-sx q0[13];
-rz(-pi) q0[14];
-sx q0[14];
-rz(0.29366285) q0[14];
-sx q0[14];
-rz(-pi) q0[15];
-sx q0[15];
-rz(1.3783849) q0[15];
-sx q0[15];
-rz(-pi) q0[16];
-sx q0[16];
-rz(0.60217665) q0[16];
-sx q0[16];
-rz(-pi) q0[17];
-sx q0[17];
-rz(2.6612974) q0[17];
-sx q0[17];
-rz(-pi) q0[18];
-sx q0[18];
-rz(0.67309765) q0[18];
-sx q0[18];
-rz(-pi) q0[19];
-sx q0[19];
-rz(1.5501606) q0[19];
-sx q0[19];
-rz(-pi) q0[20];
-sx q0[20];
-rz(2.1441402) q0[20];
-sx q0[20];
-rz(-pi) q0[21];
-sx q0[21];
-rz(2.4289417) q0[21];
-sx q0[21];
-rz(-pi) q0[22];
-sx q0[22];
-rz(1.8641245) q0[22];
-sx q0[22];
-rz(-pi) q0[23];
-sx q0[23];
-rz(1.1541318) q0[23];
-sx q0[23];
-rz(-pi) q0[24];
-sx q0[24];
-rz(2.4301539) q0[24];
-sx q0[24];
-rz(-pi) q0[25];
-sx q0[25];
-rz(1.9978097) q0[25];
-sx q0[25];
-rz(-pi) q0[26];
-sx q0[26];
-rz(0.74807665) q0[26];
-sx q0[26];
-rz(-pi) q0[27];
-sx q0[27];
-rz(1.5331504) q0[27];
-sx q0[27];
-rz(-pi) q0[28];
-sx q0[28];
-rz(2.4601888) q0[28];
-sx q0[28];
-rz(-pi) q0[29];
-sx q0[29];
-rz(2.3719283) q0[29];
-sx q0[29];
-rz(-pi) q0[30];
-sx q0[30];
-rz(1.3535531) q0[30];
-sx q0[30];
-rz(-pi) q0[31];
-sx q0[31];
-rz(1.3231273) q0[31];
-sx q0[31];
-rz(-pi) q0[32];
-sx q0[32];
-rz(2.6203863) q0[32];
-sx q0[32];
-rz(-pi) q0[33];
-sx q0[33];
-rz(0.35282515) q0[33];
-sx q0[33];
-rz(-pi) q0[34];
-sx q0[34];
-rz(0.62761065) q0[34];
-sx q0[34];
-rz(-pi) q0[35];
-sx q0[35];
-rz(1.2064594) q0[35];
-sx q0[35];
-rz(-pi) q0[36];
-sx q0[36];
-rz(2.7485018) q0[36];
-sx q0[36];
-rz(-pi) q0[37];
-sx q0[37];
-rz(2.5930173) q0[37];
-sx q0[37];
-rz(-pi) q0[38];
-sx q0[38];
-rz(3.0772358) q0[38];
-sx q0[38];
-rz(-pi) q0[39];
-sx q0[39];
-rz(1.4705165) q0[39];
-sx q0[39];
-rz(-pi) q0[40];
-sx q0[40];
-rz(2.9569289) q0[40];
-sx q0[40];
-rz(-pi) q0[41];
-sx q0[41];
-rz(2.0067392) q0[41];
-sx q0[41];
-rz(-pi) q0[42];
-sx q0[42];
-rz(2.9391513) q0[42];
-sx q0[42];
-rz(-pi) q0[43];
-sx q0[43];
-rz(1.7414559) q0[43];
-sx q0[43];
-rz(-pi) q0[44];
-sx q0[44];
-rz(1.3521441) q0[44];
-sx q0[44];
-rz(-pi) q0[45];
-sx q0[45];
-rz(1.9420892) q0[45];
-sx q0[45];
-rz(-pi) q0[46];
-sx q0[46];
-rz(1.0650005) q0[46];
-sx q0[46];
-rz(-pi) q0[47];
-sx q0[47];
-rz(0.053029754) q0[47];
-sx q0[47];
-rz(-pi) q0[48];
-sx q0[48];
-rz(2.0580519) q0[48];
-sx q0[48];
-rz(-pi) q0[49];
-sx q0[49];
-rz(2.7693573) q0[49];
-sx q0[49];
-rz(-pi) q0[50];
-sx q0[50];
-rz(0.29075575) q0[50];
-sx q0[50];
-rz(-pi) q0[51];
-sx q0[51];
-rz(2.9835801) q0[51];
-sx q0[51];
-rz(-pi) q0[52];
-sx q0[52];
-rz(2.0602885) q0[52];
-sx q0[52];
-rz(-pi) q0[53];
-sx q0[53];
-rz(2.5407632) q0[53];
-sx q0[53];
-rz(-pi) q0[54];
-sx q0[54];
-rz(0.010143654) q0[54];
-sx q0[54];
-rz(-pi) q0[55];
-sx q0[55];
-rz(0.86844065) q0[55];
-sx q0[55];
-rz(-pi) q0[56];
-sx q0[56];
-rz(2.458999) q0[56];
-sx q0[56];
-rz(-pi) q0[57];
-sx q0[57];
-rz(0.71171885) q0[57];
-sx q0[57];
-rz(-pi) q0[58];
-sx q0[58];
-rz(2.5010917) q0[58];
-sx q0[58];
-rz(-pi) q0[59];
-sx q0[59];
-rz(3.0344817) q0[59];
-sx q0[59];
-rz(-pi) q0[60];
-sx q0[60];
-rz(2.8800856) q0[60];
-sx q0[60];
-rz(-pi) q0[61];
-sx q0[61];
-rz(2.7798573) q0[61];
-sx q0[61];
-rz(-pi) q0[62];
-sx q0[62];
-rz(0.47068565) q0[62];
-sx q0[62];
-rz(-pi) q0[63];
-sx q0[63];
-rz(0.74415825) q0[63];
-sx q0[63];
-rz(-pi) q0[64];
-sx q0[64];
-rz(1.8142342) q0[64];
-sx q0[64];
-rz(-pi) q0[65];
-sx q0[65];
-rz(2.2349102) q0[65];
-sx q0[65];
-cx q0[65],q0[1];
-rz(pi/2) q0[65];
-sx q0[65];
-rz(pi/2) q0[65];
-cx q0[1],q0[65];
-rz(-pi/4) q0[65];
-cx q0[0],q0[65];
-rz(pi/4) q0[65];
-cx q0[1],q0[65];
-rz(pi/4) q0[1];
-rz(-pi/4) q0[65];
-cx q0[0],q0[65];
-cx q0[0],q0[1];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[1];
-cx q0[0],q0[1];
-rz(3*pi/4) q0[65];
-sx q0[65];
-rz(pi/2) q0[65];
-cx q0[65],q0[1];
-rz(-pi) q0[66];
-sx q0[66];
-rz(0.43576325) q0[66];
-sx q0[66];
-cx q0[66],q0[2];
-rz(pi/2) q0[66];
-sx q0[66];
-rz(pi/2) q0[66];
-cx q0[2],q0[66];
-rz(-pi/4) q0[66];
-cx q0[0],q0[66];
-rz(pi/4) q0[66];
-cx q0[2],q0[66];
-rz(pi/4) q0[2];
-rz(-pi/4) q0[66];
-cx q0[0],q0[66];
-cx q0[0],q0[2];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[2];
-cx q0[0],q0[2];
-rz(3*pi/4) q0[66];
-sx q0[66];
-rz(pi/2) q0[66];
-cx q0[66],q0[2];
-rz(-pi) q0[67];
-sx q0[67];
-rz(0.85405645) q0[67];
-sx q0[67];
-cx q0[67],q0[3];
-rz(pi/2) q0[67];
-sx q0[67];
-rz(pi/2) q0[67];
-cx q0[3],q0[67];
-rz(-pi/4) q0[67];
-cx q0[0],q0[67];
-rz(pi/4) q0[67];
-cx q0[3],q0[67];
-rz(pi/4) q0[3];
-rz(-pi/4) q0[67];
-cx q0[0],q0[67];
-cx q0[0],q0[3];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[3];
-cx q0[0],q0[3];
-rz(3*pi/4) q0[67];
-sx q0[67];
-rz(pi/2) q0[67];
-cx q0[67],q0[3];
-rz(-pi) q0[68];
-sx q0[68];
-rz(2.2192755) q0[68];
-sx q0[68];
-cx q0[68],q0[4];
-rz(pi/2) q0[68];
-sx q0[68];
-rz(pi/2) q0[68];
-cx q0[4],q0[68];
-rz(-pi/4) q0[68];
-cx q0[0],q0[68];
-rz(pi/4) q0[68];
-cx q0[4],q0[68];
-rz(pi/4) q0[4];
-rz(-pi/4) q0[68];
-cx q0[0],q0[68];
-cx q0[0],q0[4];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[4];
-cx q0[0],q0[4];
-rz(3*pi/4) q0[68];
-sx q0[68];
-rz(pi/2) q0[68];
-cx q0[68],q0[4];
-rz(-pi) q0[69];
-sx q0[69];
-rz(0.74734955) q0[69];
-sx q0[69];
-cx q0[69],q0[5];
-rz(pi/2) q0[69];
-sx q0[69];
-rz(pi/2) q0[69];
-cx q0[5],q0[69];
-rz(-pi/4) q0[69];
-cx q0[0],q0[69];
-rz(pi/4) q0[69];
-cx q0[5],q0[69];
-rz(pi/4) q0[5];
-rz(-pi/4) q0[69];
-cx q0[0],q0[69];
-cx q0[0],q0[5];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[5];
-cx q0[0],q0[5];
-rz(3*pi/4) q0[69];
-sx q0[69];
-rz(pi/2) q0[69];
-cx q0[69],q0[5];
-rz(-pi) q0[70];
-sx q0[70];
-rz(1.6556432) q0[70];
-sx q0[70];
-cx q0[70],q0[6];
-rz(pi/2) q0[70];
-sx q0[70];
-rz(pi/2) q0[70];
-cx q0[6],q0[70];
-rz(-pi/4) q0[70];
-cx q0[0],q0[70];
-rz(pi/4) q0[70];
-cx q0[6],q0[70];
-rz(pi/4) q0[6];
-rz(-pi/4) q0[70];
-cx q0[0],q0[70];
-cx q0[0],q0[6];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[6];
-cx q0[0],q0[6];
-rz(3*pi/4) q0[70];
-sx q0[70];
-rz(pi/2) q0[70];
-cx q0[70],q0[6];
-rz(-pi) q0[71];
-sx q0[71];
-rz(1.4263669) q0[71];
-sx q0[71];
-cx q0[71],q0[7];
-rz(pi/2) q0[71];
-sx q0[71];
-rz(pi/2) q0[71];
-cx q0[7],q0[71];
-rz(-pi/4) q0[71];
-cx q0[0],q0[71];
-rz(pi/4) q0[71];
-cx q0[7],q0[71];
-rz(pi/4) q0[7];
-rz(-pi/4) q0[71];
-cx q0[0],q0[71];
-cx q0[0],q0[7];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[7];
-cx q0[0],q0[7];
-rz(3*pi/4) q0[71];
-sx q0[71];
-rz(pi/2) q0[71];
-cx q0[71],q0[7];
-rz(-pi) q0[72];
-sx q0[72];
-rz(1.8096579) q0[72];
-sx q0[72];
-cx q0[72],q0[8];
-rz(pi/2) q0[72];
-sx q0[72];
-rz(pi/2) q0[72];
-cx q0[8],q0[72];
-rz(-pi/4) q0[72];
-cx q0[0],q0[72];
-rz(pi/4) q0[72];
-cx q0[8],q0[72];
-rz(-pi/4) q0[72];
-cx q0[0],q0[72];
-rz(3*pi/4) q0[72];
-sx q0[72];
-rz(pi/2) q0[72];
-rz(pi/4) q0[8];
-cx q0[0],q0[8];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[8];
-cx q0[0],q0[8];
-cx q0[72],q0[8];
-rz(-pi) q0[73];
-sx q0[73];
-rz(0.83215515) q0[73];
-sx q0[73];
-cx q0[73],q0[9];
-rz(pi/2) q0[73];
-sx q0[73];
-rz(pi/2) q0[73];
-cx q0[9],q0[73];
-rz(-pi/4) q0[73];
-cx q0[0],q0[73];
-rz(pi/4) q0[73];
-cx q0[9],q0[73];
-rz(-pi/4) q0[73];
-cx q0[0],q0[73];
-rz(3*pi/4) q0[73];
-sx q0[73];
-rz(pi/2) q0[73];
-rz(pi/4) q0[9];
-cx q0[0],q0[9];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[9];
-cx q0[0],q0[9];
-cx q0[73],q0[9];
-rz(-pi) q0[74];
-sx q0[74];
-rz(0.98911145) q0[74];
-sx q0[74];
-cx q0[74],q0[10];
-rz(pi/2) q0[74];
-sx q0[74];
-rz(pi/2) q0[74];
-cx q0[10],q0[74];
-rz(-pi/4) q0[74];
-cx q0[0],q0[74];
-rz(pi/4) q0[74];
-cx q0[10],q0[74];
-rz(pi/4) q0[10];
-rz(-pi/4) q0[74];
-cx q0[0],q0[74];
-cx q0[0],q0[10];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[10];
-cx q0[0],q0[10];
-rz(3*pi/4) q0[74];
-sx q0[74];
-rz(pi/2) q0[74];
-cx q0[74],q0[10];
-rz(-pi) q0[75];
-sx q0[75];
-rz(2.7408638) q0[75];
-sx q0[75];
-cx q0[75],q0[11];
-rz(pi/2) q0[75];
-sx q0[75];
-rz(pi/2) q0[75];
-cx q0[11],q0[75];
-rz(-pi/4) q0[75];
-cx q0[0],q0[75];
-rz(pi/4) q0[75];
-cx q0[11],q0[75];
-rz(pi/4) q0[11];
-rz(-pi/4) q0[75];
-cx q0[0],q0[75];
-cx q0[0],q0[11];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[11];
-cx q0[0],q0[11];
-rz(3*pi/4) q0[75];
-sx q0[75];
-rz(pi/2) q0[75];
-cx q0[75],q0[11];
-rz(-pi) q0[76];
-sx q0[76];
-rz(1.5794038) q0[76];
-sx q0[76];
-cx q0[76],q0[12];
-rz(pi/2) q0[76];
-sx q0[76];
-rz(pi/2) q0[76];
-cx q0[12],q0[76];
-rz(-pi/4) q0[76];
-cx q0[0],q0[76];
-rz(pi/4) q0[76];
-cx q0[12],q0[76];
-rz(pi/4) q0[12];
-rz(-pi/4) q0[76];
-cx q0[0],q0[76];
-cx q0[0],q0[12];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[12];
-cx q0[0],q0[12];
-rz(3*pi/4) q0[76];
-sx q0[76];
-rz(pi/2) q0[76];
-cx q0[76],q0[12];
-rz(-pi) q0[77];
-sx q0[77];
-rz(2.0459453) q0[77];
-sx q0[77];
-cx q0[77],q0[13];
-rz(pi/2) q0[77];
-sx q0[77];
-rz(pi/2) q0[77];
-cx q0[13],q0[77];
-rz(-pi/4) q0[77];
-cx q0[0],q0[77];
-rz(pi/4) q0[77];
-cx q0[13],q0[77];
-rz(pi/4) q0[13];
-rz(-pi/4) q0[77];
-cx q0[0],q0[77];
-cx q0[0],q0[13];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[13];
-cx q0[0],q0[13];
-rz(3*pi/4) q0[77];
-sx q0[77];
-rz(pi/2) q0[77];
-cx q0[77],q0[13];
-rz(-pi) q0[78];
-sx q0[78];
-rz(0.28513655) q0[78];
-sx q0[78];
-cx q0[78],q0[14];
-rz(pi/2) q0[78];
-sx q0[78];
-rz(pi/2) q0[78];
-cx q0[14],q0[78];
-rz(-pi/4) q0[78];
-cx q0[0],q0[78];
-rz(pi/4) q0[78];
-cx q0[14],q0[78];
-rz(pi/4) q0[14];
-rz(-pi/4) q0[78];
-cx q0[0],q0[78];
-cx q0[0],q0[14];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[14];
-cx q0[0],q0[14];
-rz(3*pi/4) q0[78];
-sx q0[78];
-rz(pi/2) q0[78];
-cx q0[78],q0[14];
-rz(-pi) q0[79];
-sx q0[79];
-rz(1.1277693) q0[79];
-sx q0[79];
-cx q0[79],q0[15];
-rz(pi/2) q0[79];
-sx q0[79];
-rz(pi/2) q0[79];
-cx q0[15],q0[79];
-rz(-pi/4) q0[79];
-cx q0[0],q0[79];
-rz(pi/4) q0[79];
-cx q0[15],q0[79];
-rz(pi/4) q0[15];
-rz(-pi/4) q0[79];
-cx q0[0],q0[79];
-cx q0[0],q0[15];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[15];
-cx q0[0],q0[15];
-rz(3*pi/4) q0[79];
-sx q0[79];
-rz(pi/2) q0[79];
-cx q0[79],q0[15];
-rz(-pi) q0[80];
-sx q0[80];
-rz(0.83125075) q0[80];
-sx q0[80];
-cx q0[80],q0[16];
-rz(pi/2) q0[80];
-sx q0[80];
-rz(pi/2) q0[80];
-cx q0[16],q0[80];
-rz(-pi/4) q0[80];
-cx q0[0],q0[80];
-rz(pi/4) q0[80];
-cx q0[16],q0[80];
-rz(pi/4) q0[16];
-rz(-pi/4) q0[80];
-cx q0[0],q0[80];
-cx q0[0],q0[16];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[16];
-cx q0[0],q0[16];
-rz(3*pi/4) q0[80];
-sx q0[80];
-rz(pi/2) q0[80];
-cx q0[80],q0[16];
-rz(-pi) q0[81];
-sx q0[81];
-rz(1.5032746) q0[81];
-sx q0[81];
-cx q0[81],q0[17];
-rz(pi/2) q0[81];
-sx q0[81];
-rz(pi/2) q0[81];
-cx q0[17],q0[81];
-rz(-pi/4) q0[81];
-cx q0[0],q0[81];
-rz(pi/4) q0[81];
-cx q0[17],q0[81];
-rz(pi/4) q0[17];
-rz(-pi/4) q0[81];
-cx q0[0],q0[81];
-cx q0[0],q0[17];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[17];
-cx q0[0],q0[17];
-rz(3*pi/4) q0[81];
-sx q0[81];
-rz(pi/2) q0[81];
-cx q0[81],q0[17];
-rz(-pi) q0[82];
-sx q0[82];
-rz(1.7014971) q0[82];
-sx q0[82];
-cx q0[82],q0[18];
-rz(pi/2) q0[82];
-sx q0[82];
-rz(pi/2) q0[82];
-cx q0[18],q0[82];
-rz(-pi/4) q0[82];
-cx q0[0],q0[82];
-rz(pi/4) q0[82];
-cx q0[18],q0[82];
-rz(pi/4) q0[18];
-rz(-pi/4) q0[82];
-cx q0[0],q0[82];
-cx q0[0],q0[18];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[18];
-cx q0[0],q0[18];
-rz(3*pi/4) q0[82];
-sx q0[82];
-rz(pi/2) q0[82];
-cx q0[82],q0[18];
-rz(-pi) q0[83];
-sx q0[83];
-rz(2.3485) q0[83];
-sx q0[83];
-cx q0[83],q0[19];
-rz(pi/2) q0[83];
-sx q0[83];
-rz(pi/2) q0[83];
-cx q0[19],q0[83];
-rz(-pi/4) q0[83];
-cx q0[0],q0[83];
-rz(pi/4) q0[83];
-cx q0[19],q0[83];
-rz(pi/4) q0[19];
-rz(-pi/4) q0[83];
-cx q0[0],q0[83];
-cx q0[0],q0[19];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[19];
-cx q0[0],q0[19];
-rz(3*pi/4) q0[83];
-sx q0[83];
-rz(pi/2) q0[83];
-cx q0[83],q0[19];
-rz(-pi) q0[84];
-sx q0[84];
-rz(2.9013222) q0[84];
-sx q0[84];
-cx q0[84],q0[20];
-rz(pi/2) q0[84];
-sx q0[84];
-rz(pi/2) q0[84];
-cx q0[20],q0[84];
-rz(-pi/4) q0[84];
-cx q0[0],q0[84];
-rz(pi/4) q0[84];
-cx q0[20],q0[84];
-rz(pi/4) q0[20];
-rz(-pi/4) q0[84];
-cx q0[0],q0[84];
-cx q0[0],q0[20];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[20];
-cx q0[0],q0[20];
-rz(3*pi/4) q0[84];
-sx q0[84];
-rz(pi/2) q0[84];
-cx q0[84],q0[20];
-rz(-pi) q0[85];
-sx q0[85];
-rz(1.9061129) q0[85];
-sx q0[85];
-cx q0[85],q0[21];
-rz(pi/2) q0[85];
-sx q0[85];
-rz(pi/2) q0[85];
-cx q0[21],q0[85];
-rz(-pi/4) q0[85];
-cx q0[0],q0[85];
-rz(pi/4) q0[85];
-cx q0[21],q0[85];
-rz(pi/4) q0[21];
-rz(-pi/4) q0[85];
-cx q0[0],q0[85];
-cx q0[0],q0[21];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[21];
-cx q0[0],q0[21];
-rz(3*pi/4) q0[85];
-sx q0[85];
-rz(pi/2) q0[85];
-cx q0[85],q0[21];
-rz(-pi) q0[86];
-sx q0[86];
-rz(1.5741898) q0[86];
-sx q0[86];
-cx q0[86],q0[22];
-rz(pi/2) q0[86];
-sx q0[86];
-rz(pi/2) q0[86];
-cx q0[22],q0[86];
-rz(-pi/4) q0[86];
-cx q0[0],q0[86];
-rz(pi/4) q0[86];
-cx q0[22],q0[86];
-rz(pi/4) q0[22];
-rz(-pi/4) q0[86];
-cx q0[0],q0[86];
-cx q0[0],q0[22];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[22];
-cx q0[0],q0[22];
-rz(3*pi/4) q0[86];
-sx q0[86];
-rz(pi/2) q0[86];
-cx q0[86],q0[22];
-rz(-pi) q0[87];
-sx q0[87];
-rz(1.9025251) q0[87];
-sx q0[87];
-cx q0[87],q0[23];
-rz(pi/2) q0[87];
-sx q0[87];
-rz(pi/2) q0[87];
-cx q0[23],q0[87];
-rz(-pi/4) q0[87];
-cx q0[0],q0[87];
-rz(pi/4) q0[87];
-cx q0[23],q0[87];
-rz(pi/4) q0[23];
-rz(-pi/4) q0[87];
-cx q0[0],q0[87];
-cx q0[0],q0[23];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[23];
-cx q0[0],q0[23];
-rz(3*pi/4) q0[87];
-sx q0[87];
-rz(pi/2) q0[87];
-cx q0[87],q0[23];
-rz(-pi) q0[88];
-sx q0[88];
-rz(0.0080776536) q0[88];
-sx q0[88];
-cx q0[88],q0[24];
-rz(pi/2) q0[88];
-sx q0[88];
-rz(pi/2) q0[88];
-cx q0[24],q0[88];
-rz(-pi/4) q0[88];
-cx q0[0],q0[88];
-rz(pi/4) q0[88];
-cx q0[24],q0[88];
-rz(pi/4) q0[24];
-rz(-pi/4) q0[88];
-cx q0[0],q0[88];
-cx q0[0],q0[24];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[24];
-cx q0[0],q0[24];
-rz(3*pi/4) q0[88];
-sx q0[88];
-rz(pi/2) q0[88];
-cx q0[88],q0[24];
-rz(-pi) q0[89];
-sx q0[89];
-rz(1.0381883) q0[89];
-sx q0[89];
-cx q0[89],q0[25];
-rz(pi/2) q0[89];
-sx q0[89];
-rz(pi/2) q0[89];
-cx q0[25],q0[89];
-rz(-pi/4) q0[89];
-cx q0[0],q0[89];
-rz(pi/4) q0[89];
-cx q0[25],q0[89];
-rz(pi/4) q0[25];
-rz(-pi/4) q0[89];
-cx q0[0],q0[89];
-cx q0[0],q0[25];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[25];
-cx q0[0],q0[25];
-rz(3*pi/4) q0[89];
-sx q0[89];
-rz(pi/2) q0[89];
-cx q0[89],q0[25];
-rz(-pi) q0[90];
-sx q0[90];
-rz(1.3496153) q0[90];
-sx q0[90];
-cx q0[90],q0[26];
-rz(pi/2) q0[90];
-sx q0[90];
-rz(pi/2) q0[90];
-cx q0[26],q0[90];
-rz(-pi/4) q0[90];
-cx q0[0],q0[90];
-rz(pi/4) q0[90];
-cx q0[26],q0[90];
-rz(pi/4) q0[26];
-rz(-pi/4) q0[90];
-cx q0[0],q0[90];
-cx q0[0],q0[26];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[26];
-cx q0[0],q0[26];
-rz(3*pi/4) q0[90];
-sx q0[90];
-rz(pi/2) q0[90];
-cx q0[90],q0[26];
-rz(-pi) q0[91];
-sx q0[91];
-rz(2.9056813) q0[91];
-sx q0[91];
-cx q0[91],q0[27];
-rz(pi/2) q0[91];
-sx q0[91];
-rz(pi/2) q0[91];
-cx q0[27],q0[91];
-rz(-pi/4) q0[91];
-cx q0[0],q0[91];
-rz(pi/4) q0[91];
-cx q0[27],q0[91];
-rz(pi/4) q0[27];
-rz(-pi/4) q0[91];
-cx q0[0],q0[91];
-cx q0[0],q0[27];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[27];
-cx q0[0],q0[27];
-rz(3*pi/4) q0[91];
-sx q0[91];
-rz(pi/2) q0[91];
-cx q0[91],q0[27];
-rz(-pi) q0[92];
-sx q0[92];
-rz(1.3755261) q0[92];
-sx q0[92];
-cx q0[92],q0[28];
-rz(pi/2) q0[92];
-sx q0[92];
-rz(pi/2) q0[92];
-cx q0[28],q0[92];
-rz(-pi/4) q0[92];
-cx q0[0],q0[92];
-rz(pi/4) q0[92];
-cx q0[28],q0[92];
-rz(pi/4) q0[28];
-rz(-pi/4) q0[92];
-cx q0[0],q0[92];
-cx q0[0],q0[28];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[28];
-cx q0[0],q0[28];
-rz(3*pi/4) q0[92];
-sx q0[92];
-rz(pi/2) q0[92];
-cx q0[92],q0[28];
-rz(-pi) q0[93];
-sx q0[93];
-rz(2.4631241) q0[93];
-sx q0[93];
-cx q0[93],q0[29];
-rz(pi/2) q0[93];
-sx q0[93];
-rz(pi/2) q0[93];
-cx q0[29],q0[93];
-rz(-pi/4) q0[93];
-cx q0[0],q0[93];
-rz(pi/4) q0[93];
-cx q0[29],q0[93];
-rz(pi/4) q0[29];
-rz(-pi/4) q0[93];
-cx q0[0],q0[93];
-cx q0[0],q0[29];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[29];
-cx q0[0],q0[29];
-rz(3*pi/4) q0[93];
-sx q0[93];
-rz(pi/2) q0[93];
-cx q0[93],q0[29];
-rz(-pi) q0[94];
-sx q0[94];
-rz(0.68910105) q0[94];
-sx q0[94];
-cx q0[94],q0[30];
-rz(pi/2) q0[94];
-sx q0[94];
-rz(pi/2) q0[94];
-cx q0[30],q0[94];
-rz(-pi/4) q0[94];
-cx q0[0],q0[94];
-rz(pi/4) q0[94];
-cx q0[30],q0[94];
-rz(pi/4) q0[30];
-rz(-pi/4) q0[94];
-cx q0[0],q0[94];
-cx q0[0],q0[30];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[30];
-cx q0[0],q0[30];
-rz(3*pi/4) q0[94];
-sx q0[94];
-rz(pi/2) q0[94];
-cx q0[94],q0[30];
-rz(-pi) q0[95];
-sx q0[95];
-rz(0.067338854) q0[95];
-sx q0[95];
-cx q0[95],q0[31];
-rz(pi/2) q0[95];
-sx q0[95];
-rz(pi/2) q0[95];
-cx q0[31],q0[95];
-rz(-pi/4) q0[95];
-cx q0[0],q0[95];
-rz(pi/4) q0[95];
-cx q0[31],q0[95];
-rz(pi/4) q0[31];
-rz(-pi/4) q0[95];
-cx q0[0],q0[95];
-cx q0[0],q0[31];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[31];
-cx q0[0],q0[31];
-rz(3*pi/4) q0[95];
-sx q0[95];
-rz(pi/2) q0[95];
-cx q0[95],q0[31];
-rz(-pi) q0[96];
-sx q0[96];
-rz(0.82899095) q0[96];
-sx q0[96];
-cx q0[96],q0[32];
-rz(pi/2) q0[96];
-sx q0[96];
-rz(pi/2) q0[96];
-cx q0[32],q0[96];
-rz(-pi/4) q0[96];
-cx q0[0],q0[96];
-rz(pi/4) q0[96];
-cx q0[32],q0[96];
-rz(pi/4) q0[32];
-rz(-pi/4) q0[96];
-cx q0[0],q0[96];
-cx q0[0],q0[32];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[32];
-cx q0[0],q0[32];
-rz(3*pi/4) q0[96];
-sx q0[96];
-rz(pi/2) q0[96];
-cx q0[96],q0[32];
-rz(-pi) q0[97];
-sx q0[97];
-rz(2.4641346) q0[97];
-sx q0[97];
-cx q0[97],q0[33];
-rz(pi/2) q0[97];
-sx q0[97];
-rz(pi/2) q0[97];
-cx q0[33],q0[97];
-rz(-pi/4) q0[97];
-cx q0[0],q0[97];
-rz(pi/4) q0[97];
-cx q0[33],q0[97];
-rz(pi/4) q0[33];
-rz(-pi/4) q0[97];
-cx q0[0],q0[97];
-cx q0[0],q0[33];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[33];
-cx q0[0],q0[33];
-rz(3*pi/4) q0[97];
-sx q0[97];
-rz(pi/2) q0[97];
-cx q0[97],q0[33];
-rz(-pi) q0[98];
-sx q0[98];
-rz(0.36586395) q0[98];
-sx q0[98];
-cx q0[98],q0[34];
-rz(pi/2) q0[98];
-sx q0[98];
-rz(pi/2) q0[98];
-cx q0[34],q0[98];
-rz(-pi/4) q0[98];
-cx q0[0],q0[98];
-rz(pi/4) q0[98];
-cx q0[34],q0[98];
-rz(pi/4) q0[34];
-rz(-pi/4) q0[98];
-cx q0[0],q0[98];
-cx q0[0],q0[34];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[34];
-cx q0[0],q0[34];
-rz(3*pi/4) q0[98];
-sx q0[98];
-rz(pi/2) q0[98];
-cx q0[98],q0[34];
-rz(-pi) q0[99];
-sx q0[99];
-rz(3.0246451) q0[99];
-sx q0[99];
-cx q0[99],q0[35];
-rz(pi/2) q0[99];
-sx q0[99];
-rz(pi/2) q0[99];
-cx q0[35],q0[99];
-rz(-pi/4) q0[99];
-cx q0[0],q0[99];
-rz(pi/4) q0[99];
-cx q0[35],q0[99];
-rz(pi/4) q0[35];
-rz(-pi/4) q0[99];
-cx q0[0],q0[99];
-cx q0[0],q0[35];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[35];
-cx q0[0],q0[35];
-rz(3*pi/4) q0[99];
-sx q0[99];
-rz(pi/2) q0[99];
-cx q0[99],q0[35];
-rz(-pi) q0[100];
-sx q0[100];
-rz(0.23352725) q0[100];
-sx q0[100];
-cx q0[100],q0[36];
-rz(pi/2) q0[100];
-sx q0[100];
-rz(pi/2) q0[100];
-cx q0[36],q0[100];
-rz(-pi/4) q0[100];
-cx q0[0],q0[100];
-rz(pi/4) q0[100];
-cx q0[36],q0[100];
-rz(-pi/4) q0[100];
-cx q0[0],q0[100];
-rz(3*pi/4) q0[100];
-sx q0[100];
-rz(pi/2) q0[100];
-rz(pi/4) q0[36];
-cx q0[0],q0[36];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[36];
-cx q0[0],q0[36];
-cx q0[100],q0[36];
-rz(-pi) q0[101];
-sx q0[101];
-rz(3.1346066) q0[101];
-sx q0[101];
-cx q0[101],q0[37];
-rz(pi/2) q0[101];
-sx q0[101];
-rz(pi/2) q0[101];
-cx q0[37],q0[101];
-rz(-pi/4) q0[101];
-cx q0[0],q0[101];
-rz(pi/4) q0[101];
-cx q0[37],q0[101];
-rz(-pi/4) q0[101];
-cx q0[0],q0[101];
-rz(3*pi/4) q0[101];
-sx q0[101];
-rz(pi/2) q0[101];
-rz(pi/4) q0[37];
-cx q0[0],q0[37];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[37];
-cx q0[0],q0[37];
-cx q0[101],q0[37];
-rz(-pi) q0[102];
-sx q0[102];
-rz(0.47756595) q0[102];
-sx q0[102];
-cx q0[102],q0[38];
-rz(pi/2) q0[102];
-sx q0[102];
-rz(pi/2) q0[102];
-cx q0[38],q0[102];
-rz(-pi/4) q0[102];
-cx q0[0],q0[102];
-rz(pi/4) q0[102];
-cx q0[38],q0[102];
-rz(-pi/4) q0[102];
-cx q0[0],q0[102];
-rz(3*pi/4) q0[102];
-sx q0[102];
-rz(pi/2) q0[102];
-rz(pi/4) q0[38];
-cx q0[0],q0[38];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[38];
-cx q0[0],q0[38];
-cx q0[102],q0[38];
-rz(-pi) q0[103];
-sx q0[103];
-rz(1.7583375) q0[103];
-sx q0[103];
-cx q0[103],q0[39];
-rz(pi/2) q0[103];
-sx q0[103];
-rz(pi/2) q0[103];
-cx q0[39],q0[103];
-rz(-pi/4) q0[103];
-cx q0[0],q0[103];
-rz(pi/4) q0[103];
-cx q0[39],q0[103];
-rz(-pi/4) q0[103];
-cx q0[0],q0[103];
-rz(3*pi/4) q0[103];
-sx q0[103];
-rz(pi/2) q0[103];
-rz(pi/4) q0[39];
-cx q0[0],q0[39];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[39];
-cx q0[0],q0[39];
-cx q0[103],q0[39];
-rz(-pi) q0[104];
-sx q0[104];
-rz(2.2057744) q0[104];
-sx q0[104];
-cx q0[104],q0[40];
-rz(pi/2) q0[104];
-sx q0[104];
-rz(pi/2) q0[104];
-cx q0[40],q0[104];
-rz(-pi/4) q0[104];
-cx q0[0],q0[104];
-rz(pi/4) q0[104];
-cx q0[40],q0[104];
-rz(-pi/4) q0[104];
-cx q0[0],q0[104];
-rz(3*pi/4) q0[104];
-sx q0[104];
-rz(pi/2) q0[104];
-rz(pi/4) q0[40];
-cx q0[0],q0[40];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[40];
-cx q0[0],q0[40];
-cx q0[104],q0[40];
-rz(-pi) q0[105];
-sx q0[105];
-rz(1.1102312) q0[105];
-sx q0[105];
-cx q0[105],q0[41];
-rz(pi/2) q0[105];
-sx q0[105];
-rz(pi/2) q0[105];
-cx q0[41],q0[105];
-rz(-pi/4) q0[105];
-cx q0[0],q0[105];
-rz(pi/4) q0[105];
-cx q0[41],q0[105];
-rz(-pi/4) q0[105];
-cx q0[0],q0[105];
-rz(3*pi/4) q0[105];
-sx q0[105];
-rz(pi/2) q0[105];
-rz(pi/4) q0[41];
-cx q0[0],q0[41];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[41];
-cx q0[0],q0[41];
-cx q0[105],q0[41];
-rz(-pi) q0[106];
-sx q0[106];
-rz(2.0967509) q0[106];
-sx q0[106];
-cx q0[106],q0[42];
-rz(pi/2) q0[106];
-sx q0[106];
-rz(pi/2) q0[106];
-cx q0[42],q0[106];
-rz(-pi/4) q0[106];
-cx q0[0],q0[106];
-rz(pi/4) q0[106];
-cx q0[42],q0[106];
-rz(-pi/4) q0[106];
-cx q0[0],q0[106];
-rz(3*pi/4) q0[106];
-sx q0[106];
-rz(pi/2) q0[106];
-rz(pi/4) q0[42];
-cx q0[0],q0[42];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[42];
-cx q0[0],q0[42];
-cx q0[106],q0[42];
-rz(-pi) q0[107];
-sx q0[107];
-rz(0.76133795) q0[107];
-sx q0[107];
-cx q0[107],q0[43];
-rz(pi/2) q0[107];
-sx q0[107];
-rz(pi/2) q0[107];
-cx q0[43],q0[107];
-rz(-pi/4) q0[107];
-cx q0[0],q0[107];
-rz(pi/4) q0[107];
-cx q0[43],q0[107];
-rz(-pi/4) q0[107];
-cx q0[0],q0[107];
-rz(3*pi/4) q0[107];
-sx q0[107];
-rz(pi/2) q0[107];
-rz(pi/4) q0[43];
-cx q0[0],q0[43];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[43];
-cx q0[0],q0[43];
-cx q0[107],q0[43];
-rz(-pi) q0[108];
-sx q0[108];
-rz(0.023845554) q0[108];
-sx q0[108];
-cx q0[108],q0[44];
-rz(pi/2) q0[108];
-sx q0[108];
-rz(pi/2) q0[108];
-cx q0[44],q0[108];
-rz(-pi/4) q0[108];
-cx q0[0],q0[108];
-rz(pi/4) q0[108];
-cx q0[44],q0[108];
-rz(-pi/4) q0[108];
-cx q0[0],q0[108];
-rz(3*pi/4) q0[108];
-sx q0[108];
-rz(pi/2) q0[108];
-rz(pi/4) q0[44];
-cx q0[0],q0[44];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[44];
-cx q0[0],q0[44];
-cx q0[108],q0[44];
-rz(-pi) q0[109];
-sx q0[109];
-rz(2.2265302) q0[109];
-sx q0[109];
-cx q0[109],q0[45];
-rz(pi/2) q0[109];
-sx q0[109];
-rz(pi/2) q0[109];
-cx q0[45],q0[109];
-rz(-pi/4) q0[109];
-cx q0[0],q0[109];
-rz(pi/4) q0[109];
-cx q0[45],q0[109];
-rz(-pi/4) q0[109];
-cx q0[0],q0[109];
-rz(3*pi/4) q0[109];
-sx q0[109];
-rz(pi/2) q0[109];
-rz(pi/4) q0[45];
-cx q0[0],q0[45];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[45];
-cx q0[0],q0[45];
-cx q0[109],q0[45];
-rz(-pi) q0[110];
-sx q0[110];
-rz(2.8606685) q0[110];
-sx q0[110];
-cx q0[110],q0[46];
-rz(pi/2) q0[110];
-sx q0[110];
-rz(pi/2) q0[110];
-cx q0[46],q0[110];
-rz(-pi/4) q0[110];
-cx q0[0],q0[110];
-rz(pi/4) q0[110];
-cx q0[46],q0[110];
-rz(-pi/4) q0[110];
-cx q0[0],q0[110];
-rz(3*pi/4) q0[110];
-sx q0[110];
-rz(pi/2) q0[110];
-rz(pi/4) q0[46];
-cx q0[0],q0[46];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[46];
-cx q0[0],q0[46];
-cx q0[110],q0[46];
-rz(-pi) q0[111];
-sx q0[111];
-rz(1.7345153) q0[111];
-sx q0[111];
-cx q0[111],q0[47];
-rz(pi/2) q0[111];
-sx q0[111];
-rz(pi/2) q0[111];
-cx q0[47],q0[111];
-rz(-pi/4) q0[111];
-cx q0[0],q0[111];
-rz(pi/4) q0[111];
-cx q0[47],q0[111];
-rz(-pi/4) q0[111];
-cx q0[0],q0[111];
-rz(3*pi/4) q0[111];
-sx q0[111];
-rz(pi/2) q0[111];
-rz(pi/4) q0[47];
-cx q0[0],q0[47];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[47];
-cx q0[0],q0[47];
-cx q0[111],q0[47];
-rz(-pi) q0[112];
-sx q0[112];
-rz(0.56550475) q0[112];
-sx q0[112];
-cx q0[112],q0[48];
-rz(pi/2) q0[112];
-sx q0[112];
-rz(pi/2) q0[112];
-cx q0[48],q0[112];
-rz(-pi/4) q0[112];
-cx q0[0],q0[112];
-rz(pi/4) q0[112];
-cx q0[48],q0[112];
-rz(-pi/4) q0[112];
-cx q0[0],q0[112];
-rz(3*pi/4) q0[112];
-sx q0[112];
-rz(pi/2) q0[112];
-rz(pi/4) q0[48];
-cx q0[0],q0[48];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[48];
-cx q0[0],q0[48];
-cx q0[112],q0[48];
-rz(-pi) q0[113];
-sx q0[113];
-rz(2.1995965) q0[113];
-sx q0[113];
-cx q0[113],q0[49];
-rz(pi/2) q0[113];
-sx q0[113];
-rz(pi/2) q0[113];
-cx q0[49],q0[113];
-rz(-pi/4) q0[113];
-cx q0[0],q0[113];
-rz(pi/4) q0[113];
-cx q0[49],q0[113];
-rz(-pi/4) q0[113];
-cx q0[0],q0[113];
-rz(3*pi/4) q0[113];
-sx q0[113];
-rz(pi/2) q0[113];
-rz(pi/4) q0[49];
-cx q0[0],q0[49];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[49];
-cx q0[0],q0[49];
-cx q0[113],q0[49];
-rz(-pi) q0[114];
-sx q0[114];
-rz(0.75389285) q0[114];
-sx q0[114];
-cx q0[114],q0[50];
-rz(pi/2) q0[114];
-sx q0[114];
-rz(pi/2) q0[114];
-cx q0[50],q0[114];
-rz(-pi/4) q0[114];
-cx q0[0],q0[114];
-rz(pi/4) q0[114];
-cx q0[50],q0[114];
-rz(-pi/4) q0[114];
-cx q0[0],q0[114];
-rz(3*pi/4) q0[114];
-sx q0[114];
-rz(pi/2) q0[114];
-rz(pi/4) q0[50];
-cx q0[0],q0[50];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[50];
-cx q0[0],q0[50];
-cx q0[114],q0[50];
-rz(-pi) q0[115];
-sx q0[115];
-rz(0.82125665) q0[115];
-sx q0[115];
-cx q0[115],q0[51];
-rz(pi/2) q0[115];
-sx q0[115];
-rz(pi/2) q0[115];
-cx q0[51],q0[115];
-rz(-pi/4) q0[115];
-cx q0[0],q0[115];
-rz(pi/4) q0[115];
-cx q0[51],q0[115];
-rz(-pi/4) q0[115];
-cx q0[0],q0[115];
-rz(3*pi/4) q0[115];
-sx q0[115];
-rz(pi/2) q0[115];
-rz(pi/4) q0[51];
-cx q0[0],q0[51];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[51];
-cx q0[0],q0[51];
-cx q0[115],q0[51];
-rz(-pi) q0[116];
-sx q0[116];
-rz(2.7165023) q0[116];
-sx q0[116];
-cx q0[116],q0[52];
-rz(pi/2) q0[116];
-sx q0[116];
-rz(pi/2) q0[116];
-cx q0[52],q0[116];
-rz(-pi/4) q0[116];
-cx q0[0],q0[116];
-rz(pi/4) q0[116];
-cx q0[52],q0[116];
-rz(-pi/4) q0[116];
-cx q0[0],q0[116];
-rz(3*pi/4) q0[116];
-sx q0[116];
-rz(pi/2) q0[116];
-rz(pi/4) q0[52];
-cx q0[0],q0[52];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[52];
-cx q0[0],q0[52];
-cx q0[116],q0[52];
-rz(-pi) q0[117];
-sx q0[117];
-rz(1.0336367) q0[117];
-sx q0[117];
-cx q0[117],q0[53];
-rz(pi/2) q0[117];
-sx q0[117];
-rz(pi/2) q0[117];
-cx q0[53],q0[117];
-rz(-pi/4) q0[117];
-cx q0[0],q0[117];
-rz(pi/4) q0[117];
-cx q0[53],q0[117];
-rz(-pi/4) q0[117];
-cx q0[0],q0[117];
-rz(3*pi/4) q0[117];
-sx q0[117];
-rz(pi/2) q0[117];
-rz(pi/4) q0[53];
-cx q0[0],q0[53];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[53];
-cx q0[0],q0[53];
-cx q0[117],q0[53];
-rz(-pi) q0[118];
-sx q0[118];
-rz(0.22799425) q0[118];
-sx q0[118];
-cx q0[118],q0[54];
-rz(pi/2) q0[118];
-sx q0[118];
-rz(pi/2) q0[118];
-cx q0[54],q0[118];
-rz(-pi/4) q0[118];
-cx q0[0],q0[118];
-rz(pi/4) q0[118];
-cx q0[54],q0[118];
-rz(-pi/4) q0[118];
-cx q0[0],q0[118];
-rz(3*pi/4) q0[118];
-sx q0[118];
-rz(pi/2) q0[118];
-rz(pi/4) q0[54];
-cx q0[0],q0[54];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[54];
-cx q0[0],q0[54];
-cx q0[118],q0[54];
-rz(-pi) q0[119];
-sx q0[119];
-rz(2.5290342) q0[119];
-sx q0[119];
-cx q0[119],q0[55];
-rz(pi/2) q0[119];
-sx q0[119];
-rz(pi/2) q0[119];
-cx q0[55],q0[119];
-rz(-pi/4) q0[119];
-cx q0[0],q0[119];
-rz(pi/4) q0[119];
-cx q0[55],q0[119];
-rz(-pi/4) q0[119];
-cx q0[0],q0[119];
-rz(3*pi/4) q0[119];
-sx q0[119];
-rz(pi/2) q0[119];
-rz(pi/4) q0[55];
-cx q0[0],q0[55];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[55];
-cx q0[0],q0[55];
-cx q0[119],q0[55];
-rz(-pi) q0[120];
-sx q0[120];
-rz(1.6047168) q0[120];
-sx q0[120];
-cx q0[120],q0[56];
-rz(pi/2) q0[120];
-sx q0[120];
-rz(pi/2) q0[120];
-cx q0[56],q0[120];
-rz(-pi/4) q0[120];
-cx q0[0],q0[120];
-rz(pi/4) q0[120];
-cx q0[56],q0[120];
-rz(-pi/4) q0[120];
-cx q0[0],q0[120];
-rz(3*pi/4) q0[120];
-sx q0[120];
-rz(pi/2) q0[120];
-rz(pi/4) q0[56];
-cx q0[0],q0[56];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[56];
-cx q0[0],q0[56];
-cx q0[120],q0[56];
-rz(-pi) q0[121];
-sx q0[121];
-rz(2.4077133) q0[121];
-sx q0[121];
-cx q0[121],q0[57];
-rz(pi/2) q0[121];
-sx q0[121];
-rz(pi/2) q0[121];
-cx q0[57],q0[121];
-rz(-pi/4) q0[121];
-cx q0[0],q0[121];
-rz(pi/4) q0[121];
-cx q0[57],q0[121];
-rz(-pi/4) q0[121];
-cx q0[0],q0[121];
-rz(3*pi/4) q0[121];
-sx q0[121];
-rz(pi/2) q0[121];
-rz(pi/4) q0[57];
-cx q0[0],q0[57];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[57];
-cx q0[0],q0[57];
-cx q0[121],q0[57];
-rz(-pi) q0[122];
-sx q0[122];
-rz(1.7951596) q0[122];
-sx q0[122];
-cx q0[122],q0[58];
-rz(pi/2) q0[122];
-sx q0[122];
-rz(pi/2) q0[122];
-cx q0[58],q0[122];
-rz(-pi/4) q0[122];
-cx q0[0],q0[122];
-rz(pi/4) q0[122];
-cx q0[58],q0[122];
-rz(-pi/4) q0[122];
-cx q0[0],q0[122];
-rz(3*pi/4) q0[122];
-sx q0[122];
-rz(pi/2) q0[122];
-rz(pi/4) q0[58];
-cx q0[0],q0[58];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[58];
-cx q0[0],q0[58];
-cx q0[122],q0[58];
-rz(-pi) q0[123];
-sx q0[123];
-rz(2.7142261) q0[123];
-sx q0[123];
-cx q0[123],q0[59];
-rz(pi/2) q0[123];
-sx q0[123];
-rz(pi/2) q0[123];
-cx q0[59],q0[123];
-rz(-pi/4) q0[123];
-cx q0[0],q0[123];
-rz(pi/4) q0[123];
-cx q0[59],q0[123];
-rz(-pi/4) q0[123];
-cx q0[0],q0[123];
-rz(3*pi/4) q0[123];
-sx q0[123];
-rz(pi/2) q0[123];
-rz(pi/4) q0[59];
-cx q0[0],q0[59];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[59];
-cx q0[0],q0[59];
-cx q0[123],q0[59];
-rz(-pi) q0[124];
-sx q0[124];
-rz(0.96604825) q0[124];
-sx q0[124];
-cx q0[124],q0[60];
-rz(pi/2) q0[124];
-sx q0[124];
-rz(pi/2) q0[124];
-cx q0[60],q0[124];
-rz(-pi/4) q0[124];
-cx q0[0],q0[124];
-rz(pi/4) q0[124];
-cx q0[60],q0[124];
-rz(-pi/4) q0[124];
-cx q0[0],q0[124];
-rz(3*pi/4) q0[124];
-sx q0[124];
-rz(pi/2) q0[124];
-rz(pi/4) q0[60];
-cx q0[0],q0[60];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[60];
-cx q0[0],q0[60];
-cx q0[124],q0[60];
-rz(-pi) q0[125];
-sx q0[125];
-rz(2.8546969) q0[125];
-sx q0[125];
-cx q0[125],q0[61];
-rz(pi/2) q0[125];
-sx q0[125];
-rz(pi/2) q0[125];
-cx q0[61],q0[125];
-rz(-pi/4) q0[125];
-cx q0[0],q0[125];
-rz(pi/4) q0[125];
-cx q0[61],q0[125];
-rz(-pi/4) q0[125];
-cx q0[0],q0[125];
-rz(3*pi/4) q0[125];
-sx q0[125];
-rz(pi/2) q0[125];
-rz(pi/4) q0[61];
-cx q0[0],q0[61];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[61];
-cx q0[0],q0[61];
-cx q0[125],q0[61];
-rz(-pi) q0[126];
-sx q0[126];
-rz(0.32416105) q0[126];
-sx q0[126];
-cx q0[126],q0[62];
-rz(pi/2) q0[126];
-sx q0[126];
-rz(pi/2) q0[126];
-cx q0[62],q0[126];
-rz(-pi/4) q0[126];
-cx q0[0],q0[126];
-rz(pi/4) q0[126];
-cx q0[62],q0[126];
-rz(-pi/4) q0[126];
-cx q0[0],q0[126];
-rz(3*pi/4) q0[126];
-sx q0[126];
-rz(pi/2) q0[126];
-rz(pi/4) q0[62];
-cx q0[0],q0[62];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[62];
-cx q0[0],q0[62];
-cx q0[126],q0[62];
-rz(-pi) q0[127];
-sx q0[127];
-rz(0.28375015) q0[127];
-sx q0[127];
-cx q0[127],q0[63];
-rz(pi/2) q0[127];
-sx q0[127];
-rz(pi/2) q0[127];
-cx q0[63],q0[127];
-rz(-pi/4) q0[127];
-cx q0[0],q0[127];
-rz(pi/4) q0[127];
-cx q0[63],q0[127];
-rz(-pi/4) q0[127];
-cx q0[0],q0[127];
-rz(3*pi/4) q0[127];
-sx q0[127];
-rz(pi/2) q0[127];
-rz(pi/4) q0[63];
-cx q0[0],q0[63];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[63];
-cx q0[0],q0[63];
-cx q0[127],q0[63];
-rz(-pi) q0[128];
-sx q0[128];
-rz(2.3207835) q0[128];
-sx q0[128];
-cx q0[128],q0[64];
-rz(pi/2) q0[128];
-sx q0[128];
-rz(pi/2) q0[128];
-cx q0[64],q0[128];
-rz(-pi/4) q0[128];
-cx q0[0],q0[128];
-rz(pi/4) q0[128];
-cx q0[64],q0[128];
-rz(-pi/4) q0[128];
-cx q0[0],q0[128];
-rz(3*pi/4) q0[128];
-sx q0[128];
-rz(pi/2) q0[128];
-rz(pi/4) q0[64];
-cx q0[0],q0[64];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[64];
-cx q0[0],q0[64];
-rz(pi/2) q0[0];
-sx q0[0];
-rz(pi/2) q0[0];
-cx q0[128],q0[64];
-measure q0[0] -> c0[0];
@@ -1,52 +0,0 @@
-OPENQASM 2.0;
-include "qelib1.inc";
-qreg q0[31];
-creg c0[1];
-ry(0.73833681) q0[1];
-ry(2.1136653) q0[2];
-ry(0.99170185) q0[3];
-ry(2.4853475) q0[4];
-ry(2.9730737) q0[5];
-ry(0.11573346) q0[6];
-ry(0.36799169) q0[7];
-ry(2.9659679) q0[8];
-ry(2.8775801) q0[9];
-ry(0.042720746) q0[10];
-ry(1.7473397) q0[11];
-ry(0.76473447) q0[12];
-ry(2.1530548) q0[13];
-ry(0.57746513) q0[14];
-ry(0.28750319) q0[15];
-ry(2.7954465) q0[16];
-ry(2.701686) q0[17];
-ry(0.69770299) q0[18];
-ry(1.8460531) q0[19];
-ry(1.0848916) q0[20];
-ry(0.61300041) q0[21];
-ry(1.3209918) q0[22];
-ry(1.0717487) q0[23];
-ry(1.5048921) q0[24];
-ry(2.77678) q0[25];
-ry(1.9931856) q0[26];
-ry(2.8820925) q0[27];
-ry(2.7418371) q0[28];
-ry(0.98169416) q0[29];
-ry(2.2028701) q0[30];
-h q0[0];
-cswap q0[0],q0[1],q0[16];
-cswap q0[0],q0[2],q0[17];
-cswap q0[0],q0[3],q0[18];
-cswap q0[0],q0[4],q0[19];
-cswap q0[0],q0[5],q0[20];
-cswap q0[0],q0[6],q0[21];
-cswap q0[0],q0[7],q0[22];
-cswap q0[0],q0[8],q0[23];
-cswap q0[0],q0[9],q0[24];
-cswap q0[0],q0[10],q0[25];
-cswap q0[0],q0[11],q0[26];
-cswap q0[0],q0[12],q0[27];
-cswap q0[0],q0[13],q0[28];
-cswap q0[0],q0[14],q0[29];
-cswap q0[0],q0[15],q0[30];
-h q0[0];
-measure q0[0] -> c0[0];
@@ -1,431 +0,0 @@
-OPENQASM 2.0;
-include "qelib1.inc";
-qreg q0[31];
-creg c0[1];
-rz(pi/2) q0[0];
-sx q0[0];
-rz(pi/2) q0[0];
-rz(-pi) q0[1];
-sx q0[1];
-rz(2.4032558) q0[1];
-sx q0[1];
-rz(-pi) q0[2];
-sx q0[2];
-rz(1.0279274) q0[2];
-sx q0[2];
-rz(-pi) q0[3];
-sx q0[3];
-rz(2.1498908) q0[3];
-sx q0[3];
-rz(-pi) q0[4];
-sx q0[4];
-rz(0.65624515) q0[4];
-sx q0[4];
-rz(-pi) q0[5];
-sx q0[5];
-rz(0.16851895) q0[5];
-sx q0[5];
-rz(-pi) q0[6];
-sx q0[6];
-rz(3.0258592) q0[6];
-sx q0[6];
-rz(-pi) q0[7];
-sx q0[7];
-rz(2.773601) q0[7];
-sx q0[7];
-rz(-pi) q0[8];
-sx q0[8];
-rz(0.17562475) q0[8];
-sx q0[8];
-rz(-pi) q0[9];
-sx q0[9];
-rz(0.26401255) q0[9];
-sx q0[9];
-rz(-pi) q0[10];
-sx q0[10];
-rz(3.0988719) q0[10];
-sx q0[10];
-rz(-pi) q0[11];
-sx q0[11];
-rz(1.394253) q0[11];
-sx q0[11];
-rz(-pi) q0[12];
-sx q0[12];
-rz(2.3768582) q0[12];
-sx q0[12];
-rz(-pi) q0[13];
-sx q0[13];
-rz(0.98853785) q0[13];
-sx q0[13];
-rz(-pi) q0[14];
-sx q0[14];
-rz(2.5641275) q0[14];
-sx q0[14];
-rz(-pi) q0[15];
-sx q0[15];
-rz(2.8540895) q0[15];
-sx q0[15];
-rz(-pi) q0[16];
-sx q0[16];
-rz(0.34614615) q0[16];
-sx q0[16];
-cx q0[16],q0[1];
-rz(pi/2) q0[16];
-sx q0[16];
-rz(pi/2) q0[16];
-cx q0[1],q0[16];
-rz(-pi/4) q0[16];
-cx q0[0],q0[16];
-rz(pi/4) q0[16];
-cx q0[1],q0[16];
-rz(pi/4) q0[1];
-rz(-pi/4) q0[16];
-cx q0[0],q0[16];
-cx q0[0],q0[1];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[1];
-cx q0[0],q0[1];
-rz(3*pi/4) q0[16];
-sx q0[16];
-rz(pi/2) q0[16];
-cx q0[16],q0[1];
-rz(-pi) q0[17];
-sx q0[17];
-rz(0.43990665) q0[17];
-sx q0[17];
-cx q0[17],q0[2];
-rz(pi/2) q0[17];
-sx q0[17];
-rz(pi/2) q0[17];
-cx q0[2],q0[17];
-rz(-pi/4) q0[17];
-cx q0[0],q0[17];
-rz(pi/4) q0[17];
-cx q0[2],q0[17];
-rz(-pi/4) q0[17];
-cx q0[0],q0[17];
-rz(3*pi/4) q0[17];
-sx q0[17];
-rz(pi/2) q0[17];
-rz(pi/4) q0[2];
-cx q0[0],q0[2];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[2];
-cx q0[0],q0[2];
-cx q0[17],q0[2];
-rz(-pi) q0[18];
-sx q0[18];
-rz(2.4438897) q0[18];
-sx q0[18];
-cx q0[18],q0[3];
-rz(pi/2) q0[18];
-sx q0[18];
-rz(pi/2) q0[18];
-cx q0[3],q0[18];
-rz(-pi/4) q0[18];
-cx q0[0],q0[18];
-rz(pi/4) q0[18];
-cx q0[3],q0[18];
-rz(-pi/4) q0[18];
-cx q0[0],q0[18];
-rz(3*pi/4) q0[18];
-sx q0[18];
-rz(pi/2) q0[18];
-rz(pi/4) q0[3];
-cx q0[0],q0[3];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[3];
-cx q0[0],q0[3];
-cx q0[18],q0[3];
-rz(-pi) q0[19];
-sx q0[19];
-rz(1.2955396) q0[19];
-sx q0[19];
-cx q0[19],q0[4];
-rz(pi/2) q0[19];
-sx q0[19];
-rz(pi/2) q0[19];
-cx q0[4],q0[19];
-rz(-pi/4) q0[19];
-cx q0[0],q0[19];
-rz(pi/4) q0[19];
-cx q0[4],q0[19];
-rz(-pi/4) q0[19];
-cx q0[0],q0[19];
-rz(3*pi/4) q0[19];
-sx q0[19];
-rz(pi/2) q0[19];
-rz(pi/4) q0[4];
-cx q0[0],q0[4];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[4];
-cx q0[0],q0[4];
-cx q0[19],q0[4];
-rz(-pi) q0[20];
-sx q0[20];
-rz(2.0567011) q0[20];
-sx q0[20];
-cx q0[20],q0[5];
-rz(pi/2) q0[20];
-sx q0[20];
-rz(pi/2) q0[20];
-cx q0[5],q0[20];
-rz(-pi/4) q0[20];
-cx q0[0],q0[20];
-rz(pi/4) q0[20];
-cx q0[5],q0[20];
-rz(-pi/4) q0[20];
-cx q0[0],q0[20];
-rz(3*pi/4) q0[20];
-sx q0[20];
-rz(pi/2) q0[20];
-rz(pi/4) q0[5];
-cx q0[0],q0[5];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[5];
-cx q0[0],q0[5];
-cx q0[20],q0[5];
-rz(-pi) q0[21];
-sx q0[21];
-rz(2.5285922) q0[21];
-sx q0[21];
-cx q0[21],q0[6];
-rz(pi/2) q0[21];
-sx q0[21];
-rz(pi/2) q0[21];
-cx q0[6],q0[21];
-rz(-pi/4) q0[21];
-cx q0[0],q0[21];
-rz(pi/4) q0[21];
-cx q0[6],q0[21];
-rz(-pi/4) q0[21];
-cx q0[0],q0[21];
-rz(3*pi/4) q0[21];
-sx q0[21];
-rz(pi/2) q0[21];
-rz(pi/4) q0[6];
-cx q0[0],q0[6];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[6];
-cx q0[0],q0[6];
-cx q0[21],q0[6];
-rz(-pi) q0[22];
-sx q0[22];
-rz(1.8206009) q0[22];
-sx q0[22];
-cx q0[22],q0[7];
-rz(pi/2) q0[22];
-sx q0[22];
-rz(pi/2) q0[22];
-cx q0[7],q0[22];
-rz(-pi/4) q0[22];
-cx q0[0],q0[22];
-rz(pi/4) q0[22];
-cx q0[7],q0[22];
-rz(-pi/4) q0[22];
-cx q0[0],q0[22];
-rz(3*pi/4) q0[22];
-sx q0[22];
-rz(pi/2) q0[22];
-rz(pi/4) q0[7];
-cx q0[0],q0[7];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[7];
-cx q0[0],q0[7];
-cx q0[22],q0[7];
-rz(-pi) q0[23];
-sx q0[23];
-rz(2.069844) q0[23];
-sx q0[23];
-cx q0[23],q0[8];
-rz(pi/2) q0[23];
-sx q0[23];
-rz(pi/2) q0[23];
-cx q0[8],q0[23];
-rz(-pi/4) q0[23];
-cx q0[0],q0[23];
-rz(pi/4) q0[23];
-cx q0[8],q0[23];
-rz(-pi/4) q0[23];
-cx q0[0],q0[23];
-rz(3*pi/4) q0[23];
-sx q0[23];
-rz(pi/2) q0[23];
-rz(pi/4) q0[8];
-cx q0[0],q0[8];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[8];
-cx q0[0],q0[8];
-cx q0[23],q0[8];
-rz(-pi) q0[24];
-sx q0[24];
-rz(1.6367006) q0[24];
-sx q0[24];
-cx q0[24],q0[9];
-rz(pi/2) q0[24];
-sx q0[24];
-rz(pi/2) q0[24];
-cx q0[9],q0[24];
-rz(-pi/4) q0[24];
-cx q0[0],q0[24];
-rz(pi/4) q0[24];
-cx q0[9],q0[24];
-rz(-pi/4) q0[24];
-cx q0[0],q0[24];
-rz(3*pi/4) q0[24];
-sx q0[24];
-rz(pi/2) q0[24];
-rz(pi/4) q0[9];
-cx q0[0],q0[9];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[9];
-cx q0[0],q0[9];
-cx q0[24],q0[9];
-rz(-pi) q0[25];
-sx q0[25];
-rz(0.36481265) q0[25];
-sx q0[25];
-cx q0[25],q0[10];
-rz(pi/2) q0[25];
-sx q0[25];
-rz(pi/2) q0[25];
-cx q0[10],q0[25];
-rz(-pi/4) q0[25];
-cx q0[0],q0[25];
-rz(pi/4) q0[25];
-cx q0[10],q0[25];
-rz(pi/4) q0[10];
-rz(-pi/4) q0[25];
-cx q0[0],q0[25];
-cx q0[0],q0[10];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[10];
-cx q0[0],q0[10];
-rz(3*pi/4) q0[25];
-sx q0[25];
-rz(pi/2) q0[25];
-cx q0[25],q0[10];
-rz(-pi) q0[26];
-sx q0[26];
-rz(1.1484071) q0[26];
-sx q0[26];
-cx q0[26],q0[11];
-rz(pi/2) q0[26];
-sx q0[26];
-rz(pi/2) q0[26];
-cx q0[11],q0[26];
-rz(-pi/4) q0[26];
-cx q0[0],q0[26];
-rz(pi/4) q0[26];
-cx q0[11],q0[26];
-rz(pi/4) q0[11];
-rz(-pi/4) q0[26];
-cx q0[0],q0[26];
-cx q0[0],q0[11];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[11];
-cx q0[0],q0[11];
-rz(3*pi/4) q0[26];
-sx q0[26];
-rz(pi/2) q0[26];
-cx q0[26],q0[11];
-rz(-pi) q0[27];
-sx q0[27];
-rz(0.25950015) q0[27];
-sx q0[27];
-cx q0[27],q0[12];
-rz(pi/2) q0[27];
-sx q0[27];
-rz(pi/2) q0[27];
-cx q0[12],q0[27];
-rz(-pi/4) q0[27];
-cx q0[0],q0[27];
-rz(pi/4) q0[27];
-cx q0[12],q0[27];
-rz(pi/4) q0[12];
-rz(-pi/4) q0[27];
-cx q0[0],q0[27];
-cx q0[0],q0[12];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[12];
-cx q0[0],q0[12];
-rz(3*pi/4) q0[27];
-sx q0[27];
-rz(pi/2) q0[27];
-cx q0[27],q0[12];
-rz(-pi) q0[28];
-sx q0[28];
-rz(0.39975555) q0[28];
-sx q0[28];
-cx q0[28],q0[13];
-rz(pi/2) q0[28];
-sx q0[28];
-rz(pi/2) q0[28];
-cx q0[13],q0[28];
-rz(-pi/4) q0[28];
-cx q0[0],q0[28];
-rz(pi/4) q0[28];
-cx q0[13],q0[28];
-rz(pi/4) q0[13];
-rz(-pi/4) q0[28];
-cx q0[0],q0[28];
-cx q0[0],q0[13];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[13];
-cx q0[0],q0[13];
-rz(3*pi/4) q0[28];
-sx q0[28];
-rz(pi/2) q0[28];
-cx q0[28],q0[13];
-rz(-pi) q0[29];
-sx q0[29];
-rz(2.1598985) q0[29];
-sx q0[29];
-cx q0[29],q0[14];
-rz(pi/2) q0[29];
-sx q0[29];
-rz(pi/2) q0[29];
-cx q0[14],q0[29];
-rz(-pi/4) q0[29];
-cx q0[0],q0[29];
-rz(pi/4) q0[29];
-cx q0[14],q0[29];
-rz(pi/4) q0[14];
-rz(-pi/4) q0[29];
-cx q0[0],q0[29];
-cx q0[0],q0[14];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[14];
-cx q0[0],q0[14];
-rz(3*pi/4) q0[29];
-sx q0[29];
-rz(pi/2) q0[29];
-cx q0[29],q0[14];
-rz(-pi) q0[30];
-sx q0[30];
-rz(0.93872255) q0[30];
-sx q0[30];
-cx q0[30],q0[15];
-rz(pi/2) q0[30];
-sx q0[30];
-rz(pi/2) q0[30];
-cx q0[15],q0[30];
-rz(-pi/4) q0[30];
-cx q0[0],q0[30];
-rz(pi/4) q0[30];
-cx q0[15],q0[30];
-rz(pi/4) q0[15];
-rz(-pi/4) q0[30];
-cx q0[0],q0[30];
-cx q0[0],q0[15];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[15];
-cx q0[0],q0[15];
-rz(pi/2) q0[0];
-sx q0[0];
-rz(pi/2) q0[0];
-rz(3*pi/4) q0[30];
-sx q0[30];
-rz(pi/2) q0[30];
-cx q0[30],q0[15];
-measure q0[0] -> c0[0];
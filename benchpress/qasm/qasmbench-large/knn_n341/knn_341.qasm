@@ -1,517 +0,0 @@
-OPENQASM 2.0;
-include "qelib1.inc";
-qreg q0[341];
-creg c0[1];
-ry(0.8726322) q0[1];
-ry(0.59014501) q0[2];
-ry(1.1470566) q0[3];
-ry(1.3185278) q0[4];
-ry(1.0666333) q0[5];
-ry(2.8593704) q0[6];
-ry(0.23176672) q0[7];
-ry(3.0745676) q0[8];
-ry(1.2248805) q0[9];
-ry(0.46367687) q0[10];
-ry(1.1879211) q0[11];
-ry(1.3121465) q0[12];
-ry(1.9062341) q0[13];
-ry(2.4765374) q0[14];
-ry(2.0610404) q0[15];
-ry(0.59508172) q0[16];
-ry(1.7943979) q0[17];
-ry(1.4929191) q0[18];
-ry(0.62833436) q0[19];
-ry(1.0103341) q0[20];
-ry(2.0854634) q0[21];
-ry(3.0067428) q0[22];
-ry(0.51154037) q0[23];
-ry(2.1924568) q0[24];
-ry(0.55551938) q0[25];
-ry(0.39680792) q0[26];
-ry(0.91889846) q0[27];
-ry(0.50585684) q0[28];
-ry(1.6679857) q0[29];
-ry(1.9616086) q0[30];
-ry(0.066848413) q0[31];
-ry(1.5715859) q0[32];
-ry(1.7216281) q0[33];
-ry(2.44577) q0[34];
-ry(1.3291653) q0[35];
-ry(1.6502269) q0[36];
-ry(0.12349421) q0[37];
-ry(2.3244727) q0[38];
-ry(1.233296) q0[39];
-ry(1.4075405) q0[40];
-ry(1.7969113) q0[41];
-ry(0.44371336) q0[42];
-ry(2.4157948) q0[43];
-ry(1.6891487) q0[44];
-ry(0.1253688) q0[45];
-ry(2.7669141) q0[46];
-ry(0.58680243) q0[47];
-ry(1.8052507) q0[48];
-ry(2.5663334) q0[49];
-ry(0.49691522) q0[50];
-ry(3.1338959) q0[51];
-ry(2.7439001) q0[52];
-ry(2.1315345) q0[53];
-ry(0.85506353) q0[54];
-ry(2.0846625) q0[55];
-ry(2.9819731) q0[56];
-ry(0.94269743) q0[57];
-ry(2.7378405) q0[58];
-ry(0.40777687) q0[59];
-ry(2.047824) q0[60];
-ry(0.18124137) q0[61];
-ry(1.0852188) q0[62];
-ry(0.058571094) q0[63];
-ry(2.9934311) q0[64];
-ry(0.3860579) q0[65];
-ry(0.61460055) q0[66];
-ry(1.7565345) q0[67];
-ry(1.4687417) q0[68];
-ry(0.45333223) q0[69];
-ry(2.9579069) q0[70];
-ry(1.0072505) q0[71];
-ry(1.835666) q0[72];
-ry(0.052428971) q0[73];
-ry(2.4154358) q0[74];
-ry(0.064459541) q0[75];
-ry(2.843099) q0[76];
-ry(1.8319577) q0[77];
-ry(2.6573179) q0[78];
-ry(0.46575592) q0[79];
-ry(0.73332068) q0[80];
-ry(0.96755905) q0[81];
-ry(0.55113271) q0[82];
-ry(2.0426467) q0[83];
-ry(1.3020704) q0[84];
-ry(0.23430234) q0[85];
-ry(2.4070392) q0[86];
-ry(1.551766) q0[87];
-ry(2.9268702) q0[88];
-ry(0.081618443) q0[89];
-ry(1.7882688) q0[90];
-ry(1.8652143) q0[91];
-ry(0.56753217) q0[92];
-ry(0.53179449) q0[93];
-ry(0.0081645247) q0[94];
-ry(2.3662892) q0[95];
-ry(1.6436044) q0[96];
-ry(0.79248484) q0[97];
-ry(1.4905964) q0[98];
-ry(0.3136546) q0[99];
-ry(0.89885618) q0[100];
-ry(1.4652759) q0[101];
-ry(2.5074525) q0[102];
-ry(1.1144685) q0[103];
-ry(1.8055099) q0[104];
-ry(0.39910181) q0[105];
-ry(0.22932752) q0[106];
-ry(0.57420839) q0[107];
-ry(2.4492332) q0[108];
-ry(1.9332963) q0[109];
-ry(0.027626966) q0[110];
-ry(0.51374245) q0[111];
-ry(1.2336929) q0[112];
-ry(1.9866796) q0[113];
-ry(0.093835445) q0[114];
-ry(0.77457598) q0[115];
-ry(0.73715556) q0[116];
-ry(2.0187821) q0[117];
-ry(2.8077604) q0[118];
-ry(1.45442) q0[119];
-ry(0.78536024) q0[120];
-ry(1.0089622) q0[121];
-ry(0.14555807) q0[122];
-ry(2.6596772) q0[123];
-ry(1.7553529) q0[124];
-ry(1.6655675) q0[125];
-ry(2.942169) q0[126];
-ry(0.49239909) q0[127];
-ry(0.68666551) q0[128];
-ry(2.6470597) q0[129];
-ry(2.74616) q0[130];
-ry(3.0501097) q0[131];
-ry(2.5481581) q0[132];
-ry(2.0062674) q0[133];
-ry(0.56513936) q0[134];
-ry(1.1843659) q0[135];
-ry(2.1128473) q0[136];
-ry(2.8508101) q0[137];
-ry(1.3933625) q0[138];
-ry(2.9930425) q0[139];
-ry(2.7778892) q0[140];
-ry(1.2092112) q0[141];
-ry(0.78468377) q0[142];
-ry(1.5797774) q0[143];
-ry(1.8777388) q0[144];
-ry(1.117383) q0[145];
-ry(1.1058974) q0[146];
-ry(2.6523926) q0[147];
-ry(3.0072834) q0[148];
-ry(1.9154756) q0[149];
-ry(2.8220418) q0[150];
-ry(3.0283374) q0[151];
-ry(2.2564996) q0[152];
-ry(1.7372408) q0[153];
-ry(2.171112) q0[154];
-ry(0.28865267) q0[155];
-ry(1.4205215) q0[156];
-ry(0.50911374) q0[157];
-ry(3.0395381) q0[158];
-ry(0.57185915) q0[159];
-ry(2.4545767) q0[160];
-ry(3.0521696) q0[161];
-ry(0.96006238) q0[162];
-ry(2.868383) q0[163];
-ry(2.6865933) q0[164];
-ry(2.9275729) q0[165];
-ry(0.96217391) q0[166];
-ry(1.6482274) q0[167];
-ry(1.5221668) q0[168];
-ry(1.0510173) q0[169];
-ry(1.0861589) q0[170];
-ry(0.61762643) q0[171];
-ry(0.07035298) q0[172];
-ry(1.1143726) q0[173];
-ry(1.3019526) q0[174];
-ry(2.8286729) q0[175];
-ry(0.86089416) q0[176];
-ry(1.591726) q0[177];
-ry(0.88421788) q0[178];
-ry(2.1186774) q0[179];
-ry(1.1951537) q0[180];
-ry(0.75577359) q0[181];
-ry(1.9209529) q0[182];
-ry(2.7129852) q0[183];
-ry(3.1030008) q0[184];
-ry(1.9796798) q0[185];
-ry(1.5213251) q0[186];
-ry(0.8472382) q0[187];
-ry(2.7465909) q0[188];
-ry(2.6422646) q0[189];
-ry(0.46761299) q0[190];
-ry(2.5096213) q0[191];
-ry(1.7198843) q0[192];
-ry(2.1516241) q0[193];
-ry(2.7565611) q0[194];
-ry(0.96172969) q0[195];
-ry(1.224776) q0[196];
-ry(1.4094413) q0[197];
-ry(0.75700861) q0[198];
-ry(2.8412271) q0[199];
-ry(1.082992) q0[200];
-ry(0.62524276) q0[201];
-ry(0.84260831) q0[202];
-ry(1.8347441) q0[203];
-ry(3.0453949) q0[204];
-ry(1.8459715) q0[205];
-ry(1.6726993) q0[206];
-ry(1.6063949) q0[207];
-ry(0.6604853) q0[208];
-ry(2.4445254) q0[209];
-ry(1.1991544) q0[210];
-ry(1.2747166) q0[211];
-ry(0.80873137) q0[212];
-ry(0.31664647) q0[213];
-ry(1.9452238) q0[214];
-ry(0.065640831) q0[215];
-ry(2.9173621) q0[216];
-ry(0.67867985) q0[217];
-ry(0.29902743) q0[218];
-ry(2.7667137) q0[219];
-ry(1.1523388) q0[220];
-ry(3.0600144) q0[221];
-ry(0.86082479) q0[222];
-ry(1.9422235) q0[223];
-ry(0.036721187) q0[224];
-ry(1.410921) q0[225];
-ry(1.662604) q0[226];
-ry(1.1388393) q0[227];
-ry(1.8780901) q0[228];
-ry(1.5687) q0[229];
-ry(2.2788159) q0[230];
-ry(2.7467337) q0[231];
-ry(0.40511683) q0[232];
-ry(0.38936746) q0[233];
-ry(1.5227556) q0[234];
-ry(1.6064343) q0[235];
-ry(1.274878) q0[236];
-ry(0.35465358) q0[237];
-ry(2.3279254) q0[238];
-ry(0.89344446) q0[239];
-ry(0.50416388) q0[240];
-ry(0.43017026) q0[241];
-ry(0.99993206) q0[242];
-ry(0.9441447) q0[243];
-ry(0.24299821) q0[244];
-ry(2.3523585) q0[245];
-ry(1.3231959) q0[246];
-ry(0.83919634) q0[247];
-ry(1.4003031) q0[248];
-ry(2.729781) q0[249];
-ry(2.8468833) q0[250];
-ry(2.91156) q0[251];
-ry(0.86348097) q0[252];
-ry(0.12437616) q0[253];
-ry(0.17827779) q0[254];
-ry(2.291788) q0[255];
-ry(2.2773886) q0[256];
-ry(2.8448174) q0[257];
-ry(2.7656127) q0[258];
-ry(0.63595728) q0[259];
-ry(0.34126776) q0[260];
-ry(2.4845) q0[261];
-ry(1.2084488) q0[262];
-ry(0.11690472) q0[263];
-ry(0.016844571) q0[264];
-ry(2.479933) q0[265];
-ry(2.746003) q0[266];
-ry(2.1609385) q0[267];
-ry(1.381616) q0[268];
-ry(1.5340129) q0[269];
-ry(1.5756915) q0[270];
-ry(2.5360966) q0[271];
-ry(0.64351077) q0[272];
-ry(1.0566872) q0[273];
-ry(0.19145164) q0[274];
-ry(0.99723903) q0[275];
-ry(1.3178132) q0[276];
-ry(2.9882398) q0[277];
-ry(2.5052021) q0[278];
-ry(2.7761659) q0[279];
-ry(2.7666467) q0[280];
-ry(0.18289088) q0[281];
-ry(2.001343) q0[282];
-ry(0.79465933) q0[283];
-ry(3.0199987) q0[284];
-ry(0.56777372) q0[285];
-ry(1.3299504) q0[286];
-ry(0.48855283) q0[287];
-ry(0.83629302) q0[288];
-ry(2.4905847) q0[289];
-ry(0.54763215) q0[290];
-ry(2.1206387) q0[291];
-ry(2.151932) q0[292];
-ry(2.8678437) q0[293];
-ry(3.0633998) q0[294];
-ry(0.4800377) q0[295];
-ry(2.66715) q0[296];
-ry(0.35979412) q0[297];
-ry(0.56901327) q0[298];
-ry(0.21020971) q0[299];
-ry(0.79914716) q0[300];
-ry(1.1554778) q0[301];
-ry(1.7407638) q0[302];
-ry(0.22975267) q0[303];
-ry(0.5005742) q0[304];
-ry(0.34507947) q0[305];
-ry(0.5396498) q0[306];
-ry(1.735153) q0[307];
-ry(1.1787712) q0[308];
-ry(0.49812037) q0[309];
-ry(1.9158977) q0[310];
-ry(2.6189372) q0[311];
-ry(2.7819674) q0[312];
-ry(1.4796766) q0[313];
-ry(2.2946537) q0[314];
-ry(0.30918214) q0[315];
-ry(1.8977578) q0[316];
-ry(1.0163971) q0[317];
-ry(2.9475602) q0[318];
-ry(2.7095287) q0[319];
-ry(2.8753595) q0[320];
-ry(0.18800818) q0[321];
-ry(0.12286622) q0[322];
-ry(1.0334994) q0[323];
-ry(1.9948388) q0[324];
-ry(0.73867214) q0[325];
-ry(2.5050449) q0[326];
-ry(0.39306116) q0[327];
-ry(0.68610776) q0[328];
-ry(2.6791247) q0[329];
-ry(1.4504879) q0[330];
-ry(2.1693501) q0[331];
-ry(2.3344951) q0[332];
-ry(1.0275132) q0[333];
-ry(2.4275105) q0[334];
-ry(0.26808474) q0[335];
-ry(0.14976649) q0[336];
-ry(1.7860293) q0[337];
-ry(1.3527361) q0[338];
-ry(1.3432774) q0[339];
-ry(0.93438656) q0[340];
-h q0[0];
-cswap q0[0],q0[1],q0[171];
-cswap q0[0],q0[2],q0[172];
-cswap q0[0],q0[3],q0[173];
-cswap q0[0],q0[4],q0[174];
-cswap q0[0],q0[5],q0[175];
-cswap q0[0],q0[6],q0[176];
-cswap q0[0],q0[7],q0[177];
-cswap q0[0],q0[8],q0[178];
-cswap q0[0],q0[9],q0[179];
-cswap q0[0],q0[10],q0[180];
-cswap q0[0],q0[11],q0[181];
-cswap q0[0],q0[12],q0[182];
-cswap q0[0],q0[13],q0[183];
-cswap q0[0],q0[14],q0[184];
-cswap q0[0],q0[15],q0[185];
-cswap q0[0],q0[16],q0[186];
-cswap q0[0],q0[17],q0[187];
-cswap q0[0],q0[18],q0[188];
-cswap q0[0],q0[19],q0[189];
-cswap q0[0],q0[20],q0[190];
-cswap q0[0],q0[21],q0[191];
-cswap q0[0],q0[22],q0[192];
-cswap q0[0],q0[23],q0[193];
-cswap q0[0],q0[24],q0[194];
-cswap q0[0],q0[25],q0[195];
-cswap q0[0],q0[26],q0[196];
-cswap q0[0],q0[27],q0[197];
-cswap q0[0],q0[28],q0[198];
-cswap q0[0],q0[29],q0[199];
-cswap q0[0],q0[30],q0[200];
-cswap q0[0],q0[31],q0[201];
-cswap q0[0],q0[32],q0[202];
-cswap q0[0],q0[33],q0[203];
-cswap q0[0],q0[34],q0[204];
-cswap q0[0],q0[35],q0[205];
-cswap q0[0],q0[36],q0[206];
-cswap q0[0],q0[37],q0[207];
-cswap q0[0],q0[38],q0[208];
-cswap q0[0],q0[39],q0[209];
-cswap q0[0],q0[40],q0[210];
-cswap q0[0],q0[41],q0[211];
-cswap q0[0],q0[42],q0[212];
-cswap q0[0],q0[43],q0[213];
-cswap q0[0],q0[44],q0[214];
-cswap q0[0],q0[45],q0[215];
-cswap q0[0],q0[46],q0[216];
-cswap q0[0],q0[47],q0[217];
-cswap q0[0],q0[48],q0[218];
-cswap q0[0],q0[49],q0[219];
-cswap q0[0],q0[50],q0[220];
-cswap q0[0],q0[51],q0[221];
-cswap q0[0],q0[52],q0[222];
-cswap q0[0],q0[53],q0[223];
-cswap q0[0],q0[54],q0[224];
-cswap q0[0],q0[55],q0[225];
-cswap q0[0],q0[56],q0[226];
-cswap q0[0],q0[57],q0[227];
-cswap q0[0],q0[58],q0[228];
-cswap q0[0],q0[59],q0[229];
-cswap q0[0],q0[60],q0[230];
-cswap q0[0],q0[61],q0[231];
-cswap q0[0],q0[62],q0[232];
-cswap q0[0],q0[63],q0[233];
-cswap q0[0],q0[64],q0[234];
-cswap q0[0],q0[65],q0[235];
-cswap q0[0],q0[66],q0[236];
-cswap q0[0],q0[67],q0[237];
-cswap q0[0],q0[68],q0[238];
-cswap q0[0],q0[69],q0[239];
-cswap q0[0],q0[70],q0[240];
-cswap q0[0],q0[71],q0[241];
-cswap q0[0],q0[72],q0[242];
-cswap q0[0],q0[73],q0[243];
-cswap q0[0],q0[74],q0[244];
-cswap q0[0],q0[75],q0[245];
-cswap q0[0],q0[76],q0[246];
-cswap q0[0],q0[77],q0[247];
-cswap q0[0],q0[78],q0[248];
-cswap q0[0],q0[79],q0[249];
-cswap q0[0],q0[80],q0[250];
-cswap q0[0],q0[81],q0[251];
-cswap q0[0],q0[82],q0[252];
-cswap q0[0],q0[83],q0[253];
-cswap q0[0],q0[84],q0[254];
-cswap q0[0],q0[85],q0[255];
-cswap q0[0],q0[86],q0[256];
-cswap q0[0],q0[87],q0[257];
-cswap q0[0],q0[88],q0[258];
-cswap q0[0],q0[89],q0[259];
-cswap q0[0],q0[90],q0[260];
-cswap q0[0],q0[91],q0[261];
-cswap q0[0],q0[92],q0[262];
-cswap q0[0],q0[93],q0[263];
-cswap q0[0],q0[94],q0[264];
-cswap q0[0],q0[95],q0[265];
-cswap q0[0],q0[96],q0[266];
-cswap q0[0],q0[97],q0[267];
-cswap q0[0],q0[98],q0[268];
-cswap q0[0],q0[99],q0[269];
-cswap q0[0],q0[100],q0[270];
-cswap q0[0],q0[101],q0[271];
-cswap q0[0],q0[102],q0[272];
-cswap q0[0],q0[103],q0[273];
-cswap q0[0],q0[104],q0[274];
-cswap q0[0],q0[105],q0[275];
-cswap q0[0],q0[106],q0[276];
-cswap q0[0],q0[107],q0[277];
-cswap q0[0],q0[108],q0[278];
-cswap q0[0],q0[109],q0[279];
-cswap q0[0],q0[110],q0[280];
-cswap q0[0],q0[111],q0[281];
-cswap q0[0],q0[112],q0[282];
-cswap q0[0],q0[113],q0[283];
-cswap q0[0],q0[114],q0[284];
-cswap q0[0],q0[115],q0[285];
-cswap q0[0],q0[116],q0[286];
-cswap q0[0],q0[117],q0[287];
-cswap q0[0],q0[118],q0[288];
-cswap q0[0],q0[119],q0[289];
-cswap q0[0],q0[120],q0[290];
-cswap q0[0],q0[121],q0[291];
-cswap q0[0],q0[122],q0[292];
-cswap q0[0],q0[123],q0[293];
-cswap q0[0],q0[124],q0[294];
-cswap q0[0],q0[125],q0[295];
-cswap q0[0],q0[126],q0[296];
-cswap q0[0],q0[127],q0[297];
-cswap q0[0],q0[128],q0[298];
-cswap q0[0],q0[129],q0[299];
-cswap q0[0],q0[130],q0[300];
-cswap q0[0],q0[131],q0[301];
-cswap q0[0],q0[132],q0[302];
-cswap q0[0],q0[133],q0[303];
-cswap q0[0],q0[134],q0[304];
-cswap q0[0],q0[135],q0[305];
-cswap q0[0],q0[136],q0[306];
-cswap q0[0],q0[137],q0[307];
-cswap q0[0],q0[138],q0[308];
-cswap q0[0],q0[139],q0[309];
-cswap q0[0],q0[140],q0[310];
-cswap q0[0],q0[141],q0[311];
-cswap q0[0],q0[142],q0[312];
-cswap q0[0],q0[143],q0[313];
-cswap q0[0],q0[144],q0[314];
-cswap q0[0],q0[145],q0[315];
-cswap q0[0],q0[146],q0[316];
-cswap q0[0],q0[147],q0[317];
-cswap q0[0],q0[148],q0[318];
-cswap q0[0],q0[149],q0[319];
-cswap q0[0],q0[150],q0[320];
-cswap q0[0],q0[151],q0[321];
-cswap q0[0],q0[152],q0[322];
-cswap q0[0],q0[153],q0[323];
-cswap q0[0],q0[154],q0[324];
-cswap q0[0],q0[155],q0[325];
-cswap q0[0],q0[156],q0[326];
-cswap q0[0],q0[157],q0[327];
-cswap q0[0],q0[158],q0[328];
-cswap q0[0],q0[159],q0[329];
-cswap q0[0],q0[160],q0[330];
-cswap q0[0],q0[161],q0[331];
-cswap q0[0],q0[162],q0[332];
-cswap q0[0],q0[163],q0[333];
-cswap q0[0],q0[164],q0[334];
-cswap q0[0],q0[165],q0[335];
-cswap q0[0],q0[166],q0[336];
-cswap q0[0],q0[167],q0[337];
-cswap q0[0],q0[168],q0[338];
-cswap q0[0],q0[169],q0[339];
-cswap q0[0],q0[170],q0[340];
-h q0[0];
-measure q0[0] -> c0[0];
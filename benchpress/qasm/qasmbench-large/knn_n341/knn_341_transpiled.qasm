@@ -1,4771 +0,0 @@
-OPENQASM 2.0;
-include "qelib1.inc";
-qreg q0[341];
-creg c0[1];
-rz(pi/2) q0[0];
-sx q0[0];
-rz(pi/2) q0[0];
-rz(-pi) q0[1];
-sx q0[1];
-rz(2.2689605) q0[1];
-sx q0[1];
-rz(-pi) q0[2];
-sx q0[2];
-rz(2.5514476) q0[2];
-sx q0[2];
-rz(-pi) q0[3];
-sx q0[3];
-rz(1.9945361) q0[3];
-sx q0[3];
-rz(-pi) q0[4];
-sx q0[4];
-rz(1.8230649) q0[4];
-sx q0[4];
-rz(-pi) q0[5];
-sx q0[5];
-rz(2.0749594) q0[5];
-sx q0[5];
-rz(-pi) q0[6];
-sx q0[6];
-rz(0.28222225) q0[6];
-sx q0[6];
-rz(-pi) q0[7];
-sx q0[7];
-rz(2.9098259) q0[7];
-sx q0[7];
-rz(-pi) q0[8];
-sx q0[8];
-rz(0.067025054) q0[8];
-sx q0[8];
-rz(-pi) q0[9];
-sx q0[9];
-rz(1.9167122) q0[9];
-sx q0[9];
-rz(-pi) q0[10];
-sx q0[10];
-rz(2.6779158) q0[10];
-sx q0[10];
-rz(-pi) q0[11];
-sx q0[11];
-rz(1.9536716) q0[11];
-sx q0[11];
-rz(-pi) q0[12];
-sx q0[12];
-rz(1.8294462) q0[12];
-sx q0[12];
-rz(-pi) q0[13];
-sx q0[13];
-rz(1.2353586) q0[13];
-sx q0[13];
-rz(-pi) q0[14];
-sx q0[14];
-rz(0.66505525) q0[14];
-sx q0[14];
-rz(-pi) q0[15];
-sx q0[15];
-rz(1.0805523) q0[15];
-sx q0[15];
-rz(-pi) q0[16];
-sx q0[16];
-rz(2.5465109) q0[16];
-sx q0[16];
-rz(-pi) q0[17];
-sx q0[17];
-rz(1.3471948) q0[17];
-sx q0[17];
-rz(-pi) q0[18];
-sx q0[18];
-rz(1.6486736) q0[18];
-sx q0[18];
-rz(-pi) q0[19];
-sx q0[19];
-rz(2.5132583) q0[19];
-sx q0[19];
-rz(-pi) q0[20];
-sx q0[20];
-rz(2.1312586) q0[20];
-sx q0[20];
-rz(-pi) q0[21];
-sx q0[21];
-rz(1.0561293) q0[21];
-sx q0[21];
-rz(-pi) q0[22];
-sx q0[22];
-rz(0.13484985) q0[22];
-sx q0[22];
-rz(-pi) q0[23];
-sx q0[23];
-rz(2.6300523) q0[23];
-sx q0[23];
-rz(-pi) q0[24];
-sx q0[24];
-rz(0.94913585) q0[24];
-sx q0[24];
-rz(-pi) q0[25];
-sx q0[25];
-rz(2.5860733) q0[25];
-sx q0[25];
-rz(-pi) q0[26];
-sx q0[26];
-rz(2.7447847) q0[26];
-sx q0[26];
-rz(-pi) q0[27];
-sx q0[27];
-rz(2.2226942) q0[27];
-sx q0[27];
-rz(-pi) q0[28];
-sx q0[28];
-rz(2.6357358) q0[28];
-sx q0[28];
-rz(-pi) q0[29];
-sx q0[29];
-rz(1.473607) q0[29];
-sx q0[29];
-rz(-pi) q0[30];
-sx q0[30];
-rz(1.1799841) q0[30];
-sx q0[30];
-rz(-pi) q0[31];
-sx q0[31];
-rz(3.0747442) q0[31];
-sx q0[31];
-rz(-pi) q0[32];
-sx q0[32];
-rz(1.5700068) q0[32];
-sx q0[32];
-rz(-pi) q0[33];
-sx q0[33];
-rz(1.4199646) q0[33];
-sx q0[33];
-rz(-pi) q0[34];
-sx q0[34];
-rz(0.69582265) q0[34];
-sx q0[34];
-rz(-pi) q0[35];
-sx q0[35];
-rz(1.8124274) q0[35];
-sx q0[35];
-rz(-pi) q0[36];
-sx q0[36];
-rz(1.4913658) q0[36];
-sx q0[36];
-rz(-pi) q0[37];
-sx q0[37];
-rz(3.0180984) q0[37];
-sx q0[37];
-rz(-pi) q0[38];
-sx q0[38];
-rz(0.81711995) q0[38];
-sx q0[38];
-rz(-pi) q0[39];
-sx q0[39];
-rz(1.9082967) q0[39];
-sx q0[39];
-rz(-pi) q0[40];
-sx q0[40];
-rz(1.7340522) q0[40];
-sx q0[40];
-rz(-pi) q0[41];
-sx q0[41];
-rz(1.3446814) q0[41];
-sx q0[41];
-rz(-pi) q0[42];
-sx q0[42];
-rz(2.6978793) q0[42];
-sx q0[42];
-rz(-pi) q0[43];
-sx q0[43];
-rz(0.72579785) q0[43];
-sx q0[43];
-rz(-pi) q0[44];
-sx q0[44];
-rz(1.452444) q0[44];
-sx q0[44];
-rz(-pi) q0[45];
-sx q0[45];
-rz(3.0162239) q0[45];
-sx q0[45];
-rz(-pi) q0[46];
-sx q0[46];
-rz(0.37467855) q0[46];
-sx q0[46];
-rz(-pi) q0[47];
-sx q0[47];
-rz(2.5547902) q0[47];
-sx q0[47];
-rz(-pi) q0[48];
-sx q0[48];
-rz(1.336342) q0[48];
-sx q0[48];
-rz(-pi) q0[49];
-sx q0[49];
-rz(0.57525925) q0[49];
-sx q0[49];
-rz(-pi) q0[50];
-sx q0[50];
-rz(2.6446774) q0[50];
-sx q0[50];
-rz(-pi) q0[51];
-sx q0[51];
-rz(0.0076967536) q0[51];
-sx q0[51];
-rz(-pi) q0[52];
-sx q0[52];
-rz(0.39769255) q0[52];
-sx q0[52];
-rz(-pi) q0[53];
-sx q0[53];
-rz(1.0100582) q0[53];
-sx q0[53];
-rz(-pi) q0[54];
-sx q0[54];
-rz(2.2865291) q0[54];
-sx q0[54];
-rz(-pi) q0[55];
-sx q0[55];
-rz(1.0569302) q0[55];
-sx q0[55];
-rz(-pi) q0[56];
-sx q0[56];
-rz(0.15961955) q0[56];
-sx q0[56];
-rz(-pi) q0[57];
-sx q0[57];
-rz(2.1988952) q0[57];
-sx q0[57];
-rz(-pi) q0[58];
-sx q0[58];
-rz(0.40375215) q0[58];
-sx q0[58];
-rz(-pi) q0[59];
-sx q0[59];
-rz(2.7338158) q0[59];
-sx q0[59];
-rz(-pi) q0[60];
-sx q0[60];
-rz(1.0937687) q0[60];
-sx q0[60];
-rz(-pi) q0[61];
-sx q0[61];
-rz(2.9603513) q0[61];
-sx q0[61];
-rz(-pi) q0[62];
-sx q0[62];
-rz(2.0563739) q0[62];
-sx q0[62];
-rz(-pi) q0[63];
-sx q0[63];
-rz(3.0830216) q0[63];
-sx q0[63];
-rz(-pi) q0[64];
-sx q0[64];
-rz(0.14816155) q0[64];
-sx q0[64];
-rz(-pi) q0[65];
-sx q0[65];
-rz(2.7555348) q0[65];
-sx q0[65];
-rz(-pi) q0[66];
-sx q0[66];
-rz(2.5269921) q0[66];
-sx q0[66];
-rz(-pi) q0[67];
-sx q0[67];
-rz(1.3850582) q0[67];
-sx q0[67];
-rz(-pi) q0[68];
-sx q0[68];
-rz(1.672851) q0[68];
-sx q0[68];
-rz(-pi) q0[69];
-sx q0[69];
-rz(2.6882604) q0[69];
-sx q0[69];
-rz(-pi) q0[70];
-sx q0[70];
-rz(0.18368575) q0[70];
-sx q0[70];
-rz(-pi) q0[71];
-sx q0[71];
-rz(2.1343422) q0[71];
-sx q0[71];
-rz(-pi) q0[72];
-sx q0[72];
-rz(1.3059267) q0[72];
-sx q0[72];
-rz(-pi) q0[73];
-sx q0[73];
-rz(3.0891637) q0[73];
-sx q0[73];
-rz(-pi) q0[74];
-sx q0[74];
-rz(0.72615685) q0[74];
-sx q0[74];
-rz(-pi) q0[75];
-sx q0[75];
-rz(3.0771331) q0[75];
-sx q0[75];
-rz(-pi) q0[76];
-sx q0[76];
-rz(0.29849365) q0[76];
-sx q0[76];
-rz(-pi) q0[77];
-sx q0[77];
-rz(1.309635) q0[77];
-sx q0[77];
-rz(-pi) q0[78];
-sx q0[78];
-rz(0.48427475) q0[78];
-sx q0[78];
-rz(-pi) q0[79];
-sx q0[79];
-rz(2.6758367) q0[79];
-sx q0[79];
-rz(-pi) q0[80];
-sx q0[80];
-rz(2.408272) q0[80];
-sx q0[80];
-rz(-pi) q0[81];
-sx q0[81];
-rz(2.1740336) q0[81];
-sx q0[81];
-rz(-pi) q0[82];
-sx q0[82];
-rz(2.5904599) q0[82];
-sx q0[82];
-rz(-pi) q0[83];
-sx q0[83];
-rz(1.098946) q0[83];
-sx q0[83];
-rz(-pi) q0[84];
-sx q0[84];
-rz(1.8395223) q0[84];
-sx q0[84];
-rz(-pi) q0[85];
-sx q0[85];
-rz(2.9072903) q0[85];
-sx q0[85];
-rz(-pi) q0[86];
-sx q0[86];
-rz(0.73455345) q0[86];
-sx q0[86];
-rz(-pi) q0[87];
-sx q0[87];
-rz(1.5898267) q0[87];
-sx q0[87];
-rz(-pi) q0[88];
-sx q0[88];
-rz(0.21472245) q0[88];
-sx q0[88];
-rz(-pi) q0[89];
-sx q0[89];
-rz(3.0599742) q0[89];
-sx q0[89];
-rz(-pi) q0[90];
-sx q0[90];
-rz(1.3533239) q0[90];
-sx q0[90];
-rz(-pi) q0[91];
-sx q0[91];
-rz(1.2763784) q0[91];
-sx q0[91];
-rz(-pi) q0[92];
-sx q0[92];
-rz(2.5740605) q0[92];
-sx q0[92];
-rz(-pi) q0[93];
-sx q0[93];
-rz(2.6097982) q0[93];
-sx q0[93];
-rz(-pi) q0[94];
-sx q0[94];
-rz(3.1334281) q0[94];
-sx q0[94];
-rz(-pi) q0[95];
-sx q0[95];
-rz(0.77530345) q0[95];
-sx q0[95];
-rz(-pi) q0[96];
-sx q0[96];
-rz(1.4979883) q0[96];
-sx q0[96];
-rz(-pi) q0[97];
-sx q0[97];
-rz(2.3491078) q0[97];
-sx q0[97];
-rz(-pi) q0[98];
-sx q0[98];
-rz(1.6509963) q0[98];
-sx q0[98];
-rz(-pi) q0[99];
-sx q0[99];
-rz(2.8279381) q0[99];
-sx q0[99];
-rz(-pi) q0[100];
-sx q0[100];
-rz(2.2427365) q0[100];
-sx q0[100];
-rz(-pi) q0[101];
-sx q0[101];
-rz(1.6763168) q0[101];
-sx q0[101];
-rz(-pi) q0[102];
-sx q0[102];
-rz(0.63414015) q0[102];
-sx q0[102];
-rz(-pi) q0[103];
-sx q0[103];
-rz(2.0271242) q0[103];
-sx q0[103];
-rz(-pi) q0[104];
-sx q0[104];
-rz(1.3360828) q0[104];
-sx q0[104];
-rz(-pi) q0[105];
-sx q0[105];
-rz(2.7424908) q0[105];
-sx q0[105];
-rz(-pi) q0[106];
-sx q0[106];
-rz(2.9122651) q0[106];
-sx q0[106];
-rz(-pi) q0[107];
-sx q0[107];
-rz(2.5673843) q0[107];
-sx q0[107];
-rz(-pi) q0[108];
-sx q0[108];
-rz(0.69235945) q0[108];
-sx q0[108];
-rz(-pi) q0[109];
-sx q0[109];
-rz(1.2082964) q0[109];
-sx q0[109];
-rz(-pi) q0[110];
-sx q0[110];
-rz(3.1139657) q0[110];
-sx q0[110];
-rz(-pi) q0[111];
-sx q0[111];
-rz(2.6278502) q0[111];
-sx q0[111];
-rz(-pi) q0[112];
-sx q0[112];
-rz(1.9078998) q0[112];
-sx q0[112];
-rz(-pi) q0[113];
-sx q0[113];
-rz(1.1549131) q0[113];
-sx q0[113];
-rz(-pi) q0[114];
-sx q0[114];
-rz(3.0477572) q0[114];
-sx q0[114];
-rz(-pi) q0[115];
-sx q0[115];
-rz(2.3670167) q0[115];
-sx q0[115];
-rz(-pi) q0[116];
-sx q0[116];
-rz(2.4044371) q0[116];
-sx q0[116];
-rz(-pi) q0[117];
-sx q0[117];
-rz(1.1228106) q0[117];
-sx q0[117];
-rz(-pi) q0[118];
-sx q0[118];
-rz(0.33383225) q0[118];
-sx q0[118];
-rz(-pi) q0[119];
-sx q0[119];
-rz(1.6871727) q0[119];
-sx q0[119];
-rz(-pi) q0[120];
-sx q0[120];
-rz(2.3562324) q0[120];
-sx q0[120];
-rz(-pi) q0[121];
-sx q0[121];
-rz(2.1326305) q0[121];
-sx q0[121];
-rz(-pi) q0[122];
-sx q0[122];
-rz(2.9960346) q0[122];
-sx q0[122];
-rz(-pi) q0[123];
-sx q0[123];
-rz(0.48191545) q0[123];
-sx q0[123];
-rz(-pi) q0[124];
-sx q0[124];
-rz(1.3862398) q0[124];
-sx q0[124];
-rz(-pi) q0[125];
-sx q0[125];
-rz(1.4760252) q0[125];
-sx q0[125];
-rz(-pi) q0[126];
-sx q0[126];
-rz(0.19942365) q0[126];
-sx q0[126];
-rz(-pi) q0[127];
-sx q0[127];
-rz(2.6491936) q0[127];
-sx q0[127];
-rz(-pi) q0[128];
-sx q0[128];
-rz(2.4549271) q0[128];
-sx q0[128];
-rz(-pi) q0[129];
-sx q0[129];
-rz(0.49453295) q0[129];
-sx q0[129];
-rz(-pi) q0[130];
-sx q0[130];
-rz(0.39543265) q0[130];
-sx q0[130];
-rz(-pi) q0[131];
-sx q0[131];
-rz(0.091482954) q0[131];
-sx q0[131];
-rz(-pi) q0[132];
-sx q0[132];
-rz(0.59343455) q0[132];
-sx q0[132];
-rz(-pi) q0[133];
-sx q0[133];
-rz(1.1353253) q0[133];
-sx q0[133];
-rz(-pi) q0[134];
-sx q0[134];
-rz(2.5764533) q0[134];
-sx q0[134];
-rz(-pi) q0[135];
-sx q0[135];
-rz(1.9572268) q0[135];
-sx q0[135];
-rz(-pi) q0[136];
-sx q0[136];
-rz(1.0287454) q0[136];
-sx q0[136];
-rz(-pi) q0[137];
-sx q0[137];
-rz(0.29078255) q0[137];
-sx q0[137];
-rz(-pi) q0[138];
-sx q0[138];
-rz(1.7482302) q0[138];
-sx q0[138];
-rz(-pi) q0[139];
-sx q0[139];
-rz(0.14855015) q0[139];
-sx q0[139];
-rz(-pi) q0[140];
-sx q0[140];
-rz(0.36370345) q0[140];
-sx q0[140];
-rz(-pi) q0[141];
-sx q0[141];
-rz(1.9323815) q0[141];
-sx q0[141];
-rz(-pi) q0[142];
-sx q0[142];
-rz(2.3569089) q0[142];
-sx q0[142];
-rz(-pi) q0[143];
-sx q0[143];
-rz(1.5618153) q0[143];
-sx q0[143];
-rz(-pi) q0[144];
-sx q0[144];
-rz(1.2638539) q0[144];
-sx q0[144];
-rz(-pi) q0[145];
-sx q0[145];
-rz(2.0242097) q0[145];
-sx q0[145];
-rz(-pi) q0[146];
-sx q0[146];
-rz(2.0356953) q0[146];
-sx q0[146];
-rz(-pi) q0[147];
-sx q0[147];
-rz(0.48920005) q0[147];
-sx q0[147];
-rz(-pi) q0[148];
-sx q0[148];
-rz(0.13430925) q0[148];
-sx q0[148];
-rz(-pi) q0[149];
-sx q0[149];
-rz(1.2261171) q0[149];
-sx q0[149];
-rz(-pi) q0[150];
-sx q0[150];
-rz(0.31955085) q0[150];
-sx q0[150];
-rz(-pi) q0[151];
-sx q0[151];
-rz(0.11325525) q0[151];
-sx q0[151];
-rz(-pi) q0[152];
-sx q0[152];
-rz(0.88509305) q0[152];
-sx q0[152];
-rz(-pi) q0[153];
-sx q0[153];
-rz(1.4043519) q0[153];
-sx q0[153];
-rz(-pi) q0[154];
-sx q0[154];
-rz(0.97048065) q0[154];
-sx q0[154];
-rz(-pi) q0[155];
-sx q0[155];
-rz(2.85294) q0[155];
-sx q0[155];
-rz(-pi) q0[156];
-sx q0[156];
-rz(1.7210712) q0[156];
-sx q0[156];
-rz(-pi) q0[157];
-sx q0[157];
-rz(2.6324789) q0[157];
-sx q0[157];
-rz(-pi) q0[158];
-sx q0[158];
-rz(0.10205455) q0[158];
-sx q0[158];
-rz(-pi) q0[159];
-sx q0[159];
-rz(2.5697335) q0[159];
-sx q0[159];
-rz(-pi) q0[160];
-sx q0[160];
-rz(0.68701595) q0[160];
-sx q0[160];
-rz(-pi) q0[161];
-sx q0[161];
-rz(0.089423054) q0[161];
-sx q0[161];
-rz(-pi) q0[162];
-sx q0[162];
-rz(2.1815303) q0[162];
-sx q0[162];
-rz(-pi) q0[163];
-sx q0[163];
-rz(0.27320965) q0[163];
-sx q0[163];
-rz(-pi) q0[164];
-sx q0[164];
-rz(0.45499935) q0[164];
-sx q0[164];
-rz(-pi) q0[165];
-sx q0[165];
-rz(0.21401975) q0[165];
-sx q0[165];
-rz(-pi) q0[166];
-sx q0[166];
-rz(2.1794187) q0[166];
-sx q0[166];
-rz(-pi) q0[167];
-sx q0[167];
-rz(1.4933653) q0[167];
-sx q0[167];
-rz(-pi) q0[168];
-sx q0[168];
-rz(1.6194259) q0[168];
-sx q0[168];
-rz(-pi) q0[169];
-sx q0[169];
-rz(2.0905754) q0[169];
-sx q0[169];
-rz(-pi) q0[170];
-sx q0[170];
-rz(2.0554338) q0[170];
-sx q0[170];
-rz(-pi) q0[171];
-sx q0[171];
-rz(2.5239662) q0[171];
-sx q0[171];
-cx q0[171],q0[1];
-rz(pi/2) q0[171];
-sx q0[171];
-rz(pi/2) q0[171];
-cx q0[1],q0[171];
-rz(-pi/4) q0[171];
-cx q0[0],q0[171];
-rz(pi/4) q0[171];
-cx q0[1],q0[171];
-rz(pi/4) q0[1];
-rz(-pi/4) q0[171];
-cx q0[0],q0[171];
-cx q0[0],q0[1];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[1];
-cx q0[0],q0[1];
-rz(3*pi/4) q0[171];
-sx q0[171];
-rz(pi/2) q0[171];
-cx q0[171],q0[1];
-rz(-pi) q0[172];
-sx q0[172];
-rz(3.0712397) q0[172];
-sx q0[172];
-cx q0[172],q0[2];
-rz(pi/2) q0[172];
-sx q0[172];
-rz(pi/2) q0[172];
-cx q0[2],q0[172];
-rz(-pi/4) q0[172];
-cx q0[0],q0[172];
-rz(pi/4) q0[172];
-cx q0[2],q0[172];
-rz(-pi/4) q0[172];
-cx q0[0],q0[172];
-rz(3*pi/4) q0[172];
-sx q0[172];
-rz(pi/2) q0[172];
-rz(pi/4) q0[2];
-cx q0[0],q0[2];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[2];
-cx q0[0],q0[2];
-cx q0[172],q0[2];
-rz(-pi) q0[173];
-sx q0[173];
-rz(2.0272201) q0[173];
-sx q0[173];
-cx q0[173],q0[3];
-rz(pi/2) q0[173];
-sx q0[173];
-rz(pi/2) q0[173];
-cx q0[3],q0[173];
-rz(-pi/4) q0[173];
-cx q0[0],q0[173];
-rz(pi/4) q0[173];
-cx q0[3],q0[173];
-rz(-pi/4) q0[173];
-cx q0[0],q0[173];
-rz(3*pi/4) q0[173];
-sx q0[173];
-rz(pi/2) q0[173];
-rz(pi/4) q0[3];
-cx q0[0],q0[3];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[3];
-cx q0[0],q0[3];
-cx q0[173],q0[3];
-rz(-pi) q0[174];
-sx q0[174];
-rz(1.8396401) q0[174];
-sx q0[174];
-cx q0[174],q0[4];
-rz(pi/2) q0[174];
-sx q0[174];
-rz(pi/2) q0[174];
-cx q0[4],q0[174];
-rz(-pi/4) q0[174];
-cx q0[0],q0[174];
-rz(pi/4) q0[174];
-cx q0[4],q0[174];
-rz(-pi/4) q0[174];
-cx q0[0],q0[174];
-rz(3*pi/4) q0[174];
-sx q0[174];
-rz(pi/2) q0[174];
-rz(pi/4) q0[4];
-cx q0[0],q0[4];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[4];
-cx q0[0],q0[4];
-cx q0[174],q0[4];
-rz(-pi) q0[175];
-sx q0[175];
-rz(0.31291975) q0[175];
-sx q0[175];
-cx q0[175],q0[5];
-rz(pi/2) q0[175];
-sx q0[175];
-rz(pi/2) q0[175];
-cx q0[5],q0[175];
-rz(-pi/4) q0[175];
-cx q0[0],q0[175];
-rz(pi/4) q0[175];
-cx q0[5],q0[175];
-rz(-pi/4) q0[175];
-cx q0[0],q0[175];
-rz(3*pi/4) q0[175];
-sx q0[175];
-rz(pi/2) q0[175];
-rz(pi/4) q0[5];
-cx q0[0],q0[5];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[5];
-cx q0[0],q0[5];
-cx q0[175],q0[5];
-rz(-pi) q0[176];
-sx q0[176];
-rz(2.2806985) q0[176];
-sx q0[176];
-cx q0[176],q0[6];
-rz(pi/2) q0[176];
-sx q0[176];
-rz(pi/2) q0[176];
-cx q0[6],q0[176];
-rz(-pi/4) q0[176];
-cx q0[0],q0[176];
-rz(pi/4) q0[176];
-cx q0[6],q0[176];
-rz(-pi/4) q0[176];
-cx q0[0],q0[176];
-rz(3*pi/4) q0[176];
-sx q0[176];
-rz(pi/2) q0[176];
-rz(pi/4) q0[6];
-cx q0[0],q0[6];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[6];
-cx q0[0],q0[6];
-cx q0[176],q0[6];
-rz(-pi) q0[177];
-sx q0[177];
-rz(1.5498667) q0[177];
-sx q0[177];
-cx q0[177],q0[7];
-rz(pi/2) q0[177];
-sx q0[177];
-rz(pi/2) q0[177];
-cx q0[7],q0[177];
-rz(-pi/4) q0[177];
-cx q0[0],q0[177];
-rz(pi/4) q0[177];
-cx q0[7],q0[177];
-rz(-pi/4) q0[177];
-cx q0[0],q0[177];
-rz(3*pi/4) q0[177];
-sx q0[177];
-rz(pi/2) q0[177];
-rz(pi/4) q0[7];
-cx q0[0],q0[7];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[7];
-cx q0[0],q0[7];
-cx q0[177],q0[7];
-rz(-pi) q0[178];
-sx q0[178];
-rz(2.2573748) q0[178];
-sx q0[178];
-cx q0[178],q0[8];
-rz(pi/2) q0[178];
-sx q0[178];
-rz(pi/2) q0[178];
-cx q0[8],q0[178];
-rz(-pi/4) q0[178];
-cx q0[0],q0[178];
-rz(pi/4) q0[178];
-cx q0[8],q0[178];
-rz(-pi/4) q0[178];
-cx q0[0],q0[178];
-rz(3*pi/4) q0[178];
-sx q0[178];
-rz(pi/2) q0[178];
-rz(pi/4) q0[8];
-cx q0[0],q0[8];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[8];
-cx q0[0],q0[8];
-cx q0[178],q0[8];
-rz(-pi) q0[179];
-sx q0[179];
-rz(1.0229153) q0[179];
-sx q0[179];
-cx q0[179],q0[9];
-rz(pi/2) q0[179];
-sx q0[179];
-rz(pi/2) q0[179];
-cx q0[9],q0[179];
-rz(-pi/4) q0[179];
-cx q0[0],q0[179];
-rz(pi/4) q0[179];
-cx q0[9],q0[179];
-rz(-pi/4) q0[179];
-cx q0[0],q0[179];
-rz(3*pi/4) q0[179];
-sx q0[179];
-rz(pi/2) q0[179];
-rz(pi/4) q0[9];
-cx q0[0],q0[9];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[9];
-cx q0[0],q0[9];
-cx q0[179],q0[9];
-rz(-pi) q0[180];
-sx q0[180];
-rz(1.946439) q0[180];
-sx q0[180];
-cx q0[180],q0[10];
-rz(pi/2) q0[180];
-sx q0[180];
-rz(pi/2) q0[180];
-cx q0[10],q0[180];
-rz(-pi/4) q0[180];
-cx q0[0],q0[180];
-rz(pi/4) q0[180];
-cx q0[10],q0[180];
-rz(pi/4) q0[10];
-rz(-pi/4) q0[180];
-cx q0[0],q0[180];
-cx q0[0],q0[10];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[10];
-cx q0[0],q0[10];
-rz(3*pi/4) q0[180];
-sx q0[180];
-rz(pi/2) q0[180];
-cx q0[180],q0[10];
-rz(-pi) q0[181];
-sx q0[181];
-rz(2.3858191) q0[181];
-sx q0[181];
-cx q0[181],q0[11];
-rz(pi/2) q0[181];
-sx q0[181];
-rz(pi/2) q0[181];
-cx q0[11],q0[181];
-rz(-pi/4) q0[181];
-cx q0[0],q0[181];
-rz(pi/4) q0[181];
-cx q0[11],q0[181];
-rz(pi/4) q0[11];
-rz(-pi/4) q0[181];
-cx q0[0],q0[181];
-cx q0[0],q0[11];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[11];
-cx q0[0],q0[11];
-rz(3*pi/4) q0[181];
-sx q0[181];
-rz(pi/2) q0[181];
-cx q0[181],q0[11];
-rz(-pi) q0[182];
-sx q0[182];
-rz(1.2206398) q0[182];
-sx q0[182];
-cx q0[182],q0[12];
-rz(pi/2) q0[182];
-sx q0[182];
-rz(pi/2) q0[182];
-cx q0[12],q0[182];
-rz(-pi/4) q0[182];
-cx q0[0],q0[182];
-rz(pi/4) q0[182];
-cx q0[12],q0[182];
-rz(pi/4) q0[12];
-rz(-pi/4) q0[182];
-cx q0[0],q0[182];
-cx q0[0],q0[12];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[12];
-cx q0[0],q0[12];
-rz(3*pi/4) q0[182];
-sx q0[182];
-rz(pi/2) q0[182];
-cx q0[182],q0[12];
-rz(-pi) q0[183];
-sx q0[183];
-rz(0.42860745) q0[183];
-sx q0[183];
-cx q0[183],q0[13];
-rz(pi/2) q0[183];
-sx q0[183];
-rz(pi/2) q0[183];
-cx q0[13],q0[183];
-rz(-pi/4) q0[183];
-cx q0[0],q0[183];
-rz(pi/4) q0[183];
-cx q0[13],q0[183];
-rz(pi/4) q0[13];
-rz(-pi/4) q0[183];
-cx q0[0],q0[183];
-cx q0[0],q0[13];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[13];
-cx q0[0],q0[13];
-rz(3*pi/4) q0[183];
-sx q0[183];
-rz(pi/2) q0[183];
-cx q0[183],q0[13];
-rz(-pi) q0[184];
-sx q0[184];
-rz(0.038591854) q0[184];
-sx q0[184];
-cx q0[184],q0[14];
-rz(pi/2) q0[184];
-sx q0[184];
-rz(pi/2) q0[184];
-cx q0[14],q0[184];
-rz(-pi/4) q0[184];
-cx q0[0],q0[184];
-rz(pi/4) q0[184];
-cx q0[14],q0[184];
-rz(pi/4) q0[14];
-rz(-pi/4) q0[184];
-cx q0[0],q0[184];
-cx q0[0],q0[14];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[14];
-cx q0[0],q0[14];
-rz(3*pi/4) q0[184];
-sx q0[184];
-rz(pi/2) q0[184];
-cx q0[184],q0[14];
-rz(-pi) q0[185];
-sx q0[185];
-rz(1.1619129) q0[185];
-sx q0[185];
-cx q0[185],q0[15];
-rz(pi/2) q0[185];
-sx q0[185];
-rz(pi/2) q0[185];
-cx q0[15],q0[185];
-rz(-pi/4) q0[185];
-cx q0[0],q0[185];
-rz(pi/4) q0[185];
-cx q0[15],q0[185];
-rz(pi/4) q0[15];
-rz(-pi/4) q0[185];
-cx q0[0],q0[185];
-cx q0[0],q0[15];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[15];
-cx q0[0],q0[15];
-rz(3*pi/4) q0[185];
-sx q0[185];
-rz(pi/2) q0[185];
-cx q0[185],q0[15];
-rz(-pi) q0[186];
-sx q0[186];
-rz(1.6202676) q0[186];
-sx q0[186];
-cx q0[186],q0[16];
-rz(pi/2) q0[186];
-sx q0[186];
-rz(pi/2) q0[186];
-cx q0[16],q0[186];
-rz(-pi/4) q0[186];
-cx q0[0],q0[186];
-rz(pi/4) q0[186];
-cx q0[16],q0[186];
-rz(pi/4) q0[16];
-rz(-pi/4) q0[186];
-cx q0[0],q0[186];
-cx q0[0],q0[16];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[16];
-cx q0[0],q0[16];
-rz(3*pi/4) q0[186];
-sx q0[186];
-rz(pi/2) q0[186];
-cx q0[186],q0[16];
-rz(-pi) q0[187];
-sx q0[187];
-rz(2.2943545) q0[187];
-sx q0[187];
-cx q0[187],q0[17];
-rz(pi/2) q0[187];
-sx q0[187];
-rz(pi/2) q0[187];
-cx q0[17],q0[187];
-rz(-pi/4) q0[187];
-cx q0[0],q0[187];
-rz(pi/4) q0[187];
-cx q0[17],q0[187];
-rz(pi/4) q0[17];
-rz(-pi/4) q0[187];
-cx q0[0],q0[187];
-cx q0[0],q0[17];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[17];
-cx q0[0],q0[17];
-rz(3*pi/4) q0[187];
-sx q0[187];
-rz(pi/2) q0[187];
-cx q0[187],q0[17];
-rz(-pi) q0[188];
-sx q0[188];
-rz(0.39500175) q0[188];
-sx q0[188];
-cx q0[188],q0[18];
-rz(pi/2) q0[188];
-sx q0[188];
-rz(pi/2) q0[188];
-cx q0[18],q0[188];
-rz(-pi/4) q0[188];
-cx q0[0],q0[188];
-rz(pi/4) q0[188];
-cx q0[18],q0[188];
-rz(pi/4) q0[18];
-rz(-pi/4) q0[188];
-cx q0[0],q0[188];
-cx q0[0],q0[18];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[18];
-cx q0[0],q0[18];
-rz(3*pi/4) q0[188];
-sx q0[188];
-rz(pi/2) q0[188];
-cx q0[188],q0[18];
-rz(-pi) q0[189];
-sx q0[189];
-rz(0.49932805) q0[189];
-sx q0[189];
-cx q0[189],q0[19];
-rz(pi/2) q0[189];
-sx q0[189];
-rz(pi/2) q0[189];
-cx q0[19],q0[189];
-rz(-pi/4) q0[189];
-cx q0[0],q0[189];
-rz(pi/4) q0[189];
-cx q0[19],q0[189];
-rz(-pi/4) q0[189];
-cx q0[0],q0[189];
-rz(3*pi/4) q0[189];
-sx q0[189];
-rz(pi/2) q0[189];
-rz(pi/4) q0[19];
-cx q0[0],q0[19];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[19];
-cx q0[0],q0[19];
-cx q0[189],q0[19];
-rz(-pi) q0[190];
-sx q0[190];
-rz(2.6739797) q0[190];
-sx q0[190];
-cx q0[190],q0[20];
-rz(pi/2) q0[190];
-sx q0[190];
-rz(pi/2) q0[190];
-cx q0[20],q0[190];
-rz(-pi/4) q0[190];
-cx q0[0],q0[190];
-rz(pi/4) q0[190];
-cx q0[20],q0[190];
-rz(-pi/4) q0[190];
-cx q0[0],q0[190];
-rz(3*pi/4) q0[190];
-sx q0[190];
-rz(pi/2) q0[190];
-rz(pi/4) q0[20];
-cx q0[0],q0[20];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[20];
-cx q0[0],q0[20];
-cx q0[190],q0[20];
-rz(-pi) q0[191];
-sx q0[191];
-rz(0.63197135) q0[191];
-sx q0[191];
-cx q0[191],q0[21];
-rz(pi/2) q0[191];
-sx q0[191];
-rz(pi/2) q0[191];
-cx q0[21],q0[191];
-rz(-pi/4) q0[191];
-cx q0[0],q0[191];
-rz(pi/4) q0[191];
-cx q0[21],q0[191];
-rz(-pi/4) q0[191];
-cx q0[0],q0[191];
-rz(3*pi/4) q0[191];
-sx q0[191];
-rz(pi/2) q0[191];
-rz(pi/4) q0[21];
-cx q0[0],q0[21];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[21];
-cx q0[0],q0[21];
-cx q0[191],q0[21];
-rz(-pi) q0[192];
-sx q0[192];
-rz(1.4217084) q0[192];
-sx q0[192];
-cx q0[192],q0[22];
-rz(pi/2) q0[192];
-sx q0[192];
-rz(pi/2) q0[192];
-cx q0[22],q0[192];
-rz(-pi/4) q0[192];
-cx q0[0],q0[192];
-rz(pi/4) q0[192];
-cx q0[22],q0[192];
-rz(-pi/4) q0[192];
-cx q0[0],q0[192];
-rz(3*pi/4) q0[192];
-sx q0[192];
-rz(pi/2) q0[192];
-rz(pi/4) q0[22];
-cx q0[0],q0[22];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[22];
-cx q0[0],q0[22];
-cx q0[192],q0[22];
-rz(-pi) q0[193];
-sx q0[193];
-rz(0.98996855) q0[193];
-sx q0[193];
-cx q0[193],q0[23];
-rz(pi/2) q0[193];
-sx q0[193];
-rz(pi/2) q0[193];
-cx q0[23],q0[193];
-rz(-pi/4) q0[193];
-cx q0[0],q0[193];
-rz(pi/4) q0[193];
-cx q0[23],q0[193];
-rz(-pi/4) q0[193];
-cx q0[0],q0[193];
-rz(3*pi/4) q0[193];
-sx q0[193];
-rz(pi/2) q0[193];
-rz(pi/4) q0[23];
-cx q0[0],q0[23];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[23];
-cx q0[0],q0[23];
-cx q0[193],q0[23];
-rz(-pi) q0[194];
-sx q0[194];
-rz(0.38503155) q0[194];
-sx q0[194];
-cx q0[194],q0[24];
-rz(pi/2) q0[194];
-sx q0[194];
-rz(pi/2) q0[194];
-cx q0[24],q0[194];
-rz(-pi/4) q0[194];
-cx q0[0],q0[194];
-rz(pi/4) q0[194];
-cx q0[24],q0[194];
-rz(-pi/4) q0[194];
-cx q0[0],q0[194];
-rz(3*pi/4) q0[194];
-sx q0[194];
-rz(pi/2) q0[194];
-rz(pi/4) q0[24];
-cx q0[0],q0[24];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[24];
-cx q0[0],q0[24];
-cx q0[194],q0[24];
-rz(-pi) q0[195];
-sx q0[195];
-rz(2.179863) q0[195];
-sx q0[195];
-cx q0[195],q0[25];
-rz(pi/2) q0[195];
-sx q0[195];
-rz(pi/2) q0[195];
-cx q0[25],q0[195];
-rz(-pi/4) q0[195];
-cx q0[0],q0[195];
-rz(pi/4) q0[195];
-cx q0[25],q0[195];
-rz(-pi/4) q0[195];
-cx q0[0],q0[195];
-rz(3*pi/4) q0[195];
-sx q0[195];
-rz(pi/2) q0[195];
-rz(pi/4) q0[25];
-cx q0[0],q0[25];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[25];
-cx q0[0],q0[25];
-cx q0[195],q0[25];
-rz(-pi) q0[196];
-sx q0[196];
-rz(1.9168167) q0[196];
-sx q0[196];
-cx q0[196],q0[26];
-rz(pi/2) q0[196];
-sx q0[196];
-rz(pi/2) q0[196];
-cx q0[26],q0[196];
-rz(-pi/4) q0[196];
-cx q0[0],q0[196];
-rz(pi/4) q0[196];
-cx q0[26],q0[196];
-rz(-pi/4) q0[196];
-cx q0[0],q0[196];
-rz(3*pi/4) q0[196];
-sx q0[196];
-rz(pi/2) q0[196];
-rz(pi/4) q0[26];
-cx q0[0],q0[26];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[26];
-cx q0[0],q0[26];
-cx q0[196],q0[26];
-rz(-pi) q0[197];
-sx q0[197];
-rz(1.7321514) q0[197];
-sx q0[197];
-cx q0[197],q0[27];
-rz(pi/2) q0[197];
-sx q0[197];
-rz(pi/2) q0[197];
-cx q0[27],q0[197];
-rz(-pi/4) q0[197];
-cx q0[0],q0[197];
-rz(pi/4) q0[197];
-cx q0[27],q0[197];
-rz(-pi/4) q0[197];
-cx q0[0],q0[197];
-rz(3*pi/4) q0[197];
-sx q0[197];
-rz(pi/2) q0[197];
-rz(pi/4) q0[27];
-cx q0[0],q0[27];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[27];
-cx q0[0],q0[27];
-cx q0[197],q0[27];
-rz(-pi) q0[198];
-sx q0[198];
-rz(2.384584) q0[198];
-sx q0[198];
-cx q0[198],q0[28];
-rz(pi/2) q0[198];
-sx q0[198];
-rz(pi/2) q0[198];
-cx q0[28],q0[198];
-rz(-pi/4) q0[198];
-cx q0[0],q0[198];
-rz(pi/4) q0[198];
-cx q0[28],q0[198];
-rz(-pi/4) q0[198];
-cx q0[0],q0[198];
-rz(3*pi/4) q0[198];
-sx q0[198];
-rz(pi/2) q0[198];
-rz(pi/4) q0[28];
-cx q0[0],q0[28];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[28];
-cx q0[0],q0[28];
-cx q0[198],q0[28];
-rz(-pi) q0[199];
-sx q0[199];
-rz(0.30036555) q0[199];
-sx q0[199];
-cx q0[199],q0[29];
-rz(pi/2) q0[199];
-sx q0[199];
-rz(pi/2) q0[199];
-cx q0[29],q0[199];
-rz(-pi/4) q0[199];
-cx q0[0],q0[199];
-rz(pi/4) q0[199];
-cx q0[29],q0[199];
-rz(-pi/4) q0[199];
-cx q0[0],q0[199];
-rz(3*pi/4) q0[199];
-sx q0[199];
-rz(pi/2) q0[199];
-rz(pi/4) q0[29];
-cx q0[0],q0[29];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[29];
-cx q0[0],q0[29];
-cx q0[199],q0[29];
-rz(-pi) q0[200];
-sx q0[200];
-rz(2.0586007) q0[200];
-sx q0[200];
-cx q0[200],q0[30];
-rz(pi/2) q0[200];
-sx q0[200];
-rz(pi/2) q0[200];
-cx q0[30],q0[200];
-rz(-pi/4) q0[200];
-cx q0[0],q0[200];
-rz(pi/4) q0[200];
-cx q0[30],q0[200];
-rz(-pi/4) q0[200];
-cx q0[0],q0[200];
-rz(3*pi/4) q0[200];
-sx q0[200];
-rz(pi/2) q0[200];
-rz(pi/4) q0[30];
-cx q0[0],q0[30];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[30];
-cx q0[0],q0[30];
-cx q0[200],q0[30];
-rz(-pi) q0[201];
-sx q0[201];
-rz(2.5163499) q0[201];
-sx q0[201];
-cx q0[201],q0[31];
-rz(pi/2) q0[201];
-sx q0[201];
-rz(pi/2) q0[201];
-cx q0[31],q0[201];
-rz(-pi/4) q0[201];
-cx q0[0],q0[201];
-rz(pi/4) q0[201];
-cx q0[31],q0[201];
-rz(-pi/4) q0[201];
-cx q0[0],q0[201];
-rz(3*pi/4) q0[201];
-sx q0[201];
-rz(pi/2) q0[201];
-rz(pi/4) q0[31];
-cx q0[0],q0[31];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[31];
-cx q0[0],q0[31];
-cx q0[201],q0[31];
-rz(-pi) q0[202];
-sx q0[202];
-rz(2.2989843) q0[202];
-sx q0[202];
-cx q0[202],q0[32];
-rz(pi/2) q0[202];
-sx q0[202];
-rz(pi/2) q0[202];
-cx q0[32],q0[202];
-rz(-pi/4) q0[202];
-cx q0[0],q0[202];
-rz(pi/4) q0[202];
-cx q0[32],q0[202];
-rz(-pi/4) q0[202];
-cx q0[0],q0[202];
-rz(3*pi/4) q0[202];
-sx q0[202];
-rz(pi/2) q0[202];
-rz(pi/4) q0[32];
-cx q0[0],q0[32];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[32];
-cx q0[0],q0[32];
-cx q0[202],q0[32];
-rz(-pi) q0[203];
-sx q0[203];
-rz(1.3068486) q0[203];
-sx q0[203];
-cx q0[203],q0[33];
-rz(pi/2) q0[203];
-sx q0[203];
-rz(pi/2) q0[203];
-cx q0[33],q0[203];
-rz(-pi/4) q0[203];
-cx q0[0],q0[203];
-rz(pi/4) q0[203];
-cx q0[33],q0[203];
-rz(-pi/4) q0[203];
-cx q0[0],q0[203];
-rz(3*pi/4) q0[203];
-sx q0[203];
-rz(pi/2) q0[203];
-rz(pi/4) q0[33];
-cx q0[0],q0[33];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[33];
-cx q0[0],q0[33];
-cx q0[203],q0[33];
-rz(-pi) q0[204];
-sx q0[204];
-rz(0.096197754) q0[204];
-sx q0[204];
-cx q0[204],q0[34];
-rz(pi/2) q0[204];
-sx q0[204];
-rz(pi/2) q0[204];
-cx q0[34],q0[204];
-rz(-pi/4) q0[204];
-cx q0[0],q0[204];
-rz(pi/4) q0[204];
-cx q0[34],q0[204];
-rz(-pi/4) q0[204];
-cx q0[0],q0[204];
-rz(3*pi/4) q0[204];
-sx q0[204];
-rz(pi/2) q0[204];
-rz(pi/4) q0[34];
-cx q0[0],q0[34];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[34];
-cx q0[0],q0[34];
-cx q0[204],q0[34];
-rz(-pi) q0[205];
-sx q0[205];
-rz(1.2956212) q0[205];
-sx q0[205];
-cx q0[205],q0[35];
-rz(pi/2) q0[205];
-sx q0[205];
-rz(pi/2) q0[205];
-cx q0[35],q0[205];
-rz(-pi/4) q0[205];
-cx q0[0],q0[205];
-rz(pi/4) q0[205];
-cx q0[35],q0[205];
-rz(-pi/4) q0[205];
-cx q0[0],q0[205];
-rz(3*pi/4) q0[205];
-sx q0[205];
-rz(pi/2) q0[205];
-rz(pi/4) q0[35];
-cx q0[0],q0[35];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[35];
-cx q0[0],q0[35];
-cx q0[205],q0[35];
-rz(-pi) q0[206];
-sx q0[206];
-rz(1.4688934) q0[206];
-sx q0[206];
-cx q0[206],q0[36];
-rz(pi/2) q0[206];
-sx q0[206];
-rz(pi/2) q0[206];
-cx q0[36],q0[206];
-rz(-pi/4) q0[206];
-cx q0[0],q0[206];
-rz(pi/4) q0[206];
-cx q0[36],q0[206];
-rz(-pi/4) q0[206];
-cx q0[0],q0[206];
-rz(3*pi/4) q0[206];
-sx q0[206];
-rz(pi/2) q0[206];
-rz(pi/4) q0[36];
-cx q0[0],q0[36];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[36];
-cx q0[0],q0[36];
-cx q0[206],q0[36];
-rz(-pi) q0[207];
-sx q0[207];
-rz(1.5351978) q0[207];
-sx q0[207];
-cx q0[207],q0[37];
-rz(pi/2) q0[207];
-sx q0[207];
-rz(pi/2) q0[207];
-cx q0[37],q0[207];
-rz(-pi/4) q0[207];
-cx q0[0],q0[207];
-rz(pi/4) q0[207];
-cx q0[37],q0[207];
-rz(-pi/4) q0[207];
-cx q0[0],q0[207];
-rz(3*pi/4) q0[207];
-sx q0[207];
-rz(pi/2) q0[207];
-rz(pi/4) q0[37];
-cx q0[0],q0[37];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[37];
-cx q0[0],q0[37];
-cx q0[207],q0[37];
-rz(-pi) q0[208];
-sx q0[208];
-rz(2.4811074) q0[208];
-sx q0[208];
-cx q0[208],q0[38];
-rz(pi/2) q0[208];
-sx q0[208];
-rz(pi/2) q0[208];
-cx q0[38],q0[208];
-rz(-pi/4) q0[208];
-cx q0[0],q0[208];
-rz(pi/4) q0[208];
-cx q0[38],q0[208];
-rz(-pi/4) q0[208];
-cx q0[0],q0[208];
-rz(3*pi/4) q0[208];
-sx q0[208];
-rz(pi/2) q0[208];
-rz(pi/4) q0[38];
-cx q0[0],q0[38];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[38];
-cx q0[0],q0[38];
-cx q0[208],q0[38];
-rz(-pi) q0[209];
-sx q0[209];
-rz(0.69706725) q0[209];
-sx q0[209];
-cx q0[209],q0[39];
-rz(pi/2) q0[209];
-sx q0[209];
-rz(pi/2) q0[209];
-cx q0[39],q0[209];
-rz(-pi/4) q0[209];
-cx q0[0],q0[209];
-rz(pi/4) q0[209];
-cx q0[39],q0[209];
-rz(-pi/4) q0[209];
-cx q0[0],q0[209];
-rz(3*pi/4) q0[209];
-sx q0[209];
-rz(pi/2) q0[209];
-rz(pi/4) q0[39];
-cx q0[0],q0[39];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[39];
-cx q0[0],q0[39];
-cx q0[209],q0[39];
-rz(-pi) q0[210];
-sx q0[210];
-rz(1.9424383) q0[210];
-sx q0[210];
-cx q0[210],q0[40];
-rz(pi/2) q0[210];
-sx q0[210];
-rz(pi/2) q0[210];
-cx q0[40],q0[210];
-rz(-pi/4) q0[210];
-cx q0[0],q0[210];
-rz(pi/4) q0[210];
-cx q0[40],q0[210];
-rz(-pi/4) q0[210];
-cx q0[0],q0[210];
-rz(3*pi/4) q0[210];
-sx q0[210];
-rz(pi/2) q0[210];
-rz(pi/4) q0[40];
-cx q0[0],q0[40];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[40];
-cx q0[0],q0[40];
-cx q0[210],q0[40];
-rz(-pi) q0[211];
-sx q0[211];
-rz(1.8668761) q0[211];
-sx q0[211];
-cx q0[211],q0[41];
-rz(pi/2) q0[211];
-sx q0[211];
-rz(pi/2) q0[211];
-cx q0[41],q0[211];
-rz(-pi/4) q0[211];
-cx q0[0],q0[211];
-rz(pi/4) q0[211];
-cx q0[41],q0[211];
-rz(-pi/4) q0[211];
-cx q0[0],q0[211];
-rz(3*pi/4) q0[211];
-sx q0[211];
-rz(pi/2) q0[211];
-rz(pi/4) q0[41];
-cx q0[0],q0[41];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[41];
-cx q0[0],q0[41];
-cx q0[211],q0[41];
-rz(-pi) q0[212];
-sx q0[212];
-rz(2.3328613) q0[212];
-sx q0[212];
-cx q0[212],q0[42];
-rz(pi/2) q0[212];
-sx q0[212];
-rz(pi/2) q0[212];
-cx q0[42],q0[212];
-rz(-pi/4) q0[212];
-cx q0[0],q0[212];
-rz(pi/4) q0[212];
-cx q0[42],q0[212];
-rz(-pi/4) q0[212];
-cx q0[0],q0[212];
-rz(3*pi/4) q0[212];
-sx q0[212];
-rz(pi/2) q0[212];
-rz(pi/4) q0[42];
-cx q0[0],q0[42];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[42];
-cx q0[0],q0[42];
-cx q0[212],q0[42];
-rz(-pi) q0[213];
-sx q0[213];
-rz(2.8249462) q0[213];
-sx q0[213];
-cx q0[213],q0[43];
-rz(pi/2) q0[213];
-sx q0[213];
-rz(pi/2) q0[213];
-cx q0[43],q0[213];
-rz(-pi/4) q0[213];
-cx q0[0],q0[213];
-rz(pi/4) q0[213];
-cx q0[43],q0[213];
-rz(-pi/4) q0[213];
-cx q0[0],q0[213];
-rz(3*pi/4) q0[213];
-sx q0[213];
-rz(pi/2) q0[213];
-rz(pi/4) q0[43];
-cx q0[0],q0[43];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[43];
-cx q0[0],q0[43];
-cx q0[213],q0[43];
-rz(-pi) q0[214];
-sx q0[214];
-rz(1.1963689) q0[214];
-sx q0[214];
-cx q0[214],q0[44];
-rz(pi/2) q0[214];
-sx q0[214];
-rz(pi/2) q0[214];
-cx q0[44],q0[214];
-rz(-pi/4) q0[214];
-cx q0[0],q0[214];
-rz(pi/4) q0[214];
-cx q0[44],q0[214];
-rz(-pi/4) q0[214];
-cx q0[0],q0[214];
-rz(3*pi/4) q0[214];
-sx q0[214];
-rz(pi/2) q0[214];
-rz(pi/4) q0[44];
-cx q0[0],q0[44];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[44];
-cx q0[0],q0[44];
-cx q0[214],q0[44];
-rz(-pi) q0[215];
-sx q0[215];
-rz(3.0759518) q0[215];
-sx q0[215];
-cx q0[215],q0[45];
-rz(pi/2) q0[215];
-sx q0[215];
-rz(pi/2) q0[215];
-cx q0[45],q0[215];
-rz(-pi/4) q0[215];
-cx q0[0],q0[215];
-rz(pi/4) q0[215];
-cx q0[45],q0[215];
-rz(-pi/4) q0[215];
-cx q0[0],q0[215];
-rz(3*pi/4) q0[215];
-sx q0[215];
-rz(pi/2) q0[215];
-rz(pi/4) q0[45];
-cx q0[0],q0[45];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[45];
-cx q0[0],q0[45];
-cx q0[215],q0[45];
-rz(-pi) q0[216];
-sx q0[216];
-rz(0.22423055) q0[216];
-sx q0[216];
-cx q0[216],q0[46];
-rz(pi/2) q0[216];
-sx q0[216];
-rz(pi/2) q0[216];
-cx q0[46],q0[216];
-rz(-pi/4) q0[216];
-cx q0[0],q0[216];
-rz(pi/4) q0[216];
-cx q0[46],q0[216];
-rz(-pi/4) q0[216];
-cx q0[0],q0[216];
-rz(3*pi/4) q0[216];
-sx q0[216];
-rz(pi/2) q0[216];
-rz(pi/4) q0[46];
-cx q0[0],q0[46];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[46];
-cx q0[0],q0[46];
-cx q0[216],q0[46];
-rz(-pi) q0[217];
-sx q0[217];
-rz(2.4629128) q0[217];
-sx q0[217];
-cx q0[217],q0[47];
-rz(pi/2) q0[217];
-sx q0[217];
-rz(pi/2) q0[217];
-cx q0[47],q0[217];
-rz(-pi/4) q0[217];
-cx q0[0],q0[217];
-rz(pi/4) q0[217];
-cx q0[47],q0[217];
-rz(-pi/4) q0[217];
-cx q0[0],q0[217];
-rz(3*pi/4) q0[217];
-sx q0[217];
-rz(pi/2) q0[217];
-rz(pi/4) q0[47];
-cx q0[0],q0[47];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[47];
-cx q0[0],q0[47];
-cx q0[217],q0[47];
-rz(-pi) q0[218];
-sx q0[218];
-rz(2.8425652) q0[218];
-sx q0[218];
-cx q0[218],q0[48];
-rz(pi/2) q0[218];
-sx q0[218];
-rz(pi/2) q0[218];
-cx q0[48],q0[218];
-rz(-pi/4) q0[218];
-cx q0[0],q0[218];
-rz(pi/4) q0[218];
-cx q0[48],q0[218];
-rz(-pi/4) q0[218];
-cx q0[0],q0[218];
-rz(3*pi/4) q0[218];
-sx q0[218];
-rz(pi/2) q0[218];
-rz(pi/4) q0[48];
-cx q0[0],q0[48];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[48];
-cx q0[0],q0[48];
-cx q0[218],q0[48];
-rz(-pi) q0[219];
-sx q0[219];
-rz(0.37487895) q0[219];
-sx q0[219];
-cx q0[219],q0[49];
-rz(pi/2) q0[219];
-sx q0[219];
-rz(pi/2) q0[219];
-cx q0[49],q0[219];
-rz(-pi/4) q0[219];
-cx q0[0],q0[219];
-rz(pi/4) q0[219];
-cx q0[49],q0[219];
-rz(-pi/4) q0[219];
-cx q0[0],q0[219];
-rz(3*pi/4) q0[219];
-sx q0[219];
-rz(pi/2) q0[219];
-rz(pi/4) q0[49];
-cx q0[0],q0[49];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[49];
-cx q0[0],q0[49];
-cx q0[219],q0[49];
-rz(-pi) q0[220];
-sx q0[220];
-rz(1.9892539) q0[220];
-sx q0[220];
-cx q0[220],q0[50];
-rz(pi/2) q0[220];
-sx q0[220];
-rz(pi/2) q0[220];
-cx q0[50],q0[220];
-rz(-pi/4) q0[220];
-cx q0[0],q0[220];
-rz(pi/4) q0[220];
-cx q0[50],q0[220];
-rz(-pi/4) q0[220];
-cx q0[0],q0[220];
-rz(3*pi/4) q0[220];
-sx q0[220];
-rz(pi/2) q0[220];
-rz(pi/4) q0[50];
-cx q0[0],q0[50];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[50];
-cx q0[0],q0[50];
-cx q0[220],q0[50];
-rz(-pi) q0[221];
-sx q0[221];
-rz(0.081578254) q0[221];
-sx q0[221];
-cx q0[221],q0[51];
-rz(pi/2) q0[221];
-sx q0[221];
-rz(pi/2) q0[221];
-cx q0[51],q0[221];
-rz(-pi/4) q0[221];
-cx q0[0],q0[221];
-rz(pi/4) q0[221];
-cx q0[51],q0[221];
-rz(-pi/4) q0[221];
-cx q0[0],q0[221];
-rz(3*pi/4) q0[221];
-sx q0[221];
-rz(pi/2) q0[221];
-rz(pi/4) q0[51];
-cx q0[0],q0[51];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[51];
-cx q0[0],q0[51];
-cx q0[221],q0[51];
-rz(-pi) q0[222];
-sx q0[222];
-rz(2.2807679) q0[222];
-sx q0[222];
-cx q0[222],q0[52];
-rz(pi/2) q0[222];
-sx q0[222];
-rz(pi/2) q0[222];
-cx q0[52],q0[222];
-rz(-pi/4) q0[222];
-cx q0[0],q0[222];
-rz(pi/4) q0[222];
-cx q0[52],q0[222];
-rz(-pi/4) q0[222];
-cx q0[0],q0[222];
-rz(3*pi/4) q0[222];
-sx q0[222];
-rz(pi/2) q0[222];
-rz(pi/4) q0[52];
-cx q0[0],q0[52];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[52];
-cx q0[0],q0[52];
-cx q0[222],q0[52];
-rz(-pi) q0[223];
-sx q0[223];
-rz(1.1993692) q0[223];
-sx q0[223];
-cx q0[223],q0[53];
-rz(pi/2) q0[223];
-sx q0[223];
-rz(pi/2) q0[223];
-cx q0[53],q0[223];
-rz(-pi/4) q0[223];
-cx q0[0],q0[223];
-rz(pi/4) q0[223];
-cx q0[53],q0[223];
-rz(-pi/4) q0[223];
-cx q0[0],q0[223];
-rz(3*pi/4) q0[223];
-sx q0[223];
-rz(pi/2) q0[223];
-rz(pi/4) q0[53];
-cx q0[0],q0[53];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[53];
-cx q0[0],q0[53];
-cx q0[223],q0[53];
-rz(-pi) q0[224];
-sx q0[224];
-rz(3.1048715) q0[224];
-sx q0[224];
-cx q0[224],q0[54];
-rz(pi/2) q0[224];
-sx q0[224];
-rz(pi/2) q0[224];
-cx q0[54],q0[224];
-rz(-pi/4) q0[224];
-cx q0[0],q0[224];
-rz(pi/4) q0[224];
-cx q0[54],q0[224];
-rz(-pi/4) q0[224];
-cx q0[0],q0[224];
-rz(3*pi/4) q0[224];
-sx q0[224];
-rz(pi/2) q0[224];
-rz(pi/4) q0[54];
-cx q0[0],q0[54];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[54];
-cx q0[0],q0[54];
-cx q0[224],q0[54];
-rz(-pi) q0[225];
-sx q0[225];
-rz(1.7306717) q0[225];
-sx q0[225];
-cx q0[225],q0[55];
-rz(pi/2) q0[225];
-sx q0[225];
-rz(pi/2) q0[225];
-cx q0[55],q0[225];
-rz(-pi/4) q0[225];
-cx q0[0],q0[225];
-rz(pi/4) q0[225];
-cx q0[55],q0[225];
-rz(-pi/4) q0[225];
-cx q0[0],q0[225];
-rz(3*pi/4) q0[225];
-sx q0[225];
-rz(pi/2) q0[225];
-rz(pi/4) q0[55];
-cx q0[0],q0[55];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[55];
-cx q0[0],q0[55];
-cx q0[225],q0[55];
-rz(-pi) q0[226];
-sx q0[226];
-rz(1.4789887) q0[226];
-sx q0[226];
-cx q0[226],q0[56];
-rz(pi/2) q0[226];
-sx q0[226];
-rz(pi/2) q0[226];
-cx q0[56],q0[226];
-rz(-pi/4) q0[226];
-cx q0[0],q0[226];
-rz(pi/4) q0[226];
-cx q0[56],q0[226];
-rz(-pi/4) q0[226];
-cx q0[0],q0[226];
-rz(3*pi/4) q0[226];
-sx q0[226];
-rz(pi/2) q0[226];
-rz(pi/4) q0[56];
-cx q0[0],q0[56];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[56];
-cx q0[0],q0[56];
-cx q0[226],q0[56];
-rz(-pi) q0[227];
-sx q0[227];
-rz(2.0027534) q0[227];
-sx q0[227];
-cx q0[227],q0[57];
-rz(pi/2) q0[227];
-sx q0[227];
-rz(pi/2) q0[227];
-cx q0[57],q0[227];
-rz(-pi/4) q0[227];
-cx q0[0],q0[227];
-rz(pi/4) q0[227];
-cx q0[57],q0[227];
-rz(-pi/4) q0[227];
-cx q0[0],q0[227];
-rz(3*pi/4) q0[227];
-sx q0[227];
-rz(pi/2) q0[227];
-rz(pi/4) q0[57];
-cx q0[0],q0[57];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[57];
-cx q0[0],q0[57];
-cx q0[227],q0[57];
-rz(-pi) q0[228];
-sx q0[228];
-rz(1.2635026) q0[228];
-sx q0[228];
-cx q0[228],q0[58];
-rz(pi/2) q0[228];
-sx q0[228];
-rz(pi/2) q0[228];
-cx q0[58],q0[228];
-rz(-pi/4) q0[228];
-cx q0[0],q0[228];
-rz(pi/4) q0[228];
-cx q0[58],q0[228];
-rz(-pi/4) q0[228];
-cx q0[0],q0[228];
-rz(3*pi/4) q0[228];
-sx q0[228];
-rz(pi/2) q0[228];
-rz(pi/4) q0[58];
-cx q0[0],q0[58];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[58];
-cx q0[0],q0[58];
-cx q0[228],q0[58];
-rz(-pi) q0[229];
-sx q0[229];
-rz(1.5728927) q0[229];
-sx q0[229];
-cx q0[229],q0[59];
-rz(pi/2) q0[229];
-sx q0[229];
-rz(pi/2) q0[229];
-cx q0[59],q0[229];
-rz(-pi/4) q0[229];
-cx q0[0],q0[229];
-rz(pi/4) q0[229];
-cx q0[59],q0[229];
-rz(-pi/4) q0[229];
-cx q0[0],q0[229];
-rz(3*pi/4) q0[229];
-sx q0[229];
-rz(pi/2) q0[229];
-rz(pi/4) q0[59];
-cx q0[0],q0[59];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[59];
-cx q0[0],q0[59];
-cx q0[229],q0[59];
-rz(-pi) q0[230];
-sx q0[230];
-rz(0.86277675) q0[230];
-sx q0[230];
-cx q0[230],q0[60];
-rz(pi/2) q0[230];
-sx q0[230];
-rz(pi/2) q0[230];
-cx q0[60],q0[230];
-rz(-pi/4) q0[230];
-cx q0[0],q0[230];
-rz(pi/4) q0[230];
-cx q0[60],q0[230];
-rz(-pi/4) q0[230];
-cx q0[0],q0[230];
-rz(3*pi/4) q0[230];
-sx q0[230];
-rz(pi/2) q0[230];
-rz(pi/4) q0[60];
-cx q0[0],q0[60];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[60];
-cx q0[0],q0[60];
-cx q0[230],q0[60];
-rz(-pi) q0[231];
-sx q0[231];
-rz(0.39485895) q0[231];
-sx q0[231];
-cx q0[231],q0[61];
-rz(pi/2) q0[231];
-sx q0[231];
-rz(pi/2) q0[231];
-cx q0[61],q0[231];
-rz(-pi/4) q0[231];
-cx q0[0],q0[231];
-rz(pi/4) q0[231];
-cx q0[61],q0[231];
-rz(-pi/4) q0[231];
-cx q0[0],q0[231];
-rz(3*pi/4) q0[231];
-sx q0[231];
-rz(pi/2) q0[231];
-rz(pi/4) q0[61];
-cx q0[0],q0[61];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[61];
-cx q0[0],q0[61];
-cx q0[231],q0[61];
-rz(-pi) q0[232];
-sx q0[232];
-rz(2.7364758) q0[232];
-sx q0[232];
-cx q0[232],q0[62];
-rz(pi/2) q0[232];
-sx q0[232];
-rz(pi/2) q0[232];
-cx q0[62],q0[232];
-rz(-pi/4) q0[232];
-cx q0[0],q0[232];
-rz(pi/4) q0[232];
-cx q0[62],q0[232];
-rz(-pi/4) q0[232];
-cx q0[0],q0[232];
-rz(3*pi/4) q0[232];
-sx q0[232];
-rz(pi/2) q0[232];
-rz(pi/4) q0[62];
-cx q0[0],q0[62];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[62];
-cx q0[0],q0[62];
-cx q0[232],q0[62];
-rz(-pi) q0[233];
-sx q0[233];
-rz(2.7522252) q0[233];
-sx q0[233];
-cx q0[233],q0[63];
-rz(pi/2) q0[233];
-sx q0[233];
-rz(pi/2) q0[233];
-cx q0[63],q0[233];
-rz(-pi/4) q0[233];
-cx q0[0],q0[233];
-rz(pi/4) q0[233];
-cx q0[63],q0[233];
-rz(-pi/4) q0[233];
-cx q0[0],q0[233];
-rz(3*pi/4) q0[233];
-sx q0[233];
-rz(pi/2) q0[233];
-rz(pi/4) q0[63];
-cx q0[0],q0[63];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[63];
-cx q0[0],q0[63];
-cx q0[233],q0[63];
-rz(-pi) q0[234];
-sx q0[234];
-rz(1.6188371) q0[234];
-sx q0[234];
-cx q0[234],q0[64];
-rz(pi/2) q0[234];
-sx q0[234];
-rz(pi/2) q0[234];
-cx q0[64],q0[234];
-rz(-pi/4) q0[234];
-cx q0[0],q0[234];
-rz(pi/4) q0[234];
-cx q0[64],q0[234];
-rz(-pi/4) q0[234];
-cx q0[0],q0[234];
-rz(3*pi/4) q0[234];
-sx q0[234];
-rz(pi/2) q0[234];
-rz(pi/4) q0[64];
-cx q0[0],q0[64];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[64];
-cx q0[0],q0[64];
-cx q0[234],q0[64];
-rz(-pi) q0[235];
-sx q0[235];
-rz(1.5351584) q0[235];
-sx q0[235];
-cx q0[235],q0[65];
-rz(pi/2) q0[235];
-sx q0[235];
-rz(pi/2) q0[235];
-cx q0[65],q0[235];
-rz(-pi/4) q0[235];
-cx q0[0],q0[235];
-rz(pi/4) q0[235];
-cx q0[65],q0[235];
-rz(-pi/4) q0[235];
-cx q0[0],q0[235];
-rz(3*pi/4) q0[235];
-sx q0[235];
-rz(pi/2) q0[235];
-rz(pi/4) q0[65];
-cx q0[0],q0[65];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[65];
-cx q0[0],q0[65];
-cx q0[235],q0[65];
-rz(-pi) q0[236];
-sx q0[236];
-rz(1.8667147) q0[236];
-sx q0[236];
-cx q0[236],q0[66];
-rz(pi/2) q0[236];
-sx q0[236];
-rz(pi/2) q0[236];
-cx q0[66],q0[236];
-rz(-pi/4) q0[236];
-cx q0[0],q0[236];
-rz(pi/4) q0[236];
-cx q0[66],q0[236];
-rz(-pi/4) q0[236];
-cx q0[0],q0[236];
-rz(3*pi/4) q0[236];
-sx q0[236];
-rz(pi/2) q0[236];
-rz(pi/4) q0[66];
-cx q0[0],q0[66];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[66];
-cx q0[0],q0[66];
-cx q0[236],q0[66];
-rz(-pi) q0[237];
-sx q0[237];
-rz(2.7869391) q0[237];
-sx q0[237];
-cx q0[237],q0[67];
-rz(pi/2) q0[237];
-sx q0[237];
-rz(pi/2) q0[237];
-cx q0[67],q0[237];
-rz(-pi/4) q0[237];
-cx q0[0],q0[237];
-rz(pi/4) q0[237];
-cx q0[67],q0[237];
-rz(-pi/4) q0[237];
-cx q0[0],q0[237];
-rz(3*pi/4) q0[237];
-sx q0[237];
-rz(pi/2) q0[237];
-rz(pi/4) q0[67];
-cx q0[0],q0[67];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[67];
-cx q0[0],q0[67];
-cx q0[237],q0[67];
-rz(-pi) q0[238];
-sx q0[238];
-rz(0.81366725) q0[238];
-sx q0[238];
-cx q0[238],q0[68];
-rz(pi/2) q0[238];
-sx q0[238];
-rz(pi/2) q0[238];
-cx q0[68],q0[238];
-rz(-pi/4) q0[238];
-cx q0[0],q0[238];
-rz(pi/4) q0[238];
-cx q0[68],q0[238];
-rz(-pi/4) q0[238];
-cx q0[0],q0[238];
-rz(3*pi/4) q0[238];
-sx q0[238];
-rz(pi/2) q0[238];
-rz(pi/4) q0[68];
-cx q0[0],q0[68];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[68];
-cx q0[0],q0[68];
-cx q0[238],q0[68];
-rz(-pi) q0[239];
-sx q0[239];
-rz(2.2481482) q0[239];
-sx q0[239];
-cx q0[239],q0[69];
-rz(pi/2) q0[239];
-sx q0[239];
-rz(pi/2) q0[239];
-cx q0[69],q0[239];
-rz(-pi/4) q0[239];
-cx q0[0],q0[239];
-rz(pi/4) q0[239];
-cx q0[69],q0[239];
-rz(-pi/4) q0[239];
-cx q0[0],q0[239];
-rz(3*pi/4) q0[239];
-sx q0[239];
-rz(pi/2) q0[239];
-rz(pi/4) q0[69];
-cx q0[0],q0[69];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[69];
-cx q0[0],q0[69];
-cx q0[239],q0[69];
-rz(-pi) q0[240];
-sx q0[240];
-rz(2.6374288) q0[240];
-sx q0[240];
-cx q0[240],q0[70];
-rz(pi/2) q0[240];
-sx q0[240];
-rz(pi/2) q0[240];
-cx q0[70],q0[240];
-rz(-pi/4) q0[240];
-cx q0[0],q0[240];
-rz(pi/4) q0[240];
-cx q0[70],q0[240];
-rz(-pi/4) q0[240];
-cx q0[0],q0[240];
-rz(3*pi/4) q0[240];
-sx q0[240];
-rz(pi/2) q0[240];
-rz(pi/4) q0[70];
-cx q0[0],q0[70];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[70];
-cx q0[0],q0[70];
-cx q0[240],q0[70];
-rz(-pi) q0[241];
-sx q0[241];
-rz(2.7114224) q0[241];
-sx q0[241];
-cx q0[241],q0[71];
-rz(pi/2) q0[241];
-sx q0[241];
-rz(pi/2) q0[241];
-cx q0[71],q0[241];
-rz(-pi/4) q0[241];
-cx q0[0],q0[241];
-rz(pi/4) q0[241];
-cx q0[71],q0[241];
-rz(-pi/4) q0[241];
-cx q0[0],q0[241];
-rz(3*pi/4) q0[241];
-sx q0[241];
-rz(pi/2) q0[241];
-rz(pi/4) q0[71];
-cx q0[0],q0[71];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[71];
-cx q0[0],q0[71];
-cx q0[241],q0[71];
-rz(-pi) q0[242];
-sx q0[242];
-rz(2.1416606) q0[242];
-sx q0[242];
-cx q0[242],q0[72];
-rz(pi/2) q0[242];
-sx q0[242];
-rz(pi/2) q0[242];
-cx q0[72],q0[242];
-rz(-pi/4) q0[242];
-cx q0[0],q0[242];
-rz(pi/4) q0[242];
-cx q0[72],q0[242];
-rz(-pi/4) q0[242];
-cx q0[0],q0[242];
-rz(3*pi/4) q0[242];
-sx q0[242];
-rz(pi/2) q0[242];
-rz(pi/4) q0[72];
-cx q0[0],q0[72];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[72];
-cx q0[0],q0[72];
-cx q0[242],q0[72];
-rz(-pi) q0[243];
-sx q0[243];
-rz(2.197448) q0[243];
-sx q0[243];
-cx q0[243],q0[73];
-rz(pi/2) q0[243];
-sx q0[243];
-rz(pi/2) q0[243];
-cx q0[73],q0[243];
-rz(-pi/4) q0[243];
-cx q0[0],q0[243];
-rz(pi/4) q0[243];
-cx q0[73],q0[243];
-rz(-pi/4) q0[243];
-cx q0[0],q0[243];
-rz(3*pi/4) q0[243];
-sx q0[243];
-rz(pi/2) q0[243];
-rz(pi/4) q0[73];
-cx q0[0],q0[73];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[73];
-cx q0[0],q0[73];
-cx q0[243],q0[73];
-rz(-pi) q0[244];
-sx q0[244];
-rz(2.8985944) q0[244];
-sx q0[244];
-cx q0[244],q0[74];
-rz(pi/2) q0[244];
-sx q0[244];
-rz(pi/2) q0[244];
-cx q0[74],q0[244];
-rz(-pi/4) q0[244];
-cx q0[0],q0[244];
-rz(pi/4) q0[244];
-cx q0[74],q0[244];
-rz(-pi/4) q0[244];
-cx q0[0],q0[244];
-rz(3*pi/4) q0[244];
-sx q0[244];
-rz(pi/2) q0[244];
-rz(pi/4) q0[74];
-cx q0[0],q0[74];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[74];
-cx q0[0],q0[74];
-cx q0[244],q0[74];
-rz(-pi) q0[245];
-sx q0[245];
-rz(0.78923415) q0[245];
-sx q0[245];
-cx q0[245],q0[75];
-rz(pi/2) q0[245];
-sx q0[245];
-rz(pi/2) q0[245];
-cx q0[75],q0[245];
-rz(-pi/4) q0[245];
-cx q0[0],q0[245];
-rz(pi/4) q0[245];
-cx q0[75],q0[245];
-rz(-pi/4) q0[245];
-cx q0[0],q0[245];
-rz(3*pi/4) q0[245];
-sx q0[245];
-rz(pi/2) q0[245];
-rz(pi/4) q0[75];
-cx q0[0],q0[75];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[75];
-cx q0[0],q0[75];
-cx q0[245],q0[75];
-rz(-pi) q0[246];
-sx q0[246];
-rz(1.8183968) q0[246];
-sx q0[246];
-cx q0[246],q0[76];
-rz(pi/2) q0[246];
-sx q0[246];
-rz(pi/2) q0[246];
-cx q0[76],q0[246];
-rz(-pi/4) q0[246];
-cx q0[0],q0[246];
-rz(pi/4) q0[246];
-cx q0[76],q0[246];
-rz(-pi/4) q0[246];
-cx q0[0],q0[246];
-rz(3*pi/4) q0[246];
-sx q0[246];
-rz(pi/2) q0[246];
-rz(pi/4) q0[76];
-cx q0[0],q0[76];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[76];
-cx q0[0],q0[76];
-cx q0[246],q0[76];
-rz(-pi) q0[247];
-sx q0[247];
-rz(2.3023963) q0[247];
-sx q0[247];
-cx q0[247],q0[77];
-rz(pi/2) q0[247];
-sx q0[247];
-rz(pi/2) q0[247];
-cx q0[77],q0[247];
-rz(-pi/4) q0[247];
-cx q0[0],q0[247];
-rz(pi/4) q0[247];
-cx q0[77],q0[247];
-rz(-pi/4) q0[247];
-cx q0[0],q0[247];
-rz(3*pi/4) q0[247];
-sx q0[247];
-rz(pi/2) q0[247];
-rz(pi/4) q0[77];
-cx q0[0],q0[77];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[77];
-cx q0[0],q0[77];
-cx q0[247],q0[77];
-rz(-pi) q0[248];
-sx q0[248];
-rz(1.7412896) q0[248];
-sx q0[248];
-cx q0[248],q0[78];
-rz(pi/2) q0[248];
-sx q0[248];
-rz(pi/2) q0[248];
-cx q0[78],q0[248];
-rz(-pi/4) q0[248];
-cx q0[0],q0[248];
-rz(pi/4) q0[248];
-cx q0[78],q0[248];
-rz(-pi/4) q0[248];
-cx q0[0],q0[248];
-rz(3*pi/4) q0[248];
-sx q0[248];
-rz(pi/2) q0[248];
-rz(pi/4) q0[78];
-cx q0[0],q0[78];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[78];
-cx q0[0],q0[78];
-cx q0[248],q0[78];
-rz(-pi) q0[249];
-sx q0[249];
-rz(0.41181165) q0[249];
-sx q0[249];
-cx q0[249],q0[79];
-rz(pi/2) q0[249];
-sx q0[249];
-rz(pi/2) q0[249];
-cx q0[79],q0[249];
-rz(-pi/4) q0[249];
-cx q0[0],q0[249];
-rz(pi/4) q0[249];
-cx q0[79],q0[249];
-rz(-pi/4) q0[249];
-cx q0[0],q0[249];
-rz(3*pi/4) q0[249];
-sx q0[249];
-rz(pi/2) q0[249];
-rz(pi/4) q0[79];
-cx q0[0],q0[79];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[79];
-cx q0[0],q0[79];
-cx q0[249],q0[79];
-rz(-pi) q0[250];
-sx q0[250];
-rz(0.29470935) q0[250];
-sx q0[250];
-cx q0[250],q0[80];
-rz(pi/2) q0[250];
-sx q0[250];
-rz(pi/2) q0[250];
-cx q0[80],q0[250];
-rz(-pi/4) q0[250];
-cx q0[0],q0[250];
-rz(pi/4) q0[250];
-cx q0[80],q0[250];
-rz(-pi/4) q0[250];
-cx q0[0],q0[250];
-rz(3*pi/4) q0[250];
-sx q0[250];
-rz(pi/2) q0[250];
-rz(pi/4) q0[80];
-cx q0[0],q0[80];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[80];
-cx q0[0],q0[80];
-cx q0[250],q0[80];
-rz(-pi) q0[251];
-sx q0[251];
-rz(0.23003265) q0[251];
-sx q0[251];
-cx q0[251],q0[81];
-rz(pi/2) q0[251];
-sx q0[251];
-rz(pi/2) q0[251];
-cx q0[81],q0[251];
-rz(-pi/4) q0[251];
-cx q0[0],q0[251];
-rz(pi/4) q0[251];
-cx q0[81],q0[251];
-rz(-pi/4) q0[251];
-cx q0[0],q0[251];
-rz(3*pi/4) q0[251];
-sx q0[251];
-rz(pi/2) q0[251];
-rz(pi/4) q0[81];
-cx q0[0],q0[81];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[81];
-cx q0[0],q0[81];
-cx q0[251],q0[81];
-rz(-pi) q0[252];
-sx q0[252];
-rz(2.2781117) q0[252];
-sx q0[252];
-cx q0[252],q0[82];
-rz(pi/2) q0[252];
-sx q0[252];
-rz(pi/2) q0[252];
-cx q0[82],q0[252];
-rz(-pi/4) q0[252];
-cx q0[0],q0[252];
-rz(pi/4) q0[252];
-cx q0[82],q0[252];
-rz(-pi/4) q0[252];
-cx q0[0],q0[252];
-rz(3*pi/4) q0[252];
-sx q0[252];
-rz(pi/2) q0[252];
-rz(pi/4) q0[82];
-cx q0[0],q0[82];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[82];
-cx q0[0],q0[82];
-cx q0[252],q0[82];
-rz(-pi) q0[253];
-sx q0[253];
-rz(3.0172165) q0[253];
-sx q0[253];
-cx q0[253],q0[83];
-rz(pi/2) q0[253];
-sx q0[253];
-rz(pi/2) q0[253];
-cx q0[83],q0[253];
-rz(-pi/4) q0[253];
-cx q0[0],q0[253];
-rz(pi/4) q0[253];
-cx q0[83],q0[253];
-rz(-pi/4) q0[253];
-cx q0[0],q0[253];
-rz(3*pi/4) q0[253];
-sx q0[253];
-rz(pi/2) q0[253];
-rz(pi/4) q0[83];
-cx q0[0],q0[83];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[83];
-cx q0[0],q0[83];
-cx q0[253],q0[83];
-rz(-pi) q0[254];
-sx q0[254];
-rz(2.9633149) q0[254];
-sx q0[254];
-cx q0[254],q0[84];
-rz(pi/2) q0[254];
-sx q0[254];
-rz(pi/2) q0[254];
-cx q0[84],q0[254];
-rz(-pi/4) q0[254];
-cx q0[0],q0[254];
-rz(pi/4) q0[254];
-cx q0[84],q0[254];
-rz(-pi/4) q0[254];
-cx q0[0],q0[254];
-rz(3*pi/4) q0[254];
-sx q0[254];
-rz(pi/2) q0[254];
-rz(pi/4) q0[84];
-cx q0[0],q0[84];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[84];
-cx q0[0],q0[84];
-cx q0[254],q0[84];
-rz(-pi) q0[255];
-sx q0[255];
-rz(0.84980465) q0[255];
-sx q0[255];
-cx q0[255],q0[85];
-rz(pi/2) q0[255];
-sx q0[255];
-rz(pi/2) q0[255];
-cx q0[85],q0[255];
-rz(-pi/4) q0[255];
-cx q0[0],q0[255];
-rz(pi/4) q0[255];
-cx q0[85],q0[255];
-rz(-pi/4) q0[255];
-cx q0[0],q0[255];
-rz(3*pi/4) q0[255];
-sx q0[255];
-rz(pi/2) q0[255];
-rz(pi/4) q0[85];
-cx q0[0],q0[85];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[85];
-cx q0[0],q0[85];
-cx q0[255],q0[85];
-rz(-pi) q0[256];
-sx q0[256];
-rz(0.86420405) q0[256];
-sx q0[256];
-cx q0[256],q0[86];
-rz(pi/2) q0[256];
-sx q0[256];
-rz(pi/2) q0[256];
-cx q0[86],q0[256];
-rz(-pi/4) q0[256];
-cx q0[0],q0[256];
-rz(pi/4) q0[256];
-cx q0[86],q0[256];
-rz(-pi/4) q0[256];
-cx q0[0],q0[256];
-rz(3*pi/4) q0[256];
-sx q0[256];
-rz(pi/2) q0[256];
-rz(pi/4) q0[86];
-cx q0[0],q0[86];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[86];
-cx q0[0],q0[86];
-cx q0[256],q0[86];
-rz(-pi) q0[257];
-sx q0[257];
-rz(0.29677525) q0[257];
-sx q0[257];
-cx q0[257],q0[87];
-rz(pi/2) q0[257];
-sx q0[257];
-rz(pi/2) q0[257];
-cx q0[87],q0[257];
-rz(-pi/4) q0[257];
-cx q0[0],q0[257];
-rz(pi/4) q0[257];
-cx q0[87],q0[257];
-rz(-pi/4) q0[257];
-cx q0[0],q0[257];
-rz(3*pi/4) q0[257];
-sx q0[257];
-rz(pi/2) q0[257];
-rz(pi/4) q0[87];
-cx q0[0],q0[87];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[87];
-cx q0[0],q0[87];
-cx q0[257],q0[87];
-rz(-pi) q0[258];
-sx q0[258];
-rz(0.37597995) q0[258];
-sx q0[258];
-cx q0[258],q0[88];
-rz(pi/2) q0[258];
-sx q0[258];
-rz(pi/2) q0[258];
-cx q0[88],q0[258];
-rz(-pi/4) q0[258];
-cx q0[0],q0[258];
-rz(pi/4) q0[258];
-cx q0[88],q0[258];
-rz(-pi/4) q0[258];
-cx q0[0],q0[258];
-rz(3*pi/4) q0[258];
-sx q0[258];
-rz(pi/2) q0[258];
-rz(pi/4) q0[88];
-cx q0[0],q0[88];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[88];
-cx q0[0],q0[88];
-cx q0[258],q0[88];
-rz(-pi) q0[259];
-sx q0[259];
-rz(2.5056354) q0[259];
-sx q0[259];
-cx q0[259],q0[89];
-rz(pi/2) q0[259];
-sx q0[259];
-rz(pi/2) q0[259];
-cx q0[89],q0[259];
-rz(-pi/4) q0[259];
-cx q0[0],q0[259];
-rz(pi/4) q0[259];
-cx q0[89],q0[259];
-rz(-pi/4) q0[259];
-cx q0[0],q0[259];
-rz(3*pi/4) q0[259];
-sx q0[259];
-rz(pi/2) q0[259];
-rz(pi/4) q0[89];
-cx q0[0],q0[89];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[89];
-cx q0[0],q0[89];
-cx q0[259],q0[89];
-rz(-pi) q0[260];
-sx q0[260];
-rz(2.8003249) q0[260];
-sx q0[260];
-cx q0[260],q0[90];
-rz(pi/2) q0[260];
-sx q0[260];
-rz(pi/2) q0[260];
-cx q0[90],q0[260];
-rz(-pi/4) q0[260];
-cx q0[0],q0[260];
-rz(pi/4) q0[260];
-cx q0[90],q0[260];
-rz(-pi/4) q0[260];
-cx q0[0],q0[260];
-rz(3*pi/4) q0[260];
-sx q0[260];
-rz(pi/2) q0[260];
-rz(pi/4) q0[90];
-cx q0[0],q0[90];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[90];
-cx q0[0],q0[90];
-cx q0[260],q0[90];
-rz(-pi) q0[261];
-sx q0[261];
-rz(0.65709265) q0[261];
-sx q0[261];
-cx q0[261],q0[91];
-rz(pi/2) q0[261];
-sx q0[261];
-rz(pi/2) q0[261];
-cx q0[91],q0[261];
-rz(-pi/4) q0[261];
-cx q0[0],q0[261];
-rz(pi/4) q0[261];
-cx q0[91],q0[261];
-rz(-pi/4) q0[261];
-cx q0[0],q0[261];
-rz(3*pi/4) q0[261];
-sx q0[261];
-rz(pi/2) q0[261];
-rz(pi/4) q0[91];
-cx q0[0],q0[91];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[91];
-cx q0[0],q0[91];
-cx q0[261],q0[91];
-rz(-pi) q0[262];
-sx q0[262];
-rz(1.9331439) q0[262];
-sx q0[262];
-cx q0[262],q0[92];
-rz(pi/2) q0[262];
-sx q0[262];
-rz(pi/2) q0[262];
-cx q0[92],q0[262];
-rz(-pi/4) q0[262];
-cx q0[0],q0[262];
-rz(pi/4) q0[262];
-cx q0[92],q0[262];
-rz(-pi/4) q0[262];
-cx q0[0],q0[262];
-rz(3*pi/4) q0[262];
-sx q0[262];
-rz(pi/2) q0[262];
-rz(pi/4) q0[92];
-cx q0[0],q0[92];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[92];
-cx q0[0],q0[92];
-cx q0[262],q0[92];
-rz(-pi) q0[263];
-sx q0[263];
-rz(3.0246879) q0[263];
-sx q0[263];
-cx q0[263],q0[93];
-rz(pi/2) q0[263];
-sx q0[263];
-rz(pi/2) q0[263];
-cx q0[93],q0[263];
-rz(-pi/4) q0[263];
-cx q0[0],q0[263];
-rz(pi/4) q0[263];
-cx q0[93],q0[263];
-rz(-pi/4) q0[263];
-cx q0[0],q0[263];
-rz(3*pi/4) q0[263];
-sx q0[263];
-rz(pi/2) q0[263];
-rz(pi/4) q0[93];
-cx q0[0],q0[93];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[93];
-cx q0[0],q0[93];
-cx q0[263],q0[93];
-rz(-pi) q0[264];
-sx q0[264];
-rz(3.1247481) q0[264];
-sx q0[264];
-cx q0[264],q0[94];
-rz(pi/2) q0[264];
-sx q0[264];
-rz(pi/2) q0[264];
-cx q0[94],q0[264];
-rz(-pi/4) q0[264];
-cx q0[0],q0[264];
-rz(pi/4) q0[264];
-cx q0[94],q0[264];
-rz(-pi/4) q0[264];
-cx q0[0],q0[264];
-rz(3*pi/4) q0[264];
-sx q0[264];
-rz(pi/2) q0[264];
-rz(pi/4) q0[94];
-cx q0[0],q0[94];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[94];
-cx q0[0],q0[94];
-cx q0[264],q0[94];
-rz(-pi) q0[265];
-sx q0[265];
-rz(0.66165965) q0[265];
-sx q0[265];
-cx q0[265],q0[95];
-rz(pi/2) q0[265];
-sx q0[265];
-rz(pi/2) q0[265];
-cx q0[95],q0[265];
-rz(-pi/4) q0[265];
-cx q0[0],q0[265];
-rz(pi/4) q0[265];
-cx q0[95],q0[265];
-rz(-pi/4) q0[265];
-cx q0[0],q0[265];
-rz(3*pi/4) q0[265];
-sx q0[265];
-rz(pi/2) q0[265];
-rz(pi/4) q0[95];
-cx q0[0],q0[95];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[95];
-cx q0[0],q0[95];
-cx q0[265],q0[95];
-rz(-pi) q0[266];
-sx q0[266];
-rz(0.39558965) q0[266];
-sx q0[266];
-cx q0[266],q0[96];
-rz(pi/2) q0[266];
-sx q0[266];
-rz(pi/2) q0[266];
-cx q0[96],q0[266];
-rz(-pi/4) q0[266];
-cx q0[0],q0[266];
-rz(pi/4) q0[266];
-cx q0[96],q0[266];
-rz(-pi/4) q0[266];
-cx q0[0],q0[266];
-rz(3*pi/4) q0[266];
-sx q0[266];
-rz(pi/2) q0[266];
-rz(pi/4) q0[96];
-cx q0[0],q0[96];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[96];
-cx q0[0],q0[96];
-cx q0[266],q0[96];
-rz(-pi) q0[267];
-sx q0[267];
-rz(0.98065415) q0[267];
-sx q0[267];
-cx q0[267],q0[97];
-rz(pi/2) q0[267];
-sx q0[267];
-rz(pi/2) q0[267];
-cx q0[97],q0[267];
-rz(-pi/4) q0[267];
-cx q0[0],q0[267];
-rz(pi/4) q0[267];
-cx q0[97],q0[267];
-rz(-pi/4) q0[267];
-cx q0[0],q0[267];
-rz(3*pi/4) q0[267];
-sx q0[267];
-rz(pi/2) q0[267];
-rz(pi/4) q0[97];
-cx q0[0],q0[97];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[97];
-cx q0[0],q0[97];
-cx q0[267],q0[97];
-rz(-pi) q0[268];
-sx q0[268];
-rz(1.7599767) q0[268];
-sx q0[268];
-cx q0[268],q0[98];
-rz(pi/2) q0[268];
-sx q0[268];
-rz(pi/2) q0[268];
-cx q0[98],q0[268];
-rz(-pi/4) q0[268];
-cx q0[0],q0[268];
-rz(pi/4) q0[268];
-cx q0[98],q0[268];
-rz(-pi/4) q0[268];
-cx q0[0],q0[268];
-rz(3*pi/4) q0[268];
-sx q0[268];
-rz(pi/2) q0[268];
-rz(pi/4) q0[98];
-cx q0[0],q0[98];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[98];
-cx q0[0],q0[98];
-cx q0[268],q0[98];
-rz(-pi) q0[269];
-sx q0[269];
-rz(1.6075798) q0[269];
-sx q0[269];
-cx q0[269],q0[99];
-rz(pi/2) q0[269];
-sx q0[269];
-rz(pi/2) q0[269];
-cx q0[99],q0[269];
-rz(-pi/4) q0[269];
-cx q0[0],q0[269];
-rz(pi/4) q0[269];
-cx q0[99],q0[269];
-rz(-pi/4) q0[269];
-cx q0[0],q0[269];
-rz(3*pi/4) q0[269];
-sx q0[269];
-rz(pi/2) q0[269];
-rz(pi/4) q0[99];
-cx q0[0],q0[99];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[99];
-cx q0[0],q0[99];
-cx q0[269],q0[99];
-rz(-pi) q0[270];
-sx q0[270];
-rz(1.5659012) q0[270];
-sx q0[270];
-cx q0[270],q0[100];
-rz(pi/2) q0[270];
-sx q0[270];
-rz(pi/2) q0[270];
-cx q0[100],q0[270];
-rz(-pi/4) q0[270];
-cx q0[0],q0[270];
-rz(pi/4) q0[270];
-cx q0[100],q0[270];
-rz(pi/4) q0[100];
-rz(-pi/4) q0[270];
-cx q0[0],q0[270];
-cx q0[0],q0[100];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[100];
-cx q0[0],q0[100];
-rz(3*pi/4) q0[270];
-sx q0[270];
-rz(pi/2) q0[270];
-cx q0[270],q0[100];
-rz(-pi) q0[271];
-sx q0[271];
-rz(0.60549605) q0[271];
-sx q0[271];
-cx q0[271],q0[101];
-rz(pi/2) q0[271];
-sx q0[271];
-rz(pi/2) q0[271];
-cx q0[101],q0[271];
-rz(-pi/4) q0[271];
-cx q0[0],q0[271];
-rz(pi/4) q0[271];
-cx q0[101],q0[271];
-rz(pi/4) q0[101];
-rz(-pi/4) q0[271];
-cx q0[0],q0[271];
-cx q0[0],q0[101];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[101];
-cx q0[0],q0[101];
-rz(3*pi/4) q0[271];
-sx q0[271];
-rz(pi/2) q0[271];
-cx q0[271],q0[101];
-rz(-pi) q0[272];
-sx q0[272];
-rz(2.4980819) q0[272];
-sx q0[272];
-cx q0[272],q0[102];
-rz(pi/2) q0[272];
-sx q0[272];
-rz(pi/2) q0[272];
-cx q0[102],q0[272];
-rz(-pi/4) q0[272];
-cx q0[0],q0[272];
-rz(pi/4) q0[272];
-cx q0[102],q0[272];
-rz(pi/4) q0[102];
-rz(-pi/4) q0[272];
-cx q0[0],q0[272];
-cx q0[0],q0[102];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[102];
-cx q0[0],q0[102];
-rz(3*pi/4) q0[272];
-sx q0[272];
-rz(pi/2) q0[272];
-cx q0[272],q0[102];
-rz(-pi) q0[273];
-sx q0[273];
-rz(2.0849055) q0[273];
-sx q0[273];
-cx q0[273],q0[103];
-rz(pi/2) q0[273];
-sx q0[273];
-rz(pi/2) q0[273];
-cx q0[103],q0[273];
-rz(-pi/4) q0[273];
-cx q0[0],q0[273];
-rz(pi/4) q0[273];
-cx q0[103],q0[273];
-rz(pi/4) q0[103];
-rz(-pi/4) q0[273];
-cx q0[0],q0[273];
-cx q0[0],q0[103];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[103];
-cx q0[0],q0[103];
-rz(3*pi/4) q0[273];
-sx q0[273];
-rz(pi/2) q0[273];
-cx q0[273],q0[103];
-rz(-pi) q0[274];
-sx q0[274];
-rz(2.950141) q0[274];
-sx q0[274];
-cx q0[274],q0[104];
-rz(pi/2) q0[274];
-sx q0[274];
-rz(pi/2) q0[274];
-cx q0[104],q0[274];
-rz(-pi/4) q0[274];
-cx q0[0],q0[274];
-rz(pi/4) q0[274];
-cx q0[104],q0[274];
-rz(pi/4) q0[104];
-rz(-pi/4) q0[274];
-cx q0[0],q0[274];
-cx q0[0],q0[104];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[104];
-cx q0[0],q0[104];
-rz(3*pi/4) q0[274];
-sx q0[274];
-rz(pi/2) q0[274];
-cx q0[274],q0[104];
-rz(-pi) q0[275];
-sx q0[275];
-rz(2.1443536) q0[275];
-sx q0[275];
-cx q0[275],q0[105];
-rz(pi/2) q0[275];
-sx q0[275];
-rz(pi/2) q0[275];
-cx q0[105],q0[275];
-rz(-pi/4) q0[275];
-cx q0[0],q0[275];
-rz(pi/4) q0[275];
-cx q0[105],q0[275];
-rz(pi/4) q0[105];
-rz(-pi/4) q0[275];
-cx q0[0],q0[275];
-cx q0[0],q0[105];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[105];
-cx q0[0],q0[105];
-rz(3*pi/4) q0[275];
-sx q0[275];
-rz(pi/2) q0[275];
-cx q0[275],q0[105];
-rz(-pi) q0[276];
-sx q0[276];
-rz(1.8237795) q0[276];
-sx q0[276];
-cx q0[276],q0[106];
-rz(pi/2) q0[276];
-sx q0[276];
-rz(pi/2) q0[276];
-cx q0[106],q0[276];
-rz(-pi/4) q0[276];
-cx q0[0],q0[276];
-rz(pi/4) q0[276];
-cx q0[106],q0[276];
-rz(pi/4) q0[106];
-rz(-pi/4) q0[276];
-cx q0[0],q0[276];
-cx q0[0],q0[106];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[106];
-cx q0[0],q0[106];
-rz(3*pi/4) q0[276];
-sx q0[276];
-rz(pi/2) q0[276];
-cx q0[276],q0[106];
-rz(-pi) q0[277];
-sx q0[277];
-rz(0.15335285) q0[277];
-sx q0[277];
-cx q0[277],q0[107];
-rz(pi/2) q0[277];
-sx q0[277];
-rz(pi/2) q0[277];
-cx q0[107],q0[277];
-rz(-pi/4) q0[277];
-cx q0[0],q0[277];
-rz(pi/4) q0[277];
-cx q0[107],q0[277];
-rz(pi/4) q0[107];
-rz(-pi/4) q0[277];
-cx q0[0],q0[277];
-cx q0[0],q0[107];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[107];
-cx q0[0],q0[107];
-rz(3*pi/4) q0[277];
-sx q0[277];
-rz(pi/2) q0[277];
-cx q0[277],q0[107];
-rz(-pi) q0[278];
-sx q0[278];
-rz(0.63639055) q0[278];
-sx q0[278];
-cx q0[278],q0[108];
-rz(pi/2) q0[278];
-sx q0[278];
-rz(pi/2) q0[278];
-cx q0[108],q0[278];
-rz(-pi/4) q0[278];
-cx q0[0],q0[278];
-rz(pi/4) q0[278];
-cx q0[108],q0[278];
-rz(pi/4) q0[108];
-rz(-pi/4) q0[278];
-cx q0[0],q0[278];
-cx q0[0],q0[108];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[108];
-cx q0[0],q0[108];
-rz(3*pi/4) q0[278];
-sx q0[278];
-rz(pi/2) q0[278];
-cx q0[278],q0[108];
-rz(-pi) q0[279];
-sx q0[279];
-rz(0.36542675) q0[279];
-sx q0[279];
-cx q0[279],q0[109];
-rz(pi/2) q0[279];
-sx q0[279];
-rz(pi/2) q0[279];
-cx q0[109],q0[279];
-rz(-pi/4) q0[279];
-cx q0[0],q0[279];
-rz(pi/4) q0[279];
-cx q0[109],q0[279];
-rz(pi/4) q0[109];
-rz(-pi/4) q0[279];
-cx q0[0],q0[279];
-cx q0[0],q0[109];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[109];
-cx q0[0],q0[109];
-rz(3*pi/4) q0[279];
-sx q0[279];
-rz(pi/2) q0[279];
-cx q0[279],q0[109];
-rz(-pi) q0[280];
-sx q0[280];
-rz(0.37494595) q0[280];
-sx q0[280];
-cx q0[280],q0[110];
-rz(pi/2) q0[280];
-sx q0[280];
-rz(pi/2) q0[280];
-cx q0[110],q0[280];
-rz(-pi/4) q0[280];
-cx q0[0],q0[280];
-rz(pi/4) q0[280];
-cx q0[110],q0[280];
-rz(pi/4) q0[110];
-rz(-pi/4) q0[280];
-cx q0[0],q0[280];
-cx q0[0],q0[110];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[110];
-cx q0[0],q0[110];
-rz(3*pi/4) q0[280];
-sx q0[280];
-rz(pi/2) q0[280];
-cx q0[280],q0[110];
-rz(-pi) q0[281];
-sx q0[281];
-rz(2.9587018) q0[281];
-sx q0[281];
-cx q0[281],q0[111];
-rz(pi/2) q0[281];
-sx q0[281];
-rz(pi/2) q0[281];
-cx q0[111],q0[281];
-rz(-pi/4) q0[281];
-cx q0[0],q0[281];
-rz(pi/4) q0[281];
-cx q0[111],q0[281];
-rz(pi/4) q0[111];
-rz(-pi/4) q0[281];
-cx q0[0],q0[281];
-cx q0[0],q0[111];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[111];
-cx q0[0],q0[111];
-rz(3*pi/4) q0[281];
-sx q0[281];
-rz(pi/2) q0[281];
-cx q0[281],q0[111];
-rz(-pi) q0[282];
-sx q0[282];
-rz(1.1402497) q0[282];
-sx q0[282];
-cx q0[282],q0[112];
-rz(pi/2) q0[282];
-sx q0[282];
-rz(pi/2) q0[282];
-cx q0[112],q0[282];
-rz(-pi/4) q0[282];
-cx q0[0],q0[282];
-rz(pi/4) q0[282];
-cx q0[112],q0[282];
-rz(pi/4) q0[112];
-rz(-pi/4) q0[282];
-cx q0[0],q0[282];
-cx q0[0],q0[112];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[112];
-cx q0[0],q0[112];
-rz(3*pi/4) q0[282];
-sx q0[282];
-rz(pi/2) q0[282];
-cx q0[282],q0[112];
-rz(-pi) q0[283];
-sx q0[283];
-rz(2.3469333) q0[283];
-sx q0[283];
-cx q0[283],q0[113];
-rz(pi/2) q0[283];
-sx q0[283];
-rz(pi/2) q0[283];
-cx q0[113],q0[283];
-rz(-pi/4) q0[283];
-cx q0[0],q0[283];
-rz(pi/4) q0[283];
-cx q0[113],q0[283];
-rz(pi/4) q0[113];
-rz(-pi/4) q0[283];
-cx q0[0],q0[283];
-cx q0[0],q0[113];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[113];
-cx q0[0],q0[113];
-rz(3*pi/4) q0[283];
-sx q0[283];
-rz(pi/2) q0[283];
-cx q0[283],q0[113];
-rz(-pi) q0[284];
-sx q0[284];
-rz(0.12159395) q0[284];
-sx q0[284];
-cx q0[284],q0[114];
-rz(pi/2) q0[284];
-sx q0[284];
-rz(pi/2) q0[284];
-cx q0[114],q0[284];
-rz(-pi/4) q0[284];
-cx q0[0],q0[284];
-rz(pi/4) q0[284];
-cx q0[114],q0[284];
-rz(pi/4) q0[114];
-rz(-pi/4) q0[284];
-cx q0[0],q0[284];
-cx q0[0],q0[114];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[114];
-cx q0[0],q0[114];
-rz(3*pi/4) q0[284];
-sx q0[284];
-rz(pi/2) q0[284];
-cx q0[284],q0[114];
-rz(-pi) q0[285];
-sx q0[285];
-rz(2.5738189) q0[285];
-sx q0[285];
-cx q0[285],q0[115];
-rz(pi/2) q0[285];
-sx q0[285];
-rz(pi/2) q0[285];
-cx q0[115],q0[285];
-rz(-pi/4) q0[285];
-cx q0[0],q0[285];
-rz(pi/4) q0[285];
-cx q0[115],q0[285];
-rz(pi/4) q0[115];
-rz(-pi/4) q0[285];
-cx q0[0],q0[285];
-cx q0[0],q0[115];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[115];
-cx q0[0],q0[115];
-rz(3*pi/4) q0[285];
-sx q0[285];
-rz(pi/2) q0[285];
-cx q0[285],q0[115];
-rz(-pi) q0[286];
-sx q0[286];
-rz(1.8116423) q0[286];
-sx q0[286];
-cx q0[286],q0[116];
-rz(pi/2) q0[286];
-sx q0[286];
-rz(pi/2) q0[286];
-cx q0[116],q0[286];
-rz(-pi/4) q0[286];
-cx q0[0],q0[286];
-rz(pi/4) q0[286];
-cx q0[116],q0[286];
-rz(pi/4) q0[116];
-rz(-pi/4) q0[286];
-cx q0[0],q0[286];
-cx q0[0],q0[116];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[116];
-cx q0[0],q0[116];
-rz(3*pi/4) q0[286];
-sx q0[286];
-rz(pi/2) q0[286];
-cx q0[286],q0[116];
-rz(-pi) q0[287];
-sx q0[287];
-rz(2.6530398) q0[287];
-sx q0[287];
-cx q0[287],q0[117];
-rz(pi/2) q0[287];
-sx q0[287];
-rz(pi/2) q0[287];
-cx q0[117],q0[287];
-rz(-pi/4) q0[287];
-cx q0[0],q0[287];
-rz(pi/4) q0[287];
-cx q0[117],q0[287];
-rz(pi/4) q0[117];
-rz(-pi/4) q0[287];
-cx q0[0],q0[287];
-cx q0[0],q0[117];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[117];
-cx q0[0],q0[117];
-rz(3*pi/4) q0[287];
-sx q0[287];
-rz(pi/2) q0[287];
-cx q0[287],q0[117];
-rz(-pi) q0[288];
-sx q0[288];
-rz(2.3052996) q0[288];
-sx q0[288];
-cx q0[288],q0[118];
-rz(pi/2) q0[288];
-sx q0[288];
-rz(pi/2) q0[288];
-cx q0[118],q0[288];
-rz(-pi/4) q0[288];
-cx q0[0],q0[288];
-rz(pi/4) q0[288];
-cx q0[118],q0[288];
-rz(pi/4) q0[118];
-rz(-pi/4) q0[288];
-cx q0[0],q0[288];
-cx q0[0],q0[118];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[118];
-cx q0[0],q0[118];
-rz(3*pi/4) q0[288];
-sx q0[288];
-rz(pi/2) q0[288];
-cx q0[288],q0[118];
-rz(-pi) q0[289];
-sx q0[289];
-rz(0.65100795) q0[289];
-sx q0[289];
-cx q0[289],q0[119];
-rz(pi/2) q0[289];
-sx q0[289];
-rz(pi/2) q0[289];
-cx q0[119],q0[289];
-rz(-pi/4) q0[289];
-cx q0[0],q0[289];
-rz(pi/4) q0[289];
-cx q0[119],q0[289];
-rz(pi/4) q0[119];
-rz(-pi/4) q0[289];
-cx q0[0],q0[289];
-cx q0[0],q0[119];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[119];
-cx q0[0],q0[119];
-rz(3*pi/4) q0[289];
-sx q0[289];
-rz(pi/2) q0[289];
-cx q0[289],q0[119];
-rz(-pi) q0[290];
-sx q0[290];
-rz(2.5939605) q0[290];
-sx q0[290];
-cx q0[290],q0[120];
-rz(pi/2) q0[290];
-sx q0[290];
-rz(pi/2) q0[290];
-cx q0[120],q0[290];
-rz(-pi/4) q0[290];
-cx q0[0],q0[290];
-rz(pi/4) q0[290];
-cx q0[120],q0[290];
-rz(pi/4) q0[120];
-rz(-pi/4) q0[290];
-cx q0[0],q0[290];
-cx q0[0],q0[120];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[120];
-cx q0[0],q0[120];
-rz(3*pi/4) q0[290];
-sx q0[290];
-rz(pi/2) q0[290];
-cx q0[290],q0[120];
-rz(-pi) q0[291];
-sx q0[291];
-rz(1.020954) q0[291];
-sx q0[291];
-cx q0[291],q0[121];
-rz(pi/2) q0[291];
-sx q0[291];
-rz(pi/2) q0[291];
-cx q0[121],q0[291];
-rz(-pi/4) q0[291];
-cx q0[0],q0[291];
-rz(pi/4) q0[291];
-cx q0[121],q0[291];
-rz(pi/4) q0[121];
-rz(-pi/4) q0[291];
-cx q0[0],q0[291];
-cx q0[0],q0[121];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[121];
-cx q0[0],q0[121];
-rz(3*pi/4) q0[291];
-sx q0[291];
-rz(pi/2) q0[291];
-cx q0[291],q0[121];
-rz(-pi) q0[292];
-sx q0[292];
-rz(0.98966065) q0[292];
-sx q0[292];
-cx q0[292],q0[122];
-rz(pi/2) q0[292];
-sx q0[292];
-rz(pi/2) q0[292];
-cx q0[122],q0[292];
-rz(-pi/4) q0[292];
-cx q0[0],q0[292];
-rz(pi/4) q0[292];
-cx q0[122],q0[292];
-rz(pi/4) q0[122];
-rz(-pi/4) q0[292];
-cx q0[0],q0[292];
-cx q0[0],q0[122];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[122];
-cx q0[0],q0[122];
-rz(3*pi/4) q0[292];
-sx q0[292];
-rz(pi/2) q0[292];
-cx q0[292],q0[122];
-rz(-pi) q0[293];
-sx q0[293];
-rz(0.27374895) q0[293];
-sx q0[293];
-cx q0[293],q0[123];
-rz(pi/2) q0[293];
-sx q0[293];
-rz(pi/2) q0[293];
-cx q0[123],q0[293];
-rz(-pi/4) q0[293];
-cx q0[0],q0[293];
-rz(pi/4) q0[293];
-cx q0[123],q0[293];
-rz(pi/4) q0[123];
-rz(-pi/4) q0[293];
-cx q0[0],q0[293];
-cx q0[0],q0[123];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[123];
-cx q0[0],q0[123];
-rz(3*pi/4) q0[293];
-sx q0[293];
-rz(pi/2) q0[293];
-cx q0[293],q0[123];
-rz(-pi) q0[294];
-sx q0[294];
-rz(0.078192854) q0[294];
-sx q0[294];
-cx q0[294],q0[124];
-rz(pi/2) q0[294];
-sx q0[294];
-rz(pi/2) q0[294];
-cx q0[124],q0[294];
-rz(-pi/4) q0[294];
-cx q0[0],q0[294];
-rz(pi/4) q0[294];
-cx q0[124],q0[294];
-rz(pi/4) q0[124];
-rz(-pi/4) q0[294];
-cx q0[0],q0[294];
-cx q0[0],q0[124];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[124];
-cx q0[0],q0[124];
-rz(3*pi/4) q0[294];
-sx q0[294];
-rz(pi/2) q0[294];
-cx q0[294],q0[124];
-rz(-pi) q0[295];
-sx q0[295];
-rz(2.661555) q0[295];
-sx q0[295];
-cx q0[295],q0[125];
-rz(pi/2) q0[295];
-sx q0[295];
-rz(pi/2) q0[295];
-cx q0[125],q0[295];
-rz(-pi/4) q0[295];
-cx q0[0],q0[295];
-rz(pi/4) q0[295];
-cx q0[125],q0[295];
-rz(pi/4) q0[125];
-rz(-pi/4) q0[295];
-cx q0[0],q0[295];
-cx q0[0],q0[125];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[125];
-cx q0[0],q0[125];
-rz(3*pi/4) q0[295];
-sx q0[295];
-rz(pi/2) q0[295];
-cx q0[295],q0[125];
-rz(-pi) q0[296];
-sx q0[296];
-rz(0.47444265) q0[296];
-sx q0[296];
-cx q0[296],q0[126];
-rz(pi/2) q0[296];
-sx q0[296];
-rz(pi/2) q0[296];
-cx q0[126],q0[296];
-rz(-pi/4) q0[296];
-cx q0[0],q0[296];
-rz(pi/4) q0[296];
-cx q0[126],q0[296];
-rz(pi/4) q0[126];
-rz(-pi/4) q0[296];
-cx q0[0],q0[296];
-cx q0[0],q0[126];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[126];
-cx q0[0],q0[126];
-rz(3*pi/4) q0[296];
-sx q0[296];
-rz(pi/2) q0[296];
-cx q0[296],q0[126];
-rz(-pi) q0[297];
-sx q0[297];
-rz(2.7817985) q0[297];
-sx q0[297];
-cx q0[297],q0[127];
-rz(pi/2) q0[297];
-sx q0[297];
-rz(pi/2) q0[297];
-cx q0[127],q0[297];
-rz(-pi/4) q0[297];
-cx q0[0],q0[297];
-rz(pi/4) q0[297];
-cx q0[127],q0[297];
-rz(pi/4) q0[127];
-rz(-pi/4) q0[297];
-cx q0[0],q0[297];
-cx q0[0],q0[127];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[127];
-cx q0[0],q0[127];
-rz(3*pi/4) q0[297];
-sx q0[297];
-rz(pi/2) q0[297];
-cx q0[297],q0[127];
-rz(-pi) q0[298];
-sx q0[298];
-rz(2.5725794) q0[298];
-sx q0[298];
-cx q0[298],q0[128];
-rz(pi/2) q0[298];
-sx q0[298];
-rz(pi/2) q0[298];
-cx q0[128],q0[298];
-rz(-pi/4) q0[298];
-cx q0[0],q0[298];
-rz(pi/4) q0[298];
-cx q0[128],q0[298];
-rz(pi/4) q0[128];
-rz(-pi/4) q0[298];
-cx q0[0],q0[298];
-cx q0[0],q0[128];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[128];
-cx q0[0],q0[128];
-rz(3*pi/4) q0[298];
-sx q0[298];
-rz(pi/2) q0[298];
-cx q0[298],q0[128];
-rz(-pi) q0[299];
-sx q0[299];
-rz(2.9313829) q0[299];
-sx q0[299];
-cx q0[299],q0[129];
-rz(pi/2) q0[299];
-sx q0[299];
-rz(pi/2) q0[299];
-cx q0[129],q0[299];
-rz(-pi/4) q0[299];
-cx q0[0],q0[299];
-rz(pi/4) q0[299];
-cx q0[129],q0[299];
-rz(pi/4) q0[129];
-rz(-pi/4) q0[299];
-cx q0[0],q0[299];
-cx q0[0],q0[129];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[129];
-cx q0[0],q0[129];
-rz(3*pi/4) q0[299];
-sx q0[299];
-rz(pi/2) q0[299];
-cx q0[299],q0[129];
-rz(-pi) q0[300];
-sx q0[300];
-rz(2.3424455) q0[300];
-sx q0[300];
-cx q0[300],q0[130];
-rz(pi/2) q0[300];
-sx q0[300];
-rz(pi/2) q0[300];
-cx q0[130],q0[300];
-rz(-pi/4) q0[300];
-cx q0[0],q0[300];
-rz(pi/4) q0[300];
-cx q0[130],q0[300];
-rz(pi/4) q0[130];
-rz(-pi/4) q0[300];
-cx q0[0],q0[300];
-cx q0[0],q0[130];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[130];
-cx q0[0],q0[130];
-rz(3*pi/4) q0[300];
-sx q0[300];
-rz(pi/2) q0[300];
-cx q0[300],q0[130];
-rz(-pi) q0[301];
-sx q0[301];
-rz(1.9861149) q0[301];
-sx q0[301];
-cx q0[301],q0[131];
-rz(pi/2) q0[301];
-sx q0[301];
-rz(pi/2) q0[301];
-cx q0[131],q0[301];
-rz(-pi/4) q0[301];
-cx q0[0],q0[301];
-rz(pi/4) q0[301];
-cx q0[131],q0[301];
-rz(pi/4) q0[131];
-rz(-pi/4) q0[301];
-cx q0[0],q0[301];
-cx q0[0],q0[131];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[131];
-cx q0[0],q0[131];
-rz(3*pi/4) q0[301];
-sx q0[301];
-rz(pi/2) q0[301];
-cx q0[301],q0[131];
-rz(-pi) q0[302];
-sx q0[302];
-rz(1.4008289) q0[302];
-sx q0[302];
-cx q0[302],q0[132];
-rz(pi/2) q0[302];
-sx q0[302];
-rz(pi/2) q0[302];
-cx q0[132],q0[302];
-rz(-pi/4) q0[302];
-cx q0[0],q0[302];
-rz(pi/4) q0[302];
-cx q0[132],q0[302];
-rz(pi/4) q0[132];
-rz(-pi/4) q0[302];
-cx q0[0],q0[302];
-cx q0[0],q0[132];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[132];
-cx q0[0],q0[132];
-rz(3*pi/4) q0[302];
-sx q0[302];
-rz(pi/2) q0[302];
-cx q0[302],q0[132];
-rz(-pi) q0[303];
-sx q0[303];
-rz(2.91184) q0[303];
-sx q0[303];
-cx q0[303],q0[133];
-rz(pi/2) q0[303];
-sx q0[303];
-rz(pi/2) q0[303];
-cx q0[133],q0[303];
-rz(-pi/4) q0[303];
-cx q0[0],q0[303];
-rz(pi/4) q0[303];
-cx q0[133],q0[303];
-rz(pi/4) q0[133];
-rz(-pi/4) q0[303];
-cx q0[0],q0[303];
-cx q0[0],q0[133];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[133];
-cx q0[0],q0[133];
-rz(3*pi/4) q0[303];
-sx q0[303];
-rz(pi/2) q0[303];
-cx q0[303],q0[133];
-rz(-pi) q0[304];
-sx q0[304];
-rz(2.6410185) q0[304];
-sx q0[304];
-cx q0[304],q0[134];
-rz(pi/2) q0[304];
-sx q0[304];
-rz(pi/2) q0[304];
-cx q0[134],q0[304];
-rz(-pi/4) q0[304];
-cx q0[0],q0[304];
-rz(pi/4) q0[304];
-cx q0[134],q0[304];
-rz(pi/4) q0[134];
-rz(-pi/4) q0[304];
-cx q0[0],q0[304];
-cx q0[0],q0[134];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[134];
-cx q0[0],q0[134];
-rz(3*pi/4) q0[304];
-sx q0[304];
-rz(pi/2) q0[304];
-cx q0[304],q0[134];
-rz(-pi) q0[305];
-sx q0[305];
-rz(2.7965132) q0[305];
-sx q0[305];
-cx q0[305],q0[135];
-rz(pi/2) q0[305];
-sx q0[305];
-rz(pi/2) q0[305];
-cx q0[135],q0[305];
-rz(-pi/4) q0[305];
-cx q0[0],q0[305];
-rz(pi/4) q0[305];
-cx q0[135],q0[305];
-rz(pi/4) q0[135];
-rz(-pi/4) q0[305];
-cx q0[0],q0[305];
-cx q0[0],q0[135];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[135];
-cx q0[0],q0[135];
-rz(3*pi/4) q0[305];
-sx q0[305];
-rz(pi/2) q0[305];
-cx q0[305],q0[135];
-rz(-pi) q0[306];
-sx q0[306];
-rz(2.6019429) q0[306];
-sx q0[306];
-cx q0[306],q0[136];
-rz(pi/2) q0[306];
-sx q0[306];
-rz(pi/2) q0[306];
-cx q0[136],q0[306];
-rz(-pi/4) q0[306];
-cx q0[0],q0[306];
-rz(pi/4) q0[306];
-cx q0[136],q0[306];
-rz(pi/4) q0[136];
-rz(-pi/4) q0[306];
-cx q0[0],q0[306];
-cx q0[0],q0[136];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[136];
-cx q0[0],q0[136];
-rz(3*pi/4) q0[306];
-sx q0[306];
-rz(pi/2) q0[306];
-cx q0[306],q0[136];
-rz(-pi) q0[307];
-sx q0[307];
-rz(1.4064397) q0[307];
-sx q0[307];
-cx q0[307],q0[137];
-rz(pi/2) q0[307];
-sx q0[307];
-rz(pi/2) q0[307];
-cx q0[137],q0[307];
-rz(-pi/4) q0[307];
-cx q0[0],q0[307];
-rz(pi/4) q0[307];
-cx q0[137],q0[307];
-rz(pi/4) q0[137];
-rz(-pi/4) q0[307];
-cx q0[0],q0[307];
-cx q0[0],q0[137];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[137];
-cx q0[0],q0[137];
-rz(3*pi/4) q0[307];
-sx q0[307];
-rz(pi/2) q0[307];
-cx q0[307],q0[137];
-rz(-pi) q0[308];
-sx q0[308];
-rz(1.9628215) q0[308];
-sx q0[308];
-cx q0[308],q0[138];
-rz(pi/2) q0[308];
-sx q0[308];
-rz(pi/2) q0[308];
-cx q0[138],q0[308];
-rz(-pi/4) q0[308];
-cx q0[0],q0[308];
-rz(pi/4) q0[308];
-cx q0[138],q0[308];
-rz(pi/4) q0[138];
-rz(-pi/4) q0[308];
-cx q0[0],q0[308];
-cx q0[0],q0[138];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[138];
-cx q0[0],q0[138];
-rz(3*pi/4) q0[308];
-sx q0[308];
-rz(pi/2) q0[308];
-cx q0[308],q0[138];
-rz(-pi) q0[309];
-sx q0[309];
-rz(2.6434723) q0[309];
-sx q0[309];
-cx q0[309],q0[139];
-rz(pi/2) q0[309];
-sx q0[309];
-rz(pi/2) q0[309];
-cx q0[139],q0[309];
-rz(-pi/4) q0[309];
-cx q0[0],q0[309];
-rz(pi/4) q0[309];
-cx q0[139],q0[309];
-rz(pi/4) q0[139];
-rz(-pi/4) q0[309];
-cx q0[0],q0[309];
-cx q0[0],q0[139];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[139];
-cx q0[0],q0[139];
-rz(3*pi/4) q0[309];
-sx q0[309];
-rz(pi/2) q0[309];
-cx q0[309],q0[139];
-rz(-pi) q0[310];
-sx q0[310];
-rz(1.225695) q0[310];
-sx q0[310];
-cx q0[310],q0[140];
-rz(pi/2) q0[310];
-sx q0[310];
-rz(pi/2) q0[310];
-cx q0[140],q0[310];
-rz(-pi/4) q0[310];
-cx q0[0],q0[310];
-rz(pi/4) q0[310];
-cx q0[140],q0[310];
-rz(pi/4) q0[140];
-rz(-pi/4) q0[310];
-cx q0[0],q0[310];
-cx q0[0],q0[140];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[140];
-cx q0[0],q0[140];
-rz(3*pi/4) q0[310];
-sx q0[310];
-rz(pi/2) q0[310];
-cx q0[310],q0[140];
-rz(-pi) q0[311];
-sx q0[311];
-rz(0.52265545) q0[311];
-sx q0[311];
-cx q0[311],q0[141];
-rz(pi/2) q0[311];
-sx q0[311];
-rz(pi/2) q0[311];
-cx q0[141],q0[311];
-rz(-pi/4) q0[311];
-cx q0[0],q0[311];
-rz(pi/4) q0[311];
-cx q0[141],q0[311];
-rz(pi/4) q0[141];
-rz(-pi/4) q0[311];
-cx q0[0],q0[311];
-cx q0[0],q0[141];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[141];
-cx q0[0],q0[141];
-rz(3*pi/4) q0[311];
-sx q0[311];
-rz(pi/2) q0[311];
-cx q0[311],q0[141];
-rz(-pi) q0[312];
-sx q0[312];
-rz(0.35962525) q0[312];
-sx q0[312];
-cx q0[312],q0[142];
-rz(pi/2) q0[312];
-sx q0[312];
-rz(pi/2) q0[312];
-cx q0[142],q0[312];
-rz(-pi/4) q0[312];
-cx q0[0],q0[312];
-rz(pi/4) q0[312];
-cx q0[142],q0[312];
-rz(pi/4) q0[142];
-rz(-pi/4) q0[312];
-cx q0[0],q0[312];
-cx q0[0],q0[142];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[142];
-cx q0[0],q0[142];
-rz(3*pi/4) q0[312];
-sx q0[312];
-rz(pi/2) q0[312];
-cx q0[312],q0[142];
-rz(-pi) q0[313];
-sx q0[313];
-rz(1.6619161) q0[313];
-sx q0[313];
-cx q0[313],q0[143];
-rz(pi/2) q0[313];
-sx q0[313];
-rz(pi/2) q0[313];
-cx q0[143],q0[313];
-rz(-pi/4) q0[313];
-cx q0[0],q0[313];
-rz(pi/4) q0[313];
-cx q0[143],q0[313];
-rz(pi/4) q0[143];
-rz(-pi/4) q0[313];
-cx q0[0],q0[313];
-cx q0[0],q0[143];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[143];
-cx q0[0],q0[143];
-rz(3*pi/4) q0[313];
-sx q0[313];
-rz(pi/2) q0[313];
-cx q0[313],q0[143];
-rz(-pi) q0[314];
-sx q0[314];
-rz(0.84693895) q0[314];
-sx q0[314];
-cx q0[314],q0[144];
-rz(pi/2) q0[314];
-sx q0[314];
-rz(pi/2) q0[314];
-cx q0[144],q0[314];
-rz(-pi/4) q0[314];
-cx q0[0],q0[314];
-rz(pi/4) q0[314];
-cx q0[144],q0[314];
-rz(pi/4) q0[144];
-rz(-pi/4) q0[314];
-cx q0[0],q0[314];
-cx q0[0],q0[144];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[144];
-cx q0[0],q0[144];
-rz(3*pi/4) q0[314];
-sx q0[314];
-rz(pi/2) q0[314];
-cx q0[314],q0[144];
-rz(-pi) q0[315];
-sx q0[315];
-rz(2.8324105) q0[315];
-sx q0[315];
-cx q0[315],q0[145];
-rz(pi/2) q0[315];
-sx q0[315];
-rz(pi/2) q0[315];
-cx q0[145],q0[315];
-rz(-pi/4) q0[315];
-cx q0[0],q0[315];
-rz(pi/4) q0[315];
-cx q0[145],q0[315];
-rz(pi/4) q0[145];
-rz(-pi/4) q0[315];
-cx q0[0],q0[315];
-cx q0[0],q0[145];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[145];
-cx q0[0],q0[145];
-rz(3*pi/4) q0[315];
-sx q0[315];
-rz(pi/2) q0[315];
-cx q0[315],q0[145];
-rz(-pi) q0[316];
-sx q0[316];
-rz(1.2438349) q0[316];
-sx q0[316];
-cx q0[316],q0[146];
-rz(pi/2) q0[316];
-sx q0[316];
-rz(pi/2) q0[316];
-cx q0[146],q0[316];
-rz(-pi/4) q0[316];
-cx q0[0],q0[316];
-rz(pi/4) q0[316];
-cx q0[146],q0[316];
-rz(pi/4) q0[146];
-rz(-pi/4) q0[316];
-cx q0[0],q0[316];
-cx q0[0],q0[146];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[146];
-cx q0[0],q0[146];
-rz(3*pi/4) q0[316];
-sx q0[316];
-rz(pi/2) q0[316];
-cx q0[316],q0[146];
-rz(-pi) q0[317];
-sx q0[317];
-rz(2.1251956) q0[317];
-sx q0[317];
-cx q0[317],q0[147];
-rz(pi/2) q0[317];
-sx q0[317];
-rz(pi/2) q0[317];
-cx q0[147],q0[317];
-rz(-pi/4) q0[317];
-cx q0[0],q0[317];
-rz(pi/4) q0[317];
-cx q0[147],q0[317];
-rz(pi/4) q0[147];
-rz(-pi/4) q0[317];
-cx q0[0],q0[317];
-cx q0[0],q0[147];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[147];
-cx q0[0],q0[147];
-rz(3*pi/4) q0[317];
-sx q0[317];
-rz(pi/2) q0[317];
-cx q0[317],q0[147];
-rz(-pi) q0[318];
-sx q0[318];
-rz(0.19403245) q0[318];
-sx q0[318];
-cx q0[318],q0[148];
-rz(pi/2) q0[318];
-sx q0[318];
-rz(pi/2) q0[318];
-cx q0[148],q0[318];
-rz(-pi/4) q0[318];
-cx q0[0],q0[318];
-rz(pi/4) q0[318];
-cx q0[148],q0[318];
-rz(pi/4) q0[148];
-rz(-pi/4) q0[318];
-cx q0[0],q0[318];
-cx q0[0],q0[148];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[148];
-cx q0[0],q0[148];
-rz(3*pi/4) q0[318];
-sx q0[318];
-rz(pi/2) q0[318];
-cx q0[318],q0[148];
-rz(-pi) q0[319];
-sx q0[319];
-rz(0.43206395) q0[319];
-sx q0[319];
-cx q0[319],q0[149];
-rz(pi/2) q0[319];
-sx q0[319];
-rz(pi/2) q0[319];
-cx q0[149],q0[319];
-rz(-pi/4) q0[319];
-cx q0[0],q0[319];
-rz(pi/4) q0[319];
-cx q0[149],q0[319];
-rz(pi/4) q0[149];
-rz(-pi/4) q0[319];
-cx q0[0],q0[319];
-cx q0[0],q0[149];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[149];
-cx q0[0],q0[149];
-rz(3*pi/4) q0[319];
-sx q0[319];
-rz(pi/2) q0[319];
-cx q0[319],q0[149];
-rz(-pi) q0[320];
-sx q0[320];
-rz(0.26623315) q0[320];
-sx q0[320];
-cx q0[320],q0[150];
-rz(pi/2) q0[320];
-sx q0[320];
-rz(pi/2) q0[320];
-cx q0[150],q0[320];
-rz(-pi/4) q0[320];
-cx q0[0],q0[320];
-rz(pi/4) q0[320];
-cx q0[150],q0[320];
-rz(pi/4) q0[150];
-rz(-pi/4) q0[320];
-cx q0[0],q0[320];
-cx q0[0],q0[150];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[150];
-cx q0[0],q0[150];
-rz(3*pi/4) q0[320];
-sx q0[320];
-rz(pi/2) q0[320];
-cx q0[320],q0[150];
-rz(-pi) q0[321];
-sx q0[321];
-rz(2.9535845) q0[321];
-sx q0[321];
-cx q0[321],q0[151];
-rz(pi/2) q0[321];
-sx q0[321];
-rz(pi/2) q0[321];
-cx q0[151],q0[321];
-rz(-pi/4) q0[321];
-cx q0[0],q0[321];
-rz(pi/4) q0[321];
-cx q0[151],q0[321];
-rz(pi/4) q0[151];
-rz(-pi/4) q0[321];
-cx q0[0],q0[321];
-cx q0[0],q0[151];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[151];
-cx q0[0],q0[151];
-rz(3*pi/4) q0[321];
-sx q0[321];
-rz(pi/2) q0[321];
-cx q0[321],q0[151];
-rz(-pi) q0[322];
-sx q0[322];
-rz(3.0187264) q0[322];
-sx q0[322];
-cx q0[322],q0[152];
-rz(pi/2) q0[322];
-sx q0[322];
-rz(pi/2) q0[322];
-cx q0[152],q0[322];
-rz(-pi/4) q0[322];
-cx q0[0],q0[322];
-rz(pi/4) q0[322];
-cx q0[152],q0[322];
-rz(pi/4) q0[152];
-rz(-pi/4) q0[322];
-cx q0[0],q0[322];
-cx q0[0],q0[152];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[152];
-cx q0[0],q0[152];
-rz(3*pi/4) q0[322];
-sx q0[322];
-rz(pi/2) q0[322];
-cx q0[322],q0[152];
-rz(-pi) q0[323];
-sx q0[323];
-rz(2.1080933) q0[323];
-sx q0[323];
-cx q0[323],q0[153];
-rz(pi/2) q0[323];
-sx q0[323];
-rz(pi/2) q0[323];
-cx q0[153],q0[323];
-rz(-pi/4) q0[323];
-cx q0[0],q0[323];
-rz(pi/4) q0[323];
-cx q0[153],q0[323];
-rz(pi/4) q0[153];
-rz(-pi/4) q0[323];
-cx q0[0],q0[323];
-cx q0[0],q0[153];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[153];
-cx q0[0],q0[153];
-rz(3*pi/4) q0[323];
-sx q0[323];
-rz(pi/2) q0[323];
-cx q0[323],q0[153];
-rz(-pi) q0[324];
-sx q0[324];
-rz(1.1467539) q0[324];
-sx q0[324];
-cx q0[324],q0[154];
-rz(pi/2) q0[324];
-sx q0[324];
-rz(pi/2) q0[324];
-cx q0[154],q0[324];
-rz(-pi/4) q0[324];
-cx q0[0],q0[324];
-rz(pi/4) q0[324];
-cx q0[154],q0[324];
-rz(pi/4) q0[154];
-rz(-pi/4) q0[324];
-cx q0[0],q0[324];
-cx q0[0],q0[154];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[154];
-cx q0[0],q0[154];
-rz(3*pi/4) q0[324];
-sx q0[324];
-rz(pi/2) q0[324];
-cx q0[324],q0[154];
-rz(-pi) q0[325];
-sx q0[325];
-rz(2.4029205) q0[325];
-sx q0[325];
-cx q0[325],q0[155];
-rz(pi/2) q0[325];
-sx q0[325];
-rz(pi/2) q0[325];
-cx q0[155],q0[325];
-rz(-pi/4) q0[325];
-cx q0[0],q0[325];
-rz(pi/4) q0[325];
-cx q0[155],q0[325];
-rz(pi/4) q0[155];
-rz(-pi/4) q0[325];
-cx q0[0],q0[325];
-cx q0[0],q0[155];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[155];
-cx q0[0],q0[155];
-rz(3*pi/4) q0[325];
-sx q0[325];
-rz(pi/2) q0[325];
-cx q0[325],q0[155];
-rz(-pi) q0[326];
-sx q0[326];
-rz(0.63654775) q0[326];
-sx q0[326];
-cx q0[326],q0[156];
-rz(pi/2) q0[326];
-sx q0[326];
-rz(pi/2) q0[326];
-cx q0[156],q0[326];
-rz(-pi/4) q0[326];
-cx q0[0],q0[326];
-rz(pi/4) q0[326];
-cx q0[156],q0[326];
-rz(pi/4) q0[156];
-rz(-pi/4) q0[326];
-cx q0[0],q0[326];
-cx q0[0],q0[156];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[156];
-cx q0[0],q0[156];
-rz(3*pi/4) q0[326];
-sx q0[326];
-rz(pi/2) q0[326];
-cx q0[326],q0[156];
-rz(-pi) q0[327];
-sx q0[327];
-rz(2.7485315) q0[327];
-sx q0[327];
-cx q0[327],q0[157];
-rz(pi/2) q0[327];
-sx q0[327];
-rz(pi/2) q0[327];
-cx q0[157],q0[327];
-rz(-pi/4) q0[327];
-cx q0[0],q0[327];
-rz(pi/4) q0[327];
-cx q0[157],q0[327];
-rz(pi/4) q0[157];
-rz(-pi/4) q0[327];
-cx q0[0],q0[327];
-cx q0[0],q0[157];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[157];
-cx q0[0],q0[157];
-rz(3*pi/4) q0[327];
-sx q0[327];
-rz(pi/2) q0[327];
-cx q0[327],q0[157];
-rz(-pi) q0[328];
-sx q0[328];
-rz(2.4554849) q0[328];
-sx q0[328];
-cx q0[328],q0[158];
-rz(pi/2) q0[328];
-sx q0[328];
-rz(pi/2) q0[328];
-cx q0[158],q0[328];
-rz(-pi/4) q0[328];
-cx q0[0],q0[328];
-rz(pi/4) q0[328];
-cx q0[158],q0[328];
-rz(pi/4) q0[158];
-rz(-pi/4) q0[328];
-cx q0[0],q0[328];
-cx q0[0],q0[158];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[158];
-cx q0[0],q0[158];
-rz(3*pi/4) q0[328];
-sx q0[328];
-rz(pi/2) q0[328];
-cx q0[328],q0[158];
-rz(-pi) q0[329];
-sx q0[329];
-rz(0.46246795) q0[329];
-sx q0[329];
-cx q0[329],q0[159];
-rz(pi/2) q0[329];
-sx q0[329];
-rz(pi/2) q0[329];
-cx q0[159],q0[329];
-rz(-pi/4) q0[329];
-cx q0[0],q0[329];
-rz(pi/4) q0[329];
-cx q0[159],q0[329];
-rz(pi/4) q0[159];
-rz(-pi/4) q0[329];
-cx q0[0],q0[329];
-cx q0[0],q0[159];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[159];
-cx q0[0],q0[159];
-rz(3*pi/4) q0[329];
-sx q0[329];
-rz(pi/2) q0[329];
-cx q0[329],q0[159];
-rz(-pi) q0[330];
-sx q0[330];
-rz(1.6911048) q0[330];
-sx q0[330];
-cx q0[330],q0[160];
-rz(pi/2) q0[330];
-sx q0[330];
-rz(pi/2) q0[330];
-cx q0[160],q0[330];
-rz(-pi/4) q0[330];
-cx q0[0],q0[330];
-rz(pi/4) q0[330];
-cx q0[160],q0[330];
-rz(pi/4) q0[160];
-rz(-pi/4) q0[330];
-cx q0[0],q0[330];
-cx q0[0],q0[160];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[160];
-cx q0[0],q0[160];
-rz(3*pi/4) q0[330];
-sx q0[330];
-rz(pi/2) q0[330];
-cx q0[330],q0[160];
-rz(-pi) q0[331];
-sx q0[331];
-rz(0.97224255) q0[331];
-sx q0[331];
-cx q0[331],q0[161];
-rz(pi/2) q0[331];
-sx q0[331];
-rz(pi/2) q0[331];
-cx q0[161],q0[331];
-rz(-pi/4) q0[331];
-cx q0[0],q0[331];
-rz(pi/4) q0[331];
-cx q0[161],q0[331];
-rz(pi/4) q0[161];
-rz(-pi/4) q0[331];
-cx q0[0],q0[331];
-cx q0[0],q0[161];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[161];
-cx q0[0],q0[161];
-rz(3*pi/4) q0[331];
-sx q0[331];
-rz(pi/2) q0[331];
-cx q0[331],q0[161];
-rz(-pi) q0[332];
-sx q0[332];
-rz(0.80709755) q0[332];
-sx q0[332];
-cx q0[332],q0[162];
-rz(pi/2) q0[332];
-sx q0[332];
-rz(pi/2) q0[332];
-cx q0[162],q0[332];
-rz(-pi/4) q0[332];
-cx q0[0],q0[332];
-rz(pi/4) q0[332];
-cx q0[162],q0[332];
-rz(pi/4) q0[162];
-rz(-pi/4) q0[332];
-cx q0[0],q0[332];
-cx q0[0],q0[162];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[162];
-cx q0[0],q0[162];
-rz(3*pi/4) q0[332];
-sx q0[332];
-rz(pi/2) q0[332];
-cx q0[332],q0[162];
-rz(-pi) q0[333];
-sx q0[333];
-rz(2.1140795) q0[333];
-sx q0[333];
-cx q0[333],q0[163];
-rz(pi/2) q0[333];
-sx q0[333];
-rz(pi/2) q0[333];
-cx q0[163],q0[333];
-rz(-pi/4) q0[333];
-cx q0[0],q0[333];
-rz(pi/4) q0[333];
-cx q0[163],q0[333];
-rz(pi/4) q0[163];
-rz(-pi/4) q0[333];
-cx q0[0],q0[333];
-cx q0[0],q0[163];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[163];
-cx q0[0],q0[163];
-rz(3*pi/4) q0[333];
-sx q0[333];
-rz(pi/2) q0[333];
-cx q0[333],q0[163];
-rz(-pi) q0[334];
-sx q0[334];
-rz(0.71408215) q0[334];
-sx q0[334];
-cx q0[334],q0[164];
-rz(pi/2) q0[334];
-sx q0[334];
-rz(pi/2) q0[334];
-cx q0[164],q0[334];
-rz(-pi/4) q0[334];
-cx q0[0],q0[334];
-rz(pi/4) q0[334];
-cx q0[164],q0[334];
-rz(pi/4) q0[164];
-rz(-pi/4) q0[334];
-cx q0[0],q0[334];
-cx q0[0],q0[164];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[164];
-cx q0[0],q0[164];
-rz(3*pi/4) q0[334];
-sx q0[334];
-rz(pi/2) q0[334];
-cx q0[334],q0[164];
-rz(-pi) q0[335];
-sx q0[335];
-rz(2.8735079) q0[335];
-sx q0[335];
-cx q0[335],q0[165];
-rz(pi/2) q0[335];
-sx q0[335];
-rz(pi/2) q0[335];
-cx q0[165],q0[335];
-rz(-pi/4) q0[335];
-cx q0[0],q0[335];
-rz(pi/4) q0[335];
-cx q0[165],q0[335];
-rz(pi/4) q0[165];
-rz(-pi/4) q0[335];
-cx q0[0],q0[335];
-cx q0[0],q0[165];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[165];
-cx q0[0],q0[165];
-rz(3*pi/4) q0[335];
-sx q0[335];
-rz(pi/2) q0[335];
-cx q0[335],q0[165];
-rz(-pi) q0[336];
-sx q0[336];
-rz(2.9918262) q0[336];
-sx q0[336];
-cx q0[336],q0[166];
-rz(pi/2) q0[336];
-sx q0[336];
-rz(pi/2) q0[336];
-cx q0[166],q0[336];
-rz(-pi/4) q0[336];
-cx q0[0],q0[336];
-rz(pi/4) q0[336];
-cx q0[166],q0[336];
-rz(pi/4) q0[166];
-rz(-pi/4) q0[336];
-cx q0[0],q0[336];
-cx q0[0],q0[166];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[166];
-cx q0[0],q0[166];
-rz(3*pi/4) q0[336];
-sx q0[336];
-rz(pi/2) q0[336];
-cx q0[336],q0[166];
-rz(-pi) q0[337];
-sx q0[337];
-rz(1.3555634) q0[337];
-sx q0[337];
-cx q0[337],q0[167];
-rz(pi/2) q0[337];
-sx q0[337];
-rz(pi/2) q0[337];
-cx q0[167],q0[337];
-rz(-pi/4) q0[337];
-cx q0[0],q0[337];
-rz(pi/4) q0[337];
-cx q0[167],q0[337];
-rz(pi/4) q0[167];
-rz(-pi/4) q0[337];
-cx q0[0],q0[337];
-cx q0[0],q0[167];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[167];
-cx q0[0],q0[167];
-rz(3*pi/4) q0[337];
-sx q0[337];
-rz(pi/2) q0[337];
-cx q0[337],q0[167];
-rz(-pi) q0[338];
-sx q0[338];
-rz(1.7888566) q0[338];
-sx q0[338];
-cx q0[338],q0[168];
-rz(pi/2) q0[338];
-sx q0[338];
-rz(pi/2) q0[338];
-cx q0[168],q0[338];
-rz(-pi/4) q0[338];
-cx q0[0],q0[338];
-rz(pi/4) q0[338];
-cx q0[168],q0[338];
-rz(pi/4) q0[168];
-rz(-pi/4) q0[338];
-cx q0[0],q0[338];
-cx q0[0],q0[168];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[168];
-cx q0[0],q0[168];
-rz(3*pi/4) q0[338];
-sx q0[338];
-rz(pi/2) q0[338];
-cx q0[338],q0[168];
-rz(-pi) q0[339];
-sx q0[339];
-rz(1.7983153) q0[339];
-sx q0[339];
-cx q0[339],q0[169];
-rz(pi/2) q0[339];
-sx q0[339];
-rz(pi/2) q0[339];
-cx q0[169],q0[339];
-rz(-pi/4) q0[339];
-cx q0[0],q0[339];
-rz(pi/4) q0[339];
-cx q0[169],q0[339];
-rz(pi/4) q0[169];
-rz(-pi/4) q0[339];
-cx q0[0],q0[339];
-cx q0[0],q0[169];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[169];
-cx q0[0],q0[169];
-rz(3*pi/4) q0[339];
-sx q0[339];
-rz(pi/2) q0[339];
-cx q0[339],q0[169];
-rz(-pi) q0[340];
-sx q0[340];
-rz(2.2072061) q0[340];
-sx q0[340];
-cx q0[340],q0[170];
-rz(pi/2) q0[340];
-sx q0[340];
-rz(pi/2) q0[340];
-cx q0[170],q0[340];
-rz(-pi/4) q0[340];
-cx q0[0],q0[340];
-rz(pi/4) q0[340];
-cx q0[170],q0[340];
-rz(pi/4) q0[170];
-rz(-pi/4) q0[340];
-cx q0[0],q0[340];
-cx q0[0],q0[170];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[170];
-cx q0[0],q0[170];
-rz(pi/2) q0[0];
-sx q0[0];
-rz(pi/2) q0[0];
-rz(3*pi/4) q0[340];
-sx q0[340];
-rz(pi/2) q0[340];
-cx q0[340],q0[170];
-measure q0[0] -> c0[0];
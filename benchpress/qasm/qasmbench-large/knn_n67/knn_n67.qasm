@@ -1,106 +0,0 @@
-OPENQASM 2.0;
-include "qelib1.inc";
-qreg q0[67];
-creg c0[1];
-ry(1.0216052) q0[1];
-ry(0.17719301) q0[2];
-ry(0.24588507) q0[3];
-ry(0.37370494) q0[4];
-ry(1.4768661) q0[5];
-ry(0.16671369) q0[6];
-ry(0.9491252) q0[7];
-ry(0.37784193) q0[8];
-ry(1.5826519) q0[9];
-ry(2.7424682) q0[10];
-ry(1.0124638) q0[11];
-ry(1.4430258) q0[12];
-ry(0.81486447) q0[13];
-ry(0.08090016) q0[14];
-ry(1.2381135) q0[15];
-ry(2.7090431) q0[16];
-ry(0.62681728) q0[17];
-ry(0.180255) q0[18];
-ry(0.3562704) q0[19];
-ry(1.6811896) q0[20];
-ry(0.49450826) q0[21];
-ry(2.6190251) q0[22];
-ry(1.9273021) q0[23];
-ry(3.1265083) q0[24];
-ry(2.7946929) q0[25];
-ry(1.9317877) q0[26];
-ry(1.5658948) q0[27];
-ry(2.5615343) q0[28];
-ry(2.0910421) q0[29];
-ry(2.4998465) q0[30];
-ry(0.65986808) q0[31];
-ry(2.5207021) q0[32];
-ry(0.45824064) q0[33];
-ry(0.65188372) q0[34];
-ry(1.155186) q0[35];
-ry(0.031178344) q0[36];
-ry(1.7420384) q0[37];
-ry(2.6823614) q0[38];
-ry(1.5717159) q0[39];
-ry(0.13445193) q0[40];
-ry(3.068889) q0[41];
-ry(2.2010306) q0[42];
-ry(0.048202599) q0[43];
-ry(0.253312) q0[44];
-ry(1.3434136) q0[45];
-ry(1.4116241) q0[46];
-ry(1.8461468) q0[47];
-ry(1.2492772) q0[48];
-ry(1.0558707) q0[49];
-ry(2.5872282) q0[50];
-ry(2.100958) q0[51];
-ry(1.5567563) q0[52];
-ry(2.2942923) q0[53];
-ry(2.1228061) q0[54];
-ry(1.7337043) q0[55];
-ry(0.1312711) q0[56];
-ry(0.43798466) q0[57];
-ry(0.11191333) q0[58];
-ry(1.2904501) q0[59];
-ry(2.6272207) q0[60];
-ry(1.6072071) q0[61];
-ry(2.6210302) q0[62];
-ry(2.7907392) q0[63];
-ry(0.95214449) q0[64];
-ry(1.0337337) q0[65];
-ry(1.7423345) q0[66];
-h q0[0];
-cswap q0[0],q0[1],q0[34];
-cswap q0[0],q0[2],q0[35];
-cswap q0[0],q0[3],q0[36];
-cswap q0[0],q0[4],q0[37];
-cswap q0[0],q0[5],q0[38];
-cswap q0[0],q0[6],q0[39];
-cswap q0[0],q0[7],q0[40];
-cswap q0[0],q0[8],q0[41];
-cswap q0[0],q0[9],q0[42];
-cswap q0[0],q0[10],q0[43];
-cswap q0[0],q0[11],q0[44];
-cswap q0[0],q0[12],q0[45];
-cswap q0[0],q0[13],q0[46];
-cswap q0[0],q0[14],q0[47];
-cswap q0[0],q0[15],q0[48];
-cswap q0[0],q0[16],q0[49];
-cswap q0[0],q0[17],q0[50];
-cswap q0[0],q0[18],q0[51];
-cswap q0[0],q0[19],q0[52];
-cswap q0[0],q0[20],q0[53];
-cswap q0[0],q0[21],q0[54];
-cswap q0[0],q0[22],q0[55];
-cswap q0[0],q0[23],q0[56];
-cswap q0[0],q0[24],q0[57];
-cswap q0[0],q0[25],q0[58];
-cswap q0[0],q0[26],q0[59];
-cswap q0[0],q0[27],q0[60];
-cswap q0[0],q0[28],q0[61];
-cswap q0[0],q0[29],q0[62];
-cswap q0[0],q0[30],q0[63];
-cswap q0[0],q0[31],q0[64];
-cswap q0[0],q0[32],q0[65];
-cswap q0[0],q0[33],q0[66];
-h q0[0];
-measure q0[0] -> c0[0];
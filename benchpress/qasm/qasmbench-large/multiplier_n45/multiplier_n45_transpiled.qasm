@@ -1,5584 +0,0 @@
-OPENQASM 2.0;
-include "qelib1.inc";
-qreg q0[45];
-creg c0[9];
-rz(pi/2) q0[1];
-sx q0[1];
-rz(pi/2) q0[1];
-rz(pi/2) q0[3];
-sx q0[3];
-rz(pi/2) q0[3];
-cx q0[2],q0[3];
-rz(-pi/4) q0[3];
-rz(pi/2) q0[4];
-sx q0[4];
-rz(pi/2) q0[4];
-rz(pi/2) q0[6];
-sx q0[6];
-rz(pi/2) q0[6];
-cx q0[5],q0[6];
-rz(-pi/4) q0[6];
-rz(pi/2) q0[7];
-sx q0[7];
-rz(pi/2) q0[7];
-rz(pi/2) q0[9];
-sx q0[9];
-rz(pi/2) q0[9];
-cx q0[8],q0[9];
-rz(-pi/4) q0[9];
-rz(pi/2) q0[10];
-sx q0[10];
-rz(pi/2) q0[10];
-rz(pi/2) q0[12];
-sx q0[12];
-rz(pi/2) q0[12];
-cx q0[11],q0[12];
-rz(-pi/4) q0[12];
-rz(pi/2) q0[13];
-sx q0[13];
-rz(pi/2) q0[13];
-rz(pi/2) q0[15];
-sx q0[15];
-rz(pi/2) q0[15];
-cx q0[14],q0[15];
-rz(-pi/4) q0[15];
-rz(pi/2) q0[16];
-sx q0[16];
-rz(pi/2) q0[16];
-rz(pi/2) q0[18];
-sx q0[18];
-rz(pi/2) q0[18];
-cx q0[17],q0[18];
-rz(-pi/4) q0[18];
-rz(pi/2) q0[19];
-sx q0[19];
-rz(pi/2) q0[19];
-rz(pi/2) q0[21];
-sx q0[21];
-rz(pi/2) q0[21];
-cx q0[20],q0[21];
-rz(-pi/4) q0[21];
-rz(pi/2) q0[22];
-sx q0[22];
-rz(pi/2) q0[22];
-rz(pi/2) q0[24];
-sx q0[24];
-rz(pi/2) q0[24];
-cx q0[23],q0[24];
-rz(-pi/4) q0[24];
-rz(pi/2) q0[25];
-sx q0[25];
-rz(pi/2) q0[25];
-cx q0[27],q0[1];
-rz(-pi/4) q0[1];
-x q0[28];
-cx q0[28],q0[4];
-rz(-pi/4) q0[4];
-x q0[29];
-cx q0[29],q0[7];
-rz(-pi/4) q0[7];
-x q0[30];
-cx q0[30],q0[10];
-rz(-pi/4) q0[10];
-cx q0[31],q0[13];
-rz(-pi/4) q0[13];
-cx q0[32],q0[16];
-rz(-pi/4) q0[16];
-cx q0[33],q0[19];
-rz(-pi/4) q0[19];
-cx q0[34],q0[22];
-rz(-pi/4) q0[22];
-cx q0[35],q0[25];
-rz(-pi/4) q0[25];
-cx q0[36],q0[1];
-rz(pi/4) q0[1];
-cx q0[27],q0[1];
-rz(-pi/4) q0[1];
-rz(pi/4) q0[27];
-cx q0[36],q0[1];
-rz(3*pi/4) q0[1];
-sx q0[1];
-rz(pi/2) q0[1];
-cx q0[1],q0[3];
-rz(pi/4) q0[3];
-cx q0[2],q0[3];
-rz(pi/4) q0[2];
-rz(-pi/4) q0[3];
-cx q0[1],q0[3];
-cx q0[1],q0[2];
-rz(pi/4) q0[1];
-rz(-pi/4) q0[2];
-rz(pi/4) q0[3];
-cx q0[2],q0[3];
-rz(-pi/4) q0[3];
-cx q0[0],q0[3];
-rz(pi/4) q0[3];
-cx q0[2],q0[3];
-rz(pi/4) q0[2];
-rz(-pi/4) q0[3];
-cx q0[0],q0[3];
-cx q0[0],q0[2];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[2];
-cx q0[0],q0[2];
-rz(3*pi/4) q0[3];
-sx q0[3];
-rz(pi/2) q0[3];
-cx q0[36],q0[27];
-rz(-pi/4) q0[27];
-rz(pi/4) q0[36];
-cx q0[36],q0[27];
-cx q0[36],q0[4];
-rz(pi/4) q0[4];
-cx q0[28],q0[4];
-rz(pi/4) q0[28];
-rz(-pi/4) q0[4];
-cx q0[36],q0[4];
-cx q0[36],q0[28];
-rz(-pi/4) q0[28];
-rz(pi/4) q0[36];
-cx q0[36],q0[28];
-cx q0[36],q0[7];
-rz(3*pi/4) q0[4];
-sx q0[4];
-rz(pi/2) q0[4];
-cx q0[4],q0[6];
-rz(pi/4) q0[6];
-cx q0[5],q0[6];
-rz(pi/4) q0[5];
-rz(-pi/4) q0[6];
-cx q0[4],q0[6];
-cx q0[4],q0[5];
-rz(pi/4) q0[4];
-rz(-pi/4) q0[5];
-rz(pi/4) q0[6];
-cx q0[5],q0[6];
-rz(-pi/4) q0[6];
-cx q0[3],q0[6];
-rz(pi/4) q0[6];
-cx q0[5],q0[6];
-rz(pi/4) q0[5];
-rz(-pi/4) q0[6];
-cx q0[3],q0[6];
-cx q0[3],q0[5];
-rz(pi/4) q0[3];
-rz(-pi/4) q0[5];
-cx q0[3],q0[5];
-rz(3*pi/4) q0[6];
-sx q0[6];
-rz(pi/2) q0[6];
-rz(pi/4) q0[7];
-cx q0[29],q0[7];
-rz(pi/4) q0[29];
-rz(-pi/4) q0[7];
-cx q0[36],q0[7];
-cx q0[36],q0[29];
-rz(-pi/4) q0[29];
-rz(pi/4) q0[36];
-cx q0[36],q0[29];
-cx q0[36],q0[10];
-rz(pi/4) q0[10];
-cx q0[30],q0[10];
-rz(-pi/4) q0[10];
-rz(pi/4) q0[30];
-cx q0[36],q0[10];
-rz(3*pi/4) q0[10];
-sx q0[10];
-rz(pi/2) q0[10];
-cx q0[10],q0[12];
-rz(pi/4) q0[12];
-cx q0[11],q0[12];
-rz(pi/4) q0[11];
-rz(-pi/4) q0[12];
-cx q0[10],q0[12];
-cx q0[10],q0[11];
-rz(pi/4) q0[10];
-rz(-pi/4) q0[11];
-rz(pi/4) q0[12];
-cx q0[11],q0[12];
-rz(-pi/4) q0[12];
-cx q0[36],q0[30];
-rz(-pi/4) q0[30];
-rz(pi/4) q0[36];
-cx q0[36],q0[30];
-cx q0[36],q0[13];
-rz(pi/4) q0[13];
-cx q0[31],q0[13];
-rz(-pi/4) q0[13];
-rz(pi/4) q0[31];
-cx q0[36],q0[13];
-rz(3*pi/4) q0[13];
-sx q0[13];
-rz(pi/2) q0[13];
-cx q0[13],q0[15];
-rz(pi/4) q0[15];
-cx q0[14],q0[15];
-rz(pi/4) q0[14];
-rz(-pi/4) q0[15];
-cx q0[13],q0[15];
-cx q0[13],q0[14];
-rz(pi/4) q0[13];
-rz(-pi/4) q0[14];
-rz(pi/4) q0[15];
-cx q0[14],q0[15];
-rz(-pi/4) q0[15];
-cx q0[36],q0[31];
-rz(-pi/4) q0[31];
-rz(pi/4) q0[36];
-cx q0[36],q0[31];
-cx q0[36],q0[16];
-rz(pi/4) q0[16];
-cx q0[32],q0[16];
-rz(-pi/4) q0[16];
-rz(pi/4) q0[32];
-cx q0[36],q0[16];
-rz(3*pi/4) q0[16];
-sx q0[16];
-rz(pi/2) q0[16];
-cx q0[16],q0[18];
-rz(pi/4) q0[18];
-cx q0[17],q0[18];
-rz(pi/4) q0[17];
-rz(-pi/4) q0[18];
-cx q0[16],q0[18];
-cx q0[16],q0[17];
-rz(pi/4) q0[16];
-rz(-pi/4) q0[17];
-rz(pi/4) q0[18];
-cx q0[17],q0[18];
-rz(-pi/4) q0[18];
-cx q0[36],q0[32];
-rz(-pi/4) q0[32];
-rz(pi/4) q0[36];
-cx q0[36],q0[32];
-cx q0[36],q0[19];
-rz(pi/4) q0[19];
-cx q0[33],q0[19];
-rz(-pi/4) q0[19];
-rz(pi/4) q0[33];
-cx q0[36],q0[19];
-rz(3*pi/4) q0[19];
-sx q0[19];
-rz(pi/2) q0[19];
-cx q0[19],q0[21];
-rz(pi/4) q0[21];
-cx q0[20],q0[21];
-rz(pi/4) q0[20];
-rz(-pi/4) q0[21];
-cx q0[19],q0[21];
-cx q0[19],q0[20];
-rz(pi/4) q0[19];
-rz(-pi/4) q0[20];
-rz(pi/4) q0[21];
-cx q0[20],q0[21];
-rz(-pi/4) q0[21];
-cx q0[36],q0[33];
-rz(-pi/4) q0[33];
-rz(pi/4) q0[36];
-cx q0[36],q0[33];
-cx q0[36],q0[22];
-rz(pi/4) q0[22];
-cx q0[34],q0[22];
-rz(-pi/4) q0[22];
-rz(pi/4) q0[34];
-cx q0[36],q0[22];
-rz(3*pi/4) q0[22];
-sx q0[22];
-rz(pi/2) q0[22];
-cx q0[22],q0[24];
-rz(pi/4) q0[24];
-cx q0[23],q0[24];
-rz(pi/4) q0[23];
-rz(-pi/4) q0[24];
-cx q0[22],q0[24];
-cx q0[22],q0[23];
-rz(pi/4) q0[22];
-rz(-pi/4) q0[23];
-rz(pi/4) q0[24];
-cx q0[23],q0[24];
-rz(-pi/4) q0[24];
-cx q0[36],q0[34];
-rz(-pi/4) q0[34];
-rz(pi/4) q0[36];
-cx q0[36],q0[34];
-cx q0[36],q0[25];
-rz(pi/4) q0[25];
-cx q0[35],q0[25];
-rz(-pi/4) q0[25];
-rz(pi/4) q0[35];
-cx q0[36],q0[25];
-rz(3*pi/4) q0[25];
-sx q0[25];
-rz(pi/2) q0[25];
-cx q0[25],q0[26];
-rz(pi/2) q0[25];
-sx q0[25];
-rz(pi/2) q0[25];
-cx q0[36],q0[35];
-rz(-pi/4) q0[35];
-rz(pi/4) q0[36];
-cx q0[36],q0[35];
-cx q0[35],q0[25];
-rz(-pi/4) q0[25];
-rz(3*pi/4) q0[7];
-sx q0[7];
-rz(pi/2) q0[7];
-cx q0[7],q0[9];
-rz(pi/4) q0[9];
-cx q0[8],q0[9];
-rz(pi/4) q0[8];
-rz(-pi/4) q0[9];
-cx q0[7],q0[9];
-cx q0[7],q0[8];
-rz(pi/4) q0[7];
-rz(-pi/4) q0[8];
-rz(pi/4) q0[9];
-cx q0[8],q0[9];
-rz(-pi/4) q0[9];
-cx q0[6],q0[9];
-rz(pi/4) q0[9];
-cx q0[8],q0[9];
-rz(pi/4) q0[8];
-rz(-pi/4) q0[9];
-cx q0[6],q0[9];
-cx q0[6],q0[8];
-rz(pi/4) q0[6];
-rz(-pi/4) q0[8];
-cx q0[6],q0[8];
-rz(3*pi/4) q0[9];
-sx q0[9];
-rz(pi/2) q0[9];
-cx q0[9],q0[12];
-rz(pi/4) q0[12];
-cx q0[11],q0[12];
-rz(pi/4) q0[11];
-rz(-pi/4) q0[12];
-cx q0[9],q0[12];
-rz(3*pi/4) q0[12];
-sx q0[12];
-rz(pi/2) q0[12];
-cx q0[12],q0[15];
-rz(pi/4) q0[15];
-cx q0[14],q0[15];
-rz(pi/4) q0[14];
-rz(-pi/4) q0[15];
-cx q0[12],q0[15];
-cx q0[12],q0[14];
-rz(pi/4) q0[12];
-rz(-pi/4) q0[14];
-cx q0[12],q0[14];
-rz(3*pi/4) q0[15];
-sx q0[15];
-rz(pi/2) q0[15];
-cx q0[15],q0[18];
-rz(pi/4) q0[18];
-cx q0[17],q0[18];
-rz(pi/4) q0[17];
-rz(-pi/4) q0[18];
-cx q0[15],q0[18];
-cx q0[15],q0[17];
-rz(pi/4) q0[15];
-rz(-pi/4) q0[17];
-cx q0[15],q0[17];
-rz(3*pi/4) q0[18];
-sx q0[18];
-rz(pi/2) q0[18];
-cx q0[18],q0[21];
-rz(pi/4) q0[21];
-cx q0[20],q0[21];
-rz(pi/4) q0[20];
-rz(-pi/4) q0[21];
-cx q0[18],q0[21];
-cx q0[18],q0[20];
-rz(pi/4) q0[18];
-rz(-pi/4) q0[20];
-cx q0[18],q0[20];
-rz(3*pi/4) q0[21];
-sx q0[21];
-rz(pi/2) q0[21];
-cx q0[21],q0[24];
-rz(pi/4) q0[24];
-cx q0[23],q0[24];
-rz(pi/4) q0[23];
-rz(-pi/4) q0[24];
-cx q0[21],q0[24];
-cx q0[21],q0[23];
-rz(pi/4) q0[21];
-rz(-pi/4) q0[23];
-cx q0[21],q0[23];
-rz(3*pi/4) q0[24];
-sx q0[24];
-rz(pi/2) q0[24];
-cx q0[24],q0[26];
-rz(pi/2) q0[24];
-sx q0[24];
-rz(pi/2) q0[24];
-cx q0[23],q0[24];
-rz(-pi/4) q0[24];
-cx q0[21],q0[24];
-rz(pi/4) q0[24];
-cx q0[23],q0[24];
-rz(pi/4) q0[23];
-rz(-pi/4) q0[24];
-cx q0[21],q0[24];
-cx q0[21],q0[23];
-rz(pi/4) q0[21];
-rz(-pi/4) q0[23];
-cx q0[21],q0[23];
-cx q0[22],q0[23];
-rz(pi/4) q0[24];
-cx q0[23],q0[24];
-rz(-pi/4) q0[24];
-cx q0[22],q0[24];
-rz(pi/4) q0[24];
-cx q0[23],q0[24];
-rz(pi/4) q0[23];
-rz(-pi/4) q0[24];
-cx q0[22],q0[24];
-cx q0[22],q0[23];
-rz(3*pi/4) q0[22];
-sx q0[22];
-rz(pi/2) q0[22];
-rz(-pi/4) q0[23];
-cx q0[21],q0[23];
-rz(pi/2) q0[21];
-sx q0[21];
-rz(pi/2) q0[21];
-cx q0[20],q0[21];
-rz(-pi/4) q0[21];
-cx q0[18],q0[21];
-rz(pi/4) q0[21];
-cx q0[20],q0[21];
-rz(pi/4) q0[20];
-rz(-pi/4) q0[21];
-cx q0[18],q0[21];
-cx q0[18],q0[20];
-rz(pi/4) q0[18];
-rz(-pi/4) q0[20];
-cx q0[18],q0[20];
-cx q0[19],q0[20];
-rz(pi/4) q0[21];
-cx q0[20],q0[21];
-rz(-pi/4) q0[21];
-cx q0[19],q0[21];
-rz(pi/4) q0[21];
-cx q0[20],q0[21];
-rz(pi/4) q0[20];
-rz(-pi/4) q0[21];
-cx q0[19],q0[21];
-cx q0[19],q0[20];
-rz(3*pi/4) q0[19];
-sx q0[19];
-rz(pi/2) q0[19];
-rz(-pi/4) q0[20];
-cx q0[18],q0[20];
-rz(pi/2) q0[18];
-sx q0[18];
-rz(pi/2) q0[18];
-cx q0[17],q0[18];
-rz(-pi/4) q0[18];
-cx q0[15],q0[18];
-rz(pi/4) q0[18];
-cx q0[17],q0[18];
-rz(pi/4) q0[17];
-rz(-pi/4) q0[18];
-cx q0[15],q0[18];
-cx q0[15],q0[17];
-rz(pi/4) q0[15];
-rz(-pi/4) q0[17];
-cx q0[15],q0[17];
-cx q0[16],q0[17];
-rz(pi/4) q0[18];
-cx q0[17],q0[18];
-rz(-pi/4) q0[18];
-cx q0[16],q0[18];
-rz(pi/4) q0[18];
-cx q0[17],q0[18];
-rz(pi/4) q0[17];
-rz(-pi/4) q0[18];
-cx q0[16],q0[18];
-cx q0[16],q0[17];
-rz(3*pi/4) q0[16];
-sx q0[16];
-rz(pi/2) q0[16];
-rz(-pi/4) q0[17];
-cx q0[15],q0[17];
-rz(pi/2) q0[15];
-sx q0[15];
-rz(pi/2) q0[15];
-cx q0[14],q0[15];
-rz(-pi/4) q0[15];
-cx q0[12],q0[15];
-rz(pi/4) q0[15];
-cx q0[14],q0[15];
-rz(pi/4) q0[14];
-rz(-pi/4) q0[15];
-cx q0[12],q0[15];
-cx q0[12],q0[14];
-rz(pi/4) q0[12];
-rz(-pi/4) q0[14];
-cx q0[12],q0[14];
-cx q0[13],q0[14];
-rz(pi/4) q0[15];
-cx q0[14],q0[15];
-rz(-pi/4) q0[15];
-cx q0[13],q0[15];
-rz(pi/4) q0[15];
-cx q0[14],q0[15];
-rz(pi/4) q0[14];
-rz(-pi/4) q0[15];
-cx q0[13],q0[15];
-cx q0[13],q0[14];
-rz(3*pi/4) q0[13];
-sx q0[13];
-rz(pi/2) q0[13];
-rz(-pi/4) q0[14];
-cx q0[12],q0[14];
-rz(pi/2) q0[12];
-sx q0[12];
-rz(pi/2) q0[12];
-rz(pi/4) q0[15];
-cx q0[14],q0[15];
-rz(-pi/4) q0[15];
-rz(pi/4) q0[18];
-cx q0[17],q0[18];
-rz(-pi/4) q0[18];
-rz(pi/4) q0[21];
-cx q0[20],q0[21];
-rz(-pi/4) q0[21];
-rz(pi/4) q0[24];
-cx q0[23],q0[24];
-rz(-pi/4) q0[24];
-cx q0[31],q0[13];
-rz(-pi/4) q0[13];
-cx q0[32],q0[16];
-rz(-pi/4) q0[16];
-cx q0[33],q0[19];
-rz(-pi/4) q0[19];
-cx q0[34],q0[22];
-rz(-pi/4) q0[22];
-cx q0[9],q0[11];
-rz(-pi/4) q0[11];
-rz(pi/4) q0[9];
-cx q0[9],q0[11];
-cx q0[11],q0[12];
-rz(-pi/4) q0[12];
-cx q0[9],q0[12];
-rz(pi/4) q0[12];
-cx q0[11],q0[12];
-rz(pi/4) q0[11];
-rz(-pi/4) q0[12];
-cx q0[9],q0[12];
-rz(pi/4) q0[12];
-cx q0[9],q0[11];
-rz(-pi/4) q0[11];
-rz(pi/4) q0[9];
-cx q0[9],q0[11];
-cx q0[10],q0[11];
-cx q0[11],q0[12];
-rz(-pi/4) q0[12];
-cx q0[10],q0[12];
-rz(pi/4) q0[12];
-cx q0[11],q0[12];
-rz(pi/4) q0[11];
-rz(-pi/4) q0[12];
-cx q0[10],q0[12];
-cx q0[10],q0[11];
-rz(3*pi/4) q0[10];
-sx q0[10];
-rz(pi/2) q0[10];
-rz(-pi/4) q0[11];
-rz(pi/4) q0[12];
-cx q0[30],q0[10];
-rz(-pi/4) q0[10];
-cx q0[9],q0[11];
-cx q0[11],q0[12];
-rz(-pi/4) q0[12];
-rz(pi/2) q0[9];
-sx q0[9];
-rz(pi/2) q0[9];
-cx q0[8],q0[9];
-rz(-pi/4) q0[9];
-cx q0[6],q0[9];
-rz(pi/4) q0[9];
-cx q0[8],q0[9];
-rz(pi/4) q0[8];
-rz(-pi/4) q0[9];
-cx q0[6],q0[9];
-cx q0[6],q0[8];
-rz(pi/4) q0[6];
-rz(-pi/4) q0[8];
-cx q0[6],q0[8];
-cx q0[7],q0[8];
-rz(pi/4) q0[9];
-cx q0[8],q0[9];
-rz(-pi/4) q0[9];
-cx q0[7],q0[9];
-rz(pi/4) q0[9];
-cx q0[8],q0[9];
-rz(pi/4) q0[8];
-rz(-pi/4) q0[9];
-cx q0[7],q0[9];
-cx q0[7],q0[8];
-rz(3*pi/4) q0[7];
-sx q0[7];
-rz(pi/2) q0[7];
-cx q0[29],q0[7];
-rz(-pi/4) q0[7];
-rz(-pi/4) q0[8];
-cx q0[6],q0[8];
-rz(pi/2) q0[6];
-sx q0[6];
-rz(pi/2) q0[6];
-cx q0[5],q0[6];
-rz(-pi/4) q0[6];
-cx q0[3],q0[6];
-rz(pi/4) q0[6];
-cx q0[5],q0[6];
-rz(pi/4) q0[5];
-rz(-pi/4) q0[6];
-cx q0[3],q0[6];
-cx q0[3],q0[5];
-rz(pi/4) q0[3];
-rz(-pi/4) q0[5];
-cx q0[3],q0[5];
-cx q0[4],q0[5];
-rz(pi/4) q0[6];
-cx q0[5],q0[6];
-rz(-pi/4) q0[6];
-cx q0[4],q0[6];
-rz(pi/4) q0[6];
-cx q0[5],q0[6];
-rz(pi/4) q0[5];
-rz(-pi/4) q0[6];
-cx q0[4],q0[6];
-cx q0[4],q0[5];
-rz(3*pi/4) q0[4];
-sx q0[4];
-rz(pi/2) q0[4];
-cx q0[28],q0[4];
-rz(-pi/4) q0[4];
-rz(-pi/4) q0[5];
-cx q0[3],q0[5];
-rz(pi/2) q0[3];
-sx q0[3];
-rz(pi/2) q0[3];
-cx q0[2],q0[3];
-rz(-pi/4) q0[3];
-cx q0[0],q0[3];
-rz(pi/4) q0[3];
-cx q0[2],q0[3];
-rz(pi/4) q0[2];
-rz(-pi/4) q0[3];
-cx q0[0],q0[3];
-cx q0[0],q0[2];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[2];
-cx q0[0],q0[2];
-cx q0[1],q0[2];
-rz(pi/4) q0[3];
-cx q0[2],q0[3];
-rz(-pi/4) q0[3];
-cx q0[1],q0[3];
-rz(pi/4) q0[3];
-cx q0[2],q0[3];
-rz(pi/4) q0[2];
-rz(-pi/4) q0[3];
-cx q0[1],q0[3];
-cx q0[1],q0[2];
-rz(3*pi/4) q0[1];
-sx q0[1];
-rz(pi/2) q0[1];
-rz(-pi/4) q0[2];
-cx q0[0],q0[2];
-cx q0[27],q0[1];
-rz(-pi/4) q0[1];
-rz(pi/4) q0[3];
-cx q0[2],q0[3];
-rz(-pi/4) q0[3];
-cx q0[36],q0[1];
-rz(pi/4) q0[1];
-cx q0[27],q0[1];
-rz(-pi/4) q0[1];
-rz(pi/4) q0[27];
-cx q0[36],q0[1];
-rz(3*pi/4) q0[1];
-sx q0[1];
-rz(pi/2) q0[1];
-cx q0[1],q0[3];
-rz(pi/4) q0[3];
-cx q0[2],q0[3];
-rz(pi/4) q0[2];
-rz(-pi/4) q0[3];
-cx q0[1],q0[3];
-cx q0[1],q0[2];
-rz(pi/4) q0[1];
-rz(-pi/4) q0[2];
-rz(pi/4) q0[3];
-cx q0[2],q0[3];
-rz(-pi/4) q0[3];
-cx q0[0],q0[3];
-rz(pi/4) q0[3];
-cx q0[2],q0[3];
-rz(pi/4) q0[2];
-rz(-pi/4) q0[3];
-cx q0[0],q0[3];
-cx q0[0],q0[2];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[2];
-cx q0[0],q0[2];
-rz(3*pi/4) q0[3];
-sx q0[3];
-rz(pi/2) q0[3];
-cx q0[36],q0[27];
-rz(-pi/4) q0[27];
-rz(pi/4) q0[36];
-cx q0[36],q0[27];
-cx q0[36],q0[4];
-rz(pi/4) q0[4];
-cx q0[28],q0[4];
-rz(pi/4) q0[28];
-rz(-pi/4) q0[4];
-cx q0[36],q0[4];
-cx q0[36],q0[28];
-rz(-pi/4) q0[28];
-rz(pi/4) q0[36];
-cx q0[36],q0[28];
-cx q0[36],q0[7];
-rz(pi/4) q0[4];
-cx q0[27],q0[4];
-rz(-pi/4) q0[4];
-rz(pi/4) q0[6];
-cx q0[5],q0[6];
-rz(-pi/4) q0[6];
-rz(pi/4) q0[7];
-cx q0[29],q0[7];
-rz(pi/4) q0[29];
-rz(-pi/4) q0[7];
-cx q0[36],q0[7];
-cx q0[36],q0[29];
-rz(-pi/4) q0[29];
-rz(pi/4) q0[36];
-cx q0[36],q0[29];
-cx q0[36],q0[10];
-rz(pi/4) q0[10];
-cx q0[30],q0[10];
-rz(-pi/4) q0[10];
-rz(pi/4) q0[30];
-cx q0[36],q0[10];
-rz(pi/4) q0[10];
-cx q0[29],q0[10];
-rz(-pi/4) q0[10];
-cx q0[36],q0[30];
-rz(-pi/4) q0[30];
-rz(pi/4) q0[36];
-cx q0[36],q0[30];
-cx q0[36],q0[13];
-rz(pi/4) q0[13];
-cx q0[31],q0[13];
-rz(-pi/4) q0[13];
-rz(pi/4) q0[31];
-cx q0[36],q0[13];
-rz(pi/4) q0[13];
-cx q0[30],q0[13];
-rz(-pi/4) q0[13];
-cx q0[36],q0[31];
-rz(-pi/4) q0[31];
-rz(pi/4) q0[36];
-cx q0[36],q0[31];
-cx q0[36],q0[16];
-rz(pi/4) q0[16];
-cx q0[32],q0[16];
-rz(-pi/4) q0[16];
-rz(pi/4) q0[32];
-cx q0[36],q0[16];
-rz(pi/4) q0[16];
-cx q0[31],q0[16];
-rz(-pi/4) q0[16];
-cx q0[36],q0[32];
-rz(-pi/4) q0[32];
-rz(pi/4) q0[36];
-cx q0[36],q0[32];
-cx q0[36],q0[19];
-rz(pi/4) q0[19];
-cx q0[33],q0[19];
-rz(-pi/4) q0[19];
-rz(pi/4) q0[33];
-cx q0[36],q0[19];
-rz(pi/4) q0[19];
-cx q0[32],q0[19];
-rz(-pi/4) q0[19];
-cx q0[36],q0[33];
-rz(-pi/4) q0[33];
-rz(pi/4) q0[36];
-cx q0[36],q0[33];
-cx q0[36],q0[22];
-rz(pi/4) q0[22];
-cx q0[34],q0[22];
-rz(-pi/4) q0[22];
-rz(pi/4) q0[34];
-cx q0[36],q0[22];
-rz(pi/4) q0[22];
-cx q0[33],q0[22];
-rz(-pi/4) q0[22];
-cx q0[36],q0[34];
-rz(-pi/4) q0[34];
-rz(pi/4) q0[36];
-cx q0[36],q0[34];
-cx q0[36],q0[25];
-rz(pi/4) q0[25];
-cx q0[35],q0[25];
-rz(-pi/4) q0[25];
-rz(pi/4) q0[35];
-cx q0[36],q0[25];
-rz(pi/4) q0[25];
-cx q0[34],q0[25];
-rz(-pi/4) q0[25];
-cx q0[36],q0[35];
-rz(-pi/4) q0[35];
-rz(pi/4) q0[36];
-cx q0[36],q0[35];
-rz(pi/4) q0[7];
-cx q0[28],q0[7];
-rz(-pi/4) q0[7];
-rz(pi/4) q0[9];
-cx q0[8],q0[9];
-rz(-pi/4) q0[9];
-x q0[37];
-cx q0[37],q0[4];
-rz(pi/4) q0[4];
-cx q0[27],q0[4];
-rz(pi/4) q0[27];
-rz(-pi/4) q0[4];
-cx q0[37],q0[4];
-cx q0[37],q0[27];
-rz(-pi/4) q0[27];
-rz(pi/4) q0[37];
-cx q0[37],q0[27];
-cx q0[37],q0[7];
-rz(3*pi/4) q0[4];
-sx q0[4];
-rz(pi/2) q0[4];
-cx q0[4],q0[6];
-rz(pi/4) q0[6];
-cx q0[5],q0[6];
-rz(pi/4) q0[5];
-rz(-pi/4) q0[6];
-cx q0[4],q0[6];
-cx q0[4],q0[5];
-rz(pi/4) q0[4];
-rz(-pi/4) q0[5];
-rz(pi/4) q0[6];
-cx q0[5],q0[6];
-rz(-pi/4) q0[6];
-cx q0[3],q0[6];
-rz(pi/4) q0[6];
-cx q0[5],q0[6];
-rz(pi/4) q0[5];
-rz(-pi/4) q0[6];
-cx q0[3],q0[6];
-cx q0[3],q0[5];
-rz(pi/4) q0[3];
-rz(-pi/4) q0[5];
-cx q0[3],q0[5];
-rz(3*pi/4) q0[6];
-sx q0[6];
-rz(pi/2) q0[6];
-rz(pi/4) q0[7];
-cx q0[28],q0[7];
-rz(pi/4) q0[28];
-rz(-pi/4) q0[7];
-cx q0[37],q0[7];
-cx q0[37],q0[28];
-rz(-pi/4) q0[28];
-rz(pi/4) q0[37];
-cx q0[37],q0[28];
-cx q0[37],q0[10];
-rz(pi/4) q0[10];
-cx q0[29],q0[10];
-rz(-pi/4) q0[10];
-rz(pi/4) q0[29];
-cx q0[37],q0[10];
-rz(3*pi/4) q0[10];
-sx q0[10];
-rz(pi/2) q0[10];
-cx q0[10],q0[12];
-rz(pi/4) q0[12];
-cx q0[11],q0[12];
-rz(pi/4) q0[11];
-rz(-pi/4) q0[12];
-cx q0[10],q0[12];
-cx q0[10],q0[11];
-rz(pi/4) q0[10];
-rz(-pi/4) q0[11];
-rz(pi/4) q0[12];
-cx q0[11],q0[12];
-rz(-pi/4) q0[12];
-cx q0[37],q0[29];
-rz(-pi/4) q0[29];
-rz(pi/4) q0[37];
-cx q0[37],q0[29];
-cx q0[37],q0[13];
-rz(pi/4) q0[13];
-cx q0[30],q0[13];
-rz(-pi/4) q0[13];
-rz(pi/4) q0[30];
-cx q0[37],q0[13];
-rz(3*pi/4) q0[13];
-sx q0[13];
-rz(pi/2) q0[13];
-cx q0[13],q0[15];
-rz(pi/4) q0[15];
-cx q0[14],q0[15];
-rz(pi/4) q0[14];
-rz(-pi/4) q0[15];
-cx q0[13],q0[15];
-cx q0[13],q0[14];
-rz(pi/4) q0[13];
-rz(-pi/4) q0[14];
-rz(pi/4) q0[15];
-cx q0[14],q0[15];
-rz(-pi/4) q0[15];
-cx q0[37],q0[30];
-rz(-pi/4) q0[30];
-rz(pi/4) q0[37];
-cx q0[37],q0[30];
-cx q0[37],q0[16];
-rz(pi/4) q0[16];
-cx q0[31],q0[16];
-rz(-pi/4) q0[16];
-rz(pi/4) q0[31];
-cx q0[37],q0[16];
-rz(3*pi/4) q0[16];
-sx q0[16];
-rz(pi/2) q0[16];
-cx q0[16],q0[18];
-rz(pi/4) q0[18];
-cx q0[17],q0[18];
-rz(pi/4) q0[17];
-rz(-pi/4) q0[18];
-cx q0[16],q0[18];
-cx q0[16],q0[17];
-rz(pi/4) q0[16];
-rz(-pi/4) q0[17];
-rz(pi/4) q0[18];
-cx q0[17],q0[18];
-rz(-pi/4) q0[18];
-cx q0[37],q0[31];
-rz(-pi/4) q0[31];
-rz(pi/4) q0[37];
-cx q0[37],q0[31];
-cx q0[37],q0[19];
-rz(pi/4) q0[19];
-cx q0[32],q0[19];
-rz(-pi/4) q0[19];
-rz(pi/4) q0[32];
-cx q0[37],q0[19];
-rz(3*pi/4) q0[19];
-sx q0[19];
-rz(pi/2) q0[19];
-cx q0[19],q0[21];
-rz(pi/4) q0[21];
-cx q0[20],q0[21];
-rz(pi/4) q0[20];
-rz(-pi/4) q0[21];
-cx q0[19],q0[21];
-cx q0[19],q0[20];
-rz(pi/4) q0[19];
-rz(-pi/4) q0[20];
-rz(pi/4) q0[21];
-cx q0[20],q0[21];
-rz(-pi/4) q0[21];
-cx q0[37],q0[32];
-rz(-pi/4) q0[32];
-rz(pi/4) q0[37];
-cx q0[37],q0[32];
-cx q0[37],q0[22];
-rz(pi/4) q0[22];
-cx q0[33],q0[22];
-rz(-pi/4) q0[22];
-rz(pi/4) q0[33];
-cx q0[37],q0[22];
-rz(3*pi/4) q0[22];
-sx q0[22];
-rz(pi/2) q0[22];
-cx q0[22],q0[24];
-rz(pi/4) q0[24];
-cx q0[23],q0[24];
-rz(pi/4) q0[23];
-rz(-pi/4) q0[24];
-cx q0[22],q0[24];
-cx q0[22],q0[23];
-rz(pi/4) q0[22];
-rz(-pi/4) q0[23];
-rz(pi/4) q0[24];
-cx q0[23],q0[24];
-rz(-pi/4) q0[24];
-cx q0[37],q0[33];
-rz(-pi/4) q0[33];
-rz(pi/4) q0[37];
-cx q0[37],q0[33];
-cx q0[37],q0[25];
-rz(pi/4) q0[25];
-cx q0[34],q0[25];
-rz(-pi/4) q0[25];
-rz(pi/4) q0[34];
-cx q0[37],q0[25];
-rz(3*pi/4) q0[25];
-sx q0[25];
-rz(pi/2) q0[25];
-cx q0[25],q0[26];
-rz(pi/2) q0[25];
-sx q0[25];
-rz(pi/2) q0[25];
-cx q0[37],q0[34];
-rz(-pi/4) q0[34];
-rz(pi/4) q0[37];
-cx q0[37],q0[34];
-cx q0[34],q0[25];
-rz(-pi/4) q0[25];
-rz(3*pi/4) q0[7];
-sx q0[7];
-rz(pi/2) q0[7];
-cx q0[7],q0[9];
-rz(pi/4) q0[9];
-cx q0[8],q0[9];
-rz(pi/4) q0[8];
-rz(-pi/4) q0[9];
-cx q0[7],q0[9];
-cx q0[7],q0[8];
-rz(pi/4) q0[7];
-rz(-pi/4) q0[8];
-rz(pi/4) q0[9];
-cx q0[8],q0[9];
-rz(-pi/4) q0[9];
-cx q0[6],q0[9];
-rz(pi/4) q0[9];
-cx q0[8],q0[9];
-rz(pi/4) q0[8];
-rz(-pi/4) q0[9];
-cx q0[6],q0[9];
-cx q0[6],q0[8];
-rz(pi/4) q0[6];
-rz(-pi/4) q0[8];
-cx q0[6],q0[8];
-rz(3*pi/4) q0[9];
-sx q0[9];
-rz(pi/2) q0[9];
-cx q0[9],q0[12];
-rz(pi/4) q0[12];
-cx q0[11],q0[12];
-rz(pi/4) q0[11];
-rz(-pi/4) q0[12];
-cx q0[9],q0[12];
-rz(3*pi/4) q0[12];
-sx q0[12];
-rz(pi/2) q0[12];
-cx q0[12],q0[15];
-rz(pi/4) q0[15];
-cx q0[14],q0[15];
-rz(pi/4) q0[14];
-rz(-pi/4) q0[15];
-cx q0[12],q0[15];
-cx q0[12],q0[14];
-rz(pi/4) q0[12];
-rz(-pi/4) q0[14];
-cx q0[12],q0[14];
-rz(3*pi/4) q0[15];
-sx q0[15];
-rz(pi/2) q0[15];
-cx q0[15],q0[18];
-rz(pi/4) q0[18];
-cx q0[17],q0[18];
-rz(pi/4) q0[17];
-rz(-pi/4) q0[18];
-cx q0[15],q0[18];
-cx q0[15],q0[17];
-rz(pi/4) q0[15];
-rz(-pi/4) q0[17];
-cx q0[15],q0[17];
-rz(3*pi/4) q0[18];
-sx q0[18];
-rz(pi/2) q0[18];
-cx q0[18],q0[21];
-rz(pi/4) q0[21];
-cx q0[20],q0[21];
-rz(pi/4) q0[20];
-rz(-pi/4) q0[21];
-cx q0[18],q0[21];
-cx q0[18],q0[20];
-rz(pi/4) q0[18];
-rz(-pi/4) q0[20];
-cx q0[18],q0[20];
-rz(3*pi/4) q0[21];
-sx q0[21];
-rz(pi/2) q0[21];
-cx q0[21],q0[24];
-rz(pi/4) q0[24];
-cx q0[23],q0[24];
-rz(pi/4) q0[23];
-rz(-pi/4) q0[24];
-cx q0[21],q0[24];
-cx q0[21],q0[23];
-rz(pi/4) q0[21];
-rz(-pi/4) q0[23];
-cx q0[21],q0[23];
-rz(3*pi/4) q0[24];
-sx q0[24];
-rz(pi/2) q0[24];
-cx q0[24],q0[26];
-rz(pi/2) q0[24];
-sx q0[24];
-rz(pi/2) q0[24];
-cx q0[23],q0[24];
-rz(-pi/4) q0[24];
-cx q0[21],q0[24];
-rz(pi/4) q0[24];
-cx q0[23],q0[24];
-rz(pi/4) q0[23];
-rz(-pi/4) q0[24];
-cx q0[21],q0[24];
-cx q0[21],q0[23];
-rz(pi/4) q0[21];
-rz(-pi/4) q0[23];
-cx q0[21],q0[23];
-cx q0[22],q0[23];
-rz(pi/4) q0[24];
-cx q0[23],q0[24];
-rz(-pi/4) q0[24];
-cx q0[22],q0[24];
-rz(pi/4) q0[24];
-cx q0[23],q0[24];
-rz(pi/4) q0[23];
-rz(-pi/4) q0[24];
-cx q0[22],q0[24];
-cx q0[22],q0[23];
-rz(3*pi/4) q0[22];
-sx q0[22];
-rz(pi/2) q0[22];
-rz(-pi/4) q0[23];
-cx q0[21],q0[23];
-rz(pi/2) q0[21];
-sx q0[21];
-rz(pi/2) q0[21];
-cx q0[20],q0[21];
-rz(-pi/4) q0[21];
-cx q0[18],q0[21];
-rz(pi/4) q0[21];
-cx q0[20],q0[21];
-rz(pi/4) q0[20];
-rz(-pi/4) q0[21];
-cx q0[18],q0[21];
-cx q0[18],q0[20];
-rz(pi/4) q0[18];
-rz(-pi/4) q0[20];
-cx q0[18],q0[20];
-cx q0[19],q0[20];
-rz(pi/4) q0[21];
-cx q0[20],q0[21];
-rz(-pi/4) q0[21];
-cx q0[19],q0[21];
-rz(pi/4) q0[21];
-cx q0[20],q0[21];
-rz(pi/4) q0[20];
-rz(-pi/4) q0[21];
-cx q0[19],q0[21];
-cx q0[19],q0[20];
-rz(3*pi/4) q0[19];
-sx q0[19];
-rz(pi/2) q0[19];
-rz(-pi/4) q0[20];
-cx q0[18],q0[20];
-rz(pi/2) q0[18];
-sx q0[18];
-rz(pi/2) q0[18];
-cx q0[17],q0[18];
-rz(-pi/4) q0[18];
-cx q0[15],q0[18];
-rz(pi/4) q0[18];
-cx q0[17],q0[18];
-rz(pi/4) q0[17];
-rz(-pi/4) q0[18];
-cx q0[15],q0[18];
-cx q0[15],q0[17];
-rz(pi/4) q0[15];
-rz(-pi/4) q0[17];
-cx q0[15],q0[17];
-cx q0[16],q0[17];
-rz(pi/4) q0[18];
-cx q0[17],q0[18];
-rz(-pi/4) q0[18];
-cx q0[16],q0[18];
-rz(pi/4) q0[18];
-cx q0[17],q0[18];
-rz(pi/4) q0[17];
-rz(-pi/4) q0[18];
-cx q0[16],q0[18];
-cx q0[16],q0[17];
-rz(3*pi/4) q0[16];
-sx q0[16];
-rz(pi/2) q0[16];
-rz(-pi/4) q0[17];
-cx q0[15],q0[17];
-rz(pi/2) q0[15];
-sx q0[15];
-rz(pi/2) q0[15];
-cx q0[14],q0[15];
-rz(-pi/4) q0[15];
-cx q0[12],q0[15];
-rz(pi/4) q0[15];
-cx q0[14],q0[15];
-rz(pi/4) q0[14];
-rz(-pi/4) q0[15];
-cx q0[12],q0[15];
-cx q0[12],q0[14];
-rz(pi/4) q0[12];
-rz(-pi/4) q0[14];
-cx q0[12],q0[14];
-cx q0[13],q0[14];
-rz(pi/4) q0[15];
-cx q0[14],q0[15];
-rz(-pi/4) q0[15];
-cx q0[13],q0[15];
-rz(pi/4) q0[15];
-cx q0[14],q0[15];
-rz(pi/4) q0[14];
-rz(-pi/4) q0[15];
-cx q0[13],q0[15];
-cx q0[13],q0[14];
-rz(3*pi/4) q0[13];
-sx q0[13];
-rz(pi/2) q0[13];
-rz(-pi/4) q0[14];
-cx q0[12],q0[14];
-rz(pi/2) q0[12];
-sx q0[12];
-rz(pi/2) q0[12];
-rz(pi/4) q0[15];
-cx q0[14],q0[15];
-rz(-pi/4) q0[15];
-rz(pi/4) q0[18];
-cx q0[17],q0[18];
-rz(-pi/4) q0[18];
-rz(pi/4) q0[21];
-cx q0[20],q0[21];
-rz(-pi/4) q0[21];
-rz(pi/4) q0[24];
-cx q0[23],q0[24];
-rz(-pi/4) q0[24];
-cx q0[30],q0[13];
-rz(-pi/4) q0[13];
-cx q0[31],q0[16];
-rz(-pi/4) q0[16];
-cx q0[32],q0[19];
-rz(-pi/4) q0[19];
-cx q0[33],q0[22];
-rz(-pi/4) q0[22];
-cx q0[9],q0[11];
-rz(-pi/4) q0[11];
-rz(pi/4) q0[9];
-cx q0[9],q0[11];
-cx q0[11],q0[12];
-rz(-pi/4) q0[12];
-cx q0[9],q0[12];
-rz(pi/4) q0[12];
-cx q0[11],q0[12];
-rz(pi/4) q0[11];
-rz(-pi/4) q0[12];
-cx q0[9],q0[12];
-rz(pi/4) q0[12];
-cx q0[9],q0[11];
-rz(-pi/4) q0[11];
-rz(pi/4) q0[9];
-cx q0[9],q0[11];
-cx q0[10],q0[11];
-cx q0[11],q0[12];
-rz(-pi/4) q0[12];
-cx q0[10],q0[12];
-rz(pi/4) q0[12];
-cx q0[11],q0[12];
-rz(pi/4) q0[11];
-rz(-pi/4) q0[12];
-cx q0[10],q0[12];
-cx q0[10],q0[11];
-rz(3*pi/4) q0[10];
-sx q0[10];
-rz(pi/2) q0[10];
-rz(-pi/4) q0[11];
-rz(pi/4) q0[12];
-cx q0[29],q0[10];
-rz(-pi/4) q0[10];
-cx q0[9],q0[11];
-cx q0[11],q0[12];
-rz(-pi/4) q0[12];
-rz(pi/2) q0[9];
-sx q0[9];
-rz(pi/2) q0[9];
-cx q0[8],q0[9];
-rz(-pi/4) q0[9];
-cx q0[6],q0[9];
-rz(pi/4) q0[9];
-cx q0[8],q0[9];
-rz(pi/4) q0[8];
-rz(-pi/4) q0[9];
-cx q0[6],q0[9];
-cx q0[6],q0[8];
-rz(pi/4) q0[6];
-rz(-pi/4) q0[8];
-cx q0[6],q0[8];
-cx q0[7],q0[8];
-rz(pi/4) q0[9];
-cx q0[8],q0[9];
-rz(-pi/4) q0[9];
-cx q0[7],q0[9];
-rz(pi/4) q0[9];
-cx q0[8],q0[9];
-rz(pi/4) q0[8];
-rz(-pi/4) q0[9];
-cx q0[7],q0[9];
-cx q0[7],q0[8];
-rz(3*pi/4) q0[7];
-sx q0[7];
-rz(pi/2) q0[7];
-cx q0[28],q0[7];
-rz(-pi/4) q0[7];
-rz(-pi/4) q0[8];
-cx q0[6],q0[8];
-rz(pi/2) q0[6];
-sx q0[6];
-rz(pi/2) q0[6];
-cx q0[5],q0[6];
-rz(-pi/4) q0[6];
-cx q0[3],q0[6];
-rz(pi/4) q0[6];
-cx q0[5],q0[6];
-rz(pi/4) q0[5];
-rz(-pi/4) q0[6];
-cx q0[3],q0[6];
-cx q0[3],q0[5];
-rz(pi/4) q0[3];
-rz(-pi/4) q0[5];
-cx q0[3],q0[5];
-cx q0[4],q0[5];
-rz(pi/4) q0[6];
-cx q0[5],q0[6];
-rz(-pi/4) q0[6];
-cx q0[4],q0[6];
-rz(pi/4) q0[6];
-cx q0[5],q0[6];
-rz(pi/4) q0[5];
-rz(-pi/4) q0[6];
-cx q0[4],q0[6];
-cx q0[4],q0[5];
-rz(3*pi/4) q0[4];
-sx q0[4];
-rz(pi/2) q0[4];
-cx q0[27],q0[4];
-rz(-pi/4) q0[4];
-cx q0[37],q0[4];
-rz(pi/4) q0[4];
-cx q0[27],q0[4];
-rz(pi/4) q0[27];
-rz(-pi/4) q0[4];
-cx q0[37],q0[4];
-cx q0[37],q0[27];
-rz(-pi/4) q0[27];
-rz(pi/4) q0[37];
-cx q0[37],q0[27];
-cx q0[37],q0[7];
-rz(3*pi/4) q0[4];
-sx q0[4];
-rz(pi/2) q0[4];
-rz(-pi/4) q0[5];
-cx q0[3],q0[5];
-rz(pi/2) q0[3];
-sx q0[3];
-rz(pi/2) q0[3];
-cx q0[2],q0[3];
-rz(-pi/4) q0[3];
-cx q0[0],q0[3];
-rz(pi/4) q0[3];
-cx q0[2],q0[3];
-rz(pi/4) q0[2];
-rz(-pi/4) q0[3];
-cx q0[0],q0[3];
-cx q0[0],q0[2];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[2];
-cx q0[0],q0[2];
-cx q0[1],q0[2];
-rz(pi/4) q0[3];
-cx q0[2],q0[3];
-rz(-pi/4) q0[3];
-cx q0[1],q0[3];
-rz(pi/4) q0[3];
-cx q0[2],q0[3];
-rz(pi/4) q0[2];
-rz(-pi/4) q0[3];
-cx q0[1],q0[3];
-cx q0[1],q0[2];
-rz(pi/4) q0[1];
-rz(-pi/4) q0[2];
-cx q0[0],q0[2];
-rz(pi/4) q0[3];
-cx q0[2],q0[3];
-rz(-pi/4) q0[3];
-cx q0[1],q0[3];
-rz(pi/4) q0[3];
-cx q0[2],q0[3];
-rz(pi/4) q0[2];
-rz(-pi/4) q0[3];
-cx q0[1],q0[3];
-cx q0[1],q0[2];
-rz(pi/4) q0[1];
-rz(-pi/4) q0[2];
-rz(pi/4) q0[3];
-cx q0[2],q0[3];
-rz(-pi/4) q0[3];
-cx q0[0],q0[3];
-rz(pi/4) q0[3];
-cx q0[2],q0[3];
-rz(pi/4) q0[2];
-rz(-pi/4) q0[3];
-cx q0[0],q0[3];
-cx q0[0],q0[2];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[2];
-cx q0[0],q0[2];
-rz(3*pi/4) q0[3];
-sx q0[3];
-rz(pi/2) q0[3];
-rz(pi/4) q0[6];
-cx q0[5],q0[6];
-rz(-pi/4) q0[6];
-cx q0[4],q0[6];
-rz(pi/4) q0[6];
-cx q0[5],q0[6];
-rz(pi/4) q0[5];
-rz(-pi/4) q0[6];
-cx q0[4],q0[6];
-cx q0[4],q0[5];
-rz(pi/4) q0[4];
-rz(-pi/4) q0[5];
-rz(pi/4) q0[6];
-cx q0[5],q0[6];
-rz(-pi/4) q0[6];
-cx q0[3],q0[6];
-rz(pi/4) q0[6];
-cx q0[5],q0[6];
-rz(pi/4) q0[5];
-rz(-pi/4) q0[6];
-cx q0[3],q0[6];
-cx q0[3],q0[5];
-rz(pi/4) q0[3];
-rz(-pi/4) q0[5];
-cx q0[3],q0[5];
-rz(3*pi/4) q0[6];
-sx q0[6];
-rz(pi/2) q0[6];
-rz(pi/4) q0[7];
-cx q0[28],q0[7];
-rz(pi/4) q0[28];
-rz(-pi/4) q0[7];
-cx q0[37],q0[7];
-cx q0[37],q0[28];
-rz(-pi/4) q0[28];
-rz(pi/4) q0[37];
-cx q0[37],q0[28];
-cx q0[37],q0[10];
-rz(pi/4) q0[10];
-cx q0[29],q0[10];
-rz(-pi/4) q0[10];
-rz(pi/4) q0[29];
-cx q0[37],q0[10];
-rz(pi/4) q0[10];
-cx q0[28],q0[10];
-rz(-pi/4) q0[10];
-cx q0[37],q0[29];
-rz(-pi/4) q0[29];
-rz(pi/4) q0[37];
-cx q0[37],q0[29];
-cx q0[37],q0[13];
-rz(pi/4) q0[13];
-cx q0[30],q0[13];
-rz(-pi/4) q0[13];
-rz(pi/4) q0[30];
-cx q0[37],q0[13];
-rz(pi/4) q0[13];
-cx q0[29],q0[13];
-rz(-pi/4) q0[13];
-cx q0[37],q0[30];
-rz(-pi/4) q0[30];
-rz(pi/4) q0[37];
-cx q0[37],q0[30];
-cx q0[37],q0[16];
-rz(pi/4) q0[16];
-cx q0[31],q0[16];
-rz(-pi/4) q0[16];
-rz(pi/4) q0[31];
-cx q0[37],q0[16];
-rz(pi/4) q0[16];
-cx q0[30],q0[16];
-rz(-pi/4) q0[16];
-cx q0[37],q0[31];
-rz(-pi/4) q0[31];
-rz(pi/4) q0[37];
-cx q0[37],q0[31];
-cx q0[37],q0[19];
-rz(pi/4) q0[19];
-cx q0[32],q0[19];
-rz(-pi/4) q0[19];
-rz(pi/4) q0[32];
-cx q0[37],q0[19];
-rz(pi/4) q0[19];
-cx q0[31],q0[19];
-rz(-pi/4) q0[19];
-cx q0[37],q0[32];
-rz(-pi/4) q0[32];
-rz(pi/4) q0[37];
-cx q0[37],q0[32];
-cx q0[37],q0[22];
-rz(pi/4) q0[22];
-cx q0[33],q0[22];
-rz(-pi/4) q0[22];
-rz(pi/4) q0[33];
-cx q0[37],q0[22];
-rz(pi/4) q0[22];
-cx q0[32],q0[22];
-rz(-pi/4) q0[22];
-cx q0[37],q0[33];
-rz(-pi/4) q0[33];
-rz(pi/4) q0[37];
-cx q0[37],q0[33];
-cx q0[37],q0[25];
-rz(pi/4) q0[25];
-cx q0[34],q0[25];
-rz(-pi/4) q0[25];
-rz(pi/4) q0[34];
-cx q0[37],q0[25];
-rz(pi/4) q0[25];
-cx q0[33],q0[25];
-rz(-pi/4) q0[25];
-cx q0[37],q0[34];
-rz(-pi/4) q0[34];
-rz(pi/4) q0[37];
-cx q0[37],q0[34];
-rz(pi/4) q0[7];
-cx q0[27],q0[7];
-rz(-pi/4) q0[7];
-rz(pi/4) q0[9];
-cx q0[8],q0[9];
-rz(-pi/4) q0[9];
-cx q0[38],q0[7];
-rz(pi/4) q0[7];
-cx q0[27],q0[7];
-rz(pi/4) q0[27];
-rz(-pi/4) q0[7];
-cx q0[38],q0[7];
-cx q0[38],q0[27];
-rz(-pi/4) q0[27];
-rz(pi/4) q0[38];
-cx q0[38],q0[27];
-cx q0[38],q0[10];
-rz(pi/4) q0[10];
-cx q0[28],q0[10];
-rz(-pi/4) q0[10];
-rz(pi/4) q0[28];
-cx q0[38],q0[10];
-rz(3*pi/4) q0[10];
-sx q0[10];
-rz(pi/2) q0[10];
-cx q0[10],q0[12];
-rz(pi/4) q0[12];
-cx q0[11],q0[12];
-rz(pi/4) q0[11];
-rz(-pi/4) q0[12];
-cx q0[10],q0[12];
-cx q0[10],q0[11];
-rz(pi/4) q0[10];
-rz(-pi/4) q0[11];
-rz(pi/4) q0[12];
-cx q0[11],q0[12];
-rz(-pi/4) q0[12];
-cx q0[38],q0[28];
-rz(-pi/4) q0[28];
-rz(pi/4) q0[38];
-cx q0[38],q0[28];
-cx q0[38],q0[13];
-rz(pi/4) q0[13];
-cx q0[29],q0[13];
-rz(-pi/4) q0[13];
-rz(pi/4) q0[29];
-cx q0[38],q0[13];
-rz(3*pi/4) q0[13];
-sx q0[13];
-rz(pi/2) q0[13];
-cx q0[13],q0[15];
-rz(pi/4) q0[15];
-cx q0[14],q0[15];
-rz(pi/4) q0[14];
-rz(-pi/4) q0[15];
-cx q0[13],q0[15];
-cx q0[13],q0[14];
-rz(pi/4) q0[13];
-rz(-pi/4) q0[14];
-rz(pi/4) q0[15];
-cx q0[14],q0[15];
-rz(-pi/4) q0[15];
-cx q0[38],q0[29];
-rz(-pi/4) q0[29];
-rz(pi/4) q0[38];
-cx q0[38],q0[29];
-cx q0[38],q0[16];
-rz(pi/4) q0[16];
-cx q0[30],q0[16];
-rz(-pi/4) q0[16];
-rz(pi/4) q0[30];
-cx q0[38],q0[16];
-rz(3*pi/4) q0[16];
-sx q0[16];
-rz(pi/2) q0[16];
-cx q0[16],q0[18];
-rz(pi/4) q0[18];
-cx q0[17],q0[18];
-rz(pi/4) q0[17];
-rz(-pi/4) q0[18];
-cx q0[16],q0[18];
-cx q0[16],q0[17];
-rz(pi/4) q0[16];
-rz(-pi/4) q0[17];
-rz(pi/4) q0[18];
-cx q0[17],q0[18];
-rz(-pi/4) q0[18];
-cx q0[38],q0[30];
-rz(-pi/4) q0[30];
-rz(pi/4) q0[38];
-cx q0[38],q0[30];
-cx q0[38],q0[19];
-rz(pi/4) q0[19];
-cx q0[31],q0[19];
-rz(-pi/4) q0[19];
-rz(pi/4) q0[31];
-cx q0[38],q0[19];
-rz(3*pi/4) q0[19];
-sx q0[19];
-rz(pi/2) q0[19];
-cx q0[19],q0[21];
-rz(pi/4) q0[21];
-cx q0[20],q0[21];
-rz(pi/4) q0[20];
-rz(-pi/4) q0[21];
-cx q0[19],q0[21];
-cx q0[19],q0[20];
-rz(pi/4) q0[19];
-rz(-pi/4) q0[20];
-rz(pi/4) q0[21];
-cx q0[20],q0[21];
-rz(-pi/4) q0[21];
-cx q0[38],q0[31];
-rz(-pi/4) q0[31];
-rz(pi/4) q0[38];
-cx q0[38],q0[31];
-cx q0[38],q0[22];
-rz(pi/4) q0[22];
-cx q0[32],q0[22];
-rz(-pi/4) q0[22];
-rz(pi/4) q0[32];
-cx q0[38],q0[22];
-rz(3*pi/4) q0[22];
-sx q0[22];
-rz(pi/2) q0[22];
-cx q0[22],q0[24];
-rz(pi/4) q0[24];
-cx q0[23],q0[24];
-rz(pi/4) q0[23];
-rz(-pi/4) q0[24];
-cx q0[22],q0[24];
-cx q0[22],q0[23];
-rz(pi/4) q0[22];
-rz(-pi/4) q0[23];
-rz(pi/4) q0[24];
-cx q0[23],q0[24];
-rz(-pi/4) q0[24];
-cx q0[38],q0[32];
-rz(-pi/4) q0[32];
-rz(pi/4) q0[38];
-cx q0[38],q0[32];
-cx q0[38],q0[25];
-rz(pi/4) q0[25];
-cx q0[33],q0[25];
-rz(-pi/4) q0[25];
-rz(pi/4) q0[33];
-cx q0[38],q0[25];
-rz(3*pi/4) q0[25];
-sx q0[25];
-rz(pi/2) q0[25];
-cx q0[25],q0[26];
-rz(pi/2) q0[25];
-sx q0[25];
-rz(pi/2) q0[25];
-cx q0[38],q0[33];
-rz(-pi/4) q0[33];
-rz(pi/4) q0[38];
-cx q0[38],q0[33];
-cx q0[33],q0[25];
-rz(-pi/4) q0[25];
-rz(3*pi/4) q0[7];
-sx q0[7];
-rz(pi/2) q0[7];
-cx q0[7],q0[9];
-rz(pi/4) q0[9];
-cx q0[8],q0[9];
-rz(pi/4) q0[8];
-rz(-pi/4) q0[9];
-cx q0[7],q0[9];
-cx q0[7],q0[8];
-rz(pi/4) q0[7];
-rz(-pi/4) q0[8];
-rz(pi/4) q0[9];
-cx q0[8],q0[9];
-rz(-pi/4) q0[9];
-cx q0[6],q0[9];
-rz(pi/4) q0[9];
-cx q0[8],q0[9];
-rz(pi/4) q0[8];
-rz(-pi/4) q0[9];
-cx q0[6],q0[9];
-cx q0[6],q0[8];
-rz(pi/4) q0[6];
-rz(-pi/4) q0[8];
-cx q0[6],q0[8];
-rz(3*pi/4) q0[9];
-sx q0[9];
-rz(pi/2) q0[9];
-cx q0[9],q0[12];
-rz(pi/4) q0[12];
-cx q0[11],q0[12];
-rz(pi/4) q0[11];
-rz(-pi/4) q0[12];
-cx q0[9],q0[12];
-rz(3*pi/4) q0[12];
-sx q0[12];
-rz(pi/2) q0[12];
-cx q0[12],q0[15];
-rz(pi/4) q0[15];
-cx q0[14],q0[15];
-rz(pi/4) q0[14];
-rz(-pi/4) q0[15];
-cx q0[12],q0[15];
-cx q0[12],q0[14];
-rz(pi/4) q0[12];
-rz(-pi/4) q0[14];
-cx q0[12],q0[14];
-rz(3*pi/4) q0[15];
-sx q0[15];
-rz(pi/2) q0[15];
-cx q0[15],q0[18];
-rz(pi/4) q0[18];
-cx q0[17],q0[18];
-rz(pi/4) q0[17];
-rz(-pi/4) q0[18];
-cx q0[15],q0[18];
-cx q0[15],q0[17];
-rz(pi/4) q0[15];
-rz(-pi/4) q0[17];
-cx q0[15],q0[17];
-rz(3*pi/4) q0[18];
-sx q0[18];
-rz(pi/2) q0[18];
-cx q0[18],q0[21];
-rz(pi/4) q0[21];
-cx q0[20],q0[21];
-rz(pi/4) q0[20];
-rz(-pi/4) q0[21];
-cx q0[18],q0[21];
-cx q0[18],q0[20];
-rz(pi/4) q0[18];
-rz(-pi/4) q0[20];
-cx q0[18],q0[20];
-rz(3*pi/4) q0[21];
-sx q0[21];
-rz(pi/2) q0[21];
-cx q0[21],q0[24];
-rz(pi/4) q0[24];
-cx q0[23],q0[24];
-rz(pi/4) q0[23];
-rz(-pi/4) q0[24];
-cx q0[21],q0[24];
-cx q0[21],q0[23];
-rz(pi/4) q0[21];
-rz(-pi/4) q0[23];
-cx q0[21],q0[23];
-rz(3*pi/4) q0[24];
-sx q0[24];
-rz(pi/2) q0[24];
-cx q0[24],q0[26];
-rz(pi/2) q0[24];
-sx q0[24];
-rz(pi/2) q0[24];
-cx q0[23],q0[24];
-rz(-pi/4) q0[24];
-cx q0[21],q0[24];
-rz(pi/4) q0[24];
-cx q0[23],q0[24];
-rz(pi/4) q0[23];
-rz(-pi/4) q0[24];
-cx q0[21],q0[24];
-cx q0[21],q0[23];
-rz(pi/4) q0[21];
-rz(-pi/4) q0[23];
-cx q0[21],q0[23];
-cx q0[22],q0[23];
-rz(pi/4) q0[24];
-cx q0[23],q0[24];
-rz(-pi/4) q0[24];
-cx q0[22],q0[24];
-rz(pi/4) q0[24];
-cx q0[23],q0[24];
-rz(pi/4) q0[23];
-rz(-pi/4) q0[24];
-cx q0[22],q0[24];
-cx q0[22],q0[23];
-rz(3*pi/4) q0[22];
-sx q0[22];
-rz(pi/2) q0[22];
-rz(-pi/4) q0[23];
-cx q0[21],q0[23];
-rz(pi/2) q0[21];
-sx q0[21];
-rz(pi/2) q0[21];
-cx q0[20],q0[21];
-rz(-pi/4) q0[21];
-cx q0[18],q0[21];
-rz(pi/4) q0[21];
-cx q0[20],q0[21];
-rz(pi/4) q0[20];
-rz(-pi/4) q0[21];
-cx q0[18],q0[21];
-cx q0[18],q0[20];
-rz(pi/4) q0[18];
-rz(-pi/4) q0[20];
-cx q0[18],q0[20];
-cx q0[19],q0[20];
-rz(pi/4) q0[21];
-cx q0[20],q0[21];
-rz(-pi/4) q0[21];
-cx q0[19],q0[21];
-rz(pi/4) q0[21];
-cx q0[20],q0[21];
-rz(pi/4) q0[20];
-rz(-pi/4) q0[21];
-cx q0[19],q0[21];
-cx q0[19],q0[20];
-rz(3*pi/4) q0[19];
-sx q0[19];
-rz(pi/2) q0[19];
-rz(-pi/4) q0[20];
-cx q0[18],q0[20];
-rz(pi/2) q0[18];
-sx q0[18];
-rz(pi/2) q0[18];
-cx q0[17],q0[18];
-rz(-pi/4) q0[18];
-cx q0[15],q0[18];
-rz(pi/4) q0[18];
-cx q0[17],q0[18];
-rz(pi/4) q0[17];
-rz(-pi/4) q0[18];
-cx q0[15],q0[18];
-cx q0[15],q0[17];
-rz(pi/4) q0[15];
-rz(-pi/4) q0[17];
-cx q0[15],q0[17];
-cx q0[16],q0[17];
-rz(pi/4) q0[18];
-cx q0[17],q0[18];
-rz(-pi/4) q0[18];
-cx q0[16],q0[18];
-rz(pi/4) q0[18];
-cx q0[17],q0[18];
-rz(pi/4) q0[17];
-rz(-pi/4) q0[18];
-cx q0[16],q0[18];
-cx q0[16],q0[17];
-rz(3*pi/4) q0[16];
-sx q0[16];
-rz(pi/2) q0[16];
-rz(-pi/4) q0[17];
-cx q0[15],q0[17];
-rz(pi/2) q0[15];
-sx q0[15];
-rz(pi/2) q0[15];
-cx q0[14],q0[15];
-rz(-pi/4) q0[15];
-cx q0[12],q0[15];
-rz(pi/4) q0[15];
-cx q0[14],q0[15];
-rz(pi/4) q0[14];
-rz(-pi/4) q0[15];
-cx q0[12],q0[15];
-cx q0[12],q0[14];
-rz(pi/4) q0[12];
-rz(-pi/4) q0[14];
-cx q0[12],q0[14];
-cx q0[13],q0[14];
-rz(pi/4) q0[15];
-cx q0[14],q0[15];
-rz(-pi/4) q0[15];
-cx q0[13],q0[15];
-rz(pi/4) q0[15];
-cx q0[14],q0[15];
-rz(pi/4) q0[14];
-rz(-pi/4) q0[15];
-cx q0[13],q0[15];
-cx q0[13],q0[14];
-rz(3*pi/4) q0[13];
-sx q0[13];
-rz(pi/2) q0[13];
-rz(-pi/4) q0[14];
-cx q0[12],q0[14];
-rz(pi/2) q0[12];
-sx q0[12];
-rz(pi/2) q0[12];
-rz(pi/4) q0[15];
-cx q0[14],q0[15];
-rz(-pi/4) q0[15];
-rz(pi/4) q0[18];
-cx q0[17],q0[18];
-rz(-pi/4) q0[18];
-rz(pi/4) q0[21];
-cx q0[20],q0[21];
-rz(-pi/4) q0[21];
-rz(pi/4) q0[24];
-cx q0[23],q0[24];
-rz(-pi/4) q0[24];
-cx q0[29],q0[13];
-rz(-pi/4) q0[13];
-cx q0[30],q0[16];
-rz(-pi/4) q0[16];
-cx q0[31],q0[19];
-rz(-pi/4) q0[19];
-cx q0[32],q0[22];
-rz(-pi/4) q0[22];
-cx q0[9],q0[11];
-rz(-pi/4) q0[11];
-rz(pi/4) q0[9];
-cx q0[9],q0[11];
-cx q0[11],q0[12];
-rz(-pi/4) q0[12];
-cx q0[9],q0[12];
-rz(pi/4) q0[12];
-cx q0[11],q0[12];
-rz(pi/4) q0[11];
-rz(-pi/4) q0[12];
-cx q0[9],q0[12];
-rz(pi/4) q0[12];
-cx q0[9],q0[11];
-rz(-pi/4) q0[11];
-rz(pi/4) q0[9];
-cx q0[9],q0[11];
-cx q0[10],q0[11];
-cx q0[11],q0[12];
-rz(-pi/4) q0[12];
-cx q0[10],q0[12];
-rz(pi/4) q0[12];
-cx q0[11],q0[12];
-rz(pi/4) q0[11];
-rz(-pi/4) q0[12];
-cx q0[10],q0[12];
-cx q0[10],q0[11];
-rz(3*pi/4) q0[10];
-sx q0[10];
-rz(pi/2) q0[10];
-rz(-pi/4) q0[11];
-rz(pi/4) q0[12];
-cx q0[28],q0[10];
-rz(-pi/4) q0[10];
-cx q0[9],q0[11];
-cx q0[11],q0[12];
-rz(-pi/4) q0[12];
-rz(pi/2) q0[9];
-sx q0[9];
-rz(pi/2) q0[9];
-cx q0[8],q0[9];
-rz(-pi/4) q0[9];
-cx q0[6],q0[9];
-rz(pi/4) q0[9];
-cx q0[8],q0[9];
-rz(pi/4) q0[8];
-rz(-pi/4) q0[9];
-cx q0[6],q0[9];
-cx q0[6],q0[8];
-rz(pi/4) q0[6];
-rz(-pi/4) q0[8];
-cx q0[6],q0[8];
-cx q0[7],q0[8];
-rz(pi/4) q0[9];
-cx q0[8],q0[9];
-rz(-pi/4) q0[9];
-cx q0[7],q0[9];
-rz(pi/4) q0[9];
-cx q0[8],q0[9];
-rz(pi/4) q0[8];
-rz(-pi/4) q0[9];
-cx q0[7],q0[9];
-cx q0[7],q0[8];
-rz(3*pi/4) q0[7];
-sx q0[7];
-rz(pi/2) q0[7];
-cx q0[27],q0[7];
-rz(-pi/4) q0[7];
-cx q0[38],q0[7];
-rz(pi/4) q0[7];
-cx q0[27],q0[7];
-rz(pi/4) q0[27];
-rz(-pi/4) q0[7];
-cx q0[38],q0[7];
-cx q0[38],q0[27];
-rz(-pi/4) q0[27];
-rz(pi/4) q0[38];
-cx q0[38],q0[27];
-cx q0[38],q0[10];
-rz(pi/4) q0[10];
-cx q0[28],q0[10];
-rz(-pi/4) q0[10];
-rz(pi/4) q0[28];
-cx q0[38],q0[10];
-rz(pi/4) q0[10];
-cx q0[27],q0[10];
-rz(-pi/4) q0[10];
-cx q0[38],q0[28];
-rz(-pi/4) q0[28];
-rz(pi/4) q0[38];
-cx q0[38],q0[28];
-cx q0[38],q0[13];
-rz(pi/4) q0[13];
-cx q0[29],q0[13];
-rz(-pi/4) q0[13];
-rz(pi/4) q0[29];
-cx q0[38],q0[13];
-rz(pi/4) q0[13];
-cx q0[28],q0[13];
-rz(-pi/4) q0[13];
-cx q0[38],q0[29];
-rz(-pi/4) q0[29];
-rz(pi/4) q0[38];
-cx q0[38],q0[29];
-cx q0[38],q0[16];
-rz(pi/4) q0[16];
-cx q0[30],q0[16];
-rz(-pi/4) q0[16];
-rz(pi/4) q0[30];
-cx q0[38],q0[16];
-rz(pi/4) q0[16];
-cx q0[29],q0[16];
-rz(-pi/4) q0[16];
-cx q0[38],q0[30];
-rz(-pi/4) q0[30];
-rz(pi/4) q0[38];
-cx q0[38],q0[30];
-cx q0[38],q0[19];
-rz(pi/4) q0[19];
-cx q0[31],q0[19];
-rz(-pi/4) q0[19];
-rz(pi/4) q0[31];
-cx q0[38],q0[19];
-rz(pi/4) q0[19];
-cx q0[30],q0[19];
-rz(-pi/4) q0[19];
-cx q0[38],q0[31];
-rz(-pi/4) q0[31];
-rz(pi/4) q0[38];
-cx q0[38],q0[31];
-cx q0[38],q0[22];
-rz(pi/4) q0[22];
-cx q0[32],q0[22];
-rz(-pi/4) q0[22];
-rz(pi/4) q0[32];
-cx q0[38],q0[22];
-rz(pi/4) q0[22];
-cx q0[31],q0[22];
-rz(-pi/4) q0[22];
-cx q0[38],q0[32];
-rz(-pi/4) q0[32];
-rz(pi/4) q0[38];
-cx q0[38],q0[32];
-cx q0[38],q0[25];
-rz(pi/4) q0[25];
-cx q0[33],q0[25];
-rz(-pi/4) q0[25];
-rz(pi/4) q0[33];
-cx q0[38],q0[25];
-rz(pi/4) q0[25];
-cx q0[32],q0[25];
-rz(-pi/4) q0[25];
-cx q0[38],q0[33];
-rz(-pi/4) q0[33];
-rz(pi/4) q0[38];
-cx q0[38],q0[33];
-rz(3*pi/4) q0[7];
-sx q0[7];
-rz(pi/2) q0[7];
-rz(-pi/4) q0[8];
-cx q0[6],q0[8];
-rz(pi/2) q0[6];
-sx q0[6];
-rz(pi/2) q0[6];
-cx q0[5],q0[6];
-rz(-pi/4) q0[6];
-cx q0[3],q0[6];
-rz(pi/4) q0[6];
-cx q0[5],q0[6];
-rz(pi/4) q0[5];
-rz(-pi/4) q0[6];
-cx q0[3],q0[6];
-cx q0[3],q0[5];
-rz(pi/4) q0[3];
-rz(-pi/4) q0[5];
-cx q0[3],q0[5];
-cx q0[4],q0[5];
-rz(pi/4) q0[6];
-cx q0[5],q0[6];
-rz(-pi/4) q0[6];
-cx q0[4],q0[6];
-rz(pi/4) q0[6];
-cx q0[5],q0[6];
-rz(pi/4) q0[5];
-rz(-pi/4) q0[6];
-cx q0[4],q0[6];
-cx q0[4],q0[5];
-rz(pi/4) q0[4];
-rz(-pi/4) q0[5];
-cx q0[3],q0[5];
-rz(pi/2) q0[3];
-sx q0[3];
-rz(pi/2) q0[3];
-cx q0[2],q0[3];
-rz(-pi/4) q0[3];
-cx q0[0],q0[3];
-rz(pi/4) q0[3];
-cx q0[2],q0[3];
-rz(pi/4) q0[2];
-rz(-pi/4) q0[3];
-cx q0[0],q0[3];
-cx q0[0],q0[2];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[2];
-cx q0[0],q0[2];
-cx q0[1],q0[2];
-rz(pi/4) q0[3];
-cx q0[2],q0[3];
-rz(-pi/4) q0[3];
-cx q0[1],q0[3];
-rz(pi/4) q0[3];
-cx q0[2],q0[3];
-rz(pi/4) q0[2];
-rz(-pi/4) q0[3];
-cx q0[1],q0[3];
-cx q0[1],q0[2];
-rz(pi/4) q0[1];
-rz(-pi/4) q0[2];
-cx q0[0],q0[2];
-rz(pi/4) q0[3];
-cx q0[2],q0[3];
-rz(-pi/4) q0[3];
-cx q0[1],q0[3];
-rz(pi/4) q0[3];
-cx q0[2],q0[3];
-rz(pi/4) q0[2];
-rz(-pi/4) q0[3];
-cx q0[1],q0[3];
-cx q0[1],q0[2];
-rz(pi/4) q0[1];
-rz(-pi/4) q0[2];
-rz(pi/4) q0[3];
-cx q0[2],q0[3];
-rz(-pi/4) q0[3];
-cx q0[0],q0[3];
-rz(pi/4) q0[3];
-cx q0[2],q0[3];
-rz(pi/4) q0[2];
-rz(-pi/4) q0[3];
-cx q0[0],q0[3];
-cx q0[0],q0[2];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[2];
-cx q0[0],q0[2];
-rz(3*pi/4) q0[3];
-sx q0[3];
-rz(pi/2) q0[3];
-rz(pi/4) q0[6];
-cx q0[5],q0[6];
-rz(-pi/4) q0[6];
-cx q0[4],q0[6];
-rz(pi/4) q0[6];
-cx q0[5],q0[6];
-rz(pi/4) q0[5];
-rz(-pi/4) q0[6];
-cx q0[4],q0[6];
-cx q0[4],q0[5];
-rz(pi/4) q0[4];
-rz(-pi/4) q0[5];
-rz(pi/4) q0[6];
-cx q0[5],q0[6];
-rz(-pi/4) q0[6];
-cx q0[3],q0[6];
-rz(pi/4) q0[6];
-cx q0[5],q0[6];
-rz(pi/4) q0[5];
-rz(-pi/4) q0[6];
-cx q0[3],q0[6];
-cx q0[3],q0[5];
-rz(pi/4) q0[3];
-rz(-pi/4) q0[5];
-cx q0[3],q0[5];
-rz(3*pi/4) q0[6];
-sx q0[6];
-rz(pi/2) q0[6];
-rz(pi/4) q0[9];
-cx q0[8],q0[9];
-rz(-pi/4) q0[9];
-cx q0[7],q0[9];
-rz(pi/4) q0[9];
-cx q0[8],q0[9];
-rz(pi/4) q0[8];
-rz(-pi/4) q0[9];
-cx q0[7],q0[9];
-cx q0[7],q0[8];
-rz(pi/4) q0[7];
-rz(-pi/4) q0[8];
-rz(pi/4) q0[9];
-cx q0[8],q0[9];
-rz(-pi/4) q0[9];
-cx q0[6],q0[9];
-rz(pi/4) q0[9];
-cx q0[8],q0[9];
-rz(pi/4) q0[8];
-rz(-pi/4) q0[9];
-cx q0[6],q0[9];
-cx q0[6],q0[8];
-rz(pi/4) q0[6];
-rz(-pi/4) q0[8];
-cx q0[6],q0[8];
-rz(3*pi/4) q0[9];
-sx q0[9];
-rz(pi/2) q0[9];
-cx q0[39],q0[10];
-rz(pi/4) q0[10];
-cx q0[27],q0[10];
-rz(-pi/4) q0[10];
-rz(pi/4) q0[27];
-cx q0[39],q0[10];
-rz(3*pi/4) q0[10];
-sx q0[10];
-rz(pi/2) q0[10];
-cx q0[10],q0[12];
-rz(pi/4) q0[12];
-cx q0[11],q0[12];
-rz(pi/4) q0[11];
-rz(-pi/4) q0[12];
-cx q0[10],q0[12];
-cx q0[10],q0[11];
-rz(pi/4) q0[10];
-rz(-pi/4) q0[11];
-rz(pi/4) q0[12];
-cx q0[11],q0[12];
-rz(-pi/4) q0[12];
-cx q0[39],q0[27];
-rz(-pi/4) q0[27];
-rz(pi/4) q0[39];
-cx q0[39],q0[27];
-cx q0[39],q0[13];
-rz(pi/4) q0[13];
-cx q0[28],q0[13];
-rz(-pi/4) q0[13];
-rz(pi/4) q0[28];
-cx q0[39],q0[13];
-rz(3*pi/4) q0[13];
-sx q0[13];
-rz(pi/2) q0[13];
-cx q0[13],q0[15];
-rz(pi/4) q0[15];
-cx q0[14],q0[15];
-rz(pi/4) q0[14];
-rz(-pi/4) q0[15];
-cx q0[13],q0[15];
-cx q0[13],q0[14];
-rz(pi/4) q0[13];
-rz(-pi/4) q0[14];
-rz(pi/4) q0[15];
-cx q0[14],q0[15];
-rz(-pi/4) q0[15];
-cx q0[39],q0[28];
-rz(-pi/4) q0[28];
-rz(pi/4) q0[39];
-cx q0[39],q0[28];
-cx q0[39],q0[16];
-rz(pi/4) q0[16];
-cx q0[29],q0[16];
-rz(-pi/4) q0[16];
-rz(pi/4) q0[29];
-cx q0[39],q0[16];
-rz(3*pi/4) q0[16];
-sx q0[16];
-rz(pi/2) q0[16];
-cx q0[16],q0[18];
-rz(pi/4) q0[18];
-cx q0[17],q0[18];
-rz(pi/4) q0[17];
-rz(-pi/4) q0[18];
-cx q0[16],q0[18];
-cx q0[16],q0[17];
-rz(pi/4) q0[16];
-rz(-pi/4) q0[17];
-rz(pi/4) q0[18];
-cx q0[17],q0[18];
-rz(-pi/4) q0[18];
-cx q0[39],q0[29];
-rz(-pi/4) q0[29];
-rz(pi/4) q0[39];
-cx q0[39],q0[29];
-cx q0[39],q0[19];
-rz(pi/4) q0[19];
-cx q0[30],q0[19];
-rz(-pi/4) q0[19];
-rz(pi/4) q0[30];
-cx q0[39],q0[19];
-rz(3*pi/4) q0[19];
-sx q0[19];
-rz(pi/2) q0[19];
-cx q0[19],q0[21];
-rz(pi/4) q0[21];
-cx q0[20],q0[21];
-rz(pi/4) q0[20];
-rz(-pi/4) q0[21];
-cx q0[19],q0[21];
-cx q0[19],q0[20];
-rz(pi/4) q0[19];
-rz(-pi/4) q0[20];
-rz(pi/4) q0[21];
-cx q0[20],q0[21];
-rz(-pi/4) q0[21];
-cx q0[39],q0[30];
-rz(-pi/4) q0[30];
-rz(pi/4) q0[39];
-cx q0[39],q0[30];
-cx q0[39],q0[22];
-rz(pi/4) q0[22];
-cx q0[31],q0[22];
-rz(-pi/4) q0[22];
-rz(pi/4) q0[31];
-cx q0[39],q0[22];
-rz(3*pi/4) q0[22];
-sx q0[22];
-rz(pi/2) q0[22];
-cx q0[22],q0[24];
-rz(pi/4) q0[24];
-cx q0[23],q0[24];
-rz(pi/4) q0[23];
-rz(-pi/4) q0[24];
-cx q0[22],q0[24];
-cx q0[22],q0[23];
-rz(pi/4) q0[22];
-rz(-pi/4) q0[23];
-rz(pi/4) q0[24];
-cx q0[23],q0[24];
-rz(-pi/4) q0[24];
-cx q0[39],q0[31];
-rz(-pi/4) q0[31];
-rz(pi/4) q0[39];
-cx q0[39],q0[31];
-cx q0[39],q0[25];
-rz(pi/4) q0[25];
-cx q0[32],q0[25];
-rz(-pi/4) q0[25];
-rz(pi/4) q0[32];
-cx q0[39],q0[25];
-rz(3*pi/4) q0[25];
-sx q0[25];
-rz(pi/2) q0[25];
-cx q0[25],q0[26];
-rz(pi/2) q0[25];
-sx q0[25];
-rz(pi/2) q0[25];
-cx q0[39],q0[32];
-rz(-pi/4) q0[32];
-rz(pi/4) q0[39];
-cx q0[39],q0[32];
-cx q0[32],q0[25];
-rz(-pi/4) q0[25];
-cx q0[9],q0[12];
-rz(pi/4) q0[12];
-cx q0[11],q0[12];
-rz(pi/4) q0[11];
-rz(-pi/4) q0[12];
-cx q0[9],q0[12];
-rz(3*pi/4) q0[12];
-sx q0[12];
-rz(pi/2) q0[12];
-cx q0[12],q0[15];
-rz(pi/4) q0[15];
-cx q0[14],q0[15];
-rz(pi/4) q0[14];
-rz(-pi/4) q0[15];
-cx q0[12],q0[15];
-cx q0[12],q0[14];
-rz(pi/4) q0[12];
-rz(-pi/4) q0[14];
-cx q0[12],q0[14];
-rz(3*pi/4) q0[15];
-sx q0[15];
-rz(pi/2) q0[15];
-cx q0[15],q0[18];
-rz(pi/4) q0[18];
-cx q0[17],q0[18];
-rz(pi/4) q0[17];
-rz(-pi/4) q0[18];
-cx q0[15],q0[18];
-cx q0[15],q0[17];
-rz(pi/4) q0[15];
-rz(-pi/4) q0[17];
-cx q0[15],q0[17];
-rz(3*pi/4) q0[18];
-sx q0[18];
-rz(pi/2) q0[18];
-cx q0[18],q0[21];
-rz(pi/4) q0[21];
-cx q0[20],q0[21];
-rz(pi/4) q0[20];
-rz(-pi/4) q0[21];
-cx q0[18],q0[21];
-cx q0[18],q0[20];
-rz(pi/4) q0[18];
-rz(-pi/4) q0[20];
-cx q0[18],q0[20];
-rz(3*pi/4) q0[21];
-sx q0[21];
-rz(pi/2) q0[21];
-cx q0[21],q0[24];
-rz(pi/4) q0[24];
-cx q0[23],q0[24];
-rz(pi/4) q0[23];
-rz(-pi/4) q0[24];
-cx q0[21],q0[24];
-cx q0[21],q0[23];
-rz(pi/4) q0[21];
-rz(-pi/4) q0[23];
-cx q0[21],q0[23];
-rz(3*pi/4) q0[24];
-sx q0[24];
-rz(pi/2) q0[24];
-cx q0[24],q0[26];
-rz(pi/2) q0[24];
-sx q0[24];
-rz(pi/2) q0[24];
-cx q0[23],q0[24];
-rz(-pi/4) q0[24];
-cx q0[21],q0[24];
-rz(pi/4) q0[24];
-cx q0[23],q0[24];
-rz(pi/4) q0[23];
-rz(-pi/4) q0[24];
-cx q0[21],q0[24];
-cx q0[21],q0[23];
-rz(pi/4) q0[21];
-rz(-pi/4) q0[23];
-cx q0[21],q0[23];
-cx q0[22],q0[23];
-rz(pi/4) q0[24];
-cx q0[23],q0[24];
-rz(-pi/4) q0[24];
-cx q0[22],q0[24];
-rz(pi/4) q0[24];
-cx q0[23],q0[24];
-rz(pi/4) q0[23];
-rz(-pi/4) q0[24];
-cx q0[22],q0[24];
-cx q0[22],q0[23];
-rz(3*pi/4) q0[22];
-sx q0[22];
-rz(pi/2) q0[22];
-rz(-pi/4) q0[23];
-cx q0[21],q0[23];
-rz(pi/2) q0[21];
-sx q0[21];
-rz(pi/2) q0[21];
-cx q0[20],q0[21];
-rz(-pi/4) q0[21];
-cx q0[18],q0[21];
-rz(pi/4) q0[21];
-cx q0[20],q0[21];
-rz(pi/4) q0[20];
-rz(-pi/4) q0[21];
-cx q0[18],q0[21];
-cx q0[18],q0[20];
-rz(pi/4) q0[18];
-rz(-pi/4) q0[20];
-cx q0[18],q0[20];
-cx q0[19],q0[20];
-rz(pi/4) q0[21];
-cx q0[20],q0[21];
-rz(-pi/4) q0[21];
-cx q0[19],q0[21];
-rz(pi/4) q0[21];
-cx q0[20],q0[21];
-rz(pi/4) q0[20];
-rz(-pi/4) q0[21];
-cx q0[19],q0[21];
-cx q0[19],q0[20];
-rz(3*pi/4) q0[19];
-sx q0[19];
-rz(pi/2) q0[19];
-rz(-pi/4) q0[20];
-cx q0[18],q0[20];
-rz(pi/2) q0[18];
-sx q0[18];
-rz(pi/2) q0[18];
-cx q0[17],q0[18];
-rz(-pi/4) q0[18];
-cx q0[15],q0[18];
-rz(pi/4) q0[18];
-cx q0[17],q0[18];
-rz(pi/4) q0[17];
-rz(-pi/4) q0[18];
-cx q0[15],q0[18];
-cx q0[15],q0[17];
-rz(pi/4) q0[15];
-rz(-pi/4) q0[17];
-cx q0[15],q0[17];
-cx q0[16],q0[17];
-rz(pi/4) q0[18];
-cx q0[17],q0[18];
-rz(-pi/4) q0[18];
-cx q0[16],q0[18];
-rz(pi/4) q0[18];
-cx q0[17],q0[18];
-rz(pi/4) q0[17];
-rz(-pi/4) q0[18];
-cx q0[16],q0[18];
-cx q0[16],q0[17];
-rz(3*pi/4) q0[16];
-sx q0[16];
-rz(pi/2) q0[16];
-rz(-pi/4) q0[17];
-cx q0[15],q0[17];
-rz(pi/2) q0[15];
-sx q0[15];
-rz(pi/2) q0[15];
-cx q0[14],q0[15];
-rz(-pi/4) q0[15];
-cx q0[12],q0[15];
-rz(pi/4) q0[15];
-cx q0[14],q0[15];
-rz(pi/4) q0[14];
-rz(-pi/4) q0[15];
-cx q0[12],q0[15];
-cx q0[12],q0[14];
-rz(pi/4) q0[12];
-rz(-pi/4) q0[14];
-cx q0[12],q0[14];
-cx q0[13],q0[14];
-rz(pi/4) q0[15];
-cx q0[14],q0[15];
-rz(-pi/4) q0[15];
-cx q0[13],q0[15];
-rz(pi/4) q0[15];
-cx q0[14],q0[15];
-rz(pi/4) q0[14];
-rz(-pi/4) q0[15];
-cx q0[13],q0[15];
-cx q0[13],q0[14];
-rz(3*pi/4) q0[13];
-sx q0[13];
-rz(pi/2) q0[13];
-rz(-pi/4) q0[14];
-cx q0[12],q0[14];
-rz(pi/2) q0[12];
-sx q0[12];
-rz(pi/2) q0[12];
-rz(pi/4) q0[15];
-cx q0[14],q0[15];
-rz(-pi/4) q0[15];
-rz(pi/4) q0[18];
-cx q0[17],q0[18];
-rz(-pi/4) q0[18];
-rz(pi/4) q0[21];
-cx q0[20],q0[21];
-rz(-pi/4) q0[21];
-rz(pi/4) q0[24];
-cx q0[23],q0[24];
-rz(-pi/4) q0[24];
-cx q0[28],q0[13];
-rz(-pi/4) q0[13];
-cx q0[29],q0[16];
-rz(-pi/4) q0[16];
-cx q0[30],q0[19];
-rz(-pi/4) q0[19];
-cx q0[31],q0[22];
-rz(-pi/4) q0[22];
-cx q0[9],q0[11];
-rz(-pi/4) q0[11];
-rz(pi/4) q0[9];
-cx q0[9],q0[11];
-cx q0[11],q0[12];
-rz(-pi/4) q0[12];
-cx q0[9],q0[12];
-rz(pi/4) q0[12];
-cx q0[11],q0[12];
-rz(pi/4) q0[11];
-rz(-pi/4) q0[12];
-cx q0[9],q0[12];
-rz(pi/4) q0[12];
-cx q0[9],q0[11];
-rz(-pi/4) q0[11];
-rz(pi/4) q0[9];
-cx q0[9],q0[11];
-cx q0[10],q0[11];
-cx q0[11],q0[12];
-rz(-pi/4) q0[12];
-cx q0[10],q0[12];
-rz(pi/4) q0[12];
-cx q0[11],q0[12];
-rz(pi/4) q0[11];
-rz(-pi/4) q0[12];
-cx q0[10],q0[12];
-cx q0[10],q0[11];
-rz(3*pi/4) q0[10];
-sx q0[10];
-rz(pi/2) q0[10];
-rz(-pi/4) q0[11];
-rz(pi/4) q0[12];
-cx q0[27],q0[10];
-rz(-pi/4) q0[10];
-cx q0[39],q0[10];
-rz(pi/4) q0[10];
-cx q0[27],q0[10];
-rz(-pi/4) q0[10];
-rz(pi/4) q0[27];
-cx q0[39],q0[10];
-rz(3*pi/4) q0[10];
-sx q0[10];
-rz(pi/2) q0[10];
-cx q0[39],q0[27];
-rz(-pi/4) q0[27];
-rz(pi/4) q0[39];
-cx q0[39],q0[27];
-cx q0[39],q0[13];
-rz(pi/4) q0[13];
-cx q0[28],q0[13];
-rz(-pi/4) q0[13];
-rz(pi/4) q0[28];
-cx q0[39],q0[13];
-rz(pi/4) q0[13];
-cx q0[27],q0[13];
-rz(-pi/4) q0[13];
-cx q0[39],q0[28];
-rz(-pi/4) q0[28];
-rz(pi/4) q0[39];
-cx q0[39],q0[28];
-cx q0[39],q0[16];
-rz(pi/4) q0[16];
-cx q0[29],q0[16];
-rz(-pi/4) q0[16];
-rz(pi/4) q0[29];
-cx q0[39],q0[16];
-rz(pi/4) q0[16];
-cx q0[28],q0[16];
-rz(-pi/4) q0[16];
-cx q0[39],q0[29];
-rz(-pi/4) q0[29];
-rz(pi/4) q0[39];
-cx q0[39],q0[29];
-cx q0[39],q0[19];
-rz(pi/4) q0[19];
-cx q0[30],q0[19];
-rz(-pi/4) q0[19];
-rz(pi/4) q0[30];
-cx q0[39],q0[19];
-rz(pi/4) q0[19];
-cx q0[29],q0[19];
-rz(-pi/4) q0[19];
-cx q0[39],q0[30];
-rz(-pi/4) q0[30];
-rz(pi/4) q0[39];
-cx q0[39],q0[30];
-cx q0[39],q0[22];
-rz(pi/4) q0[22];
-cx q0[31],q0[22];
-rz(-pi/4) q0[22];
-rz(pi/4) q0[31];
-cx q0[39],q0[22];
-rz(pi/4) q0[22];
-cx q0[30],q0[22];
-rz(-pi/4) q0[22];
-cx q0[39],q0[31];
-rz(-pi/4) q0[31];
-rz(pi/4) q0[39];
-cx q0[39],q0[31];
-cx q0[39],q0[25];
-rz(pi/4) q0[25];
-cx q0[32],q0[25];
-rz(-pi/4) q0[25];
-rz(pi/4) q0[32];
-cx q0[39],q0[25];
-rz(pi/4) q0[25];
-cx q0[31],q0[25];
-rz(-pi/4) q0[25];
-cx q0[39],q0[32];
-rz(-pi/4) q0[32];
-rz(pi/4) q0[39];
-cx q0[39],q0[32];
-cx q0[9],q0[11];
-cx q0[11],q0[12];
-rz(-pi/4) q0[12];
-cx q0[10],q0[12];
-rz(pi/4) q0[12];
-cx q0[11],q0[12];
-rz(pi/4) q0[11];
-rz(-pi/4) q0[12];
-cx q0[10],q0[12];
-cx q0[10],q0[11];
-rz(pi/4) q0[10];
-rz(-pi/4) q0[11];
-rz(pi/4) q0[12];
-cx q0[11],q0[12];
-rz(-pi/4) q0[12];
-rz(pi/2) q0[9];
-sx q0[9];
-rz(pi/2) q0[9];
-cx q0[8],q0[9];
-rz(-pi/4) q0[9];
-cx q0[6],q0[9];
-rz(pi/4) q0[9];
-cx q0[8],q0[9];
-rz(pi/4) q0[8];
-rz(-pi/4) q0[9];
-cx q0[6],q0[9];
-cx q0[6],q0[8];
-rz(pi/4) q0[6];
-rz(-pi/4) q0[8];
-cx q0[6],q0[8];
-cx q0[7],q0[8];
-rz(pi/4) q0[9];
-cx q0[8],q0[9];
-rz(-pi/4) q0[9];
-cx q0[7],q0[9];
-rz(pi/4) q0[9];
-cx q0[8],q0[9];
-rz(pi/4) q0[8];
-rz(-pi/4) q0[9];
-cx q0[7],q0[9];
-cx q0[7],q0[8];
-rz(pi/4) q0[7];
-rz(-pi/4) q0[8];
-cx q0[6],q0[8];
-rz(pi/2) q0[6];
-sx q0[6];
-rz(pi/2) q0[6];
-cx q0[5],q0[6];
-rz(-pi/4) q0[6];
-cx q0[3],q0[6];
-rz(pi/4) q0[6];
-cx q0[5],q0[6];
-rz(pi/4) q0[5];
-rz(-pi/4) q0[6];
-cx q0[3],q0[6];
-cx q0[3],q0[5];
-rz(pi/4) q0[3];
-rz(-pi/4) q0[5];
-cx q0[3],q0[5];
-cx q0[4],q0[5];
-rz(pi/4) q0[6];
-cx q0[5],q0[6];
-rz(-pi/4) q0[6];
-cx q0[4],q0[6];
-rz(pi/4) q0[6];
-cx q0[5],q0[6];
-rz(pi/4) q0[5];
-rz(-pi/4) q0[6];
-cx q0[4],q0[6];
-cx q0[4],q0[5];
-rz(pi/4) q0[4];
-rz(-pi/4) q0[5];
-cx q0[3],q0[5];
-rz(pi/2) q0[3];
-sx q0[3];
-rz(pi/2) q0[3];
-cx q0[2],q0[3];
-rz(-pi/4) q0[3];
-cx q0[0],q0[3];
-rz(pi/4) q0[3];
-cx q0[2],q0[3];
-rz(pi/4) q0[2];
-rz(-pi/4) q0[3];
-cx q0[0],q0[3];
-cx q0[0],q0[2];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[2];
-cx q0[0],q0[2];
-cx q0[1],q0[2];
-rz(pi/4) q0[3];
-cx q0[2],q0[3];
-rz(-pi/4) q0[3];
-cx q0[1],q0[3];
-rz(pi/4) q0[3];
-cx q0[2],q0[3];
-rz(pi/4) q0[2];
-rz(-pi/4) q0[3];
-cx q0[1],q0[3];
-cx q0[1],q0[2];
-rz(pi/4) q0[1];
-rz(-pi/4) q0[2];
-cx q0[0],q0[2];
-rz(pi/4) q0[3];
-cx q0[2],q0[3];
-rz(-pi/4) q0[3];
-cx q0[1],q0[3];
-rz(pi/4) q0[3];
-cx q0[2],q0[3];
-rz(pi/4) q0[2];
-rz(-pi/4) q0[3];
-cx q0[1],q0[3];
-cx q0[1],q0[2];
-rz(pi/4) q0[1];
-rz(-pi/4) q0[2];
-rz(pi/4) q0[3];
-cx q0[2],q0[3];
-rz(-pi/4) q0[3];
-cx q0[0],q0[3];
-rz(pi/4) q0[3];
-cx q0[2],q0[3];
-rz(pi/4) q0[2];
-rz(-pi/4) q0[3];
-cx q0[0],q0[3];
-cx q0[0],q0[2];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[2];
-cx q0[0],q0[2];
-rz(3*pi/4) q0[3];
-sx q0[3];
-rz(pi/2) q0[3];
-rz(pi/4) q0[6];
-cx q0[5],q0[6];
-rz(-pi/4) q0[6];
-cx q0[4],q0[6];
-rz(pi/4) q0[6];
-cx q0[5],q0[6];
-rz(pi/4) q0[5];
-rz(-pi/4) q0[6];
-cx q0[4],q0[6];
-cx q0[4],q0[5];
-rz(pi/4) q0[4];
-rz(-pi/4) q0[5];
-rz(pi/4) q0[6];
-cx q0[5],q0[6];
-rz(-pi/4) q0[6];
-cx q0[3],q0[6];
-rz(pi/4) q0[6];
-cx q0[5],q0[6];
-rz(pi/4) q0[5];
-rz(-pi/4) q0[6];
-cx q0[3],q0[6];
-cx q0[3],q0[5];
-rz(pi/4) q0[3];
-rz(-pi/4) q0[5];
-cx q0[3],q0[5];
-rz(3*pi/4) q0[6];
-sx q0[6];
-rz(pi/2) q0[6];
-rz(pi/4) q0[9];
-cx q0[8],q0[9];
-rz(-pi/4) q0[9];
-cx q0[7],q0[9];
-rz(pi/4) q0[9];
-cx q0[8],q0[9];
-rz(pi/4) q0[8];
-rz(-pi/4) q0[9];
-cx q0[7],q0[9];
-cx q0[7],q0[8];
-rz(pi/4) q0[7];
-rz(-pi/4) q0[8];
-rz(pi/4) q0[9];
-cx q0[8],q0[9];
-rz(-pi/4) q0[9];
-cx q0[6],q0[9];
-rz(pi/4) q0[9];
-cx q0[8],q0[9];
-rz(pi/4) q0[8];
-rz(-pi/4) q0[9];
-cx q0[6],q0[9];
-cx q0[6],q0[8];
-rz(pi/4) q0[6];
-rz(-pi/4) q0[8];
-cx q0[6],q0[8];
-rz(3*pi/4) q0[9];
-sx q0[9];
-rz(pi/2) q0[9];
-cx q0[9],q0[12];
-rz(pi/4) q0[12];
-cx q0[11],q0[12];
-rz(pi/4) q0[11];
-rz(-pi/4) q0[12];
-cx q0[9],q0[12];
-rz(3*pi/4) q0[12];
-sx q0[12];
-rz(pi/2) q0[12];
-cx q0[9],q0[11];
-rz(-pi/4) q0[11];
-rz(pi/4) q0[9];
-cx q0[9],q0[11];
-x q0[40];
-cx q0[40],q0[13];
-rz(pi/4) q0[13];
-cx q0[27],q0[13];
-rz(-pi/4) q0[13];
-rz(pi/4) q0[27];
-cx q0[40],q0[13];
-rz(3*pi/4) q0[13];
-sx q0[13];
-rz(pi/2) q0[13];
-cx q0[13],q0[15];
-rz(pi/4) q0[15];
-cx q0[14],q0[15];
-rz(pi/4) q0[14];
-rz(-pi/4) q0[15];
-cx q0[13],q0[15];
-cx q0[13],q0[14];
-rz(pi/4) q0[13];
-rz(-pi/4) q0[14];
-rz(pi/4) q0[15];
-cx q0[14],q0[15];
-rz(-pi/4) q0[15];
-cx q0[12],q0[15];
-rz(pi/4) q0[15];
-cx q0[14],q0[15];
-rz(pi/4) q0[14];
-rz(-pi/4) q0[15];
-cx q0[12],q0[15];
-cx q0[12],q0[14];
-rz(pi/4) q0[12];
-rz(-pi/4) q0[14];
-cx q0[12],q0[14];
-rz(3*pi/4) q0[15];
-sx q0[15];
-rz(pi/2) q0[15];
-cx q0[40],q0[27];
-rz(-pi/4) q0[27];
-rz(pi/4) q0[40];
-cx q0[40],q0[27];
-cx q0[40],q0[16];
-rz(pi/4) q0[16];
-cx q0[28],q0[16];
-rz(-pi/4) q0[16];
-rz(pi/4) q0[28];
-cx q0[40],q0[16];
-rz(3*pi/4) q0[16];
-sx q0[16];
-rz(pi/2) q0[16];
-cx q0[16],q0[18];
-rz(pi/4) q0[18];
-cx q0[17],q0[18];
-rz(pi/4) q0[17];
-rz(-pi/4) q0[18];
-cx q0[16],q0[18];
-cx q0[16],q0[17];
-rz(pi/4) q0[16];
-rz(-pi/4) q0[17];
-rz(pi/4) q0[18];
-cx q0[17],q0[18];
-rz(-pi/4) q0[18];
-cx q0[15],q0[18];
-rz(pi/4) q0[18];
-cx q0[17],q0[18];
-rz(pi/4) q0[17];
-rz(-pi/4) q0[18];
-cx q0[15],q0[18];
-cx q0[15],q0[17];
-rz(pi/4) q0[15];
-rz(-pi/4) q0[17];
-cx q0[15],q0[17];
-rz(3*pi/4) q0[18];
-sx q0[18];
-rz(pi/2) q0[18];
-cx q0[40],q0[28];
-rz(-pi/4) q0[28];
-rz(pi/4) q0[40];
-cx q0[40],q0[28];
-cx q0[40],q0[19];
-rz(pi/4) q0[19];
-cx q0[29],q0[19];
-rz(-pi/4) q0[19];
-rz(pi/4) q0[29];
-cx q0[40],q0[19];
-rz(3*pi/4) q0[19];
-sx q0[19];
-rz(pi/2) q0[19];
-cx q0[19],q0[21];
-rz(pi/4) q0[21];
-cx q0[20],q0[21];
-rz(pi/4) q0[20];
-rz(-pi/4) q0[21];
-cx q0[19],q0[21];
-cx q0[19],q0[20];
-rz(pi/4) q0[19];
-rz(-pi/4) q0[20];
-rz(pi/4) q0[21];
-cx q0[20],q0[21];
-rz(-pi/4) q0[21];
-cx q0[18],q0[21];
-rz(pi/4) q0[21];
-cx q0[20],q0[21];
-rz(pi/4) q0[20];
-rz(-pi/4) q0[21];
-cx q0[18],q0[21];
-cx q0[18],q0[20];
-rz(pi/4) q0[18];
-rz(-pi/4) q0[20];
-cx q0[18],q0[20];
-rz(3*pi/4) q0[21];
-sx q0[21];
-rz(pi/2) q0[21];
-cx q0[40],q0[29];
-rz(-pi/4) q0[29];
-rz(pi/4) q0[40];
-cx q0[40],q0[29];
-cx q0[40],q0[22];
-rz(pi/4) q0[22];
-cx q0[30],q0[22];
-rz(-pi/4) q0[22];
-rz(pi/4) q0[30];
-cx q0[40],q0[22];
-rz(3*pi/4) q0[22];
-sx q0[22];
-rz(pi/2) q0[22];
-cx q0[22],q0[24];
-rz(pi/4) q0[24];
-cx q0[23],q0[24];
-rz(pi/4) q0[23];
-rz(-pi/4) q0[24];
-cx q0[22],q0[24];
-cx q0[22],q0[23];
-rz(pi/4) q0[22];
-rz(-pi/4) q0[23];
-rz(pi/4) q0[24];
-cx q0[23],q0[24];
-rz(-pi/4) q0[24];
-cx q0[21],q0[24];
-rz(pi/4) q0[24];
-cx q0[23],q0[24];
-rz(pi/4) q0[23];
-rz(-pi/4) q0[24];
-cx q0[21],q0[24];
-cx q0[21],q0[23];
-rz(pi/4) q0[21];
-rz(-pi/4) q0[23];
-cx q0[21],q0[23];
-rz(3*pi/4) q0[24];
-sx q0[24];
-rz(pi/2) q0[24];
-cx q0[40],q0[30];
-rz(-pi/4) q0[30];
-rz(pi/4) q0[40];
-cx q0[40],q0[30];
-cx q0[40],q0[25];
-rz(pi/4) q0[25];
-cx q0[31],q0[25];
-rz(-pi/4) q0[25];
-rz(pi/4) q0[31];
-cx q0[40],q0[25];
-rz(3*pi/4) q0[25];
-sx q0[25];
-rz(pi/2) q0[25];
-cx q0[25],q0[26];
-cx q0[24],q0[26];
-rz(pi/2) q0[24];
-sx q0[24];
-rz(pi/2) q0[24];
-cx q0[23],q0[24];
-rz(-pi/4) q0[24];
-cx q0[21],q0[24];
-rz(pi/4) q0[24];
-cx q0[23],q0[24];
-rz(pi/4) q0[23];
-rz(-pi/4) q0[24];
-cx q0[21],q0[24];
-cx q0[21],q0[23];
-rz(pi/4) q0[21];
-rz(-pi/4) q0[23];
-cx q0[21],q0[23];
-cx q0[22],q0[23];
-rz(pi/4) q0[24];
-cx q0[23],q0[24];
-rz(-pi/4) q0[24];
-cx q0[22],q0[24];
-rz(pi/4) q0[24];
-cx q0[23],q0[24];
-rz(pi/4) q0[23];
-rz(-pi/4) q0[24];
-cx q0[22],q0[24];
-cx q0[22],q0[23];
-rz(3*pi/4) q0[22];
-sx q0[22];
-rz(pi/2) q0[22];
-rz(-pi/4) q0[23];
-cx q0[21],q0[23];
-rz(pi/2) q0[21];
-sx q0[21];
-rz(pi/2) q0[21];
-cx q0[20],q0[21];
-rz(-pi/4) q0[21];
-cx q0[18],q0[21];
-rz(pi/4) q0[21];
-cx q0[20],q0[21];
-rz(pi/4) q0[20];
-rz(-pi/4) q0[21];
-cx q0[18],q0[21];
-cx q0[18],q0[20];
-rz(pi/4) q0[18];
-rz(-pi/4) q0[20];
-cx q0[18],q0[20];
-cx q0[19],q0[20];
-rz(pi/4) q0[21];
-cx q0[20],q0[21];
-rz(-pi/4) q0[21];
-cx q0[19],q0[21];
-rz(pi/4) q0[21];
-cx q0[20],q0[21];
-rz(pi/4) q0[20];
-rz(-pi/4) q0[21];
-cx q0[19],q0[21];
-cx q0[19],q0[20];
-rz(3*pi/4) q0[19];
-sx q0[19];
-rz(pi/2) q0[19];
-rz(-pi/4) q0[20];
-cx q0[18],q0[20];
-rz(pi/2) q0[18];
-sx q0[18];
-rz(pi/2) q0[18];
-cx q0[17],q0[18];
-rz(-pi/4) q0[18];
-cx q0[15],q0[18];
-rz(pi/4) q0[18];
-cx q0[17],q0[18];
-rz(pi/4) q0[17];
-rz(-pi/4) q0[18];
-cx q0[15],q0[18];
-cx q0[15],q0[17];
-rz(pi/4) q0[15];
-rz(-pi/4) q0[17];
-cx q0[15],q0[17];
-cx q0[16],q0[17];
-rz(pi/4) q0[18];
-cx q0[17],q0[18];
-rz(-pi/4) q0[18];
-cx q0[16],q0[18];
-rz(pi/4) q0[18];
-cx q0[17],q0[18];
-rz(pi/4) q0[17];
-rz(-pi/4) q0[18];
-cx q0[16],q0[18];
-cx q0[16],q0[17];
-rz(3*pi/4) q0[16];
-sx q0[16];
-rz(pi/2) q0[16];
-rz(-pi/4) q0[17];
-cx q0[15],q0[17];
-rz(pi/2) q0[15];
-sx q0[15];
-rz(pi/2) q0[15];
-cx q0[14],q0[15];
-rz(-pi/4) q0[15];
-cx q0[12],q0[15];
-rz(pi/4) q0[15];
-cx q0[14],q0[15];
-rz(pi/4) q0[14];
-rz(-pi/4) q0[15];
-cx q0[12],q0[15];
-cx q0[12],q0[14];
-rz(pi/4) q0[12];
-rz(-pi/4) q0[14];
-cx q0[12],q0[14];
-cx q0[13],q0[14];
-rz(pi/4) q0[15];
-cx q0[14],q0[15];
-rz(-pi/4) q0[15];
-cx q0[13],q0[15];
-rz(pi/4) q0[15];
-cx q0[14],q0[15];
-rz(pi/4) q0[14];
-rz(-pi/4) q0[15];
-cx q0[13],q0[15];
-cx q0[13],q0[14];
-rz(3*pi/4) q0[13];
-sx q0[13];
-rz(pi/2) q0[13];
-rz(-pi/4) q0[14];
-cx q0[12],q0[14];
-rz(pi/2) q0[12];
-sx q0[12];
-rz(pi/2) q0[12];
-cx q0[11],q0[12];
-rz(-pi/4) q0[12];
-rz(pi/4) q0[15];
-cx q0[14],q0[15];
-rz(-pi/4) q0[15];
-rz(pi/4) q0[18];
-cx q0[17],q0[18];
-rz(-pi/4) q0[18];
-rz(pi/4) q0[21];
-cx q0[20],q0[21];
-rz(-pi/4) q0[21];
-rz(pi/4) q0[24];
-cx q0[23],q0[24];
-rz(-pi/4) q0[24];
-rz(pi/2) q0[25];
-sx q0[25];
-rz(pi/2) q0[25];
-cx q0[27],q0[13];
-rz(-pi/4) q0[13];
-cx q0[28],q0[16];
-rz(-pi/4) q0[16];
-cx q0[29],q0[19];
-rz(-pi/4) q0[19];
-cx q0[30],q0[22];
-rz(-pi/4) q0[22];
-cx q0[40],q0[31];
-rz(-pi/4) q0[31];
-rz(pi/4) q0[40];
-cx q0[40],q0[31];
-cx q0[31],q0[25];
-rz(-pi/4) q0[25];
-cx q0[40],q0[13];
-rz(pi/4) q0[13];
-cx q0[27],q0[13];
-rz(-pi/4) q0[13];
-rz(pi/4) q0[27];
-cx q0[40],q0[13];
-rz(3*pi/4) q0[13];
-sx q0[13];
-rz(pi/2) q0[13];
-cx q0[13],q0[15];
-rz(pi/4) q0[15];
-cx q0[14],q0[15];
-rz(pi/4) q0[14];
-rz(-pi/4) q0[15];
-cx q0[13],q0[15];
-cx q0[13],q0[14];
-rz(pi/4) q0[13];
-rz(-pi/4) q0[14];
-rz(pi/4) q0[15];
-cx q0[14],q0[15];
-rz(-pi/4) q0[15];
-cx q0[40],q0[27];
-rz(-pi/4) q0[27];
-rz(pi/4) q0[40];
-cx q0[40],q0[27];
-cx q0[40],q0[16];
-rz(pi/4) q0[16];
-cx q0[28],q0[16];
-rz(-pi/4) q0[16];
-rz(pi/4) q0[28];
-cx q0[40],q0[16];
-rz(pi/4) q0[16];
-cx q0[27],q0[16];
-rz(-pi/4) q0[16];
-cx q0[40],q0[28];
-rz(-pi/4) q0[28];
-rz(pi/4) q0[40];
-cx q0[40],q0[28];
-cx q0[40],q0[19];
-rz(pi/4) q0[19];
-cx q0[29],q0[19];
-rz(-pi/4) q0[19];
-rz(pi/4) q0[29];
-cx q0[40],q0[19];
-rz(pi/4) q0[19];
-cx q0[28],q0[19];
-rz(-pi/4) q0[19];
-cx q0[40],q0[29];
-rz(-pi/4) q0[29];
-rz(pi/4) q0[40];
-cx q0[40],q0[29];
-cx q0[40],q0[22];
-rz(pi/4) q0[22];
-cx q0[30],q0[22];
-rz(-pi/4) q0[22];
-rz(pi/4) q0[30];
-cx q0[40],q0[22];
-rz(pi/4) q0[22];
-cx q0[29],q0[22];
-rz(-pi/4) q0[22];
-cx q0[40],q0[30];
-rz(-pi/4) q0[30];
-rz(pi/4) q0[40];
-cx q0[40],q0[30];
-cx q0[40],q0[25];
-rz(pi/4) q0[25];
-cx q0[31],q0[25];
-rz(-pi/4) q0[25];
-rz(pi/4) q0[31];
-cx q0[40],q0[25];
-rz(pi/4) q0[25];
-cx q0[30],q0[25];
-rz(-pi/4) q0[25];
-cx q0[40],q0[31];
-rz(-pi/4) q0[31];
-rz(pi/4) q0[40];
-cx q0[40],q0[31];
-cx q0[9],q0[12];
-rz(pi/4) q0[12];
-cx q0[11],q0[12];
-rz(pi/4) q0[11];
-rz(-pi/4) q0[12];
-cx q0[9],q0[12];
-rz(pi/4) q0[12];
-cx q0[9],q0[11];
-rz(-pi/4) q0[11];
-rz(pi/4) q0[9];
-cx q0[9],q0[11];
-cx q0[10],q0[11];
-cx q0[11],q0[12];
-rz(-pi/4) q0[12];
-cx q0[10],q0[12];
-rz(pi/4) q0[12];
-cx q0[11],q0[12];
-rz(pi/4) q0[11];
-rz(-pi/4) q0[12];
-cx q0[10],q0[12];
-cx q0[10],q0[11];
-rz(pi/4) q0[10];
-rz(-pi/4) q0[11];
-rz(pi/4) q0[12];
-cx q0[9],q0[11];
-cx q0[11],q0[12];
-rz(-pi/4) q0[12];
-cx q0[10],q0[12];
-rz(pi/4) q0[12];
-cx q0[11],q0[12];
-rz(pi/4) q0[11];
-rz(-pi/4) q0[12];
-cx q0[10],q0[12];
-cx q0[10],q0[11];
-rz(pi/4) q0[10];
-rz(-pi/4) q0[11];
-rz(pi/4) q0[12];
-cx q0[11],q0[12];
-rz(-pi/4) q0[12];
-rz(pi/2) q0[9];
-sx q0[9];
-rz(pi/2) q0[9];
-cx q0[8],q0[9];
-rz(-pi/4) q0[9];
-cx q0[6],q0[9];
-rz(pi/4) q0[9];
-cx q0[8],q0[9];
-rz(pi/4) q0[8];
-rz(-pi/4) q0[9];
-cx q0[6],q0[9];
-cx q0[6],q0[8];
-rz(pi/4) q0[6];
-rz(-pi/4) q0[8];
-cx q0[6],q0[8];
-cx q0[7],q0[8];
-rz(pi/4) q0[9];
-cx q0[8],q0[9];
-rz(-pi/4) q0[9];
-cx q0[7],q0[9];
-rz(pi/4) q0[9];
-cx q0[8],q0[9];
-rz(pi/4) q0[8];
-rz(-pi/4) q0[9];
-cx q0[7],q0[9];
-cx q0[7],q0[8];
-rz(pi/4) q0[7];
-rz(-pi/4) q0[8];
-cx q0[6],q0[8];
-rz(pi/2) q0[6];
-sx q0[6];
-rz(pi/2) q0[6];
-cx q0[5],q0[6];
-rz(-pi/4) q0[6];
-cx q0[3],q0[6];
-rz(pi/4) q0[6];
-cx q0[5],q0[6];
-rz(pi/4) q0[5];
-rz(-pi/4) q0[6];
-cx q0[3],q0[6];
-cx q0[3],q0[5];
-rz(pi/4) q0[3];
-rz(-pi/4) q0[5];
-cx q0[3],q0[5];
-cx q0[4],q0[5];
-rz(pi/4) q0[6];
-cx q0[5],q0[6];
-rz(-pi/4) q0[6];
-cx q0[4],q0[6];
-rz(pi/4) q0[6];
-cx q0[5],q0[6];
-rz(pi/4) q0[5];
-rz(-pi/4) q0[6];
-cx q0[4],q0[6];
-cx q0[4],q0[5];
-rz(pi/4) q0[4];
-rz(-pi/4) q0[5];
-cx q0[3],q0[5];
-rz(pi/2) q0[3];
-sx q0[3];
-rz(pi/2) q0[3];
-cx q0[2],q0[3];
-rz(-pi/4) q0[3];
-cx q0[0],q0[3];
-rz(pi/4) q0[3];
-cx q0[2],q0[3];
-rz(pi/4) q0[2];
-rz(-pi/4) q0[3];
-cx q0[0],q0[3];
-cx q0[0],q0[2];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[2];
-cx q0[0],q0[2];
-cx q0[1],q0[2];
-rz(pi/4) q0[3];
-cx q0[2],q0[3];
-rz(-pi/4) q0[3];
-cx q0[1],q0[3];
-rz(pi/4) q0[3];
-cx q0[2],q0[3];
-rz(pi/4) q0[2];
-rz(-pi/4) q0[3];
-cx q0[1],q0[3];
-cx q0[1],q0[2];
-rz(pi/4) q0[1];
-rz(-pi/4) q0[2];
-cx q0[0],q0[2];
-rz(pi/4) q0[3];
-cx q0[2],q0[3];
-rz(-pi/4) q0[3];
-cx q0[1],q0[3];
-rz(pi/4) q0[3];
-cx q0[2],q0[3];
-rz(pi/4) q0[2];
-rz(-pi/4) q0[3];
-cx q0[1],q0[3];
-cx q0[1],q0[2];
-rz(pi/4) q0[1];
-rz(-pi/4) q0[2];
-rz(pi/4) q0[3];
-cx q0[2],q0[3];
-rz(-pi/4) q0[3];
-cx q0[0],q0[3];
-rz(pi/4) q0[3];
-cx q0[2],q0[3];
-rz(pi/4) q0[2];
-rz(-pi/4) q0[3];
-cx q0[0],q0[3];
-cx q0[0],q0[2];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[2];
-cx q0[0],q0[2];
-rz(3*pi/4) q0[3];
-sx q0[3];
-rz(pi/2) q0[3];
-rz(pi/4) q0[6];
-cx q0[5],q0[6];
-rz(-pi/4) q0[6];
-cx q0[4],q0[6];
-rz(pi/4) q0[6];
-cx q0[5],q0[6];
-rz(pi/4) q0[5];
-rz(-pi/4) q0[6];
-cx q0[4],q0[6];
-cx q0[4],q0[5];
-rz(pi/4) q0[4];
-rz(-pi/4) q0[5];
-rz(pi/4) q0[6];
-cx q0[5],q0[6];
-rz(-pi/4) q0[6];
-cx q0[3],q0[6];
-rz(pi/4) q0[6];
-cx q0[5],q0[6];
-rz(pi/4) q0[5];
-rz(-pi/4) q0[6];
-cx q0[3],q0[6];
-cx q0[3],q0[5];
-rz(pi/4) q0[3];
-rz(-pi/4) q0[5];
-cx q0[3],q0[5];
-rz(3*pi/4) q0[6];
-sx q0[6];
-rz(pi/2) q0[6];
-rz(pi/4) q0[9];
-cx q0[8],q0[9];
-rz(-pi/4) q0[9];
-cx q0[7],q0[9];
-rz(pi/4) q0[9];
-cx q0[8],q0[9];
-rz(pi/4) q0[8];
-rz(-pi/4) q0[9];
-cx q0[7],q0[9];
-cx q0[7],q0[8];
-rz(pi/4) q0[7];
-rz(-pi/4) q0[8];
-rz(pi/4) q0[9];
-cx q0[8],q0[9];
-rz(-pi/4) q0[9];
-cx q0[6],q0[9];
-rz(pi/4) q0[9];
-cx q0[8],q0[9];
-rz(pi/4) q0[8];
-rz(-pi/4) q0[9];
-cx q0[6],q0[9];
-cx q0[6],q0[8];
-rz(pi/4) q0[6];
-rz(-pi/4) q0[8];
-cx q0[6],q0[8];
-rz(3*pi/4) q0[9];
-sx q0[9];
-rz(pi/2) q0[9];
-cx q0[9],q0[12];
-rz(pi/4) q0[12];
-cx q0[11],q0[12];
-rz(pi/4) q0[11];
-rz(-pi/4) q0[12];
-cx q0[9],q0[12];
-rz(3*pi/4) q0[12];
-sx q0[12];
-rz(pi/2) q0[12];
-cx q0[12],q0[15];
-rz(pi/4) q0[15];
-cx q0[14],q0[15];
-rz(pi/4) q0[14];
-rz(-pi/4) q0[15];
-cx q0[12],q0[15];
-cx q0[12],q0[14];
-rz(pi/4) q0[12];
-rz(-pi/4) q0[14];
-cx q0[12],q0[14];
-rz(3*pi/4) q0[15];
-sx q0[15];
-rz(pi/2) q0[15];
-cx q0[9],q0[11];
-rz(-pi/4) q0[11];
-rz(pi/4) q0[9];
-cx q0[9],q0[11];
-cx q0[41],q0[16];
-rz(pi/4) q0[16];
-cx q0[27],q0[16];
-rz(-pi/4) q0[16];
-rz(pi/4) q0[27];
-cx q0[41],q0[16];
-rz(3*pi/4) q0[16];
-sx q0[16];
-rz(pi/2) q0[16];
-cx q0[16],q0[18];
-rz(pi/4) q0[18];
-cx q0[17],q0[18];
-rz(pi/4) q0[17];
-rz(-pi/4) q0[18];
-cx q0[16],q0[18];
-cx q0[16],q0[17];
-rz(pi/4) q0[16];
-rz(-pi/4) q0[17];
-rz(pi/4) q0[18];
-cx q0[17],q0[18];
-rz(-pi/4) q0[18];
-cx q0[15],q0[18];
-rz(pi/4) q0[18];
-cx q0[17],q0[18];
-rz(pi/4) q0[17];
-rz(-pi/4) q0[18];
-cx q0[15],q0[18];
-cx q0[15],q0[17];
-rz(pi/4) q0[15];
-rz(-pi/4) q0[17];
-cx q0[15],q0[17];
-rz(3*pi/4) q0[18];
-sx q0[18];
-rz(pi/2) q0[18];
-cx q0[41],q0[27];
-rz(-pi/4) q0[27];
-rz(pi/4) q0[41];
-cx q0[41],q0[27];
-cx q0[41],q0[19];
-rz(pi/4) q0[19];
-cx q0[28],q0[19];
-rz(-pi/4) q0[19];
-rz(pi/4) q0[28];
-cx q0[41],q0[19];
-rz(3*pi/4) q0[19];
-sx q0[19];
-rz(pi/2) q0[19];
-cx q0[19],q0[21];
-rz(pi/4) q0[21];
-cx q0[20],q0[21];
-rz(pi/4) q0[20];
-rz(-pi/4) q0[21];
-cx q0[19],q0[21];
-cx q0[19],q0[20];
-rz(pi/4) q0[19];
-rz(-pi/4) q0[20];
-rz(pi/4) q0[21];
-cx q0[20],q0[21];
-rz(-pi/4) q0[21];
-cx q0[18],q0[21];
-rz(pi/4) q0[21];
-cx q0[20],q0[21];
-rz(pi/4) q0[20];
-rz(-pi/4) q0[21];
-cx q0[18],q0[21];
-cx q0[18],q0[20];
-rz(pi/4) q0[18];
-rz(-pi/4) q0[20];
-cx q0[18],q0[20];
-rz(3*pi/4) q0[21];
-sx q0[21];
-rz(pi/2) q0[21];
-cx q0[41],q0[28];
-rz(-pi/4) q0[28];
-rz(pi/4) q0[41];
-cx q0[41],q0[28];
-cx q0[41],q0[22];
-rz(pi/4) q0[22];
-cx q0[29],q0[22];
-rz(-pi/4) q0[22];
-rz(pi/4) q0[29];
-cx q0[41],q0[22];
-rz(3*pi/4) q0[22];
-sx q0[22];
-rz(pi/2) q0[22];
-cx q0[22],q0[24];
-rz(pi/4) q0[24];
-cx q0[23],q0[24];
-rz(pi/4) q0[23];
-rz(-pi/4) q0[24];
-cx q0[22],q0[24];
-cx q0[22],q0[23];
-rz(pi/4) q0[22];
-rz(-pi/4) q0[23];
-rz(pi/4) q0[24];
-cx q0[23],q0[24];
-rz(-pi/4) q0[24];
-cx q0[21],q0[24];
-rz(pi/4) q0[24];
-cx q0[23],q0[24];
-rz(pi/4) q0[23];
-rz(-pi/4) q0[24];
-cx q0[21],q0[24];
-cx q0[21],q0[23];
-rz(pi/4) q0[21];
-rz(-pi/4) q0[23];
-cx q0[21],q0[23];
-rz(3*pi/4) q0[24];
-sx q0[24];
-rz(pi/2) q0[24];
-cx q0[41],q0[29];
-rz(-pi/4) q0[29];
-rz(pi/4) q0[41];
-cx q0[41],q0[29];
-cx q0[41],q0[25];
-rz(pi/4) q0[25];
-cx q0[30],q0[25];
-rz(-pi/4) q0[25];
-rz(pi/4) q0[30];
-cx q0[41],q0[25];
-rz(3*pi/4) q0[25];
-sx q0[25];
-rz(pi/2) q0[25];
-cx q0[25],q0[26];
-cx q0[24],q0[26];
-rz(pi/2) q0[24];
-sx q0[24];
-rz(pi/2) q0[24];
-cx q0[23],q0[24];
-rz(-pi/4) q0[24];
-cx q0[21],q0[24];
-rz(pi/4) q0[24];
-cx q0[23],q0[24];
-rz(pi/4) q0[23];
-rz(-pi/4) q0[24];
-cx q0[21],q0[24];
-cx q0[21],q0[23];
-rz(pi/4) q0[21];
-rz(-pi/4) q0[23];
-cx q0[21],q0[23];
-cx q0[22],q0[23];
-rz(pi/4) q0[24];
-cx q0[23],q0[24];
-rz(-pi/4) q0[24];
-cx q0[22],q0[24];
-rz(pi/4) q0[24];
-cx q0[23],q0[24];
-rz(pi/4) q0[23];
-rz(-pi/4) q0[24];
-cx q0[22],q0[24];
-cx q0[22],q0[23];
-rz(3*pi/4) q0[22];
-sx q0[22];
-rz(pi/2) q0[22];
-rz(-pi/4) q0[23];
-cx q0[21],q0[23];
-rz(pi/2) q0[21];
-sx q0[21];
-rz(pi/2) q0[21];
-cx q0[20],q0[21];
-rz(-pi/4) q0[21];
-cx q0[18],q0[21];
-rz(pi/4) q0[21];
-cx q0[20],q0[21];
-rz(pi/4) q0[20];
-rz(-pi/4) q0[21];
-cx q0[18],q0[21];
-cx q0[18],q0[20];
-rz(pi/4) q0[18];
-rz(-pi/4) q0[20];
-cx q0[18],q0[20];
-cx q0[19],q0[20];
-rz(pi/4) q0[21];
-cx q0[20],q0[21];
-rz(-pi/4) q0[21];
-cx q0[19],q0[21];
-rz(pi/4) q0[21];
-cx q0[20],q0[21];
-rz(pi/4) q0[20];
-rz(-pi/4) q0[21];
-cx q0[19],q0[21];
-cx q0[19],q0[20];
-rz(3*pi/4) q0[19];
-sx q0[19];
-rz(pi/2) q0[19];
-rz(-pi/4) q0[20];
-cx q0[18],q0[20];
-rz(pi/2) q0[18];
-sx q0[18];
-rz(pi/2) q0[18];
-cx q0[17],q0[18];
-rz(-pi/4) q0[18];
-cx q0[15],q0[18];
-rz(pi/4) q0[18];
-cx q0[17],q0[18];
-rz(pi/4) q0[17];
-rz(-pi/4) q0[18];
-cx q0[15],q0[18];
-cx q0[15],q0[17];
-rz(pi/4) q0[15];
-rz(-pi/4) q0[17];
-cx q0[15],q0[17];
-cx q0[16],q0[17];
-rz(pi/4) q0[18];
-cx q0[17],q0[18];
-rz(-pi/4) q0[18];
-cx q0[16],q0[18];
-rz(pi/4) q0[18];
-cx q0[17],q0[18];
-rz(pi/4) q0[17];
-rz(-pi/4) q0[18];
-cx q0[16],q0[18];
-cx q0[16],q0[17];
-rz(3*pi/4) q0[16];
-sx q0[16];
-rz(pi/2) q0[16];
-rz(-pi/4) q0[17];
-cx q0[15],q0[17];
-rz(pi/2) q0[15];
-sx q0[15];
-rz(pi/2) q0[15];
-cx q0[14],q0[15];
-rz(-pi/4) q0[15];
-cx q0[12],q0[15];
-rz(pi/4) q0[15];
-cx q0[14],q0[15];
-rz(pi/4) q0[14];
-rz(-pi/4) q0[15];
-cx q0[12],q0[15];
-cx q0[12],q0[14];
-rz(pi/4) q0[12];
-rz(-pi/4) q0[14];
-cx q0[12],q0[14];
-cx q0[13],q0[14];
-rz(pi/4) q0[15];
-cx q0[14],q0[15];
-rz(-pi/4) q0[15];
-cx q0[13],q0[15];
-rz(pi/4) q0[15];
-cx q0[14],q0[15];
-rz(pi/4) q0[14];
-rz(-pi/4) q0[15];
-cx q0[13],q0[15];
-cx q0[13],q0[14];
-rz(pi/4) q0[13];
-rz(-pi/4) q0[14];
-cx q0[12],q0[14];
-rz(pi/2) q0[12];
-sx q0[12];
-rz(pi/2) q0[12];
-cx q0[11],q0[12];
-rz(-pi/4) q0[12];
-rz(pi/4) q0[15];
-cx q0[14],q0[15];
-rz(-pi/4) q0[15];
-cx q0[13],q0[15];
-rz(pi/4) q0[15];
-cx q0[14],q0[15];
-rz(pi/4) q0[14];
-rz(-pi/4) q0[15];
-cx q0[13],q0[15];
-cx q0[13],q0[14];
-rz(pi/4) q0[13];
-rz(-pi/4) q0[14];
-rz(pi/4) q0[15];
-cx q0[14],q0[15];
-rz(-pi/4) q0[15];
-rz(pi/4) q0[18];
-cx q0[17],q0[18];
-rz(-pi/4) q0[18];
-rz(pi/4) q0[21];
-cx q0[20],q0[21];
-rz(-pi/4) q0[21];
-rz(pi/4) q0[24];
-cx q0[23],q0[24];
-rz(-pi/4) q0[24];
-rz(pi/2) q0[25];
-sx q0[25];
-rz(pi/2) q0[25];
-cx q0[27],q0[16];
-rz(-pi/4) q0[16];
-cx q0[28],q0[19];
-rz(-pi/4) q0[19];
-cx q0[29],q0[22];
-rz(-pi/4) q0[22];
-cx q0[41],q0[30];
-rz(-pi/4) q0[30];
-rz(pi/4) q0[41];
-cx q0[41],q0[30];
-cx q0[30],q0[25];
-rz(-pi/4) q0[25];
-cx q0[41],q0[16];
-rz(pi/4) q0[16];
-cx q0[27],q0[16];
-rz(-pi/4) q0[16];
-rz(pi/4) q0[27];
-cx q0[41],q0[16];
-rz(3*pi/4) q0[16];
-sx q0[16];
-rz(pi/2) q0[16];
-cx q0[16],q0[18];
-rz(pi/4) q0[18];
-cx q0[17],q0[18];
-rz(pi/4) q0[17];
-rz(-pi/4) q0[18];
-cx q0[16],q0[18];
-cx q0[16],q0[17];
-rz(pi/4) q0[16];
-rz(-pi/4) q0[17];
-rz(pi/4) q0[18];
-cx q0[17],q0[18];
-rz(-pi/4) q0[18];
-cx q0[41],q0[27];
-rz(-pi/4) q0[27];
-rz(pi/4) q0[41];
-cx q0[41],q0[27];
-cx q0[41],q0[19];
-rz(pi/4) q0[19];
-cx q0[28],q0[19];
-rz(-pi/4) q0[19];
-rz(pi/4) q0[28];
-cx q0[41],q0[19];
-rz(pi/4) q0[19];
-cx q0[27],q0[19];
-rz(-pi/4) q0[19];
-cx q0[41],q0[28];
-rz(-pi/4) q0[28];
-rz(pi/4) q0[41];
-cx q0[41],q0[28];
-cx q0[41],q0[22];
-rz(pi/4) q0[22];
-cx q0[29],q0[22];
-rz(-pi/4) q0[22];
-rz(pi/4) q0[29];
-cx q0[41],q0[22];
-rz(pi/4) q0[22];
-cx q0[28],q0[22];
-rz(-pi/4) q0[22];
-cx q0[41],q0[29];
-rz(-pi/4) q0[29];
-rz(pi/4) q0[41];
-cx q0[41],q0[29];
-cx q0[41],q0[25];
-rz(pi/4) q0[25];
-cx q0[30],q0[25];
-rz(-pi/4) q0[25];
-rz(pi/4) q0[30];
-cx q0[41],q0[25];
-rz(pi/4) q0[25];
-cx q0[29],q0[25];
-rz(-pi/4) q0[25];
-cx q0[41],q0[30];
-rz(-pi/4) q0[30];
-rz(pi/4) q0[41];
-cx q0[41],q0[30];
-cx q0[9],q0[12];
-rz(pi/4) q0[12];
-cx q0[11],q0[12];
-rz(pi/4) q0[11];
-rz(-pi/4) q0[12];
-cx q0[9],q0[12];
-rz(pi/4) q0[12];
-cx q0[9],q0[11];
-rz(-pi/4) q0[11];
-rz(pi/4) q0[9];
-cx q0[9],q0[11];
-cx q0[10],q0[11];
-cx q0[11],q0[12];
-rz(-pi/4) q0[12];
-cx q0[10],q0[12];
-rz(pi/4) q0[12];
-cx q0[11],q0[12];
-rz(pi/4) q0[11];
-rz(-pi/4) q0[12];
-cx q0[10],q0[12];
-cx q0[10],q0[11];
-rz(pi/4) q0[10];
-rz(-pi/4) q0[11];
-rz(pi/4) q0[12];
-cx q0[9],q0[11];
-cx q0[11],q0[12];
-rz(-pi/4) q0[12];
-cx q0[10],q0[12];
-rz(pi/4) q0[12];
-cx q0[11],q0[12];
-rz(pi/4) q0[11];
-rz(-pi/4) q0[12];
-cx q0[10],q0[12];
-cx q0[10],q0[11];
-rz(pi/4) q0[10];
-rz(-pi/4) q0[11];
-rz(pi/4) q0[12];
-cx q0[11],q0[12];
-rz(-pi/4) q0[12];
-rz(pi/2) q0[9];
-sx q0[9];
-rz(pi/2) q0[9];
-cx q0[8],q0[9];
-rz(-pi/4) q0[9];
-cx q0[6],q0[9];
-rz(pi/4) q0[9];
-cx q0[8],q0[9];
-rz(pi/4) q0[8];
-rz(-pi/4) q0[9];
-cx q0[6],q0[9];
-cx q0[6],q0[8];
-rz(pi/4) q0[6];
-rz(-pi/4) q0[8];
-cx q0[6],q0[8];
-cx q0[7],q0[8];
-rz(pi/4) q0[9];
-cx q0[8],q0[9];
-rz(-pi/4) q0[9];
-cx q0[7],q0[9];
-rz(pi/4) q0[9];
-cx q0[8],q0[9];
-rz(pi/4) q0[8];
-rz(-pi/4) q0[9];
-cx q0[7],q0[9];
-cx q0[7],q0[8];
-rz(pi/4) q0[7];
-rz(-pi/4) q0[8];
-cx q0[6],q0[8];
-rz(pi/2) q0[6];
-sx q0[6];
-rz(pi/2) q0[6];
-cx q0[5],q0[6];
-rz(-pi/4) q0[6];
-cx q0[3],q0[6];
-rz(pi/4) q0[6];
-cx q0[5],q0[6];
-rz(pi/4) q0[5];
-rz(-pi/4) q0[6];
-cx q0[3],q0[6];
-cx q0[3],q0[5];
-rz(pi/4) q0[3];
-rz(-pi/4) q0[5];
-cx q0[3],q0[5];
-cx q0[4],q0[5];
-rz(pi/4) q0[6];
-cx q0[5],q0[6];
-rz(-pi/4) q0[6];
-cx q0[4],q0[6];
-rz(pi/4) q0[6];
-cx q0[5],q0[6];
-rz(pi/4) q0[5];
-rz(-pi/4) q0[6];
-cx q0[4],q0[6];
-cx q0[4],q0[5];
-rz(pi/4) q0[4];
-rz(-pi/4) q0[5];
-cx q0[3],q0[5];
-rz(pi/2) q0[3];
-sx q0[3];
-rz(pi/2) q0[3];
-cx q0[2],q0[3];
-rz(-pi/4) q0[3];
-cx q0[0],q0[3];
-rz(pi/4) q0[3];
-cx q0[2],q0[3];
-rz(pi/4) q0[2];
-rz(-pi/4) q0[3];
-cx q0[0],q0[3];
-cx q0[0],q0[2];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[2];
-cx q0[0],q0[2];
-cx q0[1],q0[2];
-rz(pi/4) q0[3];
-cx q0[2],q0[3];
-rz(-pi/4) q0[3];
-cx q0[1],q0[3];
-rz(pi/4) q0[3];
-cx q0[2],q0[3];
-rz(pi/4) q0[2];
-rz(-pi/4) q0[3];
-cx q0[1],q0[3];
-cx q0[1],q0[2];
-rz(pi/4) q0[1];
-rz(-pi/4) q0[2];
-cx q0[0],q0[2];
-rz(pi/4) q0[3];
-cx q0[2],q0[3];
-rz(-pi/4) q0[3];
-cx q0[1],q0[3];
-rz(pi/4) q0[3];
-cx q0[2],q0[3];
-rz(pi/4) q0[2];
-rz(-pi/4) q0[3];
-cx q0[1],q0[3];
-cx q0[1],q0[2];
-rz(pi/4) q0[1];
-rz(-pi/4) q0[2];
-rz(pi/4) q0[3];
-cx q0[2],q0[3];
-rz(-pi/4) q0[3];
-cx q0[0],q0[3];
-rz(pi/4) q0[3];
-cx q0[2],q0[3];
-rz(pi/4) q0[2];
-rz(-pi/4) q0[3];
-cx q0[0],q0[3];
-cx q0[0],q0[2];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[2];
-cx q0[0],q0[2];
-rz(3*pi/4) q0[3];
-sx q0[3];
-rz(pi/2) q0[3];
-rz(pi/4) q0[6];
-cx q0[5],q0[6];
-rz(-pi/4) q0[6];
-cx q0[4],q0[6];
-rz(pi/4) q0[6];
-cx q0[5],q0[6];
-rz(pi/4) q0[5];
-rz(-pi/4) q0[6];
-cx q0[4],q0[6];
-cx q0[4],q0[5];
-rz(pi/4) q0[4];
-rz(-pi/4) q0[5];
-rz(pi/4) q0[6];
-cx q0[5],q0[6];
-rz(-pi/4) q0[6];
-cx q0[3],q0[6];
-rz(pi/4) q0[6];
-cx q0[5],q0[6];
-rz(pi/4) q0[5];
-rz(-pi/4) q0[6];
-cx q0[3],q0[6];
-cx q0[3],q0[5];
-rz(pi/4) q0[3];
-rz(-pi/4) q0[5];
-cx q0[3],q0[5];
-rz(3*pi/4) q0[6];
-sx q0[6];
-rz(pi/2) q0[6];
-rz(pi/4) q0[9];
-cx q0[8],q0[9];
-rz(-pi/4) q0[9];
-cx q0[7],q0[9];
-rz(pi/4) q0[9];
-cx q0[8],q0[9];
-rz(pi/4) q0[8];
-rz(-pi/4) q0[9];
-cx q0[7],q0[9];
-cx q0[7],q0[8];
-rz(pi/4) q0[7];
-rz(-pi/4) q0[8];
-rz(pi/4) q0[9];
-cx q0[8],q0[9];
-rz(-pi/4) q0[9];
-cx q0[6],q0[9];
-rz(pi/4) q0[9];
-cx q0[8],q0[9];
-rz(pi/4) q0[8];
-rz(-pi/4) q0[9];
-cx q0[6],q0[9];
-cx q0[6],q0[8];
-rz(pi/4) q0[6];
-rz(-pi/4) q0[8];
-cx q0[6],q0[8];
-rz(3*pi/4) q0[9];
-sx q0[9];
-rz(pi/2) q0[9];
-cx q0[9],q0[12];
-rz(pi/4) q0[12];
-cx q0[11],q0[12];
-rz(pi/4) q0[11];
-rz(-pi/4) q0[12];
-cx q0[9],q0[12];
-rz(3*pi/4) q0[12];
-sx q0[12];
-rz(pi/2) q0[12];
-cx q0[12],q0[15];
-rz(pi/4) q0[15];
-cx q0[14],q0[15];
-rz(pi/4) q0[14];
-rz(-pi/4) q0[15];
-cx q0[12],q0[15];
-cx q0[12],q0[14];
-rz(pi/4) q0[12];
-rz(-pi/4) q0[14];
-cx q0[12],q0[14];
-rz(3*pi/4) q0[15];
-sx q0[15];
-rz(pi/2) q0[15];
-cx q0[15],q0[18];
-rz(pi/4) q0[18];
-cx q0[17],q0[18];
-rz(pi/4) q0[17];
-rz(-pi/4) q0[18];
-cx q0[15],q0[18];
-cx q0[15],q0[17];
-rz(pi/4) q0[15];
-rz(-pi/4) q0[17];
-cx q0[15],q0[17];
-rz(3*pi/4) q0[18];
-sx q0[18];
-rz(pi/2) q0[18];
-cx q0[9],q0[11];
-rz(-pi/4) q0[11];
-rz(pi/4) q0[9];
-cx q0[9],q0[11];
-cx q0[42],q0[19];
-rz(pi/4) q0[19];
-cx q0[27],q0[19];
-rz(-pi/4) q0[19];
-rz(pi/4) q0[27];
-cx q0[42],q0[19];
-rz(3*pi/4) q0[19];
-sx q0[19];
-rz(pi/2) q0[19];
-cx q0[19],q0[21];
-rz(pi/4) q0[21];
-cx q0[20],q0[21];
-rz(pi/4) q0[20];
-rz(-pi/4) q0[21];
-cx q0[19],q0[21];
-cx q0[19],q0[20];
-rz(pi/4) q0[19];
-rz(-pi/4) q0[20];
-rz(pi/4) q0[21];
-cx q0[20],q0[21];
-rz(-pi/4) q0[21];
-cx q0[18],q0[21];
-rz(pi/4) q0[21];
-cx q0[20],q0[21];
-rz(pi/4) q0[20];
-rz(-pi/4) q0[21];
-cx q0[18],q0[21];
-cx q0[18],q0[20];
-rz(pi/4) q0[18];
-rz(-pi/4) q0[20];
-cx q0[18],q0[20];
-rz(3*pi/4) q0[21];
-sx q0[21];
-rz(pi/2) q0[21];
-cx q0[42],q0[27];
-rz(-pi/4) q0[27];
-rz(pi/4) q0[42];
-cx q0[42],q0[27];
-cx q0[42],q0[22];
-rz(pi/4) q0[22];
-cx q0[28],q0[22];
-rz(-pi/4) q0[22];
-rz(pi/4) q0[28];
-cx q0[42],q0[22];
-rz(3*pi/4) q0[22];
-sx q0[22];
-rz(pi/2) q0[22];
-cx q0[22],q0[24];
-rz(pi/4) q0[24];
-cx q0[23],q0[24];
-rz(pi/4) q0[23];
-rz(-pi/4) q0[24];
-cx q0[22],q0[24];
-cx q0[22],q0[23];
-rz(pi/4) q0[22];
-rz(-pi/4) q0[23];
-rz(pi/4) q0[24];
-cx q0[23],q0[24];
-rz(-pi/4) q0[24];
-cx q0[21],q0[24];
-rz(pi/4) q0[24];
-cx q0[23],q0[24];
-rz(pi/4) q0[23];
-rz(-pi/4) q0[24];
-cx q0[21],q0[24];
-cx q0[21],q0[23];
-rz(pi/4) q0[21];
-rz(-pi/4) q0[23];
-cx q0[21],q0[23];
-rz(3*pi/4) q0[24];
-sx q0[24];
-rz(pi/2) q0[24];
-cx q0[42],q0[28];
-rz(-pi/4) q0[28];
-rz(pi/4) q0[42];
-cx q0[42],q0[28];
-cx q0[42],q0[25];
-rz(pi/4) q0[25];
-cx q0[29],q0[25];
-rz(-pi/4) q0[25];
-rz(pi/4) q0[29];
-cx q0[42],q0[25];
-rz(3*pi/4) q0[25];
-sx q0[25];
-rz(pi/2) q0[25];
-cx q0[25],q0[26];
-cx q0[24],q0[26];
-rz(pi/2) q0[24];
-sx q0[24];
-rz(pi/2) q0[24];
-cx q0[23],q0[24];
-rz(-pi/4) q0[24];
-cx q0[21],q0[24];
-rz(pi/4) q0[24];
-cx q0[23],q0[24];
-rz(pi/4) q0[23];
-rz(-pi/4) q0[24];
-cx q0[21],q0[24];
-cx q0[21],q0[23];
-rz(pi/4) q0[21];
-rz(-pi/4) q0[23];
-cx q0[21],q0[23];
-cx q0[22],q0[23];
-rz(pi/4) q0[24];
-cx q0[23],q0[24];
-rz(-pi/4) q0[24];
-cx q0[22],q0[24];
-rz(pi/4) q0[24];
-cx q0[23],q0[24];
-rz(pi/4) q0[23];
-rz(-pi/4) q0[24];
-cx q0[22],q0[24];
-cx q0[22],q0[23];
-rz(3*pi/4) q0[22];
-sx q0[22];
-rz(pi/2) q0[22];
-rz(-pi/4) q0[23];
-cx q0[21],q0[23];
-rz(pi/2) q0[21];
-sx q0[21];
-rz(pi/2) q0[21];
-cx q0[20],q0[21];
-rz(-pi/4) q0[21];
-cx q0[18],q0[21];
-rz(pi/4) q0[21];
-cx q0[20],q0[21];
-rz(pi/4) q0[20];
-rz(-pi/4) q0[21];
-cx q0[18],q0[21];
-cx q0[18],q0[20];
-rz(pi/4) q0[18];
-rz(-pi/4) q0[20];
-cx q0[18],q0[20];
-cx q0[19],q0[20];
-rz(pi/4) q0[21];
-cx q0[20],q0[21];
-rz(-pi/4) q0[21];
-cx q0[19],q0[21];
-rz(pi/4) q0[21];
-cx q0[20],q0[21];
-rz(pi/4) q0[20];
-rz(-pi/4) q0[21];
-cx q0[19],q0[21];
-cx q0[19],q0[20];
-rz(3*pi/4) q0[19];
-sx q0[19];
-rz(pi/2) q0[19];
-rz(-pi/4) q0[20];
-cx q0[18],q0[20];
-rz(pi/2) q0[18];
-sx q0[18];
-rz(pi/2) q0[18];
-cx q0[17],q0[18];
-rz(-pi/4) q0[18];
-cx q0[15],q0[18];
-rz(pi/4) q0[18];
-cx q0[17],q0[18];
-rz(pi/4) q0[17];
-rz(-pi/4) q0[18];
-cx q0[15],q0[18];
-cx q0[15],q0[17];
-rz(pi/4) q0[15];
-rz(-pi/4) q0[17];
-cx q0[15],q0[17];
-cx q0[16],q0[17];
-rz(pi/4) q0[18];
-cx q0[17],q0[18];
-rz(-pi/4) q0[18];
-cx q0[16],q0[18];
-rz(pi/4) q0[18];
-cx q0[17],q0[18];
-rz(pi/4) q0[17];
-rz(-pi/4) q0[18];
-cx q0[16],q0[18];
-cx q0[16],q0[17];
-rz(pi/4) q0[16];
-rz(-pi/4) q0[17];
-cx q0[15],q0[17];
-rz(pi/2) q0[15];
-sx q0[15];
-rz(pi/2) q0[15];
-cx q0[14],q0[15];
-rz(-pi/4) q0[15];
-cx q0[12],q0[15];
-rz(pi/4) q0[15];
-cx q0[14],q0[15];
-rz(pi/4) q0[14];
-rz(-pi/4) q0[15];
-cx q0[12],q0[15];
-cx q0[12],q0[14];
-rz(pi/4) q0[12];
-rz(-pi/4) q0[14];
-cx q0[12],q0[14];
-cx q0[13],q0[14];
-rz(pi/4) q0[15];
-cx q0[14],q0[15];
-rz(-pi/4) q0[15];
-cx q0[13],q0[15];
-rz(pi/4) q0[15];
-cx q0[14],q0[15];
-rz(pi/4) q0[14];
-rz(-pi/4) q0[15];
-cx q0[13],q0[15];
-cx q0[13],q0[14];
-rz(pi/4) q0[13];
-rz(-pi/4) q0[14];
-cx q0[12],q0[14];
-rz(pi/2) q0[12];
-sx q0[12];
-rz(pi/2) q0[12];
-cx q0[11],q0[12];
-rz(-pi/4) q0[12];
-rz(pi/4) q0[15];
-cx q0[14],q0[15];
-rz(-pi/4) q0[15];
-cx q0[13],q0[15];
-rz(pi/4) q0[15];
-cx q0[14],q0[15];
-rz(pi/4) q0[14];
-rz(-pi/4) q0[15];
-cx q0[13],q0[15];
-cx q0[13],q0[14];
-rz(pi/4) q0[13];
-rz(-pi/4) q0[14];
-rz(pi/4) q0[15];
-cx q0[14],q0[15];
-rz(-pi/4) q0[15];
-rz(pi/4) q0[18];
-cx q0[17],q0[18];
-rz(-pi/4) q0[18];
-cx q0[16],q0[18];
-rz(pi/4) q0[18];
-cx q0[17],q0[18];
-rz(pi/4) q0[17];
-rz(-pi/4) q0[18];
-cx q0[16],q0[18];
-cx q0[16],q0[17];
-rz(pi/4) q0[16];
-rz(-pi/4) q0[17];
-rz(pi/4) q0[18];
-cx q0[17],q0[18];
-rz(-pi/4) q0[18];
-rz(pi/4) q0[21];
-cx q0[20],q0[21];
-rz(-pi/4) q0[21];
-rz(pi/4) q0[24];
-cx q0[23],q0[24];
-rz(-pi/4) q0[24];
-rz(pi/2) q0[25];
-sx q0[25];
-rz(pi/2) q0[25];
-cx q0[27],q0[19];
-rz(-pi/4) q0[19];
-cx q0[28],q0[22];
-rz(-pi/4) q0[22];
-cx q0[42],q0[29];
-rz(-pi/4) q0[29];
-rz(pi/4) q0[42];
-cx q0[42],q0[29];
-cx q0[29],q0[25];
-rz(-pi/4) q0[25];
-cx q0[42],q0[19];
-rz(pi/4) q0[19];
-cx q0[27],q0[19];
-rz(-pi/4) q0[19];
-rz(pi/4) q0[27];
-cx q0[42],q0[19];
-rz(3*pi/4) q0[19];
-sx q0[19];
-rz(pi/2) q0[19];
-cx q0[19],q0[21];
-rz(pi/4) q0[21];
-cx q0[20],q0[21];
-rz(pi/4) q0[20];
-rz(-pi/4) q0[21];
-cx q0[19],q0[21];
-cx q0[19],q0[20];
-rz(pi/4) q0[19];
-rz(-pi/4) q0[20];
-rz(pi/4) q0[21];
-cx q0[20],q0[21];
-rz(-pi/4) q0[21];
-cx q0[42],q0[27];
-rz(-pi/4) q0[27];
-rz(pi/4) q0[42];
-cx q0[42],q0[27];
-cx q0[42],q0[22];
-rz(pi/4) q0[22];
-cx q0[28],q0[22];
-rz(-pi/4) q0[22];
-rz(pi/4) q0[28];
-cx q0[42],q0[22];
-rz(pi/4) q0[22];
-cx q0[27],q0[22];
-rz(-pi/4) q0[22];
-cx q0[42],q0[28];
-rz(-pi/4) q0[28];
-rz(pi/4) q0[42];
-cx q0[42],q0[28];
-cx q0[42],q0[25];
-rz(pi/4) q0[25];
-cx q0[29],q0[25];
-rz(-pi/4) q0[25];
-rz(pi/4) q0[29];
-cx q0[42],q0[25];
-rz(pi/4) q0[25];
-cx q0[28],q0[25];
-rz(-pi/4) q0[25];
-cx q0[42],q0[29];
-rz(-pi/4) q0[29];
-rz(pi/4) q0[42];
-cx q0[42],q0[29];
-cx q0[9],q0[12];
-rz(pi/4) q0[12];
-cx q0[11],q0[12];
-rz(pi/4) q0[11];
-rz(-pi/4) q0[12];
-cx q0[9],q0[12];
-rz(pi/4) q0[12];
-cx q0[9],q0[11];
-rz(-pi/4) q0[11];
-rz(pi/4) q0[9];
-cx q0[9],q0[11];
-cx q0[10],q0[11];
-cx q0[11],q0[12];
-rz(-pi/4) q0[12];
-cx q0[10],q0[12];
-rz(pi/4) q0[12];
-cx q0[11],q0[12];
-rz(pi/4) q0[11];
-rz(-pi/4) q0[12];
-cx q0[10],q0[12];
-cx q0[10],q0[11];
-rz(pi/4) q0[10];
-rz(-pi/4) q0[11];
-rz(pi/4) q0[12];
-cx q0[9],q0[11];
-cx q0[11],q0[12];
-rz(-pi/4) q0[12];
-cx q0[10],q0[12];
-rz(pi/4) q0[12];
-cx q0[11],q0[12];
-rz(pi/4) q0[11];
-rz(-pi/4) q0[12];
-cx q0[10],q0[12];
-cx q0[10],q0[11];
-rz(pi/4) q0[10];
-rz(-pi/4) q0[11];
-rz(pi/4) q0[12];
-cx q0[11],q0[12];
-rz(-pi/4) q0[12];
-rz(pi/2) q0[9];
-sx q0[9];
-rz(pi/2) q0[9];
-cx q0[8],q0[9];
-rz(-pi/4) q0[9];
-cx q0[6],q0[9];
-rz(pi/4) q0[9];
-cx q0[8],q0[9];
-rz(pi/4) q0[8];
-rz(-pi/4) q0[9];
-cx q0[6],q0[9];
-cx q0[6],q0[8];
-rz(pi/4) q0[6];
-rz(-pi/4) q0[8];
-cx q0[6],q0[8];
-cx q0[7],q0[8];
-rz(pi/4) q0[9];
-cx q0[8],q0[9];
-rz(-pi/4) q0[9];
-cx q0[7],q0[9];
-rz(pi/4) q0[9];
-cx q0[8],q0[9];
-rz(pi/4) q0[8];
-rz(-pi/4) q0[9];
-cx q0[7],q0[9];
-cx q0[7],q0[8];
-rz(pi/4) q0[7];
-rz(-pi/4) q0[8];
-cx q0[6],q0[8];
-rz(pi/2) q0[6];
-sx q0[6];
-rz(pi/2) q0[6];
-cx q0[5],q0[6];
-rz(-pi/4) q0[6];
-cx q0[3],q0[6];
-rz(pi/4) q0[6];
-cx q0[5],q0[6];
-rz(pi/4) q0[5];
-rz(-pi/4) q0[6];
-cx q0[3],q0[6];
-cx q0[3],q0[5];
-rz(pi/4) q0[3];
-rz(-pi/4) q0[5];
-cx q0[3],q0[5];
-cx q0[4],q0[5];
-rz(pi/4) q0[6];
-cx q0[5],q0[6];
-rz(-pi/4) q0[6];
-cx q0[4],q0[6];
-rz(pi/4) q0[6];
-cx q0[5],q0[6];
-rz(pi/4) q0[5];
-rz(-pi/4) q0[6];
-cx q0[4],q0[6];
-cx q0[4],q0[5];
-rz(pi/4) q0[4];
-rz(-pi/4) q0[5];
-cx q0[3],q0[5];
-rz(pi/2) q0[3];
-sx q0[3];
-rz(pi/2) q0[3];
-cx q0[2],q0[3];
-rz(-pi/4) q0[3];
-cx q0[0],q0[3];
-rz(pi/4) q0[3];
-cx q0[2],q0[3];
-rz(pi/4) q0[2];
-rz(-pi/4) q0[3];
-cx q0[0],q0[3];
-cx q0[0],q0[2];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[2];
-cx q0[0],q0[2];
-cx q0[1],q0[2];
-rz(pi/4) q0[3];
-cx q0[2],q0[3];
-rz(-pi/4) q0[3];
-cx q0[1],q0[3];
-rz(pi/4) q0[3];
-cx q0[2],q0[3];
-rz(pi/4) q0[2];
-rz(-pi/4) q0[3];
-cx q0[1],q0[3];
-cx q0[1],q0[2];
-rz(pi/4) q0[1];
-rz(-pi/4) q0[2];
-cx q0[0],q0[2];
-rz(pi/4) q0[3];
-cx q0[2],q0[3];
-rz(-pi/4) q0[3];
-cx q0[1],q0[3];
-rz(pi/4) q0[3];
-cx q0[2],q0[3];
-rz(pi/4) q0[2];
-rz(-pi/4) q0[3];
-cx q0[1],q0[3];
-cx q0[1],q0[2];
-rz(pi/4) q0[1];
-rz(-pi/4) q0[2];
-rz(pi/4) q0[3];
-cx q0[2],q0[3];
-rz(-pi/4) q0[3];
-cx q0[0],q0[3];
-rz(pi/4) q0[3];
-cx q0[2],q0[3];
-rz(pi/4) q0[2];
-rz(-pi/4) q0[3];
-cx q0[0],q0[3];
-cx q0[0],q0[2];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[2];
-cx q0[0],q0[2];
-rz(3*pi/4) q0[3];
-sx q0[3];
-rz(pi/2) q0[3];
-rz(pi/4) q0[6];
-cx q0[5],q0[6];
-rz(-pi/4) q0[6];
-cx q0[4],q0[6];
-rz(pi/4) q0[6];
-cx q0[5],q0[6];
-rz(pi/4) q0[5];
-rz(-pi/4) q0[6];
-cx q0[4],q0[6];
-cx q0[4],q0[5];
-rz(pi/4) q0[4];
-rz(-pi/4) q0[5];
-rz(pi/4) q0[6];
-cx q0[5],q0[6];
-rz(-pi/4) q0[6];
-cx q0[3],q0[6];
-rz(pi/4) q0[6];
-cx q0[5],q0[6];
-rz(pi/4) q0[5];
-rz(-pi/4) q0[6];
-cx q0[3],q0[6];
-cx q0[3],q0[5];
-rz(pi/4) q0[3];
-rz(-pi/4) q0[5];
-cx q0[3],q0[5];
-rz(3*pi/4) q0[6];
-sx q0[6];
-rz(pi/2) q0[6];
-rz(pi/4) q0[9];
-cx q0[8],q0[9];
-rz(-pi/4) q0[9];
-cx q0[7],q0[9];
-rz(pi/4) q0[9];
-cx q0[8],q0[9];
-rz(pi/4) q0[8];
-rz(-pi/4) q0[9];
-cx q0[7],q0[9];
-cx q0[7],q0[8];
-rz(pi/4) q0[7];
-rz(-pi/4) q0[8];
-rz(pi/4) q0[9];
-cx q0[8],q0[9];
-rz(-pi/4) q0[9];
-cx q0[6],q0[9];
-rz(pi/4) q0[9];
-cx q0[8],q0[9];
-rz(pi/4) q0[8];
-rz(-pi/4) q0[9];
-cx q0[6],q0[9];
-cx q0[6],q0[8];
-rz(pi/4) q0[6];
-rz(-pi/4) q0[8];
-cx q0[6],q0[8];
-rz(3*pi/4) q0[9];
-sx q0[9];
-rz(pi/2) q0[9];
-cx q0[9],q0[12];
-rz(pi/4) q0[12];
-cx q0[11],q0[12];
-rz(pi/4) q0[11];
-rz(-pi/4) q0[12];
-cx q0[9],q0[12];
-rz(3*pi/4) q0[12];
-sx q0[12];
-rz(pi/2) q0[12];
-cx q0[12],q0[15];
-rz(pi/4) q0[15];
-cx q0[14],q0[15];
-rz(pi/4) q0[14];
-rz(-pi/4) q0[15];
-cx q0[12],q0[15];
-cx q0[12],q0[14];
-rz(pi/4) q0[12];
-rz(-pi/4) q0[14];
-cx q0[12],q0[14];
-rz(3*pi/4) q0[15];
-sx q0[15];
-rz(pi/2) q0[15];
-cx q0[15],q0[18];
-rz(pi/4) q0[18];
-cx q0[17],q0[18];
-rz(pi/4) q0[17];
-rz(-pi/4) q0[18];
-cx q0[15],q0[18];
-cx q0[15],q0[17];
-rz(pi/4) q0[15];
-rz(-pi/4) q0[17];
-cx q0[15],q0[17];
-rz(3*pi/4) q0[18];
-sx q0[18];
-rz(pi/2) q0[18];
-cx q0[18],q0[21];
-rz(pi/4) q0[21];
-cx q0[20],q0[21];
-rz(pi/4) q0[20];
-rz(-pi/4) q0[21];
-cx q0[18],q0[21];
-cx q0[18],q0[20];
-rz(pi/4) q0[18];
-rz(-pi/4) q0[20];
-cx q0[18],q0[20];
-rz(3*pi/4) q0[21];
-sx q0[21];
-rz(pi/2) q0[21];
-cx q0[9],q0[11];
-rz(-pi/4) q0[11];
-rz(pi/4) q0[9];
-cx q0[9],q0[11];
-cx q0[43],q0[22];
-rz(pi/4) q0[22];
-cx q0[27],q0[22];
-rz(-pi/4) q0[22];
-rz(pi/4) q0[27];
-cx q0[43],q0[22];
-rz(3*pi/4) q0[22];
-sx q0[22];
-rz(pi/2) q0[22];
-cx q0[22],q0[24];
-rz(pi/4) q0[24];
-cx q0[23],q0[24];
-rz(pi/4) q0[23];
-rz(-pi/4) q0[24];
-cx q0[22],q0[24];
-cx q0[22],q0[23];
-rz(pi/4) q0[22];
-rz(-pi/4) q0[23];
-rz(pi/4) q0[24];
-cx q0[23],q0[24];
-rz(-pi/4) q0[24];
-cx q0[21],q0[24];
-rz(pi/4) q0[24];
-cx q0[23],q0[24];
-rz(pi/4) q0[23];
-rz(-pi/4) q0[24];
-cx q0[21],q0[24];
-cx q0[21],q0[23];
-rz(pi/4) q0[21];
-rz(-pi/4) q0[23];
-cx q0[21],q0[23];
-rz(3*pi/4) q0[24];
-sx q0[24];
-rz(pi/2) q0[24];
-cx q0[43],q0[27];
-rz(-pi/4) q0[27];
-rz(pi/4) q0[43];
-cx q0[43],q0[27];
-cx q0[43],q0[25];
-rz(pi/4) q0[25];
-cx q0[28],q0[25];
-rz(-pi/4) q0[25];
-rz(pi/4) q0[28];
-cx q0[43],q0[25];
-rz(3*pi/4) q0[25];
-sx q0[25];
-rz(pi/2) q0[25];
-cx q0[25],q0[26];
-cx q0[24],q0[26];
-rz(pi/2) q0[24];
-sx q0[24];
-rz(pi/2) q0[24];
-cx q0[23],q0[24];
-rz(-pi/4) q0[24];
-cx q0[21],q0[24];
-rz(pi/4) q0[24];
-cx q0[23],q0[24];
-rz(pi/4) q0[23];
-rz(-pi/4) q0[24];
-cx q0[21],q0[24];
-cx q0[21],q0[23];
-rz(pi/4) q0[21];
-rz(-pi/4) q0[23];
-cx q0[21],q0[23];
-cx q0[22],q0[23];
-rz(pi/4) q0[24];
-cx q0[23],q0[24];
-rz(-pi/4) q0[24];
-cx q0[22],q0[24];
-rz(pi/4) q0[24];
-cx q0[23],q0[24];
-rz(pi/4) q0[23];
-rz(-pi/4) q0[24];
-cx q0[22],q0[24];
-cx q0[22],q0[23];
-rz(3*pi/4) q0[22];
-sx q0[22];
-rz(pi/2) q0[22];
-rz(-pi/4) q0[23];
-cx q0[21],q0[23];
-rz(pi/2) q0[21];
-sx q0[21];
-rz(pi/2) q0[21];
-cx q0[20],q0[21];
-rz(-pi/4) q0[21];
-cx q0[18],q0[21];
-rz(pi/4) q0[21];
-cx q0[20],q0[21];
-rz(pi/4) q0[20];
-rz(-pi/4) q0[21];
-cx q0[18],q0[21];
-cx q0[18],q0[20];
-rz(pi/4) q0[18];
-rz(-pi/4) q0[20];
-cx q0[18],q0[20];
-cx q0[19],q0[20];
-rz(pi/4) q0[21];
-cx q0[20],q0[21];
-rz(-pi/4) q0[21];
-cx q0[19],q0[21];
-rz(pi/4) q0[21];
-cx q0[20],q0[21];
-rz(pi/4) q0[20];
-rz(-pi/4) q0[21];
-cx q0[19],q0[21];
-cx q0[19],q0[20];
-rz(pi/4) q0[19];
-rz(-pi/4) q0[20];
-cx q0[18],q0[20];
-rz(pi/2) q0[18];
-sx q0[18];
-rz(pi/2) q0[18];
-cx q0[17],q0[18];
-rz(-pi/4) q0[18];
-cx q0[15],q0[18];
-rz(pi/4) q0[18];
-cx q0[17],q0[18];
-rz(pi/4) q0[17];
-rz(-pi/4) q0[18];
-cx q0[15],q0[18];
-cx q0[15],q0[17];
-rz(pi/4) q0[15];
-rz(-pi/4) q0[17];
-cx q0[15],q0[17];
-cx q0[16],q0[17];
-rz(pi/4) q0[18];
-cx q0[17],q0[18];
-rz(-pi/4) q0[18];
-cx q0[16],q0[18];
-rz(pi/4) q0[18];
-cx q0[17],q0[18];
-rz(pi/4) q0[17];
-rz(-pi/4) q0[18];
-cx q0[16],q0[18];
-cx q0[16],q0[17];
-rz(pi/4) q0[16];
-rz(-pi/4) q0[17];
-cx q0[15],q0[17];
-rz(pi/2) q0[15];
-sx q0[15];
-rz(pi/2) q0[15];
-cx q0[14],q0[15];
-rz(-pi/4) q0[15];
-cx q0[12],q0[15];
-rz(pi/4) q0[15];
-cx q0[14],q0[15];
-rz(pi/4) q0[14];
-rz(-pi/4) q0[15];
-cx q0[12],q0[15];
-cx q0[12],q0[14];
-rz(pi/4) q0[12];
-rz(-pi/4) q0[14];
-cx q0[12],q0[14];
-cx q0[13],q0[14];
-rz(pi/4) q0[15];
-cx q0[14],q0[15];
-rz(-pi/4) q0[15];
-cx q0[13],q0[15];
-rz(pi/4) q0[15];
-cx q0[14],q0[15];
-rz(pi/4) q0[14];
-rz(-pi/4) q0[15];
-cx q0[13],q0[15];
-cx q0[13],q0[14];
-rz(pi/4) q0[13];
-rz(-pi/4) q0[14];
-cx q0[12],q0[14];
-rz(pi/2) q0[12];
-sx q0[12];
-rz(pi/2) q0[12];
-cx q0[11],q0[12];
-rz(-pi/4) q0[12];
-rz(pi/4) q0[15];
-cx q0[14],q0[15];
-rz(-pi/4) q0[15];
-cx q0[13],q0[15];
-rz(pi/4) q0[15];
-cx q0[14],q0[15];
-rz(pi/4) q0[14];
-rz(-pi/4) q0[15];
-cx q0[13],q0[15];
-cx q0[13],q0[14];
-rz(pi/4) q0[13];
-rz(-pi/4) q0[14];
-rz(pi/4) q0[15];
-cx q0[14],q0[15];
-rz(-pi/4) q0[15];
-rz(pi/4) q0[18];
-cx q0[17],q0[18];
-rz(-pi/4) q0[18];
-cx q0[16],q0[18];
-rz(pi/4) q0[18];
-cx q0[17],q0[18];
-rz(pi/4) q0[17];
-rz(-pi/4) q0[18];
-cx q0[16],q0[18];
-cx q0[16],q0[17];
-rz(pi/4) q0[16];
-rz(-pi/4) q0[17];
-rz(pi/4) q0[18];
-cx q0[17],q0[18];
-rz(-pi/4) q0[18];
-rz(pi/4) q0[21];
-cx q0[20],q0[21];
-rz(-pi/4) q0[21];
-cx q0[19],q0[21];
-rz(pi/4) q0[21];
-cx q0[20],q0[21];
-rz(pi/4) q0[20];
-rz(-pi/4) q0[21];
-cx q0[19],q0[21];
-cx q0[19],q0[20];
-rz(pi/4) q0[19];
-rz(-pi/4) q0[20];
-rz(pi/4) q0[21];
-cx q0[20],q0[21];
-rz(-pi/4) q0[21];
-rz(pi/4) q0[24];
-cx q0[23],q0[24];
-rz(-pi/4) q0[24];
-rz(pi/2) q0[25];
-sx q0[25];
-rz(pi/2) q0[25];
-cx q0[27],q0[22];
-rz(-pi/4) q0[22];
-cx q0[43],q0[28];
-rz(-pi/4) q0[28];
-rz(pi/4) q0[43];
-cx q0[43],q0[28];
-cx q0[28],q0[25];
-rz(-pi/4) q0[25];
-cx q0[43],q0[22];
-rz(pi/4) q0[22];
-cx q0[27],q0[22];
-rz(-pi/4) q0[22];
-rz(pi/4) q0[27];
-cx q0[43],q0[22];
-rz(3*pi/4) q0[22];
-sx q0[22];
-rz(pi/2) q0[22];
-cx q0[22],q0[24];
-rz(pi/4) q0[24];
-cx q0[23],q0[24];
-rz(pi/4) q0[23];
-rz(-pi/4) q0[24];
-cx q0[22],q0[24];
-cx q0[22],q0[23];
-rz(pi/4) q0[22];
-rz(-pi/4) q0[23];
-rz(pi/4) q0[24];
-cx q0[23],q0[24];
-rz(-pi/4) q0[24];
-cx q0[43],q0[27];
-rz(-pi/4) q0[27];
-rz(pi/4) q0[43];
-cx q0[43],q0[27];
-cx q0[43],q0[25];
-rz(pi/4) q0[25];
-cx q0[28],q0[25];
-rz(-pi/4) q0[25];
-rz(pi/4) q0[28];
-cx q0[43],q0[25];
-rz(pi/4) q0[25];
-cx q0[27],q0[25];
-rz(-pi/4) q0[25];
-cx q0[43],q0[28];
-rz(-pi/4) q0[28];
-rz(pi/4) q0[43];
-cx q0[43],q0[28];
-cx q0[9],q0[12];
-rz(pi/4) q0[12];
-cx q0[11],q0[12];
-rz(pi/4) q0[11];
-rz(-pi/4) q0[12];
-cx q0[9],q0[12];
-rz(pi/4) q0[12];
-cx q0[9],q0[11];
-rz(-pi/4) q0[11];
-rz(pi/4) q0[9];
-cx q0[9],q0[11];
-cx q0[10],q0[11];
-cx q0[11],q0[12];
-rz(-pi/4) q0[12];
-cx q0[10],q0[12];
-rz(pi/4) q0[12];
-cx q0[11],q0[12];
-rz(pi/4) q0[11];
-rz(-pi/4) q0[12];
-cx q0[10],q0[12];
-cx q0[10],q0[11];
-rz(pi/4) q0[10];
-rz(-pi/4) q0[11];
-rz(pi/4) q0[12];
-cx q0[9],q0[11];
-cx q0[11],q0[12];
-rz(-pi/4) q0[12];
-cx q0[10],q0[12];
-rz(pi/4) q0[12];
-cx q0[11],q0[12];
-rz(pi/4) q0[11];
-rz(-pi/4) q0[12];
-cx q0[10],q0[12];
-cx q0[10],q0[11];
-rz(pi/4) q0[10];
-rz(-pi/4) q0[11];
-rz(pi/4) q0[12];
-cx q0[11],q0[12];
-rz(-pi/4) q0[12];
-rz(pi/2) q0[9];
-sx q0[9];
-rz(pi/2) q0[9];
-cx q0[8],q0[9];
-rz(-pi/4) q0[9];
-cx q0[6],q0[9];
-rz(pi/4) q0[9];
-cx q0[8],q0[9];
-rz(pi/4) q0[8];
-rz(-pi/4) q0[9];
-cx q0[6],q0[9];
-cx q0[6],q0[8];
-rz(pi/4) q0[6];
-rz(-pi/4) q0[8];
-cx q0[6],q0[8];
-cx q0[7],q0[8];
-rz(pi/4) q0[9];
-cx q0[8],q0[9];
-rz(-pi/4) q0[9];
-cx q0[7],q0[9];
-rz(pi/4) q0[9];
-cx q0[8],q0[9];
-rz(pi/4) q0[8];
-rz(-pi/4) q0[9];
-cx q0[7],q0[9];
-cx q0[7],q0[8];
-rz(pi/4) q0[7];
-rz(-pi/4) q0[8];
-cx q0[6],q0[8];
-rz(pi/2) q0[6];
-sx q0[6];
-rz(pi/2) q0[6];
-cx q0[5],q0[6];
-rz(-pi/4) q0[6];
-cx q0[3],q0[6];
-rz(pi/4) q0[6];
-cx q0[5],q0[6];
-rz(pi/4) q0[5];
-rz(-pi/4) q0[6];
-cx q0[3],q0[6];
-cx q0[3],q0[5];
-rz(pi/4) q0[3];
-rz(-pi/4) q0[5];
-cx q0[3],q0[5];
-cx q0[4],q0[5];
-rz(pi/4) q0[6];
-cx q0[5],q0[6];
-rz(-pi/4) q0[6];
-cx q0[4],q0[6];
-rz(pi/4) q0[6];
-cx q0[5],q0[6];
-rz(pi/4) q0[5];
-rz(-pi/4) q0[6];
-cx q0[4],q0[6];
-cx q0[4],q0[5];
-rz(pi/4) q0[4];
-rz(-pi/4) q0[5];
-cx q0[3],q0[5];
-rz(pi/2) q0[3];
-sx q0[3];
-rz(pi/2) q0[3];
-cx q0[2],q0[3];
-rz(-pi/4) q0[3];
-cx q0[0],q0[3];
-rz(pi/4) q0[3];
-cx q0[2],q0[3];
-rz(pi/4) q0[2];
-rz(-pi/4) q0[3];
-cx q0[0],q0[3];
-cx q0[0],q0[2];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[2];
-cx q0[0],q0[2];
-cx q0[1],q0[2];
-rz(pi/4) q0[3];
-cx q0[2],q0[3];
-rz(-pi/4) q0[3];
-cx q0[1],q0[3];
-rz(pi/4) q0[3];
-cx q0[2],q0[3];
-rz(pi/4) q0[2];
-rz(-pi/4) q0[3];
-cx q0[1],q0[3];
-cx q0[1],q0[2];
-rz(pi/4) q0[1];
-rz(-pi/4) q0[2];
-cx q0[0],q0[2];
-rz(pi/4) q0[3];
-cx q0[2],q0[3];
-rz(-pi/4) q0[3];
-cx q0[1],q0[3];
-rz(pi/4) q0[3];
-cx q0[2],q0[3];
-rz(pi/4) q0[2];
-rz(-pi/4) q0[3];
-cx q0[1],q0[3];
-cx q0[1],q0[2];
-rz(pi/4) q0[1];
-rz(-pi/4) q0[2];
-rz(pi/4) q0[3];
-cx q0[2],q0[3];
-rz(-pi/4) q0[3];
-cx q0[0],q0[3];
-rz(pi/4) q0[3];
-cx q0[2],q0[3];
-rz(pi/4) q0[2];
-rz(-pi/4) q0[3];
-cx q0[0],q0[3];
-cx q0[0],q0[2];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[2];
-cx q0[0],q0[2];
-rz(3*pi/4) q0[3];
-sx q0[3];
-rz(pi/2) q0[3];
-rz(pi/4) q0[6];
-cx q0[5],q0[6];
-rz(-pi/4) q0[6];
-cx q0[4],q0[6];
-rz(pi/4) q0[6];
-cx q0[5],q0[6];
-rz(pi/4) q0[5];
-rz(-pi/4) q0[6];
-cx q0[4],q0[6];
-cx q0[4],q0[5];
-rz(pi/4) q0[4];
-rz(-pi/4) q0[5];
-rz(pi/4) q0[6];
-cx q0[5],q0[6];
-rz(-pi/4) q0[6];
-cx q0[3],q0[6];
-rz(pi/4) q0[6];
-cx q0[5],q0[6];
-rz(pi/4) q0[5];
-rz(-pi/4) q0[6];
-cx q0[3],q0[6];
-cx q0[3],q0[5];
-rz(pi/4) q0[3];
-rz(-pi/4) q0[5];
-cx q0[3],q0[5];
-rz(3*pi/4) q0[6];
-sx q0[6];
-rz(pi/2) q0[6];
-rz(pi/4) q0[9];
-cx q0[8],q0[9];
-rz(-pi/4) q0[9];
-cx q0[7],q0[9];
-rz(pi/4) q0[9];
-cx q0[8],q0[9];
-rz(pi/4) q0[8];
-rz(-pi/4) q0[9];
-cx q0[7],q0[9];
-cx q0[7],q0[8];
-rz(pi/4) q0[7];
-rz(-pi/4) q0[8];
-rz(pi/4) q0[9];
-cx q0[8],q0[9];
-rz(-pi/4) q0[9];
-cx q0[6],q0[9];
-rz(pi/4) q0[9];
-cx q0[8],q0[9];
-rz(pi/4) q0[8];
-rz(-pi/4) q0[9];
-cx q0[6],q0[9];
-cx q0[6],q0[8];
-rz(pi/4) q0[6];
-rz(-pi/4) q0[8];
-cx q0[6],q0[8];
-rz(3*pi/4) q0[9];
-sx q0[9];
-rz(pi/2) q0[9];
-cx q0[9],q0[12];
-rz(pi/4) q0[12];
-cx q0[11],q0[12];
-rz(pi/4) q0[11];
-rz(-pi/4) q0[12];
-cx q0[9],q0[12];
-rz(3*pi/4) q0[12];
-sx q0[12];
-rz(pi/2) q0[12];
-cx q0[12],q0[15];
-rz(pi/4) q0[15];
-cx q0[14],q0[15];
-rz(pi/4) q0[14];
-rz(-pi/4) q0[15];
-cx q0[12],q0[15];
-cx q0[12],q0[14];
-rz(pi/4) q0[12];
-rz(-pi/4) q0[14];
-cx q0[12],q0[14];
-rz(3*pi/4) q0[15];
-sx q0[15];
-rz(pi/2) q0[15];
-cx q0[15],q0[18];
-rz(pi/4) q0[18];
-cx q0[17],q0[18];
-rz(pi/4) q0[17];
-rz(-pi/4) q0[18];
-cx q0[15],q0[18];
-cx q0[15],q0[17];
-rz(pi/4) q0[15];
-rz(-pi/4) q0[17];
-cx q0[15],q0[17];
-rz(3*pi/4) q0[18];
-sx q0[18];
-rz(pi/2) q0[18];
-cx q0[18],q0[21];
-rz(pi/4) q0[21];
-cx q0[20],q0[21];
-rz(pi/4) q0[20];
-rz(-pi/4) q0[21];
-cx q0[18],q0[21];
-cx q0[18],q0[20];
-rz(pi/4) q0[18];
-rz(-pi/4) q0[20];
-cx q0[18],q0[20];
-rz(3*pi/4) q0[21];
-sx q0[21];
-rz(pi/2) q0[21];
-cx q0[21],q0[24];
-rz(pi/4) q0[24];
-cx q0[23],q0[24];
-rz(pi/4) q0[23];
-rz(-pi/4) q0[24];
-cx q0[21],q0[24];
-cx q0[21],q0[23];
-rz(pi/4) q0[21];
-rz(-pi/4) q0[23];
-cx q0[21],q0[23];
-rz(3*pi/4) q0[24];
-sx q0[24];
-rz(pi/2) q0[24];
-cx q0[9],q0[11];
-rz(-pi/4) q0[11];
-rz(pi/4) q0[9];
-cx q0[9],q0[11];
-cx q0[44],q0[25];
-rz(pi/4) q0[25];
-cx q0[27],q0[25];
-rz(-pi/4) q0[25];
-rz(pi/4) q0[27];
-cx q0[44],q0[25];
-rz(3*pi/4) q0[25];
-sx q0[25];
-rz(pi/2) q0[25];
-cx q0[25],q0[26];
-cx q0[24],q0[26];
-rz(pi/2) q0[24];
-sx q0[24];
-rz(pi/2) q0[24];
-cx q0[23],q0[24];
-rz(-pi/4) q0[24];
-cx q0[21],q0[24];
-rz(pi/4) q0[24];
-cx q0[23],q0[24];
-rz(pi/4) q0[23];
-rz(-pi/4) q0[24];
-cx q0[21],q0[24];
-cx q0[21],q0[23];
-rz(pi/4) q0[21];
-rz(-pi/4) q0[23];
-cx q0[21],q0[23];
-cx q0[22],q0[23];
-rz(pi/4) q0[24];
-cx q0[23],q0[24];
-rz(-pi/4) q0[24];
-cx q0[22],q0[24];
-rz(pi/4) q0[24];
-cx q0[23],q0[24];
-rz(pi/4) q0[23];
-rz(-pi/4) q0[24];
-cx q0[22],q0[24];
-cx q0[22],q0[23];
-rz(pi/4) q0[22];
-rz(-pi/4) q0[23];
-cx q0[21],q0[23];
-rz(pi/2) q0[21];
-sx q0[21];
-rz(pi/2) q0[21];
-cx q0[20],q0[21];
-rz(-pi/4) q0[21];
-cx q0[18],q0[21];
-rz(pi/4) q0[21];
-cx q0[20],q0[21];
-rz(pi/4) q0[20];
-rz(-pi/4) q0[21];
-cx q0[18],q0[21];
-cx q0[18],q0[20];
-rz(pi/4) q0[18];
-rz(-pi/4) q0[20];
-cx q0[18],q0[20];
-cx q0[19],q0[20];
-rz(pi/4) q0[21];
-cx q0[20],q0[21];
-rz(-pi/4) q0[21];
-cx q0[19],q0[21];
-rz(pi/4) q0[21];
-cx q0[20],q0[21];
-rz(pi/4) q0[20];
-rz(-pi/4) q0[21];
-cx q0[19],q0[21];
-cx q0[19],q0[20];
-rz(pi/4) q0[19];
-rz(-pi/4) q0[20];
-cx q0[18],q0[20];
-rz(pi/2) q0[18];
-sx q0[18];
-rz(pi/2) q0[18];
-cx q0[17],q0[18];
-rz(-pi/4) q0[18];
-cx q0[15],q0[18];
-rz(pi/4) q0[18];
-cx q0[17],q0[18];
-rz(pi/4) q0[17];
-rz(-pi/4) q0[18];
-cx q0[15],q0[18];
-cx q0[15],q0[17];
-rz(pi/4) q0[15];
-rz(-pi/4) q0[17];
-cx q0[15],q0[17];
-cx q0[16],q0[17];
-rz(pi/4) q0[18];
-cx q0[17],q0[18];
-rz(-pi/4) q0[18];
-cx q0[16],q0[18];
-rz(pi/4) q0[18];
-cx q0[17],q0[18];
-rz(pi/4) q0[17];
-rz(-pi/4) q0[18];
-cx q0[16],q0[18];
-cx q0[16],q0[17];
-rz(pi/4) q0[16];
-rz(-pi/4) q0[17];
-cx q0[15],q0[17];
-rz(pi/2) q0[15];
-sx q0[15];
-rz(pi/2) q0[15];
-cx q0[14],q0[15];
-rz(-pi/4) q0[15];
-cx q0[12],q0[15];
-rz(pi/4) q0[15];
-cx q0[14],q0[15];
-rz(pi/4) q0[14];
-rz(-pi/4) q0[15];
-cx q0[12],q0[15];
-cx q0[12],q0[14];
-rz(pi/4) q0[12];
-rz(-pi/4) q0[14];
-cx q0[12],q0[14];
-cx q0[13],q0[14];
-rz(pi/4) q0[15];
-cx q0[14],q0[15];
-rz(-pi/4) q0[15];
-cx q0[13],q0[15];
-rz(pi/4) q0[15];
-cx q0[14],q0[15];
-rz(pi/4) q0[14];
-rz(-pi/4) q0[15];
-cx q0[13],q0[15];
-cx q0[13],q0[14];
-rz(pi/4) q0[13];
-rz(-pi/4) q0[14];
-cx q0[12],q0[14];
-rz(pi/2) q0[12];
-sx q0[12];
-rz(pi/2) q0[12];
-cx q0[11],q0[12];
-rz(-pi/4) q0[12];
-rz(3*pi/4) q0[15];
-sx q0[15];
-rz(pi/2) q0[15];
-rz(3*pi/4) q0[18];
-sx q0[18];
-rz(pi/2) q0[18];
-rz(3*pi/4) q0[21];
-sx q0[21];
-rz(pi/2) q0[21];
-rz(3*pi/4) q0[24];
-sx q0[24];
-rz(pi/2) q0[24];
-rz(pi/2) q0[25];
-sx q0[25];
-rz(pi/2) q0[25];
-cx q0[44],q0[27];
-rz(-pi/4) q0[27];
-rz(pi/4) q0[44];
-cx q0[44],q0[27];
-cx q0[27],q0[25];
-rz(-pi/4) q0[25];
-cx q0[44],q0[25];
-rz(pi/4) q0[25];
-cx q0[27],q0[25];
-rz(-pi/4) q0[25];
-rz(pi/4) q0[27];
-cx q0[44],q0[25];
-rz(3*pi/4) q0[25];
-sx q0[25];
-rz(pi/2) q0[25];
-cx q0[44],q0[27];
-rz(-pi/4) q0[27];
-rz(pi/4) q0[44];
-cx q0[44],q0[27];
-cx q0[9],q0[12];
-rz(pi/4) q0[12];
-cx q0[11],q0[12];
-rz(pi/4) q0[11];
-rz(-pi/4) q0[12];
-cx q0[9],q0[12];
-rz(pi/4) q0[12];
-cx q0[9],q0[11];
-rz(-pi/4) q0[11];
-rz(pi/4) q0[9];
-cx q0[9],q0[11];
-cx q0[10],q0[11];
-cx q0[11],q0[12];
-rz(-pi/4) q0[12];
-cx q0[10],q0[12];
-rz(pi/4) q0[12];
-cx q0[11],q0[12];
-rz(pi/4) q0[11];
-rz(-pi/4) q0[12];
-cx q0[10],q0[12];
-cx q0[10],q0[11];
-rz(pi/4) q0[10];
-rz(-pi/4) q0[11];
-rz(3*pi/4) q0[12];
-sx q0[12];
-rz(pi/2) q0[12];
-cx q0[9],q0[11];
-rz(pi/2) q0[9];
-sx q0[9];
-rz(pi/2) q0[9];
-cx q0[8],q0[9];
-rz(-pi/4) q0[9];
-cx q0[6],q0[9];
-rz(pi/4) q0[9];
-cx q0[8],q0[9];
-rz(pi/4) q0[8];
-rz(-pi/4) q0[9];
-cx q0[6],q0[9];
-cx q0[6],q0[8];
-rz(pi/4) q0[6];
-rz(-pi/4) q0[8];
-cx q0[6],q0[8];
-cx q0[7],q0[8];
-rz(pi/4) q0[9];
-cx q0[8],q0[9];
-rz(-pi/4) q0[9];
-cx q0[7],q0[9];
-rz(pi/4) q0[9];
-cx q0[8],q0[9];
-rz(pi/4) q0[8];
-rz(-pi/4) q0[9];
-cx q0[7],q0[9];
-cx q0[7],q0[8];
-rz(pi/4) q0[7];
-rz(-pi/4) q0[8];
-cx q0[6],q0[8];
-rz(pi/2) q0[6];
-sx q0[6];
-rz(pi/2) q0[6];
-cx q0[5],q0[6];
-rz(-pi/4) q0[6];
-cx q0[3],q0[6];
-rz(pi/4) q0[6];
-cx q0[5],q0[6];
-rz(pi/4) q0[5];
-rz(-pi/4) q0[6];
-cx q0[3],q0[6];
-cx q0[3],q0[5];
-rz(pi/4) q0[3];
-rz(-pi/4) q0[5];
-cx q0[3],q0[5];
-cx q0[4],q0[5];
-rz(pi/4) q0[6];
-cx q0[5],q0[6];
-rz(-pi/4) q0[6];
-cx q0[4],q0[6];
-rz(pi/4) q0[6];
-cx q0[5],q0[6];
-rz(pi/4) q0[5];
-rz(-pi/4) q0[6];
-cx q0[4],q0[6];
-cx q0[4],q0[5];
-rz(pi/4) q0[4];
-rz(-pi/4) q0[5];
-cx q0[3],q0[5];
-rz(pi/2) q0[3];
-sx q0[3];
-rz(pi/2) q0[3];
-cx q0[2],q0[3];
-rz(-pi/4) q0[3];
-cx q0[0],q0[3];
-rz(pi/4) q0[3];
-cx q0[2],q0[3];
-rz(pi/4) q0[2];
-rz(-pi/4) q0[3];
-cx q0[0],q0[3];
-cx q0[0],q0[2];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[2];
-cx q0[0],q0[2];
-cx q0[1],q0[2];
-rz(pi/4) q0[3];
-cx q0[2],q0[3];
-rz(-pi/4) q0[3];
-cx q0[1],q0[3];
-rz(pi/4) q0[3];
-cx q0[2],q0[3];
-rz(pi/4) q0[2];
-rz(-pi/4) q0[3];
-cx q0[1],q0[3];
-cx q0[1],q0[2];
-rz(pi/4) q0[1];
-rz(-pi/4) q0[2];
-cx q0[0],q0[2];
-rz(3*pi/4) q0[3];
-sx q0[3];
-rz(pi/2) q0[3];
-rz(3*pi/4) q0[6];
-sx q0[6];
-rz(pi/2) q0[6];
-rz(3*pi/4) q0[9];
-sx q0[9];
-rz(pi/2) q0[9];
-measure q0[2] -> c0[0];
-measure q0[5] -> c0[1];
-measure q0[8] -> c0[2];
-measure q0[11] -> c0[3];
-measure q0[14] -> c0[4];
-measure q0[17] -> c0[5];
-measure q0[20] -> c0[6];
-measure q0[23] -> c0[7];
-measure q0[26] -> c0[8];
@@ -1,1976 +0,0 @@
-OPENQASM 2.0;
-include "qelib1.inc";
-qreg q0[75];
-creg c0[15];
-x q0[73];
-x q0[69];
-x q0[68];
-x q0[67];
-x q0[57];
-x q0[56];
-x q0[53];
-ccx q0[60],q0[45],q0[1];
-ccx q0[60],q0[46],q0[4];
-ccx q0[60],q0[47],q0[7];
-ccx q0[60],q0[48],q0[10];
-ccx q0[60],q0[49],q0[13];
-ccx q0[60],q0[50],q0[16];
-ccx q0[60],q0[51],q0[19];
-ccx q0[60],q0[52],q0[22];
-ccx q0[60],q0[53],q0[25];
-ccx q0[60],q0[54],q0[28];
-ccx q0[60],q0[55],q0[31];
-ccx q0[60],q0[56],q0[34];
-ccx q0[60],q0[57],q0[37];
-ccx q0[60],q0[58],q0[40];
-ccx q0[60],q0[59],q0[43];
-ccx q0[1],q0[2],q0[3];
-cx q0[1],q0[2];
-ccx q0[0],q0[2],q0[3];
-ccx q0[4],q0[5],q0[6];
-cx q0[4],q0[5];
-ccx q0[3],q0[5],q0[6];
-ccx q0[7],q0[8],q0[9];
-cx q0[7],q0[8];
-ccx q0[6],q0[8],q0[9];
-ccx q0[10],q0[11],q0[12];
-cx q0[10],q0[11];
-ccx q0[9],q0[11],q0[12];
-ccx q0[13],q0[14],q0[15];
-cx q0[13],q0[14];
-ccx q0[12],q0[14],q0[15];
-ccx q0[16],q0[17],q0[18];
-cx q0[16],q0[17];
-ccx q0[15],q0[17],q0[18];
-ccx q0[19],q0[20],q0[21];
-cx q0[19],q0[20];
-ccx q0[18],q0[20],q0[21];
-ccx q0[22],q0[23],q0[24];
-cx q0[22],q0[23];
-ccx q0[21],q0[23],q0[24];
-ccx q0[25],q0[26],q0[27];
-cx q0[25],q0[26];
-ccx q0[24],q0[26],q0[27];
-ccx q0[28],q0[29],q0[30];
-cx q0[28],q0[29];
-ccx q0[27],q0[29],q0[30];
-ccx q0[31],q0[32],q0[33];
-cx q0[31],q0[32];
-ccx q0[30],q0[32],q0[33];
-ccx q0[34],q0[35],q0[36];
-cx q0[34],q0[35];
-ccx q0[33],q0[35],q0[36];
-ccx q0[37],q0[38],q0[39];
-cx q0[37],q0[38];
-ccx q0[36],q0[38],q0[39];
-ccx q0[40],q0[41],q0[42];
-cx q0[40],q0[41];
-ccx q0[39],q0[41],q0[42];
-cx q0[43],q0[44];
-cx q0[42],q0[44];
-ccx q0[39],q0[41],q0[42];
-cx q0[40],q0[41];
-ccx q0[40],q0[41],q0[42];
-cx q0[40],q0[41];
-cx q0[39],q0[41];
-ccx q0[36],q0[38],q0[39];
-cx q0[37],q0[38];
-ccx q0[37],q0[38],q0[39];
-cx q0[37],q0[38];
-cx q0[36],q0[38];
-ccx q0[33],q0[35],q0[36];
-cx q0[34],q0[35];
-ccx q0[34],q0[35],q0[36];
-cx q0[34],q0[35];
-cx q0[33],q0[35];
-ccx q0[30],q0[32],q0[33];
-cx q0[31],q0[32];
-ccx q0[31],q0[32],q0[33];
-cx q0[31],q0[32];
-cx q0[30],q0[32];
-ccx q0[27],q0[29],q0[30];
-cx q0[28],q0[29];
-ccx q0[28],q0[29],q0[30];
-cx q0[28],q0[29];
-cx q0[27],q0[29];
-ccx q0[24],q0[26],q0[27];
-cx q0[25],q0[26];
-ccx q0[25],q0[26],q0[27];
-cx q0[25],q0[26];
-cx q0[24],q0[26];
-ccx q0[21],q0[23],q0[24];
-cx q0[22],q0[23];
-ccx q0[22],q0[23],q0[24];
-cx q0[22],q0[23];
-cx q0[21],q0[23];
-ccx q0[18],q0[20],q0[21];
-cx q0[19],q0[20];
-ccx q0[19],q0[20],q0[21];
-cx q0[19],q0[20];
-cx q0[18],q0[20];
-ccx q0[15],q0[17],q0[18];
-cx q0[16],q0[17];
-ccx q0[16],q0[17],q0[18];
-cx q0[16],q0[17];
-cx q0[15],q0[17];
-ccx q0[12],q0[14],q0[15];
-cx q0[13],q0[14];
-ccx q0[13],q0[14],q0[15];
-cx q0[13],q0[14];
-cx q0[12],q0[14];
-ccx q0[9],q0[11],q0[12];
-cx q0[10],q0[11];
-ccx q0[10],q0[11],q0[12];
-cx q0[10],q0[11];
-cx q0[9],q0[11];
-ccx q0[6],q0[8],q0[9];
-cx q0[7],q0[8];
-ccx q0[7],q0[8],q0[9];
-cx q0[7],q0[8];
-cx q0[6],q0[8];
-ccx q0[3],q0[5],q0[6];
-cx q0[4],q0[5];
-ccx q0[4],q0[5],q0[6];
-cx q0[4],q0[5];
-cx q0[3],q0[5];
-ccx q0[0],q0[2],q0[3];
-cx q0[1],q0[2];
-ccx q0[1],q0[2],q0[3];
-cx q0[1],q0[2];
-cx q0[0],q0[2];
-ccx q0[60],q0[45],q0[1];
-ccx q0[60],q0[46],q0[4];
-ccx q0[60],q0[47],q0[7];
-ccx q0[60],q0[48],q0[10];
-ccx q0[60],q0[49],q0[13];
-ccx q0[60],q0[50],q0[16];
-ccx q0[60],q0[51],q0[19];
-ccx q0[60],q0[52],q0[22];
-ccx q0[60],q0[53],q0[25];
-ccx q0[60],q0[54],q0[28];
-ccx q0[60],q0[55],q0[31];
-ccx q0[60],q0[56],q0[34];
-ccx q0[60],q0[57],q0[37];
-ccx q0[60],q0[58],q0[40];
-ccx q0[60],q0[59],q0[43];
-ccx q0[61],q0[45],q0[4];
-ccx q0[61],q0[46],q0[7];
-ccx q0[61],q0[47],q0[10];
-ccx q0[61],q0[48],q0[13];
-ccx q0[61],q0[49],q0[16];
-ccx q0[61],q0[50],q0[19];
-ccx q0[61],q0[51],q0[22];
-ccx q0[61],q0[52],q0[25];
-ccx q0[61],q0[53],q0[28];
-ccx q0[61],q0[54],q0[31];
-ccx q0[61],q0[55],q0[34];
-ccx q0[61],q0[56],q0[37];
-ccx q0[61],q0[57],q0[40];
-ccx q0[61],q0[58],q0[43];
-ccx q0[1],q0[2],q0[3];
-cx q0[1],q0[2];
-ccx q0[0],q0[2],q0[3];
-ccx q0[4],q0[5],q0[6];
-cx q0[4],q0[5];
-ccx q0[3],q0[5],q0[6];
-ccx q0[7],q0[8],q0[9];
-cx q0[7],q0[8];
-ccx q0[6],q0[8],q0[9];
-ccx q0[10],q0[11],q0[12];
-cx q0[10],q0[11];
-ccx q0[9],q0[11],q0[12];
-ccx q0[13],q0[14],q0[15];
-cx q0[13],q0[14];
-ccx q0[12],q0[14],q0[15];
-ccx q0[16],q0[17],q0[18];
-cx q0[16],q0[17];
-ccx q0[15],q0[17],q0[18];
-ccx q0[19],q0[20],q0[21];
-cx q0[19],q0[20];
-ccx q0[18],q0[20],q0[21];
-ccx q0[22],q0[23],q0[24];
-cx q0[22],q0[23];
-ccx q0[21],q0[23],q0[24];
-ccx q0[25],q0[26],q0[27];
-cx q0[25],q0[26];
-ccx q0[24],q0[26],q0[27];
-ccx q0[28],q0[29],q0[30];
-cx q0[28],q0[29];
-ccx q0[27],q0[29],q0[30];
-ccx q0[31],q0[32],q0[33];
-cx q0[31],q0[32];
-ccx q0[30],q0[32],q0[33];
-ccx q0[34],q0[35],q0[36];
-cx q0[34],q0[35];
-ccx q0[33],q0[35],q0[36];
-ccx q0[37],q0[38],q0[39];
-cx q0[37],q0[38];
-ccx q0[36],q0[38],q0[39];
-ccx q0[40],q0[41],q0[42];
-cx q0[40],q0[41];
-ccx q0[39],q0[41],q0[42];
-cx q0[43],q0[44];
-cx q0[42],q0[44];
-ccx q0[39],q0[41],q0[42];
-cx q0[40],q0[41];
-ccx q0[40],q0[41],q0[42];
-cx q0[40],q0[41];
-cx q0[39],q0[41];
-ccx q0[36],q0[38],q0[39];
-cx q0[37],q0[38];
-ccx q0[37],q0[38],q0[39];
-cx q0[37],q0[38];
-cx q0[36],q0[38];
-ccx q0[33],q0[35],q0[36];
-cx q0[34],q0[35];
-ccx q0[34],q0[35],q0[36];
-cx q0[34],q0[35];
-cx q0[33],q0[35];
-ccx q0[30],q0[32],q0[33];
-cx q0[31],q0[32];
-ccx q0[31],q0[32],q0[33];
-cx q0[31],q0[32];
-cx q0[30],q0[32];
-ccx q0[27],q0[29],q0[30];
-cx q0[28],q0[29];
-ccx q0[28],q0[29],q0[30];
-cx q0[28],q0[29];
-cx q0[27],q0[29];
-ccx q0[24],q0[26],q0[27];
-cx q0[25],q0[26];
-ccx q0[25],q0[26],q0[27];
-cx q0[25],q0[26];
-cx q0[24],q0[26];
-ccx q0[21],q0[23],q0[24];
-cx q0[22],q0[23];
-ccx q0[22],q0[23],q0[24];
-cx q0[22],q0[23];
-cx q0[21],q0[23];
-ccx q0[18],q0[20],q0[21];
-cx q0[19],q0[20];
-ccx q0[19],q0[20],q0[21];
-cx q0[19],q0[20];
-cx q0[18],q0[20];
-ccx q0[15],q0[17],q0[18];
-cx q0[16],q0[17];
-ccx q0[16],q0[17],q0[18];
-cx q0[16],q0[17];
-cx q0[15],q0[17];
-ccx q0[12],q0[14],q0[15];
-cx q0[13],q0[14];
-ccx q0[13],q0[14],q0[15];
-cx q0[13],q0[14];
-cx q0[12],q0[14];
-ccx q0[9],q0[11],q0[12];
-cx q0[10],q0[11];
-ccx q0[10],q0[11],q0[12];
-cx q0[10],q0[11];
-cx q0[9],q0[11];
-ccx q0[6],q0[8],q0[9];
-cx q0[7],q0[8];
-ccx q0[7],q0[8],q0[9];
-cx q0[7],q0[8];
-cx q0[6],q0[8];
-ccx q0[3],q0[5],q0[6];
-cx q0[4],q0[5];
-ccx q0[4],q0[5],q0[6];
-cx q0[4],q0[5];
-cx q0[3],q0[5];
-ccx q0[0],q0[2],q0[3];
-cx q0[1],q0[2];
-ccx q0[1],q0[2],q0[3];
-cx q0[1],q0[2];
-cx q0[0],q0[2];
-ccx q0[61],q0[45],q0[4];
-ccx q0[61],q0[46],q0[7];
-ccx q0[61],q0[47],q0[10];
-ccx q0[61],q0[48],q0[13];
-ccx q0[61],q0[49],q0[16];
-ccx q0[61],q0[50],q0[19];
-ccx q0[61],q0[51],q0[22];
-ccx q0[61],q0[52],q0[25];
-ccx q0[61],q0[53],q0[28];
-ccx q0[61],q0[54],q0[31];
-ccx q0[61],q0[55],q0[34];
-ccx q0[61],q0[56],q0[37];
-ccx q0[61],q0[57],q0[40];
-ccx q0[61],q0[58],q0[43];
-ccx q0[62],q0[45],q0[7];
-ccx q0[62],q0[46],q0[10];
-ccx q0[62],q0[47],q0[13];
-ccx q0[62],q0[48],q0[16];
-ccx q0[62],q0[49],q0[19];
-ccx q0[62],q0[50],q0[22];
-ccx q0[62],q0[51],q0[25];
-ccx q0[62],q0[52],q0[28];
-ccx q0[62],q0[53],q0[31];
-ccx q0[62],q0[54],q0[34];
-ccx q0[62],q0[55],q0[37];
-ccx q0[62],q0[56],q0[40];
-ccx q0[62],q0[57],q0[43];
-ccx q0[1],q0[2],q0[3];
-cx q0[1],q0[2];
-ccx q0[0],q0[2],q0[3];
-ccx q0[4],q0[5],q0[6];
-cx q0[4],q0[5];
-ccx q0[3],q0[5],q0[6];
-ccx q0[7],q0[8],q0[9];
-cx q0[7],q0[8];
-ccx q0[6],q0[8],q0[9];
-ccx q0[10],q0[11],q0[12];
-cx q0[10],q0[11];
-ccx q0[9],q0[11],q0[12];
-ccx q0[13],q0[14],q0[15];
-cx q0[13],q0[14];
-ccx q0[12],q0[14],q0[15];
-ccx q0[16],q0[17],q0[18];
-cx q0[16],q0[17];
-ccx q0[15],q0[17],q0[18];
-ccx q0[19],q0[20],q0[21];
-cx q0[19],q0[20];
-ccx q0[18],q0[20],q0[21];
-ccx q0[22],q0[23],q0[24];
-cx q0[22],q0[23];
-ccx q0[21],q0[23],q0[24];
-ccx q0[25],q0[26],q0[27];
-cx q0[25],q0[26];
-ccx q0[24],q0[26],q0[27];
-ccx q0[28],q0[29],q0[30];
-cx q0[28],q0[29];
-ccx q0[27],q0[29],q0[30];
-ccx q0[31],q0[32],q0[33];
-cx q0[31],q0[32];
-ccx q0[30],q0[32],q0[33];
-ccx q0[34],q0[35],q0[36];
-cx q0[34],q0[35];
-ccx q0[33],q0[35],q0[36];
-ccx q0[37],q0[38],q0[39];
-cx q0[37],q0[38];
-ccx q0[36],q0[38],q0[39];
-ccx q0[40],q0[41],q0[42];
-cx q0[40],q0[41];
-ccx q0[39],q0[41],q0[42];
-cx q0[43],q0[44];
-cx q0[42],q0[44];
-ccx q0[39],q0[41],q0[42];
-cx q0[40],q0[41];
-ccx q0[40],q0[41],q0[42];
-cx q0[40],q0[41];
-cx q0[39],q0[41];
-ccx q0[36],q0[38],q0[39];
-cx q0[37],q0[38];
-ccx q0[37],q0[38],q0[39];
-cx q0[37],q0[38];
-cx q0[36],q0[38];
-ccx q0[33],q0[35],q0[36];
-cx q0[34],q0[35];
-ccx q0[34],q0[35],q0[36];
-cx q0[34],q0[35];
-cx q0[33],q0[35];
-ccx q0[30],q0[32],q0[33];
-cx q0[31],q0[32];
-ccx q0[31],q0[32],q0[33];
-cx q0[31],q0[32];
-cx q0[30],q0[32];
-ccx q0[27],q0[29],q0[30];
-cx q0[28],q0[29];
-ccx q0[28],q0[29],q0[30];
-cx q0[28],q0[29];
-cx q0[27],q0[29];
-ccx q0[24],q0[26],q0[27];
-cx q0[25],q0[26];
-ccx q0[25],q0[26],q0[27];
-cx q0[25],q0[26];
-cx q0[24],q0[26];
-ccx q0[21],q0[23],q0[24];
-cx q0[22],q0[23];
-ccx q0[22],q0[23],q0[24];
-cx q0[22],q0[23];
-cx q0[21],q0[23];
-ccx q0[18],q0[20],q0[21];
-cx q0[19],q0[20];
-ccx q0[19],q0[20],q0[21];
-cx q0[19],q0[20];
-cx q0[18],q0[20];
-ccx q0[15],q0[17],q0[18];
-cx q0[16],q0[17];
-ccx q0[16],q0[17],q0[18];
-cx q0[16],q0[17];
-cx q0[15],q0[17];
-ccx q0[12],q0[14],q0[15];
-cx q0[13],q0[14];
-ccx q0[13],q0[14],q0[15];
-cx q0[13],q0[14];
-cx q0[12],q0[14];
-ccx q0[9],q0[11],q0[12];
-cx q0[10],q0[11];
-ccx q0[10],q0[11],q0[12];
-cx q0[10],q0[11];
-cx q0[9],q0[11];
-ccx q0[6],q0[8],q0[9];
-cx q0[7],q0[8];
-ccx q0[7],q0[8],q0[9];
-cx q0[7],q0[8];
-cx q0[6],q0[8];
-ccx q0[3],q0[5],q0[6];
-cx q0[4],q0[5];
-ccx q0[4],q0[5],q0[6];
-cx q0[4],q0[5];
-cx q0[3],q0[5];
-ccx q0[0],q0[2],q0[3];
-cx q0[1],q0[2];
-ccx q0[1],q0[2],q0[3];
-cx q0[1],q0[2];
-cx q0[0],q0[2];
-ccx q0[62],q0[45],q0[7];
-ccx q0[62],q0[46],q0[10];
-ccx q0[62],q0[47],q0[13];
-ccx q0[62],q0[48],q0[16];
-ccx q0[62],q0[49],q0[19];
-ccx q0[62],q0[50],q0[22];
-ccx q0[62],q0[51],q0[25];
-ccx q0[62],q0[52],q0[28];
-ccx q0[62],q0[53],q0[31];
-ccx q0[62],q0[54],q0[34];
-ccx q0[62],q0[55],q0[37];
-ccx q0[62],q0[56],q0[40];
-ccx q0[62],q0[57],q0[43];
-ccx q0[63],q0[45],q0[10];
-ccx q0[63],q0[46],q0[13];
-ccx q0[63],q0[47],q0[16];
-ccx q0[63],q0[48],q0[19];
-ccx q0[63],q0[49],q0[22];
-ccx q0[63],q0[50],q0[25];
-ccx q0[63],q0[51],q0[28];
-ccx q0[63],q0[52],q0[31];
-ccx q0[63],q0[53],q0[34];
-ccx q0[63],q0[54],q0[37];
-ccx q0[63],q0[55],q0[40];
-ccx q0[63],q0[56],q0[43];
-ccx q0[1],q0[2],q0[3];
-cx q0[1],q0[2];
-ccx q0[0],q0[2],q0[3];
-ccx q0[4],q0[5],q0[6];
-cx q0[4],q0[5];
-ccx q0[3],q0[5],q0[6];
-ccx q0[7],q0[8],q0[9];
-cx q0[7],q0[8];
-ccx q0[6],q0[8],q0[9];
-ccx q0[10],q0[11],q0[12];
-cx q0[10],q0[11];
-ccx q0[9],q0[11],q0[12];
-ccx q0[13],q0[14],q0[15];
-cx q0[13],q0[14];
-ccx q0[12],q0[14],q0[15];
-ccx q0[16],q0[17],q0[18];
-cx q0[16],q0[17];
-ccx q0[15],q0[17],q0[18];
-ccx q0[19],q0[20],q0[21];
-cx q0[19],q0[20];
-ccx q0[18],q0[20],q0[21];
-ccx q0[22],q0[23],q0[24];
-cx q0[22],q0[23];
-ccx q0[21],q0[23],q0[24];
-ccx q0[25],q0[26],q0[27];
-cx q0[25],q0[26];
-ccx q0[24],q0[26],q0[27];
-ccx q0[28],q0[29],q0[30];
-cx q0[28],q0[29];
-ccx q0[27],q0[29],q0[30];
-ccx q0[31],q0[32],q0[33];
-cx q0[31],q0[32];
-ccx q0[30],q0[32],q0[33];
-ccx q0[34],q0[35],q0[36];
-cx q0[34],q0[35];
-ccx q0[33],q0[35],q0[36];
-ccx q0[37],q0[38],q0[39];
-cx q0[37],q0[38];
-ccx q0[36],q0[38],q0[39];
-ccx q0[40],q0[41],q0[42];
-cx q0[40],q0[41];
-ccx q0[39],q0[41],q0[42];
-cx q0[43],q0[44];
-cx q0[42],q0[44];
-ccx q0[39],q0[41],q0[42];
-cx q0[40],q0[41];
-ccx q0[40],q0[41],q0[42];
-cx q0[40],q0[41];
-cx q0[39],q0[41];
-ccx q0[36],q0[38],q0[39];
-cx q0[37],q0[38];
-ccx q0[37],q0[38],q0[39];
-cx q0[37],q0[38];
-cx q0[36],q0[38];
-ccx q0[33],q0[35],q0[36];
-cx q0[34],q0[35];
-ccx q0[34],q0[35],q0[36];
-cx q0[34],q0[35];
-cx q0[33],q0[35];
-ccx q0[30],q0[32],q0[33];
-cx q0[31],q0[32];
-ccx q0[31],q0[32],q0[33];
-cx q0[31],q0[32];
-cx q0[30],q0[32];
-ccx q0[27],q0[29],q0[30];
-cx q0[28],q0[29];
-ccx q0[28],q0[29],q0[30];
-cx q0[28],q0[29];
-cx q0[27],q0[29];
-ccx q0[24],q0[26],q0[27];
-cx q0[25],q0[26];
-ccx q0[25],q0[26],q0[27];
-cx q0[25],q0[26];
-cx q0[24],q0[26];
-ccx q0[21],q0[23],q0[24];
-cx q0[22],q0[23];
-ccx q0[22],q0[23],q0[24];
-cx q0[22],q0[23];
-cx q0[21],q0[23];
-ccx q0[18],q0[20],q0[21];
-cx q0[19],q0[20];
-ccx q0[19],q0[20],q0[21];
-cx q0[19],q0[20];
-cx q0[18],q0[20];
-ccx q0[15],q0[17],q0[18];
-cx q0[16],q0[17];
-ccx q0[16],q0[17],q0[18];
-cx q0[16],q0[17];
-cx q0[15],q0[17];
-ccx q0[12],q0[14],q0[15];
-cx q0[13],q0[14];
-ccx q0[13],q0[14],q0[15];
-cx q0[13],q0[14];
-cx q0[12],q0[14];
-ccx q0[9],q0[11],q0[12];
-cx q0[10],q0[11];
-ccx q0[10],q0[11],q0[12];
-cx q0[10],q0[11];
-cx q0[9],q0[11];
-ccx q0[6],q0[8],q0[9];
-cx q0[7],q0[8];
-ccx q0[7],q0[8],q0[9];
-cx q0[7],q0[8];
-cx q0[6],q0[8];
-ccx q0[3],q0[5],q0[6];
-cx q0[4],q0[5];
-ccx q0[4],q0[5],q0[6];
-cx q0[4],q0[5];
-cx q0[3],q0[5];
-ccx q0[0],q0[2],q0[3];
-cx q0[1],q0[2];
-ccx q0[1],q0[2],q0[3];
-cx q0[1],q0[2];
-cx q0[0],q0[2];
-ccx q0[63],q0[45],q0[10];
-ccx q0[63],q0[46],q0[13];
-ccx q0[63],q0[47],q0[16];
-ccx q0[63],q0[48],q0[19];
-ccx q0[63],q0[49],q0[22];
-ccx q0[63],q0[50],q0[25];
-ccx q0[63],q0[51],q0[28];
-ccx q0[63],q0[52],q0[31];
-ccx q0[63],q0[53],q0[34];
-ccx q0[63],q0[54],q0[37];
-ccx q0[63],q0[55],q0[40];
-ccx q0[63],q0[56],q0[43];
-ccx q0[64],q0[45],q0[13];
-ccx q0[64],q0[46],q0[16];
-ccx q0[64],q0[47],q0[19];
-ccx q0[64],q0[48],q0[22];
-ccx q0[64],q0[49],q0[25];
-ccx q0[64],q0[50],q0[28];
-ccx q0[64],q0[51],q0[31];
-ccx q0[64],q0[52],q0[34];
-ccx q0[64],q0[53],q0[37];
-ccx q0[64],q0[54],q0[40];
-ccx q0[64],q0[55],q0[43];
-ccx q0[1],q0[2],q0[3];
-cx q0[1],q0[2];
-ccx q0[0],q0[2],q0[3];
-ccx q0[4],q0[5],q0[6];
-cx q0[4],q0[5];
-ccx q0[3],q0[5],q0[6];
-ccx q0[7],q0[8],q0[9];
-cx q0[7],q0[8];
-ccx q0[6],q0[8],q0[9];
-ccx q0[10],q0[11],q0[12];
-cx q0[10],q0[11];
-ccx q0[9],q0[11],q0[12];
-ccx q0[13],q0[14],q0[15];
-cx q0[13],q0[14];
-ccx q0[12],q0[14],q0[15];
-ccx q0[16],q0[17],q0[18];
-cx q0[16],q0[17];
-ccx q0[15],q0[17],q0[18];
-ccx q0[19],q0[20],q0[21];
-cx q0[19],q0[20];
-ccx q0[18],q0[20],q0[21];
-ccx q0[22],q0[23],q0[24];
-cx q0[22],q0[23];
-ccx q0[21],q0[23],q0[24];
-ccx q0[25],q0[26],q0[27];
-cx q0[25],q0[26];
-ccx q0[24],q0[26],q0[27];
-ccx q0[28],q0[29],q0[30];
-cx q0[28],q0[29];
-ccx q0[27],q0[29],q0[30];
-ccx q0[31],q0[32],q0[33];
-cx q0[31],q0[32];
-ccx q0[30],q0[32],q0[33];
-ccx q0[34],q0[35],q0[36];
-cx q0[34],q0[35];
-ccx q0[33],q0[35],q0[36];
-ccx q0[37],q0[38],q0[39];
-cx q0[37],q0[38];
-ccx q0[36],q0[38],q0[39];
-ccx q0[40],q0[41],q0[42];
-cx q0[40],q0[41];
-ccx q0[39],q0[41],q0[42];
-cx q0[43],q0[44];
-cx q0[42],q0[44];
-ccx q0[39],q0[41],q0[42];
-cx q0[40],q0[41];
-ccx q0[40],q0[41],q0[42];
-cx q0[40],q0[41];
-cx q0[39],q0[41];
-ccx q0[36],q0[38],q0[39];
-cx q0[37],q0[38];
-ccx q0[37],q0[38],q0[39];
-cx q0[37],q0[38];
-cx q0[36],q0[38];
-ccx q0[33],q0[35],q0[36];
-cx q0[34],q0[35];
-ccx q0[34],q0[35],q0[36];
-cx q0[34],q0[35];
-cx q0[33],q0[35];
-ccx q0[30],q0[32],q0[33];
-cx q0[31],q0[32];
-ccx q0[31],q0[32],q0[33];
-cx q0[31],q0[32];
-cx q0[30],q0[32];
-ccx q0[27],q0[29],q0[30];
-cx q0[28],q0[29];
-ccx q0[28],q0[29],q0[30];
-cx q0[28],q0[29];
-cx q0[27],q0[29];
-ccx q0[24],q0[26],q0[27];
-cx q0[25],q0[26];
-ccx q0[25],q0[26],q0[27];
-cx q0[25],q0[26];
-cx q0[24],q0[26];
-ccx q0[21],q0[23],q0[24];
-cx q0[22],q0[23];
-ccx q0[22],q0[23],q0[24];
-cx q0[22],q0[23];
-cx q0[21],q0[23];
-ccx q0[18],q0[20],q0[21];
-cx q0[19],q0[20];
-ccx q0[19],q0[20],q0[21];
-cx q0[19],q0[20];
-cx q0[18],q0[20];
-ccx q0[15],q0[17],q0[18];
-cx q0[16],q0[17];
-ccx q0[16],q0[17],q0[18];
-cx q0[16],q0[17];
-cx q0[15],q0[17];
-ccx q0[12],q0[14],q0[15];
-cx q0[13],q0[14];
-ccx q0[13],q0[14],q0[15];
-cx q0[13],q0[14];
-cx q0[12],q0[14];
-ccx q0[9],q0[11],q0[12];
-cx q0[10],q0[11];
-ccx q0[10],q0[11],q0[12];
-cx q0[10],q0[11];
-cx q0[9],q0[11];
-ccx q0[6],q0[8],q0[9];
-cx q0[7],q0[8];
-ccx q0[7],q0[8],q0[9];
-cx q0[7],q0[8];
-cx q0[6],q0[8];
-ccx q0[3],q0[5],q0[6];
-cx q0[4],q0[5];
-ccx q0[4],q0[5],q0[6];
-cx q0[4],q0[5];
-cx q0[3],q0[5];
-ccx q0[0],q0[2],q0[3];
-cx q0[1],q0[2];
-ccx q0[1],q0[2],q0[3];
-cx q0[1],q0[2];
-cx q0[0],q0[2];
-ccx q0[64],q0[45],q0[13];
-ccx q0[64],q0[46],q0[16];
-ccx q0[64],q0[47],q0[19];
-ccx q0[64],q0[48],q0[22];
-ccx q0[64],q0[49],q0[25];
-ccx q0[64],q0[50],q0[28];
-ccx q0[64],q0[51],q0[31];
-ccx q0[64],q0[52],q0[34];
-ccx q0[64],q0[53],q0[37];
-ccx q0[64],q0[54],q0[40];
-ccx q0[64],q0[55],q0[43];
-ccx q0[65],q0[45],q0[16];
-ccx q0[65],q0[46],q0[19];
-ccx q0[65],q0[47],q0[22];
-ccx q0[65],q0[48],q0[25];
-ccx q0[65],q0[49],q0[28];
-ccx q0[65],q0[50],q0[31];
-ccx q0[65],q0[51],q0[34];
-ccx q0[65],q0[52],q0[37];
-ccx q0[65],q0[53],q0[40];
-ccx q0[65],q0[54],q0[43];
-ccx q0[1],q0[2],q0[3];
-cx q0[1],q0[2];
-ccx q0[0],q0[2],q0[3];
-ccx q0[4],q0[5],q0[6];
-cx q0[4],q0[5];
-ccx q0[3],q0[5],q0[6];
-ccx q0[7],q0[8],q0[9];
-cx q0[7],q0[8];
-ccx q0[6],q0[8],q0[9];
-ccx q0[10],q0[11],q0[12];
-cx q0[10],q0[11];
-ccx q0[9],q0[11],q0[12];
-ccx q0[13],q0[14],q0[15];
-cx q0[13],q0[14];
-ccx q0[12],q0[14],q0[15];
-ccx q0[16],q0[17],q0[18];
-cx q0[16],q0[17];
-ccx q0[15],q0[17],q0[18];
-ccx q0[19],q0[20],q0[21];
-cx q0[19],q0[20];
-ccx q0[18],q0[20],q0[21];
-ccx q0[22],q0[23],q0[24];
-cx q0[22],q0[23];
-ccx q0[21],q0[23],q0[24];
-ccx q0[25],q0[26],q0[27];
-cx q0[25],q0[26];
-ccx q0[24],q0[26],q0[27];
-ccx q0[28],q0[29],q0[30];
-cx q0[28],q0[29];
-ccx q0[27],q0[29],q0[30];
-ccx q0[31],q0[32],q0[33];
-cx q0[31],q0[32];
-ccx q0[30],q0[32],q0[33];
-ccx q0[34],q0[35],q0[36];
-cx q0[34],q0[35];
-ccx q0[33],q0[35],q0[36];
-ccx q0[37],q0[38],q0[39];
-cx q0[37],q0[38];
-ccx q0[36],q0[38],q0[39];
-ccx q0[40],q0[41],q0[42];
-cx q0[40],q0[41];
-ccx q0[39],q0[41],q0[42];
-cx q0[43],q0[44];
-cx q0[42],q0[44];
-ccx q0[39],q0[41],q0[42];
-cx q0[40],q0[41];
-ccx q0[40],q0[41],q0[42];
-cx q0[40],q0[41];
-cx q0[39],q0[41];
-ccx q0[36],q0[38],q0[39];
-cx q0[37],q0[38];
-ccx q0[37],q0[38],q0[39];
-cx q0[37],q0[38];
-cx q0[36],q0[38];
-ccx q0[33],q0[35],q0[36];
-cx q0[34],q0[35];
-ccx q0[34],q0[35],q0[36];
-cx q0[34],q0[35];
-cx q0[33],q0[35];
-ccx q0[30],q0[32],q0[33];
-cx q0[31],q0[32];
-ccx q0[31],q0[32],q0[33];
-cx q0[31],q0[32];
-cx q0[30],q0[32];
-ccx q0[27],q0[29],q0[30];
-cx q0[28],q0[29];
-ccx q0[28],q0[29],q0[30];
-cx q0[28],q0[29];
-cx q0[27],q0[29];
-ccx q0[24],q0[26],q0[27];
-cx q0[25],q0[26];
-ccx q0[25],q0[26],q0[27];
-cx q0[25],q0[26];
-cx q0[24],q0[26];
-ccx q0[21],q0[23],q0[24];
-cx q0[22],q0[23];
-ccx q0[22],q0[23],q0[24];
-cx q0[22],q0[23];
-cx q0[21],q0[23];
-ccx q0[18],q0[20],q0[21];
-cx q0[19],q0[20];
-ccx q0[19],q0[20],q0[21];
-cx q0[19],q0[20];
-cx q0[18],q0[20];
-ccx q0[15],q0[17],q0[18];
-cx q0[16],q0[17];
-ccx q0[16],q0[17],q0[18];
-cx q0[16],q0[17];
-cx q0[15],q0[17];
-ccx q0[12],q0[14],q0[15];
-cx q0[13],q0[14];
-ccx q0[13],q0[14],q0[15];
-cx q0[13],q0[14];
-cx q0[12],q0[14];
-ccx q0[9],q0[11],q0[12];
-cx q0[10],q0[11];
-ccx q0[10],q0[11],q0[12];
-cx q0[10],q0[11];
-cx q0[9],q0[11];
-ccx q0[6],q0[8],q0[9];
-cx q0[7],q0[8];
-ccx q0[7],q0[8],q0[9];
-cx q0[7],q0[8];
-cx q0[6],q0[8];
-ccx q0[3],q0[5],q0[6];
-cx q0[4],q0[5];
-ccx q0[4],q0[5],q0[6];
-cx q0[4],q0[5];
-cx q0[3],q0[5];
-ccx q0[0],q0[2],q0[3];
-cx q0[1],q0[2];
-ccx q0[1],q0[2],q0[3];
-cx q0[1],q0[2];
-cx q0[0],q0[2];
-ccx q0[65],q0[45],q0[16];
-ccx q0[65],q0[46],q0[19];
-ccx q0[65],q0[47],q0[22];
-ccx q0[65],q0[48],q0[25];
-ccx q0[65],q0[49],q0[28];
-ccx q0[65],q0[50],q0[31];
-ccx q0[65],q0[51],q0[34];
-ccx q0[65],q0[52],q0[37];
-ccx q0[65],q0[53],q0[40];
-ccx q0[65],q0[54],q0[43];
-ccx q0[66],q0[45],q0[19];
-ccx q0[66],q0[46],q0[22];
-ccx q0[66],q0[47],q0[25];
-ccx q0[66],q0[48],q0[28];
-ccx q0[66],q0[49],q0[31];
-ccx q0[66],q0[50],q0[34];
-ccx q0[66],q0[51],q0[37];
-ccx q0[66],q0[52],q0[40];
-ccx q0[66],q0[53],q0[43];
-ccx q0[1],q0[2],q0[3];
-cx q0[1],q0[2];
-ccx q0[0],q0[2],q0[3];
-ccx q0[4],q0[5],q0[6];
-cx q0[4],q0[5];
-ccx q0[3],q0[5],q0[6];
-ccx q0[7],q0[8],q0[9];
-cx q0[7],q0[8];
-ccx q0[6],q0[8],q0[9];
-ccx q0[10],q0[11],q0[12];
-cx q0[10],q0[11];
-ccx q0[9],q0[11],q0[12];
-ccx q0[13],q0[14],q0[15];
-cx q0[13],q0[14];
-ccx q0[12],q0[14],q0[15];
-ccx q0[16],q0[17],q0[18];
-cx q0[16],q0[17];
-ccx q0[15],q0[17],q0[18];
-ccx q0[19],q0[20],q0[21];
-cx q0[19],q0[20];
-ccx q0[18],q0[20],q0[21];
-ccx q0[22],q0[23],q0[24];
-cx q0[22],q0[23];
-ccx q0[21],q0[23],q0[24];
-ccx q0[25],q0[26],q0[27];
-cx q0[25],q0[26];
-ccx q0[24],q0[26],q0[27];
-ccx q0[28],q0[29],q0[30];
-cx q0[28],q0[29];
-ccx q0[27],q0[29],q0[30];
-ccx q0[31],q0[32],q0[33];
-cx q0[31],q0[32];
-ccx q0[30],q0[32],q0[33];
-ccx q0[34],q0[35],q0[36];
-cx q0[34],q0[35];
-ccx q0[33],q0[35],q0[36];
-ccx q0[37],q0[38],q0[39];
-cx q0[37],q0[38];
-ccx q0[36],q0[38],q0[39];
-ccx q0[40],q0[41],q0[42];
-cx q0[40],q0[41];
-ccx q0[39],q0[41],q0[42];
-cx q0[43],q0[44];
-cx q0[42],q0[44];
-ccx q0[39],q0[41],q0[42];
-cx q0[40],q0[41];
-ccx q0[40],q0[41],q0[42];
-cx q0[40],q0[41];
-cx q0[39],q0[41];
-ccx q0[36],q0[38],q0[39];
-cx q0[37],q0[38];
-ccx q0[37],q0[38],q0[39];
-cx q0[37],q0[38];
-cx q0[36],q0[38];
-ccx q0[33],q0[35],q0[36];
-cx q0[34],q0[35];
-ccx q0[34],q0[35],q0[36];
-cx q0[34],q0[35];
-cx q0[33],q0[35];
-ccx q0[30],q0[32],q0[33];
-cx q0[31],q0[32];
-ccx q0[31],q0[32],q0[33];
-cx q0[31],q0[32];
-cx q0[30],q0[32];
-ccx q0[27],q0[29],q0[30];
-cx q0[28],q0[29];
-ccx q0[28],q0[29],q0[30];
-cx q0[28],q0[29];
-cx q0[27],q0[29];
-ccx q0[24],q0[26],q0[27];
-cx q0[25],q0[26];
-ccx q0[25],q0[26],q0[27];
-cx q0[25],q0[26];
-cx q0[24],q0[26];
-ccx q0[21],q0[23],q0[24];
-cx q0[22],q0[23];
-ccx q0[22],q0[23],q0[24];
-cx q0[22],q0[23];
-cx q0[21],q0[23];
-ccx q0[18],q0[20],q0[21];
-cx q0[19],q0[20];
-ccx q0[19],q0[20],q0[21];
-cx q0[19],q0[20];
-cx q0[18],q0[20];
-ccx q0[15],q0[17],q0[18];
-cx q0[16],q0[17];
-ccx q0[16],q0[17],q0[18];
-cx q0[16],q0[17];
-cx q0[15],q0[17];
-ccx q0[12],q0[14],q0[15];
-cx q0[13],q0[14];
-ccx q0[13],q0[14],q0[15];
-cx q0[13],q0[14];
-cx q0[12],q0[14];
-ccx q0[9],q0[11],q0[12];
-cx q0[10],q0[11];
-ccx q0[10],q0[11],q0[12];
-cx q0[10],q0[11];
-cx q0[9],q0[11];
-ccx q0[6],q0[8],q0[9];
-cx q0[7],q0[8];
-ccx q0[7],q0[8],q0[9];
-cx q0[7],q0[8];
-cx q0[6],q0[8];
-ccx q0[3],q0[5],q0[6];
-cx q0[4],q0[5];
-ccx q0[4],q0[5],q0[6];
-cx q0[4],q0[5];
-cx q0[3],q0[5];
-ccx q0[0],q0[2],q0[3];
-cx q0[1],q0[2];
-ccx q0[1],q0[2],q0[3];
-cx q0[1],q0[2];
-cx q0[0],q0[2];
-ccx q0[66],q0[45],q0[19];
-ccx q0[66],q0[46],q0[22];
-ccx q0[66],q0[47],q0[25];
-ccx q0[66],q0[48],q0[28];
-ccx q0[66],q0[49],q0[31];
-ccx q0[66],q0[50],q0[34];
-ccx q0[66],q0[51],q0[37];
-ccx q0[66],q0[52],q0[40];
-ccx q0[66],q0[53],q0[43];
-ccx q0[67],q0[45],q0[22];
-ccx q0[67],q0[46],q0[25];
-ccx q0[67],q0[47],q0[28];
-ccx q0[67],q0[48],q0[31];
-ccx q0[67],q0[49],q0[34];
-ccx q0[67],q0[50],q0[37];
-ccx q0[67],q0[51],q0[40];
-ccx q0[67],q0[52],q0[43];
-ccx q0[1],q0[2],q0[3];
-cx q0[1],q0[2];
-ccx q0[0],q0[2],q0[3];
-ccx q0[4],q0[5],q0[6];
-cx q0[4],q0[5];
-ccx q0[3],q0[5],q0[6];
-ccx q0[7],q0[8],q0[9];
-cx q0[7],q0[8];
-ccx q0[6],q0[8],q0[9];
-ccx q0[10],q0[11],q0[12];
-cx q0[10],q0[11];
-ccx q0[9],q0[11],q0[12];
-ccx q0[13],q0[14],q0[15];
-cx q0[13],q0[14];
-ccx q0[12],q0[14],q0[15];
-ccx q0[16],q0[17],q0[18];
-cx q0[16],q0[17];
-ccx q0[15],q0[17],q0[18];
-ccx q0[19],q0[20],q0[21];
-cx q0[19],q0[20];
-ccx q0[18],q0[20],q0[21];
-ccx q0[22],q0[23],q0[24];
-cx q0[22],q0[23];
-ccx q0[21],q0[23],q0[24];
-ccx q0[25],q0[26],q0[27];
-cx q0[25],q0[26];
-ccx q0[24],q0[26],q0[27];
-ccx q0[28],q0[29],q0[30];
-cx q0[28],q0[29];
-ccx q0[27],q0[29],q0[30];
-ccx q0[31],q0[32],q0[33];
-cx q0[31],q0[32];
-ccx q0[30],q0[32],q0[33];
-ccx q0[34],q0[35],q0[36];
-cx q0[34],q0[35];
-ccx q0[33],q0[35],q0[36];
-ccx q0[37],q0[38],q0[39];
-cx q0[37],q0[38];
-ccx q0[36],q0[38],q0[39];
-ccx q0[40],q0[41],q0[42];
-cx q0[40],q0[41];
-ccx q0[39],q0[41],q0[42];
-cx q0[43],q0[44];
-cx q0[42],q0[44];
-ccx q0[39],q0[41],q0[42];
-cx q0[40],q0[41];
-ccx q0[40],q0[41],q0[42];
-cx q0[40],q0[41];
-cx q0[39],q0[41];
-ccx q0[36],q0[38],q0[39];
-cx q0[37],q0[38];
-ccx q0[37],q0[38],q0[39];
-cx q0[37],q0[38];
-cx q0[36],q0[38];
-ccx q0[33],q0[35],q0[36];
-cx q0[34],q0[35];
-ccx q0[34],q0[35],q0[36];
-cx q0[34],q0[35];
-cx q0[33],q0[35];
-ccx q0[30],q0[32],q0[33];
-cx q0[31],q0[32];
-ccx q0[31],q0[32],q0[33];
-cx q0[31],q0[32];
-cx q0[30],q0[32];
-ccx q0[27],q0[29],q0[30];
-cx q0[28],q0[29];
-ccx q0[28],q0[29],q0[30];
-cx q0[28],q0[29];
-cx q0[27],q0[29];
-ccx q0[24],q0[26],q0[27];
-cx q0[25],q0[26];
-ccx q0[25],q0[26],q0[27];
-cx q0[25],q0[26];
-cx q0[24],q0[26];
-ccx q0[21],q0[23],q0[24];
-cx q0[22],q0[23];
-ccx q0[22],q0[23],q0[24];
-cx q0[22],q0[23];
-cx q0[21],q0[23];
-ccx q0[18],q0[20],q0[21];
-cx q0[19],q0[20];
-ccx q0[19],q0[20],q0[21];
-cx q0[19],q0[20];
-cx q0[18],q0[20];
-ccx q0[15],q0[17],q0[18];
-cx q0[16],q0[17];
-ccx q0[16],q0[17],q0[18];
-cx q0[16],q0[17];
-cx q0[15],q0[17];
-ccx q0[12],q0[14],q0[15];
-cx q0[13],q0[14];
-ccx q0[13],q0[14],q0[15];
-cx q0[13],q0[14];
-cx q0[12],q0[14];
-ccx q0[9],q0[11],q0[12];
-cx q0[10],q0[11];
-ccx q0[10],q0[11],q0[12];
-cx q0[10],q0[11];
-cx q0[9],q0[11];
-ccx q0[6],q0[8],q0[9];
-cx q0[7],q0[8];
-ccx q0[7],q0[8],q0[9];
-cx q0[7],q0[8];
-cx q0[6],q0[8];
-ccx q0[3],q0[5],q0[6];
-cx q0[4],q0[5];
-ccx q0[4],q0[5],q0[6];
-cx q0[4],q0[5];
-cx q0[3],q0[5];
-ccx q0[0],q0[2],q0[3];
-cx q0[1],q0[2];
-ccx q0[1],q0[2],q0[3];
-cx q0[1],q0[2];
-cx q0[0],q0[2];
-ccx q0[67],q0[45],q0[22];
-ccx q0[67],q0[46],q0[25];
-ccx q0[67],q0[47],q0[28];
-ccx q0[67],q0[48],q0[31];
-ccx q0[67],q0[49],q0[34];
-ccx q0[67],q0[50],q0[37];
-ccx q0[67],q0[51],q0[40];
-ccx q0[67],q0[52],q0[43];
-ccx q0[68],q0[45],q0[25];
-ccx q0[68],q0[46],q0[28];
-ccx q0[68],q0[47],q0[31];
-ccx q0[68],q0[48],q0[34];
-ccx q0[68],q0[49],q0[37];
-ccx q0[68],q0[50],q0[40];
-ccx q0[68],q0[51],q0[43];
-ccx q0[1],q0[2],q0[3];
-cx q0[1],q0[2];
-ccx q0[0],q0[2],q0[3];
-ccx q0[4],q0[5],q0[6];
-cx q0[4],q0[5];
-ccx q0[3],q0[5],q0[6];
-ccx q0[7],q0[8],q0[9];
-cx q0[7],q0[8];
-ccx q0[6],q0[8],q0[9];
-ccx q0[10],q0[11],q0[12];
-cx q0[10],q0[11];
-ccx q0[9],q0[11],q0[12];
-ccx q0[13],q0[14],q0[15];
-cx q0[13],q0[14];
-ccx q0[12],q0[14],q0[15];
-ccx q0[16],q0[17],q0[18];
-cx q0[16],q0[17];
-ccx q0[15],q0[17],q0[18];
-ccx q0[19],q0[20],q0[21];
-cx q0[19],q0[20];
-ccx q0[18],q0[20],q0[21];
-ccx q0[22],q0[23],q0[24];
-cx q0[22],q0[23];
-ccx q0[21],q0[23],q0[24];
-ccx q0[25],q0[26],q0[27];
-cx q0[25],q0[26];
-ccx q0[24],q0[26],q0[27];
-ccx q0[28],q0[29],q0[30];
-cx q0[28],q0[29];
-ccx q0[27],q0[29],q0[30];
-ccx q0[31],q0[32],q0[33];
-cx q0[31],q0[32];
-ccx q0[30],q0[32],q0[33];
-ccx q0[34],q0[35],q0[36];
-cx q0[34],q0[35];
-ccx q0[33],q0[35],q0[36];
-ccx q0[37],q0[38],q0[39];
-cx q0[37],q0[38];
-ccx q0[36],q0[38],q0[39];
-ccx q0[40],q0[41],q0[42];
-cx q0[40],q0[41];
-ccx q0[39],q0[41],q0[42];
-cx q0[43],q0[44];
-cx q0[42],q0[44];
-ccx q0[39],q0[41],q0[42];
-cx q0[40],q0[41];
-ccx q0[40],q0[41],q0[42];
-cx q0[40],q0[41];
-cx q0[39],q0[41];
-ccx q0[36],q0[38],q0[39];
-cx q0[37],q0[38];
-ccx q0[37],q0[38],q0[39];
-cx q0[37],q0[38];
-cx q0[36],q0[38];
-ccx q0[33],q0[35],q0[36];
-cx q0[34],q0[35];
-ccx q0[34],q0[35],q0[36];
-cx q0[34],q0[35];
-cx q0[33],q0[35];
-ccx q0[30],q0[32],q0[33];
-cx q0[31],q0[32];
-ccx q0[31],q0[32],q0[33];
-cx q0[31],q0[32];
-cx q0[30],q0[32];
-ccx q0[27],q0[29],q0[30];
-cx q0[28],q0[29];
-ccx q0[28],q0[29],q0[30];
-cx q0[28],q0[29];
-cx q0[27],q0[29];
-ccx q0[24],q0[26],q0[27];
-cx q0[25],q0[26];
-ccx q0[25],q0[26],q0[27];
-cx q0[25],q0[26];
-cx q0[24],q0[26];
-ccx q0[21],q0[23],q0[24];
-cx q0[22],q0[23];
-ccx q0[22],q0[23],q0[24];
-cx q0[22],q0[23];
-cx q0[21],q0[23];
-ccx q0[18],q0[20],q0[21];
-cx q0[19],q0[20];
-ccx q0[19],q0[20],q0[21];
-cx q0[19],q0[20];
-cx q0[18],q0[20];
-ccx q0[15],q0[17],q0[18];
-cx q0[16],q0[17];
-ccx q0[16],q0[17],q0[18];
-cx q0[16],q0[17];
-cx q0[15],q0[17];
-ccx q0[12],q0[14],q0[15];
-cx q0[13],q0[14];
-ccx q0[13],q0[14],q0[15];
-cx q0[13],q0[14];
-cx q0[12],q0[14];
-ccx q0[9],q0[11],q0[12];
-cx q0[10],q0[11];
-ccx q0[10],q0[11],q0[12];
-cx q0[10],q0[11];
-cx q0[9],q0[11];
-ccx q0[6],q0[8],q0[9];
-cx q0[7],q0[8];
-ccx q0[7],q0[8],q0[9];
-cx q0[7],q0[8];
-cx q0[6],q0[8];
-ccx q0[3],q0[5],q0[6];
-cx q0[4],q0[5];
-ccx q0[4],q0[5],q0[6];
-cx q0[4],q0[5];
-cx q0[3],q0[5];
-ccx q0[0],q0[2],q0[3];
-cx q0[1],q0[2];
-ccx q0[1],q0[2],q0[3];
-cx q0[1],q0[2];
-cx q0[0],q0[2];
-ccx q0[68],q0[45],q0[25];
-ccx q0[68],q0[46],q0[28];
-ccx q0[68],q0[47],q0[31];
-ccx q0[68],q0[48],q0[34];
-ccx q0[68],q0[49],q0[37];
-ccx q0[68],q0[50],q0[40];
-ccx q0[68],q0[51],q0[43];
-ccx q0[69],q0[45],q0[28];
-ccx q0[69],q0[46],q0[31];
-ccx q0[69],q0[47],q0[34];
-ccx q0[69],q0[48],q0[37];
-ccx q0[69],q0[49],q0[40];
-ccx q0[69],q0[50],q0[43];
-ccx q0[1],q0[2],q0[3];
-cx q0[1],q0[2];
-ccx q0[0],q0[2],q0[3];
-ccx q0[4],q0[5],q0[6];
-cx q0[4],q0[5];
-ccx q0[3],q0[5],q0[6];
-ccx q0[7],q0[8],q0[9];
-cx q0[7],q0[8];
-ccx q0[6],q0[8],q0[9];
-ccx q0[10],q0[11],q0[12];
-cx q0[10],q0[11];
-ccx q0[9],q0[11],q0[12];
-ccx q0[13],q0[14],q0[15];
-cx q0[13],q0[14];
-ccx q0[12],q0[14],q0[15];
-ccx q0[16],q0[17],q0[18];
-cx q0[16],q0[17];
-ccx q0[15],q0[17],q0[18];
-ccx q0[19],q0[20],q0[21];
-cx q0[19],q0[20];
-ccx q0[18],q0[20],q0[21];
-ccx q0[22],q0[23],q0[24];
-cx q0[22],q0[23];
-ccx q0[21],q0[23],q0[24];
-ccx q0[25],q0[26],q0[27];
-cx q0[25],q0[26];
-ccx q0[24],q0[26],q0[27];
-ccx q0[28],q0[29],q0[30];
-cx q0[28],q0[29];
-ccx q0[27],q0[29],q0[30];
-ccx q0[31],q0[32],q0[33];
-cx q0[31],q0[32];
-ccx q0[30],q0[32],q0[33];
-ccx q0[34],q0[35],q0[36];
-cx q0[34],q0[35];
-ccx q0[33],q0[35],q0[36];
-ccx q0[37],q0[38],q0[39];
-cx q0[37],q0[38];
-ccx q0[36],q0[38],q0[39];
-ccx q0[40],q0[41],q0[42];
-cx q0[40],q0[41];
-ccx q0[39],q0[41],q0[42];
-cx q0[43],q0[44];
-cx q0[42],q0[44];
-ccx q0[39],q0[41],q0[42];
-cx q0[40],q0[41];
-ccx q0[40],q0[41],q0[42];
-cx q0[40],q0[41];
-cx q0[39],q0[41];
-ccx q0[36],q0[38],q0[39];
-cx q0[37],q0[38];
-ccx q0[37],q0[38],q0[39];
-cx q0[37],q0[38];
-cx q0[36],q0[38];
-ccx q0[33],q0[35],q0[36];
-cx q0[34],q0[35];
-ccx q0[34],q0[35],q0[36];
-cx q0[34],q0[35];
-cx q0[33],q0[35];
-ccx q0[30],q0[32],q0[33];
-cx q0[31],q0[32];
-ccx q0[31],q0[32],q0[33];
-cx q0[31],q0[32];
-cx q0[30],q0[32];
-ccx q0[27],q0[29],q0[30];
-cx q0[28],q0[29];
-ccx q0[28],q0[29],q0[30];
-cx q0[28],q0[29];
-cx q0[27],q0[29];
-ccx q0[24],q0[26],q0[27];
-cx q0[25],q0[26];
-ccx q0[25],q0[26],q0[27];
-cx q0[25],q0[26];
-cx q0[24],q0[26];
-ccx q0[21],q0[23],q0[24];
-cx q0[22],q0[23];
-ccx q0[22],q0[23],q0[24];
-cx q0[22],q0[23];
-cx q0[21],q0[23];
-ccx q0[18],q0[20],q0[21];
-cx q0[19],q0[20];
-ccx q0[19],q0[20],q0[21];
-cx q0[19],q0[20];
-cx q0[18],q0[20];
-ccx q0[15],q0[17],q0[18];
-cx q0[16],q0[17];
-ccx q0[16],q0[17],q0[18];
-cx q0[16],q0[17];
-cx q0[15],q0[17];
-ccx q0[12],q0[14],q0[15];
-cx q0[13],q0[14];
-ccx q0[13],q0[14],q0[15];
-cx q0[13],q0[14];
-cx q0[12],q0[14];
-ccx q0[9],q0[11],q0[12];
-cx q0[10],q0[11];
-ccx q0[10],q0[11],q0[12];
-cx q0[10],q0[11];
-cx q0[9],q0[11];
-ccx q0[6],q0[8],q0[9];
-cx q0[7],q0[8];
-ccx q0[7],q0[8],q0[9];
-cx q0[7],q0[8];
-cx q0[6],q0[8];
-ccx q0[3],q0[5],q0[6];
-cx q0[4],q0[5];
-ccx q0[4],q0[5],q0[6];
-cx q0[4],q0[5];
-cx q0[3],q0[5];
-ccx q0[0],q0[2],q0[3];
-cx q0[1],q0[2];
-ccx q0[1],q0[2],q0[3];
-cx q0[1],q0[2];
-cx q0[0],q0[2];
-ccx q0[69],q0[45],q0[28];
-ccx q0[69],q0[46],q0[31];
-ccx q0[69],q0[47],q0[34];
-ccx q0[69],q0[48],q0[37];
-ccx q0[69],q0[49],q0[40];
-ccx q0[69],q0[50],q0[43];
-ccx q0[70],q0[45],q0[31];
-ccx q0[70],q0[46],q0[34];
-ccx q0[70],q0[47],q0[37];
-ccx q0[70],q0[48],q0[40];
-ccx q0[70],q0[49],q0[43];
-ccx q0[1],q0[2],q0[3];
-cx q0[1],q0[2];
-ccx q0[0],q0[2],q0[3];
-ccx q0[4],q0[5],q0[6];
-cx q0[4],q0[5];
-ccx q0[3],q0[5],q0[6];
-ccx q0[7],q0[8],q0[9];
-cx q0[7],q0[8];
-ccx q0[6],q0[8],q0[9];
-ccx q0[10],q0[11],q0[12];
-cx q0[10],q0[11];
-ccx q0[9],q0[11],q0[12];
-ccx q0[13],q0[14],q0[15];
-cx q0[13],q0[14];
-ccx q0[12],q0[14],q0[15];
-ccx q0[16],q0[17],q0[18];
-cx q0[16],q0[17];
-ccx q0[15],q0[17],q0[18];
-ccx q0[19],q0[20],q0[21];
-cx q0[19],q0[20];
-ccx q0[18],q0[20],q0[21];
-ccx q0[22],q0[23],q0[24];
-cx q0[22],q0[23];
-ccx q0[21],q0[23],q0[24];
-ccx q0[25],q0[26],q0[27];
-cx q0[25],q0[26];
-ccx q0[24],q0[26],q0[27];
-ccx q0[28],q0[29],q0[30];
-cx q0[28],q0[29];
-ccx q0[27],q0[29],q0[30];
-ccx q0[31],q0[32],q0[33];
-cx q0[31],q0[32];
-ccx q0[30],q0[32],q0[33];
-ccx q0[34],q0[35],q0[36];
-cx q0[34],q0[35];
-ccx q0[33],q0[35],q0[36];
-ccx q0[37],q0[38],q0[39];
-cx q0[37],q0[38];
-ccx q0[36],q0[38],q0[39];
-ccx q0[40],q0[41],q0[42];
-cx q0[40],q0[41];
-ccx q0[39],q0[41],q0[42];
-cx q0[43],q0[44];
-cx q0[42],q0[44];
-ccx q0[39],q0[41],q0[42];
-cx q0[40],q0[41];
-ccx q0[40],q0[41],q0[42];
-cx q0[40],q0[41];
-cx q0[39],q0[41];
-ccx q0[36],q0[38],q0[39];
-cx q0[37],q0[38];
-ccx q0[37],q0[38],q0[39];
-cx q0[37],q0[38];
-cx q0[36],q0[38];
-ccx q0[33],q0[35],q0[36];
-cx q0[34],q0[35];
-ccx q0[34],q0[35],q0[36];
-cx q0[34],q0[35];
-cx q0[33],q0[35];
-ccx q0[30],q0[32],q0[33];
-cx q0[31],q0[32];
-ccx q0[31],q0[32],q0[33];
-cx q0[31],q0[32];
-cx q0[30],q0[32];
-ccx q0[27],q0[29],q0[30];
-cx q0[28],q0[29];
-ccx q0[28],q0[29],q0[30];
-cx q0[28],q0[29];
-cx q0[27],q0[29];
-ccx q0[24],q0[26],q0[27];
-cx q0[25],q0[26];
-ccx q0[25],q0[26],q0[27];
-cx q0[25],q0[26];
-cx q0[24],q0[26];
-ccx q0[21],q0[23],q0[24];
-cx q0[22],q0[23];
-ccx q0[22],q0[23],q0[24];
-cx q0[22],q0[23];
-cx q0[21],q0[23];
-ccx q0[18],q0[20],q0[21];
-cx q0[19],q0[20];
-ccx q0[19],q0[20],q0[21];
-cx q0[19],q0[20];
-cx q0[18],q0[20];
-ccx q0[15],q0[17],q0[18];
-cx q0[16],q0[17];
-ccx q0[16],q0[17],q0[18];
-cx q0[16],q0[17];
-cx q0[15],q0[17];
-ccx q0[12],q0[14],q0[15];
-cx q0[13],q0[14];
-ccx q0[13],q0[14],q0[15];
-cx q0[13],q0[14];
-cx q0[12],q0[14];
-ccx q0[9],q0[11],q0[12];
-cx q0[10],q0[11];
-ccx q0[10],q0[11],q0[12];
-cx q0[10],q0[11];
-cx q0[9],q0[11];
-ccx q0[6],q0[8],q0[9];
-cx q0[7],q0[8];
-ccx q0[7],q0[8],q0[9];
-cx q0[7],q0[8];
-cx q0[6],q0[8];
-ccx q0[3],q0[5],q0[6];
-cx q0[4],q0[5];
-ccx q0[4],q0[5],q0[6];
-cx q0[4],q0[5];
-cx q0[3],q0[5];
-ccx q0[0],q0[2],q0[3];
-cx q0[1],q0[2];
-ccx q0[1],q0[2],q0[3];
-cx q0[1],q0[2];
-cx q0[0],q0[2];
-ccx q0[70],q0[45],q0[31];
-ccx q0[70],q0[46],q0[34];
-ccx q0[70],q0[47],q0[37];
-ccx q0[70],q0[48],q0[40];
-ccx q0[70],q0[49],q0[43];
-ccx q0[71],q0[45],q0[34];
-ccx q0[71],q0[46],q0[37];
-ccx q0[71],q0[47],q0[40];
-ccx q0[71],q0[48],q0[43];
-ccx q0[1],q0[2],q0[3];
-cx q0[1],q0[2];
-ccx q0[0],q0[2],q0[3];
-ccx q0[4],q0[5],q0[6];
-cx q0[4],q0[5];
-ccx q0[3],q0[5],q0[6];
-ccx q0[7],q0[8],q0[9];
-cx q0[7],q0[8];
-ccx q0[6],q0[8],q0[9];
-ccx q0[10],q0[11],q0[12];
-cx q0[10],q0[11];
-ccx q0[9],q0[11],q0[12];
-ccx q0[13],q0[14],q0[15];
-cx q0[13],q0[14];
-ccx q0[12],q0[14],q0[15];
-ccx q0[16],q0[17],q0[18];
-cx q0[16],q0[17];
-ccx q0[15],q0[17],q0[18];
-ccx q0[19],q0[20],q0[21];
-cx q0[19],q0[20];
-ccx q0[18],q0[20],q0[21];
-ccx q0[22],q0[23],q0[24];
-cx q0[22],q0[23];
-ccx q0[21],q0[23],q0[24];
-ccx q0[25],q0[26],q0[27];
-cx q0[25],q0[26];
-ccx q0[24],q0[26],q0[27];
-ccx q0[28],q0[29],q0[30];
-cx q0[28],q0[29];
-ccx q0[27],q0[29],q0[30];
-ccx q0[31],q0[32],q0[33];
-cx q0[31],q0[32];
-ccx q0[30],q0[32],q0[33];
-ccx q0[34],q0[35],q0[36];
-cx q0[34],q0[35];
-ccx q0[33],q0[35],q0[36];
-ccx q0[37],q0[38],q0[39];
-cx q0[37],q0[38];
-ccx q0[36],q0[38],q0[39];
-ccx q0[40],q0[41],q0[42];
-cx q0[40],q0[41];
-ccx q0[39],q0[41],q0[42];
-cx q0[43],q0[44];
-cx q0[42],q0[44];
-ccx q0[39],q0[41],q0[42];
-cx q0[40],q0[41];
-ccx q0[40],q0[41],q0[42];
-cx q0[40],q0[41];
-cx q0[39],q0[41];
-ccx q0[36],q0[38],q0[39];
-cx q0[37],q0[38];
-ccx q0[37],q0[38],q0[39];
-cx q0[37],q0[38];
-cx q0[36],q0[38];
-ccx q0[33],q0[35],q0[36];
-cx q0[34],q0[35];
-ccx q0[34],q0[35],q0[36];
-cx q0[34],q0[35];
-cx q0[33],q0[35];
-ccx q0[30],q0[32],q0[33];
-cx q0[31],q0[32];
-ccx q0[31],q0[32],q0[33];
-cx q0[31],q0[32];
-cx q0[30],q0[32];
-ccx q0[27],q0[29],q0[30];
-cx q0[28],q0[29];
-ccx q0[28],q0[29],q0[30];
-cx q0[28],q0[29];
-cx q0[27],q0[29];
-ccx q0[24],q0[26],q0[27];
-cx q0[25],q0[26];
-ccx q0[25],q0[26],q0[27];
-cx q0[25],q0[26];
-cx q0[24],q0[26];
-ccx q0[21],q0[23],q0[24];
-cx q0[22],q0[23];
-ccx q0[22],q0[23],q0[24];
-cx q0[22],q0[23];
-cx q0[21],q0[23];
-ccx q0[18],q0[20],q0[21];
-cx q0[19],q0[20];
-ccx q0[19],q0[20],q0[21];
-cx q0[19],q0[20];
-cx q0[18],q0[20];
-ccx q0[15],q0[17],q0[18];
-cx q0[16],q0[17];
-ccx q0[16],q0[17],q0[18];
-cx q0[16],q0[17];
-cx q0[15],q0[17];
-ccx q0[12],q0[14],q0[15];
-cx q0[13],q0[14];
-ccx q0[13],q0[14],q0[15];
-cx q0[13],q0[14];
-cx q0[12],q0[14];
-ccx q0[9],q0[11],q0[12];
-cx q0[10],q0[11];
-ccx q0[10],q0[11],q0[12];
-cx q0[10],q0[11];
-cx q0[9],q0[11];
-ccx q0[6],q0[8],q0[9];
-cx q0[7],q0[8];
-ccx q0[7],q0[8],q0[9];
-cx q0[7],q0[8];
-cx q0[6],q0[8];
-ccx q0[3],q0[5],q0[6];
-cx q0[4],q0[5];
-ccx q0[4],q0[5],q0[6];
-cx q0[4],q0[5];
-cx q0[3],q0[5];
-ccx q0[0],q0[2],q0[3];
-cx q0[1],q0[2];
-ccx q0[1],q0[2],q0[3];
-cx q0[1],q0[2];
-cx q0[0],q0[2];
-ccx q0[71],q0[45],q0[34];
-ccx q0[71],q0[46],q0[37];
-ccx q0[71],q0[47],q0[40];
-ccx q0[71],q0[48],q0[43];
-ccx q0[72],q0[45],q0[37];
-ccx q0[72],q0[46],q0[40];
-ccx q0[72],q0[47],q0[43];
-ccx q0[1],q0[2],q0[3];
-cx q0[1],q0[2];
-ccx q0[0],q0[2],q0[3];
-ccx q0[4],q0[5],q0[6];
-cx q0[4],q0[5];
-ccx q0[3],q0[5],q0[6];
-ccx q0[7],q0[8],q0[9];
-cx q0[7],q0[8];
-ccx q0[6],q0[8],q0[9];
-ccx q0[10],q0[11],q0[12];
-cx q0[10],q0[11];
-ccx q0[9],q0[11],q0[12];
-ccx q0[13],q0[14],q0[15];
-cx q0[13],q0[14];
-ccx q0[12],q0[14],q0[15];
-ccx q0[16],q0[17],q0[18];
-cx q0[16],q0[17];
-ccx q0[15],q0[17],q0[18];
-ccx q0[19],q0[20],q0[21];
-cx q0[19],q0[20];
-ccx q0[18],q0[20],q0[21];
-ccx q0[22],q0[23],q0[24];
-cx q0[22],q0[23];
-ccx q0[21],q0[23],q0[24];
-ccx q0[25],q0[26],q0[27];
-cx q0[25],q0[26];
-ccx q0[24],q0[26],q0[27];
-ccx q0[28],q0[29],q0[30];
-cx q0[28],q0[29];
-ccx q0[27],q0[29],q0[30];
-ccx q0[31],q0[32],q0[33];
-cx q0[31],q0[32];
-ccx q0[30],q0[32],q0[33];
-ccx q0[34],q0[35],q0[36];
-cx q0[34],q0[35];
-ccx q0[33],q0[35],q0[36];
-ccx q0[37],q0[38],q0[39];
-cx q0[37],q0[38];
-ccx q0[36],q0[38],q0[39];
-ccx q0[40],q0[41],q0[42];
-cx q0[40],q0[41];
-ccx q0[39],q0[41],q0[42];
-cx q0[43],q0[44];
-cx q0[42],q0[44];
-ccx q0[39],q0[41],q0[42];
-cx q0[40],q0[41];
-ccx q0[40],q0[41],q0[42];
-cx q0[40],q0[41];
-cx q0[39],q0[41];
-ccx q0[36],q0[38],q0[39];
-cx q0[37],q0[38];
-ccx q0[37],q0[38],q0[39];
-cx q0[37],q0[38];
-cx q0[36],q0[38];
-ccx q0[33],q0[35],q0[36];
-cx q0[34],q0[35];
-ccx q0[34],q0[35],q0[36];
-cx q0[34],q0[35];
-cx q0[33],q0[35];
-ccx q0[30],q0[32],q0[33];
-cx q0[31],q0[32];
-ccx q0[31],q0[32],q0[33];
-cx q0[31],q0[32];
-cx q0[30],q0[32];
-ccx q0[27],q0[29],q0[30];
-cx q0[28],q0[29];
-ccx q0[28],q0[29],q0[30];
-cx q0[28],q0[29];
-cx q0[27],q0[29];
-ccx q0[24],q0[26],q0[27];
-cx q0[25],q0[26];
-ccx q0[25],q0[26],q0[27];
-cx q0[25],q0[26];
-cx q0[24],q0[26];
-ccx q0[21],q0[23],q0[24];
-cx q0[22],q0[23];
-ccx q0[22],q0[23],q0[24];
-cx q0[22],q0[23];
-cx q0[21],q0[23];
-ccx q0[18],q0[20],q0[21];
-cx q0[19],q0[20];
-ccx q0[19],q0[20],q0[21];
-cx q0[19],q0[20];
-cx q0[18],q0[20];
-ccx q0[15],q0[17],q0[18];
-cx q0[16],q0[17];
-ccx q0[16],q0[17],q0[18];
-cx q0[16],q0[17];
-cx q0[15],q0[17];
-ccx q0[12],q0[14],q0[15];
-cx q0[13],q0[14];
-ccx q0[13],q0[14],q0[15];
-cx q0[13],q0[14];
-cx q0[12],q0[14];
-ccx q0[9],q0[11],q0[12];
-cx q0[10],q0[11];
-ccx q0[10],q0[11],q0[12];
-cx q0[10],q0[11];
-cx q0[9],q0[11];
-ccx q0[6],q0[8],q0[9];
-cx q0[7],q0[8];
-ccx q0[7],q0[8],q0[9];
-cx q0[7],q0[8];
-cx q0[6],q0[8];
-ccx q0[3],q0[5],q0[6];
-cx q0[4],q0[5];
-ccx q0[4],q0[5],q0[6];
-cx q0[4],q0[5];
-cx q0[3],q0[5];
-ccx q0[0],q0[2],q0[3];
-cx q0[1],q0[2];
-ccx q0[1],q0[2],q0[3];
-cx q0[1],q0[2];
-cx q0[0],q0[2];
-ccx q0[72],q0[45],q0[37];
-ccx q0[72],q0[46],q0[40];
-ccx q0[72],q0[47],q0[43];
-ccx q0[73],q0[45],q0[40];
-ccx q0[73],q0[46],q0[43];
-ccx q0[1],q0[2],q0[3];
-cx q0[1],q0[2];
-ccx q0[0],q0[2],q0[3];
-ccx q0[4],q0[5],q0[6];
-cx q0[4],q0[5];
-ccx q0[3],q0[5],q0[6];
-ccx q0[7],q0[8],q0[9];
-cx q0[7],q0[8];
-ccx q0[6],q0[8],q0[9];
-ccx q0[10],q0[11],q0[12];
-cx q0[10],q0[11];
-ccx q0[9],q0[11],q0[12];
-ccx q0[13],q0[14],q0[15];
-cx q0[13],q0[14];
-ccx q0[12],q0[14],q0[15];
-ccx q0[16],q0[17],q0[18];
-cx q0[16],q0[17];
-ccx q0[15],q0[17],q0[18];
-ccx q0[19],q0[20],q0[21];
-cx q0[19],q0[20];
-ccx q0[18],q0[20],q0[21];
-ccx q0[22],q0[23],q0[24];
-cx q0[22],q0[23];
-ccx q0[21],q0[23],q0[24];
-ccx q0[25],q0[26],q0[27];
-cx q0[25],q0[26];
-ccx q0[24],q0[26],q0[27];
-ccx q0[28],q0[29],q0[30];
-cx q0[28],q0[29];
-ccx q0[27],q0[29],q0[30];
-ccx q0[31],q0[32],q0[33];
-cx q0[31],q0[32];
-ccx q0[30],q0[32],q0[33];
-ccx q0[34],q0[35],q0[36];
-cx q0[34],q0[35];
-ccx q0[33],q0[35],q0[36];
-ccx q0[37],q0[38],q0[39];
-cx q0[37],q0[38];
-ccx q0[36],q0[38],q0[39];
-ccx q0[40],q0[41],q0[42];
-cx q0[40],q0[41];
-ccx q0[39],q0[41],q0[42];
-cx q0[43],q0[44];
-cx q0[42],q0[44];
-ccx q0[39],q0[41],q0[42];
-cx q0[40],q0[41];
-ccx q0[40],q0[41],q0[42];
-cx q0[40],q0[41];
-cx q0[39],q0[41];
-ccx q0[36],q0[38],q0[39];
-cx q0[37],q0[38];
-ccx q0[37],q0[38],q0[39];
-cx q0[37],q0[38];
-cx q0[36],q0[38];
-ccx q0[33],q0[35],q0[36];
-cx q0[34],q0[35];
-ccx q0[34],q0[35],q0[36];
-cx q0[34],q0[35];
-cx q0[33],q0[35];
-ccx q0[30],q0[32],q0[33];
-cx q0[31],q0[32];
-ccx q0[31],q0[32],q0[33];
-cx q0[31],q0[32];
-cx q0[30],q0[32];
-ccx q0[27],q0[29],q0[30];
-cx q0[28],q0[29];
-ccx q0[28],q0[29],q0[30];
-cx q0[28],q0[29];
-cx q0[27],q0[29];
-ccx q0[24],q0[26],q0[27];
-cx q0[25],q0[26];
-ccx q0[25],q0[26],q0[27];
-cx q0[25],q0[26];
-cx q0[24],q0[26];
-ccx q0[21],q0[23],q0[24];
-cx q0[22],q0[23];
-ccx q0[22],q0[23],q0[24];
-cx q0[22],q0[23];
-cx q0[21],q0[23];
-ccx q0[18],q0[20],q0[21];
-cx q0[19],q0[20];
-ccx q0[19],q0[20],q0[21];
-cx q0[19],q0[20];
-cx q0[18],q0[20];
-ccx q0[15],q0[17],q0[18];
-cx q0[16],q0[17];
-ccx q0[16],q0[17],q0[18];
-cx q0[16],q0[17];
-cx q0[15],q0[17];
-ccx q0[12],q0[14],q0[15];
-cx q0[13],q0[14];
-ccx q0[13],q0[14],q0[15];
-cx q0[13],q0[14];
-cx q0[12],q0[14];
-ccx q0[9],q0[11],q0[12];
-cx q0[10],q0[11];
-ccx q0[10],q0[11],q0[12];
-cx q0[10],q0[11];
-cx q0[9],q0[11];
-ccx q0[6],q0[8],q0[9];
-cx q0[7],q0[8];
-ccx q0[7],q0[8],q0[9];
-cx q0[7],q0[8];
-cx q0[6],q0[8];
-ccx q0[3],q0[5],q0[6];
-cx q0[4],q0[5];
-ccx q0[4],q0[5],q0[6];
-cx q0[4],q0[5];
-cx q0[3],q0[5];
-ccx q0[0],q0[2],q0[3];
-cx q0[1],q0[2];
-ccx q0[1],q0[2],q0[3];
-cx q0[1],q0[2];
-cx q0[0],q0[2];
-ccx q0[73],q0[45],q0[40];
-ccx q0[73],q0[46],q0[43];
-ccx q0[74],q0[45],q0[43];
-ccx q0[1],q0[2],q0[3];
-cx q0[1],q0[2];
-ccx q0[0],q0[2],q0[3];
-ccx q0[4],q0[5],q0[6];
-cx q0[4],q0[5];
-ccx q0[3],q0[5],q0[6];
-ccx q0[7],q0[8],q0[9];
-cx q0[7],q0[8];
-ccx q0[6],q0[8],q0[9];
-ccx q0[10],q0[11],q0[12];
-cx q0[10],q0[11];
-ccx q0[9],q0[11],q0[12];
-ccx q0[13],q0[14],q0[15];
-cx q0[13],q0[14];
-ccx q0[12],q0[14],q0[15];
-ccx q0[16],q0[17],q0[18];
-cx q0[16],q0[17];
-ccx q0[15],q0[17],q0[18];
-ccx q0[19],q0[20],q0[21];
-cx q0[19],q0[20];
-ccx q0[18],q0[20],q0[21];
-ccx q0[22],q0[23],q0[24];
-cx q0[22],q0[23];
-ccx q0[21],q0[23],q0[24];
-ccx q0[25],q0[26],q0[27];
-cx q0[25],q0[26];
-ccx q0[24],q0[26],q0[27];
-ccx q0[28],q0[29],q0[30];
-cx q0[28],q0[29];
-ccx q0[27],q0[29],q0[30];
-ccx q0[31],q0[32],q0[33];
-cx q0[31],q0[32];
-ccx q0[30],q0[32],q0[33];
-ccx q0[34],q0[35],q0[36];
-cx q0[34],q0[35];
-ccx q0[33],q0[35],q0[36];
-ccx q0[37],q0[38],q0[39];
-cx q0[37],q0[38];
-ccx q0[36],q0[38],q0[39];
-ccx q0[40],q0[41],q0[42];
-cx q0[40],q0[41];
-ccx q0[39],q0[41],q0[42];
-cx q0[43],q0[44];
-cx q0[42],q0[44];
-ccx q0[39],q0[41],q0[42];
-cx q0[40],q0[41];
-ccx q0[40],q0[41],q0[42];
-cx q0[40],q0[41];
-cx q0[39],q0[41];
-ccx q0[36],q0[38],q0[39];
-cx q0[37],q0[38];
-ccx q0[37],q0[38],q0[39];
-cx q0[37],q0[38];
-cx q0[36],q0[38];
-ccx q0[33],q0[35],q0[36];
-cx q0[34],q0[35];
-ccx q0[34],q0[35],q0[36];
-cx q0[34],q0[35];
-cx q0[33],q0[35];
-ccx q0[30],q0[32],q0[33];
-cx q0[31],q0[32];
-ccx q0[31],q0[32],q0[33];
-cx q0[31],q0[32];
-cx q0[30],q0[32];
-ccx q0[27],q0[29],q0[30];
-cx q0[28],q0[29];
-ccx q0[28],q0[29],q0[30];
-cx q0[28],q0[29];
-cx q0[27],q0[29];
-ccx q0[24],q0[26],q0[27];
-cx q0[25],q0[26];
-ccx q0[25],q0[26],q0[27];
-cx q0[25],q0[26];
-cx q0[24],q0[26];
-ccx q0[21],q0[23],q0[24];
-cx q0[22],q0[23];
-ccx q0[22],q0[23],q0[24];
-cx q0[22],q0[23];
-cx q0[21],q0[23];
-ccx q0[18],q0[20],q0[21];
-cx q0[19],q0[20];
-ccx q0[19],q0[20],q0[21];
-cx q0[19],q0[20];
-cx q0[18],q0[20];
-ccx q0[15],q0[17],q0[18];
-cx q0[16],q0[17];
-ccx q0[16],q0[17],q0[18];
-cx q0[16],q0[17];
-cx q0[15],q0[17];
-ccx q0[12],q0[14],q0[15];
-cx q0[13],q0[14];
-ccx q0[13],q0[14],q0[15];
-cx q0[13],q0[14];
-cx q0[12],q0[14];
-ccx q0[9],q0[11],q0[12];
-cx q0[10],q0[11];
-ccx q0[10],q0[11],q0[12];
-cx q0[10],q0[11];
-cx q0[9],q0[11];
-ccx q0[6],q0[8],q0[9];
-cx q0[7],q0[8];
-ccx q0[7],q0[8],q0[9];
-cx q0[7],q0[8];
-cx q0[6],q0[8];
-ccx q0[3],q0[5],q0[6];
-cx q0[4],q0[5];
-ccx q0[4],q0[5],q0[6];
-cx q0[4],q0[5];
-cx q0[3],q0[5];
-ccx q0[0],q0[2],q0[3];
-cx q0[1],q0[2];
-ccx q0[1],q0[2],q0[3];
-cx q0[1],q0[2];
-cx q0[0],q0[2];
-ccx q0[74],q0[45],q0[43];
-measure q0[2] -> c0[0];
-measure q0[5] -> c0[1];
-measure q0[8] -> c0[2];
-measure q0[11] -> c0[3];
-measure q0[14] -> c0[4];
-measure q0[17] -> c0[5];
-measure q0[20] -> c0[6];
-measure q0[23] -> c0[7];
-measure q0[26] -> c0[8];
-measure q0[29] -> c0[9];
-measure q0[32] -> c0[10];
-measure q0[35] -> c0[11];
-measure q0[38] -> c0[12];
-measure q0[41] -> c0[13];
-measure q0[44] -> c0[14];
@@ -1,15786 +0,0 @@
-OPENQASM 2.0;
-include "qelib1.inc";
-qreg q0[75];
-creg c0[15];
-rz(pi/2) q0[1];
-sx q0[1];
-rz(pi/2) q0[1];
-rz(pi/2) q0[3];
-sx q0[3];
-rz(pi/2) q0[3];
-cx q0[2],q0[3];
-rz(-pi/4) q0[3];
-rz(pi/2) q0[4];
-sx q0[4];
-rz(pi/2) q0[4];
-rz(pi/2) q0[6];
-sx q0[6];
-rz(pi/2) q0[6];
-cx q0[5],q0[6];
-rz(-pi/4) q0[6];
-rz(pi/2) q0[7];
-sx q0[7];
-rz(pi/2) q0[7];
-rz(pi/2) q0[9];
-sx q0[9];
-rz(pi/2) q0[9];
-cx q0[8],q0[9];
-rz(-pi/4) q0[9];
-rz(pi/2) q0[10];
-sx q0[10];
-rz(pi/2) q0[10];
-rz(pi/2) q0[12];
-sx q0[12];
-rz(pi/2) q0[12];
-cx q0[11],q0[12];
-rz(-pi/4) q0[12];
-rz(pi/2) q0[13];
-sx q0[13];
-rz(pi/2) q0[13];
-rz(pi/2) q0[15];
-sx q0[15];
-rz(pi/2) q0[15];
-cx q0[14],q0[15];
-rz(-pi/4) q0[15];
-rz(pi/2) q0[16];
-sx q0[16];
-rz(pi/2) q0[16];
-rz(pi/2) q0[18];
-sx q0[18];
-rz(pi/2) q0[18];
-cx q0[17],q0[18];
-rz(-pi/4) q0[18];
-rz(pi/2) q0[19];
-sx q0[19];
-rz(pi/2) q0[19];
-rz(pi/2) q0[21];
-sx q0[21];
-rz(pi/2) q0[21];
-cx q0[20],q0[21];
-rz(-pi/4) q0[21];
-rz(pi/2) q0[22];
-sx q0[22];
-rz(pi/2) q0[22];
-rz(pi/2) q0[24];
-sx q0[24];
-rz(pi/2) q0[24];
-cx q0[23],q0[24];
-rz(-pi/4) q0[24];
-rz(pi/2) q0[25];
-sx q0[25];
-rz(pi/2) q0[25];
-rz(pi/2) q0[27];
-sx q0[27];
-rz(pi/2) q0[27];
-cx q0[26],q0[27];
-rz(-pi/4) q0[27];
-rz(pi/2) q0[28];
-sx q0[28];
-rz(pi/2) q0[28];
-rz(pi/2) q0[30];
-sx q0[30];
-rz(pi/2) q0[30];
-cx q0[29],q0[30];
-rz(-pi/4) q0[30];
-rz(pi/2) q0[31];
-sx q0[31];
-rz(pi/2) q0[31];
-rz(pi/2) q0[33];
-sx q0[33];
-rz(pi/2) q0[33];
-cx q0[32],q0[33];
-rz(-pi/4) q0[33];
-rz(pi/2) q0[34];
-sx q0[34];
-rz(pi/2) q0[34];
-rz(pi/2) q0[36];
-sx q0[36];
-rz(pi/2) q0[36];
-cx q0[35],q0[36];
-rz(-pi/4) q0[36];
-rz(pi/2) q0[37];
-sx q0[37];
-rz(pi/2) q0[37];
-rz(pi/2) q0[39];
-sx q0[39];
-rz(pi/2) q0[39];
-cx q0[38],q0[39];
-rz(-pi/4) q0[39];
-rz(pi/2) q0[40];
-sx q0[40];
-rz(pi/2) q0[40];
-rz(pi/2) q0[42];
-sx q0[42];
-rz(pi/2) q0[42];
-cx q0[41],q0[42];
-rz(-pi/4) q0[42];
-rz(pi/2) q0[43];
-sx q0[43];
-rz(pi/2) q0[43];
-cx q0[45],q0[1];
-rz(-pi/4) q0[1];
-cx q0[46],q0[4];
-rz(-pi/4) q0[4];
-cx q0[47],q0[7];
-rz(-pi/4) q0[7];
-cx q0[48],q0[10];
-rz(-pi/4) q0[10];
-cx q0[49],q0[13];
-rz(-pi/4) q0[13];
-cx q0[50],q0[16];
-rz(-pi/4) q0[16];
-cx q0[51],q0[19];
-rz(-pi/4) q0[19];
-cx q0[52],q0[22];
-rz(-pi/4) q0[22];
-x q0[53];
-cx q0[53],q0[25];
-rz(-pi/4) q0[25];
-cx q0[54],q0[28];
-rz(-pi/4) q0[28];
-cx q0[55],q0[31];
-rz(-pi/4) q0[31];
-x q0[56];
-cx q0[56],q0[34];
-rz(-pi/4) q0[34];
-x q0[57];
-cx q0[57],q0[37];
-rz(-pi/4) q0[37];
-cx q0[58],q0[40];
-rz(-pi/4) q0[40];
-cx q0[59],q0[43];
-rz(-pi/4) q0[43];
-cx q0[60],q0[1];
-rz(pi/4) q0[1];
-cx q0[45],q0[1];
-rz(-pi/4) q0[1];
-rz(pi/4) q0[45];
-cx q0[60],q0[1];
-rz(3*pi/4) q0[1];
-sx q0[1];
-rz(pi/2) q0[1];
-cx q0[1],q0[3];
-rz(pi/4) q0[3];
-cx q0[2],q0[3];
-rz(pi/4) q0[2];
-rz(-pi/4) q0[3];
-cx q0[1],q0[3];
-cx q0[1],q0[2];
-rz(pi/4) q0[1];
-rz(-pi/4) q0[2];
-rz(pi/4) q0[3];
-cx q0[2],q0[3];
-rz(-pi/4) q0[3];
-cx q0[0],q0[3];
-rz(pi/4) q0[3];
-cx q0[2],q0[3];
-rz(pi/4) q0[2];
-rz(-pi/4) q0[3];
-cx q0[0],q0[3];
-cx q0[0],q0[2];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[2];
-cx q0[0],q0[2];
-rz(3*pi/4) q0[3];
-sx q0[3];
-rz(pi/2) q0[3];
-cx q0[60],q0[45];
-rz(-pi/4) q0[45];
-rz(pi/4) q0[60];
-cx q0[60],q0[45];
-cx q0[60],q0[4];
-rz(pi/4) q0[4];
-cx q0[46],q0[4];
-rz(-pi/4) q0[4];
-rz(pi/4) q0[46];
-cx q0[60],q0[4];
-rz(3*pi/4) q0[4];
-sx q0[4];
-rz(pi/2) q0[4];
-cx q0[4],q0[6];
-rz(pi/4) q0[6];
-cx q0[5],q0[6];
-rz(pi/4) q0[5];
-rz(-pi/4) q0[6];
-cx q0[4],q0[6];
-cx q0[4],q0[5];
-rz(pi/4) q0[4];
-rz(-pi/4) q0[5];
-rz(pi/4) q0[6];
-cx q0[5],q0[6];
-rz(-pi/4) q0[6];
-cx q0[3],q0[6];
-rz(pi/4) q0[6];
-cx q0[5],q0[6];
-rz(pi/4) q0[5];
-rz(-pi/4) q0[6];
-cx q0[3],q0[6];
-cx q0[3],q0[5];
-rz(pi/4) q0[3];
-rz(-pi/4) q0[5];
-cx q0[3],q0[5];
-rz(3*pi/4) q0[6];
-sx q0[6];
-rz(pi/2) q0[6];
-cx q0[60],q0[46];
-rz(-pi/4) q0[46];
-rz(pi/4) q0[60];
-cx q0[60],q0[46];
-cx q0[60],q0[7];
-rz(pi/4) q0[7];
-cx q0[47],q0[7];
-rz(pi/4) q0[47];
-rz(-pi/4) q0[7];
-cx q0[60],q0[7];
-cx q0[60],q0[47];
-rz(-pi/4) q0[47];
-rz(pi/4) q0[60];
-cx q0[60],q0[47];
-cx q0[60],q0[10];
-rz(pi/4) q0[10];
-cx q0[48],q0[10];
-rz(-pi/4) q0[10];
-rz(pi/4) q0[48];
-cx q0[60],q0[10];
-rz(3*pi/4) q0[10];
-sx q0[10];
-rz(pi/2) q0[10];
-cx q0[10],q0[12];
-rz(pi/4) q0[12];
-cx q0[11],q0[12];
-rz(pi/4) q0[11];
-rz(-pi/4) q0[12];
-cx q0[10],q0[12];
-cx q0[10],q0[11];
-rz(pi/4) q0[10];
-rz(-pi/4) q0[11];
-rz(pi/4) q0[12];
-cx q0[11],q0[12];
-rz(-pi/4) q0[12];
-cx q0[60],q0[48];
-rz(-pi/4) q0[48];
-rz(pi/4) q0[60];
-cx q0[60],q0[48];
-cx q0[60],q0[13];
-rz(pi/4) q0[13];
-cx q0[49],q0[13];
-rz(-pi/4) q0[13];
-rz(pi/4) q0[49];
-cx q0[60],q0[13];
-rz(3*pi/4) q0[13];
-sx q0[13];
-rz(pi/2) q0[13];
-cx q0[13],q0[15];
-rz(pi/4) q0[15];
-cx q0[14],q0[15];
-rz(pi/4) q0[14];
-rz(-pi/4) q0[15];
-cx q0[13],q0[15];
-cx q0[13],q0[14];
-rz(pi/4) q0[13];
-rz(-pi/4) q0[14];
-rz(pi/4) q0[15];
-cx q0[14],q0[15];
-rz(-pi/4) q0[15];
-cx q0[60],q0[49];
-rz(-pi/4) q0[49];
-rz(pi/4) q0[60];
-cx q0[60],q0[49];
-cx q0[60],q0[16];
-rz(pi/4) q0[16];
-cx q0[50],q0[16];
-rz(-pi/4) q0[16];
-rz(pi/4) q0[50];
-cx q0[60],q0[16];
-rz(3*pi/4) q0[16];
-sx q0[16];
-rz(pi/2) q0[16];
-cx q0[16],q0[18];
-rz(pi/4) q0[18];
-cx q0[17],q0[18];
-rz(pi/4) q0[17];
-rz(-pi/4) q0[18];
-cx q0[16],q0[18];
-cx q0[16],q0[17];
-rz(pi/4) q0[16];
-rz(-pi/4) q0[17];
-rz(pi/4) q0[18];
-cx q0[17],q0[18];
-rz(-pi/4) q0[18];
-cx q0[60],q0[50];
-rz(-pi/4) q0[50];
-rz(pi/4) q0[60];
-cx q0[60],q0[50];
-cx q0[60],q0[19];
-rz(pi/4) q0[19];
-cx q0[51],q0[19];
-rz(-pi/4) q0[19];
-rz(pi/4) q0[51];
-cx q0[60],q0[19];
-rz(3*pi/4) q0[19];
-sx q0[19];
-rz(pi/2) q0[19];
-cx q0[19],q0[21];
-rz(pi/4) q0[21];
-cx q0[20],q0[21];
-rz(pi/4) q0[20];
-rz(-pi/4) q0[21];
-cx q0[19],q0[21];
-cx q0[19],q0[20];
-rz(pi/4) q0[19];
-rz(-pi/4) q0[20];
-rz(pi/4) q0[21];
-cx q0[20],q0[21];
-rz(-pi/4) q0[21];
-cx q0[60],q0[51];
-rz(-pi/4) q0[51];
-rz(pi/4) q0[60];
-cx q0[60],q0[51];
-cx q0[60],q0[22];
-rz(pi/4) q0[22];
-cx q0[52],q0[22];
-rz(-pi/4) q0[22];
-rz(pi/4) q0[52];
-cx q0[60],q0[22];
-rz(3*pi/4) q0[22];
-sx q0[22];
-rz(pi/2) q0[22];
-cx q0[22],q0[24];
-rz(pi/4) q0[24];
-cx q0[23],q0[24];
-rz(pi/4) q0[23];
-rz(-pi/4) q0[24];
-cx q0[22],q0[24];
-cx q0[22],q0[23];
-rz(pi/4) q0[22];
-rz(-pi/4) q0[23];
-rz(pi/4) q0[24];
-cx q0[23],q0[24];
-rz(-pi/4) q0[24];
-cx q0[60],q0[52];
-rz(-pi/4) q0[52];
-rz(pi/4) q0[60];
-cx q0[60],q0[52];
-cx q0[60],q0[25];
-rz(pi/4) q0[25];
-cx q0[53],q0[25];
-rz(-pi/4) q0[25];
-rz(pi/4) q0[53];
-cx q0[60],q0[25];
-rz(3*pi/4) q0[25];
-sx q0[25];
-rz(pi/2) q0[25];
-cx q0[25],q0[27];
-rz(pi/4) q0[27];
-cx q0[26],q0[27];
-rz(pi/4) q0[26];
-rz(-pi/4) q0[27];
-cx q0[25],q0[27];
-cx q0[25],q0[26];
-rz(pi/4) q0[25];
-rz(-pi/4) q0[26];
-rz(pi/4) q0[27];
-cx q0[26],q0[27];
-rz(-pi/4) q0[27];
-cx q0[60],q0[53];
-rz(-pi/4) q0[53];
-rz(pi/4) q0[60];
-cx q0[60],q0[53];
-cx q0[60],q0[28];
-rz(pi/4) q0[28];
-cx q0[54],q0[28];
-rz(-pi/4) q0[28];
-rz(pi/4) q0[54];
-cx q0[60],q0[28];
-rz(3*pi/4) q0[28];
-sx q0[28];
-rz(pi/2) q0[28];
-cx q0[28],q0[30];
-rz(pi/4) q0[30];
-cx q0[29],q0[30];
-rz(pi/4) q0[29];
-rz(-pi/4) q0[30];
-cx q0[28],q0[30];
-cx q0[28],q0[29];
-rz(pi/4) q0[28];
-rz(-pi/4) q0[29];
-rz(pi/4) q0[30];
-cx q0[29],q0[30];
-rz(-pi/4) q0[30];
-cx q0[60],q0[54];
-rz(-pi/4) q0[54];
-rz(pi/4) q0[60];
-cx q0[60],q0[54];
-cx q0[60],q0[31];
-rz(pi/4) q0[31];
-cx q0[55],q0[31];
-rz(-pi/4) q0[31];
-rz(pi/4) q0[55];
-cx q0[60],q0[31];
-rz(3*pi/4) q0[31];
-sx q0[31];
-rz(pi/2) q0[31];
-cx q0[31],q0[33];
-rz(pi/4) q0[33];
-cx q0[32],q0[33];
-rz(pi/4) q0[32];
-rz(-pi/4) q0[33];
-cx q0[31],q0[33];
-cx q0[31],q0[32];
-rz(pi/4) q0[31];
-rz(-pi/4) q0[32];
-rz(pi/4) q0[33];
-cx q0[32],q0[33];
-rz(-pi/4) q0[33];
-cx q0[60],q0[55];
-rz(-pi/4) q0[55];
-rz(pi/4) q0[60];
-cx q0[60],q0[55];
-cx q0[60],q0[34];
-rz(pi/4) q0[34];
-cx q0[56],q0[34];
-rz(-pi/4) q0[34];
-rz(pi/4) q0[56];
-cx q0[60],q0[34];
-rz(3*pi/4) q0[34];
-sx q0[34];
-rz(pi/2) q0[34];
-cx q0[34],q0[36];
-rz(pi/4) q0[36];
-cx q0[35],q0[36];
-rz(pi/4) q0[35];
-rz(-pi/4) q0[36];
-cx q0[34],q0[36];
-cx q0[34],q0[35];
-rz(pi/4) q0[34];
-rz(-pi/4) q0[35];
-rz(pi/4) q0[36];
-cx q0[35],q0[36];
-rz(-pi/4) q0[36];
-cx q0[60],q0[56];
-rz(-pi/4) q0[56];
-rz(pi/4) q0[60];
-cx q0[60],q0[56];
-cx q0[60],q0[37];
-rz(pi/4) q0[37];
-cx q0[57],q0[37];
-rz(-pi/4) q0[37];
-rz(pi/4) q0[57];
-cx q0[60],q0[37];
-rz(3*pi/4) q0[37];
-sx q0[37];
-rz(pi/2) q0[37];
-cx q0[37],q0[39];
-rz(pi/4) q0[39];
-cx q0[38],q0[39];
-rz(pi/4) q0[38];
-rz(-pi/4) q0[39];
-cx q0[37],q0[39];
-cx q0[37],q0[38];
-rz(pi/4) q0[37];
-rz(-pi/4) q0[38];
-rz(pi/4) q0[39];
-cx q0[38],q0[39];
-rz(-pi/4) q0[39];
-cx q0[60],q0[57];
-rz(-pi/4) q0[57];
-rz(pi/4) q0[60];
-cx q0[60],q0[57];
-cx q0[60],q0[40];
-rz(pi/4) q0[40];
-cx q0[58],q0[40];
-rz(-pi/4) q0[40];
-rz(pi/4) q0[58];
-cx q0[60],q0[40];
-rz(3*pi/4) q0[40];
-sx q0[40];
-rz(pi/2) q0[40];
-cx q0[40],q0[42];
-rz(pi/4) q0[42];
-cx q0[41],q0[42];
-rz(pi/4) q0[41];
-rz(-pi/4) q0[42];
-cx q0[40],q0[42];
-cx q0[40],q0[41];
-rz(pi/4) q0[40];
-rz(-pi/4) q0[41];
-rz(pi/4) q0[42];
-cx q0[41],q0[42];
-rz(-pi/4) q0[42];
-cx q0[60],q0[58];
-rz(-pi/4) q0[58];
-rz(pi/4) q0[60];
-cx q0[60],q0[58];
-cx q0[60],q0[43];
-rz(pi/4) q0[43];
-cx q0[59],q0[43];
-rz(-pi/4) q0[43];
-rz(pi/4) q0[59];
-cx q0[60],q0[43];
-rz(3*pi/4) q0[43];
-sx q0[43];
-rz(pi/2) q0[43];
-cx q0[43],q0[44];
-rz(pi/2) q0[43];
-sx q0[43];
-rz(pi/2) q0[43];
-cx q0[60],q0[59];
-rz(-pi/4) q0[59];
-rz(pi/4) q0[60];
-cx q0[60],q0[59];
-cx q0[59],q0[43];
-rz(-pi/4) q0[43];
-rz(3*pi/4) q0[7];
-sx q0[7];
-rz(pi/2) q0[7];
-cx q0[7],q0[9];
-rz(pi/4) q0[9];
-cx q0[8],q0[9];
-rz(pi/4) q0[8];
-rz(-pi/4) q0[9];
-cx q0[7],q0[9];
-cx q0[7],q0[8];
-rz(pi/4) q0[7];
-rz(-pi/4) q0[8];
-rz(pi/4) q0[9];
-cx q0[8],q0[9];
-rz(-pi/4) q0[9];
-cx q0[6],q0[9];
-rz(pi/4) q0[9];
-cx q0[8],q0[9];
-rz(pi/4) q0[8];
-rz(-pi/4) q0[9];
-cx q0[6],q0[9];
-cx q0[6],q0[8];
-rz(pi/4) q0[6];
-rz(-pi/4) q0[8];
-cx q0[6],q0[8];
-rz(3*pi/4) q0[9];
-sx q0[9];
-rz(pi/2) q0[9];
-cx q0[9],q0[12];
-rz(pi/4) q0[12];
-cx q0[11],q0[12];
-rz(pi/4) q0[11];
-rz(-pi/4) q0[12];
-cx q0[9],q0[12];
-rz(3*pi/4) q0[12];
-sx q0[12];
-rz(pi/2) q0[12];
-cx q0[12],q0[15];
-rz(pi/4) q0[15];
-cx q0[14],q0[15];
-rz(pi/4) q0[14];
-rz(-pi/4) q0[15];
-cx q0[12],q0[15];
-cx q0[12],q0[14];
-rz(pi/4) q0[12];
-rz(-pi/4) q0[14];
-cx q0[12],q0[14];
-rz(3*pi/4) q0[15];
-sx q0[15];
-rz(pi/2) q0[15];
-cx q0[15],q0[18];
-rz(pi/4) q0[18];
-cx q0[17],q0[18];
-rz(pi/4) q0[17];
-rz(-pi/4) q0[18];
-cx q0[15],q0[18];
-cx q0[15],q0[17];
-rz(pi/4) q0[15];
-rz(-pi/4) q0[17];
-cx q0[15],q0[17];
-rz(3*pi/4) q0[18];
-sx q0[18];
-rz(pi/2) q0[18];
-cx q0[18],q0[21];
-rz(pi/4) q0[21];
-cx q0[20],q0[21];
-rz(pi/4) q0[20];
-rz(-pi/4) q0[21];
-cx q0[18],q0[21];
-cx q0[18],q0[20];
-rz(pi/4) q0[18];
-rz(-pi/4) q0[20];
-cx q0[18],q0[20];
-rz(3*pi/4) q0[21];
-sx q0[21];
-rz(pi/2) q0[21];
-cx q0[21],q0[24];
-rz(pi/4) q0[24];
-cx q0[23],q0[24];
-rz(pi/4) q0[23];
-rz(-pi/4) q0[24];
-cx q0[21],q0[24];
-cx q0[21],q0[23];
-rz(pi/4) q0[21];
-rz(-pi/4) q0[23];
-cx q0[21],q0[23];
-rz(3*pi/4) q0[24];
-sx q0[24];
-rz(pi/2) q0[24];
-cx q0[24],q0[27];
-rz(pi/4) q0[27];
-cx q0[26],q0[27];
-rz(pi/4) q0[26];
-rz(-pi/4) q0[27];
-cx q0[24],q0[27];
-cx q0[24],q0[26];
-rz(pi/4) q0[24];
-rz(-pi/4) q0[26];
-cx q0[24],q0[26];
-rz(3*pi/4) q0[27];
-sx q0[27];
-rz(pi/2) q0[27];
-cx q0[27],q0[30];
-rz(pi/4) q0[30];
-cx q0[29],q0[30];
-rz(pi/4) q0[29];
-rz(-pi/4) q0[30];
-cx q0[27],q0[30];
-cx q0[27],q0[29];
-rz(pi/4) q0[27];
-rz(-pi/4) q0[29];
-cx q0[27],q0[29];
-rz(3*pi/4) q0[30];
-sx q0[30];
-rz(pi/2) q0[30];
-cx q0[30],q0[33];
-rz(pi/4) q0[33];
-cx q0[32],q0[33];
-rz(pi/4) q0[32];
-rz(-pi/4) q0[33];
-cx q0[30],q0[33];
-cx q0[30],q0[32];
-rz(pi/4) q0[30];
-rz(-pi/4) q0[32];
-cx q0[30],q0[32];
-rz(3*pi/4) q0[33];
-sx q0[33];
-rz(pi/2) q0[33];
-cx q0[33],q0[36];
-rz(pi/4) q0[36];
-cx q0[35],q0[36];
-rz(pi/4) q0[35];
-rz(-pi/4) q0[36];
-cx q0[33],q0[36];
-cx q0[33],q0[35];
-rz(pi/4) q0[33];
-rz(-pi/4) q0[35];
-cx q0[33],q0[35];
-rz(3*pi/4) q0[36];
-sx q0[36];
-rz(pi/2) q0[36];
-cx q0[36],q0[39];
-rz(pi/4) q0[39];
-cx q0[38],q0[39];
-rz(pi/4) q0[38];
-rz(-pi/4) q0[39];
-cx q0[36],q0[39];
-cx q0[36],q0[38];
-rz(pi/4) q0[36];
-rz(-pi/4) q0[38];
-cx q0[36],q0[38];
-rz(3*pi/4) q0[39];
-sx q0[39];
-rz(pi/2) q0[39];
-cx q0[39],q0[42];
-rz(pi/4) q0[42];
-cx q0[41],q0[42];
-rz(pi/4) q0[41];
-rz(-pi/4) q0[42];
-cx q0[39],q0[42];
-cx q0[39],q0[41];
-rz(pi/4) q0[39];
-rz(-pi/4) q0[41];
-cx q0[39],q0[41];
-rz(3*pi/4) q0[42];
-sx q0[42];
-rz(pi/2) q0[42];
-cx q0[42],q0[44];
-rz(pi/2) q0[42];
-sx q0[42];
-rz(pi/2) q0[42];
-cx q0[41],q0[42];
-rz(-pi/4) q0[42];
-cx q0[39],q0[42];
-rz(pi/4) q0[42];
-cx q0[41],q0[42];
-rz(pi/4) q0[41];
-rz(-pi/4) q0[42];
-cx q0[39],q0[42];
-cx q0[39],q0[41];
-rz(pi/4) q0[39];
-rz(-pi/4) q0[41];
-cx q0[39],q0[41];
-cx q0[40],q0[41];
-rz(pi/4) q0[42];
-cx q0[41],q0[42];
-rz(-pi/4) q0[42];
-cx q0[40],q0[42];
-rz(pi/4) q0[42];
-cx q0[41],q0[42];
-rz(pi/4) q0[41];
-rz(-pi/4) q0[42];
-cx q0[40],q0[42];
-cx q0[40],q0[41];
-rz(3*pi/4) q0[40];
-sx q0[40];
-rz(pi/2) q0[40];
-rz(-pi/4) q0[41];
-cx q0[39],q0[41];
-rz(pi/2) q0[39];
-sx q0[39];
-rz(pi/2) q0[39];
-cx q0[38],q0[39];
-rz(-pi/4) q0[39];
-cx q0[36],q0[39];
-rz(pi/4) q0[39];
-cx q0[38],q0[39];
-rz(pi/4) q0[38];
-rz(-pi/4) q0[39];
-cx q0[36],q0[39];
-cx q0[36],q0[38];
-rz(pi/4) q0[36];
-rz(-pi/4) q0[38];
-cx q0[36],q0[38];
-cx q0[37],q0[38];
-rz(pi/4) q0[39];
-cx q0[38],q0[39];
-rz(-pi/4) q0[39];
-cx q0[37],q0[39];
-rz(pi/4) q0[39];
-cx q0[38],q0[39];
-rz(pi/4) q0[38];
-rz(-pi/4) q0[39];
-cx q0[37],q0[39];
-cx q0[37],q0[38];
-rz(3*pi/4) q0[37];
-sx q0[37];
-rz(pi/2) q0[37];
-rz(-pi/4) q0[38];
-cx q0[36],q0[38];
-rz(pi/2) q0[36];
-sx q0[36];
-rz(pi/2) q0[36];
-cx q0[35],q0[36];
-rz(-pi/4) q0[36];
-cx q0[33],q0[36];
-rz(pi/4) q0[36];
-cx q0[35],q0[36];
-rz(pi/4) q0[35];
-rz(-pi/4) q0[36];
-cx q0[33],q0[36];
-cx q0[33],q0[35];
-rz(pi/4) q0[33];
-rz(-pi/4) q0[35];
-cx q0[33],q0[35];
-cx q0[34],q0[35];
-rz(pi/4) q0[36];
-cx q0[35],q0[36];
-rz(-pi/4) q0[36];
-cx q0[34],q0[36];
-rz(pi/4) q0[36];
-cx q0[35],q0[36];
-rz(pi/4) q0[35];
-rz(-pi/4) q0[36];
-cx q0[34],q0[36];
-cx q0[34],q0[35];
-rz(3*pi/4) q0[34];
-sx q0[34];
-rz(pi/2) q0[34];
-rz(-pi/4) q0[35];
-cx q0[33],q0[35];
-rz(pi/2) q0[33];
-sx q0[33];
-rz(pi/2) q0[33];
-cx q0[32],q0[33];
-rz(-pi/4) q0[33];
-cx q0[30],q0[33];
-rz(pi/4) q0[33];
-cx q0[32],q0[33];
-rz(pi/4) q0[32];
-rz(-pi/4) q0[33];
-cx q0[30],q0[33];
-cx q0[30],q0[32];
-rz(pi/4) q0[30];
-rz(-pi/4) q0[32];
-cx q0[30],q0[32];
-cx q0[31],q0[32];
-rz(pi/4) q0[33];
-cx q0[32],q0[33];
-rz(-pi/4) q0[33];
-cx q0[31],q0[33];
-rz(pi/4) q0[33];
-cx q0[32],q0[33];
-rz(pi/4) q0[32];
-rz(-pi/4) q0[33];
-cx q0[31],q0[33];
-cx q0[31],q0[32];
-rz(3*pi/4) q0[31];
-sx q0[31];
-rz(pi/2) q0[31];
-rz(-pi/4) q0[32];
-cx q0[30],q0[32];
-rz(pi/2) q0[30];
-sx q0[30];
-rz(pi/2) q0[30];
-cx q0[29],q0[30];
-rz(-pi/4) q0[30];
-cx q0[27],q0[30];
-rz(pi/4) q0[30];
-cx q0[29],q0[30];
-rz(pi/4) q0[29];
-rz(-pi/4) q0[30];
-cx q0[27],q0[30];
-cx q0[27],q0[29];
-rz(pi/4) q0[27];
-rz(-pi/4) q0[29];
-cx q0[27],q0[29];
-cx q0[28],q0[29];
-rz(pi/4) q0[30];
-cx q0[29],q0[30];
-rz(-pi/4) q0[30];
-cx q0[28],q0[30];
-rz(pi/4) q0[30];
-cx q0[29],q0[30];
-rz(pi/4) q0[29];
-rz(-pi/4) q0[30];
-cx q0[28],q0[30];
-cx q0[28],q0[29];
-rz(3*pi/4) q0[28];
-sx q0[28];
-rz(pi/2) q0[28];
-rz(-pi/4) q0[29];
-cx q0[27],q0[29];
-rz(pi/2) q0[27];
-sx q0[27];
-rz(pi/2) q0[27];
-cx q0[26],q0[27];
-rz(-pi/4) q0[27];
-cx q0[24],q0[27];
-rz(pi/4) q0[27];
-cx q0[26],q0[27];
-rz(pi/4) q0[26];
-rz(-pi/4) q0[27];
-cx q0[24],q0[27];
-cx q0[24],q0[26];
-rz(pi/4) q0[24];
-rz(-pi/4) q0[26];
-cx q0[24],q0[26];
-cx q0[25],q0[26];
-rz(pi/4) q0[27];
-cx q0[26],q0[27];
-rz(-pi/4) q0[27];
-cx q0[25],q0[27];
-rz(pi/4) q0[27];
-cx q0[26],q0[27];
-rz(pi/4) q0[26];
-rz(-pi/4) q0[27];
-cx q0[25],q0[27];
-cx q0[25],q0[26];
-rz(3*pi/4) q0[25];
-sx q0[25];
-rz(pi/2) q0[25];
-rz(-pi/4) q0[26];
-cx q0[24],q0[26];
-rz(pi/2) q0[24];
-sx q0[24];
-rz(pi/2) q0[24];
-cx q0[23],q0[24];
-rz(-pi/4) q0[24];
-cx q0[21],q0[24];
-rz(pi/4) q0[24];
-cx q0[23],q0[24];
-rz(pi/4) q0[23];
-rz(-pi/4) q0[24];
-cx q0[21],q0[24];
-cx q0[21],q0[23];
-rz(pi/4) q0[21];
-rz(-pi/4) q0[23];
-cx q0[21],q0[23];
-cx q0[22],q0[23];
-rz(pi/4) q0[24];
-cx q0[23],q0[24];
-rz(-pi/4) q0[24];
-cx q0[22],q0[24];
-rz(pi/4) q0[24];
-cx q0[23],q0[24];
-rz(pi/4) q0[23];
-rz(-pi/4) q0[24];
-cx q0[22],q0[24];
-cx q0[22],q0[23];
-rz(3*pi/4) q0[22];
-sx q0[22];
-rz(pi/2) q0[22];
-rz(-pi/4) q0[23];
-cx q0[21],q0[23];
-rz(pi/2) q0[21];
-sx q0[21];
-rz(pi/2) q0[21];
-cx q0[20],q0[21];
-rz(-pi/4) q0[21];
-cx q0[18],q0[21];
-rz(pi/4) q0[21];
-cx q0[20],q0[21];
-rz(pi/4) q0[20];
-rz(-pi/4) q0[21];
-cx q0[18],q0[21];
-cx q0[18],q0[20];
-rz(pi/4) q0[18];
-rz(-pi/4) q0[20];
-cx q0[18],q0[20];
-cx q0[19],q0[20];
-rz(pi/4) q0[21];
-cx q0[20],q0[21];
-rz(-pi/4) q0[21];
-cx q0[19],q0[21];
-rz(pi/4) q0[21];
-cx q0[20],q0[21];
-rz(pi/4) q0[20];
-rz(-pi/4) q0[21];
-cx q0[19],q0[21];
-cx q0[19],q0[20];
-rz(3*pi/4) q0[19];
-sx q0[19];
-rz(pi/2) q0[19];
-rz(-pi/4) q0[20];
-cx q0[18],q0[20];
-rz(pi/2) q0[18];
-sx q0[18];
-rz(pi/2) q0[18];
-cx q0[17],q0[18];
-rz(-pi/4) q0[18];
-cx q0[15],q0[18];
-rz(pi/4) q0[18];
-cx q0[17],q0[18];
-rz(pi/4) q0[17];
-rz(-pi/4) q0[18];
-cx q0[15],q0[18];
-cx q0[15],q0[17];
-rz(pi/4) q0[15];
-rz(-pi/4) q0[17];
-cx q0[15],q0[17];
-cx q0[16],q0[17];
-rz(pi/4) q0[18];
-cx q0[17],q0[18];
-rz(-pi/4) q0[18];
-cx q0[16],q0[18];
-rz(pi/4) q0[18];
-cx q0[17],q0[18];
-rz(pi/4) q0[17];
-rz(-pi/4) q0[18];
-cx q0[16],q0[18];
-cx q0[16],q0[17];
-rz(3*pi/4) q0[16];
-sx q0[16];
-rz(pi/2) q0[16];
-rz(-pi/4) q0[17];
-cx q0[15],q0[17];
-rz(pi/2) q0[15];
-sx q0[15];
-rz(pi/2) q0[15];
-cx q0[14],q0[15];
-rz(-pi/4) q0[15];
-cx q0[12],q0[15];
-rz(pi/4) q0[15];
-cx q0[14],q0[15];
-rz(pi/4) q0[14];
-rz(-pi/4) q0[15];
-cx q0[12],q0[15];
-cx q0[12],q0[14];
-rz(pi/4) q0[12];
-rz(-pi/4) q0[14];
-cx q0[12],q0[14];
-cx q0[13],q0[14];
-rz(pi/4) q0[15];
-cx q0[14],q0[15];
-rz(-pi/4) q0[15];
-cx q0[13],q0[15];
-rz(pi/4) q0[15];
-cx q0[14],q0[15];
-rz(pi/4) q0[14];
-rz(-pi/4) q0[15];
-cx q0[13],q0[15];
-cx q0[13],q0[14];
-rz(3*pi/4) q0[13];
-sx q0[13];
-rz(pi/2) q0[13];
-rz(-pi/4) q0[14];
-cx q0[12],q0[14];
-rz(pi/2) q0[12];
-sx q0[12];
-rz(pi/2) q0[12];
-rz(pi/4) q0[15];
-cx q0[14],q0[15];
-rz(-pi/4) q0[15];
-rz(pi/4) q0[18];
-cx q0[17],q0[18];
-rz(-pi/4) q0[18];
-rz(pi/4) q0[21];
-cx q0[20],q0[21];
-rz(-pi/4) q0[21];
-rz(pi/4) q0[24];
-cx q0[23],q0[24];
-rz(-pi/4) q0[24];
-rz(pi/4) q0[27];
-cx q0[26],q0[27];
-rz(-pi/4) q0[27];
-rz(pi/4) q0[30];
-cx q0[29],q0[30];
-rz(-pi/4) q0[30];
-rz(pi/4) q0[33];
-cx q0[32],q0[33];
-rz(-pi/4) q0[33];
-rz(pi/4) q0[36];
-cx q0[35],q0[36];
-rz(-pi/4) q0[36];
-rz(pi/4) q0[39];
-cx q0[38],q0[39];
-rz(-pi/4) q0[39];
-rz(pi/4) q0[42];
-cx q0[41],q0[42];
-rz(-pi/4) q0[42];
-cx q0[49],q0[13];
-rz(-pi/4) q0[13];
-cx q0[50],q0[16];
-rz(-pi/4) q0[16];
-cx q0[51],q0[19];
-rz(-pi/4) q0[19];
-cx q0[52],q0[22];
-rz(-pi/4) q0[22];
-cx q0[53],q0[25];
-rz(-pi/4) q0[25];
-cx q0[54],q0[28];
-rz(-pi/4) q0[28];
-cx q0[55],q0[31];
-rz(-pi/4) q0[31];
-cx q0[56],q0[34];
-rz(-pi/4) q0[34];
-cx q0[57],q0[37];
-rz(-pi/4) q0[37];
-cx q0[58],q0[40];
-rz(-pi/4) q0[40];
-cx q0[9],q0[11];
-rz(-pi/4) q0[11];
-rz(pi/4) q0[9];
-cx q0[9],q0[11];
-cx q0[11],q0[12];
-rz(-pi/4) q0[12];
-cx q0[9],q0[12];
-rz(pi/4) q0[12];
-cx q0[11],q0[12];
-rz(pi/4) q0[11];
-rz(-pi/4) q0[12];
-cx q0[9],q0[12];
-rz(pi/4) q0[12];
-cx q0[9],q0[11];
-rz(-pi/4) q0[11];
-rz(pi/4) q0[9];
-cx q0[9],q0[11];
-cx q0[10],q0[11];
-cx q0[11],q0[12];
-rz(-pi/4) q0[12];
-cx q0[10],q0[12];
-rz(pi/4) q0[12];
-cx q0[11],q0[12];
-rz(pi/4) q0[11];
-rz(-pi/4) q0[12];
-cx q0[10],q0[12];
-cx q0[10],q0[11];
-rz(3*pi/4) q0[10];
-sx q0[10];
-rz(pi/2) q0[10];
-rz(-pi/4) q0[11];
-rz(pi/4) q0[12];
-cx q0[48],q0[10];
-rz(-pi/4) q0[10];
-cx q0[9],q0[11];
-cx q0[11],q0[12];
-rz(-pi/4) q0[12];
-rz(pi/2) q0[9];
-sx q0[9];
-rz(pi/2) q0[9];
-cx q0[8],q0[9];
-rz(-pi/4) q0[9];
-cx q0[6],q0[9];
-rz(pi/4) q0[9];
-cx q0[8],q0[9];
-rz(pi/4) q0[8];
-rz(-pi/4) q0[9];
-cx q0[6],q0[9];
-cx q0[6],q0[8];
-rz(pi/4) q0[6];
-rz(-pi/4) q0[8];
-cx q0[6],q0[8];
-cx q0[7],q0[8];
-rz(pi/4) q0[9];
-cx q0[8],q0[9];
-rz(-pi/4) q0[9];
-cx q0[7],q0[9];
-rz(pi/4) q0[9];
-cx q0[8],q0[9];
-rz(pi/4) q0[8];
-rz(-pi/4) q0[9];
-cx q0[7],q0[9];
-cx q0[7],q0[8];
-rz(3*pi/4) q0[7];
-sx q0[7];
-rz(pi/2) q0[7];
-cx q0[47],q0[7];
-rz(-pi/4) q0[7];
-rz(-pi/4) q0[8];
-cx q0[6],q0[8];
-rz(pi/2) q0[6];
-sx q0[6];
-rz(pi/2) q0[6];
-cx q0[5],q0[6];
-rz(-pi/4) q0[6];
-cx q0[3],q0[6];
-rz(pi/4) q0[6];
-cx q0[5],q0[6];
-rz(pi/4) q0[5];
-rz(-pi/4) q0[6];
-cx q0[3],q0[6];
-cx q0[3],q0[5];
-rz(pi/4) q0[3];
-rz(-pi/4) q0[5];
-cx q0[3],q0[5];
-cx q0[4],q0[5];
-rz(pi/4) q0[6];
-cx q0[5],q0[6];
-rz(-pi/4) q0[6];
-cx q0[4],q0[6];
-rz(pi/4) q0[6];
-cx q0[5],q0[6];
-rz(pi/4) q0[5];
-rz(-pi/4) q0[6];
-cx q0[4],q0[6];
-cx q0[4],q0[5];
-rz(3*pi/4) q0[4];
-sx q0[4];
-rz(pi/2) q0[4];
-cx q0[46],q0[4];
-rz(-pi/4) q0[4];
-rz(-pi/4) q0[5];
-cx q0[3],q0[5];
-rz(pi/2) q0[3];
-sx q0[3];
-rz(pi/2) q0[3];
-cx q0[2],q0[3];
-rz(-pi/4) q0[3];
-cx q0[0],q0[3];
-rz(pi/4) q0[3];
-cx q0[2],q0[3];
-rz(pi/4) q0[2];
-rz(-pi/4) q0[3];
-cx q0[0],q0[3];
-cx q0[0],q0[2];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[2];
-cx q0[0],q0[2];
-cx q0[1],q0[2];
-rz(pi/4) q0[3];
-cx q0[2],q0[3];
-rz(-pi/4) q0[3];
-cx q0[1],q0[3];
-rz(pi/4) q0[3];
-cx q0[2],q0[3];
-rz(pi/4) q0[2];
-rz(-pi/4) q0[3];
-cx q0[1],q0[3];
-cx q0[1],q0[2];
-rz(3*pi/4) q0[1];
-sx q0[1];
-rz(pi/2) q0[1];
-rz(-pi/4) q0[2];
-cx q0[0],q0[2];
-rz(pi/4) q0[3];
-cx q0[2],q0[3];
-rz(-pi/4) q0[3];
-cx q0[45],q0[1];
-rz(-pi/4) q0[1];
-rz(pi/4) q0[6];
-cx q0[5],q0[6];
-rz(-pi/4) q0[6];
-cx q0[60],q0[1];
-rz(pi/4) q0[1];
-cx q0[45],q0[1];
-rz(-pi/4) q0[1];
-rz(pi/4) q0[45];
-cx q0[60],q0[1];
-rz(3*pi/4) q0[1];
-sx q0[1];
-rz(pi/2) q0[1];
-cx q0[1],q0[3];
-rz(pi/4) q0[3];
-cx q0[2],q0[3];
-rz(pi/4) q0[2];
-rz(-pi/4) q0[3];
-cx q0[1],q0[3];
-cx q0[1],q0[2];
-rz(pi/4) q0[1];
-rz(-pi/4) q0[2];
-rz(pi/4) q0[3];
-cx q0[2],q0[3];
-rz(-pi/4) q0[3];
-cx q0[0],q0[3];
-rz(pi/4) q0[3];
-cx q0[2],q0[3];
-rz(pi/4) q0[2];
-rz(-pi/4) q0[3];
-cx q0[0],q0[3];
-cx q0[0],q0[2];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[2];
-cx q0[0],q0[2];
-rz(3*pi/4) q0[3];
-sx q0[3];
-rz(pi/2) q0[3];
-cx q0[60],q0[45];
-rz(-pi/4) q0[45];
-rz(pi/4) q0[60];
-cx q0[60],q0[45];
-cx q0[60],q0[4];
-rz(pi/4) q0[4];
-cx q0[46],q0[4];
-rz(-pi/4) q0[4];
-rz(pi/4) q0[46];
-cx q0[60],q0[4];
-rz(pi/4) q0[4];
-cx q0[45],q0[4];
-rz(-pi/4) q0[4];
-cx q0[60],q0[46];
-rz(-pi/4) q0[46];
-rz(pi/4) q0[60];
-cx q0[60],q0[46];
-cx q0[60],q0[7];
-rz(pi/4) q0[7];
-cx q0[47],q0[7];
-rz(pi/4) q0[47];
-rz(-pi/4) q0[7];
-cx q0[60],q0[7];
-cx q0[60],q0[47];
-rz(-pi/4) q0[47];
-rz(pi/4) q0[60];
-cx q0[60],q0[47];
-cx q0[60],q0[10];
-rz(pi/4) q0[10];
-cx q0[48],q0[10];
-rz(-pi/4) q0[10];
-rz(pi/4) q0[48];
-cx q0[60],q0[10];
-rz(pi/4) q0[10];
-cx q0[47],q0[10];
-rz(-pi/4) q0[10];
-cx q0[60],q0[48];
-rz(-pi/4) q0[48];
-rz(pi/4) q0[60];
-cx q0[60],q0[48];
-cx q0[60],q0[13];
-rz(pi/4) q0[13];
-cx q0[49],q0[13];
-rz(-pi/4) q0[13];
-rz(pi/4) q0[49];
-cx q0[60],q0[13];
-rz(pi/4) q0[13];
-cx q0[48],q0[13];
-rz(-pi/4) q0[13];
-cx q0[60],q0[49];
-rz(-pi/4) q0[49];
-rz(pi/4) q0[60];
-cx q0[60],q0[49];
-cx q0[60],q0[16];
-rz(pi/4) q0[16];
-cx q0[50],q0[16];
-rz(-pi/4) q0[16];
-rz(pi/4) q0[50];
-cx q0[60],q0[16];
-rz(pi/4) q0[16];
-cx q0[49],q0[16];
-rz(-pi/4) q0[16];
-cx q0[60],q0[50];
-rz(-pi/4) q0[50];
-rz(pi/4) q0[60];
-cx q0[60],q0[50];
-cx q0[60],q0[19];
-rz(pi/4) q0[19];
-cx q0[51],q0[19];
-rz(-pi/4) q0[19];
-rz(pi/4) q0[51];
-cx q0[60],q0[19];
-rz(pi/4) q0[19];
-cx q0[50],q0[19];
-rz(-pi/4) q0[19];
-cx q0[60],q0[51];
-rz(-pi/4) q0[51];
-rz(pi/4) q0[60];
-cx q0[60],q0[51];
-cx q0[60],q0[22];
-rz(pi/4) q0[22];
-cx q0[52],q0[22];
-rz(-pi/4) q0[22];
-rz(pi/4) q0[52];
-cx q0[60],q0[22];
-rz(pi/4) q0[22];
-cx q0[51],q0[22];
-rz(-pi/4) q0[22];
-cx q0[60],q0[52];
-rz(-pi/4) q0[52];
-rz(pi/4) q0[60];
-cx q0[60],q0[52];
-cx q0[60],q0[25];
-rz(pi/4) q0[25];
-cx q0[53],q0[25];
-rz(-pi/4) q0[25];
-rz(pi/4) q0[53];
-cx q0[60],q0[25];
-rz(pi/4) q0[25];
-cx q0[52],q0[25];
-rz(-pi/4) q0[25];
-cx q0[60],q0[53];
-rz(-pi/4) q0[53];
-rz(pi/4) q0[60];
-cx q0[60],q0[53];
-cx q0[60],q0[28];
-rz(pi/4) q0[28];
-cx q0[54],q0[28];
-rz(-pi/4) q0[28];
-rz(pi/4) q0[54];
-cx q0[60],q0[28];
-rz(pi/4) q0[28];
-cx q0[53],q0[28];
-rz(-pi/4) q0[28];
-cx q0[60],q0[54];
-rz(-pi/4) q0[54];
-rz(pi/4) q0[60];
-cx q0[60],q0[54];
-cx q0[60],q0[31];
-rz(pi/4) q0[31];
-cx q0[55],q0[31];
-rz(-pi/4) q0[31];
-rz(pi/4) q0[55];
-cx q0[60],q0[31];
-rz(pi/4) q0[31];
-cx q0[54],q0[31];
-rz(-pi/4) q0[31];
-cx q0[60],q0[55];
-rz(-pi/4) q0[55];
-rz(pi/4) q0[60];
-cx q0[60],q0[55];
-cx q0[60],q0[34];
-rz(pi/4) q0[34];
-cx q0[56],q0[34];
-rz(-pi/4) q0[34];
-rz(pi/4) q0[56];
-cx q0[60],q0[34];
-rz(pi/4) q0[34];
-cx q0[55],q0[34];
-rz(-pi/4) q0[34];
-cx q0[60],q0[56];
-rz(-pi/4) q0[56];
-rz(pi/4) q0[60];
-cx q0[60],q0[56];
-cx q0[60],q0[37];
-rz(pi/4) q0[37];
-cx q0[57],q0[37];
-rz(-pi/4) q0[37];
-rz(pi/4) q0[57];
-cx q0[60],q0[37];
-rz(pi/4) q0[37];
-cx q0[56],q0[37];
-rz(-pi/4) q0[37];
-cx q0[60],q0[57];
-rz(-pi/4) q0[57];
-rz(pi/4) q0[60];
-cx q0[60],q0[57];
-cx q0[60],q0[40];
-rz(pi/4) q0[40];
-cx q0[58],q0[40];
-rz(-pi/4) q0[40];
-rz(pi/4) q0[58];
-cx q0[60],q0[40];
-rz(pi/4) q0[40];
-cx q0[57],q0[40];
-rz(-pi/4) q0[40];
-cx q0[60],q0[58];
-rz(-pi/4) q0[58];
-rz(pi/4) q0[60];
-cx q0[60],q0[58];
-cx q0[60],q0[43];
-rz(pi/4) q0[43];
-cx q0[59],q0[43];
-rz(-pi/4) q0[43];
-rz(pi/4) q0[59];
-cx q0[60],q0[43];
-rz(pi/4) q0[43];
-cx q0[58],q0[43];
-rz(-pi/4) q0[43];
-cx q0[60],q0[59];
-rz(-pi/4) q0[59];
-rz(pi/4) q0[60];
-cx q0[60],q0[59];
-rz(pi/4) q0[7];
-cx q0[46],q0[7];
-rz(-pi/4) q0[7];
-rz(pi/4) q0[9];
-cx q0[8],q0[9];
-rz(-pi/4) q0[9];
-cx q0[61],q0[4];
-rz(pi/4) q0[4];
-cx q0[45],q0[4];
-rz(-pi/4) q0[4];
-rz(pi/4) q0[45];
-cx q0[61],q0[4];
-rz(3*pi/4) q0[4];
-sx q0[4];
-rz(pi/2) q0[4];
-cx q0[4],q0[6];
-rz(pi/4) q0[6];
-cx q0[5],q0[6];
-rz(pi/4) q0[5];
-rz(-pi/4) q0[6];
-cx q0[4],q0[6];
-cx q0[4],q0[5];
-rz(pi/4) q0[4];
-rz(-pi/4) q0[5];
-rz(pi/4) q0[6];
-cx q0[5],q0[6];
-rz(-pi/4) q0[6];
-cx q0[3],q0[6];
-rz(pi/4) q0[6];
-cx q0[5],q0[6];
-rz(pi/4) q0[5];
-rz(-pi/4) q0[6];
-cx q0[3],q0[6];
-cx q0[3],q0[5];
-rz(pi/4) q0[3];
-rz(-pi/4) q0[5];
-cx q0[3],q0[5];
-rz(3*pi/4) q0[6];
-sx q0[6];
-rz(pi/2) q0[6];
-cx q0[61],q0[45];
-rz(-pi/4) q0[45];
-rz(pi/4) q0[61];
-cx q0[61],q0[45];
-cx q0[61],q0[7];
-rz(pi/4) q0[7];
-cx q0[46],q0[7];
-rz(pi/4) q0[46];
-rz(-pi/4) q0[7];
-cx q0[61],q0[7];
-cx q0[61],q0[46];
-rz(-pi/4) q0[46];
-rz(pi/4) q0[61];
-cx q0[61],q0[46];
-cx q0[61],q0[10];
-rz(pi/4) q0[10];
-cx q0[47],q0[10];
-rz(-pi/4) q0[10];
-rz(pi/4) q0[47];
-cx q0[61],q0[10];
-rz(3*pi/4) q0[10];
-sx q0[10];
-rz(pi/2) q0[10];
-cx q0[10],q0[12];
-rz(pi/4) q0[12];
-cx q0[11],q0[12];
-rz(pi/4) q0[11];
-rz(-pi/4) q0[12];
-cx q0[10],q0[12];
-cx q0[10],q0[11];
-rz(pi/4) q0[10];
-rz(-pi/4) q0[11];
-rz(pi/4) q0[12];
-cx q0[11],q0[12];
-rz(-pi/4) q0[12];
-cx q0[61],q0[47];
-rz(-pi/4) q0[47];
-rz(pi/4) q0[61];
-cx q0[61],q0[47];
-cx q0[61],q0[13];
-rz(pi/4) q0[13];
-cx q0[48],q0[13];
-rz(-pi/4) q0[13];
-rz(pi/4) q0[48];
-cx q0[61],q0[13];
-rz(3*pi/4) q0[13];
-sx q0[13];
-rz(pi/2) q0[13];
-cx q0[13],q0[15];
-rz(pi/4) q0[15];
-cx q0[14],q0[15];
-rz(pi/4) q0[14];
-rz(-pi/4) q0[15];
-cx q0[13],q0[15];
-cx q0[13],q0[14];
-rz(pi/4) q0[13];
-rz(-pi/4) q0[14];
-rz(pi/4) q0[15];
-cx q0[14],q0[15];
-rz(-pi/4) q0[15];
-cx q0[61],q0[48];
-rz(-pi/4) q0[48];
-rz(pi/4) q0[61];
-cx q0[61],q0[48];
-cx q0[61],q0[16];
-rz(pi/4) q0[16];
-cx q0[49],q0[16];
-rz(-pi/4) q0[16];
-rz(pi/4) q0[49];
-cx q0[61],q0[16];
-rz(3*pi/4) q0[16];
-sx q0[16];
-rz(pi/2) q0[16];
-cx q0[16],q0[18];
-rz(pi/4) q0[18];
-cx q0[17],q0[18];
-rz(pi/4) q0[17];
-rz(-pi/4) q0[18];
-cx q0[16],q0[18];
-cx q0[16],q0[17];
-rz(pi/4) q0[16];
-rz(-pi/4) q0[17];
-rz(pi/4) q0[18];
-cx q0[17],q0[18];
-rz(-pi/4) q0[18];
-cx q0[61],q0[49];
-rz(-pi/4) q0[49];
-rz(pi/4) q0[61];
-cx q0[61],q0[49];
-cx q0[61],q0[19];
-rz(pi/4) q0[19];
-cx q0[50],q0[19];
-rz(-pi/4) q0[19];
-rz(pi/4) q0[50];
-cx q0[61],q0[19];
-rz(3*pi/4) q0[19];
-sx q0[19];
-rz(pi/2) q0[19];
-cx q0[19],q0[21];
-rz(pi/4) q0[21];
-cx q0[20],q0[21];
-rz(pi/4) q0[20];
-rz(-pi/4) q0[21];
-cx q0[19],q0[21];
-cx q0[19],q0[20];
-rz(pi/4) q0[19];
-rz(-pi/4) q0[20];
-rz(pi/4) q0[21];
-cx q0[20],q0[21];
-rz(-pi/4) q0[21];
-cx q0[61],q0[50];
-rz(-pi/4) q0[50];
-rz(pi/4) q0[61];
-cx q0[61],q0[50];
-cx q0[61],q0[22];
-rz(pi/4) q0[22];
-cx q0[51],q0[22];
-rz(-pi/4) q0[22];
-rz(pi/4) q0[51];
-cx q0[61],q0[22];
-rz(3*pi/4) q0[22];
-sx q0[22];
-rz(pi/2) q0[22];
-cx q0[22],q0[24];
-rz(pi/4) q0[24];
-cx q0[23],q0[24];
-rz(pi/4) q0[23];
-rz(-pi/4) q0[24];
-cx q0[22],q0[24];
-cx q0[22],q0[23];
-rz(pi/4) q0[22];
-rz(-pi/4) q0[23];
-rz(pi/4) q0[24];
-cx q0[23],q0[24];
-rz(-pi/4) q0[24];
-cx q0[61],q0[51];
-rz(-pi/4) q0[51];
-rz(pi/4) q0[61];
-cx q0[61],q0[51];
-cx q0[61],q0[25];
-rz(pi/4) q0[25];
-cx q0[52],q0[25];
-rz(-pi/4) q0[25];
-rz(pi/4) q0[52];
-cx q0[61],q0[25];
-rz(3*pi/4) q0[25];
-sx q0[25];
-rz(pi/2) q0[25];
-cx q0[25],q0[27];
-rz(pi/4) q0[27];
-cx q0[26],q0[27];
-rz(pi/4) q0[26];
-rz(-pi/4) q0[27];
-cx q0[25],q0[27];
-cx q0[25],q0[26];
-rz(pi/4) q0[25];
-rz(-pi/4) q0[26];
-rz(pi/4) q0[27];
-cx q0[26],q0[27];
-rz(-pi/4) q0[27];
-cx q0[61],q0[52];
-rz(-pi/4) q0[52];
-rz(pi/4) q0[61];
-cx q0[61],q0[52];
-cx q0[61],q0[28];
-rz(pi/4) q0[28];
-cx q0[53],q0[28];
-rz(-pi/4) q0[28];
-rz(pi/4) q0[53];
-cx q0[61],q0[28];
-rz(3*pi/4) q0[28];
-sx q0[28];
-rz(pi/2) q0[28];
-cx q0[28],q0[30];
-rz(pi/4) q0[30];
-cx q0[29],q0[30];
-rz(pi/4) q0[29];
-rz(-pi/4) q0[30];
-cx q0[28],q0[30];
-cx q0[28],q0[29];
-rz(pi/4) q0[28];
-rz(-pi/4) q0[29];
-rz(pi/4) q0[30];
-cx q0[29],q0[30];
-rz(-pi/4) q0[30];
-cx q0[61],q0[53];
-rz(-pi/4) q0[53];
-rz(pi/4) q0[61];
-cx q0[61],q0[53];
-cx q0[61],q0[31];
-rz(pi/4) q0[31];
-cx q0[54],q0[31];
-rz(-pi/4) q0[31];
-rz(pi/4) q0[54];
-cx q0[61],q0[31];
-rz(3*pi/4) q0[31];
-sx q0[31];
-rz(pi/2) q0[31];
-cx q0[31],q0[33];
-rz(pi/4) q0[33];
-cx q0[32],q0[33];
-rz(pi/4) q0[32];
-rz(-pi/4) q0[33];
-cx q0[31],q0[33];
-cx q0[31],q0[32];
-rz(pi/4) q0[31];
-rz(-pi/4) q0[32];
-rz(pi/4) q0[33];
-cx q0[32],q0[33];
-rz(-pi/4) q0[33];
-cx q0[61],q0[54];
-rz(-pi/4) q0[54];
-rz(pi/4) q0[61];
-cx q0[61],q0[54];
-cx q0[61],q0[34];
-rz(pi/4) q0[34];
-cx q0[55],q0[34];
-rz(-pi/4) q0[34];
-rz(pi/4) q0[55];
-cx q0[61],q0[34];
-rz(3*pi/4) q0[34];
-sx q0[34];
-rz(pi/2) q0[34];
-cx q0[34],q0[36];
-rz(pi/4) q0[36];
-cx q0[35],q0[36];
-rz(pi/4) q0[35];
-rz(-pi/4) q0[36];
-cx q0[34],q0[36];
-cx q0[34],q0[35];
-rz(pi/4) q0[34];
-rz(-pi/4) q0[35];
-rz(pi/4) q0[36];
-cx q0[35],q0[36];
-rz(-pi/4) q0[36];
-cx q0[61],q0[55];
-rz(-pi/4) q0[55];
-rz(pi/4) q0[61];
-cx q0[61],q0[55];
-cx q0[61],q0[37];
-rz(pi/4) q0[37];
-cx q0[56],q0[37];
-rz(-pi/4) q0[37];
-rz(pi/4) q0[56];
-cx q0[61],q0[37];
-rz(3*pi/4) q0[37];
-sx q0[37];
-rz(pi/2) q0[37];
-cx q0[37],q0[39];
-rz(pi/4) q0[39];
-cx q0[38],q0[39];
-rz(pi/4) q0[38];
-rz(-pi/4) q0[39];
-cx q0[37],q0[39];
-cx q0[37],q0[38];
-rz(pi/4) q0[37];
-rz(-pi/4) q0[38];
-rz(pi/4) q0[39];
-cx q0[38],q0[39];
-rz(-pi/4) q0[39];
-cx q0[61],q0[56];
-rz(-pi/4) q0[56];
-rz(pi/4) q0[61];
-cx q0[61],q0[56];
-cx q0[61],q0[40];
-rz(pi/4) q0[40];
-cx q0[57],q0[40];
-rz(-pi/4) q0[40];
-rz(pi/4) q0[57];
-cx q0[61],q0[40];
-rz(3*pi/4) q0[40];
-sx q0[40];
-rz(pi/2) q0[40];
-cx q0[40],q0[42];
-rz(pi/4) q0[42];
-cx q0[41],q0[42];
-rz(pi/4) q0[41];
-rz(-pi/4) q0[42];
-cx q0[40],q0[42];
-cx q0[40],q0[41];
-rz(pi/4) q0[40];
-rz(-pi/4) q0[41];
-rz(pi/4) q0[42];
-cx q0[41],q0[42];
-rz(-pi/4) q0[42];
-cx q0[61],q0[57];
-rz(-pi/4) q0[57];
-rz(pi/4) q0[61];
-cx q0[61],q0[57];
-cx q0[61],q0[43];
-rz(pi/4) q0[43];
-cx q0[58],q0[43];
-rz(-pi/4) q0[43];
-rz(pi/4) q0[58];
-cx q0[61],q0[43];
-rz(3*pi/4) q0[43];
-sx q0[43];
-rz(pi/2) q0[43];
-cx q0[43],q0[44];
-rz(pi/2) q0[43];
-sx q0[43];
-rz(pi/2) q0[43];
-cx q0[61],q0[58];
-rz(-pi/4) q0[58];
-rz(pi/4) q0[61];
-cx q0[61],q0[58];
-cx q0[58],q0[43];
-rz(-pi/4) q0[43];
-rz(3*pi/4) q0[7];
-sx q0[7];
-rz(pi/2) q0[7];
-cx q0[7],q0[9];
-rz(pi/4) q0[9];
-cx q0[8],q0[9];
-rz(pi/4) q0[8];
-rz(-pi/4) q0[9];
-cx q0[7],q0[9];
-cx q0[7],q0[8];
-rz(pi/4) q0[7];
-rz(-pi/4) q0[8];
-rz(pi/4) q0[9];
-cx q0[8],q0[9];
-rz(-pi/4) q0[9];
-cx q0[6],q0[9];
-rz(pi/4) q0[9];
-cx q0[8],q0[9];
-rz(pi/4) q0[8];
-rz(-pi/4) q0[9];
-cx q0[6],q0[9];
-cx q0[6],q0[8];
-rz(pi/4) q0[6];
-rz(-pi/4) q0[8];
-cx q0[6],q0[8];
-rz(3*pi/4) q0[9];
-sx q0[9];
-rz(pi/2) q0[9];
-cx q0[9],q0[12];
-rz(pi/4) q0[12];
-cx q0[11],q0[12];
-rz(pi/4) q0[11];
-rz(-pi/4) q0[12];
-cx q0[9],q0[12];
-rz(3*pi/4) q0[12];
-sx q0[12];
-rz(pi/2) q0[12];
-cx q0[12],q0[15];
-rz(pi/4) q0[15];
-cx q0[14],q0[15];
-rz(pi/4) q0[14];
-rz(-pi/4) q0[15];
-cx q0[12],q0[15];
-cx q0[12],q0[14];
-rz(pi/4) q0[12];
-rz(-pi/4) q0[14];
-cx q0[12],q0[14];
-rz(3*pi/4) q0[15];
-sx q0[15];
-rz(pi/2) q0[15];
-cx q0[15],q0[18];
-rz(pi/4) q0[18];
-cx q0[17],q0[18];
-rz(pi/4) q0[17];
-rz(-pi/4) q0[18];
-cx q0[15],q0[18];
-cx q0[15],q0[17];
-rz(pi/4) q0[15];
-rz(-pi/4) q0[17];
-cx q0[15],q0[17];
-rz(3*pi/4) q0[18];
-sx q0[18];
-rz(pi/2) q0[18];
-cx q0[18],q0[21];
-rz(pi/4) q0[21];
-cx q0[20],q0[21];
-rz(pi/4) q0[20];
-rz(-pi/4) q0[21];
-cx q0[18],q0[21];
-cx q0[18],q0[20];
-rz(pi/4) q0[18];
-rz(-pi/4) q0[20];
-cx q0[18],q0[20];
-rz(3*pi/4) q0[21];
-sx q0[21];
-rz(pi/2) q0[21];
-cx q0[21],q0[24];
-rz(pi/4) q0[24];
-cx q0[23],q0[24];
-rz(pi/4) q0[23];
-rz(-pi/4) q0[24];
-cx q0[21],q0[24];
-cx q0[21],q0[23];
-rz(pi/4) q0[21];
-rz(-pi/4) q0[23];
-cx q0[21],q0[23];
-rz(3*pi/4) q0[24];
-sx q0[24];
-rz(pi/2) q0[24];
-cx q0[24],q0[27];
-rz(pi/4) q0[27];
-cx q0[26],q0[27];
-rz(pi/4) q0[26];
-rz(-pi/4) q0[27];
-cx q0[24],q0[27];
-cx q0[24],q0[26];
-rz(pi/4) q0[24];
-rz(-pi/4) q0[26];
-cx q0[24],q0[26];
-rz(3*pi/4) q0[27];
-sx q0[27];
-rz(pi/2) q0[27];
-cx q0[27],q0[30];
-rz(pi/4) q0[30];
-cx q0[29],q0[30];
-rz(pi/4) q0[29];
-rz(-pi/4) q0[30];
-cx q0[27],q0[30];
-cx q0[27],q0[29];
-rz(pi/4) q0[27];
-rz(-pi/4) q0[29];
-cx q0[27],q0[29];
-rz(3*pi/4) q0[30];
-sx q0[30];
-rz(pi/2) q0[30];
-cx q0[30],q0[33];
-rz(pi/4) q0[33];
-cx q0[32],q0[33];
-rz(pi/4) q0[32];
-rz(-pi/4) q0[33];
-cx q0[30],q0[33];
-cx q0[30],q0[32];
-rz(pi/4) q0[30];
-rz(-pi/4) q0[32];
-cx q0[30],q0[32];
-rz(3*pi/4) q0[33];
-sx q0[33];
-rz(pi/2) q0[33];
-cx q0[33],q0[36];
-rz(pi/4) q0[36];
-cx q0[35],q0[36];
-rz(pi/4) q0[35];
-rz(-pi/4) q0[36];
-cx q0[33],q0[36];
-cx q0[33],q0[35];
-rz(pi/4) q0[33];
-rz(-pi/4) q0[35];
-cx q0[33],q0[35];
-rz(3*pi/4) q0[36];
-sx q0[36];
-rz(pi/2) q0[36];
-cx q0[36],q0[39];
-rz(pi/4) q0[39];
-cx q0[38],q0[39];
-rz(pi/4) q0[38];
-rz(-pi/4) q0[39];
-cx q0[36],q0[39];
-cx q0[36],q0[38];
-rz(pi/4) q0[36];
-rz(-pi/4) q0[38];
-cx q0[36],q0[38];
-rz(3*pi/4) q0[39];
-sx q0[39];
-rz(pi/2) q0[39];
-cx q0[39],q0[42];
-rz(pi/4) q0[42];
-cx q0[41],q0[42];
-rz(pi/4) q0[41];
-rz(-pi/4) q0[42];
-cx q0[39],q0[42];
-cx q0[39],q0[41];
-rz(pi/4) q0[39];
-rz(-pi/4) q0[41];
-cx q0[39],q0[41];
-rz(3*pi/4) q0[42];
-sx q0[42];
-rz(pi/2) q0[42];
-cx q0[42],q0[44];
-rz(pi/2) q0[42];
-sx q0[42];
-rz(pi/2) q0[42];
-cx q0[41],q0[42];
-rz(-pi/4) q0[42];
-cx q0[39],q0[42];
-rz(pi/4) q0[42];
-cx q0[41],q0[42];
-rz(pi/4) q0[41];
-rz(-pi/4) q0[42];
-cx q0[39],q0[42];
-cx q0[39],q0[41];
-rz(pi/4) q0[39];
-rz(-pi/4) q0[41];
-cx q0[39],q0[41];
-cx q0[40],q0[41];
-rz(pi/4) q0[42];
-cx q0[41],q0[42];
-rz(-pi/4) q0[42];
-cx q0[40],q0[42];
-rz(pi/4) q0[42];
-cx q0[41],q0[42];
-rz(pi/4) q0[41];
-rz(-pi/4) q0[42];
-cx q0[40],q0[42];
-cx q0[40],q0[41];
-rz(3*pi/4) q0[40];
-sx q0[40];
-rz(pi/2) q0[40];
-rz(-pi/4) q0[41];
-cx q0[39],q0[41];
-rz(pi/2) q0[39];
-sx q0[39];
-rz(pi/2) q0[39];
-cx q0[38],q0[39];
-rz(-pi/4) q0[39];
-cx q0[36],q0[39];
-rz(pi/4) q0[39];
-cx q0[38],q0[39];
-rz(pi/4) q0[38];
-rz(-pi/4) q0[39];
-cx q0[36],q0[39];
-cx q0[36],q0[38];
-rz(pi/4) q0[36];
-rz(-pi/4) q0[38];
-cx q0[36],q0[38];
-cx q0[37],q0[38];
-rz(pi/4) q0[39];
-cx q0[38],q0[39];
-rz(-pi/4) q0[39];
-cx q0[37],q0[39];
-rz(pi/4) q0[39];
-cx q0[38],q0[39];
-rz(pi/4) q0[38];
-rz(-pi/4) q0[39];
-cx q0[37],q0[39];
-cx q0[37],q0[38];
-rz(3*pi/4) q0[37];
-sx q0[37];
-rz(pi/2) q0[37];
-rz(-pi/4) q0[38];
-cx q0[36],q0[38];
-rz(pi/2) q0[36];
-sx q0[36];
-rz(pi/2) q0[36];
-cx q0[35],q0[36];
-rz(-pi/4) q0[36];
-cx q0[33],q0[36];
-rz(pi/4) q0[36];
-cx q0[35],q0[36];
-rz(pi/4) q0[35];
-rz(-pi/4) q0[36];
-cx q0[33],q0[36];
-cx q0[33],q0[35];
-rz(pi/4) q0[33];
-rz(-pi/4) q0[35];
-cx q0[33],q0[35];
-cx q0[34],q0[35];
-rz(pi/4) q0[36];
-cx q0[35],q0[36];
-rz(-pi/4) q0[36];
-cx q0[34],q0[36];
-rz(pi/4) q0[36];
-cx q0[35],q0[36];
-rz(pi/4) q0[35];
-rz(-pi/4) q0[36];
-cx q0[34],q0[36];
-cx q0[34],q0[35];
-rz(3*pi/4) q0[34];
-sx q0[34];
-rz(pi/2) q0[34];
-rz(-pi/4) q0[35];
-cx q0[33],q0[35];
-rz(pi/2) q0[33];
-sx q0[33];
-rz(pi/2) q0[33];
-cx q0[32],q0[33];
-rz(-pi/4) q0[33];
-cx q0[30],q0[33];
-rz(pi/4) q0[33];
-cx q0[32],q0[33];
-rz(pi/4) q0[32];
-rz(-pi/4) q0[33];
-cx q0[30],q0[33];
-cx q0[30],q0[32];
-rz(pi/4) q0[30];
-rz(-pi/4) q0[32];
-cx q0[30],q0[32];
-cx q0[31],q0[32];
-rz(pi/4) q0[33];
-cx q0[32],q0[33];
-rz(-pi/4) q0[33];
-cx q0[31],q0[33];
-rz(pi/4) q0[33];
-cx q0[32],q0[33];
-rz(pi/4) q0[32];
-rz(-pi/4) q0[33];
-cx q0[31],q0[33];
-cx q0[31],q0[32];
-rz(3*pi/4) q0[31];
-sx q0[31];
-rz(pi/2) q0[31];
-rz(-pi/4) q0[32];
-cx q0[30],q0[32];
-rz(pi/2) q0[30];
-sx q0[30];
-rz(pi/2) q0[30];
-cx q0[29],q0[30];
-rz(-pi/4) q0[30];
-cx q0[27],q0[30];
-rz(pi/4) q0[30];
-cx q0[29],q0[30];
-rz(pi/4) q0[29];
-rz(-pi/4) q0[30];
-cx q0[27],q0[30];
-cx q0[27],q0[29];
-rz(pi/4) q0[27];
-rz(-pi/4) q0[29];
-cx q0[27],q0[29];
-cx q0[28],q0[29];
-rz(pi/4) q0[30];
-cx q0[29],q0[30];
-rz(-pi/4) q0[30];
-cx q0[28],q0[30];
-rz(pi/4) q0[30];
-cx q0[29],q0[30];
-rz(pi/4) q0[29];
-rz(-pi/4) q0[30];
-cx q0[28],q0[30];
-cx q0[28],q0[29];
-rz(3*pi/4) q0[28];
-sx q0[28];
-rz(pi/2) q0[28];
-rz(-pi/4) q0[29];
-cx q0[27],q0[29];
-rz(pi/2) q0[27];
-sx q0[27];
-rz(pi/2) q0[27];
-cx q0[26],q0[27];
-rz(-pi/4) q0[27];
-cx q0[24],q0[27];
-rz(pi/4) q0[27];
-cx q0[26],q0[27];
-rz(pi/4) q0[26];
-rz(-pi/4) q0[27];
-cx q0[24],q0[27];
-cx q0[24],q0[26];
-rz(pi/4) q0[24];
-rz(-pi/4) q0[26];
-cx q0[24],q0[26];
-cx q0[25],q0[26];
-rz(pi/4) q0[27];
-cx q0[26],q0[27];
-rz(-pi/4) q0[27];
-cx q0[25],q0[27];
-rz(pi/4) q0[27];
-cx q0[26],q0[27];
-rz(pi/4) q0[26];
-rz(-pi/4) q0[27];
-cx q0[25],q0[27];
-cx q0[25],q0[26];
-rz(3*pi/4) q0[25];
-sx q0[25];
-rz(pi/2) q0[25];
-rz(-pi/4) q0[26];
-cx q0[24],q0[26];
-rz(pi/2) q0[24];
-sx q0[24];
-rz(pi/2) q0[24];
-cx q0[23],q0[24];
-rz(-pi/4) q0[24];
-cx q0[21],q0[24];
-rz(pi/4) q0[24];
-cx q0[23],q0[24];
-rz(pi/4) q0[23];
-rz(-pi/4) q0[24];
-cx q0[21],q0[24];
-cx q0[21],q0[23];
-rz(pi/4) q0[21];
-rz(-pi/4) q0[23];
-cx q0[21],q0[23];
-cx q0[22],q0[23];
-rz(pi/4) q0[24];
-cx q0[23],q0[24];
-rz(-pi/4) q0[24];
-cx q0[22],q0[24];
-rz(pi/4) q0[24];
-cx q0[23],q0[24];
-rz(pi/4) q0[23];
-rz(-pi/4) q0[24];
-cx q0[22],q0[24];
-cx q0[22],q0[23];
-rz(3*pi/4) q0[22];
-sx q0[22];
-rz(pi/2) q0[22];
-rz(-pi/4) q0[23];
-cx q0[21],q0[23];
-rz(pi/2) q0[21];
-sx q0[21];
-rz(pi/2) q0[21];
-cx q0[20],q0[21];
-rz(-pi/4) q0[21];
-cx q0[18],q0[21];
-rz(pi/4) q0[21];
-cx q0[20],q0[21];
-rz(pi/4) q0[20];
-rz(-pi/4) q0[21];
-cx q0[18],q0[21];
-cx q0[18],q0[20];
-rz(pi/4) q0[18];
-rz(-pi/4) q0[20];
-cx q0[18],q0[20];
-cx q0[19],q0[20];
-rz(pi/4) q0[21];
-cx q0[20],q0[21];
-rz(-pi/4) q0[21];
-cx q0[19],q0[21];
-rz(pi/4) q0[21];
-cx q0[20],q0[21];
-rz(pi/4) q0[20];
-rz(-pi/4) q0[21];
-cx q0[19],q0[21];
-cx q0[19],q0[20];
-rz(3*pi/4) q0[19];
-sx q0[19];
-rz(pi/2) q0[19];
-rz(-pi/4) q0[20];
-cx q0[18],q0[20];
-rz(pi/2) q0[18];
-sx q0[18];
-rz(pi/2) q0[18];
-cx q0[17],q0[18];
-rz(-pi/4) q0[18];
-cx q0[15],q0[18];
-rz(pi/4) q0[18];
-cx q0[17],q0[18];
-rz(pi/4) q0[17];
-rz(-pi/4) q0[18];
-cx q0[15],q0[18];
-cx q0[15],q0[17];
-rz(pi/4) q0[15];
-rz(-pi/4) q0[17];
-cx q0[15],q0[17];
-cx q0[16],q0[17];
-rz(pi/4) q0[18];
-cx q0[17],q0[18];
-rz(-pi/4) q0[18];
-cx q0[16],q0[18];
-rz(pi/4) q0[18];
-cx q0[17],q0[18];
-rz(pi/4) q0[17];
-rz(-pi/4) q0[18];
-cx q0[16],q0[18];
-cx q0[16],q0[17];
-rz(3*pi/4) q0[16];
-sx q0[16];
-rz(pi/2) q0[16];
-rz(-pi/4) q0[17];
-cx q0[15],q0[17];
-rz(pi/2) q0[15];
-sx q0[15];
-rz(pi/2) q0[15];
-cx q0[14],q0[15];
-rz(-pi/4) q0[15];
-cx q0[12],q0[15];
-rz(pi/4) q0[15];
-cx q0[14],q0[15];
-rz(pi/4) q0[14];
-rz(-pi/4) q0[15];
-cx q0[12],q0[15];
-cx q0[12],q0[14];
-rz(pi/4) q0[12];
-rz(-pi/4) q0[14];
-cx q0[12],q0[14];
-cx q0[13],q0[14];
-rz(pi/4) q0[15];
-cx q0[14],q0[15];
-rz(-pi/4) q0[15];
-cx q0[13],q0[15];
-rz(pi/4) q0[15];
-cx q0[14],q0[15];
-rz(pi/4) q0[14];
-rz(-pi/4) q0[15];
-cx q0[13],q0[15];
-cx q0[13],q0[14];
-rz(3*pi/4) q0[13];
-sx q0[13];
-rz(pi/2) q0[13];
-rz(-pi/4) q0[14];
-cx q0[12],q0[14];
-rz(pi/2) q0[12];
-sx q0[12];
-rz(pi/2) q0[12];
-rz(pi/4) q0[15];
-cx q0[14],q0[15];
-rz(-pi/4) q0[15];
-rz(pi/4) q0[18];
-cx q0[17],q0[18];
-rz(-pi/4) q0[18];
-rz(pi/4) q0[21];
-cx q0[20],q0[21];
-rz(-pi/4) q0[21];
-rz(pi/4) q0[24];
-cx q0[23],q0[24];
-rz(-pi/4) q0[24];
-rz(pi/4) q0[27];
-cx q0[26],q0[27];
-rz(-pi/4) q0[27];
-rz(pi/4) q0[30];
-cx q0[29],q0[30];
-rz(-pi/4) q0[30];
-rz(pi/4) q0[33];
-cx q0[32],q0[33];
-rz(-pi/4) q0[33];
-rz(pi/4) q0[36];
-cx q0[35],q0[36];
-rz(-pi/4) q0[36];
-rz(pi/4) q0[39];
-cx q0[38],q0[39];
-rz(-pi/4) q0[39];
-rz(pi/4) q0[42];
-cx q0[41],q0[42];
-rz(-pi/4) q0[42];
-cx q0[48],q0[13];
-rz(-pi/4) q0[13];
-cx q0[49],q0[16];
-rz(-pi/4) q0[16];
-cx q0[50],q0[19];
-rz(-pi/4) q0[19];
-cx q0[51],q0[22];
-rz(-pi/4) q0[22];
-cx q0[52],q0[25];
-rz(-pi/4) q0[25];
-cx q0[53],q0[28];
-rz(-pi/4) q0[28];
-cx q0[54],q0[31];
-rz(-pi/4) q0[31];
-cx q0[55],q0[34];
-rz(-pi/4) q0[34];
-cx q0[56],q0[37];
-rz(-pi/4) q0[37];
-cx q0[57],q0[40];
-rz(-pi/4) q0[40];
-cx q0[9],q0[11];
-rz(-pi/4) q0[11];
-rz(pi/4) q0[9];
-cx q0[9],q0[11];
-cx q0[11],q0[12];
-rz(-pi/4) q0[12];
-cx q0[9],q0[12];
-rz(pi/4) q0[12];
-cx q0[11],q0[12];
-rz(pi/4) q0[11];
-rz(-pi/4) q0[12];
-cx q0[9],q0[12];
-rz(pi/4) q0[12];
-cx q0[9],q0[11];
-rz(-pi/4) q0[11];
-rz(pi/4) q0[9];
-cx q0[9],q0[11];
-cx q0[10],q0[11];
-cx q0[11],q0[12];
-rz(-pi/4) q0[12];
-cx q0[10],q0[12];
-rz(pi/4) q0[12];
-cx q0[11],q0[12];
-rz(pi/4) q0[11];
-rz(-pi/4) q0[12];
-cx q0[10],q0[12];
-cx q0[10],q0[11];
-rz(3*pi/4) q0[10];
-sx q0[10];
-rz(pi/2) q0[10];
-rz(-pi/4) q0[11];
-rz(pi/4) q0[12];
-cx q0[47],q0[10];
-rz(-pi/4) q0[10];
-cx q0[9],q0[11];
-cx q0[11],q0[12];
-rz(-pi/4) q0[12];
-rz(pi/2) q0[9];
-sx q0[9];
-rz(pi/2) q0[9];
-cx q0[8],q0[9];
-rz(-pi/4) q0[9];
-cx q0[6],q0[9];
-rz(pi/4) q0[9];
-cx q0[8],q0[9];
-rz(pi/4) q0[8];
-rz(-pi/4) q0[9];
-cx q0[6],q0[9];
-cx q0[6],q0[8];
-rz(pi/4) q0[6];
-rz(-pi/4) q0[8];
-cx q0[6],q0[8];
-cx q0[7],q0[8];
-rz(pi/4) q0[9];
-cx q0[8],q0[9];
-rz(-pi/4) q0[9];
-cx q0[7],q0[9];
-rz(pi/4) q0[9];
-cx q0[8],q0[9];
-rz(pi/4) q0[8];
-rz(-pi/4) q0[9];
-cx q0[7],q0[9];
-cx q0[7],q0[8];
-rz(3*pi/4) q0[7];
-sx q0[7];
-rz(pi/2) q0[7];
-cx q0[46],q0[7];
-rz(-pi/4) q0[7];
-rz(-pi/4) q0[8];
-cx q0[6],q0[8];
-rz(pi/2) q0[6];
-sx q0[6];
-rz(pi/2) q0[6];
-cx q0[5],q0[6];
-rz(-pi/4) q0[6];
-cx q0[3],q0[6];
-rz(pi/4) q0[6];
-cx q0[5],q0[6];
-rz(pi/4) q0[5];
-rz(-pi/4) q0[6];
-cx q0[3],q0[6];
-cx q0[3],q0[5];
-rz(pi/4) q0[3];
-rz(-pi/4) q0[5];
-cx q0[3],q0[5];
-cx q0[4],q0[5];
-rz(pi/4) q0[6];
-cx q0[5],q0[6];
-rz(-pi/4) q0[6];
-cx q0[4],q0[6];
-rz(pi/4) q0[6];
-cx q0[5],q0[6];
-rz(pi/4) q0[5];
-rz(-pi/4) q0[6];
-cx q0[4],q0[6];
-cx q0[4],q0[5];
-rz(3*pi/4) q0[4];
-sx q0[4];
-rz(pi/2) q0[4];
-cx q0[45],q0[4];
-rz(-pi/4) q0[4];
-rz(-pi/4) q0[5];
-cx q0[3],q0[5];
-rz(pi/2) q0[3];
-sx q0[3];
-rz(pi/2) q0[3];
-cx q0[2],q0[3];
-rz(-pi/4) q0[3];
-cx q0[0],q0[3];
-rz(pi/4) q0[3];
-cx q0[2],q0[3];
-rz(pi/4) q0[2];
-rz(-pi/4) q0[3];
-cx q0[0],q0[3];
-cx q0[0],q0[2];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[2];
-cx q0[0],q0[2];
-cx q0[1],q0[2];
-rz(pi/4) q0[3];
-cx q0[2],q0[3];
-rz(-pi/4) q0[3];
-cx q0[1],q0[3];
-rz(pi/4) q0[3];
-cx q0[2],q0[3];
-rz(pi/4) q0[2];
-rz(-pi/4) q0[3];
-cx q0[1],q0[3];
-cx q0[1],q0[2];
-rz(pi/4) q0[1];
-rz(-pi/4) q0[2];
-cx q0[0],q0[2];
-rz(pi/4) q0[3];
-cx q0[2],q0[3];
-rz(-pi/4) q0[3];
-cx q0[1],q0[3];
-rz(pi/4) q0[3];
-cx q0[2],q0[3];
-rz(pi/4) q0[2];
-rz(-pi/4) q0[3];
-cx q0[1],q0[3];
-cx q0[1],q0[2];
-rz(pi/4) q0[1];
-rz(-pi/4) q0[2];
-rz(pi/4) q0[3];
-cx q0[2],q0[3];
-rz(-pi/4) q0[3];
-cx q0[0],q0[3];
-rz(pi/4) q0[3];
-cx q0[2],q0[3];
-rz(pi/4) q0[2];
-rz(-pi/4) q0[3];
-cx q0[0],q0[3];
-cx q0[0],q0[2];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[2];
-cx q0[0],q0[2];
-rz(3*pi/4) q0[3];
-sx q0[3];
-rz(pi/2) q0[3];
-rz(pi/4) q0[6];
-cx q0[5],q0[6];
-rz(-pi/4) q0[6];
-cx q0[61],q0[4];
-rz(pi/4) q0[4];
-cx q0[45],q0[4];
-rz(-pi/4) q0[4];
-rz(pi/4) q0[45];
-cx q0[61],q0[4];
-rz(3*pi/4) q0[4];
-sx q0[4];
-rz(pi/2) q0[4];
-cx q0[4],q0[6];
-rz(pi/4) q0[6];
-cx q0[5],q0[6];
-rz(pi/4) q0[5];
-rz(-pi/4) q0[6];
-cx q0[4],q0[6];
-cx q0[4],q0[5];
-rz(pi/4) q0[4];
-rz(-pi/4) q0[5];
-rz(pi/4) q0[6];
-cx q0[5],q0[6];
-rz(-pi/4) q0[6];
-cx q0[3],q0[6];
-rz(pi/4) q0[6];
-cx q0[5],q0[6];
-rz(pi/4) q0[5];
-rz(-pi/4) q0[6];
-cx q0[3],q0[6];
-cx q0[3],q0[5];
-rz(pi/4) q0[3];
-rz(-pi/4) q0[5];
-cx q0[3],q0[5];
-rz(3*pi/4) q0[6];
-sx q0[6];
-rz(pi/2) q0[6];
-cx q0[61],q0[45];
-rz(-pi/4) q0[45];
-rz(pi/4) q0[61];
-cx q0[61],q0[45];
-cx q0[61],q0[7];
-rz(pi/4) q0[7];
-cx q0[46],q0[7];
-rz(pi/4) q0[46];
-rz(-pi/4) q0[7];
-cx q0[61],q0[7];
-cx q0[61],q0[46];
-rz(-pi/4) q0[46];
-rz(pi/4) q0[61];
-cx q0[61],q0[46];
-cx q0[61],q0[10];
-rz(pi/4) q0[10];
-cx q0[47],q0[10];
-rz(-pi/4) q0[10];
-rz(pi/4) q0[47];
-cx q0[61],q0[10];
-rz(pi/4) q0[10];
-cx q0[46],q0[10];
-rz(-pi/4) q0[10];
-cx q0[61],q0[47];
-rz(-pi/4) q0[47];
-rz(pi/4) q0[61];
-cx q0[61],q0[47];
-cx q0[61],q0[13];
-rz(pi/4) q0[13];
-cx q0[48],q0[13];
-rz(-pi/4) q0[13];
-rz(pi/4) q0[48];
-cx q0[61],q0[13];
-rz(pi/4) q0[13];
-cx q0[47],q0[13];
-rz(-pi/4) q0[13];
-cx q0[61],q0[48];
-rz(-pi/4) q0[48];
-rz(pi/4) q0[61];
-cx q0[61],q0[48];
-cx q0[61],q0[16];
-rz(pi/4) q0[16];
-cx q0[49],q0[16];
-rz(-pi/4) q0[16];
-rz(pi/4) q0[49];
-cx q0[61],q0[16];
-rz(pi/4) q0[16];
-cx q0[48],q0[16];
-rz(-pi/4) q0[16];
-cx q0[61],q0[49];
-rz(-pi/4) q0[49];
-rz(pi/4) q0[61];
-cx q0[61],q0[49];
-cx q0[61],q0[19];
-rz(pi/4) q0[19];
-cx q0[50],q0[19];
-rz(-pi/4) q0[19];
-rz(pi/4) q0[50];
-cx q0[61],q0[19];
-rz(pi/4) q0[19];
-cx q0[49],q0[19];
-rz(-pi/4) q0[19];
-cx q0[61],q0[50];
-rz(-pi/4) q0[50];
-rz(pi/4) q0[61];
-cx q0[61],q0[50];
-cx q0[61],q0[22];
-rz(pi/4) q0[22];
-cx q0[51],q0[22];
-rz(-pi/4) q0[22];
-rz(pi/4) q0[51];
-cx q0[61],q0[22];
-rz(pi/4) q0[22];
-cx q0[50],q0[22];
-rz(-pi/4) q0[22];
-cx q0[61],q0[51];
-rz(-pi/4) q0[51];
-rz(pi/4) q0[61];
-cx q0[61],q0[51];
-cx q0[61],q0[25];
-rz(pi/4) q0[25];
-cx q0[52],q0[25];
-rz(-pi/4) q0[25];
-rz(pi/4) q0[52];
-cx q0[61],q0[25];
-rz(pi/4) q0[25];
-cx q0[51],q0[25];
-rz(-pi/4) q0[25];
-cx q0[61],q0[52];
-rz(-pi/4) q0[52];
-rz(pi/4) q0[61];
-cx q0[61],q0[52];
-cx q0[61],q0[28];
-rz(pi/4) q0[28];
-cx q0[53],q0[28];
-rz(-pi/4) q0[28];
-rz(pi/4) q0[53];
-cx q0[61],q0[28];
-rz(pi/4) q0[28];
-cx q0[52],q0[28];
-rz(-pi/4) q0[28];
-cx q0[61],q0[53];
-rz(-pi/4) q0[53];
-rz(pi/4) q0[61];
-cx q0[61],q0[53];
-cx q0[61],q0[31];
-rz(pi/4) q0[31];
-cx q0[54],q0[31];
-rz(-pi/4) q0[31];
-rz(pi/4) q0[54];
-cx q0[61],q0[31];
-rz(pi/4) q0[31];
-cx q0[53],q0[31];
-rz(-pi/4) q0[31];
-cx q0[61],q0[54];
-rz(-pi/4) q0[54];
-rz(pi/4) q0[61];
-cx q0[61],q0[54];
-cx q0[61],q0[34];
-rz(pi/4) q0[34];
-cx q0[55],q0[34];
-rz(-pi/4) q0[34];
-rz(pi/4) q0[55];
-cx q0[61],q0[34];
-rz(pi/4) q0[34];
-cx q0[54],q0[34];
-rz(-pi/4) q0[34];
-cx q0[61],q0[55];
-rz(-pi/4) q0[55];
-rz(pi/4) q0[61];
-cx q0[61],q0[55];
-cx q0[61],q0[37];
-rz(pi/4) q0[37];
-cx q0[56],q0[37];
-rz(-pi/4) q0[37];
-rz(pi/4) q0[56];
-cx q0[61],q0[37];
-rz(pi/4) q0[37];
-cx q0[55],q0[37];
-rz(-pi/4) q0[37];
-cx q0[61],q0[56];
-rz(-pi/4) q0[56];
-rz(pi/4) q0[61];
-cx q0[61],q0[56];
-cx q0[61],q0[40];
-rz(pi/4) q0[40];
-cx q0[57],q0[40];
-rz(-pi/4) q0[40];
-rz(pi/4) q0[57];
-cx q0[61],q0[40];
-rz(pi/4) q0[40];
-cx q0[56],q0[40];
-rz(-pi/4) q0[40];
-cx q0[61],q0[57];
-rz(-pi/4) q0[57];
-rz(pi/4) q0[61];
-cx q0[61],q0[57];
-cx q0[61],q0[43];
-rz(pi/4) q0[43];
-cx q0[58],q0[43];
-rz(-pi/4) q0[43];
-rz(pi/4) q0[58];
-cx q0[61],q0[43];
-rz(pi/4) q0[43];
-cx q0[57],q0[43];
-rz(-pi/4) q0[43];
-cx q0[61],q0[58];
-rz(-pi/4) q0[58];
-rz(pi/4) q0[61];
-cx q0[61],q0[58];
-rz(pi/4) q0[7];
-cx q0[45],q0[7];
-rz(-pi/4) q0[7];
-rz(pi/4) q0[9];
-cx q0[8],q0[9];
-rz(-pi/4) q0[9];
-cx q0[62],q0[7];
-rz(pi/4) q0[7];
-cx q0[45],q0[7];
-rz(pi/4) q0[45];
-rz(-pi/4) q0[7];
-cx q0[62],q0[7];
-cx q0[62],q0[45];
-rz(-pi/4) q0[45];
-rz(pi/4) q0[62];
-cx q0[62],q0[45];
-cx q0[62],q0[10];
-rz(pi/4) q0[10];
-cx q0[46],q0[10];
-rz(-pi/4) q0[10];
-rz(pi/4) q0[46];
-cx q0[62],q0[10];
-rz(3*pi/4) q0[10];
-sx q0[10];
-rz(pi/2) q0[10];
-cx q0[10],q0[12];
-rz(pi/4) q0[12];
-cx q0[11],q0[12];
-rz(pi/4) q0[11];
-rz(-pi/4) q0[12];
-cx q0[10],q0[12];
-cx q0[10],q0[11];
-rz(pi/4) q0[10];
-rz(-pi/4) q0[11];
-rz(pi/4) q0[12];
-cx q0[11],q0[12];
-rz(-pi/4) q0[12];
-cx q0[62],q0[46];
-rz(-pi/4) q0[46];
-rz(pi/4) q0[62];
-cx q0[62],q0[46];
-cx q0[62],q0[13];
-rz(pi/4) q0[13];
-cx q0[47],q0[13];
-rz(-pi/4) q0[13];
-rz(pi/4) q0[47];
-cx q0[62],q0[13];
-rz(3*pi/4) q0[13];
-sx q0[13];
-rz(pi/2) q0[13];
-cx q0[13],q0[15];
-rz(pi/4) q0[15];
-cx q0[14],q0[15];
-rz(pi/4) q0[14];
-rz(-pi/4) q0[15];
-cx q0[13],q0[15];
-cx q0[13],q0[14];
-rz(pi/4) q0[13];
-rz(-pi/4) q0[14];
-rz(pi/4) q0[15];
-cx q0[14],q0[15];
-rz(-pi/4) q0[15];
-cx q0[62],q0[47];
-rz(-pi/4) q0[47];
-rz(pi/4) q0[62];
-cx q0[62],q0[47];
-cx q0[62],q0[16];
-rz(pi/4) q0[16];
-cx q0[48],q0[16];
-rz(-pi/4) q0[16];
-rz(pi/4) q0[48];
-cx q0[62],q0[16];
-rz(3*pi/4) q0[16];
-sx q0[16];
-rz(pi/2) q0[16];
-cx q0[16],q0[18];
-rz(pi/4) q0[18];
-cx q0[17],q0[18];
-rz(pi/4) q0[17];
-rz(-pi/4) q0[18];
-cx q0[16],q0[18];
-cx q0[16],q0[17];
-rz(pi/4) q0[16];
-rz(-pi/4) q0[17];
-rz(pi/4) q0[18];
-cx q0[17],q0[18];
-rz(-pi/4) q0[18];
-cx q0[62],q0[48];
-rz(-pi/4) q0[48];
-rz(pi/4) q0[62];
-cx q0[62],q0[48];
-cx q0[62],q0[19];
-rz(pi/4) q0[19];
-cx q0[49],q0[19];
-rz(-pi/4) q0[19];
-rz(pi/4) q0[49];
-cx q0[62],q0[19];
-rz(3*pi/4) q0[19];
-sx q0[19];
-rz(pi/2) q0[19];
-cx q0[19],q0[21];
-rz(pi/4) q0[21];
-cx q0[20],q0[21];
-rz(pi/4) q0[20];
-rz(-pi/4) q0[21];
-cx q0[19],q0[21];
-cx q0[19],q0[20];
-rz(pi/4) q0[19];
-rz(-pi/4) q0[20];
-rz(pi/4) q0[21];
-cx q0[20],q0[21];
-rz(-pi/4) q0[21];
-cx q0[62],q0[49];
-rz(-pi/4) q0[49];
-rz(pi/4) q0[62];
-cx q0[62],q0[49];
-cx q0[62],q0[22];
-rz(pi/4) q0[22];
-cx q0[50],q0[22];
-rz(-pi/4) q0[22];
-rz(pi/4) q0[50];
-cx q0[62],q0[22];
-rz(3*pi/4) q0[22];
-sx q0[22];
-rz(pi/2) q0[22];
-cx q0[22],q0[24];
-rz(pi/4) q0[24];
-cx q0[23],q0[24];
-rz(pi/4) q0[23];
-rz(-pi/4) q0[24];
-cx q0[22],q0[24];
-cx q0[22],q0[23];
-rz(pi/4) q0[22];
-rz(-pi/4) q0[23];
-rz(pi/4) q0[24];
-cx q0[23],q0[24];
-rz(-pi/4) q0[24];
-cx q0[62],q0[50];
-rz(-pi/4) q0[50];
-rz(pi/4) q0[62];
-cx q0[62],q0[50];
-cx q0[62],q0[25];
-rz(pi/4) q0[25];
-cx q0[51],q0[25];
-rz(-pi/4) q0[25];
-rz(pi/4) q0[51];
-cx q0[62],q0[25];
-rz(3*pi/4) q0[25];
-sx q0[25];
-rz(pi/2) q0[25];
-cx q0[25],q0[27];
-rz(pi/4) q0[27];
-cx q0[26],q0[27];
-rz(pi/4) q0[26];
-rz(-pi/4) q0[27];
-cx q0[25],q0[27];
-cx q0[25],q0[26];
-rz(pi/4) q0[25];
-rz(-pi/4) q0[26];
-rz(pi/4) q0[27];
-cx q0[26],q0[27];
-rz(-pi/4) q0[27];
-cx q0[62],q0[51];
-rz(-pi/4) q0[51];
-rz(pi/4) q0[62];
-cx q0[62],q0[51];
-cx q0[62],q0[28];
-rz(pi/4) q0[28];
-cx q0[52],q0[28];
-rz(-pi/4) q0[28];
-rz(pi/4) q0[52];
-cx q0[62],q0[28];
-rz(3*pi/4) q0[28];
-sx q0[28];
-rz(pi/2) q0[28];
-cx q0[28],q0[30];
-rz(pi/4) q0[30];
-cx q0[29],q0[30];
-rz(pi/4) q0[29];
-rz(-pi/4) q0[30];
-cx q0[28],q0[30];
-cx q0[28],q0[29];
-rz(pi/4) q0[28];
-rz(-pi/4) q0[29];
-rz(pi/4) q0[30];
-cx q0[29],q0[30];
-rz(-pi/4) q0[30];
-cx q0[62],q0[52];
-rz(-pi/4) q0[52];
-rz(pi/4) q0[62];
-cx q0[62],q0[52];
-cx q0[62],q0[31];
-rz(pi/4) q0[31];
-cx q0[53],q0[31];
-rz(-pi/4) q0[31];
-rz(pi/4) q0[53];
-cx q0[62],q0[31];
-rz(3*pi/4) q0[31];
-sx q0[31];
-rz(pi/2) q0[31];
-cx q0[31],q0[33];
-rz(pi/4) q0[33];
-cx q0[32],q0[33];
-rz(pi/4) q0[32];
-rz(-pi/4) q0[33];
-cx q0[31],q0[33];
-cx q0[31],q0[32];
-rz(pi/4) q0[31];
-rz(-pi/4) q0[32];
-rz(pi/4) q0[33];
-cx q0[32],q0[33];
-rz(-pi/4) q0[33];
-cx q0[62],q0[53];
-rz(-pi/4) q0[53];
-rz(pi/4) q0[62];
-cx q0[62],q0[53];
-cx q0[62],q0[34];
-rz(pi/4) q0[34];
-cx q0[54],q0[34];
-rz(-pi/4) q0[34];
-rz(pi/4) q0[54];
-cx q0[62],q0[34];
-rz(3*pi/4) q0[34];
-sx q0[34];
-rz(pi/2) q0[34];
-cx q0[34],q0[36];
-rz(pi/4) q0[36];
-cx q0[35],q0[36];
-rz(pi/4) q0[35];
-rz(-pi/4) q0[36];
-cx q0[34],q0[36];
-cx q0[34],q0[35];
-rz(pi/4) q0[34];
-rz(-pi/4) q0[35];
-rz(pi/4) q0[36];
-cx q0[35],q0[36];
-rz(-pi/4) q0[36];
-cx q0[62],q0[54];
-rz(-pi/4) q0[54];
-rz(pi/4) q0[62];
-cx q0[62],q0[54];
-cx q0[62],q0[37];
-rz(pi/4) q0[37];
-cx q0[55],q0[37];
-rz(-pi/4) q0[37];
-rz(pi/4) q0[55];
-cx q0[62],q0[37];
-rz(3*pi/4) q0[37];
-sx q0[37];
-rz(pi/2) q0[37];
-cx q0[37],q0[39];
-rz(pi/4) q0[39];
-cx q0[38],q0[39];
-rz(pi/4) q0[38];
-rz(-pi/4) q0[39];
-cx q0[37],q0[39];
-cx q0[37],q0[38];
-rz(pi/4) q0[37];
-rz(-pi/4) q0[38];
-rz(pi/4) q0[39];
-cx q0[38],q0[39];
-rz(-pi/4) q0[39];
-cx q0[62],q0[55];
-rz(-pi/4) q0[55];
-rz(pi/4) q0[62];
-cx q0[62],q0[55];
-cx q0[62],q0[40];
-rz(pi/4) q0[40];
-cx q0[56],q0[40];
-rz(-pi/4) q0[40];
-rz(pi/4) q0[56];
-cx q0[62],q0[40];
-rz(3*pi/4) q0[40];
-sx q0[40];
-rz(pi/2) q0[40];
-cx q0[40],q0[42];
-rz(pi/4) q0[42];
-cx q0[41],q0[42];
-rz(pi/4) q0[41];
-rz(-pi/4) q0[42];
-cx q0[40],q0[42];
-cx q0[40],q0[41];
-rz(pi/4) q0[40];
-rz(-pi/4) q0[41];
-rz(pi/4) q0[42];
-cx q0[41],q0[42];
-rz(-pi/4) q0[42];
-cx q0[62],q0[56];
-rz(-pi/4) q0[56];
-rz(pi/4) q0[62];
-cx q0[62],q0[56];
-cx q0[62],q0[43];
-rz(pi/4) q0[43];
-cx q0[57],q0[43];
-rz(-pi/4) q0[43];
-rz(pi/4) q0[57];
-cx q0[62],q0[43];
-rz(3*pi/4) q0[43];
-sx q0[43];
-rz(pi/2) q0[43];
-cx q0[43],q0[44];
-rz(pi/2) q0[43];
-sx q0[43];
-rz(pi/2) q0[43];
-cx q0[62],q0[57];
-rz(-pi/4) q0[57];
-rz(pi/4) q0[62];
-cx q0[62],q0[57];
-cx q0[57],q0[43];
-rz(-pi/4) q0[43];
-rz(3*pi/4) q0[7];
-sx q0[7];
-rz(pi/2) q0[7];
-cx q0[7],q0[9];
-rz(pi/4) q0[9];
-cx q0[8],q0[9];
-rz(pi/4) q0[8];
-rz(-pi/4) q0[9];
-cx q0[7],q0[9];
-cx q0[7],q0[8];
-rz(pi/4) q0[7];
-rz(-pi/4) q0[8];
-rz(pi/4) q0[9];
-cx q0[8],q0[9];
-rz(-pi/4) q0[9];
-cx q0[6],q0[9];
-rz(pi/4) q0[9];
-cx q0[8],q0[9];
-rz(pi/4) q0[8];
-rz(-pi/4) q0[9];
-cx q0[6],q0[9];
-cx q0[6],q0[8];
-rz(pi/4) q0[6];
-rz(-pi/4) q0[8];
-cx q0[6],q0[8];
-rz(3*pi/4) q0[9];
-sx q0[9];
-rz(pi/2) q0[9];
-cx q0[9],q0[12];
-rz(pi/4) q0[12];
-cx q0[11],q0[12];
-rz(pi/4) q0[11];
-rz(-pi/4) q0[12];
-cx q0[9],q0[12];
-rz(3*pi/4) q0[12];
-sx q0[12];
-rz(pi/2) q0[12];
-cx q0[12],q0[15];
-rz(pi/4) q0[15];
-cx q0[14],q0[15];
-rz(pi/4) q0[14];
-rz(-pi/4) q0[15];
-cx q0[12],q0[15];
-cx q0[12],q0[14];
-rz(pi/4) q0[12];
-rz(-pi/4) q0[14];
-cx q0[12],q0[14];
-rz(3*pi/4) q0[15];
-sx q0[15];
-rz(pi/2) q0[15];
-cx q0[15],q0[18];
-rz(pi/4) q0[18];
-cx q0[17],q0[18];
-rz(pi/4) q0[17];
-rz(-pi/4) q0[18];
-cx q0[15],q0[18];
-cx q0[15],q0[17];
-rz(pi/4) q0[15];
-rz(-pi/4) q0[17];
-cx q0[15],q0[17];
-rz(3*pi/4) q0[18];
-sx q0[18];
-rz(pi/2) q0[18];
-cx q0[18],q0[21];
-rz(pi/4) q0[21];
-cx q0[20],q0[21];
-rz(pi/4) q0[20];
-rz(-pi/4) q0[21];
-cx q0[18],q0[21];
-cx q0[18],q0[20];
-rz(pi/4) q0[18];
-rz(-pi/4) q0[20];
-cx q0[18],q0[20];
-rz(3*pi/4) q0[21];
-sx q0[21];
-rz(pi/2) q0[21];
-cx q0[21],q0[24];
-rz(pi/4) q0[24];
-cx q0[23],q0[24];
-rz(pi/4) q0[23];
-rz(-pi/4) q0[24];
-cx q0[21],q0[24];
-cx q0[21],q0[23];
-rz(pi/4) q0[21];
-rz(-pi/4) q0[23];
-cx q0[21],q0[23];
-rz(3*pi/4) q0[24];
-sx q0[24];
-rz(pi/2) q0[24];
-cx q0[24],q0[27];
-rz(pi/4) q0[27];
-cx q0[26],q0[27];
-rz(pi/4) q0[26];
-rz(-pi/4) q0[27];
-cx q0[24],q0[27];
-cx q0[24],q0[26];
-rz(pi/4) q0[24];
-rz(-pi/4) q0[26];
-cx q0[24],q0[26];
-rz(3*pi/4) q0[27];
-sx q0[27];
-rz(pi/2) q0[27];
-cx q0[27],q0[30];
-rz(pi/4) q0[30];
-cx q0[29],q0[30];
-rz(pi/4) q0[29];
-rz(-pi/4) q0[30];
-cx q0[27],q0[30];
-cx q0[27],q0[29];
-rz(pi/4) q0[27];
-rz(-pi/4) q0[29];
-cx q0[27],q0[29];
-rz(3*pi/4) q0[30];
-sx q0[30];
-rz(pi/2) q0[30];
-cx q0[30],q0[33];
-rz(pi/4) q0[33];
-cx q0[32],q0[33];
-rz(pi/4) q0[32];
-rz(-pi/4) q0[33];
-cx q0[30],q0[33];
-cx q0[30],q0[32];
-rz(pi/4) q0[30];
-rz(-pi/4) q0[32];
-cx q0[30],q0[32];
-rz(3*pi/4) q0[33];
-sx q0[33];
-rz(pi/2) q0[33];
-cx q0[33],q0[36];
-rz(pi/4) q0[36];
-cx q0[35],q0[36];
-rz(pi/4) q0[35];
-rz(-pi/4) q0[36];
-cx q0[33],q0[36];
-cx q0[33],q0[35];
-rz(pi/4) q0[33];
-rz(-pi/4) q0[35];
-cx q0[33],q0[35];
-rz(3*pi/4) q0[36];
-sx q0[36];
-rz(pi/2) q0[36];
-cx q0[36],q0[39];
-rz(pi/4) q0[39];
-cx q0[38],q0[39];
-rz(pi/4) q0[38];
-rz(-pi/4) q0[39];
-cx q0[36],q0[39];
-cx q0[36],q0[38];
-rz(pi/4) q0[36];
-rz(-pi/4) q0[38];
-cx q0[36],q0[38];
-rz(3*pi/4) q0[39];
-sx q0[39];
-rz(pi/2) q0[39];
-cx q0[39],q0[42];
-rz(pi/4) q0[42];
-cx q0[41],q0[42];
-rz(pi/4) q0[41];
-rz(-pi/4) q0[42];
-cx q0[39],q0[42];
-cx q0[39],q0[41];
-rz(pi/4) q0[39];
-rz(-pi/4) q0[41];
-cx q0[39],q0[41];
-rz(3*pi/4) q0[42];
-sx q0[42];
-rz(pi/2) q0[42];
-cx q0[42],q0[44];
-rz(pi/2) q0[42];
-sx q0[42];
-rz(pi/2) q0[42];
-cx q0[41],q0[42];
-rz(-pi/4) q0[42];
-cx q0[39],q0[42];
-rz(pi/4) q0[42];
-cx q0[41],q0[42];
-rz(pi/4) q0[41];
-rz(-pi/4) q0[42];
-cx q0[39],q0[42];
-cx q0[39],q0[41];
-rz(pi/4) q0[39];
-rz(-pi/4) q0[41];
-cx q0[39],q0[41];
-cx q0[40],q0[41];
-rz(pi/4) q0[42];
-cx q0[41],q0[42];
-rz(-pi/4) q0[42];
-cx q0[40],q0[42];
-rz(pi/4) q0[42];
-cx q0[41],q0[42];
-rz(pi/4) q0[41];
-rz(-pi/4) q0[42];
-cx q0[40],q0[42];
-cx q0[40],q0[41];
-rz(3*pi/4) q0[40];
-sx q0[40];
-rz(pi/2) q0[40];
-rz(-pi/4) q0[41];
-cx q0[39],q0[41];
-rz(pi/2) q0[39];
-sx q0[39];
-rz(pi/2) q0[39];
-cx q0[38],q0[39];
-rz(-pi/4) q0[39];
-cx q0[36],q0[39];
-rz(pi/4) q0[39];
-cx q0[38],q0[39];
-rz(pi/4) q0[38];
-rz(-pi/4) q0[39];
-cx q0[36],q0[39];
-cx q0[36],q0[38];
-rz(pi/4) q0[36];
-rz(-pi/4) q0[38];
-cx q0[36],q0[38];
-cx q0[37],q0[38];
-rz(pi/4) q0[39];
-cx q0[38],q0[39];
-rz(-pi/4) q0[39];
-cx q0[37],q0[39];
-rz(pi/4) q0[39];
-cx q0[38],q0[39];
-rz(pi/4) q0[38];
-rz(-pi/4) q0[39];
-cx q0[37],q0[39];
-cx q0[37],q0[38];
-rz(3*pi/4) q0[37];
-sx q0[37];
-rz(pi/2) q0[37];
-rz(-pi/4) q0[38];
-cx q0[36],q0[38];
-rz(pi/2) q0[36];
-sx q0[36];
-rz(pi/2) q0[36];
-cx q0[35],q0[36];
-rz(-pi/4) q0[36];
-cx q0[33],q0[36];
-rz(pi/4) q0[36];
-cx q0[35],q0[36];
-rz(pi/4) q0[35];
-rz(-pi/4) q0[36];
-cx q0[33],q0[36];
-cx q0[33],q0[35];
-rz(pi/4) q0[33];
-rz(-pi/4) q0[35];
-cx q0[33],q0[35];
-cx q0[34],q0[35];
-rz(pi/4) q0[36];
-cx q0[35],q0[36];
-rz(-pi/4) q0[36];
-cx q0[34],q0[36];
-rz(pi/4) q0[36];
-cx q0[35],q0[36];
-rz(pi/4) q0[35];
-rz(-pi/4) q0[36];
-cx q0[34],q0[36];
-cx q0[34],q0[35];
-rz(3*pi/4) q0[34];
-sx q0[34];
-rz(pi/2) q0[34];
-rz(-pi/4) q0[35];
-cx q0[33],q0[35];
-rz(pi/2) q0[33];
-sx q0[33];
-rz(pi/2) q0[33];
-cx q0[32],q0[33];
-rz(-pi/4) q0[33];
-cx q0[30],q0[33];
-rz(pi/4) q0[33];
-cx q0[32],q0[33];
-rz(pi/4) q0[32];
-rz(-pi/4) q0[33];
-cx q0[30],q0[33];
-cx q0[30],q0[32];
-rz(pi/4) q0[30];
-rz(-pi/4) q0[32];
-cx q0[30],q0[32];
-cx q0[31],q0[32];
-rz(pi/4) q0[33];
-cx q0[32],q0[33];
-rz(-pi/4) q0[33];
-cx q0[31],q0[33];
-rz(pi/4) q0[33];
-cx q0[32],q0[33];
-rz(pi/4) q0[32];
-rz(-pi/4) q0[33];
-cx q0[31],q0[33];
-cx q0[31],q0[32];
-rz(3*pi/4) q0[31];
-sx q0[31];
-rz(pi/2) q0[31];
-rz(-pi/4) q0[32];
-cx q0[30],q0[32];
-rz(pi/2) q0[30];
-sx q0[30];
-rz(pi/2) q0[30];
-cx q0[29],q0[30];
-rz(-pi/4) q0[30];
-cx q0[27],q0[30];
-rz(pi/4) q0[30];
-cx q0[29],q0[30];
-rz(pi/4) q0[29];
-rz(-pi/4) q0[30];
-cx q0[27],q0[30];
-cx q0[27],q0[29];
-rz(pi/4) q0[27];
-rz(-pi/4) q0[29];
-cx q0[27],q0[29];
-cx q0[28],q0[29];
-rz(pi/4) q0[30];
-cx q0[29],q0[30];
-rz(-pi/4) q0[30];
-cx q0[28],q0[30];
-rz(pi/4) q0[30];
-cx q0[29],q0[30];
-rz(pi/4) q0[29];
-rz(-pi/4) q0[30];
-cx q0[28],q0[30];
-cx q0[28],q0[29];
-rz(3*pi/4) q0[28];
-sx q0[28];
-rz(pi/2) q0[28];
-rz(-pi/4) q0[29];
-cx q0[27],q0[29];
-rz(pi/2) q0[27];
-sx q0[27];
-rz(pi/2) q0[27];
-cx q0[26],q0[27];
-rz(-pi/4) q0[27];
-cx q0[24],q0[27];
-rz(pi/4) q0[27];
-cx q0[26],q0[27];
-rz(pi/4) q0[26];
-rz(-pi/4) q0[27];
-cx q0[24],q0[27];
-cx q0[24],q0[26];
-rz(pi/4) q0[24];
-rz(-pi/4) q0[26];
-cx q0[24],q0[26];
-cx q0[25],q0[26];
-rz(pi/4) q0[27];
-cx q0[26],q0[27];
-rz(-pi/4) q0[27];
-cx q0[25],q0[27];
-rz(pi/4) q0[27];
-cx q0[26],q0[27];
-rz(pi/4) q0[26];
-rz(-pi/4) q0[27];
-cx q0[25],q0[27];
-cx q0[25],q0[26];
-rz(3*pi/4) q0[25];
-sx q0[25];
-rz(pi/2) q0[25];
-rz(-pi/4) q0[26];
-cx q0[24],q0[26];
-rz(pi/2) q0[24];
-sx q0[24];
-rz(pi/2) q0[24];
-cx q0[23],q0[24];
-rz(-pi/4) q0[24];
-cx q0[21],q0[24];
-rz(pi/4) q0[24];
-cx q0[23],q0[24];
-rz(pi/4) q0[23];
-rz(-pi/4) q0[24];
-cx q0[21],q0[24];
-cx q0[21],q0[23];
-rz(pi/4) q0[21];
-rz(-pi/4) q0[23];
-cx q0[21],q0[23];
-cx q0[22],q0[23];
-rz(pi/4) q0[24];
-cx q0[23],q0[24];
-rz(-pi/4) q0[24];
-cx q0[22],q0[24];
-rz(pi/4) q0[24];
-cx q0[23],q0[24];
-rz(pi/4) q0[23];
-rz(-pi/4) q0[24];
-cx q0[22],q0[24];
-cx q0[22],q0[23];
-rz(3*pi/4) q0[22];
-sx q0[22];
-rz(pi/2) q0[22];
-rz(-pi/4) q0[23];
-cx q0[21],q0[23];
-rz(pi/2) q0[21];
-sx q0[21];
-rz(pi/2) q0[21];
-cx q0[20],q0[21];
-rz(-pi/4) q0[21];
-cx q0[18],q0[21];
-rz(pi/4) q0[21];
-cx q0[20],q0[21];
-rz(pi/4) q0[20];
-rz(-pi/4) q0[21];
-cx q0[18],q0[21];
-cx q0[18],q0[20];
-rz(pi/4) q0[18];
-rz(-pi/4) q0[20];
-cx q0[18],q0[20];
-cx q0[19],q0[20];
-rz(pi/4) q0[21];
-cx q0[20],q0[21];
-rz(-pi/4) q0[21];
-cx q0[19],q0[21];
-rz(pi/4) q0[21];
-cx q0[20],q0[21];
-rz(pi/4) q0[20];
-rz(-pi/4) q0[21];
-cx q0[19],q0[21];
-cx q0[19],q0[20];
-rz(3*pi/4) q0[19];
-sx q0[19];
-rz(pi/2) q0[19];
-rz(-pi/4) q0[20];
-cx q0[18],q0[20];
-rz(pi/2) q0[18];
-sx q0[18];
-rz(pi/2) q0[18];
-cx q0[17],q0[18];
-rz(-pi/4) q0[18];
-cx q0[15],q0[18];
-rz(pi/4) q0[18];
-cx q0[17],q0[18];
-rz(pi/4) q0[17];
-rz(-pi/4) q0[18];
-cx q0[15],q0[18];
-cx q0[15],q0[17];
-rz(pi/4) q0[15];
-rz(-pi/4) q0[17];
-cx q0[15],q0[17];
-cx q0[16],q0[17];
-rz(pi/4) q0[18];
-cx q0[17],q0[18];
-rz(-pi/4) q0[18];
-cx q0[16],q0[18];
-rz(pi/4) q0[18];
-cx q0[17],q0[18];
-rz(pi/4) q0[17];
-rz(-pi/4) q0[18];
-cx q0[16],q0[18];
-cx q0[16],q0[17];
-rz(3*pi/4) q0[16];
-sx q0[16];
-rz(pi/2) q0[16];
-rz(-pi/4) q0[17];
-cx q0[15],q0[17];
-rz(pi/2) q0[15];
-sx q0[15];
-rz(pi/2) q0[15];
-cx q0[14],q0[15];
-rz(-pi/4) q0[15];
-cx q0[12],q0[15];
-rz(pi/4) q0[15];
-cx q0[14],q0[15];
-rz(pi/4) q0[14];
-rz(-pi/4) q0[15];
-cx q0[12],q0[15];
-cx q0[12],q0[14];
-rz(pi/4) q0[12];
-rz(-pi/4) q0[14];
-cx q0[12],q0[14];
-cx q0[13],q0[14];
-rz(pi/4) q0[15];
-cx q0[14],q0[15];
-rz(-pi/4) q0[15];
-cx q0[13],q0[15];
-rz(pi/4) q0[15];
-cx q0[14],q0[15];
-rz(pi/4) q0[14];
-rz(-pi/4) q0[15];
-cx q0[13],q0[15];
-cx q0[13],q0[14];
-rz(3*pi/4) q0[13];
-sx q0[13];
-rz(pi/2) q0[13];
-rz(-pi/4) q0[14];
-cx q0[12],q0[14];
-rz(pi/2) q0[12];
-sx q0[12];
-rz(pi/2) q0[12];
-rz(pi/4) q0[15];
-cx q0[14],q0[15];
-rz(-pi/4) q0[15];
-rz(pi/4) q0[18];
-cx q0[17],q0[18];
-rz(-pi/4) q0[18];
-rz(pi/4) q0[21];
-cx q0[20],q0[21];
-rz(-pi/4) q0[21];
-rz(pi/4) q0[24];
-cx q0[23],q0[24];
-rz(-pi/4) q0[24];
-rz(pi/4) q0[27];
-cx q0[26],q0[27];
-rz(-pi/4) q0[27];
-rz(pi/4) q0[30];
-cx q0[29],q0[30];
-rz(-pi/4) q0[30];
-rz(pi/4) q0[33];
-cx q0[32],q0[33];
-rz(-pi/4) q0[33];
-rz(pi/4) q0[36];
-cx q0[35],q0[36];
-rz(-pi/4) q0[36];
-rz(pi/4) q0[39];
-cx q0[38],q0[39];
-rz(-pi/4) q0[39];
-rz(pi/4) q0[42];
-cx q0[41],q0[42];
-rz(-pi/4) q0[42];
-cx q0[47],q0[13];
-rz(-pi/4) q0[13];
-cx q0[48],q0[16];
-rz(-pi/4) q0[16];
-cx q0[49],q0[19];
-rz(-pi/4) q0[19];
-cx q0[50],q0[22];
-rz(-pi/4) q0[22];
-cx q0[51],q0[25];
-rz(-pi/4) q0[25];
-cx q0[52],q0[28];
-rz(-pi/4) q0[28];
-cx q0[53],q0[31];
-rz(-pi/4) q0[31];
-cx q0[54],q0[34];
-rz(-pi/4) q0[34];
-cx q0[55],q0[37];
-rz(-pi/4) q0[37];
-cx q0[56],q0[40];
-rz(-pi/4) q0[40];
-cx q0[9],q0[11];
-rz(-pi/4) q0[11];
-rz(pi/4) q0[9];
-cx q0[9],q0[11];
-cx q0[11],q0[12];
-rz(-pi/4) q0[12];
-cx q0[9],q0[12];
-rz(pi/4) q0[12];
-cx q0[11],q0[12];
-rz(pi/4) q0[11];
-rz(-pi/4) q0[12];
-cx q0[9],q0[12];
-rz(pi/4) q0[12];
-cx q0[9],q0[11];
-rz(-pi/4) q0[11];
-rz(pi/4) q0[9];
-cx q0[9],q0[11];
-cx q0[10],q0[11];
-cx q0[11],q0[12];
-rz(-pi/4) q0[12];
-cx q0[10],q0[12];
-rz(pi/4) q0[12];
-cx q0[11],q0[12];
-rz(pi/4) q0[11];
-rz(-pi/4) q0[12];
-cx q0[10],q0[12];
-cx q0[10],q0[11];
-rz(3*pi/4) q0[10];
-sx q0[10];
-rz(pi/2) q0[10];
-rz(-pi/4) q0[11];
-rz(pi/4) q0[12];
-cx q0[46],q0[10];
-rz(-pi/4) q0[10];
-cx q0[9],q0[11];
-cx q0[11],q0[12];
-rz(-pi/4) q0[12];
-rz(pi/2) q0[9];
-sx q0[9];
-rz(pi/2) q0[9];
-cx q0[8],q0[9];
-rz(-pi/4) q0[9];
-cx q0[6],q0[9];
-rz(pi/4) q0[9];
-cx q0[8],q0[9];
-rz(pi/4) q0[8];
-rz(-pi/4) q0[9];
-cx q0[6],q0[9];
-cx q0[6],q0[8];
-rz(pi/4) q0[6];
-rz(-pi/4) q0[8];
-cx q0[6],q0[8];
-cx q0[7],q0[8];
-rz(pi/4) q0[9];
-cx q0[8],q0[9];
-rz(-pi/4) q0[9];
-cx q0[7],q0[9];
-rz(pi/4) q0[9];
-cx q0[8],q0[9];
-rz(pi/4) q0[8];
-rz(-pi/4) q0[9];
-cx q0[7],q0[9];
-cx q0[7],q0[8];
-rz(3*pi/4) q0[7];
-sx q0[7];
-rz(pi/2) q0[7];
-cx q0[45],q0[7];
-rz(-pi/4) q0[7];
-cx q0[62],q0[7];
-rz(pi/4) q0[7];
-cx q0[45],q0[7];
-rz(pi/4) q0[45];
-rz(-pi/4) q0[7];
-cx q0[62],q0[7];
-cx q0[62],q0[45];
-rz(-pi/4) q0[45];
-rz(pi/4) q0[62];
-cx q0[62],q0[45];
-cx q0[62],q0[10];
-rz(pi/4) q0[10];
-cx q0[46],q0[10];
-rz(-pi/4) q0[10];
-rz(pi/4) q0[46];
-cx q0[62],q0[10];
-rz(pi/4) q0[10];
-cx q0[45],q0[10];
-rz(-pi/4) q0[10];
-cx q0[62],q0[46];
-rz(-pi/4) q0[46];
-rz(pi/4) q0[62];
-cx q0[62],q0[46];
-cx q0[62],q0[13];
-rz(pi/4) q0[13];
-cx q0[47],q0[13];
-rz(-pi/4) q0[13];
-rz(pi/4) q0[47];
-cx q0[62],q0[13];
-rz(pi/4) q0[13];
-cx q0[46],q0[13];
-rz(-pi/4) q0[13];
-cx q0[62],q0[47];
-rz(-pi/4) q0[47];
-rz(pi/4) q0[62];
-cx q0[62],q0[47];
-cx q0[62],q0[16];
-rz(pi/4) q0[16];
-cx q0[48],q0[16];
-rz(-pi/4) q0[16];
-rz(pi/4) q0[48];
-cx q0[62],q0[16];
-rz(pi/4) q0[16];
-cx q0[47],q0[16];
-rz(-pi/4) q0[16];
-cx q0[62],q0[48];
-rz(-pi/4) q0[48];
-rz(pi/4) q0[62];
-cx q0[62],q0[48];
-cx q0[62],q0[19];
-rz(pi/4) q0[19];
-cx q0[49],q0[19];
-rz(-pi/4) q0[19];
-rz(pi/4) q0[49];
-cx q0[62],q0[19];
-rz(pi/4) q0[19];
-cx q0[48],q0[19];
-rz(-pi/4) q0[19];
-cx q0[62],q0[49];
-rz(-pi/4) q0[49];
-rz(pi/4) q0[62];
-cx q0[62],q0[49];
-cx q0[62],q0[22];
-rz(pi/4) q0[22];
-cx q0[50],q0[22];
-rz(-pi/4) q0[22];
-rz(pi/4) q0[50];
-cx q0[62],q0[22];
-rz(pi/4) q0[22];
-cx q0[49],q0[22];
-rz(-pi/4) q0[22];
-cx q0[62],q0[50];
-rz(-pi/4) q0[50];
-rz(pi/4) q0[62];
-cx q0[62],q0[50];
-cx q0[62],q0[25];
-rz(pi/4) q0[25];
-cx q0[51],q0[25];
-rz(-pi/4) q0[25];
-rz(pi/4) q0[51];
-cx q0[62],q0[25];
-rz(pi/4) q0[25];
-cx q0[50],q0[25];
-rz(-pi/4) q0[25];
-cx q0[62],q0[51];
-rz(-pi/4) q0[51];
-rz(pi/4) q0[62];
-cx q0[62],q0[51];
-cx q0[62],q0[28];
-rz(pi/4) q0[28];
-cx q0[52],q0[28];
-rz(-pi/4) q0[28];
-rz(pi/4) q0[52];
-cx q0[62],q0[28];
-rz(pi/4) q0[28];
-cx q0[51],q0[28];
-rz(-pi/4) q0[28];
-cx q0[62],q0[52];
-rz(-pi/4) q0[52];
-rz(pi/4) q0[62];
-cx q0[62],q0[52];
-cx q0[62],q0[31];
-rz(pi/4) q0[31];
-cx q0[53],q0[31];
-rz(-pi/4) q0[31];
-rz(pi/4) q0[53];
-cx q0[62],q0[31];
-rz(pi/4) q0[31];
-cx q0[52],q0[31];
-rz(-pi/4) q0[31];
-cx q0[62],q0[53];
-rz(-pi/4) q0[53];
-rz(pi/4) q0[62];
-cx q0[62],q0[53];
-cx q0[62],q0[34];
-rz(pi/4) q0[34];
-cx q0[54],q0[34];
-rz(-pi/4) q0[34];
-rz(pi/4) q0[54];
-cx q0[62],q0[34];
-rz(pi/4) q0[34];
-cx q0[53],q0[34];
-rz(-pi/4) q0[34];
-cx q0[62],q0[54];
-rz(-pi/4) q0[54];
-rz(pi/4) q0[62];
-cx q0[62],q0[54];
-cx q0[62],q0[37];
-rz(pi/4) q0[37];
-cx q0[55],q0[37];
-rz(-pi/4) q0[37];
-rz(pi/4) q0[55];
-cx q0[62],q0[37];
-rz(pi/4) q0[37];
-cx q0[54],q0[37];
-rz(-pi/4) q0[37];
-cx q0[62],q0[55];
-rz(-pi/4) q0[55];
-rz(pi/4) q0[62];
-cx q0[62],q0[55];
-cx q0[62],q0[40];
-rz(pi/4) q0[40];
-cx q0[56],q0[40];
-rz(-pi/4) q0[40];
-rz(pi/4) q0[56];
-cx q0[62],q0[40];
-rz(pi/4) q0[40];
-cx q0[55],q0[40];
-rz(-pi/4) q0[40];
-cx q0[62],q0[56];
-rz(-pi/4) q0[56];
-rz(pi/4) q0[62];
-cx q0[62],q0[56];
-cx q0[62],q0[43];
-rz(pi/4) q0[43];
-cx q0[57],q0[43];
-rz(-pi/4) q0[43];
-rz(pi/4) q0[57];
-cx q0[62],q0[43];
-rz(pi/4) q0[43];
-cx q0[56],q0[43];
-rz(-pi/4) q0[43];
-cx q0[62],q0[57];
-rz(-pi/4) q0[57];
-rz(pi/4) q0[62];
-cx q0[62],q0[57];
-rz(3*pi/4) q0[7];
-sx q0[7];
-rz(pi/2) q0[7];
-rz(-pi/4) q0[8];
-cx q0[6],q0[8];
-rz(pi/2) q0[6];
-sx q0[6];
-rz(pi/2) q0[6];
-cx q0[5],q0[6];
-rz(-pi/4) q0[6];
-cx q0[3],q0[6];
-rz(pi/4) q0[6];
-cx q0[5],q0[6];
-rz(pi/4) q0[5];
-rz(-pi/4) q0[6];
-cx q0[3],q0[6];
-cx q0[3],q0[5];
-rz(pi/4) q0[3];
-rz(-pi/4) q0[5];
-cx q0[3],q0[5];
-cx q0[4],q0[5];
-rz(pi/4) q0[6];
-cx q0[5],q0[6];
-rz(-pi/4) q0[6];
-cx q0[4],q0[6];
-rz(pi/4) q0[6];
-cx q0[5],q0[6];
-rz(pi/4) q0[5];
-rz(-pi/4) q0[6];
-cx q0[4],q0[6];
-cx q0[4],q0[5];
-rz(pi/4) q0[4];
-rz(-pi/4) q0[5];
-cx q0[3],q0[5];
-rz(pi/2) q0[3];
-sx q0[3];
-rz(pi/2) q0[3];
-cx q0[2],q0[3];
-rz(-pi/4) q0[3];
-cx q0[0],q0[3];
-rz(pi/4) q0[3];
-cx q0[2],q0[3];
-rz(pi/4) q0[2];
-rz(-pi/4) q0[3];
-cx q0[0],q0[3];
-cx q0[0],q0[2];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[2];
-cx q0[0],q0[2];
-cx q0[1],q0[2];
-rz(pi/4) q0[3];
-cx q0[2],q0[3];
-rz(-pi/4) q0[3];
-cx q0[1],q0[3];
-rz(pi/4) q0[3];
-cx q0[2],q0[3];
-rz(pi/4) q0[2];
-rz(-pi/4) q0[3];
-cx q0[1],q0[3];
-cx q0[1],q0[2];
-rz(pi/4) q0[1];
-rz(-pi/4) q0[2];
-cx q0[0],q0[2];
-rz(pi/4) q0[3];
-cx q0[2],q0[3];
-rz(-pi/4) q0[3];
-cx q0[1],q0[3];
-rz(pi/4) q0[3];
-cx q0[2],q0[3];
-rz(pi/4) q0[2];
-rz(-pi/4) q0[3];
-cx q0[1],q0[3];
-cx q0[1],q0[2];
-rz(pi/4) q0[1];
-rz(-pi/4) q0[2];
-rz(pi/4) q0[3];
-cx q0[2],q0[3];
-rz(-pi/4) q0[3];
-cx q0[0],q0[3];
-rz(pi/4) q0[3];
-cx q0[2],q0[3];
-rz(pi/4) q0[2];
-rz(-pi/4) q0[3];
-cx q0[0],q0[3];
-cx q0[0],q0[2];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[2];
-cx q0[0],q0[2];
-rz(3*pi/4) q0[3];
-sx q0[3];
-rz(pi/2) q0[3];
-rz(pi/4) q0[6];
-cx q0[5],q0[6];
-rz(-pi/4) q0[6];
-cx q0[4],q0[6];
-rz(pi/4) q0[6];
-cx q0[5],q0[6];
-rz(pi/4) q0[5];
-rz(-pi/4) q0[6];
-cx q0[4],q0[6];
-cx q0[4],q0[5];
-rz(pi/4) q0[4];
-rz(-pi/4) q0[5];
-rz(pi/4) q0[6];
-cx q0[5],q0[6];
-rz(-pi/4) q0[6];
-cx q0[3],q0[6];
-rz(pi/4) q0[6];
-cx q0[5],q0[6];
-rz(pi/4) q0[5];
-rz(-pi/4) q0[6];
-cx q0[3],q0[6];
-cx q0[3],q0[5];
-rz(pi/4) q0[3];
-rz(-pi/4) q0[5];
-cx q0[3],q0[5];
-rz(3*pi/4) q0[6];
-sx q0[6];
-rz(pi/2) q0[6];
-rz(pi/4) q0[9];
-cx q0[8],q0[9];
-rz(-pi/4) q0[9];
-cx q0[7],q0[9];
-rz(pi/4) q0[9];
-cx q0[8],q0[9];
-rz(pi/4) q0[8];
-rz(-pi/4) q0[9];
-cx q0[7],q0[9];
-cx q0[7],q0[8];
-rz(pi/4) q0[7];
-rz(-pi/4) q0[8];
-rz(pi/4) q0[9];
-cx q0[8],q0[9];
-rz(-pi/4) q0[9];
-cx q0[6],q0[9];
-rz(pi/4) q0[9];
-cx q0[8],q0[9];
-rz(pi/4) q0[8];
-rz(-pi/4) q0[9];
-cx q0[6],q0[9];
-cx q0[6],q0[8];
-rz(pi/4) q0[6];
-rz(-pi/4) q0[8];
-cx q0[6],q0[8];
-rz(3*pi/4) q0[9];
-sx q0[9];
-rz(pi/2) q0[9];
-cx q0[63],q0[10];
-rz(pi/4) q0[10];
-cx q0[45],q0[10];
-rz(-pi/4) q0[10];
-rz(pi/4) q0[45];
-cx q0[63],q0[10];
-rz(3*pi/4) q0[10];
-sx q0[10];
-rz(pi/2) q0[10];
-cx q0[10],q0[12];
-rz(pi/4) q0[12];
-cx q0[11],q0[12];
-rz(pi/4) q0[11];
-rz(-pi/4) q0[12];
-cx q0[10],q0[12];
-cx q0[10],q0[11];
-rz(pi/4) q0[10];
-rz(-pi/4) q0[11];
-rz(pi/4) q0[12];
-cx q0[11],q0[12];
-rz(-pi/4) q0[12];
-cx q0[63],q0[45];
-rz(-pi/4) q0[45];
-rz(pi/4) q0[63];
-cx q0[63],q0[45];
-cx q0[63],q0[13];
-rz(pi/4) q0[13];
-cx q0[46],q0[13];
-rz(-pi/4) q0[13];
-rz(pi/4) q0[46];
-cx q0[63],q0[13];
-rz(3*pi/4) q0[13];
-sx q0[13];
-rz(pi/2) q0[13];
-cx q0[13],q0[15];
-rz(pi/4) q0[15];
-cx q0[14],q0[15];
-rz(pi/4) q0[14];
-rz(-pi/4) q0[15];
-cx q0[13],q0[15];
-cx q0[13],q0[14];
-rz(pi/4) q0[13];
-rz(-pi/4) q0[14];
-rz(pi/4) q0[15];
-cx q0[14],q0[15];
-rz(-pi/4) q0[15];
-cx q0[63],q0[46];
-rz(-pi/4) q0[46];
-rz(pi/4) q0[63];
-cx q0[63],q0[46];
-cx q0[63],q0[16];
-rz(pi/4) q0[16];
-cx q0[47],q0[16];
-rz(-pi/4) q0[16];
-rz(pi/4) q0[47];
-cx q0[63],q0[16];
-rz(3*pi/4) q0[16];
-sx q0[16];
-rz(pi/2) q0[16];
-cx q0[16],q0[18];
-rz(pi/4) q0[18];
-cx q0[17],q0[18];
-rz(pi/4) q0[17];
-rz(-pi/4) q0[18];
-cx q0[16],q0[18];
-cx q0[16],q0[17];
-rz(pi/4) q0[16];
-rz(-pi/4) q0[17];
-rz(pi/4) q0[18];
-cx q0[17],q0[18];
-rz(-pi/4) q0[18];
-cx q0[63],q0[47];
-rz(-pi/4) q0[47];
-rz(pi/4) q0[63];
-cx q0[63],q0[47];
-cx q0[63],q0[19];
-rz(pi/4) q0[19];
-cx q0[48],q0[19];
-rz(-pi/4) q0[19];
-rz(pi/4) q0[48];
-cx q0[63],q0[19];
-rz(3*pi/4) q0[19];
-sx q0[19];
-rz(pi/2) q0[19];
-cx q0[19],q0[21];
-rz(pi/4) q0[21];
-cx q0[20],q0[21];
-rz(pi/4) q0[20];
-rz(-pi/4) q0[21];
-cx q0[19],q0[21];
-cx q0[19],q0[20];
-rz(pi/4) q0[19];
-rz(-pi/4) q0[20];
-rz(pi/4) q0[21];
-cx q0[20],q0[21];
-rz(-pi/4) q0[21];
-cx q0[63],q0[48];
-rz(-pi/4) q0[48];
-rz(pi/4) q0[63];
-cx q0[63],q0[48];
-cx q0[63],q0[22];
-rz(pi/4) q0[22];
-cx q0[49],q0[22];
-rz(-pi/4) q0[22];
-rz(pi/4) q0[49];
-cx q0[63],q0[22];
-rz(3*pi/4) q0[22];
-sx q0[22];
-rz(pi/2) q0[22];
-cx q0[22],q0[24];
-rz(pi/4) q0[24];
-cx q0[23],q0[24];
-rz(pi/4) q0[23];
-rz(-pi/4) q0[24];
-cx q0[22],q0[24];
-cx q0[22],q0[23];
-rz(pi/4) q0[22];
-rz(-pi/4) q0[23];
-rz(pi/4) q0[24];
-cx q0[23],q0[24];
-rz(-pi/4) q0[24];
-cx q0[63],q0[49];
-rz(-pi/4) q0[49];
-rz(pi/4) q0[63];
-cx q0[63],q0[49];
-cx q0[63],q0[25];
-rz(pi/4) q0[25];
-cx q0[50],q0[25];
-rz(-pi/4) q0[25];
-rz(pi/4) q0[50];
-cx q0[63],q0[25];
-rz(3*pi/4) q0[25];
-sx q0[25];
-rz(pi/2) q0[25];
-cx q0[25],q0[27];
-rz(pi/4) q0[27];
-cx q0[26],q0[27];
-rz(pi/4) q0[26];
-rz(-pi/4) q0[27];
-cx q0[25],q0[27];
-cx q0[25],q0[26];
-rz(pi/4) q0[25];
-rz(-pi/4) q0[26];
-rz(pi/4) q0[27];
-cx q0[26],q0[27];
-rz(-pi/4) q0[27];
-cx q0[63],q0[50];
-rz(-pi/4) q0[50];
-rz(pi/4) q0[63];
-cx q0[63],q0[50];
-cx q0[63],q0[28];
-rz(pi/4) q0[28];
-cx q0[51],q0[28];
-rz(-pi/4) q0[28];
-rz(pi/4) q0[51];
-cx q0[63],q0[28];
-rz(3*pi/4) q0[28];
-sx q0[28];
-rz(pi/2) q0[28];
-cx q0[28],q0[30];
-rz(pi/4) q0[30];
-cx q0[29],q0[30];
-rz(pi/4) q0[29];
-rz(-pi/4) q0[30];
-cx q0[28],q0[30];
-cx q0[28],q0[29];
-rz(pi/4) q0[28];
-rz(-pi/4) q0[29];
-rz(pi/4) q0[30];
-cx q0[29],q0[30];
-rz(-pi/4) q0[30];
-cx q0[63],q0[51];
-rz(-pi/4) q0[51];
-rz(pi/4) q0[63];
-cx q0[63],q0[51];
-cx q0[63],q0[31];
-rz(pi/4) q0[31];
-cx q0[52],q0[31];
-rz(-pi/4) q0[31];
-rz(pi/4) q0[52];
-cx q0[63],q0[31];
-rz(3*pi/4) q0[31];
-sx q0[31];
-rz(pi/2) q0[31];
-cx q0[31],q0[33];
-rz(pi/4) q0[33];
-cx q0[32],q0[33];
-rz(pi/4) q0[32];
-rz(-pi/4) q0[33];
-cx q0[31],q0[33];
-cx q0[31],q0[32];
-rz(pi/4) q0[31];
-rz(-pi/4) q0[32];
-rz(pi/4) q0[33];
-cx q0[32],q0[33];
-rz(-pi/4) q0[33];
-cx q0[63],q0[52];
-rz(-pi/4) q0[52];
-rz(pi/4) q0[63];
-cx q0[63],q0[52];
-cx q0[63],q0[34];
-rz(pi/4) q0[34];
-cx q0[53],q0[34];
-rz(-pi/4) q0[34];
-rz(pi/4) q0[53];
-cx q0[63],q0[34];
-rz(3*pi/4) q0[34];
-sx q0[34];
-rz(pi/2) q0[34];
-cx q0[34],q0[36];
-rz(pi/4) q0[36];
-cx q0[35],q0[36];
-rz(pi/4) q0[35];
-rz(-pi/4) q0[36];
-cx q0[34],q0[36];
-cx q0[34],q0[35];
-rz(pi/4) q0[34];
-rz(-pi/4) q0[35];
-rz(pi/4) q0[36];
-cx q0[35],q0[36];
-rz(-pi/4) q0[36];
-cx q0[63],q0[53];
-rz(-pi/4) q0[53];
-rz(pi/4) q0[63];
-cx q0[63],q0[53];
-cx q0[63],q0[37];
-rz(pi/4) q0[37];
-cx q0[54],q0[37];
-rz(-pi/4) q0[37];
-rz(pi/4) q0[54];
-cx q0[63],q0[37];
-rz(3*pi/4) q0[37];
-sx q0[37];
-rz(pi/2) q0[37];
-cx q0[37],q0[39];
-rz(pi/4) q0[39];
-cx q0[38],q0[39];
-rz(pi/4) q0[38];
-rz(-pi/4) q0[39];
-cx q0[37],q0[39];
-cx q0[37],q0[38];
-rz(pi/4) q0[37];
-rz(-pi/4) q0[38];
-rz(pi/4) q0[39];
-cx q0[38],q0[39];
-rz(-pi/4) q0[39];
-cx q0[63],q0[54];
-rz(-pi/4) q0[54];
-rz(pi/4) q0[63];
-cx q0[63],q0[54];
-cx q0[63],q0[40];
-rz(pi/4) q0[40];
-cx q0[55],q0[40];
-rz(-pi/4) q0[40];
-rz(pi/4) q0[55];
-cx q0[63],q0[40];
-rz(3*pi/4) q0[40];
-sx q0[40];
-rz(pi/2) q0[40];
-cx q0[40],q0[42];
-rz(pi/4) q0[42];
-cx q0[41],q0[42];
-rz(pi/4) q0[41];
-rz(-pi/4) q0[42];
-cx q0[40],q0[42];
-cx q0[40],q0[41];
-rz(pi/4) q0[40];
-rz(-pi/4) q0[41];
-rz(pi/4) q0[42];
-cx q0[41],q0[42];
-rz(-pi/4) q0[42];
-cx q0[63],q0[55];
-rz(-pi/4) q0[55];
-rz(pi/4) q0[63];
-cx q0[63],q0[55];
-cx q0[63],q0[43];
-rz(pi/4) q0[43];
-cx q0[56],q0[43];
-rz(-pi/4) q0[43];
-rz(pi/4) q0[56];
-cx q0[63],q0[43];
-rz(3*pi/4) q0[43];
-sx q0[43];
-rz(pi/2) q0[43];
-cx q0[43],q0[44];
-rz(pi/2) q0[43];
-sx q0[43];
-rz(pi/2) q0[43];
-cx q0[63],q0[56];
-rz(-pi/4) q0[56];
-rz(pi/4) q0[63];
-cx q0[63],q0[56];
-cx q0[56],q0[43];
-rz(-pi/4) q0[43];
-cx q0[9],q0[12];
-rz(pi/4) q0[12];
-cx q0[11],q0[12];
-rz(pi/4) q0[11];
-rz(-pi/4) q0[12];
-cx q0[9],q0[12];
-rz(3*pi/4) q0[12];
-sx q0[12];
-rz(pi/2) q0[12];
-cx q0[12],q0[15];
-rz(pi/4) q0[15];
-cx q0[14],q0[15];
-rz(pi/4) q0[14];
-rz(-pi/4) q0[15];
-cx q0[12],q0[15];
-cx q0[12],q0[14];
-rz(pi/4) q0[12];
-rz(-pi/4) q0[14];
-cx q0[12],q0[14];
-rz(3*pi/4) q0[15];
-sx q0[15];
-rz(pi/2) q0[15];
-cx q0[15],q0[18];
-rz(pi/4) q0[18];
-cx q0[17],q0[18];
-rz(pi/4) q0[17];
-rz(-pi/4) q0[18];
-cx q0[15],q0[18];
-cx q0[15],q0[17];
-rz(pi/4) q0[15];
-rz(-pi/4) q0[17];
-cx q0[15],q0[17];
-rz(3*pi/4) q0[18];
-sx q0[18];
-rz(pi/2) q0[18];
-cx q0[18],q0[21];
-rz(pi/4) q0[21];
-cx q0[20],q0[21];
-rz(pi/4) q0[20];
-rz(-pi/4) q0[21];
-cx q0[18],q0[21];
-cx q0[18],q0[20];
-rz(pi/4) q0[18];
-rz(-pi/4) q0[20];
-cx q0[18],q0[20];
-rz(3*pi/4) q0[21];
-sx q0[21];
-rz(pi/2) q0[21];
-cx q0[21],q0[24];
-rz(pi/4) q0[24];
-cx q0[23],q0[24];
-rz(pi/4) q0[23];
-rz(-pi/4) q0[24];
-cx q0[21],q0[24];
-cx q0[21],q0[23];
-rz(pi/4) q0[21];
-rz(-pi/4) q0[23];
-cx q0[21],q0[23];
-rz(3*pi/4) q0[24];
-sx q0[24];
-rz(pi/2) q0[24];
-cx q0[24],q0[27];
-rz(pi/4) q0[27];
-cx q0[26],q0[27];
-rz(pi/4) q0[26];
-rz(-pi/4) q0[27];
-cx q0[24],q0[27];
-cx q0[24],q0[26];
-rz(pi/4) q0[24];
-rz(-pi/4) q0[26];
-cx q0[24],q0[26];
-rz(3*pi/4) q0[27];
-sx q0[27];
-rz(pi/2) q0[27];
-cx q0[27],q0[30];
-rz(pi/4) q0[30];
-cx q0[29],q0[30];
-rz(pi/4) q0[29];
-rz(-pi/4) q0[30];
-cx q0[27],q0[30];
-cx q0[27],q0[29];
-rz(pi/4) q0[27];
-rz(-pi/4) q0[29];
-cx q0[27],q0[29];
-rz(3*pi/4) q0[30];
-sx q0[30];
-rz(pi/2) q0[30];
-cx q0[30],q0[33];
-rz(pi/4) q0[33];
-cx q0[32],q0[33];
-rz(pi/4) q0[32];
-rz(-pi/4) q0[33];
-cx q0[30],q0[33];
-cx q0[30],q0[32];
-rz(pi/4) q0[30];
-rz(-pi/4) q0[32];
-cx q0[30],q0[32];
-rz(3*pi/4) q0[33];
-sx q0[33];
-rz(pi/2) q0[33];
-cx q0[33],q0[36];
-rz(pi/4) q0[36];
-cx q0[35],q0[36];
-rz(pi/4) q0[35];
-rz(-pi/4) q0[36];
-cx q0[33],q0[36];
-cx q0[33],q0[35];
-rz(pi/4) q0[33];
-rz(-pi/4) q0[35];
-cx q0[33],q0[35];
-rz(3*pi/4) q0[36];
-sx q0[36];
-rz(pi/2) q0[36];
-cx q0[36],q0[39];
-rz(pi/4) q0[39];
-cx q0[38],q0[39];
-rz(pi/4) q0[38];
-rz(-pi/4) q0[39];
-cx q0[36],q0[39];
-cx q0[36],q0[38];
-rz(pi/4) q0[36];
-rz(-pi/4) q0[38];
-cx q0[36],q0[38];
-rz(3*pi/4) q0[39];
-sx q0[39];
-rz(pi/2) q0[39];
-cx q0[39],q0[42];
-rz(pi/4) q0[42];
-cx q0[41],q0[42];
-rz(pi/4) q0[41];
-rz(-pi/4) q0[42];
-cx q0[39],q0[42];
-cx q0[39],q0[41];
-rz(pi/4) q0[39];
-rz(-pi/4) q0[41];
-cx q0[39],q0[41];
-rz(3*pi/4) q0[42];
-sx q0[42];
-rz(pi/2) q0[42];
-cx q0[42],q0[44];
-rz(pi/2) q0[42];
-sx q0[42];
-rz(pi/2) q0[42];
-cx q0[41],q0[42];
-rz(-pi/4) q0[42];
-cx q0[39],q0[42];
-rz(pi/4) q0[42];
-cx q0[41],q0[42];
-rz(pi/4) q0[41];
-rz(-pi/4) q0[42];
-cx q0[39],q0[42];
-cx q0[39],q0[41];
-rz(pi/4) q0[39];
-rz(-pi/4) q0[41];
-cx q0[39],q0[41];
-cx q0[40],q0[41];
-rz(pi/4) q0[42];
-cx q0[41],q0[42];
-rz(-pi/4) q0[42];
-cx q0[40],q0[42];
-rz(pi/4) q0[42];
-cx q0[41],q0[42];
-rz(pi/4) q0[41];
-rz(-pi/4) q0[42];
-cx q0[40],q0[42];
-cx q0[40],q0[41];
-rz(3*pi/4) q0[40];
-sx q0[40];
-rz(pi/2) q0[40];
-rz(-pi/4) q0[41];
-cx q0[39],q0[41];
-rz(pi/2) q0[39];
-sx q0[39];
-rz(pi/2) q0[39];
-cx q0[38],q0[39];
-rz(-pi/4) q0[39];
-cx q0[36],q0[39];
-rz(pi/4) q0[39];
-cx q0[38],q0[39];
-rz(pi/4) q0[38];
-rz(-pi/4) q0[39];
-cx q0[36],q0[39];
-cx q0[36],q0[38];
-rz(pi/4) q0[36];
-rz(-pi/4) q0[38];
-cx q0[36],q0[38];
-cx q0[37],q0[38];
-rz(pi/4) q0[39];
-cx q0[38],q0[39];
-rz(-pi/4) q0[39];
-cx q0[37],q0[39];
-rz(pi/4) q0[39];
-cx q0[38],q0[39];
-rz(pi/4) q0[38];
-rz(-pi/4) q0[39];
-cx q0[37],q0[39];
-cx q0[37],q0[38];
-rz(3*pi/4) q0[37];
-sx q0[37];
-rz(pi/2) q0[37];
-rz(-pi/4) q0[38];
-cx q0[36],q0[38];
-rz(pi/2) q0[36];
-sx q0[36];
-rz(pi/2) q0[36];
-cx q0[35],q0[36];
-rz(-pi/4) q0[36];
-cx q0[33],q0[36];
-rz(pi/4) q0[36];
-cx q0[35],q0[36];
-rz(pi/4) q0[35];
-rz(-pi/4) q0[36];
-cx q0[33],q0[36];
-cx q0[33],q0[35];
-rz(pi/4) q0[33];
-rz(-pi/4) q0[35];
-cx q0[33],q0[35];
-cx q0[34],q0[35];
-rz(pi/4) q0[36];
-cx q0[35],q0[36];
-rz(-pi/4) q0[36];
-cx q0[34],q0[36];
-rz(pi/4) q0[36];
-cx q0[35],q0[36];
-rz(pi/4) q0[35];
-rz(-pi/4) q0[36];
-cx q0[34],q0[36];
-cx q0[34],q0[35];
-rz(3*pi/4) q0[34];
-sx q0[34];
-rz(pi/2) q0[34];
-rz(-pi/4) q0[35];
-cx q0[33],q0[35];
-rz(pi/2) q0[33];
-sx q0[33];
-rz(pi/2) q0[33];
-cx q0[32],q0[33];
-rz(-pi/4) q0[33];
-cx q0[30],q0[33];
-rz(pi/4) q0[33];
-cx q0[32],q0[33];
-rz(pi/4) q0[32];
-rz(-pi/4) q0[33];
-cx q0[30],q0[33];
-cx q0[30],q0[32];
-rz(pi/4) q0[30];
-rz(-pi/4) q0[32];
-cx q0[30],q0[32];
-cx q0[31],q0[32];
-rz(pi/4) q0[33];
-cx q0[32],q0[33];
-rz(-pi/4) q0[33];
-cx q0[31],q0[33];
-rz(pi/4) q0[33];
-cx q0[32],q0[33];
-rz(pi/4) q0[32];
-rz(-pi/4) q0[33];
-cx q0[31],q0[33];
-cx q0[31],q0[32];
-rz(3*pi/4) q0[31];
-sx q0[31];
-rz(pi/2) q0[31];
-rz(-pi/4) q0[32];
-cx q0[30],q0[32];
-rz(pi/2) q0[30];
-sx q0[30];
-rz(pi/2) q0[30];
-cx q0[29],q0[30];
-rz(-pi/4) q0[30];
-cx q0[27],q0[30];
-rz(pi/4) q0[30];
-cx q0[29],q0[30];
-rz(pi/4) q0[29];
-rz(-pi/4) q0[30];
-cx q0[27],q0[30];
-cx q0[27],q0[29];
-rz(pi/4) q0[27];
-rz(-pi/4) q0[29];
-cx q0[27],q0[29];
-cx q0[28],q0[29];
-rz(pi/4) q0[30];
-cx q0[29],q0[30];
-rz(-pi/4) q0[30];
-cx q0[28],q0[30];
-rz(pi/4) q0[30];
-cx q0[29],q0[30];
-rz(pi/4) q0[29];
-rz(-pi/4) q0[30];
-cx q0[28],q0[30];
-cx q0[28],q0[29];
-rz(3*pi/4) q0[28];
-sx q0[28];
-rz(pi/2) q0[28];
-rz(-pi/4) q0[29];
-cx q0[27],q0[29];
-rz(pi/2) q0[27];
-sx q0[27];
-rz(pi/2) q0[27];
-cx q0[26],q0[27];
-rz(-pi/4) q0[27];
-cx q0[24],q0[27];
-rz(pi/4) q0[27];
-cx q0[26],q0[27];
-rz(pi/4) q0[26];
-rz(-pi/4) q0[27];
-cx q0[24],q0[27];
-cx q0[24],q0[26];
-rz(pi/4) q0[24];
-rz(-pi/4) q0[26];
-cx q0[24],q0[26];
-cx q0[25],q0[26];
-rz(pi/4) q0[27];
-cx q0[26],q0[27];
-rz(-pi/4) q0[27];
-cx q0[25],q0[27];
-rz(pi/4) q0[27];
-cx q0[26],q0[27];
-rz(pi/4) q0[26];
-rz(-pi/4) q0[27];
-cx q0[25],q0[27];
-cx q0[25],q0[26];
-rz(3*pi/4) q0[25];
-sx q0[25];
-rz(pi/2) q0[25];
-rz(-pi/4) q0[26];
-cx q0[24],q0[26];
-rz(pi/2) q0[24];
-sx q0[24];
-rz(pi/2) q0[24];
-cx q0[23],q0[24];
-rz(-pi/4) q0[24];
-cx q0[21],q0[24];
-rz(pi/4) q0[24];
-cx q0[23],q0[24];
-rz(pi/4) q0[23];
-rz(-pi/4) q0[24];
-cx q0[21],q0[24];
-cx q0[21],q0[23];
-rz(pi/4) q0[21];
-rz(-pi/4) q0[23];
-cx q0[21],q0[23];
-cx q0[22],q0[23];
-rz(pi/4) q0[24];
-cx q0[23],q0[24];
-rz(-pi/4) q0[24];
-cx q0[22],q0[24];
-rz(pi/4) q0[24];
-cx q0[23],q0[24];
-rz(pi/4) q0[23];
-rz(-pi/4) q0[24];
-cx q0[22],q0[24];
-cx q0[22],q0[23];
-rz(3*pi/4) q0[22];
-sx q0[22];
-rz(pi/2) q0[22];
-rz(-pi/4) q0[23];
-cx q0[21],q0[23];
-rz(pi/2) q0[21];
-sx q0[21];
-rz(pi/2) q0[21];
-cx q0[20],q0[21];
-rz(-pi/4) q0[21];
-cx q0[18],q0[21];
-rz(pi/4) q0[21];
-cx q0[20],q0[21];
-rz(pi/4) q0[20];
-rz(-pi/4) q0[21];
-cx q0[18],q0[21];
-cx q0[18],q0[20];
-rz(pi/4) q0[18];
-rz(-pi/4) q0[20];
-cx q0[18],q0[20];
-cx q0[19],q0[20];
-rz(pi/4) q0[21];
-cx q0[20],q0[21];
-rz(-pi/4) q0[21];
-cx q0[19],q0[21];
-rz(pi/4) q0[21];
-cx q0[20],q0[21];
-rz(pi/4) q0[20];
-rz(-pi/4) q0[21];
-cx q0[19],q0[21];
-cx q0[19],q0[20];
-rz(3*pi/4) q0[19];
-sx q0[19];
-rz(pi/2) q0[19];
-rz(-pi/4) q0[20];
-cx q0[18],q0[20];
-rz(pi/2) q0[18];
-sx q0[18];
-rz(pi/2) q0[18];
-cx q0[17],q0[18];
-rz(-pi/4) q0[18];
-cx q0[15],q0[18];
-rz(pi/4) q0[18];
-cx q0[17],q0[18];
-rz(pi/4) q0[17];
-rz(-pi/4) q0[18];
-cx q0[15],q0[18];
-cx q0[15],q0[17];
-rz(pi/4) q0[15];
-rz(-pi/4) q0[17];
-cx q0[15],q0[17];
-cx q0[16],q0[17];
-rz(pi/4) q0[18];
-cx q0[17],q0[18];
-rz(-pi/4) q0[18];
-cx q0[16],q0[18];
-rz(pi/4) q0[18];
-cx q0[17],q0[18];
-rz(pi/4) q0[17];
-rz(-pi/4) q0[18];
-cx q0[16],q0[18];
-cx q0[16],q0[17];
-rz(3*pi/4) q0[16];
-sx q0[16];
-rz(pi/2) q0[16];
-rz(-pi/4) q0[17];
-cx q0[15],q0[17];
-rz(pi/2) q0[15];
-sx q0[15];
-rz(pi/2) q0[15];
-cx q0[14],q0[15];
-rz(-pi/4) q0[15];
-cx q0[12],q0[15];
-rz(pi/4) q0[15];
-cx q0[14],q0[15];
-rz(pi/4) q0[14];
-rz(-pi/4) q0[15];
-cx q0[12],q0[15];
-cx q0[12],q0[14];
-rz(pi/4) q0[12];
-rz(-pi/4) q0[14];
-cx q0[12],q0[14];
-cx q0[13],q0[14];
-rz(pi/4) q0[15];
-cx q0[14],q0[15];
-rz(-pi/4) q0[15];
-cx q0[13],q0[15];
-rz(pi/4) q0[15];
-cx q0[14],q0[15];
-rz(pi/4) q0[14];
-rz(-pi/4) q0[15];
-cx q0[13],q0[15];
-cx q0[13],q0[14];
-rz(3*pi/4) q0[13];
-sx q0[13];
-rz(pi/2) q0[13];
-rz(-pi/4) q0[14];
-cx q0[12],q0[14];
-rz(pi/2) q0[12];
-sx q0[12];
-rz(pi/2) q0[12];
-rz(pi/4) q0[15];
-cx q0[14],q0[15];
-rz(-pi/4) q0[15];
-rz(pi/4) q0[18];
-cx q0[17],q0[18];
-rz(-pi/4) q0[18];
-rz(pi/4) q0[21];
-cx q0[20],q0[21];
-rz(-pi/4) q0[21];
-rz(pi/4) q0[24];
-cx q0[23],q0[24];
-rz(-pi/4) q0[24];
-rz(pi/4) q0[27];
-cx q0[26],q0[27];
-rz(-pi/4) q0[27];
-rz(pi/4) q0[30];
-cx q0[29],q0[30];
-rz(-pi/4) q0[30];
-rz(pi/4) q0[33];
-cx q0[32],q0[33];
-rz(-pi/4) q0[33];
-rz(pi/4) q0[36];
-cx q0[35],q0[36];
-rz(-pi/4) q0[36];
-rz(pi/4) q0[39];
-cx q0[38],q0[39];
-rz(-pi/4) q0[39];
-rz(pi/4) q0[42];
-cx q0[41],q0[42];
-rz(-pi/4) q0[42];
-cx q0[46],q0[13];
-rz(-pi/4) q0[13];
-cx q0[47],q0[16];
-rz(-pi/4) q0[16];
-cx q0[48],q0[19];
-rz(-pi/4) q0[19];
-cx q0[49],q0[22];
-rz(-pi/4) q0[22];
-cx q0[50],q0[25];
-rz(-pi/4) q0[25];
-cx q0[51],q0[28];
-rz(-pi/4) q0[28];
-cx q0[52],q0[31];
-rz(-pi/4) q0[31];
-cx q0[53],q0[34];
-rz(-pi/4) q0[34];
-cx q0[54],q0[37];
-rz(-pi/4) q0[37];
-cx q0[55],q0[40];
-rz(-pi/4) q0[40];
-cx q0[9],q0[11];
-rz(-pi/4) q0[11];
-rz(pi/4) q0[9];
-cx q0[9],q0[11];
-cx q0[11],q0[12];
-rz(-pi/4) q0[12];
-cx q0[9],q0[12];
-rz(pi/4) q0[12];
-cx q0[11],q0[12];
-rz(pi/4) q0[11];
-rz(-pi/4) q0[12];
-cx q0[9],q0[12];
-rz(pi/4) q0[12];
-cx q0[9],q0[11];
-rz(-pi/4) q0[11];
-rz(pi/4) q0[9];
-cx q0[9],q0[11];
-cx q0[10],q0[11];
-cx q0[11],q0[12];
-rz(-pi/4) q0[12];
-cx q0[10],q0[12];
-rz(pi/4) q0[12];
-cx q0[11],q0[12];
-rz(pi/4) q0[11];
-rz(-pi/4) q0[12];
-cx q0[10],q0[12];
-cx q0[10],q0[11];
-rz(3*pi/4) q0[10];
-sx q0[10];
-rz(pi/2) q0[10];
-rz(-pi/4) q0[11];
-rz(pi/4) q0[12];
-cx q0[45],q0[10];
-rz(-pi/4) q0[10];
-cx q0[63],q0[10];
-rz(pi/4) q0[10];
-cx q0[45],q0[10];
-rz(-pi/4) q0[10];
-rz(pi/4) q0[45];
-cx q0[63],q0[10];
-rz(3*pi/4) q0[10];
-sx q0[10];
-rz(pi/2) q0[10];
-cx q0[63],q0[45];
-rz(-pi/4) q0[45];
-rz(pi/4) q0[63];
-cx q0[63],q0[45];
-cx q0[63],q0[13];
-rz(pi/4) q0[13];
-cx q0[46],q0[13];
-rz(-pi/4) q0[13];
-rz(pi/4) q0[46];
-cx q0[63],q0[13];
-rz(pi/4) q0[13];
-cx q0[45],q0[13];
-rz(-pi/4) q0[13];
-cx q0[63],q0[46];
-rz(-pi/4) q0[46];
-rz(pi/4) q0[63];
-cx q0[63],q0[46];
-cx q0[63],q0[16];
-rz(pi/4) q0[16];
-cx q0[47],q0[16];
-rz(-pi/4) q0[16];
-rz(pi/4) q0[47];
-cx q0[63],q0[16];
-rz(pi/4) q0[16];
-cx q0[46],q0[16];
-rz(-pi/4) q0[16];
-cx q0[63],q0[47];
-rz(-pi/4) q0[47];
-rz(pi/4) q0[63];
-cx q0[63],q0[47];
-cx q0[63],q0[19];
-rz(pi/4) q0[19];
-cx q0[48],q0[19];
-rz(-pi/4) q0[19];
-rz(pi/4) q0[48];
-cx q0[63],q0[19];
-rz(pi/4) q0[19];
-cx q0[47],q0[19];
-rz(-pi/4) q0[19];
-cx q0[63],q0[48];
-rz(-pi/4) q0[48];
-rz(pi/4) q0[63];
-cx q0[63],q0[48];
-cx q0[63],q0[22];
-rz(pi/4) q0[22];
-cx q0[49],q0[22];
-rz(-pi/4) q0[22];
-rz(pi/4) q0[49];
-cx q0[63],q0[22];
-rz(pi/4) q0[22];
-cx q0[48],q0[22];
-rz(-pi/4) q0[22];
-cx q0[63],q0[49];
-rz(-pi/4) q0[49];
-rz(pi/4) q0[63];
-cx q0[63],q0[49];
-cx q0[63],q0[25];
-rz(pi/4) q0[25];
-cx q0[50],q0[25];
-rz(-pi/4) q0[25];
-rz(pi/4) q0[50];
-cx q0[63],q0[25];
-rz(pi/4) q0[25];
-cx q0[49],q0[25];
-rz(-pi/4) q0[25];
-cx q0[63],q0[50];
-rz(-pi/4) q0[50];
-rz(pi/4) q0[63];
-cx q0[63],q0[50];
-cx q0[63],q0[28];
-rz(pi/4) q0[28];
-cx q0[51],q0[28];
-rz(-pi/4) q0[28];
-rz(pi/4) q0[51];
-cx q0[63],q0[28];
-rz(pi/4) q0[28];
-cx q0[50],q0[28];
-rz(-pi/4) q0[28];
-cx q0[63],q0[51];
-rz(-pi/4) q0[51];
-rz(pi/4) q0[63];
-cx q0[63],q0[51];
-cx q0[63],q0[31];
-rz(pi/4) q0[31];
-cx q0[52],q0[31];
-rz(-pi/4) q0[31];
-rz(pi/4) q0[52];
-cx q0[63],q0[31];
-rz(pi/4) q0[31];
-cx q0[51],q0[31];
-rz(-pi/4) q0[31];
-cx q0[63],q0[52];
-rz(-pi/4) q0[52];
-rz(pi/4) q0[63];
-cx q0[63],q0[52];
-cx q0[63],q0[34];
-rz(pi/4) q0[34];
-cx q0[53],q0[34];
-rz(-pi/4) q0[34];
-rz(pi/4) q0[53];
-cx q0[63],q0[34];
-rz(pi/4) q0[34];
-cx q0[52],q0[34];
-rz(-pi/4) q0[34];
-cx q0[63],q0[53];
-rz(-pi/4) q0[53];
-rz(pi/4) q0[63];
-cx q0[63],q0[53];
-cx q0[63],q0[37];
-rz(pi/4) q0[37];
-cx q0[54],q0[37];
-rz(-pi/4) q0[37];
-rz(pi/4) q0[54];
-cx q0[63],q0[37];
-rz(pi/4) q0[37];
-cx q0[53],q0[37];
-rz(-pi/4) q0[37];
-cx q0[63],q0[54];
-rz(-pi/4) q0[54];
-rz(pi/4) q0[63];
-cx q0[63],q0[54];
-cx q0[63],q0[40];
-rz(pi/4) q0[40];
-cx q0[55],q0[40];
-rz(-pi/4) q0[40];
-rz(pi/4) q0[55];
-cx q0[63],q0[40];
-rz(pi/4) q0[40];
-cx q0[54],q0[40];
-rz(-pi/4) q0[40];
-cx q0[63],q0[55];
-rz(-pi/4) q0[55];
-rz(pi/4) q0[63];
-cx q0[63],q0[55];
-cx q0[63],q0[43];
-rz(pi/4) q0[43];
-cx q0[56],q0[43];
-rz(-pi/4) q0[43];
-rz(pi/4) q0[56];
-cx q0[63],q0[43];
-rz(pi/4) q0[43];
-cx q0[55],q0[43];
-rz(-pi/4) q0[43];
-cx q0[63],q0[56];
-rz(-pi/4) q0[56];
-rz(pi/4) q0[63];
-cx q0[63],q0[56];
-cx q0[9],q0[11];
-cx q0[11],q0[12];
-rz(-pi/4) q0[12];
-cx q0[10],q0[12];
-rz(pi/4) q0[12];
-cx q0[11],q0[12];
-rz(pi/4) q0[11];
-rz(-pi/4) q0[12];
-cx q0[10],q0[12];
-cx q0[10],q0[11];
-rz(pi/4) q0[10];
-rz(-pi/4) q0[11];
-rz(pi/4) q0[12];
-cx q0[11],q0[12];
-rz(-pi/4) q0[12];
-rz(pi/2) q0[9];
-sx q0[9];
-rz(pi/2) q0[9];
-cx q0[8],q0[9];
-rz(-pi/4) q0[9];
-cx q0[6],q0[9];
-rz(pi/4) q0[9];
-cx q0[8],q0[9];
-rz(pi/4) q0[8];
-rz(-pi/4) q0[9];
-cx q0[6],q0[9];
-cx q0[6],q0[8];
-rz(pi/4) q0[6];
-rz(-pi/4) q0[8];
-cx q0[6],q0[8];
-cx q0[7],q0[8];
-rz(pi/4) q0[9];
-cx q0[8],q0[9];
-rz(-pi/4) q0[9];
-cx q0[7],q0[9];
-rz(pi/4) q0[9];
-cx q0[8],q0[9];
-rz(pi/4) q0[8];
-rz(-pi/4) q0[9];
-cx q0[7],q0[9];
-cx q0[7],q0[8];
-rz(pi/4) q0[7];
-rz(-pi/4) q0[8];
-cx q0[6],q0[8];
-rz(pi/2) q0[6];
-sx q0[6];
-rz(pi/2) q0[6];
-cx q0[5],q0[6];
-rz(-pi/4) q0[6];
-cx q0[3],q0[6];
-rz(pi/4) q0[6];
-cx q0[5],q0[6];
-rz(pi/4) q0[5];
-rz(-pi/4) q0[6];
-cx q0[3],q0[6];
-cx q0[3],q0[5];
-rz(pi/4) q0[3];
-rz(-pi/4) q0[5];
-cx q0[3],q0[5];
-cx q0[4],q0[5];
-rz(pi/4) q0[6];
-cx q0[5],q0[6];
-rz(-pi/4) q0[6];
-cx q0[4],q0[6];
-rz(pi/4) q0[6];
-cx q0[5],q0[6];
-rz(pi/4) q0[5];
-rz(-pi/4) q0[6];
-cx q0[4],q0[6];
-cx q0[4],q0[5];
-rz(pi/4) q0[4];
-rz(-pi/4) q0[5];
-cx q0[3],q0[5];
-rz(pi/2) q0[3];
-sx q0[3];
-rz(pi/2) q0[3];
-cx q0[2],q0[3];
-rz(-pi/4) q0[3];
-cx q0[0],q0[3];
-rz(pi/4) q0[3];
-cx q0[2],q0[3];
-rz(pi/4) q0[2];
-rz(-pi/4) q0[3];
-cx q0[0],q0[3];
-cx q0[0],q0[2];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[2];
-cx q0[0],q0[2];
-cx q0[1],q0[2];
-rz(pi/4) q0[3];
-cx q0[2],q0[3];
-rz(-pi/4) q0[3];
-cx q0[1],q0[3];
-rz(pi/4) q0[3];
-cx q0[2],q0[3];
-rz(pi/4) q0[2];
-rz(-pi/4) q0[3];
-cx q0[1],q0[3];
-cx q0[1],q0[2];
-rz(pi/4) q0[1];
-rz(-pi/4) q0[2];
-cx q0[0],q0[2];
-rz(pi/4) q0[3];
-cx q0[2],q0[3];
-rz(-pi/4) q0[3];
-cx q0[1],q0[3];
-rz(pi/4) q0[3];
-cx q0[2],q0[3];
-rz(pi/4) q0[2];
-rz(-pi/4) q0[3];
-cx q0[1],q0[3];
-cx q0[1],q0[2];
-rz(pi/4) q0[1];
-rz(-pi/4) q0[2];
-rz(pi/4) q0[3];
-cx q0[2],q0[3];
-rz(-pi/4) q0[3];
-cx q0[0],q0[3];
-rz(pi/4) q0[3];
-cx q0[2],q0[3];
-rz(pi/4) q0[2];
-rz(-pi/4) q0[3];
-cx q0[0],q0[3];
-cx q0[0],q0[2];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[2];
-cx q0[0],q0[2];
-rz(3*pi/4) q0[3];
-sx q0[3];
-rz(pi/2) q0[3];
-rz(pi/4) q0[6];
-cx q0[5],q0[6];
-rz(-pi/4) q0[6];
-cx q0[4],q0[6];
-rz(pi/4) q0[6];
-cx q0[5],q0[6];
-rz(pi/4) q0[5];
-rz(-pi/4) q0[6];
-cx q0[4],q0[6];
-cx q0[4],q0[5];
-rz(pi/4) q0[4];
-rz(-pi/4) q0[5];
-rz(pi/4) q0[6];
-cx q0[5],q0[6];
-rz(-pi/4) q0[6];
-cx q0[3],q0[6];
-rz(pi/4) q0[6];
-cx q0[5],q0[6];
-rz(pi/4) q0[5];
-rz(-pi/4) q0[6];
-cx q0[3],q0[6];
-cx q0[3],q0[5];
-rz(pi/4) q0[3];
-rz(-pi/4) q0[5];
-cx q0[3],q0[5];
-rz(3*pi/4) q0[6];
-sx q0[6];
-rz(pi/2) q0[6];
-rz(pi/4) q0[9];
-cx q0[8],q0[9];
-rz(-pi/4) q0[9];
-cx q0[7],q0[9];
-rz(pi/4) q0[9];
-cx q0[8],q0[9];
-rz(pi/4) q0[8];
-rz(-pi/4) q0[9];
-cx q0[7],q0[9];
-cx q0[7],q0[8];
-rz(pi/4) q0[7];
-rz(-pi/4) q0[8];
-rz(pi/4) q0[9];
-cx q0[8],q0[9];
-rz(-pi/4) q0[9];
-cx q0[6],q0[9];
-rz(pi/4) q0[9];
-cx q0[8],q0[9];
-rz(pi/4) q0[8];
-rz(-pi/4) q0[9];
-cx q0[6],q0[9];
-cx q0[6],q0[8];
-rz(pi/4) q0[6];
-rz(-pi/4) q0[8];
-cx q0[6],q0[8];
-rz(3*pi/4) q0[9];
-sx q0[9];
-rz(pi/2) q0[9];
-cx q0[9],q0[12];
-rz(pi/4) q0[12];
-cx q0[11],q0[12];
-rz(pi/4) q0[11];
-rz(-pi/4) q0[12];
-cx q0[9],q0[12];
-rz(3*pi/4) q0[12];
-sx q0[12];
-rz(pi/2) q0[12];
-cx q0[9],q0[11];
-rz(-pi/4) q0[11];
-rz(pi/4) q0[9];
-cx q0[9],q0[11];
-cx q0[64],q0[13];
-rz(pi/4) q0[13];
-cx q0[45],q0[13];
-rz(-pi/4) q0[13];
-rz(pi/4) q0[45];
-cx q0[64],q0[13];
-rz(3*pi/4) q0[13];
-sx q0[13];
-rz(pi/2) q0[13];
-cx q0[13],q0[15];
-rz(pi/4) q0[15];
-cx q0[14],q0[15];
-rz(pi/4) q0[14];
-rz(-pi/4) q0[15];
-cx q0[13],q0[15];
-cx q0[13],q0[14];
-rz(pi/4) q0[13];
-rz(-pi/4) q0[14];
-rz(pi/4) q0[15];
-cx q0[14],q0[15];
-rz(-pi/4) q0[15];
-cx q0[12],q0[15];
-rz(pi/4) q0[15];
-cx q0[14],q0[15];
-rz(pi/4) q0[14];
-rz(-pi/4) q0[15];
-cx q0[12],q0[15];
-cx q0[12],q0[14];
-rz(pi/4) q0[12];
-rz(-pi/4) q0[14];
-cx q0[12],q0[14];
-rz(3*pi/4) q0[15];
-sx q0[15];
-rz(pi/2) q0[15];
-cx q0[64],q0[45];
-rz(-pi/4) q0[45];
-rz(pi/4) q0[64];
-cx q0[64],q0[45];
-cx q0[64],q0[16];
-rz(pi/4) q0[16];
-cx q0[46],q0[16];
-rz(-pi/4) q0[16];
-rz(pi/4) q0[46];
-cx q0[64],q0[16];
-rz(3*pi/4) q0[16];
-sx q0[16];
-rz(pi/2) q0[16];
-cx q0[16],q0[18];
-rz(pi/4) q0[18];
-cx q0[17],q0[18];
-rz(pi/4) q0[17];
-rz(-pi/4) q0[18];
-cx q0[16],q0[18];
-cx q0[16],q0[17];
-rz(pi/4) q0[16];
-rz(-pi/4) q0[17];
-rz(pi/4) q0[18];
-cx q0[17],q0[18];
-rz(-pi/4) q0[18];
-cx q0[15],q0[18];
-rz(pi/4) q0[18];
-cx q0[17],q0[18];
-rz(pi/4) q0[17];
-rz(-pi/4) q0[18];
-cx q0[15],q0[18];
-cx q0[15],q0[17];
-rz(pi/4) q0[15];
-rz(-pi/4) q0[17];
-cx q0[15],q0[17];
-rz(3*pi/4) q0[18];
-sx q0[18];
-rz(pi/2) q0[18];
-cx q0[64],q0[46];
-rz(-pi/4) q0[46];
-rz(pi/4) q0[64];
-cx q0[64],q0[46];
-cx q0[64],q0[19];
-rz(pi/4) q0[19];
-cx q0[47],q0[19];
-rz(-pi/4) q0[19];
-rz(pi/4) q0[47];
-cx q0[64],q0[19];
-rz(3*pi/4) q0[19];
-sx q0[19];
-rz(pi/2) q0[19];
-cx q0[19],q0[21];
-rz(pi/4) q0[21];
-cx q0[20],q0[21];
-rz(pi/4) q0[20];
-rz(-pi/4) q0[21];
-cx q0[19],q0[21];
-cx q0[19],q0[20];
-rz(pi/4) q0[19];
-rz(-pi/4) q0[20];
-rz(pi/4) q0[21];
-cx q0[20],q0[21];
-rz(-pi/4) q0[21];
-cx q0[18],q0[21];
-rz(pi/4) q0[21];
-cx q0[20],q0[21];
-rz(pi/4) q0[20];
-rz(-pi/4) q0[21];
-cx q0[18],q0[21];
-cx q0[18],q0[20];
-rz(pi/4) q0[18];
-rz(-pi/4) q0[20];
-cx q0[18],q0[20];
-rz(3*pi/4) q0[21];
-sx q0[21];
-rz(pi/2) q0[21];
-cx q0[64],q0[47];
-rz(-pi/4) q0[47];
-rz(pi/4) q0[64];
-cx q0[64],q0[47];
-cx q0[64],q0[22];
-rz(pi/4) q0[22];
-cx q0[48],q0[22];
-rz(-pi/4) q0[22];
-rz(pi/4) q0[48];
-cx q0[64],q0[22];
-rz(3*pi/4) q0[22];
-sx q0[22];
-rz(pi/2) q0[22];
-cx q0[22],q0[24];
-rz(pi/4) q0[24];
-cx q0[23],q0[24];
-rz(pi/4) q0[23];
-rz(-pi/4) q0[24];
-cx q0[22],q0[24];
-cx q0[22],q0[23];
-rz(pi/4) q0[22];
-rz(-pi/4) q0[23];
-rz(pi/4) q0[24];
-cx q0[23],q0[24];
-rz(-pi/4) q0[24];
-cx q0[21],q0[24];
-rz(pi/4) q0[24];
-cx q0[23],q0[24];
-rz(pi/4) q0[23];
-rz(-pi/4) q0[24];
-cx q0[21],q0[24];
-cx q0[21],q0[23];
-rz(pi/4) q0[21];
-rz(-pi/4) q0[23];
-cx q0[21],q0[23];
-rz(3*pi/4) q0[24];
-sx q0[24];
-rz(pi/2) q0[24];
-cx q0[64],q0[48];
-rz(-pi/4) q0[48];
-rz(pi/4) q0[64];
-cx q0[64],q0[48];
-cx q0[64],q0[25];
-rz(pi/4) q0[25];
-cx q0[49],q0[25];
-rz(-pi/4) q0[25];
-rz(pi/4) q0[49];
-cx q0[64],q0[25];
-rz(3*pi/4) q0[25];
-sx q0[25];
-rz(pi/2) q0[25];
-cx q0[25],q0[27];
-rz(pi/4) q0[27];
-cx q0[26],q0[27];
-rz(pi/4) q0[26];
-rz(-pi/4) q0[27];
-cx q0[25],q0[27];
-cx q0[25],q0[26];
-rz(pi/4) q0[25];
-rz(-pi/4) q0[26];
-rz(pi/4) q0[27];
-cx q0[26],q0[27];
-rz(-pi/4) q0[27];
-cx q0[24],q0[27];
-rz(pi/4) q0[27];
-cx q0[26],q0[27];
-rz(pi/4) q0[26];
-rz(-pi/4) q0[27];
-cx q0[24],q0[27];
-cx q0[24],q0[26];
-rz(pi/4) q0[24];
-rz(-pi/4) q0[26];
-cx q0[24],q0[26];
-rz(3*pi/4) q0[27];
-sx q0[27];
-rz(pi/2) q0[27];
-cx q0[64],q0[49];
-rz(-pi/4) q0[49];
-rz(pi/4) q0[64];
-cx q0[64],q0[49];
-cx q0[64],q0[28];
-rz(pi/4) q0[28];
-cx q0[50],q0[28];
-rz(-pi/4) q0[28];
-rz(pi/4) q0[50];
-cx q0[64],q0[28];
-rz(3*pi/4) q0[28];
-sx q0[28];
-rz(pi/2) q0[28];
-cx q0[28],q0[30];
-rz(pi/4) q0[30];
-cx q0[29],q0[30];
-rz(pi/4) q0[29];
-rz(-pi/4) q0[30];
-cx q0[28],q0[30];
-cx q0[28],q0[29];
-rz(pi/4) q0[28];
-rz(-pi/4) q0[29];
-rz(pi/4) q0[30];
-cx q0[29],q0[30];
-rz(-pi/4) q0[30];
-cx q0[27],q0[30];
-rz(pi/4) q0[30];
-cx q0[29],q0[30];
-rz(pi/4) q0[29];
-rz(-pi/4) q0[30];
-cx q0[27],q0[30];
-cx q0[27],q0[29];
-rz(pi/4) q0[27];
-rz(-pi/4) q0[29];
-cx q0[27],q0[29];
-rz(3*pi/4) q0[30];
-sx q0[30];
-rz(pi/2) q0[30];
-cx q0[64],q0[50];
-rz(-pi/4) q0[50];
-rz(pi/4) q0[64];
-cx q0[64],q0[50];
-cx q0[64],q0[31];
-rz(pi/4) q0[31];
-cx q0[51],q0[31];
-rz(-pi/4) q0[31];
-rz(pi/4) q0[51];
-cx q0[64],q0[31];
-rz(3*pi/4) q0[31];
-sx q0[31];
-rz(pi/2) q0[31];
-cx q0[31],q0[33];
-rz(pi/4) q0[33];
-cx q0[32],q0[33];
-rz(pi/4) q0[32];
-rz(-pi/4) q0[33];
-cx q0[31],q0[33];
-cx q0[31],q0[32];
-rz(pi/4) q0[31];
-rz(-pi/4) q0[32];
-rz(pi/4) q0[33];
-cx q0[32],q0[33];
-rz(-pi/4) q0[33];
-cx q0[30],q0[33];
-rz(pi/4) q0[33];
-cx q0[32],q0[33];
-rz(pi/4) q0[32];
-rz(-pi/4) q0[33];
-cx q0[30],q0[33];
-cx q0[30],q0[32];
-rz(pi/4) q0[30];
-rz(-pi/4) q0[32];
-cx q0[30],q0[32];
-rz(3*pi/4) q0[33];
-sx q0[33];
-rz(pi/2) q0[33];
-cx q0[64],q0[51];
-rz(-pi/4) q0[51];
-rz(pi/4) q0[64];
-cx q0[64],q0[51];
-cx q0[64],q0[34];
-rz(pi/4) q0[34];
-cx q0[52],q0[34];
-rz(-pi/4) q0[34];
-rz(pi/4) q0[52];
-cx q0[64],q0[34];
-rz(3*pi/4) q0[34];
-sx q0[34];
-rz(pi/2) q0[34];
-cx q0[34],q0[36];
-rz(pi/4) q0[36];
-cx q0[35],q0[36];
-rz(pi/4) q0[35];
-rz(-pi/4) q0[36];
-cx q0[34],q0[36];
-cx q0[34],q0[35];
-rz(pi/4) q0[34];
-rz(-pi/4) q0[35];
-rz(pi/4) q0[36];
-cx q0[35],q0[36];
-rz(-pi/4) q0[36];
-cx q0[33],q0[36];
-rz(pi/4) q0[36];
-cx q0[35],q0[36];
-rz(pi/4) q0[35];
-rz(-pi/4) q0[36];
-cx q0[33],q0[36];
-cx q0[33],q0[35];
-rz(pi/4) q0[33];
-rz(-pi/4) q0[35];
-cx q0[33],q0[35];
-rz(3*pi/4) q0[36];
-sx q0[36];
-rz(pi/2) q0[36];
-cx q0[64],q0[52];
-rz(-pi/4) q0[52];
-rz(pi/4) q0[64];
-cx q0[64],q0[52];
-cx q0[64],q0[37];
-rz(pi/4) q0[37];
-cx q0[53],q0[37];
-rz(-pi/4) q0[37];
-rz(pi/4) q0[53];
-cx q0[64],q0[37];
-rz(3*pi/4) q0[37];
-sx q0[37];
-rz(pi/2) q0[37];
-cx q0[37],q0[39];
-rz(pi/4) q0[39];
-cx q0[38],q0[39];
-rz(pi/4) q0[38];
-rz(-pi/4) q0[39];
-cx q0[37],q0[39];
-cx q0[37],q0[38];
-rz(pi/4) q0[37];
-rz(-pi/4) q0[38];
-rz(pi/4) q0[39];
-cx q0[38],q0[39];
-rz(-pi/4) q0[39];
-cx q0[36],q0[39];
-rz(pi/4) q0[39];
-cx q0[38],q0[39];
-rz(pi/4) q0[38];
-rz(-pi/4) q0[39];
-cx q0[36],q0[39];
-cx q0[36],q0[38];
-rz(pi/4) q0[36];
-rz(-pi/4) q0[38];
-cx q0[36],q0[38];
-rz(3*pi/4) q0[39];
-sx q0[39];
-rz(pi/2) q0[39];
-cx q0[64],q0[53];
-rz(-pi/4) q0[53];
-rz(pi/4) q0[64];
-cx q0[64],q0[53];
-cx q0[64],q0[40];
-rz(pi/4) q0[40];
-cx q0[54],q0[40];
-rz(-pi/4) q0[40];
-rz(pi/4) q0[54];
-cx q0[64],q0[40];
-rz(3*pi/4) q0[40];
-sx q0[40];
-rz(pi/2) q0[40];
-cx q0[40],q0[42];
-rz(pi/4) q0[42];
-cx q0[41],q0[42];
-rz(pi/4) q0[41];
-rz(-pi/4) q0[42];
-cx q0[40],q0[42];
-cx q0[40],q0[41];
-rz(pi/4) q0[40];
-rz(-pi/4) q0[41];
-rz(pi/4) q0[42];
-cx q0[41],q0[42];
-rz(-pi/4) q0[42];
-cx q0[39],q0[42];
-rz(pi/4) q0[42];
-cx q0[41],q0[42];
-rz(pi/4) q0[41];
-rz(-pi/4) q0[42];
-cx q0[39],q0[42];
-cx q0[39],q0[41];
-rz(pi/4) q0[39];
-rz(-pi/4) q0[41];
-cx q0[39],q0[41];
-rz(3*pi/4) q0[42];
-sx q0[42];
-rz(pi/2) q0[42];
-cx q0[64],q0[54];
-rz(-pi/4) q0[54];
-rz(pi/4) q0[64];
-cx q0[64],q0[54];
-cx q0[64],q0[43];
-rz(pi/4) q0[43];
-cx q0[55],q0[43];
-rz(-pi/4) q0[43];
-rz(pi/4) q0[55];
-cx q0[64],q0[43];
-rz(3*pi/4) q0[43];
-sx q0[43];
-rz(pi/2) q0[43];
-cx q0[43],q0[44];
-cx q0[42],q0[44];
-rz(pi/2) q0[42];
-sx q0[42];
-rz(pi/2) q0[42];
-cx q0[41],q0[42];
-rz(-pi/4) q0[42];
-cx q0[39],q0[42];
-rz(pi/4) q0[42];
-cx q0[41],q0[42];
-rz(pi/4) q0[41];
-rz(-pi/4) q0[42];
-cx q0[39],q0[42];
-cx q0[39],q0[41];
-rz(pi/4) q0[39];
-rz(-pi/4) q0[41];
-cx q0[39],q0[41];
-cx q0[40],q0[41];
-rz(pi/4) q0[42];
-cx q0[41],q0[42];
-rz(-pi/4) q0[42];
-cx q0[40],q0[42];
-rz(pi/4) q0[42];
-cx q0[41],q0[42];
-rz(pi/4) q0[41];
-rz(-pi/4) q0[42];
-cx q0[40],q0[42];
-cx q0[40],q0[41];
-rz(3*pi/4) q0[40];
-sx q0[40];
-rz(pi/2) q0[40];
-rz(-pi/4) q0[41];
-cx q0[39],q0[41];
-rz(pi/2) q0[39];
-sx q0[39];
-rz(pi/2) q0[39];
-cx q0[38],q0[39];
-rz(-pi/4) q0[39];
-cx q0[36],q0[39];
-rz(pi/4) q0[39];
-cx q0[38],q0[39];
-rz(pi/4) q0[38];
-rz(-pi/4) q0[39];
-cx q0[36],q0[39];
-cx q0[36],q0[38];
-rz(pi/4) q0[36];
-rz(-pi/4) q0[38];
-cx q0[36],q0[38];
-cx q0[37],q0[38];
-rz(pi/4) q0[39];
-cx q0[38],q0[39];
-rz(-pi/4) q0[39];
-cx q0[37],q0[39];
-rz(pi/4) q0[39];
-cx q0[38],q0[39];
-rz(pi/4) q0[38];
-rz(-pi/4) q0[39];
-cx q0[37],q0[39];
-cx q0[37],q0[38];
-rz(3*pi/4) q0[37];
-sx q0[37];
-rz(pi/2) q0[37];
-rz(-pi/4) q0[38];
-cx q0[36],q0[38];
-rz(pi/2) q0[36];
-sx q0[36];
-rz(pi/2) q0[36];
-cx q0[35],q0[36];
-rz(-pi/4) q0[36];
-cx q0[33],q0[36];
-rz(pi/4) q0[36];
-cx q0[35],q0[36];
-rz(pi/4) q0[35];
-rz(-pi/4) q0[36];
-cx q0[33],q0[36];
-cx q0[33],q0[35];
-rz(pi/4) q0[33];
-rz(-pi/4) q0[35];
-cx q0[33],q0[35];
-cx q0[34],q0[35];
-rz(pi/4) q0[36];
-cx q0[35],q0[36];
-rz(-pi/4) q0[36];
-cx q0[34],q0[36];
-rz(pi/4) q0[36];
-cx q0[35],q0[36];
-rz(pi/4) q0[35];
-rz(-pi/4) q0[36];
-cx q0[34],q0[36];
-cx q0[34],q0[35];
-rz(3*pi/4) q0[34];
-sx q0[34];
-rz(pi/2) q0[34];
-rz(-pi/4) q0[35];
-cx q0[33],q0[35];
-rz(pi/2) q0[33];
-sx q0[33];
-rz(pi/2) q0[33];
-cx q0[32],q0[33];
-rz(-pi/4) q0[33];
-cx q0[30],q0[33];
-rz(pi/4) q0[33];
-cx q0[32],q0[33];
-rz(pi/4) q0[32];
-rz(-pi/4) q0[33];
-cx q0[30],q0[33];
-cx q0[30],q0[32];
-rz(pi/4) q0[30];
-rz(-pi/4) q0[32];
-cx q0[30],q0[32];
-cx q0[31],q0[32];
-rz(pi/4) q0[33];
-cx q0[32],q0[33];
-rz(-pi/4) q0[33];
-cx q0[31],q0[33];
-rz(pi/4) q0[33];
-cx q0[32],q0[33];
-rz(pi/4) q0[32];
-rz(-pi/4) q0[33];
-cx q0[31],q0[33];
-cx q0[31],q0[32];
-rz(3*pi/4) q0[31];
-sx q0[31];
-rz(pi/2) q0[31];
-rz(-pi/4) q0[32];
-cx q0[30],q0[32];
-rz(pi/2) q0[30];
-sx q0[30];
-rz(pi/2) q0[30];
-cx q0[29],q0[30];
-rz(-pi/4) q0[30];
-cx q0[27],q0[30];
-rz(pi/4) q0[30];
-cx q0[29],q0[30];
-rz(pi/4) q0[29];
-rz(-pi/4) q0[30];
-cx q0[27],q0[30];
-cx q0[27],q0[29];
-rz(pi/4) q0[27];
-rz(-pi/4) q0[29];
-cx q0[27],q0[29];
-cx q0[28],q0[29];
-rz(pi/4) q0[30];
-cx q0[29],q0[30];
-rz(-pi/4) q0[30];
-cx q0[28],q0[30];
-rz(pi/4) q0[30];
-cx q0[29],q0[30];
-rz(pi/4) q0[29];
-rz(-pi/4) q0[30];
-cx q0[28],q0[30];
-cx q0[28],q0[29];
-rz(3*pi/4) q0[28];
-sx q0[28];
-rz(pi/2) q0[28];
-rz(-pi/4) q0[29];
-cx q0[27],q0[29];
-rz(pi/2) q0[27];
-sx q0[27];
-rz(pi/2) q0[27];
-cx q0[26],q0[27];
-rz(-pi/4) q0[27];
-cx q0[24],q0[27];
-rz(pi/4) q0[27];
-cx q0[26],q0[27];
-rz(pi/4) q0[26];
-rz(-pi/4) q0[27];
-cx q0[24],q0[27];
-cx q0[24],q0[26];
-rz(pi/4) q0[24];
-rz(-pi/4) q0[26];
-cx q0[24],q0[26];
-cx q0[25],q0[26];
-rz(pi/4) q0[27];
-cx q0[26],q0[27];
-rz(-pi/4) q0[27];
-cx q0[25],q0[27];
-rz(pi/4) q0[27];
-cx q0[26],q0[27];
-rz(pi/4) q0[26];
-rz(-pi/4) q0[27];
-cx q0[25],q0[27];
-cx q0[25],q0[26];
-rz(3*pi/4) q0[25];
-sx q0[25];
-rz(pi/2) q0[25];
-rz(-pi/4) q0[26];
-cx q0[24],q0[26];
-rz(pi/2) q0[24];
-sx q0[24];
-rz(pi/2) q0[24];
-cx q0[23],q0[24];
-rz(-pi/4) q0[24];
-cx q0[21],q0[24];
-rz(pi/4) q0[24];
-cx q0[23],q0[24];
-rz(pi/4) q0[23];
-rz(-pi/4) q0[24];
-cx q0[21],q0[24];
-cx q0[21],q0[23];
-rz(pi/4) q0[21];
-rz(-pi/4) q0[23];
-cx q0[21],q0[23];
-cx q0[22],q0[23];
-rz(pi/4) q0[24];
-cx q0[23],q0[24];
-rz(-pi/4) q0[24];
-cx q0[22],q0[24];
-rz(pi/4) q0[24];
-cx q0[23],q0[24];
-rz(pi/4) q0[23];
-rz(-pi/4) q0[24];
-cx q0[22],q0[24];
-cx q0[22],q0[23];
-rz(3*pi/4) q0[22];
-sx q0[22];
-rz(pi/2) q0[22];
-rz(-pi/4) q0[23];
-cx q0[21],q0[23];
-rz(pi/2) q0[21];
-sx q0[21];
-rz(pi/2) q0[21];
-cx q0[20],q0[21];
-rz(-pi/4) q0[21];
-cx q0[18],q0[21];
-rz(pi/4) q0[21];
-cx q0[20],q0[21];
-rz(pi/4) q0[20];
-rz(-pi/4) q0[21];
-cx q0[18],q0[21];
-cx q0[18],q0[20];
-rz(pi/4) q0[18];
-rz(-pi/4) q0[20];
-cx q0[18],q0[20];
-cx q0[19],q0[20];
-rz(pi/4) q0[21];
-cx q0[20],q0[21];
-rz(-pi/4) q0[21];
-cx q0[19],q0[21];
-rz(pi/4) q0[21];
-cx q0[20],q0[21];
-rz(pi/4) q0[20];
-rz(-pi/4) q0[21];
-cx q0[19],q0[21];
-cx q0[19],q0[20];
-rz(3*pi/4) q0[19];
-sx q0[19];
-rz(pi/2) q0[19];
-rz(-pi/4) q0[20];
-cx q0[18],q0[20];
-rz(pi/2) q0[18];
-sx q0[18];
-rz(pi/2) q0[18];
-cx q0[17],q0[18];
-rz(-pi/4) q0[18];
-cx q0[15],q0[18];
-rz(pi/4) q0[18];
-cx q0[17],q0[18];
-rz(pi/4) q0[17];
-rz(-pi/4) q0[18];
-cx q0[15],q0[18];
-cx q0[15],q0[17];
-rz(pi/4) q0[15];
-rz(-pi/4) q0[17];
-cx q0[15],q0[17];
-cx q0[16],q0[17];
-rz(pi/4) q0[18];
-cx q0[17],q0[18];
-rz(-pi/4) q0[18];
-cx q0[16],q0[18];
-rz(pi/4) q0[18];
-cx q0[17],q0[18];
-rz(pi/4) q0[17];
-rz(-pi/4) q0[18];
-cx q0[16],q0[18];
-cx q0[16],q0[17];
-rz(3*pi/4) q0[16];
-sx q0[16];
-rz(pi/2) q0[16];
-rz(-pi/4) q0[17];
-cx q0[15],q0[17];
-rz(pi/2) q0[15];
-sx q0[15];
-rz(pi/2) q0[15];
-cx q0[14],q0[15];
-rz(-pi/4) q0[15];
-cx q0[12],q0[15];
-rz(pi/4) q0[15];
-cx q0[14],q0[15];
-rz(pi/4) q0[14];
-rz(-pi/4) q0[15];
-cx q0[12],q0[15];
-cx q0[12],q0[14];
-rz(pi/4) q0[12];
-rz(-pi/4) q0[14];
-cx q0[12],q0[14];
-cx q0[13],q0[14];
-rz(pi/4) q0[15];
-cx q0[14],q0[15];
-rz(-pi/4) q0[15];
-cx q0[13],q0[15];
-rz(pi/4) q0[15];
-cx q0[14],q0[15];
-rz(pi/4) q0[14];
-rz(-pi/4) q0[15];
-cx q0[13],q0[15];
-cx q0[13],q0[14];
-rz(3*pi/4) q0[13];
-sx q0[13];
-rz(pi/2) q0[13];
-rz(-pi/4) q0[14];
-cx q0[12],q0[14];
-rz(pi/2) q0[12];
-sx q0[12];
-rz(pi/2) q0[12];
-cx q0[11],q0[12];
-rz(-pi/4) q0[12];
-rz(pi/4) q0[15];
-cx q0[14],q0[15];
-rz(-pi/4) q0[15];
-rz(pi/4) q0[18];
-cx q0[17],q0[18];
-rz(-pi/4) q0[18];
-rz(pi/4) q0[21];
-cx q0[20],q0[21];
-rz(-pi/4) q0[21];
-rz(pi/4) q0[24];
-cx q0[23],q0[24];
-rz(-pi/4) q0[24];
-rz(pi/4) q0[27];
-cx q0[26],q0[27];
-rz(-pi/4) q0[27];
-rz(pi/4) q0[30];
-cx q0[29],q0[30];
-rz(-pi/4) q0[30];
-rz(pi/4) q0[33];
-cx q0[32],q0[33];
-rz(-pi/4) q0[33];
-rz(pi/4) q0[36];
-cx q0[35],q0[36];
-rz(-pi/4) q0[36];
-rz(pi/4) q0[39];
-cx q0[38],q0[39];
-rz(-pi/4) q0[39];
-rz(pi/4) q0[42];
-cx q0[41],q0[42];
-rz(-pi/4) q0[42];
-rz(pi/2) q0[43];
-sx q0[43];
-rz(pi/2) q0[43];
-cx q0[45],q0[13];
-rz(-pi/4) q0[13];
-cx q0[46],q0[16];
-rz(-pi/4) q0[16];
-cx q0[47],q0[19];
-rz(-pi/4) q0[19];
-cx q0[48],q0[22];
-rz(-pi/4) q0[22];
-cx q0[49],q0[25];
-rz(-pi/4) q0[25];
-cx q0[50],q0[28];
-rz(-pi/4) q0[28];
-cx q0[51],q0[31];
-rz(-pi/4) q0[31];
-cx q0[52],q0[34];
-rz(-pi/4) q0[34];
-cx q0[53],q0[37];
-rz(-pi/4) q0[37];
-cx q0[54],q0[40];
-rz(-pi/4) q0[40];
-cx q0[64],q0[55];
-rz(-pi/4) q0[55];
-rz(pi/4) q0[64];
-cx q0[64],q0[55];
-cx q0[55],q0[43];
-rz(-pi/4) q0[43];
-cx q0[64],q0[13];
-rz(pi/4) q0[13];
-cx q0[45],q0[13];
-rz(-pi/4) q0[13];
-rz(pi/4) q0[45];
-cx q0[64],q0[13];
-rz(3*pi/4) q0[13];
-sx q0[13];
-rz(pi/2) q0[13];
-cx q0[13],q0[15];
-rz(pi/4) q0[15];
-cx q0[14],q0[15];
-rz(pi/4) q0[14];
-rz(-pi/4) q0[15];
-cx q0[13],q0[15];
-cx q0[13],q0[14];
-rz(pi/4) q0[13];
-rz(-pi/4) q0[14];
-rz(pi/4) q0[15];
-cx q0[14],q0[15];
-rz(-pi/4) q0[15];
-cx q0[64],q0[45];
-rz(-pi/4) q0[45];
-rz(pi/4) q0[64];
-cx q0[64],q0[45];
-cx q0[64],q0[16];
-rz(pi/4) q0[16];
-cx q0[46],q0[16];
-rz(-pi/4) q0[16];
-rz(pi/4) q0[46];
-cx q0[64],q0[16];
-rz(pi/4) q0[16];
-cx q0[45],q0[16];
-rz(-pi/4) q0[16];
-cx q0[64],q0[46];
-rz(-pi/4) q0[46];
-rz(pi/4) q0[64];
-cx q0[64],q0[46];
-cx q0[64],q0[19];
-rz(pi/4) q0[19];
-cx q0[47],q0[19];
-rz(-pi/4) q0[19];
-rz(pi/4) q0[47];
-cx q0[64],q0[19];
-rz(pi/4) q0[19];
-cx q0[46],q0[19];
-rz(-pi/4) q0[19];
-cx q0[64],q0[47];
-rz(-pi/4) q0[47];
-rz(pi/4) q0[64];
-cx q0[64],q0[47];
-cx q0[64],q0[22];
-rz(pi/4) q0[22];
-cx q0[48],q0[22];
-rz(-pi/4) q0[22];
-rz(pi/4) q0[48];
-cx q0[64],q0[22];
-rz(pi/4) q0[22];
-cx q0[47],q0[22];
-rz(-pi/4) q0[22];
-cx q0[64],q0[48];
-rz(-pi/4) q0[48];
-rz(pi/4) q0[64];
-cx q0[64],q0[48];
-cx q0[64],q0[25];
-rz(pi/4) q0[25];
-cx q0[49],q0[25];
-rz(-pi/4) q0[25];
-rz(pi/4) q0[49];
-cx q0[64],q0[25];
-rz(pi/4) q0[25];
-cx q0[48],q0[25];
-rz(-pi/4) q0[25];
-cx q0[64],q0[49];
-rz(-pi/4) q0[49];
-rz(pi/4) q0[64];
-cx q0[64],q0[49];
-cx q0[64],q0[28];
-rz(pi/4) q0[28];
-cx q0[50],q0[28];
-rz(-pi/4) q0[28];
-rz(pi/4) q0[50];
-cx q0[64],q0[28];
-rz(pi/4) q0[28];
-cx q0[49],q0[28];
-rz(-pi/4) q0[28];
-cx q0[64],q0[50];
-rz(-pi/4) q0[50];
-rz(pi/4) q0[64];
-cx q0[64],q0[50];
-cx q0[64],q0[31];
-rz(pi/4) q0[31];
-cx q0[51],q0[31];
-rz(-pi/4) q0[31];
-rz(pi/4) q0[51];
-cx q0[64],q0[31];
-rz(pi/4) q0[31];
-cx q0[50],q0[31];
-rz(-pi/4) q0[31];
-cx q0[64],q0[51];
-rz(-pi/4) q0[51];
-rz(pi/4) q0[64];
-cx q0[64],q0[51];
-cx q0[64],q0[34];
-rz(pi/4) q0[34];
-cx q0[52],q0[34];
-rz(-pi/4) q0[34];
-rz(pi/4) q0[52];
-cx q0[64],q0[34];
-rz(pi/4) q0[34];
-cx q0[51],q0[34];
-rz(-pi/4) q0[34];
-cx q0[64],q0[52];
-rz(-pi/4) q0[52];
-rz(pi/4) q0[64];
-cx q0[64],q0[52];
-cx q0[64],q0[37];
-rz(pi/4) q0[37];
-cx q0[53],q0[37];
-rz(-pi/4) q0[37];
-rz(pi/4) q0[53];
-cx q0[64],q0[37];
-rz(pi/4) q0[37];
-cx q0[52],q0[37];
-rz(-pi/4) q0[37];
-cx q0[64],q0[53];
-rz(-pi/4) q0[53];
-rz(pi/4) q0[64];
-cx q0[64],q0[53];
-cx q0[64],q0[40];
-rz(pi/4) q0[40];
-cx q0[54],q0[40];
-rz(-pi/4) q0[40];
-rz(pi/4) q0[54];
-cx q0[64],q0[40];
-rz(pi/4) q0[40];
-cx q0[53],q0[40];
-rz(-pi/4) q0[40];
-cx q0[64],q0[54];
-rz(-pi/4) q0[54];
-rz(pi/4) q0[64];
-cx q0[64],q0[54];
-cx q0[64],q0[43];
-rz(pi/4) q0[43];
-cx q0[55],q0[43];
-rz(-pi/4) q0[43];
-rz(pi/4) q0[55];
-cx q0[64],q0[43];
-rz(pi/4) q0[43];
-cx q0[54],q0[43];
-rz(-pi/4) q0[43];
-cx q0[64],q0[55];
-rz(-pi/4) q0[55];
-rz(pi/4) q0[64];
-cx q0[64],q0[55];
-cx q0[9],q0[12];
-rz(pi/4) q0[12];
-cx q0[11],q0[12];
-rz(pi/4) q0[11];
-rz(-pi/4) q0[12];
-cx q0[9],q0[12];
-rz(pi/4) q0[12];
-cx q0[9],q0[11];
-rz(-pi/4) q0[11];
-rz(pi/4) q0[9];
-cx q0[9],q0[11];
-cx q0[10],q0[11];
-cx q0[11],q0[12];
-rz(-pi/4) q0[12];
-cx q0[10],q0[12];
-rz(pi/4) q0[12];
-cx q0[11],q0[12];
-rz(pi/4) q0[11];
-rz(-pi/4) q0[12];
-cx q0[10],q0[12];
-cx q0[10],q0[11];
-rz(pi/4) q0[10];
-rz(-pi/4) q0[11];
-rz(pi/4) q0[12];
-cx q0[9],q0[11];
-cx q0[11],q0[12];
-rz(-pi/4) q0[12];
-cx q0[10],q0[12];
-rz(pi/4) q0[12];
-cx q0[11],q0[12];
-rz(pi/4) q0[11];
-rz(-pi/4) q0[12];
-cx q0[10],q0[12];
-cx q0[10],q0[11];
-rz(pi/4) q0[10];
-rz(-pi/4) q0[11];
-rz(pi/4) q0[12];
-cx q0[11],q0[12];
-rz(-pi/4) q0[12];
-rz(pi/2) q0[9];
-sx q0[9];
-rz(pi/2) q0[9];
-cx q0[8],q0[9];
-rz(-pi/4) q0[9];
-cx q0[6],q0[9];
-rz(pi/4) q0[9];
-cx q0[8],q0[9];
-rz(pi/4) q0[8];
-rz(-pi/4) q0[9];
-cx q0[6],q0[9];
-cx q0[6],q0[8];
-rz(pi/4) q0[6];
-rz(-pi/4) q0[8];
-cx q0[6],q0[8];
-cx q0[7],q0[8];
-rz(pi/4) q0[9];
-cx q0[8],q0[9];
-rz(-pi/4) q0[9];
-cx q0[7],q0[9];
-rz(pi/4) q0[9];
-cx q0[8],q0[9];
-rz(pi/4) q0[8];
-rz(-pi/4) q0[9];
-cx q0[7],q0[9];
-cx q0[7],q0[8];
-rz(pi/4) q0[7];
-rz(-pi/4) q0[8];
-cx q0[6],q0[8];
-rz(pi/2) q0[6];
-sx q0[6];
-rz(pi/2) q0[6];
-cx q0[5],q0[6];
-rz(-pi/4) q0[6];
-cx q0[3],q0[6];
-rz(pi/4) q0[6];
-cx q0[5],q0[6];
-rz(pi/4) q0[5];
-rz(-pi/4) q0[6];
-cx q0[3],q0[6];
-cx q0[3],q0[5];
-rz(pi/4) q0[3];
-rz(-pi/4) q0[5];
-cx q0[3],q0[5];
-cx q0[4],q0[5];
-rz(pi/4) q0[6];
-cx q0[5],q0[6];
-rz(-pi/4) q0[6];
-cx q0[4],q0[6];
-rz(pi/4) q0[6];
-cx q0[5],q0[6];
-rz(pi/4) q0[5];
-rz(-pi/4) q0[6];
-cx q0[4],q0[6];
-cx q0[4],q0[5];
-rz(pi/4) q0[4];
-rz(-pi/4) q0[5];
-cx q0[3],q0[5];
-rz(pi/2) q0[3];
-sx q0[3];
-rz(pi/2) q0[3];
-cx q0[2],q0[3];
-rz(-pi/4) q0[3];
-cx q0[0],q0[3];
-rz(pi/4) q0[3];
-cx q0[2],q0[3];
-rz(pi/4) q0[2];
-rz(-pi/4) q0[3];
-cx q0[0],q0[3];
-cx q0[0],q0[2];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[2];
-cx q0[0],q0[2];
-cx q0[1],q0[2];
-rz(pi/4) q0[3];
-cx q0[2],q0[3];
-rz(-pi/4) q0[3];
-cx q0[1],q0[3];
-rz(pi/4) q0[3];
-cx q0[2],q0[3];
-rz(pi/4) q0[2];
-rz(-pi/4) q0[3];
-cx q0[1],q0[3];
-cx q0[1],q0[2];
-rz(pi/4) q0[1];
-rz(-pi/4) q0[2];
-cx q0[0],q0[2];
-rz(pi/4) q0[3];
-cx q0[2],q0[3];
-rz(-pi/4) q0[3];
-cx q0[1],q0[3];
-rz(pi/4) q0[3];
-cx q0[2],q0[3];
-rz(pi/4) q0[2];
-rz(-pi/4) q0[3];
-cx q0[1],q0[3];
-cx q0[1],q0[2];
-rz(pi/4) q0[1];
-rz(-pi/4) q0[2];
-rz(pi/4) q0[3];
-cx q0[2],q0[3];
-rz(-pi/4) q0[3];
-cx q0[0],q0[3];
-rz(pi/4) q0[3];
-cx q0[2],q0[3];
-rz(pi/4) q0[2];
-rz(-pi/4) q0[3];
-cx q0[0],q0[3];
-cx q0[0],q0[2];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[2];
-cx q0[0],q0[2];
-rz(3*pi/4) q0[3];
-sx q0[3];
-rz(pi/2) q0[3];
-rz(pi/4) q0[6];
-cx q0[5],q0[6];
-rz(-pi/4) q0[6];
-cx q0[4],q0[6];
-rz(pi/4) q0[6];
-cx q0[5],q0[6];
-rz(pi/4) q0[5];
-rz(-pi/4) q0[6];
-cx q0[4],q0[6];
-cx q0[4],q0[5];
-rz(pi/4) q0[4];
-rz(-pi/4) q0[5];
-rz(pi/4) q0[6];
-cx q0[5],q0[6];
-rz(-pi/4) q0[6];
-cx q0[3],q0[6];
-rz(pi/4) q0[6];
-cx q0[5],q0[6];
-rz(pi/4) q0[5];
-rz(-pi/4) q0[6];
-cx q0[3],q0[6];
-cx q0[3],q0[5];
-rz(pi/4) q0[3];
-rz(-pi/4) q0[5];
-cx q0[3],q0[5];
-rz(3*pi/4) q0[6];
-sx q0[6];
-rz(pi/2) q0[6];
-rz(pi/4) q0[9];
-cx q0[8],q0[9];
-rz(-pi/4) q0[9];
-cx q0[7],q0[9];
-rz(pi/4) q0[9];
-cx q0[8],q0[9];
-rz(pi/4) q0[8];
-rz(-pi/4) q0[9];
-cx q0[7],q0[9];
-cx q0[7],q0[8];
-rz(pi/4) q0[7];
-rz(-pi/4) q0[8];
-rz(pi/4) q0[9];
-cx q0[8],q0[9];
-rz(-pi/4) q0[9];
-cx q0[6],q0[9];
-rz(pi/4) q0[9];
-cx q0[8],q0[9];
-rz(pi/4) q0[8];
-rz(-pi/4) q0[9];
-cx q0[6],q0[9];
-cx q0[6],q0[8];
-rz(pi/4) q0[6];
-rz(-pi/4) q0[8];
-cx q0[6],q0[8];
-rz(3*pi/4) q0[9];
-sx q0[9];
-rz(pi/2) q0[9];
-cx q0[9],q0[12];
-rz(pi/4) q0[12];
-cx q0[11],q0[12];
-rz(pi/4) q0[11];
-rz(-pi/4) q0[12];
-cx q0[9],q0[12];
-rz(3*pi/4) q0[12];
-sx q0[12];
-rz(pi/2) q0[12];
-cx q0[12],q0[15];
-rz(pi/4) q0[15];
-cx q0[14],q0[15];
-rz(pi/4) q0[14];
-rz(-pi/4) q0[15];
-cx q0[12],q0[15];
-cx q0[12],q0[14];
-rz(pi/4) q0[12];
-rz(-pi/4) q0[14];
-cx q0[12],q0[14];
-rz(3*pi/4) q0[15];
-sx q0[15];
-rz(pi/2) q0[15];
-cx q0[9],q0[11];
-rz(-pi/4) q0[11];
-rz(pi/4) q0[9];
-cx q0[9],q0[11];
-cx q0[65],q0[16];
-rz(pi/4) q0[16];
-cx q0[45],q0[16];
-rz(-pi/4) q0[16];
-rz(pi/4) q0[45];
-cx q0[65],q0[16];
-rz(3*pi/4) q0[16];
-sx q0[16];
-rz(pi/2) q0[16];
-cx q0[16],q0[18];
-rz(pi/4) q0[18];
-cx q0[17],q0[18];
-rz(pi/4) q0[17];
-rz(-pi/4) q0[18];
-cx q0[16],q0[18];
-cx q0[16],q0[17];
-rz(pi/4) q0[16];
-rz(-pi/4) q0[17];
-rz(pi/4) q0[18];
-cx q0[17],q0[18];
-rz(-pi/4) q0[18];
-cx q0[15],q0[18];
-rz(pi/4) q0[18];
-cx q0[17],q0[18];
-rz(pi/4) q0[17];
-rz(-pi/4) q0[18];
-cx q0[15],q0[18];
-cx q0[15],q0[17];
-rz(pi/4) q0[15];
-rz(-pi/4) q0[17];
-cx q0[15],q0[17];
-rz(3*pi/4) q0[18];
-sx q0[18];
-rz(pi/2) q0[18];
-cx q0[65],q0[45];
-rz(-pi/4) q0[45];
-rz(pi/4) q0[65];
-cx q0[65],q0[45];
-cx q0[65],q0[19];
-rz(pi/4) q0[19];
-cx q0[46],q0[19];
-rz(-pi/4) q0[19];
-rz(pi/4) q0[46];
-cx q0[65],q0[19];
-rz(3*pi/4) q0[19];
-sx q0[19];
-rz(pi/2) q0[19];
-cx q0[19],q0[21];
-rz(pi/4) q0[21];
-cx q0[20],q0[21];
-rz(pi/4) q0[20];
-rz(-pi/4) q0[21];
-cx q0[19],q0[21];
-cx q0[19],q0[20];
-rz(pi/4) q0[19];
-rz(-pi/4) q0[20];
-rz(pi/4) q0[21];
-cx q0[20],q0[21];
-rz(-pi/4) q0[21];
-cx q0[18],q0[21];
-rz(pi/4) q0[21];
-cx q0[20],q0[21];
-rz(pi/4) q0[20];
-rz(-pi/4) q0[21];
-cx q0[18],q0[21];
-cx q0[18],q0[20];
-rz(pi/4) q0[18];
-rz(-pi/4) q0[20];
-cx q0[18],q0[20];
-rz(3*pi/4) q0[21];
-sx q0[21];
-rz(pi/2) q0[21];
-cx q0[65],q0[46];
-rz(-pi/4) q0[46];
-rz(pi/4) q0[65];
-cx q0[65],q0[46];
-cx q0[65],q0[22];
-rz(pi/4) q0[22];
-cx q0[47],q0[22];
-rz(-pi/4) q0[22];
-rz(pi/4) q0[47];
-cx q0[65],q0[22];
-rz(3*pi/4) q0[22];
-sx q0[22];
-rz(pi/2) q0[22];
-cx q0[22],q0[24];
-rz(pi/4) q0[24];
-cx q0[23],q0[24];
-rz(pi/4) q0[23];
-rz(-pi/4) q0[24];
-cx q0[22],q0[24];
-cx q0[22],q0[23];
-rz(pi/4) q0[22];
-rz(-pi/4) q0[23];
-rz(pi/4) q0[24];
-cx q0[23],q0[24];
-rz(-pi/4) q0[24];
-cx q0[21],q0[24];
-rz(pi/4) q0[24];
-cx q0[23],q0[24];
-rz(pi/4) q0[23];
-rz(-pi/4) q0[24];
-cx q0[21],q0[24];
-cx q0[21],q0[23];
-rz(pi/4) q0[21];
-rz(-pi/4) q0[23];
-cx q0[21],q0[23];
-rz(3*pi/4) q0[24];
-sx q0[24];
-rz(pi/2) q0[24];
-cx q0[65],q0[47];
-rz(-pi/4) q0[47];
-rz(pi/4) q0[65];
-cx q0[65],q0[47];
-cx q0[65],q0[25];
-rz(pi/4) q0[25];
-cx q0[48],q0[25];
-rz(-pi/4) q0[25];
-rz(pi/4) q0[48];
-cx q0[65],q0[25];
-rz(3*pi/4) q0[25];
-sx q0[25];
-rz(pi/2) q0[25];
-cx q0[25],q0[27];
-rz(pi/4) q0[27];
-cx q0[26],q0[27];
-rz(pi/4) q0[26];
-rz(-pi/4) q0[27];
-cx q0[25],q0[27];
-cx q0[25],q0[26];
-rz(pi/4) q0[25];
-rz(-pi/4) q0[26];
-rz(pi/4) q0[27];
-cx q0[26],q0[27];
-rz(-pi/4) q0[27];
-cx q0[24],q0[27];
-rz(pi/4) q0[27];
-cx q0[26],q0[27];
-rz(pi/4) q0[26];
-rz(-pi/4) q0[27];
-cx q0[24],q0[27];
-cx q0[24],q0[26];
-rz(pi/4) q0[24];
-rz(-pi/4) q0[26];
-cx q0[24],q0[26];
-rz(3*pi/4) q0[27];
-sx q0[27];
-rz(pi/2) q0[27];
-cx q0[65],q0[48];
-rz(-pi/4) q0[48];
-rz(pi/4) q0[65];
-cx q0[65],q0[48];
-cx q0[65],q0[28];
-rz(pi/4) q0[28];
-cx q0[49],q0[28];
-rz(-pi/4) q0[28];
-rz(pi/4) q0[49];
-cx q0[65],q0[28];
-rz(3*pi/4) q0[28];
-sx q0[28];
-rz(pi/2) q0[28];
-cx q0[28],q0[30];
-rz(pi/4) q0[30];
-cx q0[29],q0[30];
-rz(pi/4) q0[29];
-rz(-pi/4) q0[30];
-cx q0[28],q0[30];
-cx q0[28],q0[29];
-rz(pi/4) q0[28];
-rz(-pi/4) q0[29];
-rz(pi/4) q0[30];
-cx q0[29],q0[30];
-rz(-pi/4) q0[30];
-cx q0[27],q0[30];
-rz(pi/4) q0[30];
-cx q0[29],q0[30];
-rz(pi/4) q0[29];
-rz(-pi/4) q0[30];
-cx q0[27],q0[30];
-cx q0[27],q0[29];
-rz(pi/4) q0[27];
-rz(-pi/4) q0[29];
-cx q0[27],q0[29];
-rz(3*pi/4) q0[30];
-sx q0[30];
-rz(pi/2) q0[30];
-cx q0[65],q0[49];
-rz(-pi/4) q0[49];
-rz(pi/4) q0[65];
-cx q0[65],q0[49];
-cx q0[65],q0[31];
-rz(pi/4) q0[31];
-cx q0[50],q0[31];
-rz(-pi/4) q0[31];
-rz(pi/4) q0[50];
-cx q0[65],q0[31];
-rz(3*pi/4) q0[31];
-sx q0[31];
-rz(pi/2) q0[31];
-cx q0[31],q0[33];
-rz(pi/4) q0[33];
-cx q0[32],q0[33];
-rz(pi/4) q0[32];
-rz(-pi/4) q0[33];
-cx q0[31],q0[33];
-cx q0[31],q0[32];
-rz(pi/4) q0[31];
-rz(-pi/4) q0[32];
-rz(pi/4) q0[33];
-cx q0[32],q0[33];
-rz(-pi/4) q0[33];
-cx q0[30],q0[33];
-rz(pi/4) q0[33];
-cx q0[32],q0[33];
-rz(pi/4) q0[32];
-rz(-pi/4) q0[33];
-cx q0[30],q0[33];
-cx q0[30],q0[32];
-rz(pi/4) q0[30];
-rz(-pi/4) q0[32];
-cx q0[30],q0[32];
-rz(3*pi/4) q0[33];
-sx q0[33];
-rz(pi/2) q0[33];
-cx q0[65],q0[50];
-rz(-pi/4) q0[50];
-rz(pi/4) q0[65];
-cx q0[65],q0[50];
-cx q0[65],q0[34];
-rz(pi/4) q0[34];
-cx q0[51],q0[34];
-rz(-pi/4) q0[34];
-rz(pi/4) q0[51];
-cx q0[65],q0[34];
-rz(3*pi/4) q0[34];
-sx q0[34];
-rz(pi/2) q0[34];
-cx q0[34],q0[36];
-rz(pi/4) q0[36];
-cx q0[35],q0[36];
-rz(pi/4) q0[35];
-rz(-pi/4) q0[36];
-cx q0[34],q0[36];
-cx q0[34],q0[35];
-rz(pi/4) q0[34];
-rz(-pi/4) q0[35];
-rz(pi/4) q0[36];
-cx q0[35],q0[36];
-rz(-pi/4) q0[36];
-cx q0[33],q0[36];
-rz(pi/4) q0[36];
-cx q0[35],q0[36];
-rz(pi/4) q0[35];
-rz(-pi/4) q0[36];
-cx q0[33],q0[36];
-cx q0[33],q0[35];
-rz(pi/4) q0[33];
-rz(-pi/4) q0[35];
-cx q0[33],q0[35];
-rz(3*pi/4) q0[36];
-sx q0[36];
-rz(pi/2) q0[36];
-cx q0[65],q0[51];
-rz(-pi/4) q0[51];
-rz(pi/4) q0[65];
-cx q0[65],q0[51];
-cx q0[65],q0[37];
-rz(pi/4) q0[37];
-cx q0[52],q0[37];
-rz(-pi/4) q0[37];
-rz(pi/4) q0[52];
-cx q0[65],q0[37];
-rz(3*pi/4) q0[37];
-sx q0[37];
-rz(pi/2) q0[37];
-cx q0[37],q0[39];
-rz(pi/4) q0[39];
-cx q0[38],q0[39];
-rz(pi/4) q0[38];
-rz(-pi/4) q0[39];
-cx q0[37],q0[39];
-cx q0[37],q0[38];
-rz(pi/4) q0[37];
-rz(-pi/4) q0[38];
-rz(pi/4) q0[39];
-cx q0[38],q0[39];
-rz(-pi/4) q0[39];
-cx q0[36],q0[39];
-rz(pi/4) q0[39];
-cx q0[38],q0[39];
-rz(pi/4) q0[38];
-rz(-pi/4) q0[39];
-cx q0[36],q0[39];
-cx q0[36],q0[38];
-rz(pi/4) q0[36];
-rz(-pi/4) q0[38];
-cx q0[36],q0[38];
-rz(3*pi/4) q0[39];
-sx q0[39];
-rz(pi/2) q0[39];
-cx q0[65],q0[52];
-rz(-pi/4) q0[52];
-rz(pi/4) q0[65];
-cx q0[65],q0[52];
-cx q0[65],q0[40];
-rz(pi/4) q0[40];
-cx q0[53],q0[40];
-rz(-pi/4) q0[40];
-rz(pi/4) q0[53];
-cx q0[65],q0[40];
-rz(3*pi/4) q0[40];
-sx q0[40];
-rz(pi/2) q0[40];
-cx q0[40],q0[42];
-rz(pi/4) q0[42];
-cx q0[41],q0[42];
-rz(pi/4) q0[41];
-rz(-pi/4) q0[42];
-cx q0[40],q0[42];
-cx q0[40],q0[41];
-rz(pi/4) q0[40];
-rz(-pi/4) q0[41];
-rz(pi/4) q0[42];
-cx q0[41],q0[42];
-rz(-pi/4) q0[42];
-cx q0[39],q0[42];
-rz(pi/4) q0[42];
-cx q0[41],q0[42];
-rz(pi/4) q0[41];
-rz(-pi/4) q0[42];
-cx q0[39],q0[42];
-cx q0[39],q0[41];
-rz(pi/4) q0[39];
-rz(-pi/4) q0[41];
-cx q0[39],q0[41];
-rz(3*pi/4) q0[42];
-sx q0[42];
-rz(pi/2) q0[42];
-cx q0[65],q0[53];
-rz(-pi/4) q0[53];
-rz(pi/4) q0[65];
-cx q0[65],q0[53];
-cx q0[65],q0[43];
-rz(pi/4) q0[43];
-cx q0[54],q0[43];
-rz(-pi/4) q0[43];
-rz(pi/4) q0[54];
-cx q0[65],q0[43];
-rz(3*pi/4) q0[43];
-sx q0[43];
-rz(pi/2) q0[43];
-cx q0[43],q0[44];
-cx q0[42],q0[44];
-rz(pi/2) q0[42];
-sx q0[42];
-rz(pi/2) q0[42];
-cx q0[41],q0[42];
-rz(-pi/4) q0[42];
-cx q0[39],q0[42];
-rz(pi/4) q0[42];
-cx q0[41],q0[42];
-rz(pi/4) q0[41];
-rz(-pi/4) q0[42];
-cx q0[39],q0[42];
-cx q0[39],q0[41];
-rz(pi/4) q0[39];
-rz(-pi/4) q0[41];
-cx q0[39],q0[41];
-cx q0[40],q0[41];
-rz(pi/4) q0[42];
-cx q0[41],q0[42];
-rz(-pi/4) q0[42];
-cx q0[40],q0[42];
-rz(pi/4) q0[42];
-cx q0[41],q0[42];
-rz(pi/4) q0[41];
-rz(-pi/4) q0[42];
-cx q0[40],q0[42];
-cx q0[40],q0[41];
-rz(3*pi/4) q0[40];
-sx q0[40];
-rz(pi/2) q0[40];
-rz(-pi/4) q0[41];
-cx q0[39],q0[41];
-rz(pi/2) q0[39];
-sx q0[39];
-rz(pi/2) q0[39];
-cx q0[38],q0[39];
-rz(-pi/4) q0[39];
-cx q0[36],q0[39];
-rz(pi/4) q0[39];
-cx q0[38],q0[39];
-rz(pi/4) q0[38];
-rz(-pi/4) q0[39];
-cx q0[36],q0[39];
-cx q0[36],q0[38];
-rz(pi/4) q0[36];
-rz(-pi/4) q0[38];
-cx q0[36],q0[38];
-cx q0[37],q0[38];
-rz(pi/4) q0[39];
-cx q0[38],q0[39];
-rz(-pi/4) q0[39];
-cx q0[37],q0[39];
-rz(pi/4) q0[39];
-cx q0[38],q0[39];
-rz(pi/4) q0[38];
-rz(-pi/4) q0[39];
-cx q0[37],q0[39];
-cx q0[37],q0[38];
-rz(3*pi/4) q0[37];
-sx q0[37];
-rz(pi/2) q0[37];
-rz(-pi/4) q0[38];
-cx q0[36],q0[38];
-rz(pi/2) q0[36];
-sx q0[36];
-rz(pi/2) q0[36];
-cx q0[35],q0[36];
-rz(-pi/4) q0[36];
-cx q0[33],q0[36];
-rz(pi/4) q0[36];
-cx q0[35],q0[36];
-rz(pi/4) q0[35];
-rz(-pi/4) q0[36];
-cx q0[33],q0[36];
-cx q0[33],q0[35];
-rz(pi/4) q0[33];
-rz(-pi/4) q0[35];
-cx q0[33],q0[35];
-cx q0[34],q0[35];
-rz(pi/4) q0[36];
-cx q0[35],q0[36];
-rz(-pi/4) q0[36];
-cx q0[34],q0[36];
-rz(pi/4) q0[36];
-cx q0[35],q0[36];
-rz(pi/4) q0[35];
-rz(-pi/4) q0[36];
-cx q0[34],q0[36];
-cx q0[34],q0[35];
-rz(3*pi/4) q0[34];
-sx q0[34];
-rz(pi/2) q0[34];
-rz(-pi/4) q0[35];
-cx q0[33],q0[35];
-rz(pi/2) q0[33];
-sx q0[33];
-rz(pi/2) q0[33];
-cx q0[32],q0[33];
-rz(-pi/4) q0[33];
-cx q0[30],q0[33];
-rz(pi/4) q0[33];
-cx q0[32],q0[33];
-rz(pi/4) q0[32];
-rz(-pi/4) q0[33];
-cx q0[30],q0[33];
-cx q0[30],q0[32];
-rz(pi/4) q0[30];
-rz(-pi/4) q0[32];
-cx q0[30],q0[32];
-cx q0[31],q0[32];
-rz(pi/4) q0[33];
-cx q0[32],q0[33];
-rz(-pi/4) q0[33];
-cx q0[31],q0[33];
-rz(pi/4) q0[33];
-cx q0[32],q0[33];
-rz(pi/4) q0[32];
-rz(-pi/4) q0[33];
-cx q0[31],q0[33];
-cx q0[31],q0[32];
-rz(3*pi/4) q0[31];
-sx q0[31];
-rz(pi/2) q0[31];
-rz(-pi/4) q0[32];
-cx q0[30],q0[32];
-rz(pi/2) q0[30];
-sx q0[30];
-rz(pi/2) q0[30];
-cx q0[29],q0[30];
-rz(-pi/4) q0[30];
-cx q0[27],q0[30];
-rz(pi/4) q0[30];
-cx q0[29],q0[30];
-rz(pi/4) q0[29];
-rz(-pi/4) q0[30];
-cx q0[27],q0[30];
-cx q0[27],q0[29];
-rz(pi/4) q0[27];
-rz(-pi/4) q0[29];
-cx q0[27],q0[29];
-cx q0[28],q0[29];
-rz(pi/4) q0[30];
-cx q0[29],q0[30];
-rz(-pi/4) q0[30];
-cx q0[28],q0[30];
-rz(pi/4) q0[30];
-cx q0[29],q0[30];
-rz(pi/4) q0[29];
-rz(-pi/4) q0[30];
-cx q0[28],q0[30];
-cx q0[28],q0[29];
-rz(3*pi/4) q0[28];
-sx q0[28];
-rz(pi/2) q0[28];
-rz(-pi/4) q0[29];
-cx q0[27],q0[29];
-rz(pi/2) q0[27];
-sx q0[27];
-rz(pi/2) q0[27];
-cx q0[26],q0[27];
-rz(-pi/4) q0[27];
-cx q0[24],q0[27];
-rz(pi/4) q0[27];
-cx q0[26],q0[27];
-rz(pi/4) q0[26];
-rz(-pi/4) q0[27];
-cx q0[24],q0[27];
-cx q0[24],q0[26];
-rz(pi/4) q0[24];
-rz(-pi/4) q0[26];
-cx q0[24],q0[26];
-cx q0[25],q0[26];
-rz(pi/4) q0[27];
-cx q0[26],q0[27];
-rz(-pi/4) q0[27];
-cx q0[25],q0[27];
-rz(pi/4) q0[27];
-cx q0[26],q0[27];
-rz(pi/4) q0[26];
-rz(-pi/4) q0[27];
-cx q0[25],q0[27];
-cx q0[25],q0[26];
-rz(3*pi/4) q0[25];
-sx q0[25];
-rz(pi/2) q0[25];
-rz(-pi/4) q0[26];
-cx q0[24],q0[26];
-rz(pi/2) q0[24];
-sx q0[24];
-rz(pi/2) q0[24];
-cx q0[23],q0[24];
-rz(-pi/4) q0[24];
-cx q0[21],q0[24];
-rz(pi/4) q0[24];
-cx q0[23],q0[24];
-rz(pi/4) q0[23];
-rz(-pi/4) q0[24];
-cx q0[21],q0[24];
-cx q0[21],q0[23];
-rz(pi/4) q0[21];
-rz(-pi/4) q0[23];
-cx q0[21],q0[23];
-cx q0[22],q0[23];
-rz(pi/4) q0[24];
-cx q0[23],q0[24];
-rz(-pi/4) q0[24];
-cx q0[22],q0[24];
-rz(pi/4) q0[24];
-cx q0[23],q0[24];
-rz(pi/4) q0[23];
-rz(-pi/4) q0[24];
-cx q0[22],q0[24];
-cx q0[22],q0[23];
-rz(3*pi/4) q0[22];
-sx q0[22];
-rz(pi/2) q0[22];
-rz(-pi/4) q0[23];
-cx q0[21],q0[23];
-rz(pi/2) q0[21];
-sx q0[21];
-rz(pi/2) q0[21];
-cx q0[20],q0[21];
-rz(-pi/4) q0[21];
-cx q0[18],q0[21];
-rz(pi/4) q0[21];
-cx q0[20],q0[21];
-rz(pi/4) q0[20];
-rz(-pi/4) q0[21];
-cx q0[18],q0[21];
-cx q0[18],q0[20];
-rz(pi/4) q0[18];
-rz(-pi/4) q0[20];
-cx q0[18],q0[20];
-cx q0[19],q0[20];
-rz(pi/4) q0[21];
-cx q0[20],q0[21];
-rz(-pi/4) q0[21];
-cx q0[19],q0[21];
-rz(pi/4) q0[21];
-cx q0[20],q0[21];
-rz(pi/4) q0[20];
-rz(-pi/4) q0[21];
-cx q0[19],q0[21];
-cx q0[19],q0[20];
-rz(3*pi/4) q0[19];
-sx q0[19];
-rz(pi/2) q0[19];
-rz(-pi/4) q0[20];
-cx q0[18],q0[20];
-rz(pi/2) q0[18];
-sx q0[18];
-rz(pi/2) q0[18];
-cx q0[17],q0[18];
-rz(-pi/4) q0[18];
-cx q0[15],q0[18];
-rz(pi/4) q0[18];
-cx q0[17],q0[18];
-rz(pi/4) q0[17];
-rz(-pi/4) q0[18];
-cx q0[15],q0[18];
-cx q0[15],q0[17];
-rz(pi/4) q0[15];
-rz(-pi/4) q0[17];
-cx q0[15],q0[17];
-cx q0[16],q0[17];
-rz(pi/4) q0[18];
-cx q0[17],q0[18];
-rz(-pi/4) q0[18];
-cx q0[16],q0[18];
-rz(pi/4) q0[18];
-cx q0[17],q0[18];
-rz(pi/4) q0[17];
-rz(-pi/4) q0[18];
-cx q0[16],q0[18];
-cx q0[16],q0[17];
-rz(3*pi/4) q0[16];
-sx q0[16];
-rz(pi/2) q0[16];
-rz(-pi/4) q0[17];
-cx q0[15],q0[17];
-rz(pi/2) q0[15];
-sx q0[15];
-rz(pi/2) q0[15];
-cx q0[14],q0[15];
-rz(-pi/4) q0[15];
-cx q0[12],q0[15];
-rz(pi/4) q0[15];
-cx q0[14],q0[15];
-rz(pi/4) q0[14];
-rz(-pi/4) q0[15];
-cx q0[12],q0[15];
-cx q0[12],q0[14];
-rz(pi/4) q0[12];
-rz(-pi/4) q0[14];
-cx q0[12],q0[14];
-cx q0[13],q0[14];
-rz(pi/4) q0[15];
-cx q0[14],q0[15];
-rz(-pi/4) q0[15];
-cx q0[13],q0[15];
-rz(pi/4) q0[15];
-cx q0[14],q0[15];
-rz(pi/4) q0[14];
-rz(-pi/4) q0[15];
-cx q0[13],q0[15];
-cx q0[13],q0[14];
-rz(pi/4) q0[13];
-rz(-pi/4) q0[14];
-cx q0[12],q0[14];
-rz(pi/2) q0[12];
-sx q0[12];
-rz(pi/2) q0[12];
-cx q0[11],q0[12];
-rz(-pi/4) q0[12];
-rz(pi/4) q0[15];
-cx q0[14],q0[15];
-rz(-pi/4) q0[15];
-cx q0[13],q0[15];
-rz(pi/4) q0[15];
-cx q0[14],q0[15];
-rz(pi/4) q0[14];
-rz(-pi/4) q0[15];
-cx q0[13],q0[15];
-cx q0[13],q0[14];
-rz(pi/4) q0[13];
-rz(-pi/4) q0[14];
-rz(pi/4) q0[15];
-cx q0[14],q0[15];
-rz(-pi/4) q0[15];
-rz(pi/4) q0[18];
-cx q0[17],q0[18];
-rz(-pi/4) q0[18];
-rz(pi/4) q0[21];
-cx q0[20],q0[21];
-rz(-pi/4) q0[21];
-rz(pi/4) q0[24];
-cx q0[23],q0[24];
-rz(-pi/4) q0[24];
-rz(pi/4) q0[27];
-cx q0[26],q0[27];
-rz(-pi/4) q0[27];
-rz(pi/4) q0[30];
-cx q0[29],q0[30];
-rz(-pi/4) q0[30];
-rz(pi/4) q0[33];
-cx q0[32],q0[33];
-rz(-pi/4) q0[33];
-rz(pi/4) q0[36];
-cx q0[35],q0[36];
-rz(-pi/4) q0[36];
-rz(pi/4) q0[39];
-cx q0[38],q0[39];
-rz(-pi/4) q0[39];
-rz(pi/4) q0[42];
-cx q0[41],q0[42];
-rz(-pi/4) q0[42];
-rz(pi/2) q0[43];
-sx q0[43];
-rz(pi/2) q0[43];
-cx q0[45],q0[16];
-rz(-pi/4) q0[16];
-cx q0[46],q0[19];
-rz(-pi/4) q0[19];
-cx q0[47],q0[22];
-rz(-pi/4) q0[22];
-cx q0[48],q0[25];
-rz(-pi/4) q0[25];
-cx q0[49],q0[28];
-rz(-pi/4) q0[28];
-cx q0[50],q0[31];
-rz(-pi/4) q0[31];
-cx q0[51],q0[34];
-rz(-pi/4) q0[34];
-cx q0[52],q0[37];
-rz(-pi/4) q0[37];
-cx q0[53],q0[40];
-rz(-pi/4) q0[40];
-cx q0[65],q0[54];
-rz(-pi/4) q0[54];
-rz(pi/4) q0[65];
-cx q0[65],q0[54];
-cx q0[54],q0[43];
-rz(-pi/4) q0[43];
-cx q0[65],q0[16];
-rz(pi/4) q0[16];
-cx q0[45],q0[16];
-rz(-pi/4) q0[16];
-rz(pi/4) q0[45];
-cx q0[65],q0[16];
-rz(3*pi/4) q0[16];
-sx q0[16];
-rz(pi/2) q0[16];
-cx q0[16],q0[18];
-rz(pi/4) q0[18];
-cx q0[17],q0[18];
-rz(pi/4) q0[17];
-rz(-pi/4) q0[18];
-cx q0[16],q0[18];
-cx q0[16],q0[17];
-rz(pi/4) q0[16];
-rz(-pi/4) q0[17];
-rz(pi/4) q0[18];
-cx q0[17],q0[18];
-rz(-pi/4) q0[18];
-cx q0[65],q0[45];
-rz(-pi/4) q0[45];
-rz(pi/4) q0[65];
-cx q0[65],q0[45];
-cx q0[65],q0[19];
-rz(pi/4) q0[19];
-cx q0[46],q0[19];
-rz(-pi/4) q0[19];
-rz(pi/4) q0[46];
-cx q0[65],q0[19];
-rz(pi/4) q0[19];
-cx q0[45],q0[19];
-rz(-pi/4) q0[19];
-cx q0[65],q0[46];
-rz(-pi/4) q0[46];
-rz(pi/4) q0[65];
-cx q0[65],q0[46];
-cx q0[65],q0[22];
-rz(pi/4) q0[22];
-cx q0[47],q0[22];
-rz(-pi/4) q0[22];
-rz(pi/4) q0[47];
-cx q0[65],q0[22];
-rz(pi/4) q0[22];
-cx q0[46],q0[22];
-rz(-pi/4) q0[22];
-cx q0[65],q0[47];
-rz(-pi/4) q0[47];
-rz(pi/4) q0[65];
-cx q0[65],q0[47];
-cx q0[65],q0[25];
-rz(pi/4) q0[25];
-cx q0[48],q0[25];
-rz(-pi/4) q0[25];
-rz(pi/4) q0[48];
-cx q0[65],q0[25];
-rz(pi/4) q0[25];
-cx q0[47],q0[25];
-rz(-pi/4) q0[25];
-cx q0[65],q0[48];
-rz(-pi/4) q0[48];
-rz(pi/4) q0[65];
-cx q0[65],q0[48];
-cx q0[65],q0[28];
-rz(pi/4) q0[28];
-cx q0[49],q0[28];
-rz(-pi/4) q0[28];
-rz(pi/4) q0[49];
-cx q0[65],q0[28];
-rz(pi/4) q0[28];
-cx q0[48],q0[28];
-rz(-pi/4) q0[28];
-cx q0[65],q0[49];
-rz(-pi/4) q0[49];
-rz(pi/4) q0[65];
-cx q0[65],q0[49];
-cx q0[65],q0[31];
-rz(pi/4) q0[31];
-cx q0[50],q0[31];
-rz(-pi/4) q0[31];
-rz(pi/4) q0[50];
-cx q0[65],q0[31];
-rz(pi/4) q0[31];
-cx q0[49],q0[31];
-rz(-pi/4) q0[31];
-cx q0[65],q0[50];
-rz(-pi/4) q0[50];
-rz(pi/4) q0[65];
-cx q0[65],q0[50];
-cx q0[65],q0[34];
-rz(pi/4) q0[34];
-cx q0[51],q0[34];
-rz(-pi/4) q0[34];
-rz(pi/4) q0[51];
-cx q0[65],q0[34];
-rz(pi/4) q0[34];
-cx q0[50],q0[34];
-rz(-pi/4) q0[34];
-cx q0[65],q0[51];
-rz(-pi/4) q0[51];
-rz(pi/4) q0[65];
-cx q0[65],q0[51];
-cx q0[65],q0[37];
-rz(pi/4) q0[37];
-cx q0[52],q0[37];
-rz(-pi/4) q0[37];
-rz(pi/4) q0[52];
-cx q0[65],q0[37];
-rz(pi/4) q0[37];
-cx q0[51],q0[37];
-rz(-pi/4) q0[37];
-cx q0[65],q0[52];
-rz(-pi/4) q0[52];
-rz(pi/4) q0[65];
-cx q0[65],q0[52];
-cx q0[65],q0[40];
-rz(pi/4) q0[40];
-cx q0[53],q0[40];
-rz(-pi/4) q0[40];
-rz(pi/4) q0[53];
-cx q0[65],q0[40];
-rz(pi/4) q0[40];
-cx q0[52],q0[40];
-rz(-pi/4) q0[40];
-cx q0[65],q0[53];
-rz(-pi/4) q0[53];
-rz(pi/4) q0[65];
-cx q0[65],q0[53];
-cx q0[65],q0[43];
-rz(pi/4) q0[43];
-cx q0[54],q0[43];
-rz(-pi/4) q0[43];
-rz(pi/4) q0[54];
-cx q0[65],q0[43];
-rz(pi/4) q0[43];
-cx q0[53],q0[43];
-rz(-pi/4) q0[43];
-cx q0[65],q0[54];
-rz(-pi/4) q0[54];
-rz(pi/4) q0[65];
-cx q0[65],q0[54];
-cx q0[9],q0[12];
-rz(pi/4) q0[12];
-cx q0[11],q0[12];
-rz(pi/4) q0[11];
-rz(-pi/4) q0[12];
-cx q0[9],q0[12];
-rz(pi/4) q0[12];
-cx q0[9],q0[11];
-rz(-pi/4) q0[11];
-rz(pi/4) q0[9];
-cx q0[9],q0[11];
-cx q0[10],q0[11];
-cx q0[11],q0[12];
-rz(-pi/4) q0[12];
-cx q0[10],q0[12];
-rz(pi/4) q0[12];
-cx q0[11],q0[12];
-rz(pi/4) q0[11];
-rz(-pi/4) q0[12];
-cx q0[10],q0[12];
-cx q0[10],q0[11];
-rz(pi/4) q0[10];
-rz(-pi/4) q0[11];
-rz(pi/4) q0[12];
-cx q0[9],q0[11];
-cx q0[11],q0[12];
-rz(-pi/4) q0[12];
-cx q0[10],q0[12];
-rz(pi/4) q0[12];
-cx q0[11],q0[12];
-rz(pi/4) q0[11];
-rz(-pi/4) q0[12];
-cx q0[10],q0[12];
-cx q0[10],q0[11];
-rz(pi/4) q0[10];
-rz(-pi/4) q0[11];
-rz(pi/4) q0[12];
-cx q0[11],q0[12];
-rz(-pi/4) q0[12];
-rz(pi/2) q0[9];
-sx q0[9];
-rz(pi/2) q0[9];
-cx q0[8],q0[9];
-rz(-pi/4) q0[9];
-cx q0[6],q0[9];
-rz(pi/4) q0[9];
-cx q0[8],q0[9];
-rz(pi/4) q0[8];
-rz(-pi/4) q0[9];
-cx q0[6],q0[9];
-cx q0[6],q0[8];
-rz(pi/4) q0[6];
-rz(-pi/4) q0[8];
-cx q0[6],q0[8];
-cx q0[7],q0[8];
-rz(pi/4) q0[9];
-cx q0[8],q0[9];
-rz(-pi/4) q0[9];
-cx q0[7],q0[9];
-rz(pi/4) q0[9];
-cx q0[8],q0[9];
-rz(pi/4) q0[8];
-rz(-pi/4) q0[9];
-cx q0[7],q0[9];
-cx q0[7],q0[8];
-rz(pi/4) q0[7];
-rz(-pi/4) q0[8];
-cx q0[6],q0[8];
-rz(pi/2) q0[6];
-sx q0[6];
-rz(pi/2) q0[6];
-cx q0[5],q0[6];
-rz(-pi/4) q0[6];
-cx q0[3],q0[6];
-rz(pi/4) q0[6];
-cx q0[5],q0[6];
-rz(pi/4) q0[5];
-rz(-pi/4) q0[6];
-cx q0[3],q0[6];
-cx q0[3],q0[5];
-rz(pi/4) q0[3];
-rz(-pi/4) q0[5];
-cx q0[3],q0[5];
-cx q0[4],q0[5];
-rz(pi/4) q0[6];
-cx q0[5],q0[6];
-rz(-pi/4) q0[6];
-cx q0[4],q0[6];
-rz(pi/4) q0[6];
-cx q0[5],q0[6];
-rz(pi/4) q0[5];
-rz(-pi/4) q0[6];
-cx q0[4],q0[6];
-cx q0[4],q0[5];
-rz(pi/4) q0[4];
-rz(-pi/4) q0[5];
-cx q0[3],q0[5];
-rz(pi/2) q0[3];
-sx q0[3];
-rz(pi/2) q0[3];
-cx q0[2],q0[3];
-rz(-pi/4) q0[3];
-cx q0[0],q0[3];
-rz(pi/4) q0[3];
-cx q0[2],q0[3];
-rz(pi/4) q0[2];
-rz(-pi/4) q0[3];
-cx q0[0],q0[3];
-cx q0[0],q0[2];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[2];
-cx q0[0],q0[2];
-cx q0[1],q0[2];
-rz(pi/4) q0[3];
-cx q0[2],q0[3];
-rz(-pi/4) q0[3];
-cx q0[1],q0[3];
-rz(pi/4) q0[3];
-cx q0[2],q0[3];
-rz(pi/4) q0[2];
-rz(-pi/4) q0[3];
-cx q0[1],q0[3];
-cx q0[1],q0[2];
-rz(pi/4) q0[1];
-rz(-pi/4) q0[2];
-cx q0[0],q0[2];
-rz(pi/4) q0[3];
-cx q0[2],q0[3];
-rz(-pi/4) q0[3];
-cx q0[1],q0[3];
-rz(pi/4) q0[3];
-cx q0[2],q0[3];
-rz(pi/4) q0[2];
-rz(-pi/4) q0[3];
-cx q0[1],q0[3];
-cx q0[1],q0[2];
-rz(pi/4) q0[1];
-rz(-pi/4) q0[2];
-rz(pi/4) q0[3];
-cx q0[2],q0[3];
-rz(-pi/4) q0[3];
-cx q0[0],q0[3];
-rz(pi/4) q0[3];
-cx q0[2],q0[3];
-rz(pi/4) q0[2];
-rz(-pi/4) q0[3];
-cx q0[0],q0[3];
-cx q0[0],q0[2];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[2];
-cx q0[0],q0[2];
-rz(3*pi/4) q0[3];
-sx q0[3];
-rz(pi/2) q0[3];
-rz(pi/4) q0[6];
-cx q0[5],q0[6];
-rz(-pi/4) q0[6];
-cx q0[4],q0[6];
-rz(pi/4) q0[6];
-cx q0[5],q0[6];
-rz(pi/4) q0[5];
-rz(-pi/4) q0[6];
-cx q0[4],q0[6];
-cx q0[4],q0[5];
-rz(pi/4) q0[4];
-rz(-pi/4) q0[5];
-rz(pi/4) q0[6];
-cx q0[5],q0[6];
-rz(-pi/4) q0[6];
-cx q0[3],q0[6];
-rz(pi/4) q0[6];
-cx q0[5],q0[6];
-rz(pi/4) q0[5];
-rz(-pi/4) q0[6];
-cx q0[3],q0[6];
-cx q0[3],q0[5];
-rz(pi/4) q0[3];
-rz(-pi/4) q0[5];
-cx q0[3],q0[5];
-rz(3*pi/4) q0[6];
-sx q0[6];
-rz(pi/2) q0[6];
-rz(pi/4) q0[9];
-cx q0[8],q0[9];
-rz(-pi/4) q0[9];
-cx q0[7],q0[9];
-rz(pi/4) q0[9];
-cx q0[8],q0[9];
-rz(pi/4) q0[8];
-rz(-pi/4) q0[9];
-cx q0[7],q0[9];
-cx q0[7],q0[8];
-rz(pi/4) q0[7];
-rz(-pi/4) q0[8];
-rz(pi/4) q0[9];
-cx q0[8],q0[9];
-rz(-pi/4) q0[9];
-cx q0[6],q0[9];
-rz(pi/4) q0[9];
-cx q0[8],q0[9];
-rz(pi/4) q0[8];
-rz(-pi/4) q0[9];
-cx q0[6],q0[9];
-cx q0[6],q0[8];
-rz(pi/4) q0[6];
-rz(-pi/4) q0[8];
-cx q0[6],q0[8];
-rz(3*pi/4) q0[9];
-sx q0[9];
-rz(pi/2) q0[9];
-cx q0[9],q0[12];
-rz(pi/4) q0[12];
-cx q0[11],q0[12];
-rz(pi/4) q0[11];
-rz(-pi/4) q0[12];
-cx q0[9],q0[12];
-rz(3*pi/4) q0[12];
-sx q0[12];
-rz(pi/2) q0[12];
-cx q0[12],q0[15];
-rz(pi/4) q0[15];
-cx q0[14],q0[15];
-rz(pi/4) q0[14];
-rz(-pi/4) q0[15];
-cx q0[12],q0[15];
-cx q0[12],q0[14];
-rz(pi/4) q0[12];
-rz(-pi/4) q0[14];
-cx q0[12],q0[14];
-rz(3*pi/4) q0[15];
-sx q0[15];
-rz(pi/2) q0[15];
-cx q0[15],q0[18];
-rz(pi/4) q0[18];
-cx q0[17],q0[18];
-rz(pi/4) q0[17];
-rz(-pi/4) q0[18];
-cx q0[15],q0[18];
-cx q0[15],q0[17];
-rz(pi/4) q0[15];
-rz(-pi/4) q0[17];
-cx q0[15],q0[17];
-rz(3*pi/4) q0[18];
-sx q0[18];
-rz(pi/2) q0[18];
-cx q0[9],q0[11];
-rz(-pi/4) q0[11];
-rz(pi/4) q0[9];
-cx q0[9],q0[11];
-cx q0[66],q0[19];
-rz(pi/4) q0[19];
-cx q0[45],q0[19];
-rz(-pi/4) q0[19];
-rz(pi/4) q0[45];
-cx q0[66],q0[19];
-rz(3*pi/4) q0[19];
-sx q0[19];
-rz(pi/2) q0[19];
-cx q0[19],q0[21];
-rz(pi/4) q0[21];
-cx q0[20],q0[21];
-rz(pi/4) q0[20];
-rz(-pi/4) q0[21];
-cx q0[19],q0[21];
-cx q0[19],q0[20];
-rz(pi/4) q0[19];
-rz(-pi/4) q0[20];
-rz(pi/4) q0[21];
-cx q0[20],q0[21];
-rz(-pi/4) q0[21];
-cx q0[18],q0[21];
-rz(pi/4) q0[21];
-cx q0[20],q0[21];
-rz(pi/4) q0[20];
-rz(-pi/4) q0[21];
-cx q0[18],q0[21];
-cx q0[18],q0[20];
-rz(pi/4) q0[18];
-rz(-pi/4) q0[20];
-cx q0[18],q0[20];
-rz(3*pi/4) q0[21];
-sx q0[21];
-rz(pi/2) q0[21];
-cx q0[66],q0[45];
-rz(-pi/4) q0[45];
-rz(pi/4) q0[66];
-cx q0[66],q0[45];
-cx q0[66],q0[22];
-rz(pi/4) q0[22];
-cx q0[46],q0[22];
-rz(-pi/4) q0[22];
-rz(pi/4) q0[46];
-cx q0[66],q0[22];
-rz(3*pi/4) q0[22];
-sx q0[22];
-rz(pi/2) q0[22];
-cx q0[22],q0[24];
-rz(pi/4) q0[24];
-cx q0[23],q0[24];
-rz(pi/4) q0[23];
-rz(-pi/4) q0[24];
-cx q0[22],q0[24];
-cx q0[22],q0[23];
-rz(pi/4) q0[22];
-rz(-pi/4) q0[23];
-rz(pi/4) q0[24];
-cx q0[23],q0[24];
-rz(-pi/4) q0[24];
-cx q0[21],q0[24];
-rz(pi/4) q0[24];
-cx q0[23],q0[24];
-rz(pi/4) q0[23];
-rz(-pi/4) q0[24];
-cx q0[21],q0[24];
-cx q0[21],q0[23];
-rz(pi/4) q0[21];
-rz(-pi/4) q0[23];
-cx q0[21],q0[23];
-rz(3*pi/4) q0[24];
-sx q0[24];
-rz(pi/2) q0[24];
-cx q0[66],q0[46];
-rz(-pi/4) q0[46];
-rz(pi/4) q0[66];
-cx q0[66],q0[46];
-cx q0[66],q0[25];
-rz(pi/4) q0[25];
-cx q0[47],q0[25];
-rz(-pi/4) q0[25];
-rz(pi/4) q0[47];
-cx q0[66],q0[25];
-rz(3*pi/4) q0[25];
-sx q0[25];
-rz(pi/2) q0[25];
-cx q0[25],q0[27];
-rz(pi/4) q0[27];
-cx q0[26],q0[27];
-rz(pi/4) q0[26];
-rz(-pi/4) q0[27];
-cx q0[25],q0[27];
-cx q0[25],q0[26];
-rz(pi/4) q0[25];
-rz(-pi/4) q0[26];
-rz(pi/4) q0[27];
-cx q0[26],q0[27];
-rz(-pi/4) q0[27];
-cx q0[24],q0[27];
-rz(pi/4) q0[27];
-cx q0[26],q0[27];
-rz(pi/4) q0[26];
-rz(-pi/4) q0[27];
-cx q0[24],q0[27];
-cx q0[24],q0[26];
-rz(pi/4) q0[24];
-rz(-pi/4) q0[26];
-cx q0[24],q0[26];
-rz(3*pi/4) q0[27];
-sx q0[27];
-rz(pi/2) q0[27];
-cx q0[66],q0[47];
-rz(-pi/4) q0[47];
-rz(pi/4) q0[66];
-cx q0[66],q0[47];
-cx q0[66],q0[28];
-rz(pi/4) q0[28];
-cx q0[48],q0[28];
-rz(-pi/4) q0[28];
-rz(pi/4) q0[48];
-cx q0[66],q0[28];
-rz(3*pi/4) q0[28];
-sx q0[28];
-rz(pi/2) q0[28];
-cx q0[28],q0[30];
-rz(pi/4) q0[30];
-cx q0[29],q0[30];
-rz(pi/4) q0[29];
-rz(-pi/4) q0[30];
-cx q0[28],q0[30];
-cx q0[28],q0[29];
-rz(pi/4) q0[28];
-rz(-pi/4) q0[29];
-rz(pi/4) q0[30];
-cx q0[29],q0[30];
-rz(-pi/4) q0[30];
-cx q0[27],q0[30];
-rz(pi/4) q0[30];
-cx q0[29],q0[30];
-rz(pi/4) q0[29];
-rz(-pi/4) q0[30];
-cx q0[27],q0[30];
-cx q0[27],q0[29];
-rz(pi/4) q0[27];
-rz(-pi/4) q0[29];
-cx q0[27],q0[29];
-rz(3*pi/4) q0[30];
-sx q0[30];
-rz(pi/2) q0[30];
-cx q0[66],q0[48];
-rz(-pi/4) q0[48];
-rz(pi/4) q0[66];
-cx q0[66],q0[48];
-cx q0[66],q0[31];
-rz(pi/4) q0[31];
-cx q0[49],q0[31];
-rz(-pi/4) q0[31];
-rz(pi/4) q0[49];
-cx q0[66],q0[31];
-rz(3*pi/4) q0[31];
-sx q0[31];
-rz(pi/2) q0[31];
-cx q0[31],q0[33];
-rz(pi/4) q0[33];
-cx q0[32],q0[33];
-rz(pi/4) q0[32];
-rz(-pi/4) q0[33];
-cx q0[31],q0[33];
-cx q0[31],q0[32];
-rz(pi/4) q0[31];
-rz(-pi/4) q0[32];
-rz(pi/4) q0[33];
-cx q0[32],q0[33];
-rz(-pi/4) q0[33];
-cx q0[30],q0[33];
-rz(pi/4) q0[33];
-cx q0[32],q0[33];
-rz(pi/4) q0[32];
-rz(-pi/4) q0[33];
-cx q0[30],q0[33];
-cx q0[30],q0[32];
-rz(pi/4) q0[30];
-rz(-pi/4) q0[32];
-cx q0[30],q0[32];
-rz(3*pi/4) q0[33];
-sx q0[33];
-rz(pi/2) q0[33];
-cx q0[66],q0[49];
-rz(-pi/4) q0[49];
-rz(pi/4) q0[66];
-cx q0[66],q0[49];
-cx q0[66],q0[34];
-rz(pi/4) q0[34];
-cx q0[50],q0[34];
-rz(-pi/4) q0[34];
-rz(pi/4) q0[50];
-cx q0[66],q0[34];
-rz(3*pi/4) q0[34];
-sx q0[34];
-rz(pi/2) q0[34];
-cx q0[34],q0[36];
-rz(pi/4) q0[36];
-cx q0[35],q0[36];
-rz(pi/4) q0[35];
-rz(-pi/4) q0[36];
-cx q0[34],q0[36];
-cx q0[34],q0[35];
-rz(pi/4) q0[34];
-rz(-pi/4) q0[35];
-rz(pi/4) q0[36];
-cx q0[35],q0[36];
-rz(-pi/4) q0[36];
-cx q0[33],q0[36];
-rz(pi/4) q0[36];
-cx q0[35],q0[36];
-rz(pi/4) q0[35];
-rz(-pi/4) q0[36];
-cx q0[33],q0[36];
-cx q0[33],q0[35];
-rz(pi/4) q0[33];
-rz(-pi/4) q0[35];
-cx q0[33],q0[35];
-rz(3*pi/4) q0[36];
-sx q0[36];
-rz(pi/2) q0[36];
-cx q0[66],q0[50];
-rz(-pi/4) q0[50];
-rz(pi/4) q0[66];
-cx q0[66],q0[50];
-cx q0[66],q0[37];
-rz(pi/4) q0[37];
-cx q0[51],q0[37];
-rz(-pi/4) q0[37];
-rz(pi/4) q0[51];
-cx q0[66],q0[37];
-rz(3*pi/4) q0[37];
-sx q0[37];
-rz(pi/2) q0[37];
-cx q0[37],q0[39];
-rz(pi/4) q0[39];
-cx q0[38],q0[39];
-rz(pi/4) q0[38];
-rz(-pi/4) q0[39];
-cx q0[37],q0[39];
-cx q0[37],q0[38];
-rz(pi/4) q0[37];
-rz(-pi/4) q0[38];
-rz(pi/4) q0[39];
-cx q0[38],q0[39];
-rz(-pi/4) q0[39];
-cx q0[36],q0[39];
-rz(pi/4) q0[39];
-cx q0[38],q0[39];
-rz(pi/4) q0[38];
-rz(-pi/4) q0[39];
-cx q0[36],q0[39];
-cx q0[36],q0[38];
-rz(pi/4) q0[36];
-rz(-pi/4) q0[38];
-cx q0[36],q0[38];
-rz(3*pi/4) q0[39];
-sx q0[39];
-rz(pi/2) q0[39];
-cx q0[66],q0[51];
-rz(-pi/4) q0[51];
-rz(pi/4) q0[66];
-cx q0[66],q0[51];
-cx q0[66],q0[40];
-rz(pi/4) q0[40];
-cx q0[52],q0[40];
-rz(-pi/4) q0[40];
-rz(pi/4) q0[52];
-cx q0[66],q0[40];
-rz(3*pi/4) q0[40];
-sx q0[40];
-rz(pi/2) q0[40];
-cx q0[40],q0[42];
-rz(pi/4) q0[42];
-cx q0[41],q0[42];
-rz(pi/4) q0[41];
-rz(-pi/4) q0[42];
-cx q0[40],q0[42];
-cx q0[40],q0[41];
-rz(pi/4) q0[40];
-rz(-pi/4) q0[41];
-rz(pi/4) q0[42];
-cx q0[41],q0[42];
-rz(-pi/4) q0[42];
-cx q0[39],q0[42];
-rz(pi/4) q0[42];
-cx q0[41],q0[42];
-rz(pi/4) q0[41];
-rz(-pi/4) q0[42];
-cx q0[39],q0[42];
-cx q0[39],q0[41];
-rz(pi/4) q0[39];
-rz(-pi/4) q0[41];
-cx q0[39],q0[41];
-rz(3*pi/4) q0[42];
-sx q0[42];
-rz(pi/2) q0[42];
-cx q0[66],q0[52];
-rz(-pi/4) q0[52];
-rz(pi/4) q0[66];
-cx q0[66],q0[52];
-cx q0[66],q0[43];
-rz(pi/4) q0[43];
-cx q0[53],q0[43];
-rz(-pi/4) q0[43];
-rz(pi/4) q0[53];
-cx q0[66],q0[43];
-rz(3*pi/4) q0[43];
-sx q0[43];
-rz(pi/2) q0[43];
-cx q0[43],q0[44];
-cx q0[42],q0[44];
-rz(pi/2) q0[42];
-sx q0[42];
-rz(pi/2) q0[42];
-cx q0[41],q0[42];
-rz(-pi/4) q0[42];
-cx q0[39],q0[42];
-rz(pi/4) q0[42];
-cx q0[41],q0[42];
-rz(pi/4) q0[41];
-rz(-pi/4) q0[42];
-cx q0[39],q0[42];
-cx q0[39],q0[41];
-rz(pi/4) q0[39];
-rz(-pi/4) q0[41];
-cx q0[39],q0[41];
-cx q0[40],q0[41];
-rz(pi/4) q0[42];
-cx q0[41],q0[42];
-rz(-pi/4) q0[42];
-cx q0[40],q0[42];
-rz(pi/4) q0[42];
-cx q0[41],q0[42];
-rz(pi/4) q0[41];
-rz(-pi/4) q0[42];
-cx q0[40],q0[42];
-cx q0[40],q0[41];
-rz(3*pi/4) q0[40];
-sx q0[40];
-rz(pi/2) q0[40];
-rz(-pi/4) q0[41];
-cx q0[39],q0[41];
-rz(pi/2) q0[39];
-sx q0[39];
-rz(pi/2) q0[39];
-cx q0[38],q0[39];
-rz(-pi/4) q0[39];
-cx q0[36],q0[39];
-rz(pi/4) q0[39];
-cx q0[38],q0[39];
-rz(pi/4) q0[38];
-rz(-pi/4) q0[39];
-cx q0[36],q0[39];
-cx q0[36],q0[38];
-rz(pi/4) q0[36];
-rz(-pi/4) q0[38];
-cx q0[36],q0[38];
-cx q0[37],q0[38];
-rz(pi/4) q0[39];
-cx q0[38],q0[39];
-rz(-pi/4) q0[39];
-cx q0[37],q0[39];
-rz(pi/4) q0[39];
-cx q0[38],q0[39];
-rz(pi/4) q0[38];
-rz(-pi/4) q0[39];
-cx q0[37],q0[39];
-cx q0[37],q0[38];
-rz(3*pi/4) q0[37];
-sx q0[37];
-rz(pi/2) q0[37];
-rz(-pi/4) q0[38];
-cx q0[36],q0[38];
-rz(pi/2) q0[36];
-sx q0[36];
-rz(pi/2) q0[36];
-cx q0[35],q0[36];
-rz(-pi/4) q0[36];
-cx q0[33],q0[36];
-rz(pi/4) q0[36];
-cx q0[35],q0[36];
-rz(pi/4) q0[35];
-rz(-pi/4) q0[36];
-cx q0[33],q0[36];
-cx q0[33],q0[35];
-rz(pi/4) q0[33];
-rz(-pi/4) q0[35];
-cx q0[33],q0[35];
-cx q0[34],q0[35];
-rz(pi/4) q0[36];
-cx q0[35],q0[36];
-rz(-pi/4) q0[36];
-cx q0[34],q0[36];
-rz(pi/4) q0[36];
-cx q0[35],q0[36];
-rz(pi/4) q0[35];
-rz(-pi/4) q0[36];
-cx q0[34],q0[36];
-cx q0[34],q0[35];
-rz(3*pi/4) q0[34];
-sx q0[34];
-rz(pi/2) q0[34];
-rz(-pi/4) q0[35];
-cx q0[33],q0[35];
-rz(pi/2) q0[33];
-sx q0[33];
-rz(pi/2) q0[33];
-cx q0[32],q0[33];
-rz(-pi/4) q0[33];
-cx q0[30],q0[33];
-rz(pi/4) q0[33];
-cx q0[32],q0[33];
-rz(pi/4) q0[32];
-rz(-pi/4) q0[33];
-cx q0[30],q0[33];
-cx q0[30],q0[32];
-rz(pi/4) q0[30];
-rz(-pi/4) q0[32];
-cx q0[30],q0[32];
-cx q0[31],q0[32];
-rz(pi/4) q0[33];
-cx q0[32],q0[33];
-rz(-pi/4) q0[33];
-cx q0[31],q0[33];
-rz(pi/4) q0[33];
-cx q0[32],q0[33];
-rz(pi/4) q0[32];
-rz(-pi/4) q0[33];
-cx q0[31],q0[33];
-cx q0[31],q0[32];
-rz(3*pi/4) q0[31];
-sx q0[31];
-rz(pi/2) q0[31];
-rz(-pi/4) q0[32];
-cx q0[30],q0[32];
-rz(pi/2) q0[30];
-sx q0[30];
-rz(pi/2) q0[30];
-cx q0[29],q0[30];
-rz(-pi/4) q0[30];
-cx q0[27],q0[30];
-rz(pi/4) q0[30];
-cx q0[29],q0[30];
-rz(pi/4) q0[29];
-rz(-pi/4) q0[30];
-cx q0[27],q0[30];
-cx q0[27],q0[29];
-rz(pi/4) q0[27];
-rz(-pi/4) q0[29];
-cx q0[27],q0[29];
-cx q0[28],q0[29];
-rz(pi/4) q0[30];
-cx q0[29],q0[30];
-rz(-pi/4) q0[30];
-cx q0[28],q0[30];
-rz(pi/4) q0[30];
-cx q0[29],q0[30];
-rz(pi/4) q0[29];
-rz(-pi/4) q0[30];
-cx q0[28],q0[30];
-cx q0[28],q0[29];
-rz(3*pi/4) q0[28];
-sx q0[28];
-rz(pi/2) q0[28];
-rz(-pi/4) q0[29];
-cx q0[27],q0[29];
-rz(pi/2) q0[27];
-sx q0[27];
-rz(pi/2) q0[27];
-cx q0[26],q0[27];
-rz(-pi/4) q0[27];
-cx q0[24],q0[27];
-rz(pi/4) q0[27];
-cx q0[26],q0[27];
-rz(pi/4) q0[26];
-rz(-pi/4) q0[27];
-cx q0[24],q0[27];
-cx q0[24],q0[26];
-rz(pi/4) q0[24];
-rz(-pi/4) q0[26];
-cx q0[24],q0[26];
-cx q0[25],q0[26];
-rz(pi/4) q0[27];
-cx q0[26],q0[27];
-rz(-pi/4) q0[27];
-cx q0[25],q0[27];
-rz(pi/4) q0[27];
-cx q0[26],q0[27];
-rz(pi/4) q0[26];
-rz(-pi/4) q0[27];
-cx q0[25],q0[27];
-cx q0[25],q0[26];
-rz(3*pi/4) q0[25];
-sx q0[25];
-rz(pi/2) q0[25];
-rz(-pi/4) q0[26];
-cx q0[24],q0[26];
-rz(pi/2) q0[24];
-sx q0[24];
-rz(pi/2) q0[24];
-cx q0[23],q0[24];
-rz(-pi/4) q0[24];
-cx q0[21],q0[24];
-rz(pi/4) q0[24];
-cx q0[23],q0[24];
-rz(pi/4) q0[23];
-rz(-pi/4) q0[24];
-cx q0[21],q0[24];
-cx q0[21],q0[23];
-rz(pi/4) q0[21];
-rz(-pi/4) q0[23];
-cx q0[21],q0[23];
-cx q0[22],q0[23];
-rz(pi/4) q0[24];
-cx q0[23],q0[24];
-rz(-pi/4) q0[24];
-cx q0[22],q0[24];
-rz(pi/4) q0[24];
-cx q0[23],q0[24];
-rz(pi/4) q0[23];
-rz(-pi/4) q0[24];
-cx q0[22],q0[24];
-cx q0[22],q0[23];
-rz(3*pi/4) q0[22];
-sx q0[22];
-rz(pi/2) q0[22];
-rz(-pi/4) q0[23];
-cx q0[21],q0[23];
-rz(pi/2) q0[21];
-sx q0[21];
-rz(pi/2) q0[21];
-cx q0[20],q0[21];
-rz(-pi/4) q0[21];
-cx q0[18],q0[21];
-rz(pi/4) q0[21];
-cx q0[20],q0[21];
-rz(pi/4) q0[20];
-rz(-pi/4) q0[21];
-cx q0[18],q0[21];
-cx q0[18],q0[20];
-rz(pi/4) q0[18];
-rz(-pi/4) q0[20];
-cx q0[18],q0[20];
-cx q0[19],q0[20];
-rz(pi/4) q0[21];
-cx q0[20],q0[21];
-rz(-pi/4) q0[21];
-cx q0[19],q0[21];
-rz(pi/4) q0[21];
-cx q0[20],q0[21];
-rz(pi/4) q0[20];
-rz(-pi/4) q0[21];
-cx q0[19],q0[21];
-cx q0[19],q0[20];
-rz(3*pi/4) q0[19];
-sx q0[19];
-rz(pi/2) q0[19];
-rz(-pi/4) q0[20];
-cx q0[18],q0[20];
-rz(pi/2) q0[18];
-sx q0[18];
-rz(pi/2) q0[18];
-cx q0[17],q0[18];
-rz(-pi/4) q0[18];
-cx q0[15],q0[18];
-rz(pi/4) q0[18];
-cx q0[17],q0[18];
-rz(pi/4) q0[17];
-rz(-pi/4) q0[18];
-cx q0[15],q0[18];
-cx q0[15],q0[17];
-rz(pi/4) q0[15];
-rz(-pi/4) q0[17];
-cx q0[15],q0[17];
-cx q0[16],q0[17];
-rz(pi/4) q0[18];
-cx q0[17],q0[18];
-rz(-pi/4) q0[18];
-cx q0[16],q0[18];
-rz(pi/4) q0[18];
-cx q0[17],q0[18];
-rz(pi/4) q0[17];
-rz(-pi/4) q0[18];
-cx q0[16],q0[18];
-cx q0[16],q0[17];
-rz(pi/4) q0[16];
-rz(-pi/4) q0[17];
-cx q0[15],q0[17];
-rz(pi/2) q0[15];
-sx q0[15];
-rz(pi/2) q0[15];
-cx q0[14],q0[15];
-rz(-pi/4) q0[15];
-cx q0[12],q0[15];
-rz(pi/4) q0[15];
-cx q0[14],q0[15];
-rz(pi/4) q0[14];
-rz(-pi/4) q0[15];
-cx q0[12],q0[15];
-cx q0[12],q0[14];
-rz(pi/4) q0[12];
-rz(-pi/4) q0[14];
-cx q0[12],q0[14];
-cx q0[13],q0[14];
-rz(pi/4) q0[15];
-cx q0[14],q0[15];
-rz(-pi/4) q0[15];
-cx q0[13],q0[15];
-rz(pi/4) q0[15];
-cx q0[14],q0[15];
-rz(pi/4) q0[14];
-rz(-pi/4) q0[15];
-cx q0[13],q0[15];
-cx q0[13],q0[14];
-rz(pi/4) q0[13];
-rz(-pi/4) q0[14];
-cx q0[12],q0[14];
-rz(pi/2) q0[12];
-sx q0[12];
-rz(pi/2) q0[12];
-cx q0[11],q0[12];
-rz(-pi/4) q0[12];
-rz(pi/4) q0[15];
-cx q0[14],q0[15];
-rz(-pi/4) q0[15];
-cx q0[13],q0[15];
-rz(pi/4) q0[15];
-cx q0[14],q0[15];
-rz(pi/4) q0[14];
-rz(-pi/4) q0[15];
-cx q0[13],q0[15];
-cx q0[13],q0[14];
-rz(pi/4) q0[13];
-rz(-pi/4) q0[14];
-rz(pi/4) q0[15];
-cx q0[14],q0[15];
-rz(-pi/4) q0[15];
-rz(pi/4) q0[18];
-cx q0[17],q0[18];
-rz(-pi/4) q0[18];
-cx q0[16],q0[18];
-rz(pi/4) q0[18];
-cx q0[17],q0[18];
-rz(pi/4) q0[17];
-rz(-pi/4) q0[18];
-cx q0[16],q0[18];
-cx q0[16],q0[17];
-rz(pi/4) q0[16];
-rz(-pi/4) q0[17];
-rz(pi/4) q0[18];
-cx q0[17],q0[18];
-rz(-pi/4) q0[18];
-rz(pi/4) q0[21];
-cx q0[20],q0[21];
-rz(-pi/4) q0[21];
-rz(pi/4) q0[24];
-cx q0[23],q0[24];
-rz(-pi/4) q0[24];
-rz(pi/4) q0[27];
-cx q0[26],q0[27];
-rz(-pi/4) q0[27];
-rz(pi/4) q0[30];
-cx q0[29],q0[30];
-rz(-pi/4) q0[30];
-rz(pi/4) q0[33];
-cx q0[32],q0[33];
-rz(-pi/4) q0[33];
-rz(pi/4) q0[36];
-cx q0[35],q0[36];
-rz(-pi/4) q0[36];
-rz(pi/4) q0[39];
-cx q0[38],q0[39];
-rz(-pi/4) q0[39];
-rz(pi/4) q0[42];
-cx q0[41],q0[42];
-rz(-pi/4) q0[42];
-rz(pi/2) q0[43];
-sx q0[43];
-rz(pi/2) q0[43];
-cx q0[45],q0[19];
-rz(-pi/4) q0[19];
-cx q0[46],q0[22];
-rz(-pi/4) q0[22];
-cx q0[47],q0[25];
-rz(-pi/4) q0[25];
-cx q0[48],q0[28];
-rz(-pi/4) q0[28];
-cx q0[49],q0[31];
-rz(-pi/4) q0[31];
-cx q0[50],q0[34];
-rz(-pi/4) q0[34];
-cx q0[51],q0[37];
-rz(-pi/4) q0[37];
-cx q0[52],q0[40];
-rz(-pi/4) q0[40];
-cx q0[66],q0[53];
-rz(-pi/4) q0[53];
-rz(pi/4) q0[66];
-cx q0[66],q0[53];
-cx q0[53],q0[43];
-rz(-pi/4) q0[43];
-cx q0[66],q0[19];
-rz(pi/4) q0[19];
-cx q0[45],q0[19];
-rz(-pi/4) q0[19];
-rz(pi/4) q0[45];
-cx q0[66],q0[19];
-rz(3*pi/4) q0[19];
-sx q0[19];
-rz(pi/2) q0[19];
-cx q0[19],q0[21];
-rz(pi/4) q0[21];
-cx q0[20],q0[21];
-rz(pi/4) q0[20];
-rz(-pi/4) q0[21];
-cx q0[19],q0[21];
-cx q0[19],q0[20];
-rz(pi/4) q0[19];
-rz(-pi/4) q0[20];
-rz(pi/4) q0[21];
-cx q0[20],q0[21];
-rz(-pi/4) q0[21];
-cx q0[66],q0[45];
-rz(-pi/4) q0[45];
-rz(pi/4) q0[66];
-cx q0[66],q0[45];
-cx q0[66],q0[22];
-rz(pi/4) q0[22];
-cx q0[46],q0[22];
-rz(-pi/4) q0[22];
-rz(pi/4) q0[46];
-cx q0[66],q0[22];
-rz(pi/4) q0[22];
-cx q0[45],q0[22];
-rz(-pi/4) q0[22];
-cx q0[66],q0[46];
-rz(-pi/4) q0[46];
-rz(pi/4) q0[66];
-cx q0[66],q0[46];
-cx q0[66],q0[25];
-rz(pi/4) q0[25];
-cx q0[47],q0[25];
-rz(-pi/4) q0[25];
-rz(pi/4) q0[47];
-cx q0[66],q0[25];
-rz(pi/4) q0[25];
-cx q0[46],q0[25];
-rz(-pi/4) q0[25];
-cx q0[66],q0[47];
-rz(-pi/4) q0[47];
-rz(pi/4) q0[66];
-cx q0[66],q0[47];
-cx q0[66],q0[28];
-rz(pi/4) q0[28];
-cx q0[48],q0[28];
-rz(-pi/4) q0[28];
-rz(pi/4) q0[48];
-cx q0[66],q0[28];
-rz(pi/4) q0[28];
-cx q0[47],q0[28];
-rz(-pi/4) q0[28];
-cx q0[66],q0[48];
-rz(-pi/4) q0[48];
-rz(pi/4) q0[66];
-cx q0[66],q0[48];
-cx q0[66],q0[31];
-rz(pi/4) q0[31];
-cx q0[49],q0[31];
-rz(-pi/4) q0[31];
-rz(pi/4) q0[49];
-cx q0[66],q0[31];
-rz(pi/4) q0[31];
-cx q0[48],q0[31];
-rz(-pi/4) q0[31];
-cx q0[66],q0[49];
-rz(-pi/4) q0[49];
-rz(pi/4) q0[66];
-cx q0[66],q0[49];
-cx q0[66],q0[34];
-rz(pi/4) q0[34];
-cx q0[50],q0[34];
-rz(-pi/4) q0[34];
-rz(pi/4) q0[50];
-cx q0[66],q0[34];
-rz(pi/4) q0[34];
-cx q0[49],q0[34];
-rz(-pi/4) q0[34];
-cx q0[66],q0[50];
-rz(-pi/4) q0[50];
-rz(pi/4) q0[66];
-cx q0[66],q0[50];
-cx q0[66],q0[37];
-rz(pi/4) q0[37];
-cx q0[51],q0[37];
-rz(-pi/4) q0[37];
-rz(pi/4) q0[51];
-cx q0[66],q0[37];
-rz(pi/4) q0[37];
-cx q0[50],q0[37];
-rz(-pi/4) q0[37];
-cx q0[66],q0[51];
-rz(-pi/4) q0[51];
-rz(pi/4) q0[66];
-cx q0[66],q0[51];
-cx q0[66],q0[40];
-rz(pi/4) q0[40];
-cx q0[52],q0[40];
-rz(-pi/4) q0[40];
-rz(pi/4) q0[52];
-cx q0[66],q0[40];
-rz(pi/4) q0[40];
-cx q0[51],q0[40];
-rz(-pi/4) q0[40];
-cx q0[66],q0[52];
-rz(-pi/4) q0[52];
-rz(pi/4) q0[66];
-cx q0[66],q0[52];
-cx q0[66],q0[43];
-rz(pi/4) q0[43];
-cx q0[53],q0[43];
-rz(-pi/4) q0[43];
-rz(pi/4) q0[53];
-cx q0[66],q0[43];
-rz(pi/4) q0[43];
-cx q0[52],q0[43];
-rz(-pi/4) q0[43];
-cx q0[66],q0[53];
-rz(-pi/4) q0[53];
-rz(pi/4) q0[66];
-cx q0[66],q0[53];
-cx q0[9],q0[12];
-rz(pi/4) q0[12];
-cx q0[11],q0[12];
-rz(pi/4) q0[11];
-rz(-pi/4) q0[12];
-cx q0[9],q0[12];
-rz(pi/4) q0[12];
-cx q0[9],q0[11];
-rz(-pi/4) q0[11];
-rz(pi/4) q0[9];
-cx q0[9],q0[11];
-cx q0[10],q0[11];
-cx q0[11],q0[12];
-rz(-pi/4) q0[12];
-cx q0[10],q0[12];
-rz(pi/4) q0[12];
-cx q0[11],q0[12];
-rz(pi/4) q0[11];
-rz(-pi/4) q0[12];
-cx q0[10],q0[12];
-cx q0[10],q0[11];
-rz(pi/4) q0[10];
-rz(-pi/4) q0[11];
-rz(pi/4) q0[12];
-cx q0[9],q0[11];
-cx q0[11],q0[12];
-rz(-pi/4) q0[12];
-cx q0[10],q0[12];
-rz(pi/4) q0[12];
-cx q0[11],q0[12];
-rz(pi/4) q0[11];
-rz(-pi/4) q0[12];
-cx q0[10],q0[12];
-cx q0[10],q0[11];
-rz(pi/4) q0[10];
-rz(-pi/4) q0[11];
-rz(pi/4) q0[12];
-cx q0[11],q0[12];
-rz(-pi/4) q0[12];
-rz(pi/2) q0[9];
-sx q0[9];
-rz(pi/2) q0[9];
-cx q0[8],q0[9];
-rz(-pi/4) q0[9];
-cx q0[6],q0[9];
-rz(pi/4) q0[9];
-cx q0[8],q0[9];
-rz(pi/4) q0[8];
-rz(-pi/4) q0[9];
-cx q0[6],q0[9];
-cx q0[6],q0[8];
-rz(pi/4) q0[6];
-rz(-pi/4) q0[8];
-cx q0[6],q0[8];
-cx q0[7],q0[8];
-rz(pi/4) q0[9];
-cx q0[8],q0[9];
-rz(-pi/4) q0[9];
-cx q0[7],q0[9];
-rz(pi/4) q0[9];
-cx q0[8],q0[9];
-rz(pi/4) q0[8];
-rz(-pi/4) q0[9];
-cx q0[7],q0[9];
-cx q0[7],q0[8];
-rz(pi/4) q0[7];
-rz(-pi/4) q0[8];
-cx q0[6],q0[8];
-rz(pi/2) q0[6];
-sx q0[6];
-rz(pi/2) q0[6];
-cx q0[5],q0[6];
-rz(-pi/4) q0[6];
-cx q0[3],q0[6];
-rz(pi/4) q0[6];
-cx q0[5],q0[6];
-rz(pi/4) q0[5];
-rz(-pi/4) q0[6];
-cx q0[3],q0[6];
-cx q0[3],q0[5];
-rz(pi/4) q0[3];
-rz(-pi/4) q0[5];
-cx q0[3],q0[5];
-cx q0[4],q0[5];
-rz(pi/4) q0[6];
-cx q0[5],q0[6];
-rz(-pi/4) q0[6];
-cx q0[4],q0[6];
-rz(pi/4) q0[6];
-cx q0[5],q0[6];
-rz(pi/4) q0[5];
-rz(-pi/4) q0[6];
-cx q0[4],q0[6];
-cx q0[4],q0[5];
-rz(pi/4) q0[4];
-rz(-pi/4) q0[5];
-cx q0[3],q0[5];
-rz(pi/2) q0[3];
-sx q0[3];
-rz(pi/2) q0[3];
-cx q0[2],q0[3];
-rz(-pi/4) q0[3];
-cx q0[0],q0[3];
-rz(pi/4) q0[3];
-cx q0[2],q0[3];
-rz(pi/4) q0[2];
-rz(-pi/4) q0[3];
-cx q0[0],q0[3];
-cx q0[0],q0[2];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[2];
-cx q0[0],q0[2];
-cx q0[1],q0[2];
-rz(pi/4) q0[3];
-cx q0[2],q0[3];
-rz(-pi/4) q0[3];
-cx q0[1],q0[3];
-rz(pi/4) q0[3];
-cx q0[2],q0[3];
-rz(pi/4) q0[2];
-rz(-pi/4) q0[3];
-cx q0[1],q0[3];
-cx q0[1],q0[2];
-rz(pi/4) q0[1];
-rz(-pi/4) q0[2];
-cx q0[0],q0[2];
-rz(pi/4) q0[3];
-cx q0[2],q0[3];
-rz(-pi/4) q0[3];
-cx q0[1],q0[3];
-rz(pi/4) q0[3];
-cx q0[2],q0[3];
-rz(pi/4) q0[2];
-rz(-pi/4) q0[3];
-cx q0[1],q0[3];
-cx q0[1],q0[2];
-rz(pi/4) q0[1];
-rz(-pi/4) q0[2];
-rz(pi/4) q0[3];
-cx q0[2],q0[3];
-rz(-pi/4) q0[3];
-cx q0[0],q0[3];
-rz(pi/4) q0[3];
-cx q0[2],q0[3];
-rz(pi/4) q0[2];
-rz(-pi/4) q0[3];
-cx q0[0],q0[3];
-cx q0[0],q0[2];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[2];
-cx q0[0],q0[2];
-rz(3*pi/4) q0[3];
-sx q0[3];
-rz(pi/2) q0[3];
-rz(pi/4) q0[6];
-cx q0[5],q0[6];
-rz(-pi/4) q0[6];
-cx q0[4],q0[6];
-rz(pi/4) q0[6];
-cx q0[5],q0[6];
-rz(pi/4) q0[5];
-rz(-pi/4) q0[6];
-cx q0[4],q0[6];
-cx q0[4],q0[5];
-rz(pi/4) q0[4];
-rz(-pi/4) q0[5];
-rz(pi/4) q0[6];
-cx q0[5],q0[6];
-rz(-pi/4) q0[6];
-cx q0[3],q0[6];
-rz(pi/4) q0[6];
-cx q0[5],q0[6];
-rz(pi/4) q0[5];
-rz(-pi/4) q0[6];
-cx q0[3],q0[6];
-cx q0[3],q0[5];
-rz(pi/4) q0[3];
-rz(-pi/4) q0[5];
-cx q0[3],q0[5];
-rz(3*pi/4) q0[6];
-sx q0[6];
-rz(pi/2) q0[6];
-rz(pi/4) q0[9];
-cx q0[8],q0[9];
-rz(-pi/4) q0[9];
-cx q0[7],q0[9];
-rz(pi/4) q0[9];
-cx q0[8],q0[9];
-rz(pi/4) q0[8];
-rz(-pi/4) q0[9];
-cx q0[7],q0[9];
-cx q0[7],q0[8];
-rz(pi/4) q0[7];
-rz(-pi/4) q0[8];
-rz(pi/4) q0[9];
-cx q0[8],q0[9];
-rz(-pi/4) q0[9];
-cx q0[6],q0[9];
-rz(pi/4) q0[9];
-cx q0[8],q0[9];
-rz(pi/4) q0[8];
-rz(-pi/4) q0[9];
-cx q0[6],q0[9];
-cx q0[6],q0[8];
-rz(pi/4) q0[6];
-rz(-pi/4) q0[8];
-cx q0[6],q0[8];
-rz(3*pi/4) q0[9];
-sx q0[9];
-rz(pi/2) q0[9];
-cx q0[9],q0[12];
-rz(pi/4) q0[12];
-cx q0[11],q0[12];
-rz(pi/4) q0[11];
-rz(-pi/4) q0[12];
-cx q0[9],q0[12];
-rz(3*pi/4) q0[12];
-sx q0[12];
-rz(pi/2) q0[12];
-cx q0[12],q0[15];
-rz(pi/4) q0[15];
-cx q0[14],q0[15];
-rz(pi/4) q0[14];
-rz(-pi/4) q0[15];
-cx q0[12],q0[15];
-cx q0[12],q0[14];
-rz(pi/4) q0[12];
-rz(-pi/4) q0[14];
-cx q0[12],q0[14];
-rz(3*pi/4) q0[15];
-sx q0[15];
-rz(pi/2) q0[15];
-cx q0[15],q0[18];
-rz(pi/4) q0[18];
-cx q0[17],q0[18];
-rz(pi/4) q0[17];
-rz(-pi/4) q0[18];
-cx q0[15],q0[18];
-cx q0[15],q0[17];
-rz(pi/4) q0[15];
-rz(-pi/4) q0[17];
-cx q0[15],q0[17];
-rz(3*pi/4) q0[18];
-sx q0[18];
-rz(pi/2) q0[18];
-cx q0[18],q0[21];
-rz(pi/4) q0[21];
-cx q0[20],q0[21];
-rz(pi/4) q0[20];
-rz(-pi/4) q0[21];
-cx q0[18],q0[21];
-cx q0[18],q0[20];
-rz(pi/4) q0[18];
-rz(-pi/4) q0[20];
-cx q0[18],q0[20];
-rz(3*pi/4) q0[21];
-sx q0[21];
-rz(pi/2) q0[21];
-cx q0[9],q0[11];
-rz(-pi/4) q0[11];
-rz(pi/4) q0[9];
-cx q0[9],q0[11];
-x q0[67];
-cx q0[67],q0[22];
-rz(pi/4) q0[22];
-cx q0[45],q0[22];
-rz(-pi/4) q0[22];
-rz(pi/4) q0[45];
-cx q0[67],q0[22];
-rz(3*pi/4) q0[22];
-sx q0[22];
-rz(pi/2) q0[22];
-cx q0[22],q0[24];
-rz(pi/4) q0[24];
-cx q0[23],q0[24];
-rz(pi/4) q0[23];
-rz(-pi/4) q0[24];
-cx q0[22],q0[24];
-cx q0[22],q0[23];
-rz(pi/4) q0[22];
-rz(-pi/4) q0[23];
-rz(pi/4) q0[24];
-cx q0[23],q0[24];
-rz(-pi/4) q0[24];
-cx q0[21],q0[24];
-rz(pi/4) q0[24];
-cx q0[23],q0[24];
-rz(pi/4) q0[23];
-rz(-pi/4) q0[24];
-cx q0[21],q0[24];
-cx q0[21],q0[23];
-rz(pi/4) q0[21];
-rz(-pi/4) q0[23];
-cx q0[21],q0[23];
-rz(3*pi/4) q0[24];
-sx q0[24];
-rz(pi/2) q0[24];
-cx q0[67],q0[45];
-rz(-pi/4) q0[45];
-rz(pi/4) q0[67];
-cx q0[67],q0[45];
-cx q0[67],q0[25];
-rz(pi/4) q0[25];
-cx q0[46],q0[25];
-rz(-pi/4) q0[25];
-rz(pi/4) q0[46];
-cx q0[67],q0[25];
-rz(3*pi/4) q0[25];
-sx q0[25];
-rz(pi/2) q0[25];
-cx q0[25],q0[27];
-rz(pi/4) q0[27];
-cx q0[26],q0[27];
-rz(pi/4) q0[26];
-rz(-pi/4) q0[27];
-cx q0[25],q0[27];
-cx q0[25],q0[26];
-rz(pi/4) q0[25];
-rz(-pi/4) q0[26];
-rz(pi/4) q0[27];
-cx q0[26],q0[27];
-rz(-pi/4) q0[27];
-cx q0[24],q0[27];
-rz(pi/4) q0[27];
-cx q0[26],q0[27];
-rz(pi/4) q0[26];
-rz(-pi/4) q0[27];
-cx q0[24],q0[27];
-cx q0[24],q0[26];
-rz(pi/4) q0[24];
-rz(-pi/4) q0[26];
-cx q0[24],q0[26];
-rz(3*pi/4) q0[27];
-sx q0[27];
-rz(pi/2) q0[27];
-cx q0[67],q0[46];
-rz(-pi/4) q0[46];
-rz(pi/4) q0[67];
-cx q0[67],q0[46];
-cx q0[67],q0[28];
-rz(pi/4) q0[28];
-cx q0[47],q0[28];
-rz(-pi/4) q0[28];
-rz(pi/4) q0[47];
-cx q0[67],q0[28];
-rz(3*pi/4) q0[28];
-sx q0[28];
-rz(pi/2) q0[28];
-cx q0[28],q0[30];
-rz(pi/4) q0[30];
-cx q0[29],q0[30];
-rz(pi/4) q0[29];
-rz(-pi/4) q0[30];
-cx q0[28],q0[30];
-cx q0[28],q0[29];
-rz(pi/4) q0[28];
-rz(-pi/4) q0[29];
-rz(pi/4) q0[30];
-cx q0[29],q0[30];
-rz(-pi/4) q0[30];
-cx q0[27],q0[30];
-rz(pi/4) q0[30];
-cx q0[29],q0[30];
-rz(pi/4) q0[29];
-rz(-pi/4) q0[30];
-cx q0[27],q0[30];
-cx q0[27],q0[29];
-rz(pi/4) q0[27];
-rz(-pi/4) q0[29];
-cx q0[27],q0[29];
-rz(3*pi/4) q0[30];
-sx q0[30];
-rz(pi/2) q0[30];
-cx q0[67],q0[47];
-rz(-pi/4) q0[47];
-rz(pi/4) q0[67];
-cx q0[67],q0[47];
-cx q0[67],q0[31];
-rz(pi/4) q0[31];
-cx q0[48],q0[31];
-rz(-pi/4) q0[31];
-rz(pi/4) q0[48];
-cx q0[67],q0[31];
-rz(3*pi/4) q0[31];
-sx q0[31];
-rz(pi/2) q0[31];
-cx q0[31],q0[33];
-rz(pi/4) q0[33];
-cx q0[32],q0[33];
-rz(pi/4) q0[32];
-rz(-pi/4) q0[33];
-cx q0[31],q0[33];
-cx q0[31],q0[32];
-rz(pi/4) q0[31];
-rz(-pi/4) q0[32];
-rz(pi/4) q0[33];
-cx q0[32],q0[33];
-rz(-pi/4) q0[33];
-cx q0[30],q0[33];
-rz(pi/4) q0[33];
-cx q0[32],q0[33];
-rz(pi/4) q0[32];
-rz(-pi/4) q0[33];
-cx q0[30],q0[33];
-cx q0[30],q0[32];
-rz(pi/4) q0[30];
-rz(-pi/4) q0[32];
-cx q0[30],q0[32];
-rz(3*pi/4) q0[33];
-sx q0[33];
-rz(pi/2) q0[33];
-cx q0[67],q0[48];
-rz(-pi/4) q0[48];
-rz(pi/4) q0[67];
-cx q0[67],q0[48];
-cx q0[67],q0[34];
-rz(pi/4) q0[34];
-cx q0[49],q0[34];
-rz(-pi/4) q0[34];
-rz(pi/4) q0[49];
-cx q0[67],q0[34];
-rz(3*pi/4) q0[34];
-sx q0[34];
-rz(pi/2) q0[34];
-cx q0[34],q0[36];
-rz(pi/4) q0[36];
-cx q0[35],q0[36];
-rz(pi/4) q0[35];
-rz(-pi/4) q0[36];
-cx q0[34],q0[36];
-cx q0[34],q0[35];
-rz(pi/4) q0[34];
-rz(-pi/4) q0[35];
-rz(pi/4) q0[36];
-cx q0[35],q0[36];
-rz(-pi/4) q0[36];
-cx q0[33],q0[36];
-rz(pi/4) q0[36];
-cx q0[35],q0[36];
-rz(pi/4) q0[35];
-rz(-pi/4) q0[36];
-cx q0[33],q0[36];
-cx q0[33],q0[35];
-rz(pi/4) q0[33];
-rz(-pi/4) q0[35];
-cx q0[33],q0[35];
-rz(3*pi/4) q0[36];
-sx q0[36];
-rz(pi/2) q0[36];
-cx q0[67],q0[49];
-rz(-pi/4) q0[49];
-rz(pi/4) q0[67];
-cx q0[67],q0[49];
-cx q0[67],q0[37];
-rz(pi/4) q0[37];
-cx q0[50],q0[37];
-rz(-pi/4) q0[37];
-rz(pi/4) q0[50];
-cx q0[67],q0[37];
-rz(3*pi/4) q0[37];
-sx q0[37];
-rz(pi/2) q0[37];
-cx q0[37],q0[39];
-rz(pi/4) q0[39];
-cx q0[38],q0[39];
-rz(pi/4) q0[38];
-rz(-pi/4) q0[39];
-cx q0[37],q0[39];
-cx q0[37],q0[38];
-rz(pi/4) q0[37];
-rz(-pi/4) q0[38];
-rz(pi/4) q0[39];
-cx q0[38],q0[39];
-rz(-pi/4) q0[39];
-cx q0[36],q0[39];
-rz(pi/4) q0[39];
-cx q0[38],q0[39];
-rz(pi/4) q0[38];
-rz(-pi/4) q0[39];
-cx q0[36],q0[39];
-cx q0[36],q0[38];
-rz(pi/4) q0[36];
-rz(-pi/4) q0[38];
-cx q0[36],q0[38];
-rz(3*pi/4) q0[39];
-sx q0[39];
-rz(pi/2) q0[39];
-cx q0[67],q0[50];
-rz(-pi/4) q0[50];
-rz(pi/4) q0[67];
-cx q0[67],q0[50];
-cx q0[67],q0[40];
-rz(pi/4) q0[40];
-cx q0[51],q0[40];
-rz(-pi/4) q0[40];
-rz(pi/4) q0[51];
-cx q0[67],q0[40];
-rz(3*pi/4) q0[40];
-sx q0[40];
-rz(pi/2) q0[40];
-cx q0[40],q0[42];
-rz(pi/4) q0[42];
-cx q0[41],q0[42];
-rz(pi/4) q0[41];
-rz(-pi/4) q0[42];
-cx q0[40],q0[42];
-cx q0[40],q0[41];
-rz(pi/4) q0[40];
-rz(-pi/4) q0[41];
-rz(pi/4) q0[42];
-cx q0[41],q0[42];
-rz(-pi/4) q0[42];
-cx q0[39],q0[42];
-rz(pi/4) q0[42];
-cx q0[41],q0[42];
-rz(pi/4) q0[41];
-rz(-pi/4) q0[42];
-cx q0[39],q0[42];
-cx q0[39],q0[41];
-rz(pi/4) q0[39];
-rz(-pi/4) q0[41];
-cx q0[39],q0[41];
-rz(3*pi/4) q0[42];
-sx q0[42];
-rz(pi/2) q0[42];
-cx q0[67],q0[51];
-rz(-pi/4) q0[51];
-rz(pi/4) q0[67];
-cx q0[67],q0[51];
-cx q0[67],q0[43];
-rz(pi/4) q0[43];
-cx q0[52],q0[43];
-rz(-pi/4) q0[43];
-rz(pi/4) q0[52];
-cx q0[67],q0[43];
-rz(3*pi/4) q0[43];
-sx q0[43];
-rz(pi/2) q0[43];
-cx q0[43],q0[44];
-cx q0[42],q0[44];
-rz(pi/2) q0[42];
-sx q0[42];
-rz(pi/2) q0[42];
-cx q0[41],q0[42];
-rz(-pi/4) q0[42];
-cx q0[39],q0[42];
-rz(pi/4) q0[42];
-cx q0[41],q0[42];
-rz(pi/4) q0[41];
-rz(-pi/4) q0[42];
-cx q0[39],q0[42];
-cx q0[39],q0[41];
-rz(pi/4) q0[39];
-rz(-pi/4) q0[41];
-cx q0[39],q0[41];
-cx q0[40],q0[41];
-rz(pi/4) q0[42];
-cx q0[41],q0[42];
-rz(-pi/4) q0[42];
-cx q0[40],q0[42];
-rz(pi/4) q0[42];
-cx q0[41],q0[42];
-rz(pi/4) q0[41];
-rz(-pi/4) q0[42];
-cx q0[40],q0[42];
-cx q0[40],q0[41];
-rz(3*pi/4) q0[40];
-sx q0[40];
-rz(pi/2) q0[40];
-rz(-pi/4) q0[41];
-cx q0[39],q0[41];
-rz(pi/2) q0[39];
-sx q0[39];
-rz(pi/2) q0[39];
-cx q0[38],q0[39];
-rz(-pi/4) q0[39];
-cx q0[36],q0[39];
-rz(pi/4) q0[39];
-cx q0[38],q0[39];
-rz(pi/4) q0[38];
-rz(-pi/4) q0[39];
-cx q0[36],q0[39];
-cx q0[36],q0[38];
-rz(pi/4) q0[36];
-rz(-pi/4) q0[38];
-cx q0[36],q0[38];
-cx q0[37],q0[38];
-rz(pi/4) q0[39];
-cx q0[38],q0[39];
-rz(-pi/4) q0[39];
-cx q0[37],q0[39];
-rz(pi/4) q0[39];
-cx q0[38],q0[39];
-rz(pi/4) q0[38];
-rz(-pi/4) q0[39];
-cx q0[37],q0[39];
-cx q0[37],q0[38];
-rz(3*pi/4) q0[37];
-sx q0[37];
-rz(pi/2) q0[37];
-rz(-pi/4) q0[38];
-cx q0[36],q0[38];
-rz(pi/2) q0[36];
-sx q0[36];
-rz(pi/2) q0[36];
-cx q0[35],q0[36];
-rz(-pi/4) q0[36];
-cx q0[33],q0[36];
-rz(pi/4) q0[36];
-cx q0[35],q0[36];
-rz(pi/4) q0[35];
-rz(-pi/4) q0[36];
-cx q0[33],q0[36];
-cx q0[33],q0[35];
-rz(pi/4) q0[33];
-rz(-pi/4) q0[35];
-cx q0[33],q0[35];
-cx q0[34],q0[35];
-rz(pi/4) q0[36];
-cx q0[35],q0[36];
-rz(-pi/4) q0[36];
-cx q0[34],q0[36];
-rz(pi/4) q0[36];
-cx q0[35],q0[36];
-rz(pi/4) q0[35];
-rz(-pi/4) q0[36];
-cx q0[34],q0[36];
-cx q0[34],q0[35];
-rz(3*pi/4) q0[34];
-sx q0[34];
-rz(pi/2) q0[34];
-rz(-pi/4) q0[35];
-cx q0[33],q0[35];
-rz(pi/2) q0[33];
-sx q0[33];
-rz(pi/2) q0[33];
-cx q0[32],q0[33];
-rz(-pi/4) q0[33];
-cx q0[30],q0[33];
-rz(pi/4) q0[33];
-cx q0[32],q0[33];
-rz(pi/4) q0[32];
-rz(-pi/4) q0[33];
-cx q0[30],q0[33];
-cx q0[30],q0[32];
-rz(pi/4) q0[30];
-rz(-pi/4) q0[32];
-cx q0[30],q0[32];
-cx q0[31],q0[32];
-rz(pi/4) q0[33];
-cx q0[32],q0[33];
-rz(-pi/4) q0[33];
-cx q0[31],q0[33];
-rz(pi/4) q0[33];
-cx q0[32],q0[33];
-rz(pi/4) q0[32];
-rz(-pi/4) q0[33];
-cx q0[31],q0[33];
-cx q0[31],q0[32];
-rz(3*pi/4) q0[31];
-sx q0[31];
-rz(pi/2) q0[31];
-rz(-pi/4) q0[32];
-cx q0[30],q0[32];
-rz(pi/2) q0[30];
-sx q0[30];
-rz(pi/2) q0[30];
-cx q0[29],q0[30];
-rz(-pi/4) q0[30];
-cx q0[27],q0[30];
-rz(pi/4) q0[30];
-cx q0[29],q0[30];
-rz(pi/4) q0[29];
-rz(-pi/4) q0[30];
-cx q0[27],q0[30];
-cx q0[27],q0[29];
-rz(pi/4) q0[27];
-rz(-pi/4) q0[29];
-cx q0[27],q0[29];
-cx q0[28],q0[29];
-rz(pi/4) q0[30];
-cx q0[29],q0[30];
-rz(-pi/4) q0[30];
-cx q0[28],q0[30];
-rz(pi/4) q0[30];
-cx q0[29],q0[30];
-rz(pi/4) q0[29];
-rz(-pi/4) q0[30];
-cx q0[28],q0[30];
-cx q0[28],q0[29];
-rz(3*pi/4) q0[28];
-sx q0[28];
-rz(pi/2) q0[28];
-rz(-pi/4) q0[29];
-cx q0[27],q0[29];
-rz(pi/2) q0[27];
-sx q0[27];
-rz(pi/2) q0[27];
-cx q0[26],q0[27];
-rz(-pi/4) q0[27];
-cx q0[24],q0[27];
-rz(pi/4) q0[27];
-cx q0[26],q0[27];
-rz(pi/4) q0[26];
-rz(-pi/4) q0[27];
-cx q0[24],q0[27];
-cx q0[24],q0[26];
-rz(pi/4) q0[24];
-rz(-pi/4) q0[26];
-cx q0[24],q0[26];
-cx q0[25],q0[26];
-rz(pi/4) q0[27];
-cx q0[26],q0[27];
-rz(-pi/4) q0[27];
-cx q0[25],q0[27];
-rz(pi/4) q0[27];
-cx q0[26],q0[27];
-rz(pi/4) q0[26];
-rz(-pi/4) q0[27];
-cx q0[25],q0[27];
-cx q0[25],q0[26];
-rz(3*pi/4) q0[25];
-sx q0[25];
-rz(pi/2) q0[25];
-rz(-pi/4) q0[26];
-cx q0[24],q0[26];
-rz(pi/2) q0[24];
-sx q0[24];
-rz(pi/2) q0[24];
-cx q0[23],q0[24];
-rz(-pi/4) q0[24];
-cx q0[21],q0[24];
-rz(pi/4) q0[24];
-cx q0[23],q0[24];
-rz(pi/4) q0[23];
-rz(-pi/4) q0[24];
-cx q0[21],q0[24];
-cx q0[21],q0[23];
-rz(pi/4) q0[21];
-rz(-pi/4) q0[23];
-cx q0[21],q0[23];
-cx q0[22],q0[23];
-rz(pi/4) q0[24];
-cx q0[23],q0[24];
-rz(-pi/4) q0[24];
-cx q0[22],q0[24];
-rz(pi/4) q0[24];
-cx q0[23],q0[24];
-rz(pi/4) q0[23];
-rz(-pi/4) q0[24];
-cx q0[22],q0[24];
-cx q0[22],q0[23];
-rz(3*pi/4) q0[22];
-sx q0[22];
-rz(pi/2) q0[22];
-rz(-pi/4) q0[23];
-cx q0[21],q0[23];
-rz(pi/2) q0[21];
-sx q0[21];
-rz(pi/2) q0[21];
-cx q0[20],q0[21];
-rz(-pi/4) q0[21];
-cx q0[18],q0[21];
-rz(pi/4) q0[21];
-cx q0[20],q0[21];
-rz(pi/4) q0[20];
-rz(-pi/4) q0[21];
-cx q0[18],q0[21];
-cx q0[18],q0[20];
-rz(pi/4) q0[18];
-rz(-pi/4) q0[20];
-cx q0[18],q0[20];
-cx q0[19],q0[20];
-rz(pi/4) q0[21];
-cx q0[20],q0[21];
-rz(-pi/4) q0[21];
-cx q0[19],q0[21];
-rz(pi/4) q0[21];
-cx q0[20],q0[21];
-rz(pi/4) q0[20];
-rz(-pi/4) q0[21];
-cx q0[19],q0[21];
-cx q0[19],q0[20];
-rz(pi/4) q0[19];
-rz(-pi/4) q0[20];
-cx q0[18],q0[20];
-rz(pi/2) q0[18];
-sx q0[18];
-rz(pi/2) q0[18];
-cx q0[17],q0[18];
-rz(-pi/4) q0[18];
-cx q0[15],q0[18];
-rz(pi/4) q0[18];
-cx q0[17],q0[18];
-rz(pi/4) q0[17];
-rz(-pi/4) q0[18];
-cx q0[15],q0[18];
-cx q0[15],q0[17];
-rz(pi/4) q0[15];
-rz(-pi/4) q0[17];
-cx q0[15],q0[17];
-cx q0[16],q0[17];
-rz(pi/4) q0[18];
-cx q0[17],q0[18];
-rz(-pi/4) q0[18];
-cx q0[16],q0[18];
-rz(pi/4) q0[18];
-cx q0[17],q0[18];
-rz(pi/4) q0[17];
-rz(-pi/4) q0[18];
-cx q0[16],q0[18];
-cx q0[16],q0[17];
-rz(pi/4) q0[16];
-rz(-pi/4) q0[17];
-cx q0[15],q0[17];
-rz(pi/2) q0[15];
-sx q0[15];
-rz(pi/2) q0[15];
-cx q0[14],q0[15];
-rz(-pi/4) q0[15];
-cx q0[12],q0[15];
-rz(pi/4) q0[15];
-cx q0[14],q0[15];
-rz(pi/4) q0[14];
-rz(-pi/4) q0[15];
-cx q0[12],q0[15];
-cx q0[12],q0[14];
-rz(pi/4) q0[12];
-rz(-pi/4) q0[14];
-cx q0[12],q0[14];
-cx q0[13],q0[14];
-rz(pi/4) q0[15];
-cx q0[14],q0[15];
-rz(-pi/4) q0[15];
-cx q0[13],q0[15];
-rz(pi/4) q0[15];
-cx q0[14],q0[15];
-rz(pi/4) q0[14];
-rz(-pi/4) q0[15];
-cx q0[13],q0[15];
-cx q0[13],q0[14];
-rz(pi/4) q0[13];
-rz(-pi/4) q0[14];
-cx q0[12],q0[14];
-rz(pi/2) q0[12];
-sx q0[12];
-rz(pi/2) q0[12];
-cx q0[11],q0[12];
-rz(-pi/4) q0[12];
-rz(pi/4) q0[15];
-cx q0[14],q0[15];
-rz(-pi/4) q0[15];
-cx q0[13],q0[15];
-rz(pi/4) q0[15];
-cx q0[14],q0[15];
-rz(pi/4) q0[14];
-rz(-pi/4) q0[15];
-cx q0[13],q0[15];
-cx q0[13],q0[14];
-rz(pi/4) q0[13];
-rz(-pi/4) q0[14];
-rz(pi/4) q0[15];
-cx q0[14],q0[15];
-rz(-pi/4) q0[15];
-rz(pi/4) q0[18];
-cx q0[17],q0[18];
-rz(-pi/4) q0[18];
-cx q0[16],q0[18];
-rz(pi/4) q0[18];
-cx q0[17],q0[18];
-rz(pi/4) q0[17];
-rz(-pi/4) q0[18];
-cx q0[16],q0[18];
-cx q0[16],q0[17];
-rz(pi/4) q0[16];
-rz(-pi/4) q0[17];
-rz(pi/4) q0[18];
-cx q0[17],q0[18];
-rz(-pi/4) q0[18];
-rz(pi/4) q0[21];
-cx q0[20],q0[21];
-rz(-pi/4) q0[21];
-cx q0[19],q0[21];
-rz(pi/4) q0[21];
-cx q0[20],q0[21];
-rz(pi/4) q0[20];
-rz(-pi/4) q0[21];
-cx q0[19],q0[21];
-cx q0[19],q0[20];
-rz(pi/4) q0[19];
-rz(-pi/4) q0[20];
-rz(pi/4) q0[21];
-cx q0[20],q0[21];
-rz(-pi/4) q0[21];
-rz(pi/4) q0[24];
-cx q0[23],q0[24];
-rz(-pi/4) q0[24];
-rz(pi/4) q0[27];
-cx q0[26],q0[27];
-rz(-pi/4) q0[27];
-rz(pi/4) q0[30];
-cx q0[29],q0[30];
-rz(-pi/4) q0[30];
-rz(pi/4) q0[33];
-cx q0[32],q0[33];
-rz(-pi/4) q0[33];
-rz(pi/4) q0[36];
-cx q0[35],q0[36];
-rz(-pi/4) q0[36];
-rz(pi/4) q0[39];
-cx q0[38],q0[39];
-rz(-pi/4) q0[39];
-rz(pi/4) q0[42];
-cx q0[41],q0[42];
-rz(-pi/4) q0[42];
-rz(pi/2) q0[43];
-sx q0[43];
-rz(pi/2) q0[43];
-cx q0[45],q0[22];
-rz(-pi/4) q0[22];
-cx q0[46],q0[25];
-rz(-pi/4) q0[25];
-cx q0[47],q0[28];
-rz(-pi/4) q0[28];
-cx q0[48],q0[31];
-rz(-pi/4) q0[31];
-cx q0[49],q0[34];
-rz(-pi/4) q0[34];
-cx q0[50],q0[37];
-rz(-pi/4) q0[37];
-cx q0[51],q0[40];
-rz(-pi/4) q0[40];
-cx q0[67],q0[52];
-rz(-pi/4) q0[52];
-rz(pi/4) q0[67];
-cx q0[67],q0[52];
-cx q0[52],q0[43];
-rz(-pi/4) q0[43];
-cx q0[67],q0[22];
-rz(pi/4) q0[22];
-cx q0[45],q0[22];
-rz(-pi/4) q0[22];
-rz(pi/4) q0[45];
-cx q0[67],q0[22];
-rz(3*pi/4) q0[22];
-sx q0[22];
-rz(pi/2) q0[22];
-cx q0[22],q0[24];
-rz(pi/4) q0[24];
-cx q0[23],q0[24];
-rz(pi/4) q0[23];
-rz(-pi/4) q0[24];
-cx q0[22],q0[24];
-cx q0[22],q0[23];
-rz(pi/4) q0[22];
-rz(-pi/4) q0[23];
-rz(pi/4) q0[24];
-cx q0[23],q0[24];
-rz(-pi/4) q0[24];
-cx q0[67],q0[45];
-rz(-pi/4) q0[45];
-rz(pi/4) q0[67];
-cx q0[67],q0[45];
-cx q0[67],q0[25];
-rz(pi/4) q0[25];
-cx q0[46],q0[25];
-rz(-pi/4) q0[25];
-rz(pi/4) q0[46];
-cx q0[67],q0[25];
-rz(pi/4) q0[25];
-cx q0[45],q0[25];
-rz(-pi/4) q0[25];
-cx q0[67],q0[46];
-rz(-pi/4) q0[46];
-rz(pi/4) q0[67];
-cx q0[67],q0[46];
-cx q0[67],q0[28];
-rz(pi/4) q0[28];
-cx q0[47],q0[28];
-rz(-pi/4) q0[28];
-rz(pi/4) q0[47];
-cx q0[67],q0[28];
-rz(pi/4) q0[28];
-cx q0[46],q0[28];
-rz(-pi/4) q0[28];
-cx q0[67],q0[47];
-rz(-pi/4) q0[47];
-rz(pi/4) q0[67];
-cx q0[67],q0[47];
-cx q0[67],q0[31];
-rz(pi/4) q0[31];
-cx q0[48],q0[31];
-rz(-pi/4) q0[31];
-rz(pi/4) q0[48];
-cx q0[67],q0[31];
-rz(pi/4) q0[31];
-cx q0[47],q0[31];
-rz(-pi/4) q0[31];
-cx q0[67],q0[48];
-rz(-pi/4) q0[48];
-rz(pi/4) q0[67];
-cx q0[67],q0[48];
-cx q0[67],q0[34];
-rz(pi/4) q0[34];
-cx q0[49],q0[34];
-rz(-pi/4) q0[34];
-rz(pi/4) q0[49];
-cx q0[67],q0[34];
-rz(pi/4) q0[34];
-cx q0[48],q0[34];
-rz(-pi/4) q0[34];
-cx q0[67],q0[49];
-rz(-pi/4) q0[49];
-rz(pi/4) q0[67];
-cx q0[67],q0[49];
-cx q0[67],q0[37];
-rz(pi/4) q0[37];
-cx q0[50],q0[37];
-rz(-pi/4) q0[37];
-rz(pi/4) q0[50];
-cx q0[67],q0[37];
-rz(pi/4) q0[37];
-cx q0[49],q0[37];
-rz(-pi/4) q0[37];
-cx q0[67],q0[50];
-rz(-pi/4) q0[50];
-rz(pi/4) q0[67];
-cx q0[67],q0[50];
-cx q0[67],q0[40];
-rz(pi/4) q0[40];
-cx q0[51],q0[40];
-rz(-pi/4) q0[40];
-rz(pi/4) q0[51];
-cx q0[67],q0[40];
-rz(pi/4) q0[40];
-cx q0[50],q0[40];
-rz(-pi/4) q0[40];
-cx q0[67],q0[51];
-rz(-pi/4) q0[51];
-rz(pi/4) q0[67];
-cx q0[67],q0[51];
-cx q0[67],q0[43];
-rz(pi/4) q0[43];
-cx q0[52],q0[43];
-rz(-pi/4) q0[43];
-rz(pi/4) q0[52];
-cx q0[67],q0[43];
-rz(pi/4) q0[43];
-cx q0[51],q0[43];
-rz(-pi/4) q0[43];
-cx q0[67],q0[52];
-rz(-pi/4) q0[52];
-rz(pi/4) q0[67];
-cx q0[67],q0[52];
-cx q0[9],q0[12];
-rz(pi/4) q0[12];
-cx q0[11],q0[12];
-rz(pi/4) q0[11];
-rz(-pi/4) q0[12];
-cx q0[9],q0[12];
-rz(pi/4) q0[12];
-cx q0[9],q0[11];
-rz(-pi/4) q0[11];
-rz(pi/4) q0[9];
-cx q0[9],q0[11];
-cx q0[10],q0[11];
-cx q0[11],q0[12];
-rz(-pi/4) q0[12];
-cx q0[10],q0[12];
-rz(pi/4) q0[12];
-cx q0[11],q0[12];
-rz(pi/4) q0[11];
-rz(-pi/4) q0[12];
-cx q0[10],q0[12];
-cx q0[10],q0[11];
-rz(pi/4) q0[10];
-rz(-pi/4) q0[11];
-rz(pi/4) q0[12];
-cx q0[9],q0[11];
-cx q0[11],q0[12];
-rz(-pi/4) q0[12];
-cx q0[10],q0[12];
-rz(pi/4) q0[12];
-cx q0[11],q0[12];
-rz(pi/4) q0[11];
-rz(-pi/4) q0[12];
-cx q0[10],q0[12];
-cx q0[10],q0[11];
-rz(pi/4) q0[10];
-rz(-pi/4) q0[11];
-rz(pi/4) q0[12];
-cx q0[11],q0[12];
-rz(-pi/4) q0[12];
-rz(pi/2) q0[9];
-sx q0[9];
-rz(pi/2) q0[9];
-cx q0[8],q0[9];
-rz(-pi/4) q0[9];
-cx q0[6],q0[9];
-rz(pi/4) q0[9];
-cx q0[8],q0[9];
-rz(pi/4) q0[8];
-rz(-pi/4) q0[9];
-cx q0[6],q0[9];
-cx q0[6],q0[8];
-rz(pi/4) q0[6];
-rz(-pi/4) q0[8];
-cx q0[6],q0[8];
-cx q0[7],q0[8];
-rz(pi/4) q0[9];
-cx q0[8],q0[9];
-rz(-pi/4) q0[9];
-cx q0[7],q0[9];
-rz(pi/4) q0[9];
-cx q0[8],q0[9];
-rz(pi/4) q0[8];
-rz(-pi/4) q0[9];
-cx q0[7],q0[9];
-cx q0[7],q0[8];
-rz(pi/4) q0[7];
-rz(-pi/4) q0[8];
-cx q0[6],q0[8];
-rz(pi/2) q0[6];
-sx q0[6];
-rz(pi/2) q0[6];
-cx q0[5],q0[6];
-rz(-pi/4) q0[6];
-cx q0[3],q0[6];
-rz(pi/4) q0[6];
-cx q0[5],q0[6];
-rz(pi/4) q0[5];
-rz(-pi/4) q0[6];
-cx q0[3],q0[6];
-cx q0[3],q0[5];
-rz(pi/4) q0[3];
-rz(-pi/4) q0[5];
-cx q0[3],q0[5];
-cx q0[4],q0[5];
-rz(pi/4) q0[6];
-cx q0[5],q0[6];
-rz(-pi/4) q0[6];
-cx q0[4],q0[6];
-rz(pi/4) q0[6];
-cx q0[5],q0[6];
-rz(pi/4) q0[5];
-rz(-pi/4) q0[6];
-cx q0[4],q0[6];
-cx q0[4],q0[5];
-rz(pi/4) q0[4];
-rz(-pi/4) q0[5];
-cx q0[3],q0[5];
-rz(pi/2) q0[3];
-sx q0[3];
-rz(pi/2) q0[3];
-cx q0[2],q0[3];
-rz(-pi/4) q0[3];
-cx q0[0],q0[3];
-rz(pi/4) q0[3];
-cx q0[2],q0[3];
-rz(pi/4) q0[2];
-rz(-pi/4) q0[3];
-cx q0[0],q0[3];
-cx q0[0],q0[2];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[2];
-cx q0[0],q0[2];
-cx q0[1],q0[2];
-rz(pi/4) q0[3];
-cx q0[2],q0[3];
-rz(-pi/4) q0[3];
-cx q0[1],q0[3];
-rz(pi/4) q0[3];
-cx q0[2],q0[3];
-rz(pi/4) q0[2];
-rz(-pi/4) q0[3];
-cx q0[1],q0[3];
-cx q0[1],q0[2];
-rz(pi/4) q0[1];
-rz(-pi/4) q0[2];
-cx q0[0],q0[2];
-rz(pi/4) q0[3];
-cx q0[2],q0[3];
-rz(-pi/4) q0[3];
-cx q0[1],q0[3];
-rz(pi/4) q0[3];
-cx q0[2],q0[3];
-rz(pi/4) q0[2];
-rz(-pi/4) q0[3];
-cx q0[1],q0[3];
-cx q0[1],q0[2];
-rz(pi/4) q0[1];
-rz(-pi/4) q0[2];
-rz(pi/4) q0[3];
-cx q0[2],q0[3];
-rz(-pi/4) q0[3];
-cx q0[0],q0[3];
-rz(pi/4) q0[3];
-cx q0[2],q0[3];
-rz(pi/4) q0[2];
-rz(-pi/4) q0[3];
-cx q0[0],q0[3];
-cx q0[0],q0[2];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[2];
-cx q0[0],q0[2];
-rz(3*pi/4) q0[3];
-sx q0[3];
-rz(pi/2) q0[3];
-rz(pi/4) q0[6];
-cx q0[5],q0[6];
-rz(-pi/4) q0[6];
-cx q0[4],q0[6];
-rz(pi/4) q0[6];
-cx q0[5],q0[6];
-rz(pi/4) q0[5];
-rz(-pi/4) q0[6];
-cx q0[4],q0[6];
-cx q0[4],q0[5];
-rz(pi/4) q0[4];
-rz(-pi/4) q0[5];
-rz(pi/4) q0[6];
-cx q0[5],q0[6];
-rz(-pi/4) q0[6];
-cx q0[3],q0[6];
-rz(pi/4) q0[6];
-cx q0[5],q0[6];
-rz(pi/4) q0[5];
-rz(-pi/4) q0[6];
-cx q0[3],q0[6];
-cx q0[3],q0[5];
-rz(pi/4) q0[3];
-rz(-pi/4) q0[5];
-cx q0[3],q0[5];
-rz(3*pi/4) q0[6];
-sx q0[6];
-rz(pi/2) q0[6];
-rz(pi/4) q0[9];
-cx q0[8],q0[9];
-rz(-pi/4) q0[9];
-cx q0[7],q0[9];
-rz(pi/4) q0[9];
-cx q0[8],q0[9];
-rz(pi/4) q0[8];
-rz(-pi/4) q0[9];
-cx q0[7],q0[9];
-cx q0[7],q0[8];
-rz(pi/4) q0[7];
-rz(-pi/4) q0[8];
-rz(pi/4) q0[9];
-cx q0[8],q0[9];
-rz(-pi/4) q0[9];
-cx q0[6],q0[9];
-rz(pi/4) q0[9];
-cx q0[8],q0[9];
-rz(pi/4) q0[8];
-rz(-pi/4) q0[9];
-cx q0[6],q0[9];
-cx q0[6],q0[8];
-rz(pi/4) q0[6];
-rz(-pi/4) q0[8];
-cx q0[6],q0[8];
-rz(3*pi/4) q0[9];
-sx q0[9];
-rz(pi/2) q0[9];
-cx q0[9],q0[12];
-rz(pi/4) q0[12];
-cx q0[11],q0[12];
-rz(pi/4) q0[11];
-rz(-pi/4) q0[12];
-cx q0[9],q0[12];
-rz(3*pi/4) q0[12];
-sx q0[12];
-rz(pi/2) q0[12];
-cx q0[12],q0[15];
-rz(pi/4) q0[15];
-cx q0[14],q0[15];
-rz(pi/4) q0[14];
-rz(-pi/4) q0[15];
-cx q0[12],q0[15];
-cx q0[12],q0[14];
-rz(pi/4) q0[12];
-rz(-pi/4) q0[14];
-cx q0[12],q0[14];
-rz(3*pi/4) q0[15];
-sx q0[15];
-rz(pi/2) q0[15];
-cx q0[15],q0[18];
-rz(pi/4) q0[18];
-cx q0[17],q0[18];
-rz(pi/4) q0[17];
-rz(-pi/4) q0[18];
-cx q0[15],q0[18];
-cx q0[15],q0[17];
-rz(pi/4) q0[15];
-rz(-pi/4) q0[17];
-cx q0[15],q0[17];
-rz(3*pi/4) q0[18];
-sx q0[18];
-rz(pi/2) q0[18];
-cx q0[18],q0[21];
-rz(pi/4) q0[21];
-cx q0[20],q0[21];
-rz(pi/4) q0[20];
-rz(-pi/4) q0[21];
-cx q0[18],q0[21];
-cx q0[18],q0[20];
-rz(pi/4) q0[18];
-rz(-pi/4) q0[20];
-cx q0[18],q0[20];
-rz(3*pi/4) q0[21];
-sx q0[21];
-rz(pi/2) q0[21];
-cx q0[21],q0[24];
-rz(pi/4) q0[24];
-cx q0[23],q0[24];
-rz(pi/4) q0[23];
-rz(-pi/4) q0[24];
-cx q0[21],q0[24];
-cx q0[21],q0[23];
-rz(pi/4) q0[21];
-rz(-pi/4) q0[23];
-cx q0[21],q0[23];
-rz(3*pi/4) q0[24];
-sx q0[24];
-rz(pi/2) q0[24];
-cx q0[9],q0[11];
-rz(-pi/4) q0[11];
-rz(pi/4) q0[9];
-cx q0[9],q0[11];
-x q0[68];
-cx q0[68],q0[25];
-rz(pi/4) q0[25];
-cx q0[45],q0[25];
-rz(-pi/4) q0[25];
-rz(pi/4) q0[45];
-cx q0[68],q0[25];
-rz(3*pi/4) q0[25];
-sx q0[25];
-rz(pi/2) q0[25];
-cx q0[25],q0[27];
-rz(pi/4) q0[27];
-cx q0[26],q0[27];
-rz(pi/4) q0[26];
-rz(-pi/4) q0[27];
-cx q0[25],q0[27];
-cx q0[25],q0[26];
-rz(pi/4) q0[25];
-rz(-pi/4) q0[26];
-rz(pi/4) q0[27];
-cx q0[26],q0[27];
-rz(-pi/4) q0[27];
-cx q0[24],q0[27];
-rz(pi/4) q0[27];
-cx q0[26],q0[27];
-rz(pi/4) q0[26];
-rz(-pi/4) q0[27];
-cx q0[24],q0[27];
-cx q0[24],q0[26];
-rz(pi/4) q0[24];
-rz(-pi/4) q0[26];
-cx q0[24],q0[26];
-rz(3*pi/4) q0[27];
-sx q0[27];
-rz(pi/2) q0[27];
-cx q0[68],q0[45];
-rz(-pi/4) q0[45];
-rz(pi/4) q0[68];
-cx q0[68],q0[45];
-cx q0[68],q0[28];
-rz(pi/4) q0[28];
-cx q0[46],q0[28];
-rz(-pi/4) q0[28];
-rz(pi/4) q0[46];
-cx q0[68],q0[28];
-rz(3*pi/4) q0[28];
-sx q0[28];
-rz(pi/2) q0[28];
-cx q0[28],q0[30];
-rz(pi/4) q0[30];
-cx q0[29],q0[30];
-rz(pi/4) q0[29];
-rz(-pi/4) q0[30];
-cx q0[28],q0[30];
-cx q0[28],q0[29];
-rz(pi/4) q0[28];
-rz(-pi/4) q0[29];
-rz(pi/4) q0[30];
-cx q0[29],q0[30];
-rz(-pi/4) q0[30];
-cx q0[27],q0[30];
-rz(pi/4) q0[30];
-cx q0[29],q0[30];
-rz(pi/4) q0[29];
-rz(-pi/4) q0[30];
-cx q0[27],q0[30];
-cx q0[27],q0[29];
-rz(pi/4) q0[27];
-rz(-pi/4) q0[29];
-cx q0[27],q0[29];
-rz(3*pi/4) q0[30];
-sx q0[30];
-rz(pi/2) q0[30];
-cx q0[68],q0[46];
-rz(-pi/4) q0[46];
-rz(pi/4) q0[68];
-cx q0[68],q0[46];
-cx q0[68],q0[31];
-rz(pi/4) q0[31];
-cx q0[47],q0[31];
-rz(-pi/4) q0[31];
-rz(pi/4) q0[47];
-cx q0[68],q0[31];
-rz(3*pi/4) q0[31];
-sx q0[31];
-rz(pi/2) q0[31];
-cx q0[31],q0[33];
-rz(pi/4) q0[33];
-cx q0[32],q0[33];
-rz(pi/4) q0[32];
-rz(-pi/4) q0[33];
-cx q0[31],q0[33];
-cx q0[31],q0[32];
-rz(pi/4) q0[31];
-rz(-pi/4) q0[32];
-rz(pi/4) q0[33];
-cx q0[32],q0[33];
-rz(-pi/4) q0[33];
-cx q0[30],q0[33];
-rz(pi/4) q0[33];
-cx q0[32],q0[33];
-rz(pi/4) q0[32];
-rz(-pi/4) q0[33];
-cx q0[30],q0[33];
-cx q0[30],q0[32];
-rz(pi/4) q0[30];
-rz(-pi/4) q0[32];
-cx q0[30],q0[32];
-rz(3*pi/4) q0[33];
-sx q0[33];
-rz(pi/2) q0[33];
-cx q0[68],q0[47];
-rz(-pi/4) q0[47];
-rz(pi/4) q0[68];
-cx q0[68],q0[47];
-cx q0[68],q0[34];
-rz(pi/4) q0[34];
-cx q0[48],q0[34];
-rz(-pi/4) q0[34];
-rz(pi/4) q0[48];
-cx q0[68],q0[34];
-rz(3*pi/4) q0[34];
-sx q0[34];
-rz(pi/2) q0[34];
-cx q0[34],q0[36];
-rz(pi/4) q0[36];
-cx q0[35],q0[36];
-rz(pi/4) q0[35];
-rz(-pi/4) q0[36];
-cx q0[34],q0[36];
-cx q0[34],q0[35];
-rz(pi/4) q0[34];
-rz(-pi/4) q0[35];
-rz(pi/4) q0[36];
-cx q0[35],q0[36];
-rz(-pi/4) q0[36];
-cx q0[33],q0[36];
-rz(pi/4) q0[36];
-cx q0[35],q0[36];
-rz(pi/4) q0[35];
-rz(-pi/4) q0[36];
-cx q0[33],q0[36];
-cx q0[33],q0[35];
-rz(pi/4) q0[33];
-rz(-pi/4) q0[35];
-cx q0[33],q0[35];
-rz(3*pi/4) q0[36];
-sx q0[36];
-rz(pi/2) q0[36];
-cx q0[68],q0[48];
-rz(-pi/4) q0[48];
-rz(pi/4) q0[68];
-cx q0[68],q0[48];
-cx q0[68],q0[37];
-rz(pi/4) q0[37];
-cx q0[49],q0[37];
-rz(-pi/4) q0[37];
-rz(pi/4) q0[49];
-cx q0[68],q0[37];
-rz(3*pi/4) q0[37];
-sx q0[37];
-rz(pi/2) q0[37];
-cx q0[37],q0[39];
-rz(pi/4) q0[39];
-cx q0[38],q0[39];
-rz(pi/4) q0[38];
-rz(-pi/4) q0[39];
-cx q0[37],q0[39];
-cx q0[37],q0[38];
-rz(pi/4) q0[37];
-rz(-pi/4) q0[38];
-rz(pi/4) q0[39];
-cx q0[38],q0[39];
-rz(-pi/4) q0[39];
-cx q0[36],q0[39];
-rz(pi/4) q0[39];
-cx q0[38],q0[39];
-rz(pi/4) q0[38];
-rz(-pi/4) q0[39];
-cx q0[36],q0[39];
-cx q0[36],q0[38];
-rz(pi/4) q0[36];
-rz(-pi/4) q0[38];
-cx q0[36],q0[38];
-rz(3*pi/4) q0[39];
-sx q0[39];
-rz(pi/2) q0[39];
-cx q0[68],q0[49];
-rz(-pi/4) q0[49];
-rz(pi/4) q0[68];
-cx q0[68],q0[49];
-cx q0[68],q0[40];
-rz(pi/4) q0[40];
-cx q0[50],q0[40];
-rz(-pi/4) q0[40];
-rz(pi/4) q0[50];
-cx q0[68],q0[40];
-rz(3*pi/4) q0[40];
-sx q0[40];
-rz(pi/2) q0[40];
-cx q0[40],q0[42];
-rz(pi/4) q0[42];
-cx q0[41],q0[42];
-rz(pi/4) q0[41];
-rz(-pi/4) q0[42];
-cx q0[40],q0[42];
-cx q0[40],q0[41];
-rz(pi/4) q0[40];
-rz(-pi/4) q0[41];
-rz(pi/4) q0[42];
-cx q0[41],q0[42];
-rz(-pi/4) q0[42];
-cx q0[39],q0[42];
-rz(pi/4) q0[42];
-cx q0[41],q0[42];
-rz(pi/4) q0[41];
-rz(-pi/4) q0[42];
-cx q0[39],q0[42];
-cx q0[39],q0[41];
-rz(pi/4) q0[39];
-rz(-pi/4) q0[41];
-cx q0[39],q0[41];
-rz(3*pi/4) q0[42];
-sx q0[42];
-rz(pi/2) q0[42];
-cx q0[68],q0[50];
-rz(-pi/4) q0[50];
-rz(pi/4) q0[68];
-cx q0[68],q0[50];
-cx q0[68],q0[43];
-rz(pi/4) q0[43];
-cx q0[51],q0[43];
-rz(-pi/4) q0[43];
-rz(pi/4) q0[51];
-cx q0[68],q0[43];
-rz(3*pi/4) q0[43];
-sx q0[43];
-rz(pi/2) q0[43];
-cx q0[43],q0[44];
-cx q0[42],q0[44];
-rz(pi/2) q0[42];
-sx q0[42];
-rz(pi/2) q0[42];
-cx q0[41],q0[42];
-rz(-pi/4) q0[42];
-cx q0[39],q0[42];
-rz(pi/4) q0[42];
-cx q0[41],q0[42];
-rz(pi/4) q0[41];
-rz(-pi/4) q0[42];
-cx q0[39],q0[42];
-cx q0[39],q0[41];
-rz(pi/4) q0[39];
-rz(-pi/4) q0[41];
-cx q0[39],q0[41];
-cx q0[40],q0[41];
-rz(pi/4) q0[42];
-cx q0[41],q0[42];
-rz(-pi/4) q0[42];
-cx q0[40],q0[42];
-rz(pi/4) q0[42];
-cx q0[41],q0[42];
-rz(pi/4) q0[41];
-rz(-pi/4) q0[42];
-cx q0[40],q0[42];
-cx q0[40],q0[41];
-rz(3*pi/4) q0[40];
-sx q0[40];
-rz(pi/2) q0[40];
-rz(-pi/4) q0[41];
-cx q0[39],q0[41];
-rz(pi/2) q0[39];
-sx q0[39];
-rz(pi/2) q0[39];
-cx q0[38],q0[39];
-rz(-pi/4) q0[39];
-cx q0[36],q0[39];
-rz(pi/4) q0[39];
-cx q0[38],q0[39];
-rz(pi/4) q0[38];
-rz(-pi/4) q0[39];
-cx q0[36],q0[39];
-cx q0[36],q0[38];
-rz(pi/4) q0[36];
-rz(-pi/4) q0[38];
-cx q0[36],q0[38];
-cx q0[37],q0[38];
-rz(pi/4) q0[39];
-cx q0[38],q0[39];
-rz(-pi/4) q0[39];
-cx q0[37],q0[39];
-rz(pi/4) q0[39];
-cx q0[38],q0[39];
-rz(pi/4) q0[38];
-rz(-pi/4) q0[39];
-cx q0[37],q0[39];
-cx q0[37],q0[38];
-rz(3*pi/4) q0[37];
-sx q0[37];
-rz(pi/2) q0[37];
-rz(-pi/4) q0[38];
-cx q0[36],q0[38];
-rz(pi/2) q0[36];
-sx q0[36];
-rz(pi/2) q0[36];
-cx q0[35],q0[36];
-rz(-pi/4) q0[36];
-cx q0[33],q0[36];
-rz(pi/4) q0[36];
-cx q0[35],q0[36];
-rz(pi/4) q0[35];
-rz(-pi/4) q0[36];
-cx q0[33],q0[36];
-cx q0[33],q0[35];
-rz(pi/4) q0[33];
-rz(-pi/4) q0[35];
-cx q0[33],q0[35];
-cx q0[34],q0[35];
-rz(pi/4) q0[36];
-cx q0[35],q0[36];
-rz(-pi/4) q0[36];
-cx q0[34],q0[36];
-rz(pi/4) q0[36];
-cx q0[35],q0[36];
-rz(pi/4) q0[35];
-rz(-pi/4) q0[36];
-cx q0[34],q0[36];
-cx q0[34],q0[35];
-rz(3*pi/4) q0[34];
-sx q0[34];
-rz(pi/2) q0[34];
-rz(-pi/4) q0[35];
-cx q0[33],q0[35];
-rz(pi/2) q0[33];
-sx q0[33];
-rz(pi/2) q0[33];
-cx q0[32],q0[33];
-rz(-pi/4) q0[33];
-cx q0[30],q0[33];
-rz(pi/4) q0[33];
-cx q0[32],q0[33];
-rz(pi/4) q0[32];
-rz(-pi/4) q0[33];
-cx q0[30],q0[33];
-cx q0[30],q0[32];
-rz(pi/4) q0[30];
-rz(-pi/4) q0[32];
-cx q0[30],q0[32];
-cx q0[31],q0[32];
-rz(pi/4) q0[33];
-cx q0[32],q0[33];
-rz(-pi/4) q0[33];
-cx q0[31],q0[33];
-rz(pi/4) q0[33];
-cx q0[32],q0[33];
-rz(pi/4) q0[32];
-rz(-pi/4) q0[33];
-cx q0[31],q0[33];
-cx q0[31],q0[32];
-rz(3*pi/4) q0[31];
-sx q0[31];
-rz(pi/2) q0[31];
-rz(-pi/4) q0[32];
-cx q0[30],q0[32];
-rz(pi/2) q0[30];
-sx q0[30];
-rz(pi/2) q0[30];
-cx q0[29],q0[30];
-rz(-pi/4) q0[30];
-cx q0[27],q0[30];
-rz(pi/4) q0[30];
-cx q0[29],q0[30];
-rz(pi/4) q0[29];
-rz(-pi/4) q0[30];
-cx q0[27],q0[30];
-cx q0[27],q0[29];
-rz(pi/4) q0[27];
-rz(-pi/4) q0[29];
-cx q0[27],q0[29];
-cx q0[28],q0[29];
-rz(pi/4) q0[30];
-cx q0[29],q0[30];
-rz(-pi/4) q0[30];
-cx q0[28],q0[30];
-rz(pi/4) q0[30];
-cx q0[29],q0[30];
-rz(pi/4) q0[29];
-rz(-pi/4) q0[30];
-cx q0[28],q0[30];
-cx q0[28],q0[29];
-rz(3*pi/4) q0[28];
-sx q0[28];
-rz(pi/2) q0[28];
-rz(-pi/4) q0[29];
-cx q0[27],q0[29];
-rz(pi/2) q0[27];
-sx q0[27];
-rz(pi/2) q0[27];
-cx q0[26],q0[27];
-rz(-pi/4) q0[27];
-cx q0[24],q0[27];
-rz(pi/4) q0[27];
-cx q0[26],q0[27];
-rz(pi/4) q0[26];
-rz(-pi/4) q0[27];
-cx q0[24],q0[27];
-cx q0[24],q0[26];
-rz(pi/4) q0[24];
-rz(-pi/4) q0[26];
-cx q0[24],q0[26];
-cx q0[25],q0[26];
-rz(pi/4) q0[27];
-cx q0[26],q0[27];
-rz(-pi/4) q0[27];
-cx q0[25],q0[27];
-rz(pi/4) q0[27];
-cx q0[26],q0[27];
-rz(pi/4) q0[26];
-rz(-pi/4) q0[27];
-cx q0[25],q0[27];
-cx q0[25],q0[26];
-rz(3*pi/4) q0[25];
-sx q0[25];
-rz(pi/2) q0[25];
-rz(-pi/4) q0[26];
-cx q0[24],q0[26];
-rz(pi/2) q0[24];
-sx q0[24];
-rz(pi/2) q0[24];
-cx q0[23],q0[24];
-rz(-pi/4) q0[24];
-cx q0[21],q0[24];
-rz(pi/4) q0[24];
-cx q0[23],q0[24];
-rz(pi/4) q0[23];
-rz(-pi/4) q0[24];
-cx q0[21],q0[24];
-cx q0[21],q0[23];
-rz(pi/4) q0[21];
-rz(-pi/4) q0[23];
-cx q0[21],q0[23];
-cx q0[22],q0[23];
-rz(pi/4) q0[24];
-cx q0[23],q0[24];
-rz(-pi/4) q0[24];
-cx q0[22],q0[24];
-rz(pi/4) q0[24];
-cx q0[23],q0[24];
-rz(pi/4) q0[23];
-rz(-pi/4) q0[24];
-cx q0[22],q0[24];
-cx q0[22],q0[23];
-rz(pi/4) q0[22];
-rz(-pi/4) q0[23];
-cx q0[21],q0[23];
-rz(pi/2) q0[21];
-sx q0[21];
-rz(pi/2) q0[21];
-cx q0[20],q0[21];
-rz(-pi/4) q0[21];
-cx q0[18],q0[21];
-rz(pi/4) q0[21];
-cx q0[20],q0[21];
-rz(pi/4) q0[20];
-rz(-pi/4) q0[21];
-cx q0[18],q0[21];
-cx q0[18],q0[20];
-rz(pi/4) q0[18];
-rz(-pi/4) q0[20];
-cx q0[18],q0[20];
-cx q0[19],q0[20];
-rz(pi/4) q0[21];
-cx q0[20],q0[21];
-rz(-pi/4) q0[21];
-cx q0[19],q0[21];
-rz(pi/4) q0[21];
-cx q0[20],q0[21];
-rz(pi/4) q0[20];
-rz(-pi/4) q0[21];
-cx q0[19],q0[21];
-cx q0[19],q0[20];
-rz(pi/4) q0[19];
-rz(-pi/4) q0[20];
-cx q0[18],q0[20];
-rz(pi/2) q0[18];
-sx q0[18];
-rz(pi/2) q0[18];
-cx q0[17],q0[18];
-rz(-pi/4) q0[18];
-cx q0[15],q0[18];
-rz(pi/4) q0[18];
-cx q0[17],q0[18];
-rz(pi/4) q0[17];
-rz(-pi/4) q0[18];
-cx q0[15],q0[18];
-cx q0[15],q0[17];
-rz(pi/4) q0[15];
-rz(-pi/4) q0[17];
-cx q0[15],q0[17];
-cx q0[16],q0[17];
-rz(pi/4) q0[18];
-cx q0[17],q0[18];
-rz(-pi/4) q0[18];
-cx q0[16],q0[18];
-rz(pi/4) q0[18];
-cx q0[17],q0[18];
-rz(pi/4) q0[17];
-rz(-pi/4) q0[18];
-cx q0[16],q0[18];
-cx q0[16],q0[17];
-rz(pi/4) q0[16];
-rz(-pi/4) q0[17];
-cx q0[15],q0[17];
-rz(pi/2) q0[15];
-sx q0[15];
-rz(pi/2) q0[15];
-cx q0[14],q0[15];
-rz(-pi/4) q0[15];
-cx q0[12],q0[15];
-rz(pi/4) q0[15];
-cx q0[14],q0[15];
-rz(pi/4) q0[14];
-rz(-pi/4) q0[15];
-cx q0[12],q0[15];
-cx q0[12],q0[14];
-rz(pi/4) q0[12];
-rz(-pi/4) q0[14];
-cx q0[12],q0[14];
-cx q0[13],q0[14];
-rz(pi/4) q0[15];
-cx q0[14],q0[15];
-rz(-pi/4) q0[15];
-cx q0[13],q0[15];
-rz(pi/4) q0[15];
-cx q0[14],q0[15];
-rz(pi/4) q0[14];
-rz(-pi/4) q0[15];
-cx q0[13],q0[15];
-cx q0[13],q0[14];
-rz(pi/4) q0[13];
-rz(-pi/4) q0[14];
-cx q0[12],q0[14];
-rz(pi/2) q0[12];
-sx q0[12];
-rz(pi/2) q0[12];
-cx q0[11],q0[12];
-rz(-pi/4) q0[12];
-rz(pi/4) q0[15];
-cx q0[14],q0[15];
-rz(-pi/4) q0[15];
-cx q0[13],q0[15];
-rz(pi/4) q0[15];
-cx q0[14],q0[15];
-rz(pi/4) q0[14];
-rz(-pi/4) q0[15];
-cx q0[13],q0[15];
-cx q0[13],q0[14];
-rz(pi/4) q0[13];
-rz(-pi/4) q0[14];
-rz(pi/4) q0[15];
-cx q0[14],q0[15];
-rz(-pi/4) q0[15];
-rz(pi/4) q0[18];
-cx q0[17],q0[18];
-rz(-pi/4) q0[18];
-cx q0[16],q0[18];
-rz(pi/4) q0[18];
-cx q0[17],q0[18];
-rz(pi/4) q0[17];
-rz(-pi/4) q0[18];
-cx q0[16],q0[18];
-cx q0[16],q0[17];
-rz(pi/4) q0[16];
-rz(-pi/4) q0[17];
-rz(pi/4) q0[18];
-cx q0[17],q0[18];
-rz(-pi/4) q0[18];
-rz(pi/4) q0[21];
-cx q0[20],q0[21];
-rz(-pi/4) q0[21];
-cx q0[19],q0[21];
-rz(pi/4) q0[21];
-cx q0[20],q0[21];
-rz(pi/4) q0[20];
-rz(-pi/4) q0[21];
-cx q0[19],q0[21];
-cx q0[19],q0[20];
-rz(pi/4) q0[19];
-rz(-pi/4) q0[20];
-rz(pi/4) q0[21];
-cx q0[20],q0[21];
-rz(-pi/4) q0[21];
-rz(pi/4) q0[24];
-cx q0[23],q0[24];
-rz(-pi/4) q0[24];
-cx q0[22],q0[24];
-rz(pi/4) q0[24];
-cx q0[23],q0[24];
-rz(pi/4) q0[23];
-rz(-pi/4) q0[24];
-cx q0[22],q0[24];
-cx q0[22],q0[23];
-rz(pi/4) q0[22];
-rz(-pi/4) q0[23];
-rz(pi/4) q0[24];
-cx q0[23],q0[24];
-rz(-pi/4) q0[24];
-rz(pi/4) q0[27];
-cx q0[26],q0[27];
-rz(-pi/4) q0[27];
-rz(pi/4) q0[30];
-cx q0[29],q0[30];
-rz(-pi/4) q0[30];
-rz(pi/4) q0[33];
-cx q0[32],q0[33];
-rz(-pi/4) q0[33];
-rz(pi/4) q0[36];
-cx q0[35],q0[36];
-rz(-pi/4) q0[36];
-rz(pi/4) q0[39];
-cx q0[38],q0[39];
-rz(-pi/4) q0[39];
-rz(pi/4) q0[42];
-cx q0[41],q0[42];
-rz(-pi/4) q0[42];
-rz(pi/2) q0[43];
-sx q0[43];
-rz(pi/2) q0[43];
-cx q0[45],q0[25];
-rz(-pi/4) q0[25];
-cx q0[46],q0[28];
-rz(-pi/4) q0[28];
-cx q0[47],q0[31];
-rz(-pi/4) q0[31];
-cx q0[48],q0[34];
-rz(-pi/4) q0[34];
-cx q0[49],q0[37];
-rz(-pi/4) q0[37];
-cx q0[50],q0[40];
-rz(-pi/4) q0[40];
-cx q0[68],q0[51];
-rz(-pi/4) q0[51];
-rz(pi/4) q0[68];
-cx q0[68],q0[51];
-cx q0[51],q0[43];
-rz(-pi/4) q0[43];
-cx q0[68],q0[25];
-rz(pi/4) q0[25];
-cx q0[45],q0[25];
-rz(-pi/4) q0[25];
-rz(pi/4) q0[45];
-cx q0[68],q0[25];
-rz(3*pi/4) q0[25];
-sx q0[25];
-rz(pi/2) q0[25];
-cx q0[25],q0[27];
-rz(pi/4) q0[27];
-cx q0[26],q0[27];
-rz(pi/4) q0[26];
-rz(-pi/4) q0[27];
-cx q0[25],q0[27];
-cx q0[25],q0[26];
-rz(pi/4) q0[25];
-rz(-pi/4) q0[26];
-rz(pi/4) q0[27];
-cx q0[26],q0[27];
-rz(-pi/4) q0[27];
-cx q0[68],q0[45];
-rz(-pi/4) q0[45];
-rz(pi/4) q0[68];
-cx q0[68],q0[45];
-cx q0[68],q0[28];
-rz(pi/4) q0[28];
-cx q0[46],q0[28];
-rz(-pi/4) q0[28];
-rz(pi/4) q0[46];
-cx q0[68],q0[28];
-rz(pi/4) q0[28];
-cx q0[45],q0[28];
-rz(-pi/4) q0[28];
-cx q0[68],q0[46];
-rz(-pi/4) q0[46];
-rz(pi/4) q0[68];
-cx q0[68],q0[46];
-cx q0[68],q0[31];
-rz(pi/4) q0[31];
-cx q0[47],q0[31];
-rz(-pi/4) q0[31];
-rz(pi/4) q0[47];
-cx q0[68],q0[31];
-rz(pi/4) q0[31];
-cx q0[46],q0[31];
-rz(-pi/4) q0[31];
-cx q0[68],q0[47];
-rz(-pi/4) q0[47];
-rz(pi/4) q0[68];
-cx q0[68],q0[47];
-cx q0[68],q0[34];
-rz(pi/4) q0[34];
-cx q0[48],q0[34];
-rz(-pi/4) q0[34];
-rz(pi/4) q0[48];
-cx q0[68],q0[34];
-rz(pi/4) q0[34];
-cx q0[47],q0[34];
-rz(-pi/4) q0[34];
-cx q0[68],q0[48];
-rz(-pi/4) q0[48];
-rz(pi/4) q0[68];
-cx q0[68],q0[48];
-cx q0[68],q0[37];
-rz(pi/4) q0[37];
-cx q0[49],q0[37];
-rz(-pi/4) q0[37];
-rz(pi/4) q0[49];
-cx q0[68],q0[37];
-rz(pi/4) q0[37];
-cx q0[48],q0[37];
-rz(-pi/4) q0[37];
-cx q0[68],q0[49];
-rz(-pi/4) q0[49];
-rz(pi/4) q0[68];
-cx q0[68],q0[49];
-cx q0[68],q0[40];
-rz(pi/4) q0[40];
-cx q0[50],q0[40];
-rz(-pi/4) q0[40];
-rz(pi/4) q0[50];
-cx q0[68],q0[40];
-rz(pi/4) q0[40];
-cx q0[49],q0[40];
-rz(-pi/4) q0[40];
-cx q0[68],q0[50];
-rz(-pi/4) q0[50];
-rz(pi/4) q0[68];
-cx q0[68],q0[50];
-cx q0[68],q0[43];
-rz(pi/4) q0[43];
-cx q0[51],q0[43];
-rz(-pi/4) q0[43];
-rz(pi/4) q0[51];
-cx q0[68],q0[43];
-rz(pi/4) q0[43];
-cx q0[50],q0[43];
-rz(-pi/4) q0[43];
-cx q0[68],q0[51];
-rz(-pi/4) q0[51];
-rz(pi/4) q0[68];
-cx q0[68],q0[51];
-cx q0[9],q0[12];
-rz(pi/4) q0[12];
-cx q0[11],q0[12];
-rz(pi/4) q0[11];
-rz(-pi/4) q0[12];
-cx q0[9],q0[12];
-rz(pi/4) q0[12];
-cx q0[9],q0[11];
-rz(-pi/4) q0[11];
-rz(pi/4) q0[9];
-cx q0[9],q0[11];
-cx q0[10],q0[11];
-cx q0[11],q0[12];
-rz(-pi/4) q0[12];
-cx q0[10],q0[12];
-rz(pi/4) q0[12];
-cx q0[11],q0[12];
-rz(pi/4) q0[11];
-rz(-pi/4) q0[12];
-cx q0[10],q0[12];
-cx q0[10],q0[11];
-rz(pi/4) q0[10];
-rz(-pi/4) q0[11];
-rz(pi/4) q0[12];
-cx q0[9],q0[11];
-cx q0[11],q0[12];
-rz(-pi/4) q0[12];
-cx q0[10],q0[12];
-rz(pi/4) q0[12];
-cx q0[11],q0[12];
-rz(pi/4) q0[11];
-rz(-pi/4) q0[12];
-cx q0[10],q0[12];
-cx q0[10],q0[11];
-rz(pi/4) q0[10];
-rz(-pi/4) q0[11];
-rz(pi/4) q0[12];
-cx q0[11],q0[12];
-rz(-pi/4) q0[12];
-rz(pi/2) q0[9];
-sx q0[9];
-rz(pi/2) q0[9];
-cx q0[8],q0[9];
-rz(-pi/4) q0[9];
-cx q0[6],q0[9];
-rz(pi/4) q0[9];
-cx q0[8],q0[9];
-rz(pi/4) q0[8];
-rz(-pi/4) q0[9];
-cx q0[6],q0[9];
-cx q0[6],q0[8];
-rz(pi/4) q0[6];
-rz(-pi/4) q0[8];
-cx q0[6],q0[8];
-cx q0[7],q0[8];
-rz(pi/4) q0[9];
-cx q0[8],q0[9];
-rz(-pi/4) q0[9];
-cx q0[7],q0[9];
-rz(pi/4) q0[9];
-cx q0[8],q0[9];
-rz(pi/4) q0[8];
-rz(-pi/4) q0[9];
-cx q0[7],q0[9];
-cx q0[7],q0[8];
-rz(pi/4) q0[7];
-rz(-pi/4) q0[8];
-cx q0[6],q0[8];
-rz(pi/2) q0[6];
-sx q0[6];
-rz(pi/2) q0[6];
-cx q0[5],q0[6];
-rz(-pi/4) q0[6];
-cx q0[3],q0[6];
-rz(pi/4) q0[6];
-cx q0[5],q0[6];
-rz(pi/4) q0[5];
-rz(-pi/4) q0[6];
-cx q0[3],q0[6];
-cx q0[3],q0[5];
-rz(pi/4) q0[3];
-rz(-pi/4) q0[5];
-cx q0[3],q0[5];
-cx q0[4],q0[5];
-rz(pi/4) q0[6];
-cx q0[5],q0[6];
-rz(-pi/4) q0[6];
-cx q0[4],q0[6];
-rz(pi/4) q0[6];
-cx q0[5],q0[6];
-rz(pi/4) q0[5];
-rz(-pi/4) q0[6];
-cx q0[4],q0[6];
-cx q0[4],q0[5];
-rz(pi/4) q0[4];
-rz(-pi/4) q0[5];
-cx q0[3],q0[5];
-rz(pi/2) q0[3];
-sx q0[3];
-rz(pi/2) q0[3];
-cx q0[2],q0[3];
-rz(-pi/4) q0[3];
-cx q0[0],q0[3];
-rz(pi/4) q0[3];
-cx q0[2],q0[3];
-rz(pi/4) q0[2];
-rz(-pi/4) q0[3];
-cx q0[0],q0[3];
-cx q0[0],q0[2];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[2];
-cx q0[0],q0[2];
-cx q0[1],q0[2];
-rz(pi/4) q0[3];
-cx q0[2],q0[3];
-rz(-pi/4) q0[3];
-cx q0[1],q0[3];
-rz(pi/4) q0[3];
-cx q0[2],q0[3];
-rz(pi/4) q0[2];
-rz(-pi/4) q0[3];
-cx q0[1],q0[3];
-cx q0[1],q0[2];
-rz(pi/4) q0[1];
-rz(-pi/4) q0[2];
-cx q0[0],q0[2];
-rz(pi/4) q0[3];
-cx q0[2],q0[3];
-rz(-pi/4) q0[3];
-cx q0[1],q0[3];
-rz(pi/4) q0[3];
-cx q0[2],q0[3];
-rz(pi/4) q0[2];
-rz(-pi/4) q0[3];
-cx q0[1],q0[3];
-cx q0[1],q0[2];
-rz(pi/4) q0[1];
-rz(-pi/4) q0[2];
-rz(pi/4) q0[3];
-cx q0[2],q0[3];
-rz(-pi/4) q0[3];
-cx q0[0],q0[3];
-rz(pi/4) q0[3];
-cx q0[2],q0[3];
-rz(pi/4) q0[2];
-rz(-pi/4) q0[3];
-cx q0[0],q0[3];
-cx q0[0],q0[2];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[2];
-cx q0[0],q0[2];
-rz(3*pi/4) q0[3];
-sx q0[3];
-rz(pi/2) q0[3];
-rz(pi/4) q0[6];
-cx q0[5],q0[6];
-rz(-pi/4) q0[6];
-cx q0[4],q0[6];
-rz(pi/4) q0[6];
-cx q0[5],q0[6];
-rz(pi/4) q0[5];
-rz(-pi/4) q0[6];
-cx q0[4],q0[6];
-cx q0[4],q0[5];
-rz(pi/4) q0[4];
-rz(-pi/4) q0[5];
-rz(pi/4) q0[6];
-cx q0[5],q0[6];
-rz(-pi/4) q0[6];
-cx q0[3],q0[6];
-rz(pi/4) q0[6];
-cx q0[5],q0[6];
-rz(pi/4) q0[5];
-rz(-pi/4) q0[6];
-cx q0[3],q0[6];
-cx q0[3],q0[5];
-rz(pi/4) q0[3];
-rz(-pi/4) q0[5];
-cx q0[3],q0[5];
-rz(3*pi/4) q0[6];
-sx q0[6];
-rz(pi/2) q0[6];
-rz(pi/4) q0[9];
-cx q0[8],q0[9];
-rz(-pi/4) q0[9];
-cx q0[7],q0[9];
-rz(pi/4) q0[9];
-cx q0[8],q0[9];
-rz(pi/4) q0[8];
-rz(-pi/4) q0[9];
-cx q0[7],q0[9];
-cx q0[7],q0[8];
-rz(pi/4) q0[7];
-rz(-pi/4) q0[8];
-rz(pi/4) q0[9];
-cx q0[8],q0[9];
-rz(-pi/4) q0[9];
-cx q0[6],q0[9];
-rz(pi/4) q0[9];
-cx q0[8],q0[9];
-rz(pi/4) q0[8];
-rz(-pi/4) q0[9];
-cx q0[6],q0[9];
-cx q0[6],q0[8];
-rz(pi/4) q0[6];
-rz(-pi/4) q0[8];
-cx q0[6],q0[8];
-rz(3*pi/4) q0[9];
-sx q0[9];
-rz(pi/2) q0[9];
-cx q0[9],q0[12];
-rz(pi/4) q0[12];
-cx q0[11],q0[12];
-rz(pi/4) q0[11];
-rz(-pi/4) q0[12];
-cx q0[9],q0[12];
-rz(3*pi/4) q0[12];
-sx q0[12];
-rz(pi/2) q0[12];
-cx q0[12],q0[15];
-rz(pi/4) q0[15];
-cx q0[14],q0[15];
-rz(pi/4) q0[14];
-rz(-pi/4) q0[15];
-cx q0[12],q0[15];
-cx q0[12],q0[14];
-rz(pi/4) q0[12];
-rz(-pi/4) q0[14];
-cx q0[12],q0[14];
-rz(3*pi/4) q0[15];
-sx q0[15];
-rz(pi/2) q0[15];
-cx q0[15],q0[18];
-rz(pi/4) q0[18];
-cx q0[17],q0[18];
-rz(pi/4) q0[17];
-rz(-pi/4) q0[18];
-cx q0[15],q0[18];
-cx q0[15],q0[17];
-rz(pi/4) q0[15];
-rz(-pi/4) q0[17];
-cx q0[15],q0[17];
-rz(3*pi/4) q0[18];
-sx q0[18];
-rz(pi/2) q0[18];
-cx q0[18],q0[21];
-rz(pi/4) q0[21];
-cx q0[20],q0[21];
-rz(pi/4) q0[20];
-rz(-pi/4) q0[21];
-cx q0[18],q0[21];
-cx q0[18],q0[20];
-rz(pi/4) q0[18];
-rz(-pi/4) q0[20];
-cx q0[18],q0[20];
-rz(3*pi/4) q0[21];
-sx q0[21];
-rz(pi/2) q0[21];
-cx q0[21],q0[24];
-rz(pi/4) q0[24];
-cx q0[23],q0[24];
-rz(pi/4) q0[23];
-rz(-pi/4) q0[24];
-cx q0[21],q0[24];
-cx q0[21],q0[23];
-rz(pi/4) q0[21];
-rz(-pi/4) q0[23];
-cx q0[21],q0[23];
-rz(3*pi/4) q0[24];
-sx q0[24];
-rz(pi/2) q0[24];
-cx q0[24],q0[27];
-rz(pi/4) q0[27];
-cx q0[26],q0[27];
-rz(pi/4) q0[26];
-rz(-pi/4) q0[27];
-cx q0[24],q0[27];
-cx q0[24],q0[26];
-rz(pi/4) q0[24];
-rz(-pi/4) q0[26];
-cx q0[24],q0[26];
-rz(3*pi/4) q0[27];
-sx q0[27];
-rz(pi/2) q0[27];
-cx q0[9],q0[11];
-rz(-pi/4) q0[11];
-rz(pi/4) q0[9];
-cx q0[9],q0[11];
-x q0[69];
-cx q0[69],q0[28];
-rz(pi/4) q0[28];
-cx q0[45],q0[28];
-rz(-pi/4) q0[28];
-rz(pi/4) q0[45];
-cx q0[69],q0[28];
-rz(3*pi/4) q0[28];
-sx q0[28];
-rz(pi/2) q0[28];
-cx q0[28],q0[30];
-rz(pi/4) q0[30];
-cx q0[29],q0[30];
-rz(pi/4) q0[29];
-rz(-pi/4) q0[30];
-cx q0[28],q0[30];
-cx q0[28],q0[29];
-rz(pi/4) q0[28];
-rz(-pi/4) q0[29];
-rz(pi/4) q0[30];
-cx q0[29],q0[30];
-rz(-pi/4) q0[30];
-cx q0[27],q0[30];
-rz(pi/4) q0[30];
-cx q0[29],q0[30];
-rz(pi/4) q0[29];
-rz(-pi/4) q0[30];
-cx q0[27],q0[30];
-cx q0[27],q0[29];
-rz(pi/4) q0[27];
-rz(-pi/4) q0[29];
-cx q0[27],q0[29];
-rz(3*pi/4) q0[30];
-sx q0[30];
-rz(pi/2) q0[30];
-cx q0[69],q0[45];
-rz(-pi/4) q0[45];
-rz(pi/4) q0[69];
-cx q0[69],q0[45];
-cx q0[69],q0[31];
-rz(pi/4) q0[31];
-cx q0[46],q0[31];
-rz(-pi/4) q0[31];
-rz(pi/4) q0[46];
-cx q0[69],q0[31];
-rz(3*pi/4) q0[31];
-sx q0[31];
-rz(pi/2) q0[31];
-cx q0[31],q0[33];
-rz(pi/4) q0[33];
-cx q0[32],q0[33];
-rz(pi/4) q0[32];
-rz(-pi/4) q0[33];
-cx q0[31],q0[33];
-cx q0[31],q0[32];
-rz(pi/4) q0[31];
-rz(-pi/4) q0[32];
-rz(pi/4) q0[33];
-cx q0[32],q0[33];
-rz(-pi/4) q0[33];
-cx q0[30],q0[33];
-rz(pi/4) q0[33];
-cx q0[32],q0[33];
-rz(pi/4) q0[32];
-rz(-pi/4) q0[33];
-cx q0[30],q0[33];
-cx q0[30],q0[32];
-rz(pi/4) q0[30];
-rz(-pi/4) q0[32];
-cx q0[30],q0[32];
-rz(3*pi/4) q0[33];
-sx q0[33];
-rz(pi/2) q0[33];
-cx q0[69],q0[46];
-rz(-pi/4) q0[46];
-rz(pi/4) q0[69];
-cx q0[69],q0[46];
-cx q0[69],q0[34];
-rz(pi/4) q0[34];
-cx q0[47],q0[34];
-rz(-pi/4) q0[34];
-rz(pi/4) q0[47];
-cx q0[69],q0[34];
-rz(3*pi/4) q0[34];
-sx q0[34];
-rz(pi/2) q0[34];
-cx q0[34],q0[36];
-rz(pi/4) q0[36];
-cx q0[35],q0[36];
-rz(pi/4) q0[35];
-rz(-pi/4) q0[36];
-cx q0[34],q0[36];
-cx q0[34],q0[35];
-rz(pi/4) q0[34];
-rz(-pi/4) q0[35];
-rz(pi/4) q0[36];
-cx q0[35],q0[36];
-rz(-pi/4) q0[36];
-cx q0[33],q0[36];
-rz(pi/4) q0[36];
-cx q0[35],q0[36];
-rz(pi/4) q0[35];
-rz(-pi/4) q0[36];
-cx q0[33],q0[36];
-cx q0[33],q0[35];
-rz(pi/4) q0[33];
-rz(-pi/4) q0[35];
-cx q0[33],q0[35];
-rz(3*pi/4) q0[36];
-sx q0[36];
-rz(pi/2) q0[36];
-cx q0[69],q0[47];
-rz(-pi/4) q0[47];
-rz(pi/4) q0[69];
-cx q0[69],q0[47];
-cx q0[69],q0[37];
-rz(pi/4) q0[37];
-cx q0[48],q0[37];
-rz(-pi/4) q0[37];
-rz(pi/4) q0[48];
-cx q0[69],q0[37];
-rz(3*pi/4) q0[37];
-sx q0[37];
-rz(pi/2) q0[37];
-cx q0[37],q0[39];
-rz(pi/4) q0[39];
-cx q0[38],q0[39];
-rz(pi/4) q0[38];
-rz(-pi/4) q0[39];
-cx q0[37],q0[39];
-cx q0[37],q0[38];
-rz(pi/4) q0[37];
-rz(-pi/4) q0[38];
-rz(pi/4) q0[39];
-cx q0[38],q0[39];
-rz(-pi/4) q0[39];
-cx q0[36],q0[39];
-rz(pi/4) q0[39];
-cx q0[38],q0[39];
-rz(pi/4) q0[38];
-rz(-pi/4) q0[39];
-cx q0[36],q0[39];
-cx q0[36],q0[38];
-rz(pi/4) q0[36];
-rz(-pi/4) q0[38];
-cx q0[36],q0[38];
-rz(3*pi/4) q0[39];
-sx q0[39];
-rz(pi/2) q0[39];
-cx q0[69],q0[48];
-rz(-pi/4) q0[48];
-rz(pi/4) q0[69];
-cx q0[69],q0[48];
-cx q0[69],q0[40];
-rz(pi/4) q0[40];
-cx q0[49],q0[40];
-rz(-pi/4) q0[40];
-rz(pi/4) q0[49];
-cx q0[69],q0[40];
-rz(3*pi/4) q0[40];
-sx q0[40];
-rz(pi/2) q0[40];
-cx q0[40],q0[42];
-rz(pi/4) q0[42];
-cx q0[41],q0[42];
-rz(pi/4) q0[41];
-rz(-pi/4) q0[42];
-cx q0[40],q0[42];
-cx q0[40],q0[41];
-rz(pi/4) q0[40];
-rz(-pi/4) q0[41];
-rz(pi/4) q0[42];
-cx q0[41],q0[42];
-rz(-pi/4) q0[42];
-cx q0[39],q0[42];
-rz(pi/4) q0[42];
-cx q0[41],q0[42];
-rz(pi/4) q0[41];
-rz(-pi/4) q0[42];
-cx q0[39],q0[42];
-cx q0[39],q0[41];
-rz(pi/4) q0[39];
-rz(-pi/4) q0[41];
-cx q0[39],q0[41];
-rz(3*pi/4) q0[42];
-sx q0[42];
-rz(pi/2) q0[42];
-cx q0[69],q0[49];
-rz(-pi/4) q0[49];
-rz(pi/4) q0[69];
-cx q0[69],q0[49];
-cx q0[69],q0[43];
-rz(pi/4) q0[43];
-cx q0[50],q0[43];
-rz(-pi/4) q0[43];
-rz(pi/4) q0[50];
-cx q0[69],q0[43];
-rz(3*pi/4) q0[43];
-sx q0[43];
-rz(pi/2) q0[43];
-cx q0[43],q0[44];
-cx q0[42],q0[44];
-rz(pi/2) q0[42];
-sx q0[42];
-rz(pi/2) q0[42];
-cx q0[41],q0[42];
-rz(-pi/4) q0[42];
-cx q0[39],q0[42];
-rz(pi/4) q0[42];
-cx q0[41],q0[42];
-rz(pi/4) q0[41];
-rz(-pi/4) q0[42];
-cx q0[39],q0[42];
-cx q0[39],q0[41];
-rz(pi/4) q0[39];
-rz(-pi/4) q0[41];
-cx q0[39],q0[41];
-cx q0[40],q0[41];
-rz(pi/4) q0[42];
-cx q0[41],q0[42];
-rz(-pi/4) q0[42];
-cx q0[40],q0[42];
-rz(pi/4) q0[42];
-cx q0[41],q0[42];
-rz(pi/4) q0[41];
-rz(-pi/4) q0[42];
-cx q0[40],q0[42];
-cx q0[40],q0[41];
-rz(3*pi/4) q0[40];
-sx q0[40];
-rz(pi/2) q0[40];
-rz(-pi/4) q0[41];
-cx q0[39],q0[41];
-rz(pi/2) q0[39];
-sx q0[39];
-rz(pi/2) q0[39];
-cx q0[38],q0[39];
-rz(-pi/4) q0[39];
-cx q0[36],q0[39];
-rz(pi/4) q0[39];
-cx q0[38],q0[39];
-rz(pi/4) q0[38];
-rz(-pi/4) q0[39];
-cx q0[36],q0[39];
-cx q0[36],q0[38];
-rz(pi/4) q0[36];
-rz(-pi/4) q0[38];
-cx q0[36],q0[38];
-cx q0[37],q0[38];
-rz(pi/4) q0[39];
-cx q0[38],q0[39];
-rz(-pi/4) q0[39];
-cx q0[37],q0[39];
-rz(pi/4) q0[39];
-cx q0[38],q0[39];
-rz(pi/4) q0[38];
-rz(-pi/4) q0[39];
-cx q0[37],q0[39];
-cx q0[37],q0[38];
-rz(3*pi/4) q0[37];
-sx q0[37];
-rz(pi/2) q0[37];
-rz(-pi/4) q0[38];
-cx q0[36],q0[38];
-rz(pi/2) q0[36];
-sx q0[36];
-rz(pi/2) q0[36];
-cx q0[35],q0[36];
-rz(-pi/4) q0[36];
-cx q0[33],q0[36];
-rz(pi/4) q0[36];
-cx q0[35],q0[36];
-rz(pi/4) q0[35];
-rz(-pi/4) q0[36];
-cx q0[33],q0[36];
-cx q0[33],q0[35];
-rz(pi/4) q0[33];
-rz(-pi/4) q0[35];
-cx q0[33],q0[35];
-cx q0[34],q0[35];
-rz(pi/4) q0[36];
-cx q0[35],q0[36];
-rz(-pi/4) q0[36];
-cx q0[34],q0[36];
-rz(pi/4) q0[36];
-cx q0[35],q0[36];
-rz(pi/4) q0[35];
-rz(-pi/4) q0[36];
-cx q0[34],q0[36];
-cx q0[34],q0[35];
-rz(3*pi/4) q0[34];
-sx q0[34];
-rz(pi/2) q0[34];
-rz(-pi/4) q0[35];
-cx q0[33],q0[35];
-rz(pi/2) q0[33];
-sx q0[33];
-rz(pi/2) q0[33];
-cx q0[32],q0[33];
-rz(-pi/4) q0[33];
-cx q0[30],q0[33];
-rz(pi/4) q0[33];
-cx q0[32],q0[33];
-rz(pi/4) q0[32];
-rz(-pi/4) q0[33];
-cx q0[30],q0[33];
-cx q0[30],q0[32];
-rz(pi/4) q0[30];
-rz(-pi/4) q0[32];
-cx q0[30],q0[32];
-cx q0[31],q0[32];
-rz(pi/4) q0[33];
-cx q0[32],q0[33];
-rz(-pi/4) q0[33];
-cx q0[31],q0[33];
-rz(pi/4) q0[33];
-cx q0[32],q0[33];
-rz(pi/4) q0[32];
-rz(-pi/4) q0[33];
-cx q0[31],q0[33];
-cx q0[31],q0[32];
-rz(3*pi/4) q0[31];
-sx q0[31];
-rz(pi/2) q0[31];
-rz(-pi/4) q0[32];
-cx q0[30],q0[32];
-rz(pi/2) q0[30];
-sx q0[30];
-rz(pi/2) q0[30];
-cx q0[29],q0[30];
-rz(-pi/4) q0[30];
-cx q0[27],q0[30];
-rz(pi/4) q0[30];
-cx q0[29],q0[30];
-rz(pi/4) q0[29];
-rz(-pi/4) q0[30];
-cx q0[27],q0[30];
-cx q0[27],q0[29];
-rz(pi/4) q0[27];
-rz(-pi/4) q0[29];
-cx q0[27],q0[29];
-cx q0[28],q0[29];
-rz(pi/4) q0[30];
-cx q0[29],q0[30];
-rz(-pi/4) q0[30];
-cx q0[28],q0[30];
-rz(pi/4) q0[30];
-cx q0[29],q0[30];
-rz(pi/4) q0[29];
-rz(-pi/4) q0[30];
-cx q0[28],q0[30];
-cx q0[28],q0[29];
-rz(3*pi/4) q0[28];
-sx q0[28];
-rz(pi/2) q0[28];
-rz(-pi/4) q0[29];
-cx q0[27],q0[29];
-rz(pi/2) q0[27];
-sx q0[27];
-rz(pi/2) q0[27];
-cx q0[26],q0[27];
-rz(-pi/4) q0[27];
-cx q0[24],q0[27];
-rz(pi/4) q0[27];
-cx q0[26],q0[27];
-rz(pi/4) q0[26];
-rz(-pi/4) q0[27];
-cx q0[24],q0[27];
-cx q0[24],q0[26];
-rz(pi/4) q0[24];
-rz(-pi/4) q0[26];
-cx q0[24],q0[26];
-cx q0[25],q0[26];
-rz(pi/4) q0[27];
-cx q0[26],q0[27];
-rz(-pi/4) q0[27];
-cx q0[25],q0[27];
-rz(pi/4) q0[27];
-cx q0[26],q0[27];
-rz(pi/4) q0[26];
-rz(-pi/4) q0[27];
-cx q0[25],q0[27];
-cx q0[25],q0[26];
-rz(pi/4) q0[25];
-rz(-pi/4) q0[26];
-cx q0[24],q0[26];
-rz(pi/2) q0[24];
-sx q0[24];
-rz(pi/2) q0[24];
-cx q0[23],q0[24];
-rz(-pi/4) q0[24];
-cx q0[21],q0[24];
-rz(pi/4) q0[24];
-cx q0[23],q0[24];
-rz(pi/4) q0[23];
-rz(-pi/4) q0[24];
-cx q0[21],q0[24];
-cx q0[21],q0[23];
-rz(pi/4) q0[21];
-rz(-pi/4) q0[23];
-cx q0[21],q0[23];
-cx q0[22],q0[23];
-rz(pi/4) q0[24];
-cx q0[23],q0[24];
-rz(-pi/4) q0[24];
-cx q0[22],q0[24];
-rz(pi/4) q0[24];
-cx q0[23],q0[24];
-rz(pi/4) q0[23];
-rz(-pi/4) q0[24];
-cx q0[22],q0[24];
-cx q0[22],q0[23];
-rz(pi/4) q0[22];
-rz(-pi/4) q0[23];
-cx q0[21],q0[23];
-rz(pi/2) q0[21];
-sx q0[21];
-rz(pi/2) q0[21];
-cx q0[20],q0[21];
-rz(-pi/4) q0[21];
-cx q0[18],q0[21];
-rz(pi/4) q0[21];
-cx q0[20],q0[21];
-rz(pi/4) q0[20];
-rz(-pi/4) q0[21];
-cx q0[18],q0[21];
-cx q0[18],q0[20];
-rz(pi/4) q0[18];
-rz(-pi/4) q0[20];
-cx q0[18],q0[20];
-cx q0[19],q0[20];
-rz(pi/4) q0[21];
-cx q0[20],q0[21];
-rz(-pi/4) q0[21];
-cx q0[19],q0[21];
-rz(pi/4) q0[21];
-cx q0[20],q0[21];
-rz(pi/4) q0[20];
-rz(-pi/4) q0[21];
-cx q0[19],q0[21];
-cx q0[19],q0[20];
-rz(pi/4) q0[19];
-rz(-pi/4) q0[20];
-cx q0[18],q0[20];
-rz(pi/2) q0[18];
-sx q0[18];
-rz(pi/2) q0[18];
-cx q0[17],q0[18];
-rz(-pi/4) q0[18];
-cx q0[15],q0[18];
-rz(pi/4) q0[18];
-cx q0[17],q0[18];
-rz(pi/4) q0[17];
-rz(-pi/4) q0[18];
-cx q0[15],q0[18];
-cx q0[15],q0[17];
-rz(pi/4) q0[15];
-rz(-pi/4) q0[17];
-cx q0[15],q0[17];
-cx q0[16],q0[17];
-rz(pi/4) q0[18];
-cx q0[17],q0[18];
-rz(-pi/4) q0[18];
-cx q0[16],q0[18];
-rz(pi/4) q0[18];
-cx q0[17],q0[18];
-rz(pi/4) q0[17];
-rz(-pi/4) q0[18];
-cx q0[16],q0[18];
-cx q0[16],q0[17];
-rz(pi/4) q0[16];
-rz(-pi/4) q0[17];
-cx q0[15],q0[17];
-rz(pi/2) q0[15];
-sx q0[15];
-rz(pi/2) q0[15];
-cx q0[14],q0[15];
-rz(-pi/4) q0[15];
-cx q0[12],q0[15];
-rz(pi/4) q0[15];
-cx q0[14],q0[15];
-rz(pi/4) q0[14];
-rz(-pi/4) q0[15];
-cx q0[12],q0[15];
-cx q0[12],q0[14];
-rz(pi/4) q0[12];
-rz(-pi/4) q0[14];
-cx q0[12],q0[14];
-cx q0[13],q0[14];
-rz(pi/4) q0[15];
-cx q0[14],q0[15];
-rz(-pi/4) q0[15];
-cx q0[13],q0[15];
-rz(pi/4) q0[15];
-cx q0[14],q0[15];
-rz(pi/4) q0[14];
-rz(-pi/4) q0[15];
-cx q0[13],q0[15];
-cx q0[13],q0[14];
-rz(pi/4) q0[13];
-rz(-pi/4) q0[14];
-cx q0[12],q0[14];
-rz(pi/2) q0[12];
-sx q0[12];
-rz(pi/2) q0[12];
-cx q0[11],q0[12];
-rz(-pi/4) q0[12];
-rz(pi/4) q0[15];
-cx q0[14],q0[15];
-rz(-pi/4) q0[15];
-cx q0[13],q0[15];
-rz(pi/4) q0[15];
-cx q0[14],q0[15];
-rz(pi/4) q0[14];
-rz(-pi/4) q0[15];
-cx q0[13],q0[15];
-cx q0[13],q0[14];
-rz(pi/4) q0[13];
-rz(-pi/4) q0[14];
-rz(pi/4) q0[15];
-cx q0[14],q0[15];
-rz(-pi/4) q0[15];
-rz(pi/4) q0[18];
-cx q0[17],q0[18];
-rz(-pi/4) q0[18];
-cx q0[16],q0[18];
-rz(pi/4) q0[18];
-cx q0[17],q0[18];
-rz(pi/4) q0[17];
-rz(-pi/4) q0[18];
-cx q0[16],q0[18];
-cx q0[16],q0[17];
-rz(pi/4) q0[16];
-rz(-pi/4) q0[17];
-rz(pi/4) q0[18];
-cx q0[17],q0[18];
-rz(-pi/4) q0[18];
-rz(pi/4) q0[21];
-cx q0[20],q0[21];
-rz(-pi/4) q0[21];
-cx q0[19],q0[21];
-rz(pi/4) q0[21];
-cx q0[20],q0[21];
-rz(pi/4) q0[20];
-rz(-pi/4) q0[21];
-cx q0[19],q0[21];
-cx q0[19],q0[20];
-rz(pi/4) q0[19];
-rz(-pi/4) q0[20];
-rz(pi/4) q0[21];
-cx q0[20],q0[21];
-rz(-pi/4) q0[21];
-rz(pi/4) q0[24];
-cx q0[23],q0[24];
-rz(-pi/4) q0[24];
-cx q0[22],q0[24];
-rz(pi/4) q0[24];
-cx q0[23],q0[24];
-rz(pi/4) q0[23];
-rz(-pi/4) q0[24];
-cx q0[22],q0[24];
-cx q0[22],q0[23];
-rz(pi/4) q0[22];
-rz(-pi/4) q0[23];
-rz(pi/4) q0[24];
-cx q0[23],q0[24];
-rz(-pi/4) q0[24];
-rz(pi/4) q0[27];
-cx q0[26],q0[27];
-rz(-pi/4) q0[27];
-cx q0[25],q0[27];
-rz(pi/4) q0[27];
-cx q0[26],q0[27];
-rz(pi/4) q0[26];
-rz(-pi/4) q0[27];
-cx q0[25],q0[27];
-cx q0[25],q0[26];
-rz(pi/4) q0[25];
-rz(-pi/4) q0[26];
-rz(pi/4) q0[27];
-cx q0[26],q0[27];
-rz(-pi/4) q0[27];
-rz(pi/4) q0[30];
-cx q0[29],q0[30];
-rz(-pi/4) q0[30];
-rz(pi/4) q0[33];
-cx q0[32],q0[33];
-rz(-pi/4) q0[33];
-rz(pi/4) q0[36];
-cx q0[35],q0[36];
-rz(-pi/4) q0[36];
-rz(pi/4) q0[39];
-cx q0[38],q0[39];
-rz(-pi/4) q0[39];
-rz(pi/4) q0[42];
-cx q0[41],q0[42];
-rz(-pi/4) q0[42];
-rz(pi/2) q0[43];
-sx q0[43];
-rz(pi/2) q0[43];
-cx q0[45],q0[28];
-rz(-pi/4) q0[28];
-cx q0[46],q0[31];
-rz(-pi/4) q0[31];
-cx q0[47],q0[34];
-rz(-pi/4) q0[34];
-cx q0[48],q0[37];
-rz(-pi/4) q0[37];
-cx q0[49],q0[40];
-rz(-pi/4) q0[40];
-cx q0[69],q0[50];
-rz(-pi/4) q0[50];
-rz(pi/4) q0[69];
-cx q0[69],q0[50];
-cx q0[50],q0[43];
-rz(-pi/4) q0[43];
-cx q0[69],q0[28];
-rz(pi/4) q0[28];
-cx q0[45],q0[28];
-rz(-pi/4) q0[28];
-rz(pi/4) q0[45];
-cx q0[69],q0[28];
-rz(3*pi/4) q0[28];
-sx q0[28];
-rz(pi/2) q0[28];
-cx q0[28],q0[30];
-rz(pi/4) q0[30];
-cx q0[29],q0[30];
-rz(pi/4) q0[29];
-rz(-pi/4) q0[30];
-cx q0[28],q0[30];
-cx q0[28],q0[29];
-rz(pi/4) q0[28];
-rz(-pi/4) q0[29];
-rz(pi/4) q0[30];
-cx q0[29],q0[30];
-rz(-pi/4) q0[30];
-cx q0[69],q0[45];
-rz(-pi/4) q0[45];
-rz(pi/4) q0[69];
-cx q0[69],q0[45];
-cx q0[69],q0[31];
-rz(pi/4) q0[31];
-cx q0[46],q0[31];
-rz(-pi/4) q0[31];
-rz(pi/4) q0[46];
-cx q0[69],q0[31];
-rz(pi/4) q0[31];
-cx q0[45],q0[31];
-rz(-pi/4) q0[31];
-cx q0[69],q0[46];
-rz(-pi/4) q0[46];
-rz(pi/4) q0[69];
-cx q0[69],q0[46];
-cx q0[69],q0[34];
-rz(pi/4) q0[34];
-cx q0[47],q0[34];
-rz(-pi/4) q0[34];
-rz(pi/4) q0[47];
-cx q0[69],q0[34];
-rz(pi/4) q0[34];
-cx q0[46],q0[34];
-rz(-pi/4) q0[34];
-cx q0[69],q0[47];
-rz(-pi/4) q0[47];
-rz(pi/4) q0[69];
-cx q0[69],q0[47];
-cx q0[69],q0[37];
-rz(pi/4) q0[37];
-cx q0[48],q0[37];
-rz(-pi/4) q0[37];
-rz(pi/4) q0[48];
-cx q0[69],q0[37];
-rz(pi/4) q0[37];
-cx q0[47],q0[37];
-rz(-pi/4) q0[37];
-cx q0[69],q0[48];
-rz(-pi/4) q0[48];
-rz(pi/4) q0[69];
-cx q0[69],q0[48];
-cx q0[69],q0[40];
-rz(pi/4) q0[40];
-cx q0[49],q0[40];
-rz(-pi/4) q0[40];
-rz(pi/4) q0[49];
-cx q0[69],q0[40];
-rz(pi/4) q0[40];
-cx q0[48],q0[40];
-rz(-pi/4) q0[40];
-cx q0[69],q0[49];
-rz(-pi/4) q0[49];
-rz(pi/4) q0[69];
-cx q0[69],q0[49];
-cx q0[69],q0[43];
-rz(pi/4) q0[43];
-cx q0[50],q0[43];
-rz(-pi/4) q0[43];
-rz(pi/4) q0[50];
-cx q0[69],q0[43];
-rz(pi/4) q0[43];
-cx q0[49],q0[43];
-rz(-pi/4) q0[43];
-cx q0[69],q0[50];
-rz(-pi/4) q0[50];
-rz(pi/4) q0[69];
-cx q0[69],q0[50];
-cx q0[9],q0[12];
-rz(pi/4) q0[12];
-cx q0[11],q0[12];
-rz(pi/4) q0[11];
-rz(-pi/4) q0[12];
-cx q0[9],q0[12];
-rz(pi/4) q0[12];
-cx q0[9],q0[11];
-rz(-pi/4) q0[11];
-rz(pi/4) q0[9];
-cx q0[9],q0[11];
-cx q0[10],q0[11];
-cx q0[11],q0[12];
-rz(-pi/4) q0[12];
-cx q0[10],q0[12];
-rz(pi/4) q0[12];
-cx q0[11],q0[12];
-rz(pi/4) q0[11];
-rz(-pi/4) q0[12];
-cx q0[10],q0[12];
-cx q0[10],q0[11];
-rz(pi/4) q0[10];
-rz(-pi/4) q0[11];
-rz(pi/4) q0[12];
-cx q0[9],q0[11];
-cx q0[11],q0[12];
-rz(-pi/4) q0[12];
-cx q0[10],q0[12];
-rz(pi/4) q0[12];
-cx q0[11],q0[12];
-rz(pi/4) q0[11];
-rz(-pi/4) q0[12];
-cx q0[10],q0[12];
-cx q0[10],q0[11];
-rz(pi/4) q0[10];
-rz(-pi/4) q0[11];
-rz(pi/4) q0[12];
-cx q0[11],q0[12];
-rz(-pi/4) q0[12];
-rz(pi/2) q0[9];
-sx q0[9];
-rz(pi/2) q0[9];
-cx q0[8],q0[9];
-rz(-pi/4) q0[9];
-cx q0[6],q0[9];
-rz(pi/4) q0[9];
-cx q0[8],q0[9];
-rz(pi/4) q0[8];
-rz(-pi/4) q0[9];
-cx q0[6],q0[9];
-cx q0[6],q0[8];
-rz(pi/4) q0[6];
-rz(-pi/4) q0[8];
-cx q0[6],q0[8];
-cx q0[7],q0[8];
-rz(pi/4) q0[9];
-cx q0[8],q0[9];
-rz(-pi/4) q0[9];
-cx q0[7],q0[9];
-rz(pi/4) q0[9];
-cx q0[8],q0[9];
-rz(pi/4) q0[8];
-rz(-pi/4) q0[9];
-cx q0[7],q0[9];
-cx q0[7],q0[8];
-rz(pi/4) q0[7];
-rz(-pi/4) q0[8];
-cx q0[6],q0[8];
-rz(pi/2) q0[6];
-sx q0[6];
-rz(pi/2) q0[6];
-cx q0[5],q0[6];
-rz(-pi/4) q0[6];
-cx q0[3],q0[6];
-rz(pi/4) q0[6];
-cx q0[5],q0[6];
-rz(pi/4) q0[5];
-rz(-pi/4) q0[6];
-cx q0[3],q0[6];
-cx q0[3],q0[5];
-rz(pi/4) q0[3];
-rz(-pi/4) q0[5];
-cx q0[3],q0[5];
-cx q0[4],q0[5];
-rz(pi/4) q0[6];
-cx q0[5],q0[6];
-rz(-pi/4) q0[6];
-cx q0[4],q0[6];
-rz(pi/4) q0[6];
-cx q0[5],q0[6];
-rz(pi/4) q0[5];
-rz(-pi/4) q0[6];
-cx q0[4],q0[6];
-cx q0[4],q0[5];
-rz(pi/4) q0[4];
-rz(-pi/4) q0[5];
-cx q0[3],q0[5];
-rz(pi/2) q0[3];
-sx q0[3];
-rz(pi/2) q0[3];
-cx q0[2],q0[3];
-rz(-pi/4) q0[3];
-cx q0[0],q0[3];
-rz(pi/4) q0[3];
-cx q0[2],q0[3];
-rz(pi/4) q0[2];
-rz(-pi/4) q0[3];
-cx q0[0],q0[3];
-cx q0[0],q0[2];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[2];
-cx q0[0],q0[2];
-cx q0[1],q0[2];
-rz(pi/4) q0[3];
-cx q0[2],q0[3];
-rz(-pi/4) q0[3];
-cx q0[1],q0[3];
-rz(pi/4) q0[3];
-cx q0[2],q0[3];
-rz(pi/4) q0[2];
-rz(-pi/4) q0[3];
-cx q0[1],q0[3];
-cx q0[1],q0[2];
-rz(pi/4) q0[1];
-rz(-pi/4) q0[2];
-cx q0[0],q0[2];
-rz(pi/4) q0[3];
-cx q0[2],q0[3];
-rz(-pi/4) q0[3];
-cx q0[1],q0[3];
-rz(pi/4) q0[3];
-cx q0[2],q0[3];
-rz(pi/4) q0[2];
-rz(-pi/4) q0[3];
-cx q0[1],q0[3];
-cx q0[1],q0[2];
-rz(pi/4) q0[1];
-rz(-pi/4) q0[2];
-rz(pi/4) q0[3];
-cx q0[2],q0[3];
-rz(-pi/4) q0[3];
-cx q0[0],q0[3];
-rz(pi/4) q0[3];
-cx q0[2],q0[3];
-rz(pi/4) q0[2];
-rz(-pi/4) q0[3];
-cx q0[0],q0[3];
-cx q0[0],q0[2];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[2];
-cx q0[0],q0[2];
-rz(3*pi/4) q0[3];
-sx q0[3];
-rz(pi/2) q0[3];
-rz(pi/4) q0[6];
-cx q0[5],q0[6];
-rz(-pi/4) q0[6];
-cx q0[4],q0[6];
-rz(pi/4) q0[6];
-cx q0[5],q0[6];
-rz(pi/4) q0[5];
-rz(-pi/4) q0[6];
-cx q0[4],q0[6];
-cx q0[4],q0[5];
-rz(pi/4) q0[4];
-rz(-pi/4) q0[5];
-rz(pi/4) q0[6];
-cx q0[5],q0[6];
-rz(-pi/4) q0[6];
-cx q0[3],q0[6];
-rz(pi/4) q0[6];
-cx q0[5],q0[6];
-rz(pi/4) q0[5];
-rz(-pi/4) q0[6];
-cx q0[3],q0[6];
-cx q0[3],q0[5];
-rz(pi/4) q0[3];
-rz(-pi/4) q0[5];
-cx q0[3],q0[5];
-rz(3*pi/4) q0[6];
-sx q0[6];
-rz(pi/2) q0[6];
-rz(pi/4) q0[9];
-cx q0[8],q0[9];
-rz(-pi/4) q0[9];
-cx q0[7],q0[9];
-rz(pi/4) q0[9];
-cx q0[8],q0[9];
-rz(pi/4) q0[8];
-rz(-pi/4) q0[9];
-cx q0[7],q0[9];
-cx q0[7],q0[8];
-rz(pi/4) q0[7];
-rz(-pi/4) q0[8];
-rz(pi/4) q0[9];
-cx q0[8],q0[9];
-rz(-pi/4) q0[9];
-cx q0[6],q0[9];
-rz(pi/4) q0[9];
-cx q0[8],q0[9];
-rz(pi/4) q0[8];
-rz(-pi/4) q0[9];
-cx q0[6],q0[9];
-cx q0[6],q0[8];
-rz(pi/4) q0[6];
-rz(-pi/4) q0[8];
-cx q0[6],q0[8];
-rz(3*pi/4) q0[9];
-sx q0[9];
-rz(pi/2) q0[9];
-cx q0[9],q0[12];
-rz(pi/4) q0[12];
-cx q0[11],q0[12];
-rz(pi/4) q0[11];
-rz(-pi/4) q0[12];
-cx q0[9],q0[12];
-rz(3*pi/4) q0[12];
-sx q0[12];
-rz(pi/2) q0[12];
-cx q0[12],q0[15];
-rz(pi/4) q0[15];
-cx q0[14],q0[15];
-rz(pi/4) q0[14];
-rz(-pi/4) q0[15];
-cx q0[12],q0[15];
-cx q0[12],q0[14];
-rz(pi/4) q0[12];
-rz(-pi/4) q0[14];
-cx q0[12],q0[14];
-rz(3*pi/4) q0[15];
-sx q0[15];
-rz(pi/2) q0[15];
-cx q0[15],q0[18];
-rz(pi/4) q0[18];
-cx q0[17],q0[18];
-rz(pi/4) q0[17];
-rz(-pi/4) q0[18];
-cx q0[15],q0[18];
-cx q0[15],q0[17];
-rz(pi/4) q0[15];
-rz(-pi/4) q0[17];
-cx q0[15],q0[17];
-rz(3*pi/4) q0[18];
-sx q0[18];
-rz(pi/2) q0[18];
-cx q0[18],q0[21];
-rz(pi/4) q0[21];
-cx q0[20],q0[21];
-rz(pi/4) q0[20];
-rz(-pi/4) q0[21];
-cx q0[18],q0[21];
-cx q0[18],q0[20];
-rz(pi/4) q0[18];
-rz(-pi/4) q0[20];
-cx q0[18],q0[20];
-rz(3*pi/4) q0[21];
-sx q0[21];
-rz(pi/2) q0[21];
-cx q0[21],q0[24];
-rz(pi/4) q0[24];
-cx q0[23],q0[24];
-rz(pi/4) q0[23];
-rz(-pi/4) q0[24];
-cx q0[21],q0[24];
-cx q0[21],q0[23];
-rz(pi/4) q0[21];
-rz(-pi/4) q0[23];
-cx q0[21],q0[23];
-rz(3*pi/4) q0[24];
-sx q0[24];
-rz(pi/2) q0[24];
-cx q0[24],q0[27];
-rz(pi/4) q0[27];
-cx q0[26],q0[27];
-rz(pi/4) q0[26];
-rz(-pi/4) q0[27];
-cx q0[24],q0[27];
-cx q0[24],q0[26];
-rz(pi/4) q0[24];
-rz(-pi/4) q0[26];
-cx q0[24],q0[26];
-rz(3*pi/4) q0[27];
-sx q0[27];
-rz(pi/2) q0[27];
-cx q0[27],q0[30];
-rz(pi/4) q0[30];
-cx q0[29],q0[30];
-rz(pi/4) q0[29];
-rz(-pi/4) q0[30];
-cx q0[27],q0[30];
-cx q0[27],q0[29];
-rz(pi/4) q0[27];
-rz(-pi/4) q0[29];
-cx q0[27],q0[29];
-rz(3*pi/4) q0[30];
-sx q0[30];
-rz(pi/2) q0[30];
-cx q0[9],q0[11];
-rz(-pi/4) q0[11];
-rz(pi/4) q0[9];
-cx q0[9],q0[11];
-cx q0[70],q0[31];
-rz(pi/4) q0[31];
-cx q0[45],q0[31];
-rz(-pi/4) q0[31];
-rz(pi/4) q0[45];
-cx q0[70],q0[31];
-rz(3*pi/4) q0[31];
-sx q0[31];
-rz(pi/2) q0[31];
-cx q0[31],q0[33];
-rz(pi/4) q0[33];
-cx q0[32],q0[33];
-rz(pi/4) q0[32];
-rz(-pi/4) q0[33];
-cx q0[31],q0[33];
-cx q0[31],q0[32];
-rz(pi/4) q0[31];
-rz(-pi/4) q0[32];
-rz(pi/4) q0[33];
-cx q0[32],q0[33];
-rz(-pi/4) q0[33];
-cx q0[30],q0[33];
-rz(pi/4) q0[33];
-cx q0[32],q0[33];
-rz(pi/4) q0[32];
-rz(-pi/4) q0[33];
-cx q0[30],q0[33];
-cx q0[30],q0[32];
-rz(pi/4) q0[30];
-rz(-pi/4) q0[32];
-cx q0[30],q0[32];
-rz(3*pi/4) q0[33];
-sx q0[33];
-rz(pi/2) q0[33];
-cx q0[70],q0[45];
-rz(-pi/4) q0[45];
-rz(pi/4) q0[70];
-cx q0[70],q0[45];
-cx q0[70],q0[34];
-rz(pi/4) q0[34];
-cx q0[46],q0[34];
-rz(-pi/4) q0[34];
-rz(pi/4) q0[46];
-cx q0[70],q0[34];
-rz(3*pi/4) q0[34];
-sx q0[34];
-rz(pi/2) q0[34];
-cx q0[34],q0[36];
-rz(pi/4) q0[36];
-cx q0[35],q0[36];
-rz(pi/4) q0[35];
-rz(-pi/4) q0[36];
-cx q0[34],q0[36];
-cx q0[34],q0[35];
-rz(pi/4) q0[34];
-rz(-pi/4) q0[35];
-rz(pi/4) q0[36];
-cx q0[35],q0[36];
-rz(-pi/4) q0[36];
-cx q0[33],q0[36];
-rz(pi/4) q0[36];
-cx q0[35],q0[36];
-rz(pi/4) q0[35];
-rz(-pi/4) q0[36];
-cx q0[33],q0[36];
-cx q0[33],q0[35];
-rz(pi/4) q0[33];
-rz(-pi/4) q0[35];
-cx q0[33],q0[35];
-rz(3*pi/4) q0[36];
-sx q0[36];
-rz(pi/2) q0[36];
-cx q0[70],q0[46];
-rz(-pi/4) q0[46];
-rz(pi/4) q0[70];
-cx q0[70],q0[46];
-cx q0[70],q0[37];
-rz(pi/4) q0[37];
-cx q0[47],q0[37];
-rz(-pi/4) q0[37];
-rz(pi/4) q0[47];
-cx q0[70],q0[37];
-rz(3*pi/4) q0[37];
-sx q0[37];
-rz(pi/2) q0[37];
-cx q0[37],q0[39];
-rz(pi/4) q0[39];
-cx q0[38],q0[39];
-rz(pi/4) q0[38];
-rz(-pi/4) q0[39];
-cx q0[37],q0[39];
-cx q0[37],q0[38];
-rz(pi/4) q0[37];
-rz(-pi/4) q0[38];
-rz(pi/4) q0[39];
-cx q0[38],q0[39];
-rz(-pi/4) q0[39];
-cx q0[36],q0[39];
-rz(pi/4) q0[39];
-cx q0[38],q0[39];
-rz(pi/4) q0[38];
-rz(-pi/4) q0[39];
-cx q0[36],q0[39];
-cx q0[36],q0[38];
-rz(pi/4) q0[36];
-rz(-pi/4) q0[38];
-cx q0[36],q0[38];
-rz(3*pi/4) q0[39];
-sx q0[39];
-rz(pi/2) q0[39];
-cx q0[70],q0[47];
-rz(-pi/4) q0[47];
-rz(pi/4) q0[70];
-cx q0[70],q0[47];
-cx q0[70],q0[40];
-rz(pi/4) q0[40];
-cx q0[48],q0[40];
-rz(-pi/4) q0[40];
-rz(pi/4) q0[48];
-cx q0[70],q0[40];
-rz(3*pi/4) q0[40];
-sx q0[40];
-rz(pi/2) q0[40];
-cx q0[40],q0[42];
-rz(pi/4) q0[42];
-cx q0[41],q0[42];
-rz(pi/4) q0[41];
-rz(-pi/4) q0[42];
-cx q0[40],q0[42];
-cx q0[40],q0[41];
-rz(pi/4) q0[40];
-rz(-pi/4) q0[41];
-rz(pi/4) q0[42];
-cx q0[41],q0[42];
-rz(-pi/4) q0[42];
-cx q0[39],q0[42];
-rz(pi/4) q0[42];
-cx q0[41],q0[42];
-rz(pi/4) q0[41];
-rz(-pi/4) q0[42];
-cx q0[39],q0[42];
-cx q0[39],q0[41];
-rz(pi/4) q0[39];
-rz(-pi/4) q0[41];
-cx q0[39],q0[41];
-rz(3*pi/4) q0[42];
-sx q0[42];
-rz(pi/2) q0[42];
-cx q0[70],q0[48];
-rz(-pi/4) q0[48];
-rz(pi/4) q0[70];
-cx q0[70],q0[48];
-cx q0[70],q0[43];
-rz(pi/4) q0[43];
-cx q0[49],q0[43];
-rz(-pi/4) q0[43];
-rz(pi/4) q0[49];
-cx q0[70],q0[43];
-rz(3*pi/4) q0[43];
-sx q0[43];
-rz(pi/2) q0[43];
-cx q0[43],q0[44];
-cx q0[42],q0[44];
-rz(pi/2) q0[42];
-sx q0[42];
-rz(pi/2) q0[42];
-cx q0[41],q0[42];
-rz(-pi/4) q0[42];
-cx q0[39],q0[42];
-rz(pi/4) q0[42];
-cx q0[41],q0[42];
-rz(pi/4) q0[41];
-rz(-pi/4) q0[42];
-cx q0[39],q0[42];
-cx q0[39],q0[41];
-rz(pi/4) q0[39];
-rz(-pi/4) q0[41];
-cx q0[39],q0[41];
-cx q0[40],q0[41];
-rz(pi/4) q0[42];
-cx q0[41],q0[42];
-rz(-pi/4) q0[42];
-cx q0[40],q0[42];
-rz(pi/4) q0[42];
-cx q0[41],q0[42];
-rz(pi/4) q0[41];
-rz(-pi/4) q0[42];
-cx q0[40],q0[42];
-cx q0[40],q0[41];
-rz(3*pi/4) q0[40];
-sx q0[40];
-rz(pi/2) q0[40];
-rz(-pi/4) q0[41];
-cx q0[39],q0[41];
-rz(pi/2) q0[39];
-sx q0[39];
-rz(pi/2) q0[39];
-cx q0[38],q0[39];
-rz(-pi/4) q0[39];
-cx q0[36],q0[39];
-rz(pi/4) q0[39];
-cx q0[38],q0[39];
-rz(pi/4) q0[38];
-rz(-pi/4) q0[39];
-cx q0[36],q0[39];
-cx q0[36],q0[38];
-rz(pi/4) q0[36];
-rz(-pi/4) q0[38];
-cx q0[36],q0[38];
-cx q0[37],q0[38];
-rz(pi/4) q0[39];
-cx q0[38],q0[39];
-rz(-pi/4) q0[39];
-cx q0[37],q0[39];
-rz(pi/4) q0[39];
-cx q0[38],q0[39];
-rz(pi/4) q0[38];
-rz(-pi/4) q0[39];
-cx q0[37],q0[39];
-cx q0[37],q0[38];
-rz(3*pi/4) q0[37];
-sx q0[37];
-rz(pi/2) q0[37];
-rz(-pi/4) q0[38];
-cx q0[36],q0[38];
-rz(pi/2) q0[36];
-sx q0[36];
-rz(pi/2) q0[36];
-cx q0[35],q0[36];
-rz(-pi/4) q0[36];
-cx q0[33],q0[36];
-rz(pi/4) q0[36];
-cx q0[35],q0[36];
-rz(pi/4) q0[35];
-rz(-pi/4) q0[36];
-cx q0[33],q0[36];
-cx q0[33],q0[35];
-rz(pi/4) q0[33];
-rz(-pi/4) q0[35];
-cx q0[33],q0[35];
-cx q0[34],q0[35];
-rz(pi/4) q0[36];
-cx q0[35],q0[36];
-rz(-pi/4) q0[36];
-cx q0[34],q0[36];
-rz(pi/4) q0[36];
-cx q0[35],q0[36];
-rz(pi/4) q0[35];
-rz(-pi/4) q0[36];
-cx q0[34],q0[36];
-cx q0[34],q0[35];
-rz(3*pi/4) q0[34];
-sx q0[34];
-rz(pi/2) q0[34];
-rz(-pi/4) q0[35];
-cx q0[33],q0[35];
-rz(pi/2) q0[33];
-sx q0[33];
-rz(pi/2) q0[33];
-cx q0[32],q0[33];
-rz(-pi/4) q0[33];
-cx q0[30],q0[33];
-rz(pi/4) q0[33];
-cx q0[32],q0[33];
-rz(pi/4) q0[32];
-rz(-pi/4) q0[33];
-cx q0[30],q0[33];
-cx q0[30],q0[32];
-rz(pi/4) q0[30];
-rz(-pi/4) q0[32];
-cx q0[30],q0[32];
-cx q0[31],q0[32];
-rz(pi/4) q0[33];
-cx q0[32],q0[33];
-rz(-pi/4) q0[33];
-cx q0[31],q0[33];
-rz(pi/4) q0[33];
-cx q0[32],q0[33];
-rz(pi/4) q0[32];
-rz(-pi/4) q0[33];
-cx q0[31],q0[33];
-cx q0[31],q0[32];
-rz(3*pi/4) q0[31];
-sx q0[31];
-rz(pi/2) q0[31];
-rz(-pi/4) q0[32];
-cx q0[30],q0[32];
-rz(pi/2) q0[30];
-sx q0[30];
-rz(pi/2) q0[30];
-cx q0[29],q0[30];
-rz(-pi/4) q0[30];
-cx q0[27],q0[30];
-rz(pi/4) q0[30];
-cx q0[29],q0[30];
-rz(pi/4) q0[29];
-rz(-pi/4) q0[30];
-cx q0[27],q0[30];
-cx q0[27],q0[29];
-rz(pi/4) q0[27];
-rz(-pi/4) q0[29];
-cx q0[27],q0[29];
-cx q0[28],q0[29];
-rz(pi/4) q0[30];
-cx q0[29],q0[30];
-rz(-pi/4) q0[30];
-cx q0[28],q0[30];
-rz(pi/4) q0[30];
-cx q0[29],q0[30];
-rz(pi/4) q0[29];
-rz(-pi/4) q0[30];
-cx q0[28],q0[30];
-cx q0[28],q0[29];
-rz(pi/4) q0[28];
-rz(-pi/4) q0[29];
-cx q0[27],q0[29];
-rz(pi/2) q0[27];
-sx q0[27];
-rz(pi/2) q0[27];
-cx q0[26],q0[27];
-rz(-pi/4) q0[27];
-cx q0[24],q0[27];
-rz(pi/4) q0[27];
-cx q0[26],q0[27];
-rz(pi/4) q0[26];
-rz(-pi/4) q0[27];
-cx q0[24],q0[27];
-cx q0[24],q0[26];
-rz(pi/4) q0[24];
-rz(-pi/4) q0[26];
-cx q0[24],q0[26];
-cx q0[25],q0[26];
-rz(pi/4) q0[27];
-cx q0[26],q0[27];
-rz(-pi/4) q0[27];
-cx q0[25],q0[27];
-rz(pi/4) q0[27];
-cx q0[26],q0[27];
-rz(pi/4) q0[26];
-rz(-pi/4) q0[27];
-cx q0[25],q0[27];
-cx q0[25],q0[26];
-rz(pi/4) q0[25];
-rz(-pi/4) q0[26];
-cx q0[24],q0[26];
-rz(pi/2) q0[24];
-sx q0[24];
-rz(pi/2) q0[24];
-cx q0[23],q0[24];
-rz(-pi/4) q0[24];
-cx q0[21],q0[24];
-rz(pi/4) q0[24];
-cx q0[23],q0[24];
-rz(pi/4) q0[23];
-rz(-pi/4) q0[24];
-cx q0[21],q0[24];
-cx q0[21],q0[23];
-rz(pi/4) q0[21];
-rz(-pi/4) q0[23];
-cx q0[21],q0[23];
-cx q0[22],q0[23];
-rz(pi/4) q0[24];
-cx q0[23],q0[24];
-rz(-pi/4) q0[24];
-cx q0[22],q0[24];
-rz(pi/4) q0[24];
-cx q0[23],q0[24];
-rz(pi/4) q0[23];
-rz(-pi/4) q0[24];
-cx q0[22],q0[24];
-cx q0[22],q0[23];
-rz(pi/4) q0[22];
-rz(-pi/4) q0[23];
-cx q0[21],q0[23];
-rz(pi/2) q0[21];
-sx q0[21];
-rz(pi/2) q0[21];
-cx q0[20],q0[21];
-rz(-pi/4) q0[21];
-cx q0[18],q0[21];
-rz(pi/4) q0[21];
-cx q0[20],q0[21];
-rz(pi/4) q0[20];
-rz(-pi/4) q0[21];
-cx q0[18],q0[21];
-cx q0[18],q0[20];
-rz(pi/4) q0[18];
-rz(-pi/4) q0[20];
-cx q0[18],q0[20];
-cx q0[19],q0[20];
-rz(pi/4) q0[21];
-cx q0[20],q0[21];
-rz(-pi/4) q0[21];
-cx q0[19],q0[21];
-rz(pi/4) q0[21];
-cx q0[20],q0[21];
-rz(pi/4) q0[20];
-rz(-pi/4) q0[21];
-cx q0[19],q0[21];
-cx q0[19],q0[20];
-rz(pi/4) q0[19];
-rz(-pi/4) q0[20];
-cx q0[18],q0[20];
-rz(pi/2) q0[18];
-sx q0[18];
-rz(pi/2) q0[18];
-cx q0[17],q0[18];
-rz(-pi/4) q0[18];
-cx q0[15],q0[18];
-rz(pi/4) q0[18];
-cx q0[17],q0[18];
-rz(pi/4) q0[17];
-rz(-pi/4) q0[18];
-cx q0[15],q0[18];
-cx q0[15],q0[17];
-rz(pi/4) q0[15];
-rz(-pi/4) q0[17];
-cx q0[15],q0[17];
-cx q0[16],q0[17];
-rz(pi/4) q0[18];
-cx q0[17],q0[18];
-rz(-pi/4) q0[18];
-cx q0[16],q0[18];
-rz(pi/4) q0[18];
-cx q0[17],q0[18];
-rz(pi/4) q0[17];
-rz(-pi/4) q0[18];
-cx q0[16],q0[18];
-cx q0[16],q0[17];
-rz(pi/4) q0[16];
-rz(-pi/4) q0[17];
-cx q0[15],q0[17];
-rz(pi/2) q0[15];
-sx q0[15];
-rz(pi/2) q0[15];
-cx q0[14],q0[15];
-rz(-pi/4) q0[15];
-cx q0[12],q0[15];
-rz(pi/4) q0[15];
-cx q0[14],q0[15];
-rz(pi/4) q0[14];
-rz(-pi/4) q0[15];
-cx q0[12],q0[15];
-cx q0[12],q0[14];
-rz(pi/4) q0[12];
-rz(-pi/4) q0[14];
-cx q0[12],q0[14];
-cx q0[13],q0[14];
-rz(pi/4) q0[15];
-cx q0[14],q0[15];
-rz(-pi/4) q0[15];
-cx q0[13],q0[15];
-rz(pi/4) q0[15];
-cx q0[14],q0[15];
-rz(pi/4) q0[14];
-rz(-pi/4) q0[15];
-cx q0[13],q0[15];
-cx q0[13],q0[14];
-rz(pi/4) q0[13];
-rz(-pi/4) q0[14];
-cx q0[12],q0[14];
-rz(pi/2) q0[12];
-sx q0[12];
-rz(pi/2) q0[12];
-cx q0[11],q0[12];
-rz(-pi/4) q0[12];
-rz(pi/4) q0[15];
-cx q0[14],q0[15];
-rz(-pi/4) q0[15];
-cx q0[13],q0[15];
-rz(pi/4) q0[15];
-cx q0[14],q0[15];
-rz(pi/4) q0[14];
-rz(-pi/4) q0[15];
-cx q0[13],q0[15];
-cx q0[13],q0[14];
-rz(pi/4) q0[13];
-rz(-pi/4) q0[14];
-rz(pi/4) q0[15];
-cx q0[14],q0[15];
-rz(-pi/4) q0[15];
-rz(pi/4) q0[18];
-cx q0[17],q0[18];
-rz(-pi/4) q0[18];
-cx q0[16],q0[18];
-rz(pi/4) q0[18];
-cx q0[17],q0[18];
-rz(pi/4) q0[17];
-rz(-pi/4) q0[18];
-cx q0[16],q0[18];
-cx q0[16],q0[17];
-rz(pi/4) q0[16];
-rz(-pi/4) q0[17];
-rz(pi/4) q0[18];
-cx q0[17],q0[18];
-rz(-pi/4) q0[18];
-rz(pi/4) q0[21];
-cx q0[20],q0[21];
-rz(-pi/4) q0[21];
-cx q0[19],q0[21];
-rz(pi/4) q0[21];
-cx q0[20],q0[21];
-rz(pi/4) q0[20];
-rz(-pi/4) q0[21];
-cx q0[19],q0[21];
-cx q0[19],q0[20];
-rz(pi/4) q0[19];
-rz(-pi/4) q0[20];
-rz(pi/4) q0[21];
-cx q0[20],q0[21];
-rz(-pi/4) q0[21];
-rz(pi/4) q0[24];
-cx q0[23],q0[24];
-rz(-pi/4) q0[24];
-cx q0[22],q0[24];
-rz(pi/4) q0[24];
-cx q0[23],q0[24];
-rz(pi/4) q0[23];
-rz(-pi/4) q0[24];
-cx q0[22],q0[24];
-cx q0[22],q0[23];
-rz(pi/4) q0[22];
-rz(-pi/4) q0[23];
-rz(pi/4) q0[24];
-cx q0[23],q0[24];
-rz(-pi/4) q0[24];
-rz(pi/4) q0[27];
-cx q0[26],q0[27];
-rz(-pi/4) q0[27];
-cx q0[25],q0[27];
-rz(pi/4) q0[27];
-cx q0[26],q0[27];
-rz(pi/4) q0[26];
-rz(-pi/4) q0[27];
-cx q0[25],q0[27];
-cx q0[25],q0[26];
-rz(pi/4) q0[25];
-rz(-pi/4) q0[26];
-rz(pi/4) q0[27];
-cx q0[26],q0[27];
-rz(-pi/4) q0[27];
-rz(pi/4) q0[30];
-cx q0[29],q0[30];
-rz(-pi/4) q0[30];
-cx q0[28],q0[30];
-rz(pi/4) q0[30];
-cx q0[29],q0[30];
-rz(pi/4) q0[29];
-rz(-pi/4) q0[30];
-cx q0[28],q0[30];
-cx q0[28],q0[29];
-rz(pi/4) q0[28];
-rz(-pi/4) q0[29];
-rz(pi/4) q0[30];
-cx q0[29],q0[30];
-rz(-pi/4) q0[30];
-rz(pi/4) q0[33];
-cx q0[32],q0[33];
-rz(-pi/4) q0[33];
-rz(pi/4) q0[36];
-cx q0[35],q0[36];
-rz(-pi/4) q0[36];
-rz(pi/4) q0[39];
-cx q0[38],q0[39];
-rz(-pi/4) q0[39];
-rz(pi/4) q0[42];
-cx q0[41],q0[42];
-rz(-pi/4) q0[42];
-rz(pi/2) q0[43];
-sx q0[43];
-rz(pi/2) q0[43];
-cx q0[45],q0[31];
-rz(-pi/4) q0[31];
-cx q0[46],q0[34];
-rz(-pi/4) q0[34];
-cx q0[47],q0[37];
-rz(-pi/4) q0[37];
-cx q0[48],q0[40];
-rz(-pi/4) q0[40];
-cx q0[70],q0[49];
-rz(-pi/4) q0[49];
-rz(pi/4) q0[70];
-cx q0[70],q0[49];
-cx q0[49],q0[43];
-rz(-pi/4) q0[43];
-cx q0[70],q0[31];
-rz(pi/4) q0[31];
-cx q0[45],q0[31];
-rz(-pi/4) q0[31];
-rz(pi/4) q0[45];
-cx q0[70],q0[31];
-rz(3*pi/4) q0[31];
-sx q0[31];
-rz(pi/2) q0[31];
-cx q0[31],q0[33];
-rz(pi/4) q0[33];
-cx q0[32],q0[33];
-rz(pi/4) q0[32];
-rz(-pi/4) q0[33];
-cx q0[31],q0[33];
-cx q0[31],q0[32];
-rz(pi/4) q0[31];
-rz(-pi/4) q0[32];
-rz(pi/4) q0[33];
-cx q0[32],q0[33];
-rz(-pi/4) q0[33];
-cx q0[70],q0[45];
-rz(-pi/4) q0[45];
-rz(pi/4) q0[70];
-cx q0[70],q0[45];
-cx q0[70],q0[34];
-rz(pi/4) q0[34];
-cx q0[46],q0[34];
-rz(-pi/4) q0[34];
-rz(pi/4) q0[46];
-cx q0[70],q0[34];
-rz(pi/4) q0[34];
-cx q0[45],q0[34];
-rz(-pi/4) q0[34];
-cx q0[70],q0[46];
-rz(-pi/4) q0[46];
-rz(pi/4) q0[70];
-cx q0[70],q0[46];
-cx q0[70],q0[37];
-rz(pi/4) q0[37];
-cx q0[47],q0[37];
-rz(-pi/4) q0[37];
-rz(pi/4) q0[47];
-cx q0[70],q0[37];
-rz(pi/4) q0[37];
-cx q0[46],q0[37];
-rz(-pi/4) q0[37];
-cx q0[70],q0[47];
-rz(-pi/4) q0[47];
-rz(pi/4) q0[70];
-cx q0[70],q0[47];
-cx q0[70],q0[40];
-rz(pi/4) q0[40];
-cx q0[48],q0[40];
-rz(-pi/4) q0[40];
-rz(pi/4) q0[48];
-cx q0[70],q0[40];
-rz(pi/4) q0[40];
-cx q0[47],q0[40];
-rz(-pi/4) q0[40];
-cx q0[70],q0[48];
-rz(-pi/4) q0[48];
-rz(pi/4) q0[70];
-cx q0[70],q0[48];
-cx q0[70],q0[43];
-rz(pi/4) q0[43];
-cx q0[49],q0[43];
-rz(-pi/4) q0[43];
-rz(pi/4) q0[49];
-cx q0[70],q0[43];
-rz(pi/4) q0[43];
-cx q0[48],q0[43];
-rz(-pi/4) q0[43];
-cx q0[70],q0[49];
-rz(-pi/4) q0[49];
-rz(pi/4) q0[70];
-cx q0[70],q0[49];
-cx q0[9],q0[12];
-rz(pi/4) q0[12];
-cx q0[11],q0[12];
-rz(pi/4) q0[11];
-rz(-pi/4) q0[12];
-cx q0[9],q0[12];
-rz(pi/4) q0[12];
-cx q0[9],q0[11];
-rz(-pi/4) q0[11];
-rz(pi/4) q0[9];
-cx q0[9],q0[11];
-cx q0[10],q0[11];
-cx q0[11],q0[12];
-rz(-pi/4) q0[12];
-cx q0[10],q0[12];
-rz(pi/4) q0[12];
-cx q0[11],q0[12];
-rz(pi/4) q0[11];
-rz(-pi/4) q0[12];
-cx q0[10],q0[12];
-cx q0[10],q0[11];
-rz(pi/4) q0[10];
-rz(-pi/4) q0[11];
-rz(pi/4) q0[12];
-cx q0[9],q0[11];
-cx q0[11],q0[12];
-rz(-pi/4) q0[12];
-cx q0[10],q0[12];
-rz(pi/4) q0[12];
-cx q0[11],q0[12];
-rz(pi/4) q0[11];
-rz(-pi/4) q0[12];
-cx q0[10],q0[12];
-cx q0[10],q0[11];
-rz(pi/4) q0[10];
-rz(-pi/4) q0[11];
-rz(pi/4) q0[12];
-cx q0[11],q0[12];
-rz(-pi/4) q0[12];
-rz(pi/2) q0[9];
-sx q0[9];
-rz(pi/2) q0[9];
-cx q0[8],q0[9];
-rz(-pi/4) q0[9];
-cx q0[6],q0[9];
-rz(pi/4) q0[9];
-cx q0[8],q0[9];
-rz(pi/4) q0[8];
-rz(-pi/4) q0[9];
-cx q0[6],q0[9];
-cx q0[6],q0[8];
-rz(pi/4) q0[6];
-rz(-pi/4) q0[8];
-cx q0[6],q0[8];
-cx q0[7],q0[8];
-rz(pi/4) q0[9];
-cx q0[8],q0[9];
-rz(-pi/4) q0[9];
-cx q0[7],q0[9];
-rz(pi/4) q0[9];
-cx q0[8],q0[9];
-rz(pi/4) q0[8];
-rz(-pi/4) q0[9];
-cx q0[7],q0[9];
-cx q0[7],q0[8];
-rz(pi/4) q0[7];
-rz(-pi/4) q0[8];
-cx q0[6],q0[8];
-rz(pi/2) q0[6];
-sx q0[6];
-rz(pi/2) q0[6];
-cx q0[5],q0[6];
-rz(-pi/4) q0[6];
-cx q0[3],q0[6];
-rz(pi/4) q0[6];
-cx q0[5],q0[6];
-rz(pi/4) q0[5];
-rz(-pi/4) q0[6];
-cx q0[3],q0[6];
-cx q0[3],q0[5];
-rz(pi/4) q0[3];
-rz(-pi/4) q0[5];
-cx q0[3],q0[5];
-cx q0[4],q0[5];
-rz(pi/4) q0[6];
-cx q0[5],q0[6];
-rz(-pi/4) q0[6];
-cx q0[4],q0[6];
-rz(pi/4) q0[6];
-cx q0[5],q0[6];
-rz(pi/4) q0[5];
-rz(-pi/4) q0[6];
-cx q0[4],q0[6];
-cx q0[4],q0[5];
-rz(pi/4) q0[4];
-rz(-pi/4) q0[5];
-cx q0[3],q0[5];
-rz(pi/2) q0[3];
-sx q0[3];
-rz(pi/2) q0[3];
-cx q0[2],q0[3];
-rz(-pi/4) q0[3];
-cx q0[0],q0[3];
-rz(pi/4) q0[3];
-cx q0[2],q0[3];
-rz(pi/4) q0[2];
-rz(-pi/4) q0[3];
-cx q0[0],q0[3];
-cx q0[0],q0[2];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[2];
-cx q0[0],q0[2];
-cx q0[1],q0[2];
-rz(pi/4) q0[3];
-cx q0[2],q0[3];
-rz(-pi/4) q0[3];
-cx q0[1],q0[3];
-rz(pi/4) q0[3];
-cx q0[2],q0[3];
-rz(pi/4) q0[2];
-rz(-pi/4) q0[3];
-cx q0[1],q0[3];
-cx q0[1],q0[2];
-rz(pi/4) q0[1];
-rz(-pi/4) q0[2];
-cx q0[0],q0[2];
-rz(pi/4) q0[3];
-cx q0[2],q0[3];
-rz(-pi/4) q0[3];
-cx q0[1],q0[3];
-rz(pi/4) q0[3];
-cx q0[2],q0[3];
-rz(pi/4) q0[2];
-rz(-pi/4) q0[3];
-cx q0[1],q0[3];
-cx q0[1],q0[2];
-rz(pi/4) q0[1];
-rz(-pi/4) q0[2];
-rz(pi/4) q0[3];
-cx q0[2],q0[3];
-rz(-pi/4) q0[3];
-cx q0[0],q0[3];
-rz(pi/4) q0[3];
-cx q0[2],q0[3];
-rz(pi/4) q0[2];
-rz(-pi/4) q0[3];
-cx q0[0],q0[3];
-cx q0[0],q0[2];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[2];
-cx q0[0],q0[2];
-rz(3*pi/4) q0[3];
-sx q0[3];
-rz(pi/2) q0[3];
-rz(pi/4) q0[6];
-cx q0[5],q0[6];
-rz(-pi/4) q0[6];
-cx q0[4],q0[6];
-rz(pi/4) q0[6];
-cx q0[5],q0[6];
-rz(pi/4) q0[5];
-rz(-pi/4) q0[6];
-cx q0[4],q0[6];
-cx q0[4],q0[5];
-rz(pi/4) q0[4];
-rz(-pi/4) q0[5];
-rz(pi/4) q0[6];
-cx q0[5],q0[6];
-rz(-pi/4) q0[6];
-cx q0[3],q0[6];
-rz(pi/4) q0[6];
-cx q0[5],q0[6];
-rz(pi/4) q0[5];
-rz(-pi/4) q0[6];
-cx q0[3],q0[6];
-cx q0[3],q0[5];
-rz(pi/4) q0[3];
-rz(-pi/4) q0[5];
-cx q0[3],q0[5];
-rz(3*pi/4) q0[6];
-sx q0[6];
-rz(pi/2) q0[6];
-rz(pi/4) q0[9];
-cx q0[8],q0[9];
-rz(-pi/4) q0[9];
-cx q0[7],q0[9];
-rz(pi/4) q0[9];
-cx q0[8],q0[9];
-rz(pi/4) q0[8];
-rz(-pi/4) q0[9];
-cx q0[7],q0[9];
-cx q0[7],q0[8];
-rz(pi/4) q0[7];
-rz(-pi/4) q0[8];
-rz(pi/4) q0[9];
-cx q0[8],q0[9];
-rz(-pi/4) q0[9];
-cx q0[6],q0[9];
-rz(pi/4) q0[9];
-cx q0[8],q0[9];
-rz(pi/4) q0[8];
-rz(-pi/4) q0[9];
-cx q0[6],q0[9];
-cx q0[6],q0[8];
-rz(pi/4) q0[6];
-rz(-pi/4) q0[8];
-cx q0[6],q0[8];
-rz(3*pi/4) q0[9];
-sx q0[9];
-rz(pi/2) q0[9];
-cx q0[9],q0[12];
-rz(pi/4) q0[12];
-cx q0[11],q0[12];
-rz(pi/4) q0[11];
-rz(-pi/4) q0[12];
-cx q0[9],q0[12];
-rz(3*pi/4) q0[12];
-sx q0[12];
-rz(pi/2) q0[12];
-cx q0[12],q0[15];
-rz(pi/4) q0[15];
-cx q0[14],q0[15];
-rz(pi/4) q0[14];
-rz(-pi/4) q0[15];
-cx q0[12],q0[15];
-cx q0[12],q0[14];
-rz(pi/4) q0[12];
-rz(-pi/4) q0[14];
-cx q0[12],q0[14];
-rz(3*pi/4) q0[15];
-sx q0[15];
-rz(pi/2) q0[15];
-cx q0[15],q0[18];
-rz(pi/4) q0[18];
-cx q0[17],q0[18];
-rz(pi/4) q0[17];
-rz(-pi/4) q0[18];
-cx q0[15],q0[18];
-cx q0[15],q0[17];
-rz(pi/4) q0[15];
-rz(-pi/4) q0[17];
-cx q0[15],q0[17];
-rz(3*pi/4) q0[18];
-sx q0[18];
-rz(pi/2) q0[18];
-cx q0[18],q0[21];
-rz(pi/4) q0[21];
-cx q0[20],q0[21];
-rz(pi/4) q0[20];
-rz(-pi/4) q0[21];
-cx q0[18],q0[21];
-cx q0[18],q0[20];
-rz(pi/4) q0[18];
-rz(-pi/4) q0[20];
-cx q0[18],q0[20];
-rz(3*pi/4) q0[21];
-sx q0[21];
-rz(pi/2) q0[21];
-cx q0[21],q0[24];
-rz(pi/4) q0[24];
-cx q0[23],q0[24];
-rz(pi/4) q0[23];
-rz(-pi/4) q0[24];
-cx q0[21],q0[24];
-cx q0[21],q0[23];
-rz(pi/4) q0[21];
-rz(-pi/4) q0[23];
-cx q0[21],q0[23];
-rz(3*pi/4) q0[24];
-sx q0[24];
-rz(pi/2) q0[24];
-cx q0[24],q0[27];
-rz(pi/4) q0[27];
-cx q0[26],q0[27];
-rz(pi/4) q0[26];
-rz(-pi/4) q0[27];
-cx q0[24],q0[27];
-cx q0[24],q0[26];
-rz(pi/4) q0[24];
-rz(-pi/4) q0[26];
-cx q0[24],q0[26];
-rz(3*pi/4) q0[27];
-sx q0[27];
-rz(pi/2) q0[27];
-cx q0[27],q0[30];
-rz(pi/4) q0[30];
-cx q0[29],q0[30];
-rz(pi/4) q0[29];
-rz(-pi/4) q0[30];
-cx q0[27],q0[30];
-cx q0[27],q0[29];
-rz(pi/4) q0[27];
-rz(-pi/4) q0[29];
-cx q0[27],q0[29];
-rz(3*pi/4) q0[30];
-sx q0[30];
-rz(pi/2) q0[30];
-cx q0[30],q0[33];
-rz(pi/4) q0[33];
-cx q0[32],q0[33];
-rz(pi/4) q0[32];
-rz(-pi/4) q0[33];
-cx q0[30],q0[33];
-cx q0[30],q0[32];
-rz(pi/4) q0[30];
-rz(-pi/4) q0[32];
-cx q0[30],q0[32];
-rz(3*pi/4) q0[33];
-sx q0[33];
-rz(pi/2) q0[33];
-cx q0[9],q0[11];
-rz(-pi/4) q0[11];
-rz(pi/4) q0[9];
-cx q0[9],q0[11];
-cx q0[71],q0[34];
-rz(pi/4) q0[34];
-cx q0[45],q0[34];
-rz(-pi/4) q0[34];
-rz(pi/4) q0[45];
-cx q0[71],q0[34];
-rz(3*pi/4) q0[34];
-sx q0[34];
-rz(pi/2) q0[34];
-cx q0[34],q0[36];
-rz(pi/4) q0[36];
-cx q0[35],q0[36];
-rz(pi/4) q0[35];
-rz(-pi/4) q0[36];
-cx q0[34],q0[36];
-cx q0[34],q0[35];
-rz(pi/4) q0[34];
-rz(-pi/4) q0[35];
-rz(pi/4) q0[36];
-cx q0[35],q0[36];
-rz(-pi/4) q0[36];
-cx q0[33],q0[36];
-rz(pi/4) q0[36];
-cx q0[35],q0[36];
-rz(pi/4) q0[35];
-rz(-pi/4) q0[36];
-cx q0[33],q0[36];
-cx q0[33],q0[35];
-rz(pi/4) q0[33];
-rz(-pi/4) q0[35];
-cx q0[33],q0[35];
-rz(3*pi/4) q0[36];
-sx q0[36];
-rz(pi/2) q0[36];
-cx q0[71],q0[45];
-rz(-pi/4) q0[45];
-rz(pi/4) q0[71];
-cx q0[71],q0[45];
-cx q0[71],q0[37];
-rz(pi/4) q0[37];
-cx q0[46],q0[37];
-rz(-pi/4) q0[37];
-rz(pi/4) q0[46];
-cx q0[71],q0[37];
-rz(3*pi/4) q0[37];
-sx q0[37];
-rz(pi/2) q0[37];
-cx q0[37],q0[39];
-rz(pi/4) q0[39];
-cx q0[38],q0[39];
-rz(pi/4) q0[38];
-rz(-pi/4) q0[39];
-cx q0[37],q0[39];
-cx q0[37],q0[38];
-rz(pi/4) q0[37];
-rz(-pi/4) q0[38];
-rz(pi/4) q0[39];
-cx q0[38],q0[39];
-rz(-pi/4) q0[39];
-cx q0[36],q0[39];
-rz(pi/4) q0[39];
-cx q0[38],q0[39];
-rz(pi/4) q0[38];
-rz(-pi/4) q0[39];
-cx q0[36],q0[39];
-cx q0[36],q0[38];
-rz(pi/4) q0[36];
-rz(-pi/4) q0[38];
-cx q0[36],q0[38];
-rz(3*pi/4) q0[39];
-sx q0[39];
-rz(pi/2) q0[39];
-cx q0[71],q0[46];
-rz(-pi/4) q0[46];
-rz(pi/4) q0[71];
-cx q0[71],q0[46];
-cx q0[71],q0[40];
-rz(pi/4) q0[40];
-cx q0[47],q0[40];
-rz(-pi/4) q0[40];
-rz(pi/4) q0[47];
-cx q0[71],q0[40];
-rz(3*pi/4) q0[40];
-sx q0[40];
-rz(pi/2) q0[40];
-cx q0[40],q0[42];
-rz(pi/4) q0[42];
-cx q0[41],q0[42];
-rz(pi/4) q0[41];
-rz(-pi/4) q0[42];
-cx q0[40],q0[42];
-cx q0[40],q0[41];
-rz(pi/4) q0[40];
-rz(-pi/4) q0[41];
-rz(pi/4) q0[42];
-cx q0[41],q0[42];
-rz(-pi/4) q0[42];
-cx q0[39],q0[42];
-rz(pi/4) q0[42];
-cx q0[41],q0[42];
-rz(pi/4) q0[41];
-rz(-pi/4) q0[42];
-cx q0[39],q0[42];
-cx q0[39],q0[41];
-rz(pi/4) q0[39];
-rz(-pi/4) q0[41];
-cx q0[39],q0[41];
-rz(3*pi/4) q0[42];
-sx q0[42];
-rz(pi/2) q0[42];
-cx q0[71],q0[47];
-rz(-pi/4) q0[47];
-rz(pi/4) q0[71];
-cx q0[71],q0[47];
-cx q0[71],q0[43];
-rz(pi/4) q0[43];
-cx q0[48],q0[43];
-rz(-pi/4) q0[43];
-rz(pi/4) q0[48];
-cx q0[71],q0[43];
-rz(3*pi/4) q0[43];
-sx q0[43];
-rz(pi/2) q0[43];
-cx q0[43],q0[44];
-cx q0[42],q0[44];
-rz(pi/2) q0[42];
-sx q0[42];
-rz(pi/2) q0[42];
-cx q0[41],q0[42];
-rz(-pi/4) q0[42];
-cx q0[39],q0[42];
-rz(pi/4) q0[42];
-cx q0[41],q0[42];
-rz(pi/4) q0[41];
-rz(-pi/4) q0[42];
-cx q0[39],q0[42];
-cx q0[39],q0[41];
-rz(pi/4) q0[39];
-rz(-pi/4) q0[41];
-cx q0[39],q0[41];
-cx q0[40],q0[41];
-rz(pi/4) q0[42];
-cx q0[41],q0[42];
-rz(-pi/4) q0[42];
-cx q0[40],q0[42];
-rz(pi/4) q0[42];
-cx q0[41],q0[42];
-rz(pi/4) q0[41];
-rz(-pi/4) q0[42];
-cx q0[40],q0[42];
-cx q0[40],q0[41];
-rz(3*pi/4) q0[40];
-sx q0[40];
-rz(pi/2) q0[40];
-rz(-pi/4) q0[41];
-cx q0[39],q0[41];
-rz(pi/2) q0[39];
-sx q0[39];
-rz(pi/2) q0[39];
-cx q0[38],q0[39];
-rz(-pi/4) q0[39];
-cx q0[36],q0[39];
-rz(pi/4) q0[39];
-cx q0[38],q0[39];
-rz(pi/4) q0[38];
-rz(-pi/4) q0[39];
-cx q0[36],q0[39];
-cx q0[36],q0[38];
-rz(pi/4) q0[36];
-rz(-pi/4) q0[38];
-cx q0[36],q0[38];
-cx q0[37],q0[38];
-rz(pi/4) q0[39];
-cx q0[38],q0[39];
-rz(-pi/4) q0[39];
-cx q0[37],q0[39];
-rz(pi/4) q0[39];
-cx q0[38],q0[39];
-rz(pi/4) q0[38];
-rz(-pi/4) q0[39];
-cx q0[37],q0[39];
-cx q0[37],q0[38];
-rz(3*pi/4) q0[37];
-sx q0[37];
-rz(pi/2) q0[37];
-rz(-pi/4) q0[38];
-cx q0[36],q0[38];
-rz(pi/2) q0[36];
-sx q0[36];
-rz(pi/2) q0[36];
-cx q0[35],q0[36];
-rz(-pi/4) q0[36];
-cx q0[33],q0[36];
-rz(pi/4) q0[36];
-cx q0[35],q0[36];
-rz(pi/4) q0[35];
-rz(-pi/4) q0[36];
-cx q0[33],q0[36];
-cx q0[33],q0[35];
-rz(pi/4) q0[33];
-rz(-pi/4) q0[35];
-cx q0[33],q0[35];
-cx q0[34],q0[35];
-rz(pi/4) q0[36];
-cx q0[35],q0[36];
-rz(-pi/4) q0[36];
-cx q0[34],q0[36];
-rz(pi/4) q0[36];
-cx q0[35],q0[36];
-rz(pi/4) q0[35];
-rz(-pi/4) q0[36];
-cx q0[34],q0[36];
-cx q0[34],q0[35];
-rz(3*pi/4) q0[34];
-sx q0[34];
-rz(pi/2) q0[34];
-rz(-pi/4) q0[35];
-cx q0[33],q0[35];
-rz(pi/2) q0[33];
-sx q0[33];
-rz(pi/2) q0[33];
-cx q0[32],q0[33];
-rz(-pi/4) q0[33];
-cx q0[30],q0[33];
-rz(pi/4) q0[33];
-cx q0[32],q0[33];
-rz(pi/4) q0[32];
-rz(-pi/4) q0[33];
-cx q0[30],q0[33];
-cx q0[30],q0[32];
-rz(pi/4) q0[30];
-rz(-pi/4) q0[32];
-cx q0[30],q0[32];
-cx q0[31],q0[32];
-rz(pi/4) q0[33];
-cx q0[32],q0[33];
-rz(-pi/4) q0[33];
-cx q0[31],q0[33];
-rz(pi/4) q0[33];
-cx q0[32],q0[33];
-rz(pi/4) q0[32];
-rz(-pi/4) q0[33];
-cx q0[31],q0[33];
-cx q0[31],q0[32];
-rz(pi/4) q0[31];
-rz(-pi/4) q0[32];
-cx q0[30],q0[32];
-rz(pi/2) q0[30];
-sx q0[30];
-rz(pi/2) q0[30];
-cx q0[29],q0[30];
-rz(-pi/4) q0[30];
-cx q0[27],q0[30];
-rz(pi/4) q0[30];
-cx q0[29],q0[30];
-rz(pi/4) q0[29];
-rz(-pi/4) q0[30];
-cx q0[27],q0[30];
-cx q0[27],q0[29];
-rz(pi/4) q0[27];
-rz(-pi/4) q0[29];
-cx q0[27],q0[29];
-cx q0[28],q0[29];
-rz(pi/4) q0[30];
-cx q0[29],q0[30];
-rz(-pi/4) q0[30];
-cx q0[28],q0[30];
-rz(pi/4) q0[30];
-cx q0[29],q0[30];
-rz(pi/4) q0[29];
-rz(-pi/4) q0[30];
-cx q0[28],q0[30];
-cx q0[28],q0[29];
-rz(pi/4) q0[28];
-rz(-pi/4) q0[29];
-cx q0[27],q0[29];
-rz(pi/2) q0[27];
-sx q0[27];
-rz(pi/2) q0[27];
-cx q0[26],q0[27];
-rz(-pi/4) q0[27];
-cx q0[24],q0[27];
-rz(pi/4) q0[27];
-cx q0[26],q0[27];
-rz(pi/4) q0[26];
-rz(-pi/4) q0[27];
-cx q0[24],q0[27];
-cx q0[24],q0[26];
-rz(pi/4) q0[24];
-rz(-pi/4) q0[26];
-cx q0[24],q0[26];
-cx q0[25],q0[26];
-rz(pi/4) q0[27];
-cx q0[26],q0[27];
-rz(-pi/4) q0[27];
-cx q0[25],q0[27];
-rz(pi/4) q0[27];
-cx q0[26],q0[27];
-rz(pi/4) q0[26];
-rz(-pi/4) q0[27];
-cx q0[25],q0[27];
-cx q0[25],q0[26];
-rz(pi/4) q0[25];
-rz(-pi/4) q0[26];
-cx q0[24],q0[26];
-rz(pi/2) q0[24];
-sx q0[24];
-rz(pi/2) q0[24];
-cx q0[23],q0[24];
-rz(-pi/4) q0[24];
-cx q0[21],q0[24];
-rz(pi/4) q0[24];
-cx q0[23],q0[24];
-rz(pi/4) q0[23];
-rz(-pi/4) q0[24];
-cx q0[21],q0[24];
-cx q0[21],q0[23];
-rz(pi/4) q0[21];
-rz(-pi/4) q0[23];
-cx q0[21],q0[23];
-cx q0[22],q0[23];
-rz(pi/4) q0[24];
-cx q0[23],q0[24];
-rz(-pi/4) q0[24];
-cx q0[22],q0[24];
-rz(pi/4) q0[24];
-cx q0[23],q0[24];
-rz(pi/4) q0[23];
-rz(-pi/4) q0[24];
-cx q0[22],q0[24];
-cx q0[22],q0[23];
-rz(pi/4) q0[22];
-rz(-pi/4) q0[23];
-cx q0[21],q0[23];
-rz(pi/2) q0[21];
-sx q0[21];
-rz(pi/2) q0[21];
-cx q0[20],q0[21];
-rz(-pi/4) q0[21];
-cx q0[18],q0[21];
-rz(pi/4) q0[21];
-cx q0[20],q0[21];
-rz(pi/4) q0[20];
-rz(-pi/4) q0[21];
-cx q0[18],q0[21];
-cx q0[18],q0[20];
-rz(pi/4) q0[18];
-rz(-pi/4) q0[20];
-cx q0[18],q0[20];
-cx q0[19],q0[20];
-rz(pi/4) q0[21];
-cx q0[20],q0[21];
-rz(-pi/4) q0[21];
-cx q0[19],q0[21];
-rz(pi/4) q0[21];
-cx q0[20],q0[21];
-rz(pi/4) q0[20];
-rz(-pi/4) q0[21];
-cx q0[19],q0[21];
-cx q0[19],q0[20];
-rz(pi/4) q0[19];
-rz(-pi/4) q0[20];
-cx q0[18],q0[20];
-rz(pi/2) q0[18];
-sx q0[18];
-rz(pi/2) q0[18];
-cx q0[17],q0[18];
-rz(-pi/4) q0[18];
-cx q0[15],q0[18];
-rz(pi/4) q0[18];
-cx q0[17],q0[18];
-rz(pi/4) q0[17];
-rz(-pi/4) q0[18];
-cx q0[15],q0[18];
-cx q0[15],q0[17];
-rz(pi/4) q0[15];
-rz(-pi/4) q0[17];
-cx q0[15],q0[17];
-cx q0[16],q0[17];
-rz(pi/4) q0[18];
-cx q0[17],q0[18];
-rz(-pi/4) q0[18];
-cx q0[16],q0[18];
-rz(pi/4) q0[18];
-cx q0[17],q0[18];
-rz(pi/4) q0[17];
-rz(-pi/4) q0[18];
-cx q0[16],q0[18];
-cx q0[16],q0[17];
-rz(pi/4) q0[16];
-rz(-pi/4) q0[17];
-cx q0[15],q0[17];
-rz(pi/2) q0[15];
-sx q0[15];
-rz(pi/2) q0[15];
-cx q0[14],q0[15];
-rz(-pi/4) q0[15];
-cx q0[12],q0[15];
-rz(pi/4) q0[15];
-cx q0[14],q0[15];
-rz(pi/4) q0[14];
-rz(-pi/4) q0[15];
-cx q0[12],q0[15];
-cx q0[12],q0[14];
-rz(pi/4) q0[12];
-rz(-pi/4) q0[14];
-cx q0[12],q0[14];
-cx q0[13],q0[14];
-rz(pi/4) q0[15];
-cx q0[14],q0[15];
-rz(-pi/4) q0[15];
-cx q0[13],q0[15];
-rz(pi/4) q0[15];
-cx q0[14],q0[15];
-rz(pi/4) q0[14];
-rz(-pi/4) q0[15];
-cx q0[13],q0[15];
-cx q0[13],q0[14];
-rz(pi/4) q0[13];
-rz(-pi/4) q0[14];
-cx q0[12],q0[14];
-rz(pi/2) q0[12];
-sx q0[12];
-rz(pi/2) q0[12];
-cx q0[11],q0[12];
-rz(-pi/4) q0[12];
-rz(pi/4) q0[15];
-cx q0[14],q0[15];
-rz(-pi/4) q0[15];
-cx q0[13],q0[15];
-rz(pi/4) q0[15];
-cx q0[14],q0[15];
-rz(pi/4) q0[14];
-rz(-pi/4) q0[15];
-cx q0[13],q0[15];
-cx q0[13],q0[14];
-rz(pi/4) q0[13];
-rz(-pi/4) q0[14];
-rz(pi/4) q0[15];
-cx q0[14],q0[15];
-rz(-pi/4) q0[15];
-rz(pi/4) q0[18];
-cx q0[17],q0[18];
-rz(-pi/4) q0[18];
-cx q0[16],q0[18];
-rz(pi/4) q0[18];
-cx q0[17],q0[18];
-rz(pi/4) q0[17];
-rz(-pi/4) q0[18];
-cx q0[16],q0[18];
-cx q0[16],q0[17];
-rz(pi/4) q0[16];
-rz(-pi/4) q0[17];
-rz(pi/4) q0[18];
-cx q0[17],q0[18];
-rz(-pi/4) q0[18];
-rz(pi/4) q0[21];
-cx q0[20],q0[21];
-rz(-pi/4) q0[21];
-cx q0[19],q0[21];
-rz(pi/4) q0[21];
-cx q0[20],q0[21];
-rz(pi/4) q0[20];
-rz(-pi/4) q0[21];
-cx q0[19],q0[21];
-cx q0[19],q0[20];
-rz(pi/4) q0[19];
-rz(-pi/4) q0[20];
-rz(pi/4) q0[21];
-cx q0[20],q0[21];
-rz(-pi/4) q0[21];
-rz(pi/4) q0[24];
-cx q0[23],q0[24];
-rz(-pi/4) q0[24];
-cx q0[22],q0[24];
-rz(pi/4) q0[24];
-cx q0[23],q0[24];
-rz(pi/4) q0[23];
-rz(-pi/4) q0[24];
-cx q0[22],q0[24];
-cx q0[22],q0[23];
-rz(pi/4) q0[22];
-rz(-pi/4) q0[23];
-rz(pi/4) q0[24];
-cx q0[23],q0[24];
-rz(-pi/4) q0[24];
-rz(pi/4) q0[27];
-cx q0[26],q0[27];
-rz(-pi/4) q0[27];
-cx q0[25],q0[27];
-rz(pi/4) q0[27];
-cx q0[26],q0[27];
-rz(pi/4) q0[26];
-rz(-pi/4) q0[27];
-cx q0[25],q0[27];
-cx q0[25],q0[26];
-rz(pi/4) q0[25];
-rz(-pi/4) q0[26];
-rz(pi/4) q0[27];
-cx q0[26],q0[27];
-rz(-pi/4) q0[27];
-rz(pi/4) q0[30];
-cx q0[29],q0[30];
-rz(-pi/4) q0[30];
-cx q0[28],q0[30];
-rz(pi/4) q0[30];
-cx q0[29],q0[30];
-rz(pi/4) q0[29];
-rz(-pi/4) q0[30];
-cx q0[28],q0[30];
-cx q0[28],q0[29];
-rz(pi/4) q0[28];
-rz(-pi/4) q0[29];
-rz(pi/4) q0[30];
-cx q0[29],q0[30];
-rz(-pi/4) q0[30];
-rz(pi/4) q0[33];
-cx q0[32],q0[33];
-rz(-pi/4) q0[33];
-cx q0[31],q0[33];
-rz(pi/4) q0[33];
-cx q0[32],q0[33];
-rz(pi/4) q0[32];
-rz(-pi/4) q0[33];
-cx q0[31],q0[33];
-cx q0[31],q0[32];
-rz(pi/4) q0[31];
-rz(-pi/4) q0[32];
-rz(pi/4) q0[33];
-cx q0[32],q0[33];
-rz(-pi/4) q0[33];
-rz(pi/4) q0[36];
-cx q0[35],q0[36];
-rz(-pi/4) q0[36];
-rz(pi/4) q0[39];
-cx q0[38],q0[39];
-rz(-pi/4) q0[39];
-rz(pi/4) q0[42];
-cx q0[41],q0[42];
-rz(-pi/4) q0[42];
-rz(pi/2) q0[43];
-sx q0[43];
-rz(pi/2) q0[43];
-cx q0[45],q0[34];
-rz(-pi/4) q0[34];
-cx q0[46],q0[37];
-rz(-pi/4) q0[37];
-cx q0[47],q0[40];
-rz(-pi/4) q0[40];
-cx q0[71],q0[48];
-rz(-pi/4) q0[48];
-rz(pi/4) q0[71];
-cx q0[71],q0[48];
-cx q0[48],q0[43];
-rz(-pi/4) q0[43];
-cx q0[71],q0[34];
-rz(pi/4) q0[34];
-cx q0[45],q0[34];
-rz(-pi/4) q0[34];
-rz(pi/4) q0[45];
-cx q0[71],q0[34];
-rz(3*pi/4) q0[34];
-sx q0[34];
-rz(pi/2) q0[34];
-cx q0[34],q0[36];
-rz(pi/4) q0[36];
-cx q0[35],q0[36];
-rz(pi/4) q0[35];
-rz(-pi/4) q0[36];
-cx q0[34],q0[36];
-cx q0[34],q0[35];
-rz(pi/4) q0[34];
-rz(-pi/4) q0[35];
-rz(pi/4) q0[36];
-cx q0[35],q0[36];
-rz(-pi/4) q0[36];
-cx q0[71],q0[45];
-rz(-pi/4) q0[45];
-rz(pi/4) q0[71];
-cx q0[71],q0[45];
-cx q0[71],q0[37];
-rz(pi/4) q0[37];
-cx q0[46],q0[37];
-rz(-pi/4) q0[37];
-rz(pi/4) q0[46];
-cx q0[71],q0[37];
-rz(pi/4) q0[37];
-cx q0[45],q0[37];
-rz(-pi/4) q0[37];
-cx q0[71],q0[46];
-rz(-pi/4) q0[46];
-rz(pi/4) q0[71];
-cx q0[71],q0[46];
-cx q0[71],q0[40];
-rz(pi/4) q0[40];
-cx q0[47],q0[40];
-rz(-pi/4) q0[40];
-rz(pi/4) q0[47];
-cx q0[71],q0[40];
-rz(pi/4) q0[40];
-cx q0[46],q0[40];
-rz(-pi/4) q0[40];
-cx q0[71],q0[47];
-rz(-pi/4) q0[47];
-rz(pi/4) q0[71];
-cx q0[71],q0[47];
-cx q0[71],q0[43];
-rz(pi/4) q0[43];
-cx q0[48],q0[43];
-rz(-pi/4) q0[43];
-rz(pi/4) q0[48];
-cx q0[71],q0[43];
-rz(pi/4) q0[43];
-cx q0[47],q0[43];
-rz(-pi/4) q0[43];
-cx q0[71],q0[48];
-rz(-pi/4) q0[48];
-rz(pi/4) q0[71];
-cx q0[71],q0[48];
-cx q0[9],q0[12];
-rz(pi/4) q0[12];
-cx q0[11],q0[12];
-rz(pi/4) q0[11];
-rz(-pi/4) q0[12];
-cx q0[9],q0[12];
-rz(pi/4) q0[12];
-cx q0[9],q0[11];
-rz(-pi/4) q0[11];
-rz(pi/4) q0[9];
-cx q0[9],q0[11];
-cx q0[10],q0[11];
-cx q0[11],q0[12];
-rz(-pi/4) q0[12];
-cx q0[10],q0[12];
-rz(pi/4) q0[12];
-cx q0[11],q0[12];
-rz(pi/4) q0[11];
-rz(-pi/4) q0[12];
-cx q0[10],q0[12];
-cx q0[10],q0[11];
-rz(pi/4) q0[10];
-rz(-pi/4) q0[11];
-rz(pi/4) q0[12];
-cx q0[9],q0[11];
-cx q0[11],q0[12];
-rz(-pi/4) q0[12];
-cx q0[10],q0[12];
-rz(pi/4) q0[12];
-cx q0[11],q0[12];
-rz(pi/4) q0[11];
-rz(-pi/4) q0[12];
-cx q0[10],q0[12];
-cx q0[10],q0[11];
-rz(pi/4) q0[10];
-rz(-pi/4) q0[11];
-rz(pi/4) q0[12];
-cx q0[11],q0[12];
-rz(-pi/4) q0[12];
-rz(pi/2) q0[9];
-sx q0[9];
-rz(pi/2) q0[9];
-cx q0[8],q0[9];
-rz(-pi/4) q0[9];
-cx q0[6],q0[9];
-rz(pi/4) q0[9];
-cx q0[8],q0[9];
-rz(pi/4) q0[8];
-rz(-pi/4) q0[9];
-cx q0[6],q0[9];
-cx q0[6],q0[8];
-rz(pi/4) q0[6];
-rz(-pi/4) q0[8];
-cx q0[6],q0[8];
-cx q0[7],q0[8];
-rz(pi/4) q0[9];
-cx q0[8],q0[9];
-rz(-pi/4) q0[9];
-cx q0[7],q0[9];
-rz(pi/4) q0[9];
-cx q0[8],q0[9];
-rz(pi/4) q0[8];
-rz(-pi/4) q0[9];
-cx q0[7],q0[9];
-cx q0[7],q0[8];
-rz(pi/4) q0[7];
-rz(-pi/4) q0[8];
-cx q0[6],q0[8];
-rz(pi/2) q0[6];
-sx q0[6];
-rz(pi/2) q0[6];
-cx q0[5],q0[6];
-rz(-pi/4) q0[6];
-cx q0[3],q0[6];
-rz(pi/4) q0[6];
-cx q0[5],q0[6];
-rz(pi/4) q0[5];
-rz(-pi/4) q0[6];
-cx q0[3],q0[6];
-cx q0[3],q0[5];
-rz(pi/4) q0[3];
-rz(-pi/4) q0[5];
-cx q0[3],q0[5];
-cx q0[4],q0[5];
-rz(pi/4) q0[6];
-cx q0[5],q0[6];
-rz(-pi/4) q0[6];
-cx q0[4],q0[6];
-rz(pi/4) q0[6];
-cx q0[5],q0[6];
-rz(pi/4) q0[5];
-rz(-pi/4) q0[6];
-cx q0[4],q0[6];
-cx q0[4],q0[5];
-rz(pi/4) q0[4];
-rz(-pi/4) q0[5];
-cx q0[3],q0[5];
-rz(pi/2) q0[3];
-sx q0[3];
-rz(pi/2) q0[3];
-cx q0[2],q0[3];
-rz(-pi/4) q0[3];
-cx q0[0],q0[3];
-rz(pi/4) q0[3];
-cx q0[2],q0[3];
-rz(pi/4) q0[2];
-rz(-pi/4) q0[3];
-cx q0[0],q0[3];
-cx q0[0],q0[2];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[2];
-cx q0[0],q0[2];
-cx q0[1],q0[2];
-rz(pi/4) q0[3];
-cx q0[2],q0[3];
-rz(-pi/4) q0[3];
-cx q0[1],q0[3];
-rz(pi/4) q0[3];
-cx q0[2],q0[3];
-rz(pi/4) q0[2];
-rz(-pi/4) q0[3];
-cx q0[1],q0[3];
-cx q0[1],q0[2];
-rz(pi/4) q0[1];
-rz(-pi/4) q0[2];
-cx q0[0],q0[2];
-rz(pi/4) q0[3];
-cx q0[2],q0[3];
-rz(-pi/4) q0[3];
-cx q0[1],q0[3];
-rz(pi/4) q0[3];
-cx q0[2],q0[3];
-rz(pi/4) q0[2];
-rz(-pi/4) q0[3];
-cx q0[1],q0[3];
-cx q0[1],q0[2];
-rz(pi/4) q0[1];
-rz(-pi/4) q0[2];
-rz(pi/4) q0[3];
-cx q0[2],q0[3];
-rz(-pi/4) q0[3];
-cx q0[0],q0[3];
-rz(pi/4) q0[3];
-cx q0[2],q0[3];
-rz(pi/4) q0[2];
-rz(-pi/4) q0[3];
-cx q0[0],q0[3];
-cx q0[0],q0[2];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[2];
-cx q0[0],q0[2];
-rz(3*pi/4) q0[3];
-sx q0[3];
-rz(pi/2) q0[3];
-rz(pi/4) q0[6];
-cx q0[5],q0[6];
-rz(-pi/4) q0[6];
-cx q0[4],q0[6];
-rz(pi/4) q0[6];
-cx q0[5],q0[6];
-rz(pi/4) q0[5];
-rz(-pi/4) q0[6];
-cx q0[4],q0[6];
-cx q0[4],q0[5];
-rz(pi/4) q0[4];
-rz(-pi/4) q0[5];
-rz(pi/4) q0[6];
-cx q0[5],q0[6];
-rz(-pi/4) q0[6];
-cx q0[3],q0[6];
-rz(pi/4) q0[6];
-cx q0[5],q0[6];
-rz(pi/4) q0[5];
-rz(-pi/4) q0[6];
-cx q0[3],q0[6];
-cx q0[3],q0[5];
-rz(pi/4) q0[3];
-rz(-pi/4) q0[5];
-cx q0[3],q0[5];
-rz(3*pi/4) q0[6];
-sx q0[6];
-rz(pi/2) q0[6];
-rz(pi/4) q0[9];
-cx q0[8],q0[9];
-rz(-pi/4) q0[9];
-cx q0[7],q0[9];
-rz(pi/4) q0[9];
-cx q0[8],q0[9];
-rz(pi/4) q0[8];
-rz(-pi/4) q0[9];
-cx q0[7],q0[9];
-cx q0[7],q0[8];
-rz(pi/4) q0[7];
-rz(-pi/4) q0[8];
-rz(pi/4) q0[9];
-cx q0[8],q0[9];
-rz(-pi/4) q0[9];
-cx q0[6],q0[9];
-rz(pi/4) q0[9];
-cx q0[8],q0[9];
-rz(pi/4) q0[8];
-rz(-pi/4) q0[9];
-cx q0[6],q0[9];
-cx q0[6],q0[8];
-rz(pi/4) q0[6];
-rz(-pi/4) q0[8];
-cx q0[6],q0[8];
-rz(3*pi/4) q0[9];
-sx q0[9];
-rz(pi/2) q0[9];
-cx q0[9],q0[12];
-rz(pi/4) q0[12];
-cx q0[11],q0[12];
-rz(pi/4) q0[11];
-rz(-pi/4) q0[12];
-cx q0[9],q0[12];
-rz(3*pi/4) q0[12];
-sx q0[12];
-rz(pi/2) q0[12];
-cx q0[12],q0[15];
-rz(pi/4) q0[15];
-cx q0[14],q0[15];
-rz(pi/4) q0[14];
-rz(-pi/4) q0[15];
-cx q0[12],q0[15];
-cx q0[12],q0[14];
-rz(pi/4) q0[12];
-rz(-pi/4) q0[14];
-cx q0[12],q0[14];
-rz(3*pi/4) q0[15];
-sx q0[15];
-rz(pi/2) q0[15];
-cx q0[15],q0[18];
-rz(pi/4) q0[18];
-cx q0[17],q0[18];
-rz(pi/4) q0[17];
-rz(-pi/4) q0[18];
-cx q0[15],q0[18];
-cx q0[15],q0[17];
-rz(pi/4) q0[15];
-rz(-pi/4) q0[17];
-cx q0[15],q0[17];
-rz(3*pi/4) q0[18];
-sx q0[18];
-rz(pi/2) q0[18];
-cx q0[18],q0[21];
-rz(pi/4) q0[21];
-cx q0[20],q0[21];
-rz(pi/4) q0[20];
-rz(-pi/4) q0[21];
-cx q0[18],q0[21];
-cx q0[18],q0[20];
-rz(pi/4) q0[18];
-rz(-pi/4) q0[20];
-cx q0[18],q0[20];
-rz(3*pi/4) q0[21];
-sx q0[21];
-rz(pi/2) q0[21];
-cx q0[21],q0[24];
-rz(pi/4) q0[24];
-cx q0[23],q0[24];
-rz(pi/4) q0[23];
-rz(-pi/4) q0[24];
-cx q0[21],q0[24];
-cx q0[21],q0[23];
-rz(pi/4) q0[21];
-rz(-pi/4) q0[23];
-cx q0[21],q0[23];
-rz(3*pi/4) q0[24];
-sx q0[24];
-rz(pi/2) q0[24];
-cx q0[24],q0[27];
-rz(pi/4) q0[27];
-cx q0[26],q0[27];
-rz(pi/4) q0[26];
-rz(-pi/4) q0[27];
-cx q0[24],q0[27];
-cx q0[24],q0[26];
-rz(pi/4) q0[24];
-rz(-pi/4) q0[26];
-cx q0[24],q0[26];
-rz(3*pi/4) q0[27];
-sx q0[27];
-rz(pi/2) q0[27];
-cx q0[27],q0[30];
-rz(pi/4) q0[30];
-cx q0[29],q0[30];
-rz(pi/4) q0[29];
-rz(-pi/4) q0[30];
-cx q0[27],q0[30];
-cx q0[27],q0[29];
-rz(pi/4) q0[27];
-rz(-pi/4) q0[29];
-cx q0[27],q0[29];
-rz(3*pi/4) q0[30];
-sx q0[30];
-rz(pi/2) q0[30];
-cx q0[30],q0[33];
-rz(pi/4) q0[33];
-cx q0[32],q0[33];
-rz(pi/4) q0[32];
-rz(-pi/4) q0[33];
-cx q0[30],q0[33];
-cx q0[30],q0[32];
-rz(pi/4) q0[30];
-rz(-pi/4) q0[32];
-cx q0[30],q0[32];
-rz(3*pi/4) q0[33];
-sx q0[33];
-rz(pi/2) q0[33];
-cx q0[33],q0[36];
-rz(pi/4) q0[36];
-cx q0[35],q0[36];
-rz(pi/4) q0[35];
-rz(-pi/4) q0[36];
-cx q0[33],q0[36];
-cx q0[33],q0[35];
-rz(pi/4) q0[33];
-rz(-pi/4) q0[35];
-cx q0[33],q0[35];
-rz(3*pi/4) q0[36];
-sx q0[36];
-rz(pi/2) q0[36];
-cx q0[9],q0[11];
-rz(-pi/4) q0[11];
-rz(pi/4) q0[9];
-cx q0[9],q0[11];
-cx q0[72],q0[37];
-rz(pi/4) q0[37];
-cx q0[45],q0[37];
-rz(-pi/4) q0[37];
-rz(pi/4) q0[45];
-cx q0[72],q0[37];
-rz(3*pi/4) q0[37];
-sx q0[37];
-rz(pi/2) q0[37];
-cx q0[37],q0[39];
-rz(pi/4) q0[39];
-cx q0[38],q0[39];
-rz(pi/4) q0[38];
-rz(-pi/4) q0[39];
-cx q0[37],q0[39];
-cx q0[37],q0[38];
-rz(pi/4) q0[37];
-rz(-pi/4) q0[38];
-rz(pi/4) q0[39];
-cx q0[38],q0[39];
-rz(-pi/4) q0[39];
-cx q0[36],q0[39];
-rz(pi/4) q0[39];
-cx q0[38],q0[39];
-rz(pi/4) q0[38];
-rz(-pi/4) q0[39];
-cx q0[36],q0[39];
-cx q0[36],q0[38];
-rz(pi/4) q0[36];
-rz(-pi/4) q0[38];
-cx q0[36],q0[38];
-rz(3*pi/4) q0[39];
-sx q0[39];
-rz(pi/2) q0[39];
-cx q0[72],q0[45];
-rz(-pi/4) q0[45];
-rz(pi/4) q0[72];
-cx q0[72],q0[45];
-cx q0[72],q0[40];
-rz(pi/4) q0[40];
-cx q0[46],q0[40];
-rz(-pi/4) q0[40];
-rz(pi/4) q0[46];
-cx q0[72],q0[40];
-rz(3*pi/4) q0[40];
-sx q0[40];
-rz(pi/2) q0[40];
-cx q0[40],q0[42];
-rz(pi/4) q0[42];
-cx q0[41],q0[42];
-rz(pi/4) q0[41];
-rz(-pi/4) q0[42];
-cx q0[40],q0[42];
-cx q0[40],q0[41];
-rz(pi/4) q0[40];
-rz(-pi/4) q0[41];
-rz(pi/4) q0[42];
-cx q0[41],q0[42];
-rz(-pi/4) q0[42];
-cx q0[39],q0[42];
-rz(pi/4) q0[42];
-cx q0[41],q0[42];
-rz(pi/4) q0[41];
-rz(-pi/4) q0[42];
-cx q0[39],q0[42];
-cx q0[39],q0[41];
-rz(pi/4) q0[39];
-rz(-pi/4) q0[41];
-cx q0[39],q0[41];
-rz(3*pi/4) q0[42];
-sx q0[42];
-rz(pi/2) q0[42];
-cx q0[72],q0[46];
-rz(-pi/4) q0[46];
-rz(pi/4) q0[72];
-cx q0[72],q0[46];
-cx q0[72],q0[43];
-rz(pi/4) q0[43];
-cx q0[47],q0[43];
-rz(-pi/4) q0[43];
-rz(pi/4) q0[47];
-cx q0[72],q0[43];
-rz(3*pi/4) q0[43];
-sx q0[43];
-rz(pi/2) q0[43];
-cx q0[43],q0[44];
-cx q0[42],q0[44];
-rz(pi/2) q0[42];
-sx q0[42];
-rz(pi/2) q0[42];
-cx q0[41],q0[42];
-rz(-pi/4) q0[42];
-cx q0[39],q0[42];
-rz(pi/4) q0[42];
-cx q0[41],q0[42];
-rz(pi/4) q0[41];
-rz(-pi/4) q0[42];
-cx q0[39],q0[42];
-cx q0[39],q0[41];
-rz(pi/4) q0[39];
-rz(-pi/4) q0[41];
-cx q0[39],q0[41];
-cx q0[40],q0[41];
-rz(pi/4) q0[42];
-cx q0[41],q0[42];
-rz(-pi/4) q0[42];
-cx q0[40],q0[42];
-rz(pi/4) q0[42];
-cx q0[41],q0[42];
-rz(pi/4) q0[41];
-rz(-pi/4) q0[42];
-cx q0[40],q0[42];
-cx q0[40],q0[41];
-rz(3*pi/4) q0[40];
-sx q0[40];
-rz(pi/2) q0[40];
-rz(-pi/4) q0[41];
-cx q0[39],q0[41];
-rz(pi/2) q0[39];
-sx q0[39];
-rz(pi/2) q0[39];
-cx q0[38],q0[39];
-rz(-pi/4) q0[39];
-cx q0[36],q0[39];
-rz(pi/4) q0[39];
-cx q0[38],q0[39];
-rz(pi/4) q0[38];
-rz(-pi/4) q0[39];
-cx q0[36],q0[39];
-cx q0[36],q0[38];
-rz(pi/4) q0[36];
-rz(-pi/4) q0[38];
-cx q0[36],q0[38];
-cx q0[37],q0[38];
-rz(pi/4) q0[39];
-cx q0[38],q0[39];
-rz(-pi/4) q0[39];
-cx q0[37],q0[39];
-rz(pi/4) q0[39];
-cx q0[38],q0[39];
-rz(pi/4) q0[38];
-rz(-pi/4) q0[39];
-cx q0[37],q0[39];
-cx q0[37],q0[38];
-rz(3*pi/4) q0[37];
-sx q0[37];
-rz(pi/2) q0[37];
-rz(-pi/4) q0[38];
-cx q0[36],q0[38];
-rz(pi/2) q0[36];
-sx q0[36];
-rz(pi/2) q0[36];
-cx q0[35],q0[36];
-rz(-pi/4) q0[36];
-cx q0[33],q0[36];
-rz(pi/4) q0[36];
-cx q0[35],q0[36];
-rz(pi/4) q0[35];
-rz(-pi/4) q0[36];
-cx q0[33],q0[36];
-cx q0[33],q0[35];
-rz(pi/4) q0[33];
-rz(-pi/4) q0[35];
-cx q0[33],q0[35];
-cx q0[34],q0[35];
-rz(pi/4) q0[36];
-cx q0[35],q0[36];
-rz(-pi/4) q0[36];
-cx q0[34],q0[36];
-rz(pi/4) q0[36];
-cx q0[35],q0[36];
-rz(pi/4) q0[35];
-rz(-pi/4) q0[36];
-cx q0[34],q0[36];
-cx q0[34],q0[35];
-rz(pi/4) q0[34];
-rz(-pi/4) q0[35];
-cx q0[33],q0[35];
-rz(pi/2) q0[33];
-sx q0[33];
-rz(pi/2) q0[33];
-cx q0[32],q0[33];
-rz(-pi/4) q0[33];
-cx q0[30],q0[33];
-rz(pi/4) q0[33];
-cx q0[32],q0[33];
-rz(pi/4) q0[32];
-rz(-pi/4) q0[33];
-cx q0[30],q0[33];
-cx q0[30],q0[32];
-rz(pi/4) q0[30];
-rz(-pi/4) q0[32];
-cx q0[30],q0[32];
-cx q0[31],q0[32];
-rz(pi/4) q0[33];
-cx q0[32],q0[33];
-rz(-pi/4) q0[33];
-cx q0[31],q0[33];
-rz(pi/4) q0[33];
-cx q0[32],q0[33];
-rz(pi/4) q0[32];
-rz(-pi/4) q0[33];
-cx q0[31],q0[33];
-cx q0[31],q0[32];
-rz(pi/4) q0[31];
-rz(-pi/4) q0[32];
-cx q0[30],q0[32];
-rz(pi/2) q0[30];
-sx q0[30];
-rz(pi/2) q0[30];
-cx q0[29],q0[30];
-rz(-pi/4) q0[30];
-cx q0[27],q0[30];
-rz(pi/4) q0[30];
-cx q0[29],q0[30];
-rz(pi/4) q0[29];
-rz(-pi/4) q0[30];
-cx q0[27],q0[30];
-cx q0[27],q0[29];
-rz(pi/4) q0[27];
-rz(-pi/4) q0[29];
-cx q0[27],q0[29];
-cx q0[28],q0[29];
-rz(pi/4) q0[30];
-cx q0[29],q0[30];
-rz(-pi/4) q0[30];
-cx q0[28],q0[30];
-rz(pi/4) q0[30];
-cx q0[29],q0[30];
-rz(pi/4) q0[29];
-rz(-pi/4) q0[30];
-cx q0[28],q0[30];
-cx q0[28],q0[29];
-rz(pi/4) q0[28];
-rz(-pi/4) q0[29];
-cx q0[27],q0[29];
-rz(pi/2) q0[27];
-sx q0[27];
-rz(pi/2) q0[27];
-cx q0[26],q0[27];
-rz(-pi/4) q0[27];
-cx q0[24],q0[27];
-rz(pi/4) q0[27];
-cx q0[26],q0[27];
-rz(pi/4) q0[26];
-rz(-pi/4) q0[27];
-cx q0[24],q0[27];
-cx q0[24],q0[26];
-rz(pi/4) q0[24];
-rz(-pi/4) q0[26];
-cx q0[24],q0[26];
-cx q0[25],q0[26];
-rz(pi/4) q0[27];
-cx q0[26],q0[27];
-rz(-pi/4) q0[27];
-cx q0[25],q0[27];
-rz(pi/4) q0[27];
-cx q0[26],q0[27];
-rz(pi/4) q0[26];
-rz(-pi/4) q0[27];
-cx q0[25],q0[27];
-cx q0[25],q0[26];
-rz(pi/4) q0[25];
-rz(-pi/4) q0[26];
-cx q0[24],q0[26];
-rz(pi/2) q0[24];
-sx q0[24];
-rz(pi/2) q0[24];
-cx q0[23],q0[24];
-rz(-pi/4) q0[24];
-cx q0[21],q0[24];
-rz(pi/4) q0[24];
-cx q0[23],q0[24];
-rz(pi/4) q0[23];
-rz(-pi/4) q0[24];
-cx q0[21],q0[24];
-cx q0[21],q0[23];
-rz(pi/4) q0[21];
-rz(-pi/4) q0[23];
-cx q0[21],q0[23];
-cx q0[22],q0[23];
-rz(pi/4) q0[24];
-cx q0[23],q0[24];
-rz(-pi/4) q0[24];
-cx q0[22],q0[24];
-rz(pi/4) q0[24];
-cx q0[23],q0[24];
-rz(pi/4) q0[23];
-rz(-pi/4) q0[24];
-cx q0[22],q0[24];
-cx q0[22],q0[23];
-rz(pi/4) q0[22];
-rz(-pi/4) q0[23];
-cx q0[21],q0[23];
-rz(pi/2) q0[21];
-sx q0[21];
-rz(pi/2) q0[21];
-cx q0[20],q0[21];
-rz(-pi/4) q0[21];
-cx q0[18],q0[21];
-rz(pi/4) q0[21];
-cx q0[20],q0[21];
-rz(pi/4) q0[20];
-rz(-pi/4) q0[21];
-cx q0[18],q0[21];
-cx q0[18],q0[20];
-rz(pi/4) q0[18];
-rz(-pi/4) q0[20];
-cx q0[18],q0[20];
-cx q0[19],q0[20];
-rz(pi/4) q0[21];
-cx q0[20],q0[21];
-rz(-pi/4) q0[21];
-cx q0[19],q0[21];
-rz(pi/4) q0[21];
-cx q0[20],q0[21];
-rz(pi/4) q0[20];
-rz(-pi/4) q0[21];
-cx q0[19],q0[21];
-cx q0[19],q0[20];
-rz(pi/4) q0[19];
-rz(-pi/4) q0[20];
-cx q0[18],q0[20];
-rz(pi/2) q0[18];
-sx q0[18];
-rz(pi/2) q0[18];
-cx q0[17],q0[18];
-rz(-pi/4) q0[18];
-cx q0[15],q0[18];
-rz(pi/4) q0[18];
-cx q0[17],q0[18];
-rz(pi/4) q0[17];
-rz(-pi/4) q0[18];
-cx q0[15],q0[18];
-cx q0[15],q0[17];
-rz(pi/4) q0[15];
-rz(-pi/4) q0[17];
-cx q0[15],q0[17];
-cx q0[16],q0[17];
-rz(pi/4) q0[18];
-cx q0[17],q0[18];
-rz(-pi/4) q0[18];
-cx q0[16],q0[18];
-rz(pi/4) q0[18];
-cx q0[17],q0[18];
-rz(pi/4) q0[17];
-rz(-pi/4) q0[18];
-cx q0[16],q0[18];
-cx q0[16],q0[17];
-rz(pi/4) q0[16];
-rz(-pi/4) q0[17];
-cx q0[15],q0[17];
-rz(pi/2) q0[15];
-sx q0[15];
-rz(pi/2) q0[15];
-cx q0[14],q0[15];
-rz(-pi/4) q0[15];
-cx q0[12],q0[15];
-rz(pi/4) q0[15];
-cx q0[14],q0[15];
-rz(pi/4) q0[14];
-rz(-pi/4) q0[15];
-cx q0[12],q0[15];
-cx q0[12],q0[14];
-rz(pi/4) q0[12];
-rz(-pi/4) q0[14];
-cx q0[12],q0[14];
-cx q0[13],q0[14];
-rz(pi/4) q0[15];
-cx q0[14],q0[15];
-rz(-pi/4) q0[15];
-cx q0[13],q0[15];
-rz(pi/4) q0[15];
-cx q0[14],q0[15];
-rz(pi/4) q0[14];
-rz(-pi/4) q0[15];
-cx q0[13],q0[15];
-cx q0[13],q0[14];
-rz(pi/4) q0[13];
-rz(-pi/4) q0[14];
-cx q0[12],q0[14];
-rz(pi/2) q0[12];
-sx q0[12];
-rz(pi/2) q0[12];
-cx q0[11],q0[12];
-rz(-pi/4) q0[12];
-rz(pi/4) q0[15];
-cx q0[14],q0[15];
-rz(-pi/4) q0[15];
-cx q0[13],q0[15];
-rz(pi/4) q0[15];
-cx q0[14],q0[15];
-rz(pi/4) q0[14];
-rz(-pi/4) q0[15];
-cx q0[13],q0[15];
-cx q0[13],q0[14];
-rz(pi/4) q0[13];
-rz(-pi/4) q0[14];
-rz(pi/4) q0[15];
-cx q0[14],q0[15];
-rz(-pi/4) q0[15];
-rz(pi/4) q0[18];
-cx q0[17],q0[18];
-rz(-pi/4) q0[18];
-cx q0[16],q0[18];
-rz(pi/4) q0[18];
-cx q0[17],q0[18];
-rz(pi/4) q0[17];
-rz(-pi/4) q0[18];
-cx q0[16],q0[18];
-cx q0[16],q0[17];
-rz(pi/4) q0[16];
-rz(-pi/4) q0[17];
-rz(pi/4) q0[18];
-cx q0[17],q0[18];
-rz(-pi/4) q0[18];
-rz(pi/4) q0[21];
-cx q0[20],q0[21];
-rz(-pi/4) q0[21];
-cx q0[19],q0[21];
-rz(pi/4) q0[21];
-cx q0[20],q0[21];
-rz(pi/4) q0[20];
-rz(-pi/4) q0[21];
-cx q0[19],q0[21];
-cx q0[19],q0[20];
-rz(pi/4) q0[19];
-rz(-pi/4) q0[20];
-rz(pi/4) q0[21];
-cx q0[20],q0[21];
-rz(-pi/4) q0[21];
-rz(pi/4) q0[24];
-cx q0[23],q0[24];
-rz(-pi/4) q0[24];
-cx q0[22],q0[24];
-rz(pi/4) q0[24];
-cx q0[23],q0[24];
-rz(pi/4) q0[23];
-rz(-pi/4) q0[24];
-cx q0[22],q0[24];
-cx q0[22],q0[23];
-rz(pi/4) q0[22];
-rz(-pi/4) q0[23];
-rz(pi/4) q0[24];
-cx q0[23],q0[24];
-rz(-pi/4) q0[24];
-rz(pi/4) q0[27];
-cx q0[26],q0[27];
-rz(-pi/4) q0[27];
-cx q0[25],q0[27];
-rz(pi/4) q0[27];
-cx q0[26],q0[27];
-rz(pi/4) q0[26];
-rz(-pi/4) q0[27];
-cx q0[25],q0[27];
-cx q0[25],q0[26];
-rz(pi/4) q0[25];
-rz(-pi/4) q0[26];
-rz(pi/4) q0[27];
-cx q0[26],q0[27];
-rz(-pi/4) q0[27];
-rz(pi/4) q0[30];
-cx q0[29],q0[30];
-rz(-pi/4) q0[30];
-cx q0[28],q0[30];
-rz(pi/4) q0[30];
-cx q0[29],q0[30];
-rz(pi/4) q0[29];
-rz(-pi/4) q0[30];
-cx q0[28],q0[30];
-cx q0[28],q0[29];
-rz(pi/4) q0[28];
-rz(-pi/4) q0[29];
-rz(pi/4) q0[30];
-cx q0[29],q0[30];
-rz(-pi/4) q0[30];
-rz(pi/4) q0[33];
-cx q0[32],q0[33];
-rz(-pi/4) q0[33];
-cx q0[31],q0[33];
-rz(pi/4) q0[33];
-cx q0[32],q0[33];
-rz(pi/4) q0[32];
-rz(-pi/4) q0[33];
-cx q0[31],q0[33];
-cx q0[31],q0[32];
-rz(pi/4) q0[31];
-rz(-pi/4) q0[32];
-rz(pi/4) q0[33];
-cx q0[32],q0[33];
-rz(-pi/4) q0[33];
-rz(pi/4) q0[36];
-cx q0[35],q0[36];
-rz(-pi/4) q0[36];
-cx q0[34],q0[36];
-rz(pi/4) q0[36];
-cx q0[35],q0[36];
-rz(pi/4) q0[35];
-rz(-pi/4) q0[36];
-cx q0[34],q0[36];
-cx q0[34],q0[35];
-rz(pi/4) q0[34];
-rz(-pi/4) q0[35];
-rz(pi/4) q0[36];
-cx q0[35],q0[36];
-rz(-pi/4) q0[36];
-rz(pi/4) q0[39];
-cx q0[38],q0[39];
-rz(-pi/4) q0[39];
-rz(pi/4) q0[42];
-cx q0[41],q0[42];
-rz(-pi/4) q0[42];
-rz(pi/2) q0[43];
-sx q0[43];
-rz(pi/2) q0[43];
-cx q0[45],q0[37];
-rz(-pi/4) q0[37];
-cx q0[46],q0[40];
-rz(-pi/4) q0[40];
-cx q0[72],q0[47];
-rz(-pi/4) q0[47];
-rz(pi/4) q0[72];
-cx q0[72],q0[47];
-cx q0[47],q0[43];
-rz(-pi/4) q0[43];
-cx q0[72],q0[37];
-rz(pi/4) q0[37];
-cx q0[45],q0[37];
-rz(-pi/4) q0[37];
-rz(pi/4) q0[45];
-cx q0[72],q0[37];
-rz(3*pi/4) q0[37];
-sx q0[37];
-rz(pi/2) q0[37];
-cx q0[37],q0[39];
-rz(pi/4) q0[39];
-cx q0[38],q0[39];
-rz(pi/4) q0[38];
-rz(-pi/4) q0[39];
-cx q0[37],q0[39];
-cx q0[37],q0[38];
-rz(pi/4) q0[37];
-rz(-pi/4) q0[38];
-rz(pi/4) q0[39];
-cx q0[38],q0[39];
-rz(-pi/4) q0[39];
-cx q0[72],q0[45];
-rz(-pi/4) q0[45];
-rz(pi/4) q0[72];
-cx q0[72],q0[45];
-cx q0[72],q0[40];
-rz(pi/4) q0[40];
-cx q0[46],q0[40];
-rz(-pi/4) q0[40];
-rz(pi/4) q0[46];
-cx q0[72],q0[40];
-rz(pi/4) q0[40];
-cx q0[45],q0[40];
-rz(-pi/4) q0[40];
-cx q0[72],q0[46];
-rz(-pi/4) q0[46];
-rz(pi/4) q0[72];
-cx q0[72],q0[46];
-cx q0[72],q0[43];
-rz(pi/4) q0[43];
-cx q0[47],q0[43];
-rz(-pi/4) q0[43];
-rz(pi/4) q0[47];
-cx q0[72],q0[43];
-rz(pi/4) q0[43];
-cx q0[46],q0[43];
-rz(-pi/4) q0[43];
-cx q0[72],q0[47];
-rz(-pi/4) q0[47];
-rz(pi/4) q0[72];
-cx q0[72],q0[47];
-cx q0[9],q0[12];
-rz(pi/4) q0[12];
-cx q0[11],q0[12];
-rz(pi/4) q0[11];
-rz(-pi/4) q0[12];
-cx q0[9],q0[12];
-rz(pi/4) q0[12];
-cx q0[9],q0[11];
-rz(-pi/4) q0[11];
-rz(pi/4) q0[9];
-cx q0[9],q0[11];
-cx q0[10],q0[11];
-cx q0[11],q0[12];
-rz(-pi/4) q0[12];
-cx q0[10],q0[12];
-rz(pi/4) q0[12];
-cx q0[11],q0[12];
-rz(pi/4) q0[11];
-rz(-pi/4) q0[12];
-cx q0[10],q0[12];
-cx q0[10],q0[11];
-rz(pi/4) q0[10];
-rz(-pi/4) q0[11];
-rz(pi/4) q0[12];
-cx q0[9],q0[11];
-cx q0[11],q0[12];
-rz(-pi/4) q0[12];
-cx q0[10],q0[12];
-rz(pi/4) q0[12];
-cx q0[11],q0[12];
-rz(pi/4) q0[11];
-rz(-pi/4) q0[12];
-cx q0[10],q0[12];
-cx q0[10],q0[11];
-rz(pi/4) q0[10];
-rz(-pi/4) q0[11];
-rz(pi/4) q0[12];
-cx q0[11],q0[12];
-rz(-pi/4) q0[12];
-rz(pi/2) q0[9];
-sx q0[9];
-rz(pi/2) q0[9];
-cx q0[8],q0[9];
-rz(-pi/4) q0[9];
-cx q0[6],q0[9];
-rz(pi/4) q0[9];
-cx q0[8],q0[9];
-rz(pi/4) q0[8];
-rz(-pi/4) q0[9];
-cx q0[6],q0[9];
-cx q0[6],q0[8];
-rz(pi/4) q0[6];
-rz(-pi/4) q0[8];
-cx q0[6],q0[8];
-cx q0[7],q0[8];
-rz(pi/4) q0[9];
-cx q0[8],q0[9];
-rz(-pi/4) q0[9];
-cx q0[7],q0[9];
-rz(pi/4) q0[9];
-cx q0[8],q0[9];
-rz(pi/4) q0[8];
-rz(-pi/4) q0[9];
-cx q0[7],q0[9];
-cx q0[7],q0[8];
-rz(pi/4) q0[7];
-rz(-pi/4) q0[8];
-cx q0[6],q0[8];
-rz(pi/2) q0[6];
-sx q0[6];
-rz(pi/2) q0[6];
-cx q0[5],q0[6];
-rz(-pi/4) q0[6];
-cx q0[3],q0[6];
-rz(pi/4) q0[6];
-cx q0[5],q0[6];
-rz(pi/4) q0[5];
-rz(-pi/4) q0[6];
-cx q0[3],q0[6];
-cx q0[3],q0[5];
-rz(pi/4) q0[3];
-rz(-pi/4) q0[5];
-cx q0[3],q0[5];
-cx q0[4],q0[5];
-rz(pi/4) q0[6];
-cx q0[5],q0[6];
-rz(-pi/4) q0[6];
-cx q0[4],q0[6];
-rz(pi/4) q0[6];
-cx q0[5],q0[6];
-rz(pi/4) q0[5];
-rz(-pi/4) q0[6];
-cx q0[4],q0[6];
-cx q0[4],q0[5];
-rz(pi/4) q0[4];
-rz(-pi/4) q0[5];
-cx q0[3],q0[5];
-rz(pi/2) q0[3];
-sx q0[3];
-rz(pi/2) q0[3];
-cx q0[2],q0[3];
-rz(-pi/4) q0[3];
-cx q0[0],q0[3];
-rz(pi/4) q0[3];
-cx q0[2],q0[3];
-rz(pi/4) q0[2];
-rz(-pi/4) q0[3];
-cx q0[0],q0[3];
-cx q0[0],q0[2];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[2];
-cx q0[0],q0[2];
-cx q0[1],q0[2];
-rz(pi/4) q0[3];
-cx q0[2],q0[3];
-rz(-pi/4) q0[3];
-cx q0[1],q0[3];
-rz(pi/4) q0[3];
-cx q0[2],q0[3];
-rz(pi/4) q0[2];
-rz(-pi/4) q0[3];
-cx q0[1],q0[3];
-cx q0[1],q0[2];
-rz(pi/4) q0[1];
-rz(-pi/4) q0[2];
-cx q0[0],q0[2];
-rz(pi/4) q0[3];
-cx q0[2],q0[3];
-rz(-pi/4) q0[3];
-cx q0[1],q0[3];
-rz(pi/4) q0[3];
-cx q0[2],q0[3];
-rz(pi/4) q0[2];
-rz(-pi/4) q0[3];
-cx q0[1],q0[3];
-cx q0[1],q0[2];
-rz(pi/4) q0[1];
-rz(-pi/4) q0[2];
-rz(pi/4) q0[3];
-cx q0[2],q0[3];
-rz(-pi/4) q0[3];
-cx q0[0],q0[3];
-rz(pi/4) q0[3];
-cx q0[2],q0[3];
-rz(pi/4) q0[2];
-rz(-pi/4) q0[3];
-cx q0[0],q0[3];
-cx q0[0],q0[2];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[2];
-cx q0[0],q0[2];
-rz(3*pi/4) q0[3];
-sx q0[3];
-rz(pi/2) q0[3];
-rz(pi/4) q0[6];
-cx q0[5],q0[6];
-rz(-pi/4) q0[6];
-cx q0[4],q0[6];
-rz(pi/4) q0[6];
-cx q0[5],q0[6];
-rz(pi/4) q0[5];
-rz(-pi/4) q0[6];
-cx q0[4],q0[6];
-cx q0[4],q0[5];
-rz(pi/4) q0[4];
-rz(-pi/4) q0[5];
-rz(pi/4) q0[6];
-cx q0[5],q0[6];
-rz(-pi/4) q0[6];
-cx q0[3],q0[6];
-rz(pi/4) q0[6];
-cx q0[5],q0[6];
-rz(pi/4) q0[5];
-rz(-pi/4) q0[6];
-cx q0[3],q0[6];
-cx q0[3],q0[5];
-rz(pi/4) q0[3];
-rz(-pi/4) q0[5];
-cx q0[3],q0[5];
-rz(3*pi/4) q0[6];
-sx q0[6];
-rz(pi/2) q0[6];
-rz(pi/4) q0[9];
-cx q0[8],q0[9];
-rz(-pi/4) q0[9];
-cx q0[7],q0[9];
-rz(pi/4) q0[9];
-cx q0[8],q0[9];
-rz(pi/4) q0[8];
-rz(-pi/4) q0[9];
-cx q0[7],q0[9];
-cx q0[7],q0[8];
-rz(pi/4) q0[7];
-rz(-pi/4) q0[8];
-rz(pi/4) q0[9];
-cx q0[8],q0[9];
-rz(-pi/4) q0[9];
-cx q0[6],q0[9];
-rz(pi/4) q0[9];
-cx q0[8],q0[9];
-rz(pi/4) q0[8];
-rz(-pi/4) q0[9];
-cx q0[6],q0[9];
-cx q0[6],q0[8];
-rz(pi/4) q0[6];
-rz(-pi/4) q0[8];
-cx q0[6],q0[8];
-rz(3*pi/4) q0[9];
-sx q0[9];
-rz(pi/2) q0[9];
-cx q0[9],q0[12];
-rz(pi/4) q0[12];
-cx q0[11],q0[12];
-rz(pi/4) q0[11];
-rz(-pi/4) q0[12];
-cx q0[9],q0[12];
-rz(3*pi/4) q0[12];
-sx q0[12];
-rz(pi/2) q0[12];
-cx q0[12],q0[15];
-rz(pi/4) q0[15];
-cx q0[14],q0[15];
-rz(pi/4) q0[14];
-rz(-pi/4) q0[15];
-cx q0[12],q0[15];
-cx q0[12],q0[14];
-rz(pi/4) q0[12];
-rz(-pi/4) q0[14];
-cx q0[12],q0[14];
-rz(3*pi/4) q0[15];
-sx q0[15];
-rz(pi/2) q0[15];
-cx q0[15],q0[18];
-rz(pi/4) q0[18];
-cx q0[17],q0[18];
-rz(pi/4) q0[17];
-rz(-pi/4) q0[18];
-cx q0[15],q0[18];
-cx q0[15],q0[17];
-rz(pi/4) q0[15];
-rz(-pi/4) q0[17];
-cx q0[15],q0[17];
-rz(3*pi/4) q0[18];
-sx q0[18];
-rz(pi/2) q0[18];
-cx q0[18],q0[21];
-rz(pi/4) q0[21];
-cx q0[20],q0[21];
-rz(pi/4) q0[20];
-rz(-pi/4) q0[21];
-cx q0[18],q0[21];
-cx q0[18],q0[20];
-rz(pi/4) q0[18];
-rz(-pi/4) q0[20];
-cx q0[18],q0[20];
-rz(3*pi/4) q0[21];
-sx q0[21];
-rz(pi/2) q0[21];
-cx q0[21],q0[24];
-rz(pi/4) q0[24];
-cx q0[23],q0[24];
-rz(pi/4) q0[23];
-rz(-pi/4) q0[24];
-cx q0[21],q0[24];
-cx q0[21],q0[23];
-rz(pi/4) q0[21];
-rz(-pi/4) q0[23];
-cx q0[21],q0[23];
-rz(3*pi/4) q0[24];
-sx q0[24];
-rz(pi/2) q0[24];
-cx q0[24],q0[27];
-rz(pi/4) q0[27];
-cx q0[26],q0[27];
-rz(pi/4) q0[26];
-rz(-pi/4) q0[27];
-cx q0[24],q0[27];
-cx q0[24],q0[26];
-rz(pi/4) q0[24];
-rz(-pi/4) q0[26];
-cx q0[24],q0[26];
-rz(3*pi/4) q0[27];
-sx q0[27];
-rz(pi/2) q0[27];
-cx q0[27],q0[30];
-rz(pi/4) q0[30];
-cx q0[29],q0[30];
-rz(pi/4) q0[29];
-rz(-pi/4) q0[30];
-cx q0[27],q0[30];
-cx q0[27],q0[29];
-rz(pi/4) q0[27];
-rz(-pi/4) q0[29];
-cx q0[27],q0[29];
-rz(3*pi/4) q0[30];
-sx q0[30];
-rz(pi/2) q0[30];
-cx q0[30],q0[33];
-rz(pi/4) q0[33];
-cx q0[32],q0[33];
-rz(pi/4) q0[32];
-rz(-pi/4) q0[33];
-cx q0[30],q0[33];
-cx q0[30],q0[32];
-rz(pi/4) q0[30];
-rz(-pi/4) q0[32];
-cx q0[30],q0[32];
-rz(3*pi/4) q0[33];
-sx q0[33];
-rz(pi/2) q0[33];
-cx q0[33],q0[36];
-rz(pi/4) q0[36];
-cx q0[35],q0[36];
-rz(pi/4) q0[35];
-rz(-pi/4) q0[36];
-cx q0[33],q0[36];
-cx q0[33],q0[35];
-rz(pi/4) q0[33];
-rz(-pi/4) q0[35];
-cx q0[33],q0[35];
-rz(3*pi/4) q0[36];
-sx q0[36];
-rz(pi/2) q0[36];
-cx q0[36],q0[39];
-rz(pi/4) q0[39];
-cx q0[38],q0[39];
-rz(pi/4) q0[38];
-rz(-pi/4) q0[39];
-cx q0[36],q0[39];
-cx q0[36],q0[38];
-rz(pi/4) q0[36];
-rz(-pi/4) q0[38];
-cx q0[36],q0[38];
-rz(3*pi/4) q0[39];
-sx q0[39];
-rz(pi/2) q0[39];
-cx q0[9],q0[11];
-rz(-pi/4) q0[11];
-rz(pi/4) q0[9];
-cx q0[9],q0[11];
-x q0[73];
-cx q0[73],q0[40];
-rz(pi/4) q0[40];
-cx q0[45],q0[40];
-rz(-pi/4) q0[40];
-rz(pi/4) q0[45];
-cx q0[73],q0[40];
-rz(3*pi/4) q0[40];
-sx q0[40];
-rz(pi/2) q0[40];
-cx q0[40],q0[42];
-rz(pi/4) q0[42];
-cx q0[41],q0[42];
-rz(pi/4) q0[41];
-rz(-pi/4) q0[42];
-cx q0[40],q0[42];
-cx q0[40],q0[41];
-rz(pi/4) q0[40];
-rz(-pi/4) q0[41];
-rz(pi/4) q0[42];
-cx q0[41],q0[42];
-rz(-pi/4) q0[42];
-cx q0[39],q0[42];
-rz(pi/4) q0[42];
-cx q0[41],q0[42];
-rz(pi/4) q0[41];
-rz(-pi/4) q0[42];
-cx q0[39],q0[42];
-cx q0[39],q0[41];
-rz(pi/4) q0[39];
-rz(-pi/4) q0[41];
-cx q0[39],q0[41];
-rz(3*pi/4) q0[42];
-sx q0[42];
-rz(pi/2) q0[42];
-cx q0[73],q0[45];
-rz(-pi/4) q0[45];
-rz(pi/4) q0[73];
-cx q0[73],q0[45];
-cx q0[73],q0[43];
-rz(pi/4) q0[43];
-cx q0[46],q0[43];
-rz(-pi/4) q0[43];
-rz(pi/4) q0[46];
-cx q0[73],q0[43];
-rz(3*pi/4) q0[43];
-sx q0[43];
-rz(pi/2) q0[43];
-cx q0[43],q0[44];
-cx q0[42],q0[44];
-rz(pi/2) q0[42];
-sx q0[42];
-rz(pi/2) q0[42];
-cx q0[41],q0[42];
-rz(-pi/4) q0[42];
-cx q0[39],q0[42];
-rz(pi/4) q0[42];
-cx q0[41],q0[42];
-rz(pi/4) q0[41];
-rz(-pi/4) q0[42];
-cx q0[39],q0[42];
-cx q0[39],q0[41];
-rz(pi/4) q0[39];
-rz(-pi/4) q0[41];
-cx q0[39],q0[41];
-cx q0[40],q0[41];
-rz(pi/4) q0[42];
-cx q0[41],q0[42];
-rz(-pi/4) q0[42];
-cx q0[40],q0[42];
-rz(pi/4) q0[42];
-cx q0[41],q0[42];
-rz(pi/4) q0[41];
-rz(-pi/4) q0[42];
-cx q0[40],q0[42];
-cx q0[40],q0[41];
-rz(3*pi/4) q0[40];
-sx q0[40];
-rz(pi/2) q0[40];
-rz(-pi/4) q0[41];
-cx q0[39],q0[41];
-rz(pi/2) q0[39];
-sx q0[39];
-rz(pi/2) q0[39];
-cx q0[38],q0[39];
-rz(-pi/4) q0[39];
-cx q0[36],q0[39];
-rz(pi/4) q0[39];
-cx q0[38],q0[39];
-rz(pi/4) q0[38];
-rz(-pi/4) q0[39];
-cx q0[36],q0[39];
-cx q0[36],q0[38];
-rz(pi/4) q0[36];
-rz(-pi/4) q0[38];
-cx q0[36],q0[38];
-cx q0[37],q0[38];
-rz(pi/4) q0[39];
-cx q0[38],q0[39];
-rz(-pi/4) q0[39];
-cx q0[37],q0[39];
-rz(pi/4) q0[39];
-cx q0[38],q0[39];
-rz(pi/4) q0[38];
-rz(-pi/4) q0[39];
-cx q0[37],q0[39];
-cx q0[37],q0[38];
-rz(pi/4) q0[37];
-rz(-pi/4) q0[38];
-cx q0[36],q0[38];
-rz(pi/2) q0[36];
-sx q0[36];
-rz(pi/2) q0[36];
-cx q0[35],q0[36];
-rz(-pi/4) q0[36];
-cx q0[33],q0[36];
-rz(pi/4) q0[36];
-cx q0[35],q0[36];
-rz(pi/4) q0[35];
-rz(-pi/4) q0[36];
-cx q0[33],q0[36];
-cx q0[33],q0[35];
-rz(pi/4) q0[33];
-rz(-pi/4) q0[35];
-cx q0[33],q0[35];
-cx q0[34],q0[35];
-rz(pi/4) q0[36];
-cx q0[35],q0[36];
-rz(-pi/4) q0[36];
-cx q0[34],q0[36];
-rz(pi/4) q0[36];
-cx q0[35],q0[36];
-rz(pi/4) q0[35];
-rz(-pi/4) q0[36];
-cx q0[34],q0[36];
-cx q0[34],q0[35];
-rz(pi/4) q0[34];
-rz(-pi/4) q0[35];
-cx q0[33],q0[35];
-rz(pi/2) q0[33];
-sx q0[33];
-rz(pi/2) q0[33];
-cx q0[32],q0[33];
-rz(-pi/4) q0[33];
-cx q0[30],q0[33];
-rz(pi/4) q0[33];
-cx q0[32],q0[33];
-rz(pi/4) q0[32];
-rz(-pi/4) q0[33];
-cx q0[30],q0[33];
-cx q0[30],q0[32];
-rz(pi/4) q0[30];
-rz(-pi/4) q0[32];
-cx q0[30],q0[32];
-cx q0[31],q0[32];
-rz(pi/4) q0[33];
-cx q0[32],q0[33];
-rz(-pi/4) q0[33];
-cx q0[31],q0[33];
-rz(pi/4) q0[33];
-cx q0[32],q0[33];
-rz(pi/4) q0[32];
-rz(-pi/4) q0[33];
-cx q0[31],q0[33];
-cx q0[31],q0[32];
-rz(pi/4) q0[31];
-rz(-pi/4) q0[32];
-cx q0[30],q0[32];
-rz(pi/2) q0[30];
-sx q0[30];
-rz(pi/2) q0[30];
-cx q0[29],q0[30];
-rz(-pi/4) q0[30];
-cx q0[27],q0[30];
-rz(pi/4) q0[30];
-cx q0[29],q0[30];
-rz(pi/4) q0[29];
-rz(-pi/4) q0[30];
-cx q0[27],q0[30];
-cx q0[27],q0[29];
-rz(pi/4) q0[27];
-rz(-pi/4) q0[29];
-cx q0[27],q0[29];
-cx q0[28],q0[29];
-rz(pi/4) q0[30];
-cx q0[29],q0[30];
-rz(-pi/4) q0[30];
-cx q0[28],q0[30];
-rz(pi/4) q0[30];
-cx q0[29],q0[30];
-rz(pi/4) q0[29];
-rz(-pi/4) q0[30];
-cx q0[28],q0[30];
-cx q0[28],q0[29];
-rz(pi/4) q0[28];
-rz(-pi/4) q0[29];
-cx q0[27],q0[29];
-rz(pi/2) q0[27];
-sx q0[27];
-rz(pi/2) q0[27];
-cx q0[26],q0[27];
-rz(-pi/4) q0[27];
-cx q0[24],q0[27];
-rz(pi/4) q0[27];
-cx q0[26],q0[27];
-rz(pi/4) q0[26];
-rz(-pi/4) q0[27];
-cx q0[24],q0[27];
-cx q0[24],q0[26];
-rz(pi/4) q0[24];
-rz(-pi/4) q0[26];
-cx q0[24],q0[26];
-cx q0[25],q0[26];
-rz(pi/4) q0[27];
-cx q0[26],q0[27];
-rz(-pi/4) q0[27];
-cx q0[25],q0[27];
-rz(pi/4) q0[27];
-cx q0[26],q0[27];
-rz(pi/4) q0[26];
-rz(-pi/4) q0[27];
-cx q0[25],q0[27];
-cx q0[25],q0[26];
-rz(pi/4) q0[25];
-rz(-pi/4) q0[26];
-cx q0[24],q0[26];
-rz(pi/2) q0[24];
-sx q0[24];
-rz(pi/2) q0[24];
-cx q0[23],q0[24];
-rz(-pi/4) q0[24];
-cx q0[21],q0[24];
-rz(pi/4) q0[24];
-cx q0[23],q0[24];
-rz(pi/4) q0[23];
-rz(-pi/4) q0[24];
-cx q0[21],q0[24];
-cx q0[21],q0[23];
-rz(pi/4) q0[21];
-rz(-pi/4) q0[23];
-cx q0[21],q0[23];
-cx q0[22],q0[23];
-rz(pi/4) q0[24];
-cx q0[23],q0[24];
-rz(-pi/4) q0[24];
-cx q0[22],q0[24];
-rz(pi/4) q0[24];
-cx q0[23],q0[24];
-rz(pi/4) q0[23];
-rz(-pi/4) q0[24];
-cx q0[22],q0[24];
-cx q0[22],q0[23];
-rz(pi/4) q0[22];
-rz(-pi/4) q0[23];
-cx q0[21],q0[23];
-rz(pi/2) q0[21];
-sx q0[21];
-rz(pi/2) q0[21];
-cx q0[20],q0[21];
-rz(-pi/4) q0[21];
-cx q0[18],q0[21];
-rz(pi/4) q0[21];
-cx q0[20],q0[21];
-rz(pi/4) q0[20];
-rz(-pi/4) q0[21];
-cx q0[18],q0[21];
-cx q0[18],q0[20];
-rz(pi/4) q0[18];
-rz(-pi/4) q0[20];
-cx q0[18],q0[20];
-cx q0[19],q0[20];
-rz(pi/4) q0[21];
-cx q0[20],q0[21];
-rz(-pi/4) q0[21];
-cx q0[19],q0[21];
-rz(pi/4) q0[21];
-cx q0[20],q0[21];
-rz(pi/4) q0[20];
-rz(-pi/4) q0[21];
-cx q0[19],q0[21];
-cx q0[19],q0[20];
-rz(pi/4) q0[19];
-rz(-pi/4) q0[20];
-cx q0[18],q0[20];
-rz(pi/2) q0[18];
-sx q0[18];
-rz(pi/2) q0[18];
-cx q0[17],q0[18];
-rz(-pi/4) q0[18];
-cx q0[15],q0[18];
-rz(pi/4) q0[18];
-cx q0[17],q0[18];
-rz(pi/4) q0[17];
-rz(-pi/4) q0[18];
-cx q0[15],q0[18];
-cx q0[15],q0[17];
-rz(pi/4) q0[15];
-rz(-pi/4) q0[17];
-cx q0[15],q0[17];
-cx q0[16],q0[17];
-rz(pi/4) q0[18];
-cx q0[17],q0[18];
-rz(-pi/4) q0[18];
-cx q0[16],q0[18];
-rz(pi/4) q0[18];
-cx q0[17],q0[18];
-rz(pi/4) q0[17];
-rz(-pi/4) q0[18];
-cx q0[16],q0[18];
-cx q0[16],q0[17];
-rz(pi/4) q0[16];
-rz(-pi/4) q0[17];
-cx q0[15],q0[17];
-rz(pi/2) q0[15];
-sx q0[15];
-rz(pi/2) q0[15];
-cx q0[14],q0[15];
-rz(-pi/4) q0[15];
-cx q0[12],q0[15];
-rz(pi/4) q0[15];
-cx q0[14],q0[15];
-rz(pi/4) q0[14];
-rz(-pi/4) q0[15];
-cx q0[12],q0[15];
-cx q0[12],q0[14];
-rz(pi/4) q0[12];
-rz(-pi/4) q0[14];
-cx q0[12],q0[14];
-cx q0[13],q0[14];
-rz(pi/4) q0[15];
-cx q0[14],q0[15];
-rz(-pi/4) q0[15];
-cx q0[13],q0[15];
-rz(pi/4) q0[15];
-cx q0[14],q0[15];
-rz(pi/4) q0[14];
-rz(-pi/4) q0[15];
-cx q0[13],q0[15];
-cx q0[13],q0[14];
-rz(pi/4) q0[13];
-rz(-pi/4) q0[14];
-cx q0[12],q0[14];
-rz(pi/2) q0[12];
-sx q0[12];
-rz(pi/2) q0[12];
-cx q0[11],q0[12];
-rz(-pi/4) q0[12];
-rz(pi/4) q0[15];
-cx q0[14],q0[15];
-rz(-pi/4) q0[15];
-cx q0[13],q0[15];
-rz(pi/4) q0[15];
-cx q0[14],q0[15];
-rz(pi/4) q0[14];
-rz(-pi/4) q0[15];
-cx q0[13],q0[15];
-cx q0[13],q0[14];
-rz(pi/4) q0[13];
-rz(-pi/4) q0[14];
-rz(pi/4) q0[15];
-cx q0[14],q0[15];
-rz(-pi/4) q0[15];
-rz(pi/4) q0[18];
-cx q0[17],q0[18];
-rz(-pi/4) q0[18];
-cx q0[16],q0[18];
-rz(pi/4) q0[18];
-cx q0[17],q0[18];
-rz(pi/4) q0[17];
-rz(-pi/4) q0[18];
-cx q0[16],q0[18];
-cx q0[16],q0[17];
-rz(pi/4) q0[16];
-rz(-pi/4) q0[17];
-rz(pi/4) q0[18];
-cx q0[17],q0[18];
-rz(-pi/4) q0[18];
-rz(pi/4) q0[21];
-cx q0[20],q0[21];
-rz(-pi/4) q0[21];
-cx q0[19],q0[21];
-rz(pi/4) q0[21];
-cx q0[20],q0[21];
-rz(pi/4) q0[20];
-rz(-pi/4) q0[21];
-cx q0[19],q0[21];
-cx q0[19],q0[20];
-rz(pi/4) q0[19];
-rz(-pi/4) q0[20];
-rz(pi/4) q0[21];
-cx q0[20],q0[21];
-rz(-pi/4) q0[21];
-rz(pi/4) q0[24];
-cx q0[23],q0[24];
-rz(-pi/4) q0[24];
-cx q0[22],q0[24];
-rz(pi/4) q0[24];
-cx q0[23],q0[24];
-rz(pi/4) q0[23];
-rz(-pi/4) q0[24];
-cx q0[22],q0[24];
-cx q0[22],q0[23];
-rz(pi/4) q0[22];
-rz(-pi/4) q0[23];
-rz(pi/4) q0[24];
-cx q0[23],q0[24];
-rz(-pi/4) q0[24];
-rz(pi/4) q0[27];
-cx q0[26],q0[27];
-rz(-pi/4) q0[27];
-cx q0[25],q0[27];
-rz(pi/4) q0[27];
-cx q0[26],q0[27];
-rz(pi/4) q0[26];
-rz(-pi/4) q0[27];
-cx q0[25],q0[27];
-cx q0[25],q0[26];
-rz(pi/4) q0[25];
-rz(-pi/4) q0[26];
-rz(pi/4) q0[27];
-cx q0[26],q0[27];
-rz(-pi/4) q0[27];
-rz(pi/4) q0[30];
-cx q0[29],q0[30];
-rz(-pi/4) q0[30];
-cx q0[28],q0[30];
-rz(pi/4) q0[30];
-cx q0[29],q0[30];
-rz(pi/4) q0[29];
-rz(-pi/4) q0[30];
-cx q0[28],q0[30];
-cx q0[28],q0[29];
-rz(pi/4) q0[28];
-rz(-pi/4) q0[29];
-rz(pi/4) q0[30];
-cx q0[29],q0[30];
-rz(-pi/4) q0[30];
-rz(pi/4) q0[33];
-cx q0[32],q0[33];
-rz(-pi/4) q0[33];
-cx q0[31],q0[33];
-rz(pi/4) q0[33];
-cx q0[32],q0[33];
-rz(pi/4) q0[32];
-rz(-pi/4) q0[33];
-cx q0[31],q0[33];
-cx q0[31],q0[32];
-rz(pi/4) q0[31];
-rz(-pi/4) q0[32];
-rz(pi/4) q0[33];
-cx q0[32],q0[33];
-rz(-pi/4) q0[33];
-rz(pi/4) q0[36];
-cx q0[35],q0[36];
-rz(-pi/4) q0[36];
-cx q0[34],q0[36];
-rz(pi/4) q0[36];
-cx q0[35],q0[36];
-rz(pi/4) q0[35];
-rz(-pi/4) q0[36];
-cx q0[34],q0[36];
-cx q0[34],q0[35];
-rz(pi/4) q0[34];
-rz(-pi/4) q0[35];
-rz(pi/4) q0[36];
-cx q0[35],q0[36];
-rz(-pi/4) q0[36];
-rz(pi/4) q0[39];
-cx q0[38],q0[39];
-rz(-pi/4) q0[39];
-cx q0[37],q0[39];
-rz(pi/4) q0[39];
-cx q0[38],q0[39];
-rz(pi/4) q0[38];
-rz(-pi/4) q0[39];
-cx q0[37],q0[39];
-cx q0[37],q0[38];
-rz(pi/4) q0[37];
-rz(-pi/4) q0[38];
-rz(pi/4) q0[39];
-cx q0[38],q0[39];
-rz(-pi/4) q0[39];
-rz(pi/4) q0[42];
-cx q0[41],q0[42];
-rz(-pi/4) q0[42];
-rz(pi/2) q0[43];
-sx q0[43];
-rz(pi/2) q0[43];
-cx q0[45],q0[40];
-rz(-pi/4) q0[40];
-cx q0[73],q0[46];
-rz(-pi/4) q0[46];
-rz(pi/4) q0[73];
-cx q0[73],q0[46];
-cx q0[46],q0[43];
-rz(-pi/4) q0[43];
-cx q0[73],q0[40];
-rz(pi/4) q0[40];
-cx q0[45],q0[40];
-rz(-pi/4) q0[40];
-rz(pi/4) q0[45];
-cx q0[73],q0[40];
-rz(3*pi/4) q0[40];
-sx q0[40];
-rz(pi/2) q0[40];
-cx q0[40],q0[42];
-rz(pi/4) q0[42];
-cx q0[41],q0[42];
-rz(pi/4) q0[41];
-rz(-pi/4) q0[42];
-cx q0[40],q0[42];
-cx q0[40],q0[41];
-rz(pi/4) q0[40];
-rz(-pi/4) q0[41];
-rz(pi/4) q0[42];
-cx q0[41],q0[42];
-rz(-pi/4) q0[42];
-cx q0[73],q0[45];
-rz(-pi/4) q0[45];
-rz(pi/4) q0[73];
-cx q0[73],q0[45];
-cx q0[73],q0[43];
-rz(pi/4) q0[43];
-cx q0[46],q0[43];
-rz(-pi/4) q0[43];
-rz(pi/4) q0[46];
-cx q0[73],q0[43];
-rz(pi/4) q0[43];
-cx q0[45],q0[43];
-rz(-pi/4) q0[43];
-cx q0[73],q0[46];
-rz(-pi/4) q0[46];
-rz(pi/4) q0[73];
-cx q0[73],q0[46];
-cx q0[9],q0[12];
-rz(pi/4) q0[12];
-cx q0[11],q0[12];
-rz(pi/4) q0[11];
-rz(-pi/4) q0[12];
-cx q0[9],q0[12];
-rz(pi/4) q0[12];
-cx q0[9],q0[11];
-rz(-pi/4) q0[11];
-rz(pi/4) q0[9];
-cx q0[9],q0[11];
-cx q0[10],q0[11];
-cx q0[11],q0[12];
-rz(-pi/4) q0[12];
-cx q0[10],q0[12];
-rz(pi/4) q0[12];
-cx q0[11],q0[12];
-rz(pi/4) q0[11];
-rz(-pi/4) q0[12];
-cx q0[10],q0[12];
-cx q0[10],q0[11];
-rz(pi/4) q0[10];
-rz(-pi/4) q0[11];
-rz(pi/4) q0[12];
-cx q0[9],q0[11];
-cx q0[11],q0[12];
-rz(-pi/4) q0[12];
-cx q0[10],q0[12];
-rz(pi/4) q0[12];
-cx q0[11],q0[12];
-rz(pi/4) q0[11];
-rz(-pi/4) q0[12];
-cx q0[10],q0[12];
-cx q0[10],q0[11];
-rz(pi/4) q0[10];
-rz(-pi/4) q0[11];
-rz(pi/4) q0[12];
-cx q0[11],q0[12];
-rz(-pi/4) q0[12];
-rz(pi/2) q0[9];
-sx q0[9];
-rz(pi/2) q0[9];
-cx q0[8],q0[9];
-rz(-pi/4) q0[9];
-cx q0[6],q0[9];
-rz(pi/4) q0[9];
-cx q0[8],q0[9];
-rz(pi/4) q0[8];
-rz(-pi/4) q0[9];
-cx q0[6],q0[9];
-cx q0[6],q0[8];
-rz(pi/4) q0[6];
-rz(-pi/4) q0[8];
-cx q0[6],q0[8];
-cx q0[7],q0[8];
-rz(pi/4) q0[9];
-cx q0[8],q0[9];
-rz(-pi/4) q0[9];
-cx q0[7],q0[9];
-rz(pi/4) q0[9];
-cx q0[8],q0[9];
-rz(pi/4) q0[8];
-rz(-pi/4) q0[9];
-cx q0[7],q0[9];
-cx q0[7],q0[8];
-rz(pi/4) q0[7];
-rz(-pi/4) q0[8];
-cx q0[6],q0[8];
-rz(pi/2) q0[6];
-sx q0[6];
-rz(pi/2) q0[6];
-cx q0[5],q0[6];
-rz(-pi/4) q0[6];
-cx q0[3],q0[6];
-rz(pi/4) q0[6];
-cx q0[5],q0[6];
-rz(pi/4) q0[5];
-rz(-pi/4) q0[6];
-cx q0[3],q0[6];
-cx q0[3],q0[5];
-rz(pi/4) q0[3];
-rz(-pi/4) q0[5];
-cx q0[3],q0[5];
-cx q0[4],q0[5];
-rz(pi/4) q0[6];
-cx q0[5],q0[6];
-rz(-pi/4) q0[6];
-cx q0[4],q0[6];
-rz(pi/4) q0[6];
-cx q0[5],q0[6];
-rz(pi/4) q0[5];
-rz(-pi/4) q0[6];
-cx q0[4],q0[6];
-cx q0[4],q0[5];
-rz(pi/4) q0[4];
-rz(-pi/4) q0[5];
-cx q0[3],q0[5];
-rz(pi/2) q0[3];
-sx q0[3];
-rz(pi/2) q0[3];
-cx q0[2],q0[3];
-rz(-pi/4) q0[3];
-cx q0[0],q0[3];
-rz(pi/4) q0[3];
-cx q0[2],q0[3];
-rz(pi/4) q0[2];
-rz(-pi/4) q0[3];
-cx q0[0],q0[3];
-cx q0[0],q0[2];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[2];
-cx q0[0],q0[2];
-cx q0[1],q0[2];
-rz(pi/4) q0[3];
-cx q0[2],q0[3];
-rz(-pi/4) q0[3];
-cx q0[1],q0[3];
-rz(pi/4) q0[3];
-cx q0[2],q0[3];
-rz(pi/4) q0[2];
-rz(-pi/4) q0[3];
-cx q0[1],q0[3];
-cx q0[1],q0[2];
-rz(pi/4) q0[1];
-rz(-pi/4) q0[2];
-cx q0[0],q0[2];
-rz(pi/4) q0[3];
-cx q0[2],q0[3];
-rz(-pi/4) q0[3];
-cx q0[1],q0[3];
-rz(pi/4) q0[3];
-cx q0[2],q0[3];
-rz(pi/4) q0[2];
-rz(-pi/4) q0[3];
-cx q0[1],q0[3];
-cx q0[1],q0[2];
-rz(pi/4) q0[1];
-rz(-pi/4) q0[2];
-rz(pi/4) q0[3];
-cx q0[2],q0[3];
-rz(-pi/4) q0[3];
-cx q0[0],q0[3];
-rz(pi/4) q0[3];
-cx q0[2],q0[3];
-rz(pi/4) q0[2];
-rz(-pi/4) q0[3];
-cx q0[0],q0[3];
-cx q0[0],q0[2];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[2];
-cx q0[0],q0[2];
-rz(3*pi/4) q0[3];
-sx q0[3];
-rz(pi/2) q0[3];
-rz(pi/4) q0[6];
-cx q0[5],q0[6];
-rz(-pi/4) q0[6];
-cx q0[4],q0[6];
-rz(pi/4) q0[6];
-cx q0[5],q0[6];
-rz(pi/4) q0[5];
-rz(-pi/4) q0[6];
-cx q0[4],q0[6];
-cx q0[4],q0[5];
-rz(pi/4) q0[4];
-rz(-pi/4) q0[5];
-rz(pi/4) q0[6];
-cx q0[5],q0[6];
-rz(-pi/4) q0[6];
-cx q0[3],q0[6];
-rz(pi/4) q0[6];
-cx q0[5],q0[6];
-rz(pi/4) q0[5];
-rz(-pi/4) q0[6];
-cx q0[3],q0[6];
-cx q0[3],q0[5];
-rz(pi/4) q0[3];
-rz(-pi/4) q0[5];
-cx q0[3],q0[5];
-rz(3*pi/4) q0[6];
-sx q0[6];
-rz(pi/2) q0[6];
-rz(pi/4) q0[9];
-cx q0[8],q0[9];
-rz(-pi/4) q0[9];
-cx q0[7],q0[9];
-rz(pi/4) q0[9];
-cx q0[8],q0[9];
-rz(pi/4) q0[8];
-rz(-pi/4) q0[9];
-cx q0[7],q0[9];
-cx q0[7],q0[8];
-rz(pi/4) q0[7];
-rz(-pi/4) q0[8];
-rz(pi/4) q0[9];
-cx q0[8],q0[9];
-rz(-pi/4) q0[9];
-cx q0[6],q0[9];
-rz(pi/4) q0[9];
-cx q0[8],q0[9];
-rz(pi/4) q0[8];
-rz(-pi/4) q0[9];
-cx q0[6],q0[9];
-cx q0[6],q0[8];
-rz(pi/4) q0[6];
-rz(-pi/4) q0[8];
-cx q0[6],q0[8];
-rz(3*pi/4) q0[9];
-sx q0[9];
-rz(pi/2) q0[9];
-cx q0[9],q0[12];
-rz(pi/4) q0[12];
-cx q0[11],q0[12];
-rz(pi/4) q0[11];
-rz(-pi/4) q0[12];
-cx q0[9],q0[12];
-rz(3*pi/4) q0[12];
-sx q0[12];
-rz(pi/2) q0[12];
-cx q0[12],q0[15];
-rz(pi/4) q0[15];
-cx q0[14],q0[15];
-rz(pi/4) q0[14];
-rz(-pi/4) q0[15];
-cx q0[12],q0[15];
-cx q0[12],q0[14];
-rz(pi/4) q0[12];
-rz(-pi/4) q0[14];
-cx q0[12],q0[14];
-rz(3*pi/4) q0[15];
-sx q0[15];
-rz(pi/2) q0[15];
-cx q0[15],q0[18];
-rz(pi/4) q0[18];
-cx q0[17],q0[18];
-rz(pi/4) q0[17];
-rz(-pi/4) q0[18];
-cx q0[15],q0[18];
-cx q0[15],q0[17];
-rz(pi/4) q0[15];
-rz(-pi/4) q0[17];
-cx q0[15],q0[17];
-rz(3*pi/4) q0[18];
-sx q0[18];
-rz(pi/2) q0[18];
-cx q0[18],q0[21];
-rz(pi/4) q0[21];
-cx q0[20],q0[21];
-rz(pi/4) q0[20];
-rz(-pi/4) q0[21];
-cx q0[18],q0[21];
-cx q0[18],q0[20];
-rz(pi/4) q0[18];
-rz(-pi/4) q0[20];
-cx q0[18],q0[20];
-rz(3*pi/4) q0[21];
-sx q0[21];
-rz(pi/2) q0[21];
-cx q0[21],q0[24];
-rz(pi/4) q0[24];
-cx q0[23],q0[24];
-rz(pi/4) q0[23];
-rz(-pi/4) q0[24];
-cx q0[21],q0[24];
-cx q0[21],q0[23];
-rz(pi/4) q0[21];
-rz(-pi/4) q0[23];
-cx q0[21],q0[23];
-rz(3*pi/4) q0[24];
-sx q0[24];
-rz(pi/2) q0[24];
-cx q0[24],q0[27];
-rz(pi/4) q0[27];
-cx q0[26],q0[27];
-rz(pi/4) q0[26];
-rz(-pi/4) q0[27];
-cx q0[24],q0[27];
-cx q0[24],q0[26];
-rz(pi/4) q0[24];
-rz(-pi/4) q0[26];
-cx q0[24],q0[26];
-rz(3*pi/4) q0[27];
-sx q0[27];
-rz(pi/2) q0[27];
-cx q0[27],q0[30];
-rz(pi/4) q0[30];
-cx q0[29],q0[30];
-rz(pi/4) q0[29];
-rz(-pi/4) q0[30];
-cx q0[27],q0[30];
-cx q0[27],q0[29];
-rz(pi/4) q0[27];
-rz(-pi/4) q0[29];
-cx q0[27],q0[29];
-rz(3*pi/4) q0[30];
-sx q0[30];
-rz(pi/2) q0[30];
-cx q0[30],q0[33];
-rz(pi/4) q0[33];
-cx q0[32],q0[33];
-rz(pi/4) q0[32];
-rz(-pi/4) q0[33];
-cx q0[30],q0[33];
-cx q0[30],q0[32];
-rz(pi/4) q0[30];
-rz(-pi/4) q0[32];
-cx q0[30],q0[32];
-rz(3*pi/4) q0[33];
-sx q0[33];
-rz(pi/2) q0[33];
-cx q0[33],q0[36];
-rz(pi/4) q0[36];
-cx q0[35],q0[36];
-rz(pi/4) q0[35];
-rz(-pi/4) q0[36];
-cx q0[33],q0[36];
-cx q0[33],q0[35];
-rz(pi/4) q0[33];
-rz(-pi/4) q0[35];
-cx q0[33],q0[35];
-rz(3*pi/4) q0[36];
-sx q0[36];
-rz(pi/2) q0[36];
-cx q0[36],q0[39];
-rz(pi/4) q0[39];
-cx q0[38],q0[39];
-rz(pi/4) q0[38];
-rz(-pi/4) q0[39];
-cx q0[36],q0[39];
-cx q0[36],q0[38];
-rz(pi/4) q0[36];
-rz(-pi/4) q0[38];
-cx q0[36],q0[38];
-rz(3*pi/4) q0[39];
-sx q0[39];
-rz(pi/2) q0[39];
-cx q0[39],q0[42];
-rz(pi/4) q0[42];
-cx q0[41],q0[42];
-rz(pi/4) q0[41];
-rz(-pi/4) q0[42];
-cx q0[39],q0[42];
-cx q0[39],q0[41];
-rz(pi/4) q0[39];
-rz(-pi/4) q0[41];
-cx q0[39],q0[41];
-rz(3*pi/4) q0[42];
-sx q0[42];
-rz(pi/2) q0[42];
-cx q0[9],q0[11];
-rz(-pi/4) q0[11];
-rz(pi/4) q0[9];
-cx q0[9],q0[11];
-cx q0[74],q0[43];
-rz(pi/4) q0[43];
-cx q0[45],q0[43];
-rz(-pi/4) q0[43];
-rz(pi/4) q0[45];
-cx q0[74],q0[43];
-rz(3*pi/4) q0[43];
-sx q0[43];
-rz(pi/2) q0[43];
-cx q0[43],q0[44];
-cx q0[42],q0[44];
-rz(pi/2) q0[42];
-sx q0[42];
-rz(pi/2) q0[42];
-cx q0[41],q0[42];
-rz(-pi/4) q0[42];
-cx q0[39],q0[42];
-rz(pi/4) q0[42];
-cx q0[41],q0[42];
-rz(pi/4) q0[41];
-rz(-pi/4) q0[42];
-cx q0[39],q0[42];
-cx q0[39],q0[41];
-rz(pi/4) q0[39];
-rz(-pi/4) q0[41];
-cx q0[39],q0[41];
-cx q0[40],q0[41];
-rz(pi/4) q0[42];
-cx q0[41],q0[42];
-rz(-pi/4) q0[42];
-cx q0[40],q0[42];
-rz(pi/4) q0[42];
-cx q0[41],q0[42];
-rz(pi/4) q0[41];
-rz(-pi/4) q0[42];
-cx q0[40],q0[42];
-cx q0[40],q0[41];
-rz(pi/4) q0[40];
-rz(-pi/4) q0[41];
-cx q0[39],q0[41];
-rz(pi/2) q0[39];
-sx q0[39];
-rz(pi/2) q0[39];
-cx q0[38],q0[39];
-rz(-pi/4) q0[39];
-cx q0[36],q0[39];
-rz(pi/4) q0[39];
-cx q0[38],q0[39];
-rz(pi/4) q0[38];
-rz(-pi/4) q0[39];
-cx q0[36],q0[39];
-cx q0[36],q0[38];
-rz(pi/4) q0[36];
-rz(-pi/4) q0[38];
-cx q0[36],q0[38];
-cx q0[37],q0[38];
-rz(pi/4) q0[39];
-cx q0[38],q0[39];
-rz(-pi/4) q0[39];
-cx q0[37],q0[39];
-rz(pi/4) q0[39];
-cx q0[38],q0[39];
-rz(pi/4) q0[38];
-rz(-pi/4) q0[39];
-cx q0[37],q0[39];
-cx q0[37],q0[38];
-rz(pi/4) q0[37];
-rz(-pi/4) q0[38];
-cx q0[36],q0[38];
-rz(pi/2) q0[36];
-sx q0[36];
-rz(pi/2) q0[36];
-cx q0[35],q0[36];
-rz(-pi/4) q0[36];
-cx q0[33],q0[36];
-rz(pi/4) q0[36];
-cx q0[35],q0[36];
-rz(pi/4) q0[35];
-rz(-pi/4) q0[36];
-cx q0[33],q0[36];
-cx q0[33],q0[35];
-rz(pi/4) q0[33];
-rz(-pi/4) q0[35];
-cx q0[33],q0[35];
-cx q0[34],q0[35];
-rz(pi/4) q0[36];
-cx q0[35],q0[36];
-rz(-pi/4) q0[36];
-cx q0[34],q0[36];
-rz(pi/4) q0[36];
-cx q0[35],q0[36];
-rz(pi/4) q0[35];
-rz(-pi/4) q0[36];
-cx q0[34],q0[36];
-cx q0[34],q0[35];
-rz(pi/4) q0[34];
-rz(-pi/4) q0[35];
-cx q0[33],q0[35];
-rz(pi/2) q0[33];
-sx q0[33];
-rz(pi/2) q0[33];
-cx q0[32],q0[33];
-rz(-pi/4) q0[33];
-cx q0[30],q0[33];
-rz(pi/4) q0[33];
-cx q0[32],q0[33];
-rz(pi/4) q0[32];
-rz(-pi/4) q0[33];
-cx q0[30],q0[33];
-cx q0[30],q0[32];
-rz(pi/4) q0[30];
-rz(-pi/4) q0[32];
-cx q0[30],q0[32];
-cx q0[31],q0[32];
-rz(pi/4) q0[33];
-cx q0[32],q0[33];
-rz(-pi/4) q0[33];
-cx q0[31],q0[33];
-rz(pi/4) q0[33];
-cx q0[32],q0[33];
-rz(pi/4) q0[32];
-rz(-pi/4) q0[33];
-cx q0[31],q0[33];
-cx q0[31],q0[32];
-rz(pi/4) q0[31];
-rz(-pi/4) q0[32];
-cx q0[30],q0[32];
-rz(pi/2) q0[30];
-sx q0[30];
-rz(pi/2) q0[30];
-cx q0[29],q0[30];
-rz(-pi/4) q0[30];
-cx q0[27],q0[30];
-rz(pi/4) q0[30];
-cx q0[29],q0[30];
-rz(pi/4) q0[29];
-rz(-pi/4) q0[30];
-cx q0[27],q0[30];
-cx q0[27],q0[29];
-rz(pi/4) q0[27];
-rz(-pi/4) q0[29];
-cx q0[27],q0[29];
-cx q0[28],q0[29];
-rz(pi/4) q0[30];
-cx q0[29],q0[30];
-rz(-pi/4) q0[30];
-cx q0[28],q0[30];
-rz(pi/4) q0[30];
-cx q0[29],q0[30];
-rz(pi/4) q0[29];
-rz(-pi/4) q0[30];
-cx q0[28],q0[30];
-cx q0[28],q0[29];
-rz(pi/4) q0[28];
-rz(-pi/4) q0[29];
-cx q0[27],q0[29];
-rz(pi/2) q0[27];
-sx q0[27];
-rz(pi/2) q0[27];
-cx q0[26],q0[27];
-rz(-pi/4) q0[27];
-cx q0[24],q0[27];
-rz(pi/4) q0[27];
-cx q0[26],q0[27];
-rz(pi/4) q0[26];
-rz(-pi/4) q0[27];
-cx q0[24],q0[27];
-cx q0[24],q0[26];
-rz(pi/4) q0[24];
-rz(-pi/4) q0[26];
-cx q0[24],q0[26];
-cx q0[25],q0[26];
-rz(pi/4) q0[27];
-cx q0[26],q0[27];
-rz(-pi/4) q0[27];
-cx q0[25],q0[27];
-rz(pi/4) q0[27];
-cx q0[26],q0[27];
-rz(pi/4) q0[26];
-rz(-pi/4) q0[27];
-cx q0[25],q0[27];
-cx q0[25],q0[26];
-rz(pi/4) q0[25];
-rz(-pi/4) q0[26];
-cx q0[24],q0[26];
-rz(pi/2) q0[24];
-sx q0[24];
-rz(pi/2) q0[24];
-cx q0[23],q0[24];
-rz(-pi/4) q0[24];
-cx q0[21],q0[24];
-rz(pi/4) q0[24];
-cx q0[23],q0[24];
-rz(pi/4) q0[23];
-rz(-pi/4) q0[24];
-cx q0[21],q0[24];
-cx q0[21],q0[23];
-rz(pi/4) q0[21];
-rz(-pi/4) q0[23];
-cx q0[21],q0[23];
-cx q0[22],q0[23];
-rz(pi/4) q0[24];
-cx q0[23],q0[24];
-rz(-pi/4) q0[24];
-cx q0[22],q0[24];
-rz(pi/4) q0[24];
-cx q0[23],q0[24];
-rz(pi/4) q0[23];
-rz(-pi/4) q0[24];
-cx q0[22],q0[24];
-cx q0[22],q0[23];
-rz(pi/4) q0[22];
-rz(-pi/4) q0[23];
-cx q0[21],q0[23];
-rz(pi/2) q0[21];
-sx q0[21];
-rz(pi/2) q0[21];
-cx q0[20],q0[21];
-rz(-pi/4) q0[21];
-cx q0[18],q0[21];
-rz(pi/4) q0[21];
-cx q0[20],q0[21];
-rz(pi/4) q0[20];
-rz(-pi/4) q0[21];
-cx q0[18],q0[21];
-cx q0[18],q0[20];
-rz(pi/4) q0[18];
-rz(-pi/4) q0[20];
-cx q0[18],q0[20];
-cx q0[19],q0[20];
-rz(pi/4) q0[21];
-cx q0[20],q0[21];
-rz(-pi/4) q0[21];
-cx q0[19],q0[21];
-rz(pi/4) q0[21];
-cx q0[20],q0[21];
-rz(pi/4) q0[20];
-rz(-pi/4) q0[21];
-cx q0[19],q0[21];
-cx q0[19],q0[20];
-rz(pi/4) q0[19];
-rz(-pi/4) q0[20];
-cx q0[18],q0[20];
-rz(pi/2) q0[18];
-sx q0[18];
-rz(pi/2) q0[18];
-cx q0[17],q0[18];
-rz(-pi/4) q0[18];
-cx q0[15],q0[18];
-rz(pi/4) q0[18];
-cx q0[17],q0[18];
-rz(pi/4) q0[17];
-rz(-pi/4) q0[18];
-cx q0[15],q0[18];
-cx q0[15],q0[17];
-rz(pi/4) q0[15];
-rz(-pi/4) q0[17];
-cx q0[15],q0[17];
-cx q0[16],q0[17];
-rz(pi/4) q0[18];
-cx q0[17],q0[18];
-rz(-pi/4) q0[18];
-cx q0[16],q0[18];
-rz(pi/4) q0[18];
-cx q0[17],q0[18];
-rz(pi/4) q0[17];
-rz(-pi/4) q0[18];
-cx q0[16],q0[18];
-cx q0[16],q0[17];
-rz(pi/4) q0[16];
-rz(-pi/4) q0[17];
-cx q0[15],q0[17];
-rz(pi/2) q0[15];
-sx q0[15];
-rz(pi/2) q0[15];
-cx q0[14],q0[15];
-rz(-pi/4) q0[15];
-cx q0[12],q0[15];
-rz(pi/4) q0[15];
-cx q0[14],q0[15];
-rz(pi/4) q0[14];
-rz(-pi/4) q0[15];
-cx q0[12],q0[15];
-cx q0[12],q0[14];
-rz(pi/4) q0[12];
-rz(-pi/4) q0[14];
-cx q0[12],q0[14];
-cx q0[13],q0[14];
-rz(pi/4) q0[15];
-cx q0[14],q0[15];
-rz(-pi/4) q0[15];
-cx q0[13],q0[15];
-rz(pi/4) q0[15];
-cx q0[14],q0[15];
-rz(pi/4) q0[14];
-rz(-pi/4) q0[15];
-cx q0[13],q0[15];
-cx q0[13],q0[14];
-rz(pi/4) q0[13];
-rz(-pi/4) q0[14];
-cx q0[12],q0[14];
-rz(pi/2) q0[12];
-sx q0[12];
-rz(pi/2) q0[12];
-cx q0[11],q0[12];
-rz(-pi/4) q0[12];
-rz(3*pi/4) q0[15];
-sx q0[15];
-rz(pi/2) q0[15];
-rz(3*pi/4) q0[18];
-sx q0[18];
-rz(pi/2) q0[18];
-rz(3*pi/4) q0[21];
-sx q0[21];
-rz(pi/2) q0[21];
-rz(3*pi/4) q0[24];
-sx q0[24];
-rz(pi/2) q0[24];
-rz(3*pi/4) q0[27];
-sx q0[27];
-rz(pi/2) q0[27];
-rz(3*pi/4) q0[30];
-sx q0[30];
-rz(pi/2) q0[30];
-rz(3*pi/4) q0[33];
-sx q0[33];
-rz(pi/2) q0[33];
-rz(3*pi/4) q0[36];
-sx q0[36];
-rz(pi/2) q0[36];
-rz(3*pi/4) q0[39];
-sx q0[39];
-rz(pi/2) q0[39];
-rz(3*pi/4) q0[42];
-sx q0[42];
-rz(pi/2) q0[42];
-rz(pi/2) q0[43];
-sx q0[43];
-rz(pi/2) q0[43];
-cx q0[74],q0[45];
-rz(-pi/4) q0[45];
-rz(pi/4) q0[74];
-cx q0[74],q0[45];
-cx q0[45],q0[43];
-rz(-pi/4) q0[43];
-cx q0[74],q0[43];
-rz(pi/4) q0[43];
-cx q0[45],q0[43];
-rz(-pi/4) q0[43];
-rz(pi/4) q0[45];
-cx q0[74],q0[43];
-rz(3*pi/4) q0[43];
-sx q0[43];
-rz(pi/2) q0[43];
-cx q0[74],q0[45];
-rz(-pi/4) q0[45];
-rz(pi/4) q0[74];
-cx q0[74],q0[45];
-cx q0[9],q0[12];
-rz(pi/4) q0[12];
-cx q0[11],q0[12];
-rz(pi/4) q0[11];
-rz(-pi/4) q0[12];
-cx q0[9],q0[12];
-rz(pi/4) q0[12];
-cx q0[9],q0[11];
-rz(-pi/4) q0[11];
-rz(pi/4) q0[9];
-cx q0[9],q0[11];
-cx q0[10],q0[11];
-cx q0[11],q0[12];
-rz(-pi/4) q0[12];
-cx q0[10],q0[12];
-rz(pi/4) q0[12];
-cx q0[11],q0[12];
-rz(pi/4) q0[11];
-rz(-pi/4) q0[12];
-cx q0[10],q0[12];
-cx q0[10],q0[11];
-rz(pi/4) q0[10];
-rz(-pi/4) q0[11];
-rz(3*pi/4) q0[12];
-sx q0[12];
-rz(pi/2) q0[12];
-cx q0[9],q0[11];
-rz(pi/2) q0[9];
-sx q0[9];
-rz(pi/2) q0[9];
-cx q0[8],q0[9];
-rz(-pi/4) q0[9];
-cx q0[6],q0[9];
-rz(pi/4) q0[9];
-cx q0[8],q0[9];
-rz(pi/4) q0[8];
-rz(-pi/4) q0[9];
-cx q0[6],q0[9];
-cx q0[6],q0[8];
-rz(pi/4) q0[6];
-rz(-pi/4) q0[8];
-cx q0[6],q0[8];
-cx q0[7],q0[8];
-rz(pi/4) q0[9];
-cx q0[8],q0[9];
-rz(-pi/4) q0[9];
-cx q0[7],q0[9];
-rz(pi/4) q0[9];
-cx q0[8],q0[9];
-rz(pi/4) q0[8];
-rz(-pi/4) q0[9];
-cx q0[7],q0[9];
-cx q0[7],q0[8];
-rz(pi/4) q0[7];
-rz(-pi/4) q0[8];
-cx q0[6],q0[8];
-rz(pi/2) q0[6];
-sx q0[6];
-rz(pi/2) q0[6];
-cx q0[5],q0[6];
-rz(-pi/4) q0[6];
-cx q0[3],q0[6];
-rz(pi/4) q0[6];
-cx q0[5],q0[6];
-rz(pi/4) q0[5];
-rz(-pi/4) q0[6];
-cx q0[3],q0[6];
-cx q0[3],q0[5];
-rz(pi/4) q0[3];
-rz(-pi/4) q0[5];
-cx q0[3],q0[5];
-cx q0[4],q0[5];
-rz(pi/4) q0[6];
-cx q0[5],q0[6];
-rz(-pi/4) q0[6];
-cx q0[4],q0[6];
-rz(pi/4) q0[6];
-cx q0[5],q0[6];
-rz(pi/4) q0[5];
-rz(-pi/4) q0[6];
-cx q0[4],q0[6];
-cx q0[4],q0[5];
-rz(pi/4) q0[4];
-rz(-pi/4) q0[5];
-cx q0[3],q0[5];
-rz(pi/2) q0[3];
-sx q0[3];
-rz(pi/2) q0[3];
-cx q0[2],q0[3];
-rz(-pi/4) q0[3];
-cx q0[0],q0[3];
-rz(pi/4) q0[3];
-cx q0[2],q0[3];
-rz(pi/4) q0[2];
-rz(-pi/4) q0[3];
-cx q0[0],q0[3];
-cx q0[0],q0[2];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[2];
-cx q0[0],q0[2];
-cx q0[1],q0[2];
-rz(pi/4) q0[3];
-cx q0[2],q0[3];
-rz(-pi/4) q0[3];
-cx q0[1],q0[3];
-rz(pi/4) q0[3];
-cx q0[2],q0[3];
-rz(pi/4) q0[2];
-rz(-pi/4) q0[3];
-cx q0[1],q0[3];
-cx q0[1],q0[2];
-rz(pi/4) q0[1];
-rz(-pi/4) q0[2];
-cx q0[0],q0[2];
-rz(3*pi/4) q0[3];
-sx q0[3];
-rz(pi/2) q0[3];
-rz(3*pi/4) q0[6];
-sx q0[6];
-rz(pi/2) q0[6];
-rz(3*pi/4) q0[9];
-sx q0[9];
-rz(pi/2) q0[9];
-measure q0[2] -> c0[0];
-measure q0[5] -> c0[1];
-measure q0[8] -> c0[2];
-measure q0[11] -> c0[3];
-measure q0[14] -> c0[4];
-measure q0[17] -> c0[5];
-measure q0[20] -> c0[6];
-measure q0[23] -> c0[7];
-measure q0[26] -> c0[8];
-measure q0[29] -> c0[9];
-measure q0[32] -> c0[10];
-measure q0[35] -> c0[11];
-measure q0[38] -> c0[12];
-measure q0[41] -> c0[13];
-measure q0[44] -> c0[14];
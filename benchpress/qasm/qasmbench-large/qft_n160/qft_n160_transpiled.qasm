@@ -1,28546 +0,0 @@
-OPENQASM 2.0;
-include "qelib1.inc";
-qreg q[160];
-creg c[160];
-creg meas[160];
-rz(pi/2) q[0];
-sx q[0];
-rz(pi/2) q[0];
-rz(pi/4) q[1];
-cx q[1],q[0];
-rz(-pi/4) q[0];
-cx q[1],q[0];
-rz(pi/4) q[0];
-rz(pi/2) q[1];
-sx q[1];
-rz(pi/2) q[1];
-rz(pi/8) q[2];
-cx q[2],q[0];
-rz(-pi/8) q[0];
-cx q[2],q[0];
-rz(pi/8) q[0];
-rz(pi/4) q[2];
-cx q[2],q[1];
-rz(-pi/4) q[1];
-cx q[2],q[1];
-rz(pi/4) q[1];
-rz(pi/2) q[2];
-sx q[2];
-rz(pi/2) q[2];
-rz(pi/16) q[3];
-cx q[3],q[0];
-rz(-pi/16) q[0];
-cx q[3],q[0];
-rz(pi/16) q[0];
-rz(pi/8) q[3];
-cx q[3],q[1];
-rz(-pi/8) q[1];
-cx q[3],q[1];
-rz(pi/8) q[1];
-rz(pi/4) q[3];
-cx q[3],q[2];
-rz(-pi/4) q[2];
-cx q[3],q[2];
-rz(pi/4) q[2];
-rz(pi/2) q[3];
-sx q[3];
-rz(pi/2) q[3];
-rz(pi/32) q[4];
-cx q[4],q[0];
-rz(-pi/32) q[0];
-cx q[4],q[0];
-rz(pi/32) q[0];
-rz(pi/16) q[4];
-cx q[4],q[1];
-rz(-pi/16) q[1];
-cx q[4],q[1];
-rz(pi/16) q[1];
-rz(pi/8) q[4];
-cx q[4],q[2];
-rz(-pi/8) q[2];
-cx q[4],q[2];
-rz(pi/8) q[2];
-rz(pi/4) q[4];
-cx q[4],q[3];
-rz(-pi/4) q[3];
-cx q[4],q[3];
-rz(pi/4) q[3];
-rz(pi/2) q[4];
-sx q[4];
-rz(pi/2) q[4];
-rz(pi/64) q[5];
-cx q[5],q[0];
-rz(-pi/64) q[0];
-cx q[5],q[0];
-rz(pi/64) q[0];
-rz(pi/32) q[5];
-cx q[5],q[1];
-rz(-pi/32) q[1];
-cx q[5],q[1];
-rz(pi/32) q[1];
-rz(pi/16) q[5];
-cx q[5],q[2];
-rz(-pi/16) q[2];
-cx q[5],q[2];
-rz(pi/16) q[2];
-rz(pi/8) q[5];
-cx q[5],q[3];
-rz(-pi/8) q[3];
-cx q[5],q[3];
-rz(pi/8) q[3];
-rz(pi/4) q[5];
-cx q[5],q[4];
-rz(-pi/4) q[4];
-cx q[5],q[4];
-rz(pi/4) q[4];
-rz(pi/2) q[5];
-sx q[5];
-rz(pi/2) q[5];
-rz(pi/128) q[6];
-cx q[6],q[0];
-rz(-pi/128) q[0];
-cx q[6],q[0];
-rz(pi/128) q[0];
-rz(pi/64) q[6];
-cx q[6],q[1];
-rz(-pi/64) q[1];
-cx q[6],q[1];
-rz(pi/64) q[1];
-rz(pi/32) q[6];
-cx q[6],q[2];
-rz(-pi/32) q[2];
-cx q[6],q[2];
-rz(pi/32) q[2];
-rz(pi/16) q[6];
-cx q[6],q[3];
-rz(-pi/16) q[3];
-cx q[6],q[3];
-rz(pi/16) q[3];
-rz(pi/8) q[6];
-cx q[6],q[4];
-rz(-pi/8) q[4];
-cx q[6],q[4];
-rz(pi/8) q[4];
-rz(pi/4) q[6];
-cx q[6],q[5];
-rz(-pi/4) q[5];
-cx q[6],q[5];
-rz(pi/4) q[5];
-rz(pi/2) q[6];
-sx q[6];
-rz(pi/2) q[6];
-rz(pi/256) q[7];
-cx q[7],q[0];
-rz(-pi/256) q[0];
-cx q[7],q[0];
-rz(pi/256) q[0];
-rz(pi/128) q[7];
-cx q[7],q[1];
-rz(-pi/128) q[1];
-cx q[7],q[1];
-rz(pi/128) q[1];
-rz(pi/64) q[7];
-cx q[7],q[2];
-rz(-pi/64) q[2];
-cx q[7],q[2];
-rz(pi/64) q[2];
-rz(pi/32) q[7];
-cx q[7],q[3];
-rz(-pi/32) q[3];
-cx q[7],q[3];
-rz(pi/32) q[3];
-rz(pi/16) q[7];
-cx q[7],q[4];
-rz(-pi/16) q[4];
-cx q[7],q[4];
-rz(pi/16) q[4];
-rz(pi/8) q[7];
-cx q[7],q[5];
-rz(-pi/8) q[5];
-cx q[7],q[5];
-rz(pi/8) q[5];
-rz(pi/4) q[7];
-cx q[7],q[6];
-rz(-pi/4) q[6];
-cx q[7],q[6];
-rz(pi/4) q[6];
-rz(pi/2) q[7];
-sx q[7];
-rz(pi/2) q[7];
-rz(pi/512) q[8];
-cx q[8],q[0];
-rz(-pi/512) q[0];
-cx q[8],q[0];
-rz(pi/512) q[0];
-rz(pi/256) q[8];
-cx q[8],q[1];
-rz(-pi/256) q[1];
-cx q[8],q[1];
-rz(pi/256) q[1];
-rz(pi/128) q[8];
-cx q[8],q[2];
-rz(-pi/128) q[2];
-cx q[8],q[2];
-rz(pi/128) q[2];
-rz(pi/64) q[8];
-cx q[8],q[3];
-rz(-pi/64) q[3];
-cx q[8],q[3];
-rz(pi/64) q[3];
-rz(pi/32) q[8];
-cx q[8],q[4];
-rz(-pi/32) q[4];
-cx q[8],q[4];
-rz(pi/32) q[4];
-rz(pi/16) q[8];
-cx q[8],q[5];
-rz(-pi/16) q[5];
-cx q[8],q[5];
-rz(pi/16) q[5];
-rz(pi/8) q[8];
-cx q[8],q[6];
-rz(-pi/8) q[6];
-cx q[8],q[6];
-rz(pi/8) q[6];
-rz(pi/4) q[8];
-cx q[8],q[7];
-rz(-pi/4) q[7];
-cx q[8],q[7];
-rz(pi/4) q[7];
-rz(pi/2) q[8];
-sx q[8];
-rz(pi/2) q[8];
-rz(pi/1024) q[9];
-cx q[9],q[0];
-rz(-pi/1024) q[0];
-cx q[9],q[0];
-rz(pi/1024) q[0];
-rz(pi/512) q[9];
-cx q[9],q[1];
-rz(-pi/512) q[1];
-cx q[9],q[1];
-rz(pi/512) q[1];
-rz(pi/256) q[9];
-cx q[9],q[2];
-rz(-pi/256) q[2];
-cx q[9],q[2];
-rz(pi/256) q[2];
-rz(pi/128) q[9];
-cx q[9],q[3];
-rz(-pi/128) q[3];
-cx q[9],q[3];
-rz(pi/128) q[3];
-rz(pi/64) q[9];
-cx q[9],q[4];
-rz(-pi/64) q[4];
-cx q[9],q[4];
-rz(pi/64) q[4];
-rz(pi/32) q[9];
-cx q[9],q[5];
-rz(-pi/32) q[5];
-cx q[9],q[5];
-rz(pi/32) q[5];
-rz(pi/16) q[9];
-cx q[9],q[6];
-rz(-pi/16) q[6];
-cx q[9],q[6];
-rz(pi/16) q[6];
-rz(pi/8) q[9];
-cx q[9],q[7];
-rz(-pi/8) q[7];
-cx q[9],q[7];
-rz(pi/8) q[7];
-rz(pi/4) q[9];
-cx q[9],q[8];
-rz(-pi/4) q[8];
-cx q[9],q[8];
-rz(pi/4) q[8];
-rz(pi/2) q[9];
-sx q[9];
-rz(pi/2) q[9];
-rz(pi/2048) q[10];
-cx q[10],q[0];
-rz(-pi/2048) q[0];
-cx q[10],q[0];
-rz(pi/2048) q[0];
-rz(pi/1024) q[10];
-cx q[10],q[1];
-rz(-pi/1024) q[1];
-cx q[10],q[1];
-rz(pi/1024) q[1];
-rz(pi/512) q[10];
-cx q[10],q[2];
-rz(-pi/512) q[2];
-cx q[10],q[2];
-rz(pi/256) q[10];
-cx q[10],q[3];
-rz(pi/512) q[2];
-rz(-pi/256) q[3];
-cx q[10],q[3];
-rz(pi/128) q[10];
-cx q[10],q[4];
-rz(pi/256) q[3];
-rz(-pi/128) q[4];
-cx q[10],q[4];
-rz(pi/64) q[10];
-cx q[10],q[5];
-rz(pi/128) q[4];
-rz(-pi/64) q[5];
-cx q[10],q[5];
-rz(pi/32) q[10];
-cx q[10],q[6];
-rz(pi/64) q[5];
-rz(-pi/32) q[6];
-cx q[10],q[6];
-rz(pi/16) q[10];
-cx q[10],q[7];
-rz(pi/32) q[6];
-rz(-pi/16) q[7];
-cx q[10],q[7];
-rz(pi/8) q[10];
-cx q[10],q[8];
-rz(pi/16) q[7];
-rz(-pi/8) q[8];
-cx q[10],q[8];
-rz(pi/4) q[10];
-cx q[10],q[9];
-rz(pi/8) q[8];
-rz(-pi/4) q[9];
-cx q[10],q[9];
-rz(pi/2) q[10];
-sx q[10];
-rz(pi/2) q[10];
-rz(pi/4) q[9];
-rz(pi/4096) q[11];
-cx q[11],q[0];
-rz(-pi/4096) q[0];
-cx q[11],q[0];
-rz(pi/4096) q[0];
-rz(pi/2048) q[11];
-cx q[11],q[1];
-rz(-pi/2048) q[1];
-cx q[11],q[1];
-rz(pi/2048) q[1];
-rz(pi/1024) q[11];
-cx q[11],q[2];
-rz(-pi/1024) q[2];
-cx q[11],q[2];
-rz(pi/512) q[11];
-cx q[11],q[3];
-rz(pi/1024) q[2];
-rz(-pi/512) q[3];
-cx q[11],q[3];
-rz(pi/256) q[11];
-cx q[11],q[4];
-rz(pi/512) q[3];
-rz(-pi/256) q[4];
-cx q[11],q[4];
-rz(pi/128) q[11];
-cx q[11],q[5];
-rz(pi/256) q[4];
-rz(-pi/128) q[5];
-cx q[11],q[5];
-rz(pi/64) q[11];
-cx q[11],q[6];
-rz(pi/128) q[5];
-rz(-pi/64) q[6];
-cx q[11],q[6];
-rz(pi/32) q[11];
-cx q[11],q[7];
-rz(pi/64) q[6];
-rz(-pi/32) q[7];
-cx q[11],q[7];
-rz(pi/16) q[11];
-cx q[11],q[8];
-rz(pi/32) q[7];
-rz(-pi/16) q[8];
-cx q[11],q[8];
-rz(pi/8) q[11];
-cx q[11],q[9];
-rz(pi/16) q[8];
-rz(-pi/8) q[9];
-cx q[11],q[9];
-rz(pi/4) q[11];
-cx q[11],q[10];
-rz(-pi/4) q[10];
-cx q[11],q[10];
-rz(pi/4) q[10];
-rz(pi/2) q[11];
-sx q[11];
-rz(pi/2) q[11];
-rz(pi/8) q[9];
-rz(pi/8192) q[12];
-cx q[12],q[0];
-rz(-pi/8192) q[0];
-cx q[12],q[0];
-rz(pi/8192) q[0];
-rz(pi/4096) q[12];
-cx q[12],q[1];
-rz(-pi/4096) q[1];
-cx q[12],q[1];
-rz(pi/4096) q[1];
-rz(pi/2048) q[12];
-cx q[12],q[2];
-rz(-pi/2048) q[2];
-cx q[12],q[2];
-rz(pi/1024) q[12];
-cx q[12],q[3];
-rz(pi/2048) q[2];
-rz(-pi/1024) q[3];
-cx q[12],q[3];
-rz(pi/512) q[12];
-cx q[12],q[4];
-rz(pi/1024) q[3];
-rz(-pi/512) q[4];
-cx q[12],q[4];
-rz(pi/256) q[12];
-cx q[12],q[5];
-rz(pi/512) q[4];
-rz(-pi/256) q[5];
-cx q[12],q[5];
-rz(pi/128) q[12];
-cx q[12],q[6];
-rz(pi/256) q[5];
-rz(-pi/128) q[6];
-cx q[12],q[6];
-rz(pi/64) q[12];
-cx q[12],q[7];
-rz(pi/128) q[6];
-rz(-pi/64) q[7];
-cx q[12],q[7];
-rz(pi/32) q[12];
-cx q[12],q[8];
-rz(pi/64) q[7];
-rz(-pi/32) q[8];
-cx q[12],q[8];
-rz(pi/16) q[12];
-cx q[12],q[9];
-rz(pi/32) q[8];
-rz(-pi/16) q[9];
-cx q[12],q[9];
-rz(pi/8) q[12];
-cx q[12],q[10];
-rz(-pi/8) q[10];
-cx q[12],q[10];
-rz(pi/8) q[10];
-rz(pi/4) q[12];
-cx q[12],q[11];
-rz(-pi/4) q[11];
-cx q[12],q[11];
-rz(pi/4) q[11];
-rz(pi/2) q[12];
-sx q[12];
-rz(pi/2) q[12];
-rz(pi/16) q[9];
-rz(pi/16384) q[13];
-cx q[13],q[0];
-rz(-pi/16384) q[0];
-cx q[13],q[0];
-rz(pi/16384) q[0];
-rz(pi/8192) q[13];
-cx q[13],q[1];
-rz(-pi/8192) q[1];
-cx q[13],q[1];
-rz(pi/8192) q[1];
-rz(pi/4096) q[13];
-cx q[13],q[2];
-rz(-pi/4096) q[2];
-cx q[13],q[2];
-rz(pi/2048) q[13];
-cx q[13],q[3];
-rz(pi/4096) q[2];
-rz(-pi/2048) q[3];
-cx q[13],q[3];
-rz(pi/1024) q[13];
-cx q[13],q[4];
-rz(pi/2048) q[3];
-rz(-pi/1024) q[4];
-cx q[13],q[4];
-rz(pi/512) q[13];
-cx q[13],q[5];
-rz(pi/1024) q[4];
-rz(-pi/512) q[5];
-cx q[13],q[5];
-rz(pi/256) q[13];
-cx q[13],q[6];
-rz(pi/512) q[5];
-rz(-pi/256) q[6];
-cx q[13],q[6];
-rz(pi/128) q[13];
-cx q[13],q[7];
-rz(pi/256) q[6];
-rz(-pi/128) q[7];
-cx q[13],q[7];
-rz(pi/64) q[13];
-cx q[13],q[8];
-rz(pi/128) q[7];
-rz(-pi/64) q[8];
-cx q[13],q[8];
-rz(pi/32) q[13];
-cx q[13],q[9];
-rz(pi/64) q[8];
-rz(-pi/32) q[9];
-cx q[13],q[9];
-rz(pi/16) q[13];
-cx q[13],q[10];
-rz(-pi/16) q[10];
-cx q[13],q[10];
-rz(pi/16) q[10];
-rz(pi/8) q[13];
-cx q[13],q[11];
-rz(-pi/8) q[11];
-cx q[13],q[11];
-rz(pi/8) q[11];
-rz(pi/4) q[13];
-cx q[13],q[12];
-rz(-pi/4) q[12];
-cx q[13],q[12];
-rz(pi/4) q[12];
-rz(pi/2) q[13];
-sx q[13];
-rz(pi/2) q[13];
-rz(pi/32) q[9];
-rz(pi/32768) q[14];
-cx q[14],q[0];
-rz(-pi/32768) q[0];
-cx q[14],q[0];
-rz(pi/32768) q[0];
-rz(pi/16384) q[14];
-cx q[14],q[1];
-rz(-pi/16384) q[1];
-cx q[14],q[1];
-rz(pi/16384) q[1];
-rz(pi/8192) q[14];
-cx q[14],q[2];
-rz(-pi/8192) q[2];
-cx q[14],q[2];
-rz(pi/4096) q[14];
-cx q[14],q[3];
-rz(pi/8192) q[2];
-rz(-pi/4096) q[3];
-cx q[14],q[3];
-rz(pi/2048) q[14];
-cx q[14],q[4];
-rz(pi/4096) q[3];
-rz(-pi/2048) q[4];
-cx q[14],q[4];
-rz(pi/1024) q[14];
-cx q[14],q[5];
-rz(pi/2048) q[4];
-rz(-pi/1024) q[5];
-cx q[14],q[5];
-rz(pi/512) q[14];
-cx q[14],q[6];
-rz(pi/1024) q[5];
-rz(-pi/512) q[6];
-cx q[14],q[6];
-rz(pi/256) q[14];
-cx q[14],q[7];
-rz(pi/512) q[6];
-rz(-pi/256) q[7];
-cx q[14],q[7];
-rz(pi/128) q[14];
-cx q[14],q[8];
-rz(pi/256) q[7];
-rz(-pi/128) q[8];
-cx q[14],q[8];
-rz(pi/64) q[14];
-cx q[14],q[9];
-rz(pi/128) q[8];
-rz(-pi/64) q[9];
-cx q[14],q[9];
-rz(pi/32) q[14];
-cx q[14],q[10];
-rz(-pi/32) q[10];
-cx q[14],q[10];
-rz(pi/32) q[10];
-rz(pi/16) q[14];
-cx q[14],q[11];
-rz(-pi/16) q[11];
-cx q[14],q[11];
-rz(pi/16) q[11];
-rz(pi/8) q[14];
-cx q[14],q[12];
-rz(-pi/8) q[12];
-cx q[14],q[12];
-rz(pi/8) q[12];
-rz(pi/4) q[14];
-cx q[14],q[13];
-rz(-pi/4) q[13];
-cx q[14],q[13];
-rz(pi/4) q[13];
-rz(pi/2) q[14];
-sx q[14];
-rz(pi/2) q[14];
-rz(pi/64) q[9];
-rz(pi/65536) q[15];
-cx q[15],q[0];
-rz(-pi/65536) q[0];
-cx q[15],q[0];
-rz(pi/65536) q[0];
-rz(pi/32768) q[15];
-cx q[15],q[1];
-rz(-pi/32768) q[1];
-cx q[15],q[1];
-rz(pi/32768) q[1];
-rz(pi/16384) q[15];
-cx q[15],q[2];
-rz(-pi/16384) q[2];
-cx q[15],q[2];
-rz(pi/8192) q[15];
-cx q[15],q[3];
-rz(pi/16384) q[2];
-rz(-pi/8192) q[3];
-cx q[15],q[3];
-rz(pi/4096) q[15];
-cx q[15],q[4];
-rz(pi/8192) q[3];
-rz(-pi/4096) q[4];
-cx q[15],q[4];
-rz(pi/2048) q[15];
-cx q[15],q[5];
-rz(pi/4096) q[4];
-rz(-pi/2048) q[5];
-cx q[15],q[5];
-rz(pi/1024) q[15];
-cx q[15],q[6];
-rz(pi/2048) q[5];
-rz(-pi/1024) q[6];
-cx q[15],q[6];
-rz(pi/512) q[15];
-cx q[15],q[7];
-rz(pi/1024) q[6];
-rz(-pi/512) q[7];
-cx q[15],q[7];
-rz(pi/256) q[15];
-cx q[15],q[8];
-rz(pi/512) q[7];
-rz(-pi/256) q[8];
-cx q[15],q[8];
-rz(pi/128) q[15];
-cx q[15],q[9];
-rz(pi/256) q[8];
-rz(-pi/128) q[9];
-cx q[15],q[9];
-rz(pi/64) q[15];
-cx q[15],q[10];
-rz(-pi/64) q[10];
-cx q[15],q[10];
-rz(pi/64) q[10];
-rz(pi/32) q[15];
-cx q[15],q[11];
-rz(-pi/32) q[11];
-cx q[15],q[11];
-rz(pi/32) q[11];
-rz(pi/16) q[15];
-cx q[15],q[12];
-rz(-pi/16) q[12];
-cx q[15],q[12];
-rz(pi/16) q[12];
-rz(pi/8) q[15];
-cx q[15],q[13];
-rz(-pi/8) q[13];
-cx q[15],q[13];
-rz(pi/8) q[13];
-rz(pi/4) q[15];
-cx q[15],q[14];
-rz(-pi/4) q[14];
-cx q[15],q[14];
-rz(pi/4) q[14];
-rz(pi/2) q[15];
-sx q[15];
-rz(pi/2) q[15];
-rz(pi/128) q[9];
-rz(pi/131072) q[16];
-cx q[16],q[0];
-rz(-pi/131072) q[0];
-cx q[16],q[0];
-rz(pi/131072) q[0];
-rz(pi/65536) q[16];
-cx q[16],q[1];
-rz(-pi/65536) q[1];
-cx q[16],q[1];
-rz(pi/65536) q[1];
-rz(pi/32768) q[16];
-cx q[16],q[2];
-rz(-pi/32768) q[2];
-cx q[16],q[2];
-rz(pi/16384) q[16];
-cx q[16],q[3];
-rz(pi/32768) q[2];
-rz(-pi/16384) q[3];
-cx q[16],q[3];
-rz(pi/8192) q[16];
-cx q[16],q[4];
-rz(pi/16384) q[3];
-rz(-pi/8192) q[4];
-cx q[16],q[4];
-rz(pi/4096) q[16];
-cx q[16],q[5];
-rz(pi/8192) q[4];
-rz(-pi/4096) q[5];
-cx q[16],q[5];
-rz(pi/2048) q[16];
-cx q[16],q[6];
-rz(pi/4096) q[5];
-rz(-pi/2048) q[6];
-cx q[16],q[6];
-rz(pi/1024) q[16];
-cx q[16],q[7];
-rz(pi/2048) q[6];
-rz(-pi/1024) q[7];
-cx q[16],q[7];
-rz(pi/512) q[16];
-cx q[16],q[8];
-rz(pi/1024) q[7];
-rz(-pi/512) q[8];
-cx q[16],q[8];
-rz(pi/256) q[16];
-cx q[16],q[9];
-rz(pi/512) q[8];
-rz(-pi/256) q[9];
-cx q[16],q[9];
-rz(pi/128) q[16];
-cx q[16],q[10];
-rz(-pi/128) q[10];
-cx q[16],q[10];
-rz(pi/128) q[10];
-rz(pi/64) q[16];
-cx q[16],q[11];
-rz(-pi/64) q[11];
-cx q[16],q[11];
-rz(pi/64) q[11];
-rz(pi/32) q[16];
-cx q[16],q[12];
-rz(-pi/32) q[12];
-cx q[16],q[12];
-rz(pi/32) q[12];
-rz(pi/16) q[16];
-cx q[16],q[13];
-rz(-pi/16) q[13];
-cx q[16],q[13];
-rz(pi/16) q[13];
-rz(pi/8) q[16];
-cx q[16],q[14];
-rz(-pi/8) q[14];
-cx q[16],q[14];
-rz(pi/8) q[14];
-rz(pi/4) q[16];
-cx q[16],q[15];
-rz(-pi/4) q[15];
-cx q[16],q[15];
-rz(pi/4) q[15];
-rz(pi/2) q[16];
-sx q[16];
-rz(pi/2) q[16];
-rz(pi/256) q[9];
-rz(pi/262144) q[17];
-cx q[17],q[0];
-rz(-pi/262144) q[0];
-cx q[17],q[0];
-rz(pi/262144) q[0];
-rz(pi/131072) q[17];
-cx q[17],q[1];
-rz(-pi/131072) q[1];
-cx q[17],q[1];
-rz(pi/131072) q[1];
-rz(pi/65536) q[17];
-cx q[17],q[2];
-rz(-pi/65536) q[2];
-cx q[17],q[2];
-rz(pi/32768) q[17];
-cx q[17],q[3];
-rz(pi/65536) q[2];
-rz(-pi/32768) q[3];
-cx q[17],q[3];
-rz(pi/16384) q[17];
-cx q[17],q[4];
-rz(pi/32768) q[3];
-rz(-pi/16384) q[4];
-cx q[17],q[4];
-rz(pi/8192) q[17];
-cx q[17],q[5];
-rz(pi/16384) q[4];
-rz(-pi/8192) q[5];
-cx q[17],q[5];
-rz(pi/4096) q[17];
-cx q[17],q[6];
-rz(pi/8192) q[5];
-rz(-pi/4096) q[6];
-cx q[17],q[6];
-rz(pi/2048) q[17];
-cx q[17],q[7];
-rz(pi/4096) q[6];
-rz(-pi/2048) q[7];
-cx q[17],q[7];
-rz(pi/1024) q[17];
-cx q[17],q[8];
-rz(pi/2048) q[7];
-rz(-pi/1024) q[8];
-cx q[17],q[8];
-rz(pi/512) q[17];
-cx q[17],q[9];
-rz(pi/1024) q[8];
-rz(-pi/512) q[9];
-cx q[17],q[9];
-rz(pi/256) q[17];
-cx q[17],q[10];
-rz(-pi/256) q[10];
-cx q[17],q[10];
-rz(pi/256) q[10];
-rz(pi/128) q[17];
-cx q[17],q[11];
-rz(-pi/128) q[11];
-cx q[17],q[11];
-rz(pi/128) q[11];
-rz(pi/64) q[17];
-cx q[17],q[12];
-rz(-pi/64) q[12];
-cx q[17],q[12];
-rz(pi/64) q[12];
-rz(pi/32) q[17];
-cx q[17],q[13];
-rz(-pi/32) q[13];
-cx q[17],q[13];
-rz(pi/32) q[13];
-rz(pi/16) q[17];
-cx q[17],q[14];
-rz(-pi/16) q[14];
-cx q[17],q[14];
-rz(pi/16) q[14];
-rz(pi/8) q[17];
-cx q[17],q[15];
-rz(-pi/8) q[15];
-cx q[17],q[15];
-rz(pi/8) q[15];
-rz(pi/4) q[17];
-cx q[17],q[16];
-rz(-pi/4) q[16];
-cx q[17],q[16];
-rz(pi/4) q[16];
-rz(pi/2) q[17];
-sx q[17];
-rz(pi/2) q[17];
-rz(pi/512) q[9];
-rz(pi/524288) q[18];
-cx q[18],q[0];
-rz(-pi/524288) q[0];
-cx q[18],q[0];
-rz(pi/524288) q[0];
-rz(pi/262144) q[18];
-cx q[18],q[1];
-rz(-pi/262144) q[1];
-cx q[18],q[1];
-rz(pi/262144) q[1];
-rz(pi/131072) q[18];
-cx q[18],q[2];
-rz(-pi/131072) q[2];
-cx q[18],q[2];
-rz(pi/65536) q[18];
-cx q[18],q[3];
-rz(pi/131072) q[2];
-rz(-pi/65536) q[3];
-cx q[18],q[3];
-rz(pi/32768) q[18];
-cx q[18],q[4];
-rz(pi/65536) q[3];
-rz(-pi/32768) q[4];
-cx q[18],q[4];
-rz(pi/16384) q[18];
-cx q[18],q[5];
-rz(pi/32768) q[4];
-rz(-pi/16384) q[5];
-cx q[18],q[5];
-rz(pi/8192) q[18];
-cx q[18],q[6];
-rz(pi/16384) q[5];
-rz(-pi/8192) q[6];
-cx q[18],q[6];
-rz(pi/4096) q[18];
-cx q[18],q[7];
-rz(pi/8192) q[6];
-rz(-pi/4096) q[7];
-cx q[18],q[7];
-rz(pi/2048) q[18];
-cx q[18],q[8];
-rz(pi/4096) q[7];
-rz(-pi/2048) q[8];
-cx q[18],q[8];
-rz(pi/1024) q[18];
-cx q[18],q[9];
-rz(pi/2048) q[8];
-rz(-pi/1024) q[9];
-cx q[18],q[9];
-rz(pi/512) q[18];
-cx q[18],q[10];
-rz(-pi/512) q[10];
-cx q[18],q[10];
-rz(pi/512) q[10];
-rz(pi/256) q[18];
-cx q[18],q[11];
-rz(-pi/256) q[11];
-cx q[18],q[11];
-rz(pi/256) q[11];
-rz(pi/128) q[18];
-cx q[18],q[12];
-rz(-pi/128) q[12];
-cx q[18],q[12];
-rz(pi/128) q[12];
-rz(pi/64) q[18];
-cx q[18],q[13];
-rz(-pi/64) q[13];
-cx q[18],q[13];
-rz(pi/64) q[13];
-rz(pi/32) q[18];
-cx q[18],q[14];
-rz(-pi/32) q[14];
-cx q[18],q[14];
-rz(pi/32) q[14];
-rz(pi/16) q[18];
-cx q[18],q[15];
-rz(-pi/16) q[15];
-cx q[18],q[15];
-rz(pi/16) q[15];
-rz(pi/8) q[18];
-cx q[18],q[16];
-rz(-pi/8) q[16];
-cx q[18],q[16];
-rz(pi/8) q[16];
-rz(pi/4) q[18];
-cx q[18],q[17];
-rz(-pi/4) q[17];
-cx q[18],q[17];
-rz(pi/4) q[17];
-rz(pi/2) q[18];
-sx q[18];
-rz(pi/2) q[18];
-rz(pi/1024) q[9];
-rz(pi/1048576) q[19];
-cx q[19],q[0];
-rz(-pi/1048576) q[0];
-cx q[19],q[0];
-rz(pi/1048576) q[0];
-rz(pi/524288) q[19];
-cx q[19],q[1];
-rz(-pi/524288) q[1];
-cx q[19],q[1];
-rz(pi/524288) q[1];
-rz(pi/262144) q[19];
-cx q[19],q[2];
-rz(-pi/262144) q[2];
-cx q[19],q[2];
-rz(pi/131072) q[19];
-cx q[19],q[3];
-rz(pi/262144) q[2];
-rz(-pi/131072) q[3];
-cx q[19],q[3];
-rz(pi/65536) q[19];
-cx q[19],q[4];
-rz(pi/131072) q[3];
-rz(-pi/65536) q[4];
-cx q[19],q[4];
-rz(pi/32768) q[19];
-cx q[19],q[5];
-rz(pi/65536) q[4];
-rz(-pi/32768) q[5];
-cx q[19],q[5];
-rz(pi/16384) q[19];
-cx q[19],q[6];
-rz(pi/32768) q[5];
-rz(-pi/16384) q[6];
-cx q[19],q[6];
-rz(pi/8192) q[19];
-cx q[19],q[7];
-rz(pi/16384) q[6];
-rz(-pi/8192) q[7];
-cx q[19],q[7];
-rz(pi/4096) q[19];
-cx q[19],q[8];
-rz(pi/8192) q[7];
-rz(-pi/4096) q[8];
-cx q[19],q[8];
-rz(pi/2048) q[19];
-cx q[19],q[9];
-rz(pi/4096) q[8];
-rz(-pi/2048) q[9];
-cx q[19],q[9];
-rz(pi/1024) q[19];
-cx q[19],q[10];
-rz(-pi/1024) q[10];
-cx q[19],q[10];
-rz(pi/1024) q[10];
-rz(pi/512) q[19];
-cx q[19],q[11];
-rz(-pi/512) q[11];
-cx q[19],q[11];
-rz(pi/512) q[11];
-rz(pi/256) q[19];
-cx q[19],q[12];
-rz(-pi/256) q[12];
-cx q[19],q[12];
-rz(pi/256) q[12];
-rz(pi/128) q[19];
-cx q[19],q[13];
-rz(-pi/128) q[13];
-cx q[19],q[13];
-rz(pi/128) q[13];
-rz(pi/64) q[19];
-cx q[19],q[14];
-rz(-pi/64) q[14];
-cx q[19],q[14];
-rz(pi/64) q[14];
-rz(pi/32) q[19];
-cx q[19],q[15];
-rz(-pi/32) q[15];
-cx q[19],q[15];
-rz(pi/32) q[15];
-rz(pi/16) q[19];
-cx q[19],q[16];
-rz(-pi/16) q[16];
-cx q[19],q[16];
-rz(pi/16) q[16];
-rz(pi/8) q[19];
-cx q[19],q[17];
-rz(-pi/8) q[17];
-cx q[19],q[17];
-rz(pi/8) q[17];
-rz(pi/4) q[19];
-cx q[19],q[18];
-rz(-pi/4) q[18];
-cx q[19],q[18];
-rz(pi/4) q[18];
-rz(pi/2) q[19];
-sx q[19];
-rz(pi/2) q[19];
-rz(pi/2048) q[9];
-rz(pi/2097152) q[20];
-cx q[20],q[0];
-rz(-pi/2097152) q[0];
-cx q[20],q[0];
-rz(pi/2097152) q[0];
-rz(pi/1048576) q[20];
-cx q[20],q[1];
-rz(-pi/1048576) q[1];
-cx q[20],q[1];
-rz(pi/1048576) q[1];
-rz(pi/524288) q[20];
-cx q[20],q[2];
-rz(-pi/524288) q[2];
-cx q[20],q[2];
-rz(pi/524288) q[2];
-rz(pi/262144) q[20];
-cx q[20],q[3];
-rz(-pi/262144) q[3];
-cx q[20],q[3];
-rz(pi/131072) q[20];
-cx q[20],q[4];
-rz(pi/262144) q[3];
-rz(-pi/131072) q[4];
-cx q[20],q[4];
-rz(pi/65536) q[20];
-cx q[20],q[5];
-rz(pi/131072) q[4];
-rz(-pi/65536) q[5];
-cx q[20],q[5];
-rz(pi/32768) q[20];
-cx q[20],q[6];
-rz(pi/65536) q[5];
-rz(-pi/32768) q[6];
-cx q[20],q[6];
-rz(pi/16384) q[20];
-cx q[20],q[7];
-rz(pi/32768) q[6];
-rz(-pi/16384) q[7];
-cx q[20],q[7];
-rz(pi/8192) q[20];
-cx q[20],q[8];
-rz(pi/16384) q[7];
-rz(-pi/8192) q[8];
-cx q[20],q[8];
-rz(pi/4096) q[20];
-cx q[20],q[9];
-rz(pi/8192) q[8];
-rz(-pi/4096) q[9];
-cx q[20],q[9];
-rz(pi/2048) q[20];
-cx q[20],q[10];
-rz(-pi/2048) q[10];
-cx q[20],q[10];
-rz(pi/2048) q[10];
-rz(pi/1024) q[20];
-cx q[20],q[11];
-rz(-pi/1024) q[11];
-cx q[20],q[11];
-rz(pi/1024) q[11];
-rz(pi/512) q[20];
-cx q[20],q[12];
-rz(-pi/512) q[12];
-cx q[20],q[12];
-rz(pi/512) q[12];
-rz(pi/256) q[20];
-cx q[20],q[13];
-rz(-pi/256) q[13];
-cx q[20],q[13];
-rz(pi/256) q[13];
-rz(pi/128) q[20];
-cx q[20],q[14];
-rz(-pi/128) q[14];
-cx q[20],q[14];
-rz(pi/128) q[14];
-rz(pi/64) q[20];
-cx q[20],q[15];
-rz(-pi/64) q[15];
-cx q[20],q[15];
-rz(pi/64) q[15];
-rz(pi/32) q[20];
-cx q[20],q[16];
-rz(-pi/32) q[16];
-cx q[20],q[16];
-rz(pi/32) q[16];
-rz(pi/16) q[20];
-cx q[20],q[17];
-rz(-pi/16) q[17];
-cx q[20],q[17];
-rz(pi/16) q[17];
-rz(pi/8) q[20];
-cx q[20],q[18];
-rz(-pi/8) q[18];
-cx q[20],q[18];
-rz(pi/8) q[18];
-rz(pi/4) q[20];
-cx q[20],q[19];
-rz(-pi/4) q[19];
-cx q[20],q[19];
-rz(pi/4) q[19];
-rz(pi/2) q[20];
-sx q[20];
-rz(pi/2) q[20];
-rz(pi/4096) q[9];
-rz(pi/4194304) q[21];
-cx q[21],q[0];
-rz(-pi/4194304) q[0];
-cx q[21],q[0];
-rz(pi/4194304) q[0];
-rz(pi/2097152) q[21];
-cx q[21],q[1];
-rz(-pi/2097152) q[1];
-cx q[21],q[1];
-rz(pi/2097152) q[1];
-rz(pi/1048576) q[21];
-cx q[21],q[2];
-rz(-pi/1048576) q[2];
-cx q[21],q[2];
-rz(pi/1048576) q[2];
-rz(pi/524288) q[21];
-cx q[21],q[3];
-rz(-pi/524288) q[3];
-cx q[21],q[3];
-rz(pi/262144) q[21];
-cx q[21],q[4];
-rz(pi/524288) q[3];
-rz(-pi/262144) q[4];
-cx q[21],q[4];
-rz(pi/131072) q[21];
-cx q[21],q[5];
-rz(pi/262144) q[4];
-rz(-pi/131072) q[5];
-cx q[21],q[5];
-rz(pi/65536) q[21];
-cx q[21],q[6];
-rz(pi/131072) q[5];
-rz(-pi/65536) q[6];
-cx q[21],q[6];
-rz(pi/32768) q[21];
-cx q[21],q[7];
-rz(pi/65536) q[6];
-rz(-pi/32768) q[7];
-cx q[21],q[7];
-rz(pi/16384) q[21];
-cx q[21],q[8];
-rz(pi/32768) q[7];
-rz(-pi/16384) q[8];
-cx q[21],q[8];
-rz(pi/8192) q[21];
-cx q[21],q[9];
-rz(pi/16384) q[8];
-rz(-pi/8192) q[9];
-cx q[21],q[9];
-rz(pi/4096) q[21];
-cx q[21],q[10];
-rz(-pi/4096) q[10];
-cx q[21],q[10];
-rz(pi/4096) q[10];
-rz(pi/2048) q[21];
-cx q[21],q[11];
-rz(-pi/2048) q[11];
-cx q[21],q[11];
-rz(pi/2048) q[11];
-rz(pi/1024) q[21];
-cx q[21],q[12];
-rz(-pi/1024) q[12];
-cx q[21],q[12];
-rz(pi/1024) q[12];
-rz(pi/512) q[21];
-cx q[21],q[13];
-rz(-pi/512) q[13];
-cx q[21],q[13];
-rz(pi/512) q[13];
-rz(pi/256) q[21];
-cx q[21],q[14];
-rz(-pi/256) q[14];
-cx q[21],q[14];
-rz(pi/256) q[14];
-rz(pi/128) q[21];
-cx q[21],q[15];
-rz(-pi/128) q[15];
-cx q[21],q[15];
-rz(pi/128) q[15];
-rz(pi/64) q[21];
-cx q[21],q[16];
-rz(-pi/64) q[16];
-cx q[21],q[16];
-rz(pi/64) q[16];
-rz(pi/32) q[21];
-cx q[21],q[17];
-rz(-pi/32) q[17];
-cx q[21],q[17];
-rz(pi/32) q[17];
-rz(pi/16) q[21];
-cx q[21],q[18];
-rz(-pi/16) q[18];
-cx q[21],q[18];
-rz(pi/16) q[18];
-rz(pi/8) q[21];
-cx q[21],q[19];
-rz(-pi/8) q[19];
-cx q[21],q[19];
-rz(pi/8) q[19];
-rz(pi/4) q[21];
-cx q[21],q[20];
-rz(-pi/4) q[20];
-cx q[21],q[20];
-rz(pi/4) q[20];
-rz(pi/2) q[21];
-sx q[21];
-rz(pi/2) q[21];
-rz(pi/8192) q[9];
-rz(pi/8388608) q[22];
-cx q[22],q[0];
-rz(-pi/8388608) q[0];
-cx q[22],q[0];
-rz(pi/8388608) q[0];
-rz(pi/4194304) q[22];
-cx q[22],q[1];
-rz(-pi/4194304) q[1];
-cx q[22],q[1];
-rz(pi/4194304) q[1];
-rz(pi/2097152) q[22];
-cx q[22],q[2];
-rz(-pi/2097152) q[2];
-cx q[22],q[2];
-rz(pi/2097152) q[2];
-rz(pi/1048576) q[22];
-cx q[22],q[3];
-rz(-pi/1048576) q[3];
-cx q[22],q[3];
-rz(pi/524288) q[22];
-cx q[22],q[4];
-rz(pi/1048576) q[3];
-rz(-pi/524288) q[4];
-cx q[22],q[4];
-rz(pi/262144) q[22];
-cx q[22],q[5];
-rz(pi/524288) q[4];
-rz(-pi/262144) q[5];
-cx q[22],q[5];
-rz(pi/131072) q[22];
-cx q[22],q[6];
-rz(pi/262144) q[5];
-rz(-pi/131072) q[6];
-cx q[22],q[6];
-rz(pi/65536) q[22];
-cx q[22],q[7];
-rz(pi/131072) q[6];
-rz(-pi/65536) q[7];
-cx q[22],q[7];
-rz(pi/32768) q[22];
-cx q[22],q[8];
-rz(pi/65536) q[7];
-rz(-pi/32768) q[8];
-cx q[22],q[8];
-rz(pi/16384) q[22];
-cx q[22],q[9];
-rz(pi/32768) q[8];
-rz(-pi/16384) q[9];
-cx q[22],q[9];
-rz(pi/8192) q[22];
-cx q[22],q[10];
-rz(-pi/8192) q[10];
-cx q[22],q[10];
-rz(pi/8192) q[10];
-rz(pi/4096) q[22];
-cx q[22],q[11];
-rz(-pi/4096) q[11];
-cx q[22],q[11];
-rz(pi/4096) q[11];
-rz(pi/2048) q[22];
-cx q[22],q[12];
-rz(-pi/2048) q[12];
-cx q[22],q[12];
-rz(pi/2048) q[12];
-rz(pi/1024) q[22];
-cx q[22],q[13];
-rz(-pi/1024) q[13];
-cx q[22],q[13];
-rz(pi/1024) q[13];
-rz(pi/512) q[22];
-cx q[22],q[14];
-rz(-pi/512) q[14];
-cx q[22],q[14];
-rz(pi/512) q[14];
-rz(pi/256) q[22];
-cx q[22],q[15];
-rz(-pi/256) q[15];
-cx q[22],q[15];
-rz(pi/256) q[15];
-rz(pi/128) q[22];
-cx q[22],q[16];
-rz(-pi/128) q[16];
-cx q[22],q[16];
-rz(pi/128) q[16];
-rz(pi/64) q[22];
-cx q[22],q[17];
-rz(-pi/64) q[17];
-cx q[22],q[17];
-rz(pi/64) q[17];
-rz(pi/32) q[22];
-cx q[22],q[18];
-rz(-pi/32) q[18];
-cx q[22],q[18];
-rz(pi/32) q[18];
-rz(pi/16) q[22];
-cx q[22],q[19];
-rz(-pi/16) q[19];
-cx q[22],q[19];
-rz(pi/16) q[19];
-rz(pi/8) q[22];
-cx q[22],q[20];
-rz(-pi/8) q[20];
-cx q[22],q[20];
-rz(pi/8) q[20];
-rz(pi/4) q[22];
-cx q[22],q[21];
-rz(-pi/4) q[21];
-cx q[22],q[21];
-rz(pi/4) q[21];
-rz(pi/2) q[22];
-sx q[22];
-rz(pi/2) q[22];
-rz(pi/16384) q[9];
-rz(pi/16777216) q[23];
-cx q[23],q[0];
-rz(-pi/16777216) q[0];
-cx q[23],q[0];
-rz(pi/16777216) q[0];
-rz(pi/8388608) q[23];
-cx q[23],q[1];
-rz(-pi/8388608) q[1];
-cx q[23],q[1];
-rz(pi/8388608) q[1];
-rz(pi/4194304) q[23];
-cx q[23],q[2];
-rz(-pi/4194304) q[2];
-cx q[23],q[2];
-rz(pi/4194304) q[2];
-rz(pi/2097152) q[23];
-cx q[23],q[3];
-rz(-pi/2097152) q[3];
-cx q[23],q[3];
-rz(pi/1048576) q[23];
-cx q[23],q[4];
-rz(pi/2097152) q[3];
-rz(-pi/1048576) q[4];
-cx q[23],q[4];
-rz(pi/524288) q[23];
-cx q[23],q[5];
-rz(pi/1048576) q[4];
-rz(-pi/524288) q[5];
-cx q[23],q[5];
-rz(pi/262144) q[23];
-cx q[23],q[6];
-rz(pi/524288) q[5];
-rz(-pi/262144) q[6];
-cx q[23],q[6];
-rz(pi/131072) q[23];
-cx q[23],q[7];
-rz(pi/262144) q[6];
-rz(-pi/131072) q[7];
-cx q[23],q[7];
-rz(pi/65536) q[23];
-cx q[23],q[8];
-rz(pi/131072) q[7];
-rz(-pi/65536) q[8];
-cx q[23],q[8];
-rz(pi/32768) q[23];
-cx q[23],q[9];
-rz(pi/65536) q[8];
-rz(-pi/32768) q[9];
-cx q[23],q[9];
-rz(pi/16384) q[23];
-cx q[23],q[10];
-rz(-pi/16384) q[10];
-cx q[23],q[10];
-rz(pi/16384) q[10];
-rz(pi/8192) q[23];
-cx q[23],q[11];
-rz(-pi/8192) q[11];
-cx q[23],q[11];
-rz(pi/8192) q[11];
-rz(pi/4096) q[23];
-cx q[23],q[12];
-rz(-pi/4096) q[12];
-cx q[23],q[12];
-rz(pi/4096) q[12];
-rz(pi/2048) q[23];
-cx q[23],q[13];
-rz(-pi/2048) q[13];
-cx q[23],q[13];
-rz(pi/2048) q[13];
-rz(pi/1024) q[23];
-cx q[23],q[14];
-rz(-pi/1024) q[14];
-cx q[23],q[14];
-rz(pi/1024) q[14];
-rz(pi/512) q[23];
-cx q[23],q[15];
-rz(-pi/512) q[15];
-cx q[23],q[15];
-rz(pi/512) q[15];
-rz(pi/256) q[23];
-cx q[23],q[16];
-rz(-pi/256) q[16];
-cx q[23],q[16];
-rz(pi/256) q[16];
-rz(pi/128) q[23];
-cx q[23],q[17];
-rz(-pi/128) q[17];
-cx q[23],q[17];
-rz(pi/128) q[17];
-rz(pi/64) q[23];
-cx q[23],q[18];
-rz(-pi/64) q[18];
-cx q[23],q[18];
-rz(pi/64) q[18];
-rz(pi/32) q[23];
-cx q[23],q[19];
-rz(-pi/32) q[19];
-cx q[23],q[19];
-rz(pi/32) q[19];
-rz(pi/16) q[23];
-cx q[23],q[20];
-rz(-pi/16) q[20];
-cx q[23],q[20];
-rz(pi/16) q[20];
-rz(pi/8) q[23];
-cx q[23],q[21];
-rz(-pi/8) q[21];
-cx q[23],q[21];
-rz(pi/8) q[21];
-rz(pi/4) q[23];
-cx q[23],q[22];
-rz(-pi/4) q[22];
-cx q[23],q[22];
-rz(pi/4) q[22];
-rz(pi/2) q[23];
-sx q[23];
-rz(pi/2) q[23];
-rz(pi/32768) q[9];
-rz(pi/33554432) q[24];
-cx q[24],q[0];
-rz(-pi/33554432) q[0];
-cx q[24],q[0];
-rz(pi/33554432) q[0];
-rz(pi/16777216) q[24];
-cx q[24],q[1];
-rz(-pi/16777216) q[1];
-cx q[24],q[1];
-rz(pi/16777216) q[1];
-rz(pi/8388608) q[24];
-cx q[24],q[2];
-rz(-pi/8388608) q[2];
-cx q[24],q[2];
-rz(pi/8388608) q[2];
-rz(pi/4194304) q[24];
-cx q[24],q[3];
-rz(-pi/4194304) q[3];
-cx q[24],q[3];
-rz(pi/2097152) q[24];
-cx q[24],q[4];
-rz(pi/4194304) q[3];
-rz(-pi/2097152) q[4];
-cx q[24],q[4];
-rz(pi/1048576) q[24];
-cx q[24],q[5];
-rz(pi/2097152) q[4];
-rz(-pi/1048576) q[5];
-cx q[24],q[5];
-rz(pi/524288) q[24];
-cx q[24],q[6];
-rz(pi/1048576) q[5];
-rz(-pi/524288) q[6];
-cx q[24],q[6];
-rz(pi/262144) q[24];
-cx q[24],q[7];
-rz(pi/524288) q[6];
-rz(-pi/262144) q[7];
-cx q[24],q[7];
-rz(pi/131072) q[24];
-cx q[24],q[8];
-rz(pi/262144) q[7];
-rz(-pi/131072) q[8];
-cx q[24],q[8];
-rz(pi/65536) q[24];
-cx q[24],q[9];
-rz(pi/131072) q[8];
-rz(-pi/65536) q[9];
-cx q[24],q[9];
-rz(pi/32768) q[24];
-cx q[24],q[10];
-rz(-pi/32768) q[10];
-cx q[24],q[10];
-rz(pi/32768) q[10];
-rz(pi/16384) q[24];
-cx q[24],q[11];
-rz(-pi/16384) q[11];
-cx q[24],q[11];
-rz(pi/16384) q[11];
-rz(pi/8192) q[24];
-cx q[24],q[12];
-rz(-pi/8192) q[12];
-cx q[24],q[12];
-rz(pi/8192) q[12];
-rz(pi/4096) q[24];
-cx q[24],q[13];
-rz(-pi/4096) q[13];
-cx q[24],q[13];
-rz(pi/4096) q[13];
-rz(pi/2048) q[24];
-cx q[24],q[14];
-rz(-pi/2048) q[14];
-cx q[24],q[14];
-rz(pi/2048) q[14];
-rz(pi/1024) q[24];
-cx q[24],q[15];
-rz(-pi/1024) q[15];
-cx q[24],q[15];
-rz(pi/1024) q[15];
-rz(pi/512) q[24];
-cx q[24],q[16];
-rz(-pi/512) q[16];
-cx q[24],q[16];
-rz(pi/512) q[16];
-rz(pi/256) q[24];
-cx q[24],q[17];
-rz(-pi/256) q[17];
-cx q[24],q[17];
-rz(pi/256) q[17];
-rz(pi/128) q[24];
-cx q[24],q[18];
-rz(-pi/128) q[18];
-cx q[24],q[18];
-rz(pi/128) q[18];
-rz(pi/64) q[24];
-cx q[24],q[19];
-rz(-pi/64) q[19];
-cx q[24],q[19];
-rz(pi/64) q[19];
-rz(pi/32) q[24];
-cx q[24],q[20];
-rz(-pi/32) q[20];
-cx q[24],q[20];
-rz(pi/32) q[20];
-rz(pi/16) q[24];
-cx q[24],q[21];
-rz(-pi/16) q[21];
-cx q[24],q[21];
-rz(pi/16) q[21];
-rz(pi/8) q[24];
-cx q[24],q[22];
-rz(-pi/8) q[22];
-cx q[24],q[22];
-rz(pi/8) q[22];
-rz(pi/4) q[24];
-cx q[24],q[23];
-rz(-pi/4) q[23];
-cx q[24],q[23];
-rz(pi/4) q[23];
-rz(pi/2) q[24];
-sx q[24];
-rz(pi/2) q[24];
-rz(pi/65536) q[9];
-rz(pi/67108864) q[25];
-cx q[25],q[0];
-rz(-pi/67108864) q[0];
-cx q[25],q[0];
-rz(pi/67108864) q[0];
-rz(pi/33554432) q[25];
-cx q[25],q[1];
-rz(-pi/33554432) q[1];
-cx q[25],q[1];
-rz(pi/33554432) q[1];
-rz(pi/16777216) q[25];
-cx q[25],q[2];
-rz(-pi/16777216) q[2];
-cx q[25],q[2];
-rz(pi/16777216) q[2];
-rz(pi/8388608) q[25];
-cx q[25],q[3];
-rz(-pi/8388608) q[3];
-cx q[25],q[3];
-rz(pi/4194304) q[25];
-cx q[25],q[4];
-rz(pi/8388608) q[3];
-rz(-pi/4194304) q[4];
-cx q[25],q[4];
-rz(pi/2097152) q[25];
-cx q[25],q[5];
-rz(pi/4194304) q[4];
-rz(-pi/2097152) q[5];
-cx q[25],q[5];
-rz(pi/1048576) q[25];
-cx q[25],q[6];
-rz(pi/2097152) q[5];
-rz(-pi/1048576) q[6];
-cx q[25],q[6];
-rz(pi/524288) q[25];
-cx q[25],q[7];
-rz(pi/1048576) q[6];
-rz(-pi/524288) q[7];
-cx q[25],q[7];
-rz(pi/262144) q[25];
-cx q[25],q[8];
-rz(pi/524288) q[7];
-rz(-pi/262144) q[8];
-cx q[25],q[8];
-rz(pi/131072) q[25];
-cx q[25],q[9];
-rz(pi/262144) q[8];
-rz(-pi/131072) q[9];
-cx q[25],q[9];
-rz(pi/65536) q[25];
-cx q[25],q[10];
-rz(-pi/65536) q[10];
-cx q[25],q[10];
-rz(pi/65536) q[10];
-rz(pi/32768) q[25];
-cx q[25],q[11];
-rz(-pi/32768) q[11];
-cx q[25],q[11];
-rz(pi/32768) q[11];
-rz(pi/16384) q[25];
-cx q[25],q[12];
-rz(-pi/16384) q[12];
-cx q[25],q[12];
-rz(pi/16384) q[12];
-rz(pi/8192) q[25];
-cx q[25],q[13];
-rz(-pi/8192) q[13];
-cx q[25],q[13];
-rz(pi/8192) q[13];
-rz(pi/4096) q[25];
-cx q[25],q[14];
-rz(-pi/4096) q[14];
-cx q[25],q[14];
-rz(pi/4096) q[14];
-rz(pi/2048) q[25];
-cx q[25],q[15];
-rz(-pi/2048) q[15];
-cx q[25],q[15];
-rz(pi/2048) q[15];
-rz(pi/1024) q[25];
-cx q[25],q[16];
-rz(-pi/1024) q[16];
-cx q[25],q[16];
-rz(pi/1024) q[16];
-rz(pi/512) q[25];
-cx q[25],q[17];
-rz(-pi/512) q[17];
-cx q[25],q[17];
-rz(pi/512) q[17];
-rz(pi/256) q[25];
-cx q[25],q[18];
-rz(-pi/256) q[18];
-cx q[25],q[18];
-rz(pi/256) q[18];
-rz(pi/128) q[25];
-cx q[25],q[19];
-rz(-pi/128) q[19];
-cx q[25],q[19];
-rz(pi/128) q[19];
-rz(pi/64) q[25];
-cx q[25],q[20];
-rz(-pi/64) q[20];
-cx q[25],q[20];
-rz(pi/64) q[20];
-rz(pi/32) q[25];
-cx q[25],q[21];
-rz(-pi/32) q[21];
-cx q[25],q[21];
-rz(pi/32) q[21];
-rz(pi/16) q[25];
-cx q[25],q[22];
-rz(-pi/16) q[22];
-cx q[25],q[22];
-rz(pi/16) q[22];
-rz(pi/8) q[25];
-cx q[25],q[23];
-rz(-pi/8) q[23];
-cx q[25],q[23];
-rz(pi/8) q[23];
-rz(pi/4) q[25];
-cx q[25],q[24];
-rz(-pi/4) q[24];
-cx q[25],q[24];
-rz(pi/4) q[24];
-rz(pi/2) q[25];
-sx q[25];
-rz(pi/2) q[25];
-rz(pi/131072) q[9];
-rz(pi/134217728) q[26];
-cx q[26],q[0];
-rz(-pi/134217728) q[0];
-cx q[26],q[0];
-rz(pi/134217728) q[0];
-rz(pi/67108864) q[26];
-cx q[26],q[1];
-rz(-pi/67108864) q[1];
-cx q[26],q[1];
-rz(pi/67108864) q[1];
-rz(pi/33554432) q[26];
-cx q[26],q[2];
-rz(-pi/33554432) q[2];
-cx q[26],q[2];
-rz(pi/33554432) q[2];
-rz(pi/16777216) q[26];
-cx q[26],q[3];
-rz(-pi/16777216) q[3];
-cx q[26],q[3];
-rz(pi/8388608) q[26];
-cx q[26],q[4];
-rz(pi/16777216) q[3];
-rz(-pi/8388608) q[4];
-cx q[26],q[4];
-rz(pi/4194304) q[26];
-cx q[26],q[5];
-rz(pi/8388608) q[4];
-rz(-pi/4194304) q[5];
-cx q[26],q[5];
-rz(pi/2097152) q[26];
-cx q[26],q[6];
-rz(pi/4194304) q[5];
-rz(-pi/2097152) q[6];
-cx q[26],q[6];
-rz(pi/1048576) q[26];
-cx q[26],q[7];
-rz(pi/2097152) q[6];
-rz(-pi/1048576) q[7];
-cx q[26],q[7];
-rz(pi/524288) q[26];
-cx q[26],q[8];
-rz(pi/1048576) q[7];
-rz(-pi/524288) q[8];
-cx q[26],q[8];
-rz(pi/262144) q[26];
-cx q[26],q[9];
-rz(pi/524288) q[8];
-rz(-pi/262144) q[9];
-cx q[26],q[9];
-rz(pi/131072) q[26];
-cx q[26],q[10];
-rz(-pi/131072) q[10];
-cx q[26],q[10];
-rz(pi/131072) q[10];
-rz(pi/65536) q[26];
-cx q[26],q[11];
-rz(-pi/65536) q[11];
-cx q[26],q[11];
-rz(pi/65536) q[11];
-rz(pi/32768) q[26];
-cx q[26],q[12];
-rz(-pi/32768) q[12];
-cx q[26],q[12];
-rz(pi/32768) q[12];
-rz(pi/16384) q[26];
-cx q[26],q[13];
-rz(-pi/16384) q[13];
-cx q[26],q[13];
-rz(pi/16384) q[13];
-rz(pi/8192) q[26];
-cx q[26],q[14];
-rz(-pi/8192) q[14];
-cx q[26],q[14];
-rz(pi/8192) q[14];
-rz(pi/4096) q[26];
-cx q[26],q[15];
-rz(-pi/4096) q[15];
-cx q[26],q[15];
-rz(pi/4096) q[15];
-rz(pi/2048) q[26];
-cx q[26],q[16];
-rz(-pi/2048) q[16];
-cx q[26],q[16];
-rz(pi/2048) q[16];
-rz(pi/1024) q[26];
-cx q[26],q[17];
-rz(-pi/1024) q[17];
-cx q[26],q[17];
-rz(pi/1024) q[17];
-rz(pi/512) q[26];
-cx q[26],q[18];
-rz(-pi/512) q[18];
-cx q[26],q[18];
-rz(pi/512) q[18];
-rz(pi/256) q[26];
-cx q[26],q[19];
-rz(-pi/256) q[19];
-cx q[26],q[19];
-rz(pi/256) q[19];
-rz(pi/128) q[26];
-cx q[26],q[20];
-rz(-pi/128) q[20];
-cx q[26],q[20];
-rz(pi/128) q[20];
-rz(pi/64) q[26];
-cx q[26],q[21];
-rz(-pi/64) q[21];
-cx q[26],q[21];
-rz(pi/64) q[21];
-rz(pi/32) q[26];
-cx q[26],q[22];
-rz(-pi/32) q[22];
-cx q[26],q[22];
-rz(pi/32) q[22];
-rz(pi/16) q[26];
-cx q[26],q[23];
-rz(-pi/16) q[23];
-cx q[26],q[23];
-rz(pi/16) q[23];
-rz(pi/8) q[26];
-cx q[26],q[24];
-rz(-pi/8) q[24];
-cx q[26],q[24];
-rz(pi/8) q[24];
-rz(pi/4) q[26];
-cx q[26],q[25];
-rz(-pi/4) q[25];
-cx q[26],q[25];
-rz(pi/4) q[25];
-rz(pi/2) q[26];
-sx q[26];
-rz(pi/2) q[26];
-rz(pi/262144) q[9];
-rz(pi/268435456) q[27];
-cx q[27],q[0];
-rz(-pi/268435456) q[0];
-cx q[27],q[0];
-rz(pi/268435456) q[0];
-rz(pi/134217728) q[27];
-cx q[27],q[1];
-rz(-pi/134217728) q[1];
-cx q[27],q[1];
-rz(pi/134217728) q[1];
-rz(pi/67108864) q[27];
-cx q[27],q[2];
-rz(-pi/67108864) q[2];
-cx q[27],q[2];
-rz(pi/67108864) q[2];
-rz(pi/33554432) q[27];
-cx q[27],q[3];
-rz(-pi/33554432) q[3];
-cx q[27],q[3];
-rz(pi/16777216) q[27];
-cx q[27],q[4];
-rz(pi/33554432) q[3];
-rz(-pi/16777216) q[4];
-cx q[27],q[4];
-rz(pi/8388608) q[27];
-cx q[27],q[5];
-rz(pi/16777216) q[4];
-rz(-pi/8388608) q[5];
-cx q[27],q[5];
-rz(pi/4194304) q[27];
-cx q[27],q[6];
-rz(pi/8388608) q[5];
-rz(-pi/4194304) q[6];
-cx q[27],q[6];
-rz(pi/2097152) q[27];
-cx q[27],q[7];
-rz(pi/4194304) q[6];
-rz(-pi/2097152) q[7];
-cx q[27],q[7];
-rz(pi/1048576) q[27];
-cx q[27],q[8];
-rz(pi/2097152) q[7];
-rz(-pi/1048576) q[8];
-cx q[27],q[8];
-rz(pi/524288) q[27];
-cx q[27],q[9];
-rz(pi/1048576) q[8];
-rz(-pi/524288) q[9];
-cx q[27],q[9];
-rz(pi/262144) q[27];
-cx q[27],q[10];
-rz(-pi/262144) q[10];
-cx q[27],q[10];
-rz(pi/262144) q[10];
-rz(pi/131072) q[27];
-cx q[27],q[11];
-rz(-pi/131072) q[11];
-cx q[27],q[11];
-rz(pi/131072) q[11];
-rz(pi/65536) q[27];
-cx q[27],q[12];
-rz(-pi/65536) q[12];
-cx q[27],q[12];
-rz(pi/65536) q[12];
-rz(pi/32768) q[27];
-cx q[27],q[13];
-rz(-pi/32768) q[13];
-cx q[27],q[13];
-rz(pi/32768) q[13];
-rz(pi/16384) q[27];
-cx q[27],q[14];
-rz(-pi/16384) q[14];
-cx q[27],q[14];
-rz(pi/16384) q[14];
-rz(pi/8192) q[27];
-cx q[27],q[15];
-rz(-pi/8192) q[15];
-cx q[27],q[15];
-rz(pi/8192) q[15];
-rz(pi/4096) q[27];
-cx q[27],q[16];
-rz(-pi/4096) q[16];
-cx q[27],q[16];
-rz(pi/4096) q[16];
-rz(pi/2048) q[27];
-cx q[27],q[17];
-rz(-pi/2048) q[17];
-cx q[27],q[17];
-rz(pi/2048) q[17];
-rz(pi/1024) q[27];
-cx q[27],q[18];
-rz(-pi/1024) q[18];
-cx q[27],q[18];
-rz(pi/1024) q[18];
-rz(pi/512) q[27];
-cx q[27],q[19];
-rz(-pi/512) q[19];
-cx q[27],q[19];
-rz(pi/512) q[19];
-rz(pi/256) q[27];
-cx q[27],q[20];
-rz(-pi/256) q[20];
-cx q[27],q[20];
-rz(pi/256) q[20];
-rz(pi/128) q[27];
-cx q[27],q[21];
-rz(-pi/128) q[21];
-cx q[27],q[21];
-rz(pi/128) q[21];
-rz(pi/64) q[27];
-cx q[27],q[22];
-rz(-pi/64) q[22];
-cx q[27],q[22];
-rz(pi/64) q[22];
-rz(pi/32) q[27];
-cx q[27],q[23];
-rz(-pi/32) q[23];
-cx q[27],q[23];
-rz(pi/32) q[23];
-rz(pi/16) q[27];
-cx q[27],q[24];
-rz(-pi/16) q[24];
-cx q[27],q[24];
-rz(pi/16) q[24];
-rz(pi/8) q[27];
-cx q[27],q[25];
-rz(-pi/8) q[25];
-cx q[27],q[25];
-rz(pi/8) q[25];
-rz(pi/4) q[27];
-cx q[27],q[26];
-rz(-pi/4) q[26];
-cx q[27],q[26];
-rz(pi/4) q[26];
-rz(pi/2) q[27];
-sx q[27];
-rz(pi/2) q[27];
-rz(pi/524288) q[9];
-rz(pi/536870912) q[28];
-cx q[28],q[0];
-rz(-pi/536870912) q[0];
-cx q[28],q[0];
-rz(pi/536870912) q[0];
-rz(pi/268435456) q[28];
-cx q[28],q[1];
-rz(-pi/268435456) q[1];
-cx q[28],q[1];
-rz(pi/268435456) q[1];
-rz(pi/134217728) q[28];
-cx q[28],q[2];
-rz(-pi/134217728) q[2];
-cx q[28],q[2];
-rz(pi/134217728) q[2];
-rz(pi/67108864) q[28];
-cx q[28],q[3];
-rz(-pi/67108864) q[3];
-cx q[28],q[3];
-rz(pi/33554432) q[28];
-cx q[28],q[4];
-rz(pi/67108864) q[3];
-rz(-pi/33554432) q[4];
-cx q[28],q[4];
-rz(pi/16777216) q[28];
-cx q[28],q[5];
-rz(pi/33554432) q[4];
-rz(-pi/16777216) q[5];
-cx q[28],q[5];
-rz(pi/8388608) q[28];
-cx q[28],q[6];
-rz(pi/16777216) q[5];
-rz(-pi/8388608) q[6];
-cx q[28],q[6];
-rz(pi/4194304) q[28];
-cx q[28],q[7];
-rz(pi/8388608) q[6];
-rz(-pi/4194304) q[7];
-cx q[28],q[7];
-rz(pi/2097152) q[28];
-cx q[28],q[8];
-rz(pi/4194304) q[7];
-rz(-pi/2097152) q[8];
-cx q[28],q[8];
-rz(pi/1048576) q[28];
-cx q[28],q[9];
-rz(pi/2097152) q[8];
-rz(-pi/1048576) q[9];
-cx q[28],q[9];
-rz(pi/524288) q[28];
-cx q[28],q[10];
-rz(-pi/524288) q[10];
-cx q[28],q[10];
-rz(pi/524288) q[10];
-rz(pi/262144) q[28];
-cx q[28],q[11];
-rz(-pi/262144) q[11];
-cx q[28],q[11];
-rz(pi/262144) q[11];
-rz(pi/131072) q[28];
-cx q[28],q[12];
-rz(-pi/131072) q[12];
-cx q[28],q[12];
-rz(pi/131072) q[12];
-rz(pi/65536) q[28];
-cx q[28],q[13];
-rz(-pi/65536) q[13];
-cx q[28],q[13];
-rz(pi/65536) q[13];
-rz(pi/32768) q[28];
-cx q[28],q[14];
-rz(-pi/32768) q[14];
-cx q[28],q[14];
-rz(pi/32768) q[14];
-rz(pi/16384) q[28];
-cx q[28],q[15];
-rz(-pi/16384) q[15];
-cx q[28],q[15];
-rz(pi/16384) q[15];
-rz(pi/8192) q[28];
-cx q[28],q[16];
-rz(-pi/8192) q[16];
-cx q[28],q[16];
-rz(pi/8192) q[16];
-rz(pi/4096) q[28];
-cx q[28],q[17];
-rz(-pi/4096) q[17];
-cx q[28],q[17];
-rz(pi/4096) q[17];
-rz(pi/2048) q[28];
-cx q[28],q[18];
-rz(-pi/2048) q[18];
-cx q[28],q[18];
-rz(pi/2048) q[18];
-rz(pi/1024) q[28];
-cx q[28],q[19];
-rz(-pi/1024) q[19];
-cx q[28],q[19];
-rz(pi/1024) q[19];
-rz(pi/512) q[28];
-cx q[28],q[20];
-rz(-pi/512) q[20];
-cx q[28],q[20];
-rz(pi/512) q[20];
-rz(pi/256) q[28];
-cx q[28],q[21];
-rz(-pi/256) q[21];
-cx q[28],q[21];
-rz(pi/256) q[21];
-rz(pi/128) q[28];
-cx q[28],q[22];
-rz(-pi/128) q[22];
-cx q[28],q[22];
-rz(pi/128) q[22];
-rz(pi/64) q[28];
-cx q[28],q[23];
-rz(-pi/64) q[23];
-cx q[28],q[23];
-rz(pi/64) q[23];
-rz(pi/32) q[28];
-cx q[28],q[24];
-rz(-pi/32) q[24];
-cx q[28],q[24];
-rz(pi/32) q[24];
-rz(pi/16) q[28];
-cx q[28],q[25];
-rz(-pi/16) q[25];
-cx q[28],q[25];
-rz(pi/16) q[25];
-rz(pi/8) q[28];
-cx q[28],q[26];
-rz(-pi/8) q[26];
-cx q[28],q[26];
-rz(pi/8) q[26];
-rz(pi/4) q[28];
-cx q[28],q[27];
-rz(-pi/4) q[27];
-cx q[28],q[27];
-rz(pi/4) q[27];
-rz(pi/2) q[28];
-sx q[28];
-rz(pi/2) q[28];
-rz(pi/1048576) q[9];
-rz(pi/1073741824) q[29];
-cx q[29],q[0];
-rz(-pi/1073741824) q[0];
-cx q[29],q[0];
-rz(pi/1073741824) q[0];
-rz(pi/536870912) q[29];
-cx q[29],q[1];
-rz(-pi/536870912) q[1];
-cx q[29],q[1];
-rz(pi/536870912) q[1];
-rz(pi/268435456) q[29];
-cx q[29],q[2];
-rz(-pi/268435456) q[2];
-cx q[29],q[2];
-rz(pi/268435456) q[2];
-rz(pi/134217728) q[29];
-cx q[29],q[3];
-rz(-pi/134217728) q[3];
-cx q[29],q[3];
-rz(pi/67108864) q[29];
-cx q[29],q[4];
-rz(pi/134217728) q[3];
-rz(-pi/67108864) q[4];
-cx q[29],q[4];
-rz(pi/33554432) q[29];
-cx q[29],q[5];
-rz(pi/67108864) q[4];
-rz(-pi/33554432) q[5];
-cx q[29],q[5];
-rz(pi/16777216) q[29];
-cx q[29],q[6];
-rz(pi/33554432) q[5];
-rz(-pi/16777216) q[6];
-cx q[29],q[6];
-rz(pi/8388608) q[29];
-cx q[29],q[7];
-rz(pi/16777216) q[6];
-rz(-pi/8388608) q[7];
-cx q[29],q[7];
-rz(pi/4194304) q[29];
-cx q[29],q[8];
-rz(pi/8388608) q[7];
-rz(-pi/4194304) q[8];
-cx q[29],q[8];
-rz(pi/2097152) q[29];
-cx q[29],q[9];
-rz(pi/4194304) q[8];
-rz(-pi/2097152) q[9];
-cx q[29],q[9];
-rz(pi/1048576) q[29];
-cx q[29],q[10];
-rz(-pi/1048576) q[10];
-cx q[29],q[10];
-rz(pi/1048576) q[10];
-rz(pi/524288) q[29];
-cx q[29],q[11];
-rz(-pi/524288) q[11];
-cx q[29],q[11];
-rz(pi/524288) q[11];
-rz(pi/262144) q[29];
-cx q[29],q[12];
-rz(-pi/262144) q[12];
-cx q[29],q[12];
-rz(pi/262144) q[12];
-rz(pi/131072) q[29];
-cx q[29],q[13];
-rz(-pi/131072) q[13];
-cx q[29],q[13];
-rz(pi/131072) q[13];
-rz(pi/65536) q[29];
-cx q[29],q[14];
-rz(-pi/65536) q[14];
-cx q[29],q[14];
-rz(pi/65536) q[14];
-rz(pi/32768) q[29];
-cx q[29],q[15];
-rz(-pi/32768) q[15];
-cx q[29],q[15];
-rz(pi/32768) q[15];
-rz(pi/16384) q[29];
-cx q[29],q[16];
-rz(-pi/16384) q[16];
-cx q[29],q[16];
-rz(pi/16384) q[16];
-rz(pi/8192) q[29];
-cx q[29],q[17];
-rz(-pi/8192) q[17];
-cx q[29],q[17];
-rz(pi/8192) q[17];
-rz(pi/4096) q[29];
-cx q[29],q[18];
-rz(-pi/4096) q[18];
-cx q[29],q[18];
-rz(pi/4096) q[18];
-rz(pi/2048) q[29];
-cx q[29],q[19];
-rz(-pi/2048) q[19];
-cx q[29],q[19];
-rz(pi/2048) q[19];
-rz(pi/1024) q[29];
-cx q[29],q[20];
-rz(-pi/1024) q[20];
-cx q[29],q[20];
-rz(pi/1024) q[20];
-rz(pi/512) q[29];
-cx q[29],q[21];
-rz(-pi/512) q[21];
-cx q[29],q[21];
-rz(pi/512) q[21];
-rz(pi/256) q[29];
-cx q[29],q[22];
-rz(-pi/256) q[22];
-cx q[29],q[22];
-rz(pi/256) q[22];
-rz(pi/128) q[29];
-cx q[29],q[23];
-rz(-pi/128) q[23];
-cx q[29],q[23];
-rz(pi/128) q[23];
-rz(pi/64) q[29];
-cx q[29],q[24];
-rz(-pi/64) q[24];
-cx q[29],q[24];
-rz(pi/64) q[24];
-rz(pi/32) q[29];
-cx q[29],q[25];
-rz(-pi/32) q[25];
-cx q[29],q[25];
-rz(pi/32) q[25];
-rz(pi/16) q[29];
-cx q[29],q[26];
-rz(-pi/16) q[26];
-cx q[29],q[26];
-rz(pi/16) q[26];
-rz(pi/8) q[29];
-cx q[29],q[27];
-rz(-pi/8) q[27];
-cx q[29],q[27];
-rz(pi/8) q[27];
-rz(pi/4) q[29];
-cx q[29],q[28];
-rz(-pi/4) q[28];
-cx q[29],q[28];
-rz(pi/4) q[28];
-rz(pi/2) q[29];
-sx q[29];
-rz(pi/2) q[29];
-rz(pi/2097152) q[9];
-rz(pi/2147483648) q[30];
-cx q[30],q[0];
-rz(-pi/2147483648) q[0];
-cx q[30],q[0];
-rz(pi/2147483648) q[0];
-rz(pi/1073741824) q[30];
-cx q[30],q[1];
-rz(-pi/1073741824) q[1];
-cx q[30],q[1];
-rz(pi/1073741824) q[1];
-rz(pi/536870912) q[30];
-cx q[30],q[2];
-rz(-pi/536870912) q[2];
-cx q[30],q[2];
-rz(pi/536870912) q[2];
-rz(pi/268435456) q[30];
-cx q[30],q[3];
-rz(-pi/268435456) q[3];
-cx q[30],q[3];
-rz(pi/268435456) q[3];
-rz(pi/134217728) q[30];
-cx q[30],q[4];
-rz(-pi/134217728) q[4];
-cx q[30],q[4];
-rz(pi/67108864) q[30];
-cx q[30],q[5];
-rz(pi/134217728) q[4];
-rz(-pi/67108864) q[5];
-cx q[30],q[5];
-rz(pi/33554432) q[30];
-cx q[30],q[6];
-rz(pi/67108864) q[5];
-rz(-pi/33554432) q[6];
-cx q[30],q[6];
-rz(pi/16777216) q[30];
-cx q[30],q[7];
-rz(pi/33554432) q[6];
-rz(-pi/16777216) q[7];
-cx q[30],q[7];
-rz(pi/8388608) q[30];
-cx q[30],q[8];
-rz(pi/16777216) q[7];
-rz(-pi/8388608) q[8];
-cx q[30],q[8];
-rz(pi/4194304) q[30];
-cx q[30],q[9];
-rz(pi/8388608) q[8];
-rz(-pi/4194304) q[9];
-cx q[30],q[9];
-rz(pi/2097152) q[30];
-cx q[30],q[10];
-rz(-pi/2097152) q[10];
-cx q[30],q[10];
-rz(pi/2097152) q[10];
-rz(pi/1048576) q[30];
-cx q[30],q[11];
-rz(-pi/1048576) q[11];
-cx q[30],q[11];
-rz(pi/1048576) q[11];
-rz(pi/524288) q[30];
-cx q[30],q[12];
-rz(-pi/524288) q[12];
-cx q[30],q[12];
-rz(pi/524288) q[12];
-rz(pi/262144) q[30];
-cx q[30],q[13];
-rz(-pi/262144) q[13];
-cx q[30],q[13];
-rz(pi/262144) q[13];
-rz(pi/131072) q[30];
-cx q[30],q[14];
-rz(-pi/131072) q[14];
-cx q[30],q[14];
-rz(pi/131072) q[14];
-rz(pi/65536) q[30];
-cx q[30],q[15];
-rz(-pi/65536) q[15];
-cx q[30],q[15];
-rz(pi/65536) q[15];
-rz(pi/32768) q[30];
-cx q[30],q[16];
-rz(-pi/32768) q[16];
-cx q[30],q[16];
-rz(pi/32768) q[16];
-rz(pi/16384) q[30];
-cx q[30],q[17];
-rz(-pi/16384) q[17];
-cx q[30],q[17];
-rz(pi/16384) q[17];
-rz(pi/8192) q[30];
-cx q[30],q[18];
-rz(-pi/8192) q[18];
-cx q[30],q[18];
-rz(pi/8192) q[18];
-rz(pi/4096) q[30];
-cx q[30],q[19];
-rz(-pi/4096) q[19];
-cx q[30],q[19];
-rz(pi/4096) q[19];
-rz(pi/2048) q[30];
-cx q[30],q[20];
-rz(-pi/2048) q[20];
-cx q[30],q[20];
-rz(pi/2048) q[20];
-rz(pi/1024) q[30];
-cx q[30],q[21];
-rz(-pi/1024) q[21];
-cx q[30],q[21];
-rz(pi/1024) q[21];
-rz(pi/512) q[30];
-cx q[30],q[22];
-rz(-pi/512) q[22];
-cx q[30],q[22];
-rz(pi/512) q[22];
-rz(pi/256) q[30];
-cx q[30],q[23];
-rz(-pi/256) q[23];
-cx q[30],q[23];
-rz(pi/256) q[23];
-rz(pi/128) q[30];
-cx q[30],q[24];
-rz(-pi/128) q[24];
-cx q[30],q[24];
-rz(pi/128) q[24];
-rz(pi/64) q[30];
-cx q[30],q[25];
-rz(-pi/64) q[25];
-cx q[30],q[25];
-rz(pi/64) q[25];
-rz(pi/32) q[30];
-cx q[30],q[26];
-rz(-pi/32) q[26];
-cx q[30],q[26];
-rz(pi/32) q[26];
-rz(pi/16) q[30];
-cx q[30],q[27];
-rz(-pi/16) q[27];
-cx q[30],q[27];
-rz(pi/16) q[27];
-rz(pi/8) q[30];
-cx q[30],q[28];
-rz(-pi/8) q[28];
-cx q[30],q[28];
-rz(pi/8) q[28];
-rz(pi/4) q[30];
-cx q[30],q[29];
-rz(-pi/4) q[29];
-cx q[30],q[29];
-rz(pi/4) q[29];
-rz(pi/2) q[30];
-sx q[30];
-rz(pi/2) q[30];
-rz(pi/4194304) q[9];
-rz(7.3145903963358e-10) q[31];
-cx q[31],q[0];
-rz(-7.3145903963358e-10) q[0];
-cx q[31],q[0];
-rz(7.3145903963358e-10) q[0];
-rz(pi/2147483648) q[31];
-cx q[31],q[1];
-rz(-pi/2147483648) q[1];
-cx q[31],q[1];
-rz(pi/2147483648) q[1];
-rz(pi/1073741824) q[31];
-cx q[31],q[2];
-rz(-pi/1073741824) q[2];
-cx q[31],q[2];
-rz(pi/1073741824) q[2];
-rz(pi/536870912) q[31];
-cx q[31],q[3];
-rz(-pi/536870912) q[3];
-cx q[31],q[3];
-rz(pi/536870912) q[3];
-rz(pi/268435456) q[31];
-cx q[31],q[4];
-rz(-pi/268435456) q[4];
-cx q[31],q[4];
-rz(pi/134217728) q[31];
-cx q[31],q[5];
-rz(pi/268435456) q[4];
-rz(-pi/134217728) q[5];
-cx q[31],q[5];
-rz(pi/67108864) q[31];
-cx q[31],q[6];
-rz(pi/134217728) q[5];
-rz(-pi/67108864) q[6];
-cx q[31],q[6];
-rz(pi/33554432) q[31];
-cx q[31],q[7];
-rz(pi/67108864) q[6];
-rz(-pi/33554432) q[7];
-cx q[31],q[7];
-rz(pi/16777216) q[31];
-cx q[31],q[8];
-rz(pi/33554432) q[7];
-rz(-pi/16777216) q[8];
-cx q[31],q[8];
-rz(pi/8388608) q[31];
-cx q[31],q[9];
-rz(pi/16777216) q[8];
-rz(-pi/8388608) q[9];
-cx q[31],q[9];
-rz(pi/4194304) q[31];
-cx q[31],q[10];
-rz(-pi/4194304) q[10];
-cx q[31],q[10];
-rz(pi/4194304) q[10];
-rz(pi/2097152) q[31];
-cx q[31],q[11];
-rz(-pi/2097152) q[11];
-cx q[31],q[11];
-rz(pi/2097152) q[11];
-rz(pi/1048576) q[31];
-cx q[31],q[12];
-rz(-pi/1048576) q[12];
-cx q[31],q[12];
-rz(pi/1048576) q[12];
-rz(pi/524288) q[31];
-cx q[31],q[13];
-rz(-pi/524288) q[13];
-cx q[31],q[13];
-rz(pi/524288) q[13];
-rz(pi/262144) q[31];
-cx q[31],q[14];
-rz(-pi/262144) q[14];
-cx q[31],q[14];
-rz(pi/262144) q[14];
-rz(pi/131072) q[31];
-cx q[31],q[15];
-rz(-pi/131072) q[15];
-cx q[31],q[15];
-rz(pi/131072) q[15];
-rz(pi/65536) q[31];
-cx q[31],q[16];
-rz(-pi/65536) q[16];
-cx q[31],q[16];
-rz(pi/65536) q[16];
-rz(pi/32768) q[31];
-cx q[31],q[17];
-rz(-pi/32768) q[17];
-cx q[31],q[17];
-rz(pi/32768) q[17];
-rz(pi/16384) q[31];
-cx q[31],q[18];
-rz(-pi/16384) q[18];
-cx q[31],q[18];
-rz(pi/16384) q[18];
-rz(pi/8192) q[31];
-cx q[31],q[19];
-rz(-pi/8192) q[19];
-cx q[31],q[19];
-rz(pi/8192) q[19];
-rz(pi/4096) q[31];
-cx q[31],q[20];
-rz(-pi/4096) q[20];
-cx q[31],q[20];
-rz(pi/4096) q[20];
-rz(pi/2048) q[31];
-cx q[31],q[21];
-rz(-pi/2048) q[21];
-cx q[31],q[21];
-rz(pi/2048) q[21];
-rz(pi/1024) q[31];
-cx q[31],q[22];
-rz(-pi/1024) q[22];
-cx q[31],q[22];
-rz(pi/1024) q[22];
-rz(pi/512) q[31];
-cx q[31],q[23];
-rz(-pi/512) q[23];
-cx q[31],q[23];
-rz(pi/512) q[23];
-rz(pi/256) q[31];
-cx q[31],q[24];
-rz(-pi/256) q[24];
-cx q[31],q[24];
-rz(pi/256) q[24];
-rz(pi/128) q[31];
-cx q[31],q[25];
-rz(-pi/128) q[25];
-cx q[31],q[25];
-rz(pi/128) q[25];
-rz(pi/64) q[31];
-cx q[31],q[26];
-rz(-pi/64) q[26];
-cx q[31],q[26];
-rz(pi/64) q[26];
-rz(pi/32) q[31];
-cx q[31],q[27];
-rz(-pi/32) q[27];
-cx q[31],q[27];
-rz(pi/32) q[27];
-rz(pi/16) q[31];
-cx q[31],q[28];
-rz(-pi/16) q[28];
-cx q[31],q[28];
-rz(pi/16) q[28];
-rz(pi/8) q[31];
-cx q[31],q[29];
-rz(-pi/8) q[29];
-cx q[31],q[29];
-rz(pi/8) q[29];
-rz(pi/4) q[31];
-cx q[31],q[30];
-rz(-pi/4) q[30];
-cx q[31],q[30];
-rz(pi/4) q[30];
-rz(pi/2) q[31];
-sx q[31];
-rz(pi/2) q[31];
-rz(pi/8388608) q[9];
-rz(3.6572951981679e-10) q[32];
-cx q[32],q[0];
-rz(-3.6572951981679e-10) q[0];
-cx q[32],q[0];
-rz(3.6572951981679e-10) q[0];
-rz(7.3145903963358e-10) q[32];
-cx q[32],q[1];
-rz(-7.3145903963358e-10) q[1];
-cx q[32],q[1];
-rz(7.3145903963358e-10) q[1];
-rz(pi/2147483648) q[32];
-cx q[32],q[2];
-rz(-pi/2147483648) q[2];
-cx q[32],q[2];
-rz(pi/2147483648) q[2];
-rz(pi/1073741824) q[32];
-cx q[32],q[3];
-rz(-pi/1073741824) q[3];
-cx q[32],q[3];
-rz(pi/1073741824) q[3];
-rz(pi/536870912) q[32];
-cx q[32],q[4];
-rz(-pi/536870912) q[4];
-cx q[32],q[4];
-rz(pi/268435456) q[32];
-cx q[32],q[5];
-rz(pi/536870912) q[4];
-rz(-pi/268435456) q[5];
-cx q[32],q[5];
-rz(pi/134217728) q[32];
-cx q[32],q[6];
-rz(pi/268435456) q[5];
-rz(-pi/134217728) q[6];
-cx q[32],q[6];
-rz(pi/67108864) q[32];
-cx q[32],q[7];
-rz(pi/134217728) q[6];
-rz(-pi/67108864) q[7];
-cx q[32],q[7];
-rz(pi/33554432) q[32];
-cx q[32],q[8];
-rz(pi/67108864) q[7];
-rz(-pi/33554432) q[8];
-cx q[32],q[8];
-rz(pi/16777216) q[32];
-cx q[32],q[9];
-rz(pi/33554432) q[8];
-rz(-pi/16777216) q[9];
-cx q[32],q[9];
-rz(pi/8388608) q[32];
-cx q[32],q[10];
-rz(-pi/8388608) q[10];
-cx q[32],q[10];
-rz(pi/8388608) q[10];
-rz(pi/4194304) q[32];
-cx q[32],q[11];
-rz(-pi/4194304) q[11];
-cx q[32],q[11];
-rz(pi/4194304) q[11];
-rz(pi/2097152) q[32];
-cx q[32],q[12];
-rz(-pi/2097152) q[12];
-cx q[32],q[12];
-rz(pi/2097152) q[12];
-rz(pi/1048576) q[32];
-cx q[32],q[13];
-rz(-pi/1048576) q[13];
-cx q[32],q[13];
-rz(pi/1048576) q[13];
-rz(pi/524288) q[32];
-cx q[32],q[14];
-rz(-pi/524288) q[14];
-cx q[32],q[14];
-rz(pi/524288) q[14];
-rz(pi/262144) q[32];
-cx q[32],q[15];
-rz(-pi/262144) q[15];
-cx q[32],q[15];
-rz(pi/262144) q[15];
-rz(pi/131072) q[32];
-cx q[32],q[16];
-rz(-pi/131072) q[16];
-cx q[32],q[16];
-rz(pi/131072) q[16];
-rz(pi/65536) q[32];
-cx q[32],q[17];
-rz(-pi/65536) q[17];
-cx q[32],q[17];
-rz(pi/65536) q[17];
-rz(pi/32768) q[32];
-cx q[32],q[18];
-rz(-pi/32768) q[18];
-cx q[32],q[18];
-rz(pi/32768) q[18];
-rz(pi/16384) q[32];
-cx q[32],q[19];
-rz(-pi/16384) q[19];
-cx q[32],q[19];
-rz(pi/16384) q[19];
-rz(pi/8192) q[32];
-cx q[32],q[20];
-rz(-pi/8192) q[20];
-cx q[32],q[20];
-rz(pi/8192) q[20];
-rz(pi/4096) q[32];
-cx q[32],q[21];
-rz(-pi/4096) q[21];
-cx q[32],q[21];
-rz(pi/4096) q[21];
-rz(pi/2048) q[32];
-cx q[32],q[22];
-rz(-pi/2048) q[22];
-cx q[32],q[22];
-rz(pi/2048) q[22];
-rz(pi/1024) q[32];
-cx q[32],q[23];
-rz(-pi/1024) q[23];
-cx q[32],q[23];
-rz(pi/1024) q[23];
-rz(pi/512) q[32];
-cx q[32],q[24];
-rz(-pi/512) q[24];
-cx q[32],q[24];
-rz(pi/512) q[24];
-rz(pi/256) q[32];
-cx q[32],q[25];
-rz(-pi/256) q[25];
-cx q[32],q[25];
-rz(pi/256) q[25];
-rz(pi/128) q[32];
-cx q[32],q[26];
-rz(-pi/128) q[26];
-cx q[32],q[26];
-rz(pi/128) q[26];
-rz(pi/64) q[32];
-cx q[32],q[27];
-rz(-pi/64) q[27];
-cx q[32],q[27];
-rz(pi/64) q[27];
-rz(pi/32) q[32];
-cx q[32],q[28];
-rz(-pi/32) q[28];
-cx q[32],q[28];
-rz(pi/32) q[28];
-rz(pi/16) q[32];
-cx q[32],q[29];
-rz(-pi/16) q[29];
-cx q[32],q[29];
-rz(pi/16) q[29];
-rz(pi/8) q[32];
-cx q[32],q[30];
-rz(-pi/8) q[30];
-cx q[32],q[30];
-rz(pi/8) q[30];
-rz(pi/4) q[32];
-cx q[32],q[31];
-rz(-pi/4) q[31];
-cx q[32],q[31];
-rz(pi/4) q[31];
-rz(pi/2) q[32];
-sx q[32];
-rz(pi/2) q[32];
-rz(pi/16777216) q[9];
-rz(1.82864759908395e-10) q[33];
-cx q[33],q[0];
-rz(-1.82864759908395e-10) q[0];
-cx q[33],q[0];
-rz(1.82864759908395e-10) q[0];
-rz(3.6572951981679e-10) q[33];
-cx q[33],q[1];
-rz(-3.6572951981679e-10) q[1];
-cx q[33],q[1];
-rz(3.6572951981679e-10) q[1];
-rz(7.3145903963358e-10) q[33];
-cx q[33],q[2];
-rz(-7.3145903963358e-10) q[2];
-cx q[33],q[2];
-rz(7.3145903963358e-10) q[2];
-rz(pi/2147483648) q[33];
-cx q[33],q[3];
-rz(-pi/2147483648) q[3];
-cx q[33],q[3];
-rz(pi/2147483648) q[3];
-rz(pi/1073741824) q[33];
-cx q[33],q[4];
-rz(-pi/1073741824) q[4];
-cx q[33],q[4];
-rz(pi/536870912) q[33];
-cx q[33],q[5];
-rz(pi/1073741824) q[4];
-rz(-pi/536870912) q[5];
-cx q[33],q[5];
-rz(pi/268435456) q[33];
-cx q[33],q[6];
-rz(pi/536870912) q[5];
-rz(-pi/268435456) q[6];
-cx q[33],q[6];
-rz(pi/134217728) q[33];
-cx q[33],q[7];
-rz(pi/268435456) q[6];
-rz(-pi/134217728) q[7];
-cx q[33],q[7];
-rz(pi/67108864) q[33];
-cx q[33],q[8];
-rz(pi/134217728) q[7];
-rz(-pi/67108864) q[8];
-cx q[33],q[8];
-rz(pi/33554432) q[33];
-cx q[33],q[9];
-rz(pi/67108864) q[8];
-rz(-pi/33554432) q[9];
-cx q[33],q[9];
-rz(pi/16777216) q[33];
-cx q[33],q[10];
-rz(-pi/16777216) q[10];
-cx q[33],q[10];
-rz(pi/16777216) q[10];
-rz(pi/8388608) q[33];
-cx q[33],q[11];
-rz(-pi/8388608) q[11];
-cx q[33],q[11];
-rz(pi/8388608) q[11];
-rz(pi/4194304) q[33];
-cx q[33],q[12];
-rz(-pi/4194304) q[12];
-cx q[33],q[12];
-rz(pi/4194304) q[12];
-rz(pi/2097152) q[33];
-cx q[33],q[13];
-rz(-pi/2097152) q[13];
-cx q[33],q[13];
-rz(pi/2097152) q[13];
-rz(pi/1048576) q[33];
-cx q[33],q[14];
-rz(-pi/1048576) q[14];
-cx q[33],q[14];
-rz(pi/1048576) q[14];
-rz(pi/524288) q[33];
-cx q[33],q[15];
-rz(-pi/524288) q[15];
-cx q[33],q[15];
-rz(pi/524288) q[15];
-rz(pi/262144) q[33];
-cx q[33],q[16];
-rz(-pi/262144) q[16];
-cx q[33],q[16];
-rz(pi/262144) q[16];
-rz(pi/131072) q[33];
-cx q[33],q[17];
-rz(-pi/131072) q[17];
-cx q[33],q[17];
-rz(pi/131072) q[17];
-rz(pi/65536) q[33];
-cx q[33],q[18];
-rz(-pi/65536) q[18];
-cx q[33],q[18];
-rz(pi/65536) q[18];
-rz(pi/32768) q[33];
-cx q[33],q[19];
-rz(-pi/32768) q[19];
-cx q[33],q[19];
-rz(pi/32768) q[19];
-rz(pi/16384) q[33];
-cx q[33],q[20];
-rz(-pi/16384) q[20];
-cx q[33],q[20];
-rz(pi/16384) q[20];
-rz(pi/8192) q[33];
-cx q[33],q[21];
-rz(-pi/8192) q[21];
-cx q[33],q[21];
-rz(pi/8192) q[21];
-rz(pi/4096) q[33];
-cx q[33],q[22];
-rz(-pi/4096) q[22];
-cx q[33],q[22];
-rz(pi/4096) q[22];
-rz(pi/2048) q[33];
-cx q[33],q[23];
-rz(-pi/2048) q[23];
-cx q[33],q[23];
-rz(pi/2048) q[23];
-rz(pi/1024) q[33];
-cx q[33],q[24];
-rz(-pi/1024) q[24];
-cx q[33],q[24];
-rz(pi/1024) q[24];
-rz(pi/512) q[33];
-cx q[33],q[25];
-rz(-pi/512) q[25];
-cx q[33],q[25];
-rz(pi/512) q[25];
-rz(pi/256) q[33];
-cx q[33],q[26];
-rz(-pi/256) q[26];
-cx q[33],q[26];
-rz(pi/256) q[26];
-rz(pi/128) q[33];
-cx q[33],q[27];
-rz(-pi/128) q[27];
-cx q[33],q[27];
-rz(pi/128) q[27];
-rz(pi/64) q[33];
-cx q[33],q[28];
-rz(-pi/64) q[28];
-cx q[33],q[28];
-rz(pi/64) q[28];
-rz(pi/32) q[33];
-cx q[33],q[29];
-rz(-pi/32) q[29];
-cx q[33],q[29];
-rz(pi/32) q[29];
-rz(pi/16) q[33];
-cx q[33],q[30];
-rz(-pi/16) q[30];
-cx q[33],q[30];
-rz(pi/16) q[30];
-rz(pi/8) q[33];
-cx q[33],q[31];
-rz(-pi/8) q[31];
-cx q[33],q[31];
-rz(pi/8) q[31];
-rz(pi/4) q[33];
-cx q[33],q[32];
-rz(-pi/4) q[32];
-cx q[33],q[32];
-rz(pi/4) q[32];
-rz(pi/2) q[33];
-sx q[33];
-rz(pi/2) q[33];
-rz(pi/33554432) q[9];
-rz(9.14323799541975e-11) q[34];
-cx q[34],q[0];
-rz(-9.14323799541975e-11) q[0];
-cx q[34],q[0];
-rz(9.14323799541975e-11) q[0];
-rz(1.82864759908395e-10) q[34];
-cx q[34],q[1];
-rz(-1.82864759908395e-10) q[1];
-cx q[34],q[1];
-rz(1.82864759908395e-10) q[1];
-rz(3.6572951981679e-10) q[34];
-cx q[34],q[2];
-rz(-3.6572951981679e-10) q[2];
-cx q[34],q[2];
-rz(3.6572951981679e-10) q[2];
-rz(7.3145903963358e-10) q[34];
-cx q[34],q[3];
-rz(-7.3145903963358e-10) q[3];
-cx q[34],q[3];
-rz(7.3145903963358e-10) q[3];
-rz(pi/2147483648) q[34];
-cx q[34],q[4];
-rz(-pi/2147483648) q[4];
-cx q[34],q[4];
-rz(pi/1073741824) q[34];
-cx q[34],q[5];
-rz(pi/2147483648) q[4];
-rz(-pi/1073741824) q[5];
-cx q[34],q[5];
-rz(pi/536870912) q[34];
-cx q[34],q[6];
-rz(pi/1073741824) q[5];
-rz(-pi/536870912) q[6];
-cx q[34],q[6];
-rz(pi/268435456) q[34];
-cx q[34],q[7];
-rz(pi/536870912) q[6];
-rz(-pi/268435456) q[7];
-cx q[34],q[7];
-rz(pi/134217728) q[34];
-cx q[34],q[8];
-rz(pi/268435456) q[7];
-rz(-pi/134217728) q[8];
-cx q[34],q[8];
-rz(pi/67108864) q[34];
-cx q[34],q[9];
-rz(pi/134217728) q[8];
-rz(-pi/67108864) q[9];
-cx q[34],q[9];
-rz(pi/33554432) q[34];
-cx q[34],q[10];
-rz(-pi/33554432) q[10];
-cx q[34],q[10];
-rz(pi/33554432) q[10];
-rz(pi/16777216) q[34];
-cx q[34],q[11];
-rz(-pi/16777216) q[11];
-cx q[34],q[11];
-rz(pi/16777216) q[11];
-rz(pi/8388608) q[34];
-cx q[34],q[12];
-rz(-pi/8388608) q[12];
-cx q[34],q[12];
-rz(pi/8388608) q[12];
-rz(pi/4194304) q[34];
-cx q[34],q[13];
-rz(-pi/4194304) q[13];
-cx q[34],q[13];
-rz(pi/4194304) q[13];
-rz(pi/2097152) q[34];
-cx q[34],q[14];
-rz(-pi/2097152) q[14];
-cx q[34],q[14];
-rz(pi/2097152) q[14];
-rz(pi/1048576) q[34];
-cx q[34],q[15];
-rz(-pi/1048576) q[15];
-cx q[34],q[15];
-rz(pi/1048576) q[15];
-rz(pi/524288) q[34];
-cx q[34],q[16];
-rz(-pi/524288) q[16];
-cx q[34],q[16];
-rz(pi/524288) q[16];
-rz(pi/262144) q[34];
-cx q[34],q[17];
-rz(-pi/262144) q[17];
-cx q[34],q[17];
-rz(pi/262144) q[17];
-rz(pi/131072) q[34];
-cx q[34],q[18];
-rz(-pi/131072) q[18];
-cx q[34],q[18];
-rz(pi/131072) q[18];
-rz(pi/65536) q[34];
-cx q[34],q[19];
-rz(-pi/65536) q[19];
-cx q[34],q[19];
-rz(pi/65536) q[19];
-rz(pi/32768) q[34];
-cx q[34],q[20];
-rz(-pi/32768) q[20];
-cx q[34],q[20];
-rz(pi/32768) q[20];
-rz(pi/16384) q[34];
-cx q[34],q[21];
-rz(-pi/16384) q[21];
-cx q[34],q[21];
-rz(pi/16384) q[21];
-rz(pi/8192) q[34];
-cx q[34],q[22];
-rz(-pi/8192) q[22];
-cx q[34],q[22];
-rz(pi/8192) q[22];
-rz(pi/4096) q[34];
-cx q[34],q[23];
-rz(-pi/4096) q[23];
-cx q[34],q[23];
-rz(pi/4096) q[23];
-rz(pi/2048) q[34];
-cx q[34],q[24];
-rz(-pi/2048) q[24];
-cx q[34],q[24];
-rz(pi/2048) q[24];
-rz(pi/1024) q[34];
-cx q[34],q[25];
-rz(-pi/1024) q[25];
-cx q[34],q[25];
-rz(pi/1024) q[25];
-rz(pi/512) q[34];
-cx q[34],q[26];
-rz(-pi/512) q[26];
-cx q[34],q[26];
-rz(pi/512) q[26];
-rz(pi/256) q[34];
-cx q[34],q[27];
-rz(-pi/256) q[27];
-cx q[34],q[27];
-rz(pi/256) q[27];
-rz(pi/128) q[34];
-cx q[34],q[28];
-rz(-pi/128) q[28];
-cx q[34],q[28];
-rz(pi/128) q[28];
-rz(pi/64) q[34];
-cx q[34],q[29];
-rz(-pi/64) q[29];
-cx q[34],q[29];
-rz(pi/64) q[29];
-rz(pi/32) q[34];
-cx q[34],q[30];
-rz(-pi/32) q[30];
-cx q[34],q[30];
-rz(pi/32) q[30];
-rz(pi/16) q[34];
-cx q[34],q[31];
-rz(-pi/16) q[31];
-cx q[34],q[31];
-rz(pi/16) q[31];
-rz(pi/8) q[34];
-cx q[34],q[32];
-rz(-pi/8) q[32];
-cx q[34],q[32];
-rz(pi/8) q[32];
-rz(pi/4) q[34];
-cx q[34],q[33];
-rz(-pi/4) q[33];
-cx q[34],q[33];
-rz(pi/4) q[33];
-rz(pi/2) q[34];
-sx q[34];
-rz(pi/2) q[34];
-rz(pi/67108864) q[9];
-rz(4.57161899770987e-11) q[35];
-cx q[35],q[0];
-rz(-4.57161899770987e-11) q[0];
-cx q[35],q[0];
-rz(4.57161899770987e-11) q[0];
-rz(9.14323799541975e-11) q[35];
-cx q[35],q[1];
-rz(-9.14323799541975e-11) q[1];
-cx q[35],q[1];
-rz(9.14323799541975e-11) q[1];
-rz(1.82864759908395e-10) q[35];
-cx q[35],q[2];
-rz(-1.82864759908395e-10) q[2];
-cx q[35],q[2];
-rz(1.82864759908395e-10) q[2];
-rz(3.6572951981679e-10) q[35];
-cx q[35],q[3];
-rz(-3.6572951981679e-10) q[3];
-cx q[35],q[3];
-rz(3.6572951981679e-10) q[3];
-rz(7.3145903963358e-10) q[35];
-cx q[35],q[4];
-rz(-7.3145903963358e-10) q[4];
-cx q[35],q[4];
-rz(pi/2147483648) q[35];
-cx q[35],q[5];
-rz(7.3145903963358e-10) q[4];
-rz(-pi/2147483648) q[5];
-cx q[35],q[5];
-rz(pi/1073741824) q[35];
-cx q[35],q[6];
-rz(pi/2147483648) q[5];
-rz(-pi/1073741824) q[6];
-cx q[35],q[6];
-rz(pi/536870912) q[35];
-cx q[35],q[7];
-rz(pi/1073741824) q[6];
-rz(-pi/536870912) q[7];
-cx q[35],q[7];
-rz(pi/268435456) q[35];
-cx q[35],q[8];
-rz(pi/536870912) q[7];
-rz(-pi/268435456) q[8];
-cx q[35],q[8];
-rz(pi/134217728) q[35];
-cx q[35],q[9];
-rz(pi/268435456) q[8];
-rz(-pi/134217728) q[9];
-cx q[35],q[9];
-rz(pi/67108864) q[35];
-cx q[35],q[10];
-rz(-pi/67108864) q[10];
-cx q[35],q[10];
-rz(pi/67108864) q[10];
-rz(pi/33554432) q[35];
-cx q[35],q[11];
-rz(-pi/33554432) q[11];
-cx q[35],q[11];
-rz(pi/33554432) q[11];
-rz(pi/16777216) q[35];
-cx q[35],q[12];
-rz(-pi/16777216) q[12];
-cx q[35],q[12];
-rz(pi/16777216) q[12];
-rz(pi/8388608) q[35];
-cx q[35],q[13];
-rz(-pi/8388608) q[13];
-cx q[35],q[13];
-rz(pi/8388608) q[13];
-rz(pi/4194304) q[35];
-cx q[35],q[14];
-rz(-pi/4194304) q[14];
-cx q[35],q[14];
-rz(pi/4194304) q[14];
-rz(pi/2097152) q[35];
-cx q[35],q[15];
-rz(-pi/2097152) q[15];
-cx q[35],q[15];
-rz(pi/2097152) q[15];
-rz(pi/1048576) q[35];
-cx q[35],q[16];
-rz(-pi/1048576) q[16];
-cx q[35],q[16];
-rz(pi/1048576) q[16];
-rz(pi/524288) q[35];
-cx q[35],q[17];
-rz(-pi/524288) q[17];
-cx q[35],q[17];
-rz(pi/524288) q[17];
-rz(pi/262144) q[35];
-cx q[35],q[18];
-rz(-pi/262144) q[18];
-cx q[35],q[18];
-rz(pi/262144) q[18];
-rz(pi/131072) q[35];
-cx q[35],q[19];
-rz(-pi/131072) q[19];
-cx q[35],q[19];
-rz(pi/131072) q[19];
-rz(pi/65536) q[35];
-cx q[35],q[20];
-rz(-pi/65536) q[20];
-cx q[35],q[20];
-rz(pi/65536) q[20];
-rz(pi/32768) q[35];
-cx q[35],q[21];
-rz(-pi/32768) q[21];
-cx q[35],q[21];
-rz(pi/32768) q[21];
-rz(pi/16384) q[35];
-cx q[35],q[22];
-rz(-pi/16384) q[22];
-cx q[35],q[22];
-rz(pi/16384) q[22];
-rz(pi/8192) q[35];
-cx q[35],q[23];
-rz(-pi/8192) q[23];
-cx q[35],q[23];
-rz(pi/8192) q[23];
-rz(pi/4096) q[35];
-cx q[35],q[24];
-rz(-pi/4096) q[24];
-cx q[35],q[24];
-rz(pi/4096) q[24];
-rz(pi/2048) q[35];
-cx q[35],q[25];
-rz(-pi/2048) q[25];
-cx q[35],q[25];
-rz(pi/2048) q[25];
-rz(pi/1024) q[35];
-cx q[35],q[26];
-rz(-pi/1024) q[26];
-cx q[35],q[26];
-rz(pi/1024) q[26];
-rz(pi/512) q[35];
-cx q[35],q[27];
-rz(-pi/512) q[27];
-cx q[35],q[27];
-rz(pi/512) q[27];
-rz(pi/256) q[35];
-cx q[35],q[28];
-rz(-pi/256) q[28];
-cx q[35],q[28];
-rz(pi/256) q[28];
-rz(pi/128) q[35];
-cx q[35],q[29];
-rz(-pi/128) q[29];
-cx q[35],q[29];
-rz(pi/128) q[29];
-rz(pi/64) q[35];
-cx q[35],q[30];
-rz(-pi/64) q[30];
-cx q[35],q[30];
-rz(pi/64) q[30];
-rz(pi/32) q[35];
-cx q[35],q[31];
-rz(-pi/32) q[31];
-cx q[35],q[31];
-rz(pi/32) q[31];
-rz(pi/16) q[35];
-cx q[35],q[32];
-rz(-pi/16) q[32];
-cx q[35],q[32];
-rz(pi/16) q[32];
-rz(pi/8) q[35];
-cx q[35],q[33];
-rz(-pi/8) q[33];
-cx q[35],q[33];
-rz(pi/8) q[33];
-rz(pi/4) q[35];
-cx q[35],q[34];
-rz(-pi/4) q[34];
-cx q[35],q[34];
-rz(pi/4) q[34];
-rz(pi/2) q[35];
-sx q[35];
-rz(pi/2) q[35];
-rz(pi/134217728) q[9];
-rz(2.28580949885494e-11) q[36];
-cx q[36],q[0];
-rz(-2.28580949885494e-11) q[0];
-cx q[36],q[0];
-rz(2.28580949885494e-11) q[0];
-rz(4.57161899770987e-11) q[36];
-cx q[36],q[1];
-rz(-4.57161899770987e-11) q[1];
-cx q[36],q[1];
-rz(4.57161899770987e-11) q[1];
-rz(9.14323799541975e-11) q[36];
-cx q[36],q[2];
-rz(-9.14323799541975e-11) q[2];
-cx q[36],q[2];
-rz(9.14323799541975e-11) q[2];
-rz(1.82864759908395e-10) q[36];
-cx q[36],q[3];
-rz(-1.82864759908395e-10) q[3];
-cx q[36],q[3];
-rz(1.82864759908395e-10) q[3];
-rz(3.6572951981679e-10) q[36];
-cx q[36],q[4];
-rz(-3.6572951981679e-10) q[4];
-cx q[36],q[4];
-rz(7.3145903963358e-10) q[36];
-cx q[36],q[5];
-rz(3.6572951981679e-10) q[4];
-rz(-7.3145903963358e-10) q[5];
-cx q[36],q[5];
-rz(pi/2147483648) q[36];
-cx q[36],q[6];
-rz(7.3145903963358e-10) q[5];
-rz(-pi/2147483648) q[6];
-cx q[36],q[6];
-rz(pi/1073741824) q[36];
-cx q[36],q[7];
-rz(pi/2147483648) q[6];
-rz(-pi/1073741824) q[7];
-cx q[36],q[7];
-rz(pi/536870912) q[36];
-cx q[36],q[8];
-rz(pi/1073741824) q[7];
-rz(-pi/536870912) q[8];
-cx q[36],q[8];
-rz(pi/268435456) q[36];
-cx q[36],q[9];
-rz(pi/536870912) q[8];
-rz(-pi/268435456) q[9];
-cx q[36],q[9];
-rz(pi/134217728) q[36];
-cx q[36],q[10];
-rz(-pi/134217728) q[10];
-cx q[36],q[10];
-rz(pi/134217728) q[10];
-rz(pi/67108864) q[36];
-cx q[36],q[11];
-rz(-pi/67108864) q[11];
-cx q[36],q[11];
-rz(pi/67108864) q[11];
-rz(pi/33554432) q[36];
-cx q[36],q[12];
-rz(-pi/33554432) q[12];
-cx q[36],q[12];
-rz(pi/33554432) q[12];
-rz(pi/16777216) q[36];
-cx q[36],q[13];
-rz(-pi/16777216) q[13];
-cx q[36],q[13];
-rz(pi/16777216) q[13];
-rz(pi/8388608) q[36];
-cx q[36],q[14];
-rz(-pi/8388608) q[14];
-cx q[36],q[14];
-rz(pi/8388608) q[14];
-rz(pi/4194304) q[36];
-cx q[36],q[15];
-rz(-pi/4194304) q[15];
-cx q[36],q[15];
-rz(pi/4194304) q[15];
-rz(pi/2097152) q[36];
-cx q[36],q[16];
-rz(-pi/2097152) q[16];
-cx q[36],q[16];
-rz(pi/2097152) q[16];
-rz(pi/1048576) q[36];
-cx q[36],q[17];
-rz(-pi/1048576) q[17];
-cx q[36],q[17];
-rz(pi/1048576) q[17];
-rz(pi/524288) q[36];
-cx q[36],q[18];
-rz(-pi/524288) q[18];
-cx q[36],q[18];
-rz(pi/524288) q[18];
-rz(pi/262144) q[36];
-cx q[36],q[19];
-rz(-pi/262144) q[19];
-cx q[36],q[19];
-rz(pi/262144) q[19];
-rz(pi/131072) q[36];
-cx q[36],q[20];
-rz(-pi/131072) q[20];
-cx q[36],q[20];
-rz(pi/131072) q[20];
-rz(pi/65536) q[36];
-cx q[36],q[21];
-rz(-pi/65536) q[21];
-cx q[36],q[21];
-rz(pi/65536) q[21];
-rz(pi/32768) q[36];
-cx q[36],q[22];
-rz(-pi/32768) q[22];
-cx q[36],q[22];
-rz(pi/32768) q[22];
-rz(pi/16384) q[36];
-cx q[36],q[23];
-rz(-pi/16384) q[23];
-cx q[36],q[23];
-rz(pi/16384) q[23];
-rz(pi/8192) q[36];
-cx q[36],q[24];
-rz(-pi/8192) q[24];
-cx q[36],q[24];
-rz(pi/8192) q[24];
-rz(pi/4096) q[36];
-cx q[36],q[25];
-rz(-pi/4096) q[25];
-cx q[36],q[25];
-rz(pi/4096) q[25];
-rz(pi/2048) q[36];
-cx q[36],q[26];
-rz(-pi/2048) q[26];
-cx q[36],q[26];
-rz(pi/2048) q[26];
-rz(pi/1024) q[36];
-cx q[36],q[27];
-rz(-pi/1024) q[27];
-cx q[36],q[27];
-rz(pi/1024) q[27];
-rz(pi/512) q[36];
-cx q[36],q[28];
-rz(-pi/512) q[28];
-cx q[36],q[28];
-rz(pi/512) q[28];
-rz(pi/256) q[36];
-cx q[36],q[29];
-rz(-pi/256) q[29];
-cx q[36],q[29];
-rz(pi/256) q[29];
-rz(pi/128) q[36];
-cx q[36],q[30];
-rz(-pi/128) q[30];
-cx q[36],q[30];
-rz(pi/128) q[30];
-rz(pi/64) q[36];
-cx q[36],q[31];
-rz(-pi/64) q[31];
-cx q[36],q[31];
-rz(pi/64) q[31];
-rz(pi/32) q[36];
-cx q[36],q[32];
-rz(-pi/32) q[32];
-cx q[36],q[32];
-rz(pi/32) q[32];
-rz(pi/16) q[36];
-cx q[36],q[33];
-rz(-pi/16) q[33];
-cx q[36],q[33];
-rz(pi/16) q[33];
-rz(pi/8) q[36];
-cx q[36],q[34];
-rz(-pi/8) q[34];
-cx q[36],q[34];
-rz(pi/8) q[34];
-rz(pi/4) q[36];
-cx q[36],q[35];
-rz(-pi/4) q[35];
-cx q[36],q[35];
-rz(pi/4) q[35];
-rz(pi/2) q[36];
-sx q[36];
-rz(pi/2) q[36];
-rz(pi/268435456) q[9];
-rz(1.14290474942747e-11) q[37];
-cx q[37],q[0];
-rz(-1.14290474942747e-11) q[0];
-cx q[37],q[0];
-rz(1.14290474942747e-11) q[0];
-rz(2.28580949885494e-11) q[37];
-cx q[37],q[1];
-rz(-2.28580949885494e-11) q[1];
-cx q[37],q[1];
-rz(2.28580949885494e-11) q[1];
-rz(4.57161899770987e-11) q[37];
-cx q[37],q[2];
-rz(-4.57161899770987e-11) q[2];
-cx q[37],q[2];
-rz(4.57161899770987e-11) q[2];
-rz(9.14323799541975e-11) q[37];
-cx q[37],q[3];
-rz(-9.14323799541975e-11) q[3];
-cx q[37],q[3];
-rz(9.14323799541975e-11) q[3];
-rz(1.82864759908395e-10) q[37];
-cx q[37],q[4];
-rz(-1.82864759908395e-10) q[4];
-cx q[37],q[4];
-rz(3.6572951981679e-10) q[37];
-cx q[37],q[5];
-rz(1.82864759908395e-10) q[4];
-rz(-3.6572951981679e-10) q[5];
-cx q[37],q[5];
-rz(7.3145903963358e-10) q[37];
-cx q[37],q[6];
-rz(3.6572951981679e-10) q[5];
-rz(-7.3145903963358e-10) q[6];
-cx q[37],q[6];
-rz(pi/2147483648) q[37];
-cx q[37],q[7];
-rz(7.3145903963358e-10) q[6];
-rz(-pi/2147483648) q[7];
-cx q[37],q[7];
-rz(pi/1073741824) q[37];
-cx q[37],q[8];
-rz(pi/2147483648) q[7];
-rz(-pi/1073741824) q[8];
-cx q[37],q[8];
-rz(pi/536870912) q[37];
-cx q[37],q[9];
-rz(pi/1073741824) q[8];
-rz(-pi/536870912) q[9];
-cx q[37],q[9];
-rz(pi/268435456) q[37];
-cx q[37],q[10];
-rz(-pi/268435456) q[10];
-cx q[37],q[10];
-rz(pi/268435456) q[10];
-rz(pi/134217728) q[37];
-cx q[37],q[11];
-rz(-pi/134217728) q[11];
-cx q[37],q[11];
-rz(pi/134217728) q[11];
-rz(pi/67108864) q[37];
-cx q[37],q[12];
-rz(-pi/67108864) q[12];
-cx q[37],q[12];
-rz(pi/67108864) q[12];
-rz(pi/33554432) q[37];
-cx q[37],q[13];
-rz(-pi/33554432) q[13];
-cx q[37],q[13];
-rz(pi/33554432) q[13];
-rz(pi/16777216) q[37];
-cx q[37],q[14];
-rz(-pi/16777216) q[14];
-cx q[37],q[14];
-rz(pi/16777216) q[14];
-rz(pi/8388608) q[37];
-cx q[37],q[15];
-rz(-pi/8388608) q[15];
-cx q[37],q[15];
-rz(pi/8388608) q[15];
-rz(pi/4194304) q[37];
-cx q[37],q[16];
-rz(-pi/4194304) q[16];
-cx q[37],q[16];
-rz(pi/4194304) q[16];
-rz(pi/2097152) q[37];
-cx q[37],q[17];
-rz(-pi/2097152) q[17];
-cx q[37],q[17];
-rz(pi/2097152) q[17];
-rz(pi/1048576) q[37];
-cx q[37],q[18];
-rz(-pi/1048576) q[18];
-cx q[37],q[18];
-rz(pi/1048576) q[18];
-rz(pi/524288) q[37];
-cx q[37],q[19];
-rz(-pi/524288) q[19];
-cx q[37],q[19];
-rz(pi/524288) q[19];
-rz(pi/262144) q[37];
-cx q[37],q[20];
-rz(-pi/262144) q[20];
-cx q[37],q[20];
-rz(pi/262144) q[20];
-rz(pi/131072) q[37];
-cx q[37],q[21];
-rz(-pi/131072) q[21];
-cx q[37],q[21];
-rz(pi/131072) q[21];
-rz(pi/65536) q[37];
-cx q[37],q[22];
-rz(-pi/65536) q[22];
-cx q[37],q[22];
-rz(pi/65536) q[22];
-rz(pi/32768) q[37];
-cx q[37],q[23];
-rz(-pi/32768) q[23];
-cx q[37],q[23];
-rz(pi/32768) q[23];
-rz(pi/16384) q[37];
-cx q[37],q[24];
-rz(-pi/16384) q[24];
-cx q[37],q[24];
-rz(pi/16384) q[24];
-rz(pi/8192) q[37];
-cx q[37],q[25];
-rz(-pi/8192) q[25];
-cx q[37],q[25];
-rz(pi/8192) q[25];
-rz(pi/4096) q[37];
-cx q[37],q[26];
-rz(-pi/4096) q[26];
-cx q[37],q[26];
-rz(pi/4096) q[26];
-rz(pi/2048) q[37];
-cx q[37],q[27];
-rz(-pi/2048) q[27];
-cx q[37],q[27];
-rz(pi/2048) q[27];
-rz(pi/1024) q[37];
-cx q[37],q[28];
-rz(-pi/1024) q[28];
-cx q[37],q[28];
-rz(pi/1024) q[28];
-rz(pi/512) q[37];
-cx q[37],q[29];
-rz(-pi/512) q[29];
-cx q[37],q[29];
-rz(pi/512) q[29];
-rz(pi/256) q[37];
-cx q[37],q[30];
-rz(-pi/256) q[30];
-cx q[37],q[30];
-rz(pi/256) q[30];
-rz(pi/128) q[37];
-cx q[37],q[31];
-rz(-pi/128) q[31];
-cx q[37],q[31];
-rz(pi/128) q[31];
-rz(pi/64) q[37];
-cx q[37],q[32];
-rz(-pi/64) q[32];
-cx q[37],q[32];
-rz(pi/64) q[32];
-rz(pi/32) q[37];
-cx q[37],q[33];
-rz(-pi/32) q[33];
-cx q[37],q[33];
-rz(pi/32) q[33];
-rz(pi/16) q[37];
-cx q[37],q[34];
-rz(-pi/16) q[34];
-cx q[37],q[34];
-rz(pi/16) q[34];
-rz(pi/8) q[37];
-cx q[37],q[35];
-rz(-pi/8) q[35];
-cx q[37],q[35];
-rz(pi/8) q[35];
-rz(pi/4) q[37];
-cx q[37],q[36];
-rz(-pi/4) q[36];
-cx q[37],q[36];
-rz(pi/4) q[36];
-rz(pi/2) q[37];
-sx q[37];
-rz(pi/2) q[37];
-rz(pi/536870912) q[9];
-rz(5.71452374713734e-12) q[38];
-cx q[38],q[0];
-rz(-5.71452374713734e-12) q[0];
-cx q[38],q[0];
-rz(5.71452374713734e-12) q[0];
-rz(1.14290474942747e-11) q[38];
-cx q[38],q[1];
-rz(-1.14290474942747e-11) q[1];
-cx q[38],q[1];
-rz(1.14290474942747e-11) q[1];
-rz(2.28580949885494e-11) q[38];
-cx q[38],q[2];
-rz(-2.28580949885494e-11) q[2];
-cx q[38],q[2];
-rz(2.28580949885494e-11) q[2];
-rz(4.57161899770987e-11) q[38];
-cx q[38],q[3];
-rz(-4.57161899770987e-11) q[3];
-cx q[38],q[3];
-rz(4.57161899770987e-11) q[3];
-rz(9.14323799541975e-11) q[38];
-cx q[38],q[4];
-rz(-9.14323799541975e-11) q[4];
-cx q[38],q[4];
-rz(1.82864759908395e-10) q[38];
-cx q[38],q[5];
-rz(9.14323799541975e-11) q[4];
-rz(-1.82864759908395e-10) q[5];
-cx q[38],q[5];
-rz(3.6572951981679e-10) q[38];
-cx q[38],q[6];
-rz(1.82864759908395e-10) q[5];
-rz(-3.6572951981679e-10) q[6];
-cx q[38],q[6];
-rz(7.3145903963358e-10) q[38];
-cx q[38],q[7];
-rz(3.6572951981679e-10) q[6];
-rz(-7.3145903963358e-10) q[7];
-cx q[38],q[7];
-rz(pi/2147483648) q[38];
-cx q[38],q[8];
-rz(7.3145903963358e-10) q[7];
-rz(-pi/2147483648) q[8];
-cx q[38],q[8];
-rz(pi/1073741824) q[38];
-cx q[38],q[9];
-rz(pi/2147483648) q[8];
-rz(-pi/1073741824) q[9];
-cx q[38],q[9];
-rz(pi/536870912) q[38];
-cx q[38],q[10];
-rz(-pi/536870912) q[10];
-cx q[38],q[10];
-rz(pi/536870912) q[10];
-rz(pi/268435456) q[38];
-cx q[38],q[11];
-rz(-pi/268435456) q[11];
-cx q[38],q[11];
-rz(pi/268435456) q[11];
-rz(pi/134217728) q[38];
-cx q[38],q[12];
-rz(-pi/134217728) q[12];
-cx q[38],q[12];
-rz(pi/134217728) q[12];
-rz(pi/67108864) q[38];
-cx q[38],q[13];
-rz(-pi/67108864) q[13];
-cx q[38],q[13];
-rz(pi/67108864) q[13];
-rz(pi/33554432) q[38];
-cx q[38],q[14];
-rz(-pi/33554432) q[14];
-cx q[38],q[14];
-rz(pi/33554432) q[14];
-rz(pi/16777216) q[38];
-cx q[38],q[15];
-rz(-pi/16777216) q[15];
-cx q[38],q[15];
-rz(pi/16777216) q[15];
-rz(pi/8388608) q[38];
-cx q[38],q[16];
-rz(-pi/8388608) q[16];
-cx q[38],q[16];
-rz(pi/8388608) q[16];
-rz(pi/4194304) q[38];
-cx q[38],q[17];
-rz(-pi/4194304) q[17];
-cx q[38],q[17];
-rz(pi/4194304) q[17];
-rz(pi/2097152) q[38];
-cx q[38],q[18];
-rz(-pi/2097152) q[18];
-cx q[38],q[18];
-rz(pi/2097152) q[18];
-rz(pi/1048576) q[38];
-cx q[38],q[19];
-rz(-pi/1048576) q[19];
-cx q[38],q[19];
-rz(pi/1048576) q[19];
-rz(pi/524288) q[38];
-cx q[38],q[20];
-rz(-pi/524288) q[20];
-cx q[38],q[20];
-rz(pi/524288) q[20];
-rz(pi/262144) q[38];
-cx q[38],q[21];
-rz(-pi/262144) q[21];
-cx q[38],q[21];
-rz(pi/262144) q[21];
-rz(pi/131072) q[38];
-cx q[38],q[22];
-rz(-pi/131072) q[22];
-cx q[38],q[22];
-rz(pi/131072) q[22];
-rz(pi/65536) q[38];
-cx q[38],q[23];
-rz(-pi/65536) q[23];
-cx q[38],q[23];
-rz(pi/65536) q[23];
-rz(pi/32768) q[38];
-cx q[38],q[24];
-rz(-pi/32768) q[24];
-cx q[38],q[24];
-rz(pi/32768) q[24];
-rz(pi/16384) q[38];
-cx q[38],q[25];
-rz(-pi/16384) q[25];
-cx q[38],q[25];
-rz(pi/16384) q[25];
-rz(pi/8192) q[38];
-cx q[38],q[26];
-rz(-pi/8192) q[26];
-cx q[38],q[26];
-rz(pi/8192) q[26];
-rz(pi/4096) q[38];
-cx q[38],q[27];
-rz(-pi/4096) q[27];
-cx q[38],q[27];
-rz(pi/4096) q[27];
-rz(pi/2048) q[38];
-cx q[38],q[28];
-rz(-pi/2048) q[28];
-cx q[38],q[28];
-rz(pi/2048) q[28];
-rz(pi/1024) q[38];
-cx q[38],q[29];
-rz(-pi/1024) q[29];
-cx q[38],q[29];
-rz(pi/1024) q[29];
-rz(pi/512) q[38];
-cx q[38],q[30];
-rz(-pi/512) q[30];
-cx q[38],q[30];
-rz(pi/512) q[30];
-rz(pi/256) q[38];
-cx q[38],q[31];
-rz(-pi/256) q[31];
-cx q[38],q[31];
-rz(pi/256) q[31];
-rz(pi/128) q[38];
-cx q[38],q[32];
-rz(-pi/128) q[32];
-cx q[38],q[32];
-rz(pi/128) q[32];
-rz(pi/64) q[38];
-cx q[38],q[33];
-rz(-pi/64) q[33];
-cx q[38],q[33];
-rz(pi/64) q[33];
-rz(pi/32) q[38];
-cx q[38],q[34];
-rz(-pi/32) q[34];
-cx q[38],q[34];
-rz(pi/32) q[34];
-rz(pi/16) q[38];
-cx q[38],q[35];
-rz(-pi/16) q[35];
-cx q[38],q[35];
-rz(pi/16) q[35];
-rz(pi/8) q[38];
-cx q[38],q[36];
-rz(-pi/8) q[36];
-cx q[38],q[36];
-rz(pi/8) q[36];
-rz(pi/4) q[38];
-cx q[38],q[37];
-rz(-pi/4) q[37];
-cx q[38],q[37];
-rz(pi/4) q[37];
-rz(pi/2) q[38];
-sx q[38];
-rz(pi/2) q[38];
-rz(pi/1073741824) q[9];
-rz(2.85726187356867e-12) q[39];
-cx q[39],q[0];
-rz(-2.85726187356867e-12) q[0];
-cx q[39],q[0];
-rz(2.85726187356867e-12) q[0];
-rz(5.71452374713734e-12) q[39];
-cx q[39],q[1];
-rz(-5.71452374713734e-12) q[1];
-cx q[39],q[1];
-rz(5.71452374713734e-12) q[1];
-rz(1.14290474942747e-11) q[39];
-cx q[39],q[2];
-rz(-1.14290474942747e-11) q[2];
-cx q[39],q[2];
-rz(1.14290474942747e-11) q[2];
-rz(2.28580949885494e-11) q[39];
-cx q[39],q[3];
-rz(-2.28580949885494e-11) q[3];
-cx q[39],q[3];
-rz(2.28580949885494e-11) q[3];
-rz(4.57161899770987e-11) q[39];
-cx q[39],q[4];
-rz(-4.57161899770987e-11) q[4];
-cx q[39],q[4];
-rz(9.14323799541975e-11) q[39];
-cx q[39],q[5];
-rz(4.57161899770987e-11) q[4];
-rz(-9.14323799541975e-11) q[5];
-cx q[39],q[5];
-rz(1.82864759908395e-10) q[39];
-cx q[39],q[6];
-rz(9.14323799541975e-11) q[5];
-rz(-1.82864759908395e-10) q[6];
-cx q[39],q[6];
-rz(3.6572951981679e-10) q[39];
-cx q[39],q[7];
-rz(1.82864759908395e-10) q[6];
-rz(-3.6572951981679e-10) q[7];
-cx q[39],q[7];
-rz(7.3145903963358e-10) q[39];
-cx q[39],q[8];
-rz(3.6572951981679e-10) q[7];
-rz(-7.3145903963358e-10) q[8];
-cx q[39],q[8];
-rz(pi/2147483648) q[39];
-cx q[39],q[9];
-rz(7.3145903963358e-10) q[8];
-rz(-pi/2147483648) q[9];
-cx q[39],q[9];
-rz(pi/1073741824) q[39];
-cx q[39],q[10];
-rz(-pi/1073741824) q[10];
-cx q[39],q[10];
-rz(pi/1073741824) q[10];
-rz(pi/536870912) q[39];
-cx q[39],q[11];
-rz(-pi/536870912) q[11];
-cx q[39],q[11];
-rz(pi/536870912) q[11];
-rz(pi/268435456) q[39];
-cx q[39],q[12];
-rz(-pi/268435456) q[12];
-cx q[39],q[12];
-rz(pi/268435456) q[12];
-rz(pi/134217728) q[39];
-cx q[39],q[13];
-rz(-pi/134217728) q[13];
-cx q[39],q[13];
-rz(pi/134217728) q[13];
-rz(pi/67108864) q[39];
-cx q[39],q[14];
-rz(-pi/67108864) q[14];
-cx q[39],q[14];
-rz(pi/67108864) q[14];
-rz(pi/33554432) q[39];
-cx q[39],q[15];
-rz(-pi/33554432) q[15];
-cx q[39],q[15];
-rz(pi/33554432) q[15];
-rz(pi/16777216) q[39];
-cx q[39],q[16];
-rz(-pi/16777216) q[16];
-cx q[39],q[16];
-rz(pi/16777216) q[16];
-rz(pi/8388608) q[39];
-cx q[39],q[17];
-rz(-pi/8388608) q[17];
-cx q[39],q[17];
-rz(pi/8388608) q[17];
-rz(pi/4194304) q[39];
-cx q[39],q[18];
-rz(-pi/4194304) q[18];
-cx q[39],q[18];
-rz(pi/4194304) q[18];
-rz(pi/2097152) q[39];
-cx q[39],q[19];
-rz(-pi/2097152) q[19];
-cx q[39],q[19];
-rz(pi/2097152) q[19];
-rz(pi/1048576) q[39];
-cx q[39],q[20];
-rz(-pi/1048576) q[20];
-cx q[39],q[20];
-rz(pi/1048576) q[20];
-rz(pi/524288) q[39];
-cx q[39],q[21];
-rz(-pi/524288) q[21];
-cx q[39],q[21];
-rz(pi/524288) q[21];
-rz(pi/262144) q[39];
-cx q[39],q[22];
-rz(-pi/262144) q[22];
-cx q[39],q[22];
-rz(pi/262144) q[22];
-rz(pi/131072) q[39];
-cx q[39],q[23];
-rz(-pi/131072) q[23];
-cx q[39],q[23];
-rz(pi/131072) q[23];
-rz(pi/65536) q[39];
-cx q[39],q[24];
-rz(-pi/65536) q[24];
-cx q[39],q[24];
-rz(pi/65536) q[24];
-rz(pi/32768) q[39];
-cx q[39],q[25];
-rz(-pi/32768) q[25];
-cx q[39],q[25];
-rz(pi/32768) q[25];
-rz(pi/16384) q[39];
-cx q[39],q[26];
-rz(-pi/16384) q[26];
-cx q[39],q[26];
-rz(pi/16384) q[26];
-rz(pi/8192) q[39];
-cx q[39],q[27];
-rz(-pi/8192) q[27];
-cx q[39],q[27];
-rz(pi/8192) q[27];
-rz(pi/4096) q[39];
-cx q[39],q[28];
-rz(-pi/4096) q[28];
-cx q[39],q[28];
-rz(pi/4096) q[28];
-rz(pi/2048) q[39];
-cx q[39],q[29];
-rz(-pi/2048) q[29];
-cx q[39],q[29];
-rz(pi/2048) q[29];
-rz(pi/1024) q[39];
-cx q[39],q[30];
-rz(-pi/1024) q[30];
-cx q[39],q[30];
-rz(pi/1024) q[30];
-rz(pi/512) q[39];
-cx q[39],q[31];
-rz(-pi/512) q[31];
-cx q[39],q[31];
-rz(pi/512) q[31];
-rz(pi/256) q[39];
-cx q[39],q[32];
-rz(-pi/256) q[32];
-cx q[39],q[32];
-rz(pi/256) q[32];
-rz(pi/128) q[39];
-cx q[39],q[33];
-rz(-pi/128) q[33];
-cx q[39],q[33];
-rz(pi/128) q[33];
-rz(pi/64) q[39];
-cx q[39],q[34];
-rz(-pi/64) q[34];
-cx q[39],q[34];
-rz(pi/64) q[34];
-rz(pi/32) q[39];
-cx q[39],q[35];
-rz(-pi/32) q[35];
-cx q[39],q[35];
-rz(pi/32) q[35];
-rz(pi/16) q[39];
-cx q[39],q[36];
-rz(-pi/16) q[36];
-cx q[39],q[36];
-rz(pi/16) q[36];
-rz(pi/8) q[39];
-cx q[39],q[37];
-rz(-pi/8) q[37];
-cx q[39],q[37];
-rz(pi/8) q[37];
-rz(pi/4) q[39];
-cx q[39],q[38];
-rz(-pi/4) q[38];
-cx q[39],q[38];
-rz(pi/4) q[38];
-rz(pi/2) q[39];
-sx q[39];
-rz(pi/2) q[39];
-rz(pi/2147483648) q[9];
-rz(1.42863093678434e-12) q[40];
-cx q[40],q[0];
-rz(-1.42863093678434e-12) q[0];
-cx q[40],q[0];
-rz(1.42863093678434e-12) q[0];
-rz(2.85726187356867e-12) q[40];
-cx q[40],q[1];
-rz(-2.85726187356867e-12) q[1];
-cx q[40],q[1];
-rz(2.85726187356867e-12) q[1];
-rz(5.71452374713734e-12) q[40];
-cx q[40],q[2];
-rz(-5.71452374713734e-12) q[2];
-cx q[40],q[2];
-rz(5.71452374713734e-12) q[2];
-rz(1.14290474942747e-11) q[40];
-cx q[40],q[3];
-rz(-1.14290474942747e-11) q[3];
-cx q[40],q[3];
-rz(1.14290474942747e-11) q[3];
-rz(2.28580949885494e-11) q[40];
-cx q[40],q[4];
-rz(-2.28580949885494e-11) q[4];
-cx q[40],q[4];
-rz(2.28580949885494e-11) q[4];
-rz(4.57161899770987e-11) q[40];
-cx q[40],q[5];
-rz(-4.57161899770987e-11) q[5];
-cx q[40],q[5];
-rz(9.14323799541975e-11) q[40];
-cx q[40],q[6];
-rz(4.57161899770987e-11) q[5];
-rz(-9.14323799541975e-11) q[6];
-cx q[40],q[6];
-rz(1.82864759908395e-10) q[40];
-cx q[40],q[7];
-rz(9.14323799541975e-11) q[6];
-rz(-1.82864759908395e-10) q[7];
-cx q[40],q[7];
-rz(3.6572951981679e-10) q[40];
-cx q[40],q[8];
-rz(1.82864759908395e-10) q[7];
-rz(-3.6572951981679e-10) q[8];
-cx q[40],q[8];
-rz(7.3145903963358e-10) q[40];
-cx q[40],q[9];
-rz(3.6572951981679e-10) q[8];
-rz(-7.3145903963358e-10) q[9];
-cx q[40],q[9];
-rz(pi/2147483648) q[40];
-cx q[40],q[10];
-rz(-pi/2147483648) q[10];
-cx q[40],q[10];
-rz(pi/2147483648) q[10];
-rz(pi/1073741824) q[40];
-cx q[40],q[11];
-rz(-pi/1073741824) q[11];
-cx q[40],q[11];
-rz(pi/1073741824) q[11];
-rz(pi/536870912) q[40];
-cx q[40],q[12];
-rz(-pi/536870912) q[12];
-cx q[40],q[12];
-rz(pi/536870912) q[12];
-rz(pi/268435456) q[40];
-cx q[40],q[13];
-rz(-pi/268435456) q[13];
-cx q[40],q[13];
-rz(pi/268435456) q[13];
-rz(pi/134217728) q[40];
-cx q[40],q[14];
-rz(-pi/134217728) q[14];
-cx q[40],q[14];
-rz(pi/134217728) q[14];
-rz(pi/67108864) q[40];
-cx q[40],q[15];
-rz(-pi/67108864) q[15];
-cx q[40],q[15];
-rz(pi/67108864) q[15];
-rz(pi/33554432) q[40];
-cx q[40],q[16];
-rz(-pi/33554432) q[16];
-cx q[40],q[16];
-rz(pi/33554432) q[16];
-rz(pi/16777216) q[40];
-cx q[40],q[17];
-rz(-pi/16777216) q[17];
-cx q[40],q[17];
-rz(pi/16777216) q[17];
-rz(pi/8388608) q[40];
-cx q[40],q[18];
-rz(-pi/8388608) q[18];
-cx q[40],q[18];
-rz(pi/8388608) q[18];
-rz(pi/4194304) q[40];
-cx q[40],q[19];
-rz(-pi/4194304) q[19];
-cx q[40],q[19];
-rz(pi/4194304) q[19];
-rz(pi/2097152) q[40];
-cx q[40],q[20];
-rz(-pi/2097152) q[20];
-cx q[40],q[20];
-rz(pi/2097152) q[20];
-rz(pi/1048576) q[40];
-cx q[40],q[21];
-rz(-pi/1048576) q[21];
-cx q[40],q[21];
-rz(pi/1048576) q[21];
-rz(pi/524288) q[40];
-cx q[40],q[22];
-rz(-pi/524288) q[22];
-cx q[40],q[22];
-rz(pi/524288) q[22];
-rz(pi/262144) q[40];
-cx q[40],q[23];
-rz(-pi/262144) q[23];
-cx q[40],q[23];
-rz(pi/262144) q[23];
-rz(pi/131072) q[40];
-cx q[40],q[24];
-rz(-pi/131072) q[24];
-cx q[40],q[24];
-rz(pi/131072) q[24];
-rz(pi/65536) q[40];
-cx q[40],q[25];
-rz(-pi/65536) q[25];
-cx q[40],q[25];
-rz(pi/65536) q[25];
-rz(pi/32768) q[40];
-cx q[40],q[26];
-rz(-pi/32768) q[26];
-cx q[40],q[26];
-rz(pi/32768) q[26];
-rz(pi/16384) q[40];
-cx q[40],q[27];
-rz(-pi/16384) q[27];
-cx q[40],q[27];
-rz(pi/16384) q[27];
-rz(pi/8192) q[40];
-cx q[40],q[28];
-rz(-pi/8192) q[28];
-cx q[40],q[28];
-rz(pi/8192) q[28];
-rz(pi/4096) q[40];
-cx q[40],q[29];
-rz(-pi/4096) q[29];
-cx q[40],q[29];
-rz(pi/4096) q[29];
-rz(pi/2048) q[40];
-cx q[40],q[30];
-rz(-pi/2048) q[30];
-cx q[40],q[30];
-rz(pi/2048) q[30];
-rz(pi/1024) q[40];
-cx q[40],q[31];
-rz(-pi/1024) q[31];
-cx q[40],q[31];
-rz(pi/1024) q[31];
-rz(pi/512) q[40];
-cx q[40],q[32];
-rz(-pi/512) q[32];
-cx q[40],q[32];
-rz(pi/512) q[32];
-rz(pi/256) q[40];
-cx q[40],q[33];
-rz(-pi/256) q[33];
-cx q[40],q[33];
-rz(pi/256) q[33];
-rz(pi/128) q[40];
-cx q[40],q[34];
-rz(-pi/128) q[34];
-cx q[40],q[34];
-rz(pi/128) q[34];
-rz(pi/64) q[40];
-cx q[40],q[35];
-rz(-pi/64) q[35];
-cx q[40],q[35];
-rz(pi/64) q[35];
-rz(pi/32) q[40];
-cx q[40],q[36];
-rz(-pi/32) q[36];
-cx q[40],q[36];
-rz(pi/32) q[36];
-rz(pi/16) q[40];
-cx q[40],q[37];
-rz(-pi/16) q[37];
-cx q[40],q[37];
-rz(pi/16) q[37];
-rz(pi/8) q[40];
-cx q[40],q[38];
-rz(-pi/8) q[38];
-cx q[40],q[38];
-rz(pi/8) q[38];
-rz(pi/4) q[40];
-cx q[40],q[39];
-rz(-pi/4) q[39];
-cx q[40],q[39];
-rz(pi/4) q[39];
-rz(pi/2) q[40];
-sx q[40];
-rz(pi/2) q[40];
-rz(7.3145903963358e-10) q[9];
-rz(1.42863093678434e-12) q[41];
-cx q[41],q[1];
-rz(-1.42863093678434e-12) q[1];
-cx q[41],q[1];
-rz(1.42863093678434e-12) q[1];
-rz(2.85726187356867e-12) q[41];
-cx q[41],q[2];
-rz(-2.85726187356867e-12) q[2];
-cx q[41],q[2];
-rz(2.85726187356867e-12) q[2];
-rz(5.71452374713734e-12) q[41];
-cx q[41],q[3];
-rz(-5.71452374713734e-12) q[3];
-cx q[41],q[3];
-rz(5.71452374713734e-12) q[3];
-rz(1.14290474942747e-11) q[41];
-cx q[41],q[4];
-rz(-1.14290474942747e-11) q[4];
-cx q[41],q[4];
-rz(1.14290474942747e-11) q[4];
-rz(2.28580949885494e-11) q[41];
-cx q[41],q[5];
-rz(-2.28580949885494e-11) q[5];
-cx q[41],q[5];
-rz(4.57161899770987e-11) q[41];
-cx q[41],q[6];
-rz(2.28580949885494e-11) q[5];
-rz(-4.57161899770987e-11) q[6];
-cx q[41],q[6];
-rz(9.14323799541975e-11) q[41];
-cx q[41],q[7];
-rz(4.57161899770987e-11) q[6];
-rz(-9.14323799541975e-11) q[7];
-cx q[41],q[7];
-rz(1.82864759908395e-10) q[41];
-cx q[41],q[8];
-rz(9.14323799541975e-11) q[7];
-rz(-1.82864759908395e-10) q[8];
-cx q[41],q[8];
-rz(3.6572951981679e-10) q[41];
-cx q[41],q[9];
-rz(1.82864759908395e-10) q[8];
-rz(-3.6572951981679e-10) q[9];
-cx q[41],q[9];
-rz(7.3145903963358e-10) q[41];
-cx q[41],q[10];
-rz(-7.3145903963358e-10) q[10];
-cx q[41],q[10];
-rz(7.3145903963358e-10) q[10];
-rz(pi/2147483648) q[41];
-cx q[41],q[11];
-rz(-pi/2147483648) q[11];
-cx q[41],q[11];
-rz(pi/2147483648) q[11];
-rz(pi/1073741824) q[41];
-cx q[41],q[12];
-rz(-pi/1073741824) q[12];
-cx q[41],q[12];
-rz(pi/1073741824) q[12];
-rz(pi/536870912) q[41];
-cx q[41],q[13];
-rz(-pi/536870912) q[13];
-cx q[41],q[13];
-rz(pi/536870912) q[13];
-rz(pi/268435456) q[41];
-cx q[41],q[14];
-rz(-pi/268435456) q[14];
-cx q[41],q[14];
-rz(pi/268435456) q[14];
-rz(pi/134217728) q[41];
-cx q[41],q[15];
-rz(-pi/134217728) q[15];
-cx q[41],q[15];
-rz(pi/134217728) q[15];
-rz(pi/67108864) q[41];
-cx q[41],q[16];
-rz(-pi/67108864) q[16];
-cx q[41],q[16];
-rz(pi/67108864) q[16];
-rz(pi/33554432) q[41];
-cx q[41],q[17];
-rz(-pi/33554432) q[17];
-cx q[41],q[17];
-rz(pi/33554432) q[17];
-rz(pi/16777216) q[41];
-cx q[41],q[18];
-rz(-pi/16777216) q[18];
-cx q[41],q[18];
-rz(pi/16777216) q[18];
-rz(pi/8388608) q[41];
-cx q[41],q[19];
-rz(-pi/8388608) q[19];
-cx q[41],q[19];
-rz(pi/8388608) q[19];
-rz(pi/4194304) q[41];
-cx q[41],q[20];
-rz(-pi/4194304) q[20];
-cx q[41],q[20];
-rz(pi/4194304) q[20];
-rz(pi/2097152) q[41];
-cx q[41],q[21];
-rz(-pi/2097152) q[21];
-cx q[41],q[21];
-rz(pi/2097152) q[21];
-rz(pi/1048576) q[41];
-cx q[41],q[22];
-rz(-pi/1048576) q[22];
-cx q[41],q[22];
-rz(pi/1048576) q[22];
-rz(pi/524288) q[41];
-cx q[41],q[23];
-rz(-pi/524288) q[23];
-cx q[41],q[23];
-rz(pi/524288) q[23];
-rz(pi/262144) q[41];
-cx q[41],q[24];
-rz(-pi/262144) q[24];
-cx q[41],q[24];
-rz(pi/262144) q[24];
-rz(pi/131072) q[41];
-cx q[41],q[25];
-rz(-pi/131072) q[25];
-cx q[41],q[25];
-rz(pi/131072) q[25];
-rz(pi/65536) q[41];
-cx q[41],q[26];
-rz(-pi/65536) q[26];
-cx q[41],q[26];
-rz(pi/65536) q[26];
-rz(pi/32768) q[41];
-cx q[41],q[27];
-rz(-pi/32768) q[27];
-cx q[41],q[27];
-rz(pi/32768) q[27];
-rz(pi/16384) q[41];
-cx q[41],q[28];
-rz(-pi/16384) q[28];
-cx q[41],q[28];
-rz(pi/16384) q[28];
-rz(pi/8192) q[41];
-cx q[41],q[29];
-rz(-pi/8192) q[29];
-cx q[41],q[29];
-rz(pi/8192) q[29];
-rz(pi/4096) q[41];
-cx q[41],q[30];
-rz(-pi/4096) q[30];
-cx q[41],q[30];
-rz(pi/4096) q[30];
-rz(pi/2048) q[41];
-cx q[41],q[31];
-rz(-pi/2048) q[31];
-cx q[41],q[31];
-rz(pi/2048) q[31];
-rz(pi/1024) q[41];
-cx q[41],q[32];
-rz(-pi/1024) q[32];
-cx q[41],q[32];
-rz(pi/1024) q[32];
-rz(pi/512) q[41];
-cx q[41],q[33];
-rz(-pi/512) q[33];
-cx q[41],q[33];
-rz(pi/512) q[33];
-rz(pi/256) q[41];
-cx q[41],q[34];
-rz(-pi/256) q[34];
-cx q[41],q[34];
-rz(pi/256) q[34];
-rz(pi/128) q[41];
-cx q[41],q[35];
-rz(-pi/128) q[35];
-cx q[41],q[35];
-rz(pi/128) q[35];
-rz(pi/64) q[41];
-cx q[41],q[36];
-rz(-pi/64) q[36];
-cx q[41],q[36];
-rz(pi/64) q[36];
-rz(pi/32) q[41];
-cx q[41],q[37];
-rz(-pi/32) q[37];
-cx q[41],q[37];
-rz(pi/32) q[37];
-rz(pi/16) q[41];
-cx q[41],q[38];
-rz(-pi/16) q[38];
-cx q[41],q[38];
-rz(pi/16) q[38];
-rz(pi/8) q[41];
-cx q[41],q[39];
-rz(-pi/8) q[39];
-cx q[41],q[39];
-rz(pi/8) q[39];
-rz(pi/4) q[41];
-cx q[41],q[40];
-rz(-pi/4) q[40];
-cx q[41],q[40];
-rz(pi/4) q[40];
-rz(pi/2) q[41];
-sx q[41];
-rz(pi/2) q[41];
-rz(3.6572951981679e-10) q[9];
-rz(1.42863093678434e-12) q[42];
-cx q[42],q[2];
-rz(-1.42863093678434e-12) q[2];
-cx q[42],q[2];
-rz(1.42863093678434e-12) q[2];
-rz(2.85726187356867e-12) q[42];
-cx q[42],q[3];
-rz(-2.85726187356867e-12) q[3];
-cx q[42],q[3];
-rz(2.85726187356867e-12) q[3];
-rz(5.71452374713734e-12) q[42];
-cx q[42],q[4];
-rz(-5.71452374713734e-12) q[4];
-cx q[42],q[4];
-rz(5.71452374713734e-12) q[4];
-rz(1.14290474942747e-11) q[42];
-cx q[42],q[5];
-rz(-1.14290474942747e-11) q[5];
-cx q[42],q[5];
-rz(2.28580949885494e-11) q[42];
-cx q[42],q[6];
-rz(1.14290474942747e-11) q[5];
-rz(-2.28580949885494e-11) q[6];
-cx q[42],q[6];
-rz(4.57161899770987e-11) q[42];
-cx q[42],q[7];
-rz(2.28580949885494e-11) q[6];
-rz(-4.57161899770987e-11) q[7];
-cx q[42],q[7];
-rz(9.14323799541975e-11) q[42];
-cx q[42],q[8];
-rz(4.57161899770987e-11) q[7];
-rz(-9.14323799541975e-11) q[8];
-cx q[42],q[8];
-rz(1.82864759908395e-10) q[42];
-cx q[42],q[9];
-rz(9.14323799541975e-11) q[8];
-rz(-1.82864759908395e-10) q[9];
-cx q[42],q[9];
-rz(3.6572951981679e-10) q[42];
-cx q[42],q[10];
-rz(-3.6572951981679e-10) q[10];
-cx q[42],q[10];
-rz(3.6572951981679e-10) q[10];
-rz(7.3145903963358e-10) q[42];
-cx q[42],q[11];
-rz(-7.3145903963358e-10) q[11];
-cx q[42],q[11];
-rz(7.3145903963358e-10) q[11];
-rz(pi/2147483648) q[42];
-cx q[42],q[12];
-rz(-pi/2147483648) q[12];
-cx q[42],q[12];
-rz(pi/2147483648) q[12];
-rz(pi/1073741824) q[42];
-cx q[42],q[13];
-rz(-pi/1073741824) q[13];
-cx q[42],q[13];
-rz(pi/1073741824) q[13];
-rz(pi/536870912) q[42];
-cx q[42],q[14];
-rz(-pi/536870912) q[14];
-cx q[42],q[14];
-rz(pi/536870912) q[14];
-rz(pi/268435456) q[42];
-cx q[42],q[15];
-rz(-pi/268435456) q[15];
-cx q[42],q[15];
-rz(pi/268435456) q[15];
-rz(pi/134217728) q[42];
-cx q[42],q[16];
-rz(-pi/134217728) q[16];
-cx q[42],q[16];
-rz(pi/134217728) q[16];
-rz(pi/67108864) q[42];
-cx q[42],q[17];
-rz(-pi/67108864) q[17];
-cx q[42],q[17];
-rz(pi/67108864) q[17];
-rz(pi/33554432) q[42];
-cx q[42],q[18];
-rz(-pi/33554432) q[18];
-cx q[42],q[18];
-rz(pi/33554432) q[18];
-rz(pi/16777216) q[42];
-cx q[42],q[19];
-rz(-pi/16777216) q[19];
-cx q[42],q[19];
-rz(pi/16777216) q[19];
-rz(pi/8388608) q[42];
-cx q[42],q[20];
-rz(-pi/8388608) q[20];
-cx q[42],q[20];
-rz(pi/8388608) q[20];
-rz(pi/4194304) q[42];
-cx q[42],q[21];
-rz(-pi/4194304) q[21];
-cx q[42],q[21];
-rz(pi/4194304) q[21];
-rz(pi/2097152) q[42];
-cx q[42],q[22];
-rz(-pi/2097152) q[22];
-cx q[42],q[22];
-rz(pi/2097152) q[22];
-rz(pi/1048576) q[42];
-cx q[42],q[23];
-rz(-pi/1048576) q[23];
-cx q[42],q[23];
-rz(pi/1048576) q[23];
-rz(pi/524288) q[42];
-cx q[42],q[24];
-rz(-pi/524288) q[24];
-cx q[42],q[24];
-rz(pi/524288) q[24];
-rz(pi/262144) q[42];
-cx q[42],q[25];
-rz(-pi/262144) q[25];
-cx q[42],q[25];
-rz(pi/262144) q[25];
-rz(pi/131072) q[42];
-cx q[42],q[26];
-rz(-pi/131072) q[26];
-cx q[42],q[26];
-rz(pi/131072) q[26];
-rz(pi/65536) q[42];
-cx q[42],q[27];
-rz(-pi/65536) q[27];
-cx q[42],q[27];
-rz(pi/65536) q[27];
-rz(pi/32768) q[42];
-cx q[42],q[28];
-rz(-pi/32768) q[28];
-cx q[42],q[28];
-rz(pi/32768) q[28];
-rz(pi/16384) q[42];
-cx q[42],q[29];
-rz(-pi/16384) q[29];
-cx q[42],q[29];
-rz(pi/16384) q[29];
-rz(pi/8192) q[42];
-cx q[42],q[30];
-rz(-pi/8192) q[30];
-cx q[42],q[30];
-rz(pi/8192) q[30];
-rz(pi/4096) q[42];
-cx q[42],q[31];
-rz(-pi/4096) q[31];
-cx q[42],q[31];
-rz(pi/4096) q[31];
-rz(pi/2048) q[42];
-cx q[42],q[32];
-rz(-pi/2048) q[32];
-cx q[42],q[32];
-rz(pi/2048) q[32];
-rz(pi/1024) q[42];
-cx q[42],q[33];
-rz(-pi/1024) q[33];
-cx q[42],q[33];
-rz(pi/1024) q[33];
-rz(pi/512) q[42];
-cx q[42],q[34];
-rz(-pi/512) q[34];
-cx q[42],q[34];
-rz(pi/512) q[34];
-rz(pi/256) q[42];
-cx q[42],q[35];
-rz(-pi/256) q[35];
-cx q[42],q[35];
-rz(pi/256) q[35];
-rz(pi/128) q[42];
-cx q[42],q[36];
-rz(-pi/128) q[36];
-cx q[42],q[36];
-rz(pi/128) q[36];
-rz(pi/64) q[42];
-cx q[42],q[37];
-rz(-pi/64) q[37];
-cx q[42],q[37];
-rz(pi/64) q[37];
-rz(pi/32) q[42];
-cx q[42],q[38];
-rz(-pi/32) q[38];
-cx q[42],q[38];
-rz(pi/32) q[38];
-rz(pi/16) q[42];
-cx q[42],q[39];
-rz(-pi/16) q[39];
-cx q[42],q[39];
-rz(pi/16) q[39];
-rz(pi/8) q[42];
-cx q[42],q[40];
-rz(-pi/8) q[40];
-cx q[42],q[40];
-rz(pi/8) q[40];
-rz(pi/4) q[42];
-cx q[42],q[41];
-rz(-pi/4) q[41];
-cx q[42],q[41];
-rz(pi/4) q[41];
-rz(pi/2) q[42];
-sx q[42];
-rz(pi/2) q[42];
-rz(1.82864759908395e-10) q[9];
-rz(1.42863093678434e-12) q[43];
-cx q[43],q[3];
-rz(-1.42863093678434e-12) q[3];
-cx q[43],q[3];
-rz(1.42863093678434e-12) q[3];
-rz(2.85726187356867e-12) q[43];
-cx q[43],q[4];
-rz(-2.85726187356867e-12) q[4];
-cx q[43],q[4];
-rz(2.85726187356867e-12) q[4];
-rz(5.71452374713734e-12) q[43];
-cx q[43],q[5];
-rz(-5.71452374713734e-12) q[5];
-cx q[43],q[5];
-rz(1.14290474942747e-11) q[43];
-cx q[43],q[6];
-rz(5.71452374713734e-12) q[5];
-rz(-1.14290474942747e-11) q[6];
-cx q[43],q[6];
-rz(2.28580949885494e-11) q[43];
-cx q[43],q[7];
-rz(1.14290474942747e-11) q[6];
-rz(-2.28580949885494e-11) q[7];
-cx q[43],q[7];
-rz(4.57161899770987e-11) q[43];
-cx q[43],q[8];
-rz(2.28580949885494e-11) q[7];
-rz(-4.57161899770987e-11) q[8];
-cx q[43],q[8];
-rz(9.14323799541975e-11) q[43];
-cx q[43],q[9];
-rz(4.57161899770987e-11) q[8];
-rz(-9.14323799541975e-11) q[9];
-cx q[43],q[9];
-rz(1.82864759908395e-10) q[43];
-cx q[43],q[10];
-rz(-1.82864759908395e-10) q[10];
-cx q[43],q[10];
-rz(1.82864759908395e-10) q[10];
-rz(3.6572951981679e-10) q[43];
-cx q[43],q[11];
-rz(-3.6572951981679e-10) q[11];
-cx q[43],q[11];
-rz(3.6572951981679e-10) q[11];
-rz(7.3145903963358e-10) q[43];
-cx q[43],q[12];
-rz(-7.3145903963358e-10) q[12];
-cx q[43],q[12];
-rz(7.3145903963358e-10) q[12];
-rz(pi/2147483648) q[43];
-cx q[43],q[13];
-rz(-pi/2147483648) q[13];
-cx q[43],q[13];
-rz(pi/2147483648) q[13];
-rz(pi/1073741824) q[43];
-cx q[43],q[14];
-rz(-pi/1073741824) q[14];
-cx q[43],q[14];
-rz(pi/1073741824) q[14];
-rz(pi/536870912) q[43];
-cx q[43],q[15];
-rz(-pi/536870912) q[15];
-cx q[43],q[15];
-rz(pi/536870912) q[15];
-rz(pi/268435456) q[43];
-cx q[43],q[16];
-rz(-pi/268435456) q[16];
-cx q[43],q[16];
-rz(pi/268435456) q[16];
-rz(pi/134217728) q[43];
-cx q[43],q[17];
-rz(-pi/134217728) q[17];
-cx q[43],q[17];
-rz(pi/134217728) q[17];
-rz(pi/67108864) q[43];
-cx q[43],q[18];
-rz(-pi/67108864) q[18];
-cx q[43],q[18];
-rz(pi/67108864) q[18];
-rz(pi/33554432) q[43];
-cx q[43],q[19];
-rz(-pi/33554432) q[19];
-cx q[43],q[19];
-rz(pi/33554432) q[19];
-rz(pi/16777216) q[43];
-cx q[43],q[20];
-rz(-pi/16777216) q[20];
-cx q[43],q[20];
-rz(pi/16777216) q[20];
-rz(pi/8388608) q[43];
-cx q[43],q[21];
-rz(-pi/8388608) q[21];
-cx q[43],q[21];
-rz(pi/8388608) q[21];
-rz(pi/4194304) q[43];
-cx q[43],q[22];
-rz(-pi/4194304) q[22];
-cx q[43],q[22];
-rz(pi/4194304) q[22];
-rz(pi/2097152) q[43];
-cx q[43],q[23];
-rz(-pi/2097152) q[23];
-cx q[43],q[23];
-rz(pi/2097152) q[23];
-rz(pi/1048576) q[43];
-cx q[43],q[24];
-rz(-pi/1048576) q[24];
-cx q[43],q[24];
-rz(pi/1048576) q[24];
-rz(pi/524288) q[43];
-cx q[43],q[25];
-rz(-pi/524288) q[25];
-cx q[43],q[25];
-rz(pi/524288) q[25];
-rz(pi/262144) q[43];
-cx q[43],q[26];
-rz(-pi/262144) q[26];
-cx q[43],q[26];
-rz(pi/262144) q[26];
-rz(pi/131072) q[43];
-cx q[43],q[27];
-rz(-pi/131072) q[27];
-cx q[43],q[27];
-rz(pi/131072) q[27];
-rz(pi/65536) q[43];
-cx q[43],q[28];
-rz(-pi/65536) q[28];
-cx q[43],q[28];
-rz(pi/65536) q[28];
-rz(pi/32768) q[43];
-cx q[43],q[29];
-rz(-pi/32768) q[29];
-cx q[43],q[29];
-rz(pi/32768) q[29];
-rz(pi/16384) q[43];
-cx q[43],q[30];
-rz(-pi/16384) q[30];
-cx q[43],q[30];
-rz(pi/16384) q[30];
-rz(pi/8192) q[43];
-cx q[43],q[31];
-rz(-pi/8192) q[31];
-cx q[43],q[31];
-rz(pi/8192) q[31];
-rz(pi/4096) q[43];
-cx q[43],q[32];
-rz(-pi/4096) q[32];
-cx q[43],q[32];
-rz(pi/4096) q[32];
-rz(pi/2048) q[43];
-cx q[43],q[33];
-rz(-pi/2048) q[33];
-cx q[43],q[33];
-rz(pi/2048) q[33];
-rz(pi/1024) q[43];
-cx q[43],q[34];
-rz(-pi/1024) q[34];
-cx q[43],q[34];
-rz(pi/1024) q[34];
-rz(pi/512) q[43];
-cx q[43],q[35];
-rz(-pi/512) q[35];
-cx q[43],q[35];
-rz(pi/512) q[35];
-rz(pi/256) q[43];
-cx q[43],q[36];
-rz(-pi/256) q[36];
-cx q[43],q[36];
-rz(pi/256) q[36];
-rz(pi/128) q[43];
-cx q[43],q[37];
-rz(-pi/128) q[37];
-cx q[43],q[37];
-rz(pi/128) q[37];
-rz(pi/64) q[43];
-cx q[43],q[38];
-rz(-pi/64) q[38];
-cx q[43],q[38];
-rz(pi/64) q[38];
-rz(pi/32) q[43];
-cx q[43],q[39];
-rz(-pi/32) q[39];
-cx q[43],q[39];
-rz(pi/32) q[39];
-rz(pi/16) q[43];
-cx q[43],q[40];
-rz(-pi/16) q[40];
-cx q[43],q[40];
-rz(pi/16) q[40];
-rz(pi/8) q[43];
-cx q[43],q[41];
-rz(-pi/8) q[41];
-cx q[43],q[41];
-rz(pi/8) q[41];
-rz(pi/4) q[43];
-cx q[43],q[42];
-rz(-pi/4) q[42];
-cx q[43],q[42];
-rz(pi/4) q[42];
-rz(pi/2) q[43];
-sx q[43];
-rz(pi/2) q[43];
-rz(9.14323799541975e-11) q[9];
-rz(1.42863093678434e-12) q[44];
-cx q[44],q[4];
-rz(-1.42863093678434e-12) q[4];
-cx q[44],q[4];
-rz(1.42863093678434e-12) q[4];
-rz(2.85726187356867e-12) q[44];
-cx q[44],q[5];
-rz(-2.85726187356867e-12) q[5];
-cx q[44],q[5];
-rz(5.71452374713734e-12) q[44];
-cx q[44],q[6];
-rz(2.85726187356867e-12) q[5];
-rz(-5.71452374713734e-12) q[6];
-cx q[44],q[6];
-rz(1.14290474942747e-11) q[44];
-cx q[44],q[7];
-rz(5.71452374713734e-12) q[6];
-rz(-1.14290474942747e-11) q[7];
-cx q[44],q[7];
-rz(2.28580949885494e-11) q[44];
-cx q[44],q[8];
-rz(1.14290474942747e-11) q[7];
-rz(-2.28580949885494e-11) q[8];
-cx q[44],q[8];
-rz(4.57161899770987e-11) q[44];
-cx q[44],q[9];
-rz(2.28580949885494e-11) q[8];
-rz(-4.57161899770987e-11) q[9];
-cx q[44],q[9];
-rz(9.14323799541975e-11) q[44];
-cx q[44],q[10];
-rz(-9.14323799541975e-11) q[10];
-cx q[44],q[10];
-rz(9.14323799541975e-11) q[10];
-rz(1.82864759908395e-10) q[44];
-cx q[44],q[11];
-rz(-1.82864759908395e-10) q[11];
-cx q[44],q[11];
-rz(1.82864759908395e-10) q[11];
-rz(3.6572951981679e-10) q[44];
-cx q[44],q[12];
-rz(-3.6572951981679e-10) q[12];
-cx q[44],q[12];
-rz(3.6572951981679e-10) q[12];
-rz(7.3145903963358e-10) q[44];
-cx q[44],q[13];
-rz(-7.3145903963358e-10) q[13];
-cx q[44],q[13];
-rz(7.3145903963358e-10) q[13];
-rz(pi/2147483648) q[44];
-cx q[44],q[14];
-rz(-pi/2147483648) q[14];
-cx q[44],q[14];
-rz(pi/2147483648) q[14];
-rz(pi/1073741824) q[44];
-cx q[44],q[15];
-rz(-pi/1073741824) q[15];
-cx q[44],q[15];
-rz(pi/1073741824) q[15];
-rz(pi/536870912) q[44];
-cx q[44],q[16];
-rz(-pi/536870912) q[16];
-cx q[44],q[16];
-rz(pi/536870912) q[16];
-rz(pi/268435456) q[44];
-cx q[44],q[17];
-rz(-pi/268435456) q[17];
-cx q[44],q[17];
-rz(pi/268435456) q[17];
-rz(pi/134217728) q[44];
-cx q[44],q[18];
-rz(-pi/134217728) q[18];
-cx q[44],q[18];
-rz(pi/134217728) q[18];
-rz(pi/67108864) q[44];
-cx q[44],q[19];
-rz(-pi/67108864) q[19];
-cx q[44],q[19];
-rz(pi/67108864) q[19];
-rz(pi/33554432) q[44];
-cx q[44],q[20];
-rz(-pi/33554432) q[20];
-cx q[44],q[20];
-rz(pi/33554432) q[20];
-rz(pi/16777216) q[44];
-cx q[44],q[21];
-rz(-pi/16777216) q[21];
-cx q[44],q[21];
-rz(pi/16777216) q[21];
-rz(pi/8388608) q[44];
-cx q[44],q[22];
-rz(-pi/8388608) q[22];
-cx q[44],q[22];
-rz(pi/8388608) q[22];
-rz(pi/4194304) q[44];
-cx q[44],q[23];
-rz(-pi/4194304) q[23];
-cx q[44],q[23];
-rz(pi/4194304) q[23];
-rz(pi/2097152) q[44];
-cx q[44],q[24];
-rz(-pi/2097152) q[24];
-cx q[44],q[24];
-rz(pi/2097152) q[24];
-rz(pi/1048576) q[44];
-cx q[44],q[25];
-rz(-pi/1048576) q[25];
-cx q[44],q[25];
-rz(pi/1048576) q[25];
-rz(pi/524288) q[44];
-cx q[44],q[26];
-rz(-pi/524288) q[26];
-cx q[44],q[26];
-rz(pi/524288) q[26];
-rz(pi/262144) q[44];
-cx q[44],q[27];
-rz(-pi/262144) q[27];
-cx q[44],q[27];
-rz(pi/262144) q[27];
-rz(pi/131072) q[44];
-cx q[44],q[28];
-rz(-pi/131072) q[28];
-cx q[44],q[28];
-rz(pi/131072) q[28];
-rz(pi/65536) q[44];
-cx q[44],q[29];
-rz(-pi/65536) q[29];
-cx q[44],q[29];
-rz(pi/65536) q[29];
-rz(pi/32768) q[44];
-cx q[44],q[30];
-rz(-pi/32768) q[30];
-cx q[44],q[30];
-rz(pi/32768) q[30];
-rz(pi/16384) q[44];
-cx q[44],q[31];
-rz(-pi/16384) q[31];
-cx q[44],q[31];
-rz(pi/16384) q[31];
-rz(pi/8192) q[44];
-cx q[44],q[32];
-rz(-pi/8192) q[32];
-cx q[44],q[32];
-rz(pi/8192) q[32];
-rz(pi/4096) q[44];
-cx q[44],q[33];
-rz(-pi/4096) q[33];
-cx q[44],q[33];
-rz(pi/4096) q[33];
-rz(pi/2048) q[44];
-cx q[44],q[34];
-rz(-pi/2048) q[34];
-cx q[44],q[34];
-rz(pi/2048) q[34];
-rz(pi/1024) q[44];
-cx q[44],q[35];
-rz(-pi/1024) q[35];
-cx q[44],q[35];
-rz(pi/1024) q[35];
-rz(pi/512) q[44];
-cx q[44],q[36];
-rz(-pi/512) q[36];
-cx q[44],q[36];
-rz(pi/512) q[36];
-rz(pi/256) q[44];
-cx q[44],q[37];
-rz(-pi/256) q[37];
-cx q[44],q[37];
-rz(pi/256) q[37];
-rz(pi/128) q[44];
-cx q[44],q[38];
-rz(-pi/128) q[38];
-cx q[44],q[38];
-rz(pi/128) q[38];
-rz(pi/64) q[44];
-cx q[44],q[39];
-rz(-pi/64) q[39];
-cx q[44],q[39];
-rz(pi/64) q[39];
-rz(pi/32) q[44];
-cx q[44],q[40];
-rz(-pi/32) q[40];
-cx q[44],q[40];
-rz(pi/32) q[40];
-rz(pi/16) q[44];
-cx q[44],q[41];
-rz(-pi/16) q[41];
-cx q[44],q[41];
-rz(pi/16) q[41];
-rz(pi/8) q[44];
-cx q[44],q[42];
-rz(-pi/8) q[42];
-cx q[44],q[42];
-rz(pi/8) q[42];
-rz(pi/4) q[44];
-cx q[44],q[43];
-rz(-pi/4) q[43];
-cx q[44],q[43];
-rz(pi/4) q[43];
-rz(pi/2) q[44];
-sx q[44];
-rz(pi/2) q[44];
-rz(4.57161899770987e-11) q[9];
-rz(1.42863093678434e-12) q[45];
-cx q[45],q[5];
-rz(-1.42863093678434e-12) q[5];
-cx q[45],q[5];
-rz(2.85726187356867e-12) q[45];
-cx q[45],q[6];
-rz(1.42863093678434e-12) q[5];
-rz(-2.85726187356867e-12) q[6];
-cx q[45],q[6];
-rz(5.71452374713734e-12) q[45];
-cx q[45],q[7];
-rz(2.85726187356867e-12) q[6];
-rz(-5.71452374713734e-12) q[7];
-cx q[45],q[7];
-rz(1.14290474942747e-11) q[45];
-cx q[45],q[8];
-rz(5.71452374713734e-12) q[7];
-rz(-1.14290474942747e-11) q[8];
-cx q[45],q[8];
-rz(2.28580949885494e-11) q[45];
-cx q[45],q[9];
-rz(1.14290474942747e-11) q[8];
-rz(-2.28580949885494e-11) q[9];
-cx q[45],q[9];
-rz(4.57161899770987e-11) q[45];
-cx q[45],q[10];
-rz(-4.57161899770987e-11) q[10];
-cx q[45],q[10];
-rz(4.57161899770987e-11) q[10];
-rz(9.14323799541975e-11) q[45];
-cx q[45],q[11];
-rz(-9.14323799541975e-11) q[11];
-cx q[45],q[11];
-rz(9.14323799541975e-11) q[11];
-rz(1.82864759908395e-10) q[45];
-cx q[45],q[12];
-rz(-1.82864759908395e-10) q[12];
-cx q[45],q[12];
-rz(1.82864759908395e-10) q[12];
-rz(3.6572951981679e-10) q[45];
-cx q[45],q[13];
-rz(-3.6572951981679e-10) q[13];
-cx q[45],q[13];
-rz(3.6572951981679e-10) q[13];
-rz(7.3145903963358e-10) q[45];
-cx q[45],q[14];
-rz(-7.3145903963358e-10) q[14];
-cx q[45],q[14];
-rz(7.3145903963358e-10) q[14];
-rz(pi/2147483648) q[45];
-cx q[45],q[15];
-rz(-pi/2147483648) q[15];
-cx q[45],q[15];
-rz(pi/2147483648) q[15];
-rz(pi/1073741824) q[45];
-cx q[45],q[16];
-rz(-pi/1073741824) q[16];
-cx q[45],q[16];
-rz(pi/1073741824) q[16];
-rz(pi/536870912) q[45];
-cx q[45],q[17];
-rz(-pi/536870912) q[17];
-cx q[45],q[17];
-rz(pi/536870912) q[17];
-rz(pi/268435456) q[45];
-cx q[45],q[18];
-rz(-pi/268435456) q[18];
-cx q[45],q[18];
-rz(pi/268435456) q[18];
-rz(pi/134217728) q[45];
-cx q[45],q[19];
-rz(-pi/134217728) q[19];
-cx q[45],q[19];
-rz(pi/134217728) q[19];
-rz(pi/67108864) q[45];
-cx q[45],q[20];
-rz(-pi/67108864) q[20];
-cx q[45],q[20];
-rz(pi/67108864) q[20];
-rz(pi/33554432) q[45];
-cx q[45],q[21];
-rz(-pi/33554432) q[21];
-cx q[45],q[21];
-rz(pi/33554432) q[21];
-rz(pi/16777216) q[45];
-cx q[45],q[22];
-rz(-pi/16777216) q[22];
-cx q[45],q[22];
-rz(pi/16777216) q[22];
-rz(pi/8388608) q[45];
-cx q[45],q[23];
-rz(-pi/8388608) q[23];
-cx q[45],q[23];
-rz(pi/8388608) q[23];
-rz(pi/4194304) q[45];
-cx q[45],q[24];
-rz(-pi/4194304) q[24];
-cx q[45],q[24];
-rz(pi/4194304) q[24];
-rz(pi/2097152) q[45];
-cx q[45],q[25];
-rz(-pi/2097152) q[25];
-cx q[45],q[25];
-rz(pi/2097152) q[25];
-rz(pi/1048576) q[45];
-cx q[45],q[26];
-rz(-pi/1048576) q[26];
-cx q[45],q[26];
-rz(pi/1048576) q[26];
-rz(pi/524288) q[45];
-cx q[45],q[27];
-rz(-pi/524288) q[27];
-cx q[45],q[27];
-rz(pi/524288) q[27];
-rz(pi/262144) q[45];
-cx q[45],q[28];
-rz(-pi/262144) q[28];
-cx q[45],q[28];
-rz(pi/262144) q[28];
-rz(pi/131072) q[45];
-cx q[45],q[29];
-rz(-pi/131072) q[29];
-cx q[45],q[29];
-rz(pi/131072) q[29];
-rz(pi/65536) q[45];
-cx q[45],q[30];
-rz(-pi/65536) q[30];
-cx q[45],q[30];
-rz(pi/65536) q[30];
-rz(pi/32768) q[45];
-cx q[45],q[31];
-rz(-pi/32768) q[31];
-cx q[45],q[31];
-rz(pi/32768) q[31];
-rz(pi/16384) q[45];
-cx q[45],q[32];
-rz(-pi/16384) q[32];
-cx q[45],q[32];
-rz(pi/16384) q[32];
-rz(pi/8192) q[45];
-cx q[45],q[33];
-rz(-pi/8192) q[33];
-cx q[45],q[33];
-rz(pi/8192) q[33];
-rz(pi/4096) q[45];
-cx q[45],q[34];
-rz(-pi/4096) q[34];
-cx q[45],q[34];
-rz(pi/4096) q[34];
-rz(pi/2048) q[45];
-cx q[45],q[35];
-rz(-pi/2048) q[35];
-cx q[45],q[35];
-rz(pi/2048) q[35];
-rz(pi/1024) q[45];
-cx q[45],q[36];
-rz(-pi/1024) q[36];
-cx q[45],q[36];
-rz(pi/1024) q[36];
-rz(pi/512) q[45];
-cx q[45],q[37];
-rz(-pi/512) q[37];
-cx q[45],q[37];
-rz(pi/512) q[37];
-rz(pi/256) q[45];
-cx q[45],q[38];
-rz(-pi/256) q[38];
-cx q[45],q[38];
-rz(pi/256) q[38];
-rz(pi/128) q[45];
-cx q[45],q[39];
-rz(-pi/128) q[39];
-cx q[45],q[39];
-rz(pi/128) q[39];
-rz(pi/64) q[45];
-cx q[45],q[40];
-rz(-pi/64) q[40];
-cx q[45],q[40];
-rz(pi/64) q[40];
-rz(pi/32) q[45];
-cx q[45],q[41];
-rz(-pi/32) q[41];
-cx q[45],q[41];
-rz(pi/32) q[41];
-rz(pi/16) q[45];
-cx q[45],q[42];
-rz(-pi/16) q[42];
-cx q[45],q[42];
-rz(pi/16) q[42];
-rz(pi/8) q[45];
-cx q[45],q[43];
-rz(-pi/8) q[43];
-cx q[45],q[43];
-rz(pi/8) q[43];
-rz(pi/4) q[45];
-cx q[45],q[44];
-rz(-pi/4) q[44];
-cx q[45],q[44];
-rz(pi/4) q[44];
-rz(pi/2) q[45];
-sx q[45];
-rz(pi/2) q[45];
-rz(2.28580949885494e-11) q[9];
-rz(1.42863093678434e-12) q[46];
-cx q[46],q[6];
-rz(-1.42863093678434e-12) q[6];
-cx q[46],q[6];
-rz(2.85726187356867e-12) q[46];
-cx q[46],q[7];
-rz(1.42863093678434e-12) q[6];
-rz(-2.85726187356867e-12) q[7];
-cx q[46],q[7];
-rz(5.71452374713734e-12) q[46];
-cx q[46],q[8];
-rz(2.85726187356867e-12) q[7];
-rz(-5.71452374713734e-12) q[8];
-cx q[46],q[8];
-rz(1.14290474942747e-11) q[46];
-cx q[46],q[9];
-rz(5.71452374713734e-12) q[8];
-rz(-1.14290474942747e-11) q[9];
-cx q[46],q[9];
-rz(2.28580949885494e-11) q[46];
-cx q[46],q[10];
-rz(-2.28580949885494e-11) q[10];
-cx q[46],q[10];
-rz(2.28580949885494e-11) q[10];
-rz(4.57161899770987e-11) q[46];
-cx q[46],q[11];
-rz(-4.57161899770987e-11) q[11];
-cx q[46],q[11];
-rz(4.57161899770987e-11) q[11];
-rz(9.14323799541975e-11) q[46];
-cx q[46],q[12];
-rz(-9.14323799541975e-11) q[12];
-cx q[46],q[12];
-rz(9.14323799541975e-11) q[12];
-rz(1.82864759908395e-10) q[46];
-cx q[46],q[13];
-rz(-1.82864759908395e-10) q[13];
-cx q[46],q[13];
-rz(1.82864759908395e-10) q[13];
-rz(3.6572951981679e-10) q[46];
-cx q[46],q[14];
-rz(-3.6572951981679e-10) q[14];
-cx q[46],q[14];
-rz(3.6572951981679e-10) q[14];
-rz(7.3145903963358e-10) q[46];
-cx q[46],q[15];
-rz(-7.3145903963358e-10) q[15];
-cx q[46],q[15];
-rz(7.3145903963358e-10) q[15];
-rz(pi/2147483648) q[46];
-cx q[46],q[16];
-rz(-pi/2147483648) q[16];
-cx q[46],q[16];
-rz(pi/2147483648) q[16];
-rz(pi/1073741824) q[46];
-cx q[46],q[17];
-rz(-pi/1073741824) q[17];
-cx q[46],q[17];
-rz(pi/1073741824) q[17];
-rz(pi/536870912) q[46];
-cx q[46],q[18];
-rz(-pi/536870912) q[18];
-cx q[46],q[18];
-rz(pi/536870912) q[18];
-rz(pi/268435456) q[46];
-cx q[46],q[19];
-rz(-pi/268435456) q[19];
-cx q[46],q[19];
-rz(pi/268435456) q[19];
-rz(pi/134217728) q[46];
-cx q[46],q[20];
-rz(-pi/134217728) q[20];
-cx q[46],q[20];
-rz(pi/134217728) q[20];
-rz(pi/67108864) q[46];
-cx q[46],q[21];
-rz(-pi/67108864) q[21];
-cx q[46],q[21];
-rz(pi/67108864) q[21];
-rz(pi/33554432) q[46];
-cx q[46],q[22];
-rz(-pi/33554432) q[22];
-cx q[46],q[22];
-rz(pi/33554432) q[22];
-rz(pi/16777216) q[46];
-cx q[46],q[23];
-rz(-pi/16777216) q[23];
-cx q[46],q[23];
-rz(pi/16777216) q[23];
-rz(pi/8388608) q[46];
-cx q[46],q[24];
-rz(-pi/8388608) q[24];
-cx q[46],q[24];
-rz(pi/8388608) q[24];
-rz(pi/4194304) q[46];
-cx q[46],q[25];
-rz(-pi/4194304) q[25];
-cx q[46],q[25];
-rz(pi/4194304) q[25];
-rz(pi/2097152) q[46];
-cx q[46],q[26];
-rz(-pi/2097152) q[26];
-cx q[46],q[26];
-rz(pi/2097152) q[26];
-rz(pi/1048576) q[46];
-cx q[46],q[27];
-rz(-pi/1048576) q[27];
-cx q[46],q[27];
-rz(pi/1048576) q[27];
-rz(pi/524288) q[46];
-cx q[46],q[28];
-rz(-pi/524288) q[28];
-cx q[46],q[28];
-rz(pi/524288) q[28];
-rz(pi/262144) q[46];
-cx q[46],q[29];
-rz(-pi/262144) q[29];
-cx q[46],q[29];
-rz(pi/262144) q[29];
-rz(pi/131072) q[46];
-cx q[46],q[30];
-rz(-pi/131072) q[30];
-cx q[46],q[30];
-rz(pi/131072) q[30];
-rz(pi/65536) q[46];
-cx q[46],q[31];
-rz(-pi/65536) q[31];
-cx q[46],q[31];
-rz(pi/65536) q[31];
-rz(pi/32768) q[46];
-cx q[46],q[32];
-rz(-pi/32768) q[32];
-cx q[46],q[32];
-rz(pi/32768) q[32];
-rz(pi/16384) q[46];
-cx q[46],q[33];
-rz(-pi/16384) q[33];
-cx q[46],q[33];
-rz(pi/16384) q[33];
-rz(pi/8192) q[46];
-cx q[46],q[34];
-rz(-pi/8192) q[34];
-cx q[46],q[34];
-rz(pi/8192) q[34];
-rz(pi/4096) q[46];
-cx q[46],q[35];
-rz(-pi/4096) q[35];
-cx q[46],q[35];
-rz(pi/4096) q[35];
-rz(pi/2048) q[46];
-cx q[46],q[36];
-rz(-pi/2048) q[36];
-cx q[46],q[36];
-rz(pi/2048) q[36];
-rz(pi/1024) q[46];
-cx q[46],q[37];
-rz(-pi/1024) q[37];
-cx q[46],q[37];
-rz(pi/1024) q[37];
-rz(pi/512) q[46];
-cx q[46],q[38];
-rz(-pi/512) q[38];
-cx q[46],q[38];
-rz(pi/512) q[38];
-rz(pi/256) q[46];
-cx q[46],q[39];
-rz(-pi/256) q[39];
-cx q[46],q[39];
-rz(pi/256) q[39];
-rz(pi/128) q[46];
-cx q[46],q[40];
-rz(-pi/128) q[40];
-cx q[46],q[40];
-rz(pi/128) q[40];
-rz(pi/64) q[46];
-cx q[46],q[41];
-rz(-pi/64) q[41];
-cx q[46],q[41];
-rz(pi/64) q[41];
-rz(pi/32) q[46];
-cx q[46],q[42];
-rz(-pi/32) q[42];
-cx q[46],q[42];
-rz(pi/32) q[42];
-rz(pi/16) q[46];
-cx q[46],q[43];
-rz(-pi/16) q[43];
-cx q[46],q[43];
-rz(pi/16) q[43];
-rz(pi/8) q[46];
-cx q[46],q[44];
-rz(-pi/8) q[44];
-cx q[46],q[44];
-rz(pi/8) q[44];
-rz(pi/4) q[46];
-cx q[46],q[45];
-rz(-pi/4) q[45];
-cx q[46],q[45];
-rz(pi/4) q[45];
-rz(pi/2) q[46];
-sx q[46];
-rz(pi/2) q[46];
-rz(1.14290474942747e-11) q[9];
-rz(1.42863093678434e-12) q[47];
-cx q[47],q[7];
-rz(-1.42863093678434e-12) q[7];
-cx q[47],q[7];
-rz(2.85726187356867e-12) q[47];
-cx q[47],q[8];
-rz(1.42863093678434e-12) q[7];
-rz(-2.85726187356867e-12) q[8];
-cx q[47],q[8];
-rz(5.71452374713734e-12) q[47];
-cx q[47],q[9];
-rz(2.85726187356867e-12) q[8];
-rz(-5.71452374713734e-12) q[9];
-cx q[47],q[9];
-rz(1.14290474942747e-11) q[47];
-cx q[47],q[10];
-rz(-1.14290474942747e-11) q[10];
-cx q[47],q[10];
-rz(1.14290474942747e-11) q[10];
-rz(2.28580949885494e-11) q[47];
-cx q[47],q[11];
-rz(-2.28580949885494e-11) q[11];
-cx q[47],q[11];
-rz(2.28580949885494e-11) q[11];
-rz(4.57161899770987e-11) q[47];
-cx q[47],q[12];
-rz(-4.57161899770987e-11) q[12];
-cx q[47],q[12];
-rz(4.57161899770987e-11) q[12];
-rz(9.14323799541975e-11) q[47];
-cx q[47],q[13];
-rz(-9.14323799541975e-11) q[13];
-cx q[47],q[13];
-rz(9.14323799541975e-11) q[13];
-rz(1.82864759908395e-10) q[47];
-cx q[47],q[14];
-rz(-1.82864759908395e-10) q[14];
-cx q[47],q[14];
-rz(1.82864759908395e-10) q[14];
-rz(3.6572951981679e-10) q[47];
-cx q[47],q[15];
-rz(-3.6572951981679e-10) q[15];
-cx q[47],q[15];
-rz(3.6572951981679e-10) q[15];
-rz(7.3145903963358e-10) q[47];
-cx q[47],q[16];
-rz(-7.3145903963358e-10) q[16];
-cx q[47],q[16];
-rz(7.3145903963358e-10) q[16];
-rz(pi/2147483648) q[47];
-cx q[47],q[17];
-rz(-pi/2147483648) q[17];
-cx q[47],q[17];
-rz(pi/2147483648) q[17];
-rz(pi/1073741824) q[47];
-cx q[47],q[18];
-rz(-pi/1073741824) q[18];
-cx q[47],q[18];
-rz(pi/1073741824) q[18];
-rz(pi/536870912) q[47];
-cx q[47],q[19];
-rz(-pi/536870912) q[19];
-cx q[47],q[19];
-rz(pi/536870912) q[19];
-rz(pi/268435456) q[47];
-cx q[47],q[20];
-rz(-pi/268435456) q[20];
-cx q[47],q[20];
-rz(pi/268435456) q[20];
-rz(pi/134217728) q[47];
-cx q[47],q[21];
-rz(-pi/134217728) q[21];
-cx q[47],q[21];
-rz(pi/134217728) q[21];
-rz(pi/67108864) q[47];
-cx q[47],q[22];
-rz(-pi/67108864) q[22];
-cx q[47],q[22];
-rz(pi/67108864) q[22];
-rz(pi/33554432) q[47];
-cx q[47],q[23];
-rz(-pi/33554432) q[23];
-cx q[47],q[23];
-rz(pi/33554432) q[23];
-rz(pi/16777216) q[47];
-cx q[47],q[24];
-rz(-pi/16777216) q[24];
-cx q[47],q[24];
-rz(pi/16777216) q[24];
-rz(pi/8388608) q[47];
-cx q[47],q[25];
-rz(-pi/8388608) q[25];
-cx q[47],q[25];
-rz(pi/8388608) q[25];
-rz(pi/4194304) q[47];
-cx q[47],q[26];
-rz(-pi/4194304) q[26];
-cx q[47],q[26];
-rz(pi/4194304) q[26];
-rz(pi/2097152) q[47];
-cx q[47],q[27];
-rz(-pi/2097152) q[27];
-cx q[47],q[27];
-rz(pi/2097152) q[27];
-rz(pi/1048576) q[47];
-cx q[47],q[28];
-rz(-pi/1048576) q[28];
-cx q[47],q[28];
-rz(pi/1048576) q[28];
-rz(pi/524288) q[47];
-cx q[47],q[29];
-rz(-pi/524288) q[29];
-cx q[47],q[29];
-rz(pi/524288) q[29];
-rz(pi/262144) q[47];
-cx q[47],q[30];
-rz(-pi/262144) q[30];
-cx q[47],q[30];
-rz(pi/262144) q[30];
-rz(pi/131072) q[47];
-cx q[47],q[31];
-rz(-pi/131072) q[31];
-cx q[47],q[31];
-rz(pi/131072) q[31];
-rz(pi/65536) q[47];
-cx q[47],q[32];
-rz(-pi/65536) q[32];
-cx q[47],q[32];
-rz(pi/65536) q[32];
-rz(pi/32768) q[47];
-cx q[47],q[33];
-rz(-pi/32768) q[33];
-cx q[47],q[33];
-rz(pi/32768) q[33];
-rz(pi/16384) q[47];
-cx q[47],q[34];
-rz(-pi/16384) q[34];
-cx q[47],q[34];
-rz(pi/16384) q[34];
-rz(pi/8192) q[47];
-cx q[47],q[35];
-rz(-pi/8192) q[35];
-cx q[47],q[35];
-rz(pi/8192) q[35];
-rz(pi/4096) q[47];
-cx q[47],q[36];
-rz(-pi/4096) q[36];
-cx q[47],q[36];
-rz(pi/4096) q[36];
-rz(pi/2048) q[47];
-cx q[47],q[37];
-rz(-pi/2048) q[37];
-cx q[47],q[37];
-rz(pi/2048) q[37];
-rz(pi/1024) q[47];
-cx q[47],q[38];
-rz(-pi/1024) q[38];
-cx q[47],q[38];
-rz(pi/1024) q[38];
-rz(pi/512) q[47];
-cx q[47],q[39];
-rz(-pi/512) q[39];
-cx q[47],q[39];
-rz(pi/512) q[39];
-rz(pi/256) q[47];
-cx q[47],q[40];
-rz(-pi/256) q[40];
-cx q[47],q[40];
-rz(pi/256) q[40];
-rz(pi/128) q[47];
-cx q[47],q[41];
-rz(-pi/128) q[41];
-cx q[47],q[41];
-rz(pi/128) q[41];
-rz(pi/64) q[47];
-cx q[47],q[42];
-rz(-pi/64) q[42];
-cx q[47],q[42];
-rz(pi/64) q[42];
-rz(pi/32) q[47];
-cx q[47],q[43];
-rz(-pi/32) q[43];
-cx q[47],q[43];
-rz(pi/32) q[43];
-rz(pi/16) q[47];
-cx q[47],q[44];
-rz(-pi/16) q[44];
-cx q[47],q[44];
-rz(pi/16) q[44];
-rz(pi/8) q[47];
-cx q[47],q[45];
-rz(-pi/8) q[45];
-cx q[47],q[45];
-rz(pi/8) q[45];
-rz(pi/4) q[47];
-cx q[47],q[46];
-rz(-pi/4) q[46];
-cx q[47],q[46];
-rz(pi/4) q[46];
-rz(pi/2) q[47];
-sx q[47];
-rz(pi/2) q[47];
-rz(5.71452374713734e-12) q[9];
-rz(1.42863093678434e-12) q[48];
-cx q[48],q[8];
-rz(-1.42863093678434e-12) q[8];
-cx q[48],q[8];
-rz(2.85726187356867e-12) q[48];
-cx q[48],q[9];
-rz(1.42863093678434e-12) q[8];
-rz(-2.85726187356867e-12) q[9];
-cx q[48],q[9];
-rz(5.71452374713734e-12) q[48];
-cx q[48],q[10];
-rz(-5.71452374713734e-12) q[10];
-cx q[48],q[10];
-rz(5.71452374713734e-12) q[10];
-rz(1.14290474942747e-11) q[48];
-cx q[48],q[11];
-rz(-1.14290474942747e-11) q[11];
-cx q[48],q[11];
-rz(1.14290474942747e-11) q[11];
-rz(2.28580949885494e-11) q[48];
-cx q[48],q[12];
-rz(-2.28580949885494e-11) q[12];
-cx q[48],q[12];
-rz(2.28580949885494e-11) q[12];
-rz(4.57161899770987e-11) q[48];
-cx q[48],q[13];
-rz(-4.57161899770987e-11) q[13];
-cx q[48],q[13];
-rz(4.57161899770987e-11) q[13];
-rz(9.14323799541975e-11) q[48];
-cx q[48],q[14];
-rz(-9.14323799541975e-11) q[14];
-cx q[48],q[14];
-rz(9.14323799541975e-11) q[14];
-rz(1.82864759908395e-10) q[48];
-cx q[48],q[15];
-rz(-1.82864759908395e-10) q[15];
-cx q[48],q[15];
-rz(1.82864759908395e-10) q[15];
-rz(3.6572951981679e-10) q[48];
-cx q[48],q[16];
-rz(-3.6572951981679e-10) q[16];
-cx q[48],q[16];
-rz(3.6572951981679e-10) q[16];
-rz(7.3145903963358e-10) q[48];
-cx q[48],q[17];
-rz(-7.3145903963358e-10) q[17];
-cx q[48],q[17];
-rz(7.3145903963358e-10) q[17];
-rz(pi/2147483648) q[48];
-cx q[48],q[18];
-rz(-pi/2147483648) q[18];
-cx q[48],q[18];
-rz(pi/2147483648) q[18];
-rz(pi/1073741824) q[48];
-cx q[48],q[19];
-rz(-pi/1073741824) q[19];
-cx q[48],q[19];
-rz(pi/1073741824) q[19];
-rz(pi/536870912) q[48];
-cx q[48],q[20];
-rz(-pi/536870912) q[20];
-cx q[48],q[20];
-rz(pi/536870912) q[20];
-rz(pi/268435456) q[48];
-cx q[48],q[21];
-rz(-pi/268435456) q[21];
-cx q[48],q[21];
-rz(pi/268435456) q[21];
-rz(pi/134217728) q[48];
-cx q[48],q[22];
-rz(-pi/134217728) q[22];
-cx q[48],q[22];
-rz(pi/134217728) q[22];
-rz(pi/67108864) q[48];
-cx q[48],q[23];
-rz(-pi/67108864) q[23];
-cx q[48],q[23];
-rz(pi/67108864) q[23];
-rz(pi/33554432) q[48];
-cx q[48],q[24];
-rz(-pi/33554432) q[24];
-cx q[48],q[24];
-rz(pi/33554432) q[24];
-rz(pi/16777216) q[48];
-cx q[48],q[25];
-rz(-pi/16777216) q[25];
-cx q[48],q[25];
-rz(pi/16777216) q[25];
-rz(pi/8388608) q[48];
-cx q[48],q[26];
-rz(-pi/8388608) q[26];
-cx q[48],q[26];
-rz(pi/8388608) q[26];
-rz(pi/4194304) q[48];
-cx q[48],q[27];
-rz(-pi/4194304) q[27];
-cx q[48],q[27];
-rz(pi/4194304) q[27];
-rz(pi/2097152) q[48];
-cx q[48],q[28];
-rz(-pi/2097152) q[28];
-cx q[48],q[28];
-rz(pi/2097152) q[28];
-rz(pi/1048576) q[48];
-cx q[48],q[29];
-rz(-pi/1048576) q[29];
-cx q[48],q[29];
-rz(pi/1048576) q[29];
-rz(pi/524288) q[48];
-cx q[48],q[30];
-rz(-pi/524288) q[30];
-cx q[48],q[30];
-rz(pi/524288) q[30];
-rz(pi/262144) q[48];
-cx q[48],q[31];
-rz(-pi/262144) q[31];
-cx q[48],q[31];
-rz(pi/262144) q[31];
-rz(pi/131072) q[48];
-cx q[48],q[32];
-rz(-pi/131072) q[32];
-cx q[48],q[32];
-rz(pi/131072) q[32];
-rz(pi/65536) q[48];
-cx q[48],q[33];
-rz(-pi/65536) q[33];
-cx q[48],q[33];
-rz(pi/65536) q[33];
-rz(pi/32768) q[48];
-cx q[48],q[34];
-rz(-pi/32768) q[34];
-cx q[48],q[34];
-rz(pi/32768) q[34];
-rz(pi/16384) q[48];
-cx q[48],q[35];
-rz(-pi/16384) q[35];
-cx q[48],q[35];
-rz(pi/16384) q[35];
-rz(pi/8192) q[48];
-cx q[48],q[36];
-rz(-pi/8192) q[36];
-cx q[48],q[36];
-rz(pi/8192) q[36];
-rz(pi/4096) q[48];
-cx q[48],q[37];
-rz(-pi/4096) q[37];
-cx q[48],q[37];
-rz(pi/4096) q[37];
-rz(pi/2048) q[48];
-cx q[48],q[38];
-rz(-pi/2048) q[38];
-cx q[48],q[38];
-rz(pi/2048) q[38];
-rz(pi/1024) q[48];
-cx q[48],q[39];
-rz(-pi/1024) q[39];
-cx q[48],q[39];
-rz(pi/1024) q[39];
-rz(pi/512) q[48];
-cx q[48],q[40];
-rz(-pi/512) q[40];
-cx q[48],q[40];
-rz(pi/512) q[40];
-rz(pi/256) q[48];
-cx q[48],q[41];
-rz(-pi/256) q[41];
-cx q[48],q[41];
-rz(pi/256) q[41];
-rz(pi/128) q[48];
-cx q[48],q[42];
-rz(-pi/128) q[42];
-cx q[48],q[42];
-rz(pi/128) q[42];
-rz(pi/64) q[48];
-cx q[48],q[43];
-rz(-pi/64) q[43];
-cx q[48],q[43];
-rz(pi/64) q[43];
-rz(pi/32) q[48];
-cx q[48],q[44];
-rz(-pi/32) q[44];
-cx q[48],q[44];
-rz(pi/32) q[44];
-rz(pi/16) q[48];
-cx q[48],q[45];
-rz(-pi/16) q[45];
-cx q[48],q[45];
-rz(pi/16) q[45];
-rz(pi/8) q[48];
-cx q[48],q[46];
-rz(-pi/8) q[46];
-cx q[48],q[46];
-rz(pi/8) q[46];
-rz(pi/4) q[48];
-cx q[48],q[47];
-rz(-pi/4) q[47];
-cx q[48],q[47];
-rz(pi/4) q[47];
-rz(pi/2) q[48];
-sx q[48];
-rz(pi/2) q[48];
-rz(2.85726187356867e-12) q[9];
-rz(1.42863093678434e-12) q[49];
-cx q[49],q[9];
-rz(-1.42863093678434e-12) q[9];
-cx q[49],q[9];
-rz(2.85726187356867e-12) q[49];
-cx q[49],q[10];
-rz(-2.85726187356867e-12) q[10];
-cx q[49],q[10];
-rz(2.85726187356867e-12) q[10];
-rz(5.71452374713734e-12) q[49];
-cx q[49],q[11];
-rz(-5.71452374713734e-12) q[11];
-cx q[49],q[11];
-rz(5.71452374713734e-12) q[11];
-rz(1.14290474942747e-11) q[49];
-cx q[49],q[12];
-rz(-1.14290474942747e-11) q[12];
-cx q[49],q[12];
-rz(1.14290474942747e-11) q[12];
-rz(2.28580949885494e-11) q[49];
-cx q[49],q[13];
-rz(-2.28580949885494e-11) q[13];
-cx q[49],q[13];
-rz(2.28580949885494e-11) q[13];
-rz(4.57161899770987e-11) q[49];
-cx q[49],q[14];
-rz(-4.57161899770987e-11) q[14];
-cx q[49],q[14];
-rz(4.57161899770987e-11) q[14];
-rz(9.14323799541975e-11) q[49];
-cx q[49],q[15];
-rz(-9.14323799541975e-11) q[15];
-cx q[49],q[15];
-rz(9.14323799541975e-11) q[15];
-rz(1.82864759908395e-10) q[49];
-cx q[49],q[16];
-rz(-1.82864759908395e-10) q[16];
-cx q[49],q[16];
-rz(1.82864759908395e-10) q[16];
-rz(3.6572951981679e-10) q[49];
-cx q[49],q[17];
-rz(-3.6572951981679e-10) q[17];
-cx q[49],q[17];
-rz(3.6572951981679e-10) q[17];
-rz(7.3145903963358e-10) q[49];
-cx q[49],q[18];
-rz(-7.3145903963358e-10) q[18];
-cx q[49],q[18];
-rz(7.3145903963358e-10) q[18];
-rz(pi/2147483648) q[49];
-cx q[49],q[19];
-rz(-pi/2147483648) q[19];
-cx q[49],q[19];
-rz(pi/2147483648) q[19];
-rz(pi/1073741824) q[49];
-cx q[49],q[20];
-rz(-pi/1073741824) q[20];
-cx q[49],q[20];
-rz(pi/1073741824) q[20];
-rz(pi/536870912) q[49];
-cx q[49],q[21];
-rz(-pi/536870912) q[21];
-cx q[49],q[21];
-rz(pi/536870912) q[21];
-rz(pi/268435456) q[49];
-cx q[49],q[22];
-rz(-pi/268435456) q[22];
-cx q[49],q[22];
-rz(pi/268435456) q[22];
-rz(pi/134217728) q[49];
-cx q[49],q[23];
-rz(-pi/134217728) q[23];
-cx q[49],q[23];
-rz(pi/134217728) q[23];
-rz(pi/67108864) q[49];
-cx q[49],q[24];
-rz(-pi/67108864) q[24];
-cx q[49],q[24];
-rz(pi/67108864) q[24];
-rz(pi/33554432) q[49];
-cx q[49],q[25];
-rz(-pi/33554432) q[25];
-cx q[49],q[25];
-rz(pi/33554432) q[25];
-rz(pi/16777216) q[49];
-cx q[49],q[26];
-rz(-pi/16777216) q[26];
-cx q[49],q[26];
-rz(pi/16777216) q[26];
-rz(pi/8388608) q[49];
-cx q[49],q[27];
-rz(-pi/8388608) q[27];
-cx q[49],q[27];
-rz(pi/8388608) q[27];
-rz(pi/4194304) q[49];
-cx q[49],q[28];
-rz(-pi/4194304) q[28];
-cx q[49],q[28];
-rz(pi/4194304) q[28];
-rz(pi/2097152) q[49];
-cx q[49],q[29];
-rz(-pi/2097152) q[29];
-cx q[49],q[29];
-rz(pi/2097152) q[29];
-rz(pi/1048576) q[49];
-cx q[49],q[30];
-rz(-pi/1048576) q[30];
-cx q[49],q[30];
-rz(pi/1048576) q[30];
-rz(pi/524288) q[49];
-cx q[49],q[31];
-rz(-pi/524288) q[31];
-cx q[49],q[31];
-rz(pi/524288) q[31];
-rz(pi/262144) q[49];
-cx q[49],q[32];
-rz(-pi/262144) q[32];
-cx q[49],q[32];
-rz(pi/262144) q[32];
-rz(pi/131072) q[49];
-cx q[49],q[33];
-rz(-pi/131072) q[33];
-cx q[49],q[33];
-rz(pi/131072) q[33];
-rz(pi/65536) q[49];
-cx q[49],q[34];
-rz(-pi/65536) q[34];
-cx q[49],q[34];
-rz(pi/65536) q[34];
-rz(pi/32768) q[49];
-cx q[49],q[35];
-rz(-pi/32768) q[35];
-cx q[49],q[35];
-rz(pi/32768) q[35];
-rz(pi/16384) q[49];
-cx q[49],q[36];
-rz(-pi/16384) q[36];
-cx q[49],q[36];
-rz(pi/16384) q[36];
-rz(pi/8192) q[49];
-cx q[49],q[37];
-rz(-pi/8192) q[37];
-cx q[49],q[37];
-rz(pi/8192) q[37];
-rz(pi/4096) q[49];
-cx q[49],q[38];
-rz(-pi/4096) q[38];
-cx q[49],q[38];
-rz(pi/4096) q[38];
-rz(pi/2048) q[49];
-cx q[49],q[39];
-rz(-pi/2048) q[39];
-cx q[49],q[39];
-rz(pi/2048) q[39];
-rz(pi/1024) q[49];
-cx q[49],q[40];
-rz(-pi/1024) q[40];
-cx q[49],q[40];
-rz(pi/1024) q[40];
-rz(pi/512) q[49];
-cx q[49],q[41];
-rz(-pi/512) q[41];
-cx q[49],q[41];
-rz(pi/512) q[41];
-rz(pi/256) q[49];
-cx q[49],q[42];
-rz(-pi/256) q[42];
-cx q[49],q[42];
-rz(pi/256) q[42];
-rz(pi/128) q[49];
-cx q[49],q[43];
-rz(-pi/128) q[43];
-cx q[49],q[43];
-rz(pi/128) q[43];
-rz(pi/64) q[49];
-cx q[49],q[44];
-rz(-pi/64) q[44];
-cx q[49],q[44];
-rz(pi/64) q[44];
-rz(pi/32) q[49];
-cx q[49],q[45];
-rz(-pi/32) q[45];
-cx q[49],q[45];
-rz(pi/32) q[45];
-rz(pi/16) q[49];
-cx q[49],q[46];
-rz(-pi/16) q[46];
-cx q[49],q[46];
-rz(pi/16) q[46];
-rz(pi/8) q[49];
-cx q[49],q[47];
-rz(-pi/8) q[47];
-cx q[49],q[47];
-rz(pi/8) q[47];
-rz(pi/4) q[49];
-cx q[49],q[48];
-rz(-pi/4) q[48];
-cx q[49],q[48];
-rz(pi/4) q[48];
-rz(pi/2) q[49];
-sx q[49];
-rz(pi/2) q[49];
-rz(1.42863093678434e-12) q[9];
-rz(1.42863093678434e-12) q[50];
-cx q[50],q[10];
-rz(-1.42863093678434e-12) q[10];
-cx q[50],q[10];
-rz(1.42863093678434e-12) q[10];
-rz(2.85726187356867e-12) q[50];
-cx q[50],q[11];
-rz(-2.85726187356867e-12) q[11];
-cx q[50],q[11];
-rz(2.85726187356867e-12) q[11];
-rz(5.71452374713734e-12) q[50];
-cx q[50],q[12];
-rz(-5.71452374713734e-12) q[12];
-cx q[50],q[12];
-rz(5.71452374713734e-12) q[12];
-rz(1.14290474942747e-11) q[50];
-cx q[50],q[13];
-rz(-1.14290474942747e-11) q[13];
-cx q[50],q[13];
-rz(1.14290474942747e-11) q[13];
-rz(2.28580949885494e-11) q[50];
-cx q[50],q[14];
-rz(-2.28580949885494e-11) q[14];
-cx q[50],q[14];
-rz(2.28580949885494e-11) q[14];
-rz(4.57161899770987e-11) q[50];
-cx q[50],q[15];
-rz(-4.57161899770987e-11) q[15];
-cx q[50],q[15];
-rz(4.57161899770987e-11) q[15];
-rz(9.14323799541975e-11) q[50];
-cx q[50],q[16];
-rz(-9.14323799541975e-11) q[16];
-cx q[50],q[16];
-rz(9.14323799541975e-11) q[16];
-rz(1.82864759908395e-10) q[50];
-cx q[50],q[17];
-rz(-1.82864759908395e-10) q[17];
-cx q[50],q[17];
-rz(1.82864759908395e-10) q[17];
-rz(3.6572951981679e-10) q[50];
-cx q[50],q[18];
-rz(-3.6572951981679e-10) q[18];
-cx q[50],q[18];
-rz(3.6572951981679e-10) q[18];
-rz(7.3145903963358e-10) q[50];
-cx q[50],q[19];
-rz(-7.3145903963358e-10) q[19];
-cx q[50],q[19];
-rz(7.3145903963358e-10) q[19];
-rz(pi/2147483648) q[50];
-cx q[50],q[20];
-rz(-pi/2147483648) q[20];
-cx q[50],q[20];
-rz(pi/2147483648) q[20];
-rz(pi/1073741824) q[50];
-cx q[50],q[21];
-rz(-pi/1073741824) q[21];
-cx q[50],q[21];
-rz(pi/1073741824) q[21];
-rz(pi/536870912) q[50];
-cx q[50],q[22];
-rz(-pi/536870912) q[22];
-cx q[50],q[22];
-rz(pi/536870912) q[22];
-rz(pi/268435456) q[50];
-cx q[50],q[23];
-rz(-pi/268435456) q[23];
-cx q[50],q[23];
-rz(pi/268435456) q[23];
-rz(pi/134217728) q[50];
-cx q[50],q[24];
-rz(-pi/134217728) q[24];
-cx q[50],q[24];
-rz(pi/134217728) q[24];
-rz(pi/67108864) q[50];
-cx q[50],q[25];
-rz(-pi/67108864) q[25];
-cx q[50],q[25];
-rz(pi/67108864) q[25];
-rz(pi/33554432) q[50];
-cx q[50],q[26];
-rz(-pi/33554432) q[26];
-cx q[50],q[26];
-rz(pi/33554432) q[26];
-rz(pi/16777216) q[50];
-cx q[50],q[27];
-rz(-pi/16777216) q[27];
-cx q[50],q[27];
-rz(pi/16777216) q[27];
-rz(pi/8388608) q[50];
-cx q[50],q[28];
-rz(-pi/8388608) q[28];
-cx q[50],q[28];
-rz(pi/8388608) q[28];
-rz(pi/4194304) q[50];
-cx q[50],q[29];
-rz(-pi/4194304) q[29];
-cx q[50],q[29];
-rz(pi/4194304) q[29];
-rz(pi/2097152) q[50];
-cx q[50],q[30];
-rz(-pi/2097152) q[30];
-cx q[50],q[30];
-rz(pi/2097152) q[30];
-rz(pi/1048576) q[50];
-cx q[50],q[31];
-rz(-pi/1048576) q[31];
-cx q[50],q[31];
-rz(pi/1048576) q[31];
-rz(pi/524288) q[50];
-cx q[50],q[32];
-rz(-pi/524288) q[32];
-cx q[50],q[32];
-rz(pi/524288) q[32];
-rz(pi/262144) q[50];
-cx q[50],q[33];
-rz(-pi/262144) q[33];
-cx q[50],q[33];
-rz(pi/262144) q[33];
-rz(pi/131072) q[50];
-cx q[50],q[34];
-rz(-pi/131072) q[34];
-cx q[50],q[34];
-rz(pi/131072) q[34];
-rz(pi/65536) q[50];
-cx q[50],q[35];
-rz(-pi/65536) q[35];
-cx q[50],q[35];
-rz(pi/65536) q[35];
-rz(pi/32768) q[50];
-cx q[50],q[36];
-rz(-pi/32768) q[36];
-cx q[50],q[36];
-rz(pi/32768) q[36];
-rz(pi/16384) q[50];
-cx q[50],q[37];
-rz(-pi/16384) q[37];
-cx q[50],q[37];
-rz(pi/16384) q[37];
-rz(pi/8192) q[50];
-cx q[50],q[38];
-rz(-pi/8192) q[38];
-cx q[50],q[38];
-rz(pi/8192) q[38];
-rz(pi/4096) q[50];
-cx q[50],q[39];
-rz(-pi/4096) q[39];
-cx q[50],q[39];
-rz(pi/4096) q[39];
-rz(pi/2048) q[50];
-cx q[50],q[40];
-rz(-pi/2048) q[40];
-cx q[50],q[40];
-rz(pi/2048) q[40];
-rz(pi/1024) q[50];
-cx q[50],q[41];
-rz(-pi/1024) q[41];
-cx q[50],q[41];
-rz(pi/1024) q[41];
-rz(pi/512) q[50];
-cx q[50],q[42];
-rz(-pi/512) q[42];
-cx q[50],q[42];
-rz(pi/512) q[42];
-rz(pi/256) q[50];
-cx q[50],q[43];
-rz(-pi/256) q[43];
-cx q[50],q[43];
-rz(pi/256) q[43];
-rz(pi/128) q[50];
-cx q[50],q[44];
-rz(-pi/128) q[44];
-cx q[50],q[44];
-rz(pi/128) q[44];
-rz(pi/64) q[50];
-cx q[50],q[45];
-rz(-pi/64) q[45];
-cx q[50],q[45];
-rz(pi/64) q[45];
-rz(pi/32) q[50];
-cx q[50],q[46];
-rz(-pi/32) q[46];
-cx q[50],q[46];
-rz(pi/32) q[46];
-rz(pi/16) q[50];
-cx q[50],q[47];
-rz(-pi/16) q[47];
-cx q[50],q[47];
-rz(pi/16) q[47];
-rz(pi/8) q[50];
-cx q[50],q[48];
-rz(-pi/8) q[48];
-cx q[50],q[48];
-rz(pi/8) q[48];
-rz(pi/4) q[50];
-cx q[50],q[49];
-rz(-pi/4) q[49];
-cx q[50],q[49];
-rz(pi/4) q[49];
-rz(pi/2) q[50];
-sx q[50];
-rz(pi/2) q[50];
-rz(1.42863093678434e-12) q[51];
-cx q[51],q[11];
-rz(-1.42863093678434e-12) q[11];
-cx q[51],q[11];
-rz(1.42863093678434e-12) q[11];
-rz(2.85726187356867e-12) q[51];
-cx q[51],q[12];
-rz(-2.85726187356867e-12) q[12];
-cx q[51],q[12];
-rz(2.85726187356867e-12) q[12];
-rz(5.71452374713734e-12) q[51];
-cx q[51],q[13];
-rz(-5.71452374713734e-12) q[13];
-cx q[51],q[13];
-rz(5.71452374713734e-12) q[13];
-rz(1.14290474942747e-11) q[51];
-cx q[51],q[14];
-rz(-1.14290474942747e-11) q[14];
-cx q[51],q[14];
-rz(1.14290474942747e-11) q[14];
-rz(2.28580949885494e-11) q[51];
-cx q[51],q[15];
-rz(-2.28580949885494e-11) q[15];
-cx q[51],q[15];
-rz(2.28580949885494e-11) q[15];
-rz(4.57161899770987e-11) q[51];
-cx q[51],q[16];
-rz(-4.57161899770987e-11) q[16];
-cx q[51],q[16];
-rz(4.57161899770987e-11) q[16];
-rz(9.14323799541975e-11) q[51];
-cx q[51],q[17];
-rz(-9.14323799541975e-11) q[17];
-cx q[51],q[17];
-rz(9.14323799541975e-11) q[17];
-rz(1.82864759908395e-10) q[51];
-cx q[51],q[18];
-rz(-1.82864759908395e-10) q[18];
-cx q[51],q[18];
-rz(1.82864759908395e-10) q[18];
-rz(3.6572951981679e-10) q[51];
-cx q[51],q[19];
-rz(-3.6572951981679e-10) q[19];
-cx q[51],q[19];
-rz(3.6572951981679e-10) q[19];
-rz(7.3145903963358e-10) q[51];
-cx q[51],q[20];
-rz(-7.3145903963358e-10) q[20];
-cx q[51],q[20];
-rz(7.3145903963358e-10) q[20];
-rz(pi/2147483648) q[51];
-cx q[51],q[21];
-rz(-pi/2147483648) q[21];
-cx q[51],q[21];
-rz(pi/2147483648) q[21];
-rz(pi/1073741824) q[51];
-cx q[51],q[22];
-rz(-pi/1073741824) q[22];
-cx q[51],q[22];
-rz(pi/1073741824) q[22];
-rz(pi/536870912) q[51];
-cx q[51],q[23];
-rz(-pi/536870912) q[23];
-cx q[51],q[23];
-rz(pi/536870912) q[23];
-rz(pi/268435456) q[51];
-cx q[51],q[24];
-rz(-pi/268435456) q[24];
-cx q[51],q[24];
-rz(pi/268435456) q[24];
-rz(pi/134217728) q[51];
-cx q[51],q[25];
-rz(-pi/134217728) q[25];
-cx q[51],q[25];
-rz(pi/134217728) q[25];
-rz(pi/67108864) q[51];
-cx q[51],q[26];
-rz(-pi/67108864) q[26];
-cx q[51],q[26];
-rz(pi/67108864) q[26];
-rz(pi/33554432) q[51];
-cx q[51],q[27];
-rz(-pi/33554432) q[27];
-cx q[51],q[27];
-rz(pi/33554432) q[27];
-rz(pi/16777216) q[51];
-cx q[51],q[28];
-rz(-pi/16777216) q[28];
-cx q[51],q[28];
-rz(pi/16777216) q[28];
-rz(pi/8388608) q[51];
-cx q[51],q[29];
-rz(-pi/8388608) q[29];
-cx q[51],q[29];
-rz(pi/8388608) q[29];
-rz(pi/4194304) q[51];
-cx q[51],q[30];
-rz(-pi/4194304) q[30];
-cx q[51],q[30];
-rz(pi/4194304) q[30];
-rz(pi/2097152) q[51];
-cx q[51],q[31];
-rz(-pi/2097152) q[31];
-cx q[51],q[31];
-rz(pi/2097152) q[31];
-rz(pi/1048576) q[51];
-cx q[51],q[32];
-rz(-pi/1048576) q[32];
-cx q[51],q[32];
-rz(pi/1048576) q[32];
-rz(pi/524288) q[51];
-cx q[51],q[33];
-rz(-pi/524288) q[33];
-cx q[51],q[33];
-rz(pi/524288) q[33];
-rz(pi/262144) q[51];
-cx q[51],q[34];
-rz(-pi/262144) q[34];
-cx q[51],q[34];
-rz(pi/262144) q[34];
-rz(pi/131072) q[51];
-cx q[51],q[35];
-rz(-pi/131072) q[35];
-cx q[51],q[35];
-rz(pi/131072) q[35];
-rz(pi/65536) q[51];
-cx q[51],q[36];
-rz(-pi/65536) q[36];
-cx q[51],q[36];
-rz(pi/65536) q[36];
-rz(pi/32768) q[51];
-cx q[51],q[37];
-rz(-pi/32768) q[37];
-cx q[51],q[37];
-rz(pi/32768) q[37];
-rz(pi/16384) q[51];
-cx q[51],q[38];
-rz(-pi/16384) q[38];
-cx q[51],q[38];
-rz(pi/16384) q[38];
-rz(pi/8192) q[51];
-cx q[51],q[39];
-rz(-pi/8192) q[39];
-cx q[51],q[39];
-rz(pi/8192) q[39];
-rz(pi/4096) q[51];
-cx q[51],q[40];
-rz(-pi/4096) q[40];
-cx q[51],q[40];
-rz(pi/4096) q[40];
-rz(pi/2048) q[51];
-cx q[51],q[41];
-rz(-pi/2048) q[41];
-cx q[51],q[41];
-rz(pi/2048) q[41];
-rz(pi/1024) q[51];
-cx q[51],q[42];
-rz(-pi/1024) q[42];
-cx q[51],q[42];
-rz(pi/1024) q[42];
-rz(pi/512) q[51];
-cx q[51],q[43];
-rz(-pi/512) q[43];
-cx q[51],q[43];
-rz(pi/512) q[43];
-rz(pi/256) q[51];
-cx q[51],q[44];
-rz(-pi/256) q[44];
-cx q[51],q[44];
-rz(pi/256) q[44];
-rz(pi/128) q[51];
-cx q[51],q[45];
-rz(-pi/128) q[45];
-cx q[51],q[45];
-rz(pi/128) q[45];
-rz(pi/64) q[51];
-cx q[51],q[46];
-rz(-pi/64) q[46];
-cx q[51],q[46];
-rz(pi/64) q[46];
-rz(pi/32) q[51];
-cx q[51],q[47];
-rz(-pi/32) q[47];
-cx q[51],q[47];
-rz(pi/32) q[47];
-rz(pi/16) q[51];
-cx q[51],q[48];
-rz(-pi/16) q[48];
-cx q[51],q[48];
-rz(pi/16) q[48];
-rz(pi/8) q[51];
-cx q[51],q[49];
-rz(-pi/8) q[49];
-cx q[51],q[49];
-rz(pi/8) q[49];
-rz(pi/4) q[51];
-cx q[51],q[50];
-rz(-pi/4) q[50];
-cx q[51],q[50];
-rz(pi/4) q[50];
-rz(pi/2) q[51];
-sx q[51];
-rz(pi/2) q[51];
-rz(1.42863093678434e-12) q[52];
-cx q[52],q[12];
-rz(-1.42863093678434e-12) q[12];
-cx q[52],q[12];
-rz(1.42863093678434e-12) q[12];
-rz(2.85726187356867e-12) q[52];
-cx q[52],q[13];
-rz(-2.85726187356867e-12) q[13];
-cx q[52],q[13];
-rz(2.85726187356867e-12) q[13];
-rz(5.71452374713734e-12) q[52];
-cx q[52],q[14];
-rz(-5.71452374713734e-12) q[14];
-cx q[52],q[14];
-rz(5.71452374713734e-12) q[14];
-rz(1.14290474942747e-11) q[52];
-cx q[52],q[15];
-rz(-1.14290474942747e-11) q[15];
-cx q[52],q[15];
-rz(1.14290474942747e-11) q[15];
-rz(2.28580949885494e-11) q[52];
-cx q[52],q[16];
-rz(-2.28580949885494e-11) q[16];
-cx q[52],q[16];
-rz(2.28580949885494e-11) q[16];
-rz(4.57161899770987e-11) q[52];
-cx q[52],q[17];
-rz(-4.57161899770987e-11) q[17];
-cx q[52],q[17];
-rz(4.57161899770987e-11) q[17];
-rz(9.14323799541975e-11) q[52];
-cx q[52],q[18];
-rz(-9.14323799541975e-11) q[18];
-cx q[52],q[18];
-rz(9.14323799541975e-11) q[18];
-rz(1.82864759908395e-10) q[52];
-cx q[52],q[19];
-rz(-1.82864759908395e-10) q[19];
-cx q[52],q[19];
-rz(1.82864759908395e-10) q[19];
-rz(3.6572951981679e-10) q[52];
-cx q[52],q[20];
-rz(-3.6572951981679e-10) q[20];
-cx q[52],q[20];
-rz(3.6572951981679e-10) q[20];
-rz(7.3145903963358e-10) q[52];
-cx q[52],q[21];
-rz(-7.3145903963358e-10) q[21];
-cx q[52],q[21];
-rz(7.3145903963358e-10) q[21];
-rz(pi/2147483648) q[52];
-cx q[52],q[22];
-rz(-pi/2147483648) q[22];
-cx q[52],q[22];
-rz(pi/2147483648) q[22];
-rz(pi/1073741824) q[52];
-cx q[52],q[23];
-rz(-pi/1073741824) q[23];
-cx q[52],q[23];
-rz(pi/1073741824) q[23];
-rz(pi/536870912) q[52];
-cx q[52],q[24];
-rz(-pi/536870912) q[24];
-cx q[52],q[24];
-rz(pi/536870912) q[24];
-rz(pi/268435456) q[52];
-cx q[52],q[25];
-rz(-pi/268435456) q[25];
-cx q[52],q[25];
-rz(pi/268435456) q[25];
-rz(pi/134217728) q[52];
-cx q[52],q[26];
-rz(-pi/134217728) q[26];
-cx q[52],q[26];
-rz(pi/134217728) q[26];
-rz(pi/67108864) q[52];
-cx q[52],q[27];
-rz(-pi/67108864) q[27];
-cx q[52],q[27];
-rz(pi/67108864) q[27];
-rz(pi/33554432) q[52];
-cx q[52],q[28];
-rz(-pi/33554432) q[28];
-cx q[52],q[28];
-rz(pi/33554432) q[28];
-rz(pi/16777216) q[52];
-cx q[52],q[29];
-rz(-pi/16777216) q[29];
-cx q[52],q[29];
-rz(pi/16777216) q[29];
-rz(pi/8388608) q[52];
-cx q[52],q[30];
-rz(-pi/8388608) q[30];
-cx q[52],q[30];
-rz(pi/8388608) q[30];
-rz(pi/4194304) q[52];
-cx q[52],q[31];
-rz(-pi/4194304) q[31];
-cx q[52],q[31];
-rz(pi/4194304) q[31];
-rz(pi/2097152) q[52];
-cx q[52],q[32];
-rz(-pi/2097152) q[32];
-cx q[52],q[32];
-rz(pi/2097152) q[32];
-rz(pi/1048576) q[52];
-cx q[52],q[33];
-rz(-pi/1048576) q[33];
-cx q[52],q[33];
-rz(pi/1048576) q[33];
-rz(pi/524288) q[52];
-cx q[52],q[34];
-rz(-pi/524288) q[34];
-cx q[52],q[34];
-rz(pi/524288) q[34];
-rz(pi/262144) q[52];
-cx q[52],q[35];
-rz(-pi/262144) q[35];
-cx q[52],q[35];
-rz(pi/262144) q[35];
-rz(pi/131072) q[52];
-cx q[52],q[36];
-rz(-pi/131072) q[36];
-cx q[52],q[36];
-rz(pi/131072) q[36];
-rz(pi/65536) q[52];
-cx q[52],q[37];
-rz(-pi/65536) q[37];
-cx q[52],q[37];
-rz(pi/65536) q[37];
-rz(pi/32768) q[52];
-cx q[52],q[38];
-rz(-pi/32768) q[38];
-cx q[52],q[38];
-rz(pi/32768) q[38];
-rz(pi/16384) q[52];
-cx q[52],q[39];
-rz(-pi/16384) q[39];
-cx q[52],q[39];
-rz(pi/16384) q[39];
-rz(pi/8192) q[52];
-cx q[52],q[40];
-rz(-pi/8192) q[40];
-cx q[52],q[40];
-rz(pi/8192) q[40];
-rz(pi/4096) q[52];
-cx q[52],q[41];
-rz(-pi/4096) q[41];
-cx q[52],q[41];
-rz(pi/4096) q[41];
-rz(pi/2048) q[52];
-cx q[52],q[42];
-rz(-pi/2048) q[42];
-cx q[52],q[42];
-rz(pi/2048) q[42];
-rz(pi/1024) q[52];
-cx q[52],q[43];
-rz(-pi/1024) q[43];
-cx q[52],q[43];
-rz(pi/1024) q[43];
-rz(pi/512) q[52];
-cx q[52],q[44];
-rz(-pi/512) q[44];
-cx q[52],q[44];
-rz(pi/512) q[44];
-rz(pi/256) q[52];
-cx q[52],q[45];
-rz(-pi/256) q[45];
-cx q[52],q[45];
-rz(pi/256) q[45];
-rz(pi/128) q[52];
-cx q[52],q[46];
-rz(-pi/128) q[46];
-cx q[52],q[46];
-rz(pi/128) q[46];
-rz(pi/64) q[52];
-cx q[52],q[47];
-rz(-pi/64) q[47];
-cx q[52],q[47];
-rz(pi/64) q[47];
-rz(pi/32) q[52];
-cx q[52],q[48];
-rz(-pi/32) q[48];
-cx q[52],q[48];
-rz(pi/32) q[48];
-rz(pi/16) q[52];
-cx q[52],q[49];
-rz(-pi/16) q[49];
-cx q[52],q[49];
-rz(pi/16) q[49];
-rz(pi/8) q[52];
-cx q[52],q[50];
-rz(-pi/8) q[50];
-cx q[52],q[50];
-rz(pi/8) q[50];
-rz(pi/4) q[52];
-cx q[52],q[51];
-rz(-pi/4) q[51];
-cx q[52],q[51];
-rz(pi/4) q[51];
-rz(pi/2) q[52];
-sx q[52];
-rz(pi/2) q[52];
-rz(1.42863093678434e-12) q[53];
-cx q[53],q[13];
-rz(-1.42863093678434e-12) q[13];
-cx q[53],q[13];
-rz(1.42863093678434e-12) q[13];
-rz(2.85726187356867e-12) q[53];
-cx q[53],q[14];
-rz(-2.85726187356867e-12) q[14];
-cx q[53],q[14];
-rz(2.85726187356867e-12) q[14];
-rz(5.71452374713734e-12) q[53];
-cx q[53],q[15];
-rz(-5.71452374713734e-12) q[15];
-cx q[53],q[15];
-rz(5.71452374713734e-12) q[15];
-rz(1.14290474942747e-11) q[53];
-cx q[53],q[16];
-rz(-1.14290474942747e-11) q[16];
-cx q[53],q[16];
-rz(1.14290474942747e-11) q[16];
-rz(2.28580949885494e-11) q[53];
-cx q[53],q[17];
-rz(-2.28580949885494e-11) q[17];
-cx q[53],q[17];
-rz(2.28580949885494e-11) q[17];
-rz(4.57161899770987e-11) q[53];
-cx q[53],q[18];
-rz(-4.57161899770987e-11) q[18];
-cx q[53],q[18];
-rz(4.57161899770987e-11) q[18];
-rz(9.14323799541975e-11) q[53];
-cx q[53],q[19];
-rz(-9.14323799541975e-11) q[19];
-cx q[53],q[19];
-rz(9.14323799541975e-11) q[19];
-rz(1.82864759908395e-10) q[53];
-cx q[53],q[20];
-rz(-1.82864759908395e-10) q[20];
-cx q[53],q[20];
-rz(1.82864759908395e-10) q[20];
-rz(3.6572951981679e-10) q[53];
-cx q[53],q[21];
-rz(-3.6572951981679e-10) q[21];
-cx q[53],q[21];
-rz(3.6572951981679e-10) q[21];
-rz(7.3145903963358e-10) q[53];
-cx q[53],q[22];
-rz(-7.3145903963358e-10) q[22];
-cx q[53],q[22];
-rz(7.3145903963358e-10) q[22];
-rz(pi/2147483648) q[53];
-cx q[53],q[23];
-rz(-pi/2147483648) q[23];
-cx q[53],q[23];
-rz(pi/2147483648) q[23];
-rz(pi/1073741824) q[53];
-cx q[53],q[24];
-rz(-pi/1073741824) q[24];
-cx q[53],q[24];
-rz(pi/1073741824) q[24];
-rz(pi/536870912) q[53];
-cx q[53],q[25];
-rz(-pi/536870912) q[25];
-cx q[53],q[25];
-rz(pi/536870912) q[25];
-rz(pi/268435456) q[53];
-cx q[53],q[26];
-rz(-pi/268435456) q[26];
-cx q[53],q[26];
-rz(pi/268435456) q[26];
-rz(pi/134217728) q[53];
-cx q[53],q[27];
-rz(-pi/134217728) q[27];
-cx q[53],q[27];
-rz(pi/134217728) q[27];
-rz(pi/67108864) q[53];
-cx q[53],q[28];
-rz(-pi/67108864) q[28];
-cx q[53],q[28];
-rz(pi/67108864) q[28];
-rz(pi/33554432) q[53];
-cx q[53],q[29];
-rz(-pi/33554432) q[29];
-cx q[53],q[29];
-rz(pi/33554432) q[29];
-rz(pi/16777216) q[53];
-cx q[53],q[30];
-rz(-pi/16777216) q[30];
-cx q[53],q[30];
-rz(pi/16777216) q[30];
-rz(pi/8388608) q[53];
-cx q[53],q[31];
-rz(-pi/8388608) q[31];
-cx q[53],q[31];
-rz(pi/8388608) q[31];
-rz(pi/4194304) q[53];
-cx q[53],q[32];
-rz(-pi/4194304) q[32];
-cx q[53],q[32];
-rz(pi/4194304) q[32];
-rz(pi/2097152) q[53];
-cx q[53],q[33];
-rz(-pi/2097152) q[33];
-cx q[53],q[33];
-rz(pi/2097152) q[33];
-rz(pi/1048576) q[53];
-cx q[53],q[34];
-rz(-pi/1048576) q[34];
-cx q[53],q[34];
-rz(pi/1048576) q[34];
-rz(pi/524288) q[53];
-cx q[53],q[35];
-rz(-pi/524288) q[35];
-cx q[53],q[35];
-rz(pi/524288) q[35];
-rz(pi/262144) q[53];
-cx q[53],q[36];
-rz(-pi/262144) q[36];
-cx q[53],q[36];
-rz(pi/262144) q[36];
-rz(pi/131072) q[53];
-cx q[53],q[37];
-rz(-pi/131072) q[37];
-cx q[53],q[37];
-rz(pi/131072) q[37];
-rz(pi/65536) q[53];
-cx q[53],q[38];
-rz(-pi/65536) q[38];
-cx q[53],q[38];
-rz(pi/65536) q[38];
-rz(pi/32768) q[53];
-cx q[53],q[39];
-rz(-pi/32768) q[39];
-cx q[53],q[39];
-rz(pi/32768) q[39];
-rz(pi/16384) q[53];
-cx q[53],q[40];
-rz(-pi/16384) q[40];
-cx q[53],q[40];
-rz(pi/16384) q[40];
-rz(pi/8192) q[53];
-cx q[53],q[41];
-rz(-pi/8192) q[41];
-cx q[53],q[41];
-rz(pi/8192) q[41];
-rz(pi/4096) q[53];
-cx q[53],q[42];
-rz(-pi/4096) q[42];
-cx q[53],q[42];
-rz(pi/4096) q[42];
-rz(pi/2048) q[53];
-cx q[53],q[43];
-rz(-pi/2048) q[43];
-cx q[53],q[43];
-rz(pi/2048) q[43];
-rz(pi/1024) q[53];
-cx q[53],q[44];
-rz(-pi/1024) q[44];
-cx q[53],q[44];
-rz(pi/1024) q[44];
-rz(pi/512) q[53];
-cx q[53],q[45];
-rz(-pi/512) q[45];
-cx q[53],q[45];
-rz(pi/512) q[45];
-rz(pi/256) q[53];
-cx q[53],q[46];
-rz(-pi/256) q[46];
-cx q[53],q[46];
-rz(pi/256) q[46];
-rz(pi/128) q[53];
-cx q[53],q[47];
-rz(-pi/128) q[47];
-cx q[53],q[47];
-rz(pi/128) q[47];
-rz(pi/64) q[53];
-cx q[53],q[48];
-rz(-pi/64) q[48];
-cx q[53],q[48];
-rz(pi/64) q[48];
-rz(pi/32) q[53];
-cx q[53],q[49];
-rz(-pi/32) q[49];
-cx q[53],q[49];
-rz(pi/32) q[49];
-rz(pi/16) q[53];
-cx q[53],q[50];
-rz(-pi/16) q[50];
-cx q[53],q[50];
-rz(pi/16) q[50];
-rz(pi/8) q[53];
-cx q[53],q[51];
-rz(-pi/8) q[51];
-cx q[53],q[51];
-rz(pi/8) q[51];
-rz(pi/4) q[53];
-cx q[53],q[52];
-rz(-pi/4) q[52];
-cx q[53],q[52];
-rz(pi/4) q[52];
-rz(pi/2) q[53];
-sx q[53];
-rz(pi/2) q[53];
-rz(1.42863093678434e-12) q[54];
-cx q[54],q[14];
-rz(-1.42863093678434e-12) q[14];
-cx q[54],q[14];
-rz(1.42863093678434e-12) q[14];
-rz(2.85726187356867e-12) q[54];
-cx q[54],q[15];
-rz(-2.85726187356867e-12) q[15];
-cx q[54],q[15];
-rz(2.85726187356867e-12) q[15];
-rz(5.71452374713734e-12) q[54];
-cx q[54],q[16];
-rz(-5.71452374713734e-12) q[16];
-cx q[54],q[16];
-rz(5.71452374713734e-12) q[16];
-rz(1.14290474942747e-11) q[54];
-cx q[54],q[17];
-rz(-1.14290474942747e-11) q[17];
-cx q[54],q[17];
-rz(1.14290474942747e-11) q[17];
-rz(2.28580949885494e-11) q[54];
-cx q[54],q[18];
-rz(-2.28580949885494e-11) q[18];
-cx q[54],q[18];
-rz(2.28580949885494e-11) q[18];
-rz(4.57161899770987e-11) q[54];
-cx q[54],q[19];
-rz(-4.57161899770987e-11) q[19];
-cx q[54],q[19];
-rz(4.57161899770987e-11) q[19];
-rz(9.14323799541975e-11) q[54];
-cx q[54],q[20];
-rz(-9.14323799541975e-11) q[20];
-cx q[54],q[20];
-rz(9.14323799541975e-11) q[20];
-rz(1.82864759908395e-10) q[54];
-cx q[54],q[21];
-rz(-1.82864759908395e-10) q[21];
-cx q[54],q[21];
-rz(1.82864759908395e-10) q[21];
-rz(3.6572951981679e-10) q[54];
-cx q[54],q[22];
-rz(-3.6572951981679e-10) q[22];
-cx q[54],q[22];
-rz(3.6572951981679e-10) q[22];
-rz(7.3145903963358e-10) q[54];
-cx q[54],q[23];
-rz(-7.3145903963358e-10) q[23];
-cx q[54],q[23];
-rz(7.3145903963358e-10) q[23];
-rz(pi/2147483648) q[54];
-cx q[54],q[24];
-rz(-pi/2147483648) q[24];
-cx q[54],q[24];
-rz(pi/2147483648) q[24];
-rz(pi/1073741824) q[54];
-cx q[54],q[25];
-rz(-pi/1073741824) q[25];
-cx q[54],q[25];
-rz(pi/1073741824) q[25];
-rz(pi/536870912) q[54];
-cx q[54],q[26];
-rz(-pi/536870912) q[26];
-cx q[54],q[26];
-rz(pi/536870912) q[26];
-rz(pi/268435456) q[54];
-cx q[54],q[27];
-rz(-pi/268435456) q[27];
-cx q[54],q[27];
-rz(pi/268435456) q[27];
-rz(pi/134217728) q[54];
-cx q[54],q[28];
-rz(-pi/134217728) q[28];
-cx q[54],q[28];
-rz(pi/134217728) q[28];
-rz(pi/67108864) q[54];
-cx q[54],q[29];
-rz(-pi/67108864) q[29];
-cx q[54],q[29];
-rz(pi/67108864) q[29];
-rz(pi/33554432) q[54];
-cx q[54],q[30];
-rz(-pi/33554432) q[30];
-cx q[54],q[30];
-rz(pi/33554432) q[30];
-rz(pi/16777216) q[54];
-cx q[54],q[31];
-rz(-pi/16777216) q[31];
-cx q[54],q[31];
-rz(pi/16777216) q[31];
-rz(pi/8388608) q[54];
-cx q[54],q[32];
-rz(-pi/8388608) q[32];
-cx q[54],q[32];
-rz(pi/8388608) q[32];
-rz(pi/4194304) q[54];
-cx q[54],q[33];
-rz(-pi/4194304) q[33];
-cx q[54],q[33];
-rz(pi/4194304) q[33];
-rz(pi/2097152) q[54];
-cx q[54],q[34];
-rz(-pi/2097152) q[34];
-cx q[54],q[34];
-rz(pi/2097152) q[34];
-rz(pi/1048576) q[54];
-cx q[54],q[35];
-rz(-pi/1048576) q[35];
-cx q[54],q[35];
-rz(pi/1048576) q[35];
-rz(pi/524288) q[54];
-cx q[54],q[36];
-rz(-pi/524288) q[36];
-cx q[54],q[36];
-rz(pi/524288) q[36];
-rz(pi/262144) q[54];
-cx q[54],q[37];
-rz(-pi/262144) q[37];
-cx q[54],q[37];
-rz(pi/262144) q[37];
-rz(pi/131072) q[54];
-cx q[54],q[38];
-rz(-pi/131072) q[38];
-cx q[54],q[38];
-rz(pi/131072) q[38];
-rz(pi/65536) q[54];
-cx q[54],q[39];
-rz(-pi/65536) q[39];
-cx q[54],q[39];
-rz(pi/65536) q[39];
-rz(pi/32768) q[54];
-cx q[54],q[40];
-rz(-pi/32768) q[40];
-cx q[54],q[40];
-rz(pi/32768) q[40];
-rz(pi/16384) q[54];
-cx q[54],q[41];
-rz(-pi/16384) q[41];
-cx q[54],q[41];
-rz(pi/16384) q[41];
-rz(pi/8192) q[54];
-cx q[54],q[42];
-rz(-pi/8192) q[42];
-cx q[54],q[42];
-rz(pi/8192) q[42];
-rz(pi/4096) q[54];
-cx q[54],q[43];
-rz(-pi/4096) q[43];
-cx q[54],q[43];
-rz(pi/4096) q[43];
-rz(pi/2048) q[54];
-cx q[54],q[44];
-rz(-pi/2048) q[44];
-cx q[54],q[44];
-rz(pi/2048) q[44];
-rz(pi/1024) q[54];
-cx q[54],q[45];
-rz(-pi/1024) q[45];
-cx q[54],q[45];
-rz(pi/1024) q[45];
-rz(pi/512) q[54];
-cx q[54],q[46];
-rz(-pi/512) q[46];
-cx q[54],q[46];
-rz(pi/512) q[46];
-rz(pi/256) q[54];
-cx q[54],q[47];
-rz(-pi/256) q[47];
-cx q[54],q[47];
-rz(pi/256) q[47];
-rz(pi/128) q[54];
-cx q[54],q[48];
-rz(-pi/128) q[48];
-cx q[54],q[48];
-rz(pi/128) q[48];
-rz(pi/64) q[54];
-cx q[54],q[49];
-rz(-pi/64) q[49];
-cx q[54],q[49];
-rz(pi/64) q[49];
-rz(pi/32) q[54];
-cx q[54],q[50];
-rz(-pi/32) q[50];
-cx q[54],q[50];
-rz(pi/32) q[50];
-rz(pi/16) q[54];
-cx q[54],q[51];
-rz(-pi/16) q[51];
-cx q[54],q[51];
-rz(pi/16) q[51];
-rz(pi/8) q[54];
-cx q[54],q[52];
-rz(-pi/8) q[52];
-cx q[54],q[52];
-rz(pi/8) q[52];
-rz(pi/4) q[54];
-cx q[54],q[53];
-rz(-pi/4) q[53];
-cx q[54],q[53];
-rz(pi/4) q[53];
-rz(pi/2) q[54];
-sx q[54];
-rz(pi/2) q[54];
-rz(1.42863093678434e-12) q[55];
-cx q[55],q[15];
-rz(-1.42863093678434e-12) q[15];
-cx q[55],q[15];
-rz(1.42863093678434e-12) q[15];
-rz(2.85726187356867e-12) q[55];
-cx q[55],q[16];
-rz(-2.85726187356867e-12) q[16];
-cx q[55],q[16];
-rz(2.85726187356867e-12) q[16];
-rz(5.71452374713734e-12) q[55];
-cx q[55],q[17];
-rz(-5.71452374713734e-12) q[17];
-cx q[55],q[17];
-rz(5.71452374713734e-12) q[17];
-rz(1.14290474942747e-11) q[55];
-cx q[55],q[18];
-rz(-1.14290474942747e-11) q[18];
-cx q[55],q[18];
-rz(1.14290474942747e-11) q[18];
-rz(2.28580949885494e-11) q[55];
-cx q[55],q[19];
-rz(-2.28580949885494e-11) q[19];
-cx q[55],q[19];
-rz(2.28580949885494e-11) q[19];
-rz(4.57161899770987e-11) q[55];
-cx q[55],q[20];
-rz(-4.57161899770987e-11) q[20];
-cx q[55],q[20];
-rz(4.57161899770987e-11) q[20];
-rz(9.14323799541975e-11) q[55];
-cx q[55],q[21];
-rz(-9.14323799541975e-11) q[21];
-cx q[55],q[21];
-rz(9.14323799541975e-11) q[21];
-rz(1.82864759908395e-10) q[55];
-cx q[55],q[22];
-rz(-1.82864759908395e-10) q[22];
-cx q[55],q[22];
-rz(1.82864759908395e-10) q[22];
-rz(3.6572951981679e-10) q[55];
-cx q[55],q[23];
-rz(-3.6572951981679e-10) q[23];
-cx q[55],q[23];
-rz(3.6572951981679e-10) q[23];
-rz(7.3145903963358e-10) q[55];
-cx q[55],q[24];
-rz(-7.3145903963358e-10) q[24];
-cx q[55],q[24];
-rz(7.3145903963358e-10) q[24];
-rz(pi/2147483648) q[55];
-cx q[55],q[25];
-rz(-pi/2147483648) q[25];
-cx q[55],q[25];
-rz(pi/2147483648) q[25];
-rz(pi/1073741824) q[55];
-cx q[55],q[26];
-rz(-pi/1073741824) q[26];
-cx q[55],q[26];
-rz(pi/1073741824) q[26];
-rz(pi/536870912) q[55];
-cx q[55],q[27];
-rz(-pi/536870912) q[27];
-cx q[55],q[27];
-rz(pi/536870912) q[27];
-rz(pi/268435456) q[55];
-cx q[55],q[28];
-rz(-pi/268435456) q[28];
-cx q[55],q[28];
-rz(pi/268435456) q[28];
-rz(pi/134217728) q[55];
-cx q[55],q[29];
-rz(-pi/134217728) q[29];
-cx q[55],q[29];
-rz(pi/134217728) q[29];
-rz(pi/67108864) q[55];
-cx q[55],q[30];
-rz(-pi/67108864) q[30];
-cx q[55],q[30];
-rz(pi/67108864) q[30];
-rz(pi/33554432) q[55];
-cx q[55],q[31];
-rz(-pi/33554432) q[31];
-cx q[55],q[31];
-rz(pi/33554432) q[31];
-rz(pi/16777216) q[55];
-cx q[55],q[32];
-rz(-pi/16777216) q[32];
-cx q[55],q[32];
-rz(pi/16777216) q[32];
-rz(pi/8388608) q[55];
-cx q[55],q[33];
-rz(-pi/8388608) q[33];
-cx q[55],q[33];
-rz(pi/8388608) q[33];
-rz(pi/4194304) q[55];
-cx q[55],q[34];
-rz(-pi/4194304) q[34];
-cx q[55],q[34];
-rz(pi/4194304) q[34];
-rz(pi/2097152) q[55];
-cx q[55],q[35];
-rz(-pi/2097152) q[35];
-cx q[55],q[35];
-rz(pi/2097152) q[35];
-rz(pi/1048576) q[55];
-cx q[55],q[36];
-rz(-pi/1048576) q[36];
-cx q[55],q[36];
-rz(pi/1048576) q[36];
-rz(pi/524288) q[55];
-cx q[55],q[37];
-rz(-pi/524288) q[37];
-cx q[55],q[37];
-rz(pi/524288) q[37];
-rz(pi/262144) q[55];
-cx q[55],q[38];
-rz(-pi/262144) q[38];
-cx q[55],q[38];
-rz(pi/262144) q[38];
-rz(pi/131072) q[55];
-cx q[55],q[39];
-rz(-pi/131072) q[39];
-cx q[55],q[39];
-rz(pi/131072) q[39];
-rz(pi/65536) q[55];
-cx q[55],q[40];
-rz(-pi/65536) q[40];
-cx q[55],q[40];
-rz(pi/65536) q[40];
-rz(pi/32768) q[55];
-cx q[55],q[41];
-rz(-pi/32768) q[41];
-cx q[55],q[41];
-rz(pi/32768) q[41];
-rz(pi/16384) q[55];
-cx q[55],q[42];
-rz(-pi/16384) q[42];
-cx q[55],q[42];
-rz(pi/16384) q[42];
-rz(pi/8192) q[55];
-cx q[55],q[43];
-rz(-pi/8192) q[43];
-cx q[55],q[43];
-rz(pi/8192) q[43];
-rz(pi/4096) q[55];
-cx q[55],q[44];
-rz(-pi/4096) q[44];
-cx q[55],q[44];
-rz(pi/4096) q[44];
-rz(pi/2048) q[55];
-cx q[55],q[45];
-rz(-pi/2048) q[45];
-cx q[55],q[45];
-rz(pi/2048) q[45];
-rz(pi/1024) q[55];
-cx q[55],q[46];
-rz(-pi/1024) q[46];
-cx q[55],q[46];
-rz(pi/1024) q[46];
-rz(pi/512) q[55];
-cx q[55],q[47];
-rz(-pi/512) q[47];
-cx q[55],q[47];
-rz(pi/512) q[47];
-rz(pi/256) q[55];
-cx q[55],q[48];
-rz(-pi/256) q[48];
-cx q[55],q[48];
-rz(pi/256) q[48];
-rz(pi/128) q[55];
-cx q[55],q[49];
-rz(-pi/128) q[49];
-cx q[55],q[49];
-rz(pi/128) q[49];
-rz(pi/64) q[55];
-cx q[55],q[50];
-rz(-pi/64) q[50];
-cx q[55],q[50];
-rz(pi/64) q[50];
-rz(pi/32) q[55];
-cx q[55],q[51];
-rz(-pi/32) q[51];
-cx q[55],q[51];
-rz(pi/32) q[51];
-rz(pi/16) q[55];
-cx q[55],q[52];
-rz(-pi/16) q[52];
-cx q[55],q[52];
-rz(pi/16) q[52];
-rz(pi/8) q[55];
-cx q[55],q[53];
-rz(-pi/8) q[53];
-cx q[55],q[53];
-rz(pi/8) q[53];
-rz(pi/4) q[55];
-cx q[55],q[54];
-rz(-pi/4) q[54];
-cx q[55],q[54];
-rz(pi/4) q[54];
-rz(pi/2) q[55];
-sx q[55];
-rz(pi/2) q[55];
-rz(1.42863093678434e-12) q[56];
-cx q[56],q[16];
-rz(-1.42863093678434e-12) q[16];
-cx q[56],q[16];
-rz(1.42863093678434e-12) q[16];
-rz(2.85726187356867e-12) q[56];
-cx q[56],q[17];
-rz(-2.85726187356867e-12) q[17];
-cx q[56],q[17];
-rz(2.85726187356867e-12) q[17];
-rz(5.71452374713734e-12) q[56];
-cx q[56],q[18];
-rz(-5.71452374713734e-12) q[18];
-cx q[56],q[18];
-rz(5.71452374713734e-12) q[18];
-rz(1.14290474942747e-11) q[56];
-cx q[56],q[19];
-rz(-1.14290474942747e-11) q[19];
-cx q[56],q[19];
-rz(1.14290474942747e-11) q[19];
-rz(2.28580949885494e-11) q[56];
-cx q[56],q[20];
-rz(-2.28580949885494e-11) q[20];
-cx q[56],q[20];
-rz(2.28580949885494e-11) q[20];
-rz(4.57161899770987e-11) q[56];
-cx q[56],q[21];
-rz(-4.57161899770987e-11) q[21];
-cx q[56],q[21];
-rz(4.57161899770987e-11) q[21];
-rz(9.14323799541975e-11) q[56];
-cx q[56],q[22];
-rz(-9.14323799541975e-11) q[22];
-cx q[56],q[22];
-rz(9.14323799541975e-11) q[22];
-rz(1.82864759908395e-10) q[56];
-cx q[56],q[23];
-rz(-1.82864759908395e-10) q[23];
-cx q[56],q[23];
-rz(1.82864759908395e-10) q[23];
-rz(3.6572951981679e-10) q[56];
-cx q[56],q[24];
-rz(-3.6572951981679e-10) q[24];
-cx q[56],q[24];
-rz(3.6572951981679e-10) q[24];
-rz(7.3145903963358e-10) q[56];
-cx q[56],q[25];
-rz(-7.3145903963358e-10) q[25];
-cx q[56],q[25];
-rz(7.3145903963358e-10) q[25];
-rz(pi/2147483648) q[56];
-cx q[56],q[26];
-rz(-pi/2147483648) q[26];
-cx q[56],q[26];
-rz(pi/2147483648) q[26];
-rz(pi/1073741824) q[56];
-cx q[56],q[27];
-rz(-pi/1073741824) q[27];
-cx q[56],q[27];
-rz(pi/1073741824) q[27];
-rz(pi/536870912) q[56];
-cx q[56],q[28];
-rz(-pi/536870912) q[28];
-cx q[56],q[28];
-rz(pi/536870912) q[28];
-rz(pi/268435456) q[56];
-cx q[56],q[29];
-rz(-pi/268435456) q[29];
-cx q[56],q[29];
-rz(pi/268435456) q[29];
-rz(pi/134217728) q[56];
-cx q[56],q[30];
-rz(-pi/134217728) q[30];
-cx q[56],q[30];
-rz(pi/134217728) q[30];
-rz(pi/67108864) q[56];
-cx q[56],q[31];
-rz(-pi/67108864) q[31];
-cx q[56],q[31];
-rz(pi/67108864) q[31];
-rz(pi/33554432) q[56];
-cx q[56],q[32];
-rz(-pi/33554432) q[32];
-cx q[56],q[32];
-rz(pi/33554432) q[32];
-rz(pi/16777216) q[56];
-cx q[56],q[33];
-rz(-pi/16777216) q[33];
-cx q[56],q[33];
-rz(pi/16777216) q[33];
-rz(pi/8388608) q[56];
-cx q[56],q[34];
-rz(-pi/8388608) q[34];
-cx q[56],q[34];
-rz(pi/8388608) q[34];
-rz(pi/4194304) q[56];
-cx q[56],q[35];
-rz(-pi/4194304) q[35];
-cx q[56],q[35];
-rz(pi/4194304) q[35];
-rz(pi/2097152) q[56];
-cx q[56],q[36];
-rz(-pi/2097152) q[36];
-cx q[56],q[36];
-rz(pi/2097152) q[36];
-rz(pi/1048576) q[56];
-cx q[56],q[37];
-rz(-pi/1048576) q[37];
-cx q[56],q[37];
-rz(pi/1048576) q[37];
-rz(pi/524288) q[56];
-cx q[56],q[38];
-rz(-pi/524288) q[38];
-cx q[56],q[38];
-rz(pi/524288) q[38];
-rz(pi/262144) q[56];
-cx q[56],q[39];
-rz(-pi/262144) q[39];
-cx q[56],q[39];
-rz(pi/262144) q[39];
-rz(pi/131072) q[56];
-cx q[56],q[40];
-rz(-pi/131072) q[40];
-cx q[56],q[40];
-rz(pi/131072) q[40];
-rz(pi/65536) q[56];
-cx q[56],q[41];
-rz(-pi/65536) q[41];
-cx q[56],q[41];
-rz(pi/65536) q[41];
-rz(pi/32768) q[56];
-cx q[56],q[42];
-rz(-pi/32768) q[42];
-cx q[56],q[42];
-rz(pi/32768) q[42];
-rz(pi/16384) q[56];
-cx q[56],q[43];
-rz(-pi/16384) q[43];
-cx q[56],q[43];
-rz(pi/16384) q[43];
-rz(pi/8192) q[56];
-cx q[56],q[44];
-rz(-pi/8192) q[44];
-cx q[56],q[44];
-rz(pi/8192) q[44];
-rz(pi/4096) q[56];
-cx q[56],q[45];
-rz(-pi/4096) q[45];
-cx q[56],q[45];
-rz(pi/4096) q[45];
-rz(pi/2048) q[56];
-cx q[56],q[46];
-rz(-pi/2048) q[46];
-cx q[56],q[46];
-rz(pi/2048) q[46];
-rz(pi/1024) q[56];
-cx q[56],q[47];
-rz(-pi/1024) q[47];
-cx q[56],q[47];
-rz(pi/1024) q[47];
-rz(pi/512) q[56];
-cx q[56],q[48];
-rz(-pi/512) q[48];
-cx q[56],q[48];
-rz(pi/512) q[48];
-rz(pi/256) q[56];
-cx q[56],q[49];
-rz(-pi/256) q[49];
-cx q[56],q[49];
-rz(pi/256) q[49];
-rz(pi/128) q[56];
-cx q[56],q[50];
-rz(-pi/128) q[50];
-cx q[56],q[50];
-rz(pi/128) q[50];
-rz(pi/64) q[56];
-cx q[56],q[51];
-rz(-pi/64) q[51];
-cx q[56],q[51];
-rz(pi/64) q[51];
-rz(pi/32) q[56];
-cx q[56],q[52];
-rz(-pi/32) q[52];
-cx q[56],q[52];
-rz(pi/32) q[52];
-rz(pi/16) q[56];
-cx q[56],q[53];
-rz(-pi/16) q[53];
-cx q[56],q[53];
-rz(pi/16) q[53];
-rz(pi/8) q[56];
-cx q[56],q[54];
-rz(-pi/8) q[54];
-cx q[56],q[54];
-rz(pi/8) q[54];
-rz(pi/4) q[56];
-cx q[56],q[55];
-rz(-pi/4) q[55];
-cx q[56],q[55];
-rz(pi/4) q[55];
-rz(pi/2) q[56];
-sx q[56];
-rz(pi/2) q[56];
-rz(1.42863093678434e-12) q[57];
-cx q[57],q[17];
-rz(-1.42863093678434e-12) q[17];
-cx q[57],q[17];
-rz(1.42863093678434e-12) q[17];
-rz(2.85726187356867e-12) q[57];
-cx q[57],q[18];
-rz(-2.85726187356867e-12) q[18];
-cx q[57],q[18];
-rz(2.85726187356867e-12) q[18];
-rz(5.71452374713734e-12) q[57];
-cx q[57],q[19];
-rz(-5.71452374713734e-12) q[19];
-cx q[57],q[19];
-rz(5.71452374713734e-12) q[19];
-rz(1.14290474942747e-11) q[57];
-cx q[57],q[20];
-rz(-1.14290474942747e-11) q[20];
-cx q[57],q[20];
-rz(1.14290474942747e-11) q[20];
-rz(2.28580949885494e-11) q[57];
-cx q[57],q[21];
-rz(-2.28580949885494e-11) q[21];
-cx q[57],q[21];
-rz(2.28580949885494e-11) q[21];
-rz(4.57161899770987e-11) q[57];
-cx q[57],q[22];
-rz(-4.57161899770987e-11) q[22];
-cx q[57],q[22];
-rz(4.57161899770987e-11) q[22];
-rz(9.14323799541975e-11) q[57];
-cx q[57],q[23];
-rz(-9.14323799541975e-11) q[23];
-cx q[57],q[23];
-rz(9.14323799541975e-11) q[23];
-rz(1.82864759908395e-10) q[57];
-cx q[57],q[24];
-rz(-1.82864759908395e-10) q[24];
-cx q[57],q[24];
-rz(1.82864759908395e-10) q[24];
-rz(3.6572951981679e-10) q[57];
-cx q[57],q[25];
-rz(-3.6572951981679e-10) q[25];
-cx q[57],q[25];
-rz(3.6572951981679e-10) q[25];
-rz(7.3145903963358e-10) q[57];
-cx q[57],q[26];
-rz(-7.3145903963358e-10) q[26];
-cx q[57],q[26];
-rz(7.3145903963358e-10) q[26];
-rz(pi/2147483648) q[57];
-cx q[57],q[27];
-rz(-pi/2147483648) q[27];
-cx q[57],q[27];
-rz(pi/2147483648) q[27];
-rz(pi/1073741824) q[57];
-cx q[57],q[28];
-rz(-pi/1073741824) q[28];
-cx q[57],q[28];
-rz(pi/1073741824) q[28];
-rz(pi/536870912) q[57];
-cx q[57],q[29];
-rz(-pi/536870912) q[29];
-cx q[57],q[29];
-rz(pi/536870912) q[29];
-rz(pi/268435456) q[57];
-cx q[57],q[30];
-rz(-pi/268435456) q[30];
-cx q[57],q[30];
-rz(pi/268435456) q[30];
-rz(pi/134217728) q[57];
-cx q[57],q[31];
-rz(-pi/134217728) q[31];
-cx q[57],q[31];
-rz(pi/134217728) q[31];
-rz(pi/67108864) q[57];
-cx q[57],q[32];
-rz(-pi/67108864) q[32];
-cx q[57],q[32];
-rz(pi/67108864) q[32];
-rz(pi/33554432) q[57];
-cx q[57],q[33];
-rz(-pi/33554432) q[33];
-cx q[57],q[33];
-rz(pi/33554432) q[33];
-rz(pi/16777216) q[57];
-cx q[57],q[34];
-rz(-pi/16777216) q[34];
-cx q[57],q[34];
-rz(pi/16777216) q[34];
-rz(pi/8388608) q[57];
-cx q[57],q[35];
-rz(-pi/8388608) q[35];
-cx q[57],q[35];
-rz(pi/8388608) q[35];
-rz(pi/4194304) q[57];
-cx q[57],q[36];
-rz(-pi/4194304) q[36];
-cx q[57],q[36];
-rz(pi/4194304) q[36];
-rz(pi/2097152) q[57];
-cx q[57],q[37];
-rz(-pi/2097152) q[37];
-cx q[57],q[37];
-rz(pi/2097152) q[37];
-rz(pi/1048576) q[57];
-cx q[57],q[38];
-rz(-pi/1048576) q[38];
-cx q[57],q[38];
-rz(pi/1048576) q[38];
-rz(pi/524288) q[57];
-cx q[57],q[39];
-rz(-pi/524288) q[39];
-cx q[57],q[39];
-rz(pi/524288) q[39];
-rz(pi/262144) q[57];
-cx q[57],q[40];
-rz(-pi/262144) q[40];
-cx q[57],q[40];
-rz(pi/262144) q[40];
-rz(pi/131072) q[57];
-cx q[57],q[41];
-rz(-pi/131072) q[41];
-cx q[57],q[41];
-rz(pi/131072) q[41];
-rz(pi/65536) q[57];
-cx q[57],q[42];
-rz(-pi/65536) q[42];
-cx q[57],q[42];
-rz(pi/65536) q[42];
-rz(pi/32768) q[57];
-cx q[57],q[43];
-rz(-pi/32768) q[43];
-cx q[57],q[43];
-rz(pi/32768) q[43];
-rz(pi/16384) q[57];
-cx q[57],q[44];
-rz(-pi/16384) q[44];
-cx q[57],q[44];
-rz(pi/16384) q[44];
-rz(pi/8192) q[57];
-cx q[57],q[45];
-rz(-pi/8192) q[45];
-cx q[57],q[45];
-rz(pi/8192) q[45];
-rz(pi/4096) q[57];
-cx q[57],q[46];
-rz(-pi/4096) q[46];
-cx q[57],q[46];
-rz(pi/4096) q[46];
-rz(pi/2048) q[57];
-cx q[57],q[47];
-rz(-pi/2048) q[47];
-cx q[57],q[47];
-rz(pi/2048) q[47];
-rz(pi/1024) q[57];
-cx q[57],q[48];
-rz(-pi/1024) q[48];
-cx q[57],q[48];
-rz(pi/1024) q[48];
-rz(pi/512) q[57];
-cx q[57],q[49];
-rz(-pi/512) q[49];
-cx q[57],q[49];
-rz(pi/512) q[49];
-rz(pi/256) q[57];
-cx q[57],q[50];
-rz(-pi/256) q[50];
-cx q[57],q[50];
-rz(pi/256) q[50];
-rz(pi/128) q[57];
-cx q[57],q[51];
-rz(-pi/128) q[51];
-cx q[57],q[51];
-rz(pi/128) q[51];
-rz(pi/64) q[57];
-cx q[57],q[52];
-rz(-pi/64) q[52];
-cx q[57],q[52];
-rz(pi/64) q[52];
-rz(pi/32) q[57];
-cx q[57],q[53];
-rz(-pi/32) q[53];
-cx q[57],q[53];
-rz(pi/32) q[53];
-rz(pi/16) q[57];
-cx q[57],q[54];
-rz(-pi/16) q[54];
-cx q[57],q[54];
-rz(pi/16) q[54];
-rz(pi/8) q[57];
-cx q[57],q[55];
-rz(-pi/8) q[55];
-cx q[57],q[55];
-rz(pi/8) q[55];
-rz(pi/4) q[57];
-cx q[57],q[56];
-rz(-pi/4) q[56];
-cx q[57],q[56];
-rz(pi/4) q[56];
-rz(pi/2) q[57];
-sx q[57];
-rz(pi/2) q[57];
-rz(1.42863093678434e-12) q[58];
-cx q[58],q[18];
-rz(-1.42863093678434e-12) q[18];
-cx q[58],q[18];
-rz(1.42863093678434e-12) q[18];
-rz(2.85726187356867e-12) q[58];
-cx q[58],q[19];
-rz(-2.85726187356867e-12) q[19];
-cx q[58],q[19];
-rz(2.85726187356867e-12) q[19];
-rz(5.71452374713734e-12) q[58];
-cx q[58],q[20];
-rz(-5.71452374713734e-12) q[20];
-cx q[58],q[20];
-rz(5.71452374713734e-12) q[20];
-rz(1.14290474942747e-11) q[58];
-cx q[58],q[21];
-rz(-1.14290474942747e-11) q[21];
-cx q[58],q[21];
-rz(1.14290474942747e-11) q[21];
-rz(2.28580949885494e-11) q[58];
-cx q[58],q[22];
-rz(-2.28580949885494e-11) q[22];
-cx q[58],q[22];
-rz(2.28580949885494e-11) q[22];
-rz(4.57161899770987e-11) q[58];
-cx q[58],q[23];
-rz(-4.57161899770987e-11) q[23];
-cx q[58],q[23];
-rz(4.57161899770987e-11) q[23];
-rz(9.14323799541975e-11) q[58];
-cx q[58],q[24];
-rz(-9.14323799541975e-11) q[24];
-cx q[58],q[24];
-rz(9.14323799541975e-11) q[24];
-rz(1.82864759908395e-10) q[58];
-cx q[58],q[25];
-rz(-1.82864759908395e-10) q[25];
-cx q[58],q[25];
-rz(1.82864759908395e-10) q[25];
-rz(3.6572951981679e-10) q[58];
-cx q[58],q[26];
-rz(-3.6572951981679e-10) q[26];
-cx q[58],q[26];
-rz(3.6572951981679e-10) q[26];
-rz(7.3145903963358e-10) q[58];
-cx q[58],q[27];
-rz(-7.3145903963358e-10) q[27];
-cx q[58],q[27];
-rz(7.3145903963358e-10) q[27];
-rz(pi/2147483648) q[58];
-cx q[58],q[28];
-rz(-pi/2147483648) q[28];
-cx q[58],q[28];
-rz(pi/2147483648) q[28];
-rz(pi/1073741824) q[58];
-cx q[58],q[29];
-rz(-pi/1073741824) q[29];
-cx q[58],q[29];
-rz(pi/1073741824) q[29];
-rz(pi/536870912) q[58];
-cx q[58],q[30];
-rz(-pi/536870912) q[30];
-cx q[58],q[30];
-rz(pi/536870912) q[30];
-rz(pi/268435456) q[58];
-cx q[58],q[31];
-rz(-pi/268435456) q[31];
-cx q[58],q[31];
-rz(pi/268435456) q[31];
-rz(pi/134217728) q[58];
-cx q[58],q[32];
-rz(-pi/134217728) q[32];
-cx q[58],q[32];
-rz(pi/134217728) q[32];
-rz(pi/67108864) q[58];
-cx q[58],q[33];
-rz(-pi/67108864) q[33];
-cx q[58],q[33];
-rz(pi/67108864) q[33];
-rz(pi/33554432) q[58];
-cx q[58],q[34];
-rz(-pi/33554432) q[34];
-cx q[58],q[34];
-rz(pi/33554432) q[34];
-rz(pi/16777216) q[58];
-cx q[58],q[35];
-rz(-pi/16777216) q[35];
-cx q[58],q[35];
-rz(pi/16777216) q[35];
-rz(pi/8388608) q[58];
-cx q[58],q[36];
-rz(-pi/8388608) q[36];
-cx q[58],q[36];
-rz(pi/8388608) q[36];
-rz(pi/4194304) q[58];
-cx q[58],q[37];
-rz(-pi/4194304) q[37];
-cx q[58],q[37];
-rz(pi/4194304) q[37];
-rz(pi/2097152) q[58];
-cx q[58],q[38];
-rz(-pi/2097152) q[38];
-cx q[58],q[38];
-rz(pi/2097152) q[38];
-rz(pi/1048576) q[58];
-cx q[58],q[39];
-rz(-pi/1048576) q[39];
-cx q[58],q[39];
-rz(pi/1048576) q[39];
-rz(pi/524288) q[58];
-cx q[58],q[40];
-rz(-pi/524288) q[40];
-cx q[58],q[40];
-rz(pi/524288) q[40];
-rz(pi/262144) q[58];
-cx q[58],q[41];
-rz(-pi/262144) q[41];
-cx q[58],q[41];
-rz(pi/262144) q[41];
-rz(pi/131072) q[58];
-cx q[58],q[42];
-rz(-pi/131072) q[42];
-cx q[58],q[42];
-rz(pi/131072) q[42];
-rz(pi/65536) q[58];
-cx q[58],q[43];
-rz(-pi/65536) q[43];
-cx q[58],q[43];
-rz(pi/65536) q[43];
-rz(pi/32768) q[58];
-cx q[58],q[44];
-rz(-pi/32768) q[44];
-cx q[58],q[44];
-rz(pi/32768) q[44];
-rz(pi/16384) q[58];
-cx q[58],q[45];
-rz(-pi/16384) q[45];
-cx q[58],q[45];
-rz(pi/16384) q[45];
-rz(pi/8192) q[58];
-cx q[58],q[46];
-rz(-pi/8192) q[46];
-cx q[58],q[46];
-rz(pi/8192) q[46];
-rz(pi/4096) q[58];
-cx q[58],q[47];
-rz(-pi/4096) q[47];
-cx q[58],q[47];
-rz(pi/4096) q[47];
-rz(pi/2048) q[58];
-cx q[58],q[48];
-rz(-pi/2048) q[48];
-cx q[58],q[48];
-rz(pi/2048) q[48];
-rz(pi/1024) q[58];
-cx q[58],q[49];
-rz(-pi/1024) q[49];
-cx q[58],q[49];
-rz(pi/1024) q[49];
-rz(pi/512) q[58];
-cx q[58],q[50];
-rz(-pi/512) q[50];
-cx q[58],q[50];
-rz(pi/512) q[50];
-rz(pi/256) q[58];
-cx q[58],q[51];
-rz(-pi/256) q[51];
-cx q[58],q[51];
-rz(pi/256) q[51];
-rz(pi/128) q[58];
-cx q[58],q[52];
-rz(-pi/128) q[52];
-cx q[58],q[52];
-rz(pi/128) q[52];
-rz(pi/64) q[58];
-cx q[58],q[53];
-rz(-pi/64) q[53];
-cx q[58],q[53];
-rz(pi/64) q[53];
-rz(pi/32) q[58];
-cx q[58],q[54];
-rz(-pi/32) q[54];
-cx q[58],q[54];
-rz(pi/32) q[54];
-rz(pi/16) q[58];
-cx q[58],q[55];
-rz(-pi/16) q[55];
-cx q[58],q[55];
-rz(pi/16) q[55];
-rz(pi/8) q[58];
-cx q[58],q[56];
-rz(-pi/8) q[56];
-cx q[58],q[56];
-rz(pi/8) q[56];
-rz(pi/4) q[58];
-cx q[58],q[57];
-rz(-pi/4) q[57];
-cx q[58],q[57];
-rz(pi/4) q[57];
-rz(pi/2) q[58];
-sx q[58];
-rz(pi/2) q[58];
-rz(1.42863093678434e-12) q[59];
-cx q[59],q[19];
-rz(-1.42863093678434e-12) q[19];
-cx q[59],q[19];
-rz(1.42863093678434e-12) q[19];
-rz(2.85726187356867e-12) q[59];
-cx q[59],q[20];
-rz(-2.85726187356867e-12) q[20];
-cx q[59],q[20];
-rz(2.85726187356867e-12) q[20];
-rz(5.71452374713734e-12) q[59];
-cx q[59],q[21];
-rz(-5.71452374713734e-12) q[21];
-cx q[59],q[21];
-rz(5.71452374713734e-12) q[21];
-rz(1.14290474942747e-11) q[59];
-cx q[59],q[22];
-rz(-1.14290474942747e-11) q[22];
-cx q[59],q[22];
-rz(1.14290474942747e-11) q[22];
-rz(2.28580949885494e-11) q[59];
-cx q[59],q[23];
-rz(-2.28580949885494e-11) q[23];
-cx q[59],q[23];
-rz(2.28580949885494e-11) q[23];
-rz(4.57161899770987e-11) q[59];
-cx q[59],q[24];
-rz(-4.57161899770987e-11) q[24];
-cx q[59],q[24];
-rz(4.57161899770987e-11) q[24];
-rz(9.14323799541975e-11) q[59];
-cx q[59],q[25];
-rz(-9.14323799541975e-11) q[25];
-cx q[59],q[25];
-rz(9.14323799541975e-11) q[25];
-rz(1.82864759908395e-10) q[59];
-cx q[59],q[26];
-rz(-1.82864759908395e-10) q[26];
-cx q[59],q[26];
-rz(1.82864759908395e-10) q[26];
-rz(3.6572951981679e-10) q[59];
-cx q[59],q[27];
-rz(-3.6572951981679e-10) q[27];
-cx q[59],q[27];
-rz(3.6572951981679e-10) q[27];
-rz(7.3145903963358e-10) q[59];
-cx q[59],q[28];
-rz(-7.3145903963358e-10) q[28];
-cx q[59],q[28];
-rz(7.3145903963358e-10) q[28];
-rz(pi/2147483648) q[59];
-cx q[59],q[29];
-rz(-pi/2147483648) q[29];
-cx q[59],q[29];
-rz(pi/2147483648) q[29];
-rz(pi/1073741824) q[59];
-cx q[59],q[30];
-rz(-pi/1073741824) q[30];
-cx q[59],q[30];
-rz(pi/1073741824) q[30];
-rz(pi/536870912) q[59];
-cx q[59],q[31];
-rz(-pi/536870912) q[31];
-cx q[59],q[31];
-rz(pi/536870912) q[31];
-rz(pi/268435456) q[59];
-cx q[59],q[32];
-rz(-pi/268435456) q[32];
-cx q[59],q[32];
-rz(pi/268435456) q[32];
-rz(pi/134217728) q[59];
-cx q[59],q[33];
-rz(-pi/134217728) q[33];
-cx q[59],q[33];
-rz(pi/134217728) q[33];
-rz(pi/67108864) q[59];
-cx q[59],q[34];
-rz(-pi/67108864) q[34];
-cx q[59],q[34];
-rz(pi/67108864) q[34];
-rz(pi/33554432) q[59];
-cx q[59],q[35];
-rz(-pi/33554432) q[35];
-cx q[59],q[35];
-rz(pi/33554432) q[35];
-rz(pi/16777216) q[59];
-cx q[59],q[36];
-rz(-pi/16777216) q[36];
-cx q[59],q[36];
-rz(pi/16777216) q[36];
-rz(pi/8388608) q[59];
-cx q[59],q[37];
-rz(-pi/8388608) q[37];
-cx q[59],q[37];
-rz(pi/8388608) q[37];
-rz(pi/4194304) q[59];
-cx q[59],q[38];
-rz(-pi/4194304) q[38];
-cx q[59],q[38];
-rz(pi/4194304) q[38];
-rz(pi/2097152) q[59];
-cx q[59],q[39];
-rz(-pi/2097152) q[39];
-cx q[59],q[39];
-rz(pi/2097152) q[39];
-rz(pi/1048576) q[59];
-cx q[59],q[40];
-rz(-pi/1048576) q[40];
-cx q[59],q[40];
-rz(pi/1048576) q[40];
-rz(pi/524288) q[59];
-cx q[59],q[41];
-rz(-pi/524288) q[41];
-cx q[59],q[41];
-rz(pi/524288) q[41];
-rz(pi/262144) q[59];
-cx q[59],q[42];
-rz(-pi/262144) q[42];
-cx q[59],q[42];
-rz(pi/262144) q[42];
-rz(pi/131072) q[59];
-cx q[59],q[43];
-rz(-pi/131072) q[43];
-cx q[59],q[43];
-rz(pi/131072) q[43];
-rz(pi/65536) q[59];
-cx q[59],q[44];
-rz(-pi/65536) q[44];
-cx q[59],q[44];
-rz(pi/65536) q[44];
-rz(pi/32768) q[59];
-cx q[59],q[45];
-rz(-pi/32768) q[45];
-cx q[59],q[45];
-rz(pi/32768) q[45];
-rz(pi/16384) q[59];
-cx q[59],q[46];
-rz(-pi/16384) q[46];
-cx q[59],q[46];
-rz(pi/16384) q[46];
-rz(pi/8192) q[59];
-cx q[59],q[47];
-rz(-pi/8192) q[47];
-cx q[59],q[47];
-rz(pi/8192) q[47];
-rz(pi/4096) q[59];
-cx q[59],q[48];
-rz(-pi/4096) q[48];
-cx q[59],q[48];
-rz(pi/4096) q[48];
-rz(pi/2048) q[59];
-cx q[59],q[49];
-rz(-pi/2048) q[49];
-cx q[59],q[49];
-rz(pi/2048) q[49];
-rz(pi/1024) q[59];
-cx q[59],q[50];
-rz(-pi/1024) q[50];
-cx q[59],q[50];
-rz(pi/1024) q[50];
-rz(pi/512) q[59];
-cx q[59],q[51];
-rz(-pi/512) q[51];
-cx q[59],q[51];
-rz(pi/512) q[51];
-rz(pi/256) q[59];
-cx q[59],q[52];
-rz(-pi/256) q[52];
-cx q[59],q[52];
-rz(pi/256) q[52];
-rz(pi/128) q[59];
-cx q[59],q[53];
-rz(-pi/128) q[53];
-cx q[59],q[53];
-rz(pi/128) q[53];
-rz(pi/64) q[59];
-cx q[59],q[54];
-rz(-pi/64) q[54];
-cx q[59],q[54];
-rz(pi/64) q[54];
-rz(pi/32) q[59];
-cx q[59],q[55];
-rz(-pi/32) q[55];
-cx q[59],q[55];
-rz(pi/32) q[55];
-rz(pi/16) q[59];
-cx q[59],q[56];
-rz(-pi/16) q[56];
-cx q[59],q[56];
-rz(pi/16) q[56];
-rz(pi/8) q[59];
-cx q[59],q[57];
-rz(-pi/8) q[57];
-cx q[59],q[57];
-rz(pi/8) q[57];
-rz(pi/4) q[59];
-cx q[59],q[58];
-rz(-pi/4) q[58];
-cx q[59],q[58];
-rz(pi/4) q[58];
-rz(pi/2) q[59];
-sx q[59];
-rz(pi/2) q[59];
-rz(1.42863093678434e-12) q[60];
-cx q[60],q[20];
-rz(-1.42863093678434e-12) q[20];
-cx q[60],q[20];
-rz(1.42863093678434e-12) q[20];
-rz(2.85726187356867e-12) q[60];
-cx q[60],q[21];
-rz(-2.85726187356867e-12) q[21];
-cx q[60],q[21];
-rz(2.85726187356867e-12) q[21];
-rz(5.71452374713734e-12) q[60];
-cx q[60],q[22];
-rz(-5.71452374713734e-12) q[22];
-cx q[60],q[22];
-rz(5.71452374713734e-12) q[22];
-rz(1.14290474942747e-11) q[60];
-cx q[60],q[23];
-rz(-1.14290474942747e-11) q[23];
-cx q[60],q[23];
-rz(1.14290474942747e-11) q[23];
-rz(2.28580949885494e-11) q[60];
-cx q[60],q[24];
-rz(-2.28580949885494e-11) q[24];
-cx q[60],q[24];
-rz(2.28580949885494e-11) q[24];
-rz(4.57161899770987e-11) q[60];
-cx q[60],q[25];
-rz(-4.57161899770987e-11) q[25];
-cx q[60],q[25];
-rz(4.57161899770987e-11) q[25];
-rz(9.14323799541975e-11) q[60];
-cx q[60],q[26];
-rz(-9.14323799541975e-11) q[26];
-cx q[60],q[26];
-rz(9.14323799541975e-11) q[26];
-rz(1.82864759908395e-10) q[60];
-cx q[60],q[27];
-rz(-1.82864759908395e-10) q[27];
-cx q[60],q[27];
-rz(1.82864759908395e-10) q[27];
-rz(3.6572951981679e-10) q[60];
-cx q[60],q[28];
-rz(-3.6572951981679e-10) q[28];
-cx q[60],q[28];
-rz(3.6572951981679e-10) q[28];
-rz(7.3145903963358e-10) q[60];
-cx q[60],q[29];
-rz(-7.3145903963358e-10) q[29];
-cx q[60],q[29];
-rz(7.3145903963358e-10) q[29];
-rz(pi/2147483648) q[60];
-cx q[60],q[30];
-rz(-pi/2147483648) q[30];
-cx q[60],q[30];
-rz(pi/2147483648) q[30];
-rz(pi/1073741824) q[60];
-cx q[60],q[31];
-rz(-pi/1073741824) q[31];
-cx q[60],q[31];
-rz(pi/1073741824) q[31];
-rz(pi/536870912) q[60];
-cx q[60],q[32];
-rz(-pi/536870912) q[32];
-cx q[60],q[32];
-rz(pi/536870912) q[32];
-rz(pi/268435456) q[60];
-cx q[60],q[33];
-rz(-pi/268435456) q[33];
-cx q[60],q[33];
-rz(pi/268435456) q[33];
-rz(pi/134217728) q[60];
-cx q[60],q[34];
-rz(-pi/134217728) q[34];
-cx q[60],q[34];
-rz(pi/134217728) q[34];
-rz(pi/67108864) q[60];
-cx q[60],q[35];
-rz(-pi/67108864) q[35];
-cx q[60],q[35];
-rz(pi/67108864) q[35];
-rz(pi/33554432) q[60];
-cx q[60],q[36];
-rz(-pi/33554432) q[36];
-cx q[60],q[36];
-rz(pi/33554432) q[36];
-rz(pi/16777216) q[60];
-cx q[60],q[37];
-rz(-pi/16777216) q[37];
-cx q[60],q[37];
-rz(pi/16777216) q[37];
-rz(pi/8388608) q[60];
-cx q[60],q[38];
-rz(-pi/8388608) q[38];
-cx q[60],q[38];
-rz(pi/8388608) q[38];
-rz(pi/4194304) q[60];
-cx q[60],q[39];
-rz(-pi/4194304) q[39];
-cx q[60],q[39];
-rz(pi/4194304) q[39];
-rz(pi/2097152) q[60];
-cx q[60],q[40];
-rz(-pi/2097152) q[40];
-cx q[60],q[40];
-rz(pi/2097152) q[40];
-rz(pi/1048576) q[60];
-cx q[60],q[41];
-rz(-pi/1048576) q[41];
-cx q[60],q[41];
-rz(pi/1048576) q[41];
-rz(pi/524288) q[60];
-cx q[60],q[42];
-rz(-pi/524288) q[42];
-cx q[60],q[42];
-rz(pi/524288) q[42];
-rz(pi/262144) q[60];
-cx q[60],q[43];
-rz(-pi/262144) q[43];
-cx q[60],q[43];
-rz(pi/262144) q[43];
-rz(pi/131072) q[60];
-cx q[60],q[44];
-rz(-pi/131072) q[44];
-cx q[60],q[44];
-rz(pi/131072) q[44];
-rz(pi/65536) q[60];
-cx q[60],q[45];
-rz(-pi/65536) q[45];
-cx q[60],q[45];
-rz(pi/65536) q[45];
-rz(pi/32768) q[60];
-cx q[60],q[46];
-rz(-pi/32768) q[46];
-cx q[60],q[46];
-rz(pi/32768) q[46];
-rz(pi/16384) q[60];
-cx q[60],q[47];
-rz(-pi/16384) q[47];
-cx q[60],q[47];
-rz(pi/16384) q[47];
-rz(pi/8192) q[60];
-cx q[60],q[48];
-rz(-pi/8192) q[48];
-cx q[60],q[48];
-rz(pi/8192) q[48];
-rz(pi/4096) q[60];
-cx q[60],q[49];
-rz(-pi/4096) q[49];
-cx q[60],q[49];
-rz(pi/4096) q[49];
-rz(pi/2048) q[60];
-cx q[60],q[50];
-rz(-pi/2048) q[50];
-cx q[60],q[50];
-rz(pi/2048) q[50];
-rz(pi/1024) q[60];
-cx q[60],q[51];
-rz(-pi/1024) q[51];
-cx q[60],q[51];
-rz(pi/1024) q[51];
-rz(pi/512) q[60];
-cx q[60],q[52];
-rz(-pi/512) q[52];
-cx q[60],q[52];
-rz(pi/512) q[52];
-rz(pi/256) q[60];
-cx q[60],q[53];
-rz(-pi/256) q[53];
-cx q[60],q[53];
-rz(pi/256) q[53];
-rz(pi/128) q[60];
-cx q[60],q[54];
-rz(-pi/128) q[54];
-cx q[60],q[54];
-rz(pi/128) q[54];
-rz(pi/64) q[60];
-cx q[60],q[55];
-rz(-pi/64) q[55];
-cx q[60],q[55];
-rz(pi/64) q[55];
-rz(pi/32) q[60];
-cx q[60],q[56];
-rz(-pi/32) q[56];
-cx q[60],q[56];
-rz(pi/32) q[56];
-rz(pi/16) q[60];
-cx q[60],q[57];
-rz(-pi/16) q[57];
-cx q[60],q[57];
-rz(pi/16) q[57];
-rz(pi/8) q[60];
-cx q[60],q[58];
-rz(-pi/8) q[58];
-cx q[60],q[58];
-rz(pi/8) q[58];
-rz(pi/4) q[60];
-cx q[60],q[59];
-rz(-pi/4) q[59];
-cx q[60],q[59];
-rz(pi/4) q[59];
-rz(pi/2) q[60];
-sx q[60];
-rz(pi/2) q[60];
-rz(1.42863093678434e-12) q[61];
-cx q[61],q[21];
-rz(-1.42863093678434e-12) q[21];
-cx q[61],q[21];
-rz(1.42863093678434e-12) q[21];
-rz(2.85726187356867e-12) q[61];
-cx q[61],q[22];
-rz(-2.85726187356867e-12) q[22];
-cx q[61],q[22];
-rz(2.85726187356867e-12) q[22];
-rz(5.71452374713734e-12) q[61];
-cx q[61],q[23];
-rz(-5.71452374713734e-12) q[23];
-cx q[61],q[23];
-rz(5.71452374713734e-12) q[23];
-rz(1.14290474942747e-11) q[61];
-cx q[61],q[24];
-rz(-1.14290474942747e-11) q[24];
-cx q[61],q[24];
-rz(1.14290474942747e-11) q[24];
-rz(2.28580949885494e-11) q[61];
-cx q[61],q[25];
-rz(-2.28580949885494e-11) q[25];
-cx q[61],q[25];
-rz(2.28580949885494e-11) q[25];
-rz(4.57161899770987e-11) q[61];
-cx q[61],q[26];
-rz(-4.57161899770987e-11) q[26];
-cx q[61],q[26];
-rz(4.57161899770987e-11) q[26];
-rz(9.14323799541975e-11) q[61];
-cx q[61],q[27];
-rz(-9.14323799541975e-11) q[27];
-cx q[61],q[27];
-rz(9.14323799541975e-11) q[27];
-rz(1.82864759908395e-10) q[61];
-cx q[61],q[28];
-rz(-1.82864759908395e-10) q[28];
-cx q[61],q[28];
-rz(1.82864759908395e-10) q[28];
-rz(3.6572951981679e-10) q[61];
-cx q[61],q[29];
-rz(-3.6572951981679e-10) q[29];
-cx q[61],q[29];
-rz(3.6572951981679e-10) q[29];
-rz(7.3145903963358e-10) q[61];
-cx q[61],q[30];
-rz(-7.3145903963358e-10) q[30];
-cx q[61],q[30];
-rz(7.3145903963358e-10) q[30];
-rz(pi/2147483648) q[61];
-cx q[61],q[31];
-rz(-pi/2147483648) q[31];
-cx q[61],q[31];
-rz(pi/2147483648) q[31];
-rz(pi/1073741824) q[61];
-cx q[61],q[32];
-rz(-pi/1073741824) q[32];
-cx q[61],q[32];
-rz(pi/1073741824) q[32];
-rz(pi/536870912) q[61];
-cx q[61],q[33];
-rz(-pi/536870912) q[33];
-cx q[61],q[33];
-rz(pi/536870912) q[33];
-rz(pi/268435456) q[61];
-cx q[61],q[34];
-rz(-pi/268435456) q[34];
-cx q[61],q[34];
-rz(pi/268435456) q[34];
-rz(pi/134217728) q[61];
-cx q[61],q[35];
-rz(-pi/134217728) q[35];
-cx q[61],q[35];
-rz(pi/134217728) q[35];
-rz(pi/67108864) q[61];
-cx q[61],q[36];
-rz(-pi/67108864) q[36];
-cx q[61],q[36];
-rz(pi/67108864) q[36];
-rz(pi/33554432) q[61];
-cx q[61],q[37];
-rz(-pi/33554432) q[37];
-cx q[61],q[37];
-rz(pi/33554432) q[37];
-rz(pi/16777216) q[61];
-cx q[61],q[38];
-rz(-pi/16777216) q[38];
-cx q[61],q[38];
-rz(pi/16777216) q[38];
-rz(pi/8388608) q[61];
-cx q[61],q[39];
-rz(-pi/8388608) q[39];
-cx q[61],q[39];
-rz(pi/8388608) q[39];
-rz(pi/4194304) q[61];
-cx q[61],q[40];
-rz(-pi/4194304) q[40];
-cx q[61],q[40];
-rz(pi/4194304) q[40];
-rz(pi/2097152) q[61];
-cx q[61],q[41];
-rz(-pi/2097152) q[41];
-cx q[61],q[41];
-rz(pi/2097152) q[41];
-rz(pi/1048576) q[61];
-cx q[61],q[42];
-rz(-pi/1048576) q[42];
-cx q[61],q[42];
-rz(pi/1048576) q[42];
-rz(pi/524288) q[61];
-cx q[61],q[43];
-rz(-pi/524288) q[43];
-cx q[61],q[43];
-rz(pi/524288) q[43];
-rz(pi/262144) q[61];
-cx q[61],q[44];
-rz(-pi/262144) q[44];
-cx q[61],q[44];
-rz(pi/262144) q[44];
-rz(pi/131072) q[61];
-cx q[61],q[45];
-rz(-pi/131072) q[45];
-cx q[61],q[45];
-rz(pi/131072) q[45];
-rz(pi/65536) q[61];
-cx q[61],q[46];
-rz(-pi/65536) q[46];
-cx q[61],q[46];
-rz(pi/65536) q[46];
-rz(pi/32768) q[61];
-cx q[61],q[47];
-rz(-pi/32768) q[47];
-cx q[61],q[47];
-rz(pi/32768) q[47];
-rz(pi/16384) q[61];
-cx q[61],q[48];
-rz(-pi/16384) q[48];
-cx q[61],q[48];
-rz(pi/16384) q[48];
-rz(pi/8192) q[61];
-cx q[61],q[49];
-rz(-pi/8192) q[49];
-cx q[61],q[49];
-rz(pi/8192) q[49];
-rz(pi/4096) q[61];
-cx q[61],q[50];
-rz(-pi/4096) q[50];
-cx q[61],q[50];
-rz(pi/4096) q[50];
-rz(pi/2048) q[61];
-cx q[61],q[51];
-rz(-pi/2048) q[51];
-cx q[61],q[51];
-rz(pi/2048) q[51];
-rz(pi/1024) q[61];
-cx q[61],q[52];
-rz(-pi/1024) q[52];
-cx q[61],q[52];
-rz(pi/1024) q[52];
-rz(pi/512) q[61];
-cx q[61],q[53];
-rz(-pi/512) q[53];
-cx q[61],q[53];
-rz(pi/512) q[53];
-rz(pi/256) q[61];
-cx q[61],q[54];
-rz(-pi/256) q[54];
-cx q[61],q[54];
-rz(pi/256) q[54];
-rz(pi/128) q[61];
-cx q[61],q[55];
-rz(-pi/128) q[55];
-cx q[61],q[55];
-rz(pi/128) q[55];
-rz(pi/64) q[61];
-cx q[61],q[56];
-rz(-pi/64) q[56];
-cx q[61],q[56];
-rz(pi/64) q[56];
-rz(pi/32) q[61];
-cx q[61],q[57];
-rz(-pi/32) q[57];
-cx q[61],q[57];
-rz(pi/32) q[57];
-rz(pi/16) q[61];
-cx q[61],q[58];
-rz(-pi/16) q[58];
-cx q[61],q[58];
-rz(pi/16) q[58];
-rz(pi/8) q[61];
-cx q[61],q[59];
-rz(-pi/8) q[59];
-cx q[61],q[59];
-rz(pi/8) q[59];
-rz(pi/4) q[61];
-cx q[61],q[60];
-rz(-pi/4) q[60];
-cx q[61],q[60];
-rz(pi/4) q[60];
-rz(pi/2) q[61];
-sx q[61];
-rz(pi/2) q[61];
-rz(1.42863093678434e-12) q[62];
-cx q[62],q[22];
-rz(-1.42863093678434e-12) q[22];
-cx q[62],q[22];
-rz(1.42863093678434e-12) q[22];
-rz(2.85726187356867e-12) q[62];
-cx q[62],q[23];
-rz(-2.85726187356867e-12) q[23];
-cx q[62],q[23];
-rz(2.85726187356867e-12) q[23];
-rz(5.71452374713734e-12) q[62];
-cx q[62],q[24];
-rz(-5.71452374713734e-12) q[24];
-cx q[62],q[24];
-rz(5.71452374713734e-12) q[24];
-rz(1.14290474942747e-11) q[62];
-cx q[62],q[25];
-rz(-1.14290474942747e-11) q[25];
-cx q[62],q[25];
-rz(1.14290474942747e-11) q[25];
-rz(2.28580949885494e-11) q[62];
-cx q[62],q[26];
-rz(-2.28580949885494e-11) q[26];
-cx q[62],q[26];
-rz(2.28580949885494e-11) q[26];
-rz(4.57161899770987e-11) q[62];
-cx q[62],q[27];
-rz(-4.57161899770987e-11) q[27];
-cx q[62],q[27];
-rz(4.57161899770987e-11) q[27];
-rz(9.14323799541975e-11) q[62];
-cx q[62],q[28];
-rz(-9.14323799541975e-11) q[28];
-cx q[62],q[28];
-rz(9.14323799541975e-11) q[28];
-rz(1.82864759908395e-10) q[62];
-cx q[62],q[29];
-rz(-1.82864759908395e-10) q[29];
-cx q[62],q[29];
-rz(1.82864759908395e-10) q[29];
-rz(3.6572951981679e-10) q[62];
-cx q[62],q[30];
-rz(-3.6572951981679e-10) q[30];
-cx q[62],q[30];
-rz(3.6572951981679e-10) q[30];
-rz(7.3145903963358e-10) q[62];
-cx q[62],q[31];
-rz(-7.3145903963358e-10) q[31];
-cx q[62],q[31];
-rz(7.3145903963358e-10) q[31];
-rz(pi/2147483648) q[62];
-cx q[62],q[32];
-rz(-pi/2147483648) q[32];
-cx q[62],q[32];
-rz(pi/2147483648) q[32];
-rz(pi/1073741824) q[62];
-cx q[62],q[33];
-rz(-pi/1073741824) q[33];
-cx q[62],q[33];
-rz(pi/1073741824) q[33];
-rz(pi/536870912) q[62];
-cx q[62],q[34];
-rz(-pi/536870912) q[34];
-cx q[62],q[34];
-rz(pi/536870912) q[34];
-rz(pi/268435456) q[62];
-cx q[62],q[35];
-rz(-pi/268435456) q[35];
-cx q[62],q[35];
-rz(pi/268435456) q[35];
-rz(pi/134217728) q[62];
-cx q[62],q[36];
-rz(-pi/134217728) q[36];
-cx q[62],q[36];
-rz(pi/134217728) q[36];
-rz(pi/67108864) q[62];
-cx q[62],q[37];
-rz(-pi/67108864) q[37];
-cx q[62],q[37];
-rz(pi/67108864) q[37];
-rz(pi/33554432) q[62];
-cx q[62],q[38];
-rz(-pi/33554432) q[38];
-cx q[62],q[38];
-rz(pi/33554432) q[38];
-rz(pi/16777216) q[62];
-cx q[62],q[39];
-rz(-pi/16777216) q[39];
-cx q[62],q[39];
-rz(pi/16777216) q[39];
-rz(pi/8388608) q[62];
-cx q[62],q[40];
-rz(-pi/8388608) q[40];
-cx q[62],q[40];
-rz(pi/8388608) q[40];
-rz(pi/4194304) q[62];
-cx q[62],q[41];
-rz(-pi/4194304) q[41];
-cx q[62],q[41];
-rz(pi/4194304) q[41];
-rz(pi/2097152) q[62];
-cx q[62],q[42];
-rz(-pi/2097152) q[42];
-cx q[62],q[42];
-rz(pi/2097152) q[42];
-rz(pi/1048576) q[62];
-cx q[62],q[43];
-rz(-pi/1048576) q[43];
-cx q[62],q[43];
-rz(pi/1048576) q[43];
-rz(pi/524288) q[62];
-cx q[62],q[44];
-rz(-pi/524288) q[44];
-cx q[62],q[44];
-rz(pi/524288) q[44];
-rz(pi/262144) q[62];
-cx q[62],q[45];
-rz(-pi/262144) q[45];
-cx q[62],q[45];
-rz(pi/262144) q[45];
-rz(pi/131072) q[62];
-cx q[62],q[46];
-rz(-pi/131072) q[46];
-cx q[62],q[46];
-rz(pi/131072) q[46];
-rz(pi/65536) q[62];
-cx q[62],q[47];
-rz(-pi/65536) q[47];
-cx q[62],q[47];
-rz(pi/65536) q[47];
-rz(pi/32768) q[62];
-cx q[62],q[48];
-rz(-pi/32768) q[48];
-cx q[62],q[48];
-rz(pi/32768) q[48];
-rz(pi/16384) q[62];
-cx q[62],q[49];
-rz(-pi/16384) q[49];
-cx q[62],q[49];
-rz(pi/16384) q[49];
-rz(pi/8192) q[62];
-cx q[62],q[50];
-rz(-pi/8192) q[50];
-cx q[62],q[50];
-rz(pi/8192) q[50];
-rz(pi/4096) q[62];
-cx q[62],q[51];
-rz(-pi/4096) q[51];
-cx q[62],q[51];
-rz(pi/4096) q[51];
-rz(pi/2048) q[62];
-cx q[62],q[52];
-rz(-pi/2048) q[52];
-cx q[62],q[52];
-rz(pi/2048) q[52];
-rz(pi/1024) q[62];
-cx q[62],q[53];
-rz(-pi/1024) q[53];
-cx q[62],q[53];
-rz(pi/1024) q[53];
-rz(pi/512) q[62];
-cx q[62],q[54];
-rz(-pi/512) q[54];
-cx q[62],q[54];
-rz(pi/512) q[54];
-rz(pi/256) q[62];
-cx q[62],q[55];
-rz(-pi/256) q[55];
-cx q[62],q[55];
-rz(pi/256) q[55];
-rz(pi/128) q[62];
-cx q[62],q[56];
-rz(-pi/128) q[56];
-cx q[62],q[56];
-rz(pi/128) q[56];
-rz(pi/64) q[62];
-cx q[62],q[57];
-rz(-pi/64) q[57];
-cx q[62],q[57];
-rz(pi/64) q[57];
-rz(pi/32) q[62];
-cx q[62],q[58];
-rz(-pi/32) q[58];
-cx q[62],q[58];
-rz(pi/32) q[58];
-rz(pi/16) q[62];
-cx q[62],q[59];
-rz(-pi/16) q[59];
-cx q[62],q[59];
-rz(pi/16) q[59];
-rz(pi/8) q[62];
-cx q[62],q[60];
-rz(-pi/8) q[60];
-cx q[62],q[60];
-rz(pi/8) q[60];
-rz(pi/4) q[62];
-cx q[62],q[61];
-rz(-pi/4) q[61];
-cx q[62],q[61];
-rz(pi/4) q[61];
-rz(pi/2) q[62];
-sx q[62];
-rz(pi/2) q[62];
-rz(1.42863093678434e-12) q[63];
-cx q[63],q[23];
-rz(-1.42863093678434e-12) q[23];
-cx q[63],q[23];
-rz(1.42863093678434e-12) q[23];
-rz(2.85726187356867e-12) q[63];
-cx q[63],q[24];
-rz(-2.85726187356867e-12) q[24];
-cx q[63],q[24];
-rz(2.85726187356867e-12) q[24];
-rz(5.71452374713734e-12) q[63];
-cx q[63],q[25];
-rz(-5.71452374713734e-12) q[25];
-cx q[63],q[25];
-rz(5.71452374713734e-12) q[25];
-rz(1.14290474942747e-11) q[63];
-cx q[63],q[26];
-rz(-1.14290474942747e-11) q[26];
-cx q[63],q[26];
-rz(1.14290474942747e-11) q[26];
-rz(2.28580949885494e-11) q[63];
-cx q[63],q[27];
-rz(-2.28580949885494e-11) q[27];
-cx q[63],q[27];
-rz(2.28580949885494e-11) q[27];
-rz(4.57161899770987e-11) q[63];
-cx q[63],q[28];
-rz(-4.57161899770987e-11) q[28];
-cx q[63],q[28];
-rz(4.57161899770987e-11) q[28];
-rz(9.14323799541975e-11) q[63];
-cx q[63],q[29];
-rz(-9.14323799541975e-11) q[29];
-cx q[63],q[29];
-rz(9.14323799541975e-11) q[29];
-rz(1.82864759908395e-10) q[63];
-cx q[63],q[30];
-rz(-1.82864759908395e-10) q[30];
-cx q[63],q[30];
-rz(1.82864759908395e-10) q[30];
-rz(3.6572951981679e-10) q[63];
-cx q[63],q[31];
-rz(-3.6572951981679e-10) q[31];
-cx q[63],q[31];
-rz(3.6572951981679e-10) q[31];
-rz(7.3145903963358e-10) q[63];
-cx q[63],q[32];
-rz(-7.3145903963358e-10) q[32];
-cx q[63],q[32];
-rz(7.3145903963358e-10) q[32];
-rz(pi/2147483648) q[63];
-cx q[63],q[33];
-rz(-pi/2147483648) q[33];
-cx q[63],q[33];
-rz(pi/2147483648) q[33];
-rz(pi/1073741824) q[63];
-cx q[63],q[34];
-rz(-pi/1073741824) q[34];
-cx q[63],q[34];
-rz(pi/1073741824) q[34];
-rz(pi/536870912) q[63];
-cx q[63],q[35];
-rz(-pi/536870912) q[35];
-cx q[63],q[35];
-rz(pi/536870912) q[35];
-rz(pi/268435456) q[63];
-cx q[63],q[36];
-rz(-pi/268435456) q[36];
-cx q[63],q[36];
-rz(pi/268435456) q[36];
-rz(pi/134217728) q[63];
-cx q[63],q[37];
-rz(-pi/134217728) q[37];
-cx q[63],q[37];
-rz(pi/134217728) q[37];
-rz(pi/67108864) q[63];
-cx q[63],q[38];
-rz(-pi/67108864) q[38];
-cx q[63],q[38];
-rz(pi/67108864) q[38];
-rz(pi/33554432) q[63];
-cx q[63],q[39];
-rz(-pi/33554432) q[39];
-cx q[63],q[39];
-rz(pi/33554432) q[39];
-rz(pi/16777216) q[63];
-cx q[63],q[40];
-rz(-pi/16777216) q[40];
-cx q[63],q[40];
-rz(pi/16777216) q[40];
-rz(pi/8388608) q[63];
-cx q[63],q[41];
-rz(-pi/8388608) q[41];
-cx q[63],q[41];
-rz(pi/8388608) q[41];
-rz(pi/4194304) q[63];
-cx q[63],q[42];
-rz(-pi/4194304) q[42];
-cx q[63],q[42];
-rz(pi/4194304) q[42];
-rz(pi/2097152) q[63];
-cx q[63],q[43];
-rz(-pi/2097152) q[43];
-cx q[63],q[43];
-rz(pi/2097152) q[43];
-rz(pi/1048576) q[63];
-cx q[63],q[44];
-rz(-pi/1048576) q[44];
-cx q[63],q[44];
-rz(pi/1048576) q[44];
-rz(pi/524288) q[63];
-cx q[63],q[45];
-rz(-pi/524288) q[45];
-cx q[63],q[45];
-rz(pi/524288) q[45];
-rz(pi/262144) q[63];
-cx q[63],q[46];
-rz(-pi/262144) q[46];
-cx q[63],q[46];
-rz(pi/262144) q[46];
-rz(pi/131072) q[63];
-cx q[63],q[47];
-rz(-pi/131072) q[47];
-cx q[63],q[47];
-rz(pi/131072) q[47];
-rz(pi/65536) q[63];
-cx q[63],q[48];
-rz(-pi/65536) q[48];
-cx q[63],q[48];
-rz(pi/65536) q[48];
-rz(pi/32768) q[63];
-cx q[63],q[49];
-rz(-pi/32768) q[49];
-cx q[63],q[49];
-rz(pi/32768) q[49];
-rz(pi/16384) q[63];
-cx q[63],q[50];
-rz(-pi/16384) q[50];
-cx q[63],q[50];
-rz(pi/16384) q[50];
-rz(pi/8192) q[63];
-cx q[63],q[51];
-rz(-pi/8192) q[51];
-cx q[63],q[51];
-rz(pi/8192) q[51];
-rz(pi/4096) q[63];
-cx q[63],q[52];
-rz(-pi/4096) q[52];
-cx q[63],q[52];
-rz(pi/4096) q[52];
-rz(pi/2048) q[63];
-cx q[63],q[53];
-rz(-pi/2048) q[53];
-cx q[63],q[53];
-rz(pi/2048) q[53];
-rz(pi/1024) q[63];
-cx q[63],q[54];
-rz(-pi/1024) q[54];
-cx q[63],q[54];
-rz(pi/1024) q[54];
-rz(pi/512) q[63];
-cx q[63],q[55];
-rz(-pi/512) q[55];
-cx q[63],q[55];
-rz(pi/512) q[55];
-rz(pi/256) q[63];
-cx q[63],q[56];
-rz(-pi/256) q[56];
-cx q[63],q[56];
-rz(pi/256) q[56];
-rz(pi/128) q[63];
-cx q[63],q[57];
-rz(-pi/128) q[57];
-cx q[63],q[57];
-rz(pi/128) q[57];
-rz(pi/64) q[63];
-cx q[63],q[58];
-rz(-pi/64) q[58];
-cx q[63],q[58];
-rz(pi/64) q[58];
-rz(pi/32) q[63];
-cx q[63],q[59];
-rz(-pi/32) q[59];
-cx q[63],q[59];
-rz(pi/32) q[59];
-rz(pi/16) q[63];
-cx q[63],q[60];
-rz(-pi/16) q[60];
-cx q[63],q[60];
-rz(pi/16) q[60];
-rz(pi/8) q[63];
-cx q[63],q[61];
-rz(-pi/8) q[61];
-cx q[63],q[61];
-rz(pi/8) q[61];
-rz(pi/4) q[63];
-cx q[63],q[62];
-rz(-pi/4) q[62];
-cx q[63],q[62];
-rz(pi/4) q[62];
-rz(pi/2) q[63];
-sx q[63];
-rz(pi/2) q[63];
-rz(1.42863093678434e-12) q[64];
-cx q[64],q[24];
-rz(-1.42863093678434e-12) q[24];
-cx q[64],q[24];
-rz(1.42863093678434e-12) q[24];
-rz(2.85726187356867e-12) q[64];
-cx q[64],q[25];
-rz(-2.85726187356867e-12) q[25];
-cx q[64],q[25];
-rz(2.85726187356867e-12) q[25];
-rz(5.71452374713734e-12) q[64];
-cx q[64],q[26];
-rz(-5.71452374713734e-12) q[26];
-cx q[64],q[26];
-rz(5.71452374713734e-12) q[26];
-rz(1.14290474942747e-11) q[64];
-cx q[64],q[27];
-rz(-1.14290474942747e-11) q[27];
-cx q[64],q[27];
-rz(1.14290474942747e-11) q[27];
-rz(2.28580949885494e-11) q[64];
-cx q[64],q[28];
-rz(-2.28580949885494e-11) q[28];
-cx q[64],q[28];
-rz(2.28580949885494e-11) q[28];
-rz(4.57161899770987e-11) q[64];
-cx q[64],q[29];
-rz(-4.57161899770987e-11) q[29];
-cx q[64],q[29];
-rz(4.57161899770987e-11) q[29];
-rz(9.14323799541975e-11) q[64];
-cx q[64],q[30];
-rz(-9.14323799541975e-11) q[30];
-cx q[64],q[30];
-rz(9.14323799541975e-11) q[30];
-rz(1.82864759908395e-10) q[64];
-cx q[64],q[31];
-rz(-1.82864759908395e-10) q[31];
-cx q[64],q[31];
-rz(1.82864759908395e-10) q[31];
-rz(3.6572951981679e-10) q[64];
-cx q[64],q[32];
-rz(-3.6572951981679e-10) q[32];
-cx q[64],q[32];
-rz(3.6572951981679e-10) q[32];
-rz(7.3145903963358e-10) q[64];
-cx q[64],q[33];
-rz(-7.3145903963358e-10) q[33];
-cx q[64],q[33];
-rz(7.3145903963358e-10) q[33];
-rz(pi/2147483648) q[64];
-cx q[64],q[34];
-rz(-pi/2147483648) q[34];
-cx q[64],q[34];
-rz(pi/2147483648) q[34];
-rz(pi/1073741824) q[64];
-cx q[64],q[35];
-rz(-pi/1073741824) q[35];
-cx q[64],q[35];
-rz(pi/1073741824) q[35];
-rz(pi/536870912) q[64];
-cx q[64],q[36];
-rz(-pi/536870912) q[36];
-cx q[64],q[36];
-rz(pi/536870912) q[36];
-rz(pi/268435456) q[64];
-cx q[64],q[37];
-rz(-pi/268435456) q[37];
-cx q[64],q[37];
-rz(pi/268435456) q[37];
-rz(pi/134217728) q[64];
-cx q[64],q[38];
-rz(-pi/134217728) q[38];
-cx q[64],q[38];
-rz(pi/134217728) q[38];
-rz(pi/67108864) q[64];
-cx q[64],q[39];
-rz(-pi/67108864) q[39];
-cx q[64],q[39];
-rz(pi/67108864) q[39];
-rz(pi/33554432) q[64];
-cx q[64],q[40];
-rz(-pi/33554432) q[40];
-cx q[64],q[40];
-rz(pi/33554432) q[40];
-rz(pi/16777216) q[64];
-cx q[64],q[41];
-rz(-pi/16777216) q[41];
-cx q[64],q[41];
-rz(pi/16777216) q[41];
-rz(pi/8388608) q[64];
-cx q[64],q[42];
-rz(-pi/8388608) q[42];
-cx q[64],q[42];
-rz(pi/8388608) q[42];
-rz(pi/4194304) q[64];
-cx q[64],q[43];
-rz(-pi/4194304) q[43];
-cx q[64],q[43];
-rz(pi/4194304) q[43];
-rz(pi/2097152) q[64];
-cx q[64],q[44];
-rz(-pi/2097152) q[44];
-cx q[64],q[44];
-rz(pi/2097152) q[44];
-rz(pi/1048576) q[64];
-cx q[64],q[45];
-rz(-pi/1048576) q[45];
-cx q[64],q[45];
-rz(pi/1048576) q[45];
-rz(pi/524288) q[64];
-cx q[64],q[46];
-rz(-pi/524288) q[46];
-cx q[64],q[46];
-rz(pi/524288) q[46];
-rz(pi/262144) q[64];
-cx q[64],q[47];
-rz(-pi/262144) q[47];
-cx q[64],q[47];
-rz(pi/262144) q[47];
-rz(pi/131072) q[64];
-cx q[64],q[48];
-rz(-pi/131072) q[48];
-cx q[64],q[48];
-rz(pi/131072) q[48];
-rz(pi/65536) q[64];
-cx q[64],q[49];
-rz(-pi/65536) q[49];
-cx q[64],q[49];
-rz(pi/65536) q[49];
-rz(pi/32768) q[64];
-cx q[64],q[50];
-rz(-pi/32768) q[50];
-cx q[64],q[50];
-rz(pi/32768) q[50];
-rz(pi/16384) q[64];
-cx q[64],q[51];
-rz(-pi/16384) q[51];
-cx q[64],q[51];
-rz(pi/16384) q[51];
-rz(pi/8192) q[64];
-cx q[64],q[52];
-rz(-pi/8192) q[52];
-cx q[64],q[52];
-rz(pi/8192) q[52];
-rz(pi/4096) q[64];
-cx q[64],q[53];
-rz(-pi/4096) q[53];
-cx q[64],q[53];
-rz(pi/4096) q[53];
-rz(pi/2048) q[64];
-cx q[64],q[54];
-rz(-pi/2048) q[54];
-cx q[64],q[54];
-rz(pi/2048) q[54];
-rz(pi/1024) q[64];
-cx q[64],q[55];
-rz(-pi/1024) q[55];
-cx q[64],q[55];
-rz(pi/1024) q[55];
-rz(pi/512) q[64];
-cx q[64],q[56];
-rz(-pi/512) q[56];
-cx q[64],q[56];
-rz(pi/512) q[56];
-rz(pi/256) q[64];
-cx q[64],q[57];
-rz(-pi/256) q[57];
-cx q[64],q[57];
-rz(pi/256) q[57];
-rz(pi/128) q[64];
-cx q[64],q[58];
-rz(-pi/128) q[58];
-cx q[64],q[58];
-rz(pi/128) q[58];
-rz(pi/64) q[64];
-cx q[64],q[59];
-rz(-pi/64) q[59];
-cx q[64],q[59];
-rz(pi/64) q[59];
-rz(pi/32) q[64];
-cx q[64],q[60];
-rz(-pi/32) q[60];
-cx q[64],q[60];
-rz(pi/32) q[60];
-rz(pi/16) q[64];
-cx q[64],q[61];
-rz(-pi/16) q[61];
-cx q[64],q[61];
-rz(pi/16) q[61];
-rz(pi/8) q[64];
-cx q[64],q[62];
-rz(-pi/8) q[62];
-cx q[64],q[62];
-rz(pi/8) q[62];
-rz(pi/4) q[64];
-cx q[64],q[63];
-rz(-pi/4) q[63];
-cx q[64],q[63];
-rz(pi/4) q[63];
-rz(pi/2) q[64];
-sx q[64];
-rz(pi/2) q[64];
-rz(1.42863093678434e-12) q[65];
-cx q[65],q[25];
-rz(-1.42863093678434e-12) q[25];
-cx q[65],q[25];
-rz(1.42863093678434e-12) q[25];
-rz(2.85726187356867e-12) q[65];
-cx q[65],q[26];
-rz(-2.85726187356867e-12) q[26];
-cx q[65],q[26];
-rz(2.85726187356867e-12) q[26];
-rz(5.71452374713734e-12) q[65];
-cx q[65],q[27];
-rz(-5.71452374713734e-12) q[27];
-cx q[65],q[27];
-rz(5.71452374713734e-12) q[27];
-rz(1.14290474942747e-11) q[65];
-cx q[65],q[28];
-rz(-1.14290474942747e-11) q[28];
-cx q[65],q[28];
-rz(1.14290474942747e-11) q[28];
-rz(2.28580949885494e-11) q[65];
-cx q[65],q[29];
-rz(-2.28580949885494e-11) q[29];
-cx q[65],q[29];
-rz(2.28580949885494e-11) q[29];
-rz(4.57161899770987e-11) q[65];
-cx q[65],q[30];
-rz(-4.57161899770987e-11) q[30];
-cx q[65],q[30];
-rz(4.57161899770987e-11) q[30];
-rz(9.14323799541975e-11) q[65];
-cx q[65],q[31];
-rz(-9.14323799541975e-11) q[31];
-cx q[65],q[31];
-rz(9.14323799541975e-11) q[31];
-rz(1.82864759908395e-10) q[65];
-cx q[65],q[32];
-rz(-1.82864759908395e-10) q[32];
-cx q[65],q[32];
-rz(1.82864759908395e-10) q[32];
-rz(3.6572951981679e-10) q[65];
-cx q[65],q[33];
-rz(-3.6572951981679e-10) q[33];
-cx q[65],q[33];
-rz(3.6572951981679e-10) q[33];
-rz(7.3145903963358e-10) q[65];
-cx q[65],q[34];
-rz(-7.3145903963358e-10) q[34];
-cx q[65],q[34];
-rz(7.3145903963358e-10) q[34];
-rz(pi/2147483648) q[65];
-cx q[65],q[35];
-rz(-pi/2147483648) q[35];
-cx q[65],q[35];
-rz(pi/2147483648) q[35];
-rz(pi/1073741824) q[65];
-cx q[65],q[36];
-rz(-pi/1073741824) q[36];
-cx q[65],q[36];
-rz(pi/1073741824) q[36];
-rz(pi/536870912) q[65];
-cx q[65],q[37];
-rz(-pi/536870912) q[37];
-cx q[65],q[37];
-rz(pi/536870912) q[37];
-rz(pi/268435456) q[65];
-cx q[65],q[38];
-rz(-pi/268435456) q[38];
-cx q[65],q[38];
-rz(pi/268435456) q[38];
-rz(pi/134217728) q[65];
-cx q[65],q[39];
-rz(-pi/134217728) q[39];
-cx q[65],q[39];
-rz(pi/134217728) q[39];
-rz(pi/67108864) q[65];
-cx q[65],q[40];
-rz(-pi/67108864) q[40];
-cx q[65],q[40];
-rz(pi/67108864) q[40];
-rz(pi/33554432) q[65];
-cx q[65],q[41];
-rz(-pi/33554432) q[41];
-cx q[65],q[41];
-rz(pi/33554432) q[41];
-rz(pi/16777216) q[65];
-cx q[65],q[42];
-rz(-pi/16777216) q[42];
-cx q[65],q[42];
-rz(pi/16777216) q[42];
-rz(pi/8388608) q[65];
-cx q[65],q[43];
-rz(-pi/8388608) q[43];
-cx q[65],q[43];
-rz(pi/8388608) q[43];
-rz(pi/4194304) q[65];
-cx q[65],q[44];
-rz(-pi/4194304) q[44];
-cx q[65],q[44];
-rz(pi/4194304) q[44];
-rz(pi/2097152) q[65];
-cx q[65],q[45];
-rz(-pi/2097152) q[45];
-cx q[65],q[45];
-rz(pi/2097152) q[45];
-rz(pi/1048576) q[65];
-cx q[65],q[46];
-rz(-pi/1048576) q[46];
-cx q[65],q[46];
-rz(pi/1048576) q[46];
-rz(pi/524288) q[65];
-cx q[65],q[47];
-rz(-pi/524288) q[47];
-cx q[65],q[47];
-rz(pi/524288) q[47];
-rz(pi/262144) q[65];
-cx q[65],q[48];
-rz(-pi/262144) q[48];
-cx q[65],q[48];
-rz(pi/262144) q[48];
-rz(pi/131072) q[65];
-cx q[65],q[49];
-rz(-pi/131072) q[49];
-cx q[65],q[49];
-rz(pi/131072) q[49];
-rz(pi/65536) q[65];
-cx q[65],q[50];
-rz(-pi/65536) q[50];
-cx q[65],q[50];
-rz(pi/65536) q[50];
-rz(pi/32768) q[65];
-cx q[65],q[51];
-rz(-pi/32768) q[51];
-cx q[65],q[51];
-rz(pi/32768) q[51];
-rz(pi/16384) q[65];
-cx q[65],q[52];
-rz(-pi/16384) q[52];
-cx q[65],q[52];
-rz(pi/16384) q[52];
-rz(pi/8192) q[65];
-cx q[65],q[53];
-rz(-pi/8192) q[53];
-cx q[65],q[53];
-rz(pi/8192) q[53];
-rz(pi/4096) q[65];
-cx q[65],q[54];
-rz(-pi/4096) q[54];
-cx q[65],q[54];
-rz(pi/4096) q[54];
-rz(pi/2048) q[65];
-cx q[65],q[55];
-rz(-pi/2048) q[55];
-cx q[65],q[55];
-rz(pi/2048) q[55];
-rz(pi/1024) q[65];
-cx q[65],q[56];
-rz(-pi/1024) q[56];
-cx q[65],q[56];
-rz(pi/1024) q[56];
-rz(pi/512) q[65];
-cx q[65],q[57];
-rz(-pi/512) q[57];
-cx q[65],q[57];
-rz(pi/512) q[57];
-rz(pi/256) q[65];
-cx q[65],q[58];
-rz(-pi/256) q[58];
-cx q[65],q[58];
-rz(pi/256) q[58];
-rz(pi/128) q[65];
-cx q[65],q[59];
-rz(-pi/128) q[59];
-cx q[65],q[59];
-rz(pi/128) q[59];
-rz(pi/64) q[65];
-cx q[65],q[60];
-rz(-pi/64) q[60];
-cx q[65],q[60];
-rz(pi/64) q[60];
-rz(pi/32) q[65];
-cx q[65],q[61];
-rz(-pi/32) q[61];
-cx q[65],q[61];
-rz(pi/32) q[61];
-rz(pi/16) q[65];
-cx q[65],q[62];
-rz(-pi/16) q[62];
-cx q[65],q[62];
-rz(pi/16) q[62];
-rz(pi/8) q[65];
-cx q[65],q[63];
-rz(-pi/8) q[63];
-cx q[65],q[63];
-rz(pi/8) q[63];
-rz(pi/4) q[65];
-cx q[65],q[64];
-rz(-pi/4) q[64];
-cx q[65],q[64];
-rz(pi/4) q[64];
-rz(pi/2) q[65];
-sx q[65];
-rz(pi/2) q[65];
-rz(1.42863093678434e-12) q[66];
-cx q[66],q[26];
-rz(-1.42863093678434e-12) q[26];
-cx q[66],q[26];
-rz(1.42863093678434e-12) q[26];
-rz(2.85726187356867e-12) q[66];
-cx q[66],q[27];
-rz(-2.85726187356867e-12) q[27];
-cx q[66],q[27];
-rz(2.85726187356867e-12) q[27];
-rz(5.71452374713734e-12) q[66];
-cx q[66],q[28];
-rz(-5.71452374713734e-12) q[28];
-cx q[66],q[28];
-rz(5.71452374713734e-12) q[28];
-rz(1.14290474942747e-11) q[66];
-cx q[66],q[29];
-rz(-1.14290474942747e-11) q[29];
-cx q[66],q[29];
-rz(1.14290474942747e-11) q[29];
-rz(2.28580949885494e-11) q[66];
-cx q[66],q[30];
-rz(-2.28580949885494e-11) q[30];
-cx q[66],q[30];
-rz(2.28580949885494e-11) q[30];
-rz(4.57161899770987e-11) q[66];
-cx q[66],q[31];
-rz(-4.57161899770987e-11) q[31];
-cx q[66],q[31];
-rz(4.57161899770987e-11) q[31];
-rz(9.14323799541975e-11) q[66];
-cx q[66],q[32];
-rz(-9.14323799541975e-11) q[32];
-cx q[66],q[32];
-rz(9.14323799541975e-11) q[32];
-rz(1.82864759908395e-10) q[66];
-cx q[66],q[33];
-rz(-1.82864759908395e-10) q[33];
-cx q[66],q[33];
-rz(1.82864759908395e-10) q[33];
-rz(3.6572951981679e-10) q[66];
-cx q[66],q[34];
-rz(-3.6572951981679e-10) q[34];
-cx q[66],q[34];
-rz(3.6572951981679e-10) q[34];
-rz(7.3145903963358e-10) q[66];
-cx q[66],q[35];
-rz(-7.3145903963358e-10) q[35];
-cx q[66],q[35];
-rz(7.3145903963358e-10) q[35];
-rz(pi/2147483648) q[66];
-cx q[66],q[36];
-rz(-pi/2147483648) q[36];
-cx q[66],q[36];
-rz(pi/2147483648) q[36];
-rz(pi/1073741824) q[66];
-cx q[66],q[37];
-rz(-pi/1073741824) q[37];
-cx q[66],q[37];
-rz(pi/1073741824) q[37];
-rz(pi/536870912) q[66];
-cx q[66],q[38];
-rz(-pi/536870912) q[38];
-cx q[66],q[38];
-rz(pi/536870912) q[38];
-rz(pi/268435456) q[66];
-cx q[66],q[39];
-rz(-pi/268435456) q[39];
-cx q[66],q[39];
-rz(pi/268435456) q[39];
-rz(pi/134217728) q[66];
-cx q[66],q[40];
-rz(-pi/134217728) q[40];
-cx q[66],q[40];
-rz(pi/134217728) q[40];
-rz(pi/67108864) q[66];
-cx q[66],q[41];
-rz(-pi/67108864) q[41];
-cx q[66],q[41];
-rz(pi/67108864) q[41];
-rz(pi/33554432) q[66];
-cx q[66],q[42];
-rz(-pi/33554432) q[42];
-cx q[66],q[42];
-rz(pi/33554432) q[42];
-rz(pi/16777216) q[66];
-cx q[66],q[43];
-rz(-pi/16777216) q[43];
-cx q[66],q[43];
-rz(pi/16777216) q[43];
-rz(pi/8388608) q[66];
-cx q[66],q[44];
-rz(-pi/8388608) q[44];
-cx q[66],q[44];
-rz(pi/8388608) q[44];
-rz(pi/4194304) q[66];
-cx q[66],q[45];
-rz(-pi/4194304) q[45];
-cx q[66],q[45];
-rz(pi/4194304) q[45];
-rz(pi/2097152) q[66];
-cx q[66],q[46];
-rz(-pi/2097152) q[46];
-cx q[66],q[46];
-rz(pi/2097152) q[46];
-rz(pi/1048576) q[66];
-cx q[66],q[47];
-rz(-pi/1048576) q[47];
-cx q[66],q[47];
-rz(pi/1048576) q[47];
-rz(pi/524288) q[66];
-cx q[66],q[48];
-rz(-pi/524288) q[48];
-cx q[66],q[48];
-rz(pi/524288) q[48];
-rz(pi/262144) q[66];
-cx q[66],q[49];
-rz(-pi/262144) q[49];
-cx q[66],q[49];
-rz(pi/262144) q[49];
-rz(pi/131072) q[66];
-cx q[66],q[50];
-rz(-pi/131072) q[50];
-cx q[66],q[50];
-rz(pi/131072) q[50];
-rz(pi/65536) q[66];
-cx q[66],q[51];
-rz(-pi/65536) q[51];
-cx q[66],q[51];
-rz(pi/65536) q[51];
-rz(pi/32768) q[66];
-cx q[66],q[52];
-rz(-pi/32768) q[52];
-cx q[66],q[52];
-rz(pi/32768) q[52];
-rz(pi/16384) q[66];
-cx q[66],q[53];
-rz(-pi/16384) q[53];
-cx q[66],q[53];
-rz(pi/16384) q[53];
-rz(pi/8192) q[66];
-cx q[66],q[54];
-rz(-pi/8192) q[54];
-cx q[66],q[54];
-rz(pi/8192) q[54];
-rz(pi/4096) q[66];
-cx q[66],q[55];
-rz(-pi/4096) q[55];
-cx q[66],q[55];
-rz(pi/4096) q[55];
-rz(pi/2048) q[66];
-cx q[66],q[56];
-rz(-pi/2048) q[56];
-cx q[66],q[56];
-rz(pi/2048) q[56];
-rz(pi/1024) q[66];
-cx q[66],q[57];
-rz(-pi/1024) q[57];
-cx q[66],q[57];
-rz(pi/1024) q[57];
-rz(pi/512) q[66];
-cx q[66],q[58];
-rz(-pi/512) q[58];
-cx q[66],q[58];
-rz(pi/512) q[58];
-rz(pi/256) q[66];
-cx q[66],q[59];
-rz(-pi/256) q[59];
-cx q[66],q[59];
-rz(pi/256) q[59];
-rz(pi/128) q[66];
-cx q[66],q[60];
-rz(-pi/128) q[60];
-cx q[66],q[60];
-rz(pi/128) q[60];
-rz(pi/64) q[66];
-cx q[66],q[61];
-rz(-pi/64) q[61];
-cx q[66],q[61];
-rz(pi/64) q[61];
-rz(pi/32) q[66];
-cx q[66],q[62];
-rz(-pi/32) q[62];
-cx q[66],q[62];
-rz(pi/32) q[62];
-rz(pi/16) q[66];
-cx q[66],q[63];
-rz(-pi/16) q[63];
-cx q[66],q[63];
-rz(pi/16) q[63];
-rz(pi/8) q[66];
-cx q[66],q[64];
-rz(-pi/8) q[64];
-cx q[66],q[64];
-rz(pi/8) q[64];
-rz(pi/4) q[66];
-cx q[66],q[65];
-rz(-pi/4) q[65];
-cx q[66],q[65];
-rz(pi/4) q[65];
-rz(pi/2) q[66];
-sx q[66];
-rz(pi/2) q[66];
-rz(1.42863093678434e-12) q[67];
-cx q[67],q[27];
-rz(-1.42863093678434e-12) q[27];
-cx q[67],q[27];
-rz(1.42863093678434e-12) q[27];
-rz(2.85726187356867e-12) q[67];
-cx q[67],q[28];
-rz(-2.85726187356867e-12) q[28];
-cx q[67],q[28];
-rz(2.85726187356867e-12) q[28];
-rz(5.71452374713734e-12) q[67];
-cx q[67],q[29];
-rz(-5.71452374713734e-12) q[29];
-cx q[67],q[29];
-rz(5.71452374713734e-12) q[29];
-rz(1.14290474942747e-11) q[67];
-cx q[67],q[30];
-rz(-1.14290474942747e-11) q[30];
-cx q[67],q[30];
-rz(1.14290474942747e-11) q[30];
-rz(2.28580949885494e-11) q[67];
-cx q[67],q[31];
-rz(-2.28580949885494e-11) q[31];
-cx q[67],q[31];
-rz(2.28580949885494e-11) q[31];
-rz(4.57161899770987e-11) q[67];
-cx q[67],q[32];
-rz(-4.57161899770987e-11) q[32];
-cx q[67],q[32];
-rz(4.57161899770987e-11) q[32];
-rz(9.14323799541975e-11) q[67];
-cx q[67],q[33];
-rz(-9.14323799541975e-11) q[33];
-cx q[67],q[33];
-rz(9.14323799541975e-11) q[33];
-rz(1.82864759908395e-10) q[67];
-cx q[67],q[34];
-rz(-1.82864759908395e-10) q[34];
-cx q[67],q[34];
-rz(1.82864759908395e-10) q[34];
-rz(3.6572951981679e-10) q[67];
-cx q[67],q[35];
-rz(-3.6572951981679e-10) q[35];
-cx q[67],q[35];
-rz(3.6572951981679e-10) q[35];
-rz(7.3145903963358e-10) q[67];
-cx q[67],q[36];
-rz(-7.3145903963358e-10) q[36];
-cx q[67],q[36];
-rz(7.3145903963358e-10) q[36];
-rz(pi/2147483648) q[67];
-cx q[67],q[37];
-rz(-pi/2147483648) q[37];
-cx q[67],q[37];
-rz(pi/2147483648) q[37];
-rz(pi/1073741824) q[67];
-cx q[67],q[38];
-rz(-pi/1073741824) q[38];
-cx q[67],q[38];
-rz(pi/1073741824) q[38];
-rz(pi/536870912) q[67];
-cx q[67],q[39];
-rz(-pi/536870912) q[39];
-cx q[67],q[39];
-rz(pi/536870912) q[39];
-rz(pi/268435456) q[67];
-cx q[67],q[40];
-rz(-pi/268435456) q[40];
-cx q[67],q[40];
-rz(pi/268435456) q[40];
-rz(pi/134217728) q[67];
-cx q[67],q[41];
-rz(-pi/134217728) q[41];
-cx q[67],q[41];
-rz(pi/134217728) q[41];
-rz(pi/67108864) q[67];
-cx q[67],q[42];
-rz(-pi/67108864) q[42];
-cx q[67],q[42];
-rz(pi/67108864) q[42];
-rz(pi/33554432) q[67];
-cx q[67],q[43];
-rz(-pi/33554432) q[43];
-cx q[67],q[43];
-rz(pi/33554432) q[43];
-rz(pi/16777216) q[67];
-cx q[67],q[44];
-rz(-pi/16777216) q[44];
-cx q[67],q[44];
-rz(pi/16777216) q[44];
-rz(pi/8388608) q[67];
-cx q[67],q[45];
-rz(-pi/8388608) q[45];
-cx q[67],q[45];
-rz(pi/8388608) q[45];
-rz(pi/4194304) q[67];
-cx q[67],q[46];
-rz(-pi/4194304) q[46];
-cx q[67],q[46];
-rz(pi/4194304) q[46];
-rz(pi/2097152) q[67];
-cx q[67],q[47];
-rz(-pi/2097152) q[47];
-cx q[67],q[47];
-rz(pi/2097152) q[47];
-rz(pi/1048576) q[67];
-cx q[67],q[48];
-rz(-pi/1048576) q[48];
-cx q[67],q[48];
-rz(pi/1048576) q[48];
-rz(pi/524288) q[67];
-cx q[67],q[49];
-rz(-pi/524288) q[49];
-cx q[67],q[49];
-rz(pi/524288) q[49];
-rz(pi/262144) q[67];
-cx q[67],q[50];
-rz(-pi/262144) q[50];
-cx q[67],q[50];
-rz(pi/262144) q[50];
-rz(pi/131072) q[67];
-cx q[67],q[51];
-rz(-pi/131072) q[51];
-cx q[67],q[51];
-rz(pi/131072) q[51];
-rz(pi/65536) q[67];
-cx q[67],q[52];
-rz(-pi/65536) q[52];
-cx q[67],q[52];
-rz(pi/65536) q[52];
-rz(pi/32768) q[67];
-cx q[67],q[53];
-rz(-pi/32768) q[53];
-cx q[67],q[53];
-rz(pi/32768) q[53];
-rz(pi/16384) q[67];
-cx q[67],q[54];
-rz(-pi/16384) q[54];
-cx q[67],q[54];
-rz(pi/16384) q[54];
-rz(pi/8192) q[67];
-cx q[67],q[55];
-rz(-pi/8192) q[55];
-cx q[67],q[55];
-rz(pi/8192) q[55];
-rz(pi/4096) q[67];
-cx q[67],q[56];
-rz(-pi/4096) q[56];
-cx q[67],q[56];
-rz(pi/4096) q[56];
-rz(pi/2048) q[67];
-cx q[67],q[57];
-rz(-pi/2048) q[57];
-cx q[67],q[57];
-rz(pi/2048) q[57];
-rz(pi/1024) q[67];
-cx q[67],q[58];
-rz(-pi/1024) q[58];
-cx q[67],q[58];
-rz(pi/1024) q[58];
-rz(pi/512) q[67];
-cx q[67],q[59];
-rz(-pi/512) q[59];
-cx q[67],q[59];
-rz(pi/512) q[59];
-rz(pi/256) q[67];
-cx q[67],q[60];
-rz(-pi/256) q[60];
-cx q[67],q[60];
-rz(pi/256) q[60];
-rz(pi/128) q[67];
-cx q[67],q[61];
-rz(-pi/128) q[61];
-cx q[67],q[61];
-rz(pi/128) q[61];
-rz(pi/64) q[67];
-cx q[67],q[62];
-rz(-pi/64) q[62];
-cx q[67],q[62];
-rz(pi/64) q[62];
-rz(pi/32) q[67];
-cx q[67],q[63];
-rz(-pi/32) q[63];
-cx q[67],q[63];
-rz(pi/32) q[63];
-rz(pi/16) q[67];
-cx q[67],q[64];
-rz(-pi/16) q[64];
-cx q[67],q[64];
-rz(pi/16) q[64];
-rz(pi/8) q[67];
-cx q[67],q[65];
-rz(-pi/8) q[65];
-cx q[67],q[65];
-rz(pi/8) q[65];
-rz(pi/4) q[67];
-cx q[67],q[66];
-rz(-pi/4) q[66];
-cx q[67],q[66];
-rz(pi/4) q[66];
-rz(pi/2) q[67];
-sx q[67];
-rz(pi/2) q[67];
-rz(1.42863093678434e-12) q[68];
-cx q[68],q[28];
-rz(-1.42863093678434e-12) q[28];
-cx q[68],q[28];
-rz(1.42863093678434e-12) q[28];
-rz(2.85726187356867e-12) q[68];
-cx q[68],q[29];
-rz(-2.85726187356867e-12) q[29];
-cx q[68],q[29];
-rz(2.85726187356867e-12) q[29];
-rz(5.71452374713734e-12) q[68];
-cx q[68],q[30];
-rz(-5.71452374713734e-12) q[30];
-cx q[68],q[30];
-rz(5.71452374713734e-12) q[30];
-rz(1.14290474942747e-11) q[68];
-cx q[68],q[31];
-rz(-1.14290474942747e-11) q[31];
-cx q[68],q[31];
-rz(1.14290474942747e-11) q[31];
-rz(2.28580949885494e-11) q[68];
-cx q[68],q[32];
-rz(-2.28580949885494e-11) q[32];
-cx q[68],q[32];
-rz(2.28580949885494e-11) q[32];
-rz(4.57161899770987e-11) q[68];
-cx q[68],q[33];
-rz(-4.57161899770987e-11) q[33];
-cx q[68],q[33];
-rz(4.57161899770987e-11) q[33];
-rz(9.14323799541975e-11) q[68];
-cx q[68],q[34];
-rz(-9.14323799541975e-11) q[34];
-cx q[68],q[34];
-rz(9.14323799541975e-11) q[34];
-rz(1.82864759908395e-10) q[68];
-cx q[68],q[35];
-rz(-1.82864759908395e-10) q[35];
-cx q[68],q[35];
-rz(1.82864759908395e-10) q[35];
-rz(3.6572951981679e-10) q[68];
-cx q[68],q[36];
-rz(-3.6572951981679e-10) q[36];
-cx q[68],q[36];
-rz(3.6572951981679e-10) q[36];
-rz(7.3145903963358e-10) q[68];
-cx q[68],q[37];
-rz(-7.3145903963358e-10) q[37];
-cx q[68],q[37];
-rz(7.3145903963358e-10) q[37];
-rz(pi/2147483648) q[68];
-cx q[68],q[38];
-rz(-pi/2147483648) q[38];
-cx q[68],q[38];
-rz(pi/2147483648) q[38];
-rz(pi/1073741824) q[68];
-cx q[68],q[39];
-rz(-pi/1073741824) q[39];
-cx q[68],q[39];
-rz(pi/1073741824) q[39];
-rz(pi/536870912) q[68];
-cx q[68],q[40];
-rz(-pi/536870912) q[40];
-cx q[68],q[40];
-rz(pi/536870912) q[40];
-rz(pi/268435456) q[68];
-cx q[68],q[41];
-rz(-pi/268435456) q[41];
-cx q[68],q[41];
-rz(pi/268435456) q[41];
-rz(pi/134217728) q[68];
-cx q[68],q[42];
-rz(-pi/134217728) q[42];
-cx q[68],q[42];
-rz(pi/134217728) q[42];
-rz(pi/67108864) q[68];
-cx q[68],q[43];
-rz(-pi/67108864) q[43];
-cx q[68],q[43];
-rz(pi/67108864) q[43];
-rz(pi/33554432) q[68];
-cx q[68],q[44];
-rz(-pi/33554432) q[44];
-cx q[68],q[44];
-rz(pi/33554432) q[44];
-rz(pi/16777216) q[68];
-cx q[68],q[45];
-rz(-pi/16777216) q[45];
-cx q[68],q[45];
-rz(pi/16777216) q[45];
-rz(pi/8388608) q[68];
-cx q[68],q[46];
-rz(-pi/8388608) q[46];
-cx q[68],q[46];
-rz(pi/8388608) q[46];
-rz(pi/4194304) q[68];
-cx q[68],q[47];
-rz(-pi/4194304) q[47];
-cx q[68],q[47];
-rz(pi/4194304) q[47];
-rz(pi/2097152) q[68];
-cx q[68],q[48];
-rz(-pi/2097152) q[48];
-cx q[68],q[48];
-rz(pi/2097152) q[48];
-rz(pi/1048576) q[68];
-cx q[68],q[49];
-rz(-pi/1048576) q[49];
-cx q[68],q[49];
-rz(pi/1048576) q[49];
-rz(pi/524288) q[68];
-cx q[68],q[50];
-rz(-pi/524288) q[50];
-cx q[68],q[50];
-rz(pi/524288) q[50];
-rz(pi/262144) q[68];
-cx q[68],q[51];
-rz(-pi/262144) q[51];
-cx q[68],q[51];
-rz(pi/262144) q[51];
-rz(pi/131072) q[68];
-cx q[68],q[52];
-rz(-pi/131072) q[52];
-cx q[68],q[52];
-rz(pi/131072) q[52];
-rz(pi/65536) q[68];
-cx q[68],q[53];
-rz(-pi/65536) q[53];
-cx q[68],q[53];
-rz(pi/65536) q[53];
-rz(pi/32768) q[68];
-cx q[68],q[54];
-rz(-pi/32768) q[54];
-cx q[68],q[54];
-rz(pi/32768) q[54];
-rz(pi/16384) q[68];
-cx q[68],q[55];
-rz(-pi/16384) q[55];
-cx q[68],q[55];
-rz(pi/16384) q[55];
-rz(pi/8192) q[68];
-cx q[68],q[56];
-rz(-pi/8192) q[56];
-cx q[68],q[56];
-rz(pi/8192) q[56];
-rz(pi/4096) q[68];
-cx q[68],q[57];
-rz(-pi/4096) q[57];
-cx q[68],q[57];
-rz(pi/4096) q[57];
-rz(pi/2048) q[68];
-cx q[68],q[58];
-rz(-pi/2048) q[58];
-cx q[68],q[58];
-rz(pi/2048) q[58];
-rz(pi/1024) q[68];
-cx q[68],q[59];
-rz(-pi/1024) q[59];
-cx q[68],q[59];
-rz(pi/1024) q[59];
-rz(pi/512) q[68];
-cx q[68],q[60];
-rz(-pi/512) q[60];
-cx q[68],q[60];
-rz(pi/512) q[60];
-rz(pi/256) q[68];
-cx q[68],q[61];
-rz(-pi/256) q[61];
-cx q[68],q[61];
-rz(pi/256) q[61];
-rz(pi/128) q[68];
-cx q[68],q[62];
-rz(-pi/128) q[62];
-cx q[68],q[62];
-rz(pi/128) q[62];
-rz(pi/64) q[68];
-cx q[68],q[63];
-rz(-pi/64) q[63];
-cx q[68],q[63];
-rz(pi/64) q[63];
-rz(pi/32) q[68];
-cx q[68],q[64];
-rz(-pi/32) q[64];
-cx q[68],q[64];
-rz(pi/32) q[64];
-rz(pi/16) q[68];
-cx q[68],q[65];
-rz(-pi/16) q[65];
-cx q[68],q[65];
-rz(pi/16) q[65];
-rz(pi/8) q[68];
-cx q[68],q[66];
-rz(-pi/8) q[66];
-cx q[68],q[66];
-rz(pi/8) q[66];
-rz(pi/4) q[68];
-cx q[68],q[67];
-rz(-pi/4) q[67];
-cx q[68],q[67];
-rz(pi/4) q[67];
-rz(pi/2) q[68];
-sx q[68];
-rz(pi/2) q[68];
-rz(1.42863093678434e-12) q[69];
-cx q[69],q[29];
-rz(-1.42863093678434e-12) q[29];
-cx q[69],q[29];
-rz(1.42863093678434e-12) q[29];
-rz(2.85726187356867e-12) q[69];
-cx q[69],q[30];
-rz(-2.85726187356867e-12) q[30];
-cx q[69],q[30];
-rz(2.85726187356867e-12) q[30];
-rz(5.71452374713734e-12) q[69];
-cx q[69],q[31];
-rz(-5.71452374713734e-12) q[31];
-cx q[69],q[31];
-rz(5.71452374713734e-12) q[31];
-rz(1.14290474942747e-11) q[69];
-cx q[69],q[32];
-rz(-1.14290474942747e-11) q[32];
-cx q[69],q[32];
-rz(1.14290474942747e-11) q[32];
-rz(2.28580949885494e-11) q[69];
-cx q[69],q[33];
-rz(-2.28580949885494e-11) q[33];
-cx q[69],q[33];
-rz(2.28580949885494e-11) q[33];
-rz(4.57161899770987e-11) q[69];
-cx q[69],q[34];
-rz(-4.57161899770987e-11) q[34];
-cx q[69],q[34];
-rz(4.57161899770987e-11) q[34];
-rz(9.14323799541975e-11) q[69];
-cx q[69],q[35];
-rz(-9.14323799541975e-11) q[35];
-cx q[69],q[35];
-rz(9.14323799541975e-11) q[35];
-rz(1.82864759908395e-10) q[69];
-cx q[69],q[36];
-rz(-1.82864759908395e-10) q[36];
-cx q[69],q[36];
-rz(1.82864759908395e-10) q[36];
-rz(3.6572951981679e-10) q[69];
-cx q[69],q[37];
-rz(-3.6572951981679e-10) q[37];
-cx q[69],q[37];
-rz(3.6572951981679e-10) q[37];
-rz(7.3145903963358e-10) q[69];
-cx q[69],q[38];
-rz(-7.3145903963358e-10) q[38];
-cx q[69],q[38];
-rz(7.3145903963358e-10) q[38];
-rz(pi/2147483648) q[69];
-cx q[69],q[39];
-rz(-pi/2147483648) q[39];
-cx q[69],q[39];
-rz(pi/2147483648) q[39];
-rz(pi/1073741824) q[69];
-cx q[69],q[40];
-rz(-pi/1073741824) q[40];
-cx q[69],q[40];
-rz(pi/1073741824) q[40];
-rz(pi/536870912) q[69];
-cx q[69],q[41];
-rz(-pi/536870912) q[41];
-cx q[69],q[41];
-rz(pi/536870912) q[41];
-rz(pi/268435456) q[69];
-cx q[69],q[42];
-rz(-pi/268435456) q[42];
-cx q[69],q[42];
-rz(pi/268435456) q[42];
-rz(pi/134217728) q[69];
-cx q[69],q[43];
-rz(-pi/134217728) q[43];
-cx q[69],q[43];
-rz(pi/134217728) q[43];
-rz(pi/67108864) q[69];
-cx q[69],q[44];
-rz(-pi/67108864) q[44];
-cx q[69],q[44];
-rz(pi/67108864) q[44];
-rz(pi/33554432) q[69];
-cx q[69],q[45];
-rz(-pi/33554432) q[45];
-cx q[69],q[45];
-rz(pi/33554432) q[45];
-rz(pi/16777216) q[69];
-cx q[69],q[46];
-rz(-pi/16777216) q[46];
-cx q[69],q[46];
-rz(pi/16777216) q[46];
-rz(pi/8388608) q[69];
-cx q[69],q[47];
-rz(-pi/8388608) q[47];
-cx q[69],q[47];
-rz(pi/8388608) q[47];
-rz(pi/4194304) q[69];
-cx q[69],q[48];
-rz(-pi/4194304) q[48];
-cx q[69],q[48];
-rz(pi/4194304) q[48];
-rz(pi/2097152) q[69];
-cx q[69],q[49];
-rz(-pi/2097152) q[49];
-cx q[69],q[49];
-rz(pi/2097152) q[49];
-rz(pi/1048576) q[69];
-cx q[69],q[50];
-rz(-pi/1048576) q[50];
-cx q[69],q[50];
-rz(pi/1048576) q[50];
-rz(pi/524288) q[69];
-cx q[69],q[51];
-rz(-pi/524288) q[51];
-cx q[69],q[51];
-rz(pi/524288) q[51];
-rz(pi/262144) q[69];
-cx q[69],q[52];
-rz(-pi/262144) q[52];
-cx q[69],q[52];
-rz(pi/262144) q[52];
-rz(pi/131072) q[69];
-cx q[69],q[53];
-rz(-pi/131072) q[53];
-cx q[69],q[53];
-rz(pi/131072) q[53];
-rz(pi/65536) q[69];
-cx q[69],q[54];
-rz(-pi/65536) q[54];
-cx q[69],q[54];
-rz(pi/65536) q[54];
-rz(pi/32768) q[69];
-cx q[69],q[55];
-rz(-pi/32768) q[55];
-cx q[69],q[55];
-rz(pi/32768) q[55];
-rz(pi/16384) q[69];
-cx q[69],q[56];
-rz(-pi/16384) q[56];
-cx q[69],q[56];
-rz(pi/16384) q[56];
-rz(pi/8192) q[69];
-cx q[69],q[57];
-rz(-pi/8192) q[57];
-cx q[69],q[57];
-rz(pi/8192) q[57];
-rz(pi/4096) q[69];
-cx q[69],q[58];
-rz(-pi/4096) q[58];
-cx q[69],q[58];
-rz(pi/4096) q[58];
-rz(pi/2048) q[69];
-cx q[69],q[59];
-rz(-pi/2048) q[59];
-cx q[69],q[59];
-rz(pi/2048) q[59];
-rz(pi/1024) q[69];
-cx q[69],q[60];
-rz(-pi/1024) q[60];
-cx q[69],q[60];
-rz(pi/1024) q[60];
-rz(pi/512) q[69];
-cx q[69],q[61];
-rz(-pi/512) q[61];
-cx q[69],q[61];
-rz(pi/512) q[61];
-rz(pi/256) q[69];
-cx q[69],q[62];
-rz(-pi/256) q[62];
-cx q[69],q[62];
-rz(pi/256) q[62];
-rz(pi/128) q[69];
-cx q[69],q[63];
-rz(-pi/128) q[63];
-cx q[69],q[63];
-rz(pi/128) q[63];
-rz(pi/64) q[69];
-cx q[69],q[64];
-rz(-pi/64) q[64];
-cx q[69],q[64];
-rz(pi/64) q[64];
-rz(pi/32) q[69];
-cx q[69],q[65];
-rz(-pi/32) q[65];
-cx q[69],q[65];
-rz(pi/32) q[65];
-rz(pi/16) q[69];
-cx q[69],q[66];
-rz(-pi/16) q[66];
-cx q[69],q[66];
-rz(pi/16) q[66];
-rz(pi/8) q[69];
-cx q[69],q[67];
-rz(-pi/8) q[67];
-cx q[69],q[67];
-rz(pi/8) q[67];
-rz(pi/4) q[69];
-cx q[69],q[68];
-rz(-pi/4) q[68];
-cx q[69],q[68];
-rz(pi/4) q[68];
-rz(pi/2) q[69];
-sx q[69];
-rz(pi/2) q[69];
-rz(1.42863093678434e-12) q[70];
-cx q[70],q[30];
-rz(-1.42863093678434e-12) q[30];
-cx q[70],q[30];
-rz(1.42863093678434e-12) q[30];
-rz(2.85726187356867e-12) q[70];
-cx q[70],q[31];
-rz(-2.85726187356867e-12) q[31];
-cx q[70],q[31];
-rz(2.85726187356867e-12) q[31];
-rz(5.71452374713734e-12) q[70];
-cx q[70],q[32];
-rz(-5.71452374713734e-12) q[32];
-cx q[70],q[32];
-rz(5.71452374713734e-12) q[32];
-rz(1.14290474942747e-11) q[70];
-cx q[70],q[33];
-rz(-1.14290474942747e-11) q[33];
-cx q[70],q[33];
-rz(1.14290474942747e-11) q[33];
-rz(2.28580949885494e-11) q[70];
-cx q[70],q[34];
-rz(-2.28580949885494e-11) q[34];
-cx q[70],q[34];
-rz(2.28580949885494e-11) q[34];
-rz(4.57161899770987e-11) q[70];
-cx q[70],q[35];
-rz(-4.57161899770987e-11) q[35];
-cx q[70],q[35];
-rz(4.57161899770987e-11) q[35];
-rz(9.14323799541975e-11) q[70];
-cx q[70],q[36];
-rz(-9.14323799541975e-11) q[36];
-cx q[70],q[36];
-rz(9.14323799541975e-11) q[36];
-rz(1.82864759908395e-10) q[70];
-cx q[70],q[37];
-rz(-1.82864759908395e-10) q[37];
-cx q[70],q[37];
-rz(1.82864759908395e-10) q[37];
-rz(3.6572951981679e-10) q[70];
-cx q[70],q[38];
-rz(-3.6572951981679e-10) q[38];
-cx q[70],q[38];
-rz(3.6572951981679e-10) q[38];
-rz(7.3145903963358e-10) q[70];
-cx q[70],q[39];
-rz(-7.3145903963358e-10) q[39];
-cx q[70],q[39];
-rz(7.3145903963358e-10) q[39];
-rz(pi/2147483648) q[70];
-cx q[70],q[40];
-rz(-pi/2147483648) q[40];
-cx q[70],q[40];
-rz(pi/2147483648) q[40];
-rz(pi/1073741824) q[70];
-cx q[70],q[41];
-rz(-pi/1073741824) q[41];
-cx q[70],q[41];
-rz(pi/1073741824) q[41];
-rz(pi/536870912) q[70];
-cx q[70],q[42];
-rz(-pi/536870912) q[42];
-cx q[70],q[42];
-rz(pi/536870912) q[42];
-rz(pi/268435456) q[70];
-cx q[70],q[43];
-rz(-pi/268435456) q[43];
-cx q[70],q[43];
-rz(pi/268435456) q[43];
-rz(pi/134217728) q[70];
-cx q[70],q[44];
-rz(-pi/134217728) q[44];
-cx q[70],q[44];
-rz(pi/134217728) q[44];
-rz(pi/67108864) q[70];
-cx q[70],q[45];
-rz(-pi/67108864) q[45];
-cx q[70],q[45];
-rz(pi/67108864) q[45];
-rz(pi/33554432) q[70];
-cx q[70],q[46];
-rz(-pi/33554432) q[46];
-cx q[70],q[46];
-rz(pi/33554432) q[46];
-rz(pi/16777216) q[70];
-cx q[70],q[47];
-rz(-pi/16777216) q[47];
-cx q[70],q[47];
-rz(pi/16777216) q[47];
-rz(pi/8388608) q[70];
-cx q[70],q[48];
-rz(-pi/8388608) q[48];
-cx q[70],q[48];
-rz(pi/8388608) q[48];
-rz(pi/4194304) q[70];
-cx q[70],q[49];
-rz(-pi/4194304) q[49];
-cx q[70],q[49];
-rz(pi/4194304) q[49];
-rz(pi/2097152) q[70];
-cx q[70],q[50];
-rz(-pi/2097152) q[50];
-cx q[70],q[50];
-rz(pi/2097152) q[50];
-rz(pi/1048576) q[70];
-cx q[70],q[51];
-rz(-pi/1048576) q[51];
-cx q[70],q[51];
-rz(pi/1048576) q[51];
-rz(pi/524288) q[70];
-cx q[70],q[52];
-rz(-pi/524288) q[52];
-cx q[70],q[52];
-rz(pi/524288) q[52];
-rz(pi/262144) q[70];
-cx q[70],q[53];
-rz(-pi/262144) q[53];
-cx q[70],q[53];
-rz(pi/262144) q[53];
-rz(pi/131072) q[70];
-cx q[70],q[54];
-rz(-pi/131072) q[54];
-cx q[70],q[54];
-rz(pi/131072) q[54];
-rz(pi/65536) q[70];
-cx q[70],q[55];
-rz(-pi/65536) q[55];
-cx q[70],q[55];
-rz(pi/65536) q[55];
-rz(pi/32768) q[70];
-cx q[70],q[56];
-rz(-pi/32768) q[56];
-cx q[70],q[56];
-rz(pi/32768) q[56];
-rz(pi/16384) q[70];
-cx q[70],q[57];
-rz(-pi/16384) q[57];
-cx q[70],q[57];
-rz(pi/16384) q[57];
-rz(pi/8192) q[70];
-cx q[70],q[58];
-rz(-pi/8192) q[58];
-cx q[70],q[58];
-rz(pi/8192) q[58];
-rz(pi/4096) q[70];
-cx q[70],q[59];
-rz(-pi/4096) q[59];
-cx q[70],q[59];
-rz(pi/4096) q[59];
-rz(pi/2048) q[70];
-cx q[70],q[60];
-rz(-pi/2048) q[60];
-cx q[70],q[60];
-rz(pi/2048) q[60];
-rz(pi/1024) q[70];
-cx q[70],q[61];
-rz(-pi/1024) q[61];
-cx q[70],q[61];
-rz(pi/1024) q[61];
-rz(pi/512) q[70];
-cx q[70],q[62];
-rz(-pi/512) q[62];
-cx q[70],q[62];
-rz(pi/512) q[62];
-rz(pi/256) q[70];
-cx q[70],q[63];
-rz(-pi/256) q[63];
-cx q[70],q[63];
-rz(pi/256) q[63];
-rz(pi/128) q[70];
-cx q[70],q[64];
-rz(-pi/128) q[64];
-cx q[70],q[64];
-rz(pi/128) q[64];
-rz(pi/64) q[70];
-cx q[70],q[65];
-rz(-pi/64) q[65];
-cx q[70],q[65];
-rz(pi/64) q[65];
-rz(pi/32) q[70];
-cx q[70],q[66];
-rz(-pi/32) q[66];
-cx q[70],q[66];
-rz(pi/32) q[66];
-rz(pi/16) q[70];
-cx q[70],q[67];
-rz(-pi/16) q[67];
-cx q[70],q[67];
-rz(pi/16) q[67];
-rz(pi/8) q[70];
-cx q[70],q[68];
-rz(-pi/8) q[68];
-cx q[70],q[68];
-rz(pi/8) q[68];
-rz(pi/4) q[70];
-cx q[70],q[69];
-rz(-pi/4) q[69];
-cx q[70],q[69];
-rz(pi/4) q[69];
-rz(pi/2) q[70];
-sx q[70];
-rz(pi/2) q[70];
-rz(1.42863093678434e-12) q[71];
-cx q[71],q[31];
-rz(-1.42863093678434e-12) q[31];
-cx q[71],q[31];
-rz(1.42863093678434e-12) q[31];
-rz(2.85726187356867e-12) q[71];
-cx q[71],q[32];
-rz(-2.85726187356867e-12) q[32];
-cx q[71],q[32];
-rz(2.85726187356867e-12) q[32];
-rz(5.71452374713734e-12) q[71];
-cx q[71],q[33];
-rz(-5.71452374713734e-12) q[33];
-cx q[71],q[33];
-rz(5.71452374713734e-12) q[33];
-rz(1.14290474942747e-11) q[71];
-cx q[71],q[34];
-rz(-1.14290474942747e-11) q[34];
-cx q[71],q[34];
-rz(1.14290474942747e-11) q[34];
-rz(2.28580949885494e-11) q[71];
-cx q[71],q[35];
-rz(-2.28580949885494e-11) q[35];
-cx q[71],q[35];
-rz(2.28580949885494e-11) q[35];
-rz(4.57161899770987e-11) q[71];
-cx q[71],q[36];
-rz(-4.57161899770987e-11) q[36];
-cx q[71],q[36];
-rz(4.57161899770987e-11) q[36];
-rz(9.14323799541975e-11) q[71];
-cx q[71],q[37];
-rz(-9.14323799541975e-11) q[37];
-cx q[71],q[37];
-rz(9.14323799541975e-11) q[37];
-rz(1.82864759908395e-10) q[71];
-cx q[71],q[38];
-rz(-1.82864759908395e-10) q[38];
-cx q[71],q[38];
-rz(1.82864759908395e-10) q[38];
-rz(3.6572951981679e-10) q[71];
-cx q[71],q[39];
-rz(-3.6572951981679e-10) q[39];
-cx q[71],q[39];
-rz(3.6572951981679e-10) q[39];
-rz(7.3145903963358e-10) q[71];
-cx q[71],q[40];
-rz(-7.3145903963358e-10) q[40];
-cx q[71],q[40];
-rz(7.3145903963358e-10) q[40];
-rz(pi/2147483648) q[71];
-cx q[71],q[41];
-rz(-pi/2147483648) q[41];
-cx q[71],q[41];
-rz(pi/2147483648) q[41];
-rz(pi/1073741824) q[71];
-cx q[71],q[42];
-rz(-pi/1073741824) q[42];
-cx q[71],q[42];
-rz(pi/1073741824) q[42];
-rz(pi/536870912) q[71];
-cx q[71],q[43];
-rz(-pi/536870912) q[43];
-cx q[71],q[43];
-rz(pi/536870912) q[43];
-rz(pi/268435456) q[71];
-cx q[71],q[44];
-rz(-pi/268435456) q[44];
-cx q[71],q[44];
-rz(pi/268435456) q[44];
-rz(pi/134217728) q[71];
-cx q[71],q[45];
-rz(-pi/134217728) q[45];
-cx q[71],q[45];
-rz(pi/134217728) q[45];
-rz(pi/67108864) q[71];
-cx q[71],q[46];
-rz(-pi/67108864) q[46];
-cx q[71],q[46];
-rz(pi/67108864) q[46];
-rz(pi/33554432) q[71];
-cx q[71],q[47];
-rz(-pi/33554432) q[47];
-cx q[71],q[47];
-rz(pi/33554432) q[47];
-rz(pi/16777216) q[71];
-cx q[71],q[48];
-rz(-pi/16777216) q[48];
-cx q[71],q[48];
-rz(pi/16777216) q[48];
-rz(pi/8388608) q[71];
-cx q[71],q[49];
-rz(-pi/8388608) q[49];
-cx q[71],q[49];
-rz(pi/8388608) q[49];
-rz(pi/4194304) q[71];
-cx q[71],q[50];
-rz(-pi/4194304) q[50];
-cx q[71],q[50];
-rz(pi/4194304) q[50];
-rz(pi/2097152) q[71];
-cx q[71],q[51];
-rz(-pi/2097152) q[51];
-cx q[71],q[51];
-rz(pi/2097152) q[51];
-rz(pi/1048576) q[71];
-cx q[71],q[52];
-rz(-pi/1048576) q[52];
-cx q[71],q[52];
-rz(pi/1048576) q[52];
-rz(pi/524288) q[71];
-cx q[71],q[53];
-rz(-pi/524288) q[53];
-cx q[71],q[53];
-rz(pi/524288) q[53];
-rz(pi/262144) q[71];
-cx q[71],q[54];
-rz(-pi/262144) q[54];
-cx q[71],q[54];
-rz(pi/262144) q[54];
-rz(pi/131072) q[71];
-cx q[71],q[55];
-rz(-pi/131072) q[55];
-cx q[71],q[55];
-rz(pi/131072) q[55];
-rz(pi/65536) q[71];
-cx q[71],q[56];
-rz(-pi/65536) q[56];
-cx q[71],q[56];
-rz(pi/65536) q[56];
-rz(pi/32768) q[71];
-cx q[71],q[57];
-rz(-pi/32768) q[57];
-cx q[71],q[57];
-rz(pi/32768) q[57];
-rz(pi/16384) q[71];
-cx q[71],q[58];
-rz(-pi/16384) q[58];
-cx q[71],q[58];
-rz(pi/16384) q[58];
-rz(pi/8192) q[71];
-cx q[71],q[59];
-rz(-pi/8192) q[59];
-cx q[71],q[59];
-rz(pi/8192) q[59];
-rz(pi/4096) q[71];
-cx q[71],q[60];
-rz(-pi/4096) q[60];
-cx q[71],q[60];
-rz(pi/4096) q[60];
-rz(pi/2048) q[71];
-cx q[71],q[61];
-rz(-pi/2048) q[61];
-cx q[71],q[61];
-rz(pi/2048) q[61];
-rz(pi/1024) q[71];
-cx q[71],q[62];
-rz(-pi/1024) q[62];
-cx q[71],q[62];
-rz(pi/1024) q[62];
-rz(pi/512) q[71];
-cx q[71],q[63];
-rz(-pi/512) q[63];
-cx q[71],q[63];
-rz(pi/512) q[63];
-rz(pi/256) q[71];
-cx q[71],q[64];
-rz(-pi/256) q[64];
-cx q[71],q[64];
-rz(pi/256) q[64];
-rz(pi/128) q[71];
-cx q[71],q[65];
-rz(-pi/128) q[65];
-cx q[71],q[65];
-rz(pi/128) q[65];
-rz(pi/64) q[71];
-cx q[71],q[66];
-rz(-pi/64) q[66];
-cx q[71],q[66];
-rz(pi/64) q[66];
-rz(pi/32) q[71];
-cx q[71],q[67];
-rz(-pi/32) q[67];
-cx q[71],q[67];
-rz(pi/32) q[67];
-rz(pi/16) q[71];
-cx q[71],q[68];
-rz(-pi/16) q[68];
-cx q[71],q[68];
-rz(pi/16) q[68];
-rz(pi/8) q[71];
-cx q[71],q[69];
-rz(-pi/8) q[69];
-cx q[71],q[69];
-rz(pi/8) q[69];
-rz(pi/4) q[71];
-cx q[71],q[70];
-rz(-pi/4) q[70];
-cx q[71],q[70];
-rz(pi/4) q[70];
-rz(pi/2) q[71];
-sx q[71];
-rz(pi/2) q[71];
-rz(1.42863093678434e-12) q[72];
-cx q[72],q[32];
-rz(-1.42863093678434e-12) q[32];
-cx q[72],q[32];
-rz(1.42863093678434e-12) q[32];
-rz(2.85726187356867e-12) q[72];
-cx q[72],q[33];
-rz(-2.85726187356867e-12) q[33];
-cx q[72],q[33];
-rz(2.85726187356867e-12) q[33];
-rz(5.71452374713734e-12) q[72];
-cx q[72],q[34];
-rz(-5.71452374713734e-12) q[34];
-cx q[72],q[34];
-rz(5.71452374713734e-12) q[34];
-rz(1.14290474942747e-11) q[72];
-cx q[72],q[35];
-rz(-1.14290474942747e-11) q[35];
-cx q[72],q[35];
-rz(1.14290474942747e-11) q[35];
-rz(2.28580949885494e-11) q[72];
-cx q[72],q[36];
-rz(-2.28580949885494e-11) q[36];
-cx q[72],q[36];
-rz(2.28580949885494e-11) q[36];
-rz(4.57161899770987e-11) q[72];
-cx q[72],q[37];
-rz(-4.57161899770987e-11) q[37];
-cx q[72],q[37];
-rz(4.57161899770987e-11) q[37];
-rz(9.14323799541975e-11) q[72];
-cx q[72],q[38];
-rz(-9.14323799541975e-11) q[38];
-cx q[72],q[38];
-rz(9.14323799541975e-11) q[38];
-rz(1.82864759908395e-10) q[72];
-cx q[72],q[39];
-rz(-1.82864759908395e-10) q[39];
-cx q[72],q[39];
-rz(1.82864759908395e-10) q[39];
-rz(3.6572951981679e-10) q[72];
-cx q[72],q[40];
-rz(-3.6572951981679e-10) q[40];
-cx q[72],q[40];
-rz(3.6572951981679e-10) q[40];
-rz(7.3145903963358e-10) q[72];
-cx q[72],q[41];
-rz(-7.3145903963358e-10) q[41];
-cx q[72],q[41];
-rz(7.3145903963358e-10) q[41];
-rz(pi/2147483648) q[72];
-cx q[72],q[42];
-rz(-pi/2147483648) q[42];
-cx q[72],q[42];
-rz(pi/2147483648) q[42];
-rz(pi/1073741824) q[72];
-cx q[72],q[43];
-rz(-pi/1073741824) q[43];
-cx q[72],q[43];
-rz(pi/1073741824) q[43];
-rz(pi/536870912) q[72];
-cx q[72],q[44];
-rz(-pi/536870912) q[44];
-cx q[72],q[44];
-rz(pi/536870912) q[44];
-rz(pi/268435456) q[72];
-cx q[72],q[45];
-rz(-pi/268435456) q[45];
-cx q[72],q[45];
-rz(pi/268435456) q[45];
-rz(pi/134217728) q[72];
-cx q[72],q[46];
-rz(-pi/134217728) q[46];
-cx q[72],q[46];
-rz(pi/134217728) q[46];
-rz(pi/67108864) q[72];
-cx q[72],q[47];
-rz(-pi/67108864) q[47];
-cx q[72],q[47];
-rz(pi/67108864) q[47];
-rz(pi/33554432) q[72];
-cx q[72],q[48];
-rz(-pi/33554432) q[48];
-cx q[72],q[48];
-rz(pi/33554432) q[48];
-rz(pi/16777216) q[72];
-cx q[72],q[49];
-rz(-pi/16777216) q[49];
-cx q[72],q[49];
-rz(pi/16777216) q[49];
-rz(pi/8388608) q[72];
-cx q[72],q[50];
-rz(-pi/8388608) q[50];
-cx q[72],q[50];
-rz(pi/8388608) q[50];
-rz(pi/4194304) q[72];
-cx q[72],q[51];
-rz(-pi/4194304) q[51];
-cx q[72],q[51];
-rz(pi/4194304) q[51];
-rz(pi/2097152) q[72];
-cx q[72],q[52];
-rz(-pi/2097152) q[52];
-cx q[72],q[52];
-rz(pi/2097152) q[52];
-rz(pi/1048576) q[72];
-cx q[72],q[53];
-rz(-pi/1048576) q[53];
-cx q[72],q[53];
-rz(pi/1048576) q[53];
-rz(pi/524288) q[72];
-cx q[72],q[54];
-rz(-pi/524288) q[54];
-cx q[72],q[54];
-rz(pi/524288) q[54];
-rz(pi/262144) q[72];
-cx q[72],q[55];
-rz(-pi/262144) q[55];
-cx q[72],q[55];
-rz(pi/262144) q[55];
-rz(pi/131072) q[72];
-cx q[72],q[56];
-rz(-pi/131072) q[56];
-cx q[72],q[56];
-rz(pi/131072) q[56];
-rz(pi/65536) q[72];
-cx q[72],q[57];
-rz(-pi/65536) q[57];
-cx q[72],q[57];
-rz(pi/65536) q[57];
-rz(pi/32768) q[72];
-cx q[72],q[58];
-rz(-pi/32768) q[58];
-cx q[72],q[58];
-rz(pi/32768) q[58];
-rz(pi/16384) q[72];
-cx q[72],q[59];
-rz(-pi/16384) q[59];
-cx q[72],q[59];
-rz(pi/16384) q[59];
-rz(pi/8192) q[72];
-cx q[72],q[60];
-rz(-pi/8192) q[60];
-cx q[72],q[60];
-rz(pi/8192) q[60];
-rz(pi/4096) q[72];
-cx q[72],q[61];
-rz(-pi/4096) q[61];
-cx q[72],q[61];
-rz(pi/4096) q[61];
-rz(pi/2048) q[72];
-cx q[72],q[62];
-rz(-pi/2048) q[62];
-cx q[72],q[62];
-rz(pi/2048) q[62];
-rz(pi/1024) q[72];
-cx q[72],q[63];
-rz(-pi/1024) q[63];
-cx q[72],q[63];
-rz(pi/1024) q[63];
-rz(pi/512) q[72];
-cx q[72],q[64];
-rz(-pi/512) q[64];
-cx q[72],q[64];
-rz(pi/512) q[64];
-rz(pi/256) q[72];
-cx q[72],q[65];
-rz(-pi/256) q[65];
-cx q[72],q[65];
-rz(pi/256) q[65];
-rz(pi/128) q[72];
-cx q[72],q[66];
-rz(-pi/128) q[66];
-cx q[72],q[66];
-rz(pi/128) q[66];
-rz(pi/64) q[72];
-cx q[72],q[67];
-rz(-pi/64) q[67];
-cx q[72],q[67];
-rz(pi/64) q[67];
-rz(pi/32) q[72];
-cx q[72],q[68];
-rz(-pi/32) q[68];
-cx q[72],q[68];
-rz(pi/32) q[68];
-rz(pi/16) q[72];
-cx q[72],q[69];
-rz(-pi/16) q[69];
-cx q[72],q[69];
-rz(pi/16) q[69];
-rz(pi/8) q[72];
-cx q[72],q[70];
-rz(-pi/8) q[70];
-cx q[72],q[70];
-rz(pi/8) q[70];
-rz(pi/4) q[72];
-cx q[72],q[71];
-rz(-pi/4) q[71];
-cx q[72],q[71];
-rz(pi/4) q[71];
-rz(pi/2) q[72];
-sx q[72];
-rz(pi/2) q[72];
-rz(1.42863093678434e-12) q[73];
-cx q[73],q[33];
-rz(-1.42863093678434e-12) q[33];
-cx q[73],q[33];
-rz(1.42863093678434e-12) q[33];
-rz(2.85726187356867e-12) q[73];
-cx q[73],q[34];
-rz(-2.85726187356867e-12) q[34];
-cx q[73],q[34];
-rz(2.85726187356867e-12) q[34];
-rz(5.71452374713734e-12) q[73];
-cx q[73],q[35];
-rz(-5.71452374713734e-12) q[35];
-cx q[73],q[35];
-rz(5.71452374713734e-12) q[35];
-rz(1.14290474942747e-11) q[73];
-cx q[73],q[36];
-rz(-1.14290474942747e-11) q[36];
-cx q[73],q[36];
-rz(1.14290474942747e-11) q[36];
-rz(2.28580949885494e-11) q[73];
-cx q[73],q[37];
-rz(-2.28580949885494e-11) q[37];
-cx q[73],q[37];
-rz(2.28580949885494e-11) q[37];
-rz(4.57161899770987e-11) q[73];
-cx q[73],q[38];
-rz(-4.57161899770987e-11) q[38];
-cx q[73],q[38];
-rz(4.57161899770987e-11) q[38];
-rz(9.14323799541975e-11) q[73];
-cx q[73],q[39];
-rz(-9.14323799541975e-11) q[39];
-cx q[73],q[39];
-rz(9.14323799541975e-11) q[39];
-rz(1.82864759908395e-10) q[73];
-cx q[73],q[40];
-rz(-1.82864759908395e-10) q[40];
-cx q[73],q[40];
-rz(1.82864759908395e-10) q[40];
-rz(3.6572951981679e-10) q[73];
-cx q[73],q[41];
-rz(-3.6572951981679e-10) q[41];
-cx q[73],q[41];
-rz(3.6572951981679e-10) q[41];
-rz(7.3145903963358e-10) q[73];
-cx q[73],q[42];
-rz(-7.3145903963358e-10) q[42];
-cx q[73],q[42];
-rz(7.3145903963358e-10) q[42];
-rz(pi/2147483648) q[73];
-cx q[73],q[43];
-rz(-pi/2147483648) q[43];
-cx q[73],q[43];
-rz(pi/2147483648) q[43];
-rz(pi/1073741824) q[73];
-cx q[73],q[44];
-rz(-pi/1073741824) q[44];
-cx q[73],q[44];
-rz(pi/1073741824) q[44];
-rz(pi/536870912) q[73];
-cx q[73],q[45];
-rz(-pi/536870912) q[45];
-cx q[73],q[45];
-rz(pi/536870912) q[45];
-rz(pi/268435456) q[73];
-cx q[73],q[46];
-rz(-pi/268435456) q[46];
-cx q[73],q[46];
-rz(pi/268435456) q[46];
-rz(pi/134217728) q[73];
-cx q[73],q[47];
-rz(-pi/134217728) q[47];
-cx q[73],q[47];
-rz(pi/134217728) q[47];
-rz(pi/67108864) q[73];
-cx q[73],q[48];
-rz(-pi/67108864) q[48];
-cx q[73],q[48];
-rz(pi/67108864) q[48];
-rz(pi/33554432) q[73];
-cx q[73],q[49];
-rz(-pi/33554432) q[49];
-cx q[73],q[49];
-rz(pi/33554432) q[49];
-rz(pi/16777216) q[73];
-cx q[73],q[50];
-rz(-pi/16777216) q[50];
-cx q[73],q[50];
-rz(pi/16777216) q[50];
-rz(pi/8388608) q[73];
-cx q[73],q[51];
-rz(-pi/8388608) q[51];
-cx q[73],q[51];
-rz(pi/8388608) q[51];
-rz(pi/4194304) q[73];
-cx q[73],q[52];
-rz(-pi/4194304) q[52];
-cx q[73],q[52];
-rz(pi/4194304) q[52];
-rz(pi/2097152) q[73];
-cx q[73],q[53];
-rz(-pi/2097152) q[53];
-cx q[73],q[53];
-rz(pi/2097152) q[53];
-rz(pi/1048576) q[73];
-cx q[73],q[54];
-rz(-pi/1048576) q[54];
-cx q[73],q[54];
-rz(pi/1048576) q[54];
-rz(pi/524288) q[73];
-cx q[73],q[55];
-rz(-pi/524288) q[55];
-cx q[73],q[55];
-rz(pi/524288) q[55];
-rz(pi/262144) q[73];
-cx q[73],q[56];
-rz(-pi/262144) q[56];
-cx q[73],q[56];
-rz(pi/262144) q[56];
-rz(pi/131072) q[73];
-cx q[73],q[57];
-rz(-pi/131072) q[57];
-cx q[73],q[57];
-rz(pi/131072) q[57];
-rz(pi/65536) q[73];
-cx q[73],q[58];
-rz(-pi/65536) q[58];
-cx q[73],q[58];
-rz(pi/65536) q[58];
-rz(pi/32768) q[73];
-cx q[73],q[59];
-rz(-pi/32768) q[59];
-cx q[73],q[59];
-rz(pi/32768) q[59];
-rz(pi/16384) q[73];
-cx q[73],q[60];
-rz(-pi/16384) q[60];
-cx q[73],q[60];
-rz(pi/16384) q[60];
-rz(pi/8192) q[73];
-cx q[73],q[61];
-rz(-pi/8192) q[61];
-cx q[73],q[61];
-rz(pi/8192) q[61];
-rz(pi/4096) q[73];
-cx q[73],q[62];
-rz(-pi/4096) q[62];
-cx q[73],q[62];
-rz(pi/4096) q[62];
-rz(pi/2048) q[73];
-cx q[73],q[63];
-rz(-pi/2048) q[63];
-cx q[73],q[63];
-rz(pi/2048) q[63];
-rz(pi/1024) q[73];
-cx q[73],q[64];
-rz(-pi/1024) q[64];
-cx q[73],q[64];
-rz(pi/1024) q[64];
-rz(pi/512) q[73];
-cx q[73],q[65];
-rz(-pi/512) q[65];
-cx q[73],q[65];
-rz(pi/512) q[65];
-rz(pi/256) q[73];
-cx q[73],q[66];
-rz(-pi/256) q[66];
-cx q[73],q[66];
-rz(pi/256) q[66];
-rz(pi/128) q[73];
-cx q[73],q[67];
-rz(-pi/128) q[67];
-cx q[73],q[67];
-rz(pi/128) q[67];
-rz(pi/64) q[73];
-cx q[73],q[68];
-rz(-pi/64) q[68];
-cx q[73],q[68];
-rz(pi/64) q[68];
-rz(pi/32) q[73];
-cx q[73],q[69];
-rz(-pi/32) q[69];
-cx q[73],q[69];
-rz(pi/32) q[69];
-rz(pi/16) q[73];
-cx q[73],q[70];
-rz(-pi/16) q[70];
-cx q[73],q[70];
-rz(pi/16) q[70];
-rz(pi/8) q[73];
-cx q[73],q[71];
-rz(-pi/8) q[71];
-cx q[73],q[71];
-rz(pi/8) q[71];
-rz(pi/4) q[73];
-cx q[73],q[72];
-rz(-pi/4) q[72];
-cx q[73],q[72];
-rz(pi/4) q[72];
-rz(pi/2) q[73];
-sx q[73];
-rz(pi/2) q[73];
-rz(1.42863093678434e-12) q[74];
-cx q[74],q[34];
-rz(-1.42863093678434e-12) q[34];
-cx q[74],q[34];
-rz(1.42863093678434e-12) q[34];
-rz(2.85726187356867e-12) q[74];
-cx q[74],q[35];
-rz(-2.85726187356867e-12) q[35];
-cx q[74],q[35];
-rz(2.85726187356867e-12) q[35];
-rz(5.71452374713734e-12) q[74];
-cx q[74],q[36];
-rz(-5.71452374713734e-12) q[36];
-cx q[74],q[36];
-rz(5.71452374713734e-12) q[36];
-rz(1.14290474942747e-11) q[74];
-cx q[74],q[37];
-rz(-1.14290474942747e-11) q[37];
-cx q[74],q[37];
-rz(1.14290474942747e-11) q[37];
-rz(2.28580949885494e-11) q[74];
-cx q[74],q[38];
-rz(-2.28580949885494e-11) q[38];
-cx q[74],q[38];
-rz(2.28580949885494e-11) q[38];
-rz(4.57161899770987e-11) q[74];
-cx q[74],q[39];
-rz(-4.57161899770987e-11) q[39];
-cx q[74],q[39];
-rz(4.57161899770987e-11) q[39];
-rz(9.14323799541975e-11) q[74];
-cx q[74],q[40];
-rz(-9.14323799541975e-11) q[40];
-cx q[74],q[40];
-rz(9.14323799541975e-11) q[40];
-rz(1.82864759908395e-10) q[74];
-cx q[74],q[41];
-rz(-1.82864759908395e-10) q[41];
-cx q[74],q[41];
-rz(1.82864759908395e-10) q[41];
-rz(3.6572951981679e-10) q[74];
-cx q[74],q[42];
-rz(-3.6572951981679e-10) q[42];
-cx q[74],q[42];
-rz(3.6572951981679e-10) q[42];
-rz(7.3145903963358e-10) q[74];
-cx q[74],q[43];
-rz(-7.3145903963358e-10) q[43];
-cx q[74],q[43];
-rz(7.3145903963358e-10) q[43];
-rz(pi/2147483648) q[74];
-cx q[74],q[44];
-rz(-pi/2147483648) q[44];
-cx q[74],q[44];
-rz(pi/2147483648) q[44];
-rz(pi/1073741824) q[74];
-cx q[74],q[45];
-rz(-pi/1073741824) q[45];
-cx q[74],q[45];
-rz(pi/1073741824) q[45];
-rz(pi/536870912) q[74];
-cx q[74],q[46];
-rz(-pi/536870912) q[46];
-cx q[74],q[46];
-rz(pi/536870912) q[46];
-rz(pi/268435456) q[74];
-cx q[74],q[47];
-rz(-pi/268435456) q[47];
-cx q[74],q[47];
-rz(pi/268435456) q[47];
-rz(pi/134217728) q[74];
-cx q[74],q[48];
-rz(-pi/134217728) q[48];
-cx q[74],q[48];
-rz(pi/134217728) q[48];
-rz(pi/67108864) q[74];
-cx q[74],q[49];
-rz(-pi/67108864) q[49];
-cx q[74],q[49];
-rz(pi/67108864) q[49];
-rz(pi/33554432) q[74];
-cx q[74],q[50];
-rz(-pi/33554432) q[50];
-cx q[74],q[50];
-rz(pi/33554432) q[50];
-rz(pi/16777216) q[74];
-cx q[74],q[51];
-rz(-pi/16777216) q[51];
-cx q[74],q[51];
-rz(pi/16777216) q[51];
-rz(pi/8388608) q[74];
-cx q[74],q[52];
-rz(-pi/8388608) q[52];
-cx q[74],q[52];
-rz(pi/8388608) q[52];
-rz(pi/4194304) q[74];
-cx q[74],q[53];
-rz(-pi/4194304) q[53];
-cx q[74],q[53];
-rz(pi/4194304) q[53];
-rz(pi/2097152) q[74];
-cx q[74],q[54];
-rz(-pi/2097152) q[54];
-cx q[74],q[54];
-rz(pi/2097152) q[54];
-rz(pi/1048576) q[74];
-cx q[74],q[55];
-rz(-pi/1048576) q[55];
-cx q[74],q[55];
-rz(pi/1048576) q[55];
-rz(pi/524288) q[74];
-cx q[74],q[56];
-rz(-pi/524288) q[56];
-cx q[74],q[56];
-rz(pi/524288) q[56];
-rz(pi/262144) q[74];
-cx q[74],q[57];
-rz(-pi/262144) q[57];
-cx q[74],q[57];
-rz(pi/262144) q[57];
-rz(pi/131072) q[74];
-cx q[74],q[58];
-rz(-pi/131072) q[58];
-cx q[74],q[58];
-rz(pi/131072) q[58];
-rz(pi/65536) q[74];
-cx q[74],q[59];
-rz(-pi/65536) q[59];
-cx q[74],q[59];
-rz(pi/65536) q[59];
-rz(pi/32768) q[74];
-cx q[74],q[60];
-rz(-pi/32768) q[60];
-cx q[74],q[60];
-rz(pi/32768) q[60];
-rz(pi/16384) q[74];
-cx q[74],q[61];
-rz(-pi/16384) q[61];
-cx q[74],q[61];
-rz(pi/16384) q[61];
-rz(pi/8192) q[74];
-cx q[74],q[62];
-rz(-pi/8192) q[62];
-cx q[74],q[62];
-rz(pi/8192) q[62];
-rz(pi/4096) q[74];
-cx q[74],q[63];
-rz(-pi/4096) q[63];
-cx q[74],q[63];
-rz(pi/4096) q[63];
-rz(pi/2048) q[74];
-cx q[74],q[64];
-rz(-pi/2048) q[64];
-cx q[74],q[64];
-rz(pi/2048) q[64];
-rz(pi/1024) q[74];
-cx q[74],q[65];
-rz(-pi/1024) q[65];
-cx q[74],q[65];
-rz(pi/1024) q[65];
-rz(pi/512) q[74];
-cx q[74],q[66];
-rz(-pi/512) q[66];
-cx q[74],q[66];
-rz(pi/512) q[66];
-rz(pi/256) q[74];
-cx q[74],q[67];
-rz(-pi/256) q[67];
-cx q[74],q[67];
-rz(pi/256) q[67];
-rz(pi/128) q[74];
-cx q[74],q[68];
-rz(-pi/128) q[68];
-cx q[74],q[68];
-rz(pi/128) q[68];
-rz(pi/64) q[74];
-cx q[74],q[69];
-rz(-pi/64) q[69];
-cx q[74],q[69];
-rz(pi/64) q[69];
-rz(pi/32) q[74];
-cx q[74],q[70];
-rz(-pi/32) q[70];
-cx q[74],q[70];
-rz(pi/32) q[70];
-rz(pi/16) q[74];
-cx q[74],q[71];
-rz(-pi/16) q[71];
-cx q[74],q[71];
-rz(pi/16) q[71];
-rz(pi/8) q[74];
-cx q[74],q[72];
-rz(-pi/8) q[72];
-cx q[74],q[72];
-rz(pi/8) q[72];
-rz(pi/4) q[74];
-cx q[74],q[73];
-rz(-pi/4) q[73];
-cx q[74],q[73];
-rz(pi/4) q[73];
-rz(pi/2) q[74];
-sx q[74];
-rz(pi/2) q[74];
-rz(1.42863093678434e-12) q[75];
-cx q[75],q[35];
-rz(-1.42863093678434e-12) q[35];
-cx q[75],q[35];
-rz(1.42863093678434e-12) q[35];
-rz(2.85726187356867e-12) q[75];
-cx q[75],q[36];
-rz(-2.85726187356867e-12) q[36];
-cx q[75],q[36];
-rz(2.85726187356867e-12) q[36];
-rz(5.71452374713734e-12) q[75];
-cx q[75],q[37];
-rz(-5.71452374713734e-12) q[37];
-cx q[75],q[37];
-rz(5.71452374713734e-12) q[37];
-rz(1.14290474942747e-11) q[75];
-cx q[75],q[38];
-rz(-1.14290474942747e-11) q[38];
-cx q[75],q[38];
-rz(1.14290474942747e-11) q[38];
-rz(2.28580949885494e-11) q[75];
-cx q[75],q[39];
-rz(-2.28580949885494e-11) q[39];
-cx q[75],q[39];
-rz(2.28580949885494e-11) q[39];
-rz(4.57161899770987e-11) q[75];
-cx q[75],q[40];
-rz(-4.57161899770987e-11) q[40];
-cx q[75],q[40];
-rz(4.57161899770987e-11) q[40];
-rz(9.14323799541975e-11) q[75];
-cx q[75],q[41];
-rz(-9.14323799541975e-11) q[41];
-cx q[75],q[41];
-rz(9.14323799541975e-11) q[41];
-rz(1.82864759908395e-10) q[75];
-cx q[75],q[42];
-rz(-1.82864759908395e-10) q[42];
-cx q[75],q[42];
-rz(1.82864759908395e-10) q[42];
-rz(3.6572951981679e-10) q[75];
-cx q[75],q[43];
-rz(-3.6572951981679e-10) q[43];
-cx q[75],q[43];
-rz(3.6572951981679e-10) q[43];
-rz(7.3145903963358e-10) q[75];
-cx q[75],q[44];
-rz(-7.3145903963358e-10) q[44];
-cx q[75],q[44];
-rz(7.3145903963358e-10) q[44];
-rz(pi/2147483648) q[75];
-cx q[75],q[45];
-rz(-pi/2147483648) q[45];
-cx q[75],q[45];
-rz(pi/2147483648) q[45];
-rz(pi/1073741824) q[75];
-cx q[75],q[46];
-rz(-pi/1073741824) q[46];
-cx q[75],q[46];
-rz(pi/1073741824) q[46];
-rz(pi/536870912) q[75];
-cx q[75],q[47];
-rz(-pi/536870912) q[47];
-cx q[75],q[47];
-rz(pi/536870912) q[47];
-rz(pi/268435456) q[75];
-cx q[75],q[48];
-rz(-pi/268435456) q[48];
-cx q[75],q[48];
-rz(pi/268435456) q[48];
-rz(pi/134217728) q[75];
-cx q[75],q[49];
-rz(-pi/134217728) q[49];
-cx q[75],q[49];
-rz(pi/134217728) q[49];
-rz(pi/67108864) q[75];
-cx q[75],q[50];
-rz(-pi/67108864) q[50];
-cx q[75],q[50];
-rz(pi/67108864) q[50];
-rz(pi/33554432) q[75];
-cx q[75],q[51];
-rz(-pi/33554432) q[51];
-cx q[75],q[51];
-rz(pi/33554432) q[51];
-rz(pi/16777216) q[75];
-cx q[75],q[52];
-rz(-pi/16777216) q[52];
-cx q[75],q[52];
-rz(pi/16777216) q[52];
-rz(pi/8388608) q[75];
-cx q[75],q[53];
-rz(-pi/8388608) q[53];
-cx q[75],q[53];
-rz(pi/8388608) q[53];
-rz(pi/4194304) q[75];
-cx q[75],q[54];
-rz(-pi/4194304) q[54];
-cx q[75],q[54];
-rz(pi/4194304) q[54];
-rz(pi/2097152) q[75];
-cx q[75],q[55];
-rz(-pi/2097152) q[55];
-cx q[75],q[55];
-rz(pi/2097152) q[55];
-rz(pi/1048576) q[75];
-cx q[75],q[56];
-rz(-pi/1048576) q[56];
-cx q[75],q[56];
-rz(pi/1048576) q[56];
-rz(pi/524288) q[75];
-cx q[75],q[57];
-rz(-pi/524288) q[57];
-cx q[75],q[57];
-rz(pi/524288) q[57];
-rz(pi/262144) q[75];
-cx q[75],q[58];
-rz(-pi/262144) q[58];
-cx q[75],q[58];
-rz(pi/262144) q[58];
-rz(pi/131072) q[75];
-cx q[75],q[59];
-rz(-pi/131072) q[59];
-cx q[75],q[59];
-rz(pi/131072) q[59];
-rz(pi/65536) q[75];
-cx q[75],q[60];
-rz(-pi/65536) q[60];
-cx q[75],q[60];
-rz(pi/65536) q[60];
-rz(pi/32768) q[75];
-cx q[75],q[61];
-rz(-pi/32768) q[61];
-cx q[75],q[61];
-rz(pi/32768) q[61];
-rz(pi/16384) q[75];
-cx q[75],q[62];
-rz(-pi/16384) q[62];
-cx q[75],q[62];
-rz(pi/16384) q[62];
-rz(pi/8192) q[75];
-cx q[75],q[63];
-rz(-pi/8192) q[63];
-cx q[75],q[63];
-rz(pi/8192) q[63];
-rz(pi/4096) q[75];
-cx q[75],q[64];
-rz(-pi/4096) q[64];
-cx q[75],q[64];
-rz(pi/4096) q[64];
-rz(pi/2048) q[75];
-cx q[75],q[65];
-rz(-pi/2048) q[65];
-cx q[75],q[65];
-rz(pi/2048) q[65];
-rz(pi/1024) q[75];
-cx q[75],q[66];
-rz(-pi/1024) q[66];
-cx q[75],q[66];
-rz(pi/1024) q[66];
-rz(pi/512) q[75];
-cx q[75],q[67];
-rz(-pi/512) q[67];
-cx q[75],q[67];
-rz(pi/512) q[67];
-rz(pi/256) q[75];
-cx q[75],q[68];
-rz(-pi/256) q[68];
-cx q[75],q[68];
-rz(pi/256) q[68];
-rz(pi/128) q[75];
-cx q[75],q[69];
-rz(-pi/128) q[69];
-cx q[75],q[69];
-rz(pi/128) q[69];
-rz(pi/64) q[75];
-cx q[75],q[70];
-rz(-pi/64) q[70];
-cx q[75],q[70];
-rz(pi/64) q[70];
-rz(pi/32) q[75];
-cx q[75],q[71];
-rz(-pi/32) q[71];
-cx q[75],q[71];
-rz(pi/32) q[71];
-rz(pi/16) q[75];
-cx q[75],q[72];
-rz(-pi/16) q[72];
-cx q[75],q[72];
-rz(pi/16) q[72];
-rz(pi/8) q[75];
-cx q[75],q[73];
-rz(-pi/8) q[73];
-cx q[75],q[73];
-rz(pi/8) q[73];
-rz(pi/4) q[75];
-cx q[75],q[74];
-rz(-pi/4) q[74];
-cx q[75],q[74];
-rz(pi/4) q[74];
-rz(pi/2) q[75];
-sx q[75];
-rz(pi/2) q[75];
-rz(1.42863093678434e-12) q[76];
-cx q[76],q[36];
-rz(-1.42863093678434e-12) q[36];
-cx q[76],q[36];
-rz(1.42863093678434e-12) q[36];
-rz(2.85726187356867e-12) q[76];
-cx q[76],q[37];
-rz(-2.85726187356867e-12) q[37];
-cx q[76],q[37];
-rz(2.85726187356867e-12) q[37];
-rz(5.71452374713734e-12) q[76];
-cx q[76],q[38];
-rz(-5.71452374713734e-12) q[38];
-cx q[76],q[38];
-rz(5.71452374713734e-12) q[38];
-rz(1.14290474942747e-11) q[76];
-cx q[76],q[39];
-rz(-1.14290474942747e-11) q[39];
-cx q[76],q[39];
-rz(1.14290474942747e-11) q[39];
-rz(2.28580949885494e-11) q[76];
-cx q[76],q[40];
-rz(-2.28580949885494e-11) q[40];
-cx q[76],q[40];
-rz(2.28580949885494e-11) q[40];
-rz(4.57161899770987e-11) q[76];
-cx q[76],q[41];
-rz(-4.57161899770987e-11) q[41];
-cx q[76],q[41];
-rz(4.57161899770987e-11) q[41];
-rz(9.14323799541975e-11) q[76];
-cx q[76],q[42];
-rz(-9.14323799541975e-11) q[42];
-cx q[76],q[42];
-rz(9.14323799541975e-11) q[42];
-rz(1.82864759908395e-10) q[76];
-cx q[76],q[43];
-rz(-1.82864759908395e-10) q[43];
-cx q[76],q[43];
-rz(1.82864759908395e-10) q[43];
-rz(3.6572951981679e-10) q[76];
-cx q[76],q[44];
-rz(-3.6572951981679e-10) q[44];
-cx q[76],q[44];
-rz(3.6572951981679e-10) q[44];
-rz(7.3145903963358e-10) q[76];
-cx q[76],q[45];
-rz(-7.3145903963358e-10) q[45];
-cx q[76],q[45];
-rz(7.3145903963358e-10) q[45];
-rz(pi/2147483648) q[76];
-cx q[76],q[46];
-rz(-pi/2147483648) q[46];
-cx q[76],q[46];
-rz(pi/2147483648) q[46];
-rz(pi/1073741824) q[76];
-cx q[76],q[47];
-rz(-pi/1073741824) q[47];
-cx q[76],q[47];
-rz(pi/1073741824) q[47];
-rz(pi/536870912) q[76];
-cx q[76],q[48];
-rz(-pi/536870912) q[48];
-cx q[76],q[48];
-rz(pi/536870912) q[48];
-rz(pi/268435456) q[76];
-cx q[76],q[49];
-rz(-pi/268435456) q[49];
-cx q[76],q[49];
-rz(pi/268435456) q[49];
-rz(pi/134217728) q[76];
-cx q[76],q[50];
-rz(-pi/134217728) q[50];
-cx q[76],q[50];
-rz(pi/134217728) q[50];
-rz(pi/67108864) q[76];
-cx q[76],q[51];
-rz(-pi/67108864) q[51];
-cx q[76],q[51];
-rz(pi/67108864) q[51];
-rz(pi/33554432) q[76];
-cx q[76],q[52];
-rz(-pi/33554432) q[52];
-cx q[76],q[52];
-rz(pi/33554432) q[52];
-rz(pi/16777216) q[76];
-cx q[76],q[53];
-rz(-pi/16777216) q[53];
-cx q[76],q[53];
-rz(pi/16777216) q[53];
-rz(pi/8388608) q[76];
-cx q[76],q[54];
-rz(-pi/8388608) q[54];
-cx q[76],q[54];
-rz(pi/8388608) q[54];
-rz(pi/4194304) q[76];
-cx q[76],q[55];
-rz(-pi/4194304) q[55];
-cx q[76],q[55];
-rz(pi/4194304) q[55];
-rz(pi/2097152) q[76];
-cx q[76],q[56];
-rz(-pi/2097152) q[56];
-cx q[76],q[56];
-rz(pi/2097152) q[56];
-rz(pi/1048576) q[76];
-cx q[76],q[57];
-rz(-pi/1048576) q[57];
-cx q[76],q[57];
-rz(pi/1048576) q[57];
-rz(pi/524288) q[76];
-cx q[76],q[58];
-rz(-pi/524288) q[58];
-cx q[76],q[58];
-rz(pi/524288) q[58];
-rz(pi/262144) q[76];
-cx q[76],q[59];
-rz(-pi/262144) q[59];
-cx q[76],q[59];
-rz(pi/262144) q[59];
-rz(pi/131072) q[76];
-cx q[76],q[60];
-rz(-pi/131072) q[60];
-cx q[76],q[60];
-rz(pi/131072) q[60];
-rz(pi/65536) q[76];
-cx q[76],q[61];
-rz(-pi/65536) q[61];
-cx q[76],q[61];
-rz(pi/65536) q[61];
-rz(pi/32768) q[76];
-cx q[76],q[62];
-rz(-pi/32768) q[62];
-cx q[76],q[62];
-rz(pi/32768) q[62];
-rz(pi/16384) q[76];
-cx q[76],q[63];
-rz(-pi/16384) q[63];
-cx q[76],q[63];
-rz(pi/16384) q[63];
-rz(pi/8192) q[76];
-cx q[76],q[64];
-rz(-pi/8192) q[64];
-cx q[76],q[64];
-rz(pi/8192) q[64];
-rz(pi/4096) q[76];
-cx q[76],q[65];
-rz(-pi/4096) q[65];
-cx q[76],q[65];
-rz(pi/4096) q[65];
-rz(pi/2048) q[76];
-cx q[76],q[66];
-rz(-pi/2048) q[66];
-cx q[76],q[66];
-rz(pi/2048) q[66];
-rz(pi/1024) q[76];
-cx q[76],q[67];
-rz(-pi/1024) q[67];
-cx q[76],q[67];
-rz(pi/1024) q[67];
-rz(pi/512) q[76];
-cx q[76],q[68];
-rz(-pi/512) q[68];
-cx q[76],q[68];
-rz(pi/512) q[68];
-rz(pi/256) q[76];
-cx q[76],q[69];
-rz(-pi/256) q[69];
-cx q[76],q[69];
-rz(pi/256) q[69];
-rz(pi/128) q[76];
-cx q[76],q[70];
-rz(-pi/128) q[70];
-cx q[76],q[70];
-rz(pi/128) q[70];
-rz(pi/64) q[76];
-cx q[76],q[71];
-rz(-pi/64) q[71];
-cx q[76],q[71];
-rz(pi/64) q[71];
-rz(pi/32) q[76];
-cx q[76],q[72];
-rz(-pi/32) q[72];
-cx q[76],q[72];
-rz(pi/32) q[72];
-rz(pi/16) q[76];
-cx q[76],q[73];
-rz(-pi/16) q[73];
-cx q[76],q[73];
-rz(pi/16) q[73];
-rz(pi/8) q[76];
-cx q[76],q[74];
-rz(-pi/8) q[74];
-cx q[76],q[74];
-rz(pi/8) q[74];
-rz(pi/4) q[76];
-cx q[76],q[75];
-rz(-pi/4) q[75];
-cx q[76],q[75];
-rz(pi/4) q[75];
-rz(pi/2) q[76];
-sx q[76];
-rz(pi/2) q[76];
-rz(1.42863093678434e-12) q[77];
-cx q[77],q[37];
-rz(-1.42863093678434e-12) q[37];
-cx q[77],q[37];
-rz(1.42863093678434e-12) q[37];
-rz(2.85726187356867e-12) q[77];
-cx q[77],q[38];
-rz(-2.85726187356867e-12) q[38];
-cx q[77],q[38];
-rz(2.85726187356867e-12) q[38];
-rz(5.71452374713734e-12) q[77];
-cx q[77],q[39];
-rz(-5.71452374713734e-12) q[39];
-cx q[77],q[39];
-rz(5.71452374713734e-12) q[39];
-rz(1.14290474942747e-11) q[77];
-cx q[77],q[40];
-rz(-1.14290474942747e-11) q[40];
-cx q[77],q[40];
-rz(1.14290474942747e-11) q[40];
-rz(2.28580949885494e-11) q[77];
-cx q[77],q[41];
-rz(-2.28580949885494e-11) q[41];
-cx q[77],q[41];
-rz(2.28580949885494e-11) q[41];
-rz(4.57161899770987e-11) q[77];
-cx q[77],q[42];
-rz(-4.57161899770987e-11) q[42];
-cx q[77],q[42];
-rz(4.57161899770987e-11) q[42];
-rz(9.14323799541975e-11) q[77];
-cx q[77],q[43];
-rz(-9.14323799541975e-11) q[43];
-cx q[77],q[43];
-rz(9.14323799541975e-11) q[43];
-rz(1.82864759908395e-10) q[77];
-cx q[77],q[44];
-rz(-1.82864759908395e-10) q[44];
-cx q[77],q[44];
-rz(1.82864759908395e-10) q[44];
-rz(3.6572951981679e-10) q[77];
-cx q[77],q[45];
-rz(-3.6572951981679e-10) q[45];
-cx q[77],q[45];
-rz(3.6572951981679e-10) q[45];
-rz(7.3145903963358e-10) q[77];
-cx q[77],q[46];
-rz(-7.3145903963358e-10) q[46];
-cx q[77],q[46];
-rz(7.3145903963358e-10) q[46];
-rz(pi/2147483648) q[77];
-cx q[77],q[47];
-rz(-pi/2147483648) q[47];
-cx q[77],q[47];
-rz(pi/2147483648) q[47];
-rz(pi/1073741824) q[77];
-cx q[77],q[48];
-rz(-pi/1073741824) q[48];
-cx q[77],q[48];
-rz(pi/1073741824) q[48];
-rz(pi/536870912) q[77];
-cx q[77],q[49];
-rz(-pi/536870912) q[49];
-cx q[77],q[49];
-rz(pi/536870912) q[49];
-rz(pi/268435456) q[77];
-cx q[77],q[50];
-rz(-pi/268435456) q[50];
-cx q[77],q[50];
-rz(pi/268435456) q[50];
-rz(pi/134217728) q[77];
-cx q[77],q[51];
-rz(-pi/134217728) q[51];
-cx q[77],q[51];
-rz(pi/134217728) q[51];
-rz(pi/67108864) q[77];
-cx q[77],q[52];
-rz(-pi/67108864) q[52];
-cx q[77],q[52];
-rz(pi/67108864) q[52];
-rz(pi/33554432) q[77];
-cx q[77],q[53];
-rz(-pi/33554432) q[53];
-cx q[77],q[53];
-rz(pi/33554432) q[53];
-rz(pi/16777216) q[77];
-cx q[77],q[54];
-rz(-pi/16777216) q[54];
-cx q[77],q[54];
-rz(pi/16777216) q[54];
-rz(pi/8388608) q[77];
-cx q[77],q[55];
-rz(-pi/8388608) q[55];
-cx q[77],q[55];
-rz(pi/8388608) q[55];
-rz(pi/4194304) q[77];
-cx q[77],q[56];
-rz(-pi/4194304) q[56];
-cx q[77],q[56];
-rz(pi/4194304) q[56];
-rz(pi/2097152) q[77];
-cx q[77],q[57];
-rz(-pi/2097152) q[57];
-cx q[77],q[57];
-rz(pi/2097152) q[57];
-rz(pi/1048576) q[77];
-cx q[77],q[58];
-rz(-pi/1048576) q[58];
-cx q[77],q[58];
-rz(pi/1048576) q[58];
-rz(pi/524288) q[77];
-cx q[77],q[59];
-rz(-pi/524288) q[59];
-cx q[77],q[59];
-rz(pi/524288) q[59];
-rz(pi/262144) q[77];
-cx q[77],q[60];
-rz(-pi/262144) q[60];
-cx q[77],q[60];
-rz(pi/262144) q[60];
-rz(pi/131072) q[77];
-cx q[77],q[61];
-rz(-pi/131072) q[61];
-cx q[77],q[61];
-rz(pi/131072) q[61];
-rz(pi/65536) q[77];
-cx q[77],q[62];
-rz(-pi/65536) q[62];
-cx q[77],q[62];
-rz(pi/65536) q[62];
-rz(pi/32768) q[77];
-cx q[77],q[63];
-rz(-pi/32768) q[63];
-cx q[77],q[63];
-rz(pi/32768) q[63];
-rz(pi/16384) q[77];
-cx q[77],q[64];
-rz(-pi/16384) q[64];
-cx q[77],q[64];
-rz(pi/16384) q[64];
-rz(pi/8192) q[77];
-cx q[77],q[65];
-rz(-pi/8192) q[65];
-cx q[77],q[65];
-rz(pi/8192) q[65];
-rz(pi/4096) q[77];
-cx q[77],q[66];
-rz(-pi/4096) q[66];
-cx q[77],q[66];
-rz(pi/4096) q[66];
-rz(pi/2048) q[77];
-cx q[77],q[67];
-rz(-pi/2048) q[67];
-cx q[77],q[67];
-rz(pi/2048) q[67];
-rz(pi/1024) q[77];
-cx q[77],q[68];
-rz(-pi/1024) q[68];
-cx q[77],q[68];
-rz(pi/1024) q[68];
-rz(pi/512) q[77];
-cx q[77],q[69];
-rz(-pi/512) q[69];
-cx q[77],q[69];
-rz(pi/512) q[69];
-rz(pi/256) q[77];
-cx q[77],q[70];
-rz(-pi/256) q[70];
-cx q[77],q[70];
-rz(pi/256) q[70];
-rz(pi/128) q[77];
-cx q[77],q[71];
-rz(-pi/128) q[71];
-cx q[77],q[71];
-rz(pi/128) q[71];
-rz(pi/64) q[77];
-cx q[77],q[72];
-rz(-pi/64) q[72];
-cx q[77],q[72];
-rz(pi/64) q[72];
-rz(pi/32) q[77];
-cx q[77],q[73];
-rz(-pi/32) q[73];
-cx q[77],q[73];
-rz(pi/32) q[73];
-rz(pi/16) q[77];
-cx q[77],q[74];
-rz(-pi/16) q[74];
-cx q[77],q[74];
-rz(pi/16) q[74];
-rz(pi/8) q[77];
-cx q[77],q[75];
-rz(-pi/8) q[75];
-cx q[77],q[75];
-rz(pi/8) q[75];
-rz(pi/4) q[77];
-cx q[77],q[76];
-rz(-pi/4) q[76];
-cx q[77],q[76];
-rz(pi/4) q[76];
-rz(pi/2) q[77];
-sx q[77];
-rz(pi/2) q[77];
-rz(1.42863093678434e-12) q[78];
-cx q[78],q[38];
-rz(-1.42863093678434e-12) q[38];
-cx q[78],q[38];
-rz(1.42863093678434e-12) q[38];
-rz(2.85726187356867e-12) q[78];
-cx q[78],q[39];
-rz(-2.85726187356867e-12) q[39];
-cx q[78],q[39];
-rz(2.85726187356867e-12) q[39];
-rz(5.71452374713734e-12) q[78];
-cx q[78],q[40];
-rz(-5.71452374713734e-12) q[40];
-cx q[78],q[40];
-rz(5.71452374713734e-12) q[40];
-rz(1.14290474942747e-11) q[78];
-cx q[78],q[41];
-rz(-1.14290474942747e-11) q[41];
-cx q[78],q[41];
-rz(1.14290474942747e-11) q[41];
-rz(2.28580949885494e-11) q[78];
-cx q[78],q[42];
-rz(-2.28580949885494e-11) q[42];
-cx q[78],q[42];
-rz(2.28580949885494e-11) q[42];
-rz(4.57161899770987e-11) q[78];
-cx q[78],q[43];
-rz(-4.57161899770987e-11) q[43];
-cx q[78],q[43];
-rz(4.57161899770987e-11) q[43];
-rz(9.14323799541975e-11) q[78];
-cx q[78],q[44];
-rz(-9.14323799541975e-11) q[44];
-cx q[78],q[44];
-rz(9.14323799541975e-11) q[44];
-rz(1.82864759908395e-10) q[78];
-cx q[78],q[45];
-rz(-1.82864759908395e-10) q[45];
-cx q[78],q[45];
-rz(1.82864759908395e-10) q[45];
-rz(3.6572951981679e-10) q[78];
-cx q[78],q[46];
-rz(-3.6572951981679e-10) q[46];
-cx q[78],q[46];
-rz(3.6572951981679e-10) q[46];
-rz(7.3145903963358e-10) q[78];
-cx q[78],q[47];
-rz(-7.3145903963358e-10) q[47];
-cx q[78],q[47];
-rz(7.3145903963358e-10) q[47];
-rz(pi/2147483648) q[78];
-cx q[78],q[48];
-rz(-pi/2147483648) q[48];
-cx q[78],q[48];
-rz(pi/2147483648) q[48];
-rz(pi/1073741824) q[78];
-cx q[78],q[49];
-rz(-pi/1073741824) q[49];
-cx q[78],q[49];
-rz(pi/1073741824) q[49];
-rz(pi/536870912) q[78];
-cx q[78],q[50];
-rz(-pi/536870912) q[50];
-cx q[78],q[50];
-rz(pi/536870912) q[50];
-rz(pi/268435456) q[78];
-cx q[78],q[51];
-rz(-pi/268435456) q[51];
-cx q[78],q[51];
-rz(pi/268435456) q[51];
-rz(pi/134217728) q[78];
-cx q[78],q[52];
-rz(-pi/134217728) q[52];
-cx q[78],q[52];
-rz(pi/134217728) q[52];
-rz(pi/67108864) q[78];
-cx q[78],q[53];
-rz(-pi/67108864) q[53];
-cx q[78],q[53];
-rz(pi/67108864) q[53];
-rz(pi/33554432) q[78];
-cx q[78],q[54];
-rz(-pi/33554432) q[54];
-cx q[78],q[54];
-rz(pi/33554432) q[54];
-rz(pi/16777216) q[78];
-cx q[78],q[55];
-rz(-pi/16777216) q[55];
-cx q[78],q[55];
-rz(pi/16777216) q[55];
-rz(pi/8388608) q[78];
-cx q[78],q[56];
-rz(-pi/8388608) q[56];
-cx q[78],q[56];
-rz(pi/8388608) q[56];
-rz(pi/4194304) q[78];
-cx q[78],q[57];
-rz(-pi/4194304) q[57];
-cx q[78],q[57];
-rz(pi/4194304) q[57];
-rz(pi/2097152) q[78];
-cx q[78],q[58];
-rz(-pi/2097152) q[58];
-cx q[78],q[58];
-rz(pi/2097152) q[58];
-rz(pi/1048576) q[78];
-cx q[78],q[59];
-rz(-pi/1048576) q[59];
-cx q[78],q[59];
-rz(pi/1048576) q[59];
-rz(pi/524288) q[78];
-cx q[78],q[60];
-rz(-pi/524288) q[60];
-cx q[78],q[60];
-rz(pi/524288) q[60];
-rz(pi/262144) q[78];
-cx q[78],q[61];
-rz(-pi/262144) q[61];
-cx q[78],q[61];
-rz(pi/262144) q[61];
-rz(pi/131072) q[78];
-cx q[78],q[62];
-rz(-pi/131072) q[62];
-cx q[78],q[62];
-rz(pi/131072) q[62];
-rz(pi/65536) q[78];
-cx q[78],q[63];
-rz(-pi/65536) q[63];
-cx q[78],q[63];
-rz(pi/65536) q[63];
-rz(pi/32768) q[78];
-cx q[78],q[64];
-rz(-pi/32768) q[64];
-cx q[78],q[64];
-rz(pi/32768) q[64];
-rz(pi/16384) q[78];
-cx q[78],q[65];
-rz(-pi/16384) q[65];
-cx q[78],q[65];
-rz(pi/16384) q[65];
-rz(pi/8192) q[78];
-cx q[78],q[66];
-rz(-pi/8192) q[66];
-cx q[78],q[66];
-rz(pi/8192) q[66];
-rz(pi/4096) q[78];
-cx q[78],q[67];
-rz(-pi/4096) q[67];
-cx q[78],q[67];
-rz(pi/4096) q[67];
-rz(pi/2048) q[78];
-cx q[78],q[68];
-rz(-pi/2048) q[68];
-cx q[78],q[68];
-rz(pi/2048) q[68];
-rz(pi/1024) q[78];
-cx q[78],q[69];
-rz(-pi/1024) q[69];
-cx q[78],q[69];
-rz(pi/1024) q[69];
-rz(pi/512) q[78];
-cx q[78],q[70];
-rz(-pi/512) q[70];
-cx q[78],q[70];
-rz(pi/512) q[70];
-rz(pi/256) q[78];
-cx q[78],q[71];
-rz(-pi/256) q[71];
-cx q[78],q[71];
-rz(pi/256) q[71];
-rz(pi/128) q[78];
-cx q[78],q[72];
-rz(-pi/128) q[72];
-cx q[78],q[72];
-rz(pi/128) q[72];
-rz(pi/64) q[78];
-cx q[78],q[73];
-rz(-pi/64) q[73];
-cx q[78],q[73];
-rz(pi/64) q[73];
-rz(pi/32) q[78];
-cx q[78],q[74];
-rz(-pi/32) q[74];
-cx q[78],q[74];
-rz(pi/32) q[74];
-rz(pi/16) q[78];
-cx q[78],q[75];
-rz(-pi/16) q[75];
-cx q[78],q[75];
-rz(pi/16) q[75];
-rz(pi/8) q[78];
-cx q[78],q[76];
-rz(-pi/8) q[76];
-cx q[78],q[76];
-rz(pi/8) q[76];
-rz(pi/4) q[78];
-cx q[78],q[77];
-rz(-pi/4) q[77];
-cx q[78],q[77];
-rz(pi/4) q[77];
-rz(pi/2) q[78];
-sx q[78];
-rz(pi/2) q[78];
-rz(1.42863093678434e-12) q[79];
-cx q[79],q[39];
-rz(-1.42863093678434e-12) q[39];
-cx q[79],q[39];
-rz(1.42863093678434e-12) q[39];
-rz(2.85726187356867e-12) q[79];
-cx q[79],q[40];
-rz(-2.85726187356867e-12) q[40];
-cx q[79],q[40];
-rz(2.85726187356867e-12) q[40];
-rz(5.71452374713734e-12) q[79];
-cx q[79],q[41];
-rz(-5.71452374713734e-12) q[41];
-cx q[79],q[41];
-rz(5.71452374713734e-12) q[41];
-rz(1.14290474942747e-11) q[79];
-cx q[79],q[42];
-rz(-1.14290474942747e-11) q[42];
-cx q[79],q[42];
-rz(1.14290474942747e-11) q[42];
-rz(2.28580949885494e-11) q[79];
-cx q[79],q[43];
-rz(-2.28580949885494e-11) q[43];
-cx q[79],q[43];
-rz(2.28580949885494e-11) q[43];
-rz(4.57161899770987e-11) q[79];
-cx q[79],q[44];
-rz(-4.57161899770987e-11) q[44];
-cx q[79],q[44];
-rz(4.57161899770987e-11) q[44];
-rz(9.14323799541975e-11) q[79];
-cx q[79],q[45];
-rz(-9.14323799541975e-11) q[45];
-cx q[79],q[45];
-rz(9.14323799541975e-11) q[45];
-rz(1.82864759908395e-10) q[79];
-cx q[79],q[46];
-rz(-1.82864759908395e-10) q[46];
-cx q[79],q[46];
-rz(1.82864759908395e-10) q[46];
-rz(3.6572951981679e-10) q[79];
-cx q[79],q[47];
-rz(-3.6572951981679e-10) q[47];
-cx q[79],q[47];
-rz(3.6572951981679e-10) q[47];
-rz(7.3145903963358e-10) q[79];
-cx q[79],q[48];
-rz(-7.3145903963358e-10) q[48];
-cx q[79],q[48];
-rz(7.3145903963358e-10) q[48];
-rz(pi/2147483648) q[79];
-cx q[79],q[49];
-rz(-pi/2147483648) q[49];
-cx q[79],q[49];
-rz(pi/2147483648) q[49];
-rz(pi/1073741824) q[79];
-cx q[79],q[50];
-rz(-pi/1073741824) q[50];
-cx q[79],q[50];
-rz(pi/1073741824) q[50];
-rz(pi/536870912) q[79];
-cx q[79],q[51];
-rz(-pi/536870912) q[51];
-cx q[79],q[51];
-rz(pi/536870912) q[51];
-rz(pi/268435456) q[79];
-cx q[79],q[52];
-rz(-pi/268435456) q[52];
-cx q[79],q[52];
-rz(pi/268435456) q[52];
-rz(pi/134217728) q[79];
-cx q[79],q[53];
-rz(-pi/134217728) q[53];
-cx q[79],q[53];
-rz(pi/134217728) q[53];
-rz(pi/67108864) q[79];
-cx q[79],q[54];
-rz(-pi/67108864) q[54];
-cx q[79],q[54];
-rz(pi/67108864) q[54];
-rz(pi/33554432) q[79];
-cx q[79],q[55];
-rz(-pi/33554432) q[55];
-cx q[79],q[55];
-rz(pi/33554432) q[55];
-rz(pi/16777216) q[79];
-cx q[79],q[56];
-rz(-pi/16777216) q[56];
-cx q[79],q[56];
-rz(pi/16777216) q[56];
-rz(pi/8388608) q[79];
-cx q[79],q[57];
-rz(-pi/8388608) q[57];
-cx q[79],q[57];
-rz(pi/8388608) q[57];
-rz(pi/4194304) q[79];
-cx q[79],q[58];
-rz(-pi/4194304) q[58];
-cx q[79],q[58];
-rz(pi/4194304) q[58];
-rz(pi/2097152) q[79];
-cx q[79],q[59];
-rz(-pi/2097152) q[59];
-cx q[79],q[59];
-rz(pi/2097152) q[59];
-rz(pi/1048576) q[79];
-cx q[79],q[60];
-rz(-pi/1048576) q[60];
-cx q[79],q[60];
-rz(pi/1048576) q[60];
-rz(pi/524288) q[79];
-cx q[79],q[61];
-rz(-pi/524288) q[61];
-cx q[79],q[61];
-rz(pi/524288) q[61];
-rz(pi/262144) q[79];
-cx q[79],q[62];
-rz(-pi/262144) q[62];
-cx q[79],q[62];
-rz(pi/262144) q[62];
-rz(pi/131072) q[79];
-cx q[79],q[63];
-rz(-pi/131072) q[63];
-cx q[79],q[63];
-rz(pi/131072) q[63];
-rz(pi/65536) q[79];
-cx q[79],q[64];
-rz(-pi/65536) q[64];
-cx q[79],q[64];
-rz(pi/65536) q[64];
-rz(pi/32768) q[79];
-cx q[79],q[65];
-rz(-pi/32768) q[65];
-cx q[79],q[65];
-rz(pi/32768) q[65];
-rz(pi/16384) q[79];
-cx q[79],q[66];
-rz(-pi/16384) q[66];
-cx q[79],q[66];
-rz(pi/16384) q[66];
-rz(pi/8192) q[79];
-cx q[79],q[67];
-rz(-pi/8192) q[67];
-cx q[79],q[67];
-rz(pi/8192) q[67];
-rz(pi/4096) q[79];
-cx q[79],q[68];
-rz(-pi/4096) q[68];
-cx q[79],q[68];
-rz(pi/4096) q[68];
-rz(pi/2048) q[79];
-cx q[79],q[69];
-rz(-pi/2048) q[69];
-cx q[79],q[69];
-rz(pi/2048) q[69];
-rz(pi/1024) q[79];
-cx q[79],q[70];
-rz(-pi/1024) q[70];
-cx q[79],q[70];
-rz(pi/1024) q[70];
-rz(pi/512) q[79];
-cx q[79],q[71];
-rz(-pi/512) q[71];
-cx q[79],q[71];
-rz(pi/512) q[71];
-rz(pi/256) q[79];
-cx q[79],q[72];
-rz(-pi/256) q[72];
-cx q[79],q[72];
-rz(pi/256) q[72];
-rz(pi/128) q[79];
-cx q[79],q[73];
-rz(-pi/128) q[73];
-cx q[79],q[73];
-rz(pi/128) q[73];
-rz(pi/64) q[79];
-cx q[79],q[74];
-rz(-pi/64) q[74];
-cx q[79],q[74];
-rz(pi/64) q[74];
-rz(pi/32) q[79];
-cx q[79],q[75];
-rz(-pi/32) q[75];
-cx q[79],q[75];
-rz(pi/32) q[75];
-rz(pi/16) q[79];
-cx q[79],q[76];
-rz(-pi/16) q[76];
-cx q[79],q[76];
-rz(pi/16) q[76];
-rz(pi/8) q[79];
-cx q[79],q[77];
-rz(-pi/8) q[77];
-cx q[79],q[77];
-rz(pi/8) q[77];
-rz(pi/4) q[79];
-cx q[79],q[78];
-rz(-pi/4) q[78];
-cx q[79],q[78];
-rz(pi/4) q[78];
-rz(pi/2) q[79];
-sx q[79];
-rz(pi/2) q[79];
-rz(1.42863093678434e-12) q[80];
-cx q[80],q[40];
-rz(-1.42863093678434e-12) q[40];
-cx q[80],q[40];
-rz(1.42863093678434e-12) q[40];
-rz(2.85726187356867e-12) q[80];
-cx q[80],q[41];
-rz(-2.85726187356867e-12) q[41];
-cx q[80],q[41];
-rz(2.85726187356867e-12) q[41];
-rz(5.71452374713734e-12) q[80];
-cx q[80],q[42];
-rz(-5.71452374713734e-12) q[42];
-cx q[80],q[42];
-rz(5.71452374713734e-12) q[42];
-rz(1.14290474942747e-11) q[80];
-cx q[80],q[43];
-rz(-1.14290474942747e-11) q[43];
-cx q[80],q[43];
-rz(1.14290474942747e-11) q[43];
-rz(2.28580949885494e-11) q[80];
-cx q[80],q[44];
-rz(-2.28580949885494e-11) q[44];
-cx q[80],q[44];
-rz(2.28580949885494e-11) q[44];
-rz(4.57161899770987e-11) q[80];
-cx q[80],q[45];
-rz(-4.57161899770987e-11) q[45];
-cx q[80],q[45];
-rz(4.57161899770987e-11) q[45];
-rz(9.14323799541975e-11) q[80];
-cx q[80],q[46];
-rz(-9.14323799541975e-11) q[46];
-cx q[80],q[46];
-rz(9.14323799541975e-11) q[46];
-rz(1.82864759908395e-10) q[80];
-cx q[80],q[47];
-rz(-1.82864759908395e-10) q[47];
-cx q[80],q[47];
-rz(1.82864759908395e-10) q[47];
-rz(3.6572951981679e-10) q[80];
-cx q[80],q[48];
-rz(-3.6572951981679e-10) q[48];
-cx q[80],q[48];
-rz(3.6572951981679e-10) q[48];
-rz(7.3145903963358e-10) q[80];
-cx q[80],q[49];
-rz(-7.3145903963358e-10) q[49];
-cx q[80],q[49];
-rz(7.3145903963358e-10) q[49];
-rz(pi/2147483648) q[80];
-cx q[80],q[50];
-rz(-pi/2147483648) q[50];
-cx q[80],q[50];
-rz(pi/2147483648) q[50];
-rz(pi/1073741824) q[80];
-cx q[80],q[51];
-rz(-pi/1073741824) q[51];
-cx q[80],q[51];
-rz(pi/1073741824) q[51];
-rz(pi/536870912) q[80];
-cx q[80],q[52];
-rz(-pi/536870912) q[52];
-cx q[80],q[52];
-rz(pi/536870912) q[52];
-rz(pi/268435456) q[80];
-cx q[80],q[53];
-rz(-pi/268435456) q[53];
-cx q[80],q[53];
-rz(pi/268435456) q[53];
-rz(pi/134217728) q[80];
-cx q[80],q[54];
-rz(-pi/134217728) q[54];
-cx q[80],q[54];
-rz(pi/134217728) q[54];
-rz(pi/67108864) q[80];
-cx q[80],q[55];
-rz(-pi/67108864) q[55];
-cx q[80],q[55];
-rz(pi/67108864) q[55];
-rz(pi/33554432) q[80];
-cx q[80],q[56];
-rz(-pi/33554432) q[56];
-cx q[80],q[56];
-rz(pi/33554432) q[56];
-rz(pi/16777216) q[80];
-cx q[80],q[57];
-rz(-pi/16777216) q[57];
-cx q[80],q[57];
-rz(pi/16777216) q[57];
-rz(pi/8388608) q[80];
-cx q[80],q[58];
-rz(-pi/8388608) q[58];
-cx q[80],q[58];
-rz(pi/8388608) q[58];
-rz(pi/4194304) q[80];
-cx q[80],q[59];
-rz(-pi/4194304) q[59];
-cx q[80],q[59];
-rz(pi/4194304) q[59];
-rz(pi/2097152) q[80];
-cx q[80],q[60];
-rz(-pi/2097152) q[60];
-cx q[80],q[60];
-rz(pi/2097152) q[60];
-rz(pi/1048576) q[80];
-cx q[80],q[61];
-rz(-pi/1048576) q[61];
-cx q[80],q[61];
-rz(pi/1048576) q[61];
-rz(pi/524288) q[80];
-cx q[80],q[62];
-rz(-pi/524288) q[62];
-cx q[80],q[62];
-rz(pi/524288) q[62];
-rz(pi/262144) q[80];
-cx q[80],q[63];
-rz(-pi/262144) q[63];
-cx q[80],q[63];
-rz(pi/262144) q[63];
-rz(pi/131072) q[80];
-cx q[80],q[64];
-rz(-pi/131072) q[64];
-cx q[80],q[64];
-rz(pi/131072) q[64];
-rz(pi/65536) q[80];
-cx q[80],q[65];
-rz(-pi/65536) q[65];
-cx q[80],q[65];
-rz(pi/65536) q[65];
-rz(pi/32768) q[80];
-cx q[80],q[66];
-rz(-pi/32768) q[66];
-cx q[80],q[66];
-rz(pi/32768) q[66];
-rz(pi/16384) q[80];
-cx q[80],q[67];
-rz(-pi/16384) q[67];
-cx q[80],q[67];
-rz(pi/16384) q[67];
-rz(pi/8192) q[80];
-cx q[80],q[68];
-rz(-pi/8192) q[68];
-cx q[80],q[68];
-rz(pi/8192) q[68];
-rz(pi/4096) q[80];
-cx q[80],q[69];
-rz(-pi/4096) q[69];
-cx q[80],q[69];
-rz(pi/4096) q[69];
-rz(pi/2048) q[80];
-cx q[80],q[70];
-rz(-pi/2048) q[70];
-cx q[80],q[70];
-rz(pi/2048) q[70];
-rz(pi/1024) q[80];
-cx q[80],q[71];
-rz(-pi/1024) q[71];
-cx q[80],q[71];
-rz(pi/1024) q[71];
-rz(pi/512) q[80];
-cx q[80],q[72];
-rz(-pi/512) q[72];
-cx q[80],q[72];
-rz(pi/512) q[72];
-rz(pi/256) q[80];
-cx q[80],q[73];
-rz(-pi/256) q[73];
-cx q[80],q[73];
-rz(pi/256) q[73];
-rz(pi/128) q[80];
-cx q[80],q[74];
-rz(-pi/128) q[74];
-cx q[80],q[74];
-rz(pi/128) q[74];
-rz(pi/64) q[80];
-cx q[80],q[75];
-rz(-pi/64) q[75];
-cx q[80],q[75];
-rz(pi/64) q[75];
-rz(pi/32) q[80];
-cx q[80],q[76];
-rz(-pi/32) q[76];
-cx q[80],q[76];
-rz(pi/32) q[76];
-rz(pi/16) q[80];
-cx q[80],q[77];
-rz(-pi/16) q[77];
-cx q[80],q[77];
-rz(pi/16) q[77];
-rz(pi/8) q[80];
-cx q[80],q[78];
-rz(-pi/8) q[78];
-cx q[80],q[78];
-rz(pi/8) q[78];
-rz(pi/4) q[80];
-cx q[80],q[79];
-rz(-pi/4) q[79];
-cx q[80],q[79];
-rz(pi/4) q[79];
-rz(pi/2) q[80];
-sx q[80];
-rz(pi/2) q[80];
-rz(1.42863093678434e-12) q[81];
-cx q[81],q[41];
-rz(-1.42863093678434e-12) q[41];
-cx q[81],q[41];
-rz(1.42863093678434e-12) q[41];
-rz(2.85726187356867e-12) q[81];
-cx q[81],q[42];
-rz(-2.85726187356867e-12) q[42];
-cx q[81],q[42];
-rz(2.85726187356867e-12) q[42];
-rz(5.71452374713734e-12) q[81];
-cx q[81],q[43];
-rz(-5.71452374713734e-12) q[43];
-cx q[81],q[43];
-rz(5.71452374713734e-12) q[43];
-rz(1.14290474942747e-11) q[81];
-cx q[81],q[44];
-rz(-1.14290474942747e-11) q[44];
-cx q[81],q[44];
-rz(1.14290474942747e-11) q[44];
-rz(2.28580949885494e-11) q[81];
-cx q[81],q[45];
-rz(-2.28580949885494e-11) q[45];
-cx q[81],q[45];
-rz(2.28580949885494e-11) q[45];
-rz(4.57161899770987e-11) q[81];
-cx q[81],q[46];
-rz(-4.57161899770987e-11) q[46];
-cx q[81],q[46];
-rz(4.57161899770987e-11) q[46];
-rz(9.14323799541975e-11) q[81];
-cx q[81],q[47];
-rz(-9.14323799541975e-11) q[47];
-cx q[81],q[47];
-rz(9.14323799541975e-11) q[47];
-rz(1.82864759908395e-10) q[81];
-cx q[81],q[48];
-rz(-1.82864759908395e-10) q[48];
-cx q[81],q[48];
-rz(1.82864759908395e-10) q[48];
-rz(3.6572951981679e-10) q[81];
-cx q[81],q[49];
-rz(-3.6572951981679e-10) q[49];
-cx q[81],q[49];
-rz(3.6572951981679e-10) q[49];
-rz(7.3145903963358e-10) q[81];
-cx q[81],q[50];
-rz(-7.3145903963358e-10) q[50];
-cx q[81],q[50];
-rz(7.3145903963358e-10) q[50];
-rz(pi/2147483648) q[81];
-cx q[81],q[51];
-rz(-pi/2147483648) q[51];
-cx q[81],q[51];
-rz(pi/2147483648) q[51];
-rz(pi/1073741824) q[81];
-cx q[81],q[52];
-rz(-pi/1073741824) q[52];
-cx q[81],q[52];
-rz(pi/1073741824) q[52];
-rz(pi/536870912) q[81];
-cx q[81],q[53];
-rz(-pi/536870912) q[53];
-cx q[81],q[53];
-rz(pi/536870912) q[53];
-rz(pi/268435456) q[81];
-cx q[81],q[54];
-rz(-pi/268435456) q[54];
-cx q[81],q[54];
-rz(pi/268435456) q[54];
-rz(pi/134217728) q[81];
-cx q[81],q[55];
-rz(-pi/134217728) q[55];
-cx q[81],q[55];
-rz(pi/134217728) q[55];
-rz(pi/67108864) q[81];
-cx q[81],q[56];
-rz(-pi/67108864) q[56];
-cx q[81],q[56];
-rz(pi/67108864) q[56];
-rz(pi/33554432) q[81];
-cx q[81],q[57];
-rz(-pi/33554432) q[57];
-cx q[81],q[57];
-rz(pi/33554432) q[57];
-rz(pi/16777216) q[81];
-cx q[81],q[58];
-rz(-pi/16777216) q[58];
-cx q[81],q[58];
-rz(pi/16777216) q[58];
-rz(pi/8388608) q[81];
-cx q[81],q[59];
-rz(-pi/8388608) q[59];
-cx q[81],q[59];
-rz(pi/8388608) q[59];
-rz(pi/4194304) q[81];
-cx q[81],q[60];
-rz(-pi/4194304) q[60];
-cx q[81],q[60];
-rz(pi/4194304) q[60];
-rz(pi/2097152) q[81];
-cx q[81],q[61];
-rz(-pi/2097152) q[61];
-cx q[81],q[61];
-rz(pi/2097152) q[61];
-rz(pi/1048576) q[81];
-cx q[81],q[62];
-rz(-pi/1048576) q[62];
-cx q[81],q[62];
-rz(pi/1048576) q[62];
-rz(pi/524288) q[81];
-cx q[81],q[63];
-rz(-pi/524288) q[63];
-cx q[81],q[63];
-rz(pi/524288) q[63];
-rz(pi/262144) q[81];
-cx q[81],q[64];
-rz(-pi/262144) q[64];
-cx q[81],q[64];
-rz(pi/262144) q[64];
-rz(pi/131072) q[81];
-cx q[81],q[65];
-rz(-pi/131072) q[65];
-cx q[81],q[65];
-rz(pi/131072) q[65];
-rz(pi/65536) q[81];
-cx q[81],q[66];
-rz(-pi/65536) q[66];
-cx q[81],q[66];
-rz(pi/65536) q[66];
-rz(pi/32768) q[81];
-cx q[81],q[67];
-rz(-pi/32768) q[67];
-cx q[81],q[67];
-rz(pi/32768) q[67];
-rz(pi/16384) q[81];
-cx q[81],q[68];
-rz(-pi/16384) q[68];
-cx q[81],q[68];
-rz(pi/16384) q[68];
-rz(pi/8192) q[81];
-cx q[81],q[69];
-rz(-pi/8192) q[69];
-cx q[81],q[69];
-rz(pi/8192) q[69];
-rz(pi/4096) q[81];
-cx q[81],q[70];
-rz(-pi/4096) q[70];
-cx q[81],q[70];
-rz(pi/4096) q[70];
-rz(pi/2048) q[81];
-cx q[81],q[71];
-rz(-pi/2048) q[71];
-cx q[81],q[71];
-rz(pi/2048) q[71];
-rz(pi/1024) q[81];
-cx q[81],q[72];
-rz(-pi/1024) q[72];
-cx q[81],q[72];
-rz(pi/1024) q[72];
-rz(pi/512) q[81];
-cx q[81],q[73];
-rz(-pi/512) q[73];
-cx q[81],q[73];
-rz(pi/512) q[73];
-rz(pi/256) q[81];
-cx q[81],q[74];
-rz(-pi/256) q[74];
-cx q[81],q[74];
-rz(pi/256) q[74];
-rz(pi/128) q[81];
-cx q[81],q[75];
-rz(-pi/128) q[75];
-cx q[81],q[75];
-rz(pi/128) q[75];
-rz(pi/64) q[81];
-cx q[81],q[76];
-rz(-pi/64) q[76];
-cx q[81],q[76];
-rz(pi/64) q[76];
-rz(pi/32) q[81];
-cx q[81],q[77];
-rz(-pi/32) q[77];
-cx q[81],q[77];
-rz(pi/32) q[77];
-rz(pi/16) q[81];
-cx q[81],q[78];
-rz(-pi/16) q[78];
-cx q[81],q[78];
-rz(pi/16) q[78];
-rz(pi/8) q[81];
-cx q[81],q[79];
-rz(-pi/8) q[79];
-cx q[81],q[79];
-rz(pi/8) q[79];
-rz(pi/4) q[81];
-cx q[81],q[80];
-rz(-pi/4) q[80];
-cx q[81],q[80];
-rz(pi/4) q[80];
-rz(pi/2) q[81];
-sx q[81];
-rz(pi/2) q[81];
-rz(1.42863093678434e-12) q[82];
-cx q[82],q[42];
-rz(-1.42863093678434e-12) q[42];
-cx q[82],q[42];
-rz(1.42863093678434e-12) q[42];
-rz(2.85726187356867e-12) q[82];
-cx q[82],q[43];
-rz(-2.85726187356867e-12) q[43];
-cx q[82],q[43];
-rz(2.85726187356867e-12) q[43];
-rz(5.71452374713734e-12) q[82];
-cx q[82],q[44];
-rz(-5.71452374713734e-12) q[44];
-cx q[82],q[44];
-rz(5.71452374713734e-12) q[44];
-rz(1.14290474942747e-11) q[82];
-cx q[82],q[45];
-rz(-1.14290474942747e-11) q[45];
-cx q[82],q[45];
-rz(1.14290474942747e-11) q[45];
-rz(2.28580949885494e-11) q[82];
-cx q[82],q[46];
-rz(-2.28580949885494e-11) q[46];
-cx q[82],q[46];
-rz(2.28580949885494e-11) q[46];
-rz(4.57161899770987e-11) q[82];
-cx q[82],q[47];
-rz(-4.57161899770987e-11) q[47];
-cx q[82],q[47];
-rz(4.57161899770987e-11) q[47];
-rz(9.14323799541975e-11) q[82];
-cx q[82],q[48];
-rz(-9.14323799541975e-11) q[48];
-cx q[82],q[48];
-rz(9.14323799541975e-11) q[48];
-rz(1.82864759908395e-10) q[82];
-cx q[82],q[49];
-rz(-1.82864759908395e-10) q[49];
-cx q[82],q[49];
-rz(1.82864759908395e-10) q[49];
-rz(3.6572951981679e-10) q[82];
-cx q[82],q[50];
-rz(-3.6572951981679e-10) q[50];
-cx q[82],q[50];
-rz(3.6572951981679e-10) q[50];
-rz(7.3145903963358e-10) q[82];
-cx q[82],q[51];
-rz(-7.3145903963358e-10) q[51];
-cx q[82],q[51];
-rz(7.3145903963358e-10) q[51];
-rz(pi/2147483648) q[82];
-cx q[82],q[52];
-rz(-pi/2147483648) q[52];
-cx q[82],q[52];
-rz(pi/2147483648) q[52];
-rz(pi/1073741824) q[82];
-cx q[82],q[53];
-rz(-pi/1073741824) q[53];
-cx q[82],q[53];
-rz(pi/1073741824) q[53];
-rz(pi/536870912) q[82];
-cx q[82],q[54];
-rz(-pi/536870912) q[54];
-cx q[82],q[54];
-rz(pi/536870912) q[54];
-rz(pi/268435456) q[82];
-cx q[82],q[55];
-rz(-pi/268435456) q[55];
-cx q[82],q[55];
-rz(pi/268435456) q[55];
-rz(pi/134217728) q[82];
-cx q[82],q[56];
-rz(-pi/134217728) q[56];
-cx q[82],q[56];
-rz(pi/134217728) q[56];
-rz(pi/67108864) q[82];
-cx q[82],q[57];
-rz(-pi/67108864) q[57];
-cx q[82],q[57];
-rz(pi/67108864) q[57];
-rz(pi/33554432) q[82];
-cx q[82],q[58];
-rz(-pi/33554432) q[58];
-cx q[82],q[58];
-rz(pi/33554432) q[58];
-rz(pi/16777216) q[82];
-cx q[82],q[59];
-rz(-pi/16777216) q[59];
-cx q[82],q[59];
-rz(pi/16777216) q[59];
-rz(pi/8388608) q[82];
-cx q[82],q[60];
-rz(-pi/8388608) q[60];
-cx q[82],q[60];
-rz(pi/8388608) q[60];
-rz(pi/4194304) q[82];
-cx q[82],q[61];
-rz(-pi/4194304) q[61];
-cx q[82],q[61];
-rz(pi/4194304) q[61];
-rz(pi/2097152) q[82];
-cx q[82],q[62];
-rz(-pi/2097152) q[62];
-cx q[82],q[62];
-rz(pi/2097152) q[62];
-rz(pi/1048576) q[82];
-cx q[82],q[63];
-rz(-pi/1048576) q[63];
-cx q[82],q[63];
-rz(pi/1048576) q[63];
-rz(pi/524288) q[82];
-cx q[82],q[64];
-rz(-pi/524288) q[64];
-cx q[82],q[64];
-rz(pi/524288) q[64];
-rz(pi/262144) q[82];
-cx q[82],q[65];
-rz(-pi/262144) q[65];
-cx q[82],q[65];
-rz(pi/262144) q[65];
-rz(pi/131072) q[82];
-cx q[82],q[66];
-rz(-pi/131072) q[66];
-cx q[82],q[66];
-rz(pi/131072) q[66];
-rz(pi/65536) q[82];
-cx q[82],q[67];
-rz(-pi/65536) q[67];
-cx q[82],q[67];
-rz(pi/65536) q[67];
-rz(pi/32768) q[82];
-cx q[82],q[68];
-rz(-pi/32768) q[68];
-cx q[82],q[68];
-rz(pi/32768) q[68];
-rz(pi/16384) q[82];
-cx q[82],q[69];
-rz(-pi/16384) q[69];
-cx q[82],q[69];
-rz(pi/16384) q[69];
-rz(pi/8192) q[82];
-cx q[82],q[70];
-rz(-pi/8192) q[70];
-cx q[82],q[70];
-rz(pi/8192) q[70];
-rz(pi/4096) q[82];
-cx q[82],q[71];
-rz(-pi/4096) q[71];
-cx q[82],q[71];
-rz(pi/4096) q[71];
-rz(pi/2048) q[82];
-cx q[82],q[72];
-rz(-pi/2048) q[72];
-cx q[82],q[72];
-rz(pi/2048) q[72];
-rz(pi/1024) q[82];
-cx q[82],q[73];
-rz(-pi/1024) q[73];
-cx q[82],q[73];
-rz(pi/1024) q[73];
-rz(pi/512) q[82];
-cx q[82],q[74];
-rz(-pi/512) q[74];
-cx q[82],q[74];
-rz(pi/512) q[74];
-rz(pi/256) q[82];
-cx q[82],q[75];
-rz(-pi/256) q[75];
-cx q[82],q[75];
-rz(pi/256) q[75];
-rz(pi/128) q[82];
-cx q[82],q[76];
-rz(-pi/128) q[76];
-cx q[82],q[76];
-rz(pi/128) q[76];
-rz(pi/64) q[82];
-cx q[82],q[77];
-rz(-pi/64) q[77];
-cx q[82],q[77];
-rz(pi/64) q[77];
-rz(pi/32) q[82];
-cx q[82],q[78];
-rz(-pi/32) q[78];
-cx q[82],q[78];
-rz(pi/32) q[78];
-rz(pi/16) q[82];
-cx q[82],q[79];
-rz(-pi/16) q[79];
-cx q[82],q[79];
-rz(pi/16) q[79];
-rz(pi/8) q[82];
-cx q[82],q[80];
-rz(-pi/8) q[80];
-cx q[82],q[80];
-rz(pi/8) q[80];
-rz(pi/4) q[82];
-cx q[82],q[81];
-rz(-pi/4) q[81];
-cx q[82],q[81];
-rz(pi/4) q[81];
-rz(pi/2) q[82];
-sx q[82];
-rz(pi/2) q[82];
-rz(1.42863093678434e-12) q[83];
-cx q[83],q[43];
-rz(-1.42863093678434e-12) q[43];
-cx q[83],q[43];
-rz(1.42863093678434e-12) q[43];
-rz(2.85726187356867e-12) q[83];
-cx q[83],q[44];
-rz(-2.85726187356867e-12) q[44];
-cx q[83],q[44];
-rz(2.85726187356867e-12) q[44];
-rz(5.71452374713734e-12) q[83];
-cx q[83],q[45];
-rz(-5.71452374713734e-12) q[45];
-cx q[83],q[45];
-rz(5.71452374713734e-12) q[45];
-rz(1.14290474942747e-11) q[83];
-cx q[83],q[46];
-rz(-1.14290474942747e-11) q[46];
-cx q[83],q[46];
-rz(1.14290474942747e-11) q[46];
-rz(2.28580949885494e-11) q[83];
-cx q[83],q[47];
-rz(-2.28580949885494e-11) q[47];
-cx q[83],q[47];
-rz(2.28580949885494e-11) q[47];
-rz(4.57161899770987e-11) q[83];
-cx q[83],q[48];
-rz(-4.57161899770987e-11) q[48];
-cx q[83],q[48];
-rz(4.57161899770987e-11) q[48];
-rz(9.14323799541975e-11) q[83];
-cx q[83],q[49];
-rz(-9.14323799541975e-11) q[49];
-cx q[83],q[49];
-rz(9.14323799541975e-11) q[49];
-rz(1.82864759908395e-10) q[83];
-cx q[83],q[50];
-rz(-1.82864759908395e-10) q[50];
-cx q[83],q[50];
-rz(1.82864759908395e-10) q[50];
-rz(3.6572951981679e-10) q[83];
-cx q[83],q[51];
-rz(-3.6572951981679e-10) q[51];
-cx q[83],q[51];
-rz(3.6572951981679e-10) q[51];
-rz(7.3145903963358e-10) q[83];
-cx q[83],q[52];
-rz(-7.3145903963358e-10) q[52];
-cx q[83],q[52];
-rz(7.3145903963358e-10) q[52];
-rz(pi/2147483648) q[83];
-cx q[83],q[53];
-rz(-pi/2147483648) q[53];
-cx q[83],q[53];
-rz(pi/2147483648) q[53];
-rz(pi/1073741824) q[83];
-cx q[83],q[54];
-rz(-pi/1073741824) q[54];
-cx q[83],q[54];
-rz(pi/1073741824) q[54];
-rz(pi/536870912) q[83];
-cx q[83],q[55];
-rz(-pi/536870912) q[55];
-cx q[83],q[55];
-rz(pi/536870912) q[55];
-rz(pi/268435456) q[83];
-cx q[83],q[56];
-rz(-pi/268435456) q[56];
-cx q[83],q[56];
-rz(pi/268435456) q[56];
-rz(pi/134217728) q[83];
-cx q[83],q[57];
-rz(-pi/134217728) q[57];
-cx q[83],q[57];
-rz(pi/134217728) q[57];
-rz(pi/67108864) q[83];
-cx q[83],q[58];
-rz(-pi/67108864) q[58];
-cx q[83],q[58];
-rz(pi/67108864) q[58];
-rz(pi/33554432) q[83];
-cx q[83],q[59];
-rz(-pi/33554432) q[59];
-cx q[83],q[59];
-rz(pi/33554432) q[59];
-rz(pi/16777216) q[83];
-cx q[83],q[60];
-rz(-pi/16777216) q[60];
-cx q[83],q[60];
-rz(pi/16777216) q[60];
-rz(pi/8388608) q[83];
-cx q[83],q[61];
-rz(-pi/8388608) q[61];
-cx q[83],q[61];
-rz(pi/8388608) q[61];
-rz(pi/4194304) q[83];
-cx q[83],q[62];
-rz(-pi/4194304) q[62];
-cx q[83],q[62];
-rz(pi/4194304) q[62];
-rz(pi/2097152) q[83];
-cx q[83],q[63];
-rz(-pi/2097152) q[63];
-cx q[83],q[63];
-rz(pi/2097152) q[63];
-rz(pi/1048576) q[83];
-cx q[83],q[64];
-rz(-pi/1048576) q[64];
-cx q[83],q[64];
-rz(pi/1048576) q[64];
-rz(pi/524288) q[83];
-cx q[83],q[65];
-rz(-pi/524288) q[65];
-cx q[83],q[65];
-rz(pi/524288) q[65];
-rz(pi/262144) q[83];
-cx q[83],q[66];
-rz(-pi/262144) q[66];
-cx q[83],q[66];
-rz(pi/262144) q[66];
-rz(pi/131072) q[83];
-cx q[83],q[67];
-rz(-pi/131072) q[67];
-cx q[83],q[67];
-rz(pi/131072) q[67];
-rz(pi/65536) q[83];
-cx q[83],q[68];
-rz(-pi/65536) q[68];
-cx q[83],q[68];
-rz(pi/65536) q[68];
-rz(pi/32768) q[83];
-cx q[83],q[69];
-rz(-pi/32768) q[69];
-cx q[83],q[69];
-rz(pi/32768) q[69];
-rz(pi/16384) q[83];
-cx q[83],q[70];
-rz(-pi/16384) q[70];
-cx q[83],q[70];
-rz(pi/16384) q[70];
-rz(pi/8192) q[83];
-cx q[83],q[71];
-rz(-pi/8192) q[71];
-cx q[83],q[71];
-rz(pi/8192) q[71];
-rz(pi/4096) q[83];
-cx q[83],q[72];
-rz(-pi/4096) q[72];
-cx q[83],q[72];
-rz(pi/4096) q[72];
-rz(pi/2048) q[83];
-cx q[83],q[73];
-rz(-pi/2048) q[73];
-cx q[83],q[73];
-rz(pi/2048) q[73];
-rz(pi/1024) q[83];
-cx q[83],q[74];
-rz(-pi/1024) q[74];
-cx q[83],q[74];
-rz(pi/1024) q[74];
-rz(pi/512) q[83];
-cx q[83],q[75];
-rz(-pi/512) q[75];
-cx q[83],q[75];
-rz(pi/512) q[75];
-rz(pi/256) q[83];
-cx q[83],q[76];
-rz(-pi/256) q[76];
-cx q[83],q[76];
-rz(pi/256) q[76];
-rz(pi/128) q[83];
-cx q[83],q[77];
-rz(-pi/128) q[77];
-cx q[83],q[77];
-rz(pi/128) q[77];
-rz(pi/64) q[83];
-cx q[83],q[78];
-rz(-pi/64) q[78];
-cx q[83],q[78];
-rz(pi/64) q[78];
-rz(pi/32) q[83];
-cx q[83],q[79];
-rz(-pi/32) q[79];
-cx q[83],q[79];
-rz(pi/32) q[79];
-rz(pi/16) q[83];
-cx q[83],q[80];
-rz(-pi/16) q[80];
-cx q[83],q[80];
-rz(pi/16) q[80];
-rz(pi/8) q[83];
-cx q[83],q[81];
-rz(-pi/8) q[81];
-cx q[83],q[81];
-rz(pi/8) q[81];
-rz(pi/4) q[83];
-cx q[83],q[82];
-rz(-pi/4) q[82];
-cx q[83],q[82];
-rz(pi/4) q[82];
-rz(pi/2) q[83];
-sx q[83];
-rz(pi/2) q[83];
-rz(1.42863093678434e-12) q[84];
-cx q[84],q[44];
-rz(-1.42863093678434e-12) q[44];
-cx q[84],q[44];
-rz(1.42863093678434e-12) q[44];
-rz(2.85726187356867e-12) q[84];
-cx q[84],q[45];
-rz(-2.85726187356867e-12) q[45];
-cx q[84],q[45];
-rz(2.85726187356867e-12) q[45];
-rz(5.71452374713734e-12) q[84];
-cx q[84],q[46];
-rz(-5.71452374713734e-12) q[46];
-cx q[84],q[46];
-rz(5.71452374713734e-12) q[46];
-rz(1.14290474942747e-11) q[84];
-cx q[84],q[47];
-rz(-1.14290474942747e-11) q[47];
-cx q[84],q[47];
-rz(1.14290474942747e-11) q[47];
-rz(2.28580949885494e-11) q[84];
-cx q[84],q[48];
-rz(-2.28580949885494e-11) q[48];
-cx q[84],q[48];
-rz(2.28580949885494e-11) q[48];
-rz(4.57161899770987e-11) q[84];
-cx q[84],q[49];
-rz(-4.57161899770987e-11) q[49];
-cx q[84],q[49];
-rz(4.57161899770987e-11) q[49];
-rz(9.14323799541975e-11) q[84];
-cx q[84],q[50];
-rz(-9.14323799541975e-11) q[50];
-cx q[84],q[50];
-rz(9.14323799541975e-11) q[50];
-rz(1.82864759908395e-10) q[84];
-cx q[84],q[51];
-rz(-1.82864759908395e-10) q[51];
-cx q[84],q[51];
-rz(1.82864759908395e-10) q[51];
-rz(3.6572951981679e-10) q[84];
-cx q[84],q[52];
-rz(-3.6572951981679e-10) q[52];
-cx q[84],q[52];
-rz(3.6572951981679e-10) q[52];
-rz(7.3145903963358e-10) q[84];
-cx q[84],q[53];
-rz(-7.3145903963358e-10) q[53];
-cx q[84],q[53];
-rz(7.3145903963358e-10) q[53];
-rz(pi/2147483648) q[84];
-cx q[84],q[54];
-rz(-pi/2147483648) q[54];
-cx q[84],q[54];
-rz(pi/2147483648) q[54];
-rz(pi/1073741824) q[84];
-cx q[84],q[55];
-rz(-pi/1073741824) q[55];
-cx q[84],q[55];
-rz(pi/1073741824) q[55];
-rz(pi/536870912) q[84];
-cx q[84],q[56];
-rz(-pi/536870912) q[56];
-cx q[84],q[56];
-rz(pi/536870912) q[56];
-rz(pi/268435456) q[84];
-cx q[84],q[57];
-rz(-pi/268435456) q[57];
-cx q[84],q[57];
-rz(pi/268435456) q[57];
-rz(pi/134217728) q[84];
-cx q[84],q[58];
-rz(-pi/134217728) q[58];
-cx q[84],q[58];
-rz(pi/134217728) q[58];
-rz(pi/67108864) q[84];
-cx q[84],q[59];
-rz(-pi/67108864) q[59];
-cx q[84],q[59];
-rz(pi/67108864) q[59];
-rz(pi/33554432) q[84];
-cx q[84],q[60];
-rz(-pi/33554432) q[60];
-cx q[84],q[60];
-rz(pi/33554432) q[60];
-rz(pi/16777216) q[84];
-cx q[84],q[61];
-rz(-pi/16777216) q[61];
-cx q[84],q[61];
-rz(pi/16777216) q[61];
-rz(pi/8388608) q[84];
-cx q[84],q[62];
-rz(-pi/8388608) q[62];
-cx q[84],q[62];
-rz(pi/8388608) q[62];
-rz(pi/4194304) q[84];
-cx q[84],q[63];
-rz(-pi/4194304) q[63];
-cx q[84],q[63];
-rz(pi/4194304) q[63];
-rz(pi/2097152) q[84];
-cx q[84],q[64];
-rz(-pi/2097152) q[64];
-cx q[84],q[64];
-rz(pi/2097152) q[64];
-rz(pi/1048576) q[84];
-cx q[84],q[65];
-rz(-pi/1048576) q[65];
-cx q[84],q[65];
-rz(pi/1048576) q[65];
-rz(pi/524288) q[84];
-cx q[84],q[66];
-rz(-pi/524288) q[66];
-cx q[84],q[66];
-rz(pi/524288) q[66];
-rz(pi/262144) q[84];
-cx q[84],q[67];
-rz(-pi/262144) q[67];
-cx q[84],q[67];
-rz(pi/262144) q[67];
-rz(pi/131072) q[84];
-cx q[84],q[68];
-rz(-pi/131072) q[68];
-cx q[84],q[68];
-rz(pi/131072) q[68];
-rz(pi/65536) q[84];
-cx q[84],q[69];
-rz(-pi/65536) q[69];
-cx q[84],q[69];
-rz(pi/65536) q[69];
-rz(pi/32768) q[84];
-cx q[84],q[70];
-rz(-pi/32768) q[70];
-cx q[84],q[70];
-rz(pi/32768) q[70];
-rz(pi/16384) q[84];
-cx q[84],q[71];
-rz(-pi/16384) q[71];
-cx q[84],q[71];
-rz(pi/16384) q[71];
-rz(pi/8192) q[84];
-cx q[84],q[72];
-rz(-pi/8192) q[72];
-cx q[84],q[72];
-rz(pi/8192) q[72];
-rz(pi/4096) q[84];
-cx q[84],q[73];
-rz(-pi/4096) q[73];
-cx q[84],q[73];
-rz(pi/4096) q[73];
-rz(pi/2048) q[84];
-cx q[84],q[74];
-rz(-pi/2048) q[74];
-cx q[84],q[74];
-rz(pi/2048) q[74];
-rz(pi/1024) q[84];
-cx q[84],q[75];
-rz(-pi/1024) q[75];
-cx q[84],q[75];
-rz(pi/1024) q[75];
-rz(pi/512) q[84];
-cx q[84],q[76];
-rz(-pi/512) q[76];
-cx q[84],q[76];
-rz(pi/512) q[76];
-rz(pi/256) q[84];
-cx q[84],q[77];
-rz(-pi/256) q[77];
-cx q[84],q[77];
-rz(pi/256) q[77];
-rz(pi/128) q[84];
-cx q[84],q[78];
-rz(-pi/128) q[78];
-cx q[84],q[78];
-rz(pi/128) q[78];
-rz(pi/64) q[84];
-cx q[84],q[79];
-rz(-pi/64) q[79];
-cx q[84],q[79];
-rz(pi/64) q[79];
-rz(pi/32) q[84];
-cx q[84],q[80];
-rz(-pi/32) q[80];
-cx q[84],q[80];
-rz(pi/32) q[80];
-rz(pi/16) q[84];
-cx q[84],q[81];
-rz(-pi/16) q[81];
-cx q[84],q[81];
-rz(pi/16) q[81];
-rz(pi/8) q[84];
-cx q[84],q[82];
-rz(-pi/8) q[82];
-cx q[84],q[82];
-rz(pi/8) q[82];
-rz(pi/4) q[84];
-cx q[84],q[83];
-rz(-pi/4) q[83];
-cx q[84],q[83];
-rz(pi/4) q[83];
-rz(pi/2) q[84];
-sx q[84];
-rz(pi/2) q[84];
-rz(1.42863093678434e-12) q[85];
-cx q[85],q[45];
-rz(-1.42863093678434e-12) q[45];
-cx q[85],q[45];
-rz(1.42863093678434e-12) q[45];
-rz(2.85726187356867e-12) q[85];
-cx q[85],q[46];
-rz(-2.85726187356867e-12) q[46];
-cx q[85],q[46];
-rz(2.85726187356867e-12) q[46];
-rz(5.71452374713734e-12) q[85];
-cx q[85],q[47];
-rz(-5.71452374713734e-12) q[47];
-cx q[85],q[47];
-rz(5.71452374713734e-12) q[47];
-rz(1.14290474942747e-11) q[85];
-cx q[85],q[48];
-rz(-1.14290474942747e-11) q[48];
-cx q[85],q[48];
-rz(1.14290474942747e-11) q[48];
-rz(2.28580949885494e-11) q[85];
-cx q[85],q[49];
-rz(-2.28580949885494e-11) q[49];
-cx q[85],q[49];
-rz(2.28580949885494e-11) q[49];
-rz(4.57161899770987e-11) q[85];
-cx q[85],q[50];
-rz(-4.57161899770987e-11) q[50];
-cx q[85],q[50];
-rz(4.57161899770987e-11) q[50];
-rz(9.14323799541975e-11) q[85];
-cx q[85],q[51];
-rz(-9.14323799541975e-11) q[51];
-cx q[85],q[51];
-rz(9.14323799541975e-11) q[51];
-rz(1.82864759908395e-10) q[85];
-cx q[85],q[52];
-rz(-1.82864759908395e-10) q[52];
-cx q[85],q[52];
-rz(1.82864759908395e-10) q[52];
-rz(3.6572951981679e-10) q[85];
-cx q[85],q[53];
-rz(-3.6572951981679e-10) q[53];
-cx q[85],q[53];
-rz(3.6572951981679e-10) q[53];
-rz(7.3145903963358e-10) q[85];
-cx q[85],q[54];
-rz(-7.3145903963358e-10) q[54];
-cx q[85],q[54];
-rz(7.3145903963358e-10) q[54];
-rz(pi/2147483648) q[85];
-cx q[85],q[55];
-rz(-pi/2147483648) q[55];
-cx q[85],q[55];
-rz(pi/2147483648) q[55];
-rz(pi/1073741824) q[85];
-cx q[85],q[56];
-rz(-pi/1073741824) q[56];
-cx q[85],q[56];
-rz(pi/1073741824) q[56];
-rz(pi/536870912) q[85];
-cx q[85],q[57];
-rz(-pi/536870912) q[57];
-cx q[85],q[57];
-rz(pi/536870912) q[57];
-rz(pi/268435456) q[85];
-cx q[85],q[58];
-rz(-pi/268435456) q[58];
-cx q[85],q[58];
-rz(pi/268435456) q[58];
-rz(pi/134217728) q[85];
-cx q[85],q[59];
-rz(-pi/134217728) q[59];
-cx q[85],q[59];
-rz(pi/134217728) q[59];
-rz(pi/67108864) q[85];
-cx q[85],q[60];
-rz(-pi/67108864) q[60];
-cx q[85],q[60];
-rz(pi/67108864) q[60];
-rz(pi/33554432) q[85];
-cx q[85],q[61];
-rz(-pi/33554432) q[61];
-cx q[85],q[61];
-rz(pi/33554432) q[61];
-rz(pi/16777216) q[85];
-cx q[85],q[62];
-rz(-pi/16777216) q[62];
-cx q[85],q[62];
-rz(pi/16777216) q[62];
-rz(pi/8388608) q[85];
-cx q[85],q[63];
-rz(-pi/8388608) q[63];
-cx q[85],q[63];
-rz(pi/8388608) q[63];
-rz(pi/4194304) q[85];
-cx q[85],q[64];
-rz(-pi/4194304) q[64];
-cx q[85],q[64];
-rz(pi/4194304) q[64];
-rz(pi/2097152) q[85];
-cx q[85],q[65];
-rz(-pi/2097152) q[65];
-cx q[85],q[65];
-rz(pi/2097152) q[65];
-rz(pi/1048576) q[85];
-cx q[85],q[66];
-rz(-pi/1048576) q[66];
-cx q[85],q[66];
-rz(pi/1048576) q[66];
-rz(pi/524288) q[85];
-cx q[85],q[67];
-rz(-pi/524288) q[67];
-cx q[85],q[67];
-rz(pi/524288) q[67];
-rz(pi/262144) q[85];
-cx q[85],q[68];
-rz(-pi/262144) q[68];
-cx q[85],q[68];
-rz(pi/262144) q[68];
-rz(pi/131072) q[85];
-cx q[85],q[69];
-rz(-pi/131072) q[69];
-cx q[85],q[69];
-rz(pi/131072) q[69];
-rz(pi/65536) q[85];
-cx q[85],q[70];
-rz(-pi/65536) q[70];
-cx q[85],q[70];
-rz(pi/65536) q[70];
-rz(pi/32768) q[85];
-cx q[85],q[71];
-rz(-pi/32768) q[71];
-cx q[85],q[71];
-rz(pi/32768) q[71];
-rz(pi/16384) q[85];
-cx q[85],q[72];
-rz(-pi/16384) q[72];
-cx q[85],q[72];
-rz(pi/16384) q[72];
-rz(pi/8192) q[85];
-cx q[85],q[73];
-rz(-pi/8192) q[73];
-cx q[85],q[73];
-rz(pi/8192) q[73];
-rz(pi/4096) q[85];
-cx q[85],q[74];
-rz(-pi/4096) q[74];
-cx q[85],q[74];
-rz(pi/4096) q[74];
-rz(pi/2048) q[85];
-cx q[85],q[75];
-rz(-pi/2048) q[75];
-cx q[85],q[75];
-rz(pi/2048) q[75];
-rz(pi/1024) q[85];
-cx q[85],q[76];
-rz(-pi/1024) q[76];
-cx q[85],q[76];
-rz(pi/1024) q[76];
-rz(pi/512) q[85];
-cx q[85],q[77];
-rz(-pi/512) q[77];
-cx q[85],q[77];
-rz(pi/512) q[77];
-rz(pi/256) q[85];
-cx q[85],q[78];
-rz(-pi/256) q[78];
-cx q[85],q[78];
-rz(pi/256) q[78];
-rz(pi/128) q[85];
-cx q[85],q[79];
-rz(-pi/128) q[79];
-cx q[85],q[79];
-rz(pi/128) q[79];
-rz(pi/64) q[85];
-cx q[85],q[80];
-rz(-pi/64) q[80];
-cx q[85],q[80];
-rz(pi/64) q[80];
-rz(pi/32) q[85];
-cx q[85],q[81];
-rz(-pi/32) q[81];
-cx q[85],q[81];
-rz(pi/32) q[81];
-rz(pi/16) q[85];
-cx q[85],q[82];
-rz(-pi/16) q[82];
-cx q[85],q[82];
-rz(pi/16) q[82];
-rz(pi/8) q[85];
-cx q[85],q[83];
-rz(-pi/8) q[83];
-cx q[85],q[83];
-rz(pi/8) q[83];
-rz(pi/4) q[85];
-cx q[85],q[84];
-rz(-pi/4) q[84];
-cx q[85],q[84];
-rz(pi/4) q[84];
-rz(pi/2) q[85];
-sx q[85];
-rz(pi/2) q[85];
-rz(1.42863093678434e-12) q[86];
-cx q[86],q[46];
-rz(-1.42863093678434e-12) q[46];
-cx q[86],q[46];
-rz(1.42863093678434e-12) q[46];
-rz(2.85726187356867e-12) q[86];
-cx q[86],q[47];
-rz(-2.85726187356867e-12) q[47];
-cx q[86],q[47];
-rz(2.85726187356867e-12) q[47];
-rz(5.71452374713734e-12) q[86];
-cx q[86],q[48];
-rz(-5.71452374713734e-12) q[48];
-cx q[86],q[48];
-rz(5.71452374713734e-12) q[48];
-rz(1.14290474942747e-11) q[86];
-cx q[86],q[49];
-rz(-1.14290474942747e-11) q[49];
-cx q[86],q[49];
-rz(1.14290474942747e-11) q[49];
-rz(2.28580949885494e-11) q[86];
-cx q[86],q[50];
-rz(-2.28580949885494e-11) q[50];
-cx q[86],q[50];
-rz(2.28580949885494e-11) q[50];
-rz(4.57161899770987e-11) q[86];
-cx q[86],q[51];
-rz(-4.57161899770987e-11) q[51];
-cx q[86],q[51];
-rz(4.57161899770987e-11) q[51];
-rz(9.14323799541975e-11) q[86];
-cx q[86],q[52];
-rz(-9.14323799541975e-11) q[52];
-cx q[86],q[52];
-rz(9.14323799541975e-11) q[52];
-rz(1.82864759908395e-10) q[86];
-cx q[86],q[53];
-rz(-1.82864759908395e-10) q[53];
-cx q[86],q[53];
-rz(1.82864759908395e-10) q[53];
-rz(3.6572951981679e-10) q[86];
-cx q[86],q[54];
-rz(-3.6572951981679e-10) q[54];
-cx q[86],q[54];
-rz(3.6572951981679e-10) q[54];
-rz(7.3145903963358e-10) q[86];
-cx q[86],q[55];
-rz(-7.3145903963358e-10) q[55];
-cx q[86],q[55];
-rz(7.3145903963358e-10) q[55];
-rz(pi/2147483648) q[86];
-cx q[86],q[56];
-rz(-pi/2147483648) q[56];
-cx q[86],q[56];
-rz(pi/2147483648) q[56];
-rz(pi/1073741824) q[86];
-cx q[86],q[57];
-rz(-pi/1073741824) q[57];
-cx q[86],q[57];
-rz(pi/1073741824) q[57];
-rz(pi/536870912) q[86];
-cx q[86],q[58];
-rz(-pi/536870912) q[58];
-cx q[86],q[58];
-rz(pi/536870912) q[58];
-rz(pi/268435456) q[86];
-cx q[86],q[59];
-rz(-pi/268435456) q[59];
-cx q[86],q[59];
-rz(pi/268435456) q[59];
-rz(pi/134217728) q[86];
-cx q[86],q[60];
-rz(-pi/134217728) q[60];
-cx q[86],q[60];
-rz(pi/134217728) q[60];
-rz(pi/67108864) q[86];
-cx q[86],q[61];
-rz(-pi/67108864) q[61];
-cx q[86],q[61];
-rz(pi/67108864) q[61];
-rz(pi/33554432) q[86];
-cx q[86],q[62];
-rz(-pi/33554432) q[62];
-cx q[86],q[62];
-rz(pi/33554432) q[62];
-rz(pi/16777216) q[86];
-cx q[86],q[63];
-rz(-pi/16777216) q[63];
-cx q[86],q[63];
-rz(pi/16777216) q[63];
-rz(pi/8388608) q[86];
-cx q[86],q[64];
-rz(-pi/8388608) q[64];
-cx q[86],q[64];
-rz(pi/8388608) q[64];
-rz(pi/4194304) q[86];
-cx q[86],q[65];
-rz(-pi/4194304) q[65];
-cx q[86],q[65];
-rz(pi/4194304) q[65];
-rz(pi/2097152) q[86];
-cx q[86],q[66];
-rz(-pi/2097152) q[66];
-cx q[86],q[66];
-rz(pi/2097152) q[66];
-rz(pi/1048576) q[86];
-cx q[86],q[67];
-rz(-pi/1048576) q[67];
-cx q[86],q[67];
-rz(pi/1048576) q[67];
-rz(pi/524288) q[86];
-cx q[86],q[68];
-rz(-pi/524288) q[68];
-cx q[86],q[68];
-rz(pi/524288) q[68];
-rz(pi/262144) q[86];
-cx q[86],q[69];
-rz(-pi/262144) q[69];
-cx q[86],q[69];
-rz(pi/262144) q[69];
-rz(pi/131072) q[86];
-cx q[86],q[70];
-rz(-pi/131072) q[70];
-cx q[86],q[70];
-rz(pi/131072) q[70];
-rz(pi/65536) q[86];
-cx q[86],q[71];
-rz(-pi/65536) q[71];
-cx q[86],q[71];
-rz(pi/65536) q[71];
-rz(pi/32768) q[86];
-cx q[86],q[72];
-rz(-pi/32768) q[72];
-cx q[86],q[72];
-rz(pi/32768) q[72];
-rz(pi/16384) q[86];
-cx q[86],q[73];
-rz(-pi/16384) q[73];
-cx q[86],q[73];
-rz(pi/16384) q[73];
-rz(pi/8192) q[86];
-cx q[86],q[74];
-rz(-pi/8192) q[74];
-cx q[86],q[74];
-rz(pi/8192) q[74];
-rz(pi/4096) q[86];
-cx q[86],q[75];
-rz(-pi/4096) q[75];
-cx q[86],q[75];
-rz(pi/4096) q[75];
-rz(pi/2048) q[86];
-cx q[86],q[76];
-rz(-pi/2048) q[76];
-cx q[86],q[76];
-rz(pi/2048) q[76];
-rz(pi/1024) q[86];
-cx q[86],q[77];
-rz(-pi/1024) q[77];
-cx q[86],q[77];
-rz(pi/1024) q[77];
-rz(pi/512) q[86];
-cx q[86],q[78];
-rz(-pi/512) q[78];
-cx q[86],q[78];
-rz(pi/512) q[78];
-rz(pi/256) q[86];
-cx q[86],q[79];
-rz(-pi/256) q[79];
-cx q[86],q[79];
-rz(pi/256) q[79];
-rz(pi/128) q[86];
-cx q[86],q[80];
-rz(-pi/128) q[80];
-cx q[86],q[80];
-rz(pi/128) q[80];
-rz(pi/64) q[86];
-cx q[86],q[81];
-rz(-pi/64) q[81];
-cx q[86],q[81];
-rz(pi/64) q[81];
-rz(pi/32) q[86];
-cx q[86],q[82];
-rz(-pi/32) q[82];
-cx q[86],q[82];
-rz(pi/32) q[82];
-rz(pi/16) q[86];
-cx q[86],q[83];
-rz(-pi/16) q[83];
-cx q[86],q[83];
-rz(pi/16) q[83];
-rz(pi/8) q[86];
-cx q[86],q[84];
-rz(-pi/8) q[84];
-cx q[86],q[84];
-rz(pi/8) q[84];
-rz(pi/4) q[86];
-cx q[86],q[85];
-rz(-pi/4) q[85];
-cx q[86],q[85];
-rz(pi/4) q[85];
-rz(pi/2) q[86];
-sx q[86];
-rz(pi/2) q[86];
-rz(1.42863093678434e-12) q[87];
-cx q[87],q[47];
-rz(-1.42863093678434e-12) q[47];
-cx q[87],q[47];
-rz(1.42863093678434e-12) q[47];
-rz(2.85726187356867e-12) q[87];
-cx q[87],q[48];
-rz(-2.85726187356867e-12) q[48];
-cx q[87],q[48];
-rz(2.85726187356867e-12) q[48];
-rz(5.71452374713734e-12) q[87];
-cx q[87],q[49];
-rz(-5.71452374713734e-12) q[49];
-cx q[87],q[49];
-rz(5.71452374713734e-12) q[49];
-rz(1.14290474942747e-11) q[87];
-cx q[87],q[50];
-rz(-1.14290474942747e-11) q[50];
-cx q[87],q[50];
-rz(1.14290474942747e-11) q[50];
-rz(2.28580949885494e-11) q[87];
-cx q[87],q[51];
-rz(-2.28580949885494e-11) q[51];
-cx q[87],q[51];
-rz(2.28580949885494e-11) q[51];
-rz(4.57161899770987e-11) q[87];
-cx q[87],q[52];
-rz(-4.57161899770987e-11) q[52];
-cx q[87],q[52];
-rz(4.57161899770987e-11) q[52];
-rz(9.14323799541975e-11) q[87];
-cx q[87],q[53];
-rz(-9.14323799541975e-11) q[53];
-cx q[87],q[53];
-rz(9.14323799541975e-11) q[53];
-rz(1.82864759908395e-10) q[87];
-cx q[87],q[54];
-rz(-1.82864759908395e-10) q[54];
-cx q[87],q[54];
-rz(1.82864759908395e-10) q[54];
-rz(3.6572951981679e-10) q[87];
-cx q[87],q[55];
-rz(-3.6572951981679e-10) q[55];
-cx q[87],q[55];
-rz(3.6572951981679e-10) q[55];
-rz(7.3145903963358e-10) q[87];
-cx q[87],q[56];
-rz(-7.3145903963358e-10) q[56];
-cx q[87],q[56];
-rz(7.3145903963358e-10) q[56];
-rz(pi/2147483648) q[87];
-cx q[87],q[57];
-rz(-pi/2147483648) q[57];
-cx q[87],q[57];
-rz(pi/2147483648) q[57];
-rz(pi/1073741824) q[87];
-cx q[87],q[58];
-rz(-pi/1073741824) q[58];
-cx q[87],q[58];
-rz(pi/1073741824) q[58];
-rz(pi/536870912) q[87];
-cx q[87],q[59];
-rz(-pi/536870912) q[59];
-cx q[87],q[59];
-rz(pi/536870912) q[59];
-rz(pi/268435456) q[87];
-cx q[87],q[60];
-rz(-pi/268435456) q[60];
-cx q[87],q[60];
-rz(pi/268435456) q[60];
-rz(pi/134217728) q[87];
-cx q[87],q[61];
-rz(-pi/134217728) q[61];
-cx q[87],q[61];
-rz(pi/134217728) q[61];
-rz(pi/67108864) q[87];
-cx q[87],q[62];
-rz(-pi/67108864) q[62];
-cx q[87],q[62];
-rz(pi/67108864) q[62];
-rz(pi/33554432) q[87];
-cx q[87],q[63];
-rz(-pi/33554432) q[63];
-cx q[87],q[63];
-rz(pi/33554432) q[63];
-rz(pi/16777216) q[87];
-cx q[87],q[64];
-rz(-pi/16777216) q[64];
-cx q[87],q[64];
-rz(pi/16777216) q[64];
-rz(pi/8388608) q[87];
-cx q[87],q[65];
-rz(-pi/8388608) q[65];
-cx q[87],q[65];
-rz(pi/8388608) q[65];
-rz(pi/4194304) q[87];
-cx q[87],q[66];
-rz(-pi/4194304) q[66];
-cx q[87],q[66];
-rz(pi/4194304) q[66];
-rz(pi/2097152) q[87];
-cx q[87],q[67];
-rz(-pi/2097152) q[67];
-cx q[87],q[67];
-rz(pi/2097152) q[67];
-rz(pi/1048576) q[87];
-cx q[87],q[68];
-rz(-pi/1048576) q[68];
-cx q[87],q[68];
-rz(pi/1048576) q[68];
-rz(pi/524288) q[87];
-cx q[87],q[69];
-rz(-pi/524288) q[69];
-cx q[87],q[69];
-rz(pi/524288) q[69];
-rz(pi/262144) q[87];
-cx q[87],q[70];
-rz(-pi/262144) q[70];
-cx q[87],q[70];
-rz(pi/262144) q[70];
-rz(pi/131072) q[87];
-cx q[87],q[71];
-rz(-pi/131072) q[71];
-cx q[87],q[71];
-rz(pi/131072) q[71];
-rz(pi/65536) q[87];
-cx q[87],q[72];
-rz(-pi/65536) q[72];
-cx q[87],q[72];
-rz(pi/65536) q[72];
-rz(pi/32768) q[87];
-cx q[87],q[73];
-rz(-pi/32768) q[73];
-cx q[87],q[73];
-rz(pi/32768) q[73];
-rz(pi/16384) q[87];
-cx q[87],q[74];
-rz(-pi/16384) q[74];
-cx q[87],q[74];
-rz(pi/16384) q[74];
-rz(pi/8192) q[87];
-cx q[87],q[75];
-rz(-pi/8192) q[75];
-cx q[87],q[75];
-rz(pi/8192) q[75];
-rz(pi/4096) q[87];
-cx q[87],q[76];
-rz(-pi/4096) q[76];
-cx q[87],q[76];
-rz(pi/4096) q[76];
-rz(pi/2048) q[87];
-cx q[87],q[77];
-rz(-pi/2048) q[77];
-cx q[87],q[77];
-rz(pi/2048) q[77];
-rz(pi/1024) q[87];
-cx q[87],q[78];
-rz(-pi/1024) q[78];
-cx q[87],q[78];
-rz(pi/1024) q[78];
-rz(pi/512) q[87];
-cx q[87],q[79];
-rz(-pi/512) q[79];
-cx q[87],q[79];
-rz(pi/512) q[79];
-rz(pi/256) q[87];
-cx q[87],q[80];
-rz(-pi/256) q[80];
-cx q[87],q[80];
-rz(pi/256) q[80];
-rz(pi/128) q[87];
-cx q[87],q[81];
-rz(-pi/128) q[81];
-cx q[87],q[81];
-rz(pi/128) q[81];
-rz(pi/64) q[87];
-cx q[87],q[82];
-rz(-pi/64) q[82];
-cx q[87],q[82];
-rz(pi/64) q[82];
-rz(pi/32) q[87];
-cx q[87],q[83];
-rz(-pi/32) q[83];
-cx q[87],q[83];
-rz(pi/32) q[83];
-rz(pi/16) q[87];
-cx q[87],q[84];
-rz(-pi/16) q[84];
-cx q[87],q[84];
-rz(pi/16) q[84];
-rz(pi/8) q[87];
-cx q[87],q[85];
-rz(-pi/8) q[85];
-cx q[87],q[85];
-rz(pi/8) q[85];
-rz(pi/4) q[87];
-cx q[87],q[86];
-rz(-pi/4) q[86];
-cx q[87],q[86];
-rz(pi/4) q[86];
-rz(pi/2) q[87];
-sx q[87];
-rz(pi/2) q[87];
-rz(1.42863093678434e-12) q[88];
-cx q[88],q[48];
-rz(-1.42863093678434e-12) q[48];
-cx q[88],q[48];
-rz(1.42863093678434e-12) q[48];
-rz(2.85726187356867e-12) q[88];
-cx q[88],q[49];
-rz(-2.85726187356867e-12) q[49];
-cx q[88],q[49];
-rz(2.85726187356867e-12) q[49];
-rz(5.71452374713734e-12) q[88];
-cx q[88],q[50];
-rz(-5.71452374713734e-12) q[50];
-cx q[88],q[50];
-rz(5.71452374713734e-12) q[50];
-rz(1.14290474942747e-11) q[88];
-cx q[88],q[51];
-rz(-1.14290474942747e-11) q[51];
-cx q[88],q[51];
-rz(1.14290474942747e-11) q[51];
-rz(2.28580949885494e-11) q[88];
-cx q[88],q[52];
-rz(-2.28580949885494e-11) q[52];
-cx q[88],q[52];
-rz(2.28580949885494e-11) q[52];
-rz(4.57161899770987e-11) q[88];
-cx q[88],q[53];
-rz(-4.57161899770987e-11) q[53];
-cx q[88],q[53];
-rz(4.57161899770987e-11) q[53];
-rz(9.14323799541975e-11) q[88];
-cx q[88],q[54];
-rz(-9.14323799541975e-11) q[54];
-cx q[88],q[54];
-rz(9.14323799541975e-11) q[54];
-rz(1.82864759908395e-10) q[88];
-cx q[88],q[55];
-rz(-1.82864759908395e-10) q[55];
-cx q[88],q[55];
-rz(1.82864759908395e-10) q[55];
-rz(3.6572951981679e-10) q[88];
-cx q[88],q[56];
-rz(-3.6572951981679e-10) q[56];
-cx q[88],q[56];
-rz(3.6572951981679e-10) q[56];
-rz(7.3145903963358e-10) q[88];
-cx q[88],q[57];
-rz(-7.3145903963358e-10) q[57];
-cx q[88],q[57];
-rz(7.3145903963358e-10) q[57];
-rz(pi/2147483648) q[88];
-cx q[88],q[58];
-rz(-pi/2147483648) q[58];
-cx q[88],q[58];
-rz(pi/2147483648) q[58];
-rz(pi/1073741824) q[88];
-cx q[88],q[59];
-rz(-pi/1073741824) q[59];
-cx q[88],q[59];
-rz(pi/1073741824) q[59];
-rz(pi/536870912) q[88];
-cx q[88],q[60];
-rz(-pi/536870912) q[60];
-cx q[88],q[60];
-rz(pi/536870912) q[60];
-rz(pi/268435456) q[88];
-cx q[88],q[61];
-rz(-pi/268435456) q[61];
-cx q[88],q[61];
-rz(pi/268435456) q[61];
-rz(pi/134217728) q[88];
-cx q[88],q[62];
-rz(-pi/134217728) q[62];
-cx q[88],q[62];
-rz(pi/134217728) q[62];
-rz(pi/67108864) q[88];
-cx q[88],q[63];
-rz(-pi/67108864) q[63];
-cx q[88],q[63];
-rz(pi/67108864) q[63];
-rz(pi/33554432) q[88];
-cx q[88],q[64];
-rz(-pi/33554432) q[64];
-cx q[88],q[64];
-rz(pi/33554432) q[64];
-rz(pi/16777216) q[88];
-cx q[88],q[65];
-rz(-pi/16777216) q[65];
-cx q[88],q[65];
-rz(pi/16777216) q[65];
-rz(pi/8388608) q[88];
-cx q[88],q[66];
-rz(-pi/8388608) q[66];
-cx q[88],q[66];
-rz(pi/8388608) q[66];
-rz(pi/4194304) q[88];
-cx q[88],q[67];
-rz(-pi/4194304) q[67];
-cx q[88],q[67];
-rz(pi/4194304) q[67];
-rz(pi/2097152) q[88];
-cx q[88],q[68];
-rz(-pi/2097152) q[68];
-cx q[88],q[68];
-rz(pi/2097152) q[68];
-rz(pi/1048576) q[88];
-cx q[88],q[69];
-rz(-pi/1048576) q[69];
-cx q[88],q[69];
-rz(pi/1048576) q[69];
-rz(pi/524288) q[88];
-cx q[88],q[70];
-rz(-pi/524288) q[70];
-cx q[88],q[70];
-rz(pi/524288) q[70];
-rz(pi/262144) q[88];
-cx q[88],q[71];
-rz(-pi/262144) q[71];
-cx q[88],q[71];
-rz(pi/262144) q[71];
-rz(pi/131072) q[88];
-cx q[88],q[72];
-rz(-pi/131072) q[72];
-cx q[88],q[72];
-rz(pi/131072) q[72];
-rz(pi/65536) q[88];
-cx q[88],q[73];
-rz(-pi/65536) q[73];
-cx q[88],q[73];
-rz(pi/65536) q[73];
-rz(pi/32768) q[88];
-cx q[88],q[74];
-rz(-pi/32768) q[74];
-cx q[88],q[74];
-rz(pi/32768) q[74];
-rz(pi/16384) q[88];
-cx q[88],q[75];
-rz(-pi/16384) q[75];
-cx q[88],q[75];
-rz(pi/16384) q[75];
-rz(pi/8192) q[88];
-cx q[88],q[76];
-rz(-pi/8192) q[76];
-cx q[88],q[76];
-rz(pi/8192) q[76];
-rz(pi/4096) q[88];
-cx q[88],q[77];
-rz(-pi/4096) q[77];
-cx q[88],q[77];
-rz(pi/4096) q[77];
-rz(pi/2048) q[88];
-cx q[88],q[78];
-rz(-pi/2048) q[78];
-cx q[88],q[78];
-rz(pi/2048) q[78];
-rz(pi/1024) q[88];
-cx q[88],q[79];
-rz(-pi/1024) q[79];
-cx q[88],q[79];
-rz(pi/1024) q[79];
-rz(pi/512) q[88];
-cx q[88],q[80];
-rz(-pi/512) q[80];
-cx q[88],q[80];
-rz(pi/512) q[80];
-rz(pi/256) q[88];
-cx q[88],q[81];
-rz(-pi/256) q[81];
-cx q[88],q[81];
-rz(pi/256) q[81];
-rz(pi/128) q[88];
-cx q[88],q[82];
-rz(-pi/128) q[82];
-cx q[88],q[82];
-rz(pi/128) q[82];
-rz(pi/64) q[88];
-cx q[88],q[83];
-rz(-pi/64) q[83];
-cx q[88],q[83];
-rz(pi/64) q[83];
-rz(pi/32) q[88];
-cx q[88],q[84];
-rz(-pi/32) q[84];
-cx q[88],q[84];
-rz(pi/32) q[84];
-rz(pi/16) q[88];
-cx q[88],q[85];
-rz(-pi/16) q[85];
-cx q[88],q[85];
-rz(pi/16) q[85];
-rz(pi/8) q[88];
-cx q[88],q[86];
-rz(-pi/8) q[86];
-cx q[88],q[86];
-rz(pi/8) q[86];
-rz(pi/4) q[88];
-cx q[88],q[87];
-rz(-pi/4) q[87];
-cx q[88],q[87];
-rz(pi/4) q[87];
-rz(pi/2) q[88];
-sx q[88];
-rz(pi/2) q[88];
-rz(1.42863093678434e-12) q[89];
-cx q[89],q[49];
-rz(-1.42863093678434e-12) q[49];
-cx q[89],q[49];
-rz(1.42863093678434e-12) q[49];
-rz(2.85726187356867e-12) q[89];
-cx q[89],q[50];
-rz(-2.85726187356867e-12) q[50];
-cx q[89],q[50];
-rz(2.85726187356867e-12) q[50];
-rz(5.71452374713734e-12) q[89];
-cx q[89],q[51];
-rz(-5.71452374713734e-12) q[51];
-cx q[89],q[51];
-rz(5.71452374713734e-12) q[51];
-rz(1.14290474942747e-11) q[89];
-cx q[89],q[52];
-rz(-1.14290474942747e-11) q[52];
-cx q[89],q[52];
-rz(1.14290474942747e-11) q[52];
-rz(2.28580949885494e-11) q[89];
-cx q[89],q[53];
-rz(-2.28580949885494e-11) q[53];
-cx q[89],q[53];
-rz(2.28580949885494e-11) q[53];
-rz(4.57161899770987e-11) q[89];
-cx q[89],q[54];
-rz(-4.57161899770987e-11) q[54];
-cx q[89],q[54];
-rz(4.57161899770987e-11) q[54];
-rz(9.14323799541975e-11) q[89];
-cx q[89],q[55];
-rz(-9.14323799541975e-11) q[55];
-cx q[89],q[55];
-rz(9.14323799541975e-11) q[55];
-rz(1.82864759908395e-10) q[89];
-cx q[89],q[56];
-rz(-1.82864759908395e-10) q[56];
-cx q[89],q[56];
-rz(1.82864759908395e-10) q[56];
-rz(3.6572951981679e-10) q[89];
-cx q[89],q[57];
-rz(-3.6572951981679e-10) q[57];
-cx q[89],q[57];
-rz(3.6572951981679e-10) q[57];
-rz(7.3145903963358e-10) q[89];
-cx q[89],q[58];
-rz(-7.3145903963358e-10) q[58];
-cx q[89],q[58];
-rz(7.3145903963358e-10) q[58];
-rz(pi/2147483648) q[89];
-cx q[89],q[59];
-rz(-pi/2147483648) q[59];
-cx q[89],q[59];
-rz(pi/2147483648) q[59];
-rz(pi/1073741824) q[89];
-cx q[89],q[60];
-rz(-pi/1073741824) q[60];
-cx q[89],q[60];
-rz(pi/1073741824) q[60];
-rz(pi/536870912) q[89];
-cx q[89],q[61];
-rz(-pi/536870912) q[61];
-cx q[89],q[61];
-rz(pi/536870912) q[61];
-rz(pi/268435456) q[89];
-cx q[89],q[62];
-rz(-pi/268435456) q[62];
-cx q[89],q[62];
-rz(pi/268435456) q[62];
-rz(pi/134217728) q[89];
-cx q[89],q[63];
-rz(-pi/134217728) q[63];
-cx q[89],q[63];
-rz(pi/134217728) q[63];
-rz(pi/67108864) q[89];
-cx q[89],q[64];
-rz(-pi/67108864) q[64];
-cx q[89],q[64];
-rz(pi/67108864) q[64];
-rz(pi/33554432) q[89];
-cx q[89],q[65];
-rz(-pi/33554432) q[65];
-cx q[89],q[65];
-rz(pi/33554432) q[65];
-rz(pi/16777216) q[89];
-cx q[89],q[66];
-rz(-pi/16777216) q[66];
-cx q[89],q[66];
-rz(pi/16777216) q[66];
-rz(pi/8388608) q[89];
-cx q[89],q[67];
-rz(-pi/8388608) q[67];
-cx q[89],q[67];
-rz(pi/8388608) q[67];
-rz(pi/4194304) q[89];
-cx q[89],q[68];
-rz(-pi/4194304) q[68];
-cx q[89],q[68];
-rz(pi/4194304) q[68];
-rz(pi/2097152) q[89];
-cx q[89],q[69];
-rz(-pi/2097152) q[69];
-cx q[89],q[69];
-rz(pi/2097152) q[69];
-rz(pi/1048576) q[89];
-cx q[89],q[70];
-rz(-pi/1048576) q[70];
-cx q[89],q[70];
-rz(pi/1048576) q[70];
-rz(pi/524288) q[89];
-cx q[89],q[71];
-rz(-pi/524288) q[71];
-cx q[89],q[71];
-rz(pi/524288) q[71];
-rz(pi/262144) q[89];
-cx q[89],q[72];
-rz(-pi/262144) q[72];
-cx q[89],q[72];
-rz(pi/262144) q[72];
-rz(pi/131072) q[89];
-cx q[89],q[73];
-rz(-pi/131072) q[73];
-cx q[89],q[73];
-rz(pi/131072) q[73];
-rz(pi/65536) q[89];
-cx q[89],q[74];
-rz(-pi/65536) q[74];
-cx q[89],q[74];
-rz(pi/65536) q[74];
-rz(pi/32768) q[89];
-cx q[89],q[75];
-rz(-pi/32768) q[75];
-cx q[89],q[75];
-rz(pi/32768) q[75];
-rz(pi/16384) q[89];
-cx q[89],q[76];
-rz(-pi/16384) q[76];
-cx q[89],q[76];
-rz(pi/16384) q[76];
-rz(pi/8192) q[89];
-cx q[89],q[77];
-rz(-pi/8192) q[77];
-cx q[89],q[77];
-rz(pi/8192) q[77];
-rz(pi/4096) q[89];
-cx q[89],q[78];
-rz(-pi/4096) q[78];
-cx q[89],q[78];
-rz(pi/4096) q[78];
-rz(pi/2048) q[89];
-cx q[89],q[79];
-rz(-pi/2048) q[79];
-cx q[89],q[79];
-rz(pi/2048) q[79];
-rz(pi/1024) q[89];
-cx q[89],q[80];
-rz(-pi/1024) q[80];
-cx q[89],q[80];
-rz(pi/1024) q[80];
-rz(pi/512) q[89];
-cx q[89],q[81];
-rz(-pi/512) q[81];
-cx q[89],q[81];
-rz(pi/512) q[81];
-rz(pi/256) q[89];
-cx q[89],q[82];
-rz(-pi/256) q[82];
-cx q[89],q[82];
-rz(pi/256) q[82];
-rz(pi/128) q[89];
-cx q[89],q[83];
-rz(-pi/128) q[83];
-cx q[89],q[83];
-rz(pi/128) q[83];
-rz(pi/64) q[89];
-cx q[89],q[84];
-rz(-pi/64) q[84];
-cx q[89],q[84];
-rz(pi/64) q[84];
-rz(pi/32) q[89];
-cx q[89],q[85];
-rz(-pi/32) q[85];
-cx q[89],q[85];
-rz(pi/32) q[85];
-rz(pi/16) q[89];
-cx q[89],q[86];
-rz(-pi/16) q[86];
-cx q[89],q[86];
-rz(pi/16) q[86];
-rz(pi/8) q[89];
-cx q[89],q[87];
-rz(-pi/8) q[87];
-cx q[89],q[87];
-rz(pi/8) q[87];
-rz(pi/4) q[89];
-cx q[89],q[88];
-rz(-pi/4) q[88];
-cx q[89],q[88];
-rz(pi/4) q[88];
-rz(pi/2) q[89];
-sx q[89];
-rz(pi/2) q[89];
-rz(1.42863093678434e-12) q[90];
-cx q[90],q[50];
-rz(-1.42863093678434e-12) q[50];
-cx q[90],q[50];
-rz(1.42863093678434e-12) q[50];
-rz(2.85726187356867e-12) q[90];
-cx q[90],q[51];
-rz(-2.85726187356867e-12) q[51];
-cx q[90],q[51];
-rz(2.85726187356867e-12) q[51];
-rz(5.71452374713734e-12) q[90];
-cx q[90],q[52];
-rz(-5.71452374713734e-12) q[52];
-cx q[90],q[52];
-rz(5.71452374713734e-12) q[52];
-rz(1.14290474942747e-11) q[90];
-cx q[90],q[53];
-rz(-1.14290474942747e-11) q[53];
-cx q[90],q[53];
-rz(1.14290474942747e-11) q[53];
-rz(2.28580949885494e-11) q[90];
-cx q[90],q[54];
-rz(-2.28580949885494e-11) q[54];
-cx q[90],q[54];
-rz(2.28580949885494e-11) q[54];
-rz(4.57161899770987e-11) q[90];
-cx q[90],q[55];
-rz(-4.57161899770987e-11) q[55];
-cx q[90],q[55];
-rz(4.57161899770987e-11) q[55];
-rz(9.14323799541975e-11) q[90];
-cx q[90],q[56];
-rz(-9.14323799541975e-11) q[56];
-cx q[90],q[56];
-rz(9.14323799541975e-11) q[56];
-rz(1.82864759908395e-10) q[90];
-cx q[90],q[57];
-rz(-1.82864759908395e-10) q[57];
-cx q[90],q[57];
-rz(1.82864759908395e-10) q[57];
-rz(3.6572951981679e-10) q[90];
-cx q[90],q[58];
-rz(-3.6572951981679e-10) q[58];
-cx q[90],q[58];
-rz(3.6572951981679e-10) q[58];
-rz(7.3145903963358e-10) q[90];
-cx q[90],q[59];
-rz(-7.3145903963358e-10) q[59];
-cx q[90],q[59];
-rz(7.3145903963358e-10) q[59];
-rz(pi/2147483648) q[90];
-cx q[90],q[60];
-rz(-pi/2147483648) q[60];
-cx q[90],q[60];
-rz(pi/2147483648) q[60];
-rz(pi/1073741824) q[90];
-cx q[90],q[61];
-rz(-pi/1073741824) q[61];
-cx q[90],q[61];
-rz(pi/1073741824) q[61];
-rz(pi/536870912) q[90];
-cx q[90],q[62];
-rz(-pi/536870912) q[62];
-cx q[90],q[62];
-rz(pi/536870912) q[62];
-rz(pi/268435456) q[90];
-cx q[90],q[63];
-rz(-pi/268435456) q[63];
-cx q[90],q[63];
-rz(pi/268435456) q[63];
-rz(pi/134217728) q[90];
-cx q[90],q[64];
-rz(-pi/134217728) q[64];
-cx q[90],q[64];
-rz(pi/134217728) q[64];
-rz(pi/67108864) q[90];
-cx q[90],q[65];
-rz(-pi/67108864) q[65];
-cx q[90],q[65];
-rz(pi/67108864) q[65];
-rz(pi/33554432) q[90];
-cx q[90],q[66];
-rz(-pi/33554432) q[66];
-cx q[90],q[66];
-rz(pi/33554432) q[66];
-rz(pi/16777216) q[90];
-cx q[90],q[67];
-rz(-pi/16777216) q[67];
-cx q[90],q[67];
-rz(pi/16777216) q[67];
-rz(pi/8388608) q[90];
-cx q[90],q[68];
-rz(-pi/8388608) q[68];
-cx q[90],q[68];
-rz(pi/8388608) q[68];
-rz(pi/4194304) q[90];
-cx q[90],q[69];
-rz(-pi/4194304) q[69];
-cx q[90],q[69];
-rz(pi/4194304) q[69];
-rz(pi/2097152) q[90];
-cx q[90],q[70];
-rz(-pi/2097152) q[70];
-cx q[90],q[70];
-rz(pi/2097152) q[70];
-rz(pi/1048576) q[90];
-cx q[90],q[71];
-rz(-pi/1048576) q[71];
-cx q[90],q[71];
-rz(pi/1048576) q[71];
-rz(pi/524288) q[90];
-cx q[90],q[72];
-rz(-pi/524288) q[72];
-cx q[90],q[72];
-rz(pi/524288) q[72];
-rz(pi/262144) q[90];
-cx q[90],q[73];
-rz(-pi/262144) q[73];
-cx q[90],q[73];
-rz(pi/262144) q[73];
-rz(pi/131072) q[90];
-cx q[90],q[74];
-rz(-pi/131072) q[74];
-cx q[90],q[74];
-rz(pi/131072) q[74];
-rz(pi/65536) q[90];
-cx q[90],q[75];
-rz(-pi/65536) q[75];
-cx q[90],q[75];
-rz(pi/65536) q[75];
-rz(pi/32768) q[90];
-cx q[90],q[76];
-rz(-pi/32768) q[76];
-cx q[90],q[76];
-rz(pi/32768) q[76];
-rz(pi/16384) q[90];
-cx q[90],q[77];
-rz(-pi/16384) q[77];
-cx q[90],q[77];
-rz(pi/16384) q[77];
-rz(pi/8192) q[90];
-cx q[90],q[78];
-rz(-pi/8192) q[78];
-cx q[90],q[78];
-rz(pi/8192) q[78];
-rz(pi/4096) q[90];
-cx q[90],q[79];
-rz(-pi/4096) q[79];
-cx q[90],q[79];
-rz(pi/4096) q[79];
-rz(pi/2048) q[90];
-cx q[90],q[80];
-rz(-pi/2048) q[80];
-cx q[90],q[80];
-rz(pi/2048) q[80];
-rz(pi/1024) q[90];
-cx q[90],q[81];
-rz(-pi/1024) q[81];
-cx q[90],q[81];
-rz(pi/1024) q[81];
-rz(pi/512) q[90];
-cx q[90],q[82];
-rz(-pi/512) q[82];
-cx q[90],q[82];
-rz(pi/512) q[82];
-rz(pi/256) q[90];
-cx q[90],q[83];
-rz(-pi/256) q[83];
-cx q[90],q[83];
-rz(pi/256) q[83];
-rz(pi/128) q[90];
-cx q[90],q[84];
-rz(-pi/128) q[84];
-cx q[90],q[84];
-rz(pi/128) q[84];
-rz(pi/64) q[90];
-cx q[90],q[85];
-rz(-pi/64) q[85];
-cx q[90],q[85];
-rz(pi/64) q[85];
-rz(pi/32) q[90];
-cx q[90],q[86];
-rz(-pi/32) q[86];
-cx q[90],q[86];
-rz(pi/32) q[86];
-rz(pi/16) q[90];
-cx q[90],q[87];
-rz(-pi/16) q[87];
-cx q[90],q[87];
-rz(pi/16) q[87];
-rz(pi/8) q[90];
-cx q[90],q[88];
-rz(-pi/8) q[88];
-cx q[90],q[88];
-rz(pi/8) q[88];
-rz(pi/4) q[90];
-cx q[90],q[89];
-rz(-pi/4) q[89];
-cx q[90],q[89];
-rz(pi/4) q[89];
-rz(pi/2) q[90];
-sx q[90];
-rz(pi/2) q[90];
-rz(1.42863093678434e-12) q[91];
-cx q[91],q[51];
-rz(-1.42863093678434e-12) q[51];
-cx q[91],q[51];
-rz(1.42863093678434e-12) q[51];
-rz(2.85726187356867e-12) q[91];
-cx q[91],q[52];
-rz(-2.85726187356867e-12) q[52];
-cx q[91],q[52];
-rz(2.85726187356867e-12) q[52];
-rz(5.71452374713734e-12) q[91];
-cx q[91],q[53];
-rz(-5.71452374713734e-12) q[53];
-cx q[91],q[53];
-rz(5.71452374713734e-12) q[53];
-rz(1.14290474942747e-11) q[91];
-cx q[91],q[54];
-rz(-1.14290474942747e-11) q[54];
-cx q[91],q[54];
-rz(1.14290474942747e-11) q[54];
-rz(2.28580949885494e-11) q[91];
-cx q[91],q[55];
-rz(-2.28580949885494e-11) q[55];
-cx q[91],q[55];
-rz(2.28580949885494e-11) q[55];
-rz(4.57161899770987e-11) q[91];
-cx q[91],q[56];
-rz(-4.57161899770987e-11) q[56];
-cx q[91],q[56];
-rz(4.57161899770987e-11) q[56];
-rz(9.14323799541975e-11) q[91];
-cx q[91],q[57];
-rz(-9.14323799541975e-11) q[57];
-cx q[91],q[57];
-rz(9.14323799541975e-11) q[57];
-rz(1.82864759908395e-10) q[91];
-cx q[91],q[58];
-rz(-1.82864759908395e-10) q[58];
-cx q[91],q[58];
-rz(1.82864759908395e-10) q[58];
-rz(3.6572951981679e-10) q[91];
-cx q[91],q[59];
-rz(-3.6572951981679e-10) q[59];
-cx q[91],q[59];
-rz(3.6572951981679e-10) q[59];
-rz(7.3145903963358e-10) q[91];
-cx q[91],q[60];
-rz(-7.3145903963358e-10) q[60];
-cx q[91],q[60];
-rz(7.3145903963358e-10) q[60];
-rz(pi/2147483648) q[91];
-cx q[91],q[61];
-rz(-pi/2147483648) q[61];
-cx q[91],q[61];
-rz(pi/2147483648) q[61];
-rz(pi/1073741824) q[91];
-cx q[91],q[62];
-rz(-pi/1073741824) q[62];
-cx q[91],q[62];
-rz(pi/1073741824) q[62];
-rz(pi/536870912) q[91];
-cx q[91],q[63];
-rz(-pi/536870912) q[63];
-cx q[91],q[63];
-rz(pi/536870912) q[63];
-rz(pi/268435456) q[91];
-cx q[91],q[64];
-rz(-pi/268435456) q[64];
-cx q[91],q[64];
-rz(pi/268435456) q[64];
-rz(pi/134217728) q[91];
-cx q[91],q[65];
-rz(-pi/134217728) q[65];
-cx q[91],q[65];
-rz(pi/134217728) q[65];
-rz(pi/67108864) q[91];
-cx q[91],q[66];
-rz(-pi/67108864) q[66];
-cx q[91],q[66];
-rz(pi/67108864) q[66];
-rz(pi/33554432) q[91];
-cx q[91],q[67];
-rz(-pi/33554432) q[67];
-cx q[91],q[67];
-rz(pi/33554432) q[67];
-rz(pi/16777216) q[91];
-cx q[91],q[68];
-rz(-pi/16777216) q[68];
-cx q[91],q[68];
-rz(pi/16777216) q[68];
-rz(pi/8388608) q[91];
-cx q[91],q[69];
-rz(-pi/8388608) q[69];
-cx q[91],q[69];
-rz(pi/8388608) q[69];
-rz(pi/4194304) q[91];
-cx q[91],q[70];
-rz(-pi/4194304) q[70];
-cx q[91],q[70];
-rz(pi/4194304) q[70];
-rz(pi/2097152) q[91];
-cx q[91],q[71];
-rz(-pi/2097152) q[71];
-cx q[91],q[71];
-rz(pi/2097152) q[71];
-rz(pi/1048576) q[91];
-cx q[91],q[72];
-rz(-pi/1048576) q[72];
-cx q[91],q[72];
-rz(pi/1048576) q[72];
-rz(pi/524288) q[91];
-cx q[91],q[73];
-rz(-pi/524288) q[73];
-cx q[91],q[73];
-rz(pi/524288) q[73];
-rz(pi/262144) q[91];
-cx q[91],q[74];
-rz(-pi/262144) q[74];
-cx q[91],q[74];
-rz(pi/262144) q[74];
-rz(pi/131072) q[91];
-cx q[91],q[75];
-rz(-pi/131072) q[75];
-cx q[91],q[75];
-rz(pi/131072) q[75];
-rz(pi/65536) q[91];
-cx q[91],q[76];
-rz(-pi/65536) q[76];
-cx q[91],q[76];
-rz(pi/65536) q[76];
-rz(pi/32768) q[91];
-cx q[91],q[77];
-rz(-pi/32768) q[77];
-cx q[91],q[77];
-rz(pi/32768) q[77];
-rz(pi/16384) q[91];
-cx q[91],q[78];
-rz(-pi/16384) q[78];
-cx q[91],q[78];
-rz(pi/16384) q[78];
-rz(pi/8192) q[91];
-cx q[91],q[79];
-rz(-pi/8192) q[79];
-cx q[91],q[79];
-rz(pi/8192) q[79];
-rz(pi/4096) q[91];
-cx q[91],q[80];
-rz(-pi/4096) q[80];
-cx q[91],q[80];
-rz(pi/4096) q[80];
-rz(pi/2048) q[91];
-cx q[91],q[81];
-rz(-pi/2048) q[81];
-cx q[91],q[81];
-rz(pi/2048) q[81];
-rz(pi/1024) q[91];
-cx q[91],q[82];
-rz(-pi/1024) q[82];
-cx q[91],q[82];
-rz(pi/1024) q[82];
-rz(pi/512) q[91];
-cx q[91],q[83];
-rz(-pi/512) q[83];
-cx q[91],q[83];
-rz(pi/512) q[83];
-rz(pi/256) q[91];
-cx q[91],q[84];
-rz(-pi/256) q[84];
-cx q[91],q[84];
-rz(pi/256) q[84];
-rz(pi/128) q[91];
-cx q[91],q[85];
-rz(-pi/128) q[85];
-cx q[91],q[85];
-rz(pi/128) q[85];
-rz(pi/64) q[91];
-cx q[91],q[86];
-rz(-pi/64) q[86];
-cx q[91],q[86];
-rz(pi/64) q[86];
-rz(pi/32) q[91];
-cx q[91],q[87];
-rz(-pi/32) q[87];
-cx q[91],q[87];
-rz(pi/32) q[87];
-rz(pi/16) q[91];
-cx q[91],q[88];
-rz(-pi/16) q[88];
-cx q[91],q[88];
-rz(pi/16) q[88];
-rz(pi/8) q[91];
-cx q[91],q[89];
-rz(-pi/8) q[89];
-cx q[91],q[89];
-rz(pi/8) q[89];
-rz(pi/4) q[91];
-cx q[91],q[90];
-rz(-pi/4) q[90];
-cx q[91],q[90];
-rz(pi/4) q[90];
-rz(pi/2) q[91];
-sx q[91];
-rz(pi/2) q[91];
-rz(1.42863093678434e-12) q[92];
-cx q[92],q[52];
-rz(-1.42863093678434e-12) q[52];
-cx q[92],q[52];
-rz(1.42863093678434e-12) q[52];
-rz(2.85726187356867e-12) q[92];
-cx q[92],q[53];
-rz(-2.85726187356867e-12) q[53];
-cx q[92],q[53];
-rz(2.85726187356867e-12) q[53];
-rz(5.71452374713734e-12) q[92];
-cx q[92],q[54];
-rz(-5.71452374713734e-12) q[54];
-cx q[92],q[54];
-rz(5.71452374713734e-12) q[54];
-rz(1.14290474942747e-11) q[92];
-cx q[92],q[55];
-rz(-1.14290474942747e-11) q[55];
-cx q[92],q[55];
-rz(1.14290474942747e-11) q[55];
-rz(2.28580949885494e-11) q[92];
-cx q[92],q[56];
-rz(-2.28580949885494e-11) q[56];
-cx q[92],q[56];
-rz(2.28580949885494e-11) q[56];
-rz(4.57161899770987e-11) q[92];
-cx q[92],q[57];
-rz(-4.57161899770987e-11) q[57];
-cx q[92],q[57];
-rz(4.57161899770987e-11) q[57];
-rz(9.14323799541975e-11) q[92];
-cx q[92],q[58];
-rz(-9.14323799541975e-11) q[58];
-cx q[92],q[58];
-rz(9.14323799541975e-11) q[58];
-rz(1.82864759908395e-10) q[92];
-cx q[92],q[59];
-rz(-1.82864759908395e-10) q[59];
-cx q[92],q[59];
-rz(1.82864759908395e-10) q[59];
-rz(3.6572951981679e-10) q[92];
-cx q[92],q[60];
-rz(-3.6572951981679e-10) q[60];
-cx q[92],q[60];
-rz(3.6572951981679e-10) q[60];
-rz(7.3145903963358e-10) q[92];
-cx q[92],q[61];
-rz(-7.3145903963358e-10) q[61];
-cx q[92],q[61];
-rz(7.3145903963358e-10) q[61];
-rz(pi/2147483648) q[92];
-cx q[92],q[62];
-rz(-pi/2147483648) q[62];
-cx q[92],q[62];
-rz(pi/2147483648) q[62];
-rz(pi/1073741824) q[92];
-cx q[92],q[63];
-rz(-pi/1073741824) q[63];
-cx q[92],q[63];
-rz(pi/1073741824) q[63];
-rz(pi/536870912) q[92];
-cx q[92],q[64];
-rz(-pi/536870912) q[64];
-cx q[92],q[64];
-rz(pi/536870912) q[64];
-rz(pi/268435456) q[92];
-cx q[92],q[65];
-rz(-pi/268435456) q[65];
-cx q[92],q[65];
-rz(pi/268435456) q[65];
-rz(pi/134217728) q[92];
-cx q[92],q[66];
-rz(-pi/134217728) q[66];
-cx q[92],q[66];
-rz(pi/134217728) q[66];
-rz(pi/67108864) q[92];
-cx q[92],q[67];
-rz(-pi/67108864) q[67];
-cx q[92],q[67];
-rz(pi/67108864) q[67];
-rz(pi/33554432) q[92];
-cx q[92],q[68];
-rz(-pi/33554432) q[68];
-cx q[92],q[68];
-rz(pi/33554432) q[68];
-rz(pi/16777216) q[92];
-cx q[92],q[69];
-rz(-pi/16777216) q[69];
-cx q[92],q[69];
-rz(pi/16777216) q[69];
-rz(pi/8388608) q[92];
-cx q[92],q[70];
-rz(-pi/8388608) q[70];
-cx q[92],q[70];
-rz(pi/8388608) q[70];
-rz(pi/4194304) q[92];
-cx q[92],q[71];
-rz(-pi/4194304) q[71];
-cx q[92],q[71];
-rz(pi/4194304) q[71];
-rz(pi/2097152) q[92];
-cx q[92],q[72];
-rz(-pi/2097152) q[72];
-cx q[92],q[72];
-rz(pi/2097152) q[72];
-rz(pi/1048576) q[92];
-cx q[92],q[73];
-rz(-pi/1048576) q[73];
-cx q[92],q[73];
-rz(pi/1048576) q[73];
-rz(pi/524288) q[92];
-cx q[92],q[74];
-rz(-pi/524288) q[74];
-cx q[92],q[74];
-rz(pi/524288) q[74];
-rz(pi/262144) q[92];
-cx q[92],q[75];
-rz(-pi/262144) q[75];
-cx q[92],q[75];
-rz(pi/262144) q[75];
-rz(pi/131072) q[92];
-cx q[92],q[76];
-rz(-pi/131072) q[76];
-cx q[92],q[76];
-rz(pi/131072) q[76];
-rz(pi/65536) q[92];
-cx q[92],q[77];
-rz(-pi/65536) q[77];
-cx q[92],q[77];
-rz(pi/65536) q[77];
-rz(pi/32768) q[92];
-cx q[92],q[78];
-rz(-pi/32768) q[78];
-cx q[92],q[78];
-rz(pi/32768) q[78];
-rz(pi/16384) q[92];
-cx q[92],q[79];
-rz(-pi/16384) q[79];
-cx q[92],q[79];
-rz(pi/16384) q[79];
-rz(pi/8192) q[92];
-cx q[92],q[80];
-rz(-pi/8192) q[80];
-cx q[92],q[80];
-rz(pi/8192) q[80];
-rz(pi/4096) q[92];
-cx q[92],q[81];
-rz(-pi/4096) q[81];
-cx q[92],q[81];
-rz(pi/4096) q[81];
-rz(pi/2048) q[92];
-cx q[92],q[82];
-rz(-pi/2048) q[82];
-cx q[92],q[82];
-rz(pi/2048) q[82];
-rz(pi/1024) q[92];
-cx q[92],q[83];
-rz(-pi/1024) q[83];
-cx q[92],q[83];
-rz(pi/1024) q[83];
-rz(pi/512) q[92];
-cx q[92],q[84];
-rz(-pi/512) q[84];
-cx q[92],q[84];
-rz(pi/512) q[84];
-rz(pi/256) q[92];
-cx q[92],q[85];
-rz(-pi/256) q[85];
-cx q[92],q[85];
-rz(pi/256) q[85];
-rz(pi/128) q[92];
-cx q[92],q[86];
-rz(-pi/128) q[86];
-cx q[92],q[86];
-rz(pi/128) q[86];
-rz(pi/64) q[92];
-cx q[92],q[87];
-rz(-pi/64) q[87];
-cx q[92],q[87];
-rz(pi/64) q[87];
-rz(pi/32) q[92];
-cx q[92],q[88];
-rz(-pi/32) q[88];
-cx q[92],q[88];
-rz(pi/32) q[88];
-rz(pi/16) q[92];
-cx q[92],q[89];
-rz(-pi/16) q[89];
-cx q[92],q[89];
-rz(pi/16) q[89];
-rz(pi/8) q[92];
-cx q[92],q[90];
-rz(-pi/8) q[90];
-cx q[92],q[90];
-rz(pi/8) q[90];
-rz(pi/4) q[92];
-cx q[92],q[91];
-rz(-pi/4) q[91];
-cx q[92],q[91];
-rz(pi/4) q[91];
-rz(pi/2) q[92];
-sx q[92];
-rz(pi/2) q[92];
-rz(1.42863093678434e-12) q[93];
-cx q[93],q[53];
-rz(-1.42863093678434e-12) q[53];
-cx q[93],q[53];
-rz(1.42863093678434e-12) q[53];
-rz(2.85726187356867e-12) q[93];
-cx q[93],q[54];
-rz(-2.85726187356867e-12) q[54];
-cx q[93],q[54];
-rz(2.85726187356867e-12) q[54];
-rz(5.71452374713734e-12) q[93];
-cx q[93],q[55];
-rz(-5.71452374713734e-12) q[55];
-cx q[93],q[55];
-rz(5.71452374713734e-12) q[55];
-rz(1.14290474942747e-11) q[93];
-cx q[93],q[56];
-rz(-1.14290474942747e-11) q[56];
-cx q[93],q[56];
-rz(1.14290474942747e-11) q[56];
-rz(2.28580949885494e-11) q[93];
-cx q[93],q[57];
-rz(-2.28580949885494e-11) q[57];
-cx q[93],q[57];
-rz(2.28580949885494e-11) q[57];
-rz(4.57161899770987e-11) q[93];
-cx q[93],q[58];
-rz(-4.57161899770987e-11) q[58];
-cx q[93],q[58];
-rz(4.57161899770987e-11) q[58];
-rz(9.14323799541975e-11) q[93];
-cx q[93],q[59];
-rz(-9.14323799541975e-11) q[59];
-cx q[93],q[59];
-rz(9.14323799541975e-11) q[59];
-rz(1.82864759908395e-10) q[93];
-cx q[93],q[60];
-rz(-1.82864759908395e-10) q[60];
-cx q[93],q[60];
-rz(1.82864759908395e-10) q[60];
-rz(3.6572951981679e-10) q[93];
-cx q[93],q[61];
-rz(-3.6572951981679e-10) q[61];
-cx q[93],q[61];
-rz(3.6572951981679e-10) q[61];
-rz(7.3145903963358e-10) q[93];
-cx q[93],q[62];
-rz(-7.3145903963358e-10) q[62];
-cx q[93],q[62];
-rz(7.3145903963358e-10) q[62];
-rz(pi/2147483648) q[93];
-cx q[93],q[63];
-rz(-pi/2147483648) q[63];
-cx q[93],q[63];
-rz(pi/2147483648) q[63];
-rz(pi/1073741824) q[93];
-cx q[93],q[64];
-rz(-pi/1073741824) q[64];
-cx q[93],q[64];
-rz(pi/1073741824) q[64];
-rz(pi/536870912) q[93];
-cx q[93],q[65];
-rz(-pi/536870912) q[65];
-cx q[93],q[65];
-rz(pi/536870912) q[65];
-rz(pi/268435456) q[93];
-cx q[93],q[66];
-rz(-pi/268435456) q[66];
-cx q[93],q[66];
-rz(pi/268435456) q[66];
-rz(pi/134217728) q[93];
-cx q[93],q[67];
-rz(-pi/134217728) q[67];
-cx q[93],q[67];
-rz(pi/134217728) q[67];
-rz(pi/67108864) q[93];
-cx q[93],q[68];
-rz(-pi/67108864) q[68];
-cx q[93],q[68];
-rz(pi/67108864) q[68];
-rz(pi/33554432) q[93];
-cx q[93],q[69];
-rz(-pi/33554432) q[69];
-cx q[93],q[69];
-rz(pi/33554432) q[69];
-rz(pi/16777216) q[93];
-cx q[93],q[70];
-rz(-pi/16777216) q[70];
-cx q[93],q[70];
-rz(pi/16777216) q[70];
-rz(pi/8388608) q[93];
-cx q[93],q[71];
-rz(-pi/8388608) q[71];
-cx q[93],q[71];
-rz(pi/8388608) q[71];
-rz(pi/4194304) q[93];
-cx q[93],q[72];
-rz(-pi/4194304) q[72];
-cx q[93],q[72];
-rz(pi/4194304) q[72];
-rz(pi/2097152) q[93];
-cx q[93],q[73];
-rz(-pi/2097152) q[73];
-cx q[93],q[73];
-rz(pi/2097152) q[73];
-rz(pi/1048576) q[93];
-cx q[93],q[74];
-rz(-pi/1048576) q[74];
-cx q[93],q[74];
-rz(pi/1048576) q[74];
-rz(pi/524288) q[93];
-cx q[93],q[75];
-rz(-pi/524288) q[75];
-cx q[93],q[75];
-rz(pi/524288) q[75];
-rz(pi/262144) q[93];
-cx q[93],q[76];
-rz(-pi/262144) q[76];
-cx q[93],q[76];
-rz(pi/262144) q[76];
-rz(pi/131072) q[93];
-cx q[93],q[77];
-rz(-pi/131072) q[77];
-cx q[93],q[77];
-rz(pi/131072) q[77];
-rz(pi/65536) q[93];
-cx q[93],q[78];
-rz(-pi/65536) q[78];
-cx q[93],q[78];
-rz(pi/65536) q[78];
-rz(pi/32768) q[93];
-cx q[93],q[79];
-rz(-pi/32768) q[79];
-cx q[93],q[79];
-rz(pi/32768) q[79];
-rz(pi/16384) q[93];
-cx q[93],q[80];
-rz(-pi/16384) q[80];
-cx q[93],q[80];
-rz(pi/16384) q[80];
-rz(pi/8192) q[93];
-cx q[93],q[81];
-rz(-pi/8192) q[81];
-cx q[93],q[81];
-rz(pi/8192) q[81];
-rz(pi/4096) q[93];
-cx q[93],q[82];
-rz(-pi/4096) q[82];
-cx q[93],q[82];
-rz(pi/4096) q[82];
-rz(pi/2048) q[93];
-cx q[93],q[83];
-rz(-pi/2048) q[83];
-cx q[93],q[83];
-rz(pi/2048) q[83];
-rz(pi/1024) q[93];
-cx q[93],q[84];
-rz(-pi/1024) q[84];
-cx q[93],q[84];
-rz(pi/1024) q[84];
-rz(pi/512) q[93];
-cx q[93],q[85];
-rz(-pi/512) q[85];
-cx q[93],q[85];
-rz(pi/512) q[85];
-rz(pi/256) q[93];
-cx q[93],q[86];
-rz(-pi/256) q[86];
-cx q[93],q[86];
-rz(pi/256) q[86];
-rz(pi/128) q[93];
-cx q[93],q[87];
-rz(-pi/128) q[87];
-cx q[93],q[87];
-rz(pi/128) q[87];
-rz(pi/64) q[93];
-cx q[93],q[88];
-rz(-pi/64) q[88];
-cx q[93],q[88];
-rz(pi/64) q[88];
-rz(pi/32) q[93];
-cx q[93],q[89];
-rz(-pi/32) q[89];
-cx q[93],q[89];
-rz(pi/32) q[89];
-rz(pi/16) q[93];
-cx q[93],q[90];
-rz(-pi/16) q[90];
-cx q[93],q[90];
-rz(pi/16) q[90];
-rz(pi/8) q[93];
-cx q[93],q[91];
-rz(-pi/8) q[91];
-cx q[93],q[91];
-rz(pi/8) q[91];
-rz(pi/4) q[93];
-cx q[93],q[92];
-rz(-pi/4) q[92];
-cx q[93],q[92];
-rz(pi/4) q[92];
-rz(pi/2) q[93];
-sx q[93];
-rz(pi/2) q[93];
-rz(1.42863093678434e-12) q[94];
-cx q[94],q[54];
-rz(-1.42863093678434e-12) q[54];
-cx q[94],q[54];
-rz(1.42863093678434e-12) q[54];
-rz(2.85726187356867e-12) q[94];
-cx q[94],q[55];
-rz(-2.85726187356867e-12) q[55];
-cx q[94],q[55];
-rz(2.85726187356867e-12) q[55];
-rz(5.71452374713734e-12) q[94];
-cx q[94],q[56];
-rz(-5.71452374713734e-12) q[56];
-cx q[94],q[56];
-rz(5.71452374713734e-12) q[56];
-rz(1.14290474942747e-11) q[94];
-cx q[94],q[57];
-rz(-1.14290474942747e-11) q[57];
-cx q[94],q[57];
-rz(1.14290474942747e-11) q[57];
-rz(2.28580949885494e-11) q[94];
-cx q[94],q[58];
-rz(-2.28580949885494e-11) q[58];
-cx q[94],q[58];
-rz(2.28580949885494e-11) q[58];
-rz(4.57161899770987e-11) q[94];
-cx q[94],q[59];
-rz(-4.57161899770987e-11) q[59];
-cx q[94],q[59];
-rz(4.57161899770987e-11) q[59];
-rz(9.14323799541975e-11) q[94];
-cx q[94],q[60];
-rz(-9.14323799541975e-11) q[60];
-cx q[94],q[60];
-rz(9.14323799541975e-11) q[60];
-rz(1.82864759908395e-10) q[94];
-cx q[94],q[61];
-rz(-1.82864759908395e-10) q[61];
-cx q[94],q[61];
-rz(1.82864759908395e-10) q[61];
-rz(3.6572951981679e-10) q[94];
-cx q[94],q[62];
-rz(-3.6572951981679e-10) q[62];
-cx q[94],q[62];
-rz(3.6572951981679e-10) q[62];
-rz(7.3145903963358e-10) q[94];
-cx q[94],q[63];
-rz(-7.3145903963358e-10) q[63];
-cx q[94],q[63];
-rz(7.3145903963358e-10) q[63];
-rz(pi/2147483648) q[94];
-cx q[94],q[64];
-rz(-pi/2147483648) q[64];
-cx q[94],q[64];
-rz(pi/2147483648) q[64];
-rz(pi/1073741824) q[94];
-cx q[94],q[65];
-rz(-pi/1073741824) q[65];
-cx q[94],q[65];
-rz(pi/1073741824) q[65];
-rz(pi/536870912) q[94];
-cx q[94],q[66];
-rz(-pi/536870912) q[66];
-cx q[94],q[66];
-rz(pi/536870912) q[66];
-rz(pi/268435456) q[94];
-cx q[94],q[67];
-rz(-pi/268435456) q[67];
-cx q[94],q[67];
-rz(pi/268435456) q[67];
-rz(pi/134217728) q[94];
-cx q[94],q[68];
-rz(-pi/134217728) q[68];
-cx q[94],q[68];
-rz(pi/134217728) q[68];
-rz(pi/67108864) q[94];
-cx q[94],q[69];
-rz(-pi/67108864) q[69];
-cx q[94],q[69];
-rz(pi/67108864) q[69];
-rz(pi/33554432) q[94];
-cx q[94],q[70];
-rz(-pi/33554432) q[70];
-cx q[94],q[70];
-rz(pi/33554432) q[70];
-rz(pi/16777216) q[94];
-cx q[94],q[71];
-rz(-pi/16777216) q[71];
-cx q[94],q[71];
-rz(pi/16777216) q[71];
-rz(pi/8388608) q[94];
-cx q[94],q[72];
-rz(-pi/8388608) q[72];
-cx q[94],q[72];
-rz(pi/8388608) q[72];
-rz(pi/4194304) q[94];
-cx q[94],q[73];
-rz(-pi/4194304) q[73];
-cx q[94],q[73];
-rz(pi/4194304) q[73];
-rz(pi/2097152) q[94];
-cx q[94],q[74];
-rz(-pi/2097152) q[74];
-cx q[94],q[74];
-rz(pi/2097152) q[74];
-rz(pi/1048576) q[94];
-cx q[94],q[75];
-rz(-pi/1048576) q[75];
-cx q[94],q[75];
-rz(pi/1048576) q[75];
-rz(pi/524288) q[94];
-cx q[94],q[76];
-rz(-pi/524288) q[76];
-cx q[94],q[76];
-rz(pi/524288) q[76];
-rz(pi/262144) q[94];
-cx q[94],q[77];
-rz(-pi/262144) q[77];
-cx q[94],q[77];
-rz(pi/262144) q[77];
-rz(pi/131072) q[94];
-cx q[94],q[78];
-rz(-pi/131072) q[78];
-cx q[94],q[78];
-rz(pi/131072) q[78];
-rz(pi/65536) q[94];
-cx q[94],q[79];
-rz(-pi/65536) q[79];
-cx q[94],q[79];
-rz(pi/65536) q[79];
-rz(pi/32768) q[94];
-cx q[94],q[80];
-rz(-pi/32768) q[80];
-cx q[94],q[80];
-rz(pi/32768) q[80];
-rz(pi/16384) q[94];
-cx q[94],q[81];
-rz(-pi/16384) q[81];
-cx q[94],q[81];
-rz(pi/16384) q[81];
-rz(pi/8192) q[94];
-cx q[94],q[82];
-rz(-pi/8192) q[82];
-cx q[94],q[82];
-rz(pi/8192) q[82];
-rz(pi/4096) q[94];
-cx q[94],q[83];
-rz(-pi/4096) q[83];
-cx q[94],q[83];
-rz(pi/4096) q[83];
-rz(pi/2048) q[94];
-cx q[94],q[84];
-rz(-pi/2048) q[84];
-cx q[94],q[84];
-rz(pi/2048) q[84];
-rz(pi/1024) q[94];
-cx q[94],q[85];
-rz(-pi/1024) q[85];
-cx q[94],q[85];
-rz(pi/1024) q[85];
-rz(pi/512) q[94];
-cx q[94],q[86];
-rz(-pi/512) q[86];
-cx q[94],q[86];
-rz(pi/512) q[86];
-rz(pi/256) q[94];
-cx q[94],q[87];
-rz(-pi/256) q[87];
-cx q[94],q[87];
-rz(pi/256) q[87];
-rz(pi/128) q[94];
-cx q[94],q[88];
-rz(-pi/128) q[88];
-cx q[94],q[88];
-rz(pi/128) q[88];
-rz(pi/64) q[94];
-cx q[94],q[89];
-rz(-pi/64) q[89];
-cx q[94],q[89];
-rz(pi/64) q[89];
-rz(pi/32) q[94];
-cx q[94],q[90];
-rz(-pi/32) q[90];
-cx q[94],q[90];
-rz(pi/32) q[90];
-rz(pi/16) q[94];
-cx q[94],q[91];
-rz(-pi/16) q[91];
-cx q[94],q[91];
-rz(pi/16) q[91];
-rz(pi/8) q[94];
-cx q[94],q[92];
-rz(-pi/8) q[92];
-cx q[94],q[92];
-rz(pi/8) q[92];
-rz(pi/4) q[94];
-cx q[94],q[93];
-rz(-pi/4) q[93];
-cx q[94],q[93];
-rz(pi/4) q[93];
-rz(pi/2) q[94];
-sx q[94];
-rz(pi/2) q[94];
-rz(1.42863093678434e-12) q[95];
-cx q[95],q[55];
-rz(-1.42863093678434e-12) q[55];
-cx q[95],q[55];
-rz(1.42863093678434e-12) q[55];
-rz(2.85726187356867e-12) q[95];
-cx q[95],q[56];
-rz(-2.85726187356867e-12) q[56];
-cx q[95],q[56];
-rz(2.85726187356867e-12) q[56];
-rz(5.71452374713734e-12) q[95];
-cx q[95],q[57];
-rz(-5.71452374713734e-12) q[57];
-cx q[95],q[57];
-rz(5.71452374713734e-12) q[57];
-rz(1.14290474942747e-11) q[95];
-cx q[95],q[58];
-rz(-1.14290474942747e-11) q[58];
-cx q[95],q[58];
-rz(1.14290474942747e-11) q[58];
-rz(2.28580949885494e-11) q[95];
-cx q[95],q[59];
-rz(-2.28580949885494e-11) q[59];
-cx q[95],q[59];
-rz(2.28580949885494e-11) q[59];
-rz(4.57161899770987e-11) q[95];
-cx q[95],q[60];
-rz(-4.57161899770987e-11) q[60];
-cx q[95],q[60];
-rz(4.57161899770987e-11) q[60];
-rz(9.14323799541975e-11) q[95];
-cx q[95],q[61];
-rz(-9.14323799541975e-11) q[61];
-cx q[95],q[61];
-rz(9.14323799541975e-11) q[61];
-rz(1.82864759908395e-10) q[95];
-cx q[95],q[62];
-rz(-1.82864759908395e-10) q[62];
-cx q[95],q[62];
-rz(1.82864759908395e-10) q[62];
-rz(3.6572951981679e-10) q[95];
-cx q[95],q[63];
-rz(-3.6572951981679e-10) q[63];
-cx q[95],q[63];
-rz(3.6572951981679e-10) q[63];
-rz(7.3145903963358e-10) q[95];
-cx q[95],q[64];
-rz(-7.3145903963358e-10) q[64];
-cx q[95],q[64];
-rz(7.3145903963358e-10) q[64];
-rz(pi/2147483648) q[95];
-cx q[95],q[65];
-rz(-pi/2147483648) q[65];
-cx q[95],q[65];
-rz(pi/2147483648) q[65];
-rz(pi/1073741824) q[95];
-cx q[95],q[66];
-rz(-pi/1073741824) q[66];
-cx q[95],q[66];
-rz(pi/1073741824) q[66];
-rz(pi/536870912) q[95];
-cx q[95],q[67];
-rz(-pi/536870912) q[67];
-cx q[95],q[67];
-rz(pi/536870912) q[67];
-rz(pi/268435456) q[95];
-cx q[95],q[68];
-rz(-pi/268435456) q[68];
-cx q[95],q[68];
-rz(pi/268435456) q[68];
-rz(pi/134217728) q[95];
-cx q[95],q[69];
-rz(-pi/134217728) q[69];
-cx q[95],q[69];
-rz(pi/134217728) q[69];
-rz(pi/67108864) q[95];
-cx q[95],q[70];
-rz(-pi/67108864) q[70];
-cx q[95],q[70];
-rz(pi/67108864) q[70];
-rz(pi/33554432) q[95];
-cx q[95],q[71];
-rz(-pi/33554432) q[71];
-cx q[95],q[71];
-rz(pi/33554432) q[71];
-rz(pi/16777216) q[95];
-cx q[95],q[72];
-rz(-pi/16777216) q[72];
-cx q[95],q[72];
-rz(pi/16777216) q[72];
-rz(pi/8388608) q[95];
-cx q[95],q[73];
-rz(-pi/8388608) q[73];
-cx q[95],q[73];
-rz(pi/8388608) q[73];
-rz(pi/4194304) q[95];
-cx q[95],q[74];
-rz(-pi/4194304) q[74];
-cx q[95],q[74];
-rz(pi/4194304) q[74];
-rz(pi/2097152) q[95];
-cx q[95],q[75];
-rz(-pi/2097152) q[75];
-cx q[95],q[75];
-rz(pi/2097152) q[75];
-rz(pi/1048576) q[95];
-cx q[95],q[76];
-rz(-pi/1048576) q[76];
-cx q[95],q[76];
-rz(pi/1048576) q[76];
-rz(pi/524288) q[95];
-cx q[95],q[77];
-rz(-pi/524288) q[77];
-cx q[95],q[77];
-rz(pi/524288) q[77];
-rz(pi/262144) q[95];
-cx q[95],q[78];
-rz(-pi/262144) q[78];
-cx q[95],q[78];
-rz(pi/262144) q[78];
-rz(pi/131072) q[95];
-cx q[95],q[79];
-rz(-pi/131072) q[79];
-cx q[95],q[79];
-rz(pi/131072) q[79];
-rz(pi/65536) q[95];
-cx q[95],q[80];
-rz(-pi/65536) q[80];
-cx q[95],q[80];
-rz(pi/65536) q[80];
-rz(pi/32768) q[95];
-cx q[95],q[81];
-rz(-pi/32768) q[81];
-cx q[95],q[81];
-rz(pi/32768) q[81];
-rz(pi/16384) q[95];
-cx q[95],q[82];
-rz(-pi/16384) q[82];
-cx q[95],q[82];
-rz(pi/16384) q[82];
-rz(pi/8192) q[95];
-cx q[95],q[83];
-rz(-pi/8192) q[83];
-cx q[95],q[83];
-rz(pi/8192) q[83];
-rz(pi/4096) q[95];
-cx q[95],q[84];
-rz(-pi/4096) q[84];
-cx q[95],q[84];
-rz(pi/4096) q[84];
-rz(pi/2048) q[95];
-cx q[95],q[85];
-rz(-pi/2048) q[85];
-cx q[95],q[85];
-rz(pi/2048) q[85];
-rz(pi/1024) q[95];
-cx q[95],q[86];
-rz(-pi/1024) q[86];
-cx q[95],q[86];
-rz(pi/1024) q[86];
-rz(pi/512) q[95];
-cx q[95],q[87];
-rz(-pi/512) q[87];
-cx q[95],q[87];
-rz(pi/512) q[87];
-rz(pi/256) q[95];
-cx q[95],q[88];
-rz(-pi/256) q[88];
-cx q[95],q[88];
-rz(pi/256) q[88];
-rz(pi/128) q[95];
-cx q[95],q[89];
-rz(-pi/128) q[89];
-cx q[95],q[89];
-rz(pi/128) q[89];
-rz(pi/64) q[95];
-cx q[95],q[90];
-rz(-pi/64) q[90];
-cx q[95],q[90];
-rz(pi/64) q[90];
-rz(pi/32) q[95];
-cx q[95],q[91];
-rz(-pi/32) q[91];
-cx q[95],q[91];
-rz(pi/32) q[91];
-rz(pi/16) q[95];
-cx q[95],q[92];
-rz(-pi/16) q[92];
-cx q[95],q[92];
-rz(pi/16) q[92];
-rz(pi/8) q[95];
-cx q[95],q[93];
-rz(-pi/8) q[93];
-cx q[95],q[93];
-rz(pi/8) q[93];
-rz(pi/4) q[95];
-cx q[95],q[94];
-rz(-pi/4) q[94];
-cx q[95],q[94];
-rz(pi/4) q[94];
-rz(pi/2) q[95];
-sx q[95];
-rz(pi/2) q[95];
-rz(1.42863093678434e-12) q[96];
-cx q[96],q[56];
-rz(-1.42863093678434e-12) q[56];
-cx q[96],q[56];
-rz(1.42863093678434e-12) q[56];
-rz(2.85726187356867e-12) q[96];
-cx q[96],q[57];
-rz(-2.85726187356867e-12) q[57];
-cx q[96],q[57];
-rz(2.85726187356867e-12) q[57];
-rz(5.71452374713734e-12) q[96];
-cx q[96],q[58];
-rz(-5.71452374713734e-12) q[58];
-cx q[96],q[58];
-rz(5.71452374713734e-12) q[58];
-rz(1.14290474942747e-11) q[96];
-cx q[96],q[59];
-rz(-1.14290474942747e-11) q[59];
-cx q[96],q[59];
-rz(1.14290474942747e-11) q[59];
-rz(2.28580949885494e-11) q[96];
-cx q[96],q[60];
-rz(-2.28580949885494e-11) q[60];
-cx q[96],q[60];
-rz(2.28580949885494e-11) q[60];
-rz(4.57161899770987e-11) q[96];
-cx q[96],q[61];
-rz(-4.57161899770987e-11) q[61];
-cx q[96],q[61];
-rz(4.57161899770987e-11) q[61];
-rz(9.14323799541975e-11) q[96];
-cx q[96],q[62];
-rz(-9.14323799541975e-11) q[62];
-cx q[96],q[62];
-rz(9.14323799541975e-11) q[62];
-rz(1.82864759908395e-10) q[96];
-cx q[96],q[63];
-rz(-1.82864759908395e-10) q[63];
-cx q[96],q[63];
-rz(1.82864759908395e-10) q[63];
-rz(3.6572951981679e-10) q[96];
-cx q[96],q[64];
-rz(-3.6572951981679e-10) q[64];
-cx q[96],q[64];
-rz(3.6572951981679e-10) q[64];
-rz(7.3145903963358e-10) q[96];
-cx q[96],q[65];
-rz(-7.3145903963358e-10) q[65];
-cx q[96],q[65];
-rz(7.3145903963358e-10) q[65];
-rz(pi/2147483648) q[96];
-cx q[96],q[66];
-rz(-pi/2147483648) q[66];
-cx q[96],q[66];
-rz(pi/2147483648) q[66];
-rz(pi/1073741824) q[96];
-cx q[96],q[67];
-rz(-pi/1073741824) q[67];
-cx q[96],q[67];
-rz(pi/1073741824) q[67];
-rz(pi/536870912) q[96];
-cx q[96],q[68];
-rz(-pi/536870912) q[68];
-cx q[96],q[68];
-rz(pi/536870912) q[68];
-rz(pi/268435456) q[96];
-cx q[96],q[69];
-rz(-pi/268435456) q[69];
-cx q[96],q[69];
-rz(pi/268435456) q[69];
-rz(pi/134217728) q[96];
-cx q[96],q[70];
-rz(-pi/134217728) q[70];
-cx q[96],q[70];
-rz(pi/134217728) q[70];
-rz(pi/67108864) q[96];
-cx q[96],q[71];
-rz(-pi/67108864) q[71];
-cx q[96],q[71];
-rz(pi/67108864) q[71];
-rz(pi/33554432) q[96];
-cx q[96],q[72];
-rz(-pi/33554432) q[72];
-cx q[96],q[72];
-rz(pi/33554432) q[72];
-rz(pi/16777216) q[96];
-cx q[96],q[73];
-rz(-pi/16777216) q[73];
-cx q[96],q[73];
-rz(pi/16777216) q[73];
-rz(pi/8388608) q[96];
-cx q[96],q[74];
-rz(-pi/8388608) q[74];
-cx q[96],q[74];
-rz(pi/8388608) q[74];
-rz(pi/4194304) q[96];
-cx q[96],q[75];
-rz(-pi/4194304) q[75];
-cx q[96],q[75];
-rz(pi/4194304) q[75];
-rz(pi/2097152) q[96];
-cx q[96],q[76];
-rz(-pi/2097152) q[76];
-cx q[96],q[76];
-rz(pi/2097152) q[76];
-rz(pi/1048576) q[96];
-cx q[96],q[77];
-rz(-pi/1048576) q[77];
-cx q[96],q[77];
-rz(pi/1048576) q[77];
-rz(pi/524288) q[96];
-cx q[96],q[78];
-rz(-pi/524288) q[78];
-cx q[96],q[78];
-rz(pi/524288) q[78];
-rz(pi/262144) q[96];
-cx q[96],q[79];
-rz(-pi/262144) q[79];
-cx q[96],q[79];
-rz(pi/262144) q[79];
-rz(pi/131072) q[96];
-cx q[96],q[80];
-rz(-pi/131072) q[80];
-cx q[96],q[80];
-rz(pi/131072) q[80];
-rz(pi/65536) q[96];
-cx q[96],q[81];
-rz(-pi/65536) q[81];
-cx q[96],q[81];
-rz(pi/65536) q[81];
-rz(pi/32768) q[96];
-cx q[96],q[82];
-rz(-pi/32768) q[82];
-cx q[96],q[82];
-rz(pi/32768) q[82];
-rz(pi/16384) q[96];
-cx q[96],q[83];
-rz(-pi/16384) q[83];
-cx q[96],q[83];
-rz(pi/16384) q[83];
-rz(pi/8192) q[96];
-cx q[96],q[84];
-rz(-pi/8192) q[84];
-cx q[96],q[84];
-rz(pi/8192) q[84];
-rz(pi/4096) q[96];
-cx q[96],q[85];
-rz(-pi/4096) q[85];
-cx q[96],q[85];
-rz(pi/4096) q[85];
-rz(pi/2048) q[96];
-cx q[96],q[86];
-rz(-pi/2048) q[86];
-cx q[96],q[86];
-rz(pi/2048) q[86];
-rz(pi/1024) q[96];
-cx q[96],q[87];
-rz(-pi/1024) q[87];
-cx q[96],q[87];
-rz(pi/1024) q[87];
-rz(pi/512) q[96];
-cx q[96],q[88];
-rz(-pi/512) q[88];
-cx q[96],q[88];
-rz(pi/512) q[88];
-rz(pi/256) q[96];
-cx q[96],q[89];
-rz(-pi/256) q[89];
-cx q[96],q[89];
-rz(pi/256) q[89];
-rz(pi/128) q[96];
-cx q[96],q[90];
-rz(-pi/128) q[90];
-cx q[96],q[90];
-rz(pi/128) q[90];
-rz(pi/64) q[96];
-cx q[96],q[91];
-rz(-pi/64) q[91];
-cx q[96],q[91];
-rz(pi/64) q[91];
-rz(pi/32) q[96];
-cx q[96],q[92];
-rz(-pi/32) q[92];
-cx q[96],q[92];
-rz(pi/32) q[92];
-rz(pi/16) q[96];
-cx q[96],q[93];
-rz(-pi/16) q[93];
-cx q[96],q[93];
-rz(pi/16) q[93];
-rz(pi/8) q[96];
-cx q[96],q[94];
-rz(-pi/8) q[94];
-cx q[96],q[94];
-rz(pi/8) q[94];
-rz(pi/4) q[96];
-cx q[96],q[95];
-rz(-pi/4) q[95];
-cx q[96],q[95];
-rz(pi/4) q[95];
-rz(pi/2) q[96];
-sx q[96];
-rz(pi/2) q[96];
-rz(1.42863093678434e-12) q[97];
-cx q[97],q[57];
-rz(-1.42863093678434e-12) q[57];
-cx q[97],q[57];
-rz(1.42863093678434e-12) q[57];
-rz(2.85726187356867e-12) q[97];
-cx q[97],q[58];
-rz(-2.85726187356867e-12) q[58];
-cx q[97],q[58];
-rz(2.85726187356867e-12) q[58];
-rz(5.71452374713734e-12) q[97];
-cx q[97],q[59];
-rz(-5.71452374713734e-12) q[59];
-cx q[97],q[59];
-rz(5.71452374713734e-12) q[59];
-rz(1.14290474942747e-11) q[97];
-cx q[97],q[60];
-rz(-1.14290474942747e-11) q[60];
-cx q[97],q[60];
-rz(1.14290474942747e-11) q[60];
-rz(2.28580949885494e-11) q[97];
-cx q[97],q[61];
-rz(-2.28580949885494e-11) q[61];
-cx q[97],q[61];
-rz(2.28580949885494e-11) q[61];
-rz(4.57161899770987e-11) q[97];
-cx q[97],q[62];
-rz(-4.57161899770987e-11) q[62];
-cx q[97],q[62];
-rz(4.57161899770987e-11) q[62];
-rz(9.14323799541975e-11) q[97];
-cx q[97],q[63];
-rz(-9.14323799541975e-11) q[63];
-cx q[97],q[63];
-rz(9.14323799541975e-11) q[63];
-rz(1.82864759908395e-10) q[97];
-cx q[97],q[64];
-rz(-1.82864759908395e-10) q[64];
-cx q[97],q[64];
-rz(1.82864759908395e-10) q[64];
-rz(3.6572951981679e-10) q[97];
-cx q[97],q[65];
-rz(-3.6572951981679e-10) q[65];
-cx q[97],q[65];
-rz(3.6572951981679e-10) q[65];
-rz(7.3145903963358e-10) q[97];
-cx q[97],q[66];
-rz(-7.3145903963358e-10) q[66];
-cx q[97],q[66];
-rz(7.3145903963358e-10) q[66];
-rz(pi/2147483648) q[97];
-cx q[97],q[67];
-rz(-pi/2147483648) q[67];
-cx q[97],q[67];
-rz(pi/2147483648) q[67];
-rz(pi/1073741824) q[97];
-cx q[97],q[68];
-rz(-pi/1073741824) q[68];
-cx q[97],q[68];
-rz(pi/1073741824) q[68];
-rz(pi/536870912) q[97];
-cx q[97],q[69];
-rz(-pi/536870912) q[69];
-cx q[97],q[69];
-rz(pi/536870912) q[69];
-rz(pi/268435456) q[97];
-cx q[97],q[70];
-rz(-pi/268435456) q[70];
-cx q[97],q[70];
-rz(pi/268435456) q[70];
-rz(pi/134217728) q[97];
-cx q[97],q[71];
-rz(-pi/134217728) q[71];
-cx q[97],q[71];
-rz(pi/134217728) q[71];
-rz(pi/67108864) q[97];
-cx q[97],q[72];
-rz(-pi/67108864) q[72];
-cx q[97],q[72];
-rz(pi/67108864) q[72];
-rz(pi/33554432) q[97];
-cx q[97],q[73];
-rz(-pi/33554432) q[73];
-cx q[97],q[73];
-rz(pi/33554432) q[73];
-rz(pi/16777216) q[97];
-cx q[97],q[74];
-rz(-pi/16777216) q[74];
-cx q[97],q[74];
-rz(pi/16777216) q[74];
-rz(pi/8388608) q[97];
-cx q[97],q[75];
-rz(-pi/8388608) q[75];
-cx q[97],q[75];
-rz(pi/8388608) q[75];
-rz(pi/4194304) q[97];
-cx q[97],q[76];
-rz(-pi/4194304) q[76];
-cx q[97],q[76];
-rz(pi/4194304) q[76];
-rz(pi/2097152) q[97];
-cx q[97],q[77];
-rz(-pi/2097152) q[77];
-cx q[97],q[77];
-rz(pi/2097152) q[77];
-rz(pi/1048576) q[97];
-cx q[97],q[78];
-rz(-pi/1048576) q[78];
-cx q[97],q[78];
-rz(pi/1048576) q[78];
-rz(pi/524288) q[97];
-cx q[97],q[79];
-rz(-pi/524288) q[79];
-cx q[97],q[79];
-rz(pi/524288) q[79];
-rz(pi/262144) q[97];
-cx q[97],q[80];
-rz(-pi/262144) q[80];
-cx q[97],q[80];
-rz(pi/262144) q[80];
-rz(pi/131072) q[97];
-cx q[97],q[81];
-rz(-pi/131072) q[81];
-cx q[97],q[81];
-rz(pi/131072) q[81];
-rz(pi/65536) q[97];
-cx q[97],q[82];
-rz(-pi/65536) q[82];
-cx q[97],q[82];
-rz(pi/65536) q[82];
-rz(pi/32768) q[97];
-cx q[97],q[83];
-rz(-pi/32768) q[83];
-cx q[97],q[83];
-rz(pi/32768) q[83];
-rz(pi/16384) q[97];
-cx q[97],q[84];
-rz(-pi/16384) q[84];
-cx q[97],q[84];
-rz(pi/16384) q[84];
-rz(pi/8192) q[97];
-cx q[97],q[85];
-rz(-pi/8192) q[85];
-cx q[97],q[85];
-rz(pi/8192) q[85];
-rz(pi/4096) q[97];
-cx q[97],q[86];
-rz(-pi/4096) q[86];
-cx q[97],q[86];
-rz(pi/4096) q[86];
-rz(pi/2048) q[97];
-cx q[97],q[87];
-rz(-pi/2048) q[87];
-cx q[97],q[87];
-rz(pi/2048) q[87];
-rz(pi/1024) q[97];
-cx q[97],q[88];
-rz(-pi/1024) q[88];
-cx q[97],q[88];
-rz(pi/1024) q[88];
-rz(pi/512) q[97];
-cx q[97],q[89];
-rz(-pi/512) q[89];
-cx q[97],q[89];
-rz(pi/512) q[89];
-rz(pi/256) q[97];
-cx q[97],q[90];
-rz(-pi/256) q[90];
-cx q[97],q[90];
-rz(pi/256) q[90];
-rz(pi/128) q[97];
-cx q[97],q[91];
-rz(-pi/128) q[91];
-cx q[97],q[91];
-rz(pi/128) q[91];
-rz(pi/64) q[97];
-cx q[97],q[92];
-rz(-pi/64) q[92];
-cx q[97],q[92];
-rz(pi/64) q[92];
-rz(pi/32) q[97];
-cx q[97],q[93];
-rz(-pi/32) q[93];
-cx q[97],q[93];
-rz(pi/32) q[93];
-rz(pi/16) q[97];
-cx q[97],q[94];
-rz(-pi/16) q[94];
-cx q[97],q[94];
-rz(pi/16) q[94];
-rz(pi/8) q[97];
-cx q[97],q[95];
-rz(-pi/8) q[95];
-cx q[97],q[95];
-rz(pi/8) q[95];
-rz(pi/4) q[97];
-cx q[97],q[96];
-rz(-pi/4) q[96];
-cx q[97],q[96];
-rz(pi/4) q[96];
-rz(pi/2) q[97];
-sx q[97];
-rz(pi/2) q[97];
-rz(1.42863093678434e-12) q[98];
-cx q[98],q[58];
-rz(-1.42863093678434e-12) q[58];
-cx q[98],q[58];
-rz(1.42863093678434e-12) q[58];
-rz(2.85726187356867e-12) q[98];
-cx q[98],q[59];
-rz(-2.85726187356867e-12) q[59];
-cx q[98],q[59];
-rz(2.85726187356867e-12) q[59];
-rz(5.71452374713734e-12) q[98];
-cx q[98],q[60];
-rz(-5.71452374713734e-12) q[60];
-cx q[98],q[60];
-rz(5.71452374713734e-12) q[60];
-rz(1.14290474942747e-11) q[98];
-cx q[98],q[61];
-rz(-1.14290474942747e-11) q[61];
-cx q[98],q[61];
-rz(1.14290474942747e-11) q[61];
-rz(2.28580949885494e-11) q[98];
-cx q[98],q[62];
-rz(-2.28580949885494e-11) q[62];
-cx q[98],q[62];
-rz(2.28580949885494e-11) q[62];
-rz(4.57161899770987e-11) q[98];
-cx q[98],q[63];
-rz(-4.57161899770987e-11) q[63];
-cx q[98],q[63];
-rz(4.57161899770987e-11) q[63];
-rz(9.14323799541975e-11) q[98];
-cx q[98],q[64];
-rz(-9.14323799541975e-11) q[64];
-cx q[98],q[64];
-rz(9.14323799541975e-11) q[64];
-rz(1.82864759908395e-10) q[98];
-cx q[98],q[65];
-rz(-1.82864759908395e-10) q[65];
-cx q[98],q[65];
-rz(1.82864759908395e-10) q[65];
-rz(3.6572951981679e-10) q[98];
-cx q[98],q[66];
-rz(-3.6572951981679e-10) q[66];
-cx q[98],q[66];
-rz(3.6572951981679e-10) q[66];
-rz(7.3145903963358e-10) q[98];
-cx q[98],q[67];
-rz(-7.3145903963358e-10) q[67];
-cx q[98],q[67];
-rz(7.3145903963358e-10) q[67];
-rz(pi/2147483648) q[98];
-cx q[98],q[68];
-rz(-pi/2147483648) q[68];
-cx q[98],q[68];
-rz(pi/2147483648) q[68];
-rz(pi/1073741824) q[98];
-cx q[98],q[69];
-rz(-pi/1073741824) q[69];
-cx q[98],q[69];
-rz(pi/1073741824) q[69];
-rz(pi/536870912) q[98];
-cx q[98],q[70];
-rz(-pi/536870912) q[70];
-cx q[98],q[70];
-rz(pi/536870912) q[70];
-rz(pi/268435456) q[98];
-cx q[98],q[71];
-rz(-pi/268435456) q[71];
-cx q[98],q[71];
-rz(pi/268435456) q[71];
-rz(pi/134217728) q[98];
-cx q[98],q[72];
-rz(-pi/134217728) q[72];
-cx q[98],q[72];
-rz(pi/134217728) q[72];
-rz(pi/67108864) q[98];
-cx q[98],q[73];
-rz(-pi/67108864) q[73];
-cx q[98],q[73];
-rz(pi/67108864) q[73];
-rz(pi/33554432) q[98];
-cx q[98],q[74];
-rz(-pi/33554432) q[74];
-cx q[98],q[74];
-rz(pi/33554432) q[74];
-rz(pi/16777216) q[98];
-cx q[98],q[75];
-rz(-pi/16777216) q[75];
-cx q[98],q[75];
-rz(pi/16777216) q[75];
-rz(pi/8388608) q[98];
-cx q[98],q[76];
-rz(-pi/8388608) q[76];
-cx q[98],q[76];
-rz(pi/8388608) q[76];
-rz(pi/4194304) q[98];
-cx q[98],q[77];
-rz(-pi/4194304) q[77];
-cx q[98],q[77];
-rz(pi/4194304) q[77];
-rz(pi/2097152) q[98];
-cx q[98],q[78];
-rz(-pi/2097152) q[78];
-cx q[98],q[78];
-rz(pi/2097152) q[78];
-rz(pi/1048576) q[98];
-cx q[98],q[79];
-rz(-pi/1048576) q[79];
-cx q[98],q[79];
-rz(pi/1048576) q[79];
-rz(pi/524288) q[98];
-cx q[98],q[80];
-rz(-pi/524288) q[80];
-cx q[98],q[80];
-rz(pi/524288) q[80];
-rz(pi/262144) q[98];
-cx q[98],q[81];
-rz(-pi/262144) q[81];
-cx q[98],q[81];
-rz(pi/262144) q[81];
-rz(pi/131072) q[98];
-cx q[98],q[82];
-rz(-pi/131072) q[82];
-cx q[98],q[82];
-rz(pi/131072) q[82];
-rz(pi/65536) q[98];
-cx q[98],q[83];
-rz(-pi/65536) q[83];
-cx q[98],q[83];
-rz(pi/65536) q[83];
-rz(pi/32768) q[98];
-cx q[98],q[84];
-rz(-pi/32768) q[84];
-cx q[98],q[84];
-rz(pi/32768) q[84];
-rz(pi/16384) q[98];
-cx q[98],q[85];
-rz(-pi/16384) q[85];
-cx q[98],q[85];
-rz(pi/16384) q[85];
-rz(pi/8192) q[98];
-cx q[98],q[86];
-rz(-pi/8192) q[86];
-cx q[98],q[86];
-rz(pi/8192) q[86];
-rz(pi/4096) q[98];
-cx q[98],q[87];
-rz(-pi/4096) q[87];
-cx q[98],q[87];
-rz(pi/4096) q[87];
-rz(pi/2048) q[98];
-cx q[98],q[88];
-rz(-pi/2048) q[88];
-cx q[98],q[88];
-rz(pi/2048) q[88];
-rz(pi/1024) q[98];
-cx q[98],q[89];
-rz(-pi/1024) q[89];
-cx q[98],q[89];
-rz(pi/1024) q[89];
-rz(pi/512) q[98];
-cx q[98],q[90];
-rz(-pi/512) q[90];
-cx q[98],q[90];
-rz(pi/512) q[90];
-rz(pi/256) q[98];
-cx q[98],q[91];
-rz(-pi/256) q[91];
-cx q[98],q[91];
-rz(pi/256) q[91];
-rz(pi/128) q[98];
-cx q[98],q[92];
-rz(-pi/128) q[92];
-cx q[98],q[92];
-rz(pi/128) q[92];
-rz(pi/64) q[98];
-cx q[98],q[93];
-rz(-pi/64) q[93];
-cx q[98],q[93];
-rz(pi/64) q[93];
-rz(pi/32) q[98];
-cx q[98],q[94];
-rz(-pi/32) q[94];
-cx q[98],q[94];
-rz(pi/32) q[94];
-rz(pi/16) q[98];
-cx q[98],q[95];
-rz(-pi/16) q[95];
-cx q[98],q[95];
-rz(pi/16) q[95];
-rz(pi/8) q[98];
-cx q[98],q[96];
-rz(-pi/8) q[96];
-cx q[98],q[96];
-rz(pi/8) q[96];
-rz(pi/4) q[98];
-cx q[98],q[97];
-rz(-pi/4) q[97];
-cx q[98],q[97];
-rz(pi/4) q[97];
-rz(pi/2) q[98];
-sx q[98];
-rz(pi/2) q[98];
-rz(1.42863093678434e-12) q[99];
-cx q[99],q[59];
-rz(-1.42863093678434e-12) q[59];
-cx q[99],q[59];
-rz(1.42863093678434e-12) q[59];
-rz(2.85726187356867e-12) q[99];
-cx q[99],q[60];
-rz(-2.85726187356867e-12) q[60];
-cx q[99],q[60];
-rz(2.85726187356867e-12) q[60];
-rz(5.71452374713734e-12) q[99];
-cx q[99],q[61];
-rz(-5.71452374713734e-12) q[61];
-cx q[99],q[61];
-rz(5.71452374713734e-12) q[61];
-rz(1.14290474942747e-11) q[99];
-cx q[99],q[62];
-rz(-1.14290474942747e-11) q[62];
-cx q[99],q[62];
-rz(1.14290474942747e-11) q[62];
-rz(2.28580949885494e-11) q[99];
-cx q[99],q[63];
-rz(-2.28580949885494e-11) q[63];
-cx q[99],q[63];
-rz(2.28580949885494e-11) q[63];
-rz(4.57161899770987e-11) q[99];
-cx q[99],q[64];
-rz(-4.57161899770987e-11) q[64];
-cx q[99],q[64];
-rz(4.57161899770987e-11) q[64];
-rz(9.14323799541975e-11) q[99];
-cx q[99],q[65];
-rz(-9.14323799541975e-11) q[65];
-cx q[99],q[65];
-rz(9.14323799541975e-11) q[65];
-rz(1.82864759908395e-10) q[99];
-cx q[99],q[66];
-rz(-1.82864759908395e-10) q[66];
-cx q[99],q[66];
-rz(1.82864759908395e-10) q[66];
-rz(3.6572951981679e-10) q[99];
-cx q[99],q[67];
-rz(-3.6572951981679e-10) q[67];
-cx q[99],q[67];
-rz(3.6572951981679e-10) q[67];
-rz(7.3145903963358e-10) q[99];
-cx q[99],q[68];
-rz(-7.3145903963358e-10) q[68];
-cx q[99],q[68];
-rz(7.3145903963358e-10) q[68];
-rz(pi/2147483648) q[99];
-cx q[99],q[69];
-rz(-pi/2147483648) q[69];
-cx q[99],q[69];
-rz(pi/2147483648) q[69];
-rz(pi/1073741824) q[99];
-cx q[99],q[70];
-rz(-pi/1073741824) q[70];
-cx q[99],q[70];
-rz(pi/1073741824) q[70];
-rz(pi/536870912) q[99];
-cx q[99],q[71];
-rz(-pi/536870912) q[71];
-cx q[99],q[71];
-rz(pi/536870912) q[71];
-rz(pi/268435456) q[99];
-cx q[99],q[72];
-rz(-pi/268435456) q[72];
-cx q[99],q[72];
-rz(pi/268435456) q[72];
-rz(pi/134217728) q[99];
-cx q[99],q[73];
-rz(-pi/134217728) q[73];
-cx q[99],q[73];
-rz(pi/134217728) q[73];
-rz(pi/67108864) q[99];
-cx q[99],q[74];
-rz(-pi/67108864) q[74];
-cx q[99],q[74];
-rz(pi/67108864) q[74];
-rz(pi/33554432) q[99];
-cx q[99],q[75];
-rz(-pi/33554432) q[75];
-cx q[99],q[75];
-rz(pi/33554432) q[75];
-rz(pi/16777216) q[99];
-cx q[99],q[76];
-rz(-pi/16777216) q[76];
-cx q[99],q[76];
-rz(pi/16777216) q[76];
-rz(pi/8388608) q[99];
-cx q[99],q[77];
-rz(-pi/8388608) q[77];
-cx q[99],q[77];
-rz(pi/8388608) q[77];
-rz(pi/4194304) q[99];
-cx q[99],q[78];
-rz(-pi/4194304) q[78];
-cx q[99],q[78];
-rz(pi/4194304) q[78];
-rz(pi/2097152) q[99];
-cx q[99],q[79];
-rz(-pi/2097152) q[79];
-cx q[99],q[79];
-rz(pi/2097152) q[79];
-rz(pi/1048576) q[99];
-cx q[99],q[80];
-rz(-pi/1048576) q[80];
-cx q[99],q[80];
-rz(pi/1048576) q[80];
-rz(pi/524288) q[99];
-cx q[99],q[81];
-rz(-pi/524288) q[81];
-cx q[99],q[81];
-rz(pi/524288) q[81];
-rz(pi/262144) q[99];
-cx q[99],q[82];
-rz(-pi/262144) q[82];
-cx q[99],q[82];
-rz(pi/262144) q[82];
-rz(pi/131072) q[99];
-cx q[99],q[83];
-rz(-pi/131072) q[83];
-cx q[99],q[83];
-rz(pi/131072) q[83];
-rz(pi/65536) q[99];
-cx q[99],q[84];
-rz(-pi/65536) q[84];
-cx q[99],q[84];
-rz(pi/65536) q[84];
-rz(pi/32768) q[99];
-cx q[99],q[85];
-rz(-pi/32768) q[85];
-cx q[99],q[85];
-rz(pi/32768) q[85];
-rz(pi/16384) q[99];
-cx q[99],q[86];
-rz(-pi/16384) q[86];
-cx q[99],q[86];
-rz(pi/16384) q[86];
-rz(pi/8192) q[99];
-cx q[99],q[87];
-rz(-pi/8192) q[87];
-cx q[99],q[87];
-rz(pi/8192) q[87];
-rz(pi/4096) q[99];
-cx q[99],q[88];
-rz(-pi/4096) q[88];
-cx q[99],q[88];
-rz(pi/4096) q[88];
-rz(pi/2048) q[99];
-cx q[99],q[89];
-rz(-pi/2048) q[89];
-cx q[99],q[89];
-rz(pi/2048) q[89];
-rz(pi/1024) q[99];
-cx q[99],q[90];
-rz(-pi/1024) q[90];
-cx q[99],q[90];
-rz(pi/1024) q[90];
-rz(pi/512) q[99];
-cx q[99],q[91];
-rz(-pi/512) q[91];
-cx q[99],q[91];
-rz(pi/512) q[91];
-rz(pi/256) q[99];
-cx q[99],q[92];
-rz(-pi/256) q[92];
-cx q[99],q[92];
-rz(pi/256) q[92];
-rz(pi/128) q[99];
-cx q[99],q[93];
-rz(-pi/128) q[93];
-cx q[99],q[93];
-rz(pi/128) q[93];
-rz(pi/64) q[99];
-cx q[99],q[94];
-rz(-pi/64) q[94];
-cx q[99],q[94];
-rz(pi/64) q[94];
-rz(pi/32) q[99];
-cx q[99],q[95];
-rz(-pi/32) q[95];
-cx q[99],q[95];
-rz(pi/32) q[95];
-rz(pi/16) q[99];
-cx q[99],q[96];
-rz(-pi/16) q[96];
-cx q[99],q[96];
-rz(pi/16) q[96];
-rz(pi/8) q[99];
-cx q[99],q[97];
-rz(-pi/8) q[97];
-cx q[99],q[97];
-rz(pi/8) q[97];
-rz(pi/4) q[99];
-cx q[99],q[98];
-rz(-pi/4) q[98];
-cx q[99],q[98];
-rz(pi/4) q[98];
-rz(pi/2) q[99];
-sx q[99];
-rz(pi/2) q[99];
-rz(1.42863093678434e-12) q[100];
-cx q[100],q[60];
-rz(-1.42863093678434e-12) q[60];
-cx q[100],q[60];
-rz(2.85726187356867e-12) q[100];
-cx q[100],q[61];
-rz(1.42863093678434e-12) q[60];
-rz(-2.85726187356867e-12) q[61];
-cx q[100],q[61];
-rz(5.71452374713734e-12) q[100];
-cx q[100],q[62];
-rz(2.85726187356867e-12) q[61];
-rz(-5.71452374713734e-12) q[62];
-cx q[100],q[62];
-rz(1.14290474942747e-11) q[100];
-cx q[100],q[63];
-rz(5.71452374713734e-12) q[62];
-rz(-1.14290474942747e-11) q[63];
-cx q[100],q[63];
-rz(2.28580949885494e-11) q[100];
-cx q[100],q[64];
-rz(1.14290474942747e-11) q[63];
-rz(-2.28580949885494e-11) q[64];
-cx q[100],q[64];
-rz(4.57161899770987e-11) q[100];
-cx q[100],q[65];
-rz(2.28580949885494e-11) q[64];
-rz(-4.57161899770987e-11) q[65];
-cx q[100],q[65];
-rz(9.14323799541975e-11) q[100];
-cx q[100],q[66];
-rz(4.57161899770987e-11) q[65];
-rz(-9.14323799541975e-11) q[66];
-cx q[100],q[66];
-rz(1.82864759908395e-10) q[100];
-cx q[100],q[67];
-rz(9.14323799541975e-11) q[66];
-rz(-1.82864759908395e-10) q[67];
-cx q[100],q[67];
-rz(3.6572951981679e-10) q[100];
-cx q[100],q[68];
-rz(1.82864759908395e-10) q[67];
-rz(-3.6572951981679e-10) q[68];
-cx q[100],q[68];
-rz(7.3145903963358e-10) q[100];
-cx q[100],q[69];
-rz(3.6572951981679e-10) q[68];
-rz(-7.3145903963358e-10) q[69];
-cx q[100],q[69];
-rz(pi/2147483648) q[100];
-cx q[100],q[70];
-rz(7.3145903963358e-10) q[69];
-rz(-pi/2147483648) q[70];
-cx q[100],q[70];
-rz(pi/1073741824) q[100];
-cx q[100],q[71];
-rz(pi/2147483648) q[70];
-rz(-pi/1073741824) q[71];
-cx q[100],q[71];
-rz(pi/536870912) q[100];
-cx q[100],q[72];
-rz(pi/1073741824) q[71];
-rz(-pi/536870912) q[72];
-cx q[100],q[72];
-rz(pi/268435456) q[100];
-cx q[100],q[73];
-rz(pi/536870912) q[72];
-rz(-pi/268435456) q[73];
-cx q[100],q[73];
-rz(pi/134217728) q[100];
-cx q[100],q[74];
-rz(pi/268435456) q[73];
-rz(-pi/134217728) q[74];
-cx q[100],q[74];
-rz(pi/67108864) q[100];
-cx q[100],q[75];
-rz(pi/134217728) q[74];
-rz(-pi/67108864) q[75];
-cx q[100],q[75];
-rz(pi/33554432) q[100];
-cx q[100],q[76];
-rz(pi/67108864) q[75];
-rz(-pi/33554432) q[76];
-cx q[100],q[76];
-rz(pi/16777216) q[100];
-cx q[100],q[77];
-rz(pi/33554432) q[76];
-rz(-pi/16777216) q[77];
-cx q[100],q[77];
-rz(pi/8388608) q[100];
-cx q[100],q[78];
-rz(pi/16777216) q[77];
-rz(-pi/8388608) q[78];
-cx q[100],q[78];
-rz(pi/4194304) q[100];
-cx q[100],q[79];
-rz(pi/8388608) q[78];
-rz(-pi/4194304) q[79];
-cx q[100],q[79];
-rz(pi/2097152) q[100];
-cx q[100],q[80];
-rz(pi/4194304) q[79];
-rz(-pi/2097152) q[80];
-cx q[100],q[80];
-rz(pi/1048576) q[100];
-cx q[100],q[81];
-rz(pi/2097152) q[80];
-rz(-pi/1048576) q[81];
-cx q[100],q[81];
-rz(pi/524288) q[100];
-cx q[100],q[82];
-rz(pi/1048576) q[81];
-rz(-pi/524288) q[82];
-cx q[100],q[82];
-rz(pi/262144) q[100];
-cx q[100],q[83];
-rz(pi/524288) q[82];
-rz(-pi/262144) q[83];
-cx q[100],q[83];
-rz(pi/131072) q[100];
-cx q[100],q[84];
-rz(pi/262144) q[83];
-rz(-pi/131072) q[84];
-cx q[100],q[84];
-rz(pi/65536) q[100];
-cx q[100],q[85];
-rz(pi/131072) q[84];
-rz(-pi/65536) q[85];
-cx q[100],q[85];
-rz(pi/32768) q[100];
-cx q[100],q[86];
-rz(pi/65536) q[85];
-rz(-pi/32768) q[86];
-cx q[100],q[86];
-rz(pi/16384) q[100];
-cx q[100],q[87];
-rz(pi/32768) q[86];
-rz(-pi/16384) q[87];
-cx q[100],q[87];
-rz(pi/8192) q[100];
-cx q[100],q[88];
-rz(pi/16384) q[87];
-rz(-pi/8192) q[88];
-cx q[100],q[88];
-rz(pi/4096) q[100];
-cx q[100],q[89];
-rz(pi/8192) q[88];
-rz(-pi/4096) q[89];
-cx q[100],q[89];
-rz(pi/2048) q[100];
-cx q[100],q[90];
-rz(pi/4096) q[89];
-rz(-pi/2048) q[90];
-cx q[100],q[90];
-rz(pi/1024) q[100];
-cx q[100],q[91];
-rz(pi/2048) q[90];
-rz(-pi/1024) q[91];
-cx q[100],q[91];
-rz(pi/512) q[100];
-cx q[100],q[92];
-rz(pi/1024) q[91];
-rz(-pi/512) q[92];
-cx q[100],q[92];
-rz(pi/256) q[100];
-cx q[100],q[93];
-rz(pi/512) q[92];
-rz(-pi/256) q[93];
-cx q[100],q[93];
-rz(pi/128) q[100];
-cx q[100],q[94];
-rz(pi/256) q[93];
-rz(-pi/128) q[94];
-cx q[100],q[94];
-rz(pi/64) q[100];
-cx q[100],q[95];
-rz(pi/128) q[94];
-rz(-pi/64) q[95];
-cx q[100],q[95];
-rz(pi/32) q[100];
-cx q[100],q[96];
-rz(pi/64) q[95];
-rz(-pi/32) q[96];
-cx q[100],q[96];
-rz(pi/16) q[100];
-cx q[100],q[97];
-rz(pi/32) q[96];
-rz(-pi/16) q[97];
-cx q[100],q[97];
-rz(pi/8) q[100];
-cx q[100],q[98];
-rz(pi/16) q[97];
-rz(-pi/8) q[98];
-cx q[100],q[98];
-rz(pi/4) q[100];
-cx q[100],q[99];
-rz(pi/8) q[98];
-rz(-pi/4) q[99];
-cx q[100],q[99];
-rz(pi/2) q[100];
-sx q[100];
-rz(pi/2) q[100];
-rz(pi/4) q[99];
-rz(1.42863093678434e-12) q[101];
-cx q[101],q[61];
-rz(-1.42863093678434e-12) q[61];
-cx q[101],q[61];
-rz(2.85726187356867e-12) q[101];
-cx q[101],q[62];
-rz(1.42863093678434e-12) q[61];
-rz(-2.85726187356867e-12) q[62];
-cx q[101],q[62];
-rz(5.71452374713734e-12) q[101];
-cx q[101],q[63];
-rz(2.85726187356867e-12) q[62];
-rz(-5.71452374713734e-12) q[63];
-cx q[101],q[63];
-rz(1.14290474942747e-11) q[101];
-cx q[101],q[64];
-rz(5.71452374713734e-12) q[63];
-rz(-1.14290474942747e-11) q[64];
-cx q[101],q[64];
-rz(2.28580949885494e-11) q[101];
-cx q[101],q[65];
-rz(1.14290474942747e-11) q[64];
-rz(-2.28580949885494e-11) q[65];
-cx q[101],q[65];
-rz(4.57161899770987e-11) q[101];
-cx q[101],q[66];
-rz(2.28580949885494e-11) q[65];
-rz(-4.57161899770987e-11) q[66];
-cx q[101],q[66];
-rz(9.14323799541975e-11) q[101];
-cx q[101],q[67];
-rz(4.57161899770987e-11) q[66];
-rz(-9.14323799541975e-11) q[67];
-cx q[101],q[67];
-rz(1.82864759908395e-10) q[101];
-cx q[101],q[68];
-rz(9.14323799541975e-11) q[67];
-rz(-1.82864759908395e-10) q[68];
-cx q[101],q[68];
-rz(3.6572951981679e-10) q[101];
-cx q[101],q[69];
-rz(1.82864759908395e-10) q[68];
-rz(-3.6572951981679e-10) q[69];
-cx q[101],q[69];
-rz(7.3145903963358e-10) q[101];
-cx q[101],q[70];
-rz(3.6572951981679e-10) q[69];
-rz(-7.3145903963358e-10) q[70];
-cx q[101],q[70];
-rz(pi/2147483648) q[101];
-cx q[101],q[71];
-rz(7.3145903963358e-10) q[70];
-rz(-pi/2147483648) q[71];
-cx q[101],q[71];
-rz(pi/1073741824) q[101];
-cx q[101],q[72];
-rz(pi/2147483648) q[71];
-rz(-pi/1073741824) q[72];
-cx q[101],q[72];
-rz(pi/536870912) q[101];
-cx q[101],q[73];
-rz(pi/1073741824) q[72];
-rz(-pi/536870912) q[73];
-cx q[101],q[73];
-rz(pi/268435456) q[101];
-cx q[101],q[74];
-rz(pi/536870912) q[73];
-rz(-pi/268435456) q[74];
-cx q[101],q[74];
-rz(pi/134217728) q[101];
-cx q[101],q[75];
-rz(pi/268435456) q[74];
-rz(-pi/134217728) q[75];
-cx q[101],q[75];
-rz(pi/67108864) q[101];
-cx q[101],q[76];
-rz(pi/134217728) q[75];
-rz(-pi/67108864) q[76];
-cx q[101],q[76];
-rz(pi/33554432) q[101];
-cx q[101],q[77];
-rz(pi/67108864) q[76];
-rz(-pi/33554432) q[77];
-cx q[101],q[77];
-rz(pi/16777216) q[101];
-cx q[101],q[78];
-rz(pi/33554432) q[77];
-rz(-pi/16777216) q[78];
-cx q[101],q[78];
-rz(pi/8388608) q[101];
-cx q[101],q[79];
-rz(pi/16777216) q[78];
-rz(-pi/8388608) q[79];
-cx q[101],q[79];
-rz(pi/4194304) q[101];
-cx q[101],q[80];
-rz(pi/8388608) q[79];
-rz(-pi/4194304) q[80];
-cx q[101],q[80];
-rz(pi/2097152) q[101];
-cx q[101],q[81];
-rz(pi/4194304) q[80];
-rz(-pi/2097152) q[81];
-cx q[101],q[81];
-rz(pi/1048576) q[101];
-cx q[101],q[82];
-rz(pi/2097152) q[81];
-rz(-pi/1048576) q[82];
-cx q[101],q[82];
-rz(pi/524288) q[101];
-cx q[101],q[83];
-rz(pi/1048576) q[82];
-rz(-pi/524288) q[83];
-cx q[101],q[83];
-rz(pi/262144) q[101];
-cx q[101],q[84];
-rz(pi/524288) q[83];
-rz(-pi/262144) q[84];
-cx q[101],q[84];
-rz(pi/131072) q[101];
-cx q[101],q[85];
-rz(pi/262144) q[84];
-rz(-pi/131072) q[85];
-cx q[101],q[85];
-rz(pi/65536) q[101];
-cx q[101],q[86];
-rz(pi/131072) q[85];
-rz(-pi/65536) q[86];
-cx q[101],q[86];
-rz(pi/32768) q[101];
-cx q[101],q[87];
-rz(pi/65536) q[86];
-rz(-pi/32768) q[87];
-cx q[101],q[87];
-rz(pi/16384) q[101];
-cx q[101],q[88];
-rz(pi/32768) q[87];
-rz(-pi/16384) q[88];
-cx q[101],q[88];
-rz(pi/8192) q[101];
-cx q[101],q[89];
-rz(pi/16384) q[88];
-rz(-pi/8192) q[89];
-cx q[101],q[89];
-rz(pi/4096) q[101];
-cx q[101],q[90];
-rz(pi/8192) q[89];
-rz(-pi/4096) q[90];
-cx q[101],q[90];
-rz(pi/2048) q[101];
-cx q[101],q[91];
-rz(pi/4096) q[90];
-rz(-pi/2048) q[91];
-cx q[101],q[91];
-rz(pi/1024) q[101];
-cx q[101],q[92];
-rz(pi/2048) q[91];
-rz(-pi/1024) q[92];
-cx q[101],q[92];
-rz(pi/512) q[101];
-cx q[101],q[93];
-rz(pi/1024) q[92];
-rz(-pi/512) q[93];
-cx q[101],q[93];
-rz(pi/256) q[101];
-cx q[101],q[94];
-rz(pi/512) q[93];
-rz(-pi/256) q[94];
-cx q[101],q[94];
-rz(pi/128) q[101];
-cx q[101],q[95];
-rz(pi/256) q[94];
-rz(-pi/128) q[95];
-cx q[101],q[95];
-rz(pi/64) q[101];
-cx q[101],q[96];
-rz(pi/128) q[95];
-rz(-pi/64) q[96];
-cx q[101],q[96];
-rz(pi/32) q[101];
-cx q[101],q[97];
-rz(pi/64) q[96];
-rz(-pi/32) q[97];
-cx q[101],q[97];
-rz(pi/16) q[101];
-cx q[101],q[98];
-rz(pi/32) q[97];
-rz(-pi/16) q[98];
-cx q[101],q[98];
-rz(pi/8) q[101];
-cx q[101],q[99];
-rz(pi/16) q[98];
-rz(-pi/8) q[99];
-cx q[101],q[99];
-rz(pi/4) q[101];
-cx q[101],q[100];
-rz(-pi/4) q[100];
-cx q[101],q[100];
-rz(pi/4) q[100];
-rz(pi/2) q[101];
-sx q[101];
-rz(pi/2) q[101];
-rz(pi/8) q[99];
-rz(1.42863093678434e-12) q[102];
-cx q[102],q[62];
-rz(-1.42863093678434e-12) q[62];
-cx q[102],q[62];
-rz(2.85726187356867e-12) q[102];
-cx q[102],q[63];
-rz(1.42863093678434e-12) q[62];
-rz(-2.85726187356867e-12) q[63];
-cx q[102],q[63];
-rz(5.71452374713734e-12) q[102];
-cx q[102],q[64];
-rz(2.85726187356867e-12) q[63];
-rz(-5.71452374713734e-12) q[64];
-cx q[102],q[64];
-rz(1.14290474942747e-11) q[102];
-cx q[102],q[65];
-rz(5.71452374713734e-12) q[64];
-rz(-1.14290474942747e-11) q[65];
-cx q[102],q[65];
-rz(2.28580949885494e-11) q[102];
-cx q[102],q[66];
-rz(1.14290474942747e-11) q[65];
-rz(-2.28580949885494e-11) q[66];
-cx q[102],q[66];
-rz(4.57161899770987e-11) q[102];
-cx q[102],q[67];
-rz(2.28580949885494e-11) q[66];
-rz(-4.57161899770987e-11) q[67];
-cx q[102],q[67];
-rz(9.14323799541975e-11) q[102];
-cx q[102],q[68];
-rz(4.57161899770987e-11) q[67];
-rz(-9.14323799541975e-11) q[68];
-cx q[102],q[68];
-rz(1.82864759908395e-10) q[102];
-cx q[102],q[69];
-rz(9.14323799541975e-11) q[68];
-rz(-1.82864759908395e-10) q[69];
-cx q[102],q[69];
-rz(3.6572951981679e-10) q[102];
-cx q[102],q[70];
-rz(1.82864759908395e-10) q[69];
-rz(-3.6572951981679e-10) q[70];
-cx q[102],q[70];
-rz(7.3145903963358e-10) q[102];
-cx q[102],q[71];
-rz(3.6572951981679e-10) q[70];
-rz(-7.3145903963358e-10) q[71];
-cx q[102],q[71];
-rz(pi/2147483648) q[102];
-cx q[102],q[72];
-rz(7.3145903963358e-10) q[71];
-rz(-pi/2147483648) q[72];
-cx q[102],q[72];
-rz(pi/1073741824) q[102];
-cx q[102],q[73];
-rz(pi/2147483648) q[72];
-rz(-pi/1073741824) q[73];
-cx q[102],q[73];
-rz(pi/536870912) q[102];
-cx q[102],q[74];
-rz(pi/1073741824) q[73];
-rz(-pi/536870912) q[74];
-cx q[102],q[74];
-rz(pi/268435456) q[102];
-cx q[102],q[75];
-rz(pi/536870912) q[74];
-rz(-pi/268435456) q[75];
-cx q[102],q[75];
-rz(pi/134217728) q[102];
-cx q[102],q[76];
-rz(pi/268435456) q[75];
-rz(-pi/134217728) q[76];
-cx q[102],q[76];
-rz(pi/67108864) q[102];
-cx q[102],q[77];
-rz(pi/134217728) q[76];
-rz(-pi/67108864) q[77];
-cx q[102],q[77];
-rz(pi/33554432) q[102];
-cx q[102],q[78];
-rz(pi/67108864) q[77];
-rz(-pi/33554432) q[78];
-cx q[102],q[78];
-rz(pi/16777216) q[102];
-cx q[102],q[79];
-rz(pi/33554432) q[78];
-rz(-pi/16777216) q[79];
-cx q[102],q[79];
-rz(pi/8388608) q[102];
-cx q[102],q[80];
-rz(pi/16777216) q[79];
-rz(-pi/8388608) q[80];
-cx q[102],q[80];
-rz(pi/4194304) q[102];
-cx q[102],q[81];
-rz(pi/8388608) q[80];
-rz(-pi/4194304) q[81];
-cx q[102],q[81];
-rz(pi/2097152) q[102];
-cx q[102],q[82];
-rz(pi/4194304) q[81];
-rz(-pi/2097152) q[82];
-cx q[102],q[82];
-rz(pi/1048576) q[102];
-cx q[102],q[83];
-rz(pi/2097152) q[82];
-rz(-pi/1048576) q[83];
-cx q[102],q[83];
-rz(pi/524288) q[102];
-cx q[102],q[84];
-rz(pi/1048576) q[83];
-rz(-pi/524288) q[84];
-cx q[102],q[84];
-rz(pi/262144) q[102];
-cx q[102],q[85];
-rz(pi/524288) q[84];
-rz(-pi/262144) q[85];
-cx q[102],q[85];
-rz(pi/131072) q[102];
-cx q[102],q[86];
-rz(pi/262144) q[85];
-rz(-pi/131072) q[86];
-cx q[102],q[86];
-rz(pi/65536) q[102];
-cx q[102],q[87];
-rz(pi/131072) q[86];
-rz(-pi/65536) q[87];
-cx q[102],q[87];
-rz(pi/32768) q[102];
-cx q[102],q[88];
-rz(pi/65536) q[87];
-rz(-pi/32768) q[88];
-cx q[102],q[88];
-rz(pi/16384) q[102];
-cx q[102],q[89];
-rz(pi/32768) q[88];
-rz(-pi/16384) q[89];
-cx q[102],q[89];
-rz(pi/8192) q[102];
-cx q[102],q[90];
-rz(pi/16384) q[89];
-rz(-pi/8192) q[90];
-cx q[102],q[90];
-rz(pi/4096) q[102];
-cx q[102],q[91];
-rz(pi/8192) q[90];
-rz(-pi/4096) q[91];
-cx q[102],q[91];
-rz(pi/2048) q[102];
-cx q[102],q[92];
-rz(pi/4096) q[91];
-rz(-pi/2048) q[92];
-cx q[102],q[92];
-rz(pi/1024) q[102];
-cx q[102],q[93];
-rz(pi/2048) q[92];
-rz(-pi/1024) q[93];
-cx q[102],q[93];
-rz(pi/512) q[102];
-cx q[102],q[94];
-rz(pi/1024) q[93];
-rz(-pi/512) q[94];
-cx q[102],q[94];
-rz(pi/256) q[102];
-cx q[102],q[95];
-rz(pi/512) q[94];
-rz(-pi/256) q[95];
-cx q[102],q[95];
-rz(pi/128) q[102];
-cx q[102],q[96];
-rz(pi/256) q[95];
-rz(-pi/128) q[96];
-cx q[102],q[96];
-rz(pi/64) q[102];
-cx q[102],q[97];
-rz(pi/128) q[96];
-rz(-pi/64) q[97];
-cx q[102],q[97];
-rz(pi/32) q[102];
-cx q[102],q[98];
-rz(pi/64) q[97];
-rz(-pi/32) q[98];
-cx q[102],q[98];
-rz(pi/16) q[102];
-cx q[102],q[99];
-rz(pi/32) q[98];
-rz(-pi/16) q[99];
-cx q[102],q[99];
-rz(pi/8) q[102];
-cx q[102],q[100];
-rz(-pi/8) q[100];
-cx q[102],q[100];
-rz(pi/8) q[100];
-rz(pi/4) q[102];
-cx q[102],q[101];
-rz(-pi/4) q[101];
-cx q[102],q[101];
-rz(pi/4) q[101];
-rz(pi/2) q[102];
-sx q[102];
-rz(pi/2) q[102];
-rz(pi/16) q[99];
-rz(1.42863093678434e-12) q[103];
-cx q[103],q[63];
-rz(-1.42863093678434e-12) q[63];
-cx q[103],q[63];
-rz(2.85726187356867e-12) q[103];
-cx q[103],q[64];
-rz(1.42863093678434e-12) q[63];
-rz(-2.85726187356867e-12) q[64];
-cx q[103],q[64];
-rz(5.71452374713734e-12) q[103];
-cx q[103],q[65];
-rz(2.85726187356867e-12) q[64];
-rz(-5.71452374713734e-12) q[65];
-cx q[103],q[65];
-rz(1.14290474942747e-11) q[103];
-cx q[103],q[66];
-rz(5.71452374713734e-12) q[65];
-rz(-1.14290474942747e-11) q[66];
-cx q[103],q[66];
-rz(2.28580949885494e-11) q[103];
-cx q[103],q[67];
-rz(1.14290474942747e-11) q[66];
-rz(-2.28580949885494e-11) q[67];
-cx q[103],q[67];
-rz(4.57161899770987e-11) q[103];
-cx q[103],q[68];
-rz(2.28580949885494e-11) q[67];
-rz(-4.57161899770987e-11) q[68];
-cx q[103],q[68];
-rz(9.14323799541975e-11) q[103];
-cx q[103],q[69];
-rz(4.57161899770987e-11) q[68];
-rz(-9.14323799541975e-11) q[69];
-cx q[103],q[69];
-rz(1.82864759908395e-10) q[103];
-cx q[103],q[70];
-rz(9.14323799541975e-11) q[69];
-rz(-1.82864759908395e-10) q[70];
-cx q[103],q[70];
-rz(3.6572951981679e-10) q[103];
-cx q[103],q[71];
-rz(1.82864759908395e-10) q[70];
-rz(-3.6572951981679e-10) q[71];
-cx q[103],q[71];
-rz(7.3145903963358e-10) q[103];
-cx q[103],q[72];
-rz(3.6572951981679e-10) q[71];
-rz(-7.3145903963358e-10) q[72];
-cx q[103],q[72];
-rz(pi/2147483648) q[103];
-cx q[103],q[73];
-rz(7.3145903963358e-10) q[72];
-rz(-pi/2147483648) q[73];
-cx q[103],q[73];
-rz(pi/1073741824) q[103];
-cx q[103],q[74];
-rz(pi/2147483648) q[73];
-rz(-pi/1073741824) q[74];
-cx q[103],q[74];
-rz(pi/536870912) q[103];
-cx q[103],q[75];
-rz(pi/1073741824) q[74];
-rz(-pi/536870912) q[75];
-cx q[103],q[75];
-rz(pi/268435456) q[103];
-cx q[103],q[76];
-rz(pi/536870912) q[75];
-rz(-pi/268435456) q[76];
-cx q[103],q[76];
-rz(pi/134217728) q[103];
-cx q[103],q[77];
-rz(pi/268435456) q[76];
-rz(-pi/134217728) q[77];
-cx q[103],q[77];
-rz(pi/67108864) q[103];
-cx q[103],q[78];
-rz(pi/134217728) q[77];
-rz(-pi/67108864) q[78];
-cx q[103],q[78];
-rz(pi/33554432) q[103];
-cx q[103],q[79];
-rz(pi/67108864) q[78];
-rz(-pi/33554432) q[79];
-cx q[103],q[79];
-rz(pi/16777216) q[103];
-cx q[103],q[80];
-rz(pi/33554432) q[79];
-rz(-pi/16777216) q[80];
-cx q[103],q[80];
-rz(pi/8388608) q[103];
-cx q[103],q[81];
-rz(pi/16777216) q[80];
-rz(-pi/8388608) q[81];
-cx q[103],q[81];
-rz(pi/4194304) q[103];
-cx q[103],q[82];
-rz(pi/8388608) q[81];
-rz(-pi/4194304) q[82];
-cx q[103],q[82];
-rz(pi/2097152) q[103];
-cx q[103],q[83];
-rz(pi/4194304) q[82];
-rz(-pi/2097152) q[83];
-cx q[103],q[83];
-rz(pi/1048576) q[103];
-cx q[103],q[84];
-rz(pi/2097152) q[83];
-rz(-pi/1048576) q[84];
-cx q[103],q[84];
-rz(pi/524288) q[103];
-cx q[103],q[85];
-rz(pi/1048576) q[84];
-rz(-pi/524288) q[85];
-cx q[103],q[85];
-rz(pi/262144) q[103];
-cx q[103],q[86];
-rz(pi/524288) q[85];
-rz(-pi/262144) q[86];
-cx q[103],q[86];
-rz(pi/131072) q[103];
-cx q[103],q[87];
-rz(pi/262144) q[86];
-rz(-pi/131072) q[87];
-cx q[103],q[87];
-rz(pi/65536) q[103];
-cx q[103],q[88];
-rz(pi/131072) q[87];
-rz(-pi/65536) q[88];
-cx q[103],q[88];
-rz(pi/32768) q[103];
-cx q[103],q[89];
-rz(pi/65536) q[88];
-rz(-pi/32768) q[89];
-cx q[103],q[89];
-rz(pi/16384) q[103];
-cx q[103],q[90];
-rz(pi/32768) q[89];
-rz(-pi/16384) q[90];
-cx q[103],q[90];
-rz(pi/8192) q[103];
-cx q[103],q[91];
-rz(pi/16384) q[90];
-rz(-pi/8192) q[91];
-cx q[103],q[91];
-rz(pi/4096) q[103];
-cx q[103],q[92];
-rz(pi/8192) q[91];
-rz(-pi/4096) q[92];
-cx q[103],q[92];
-rz(pi/2048) q[103];
-cx q[103],q[93];
-rz(pi/4096) q[92];
-rz(-pi/2048) q[93];
-cx q[103],q[93];
-rz(pi/1024) q[103];
-cx q[103],q[94];
-rz(pi/2048) q[93];
-rz(-pi/1024) q[94];
-cx q[103],q[94];
-rz(pi/512) q[103];
-cx q[103],q[95];
-rz(pi/1024) q[94];
-rz(-pi/512) q[95];
-cx q[103],q[95];
-rz(pi/256) q[103];
-cx q[103],q[96];
-rz(pi/512) q[95];
-rz(-pi/256) q[96];
-cx q[103],q[96];
-rz(pi/128) q[103];
-cx q[103],q[97];
-rz(pi/256) q[96];
-rz(-pi/128) q[97];
-cx q[103],q[97];
-rz(pi/64) q[103];
-cx q[103],q[98];
-rz(pi/128) q[97];
-rz(-pi/64) q[98];
-cx q[103],q[98];
-rz(pi/32) q[103];
-cx q[103],q[99];
-rz(pi/64) q[98];
-rz(-pi/32) q[99];
-cx q[103],q[99];
-rz(pi/16) q[103];
-cx q[103],q[100];
-rz(-pi/16) q[100];
-cx q[103],q[100];
-rz(pi/16) q[100];
-rz(pi/8) q[103];
-cx q[103],q[101];
-rz(-pi/8) q[101];
-cx q[103],q[101];
-rz(pi/8) q[101];
-rz(pi/4) q[103];
-cx q[103],q[102];
-rz(-pi/4) q[102];
-cx q[103],q[102];
-rz(pi/4) q[102];
-rz(pi/2) q[103];
-sx q[103];
-rz(pi/2) q[103];
-rz(pi/32) q[99];
-rz(1.42863093678434e-12) q[104];
-cx q[104],q[64];
-rz(-1.42863093678434e-12) q[64];
-cx q[104],q[64];
-rz(2.85726187356867e-12) q[104];
-cx q[104],q[65];
-rz(1.42863093678434e-12) q[64];
-rz(-2.85726187356867e-12) q[65];
-cx q[104],q[65];
-rz(5.71452374713734e-12) q[104];
-cx q[104],q[66];
-rz(2.85726187356867e-12) q[65];
-rz(-5.71452374713734e-12) q[66];
-cx q[104],q[66];
-rz(1.14290474942747e-11) q[104];
-cx q[104],q[67];
-rz(5.71452374713734e-12) q[66];
-rz(-1.14290474942747e-11) q[67];
-cx q[104],q[67];
-rz(2.28580949885494e-11) q[104];
-cx q[104],q[68];
-rz(1.14290474942747e-11) q[67];
-rz(-2.28580949885494e-11) q[68];
-cx q[104],q[68];
-rz(4.57161899770987e-11) q[104];
-cx q[104],q[69];
-rz(2.28580949885494e-11) q[68];
-rz(-4.57161899770987e-11) q[69];
-cx q[104],q[69];
-rz(9.14323799541975e-11) q[104];
-cx q[104],q[70];
-rz(4.57161899770987e-11) q[69];
-rz(-9.14323799541975e-11) q[70];
-cx q[104],q[70];
-rz(1.82864759908395e-10) q[104];
-cx q[104],q[71];
-rz(9.14323799541975e-11) q[70];
-rz(-1.82864759908395e-10) q[71];
-cx q[104],q[71];
-rz(3.6572951981679e-10) q[104];
-cx q[104],q[72];
-rz(1.82864759908395e-10) q[71];
-rz(-3.6572951981679e-10) q[72];
-cx q[104],q[72];
-rz(7.3145903963358e-10) q[104];
-cx q[104],q[73];
-rz(3.6572951981679e-10) q[72];
-rz(-7.3145903963358e-10) q[73];
-cx q[104],q[73];
-rz(pi/2147483648) q[104];
-cx q[104],q[74];
-rz(7.3145903963358e-10) q[73];
-rz(-pi/2147483648) q[74];
-cx q[104],q[74];
-rz(pi/1073741824) q[104];
-cx q[104],q[75];
-rz(pi/2147483648) q[74];
-rz(-pi/1073741824) q[75];
-cx q[104],q[75];
-rz(pi/536870912) q[104];
-cx q[104],q[76];
-rz(pi/1073741824) q[75];
-rz(-pi/536870912) q[76];
-cx q[104],q[76];
-rz(pi/268435456) q[104];
-cx q[104],q[77];
-rz(pi/536870912) q[76];
-rz(-pi/268435456) q[77];
-cx q[104],q[77];
-rz(pi/134217728) q[104];
-cx q[104],q[78];
-rz(pi/268435456) q[77];
-rz(-pi/134217728) q[78];
-cx q[104],q[78];
-rz(pi/67108864) q[104];
-cx q[104],q[79];
-rz(pi/134217728) q[78];
-rz(-pi/67108864) q[79];
-cx q[104],q[79];
-rz(pi/33554432) q[104];
-cx q[104],q[80];
-rz(pi/67108864) q[79];
-rz(-pi/33554432) q[80];
-cx q[104],q[80];
-rz(pi/16777216) q[104];
-cx q[104],q[81];
-rz(pi/33554432) q[80];
-rz(-pi/16777216) q[81];
-cx q[104],q[81];
-rz(pi/8388608) q[104];
-cx q[104],q[82];
-rz(pi/16777216) q[81];
-rz(-pi/8388608) q[82];
-cx q[104],q[82];
-rz(pi/4194304) q[104];
-cx q[104],q[83];
-rz(pi/8388608) q[82];
-rz(-pi/4194304) q[83];
-cx q[104],q[83];
-rz(pi/2097152) q[104];
-cx q[104],q[84];
-rz(pi/4194304) q[83];
-rz(-pi/2097152) q[84];
-cx q[104],q[84];
-rz(pi/1048576) q[104];
-cx q[104],q[85];
-rz(pi/2097152) q[84];
-rz(-pi/1048576) q[85];
-cx q[104],q[85];
-rz(pi/524288) q[104];
-cx q[104],q[86];
-rz(pi/1048576) q[85];
-rz(-pi/524288) q[86];
-cx q[104],q[86];
-rz(pi/262144) q[104];
-cx q[104],q[87];
-rz(pi/524288) q[86];
-rz(-pi/262144) q[87];
-cx q[104],q[87];
-rz(pi/131072) q[104];
-cx q[104],q[88];
-rz(pi/262144) q[87];
-rz(-pi/131072) q[88];
-cx q[104],q[88];
-rz(pi/65536) q[104];
-cx q[104],q[89];
-rz(pi/131072) q[88];
-rz(-pi/65536) q[89];
-cx q[104],q[89];
-rz(pi/32768) q[104];
-cx q[104],q[90];
-rz(pi/65536) q[89];
-rz(-pi/32768) q[90];
-cx q[104],q[90];
-rz(pi/16384) q[104];
-cx q[104],q[91];
-rz(pi/32768) q[90];
-rz(-pi/16384) q[91];
-cx q[104],q[91];
-rz(pi/8192) q[104];
-cx q[104],q[92];
-rz(pi/16384) q[91];
-rz(-pi/8192) q[92];
-cx q[104],q[92];
-rz(pi/4096) q[104];
-cx q[104],q[93];
-rz(pi/8192) q[92];
-rz(-pi/4096) q[93];
-cx q[104],q[93];
-rz(pi/2048) q[104];
-cx q[104],q[94];
-rz(pi/4096) q[93];
-rz(-pi/2048) q[94];
-cx q[104],q[94];
-rz(pi/1024) q[104];
-cx q[104],q[95];
-rz(pi/2048) q[94];
-rz(-pi/1024) q[95];
-cx q[104],q[95];
-rz(pi/512) q[104];
-cx q[104],q[96];
-rz(pi/1024) q[95];
-rz(-pi/512) q[96];
-cx q[104],q[96];
-rz(pi/256) q[104];
-cx q[104],q[97];
-rz(pi/512) q[96];
-rz(-pi/256) q[97];
-cx q[104],q[97];
-rz(pi/128) q[104];
-cx q[104],q[98];
-rz(pi/256) q[97];
-rz(-pi/128) q[98];
-cx q[104],q[98];
-rz(pi/64) q[104];
-cx q[104],q[99];
-rz(pi/128) q[98];
-rz(-pi/64) q[99];
-cx q[104],q[99];
-rz(pi/32) q[104];
-cx q[104],q[100];
-rz(-pi/32) q[100];
-cx q[104],q[100];
-rz(pi/32) q[100];
-rz(pi/16) q[104];
-cx q[104],q[101];
-rz(-pi/16) q[101];
-cx q[104],q[101];
-rz(pi/16) q[101];
-rz(pi/8) q[104];
-cx q[104],q[102];
-rz(-pi/8) q[102];
-cx q[104],q[102];
-rz(pi/8) q[102];
-rz(pi/4) q[104];
-cx q[104],q[103];
-rz(-pi/4) q[103];
-cx q[104],q[103];
-rz(pi/4) q[103];
-rz(pi/2) q[104];
-sx q[104];
-rz(pi/2) q[104];
-rz(pi/64) q[99];
-rz(1.42863093678434e-12) q[105];
-cx q[105],q[65];
-rz(-1.42863093678434e-12) q[65];
-cx q[105],q[65];
-rz(2.85726187356867e-12) q[105];
-cx q[105],q[66];
-rz(1.42863093678434e-12) q[65];
-rz(-2.85726187356867e-12) q[66];
-cx q[105],q[66];
-rz(5.71452374713734e-12) q[105];
-cx q[105],q[67];
-rz(2.85726187356867e-12) q[66];
-rz(-5.71452374713734e-12) q[67];
-cx q[105],q[67];
-rz(1.14290474942747e-11) q[105];
-cx q[105],q[68];
-rz(5.71452374713734e-12) q[67];
-rz(-1.14290474942747e-11) q[68];
-cx q[105],q[68];
-rz(2.28580949885494e-11) q[105];
-cx q[105],q[69];
-rz(1.14290474942747e-11) q[68];
-rz(-2.28580949885494e-11) q[69];
-cx q[105],q[69];
-rz(4.57161899770987e-11) q[105];
-cx q[105],q[70];
-rz(2.28580949885494e-11) q[69];
-rz(-4.57161899770987e-11) q[70];
-cx q[105],q[70];
-rz(9.14323799541975e-11) q[105];
-cx q[105],q[71];
-rz(4.57161899770987e-11) q[70];
-rz(-9.14323799541975e-11) q[71];
-cx q[105],q[71];
-rz(1.82864759908395e-10) q[105];
-cx q[105],q[72];
-rz(9.14323799541975e-11) q[71];
-rz(-1.82864759908395e-10) q[72];
-cx q[105],q[72];
-rz(3.6572951981679e-10) q[105];
-cx q[105],q[73];
-rz(1.82864759908395e-10) q[72];
-rz(-3.6572951981679e-10) q[73];
-cx q[105],q[73];
-rz(7.3145903963358e-10) q[105];
-cx q[105],q[74];
-rz(3.6572951981679e-10) q[73];
-rz(-7.3145903963358e-10) q[74];
-cx q[105],q[74];
-rz(pi/2147483648) q[105];
-cx q[105],q[75];
-rz(7.3145903963358e-10) q[74];
-rz(-pi/2147483648) q[75];
-cx q[105],q[75];
-rz(pi/1073741824) q[105];
-cx q[105],q[76];
-rz(pi/2147483648) q[75];
-rz(-pi/1073741824) q[76];
-cx q[105],q[76];
-rz(pi/536870912) q[105];
-cx q[105],q[77];
-rz(pi/1073741824) q[76];
-rz(-pi/536870912) q[77];
-cx q[105],q[77];
-rz(pi/268435456) q[105];
-cx q[105],q[78];
-rz(pi/536870912) q[77];
-rz(-pi/268435456) q[78];
-cx q[105],q[78];
-rz(pi/134217728) q[105];
-cx q[105],q[79];
-rz(pi/268435456) q[78];
-rz(-pi/134217728) q[79];
-cx q[105],q[79];
-rz(pi/67108864) q[105];
-cx q[105],q[80];
-rz(pi/134217728) q[79];
-rz(-pi/67108864) q[80];
-cx q[105],q[80];
-rz(pi/33554432) q[105];
-cx q[105],q[81];
-rz(pi/67108864) q[80];
-rz(-pi/33554432) q[81];
-cx q[105],q[81];
-rz(pi/16777216) q[105];
-cx q[105],q[82];
-rz(pi/33554432) q[81];
-rz(-pi/16777216) q[82];
-cx q[105],q[82];
-rz(pi/8388608) q[105];
-cx q[105],q[83];
-rz(pi/16777216) q[82];
-rz(-pi/8388608) q[83];
-cx q[105],q[83];
-rz(pi/4194304) q[105];
-cx q[105],q[84];
-rz(pi/8388608) q[83];
-rz(-pi/4194304) q[84];
-cx q[105],q[84];
-rz(pi/2097152) q[105];
-cx q[105],q[85];
-rz(pi/4194304) q[84];
-rz(-pi/2097152) q[85];
-cx q[105],q[85];
-rz(pi/1048576) q[105];
-cx q[105],q[86];
-rz(pi/2097152) q[85];
-rz(-pi/1048576) q[86];
-cx q[105],q[86];
-rz(pi/524288) q[105];
-cx q[105],q[87];
-rz(pi/1048576) q[86];
-rz(-pi/524288) q[87];
-cx q[105],q[87];
-rz(pi/262144) q[105];
-cx q[105],q[88];
-rz(pi/524288) q[87];
-rz(-pi/262144) q[88];
-cx q[105],q[88];
-rz(pi/131072) q[105];
-cx q[105],q[89];
-rz(pi/262144) q[88];
-rz(-pi/131072) q[89];
-cx q[105],q[89];
-rz(pi/65536) q[105];
-cx q[105],q[90];
-rz(pi/131072) q[89];
-rz(-pi/65536) q[90];
-cx q[105],q[90];
-rz(pi/32768) q[105];
-cx q[105],q[91];
-rz(pi/65536) q[90];
-rz(-pi/32768) q[91];
-cx q[105],q[91];
-rz(pi/16384) q[105];
-cx q[105],q[92];
-rz(pi/32768) q[91];
-rz(-pi/16384) q[92];
-cx q[105],q[92];
-rz(pi/8192) q[105];
-cx q[105],q[93];
-rz(pi/16384) q[92];
-rz(-pi/8192) q[93];
-cx q[105],q[93];
-rz(pi/4096) q[105];
-cx q[105],q[94];
-rz(pi/8192) q[93];
-rz(-pi/4096) q[94];
-cx q[105],q[94];
-rz(pi/2048) q[105];
-cx q[105],q[95];
-rz(pi/4096) q[94];
-rz(-pi/2048) q[95];
-cx q[105],q[95];
-rz(pi/1024) q[105];
-cx q[105],q[96];
-rz(pi/2048) q[95];
-rz(-pi/1024) q[96];
-cx q[105],q[96];
-rz(pi/512) q[105];
-cx q[105],q[97];
-rz(pi/1024) q[96];
-rz(-pi/512) q[97];
-cx q[105],q[97];
-rz(pi/256) q[105];
-cx q[105],q[98];
-rz(pi/512) q[97];
-rz(-pi/256) q[98];
-cx q[105],q[98];
-rz(pi/128) q[105];
-cx q[105],q[99];
-rz(pi/256) q[98];
-rz(-pi/128) q[99];
-cx q[105],q[99];
-rz(pi/64) q[105];
-cx q[105],q[100];
-rz(-pi/64) q[100];
-cx q[105],q[100];
-rz(pi/64) q[100];
-rz(pi/32) q[105];
-cx q[105],q[101];
-rz(-pi/32) q[101];
-cx q[105],q[101];
-rz(pi/32) q[101];
-rz(pi/16) q[105];
-cx q[105],q[102];
-rz(-pi/16) q[102];
-cx q[105],q[102];
-rz(pi/16) q[102];
-rz(pi/8) q[105];
-cx q[105],q[103];
-rz(-pi/8) q[103];
-cx q[105],q[103];
-rz(pi/8) q[103];
-rz(pi/4) q[105];
-cx q[105],q[104];
-rz(-pi/4) q[104];
-cx q[105],q[104];
-rz(pi/4) q[104];
-rz(pi/2) q[105];
-sx q[105];
-rz(pi/2) q[105];
-rz(pi/128) q[99];
-rz(1.42863093678434e-12) q[106];
-cx q[106],q[66];
-rz(-1.42863093678434e-12) q[66];
-cx q[106],q[66];
-rz(2.85726187356867e-12) q[106];
-cx q[106],q[67];
-rz(1.42863093678434e-12) q[66];
-rz(-2.85726187356867e-12) q[67];
-cx q[106],q[67];
-rz(5.71452374713734e-12) q[106];
-cx q[106],q[68];
-rz(2.85726187356867e-12) q[67];
-rz(-5.71452374713734e-12) q[68];
-cx q[106],q[68];
-rz(1.14290474942747e-11) q[106];
-cx q[106],q[69];
-rz(5.71452374713734e-12) q[68];
-rz(-1.14290474942747e-11) q[69];
-cx q[106],q[69];
-rz(2.28580949885494e-11) q[106];
-cx q[106],q[70];
-rz(1.14290474942747e-11) q[69];
-rz(-2.28580949885494e-11) q[70];
-cx q[106],q[70];
-rz(4.57161899770987e-11) q[106];
-cx q[106],q[71];
-rz(2.28580949885494e-11) q[70];
-rz(-4.57161899770987e-11) q[71];
-cx q[106],q[71];
-rz(9.14323799541975e-11) q[106];
-cx q[106],q[72];
-rz(4.57161899770987e-11) q[71];
-rz(-9.14323799541975e-11) q[72];
-cx q[106],q[72];
-rz(1.82864759908395e-10) q[106];
-cx q[106],q[73];
-rz(9.14323799541975e-11) q[72];
-rz(-1.82864759908395e-10) q[73];
-cx q[106],q[73];
-rz(3.6572951981679e-10) q[106];
-cx q[106],q[74];
-rz(1.82864759908395e-10) q[73];
-rz(-3.6572951981679e-10) q[74];
-cx q[106],q[74];
-rz(7.3145903963358e-10) q[106];
-cx q[106],q[75];
-rz(3.6572951981679e-10) q[74];
-rz(-7.3145903963358e-10) q[75];
-cx q[106],q[75];
-rz(pi/2147483648) q[106];
-cx q[106],q[76];
-rz(7.3145903963358e-10) q[75];
-rz(-pi/2147483648) q[76];
-cx q[106],q[76];
-rz(pi/1073741824) q[106];
-cx q[106],q[77];
-rz(pi/2147483648) q[76];
-rz(-pi/1073741824) q[77];
-cx q[106],q[77];
-rz(pi/536870912) q[106];
-cx q[106],q[78];
-rz(pi/1073741824) q[77];
-rz(-pi/536870912) q[78];
-cx q[106],q[78];
-rz(pi/268435456) q[106];
-cx q[106],q[79];
-rz(pi/536870912) q[78];
-rz(-pi/268435456) q[79];
-cx q[106],q[79];
-rz(pi/134217728) q[106];
-cx q[106],q[80];
-rz(pi/268435456) q[79];
-rz(-pi/134217728) q[80];
-cx q[106],q[80];
-rz(pi/67108864) q[106];
-cx q[106],q[81];
-rz(pi/134217728) q[80];
-rz(-pi/67108864) q[81];
-cx q[106],q[81];
-rz(pi/33554432) q[106];
-cx q[106],q[82];
-rz(pi/67108864) q[81];
-rz(-pi/33554432) q[82];
-cx q[106],q[82];
-rz(pi/16777216) q[106];
-cx q[106],q[83];
-rz(pi/33554432) q[82];
-rz(-pi/16777216) q[83];
-cx q[106],q[83];
-rz(pi/8388608) q[106];
-cx q[106],q[84];
-rz(pi/16777216) q[83];
-rz(-pi/8388608) q[84];
-cx q[106],q[84];
-rz(pi/4194304) q[106];
-cx q[106],q[85];
-rz(pi/8388608) q[84];
-rz(-pi/4194304) q[85];
-cx q[106],q[85];
-rz(pi/2097152) q[106];
-cx q[106],q[86];
-rz(pi/4194304) q[85];
-rz(-pi/2097152) q[86];
-cx q[106],q[86];
-rz(pi/1048576) q[106];
-cx q[106],q[87];
-rz(pi/2097152) q[86];
-rz(-pi/1048576) q[87];
-cx q[106],q[87];
-rz(pi/524288) q[106];
-cx q[106],q[88];
-rz(pi/1048576) q[87];
-rz(-pi/524288) q[88];
-cx q[106],q[88];
-rz(pi/262144) q[106];
-cx q[106],q[89];
-rz(pi/524288) q[88];
-rz(-pi/262144) q[89];
-cx q[106],q[89];
-rz(pi/131072) q[106];
-cx q[106],q[90];
-rz(pi/262144) q[89];
-rz(-pi/131072) q[90];
-cx q[106],q[90];
-rz(pi/65536) q[106];
-cx q[106],q[91];
-rz(pi/131072) q[90];
-rz(-pi/65536) q[91];
-cx q[106],q[91];
-rz(pi/32768) q[106];
-cx q[106],q[92];
-rz(pi/65536) q[91];
-rz(-pi/32768) q[92];
-cx q[106],q[92];
-rz(pi/16384) q[106];
-cx q[106],q[93];
-rz(pi/32768) q[92];
-rz(-pi/16384) q[93];
-cx q[106],q[93];
-rz(pi/8192) q[106];
-cx q[106],q[94];
-rz(pi/16384) q[93];
-rz(-pi/8192) q[94];
-cx q[106],q[94];
-rz(pi/4096) q[106];
-cx q[106],q[95];
-rz(pi/8192) q[94];
-rz(-pi/4096) q[95];
-cx q[106],q[95];
-rz(pi/2048) q[106];
-cx q[106],q[96];
-rz(pi/4096) q[95];
-rz(-pi/2048) q[96];
-cx q[106],q[96];
-rz(pi/1024) q[106];
-cx q[106],q[97];
-rz(pi/2048) q[96];
-rz(-pi/1024) q[97];
-cx q[106],q[97];
-rz(pi/512) q[106];
-cx q[106],q[98];
-rz(pi/1024) q[97];
-rz(-pi/512) q[98];
-cx q[106],q[98];
-rz(pi/256) q[106];
-cx q[106],q[99];
-rz(pi/512) q[98];
-rz(-pi/256) q[99];
-cx q[106],q[99];
-rz(pi/128) q[106];
-cx q[106],q[100];
-rz(-pi/128) q[100];
-cx q[106],q[100];
-rz(pi/128) q[100];
-rz(pi/64) q[106];
-cx q[106],q[101];
-rz(-pi/64) q[101];
-cx q[106],q[101];
-rz(pi/64) q[101];
-rz(pi/32) q[106];
-cx q[106],q[102];
-rz(-pi/32) q[102];
-cx q[106],q[102];
-rz(pi/32) q[102];
-rz(pi/16) q[106];
-cx q[106],q[103];
-rz(-pi/16) q[103];
-cx q[106],q[103];
-rz(pi/16) q[103];
-rz(pi/8) q[106];
-cx q[106],q[104];
-rz(-pi/8) q[104];
-cx q[106],q[104];
-rz(pi/8) q[104];
-rz(pi/4) q[106];
-cx q[106],q[105];
-rz(-pi/4) q[105];
-cx q[106],q[105];
-rz(pi/4) q[105];
-rz(pi/2) q[106];
-sx q[106];
-rz(pi/2) q[106];
-rz(pi/256) q[99];
-rz(1.42863093678434e-12) q[107];
-cx q[107],q[67];
-rz(-1.42863093678434e-12) q[67];
-cx q[107],q[67];
-rz(2.85726187356867e-12) q[107];
-cx q[107],q[68];
-rz(1.42863093678434e-12) q[67];
-rz(-2.85726187356867e-12) q[68];
-cx q[107],q[68];
-rz(5.71452374713734e-12) q[107];
-cx q[107],q[69];
-rz(2.85726187356867e-12) q[68];
-rz(-5.71452374713734e-12) q[69];
-cx q[107],q[69];
-rz(1.14290474942747e-11) q[107];
-cx q[107],q[70];
-rz(5.71452374713734e-12) q[69];
-rz(-1.14290474942747e-11) q[70];
-cx q[107],q[70];
-rz(2.28580949885494e-11) q[107];
-cx q[107],q[71];
-rz(1.14290474942747e-11) q[70];
-rz(-2.28580949885494e-11) q[71];
-cx q[107],q[71];
-rz(4.57161899770987e-11) q[107];
-cx q[107],q[72];
-rz(2.28580949885494e-11) q[71];
-rz(-4.57161899770987e-11) q[72];
-cx q[107],q[72];
-rz(9.14323799541975e-11) q[107];
-cx q[107],q[73];
-rz(4.57161899770987e-11) q[72];
-rz(-9.14323799541975e-11) q[73];
-cx q[107],q[73];
-rz(1.82864759908395e-10) q[107];
-cx q[107],q[74];
-rz(9.14323799541975e-11) q[73];
-rz(-1.82864759908395e-10) q[74];
-cx q[107],q[74];
-rz(3.6572951981679e-10) q[107];
-cx q[107],q[75];
-rz(1.82864759908395e-10) q[74];
-rz(-3.6572951981679e-10) q[75];
-cx q[107],q[75];
-rz(7.3145903963358e-10) q[107];
-cx q[107],q[76];
-rz(3.6572951981679e-10) q[75];
-rz(-7.3145903963358e-10) q[76];
-cx q[107],q[76];
-rz(pi/2147483648) q[107];
-cx q[107],q[77];
-rz(7.3145903963358e-10) q[76];
-rz(-pi/2147483648) q[77];
-cx q[107],q[77];
-rz(pi/1073741824) q[107];
-cx q[107],q[78];
-rz(pi/2147483648) q[77];
-rz(-pi/1073741824) q[78];
-cx q[107],q[78];
-rz(pi/536870912) q[107];
-cx q[107],q[79];
-rz(pi/1073741824) q[78];
-rz(-pi/536870912) q[79];
-cx q[107],q[79];
-rz(pi/268435456) q[107];
-cx q[107],q[80];
-rz(pi/536870912) q[79];
-rz(-pi/268435456) q[80];
-cx q[107],q[80];
-rz(pi/134217728) q[107];
-cx q[107],q[81];
-rz(pi/268435456) q[80];
-rz(-pi/134217728) q[81];
-cx q[107],q[81];
-rz(pi/67108864) q[107];
-cx q[107],q[82];
-rz(pi/134217728) q[81];
-rz(-pi/67108864) q[82];
-cx q[107],q[82];
-rz(pi/33554432) q[107];
-cx q[107],q[83];
-rz(pi/67108864) q[82];
-rz(-pi/33554432) q[83];
-cx q[107],q[83];
-rz(pi/16777216) q[107];
-cx q[107],q[84];
-rz(pi/33554432) q[83];
-rz(-pi/16777216) q[84];
-cx q[107],q[84];
-rz(pi/8388608) q[107];
-cx q[107],q[85];
-rz(pi/16777216) q[84];
-rz(-pi/8388608) q[85];
-cx q[107],q[85];
-rz(pi/4194304) q[107];
-cx q[107],q[86];
-rz(pi/8388608) q[85];
-rz(-pi/4194304) q[86];
-cx q[107],q[86];
-rz(pi/2097152) q[107];
-cx q[107],q[87];
-rz(pi/4194304) q[86];
-rz(-pi/2097152) q[87];
-cx q[107],q[87];
-rz(pi/1048576) q[107];
-cx q[107],q[88];
-rz(pi/2097152) q[87];
-rz(-pi/1048576) q[88];
-cx q[107],q[88];
-rz(pi/524288) q[107];
-cx q[107],q[89];
-rz(pi/1048576) q[88];
-rz(-pi/524288) q[89];
-cx q[107],q[89];
-rz(pi/262144) q[107];
-cx q[107],q[90];
-rz(pi/524288) q[89];
-rz(-pi/262144) q[90];
-cx q[107],q[90];
-rz(pi/131072) q[107];
-cx q[107],q[91];
-rz(pi/262144) q[90];
-rz(-pi/131072) q[91];
-cx q[107],q[91];
-rz(pi/65536) q[107];
-cx q[107],q[92];
-rz(pi/131072) q[91];
-rz(-pi/65536) q[92];
-cx q[107],q[92];
-rz(pi/32768) q[107];
-cx q[107],q[93];
-rz(pi/65536) q[92];
-rz(-pi/32768) q[93];
-cx q[107],q[93];
-rz(pi/16384) q[107];
-cx q[107],q[94];
-rz(pi/32768) q[93];
-rz(-pi/16384) q[94];
-cx q[107],q[94];
-rz(pi/8192) q[107];
-cx q[107],q[95];
-rz(pi/16384) q[94];
-rz(-pi/8192) q[95];
-cx q[107],q[95];
-rz(pi/4096) q[107];
-cx q[107],q[96];
-rz(pi/8192) q[95];
-rz(-pi/4096) q[96];
-cx q[107],q[96];
-rz(pi/2048) q[107];
-cx q[107],q[97];
-rz(pi/4096) q[96];
-rz(-pi/2048) q[97];
-cx q[107],q[97];
-rz(pi/1024) q[107];
-cx q[107],q[98];
-rz(pi/2048) q[97];
-rz(-pi/1024) q[98];
-cx q[107],q[98];
-rz(pi/512) q[107];
-cx q[107],q[99];
-rz(pi/1024) q[98];
-rz(-pi/512) q[99];
-cx q[107],q[99];
-rz(pi/256) q[107];
-cx q[107],q[100];
-rz(-pi/256) q[100];
-cx q[107],q[100];
-rz(pi/256) q[100];
-rz(pi/128) q[107];
-cx q[107],q[101];
-rz(-pi/128) q[101];
-cx q[107],q[101];
-rz(pi/128) q[101];
-rz(pi/64) q[107];
-cx q[107],q[102];
-rz(-pi/64) q[102];
-cx q[107],q[102];
-rz(pi/64) q[102];
-rz(pi/32) q[107];
-cx q[107],q[103];
-rz(-pi/32) q[103];
-cx q[107],q[103];
-rz(pi/32) q[103];
-rz(pi/16) q[107];
-cx q[107],q[104];
-rz(-pi/16) q[104];
-cx q[107],q[104];
-rz(pi/16) q[104];
-rz(pi/8) q[107];
-cx q[107],q[105];
-rz(-pi/8) q[105];
-cx q[107],q[105];
-rz(pi/8) q[105];
-rz(pi/4) q[107];
-cx q[107],q[106];
-rz(-pi/4) q[106];
-cx q[107],q[106];
-rz(pi/4) q[106];
-rz(pi/2) q[107];
-sx q[107];
-rz(pi/2) q[107];
-rz(pi/512) q[99];
-rz(1.42863093678434e-12) q[108];
-cx q[108],q[68];
-rz(-1.42863093678434e-12) q[68];
-cx q[108],q[68];
-rz(2.85726187356867e-12) q[108];
-cx q[108],q[69];
-rz(1.42863093678434e-12) q[68];
-rz(-2.85726187356867e-12) q[69];
-cx q[108],q[69];
-rz(5.71452374713734e-12) q[108];
-cx q[108],q[70];
-rz(2.85726187356867e-12) q[69];
-rz(-5.71452374713734e-12) q[70];
-cx q[108],q[70];
-rz(1.14290474942747e-11) q[108];
-cx q[108],q[71];
-rz(5.71452374713734e-12) q[70];
-rz(-1.14290474942747e-11) q[71];
-cx q[108],q[71];
-rz(2.28580949885494e-11) q[108];
-cx q[108],q[72];
-rz(1.14290474942747e-11) q[71];
-rz(-2.28580949885494e-11) q[72];
-cx q[108],q[72];
-rz(4.57161899770987e-11) q[108];
-cx q[108],q[73];
-rz(2.28580949885494e-11) q[72];
-rz(-4.57161899770987e-11) q[73];
-cx q[108],q[73];
-rz(9.14323799541975e-11) q[108];
-cx q[108],q[74];
-rz(4.57161899770987e-11) q[73];
-rz(-9.14323799541975e-11) q[74];
-cx q[108],q[74];
-rz(1.82864759908395e-10) q[108];
-cx q[108],q[75];
-rz(9.14323799541975e-11) q[74];
-rz(-1.82864759908395e-10) q[75];
-cx q[108],q[75];
-rz(3.6572951981679e-10) q[108];
-cx q[108],q[76];
-rz(1.82864759908395e-10) q[75];
-rz(-3.6572951981679e-10) q[76];
-cx q[108],q[76];
-rz(7.3145903963358e-10) q[108];
-cx q[108],q[77];
-rz(3.6572951981679e-10) q[76];
-rz(-7.3145903963358e-10) q[77];
-cx q[108],q[77];
-rz(pi/2147483648) q[108];
-cx q[108],q[78];
-rz(7.3145903963358e-10) q[77];
-rz(-pi/2147483648) q[78];
-cx q[108],q[78];
-rz(pi/1073741824) q[108];
-cx q[108],q[79];
-rz(pi/2147483648) q[78];
-rz(-pi/1073741824) q[79];
-cx q[108],q[79];
-rz(pi/536870912) q[108];
-cx q[108],q[80];
-rz(pi/1073741824) q[79];
-rz(-pi/536870912) q[80];
-cx q[108],q[80];
-rz(pi/268435456) q[108];
-cx q[108],q[81];
-rz(pi/536870912) q[80];
-rz(-pi/268435456) q[81];
-cx q[108],q[81];
-rz(pi/134217728) q[108];
-cx q[108],q[82];
-rz(pi/268435456) q[81];
-rz(-pi/134217728) q[82];
-cx q[108],q[82];
-rz(pi/67108864) q[108];
-cx q[108],q[83];
-rz(pi/134217728) q[82];
-rz(-pi/67108864) q[83];
-cx q[108],q[83];
-rz(pi/33554432) q[108];
-cx q[108],q[84];
-rz(pi/67108864) q[83];
-rz(-pi/33554432) q[84];
-cx q[108],q[84];
-rz(pi/16777216) q[108];
-cx q[108],q[85];
-rz(pi/33554432) q[84];
-rz(-pi/16777216) q[85];
-cx q[108],q[85];
-rz(pi/8388608) q[108];
-cx q[108],q[86];
-rz(pi/16777216) q[85];
-rz(-pi/8388608) q[86];
-cx q[108],q[86];
-rz(pi/4194304) q[108];
-cx q[108],q[87];
-rz(pi/8388608) q[86];
-rz(-pi/4194304) q[87];
-cx q[108],q[87];
-rz(pi/2097152) q[108];
-cx q[108],q[88];
-rz(pi/4194304) q[87];
-rz(-pi/2097152) q[88];
-cx q[108],q[88];
-rz(pi/1048576) q[108];
-cx q[108],q[89];
-rz(pi/2097152) q[88];
-rz(-pi/1048576) q[89];
-cx q[108],q[89];
-rz(pi/524288) q[108];
-cx q[108],q[90];
-rz(pi/1048576) q[89];
-rz(-pi/524288) q[90];
-cx q[108],q[90];
-rz(pi/262144) q[108];
-cx q[108],q[91];
-rz(pi/524288) q[90];
-rz(-pi/262144) q[91];
-cx q[108],q[91];
-rz(pi/131072) q[108];
-cx q[108],q[92];
-rz(pi/262144) q[91];
-rz(-pi/131072) q[92];
-cx q[108],q[92];
-rz(pi/65536) q[108];
-cx q[108],q[93];
-rz(pi/131072) q[92];
-rz(-pi/65536) q[93];
-cx q[108],q[93];
-rz(pi/32768) q[108];
-cx q[108],q[94];
-rz(pi/65536) q[93];
-rz(-pi/32768) q[94];
-cx q[108],q[94];
-rz(pi/16384) q[108];
-cx q[108],q[95];
-rz(pi/32768) q[94];
-rz(-pi/16384) q[95];
-cx q[108],q[95];
-rz(pi/8192) q[108];
-cx q[108],q[96];
-rz(pi/16384) q[95];
-rz(-pi/8192) q[96];
-cx q[108],q[96];
-rz(pi/4096) q[108];
-cx q[108],q[97];
-rz(pi/8192) q[96];
-rz(-pi/4096) q[97];
-cx q[108],q[97];
-rz(pi/2048) q[108];
-cx q[108],q[98];
-rz(pi/4096) q[97];
-rz(-pi/2048) q[98];
-cx q[108],q[98];
-rz(pi/1024) q[108];
-cx q[108],q[99];
-rz(pi/2048) q[98];
-rz(-pi/1024) q[99];
-cx q[108],q[99];
-rz(pi/512) q[108];
-cx q[108],q[100];
-rz(-pi/512) q[100];
-cx q[108],q[100];
-rz(pi/512) q[100];
-rz(pi/256) q[108];
-cx q[108],q[101];
-rz(-pi/256) q[101];
-cx q[108],q[101];
-rz(pi/256) q[101];
-rz(pi/128) q[108];
-cx q[108],q[102];
-rz(-pi/128) q[102];
-cx q[108],q[102];
-rz(pi/128) q[102];
-rz(pi/64) q[108];
-cx q[108],q[103];
-rz(-pi/64) q[103];
-cx q[108],q[103];
-rz(pi/64) q[103];
-rz(pi/32) q[108];
-cx q[108],q[104];
-rz(-pi/32) q[104];
-cx q[108],q[104];
-rz(pi/32) q[104];
-rz(pi/16) q[108];
-cx q[108],q[105];
-rz(-pi/16) q[105];
-cx q[108],q[105];
-rz(pi/16) q[105];
-rz(pi/8) q[108];
-cx q[108],q[106];
-rz(-pi/8) q[106];
-cx q[108],q[106];
-rz(pi/8) q[106];
-rz(pi/4) q[108];
-cx q[108],q[107];
-rz(-pi/4) q[107];
-cx q[108],q[107];
-rz(pi/4) q[107];
-rz(pi/2) q[108];
-sx q[108];
-rz(pi/2) q[108];
-rz(pi/1024) q[99];
-rz(1.42863093678434e-12) q[109];
-cx q[109],q[69];
-rz(-1.42863093678434e-12) q[69];
-cx q[109],q[69];
-rz(2.85726187356867e-12) q[109];
-cx q[109],q[70];
-rz(1.42863093678434e-12) q[69];
-rz(-2.85726187356867e-12) q[70];
-cx q[109],q[70];
-rz(5.71452374713734e-12) q[109];
-cx q[109],q[71];
-rz(2.85726187356867e-12) q[70];
-rz(-5.71452374713734e-12) q[71];
-cx q[109],q[71];
-rz(1.14290474942747e-11) q[109];
-cx q[109],q[72];
-rz(5.71452374713734e-12) q[71];
-rz(-1.14290474942747e-11) q[72];
-cx q[109],q[72];
-rz(2.28580949885494e-11) q[109];
-cx q[109],q[73];
-rz(1.14290474942747e-11) q[72];
-rz(-2.28580949885494e-11) q[73];
-cx q[109],q[73];
-rz(4.57161899770987e-11) q[109];
-cx q[109],q[74];
-rz(2.28580949885494e-11) q[73];
-rz(-4.57161899770987e-11) q[74];
-cx q[109],q[74];
-rz(9.14323799541975e-11) q[109];
-cx q[109],q[75];
-rz(4.57161899770987e-11) q[74];
-rz(-9.14323799541975e-11) q[75];
-cx q[109],q[75];
-rz(1.82864759908395e-10) q[109];
-cx q[109],q[76];
-rz(9.14323799541975e-11) q[75];
-rz(-1.82864759908395e-10) q[76];
-cx q[109],q[76];
-rz(3.6572951981679e-10) q[109];
-cx q[109],q[77];
-rz(1.82864759908395e-10) q[76];
-rz(-3.6572951981679e-10) q[77];
-cx q[109],q[77];
-rz(7.3145903963358e-10) q[109];
-cx q[109],q[78];
-rz(3.6572951981679e-10) q[77];
-rz(-7.3145903963358e-10) q[78];
-cx q[109],q[78];
-rz(pi/2147483648) q[109];
-cx q[109],q[79];
-rz(7.3145903963358e-10) q[78];
-rz(-pi/2147483648) q[79];
-cx q[109],q[79];
-rz(pi/1073741824) q[109];
-cx q[109],q[80];
-rz(pi/2147483648) q[79];
-rz(-pi/1073741824) q[80];
-cx q[109],q[80];
-rz(pi/536870912) q[109];
-cx q[109],q[81];
-rz(pi/1073741824) q[80];
-rz(-pi/536870912) q[81];
-cx q[109],q[81];
-rz(pi/268435456) q[109];
-cx q[109],q[82];
-rz(pi/536870912) q[81];
-rz(-pi/268435456) q[82];
-cx q[109],q[82];
-rz(pi/134217728) q[109];
-cx q[109],q[83];
-rz(pi/268435456) q[82];
-rz(-pi/134217728) q[83];
-cx q[109],q[83];
-rz(pi/67108864) q[109];
-cx q[109],q[84];
-rz(pi/134217728) q[83];
-rz(-pi/67108864) q[84];
-cx q[109],q[84];
-rz(pi/33554432) q[109];
-cx q[109],q[85];
-rz(pi/67108864) q[84];
-rz(-pi/33554432) q[85];
-cx q[109],q[85];
-rz(pi/16777216) q[109];
-cx q[109],q[86];
-rz(pi/33554432) q[85];
-rz(-pi/16777216) q[86];
-cx q[109],q[86];
-rz(pi/8388608) q[109];
-cx q[109],q[87];
-rz(pi/16777216) q[86];
-rz(-pi/8388608) q[87];
-cx q[109],q[87];
-rz(pi/4194304) q[109];
-cx q[109],q[88];
-rz(pi/8388608) q[87];
-rz(-pi/4194304) q[88];
-cx q[109],q[88];
-rz(pi/2097152) q[109];
-cx q[109],q[89];
-rz(pi/4194304) q[88];
-rz(-pi/2097152) q[89];
-cx q[109],q[89];
-rz(pi/1048576) q[109];
-cx q[109],q[90];
-rz(pi/2097152) q[89];
-rz(-pi/1048576) q[90];
-cx q[109],q[90];
-rz(pi/524288) q[109];
-cx q[109],q[91];
-rz(pi/1048576) q[90];
-rz(-pi/524288) q[91];
-cx q[109],q[91];
-rz(pi/262144) q[109];
-cx q[109],q[92];
-rz(pi/524288) q[91];
-rz(-pi/262144) q[92];
-cx q[109],q[92];
-rz(pi/131072) q[109];
-cx q[109],q[93];
-rz(pi/262144) q[92];
-rz(-pi/131072) q[93];
-cx q[109],q[93];
-rz(pi/65536) q[109];
-cx q[109],q[94];
-rz(pi/131072) q[93];
-rz(-pi/65536) q[94];
-cx q[109],q[94];
-rz(pi/32768) q[109];
-cx q[109],q[95];
-rz(pi/65536) q[94];
-rz(-pi/32768) q[95];
-cx q[109],q[95];
-rz(pi/16384) q[109];
-cx q[109],q[96];
-rz(pi/32768) q[95];
-rz(-pi/16384) q[96];
-cx q[109],q[96];
-rz(pi/8192) q[109];
-cx q[109],q[97];
-rz(pi/16384) q[96];
-rz(-pi/8192) q[97];
-cx q[109],q[97];
-rz(pi/4096) q[109];
-cx q[109],q[98];
-rz(pi/8192) q[97];
-rz(-pi/4096) q[98];
-cx q[109],q[98];
-rz(pi/2048) q[109];
-cx q[109],q[99];
-rz(pi/4096) q[98];
-rz(-pi/2048) q[99];
-cx q[109],q[99];
-rz(pi/1024) q[109];
-cx q[109],q[100];
-rz(-pi/1024) q[100];
-cx q[109],q[100];
-rz(pi/1024) q[100];
-rz(pi/512) q[109];
-cx q[109],q[101];
-rz(-pi/512) q[101];
-cx q[109],q[101];
-rz(pi/512) q[101];
-rz(pi/256) q[109];
-cx q[109],q[102];
-rz(-pi/256) q[102];
-cx q[109],q[102];
-rz(pi/256) q[102];
-rz(pi/128) q[109];
-cx q[109],q[103];
-rz(-pi/128) q[103];
-cx q[109],q[103];
-rz(pi/128) q[103];
-rz(pi/64) q[109];
-cx q[109],q[104];
-rz(-pi/64) q[104];
-cx q[109],q[104];
-rz(pi/64) q[104];
-rz(pi/32) q[109];
-cx q[109],q[105];
-rz(-pi/32) q[105];
-cx q[109],q[105];
-rz(pi/32) q[105];
-rz(pi/16) q[109];
-cx q[109],q[106];
-rz(-pi/16) q[106];
-cx q[109],q[106];
-rz(pi/16) q[106];
-rz(pi/8) q[109];
-cx q[109],q[107];
-rz(-pi/8) q[107];
-cx q[109],q[107];
-rz(pi/8) q[107];
-rz(pi/4) q[109];
-cx q[109],q[108];
-rz(-pi/4) q[108];
-cx q[109],q[108];
-rz(pi/4) q[108];
-rz(pi/2) q[109];
-sx q[109];
-rz(pi/2) q[109];
-rz(pi/2048) q[99];
-rz(1.42863093678434e-12) q[110];
-cx q[110],q[70];
-rz(-1.42863093678434e-12) q[70];
-cx q[110],q[70];
-rz(2.85726187356867e-12) q[110];
-cx q[110],q[71];
-rz(1.42863093678434e-12) q[70];
-rz(-2.85726187356867e-12) q[71];
-cx q[110],q[71];
-rz(5.71452374713734e-12) q[110];
-cx q[110],q[72];
-rz(2.85726187356867e-12) q[71];
-rz(-5.71452374713734e-12) q[72];
-cx q[110],q[72];
-rz(1.14290474942747e-11) q[110];
-cx q[110],q[73];
-rz(5.71452374713734e-12) q[72];
-rz(-1.14290474942747e-11) q[73];
-cx q[110],q[73];
-rz(2.28580949885494e-11) q[110];
-cx q[110],q[74];
-rz(1.14290474942747e-11) q[73];
-rz(-2.28580949885494e-11) q[74];
-cx q[110],q[74];
-rz(4.57161899770987e-11) q[110];
-cx q[110],q[75];
-rz(2.28580949885494e-11) q[74];
-rz(-4.57161899770987e-11) q[75];
-cx q[110],q[75];
-rz(9.14323799541975e-11) q[110];
-cx q[110],q[76];
-rz(4.57161899770987e-11) q[75];
-rz(-9.14323799541975e-11) q[76];
-cx q[110],q[76];
-rz(1.82864759908395e-10) q[110];
-cx q[110],q[77];
-rz(9.14323799541975e-11) q[76];
-rz(-1.82864759908395e-10) q[77];
-cx q[110],q[77];
-rz(3.6572951981679e-10) q[110];
-cx q[110],q[78];
-rz(1.82864759908395e-10) q[77];
-rz(-3.6572951981679e-10) q[78];
-cx q[110],q[78];
-rz(7.3145903963358e-10) q[110];
-cx q[110],q[79];
-rz(3.6572951981679e-10) q[78];
-rz(-7.3145903963358e-10) q[79];
-cx q[110],q[79];
-rz(pi/2147483648) q[110];
-cx q[110],q[80];
-rz(7.3145903963358e-10) q[79];
-rz(-pi/2147483648) q[80];
-cx q[110],q[80];
-rz(pi/1073741824) q[110];
-cx q[110],q[81];
-rz(pi/2147483648) q[80];
-rz(-pi/1073741824) q[81];
-cx q[110],q[81];
-rz(pi/536870912) q[110];
-cx q[110],q[82];
-rz(pi/1073741824) q[81];
-rz(-pi/536870912) q[82];
-cx q[110],q[82];
-rz(pi/268435456) q[110];
-cx q[110],q[83];
-rz(pi/536870912) q[82];
-rz(-pi/268435456) q[83];
-cx q[110],q[83];
-rz(pi/134217728) q[110];
-cx q[110],q[84];
-rz(pi/268435456) q[83];
-rz(-pi/134217728) q[84];
-cx q[110],q[84];
-rz(pi/67108864) q[110];
-cx q[110],q[85];
-rz(pi/134217728) q[84];
-rz(-pi/67108864) q[85];
-cx q[110],q[85];
-rz(pi/33554432) q[110];
-cx q[110],q[86];
-rz(pi/67108864) q[85];
-rz(-pi/33554432) q[86];
-cx q[110],q[86];
-rz(pi/16777216) q[110];
-cx q[110],q[87];
-rz(pi/33554432) q[86];
-rz(-pi/16777216) q[87];
-cx q[110],q[87];
-rz(pi/8388608) q[110];
-cx q[110],q[88];
-rz(pi/16777216) q[87];
-rz(-pi/8388608) q[88];
-cx q[110],q[88];
-rz(pi/4194304) q[110];
-cx q[110],q[89];
-rz(pi/8388608) q[88];
-rz(-pi/4194304) q[89];
-cx q[110],q[89];
-rz(pi/2097152) q[110];
-cx q[110],q[90];
-rz(pi/4194304) q[89];
-rz(-pi/2097152) q[90];
-cx q[110],q[90];
-rz(pi/1048576) q[110];
-cx q[110],q[91];
-rz(pi/2097152) q[90];
-rz(-pi/1048576) q[91];
-cx q[110],q[91];
-rz(pi/524288) q[110];
-cx q[110],q[92];
-rz(pi/1048576) q[91];
-rz(-pi/524288) q[92];
-cx q[110],q[92];
-rz(pi/262144) q[110];
-cx q[110],q[93];
-rz(pi/524288) q[92];
-rz(-pi/262144) q[93];
-cx q[110],q[93];
-rz(pi/131072) q[110];
-cx q[110],q[94];
-rz(pi/262144) q[93];
-rz(-pi/131072) q[94];
-cx q[110],q[94];
-rz(pi/65536) q[110];
-cx q[110],q[95];
-rz(pi/131072) q[94];
-rz(-pi/65536) q[95];
-cx q[110],q[95];
-rz(pi/32768) q[110];
-cx q[110],q[96];
-rz(pi/65536) q[95];
-rz(-pi/32768) q[96];
-cx q[110],q[96];
-rz(pi/16384) q[110];
-cx q[110],q[97];
-rz(pi/32768) q[96];
-rz(-pi/16384) q[97];
-cx q[110],q[97];
-rz(pi/8192) q[110];
-cx q[110],q[98];
-rz(pi/16384) q[97];
-rz(-pi/8192) q[98];
-cx q[110],q[98];
-rz(pi/4096) q[110];
-cx q[110],q[99];
-rz(pi/8192) q[98];
-rz(-pi/4096) q[99];
-cx q[110],q[99];
-rz(pi/2048) q[110];
-cx q[110],q[100];
-rz(-pi/2048) q[100];
-cx q[110],q[100];
-rz(pi/2048) q[100];
-rz(pi/1024) q[110];
-cx q[110],q[101];
-rz(-pi/1024) q[101];
-cx q[110],q[101];
-rz(pi/1024) q[101];
-rz(pi/512) q[110];
-cx q[110],q[102];
-rz(-pi/512) q[102];
-cx q[110],q[102];
-rz(pi/512) q[102];
-rz(pi/256) q[110];
-cx q[110],q[103];
-rz(-pi/256) q[103];
-cx q[110],q[103];
-rz(pi/256) q[103];
-rz(pi/128) q[110];
-cx q[110],q[104];
-rz(-pi/128) q[104];
-cx q[110],q[104];
-rz(pi/128) q[104];
-rz(pi/64) q[110];
-cx q[110],q[105];
-rz(-pi/64) q[105];
-cx q[110],q[105];
-rz(pi/64) q[105];
-rz(pi/32) q[110];
-cx q[110],q[106];
-rz(-pi/32) q[106];
-cx q[110],q[106];
-rz(pi/32) q[106];
-rz(pi/16) q[110];
-cx q[110],q[107];
-rz(-pi/16) q[107];
-cx q[110],q[107];
-rz(pi/16) q[107];
-rz(pi/8) q[110];
-cx q[110],q[108];
-rz(-pi/8) q[108];
-cx q[110],q[108];
-rz(pi/8) q[108];
-rz(pi/4) q[110];
-cx q[110],q[109];
-rz(-pi/4) q[109];
-cx q[110],q[109];
-rz(pi/4) q[109];
-rz(pi/2) q[110];
-sx q[110];
-rz(pi/2) q[110];
-rz(pi/4096) q[99];
-rz(1.42863093678434e-12) q[111];
-cx q[111],q[71];
-rz(-1.42863093678434e-12) q[71];
-cx q[111],q[71];
-rz(2.85726187356867e-12) q[111];
-cx q[111],q[72];
-rz(1.42863093678434e-12) q[71];
-rz(-2.85726187356867e-12) q[72];
-cx q[111],q[72];
-rz(5.71452374713734e-12) q[111];
-cx q[111],q[73];
-rz(2.85726187356867e-12) q[72];
-rz(-5.71452374713734e-12) q[73];
-cx q[111],q[73];
-rz(1.14290474942747e-11) q[111];
-cx q[111],q[74];
-rz(5.71452374713734e-12) q[73];
-rz(-1.14290474942747e-11) q[74];
-cx q[111],q[74];
-rz(2.28580949885494e-11) q[111];
-cx q[111],q[75];
-rz(1.14290474942747e-11) q[74];
-rz(-2.28580949885494e-11) q[75];
-cx q[111],q[75];
-rz(4.57161899770987e-11) q[111];
-cx q[111],q[76];
-rz(2.28580949885494e-11) q[75];
-rz(-4.57161899770987e-11) q[76];
-cx q[111],q[76];
-rz(9.14323799541975e-11) q[111];
-cx q[111],q[77];
-rz(4.57161899770987e-11) q[76];
-rz(-9.14323799541975e-11) q[77];
-cx q[111],q[77];
-rz(1.82864759908395e-10) q[111];
-cx q[111],q[78];
-rz(9.14323799541975e-11) q[77];
-rz(-1.82864759908395e-10) q[78];
-cx q[111],q[78];
-rz(3.6572951981679e-10) q[111];
-cx q[111],q[79];
-rz(1.82864759908395e-10) q[78];
-rz(-3.6572951981679e-10) q[79];
-cx q[111],q[79];
-rz(7.3145903963358e-10) q[111];
-cx q[111],q[80];
-rz(3.6572951981679e-10) q[79];
-rz(-7.3145903963358e-10) q[80];
-cx q[111],q[80];
-rz(pi/2147483648) q[111];
-cx q[111],q[81];
-rz(7.3145903963358e-10) q[80];
-rz(-pi/2147483648) q[81];
-cx q[111],q[81];
-rz(pi/1073741824) q[111];
-cx q[111],q[82];
-rz(pi/2147483648) q[81];
-rz(-pi/1073741824) q[82];
-cx q[111],q[82];
-rz(pi/536870912) q[111];
-cx q[111],q[83];
-rz(pi/1073741824) q[82];
-rz(-pi/536870912) q[83];
-cx q[111],q[83];
-rz(pi/268435456) q[111];
-cx q[111],q[84];
-rz(pi/536870912) q[83];
-rz(-pi/268435456) q[84];
-cx q[111],q[84];
-rz(pi/134217728) q[111];
-cx q[111],q[85];
-rz(pi/268435456) q[84];
-rz(-pi/134217728) q[85];
-cx q[111],q[85];
-rz(pi/67108864) q[111];
-cx q[111],q[86];
-rz(pi/134217728) q[85];
-rz(-pi/67108864) q[86];
-cx q[111],q[86];
-rz(pi/33554432) q[111];
-cx q[111],q[87];
-rz(pi/67108864) q[86];
-rz(-pi/33554432) q[87];
-cx q[111],q[87];
-rz(pi/16777216) q[111];
-cx q[111],q[88];
-rz(pi/33554432) q[87];
-rz(-pi/16777216) q[88];
-cx q[111],q[88];
-rz(pi/8388608) q[111];
-cx q[111],q[89];
-rz(pi/16777216) q[88];
-rz(-pi/8388608) q[89];
-cx q[111],q[89];
-rz(pi/4194304) q[111];
-cx q[111],q[90];
-rz(pi/8388608) q[89];
-rz(-pi/4194304) q[90];
-cx q[111],q[90];
-rz(pi/2097152) q[111];
-cx q[111],q[91];
-rz(pi/4194304) q[90];
-rz(-pi/2097152) q[91];
-cx q[111],q[91];
-rz(pi/1048576) q[111];
-cx q[111],q[92];
-rz(pi/2097152) q[91];
-rz(-pi/1048576) q[92];
-cx q[111],q[92];
-rz(pi/524288) q[111];
-cx q[111],q[93];
-rz(pi/1048576) q[92];
-rz(-pi/524288) q[93];
-cx q[111],q[93];
-rz(pi/262144) q[111];
-cx q[111],q[94];
-rz(pi/524288) q[93];
-rz(-pi/262144) q[94];
-cx q[111],q[94];
-rz(pi/131072) q[111];
-cx q[111],q[95];
-rz(pi/262144) q[94];
-rz(-pi/131072) q[95];
-cx q[111],q[95];
-rz(pi/65536) q[111];
-cx q[111],q[96];
-rz(pi/131072) q[95];
-rz(-pi/65536) q[96];
-cx q[111],q[96];
-rz(pi/32768) q[111];
-cx q[111],q[97];
-rz(pi/65536) q[96];
-rz(-pi/32768) q[97];
-cx q[111],q[97];
-rz(pi/16384) q[111];
-cx q[111],q[98];
-rz(pi/32768) q[97];
-rz(-pi/16384) q[98];
-cx q[111],q[98];
-rz(pi/8192) q[111];
-cx q[111],q[99];
-rz(pi/16384) q[98];
-rz(-pi/8192) q[99];
-cx q[111],q[99];
-rz(pi/4096) q[111];
-cx q[111],q[100];
-rz(-pi/4096) q[100];
-cx q[111],q[100];
-rz(pi/4096) q[100];
-rz(pi/2048) q[111];
-cx q[111],q[101];
-rz(-pi/2048) q[101];
-cx q[111],q[101];
-rz(pi/2048) q[101];
-rz(pi/1024) q[111];
-cx q[111],q[102];
-rz(-pi/1024) q[102];
-cx q[111],q[102];
-rz(pi/1024) q[102];
-rz(pi/512) q[111];
-cx q[111],q[103];
-rz(-pi/512) q[103];
-cx q[111],q[103];
-rz(pi/512) q[103];
-rz(pi/256) q[111];
-cx q[111],q[104];
-rz(-pi/256) q[104];
-cx q[111],q[104];
-rz(pi/256) q[104];
-rz(pi/128) q[111];
-cx q[111],q[105];
-rz(-pi/128) q[105];
-cx q[111],q[105];
-rz(pi/128) q[105];
-rz(pi/64) q[111];
-cx q[111],q[106];
-rz(-pi/64) q[106];
-cx q[111],q[106];
-rz(pi/64) q[106];
-rz(pi/32) q[111];
-cx q[111],q[107];
-rz(-pi/32) q[107];
-cx q[111],q[107];
-rz(pi/32) q[107];
-rz(pi/16) q[111];
-cx q[111],q[108];
-rz(-pi/16) q[108];
-cx q[111],q[108];
-rz(pi/16) q[108];
-rz(pi/8) q[111];
-cx q[111],q[109];
-rz(-pi/8) q[109];
-cx q[111],q[109];
-rz(pi/8) q[109];
-rz(pi/4) q[111];
-cx q[111],q[110];
-rz(-pi/4) q[110];
-cx q[111],q[110];
-rz(pi/4) q[110];
-rz(pi/2) q[111];
-sx q[111];
-rz(pi/2) q[111];
-rz(pi/8192) q[99];
-rz(1.42863093678434e-12) q[112];
-cx q[112],q[72];
-rz(-1.42863093678434e-12) q[72];
-cx q[112],q[72];
-rz(2.85726187356867e-12) q[112];
-cx q[112],q[73];
-rz(1.42863093678434e-12) q[72];
-rz(-2.85726187356867e-12) q[73];
-cx q[112],q[73];
-rz(5.71452374713734e-12) q[112];
-cx q[112],q[74];
-rz(2.85726187356867e-12) q[73];
-rz(-5.71452374713734e-12) q[74];
-cx q[112],q[74];
-rz(1.14290474942747e-11) q[112];
-cx q[112],q[75];
-rz(5.71452374713734e-12) q[74];
-rz(-1.14290474942747e-11) q[75];
-cx q[112],q[75];
-rz(2.28580949885494e-11) q[112];
-cx q[112],q[76];
-rz(1.14290474942747e-11) q[75];
-rz(-2.28580949885494e-11) q[76];
-cx q[112],q[76];
-rz(4.57161899770987e-11) q[112];
-cx q[112],q[77];
-rz(2.28580949885494e-11) q[76];
-rz(-4.57161899770987e-11) q[77];
-cx q[112],q[77];
-rz(9.14323799541975e-11) q[112];
-cx q[112],q[78];
-rz(4.57161899770987e-11) q[77];
-rz(-9.14323799541975e-11) q[78];
-cx q[112],q[78];
-rz(1.82864759908395e-10) q[112];
-cx q[112],q[79];
-rz(9.14323799541975e-11) q[78];
-rz(-1.82864759908395e-10) q[79];
-cx q[112],q[79];
-rz(3.6572951981679e-10) q[112];
-cx q[112],q[80];
-rz(1.82864759908395e-10) q[79];
-rz(-3.6572951981679e-10) q[80];
-cx q[112],q[80];
-rz(7.3145903963358e-10) q[112];
-cx q[112],q[81];
-rz(3.6572951981679e-10) q[80];
-rz(-7.3145903963358e-10) q[81];
-cx q[112],q[81];
-rz(pi/2147483648) q[112];
-cx q[112],q[82];
-rz(7.3145903963358e-10) q[81];
-rz(-pi/2147483648) q[82];
-cx q[112],q[82];
-rz(pi/1073741824) q[112];
-cx q[112],q[83];
-rz(pi/2147483648) q[82];
-rz(-pi/1073741824) q[83];
-cx q[112],q[83];
-rz(pi/536870912) q[112];
-cx q[112],q[84];
-rz(pi/1073741824) q[83];
-rz(-pi/536870912) q[84];
-cx q[112],q[84];
-rz(pi/268435456) q[112];
-cx q[112],q[85];
-rz(pi/536870912) q[84];
-rz(-pi/268435456) q[85];
-cx q[112],q[85];
-rz(pi/134217728) q[112];
-cx q[112],q[86];
-rz(pi/268435456) q[85];
-rz(-pi/134217728) q[86];
-cx q[112],q[86];
-rz(pi/67108864) q[112];
-cx q[112],q[87];
-rz(pi/134217728) q[86];
-rz(-pi/67108864) q[87];
-cx q[112],q[87];
-rz(pi/33554432) q[112];
-cx q[112],q[88];
-rz(pi/67108864) q[87];
-rz(-pi/33554432) q[88];
-cx q[112],q[88];
-rz(pi/16777216) q[112];
-cx q[112],q[89];
-rz(pi/33554432) q[88];
-rz(-pi/16777216) q[89];
-cx q[112],q[89];
-rz(pi/8388608) q[112];
-cx q[112],q[90];
-rz(pi/16777216) q[89];
-rz(-pi/8388608) q[90];
-cx q[112],q[90];
-rz(pi/4194304) q[112];
-cx q[112],q[91];
-rz(pi/8388608) q[90];
-rz(-pi/4194304) q[91];
-cx q[112],q[91];
-rz(pi/2097152) q[112];
-cx q[112],q[92];
-rz(pi/4194304) q[91];
-rz(-pi/2097152) q[92];
-cx q[112],q[92];
-rz(pi/1048576) q[112];
-cx q[112],q[93];
-rz(pi/2097152) q[92];
-rz(-pi/1048576) q[93];
-cx q[112],q[93];
-rz(pi/524288) q[112];
-cx q[112],q[94];
-rz(pi/1048576) q[93];
-rz(-pi/524288) q[94];
-cx q[112],q[94];
-rz(pi/262144) q[112];
-cx q[112],q[95];
-rz(pi/524288) q[94];
-rz(-pi/262144) q[95];
-cx q[112],q[95];
-rz(pi/131072) q[112];
-cx q[112],q[96];
-rz(pi/262144) q[95];
-rz(-pi/131072) q[96];
-cx q[112],q[96];
-rz(pi/65536) q[112];
-cx q[112],q[97];
-rz(pi/131072) q[96];
-rz(-pi/65536) q[97];
-cx q[112],q[97];
-rz(pi/32768) q[112];
-cx q[112],q[98];
-rz(pi/65536) q[97];
-rz(-pi/32768) q[98];
-cx q[112],q[98];
-rz(pi/16384) q[112];
-cx q[112],q[99];
-rz(pi/32768) q[98];
-rz(-pi/16384) q[99];
-cx q[112],q[99];
-rz(pi/8192) q[112];
-cx q[112],q[100];
-rz(-pi/8192) q[100];
-cx q[112],q[100];
-rz(pi/8192) q[100];
-rz(pi/4096) q[112];
-cx q[112],q[101];
-rz(-pi/4096) q[101];
-cx q[112],q[101];
-rz(pi/4096) q[101];
-rz(pi/2048) q[112];
-cx q[112],q[102];
-rz(-pi/2048) q[102];
-cx q[112],q[102];
-rz(pi/2048) q[102];
-rz(pi/1024) q[112];
-cx q[112],q[103];
-rz(-pi/1024) q[103];
-cx q[112],q[103];
-rz(pi/1024) q[103];
-rz(pi/512) q[112];
-cx q[112],q[104];
-rz(-pi/512) q[104];
-cx q[112],q[104];
-rz(pi/512) q[104];
-rz(pi/256) q[112];
-cx q[112],q[105];
-rz(-pi/256) q[105];
-cx q[112],q[105];
-rz(pi/256) q[105];
-rz(pi/128) q[112];
-cx q[112],q[106];
-rz(-pi/128) q[106];
-cx q[112],q[106];
-rz(pi/128) q[106];
-rz(pi/64) q[112];
-cx q[112],q[107];
-rz(-pi/64) q[107];
-cx q[112],q[107];
-rz(pi/64) q[107];
-rz(pi/32) q[112];
-cx q[112],q[108];
-rz(-pi/32) q[108];
-cx q[112],q[108];
-rz(pi/32) q[108];
-rz(pi/16) q[112];
-cx q[112],q[109];
-rz(-pi/16) q[109];
-cx q[112],q[109];
-rz(pi/16) q[109];
-rz(pi/8) q[112];
-cx q[112],q[110];
-rz(-pi/8) q[110];
-cx q[112],q[110];
-rz(pi/8) q[110];
-rz(pi/4) q[112];
-cx q[112],q[111];
-rz(-pi/4) q[111];
-cx q[112],q[111];
-rz(pi/4) q[111];
-rz(pi/2) q[112];
-sx q[112];
-rz(pi/2) q[112];
-rz(pi/16384) q[99];
-rz(1.42863093678434e-12) q[113];
-cx q[113],q[73];
-rz(-1.42863093678434e-12) q[73];
-cx q[113],q[73];
-rz(2.85726187356867e-12) q[113];
-cx q[113],q[74];
-rz(1.42863093678434e-12) q[73];
-rz(-2.85726187356867e-12) q[74];
-cx q[113],q[74];
-rz(5.71452374713734e-12) q[113];
-cx q[113],q[75];
-rz(2.85726187356867e-12) q[74];
-rz(-5.71452374713734e-12) q[75];
-cx q[113],q[75];
-rz(1.14290474942747e-11) q[113];
-cx q[113],q[76];
-rz(5.71452374713734e-12) q[75];
-rz(-1.14290474942747e-11) q[76];
-cx q[113],q[76];
-rz(2.28580949885494e-11) q[113];
-cx q[113],q[77];
-rz(1.14290474942747e-11) q[76];
-rz(-2.28580949885494e-11) q[77];
-cx q[113],q[77];
-rz(4.57161899770987e-11) q[113];
-cx q[113],q[78];
-rz(2.28580949885494e-11) q[77];
-rz(-4.57161899770987e-11) q[78];
-cx q[113],q[78];
-rz(9.14323799541975e-11) q[113];
-cx q[113],q[79];
-rz(4.57161899770987e-11) q[78];
-rz(-9.14323799541975e-11) q[79];
-cx q[113],q[79];
-rz(1.82864759908395e-10) q[113];
-cx q[113],q[80];
-rz(9.14323799541975e-11) q[79];
-rz(-1.82864759908395e-10) q[80];
-cx q[113],q[80];
-rz(3.6572951981679e-10) q[113];
-cx q[113],q[81];
-rz(1.82864759908395e-10) q[80];
-rz(-3.6572951981679e-10) q[81];
-cx q[113],q[81];
-rz(7.3145903963358e-10) q[113];
-cx q[113],q[82];
-rz(3.6572951981679e-10) q[81];
-rz(-7.3145903963358e-10) q[82];
-cx q[113],q[82];
-rz(pi/2147483648) q[113];
-cx q[113],q[83];
-rz(7.3145903963358e-10) q[82];
-rz(-pi/2147483648) q[83];
-cx q[113],q[83];
-rz(pi/1073741824) q[113];
-cx q[113],q[84];
-rz(pi/2147483648) q[83];
-rz(-pi/1073741824) q[84];
-cx q[113],q[84];
-rz(pi/536870912) q[113];
-cx q[113],q[85];
-rz(pi/1073741824) q[84];
-rz(-pi/536870912) q[85];
-cx q[113],q[85];
-rz(pi/268435456) q[113];
-cx q[113],q[86];
-rz(pi/536870912) q[85];
-rz(-pi/268435456) q[86];
-cx q[113],q[86];
-rz(pi/134217728) q[113];
-cx q[113],q[87];
-rz(pi/268435456) q[86];
-rz(-pi/134217728) q[87];
-cx q[113],q[87];
-rz(pi/67108864) q[113];
-cx q[113],q[88];
-rz(pi/134217728) q[87];
-rz(-pi/67108864) q[88];
-cx q[113],q[88];
-rz(pi/33554432) q[113];
-cx q[113],q[89];
-rz(pi/67108864) q[88];
-rz(-pi/33554432) q[89];
-cx q[113],q[89];
-rz(pi/16777216) q[113];
-cx q[113],q[90];
-rz(pi/33554432) q[89];
-rz(-pi/16777216) q[90];
-cx q[113],q[90];
-rz(pi/8388608) q[113];
-cx q[113],q[91];
-rz(pi/16777216) q[90];
-rz(-pi/8388608) q[91];
-cx q[113],q[91];
-rz(pi/4194304) q[113];
-cx q[113],q[92];
-rz(pi/8388608) q[91];
-rz(-pi/4194304) q[92];
-cx q[113],q[92];
-rz(pi/2097152) q[113];
-cx q[113],q[93];
-rz(pi/4194304) q[92];
-rz(-pi/2097152) q[93];
-cx q[113],q[93];
-rz(pi/1048576) q[113];
-cx q[113],q[94];
-rz(pi/2097152) q[93];
-rz(-pi/1048576) q[94];
-cx q[113],q[94];
-rz(pi/524288) q[113];
-cx q[113],q[95];
-rz(pi/1048576) q[94];
-rz(-pi/524288) q[95];
-cx q[113],q[95];
-rz(pi/262144) q[113];
-cx q[113],q[96];
-rz(pi/524288) q[95];
-rz(-pi/262144) q[96];
-cx q[113],q[96];
-rz(pi/131072) q[113];
-cx q[113],q[97];
-rz(pi/262144) q[96];
-rz(-pi/131072) q[97];
-cx q[113],q[97];
-rz(pi/65536) q[113];
-cx q[113],q[98];
-rz(pi/131072) q[97];
-rz(-pi/65536) q[98];
-cx q[113],q[98];
-rz(pi/32768) q[113];
-cx q[113],q[99];
-rz(pi/65536) q[98];
-rz(-pi/32768) q[99];
-cx q[113],q[99];
-rz(pi/16384) q[113];
-cx q[113],q[100];
-rz(-pi/16384) q[100];
-cx q[113],q[100];
-rz(pi/16384) q[100];
-rz(pi/8192) q[113];
-cx q[113],q[101];
-rz(-pi/8192) q[101];
-cx q[113],q[101];
-rz(pi/8192) q[101];
-rz(pi/4096) q[113];
-cx q[113],q[102];
-rz(-pi/4096) q[102];
-cx q[113],q[102];
-rz(pi/4096) q[102];
-rz(pi/2048) q[113];
-cx q[113],q[103];
-rz(-pi/2048) q[103];
-cx q[113],q[103];
-rz(pi/2048) q[103];
-rz(pi/1024) q[113];
-cx q[113],q[104];
-rz(-pi/1024) q[104];
-cx q[113],q[104];
-rz(pi/1024) q[104];
-rz(pi/512) q[113];
-cx q[113],q[105];
-rz(-pi/512) q[105];
-cx q[113],q[105];
-rz(pi/512) q[105];
-rz(pi/256) q[113];
-cx q[113],q[106];
-rz(-pi/256) q[106];
-cx q[113],q[106];
-rz(pi/256) q[106];
-rz(pi/128) q[113];
-cx q[113],q[107];
-rz(-pi/128) q[107];
-cx q[113],q[107];
-rz(pi/128) q[107];
-rz(pi/64) q[113];
-cx q[113],q[108];
-rz(-pi/64) q[108];
-cx q[113],q[108];
-rz(pi/64) q[108];
-rz(pi/32) q[113];
-cx q[113],q[109];
-rz(-pi/32) q[109];
-cx q[113],q[109];
-rz(pi/32) q[109];
-rz(pi/16) q[113];
-cx q[113],q[110];
-rz(-pi/16) q[110];
-cx q[113],q[110];
-rz(pi/16) q[110];
-rz(pi/8) q[113];
-cx q[113],q[111];
-rz(-pi/8) q[111];
-cx q[113],q[111];
-rz(pi/8) q[111];
-rz(pi/4) q[113];
-cx q[113],q[112];
-rz(-pi/4) q[112];
-cx q[113],q[112];
-rz(pi/4) q[112];
-rz(pi/2) q[113];
-sx q[113];
-rz(pi/2) q[113];
-rz(pi/32768) q[99];
-rz(1.42863093678434e-12) q[114];
-cx q[114],q[74];
-rz(-1.42863093678434e-12) q[74];
-cx q[114],q[74];
-rz(2.85726187356867e-12) q[114];
-cx q[114],q[75];
-rz(1.42863093678434e-12) q[74];
-rz(-2.85726187356867e-12) q[75];
-cx q[114],q[75];
-rz(5.71452374713734e-12) q[114];
-cx q[114],q[76];
-rz(2.85726187356867e-12) q[75];
-rz(-5.71452374713734e-12) q[76];
-cx q[114],q[76];
-rz(1.14290474942747e-11) q[114];
-cx q[114],q[77];
-rz(5.71452374713734e-12) q[76];
-rz(-1.14290474942747e-11) q[77];
-cx q[114],q[77];
-rz(2.28580949885494e-11) q[114];
-cx q[114],q[78];
-rz(1.14290474942747e-11) q[77];
-rz(-2.28580949885494e-11) q[78];
-cx q[114],q[78];
-rz(4.57161899770987e-11) q[114];
-cx q[114],q[79];
-rz(2.28580949885494e-11) q[78];
-rz(-4.57161899770987e-11) q[79];
-cx q[114],q[79];
-rz(9.14323799541975e-11) q[114];
-cx q[114],q[80];
-rz(4.57161899770987e-11) q[79];
-rz(-9.14323799541975e-11) q[80];
-cx q[114],q[80];
-rz(1.82864759908395e-10) q[114];
-cx q[114],q[81];
-rz(9.14323799541975e-11) q[80];
-rz(-1.82864759908395e-10) q[81];
-cx q[114],q[81];
-rz(3.6572951981679e-10) q[114];
-cx q[114],q[82];
-rz(1.82864759908395e-10) q[81];
-rz(-3.6572951981679e-10) q[82];
-cx q[114],q[82];
-rz(7.3145903963358e-10) q[114];
-cx q[114],q[83];
-rz(3.6572951981679e-10) q[82];
-rz(-7.3145903963358e-10) q[83];
-cx q[114],q[83];
-rz(pi/2147483648) q[114];
-cx q[114],q[84];
-rz(7.3145903963358e-10) q[83];
-rz(-pi/2147483648) q[84];
-cx q[114],q[84];
-rz(pi/1073741824) q[114];
-cx q[114],q[85];
-rz(pi/2147483648) q[84];
-rz(-pi/1073741824) q[85];
-cx q[114],q[85];
-rz(pi/536870912) q[114];
-cx q[114],q[86];
-rz(pi/1073741824) q[85];
-rz(-pi/536870912) q[86];
-cx q[114],q[86];
-rz(pi/268435456) q[114];
-cx q[114],q[87];
-rz(pi/536870912) q[86];
-rz(-pi/268435456) q[87];
-cx q[114],q[87];
-rz(pi/134217728) q[114];
-cx q[114],q[88];
-rz(pi/268435456) q[87];
-rz(-pi/134217728) q[88];
-cx q[114],q[88];
-rz(pi/67108864) q[114];
-cx q[114],q[89];
-rz(pi/134217728) q[88];
-rz(-pi/67108864) q[89];
-cx q[114],q[89];
-rz(pi/33554432) q[114];
-cx q[114],q[90];
-rz(pi/67108864) q[89];
-rz(-pi/33554432) q[90];
-cx q[114],q[90];
-rz(pi/16777216) q[114];
-cx q[114],q[91];
-rz(pi/33554432) q[90];
-rz(-pi/16777216) q[91];
-cx q[114],q[91];
-rz(pi/8388608) q[114];
-cx q[114],q[92];
-rz(pi/16777216) q[91];
-rz(-pi/8388608) q[92];
-cx q[114],q[92];
-rz(pi/4194304) q[114];
-cx q[114],q[93];
-rz(pi/8388608) q[92];
-rz(-pi/4194304) q[93];
-cx q[114],q[93];
-rz(pi/2097152) q[114];
-cx q[114],q[94];
-rz(pi/4194304) q[93];
-rz(-pi/2097152) q[94];
-cx q[114],q[94];
-rz(pi/1048576) q[114];
-cx q[114],q[95];
-rz(pi/2097152) q[94];
-rz(-pi/1048576) q[95];
-cx q[114],q[95];
-rz(pi/524288) q[114];
-cx q[114],q[96];
-rz(pi/1048576) q[95];
-rz(-pi/524288) q[96];
-cx q[114],q[96];
-rz(pi/262144) q[114];
-cx q[114],q[97];
-rz(pi/524288) q[96];
-rz(-pi/262144) q[97];
-cx q[114],q[97];
-rz(pi/131072) q[114];
-cx q[114],q[98];
-rz(pi/262144) q[97];
-rz(-pi/131072) q[98];
-cx q[114],q[98];
-rz(pi/65536) q[114];
-cx q[114],q[99];
-rz(pi/131072) q[98];
-rz(-pi/65536) q[99];
-cx q[114],q[99];
-rz(pi/32768) q[114];
-cx q[114],q[100];
-rz(-pi/32768) q[100];
-cx q[114],q[100];
-rz(pi/32768) q[100];
-rz(pi/16384) q[114];
-cx q[114],q[101];
-rz(-pi/16384) q[101];
-cx q[114],q[101];
-rz(pi/16384) q[101];
-rz(pi/8192) q[114];
-cx q[114],q[102];
-rz(-pi/8192) q[102];
-cx q[114],q[102];
-rz(pi/8192) q[102];
-rz(pi/4096) q[114];
-cx q[114],q[103];
-rz(-pi/4096) q[103];
-cx q[114],q[103];
-rz(pi/4096) q[103];
-rz(pi/2048) q[114];
-cx q[114],q[104];
-rz(-pi/2048) q[104];
-cx q[114],q[104];
-rz(pi/2048) q[104];
-rz(pi/1024) q[114];
-cx q[114],q[105];
-rz(-pi/1024) q[105];
-cx q[114],q[105];
-rz(pi/1024) q[105];
-rz(pi/512) q[114];
-cx q[114],q[106];
-rz(-pi/512) q[106];
-cx q[114],q[106];
-rz(pi/512) q[106];
-rz(pi/256) q[114];
-cx q[114],q[107];
-rz(-pi/256) q[107];
-cx q[114],q[107];
-rz(pi/256) q[107];
-rz(pi/128) q[114];
-cx q[114],q[108];
-rz(-pi/128) q[108];
-cx q[114],q[108];
-rz(pi/128) q[108];
-rz(pi/64) q[114];
-cx q[114],q[109];
-rz(-pi/64) q[109];
-cx q[114],q[109];
-rz(pi/64) q[109];
-rz(pi/32) q[114];
-cx q[114],q[110];
-rz(-pi/32) q[110];
-cx q[114],q[110];
-rz(pi/32) q[110];
-rz(pi/16) q[114];
-cx q[114],q[111];
-rz(-pi/16) q[111];
-cx q[114],q[111];
-rz(pi/16) q[111];
-rz(pi/8) q[114];
-cx q[114],q[112];
-rz(-pi/8) q[112];
-cx q[114],q[112];
-rz(pi/8) q[112];
-rz(pi/4) q[114];
-cx q[114],q[113];
-rz(-pi/4) q[113];
-cx q[114],q[113];
-rz(pi/4) q[113];
-rz(pi/2) q[114];
-sx q[114];
-rz(pi/2) q[114];
-rz(pi/65536) q[99];
-rz(1.42863093678434e-12) q[115];
-cx q[115],q[75];
-rz(-1.42863093678434e-12) q[75];
-cx q[115],q[75];
-rz(2.85726187356867e-12) q[115];
-cx q[115],q[76];
-rz(1.42863093678434e-12) q[75];
-rz(-2.85726187356867e-12) q[76];
-cx q[115],q[76];
-rz(5.71452374713734e-12) q[115];
-cx q[115],q[77];
-rz(2.85726187356867e-12) q[76];
-rz(-5.71452374713734e-12) q[77];
-cx q[115],q[77];
-rz(1.14290474942747e-11) q[115];
-cx q[115],q[78];
-rz(5.71452374713734e-12) q[77];
-rz(-1.14290474942747e-11) q[78];
-cx q[115],q[78];
-rz(2.28580949885494e-11) q[115];
-cx q[115],q[79];
-rz(1.14290474942747e-11) q[78];
-rz(-2.28580949885494e-11) q[79];
-cx q[115],q[79];
-rz(4.57161899770987e-11) q[115];
-cx q[115],q[80];
-rz(2.28580949885494e-11) q[79];
-rz(-4.57161899770987e-11) q[80];
-cx q[115],q[80];
-rz(9.14323799541975e-11) q[115];
-cx q[115],q[81];
-rz(4.57161899770987e-11) q[80];
-rz(-9.14323799541975e-11) q[81];
-cx q[115],q[81];
-rz(1.82864759908395e-10) q[115];
-cx q[115],q[82];
-rz(9.14323799541975e-11) q[81];
-rz(-1.82864759908395e-10) q[82];
-cx q[115],q[82];
-rz(3.6572951981679e-10) q[115];
-cx q[115],q[83];
-rz(1.82864759908395e-10) q[82];
-rz(-3.6572951981679e-10) q[83];
-cx q[115],q[83];
-rz(7.3145903963358e-10) q[115];
-cx q[115],q[84];
-rz(3.6572951981679e-10) q[83];
-rz(-7.3145903963358e-10) q[84];
-cx q[115],q[84];
-rz(pi/2147483648) q[115];
-cx q[115],q[85];
-rz(7.3145903963358e-10) q[84];
-rz(-pi/2147483648) q[85];
-cx q[115],q[85];
-rz(pi/1073741824) q[115];
-cx q[115],q[86];
-rz(pi/2147483648) q[85];
-rz(-pi/1073741824) q[86];
-cx q[115],q[86];
-rz(pi/536870912) q[115];
-cx q[115],q[87];
-rz(pi/1073741824) q[86];
-rz(-pi/536870912) q[87];
-cx q[115],q[87];
-rz(pi/268435456) q[115];
-cx q[115],q[88];
-rz(pi/536870912) q[87];
-rz(-pi/268435456) q[88];
-cx q[115],q[88];
-rz(pi/134217728) q[115];
-cx q[115],q[89];
-rz(pi/268435456) q[88];
-rz(-pi/134217728) q[89];
-cx q[115],q[89];
-rz(pi/67108864) q[115];
-cx q[115],q[90];
-rz(pi/134217728) q[89];
-rz(-pi/67108864) q[90];
-cx q[115],q[90];
-rz(pi/33554432) q[115];
-cx q[115],q[91];
-rz(pi/67108864) q[90];
-rz(-pi/33554432) q[91];
-cx q[115],q[91];
-rz(pi/16777216) q[115];
-cx q[115],q[92];
-rz(pi/33554432) q[91];
-rz(-pi/16777216) q[92];
-cx q[115],q[92];
-rz(pi/8388608) q[115];
-cx q[115],q[93];
-rz(pi/16777216) q[92];
-rz(-pi/8388608) q[93];
-cx q[115],q[93];
-rz(pi/4194304) q[115];
-cx q[115],q[94];
-rz(pi/8388608) q[93];
-rz(-pi/4194304) q[94];
-cx q[115],q[94];
-rz(pi/2097152) q[115];
-cx q[115],q[95];
-rz(pi/4194304) q[94];
-rz(-pi/2097152) q[95];
-cx q[115],q[95];
-rz(pi/1048576) q[115];
-cx q[115],q[96];
-rz(pi/2097152) q[95];
-rz(-pi/1048576) q[96];
-cx q[115],q[96];
-rz(pi/524288) q[115];
-cx q[115],q[97];
-rz(pi/1048576) q[96];
-rz(-pi/524288) q[97];
-cx q[115],q[97];
-rz(pi/262144) q[115];
-cx q[115],q[98];
-rz(pi/524288) q[97];
-rz(-pi/262144) q[98];
-cx q[115],q[98];
-rz(pi/131072) q[115];
-cx q[115],q[99];
-rz(pi/262144) q[98];
-rz(-pi/131072) q[99];
-cx q[115],q[99];
-rz(pi/65536) q[115];
-cx q[115],q[100];
-rz(-pi/65536) q[100];
-cx q[115],q[100];
-rz(pi/65536) q[100];
-rz(pi/32768) q[115];
-cx q[115],q[101];
-rz(-pi/32768) q[101];
-cx q[115],q[101];
-rz(pi/32768) q[101];
-rz(pi/16384) q[115];
-cx q[115],q[102];
-rz(-pi/16384) q[102];
-cx q[115],q[102];
-rz(pi/16384) q[102];
-rz(pi/8192) q[115];
-cx q[115],q[103];
-rz(-pi/8192) q[103];
-cx q[115],q[103];
-rz(pi/8192) q[103];
-rz(pi/4096) q[115];
-cx q[115],q[104];
-rz(-pi/4096) q[104];
-cx q[115],q[104];
-rz(pi/4096) q[104];
-rz(pi/2048) q[115];
-cx q[115],q[105];
-rz(-pi/2048) q[105];
-cx q[115],q[105];
-rz(pi/2048) q[105];
-rz(pi/1024) q[115];
-cx q[115],q[106];
-rz(-pi/1024) q[106];
-cx q[115],q[106];
-rz(pi/1024) q[106];
-rz(pi/512) q[115];
-cx q[115],q[107];
-rz(-pi/512) q[107];
-cx q[115],q[107];
-rz(pi/512) q[107];
-rz(pi/256) q[115];
-cx q[115],q[108];
-rz(-pi/256) q[108];
-cx q[115],q[108];
-rz(pi/256) q[108];
-rz(pi/128) q[115];
-cx q[115],q[109];
-rz(-pi/128) q[109];
-cx q[115],q[109];
-rz(pi/128) q[109];
-rz(pi/64) q[115];
-cx q[115],q[110];
-rz(-pi/64) q[110];
-cx q[115],q[110];
-rz(pi/64) q[110];
-rz(pi/32) q[115];
-cx q[115],q[111];
-rz(-pi/32) q[111];
-cx q[115],q[111];
-rz(pi/32) q[111];
-rz(pi/16) q[115];
-cx q[115],q[112];
-rz(-pi/16) q[112];
-cx q[115],q[112];
-rz(pi/16) q[112];
-rz(pi/8) q[115];
-cx q[115],q[113];
-rz(-pi/8) q[113];
-cx q[115],q[113];
-rz(pi/8) q[113];
-rz(pi/4) q[115];
-cx q[115],q[114];
-rz(-pi/4) q[114];
-cx q[115],q[114];
-rz(pi/4) q[114];
-rz(pi/2) q[115];
-sx q[115];
-rz(pi/2) q[115];
-rz(pi/131072) q[99];
-rz(1.42863093678434e-12) q[116];
-cx q[116],q[76];
-rz(-1.42863093678434e-12) q[76];
-cx q[116],q[76];
-rz(2.85726187356867e-12) q[116];
-cx q[116],q[77];
-rz(1.42863093678434e-12) q[76];
-rz(-2.85726187356867e-12) q[77];
-cx q[116],q[77];
-rz(5.71452374713734e-12) q[116];
-cx q[116],q[78];
-rz(2.85726187356867e-12) q[77];
-rz(-5.71452374713734e-12) q[78];
-cx q[116],q[78];
-rz(1.14290474942747e-11) q[116];
-cx q[116],q[79];
-rz(5.71452374713734e-12) q[78];
-rz(-1.14290474942747e-11) q[79];
-cx q[116],q[79];
-rz(2.28580949885494e-11) q[116];
-cx q[116],q[80];
-rz(1.14290474942747e-11) q[79];
-rz(-2.28580949885494e-11) q[80];
-cx q[116],q[80];
-rz(4.57161899770987e-11) q[116];
-cx q[116],q[81];
-rz(2.28580949885494e-11) q[80];
-rz(-4.57161899770987e-11) q[81];
-cx q[116],q[81];
-rz(9.14323799541975e-11) q[116];
-cx q[116],q[82];
-rz(4.57161899770987e-11) q[81];
-rz(-9.14323799541975e-11) q[82];
-cx q[116],q[82];
-rz(1.82864759908395e-10) q[116];
-cx q[116],q[83];
-rz(9.14323799541975e-11) q[82];
-rz(-1.82864759908395e-10) q[83];
-cx q[116],q[83];
-rz(3.6572951981679e-10) q[116];
-cx q[116],q[84];
-rz(1.82864759908395e-10) q[83];
-rz(-3.6572951981679e-10) q[84];
-cx q[116],q[84];
-rz(7.3145903963358e-10) q[116];
-cx q[116],q[85];
-rz(3.6572951981679e-10) q[84];
-rz(-7.3145903963358e-10) q[85];
-cx q[116],q[85];
-rz(pi/2147483648) q[116];
-cx q[116],q[86];
-rz(7.3145903963358e-10) q[85];
-rz(-pi/2147483648) q[86];
-cx q[116],q[86];
-rz(pi/1073741824) q[116];
-cx q[116],q[87];
-rz(pi/2147483648) q[86];
-rz(-pi/1073741824) q[87];
-cx q[116],q[87];
-rz(pi/536870912) q[116];
-cx q[116],q[88];
-rz(pi/1073741824) q[87];
-rz(-pi/536870912) q[88];
-cx q[116],q[88];
-rz(pi/268435456) q[116];
-cx q[116],q[89];
-rz(pi/536870912) q[88];
-rz(-pi/268435456) q[89];
-cx q[116],q[89];
-rz(pi/134217728) q[116];
-cx q[116],q[90];
-rz(pi/268435456) q[89];
-rz(-pi/134217728) q[90];
-cx q[116],q[90];
-rz(pi/67108864) q[116];
-cx q[116],q[91];
-rz(pi/134217728) q[90];
-rz(-pi/67108864) q[91];
-cx q[116],q[91];
-rz(pi/33554432) q[116];
-cx q[116],q[92];
-rz(pi/67108864) q[91];
-rz(-pi/33554432) q[92];
-cx q[116],q[92];
-rz(pi/16777216) q[116];
-cx q[116],q[93];
-rz(pi/33554432) q[92];
-rz(-pi/16777216) q[93];
-cx q[116],q[93];
-rz(pi/8388608) q[116];
-cx q[116],q[94];
-rz(pi/16777216) q[93];
-rz(-pi/8388608) q[94];
-cx q[116],q[94];
-rz(pi/4194304) q[116];
-cx q[116],q[95];
-rz(pi/8388608) q[94];
-rz(-pi/4194304) q[95];
-cx q[116],q[95];
-rz(pi/2097152) q[116];
-cx q[116],q[96];
-rz(pi/4194304) q[95];
-rz(-pi/2097152) q[96];
-cx q[116],q[96];
-rz(pi/1048576) q[116];
-cx q[116],q[97];
-rz(pi/2097152) q[96];
-rz(-pi/1048576) q[97];
-cx q[116],q[97];
-rz(pi/524288) q[116];
-cx q[116],q[98];
-rz(pi/1048576) q[97];
-rz(-pi/524288) q[98];
-cx q[116],q[98];
-rz(pi/262144) q[116];
-cx q[116],q[99];
-rz(pi/524288) q[98];
-rz(-pi/262144) q[99];
-cx q[116],q[99];
-rz(pi/131072) q[116];
-cx q[116],q[100];
-rz(-pi/131072) q[100];
-cx q[116],q[100];
-rz(pi/131072) q[100];
-rz(pi/65536) q[116];
-cx q[116],q[101];
-rz(-pi/65536) q[101];
-cx q[116],q[101];
-rz(pi/65536) q[101];
-rz(pi/32768) q[116];
-cx q[116],q[102];
-rz(-pi/32768) q[102];
-cx q[116],q[102];
-rz(pi/32768) q[102];
-rz(pi/16384) q[116];
-cx q[116],q[103];
-rz(-pi/16384) q[103];
-cx q[116],q[103];
-rz(pi/16384) q[103];
-rz(pi/8192) q[116];
-cx q[116],q[104];
-rz(-pi/8192) q[104];
-cx q[116],q[104];
-rz(pi/8192) q[104];
-rz(pi/4096) q[116];
-cx q[116],q[105];
-rz(-pi/4096) q[105];
-cx q[116],q[105];
-rz(pi/4096) q[105];
-rz(pi/2048) q[116];
-cx q[116],q[106];
-rz(-pi/2048) q[106];
-cx q[116],q[106];
-rz(pi/2048) q[106];
-rz(pi/1024) q[116];
-cx q[116],q[107];
-rz(-pi/1024) q[107];
-cx q[116],q[107];
-rz(pi/1024) q[107];
-rz(pi/512) q[116];
-cx q[116],q[108];
-rz(-pi/512) q[108];
-cx q[116],q[108];
-rz(pi/512) q[108];
-rz(pi/256) q[116];
-cx q[116],q[109];
-rz(-pi/256) q[109];
-cx q[116],q[109];
-rz(pi/256) q[109];
-rz(pi/128) q[116];
-cx q[116],q[110];
-rz(-pi/128) q[110];
-cx q[116],q[110];
-rz(pi/128) q[110];
-rz(pi/64) q[116];
-cx q[116],q[111];
-rz(-pi/64) q[111];
-cx q[116],q[111];
-rz(pi/64) q[111];
-rz(pi/32) q[116];
-cx q[116],q[112];
-rz(-pi/32) q[112];
-cx q[116],q[112];
-rz(pi/32) q[112];
-rz(pi/16) q[116];
-cx q[116],q[113];
-rz(-pi/16) q[113];
-cx q[116],q[113];
-rz(pi/16) q[113];
-rz(pi/8) q[116];
-cx q[116],q[114];
-rz(-pi/8) q[114];
-cx q[116],q[114];
-rz(pi/8) q[114];
-rz(pi/4) q[116];
-cx q[116],q[115];
-rz(-pi/4) q[115];
-cx q[116],q[115];
-rz(pi/4) q[115];
-rz(pi/2) q[116];
-sx q[116];
-rz(pi/2) q[116];
-rz(pi/262144) q[99];
-rz(1.42863093678434e-12) q[117];
-cx q[117],q[77];
-rz(-1.42863093678434e-12) q[77];
-cx q[117],q[77];
-rz(2.85726187356867e-12) q[117];
-cx q[117],q[78];
-rz(1.42863093678434e-12) q[77];
-rz(-2.85726187356867e-12) q[78];
-cx q[117],q[78];
-rz(5.71452374713734e-12) q[117];
-cx q[117],q[79];
-rz(2.85726187356867e-12) q[78];
-rz(-5.71452374713734e-12) q[79];
-cx q[117],q[79];
-rz(1.14290474942747e-11) q[117];
-cx q[117],q[80];
-rz(5.71452374713734e-12) q[79];
-rz(-1.14290474942747e-11) q[80];
-cx q[117],q[80];
-rz(2.28580949885494e-11) q[117];
-cx q[117],q[81];
-rz(1.14290474942747e-11) q[80];
-rz(-2.28580949885494e-11) q[81];
-cx q[117],q[81];
-rz(4.57161899770987e-11) q[117];
-cx q[117],q[82];
-rz(2.28580949885494e-11) q[81];
-rz(-4.57161899770987e-11) q[82];
-cx q[117],q[82];
-rz(9.14323799541975e-11) q[117];
-cx q[117],q[83];
-rz(4.57161899770987e-11) q[82];
-rz(-9.14323799541975e-11) q[83];
-cx q[117],q[83];
-rz(1.82864759908395e-10) q[117];
-cx q[117],q[84];
-rz(9.14323799541975e-11) q[83];
-rz(-1.82864759908395e-10) q[84];
-cx q[117],q[84];
-rz(3.6572951981679e-10) q[117];
-cx q[117],q[85];
-rz(1.82864759908395e-10) q[84];
-rz(-3.6572951981679e-10) q[85];
-cx q[117],q[85];
-rz(7.3145903963358e-10) q[117];
-cx q[117],q[86];
-rz(3.6572951981679e-10) q[85];
-rz(-7.3145903963358e-10) q[86];
-cx q[117],q[86];
-rz(pi/2147483648) q[117];
-cx q[117],q[87];
-rz(7.3145903963358e-10) q[86];
-rz(-pi/2147483648) q[87];
-cx q[117],q[87];
-rz(pi/1073741824) q[117];
-cx q[117],q[88];
-rz(pi/2147483648) q[87];
-rz(-pi/1073741824) q[88];
-cx q[117],q[88];
-rz(pi/536870912) q[117];
-cx q[117],q[89];
-rz(pi/1073741824) q[88];
-rz(-pi/536870912) q[89];
-cx q[117],q[89];
-rz(pi/268435456) q[117];
-cx q[117],q[90];
-rz(pi/536870912) q[89];
-rz(-pi/268435456) q[90];
-cx q[117],q[90];
-rz(pi/134217728) q[117];
-cx q[117],q[91];
-rz(pi/268435456) q[90];
-rz(-pi/134217728) q[91];
-cx q[117],q[91];
-rz(pi/67108864) q[117];
-cx q[117],q[92];
-rz(pi/134217728) q[91];
-rz(-pi/67108864) q[92];
-cx q[117],q[92];
-rz(pi/33554432) q[117];
-cx q[117],q[93];
-rz(pi/67108864) q[92];
-rz(-pi/33554432) q[93];
-cx q[117],q[93];
-rz(pi/16777216) q[117];
-cx q[117],q[94];
-rz(pi/33554432) q[93];
-rz(-pi/16777216) q[94];
-cx q[117],q[94];
-rz(pi/8388608) q[117];
-cx q[117],q[95];
-rz(pi/16777216) q[94];
-rz(-pi/8388608) q[95];
-cx q[117],q[95];
-rz(pi/4194304) q[117];
-cx q[117],q[96];
-rz(pi/8388608) q[95];
-rz(-pi/4194304) q[96];
-cx q[117],q[96];
-rz(pi/2097152) q[117];
-cx q[117],q[97];
-rz(pi/4194304) q[96];
-rz(-pi/2097152) q[97];
-cx q[117],q[97];
-rz(pi/1048576) q[117];
-cx q[117],q[98];
-rz(pi/2097152) q[97];
-rz(-pi/1048576) q[98];
-cx q[117],q[98];
-rz(pi/524288) q[117];
-cx q[117],q[99];
-rz(pi/1048576) q[98];
-rz(-pi/524288) q[99];
-cx q[117],q[99];
-rz(pi/262144) q[117];
-cx q[117],q[100];
-rz(-pi/262144) q[100];
-cx q[117],q[100];
-rz(pi/262144) q[100];
-rz(pi/131072) q[117];
-cx q[117],q[101];
-rz(-pi/131072) q[101];
-cx q[117],q[101];
-rz(pi/131072) q[101];
-rz(pi/65536) q[117];
-cx q[117],q[102];
-rz(-pi/65536) q[102];
-cx q[117],q[102];
-rz(pi/65536) q[102];
-rz(pi/32768) q[117];
-cx q[117],q[103];
-rz(-pi/32768) q[103];
-cx q[117],q[103];
-rz(pi/32768) q[103];
-rz(pi/16384) q[117];
-cx q[117],q[104];
-rz(-pi/16384) q[104];
-cx q[117],q[104];
-rz(pi/16384) q[104];
-rz(pi/8192) q[117];
-cx q[117],q[105];
-rz(-pi/8192) q[105];
-cx q[117],q[105];
-rz(pi/8192) q[105];
-rz(pi/4096) q[117];
-cx q[117],q[106];
-rz(-pi/4096) q[106];
-cx q[117],q[106];
-rz(pi/4096) q[106];
-rz(pi/2048) q[117];
-cx q[117],q[107];
-rz(-pi/2048) q[107];
-cx q[117],q[107];
-rz(pi/2048) q[107];
-rz(pi/1024) q[117];
-cx q[117],q[108];
-rz(-pi/1024) q[108];
-cx q[117],q[108];
-rz(pi/1024) q[108];
-rz(pi/512) q[117];
-cx q[117],q[109];
-rz(-pi/512) q[109];
-cx q[117],q[109];
-rz(pi/512) q[109];
-rz(pi/256) q[117];
-cx q[117],q[110];
-rz(-pi/256) q[110];
-cx q[117],q[110];
-rz(pi/256) q[110];
-rz(pi/128) q[117];
-cx q[117],q[111];
-rz(-pi/128) q[111];
-cx q[117],q[111];
-rz(pi/128) q[111];
-rz(pi/64) q[117];
-cx q[117],q[112];
-rz(-pi/64) q[112];
-cx q[117],q[112];
-rz(pi/64) q[112];
-rz(pi/32) q[117];
-cx q[117],q[113];
-rz(-pi/32) q[113];
-cx q[117],q[113];
-rz(pi/32) q[113];
-rz(pi/16) q[117];
-cx q[117],q[114];
-rz(-pi/16) q[114];
-cx q[117],q[114];
-rz(pi/16) q[114];
-rz(pi/8) q[117];
-cx q[117],q[115];
-rz(-pi/8) q[115];
-cx q[117],q[115];
-rz(pi/8) q[115];
-rz(pi/4) q[117];
-cx q[117],q[116];
-rz(-pi/4) q[116];
-cx q[117],q[116];
-rz(pi/4) q[116];
-rz(pi/2) q[117];
-sx q[117];
-rz(pi/2) q[117];
-rz(pi/524288) q[99];
-rz(1.42863093678434e-12) q[118];
-cx q[118],q[78];
-rz(-1.42863093678434e-12) q[78];
-cx q[118],q[78];
-rz(2.85726187356867e-12) q[118];
-cx q[118],q[79];
-rz(1.42863093678434e-12) q[78];
-rz(-2.85726187356867e-12) q[79];
-cx q[118],q[79];
-rz(5.71452374713734e-12) q[118];
-cx q[118],q[80];
-rz(2.85726187356867e-12) q[79];
-rz(-5.71452374713734e-12) q[80];
-cx q[118],q[80];
-rz(1.14290474942747e-11) q[118];
-cx q[118],q[81];
-rz(5.71452374713734e-12) q[80];
-rz(-1.14290474942747e-11) q[81];
-cx q[118],q[81];
-rz(2.28580949885494e-11) q[118];
-cx q[118],q[82];
-rz(1.14290474942747e-11) q[81];
-rz(-2.28580949885494e-11) q[82];
-cx q[118],q[82];
-rz(4.57161899770987e-11) q[118];
-cx q[118],q[83];
-rz(2.28580949885494e-11) q[82];
-rz(-4.57161899770987e-11) q[83];
-cx q[118],q[83];
-rz(9.14323799541975e-11) q[118];
-cx q[118],q[84];
-rz(4.57161899770987e-11) q[83];
-rz(-9.14323799541975e-11) q[84];
-cx q[118],q[84];
-rz(1.82864759908395e-10) q[118];
-cx q[118],q[85];
-rz(9.14323799541975e-11) q[84];
-rz(-1.82864759908395e-10) q[85];
-cx q[118],q[85];
-rz(3.6572951981679e-10) q[118];
-cx q[118],q[86];
-rz(1.82864759908395e-10) q[85];
-rz(-3.6572951981679e-10) q[86];
-cx q[118],q[86];
-rz(7.3145903963358e-10) q[118];
-cx q[118],q[87];
-rz(3.6572951981679e-10) q[86];
-rz(-7.3145903963358e-10) q[87];
-cx q[118],q[87];
-rz(pi/2147483648) q[118];
-cx q[118],q[88];
-rz(7.3145903963358e-10) q[87];
-rz(-pi/2147483648) q[88];
-cx q[118],q[88];
-rz(pi/1073741824) q[118];
-cx q[118],q[89];
-rz(pi/2147483648) q[88];
-rz(-pi/1073741824) q[89];
-cx q[118],q[89];
-rz(pi/536870912) q[118];
-cx q[118],q[90];
-rz(pi/1073741824) q[89];
-rz(-pi/536870912) q[90];
-cx q[118],q[90];
-rz(pi/268435456) q[118];
-cx q[118],q[91];
-rz(pi/536870912) q[90];
-rz(-pi/268435456) q[91];
-cx q[118],q[91];
-rz(pi/134217728) q[118];
-cx q[118],q[92];
-rz(pi/268435456) q[91];
-rz(-pi/134217728) q[92];
-cx q[118],q[92];
-rz(pi/67108864) q[118];
-cx q[118],q[93];
-rz(pi/134217728) q[92];
-rz(-pi/67108864) q[93];
-cx q[118],q[93];
-rz(pi/33554432) q[118];
-cx q[118],q[94];
-rz(pi/67108864) q[93];
-rz(-pi/33554432) q[94];
-cx q[118],q[94];
-rz(pi/16777216) q[118];
-cx q[118],q[95];
-rz(pi/33554432) q[94];
-rz(-pi/16777216) q[95];
-cx q[118],q[95];
-rz(pi/8388608) q[118];
-cx q[118],q[96];
-rz(pi/16777216) q[95];
-rz(-pi/8388608) q[96];
-cx q[118],q[96];
-rz(pi/4194304) q[118];
-cx q[118],q[97];
-rz(pi/8388608) q[96];
-rz(-pi/4194304) q[97];
-cx q[118],q[97];
-rz(pi/2097152) q[118];
-cx q[118],q[98];
-rz(pi/4194304) q[97];
-rz(-pi/2097152) q[98];
-cx q[118],q[98];
-rz(pi/1048576) q[118];
-cx q[118],q[99];
-rz(pi/2097152) q[98];
-rz(-pi/1048576) q[99];
-cx q[118],q[99];
-rz(pi/524288) q[118];
-cx q[118],q[100];
-rz(-pi/524288) q[100];
-cx q[118],q[100];
-rz(pi/524288) q[100];
-rz(pi/262144) q[118];
-cx q[118],q[101];
-rz(-pi/262144) q[101];
-cx q[118],q[101];
-rz(pi/262144) q[101];
-rz(pi/131072) q[118];
-cx q[118],q[102];
-rz(-pi/131072) q[102];
-cx q[118],q[102];
-rz(pi/131072) q[102];
-rz(pi/65536) q[118];
-cx q[118],q[103];
-rz(-pi/65536) q[103];
-cx q[118],q[103];
-rz(pi/65536) q[103];
-rz(pi/32768) q[118];
-cx q[118],q[104];
-rz(-pi/32768) q[104];
-cx q[118],q[104];
-rz(pi/32768) q[104];
-rz(pi/16384) q[118];
-cx q[118],q[105];
-rz(-pi/16384) q[105];
-cx q[118],q[105];
-rz(pi/16384) q[105];
-rz(pi/8192) q[118];
-cx q[118],q[106];
-rz(-pi/8192) q[106];
-cx q[118],q[106];
-rz(pi/8192) q[106];
-rz(pi/4096) q[118];
-cx q[118],q[107];
-rz(-pi/4096) q[107];
-cx q[118],q[107];
-rz(pi/4096) q[107];
-rz(pi/2048) q[118];
-cx q[118],q[108];
-rz(-pi/2048) q[108];
-cx q[118],q[108];
-rz(pi/2048) q[108];
-rz(pi/1024) q[118];
-cx q[118],q[109];
-rz(-pi/1024) q[109];
-cx q[118],q[109];
-rz(pi/1024) q[109];
-rz(pi/512) q[118];
-cx q[118],q[110];
-rz(-pi/512) q[110];
-cx q[118],q[110];
-rz(pi/512) q[110];
-rz(pi/256) q[118];
-cx q[118],q[111];
-rz(-pi/256) q[111];
-cx q[118],q[111];
-rz(pi/256) q[111];
-rz(pi/128) q[118];
-cx q[118],q[112];
-rz(-pi/128) q[112];
-cx q[118],q[112];
-rz(pi/128) q[112];
-rz(pi/64) q[118];
-cx q[118],q[113];
-rz(-pi/64) q[113];
-cx q[118],q[113];
-rz(pi/64) q[113];
-rz(pi/32) q[118];
-cx q[118],q[114];
-rz(-pi/32) q[114];
-cx q[118],q[114];
-rz(pi/32) q[114];
-rz(pi/16) q[118];
-cx q[118],q[115];
-rz(-pi/16) q[115];
-cx q[118],q[115];
-rz(pi/16) q[115];
-rz(pi/8) q[118];
-cx q[118],q[116];
-rz(-pi/8) q[116];
-cx q[118],q[116];
-rz(pi/8) q[116];
-rz(pi/4) q[118];
-cx q[118],q[117];
-rz(-pi/4) q[117];
-cx q[118],q[117];
-rz(pi/4) q[117];
-rz(pi/2) q[118];
-sx q[118];
-rz(pi/2) q[118];
-rz(pi/1048576) q[99];
-rz(1.42863093678434e-12) q[119];
-cx q[119],q[79];
-rz(-1.42863093678434e-12) q[79];
-cx q[119],q[79];
-rz(2.85726187356867e-12) q[119];
-cx q[119],q[80];
-rz(1.42863093678434e-12) q[79];
-rz(-2.85726187356867e-12) q[80];
-cx q[119],q[80];
-rz(5.71452374713734e-12) q[119];
-cx q[119],q[81];
-rz(2.85726187356867e-12) q[80];
-rz(-5.71452374713734e-12) q[81];
-cx q[119],q[81];
-rz(1.14290474942747e-11) q[119];
-cx q[119],q[82];
-rz(5.71452374713734e-12) q[81];
-rz(-1.14290474942747e-11) q[82];
-cx q[119],q[82];
-rz(2.28580949885494e-11) q[119];
-cx q[119],q[83];
-rz(1.14290474942747e-11) q[82];
-rz(-2.28580949885494e-11) q[83];
-cx q[119],q[83];
-rz(4.57161899770987e-11) q[119];
-cx q[119],q[84];
-rz(2.28580949885494e-11) q[83];
-rz(-4.57161899770987e-11) q[84];
-cx q[119],q[84];
-rz(9.14323799541975e-11) q[119];
-cx q[119],q[85];
-rz(4.57161899770987e-11) q[84];
-rz(-9.14323799541975e-11) q[85];
-cx q[119],q[85];
-rz(1.82864759908395e-10) q[119];
-cx q[119],q[86];
-rz(9.14323799541975e-11) q[85];
-rz(-1.82864759908395e-10) q[86];
-cx q[119],q[86];
-rz(3.6572951981679e-10) q[119];
-cx q[119],q[87];
-rz(1.82864759908395e-10) q[86];
-rz(-3.6572951981679e-10) q[87];
-cx q[119],q[87];
-rz(7.3145903963358e-10) q[119];
-cx q[119],q[88];
-rz(3.6572951981679e-10) q[87];
-rz(-7.3145903963358e-10) q[88];
-cx q[119],q[88];
-rz(pi/2147483648) q[119];
-cx q[119],q[89];
-rz(7.3145903963358e-10) q[88];
-rz(-pi/2147483648) q[89];
-cx q[119],q[89];
-rz(pi/1073741824) q[119];
-cx q[119],q[90];
-rz(pi/2147483648) q[89];
-rz(-pi/1073741824) q[90];
-cx q[119],q[90];
-rz(pi/536870912) q[119];
-cx q[119],q[91];
-rz(pi/1073741824) q[90];
-rz(-pi/536870912) q[91];
-cx q[119],q[91];
-rz(pi/268435456) q[119];
-cx q[119],q[92];
-rz(pi/536870912) q[91];
-rz(-pi/268435456) q[92];
-cx q[119],q[92];
-rz(pi/134217728) q[119];
-cx q[119],q[93];
-rz(pi/268435456) q[92];
-rz(-pi/134217728) q[93];
-cx q[119],q[93];
-rz(pi/67108864) q[119];
-cx q[119],q[94];
-rz(pi/134217728) q[93];
-rz(-pi/67108864) q[94];
-cx q[119],q[94];
-rz(pi/33554432) q[119];
-cx q[119],q[95];
-rz(pi/67108864) q[94];
-rz(-pi/33554432) q[95];
-cx q[119],q[95];
-rz(pi/16777216) q[119];
-cx q[119],q[96];
-rz(pi/33554432) q[95];
-rz(-pi/16777216) q[96];
-cx q[119],q[96];
-rz(pi/8388608) q[119];
-cx q[119],q[97];
-rz(pi/16777216) q[96];
-rz(-pi/8388608) q[97];
-cx q[119],q[97];
-rz(pi/4194304) q[119];
-cx q[119],q[98];
-rz(pi/8388608) q[97];
-rz(-pi/4194304) q[98];
-cx q[119],q[98];
-rz(pi/2097152) q[119];
-cx q[119],q[99];
-rz(pi/4194304) q[98];
-rz(-pi/2097152) q[99];
-cx q[119],q[99];
-rz(pi/1048576) q[119];
-cx q[119],q[100];
-rz(-pi/1048576) q[100];
-cx q[119],q[100];
-rz(pi/1048576) q[100];
-rz(pi/524288) q[119];
-cx q[119],q[101];
-rz(-pi/524288) q[101];
-cx q[119],q[101];
-rz(pi/524288) q[101];
-rz(pi/262144) q[119];
-cx q[119],q[102];
-rz(-pi/262144) q[102];
-cx q[119],q[102];
-rz(pi/262144) q[102];
-rz(pi/131072) q[119];
-cx q[119],q[103];
-rz(-pi/131072) q[103];
-cx q[119],q[103];
-rz(pi/131072) q[103];
-rz(pi/65536) q[119];
-cx q[119],q[104];
-rz(-pi/65536) q[104];
-cx q[119],q[104];
-rz(pi/65536) q[104];
-rz(pi/32768) q[119];
-cx q[119],q[105];
-rz(-pi/32768) q[105];
-cx q[119],q[105];
-rz(pi/32768) q[105];
-rz(pi/16384) q[119];
-cx q[119],q[106];
-rz(-pi/16384) q[106];
-cx q[119],q[106];
-rz(pi/16384) q[106];
-rz(pi/8192) q[119];
-cx q[119],q[107];
-rz(-pi/8192) q[107];
-cx q[119],q[107];
-rz(pi/8192) q[107];
-rz(pi/4096) q[119];
-cx q[119],q[108];
-rz(-pi/4096) q[108];
-cx q[119],q[108];
-rz(pi/4096) q[108];
-rz(pi/2048) q[119];
-cx q[119],q[109];
-rz(-pi/2048) q[109];
-cx q[119],q[109];
-rz(pi/2048) q[109];
-rz(pi/1024) q[119];
-cx q[119],q[110];
-rz(-pi/1024) q[110];
-cx q[119],q[110];
-rz(pi/1024) q[110];
-rz(pi/512) q[119];
-cx q[119],q[111];
-rz(-pi/512) q[111];
-cx q[119],q[111];
-rz(pi/512) q[111];
-rz(pi/256) q[119];
-cx q[119],q[112];
-rz(-pi/256) q[112];
-cx q[119],q[112];
-rz(pi/256) q[112];
-rz(pi/128) q[119];
-cx q[119],q[113];
-rz(-pi/128) q[113];
-cx q[119],q[113];
-rz(pi/128) q[113];
-rz(pi/64) q[119];
-cx q[119],q[114];
-rz(-pi/64) q[114];
-cx q[119],q[114];
-rz(pi/64) q[114];
-rz(pi/32) q[119];
-cx q[119],q[115];
-rz(-pi/32) q[115];
-cx q[119],q[115];
-rz(pi/32) q[115];
-rz(pi/16) q[119];
-cx q[119],q[116];
-rz(-pi/16) q[116];
-cx q[119],q[116];
-rz(pi/16) q[116];
-rz(pi/8) q[119];
-cx q[119],q[117];
-rz(-pi/8) q[117];
-cx q[119],q[117];
-rz(pi/8) q[117];
-rz(pi/4) q[119];
-cx q[119],q[118];
-rz(-pi/4) q[118];
-cx q[119],q[118];
-rz(pi/4) q[118];
-rz(pi/2) q[119];
-sx q[119];
-rz(pi/2) q[119];
-rz(pi/2097152) q[99];
-rz(1.42863093678434e-12) q[120];
-cx q[120],q[80];
-rz(-1.42863093678434e-12) q[80];
-cx q[120],q[80];
-rz(2.85726187356867e-12) q[120];
-cx q[120],q[81];
-rz(1.42863093678434e-12) q[80];
-rz(-2.85726187356867e-12) q[81];
-cx q[120],q[81];
-rz(5.71452374713734e-12) q[120];
-cx q[120],q[82];
-rz(2.85726187356867e-12) q[81];
-rz(-5.71452374713734e-12) q[82];
-cx q[120],q[82];
-rz(1.14290474942747e-11) q[120];
-cx q[120],q[83];
-rz(5.71452374713734e-12) q[82];
-rz(-1.14290474942747e-11) q[83];
-cx q[120],q[83];
-rz(2.28580949885494e-11) q[120];
-cx q[120],q[84];
-rz(1.14290474942747e-11) q[83];
-rz(-2.28580949885494e-11) q[84];
-cx q[120],q[84];
-rz(4.57161899770987e-11) q[120];
-cx q[120],q[85];
-rz(2.28580949885494e-11) q[84];
-rz(-4.57161899770987e-11) q[85];
-cx q[120],q[85];
-rz(9.14323799541975e-11) q[120];
-cx q[120],q[86];
-rz(4.57161899770987e-11) q[85];
-rz(-9.14323799541975e-11) q[86];
-cx q[120],q[86];
-rz(1.82864759908395e-10) q[120];
-cx q[120],q[87];
-rz(9.14323799541975e-11) q[86];
-rz(-1.82864759908395e-10) q[87];
-cx q[120],q[87];
-rz(3.6572951981679e-10) q[120];
-cx q[120],q[88];
-rz(1.82864759908395e-10) q[87];
-rz(-3.6572951981679e-10) q[88];
-cx q[120],q[88];
-rz(7.3145903963358e-10) q[120];
-cx q[120],q[89];
-rz(3.6572951981679e-10) q[88];
-rz(-7.3145903963358e-10) q[89];
-cx q[120],q[89];
-rz(pi/2147483648) q[120];
-cx q[120],q[90];
-rz(7.3145903963358e-10) q[89];
-rz(-pi/2147483648) q[90];
-cx q[120],q[90];
-rz(pi/1073741824) q[120];
-cx q[120],q[91];
-rz(pi/2147483648) q[90];
-rz(-pi/1073741824) q[91];
-cx q[120],q[91];
-rz(pi/536870912) q[120];
-cx q[120],q[92];
-rz(pi/1073741824) q[91];
-rz(-pi/536870912) q[92];
-cx q[120],q[92];
-rz(pi/268435456) q[120];
-cx q[120],q[93];
-rz(pi/536870912) q[92];
-rz(-pi/268435456) q[93];
-cx q[120],q[93];
-rz(pi/134217728) q[120];
-cx q[120],q[94];
-rz(pi/268435456) q[93];
-rz(-pi/134217728) q[94];
-cx q[120],q[94];
-rz(pi/67108864) q[120];
-cx q[120],q[95];
-rz(pi/134217728) q[94];
-rz(-pi/67108864) q[95];
-cx q[120],q[95];
-rz(pi/33554432) q[120];
-cx q[120],q[96];
-rz(pi/67108864) q[95];
-rz(-pi/33554432) q[96];
-cx q[120],q[96];
-rz(pi/16777216) q[120];
-cx q[120],q[97];
-rz(pi/33554432) q[96];
-rz(-pi/16777216) q[97];
-cx q[120],q[97];
-rz(pi/8388608) q[120];
-cx q[120],q[98];
-rz(pi/16777216) q[97];
-rz(-pi/8388608) q[98];
-cx q[120],q[98];
-rz(pi/4194304) q[120];
-cx q[120],q[99];
-rz(pi/8388608) q[98];
-rz(-pi/4194304) q[99];
-cx q[120],q[99];
-rz(pi/2097152) q[120];
-cx q[120],q[100];
-rz(-pi/2097152) q[100];
-cx q[120],q[100];
-rz(pi/2097152) q[100];
-rz(pi/1048576) q[120];
-cx q[120],q[101];
-rz(-pi/1048576) q[101];
-cx q[120],q[101];
-rz(pi/1048576) q[101];
-rz(pi/524288) q[120];
-cx q[120],q[102];
-rz(-pi/524288) q[102];
-cx q[120],q[102];
-rz(pi/524288) q[102];
-rz(pi/262144) q[120];
-cx q[120],q[103];
-rz(-pi/262144) q[103];
-cx q[120],q[103];
-rz(pi/262144) q[103];
-rz(pi/131072) q[120];
-cx q[120],q[104];
-rz(-pi/131072) q[104];
-cx q[120],q[104];
-rz(pi/131072) q[104];
-rz(pi/65536) q[120];
-cx q[120],q[105];
-rz(-pi/65536) q[105];
-cx q[120],q[105];
-rz(pi/65536) q[105];
-rz(pi/32768) q[120];
-cx q[120],q[106];
-rz(-pi/32768) q[106];
-cx q[120],q[106];
-rz(pi/32768) q[106];
-rz(pi/16384) q[120];
-cx q[120],q[107];
-rz(-pi/16384) q[107];
-cx q[120],q[107];
-rz(pi/16384) q[107];
-rz(pi/8192) q[120];
-cx q[120],q[108];
-rz(-pi/8192) q[108];
-cx q[120],q[108];
-rz(pi/8192) q[108];
-rz(pi/4096) q[120];
-cx q[120],q[109];
-rz(-pi/4096) q[109];
-cx q[120],q[109];
-rz(pi/4096) q[109];
-rz(pi/2048) q[120];
-cx q[120],q[110];
-rz(-pi/2048) q[110];
-cx q[120],q[110];
-rz(pi/2048) q[110];
-rz(pi/1024) q[120];
-cx q[120],q[111];
-rz(-pi/1024) q[111];
-cx q[120],q[111];
-rz(pi/1024) q[111];
-rz(pi/512) q[120];
-cx q[120],q[112];
-rz(-pi/512) q[112];
-cx q[120],q[112];
-rz(pi/512) q[112];
-rz(pi/256) q[120];
-cx q[120],q[113];
-rz(-pi/256) q[113];
-cx q[120],q[113];
-rz(pi/256) q[113];
-rz(pi/128) q[120];
-cx q[120],q[114];
-rz(-pi/128) q[114];
-cx q[120],q[114];
-rz(pi/128) q[114];
-rz(pi/64) q[120];
-cx q[120],q[115];
-rz(-pi/64) q[115];
-cx q[120],q[115];
-rz(pi/64) q[115];
-rz(pi/32) q[120];
-cx q[120],q[116];
-rz(-pi/32) q[116];
-cx q[120],q[116];
-rz(pi/32) q[116];
-rz(pi/16) q[120];
-cx q[120],q[117];
-rz(-pi/16) q[117];
-cx q[120],q[117];
-rz(pi/16) q[117];
-rz(pi/8) q[120];
-cx q[120],q[118];
-rz(-pi/8) q[118];
-cx q[120],q[118];
-rz(pi/8) q[118];
-rz(pi/4) q[120];
-cx q[120],q[119];
-rz(-pi/4) q[119];
-cx q[120],q[119];
-rz(pi/4) q[119];
-rz(pi/2) q[120];
-sx q[120];
-rz(pi/2) q[120];
-rz(pi/4194304) q[99];
-rz(1.42863093678434e-12) q[121];
-cx q[121],q[81];
-rz(-1.42863093678434e-12) q[81];
-cx q[121],q[81];
-rz(2.85726187356867e-12) q[121];
-cx q[121],q[82];
-rz(1.42863093678434e-12) q[81];
-rz(-2.85726187356867e-12) q[82];
-cx q[121],q[82];
-rz(5.71452374713734e-12) q[121];
-cx q[121],q[83];
-rz(2.85726187356867e-12) q[82];
-rz(-5.71452374713734e-12) q[83];
-cx q[121],q[83];
-rz(1.14290474942747e-11) q[121];
-cx q[121],q[84];
-rz(5.71452374713734e-12) q[83];
-rz(-1.14290474942747e-11) q[84];
-cx q[121],q[84];
-rz(2.28580949885494e-11) q[121];
-cx q[121],q[85];
-rz(1.14290474942747e-11) q[84];
-rz(-2.28580949885494e-11) q[85];
-cx q[121],q[85];
-rz(4.57161899770987e-11) q[121];
-cx q[121],q[86];
-rz(2.28580949885494e-11) q[85];
-rz(-4.57161899770987e-11) q[86];
-cx q[121],q[86];
-rz(9.14323799541975e-11) q[121];
-cx q[121],q[87];
-rz(4.57161899770987e-11) q[86];
-rz(-9.14323799541975e-11) q[87];
-cx q[121],q[87];
-rz(1.82864759908395e-10) q[121];
-cx q[121],q[88];
-rz(9.14323799541975e-11) q[87];
-rz(-1.82864759908395e-10) q[88];
-cx q[121],q[88];
-rz(3.6572951981679e-10) q[121];
-cx q[121],q[89];
-rz(1.82864759908395e-10) q[88];
-rz(-3.6572951981679e-10) q[89];
-cx q[121],q[89];
-rz(7.3145903963358e-10) q[121];
-cx q[121],q[90];
-rz(3.6572951981679e-10) q[89];
-rz(-7.3145903963358e-10) q[90];
-cx q[121],q[90];
-rz(pi/2147483648) q[121];
-cx q[121],q[91];
-rz(7.3145903963358e-10) q[90];
-rz(-pi/2147483648) q[91];
-cx q[121],q[91];
-rz(pi/1073741824) q[121];
-cx q[121],q[92];
-rz(pi/2147483648) q[91];
-rz(-pi/1073741824) q[92];
-cx q[121],q[92];
-rz(pi/536870912) q[121];
-cx q[121],q[93];
-rz(pi/1073741824) q[92];
-rz(-pi/536870912) q[93];
-cx q[121],q[93];
-rz(pi/268435456) q[121];
-cx q[121],q[94];
-rz(pi/536870912) q[93];
-rz(-pi/268435456) q[94];
-cx q[121],q[94];
-rz(pi/134217728) q[121];
-cx q[121],q[95];
-rz(pi/268435456) q[94];
-rz(-pi/134217728) q[95];
-cx q[121],q[95];
-rz(pi/67108864) q[121];
-cx q[121],q[96];
-rz(pi/134217728) q[95];
-rz(-pi/67108864) q[96];
-cx q[121],q[96];
-rz(pi/33554432) q[121];
-cx q[121],q[97];
-rz(pi/67108864) q[96];
-rz(-pi/33554432) q[97];
-cx q[121],q[97];
-rz(pi/16777216) q[121];
-cx q[121],q[98];
-rz(pi/33554432) q[97];
-rz(-pi/16777216) q[98];
-cx q[121],q[98];
-rz(pi/8388608) q[121];
-cx q[121],q[99];
-rz(pi/16777216) q[98];
-rz(-pi/8388608) q[99];
-cx q[121],q[99];
-rz(pi/4194304) q[121];
-cx q[121],q[100];
-rz(-pi/4194304) q[100];
-cx q[121],q[100];
-rz(pi/4194304) q[100];
-rz(pi/2097152) q[121];
-cx q[121],q[101];
-rz(-pi/2097152) q[101];
-cx q[121],q[101];
-rz(pi/2097152) q[101];
-rz(pi/1048576) q[121];
-cx q[121],q[102];
-rz(-pi/1048576) q[102];
-cx q[121],q[102];
-rz(pi/1048576) q[102];
-rz(pi/524288) q[121];
-cx q[121],q[103];
-rz(-pi/524288) q[103];
-cx q[121],q[103];
-rz(pi/524288) q[103];
-rz(pi/262144) q[121];
-cx q[121],q[104];
-rz(-pi/262144) q[104];
-cx q[121],q[104];
-rz(pi/262144) q[104];
-rz(pi/131072) q[121];
-cx q[121],q[105];
-rz(-pi/131072) q[105];
-cx q[121],q[105];
-rz(pi/131072) q[105];
-rz(pi/65536) q[121];
-cx q[121],q[106];
-rz(-pi/65536) q[106];
-cx q[121],q[106];
-rz(pi/65536) q[106];
-rz(pi/32768) q[121];
-cx q[121],q[107];
-rz(-pi/32768) q[107];
-cx q[121],q[107];
-rz(pi/32768) q[107];
-rz(pi/16384) q[121];
-cx q[121],q[108];
-rz(-pi/16384) q[108];
-cx q[121],q[108];
-rz(pi/16384) q[108];
-rz(pi/8192) q[121];
-cx q[121],q[109];
-rz(-pi/8192) q[109];
-cx q[121],q[109];
-rz(pi/8192) q[109];
-rz(pi/4096) q[121];
-cx q[121],q[110];
-rz(-pi/4096) q[110];
-cx q[121],q[110];
-rz(pi/4096) q[110];
-rz(pi/2048) q[121];
-cx q[121],q[111];
-rz(-pi/2048) q[111];
-cx q[121],q[111];
-rz(pi/2048) q[111];
-rz(pi/1024) q[121];
-cx q[121],q[112];
-rz(-pi/1024) q[112];
-cx q[121],q[112];
-rz(pi/1024) q[112];
-rz(pi/512) q[121];
-cx q[121],q[113];
-rz(-pi/512) q[113];
-cx q[121],q[113];
-rz(pi/512) q[113];
-rz(pi/256) q[121];
-cx q[121],q[114];
-rz(-pi/256) q[114];
-cx q[121],q[114];
-rz(pi/256) q[114];
-rz(pi/128) q[121];
-cx q[121],q[115];
-rz(-pi/128) q[115];
-cx q[121],q[115];
-rz(pi/128) q[115];
-rz(pi/64) q[121];
-cx q[121],q[116];
-rz(-pi/64) q[116];
-cx q[121],q[116];
-rz(pi/64) q[116];
-rz(pi/32) q[121];
-cx q[121],q[117];
-rz(-pi/32) q[117];
-cx q[121],q[117];
-rz(pi/32) q[117];
-rz(pi/16) q[121];
-cx q[121],q[118];
-rz(-pi/16) q[118];
-cx q[121],q[118];
-rz(pi/16) q[118];
-rz(pi/8) q[121];
-cx q[121],q[119];
-rz(-pi/8) q[119];
-cx q[121],q[119];
-rz(pi/8) q[119];
-rz(pi/4) q[121];
-cx q[121],q[120];
-rz(-pi/4) q[120];
-cx q[121],q[120];
-rz(pi/4) q[120];
-rz(pi/2) q[121];
-sx q[121];
-rz(pi/2) q[121];
-rz(pi/8388608) q[99];
-rz(1.42863093678434e-12) q[122];
-cx q[122],q[82];
-rz(-1.42863093678434e-12) q[82];
-cx q[122],q[82];
-rz(2.85726187356867e-12) q[122];
-cx q[122],q[83];
-rz(1.42863093678434e-12) q[82];
-rz(-2.85726187356867e-12) q[83];
-cx q[122],q[83];
-rz(5.71452374713734e-12) q[122];
-cx q[122],q[84];
-rz(2.85726187356867e-12) q[83];
-rz(-5.71452374713734e-12) q[84];
-cx q[122],q[84];
-rz(1.14290474942747e-11) q[122];
-cx q[122],q[85];
-rz(5.71452374713734e-12) q[84];
-rz(-1.14290474942747e-11) q[85];
-cx q[122],q[85];
-rz(2.28580949885494e-11) q[122];
-cx q[122],q[86];
-rz(1.14290474942747e-11) q[85];
-rz(-2.28580949885494e-11) q[86];
-cx q[122],q[86];
-rz(4.57161899770987e-11) q[122];
-cx q[122],q[87];
-rz(2.28580949885494e-11) q[86];
-rz(-4.57161899770987e-11) q[87];
-cx q[122],q[87];
-rz(9.14323799541975e-11) q[122];
-cx q[122],q[88];
-rz(4.57161899770987e-11) q[87];
-rz(-9.14323799541975e-11) q[88];
-cx q[122],q[88];
-rz(1.82864759908395e-10) q[122];
-cx q[122],q[89];
-rz(9.14323799541975e-11) q[88];
-rz(-1.82864759908395e-10) q[89];
-cx q[122],q[89];
-rz(3.6572951981679e-10) q[122];
-cx q[122],q[90];
-rz(1.82864759908395e-10) q[89];
-rz(-3.6572951981679e-10) q[90];
-cx q[122],q[90];
-rz(7.3145903963358e-10) q[122];
-cx q[122],q[91];
-rz(3.6572951981679e-10) q[90];
-rz(-7.3145903963358e-10) q[91];
-cx q[122],q[91];
-rz(pi/2147483648) q[122];
-cx q[122],q[92];
-rz(7.3145903963358e-10) q[91];
-rz(-pi/2147483648) q[92];
-cx q[122],q[92];
-rz(pi/1073741824) q[122];
-cx q[122],q[93];
-rz(pi/2147483648) q[92];
-rz(-pi/1073741824) q[93];
-cx q[122],q[93];
-rz(pi/536870912) q[122];
-cx q[122],q[94];
-rz(pi/1073741824) q[93];
-rz(-pi/536870912) q[94];
-cx q[122],q[94];
-rz(pi/268435456) q[122];
-cx q[122],q[95];
-rz(pi/536870912) q[94];
-rz(-pi/268435456) q[95];
-cx q[122],q[95];
-rz(pi/134217728) q[122];
-cx q[122],q[96];
-rz(pi/268435456) q[95];
-rz(-pi/134217728) q[96];
-cx q[122],q[96];
-rz(pi/67108864) q[122];
-cx q[122],q[97];
-rz(pi/134217728) q[96];
-rz(-pi/67108864) q[97];
-cx q[122],q[97];
-rz(pi/33554432) q[122];
-cx q[122],q[98];
-rz(pi/67108864) q[97];
-rz(-pi/33554432) q[98];
-cx q[122],q[98];
-rz(pi/16777216) q[122];
-cx q[122],q[99];
-rz(pi/33554432) q[98];
-rz(-pi/16777216) q[99];
-cx q[122],q[99];
-rz(pi/8388608) q[122];
-cx q[122],q[100];
-rz(-pi/8388608) q[100];
-cx q[122],q[100];
-rz(pi/8388608) q[100];
-rz(pi/4194304) q[122];
-cx q[122],q[101];
-rz(-pi/4194304) q[101];
-cx q[122],q[101];
-rz(pi/4194304) q[101];
-rz(pi/2097152) q[122];
-cx q[122],q[102];
-rz(-pi/2097152) q[102];
-cx q[122],q[102];
-rz(pi/2097152) q[102];
-rz(pi/1048576) q[122];
-cx q[122],q[103];
-rz(-pi/1048576) q[103];
-cx q[122],q[103];
-rz(pi/1048576) q[103];
-rz(pi/524288) q[122];
-cx q[122],q[104];
-rz(-pi/524288) q[104];
-cx q[122],q[104];
-rz(pi/524288) q[104];
-rz(pi/262144) q[122];
-cx q[122],q[105];
-rz(-pi/262144) q[105];
-cx q[122],q[105];
-rz(pi/262144) q[105];
-rz(pi/131072) q[122];
-cx q[122],q[106];
-rz(-pi/131072) q[106];
-cx q[122],q[106];
-rz(pi/131072) q[106];
-rz(pi/65536) q[122];
-cx q[122],q[107];
-rz(-pi/65536) q[107];
-cx q[122],q[107];
-rz(pi/65536) q[107];
-rz(pi/32768) q[122];
-cx q[122],q[108];
-rz(-pi/32768) q[108];
-cx q[122],q[108];
-rz(pi/32768) q[108];
-rz(pi/16384) q[122];
-cx q[122],q[109];
-rz(-pi/16384) q[109];
-cx q[122],q[109];
-rz(pi/16384) q[109];
-rz(pi/8192) q[122];
-cx q[122],q[110];
-rz(-pi/8192) q[110];
-cx q[122],q[110];
-rz(pi/8192) q[110];
-rz(pi/4096) q[122];
-cx q[122],q[111];
-rz(-pi/4096) q[111];
-cx q[122],q[111];
-rz(pi/4096) q[111];
-rz(pi/2048) q[122];
-cx q[122],q[112];
-rz(-pi/2048) q[112];
-cx q[122],q[112];
-rz(pi/2048) q[112];
-rz(pi/1024) q[122];
-cx q[122],q[113];
-rz(-pi/1024) q[113];
-cx q[122],q[113];
-rz(pi/1024) q[113];
-rz(pi/512) q[122];
-cx q[122],q[114];
-rz(-pi/512) q[114];
-cx q[122],q[114];
-rz(pi/512) q[114];
-rz(pi/256) q[122];
-cx q[122],q[115];
-rz(-pi/256) q[115];
-cx q[122],q[115];
-rz(pi/256) q[115];
-rz(pi/128) q[122];
-cx q[122],q[116];
-rz(-pi/128) q[116];
-cx q[122],q[116];
-rz(pi/128) q[116];
-rz(pi/64) q[122];
-cx q[122],q[117];
-rz(-pi/64) q[117];
-cx q[122],q[117];
-rz(pi/64) q[117];
-rz(pi/32) q[122];
-cx q[122],q[118];
-rz(-pi/32) q[118];
-cx q[122],q[118];
-rz(pi/32) q[118];
-rz(pi/16) q[122];
-cx q[122],q[119];
-rz(-pi/16) q[119];
-cx q[122],q[119];
-rz(pi/16) q[119];
-rz(pi/8) q[122];
-cx q[122],q[120];
-rz(-pi/8) q[120];
-cx q[122],q[120];
-rz(pi/8) q[120];
-rz(pi/4) q[122];
-cx q[122],q[121];
-rz(-pi/4) q[121];
-cx q[122],q[121];
-rz(pi/4) q[121];
-rz(pi/2) q[122];
-sx q[122];
-rz(pi/2) q[122];
-rz(pi/16777216) q[99];
-rz(1.42863093678434e-12) q[123];
-cx q[123],q[83];
-rz(-1.42863093678434e-12) q[83];
-cx q[123],q[83];
-rz(2.85726187356867e-12) q[123];
-cx q[123],q[84];
-rz(1.42863093678434e-12) q[83];
-rz(-2.85726187356867e-12) q[84];
-cx q[123],q[84];
-rz(5.71452374713734e-12) q[123];
-cx q[123],q[85];
-rz(2.85726187356867e-12) q[84];
-rz(-5.71452374713734e-12) q[85];
-cx q[123],q[85];
-rz(1.14290474942747e-11) q[123];
-cx q[123],q[86];
-rz(5.71452374713734e-12) q[85];
-rz(-1.14290474942747e-11) q[86];
-cx q[123],q[86];
-rz(2.28580949885494e-11) q[123];
-cx q[123],q[87];
-rz(1.14290474942747e-11) q[86];
-rz(-2.28580949885494e-11) q[87];
-cx q[123],q[87];
-rz(4.57161899770987e-11) q[123];
-cx q[123],q[88];
-rz(2.28580949885494e-11) q[87];
-rz(-4.57161899770987e-11) q[88];
-cx q[123],q[88];
-rz(9.14323799541975e-11) q[123];
-cx q[123],q[89];
-rz(4.57161899770987e-11) q[88];
-rz(-9.14323799541975e-11) q[89];
-cx q[123],q[89];
-rz(1.82864759908395e-10) q[123];
-cx q[123],q[90];
-rz(9.14323799541975e-11) q[89];
-rz(-1.82864759908395e-10) q[90];
-cx q[123],q[90];
-rz(3.6572951981679e-10) q[123];
-cx q[123],q[91];
-rz(1.82864759908395e-10) q[90];
-rz(-3.6572951981679e-10) q[91];
-cx q[123],q[91];
-rz(7.3145903963358e-10) q[123];
-cx q[123],q[92];
-rz(3.6572951981679e-10) q[91];
-rz(-7.3145903963358e-10) q[92];
-cx q[123],q[92];
-rz(pi/2147483648) q[123];
-cx q[123],q[93];
-rz(7.3145903963358e-10) q[92];
-rz(-pi/2147483648) q[93];
-cx q[123],q[93];
-rz(pi/1073741824) q[123];
-cx q[123],q[94];
-rz(pi/2147483648) q[93];
-rz(-pi/1073741824) q[94];
-cx q[123],q[94];
-rz(pi/536870912) q[123];
-cx q[123],q[95];
-rz(pi/1073741824) q[94];
-rz(-pi/536870912) q[95];
-cx q[123],q[95];
-rz(pi/268435456) q[123];
-cx q[123],q[96];
-rz(pi/536870912) q[95];
-rz(-pi/268435456) q[96];
-cx q[123],q[96];
-rz(pi/134217728) q[123];
-cx q[123],q[97];
-rz(pi/268435456) q[96];
-rz(-pi/134217728) q[97];
-cx q[123],q[97];
-rz(pi/67108864) q[123];
-cx q[123],q[98];
-rz(pi/134217728) q[97];
-rz(-pi/67108864) q[98];
-cx q[123],q[98];
-rz(pi/33554432) q[123];
-cx q[123],q[99];
-rz(pi/67108864) q[98];
-rz(-pi/33554432) q[99];
-cx q[123],q[99];
-rz(pi/16777216) q[123];
-cx q[123],q[100];
-rz(-pi/16777216) q[100];
-cx q[123],q[100];
-rz(pi/16777216) q[100];
-rz(pi/8388608) q[123];
-cx q[123],q[101];
-rz(-pi/8388608) q[101];
-cx q[123],q[101];
-rz(pi/8388608) q[101];
-rz(pi/4194304) q[123];
-cx q[123],q[102];
-rz(-pi/4194304) q[102];
-cx q[123],q[102];
-rz(pi/4194304) q[102];
-rz(pi/2097152) q[123];
-cx q[123],q[103];
-rz(-pi/2097152) q[103];
-cx q[123],q[103];
-rz(pi/2097152) q[103];
-rz(pi/1048576) q[123];
-cx q[123],q[104];
-rz(-pi/1048576) q[104];
-cx q[123],q[104];
-rz(pi/1048576) q[104];
-rz(pi/524288) q[123];
-cx q[123],q[105];
-rz(-pi/524288) q[105];
-cx q[123],q[105];
-rz(pi/524288) q[105];
-rz(pi/262144) q[123];
-cx q[123],q[106];
-rz(-pi/262144) q[106];
-cx q[123],q[106];
-rz(pi/262144) q[106];
-rz(pi/131072) q[123];
-cx q[123],q[107];
-rz(-pi/131072) q[107];
-cx q[123],q[107];
-rz(pi/131072) q[107];
-rz(pi/65536) q[123];
-cx q[123],q[108];
-rz(-pi/65536) q[108];
-cx q[123],q[108];
-rz(pi/65536) q[108];
-rz(pi/32768) q[123];
-cx q[123],q[109];
-rz(-pi/32768) q[109];
-cx q[123],q[109];
-rz(pi/32768) q[109];
-rz(pi/16384) q[123];
-cx q[123],q[110];
-rz(-pi/16384) q[110];
-cx q[123],q[110];
-rz(pi/16384) q[110];
-rz(pi/8192) q[123];
-cx q[123],q[111];
-rz(-pi/8192) q[111];
-cx q[123],q[111];
-rz(pi/8192) q[111];
-rz(pi/4096) q[123];
-cx q[123],q[112];
-rz(-pi/4096) q[112];
-cx q[123],q[112];
-rz(pi/4096) q[112];
-rz(pi/2048) q[123];
-cx q[123],q[113];
-rz(-pi/2048) q[113];
-cx q[123],q[113];
-rz(pi/2048) q[113];
-rz(pi/1024) q[123];
-cx q[123],q[114];
-rz(-pi/1024) q[114];
-cx q[123],q[114];
-rz(pi/1024) q[114];
-rz(pi/512) q[123];
-cx q[123],q[115];
-rz(-pi/512) q[115];
-cx q[123],q[115];
-rz(pi/512) q[115];
-rz(pi/256) q[123];
-cx q[123],q[116];
-rz(-pi/256) q[116];
-cx q[123],q[116];
-rz(pi/256) q[116];
-rz(pi/128) q[123];
-cx q[123],q[117];
-rz(-pi/128) q[117];
-cx q[123],q[117];
-rz(pi/128) q[117];
-rz(pi/64) q[123];
-cx q[123],q[118];
-rz(-pi/64) q[118];
-cx q[123],q[118];
-rz(pi/64) q[118];
-rz(pi/32) q[123];
-cx q[123],q[119];
-rz(-pi/32) q[119];
-cx q[123],q[119];
-rz(pi/32) q[119];
-rz(pi/16) q[123];
-cx q[123],q[120];
-rz(-pi/16) q[120];
-cx q[123],q[120];
-rz(pi/16) q[120];
-rz(pi/8) q[123];
-cx q[123],q[121];
-rz(-pi/8) q[121];
-cx q[123],q[121];
-rz(pi/8) q[121];
-rz(pi/4) q[123];
-cx q[123],q[122];
-rz(-pi/4) q[122];
-cx q[123],q[122];
-rz(pi/4) q[122];
-rz(pi/2) q[123];
-sx q[123];
-rz(pi/2) q[123];
-rz(pi/33554432) q[99];
-rz(1.42863093678434e-12) q[124];
-cx q[124],q[84];
-rz(-1.42863093678434e-12) q[84];
-cx q[124],q[84];
-rz(2.85726187356867e-12) q[124];
-cx q[124],q[85];
-rz(1.42863093678434e-12) q[84];
-rz(-2.85726187356867e-12) q[85];
-cx q[124],q[85];
-rz(5.71452374713734e-12) q[124];
-cx q[124],q[86];
-rz(2.85726187356867e-12) q[85];
-rz(-5.71452374713734e-12) q[86];
-cx q[124],q[86];
-rz(1.14290474942747e-11) q[124];
-cx q[124],q[87];
-rz(5.71452374713734e-12) q[86];
-rz(-1.14290474942747e-11) q[87];
-cx q[124],q[87];
-rz(2.28580949885494e-11) q[124];
-cx q[124],q[88];
-rz(1.14290474942747e-11) q[87];
-rz(-2.28580949885494e-11) q[88];
-cx q[124],q[88];
-rz(4.57161899770987e-11) q[124];
-cx q[124],q[89];
-rz(2.28580949885494e-11) q[88];
-rz(-4.57161899770987e-11) q[89];
-cx q[124],q[89];
-rz(9.14323799541975e-11) q[124];
-cx q[124],q[90];
-rz(4.57161899770987e-11) q[89];
-rz(-9.14323799541975e-11) q[90];
-cx q[124],q[90];
-rz(1.82864759908395e-10) q[124];
-cx q[124],q[91];
-rz(9.14323799541975e-11) q[90];
-rz(-1.82864759908395e-10) q[91];
-cx q[124],q[91];
-rz(3.6572951981679e-10) q[124];
-cx q[124],q[92];
-rz(1.82864759908395e-10) q[91];
-rz(-3.6572951981679e-10) q[92];
-cx q[124],q[92];
-rz(7.3145903963358e-10) q[124];
-cx q[124],q[93];
-rz(3.6572951981679e-10) q[92];
-rz(-7.3145903963358e-10) q[93];
-cx q[124],q[93];
-rz(pi/2147483648) q[124];
-cx q[124],q[94];
-rz(7.3145903963358e-10) q[93];
-rz(-pi/2147483648) q[94];
-cx q[124],q[94];
-rz(pi/1073741824) q[124];
-cx q[124],q[95];
-rz(pi/2147483648) q[94];
-rz(-pi/1073741824) q[95];
-cx q[124],q[95];
-rz(pi/536870912) q[124];
-cx q[124],q[96];
-rz(pi/1073741824) q[95];
-rz(-pi/536870912) q[96];
-cx q[124],q[96];
-rz(pi/268435456) q[124];
-cx q[124],q[97];
-rz(pi/536870912) q[96];
-rz(-pi/268435456) q[97];
-cx q[124],q[97];
-rz(pi/134217728) q[124];
-cx q[124],q[98];
-rz(pi/268435456) q[97];
-rz(-pi/134217728) q[98];
-cx q[124],q[98];
-rz(pi/67108864) q[124];
-cx q[124],q[99];
-rz(pi/134217728) q[98];
-rz(-pi/67108864) q[99];
-cx q[124],q[99];
-rz(pi/33554432) q[124];
-cx q[124],q[100];
-rz(-pi/33554432) q[100];
-cx q[124],q[100];
-rz(pi/33554432) q[100];
-rz(pi/16777216) q[124];
-cx q[124],q[101];
-rz(-pi/16777216) q[101];
-cx q[124],q[101];
-rz(pi/16777216) q[101];
-rz(pi/8388608) q[124];
-cx q[124],q[102];
-rz(-pi/8388608) q[102];
-cx q[124],q[102];
-rz(pi/8388608) q[102];
-rz(pi/4194304) q[124];
-cx q[124],q[103];
-rz(-pi/4194304) q[103];
-cx q[124],q[103];
-rz(pi/4194304) q[103];
-rz(pi/2097152) q[124];
-cx q[124],q[104];
-rz(-pi/2097152) q[104];
-cx q[124],q[104];
-rz(pi/2097152) q[104];
-rz(pi/1048576) q[124];
-cx q[124],q[105];
-rz(-pi/1048576) q[105];
-cx q[124],q[105];
-rz(pi/1048576) q[105];
-rz(pi/524288) q[124];
-cx q[124],q[106];
-rz(-pi/524288) q[106];
-cx q[124],q[106];
-rz(pi/524288) q[106];
-rz(pi/262144) q[124];
-cx q[124],q[107];
-rz(-pi/262144) q[107];
-cx q[124],q[107];
-rz(pi/262144) q[107];
-rz(pi/131072) q[124];
-cx q[124],q[108];
-rz(-pi/131072) q[108];
-cx q[124],q[108];
-rz(pi/131072) q[108];
-rz(pi/65536) q[124];
-cx q[124],q[109];
-rz(-pi/65536) q[109];
-cx q[124],q[109];
-rz(pi/65536) q[109];
-rz(pi/32768) q[124];
-cx q[124],q[110];
-rz(-pi/32768) q[110];
-cx q[124],q[110];
-rz(pi/32768) q[110];
-rz(pi/16384) q[124];
-cx q[124],q[111];
-rz(-pi/16384) q[111];
-cx q[124],q[111];
-rz(pi/16384) q[111];
-rz(pi/8192) q[124];
-cx q[124],q[112];
-rz(-pi/8192) q[112];
-cx q[124],q[112];
-rz(pi/8192) q[112];
-rz(pi/4096) q[124];
-cx q[124],q[113];
-rz(-pi/4096) q[113];
-cx q[124],q[113];
-rz(pi/4096) q[113];
-rz(pi/2048) q[124];
-cx q[124],q[114];
-rz(-pi/2048) q[114];
-cx q[124],q[114];
-rz(pi/2048) q[114];
-rz(pi/1024) q[124];
-cx q[124],q[115];
-rz(-pi/1024) q[115];
-cx q[124],q[115];
-rz(pi/1024) q[115];
-rz(pi/512) q[124];
-cx q[124],q[116];
-rz(-pi/512) q[116];
-cx q[124],q[116];
-rz(pi/512) q[116];
-rz(pi/256) q[124];
-cx q[124],q[117];
-rz(-pi/256) q[117];
-cx q[124],q[117];
-rz(pi/256) q[117];
-rz(pi/128) q[124];
-cx q[124],q[118];
-rz(-pi/128) q[118];
-cx q[124],q[118];
-rz(pi/128) q[118];
-rz(pi/64) q[124];
-cx q[124],q[119];
-rz(-pi/64) q[119];
-cx q[124],q[119];
-rz(pi/64) q[119];
-rz(pi/32) q[124];
-cx q[124],q[120];
-rz(-pi/32) q[120];
-cx q[124],q[120];
-rz(pi/32) q[120];
-rz(pi/16) q[124];
-cx q[124],q[121];
-rz(-pi/16) q[121];
-cx q[124],q[121];
-rz(pi/16) q[121];
-rz(pi/8) q[124];
-cx q[124],q[122];
-rz(-pi/8) q[122];
-cx q[124],q[122];
-rz(pi/8) q[122];
-rz(pi/4) q[124];
-cx q[124],q[123];
-rz(-pi/4) q[123];
-cx q[124],q[123];
-rz(pi/4) q[123];
-rz(pi/2) q[124];
-sx q[124];
-rz(pi/2) q[124];
-rz(pi/67108864) q[99];
-rz(1.42863093678434e-12) q[125];
-cx q[125],q[85];
-rz(-1.42863093678434e-12) q[85];
-cx q[125],q[85];
-rz(2.85726187356867e-12) q[125];
-cx q[125],q[86];
-rz(1.42863093678434e-12) q[85];
-rz(-2.85726187356867e-12) q[86];
-cx q[125],q[86];
-rz(5.71452374713734e-12) q[125];
-cx q[125],q[87];
-rz(2.85726187356867e-12) q[86];
-rz(-5.71452374713734e-12) q[87];
-cx q[125],q[87];
-rz(1.14290474942747e-11) q[125];
-cx q[125],q[88];
-rz(5.71452374713734e-12) q[87];
-rz(-1.14290474942747e-11) q[88];
-cx q[125],q[88];
-rz(2.28580949885494e-11) q[125];
-cx q[125],q[89];
-rz(1.14290474942747e-11) q[88];
-rz(-2.28580949885494e-11) q[89];
-cx q[125],q[89];
-rz(4.57161899770987e-11) q[125];
-cx q[125],q[90];
-rz(2.28580949885494e-11) q[89];
-rz(-4.57161899770987e-11) q[90];
-cx q[125],q[90];
-rz(9.14323799541975e-11) q[125];
-cx q[125],q[91];
-rz(4.57161899770987e-11) q[90];
-rz(-9.14323799541975e-11) q[91];
-cx q[125],q[91];
-rz(1.82864759908395e-10) q[125];
-cx q[125],q[92];
-rz(9.14323799541975e-11) q[91];
-rz(-1.82864759908395e-10) q[92];
-cx q[125],q[92];
-rz(3.6572951981679e-10) q[125];
-cx q[125],q[93];
-rz(1.82864759908395e-10) q[92];
-rz(-3.6572951981679e-10) q[93];
-cx q[125],q[93];
-rz(7.3145903963358e-10) q[125];
-cx q[125],q[94];
-rz(3.6572951981679e-10) q[93];
-rz(-7.3145903963358e-10) q[94];
-cx q[125],q[94];
-rz(pi/2147483648) q[125];
-cx q[125],q[95];
-rz(7.3145903963358e-10) q[94];
-rz(-pi/2147483648) q[95];
-cx q[125],q[95];
-rz(pi/1073741824) q[125];
-cx q[125],q[96];
-rz(pi/2147483648) q[95];
-rz(-pi/1073741824) q[96];
-cx q[125],q[96];
-rz(pi/536870912) q[125];
-cx q[125],q[97];
-rz(pi/1073741824) q[96];
-rz(-pi/536870912) q[97];
-cx q[125],q[97];
-rz(pi/268435456) q[125];
-cx q[125],q[98];
-rz(pi/536870912) q[97];
-rz(-pi/268435456) q[98];
-cx q[125],q[98];
-rz(pi/134217728) q[125];
-cx q[125],q[99];
-rz(pi/268435456) q[98];
-rz(-pi/134217728) q[99];
-cx q[125],q[99];
-rz(pi/67108864) q[125];
-cx q[125],q[100];
-rz(-pi/67108864) q[100];
-cx q[125],q[100];
-rz(pi/67108864) q[100];
-rz(pi/33554432) q[125];
-cx q[125],q[101];
-rz(-pi/33554432) q[101];
-cx q[125],q[101];
-rz(pi/33554432) q[101];
-rz(pi/16777216) q[125];
-cx q[125],q[102];
-rz(-pi/16777216) q[102];
-cx q[125],q[102];
-rz(pi/16777216) q[102];
-rz(pi/8388608) q[125];
-cx q[125],q[103];
-rz(-pi/8388608) q[103];
-cx q[125],q[103];
-rz(pi/8388608) q[103];
-rz(pi/4194304) q[125];
-cx q[125],q[104];
-rz(-pi/4194304) q[104];
-cx q[125],q[104];
-rz(pi/4194304) q[104];
-rz(pi/2097152) q[125];
-cx q[125],q[105];
-rz(-pi/2097152) q[105];
-cx q[125],q[105];
-rz(pi/2097152) q[105];
-rz(pi/1048576) q[125];
-cx q[125],q[106];
-rz(-pi/1048576) q[106];
-cx q[125],q[106];
-rz(pi/1048576) q[106];
-rz(pi/524288) q[125];
-cx q[125],q[107];
-rz(-pi/524288) q[107];
-cx q[125],q[107];
-rz(pi/524288) q[107];
-rz(pi/262144) q[125];
-cx q[125],q[108];
-rz(-pi/262144) q[108];
-cx q[125],q[108];
-rz(pi/262144) q[108];
-rz(pi/131072) q[125];
-cx q[125],q[109];
-rz(-pi/131072) q[109];
-cx q[125],q[109];
-rz(pi/131072) q[109];
-rz(pi/65536) q[125];
-cx q[125],q[110];
-rz(-pi/65536) q[110];
-cx q[125],q[110];
-rz(pi/65536) q[110];
-rz(pi/32768) q[125];
-cx q[125],q[111];
-rz(-pi/32768) q[111];
-cx q[125],q[111];
-rz(pi/32768) q[111];
-rz(pi/16384) q[125];
-cx q[125],q[112];
-rz(-pi/16384) q[112];
-cx q[125],q[112];
-rz(pi/16384) q[112];
-rz(pi/8192) q[125];
-cx q[125],q[113];
-rz(-pi/8192) q[113];
-cx q[125],q[113];
-rz(pi/8192) q[113];
-rz(pi/4096) q[125];
-cx q[125],q[114];
-rz(-pi/4096) q[114];
-cx q[125],q[114];
-rz(pi/4096) q[114];
-rz(pi/2048) q[125];
-cx q[125],q[115];
-rz(-pi/2048) q[115];
-cx q[125],q[115];
-rz(pi/2048) q[115];
-rz(pi/1024) q[125];
-cx q[125],q[116];
-rz(-pi/1024) q[116];
-cx q[125],q[116];
-rz(pi/1024) q[116];
-rz(pi/512) q[125];
-cx q[125],q[117];
-rz(-pi/512) q[117];
-cx q[125],q[117];
-rz(pi/512) q[117];
-rz(pi/256) q[125];
-cx q[125],q[118];
-rz(-pi/256) q[118];
-cx q[125],q[118];
-rz(pi/256) q[118];
-rz(pi/128) q[125];
-cx q[125],q[119];
-rz(-pi/128) q[119];
-cx q[125],q[119];
-rz(pi/128) q[119];
-rz(pi/64) q[125];
-cx q[125],q[120];
-rz(-pi/64) q[120];
-cx q[125],q[120];
-rz(pi/64) q[120];
-rz(pi/32) q[125];
-cx q[125],q[121];
-rz(-pi/32) q[121];
-cx q[125],q[121];
-rz(pi/32) q[121];
-rz(pi/16) q[125];
-cx q[125],q[122];
-rz(-pi/16) q[122];
-cx q[125],q[122];
-rz(pi/16) q[122];
-rz(pi/8) q[125];
-cx q[125],q[123];
-rz(-pi/8) q[123];
-cx q[125],q[123];
-rz(pi/8) q[123];
-rz(pi/4) q[125];
-cx q[125],q[124];
-rz(-pi/4) q[124];
-cx q[125],q[124];
-rz(pi/4) q[124];
-rz(pi/2) q[125];
-sx q[125];
-rz(pi/2) q[125];
-rz(pi/134217728) q[99];
-rz(1.42863093678434e-12) q[126];
-cx q[126],q[86];
-rz(-1.42863093678434e-12) q[86];
-cx q[126],q[86];
-rz(2.85726187356867e-12) q[126];
-cx q[126],q[87];
-rz(1.42863093678434e-12) q[86];
-rz(-2.85726187356867e-12) q[87];
-cx q[126],q[87];
-rz(5.71452374713734e-12) q[126];
-cx q[126],q[88];
-rz(2.85726187356867e-12) q[87];
-rz(-5.71452374713734e-12) q[88];
-cx q[126],q[88];
-rz(1.14290474942747e-11) q[126];
-cx q[126],q[89];
-rz(5.71452374713734e-12) q[88];
-rz(-1.14290474942747e-11) q[89];
-cx q[126],q[89];
-rz(2.28580949885494e-11) q[126];
-cx q[126],q[90];
-rz(1.14290474942747e-11) q[89];
-rz(-2.28580949885494e-11) q[90];
-cx q[126],q[90];
-rz(4.57161899770987e-11) q[126];
-cx q[126],q[91];
-rz(2.28580949885494e-11) q[90];
-rz(-4.57161899770987e-11) q[91];
-cx q[126],q[91];
-rz(9.14323799541975e-11) q[126];
-cx q[126],q[92];
-rz(4.57161899770987e-11) q[91];
-rz(-9.14323799541975e-11) q[92];
-cx q[126],q[92];
-rz(1.82864759908395e-10) q[126];
-cx q[126],q[93];
-rz(9.14323799541975e-11) q[92];
-rz(-1.82864759908395e-10) q[93];
-cx q[126],q[93];
-rz(3.6572951981679e-10) q[126];
-cx q[126],q[94];
-rz(1.82864759908395e-10) q[93];
-rz(-3.6572951981679e-10) q[94];
-cx q[126],q[94];
-rz(7.3145903963358e-10) q[126];
-cx q[126],q[95];
-rz(3.6572951981679e-10) q[94];
-rz(-7.3145903963358e-10) q[95];
-cx q[126],q[95];
-rz(pi/2147483648) q[126];
-cx q[126],q[96];
-rz(7.3145903963358e-10) q[95];
-rz(-pi/2147483648) q[96];
-cx q[126],q[96];
-rz(pi/1073741824) q[126];
-cx q[126],q[97];
-rz(pi/2147483648) q[96];
-rz(-pi/1073741824) q[97];
-cx q[126],q[97];
-rz(pi/536870912) q[126];
-cx q[126],q[98];
-rz(pi/1073741824) q[97];
-rz(-pi/536870912) q[98];
-cx q[126],q[98];
-rz(pi/268435456) q[126];
-cx q[126],q[99];
-rz(pi/536870912) q[98];
-rz(-pi/268435456) q[99];
-cx q[126],q[99];
-rz(pi/134217728) q[126];
-cx q[126],q[100];
-rz(-pi/134217728) q[100];
-cx q[126],q[100];
-rz(pi/134217728) q[100];
-rz(pi/67108864) q[126];
-cx q[126],q[101];
-rz(-pi/67108864) q[101];
-cx q[126],q[101];
-rz(pi/67108864) q[101];
-rz(pi/33554432) q[126];
-cx q[126],q[102];
-rz(-pi/33554432) q[102];
-cx q[126],q[102];
-rz(pi/33554432) q[102];
-rz(pi/16777216) q[126];
-cx q[126],q[103];
-rz(-pi/16777216) q[103];
-cx q[126],q[103];
-rz(pi/16777216) q[103];
-rz(pi/8388608) q[126];
-cx q[126],q[104];
-rz(-pi/8388608) q[104];
-cx q[126],q[104];
-rz(pi/8388608) q[104];
-rz(pi/4194304) q[126];
-cx q[126],q[105];
-rz(-pi/4194304) q[105];
-cx q[126],q[105];
-rz(pi/4194304) q[105];
-rz(pi/2097152) q[126];
-cx q[126],q[106];
-rz(-pi/2097152) q[106];
-cx q[126],q[106];
-rz(pi/2097152) q[106];
-rz(pi/1048576) q[126];
-cx q[126],q[107];
-rz(-pi/1048576) q[107];
-cx q[126],q[107];
-rz(pi/1048576) q[107];
-rz(pi/524288) q[126];
-cx q[126],q[108];
-rz(-pi/524288) q[108];
-cx q[126],q[108];
-rz(pi/524288) q[108];
-rz(pi/262144) q[126];
-cx q[126],q[109];
-rz(-pi/262144) q[109];
-cx q[126],q[109];
-rz(pi/262144) q[109];
-rz(pi/131072) q[126];
-cx q[126],q[110];
-rz(-pi/131072) q[110];
-cx q[126],q[110];
-rz(pi/131072) q[110];
-rz(pi/65536) q[126];
-cx q[126],q[111];
-rz(-pi/65536) q[111];
-cx q[126],q[111];
-rz(pi/65536) q[111];
-rz(pi/32768) q[126];
-cx q[126],q[112];
-rz(-pi/32768) q[112];
-cx q[126],q[112];
-rz(pi/32768) q[112];
-rz(pi/16384) q[126];
-cx q[126],q[113];
-rz(-pi/16384) q[113];
-cx q[126],q[113];
-rz(pi/16384) q[113];
-rz(pi/8192) q[126];
-cx q[126],q[114];
-rz(-pi/8192) q[114];
-cx q[126],q[114];
-rz(pi/8192) q[114];
-rz(pi/4096) q[126];
-cx q[126],q[115];
-rz(-pi/4096) q[115];
-cx q[126],q[115];
-rz(pi/4096) q[115];
-rz(pi/2048) q[126];
-cx q[126],q[116];
-rz(-pi/2048) q[116];
-cx q[126],q[116];
-rz(pi/2048) q[116];
-rz(pi/1024) q[126];
-cx q[126],q[117];
-rz(-pi/1024) q[117];
-cx q[126],q[117];
-rz(pi/1024) q[117];
-rz(pi/512) q[126];
-cx q[126],q[118];
-rz(-pi/512) q[118];
-cx q[126],q[118];
-rz(pi/512) q[118];
-rz(pi/256) q[126];
-cx q[126],q[119];
-rz(-pi/256) q[119];
-cx q[126],q[119];
-rz(pi/256) q[119];
-rz(pi/128) q[126];
-cx q[126],q[120];
-rz(-pi/128) q[120];
-cx q[126],q[120];
-rz(pi/128) q[120];
-rz(pi/64) q[126];
-cx q[126],q[121];
-rz(-pi/64) q[121];
-cx q[126],q[121];
-rz(pi/64) q[121];
-rz(pi/32) q[126];
-cx q[126],q[122];
-rz(-pi/32) q[122];
-cx q[126],q[122];
-rz(pi/32) q[122];
-rz(pi/16) q[126];
-cx q[126],q[123];
-rz(-pi/16) q[123];
-cx q[126],q[123];
-rz(pi/16) q[123];
-rz(pi/8) q[126];
-cx q[126],q[124];
-rz(-pi/8) q[124];
-cx q[126],q[124];
-rz(pi/8) q[124];
-rz(pi/4) q[126];
-cx q[126],q[125];
-rz(-pi/4) q[125];
-cx q[126],q[125];
-rz(pi/4) q[125];
-rz(pi/2) q[126];
-sx q[126];
-rz(pi/2) q[126];
-rz(pi/268435456) q[99];
-rz(1.42863093678434e-12) q[127];
-cx q[127],q[87];
-rz(-1.42863093678434e-12) q[87];
-cx q[127],q[87];
-rz(2.85726187356867e-12) q[127];
-cx q[127],q[88];
-rz(1.42863093678434e-12) q[87];
-rz(-2.85726187356867e-12) q[88];
-cx q[127],q[88];
-rz(5.71452374713734e-12) q[127];
-cx q[127],q[89];
-rz(2.85726187356867e-12) q[88];
-rz(-5.71452374713734e-12) q[89];
-cx q[127],q[89];
-rz(1.14290474942747e-11) q[127];
-cx q[127],q[90];
-rz(5.71452374713734e-12) q[89];
-rz(-1.14290474942747e-11) q[90];
-cx q[127],q[90];
-rz(2.28580949885494e-11) q[127];
-cx q[127],q[91];
-rz(1.14290474942747e-11) q[90];
-rz(-2.28580949885494e-11) q[91];
-cx q[127],q[91];
-rz(4.57161899770987e-11) q[127];
-cx q[127],q[92];
-rz(2.28580949885494e-11) q[91];
-rz(-4.57161899770987e-11) q[92];
-cx q[127],q[92];
-rz(9.14323799541975e-11) q[127];
-cx q[127],q[93];
-rz(4.57161899770987e-11) q[92];
-rz(-9.14323799541975e-11) q[93];
-cx q[127],q[93];
-rz(1.82864759908395e-10) q[127];
-cx q[127],q[94];
-rz(9.14323799541975e-11) q[93];
-rz(-1.82864759908395e-10) q[94];
-cx q[127],q[94];
-rz(3.6572951981679e-10) q[127];
-cx q[127],q[95];
-rz(1.82864759908395e-10) q[94];
-rz(-3.6572951981679e-10) q[95];
-cx q[127],q[95];
-rz(7.3145903963358e-10) q[127];
-cx q[127],q[96];
-rz(3.6572951981679e-10) q[95];
-rz(-7.3145903963358e-10) q[96];
-cx q[127],q[96];
-rz(pi/2147483648) q[127];
-cx q[127],q[97];
-rz(7.3145903963358e-10) q[96];
-rz(-pi/2147483648) q[97];
-cx q[127],q[97];
-rz(pi/1073741824) q[127];
-cx q[127],q[98];
-rz(pi/2147483648) q[97];
-rz(-pi/1073741824) q[98];
-cx q[127],q[98];
-rz(pi/536870912) q[127];
-cx q[127],q[99];
-rz(pi/1073741824) q[98];
-rz(-pi/536870912) q[99];
-cx q[127],q[99];
-rz(pi/268435456) q[127];
-cx q[127],q[100];
-rz(-pi/268435456) q[100];
-cx q[127],q[100];
-rz(pi/268435456) q[100];
-rz(pi/134217728) q[127];
-cx q[127],q[101];
-rz(-pi/134217728) q[101];
-cx q[127],q[101];
-rz(pi/134217728) q[101];
-rz(pi/67108864) q[127];
-cx q[127],q[102];
-rz(-pi/67108864) q[102];
-cx q[127],q[102];
-rz(pi/67108864) q[102];
-rz(pi/33554432) q[127];
-cx q[127],q[103];
-rz(-pi/33554432) q[103];
-cx q[127],q[103];
-rz(pi/33554432) q[103];
-rz(pi/16777216) q[127];
-cx q[127],q[104];
-rz(-pi/16777216) q[104];
-cx q[127],q[104];
-rz(pi/16777216) q[104];
-rz(pi/8388608) q[127];
-cx q[127],q[105];
-rz(-pi/8388608) q[105];
-cx q[127],q[105];
-rz(pi/8388608) q[105];
-rz(pi/4194304) q[127];
-cx q[127],q[106];
-rz(-pi/4194304) q[106];
-cx q[127],q[106];
-rz(pi/4194304) q[106];
-rz(pi/2097152) q[127];
-cx q[127],q[107];
-rz(-pi/2097152) q[107];
-cx q[127],q[107];
-rz(pi/2097152) q[107];
-rz(pi/1048576) q[127];
-cx q[127],q[108];
-rz(-pi/1048576) q[108];
-cx q[127],q[108];
-rz(pi/1048576) q[108];
-rz(pi/524288) q[127];
-cx q[127],q[109];
-rz(-pi/524288) q[109];
-cx q[127],q[109];
-rz(pi/524288) q[109];
-rz(pi/262144) q[127];
-cx q[127],q[110];
-rz(-pi/262144) q[110];
-cx q[127],q[110];
-rz(pi/262144) q[110];
-rz(pi/131072) q[127];
-cx q[127],q[111];
-rz(-pi/131072) q[111];
-cx q[127],q[111];
-rz(pi/131072) q[111];
-rz(pi/65536) q[127];
-cx q[127],q[112];
-rz(-pi/65536) q[112];
-cx q[127],q[112];
-rz(pi/65536) q[112];
-rz(pi/32768) q[127];
-cx q[127],q[113];
-rz(-pi/32768) q[113];
-cx q[127],q[113];
-rz(pi/32768) q[113];
-rz(pi/16384) q[127];
-cx q[127],q[114];
-rz(-pi/16384) q[114];
-cx q[127],q[114];
-rz(pi/16384) q[114];
-rz(pi/8192) q[127];
-cx q[127],q[115];
-rz(-pi/8192) q[115];
-cx q[127],q[115];
-rz(pi/8192) q[115];
-rz(pi/4096) q[127];
-cx q[127],q[116];
-rz(-pi/4096) q[116];
-cx q[127],q[116];
-rz(pi/4096) q[116];
-rz(pi/2048) q[127];
-cx q[127],q[117];
-rz(-pi/2048) q[117];
-cx q[127],q[117];
-rz(pi/2048) q[117];
-rz(pi/1024) q[127];
-cx q[127],q[118];
-rz(-pi/1024) q[118];
-cx q[127],q[118];
-rz(pi/1024) q[118];
-rz(pi/512) q[127];
-cx q[127],q[119];
-rz(-pi/512) q[119];
-cx q[127],q[119];
-rz(pi/512) q[119];
-rz(pi/256) q[127];
-cx q[127],q[120];
-rz(-pi/256) q[120];
-cx q[127],q[120];
-rz(pi/256) q[120];
-rz(pi/128) q[127];
-cx q[127],q[121];
-rz(-pi/128) q[121];
-cx q[127],q[121];
-rz(pi/128) q[121];
-rz(pi/64) q[127];
-cx q[127],q[122];
-rz(-pi/64) q[122];
-cx q[127],q[122];
-rz(pi/64) q[122];
-rz(pi/32) q[127];
-cx q[127],q[123];
-rz(-pi/32) q[123];
-cx q[127],q[123];
-rz(pi/32) q[123];
-rz(pi/16) q[127];
-cx q[127],q[124];
-rz(-pi/16) q[124];
-cx q[127],q[124];
-rz(pi/16) q[124];
-rz(pi/8) q[127];
-cx q[127],q[125];
-rz(-pi/8) q[125];
-cx q[127],q[125];
-rz(pi/8) q[125];
-rz(pi/4) q[127];
-cx q[127],q[126];
-rz(-pi/4) q[126];
-cx q[127],q[126];
-rz(pi/4) q[126];
-rz(pi/2) q[127];
-sx q[127];
-rz(pi/2) q[127];
-rz(pi/536870912) q[99];
-rz(1.42863093678434e-12) q[128];
-cx q[128],q[88];
-rz(-1.42863093678434e-12) q[88];
-cx q[128],q[88];
-rz(2.85726187356867e-12) q[128];
-cx q[128],q[89];
-rz(1.42863093678434e-12) q[88];
-rz(-2.85726187356867e-12) q[89];
-cx q[128],q[89];
-rz(5.71452374713734e-12) q[128];
-cx q[128],q[90];
-rz(2.85726187356867e-12) q[89];
-rz(-5.71452374713734e-12) q[90];
-cx q[128],q[90];
-rz(1.14290474942747e-11) q[128];
-cx q[128],q[91];
-rz(5.71452374713734e-12) q[90];
-rz(-1.14290474942747e-11) q[91];
-cx q[128],q[91];
-rz(2.28580949885494e-11) q[128];
-cx q[128],q[92];
-rz(1.14290474942747e-11) q[91];
-rz(-2.28580949885494e-11) q[92];
-cx q[128],q[92];
-rz(4.57161899770987e-11) q[128];
-cx q[128],q[93];
-rz(2.28580949885494e-11) q[92];
-rz(-4.57161899770987e-11) q[93];
-cx q[128],q[93];
-rz(9.14323799541975e-11) q[128];
-cx q[128],q[94];
-rz(4.57161899770987e-11) q[93];
-rz(-9.14323799541975e-11) q[94];
-cx q[128],q[94];
-rz(1.82864759908395e-10) q[128];
-cx q[128],q[95];
-rz(9.14323799541975e-11) q[94];
-rz(-1.82864759908395e-10) q[95];
-cx q[128],q[95];
-rz(3.6572951981679e-10) q[128];
-cx q[128],q[96];
-rz(1.82864759908395e-10) q[95];
-rz(-3.6572951981679e-10) q[96];
-cx q[128],q[96];
-rz(7.3145903963358e-10) q[128];
-cx q[128],q[97];
-rz(3.6572951981679e-10) q[96];
-rz(-7.3145903963358e-10) q[97];
-cx q[128],q[97];
-rz(pi/2147483648) q[128];
-cx q[128],q[98];
-rz(7.3145903963358e-10) q[97];
-rz(-pi/2147483648) q[98];
-cx q[128],q[98];
-rz(pi/1073741824) q[128];
-cx q[128],q[99];
-rz(pi/2147483648) q[98];
-rz(-pi/1073741824) q[99];
-cx q[128],q[99];
-rz(pi/536870912) q[128];
-cx q[128],q[100];
-rz(-pi/536870912) q[100];
-cx q[128],q[100];
-rz(pi/536870912) q[100];
-rz(pi/268435456) q[128];
-cx q[128],q[101];
-rz(-pi/268435456) q[101];
-cx q[128],q[101];
-rz(pi/268435456) q[101];
-rz(pi/134217728) q[128];
-cx q[128],q[102];
-rz(-pi/134217728) q[102];
-cx q[128],q[102];
-rz(pi/134217728) q[102];
-rz(pi/67108864) q[128];
-cx q[128],q[103];
-rz(-pi/67108864) q[103];
-cx q[128],q[103];
-rz(pi/67108864) q[103];
-rz(pi/33554432) q[128];
-cx q[128],q[104];
-rz(-pi/33554432) q[104];
-cx q[128],q[104];
-rz(pi/33554432) q[104];
-rz(pi/16777216) q[128];
-cx q[128],q[105];
-rz(-pi/16777216) q[105];
-cx q[128],q[105];
-rz(pi/16777216) q[105];
-rz(pi/8388608) q[128];
-cx q[128],q[106];
-rz(-pi/8388608) q[106];
-cx q[128],q[106];
-rz(pi/8388608) q[106];
-rz(pi/4194304) q[128];
-cx q[128],q[107];
-rz(-pi/4194304) q[107];
-cx q[128],q[107];
-rz(pi/4194304) q[107];
-rz(pi/2097152) q[128];
-cx q[128],q[108];
-rz(-pi/2097152) q[108];
-cx q[128],q[108];
-rz(pi/2097152) q[108];
-rz(pi/1048576) q[128];
-cx q[128],q[109];
-rz(-pi/1048576) q[109];
-cx q[128],q[109];
-rz(pi/1048576) q[109];
-rz(pi/524288) q[128];
-cx q[128],q[110];
-rz(-pi/524288) q[110];
-cx q[128],q[110];
-rz(pi/524288) q[110];
-rz(pi/262144) q[128];
-cx q[128],q[111];
-rz(-pi/262144) q[111];
-cx q[128],q[111];
-rz(pi/262144) q[111];
-rz(pi/131072) q[128];
-cx q[128],q[112];
-rz(-pi/131072) q[112];
-cx q[128],q[112];
-rz(pi/131072) q[112];
-rz(pi/65536) q[128];
-cx q[128],q[113];
-rz(-pi/65536) q[113];
-cx q[128],q[113];
-rz(pi/65536) q[113];
-rz(pi/32768) q[128];
-cx q[128],q[114];
-rz(-pi/32768) q[114];
-cx q[128],q[114];
-rz(pi/32768) q[114];
-rz(pi/16384) q[128];
-cx q[128],q[115];
-rz(-pi/16384) q[115];
-cx q[128],q[115];
-rz(pi/16384) q[115];
-rz(pi/8192) q[128];
-cx q[128],q[116];
-rz(-pi/8192) q[116];
-cx q[128],q[116];
-rz(pi/8192) q[116];
-rz(pi/4096) q[128];
-cx q[128],q[117];
-rz(-pi/4096) q[117];
-cx q[128],q[117];
-rz(pi/4096) q[117];
-rz(pi/2048) q[128];
-cx q[128],q[118];
-rz(-pi/2048) q[118];
-cx q[128],q[118];
-rz(pi/2048) q[118];
-rz(pi/1024) q[128];
-cx q[128],q[119];
-rz(-pi/1024) q[119];
-cx q[128],q[119];
-rz(pi/1024) q[119];
-rz(pi/512) q[128];
-cx q[128],q[120];
-rz(-pi/512) q[120];
-cx q[128],q[120];
-rz(pi/512) q[120];
-rz(pi/256) q[128];
-cx q[128],q[121];
-rz(-pi/256) q[121];
-cx q[128],q[121];
-rz(pi/256) q[121];
-rz(pi/128) q[128];
-cx q[128],q[122];
-rz(-pi/128) q[122];
-cx q[128],q[122];
-rz(pi/128) q[122];
-rz(pi/64) q[128];
-cx q[128],q[123];
-rz(-pi/64) q[123];
-cx q[128],q[123];
-rz(pi/64) q[123];
-rz(pi/32) q[128];
-cx q[128],q[124];
-rz(-pi/32) q[124];
-cx q[128],q[124];
-rz(pi/32) q[124];
-rz(pi/16) q[128];
-cx q[128],q[125];
-rz(-pi/16) q[125];
-cx q[128],q[125];
-rz(pi/16) q[125];
-rz(pi/8) q[128];
-cx q[128],q[126];
-rz(-pi/8) q[126];
-cx q[128],q[126];
-rz(pi/8) q[126];
-rz(pi/4) q[128];
-cx q[128],q[127];
-rz(-pi/4) q[127];
-cx q[128],q[127];
-rz(pi/4) q[127];
-rz(pi/2) q[128];
-sx q[128];
-rz(pi/2) q[128];
-rz(pi/1073741824) q[99];
-rz(1.42863093678434e-12) q[129];
-cx q[129],q[89];
-rz(-1.42863093678434e-12) q[89];
-cx q[129],q[89];
-rz(2.85726187356867e-12) q[129];
-cx q[129],q[90];
-rz(1.42863093678434e-12) q[89];
-rz(-2.85726187356867e-12) q[90];
-cx q[129],q[90];
-rz(5.71452374713734e-12) q[129];
-cx q[129],q[91];
-rz(2.85726187356867e-12) q[90];
-rz(-5.71452374713734e-12) q[91];
-cx q[129],q[91];
-rz(1.14290474942747e-11) q[129];
-cx q[129],q[92];
-rz(5.71452374713734e-12) q[91];
-rz(-1.14290474942747e-11) q[92];
-cx q[129],q[92];
-rz(2.28580949885494e-11) q[129];
-cx q[129],q[93];
-rz(1.14290474942747e-11) q[92];
-rz(-2.28580949885494e-11) q[93];
-cx q[129],q[93];
-rz(4.57161899770987e-11) q[129];
-cx q[129],q[94];
-rz(2.28580949885494e-11) q[93];
-rz(-4.57161899770987e-11) q[94];
-cx q[129],q[94];
-rz(9.14323799541975e-11) q[129];
-cx q[129],q[95];
-rz(4.57161899770987e-11) q[94];
-rz(-9.14323799541975e-11) q[95];
-cx q[129],q[95];
-rz(1.82864759908395e-10) q[129];
-cx q[129],q[96];
-rz(9.14323799541975e-11) q[95];
-rz(-1.82864759908395e-10) q[96];
-cx q[129],q[96];
-rz(3.6572951981679e-10) q[129];
-cx q[129],q[97];
-rz(1.82864759908395e-10) q[96];
-rz(-3.6572951981679e-10) q[97];
-cx q[129],q[97];
-rz(7.3145903963358e-10) q[129];
-cx q[129],q[98];
-rz(3.6572951981679e-10) q[97];
-rz(-7.3145903963358e-10) q[98];
-cx q[129],q[98];
-rz(pi/2147483648) q[129];
-cx q[129],q[99];
-rz(7.3145903963358e-10) q[98];
-rz(-pi/2147483648) q[99];
-cx q[129],q[99];
-rz(pi/1073741824) q[129];
-cx q[129],q[100];
-rz(-pi/1073741824) q[100];
-cx q[129],q[100];
-rz(pi/1073741824) q[100];
-rz(pi/536870912) q[129];
-cx q[129],q[101];
-rz(-pi/536870912) q[101];
-cx q[129],q[101];
-rz(pi/536870912) q[101];
-rz(pi/268435456) q[129];
-cx q[129],q[102];
-rz(-pi/268435456) q[102];
-cx q[129],q[102];
-rz(pi/268435456) q[102];
-rz(pi/134217728) q[129];
-cx q[129],q[103];
-rz(-pi/134217728) q[103];
-cx q[129],q[103];
-rz(pi/134217728) q[103];
-rz(pi/67108864) q[129];
-cx q[129],q[104];
-rz(-pi/67108864) q[104];
-cx q[129],q[104];
-rz(pi/67108864) q[104];
-rz(pi/33554432) q[129];
-cx q[129],q[105];
-rz(-pi/33554432) q[105];
-cx q[129],q[105];
-rz(pi/33554432) q[105];
-rz(pi/16777216) q[129];
-cx q[129],q[106];
-rz(-pi/16777216) q[106];
-cx q[129],q[106];
-rz(pi/16777216) q[106];
-rz(pi/8388608) q[129];
-cx q[129],q[107];
-rz(-pi/8388608) q[107];
-cx q[129],q[107];
-rz(pi/8388608) q[107];
-rz(pi/4194304) q[129];
-cx q[129],q[108];
-rz(-pi/4194304) q[108];
-cx q[129],q[108];
-rz(pi/4194304) q[108];
-rz(pi/2097152) q[129];
-cx q[129],q[109];
-rz(-pi/2097152) q[109];
-cx q[129],q[109];
-rz(pi/2097152) q[109];
-rz(pi/1048576) q[129];
-cx q[129],q[110];
-rz(-pi/1048576) q[110];
-cx q[129],q[110];
-rz(pi/1048576) q[110];
-rz(pi/524288) q[129];
-cx q[129],q[111];
-rz(-pi/524288) q[111];
-cx q[129],q[111];
-rz(pi/524288) q[111];
-rz(pi/262144) q[129];
-cx q[129],q[112];
-rz(-pi/262144) q[112];
-cx q[129],q[112];
-rz(pi/262144) q[112];
-rz(pi/131072) q[129];
-cx q[129],q[113];
-rz(-pi/131072) q[113];
-cx q[129],q[113];
-rz(pi/131072) q[113];
-rz(pi/65536) q[129];
-cx q[129],q[114];
-rz(-pi/65536) q[114];
-cx q[129],q[114];
-rz(pi/65536) q[114];
-rz(pi/32768) q[129];
-cx q[129],q[115];
-rz(-pi/32768) q[115];
-cx q[129],q[115];
-rz(pi/32768) q[115];
-rz(pi/16384) q[129];
-cx q[129],q[116];
-rz(-pi/16384) q[116];
-cx q[129],q[116];
-rz(pi/16384) q[116];
-rz(pi/8192) q[129];
-cx q[129],q[117];
-rz(-pi/8192) q[117];
-cx q[129],q[117];
-rz(pi/8192) q[117];
-rz(pi/4096) q[129];
-cx q[129],q[118];
-rz(-pi/4096) q[118];
-cx q[129],q[118];
-rz(pi/4096) q[118];
-rz(pi/2048) q[129];
-cx q[129],q[119];
-rz(-pi/2048) q[119];
-cx q[129],q[119];
-rz(pi/2048) q[119];
-rz(pi/1024) q[129];
-cx q[129],q[120];
-rz(-pi/1024) q[120];
-cx q[129],q[120];
-rz(pi/1024) q[120];
-rz(pi/512) q[129];
-cx q[129],q[121];
-rz(-pi/512) q[121];
-cx q[129],q[121];
-rz(pi/512) q[121];
-rz(pi/256) q[129];
-cx q[129],q[122];
-rz(-pi/256) q[122];
-cx q[129],q[122];
-rz(pi/256) q[122];
-rz(pi/128) q[129];
-cx q[129],q[123];
-rz(-pi/128) q[123];
-cx q[129],q[123];
-rz(pi/128) q[123];
-rz(pi/64) q[129];
-cx q[129],q[124];
-rz(-pi/64) q[124];
-cx q[129],q[124];
-rz(pi/64) q[124];
-rz(pi/32) q[129];
-cx q[129],q[125];
-rz(-pi/32) q[125];
-cx q[129],q[125];
-rz(pi/32) q[125];
-rz(pi/16) q[129];
-cx q[129],q[126];
-rz(-pi/16) q[126];
-cx q[129],q[126];
-rz(pi/16) q[126];
-rz(pi/8) q[129];
-cx q[129],q[127];
-rz(-pi/8) q[127];
-cx q[129],q[127];
-rz(pi/8) q[127];
-rz(pi/4) q[129];
-cx q[129],q[128];
-rz(-pi/4) q[128];
-cx q[129],q[128];
-rz(pi/4) q[128];
-rz(pi/2) q[129];
-sx q[129];
-rz(pi/2) q[129];
-rz(pi/2147483648) q[99];
-rz(1.42863093678434e-12) q[130];
-cx q[130],q[90];
-rz(-1.42863093678434e-12) q[90];
-cx q[130],q[90];
-rz(2.85726187356867e-12) q[130];
-cx q[130],q[91];
-rz(1.42863093678434e-12) q[90];
-rz(-2.85726187356867e-12) q[91];
-cx q[130],q[91];
-rz(5.71452374713734e-12) q[130];
-cx q[130],q[92];
-rz(2.85726187356867e-12) q[91];
-rz(-5.71452374713734e-12) q[92];
-cx q[130],q[92];
-rz(1.14290474942747e-11) q[130];
-cx q[130],q[93];
-rz(5.71452374713734e-12) q[92];
-rz(-1.14290474942747e-11) q[93];
-cx q[130],q[93];
-rz(2.28580949885494e-11) q[130];
-cx q[130],q[94];
-rz(1.14290474942747e-11) q[93];
-rz(-2.28580949885494e-11) q[94];
-cx q[130],q[94];
-rz(4.57161899770987e-11) q[130];
-cx q[130],q[95];
-rz(2.28580949885494e-11) q[94];
-rz(-4.57161899770987e-11) q[95];
-cx q[130],q[95];
-rz(9.14323799541975e-11) q[130];
-cx q[130],q[96];
-rz(4.57161899770987e-11) q[95];
-rz(-9.14323799541975e-11) q[96];
-cx q[130],q[96];
-rz(1.82864759908395e-10) q[130];
-cx q[130],q[97];
-rz(9.14323799541975e-11) q[96];
-rz(-1.82864759908395e-10) q[97];
-cx q[130],q[97];
-rz(3.6572951981679e-10) q[130];
-cx q[130],q[98];
-rz(1.82864759908395e-10) q[97];
-rz(-3.6572951981679e-10) q[98];
-cx q[130],q[98];
-rz(7.3145903963358e-10) q[130];
-cx q[130],q[99];
-rz(3.6572951981679e-10) q[98];
-rz(-7.3145903963358e-10) q[99];
-cx q[130],q[99];
-rz(pi/2147483648) q[130];
-cx q[130],q[100];
-rz(-pi/2147483648) q[100];
-cx q[130],q[100];
-rz(pi/2147483648) q[100];
-rz(pi/1073741824) q[130];
-cx q[130],q[101];
-rz(-pi/1073741824) q[101];
-cx q[130],q[101];
-rz(pi/1073741824) q[101];
-rz(pi/536870912) q[130];
-cx q[130],q[102];
-rz(-pi/536870912) q[102];
-cx q[130],q[102];
-rz(pi/536870912) q[102];
-rz(pi/268435456) q[130];
-cx q[130],q[103];
-rz(-pi/268435456) q[103];
-cx q[130],q[103];
-rz(pi/268435456) q[103];
-rz(pi/134217728) q[130];
-cx q[130],q[104];
-rz(-pi/134217728) q[104];
-cx q[130],q[104];
-rz(pi/134217728) q[104];
-rz(pi/67108864) q[130];
-cx q[130],q[105];
-rz(-pi/67108864) q[105];
-cx q[130],q[105];
-rz(pi/67108864) q[105];
-rz(pi/33554432) q[130];
-cx q[130],q[106];
-rz(-pi/33554432) q[106];
-cx q[130],q[106];
-rz(pi/33554432) q[106];
-rz(pi/16777216) q[130];
-cx q[130],q[107];
-rz(-pi/16777216) q[107];
-cx q[130],q[107];
-rz(pi/16777216) q[107];
-rz(pi/8388608) q[130];
-cx q[130],q[108];
-rz(-pi/8388608) q[108];
-cx q[130],q[108];
-rz(pi/8388608) q[108];
-rz(pi/4194304) q[130];
-cx q[130],q[109];
-rz(-pi/4194304) q[109];
-cx q[130],q[109];
-rz(pi/4194304) q[109];
-rz(pi/2097152) q[130];
-cx q[130],q[110];
-rz(-pi/2097152) q[110];
-cx q[130],q[110];
-rz(pi/2097152) q[110];
-rz(pi/1048576) q[130];
-cx q[130],q[111];
-rz(-pi/1048576) q[111];
-cx q[130],q[111];
-rz(pi/1048576) q[111];
-rz(pi/524288) q[130];
-cx q[130],q[112];
-rz(-pi/524288) q[112];
-cx q[130],q[112];
-rz(pi/524288) q[112];
-rz(pi/262144) q[130];
-cx q[130],q[113];
-rz(-pi/262144) q[113];
-cx q[130],q[113];
-rz(pi/262144) q[113];
-rz(pi/131072) q[130];
-cx q[130],q[114];
-rz(-pi/131072) q[114];
-cx q[130],q[114];
-rz(pi/131072) q[114];
-rz(pi/65536) q[130];
-cx q[130],q[115];
-rz(-pi/65536) q[115];
-cx q[130],q[115];
-rz(pi/65536) q[115];
-rz(pi/32768) q[130];
-cx q[130],q[116];
-rz(-pi/32768) q[116];
-cx q[130],q[116];
-rz(pi/32768) q[116];
-rz(pi/16384) q[130];
-cx q[130],q[117];
-rz(-pi/16384) q[117];
-cx q[130],q[117];
-rz(pi/16384) q[117];
-rz(pi/8192) q[130];
-cx q[130],q[118];
-rz(-pi/8192) q[118];
-cx q[130],q[118];
-rz(pi/8192) q[118];
-rz(pi/4096) q[130];
-cx q[130],q[119];
-rz(-pi/4096) q[119];
-cx q[130],q[119];
-rz(pi/4096) q[119];
-rz(pi/2048) q[130];
-cx q[130],q[120];
-rz(-pi/2048) q[120];
-cx q[130],q[120];
-rz(pi/2048) q[120];
-rz(pi/1024) q[130];
-cx q[130],q[121];
-rz(-pi/1024) q[121];
-cx q[130],q[121];
-rz(pi/1024) q[121];
-rz(pi/512) q[130];
-cx q[130],q[122];
-rz(-pi/512) q[122];
-cx q[130],q[122];
-rz(pi/512) q[122];
-rz(pi/256) q[130];
-cx q[130],q[123];
-rz(-pi/256) q[123];
-cx q[130],q[123];
-rz(pi/256) q[123];
-rz(pi/128) q[130];
-cx q[130],q[124];
-rz(-pi/128) q[124];
-cx q[130],q[124];
-rz(pi/128) q[124];
-rz(pi/64) q[130];
-cx q[130],q[125];
-rz(-pi/64) q[125];
-cx q[130],q[125];
-rz(pi/64) q[125];
-rz(pi/32) q[130];
-cx q[130],q[126];
-rz(-pi/32) q[126];
-cx q[130],q[126];
-rz(pi/32) q[126];
-rz(pi/16) q[130];
-cx q[130],q[127];
-rz(-pi/16) q[127];
-cx q[130],q[127];
-rz(pi/16) q[127];
-rz(pi/8) q[130];
-cx q[130],q[128];
-rz(-pi/8) q[128];
-cx q[130],q[128];
-rz(pi/8) q[128];
-rz(pi/4) q[130];
-cx q[130],q[129];
-rz(-pi/4) q[129];
-cx q[130],q[129];
-rz(pi/4) q[129];
-rz(pi/2) q[130];
-sx q[130];
-rz(pi/2) q[130];
-rz(7.3145903963358e-10) q[99];
-rz(1.42863093678434e-12) q[131];
-cx q[131],q[91];
-rz(-1.42863093678434e-12) q[91];
-cx q[131],q[91];
-rz(2.85726187356867e-12) q[131];
-cx q[131],q[92];
-rz(1.42863093678434e-12) q[91];
-rz(-2.85726187356867e-12) q[92];
-cx q[131],q[92];
-rz(5.71452374713734e-12) q[131];
-cx q[131],q[93];
-rz(2.85726187356867e-12) q[92];
-rz(-5.71452374713734e-12) q[93];
-cx q[131],q[93];
-rz(1.14290474942747e-11) q[131];
-cx q[131],q[94];
-rz(5.71452374713734e-12) q[93];
-rz(-1.14290474942747e-11) q[94];
-cx q[131],q[94];
-rz(2.28580949885494e-11) q[131];
-cx q[131],q[95];
-rz(1.14290474942747e-11) q[94];
-rz(-2.28580949885494e-11) q[95];
-cx q[131],q[95];
-rz(4.57161899770987e-11) q[131];
-cx q[131],q[96];
-rz(2.28580949885494e-11) q[95];
-rz(-4.57161899770987e-11) q[96];
-cx q[131],q[96];
-rz(9.14323799541975e-11) q[131];
-cx q[131],q[97];
-rz(4.57161899770987e-11) q[96];
-rz(-9.14323799541975e-11) q[97];
-cx q[131],q[97];
-rz(1.82864759908395e-10) q[131];
-cx q[131],q[98];
-rz(9.14323799541975e-11) q[97];
-rz(-1.82864759908395e-10) q[98];
-cx q[131],q[98];
-rz(3.6572951981679e-10) q[131];
-cx q[131],q[99];
-rz(1.82864759908395e-10) q[98];
-rz(-3.6572951981679e-10) q[99];
-cx q[131],q[99];
-rz(7.3145903963358e-10) q[131];
-cx q[131],q[100];
-rz(-7.3145903963358e-10) q[100];
-cx q[131],q[100];
-rz(7.3145903963358e-10) q[100];
-rz(pi/2147483648) q[131];
-cx q[131],q[101];
-rz(-pi/2147483648) q[101];
-cx q[131],q[101];
-rz(pi/2147483648) q[101];
-rz(pi/1073741824) q[131];
-cx q[131],q[102];
-rz(-pi/1073741824) q[102];
-cx q[131],q[102];
-rz(pi/1073741824) q[102];
-rz(pi/536870912) q[131];
-cx q[131],q[103];
-rz(-pi/536870912) q[103];
-cx q[131],q[103];
-rz(pi/536870912) q[103];
-rz(pi/268435456) q[131];
-cx q[131],q[104];
-rz(-pi/268435456) q[104];
-cx q[131],q[104];
-rz(pi/268435456) q[104];
-rz(pi/134217728) q[131];
-cx q[131],q[105];
-rz(-pi/134217728) q[105];
-cx q[131],q[105];
-rz(pi/134217728) q[105];
-rz(pi/67108864) q[131];
-cx q[131],q[106];
-rz(-pi/67108864) q[106];
-cx q[131],q[106];
-rz(pi/67108864) q[106];
-rz(pi/33554432) q[131];
-cx q[131],q[107];
-rz(-pi/33554432) q[107];
-cx q[131],q[107];
-rz(pi/33554432) q[107];
-rz(pi/16777216) q[131];
-cx q[131],q[108];
-rz(-pi/16777216) q[108];
-cx q[131],q[108];
-rz(pi/16777216) q[108];
-rz(pi/8388608) q[131];
-cx q[131],q[109];
-rz(-pi/8388608) q[109];
-cx q[131],q[109];
-rz(pi/8388608) q[109];
-rz(pi/4194304) q[131];
-cx q[131],q[110];
-rz(-pi/4194304) q[110];
-cx q[131],q[110];
-rz(pi/4194304) q[110];
-rz(pi/2097152) q[131];
-cx q[131],q[111];
-rz(-pi/2097152) q[111];
-cx q[131],q[111];
-rz(pi/2097152) q[111];
-rz(pi/1048576) q[131];
-cx q[131],q[112];
-rz(-pi/1048576) q[112];
-cx q[131],q[112];
-rz(pi/1048576) q[112];
-rz(pi/524288) q[131];
-cx q[131],q[113];
-rz(-pi/524288) q[113];
-cx q[131],q[113];
-rz(pi/524288) q[113];
-rz(pi/262144) q[131];
-cx q[131],q[114];
-rz(-pi/262144) q[114];
-cx q[131],q[114];
-rz(pi/262144) q[114];
-rz(pi/131072) q[131];
-cx q[131],q[115];
-rz(-pi/131072) q[115];
-cx q[131],q[115];
-rz(pi/131072) q[115];
-rz(pi/65536) q[131];
-cx q[131],q[116];
-rz(-pi/65536) q[116];
-cx q[131],q[116];
-rz(pi/65536) q[116];
-rz(pi/32768) q[131];
-cx q[131],q[117];
-rz(-pi/32768) q[117];
-cx q[131],q[117];
-rz(pi/32768) q[117];
-rz(pi/16384) q[131];
-cx q[131],q[118];
-rz(-pi/16384) q[118];
-cx q[131],q[118];
-rz(pi/16384) q[118];
-rz(pi/8192) q[131];
-cx q[131],q[119];
-rz(-pi/8192) q[119];
-cx q[131],q[119];
-rz(pi/8192) q[119];
-rz(pi/4096) q[131];
-cx q[131],q[120];
-rz(-pi/4096) q[120];
-cx q[131],q[120];
-rz(pi/4096) q[120];
-rz(pi/2048) q[131];
-cx q[131],q[121];
-rz(-pi/2048) q[121];
-cx q[131],q[121];
-rz(pi/2048) q[121];
-rz(pi/1024) q[131];
-cx q[131],q[122];
-rz(-pi/1024) q[122];
-cx q[131],q[122];
-rz(pi/1024) q[122];
-rz(pi/512) q[131];
-cx q[131],q[123];
-rz(-pi/512) q[123];
-cx q[131],q[123];
-rz(pi/512) q[123];
-rz(pi/256) q[131];
-cx q[131],q[124];
-rz(-pi/256) q[124];
-cx q[131],q[124];
-rz(pi/256) q[124];
-rz(pi/128) q[131];
-cx q[131],q[125];
-rz(-pi/128) q[125];
-cx q[131],q[125];
-rz(pi/128) q[125];
-rz(pi/64) q[131];
-cx q[131],q[126];
-rz(-pi/64) q[126];
-cx q[131],q[126];
-rz(pi/64) q[126];
-rz(pi/32) q[131];
-cx q[131],q[127];
-rz(-pi/32) q[127];
-cx q[131],q[127];
-rz(pi/32) q[127];
-rz(pi/16) q[131];
-cx q[131],q[128];
-rz(-pi/16) q[128];
-cx q[131],q[128];
-rz(pi/16) q[128];
-rz(pi/8) q[131];
-cx q[131],q[129];
-rz(-pi/8) q[129];
-cx q[131],q[129];
-rz(pi/8) q[129];
-rz(pi/4) q[131];
-cx q[131],q[130];
-rz(-pi/4) q[130];
-cx q[131],q[130];
-rz(pi/4) q[130];
-rz(pi/2) q[131];
-sx q[131];
-rz(pi/2) q[131];
-rz(3.6572951981679e-10) q[99];
-rz(1.42863093678434e-12) q[132];
-cx q[132],q[92];
-rz(-1.42863093678434e-12) q[92];
-cx q[132],q[92];
-rz(2.85726187356867e-12) q[132];
-cx q[132],q[93];
-rz(1.42863093678434e-12) q[92];
-rz(-2.85726187356867e-12) q[93];
-cx q[132],q[93];
-rz(5.71452374713734e-12) q[132];
-cx q[132],q[94];
-rz(2.85726187356867e-12) q[93];
-rz(-5.71452374713734e-12) q[94];
-cx q[132],q[94];
-rz(1.14290474942747e-11) q[132];
-cx q[132],q[95];
-rz(5.71452374713734e-12) q[94];
-rz(-1.14290474942747e-11) q[95];
-cx q[132],q[95];
-rz(2.28580949885494e-11) q[132];
-cx q[132],q[96];
-rz(1.14290474942747e-11) q[95];
-rz(-2.28580949885494e-11) q[96];
-cx q[132],q[96];
-rz(4.57161899770987e-11) q[132];
-cx q[132],q[97];
-rz(2.28580949885494e-11) q[96];
-rz(-4.57161899770987e-11) q[97];
-cx q[132],q[97];
-rz(9.14323799541975e-11) q[132];
-cx q[132],q[98];
-rz(4.57161899770987e-11) q[97];
-rz(-9.14323799541975e-11) q[98];
-cx q[132],q[98];
-rz(1.82864759908395e-10) q[132];
-cx q[132],q[99];
-rz(9.14323799541975e-11) q[98];
-rz(-1.82864759908395e-10) q[99];
-cx q[132],q[99];
-rz(3.6572951981679e-10) q[132];
-cx q[132],q[100];
-rz(-3.6572951981679e-10) q[100];
-cx q[132],q[100];
-rz(3.6572951981679e-10) q[100];
-rz(7.3145903963358e-10) q[132];
-cx q[132],q[101];
-rz(-7.3145903963358e-10) q[101];
-cx q[132],q[101];
-rz(7.3145903963358e-10) q[101];
-rz(pi/2147483648) q[132];
-cx q[132],q[102];
-rz(-pi/2147483648) q[102];
-cx q[132],q[102];
-rz(pi/2147483648) q[102];
-rz(pi/1073741824) q[132];
-cx q[132],q[103];
-rz(-pi/1073741824) q[103];
-cx q[132],q[103];
-rz(pi/1073741824) q[103];
-rz(pi/536870912) q[132];
-cx q[132],q[104];
-rz(-pi/536870912) q[104];
-cx q[132],q[104];
-rz(pi/536870912) q[104];
-rz(pi/268435456) q[132];
-cx q[132],q[105];
-rz(-pi/268435456) q[105];
-cx q[132],q[105];
-rz(pi/268435456) q[105];
-rz(pi/134217728) q[132];
-cx q[132],q[106];
-rz(-pi/134217728) q[106];
-cx q[132],q[106];
-rz(pi/134217728) q[106];
-rz(pi/67108864) q[132];
-cx q[132],q[107];
-rz(-pi/67108864) q[107];
-cx q[132],q[107];
-rz(pi/67108864) q[107];
-rz(pi/33554432) q[132];
-cx q[132],q[108];
-rz(-pi/33554432) q[108];
-cx q[132],q[108];
-rz(pi/33554432) q[108];
-rz(pi/16777216) q[132];
-cx q[132],q[109];
-rz(-pi/16777216) q[109];
-cx q[132],q[109];
-rz(pi/16777216) q[109];
-rz(pi/8388608) q[132];
-cx q[132],q[110];
-rz(-pi/8388608) q[110];
-cx q[132],q[110];
-rz(pi/8388608) q[110];
-rz(pi/4194304) q[132];
-cx q[132],q[111];
-rz(-pi/4194304) q[111];
-cx q[132],q[111];
-rz(pi/4194304) q[111];
-rz(pi/2097152) q[132];
-cx q[132],q[112];
-rz(-pi/2097152) q[112];
-cx q[132],q[112];
-rz(pi/2097152) q[112];
-rz(pi/1048576) q[132];
-cx q[132],q[113];
-rz(-pi/1048576) q[113];
-cx q[132],q[113];
-rz(pi/1048576) q[113];
-rz(pi/524288) q[132];
-cx q[132],q[114];
-rz(-pi/524288) q[114];
-cx q[132],q[114];
-rz(pi/524288) q[114];
-rz(pi/262144) q[132];
-cx q[132],q[115];
-rz(-pi/262144) q[115];
-cx q[132],q[115];
-rz(pi/262144) q[115];
-rz(pi/131072) q[132];
-cx q[132],q[116];
-rz(-pi/131072) q[116];
-cx q[132],q[116];
-rz(pi/131072) q[116];
-rz(pi/65536) q[132];
-cx q[132],q[117];
-rz(-pi/65536) q[117];
-cx q[132],q[117];
-rz(pi/65536) q[117];
-rz(pi/32768) q[132];
-cx q[132],q[118];
-rz(-pi/32768) q[118];
-cx q[132],q[118];
-rz(pi/32768) q[118];
-rz(pi/16384) q[132];
-cx q[132],q[119];
-rz(-pi/16384) q[119];
-cx q[132],q[119];
-rz(pi/16384) q[119];
-rz(pi/8192) q[132];
-cx q[132],q[120];
-rz(-pi/8192) q[120];
-cx q[132],q[120];
-rz(pi/8192) q[120];
-rz(pi/4096) q[132];
-cx q[132],q[121];
-rz(-pi/4096) q[121];
-cx q[132],q[121];
-rz(pi/4096) q[121];
-rz(pi/2048) q[132];
-cx q[132],q[122];
-rz(-pi/2048) q[122];
-cx q[132],q[122];
-rz(pi/2048) q[122];
-rz(pi/1024) q[132];
-cx q[132],q[123];
-rz(-pi/1024) q[123];
-cx q[132],q[123];
-rz(pi/1024) q[123];
-rz(pi/512) q[132];
-cx q[132],q[124];
-rz(-pi/512) q[124];
-cx q[132],q[124];
-rz(pi/512) q[124];
-rz(pi/256) q[132];
-cx q[132],q[125];
-rz(-pi/256) q[125];
-cx q[132],q[125];
-rz(pi/256) q[125];
-rz(pi/128) q[132];
-cx q[132],q[126];
-rz(-pi/128) q[126];
-cx q[132],q[126];
-rz(pi/128) q[126];
-rz(pi/64) q[132];
-cx q[132],q[127];
-rz(-pi/64) q[127];
-cx q[132],q[127];
-rz(pi/64) q[127];
-rz(pi/32) q[132];
-cx q[132],q[128];
-rz(-pi/32) q[128];
-cx q[132],q[128];
-rz(pi/32) q[128];
-rz(pi/16) q[132];
-cx q[132],q[129];
-rz(-pi/16) q[129];
-cx q[132],q[129];
-rz(pi/16) q[129];
-rz(pi/8) q[132];
-cx q[132],q[130];
-rz(-pi/8) q[130];
-cx q[132],q[130];
-rz(pi/8) q[130];
-rz(pi/4) q[132];
-cx q[132],q[131];
-rz(-pi/4) q[131];
-cx q[132],q[131];
-rz(pi/4) q[131];
-rz(pi/2) q[132];
-sx q[132];
-rz(pi/2) q[132];
-rz(1.82864759908395e-10) q[99];
-rz(1.42863093678434e-12) q[133];
-cx q[133],q[93];
-rz(-1.42863093678434e-12) q[93];
-cx q[133],q[93];
-rz(2.85726187356867e-12) q[133];
-cx q[133],q[94];
-rz(1.42863093678434e-12) q[93];
-rz(-2.85726187356867e-12) q[94];
-cx q[133],q[94];
-rz(5.71452374713734e-12) q[133];
-cx q[133],q[95];
-rz(2.85726187356867e-12) q[94];
-rz(-5.71452374713734e-12) q[95];
-cx q[133],q[95];
-rz(1.14290474942747e-11) q[133];
-cx q[133],q[96];
-rz(5.71452374713734e-12) q[95];
-rz(-1.14290474942747e-11) q[96];
-cx q[133],q[96];
-rz(2.28580949885494e-11) q[133];
-cx q[133],q[97];
-rz(1.14290474942747e-11) q[96];
-rz(-2.28580949885494e-11) q[97];
-cx q[133],q[97];
-rz(4.57161899770987e-11) q[133];
-cx q[133],q[98];
-rz(2.28580949885494e-11) q[97];
-rz(-4.57161899770987e-11) q[98];
-cx q[133],q[98];
-rz(9.14323799541975e-11) q[133];
-cx q[133],q[99];
-rz(4.57161899770987e-11) q[98];
-rz(-9.14323799541975e-11) q[99];
-cx q[133],q[99];
-rz(1.82864759908395e-10) q[133];
-cx q[133],q[100];
-rz(-1.82864759908395e-10) q[100];
-cx q[133],q[100];
-rz(1.82864759908395e-10) q[100];
-rz(3.6572951981679e-10) q[133];
-cx q[133],q[101];
-rz(-3.6572951981679e-10) q[101];
-cx q[133],q[101];
-rz(3.6572951981679e-10) q[101];
-rz(7.3145903963358e-10) q[133];
-cx q[133],q[102];
-rz(-7.3145903963358e-10) q[102];
-cx q[133],q[102];
-rz(7.3145903963358e-10) q[102];
-rz(pi/2147483648) q[133];
-cx q[133],q[103];
-rz(-pi/2147483648) q[103];
-cx q[133],q[103];
-rz(pi/2147483648) q[103];
-rz(pi/1073741824) q[133];
-cx q[133],q[104];
-rz(-pi/1073741824) q[104];
-cx q[133],q[104];
-rz(pi/1073741824) q[104];
-rz(pi/536870912) q[133];
-cx q[133],q[105];
-rz(-pi/536870912) q[105];
-cx q[133],q[105];
-rz(pi/536870912) q[105];
-rz(pi/268435456) q[133];
-cx q[133],q[106];
-rz(-pi/268435456) q[106];
-cx q[133],q[106];
-rz(pi/268435456) q[106];
-rz(pi/134217728) q[133];
-cx q[133],q[107];
-rz(-pi/134217728) q[107];
-cx q[133],q[107];
-rz(pi/134217728) q[107];
-rz(pi/67108864) q[133];
-cx q[133],q[108];
-rz(-pi/67108864) q[108];
-cx q[133],q[108];
-rz(pi/67108864) q[108];
-rz(pi/33554432) q[133];
-cx q[133],q[109];
-rz(-pi/33554432) q[109];
-cx q[133],q[109];
-rz(pi/33554432) q[109];
-rz(pi/16777216) q[133];
-cx q[133],q[110];
-rz(-pi/16777216) q[110];
-cx q[133],q[110];
-rz(pi/16777216) q[110];
-rz(pi/8388608) q[133];
-cx q[133],q[111];
-rz(-pi/8388608) q[111];
-cx q[133],q[111];
-rz(pi/8388608) q[111];
-rz(pi/4194304) q[133];
-cx q[133],q[112];
-rz(-pi/4194304) q[112];
-cx q[133],q[112];
-rz(pi/4194304) q[112];
-rz(pi/2097152) q[133];
-cx q[133],q[113];
-rz(-pi/2097152) q[113];
-cx q[133],q[113];
-rz(pi/2097152) q[113];
-rz(pi/1048576) q[133];
-cx q[133],q[114];
-rz(-pi/1048576) q[114];
-cx q[133],q[114];
-rz(pi/1048576) q[114];
-rz(pi/524288) q[133];
-cx q[133],q[115];
-rz(-pi/524288) q[115];
-cx q[133],q[115];
-rz(pi/524288) q[115];
-rz(pi/262144) q[133];
-cx q[133],q[116];
-rz(-pi/262144) q[116];
-cx q[133],q[116];
-rz(pi/262144) q[116];
-rz(pi/131072) q[133];
-cx q[133],q[117];
-rz(-pi/131072) q[117];
-cx q[133],q[117];
-rz(pi/131072) q[117];
-rz(pi/65536) q[133];
-cx q[133],q[118];
-rz(-pi/65536) q[118];
-cx q[133],q[118];
-rz(pi/65536) q[118];
-rz(pi/32768) q[133];
-cx q[133],q[119];
-rz(-pi/32768) q[119];
-cx q[133],q[119];
-rz(pi/32768) q[119];
-rz(pi/16384) q[133];
-cx q[133],q[120];
-rz(-pi/16384) q[120];
-cx q[133],q[120];
-rz(pi/16384) q[120];
-rz(pi/8192) q[133];
-cx q[133],q[121];
-rz(-pi/8192) q[121];
-cx q[133],q[121];
-rz(pi/8192) q[121];
-rz(pi/4096) q[133];
-cx q[133],q[122];
-rz(-pi/4096) q[122];
-cx q[133],q[122];
-rz(pi/4096) q[122];
-rz(pi/2048) q[133];
-cx q[133],q[123];
-rz(-pi/2048) q[123];
-cx q[133],q[123];
-rz(pi/2048) q[123];
-rz(pi/1024) q[133];
-cx q[133],q[124];
-rz(-pi/1024) q[124];
-cx q[133],q[124];
-rz(pi/1024) q[124];
-rz(pi/512) q[133];
-cx q[133],q[125];
-rz(-pi/512) q[125];
-cx q[133],q[125];
-rz(pi/512) q[125];
-rz(pi/256) q[133];
-cx q[133],q[126];
-rz(-pi/256) q[126];
-cx q[133],q[126];
-rz(pi/256) q[126];
-rz(pi/128) q[133];
-cx q[133],q[127];
-rz(-pi/128) q[127];
-cx q[133],q[127];
-rz(pi/128) q[127];
-rz(pi/64) q[133];
-cx q[133],q[128];
-rz(-pi/64) q[128];
-cx q[133],q[128];
-rz(pi/64) q[128];
-rz(pi/32) q[133];
-cx q[133],q[129];
-rz(-pi/32) q[129];
-cx q[133],q[129];
-rz(pi/32) q[129];
-rz(pi/16) q[133];
-cx q[133],q[130];
-rz(-pi/16) q[130];
-cx q[133],q[130];
-rz(pi/16) q[130];
-rz(pi/8) q[133];
-cx q[133],q[131];
-rz(-pi/8) q[131];
-cx q[133],q[131];
-rz(pi/8) q[131];
-rz(pi/4) q[133];
-cx q[133],q[132];
-rz(-pi/4) q[132];
-cx q[133],q[132];
-rz(pi/4) q[132];
-rz(pi/2) q[133];
-sx q[133];
-rz(pi/2) q[133];
-rz(9.14323799541975e-11) q[99];
-rz(1.42863093678434e-12) q[134];
-cx q[134],q[94];
-rz(-1.42863093678434e-12) q[94];
-cx q[134],q[94];
-rz(2.85726187356867e-12) q[134];
-cx q[134],q[95];
-rz(1.42863093678434e-12) q[94];
-rz(-2.85726187356867e-12) q[95];
-cx q[134],q[95];
-rz(5.71452374713734e-12) q[134];
-cx q[134],q[96];
-rz(2.85726187356867e-12) q[95];
-rz(-5.71452374713734e-12) q[96];
-cx q[134],q[96];
-rz(1.14290474942747e-11) q[134];
-cx q[134],q[97];
-rz(5.71452374713734e-12) q[96];
-rz(-1.14290474942747e-11) q[97];
-cx q[134],q[97];
-rz(2.28580949885494e-11) q[134];
-cx q[134],q[98];
-rz(1.14290474942747e-11) q[97];
-rz(-2.28580949885494e-11) q[98];
-cx q[134],q[98];
-rz(4.57161899770987e-11) q[134];
-cx q[134],q[99];
-rz(2.28580949885494e-11) q[98];
-rz(-4.57161899770987e-11) q[99];
-cx q[134],q[99];
-rz(9.14323799541975e-11) q[134];
-cx q[134],q[100];
-rz(-9.14323799541975e-11) q[100];
-cx q[134],q[100];
-rz(9.14323799541975e-11) q[100];
-rz(1.82864759908395e-10) q[134];
-cx q[134],q[101];
-rz(-1.82864759908395e-10) q[101];
-cx q[134],q[101];
-rz(1.82864759908395e-10) q[101];
-rz(3.6572951981679e-10) q[134];
-cx q[134],q[102];
-rz(-3.6572951981679e-10) q[102];
-cx q[134],q[102];
-rz(3.6572951981679e-10) q[102];
-rz(7.3145903963358e-10) q[134];
-cx q[134],q[103];
-rz(-7.3145903963358e-10) q[103];
-cx q[134],q[103];
-rz(7.3145903963358e-10) q[103];
-rz(pi/2147483648) q[134];
-cx q[134],q[104];
-rz(-pi/2147483648) q[104];
-cx q[134],q[104];
-rz(pi/2147483648) q[104];
-rz(pi/1073741824) q[134];
-cx q[134],q[105];
-rz(-pi/1073741824) q[105];
-cx q[134],q[105];
-rz(pi/1073741824) q[105];
-rz(pi/536870912) q[134];
-cx q[134],q[106];
-rz(-pi/536870912) q[106];
-cx q[134],q[106];
-rz(pi/536870912) q[106];
-rz(pi/268435456) q[134];
-cx q[134],q[107];
-rz(-pi/268435456) q[107];
-cx q[134],q[107];
-rz(pi/268435456) q[107];
-rz(pi/134217728) q[134];
-cx q[134],q[108];
-rz(-pi/134217728) q[108];
-cx q[134],q[108];
-rz(pi/134217728) q[108];
-rz(pi/67108864) q[134];
-cx q[134],q[109];
-rz(-pi/67108864) q[109];
-cx q[134],q[109];
-rz(pi/67108864) q[109];
-rz(pi/33554432) q[134];
-cx q[134],q[110];
-rz(-pi/33554432) q[110];
-cx q[134],q[110];
-rz(pi/33554432) q[110];
-rz(pi/16777216) q[134];
-cx q[134],q[111];
-rz(-pi/16777216) q[111];
-cx q[134],q[111];
-rz(pi/16777216) q[111];
-rz(pi/8388608) q[134];
-cx q[134],q[112];
-rz(-pi/8388608) q[112];
-cx q[134],q[112];
-rz(pi/8388608) q[112];
-rz(pi/4194304) q[134];
-cx q[134],q[113];
-rz(-pi/4194304) q[113];
-cx q[134],q[113];
-rz(pi/4194304) q[113];
-rz(pi/2097152) q[134];
-cx q[134],q[114];
-rz(-pi/2097152) q[114];
-cx q[134],q[114];
-rz(pi/2097152) q[114];
-rz(pi/1048576) q[134];
-cx q[134],q[115];
-rz(-pi/1048576) q[115];
-cx q[134],q[115];
-rz(pi/1048576) q[115];
-rz(pi/524288) q[134];
-cx q[134],q[116];
-rz(-pi/524288) q[116];
-cx q[134],q[116];
-rz(pi/524288) q[116];
-rz(pi/262144) q[134];
-cx q[134],q[117];
-rz(-pi/262144) q[117];
-cx q[134],q[117];
-rz(pi/262144) q[117];
-rz(pi/131072) q[134];
-cx q[134],q[118];
-rz(-pi/131072) q[118];
-cx q[134],q[118];
-rz(pi/131072) q[118];
-rz(pi/65536) q[134];
-cx q[134],q[119];
-rz(-pi/65536) q[119];
-cx q[134],q[119];
-rz(pi/65536) q[119];
-rz(pi/32768) q[134];
-cx q[134],q[120];
-rz(-pi/32768) q[120];
-cx q[134],q[120];
-rz(pi/32768) q[120];
-rz(pi/16384) q[134];
-cx q[134],q[121];
-rz(-pi/16384) q[121];
-cx q[134],q[121];
-rz(pi/16384) q[121];
-rz(pi/8192) q[134];
-cx q[134],q[122];
-rz(-pi/8192) q[122];
-cx q[134],q[122];
-rz(pi/8192) q[122];
-rz(pi/4096) q[134];
-cx q[134],q[123];
-rz(-pi/4096) q[123];
-cx q[134],q[123];
-rz(pi/4096) q[123];
-rz(pi/2048) q[134];
-cx q[134],q[124];
-rz(-pi/2048) q[124];
-cx q[134],q[124];
-rz(pi/2048) q[124];
-rz(pi/1024) q[134];
-cx q[134],q[125];
-rz(-pi/1024) q[125];
-cx q[134],q[125];
-rz(pi/1024) q[125];
-rz(pi/512) q[134];
-cx q[134],q[126];
-rz(-pi/512) q[126];
-cx q[134],q[126];
-rz(pi/512) q[126];
-rz(pi/256) q[134];
-cx q[134],q[127];
-rz(-pi/256) q[127];
-cx q[134],q[127];
-rz(pi/256) q[127];
-rz(pi/128) q[134];
-cx q[134],q[128];
-rz(-pi/128) q[128];
-cx q[134],q[128];
-rz(pi/128) q[128];
-rz(pi/64) q[134];
-cx q[134],q[129];
-rz(-pi/64) q[129];
-cx q[134],q[129];
-rz(pi/64) q[129];
-rz(pi/32) q[134];
-cx q[134],q[130];
-rz(-pi/32) q[130];
-cx q[134],q[130];
-rz(pi/32) q[130];
-rz(pi/16) q[134];
-cx q[134],q[131];
-rz(-pi/16) q[131];
-cx q[134],q[131];
-rz(pi/16) q[131];
-rz(pi/8) q[134];
-cx q[134],q[132];
-rz(-pi/8) q[132];
-cx q[134],q[132];
-rz(pi/8) q[132];
-rz(pi/4) q[134];
-cx q[134],q[133];
-rz(-pi/4) q[133];
-cx q[134],q[133];
-rz(pi/4) q[133];
-rz(pi/2) q[134];
-sx q[134];
-rz(pi/2) q[134];
-rz(4.57161899770987e-11) q[99];
-rz(1.42863093678434e-12) q[135];
-cx q[135],q[95];
-rz(-1.42863093678434e-12) q[95];
-cx q[135],q[95];
-rz(2.85726187356867e-12) q[135];
-cx q[135],q[96];
-rz(1.42863093678434e-12) q[95];
-rz(-2.85726187356867e-12) q[96];
-cx q[135],q[96];
-rz(5.71452374713734e-12) q[135];
-cx q[135],q[97];
-rz(2.85726187356867e-12) q[96];
-rz(-5.71452374713734e-12) q[97];
-cx q[135],q[97];
-rz(1.14290474942747e-11) q[135];
-cx q[135],q[98];
-rz(5.71452374713734e-12) q[97];
-rz(-1.14290474942747e-11) q[98];
-cx q[135],q[98];
-rz(2.28580949885494e-11) q[135];
-cx q[135],q[99];
-rz(1.14290474942747e-11) q[98];
-rz(-2.28580949885494e-11) q[99];
-cx q[135],q[99];
-rz(4.57161899770987e-11) q[135];
-cx q[135],q[100];
-rz(-4.57161899770987e-11) q[100];
-cx q[135],q[100];
-rz(4.57161899770987e-11) q[100];
-rz(9.14323799541975e-11) q[135];
-cx q[135],q[101];
-rz(-9.14323799541975e-11) q[101];
-cx q[135],q[101];
-rz(9.14323799541975e-11) q[101];
-rz(1.82864759908395e-10) q[135];
-cx q[135],q[102];
-rz(-1.82864759908395e-10) q[102];
-cx q[135],q[102];
-rz(1.82864759908395e-10) q[102];
-rz(3.6572951981679e-10) q[135];
-cx q[135],q[103];
-rz(-3.6572951981679e-10) q[103];
-cx q[135],q[103];
-rz(3.6572951981679e-10) q[103];
-rz(7.3145903963358e-10) q[135];
-cx q[135],q[104];
-rz(-7.3145903963358e-10) q[104];
-cx q[135],q[104];
-rz(7.3145903963358e-10) q[104];
-rz(pi/2147483648) q[135];
-cx q[135],q[105];
-rz(-pi/2147483648) q[105];
-cx q[135],q[105];
-rz(pi/2147483648) q[105];
-rz(pi/1073741824) q[135];
-cx q[135],q[106];
-rz(-pi/1073741824) q[106];
-cx q[135],q[106];
-rz(pi/1073741824) q[106];
-rz(pi/536870912) q[135];
-cx q[135],q[107];
-rz(-pi/536870912) q[107];
-cx q[135],q[107];
-rz(pi/536870912) q[107];
-rz(pi/268435456) q[135];
-cx q[135],q[108];
-rz(-pi/268435456) q[108];
-cx q[135],q[108];
-rz(pi/268435456) q[108];
-rz(pi/134217728) q[135];
-cx q[135],q[109];
-rz(-pi/134217728) q[109];
-cx q[135],q[109];
-rz(pi/134217728) q[109];
-rz(pi/67108864) q[135];
-cx q[135],q[110];
-rz(-pi/67108864) q[110];
-cx q[135],q[110];
-rz(pi/67108864) q[110];
-rz(pi/33554432) q[135];
-cx q[135],q[111];
-rz(-pi/33554432) q[111];
-cx q[135],q[111];
-rz(pi/33554432) q[111];
-rz(pi/16777216) q[135];
-cx q[135],q[112];
-rz(-pi/16777216) q[112];
-cx q[135],q[112];
-rz(pi/16777216) q[112];
-rz(pi/8388608) q[135];
-cx q[135],q[113];
-rz(-pi/8388608) q[113];
-cx q[135],q[113];
-rz(pi/8388608) q[113];
-rz(pi/4194304) q[135];
-cx q[135],q[114];
-rz(-pi/4194304) q[114];
-cx q[135],q[114];
-rz(pi/4194304) q[114];
-rz(pi/2097152) q[135];
-cx q[135],q[115];
-rz(-pi/2097152) q[115];
-cx q[135],q[115];
-rz(pi/2097152) q[115];
-rz(pi/1048576) q[135];
-cx q[135],q[116];
-rz(-pi/1048576) q[116];
-cx q[135],q[116];
-rz(pi/1048576) q[116];
-rz(pi/524288) q[135];
-cx q[135],q[117];
-rz(-pi/524288) q[117];
-cx q[135],q[117];
-rz(pi/524288) q[117];
-rz(pi/262144) q[135];
-cx q[135],q[118];
-rz(-pi/262144) q[118];
-cx q[135],q[118];
-rz(pi/262144) q[118];
-rz(pi/131072) q[135];
-cx q[135],q[119];
-rz(-pi/131072) q[119];
-cx q[135],q[119];
-rz(pi/131072) q[119];
-rz(pi/65536) q[135];
-cx q[135],q[120];
-rz(-pi/65536) q[120];
-cx q[135],q[120];
-rz(pi/65536) q[120];
-rz(pi/32768) q[135];
-cx q[135],q[121];
-rz(-pi/32768) q[121];
-cx q[135],q[121];
-rz(pi/32768) q[121];
-rz(pi/16384) q[135];
-cx q[135],q[122];
-rz(-pi/16384) q[122];
-cx q[135],q[122];
-rz(pi/16384) q[122];
-rz(pi/8192) q[135];
-cx q[135],q[123];
-rz(-pi/8192) q[123];
-cx q[135],q[123];
-rz(pi/8192) q[123];
-rz(pi/4096) q[135];
-cx q[135],q[124];
-rz(-pi/4096) q[124];
-cx q[135],q[124];
-rz(pi/4096) q[124];
-rz(pi/2048) q[135];
-cx q[135],q[125];
-rz(-pi/2048) q[125];
-cx q[135],q[125];
-rz(pi/2048) q[125];
-rz(pi/1024) q[135];
-cx q[135],q[126];
-rz(-pi/1024) q[126];
-cx q[135],q[126];
-rz(pi/1024) q[126];
-rz(pi/512) q[135];
-cx q[135],q[127];
-rz(-pi/512) q[127];
-cx q[135],q[127];
-rz(pi/512) q[127];
-rz(pi/256) q[135];
-cx q[135],q[128];
-rz(-pi/256) q[128];
-cx q[135],q[128];
-rz(pi/256) q[128];
-rz(pi/128) q[135];
-cx q[135],q[129];
-rz(-pi/128) q[129];
-cx q[135],q[129];
-rz(pi/128) q[129];
-rz(pi/64) q[135];
-cx q[135],q[130];
-rz(-pi/64) q[130];
-cx q[135],q[130];
-rz(pi/64) q[130];
-rz(pi/32) q[135];
-cx q[135],q[131];
-rz(-pi/32) q[131];
-cx q[135],q[131];
-rz(pi/32) q[131];
-rz(pi/16) q[135];
-cx q[135],q[132];
-rz(-pi/16) q[132];
-cx q[135],q[132];
-rz(pi/16) q[132];
-rz(pi/8) q[135];
-cx q[135],q[133];
-rz(-pi/8) q[133];
-cx q[135],q[133];
-rz(pi/8) q[133];
-rz(pi/4) q[135];
-cx q[135],q[134];
-rz(-pi/4) q[134];
-cx q[135],q[134];
-rz(pi/4) q[134];
-rz(pi/2) q[135];
-sx q[135];
-rz(pi/2) q[135];
-rz(2.28580949885494e-11) q[99];
-rz(1.42863093678434e-12) q[136];
-cx q[136],q[96];
-rz(-1.42863093678434e-12) q[96];
-cx q[136],q[96];
-rz(2.85726187356867e-12) q[136];
-cx q[136],q[97];
-rz(1.42863093678434e-12) q[96];
-rz(-2.85726187356867e-12) q[97];
-cx q[136],q[97];
-rz(5.71452374713734e-12) q[136];
-cx q[136],q[98];
-rz(2.85726187356867e-12) q[97];
-rz(-5.71452374713734e-12) q[98];
-cx q[136],q[98];
-rz(1.14290474942747e-11) q[136];
-cx q[136],q[99];
-rz(5.71452374713734e-12) q[98];
-rz(-1.14290474942747e-11) q[99];
-cx q[136],q[99];
-rz(2.28580949885494e-11) q[136];
-cx q[136],q[100];
-rz(-2.28580949885494e-11) q[100];
-cx q[136],q[100];
-rz(2.28580949885494e-11) q[100];
-rz(4.57161899770987e-11) q[136];
-cx q[136],q[101];
-rz(-4.57161899770987e-11) q[101];
-cx q[136],q[101];
-rz(4.57161899770987e-11) q[101];
-rz(9.14323799541975e-11) q[136];
-cx q[136],q[102];
-rz(-9.14323799541975e-11) q[102];
-cx q[136],q[102];
-rz(9.14323799541975e-11) q[102];
-rz(1.82864759908395e-10) q[136];
-cx q[136],q[103];
-rz(-1.82864759908395e-10) q[103];
-cx q[136],q[103];
-rz(1.82864759908395e-10) q[103];
-rz(3.6572951981679e-10) q[136];
-cx q[136],q[104];
-rz(-3.6572951981679e-10) q[104];
-cx q[136],q[104];
-rz(3.6572951981679e-10) q[104];
-rz(7.3145903963358e-10) q[136];
-cx q[136],q[105];
-rz(-7.3145903963358e-10) q[105];
-cx q[136],q[105];
-rz(7.3145903963358e-10) q[105];
-rz(pi/2147483648) q[136];
-cx q[136],q[106];
-rz(-pi/2147483648) q[106];
-cx q[136],q[106];
-rz(pi/2147483648) q[106];
-rz(pi/1073741824) q[136];
-cx q[136],q[107];
-rz(-pi/1073741824) q[107];
-cx q[136],q[107];
-rz(pi/1073741824) q[107];
-rz(pi/536870912) q[136];
-cx q[136],q[108];
-rz(-pi/536870912) q[108];
-cx q[136],q[108];
-rz(pi/536870912) q[108];
-rz(pi/268435456) q[136];
-cx q[136],q[109];
-rz(-pi/268435456) q[109];
-cx q[136],q[109];
-rz(pi/268435456) q[109];
-rz(pi/134217728) q[136];
-cx q[136],q[110];
-rz(-pi/134217728) q[110];
-cx q[136],q[110];
-rz(pi/134217728) q[110];
-rz(pi/67108864) q[136];
-cx q[136],q[111];
-rz(-pi/67108864) q[111];
-cx q[136],q[111];
-rz(pi/67108864) q[111];
-rz(pi/33554432) q[136];
-cx q[136],q[112];
-rz(-pi/33554432) q[112];
-cx q[136],q[112];
-rz(pi/33554432) q[112];
-rz(pi/16777216) q[136];
-cx q[136],q[113];
-rz(-pi/16777216) q[113];
-cx q[136],q[113];
-rz(pi/16777216) q[113];
-rz(pi/8388608) q[136];
-cx q[136],q[114];
-rz(-pi/8388608) q[114];
-cx q[136],q[114];
-rz(pi/8388608) q[114];
-rz(pi/4194304) q[136];
-cx q[136],q[115];
-rz(-pi/4194304) q[115];
-cx q[136],q[115];
-rz(pi/4194304) q[115];
-rz(pi/2097152) q[136];
-cx q[136],q[116];
-rz(-pi/2097152) q[116];
-cx q[136],q[116];
-rz(pi/2097152) q[116];
-rz(pi/1048576) q[136];
-cx q[136],q[117];
-rz(-pi/1048576) q[117];
-cx q[136],q[117];
-rz(pi/1048576) q[117];
-rz(pi/524288) q[136];
-cx q[136],q[118];
-rz(-pi/524288) q[118];
-cx q[136],q[118];
-rz(pi/524288) q[118];
-rz(pi/262144) q[136];
-cx q[136],q[119];
-rz(-pi/262144) q[119];
-cx q[136],q[119];
-rz(pi/262144) q[119];
-rz(pi/131072) q[136];
-cx q[136],q[120];
-rz(-pi/131072) q[120];
-cx q[136],q[120];
-rz(pi/131072) q[120];
-rz(pi/65536) q[136];
-cx q[136],q[121];
-rz(-pi/65536) q[121];
-cx q[136],q[121];
-rz(pi/65536) q[121];
-rz(pi/32768) q[136];
-cx q[136],q[122];
-rz(-pi/32768) q[122];
-cx q[136],q[122];
-rz(pi/32768) q[122];
-rz(pi/16384) q[136];
-cx q[136],q[123];
-rz(-pi/16384) q[123];
-cx q[136],q[123];
-rz(pi/16384) q[123];
-rz(pi/8192) q[136];
-cx q[136],q[124];
-rz(-pi/8192) q[124];
-cx q[136],q[124];
-rz(pi/8192) q[124];
-rz(pi/4096) q[136];
-cx q[136],q[125];
-rz(-pi/4096) q[125];
-cx q[136],q[125];
-rz(pi/4096) q[125];
-rz(pi/2048) q[136];
-cx q[136],q[126];
-rz(-pi/2048) q[126];
-cx q[136],q[126];
-rz(pi/2048) q[126];
-rz(pi/1024) q[136];
-cx q[136],q[127];
-rz(-pi/1024) q[127];
-cx q[136],q[127];
-rz(pi/1024) q[127];
-rz(pi/512) q[136];
-cx q[136],q[128];
-rz(-pi/512) q[128];
-cx q[136],q[128];
-rz(pi/512) q[128];
-rz(pi/256) q[136];
-cx q[136],q[129];
-rz(-pi/256) q[129];
-cx q[136],q[129];
-rz(pi/256) q[129];
-rz(pi/128) q[136];
-cx q[136],q[130];
-rz(-pi/128) q[130];
-cx q[136],q[130];
-rz(pi/128) q[130];
-rz(pi/64) q[136];
-cx q[136],q[131];
-rz(-pi/64) q[131];
-cx q[136],q[131];
-rz(pi/64) q[131];
-rz(pi/32) q[136];
-cx q[136],q[132];
-rz(-pi/32) q[132];
-cx q[136],q[132];
-rz(pi/32) q[132];
-rz(pi/16) q[136];
-cx q[136],q[133];
-rz(-pi/16) q[133];
-cx q[136],q[133];
-rz(pi/16) q[133];
-rz(pi/8) q[136];
-cx q[136],q[134];
-rz(-pi/8) q[134];
-cx q[136],q[134];
-rz(pi/8) q[134];
-rz(pi/4) q[136];
-cx q[136],q[135];
-rz(-pi/4) q[135];
-cx q[136],q[135];
-rz(pi/4) q[135];
-rz(pi/2) q[136];
-sx q[136];
-rz(pi/2) q[136];
-rz(1.14290474942747e-11) q[99];
-rz(1.42863093678434e-12) q[137];
-cx q[137],q[97];
-rz(-1.42863093678434e-12) q[97];
-cx q[137],q[97];
-rz(2.85726187356867e-12) q[137];
-cx q[137],q[98];
-rz(1.42863093678434e-12) q[97];
-rz(-2.85726187356867e-12) q[98];
-cx q[137],q[98];
-rz(5.71452374713734e-12) q[137];
-cx q[137],q[99];
-rz(2.85726187356867e-12) q[98];
-rz(-5.71452374713734e-12) q[99];
-cx q[137],q[99];
-rz(1.14290474942747e-11) q[137];
-cx q[137],q[100];
-rz(-1.14290474942747e-11) q[100];
-cx q[137],q[100];
-rz(1.14290474942747e-11) q[100];
-rz(2.28580949885494e-11) q[137];
-cx q[137],q[101];
-rz(-2.28580949885494e-11) q[101];
-cx q[137],q[101];
-rz(2.28580949885494e-11) q[101];
-rz(4.57161899770987e-11) q[137];
-cx q[137],q[102];
-rz(-4.57161899770987e-11) q[102];
-cx q[137],q[102];
-rz(4.57161899770987e-11) q[102];
-rz(9.14323799541975e-11) q[137];
-cx q[137],q[103];
-rz(-9.14323799541975e-11) q[103];
-cx q[137],q[103];
-rz(9.14323799541975e-11) q[103];
-rz(1.82864759908395e-10) q[137];
-cx q[137],q[104];
-rz(-1.82864759908395e-10) q[104];
-cx q[137],q[104];
-rz(1.82864759908395e-10) q[104];
-rz(3.6572951981679e-10) q[137];
-cx q[137],q[105];
-rz(-3.6572951981679e-10) q[105];
-cx q[137],q[105];
-rz(3.6572951981679e-10) q[105];
-rz(7.3145903963358e-10) q[137];
-cx q[137],q[106];
-rz(-7.3145903963358e-10) q[106];
-cx q[137],q[106];
-rz(7.3145903963358e-10) q[106];
-rz(pi/2147483648) q[137];
-cx q[137],q[107];
-rz(-pi/2147483648) q[107];
-cx q[137],q[107];
-rz(pi/2147483648) q[107];
-rz(pi/1073741824) q[137];
-cx q[137],q[108];
-rz(-pi/1073741824) q[108];
-cx q[137],q[108];
-rz(pi/1073741824) q[108];
-rz(pi/536870912) q[137];
-cx q[137],q[109];
-rz(-pi/536870912) q[109];
-cx q[137],q[109];
-rz(pi/536870912) q[109];
-rz(pi/268435456) q[137];
-cx q[137],q[110];
-rz(-pi/268435456) q[110];
-cx q[137],q[110];
-rz(pi/268435456) q[110];
-rz(pi/134217728) q[137];
-cx q[137],q[111];
-rz(-pi/134217728) q[111];
-cx q[137],q[111];
-rz(pi/134217728) q[111];
-rz(pi/67108864) q[137];
-cx q[137],q[112];
-rz(-pi/67108864) q[112];
-cx q[137],q[112];
-rz(pi/67108864) q[112];
-rz(pi/33554432) q[137];
-cx q[137],q[113];
-rz(-pi/33554432) q[113];
-cx q[137],q[113];
-rz(pi/33554432) q[113];
-rz(pi/16777216) q[137];
-cx q[137],q[114];
-rz(-pi/16777216) q[114];
-cx q[137],q[114];
-rz(pi/16777216) q[114];
-rz(pi/8388608) q[137];
-cx q[137],q[115];
-rz(-pi/8388608) q[115];
-cx q[137],q[115];
-rz(pi/8388608) q[115];
-rz(pi/4194304) q[137];
-cx q[137],q[116];
-rz(-pi/4194304) q[116];
-cx q[137],q[116];
-rz(pi/4194304) q[116];
-rz(pi/2097152) q[137];
-cx q[137],q[117];
-rz(-pi/2097152) q[117];
-cx q[137],q[117];
-rz(pi/2097152) q[117];
-rz(pi/1048576) q[137];
-cx q[137],q[118];
-rz(-pi/1048576) q[118];
-cx q[137],q[118];
-rz(pi/1048576) q[118];
-rz(pi/524288) q[137];
-cx q[137],q[119];
-rz(-pi/524288) q[119];
-cx q[137],q[119];
-rz(pi/524288) q[119];
-rz(pi/262144) q[137];
-cx q[137],q[120];
-rz(-pi/262144) q[120];
-cx q[137],q[120];
-rz(pi/262144) q[120];
-rz(pi/131072) q[137];
-cx q[137],q[121];
-rz(-pi/131072) q[121];
-cx q[137],q[121];
-rz(pi/131072) q[121];
-rz(pi/65536) q[137];
-cx q[137],q[122];
-rz(-pi/65536) q[122];
-cx q[137],q[122];
-rz(pi/65536) q[122];
-rz(pi/32768) q[137];
-cx q[137],q[123];
-rz(-pi/32768) q[123];
-cx q[137],q[123];
-rz(pi/32768) q[123];
-rz(pi/16384) q[137];
-cx q[137],q[124];
-rz(-pi/16384) q[124];
-cx q[137],q[124];
-rz(pi/16384) q[124];
-rz(pi/8192) q[137];
-cx q[137],q[125];
-rz(-pi/8192) q[125];
-cx q[137],q[125];
-rz(pi/8192) q[125];
-rz(pi/4096) q[137];
-cx q[137],q[126];
-rz(-pi/4096) q[126];
-cx q[137],q[126];
-rz(pi/4096) q[126];
-rz(pi/2048) q[137];
-cx q[137],q[127];
-rz(-pi/2048) q[127];
-cx q[137],q[127];
-rz(pi/2048) q[127];
-rz(pi/1024) q[137];
-cx q[137],q[128];
-rz(-pi/1024) q[128];
-cx q[137],q[128];
-rz(pi/1024) q[128];
-rz(pi/512) q[137];
-cx q[137],q[129];
-rz(-pi/512) q[129];
-cx q[137],q[129];
-rz(pi/512) q[129];
-rz(pi/256) q[137];
-cx q[137],q[130];
-rz(-pi/256) q[130];
-cx q[137],q[130];
-rz(pi/256) q[130];
-rz(pi/128) q[137];
-cx q[137],q[131];
-rz(-pi/128) q[131];
-cx q[137],q[131];
-rz(pi/128) q[131];
-rz(pi/64) q[137];
-cx q[137],q[132];
-rz(-pi/64) q[132];
-cx q[137],q[132];
-rz(pi/64) q[132];
-rz(pi/32) q[137];
-cx q[137],q[133];
-rz(-pi/32) q[133];
-cx q[137],q[133];
-rz(pi/32) q[133];
-rz(pi/16) q[137];
-cx q[137],q[134];
-rz(-pi/16) q[134];
-cx q[137],q[134];
-rz(pi/16) q[134];
-rz(pi/8) q[137];
-cx q[137],q[135];
-rz(-pi/8) q[135];
-cx q[137],q[135];
-rz(pi/8) q[135];
-rz(pi/4) q[137];
-cx q[137],q[136];
-rz(-pi/4) q[136];
-cx q[137],q[136];
-rz(pi/4) q[136];
-rz(pi/2) q[137];
-sx q[137];
-rz(pi/2) q[137];
-rz(5.71452374713734e-12) q[99];
-rz(1.42863093678434e-12) q[138];
-cx q[138],q[98];
-rz(-1.42863093678434e-12) q[98];
-cx q[138],q[98];
-rz(2.85726187356867e-12) q[138];
-cx q[138],q[99];
-rz(1.42863093678434e-12) q[98];
-rz(-2.85726187356867e-12) q[99];
-cx q[138],q[99];
-rz(5.71452374713734e-12) q[138];
-cx q[138],q[100];
-rz(-5.71452374713734e-12) q[100];
-cx q[138],q[100];
-rz(5.71452374713734e-12) q[100];
-rz(1.14290474942747e-11) q[138];
-cx q[138],q[101];
-rz(-1.14290474942747e-11) q[101];
-cx q[138],q[101];
-rz(1.14290474942747e-11) q[101];
-rz(2.28580949885494e-11) q[138];
-cx q[138],q[102];
-rz(-2.28580949885494e-11) q[102];
-cx q[138],q[102];
-rz(2.28580949885494e-11) q[102];
-rz(4.57161899770987e-11) q[138];
-cx q[138],q[103];
-rz(-4.57161899770987e-11) q[103];
-cx q[138],q[103];
-rz(4.57161899770987e-11) q[103];
-rz(9.14323799541975e-11) q[138];
-cx q[138],q[104];
-rz(-9.14323799541975e-11) q[104];
-cx q[138],q[104];
-rz(9.14323799541975e-11) q[104];
-rz(1.82864759908395e-10) q[138];
-cx q[138],q[105];
-rz(-1.82864759908395e-10) q[105];
-cx q[138],q[105];
-rz(1.82864759908395e-10) q[105];
-rz(3.6572951981679e-10) q[138];
-cx q[138],q[106];
-rz(-3.6572951981679e-10) q[106];
-cx q[138],q[106];
-rz(3.6572951981679e-10) q[106];
-rz(7.3145903963358e-10) q[138];
-cx q[138],q[107];
-rz(-7.3145903963358e-10) q[107];
-cx q[138],q[107];
-rz(7.3145903963358e-10) q[107];
-rz(pi/2147483648) q[138];
-cx q[138],q[108];
-rz(-pi/2147483648) q[108];
-cx q[138],q[108];
-rz(pi/2147483648) q[108];
-rz(pi/1073741824) q[138];
-cx q[138],q[109];
-rz(-pi/1073741824) q[109];
-cx q[138],q[109];
-rz(pi/1073741824) q[109];
-rz(pi/536870912) q[138];
-cx q[138],q[110];
-rz(-pi/536870912) q[110];
-cx q[138],q[110];
-rz(pi/536870912) q[110];
-rz(pi/268435456) q[138];
-cx q[138],q[111];
-rz(-pi/268435456) q[111];
-cx q[138],q[111];
-rz(pi/268435456) q[111];
-rz(pi/134217728) q[138];
-cx q[138],q[112];
-rz(-pi/134217728) q[112];
-cx q[138],q[112];
-rz(pi/134217728) q[112];
-rz(pi/67108864) q[138];
-cx q[138],q[113];
-rz(-pi/67108864) q[113];
-cx q[138],q[113];
-rz(pi/67108864) q[113];
-rz(pi/33554432) q[138];
-cx q[138],q[114];
-rz(-pi/33554432) q[114];
-cx q[138],q[114];
-rz(pi/33554432) q[114];
-rz(pi/16777216) q[138];
-cx q[138],q[115];
-rz(-pi/16777216) q[115];
-cx q[138],q[115];
-rz(pi/16777216) q[115];
-rz(pi/8388608) q[138];
-cx q[138],q[116];
-rz(-pi/8388608) q[116];
-cx q[138],q[116];
-rz(pi/8388608) q[116];
-rz(pi/4194304) q[138];
-cx q[138],q[117];
-rz(-pi/4194304) q[117];
-cx q[138],q[117];
-rz(pi/4194304) q[117];
-rz(pi/2097152) q[138];
-cx q[138],q[118];
-rz(-pi/2097152) q[118];
-cx q[138],q[118];
-rz(pi/2097152) q[118];
-rz(pi/1048576) q[138];
-cx q[138],q[119];
-rz(-pi/1048576) q[119];
-cx q[138],q[119];
-rz(pi/1048576) q[119];
-rz(pi/524288) q[138];
-cx q[138],q[120];
-rz(-pi/524288) q[120];
-cx q[138],q[120];
-rz(pi/524288) q[120];
-rz(pi/262144) q[138];
-cx q[138],q[121];
-rz(-pi/262144) q[121];
-cx q[138],q[121];
-rz(pi/262144) q[121];
-rz(pi/131072) q[138];
-cx q[138],q[122];
-rz(-pi/131072) q[122];
-cx q[138],q[122];
-rz(pi/131072) q[122];
-rz(pi/65536) q[138];
-cx q[138],q[123];
-rz(-pi/65536) q[123];
-cx q[138],q[123];
-rz(pi/65536) q[123];
-rz(pi/32768) q[138];
-cx q[138],q[124];
-rz(-pi/32768) q[124];
-cx q[138],q[124];
-rz(pi/32768) q[124];
-rz(pi/16384) q[138];
-cx q[138],q[125];
-rz(-pi/16384) q[125];
-cx q[138],q[125];
-rz(pi/16384) q[125];
-rz(pi/8192) q[138];
-cx q[138],q[126];
-rz(-pi/8192) q[126];
-cx q[138],q[126];
-rz(pi/8192) q[126];
-rz(pi/4096) q[138];
-cx q[138],q[127];
-rz(-pi/4096) q[127];
-cx q[138],q[127];
-rz(pi/4096) q[127];
-rz(pi/2048) q[138];
-cx q[138],q[128];
-rz(-pi/2048) q[128];
-cx q[138],q[128];
-rz(pi/2048) q[128];
-rz(pi/1024) q[138];
-cx q[138],q[129];
-rz(-pi/1024) q[129];
-cx q[138],q[129];
-rz(pi/1024) q[129];
-rz(pi/512) q[138];
-cx q[138],q[130];
-rz(-pi/512) q[130];
-cx q[138],q[130];
-rz(pi/512) q[130];
-rz(pi/256) q[138];
-cx q[138],q[131];
-rz(-pi/256) q[131];
-cx q[138],q[131];
-rz(pi/256) q[131];
-rz(pi/128) q[138];
-cx q[138],q[132];
-rz(-pi/128) q[132];
-cx q[138],q[132];
-rz(pi/128) q[132];
-rz(pi/64) q[138];
-cx q[138],q[133];
-rz(-pi/64) q[133];
-cx q[138],q[133];
-rz(pi/64) q[133];
-rz(pi/32) q[138];
-cx q[138],q[134];
-rz(-pi/32) q[134];
-cx q[138],q[134];
-rz(pi/32) q[134];
-rz(pi/16) q[138];
-cx q[138],q[135];
-rz(-pi/16) q[135];
-cx q[138],q[135];
-rz(pi/16) q[135];
-rz(pi/8) q[138];
-cx q[138],q[136];
-rz(-pi/8) q[136];
-cx q[138],q[136];
-rz(pi/8) q[136];
-rz(pi/4) q[138];
-cx q[138],q[137];
-rz(-pi/4) q[137];
-cx q[138],q[137];
-rz(pi/4) q[137];
-rz(pi/2) q[138];
-sx q[138];
-rz(pi/2) q[138];
-rz(2.85726187356867e-12) q[99];
-rz(1.42863093678434e-12) q[139];
-cx q[139],q[99];
-rz(-1.42863093678434e-12) q[99];
-cx q[139],q[99];
-rz(2.85726187356867e-12) q[139];
-cx q[139],q[100];
-rz(-2.85726187356867e-12) q[100];
-cx q[139],q[100];
-rz(2.85726187356867e-12) q[100];
-rz(5.71452374713734e-12) q[139];
-cx q[139],q[101];
-rz(-5.71452374713734e-12) q[101];
-cx q[139],q[101];
-rz(5.71452374713734e-12) q[101];
-rz(1.14290474942747e-11) q[139];
-cx q[139],q[102];
-rz(-1.14290474942747e-11) q[102];
-cx q[139],q[102];
-rz(1.14290474942747e-11) q[102];
-rz(2.28580949885494e-11) q[139];
-cx q[139],q[103];
-rz(-2.28580949885494e-11) q[103];
-cx q[139],q[103];
-rz(2.28580949885494e-11) q[103];
-rz(4.57161899770987e-11) q[139];
-cx q[139],q[104];
-rz(-4.57161899770987e-11) q[104];
-cx q[139],q[104];
-rz(4.57161899770987e-11) q[104];
-rz(9.14323799541975e-11) q[139];
-cx q[139],q[105];
-rz(-9.14323799541975e-11) q[105];
-cx q[139],q[105];
-rz(9.14323799541975e-11) q[105];
-rz(1.82864759908395e-10) q[139];
-cx q[139],q[106];
-rz(-1.82864759908395e-10) q[106];
-cx q[139],q[106];
-rz(1.82864759908395e-10) q[106];
-rz(3.6572951981679e-10) q[139];
-cx q[139],q[107];
-rz(-3.6572951981679e-10) q[107];
-cx q[139],q[107];
-rz(3.6572951981679e-10) q[107];
-rz(7.3145903963358e-10) q[139];
-cx q[139],q[108];
-rz(-7.3145903963358e-10) q[108];
-cx q[139],q[108];
-rz(7.3145903963358e-10) q[108];
-rz(pi/2147483648) q[139];
-cx q[139],q[109];
-rz(-pi/2147483648) q[109];
-cx q[139],q[109];
-rz(pi/2147483648) q[109];
-rz(pi/1073741824) q[139];
-cx q[139],q[110];
-rz(-pi/1073741824) q[110];
-cx q[139],q[110];
-rz(pi/1073741824) q[110];
-rz(pi/536870912) q[139];
-cx q[139],q[111];
-rz(-pi/536870912) q[111];
-cx q[139],q[111];
-rz(pi/536870912) q[111];
-rz(pi/268435456) q[139];
-cx q[139],q[112];
-rz(-pi/268435456) q[112];
-cx q[139],q[112];
-rz(pi/268435456) q[112];
-rz(pi/134217728) q[139];
-cx q[139],q[113];
-rz(-pi/134217728) q[113];
-cx q[139],q[113];
-rz(pi/134217728) q[113];
-rz(pi/67108864) q[139];
-cx q[139],q[114];
-rz(-pi/67108864) q[114];
-cx q[139],q[114];
-rz(pi/67108864) q[114];
-rz(pi/33554432) q[139];
-cx q[139],q[115];
-rz(-pi/33554432) q[115];
-cx q[139],q[115];
-rz(pi/33554432) q[115];
-rz(pi/16777216) q[139];
-cx q[139],q[116];
-rz(-pi/16777216) q[116];
-cx q[139],q[116];
-rz(pi/16777216) q[116];
-rz(pi/8388608) q[139];
-cx q[139],q[117];
-rz(-pi/8388608) q[117];
-cx q[139],q[117];
-rz(pi/8388608) q[117];
-rz(pi/4194304) q[139];
-cx q[139],q[118];
-rz(-pi/4194304) q[118];
-cx q[139],q[118];
-rz(pi/4194304) q[118];
-rz(pi/2097152) q[139];
-cx q[139],q[119];
-rz(-pi/2097152) q[119];
-cx q[139],q[119];
-rz(pi/2097152) q[119];
-rz(pi/1048576) q[139];
-cx q[139],q[120];
-rz(-pi/1048576) q[120];
-cx q[139],q[120];
-rz(pi/1048576) q[120];
-rz(pi/524288) q[139];
-cx q[139],q[121];
-rz(-pi/524288) q[121];
-cx q[139],q[121];
-rz(pi/524288) q[121];
-rz(pi/262144) q[139];
-cx q[139],q[122];
-rz(-pi/262144) q[122];
-cx q[139],q[122];
-rz(pi/262144) q[122];
-rz(pi/131072) q[139];
-cx q[139],q[123];
-rz(-pi/131072) q[123];
-cx q[139],q[123];
-rz(pi/131072) q[123];
-rz(pi/65536) q[139];
-cx q[139],q[124];
-rz(-pi/65536) q[124];
-cx q[139],q[124];
-rz(pi/65536) q[124];
-rz(pi/32768) q[139];
-cx q[139],q[125];
-rz(-pi/32768) q[125];
-cx q[139],q[125];
-rz(pi/32768) q[125];
-rz(pi/16384) q[139];
-cx q[139],q[126];
-rz(-pi/16384) q[126];
-cx q[139],q[126];
-rz(pi/16384) q[126];
-rz(pi/8192) q[139];
-cx q[139],q[127];
-rz(-pi/8192) q[127];
-cx q[139],q[127];
-rz(pi/8192) q[127];
-rz(pi/4096) q[139];
-cx q[139],q[128];
-rz(-pi/4096) q[128];
-cx q[139],q[128];
-rz(pi/4096) q[128];
-rz(pi/2048) q[139];
-cx q[139],q[129];
-rz(-pi/2048) q[129];
-cx q[139],q[129];
-rz(pi/2048) q[129];
-rz(pi/1024) q[139];
-cx q[139],q[130];
-rz(-pi/1024) q[130];
-cx q[139],q[130];
-rz(pi/1024) q[130];
-rz(pi/512) q[139];
-cx q[139],q[131];
-rz(-pi/512) q[131];
-cx q[139],q[131];
-rz(pi/512) q[131];
-rz(pi/256) q[139];
-cx q[139],q[132];
-rz(-pi/256) q[132];
-cx q[139],q[132];
-rz(pi/256) q[132];
-rz(pi/128) q[139];
-cx q[139],q[133];
-rz(-pi/128) q[133];
-cx q[139],q[133];
-rz(pi/128) q[133];
-rz(pi/64) q[139];
-cx q[139],q[134];
-rz(-pi/64) q[134];
-cx q[139],q[134];
-rz(pi/64) q[134];
-rz(pi/32) q[139];
-cx q[139],q[135];
-rz(-pi/32) q[135];
-cx q[139],q[135];
-rz(pi/32) q[135];
-rz(pi/16) q[139];
-cx q[139],q[136];
-rz(-pi/16) q[136];
-cx q[139],q[136];
-rz(pi/16) q[136];
-rz(pi/8) q[139];
-cx q[139],q[137];
-rz(-pi/8) q[137];
-cx q[139],q[137];
-rz(pi/8) q[137];
-rz(pi/4) q[139];
-cx q[139],q[138];
-rz(-pi/4) q[138];
-cx q[139],q[138];
-rz(pi/4) q[138];
-rz(pi/2) q[139];
-sx q[139];
-rz(pi/2) q[139];
-rz(1.42863093678434e-12) q[99];
-rz(1.42863093678434e-12) q[140];
-cx q[140],q[100];
-rz(-1.42863093678434e-12) q[100];
-cx q[140],q[100];
-rz(1.42863093678434e-12) q[100];
-rz(2.85726187356867e-12) q[140];
-cx q[140],q[101];
-rz(-2.85726187356867e-12) q[101];
-cx q[140],q[101];
-rz(2.85726187356867e-12) q[101];
-rz(5.71452374713734e-12) q[140];
-cx q[140],q[102];
-rz(-5.71452374713734e-12) q[102];
-cx q[140],q[102];
-rz(5.71452374713734e-12) q[102];
-rz(1.14290474942747e-11) q[140];
-cx q[140],q[103];
-rz(-1.14290474942747e-11) q[103];
-cx q[140],q[103];
-rz(1.14290474942747e-11) q[103];
-rz(2.28580949885494e-11) q[140];
-cx q[140],q[104];
-rz(-2.28580949885494e-11) q[104];
-cx q[140],q[104];
-rz(2.28580949885494e-11) q[104];
-rz(4.57161899770987e-11) q[140];
-cx q[140],q[105];
-rz(-4.57161899770987e-11) q[105];
-cx q[140],q[105];
-rz(4.57161899770987e-11) q[105];
-rz(9.14323799541975e-11) q[140];
-cx q[140],q[106];
-rz(-9.14323799541975e-11) q[106];
-cx q[140],q[106];
-rz(9.14323799541975e-11) q[106];
-rz(1.82864759908395e-10) q[140];
-cx q[140],q[107];
-rz(-1.82864759908395e-10) q[107];
-cx q[140],q[107];
-rz(1.82864759908395e-10) q[107];
-rz(3.6572951981679e-10) q[140];
-cx q[140],q[108];
-rz(-3.6572951981679e-10) q[108];
-cx q[140],q[108];
-rz(3.6572951981679e-10) q[108];
-rz(7.3145903963358e-10) q[140];
-cx q[140],q[109];
-rz(-7.3145903963358e-10) q[109];
-cx q[140],q[109];
-rz(7.3145903963358e-10) q[109];
-rz(pi/2147483648) q[140];
-cx q[140],q[110];
-rz(-pi/2147483648) q[110];
-cx q[140],q[110];
-rz(pi/2147483648) q[110];
-rz(pi/1073741824) q[140];
-cx q[140],q[111];
-rz(-pi/1073741824) q[111];
-cx q[140],q[111];
-rz(pi/1073741824) q[111];
-rz(pi/536870912) q[140];
-cx q[140],q[112];
-rz(-pi/536870912) q[112];
-cx q[140],q[112];
-rz(pi/536870912) q[112];
-rz(pi/268435456) q[140];
-cx q[140],q[113];
-rz(-pi/268435456) q[113];
-cx q[140],q[113];
-rz(pi/268435456) q[113];
-rz(pi/134217728) q[140];
-cx q[140],q[114];
-rz(-pi/134217728) q[114];
-cx q[140],q[114];
-rz(pi/134217728) q[114];
-rz(pi/67108864) q[140];
-cx q[140],q[115];
-rz(-pi/67108864) q[115];
-cx q[140],q[115];
-rz(pi/67108864) q[115];
-rz(pi/33554432) q[140];
-cx q[140],q[116];
-rz(-pi/33554432) q[116];
-cx q[140],q[116];
-rz(pi/33554432) q[116];
-rz(pi/16777216) q[140];
-cx q[140],q[117];
-rz(-pi/16777216) q[117];
-cx q[140],q[117];
-rz(pi/16777216) q[117];
-rz(pi/8388608) q[140];
-cx q[140],q[118];
-rz(-pi/8388608) q[118];
-cx q[140],q[118];
-rz(pi/8388608) q[118];
-rz(pi/4194304) q[140];
-cx q[140],q[119];
-rz(-pi/4194304) q[119];
-cx q[140],q[119];
-rz(pi/4194304) q[119];
-rz(pi/2097152) q[140];
-cx q[140],q[120];
-rz(-pi/2097152) q[120];
-cx q[140],q[120];
-rz(pi/2097152) q[120];
-rz(pi/1048576) q[140];
-cx q[140],q[121];
-rz(-pi/1048576) q[121];
-cx q[140],q[121];
-rz(pi/1048576) q[121];
-rz(pi/524288) q[140];
-cx q[140],q[122];
-rz(-pi/524288) q[122];
-cx q[140],q[122];
-rz(pi/524288) q[122];
-rz(pi/262144) q[140];
-cx q[140],q[123];
-rz(-pi/262144) q[123];
-cx q[140],q[123];
-rz(pi/262144) q[123];
-rz(pi/131072) q[140];
-cx q[140],q[124];
-rz(-pi/131072) q[124];
-cx q[140],q[124];
-rz(pi/131072) q[124];
-rz(pi/65536) q[140];
-cx q[140],q[125];
-rz(-pi/65536) q[125];
-cx q[140],q[125];
-rz(pi/65536) q[125];
-rz(pi/32768) q[140];
-cx q[140],q[126];
-rz(-pi/32768) q[126];
-cx q[140],q[126];
-rz(pi/32768) q[126];
-rz(pi/16384) q[140];
-cx q[140],q[127];
-rz(-pi/16384) q[127];
-cx q[140],q[127];
-rz(pi/16384) q[127];
-rz(pi/8192) q[140];
-cx q[140],q[128];
-rz(-pi/8192) q[128];
-cx q[140],q[128];
-rz(pi/8192) q[128];
-rz(pi/4096) q[140];
-cx q[140],q[129];
-rz(-pi/4096) q[129];
-cx q[140],q[129];
-rz(pi/4096) q[129];
-rz(pi/2048) q[140];
-cx q[140],q[130];
-rz(-pi/2048) q[130];
-cx q[140],q[130];
-rz(pi/2048) q[130];
-rz(pi/1024) q[140];
-cx q[140],q[131];
-rz(-pi/1024) q[131];
-cx q[140],q[131];
-rz(pi/1024) q[131];
-rz(pi/512) q[140];
-cx q[140],q[132];
-rz(-pi/512) q[132];
-cx q[140],q[132];
-rz(pi/512) q[132];
-rz(pi/256) q[140];
-cx q[140],q[133];
-rz(-pi/256) q[133];
-cx q[140],q[133];
-rz(pi/256) q[133];
-rz(pi/128) q[140];
-cx q[140],q[134];
-rz(-pi/128) q[134];
-cx q[140],q[134];
-rz(pi/128) q[134];
-rz(pi/64) q[140];
-cx q[140],q[135];
-rz(-pi/64) q[135];
-cx q[140],q[135];
-rz(pi/64) q[135];
-rz(pi/32) q[140];
-cx q[140],q[136];
-rz(-pi/32) q[136];
-cx q[140],q[136];
-rz(pi/32) q[136];
-rz(pi/16) q[140];
-cx q[140],q[137];
-rz(-pi/16) q[137];
-cx q[140],q[137];
-rz(pi/16) q[137];
-rz(pi/8) q[140];
-cx q[140],q[138];
-rz(-pi/8) q[138];
-cx q[140],q[138];
-rz(pi/8) q[138];
-rz(pi/4) q[140];
-cx q[140],q[139];
-rz(-pi/4) q[139];
-cx q[140],q[139];
-rz(pi/4) q[139];
-rz(pi/2) q[140];
-sx q[140];
-rz(pi/2) q[140];
-rz(1.42863093678434e-12) q[141];
-cx q[141],q[101];
-rz(-1.42863093678434e-12) q[101];
-cx q[141],q[101];
-rz(1.42863093678434e-12) q[101];
-rz(2.85726187356867e-12) q[141];
-cx q[141],q[102];
-rz(-2.85726187356867e-12) q[102];
-cx q[141],q[102];
-rz(2.85726187356867e-12) q[102];
-rz(5.71452374713734e-12) q[141];
-cx q[141],q[103];
-rz(-5.71452374713734e-12) q[103];
-cx q[141],q[103];
-rz(5.71452374713734e-12) q[103];
-rz(1.14290474942747e-11) q[141];
-cx q[141],q[104];
-rz(-1.14290474942747e-11) q[104];
-cx q[141],q[104];
-rz(1.14290474942747e-11) q[104];
-rz(2.28580949885494e-11) q[141];
-cx q[141],q[105];
-rz(-2.28580949885494e-11) q[105];
-cx q[141],q[105];
-rz(2.28580949885494e-11) q[105];
-rz(4.57161899770987e-11) q[141];
-cx q[141],q[106];
-rz(-4.57161899770987e-11) q[106];
-cx q[141],q[106];
-rz(4.57161899770987e-11) q[106];
-rz(9.14323799541975e-11) q[141];
-cx q[141],q[107];
-rz(-9.14323799541975e-11) q[107];
-cx q[141],q[107];
-rz(9.14323799541975e-11) q[107];
-rz(1.82864759908395e-10) q[141];
-cx q[141],q[108];
-rz(-1.82864759908395e-10) q[108];
-cx q[141],q[108];
-rz(1.82864759908395e-10) q[108];
-rz(3.6572951981679e-10) q[141];
-cx q[141],q[109];
-rz(-3.6572951981679e-10) q[109];
-cx q[141],q[109];
-rz(3.6572951981679e-10) q[109];
-rz(7.3145903963358e-10) q[141];
-cx q[141],q[110];
-rz(-7.3145903963358e-10) q[110];
-cx q[141],q[110];
-rz(7.3145903963358e-10) q[110];
-rz(pi/2147483648) q[141];
-cx q[141],q[111];
-rz(-pi/2147483648) q[111];
-cx q[141],q[111];
-rz(pi/2147483648) q[111];
-rz(pi/1073741824) q[141];
-cx q[141],q[112];
-rz(-pi/1073741824) q[112];
-cx q[141],q[112];
-rz(pi/1073741824) q[112];
-rz(pi/536870912) q[141];
-cx q[141],q[113];
-rz(-pi/536870912) q[113];
-cx q[141],q[113];
-rz(pi/536870912) q[113];
-rz(pi/268435456) q[141];
-cx q[141],q[114];
-rz(-pi/268435456) q[114];
-cx q[141],q[114];
-rz(pi/268435456) q[114];
-rz(pi/134217728) q[141];
-cx q[141],q[115];
-rz(-pi/134217728) q[115];
-cx q[141],q[115];
-rz(pi/134217728) q[115];
-rz(pi/67108864) q[141];
-cx q[141],q[116];
-rz(-pi/67108864) q[116];
-cx q[141],q[116];
-rz(pi/67108864) q[116];
-rz(pi/33554432) q[141];
-cx q[141],q[117];
-rz(-pi/33554432) q[117];
-cx q[141],q[117];
-rz(pi/33554432) q[117];
-rz(pi/16777216) q[141];
-cx q[141],q[118];
-rz(-pi/16777216) q[118];
-cx q[141],q[118];
-rz(pi/16777216) q[118];
-rz(pi/8388608) q[141];
-cx q[141],q[119];
-rz(-pi/8388608) q[119];
-cx q[141],q[119];
-rz(pi/8388608) q[119];
-rz(pi/4194304) q[141];
-cx q[141],q[120];
-rz(-pi/4194304) q[120];
-cx q[141],q[120];
-rz(pi/4194304) q[120];
-rz(pi/2097152) q[141];
-cx q[141],q[121];
-rz(-pi/2097152) q[121];
-cx q[141],q[121];
-rz(pi/2097152) q[121];
-rz(pi/1048576) q[141];
-cx q[141],q[122];
-rz(-pi/1048576) q[122];
-cx q[141],q[122];
-rz(pi/1048576) q[122];
-rz(pi/524288) q[141];
-cx q[141],q[123];
-rz(-pi/524288) q[123];
-cx q[141],q[123];
-rz(pi/524288) q[123];
-rz(pi/262144) q[141];
-cx q[141],q[124];
-rz(-pi/262144) q[124];
-cx q[141],q[124];
-rz(pi/262144) q[124];
-rz(pi/131072) q[141];
-cx q[141],q[125];
-rz(-pi/131072) q[125];
-cx q[141],q[125];
-rz(pi/131072) q[125];
-rz(pi/65536) q[141];
-cx q[141],q[126];
-rz(-pi/65536) q[126];
-cx q[141],q[126];
-rz(pi/65536) q[126];
-rz(pi/32768) q[141];
-cx q[141],q[127];
-rz(-pi/32768) q[127];
-cx q[141],q[127];
-rz(pi/32768) q[127];
-rz(pi/16384) q[141];
-cx q[141],q[128];
-rz(-pi/16384) q[128];
-cx q[141],q[128];
-rz(pi/16384) q[128];
-rz(pi/8192) q[141];
-cx q[141],q[129];
-rz(-pi/8192) q[129];
-cx q[141],q[129];
-rz(pi/8192) q[129];
-rz(pi/4096) q[141];
-cx q[141],q[130];
-rz(-pi/4096) q[130];
-cx q[141],q[130];
-rz(pi/4096) q[130];
-rz(pi/2048) q[141];
-cx q[141],q[131];
-rz(-pi/2048) q[131];
-cx q[141],q[131];
-rz(pi/2048) q[131];
-rz(pi/1024) q[141];
-cx q[141],q[132];
-rz(-pi/1024) q[132];
-cx q[141],q[132];
-rz(pi/1024) q[132];
-rz(pi/512) q[141];
-cx q[141],q[133];
-rz(-pi/512) q[133];
-cx q[141],q[133];
-rz(pi/512) q[133];
-rz(pi/256) q[141];
-cx q[141],q[134];
-rz(-pi/256) q[134];
-cx q[141],q[134];
-rz(pi/256) q[134];
-rz(pi/128) q[141];
-cx q[141],q[135];
-rz(-pi/128) q[135];
-cx q[141],q[135];
-rz(pi/128) q[135];
-rz(pi/64) q[141];
-cx q[141],q[136];
-rz(-pi/64) q[136];
-cx q[141],q[136];
-rz(pi/64) q[136];
-rz(pi/32) q[141];
-cx q[141],q[137];
-rz(-pi/32) q[137];
-cx q[141],q[137];
-rz(pi/32) q[137];
-rz(pi/16) q[141];
-cx q[141],q[138];
-rz(-pi/16) q[138];
-cx q[141],q[138];
-rz(pi/16) q[138];
-rz(pi/8) q[141];
-cx q[141],q[139];
-rz(-pi/8) q[139];
-cx q[141],q[139];
-rz(pi/8) q[139];
-rz(pi/4) q[141];
-cx q[141],q[140];
-rz(-pi/4) q[140];
-cx q[141],q[140];
-rz(pi/4) q[140];
-rz(pi/2) q[141];
-sx q[141];
-rz(pi/2) q[141];
-rz(1.42863093678434e-12) q[142];
-cx q[142],q[102];
-rz(-1.42863093678434e-12) q[102];
-cx q[142],q[102];
-rz(1.42863093678434e-12) q[102];
-rz(2.85726187356867e-12) q[142];
-cx q[142],q[103];
-rz(-2.85726187356867e-12) q[103];
-cx q[142],q[103];
-rz(2.85726187356867e-12) q[103];
-rz(5.71452374713734e-12) q[142];
-cx q[142],q[104];
-rz(-5.71452374713734e-12) q[104];
-cx q[142],q[104];
-rz(5.71452374713734e-12) q[104];
-rz(1.14290474942747e-11) q[142];
-cx q[142],q[105];
-rz(-1.14290474942747e-11) q[105];
-cx q[142],q[105];
-rz(1.14290474942747e-11) q[105];
-rz(2.28580949885494e-11) q[142];
-cx q[142],q[106];
-rz(-2.28580949885494e-11) q[106];
-cx q[142],q[106];
-rz(2.28580949885494e-11) q[106];
-rz(4.57161899770987e-11) q[142];
-cx q[142],q[107];
-rz(-4.57161899770987e-11) q[107];
-cx q[142],q[107];
-rz(4.57161899770987e-11) q[107];
-rz(9.14323799541975e-11) q[142];
-cx q[142],q[108];
-rz(-9.14323799541975e-11) q[108];
-cx q[142],q[108];
-rz(9.14323799541975e-11) q[108];
-rz(1.82864759908395e-10) q[142];
-cx q[142],q[109];
-rz(-1.82864759908395e-10) q[109];
-cx q[142],q[109];
-rz(1.82864759908395e-10) q[109];
-rz(3.6572951981679e-10) q[142];
-cx q[142],q[110];
-rz(-3.6572951981679e-10) q[110];
-cx q[142],q[110];
-rz(3.6572951981679e-10) q[110];
-rz(7.3145903963358e-10) q[142];
-cx q[142],q[111];
-rz(-7.3145903963358e-10) q[111];
-cx q[142],q[111];
-rz(7.3145903963358e-10) q[111];
-rz(pi/2147483648) q[142];
-cx q[142],q[112];
-rz(-pi/2147483648) q[112];
-cx q[142],q[112];
-rz(pi/2147483648) q[112];
-rz(pi/1073741824) q[142];
-cx q[142],q[113];
-rz(-pi/1073741824) q[113];
-cx q[142],q[113];
-rz(pi/1073741824) q[113];
-rz(pi/536870912) q[142];
-cx q[142],q[114];
-rz(-pi/536870912) q[114];
-cx q[142],q[114];
-rz(pi/536870912) q[114];
-rz(pi/268435456) q[142];
-cx q[142],q[115];
-rz(-pi/268435456) q[115];
-cx q[142],q[115];
-rz(pi/268435456) q[115];
-rz(pi/134217728) q[142];
-cx q[142],q[116];
-rz(-pi/134217728) q[116];
-cx q[142],q[116];
-rz(pi/134217728) q[116];
-rz(pi/67108864) q[142];
-cx q[142],q[117];
-rz(-pi/67108864) q[117];
-cx q[142],q[117];
-rz(pi/67108864) q[117];
-rz(pi/33554432) q[142];
-cx q[142],q[118];
-rz(-pi/33554432) q[118];
-cx q[142],q[118];
-rz(pi/33554432) q[118];
-rz(pi/16777216) q[142];
-cx q[142],q[119];
-rz(-pi/16777216) q[119];
-cx q[142],q[119];
-rz(pi/16777216) q[119];
-rz(pi/8388608) q[142];
-cx q[142],q[120];
-rz(-pi/8388608) q[120];
-cx q[142],q[120];
-rz(pi/8388608) q[120];
-rz(pi/4194304) q[142];
-cx q[142],q[121];
-rz(-pi/4194304) q[121];
-cx q[142],q[121];
-rz(pi/4194304) q[121];
-rz(pi/2097152) q[142];
-cx q[142],q[122];
-rz(-pi/2097152) q[122];
-cx q[142],q[122];
-rz(pi/2097152) q[122];
-rz(pi/1048576) q[142];
-cx q[142],q[123];
-rz(-pi/1048576) q[123];
-cx q[142],q[123];
-rz(pi/1048576) q[123];
-rz(pi/524288) q[142];
-cx q[142],q[124];
-rz(-pi/524288) q[124];
-cx q[142],q[124];
-rz(pi/524288) q[124];
-rz(pi/262144) q[142];
-cx q[142],q[125];
-rz(-pi/262144) q[125];
-cx q[142],q[125];
-rz(pi/262144) q[125];
-rz(pi/131072) q[142];
-cx q[142],q[126];
-rz(-pi/131072) q[126];
-cx q[142],q[126];
-rz(pi/131072) q[126];
-rz(pi/65536) q[142];
-cx q[142],q[127];
-rz(-pi/65536) q[127];
-cx q[142],q[127];
-rz(pi/65536) q[127];
-rz(pi/32768) q[142];
-cx q[142],q[128];
-rz(-pi/32768) q[128];
-cx q[142],q[128];
-rz(pi/32768) q[128];
-rz(pi/16384) q[142];
-cx q[142],q[129];
-rz(-pi/16384) q[129];
-cx q[142],q[129];
-rz(pi/16384) q[129];
-rz(pi/8192) q[142];
-cx q[142],q[130];
-rz(-pi/8192) q[130];
-cx q[142],q[130];
-rz(pi/8192) q[130];
-rz(pi/4096) q[142];
-cx q[142],q[131];
-rz(-pi/4096) q[131];
-cx q[142],q[131];
-rz(pi/4096) q[131];
-rz(pi/2048) q[142];
-cx q[142],q[132];
-rz(-pi/2048) q[132];
-cx q[142],q[132];
-rz(pi/2048) q[132];
-rz(pi/1024) q[142];
-cx q[142],q[133];
-rz(-pi/1024) q[133];
-cx q[142],q[133];
-rz(pi/1024) q[133];
-rz(pi/512) q[142];
-cx q[142],q[134];
-rz(-pi/512) q[134];
-cx q[142],q[134];
-rz(pi/512) q[134];
-rz(pi/256) q[142];
-cx q[142],q[135];
-rz(-pi/256) q[135];
-cx q[142],q[135];
-rz(pi/256) q[135];
-rz(pi/128) q[142];
-cx q[142],q[136];
-rz(-pi/128) q[136];
-cx q[142],q[136];
-rz(pi/128) q[136];
-rz(pi/64) q[142];
-cx q[142],q[137];
-rz(-pi/64) q[137];
-cx q[142],q[137];
-rz(pi/64) q[137];
-rz(pi/32) q[142];
-cx q[142],q[138];
-rz(-pi/32) q[138];
-cx q[142],q[138];
-rz(pi/32) q[138];
-rz(pi/16) q[142];
-cx q[142],q[139];
-rz(-pi/16) q[139];
-cx q[142],q[139];
-rz(pi/16) q[139];
-rz(pi/8) q[142];
-cx q[142],q[140];
-rz(-pi/8) q[140];
-cx q[142],q[140];
-rz(pi/8) q[140];
-rz(pi/4) q[142];
-cx q[142],q[141];
-rz(-pi/4) q[141];
-cx q[142],q[141];
-rz(pi/4) q[141];
-rz(pi/2) q[142];
-sx q[142];
-rz(pi/2) q[142];
-rz(1.42863093678434e-12) q[143];
-cx q[143],q[103];
-rz(-1.42863093678434e-12) q[103];
-cx q[143],q[103];
-rz(1.42863093678434e-12) q[103];
-rz(2.85726187356867e-12) q[143];
-cx q[143],q[104];
-rz(-2.85726187356867e-12) q[104];
-cx q[143],q[104];
-rz(2.85726187356867e-12) q[104];
-rz(5.71452374713734e-12) q[143];
-cx q[143],q[105];
-rz(-5.71452374713734e-12) q[105];
-cx q[143],q[105];
-rz(5.71452374713734e-12) q[105];
-rz(1.14290474942747e-11) q[143];
-cx q[143],q[106];
-rz(-1.14290474942747e-11) q[106];
-cx q[143],q[106];
-rz(1.14290474942747e-11) q[106];
-rz(2.28580949885494e-11) q[143];
-cx q[143],q[107];
-rz(-2.28580949885494e-11) q[107];
-cx q[143],q[107];
-rz(2.28580949885494e-11) q[107];
-rz(4.57161899770987e-11) q[143];
-cx q[143],q[108];
-rz(-4.57161899770987e-11) q[108];
-cx q[143],q[108];
-rz(4.57161899770987e-11) q[108];
-rz(9.14323799541975e-11) q[143];
-cx q[143],q[109];
-rz(-9.14323799541975e-11) q[109];
-cx q[143],q[109];
-rz(9.14323799541975e-11) q[109];
-rz(1.82864759908395e-10) q[143];
-cx q[143],q[110];
-rz(-1.82864759908395e-10) q[110];
-cx q[143],q[110];
-rz(1.82864759908395e-10) q[110];
-rz(3.6572951981679e-10) q[143];
-cx q[143],q[111];
-rz(-3.6572951981679e-10) q[111];
-cx q[143],q[111];
-rz(3.6572951981679e-10) q[111];
-rz(7.3145903963358e-10) q[143];
-cx q[143],q[112];
-rz(-7.3145903963358e-10) q[112];
-cx q[143],q[112];
-rz(7.3145903963358e-10) q[112];
-rz(pi/2147483648) q[143];
-cx q[143],q[113];
-rz(-pi/2147483648) q[113];
-cx q[143],q[113];
-rz(pi/2147483648) q[113];
-rz(pi/1073741824) q[143];
-cx q[143],q[114];
-rz(-pi/1073741824) q[114];
-cx q[143],q[114];
-rz(pi/1073741824) q[114];
-rz(pi/536870912) q[143];
-cx q[143],q[115];
-rz(-pi/536870912) q[115];
-cx q[143],q[115];
-rz(pi/536870912) q[115];
-rz(pi/268435456) q[143];
-cx q[143],q[116];
-rz(-pi/268435456) q[116];
-cx q[143],q[116];
-rz(pi/268435456) q[116];
-rz(pi/134217728) q[143];
-cx q[143],q[117];
-rz(-pi/134217728) q[117];
-cx q[143],q[117];
-rz(pi/134217728) q[117];
-rz(pi/67108864) q[143];
-cx q[143],q[118];
-rz(-pi/67108864) q[118];
-cx q[143],q[118];
-rz(pi/67108864) q[118];
-rz(pi/33554432) q[143];
-cx q[143],q[119];
-rz(-pi/33554432) q[119];
-cx q[143],q[119];
-rz(pi/33554432) q[119];
-rz(pi/16777216) q[143];
-cx q[143],q[120];
-rz(-pi/16777216) q[120];
-cx q[143],q[120];
-rz(pi/16777216) q[120];
-rz(pi/8388608) q[143];
-cx q[143],q[121];
-rz(-pi/8388608) q[121];
-cx q[143],q[121];
-rz(pi/8388608) q[121];
-rz(pi/4194304) q[143];
-cx q[143],q[122];
-rz(-pi/4194304) q[122];
-cx q[143],q[122];
-rz(pi/4194304) q[122];
-rz(pi/2097152) q[143];
-cx q[143],q[123];
-rz(-pi/2097152) q[123];
-cx q[143],q[123];
-rz(pi/2097152) q[123];
-rz(pi/1048576) q[143];
-cx q[143],q[124];
-rz(-pi/1048576) q[124];
-cx q[143],q[124];
-rz(pi/1048576) q[124];
-rz(pi/524288) q[143];
-cx q[143],q[125];
-rz(-pi/524288) q[125];
-cx q[143],q[125];
-rz(pi/524288) q[125];
-rz(pi/262144) q[143];
-cx q[143],q[126];
-rz(-pi/262144) q[126];
-cx q[143],q[126];
-rz(pi/262144) q[126];
-rz(pi/131072) q[143];
-cx q[143],q[127];
-rz(-pi/131072) q[127];
-cx q[143],q[127];
-rz(pi/131072) q[127];
-rz(pi/65536) q[143];
-cx q[143],q[128];
-rz(-pi/65536) q[128];
-cx q[143],q[128];
-rz(pi/65536) q[128];
-rz(pi/32768) q[143];
-cx q[143],q[129];
-rz(-pi/32768) q[129];
-cx q[143],q[129];
-rz(pi/32768) q[129];
-rz(pi/16384) q[143];
-cx q[143],q[130];
-rz(-pi/16384) q[130];
-cx q[143],q[130];
-rz(pi/16384) q[130];
-rz(pi/8192) q[143];
-cx q[143],q[131];
-rz(-pi/8192) q[131];
-cx q[143],q[131];
-rz(pi/8192) q[131];
-rz(pi/4096) q[143];
-cx q[143],q[132];
-rz(-pi/4096) q[132];
-cx q[143],q[132];
-rz(pi/4096) q[132];
-rz(pi/2048) q[143];
-cx q[143],q[133];
-rz(-pi/2048) q[133];
-cx q[143],q[133];
-rz(pi/2048) q[133];
-rz(pi/1024) q[143];
-cx q[143],q[134];
-rz(-pi/1024) q[134];
-cx q[143],q[134];
-rz(pi/1024) q[134];
-rz(pi/512) q[143];
-cx q[143],q[135];
-rz(-pi/512) q[135];
-cx q[143],q[135];
-rz(pi/512) q[135];
-rz(pi/256) q[143];
-cx q[143],q[136];
-rz(-pi/256) q[136];
-cx q[143],q[136];
-rz(pi/256) q[136];
-rz(pi/128) q[143];
-cx q[143],q[137];
-rz(-pi/128) q[137];
-cx q[143],q[137];
-rz(pi/128) q[137];
-rz(pi/64) q[143];
-cx q[143],q[138];
-rz(-pi/64) q[138];
-cx q[143],q[138];
-rz(pi/64) q[138];
-rz(pi/32) q[143];
-cx q[143],q[139];
-rz(-pi/32) q[139];
-cx q[143],q[139];
-rz(pi/32) q[139];
-rz(pi/16) q[143];
-cx q[143],q[140];
-rz(-pi/16) q[140];
-cx q[143],q[140];
-rz(pi/16) q[140];
-rz(pi/8) q[143];
-cx q[143],q[141];
-rz(-pi/8) q[141];
-cx q[143],q[141];
-rz(pi/8) q[141];
-rz(pi/4) q[143];
-cx q[143],q[142];
-rz(-pi/4) q[142];
-cx q[143],q[142];
-rz(pi/4) q[142];
-rz(pi/2) q[143];
-sx q[143];
-rz(pi/2) q[143];
-rz(1.42863093678434e-12) q[144];
-cx q[144],q[104];
-rz(-1.42863093678434e-12) q[104];
-cx q[144],q[104];
-rz(1.42863093678434e-12) q[104];
-rz(2.85726187356867e-12) q[144];
-cx q[144],q[105];
-rz(-2.85726187356867e-12) q[105];
-cx q[144],q[105];
-rz(2.85726187356867e-12) q[105];
-rz(5.71452374713734e-12) q[144];
-cx q[144],q[106];
-rz(-5.71452374713734e-12) q[106];
-cx q[144],q[106];
-rz(5.71452374713734e-12) q[106];
-rz(1.14290474942747e-11) q[144];
-cx q[144],q[107];
-rz(-1.14290474942747e-11) q[107];
-cx q[144],q[107];
-rz(1.14290474942747e-11) q[107];
-rz(2.28580949885494e-11) q[144];
-cx q[144],q[108];
-rz(-2.28580949885494e-11) q[108];
-cx q[144],q[108];
-rz(2.28580949885494e-11) q[108];
-rz(4.57161899770987e-11) q[144];
-cx q[144],q[109];
-rz(-4.57161899770987e-11) q[109];
-cx q[144],q[109];
-rz(4.57161899770987e-11) q[109];
-rz(9.14323799541975e-11) q[144];
-cx q[144],q[110];
-rz(-9.14323799541975e-11) q[110];
-cx q[144],q[110];
-rz(9.14323799541975e-11) q[110];
-rz(1.82864759908395e-10) q[144];
-cx q[144],q[111];
-rz(-1.82864759908395e-10) q[111];
-cx q[144],q[111];
-rz(1.82864759908395e-10) q[111];
-rz(3.6572951981679e-10) q[144];
-cx q[144],q[112];
-rz(-3.6572951981679e-10) q[112];
-cx q[144],q[112];
-rz(3.6572951981679e-10) q[112];
-rz(7.3145903963358e-10) q[144];
-cx q[144],q[113];
-rz(-7.3145903963358e-10) q[113];
-cx q[144],q[113];
-rz(7.3145903963358e-10) q[113];
-rz(pi/2147483648) q[144];
-cx q[144],q[114];
-rz(-pi/2147483648) q[114];
-cx q[144],q[114];
-rz(pi/2147483648) q[114];
-rz(pi/1073741824) q[144];
-cx q[144],q[115];
-rz(-pi/1073741824) q[115];
-cx q[144],q[115];
-rz(pi/1073741824) q[115];
-rz(pi/536870912) q[144];
-cx q[144],q[116];
-rz(-pi/536870912) q[116];
-cx q[144],q[116];
-rz(pi/536870912) q[116];
-rz(pi/268435456) q[144];
-cx q[144],q[117];
-rz(-pi/268435456) q[117];
-cx q[144],q[117];
-rz(pi/268435456) q[117];
-rz(pi/134217728) q[144];
-cx q[144],q[118];
-rz(-pi/134217728) q[118];
-cx q[144],q[118];
-rz(pi/134217728) q[118];
-rz(pi/67108864) q[144];
-cx q[144],q[119];
-rz(-pi/67108864) q[119];
-cx q[144],q[119];
-rz(pi/67108864) q[119];
-rz(pi/33554432) q[144];
-cx q[144],q[120];
-rz(-pi/33554432) q[120];
-cx q[144],q[120];
-rz(pi/33554432) q[120];
-rz(pi/16777216) q[144];
-cx q[144],q[121];
-rz(-pi/16777216) q[121];
-cx q[144],q[121];
-rz(pi/16777216) q[121];
-rz(pi/8388608) q[144];
-cx q[144],q[122];
-rz(-pi/8388608) q[122];
-cx q[144],q[122];
-rz(pi/8388608) q[122];
-rz(pi/4194304) q[144];
-cx q[144],q[123];
-rz(-pi/4194304) q[123];
-cx q[144],q[123];
-rz(pi/4194304) q[123];
-rz(pi/2097152) q[144];
-cx q[144],q[124];
-rz(-pi/2097152) q[124];
-cx q[144],q[124];
-rz(pi/2097152) q[124];
-rz(pi/1048576) q[144];
-cx q[144],q[125];
-rz(-pi/1048576) q[125];
-cx q[144],q[125];
-rz(pi/1048576) q[125];
-rz(pi/524288) q[144];
-cx q[144],q[126];
-rz(-pi/524288) q[126];
-cx q[144],q[126];
-rz(pi/524288) q[126];
-rz(pi/262144) q[144];
-cx q[144],q[127];
-rz(-pi/262144) q[127];
-cx q[144],q[127];
-rz(pi/262144) q[127];
-rz(pi/131072) q[144];
-cx q[144],q[128];
-rz(-pi/131072) q[128];
-cx q[144],q[128];
-rz(pi/131072) q[128];
-rz(pi/65536) q[144];
-cx q[144],q[129];
-rz(-pi/65536) q[129];
-cx q[144],q[129];
-rz(pi/65536) q[129];
-rz(pi/32768) q[144];
-cx q[144],q[130];
-rz(-pi/32768) q[130];
-cx q[144],q[130];
-rz(pi/32768) q[130];
-rz(pi/16384) q[144];
-cx q[144],q[131];
-rz(-pi/16384) q[131];
-cx q[144],q[131];
-rz(pi/16384) q[131];
-rz(pi/8192) q[144];
-cx q[144],q[132];
-rz(-pi/8192) q[132];
-cx q[144],q[132];
-rz(pi/8192) q[132];
-rz(pi/4096) q[144];
-cx q[144],q[133];
-rz(-pi/4096) q[133];
-cx q[144],q[133];
-rz(pi/4096) q[133];
-rz(pi/2048) q[144];
-cx q[144],q[134];
-rz(-pi/2048) q[134];
-cx q[144],q[134];
-rz(pi/2048) q[134];
-rz(pi/1024) q[144];
-cx q[144],q[135];
-rz(-pi/1024) q[135];
-cx q[144],q[135];
-rz(pi/1024) q[135];
-rz(pi/512) q[144];
-cx q[144],q[136];
-rz(-pi/512) q[136];
-cx q[144],q[136];
-rz(pi/512) q[136];
-rz(pi/256) q[144];
-cx q[144],q[137];
-rz(-pi/256) q[137];
-cx q[144],q[137];
-rz(pi/256) q[137];
-rz(pi/128) q[144];
-cx q[144],q[138];
-rz(-pi/128) q[138];
-cx q[144],q[138];
-rz(pi/128) q[138];
-rz(pi/64) q[144];
-cx q[144],q[139];
-rz(-pi/64) q[139];
-cx q[144],q[139];
-rz(pi/64) q[139];
-rz(pi/32) q[144];
-cx q[144],q[140];
-rz(-pi/32) q[140];
-cx q[144],q[140];
-rz(pi/32) q[140];
-rz(pi/16) q[144];
-cx q[144],q[141];
-rz(-pi/16) q[141];
-cx q[144],q[141];
-rz(pi/16) q[141];
-rz(pi/8) q[144];
-cx q[144],q[142];
-rz(-pi/8) q[142];
-cx q[144],q[142];
-rz(pi/8) q[142];
-rz(pi/4) q[144];
-cx q[144],q[143];
-rz(-pi/4) q[143];
-cx q[144],q[143];
-rz(pi/4) q[143];
-rz(pi/2) q[144];
-sx q[144];
-rz(pi/2) q[144];
-rz(1.42863093678434e-12) q[145];
-cx q[145],q[105];
-rz(-1.42863093678434e-12) q[105];
-cx q[145],q[105];
-rz(1.42863093678434e-12) q[105];
-rz(2.85726187356867e-12) q[145];
-cx q[145],q[106];
-rz(-2.85726187356867e-12) q[106];
-cx q[145],q[106];
-rz(2.85726187356867e-12) q[106];
-rz(5.71452374713734e-12) q[145];
-cx q[145],q[107];
-rz(-5.71452374713734e-12) q[107];
-cx q[145],q[107];
-rz(5.71452374713734e-12) q[107];
-rz(1.14290474942747e-11) q[145];
-cx q[145],q[108];
-rz(-1.14290474942747e-11) q[108];
-cx q[145],q[108];
-rz(1.14290474942747e-11) q[108];
-rz(2.28580949885494e-11) q[145];
-cx q[145],q[109];
-rz(-2.28580949885494e-11) q[109];
-cx q[145],q[109];
-rz(2.28580949885494e-11) q[109];
-rz(4.57161899770987e-11) q[145];
-cx q[145],q[110];
-rz(-4.57161899770987e-11) q[110];
-cx q[145],q[110];
-rz(4.57161899770987e-11) q[110];
-rz(9.14323799541975e-11) q[145];
-cx q[145],q[111];
-rz(-9.14323799541975e-11) q[111];
-cx q[145],q[111];
-rz(9.14323799541975e-11) q[111];
-rz(1.82864759908395e-10) q[145];
-cx q[145],q[112];
-rz(-1.82864759908395e-10) q[112];
-cx q[145],q[112];
-rz(1.82864759908395e-10) q[112];
-rz(3.6572951981679e-10) q[145];
-cx q[145],q[113];
-rz(-3.6572951981679e-10) q[113];
-cx q[145],q[113];
-rz(3.6572951981679e-10) q[113];
-rz(7.3145903963358e-10) q[145];
-cx q[145],q[114];
-rz(-7.3145903963358e-10) q[114];
-cx q[145],q[114];
-rz(7.3145903963358e-10) q[114];
-rz(pi/2147483648) q[145];
-cx q[145],q[115];
-rz(-pi/2147483648) q[115];
-cx q[145],q[115];
-rz(pi/2147483648) q[115];
-rz(pi/1073741824) q[145];
-cx q[145],q[116];
-rz(-pi/1073741824) q[116];
-cx q[145],q[116];
-rz(pi/1073741824) q[116];
-rz(pi/536870912) q[145];
-cx q[145],q[117];
-rz(-pi/536870912) q[117];
-cx q[145],q[117];
-rz(pi/536870912) q[117];
-rz(pi/268435456) q[145];
-cx q[145],q[118];
-rz(-pi/268435456) q[118];
-cx q[145],q[118];
-rz(pi/268435456) q[118];
-rz(pi/134217728) q[145];
-cx q[145],q[119];
-rz(-pi/134217728) q[119];
-cx q[145],q[119];
-rz(pi/134217728) q[119];
-rz(pi/67108864) q[145];
-cx q[145],q[120];
-rz(-pi/67108864) q[120];
-cx q[145],q[120];
-rz(pi/67108864) q[120];
-rz(pi/33554432) q[145];
-cx q[145],q[121];
-rz(-pi/33554432) q[121];
-cx q[145],q[121];
-rz(pi/33554432) q[121];
-rz(pi/16777216) q[145];
-cx q[145],q[122];
-rz(-pi/16777216) q[122];
-cx q[145],q[122];
-rz(pi/16777216) q[122];
-rz(pi/8388608) q[145];
-cx q[145],q[123];
-rz(-pi/8388608) q[123];
-cx q[145],q[123];
-rz(pi/8388608) q[123];
-rz(pi/4194304) q[145];
-cx q[145],q[124];
-rz(-pi/4194304) q[124];
-cx q[145],q[124];
-rz(pi/4194304) q[124];
-rz(pi/2097152) q[145];
-cx q[145],q[125];
-rz(-pi/2097152) q[125];
-cx q[145],q[125];
-rz(pi/2097152) q[125];
-rz(pi/1048576) q[145];
-cx q[145],q[126];
-rz(-pi/1048576) q[126];
-cx q[145],q[126];
-rz(pi/1048576) q[126];
-rz(pi/524288) q[145];
-cx q[145],q[127];
-rz(-pi/524288) q[127];
-cx q[145],q[127];
-rz(pi/524288) q[127];
-rz(pi/262144) q[145];
-cx q[145],q[128];
-rz(-pi/262144) q[128];
-cx q[145],q[128];
-rz(pi/262144) q[128];
-rz(pi/131072) q[145];
-cx q[145],q[129];
-rz(-pi/131072) q[129];
-cx q[145],q[129];
-rz(pi/131072) q[129];
-rz(pi/65536) q[145];
-cx q[145],q[130];
-rz(-pi/65536) q[130];
-cx q[145],q[130];
-rz(pi/65536) q[130];
-rz(pi/32768) q[145];
-cx q[145],q[131];
-rz(-pi/32768) q[131];
-cx q[145],q[131];
-rz(pi/32768) q[131];
-rz(pi/16384) q[145];
-cx q[145],q[132];
-rz(-pi/16384) q[132];
-cx q[145],q[132];
-rz(pi/16384) q[132];
-rz(pi/8192) q[145];
-cx q[145],q[133];
-rz(-pi/8192) q[133];
-cx q[145],q[133];
-rz(pi/8192) q[133];
-rz(pi/4096) q[145];
-cx q[145],q[134];
-rz(-pi/4096) q[134];
-cx q[145],q[134];
-rz(pi/4096) q[134];
-rz(pi/2048) q[145];
-cx q[145],q[135];
-rz(-pi/2048) q[135];
-cx q[145],q[135];
-rz(pi/2048) q[135];
-rz(pi/1024) q[145];
-cx q[145],q[136];
-rz(-pi/1024) q[136];
-cx q[145],q[136];
-rz(pi/1024) q[136];
-rz(pi/512) q[145];
-cx q[145],q[137];
-rz(-pi/512) q[137];
-cx q[145],q[137];
-rz(pi/512) q[137];
-rz(pi/256) q[145];
-cx q[145],q[138];
-rz(-pi/256) q[138];
-cx q[145],q[138];
-rz(pi/256) q[138];
-rz(pi/128) q[145];
-cx q[145],q[139];
-rz(-pi/128) q[139];
-cx q[145],q[139];
-rz(pi/128) q[139];
-rz(pi/64) q[145];
-cx q[145],q[140];
-rz(-pi/64) q[140];
-cx q[145],q[140];
-rz(pi/64) q[140];
-rz(pi/32) q[145];
-cx q[145],q[141];
-rz(-pi/32) q[141];
-cx q[145],q[141];
-rz(pi/32) q[141];
-rz(pi/16) q[145];
-cx q[145],q[142];
-rz(-pi/16) q[142];
-cx q[145],q[142];
-rz(pi/16) q[142];
-rz(pi/8) q[145];
-cx q[145],q[143];
-rz(-pi/8) q[143];
-cx q[145],q[143];
-rz(pi/8) q[143];
-rz(pi/4) q[145];
-cx q[145],q[144];
-rz(-pi/4) q[144];
-cx q[145],q[144];
-rz(pi/4) q[144];
-rz(pi/2) q[145];
-sx q[145];
-rz(pi/2) q[145];
-rz(1.42863093678434e-12) q[146];
-cx q[146],q[106];
-rz(-1.42863093678434e-12) q[106];
-cx q[146],q[106];
-rz(1.42863093678434e-12) q[106];
-rz(2.85726187356867e-12) q[146];
-cx q[146],q[107];
-rz(-2.85726187356867e-12) q[107];
-cx q[146],q[107];
-rz(2.85726187356867e-12) q[107];
-rz(5.71452374713734e-12) q[146];
-cx q[146],q[108];
-rz(-5.71452374713734e-12) q[108];
-cx q[146],q[108];
-rz(5.71452374713734e-12) q[108];
-rz(1.14290474942747e-11) q[146];
-cx q[146],q[109];
-rz(-1.14290474942747e-11) q[109];
-cx q[146],q[109];
-rz(1.14290474942747e-11) q[109];
-rz(2.28580949885494e-11) q[146];
-cx q[146],q[110];
-rz(-2.28580949885494e-11) q[110];
-cx q[146],q[110];
-rz(2.28580949885494e-11) q[110];
-rz(4.57161899770987e-11) q[146];
-cx q[146],q[111];
-rz(-4.57161899770987e-11) q[111];
-cx q[146],q[111];
-rz(4.57161899770987e-11) q[111];
-rz(9.14323799541975e-11) q[146];
-cx q[146],q[112];
-rz(-9.14323799541975e-11) q[112];
-cx q[146],q[112];
-rz(9.14323799541975e-11) q[112];
-rz(1.82864759908395e-10) q[146];
-cx q[146],q[113];
-rz(-1.82864759908395e-10) q[113];
-cx q[146],q[113];
-rz(1.82864759908395e-10) q[113];
-rz(3.6572951981679e-10) q[146];
-cx q[146],q[114];
-rz(-3.6572951981679e-10) q[114];
-cx q[146],q[114];
-rz(3.6572951981679e-10) q[114];
-rz(7.3145903963358e-10) q[146];
-cx q[146],q[115];
-rz(-7.3145903963358e-10) q[115];
-cx q[146],q[115];
-rz(7.3145903963358e-10) q[115];
-rz(pi/2147483648) q[146];
-cx q[146],q[116];
-rz(-pi/2147483648) q[116];
-cx q[146],q[116];
-rz(pi/2147483648) q[116];
-rz(pi/1073741824) q[146];
-cx q[146],q[117];
-rz(-pi/1073741824) q[117];
-cx q[146],q[117];
-rz(pi/1073741824) q[117];
-rz(pi/536870912) q[146];
-cx q[146],q[118];
-rz(-pi/536870912) q[118];
-cx q[146],q[118];
-rz(pi/536870912) q[118];
-rz(pi/268435456) q[146];
-cx q[146],q[119];
-rz(-pi/268435456) q[119];
-cx q[146],q[119];
-rz(pi/268435456) q[119];
-rz(pi/134217728) q[146];
-cx q[146],q[120];
-rz(-pi/134217728) q[120];
-cx q[146],q[120];
-rz(pi/134217728) q[120];
-rz(pi/67108864) q[146];
-cx q[146],q[121];
-rz(-pi/67108864) q[121];
-cx q[146],q[121];
-rz(pi/67108864) q[121];
-rz(pi/33554432) q[146];
-cx q[146],q[122];
-rz(-pi/33554432) q[122];
-cx q[146],q[122];
-rz(pi/33554432) q[122];
-rz(pi/16777216) q[146];
-cx q[146],q[123];
-rz(-pi/16777216) q[123];
-cx q[146],q[123];
-rz(pi/16777216) q[123];
-rz(pi/8388608) q[146];
-cx q[146],q[124];
-rz(-pi/8388608) q[124];
-cx q[146],q[124];
-rz(pi/8388608) q[124];
-rz(pi/4194304) q[146];
-cx q[146],q[125];
-rz(-pi/4194304) q[125];
-cx q[146],q[125];
-rz(pi/4194304) q[125];
-rz(pi/2097152) q[146];
-cx q[146],q[126];
-rz(-pi/2097152) q[126];
-cx q[146],q[126];
-rz(pi/2097152) q[126];
-rz(pi/1048576) q[146];
-cx q[146],q[127];
-rz(-pi/1048576) q[127];
-cx q[146],q[127];
-rz(pi/1048576) q[127];
-rz(pi/524288) q[146];
-cx q[146],q[128];
-rz(-pi/524288) q[128];
-cx q[146],q[128];
-rz(pi/524288) q[128];
-rz(pi/262144) q[146];
-cx q[146],q[129];
-rz(-pi/262144) q[129];
-cx q[146],q[129];
-rz(pi/262144) q[129];
-rz(pi/131072) q[146];
-cx q[146],q[130];
-rz(-pi/131072) q[130];
-cx q[146],q[130];
-rz(pi/131072) q[130];
-rz(pi/65536) q[146];
-cx q[146],q[131];
-rz(-pi/65536) q[131];
-cx q[146],q[131];
-rz(pi/65536) q[131];
-rz(pi/32768) q[146];
-cx q[146],q[132];
-rz(-pi/32768) q[132];
-cx q[146],q[132];
-rz(pi/32768) q[132];
-rz(pi/16384) q[146];
-cx q[146],q[133];
-rz(-pi/16384) q[133];
-cx q[146],q[133];
-rz(pi/16384) q[133];
-rz(pi/8192) q[146];
-cx q[146],q[134];
-rz(-pi/8192) q[134];
-cx q[146],q[134];
-rz(pi/8192) q[134];
-rz(pi/4096) q[146];
-cx q[146],q[135];
-rz(-pi/4096) q[135];
-cx q[146],q[135];
-rz(pi/4096) q[135];
-rz(pi/2048) q[146];
-cx q[146],q[136];
-rz(-pi/2048) q[136];
-cx q[146],q[136];
-rz(pi/2048) q[136];
-rz(pi/1024) q[146];
-cx q[146],q[137];
-rz(-pi/1024) q[137];
-cx q[146],q[137];
-rz(pi/1024) q[137];
-rz(pi/512) q[146];
-cx q[146],q[138];
-rz(-pi/512) q[138];
-cx q[146],q[138];
-rz(pi/512) q[138];
-rz(pi/256) q[146];
-cx q[146],q[139];
-rz(-pi/256) q[139];
-cx q[146],q[139];
-rz(pi/256) q[139];
-rz(pi/128) q[146];
-cx q[146],q[140];
-rz(-pi/128) q[140];
-cx q[146],q[140];
-rz(pi/128) q[140];
-rz(pi/64) q[146];
-cx q[146],q[141];
-rz(-pi/64) q[141];
-cx q[146],q[141];
-rz(pi/64) q[141];
-rz(pi/32) q[146];
-cx q[146],q[142];
-rz(-pi/32) q[142];
-cx q[146],q[142];
-rz(pi/32) q[142];
-rz(pi/16) q[146];
-cx q[146],q[143];
-rz(-pi/16) q[143];
-cx q[146],q[143];
-rz(pi/16) q[143];
-rz(pi/8) q[146];
-cx q[146],q[144];
-rz(-pi/8) q[144];
-cx q[146],q[144];
-rz(pi/8) q[144];
-rz(pi/4) q[146];
-cx q[146],q[145];
-rz(-pi/4) q[145];
-cx q[146],q[145];
-rz(pi/4) q[145];
-rz(pi/2) q[146];
-sx q[146];
-rz(pi/2) q[146];
-rz(1.42863093678434e-12) q[147];
-cx q[147],q[107];
-rz(-1.42863093678434e-12) q[107];
-cx q[147],q[107];
-rz(1.42863093678434e-12) q[107];
-rz(2.85726187356867e-12) q[147];
-cx q[147],q[108];
-rz(-2.85726187356867e-12) q[108];
-cx q[147],q[108];
-rz(2.85726187356867e-12) q[108];
-rz(5.71452374713734e-12) q[147];
-cx q[147],q[109];
-rz(-5.71452374713734e-12) q[109];
-cx q[147],q[109];
-rz(5.71452374713734e-12) q[109];
-rz(1.14290474942747e-11) q[147];
-cx q[147],q[110];
-rz(-1.14290474942747e-11) q[110];
-cx q[147],q[110];
-rz(1.14290474942747e-11) q[110];
-rz(2.28580949885494e-11) q[147];
-cx q[147],q[111];
-rz(-2.28580949885494e-11) q[111];
-cx q[147],q[111];
-rz(2.28580949885494e-11) q[111];
-rz(4.57161899770987e-11) q[147];
-cx q[147],q[112];
-rz(-4.57161899770987e-11) q[112];
-cx q[147],q[112];
-rz(4.57161899770987e-11) q[112];
-rz(9.14323799541975e-11) q[147];
-cx q[147],q[113];
-rz(-9.14323799541975e-11) q[113];
-cx q[147],q[113];
-rz(9.14323799541975e-11) q[113];
-rz(1.82864759908395e-10) q[147];
-cx q[147],q[114];
-rz(-1.82864759908395e-10) q[114];
-cx q[147],q[114];
-rz(1.82864759908395e-10) q[114];
-rz(3.6572951981679e-10) q[147];
-cx q[147],q[115];
-rz(-3.6572951981679e-10) q[115];
-cx q[147],q[115];
-rz(3.6572951981679e-10) q[115];
-rz(7.3145903963358e-10) q[147];
-cx q[147],q[116];
-rz(-7.3145903963358e-10) q[116];
-cx q[147],q[116];
-rz(7.3145903963358e-10) q[116];
-rz(pi/2147483648) q[147];
-cx q[147],q[117];
-rz(-pi/2147483648) q[117];
-cx q[147],q[117];
-rz(pi/2147483648) q[117];
-rz(pi/1073741824) q[147];
-cx q[147],q[118];
-rz(-pi/1073741824) q[118];
-cx q[147],q[118];
-rz(pi/1073741824) q[118];
-rz(pi/536870912) q[147];
-cx q[147],q[119];
-rz(-pi/536870912) q[119];
-cx q[147],q[119];
-rz(pi/536870912) q[119];
-rz(pi/268435456) q[147];
-cx q[147],q[120];
-rz(-pi/268435456) q[120];
-cx q[147],q[120];
-rz(pi/268435456) q[120];
-rz(pi/134217728) q[147];
-cx q[147],q[121];
-rz(-pi/134217728) q[121];
-cx q[147],q[121];
-rz(pi/134217728) q[121];
-rz(pi/67108864) q[147];
-cx q[147],q[122];
-rz(-pi/67108864) q[122];
-cx q[147],q[122];
-rz(pi/67108864) q[122];
-rz(pi/33554432) q[147];
-cx q[147],q[123];
-rz(-pi/33554432) q[123];
-cx q[147],q[123];
-rz(pi/33554432) q[123];
-rz(pi/16777216) q[147];
-cx q[147],q[124];
-rz(-pi/16777216) q[124];
-cx q[147],q[124];
-rz(pi/16777216) q[124];
-rz(pi/8388608) q[147];
-cx q[147],q[125];
-rz(-pi/8388608) q[125];
-cx q[147],q[125];
-rz(pi/8388608) q[125];
-rz(pi/4194304) q[147];
-cx q[147],q[126];
-rz(-pi/4194304) q[126];
-cx q[147],q[126];
-rz(pi/4194304) q[126];
-rz(pi/2097152) q[147];
-cx q[147],q[127];
-rz(-pi/2097152) q[127];
-cx q[147],q[127];
-rz(pi/2097152) q[127];
-rz(pi/1048576) q[147];
-cx q[147],q[128];
-rz(-pi/1048576) q[128];
-cx q[147],q[128];
-rz(pi/1048576) q[128];
-rz(pi/524288) q[147];
-cx q[147],q[129];
-rz(-pi/524288) q[129];
-cx q[147],q[129];
-rz(pi/524288) q[129];
-rz(pi/262144) q[147];
-cx q[147],q[130];
-rz(-pi/262144) q[130];
-cx q[147],q[130];
-rz(pi/262144) q[130];
-rz(pi/131072) q[147];
-cx q[147],q[131];
-rz(-pi/131072) q[131];
-cx q[147],q[131];
-rz(pi/131072) q[131];
-rz(pi/65536) q[147];
-cx q[147],q[132];
-rz(-pi/65536) q[132];
-cx q[147],q[132];
-rz(pi/65536) q[132];
-rz(pi/32768) q[147];
-cx q[147],q[133];
-rz(-pi/32768) q[133];
-cx q[147],q[133];
-rz(pi/32768) q[133];
-rz(pi/16384) q[147];
-cx q[147],q[134];
-rz(-pi/16384) q[134];
-cx q[147],q[134];
-rz(pi/16384) q[134];
-rz(pi/8192) q[147];
-cx q[147],q[135];
-rz(-pi/8192) q[135];
-cx q[147],q[135];
-rz(pi/8192) q[135];
-rz(pi/4096) q[147];
-cx q[147],q[136];
-rz(-pi/4096) q[136];
-cx q[147],q[136];
-rz(pi/4096) q[136];
-rz(pi/2048) q[147];
-cx q[147],q[137];
-rz(-pi/2048) q[137];
-cx q[147],q[137];
-rz(pi/2048) q[137];
-rz(pi/1024) q[147];
-cx q[147],q[138];
-rz(-pi/1024) q[138];
-cx q[147],q[138];
-rz(pi/1024) q[138];
-rz(pi/512) q[147];
-cx q[147],q[139];
-rz(-pi/512) q[139];
-cx q[147],q[139];
-rz(pi/512) q[139];
-rz(pi/256) q[147];
-cx q[147],q[140];
-rz(-pi/256) q[140];
-cx q[147],q[140];
-rz(pi/256) q[140];
-rz(pi/128) q[147];
-cx q[147],q[141];
-rz(-pi/128) q[141];
-cx q[147],q[141];
-rz(pi/128) q[141];
-rz(pi/64) q[147];
-cx q[147],q[142];
-rz(-pi/64) q[142];
-cx q[147],q[142];
-rz(pi/64) q[142];
-rz(pi/32) q[147];
-cx q[147],q[143];
-rz(-pi/32) q[143];
-cx q[147],q[143];
-rz(pi/32) q[143];
-rz(pi/16) q[147];
-cx q[147],q[144];
-rz(-pi/16) q[144];
-cx q[147],q[144];
-rz(pi/16) q[144];
-rz(pi/8) q[147];
-cx q[147],q[145];
-rz(-pi/8) q[145];
-cx q[147],q[145];
-rz(pi/8) q[145];
-rz(pi/4) q[147];
-cx q[147],q[146];
-rz(-pi/4) q[146];
-cx q[147],q[146];
-rz(pi/4) q[146];
-rz(pi/2) q[147];
-sx q[147];
-rz(pi/2) q[147];
-rz(1.42863093678434e-12) q[148];
-cx q[148],q[108];
-rz(-1.42863093678434e-12) q[108];
-cx q[148],q[108];
-rz(1.42863093678434e-12) q[108];
-rz(2.85726187356867e-12) q[148];
-cx q[148],q[109];
-rz(-2.85726187356867e-12) q[109];
-cx q[148],q[109];
-rz(2.85726187356867e-12) q[109];
-rz(5.71452374713734e-12) q[148];
-cx q[148],q[110];
-rz(-5.71452374713734e-12) q[110];
-cx q[148],q[110];
-rz(5.71452374713734e-12) q[110];
-rz(1.14290474942747e-11) q[148];
-cx q[148],q[111];
-rz(-1.14290474942747e-11) q[111];
-cx q[148],q[111];
-rz(1.14290474942747e-11) q[111];
-rz(2.28580949885494e-11) q[148];
-cx q[148],q[112];
-rz(-2.28580949885494e-11) q[112];
-cx q[148],q[112];
-rz(2.28580949885494e-11) q[112];
-rz(4.57161899770987e-11) q[148];
-cx q[148],q[113];
-rz(-4.57161899770987e-11) q[113];
-cx q[148],q[113];
-rz(4.57161899770987e-11) q[113];
-rz(9.14323799541975e-11) q[148];
-cx q[148],q[114];
-rz(-9.14323799541975e-11) q[114];
-cx q[148],q[114];
-rz(9.14323799541975e-11) q[114];
-rz(1.82864759908395e-10) q[148];
-cx q[148],q[115];
-rz(-1.82864759908395e-10) q[115];
-cx q[148],q[115];
-rz(1.82864759908395e-10) q[115];
-rz(3.6572951981679e-10) q[148];
-cx q[148],q[116];
-rz(-3.6572951981679e-10) q[116];
-cx q[148],q[116];
-rz(3.6572951981679e-10) q[116];
-rz(7.3145903963358e-10) q[148];
-cx q[148],q[117];
-rz(-7.3145903963358e-10) q[117];
-cx q[148],q[117];
-rz(7.3145903963358e-10) q[117];
-rz(pi/2147483648) q[148];
-cx q[148],q[118];
-rz(-pi/2147483648) q[118];
-cx q[148],q[118];
-rz(pi/2147483648) q[118];
-rz(pi/1073741824) q[148];
-cx q[148],q[119];
-rz(-pi/1073741824) q[119];
-cx q[148],q[119];
-rz(pi/1073741824) q[119];
-rz(pi/536870912) q[148];
-cx q[148],q[120];
-rz(-pi/536870912) q[120];
-cx q[148],q[120];
-rz(pi/536870912) q[120];
-rz(pi/268435456) q[148];
-cx q[148],q[121];
-rz(-pi/268435456) q[121];
-cx q[148],q[121];
-rz(pi/268435456) q[121];
-rz(pi/134217728) q[148];
-cx q[148],q[122];
-rz(-pi/134217728) q[122];
-cx q[148],q[122];
-rz(pi/134217728) q[122];
-rz(pi/67108864) q[148];
-cx q[148],q[123];
-rz(-pi/67108864) q[123];
-cx q[148],q[123];
-rz(pi/67108864) q[123];
-rz(pi/33554432) q[148];
-cx q[148],q[124];
-rz(-pi/33554432) q[124];
-cx q[148],q[124];
-rz(pi/33554432) q[124];
-rz(pi/16777216) q[148];
-cx q[148],q[125];
-rz(-pi/16777216) q[125];
-cx q[148],q[125];
-rz(pi/16777216) q[125];
-rz(pi/8388608) q[148];
-cx q[148],q[126];
-rz(-pi/8388608) q[126];
-cx q[148],q[126];
-rz(pi/8388608) q[126];
-rz(pi/4194304) q[148];
-cx q[148],q[127];
-rz(-pi/4194304) q[127];
-cx q[148],q[127];
-rz(pi/4194304) q[127];
-rz(pi/2097152) q[148];
-cx q[148],q[128];
-rz(-pi/2097152) q[128];
-cx q[148],q[128];
-rz(pi/2097152) q[128];
-rz(pi/1048576) q[148];
-cx q[148],q[129];
-rz(-pi/1048576) q[129];
-cx q[148],q[129];
-rz(pi/1048576) q[129];
-rz(pi/524288) q[148];
-cx q[148],q[130];
-rz(-pi/524288) q[130];
-cx q[148],q[130];
-rz(pi/524288) q[130];
-rz(pi/262144) q[148];
-cx q[148],q[131];
-rz(-pi/262144) q[131];
-cx q[148],q[131];
-rz(pi/262144) q[131];
-rz(pi/131072) q[148];
-cx q[148],q[132];
-rz(-pi/131072) q[132];
-cx q[148],q[132];
-rz(pi/131072) q[132];
-rz(pi/65536) q[148];
-cx q[148],q[133];
-rz(-pi/65536) q[133];
-cx q[148],q[133];
-rz(pi/65536) q[133];
-rz(pi/32768) q[148];
-cx q[148],q[134];
-rz(-pi/32768) q[134];
-cx q[148],q[134];
-rz(pi/32768) q[134];
-rz(pi/16384) q[148];
-cx q[148],q[135];
-rz(-pi/16384) q[135];
-cx q[148],q[135];
-rz(pi/16384) q[135];
-rz(pi/8192) q[148];
-cx q[148],q[136];
-rz(-pi/8192) q[136];
-cx q[148],q[136];
-rz(pi/8192) q[136];
-rz(pi/4096) q[148];
-cx q[148],q[137];
-rz(-pi/4096) q[137];
-cx q[148],q[137];
-rz(pi/4096) q[137];
-rz(pi/2048) q[148];
-cx q[148],q[138];
-rz(-pi/2048) q[138];
-cx q[148],q[138];
-rz(pi/2048) q[138];
-rz(pi/1024) q[148];
-cx q[148],q[139];
-rz(-pi/1024) q[139];
-cx q[148],q[139];
-rz(pi/1024) q[139];
-rz(pi/512) q[148];
-cx q[148],q[140];
-rz(-pi/512) q[140];
-cx q[148],q[140];
-rz(pi/512) q[140];
-rz(pi/256) q[148];
-cx q[148],q[141];
-rz(-pi/256) q[141];
-cx q[148],q[141];
-rz(pi/256) q[141];
-rz(pi/128) q[148];
-cx q[148],q[142];
-rz(-pi/128) q[142];
-cx q[148],q[142];
-rz(pi/128) q[142];
-rz(pi/64) q[148];
-cx q[148],q[143];
-rz(-pi/64) q[143];
-cx q[148],q[143];
-rz(pi/64) q[143];
-rz(pi/32) q[148];
-cx q[148],q[144];
-rz(-pi/32) q[144];
-cx q[148],q[144];
-rz(pi/32) q[144];
-rz(pi/16) q[148];
-cx q[148],q[145];
-rz(-pi/16) q[145];
-cx q[148],q[145];
-rz(pi/16) q[145];
-rz(pi/8) q[148];
-cx q[148],q[146];
-rz(-pi/8) q[146];
-cx q[148],q[146];
-rz(pi/8) q[146];
-rz(pi/4) q[148];
-cx q[148],q[147];
-rz(-pi/4) q[147];
-cx q[148],q[147];
-rz(pi/4) q[147];
-rz(pi/2) q[148];
-sx q[148];
-rz(pi/2) q[148];
-rz(1.42863093678434e-12) q[149];
-cx q[149],q[109];
-rz(-1.42863093678434e-12) q[109];
-cx q[149],q[109];
-rz(1.42863093678434e-12) q[109];
-rz(2.85726187356867e-12) q[149];
-cx q[149],q[110];
-rz(-2.85726187356867e-12) q[110];
-cx q[149],q[110];
-rz(2.85726187356867e-12) q[110];
-rz(5.71452374713734e-12) q[149];
-cx q[149],q[111];
-rz(-5.71452374713734e-12) q[111];
-cx q[149],q[111];
-rz(5.71452374713734e-12) q[111];
-rz(1.14290474942747e-11) q[149];
-cx q[149],q[112];
-rz(-1.14290474942747e-11) q[112];
-cx q[149],q[112];
-rz(1.14290474942747e-11) q[112];
-rz(2.28580949885494e-11) q[149];
-cx q[149],q[113];
-rz(-2.28580949885494e-11) q[113];
-cx q[149],q[113];
-rz(2.28580949885494e-11) q[113];
-rz(4.57161899770987e-11) q[149];
-cx q[149],q[114];
-rz(-4.57161899770987e-11) q[114];
-cx q[149],q[114];
-rz(4.57161899770987e-11) q[114];
-rz(9.14323799541975e-11) q[149];
-cx q[149],q[115];
-rz(-9.14323799541975e-11) q[115];
-cx q[149],q[115];
-rz(9.14323799541975e-11) q[115];
-rz(1.82864759908395e-10) q[149];
-cx q[149],q[116];
-rz(-1.82864759908395e-10) q[116];
-cx q[149],q[116];
-rz(1.82864759908395e-10) q[116];
-rz(3.6572951981679e-10) q[149];
-cx q[149],q[117];
-rz(-3.6572951981679e-10) q[117];
-cx q[149],q[117];
-rz(3.6572951981679e-10) q[117];
-rz(7.3145903963358e-10) q[149];
-cx q[149],q[118];
-rz(-7.3145903963358e-10) q[118];
-cx q[149],q[118];
-rz(7.3145903963358e-10) q[118];
-rz(pi/2147483648) q[149];
-cx q[149],q[119];
-rz(-pi/2147483648) q[119];
-cx q[149],q[119];
-rz(pi/2147483648) q[119];
-rz(pi/1073741824) q[149];
-cx q[149],q[120];
-rz(-pi/1073741824) q[120];
-cx q[149],q[120];
-rz(pi/1073741824) q[120];
-rz(pi/536870912) q[149];
-cx q[149],q[121];
-rz(-pi/536870912) q[121];
-cx q[149],q[121];
-rz(pi/536870912) q[121];
-rz(pi/268435456) q[149];
-cx q[149],q[122];
-rz(-pi/268435456) q[122];
-cx q[149],q[122];
-rz(pi/268435456) q[122];
-rz(pi/134217728) q[149];
-cx q[149],q[123];
-rz(-pi/134217728) q[123];
-cx q[149],q[123];
-rz(pi/134217728) q[123];
-rz(pi/67108864) q[149];
-cx q[149],q[124];
-rz(-pi/67108864) q[124];
-cx q[149],q[124];
-rz(pi/67108864) q[124];
-rz(pi/33554432) q[149];
-cx q[149],q[125];
-rz(-pi/33554432) q[125];
-cx q[149],q[125];
-rz(pi/33554432) q[125];
-rz(pi/16777216) q[149];
-cx q[149],q[126];
-rz(-pi/16777216) q[126];
-cx q[149],q[126];
-rz(pi/16777216) q[126];
-rz(pi/8388608) q[149];
-cx q[149],q[127];
-rz(-pi/8388608) q[127];
-cx q[149],q[127];
-rz(pi/8388608) q[127];
-rz(pi/4194304) q[149];
-cx q[149],q[128];
-rz(-pi/4194304) q[128];
-cx q[149],q[128];
-rz(pi/4194304) q[128];
-rz(pi/2097152) q[149];
-cx q[149],q[129];
-rz(-pi/2097152) q[129];
-cx q[149],q[129];
-rz(pi/2097152) q[129];
-rz(pi/1048576) q[149];
-cx q[149],q[130];
-rz(-pi/1048576) q[130];
-cx q[149],q[130];
-rz(pi/1048576) q[130];
-rz(pi/524288) q[149];
-cx q[149],q[131];
-rz(-pi/524288) q[131];
-cx q[149],q[131];
-rz(pi/524288) q[131];
-rz(pi/262144) q[149];
-cx q[149],q[132];
-rz(-pi/262144) q[132];
-cx q[149],q[132];
-rz(pi/262144) q[132];
-rz(pi/131072) q[149];
-cx q[149],q[133];
-rz(-pi/131072) q[133];
-cx q[149],q[133];
-rz(pi/131072) q[133];
-rz(pi/65536) q[149];
-cx q[149],q[134];
-rz(-pi/65536) q[134];
-cx q[149],q[134];
-rz(pi/65536) q[134];
-rz(pi/32768) q[149];
-cx q[149],q[135];
-rz(-pi/32768) q[135];
-cx q[149],q[135];
-rz(pi/32768) q[135];
-rz(pi/16384) q[149];
-cx q[149],q[136];
-rz(-pi/16384) q[136];
-cx q[149],q[136];
-rz(pi/16384) q[136];
-rz(pi/8192) q[149];
-cx q[149],q[137];
-rz(-pi/8192) q[137];
-cx q[149],q[137];
-rz(pi/8192) q[137];
-rz(pi/4096) q[149];
-cx q[149],q[138];
-rz(-pi/4096) q[138];
-cx q[149],q[138];
-rz(pi/4096) q[138];
-rz(pi/2048) q[149];
-cx q[149],q[139];
-rz(-pi/2048) q[139];
-cx q[149],q[139];
-rz(pi/2048) q[139];
-rz(pi/1024) q[149];
-cx q[149],q[140];
-rz(-pi/1024) q[140];
-cx q[149],q[140];
-rz(pi/1024) q[140];
-rz(pi/512) q[149];
-cx q[149],q[141];
-rz(-pi/512) q[141];
-cx q[149],q[141];
-rz(pi/512) q[141];
-rz(pi/256) q[149];
-cx q[149],q[142];
-rz(-pi/256) q[142];
-cx q[149],q[142];
-rz(pi/256) q[142];
-rz(pi/128) q[149];
-cx q[149],q[143];
-rz(-pi/128) q[143];
-cx q[149],q[143];
-rz(pi/128) q[143];
-rz(pi/64) q[149];
-cx q[149],q[144];
-rz(-pi/64) q[144];
-cx q[149],q[144];
-rz(pi/64) q[144];
-rz(pi/32) q[149];
-cx q[149],q[145];
-rz(-pi/32) q[145];
-cx q[149],q[145];
-rz(pi/32) q[145];
-rz(pi/16) q[149];
-cx q[149],q[146];
-rz(-pi/16) q[146];
-cx q[149],q[146];
-rz(pi/16) q[146];
-rz(pi/8) q[149];
-cx q[149],q[147];
-rz(-pi/8) q[147];
-cx q[149],q[147];
-rz(pi/8) q[147];
-rz(pi/4) q[149];
-cx q[149],q[148];
-rz(-pi/4) q[148];
-cx q[149],q[148];
-rz(pi/4) q[148];
-rz(pi/2) q[149];
-sx q[149];
-rz(pi/2) q[149];
-rz(1.42863093678434e-12) q[150];
-cx q[150],q[110];
-rz(-1.42863093678434e-12) q[110];
-cx q[150],q[110];
-rz(1.42863093678434e-12) q[110];
-rz(2.85726187356867e-12) q[150];
-cx q[150],q[111];
-rz(-2.85726187356867e-12) q[111];
-cx q[150],q[111];
-rz(2.85726187356867e-12) q[111];
-rz(5.71452374713734e-12) q[150];
-cx q[150],q[112];
-rz(-5.71452374713734e-12) q[112];
-cx q[150],q[112];
-rz(5.71452374713734e-12) q[112];
-rz(1.14290474942747e-11) q[150];
-cx q[150],q[113];
-rz(-1.14290474942747e-11) q[113];
-cx q[150],q[113];
-rz(1.14290474942747e-11) q[113];
-rz(2.28580949885494e-11) q[150];
-cx q[150],q[114];
-rz(-2.28580949885494e-11) q[114];
-cx q[150],q[114];
-rz(2.28580949885494e-11) q[114];
-rz(4.57161899770987e-11) q[150];
-cx q[150],q[115];
-rz(-4.57161899770987e-11) q[115];
-cx q[150],q[115];
-rz(4.57161899770987e-11) q[115];
-rz(9.14323799541975e-11) q[150];
-cx q[150],q[116];
-rz(-9.14323799541975e-11) q[116];
-cx q[150],q[116];
-rz(9.14323799541975e-11) q[116];
-rz(1.82864759908395e-10) q[150];
-cx q[150],q[117];
-rz(-1.82864759908395e-10) q[117];
-cx q[150],q[117];
-rz(1.82864759908395e-10) q[117];
-rz(3.6572951981679e-10) q[150];
-cx q[150],q[118];
-rz(-3.6572951981679e-10) q[118];
-cx q[150],q[118];
-rz(3.6572951981679e-10) q[118];
-rz(7.3145903963358e-10) q[150];
-cx q[150],q[119];
-rz(-7.3145903963358e-10) q[119];
-cx q[150],q[119];
-rz(7.3145903963358e-10) q[119];
-rz(pi/2147483648) q[150];
-cx q[150],q[120];
-rz(-pi/2147483648) q[120];
-cx q[150],q[120];
-rz(pi/2147483648) q[120];
-rz(pi/1073741824) q[150];
-cx q[150],q[121];
-rz(-pi/1073741824) q[121];
-cx q[150],q[121];
-rz(pi/1073741824) q[121];
-rz(pi/536870912) q[150];
-cx q[150],q[122];
-rz(-pi/536870912) q[122];
-cx q[150],q[122];
-rz(pi/536870912) q[122];
-rz(pi/268435456) q[150];
-cx q[150],q[123];
-rz(-pi/268435456) q[123];
-cx q[150],q[123];
-rz(pi/268435456) q[123];
-rz(pi/134217728) q[150];
-cx q[150],q[124];
-rz(-pi/134217728) q[124];
-cx q[150],q[124];
-rz(pi/134217728) q[124];
-rz(pi/67108864) q[150];
-cx q[150],q[125];
-rz(-pi/67108864) q[125];
-cx q[150],q[125];
-rz(pi/67108864) q[125];
-rz(pi/33554432) q[150];
-cx q[150],q[126];
-rz(-pi/33554432) q[126];
-cx q[150],q[126];
-rz(pi/33554432) q[126];
-rz(pi/16777216) q[150];
-cx q[150],q[127];
-rz(-pi/16777216) q[127];
-cx q[150],q[127];
-rz(pi/16777216) q[127];
-rz(pi/8388608) q[150];
-cx q[150],q[128];
-rz(-pi/8388608) q[128];
-cx q[150],q[128];
-rz(pi/8388608) q[128];
-rz(pi/4194304) q[150];
-cx q[150],q[129];
-rz(-pi/4194304) q[129];
-cx q[150],q[129];
-rz(pi/4194304) q[129];
-rz(pi/2097152) q[150];
-cx q[150],q[130];
-rz(-pi/2097152) q[130];
-cx q[150],q[130];
-rz(pi/2097152) q[130];
-rz(pi/1048576) q[150];
-cx q[150],q[131];
-rz(-pi/1048576) q[131];
-cx q[150],q[131];
-rz(pi/1048576) q[131];
-rz(pi/524288) q[150];
-cx q[150],q[132];
-rz(-pi/524288) q[132];
-cx q[150],q[132];
-rz(pi/524288) q[132];
-rz(pi/262144) q[150];
-cx q[150],q[133];
-rz(-pi/262144) q[133];
-cx q[150],q[133];
-rz(pi/262144) q[133];
-rz(pi/131072) q[150];
-cx q[150],q[134];
-rz(-pi/131072) q[134];
-cx q[150],q[134];
-rz(pi/131072) q[134];
-rz(pi/65536) q[150];
-cx q[150],q[135];
-rz(-pi/65536) q[135];
-cx q[150],q[135];
-rz(pi/65536) q[135];
-rz(pi/32768) q[150];
-cx q[150],q[136];
-rz(-pi/32768) q[136];
-cx q[150],q[136];
-rz(pi/32768) q[136];
-rz(pi/16384) q[150];
-cx q[150],q[137];
-rz(-pi/16384) q[137];
-cx q[150],q[137];
-rz(pi/16384) q[137];
-rz(pi/8192) q[150];
-cx q[150],q[138];
-rz(-pi/8192) q[138];
-cx q[150],q[138];
-rz(pi/8192) q[138];
-rz(pi/4096) q[150];
-cx q[150],q[139];
-rz(-pi/4096) q[139];
-cx q[150],q[139];
-rz(pi/4096) q[139];
-rz(pi/2048) q[150];
-cx q[150],q[140];
-rz(-pi/2048) q[140];
-cx q[150],q[140];
-rz(pi/2048) q[140];
-rz(pi/1024) q[150];
-cx q[150],q[141];
-rz(-pi/1024) q[141];
-cx q[150],q[141];
-rz(pi/1024) q[141];
-rz(pi/512) q[150];
-cx q[150],q[142];
-rz(-pi/512) q[142];
-cx q[150],q[142];
-rz(pi/512) q[142];
-rz(pi/256) q[150];
-cx q[150],q[143];
-rz(-pi/256) q[143];
-cx q[150],q[143];
-rz(pi/256) q[143];
-rz(pi/128) q[150];
-cx q[150],q[144];
-rz(-pi/128) q[144];
-cx q[150],q[144];
-rz(pi/128) q[144];
-rz(pi/64) q[150];
-cx q[150],q[145];
-rz(-pi/64) q[145];
-cx q[150],q[145];
-rz(pi/64) q[145];
-rz(pi/32) q[150];
-cx q[150],q[146];
-rz(-pi/32) q[146];
-cx q[150],q[146];
-rz(pi/32) q[146];
-rz(pi/16) q[150];
-cx q[150],q[147];
-rz(-pi/16) q[147];
-cx q[150],q[147];
-rz(pi/16) q[147];
-rz(pi/8) q[150];
-cx q[150],q[148];
-rz(-pi/8) q[148];
-cx q[150],q[148];
-rz(pi/8) q[148];
-rz(pi/4) q[150];
-cx q[150],q[149];
-rz(-pi/4) q[149];
-cx q[150],q[149];
-rz(pi/4) q[149];
-rz(pi/2) q[150];
-sx q[150];
-rz(pi/2) q[150];
-rz(1.42863093678434e-12) q[151];
-cx q[151],q[111];
-rz(-1.42863093678434e-12) q[111];
-cx q[151],q[111];
-rz(1.42863093678434e-12) q[111];
-rz(2.85726187356867e-12) q[151];
-cx q[151],q[112];
-rz(-2.85726187356867e-12) q[112];
-cx q[151],q[112];
-rz(2.85726187356867e-12) q[112];
-rz(5.71452374713734e-12) q[151];
-cx q[151],q[113];
-rz(-5.71452374713734e-12) q[113];
-cx q[151],q[113];
-rz(5.71452374713734e-12) q[113];
-rz(1.14290474942747e-11) q[151];
-cx q[151],q[114];
-rz(-1.14290474942747e-11) q[114];
-cx q[151],q[114];
-rz(1.14290474942747e-11) q[114];
-rz(2.28580949885494e-11) q[151];
-cx q[151],q[115];
-rz(-2.28580949885494e-11) q[115];
-cx q[151],q[115];
-rz(2.28580949885494e-11) q[115];
-rz(4.57161899770987e-11) q[151];
-cx q[151],q[116];
-rz(-4.57161899770987e-11) q[116];
-cx q[151],q[116];
-rz(4.57161899770987e-11) q[116];
-rz(9.14323799541975e-11) q[151];
-cx q[151],q[117];
-rz(-9.14323799541975e-11) q[117];
-cx q[151],q[117];
-rz(9.14323799541975e-11) q[117];
-rz(1.82864759908395e-10) q[151];
-cx q[151],q[118];
-rz(-1.82864759908395e-10) q[118];
-cx q[151],q[118];
-rz(1.82864759908395e-10) q[118];
-rz(3.6572951981679e-10) q[151];
-cx q[151],q[119];
-rz(-3.6572951981679e-10) q[119];
-cx q[151],q[119];
-rz(3.6572951981679e-10) q[119];
-rz(7.3145903963358e-10) q[151];
-cx q[151],q[120];
-rz(-7.3145903963358e-10) q[120];
-cx q[151],q[120];
-rz(7.3145903963358e-10) q[120];
-rz(pi/2147483648) q[151];
-cx q[151],q[121];
-rz(-pi/2147483648) q[121];
-cx q[151],q[121];
-rz(pi/2147483648) q[121];
-rz(pi/1073741824) q[151];
-cx q[151],q[122];
-rz(-pi/1073741824) q[122];
-cx q[151],q[122];
-rz(pi/1073741824) q[122];
-rz(pi/536870912) q[151];
-cx q[151],q[123];
-rz(-pi/536870912) q[123];
-cx q[151],q[123];
-rz(pi/536870912) q[123];
-rz(pi/268435456) q[151];
-cx q[151],q[124];
-rz(-pi/268435456) q[124];
-cx q[151],q[124];
-rz(pi/268435456) q[124];
-rz(pi/134217728) q[151];
-cx q[151],q[125];
-rz(-pi/134217728) q[125];
-cx q[151],q[125];
-rz(pi/134217728) q[125];
-rz(pi/67108864) q[151];
-cx q[151],q[126];
-rz(-pi/67108864) q[126];
-cx q[151],q[126];
-rz(pi/67108864) q[126];
-rz(pi/33554432) q[151];
-cx q[151],q[127];
-rz(-pi/33554432) q[127];
-cx q[151],q[127];
-rz(pi/33554432) q[127];
-rz(pi/16777216) q[151];
-cx q[151],q[128];
-rz(-pi/16777216) q[128];
-cx q[151],q[128];
-rz(pi/16777216) q[128];
-rz(pi/8388608) q[151];
-cx q[151],q[129];
-rz(-pi/8388608) q[129];
-cx q[151],q[129];
-rz(pi/8388608) q[129];
-rz(pi/4194304) q[151];
-cx q[151],q[130];
-rz(-pi/4194304) q[130];
-cx q[151],q[130];
-rz(pi/4194304) q[130];
-rz(pi/2097152) q[151];
-cx q[151],q[131];
-rz(-pi/2097152) q[131];
-cx q[151],q[131];
-rz(pi/2097152) q[131];
-rz(pi/1048576) q[151];
-cx q[151],q[132];
-rz(-pi/1048576) q[132];
-cx q[151],q[132];
-rz(pi/1048576) q[132];
-rz(pi/524288) q[151];
-cx q[151],q[133];
-rz(-pi/524288) q[133];
-cx q[151],q[133];
-rz(pi/524288) q[133];
-rz(pi/262144) q[151];
-cx q[151],q[134];
-rz(-pi/262144) q[134];
-cx q[151],q[134];
-rz(pi/262144) q[134];
-rz(pi/131072) q[151];
-cx q[151],q[135];
-rz(-pi/131072) q[135];
-cx q[151],q[135];
-rz(pi/131072) q[135];
-rz(pi/65536) q[151];
-cx q[151],q[136];
-rz(-pi/65536) q[136];
-cx q[151],q[136];
-rz(pi/65536) q[136];
-rz(pi/32768) q[151];
-cx q[151],q[137];
-rz(-pi/32768) q[137];
-cx q[151],q[137];
-rz(pi/32768) q[137];
-rz(pi/16384) q[151];
-cx q[151],q[138];
-rz(-pi/16384) q[138];
-cx q[151],q[138];
-rz(pi/16384) q[138];
-rz(pi/8192) q[151];
-cx q[151],q[139];
-rz(-pi/8192) q[139];
-cx q[151],q[139];
-rz(pi/8192) q[139];
-rz(pi/4096) q[151];
-cx q[151],q[140];
-rz(-pi/4096) q[140];
-cx q[151],q[140];
-rz(pi/4096) q[140];
-rz(pi/2048) q[151];
-cx q[151],q[141];
-rz(-pi/2048) q[141];
-cx q[151],q[141];
-rz(pi/2048) q[141];
-rz(pi/1024) q[151];
-cx q[151],q[142];
-rz(-pi/1024) q[142];
-cx q[151],q[142];
-rz(pi/1024) q[142];
-rz(pi/512) q[151];
-cx q[151],q[143];
-rz(-pi/512) q[143];
-cx q[151],q[143];
-rz(pi/512) q[143];
-rz(pi/256) q[151];
-cx q[151],q[144];
-rz(-pi/256) q[144];
-cx q[151],q[144];
-rz(pi/256) q[144];
-rz(pi/128) q[151];
-cx q[151],q[145];
-rz(-pi/128) q[145];
-cx q[151],q[145];
-rz(pi/128) q[145];
-rz(pi/64) q[151];
-cx q[151],q[146];
-rz(-pi/64) q[146];
-cx q[151],q[146];
-rz(pi/64) q[146];
-rz(pi/32) q[151];
-cx q[151],q[147];
-rz(-pi/32) q[147];
-cx q[151],q[147];
-rz(pi/32) q[147];
-rz(pi/16) q[151];
-cx q[151],q[148];
-rz(-pi/16) q[148];
-cx q[151],q[148];
-rz(pi/16) q[148];
-rz(pi/8) q[151];
-cx q[151],q[149];
-rz(-pi/8) q[149];
-cx q[151],q[149];
-rz(pi/8) q[149];
-rz(pi/4) q[151];
-cx q[151],q[150];
-rz(-pi/4) q[150];
-cx q[151],q[150];
-rz(pi/4) q[150];
-rz(pi/2) q[151];
-sx q[151];
-rz(pi/2) q[151];
-rz(1.42863093678434e-12) q[152];
-cx q[152],q[112];
-rz(-1.42863093678434e-12) q[112];
-cx q[152],q[112];
-rz(1.42863093678434e-12) q[112];
-rz(2.85726187356867e-12) q[152];
-cx q[152],q[113];
-rz(-2.85726187356867e-12) q[113];
-cx q[152],q[113];
-rz(2.85726187356867e-12) q[113];
-rz(5.71452374713734e-12) q[152];
-cx q[152],q[114];
-rz(-5.71452374713734e-12) q[114];
-cx q[152],q[114];
-rz(5.71452374713734e-12) q[114];
-rz(1.14290474942747e-11) q[152];
-cx q[152],q[115];
-rz(-1.14290474942747e-11) q[115];
-cx q[152],q[115];
-rz(1.14290474942747e-11) q[115];
-rz(2.28580949885494e-11) q[152];
-cx q[152],q[116];
-rz(-2.28580949885494e-11) q[116];
-cx q[152],q[116];
-rz(2.28580949885494e-11) q[116];
-rz(4.57161899770987e-11) q[152];
-cx q[152],q[117];
-rz(-4.57161899770987e-11) q[117];
-cx q[152],q[117];
-rz(4.57161899770987e-11) q[117];
-rz(9.14323799541975e-11) q[152];
-cx q[152],q[118];
-rz(-9.14323799541975e-11) q[118];
-cx q[152],q[118];
-rz(9.14323799541975e-11) q[118];
-rz(1.82864759908395e-10) q[152];
-cx q[152],q[119];
-rz(-1.82864759908395e-10) q[119];
-cx q[152],q[119];
-rz(1.82864759908395e-10) q[119];
-rz(3.6572951981679e-10) q[152];
-cx q[152],q[120];
-rz(-3.6572951981679e-10) q[120];
-cx q[152],q[120];
-rz(3.6572951981679e-10) q[120];
-rz(7.3145903963358e-10) q[152];
-cx q[152],q[121];
-rz(-7.3145903963358e-10) q[121];
-cx q[152],q[121];
-rz(7.3145903963358e-10) q[121];
-rz(pi/2147483648) q[152];
-cx q[152],q[122];
-rz(-pi/2147483648) q[122];
-cx q[152],q[122];
-rz(pi/2147483648) q[122];
-rz(pi/1073741824) q[152];
-cx q[152],q[123];
-rz(-pi/1073741824) q[123];
-cx q[152],q[123];
-rz(pi/1073741824) q[123];
-rz(pi/536870912) q[152];
-cx q[152],q[124];
-rz(-pi/536870912) q[124];
-cx q[152],q[124];
-rz(pi/536870912) q[124];
-rz(pi/268435456) q[152];
-cx q[152],q[125];
-rz(-pi/268435456) q[125];
-cx q[152],q[125];
-rz(pi/268435456) q[125];
-rz(pi/134217728) q[152];
-cx q[152],q[126];
-rz(-pi/134217728) q[126];
-cx q[152],q[126];
-rz(pi/134217728) q[126];
-rz(pi/67108864) q[152];
-cx q[152],q[127];
-rz(-pi/67108864) q[127];
-cx q[152],q[127];
-rz(pi/67108864) q[127];
-rz(pi/33554432) q[152];
-cx q[152],q[128];
-rz(-pi/33554432) q[128];
-cx q[152],q[128];
-rz(pi/33554432) q[128];
-rz(pi/16777216) q[152];
-cx q[152],q[129];
-rz(-pi/16777216) q[129];
-cx q[152],q[129];
-rz(pi/16777216) q[129];
-rz(pi/8388608) q[152];
-cx q[152],q[130];
-rz(-pi/8388608) q[130];
-cx q[152],q[130];
-rz(pi/8388608) q[130];
-rz(pi/4194304) q[152];
-cx q[152],q[131];
-rz(-pi/4194304) q[131];
-cx q[152],q[131];
-rz(pi/4194304) q[131];
-rz(pi/2097152) q[152];
-cx q[152],q[132];
-rz(-pi/2097152) q[132];
-cx q[152],q[132];
-rz(pi/2097152) q[132];
-rz(pi/1048576) q[152];
-cx q[152],q[133];
-rz(-pi/1048576) q[133];
-cx q[152],q[133];
-rz(pi/1048576) q[133];
-rz(pi/524288) q[152];
-cx q[152],q[134];
-rz(-pi/524288) q[134];
-cx q[152],q[134];
-rz(pi/524288) q[134];
-rz(pi/262144) q[152];
-cx q[152],q[135];
-rz(-pi/262144) q[135];
-cx q[152],q[135];
-rz(pi/262144) q[135];
-rz(pi/131072) q[152];
-cx q[152],q[136];
-rz(-pi/131072) q[136];
-cx q[152],q[136];
-rz(pi/131072) q[136];
-rz(pi/65536) q[152];
-cx q[152],q[137];
-rz(-pi/65536) q[137];
-cx q[152],q[137];
-rz(pi/65536) q[137];
-rz(pi/32768) q[152];
-cx q[152],q[138];
-rz(-pi/32768) q[138];
-cx q[152],q[138];
-rz(pi/32768) q[138];
-rz(pi/16384) q[152];
-cx q[152],q[139];
-rz(-pi/16384) q[139];
-cx q[152],q[139];
-rz(pi/16384) q[139];
-rz(pi/8192) q[152];
-cx q[152],q[140];
-rz(-pi/8192) q[140];
-cx q[152],q[140];
-rz(pi/8192) q[140];
-rz(pi/4096) q[152];
-cx q[152],q[141];
-rz(-pi/4096) q[141];
-cx q[152],q[141];
-rz(pi/4096) q[141];
-rz(pi/2048) q[152];
-cx q[152],q[142];
-rz(-pi/2048) q[142];
-cx q[152],q[142];
-rz(pi/2048) q[142];
-rz(pi/1024) q[152];
-cx q[152],q[143];
-rz(-pi/1024) q[143];
-cx q[152],q[143];
-rz(pi/1024) q[143];
-rz(pi/512) q[152];
-cx q[152],q[144];
-rz(-pi/512) q[144];
-cx q[152],q[144];
-rz(pi/512) q[144];
-rz(pi/256) q[152];
-cx q[152],q[145];
-rz(-pi/256) q[145];
-cx q[152],q[145];
-rz(pi/256) q[145];
-rz(pi/128) q[152];
-cx q[152],q[146];
-rz(-pi/128) q[146];
-cx q[152],q[146];
-rz(pi/128) q[146];
-rz(pi/64) q[152];
-cx q[152],q[147];
-rz(-pi/64) q[147];
-cx q[152],q[147];
-rz(pi/64) q[147];
-rz(pi/32) q[152];
-cx q[152],q[148];
-rz(-pi/32) q[148];
-cx q[152],q[148];
-rz(pi/32) q[148];
-rz(pi/16) q[152];
-cx q[152],q[149];
-rz(-pi/16) q[149];
-cx q[152],q[149];
-rz(pi/16) q[149];
-rz(pi/8) q[152];
-cx q[152],q[150];
-rz(-pi/8) q[150];
-cx q[152],q[150];
-rz(pi/8) q[150];
-rz(pi/4) q[152];
-cx q[152],q[151];
-rz(-pi/4) q[151];
-cx q[152],q[151];
-rz(pi/4) q[151];
-rz(pi/2) q[152];
-sx q[152];
-rz(pi/2) q[152];
-rz(1.42863093678434e-12) q[153];
-cx q[153],q[113];
-rz(-1.42863093678434e-12) q[113];
-cx q[153],q[113];
-rz(1.42863093678434e-12) q[113];
-rz(2.85726187356867e-12) q[153];
-cx q[153],q[114];
-rz(-2.85726187356867e-12) q[114];
-cx q[153],q[114];
-rz(2.85726187356867e-12) q[114];
-rz(5.71452374713734e-12) q[153];
-cx q[153],q[115];
-rz(-5.71452374713734e-12) q[115];
-cx q[153],q[115];
-rz(5.71452374713734e-12) q[115];
-rz(1.14290474942747e-11) q[153];
-cx q[153],q[116];
-rz(-1.14290474942747e-11) q[116];
-cx q[153],q[116];
-rz(1.14290474942747e-11) q[116];
-rz(2.28580949885494e-11) q[153];
-cx q[153],q[117];
-rz(-2.28580949885494e-11) q[117];
-cx q[153],q[117];
-rz(2.28580949885494e-11) q[117];
-rz(4.57161899770987e-11) q[153];
-cx q[153],q[118];
-rz(-4.57161899770987e-11) q[118];
-cx q[153],q[118];
-rz(4.57161899770987e-11) q[118];
-rz(9.14323799541975e-11) q[153];
-cx q[153],q[119];
-rz(-9.14323799541975e-11) q[119];
-cx q[153],q[119];
-rz(9.14323799541975e-11) q[119];
-rz(1.82864759908395e-10) q[153];
-cx q[153],q[120];
-rz(-1.82864759908395e-10) q[120];
-cx q[153],q[120];
-rz(1.82864759908395e-10) q[120];
-rz(3.6572951981679e-10) q[153];
-cx q[153],q[121];
-rz(-3.6572951981679e-10) q[121];
-cx q[153],q[121];
-rz(3.6572951981679e-10) q[121];
-rz(7.3145903963358e-10) q[153];
-cx q[153],q[122];
-rz(-7.3145903963358e-10) q[122];
-cx q[153],q[122];
-rz(7.3145903963358e-10) q[122];
-rz(pi/2147483648) q[153];
-cx q[153],q[123];
-rz(-pi/2147483648) q[123];
-cx q[153],q[123];
-rz(pi/2147483648) q[123];
-rz(pi/1073741824) q[153];
-cx q[153],q[124];
-rz(-pi/1073741824) q[124];
-cx q[153],q[124];
-rz(pi/1073741824) q[124];
-rz(pi/536870912) q[153];
-cx q[153],q[125];
-rz(-pi/536870912) q[125];
-cx q[153],q[125];
-rz(pi/536870912) q[125];
-rz(pi/268435456) q[153];
-cx q[153],q[126];
-rz(-pi/268435456) q[126];
-cx q[153],q[126];
-rz(pi/268435456) q[126];
-rz(pi/134217728) q[153];
-cx q[153],q[127];
-rz(-pi/134217728) q[127];
-cx q[153],q[127];
-rz(pi/134217728) q[127];
-rz(pi/67108864) q[153];
-cx q[153],q[128];
-rz(-pi/67108864) q[128];
-cx q[153],q[128];
-rz(pi/67108864) q[128];
-rz(pi/33554432) q[153];
-cx q[153],q[129];
-rz(-pi/33554432) q[129];
-cx q[153],q[129];
-rz(pi/33554432) q[129];
-rz(pi/16777216) q[153];
-cx q[153],q[130];
-rz(-pi/16777216) q[130];
-cx q[153],q[130];
-rz(pi/16777216) q[130];
-rz(pi/8388608) q[153];
-cx q[153],q[131];
-rz(-pi/8388608) q[131];
-cx q[153],q[131];
-rz(pi/8388608) q[131];
-rz(pi/4194304) q[153];
-cx q[153],q[132];
-rz(-pi/4194304) q[132];
-cx q[153],q[132];
-rz(pi/4194304) q[132];
-rz(pi/2097152) q[153];
-cx q[153],q[133];
-rz(-pi/2097152) q[133];
-cx q[153],q[133];
-rz(pi/2097152) q[133];
-rz(pi/1048576) q[153];
-cx q[153],q[134];
-rz(-pi/1048576) q[134];
-cx q[153],q[134];
-rz(pi/1048576) q[134];
-rz(pi/524288) q[153];
-cx q[153],q[135];
-rz(-pi/524288) q[135];
-cx q[153],q[135];
-rz(pi/524288) q[135];
-rz(pi/262144) q[153];
-cx q[153],q[136];
-rz(-pi/262144) q[136];
-cx q[153],q[136];
-rz(pi/262144) q[136];
-rz(pi/131072) q[153];
-cx q[153],q[137];
-rz(-pi/131072) q[137];
-cx q[153],q[137];
-rz(pi/131072) q[137];
-rz(pi/65536) q[153];
-cx q[153],q[138];
-rz(-pi/65536) q[138];
-cx q[153],q[138];
-rz(pi/65536) q[138];
-rz(pi/32768) q[153];
-cx q[153],q[139];
-rz(-pi/32768) q[139];
-cx q[153],q[139];
-rz(pi/32768) q[139];
-rz(pi/16384) q[153];
-cx q[153],q[140];
-rz(-pi/16384) q[140];
-cx q[153],q[140];
-rz(pi/16384) q[140];
-rz(pi/8192) q[153];
-cx q[153],q[141];
-rz(-pi/8192) q[141];
-cx q[153],q[141];
-rz(pi/8192) q[141];
-rz(pi/4096) q[153];
-cx q[153],q[142];
-rz(-pi/4096) q[142];
-cx q[153],q[142];
-rz(pi/4096) q[142];
-rz(pi/2048) q[153];
-cx q[153],q[143];
-rz(-pi/2048) q[143];
-cx q[153],q[143];
-rz(pi/2048) q[143];
-rz(pi/1024) q[153];
-cx q[153],q[144];
-rz(-pi/1024) q[144];
-cx q[153],q[144];
-rz(pi/1024) q[144];
-rz(pi/512) q[153];
-cx q[153],q[145];
-rz(-pi/512) q[145];
-cx q[153],q[145];
-rz(pi/512) q[145];
-rz(pi/256) q[153];
-cx q[153],q[146];
-rz(-pi/256) q[146];
-cx q[153],q[146];
-rz(pi/256) q[146];
-rz(pi/128) q[153];
-cx q[153],q[147];
-rz(-pi/128) q[147];
-cx q[153],q[147];
-rz(pi/128) q[147];
-rz(pi/64) q[153];
-cx q[153],q[148];
-rz(-pi/64) q[148];
-cx q[153],q[148];
-rz(pi/64) q[148];
-rz(pi/32) q[153];
-cx q[153],q[149];
-rz(-pi/32) q[149];
-cx q[153],q[149];
-rz(pi/32) q[149];
-rz(pi/16) q[153];
-cx q[153],q[150];
-rz(-pi/16) q[150];
-cx q[153],q[150];
-rz(pi/16) q[150];
-rz(pi/8) q[153];
-cx q[153],q[151];
-rz(-pi/8) q[151];
-cx q[153],q[151];
-rz(pi/8) q[151];
-rz(pi/4) q[153];
-cx q[153],q[152];
-rz(-pi/4) q[152];
-cx q[153],q[152];
-rz(pi/4) q[152];
-rz(pi/2) q[153];
-sx q[153];
-rz(pi/2) q[153];
-rz(1.42863093678434e-12) q[154];
-cx q[154],q[114];
-rz(-1.42863093678434e-12) q[114];
-cx q[154],q[114];
-rz(1.42863093678434e-12) q[114];
-rz(2.85726187356867e-12) q[154];
-cx q[154],q[115];
-rz(-2.85726187356867e-12) q[115];
-cx q[154],q[115];
-rz(2.85726187356867e-12) q[115];
-rz(5.71452374713734e-12) q[154];
-cx q[154],q[116];
-rz(-5.71452374713734e-12) q[116];
-cx q[154],q[116];
-rz(5.71452374713734e-12) q[116];
-rz(1.14290474942747e-11) q[154];
-cx q[154],q[117];
-rz(-1.14290474942747e-11) q[117];
-cx q[154],q[117];
-rz(1.14290474942747e-11) q[117];
-rz(2.28580949885494e-11) q[154];
-cx q[154],q[118];
-rz(-2.28580949885494e-11) q[118];
-cx q[154],q[118];
-rz(2.28580949885494e-11) q[118];
-rz(4.57161899770987e-11) q[154];
-cx q[154],q[119];
-rz(-4.57161899770987e-11) q[119];
-cx q[154],q[119];
-rz(4.57161899770987e-11) q[119];
-rz(9.14323799541975e-11) q[154];
-cx q[154],q[120];
-rz(-9.14323799541975e-11) q[120];
-cx q[154],q[120];
-rz(9.14323799541975e-11) q[120];
-rz(1.82864759908395e-10) q[154];
-cx q[154],q[121];
-rz(-1.82864759908395e-10) q[121];
-cx q[154],q[121];
-rz(1.82864759908395e-10) q[121];
-rz(3.6572951981679e-10) q[154];
-cx q[154],q[122];
-rz(-3.6572951981679e-10) q[122];
-cx q[154],q[122];
-rz(3.6572951981679e-10) q[122];
-rz(7.3145903963358e-10) q[154];
-cx q[154],q[123];
-rz(-7.3145903963358e-10) q[123];
-cx q[154],q[123];
-rz(7.3145903963358e-10) q[123];
-rz(pi/2147483648) q[154];
-cx q[154],q[124];
-rz(-pi/2147483648) q[124];
-cx q[154],q[124];
-rz(pi/2147483648) q[124];
-rz(pi/1073741824) q[154];
-cx q[154],q[125];
-rz(-pi/1073741824) q[125];
-cx q[154],q[125];
-rz(pi/1073741824) q[125];
-rz(pi/536870912) q[154];
-cx q[154],q[126];
-rz(-pi/536870912) q[126];
-cx q[154],q[126];
-rz(pi/536870912) q[126];
-rz(pi/268435456) q[154];
-cx q[154],q[127];
-rz(-pi/268435456) q[127];
-cx q[154],q[127];
-rz(pi/268435456) q[127];
-rz(pi/134217728) q[154];
-cx q[154],q[128];
-rz(-pi/134217728) q[128];
-cx q[154],q[128];
-rz(pi/134217728) q[128];
-rz(pi/67108864) q[154];
-cx q[154],q[129];
-rz(-pi/67108864) q[129];
-cx q[154],q[129];
-rz(pi/67108864) q[129];
-rz(pi/33554432) q[154];
-cx q[154],q[130];
-rz(-pi/33554432) q[130];
-cx q[154],q[130];
-rz(pi/33554432) q[130];
-rz(pi/16777216) q[154];
-cx q[154],q[131];
-rz(-pi/16777216) q[131];
-cx q[154],q[131];
-rz(pi/16777216) q[131];
-rz(pi/8388608) q[154];
-cx q[154],q[132];
-rz(-pi/8388608) q[132];
-cx q[154],q[132];
-rz(pi/8388608) q[132];
-rz(pi/4194304) q[154];
-cx q[154],q[133];
-rz(-pi/4194304) q[133];
-cx q[154],q[133];
-rz(pi/4194304) q[133];
-rz(pi/2097152) q[154];
-cx q[154],q[134];
-rz(-pi/2097152) q[134];
-cx q[154],q[134];
-rz(pi/2097152) q[134];
-rz(pi/1048576) q[154];
-cx q[154],q[135];
-rz(-pi/1048576) q[135];
-cx q[154],q[135];
-rz(pi/1048576) q[135];
-rz(pi/524288) q[154];
-cx q[154],q[136];
-rz(-pi/524288) q[136];
-cx q[154],q[136];
-rz(pi/524288) q[136];
-rz(pi/262144) q[154];
-cx q[154],q[137];
-rz(-pi/262144) q[137];
-cx q[154],q[137];
-rz(pi/262144) q[137];
-rz(pi/131072) q[154];
-cx q[154],q[138];
-rz(-pi/131072) q[138];
-cx q[154],q[138];
-rz(pi/131072) q[138];
-rz(pi/65536) q[154];
-cx q[154],q[139];
-rz(-pi/65536) q[139];
-cx q[154],q[139];
-rz(pi/65536) q[139];
-rz(pi/32768) q[154];
-cx q[154],q[140];
-rz(-pi/32768) q[140];
-cx q[154],q[140];
-rz(pi/32768) q[140];
-rz(pi/16384) q[154];
-cx q[154],q[141];
-rz(-pi/16384) q[141];
-cx q[154],q[141];
-rz(pi/16384) q[141];
-rz(pi/8192) q[154];
-cx q[154],q[142];
-rz(-pi/8192) q[142];
-cx q[154],q[142];
-rz(pi/8192) q[142];
-rz(pi/4096) q[154];
-cx q[154],q[143];
-rz(-pi/4096) q[143];
-cx q[154],q[143];
-rz(pi/4096) q[143];
-rz(pi/2048) q[154];
-cx q[154],q[144];
-rz(-pi/2048) q[144];
-cx q[154],q[144];
-rz(pi/2048) q[144];
-rz(pi/1024) q[154];
-cx q[154],q[145];
-rz(-pi/1024) q[145];
-cx q[154],q[145];
-rz(pi/1024) q[145];
-rz(pi/512) q[154];
-cx q[154],q[146];
-rz(-pi/512) q[146];
-cx q[154],q[146];
-rz(pi/512) q[146];
-rz(pi/256) q[154];
-cx q[154],q[147];
-rz(-pi/256) q[147];
-cx q[154],q[147];
-rz(pi/256) q[147];
-rz(pi/128) q[154];
-cx q[154],q[148];
-rz(-pi/128) q[148];
-cx q[154],q[148];
-rz(pi/128) q[148];
-rz(pi/64) q[154];
-cx q[154],q[149];
-rz(-pi/64) q[149];
-cx q[154],q[149];
-rz(pi/64) q[149];
-rz(pi/32) q[154];
-cx q[154],q[150];
-rz(-pi/32) q[150];
-cx q[154],q[150];
-rz(pi/32) q[150];
-rz(pi/16) q[154];
-cx q[154],q[151];
-rz(-pi/16) q[151];
-cx q[154],q[151];
-rz(pi/16) q[151];
-rz(pi/8) q[154];
-cx q[154],q[152];
-rz(-pi/8) q[152];
-cx q[154],q[152];
-rz(pi/8) q[152];
-rz(pi/4) q[154];
-cx q[154],q[153];
-rz(-pi/4) q[153];
-cx q[154],q[153];
-rz(pi/4) q[153];
-rz(pi/2) q[154];
-sx q[154];
-rz(pi/2) q[154];
-rz(1.42863093678434e-12) q[155];
-cx q[155],q[115];
-rz(-1.42863093678434e-12) q[115];
-cx q[155],q[115];
-rz(1.42863093678434e-12) q[115];
-rz(2.85726187356867e-12) q[155];
-cx q[155],q[116];
-rz(-2.85726187356867e-12) q[116];
-cx q[155],q[116];
-rz(2.85726187356867e-12) q[116];
-rz(5.71452374713734e-12) q[155];
-cx q[155],q[117];
-rz(-5.71452374713734e-12) q[117];
-cx q[155],q[117];
-rz(5.71452374713734e-12) q[117];
-rz(1.14290474942747e-11) q[155];
-cx q[155],q[118];
-rz(-1.14290474942747e-11) q[118];
-cx q[155],q[118];
-rz(1.14290474942747e-11) q[118];
-rz(2.28580949885494e-11) q[155];
-cx q[155],q[119];
-rz(-2.28580949885494e-11) q[119];
-cx q[155],q[119];
-rz(2.28580949885494e-11) q[119];
-rz(4.57161899770987e-11) q[155];
-cx q[155],q[120];
-rz(-4.57161899770987e-11) q[120];
-cx q[155],q[120];
-rz(4.57161899770987e-11) q[120];
-rz(9.14323799541975e-11) q[155];
-cx q[155],q[121];
-rz(-9.14323799541975e-11) q[121];
-cx q[155],q[121];
-rz(9.14323799541975e-11) q[121];
-rz(1.82864759908395e-10) q[155];
-cx q[155],q[122];
-rz(-1.82864759908395e-10) q[122];
-cx q[155],q[122];
-rz(1.82864759908395e-10) q[122];
-rz(3.6572951981679e-10) q[155];
-cx q[155],q[123];
-rz(-3.6572951981679e-10) q[123];
-cx q[155],q[123];
-rz(3.6572951981679e-10) q[123];
-rz(7.3145903963358e-10) q[155];
-cx q[155],q[124];
-rz(-7.3145903963358e-10) q[124];
-cx q[155],q[124];
-rz(7.3145903963358e-10) q[124];
-rz(pi/2147483648) q[155];
-cx q[155],q[125];
-rz(-pi/2147483648) q[125];
-cx q[155],q[125];
-rz(pi/2147483648) q[125];
-rz(pi/1073741824) q[155];
-cx q[155],q[126];
-rz(-pi/1073741824) q[126];
-cx q[155],q[126];
-rz(pi/1073741824) q[126];
-rz(pi/536870912) q[155];
-cx q[155],q[127];
-rz(-pi/536870912) q[127];
-cx q[155],q[127];
-rz(pi/536870912) q[127];
-rz(pi/268435456) q[155];
-cx q[155],q[128];
-rz(-pi/268435456) q[128];
-cx q[155],q[128];
-rz(pi/268435456) q[128];
-rz(pi/134217728) q[155];
-cx q[155],q[129];
-rz(-pi/134217728) q[129];
-cx q[155],q[129];
-rz(pi/134217728) q[129];
-rz(pi/67108864) q[155];
-cx q[155],q[130];
-rz(-pi/67108864) q[130];
-cx q[155],q[130];
-rz(pi/67108864) q[130];
-rz(pi/33554432) q[155];
-cx q[155],q[131];
-rz(-pi/33554432) q[131];
-cx q[155],q[131];
-rz(pi/33554432) q[131];
-rz(pi/16777216) q[155];
-cx q[155],q[132];
-rz(-pi/16777216) q[132];
-cx q[155],q[132];
-rz(pi/16777216) q[132];
-rz(pi/8388608) q[155];
-cx q[155],q[133];
-rz(-pi/8388608) q[133];
-cx q[155],q[133];
-rz(pi/8388608) q[133];
-rz(pi/4194304) q[155];
-cx q[155],q[134];
-rz(-pi/4194304) q[134];
-cx q[155],q[134];
-rz(pi/4194304) q[134];
-rz(pi/2097152) q[155];
-cx q[155],q[135];
-rz(-pi/2097152) q[135];
-cx q[155],q[135];
-rz(pi/2097152) q[135];
-rz(pi/1048576) q[155];
-cx q[155],q[136];
-rz(-pi/1048576) q[136];
-cx q[155],q[136];
-rz(pi/1048576) q[136];
-rz(pi/524288) q[155];
-cx q[155],q[137];
-rz(-pi/524288) q[137];
-cx q[155],q[137];
-rz(pi/524288) q[137];
-rz(pi/262144) q[155];
-cx q[155],q[138];
-rz(-pi/262144) q[138];
-cx q[155],q[138];
-rz(pi/262144) q[138];
-rz(pi/131072) q[155];
-cx q[155],q[139];
-rz(-pi/131072) q[139];
-cx q[155],q[139];
-rz(pi/131072) q[139];
-rz(pi/65536) q[155];
-cx q[155],q[140];
-rz(-pi/65536) q[140];
-cx q[155],q[140];
-rz(pi/65536) q[140];
-rz(pi/32768) q[155];
-cx q[155],q[141];
-rz(-pi/32768) q[141];
-cx q[155],q[141];
-rz(pi/32768) q[141];
-rz(pi/16384) q[155];
-cx q[155],q[142];
-rz(-pi/16384) q[142];
-cx q[155],q[142];
-rz(pi/16384) q[142];
-rz(pi/8192) q[155];
-cx q[155],q[143];
-rz(-pi/8192) q[143];
-cx q[155],q[143];
-rz(pi/8192) q[143];
-rz(pi/4096) q[155];
-cx q[155],q[144];
-rz(-pi/4096) q[144];
-cx q[155],q[144];
-rz(pi/4096) q[144];
-rz(pi/2048) q[155];
-cx q[155],q[145];
-rz(-pi/2048) q[145];
-cx q[155],q[145];
-rz(pi/2048) q[145];
-rz(pi/1024) q[155];
-cx q[155],q[146];
-rz(-pi/1024) q[146];
-cx q[155],q[146];
-rz(pi/1024) q[146];
-rz(pi/512) q[155];
-cx q[155],q[147];
-rz(-pi/512) q[147];
-cx q[155],q[147];
-rz(pi/512) q[147];
-rz(pi/256) q[155];
-cx q[155],q[148];
-rz(-pi/256) q[148];
-cx q[155],q[148];
-rz(pi/256) q[148];
-rz(pi/128) q[155];
-cx q[155],q[149];
-rz(-pi/128) q[149];
-cx q[155],q[149];
-rz(pi/128) q[149];
-rz(pi/64) q[155];
-cx q[155],q[150];
-rz(-pi/64) q[150];
-cx q[155],q[150];
-rz(pi/64) q[150];
-rz(pi/32) q[155];
-cx q[155],q[151];
-rz(-pi/32) q[151];
-cx q[155],q[151];
-rz(pi/32) q[151];
-rz(pi/16) q[155];
-cx q[155],q[152];
-rz(-pi/16) q[152];
-cx q[155],q[152];
-rz(pi/16) q[152];
-rz(pi/8) q[155];
-cx q[155],q[153];
-rz(-pi/8) q[153];
-cx q[155],q[153];
-rz(pi/8) q[153];
-rz(pi/4) q[155];
-cx q[155],q[154];
-rz(-pi/4) q[154];
-cx q[155],q[154];
-rz(pi/4) q[154];
-rz(pi/2) q[155];
-sx q[155];
-rz(pi/2) q[155];
-rz(1.42863093678434e-12) q[156];
-cx q[156],q[116];
-rz(-1.42863093678434e-12) q[116];
-cx q[156],q[116];
-rz(1.42863093678434e-12) q[116];
-rz(2.85726187356867e-12) q[156];
-cx q[156],q[117];
-rz(-2.85726187356867e-12) q[117];
-cx q[156],q[117];
-rz(2.85726187356867e-12) q[117];
-rz(5.71452374713734e-12) q[156];
-cx q[156],q[118];
-rz(-5.71452374713734e-12) q[118];
-cx q[156],q[118];
-rz(5.71452374713734e-12) q[118];
-rz(1.14290474942747e-11) q[156];
-cx q[156],q[119];
-rz(-1.14290474942747e-11) q[119];
-cx q[156],q[119];
-rz(1.14290474942747e-11) q[119];
-rz(2.28580949885494e-11) q[156];
-cx q[156],q[120];
-rz(-2.28580949885494e-11) q[120];
-cx q[156],q[120];
-rz(2.28580949885494e-11) q[120];
-rz(4.57161899770987e-11) q[156];
-cx q[156],q[121];
-rz(-4.57161899770987e-11) q[121];
-cx q[156],q[121];
-rz(4.57161899770987e-11) q[121];
-rz(9.14323799541975e-11) q[156];
-cx q[156],q[122];
-rz(-9.14323799541975e-11) q[122];
-cx q[156],q[122];
-rz(9.14323799541975e-11) q[122];
-rz(1.82864759908395e-10) q[156];
-cx q[156],q[123];
-rz(-1.82864759908395e-10) q[123];
-cx q[156],q[123];
-rz(1.82864759908395e-10) q[123];
-rz(3.6572951981679e-10) q[156];
-cx q[156],q[124];
-rz(-3.6572951981679e-10) q[124];
-cx q[156],q[124];
-rz(3.6572951981679e-10) q[124];
-rz(7.3145903963358e-10) q[156];
-cx q[156],q[125];
-rz(-7.3145903963358e-10) q[125];
-cx q[156],q[125];
-rz(7.3145903963358e-10) q[125];
-rz(pi/2147483648) q[156];
-cx q[156],q[126];
-rz(-pi/2147483648) q[126];
-cx q[156],q[126];
-rz(pi/2147483648) q[126];
-rz(pi/1073741824) q[156];
-cx q[156],q[127];
-rz(-pi/1073741824) q[127];
-cx q[156],q[127];
-rz(pi/1073741824) q[127];
-rz(pi/536870912) q[156];
-cx q[156],q[128];
-rz(-pi/536870912) q[128];
-cx q[156],q[128];
-rz(pi/536870912) q[128];
-rz(pi/268435456) q[156];
-cx q[156],q[129];
-rz(-pi/268435456) q[129];
-cx q[156],q[129];
-rz(pi/268435456) q[129];
-rz(pi/134217728) q[156];
-cx q[156],q[130];
-rz(-pi/134217728) q[130];
-cx q[156],q[130];
-rz(pi/134217728) q[130];
-rz(pi/67108864) q[156];
-cx q[156],q[131];
-rz(-pi/67108864) q[131];
-cx q[156],q[131];
-rz(pi/67108864) q[131];
-rz(pi/33554432) q[156];
-cx q[156],q[132];
-rz(-pi/33554432) q[132];
-cx q[156],q[132];
-rz(pi/33554432) q[132];
-rz(pi/16777216) q[156];
-cx q[156],q[133];
-rz(-pi/16777216) q[133];
-cx q[156],q[133];
-rz(pi/16777216) q[133];
-rz(pi/8388608) q[156];
-cx q[156],q[134];
-rz(-pi/8388608) q[134];
-cx q[156],q[134];
-rz(pi/8388608) q[134];
-rz(pi/4194304) q[156];
-cx q[156],q[135];
-rz(-pi/4194304) q[135];
-cx q[156],q[135];
-rz(pi/4194304) q[135];
-rz(pi/2097152) q[156];
-cx q[156],q[136];
-rz(-pi/2097152) q[136];
-cx q[156],q[136];
-rz(pi/2097152) q[136];
-rz(pi/1048576) q[156];
-cx q[156],q[137];
-rz(-pi/1048576) q[137];
-cx q[156],q[137];
-rz(pi/1048576) q[137];
-rz(pi/524288) q[156];
-cx q[156],q[138];
-rz(-pi/524288) q[138];
-cx q[156],q[138];
-rz(pi/524288) q[138];
-rz(pi/262144) q[156];
-cx q[156],q[139];
-rz(-pi/262144) q[139];
-cx q[156],q[139];
-rz(pi/262144) q[139];
-rz(pi/131072) q[156];
-cx q[156],q[140];
-rz(-pi/131072) q[140];
-cx q[156],q[140];
-rz(pi/131072) q[140];
-rz(pi/65536) q[156];
-cx q[156],q[141];
-rz(-pi/65536) q[141];
-cx q[156],q[141];
-rz(pi/65536) q[141];
-rz(pi/32768) q[156];
-cx q[156],q[142];
-rz(-pi/32768) q[142];
-cx q[156],q[142];
-rz(pi/32768) q[142];
-rz(pi/16384) q[156];
-cx q[156],q[143];
-rz(-pi/16384) q[143];
-cx q[156],q[143];
-rz(pi/16384) q[143];
-rz(pi/8192) q[156];
-cx q[156],q[144];
-rz(-pi/8192) q[144];
-cx q[156],q[144];
-rz(pi/8192) q[144];
-rz(pi/4096) q[156];
-cx q[156],q[145];
-rz(-pi/4096) q[145];
-cx q[156],q[145];
-rz(pi/4096) q[145];
-rz(pi/2048) q[156];
-cx q[156],q[146];
-rz(-pi/2048) q[146];
-cx q[156],q[146];
-rz(pi/2048) q[146];
-rz(pi/1024) q[156];
-cx q[156],q[147];
-rz(-pi/1024) q[147];
-cx q[156],q[147];
-rz(pi/1024) q[147];
-rz(pi/512) q[156];
-cx q[156],q[148];
-rz(-pi/512) q[148];
-cx q[156],q[148];
-rz(pi/512) q[148];
-rz(pi/256) q[156];
-cx q[156],q[149];
-rz(-pi/256) q[149];
-cx q[156],q[149];
-rz(pi/256) q[149];
-rz(pi/128) q[156];
-cx q[156],q[150];
-rz(-pi/128) q[150];
-cx q[156],q[150];
-rz(pi/128) q[150];
-rz(pi/64) q[156];
-cx q[156],q[151];
-rz(-pi/64) q[151];
-cx q[156],q[151];
-rz(pi/64) q[151];
-rz(pi/32) q[156];
-cx q[156],q[152];
-rz(-pi/32) q[152];
-cx q[156],q[152];
-rz(pi/32) q[152];
-rz(pi/16) q[156];
-cx q[156],q[153];
-rz(-pi/16) q[153];
-cx q[156],q[153];
-rz(pi/16) q[153];
-rz(pi/8) q[156];
-cx q[156],q[154];
-rz(-pi/8) q[154];
-cx q[156],q[154];
-rz(pi/8) q[154];
-rz(pi/4) q[156];
-cx q[156],q[155];
-rz(-pi/4) q[155];
-cx q[156],q[155];
-rz(pi/4) q[155];
-rz(pi/2) q[156];
-sx q[156];
-rz(pi/2) q[156];
-rz(1.42863093678434e-12) q[157];
-cx q[157],q[117];
-rz(-1.42863093678434e-12) q[117];
-cx q[157],q[117];
-rz(1.42863093678434e-12) q[117];
-rz(2.85726187356867e-12) q[157];
-cx q[157],q[118];
-rz(-2.85726187356867e-12) q[118];
-cx q[157],q[118];
-rz(2.85726187356867e-12) q[118];
-rz(5.71452374713734e-12) q[157];
-cx q[157],q[119];
-rz(-5.71452374713734e-12) q[119];
-cx q[157],q[119];
-rz(5.71452374713734e-12) q[119];
-rz(1.14290474942747e-11) q[157];
-cx q[157],q[120];
-rz(-1.14290474942747e-11) q[120];
-cx q[157],q[120];
-rz(1.14290474942747e-11) q[120];
-rz(2.28580949885494e-11) q[157];
-cx q[157],q[121];
-rz(-2.28580949885494e-11) q[121];
-cx q[157],q[121];
-rz(2.28580949885494e-11) q[121];
-rz(4.57161899770987e-11) q[157];
-cx q[157],q[122];
-rz(-4.57161899770987e-11) q[122];
-cx q[157],q[122];
-rz(4.57161899770987e-11) q[122];
-rz(9.14323799541975e-11) q[157];
-cx q[157],q[123];
-rz(-9.14323799541975e-11) q[123];
-cx q[157],q[123];
-rz(9.14323799541975e-11) q[123];
-rz(1.82864759908395e-10) q[157];
-cx q[157],q[124];
-rz(-1.82864759908395e-10) q[124];
-cx q[157],q[124];
-rz(1.82864759908395e-10) q[124];
-rz(3.6572951981679e-10) q[157];
-cx q[157],q[125];
-rz(-3.6572951981679e-10) q[125];
-cx q[157],q[125];
-rz(3.6572951981679e-10) q[125];
-rz(7.3145903963358e-10) q[157];
-cx q[157],q[126];
-rz(-7.3145903963358e-10) q[126];
-cx q[157],q[126];
-rz(7.3145903963358e-10) q[126];
-rz(pi/2147483648) q[157];
-cx q[157],q[127];
-rz(-pi/2147483648) q[127];
-cx q[157],q[127];
-rz(pi/2147483648) q[127];
-rz(pi/1073741824) q[157];
-cx q[157],q[128];
-rz(-pi/1073741824) q[128];
-cx q[157],q[128];
-rz(pi/1073741824) q[128];
-rz(pi/536870912) q[157];
-cx q[157],q[129];
-rz(-pi/536870912) q[129];
-cx q[157],q[129];
-rz(pi/536870912) q[129];
-rz(pi/268435456) q[157];
-cx q[157],q[130];
-rz(-pi/268435456) q[130];
-cx q[157],q[130];
-rz(pi/268435456) q[130];
-rz(pi/134217728) q[157];
-cx q[157],q[131];
-rz(-pi/134217728) q[131];
-cx q[157],q[131];
-rz(pi/134217728) q[131];
-rz(pi/67108864) q[157];
-cx q[157],q[132];
-rz(-pi/67108864) q[132];
-cx q[157],q[132];
-rz(pi/67108864) q[132];
-rz(pi/33554432) q[157];
-cx q[157],q[133];
-rz(-pi/33554432) q[133];
-cx q[157],q[133];
-rz(pi/33554432) q[133];
-rz(pi/16777216) q[157];
-cx q[157],q[134];
-rz(-pi/16777216) q[134];
-cx q[157],q[134];
-rz(pi/16777216) q[134];
-rz(pi/8388608) q[157];
-cx q[157],q[135];
-rz(-pi/8388608) q[135];
-cx q[157],q[135];
-rz(pi/8388608) q[135];
-rz(pi/4194304) q[157];
-cx q[157],q[136];
-rz(-pi/4194304) q[136];
-cx q[157],q[136];
-rz(pi/4194304) q[136];
-rz(pi/2097152) q[157];
-cx q[157],q[137];
-rz(-pi/2097152) q[137];
-cx q[157],q[137];
-rz(pi/2097152) q[137];
-rz(pi/1048576) q[157];
-cx q[157],q[138];
-rz(-pi/1048576) q[138];
-cx q[157],q[138];
-rz(pi/1048576) q[138];
-rz(pi/524288) q[157];
-cx q[157],q[139];
-rz(-pi/524288) q[139];
-cx q[157],q[139];
-rz(pi/524288) q[139];
-rz(pi/262144) q[157];
-cx q[157],q[140];
-rz(-pi/262144) q[140];
-cx q[157],q[140];
-rz(pi/262144) q[140];
-rz(pi/131072) q[157];
-cx q[157],q[141];
-rz(-pi/131072) q[141];
-cx q[157],q[141];
-rz(pi/131072) q[141];
-rz(pi/65536) q[157];
-cx q[157],q[142];
-rz(-pi/65536) q[142];
-cx q[157],q[142];
-rz(pi/65536) q[142];
-rz(pi/32768) q[157];
-cx q[157],q[143];
-rz(-pi/32768) q[143];
-cx q[157],q[143];
-rz(pi/32768) q[143];
-rz(pi/16384) q[157];
-cx q[157],q[144];
-rz(-pi/16384) q[144];
-cx q[157],q[144];
-rz(pi/16384) q[144];
-rz(pi/8192) q[157];
-cx q[157],q[145];
-rz(-pi/8192) q[145];
-cx q[157],q[145];
-rz(pi/8192) q[145];
-rz(pi/4096) q[157];
-cx q[157],q[146];
-rz(-pi/4096) q[146];
-cx q[157],q[146];
-rz(pi/4096) q[146];
-rz(pi/2048) q[157];
-cx q[157],q[147];
-rz(-pi/2048) q[147];
-cx q[157],q[147];
-rz(pi/2048) q[147];
-rz(pi/1024) q[157];
-cx q[157],q[148];
-rz(-pi/1024) q[148];
-cx q[157],q[148];
-rz(pi/1024) q[148];
-rz(pi/512) q[157];
-cx q[157],q[149];
-rz(-pi/512) q[149];
-cx q[157],q[149];
-rz(pi/512) q[149];
-rz(pi/256) q[157];
-cx q[157],q[150];
-rz(-pi/256) q[150];
-cx q[157],q[150];
-rz(pi/256) q[150];
-rz(pi/128) q[157];
-cx q[157],q[151];
-rz(-pi/128) q[151];
-cx q[157],q[151];
-rz(pi/128) q[151];
-rz(pi/64) q[157];
-cx q[157],q[152];
-rz(-pi/64) q[152];
-cx q[157],q[152];
-rz(pi/64) q[152];
-rz(pi/32) q[157];
-cx q[157],q[153];
-rz(-pi/32) q[153];
-cx q[157],q[153];
-rz(pi/32) q[153];
-rz(pi/16) q[157];
-cx q[157],q[154];
-rz(-pi/16) q[154];
-cx q[157],q[154];
-rz(pi/16) q[154];
-rz(pi/8) q[157];
-cx q[157],q[155];
-rz(-pi/8) q[155];
-cx q[157],q[155];
-rz(pi/8) q[155];
-rz(pi/4) q[157];
-cx q[157],q[156];
-rz(-pi/4) q[156];
-cx q[157],q[156];
-rz(pi/4) q[156];
-rz(pi/2) q[157];
-sx q[157];
-rz(pi/2) q[157];
-rz(1.42863093678434e-12) q[158];
-cx q[158],q[118];
-rz(-1.42863093678434e-12) q[118];
-cx q[158],q[118];
-rz(1.42863093678434e-12) q[118];
-rz(2.85726187356867e-12) q[158];
-cx q[158],q[119];
-rz(-2.85726187356867e-12) q[119];
-cx q[158],q[119];
-rz(2.85726187356867e-12) q[119];
-rz(5.71452374713734e-12) q[158];
-cx q[158],q[120];
-rz(-5.71452374713734e-12) q[120];
-cx q[158],q[120];
-rz(5.71452374713734e-12) q[120];
-rz(1.14290474942747e-11) q[158];
-cx q[158],q[121];
-rz(-1.14290474942747e-11) q[121];
-cx q[158],q[121];
-rz(1.14290474942747e-11) q[121];
-rz(2.28580949885494e-11) q[158];
-cx q[158],q[122];
-rz(-2.28580949885494e-11) q[122];
-cx q[158],q[122];
-rz(2.28580949885494e-11) q[122];
-rz(4.57161899770987e-11) q[158];
-cx q[158],q[123];
-rz(-4.57161899770987e-11) q[123];
-cx q[158],q[123];
-rz(4.57161899770987e-11) q[123];
-rz(9.14323799541975e-11) q[158];
-cx q[158],q[124];
-rz(-9.14323799541975e-11) q[124];
-cx q[158],q[124];
-rz(9.14323799541975e-11) q[124];
-rz(1.82864759908395e-10) q[158];
-cx q[158],q[125];
-rz(-1.82864759908395e-10) q[125];
-cx q[158],q[125];
-rz(1.82864759908395e-10) q[125];
-rz(3.6572951981679e-10) q[158];
-cx q[158],q[126];
-rz(-3.6572951981679e-10) q[126];
-cx q[158],q[126];
-rz(3.6572951981679e-10) q[126];
-rz(7.3145903963358e-10) q[158];
-cx q[158],q[127];
-rz(-7.3145903963358e-10) q[127];
-cx q[158],q[127];
-rz(7.3145903963358e-10) q[127];
-rz(pi/2147483648) q[158];
-cx q[158],q[128];
-rz(-pi/2147483648) q[128];
-cx q[158],q[128];
-rz(pi/2147483648) q[128];
-rz(pi/1073741824) q[158];
-cx q[158],q[129];
-rz(-pi/1073741824) q[129];
-cx q[158],q[129];
-rz(pi/1073741824) q[129];
-rz(pi/536870912) q[158];
-cx q[158],q[130];
-rz(-pi/536870912) q[130];
-cx q[158],q[130];
-rz(pi/536870912) q[130];
-rz(pi/268435456) q[158];
-cx q[158],q[131];
-rz(-pi/268435456) q[131];
-cx q[158],q[131];
-rz(pi/268435456) q[131];
-rz(pi/134217728) q[158];
-cx q[158],q[132];
-rz(-pi/134217728) q[132];
-cx q[158],q[132];
-rz(pi/134217728) q[132];
-rz(pi/67108864) q[158];
-cx q[158],q[133];
-rz(-pi/67108864) q[133];
-cx q[158],q[133];
-rz(pi/67108864) q[133];
-rz(pi/33554432) q[158];
-cx q[158],q[134];
-rz(-pi/33554432) q[134];
-cx q[158],q[134];
-rz(pi/33554432) q[134];
-rz(pi/16777216) q[158];
-cx q[158],q[135];
-rz(-pi/16777216) q[135];
-cx q[158],q[135];
-rz(pi/16777216) q[135];
-rz(pi/8388608) q[158];
-cx q[158],q[136];
-rz(-pi/8388608) q[136];
-cx q[158],q[136];
-rz(pi/8388608) q[136];
-rz(pi/4194304) q[158];
-cx q[158],q[137];
-rz(-pi/4194304) q[137];
-cx q[158],q[137];
-rz(pi/4194304) q[137];
-rz(pi/2097152) q[158];
-cx q[158],q[138];
-rz(-pi/2097152) q[138];
-cx q[158],q[138];
-rz(pi/2097152) q[138];
-rz(pi/1048576) q[158];
-cx q[158],q[139];
-rz(-pi/1048576) q[139];
-cx q[158],q[139];
-rz(pi/1048576) q[139];
-rz(pi/524288) q[158];
-cx q[158],q[140];
-rz(-pi/524288) q[140];
-cx q[158],q[140];
-rz(pi/524288) q[140];
-rz(pi/262144) q[158];
-cx q[158],q[141];
-rz(-pi/262144) q[141];
-cx q[158],q[141];
-rz(pi/262144) q[141];
-rz(pi/131072) q[158];
-cx q[158],q[142];
-rz(-pi/131072) q[142];
-cx q[158],q[142];
-rz(pi/131072) q[142];
-rz(pi/65536) q[158];
-cx q[158],q[143];
-rz(-pi/65536) q[143];
-cx q[158],q[143];
-rz(pi/65536) q[143];
-rz(pi/32768) q[158];
-cx q[158],q[144];
-rz(-pi/32768) q[144];
-cx q[158],q[144];
-rz(pi/32768) q[144];
-rz(pi/16384) q[158];
-cx q[158],q[145];
-rz(-pi/16384) q[145];
-cx q[158],q[145];
-rz(pi/16384) q[145];
-rz(pi/8192) q[158];
-cx q[158],q[146];
-rz(-pi/8192) q[146];
-cx q[158],q[146];
-rz(pi/8192) q[146];
-rz(pi/4096) q[158];
-cx q[158],q[147];
-rz(-pi/4096) q[147];
-cx q[158],q[147];
-rz(pi/4096) q[147];
-rz(pi/2048) q[158];
-cx q[158],q[148];
-rz(-pi/2048) q[148];
-cx q[158],q[148];
-rz(pi/2048) q[148];
-rz(pi/1024) q[158];
-cx q[158],q[149];
-rz(-pi/1024) q[149];
-cx q[158],q[149];
-rz(pi/1024) q[149];
-rz(pi/512) q[158];
-cx q[158],q[150];
-rz(-pi/512) q[150];
-cx q[158],q[150];
-rz(pi/512) q[150];
-rz(pi/256) q[158];
-cx q[158],q[151];
-rz(-pi/256) q[151];
-cx q[158],q[151];
-rz(pi/256) q[151];
-rz(pi/128) q[158];
-cx q[158],q[152];
-rz(-pi/128) q[152];
-cx q[158],q[152];
-rz(pi/128) q[152];
-rz(pi/64) q[158];
-cx q[158],q[153];
-rz(-pi/64) q[153];
-cx q[158],q[153];
-rz(pi/64) q[153];
-rz(pi/32) q[158];
-cx q[158],q[154];
-rz(-pi/32) q[154];
-cx q[158],q[154];
-rz(pi/32) q[154];
-rz(pi/16) q[158];
-cx q[158],q[155];
-rz(-pi/16) q[155];
-cx q[158],q[155];
-rz(pi/16) q[155];
-rz(pi/8) q[158];
-cx q[158],q[156];
-rz(-pi/8) q[156];
-cx q[158],q[156];
-rz(pi/8) q[156];
-rz(pi/4) q[158];
-cx q[158],q[157];
-rz(-pi/4) q[157];
-cx q[158],q[157];
-rz(pi/4) q[157];
-rz(pi/2) q[158];
-sx q[158];
-rz(pi/2) q[158];
-rz(1.42863093678434e-12) q[159];
-cx q[159],q[119];
-rz(-1.42863093678434e-12) q[119];
-cx q[159],q[119];
-rz(1.42863093678434e-12) q[119];
-rz(2.85726187356867e-12) q[159];
-cx q[159],q[120];
-rz(-2.85726187356867e-12) q[120];
-cx q[159],q[120];
-rz(2.85726187356867e-12) q[120];
-rz(5.71452374713734e-12) q[159];
-cx q[159],q[121];
-rz(-5.71452374713734e-12) q[121];
-cx q[159],q[121];
-rz(5.71452374713734e-12) q[121];
-rz(1.14290474942747e-11) q[159];
-cx q[159],q[122];
-rz(-1.14290474942747e-11) q[122];
-cx q[159],q[122];
-rz(1.14290474942747e-11) q[122];
-rz(2.28580949885494e-11) q[159];
-cx q[159],q[123];
-rz(-2.28580949885494e-11) q[123];
-cx q[159],q[123];
-rz(2.28580949885494e-11) q[123];
-rz(4.57161899770987e-11) q[159];
-cx q[159],q[124];
-rz(-4.57161899770987e-11) q[124];
-cx q[159],q[124];
-rz(4.57161899770987e-11) q[124];
-rz(9.14323799541975e-11) q[159];
-cx q[159],q[125];
-rz(-9.14323799541975e-11) q[125];
-cx q[159],q[125];
-rz(9.14323799541975e-11) q[125];
-rz(1.82864759908395e-10) q[159];
-cx q[159],q[126];
-rz(-1.82864759908395e-10) q[126];
-cx q[159],q[126];
-rz(1.82864759908395e-10) q[126];
-rz(3.6572951981679e-10) q[159];
-cx q[159],q[127];
-rz(-3.6572951981679e-10) q[127];
-cx q[159],q[127];
-rz(3.6572951981679e-10) q[127];
-rz(7.3145903963358e-10) q[159];
-cx q[159],q[128];
-rz(-7.3145903963358e-10) q[128];
-cx q[159],q[128];
-rz(7.3145903963358e-10) q[128];
-rz(pi/2147483648) q[159];
-cx q[159],q[129];
-rz(-pi/2147483648) q[129];
-cx q[159],q[129];
-rz(pi/2147483648) q[129];
-rz(pi/1073741824) q[159];
-cx q[159],q[130];
-rz(-pi/1073741824) q[130];
-cx q[159],q[130];
-rz(pi/1073741824) q[130];
-rz(pi/536870912) q[159];
-cx q[159],q[131];
-rz(-pi/536870912) q[131];
-cx q[159],q[131];
-rz(pi/536870912) q[131];
-rz(pi/268435456) q[159];
-cx q[159],q[132];
-rz(-pi/268435456) q[132];
-cx q[159],q[132];
-rz(pi/268435456) q[132];
-rz(pi/134217728) q[159];
-cx q[159],q[133];
-rz(-pi/134217728) q[133];
-cx q[159],q[133];
-rz(pi/134217728) q[133];
-rz(pi/67108864) q[159];
-cx q[159],q[134];
-rz(-pi/67108864) q[134];
-cx q[159],q[134];
-rz(pi/67108864) q[134];
-rz(pi/33554432) q[159];
-cx q[159],q[135];
-rz(-pi/33554432) q[135];
-cx q[159],q[135];
-rz(pi/33554432) q[135];
-rz(pi/16777216) q[159];
-cx q[159],q[136];
-rz(-pi/16777216) q[136];
-cx q[159],q[136];
-rz(pi/16777216) q[136];
-rz(pi/8388608) q[159];
-cx q[159],q[137];
-rz(-pi/8388608) q[137];
-cx q[159],q[137];
-rz(pi/8388608) q[137];
-rz(pi/4194304) q[159];
-cx q[159],q[138];
-rz(-pi/4194304) q[138];
-cx q[159],q[138];
-rz(pi/4194304) q[138];
-rz(pi/2097152) q[159];
-cx q[159],q[139];
-rz(-pi/2097152) q[139];
-cx q[159],q[139];
-rz(pi/2097152) q[139];
-rz(pi/1048576) q[159];
-cx q[159],q[140];
-rz(-pi/1048576) q[140];
-cx q[159],q[140];
-rz(pi/1048576) q[140];
-rz(pi/524288) q[159];
-cx q[159],q[141];
-rz(-pi/524288) q[141];
-cx q[159],q[141];
-rz(pi/524288) q[141];
-rz(pi/262144) q[159];
-cx q[159],q[142];
-rz(-pi/262144) q[142];
-cx q[159],q[142];
-rz(pi/262144) q[142];
-rz(pi/131072) q[159];
-cx q[159],q[143];
-rz(-pi/131072) q[143];
-cx q[159],q[143];
-rz(pi/131072) q[143];
-rz(pi/65536) q[159];
-cx q[159],q[144];
-rz(-pi/65536) q[144];
-cx q[159],q[144];
-rz(pi/65536) q[144];
-rz(pi/32768) q[159];
-cx q[159],q[145];
-rz(-pi/32768) q[145];
-cx q[159],q[145];
-rz(pi/32768) q[145];
-rz(pi/16384) q[159];
-cx q[159],q[146];
-rz(-pi/16384) q[146];
-cx q[159],q[146];
-rz(pi/16384) q[146];
-rz(pi/8192) q[159];
-cx q[159],q[147];
-rz(-pi/8192) q[147];
-cx q[159],q[147];
-rz(pi/8192) q[147];
-rz(pi/4096) q[159];
-cx q[159],q[148];
-rz(-pi/4096) q[148];
-cx q[159],q[148];
-rz(pi/4096) q[148];
-rz(pi/2048) q[159];
-cx q[159],q[149];
-rz(-pi/2048) q[149];
-cx q[159],q[149];
-rz(pi/2048) q[149];
-rz(pi/1024) q[159];
-cx q[159],q[150];
-rz(-pi/1024) q[150];
-cx q[159],q[150];
-rz(pi/1024) q[150];
-rz(pi/512) q[159];
-cx q[159],q[151];
-rz(-pi/512) q[151];
-cx q[159],q[151];
-rz(pi/512) q[151];
-rz(pi/256) q[159];
-cx q[159],q[152];
-rz(-pi/256) q[152];
-cx q[159],q[152];
-rz(pi/256) q[152];
-rz(pi/128) q[159];
-cx q[159],q[153];
-rz(-pi/128) q[153];
-cx q[159],q[153];
-rz(pi/128) q[153];
-rz(pi/64) q[159];
-cx q[159],q[154];
-rz(-pi/64) q[154];
-cx q[159],q[154];
-rz(pi/64) q[154];
-rz(pi/32) q[159];
-cx q[159],q[155];
-rz(-pi/32) q[155];
-cx q[159],q[155];
-rz(pi/32) q[155];
-rz(pi/16) q[159];
-cx q[159],q[156];
-rz(-pi/16) q[156];
-cx q[159],q[156];
-rz(pi/16) q[156];
-rz(pi/8) q[159];
-cx q[159],q[157];
-rz(-pi/8) q[157];
-cx q[159],q[157];
-rz(pi/8) q[157];
-rz(pi/4) q[159];
-cx q[159],q[158];
-rz(-pi/4) q[158];
-cx q[159],q[158];
-rz(pi/4) q[158];
-rz(pi/2) q[159];
-sx q[159];
-rz(pi/2) q[159];
-barrier q[0],q[1],q[2],q[3],q[4],q[5],q[6],q[7],q[8],q[9],q[10],q[11],q[12],q[13],q[14],q[15],q[16],q[17],q[18],q[19],q[20],q[21],q[22],q[23],q[24],q[25],q[26],q[27],q[28],q[29],q[30],q[31],q[32],q[33],q[34],q[35],q[36],q[37],q[38],q[39],q[40],q[41],q[42],q[43],q[44],q[45],q[46],q[47],q[48],q[49],q[50],q[51],q[52],q[53],q[54],q[55],q[56],q[57],q[58],q[59],q[60],q[61],q[62],q[63],q[64],q[65],q[66],q[67],q[68],q[69],q[70],q[71],q[72],q[73],q[74],q[75],q[76],q[77],q[78],q[79],q[80],q[81],q[82],q[83],q[84],q[85],q[86],q[87],q[88],q[89],q[90],q[91],q[92],q[93],q[94],q[95],q[96],q[97],q[98],q[99],q[100],q[101],q[102],q[103],q[104],q[105],q[106],q[107],q[108],q[109],q[110],q[111],q[112],q[113],q[114],q[115],q[116],q[117],q[118],q[119],q[120],q[121],q[122],q[123],q[124],q[125],q[126],q[127],q[128],q[129],q[130],q[131],q[132],q[133],q[134],q[135],q[136],q[137],q[138],q[139],q[140],q[141],q[142],q[143],q[144],q[145],q[146],q[147],q[148],q[149],q[150],q[151],q[152],q[153],q[154],q[155],q[156],q[157],q[158],q[159];
-measure q[0] -> meas[0];
-measure q[1] -> meas[1];
-measure q[2] -> meas[2];
-measure q[3] -> meas[3];
-measure q[4] -> meas[4];
-measure q[5] -> meas[5];
-measure q[6] -> meas[6];
-measure q[7] -> meas[7];
-measure q[8] -> meas[8];
-measure q[9] -> meas[9];
-measure q[10] -> meas[10];
-measure q[11] -> meas[11];
-measure q[12] -> meas[12];
-measure q[13] -> meas[13];
-measure q[14] -> meas[14];
-measure q[15] -> meas[15];
-measure q[16] -> meas[16];
-measure q[17] -> meas[17];
-measure q[18] -> meas[18];
-measure q[19] -> meas[19];
-measure q[20] -> meas[20];
-measure q[21] -> meas[21];
-measure q[22] -> meas[22];
-measure q[23] -> meas[23];
-measure q[24] -> meas[24];
-measure q[25] -> meas[25];
-measure q[26] -> meas[26];
-measure q[27] -> meas[27];
-measure q[28] -> meas[28];
-measure q[29] -> meas[29];
-measure q[30] -> meas[30];
-measure q[31] -> meas[31];
-measure q[32] -> meas[32];
-measure q[33] -> meas[33];
-measure q[34] -> meas[34];
-measure q[35] -> meas[35];
-measure q[36] -> meas[36];
-measure q[37] -> meas[37];
-measure q[38] -> meas[38];
-measure q[39] -> meas[39];
-measure q[40] -> meas[40];
-measure q[41] -> meas[41];
-measure q[42] -> meas[42];
-measure q[43] -> meas[43];
-measure q[44] -> meas[44];
-measure q[45] -> meas[45];
-measure q[46] -> meas[46];
-measure q[47] -> meas[47];
-measure q[48] -> meas[48];
-measure q[49] -> meas[49];
-measure q[50] -> meas[50];
-measure q[51] -> meas[51];
-measure q[52] -> meas[52];
-measure q[53] -> meas[53];
-measure q[54] -> meas[54];
-measure q[55] -> meas[55];
-measure q[56] -> meas[56];
-measure q[57] -> meas[57];
-measure q[58] -> meas[58];
-measure q[59] -> meas[59];
-measure q[60] -> meas[60];
-measure q[61] -> meas[61];
-measure q[62] -> meas[62];
-measure q[63] -> meas[63];
-measure q[64] -> meas[64];
-measure q[65] -> meas[65];
-measure q[66] -> meas[66];
-measure q[67] -> meas[67];
-measure q[68] -> meas[68];
-measure q[69] -> meas[69];
-measure q[70] -> meas[70];
-measure q[71] -> meas[71];
-measure q[72] -> meas[72];
-measure q[73] -> meas[73];
-measure q[74] -> meas[74];
-measure q[75] -> meas[75];
-measure q[76] -> meas[76];
-measure q[77] -> meas[77];
-measure q[78] -> meas[78];
-measure q[79] -> meas[79];
-measure q[80] -> meas[80];
-measure q[81] -> meas[81];
-measure q[82] -> meas[82];
-measure q[83] -> meas[83];
-measure q[84] -> meas[84];
-measure q[85] -> meas[85];
-measure q[86] -> meas[86];
-measure q[87] -> meas[87];
-measure q[88] -> meas[88];
-measure q[89] -> meas[89];
-measure q[90] -> meas[90];
-measure q[91] -> meas[91];
-measure q[92] -> meas[92];
-measure q[93] -> meas[93];
-measure q[94] -> meas[94];
-measure q[95] -> meas[95];
-measure q[96] -> meas[96];
-measure q[97] -> meas[97];
-measure q[98] -> meas[98];
-measure q[99] -> meas[99];
-measure q[100] -> meas[100];
-measure q[101] -> meas[101];
-measure q[102] -> meas[102];
-measure q[103] -> meas[103];
-measure q[104] -> meas[104];
-measure q[105] -> meas[105];
-measure q[106] -> meas[106];
-measure q[107] -> meas[107];
-measure q[108] -> meas[108];
-measure q[109] -> meas[109];
-measure q[110] -> meas[110];
-measure q[111] -> meas[111];
-measure q[112] -> meas[112];
-measure q[113] -> meas[113];
-measure q[114] -> meas[114];
-measure q[115] -> meas[115];
-measure q[116] -> meas[116];
-measure q[117] -> meas[117];
-measure q[118] -> meas[118];
-measure q[119] -> meas[119];
-measure q[120] -> meas[120];
-measure q[121] -> meas[121];
-measure q[122] -> meas[122];
-measure q[123] -> meas[123];
-measure q[124] -> meas[124];
-measure q[125] -> meas[125];
-measure q[126] -> meas[126];
-measure q[127] -> meas[127];
-measure q[128] -> meas[128];
-measure q[129] -> meas[129];
-measure q[130] -> meas[130];
-measure q[131] -> meas[131];
-measure q[132] -> meas[132];
-measure q[133] -> meas[133];
-measure q[134] -> meas[134];
-measure q[135] -> meas[135];
-measure q[136] -> meas[136];
-measure q[137] -> meas[137];
-measure q[138] -> meas[138];
-measure q[139] -> meas[139];
-measure q[140] -> meas[140];
-measure q[141] -> meas[141];
-measure q[142] -> meas[142];
-measure q[143] -> meas[143];
-measure q[144] -> meas[144];
-measure q[145] -> meas[145];
-measure q[146] -> meas[146];
-measure q[147] -> meas[147];
-measure q[148] -> meas[148];
-measure q[149] -> meas[149];
-measure q[150] -> meas[150];
-measure q[151] -> meas[151];
-measure q[152] -> meas[152];
-measure q[153] -> meas[153];
-measure q[154] -> meas[154];
-measure q[155] -> meas[155];
-measure q[156] -> meas[156];
-measure q[157] -> meas[157];
-measure q[158] -> meas[158];
-measure q[159] -> meas[159];
@@ -1,9897 +0,0 @@
-OPENQASM 2.0;
-include "qelib1.inc";
-qreg q[63];
-creg c[63];
-creg meas[63];
-h q[0];
-u1(pi/4) q[1];
-cx q[1],q[0];
-u1(-pi/4) q[0];
-cx q[1],q[0];
-u1(pi/4) q[0];
-h q[1];
-u1(pi/8) q[2];
-cx q[2],q[0];
-u1(-pi/8) q[0];
-cx q[2],q[0];
-u1(pi/8) q[0];
-u1(pi/4) q[2];
-cx q[2],q[1];
-u1(-pi/4) q[1];
-cx q[2],q[1];
-u1(pi/4) q[1];
-h q[2];
-u1(pi/16) q[3];
-cx q[3],q[0];
-u1(-pi/16) q[0];
-cx q[3],q[0];
-u1(pi/16) q[0];
-u1(pi/8) q[3];
-cx q[3],q[1];
-u1(-pi/8) q[1];
-cx q[3],q[1];
-u1(pi/8) q[1];
-u1(pi/4) q[3];
-cx q[3],q[2];
-u1(-pi/4) q[2];
-cx q[3],q[2];
-u1(pi/4) q[2];
-h q[3];
-u1(pi/32) q[4];
-cx q[4],q[0];
-u1(-pi/32) q[0];
-cx q[4],q[0];
-u1(pi/32) q[0];
-u1(pi/16) q[4];
-cx q[4],q[1];
-u1(-pi/16) q[1];
-cx q[4],q[1];
-u1(pi/16) q[1];
-u1(pi/8) q[4];
-cx q[4],q[2];
-u1(-pi/8) q[2];
-cx q[4],q[2];
-u1(pi/8) q[2];
-u1(pi/4) q[4];
-cx q[4],q[3];
-u1(-pi/4) q[3];
-cx q[4],q[3];
-u1(pi/4) q[3];
-h q[4];
-u1(pi/64) q[5];
-cx q[5],q[0];
-u1(-pi/64) q[0];
-cx q[5],q[0];
-u1(pi/64) q[0];
-u1(pi/32) q[5];
-cx q[5],q[1];
-u1(-pi/32) q[1];
-cx q[5],q[1];
-u1(pi/32) q[1];
-u1(pi/16) q[5];
-cx q[5],q[2];
-u1(-pi/16) q[2];
-cx q[5],q[2];
-u1(pi/16) q[2];
-u1(pi/8) q[5];
-cx q[5],q[3];
-u1(-pi/8) q[3];
-cx q[5],q[3];
-u1(pi/8) q[3];
-u1(pi/4) q[5];
-cx q[5],q[4];
-u1(-pi/4) q[4];
-cx q[5],q[4];
-u1(pi/4) q[4];
-h q[5];
-u1(pi/128) q[6];
-cx q[6],q[0];
-u1(-pi/128) q[0];
-cx q[6],q[0];
-u1(pi/128) q[0];
-u1(pi/64) q[6];
-cx q[6],q[1];
-u1(-pi/64) q[1];
-cx q[6],q[1];
-u1(pi/64) q[1];
-u1(pi/32) q[6];
-cx q[6],q[2];
-u1(-pi/32) q[2];
-cx q[6],q[2];
-u1(pi/32) q[2];
-u1(pi/16) q[6];
-cx q[6],q[3];
-u1(-pi/16) q[3];
-cx q[6],q[3];
-u1(pi/16) q[3];
-u1(pi/8) q[6];
-cx q[6],q[4];
-u1(-pi/8) q[4];
-cx q[6],q[4];
-u1(pi/8) q[4];
-u1(pi/4) q[6];
-cx q[6],q[5];
-u1(-pi/4) q[5];
-cx q[6],q[5];
-u1(pi/4) q[5];
-h q[6];
-u1(pi/256) q[7];
-cx q[7],q[0];
-u1(-pi/256) q[0];
-cx q[7],q[0];
-u1(pi/256) q[0];
-u1(pi/128) q[7];
-cx q[7],q[1];
-u1(-pi/128) q[1];
-cx q[7],q[1];
-u1(pi/128) q[1];
-u1(pi/64) q[7];
-cx q[7],q[2];
-u1(-pi/64) q[2];
-cx q[7],q[2];
-u1(pi/64) q[2];
-u1(pi/32) q[7];
-cx q[7],q[3];
-u1(-pi/32) q[3];
-cx q[7],q[3];
-u1(pi/32) q[3];
-u1(pi/16) q[7];
-cx q[7],q[4];
-u1(-pi/16) q[4];
-cx q[7],q[4];
-u1(pi/16) q[4];
-u1(pi/8) q[7];
-cx q[7],q[5];
-u1(-pi/8) q[5];
-cx q[7],q[5];
-u1(pi/8) q[5];
-u1(pi/4) q[7];
-cx q[7],q[6];
-u1(-pi/4) q[6];
-cx q[7],q[6];
-u1(pi/4) q[6];
-h q[7];
-u1(pi/512) q[8];
-cx q[8],q[0];
-u1(-pi/512) q[0];
-cx q[8],q[0];
-u1(pi/512) q[0];
-u1(pi/256) q[8];
-cx q[8],q[1];
-u1(-pi/256) q[1];
-cx q[8],q[1];
-u1(pi/256) q[1];
-u1(pi/128) q[8];
-cx q[8],q[2];
-u1(-pi/128) q[2];
-cx q[8],q[2];
-u1(pi/128) q[2];
-u1(pi/64) q[8];
-cx q[8],q[3];
-u1(-pi/64) q[3];
-cx q[8],q[3];
-u1(pi/64) q[3];
-u1(pi/32) q[8];
-cx q[8],q[4];
-u1(-pi/32) q[4];
-cx q[8],q[4];
-u1(pi/32) q[4];
-u1(pi/16) q[8];
-cx q[8],q[5];
-u1(-pi/16) q[5];
-cx q[8],q[5];
-u1(pi/16) q[5];
-u1(pi/8) q[8];
-cx q[8],q[6];
-u1(-pi/8) q[6];
-cx q[8],q[6];
-u1(pi/8) q[6];
-u1(pi/4) q[8];
-cx q[8],q[7];
-u1(-pi/4) q[7];
-cx q[8],q[7];
-u1(pi/4) q[7];
-h q[8];
-u1(pi/1024) q[9];
-cx q[9],q[0];
-u1(-pi/1024) q[0];
-cx q[9],q[0];
-u1(pi/1024) q[0];
-u1(pi/512) q[9];
-cx q[9],q[1];
-u1(-pi/512) q[1];
-cx q[9],q[1];
-u1(pi/512) q[1];
-u1(pi/256) q[9];
-cx q[9],q[2];
-u1(-pi/256) q[2];
-cx q[9],q[2];
-u1(pi/256) q[2];
-u1(pi/128) q[9];
-cx q[9],q[3];
-u1(-pi/128) q[3];
-cx q[9],q[3];
-u1(pi/128) q[3];
-u1(pi/64) q[9];
-cx q[9],q[4];
-u1(-pi/64) q[4];
-cx q[9],q[4];
-u1(pi/64) q[4];
-u1(pi/32) q[9];
-cx q[9],q[5];
-u1(-pi/32) q[5];
-cx q[9],q[5];
-u1(pi/32) q[5];
-u1(pi/16) q[9];
-cx q[9],q[6];
-u1(-pi/16) q[6];
-cx q[9],q[6];
-u1(pi/16) q[6];
-u1(pi/8) q[9];
-cx q[9],q[7];
-u1(-pi/8) q[7];
-cx q[9],q[7];
-u1(pi/8) q[7];
-u1(pi/4) q[9];
-cx q[9],q[8];
-u1(-pi/4) q[8];
-cx q[9],q[8];
-u1(pi/4) q[8];
-h q[9];
-u1(pi/2048) q[10];
-cx q[10],q[0];
-u1(-pi/2048) q[0];
-cx q[10],q[0];
-u1(pi/2048) q[0];
-u1(pi/1024) q[10];
-cx q[10],q[1];
-u1(-pi/1024) q[1];
-cx q[10],q[1];
-u1(pi/1024) q[1];
-u1(pi/512) q[10];
-cx q[10],q[2];
-u1(-pi/512) q[2];
-cx q[10],q[2];
-u1(pi/512) q[2];
-u1(pi/256) q[10];
-cx q[10],q[3];
-u1(-pi/256) q[3];
-cx q[10],q[3];
-u1(pi/256) q[3];
-u1(pi/128) q[10];
-cx q[10],q[4];
-u1(-pi/128) q[4];
-cx q[10],q[4];
-u1(pi/128) q[4];
-u1(pi/64) q[10];
-cx q[10],q[5];
-u1(-pi/64) q[5];
-cx q[10],q[5];
-u1(pi/64) q[5];
-u1(pi/32) q[10];
-cx q[10],q[6];
-u1(-pi/32) q[6];
-cx q[10],q[6];
-u1(pi/32) q[6];
-u1(pi/16) q[10];
-cx q[10],q[7];
-u1(-pi/16) q[7];
-cx q[10],q[7];
-u1(pi/16) q[7];
-u1(pi/8) q[10];
-cx q[10],q[8];
-u1(-pi/8) q[8];
-cx q[10],q[8];
-u1(pi/8) q[8];
-u1(pi/4) q[10];
-cx q[10],q[9];
-u1(-pi/4) q[9];
-cx q[10],q[9];
-u1(pi/4) q[9];
-h q[10];
-u1(pi/4096) q[11];
-cx q[11],q[0];
-u1(-pi/4096) q[0];
-cx q[11],q[0];
-u1(pi/4096) q[0];
-u1(pi/2048) q[11];
-cx q[11],q[1];
-u1(-pi/2048) q[1];
-cx q[11],q[1];
-u1(pi/2048) q[1];
-u1(pi/1024) q[11];
-cx q[11],q[2];
-u1(-pi/1024) q[2];
-cx q[11],q[2];
-u1(pi/1024) q[2];
-u1(pi/512) q[11];
-cx q[11],q[3];
-u1(-pi/512) q[3];
-cx q[11],q[3];
-u1(pi/512) q[3];
-u1(pi/256) q[11];
-cx q[11],q[4];
-u1(-pi/256) q[4];
-cx q[11],q[4];
-u1(pi/256) q[4];
-u1(pi/128) q[11];
-cx q[11],q[5];
-u1(-pi/128) q[5];
-cx q[11],q[5];
-u1(pi/128) q[5];
-u1(pi/64) q[11];
-cx q[11],q[6];
-u1(-pi/64) q[6];
-cx q[11],q[6];
-u1(pi/64) q[6];
-u1(pi/32) q[11];
-cx q[11],q[7];
-u1(-pi/32) q[7];
-cx q[11],q[7];
-u1(pi/32) q[7];
-u1(pi/16) q[11];
-cx q[11],q[8];
-u1(-pi/16) q[8];
-cx q[11],q[8];
-u1(pi/16) q[8];
-u1(pi/8) q[11];
-cx q[11],q[9];
-u1(-pi/8) q[9];
-cx q[11],q[9];
-u1(pi/8) q[9];
-u1(pi/4) q[11];
-cx q[11],q[10];
-u1(-pi/4) q[10];
-cx q[11],q[10];
-u1(pi/4) q[10];
-h q[11];
-u1(pi/8192) q[12];
-cx q[12],q[0];
-u1(-pi/8192) q[0];
-cx q[12],q[0];
-u1(pi/8192) q[0];
-u1(pi/4096) q[12];
-cx q[12],q[1];
-u1(-pi/4096) q[1];
-cx q[12],q[1];
-u1(pi/4096) q[1];
-u1(pi/2048) q[12];
-cx q[12],q[2];
-u1(-pi/2048) q[2];
-cx q[12],q[2];
-u1(pi/2048) q[2];
-u1(pi/1024) q[12];
-cx q[12],q[3];
-u1(-pi/1024) q[3];
-cx q[12],q[3];
-u1(pi/1024) q[3];
-u1(pi/512) q[12];
-cx q[12],q[4];
-u1(-pi/512) q[4];
-cx q[12],q[4];
-u1(pi/512) q[4];
-u1(pi/256) q[12];
-cx q[12],q[5];
-u1(-pi/256) q[5];
-cx q[12],q[5];
-u1(pi/256) q[5];
-u1(pi/128) q[12];
-cx q[12],q[6];
-u1(-pi/128) q[6];
-cx q[12],q[6];
-u1(pi/128) q[6];
-u1(pi/64) q[12];
-cx q[12],q[7];
-u1(-pi/64) q[7];
-cx q[12],q[7];
-u1(pi/64) q[7];
-u1(pi/32) q[12];
-cx q[12],q[8];
-u1(-pi/32) q[8];
-cx q[12],q[8];
-u1(pi/32) q[8];
-u1(pi/16) q[12];
-cx q[12],q[9];
-u1(-pi/16) q[9];
-cx q[12],q[9];
-u1(pi/16) q[9];
-u1(pi/8) q[12];
-cx q[12],q[10];
-u1(-pi/8) q[10];
-cx q[12],q[10];
-u1(pi/8) q[10];
-u1(pi/4) q[12];
-cx q[12],q[11];
-u1(-pi/4) q[11];
-cx q[12],q[11];
-u1(pi/4) q[11];
-h q[12];
-u1(pi/16384) q[13];
-cx q[13],q[0];
-u1(-pi/16384) q[0];
-cx q[13],q[0];
-u1(pi/16384) q[0];
-u1(pi/8192) q[13];
-cx q[13],q[1];
-u1(-pi/8192) q[1];
-cx q[13],q[1];
-u1(pi/8192) q[1];
-u1(pi/4096) q[13];
-cx q[13],q[2];
-u1(-pi/4096) q[2];
-cx q[13],q[2];
-u1(pi/4096) q[2];
-u1(pi/2048) q[13];
-cx q[13],q[3];
-u1(-pi/2048) q[3];
-cx q[13],q[3];
-u1(pi/2048) q[3];
-u1(pi/1024) q[13];
-cx q[13],q[4];
-u1(-pi/1024) q[4];
-cx q[13],q[4];
-u1(pi/1024) q[4];
-u1(pi/512) q[13];
-cx q[13],q[5];
-u1(-pi/512) q[5];
-cx q[13],q[5];
-u1(pi/512) q[5];
-u1(pi/256) q[13];
-cx q[13],q[6];
-u1(-pi/256) q[6];
-cx q[13],q[6];
-u1(pi/256) q[6];
-u1(pi/128) q[13];
-cx q[13],q[7];
-u1(-pi/128) q[7];
-cx q[13],q[7];
-u1(pi/128) q[7];
-u1(pi/64) q[13];
-cx q[13],q[8];
-u1(-pi/64) q[8];
-cx q[13],q[8];
-u1(pi/64) q[8];
-u1(pi/32) q[13];
-cx q[13],q[9];
-u1(-pi/32) q[9];
-cx q[13],q[9];
-u1(pi/32) q[9];
-u1(pi/16) q[13];
-cx q[13],q[10];
-u1(-pi/16) q[10];
-cx q[13],q[10];
-u1(pi/16) q[10];
-u1(pi/8) q[13];
-cx q[13],q[11];
-u1(-pi/8) q[11];
-cx q[13],q[11];
-u1(pi/8) q[11];
-u1(pi/4) q[13];
-cx q[13],q[12];
-u1(-pi/4) q[12];
-cx q[13],q[12];
-u1(pi/4) q[12];
-h q[13];
-u1(pi/32768) q[14];
-cx q[14],q[0];
-u1(-pi/32768) q[0];
-cx q[14],q[0];
-u1(pi/32768) q[0];
-u1(pi/16384) q[14];
-cx q[14],q[1];
-u1(-pi/16384) q[1];
-cx q[14],q[1];
-u1(pi/16384) q[1];
-u1(pi/8192) q[14];
-cx q[14],q[2];
-u1(-pi/8192) q[2];
-cx q[14],q[2];
-u1(pi/8192) q[2];
-u1(pi/4096) q[14];
-cx q[14],q[3];
-u1(-pi/4096) q[3];
-cx q[14],q[3];
-u1(pi/4096) q[3];
-u1(pi/2048) q[14];
-cx q[14],q[4];
-u1(-pi/2048) q[4];
-cx q[14],q[4];
-u1(pi/2048) q[4];
-u1(pi/1024) q[14];
-cx q[14],q[5];
-u1(-pi/1024) q[5];
-cx q[14],q[5];
-u1(pi/1024) q[5];
-u1(pi/512) q[14];
-cx q[14],q[6];
-u1(-pi/512) q[6];
-cx q[14],q[6];
-u1(pi/512) q[6];
-u1(pi/256) q[14];
-cx q[14],q[7];
-u1(-pi/256) q[7];
-cx q[14],q[7];
-u1(pi/256) q[7];
-u1(pi/128) q[14];
-cx q[14],q[8];
-u1(-pi/128) q[8];
-cx q[14],q[8];
-u1(pi/128) q[8];
-u1(pi/64) q[14];
-cx q[14],q[9];
-u1(-pi/64) q[9];
-cx q[14],q[9];
-u1(pi/64) q[9];
-u1(pi/32) q[14];
-cx q[14],q[10];
-u1(-pi/32) q[10];
-cx q[14],q[10];
-u1(pi/32) q[10];
-u1(pi/16) q[14];
-cx q[14],q[11];
-u1(-pi/16) q[11];
-cx q[14],q[11];
-u1(pi/16) q[11];
-u1(pi/8) q[14];
-cx q[14],q[12];
-u1(-pi/8) q[12];
-cx q[14],q[12];
-u1(pi/8) q[12];
-u1(pi/4) q[14];
-cx q[14],q[13];
-u1(-pi/4) q[13];
-cx q[14],q[13];
-u1(pi/4) q[13];
-h q[14];
-u1(pi/65536) q[15];
-cx q[15],q[0];
-u1(-pi/65536) q[0];
-cx q[15],q[0];
-u1(pi/65536) q[0];
-u1(pi/32768) q[15];
-cx q[15],q[1];
-u1(-pi/32768) q[1];
-cx q[15],q[1];
-u1(pi/32768) q[1];
-u1(pi/16384) q[15];
-cx q[15],q[2];
-u1(-pi/16384) q[2];
-cx q[15],q[2];
-u1(pi/16384) q[2];
-u1(pi/8192) q[15];
-cx q[15],q[3];
-u1(-pi/8192) q[3];
-cx q[15],q[3];
-u1(pi/8192) q[3];
-u1(pi/4096) q[15];
-cx q[15],q[4];
-u1(-pi/4096) q[4];
-cx q[15],q[4];
-u1(pi/4096) q[4];
-u1(pi/2048) q[15];
-cx q[15],q[5];
-u1(-pi/2048) q[5];
-cx q[15],q[5];
-u1(pi/2048) q[5];
-u1(pi/1024) q[15];
-cx q[15],q[6];
-u1(-pi/1024) q[6];
-cx q[15],q[6];
-u1(pi/1024) q[6];
-u1(pi/512) q[15];
-cx q[15],q[7];
-u1(-pi/512) q[7];
-cx q[15],q[7];
-u1(pi/512) q[7];
-u1(pi/256) q[15];
-cx q[15],q[8];
-u1(-pi/256) q[8];
-cx q[15],q[8];
-u1(pi/256) q[8];
-u1(pi/128) q[15];
-cx q[15],q[9];
-u1(-pi/128) q[9];
-cx q[15],q[9];
-u1(pi/128) q[9];
-u1(pi/64) q[15];
-cx q[15],q[10];
-u1(-pi/64) q[10];
-cx q[15],q[10];
-u1(pi/64) q[10];
-u1(pi/32) q[15];
-cx q[15],q[11];
-u1(-pi/32) q[11];
-cx q[15],q[11];
-u1(pi/32) q[11];
-u1(pi/16) q[15];
-cx q[15],q[12];
-u1(-pi/16) q[12];
-cx q[15],q[12];
-u1(pi/16) q[12];
-u1(pi/8) q[15];
-cx q[15],q[13];
-u1(-pi/8) q[13];
-cx q[15],q[13];
-u1(pi/8) q[13];
-u1(pi/4) q[15];
-cx q[15],q[14];
-u1(-pi/4) q[14];
-cx q[15],q[14];
-u1(pi/4) q[14];
-h q[15];
-u1(pi/131072) q[16];
-cx q[16],q[0];
-u1(-pi/131072) q[0];
-cx q[16],q[0];
-u1(pi/131072) q[0];
-u1(pi/65536) q[16];
-cx q[16],q[1];
-u1(-pi/65536) q[1];
-cx q[16],q[1];
-u1(pi/65536) q[1];
-u1(pi/32768) q[16];
-cx q[16],q[2];
-u1(-pi/32768) q[2];
-cx q[16],q[2];
-u1(pi/32768) q[2];
-u1(pi/16384) q[16];
-cx q[16],q[3];
-u1(-pi/16384) q[3];
-cx q[16],q[3];
-u1(pi/16384) q[3];
-u1(pi/8192) q[16];
-cx q[16],q[4];
-u1(-pi/8192) q[4];
-cx q[16],q[4];
-u1(pi/8192) q[4];
-u1(pi/4096) q[16];
-cx q[16],q[5];
-u1(-pi/4096) q[5];
-cx q[16],q[5];
-u1(pi/4096) q[5];
-u1(pi/2048) q[16];
-cx q[16],q[6];
-u1(-pi/2048) q[6];
-cx q[16],q[6];
-u1(pi/2048) q[6];
-u1(pi/1024) q[16];
-cx q[16],q[7];
-u1(-pi/1024) q[7];
-cx q[16],q[7];
-u1(pi/1024) q[7];
-u1(pi/512) q[16];
-cx q[16],q[8];
-u1(-pi/512) q[8];
-cx q[16],q[8];
-u1(pi/512) q[8];
-u1(pi/256) q[16];
-cx q[16],q[9];
-u1(-pi/256) q[9];
-cx q[16],q[9];
-u1(pi/256) q[9];
-u1(pi/128) q[16];
-cx q[16],q[10];
-u1(-pi/128) q[10];
-cx q[16],q[10];
-u1(pi/128) q[10];
-u1(pi/64) q[16];
-cx q[16],q[11];
-u1(-pi/64) q[11];
-cx q[16],q[11];
-u1(pi/64) q[11];
-u1(pi/32) q[16];
-cx q[16],q[12];
-u1(-pi/32) q[12];
-cx q[16],q[12];
-u1(pi/32) q[12];
-u1(pi/16) q[16];
-cx q[16],q[13];
-u1(-pi/16) q[13];
-cx q[16],q[13];
-u1(pi/16) q[13];
-u1(pi/8) q[16];
-cx q[16],q[14];
-u1(-pi/8) q[14];
-cx q[16],q[14];
-u1(pi/8) q[14];
-u1(pi/4) q[16];
-cx q[16],q[15];
-u1(-pi/4) q[15];
-cx q[16],q[15];
-u1(pi/4) q[15];
-h q[16];
-u1(pi/262144) q[17];
-cx q[17],q[0];
-u1(-pi/262144) q[0];
-cx q[17],q[0];
-u1(pi/262144) q[0];
-u1(pi/131072) q[17];
-cx q[17],q[1];
-u1(-pi/131072) q[1];
-cx q[17],q[1];
-u1(pi/131072) q[1];
-u1(pi/65536) q[17];
-cx q[17],q[2];
-u1(-pi/65536) q[2];
-cx q[17],q[2];
-u1(pi/65536) q[2];
-u1(pi/32768) q[17];
-cx q[17],q[3];
-u1(-pi/32768) q[3];
-cx q[17],q[3];
-u1(pi/32768) q[3];
-u1(pi/16384) q[17];
-cx q[17],q[4];
-u1(-pi/16384) q[4];
-cx q[17],q[4];
-u1(pi/16384) q[4];
-u1(pi/8192) q[17];
-cx q[17],q[5];
-u1(-pi/8192) q[5];
-cx q[17],q[5];
-u1(pi/8192) q[5];
-u1(pi/4096) q[17];
-cx q[17],q[6];
-u1(-pi/4096) q[6];
-cx q[17],q[6];
-u1(pi/4096) q[6];
-u1(pi/2048) q[17];
-cx q[17],q[7];
-u1(-pi/2048) q[7];
-cx q[17],q[7];
-u1(pi/2048) q[7];
-u1(pi/1024) q[17];
-cx q[17],q[8];
-u1(-pi/1024) q[8];
-cx q[17],q[8];
-u1(pi/1024) q[8];
-u1(pi/512) q[17];
-cx q[17],q[9];
-u1(-pi/512) q[9];
-cx q[17],q[9];
-u1(pi/512) q[9];
-u1(pi/256) q[17];
-cx q[17],q[10];
-u1(-pi/256) q[10];
-cx q[17],q[10];
-u1(pi/256) q[10];
-u1(pi/128) q[17];
-cx q[17],q[11];
-u1(-pi/128) q[11];
-cx q[17],q[11];
-u1(pi/128) q[11];
-u1(pi/64) q[17];
-cx q[17],q[12];
-u1(-pi/64) q[12];
-cx q[17],q[12];
-u1(pi/64) q[12];
-u1(pi/32) q[17];
-cx q[17],q[13];
-u1(-pi/32) q[13];
-cx q[17],q[13];
-u1(pi/32) q[13];
-u1(pi/16) q[17];
-cx q[17],q[14];
-u1(-pi/16) q[14];
-cx q[17],q[14];
-u1(pi/16) q[14];
-u1(pi/8) q[17];
-cx q[17],q[15];
-u1(-pi/8) q[15];
-cx q[17],q[15];
-u1(pi/8) q[15];
-u1(pi/4) q[17];
-cx q[17],q[16];
-u1(-pi/4) q[16];
-cx q[17],q[16];
-u1(pi/4) q[16];
-h q[17];
-u1(pi/524288) q[18];
-cx q[18],q[0];
-u1(-pi/524288) q[0];
-cx q[18],q[0];
-u1(pi/524288) q[0];
-u1(pi/262144) q[18];
-cx q[18],q[1];
-u1(-pi/262144) q[1];
-cx q[18],q[1];
-u1(pi/262144) q[1];
-u1(pi/131072) q[18];
-cx q[18],q[2];
-u1(-pi/131072) q[2];
-cx q[18],q[2];
-u1(pi/131072) q[2];
-u1(pi/65536) q[18];
-cx q[18],q[3];
-u1(-pi/65536) q[3];
-cx q[18],q[3];
-u1(pi/65536) q[3];
-u1(pi/32768) q[18];
-cx q[18],q[4];
-u1(-pi/32768) q[4];
-cx q[18],q[4];
-u1(pi/32768) q[4];
-u1(pi/16384) q[18];
-cx q[18],q[5];
-u1(-pi/16384) q[5];
-cx q[18],q[5];
-u1(pi/16384) q[5];
-u1(pi/8192) q[18];
-cx q[18],q[6];
-u1(-pi/8192) q[6];
-cx q[18],q[6];
-u1(pi/8192) q[6];
-u1(pi/4096) q[18];
-cx q[18],q[7];
-u1(-pi/4096) q[7];
-cx q[18],q[7];
-u1(pi/4096) q[7];
-u1(pi/2048) q[18];
-cx q[18],q[8];
-u1(-pi/2048) q[8];
-cx q[18],q[8];
-u1(pi/2048) q[8];
-u1(pi/1024) q[18];
-cx q[18],q[9];
-u1(-pi/1024) q[9];
-cx q[18],q[9];
-u1(pi/1024) q[9];
-u1(pi/512) q[18];
-cx q[18],q[10];
-u1(-pi/512) q[10];
-cx q[18],q[10];
-u1(pi/512) q[10];
-u1(pi/256) q[18];
-cx q[18],q[11];
-u1(-pi/256) q[11];
-cx q[18],q[11];
-u1(pi/256) q[11];
-u1(pi/128) q[18];
-cx q[18],q[12];
-u1(-pi/128) q[12];
-cx q[18],q[12];
-u1(pi/128) q[12];
-u1(pi/64) q[18];
-cx q[18],q[13];
-u1(-pi/64) q[13];
-cx q[18],q[13];
-u1(pi/64) q[13];
-u1(pi/32) q[18];
-cx q[18],q[14];
-u1(-pi/32) q[14];
-cx q[18],q[14];
-u1(pi/32) q[14];
-u1(pi/16) q[18];
-cx q[18],q[15];
-u1(-pi/16) q[15];
-cx q[18],q[15];
-u1(pi/16) q[15];
-u1(pi/8) q[18];
-cx q[18],q[16];
-u1(-pi/8) q[16];
-cx q[18],q[16];
-u1(pi/8) q[16];
-u1(pi/4) q[18];
-cx q[18],q[17];
-u1(-pi/4) q[17];
-cx q[18],q[17];
-u1(pi/4) q[17];
-h q[18];
-u1(pi/1048576) q[19];
-cx q[19],q[0];
-u1(-pi/1048576) q[0];
-cx q[19],q[0];
-u1(pi/1048576) q[0];
-u1(pi/524288) q[19];
-cx q[19],q[1];
-u1(-pi/524288) q[1];
-cx q[19],q[1];
-u1(pi/524288) q[1];
-u1(pi/262144) q[19];
-cx q[19],q[2];
-u1(-pi/262144) q[2];
-cx q[19],q[2];
-u1(pi/262144) q[2];
-u1(pi/131072) q[19];
-cx q[19],q[3];
-u1(-pi/131072) q[3];
-cx q[19],q[3];
-u1(pi/131072) q[3];
-u1(pi/65536) q[19];
-cx q[19],q[4];
-u1(-pi/65536) q[4];
-cx q[19],q[4];
-u1(pi/65536) q[4];
-u1(pi/32768) q[19];
-cx q[19],q[5];
-u1(-pi/32768) q[5];
-cx q[19],q[5];
-u1(pi/32768) q[5];
-u1(pi/16384) q[19];
-cx q[19],q[6];
-u1(-pi/16384) q[6];
-cx q[19],q[6];
-u1(pi/16384) q[6];
-u1(pi/8192) q[19];
-cx q[19],q[7];
-u1(-pi/8192) q[7];
-cx q[19],q[7];
-u1(pi/8192) q[7];
-u1(pi/4096) q[19];
-cx q[19],q[8];
-u1(-pi/4096) q[8];
-cx q[19],q[8];
-u1(pi/4096) q[8];
-u1(pi/2048) q[19];
-cx q[19],q[9];
-u1(-pi/2048) q[9];
-cx q[19],q[9];
-u1(pi/2048) q[9];
-u1(pi/1024) q[19];
-cx q[19],q[10];
-u1(-pi/1024) q[10];
-cx q[19],q[10];
-u1(pi/1024) q[10];
-u1(pi/512) q[19];
-cx q[19],q[11];
-u1(-pi/512) q[11];
-cx q[19],q[11];
-u1(pi/512) q[11];
-u1(pi/256) q[19];
-cx q[19],q[12];
-u1(-pi/256) q[12];
-cx q[19],q[12];
-u1(pi/256) q[12];
-u1(pi/128) q[19];
-cx q[19],q[13];
-u1(-pi/128) q[13];
-cx q[19],q[13];
-u1(pi/128) q[13];
-u1(pi/64) q[19];
-cx q[19],q[14];
-u1(-pi/64) q[14];
-cx q[19],q[14];
-u1(pi/64) q[14];
-u1(pi/32) q[19];
-cx q[19],q[15];
-u1(-pi/32) q[15];
-cx q[19],q[15];
-u1(pi/32) q[15];
-u1(pi/16) q[19];
-cx q[19],q[16];
-u1(-pi/16) q[16];
-cx q[19],q[16];
-u1(pi/16) q[16];
-u1(pi/8) q[19];
-cx q[19],q[17];
-u1(-pi/8) q[17];
-cx q[19],q[17];
-u1(pi/8) q[17];
-u1(pi/4) q[19];
-cx q[19],q[18];
-u1(-pi/4) q[18];
-cx q[19],q[18];
-u1(pi/4) q[18];
-h q[19];
-u1(pi/2097152) q[20];
-cx q[20],q[0];
-u1(-pi/2097152) q[0];
-cx q[20],q[0];
-u1(pi/2097152) q[0];
-u1(pi/1048576) q[20];
-cx q[20],q[1];
-u1(-pi/1048576) q[1];
-cx q[20],q[1];
-u1(pi/1048576) q[1];
-u1(pi/524288) q[20];
-cx q[20],q[2];
-u1(-pi/524288) q[2];
-cx q[20],q[2];
-u1(pi/524288) q[2];
-u1(pi/262144) q[20];
-cx q[20],q[3];
-u1(-pi/262144) q[3];
-cx q[20],q[3];
-u1(pi/262144) q[3];
-u1(pi/131072) q[20];
-cx q[20],q[4];
-u1(-pi/131072) q[4];
-cx q[20],q[4];
-u1(pi/131072) q[4];
-u1(pi/65536) q[20];
-cx q[20],q[5];
-u1(-pi/65536) q[5];
-cx q[20],q[5];
-u1(pi/65536) q[5];
-u1(pi/32768) q[20];
-cx q[20],q[6];
-u1(-pi/32768) q[6];
-cx q[20],q[6];
-u1(pi/32768) q[6];
-u1(pi/16384) q[20];
-cx q[20],q[7];
-u1(-pi/16384) q[7];
-cx q[20],q[7];
-u1(pi/16384) q[7];
-u1(pi/8192) q[20];
-cx q[20],q[8];
-u1(-pi/8192) q[8];
-cx q[20],q[8];
-u1(pi/8192) q[8];
-u1(pi/4096) q[20];
-cx q[20],q[9];
-u1(-pi/4096) q[9];
-cx q[20],q[9];
-u1(pi/4096) q[9];
-u1(pi/2048) q[20];
-cx q[20],q[10];
-u1(-pi/2048) q[10];
-cx q[20],q[10];
-u1(pi/2048) q[10];
-u1(pi/1024) q[20];
-cx q[20],q[11];
-u1(-pi/1024) q[11];
-cx q[20],q[11];
-u1(pi/1024) q[11];
-u1(pi/512) q[20];
-cx q[20],q[12];
-u1(-pi/512) q[12];
-cx q[20],q[12];
-u1(pi/512) q[12];
-u1(pi/256) q[20];
-cx q[20],q[13];
-u1(-pi/256) q[13];
-cx q[20],q[13];
-u1(pi/256) q[13];
-u1(pi/128) q[20];
-cx q[20],q[14];
-u1(-pi/128) q[14];
-cx q[20],q[14];
-u1(pi/128) q[14];
-u1(pi/64) q[20];
-cx q[20],q[15];
-u1(-pi/64) q[15];
-cx q[20],q[15];
-u1(pi/64) q[15];
-u1(pi/32) q[20];
-cx q[20],q[16];
-u1(-pi/32) q[16];
-cx q[20],q[16];
-u1(pi/32) q[16];
-u1(pi/16) q[20];
-cx q[20],q[17];
-u1(-pi/16) q[17];
-cx q[20],q[17];
-u1(pi/16) q[17];
-u1(pi/8) q[20];
-cx q[20],q[18];
-u1(-pi/8) q[18];
-cx q[20],q[18];
-u1(pi/8) q[18];
-u1(pi/4) q[20];
-cx q[20],q[19];
-u1(-pi/4) q[19];
-cx q[20],q[19];
-u1(pi/4) q[19];
-h q[20];
-u1(pi/4194304) q[21];
-cx q[21],q[0];
-u1(-pi/4194304) q[0];
-cx q[21],q[0];
-u1(pi/4194304) q[0];
-u1(pi/2097152) q[21];
-cx q[21],q[1];
-u1(-pi/2097152) q[1];
-cx q[21],q[1];
-u1(pi/2097152) q[1];
-u1(pi/1048576) q[21];
-cx q[21],q[2];
-u1(-pi/1048576) q[2];
-cx q[21],q[2];
-u1(pi/1048576) q[2];
-u1(pi/524288) q[21];
-cx q[21],q[3];
-u1(-pi/524288) q[3];
-cx q[21],q[3];
-u1(pi/524288) q[3];
-u1(pi/262144) q[21];
-cx q[21],q[4];
-u1(-pi/262144) q[4];
-cx q[21],q[4];
-u1(pi/262144) q[4];
-u1(pi/131072) q[21];
-cx q[21],q[5];
-u1(-pi/131072) q[5];
-cx q[21],q[5];
-u1(pi/131072) q[5];
-u1(pi/65536) q[21];
-cx q[21],q[6];
-u1(-pi/65536) q[6];
-cx q[21],q[6];
-u1(pi/65536) q[6];
-u1(pi/32768) q[21];
-cx q[21],q[7];
-u1(-pi/32768) q[7];
-cx q[21],q[7];
-u1(pi/32768) q[7];
-u1(pi/16384) q[21];
-cx q[21],q[8];
-u1(-pi/16384) q[8];
-cx q[21],q[8];
-u1(pi/16384) q[8];
-u1(pi/8192) q[21];
-cx q[21],q[9];
-u1(-pi/8192) q[9];
-cx q[21],q[9];
-u1(pi/8192) q[9];
-u1(pi/4096) q[21];
-cx q[21],q[10];
-u1(-pi/4096) q[10];
-cx q[21],q[10];
-u1(pi/4096) q[10];
-u1(pi/2048) q[21];
-cx q[21],q[11];
-u1(-pi/2048) q[11];
-cx q[21],q[11];
-u1(pi/2048) q[11];
-u1(pi/1024) q[21];
-cx q[21],q[12];
-u1(-pi/1024) q[12];
-cx q[21],q[12];
-u1(pi/1024) q[12];
-u1(pi/512) q[21];
-cx q[21],q[13];
-u1(-pi/512) q[13];
-cx q[21],q[13];
-u1(pi/512) q[13];
-u1(pi/256) q[21];
-cx q[21],q[14];
-u1(-pi/256) q[14];
-cx q[21],q[14];
-u1(pi/256) q[14];
-u1(pi/128) q[21];
-cx q[21],q[15];
-u1(-pi/128) q[15];
-cx q[21],q[15];
-u1(pi/128) q[15];
-u1(pi/64) q[21];
-cx q[21],q[16];
-u1(-pi/64) q[16];
-cx q[21],q[16];
-u1(pi/64) q[16];
-u1(pi/32) q[21];
-cx q[21],q[17];
-u1(-pi/32) q[17];
-cx q[21],q[17];
-u1(pi/32) q[17];
-u1(pi/16) q[21];
-cx q[21],q[18];
-u1(-pi/16) q[18];
-cx q[21],q[18];
-u1(pi/16) q[18];
-u1(pi/8) q[21];
-cx q[21],q[19];
-u1(-pi/8) q[19];
-cx q[21],q[19];
-u1(pi/8) q[19];
-u1(pi/4) q[21];
-cx q[21],q[20];
-u1(-pi/4) q[20];
-cx q[21],q[20];
-u1(pi/4) q[20];
-h q[21];
-u1(pi/8388608) q[22];
-cx q[22],q[0];
-u1(-pi/8388608) q[0];
-cx q[22],q[0];
-u1(pi/8388608) q[0];
-u1(pi/4194304) q[22];
-cx q[22],q[1];
-u1(-pi/4194304) q[1];
-cx q[22],q[1];
-u1(pi/4194304) q[1];
-u1(pi/2097152) q[22];
-cx q[22],q[2];
-u1(-pi/2097152) q[2];
-cx q[22],q[2];
-u1(pi/2097152) q[2];
-u1(pi/1048576) q[22];
-cx q[22],q[3];
-u1(-pi/1048576) q[3];
-cx q[22],q[3];
-u1(pi/1048576) q[3];
-u1(pi/524288) q[22];
-cx q[22],q[4];
-u1(-pi/524288) q[4];
-cx q[22],q[4];
-u1(pi/524288) q[4];
-u1(pi/262144) q[22];
-cx q[22],q[5];
-u1(-pi/262144) q[5];
-cx q[22],q[5];
-u1(pi/262144) q[5];
-u1(pi/131072) q[22];
-cx q[22],q[6];
-u1(-pi/131072) q[6];
-cx q[22],q[6];
-u1(pi/131072) q[6];
-u1(pi/65536) q[22];
-cx q[22],q[7];
-u1(-pi/65536) q[7];
-cx q[22],q[7];
-u1(pi/65536) q[7];
-u1(pi/32768) q[22];
-cx q[22],q[8];
-u1(-pi/32768) q[8];
-cx q[22],q[8];
-u1(pi/32768) q[8];
-u1(pi/16384) q[22];
-cx q[22],q[9];
-u1(-pi/16384) q[9];
-cx q[22],q[9];
-u1(pi/16384) q[9];
-u1(pi/8192) q[22];
-cx q[22],q[10];
-u1(-pi/8192) q[10];
-cx q[22],q[10];
-u1(pi/8192) q[10];
-u1(pi/4096) q[22];
-cx q[22],q[11];
-u1(-pi/4096) q[11];
-cx q[22],q[11];
-u1(pi/4096) q[11];
-u1(pi/2048) q[22];
-cx q[22],q[12];
-u1(-pi/2048) q[12];
-cx q[22],q[12];
-u1(pi/2048) q[12];
-u1(pi/1024) q[22];
-cx q[22],q[13];
-u1(-pi/1024) q[13];
-cx q[22],q[13];
-u1(pi/1024) q[13];
-u1(pi/512) q[22];
-cx q[22],q[14];
-u1(-pi/512) q[14];
-cx q[22],q[14];
-u1(pi/512) q[14];
-u1(pi/256) q[22];
-cx q[22],q[15];
-u1(-pi/256) q[15];
-cx q[22],q[15];
-u1(pi/256) q[15];
-u1(pi/128) q[22];
-cx q[22],q[16];
-u1(-pi/128) q[16];
-cx q[22],q[16];
-u1(pi/128) q[16];
-u1(pi/64) q[22];
-cx q[22],q[17];
-u1(-pi/64) q[17];
-cx q[22],q[17];
-u1(pi/64) q[17];
-u1(pi/32) q[22];
-cx q[22],q[18];
-u1(-pi/32) q[18];
-cx q[22],q[18];
-u1(pi/32) q[18];
-u1(pi/16) q[22];
-cx q[22],q[19];
-u1(-pi/16) q[19];
-cx q[22],q[19];
-u1(pi/16) q[19];
-u1(pi/8) q[22];
-cx q[22],q[20];
-u1(-pi/8) q[20];
-cx q[22],q[20];
-u1(pi/8) q[20];
-u1(pi/4) q[22];
-cx q[22],q[21];
-u1(-pi/4) q[21];
-cx q[22],q[21];
-u1(pi/4) q[21];
-h q[22];
-u1(pi/16777216) q[23];
-cx q[23],q[0];
-u1(-pi/16777216) q[0];
-cx q[23],q[0];
-u1(pi/16777216) q[0];
-u1(pi/8388608) q[23];
-cx q[23],q[1];
-u1(-pi/8388608) q[1];
-cx q[23],q[1];
-u1(pi/8388608) q[1];
-u1(pi/4194304) q[23];
-cx q[23],q[2];
-u1(-pi/4194304) q[2];
-cx q[23],q[2];
-u1(pi/4194304) q[2];
-u1(pi/2097152) q[23];
-cx q[23],q[3];
-u1(-pi/2097152) q[3];
-cx q[23],q[3];
-u1(pi/2097152) q[3];
-u1(pi/1048576) q[23];
-cx q[23],q[4];
-u1(-pi/1048576) q[4];
-cx q[23],q[4];
-u1(pi/1048576) q[4];
-u1(pi/524288) q[23];
-cx q[23],q[5];
-u1(-pi/524288) q[5];
-cx q[23],q[5];
-u1(pi/524288) q[5];
-u1(pi/262144) q[23];
-cx q[23],q[6];
-u1(-pi/262144) q[6];
-cx q[23],q[6];
-u1(pi/262144) q[6];
-u1(pi/131072) q[23];
-cx q[23],q[7];
-u1(-pi/131072) q[7];
-cx q[23],q[7];
-u1(pi/131072) q[7];
-u1(pi/65536) q[23];
-cx q[23],q[8];
-u1(-pi/65536) q[8];
-cx q[23],q[8];
-u1(pi/65536) q[8];
-u1(pi/32768) q[23];
-cx q[23],q[9];
-u1(-pi/32768) q[9];
-cx q[23],q[9];
-u1(pi/32768) q[9];
-u1(pi/16384) q[23];
-cx q[23],q[10];
-u1(-pi/16384) q[10];
-cx q[23],q[10];
-u1(pi/16384) q[10];
-u1(pi/8192) q[23];
-cx q[23],q[11];
-u1(-pi/8192) q[11];
-cx q[23],q[11];
-u1(pi/8192) q[11];
-u1(pi/4096) q[23];
-cx q[23],q[12];
-u1(-pi/4096) q[12];
-cx q[23],q[12];
-u1(pi/4096) q[12];
-u1(pi/2048) q[23];
-cx q[23],q[13];
-u1(-pi/2048) q[13];
-cx q[23],q[13];
-u1(pi/2048) q[13];
-u1(pi/1024) q[23];
-cx q[23],q[14];
-u1(-pi/1024) q[14];
-cx q[23],q[14];
-u1(pi/1024) q[14];
-u1(pi/512) q[23];
-cx q[23],q[15];
-u1(-pi/512) q[15];
-cx q[23],q[15];
-u1(pi/512) q[15];
-u1(pi/256) q[23];
-cx q[23],q[16];
-u1(-pi/256) q[16];
-cx q[23],q[16];
-u1(pi/256) q[16];
-u1(pi/128) q[23];
-cx q[23],q[17];
-u1(-pi/128) q[17];
-cx q[23],q[17];
-u1(pi/128) q[17];
-u1(pi/64) q[23];
-cx q[23],q[18];
-u1(-pi/64) q[18];
-cx q[23],q[18];
-u1(pi/64) q[18];
-u1(pi/32) q[23];
-cx q[23],q[19];
-u1(-pi/32) q[19];
-cx q[23],q[19];
-u1(pi/32) q[19];
-u1(pi/16) q[23];
-cx q[23],q[20];
-u1(-pi/16) q[20];
-cx q[23],q[20];
-u1(pi/16) q[20];
-u1(pi/8) q[23];
-cx q[23],q[21];
-u1(-pi/8) q[21];
-cx q[23],q[21];
-u1(pi/8) q[21];
-u1(pi/4) q[23];
-cx q[23],q[22];
-u1(-pi/4) q[22];
-cx q[23],q[22];
-u1(pi/4) q[22];
-h q[23];
-u1(pi/33554432) q[24];
-cx q[24],q[0];
-u1(-pi/33554432) q[0];
-cx q[24],q[0];
-u1(pi/33554432) q[0];
-u1(pi/16777216) q[24];
-cx q[24],q[1];
-u1(-pi/16777216) q[1];
-cx q[24],q[1];
-u1(pi/16777216) q[1];
-u1(pi/8388608) q[24];
-cx q[24],q[2];
-u1(-pi/8388608) q[2];
-cx q[24],q[2];
-u1(pi/8388608) q[2];
-u1(pi/4194304) q[24];
-cx q[24],q[3];
-u1(-pi/4194304) q[3];
-cx q[24],q[3];
-u1(pi/4194304) q[3];
-u1(pi/2097152) q[24];
-cx q[24],q[4];
-u1(-pi/2097152) q[4];
-cx q[24],q[4];
-u1(pi/2097152) q[4];
-u1(pi/1048576) q[24];
-cx q[24],q[5];
-u1(-pi/1048576) q[5];
-cx q[24],q[5];
-u1(pi/1048576) q[5];
-u1(pi/524288) q[24];
-cx q[24],q[6];
-u1(-pi/524288) q[6];
-cx q[24],q[6];
-u1(pi/524288) q[6];
-u1(pi/262144) q[24];
-cx q[24],q[7];
-u1(-pi/262144) q[7];
-cx q[24],q[7];
-u1(pi/262144) q[7];
-u1(pi/131072) q[24];
-cx q[24],q[8];
-u1(-pi/131072) q[8];
-cx q[24],q[8];
-u1(pi/131072) q[8];
-u1(pi/65536) q[24];
-cx q[24],q[9];
-u1(-pi/65536) q[9];
-cx q[24],q[9];
-u1(pi/65536) q[9];
-u1(pi/32768) q[24];
-cx q[24],q[10];
-u1(-pi/32768) q[10];
-cx q[24],q[10];
-u1(pi/32768) q[10];
-u1(pi/16384) q[24];
-cx q[24],q[11];
-u1(-pi/16384) q[11];
-cx q[24],q[11];
-u1(pi/16384) q[11];
-u1(pi/8192) q[24];
-cx q[24],q[12];
-u1(-pi/8192) q[12];
-cx q[24],q[12];
-u1(pi/8192) q[12];
-u1(pi/4096) q[24];
-cx q[24],q[13];
-u1(-pi/4096) q[13];
-cx q[24],q[13];
-u1(pi/4096) q[13];
-u1(pi/2048) q[24];
-cx q[24],q[14];
-u1(-pi/2048) q[14];
-cx q[24],q[14];
-u1(pi/2048) q[14];
-u1(pi/1024) q[24];
-cx q[24],q[15];
-u1(-pi/1024) q[15];
-cx q[24],q[15];
-u1(pi/1024) q[15];
-u1(pi/512) q[24];
-cx q[24],q[16];
-u1(-pi/512) q[16];
-cx q[24],q[16];
-u1(pi/512) q[16];
-u1(pi/256) q[24];
-cx q[24],q[17];
-u1(-pi/256) q[17];
-cx q[24],q[17];
-u1(pi/256) q[17];
-u1(pi/128) q[24];
-cx q[24],q[18];
-u1(-pi/128) q[18];
-cx q[24],q[18];
-u1(pi/128) q[18];
-u1(pi/64) q[24];
-cx q[24],q[19];
-u1(-pi/64) q[19];
-cx q[24],q[19];
-u1(pi/64) q[19];
-u1(pi/32) q[24];
-cx q[24],q[20];
-u1(-pi/32) q[20];
-cx q[24],q[20];
-u1(pi/32) q[20];
-u1(pi/16) q[24];
-cx q[24],q[21];
-u1(-pi/16) q[21];
-cx q[24],q[21];
-u1(pi/16) q[21];
-u1(pi/8) q[24];
-cx q[24],q[22];
-u1(-pi/8) q[22];
-cx q[24],q[22];
-u1(pi/8) q[22];
-u1(pi/4) q[24];
-cx q[24],q[23];
-u1(-pi/4) q[23];
-cx q[24],q[23];
-u1(pi/4) q[23];
-h q[24];
-u1(pi/67108864) q[25];
-cx q[25],q[0];
-u1(-pi/67108864) q[0];
-cx q[25],q[0];
-u1(pi/67108864) q[0];
-u1(pi/33554432) q[25];
-cx q[25],q[1];
-u1(-pi/33554432) q[1];
-cx q[25],q[1];
-u1(pi/33554432) q[1];
-u1(pi/16777216) q[25];
-cx q[25],q[2];
-u1(-pi/16777216) q[2];
-cx q[25],q[2];
-u1(pi/16777216) q[2];
-u1(pi/8388608) q[25];
-cx q[25],q[3];
-u1(-pi/8388608) q[3];
-cx q[25],q[3];
-u1(pi/8388608) q[3];
-u1(pi/4194304) q[25];
-cx q[25],q[4];
-u1(-pi/4194304) q[4];
-cx q[25],q[4];
-u1(pi/4194304) q[4];
-u1(pi/2097152) q[25];
-cx q[25],q[5];
-u1(-pi/2097152) q[5];
-cx q[25],q[5];
-u1(pi/2097152) q[5];
-u1(pi/1048576) q[25];
-cx q[25],q[6];
-u1(-pi/1048576) q[6];
-cx q[25],q[6];
-u1(pi/1048576) q[6];
-u1(pi/524288) q[25];
-cx q[25],q[7];
-u1(-pi/524288) q[7];
-cx q[25],q[7];
-u1(pi/524288) q[7];
-u1(pi/262144) q[25];
-cx q[25],q[8];
-u1(-pi/262144) q[8];
-cx q[25],q[8];
-u1(pi/262144) q[8];
-u1(pi/131072) q[25];
-cx q[25],q[9];
-u1(-pi/131072) q[9];
-cx q[25],q[9];
-u1(pi/131072) q[9];
-u1(pi/65536) q[25];
-cx q[25],q[10];
-u1(-pi/65536) q[10];
-cx q[25],q[10];
-u1(pi/65536) q[10];
-u1(pi/32768) q[25];
-cx q[25],q[11];
-u1(-pi/32768) q[11];
-cx q[25],q[11];
-u1(pi/32768) q[11];
-u1(pi/16384) q[25];
-cx q[25],q[12];
-u1(-pi/16384) q[12];
-cx q[25],q[12];
-u1(pi/16384) q[12];
-u1(pi/8192) q[25];
-cx q[25],q[13];
-u1(-pi/8192) q[13];
-cx q[25],q[13];
-u1(pi/8192) q[13];
-u1(pi/4096) q[25];
-cx q[25],q[14];
-u1(-pi/4096) q[14];
-cx q[25],q[14];
-u1(pi/4096) q[14];
-u1(pi/2048) q[25];
-cx q[25],q[15];
-u1(-pi/2048) q[15];
-cx q[25],q[15];
-u1(pi/2048) q[15];
-u1(pi/1024) q[25];
-cx q[25],q[16];
-u1(-pi/1024) q[16];
-cx q[25],q[16];
-u1(pi/1024) q[16];
-u1(pi/512) q[25];
-cx q[25],q[17];
-u1(-pi/512) q[17];
-cx q[25],q[17];
-u1(pi/512) q[17];
-u1(pi/256) q[25];
-cx q[25],q[18];
-u1(-pi/256) q[18];
-cx q[25],q[18];
-u1(pi/256) q[18];
-u1(pi/128) q[25];
-cx q[25],q[19];
-u1(-pi/128) q[19];
-cx q[25],q[19];
-u1(pi/128) q[19];
-u1(pi/64) q[25];
-cx q[25],q[20];
-u1(-pi/64) q[20];
-cx q[25],q[20];
-u1(pi/64) q[20];
-u1(pi/32) q[25];
-cx q[25],q[21];
-u1(-pi/32) q[21];
-cx q[25],q[21];
-u1(pi/32) q[21];
-u1(pi/16) q[25];
-cx q[25],q[22];
-u1(-pi/16) q[22];
-cx q[25],q[22];
-u1(pi/16) q[22];
-u1(pi/8) q[25];
-cx q[25],q[23];
-u1(-pi/8) q[23];
-cx q[25],q[23];
-u1(pi/8) q[23];
-u1(pi/4) q[25];
-cx q[25],q[24];
-u1(-pi/4) q[24];
-cx q[25],q[24];
-u1(pi/4) q[24];
-h q[25];
-u1(pi/134217728) q[26];
-cx q[26],q[0];
-u1(-pi/134217728) q[0];
-cx q[26],q[0];
-u1(pi/134217728) q[0];
-u1(pi/67108864) q[26];
-cx q[26],q[1];
-u1(-pi/67108864) q[1];
-cx q[26],q[1];
-u1(pi/67108864) q[1];
-u1(pi/33554432) q[26];
-cx q[26],q[2];
-u1(-pi/33554432) q[2];
-cx q[26],q[2];
-u1(pi/33554432) q[2];
-u1(pi/16777216) q[26];
-cx q[26],q[3];
-u1(-pi/16777216) q[3];
-cx q[26],q[3];
-u1(pi/16777216) q[3];
-u1(pi/8388608) q[26];
-cx q[26],q[4];
-u1(-pi/8388608) q[4];
-cx q[26],q[4];
-u1(pi/8388608) q[4];
-u1(pi/4194304) q[26];
-cx q[26],q[5];
-u1(-pi/4194304) q[5];
-cx q[26],q[5];
-u1(pi/4194304) q[5];
-u1(pi/2097152) q[26];
-cx q[26],q[6];
-u1(-pi/2097152) q[6];
-cx q[26],q[6];
-u1(pi/2097152) q[6];
-u1(pi/1048576) q[26];
-cx q[26],q[7];
-u1(-pi/1048576) q[7];
-cx q[26],q[7];
-u1(pi/1048576) q[7];
-u1(pi/524288) q[26];
-cx q[26],q[8];
-u1(-pi/524288) q[8];
-cx q[26],q[8];
-u1(pi/524288) q[8];
-u1(pi/262144) q[26];
-cx q[26],q[9];
-u1(-pi/262144) q[9];
-cx q[26],q[9];
-u1(pi/262144) q[9];
-u1(pi/131072) q[26];
-cx q[26],q[10];
-u1(-pi/131072) q[10];
-cx q[26],q[10];
-u1(pi/131072) q[10];
-u1(pi/65536) q[26];
-cx q[26],q[11];
-u1(-pi/65536) q[11];
-cx q[26],q[11];
-u1(pi/65536) q[11];
-u1(pi/32768) q[26];
-cx q[26],q[12];
-u1(-pi/32768) q[12];
-cx q[26],q[12];
-u1(pi/32768) q[12];
-u1(pi/16384) q[26];
-cx q[26],q[13];
-u1(-pi/16384) q[13];
-cx q[26],q[13];
-u1(pi/16384) q[13];
-u1(pi/8192) q[26];
-cx q[26],q[14];
-u1(-pi/8192) q[14];
-cx q[26],q[14];
-u1(pi/8192) q[14];
-u1(pi/4096) q[26];
-cx q[26],q[15];
-u1(-pi/4096) q[15];
-cx q[26],q[15];
-u1(pi/4096) q[15];
-u1(pi/2048) q[26];
-cx q[26],q[16];
-u1(-pi/2048) q[16];
-cx q[26],q[16];
-u1(pi/2048) q[16];
-u1(pi/1024) q[26];
-cx q[26],q[17];
-u1(-pi/1024) q[17];
-cx q[26],q[17];
-u1(pi/1024) q[17];
-u1(pi/512) q[26];
-cx q[26],q[18];
-u1(-pi/512) q[18];
-cx q[26],q[18];
-u1(pi/512) q[18];
-u1(pi/256) q[26];
-cx q[26],q[19];
-u1(-pi/256) q[19];
-cx q[26],q[19];
-u1(pi/256) q[19];
-u1(pi/128) q[26];
-cx q[26],q[20];
-u1(-pi/128) q[20];
-cx q[26],q[20];
-u1(pi/128) q[20];
-u1(pi/64) q[26];
-cx q[26],q[21];
-u1(-pi/64) q[21];
-cx q[26],q[21];
-u1(pi/64) q[21];
-u1(pi/32) q[26];
-cx q[26],q[22];
-u1(-pi/32) q[22];
-cx q[26],q[22];
-u1(pi/32) q[22];
-u1(pi/16) q[26];
-cx q[26],q[23];
-u1(-pi/16) q[23];
-cx q[26],q[23];
-u1(pi/16) q[23];
-u1(pi/8) q[26];
-cx q[26],q[24];
-u1(-pi/8) q[24];
-cx q[26],q[24];
-u1(pi/8) q[24];
-u1(pi/4) q[26];
-cx q[26],q[25];
-u1(-pi/4) q[25];
-cx q[26],q[25];
-u1(pi/4) q[25];
-h q[26];
-u1(pi/268435456) q[27];
-cx q[27],q[0];
-u1(-pi/268435456) q[0];
-cx q[27],q[0];
-u1(pi/268435456) q[0];
-u1(pi/134217728) q[27];
-cx q[27],q[1];
-u1(-pi/134217728) q[1];
-cx q[27],q[1];
-u1(pi/134217728) q[1];
-u1(pi/67108864) q[27];
-cx q[27],q[2];
-u1(-pi/67108864) q[2];
-cx q[27],q[2];
-u1(pi/67108864) q[2];
-u1(pi/33554432) q[27];
-cx q[27],q[3];
-u1(-pi/33554432) q[3];
-cx q[27],q[3];
-u1(pi/33554432) q[3];
-u1(pi/16777216) q[27];
-cx q[27],q[4];
-u1(-pi/16777216) q[4];
-cx q[27],q[4];
-u1(pi/16777216) q[4];
-u1(pi/8388608) q[27];
-cx q[27],q[5];
-u1(-pi/8388608) q[5];
-cx q[27],q[5];
-u1(pi/8388608) q[5];
-u1(pi/4194304) q[27];
-cx q[27],q[6];
-u1(-pi/4194304) q[6];
-cx q[27],q[6];
-u1(pi/4194304) q[6];
-u1(pi/2097152) q[27];
-cx q[27],q[7];
-u1(-pi/2097152) q[7];
-cx q[27],q[7];
-u1(pi/2097152) q[7];
-u1(pi/1048576) q[27];
-cx q[27],q[8];
-u1(-pi/1048576) q[8];
-cx q[27],q[8];
-u1(pi/1048576) q[8];
-u1(pi/524288) q[27];
-cx q[27],q[9];
-u1(-pi/524288) q[9];
-cx q[27],q[9];
-u1(pi/524288) q[9];
-u1(pi/262144) q[27];
-cx q[27],q[10];
-u1(-pi/262144) q[10];
-cx q[27],q[10];
-u1(pi/262144) q[10];
-u1(pi/131072) q[27];
-cx q[27],q[11];
-u1(-pi/131072) q[11];
-cx q[27],q[11];
-u1(pi/131072) q[11];
-u1(pi/65536) q[27];
-cx q[27],q[12];
-u1(-pi/65536) q[12];
-cx q[27],q[12];
-u1(pi/65536) q[12];
-u1(pi/32768) q[27];
-cx q[27],q[13];
-u1(-pi/32768) q[13];
-cx q[27],q[13];
-u1(pi/32768) q[13];
-u1(pi/16384) q[27];
-cx q[27],q[14];
-u1(-pi/16384) q[14];
-cx q[27],q[14];
-u1(pi/16384) q[14];
-u1(pi/8192) q[27];
-cx q[27],q[15];
-u1(-pi/8192) q[15];
-cx q[27],q[15];
-u1(pi/8192) q[15];
-u1(pi/4096) q[27];
-cx q[27],q[16];
-u1(-pi/4096) q[16];
-cx q[27],q[16];
-u1(pi/4096) q[16];
-u1(pi/2048) q[27];
-cx q[27],q[17];
-u1(-pi/2048) q[17];
-cx q[27],q[17];
-u1(pi/2048) q[17];
-u1(pi/1024) q[27];
-cx q[27],q[18];
-u1(-pi/1024) q[18];
-cx q[27],q[18];
-u1(pi/1024) q[18];
-u1(pi/512) q[27];
-cx q[27],q[19];
-u1(-pi/512) q[19];
-cx q[27],q[19];
-u1(pi/512) q[19];
-u1(pi/256) q[27];
-cx q[27],q[20];
-u1(-pi/256) q[20];
-cx q[27],q[20];
-u1(pi/256) q[20];
-u1(pi/128) q[27];
-cx q[27],q[21];
-u1(-pi/128) q[21];
-cx q[27],q[21];
-u1(pi/128) q[21];
-u1(pi/64) q[27];
-cx q[27],q[22];
-u1(-pi/64) q[22];
-cx q[27],q[22];
-u1(pi/64) q[22];
-u1(pi/32) q[27];
-cx q[27],q[23];
-u1(-pi/32) q[23];
-cx q[27],q[23];
-u1(pi/32) q[23];
-u1(pi/16) q[27];
-cx q[27],q[24];
-u1(-pi/16) q[24];
-cx q[27],q[24];
-u1(pi/16) q[24];
-u1(pi/8) q[27];
-cx q[27],q[25];
-u1(-pi/8) q[25];
-cx q[27],q[25];
-u1(pi/8) q[25];
-u1(pi/4) q[27];
-cx q[27],q[26];
-u1(-pi/4) q[26];
-cx q[27],q[26];
-u1(pi/4) q[26];
-h q[27];
-u1(pi/536870912) q[28];
-cx q[28],q[0];
-u1(-pi/536870912) q[0];
-cx q[28],q[0];
-u1(pi/536870912) q[0];
-u1(pi/268435456) q[28];
-cx q[28],q[1];
-u1(-pi/268435456) q[1];
-cx q[28],q[1];
-u1(pi/268435456) q[1];
-u1(pi/134217728) q[28];
-cx q[28],q[2];
-u1(-pi/134217728) q[2];
-cx q[28],q[2];
-u1(pi/134217728) q[2];
-u1(pi/67108864) q[28];
-cx q[28],q[3];
-u1(-pi/67108864) q[3];
-cx q[28],q[3];
-u1(pi/67108864) q[3];
-u1(pi/33554432) q[28];
-cx q[28],q[4];
-u1(-pi/33554432) q[4];
-cx q[28],q[4];
-u1(pi/33554432) q[4];
-u1(pi/16777216) q[28];
-cx q[28],q[5];
-u1(-pi/16777216) q[5];
-cx q[28],q[5];
-u1(pi/16777216) q[5];
-u1(pi/8388608) q[28];
-cx q[28],q[6];
-u1(-pi/8388608) q[6];
-cx q[28],q[6];
-u1(pi/8388608) q[6];
-u1(pi/4194304) q[28];
-cx q[28],q[7];
-u1(-pi/4194304) q[7];
-cx q[28],q[7];
-u1(pi/4194304) q[7];
-u1(pi/2097152) q[28];
-cx q[28],q[8];
-u1(-pi/2097152) q[8];
-cx q[28],q[8];
-u1(pi/2097152) q[8];
-u1(pi/1048576) q[28];
-cx q[28],q[9];
-u1(-pi/1048576) q[9];
-cx q[28],q[9];
-u1(pi/1048576) q[9];
-u1(pi/524288) q[28];
-cx q[28],q[10];
-u1(-pi/524288) q[10];
-cx q[28],q[10];
-u1(pi/524288) q[10];
-u1(pi/262144) q[28];
-cx q[28],q[11];
-u1(-pi/262144) q[11];
-cx q[28],q[11];
-u1(pi/262144) q[11];
-u1(pi/131072) q[28];
-cx q[28],q[12];
-u1(-pi/131072) q[12];
-cx q[28],q[12];
-u1(pi/131072) q[12];
-u1(pi/65536) q[28];
-cx q[28],q[13];
-u1(-pi/65536) q[13];
-cx q[28],q[13];
-u1(pi/65536) q[13];
-u1(pi/32768) q[28];
-cx q[28],q[14];
-u1(-pi/32768) q[14];
-cx q[28],q[14];
-u1(pi/32768) q[14];
-u1(pi/16384) q[28];
-cx q[28],q[15];
-u1(-pi/16384) q[15];
-cx q[28],q[15];
-u1(pi/16384) q[15];
-u1(pi/8192) q[28];
-cx q[28],q[16];
-u1(-pi/8192) q[16];
-cx q[28],q[16];
-u1(pi/8192) q[16];
-u1(pi/4096) q[28];
-cx q[28],q[17];
-u1(-pi/4096) q[17];
-cx q[28],q[17];
-u1(pi/4096) q[17];
-u1(pi/2048) q[28];
-cx q[28],q[18];
-u1(-pi/2048) q[18];
-cx q[28],q[18];
-u1(pi/2048) q[18];
-u1(pi/1024) q[28];
-cx q[28],q[19];
-u1(-pi/1024) q[19];
-cx q[28],q[19];
-u1(pi/1024) q[19];
-u1(pi/512) q[28];
-cx q[28],q[20];
-u1(-pi/512) q[20];
-cx q[28],q[20];
-u1(pi/512) q[20];
-u1(pi/256) q[28];
-cx q[28],q[21];
-u1(-pi/256) q[21];
-cx q[28],q[21];
-u1(pi/256) q[21];
-u1(pi/128) q[28];
-cx q[28],q[22];
-u1(-pi/128) q[22];
-cx q[28],q[22];
-u1(pi/128) q[22];
-u1(pi/64) q[28];
-cx q[28],q[23];
-u1(-pi/64) q[23];
-cx q[28],q[23];
-u1(pi/64) q[23];
-u1(pi/32) q[28];
-cx q[28],q[24];
-u1(-pi/32) q[24];
-cx q[28],q[24];
-u1(pi/32) q[24];
-u1(pi/16) q[28];
-cx q[28],q[25];
-u1(-pi/16) q[25];
-cx q[28],q[25];
-u1(pi/16) q[25];
-u1(pi/8) q[28];
-cx q[28],q[26];
-u1(-pi/8) q[26];
-cx q[28],q[26];
-u1(pi/8) q[26];
-u1(pi/4) q[28];
-cx q[28],q[27];
-u1(-pi/4) q[27];
-cx q[28],q[27];
-u1(pi/4) q[27];
-h q[28];
-u1(pi/1073741824) q[29];
-cx q[29],q[0];
-u1(-pi/1073741824) q[0];
-cx q[29],q[0];
-u1(pi/1073741824) q[0];
-u1(pi/536870912) q[29];
-cx q[29],q[1];
-u1(-pi/536870912) q[1];
-cx q[29],q[1];
-u1(pi/536870912) q[1];
-u1(pi/268435456) q[29];
-cx q[29],q[2];
-u1(-pi/268435456) q[2];
-cx q[29],q[2];
-u1(pi/268435456) q[2];
-u1(pi/134217728) q[29];
-cx q[29],q[3];
-u1(-pi/134217728) q[3];
-cx q[29],q[3];
-u1(pi/134217728) q[3];
-u1(pi/67108864) q[29];
-cx q[29],q[4];
-u1(-pi/67108864) q[4];
-cx q[29],q[4];
-u1(pi/67108864) q[4];
-u1(pi/33554432) q[29];
-cx q[29],q[5];
-u1(-pi/33554432) q[5];
-cx q[29],q[5];
-u1(pi/33554432) q[5];
-u1(pi/16777216) q[29];
-cx q[29],q[6];
-u1(-pi/16777216) q[6];
-cx q[29],q[6];
-u1(pi/16777216) q[6];
-u1(pi/8388608) q[29];
-cx q[29],q[7];
-u1(-pi/8388608) q[7];
-cx q[29],q[7];
-u1(pi/8388608) q[7];
-u1(pi/4194304) q[29];
-cx q[29],q[8];
-u1(-pi/4194304) q[8];
-cx q[29],q[8];
-u1(pi/4194304) q[8];
-u1(pi/2097152) q[29];
-cx q[29],q[9];
-u1(-pi/2097152) q[9];
-cx q[29],q[9];
-u1(pi/2097152) q[9];
-u1(pi/1048576) q[29];
-cx q[29],q[10];
-u1(-pi/1048576) q[10];
-cx q[29],q[10];
-u1(pi/1048576) q[10];
-u1(pi/524288) q[29];
-cx q[29],q[11];
-u1(-pi/524288) q[11];
-cx q[29],q[11];
-u1(pi/524288) q[11];
-u1(pi/262144) q[29];
-cx q[29],q[12];
-u1(-pi/262144) q[12];
-cx q[29],q[12];
-u1(pi/262144) q[12];
-u1(pi/131072) q[29];
-cx q[29],q[13];
-u1(-pi/131072) q[13];
-cx q[29],q[13];
-u1(pi/131072) q[13];
-u1(pi/65536) q[29];
-cx q[29],q[14];
-u1(-pi/65536) q[14];
-cx q[29],q[14];
-u1(pi/65536) q[14];
-u1(pi/32768) q[29];
-cx q[29],q[15];
-u1(-pi/32768) q[15];
-cx q[29],q[15];
-u1(pi/32768) q[15];
-u1(pi/16384) q[29];
-cx q[29],q[16];
-u1(-pi/16384) q[16];
-cx q[29],q[16];
-u1(pi/16384) q[16];
-u1(pi/8192) q[29];
-cx q[29],q[17];
-u1(-pi/8192) q[17];
-cx q[29],q[17];
-u1(pi/8192) q[17];
-u1(pi/4096) q[29];
-cx q[29],q[18];
-u1(-pi/4096) q[18];
-cx q[29],q[18];
-u1(pi/4096) q[18];
-u1(pi/2048) q[29];
-cx q[29],q[19];
-u1(-pi/2048) q[19];
-cx q[29],q[19];
-u1(pi/2048) q[19];
-u1(pi/1024) q[29];
-cx q[29],q[20];
-u1(-pi/1024) q[20];
-cx q[29],q[20];
-u1(pi/1024) q[20];
-u1(pi/512) q[29];
-cx q[29],q[21];
-u1(-pi/512) q[21];
-cx q[29],q[21];
-u1(pi/512) q[21];
-u1(pi/256) q[29];
-cx q[29],q[22];
-u1(-pi/256) q[22];
-cx q[29],q[22];
-u1(pi/256) q[22];
-u1(pi/128) q[29];
-cx q[29],q[23];
-u1(-pi/128) q[23];
-cx q[29],q[23];
-u1(pi/128) q[23];
-u1(pi/64) q[29];
-cx q[29],q[24];
-u1(-pi/64) q[24];
-cx q[29],q[24];
-u1(pi/64) q[24];
-u1(pi/32) q[29];
-cx q[29],q[25];
-u1(-pi/32) q[25];
-cx q[29],q[25];
-u1(pi/32) q[25];
-u1(pi/16) q[29];
-cx q[29],q[26];
-u1(-pi/16) q[26];
-cx q[29],q[26];
-u1(pi/16) q[26];
-u1(pi/8) q[29];
-cx q[29],q[27];
-u1(-pi/8) q[27];
-cx q[29],q[27];
-u1(pi/8) q[27];
-u1(pi/4) q[29];
-cx q[29],q[28];
-u1(-pi/4) q[28];
-cx q[29],q[28];
-u1(pi/4) q[28];
-h q[29];
-u1(pi/2147483648) q[30];
-cx q[30],q[0];
-u1(-pi/2147483648) q[0];
-cx q[30],q[0];
-u1(pi/2147483648) q[0];
-u1(pi/1073741824) q[30];
-cx q[30],q[1];
-u1(-pi/1073741824) q[1];
-cx q[30],q[1];
-u1(pi/1073741824) q[1];
-u1(pi/536870912) q[30];
-cx q[30],q[2];
-u1(-pi/536870912) q[2];
-cx q[30],q[2];
-u1(pi/536870912) q[2];
-u1(pi/268435456) q[30];
-cx q[30],q[3];
-u1(-pi/268435456) q[3];
-cx q[30],q[3];
-u1(pi/268435456) q[3];
-u1(pi/134217728) q[30];
-cx q[30],q[4];
-u1(-pi/134217728) q[4];
-cx q[30],q[4];
-u1(pi/134217728) q[4];
-u1(pi/67108864) q[30];
-cx q[30],q[5];
-u1(-pi/67108864) q[5];
-cx q[30],q[5];
-u1(pi/67108864) q[5];
-u1(pi/33554432) q[30];
-cx q[30],q[6];
-u1(-pi/33554432) q[6];
-cx q[30],q[6];
-u1(pi/33554432) q[6];
-u1(pi/16777216) q[30];
-cx q[30],q[7];
-u1(-pi/16777216) q[7];
-cx q[30],q[7];
-u1(pi/16777216) q[7];
-u1(pi/8388608) q[30];
-cx q[30],q[8];
-u1(-pi/8388608) q[8];
-cx q[30],q[8];
-u1(pi/8388608) q[8];
-u1(pi/4194304) q[30];
-cx q[30],q[9];
-u1(-pi/4194304) q[9];
-cx q[30],q[9];
-u1(pi/4194304) q[9];
-u1(pi/2097152) q[30];
-cx q[30],q[10];
-u1(-pi/2097152) q[10];
-cx q[30],q[10];
-u1(pi/2097152) q[10];
-u1(pi/1048576) q[30];
-cx q[30],q[11];
-u1(-pi/1048576) q[11];
-cx q[30],q[11];
-u1(pi/1048576) q[11];
-u1(pi/524288) q[30];
-cx q[30],q[12];
-u1(-pi/524288) q[12];
-cx q[30],q[12];
-u1(pi/524288) q[12];
-u1(pi/262144) q[30];
-cx q[30],q[13];
-u1(-pi/262144) q[13];
-cx q[30],q[13];
-u1(pi/262144) q[13];
-u1(pi/131072) q[30];
-cx q[30],q[14];
-u1(-pi/131072) q[14];
-cx q[30],q[14];
-u1(pi/131072) q[14];
-u1(pi/65536) q[30];
-cx q[30],q[15];
-u1(-pi/65536) q[15];
-cx q[30],q[15];
-u1(pi/65536) q[15];
-u1(pi/32768) q[30];
-cx q[30],q[16];
-u1(-pi/32768) q[16];
-cx q[30],q[16];
-u1(pi/32768) q[16];
-u1(pi/16384) q[30];
-cx q[30],q[17];
-u1(-pi/16384) q[17];
-cx q[30],q[17];
-u1(pi/16384) q[17];
-u1(pi/8192) q[30];
-cx q[30],q[18];
-u1(-pi/8192) q[18];
-cx q[30],q[18];
-u1(pi/8192) q[18];
-u1(pi/4096) q[30];
-cx q[30],q[19];
-u1(-pi/4096) q[19];
-cx q[30],q[19];
-u1(pi/4096) q[19];
-u1(pi/2048) q[30];
-cx q[30],q[20];
-u1(-pi/2048) q[20];
-cx q[30],q[20];
-u1(pi/2048) q[20];
-u1(pi/1024) q[30];
-cx q[30],q[21];
-u1(-pi/1024) q[21];
-cx q[30],q[21];
-u1(pi/1024) q[21];
-u1(pi/512) q[30];
-cx q[30],q[22];
-u1(-pi/512) q[22];
-cx q[30],q[22];
-u1(pi/512) q[22];
-u1(pi/256) q[30];
-cx q[30],q[23];
-u1(-pi/256) q[23];
-cx q[30],q[23];
-u1(pi/256) q[23];
-u1(pi/128) q[30];
-cx q[30],q[24];
-u1(-pi/128) q[24];
-cx q[30],q[24];
-u1(pi/128) q[24];
-u1(pi/64) q[30];
-cx q[30],q[25];
-u1(-pi/64) q[25];
-cx q[30],q[25];
-u1(pi/64) q[25];
-u1(pi/32) q[30];
-cx q[30],q[26];
-u1(-pi/32) q[26];
-cx q[30],q[26];
-u1(pi/32) q[26];
-u1(pi/16) q[30];
-cx q[30],q[27];
-u1(-pi/16) q[27];
-cx q[30],q[27];
-u1(pi/16) q[27];
-u1(pi/8) q[30];
-cx q[30],q[28];
-u1(-pi/8) q[28];
-cx q[30],q[28];
-u1(pi/8) q[28];
-u1(pi/4) q[30];
-cx q[30],q[29];
-u1(-pi/4) q[29];
-cx q[30],q[29];
-u1(pi/4) q[29];
-h q[30];
-u1(pi/4294967296) q[31];
-cx q[31],q[0];
-u1(-pi/4294967296) q[0];
-cx q[31],q[0];
-u1(pi/4294967296) q[0];
-u1(pi/2147483648) q[31];
-cx q[31],q[1];
-u1(-pi/2147483648) q[1];
-cx q[31],q[1];
-u1(pi/2147483648) q[1];
-u1(pi/1073741824) q[31];
-cx q[31],q[2];
-u1(-pi/1073741824) q[2];
-cx q[31],q[2];
-u1(pi/1073741824) q[2];
-u1(pi/536870912) q[31];
-cx q[31],q[3];
-u1(-pi/536870912) q[3];
-cx q[31],q[3];
-u1(pi/536870912) q[3];
-u1(pi/268435456) q[31];
-cx q[31],q[4];
-u1(-pi/268435456) q[4];
-cx q[31],q[4];
-u1(pi/268435456) q[4];
-u1(pi/134217728) q[31];
-cx q[31],q[5];
-u1(-pi/134217728) q[5];
-cx q[31],q[5];
-u1(pi/134217728) q[5];
-u1(pi/67108864) q[31];
-cx q[31],q[6];
-u1(-pi/67108864) q[6];
-cx q[31],q[6];
-u1(pi/67108864) q[6];
-u1(pi/33554432) q[31];
-cx q[31],q[7];
-u1(-pi/33554432) q[7];
-cx q[31],q[7];
-u1(pi/33554432) q[7];
-u1(pi/16777216) q[31];
-cx q[31],q[8];
-u1(-pi/16777216) q[8];
-cx q[31],q[8];
-u1(pi/16777216) q[8];
-u1(pi/8388608) q[31];
-cx q[31],q[9];
-u1(-pi/8388608) q[9];
-cx q[31],q[9];
-u1(pi/8388608) q[9];
-u1(pi/4194304) q[31];
-cx q[31],q[10];
-u1(-pi/4194304) q[10];
-cx q[31],q[10];
-u1(pi/4194304) q[10];
-u1(pi/2097152) q[31];
-cx q[31],q[11];
-u1(-pi/2097152) q[11];
-cx q[31],q[11];
-u1(pi/2097152) q[11];
-u1(pi/1048576) q[31];
-cx q[31],q[12];
-u1(-pi/1048576) q[12];
-cx q[31],q[12];
-u1(pi/1048576) q[12];
-u1(pi/524288) q[31];
-cx q[31],q[13];
-u1(-pi/524288) q[13];
-cx q[31],q[13];
-u1(pi/524288) q[13];
-u1(pi/262144) q[31];
-cx q[31],q[14];
-u1(-pi/262144) q[14];
-cx q[31],q[14];
-u1(pi/262144) q[14];
-u1(pi/131072) q[31];
-cx q[31],q[15];
-u1(-pi/131072) q[15];
-cx q[31],q[15];
-u1(pi/131072) q[15];
-u1(pi/65536) q[31];
-cx q[31],q[16];
-u1(-pi/65536) q[16];
-cx q[31],q[16];
-u1(pi/65536) q[16];
-u1(pi/32768) q[31];
-cx q[31],q[17];
-u1(-pi/32768) q[17];
-cx q[31],q[17];
-u1(pi/32768) q[17];
-u1(pi/16384) q[31];
-cx q[31],q[18];
-u1(-pi/16384) q[18];
-cx q[31],q[18];
-u1(pi/16384) q[18];
-u1(pi/8192) q[31];
-cx q[31],q[19];
-u1(-pi/8192) q[19];
-cx q[31],q[19];
-u1(pi/8192) q[19];
-u1(pi/4096) q[31];
-cx q[31],q[20];
-u1(-pi/4096) q[20];
-cx q[31],q[20];
-u1(pi/4096) q[20];
-u1(pi/2048) q[31];
-cx q[31],q[21];
-u1(-pi/2048) q[21];
-cx q[31],q[21];
-u1(pi/2048) q[21];
-u1(pi/1024) q[31];
-cx q[31],q[22];
-u1(-pi/1024) q[22];
-cx q[31],q[22];
-u1(pi/1024) q[22];
-u1(pi/512) q[31];
-cx q[31],q[23];
-u1(-pi/512) q[23];
-cx q[31],q[23];
-u1(pi/512) q[23];
-u1(pi/256) q[31];
-cx q[31],q[24];
-u1(-pi/256) q[24];
-cx q[31],q[24];
-u1(pi/256) q[24];
-u1(pi/128) q[31];
-cx q[31],q[25];
-u1(-pi/128) q[25];
-cx q[31],q[25];
-u1(pi/128) q[25];
-u1(pi/64) q[31];
-cx q[31],q[26];
-u1(-pi/64) q[26];
-cx q[31],q[26];
-u1(pi/64) q[26];
-u1(pi/32) q[31];
-cx q[31],q[27];
-u1(-pi/32) q[27];
-cx q[31],q[27];
-u1(pi/32) q[27];
-u1(pi/16) q[31];
-cx q[31],q[28];
-u1(-pi/16) q[28];
-cx q[31],q[28];
-u1(pi/16) q[28];
-u1(pi/8) q[31];
-cx q[31],q[29];
-u1(-pi/8) q[29];
-cx q[31],q[29];
-u1(pi/8) q[29];
-u1(pi/4) q[31];
-cx q[31],q[30];
-u1(-pi/4) q[30];
-cx q[31],q[30];
-u1(pi/4) q[30];
-h q[31];
-u1(pi/8589934592) q[32];
-cx q[32],q[0];
-u1(-pi/8589934592) q[0];
-cx q[32],q[0];
-u1(pi/8589934592) q[0];
-u1(pi/4294967296) q[32];
-cx q[32],q[1];
-u1(-pi/4294967296) q[1];
-cx q[32],q[1];
-u1(pi/4294967296) q[1];
-u1(pi/2147483648) q[32];
-cx q[32],q[2];
-u1(-pi/2147483648) q[2];
-cx q[32],q[2];
-u1(pi/2147483648) q[2];
-u1(pi/1073741824) q[32];
-cx q[32],q[3];
-u1(-pi/1073741824) q[3];
-cx q[32],q[3];
-u1(pi/1073741824) q[3];
-u1(pi/536870912) q[32];
-cx q[32],q[4];
-u1(-pi/536870912) q[4];
-cx q[32],q[4];
-u1(pi/536870912) q[4];
-u1(pi/268435456) q[32];
-cx q[32],q[5];
-u1(-pi/268435456) q[5];
-cx q[32],q[5];
-u1(pi/268435456) q[5];
-u1(pi/134217728) q[32];
-cx q[32],q[6];
-u1(-pi/134217728) q[6];
-cx q[32],q[6];
-u1(pi/134217728) q[6];
-u1(pi/67108864) q[32];
-cx q[32],q[7];
-u1(-pi/67108864) q[7];
-cx q[32],q[7];
-u1(pi/67108864) q[7];
-u1(pi/33554432) q[32];
-cx q[32],q[8];
-u1(-pi/33554432) q[8];
-cx q[32],q[8];
-u1(pi/33554432) q[8];
-u1(pi/16777216) q[32];
-cx q[32],q[9];
-u1(-pi/16777216) q[9];
-cx q[32],q[9];
-u1(pi/16777216) q[9];
-u1(pi/8388608) q[32];
-cx q[32],q[10];
-u1(-pi/8388608) q[10];
-cx q[32],q[10];
-u1(pi/8388608) q[10];
-u1(pi/4194304) q[32];
-cx q[32],q[11];
-u1(-pi/4194304) q[11];
-cx q[32],q[11];
-u1(pi/4194304) q[11];
-u1(pi/2097152) q[32];
-cx q[32],q[12];
-u1(-pi/2097152) q[12];
-cx q[32],q[12];
-u1(pi/2097152) q[12];
-u1(pi/1048576) q[32];
-cx q[32],q[13];
-u1(-pi/1048576) q[13];
-cx q[32],q[13];
-u1(pi/1048576) q[13];
-u1(pi/524288) q[32];
-cx q[32],q[14];
-u1(-pi/524288) q[14];
-cx q[32],q[14];
-u1(pi/524288) q[14];
-u1(pi/262144) q[32];
-cx q[32],q[15];
-u1(-pi/262144) q[15];
-cx q[32],q[15];
-u1(pi/262144) q[15];
-u1(pi/131072) q[32];
-cx q[32],q[16];
-u1(-pi/131072) q[16];
-cx q[32],q[16];
-u1(pi/131072) q[16];
-u1(pi/65536) q[32];
-cx q[32],q[17];
-u1(-pi/65536) q[17];
-cx q[32],q[17];
-u1(pi/65536) q[17];
-u1(pi/32768) q[32];
-cx q[32],q[18];
-u1(-pi/32768) q[18];
-cx q[32],q[18];
-u1(pi/32768) q[18];
-u1(pi/16384) q[32];
-cx q[32],q[19];
-u1(-pi/16384) q[19];
-cx q[32],q[19];
-u1(pi/16384) q[19];
-u1(pi/8192) q[32];
-cx q[32],q[20];
-u1(-pi/8192) q[20];
-cx q[32],q[20];
-u1(pi/8192) q[20];
-u1(pi/4096) q[32];
-cx q[32],q[21];
-u1(-pi/4096) q[21];
-cx q[32],q[21];
-u1(pi/4096) q[21];
-u1(pi/2048) q[32];
-cx q[32],q[22];
-u1(-pi/2048) q[22];
-cx q[32],q[22];
-u1(pi/2048) q[22];
-u1(pi/1024) q[32];
-cx q[32],q[23];
-u1(-pi/1024) q[23];
-cx q[32],q[23];
-u1(pi/1024) q[23];
-u1(pi/512) q[32];
-cx q[32],q[24];
-u1(-pi/512) q[24];
-cx q[32],q[24];
-u1(pi/512) q[24];
-u1(pi/256) q[32];
-cx q[32],q[25];
-u1(-pi/256) q[25];
-cx q[32],q[25];
-u1(pi/256) q[25];
-u1(pi/128) q[32];
-cx q[32],q[26];
-u1(-pi/128) q[26];
-cx q[32],q[26];
-u1(pi/128) q[26];
-u1(pi/64) q[32];
-cx q[32],q[27];
-u1(-pi/64) q[27];
-cx q[32],q[27];
-u1(pi/64) q[27];
-u1(pi/32) q[32];
-cx q[32],q[28];
-u1(-pi/32) q[28];
-cx q[32],q[28];
-u1(pi/32) q[28];
-u1(pi/16) q[32];
-cx q[32],q[29];
-u1(-pi/16) q[29];
-cx q[32],q[29];
-u1(pi/16) q[29];
-u1(pi/8) q[32];
-cx q[32],q[30];
-u1(-pi/8) q[30];
-cx q[32],q[30];
-u1(pi/8) q[30];
-u1(pi/4) q[32];
-cx q[32],q[31];
-u1(-pi/4) q[31];
-cx q[32],q[31];
-u1(pi/4) q[31];
-h q[32];
-u1(pi/17179869184) q[33];
-cx q[33],q[0];
-u1(-pi/17179869184) q[0];
-cx q[33],q[0];
-u1(pi/17179869184) q[0];
-u1(pi/8589934592) q[33];
-cx q[33],q[1];
-u1(-pi/8589934592) q[1];
-cx q[33],q[1];
-u1(pi/8589934592) q[1];
-u1(pi/4294967296) q[33];
-cx q[33],q[2];
-u1(-pi/4294967296) q[2];
-cx q[33],q[2];
-u1(pi/4294967296) q[2];
-u1(pi/2147483648) q[33];
-cx q[33],q[3];
-u1(-pi/2147483648) q[3];
-cx q[33],q[3];
-u1(pi/2147483648) q[3];
-u1(pi/1073741824) q[33];
-cx q[33],q[4];
-u1(-pi/1073741824) q[4];
-cx q[33],q[4];
-u1(pi/1073741824) q[4];
-u1(pi/536870912) q[33];
-cx q[33],q[5];
-u1(-pi/536870912) q[5];
-cx q[33],q[5];
-u1(pi/536870912) q[5];
-u1(pi/268435456) q[33];
-cx q[33],q[6];
-u1(-pi/268435456) q[6];
-cx q[33],q[6];
-u1(pi/268435456) q[6];
-u1(pi/134217728) q[33];
-cx q[33],q[7];
-u1(-pi/134217728) q[7];
-cx q[33],q[7];
-u1(pi/134217728) q[7];
-u1(pi/67108864) q[33];
-cx q[33],q[8];
-u1(-pi/67108864) q[8];
-cx q[33],q[8];
-u1(pi/67108864) q[8];
-u1(pi/33554432) q[33];
-cx q[33],q[9];
-u1(-pi/33554432) q[9];
-cx q[33],q[9];
-u1(pi/33554432) q[9];
-u1(pi/16777216) q[33];
-cx q[33],q[10];
-u1(-pi/16777216) q[10];
-cx q[33],q[10];
-u1(pi/16777216) q[10];
-u1(pi/8388608) q[33];
-cx q[33],q[11];
-u1(-pi/8388608) q[11];
-cx q[33],q[11];
-u1(pi/8388608) q[11];
-u1(pi/4194304) q[33];
-cx q[33],q[12];
-u1(-pi/4194304) q[12];
-cx q[33],q[12];
-u1(pi/4194304) q[12];
-u1(pi/2097152) q[33];
-cx q[33],q[13];
-u1(-pi/2097152) q[13];
-cx q[33],q[13];
-u1(pi/2097152) q[13];
-u1(pi/1048576) q[33];
-cx q[33],q[14];
-u1(-pi/1048576) q[14];
-cx q[33],q[14];
-u1(pi/1048576) q[14];
-u1(pi/524288) q[33];
-cx q[33],q[15];
-u1(-pi/524288) q[15];
-cx q[33],q[15];
-u1(pi/524288) q[15];
-u1(pi/262144) q[33];
-cx q[33],q[16];
-u1(-pi/262144) q[16];
-cx q[33],q[16];
-u1(pi/262144) q[16];
-u1(pi/131072) q[33];
-cx q[33],q[17];
-u1(-pi/131072) q[17];
-cx q[33],q[17];
-u1(pi/131072) q[17];
-u1(pi/65536) q[33];
-cx q[33],q[18];
-u1(-pi/65536) q[18];
-cx q[33],q[18];
-u1(pi/65536) q[18];
-u1(pi/32768) q[33];
-cx q[33],q[19];
-u1(-pi/32768) q[19];
-cx q[33],q[19];
-u1(pi/32768) q[19];
-u1(pi/16384) q[33];
-cx q[33],q[20];
-u1(-pi/16384) q[20];
-cx q[33],q[20];
-u1(pi/16384) q[20];
-u1(pi/8192) q[33];
-cx q[33],q[21];
-u1(-pi/8192) q[21];
-cx q[33],q[21];
-u1(pi/8192) q[21];
-u1(pi/4096) q[33];
-cx q[33],q[22];
-u1(-pi/4096) q[22];
-cx q[33],q[22];
-u1(pi/4096) q[22];
-u1(pi/2048) q[33];
-cx q[33],q[23];
-u1(-pi/2048) q[23];
-cx q[33],q[23];
-u1(pi/2048) q[23];
-u1(pi/1024) q[33];
-cx q[33],q[24];
-u1(-pi/1024) q[24];
-cx q[33],q[24];
-u1(pi/1024) q[24];
-u1(pi/512) q[33];
-cx q[33],q[25];
-u1(-pi/512) q[25];
-cx q[33],q[25];
-u1(pi/512) q[25];
-u1(pi/256) q[33];
-cx q[33],q[26];
-u1(-pi/256) q[26];
-cx q[33],q[26];
-u1(pi/256) q[26];
-u1(pi/128) q[33];
-cx q[33],q[27];
-u1(-pi/128) q[27];
-cx q[33],q[27];
-u1(pi/128) q[27];
-u1(pi/64) q[33];
-cx q[33],q[28];
-u1(-pi/64) q[28];
-cx q[33],q[28];
-u1(pi/64) q[28];
-u1(pi/32) q[33];
-cx q[33],q[29];
-u1(-pi/32) q[29];
-cx q[33],q[29];
-u1(pi/32) q[29];
-u1(pi/16) q[33];
-cx q[33],q[30];
-u1(-pi/16) q[30];
-cx q[33],q[30];
-u1(pi/16) q[30];
-u1(pi/8) q[33];
-cx q[33],q[31];
-u1(-pi/8) q[31];
-cx q[33],q[31];
-u1(pi/8) q[31];
-u1(pi/4) q[33];
-cx q[33],q[32];
-u1(-pi/4) q[32];
-cx q[33],q[32];
-u1(pi/4) q[32];
-h q[33];
-u1(pi/34359738368) q[34];
-cx q[34],q[0];
-u1(-pi/34359738368) q[0];
-cx q[34],q[0];
-u1(pi/34359738368) q[0];
-u1(pi/17179869184) q[34];
-cx q[34],q[1];
-u1(-pi/17179869184) q[1];
-cx q[34],q[1];
-u1(pi/17179869184) q[1];
-u1(pi/8589934592) q[34];
-cx q[34],q[2];
-u1(-pi/8589934592) q[2];
-cx q[34],q[2];
-u1(pi/8589934592) q[2];
-u1(pi/4294967296) q[34];
-cx q[34],q[3];
-u1(-pi/4294967296) q[3];
-cx q[34],q[3];
-u1(pi/4294967296) q[3];
-u1(pi/2147483648) q[34];
-cx q[34],q[4];
-u1(-pi/2147483648) q[4];
-cx q[34],q[4];
-u1(pi/2147483648) q[4];
-u1(pi/1073741824) q[34];
-cx q[34],q[5];
-u1(-pi/1073741824) q[5];
-cx q[34],q[5];
-u1(pi/1073741824) q[5];
-u1(pi/536870912) q[34];
-cx q[34],q[6];
-u1(-pi/536870912) q[6];
-cx q[34],q[6];
-u1(pi/536870912) q[6];
-u1(pi/268435456) q[34];
-cx q[34],q[7];
-u1(-pi/268435456) q[7];
-cx q[34],q[7];
-u1(pi/268435456) q[7];
-u1(pi/134217728) q[34];
-cx q[34],q[8];
-u1(-pi/134217728) q[8];
-cx q[34],q[8];
-u1(pi/134217728) q[8];
-u1(pi/67108864) q[34];
-cx q[34],q[9];
-u1(-pi/67108864) q[9];
-cx q[34],q[9];
-u1(pi/67108864) q[9];
-u1(pi/33554432) q[34];
-cx q[34],q[10];
-u1(-pi/33554432) q[10];
-cx q[34],q[10];
-u1(pi/33554432) q[10];
-u1(pi/16777216) q[34];
-cx q[34],q[11];
-u1(-pi/16777216) q[11];
-cx q[34],q[11];
-u1(pi/16777216) q[11];
-u1(pi/8388608) q[34];
-cx q[34],q[12];
-u1(-pi/8388608) q[12];
-cx q[34],q[12];
-u1(pi/8388608) q[12];
-u1(pi/4194304) q[34];
-cx q[34],q[13];
-u1(-pi/4194304) q[13];
-cx q[34],q[13];
-u1(pi/4194304) q[13];
-u1(pi/2097152) q[34];
-cx q[34],q[14];
-u1(-pi/2097152) q[14];
-cx q[34],q[14];
-u1(pi/2097152) q[14];
-u1(pi/1048576) q[34];
-cx q[34],q[15];
-u1(-pi/1048576) q[15];
-cx q[34],q[15];
-u1(pi/1048576) q[15];
-u1(pi/524288) q[34];
-cx q[34],q[16];
-u1(-pi/524288) q[16];
-cx q[34],q[16];
-u1(pi/524288) q[16];
-u1(pi/262144) q[34];
-cx q[34],q[17];
-u1(-pi/262144) q[17];
-cx q[34],q[17];
-u1(pi/262144) q[17];
-u1(pi/131072) q[34];
-cx q[34],q[18];
-u1(-pi/131072) q[18];
-cx q[34],q[18];
-u1(pi/131072) q[18];
-u1(pi/65536) q[34];
-cx q[34],q[19];
-u1(-pi/65536) q[19];
-cx q[34],q[19];
-u1(pi/65536) q[19];
-u1(pi/32768) q[34];
-cx q[34],q[20];
-u1(-pi/32768) q[20];
-cx q[34],q[20];
-u1(pi/32768) q[20];
-u1(pi/16384) q[34];
-cx q[34],q[21];
-u1(-pi/16384) q[21];
-cx q[34],q[21];
-u1(pi/16384) q[21];
-u1(pi/8192) q[34];
-cx q[34],q[22];
-u1(-pi/8192) q[22];
-cx q[34],q[22];
-u1(pi/8192) q[22];
-u1(pi/4096) q[34];
-cx q[34],q[23];
-u1(-pi/4096) q[23];
-cx q[34],q[23];
-u1(pi/4096) q[23];
-u1(pi/2048) q[34];
-cx q[34],q[24];
-u1(-pi/2048) q[24];
-cx q[34],q[24];
-u1(pi/2048) q[24];
-u1(pi/1024) q[34];
-cx q[34],q[25];
-u1(-pi/1024) q[25];
-cx q[34],q[25];
-u1(pi/1024) q[25];
-u1(pi/512) q[34];
-cx q[34],q[26];
-u1(-pi/512) q[26];
-cx q[34],q[26];
-u1(pi/512) q[26];
-u1(pi/256) q[34];
-cx q[34],q[27];
-u1(-pi/256) q[27];
-cx q[34],q[27];
-u1(pi/256) q[27];
-u1(pi/128) q[34];
-cx q[34],q[28];
-u1(-pi/128) q[28];
-cx q[34],q[28];
-u1(pi/128) q[28];
-u1(pi/64) q[34];
-cx q[34],q[29];
-u1(-pi/64) q[29];
-cx q[34],q[29];
-u1(pi/64) q[29];
-u1(pi/32) q[34];
-cx q[34],q[30];
-u1(-pi/32) q[30];
-cx q[34],q[30];
-u1(pi/32) q[30];
-u1(pi/16) q[34];
-cx q[34],q[31];
-u1(-pi/16) q[31];
-cx q[34],q[31];
-u1(pi/16) q[31];
-u1(pi/8) q[34];
-cx q[34],q[32];
-u1(-pi/8) q[32];
-cx q[34],q[32];
-u1(pi/8) q[32];
-u1(pi/4) q[34];
-cx q[34],q[33];
-u1(-pi/4) q[33];
-cx q[34],q[33];
-u1(pi/4) q[33];
-h q[34];
-u1(pi/68719476736) q[35];
-cx q[35],q[0];
-u1(-pi/68719476736) q[0];
-cx q[35],q[0];
-u1(pi/68719476736) q[0];
-u1(pi/34359738368) q[35];
-cx q[35],q[1];
-u1(-pi/34359738368) q[1];
-cx q[35],q[1];
-u1(pi/34359738368) q[1];
-u1(pi/17179869184) q[35];
-cx q[35],q[2];
-u1(-pi/17179869184) q[2];
-cx q[35],q[2];
-u1(pi/17179869184) q[2];
-u1(pi/8589934592) q[35];
-cx q[35],q[3];
-u1(-pi/8589934592) q[3];
-cx q[35],q[3];
-u1(pi/8589934592) q[3];
-u1(pi/4294967296) q[35];
-cx q[35],q[4];
-u1(-pi/4294967296) q[4];
-cx q[35],q[4];
-u1(pi/4294967296) q[4];
-u1(pi/2147483648) q[35];
-cx q[35],q[5];
-u1(-pi/2147483648) q[5];
-cx q[35],q[5];
-u1(pi/2147483648) q[5];
-u1(pi/1073741824) q[35];
-cx q[35],q[6];
-u1(-pi/1073741824) q[6];
-cx q[35],q[6];
-u1(pi/1073741824) q[6];
-u1(pi/536870912) q[35];
-cx q[35],q[7];
-u1(-pi/536870912) q[7];
-cx q[35],q[7];
-u1(pi/536870912) q[7];
-u1(pi/268435456) q[35];
-cx q[35],q[8];
-u1(-pi/268435456) q[8];
-cx q[35],q[8];
-u1(pi/268435456) q[8];
-u1(pi/134217728) q[35];
-cx q[35],q[9];
-u1(-pi/134217728) q[9];
-cx q[35],q[9];
-u1(pi/134217728) q[9];
-u1(pi/67108864) q[35];
-cx q[35],q[10];
-u1(-pi/67108864) q[10];
-cx q[35],q[10];
-u1(pi/67108864) q[10];
-u1(pi/33554432) q[35];
-cx q[35],q[11];
-u1(-pi/33554432) q[11];
-cx q[35],q[11];
-u1(pi/33554432) q[11];
-u1(pi/16777216) q[35];
-cx q[35],q[12];
-u1(-pi/16777216) q[12];
-cx q[35],q[12];
-u1(pi/16777216) q[12];
-u1(pi/8388608) q[35];
-cx q[35],q[13];
-u1(-pi/8388608) q[13];
-cx q[35],q[13];
-u1(pi/8388608) q[13];
-u1(pi/4194304) q[35];
-cx q[35],q[14];
-u1(-pi/4194304) q[14];
-cx q[35],q[14];
-u1(pi/4194304) q[14];
-u1(pi/2097152) q[35];
-cx q[35],q[15];
-u1(-pi/2097152) q[15];
-cx q[35],q[15];
-u1(pi/2097152) q[15];
-u1(pi/1048576) q[35];
-cx q[35],q[16];
-u1(-pi/1048576) q[16];
-cx q[35],q[16];
-u1(pi/1048576) q[16];
-u1(pi/524288) q[35];
-cx q[35],q[17];
-u1(-pi/524288) q[17];
-cx q[35],q[17];
-u1(pi/524288) q[17];
-u1(pi/262144) q[35];
-cx q[35],q[18];
-u1(-pi/262144) q[18];
-cx q[35],q[18];
-u1(pi/262144) q[18];
-u1(pi/131072) q[35];
-cx q[35],q[19];
-u1(-pi/131072) q[19];
-cx q[35],q[19];
-u1(pi/131072) q[19];
-u1(pi/65536) q[35];
-cx q[35],q[20];
-u1(-pi/65536) q[20];
-cx q[35],q[20];
-u1(pi/65536) q[20];
-u1(pi/32768) q[35];
-cx q[35],q[21];
-u1(-pi/32768) q[21];
-cx q[35],q[21];
-u1(pi/32768) q[21];
-u1(pi/16384) q[35];
-cx q[35],q[22];
-u1(-pi/16384) q[22];
-cx q[35],q[22];
-u1(pi/16384) q[22];
-u1(pi/8192) q[35];
-cx q[35],q[23];
-u1(-pi/8192) q[23];
-cx q[35],q[23];
-u1(pi/8192) q[23];
-u1(pi/4096) q[35];
-cx q[35],q[24];
-u1(-pi/4096) q[24];
-cx q[35],q[24];
-u1(pi/4096) q[24];
-u1(pi/2048) q[35];
-cx q[35],q[25];
-u1(-pi/2048) q[25];
-cx q[35],q[25];
-u1(pi/2048) q[25];
-u1(pi/1024) q[35];
-cx q[35],q[26];
-u1(-pi/1024) q[26];
-cx q[35],q[26];
-u1(pi/1024) q[26];
-u1(pi/512) q[35];
-cx q[35],q[27];
-u1(-pi/512) q[27];
-cx q[35],q[27];
-u1(pi/512) q[27];
-u1(pi/256) q[35];
-cx q[35],q[28];
-u1(-pi/256) q[28];
-cx q[35],q[28];
-u1(pi/256) q[28];
-u1(pi/128) q[35];
-cx q[35],q[29];
-u1(-pi/128) q[29];
-cx q[35],q[29];
-u1(pi/128) q[29];
-u1(pi/64) q[35];
-cx q[35],q[30];
-u1(-pi/64) q[30];
-cx q[35],q[30];
-u1(pi/64) q[30];
-u1(pi/32) q[35];
-cx q[35],q[31];
-u1(-pi/32) q[31];
-cx q[35],q[31];
-u1(pi/32) q[31];
-u1(pi/16) q[35];
-cx q[35],q[32];
-u1(-pi/16) q[32];
-cx q[35],q[32];
-u1(pi/16) q[32];
-u1(pi/8) q[35];
-cx q[35],q[33];
-u1(-pi/8) q[33];
-cx q[35],q[33];
-u1(pi/8) q[33];
-u1(pi/4) q[35];
-cx q[35],q[34];
-u1(-pi/4) q[34];
-cx q[35],q[34];
-u1(pi/4) q[34];
-h q[35];
-u1(pi/137438953472) q[36];
-cx q[36],q[0];
-u1(-pi/137438953472) q[0];
-cx q[36],q[0];
-u1(pi/137438953472) q[0];
-u1(pi/68719476736) q[36];
-cx q[36],q[1];
-u1(-pi/68719476736) q[1];
-cx q[36],q[1];
-u1(pi/68719476736) q[1];
-u1(pi/34359738368) q[36];
-cx q[36],q[2];
-u1(-pi/34359738368) q[2];
-cx q[36],q[2];
-u1(pi/34359738368) q[2];
-u1(pi/17179869184) q[36];
-cx q[36],q[3];
-u1(-pi/17179869184) q[3];
-cx q[36],q[3];
-u1(pi/17179869184) q[3];
-u1(pi/8589934592) q[36];
-cx q[36],q[4];
-u1(-pi/8589934592) q[4];
-cx q[36],q[4];
-u1(pi/8589934592) q[4];
-u1(pi/4294967296) q[36];
-cx q[36],q[5];
-u1(-pi/4294967296) q[5];
-cx q[36],q[5];
-u1(pi/4294967296) q[5];
-u1(pi/2147483648) q[36];
-cx q[36],q[6];
-u1(-pi/2147483648) q[6];
-cx q[36],q[6];
-u1(pi/2147483648) q[6];
-u1(pi/1073741824) q[36];
-cx q[36],q[7];
-u1(-pi/1073741824) q[7];
-cx q[36],q[7];
-u1(pi/1073741824) q[7];
-u1(pi/536870912) q[36];
-cx q[36],q[8];
-u1(-pi/536870912) q[8];
-cx q[36],q[8];
-u1(pi/536870912) q[8];
-u1(pi/268435456) q[36];
-cx q[36],q[9];
-u1(-pi/268435456) q[9];
-cx q[36],q[9];
-u1(pi/268435456) q[9];
-u1(pi/134217728) q[36];
-cx q[36],q[10];
-u1(-pi/134217728) q[10];
-cx q[36],q[10];
-u1(pi/134217728) q[10];
-u1(pi/67108864) q[36];
-cx q[36],q[11];
-u1(-pi/67108864) q[11];
-cx q[36],q[11];
-u1(pi/67108864) q[11];
-u1(pi/33554432) q[36];
-cx q[36],q[12];
-u1(-pi/33554432) q[12];
-cx q[36],q[12];
-u1(pi/33554432) q[12];
-u1(pi/16777216) q[36];
-cx q[36],q[13];
-u1(-pi/16777216) q[13];
-cx q[36],q[13];
-u1(pi/16777216) q[13];
-u1(pi/8388608) q[36];
-cx q[36],q[14];
-u1(-pi/8388608) q[14];
-cx q[36],q[14];
-u1(pi/8388608) q[14];
-u1(pi/4194304) q[36];
-cx q[36],q[15];
-u1(-pi/4194304) q[15];
-cx q[36],q[15];
-u1(pi/4194304) q[15];
-u1(pi/2097152) q[36];
-cx q[36],q[16];
-u1(-pi/2097152) q[16];
-cx q[36],q[16];
-u1(pi/2097152) q[16];
-u1(pi/1048576) q[36];
-cx q[36],q[17];
-u1(-pi/1048576) q[17];
-cx q[36],q[17];
-u1(pi/1048576) q[17];
-u1(pi/524288) q[36];
-cx q[36],q[18];
-u1(-pi/524288) q[18];
-cx q[36],q[18];
-u1(pi/524288) q[18];
-u1(pi/262144) q[36];
-cx q[36],q[19];
-u1(-pi/262144) q[19];
-cx q[36],q[19];
-u1(pi/262144) q[19];
-u1(pi/131072) q[36];
-cx q[36],q[20];
-u1(-pi/131072) q[20];
-cx q[36],q[20];
-u1(pi/131072) q[20];
-u1(pi/65536) q[36];
-cx q[36],q[21];
-u1(-pi/65536) q[21];
-cx q[36],q[21];
-u1(pi/65536) q[21];
-u1(pi/32768) q[36];
-cx q[36],q[22];
-u1(-pi/32768) q[22];
-cx q[36],q[22];
-u1(pi/32768) q[22];
-u1(pi/16384) q[36];
-cx q[36],q[23];
-u1(-pi/16384) q[23];
-cx q[36],q[23];
-u1(pi/16384) q[23];
-u1(pi/8192) q[36];
-cx q[36],q[24];
-u1(-pi/8192) q[24];
-cx q[36],q[24];
-u1(pi/8192) q[24];
-u1(pi/4096) q[36];
-cx q[36],q[25];
-u1(-pi/4096) q[25];
-cx q[36],q[25];
-u1(pi/4096) q[25];
-u1(pi/2048) q[36];
-cx q[36],q[26];
-u1(-pi/2048) q[26];
-cx q[36],q[26];
-u1(pi/2048) q[26];
-u1(pi/1024) q[36];
-cx q[36],q[27];
-u1(-pi/1024) q[27];
-cx q[36],q[27];
-u1(pi/1024) q[27];
-u1(pi/512) q[36];
-cx q[36],q[28];
-u1(-pi/512) q[28];
-cx q[36],q[28];
-u1(pi/512) q[28];
-u1(pi/256) q[36];
-cx q[36],q[29];
-u1(-pi/256) q[29];
-cx q[36],q[29];
-u1(pi/256) q[29];
-u1(pi/128) q[36];
-cx q[36],q[30];
-u1(-pi/128) q[30];
-cx q[36],q[30];
-u1(pi/128) q[30];
-u1(pi/64) q[36];
-cx q[36],q[31];
-u1(-pi/64) q[31];
-cx q[36],q[31];
-u1(pi/64) q[31];
-u1(pi/32) q[36];
-cx q[36],q[32];
-u1(-pi/32) q[32];
-cx q[36],q[32];
-u1(pi/32) q[32];
-u1(pi/16) q[36];
-cx q[36],q[33];
-u1(-pi/16) q[33];
-cx q[36],q[33];
-u1(pi/16) q[33];
-u1(pi/8) q[36];
-cx q[36],q[34];
-u1(-pi/8) q[34];
-cx q[36],q[34];
-u1(pi/8) q[34];
-u1(pi/4) q[36];
-cx q[36],q[35];
-u1(-pi/4) q[35];
-cx q[36],q[35];
-u1(pi/4) q[35];
-h q[36];
-u1(pi/274877906944) q[37];
-cx q[37],q[0];
-u1(-pi/274877906944) q[0];
-cx q[37],q[0];
-u1(pi/274877906944) q[0];
-u1(pi/137438953472) q[37];
-cx q[37],q[1];
-u1(-pi/137438953472) q[1];
-cx q[37],q[1];
-u1(pi/137438953472) q[1];
-u1(pi/68719476736) q[37];
-cx q[37],q[2];
-u1(-pi/68719476736) q[2];
-cx q[37],q[2];
-u1(pi/68719476736) q[2];
-u1(pi/34359738368) q[37];
-cx q[37],q[3];
-u1(-pi/34359738368) q[3];
-cx q[37],q[3];
-u1(pi/34359738368) q[3];
-u1(pi/17179869184) q[37];
-cx q[37],q[4];
-u1(-pi/17179869184) q[4];
-cx q[37],q[4];
-u1(pi/17179869184) q[4];
-u1(pi/8589934592) q[37];
-cx q[37],q[5];
-u1(-pi/8589934592) q[5];
-cx q[37],q[5];
-u1(pi/8589934592) q[5];
-u1(pi/4294967296) q[37];
-cx q[37],q[6];
-u1(-pi/4294967296) q[6];
-cx q[37],q[6];
-u1(pi/4294967296) q[6];
-u1(pi/2147483648) q[37];
-cx q[37],q[7];
-u1(-pi/2147483648) q[7];
-cx q[37],q[7];
-u1(pi/2147483648) q[7];
-u1(pi/1073741824) q[37];
-cx q[37],q[8];
-u1(-pi/1073741824) q[8];
-cx q[37],q[8];
-u1(pi/1073741824) q[8];
-u1(pi/536870912) q[37];
-cx q[37],q[9];
-u1(-pi/536870912) q[9];
-cx q[37],q[9];
-u1(pi/536870912) q[9];
-u1(pi/268435456) q[37];
-cx q[37],q[10];
-u1(-pi/268435456) q[10];
-cx q[37],q[10];
-u1(pi/268435456) q[10];
-u1(pi/134217728) q[37];
-cx q[37],q[11];
-u1(-pi/134217728) q[11];
-cx q[37],q[11];
-u1(pi/134217728) q[11];
-u1(pi/67108864) q[37];
-cx q[37],q[12];
-u1(-pi/67108864) q[12];
-cx q[37],q[12];
-u1(pi/67108864) q[12];
-u1(pi/33554432) q[37];
-cx q[37],q[13];
-u1(-pi/33554432) q[13];
-cx q[37],q[13];
-u1(pi/33554432) q[13];
-u1(pi/16777216) q[37];
-cx q[37],q[14];
-u1(-pi/16777216) q[14];
-cx q[37],q[14];
-u1(pi/16777216) q[14];
-u1(pi/8388608) q[37];
-cx q[37],q[15];
-u1(-pi/8388608) q[15];
-cx q[37],q[15];
-u1(pi/8388608) q[15];
-u1(pi/4194304) q[37];
-cx q[37],q[16];
-u1(-pi/4194304) q[16];
-cx q[37],q[16];
-u1(pi/4194304) q[16];
-u1(pi/2097152) q[37];
-cx q[37],q[17];
-u1(-pi/2097152) q[17];
-cx q[37],q[17];
-u1(pi/2097152) q[17];
-u1(pi/1048576) q[37];
-cx q[37],q[18];
-u1(-pi/1048576) q[18];
-cx q[37],q[18];
-u1(pi/1048576) q[18];
-u1(pi/524288) q[37];
-cx q[37],q[19];
-u1(-pi/524288) q[19];
-cx q[37],q[19];
-u1(pi/524288) q[19];
-u1(pi/262144) q[37];
-cx q[37],q[20];
-u1(-pi/262144) q[20];
-cx q[37],q[20];
-u1(pi/262144) q[20];
-u1(pi/131072) q[37];
-cx q[37],q[21];
-u1(-pi/131072) q[21];
-cx q[37],q[21];
-u1(pi/131072) q[21];
-u1(pi/65536) q[37];
-cx q[37],q[22];
-u1(-pi/65536) q[22];
-cx q[37],q[22];
-u1(pi/65536) q[22];
-u1(pi/32768) q[37];
-cx q[37],q[23];
-u1(-pi/32768) q[23];
-cx q[37],q[23];
-u1(pi/32768) q[23];
-u1(pi/16384) q[37];
-cx q[37],q[24];
-u1(-pi/16384) q[24];
-cx q[37],q[24];
-u1(pi/16384) q[24];
-u1(pi/8192) q[37];
-cx q[37],q[25];
-u1(-pi/8192) q[25];
-cx q[37],q[25];
-u1(pi/8192) q[25];
-u1(pi/4096) q[37];
-cx q[37],q[26];
-u1(-pi/4096) q[26];
-cx q[37],q[26];
-u1(pi/4096) q[26];
-u1(pi/2048) q[37];
-cx q[37],q[27];
-u1(-pi/2048) q[27];
-cx q[37],q[27];
-u1(pi/2048) q[27];
-u1(pi/1024) q[37];
-cx q[37],q[28];
-u1(-pi/1024) q[28];
-cx q[37],q[28];
-u1(pi/1024) q[28];
-u1(pi/512) q[37];
-cx q[37],q[29];
-u1(-pi/512) q[29];
-cx q[37],q[29];
-u1(pi/512) q[29];
-u1(pi/256) q[37];
-cx q[37],q[30];
-u1(-pi/256) q[30];
-cx q[37],q[30];
-u1(pi/256) q[30];
-u1(pi/128) q[37];
-cx q[37],q[31];
-u1(-pi/128) q[31];
-cx q[37],q[31];
-u1(pi/128) q[31];
-u1(pi/64) q[37];
-cx q[37],q[32];
-u1(-pi/64) q[32];
-cx q[37],q[32];
-u1(pi/64) q[32];
-u1(pi/32) q[37];
-cx q[37],q[33];
-u1(-pi/32) q[33];
-cx q[37],q[33];
-u1(pi/32) q[33];
-u1(pi/16) q[37];
-cx q[37],q[34];
-u1(-pi/16) q[34];
-cx q[37],q[34];
-u1(pi/16) q[34];
-u1(pi/8) q[37];
-cx q[37],q[35];
-u1(-pi/8) q[35];
-cx q[37],q[35];
-u1(pi/8) q[35];
-u1(pi/4) q[37];
-cx q[37],q[36];
-u1(-pi/4) q[36];
-cx q[37],q[36];
-u1(pi/4) q[36];
-h q[37];
-u1(pi/549755813888) q[38];
-cx q[38],q[0];
-u1(-pi/549755813888) q[0];
-cx q[38],q[0];
-u1(pi/549755813888) q[0];
-u1(pi/274877906944) q[38];
-cx q[38],q[1];
-u1(-pi/274877906944) q[1];
-cx q[38],q[1];
-u1(pi/274877906944) q[1];
-u1(pi/137438953472) q[38];
-cx q[38],q[2];
-u1(-pi/137438953472) q[2];
-cx q[38],q[2];
-u1(pi/137438953472) q[2];
-u1(pi/68719476736) q[38];
-cx q[38],q[3];
-u1(-pi/68719476736) q[3];
-cx q[38],q[3];
-u1(pi/68719476736) q[3];
-u1(pi/34359738368) q[38];
-cx q[38],q[4];
-u1(-pi/34359738368) q[4];
-cx q[38],q[4];
-u1(pi/34359738368) q[4];
-u1(pi/17179869184) q[38];
-cx q[38],q[5];
-u1(-pi/17179869184) q[5];
-cx q[38],q[5];
-u1(pi/17179869184) q[5];
-u1(pi/8589934592) q[38];
-cx q[38],q[6];
-u1(-pi/8589934592) q[6];
-cx q[38],q[6];
-u1(pi/8589934592) q[6];
-u1(pi/4294967296) q[38];
-cx q[38],q[7];
-u1(-pi/4294967296) q[7];
-cx q[38],q[7];
-u1(pi/4294967296) q[7];
-u1(pi/2147483648) q[38];
-cx q[38],q[8];
-u1(-pi/2147483648) q[8];
-cx q[38],q[8];
-u1(pi/2147483648) q[8];
-u1(pi/1073741824) q[38];
-cx q[38],q[9];
-u1(-pi/1073741824) q[9];
-cx q[38],q[9];
-u1(pi/1073741824) q[9];
-u1(pi/536870912) q[38];
-cx q[38],q[10];
-u1(-pi/536870912) q[10];
-cx q[38],q[10];
-u1(pi/536870912) q[10];
-u1(pi/268435456) q[38];
-cx q[38],q[11];
-u1(-pi/268435456) q[11];
-cx q[38],q[11];
-u1(pi/268435456) q[11];
-u1(pi/134217728) q[38];
-cx q[38],q[12];
-u1(-pi/134217728) q[12];
-cx q[38],q[12];
-u1(pi/134217728) q[12];
-u1(pi/67108864) q[38];
-cx q[38],q[13];
-u1(-pi/67108864) q[13];
-cx q[38],q[13];
-u1(pi/67108864) q[13];
-u1(pi/33554432) q[38];
-cx q[38],q[14];
-u1(-pi/33554432) q[14];
-cx q[38],q[14];
-u1(pi/33554432) q[14];
-u1(pi/16777216) q[38];
-cx q[38],q[15];
-u1(-pi/16777216) q[15];
-cx q[38],q[15];
-u1(pi/16777216) q[15];
-u1(pi/8388608) q[38];
-cx q[38],q[16];
-u1(-pi/8388608) q[16];
-cx q[38],q[16];
-u1(pi/8388608) q[16];
-u1(pi/4194304) q[38];
-cx q[38],q[17];
-u1(-pi/4194304) q[17];
-cx q[38],q[17];
-u1(pi/4194304) q[17];
-u1(pi/2097152) q[38];
-cx q[38],q[18];
-u1(-pi/2097152) q[18];
-cx q[38],q[18];
-u1(pi/2097152) q[18];
-u1(pi/1048576) q[38];
-cx q[38],q[19];
-u1(-pi/1048576) q[19];
-cx q[38],q[19];
-u1(pi/1048576) q[19];
-u1(pi/524288) q[38];
-cx q[38],q[20];
-u1(-pi/524288) q[20];
-cx q[38],q[20];
-u1(pi/524288) q[20];
-u1(pi/262144) q[38];
-cx q[38],q[21];
-u1(-pi/262144) q[21];
-cx q[38],q[21];
-u1(pi/262144) q[21];
-u1(pi/131072) q[38];
-cx q[38],q[22];
-u1(-pi/131072) q[22];
-cx q[38],q[22];
-u1(pi/131072) q[22];
-u1(pi/65536) q[38];
-cx q[38],q[23];
-u1(-pi/65536) q[23];
-cx q[38],q[23];
-u1(pi/65536) q[23];
-u1(pi/32768) q[38];
-cx q[38],q[24];
-u1(-pi/32768) q[24];
-cx q[38],q[24];
-u1(pi/32768) q[24];
-u1(pi/16384) q[38];
-cx q[38],q[25];
-u1(-pi/16384) q[25];
-cx q[38],q[25];
-u1(pi/16384) q[25];
-u1(pi/8192) q[38];
-cx q[38],q[26];
-u1(-pi/8192) q[26];
-cx q[38],q[26];
-u1(pi/8192) q[26];
-u1(pi/4096) q[38];
-cx q[38],q[27];
-u1(-pi/4096) q[27];
-cx q[38],q[27];
-u1(pi/4096) q[27];
-u1(pi/2048) q[38];
-cx q[38],q[28];
-u1(-pi/2048) q[28];
-cx q[38],q[28];
-u1(pi/2048) q[28];
-u1(pi/1024) q[38];
-cx q[38],q[29];
-u1(-pi/1024) q[29];
-cx q[38],q[29];
-u1(pi/1024) q[29];
-u1(pi/512) q[38];
-cx q[38],q[30];
-u1(-pi/512) q[30];
-cx q[38],q[30];
-u1(pi/512) q[30];
-u1(pi/256) q[38];
-cx q[38],q[31];
-u1(-pi/256) q[31];
-cx q[38],q[31];
-u1(pi/256) q[31];
-u1(pi/128) q[38];
-cx q[38],q[32];
-u1(-pi/128) q[32];
-cx q[38],q[32];
-u1(pi/128) q[32];
-u1(pi/64) q[38];
-cx q[38],q[33];
-u1(-pi/64) q[33];
-cx q[38],q[33];
-u1(pi/64) q[33];
-u1(pi/32) q[38];
-cx q[38],q[34];
-u1(-pi/32) q[34];
-cx q[38],q[34];
-u1(pi/32) q[34];
-u1(pi/16) q[38];
-cx q[38],q[35];
-u1(-pi/16) q[35];
-cx q[38],q[35];
-u1(pi/16) q[35];
-u1(pi/8) q[38];
-cx q[38],q[36];
-u1(-pi/8) q[36];
-cx q[38],q[36];
-u1(pi/8) q[36];
-u1(pi/4) q[38];
-cx q[38],q[37];
-u1(-pi/4) q[37];
-cx q[38],q[37];
-u1(pi/4) q[37];
-h q[38];
-u1(pi/1099511627776) q[39];
-cx q[39],q[0];
-u1(-pi/1099511627776) q[0];
-cx q[39],q[0];
-u1(pi/1099511627776) q[0];
-u1(pi/549755813888) q[39];
-cx q[39],q[1];
-u1(-pi/549755813888) q[1];
-cx q[39],q[1];
-u1(pi/549755813888) q[1];
-u1(pi/274877906944) q[39];
-cx q[39],q[2];
-u1(-pi/274877906944) q[2];
-cx q[39],q[2];
-u1(pi/274877906944) q[2];
-u1(pi/137438953472) q[39];
-cx q[39],q[3];
-u1(-pi/137438953472) q[3];
-cx q[39],q[3];
-u1(pi/137438953472) q[3];
-u1(pi/68719476736) q[39];
-cx q[39],q[4];
-u1(-pi/68719476736) q[4];
-cx q[39],q[4];
-u1(pi/68719476736) q[4];
-u1(pi/34359738368) q[39];
-cx q[39],q[5];
-u1(-pi/34359738368) q[5];
-cx q[39],q[5];
-u1(pi/34359738368) q[5];
-u1(pi/17179869184) q[39];
-cx q[39],q[6];
-u1(-pi/17179869184) q[6];
-cx q[39],q[6];
-u1(pi/17179869184) q[6];
-u1(pi/8589934592) q[39];
-cx q[39],q[7];
-u1(-pi/8589934592) q[7];
-cx q[39],q[7];
-u1(pi/8589934592) q[7];
-u1(pi/4294967296) q[39];
-cx q[39],q[8];
-u1(-pi/4294967296) q[8];
-cx q[39],q[8];
-u1(pi/4294967296) q[8];
-u1(pi/2147483648) q[39];
-cx q[39],q[9];
-u1(-pi/2147483648) q[9];
-cx q[39],q[9];
-u1(pi/2147483648) q[9];
-u1(pi/1073741824) q[39];
-cx q[39],q[10];
-u1(-pi/1073741824) q[10];
-cx q[39],q[10];
-u1(pi/1073741824) q[10];
-u1(pi/536870912) q[39];
-cx q[39],q[11];
-u1(-pi/536870912) q[11];
-cx q[39],q[11];
-u1(pi/536870912) q[11];
-u1(pi/268435456) q[39];
-cx q[39],q[12];
-u1(-pi/268435456) q[12];
-cx q[39],q[12];
-u1(pi/268435456) q[12];
-u1(pi/134217728) q[39];
-cx q[39],q[13];
-u1(-pi/134217728) q[13];
-cx q[39],q[13];
-u1(pi/134217728) q[13];
-u1(pi/67108864) q[39];
-cx q[39],q[14];
-u1(-pi/67108864) q[14];
-cx q[39],q[14];
-u1(pi/67108864) q[14];
-u1(pi/33554432) q[39];
-cx q[39],q[15];
-u1(-pi/33554432) q[15];
-cx q[39],q[15];
-u1(pi/33554432) q[15];
-u1(pi/16777216) q[39];
-cx q[39],q[16];
-u1(-pi/16777216) q[16];
-cx q[39],q[16];
-u1(pi/16777216) q[16];
-u1(pi/8388608) q[39];
-cx q[39],q[17];
-u1(-pi/8388608) q[17];
-cx q[39],q[17];
-u1(pi/8388608) q[17];
-u1(pi/4194304) q[39];
-cx q[39],q[18];
-u1(-pi/4194304) q[18];
-cx q[39],q[18];
-u1(pi/4194304) q[18];
-u1(pi/2097152) q[39];
-cx q[39],q[19];
-u1(-pi/2097152) q[19];
-cx q[39],q[19];
-u1(pi/2097152) q[19];
-u1(pi/1048576) q[39];
-cx q[39],q[20];
-u1(-pi/1048576) q[20];
-cx q[39],q[20];
-u1(pi/1048576) q[20];
-u1(pi/524288) q[39];
-cx q[39],q[21];
-u1(-pi/524288) q[21];
-cx q[39],q[21];
-u1(pi/524288) q[21];
-u1(pi/262144) q[39];
-cx q[39],q[22];
-u1(-pi/262144) q[22];
-cx q[39],q[22];
-u1(pi/262144) q[22];
-u1(pi/131072) q[39];
-cx q[39],q[23];
-u1(-pi/131072) q[23];
-cx q[39],q[23];
-u1(pi/131072) q[23];
-u1(pi/65536) q[39];
-cx q[39],q[24];
-u1(-pi/65536) q[24];
-cx q[39],q[24];
-u1(pi/65536) q[24];
-u1(pi/32768) q[39];
-cx q[39],q[25];
-u1(-pi/32768) q[25];
-cx q[39],q[25];
-u1(pi/32768) q[25];
-u1(pi/16384) q[39];
-cx q[39],q[26];
-u1(-pi/16384) q[26];
-cx q[39],q[26];
-u1(pi/16384) q[26];
-u1(pi/8192) q[39];
-cx q[39],q[27];
-u1(-pi/8192) q[27];
-cx q[39],q[27];
-u1(pi/8192) q[27];
-u1(pi/4096) q[39];
-cx q[39],q[28];
-u1(-pi/4096) q[28];
-cx q[39],q[28];
-u1(pi/4096) q[28];
-u1(pi/2048) q[39];
-cx q[39],q[29];
-u1(-pi/2048) q[29];
-cx q[39],q[29];
-u1(pi/2048) q[29];
-u1(pi/1024) q[39];
-cx q[39],q[30];
-u1(-pi/1024) q[30];
-cx q[39],q[30];
-u1(pi/1024) q[30];
-u1(pi/512) q[39];
-cx q[39],q[31];
-u1(-pi/512) q[31];
-cx q[39],q[31];
-u1(pi/512) q[31];
-u1(pi/256) q[39];
-cx q[39],q[32];
-u1(-pi/256) q[32];
-cx q[39],q[32];
-u1(pi/256) q[32];
-u1(pi/128) q[39];
-cx q[39],q[33];
-u1(-pi/128) q[33];
-cx q[39],q[33];
-u1(pi/128) q[33];
-u1(pi/64) q[39];
-cx q[39],q[34];
-u1(-pi/64) q[34];
-cx q[39],q[34];
-u1(pi/64) q[34];
-u1(pi/32) q[39];
-cx q[39],q[35];
-u1(-pi/32) q[35];
-cx q[39],q[35];
-u1(pi/32) q[35];
-u1(pi/16) q[39];
-cx q[39],q[36];
-u1(-pi/16) q[36];
-cx q[39],q[36];
-u1(pi/16) q[36];
-u1(pi/8) q[39];
-cx q[39],q[37];
-u1(-pi/8) q[37];
-cx q[39],q[37];
-u1(pi/8) q[37];
-u1(pi/4) q[39];
-cx q[39],q[38];
-u1(-pi/4) q[38];
-cx q[39],q[38];
-u1(pi/4) q[38];
-h q[39];
-u1(pi/2199023255552) q[40];
-cx q[40],q[0];
-u1(-pi/2199023255552) q[0];
-cx q[40],q[0];
-u1(pi/2199023255552) q[0];
-u1(pi/1099511627776) q[40];
-cx q[40],q[1];
-u1(-pi/1099511627776) q[1];
-cx q[40],q[1];
-u1(pi/1099511627776) q[1];
-u1(pi/549755813888) q[40];
-cx q[40],q[2];
-u1(-pi/549755813888) q[2];
-cx q[40],q[2];
-u1(pi/549755813888) q[2];
-u1(pi/274877906944) q[40];
-cx q[40],q[3];
-u1(-pi/274877906944) q[3];
-cx q[40],q[3];
-u1(pi/274877906944) q[3];
-u1(pi/137438953472) q[40];
-cx q[40],q[4];
-u1(-pi/137438953472) q[4];
-cx q[40],q[4];
-u1(pi/137438953472) q[4];
-u1(pi/68719476736) q[40];
-cx q[40],q[5];
-u1(-pi/68719476736) q[5];
-cx q[40],q[5];
-u1(pi/68719476736) q[5];
-u1(pi/34359738368) q[40];
-cx q[40],q[6];
-u1(-pi/34359738368) q[6];
-cx q[40],q[6];
-u1(pi/34359738368) q[6];
-u1(pi/17179869184) q[40];
-cx q[40],q[7];
-u1(-pi/17179869184) q[7];
-cx q[40],q[7];
-u1(pi/17179869184) q[7];
-u1(pi/8589934592) q[40];
-cx q[40],q[8];
-u1(-pi/8589934592) q[8];
-cx q[40],q[8];
-u1(pi/8589934592) q[8];
-u1(pi/4294967296) q[40];
-cx q[40],q[9];
-u1(-pi/4294967296) q[9];
-cx q[40],q[9];
-u1(pi/4294967296) q[9];
-u1(pi/2147483648) q[40];
-cx q[40],q[10];
-u1(-pi/2147483648) q[10];
-cx q[40],q[10];
-u1(pi/2147483648) q[10];
-u1(pi/1073741824) q[40];
-cx q[40],q[11];
-u1(-pi/1073741824) q[11];
-cx q[40],q[11];
-u1(pi/1073741824) q[11];
-u1(pi/536870912) q[40];
-cx q[40],q[12];
-u1(-pi/536870912) q[12];
-cx q[40],q[12];
-u1(pi/536870912) q[12];
-u1(pi/268435456) q[40];
-cx q[40],q[13];
-u1(-pi/268435456) q[13];
-cx q[40],q[13];
-u1(pi/268435456) q[13];
-u1(pi/134217728) q[40];
-cx q[40],q[14];
-u1(-pi/134217728) q[14];
-cx q[40],q[14];
-u1(pi/134217728) q[14];
-u1(pi/67108864) q[40];
-cx q[40],q[15];
-u1(-pi/67108864) q[15];
-cx q[40],q[15];
-u1(pi/67108864) q[15];
-u1(pi/33554432) q[40];
-cx q[40],q[16];
-u1(-pi/33554432) q[16];
-cx q[40],q[16];
-u1(pi/33554432) q[16];
-u1(pi/16777216) q[40];
-cx q[40],q[17];
-u1(-pi/16777216) q[17];
-cx q[40],q[17];
-u1(pi/16777216) q[17];
-u1(pi/8388608) q[40];
-cx q[40],q[18];
-u1(-pi/8388608) q[18];
-cx q[40],q[18];
-u1(pi/8388608) q[18];
-u1(pi/4194304) q[40];
-cx q[40],q[19];
-u1(-pi/4194304) q[19];
-cx q[40],q[19];
-u1(pi/4194304) q[19];
-u1(pi/2097152) q[40];
-cx q[40],q[20];
-u1(-pi/2097152) q[20];
-cx q[40],q[20];
-u1(pi/2097152) q[20];
-u1(pi/1048576) q[40];
-cx q[40],q[21];
-u1(-pi/1048576) q[21];
-cx q[40],q[21];
-u1(pi/1048576) q[21];
-u1(pi/524288) q[40];
-cx q[40],q[22];
-u1(-pi/524288) q[22];
-cx q[40],q[22];
-u1(pi/524288) q[22];
-u1(pi/262144) q[40];
-cx q[40],q[23];
-u1(-pi/262144) q[23];
-cx q[40],q[23];
-u1(pi/262144) q[23];
-u1(pi/131072) q[40];
-cx q[40],q[24];
-u1(-pi/131072) q[24];
-cx q[40],q[24];
-u1(pi/131072) q[24];
-u1(pi/65536) q[40];
-cx q[40],q[25];
-u1(-pi/65536) q[25];
-cx q[40],q[25];
-u1(pi/65536) q[25];
-u1(pi/32768) q[40];
-cx q[40],q[26];
-u1(-pi/32768) q[26];
-cx q[40],q[26];
-u1(pi/32768) q[26];
-u1(pi/16384) q[40];
-cx q[40],q[27];
-u1(-pi/16384) q[27];
-cx q[40],q[27];
-u1(pi/16384) q[27];
-u1(pi/8192) q[40];
-cx q[40],q[28];
-u1(-pi/8192) q[28];
-cx q[40],q[28];
-u1(pi/8192) q[28];
-u1(pi/4096) q[40];
-cx q[40],q[29];
-u1(-pi/4096) q[29];
-cx q[40],q[29];
-u1(pi/4096) q[29];
-u1(pi/2048) q[40];
-cx q[40],q[30];
-u1(-pi/2048) q[30];
-cx q[40],q[30];
-u1(pi/2048) q[30];
-u1(pi/1024) q[40];
-cx q[40],q[31];
-u1(-pi/1024) q[31];
-cx q[40],q[31];
-u1(pi/1024) q[31];
-u1(pi/512) q[40];
-cx q[40],q[32];
-u1(-pi/512) q[32];
-cx q[40],q[32];
-u1(pi/512) q[32];
-u1(pi/256) q[40];
-cx q[40],q[33];
-u1(-pi/256) q[33];
-cx q[40],q[33];
-u1(pi/256) q[33];
-u1(pi/128) q[40];
-cx q[40],q[34];
-u1(-pi/128) q[34];
-cx q[40],q[34];
-u1(pi/128) q[34];
-u1(pi/64) q[40];
-cx q[40],q[35];
-u1(-pi/64) q[35];
-cx q[40],q[35];
-u1(pi/64) q[35];
-u1(pi/32) q[40];
-cx q[40],q[36];
-u1(-pi/32) q[36];
-cx q[40],q[36];
-u1(pi/32) q[36];
-u1(pi/16) q[40];
-cx q[40],q[37];
-u1(-pi/16) q[37];
-cx q[40],q[37];
-u1(pi/16) q[37];
-u1(pi/8) q[40];
-cx q[40],q[38];
-u1(-pi/8) q[38];
-cx q[40],q[38];
-u1(pi/8) q[38];
-u1(pi/4) q[40];
-cx q[40],q[39];
-u1(-pi/4) q[39];
-cx q[40],q[39];
-u1(pi/4) q[39];
-h q[40];
-u1(pi/4398046511104) q[41];
-cx q[41],q[0];
-u1(-pi/4398046511104) q[0];
-cx q[41],q[0];
-u1(pi/4398046511104) q[0];
-u1(pi/2199023255552) q[41];
-cx q[41],q[1];
-u1(-pi/2199023255552) q[1];
-cx q[41],q[1];
-u1(pi/2199023255552) q[1];
-u1(pi/1099511627776) q[41];
-cx q[41],q[2];
-u1(-pi/1099511627776) q[2];
-cx q[41],q[2];
-u1(pi/1099511627776) q[2];
-u1(pi/549755813888) q[41];
-cx q[41],q[3];
-u1(-pi/549755813888) q[3];
-cx q[41],q[3];
-u1(pi/549755813888) q[3];
-u1(pi/274877906944) q[41];
-cx q[41],q[4];
-u1(-pi/274877906944) q[4];
-cx q[41],q[4];
-u1(pi/274877906944) q[4];
-u1(pi/137438953472) q[41];
-cx q[41],q[5];
-u1(-pi/137438953472) q[5];
-cx q[41],q[5];
-u1(pi/137438953472) q[5];
-u1(pi/68719476736) q[41];
-cx q[41],q[6];
-u1(-pi/68719476736) q[6];
-cx q[41],q[6];
-u1(pi/68719476736) q[6];
-u1(pi/34359738368) q[41];
-cx q[41],q[7];
-u1(-pi/34359738368) q[7];
-cx q[41],q[7];
-u1(pi/34359738368) q[7];
-u1(pi/17179869184) q[41];
-cx q[41],q[8];
-u1(-pi/17179869184) q[8];
-cx q[41],q[8];
-u1(pi/17179869184) q[8];
-u1(pi/8589934592) q[41];
-cx q[41],q[9];
-u1(-pi/8589934592) q[9];
-cx q[41],q[9];
-u1(pi/8589934592) q[9];
-u1(pi/4294967296) q[41];
-cx q[41],q[10];
-u1(-pi/4294967296) q[10];
-cx q[41],q[10];
-u1(pi/4294967296) q[10];
-u1(pi/2147483648) q[41];
-cx q[41],q[11];
-u1(-pi/2147483648) q[11];
-cx q[41],q[11];
-u1(pi/2147483648) q[11];
-u1(pi/1073741824) q[41];
-cx q[41],q[12];
-u1(-pi/1073741824) q[12];
-cx q[41],q[12];
-u1(pi/1073741824) q[12];
-u1(pi/536870912) q[41];
-cx q[41],q[13];
-u1(-pi/536870912) q[13];
-cx q[41],q[13];
-u1(pi/536870912) q[13];
-u1(pi/268435456) q[41];
-cx q[41],q[14];
-u1(-pi/268435456) q[14];
-cx q[41],q[14];
-u1(pi/268435456) q[14];
-u1(pi/134217728) q[41];
-cx q[41],q[15];
-u1(-pi/134217728) q[15];
-cx q[41],q[15];
-u1(pi/134217728) q[15];
-u1(pi/67108864) q[41];
-cx q[41],q[16];
-u1(-pi/67108864) q[16];
-cx q[41],q[16];
-u1(pi/67108864) q[16];
-u1(pi/33554432) q[41];
-cx q[41],q[17];
-u1(-pi/33554432) q[17];
-cx q[41],q[17];
-u1(pi/33554432) q[17];
-u1(pi/16777216) q[41];
-cx q[41],q[18];
-u1(-pi/16777216) q[18];
-cx q[41],q[18];
-u1(pi/16777216) q[18];
-u1(pi/8388608) q[41];
-cx q[41],q[19];
-u1(-pi/8388608) q[19];
-cx q[41],q[19];
-u1(pi/8388608) q[19];
-u1(pi/4194304) q[41];
-cx q[41],q[20];
-u1(-pi/4194304) q[20];
-cx q[41],q[20];
-u1(pi/4194304) q[20];
-u1(pi/2097152) q[41];
-cx q[41],q[21];
-u1(-pi/2097152) q[21];
-cx q[41],q[21];
-u1(pi/2097152) q[21];
-u1(pi/1048576) q[41];
-cx q[41],q[22];
-u1(-pi/1048576) q[22];
-cx q[41],q[22];
-u1(pi/1048576) q[22];
-u1(pi/524288) q[41];
-cx q[41],q[23];
-u1(-pi/524288) q[23];
-cx q[41],q[23];
-u1(pi/524288) q[23];
-u1(pi/262144) q[41];
-cx q[41],q[24];
-u1(-pi/262144) q[24];
-cx q[41],q[24];
-u1(pi/262144) q[24];
-u1(pi/131072) q[41];
-cx q[41],q[25];
-u1(-pi/131072) q[25];
-cx q[41],q[25];
-u1(pi/131072) q[25];
-u1(pi/65536) q[41];
-cx q[41],q[26];
-u1(-pi/65536) q[26];
-cx q[41],q[26];
-u1(pi/65536) q[26];
-u1(pi/32768) q[41];
-cx q[41],q[27];
-u1(-pi/32768) q[27];
-cx q[41],q[27];
-u1(pi/32768) q[27];
-u1(pi/16384) q[41];
-cx q[41],q[28];
-u1(-pi/16384) q[28];
-cx q[41],q[28];
-u1(pi/16384) q[28];
-u1(pi/8192) q[41];
-cx q[41],q[29];
-u1(-pi/8192) q[29];
-cx q[41],q[29];
-u1(pi/8192) q[29];
-u1(pi/4096) q[41];
-cx q[41],q[30];
-u1(-pi/4096) q[30];
-cx q[41],q[30];
-u1(pi/4096) q[30];
-u1(pi/2048) q[41];
-cx q[41],q[31];
-u1(-pi/2048) q[31];
-cx q[41],q[31];
-u1(pi/2048) q[31];
-u1(pi/1024) q[41];
-cx q[41],q[32];
-u1(-pi/1024) q[32];
-cx q[41],q[32];
-u1(pi/1024) q[32];
-u1(pi/512) q[41];
-cx q[41],q[33];
-u1(-pi/512) q[33];
-cx q[41],q[33];
-u1(pi/512) q[33];
-u1(pi/256) q[41];
-cx q[41],q[34];
-u1(-pi/256) q[34];
-cx q[41],q[34];
-u1(pi/256) q[34];
-u1(pi/128) q[41];
-cx q[41],q[35];
-u1(-pi/128) q[35];
-cx q[41],q[35];
-u1(pi/128) q[35];
-u1(pi/64) q[41];
-cx q[41],q[36];
-u1(-pi/64) q[36];
-cx q[41],q[36];
-u1(pi/64) q[36];
-u1(pi/32) q[41];
-cx q[41],q[37];
-u1(-pi/32) q[37];
-cx q[41],q[37];
-u1(pi/32) q[37];
-u1(pi/16) q[41];
-cx q[41],q[38];
-u1(-pi/16) q[38];
-cx q[41],q[38];
-u1(pi/16) q[38];
-u1(pi/8) q[41];
-cx q[41],q[39];
-u1(-pi/8) q[39];
-cx q[41],q[39];
-u1(pi/8) q[39];
-u1(pi/4) q[41];
-cx q[41],q[40];
-u1(-pi/4) q[40];
-cx q[41],q[40];
-u1(pi/4) q[40];
-h q[41];
-u1(pi/8796093022208) q[42];
-cx q[42],q[0];
-u1(-pi/8796093022208) q[0];
-cx q[42],q[0];
-u1(pi/8796093022208) q[0];
-u1(pi/4398046511104) q[42];
-cx q[42],q[1];
-u1(-pi/4398046511104) q[1];
-cx q[42],q[1];
-u1(pi/4398046511104) q[1];
-u1(pi/2199023255552) q[42];
-cx q[42],q[2];
-u1(-pi/2199023255552) q[2];
-cx q[42],q[2];
-u1(pi/2199023255552) q[2];
-u1(pi/1099511627776) q[42];
-cx q[42],q[3];
-u1(-pi/1099511627776) q[3];
-cx q[42],q[3];
-u1(pi/1099511627776) q[3];
-u1(pi/549755813888) q[42];
-cx q[42],q[4];
-u1(-pi/549755813888) q[4];
-cx q[42],q[4];
-u1(pi/549755813888) q[4];
-u1(pi/274877906944) q[42];
-cx q[42],q[5];
-u1(-pi/274877906944) q[5];
-cx q[42],q[5];
-u1(pi/274877906944) q[5];
-u1(pi/137438953472) q[42];
-cx q[42],q[6];
-u1(-pi/137438953472) q[6];
-cx q[42],q[6];
-u1(pi/137438953472) q[6];
-u1(pi/68719476736) q[42];
-cx q[42],q[7];
-u1(-pi/68719476736) q[7];
-cx q[42],q[7];
-u1(pi/68719476736) q[7];
-u1(pi/34359738368) q[42];
-cx q[42],q[8];
-u1(-pi/34359738368) q[8];
-cx q[42],q[8];
-u1(pi/34359738368) q[8];
-u1(pi/17179869184) q[42];
-cx q[42],q[9];
-u1(-pi/17179869184) q[9];
-cx q[42],q[9];
-u1(pi/17179869184) q[9];
-u1(pi/8589934592) q[42];
-cx q[42],q[10];
-u1(-pi/8589934592) q[10];
-cx q[42],q[10];
-u1(pi/8589934592) q[10];
-u1(pi/4294967296) q[42];
-cx q[42],q[11];
-u1(-pi/4294967296) q[11];
-cx q[42],q[11];
-u1(pi/4294967296) q[11];
-u1(pi/2147483648) q[42];
-cx q[42],q[12];
-u1(-pi/2147483648) q[12];
-cx q[42],q[12];
-u1(pi/2147483648) q[12];
-u1(pi/1073741824) q[42];
-cx q[42],q[13];
-u1(-pi/1073741824) q[13];
-cx q[42],q[13];
-u1(pi/1073741824) q[13];
-u1(pi/536870912) q[42];
-cx q[42],q[14];
-u1(-pi/536870912) q[14];
-cx q[42],q[14];
-u1(pi/536870912) q[14];
-u1(pi/268435456) q[42];
-cx q[42],q[15];
-u1(-pi/268435456) q[15];
-cx q[42],q[15];
-u1(pi/268435456) q[15];
-u1(pi/134217728) q[42];
-cx q[42],q[16];
-u1(-pi/134217728) q[16];
-cx q[42],q[16];
-u1(pi/134217728) q[16];
-u1(pi/67108864) q[42];
-cx q[42],q[17];
-u1(-pi/67108864) q[17];
-cx q[42],q[17];
-u1(pi/67108864) q[17];
-u1(pi/33554432) q[42];
-cx q[42],q[18];
-u1(-pi/33554432) q[18];
-cx q[42],q[18];
-u1(pi/33554432) q[18];
-u1(pi/16777216) q[42];
-cx q[42],q[19];
-u1(-pi/16777216) q[19];
-cx q[42],q[19];
-u1(pi/16777216) q[19];
-u1(pi/8388608) q[42];
-cx q[42],q[20];
-u1(-pi/8388608) q[20];
-cx q[42],q[20];
-u1(pi/8388608) q[20];
-u1(pi/4194304) q[42];
-cx q[42],q[21];
-u1(-pi/4194304) q[21];
-cx q[42],q[21];
-u1(pi/4194304) q[21];
-u1(pi/2097152) q[42];
-cx q[42],q[22];
-u1(-pi/2097152) q[22];
-cx q[42],q[22];
-u1(pi/2097152) q[22];
-u1(pi/1048576) q[42];
-cx q[42],q[23];
-u1(-pi/1048576) q[23];
-cx q[42],q[23];
-u1(pi/1048576) q[23];
-u1(pi/524288) q[42];
-cx q[42],q[24];
-u1(-pi/524288) q[24];
-cx q[42],q[24];
-u1(pi/524288) q[24];
-u1(pi/262144) q[42];
-cx q[42],q[25];
-u1(-pi/262144) q[25];
-cx q[42],q[25];
-u1(pi/262144) q[25];
-u1(pi/131072) q[42];
-cx q[42],q[26];
-u1(-pi/131072) q[26];
-cx q[42],q[26];
-u1(pi/131072) q[26];
-u1(pi/65536) q[42];
-cx q[42],q[27];
-u1(-pi/65536) q[27];
-cx q[42],q[27];
-u1(pi/65536) q[27];
-u1(pi/32768) q[42];
-cx q[42],q[28];
-u1(-pi/32768) q[28];
-cx q[42],q[28];
-u1(pi/32768) q[28];
-u1(pi/16384) q[42];
-cx q[42],q[29];
-u1(-pi/16384) q[29];
-cx q[42],q[29];
-u1(pi/16384) q[29];
-u1(pi/8192) q[42];
-cx q[42],q[30];
-u1(-pi/8192) q[30];
-cx q[42],q[30];
-u1(pi/8192) q[30];
-u1(pi/4096) q[42];
-cx q[42],q[31];
-u1(-pi/4096) q[31];
-cx q[42],q[31];
-u1(pi/4096) q[31];
-u1(pi/2048) q[42];
-cx q[42],q[32];
-u1(-pi/2048) q[32];
-cx q[42],q[32];
-u1(pi/2048) q[32];
-u1(pi/1024) q[42];
-cx q[42],q[33];
-u1(-pi/1024) q[33];
-cx q[42],q[33];
-u1(pi/1024) q[33];
-u1(pi/512) q[42];
-cx q[42],q[34];
-u1(-pi/512) q[34];
-cx q[42],q[34];
-u1(pi/512) q[34];
-u1(pi/256) q[42];
-cx q[42],q[35];
-u1(-pi/256) q[35];
-cx q[42],q[35];
-u1(pi/256) q[35];
-u1(pi/128) q[42];
-cx q[42],q[36];
-u1(-pi/128) q[36];
-cx q[42],q[36];
-u1(pi/128) q[36];
-u1(pi/64) q[42];
-cx q[42],q[37];
-u1(-pi/64) q[37];
-cx q[42],q[37];
-u1(pi/64) q[37];
-u1(pi/32) q[42];
-cx q[42],q[38];
-u1(-pi/32) q[38];
-cx q[42],q[38];
-u1(pi/32) q[38];
-u1(pi/16) q[42];
-cx q[42],q[39];
-u1(-pi/16) q[39];
-cx q[42],q[39];
-u1(pi/16) q[39];
-u1(pi/8) q[42];
-cx q[42],q[40];
-u1(-pi/8) q[40];
-cx q[42],q[40];
-u1(pi/8) q[40];
-u1(pi/4) q[42];
-cx q[42],q[41];
-u1(-pi/4) q[41];
-cx q[42],q[41];
-u1(pi/4) q[41];
-h q[42];
-u1(pi/17592186044416) q[43];
-cx q[43],q[0];
-u1(-pi/17592186044416) q[0];
-cx q[43],q[0];
-u1(pi/17592186044416) q[0];
-u1(pi/8796093022208) q[43];
-cx q[43],q[1];
-u1(-pi/8796093022208) q[1];
-cx q[43],q[1];
-u1(pi/8796093022208) q[1];
-u1(pi/4398046511104) q[43];
-cx q[43],q[2];
-u1(-pi/4398046511104) q[2];
-cx q[43],q[2];
-u1(pi/4398046511104) q[2];
-u1(pi/2199023255552) q[43];
-cx q[43],q[3];
-u1(-pi/2199023255552) q[3];
-cx q[43],q[3];
-u1(pi/2199023255552) q[3];
-u1(pi/1099511627776) q[43];
-cx q[43],q[4];
-u1(-pi/1099511627776) q[4];
-cx q[43],q[4];
-u1(pi/1099511627776) q[4];
-u1(pi/549755813888) q[43];
-cx q[43],q[5];
-u1(-pi/549755813888) q[5];
-cx q[43],q[5];
-u1(pi/549755813888) q[5];
-u1(pi/274877906944) q[43];
-cx q[43],q[6];
-u1(-pi/274877906944) q[6];
-cx q[43],q[6];
-u1(pi/274877906944) q[6];
-u1(pi/137438953472) q[43];
-cx q[43],q[7];
-u1(-pi/137438953472) q[7];
-cx q[43],q[7];
-u1(pi/137438953472) q[7];
-u1(pi/68719476736) q[43];
-cx q[43],q[8];
-u1(-pi/68719476736) q[8];
-cx q[43],q[8];
-u1(pi/68719476736) q[8];
-u1(pi/34359738368) q[43];
-cx q[43],q[9];
-u1(-pi/34359738368) q[9];
-cx q[43],q[9];
-u1(pi/34359738368) q[9];
-u1(pi/17179869184) q[43];
-cx q[43],q[10];
-u1(-pi/17179869184) q[10];
-cx q[43],q[10];
-u1(pi/17179869184) q[10];
-u1(pi/8589934592) q[43];
-cx q[43],q[11];
-u1(-pi/8589934592) q[11];
-cx q[43],q[11];
-u1(pi/8589934592) q[11];
-u1(pi/4294967296) q[43];
-cx q[43],q[12];
-u1(-pi/4294967296) q[12];
-cx q[43],q[12];
-u1(pi/4294967296) q[12];
-u1(pi/2147483648) q[43];
-cx q[43],q[13];
-u1(-pi/2147483648) q[13];
-cx q[43],q[13];
-u1(pi/2147483648) q[13];
-u1(pi/1073741824) q[43];
-cx q[43],q[14];
-u1(-pi/1073741824) q[14];
-cx q[43],q[14];
-u1(pi/1073741824) q[14];
-u1(pi/536870912) q[43];
-cx q[43],q[15];
-u1(-pi/536870912) q[15];
-cx q[43],q[15];
-u1(pi/536870912) q[15];
-u1(pi/268435456) q[43];
-cx q[43],q[16];
-u1(-pi/268435456) q[16];
-cx q[43],q[16];
-u1(pi/268435456) q[16];
-u1(pi/134217728) q[43];
-cx q[43],q[17];
-u1(-pi/134217728) q[17];
-cx q[43],q[17];
-u1(pi/134217728) q[17];
-u1(pi/67108864) q[43];
-cx q[43],q[18];
-u1(-pi/67108864) q[18];
-cx q[43],q[18];
-u1(pi/67108864) q[18];
-u1(pi/33554432) q[43];
-cx q[43],q[19];
-u1(-pi/33554432) q[19];
-cx q[43],q[19];
-u1(pi/33554432) q[19];
-u1(pi/16777216) q[43];
-cx q[43],q[20];
-u1(-pi/16777216) q[20];
-cx q[43],q[20];
-u1(pi/16777216) q[20];
-u1(pi/8388608) q[43];
-cx q[43],q[21];
-u1(-pi/8388608) q[21];
-cx q[43],q[21];
-u1(pi/8388608) q[21];
-u1(pi/4194304) q[43];
-cx q[43],q[22];
-u1(-pi/4194304) q[22];
-cx q[43],q[22];
-u1(pi/4194304) q[22];
-u1(pi/2097152) q[43];
-cx q[43],q[23];
-u1(-pi/2097152) q[23];
-cx q[43],q[23];
-u1(pi/2097152) q[23];
-u1(pi/1048576) q[43];
-cx q[43],q[24];
-u1(-pi/1048576) q[24];
-cx q[43],q[24];
-u1(pi/1048576) q[24];
-u1(pi/524288) q[43];
-cx q[43],q[25];
-u1(-pi/524288) q[25];
-cx q[43],q[25];
-u1(pi/524288) q[25];
-u1(pi/262144) q[43];
-cx q[43],q[26];
-u1(-pi/262144) q[26];
-cx q[43],q[26];
-u1(pi/262144) q[26];
-u1(pi/131072) q[43];
-cx q[43],q[27];
-u1(-pi/131072) q[27];
-cx q[43],q[27];
-u1(pi/131072) q[27];
-u1(pi/65536) q[43];
-cx q[43],q[28];
-u1(-pi/65536) q[28];
-cx q[43],q[28];
-u1(pi/65536) q[28];
-u1(pi/32768) q[43];
-cx q[43],q[29];
-u1(-pi/32768) q[29];
-cx q[43],q[29];
-u1(pi/32768) q[29];
-u1(pi/16384) q[43];
-cx q[43],q[30];
-u1(-pi/16384) q[30];
-cx q[43],q[30];
-u1(pi/16384) q[30];
-u1(pi/8192) q[43];
-cx q[43],q[31];
-u1(-pi/8192) q[31];
-cx q[43],q[31];
-u1(pi/8192) q[31];
-u1(pi/4096) q[43];
-cx q[43],q[32];
-u1(-pi/4096) q[32];
-cx q[43],q[32];
-u1(pi/4096) q[32];
-u1(pi/2048) q[43];
-cx q[43],q[33];
-u1(-pi/2048) q[33];
-cx q[43],q[33];
-u1(pi/2048) q[33];
-u1(pi/1024) q[43];
-cx q[43],q[34];
-u1(-pi/1024) q[34];
-cx q[43],q[34];
-u1(pi/1024) q[34];
-u1(pi/512) q[43];
-cx q[43],q[35];
-u1(-pi/512) q[35];
-cx q[43],q[35];
-u1(pi/512) q[35];
-u1(pi/256) q[43];
-cx q[43],q[36];
-u1(-pi/256) q[36];
-cx q[43],q[36];
-u1(pi/256) q[36];
-u1(pi/128) q[43];
-cx q[43],q[37];
-u1(-pi/128) q[37];
-cx q[43],q[37];
-u1(pi/128) q[37];
-u1(pi/64) q[43];
-cx q[43],q[38];
-u1(-pi/64) q[38];
-cx q[43],q[38];
-u1(pi/64) q[38];
-u1(pi/32) q[43];
-cx q[43],q[39];
-u1(-pi/32) q[39];
-cx q[43],q[39];
-u1(pi/32) q[39];
-u1(pi/16) q[43];
-cx q[43],q[40];
-u1(-pi/16) q[40];
-cx q[43],q[40];
-u1(pi/16) q[40];
-u1(pi/8) q[43];
-cx q[43],q[41];
-u1(-pi/8) q[41];
-cx q[43],q[41];
-u1(pi/8) q[41];
-u1(pi/4) q[43];
-cx q[43],q[42];
-u1(-pi/4) q[42];
-cx q[43],q[42];
-u1(pi/4) q[42];
-h q[43];
-u1(pi/35184372088832) q[44];
-cx q[44],q[0];
-u1(-pi/35184372088832) q[0];
-cx q[44],q[0];
-u1(pi/35184372088832) q[0];
-u1(pi/17592186044416) q[44];
-cx q[44],q[1];
-u1(-pi/17592186044416) q[1];
-cx q[44],q[1];
-u1(pi/17592186044416) q[1];
-u1(pi/8796093022208) q[44];
-cx q[44],q[2];
-u1(-pi/8796093022208) q[2];
-cx q[44],q[2];
-u1(pi/8796093022208) q[2];
-u1(pi/4398046511104) q[44];
-cx q[44],q[3];
-u1(-pi/4398046511104) q[3];
-cx q[44],q[3];
-u1(pi/4398046511104) q[3];
-u1(pi/2199023255552) q[44];
-cx q[44],q[4];
-u1(-pi/2199023255552) q[4];
-cx q[44],q[4];
-u1(pi/2199023255552) q[4];
-u1(pi/1099511627776) q[44];
-cx q[44],q[5];
-u1(-pi/1099511627776) q[5];
-cx q[44],q[5];
-u1(pi/1099511627776) q[5];
-u1(pi/549755813888) q[44];
-cx q[44],q[6];
-u1(-pi/549755813888) q[6];
-cx q[44],q[6];
-u1(pi/549755813888) q[6];
-u1(pi/274877906944) q[44];
-cx q[44],q[7];
-u1(-pi/274877906944) q[7];
-cx q[44],q[7];
-u1(pi/274877906944) q[7];
-u1(pi/137438953472) q[44];
-cx q[44],q[8];
-u1(-pi/137438953472) q[8];
-cx q[44],q[8];
-u1(pi/137438953472) q[8];
-u1(pi/68719476736) q[44];
-cx q[44],q[9];
-u1(-pi/68719476736) q[9];
-cx q[44],q[9];
-u1(pi/68719476736) q[9];
-u1(pi/34359738368) q[44];
-cx q[44],q[10];
-u1(-pi/34359738368) q[10];
-cx q[44],q[10];
-u1(pi/34359738368) q[10];
-u1(pi/17179869184) q[44];
-cx q[44],q[11];
-u1(-pi/17179869184) q[11];
-cx q[44],q[11];
-u1(pi/17179869184) q[11];
-u1(pi/8589934592) q[44];
-cx q[44],q[12];
-u1(-pi/8589934592) q[12];
-cx q[44],q[12];
-u1(pi/8589934592) q[12];
-u1(pi/4294967296) q[44];
-cx q[44],q[13];
-u1(-pi/4294967296) q[13];
-cx q[44],q[13];
-u1(pi/4294967296) q[13];
-u1(pi/2147483648) q[44];
-cx q[44],q[14];
-u1(-pi/2147483648) q[14];
-cx q[44],q[14];
-u1(pi/2147483648) q[14];
-u1(pi/1073741824) q[44];
-cx q[44],q[15];
-u1(-pi/1073741824) q[15];
-cx q[44],q[15];
-u1(pi/1073741824) q[15];
-u1(pi/536870912) q[44];
-cx q[44],q[16];
-u1(-pi/536870912) q[16];
-cx q[44],q[16];
-u1(pi/536870912) q[16];
-u1(pi/268435456) q[44];
-cx q[44],q[17];
-u1(-pi/268435456) q[17];
-cx q[44],q[17];
-u1(pi/268435456) q[17];
-u1(pi/134217728) q[44];
-cx q[44],q[18];
-u1(-pi/134217728) q[18];
-cx q[44],q[18];
-u1(pi/134217728) q[18];
-u1(pi/67108864) q[44];
-cx q[44],q[19];
-u1(-pi/67108864) q[19];
-cx q[44],q[19];
-u1(pi/67108864) q[19];
-u1(pi/33554432) q[44];
-cx q[44],q[20];
-u1(-pi/33554432) q[20];
-cx q[44],q[20];
-u1(pi/33554432) q[20];
-u1(pi/16777216) q[44];
-cx q[44],q[21];
-u1(-pi/16777216) q[21];
-cx q[44],q[21];
-u1(pi/16777216) q[21];
-u1(pi/8388608) q[44];
-cx q[44],q[22];
-u1(-pi/8388608) q[22];
-cx q[44],q[22];
-u1(pi/8388608) q[22];
-u1(pi/4194304) q[44];
-cx q[44],q[23];
-u1(-pi/4194304) q[23];
-cx q[44],q[23];
-u1(pi/4194304) q[23];
-u1(pi/2097152) q[44];
-cx q[44],q[24];
-u1(-pi/2097152) q[24];
-cx q[44],q[24];
-u1(pi/2097152) q[24];
-u1(pi/1048576) q[44];
-cx q[44],q[25];
-u1(-pi/1048576) q[25];
-cx q[44],q[25];
-u1(pi/1048576) q[25];
-u1(pi/524288) q[44];
-cx q[44],q[26];
-u1(-pi/524288) q[26];
-cx q[44],q[26];
-u1(pi/524288) q[26];
-u1(pi/262144) q[44];
-cx q[44],q[27];
-u1(-pi/262144) q[27];
-cx q[44],q[27];
-u1(pi/262144) q[27];
-u1(pi/131072) q[44];
-cx q[44],q[28];
-u1(-pi/131072) q[28];
-cx q[44],q[28];
-u1(pi/131072) q[28];
-u1(pi/65536) q[44];
-cx q[44],q[29];
-u1(-pi/65536) q[29];
-cx q[44],q[29];
-u1(pi/65536) q[29];
-u1(pi/32768) q[44];
-cx q[44],q[30];
-u1(-pi/32768) q[30];
-cx q[44],q[30];
-u1(pi/32768) q[30];
-u1(pi/16384) q[44];
-cx q[44],q[31];
-u1(-pi/16384) q[31];
-cx q[44],q[31];
-u1(pi/16384) q[31];
-u1(pi/8192) q[44];
-cx q[44],q[32];
-u1(-pi/8192) q[32];
-cx q[44],q[32];
-u1(pi/8192) q[32];
-u1(pi/4096) q[44];
-cx q[44],q[33];
-u1(-pi/4096) q[33];
-cx q[44],q[33];
-u1(pi/4096) q[33];
-u1(pi/2048) q[44];
-cx q[44],q[34];
-u1(-pi/2048) q[34];
-cx q[44],q[34];
-u1(pi/2048) q[34];
-u1(pi/1024) q[44];
-cx q[44],q[35];
-u1(-pi/1024) q[35];
-cx q[44],q[35];
-u1(pi/1024) q[35];
-u1(pi/512) q[44];
-cx q[44],q[36];
-u1(-pi/512) q[36];
-cx q[44],q[36];
-u1(pi/512) q[36];
-u1(pi/256) q[44];
-cx q[44],q[37];
-u1(-pi/256) q[37];
-cx q[44],q[37];
-u1(pi/256) q[37];
-u1(pi/128) q[44];
-cx q[44],q[38];
-u1(-pi/128) q[38];
-cx q[44],q[38];
-u1(pi/128) q[38];
-u1(pi/64) q[44];
-cx q[44],q[39];
-u1(-pi/64) q[39];
-cx q[44],q[39];
-u1(pi/64) q[39];
-u1(pi/32) q[44];
-cx q[44],q[40];
-u1(-pi/32) q[40];
-cx q[44],q[40];
-u1(pi/32) q[40];
-u1(pi/16) q[44];
-cx q[44],q[41];
-u1(-pi/16) q[41];
-cx q[44],q[41];
-u1(pi/16) q[41];
-u1(pi/8) q[44];
-cx q[44],q[42];
-u1(-pi/8) q[42];
-cx q[44],q[42];
-u1(pi/8) q[42];
-u1(pi/4) q[44];
-cx q[44],q[43];
-u1(-pi/4) q[43];
-cx q[44],q[43];
-u1(pi/4) q[43];
-h q[44];
-u1(pi/70368744177664) q[45];
-cx q[45],q[0];
-u1(-pi/70368744177664) q[0];
-cx q[45],q[0];
-u1(pi/70368744177664) q[0];
-u1(pi/35184372088832) q[45];
-cx q[45],q[1];
-u1(-pi/35184372088832) q[1];
-cx q[45],q[1];
-u1(pi/35184372088832) q[1];
-u1(pi/17592186044416) q[45];
-cx q[45],q[2];
-u1(-pi/17592186044416) q[2];
-cx q[45],q[2];
-u1(pi/17592186044416) q[2];
-u1(pi/8796093022208) q[45];
-cx q[45],q[3];
-u1(-pi/8796093022208) q[3];
-cx q[45],q[3];
-u1(pi/8796093022208) q[3];
-u1(pi/4398046511104) q[45];
-cx q[45],q[4];
-u1(-pi/4398046511104) q[4];
-cx q[45],q[4];
-u1(pi/4398046511104) q[4];
-u1(pi/2199023255552) q[45];
-cx q[45],q[5];
-u1(-pi/2199023255552) q[5];
-cx q[45],q[5];
-u1(pi/2199023255552) q[5];
-u1(pi/1099511627776) q[45];
-cx q[45],q[6];
-u1(-pi/1099511627776) q[6];
-cx q[45],q[6];
-u1(pi/1099511627776) q[6];
-u1(pi/549755813888) q[45];
-cx q[45],q[7];
-u1(-pi/549755813888) q[7];
-cx q[45],q[7];
-u1(pi/549755813888) q[7];
-u1(pi/274877906944) q[45];
-cx q[45],q[8];
-u1(-pi/274877906944) q[8];
-cx q[45],q[8];
-u1(pi/274877906944) q[8];
-u1(pi/137438953472) q[45];
-cx q[45],q[9];
-u1(-pi/137438953472) q[9];
-cx q[45],q[9];
-u1(pi/137438953472) q[9];
-u1(pi/68719476736) q[45];
-cx q[45],q[10];
-u1(-pi/68719476736) q[10];
-cx q[45],q[10];
-u1(pi/68719476736) q[10];
-u1(pi/34359738368) q[45];
-cx q[45],q[11];
-u1(-pi/34359738368) q[11];
-cx q[45],q[11];
-u1(pi/34359738368) q[11];
-u1(pi/17179869184) q[45];
-cx q[45],q[12];
-u1(-pi/17179869184) q[12];
-cx q[45],q[12];
-u1(pi/17179869184) q[12];
-u1(pi/8589934592) q[45];
-cx q[45],q[13];
-u1(-pi/8589934592) q[13];
-cx q[45],q[13];
-u1(pi/8589934592) q[13];
-u1(pi/4294967296) q[45];
-cx q[45],q[14];
-u1(-pi/4294967296) q[14];
-cx q[45],q[14];
-u1(pi/4294967296) q[14];
-u1(pi/2147483648) q[45];
-cx q[45],q[15];
-u1(-pi/2147483648) q[15];
-cx q[45],q[15];
-u1(pi/2147483648) q[15];
-u1(pi/1073741824) q[45];
-cx q[45],q[16];
-u1(-pi/1073741824) q[16];
-cx q[45],q[16];
-u1(pi/1073741824) q[16];
-u1(pi/536870912) q[45];
-cx q[45],q[17];
-u1(-pi/536870912) q[17];
-cx q[45],q[17];
-u1(pi/536870912) q[17];
-u1(pi/268435456) q[45];
-cx q[45],q[18];
-u1(-pi/268435456) q[18];
-cx q[45],q[18];
-u1(pi/268435456) q[18];
-u1(pi/134217728) q[45];
-cx q[45],q[19];
-u1(-pi/134217728) q[19];
-cx q[45],q[19];
-u1(pi/134217728) q[19];
-u1(pi/67108864) q[45];
-cx q[45],q[20];
-u1(-pi/67108864) q[20];
-cx q[45],q[20];
-u1(pi/67108864) q[20];
-u1(pi/33554432) q[45];
-cx q[45],q[21];
-u1(-pi/33554432) q[21];
-cx q[45],q[21];
-u1(pi/33554432) q[21];
-u1(pi/16777216) q[45];
-cx q[45],q[22];
-u1(-pi/16777216) q[22];
-cx q[45],q[22];
-u1(pi/16777216) q[22];
-u1(pi/8388608) q[45];
-cx q[45],q[23];
-u1(-pi/8388608) q[23];
-cx q[45],q[23];
-u1(pi/8388608) q[23];
-u1(pi/4194304) q[45];
-cx q[45],q[24];
-u1(-pi/4194304) q[24];
-cx q[45],q[24];
-u1(pi/4194304) q[24];
-u1(pi/2097152) q[45];
-cx q[45],q[25];
-u1(-pi/2097152) q[25];
-cx q[45],q[25];
-u1(pi/2097152) q[25];
-u1(pi/1048576) q[45];
-cx q[45],q[26];
-u1(-pi/1048576) q[26];
-cx q[45],q[26];
-u1(pi/1048576) q[26];
-u1(pi/524288) q[45];
-cx q[45],q[27];
-u1(-pi/524288) q[27];
-cx q[45],q[27];
-u1(pi/524288) q[27];
-u1(pi/262144) q[45];
-cx q[45],q[28];
-u1(-pi/262144) q[28];
-cx q[45],q[28];
-u1(pi/262144) q[28];
-u1(pi/131072) q[45];
-cx q[45],q[29];
-u1(-pi/131072) q[29];
-cx q[45],q[29];
-u1(pi/131072) q[29];
-u1(pi/65536) q[45];
-cx q[45],q[30];
-u1(-pi/65536) q[30];
-cx q[45],q[30];
-u1(pi/65536) q[30];
-u1(pi/32768) q[45];
-cx q[45],q[31];
-u1(-pi/32768) q[31];
-cx q[45],q[31];
-u1(pi/32768) q[31];
-u1(pi/16384) q[45];
-cx q[45],q[32];
-u1(-pi/16384) q[32];
-cx q[45],q[32];
-u1(pi/16384) q[32];
-u1(pi/8192) q[45];
-cx q[45],q[33];
-u1(-pi/8192) q[33];
-cx q[45],q[33];
-u1(pi/8192) q[33];
-u1(pi/4096) q[45];
-cx q[45],q[34];
-u1(-pi/4096) q[34];
-cx q[45],q[34];
-u1(pi/4096) q[34];
-u1(pi/2048) q[45];
-cx q[45],q[35];
-u1(-pi/2048) q[35];
-cx q[45],q[35];
-u1(pi/2048) q[35];
-u1(pi/1024) q[45];
-cx q[45],q[36];
-u1(-pi/1024) q[36];
-cx q[45],q[36];
-u1(pi/1024) q[36];
-u1(pi/512) q[45];
-cx q[45],q[37];
-u1(-pi/512) q[37];
-cx q[45],q[37];
-u1(pi/512) q[37];
-u1(pi/256) q[45];
-cx q[45],q[38];
-u1(-pi/256) q[38];
-cx q[45],q[38];
-u1(pi/256) q[38];
-u1(pi/128) q[45];
-cx q[45],q[39];
-u1(-pi/128) q[39];
-cx q[45],q[39];
-u1(pi/128) q[39];
-u1(pi/64) q[45];
-cx q[45],q[40];
-u1(-pi/64) q[40];
-cx q[45],q[40];
-u1(pi/64) q[40];
-u1(pi/32) q[45];
-cx q[45],q[41];
-u1(-pi/32) q[41];
-cx q[45],q[41];
-u1(pi/32) q[41];
-u1(pi/16) q[45];
-cx q[45],q[42];
-u1(-pi/16) q[42];
-cx q[45],q[42];
-u1(pi/16) q[42];
-u1(pi/8) q[45];
-cx q[45],q[43];
-u1(-pi/8) q[43];
-cx q[45],q[43];
-u1(pi/8) q[43];
-u1(pi/4) q[45];
-cx q[45],q[44];
-u1(-pi/4) q[44];
-cx q[45],q[44];
-u1(pi/4) q[44];
-h q[45];
-u1(pi/140737488355328) q[46];
-cx q[46],q[0];
-u1(-pi/140737488355328) q[0];
-cx q[46],q[0];
-u1(pi/140737488355328) q[0];
-u1(pi/70368744177664) q[46];
-cx q[46],q[1];
-u1(-pi/70368744177664) q[1];
-cx q[46],q[1];
-u1(pi/70368744177664) q[1];
-u1(pi/35184372088832) q[46];
-cx q[46],q[2];
-u1(-pi/35184372088832) q[2];
-cx q[46],q[2];
-u1(pi/35184372088832) q[2];
-u1(pi/17592186044416) q[46];
-cx q[46],q[3];
-u1(-pi/17592186044416) q[3];
-cx q[46],q[3];
-u1(pi/17592186044416) q[3];
-u1(pi/8796093022208) q[46];
-cx q[46],q[4];
-u1(-pi/8796093022208) q[4];
-cx q[46],q[4];
-u1(pi/8796093022208) q[4];
-u1(pi/4398046511104) q[46];
-cx q[46],q[5];
-u1(-pi/4398046511104) q[5];
-cx q[46],q[5];
-u1(pi/4398046511104) q[5];
-u1(pi/2199023255552) q[46];
-cx q[46],q[6];
-u1(-pi/2199023255552) q[6];
-cx q[46],q[6];
-u1(pi/2199023255552) q[6];
-u1(pi/1099511627776) q[46];
-cx q[46],q[7];
-u1(-pi/1099511627776) q[7];
-cx q[46],q[7];
-u1(pi/1099511627776) q[7];
-u1(pi/549755813888) q[46];
-cx q[46],q[8];
-u1(-pi/549755813888) q[8];
-cx q[46],q[8];
-u1(pi/549755813888) q[8];
-u1(pi/274877906944) q[46];
-cx q[46],q[9];
-u1(-pi/274877906944) q[9];
-cx q[46],q[9];
-u1(pi/274877906944) q[9];
-u1(pi/137438953472) q[46];
-cx q[46],q[10];
-u1(-pi/137438953472) q[10];
-cx q[46],q[10];
-u1(pi/137438953472) q[10];
-u1(pi/68719476736) q[46];
-cx q[46],q[11];
-u1(-pi/68719476736) q[11];
-cx q[46],q[11];
-u1(pi/68719476736) q[11];
-u1(pi/34359738368) q[46];
-cx q[46],q[12];
-u1(-pi/34359738368) q[12];
-cx q[46],q[12];
-u1(pi/34359738368) q[12];
-u1(pi/17179869184) q[46];
-cx q[46],q[13];
-u1(-pi/17179869184) q[13];
-cx q[46],q[13];
-u1(pi/17179869184) q[13];
-u1(pi/8589934592) q[46];
-cx q[46],q[14];
-u1(-pi/8589934592) q[14];
-cx q[46],q[14];
-u1(pi/8589934592) q[14];
-u1(pi/4294967296) q[46];
-cx q[46],q[15];
-u1(-pi/4294967296) q[15];
-cx q[46],q[15];
-u1(pi/4294967296) q[15];
-u1(pi/2147483648) q[46];
-cx q[46],q[16];
-u1(-pi/2147483648) q[16];
-cx q[46],q[16];
-u1(pi/2147483648) q[16];
-u1(pi/1073741824) q[46];
-cx q[46],q[17];
-u1(-pi/1073741824) q[17];
-cx q[46],q[17];
-u1(pi/1073741824) q[17];
-u1(pi/536870912) q[46];
-cx q[46],q[18];
-u1(-pi/536870912) q[18];
-cx q[46],q[18];
-u1(pi/536870912) q[18];
-u1(pi/268435456) q[46];
-cx q[46],q[19];
-u1(-pi/268435456) q[19];
-cx q[46],q[19];
-u1(pi/268435456) q[19];
-u1(pi/134217728) q[46];
-cx q[46],q[20];
-u1(-pi/134217728) q[20];
-cx q[46],q[20];
-u1(pi/134217728) q[20];
-u1(pi/67108864) q[46];
-cx q[46],q[21];
-u1(-pi/67108864) q[21];
-cx q[46],q[21];
-u1(pi/67108864) q[21];
-u1(pi/33554432) q[46];
-cx q[46],q[22];
-u1(-pi/33554432) q[22];
-cx q[46],q[22];
-u1(pi/33554432) q[22];
-u1(pi/16777216) q[46];
-cx q[46],q[23];
-u1(-pi/16777216) q[23];
-cx q[46],q[23];
-u1(pi/16777216) q[23];
-u1(pi/8388608) q[46];
-cx q[46],q[24];
-u1(-pi/8388608) q[24];
-cx q[46],q[24];
-u1(pi/8388608) q[24];
-u1(pi/4194304) q[46];
-cx q[46],q[25];
-u1(-pi/4194304) q[25];
-cx q[46],q[25];
-u1(pi/4194304) q[25];
-u1(pi/2097152) q[46];
-cx q[46],q[26];
-u1(-pi/2097152) q[26];
-cx q[46],q[26];
-u1(pi/2097152) q[26];
-u1(pi/1048576) q[46];
-cx q[46],q[27];
-u1(-pi/1048576) q[27];
-cx q[46],q[27];
-u1(pi/1048576) q[27];
-u1(pi/524288) q[46];
-cx q[46],q[28];
-u1(-pi/524288) q[28];
-cx q[46],q[28];
-u1(pi/524288) q[28];
-u1(pi/262144) q[46];
-cx q[46],q[29];
-u1(-pi/262144) q[29];
-cx q[46],q[29];
-u1(pi/262144) q[29];
-u1(pi/131072) q[46];
-cx q[46],q[30];
-u1(-pi/131072) q[30];
-cx q[46],q[30];
-u1(pi/131072) q[30];
-u1(pi/65536) q[46];
-cx q[46],q[31];
-u1(-pi/65536) q[31];
-cx q[46],q[31];
-u1(pi/65536) q[31];
-u1(pi/32768) q[46];
-cx q[46],q[32];
-u1(-pi/32768) q[32];
-cx q[46],q[32];
-u1(pi/32768) q[32];
-u1(pi/16384) q[46];
-cx q[46],q[33];
-u1(-pi/16384) q[33];
-cx q[46],q[33];
-u1(pi/16384) q[33];
-u1(pi/8192) q[46];
-cx q[46],q[34];
-u1(-pi/8192) q[34];
-cx q[46],q[34];
-u1(pi/8192) q[34];
-u1(pi/4096) q[46];
-cx q[46],q[35];
-u1(-pi/4096) q[35];
-cx q[46],q[35];
-u1(pi/4096) q[35];
-u1(pi/2048) q[46];
-cx q[46],q[36];
-u1(-pi/2048) q[36];
-cx q[46],q[36];
-u1(pi/2048) q[36];
-u1(pi/1024) q[46];
-cx q[46],q[37];
-u1(-pi/1024) q[37];
-cx q[46],q[37];
-u1(pi/1024) q[37];
-u1(pi/512) q[46];
-cx q[46],q[38];
-u1(-pi/512) q[38];
-cx q[46],q[38];
-u1(pi/512) q[38];
-u1(pi/256) q[46];
-cx q[46],q[39];
-u1(-pi/256) q[39];
-cx q[46],q[39];
-u1(pi/256) q[39];
-u1(pi/128) q[46];
-cx q[46],q[40];
-u1(-pi/128) q[40];
-cx q[46],q[40];
-u1(pi/128) q[40];
-u1(pi/64) q[46];
-cx q[46],q[41];
-u1(-pi/64) q[41];
-cx q[46],q[41];
-u1(pi/64) q[41];
-u1(pi/32) q[46];
-cx q[46],q[42];
-u1(-pi/32) q[42];
-cx q[46],q[42];
-u1(pi/32) q[42];
-u1(pi/16) q[46];
-cx q[46],q[43];
-u1(-pi/16) q[43];
-cx q[46],q[43];
-u1(pi/16) q[43];
-u1(pi/8) q[46];
-cx q[46],q[44];
-u1(-pi/8) q[44];
-cx q[46],q[44];
-u1(pi/8) q[44];
-u1(pi/4) q[46];
-cx q[46],q[45];
-u1(-pi/4) q[45];
-cx q[46],q[45];
-u1(pi/4) q[45];
-h q[46];
-u1(pi/281474976710656) q[47];
-cx q[47],q[0];
-u1(-pi/281474976710656) q[0];
-cx q[47],q[0];
-u1(pi/281474976710656) q[0];
-u1(pi/140737488355328) q[47];
-cx q[47],q[1];
-u1(-pi/140737488355328) q[1];
-cx q[47],q[1];
-u1(pi/140737488355328) q[1];
-u1(pi/70368744177664) q[47];
-cx q[47],q[2];
-u1(-pi/70368744177664) q[2];
-cx q[47],q[2];
-u1(pi/70368744177664) q[2];
-u1(pi/35184372088832) q[47];
-cx q[47],q[3];
-u1(-pi/35184372088832) q[3];
-cx q[47],q[3];
-u1(pi/35184372088832) q[3];
-u1(pi/17592186044416) q[47];
-cx q[47],q[4];
-u1(-pi/17592186044416) q[4];
-cx q[47],q[4];
-u1(pi/17592186044416) q[4];
-u1(pi/8796093022208) q[47];
-cx q[47],q[5];
-u1(-pi/8796093022208) q[5];
-cx q[47],q[5];
-u1(pi/8796093022208) q[5];
-u1(pi/4398046511104) q[47];
-cx q[47],q[6];
-u1(-pi/4398046511104) q[6];
-cx q[47],q[6];
-u1(pi/4398046511104) q[6];
-u1(pi/2199023255552) q[47];
-cx q[47],q[7];
-u1(-pi/2199023255552) q[7];
-cx q[47],q[7];
-u1(pi/2199023255552) q[7];
-u1(pi/1099511627776) q[47];
-cx q[47],q[8];
-u1(-pi/1099511627776) q[8];
-cx q[47],q[8];
-u1(pi/1099511627776) q[8];
-u1(pi/549755813888) q[47];
-cx q[47],q[9];
-u1(-pi/549755813888) q[9];
-cx q[47],q[9];
-u1(pi/549755813888) q[9];
-u1(pi/274877906944) q[47];
-cx q[47],q[10];
-u1(-pi/274877906944) q[10];
-cx q[47],q[10];
-u1(pi/274877906944) q[10];
-u1(pi/137438953472) q[47];
-cx q[47],q[11];
-u1(-pi/137438953472) q[11];
-cx q[47],q[11];
-u1(pi/137438953472) q[11];
-u1(pi/68719476736) q[47];
-cx q[47],q[12];
-u1(-pi/68719476736) q[12];
-cx q[47],q[12];
-u1(pi/68719476736) q[12];
-u1(pi/34359738368) q[47];
-cx q[47],q[13];
-u1(-pi/34359738368) q[13];
-cx q[47],q[13];
-u1(pi/34359738368) q[13];
-u1(pi/17179869184) q[47];
-cx q[47],q[14];
-u1(-pi/17179869184) q[14];
-cx q[47],q[14];
-u1(pi/17179869184) q[14];
-u1(pi/8589934592) q[47];
-cx q[47],q[15];
-u1(-pi/8589934592) q[15];
-cx q[47],q[15];
-u1(pi/8589934592) q[15];
-u1(pi/4294967296) q[47];
-cx q[47],q[16];
-u1(-pi/4294967296) q[16];
-cx q[47],q[16];
-u1(pi/4294967296) q[16];
-u1(pi/2147483648) q[47];
-cx q[47],q[17];
-u1(-pi/2147483648) q[17];
-cx q[47],q[17];
-u1(pi/2147483648) q[17];
-u1(pi/1073741824) q[47];
-cx q[47],q[18];
-u1(-pi/1073741824) q[18];
-cx q[47],q[18];
-u1(pi/1073741824) q[18];
-u1(pi/536870912) q[47];
-cx q[47],q[19];
-u1(-pi/536870912) q[19];
-cx q[47],q[19];
-u1(pi/536870912) q[19];
-u1(pi/268435456) q[47];
-cx q[47],q[20];
-u1(-pi/268435456) q[20];
-cx q[47],q[20];
-u1(pi/268435456) q[20];
-u1(pi/134217728) q[47];
-cx q[47],q[21];
-u1(-pi/134217728) q[21];
-cx q[47],q[21];
-u1(pi/134217728) q[21];
-u1(pi/67108864) q[47];
-cx q[47],q[22];
-u1(-pi/67108864) q[22];
-cx q[47],q[22];
-u1(pi/67108864) q[22];
-u1(pi/33554432) q[47];
-cx q[47],q[23];
-u1(-pi/33554432) q[23];
-cx q[47],q[23];
-u1(pi/33554432) q[23];
-u1(pi/16777216) q[47];
-cx q[47],q[24];
-u1(-pi/16777216) q[24];
-cx q[47],q[24];
-u1(pi/16777216) q[24];
-u1(pi/8388608) q[47];
-cx q[47],q[25];
-u1(-pi/8388608) q[25];
-cx q[47],q[25];
-u1(pi/8388608) q[25];
-u1(pi/4194304) q[47];
-cx q[47],q[26];
-u1(-pi/4194304) q[26];
-cx q[47],q[26];
-u1(pi/4194304) q[26];
-u1(pi/2097152) q[47];
-cx q[47],q[27];
-u1(-pi/2097152) q[27];
-cx q[47],q[27];
-u1(pi/2097152) q[27];
-u1(pi/1048576) q[47];
-cx q[47],q[28];
-u1(-pi/1048576) q[28];
-cx q[47],q[28];
-u1(pi/1048576) q[28];
-u1(pi/524288) q[47];
-cx q[47],q[29];
-u1(-pi/524288) q[29];
-cx q[47],q[29];
-u1(pi/524288) q[29];
-u1(pi/262144) q[47];
-cx q[47],q[30];
-u1(-pi/262144) q[30];
-cx q[47],q[30];
-u1(pi/262144) q[30];
-u1(pi/131072) q[47];
-cx q[47],q[31];
-u1(-pi/131072) q[31];
-cx q[47],q[31];
-u1(pi/131072) q[31];
-u1(pi/65536) q[47];
-cx q[47],q[32];
-u1(-pi/65536) q[32];
-cx q[47],q[32];
-u1(pi/65536) q[32];
-u1(pi/32768) q[47];
-cx q[47],q[33];
-u1(-pi/32768) q[33];
-cx q[47],q[33];
-u1(pi/32768) q[33];
-u1(pi/16384) q[47];
-cx q[47],q[34];
-u1(-pi/16384) q[34];
-cx q[47],q[34];
-u1(pi/16384) q[34];
-u1(pi/8192) q[47];
-cx q[47],q[35];
-u1(-pi/8192) q[35];
-cx q[47],q[35];
-u1(pi/8192) q[35];
-u1(pi/4096) q[47];
-cx q[47],q[36];
-u1(-pi/4096) q[36];
-cx q[47],q[36];
-u1(pi/4096) q[36];
-u1(pi/2048) q[47];
-cx q[47],q[37];
-u1(-pi/2048) q[37];
-cx q[47],q[37];
-u1(pi/2048) q[37];
-u1(pi/1024) q[47];
-cx q[47],q[38];
-u1(-pi/1024) q[38];
-cx q[47],q[38];
-u1(pi/1024) q[38];
-u1(pi/512) q[47];
-cx q[47],q[39];
-u1(-pi/512) q[39];
-cx q[47],q[39];
-u1(pi/512) q[39];
-u1(pi/256) q[47];
-cx q[47],q[40];
-u1(-pi/256) q[40];
-cx q[47],q[40];
-u1(pi/256) q[40];
-u1(pi/128) q[47];
-cx q[47],q[41];
-u1(-pi/128) q[41];
-cx q[47],q[41];
-u1(pi/128) q[41];
-u1(pi/64) q[47];
-cx q[47],q[42];
-u1(-pi/64) q[42];
-cx q[47],q[42];
-u1(pi/64) q[42];
-u1(pi/32) q[47];
-cx q[47],q[43];
-u1(-pi/32) q[43];
-cx q[47],q[43];
-u1(pi/32) q[43];
-u1(pi/16) q[47];
-cx q[47],q[44];
-u1(-pi/16) q[44];
-cx q[47],q[44];
-u1(pi/16) q[44];
-u1(pi/8) q[47];
-cx q[47],q[45];
-u1(-pi/8) q[45];
-cx q[47],q[45];
-u1(pi/8) q[45];
-u1(pi/4) q[47];
-cx q[47],q[46];
-u1(-pi/4) q[46];
-cx q[47],q[46];
-u1(pi/4) q[46];
-h q[47];
-u1(0) q[48];
-cx q[48],q[0];
-u1(0) q[0];
-cx q[48],q[0];
-u1(0) q[0];
-u1(pi/281474976710656) q[48];
-cx q[48],q[1];
-u1(-pi/281474976710656) q[1];
-cx q[48],q[1];
-u1(pi/281474976710656) q[1];
-u1(pi/140737488355328) q[48];
-cx q[48],q[2];
-u1(-pi/140737488355328) q[2];
-cx q[48],q[2];
-u1(pi/140737488355328) q[2];
-u1(pi/70368744177664) q[48];
-cx q[48],q[3];
-u1(-pi/70368744177664) q[3];
-cx q[48],q[3];
-u1(pi/70368744177664) q[3];
-u1(pi/35184372088832) q[48];
-cx q[48],q[4];
-u1(-pi/35184372088832) q[4];
-cx q[48],q[4];
-u1(pi/35184372088832) q[4];
-u1(pi/17592186044416) q[48];
-cx q[48],q[5];
-u1(-pi/17592186044416) q[5];
-cx q[48],q[5];
-u1(pi/17592186044416) q[5];
-u1(pi/8796093022208) q[48];
-cx q[48],q[6];
-u1(-pi/8796093022208) q[6];
-cx q[48],q[6];
-u1(pi/8796093022208) q[6];
-u1(pi/4398046511104) q[48];
-cx q[48],q[7];
-u1(-pi/4398046511104) q[7];
-cx q[48],q[7];
-u1(pi/4398046511104) q[7];
-u1(pi/2199023255552) q[48];
-cx q[48],q[8];
-u1(-pi/2199023255552) q[8];
-cx q[48],q[8];
-u1(pi/2199023255552) q[8];
-u1(pi/1099511627776) q[48];
-cx q[48],q[9];
-u1(-pi/1099511627776) q[9];
-cx q[48],q[9];
-u1(pi/1099511627776) q[9];
-u1(pi/549755813888) q[48];
-cx q[48],q[10];
-u1(-pi/549755813888) q[10];
-cx q[48],q[10];
-u1(pi/549755813888) q[10];
-u1(pi/274877906944) q[48];
-cx q[48],q[11];
-u1(-pi/274877906944) q[11];
-cx q[48],q[11];
-u1(pi/274877906944) q[11];
-u1(pi/137438953472) q[48];
-cx q[48],q[12];
-u1(-pi/137438953472) q[12];
-cx q[48],q[12];
-u1(pi/137438953472) q[12];
-u1(pi/68719476736) q[48];
-cx q[48],q[13];
-u1(-pi/68719476736) q[13];
-cx q[48],q[13];
-u1(pi/68719476736) q[13];
-u1(pi/34359738368) q[48];
-cx q[48],q[14];
-u1(-pi/34359738368) q[14];
-cx q[48],q[14];
-u1(pi/34359738368) q[14];
-u1(pi/17179869184) q[48];
-cx q[48],q[15];
-u1(-pi/17179869184) q[15];
-cx q[48],q[15];
-u1(pi/17179869184) q[15];
-u1(pi/8589934592) q[48];
-cx q[48],q[16];
-u1(-pi/8589934592) q[16];
-cx q[48],q[16];
-u1(pi/8589934592) q[16];
-u1(pi/4294967296) q[48];
-cx q[48],q[17];
-u1(-pi/4294967296) q[17];
-cx q[48],q[17];
-u1(pi/4294967296) q[17];
-u1(pi/2147483648) q[48];
-cx q[48],q[18];
-u1(-pi/2147483648) q[18];
-cx q[48],q[18];
-u1(pi/2147483648) q[18];
-u1(pi/1073741824) q[48];
-cx q[48],q[19];
-u1(-pi/1073741824) q[19];
-cx q[48],q[19];
-u1(pi/1073741824) q[19];
-u1(pi/536870912) q[48];
-cx q[48],q[20];
-u1(-pi/536870912) q[20];
-cx q[48],q[20];
-u1(pi/536870912) q[20];
-u1(pi/268435456) q[48];
-cx q[48],q[21];
-u1(-pi/268435456) q[21];
-cx q[48],q[21];
-u1(pi/268435456) q[21];
-u1(pi/134217728) q[48];
-cx q[48],q[22];
-u1(-pi/134217728) q[22];
-cx q[48],q[22];
-u1(pi/134217728) q[22];
-u1(pi/67108864) q[48];
-cx q[48],q[23];
-u1(-pi/67108864) q[23];
-cx q[48],q[23];
-u1(pi/67108864) q[23];
-u1(pi/33554432) q[48];
-cx q[48],q[24];
-u1(-pi/33554432) q[24];
-cx q[48],q[24];
-u1(pi/33554432) q[24];
-u1(pi/16777216) q[48];
-cx q[48],q[25];
-u1(-pi/16777216) q[25];
-cx q[48],q[25];
-u1(pi/16777216) q[25];
-u1(pi/8388608) q[48];
-cx q[48],q[26];
-u1(-pi/8388608) q[26];
-cx q[48],q[26];
-u1(pi/8388608) q[26];
-u1(pi/4194304) q[48];
-cx q[48],q[27];
-u1(-pi/4194304) q[27];
-cx q[48],q[27];
-u1(pi/4194304) q[27];
-u1(pi/2097152) q[48];
-cx q[48],q[28];
-u1(-pi/2097152) q[28];
-cx q[48],q[28];
-u1(pi/2097152) q[28];
-u1(pi/1048576) q[48];
-cx q[48],q[29];
-u1(-pi/1048576) q[29];
-cx q[48],q[29];
-u1(pi/1048576) q[29];
-u1(pi/524288) q[48];
-cx q[48],q[30];
-u1(-pi/524288) q[30];
-cx q[48],q[30];
-u1(pi/524288) q[30];
-u1(pi/262144) q[48];
-cx q[48],q[31];
-u1(-pi/262144) q[31];
-cx q[48],q[31];
-u1(pi/262144) q[31];
-u1(pi/131072) q[48];
-cx q[48],q[32];
-u1(-pi/131072) q[32];
-cx q[48],q[32];
-u1(pi/131072) q[32];
-u1(pi/65536) q[48];
-cx q[48],q[33];
-u1(-pi/65536) q[33];
-cx q[48],q[33];
-u1(pi/65536) q[33];
-u1(pi/32768) q[48];
-cx q[48],q[34];
-u1(-pi/32768) q[34];
-cx q[48],q[34];
-u1(pi/32768) q[34];
-u1(pi/16384) q[48];
-cx q[48],q[35];
-u1(-pi/16384) q[35];
-cx q[48],q[35];
-u1(pi/16384) q[35];
-u1(pi/8192) q[48];
-cx q[48],q[36];
-u1(-pi/8192) q[36];
-cx q[48],q[36];
-u1(pi/8192) q[36];
-u1(pi/4096) q[48];
-cx q[48],q[37];
-u1(-pi/4096) q[37];
-cx q[48],q[37];
-u1(pi/4096) q[37];
-u1(pi/2048) q[48];
-cx q[48],q[38];
-u1(-pi/2048) q[38];
-cx q[48],q[38];
-u1(pi/2048) q[38];
-u1(pi/1024) q[48];
-cx q[48],q[39];
-u1(-pi/1024) q[39];
-cx q[48],q[39];
-u1(pi/1024) q[39];
-u1(pi/512) q[48];
-cx q[48],q[40];
-u1(-pi/512) q[40];
-cx q[48],q[40];
-u1(pi/512) q[40];
-u1(pi/256) q[48];
-cx q[48],q[41];
-u1(-pi/256) q[41];
-cx q[48],q[41];
-u1(pi/256) q[41];
-u1(pi/128) q[48];
-cx q[48],q[42];
-u1(-pi/128) q[42];
-cx q[48],q[42];
-u1(pi/128) q[42];
-u1(pi/64) q[48];
-cx q[48],q[43];
-u1(-pi/64) q[43];
-cx q[48],q[43];
-u1(pi/64) q[43];
-u1(pi/32) q[48];
-cx q[48],q[44];
-u1(-pi/32) q[44];
-cx q[48],q[44];
-u1(pi/32) q[44];
-u1(pi/16) q[48];
-cx q[48],q[45];
-u1(-pi/16) q[45];
-cx q[48],q[45];
-u1(pi/16) q[45];
-u1(pi/8) q[48];
-cx q[48],q[46];
-u1(-pi/8) q[46];
-cx q[48],q[46];
-u1(pi/8) q[46];
-u1(pi/4) q[48];
-cx q[48],q[47];
-u1(-pi/4) q[47];
-cx q[48],q[47];
-u1(pi/4) q[47];
-h q[48];
-u1(0) q[49];
-cx q[49],q[0];
-u1(0) q[0];
-cx q[49],q[0];
-u1(0) q[0];
-u1(0) q[49];
-cx q[49],q[1];
-u1(0) q[1];
-cx q[49],q[1];
-u1(0) q[1];
-u1(pi/281474976710656) q[49];
-cx q[49],q[2];
-u1(-pi/281474976710656) q[2];
-cx q[49],q[2];
-u1(pi/281474976710656) q[2];
-u1(pi/140737488355328) q[49];
-cx q[49],q[3];
-u1(-pi/140737488355328) q[3];
-cx q[49],q[3];
-u1(pi/140737488355328) q[3];
-u1(pi/70368744177664) q[49];
-cx q[49],q[4];
-u1(-pi/70368744177664) q[4];
-cx q[49],q[4];
-u1(pi/70368744177664) q[4];
-u1(pi/35184372088832) q[49];
-cx q[49],q[5];
-u1(-pi/35184372088832) q[5];
-cx q[49],q[5];
-u1(pi/35184372088832) q[5];
-u1(pi/17592186044416) q[49];
-cx q[49],q[6];
-u1(-pi/17592186044416) q[6];
-cx q[49],q[6];
-u1(pi/17592186044416) q[6];
-u1(pi/8796093022208) q[49];
-cx q[49],q[7];
-u1(-pi/8796093022208) q[7];
-cx q[49],q[7];
-u1(pi/8796093022208) q[7];
-u1(pi/4398046511104) q[49];
-cx q[49],q[8];
-u1(-pi/4398046511104) q[8];
-cx q[49],q[8];
-u1(pi/4398046511104) q[8];
-u1(pi/2199023255552) q[49];
-cx q[49],q[9];
-u1(-pi/2199023255552) q[9];
-cx q[49],q[9];
-u1(pi/2199023255552) q[9];
-u1(pi/1099511627776) q[49];
-cx q[49],q[10];
-u1(-pi/1099511627776) q[10];
-cx q[49],q[10];
-u1(pi/1099511627776) q[10];
-u1(pi/549755813888) q[49];
-cx q[49],q[11];
-u1(-pi/549755813888) q[11];
-cx q[49],q[11];
-u1(pi/549755813888) q[11];
-u1(pi/274877906944) q[49];
-cx q[49],q[12];
-u1(-pi/274877906944) q[12];
-cx q[49],q[12];
-u1(pi/274877906944) q[12];
-u1(pi/137438953472) q[49];
-cx q[49],q[13];
-u1(-pi/137438953472) q[13];
-cx q[49],q[13];
-u1(pi/137438953472) q[13];
-u1(pi/68719476736) q[49];
-cx q[49],q[14];
-u1(-pi/68719476736) q[14];
-cx q[49],q[14];
-u1(pi/68719476736) q[14];
-u1(pi/34359738368) q[49];
-cx q[49],q[15];
-u1(-pi/34359738368) q[15];
-cx q[49],q[15];
-u1(pi/34359738368) q[15];
-u1(pi/17179869184) q[49];
-cx q[49],q[16];
-u1(-pi/17179869184) q[16];
-cx q[49],q[16];
-u1(pi/17179869184) q[16];
-u1(pi/8589934592) q[49];
-cx q[49],q[17];
-u1(-pi/8589934592) q[17];
-cx q[49],q[17];
-u1(pi/8589934592) q[17];
-u1(pi/4294967296) q[49];
-cx q[49],q[18];
-u1(-pi/4294967296) q[18];
-cx q[49],q[18];
-u1(pi/4294967296) q[18];
-u1(pi/2147483648) q[49];
-cx q[49],q[19];
-u1(-pi/2147483648) q[19];
-cx q[49],q[19];
-u1(pi/2147483648) q[19];
-u1(pi/1073741824) q[49];
-cx q[49],q[20];
-u1(-pi/1073741824) q[20];
-cx q[49],q[20];
-u1(pi/1073741824) q[20];
-u1(pi/536870912) q[49];
-cx q[49],q[21];
-u1(-pi/536870912) q[21];
-cx q[49],q[21];
-u1(pi/536870912) q[21];
-u1(pi/268435456) q[49];
-cx q[49],q[22];
-u1(-pi/268435456) q[22];
-cx q[49],q[22];
-u1(pi/268435456) q[22];
-u1(pi/134217728) q[49];
-cx q[49],q[23];
-u1(-pi/134217728) q[23];
-cx q[49],q[23];
-u1(pi/134217728) q[23];
-u1(pi/67108864) q[49];
-cx q[49],q[24];
-u1(-pi/67108864) q[24];
-cx q[49],q[24];
-u1(pi/67108864) q[24];
-u1(pi/33554432) q[49];
-cx q[49],q[25];
-u1(-pi/33554432) q[25];
-cx q[49],q[25];
-u1(pi/33554432) q[25];
-u1(pi/16777216) q[49];
-cx q[49],q[26];
-u1(-pi/16777216) q[26];
-cx q[49],q[26];
-u1(pi/16777216) q[26];
-u1(pi/8388608) q[49];
-cx q[49],q[27];
-u1(-pi/8388608) q[27];
-cx q[49],q[27];
-u1(pi/8388608) q[27];
-u1(pi/4194304) q[49];
-cx q[49],q[28];
-u1(-pi/4194304) q[28];
-cx q[49],q[28];
-u1(pi/4194304) q[28];
-u1(pi/2097152) q[49];
-cx q[49],q[29];
-u1(-pi/2097152) q[29];
-cx q[49],q[29];
-u1(pi/2097152) q[29];
-u1(pi/1048576) q[49];
-cx q[49],q[30];
-u1(-pi/1048576) q[30];
-cx q[49],q[30];
-u1(pi/1048576) q[30];
-u1(pi/524288) q[49];
-cx q[49],q[31];
-u1(-pi/524288) q[31];
-cx q[49],q[31];
-u1(pi/524288) q[31];
-u1(pi/262144) q[49];
-cx q[49],q[32];
-u1(-pi/262144) q[32];
-cx q[49],q[32];
-u1(pi/262144) q[32];
-u1(pi/131072) q[49];
-cx q[49],q[33];
-u1(-pi/131072) q[33];
-cx q[49],q[33];
-u1(pi/131072) q[33];
-u1(pi/65536) q[49];
-cx q[49],q[34];
-u1(-pi/65536) q[34];
-cx q[49],q[34];
-u1(pi/65536) q[34];
-u1(pi/32768) q[49];
-cx q[49],q[35];
-u1(-pi/32768) q[35];
-cx q[49],q[35];
-u1(pi/32768) q[35];
-u1(pi/16384) q[49];
-cx q[49],q[36];
-u1(-pi/16384) q[36];
-cx q[49],q[36];
-u1(pi/16384) q[36];
-u1(pi/8192) q[49];
-cx q[49],q[37];
-u1(-pi/8192) q[37];
-cx q[49],q[37];
-u1(pi/8192) q[37];
-u1(pi/4096) q[49];
-cx q[49],q[38];
-u1(-pi/4096) q[38];
-cx q[49],q[38];
-u1(pi/4096) q[38];
-u1(pi/2048) q[49];
-cx q[49],q[39];
-u1(-pi/2048) q[39];
-cx q[49],q[39];
-u1(pi/2048) q[39];
-u1(pi/1024) q[49];
-cx q[49],q[40];
-u1(-pi/1024) q[40];
-cx q[49],q[40];
-u1(pi/1024) q[40];
-u1(pi/512) q[49];
-cx q[49],q[41];
-u1(-pi/512) q[41];
-cx q[49],q[41];
-u1(pi/512) q[41];
-u1(pi/256) q[49];
-cx q[49],q[42];
-u1(-pi/256) q[42];
-cx q[49],q[42];
-u1(pi/256) q[42];
-u1(pi/128) q[49];
-cx q[49],q[43];
-u1(-pi/128) q[43];
-cx q[49],q[43];
-u1(pi/128) q[43];
-u1(pi/64) q[49];
-cx q[49],q[44];
-u1(-pi/64) q[44];
-cx q[49],q[44];
-u1(pi/64) q[44];
-u1(pi/32) q[49];
-cx q[49],q[45];
-u1(-pi/32) q[45];
-cx q[49],q[45];
-u1(pi/32) q[45];
-u1(pi/16) q[49];
-cx q[49],q[46];
-u1(-pi/16) q[46];
-cx q[49],q[46];
-u1(pi/16) q[46];
-u1(pi/8) q[49];
-cx q[49],q[47];
-u1(-pi/8) q[47];
-cx q[49],q[47];
-u1(pi/8) q[47];
-u1(pi/4) q[49];
-cx q[49],q[48];
-u1(-pi/4) q[48];
-cx q[49],q[48];
-u1(pi/4) q[48];
-h q[49];
-u1(0) q[50];
-cx q[50],q[0];
-u1(0) q[0];
-cx q[50],q[0];
-u1(0) q[0];
-u1(0) q[50];
-cx q[50],q[1];
-u1(0) q[1];
-cx q[50],q[1];
-u1(0) q[1];
-u1(0) q[50];
-cx q[50],q[2];
-u1(0) q[2];
-cx q[50],q[2];
-u1(0) q[2];
-u1(pi/281474976710656) q[50];
-cx q[50],q[3];
-u1(-pi/281474976710656) q[3];
-cx q[50],q[3];
-u1(pi/281474976710656) q[3];
-u1(pi/140737488355328) q[50];
-cx q[50],q[4];
-u1(-pi/140737488355328) q[4];
-cx q[50],q[4];
-u1(pi/140737488355328) q[4];
-u1(pi/70368744177664) q[50];
-cx q[50],q[5];
-u1(-pi/70368744177664) q[5];
-cx q[50],q[5];
-u1(pi/70368744177664) q[5];
-u1(pi/35184372088832) q[50];
-cx q[50],q[6];
-u1(-pi/35184372088832) q[6];
-cx q[50],q[6];
-u1(pi/35184372088832) q[6];
-u1(pi/17592186044416) q[50];
-cx q[50],q[7];
-u1(-pi/17592186044416) q[7];
-cx q[50],q[7];
-u1(pi/17592186044416) q[7];
-u1(pi/8796093022208) q[50];
-cx q[50],q[8];
-u1(-pi/8796093022208) q[8];
-cx q[50],q[8];
-u1(pi/8796093022208) q[8];
-u1(pi/4398046511104) q[50];
-cx q[50],q[9];
-u1(-pi/4398046511104) q[9];
-cx q[50],q[9];
-u1(pi/4398046511104) q[9];
-u1(pi/2199023255552) q[50];
-cx q[50],q[10];
-u1(-pi/2199023255552) q[10];
-cx q[50],q[10];
-u1(pi/2199023255552) q[10];
-u1(pi/1099511627776) q[50];
-cx q[50],q[11];
-u1(-pi/1099511627776) q[11];
-cx q[50],q[11];
-u1(pi/1099511627776) q[11];
-u1(pi/549755813888) q[50];
-cx q[50],q[12];
-u1(-pi/549755813888) q[12];
-cx q[50],q[12];
-u1(pi/549755813888) q[12];
-u1(pi/274877906944) q[50];
-cx q[50],q[13];
-u1(-pi/274877906944) q[13];
-cx q[50],q[13];
-u1(pi/274877906944) q[13];
-u1(pi/137438953472) q[50];
-cx q[50],q[14];
-u1(-pi/137438953472) q[14];
-cx q[50],q[14];
-u1(pi/137438953472) q[14];
-u1(pi/68719476736) q[50];
-cx q[50],q[15];
-u1(-pi/68719476736) q[15];
-cx q[50],q[15];
-u1(pi/68719476736) q[15];
-u1(pi/34359738368) q[50];
-cx q[50],q[16];
-u1(-pi/34359738368) q[16];
-cx q[50],q[16];
-u1(pi/34359738368) q[16];
-u1(pi/17179869184) q[50];
-cx q[50],q[17];
-u1(-pi/17179869184) q[17];
-cx q[50],q[17];
-u1(pi/17179869184) q[17];
-u1(pi/8589934592) q[50];
-cx q[50],q[18];
-u1(-pi/8589934592) q[18];
-cx q[50],q[18];
-u1(pi/8589934592) q[18];
-u1(pi/4294967296) q[50];
-cx q[50],q[19];
-u1(-pi/4294967296) q[19];
-cx q[50],q[19];
-u1(pi/4294967296) q[19];
-u1(pi/2147483648) q[50];
-cx q[50],q[20];
-u1(-pi/2147483648) q[20];
-cx q[50],q[20];
-u1(pi/2147483648) q[20];
-u1(pi/1073741824) q[50];
-cx q[50],q[21];
-u1(-pi/1073741824) q[21];
-cx q[50],q[21];
-u1(pi/1073741824) q[21];
-u1(pi/536870912) q[50];
-cx q[50],q[22];
-u1(-pi/536870912) q[22];
-cx q[50],q[22];
-u1(pi/536870912) q[22];
-u1(pi/268435456) q[50];
-cx q[50],q[23];
-u1(-pi/268435456) q[23];
-cx q[50],q[23];
-u1(pi/268435456) q[23];
-u1(pi/134217728) q[50];
-cx q[50],q[24];
-u1(-pi/134217728) q[24];
-cx q[50],q[24];
-u1(pi/134217728) q[24];
-u1(pi/67108864) q[50];
-cx q[50],q[25];
-u1(-pi/67108864) q[25];
-cx q[50],q[25];
-u1(pi/67108864) q[25];
-u1(pi/33554432) q[50];
-cx q[50],q[26];
-u1(-pi/33554432) q[26];
-cx q[50],q[26];
-u1(pi/33554432) q[26];
-u1(pi/16777216) q[50];
-cx q[50],q[27];
-u1(-pi/16777216) q[27];
-cx q[50],q[27];
-u1(pi/16777216) q[27];
-u1(pi/8388608) q[50];
-cx q[50],q[28];
-u1(-pi/8388608) q[28];
-cx q[50],q[28];
-u1(pi/8388608) q[28];
-u1(pi/4194304) q[50];
-cx q[50],q[29];
-u1(-pi/4194304) q[29];
-cx q[50],q[29];
-u1(pi/4194304) q[29];
-u1(pi/2097152) q[50];
-cx q[50],q[30];
-u1(-pi/2097152) q[30];
-cx q[50],q[30];
-u1(pi/2097152) q[30];
-u1(pi/1048576) q[50];
-cx q[50],q[31];
-u1(-pi/1048576) q[31];
-cx q[50],q[31];
-u1(pi/1048576) q[31];
-u1(pi/524288) q[50];
-cx q[50],q[32];
-u1(-pi/524288) q[32];
-cx q[50],q[32];
-u1(pi/524288) q[32];
-u1(pi/262144) q[50];
-cx q[50],q[33];
-u1(-pi/262144) q[33];
-cx q[50],q[33];
-u1(pi/262144) q[33];
-u1(pi/131072) q[50];
-cx q[50],q[34];
-u1(-pi/131072) q[34];
-cx q[50],q[34];
-u1(pi/131072) q[34];
-u1(pi/65536) q[50];
-cx q[50],q[35];
-u1(-pi/65536) q[35];
-cx q[50],q[35];
-u1(pi/65536) q[35];
-u1(pi/32768) q[50];
-cx q[50],q[36];
-u1(-pi/32768) q[36];
-cx q[50],q[36];
-u1(pi/32768) q[36];
-u1(pi/16384) q[50];
-cx q[50],q[37];
-u1(-pi/16384) q[37];
-cx q[50],q[37];
-u1(pi/16384) q[37];
-u1(pi/8192) q[50];
-cx q[50],q[38];
-u1(-pi/8192) q[38];
-cx q[50],q[38];
-u1(pi/8192) q[38];
-u1(pi/4096) q[50];
-cx q[50],q[39];
-u1(-pi/4096) q[39];
-cx q[50],q[39];
-u1(pi/4096) q[39];
-u1(pi/2048) q[50];
-cx q[50],q[40];
-u1(-pi/2048) q[40];
-cx q[50],q[40];
-u1(pi/2048) q[40];
-u1(pi/1024) q[50];
-cx q[50],q[41];
-u1(-pi/1024) q[41];
-cx q[50],q[41];
-u1(pi/1024) q[41];
-u1(pi/512) q[50];
-cx q[50],q[42];
-u1(-pi/512) q[42];
-cx q[50],q[42];
-u1(pi/512) q[42];
-u1(pi/256) q[50];
-cx q[50],q[43];
-u1(-pi/256) q[43];
-cx q[50],q[43];
-u1(pi/256) q[43];
-u1(pi/128) q[50];
-cx q[50],q[44];
-u1(-pi/128) q[44];
-cx q[50],q[44];
-u1(pi/128) q[44];
-u1(pi/64) q[50];
-cx q[50],q[45];
-u1(-pi/64) q[45];
-cx q[50],q[45];
-u1(pi/64) q[45];
-u1(pi/32) q[50];
-cx q[50],q[46];
-u1(-pi/32) q[46];
-cx q[50],q[46];
-u1(pi/32) q[46];
-u1(pi/16) q[50];
-cx q[50],q[47];
-u1(-pi/16) q[47];
-cx q[50],q[47];
-u1(pi/16) q[47];
-u1(pi/8) q[50];
-cx q[50],q[48];
-u1(-pi/8) q[48];
-cx q[50],q[48];
-u1(pi/8) q[48];
-u1(pi/4) q[50];
-cx q[50],q[49];
-u1(-pi/4) q[49];
-cx q[50],q[49];
-u1(pi/4) q[49];
-h q[50];
-u1(0) q[51];
-cx q[51],q[0];
-u1(0) q[0];
-cx q[51],q[0];
-u1(0) q[0];
-u1(0) q[51];
-cx q[51],q[1];
-u1(0) q[1];
-cx q[51],q[1];
-u1(0) q[1];
-u1(0) q[51];
-cx q[51],q[2];
-u1(0) q[2];
-cx q[51],q[2];
-u1(0) q[2];
-u1(0) q[51];
-cx q[51],q[3];
-u1(0) q[3];
-cx q[51],q[3];
-u1(0) q[3];
-u1(pi/281474976710656) q[51];
-cx q[51],q[4];
-u1(-pi/281474976710656) q[4];
-cx q[51],q[4];
-u1(pi/281474976710656) q[4];
-u1(pi/140737488355328) q[51];
-cx q[51],q[5];
-u1(-pi/140737488355328) q[5];
-cx q[51],q[5];
-u1(pi/140737488355328) q[5];
-u1(pi/70368744177664) q[51];
-cx q[51],q[6];
-u1(-pi/70368744177664) q[6];
-cx q[51],q[6];
-u1(pi/70368744177664) q[6];
-u1(pi/35184372088832) q[51];
-cx q[51],q[7];
-u1(-pi/35184372088832) q[7];
-cx q[51],q[7];
-u1(pi/35184372088832) q[7];
-u1(pi/17592186044416) q[51];
-cx q[51],q[8];
-u1(-pi/17592186044416) q[8];
-cx q[51],q[8];
-u1(pi/17592186044416) q[8];
-u1(pi/8796093022208) q[51];
-cx q[51],q[9];
-u1(-pi/8796093022208) q[9];
-cx q[51],q[9];
-u1(pi/8796093022208) q[9];
-u1(pi/4398046511104) q[51];
-cx q[51],q[10];
-u1(-pi/4398046511104) q[10];
-cx q[51],q[10];
-u1(pi/4398046511104) q[10];
-u1(pi/2199023255552) q[51];
-cx q[51],q[11];
-u1(-pi/2199023255552) q[11];
-cx q[51],q[11];
-u1(pi/2199023255552) q[11];
-u1(pi/1099511627776) q[51];
-cx q[51],q[12];
-u1(-pi/1099511627776) q[12];
-cx q[51],q[12];
-u1(pi/1099511627776) q[12];
-u1(pi/549755813888) q[51];
-cx q[51],q[13];
-u1(-pi/549755813888) q[13];
-cx q[51],q[13];
-u1(pi/549755813888) q[13];
-u1(pi/274877906944) q[51];
-cx q[51],q[14];
-u1(-pi/274877906944) q[14];
-cx q[51],q[14];
-u1(pi/274877906944) q[14];
-u1(pi/137438953472) q[51];
-cx q[51],q[15];
-u1(-pi/137438953472) q[15];
-cx q[51],q[15];
-u1(pi/137438953472) q[15];
-u1(pi/68719476736) q[51];
-cx q[51],q[16];
-u1(-pi/68719476736) q[16];
-cx q[51],q[16];
-u1(pi/68719476736) q[16];
-u1(pi/34359738368) q[51];
-cx q[51],q[17];
-u1(-pi/34359738368) q[17];
-cx q[51],q[17];
-u1(pi/34359738368) q[17];
-u1(pi/17179869184) q[51];
-cx q[51],q[18];
-u1(-pi/17179869184) q[18];
-cx q[51],q[18];
-u1(pi/17179869184) q[18];
-u1(pi/8589934592) q[51];
-cx q[51],q[19];
-u1(-pi/8589934592) q[19];
-cx q[51],q[19];
-u1(pi/8589934592) q[19];
-u1(pi/4294967296) q[51];
-cx q[51],q[20];
-u1(-pi/4294967296) q[20];
-cx q[51],q[20];
-u1(pi/4294967296) q[20];
-u1(pi/2147483648) q[51];
-cx q[51],q[21];
-u1(-pi/2147483648) q[21];
-cx q[51],q[21];
-u1(pi/2147483648) q[21];
-u1(pi/1073741824) q[51];
-cx q[51],q[22];
-u1(-pi/1073741824) q[22];
-cx q[51],q[22];
-u1(pi/1073741824) q[22];
-u1(pi/536870912) q[51];
-cx q[51],q[23];
-u1(-pi/536870912) q[23];
-cx q[51],q[23];
-u1(pi/536870912) q[23];
-u1(pi/268435456) q[51];
-cx q[51],q[24];
-u1(-pi/268435456) q[24];
-cx q[51],q[24];
-u1(pi/268435456) q[24];
-u1(pi/134217728) q[51];
-cx q[51],q[25];
-u1(-pi/134217728) q[25];
-cx q[51],q[25];
-u1(pi/134217728) q[25];
-u1(pi/67108864) q[51];
-cx q[51],q[26];
-u1(-pi/67108864) q[26];
-cx q[51],q[26];
-u1(pi/67108864) q[26];
-u1(pi/33554432) q[51];
-cx q[51],q[27];
-u1(-pi/33554432) q[27];
-cx q[51],q[27];
-u1(pi/33554432) q[27];
-u1(pi/16777216) q[51];
-cx q[51],q[28];
-u1(-pi/16777216) q[28];
-cx q[51],q[28];
-u1(pi/16777216) q[28];
-u1(pi/8388608) q[51];
-cx q[51],q[29];
-u1(-pi/8388608) q[29];
-cx q[51],q[29];
-u1(pi/8388608) q[29];
-u1(pi/4194304) q[51];
-cx q[51],q[30];
-u1(-pi/4194304) q[30];
-cx q[51],q[30];
-u1(pi/4194304) q[30];
-u1(pi/2097152) q[51];
-cx q[51],q[31];
-u1(-pi/2097152) q[31];
-cx q[51],q[31];
-u1(pi/2097152) q[31];
-u1(pi/1048576) q[51];
-cx q[51],q[32];
-u1(-pi/1048576) q[32];
-cx q[51],q[32];
-u1(pi/1048576) q[32];
-u1(pi/524288) q[51];
-cx q[51],q[33];
-u1(-pi/524288) q[33];
-cx q[51],q[33];
-u1(pi/524288) q[33];
-u1(pi/262144) q[51];
-cx q[51],q[34];
-u1(-pi/262144) q[34];
-cx q[51],q[34];
-u1(pi/262144) q[34];
-u1(pi/131072) q[51];
-cx q[51],q[35];
-u1(-pi/131072) q[35];
-cx q[51],q[35];
-u1(pi/131072) q[35];
-u1(pi/65536) q[51];
-cx q[51],q[36];
-u1(-pi/65536) q[36];
-cx q[51],q[36];
-u1(pi/65536) q[36];
-u1(pi/32768) q[51];
-cx q[51],q[37];
-u1(-pi/32768) q[37];
-cx q[51],q[37];
-u1(pi/32768) q[37];
-u1(pi/16384) q[51];
-cx q[51],q[38];
-u1(-pi/16384) q[38];
-cx q[51],q[38];
-u1(pi/16384) q[38];
-u1(pi/8192) q[51];
-cx q[51],q[39];
-u1(-pi/8192) q[39];
-cx q[51],q[39];
-u1(pi/8192) q[39];
-u1(pi/4096) q[51];
-cx q[51],q[40];
-u1(-pi/4096) q[40];
-cx q[51],q[40];
-u1(pi/4096) q[40];
-u1(pi/2048) q[51];
-cx q[51],q[41];
-u1(-pi/2048) q[41];
-cx q[51],q[41];
-u1(pi/2048) q[41];
-u1(pi/1024) q[51];
-cx q[51],q[42];
-u1(-pi/1024) q[42];
-cx q[51],q[42];
-u1(pi/1024) q[42];
-u1(pi/512) q[51];
-cx q[51],q[43];
-u1(-pi/512) q[43];
-cx q[51],q[43];
-u1(pi/512) q[43];
-u1(pi/256) q[51];
-cx q[51],q[44];
-u1(-pi/256) q[44];
-cx q[51],q[44];
-u1(pi/256) q[44];
-u1(pi/128) q[51];
-cx q[51],q[45];
-u1(-pi/128) q[45];
-cx q[51],q[45];
-u1(pi/128) q[45];
-u1(pi/64) q[51];
-cx q[51],q[46];
-u1(-pi/64) q[46];
-cx q[51],q[46];
-u1(pi/64) q[46];
-u1(pi/32) q[51];
-cx q[51],q[47];
-u1(-pi/32) q[47];
-cx q[51],q[47];
-u1(pi/32) q[47];
-u1(pi/16) q[51];
-cx q[51],q[48];
-u1(-pi/16) q[48];
-cx q[51],q[48];
-u1(pi/16) q[48];
-u1(pi/8) q[51];
-cx q[51],q[49];
-u1(-pi/8) q[49];
-cx q[51],q[49];
-u1(pi/8) q[49];
-u1(pi/4) q[51];
-cx q[51],q[50];
-u1(-pi/4) q[50];
-cx q[51],q[50];
-u1(pi/4) q[50];
-h q[51];
-u1(0) q[52];
-cx q[52],q[0];
-u1(0) q[0];
-cx q[52],q[0];
-u1(0) q[0];
-u1(0) q[52];
-cx q[52],q[1];
-u1(0) q[1];
-cx q[52],q[1];
-u1(0) q[1];
-u1(0) q[52];
-cx q[52],q[2];
-u1(0) q[2];
-cx q[52],q[2];
-u1(0) q[2];
-u1(0) q[52];
-cx q[52],q[3];
-u1(0) q[3];
-cx q[52],q[3];
-u1(0) q[3];
-u1(0) q[52];
-cx q[52],q[4];
-u1(0) q[4];
-cx q[52],q[4];
-u1(0) q[4];
-u1(pi/281474976710656) q[52];
-cx q[52],q[5];
-u1(-pi/281474976710656) q[5];
-cx q[52],q[5];
-u1(pi/281474976710656) q[5];
-u1(pi/140737488355328) q[52];
-cx q[52],q[6];
-u1(-pi/140737488355328) q[6];
-cx q[52],q[6];
-u1(pi/140737488355328) q[6];
-u1(pi/70368744177664) q[52];
-cx q[52],q[7];
-u1(-pi/70368744177664) q[7];
-cx q[52],q[7];
-u1(pi/70368744177664) q[7];
-u1(pi/35184372088832) q[52];
-cx q[52],q[8];
-u1(-pi/35184372088832) q[8];
-cx q[52],q[8];
-u1(pi/35184372088832) q[8];
-u1(pi/17592186044416) q[52];
-cx q[52],q[9];
-u1(-pi/17592186044416) q[9];
-cx q[52],q[9];
-u1(pi/17592186044416) q[9];
-u1(pi/8796093022208) q[52];
-cx q[52],q[10];
-u1(-pi/8796093022208) q[10];
-cx q[52],q[10];
-u1(pi/8796093022208) q[10];
-u1(pi/4398046511104) q[52];
-cx q[52],q[11];
-u1(-pi/4398046511104) q[11];
-cx q[52],q[11];
-u1(pi/4398046511104) q[11];
-u1(pi/2199023255552) q[52];
-cx q[52],q[12];
-u1(-pi/2199023255552) q[12];
-cx q[52],q[12];
-u1(pi/2199023255552) q[12];
-u1(pi/1099511627776) q[52];
-cx q[52],q[13];
-u1(-pi/1099511627776) q[13];
-cx q[52],q[13];
-u1(pi/1099511627776) q[13];
-u1(pi/549755813888) q[52];
-cx q[52],q[14];
-u1(-pi/549755813888) q[14];
-cx q[52],q[14];
-u1(pi/549755813888) q[14];
-u1(pi/274877906944) q[52];
-cx q[52],q[15];
-u1(-pi/274877906944) q[15];
-cx q[52],q[15];
-u1(pi/274877906944) q[15];
-u1(pi/137438953472) q[52];
-cx q[52],q[16];
-u1(-pi/137438953472) q[16];
-cx q[52],q[16];
-u1(pi/137438953472) q[16];
-u1(pi/68719476736) q[52];
-cx q[52],q[17];
-u1(-pi/68719476736) q[17];
-cx q[52],q[17];
-u1(pi/68719476736) q[17];
-u1(pi/34359738368) q[52];
-cx q[52],q[18];
-u1(-pi/34359738368) q[18];
-cx q[52],q[18];
-u1(pi/34359738368) q[18];
-u1(pi/17179869184) q[52];
-cx q[52],q[19];
-u1(-pi/17179869184) q[19];
-cx q[52],q[19];
-u1(pi/17179869184) q[19];
-u1(pi/8589934592) q[52];
-cx q[52],q[20];
-u1(-pi/8589934592) q[20];
-cx q[52],q[20];
-u1(pi/8589934592) q[20];
-u1(pi/4294967296) q[52];
-cx q[52],q[21];
-u1(-pi/4294967296) q[21];
-cx q[52],q[21];
-u1(pi/4294967296) q[21];
-u1(pi/2147483648) q[52];
-cx q[52],q[22];
-u1(-pi/2147483648) q[22];
-cx q[52],q[22];
-u1(pi/2147483648) q[22];
-u1(pi/1073741824) q[52];
-cx q[52],q[23];
-u1(-pi/1073741824) q[23];
-cx q[52],q[23];
-u1(pi/1073741824) q[23];
-u1(pi/536870912) q[52];
-cx q[52],q[24];
-u1(-pi/536870912) q[24];
-cx q[52],q[24];
-u1(pi/536870912) q[24];
-u1(pi/268435456) q[52];
-cx q[52],q[25];
-u1(-pi/268435456) q[25];
-cx q[52],q[25];
-u1(pi/268435456) q[25];
-u1(pi/134217728) q[52];
-cx q[52],q[26];
-u1(-pi/134217728) q[26];
-cx q[52],q[26];
-u1(pi/134217728) q[26];
-u1(pi/67108864) q[52];
-cx q[52],q[27];
-u1(-pi/67108864) q[27];
-cx q[52],q[27];
-u1(pi/67108864) q[27];
-u1(pi/33554432) q[52];
-cx q[52],q[28];
-u1(-pi/33554432) q[28];
-cx q[52],q[28];
-u1(pi/33554432) q[28];
-u1(pi/16777216) q[52];
-cx q[52],q[29];
-u1(-pi/16777216) q[29];
-cx q[52],q[29];
-u1(pi/16777216) q[29];
-u1(pi/8388608) q[52];
-cx q[52],q[30];
-u1(-pi/8388608) q[30];
-cx q[52],q[30];
-u1(pi/8388608) q[30];
-u1(pi/4194304) q[52];
-cx q[52],q[31];
-u1(-pi/4194304) q[31];
-cx q[52],q[31];
-u1(pi/4194304) q[31];
-u1(pi/2097152) q[52];
-cx q[52],q[32];
-u1(-pi/2097152) q[32];
-cx q[52],q[32];
-u1(pi/2097152) q[32];
-u1(pi/1048576) q[52];
-cx q[52],q[33];
-u1(-pi/1048576) q[33];
-cx q[52],q[33];
-u1(pi/1048576) q[33];
-u1(pi/524288) q[52];
-cx q[52],q[34];
-u1(-pi/524288) q[34];
-cx q[52],q[34];
-u1(pi/524288) q[34];
-u1(pi/262144) q[52];
-cx q[52],q[35];
-u1(-pi/262144) q[35];
-cx q[52],q[35];
-u1(pi/262144) q[35];
-u1(pi/131072) q[52];
-cx q[52],q[36];
-u1(-pi/131072) q[36];
-cx q[52],q[36];
-u1(pi/131072) q[36];
-u1(pi/65536) q[52];
-cx q[52],q[37];
-u1(-pi/65536) q[37];
-cx q[52],q[37];
-u1(pi/65536) q[37];
-u1(pi/32768) q[52];
-cx q[52],q[38];
-u1(-pi/32768) q[38];
-cx q[52],q[38];
-u1(pi/32768) q[38];
-u1(pi/16384) q[52];
-cx q[52],q[39];
-u1(-pi/16384) q[39];
-cx q[52],q[39];
-u1(pi/16384) q[39];
-u1(pi/8192) q[52];
-cx q[52],q[40];
-u1(-pi/8192) q[40];
-cx q[52],q[40];
-u1(pi/8192) q[40];
-u1(pi/4096) q[52];
-cx q[52],q[41];
-u1(-pi/4096) q[41];
-cx q[52],q[41];
-u1(pi/4096) q[41];
-u1(pi/2048) q[52];
-cx q[52],q[42];
-u1(-pi/2048) q[42];
-cx q[52],q[42];
-u1(pi/2048) q[42];
-u1(pi/1024) q[52];
-cx q[52],q[43];
-u1(-pi/1024) q[43];
-cx q[52],q[43];
-u1(pi/1024) q[43];
-u1(pi/512) q[52];
-cx q[52],q[44];
-u1(-pi/512) q[44];
-cx q[52],q[44];
-u1(pi/512) q[44];
-u1(pi/256) q[52];
-cx q[52],q[45];
-u1(-pi/256) q[45];
-cx q[52],q[45];
-u1(pi/256) q[45];
-u1(pi/128) q[52];
-cx q[52],q[46];
-u1(-pi/128) q[46];
-cx q[52],q[46];
-u1(pi/128) q[46];
-u1(pi/64) q[52];
-cx q[52],q[47];
-u1(-pi/64) q[47];
-cx q[52],q[47];
-u1(pi/64) q[47];
-u1(pi/32) q[52];
-cx q[52],q[48];
-u1(-pi/32) q[48];
-cx q[52],q[48];
-u1(pi/32) q[48];
-u1(pi/16) q[52];
-cx q[52],q[49];
-u1(-pi/16) q[49];
-cx q[52],q[49];
-u1(pi/16) q[49];
-u1(pi/8) q[52];
-cx q[52],q[50];
-u1(-pi/8) q[50];
-cx q[52],q[50];
-u1(pi/8) q[50];
-u1(pi/4) q[52];
-cx q[52],q[51];
-u1(-pi/4) q[51];
-cx q[52],q[51];
-u1(pi/4) q[51];
-h q[52];
-u1(0) q[53];
-cx q[53],q[0];
-u1(0) q[0];
-cx q[53],q[0];
-u1(0) q[0];
-u1(0) q[53];
-cx q[53],q[1];
-u1(0) q[1];
-cx q[53],q[1];
-u1(0) q[1];
-u1(0) q[53];
-cx q[53],q[2];
-u1(0) q[2];
-cx q[53],q[2];
-u1(0) q[2];
-u1(0) q[53];
-cx q[53],q[3];
-u1(0) q[3];
-cx q[53],q[3];
-u1(0) q[3];
-u1(0) q[53];
-cx q[53],q[4];
-u1(0) q[4];
-cx q[53],q[4];
-u1(0) q[4];
-u1(0) q[53];
-cx q[53],q[5];
-u1(0) q[5];
-cx q[53],q[5];
-u1(0) q[5];
-u1(pi/281474976710656) q[53];
-cx q[53],q[6];
-u1(-pi/281474976710656) q[6];
-cx q[53],q[6];
-u1(pi/281474976710656) q[6];
-u1(pi/140737488355328) q[53];
-cx q[53],q[7];
-u1(-pi/140737488355328) q[7];
-cx q[53],q[7];
-u1(pi/140737488355328) q[7];
-u1(pi/70368744177664) q[53];
-cx q[53],q[8];
-u1(-pi/70368744177664) q[8];
-cx q[53],q[8];
-u1(pi/70368744177664) q[8];
-u1(pi/35184372088832) q[53];
-cx q[53],q[9];
-u1(-pi/35184372088832) q[9];
-cx q[53],q[9];
-u1(pi/35184372088832) q[9];
-u1(pi/17592186044416) q[53];
-cx q[53],q[10];
-u1(-pi/17592186044416) q[10];
-cx q[53],q[10];
-u1(pi/17592186044416) q[10];
-u1(pi/8796093022208) q[53];
-cx q[53],q[11];
-u1(-pi/8796093022208) q[11];
-cx q[53],q[11];
-u1(pi/8796093022208) q[11];
-u1(pi/4398046511104) q[53];
-cx q[53],q[12];
-u1(-pi/4398046511104) q[12];
-cx q[53],q[12];
-u1(pi/4398046511104) q[12];
-u1(pi/2199023255552) q[53];
-cx q[53],q[13];
-u1(-pi/2199023255552) q[13];
-cx q[53],q[13];
-u1(pi/2199023255552) q[13];
-u1(pi/1099511627776) q[53];
-cx q[53],q[14];
-u1(-pi/1099511627776) q[14];
-cx q[53],q[14];
-u1(pi/1099511627776) q[14];
-u1(pi/549755813888) q[53];
-cx q[53],q[15];
-u1(-pi/549755813888) q[15];
-cx q[53],q[15];
-u1(pi/549755813888) q[15];
-u1(pi/274877906944) q[53];
-cx q[53],q[16];
-u1(-pi/274877906944) q[16];
-cx q[53],q[16];
-u1(pi/274877906944) q[16];
-u1(pi/137438953472) q[53];
-cx q[53],q[17];
-u1(-pi/137438953472) q[17];
-cx q[53],q[17];
-u1(pi/137438953472) q[17];
-u1(pi/68719476736) q[53];
-cx q[53],q[18];
-u1(-pi/68719476736) q[18];
-cx q[53],q[18];
-u1(pi/68719476736) q[18];
-u1(pi/34359738368) q[53];
-cx q[53],q[19];
-u1(-pi/34359738368) q[19];
-cx q[53],q[19];
-u1(pi/34359738368) q[19];
-u1(pi/17179869184) q[53];
-cx q[53],q[20];
-u1(-pi/17179869184) q[20];
-cx q[53],q[20];
-u1(pi/17179869184) q[20];
-u1(pi/8589934592) q[53];
-cx q[53],q[21];
-u1(-pi/8589934592) q[21];
-cx q[53],q[21];
-u1(pi/8589934592) q[21];
-u1(pi/4294967296) q[53];
-cx q[53],q[22];
-u1(-pi/4294967296) q[22];
-cx q[53],q[22];
-u1(pi/4294967296) q[22];
-u1(pi/2147483648) q[53];
-cx q[53],q[23];
-u1(-pi/2147483648) q[23];
-cx q[53],q[23];
-u1(pi/2147483648) q[23];
-u1(pi/1073741824) q[53];
-cx q[53],q[24];
-u1(-pi/1073741824) q[24];
-cx q[53],q[24];
-u1(pi/1073741824) q[24];
-u1(pi/536870912) q[53];
-cx q[53],q[25];
-u1(-pi/536870912) q[25];
-cx q[53],q[25];
-u1(pi/536870912) q[25];
-u1(pi/268435456) q[53];
-cx q[53],q[26];
-u1(-pi/268435456) q[26];
-cx q[53],q[26];
-u1(pi/268435456) q[26];
-u1(pi/134217728) q[53];
-cx q[53],q[27];
-u1(-pi/134217728) q[27];
-cx q[53],q[27];
-u1(pi/134217728) q[27];
-u1(pi/67108864) q[53];
-cx q[53],q[28];
-u1(-pi/67108864) q[28];
-cx q[53],q[28];
-u1(pi/67108864) q[28];
-u1(pi/33554432) q[53];
-cx q[53],q[29];
-u1(-pi/33554432) q[29];
-cx q[53],q[29];
-u1(pi/33554432) q[29];
-u1(pi/16777216) q[53];
-cx q[53],q[30];
-u1(-pi/16777216) q[30];
-cx q[53],q[30];
-u1(pi/16777216) q[30];
-u1(pi/8388608) q[53];
-cx q[53],q[31];
-u1(-pi/8388608) q[31];
-cx q[53],q[31];
-u1(pi/8388608) q[31];
-u1(pi/4194304) q[53];
-cx q[53],q[32];
-u1(-pi/4194304) q[32];
-cx q[53],q[32];
-u1(pi/4194304) q[32];
-u1(pi/2097152) q[53];
-cx q[53],q[33];
-u1(-pi/2097152) q[33];
-cx q[53],q[33];
-u1(pi/2097152) q[33];
-u1(pi/1048576) q[53];
-cx q[53],q[34];
-u1(-pi/1048576) q[34];
-cx q[53],q[34];
-u1(pi/1048576) q[34];
-u1(pi/524288) q[53];
-cx q[53],q[35];
-u1(-pi/524288) q[35];
-cx q[53],q[35];
-u1(pi/524288) q[35];
-u1(pi/262144) q[53];
-cx q[53],q[36];
-u1(-pi/262144) q[36];
-cx q[53],q[36];
-u1(pi/262144) q[36];
-u1(pi/131072) q[53];
-cx q[53],q[37];
-u1(-pi/131072) q[37];
-cx q[53],q[37];
-u1(pi/131072) q[37];
-u1(pi/65536) q[53];
-cx q[53],q[38];
-u1(-pi/65536) q[38];
-cx q[53],q[38];
-u1(pi/65536) q[38];
-u1(pi/32768) q[53];
-cx q[53],q[39];
-u1(-pi/32768) q[39];
-cx q[53],q[39];
-u1(pi/32768) q[39];
-u1(pi/16384) q[53];
-cx q[53],q[40];
-u1(-pi/16384) q[40];
-cx q[53],q[40];
-u1(pi/16384) q[40];
-u1(pi/8192) q[53];
-cx q[53],q[41];
-u1(-pi/8192) q[41];
-cx q[53],q[41];
-u1(pi/8192) q[41];
-u1(pi/4096) q[53];
-cx q[53],q[42];
-u1(-pi/4096) q[42];
-cx q[53],q[42];
-u1(pi/4096) q[42];
-u1(pi/2048) q[53];
-cx q[53],q[43];
-u1(-pi/2048) q[43];
-cx q[53],q[43];
-u1(pi/2048) q[43];
-u1(pi/1024) q[53];
-cx q[53],q[44];
-u1(-pi/1024) q[44];
-cx q[53],q[44];
-u1(pi/1024) q[44];
-u1(pi/512) q[53];
-cx q[53],q[45];
-u1(-pi/512) q[45];
-cx q[53],q[45];
-u1(pi/512) q[45];
-u1(pi/256) q[53];
-cx q[53],q[46];
-u1(-pi/256) q[46];
-cx q[53],q[46];
-u1(pi/256) q[46];
-u1(pi/128) q[53];
-cx q[53],q[47];
-u1(-pi/128) q[47];
-cx q[53],q[47];
-u1(pi/128) q[47];
-u1(pi/64) q[53];
-cx q[53],q[48];
-u1(-pi/64) q[48];
-cx q[53],q[48];
-u1(pi/64) q[48];
-u1(pi/32) q[53];
-cx q[53],q[49];
-u1(-pi/32) q[49];
-cx q[53],q[49];
-u1(pi/32) q[49];
-u1(pi/16) q[53];
-cx q[53],q[50];
-u1(-pi/16) q[50];
-cx q[53],q[50];
-u1(pi/16) q[50];
-u1(pi/8) q[53];
-cx q[53],q[51];
-u1(-pi/8) q[51];
-cx q[53],q[51];
-u1(pi/8) q[51];
-u1(pi/4) q[53];
-cx q[53],q[52];
-u1(-pi/4) q[52];
-cx q[53],q[52];
-u1(pi/4) q[52];
-h q[53];
-u1(0) q[54];
-cx q[54],q[0];
-u1(0) q[0];
-cx q[54],q[0];
-u1(0) q[0];
-u1(0) q[54];
-cx q[54],q[1];
-u1(0) q[1];
-cx q[54],q[1];
-u1(0) q[1];
-u1(0) q[54];
-cx q[54],q[2];
-u1(0) q[2];
-cx q[54],q[2];
-u1(0) q[2];
-u1(0) q[54];
-cx q[54],q[3];
-u1(0) q[3];
-cx q[54],q[3];
-u1(0) q[3];
-u1(0) q[54];
-cx q[54],q[4];
-u1(0) q[4];
-cx q[54],q[4];
-u1(0) q[4];
-u1(0) q[54];
-cx q[54],q[5];
-u1(0) q[5];
-cx q[54],q[5];
-u1(0) q[5];
-u1(0) q[54];
-cx q[54],q[6];
-u1(0) q[6];
-cx q[54],q[6];
-u1(0) q[6];
-u1(pi/281474976710656) q[54];
-cx q[54],q[7];
-u1(-pi/281474976710656) q[7];
-cx q[54],q[7];
-u1(pi/281474976710656) q[7];
-u1(pi/140737488355328) q[54];
-cx q[54],q[8];
-u1(-pi/140737488355328) q[8];
-cx q[54],q[8];
-u1(pi/140737488355328) q[8];
-u1(pi/70368744177664) q[54];
-cx q[54],q[9];
-u1(-pi/70368744177664) q[9];
-cx q[54],q[9];
-u1(pi/70368744177664) q[9];
-u1(pi/35184372088832) q[54];
-cx q[54],q[10];
-u1(-pi/35184372088832) q[10];
-cx q[54],q[10];
-u1(pi/35184372088832) q[10];
-u1(pi/17592186044416) q[54];
-cx q[54],q[11];
-u1(-pi/17592186044416) q[11];
-cx q[54],q[11];
-u1(pi/17592186044416) q[11];
-u1(pi/8796093022208) q[54];
-cx q[54],q[12];
-u1(-pi/8796093022208) q[12];
-cx q[54],q[12];
-u1(pi/8796093022208) q[12];
-u1(pi/4398046511104) q[54];
-cx q[54],q[13];
-u1(-pi/4398046511104) q[13];
-cx q[54],q[13];
-u1(pi/4398046511104) q[13];
-u1(pi/2199023255552) q[54];
-cx q[54],q[14];
-u1(-pi/2199023255552) q[14];
-cx q[54],q[14];
-u1(pi/2199023255552) q[14];
-u1(pi/1099511627776) q[54];
-cx q[54],q[15];
-u1(-pi/1099511627776) q[15];
-cx q[54],q[15];
-u1(pi/1099511627776) q[15];
-u1(pi/549755813888) q[54];
-cx q[54],q[16];
-u1(-pi/549755813888) q[16];
-cx q[54],q[16];
-u1(pi/549755813888) q[16];
-u1(pi/274877906944) q[54];
-cx q[54],q[17];
-u1(-pi/274877906944) q[17];
-cx q[54],q[17];
-u1(pi/274877906944) q[17];
-u1(pi/137438953472) q[54];
-cx q[54],q[18];
-u1(-pi/137438953472) q[18];
-cx q[54],q[18];
-u1(pi/137438953472) q[18];
-u1(pi/68719476736) q[54];
-cx q[54],q[19];
-u1(-pi/68719476736) q[19];
-cx q[54],q[19];
-u1(pi/68719476736) q[19];
-u1(pi/34359738368) q[54];
-cx q[54],q[20];
-u1(-pi/34359738368) q[20];
-cx q[54],q[20];
-u1(pi/34359738368) q[20];
-u1(pi/17179869184) q[54];
-cx q[54],q[21];
-u1(-pi/17179869184) q[21];
-cx q[54],q[21];
-u1(pi/17179869184) q[21];
-u1(pi/8589934592) q[54];
-cx q[54],q[22];
-u1(-pi/8589934592) q[22];
-cx q[54],q[22];
-u1(pi/8589934592) q[22];
-u1(pi/4294967296) q[54];
-cx q[54],q[23];
-u1(-pi/4294967296) q[23];
-cx q[54],q[23];
-u1(pi/4294967296) q[23];
-u1(pi/2147483648) q[54];
-cx q[54],q[24];
-u1(-pi/2147483648) q[24];
-cx q[54],q[24];
-u1(pi/2147483648) q[24];
-u1(pi/1073741824) q[54];
-cx q[54],q[25];
-u1(-pi/1073741824) q[25];
-cx q[54],q[25];
-u1(pi/1073741824) q[25];
-u1(pi/536870912) q[54];
-cx q[54],q[26];
-u1(-pi/536870912) q[26];
-cx q[54],q[26];
-u1(pi/536870912) q[26];
-u1(pi/268435456) q[54];
-cx q[54],q[27];
-u1(-pi/268435456) q[27];
-cx q[54],q[27];
-u1(pi/268435456) q[27];
-u1(pi/134217728) q[54];
-cx q[54],q[28];
-u1(-pi/134217728) q[28];
-cx q[54],q[28];
-u1(pi/134217728) q[28];
-u1(pi/67108864) q[54];
-cx q[54],q[29];
-u1(-pi/67108864) q[29];
-cx q[54],q[29];
-u1(pi/67108864) q[29];
-u1(pi/33554432) q[54];
-cx q[54],q[30];
-u1(-pi/33554432) q[30];
-cx q[54],q[30];
-u1(pi/33554432) q[30];
-u1(pi/16777216) q[54];
-cx q[54],q[31];
-u1(-pi/16777216) q[31];
-cx q[54],q[31];
-u1(pi/16777216) q[31];
-u1(pi/8388608) q[54];
-cx q[54],q[32];
-u1(-pi/8388608) q[32];
-cx q[54],q[32];
-u1(pi/8388608) q[32];
-u1(pi/4194304) q[54];
-cx q[54],q[33];
-u1(-pi/4194304) q[33];
-cx q[54],q[33];
-u1(pi/4194304) q[33];
-u1(pi/2097152) q[54];
-cx q[54],q[34];
-u1(-pi/2097152) q[34];
-cx q[54],q[34];
-u1(pi/2097152) q[34];
-u1(pi/1048576) q[54];
-cx q[54],q[35];
-u1(-pi/1048576) q[35];
-cx q[54],q[35];
-u1(pi/1048576) q[35];
-u1(pi/524288) q[54];
-cx q[54],q[36];
-u1(-pi/524288) q[36];
-cx q[54],q[36];
-u1(pi/524288) q[36];
-u1(pi/262144) q[54];
-cx q[54],q[37];
-u1(-pi/262144) q[37];
-cx q[54],q[37];
-u1(pi/262144) q[37];
-u1(pi/131072) q[54];
-cx q[54],q[38];
-u1(-pi/131072) q[38];
-cx q[54],q[38];
-u1(pi/131072) q[38];
-u1(pi/65536) q[54];
-cx q[54],q[39];
-u1(-pi/65536) q[39];
-cx q[54],q[39];
-u1(pi/65536) q[39];
-u1(pi/32768) q[54];
-cx q[54],q[40];
-u1(-pi/32768) q[40];
-cx q[54],q[40];
-u1(pi/32768) q[40];
-u1(pi/16384) q[54];
-cx q[54],q[41];
-u1(-pi/16384) q[41];
-cx q[54],q[41];
-u1(pi/16384) q[41];
-u1(pi/8192) q[54];
-cx q[54],q[42];
-u1(-pi/8192) q[42];
-cx q[54],q[42];
-u1(pi/8192) q[42];
-u1(pi/4096) q[54];
-cx q[54],q[43];
-u1(-pi/4096) q[43];
-cx q[54],q[43];
-u1(pi/4096) q[43];
-u1(pi/2048) q[54];
-cx q[54],q[44];
-u1(-pi/2048) q[44];
-cx q[54],q[44];
-u1(pi/2048) q[44];
-u1(pi/1024) q[54];
-cx q[54],q[45];
-u1(-pi/1024) q[45];
-cx q[54],q[45];
-u1(pi/1024) q[45];
-u1(pi/512) q[54];
-cx q[54],q[46];
-u1(-pi/512) q[46];
-cx q[54],q[46];
-u1(pi/512) q[46];
-u1(pi/256) q[54];
-cx q[54],q[47];
-u1(-pi/256) q[47];
-cx q[54],q[47];
-u1(pi/256) q[47];
-u1(pi/128) q[54];
-cx q[54],q[48];
-u1(-pi/128) q[48];
-cx q[54],q[48];
-u1(pi/128) q[48];
-u1(pi/64) q[54];
-cx q[54],q[49];
-u1(-pi/64) q[49];
-cx q[54],q[49];
-u1(pi/64) q[49];
-u1(pi/32) q[54];
-cx q[54],q[50];
-u1(-pi/32) q[50];
-cx q[54],q[50];
-u1(pi/32) q[50];
-u1(pi/16) q[54];
-cx q[54],q[51];
-u1(-pi/16) q[51];
-cx q[54],q[51];
-u1(pi/16) q[51];
-u1(pi/8) q[54];
-cx q[54],q[52];
-u1(-pi/8) q[52];
-cx q[54],q[52];
-u1(pi/8) q[52];
-u1(pi/4) q[54];
-cx q[54],q[53];
-u1(-pi/4) q[53];
-cx q[54],q[53];
-u1(pi/4) q[53];
-h q[54];
-u1(0) q[55];
-cx q[55],q[0];
-u1(0) q[0];
-cx q[55],q[0];
-u1(0) q[0];
-u1(0) q[55];
-cx q[55],q[1];
-u1(0) q[1];
-cx q[55],q[1];
-u1(0) q[1];
-u1(0) q[55];
-cx q[55],q[2];
-u1(0) q[2];
-cx q[55],q[2];
-u1(0) q[2];
-u1(0) q[55];
-cx q[55],q[3];
-u1(0) q[3];
-cx q[55],q[3];
-u1(0) q[3];
-u1(0) q[55];
-cx q[55],q[4];
-u1(0) q[4];
-cx q[55],q[4];
-u1(0) q[4];
-u1(0) q[55];
-cx q[55],q[5];
-u1(0) q[5];
-cx q[55],q[5];
-u1(0) q[5];
-u1(0) q[55];
-cx q[55],q[6];
-u1(0) q[6];
-cx q[55],q[6];
-u1(0) q[6];
-u1(0) q[55];
-cx q[55],q[7];
-u1(0) q[7];
-cx q[55],q[7];
-u1(0) q[7];
-u1(pi/281474976710656) q[55];
-cx q[55],q[8];
-u1(-pi/281474976710656) q[8];
-cx q[55],q[8];
-u1(pi/281474976710656) q[8];
-u1(pi/140737488355328) q[55];
-cx q[55],q[9];
-u1(-pi/140737488355328) q[9];
-cx q[55],q[9];
-u1(pi/140737488355328) q[9];
-u1(pi/70368744177664) q[55];
-cx q[55],q[10];
-u1(-pi/70368744177664) q[10];
-cx q[55],q[10];
-u1(pi/70368744177664) q[10];
-u1(pi/35184372088832) q[55];
-cx q[55],q[11];
-u1(-pi/35184372088832) q[11];
-cx q[55],q[11];
-u1(pi/35184372088832) q[11];
-u1(pi/17592186044416) q[55];
-cx q[55],q[12];
-u1(-pi/17592186044416) q[12];
-cx q[55],q[12];
-u1(pi/17592186044416) q[12];
-u1(pi/8796093022208) q[55];
-cx q[55],q[13];
-u1(-pi/8796093022208) q[13];
-cx q[55],q[13];
-u1(pi/8796093022208) q[13];
-u1(pi/4398046511104) q[55];
-cx q[55],q[14];
-u1(-pi/4398046511104) q[14];
-cx q[55],q[14];
-u1(pi/4398046511104) q[14];
-u1(pi/2199023255552) q[55];
-cx q[55],q[15];
-u1(-pi/2199023255552) q[15];
-cx q[55],q[15];
-u1(pi/2199023255552) q[15];
-u1(pi/1099511627776) q[55];
-cx q[55],q[16];
-u1(-pi/1099511627776) q[16];
-cx q[55],q[16];
-u1(pi/1099511627776) q[16];
-u1(pi/549755813888) q[55];
-cx q[55],q[17];
-u1(-pi/549755813888) q[17];
-cx q[55],q[17];
-u1(pi/549755813888) q[17];
-u1(pi/274877906944) q[55];
-cx q[55],q[18];
-u1(-pi/274877906944) q[18];
-cx q[55],q[18];
-u1(pi/274877906944) q[18];
-u1(pi/137438953472) q[55];
-cx q[55],q[19];
-u1(-pi/137438953472) q[19];
-cx q[55],q[19];
-u1(pi/137438953472) q[19];
-u1(pi/68719476736) q[55];
-cx q[55],q[20];
-u1(-pi/68719476736) q[20];
-cx q[55],q[20];
-u1(pi/68719476736) q[20];
-u1(pi/34359738368) q[55];
-cx q[55],q[21];
-u1(-pi/34359738368) q[21];
-cx q[55],q[21];
-u1(pi/34359738368) q[21];
-u1(pi/17179869184) q[55];
-cx q[55],q[22];
-u1(-pi/17179869184) q[22];
-cx q[55],q[22];
-u1(pi/17179869184) q[22];
-u1(pi/8589934592) q[55];
-cx q[55],q[23];
-u1(-pi/8589934592) q[23];
-cx q[55],q[23];
-u1(pi/8589934592) q[23];
-u1(pi/4294967296) q[55];
-cx q[55],q[24];
-u1(-pi/4294967296) q[24];
-cx q[55],q[24];
-u1(pi/4294967296) q[24];
-u1(pi/2147483648) q[55];
-cx q[55],q[25];
-u1(-pi/2147483648) q[25];
-cx q[55],q[25];
-u1(pi/2147483648) q[25];
-u1(pi/1073741824) q[55];
-cx q[55],q[26];
-u1(-pi/1073741824) q[26];
-cx q[55],q[26];
-u1(pi/1073741824) q[26];
-u1(pi/536870912) q[55];
-cx q[55],q[27];
-u1(-pi/536870912) q[27];
-cx q[55],q[27];
-u1(pi/536870912) q[27];
-u1(pi/268435456) q[55];
-cx q[55],q[28];
-u1(-pi/268435456) q[28];
-cx q[55],q[28];
-u1(pi/268435456) q[28];
-u1(pi/134217728) q[55];
-cx q[55],q[29];
-u1(-pi/134217728) q[29];
-cx q[55],q[29];
-u1(pi/134217728) q[29];
-u1(pi/67108864) q[55];
-cx q[55],q[30];
-u1(-pi/67108864) q[30];
-cx q[55],q[30];
-u1(pi/67108864) q[30];
-u1(pi/33554432) q[55];
-cx q[55],q[31];
-u1(-pi/33554432) q[31];
-cx q[55],q[31];
-u1(pi/33554432) q[31];
-u1(pi/16777216) q[55];
-cx q[55],q[32];
-u1(-pi/16777216) q[32];
-cx q[55],q[32];
-u1(pi/16777216) q[32];
-u1(pi/8388608) q[55];
-cx q[55],q[33];
-u1(-pi/8388608) q[33];
-cx q[55],q[33];
-u1(pi/8388608) q[33];
-u1(pi/4194304) q[55];
-cx q[55],q[34];
-u1(-pi/4194304) q[34];
-cx q[55],q[34];
-u1(pi/4194304) q[34];
-u1(pi/2097152) q[55];
-cx q[55],q[35];
-u1(-pi/2097152) q[35];
-cx q[55],q[35];
-u1(pi/2097152) q[35];
-u1(pi/1048576) q[55];
-cx q[55],q[36];
-u1(-pi/1048576) q[36];
-cx q[55],q[36];
-u1(pi/1048576) q[36];
-u1(pi/524288) q[55];
-cx q[55],q[37];
-u1(-pi/524288) q[37];
-cx q[55],q[37];
-u1(pi/524288) q[37];
-u1(pi/262144) q[55];
-cx q[55],q[38];
-u1(-pi/262144) q[38];
-cx q[55],q[38];
-u1(pi/262144) q[38];
-u1(pi/131072) q[55];
-cx q[55],q[39];
-u1(-pi/131072) q[39];
-cx q[55],q[39];
-u1(pi/131072) q[39];
-u1(pi/65536) q[55];
-cx q[55],q[40];
-u1(-pi/65536) q[40];
-cx q[55],q[40];
-u1(pi/65536) q[40];
-u1(pi/32768) q[55];
-cx q[55],q[41];
-u1(-pi/32768) q[41];
-cx q[55],q[41];
-u1(pi/32768) q[41];
-u1(pi/16384) q[55];
-cx q[55],q[42];
-u1(-pi/16384) q[42];
-cx q[55],q[42];
-u1(pi/16384) q[42];
-u1(pi/8192) q[55];
-cx q[55],q[43];
-u1(-pi/8192) q[43];
-cx q[55],q[43];
-u1(pi/8192) q[43];
-u1(pi/4096) q[55];
-cx q[55],q[44];
-u1(-pi/4096) q[44];
-cx q[55],q[44];
-u1(pi/4096) q[44];
-u1(pi/2048) q[55];
-cx q[55],q[45];
-u1(-pi/2048) q[45];
-cx q[55],q[45];
-u1(pi/2048) q[45];
-u1(pi/1024) q[55];
-cx q[55],q[46];
-u1(-pi/1024) q[46];
-cx q[55],q[46];
-u1(pi/1024) q[46];
-u1(pi/512) q[55];
-cx q[55],q[47];
-u1(-pi/512) q[47];
-cx q[55],q[47];
-u1(pi/512) q[47];
-u1(pi/256) q[55];
-cx q[55],q[48];
-u1(-pi/256) q[48];
-cx q[55],q[48];
-u1(pi/256) q[48];
-u1(pi/128) q[55];
-cx q[55],q[49];
-u1(-pi/128) q[49];
-cx q[55],q[49];
-u1(pi/128) q[49];
-u1(pi/64) q[55];
-cx q[55],q[50];
-u1(-pi/64) q[50];
-cx q[55],q[50];
-u1(pi/64) q[50];
-u1(pi/32) q[55];
-cx q[55],q[51];
-u1(-pi/32) q[51];
-cx q[55],q[51];
-u1(pi/32) q[51];
-u1(pi/16) q[55];
-cx q[55],q[52];
-u1(-pi/16) q[52];
-cx q[55],q[52];
-u1(pi/16) q[52];
-u1(pi/8) q[55];
-cx q[55],q[53];
-u1(-pi/8) q[53];
-cx q[55],q[53];
-u1(pi/8) q[53];
-u1(pi/4) q[55];
-cx q[55],q[54];
-u1(-pi/4) q[54];
-cx q[55],q[54];
-u1(pi/4) q[54];
-h q[55];
-u1(0) q[56];
-cx q[56],q[0];
-u1(0) q[0];
-cx q[56],q[0];
-u1(0) q[0];
-u1(0) q[56];
-cx q[56],q[1];
-u1(0) q[1];
-cx q[56],q[1];
-u1(0) q[1];
-u1(0) q[56];
-cx q[56],q[2];
-u1(0) q[2];
-cx q[56],q[2];
-u1(0) q[2];
-u1(0) q[56];
-cx q[56],q[3];
-u1(0) q[3];
-cx q[56],q[3];
-u1(0) q[3];
-u1(0) q[56];
-cx q[56],q[4];
-u1(0) q[4];
-cx q[56],q[4];
-u1(0) q[4];
-u1(0) q[56];
-cx q[56],q[5];
-u1(0) q[5];
-cx q[56],q[5];
-u1(0) q[5];
-u1(0) q[56];
-cx q[56],q[6];
-u1(0) q[6];
-cx q[56],q[6];
-u1(0) q[6];
-u1(0) q[56];
-cx q[56],q[7];
-u1(0) q[7];
-cx q[56],q[7];
-u1(0) q[7];
-u1(0) q[56];
-cx q[56],q[8];
-u1(0) q[8];
-cx q[56],q[8];
-u1(0) q[8];
-u1(pi/281474976710656) q[56];
-cx q[56],q[9];
-u1(-pi/281474976710656) q[9];
-cx q[56],q[9];
-u1(pi/281474976710656) q[9];
-u1(pi/140737488355328) q[56];
-cx q[56],q[10];
-u1(-pi/140737488355328) q[10];
-cx q[56],q[10];
-u1(pi/140737488355328) q[10];
-u1(pi/70368744177664) q[56];
-cx q[56],q[11];
-u1(-pi/70368744177664) q[11];
-cx q[56],q[11];
-u1(pi/70368744177664) q[11];
-u1(pi/35184372088832) q[56];
-cx q[56],q[12];
-u1(-pi/35184372088832) q[12];
-cx q[56],q[12];
-u1(pi/35184372088832) q[12];
-u1(pi/17592186044416) q[56];
-cx q[56],q[13];
-u1(-pi/17592186044416) q[13];
-cx q[56],q[13];
-u1(pi/17592186044416) q[13];
-u1(pi/8796093022208) q[56];
-cx q[56],q[14];
-u1(-pi/8796093022208) q[14];
-cx q[56],q[14];
-u1(pi/8796093022208) q[14];
-u1(pi/4398046511104) q[56];
-cx q[56],q[15];
-u1(-pi/4398046511104) q[15];
-cx q[56],q[15];
-u1(pi/4398046511104) q[15];
-u1(pi/2199023255552) q[56];
-cx q[56],q[16];
-u1(-pi/2199023255552) q[16];
-cx q[56],q[16];
-u1(pi/2199023255552) q[16];
-u1(pi/1099511627776) q[56];
-cx q[56],q[17];
-u1(-pi/1099511627776) q[17];
-cx q[56],q[17];
-u1(pi/1099511627776) q[17];
-u1(pi/549755813888) q[56];
-cx q[56],q[18];
-u1(-pi/549755813888) q[18];
-cx q[56],q[18];
-u1(pi/549755813888) q[18];
-u1(pi/274877906944) q[56];
-cx q[56],q[19];
-u1(-pi/274877906944) q[19];
-cx q[56],q[19];
-u1(pi/274877906944) q[19];
-u1(pi/137438953472) q[56];
-cx q[56],q[20];
-u1(-pi/137438953472) q[20];
-cx q[56],q[20];
-u1(pi/137438953472) q[20];
-u1(pi/68719476736) q[56];
-cx q[56],q[21];
-u1(-pi/68719476736) q[21];
-cx q[56],q[21];
-u1(pi/68719476736) q[21];
-u1(pi/34359738368) q[56];
-cx q[56],q[22];
-u1(-pi/34359738368) q[22];
-cx q[56],q[22];
-u1(pi/34359738368) q[22];
-u1(pi/17179869184) q[56];
-cx q[56],q[23];
-u1(-pi/17179869184) q[23];
-cx q[56],q[23];
-u1(pi/17179869184) q[23];
-u1(pi/8589934592) q[56];
-cx q[56],q[24];
-u1(-pi/8589934592) q[24];
-cx q[56],q[24];
-u1(pi/8589934592) q[24];
-u1(pi/4294967296) q[56];
-cx q[56],q[25];
-u1(-pi/4294967296) q[25];
-cx q[56],q[25];
-u1(pi/4294967296) q[25];
-u1(pi/2147483648) q[56];
-cx q[56],q[26];
-u1(-pi/2147483648) q[26];
-cx q[56],q[26];
-u1(pi/2147483648) q[26];
-u1(pi/1073741824) q[56];
-cx q[56],q[27];
-u1(-pi/1073741824) q[27];
-cx q[56],q[27];
-u1(pi/1073741824) q[27];
-u1(pi/536870912) q[56];
-cx q[56],q[28];
-u1(-pi/536870912) q[28];
-cx q[56],q[28];
-u1(pi/536870912) q[28];
-u1(pi/268435456) q[56];
-cx q[56],q[29];
-u1(-pi/268435456) q[29];
-cx q[56],q[29];
-u1(pi/268435456) q[29];
-u1(pi/134217728) q[56];
-cx q[56],q[30];
-u1(-pi/134217728) q[30];
-cx q[56],q[30];
-u1(pi/134217728) q[30];
-u1(pi/67108864) q[56];
-cx q[56],q[31];
-u1(-pi/67108864) q[31];
-cx q[56],q[31];
-u1(pi/67108864) q[31];
-u1(pi/33554432) q[56];
-cx q[56],q[32];
-u1(-pi/33554432) q[32];
-cx q[56],q[32];
-u1(pi/33554432) q[32];
-u1(pi/16777216) q[56];
-cx q[56],q[33];
-u1(-pi/16777216) q[33];
-cx q[56],q[33];
-u1(pi/16777216) q[33];
-u1(pi/8388608) q[56];
-cx q[56],q[34];
-u1(-pi/8388608) q[34];
-cx q[56],q[34];
-u1(pi/8388608) q[34];
-u1(pi/4194304) q[56];
-cx q[56],q[35];
-u1(-pi/4194304) q[35];
-cx q[56],q[35];
-u1(pi/4194304) q[35];
-u1(pi/2097152) q[56];
-cx q[56],q[36];
-u1(-pi/2097152) q[36];
-cx q[56],q[36];
-u1(pi/2097152) q[36];
-u1(pi/1048576) q[56];
-cx q[56],q[37];
-u1(-pi/1048576) q[37];
-cx q[56],q[37];
-u1(pi/1048576) q[37];
-u1(pi/524288) q[56];
-cx q[56],q[38];
-u1(-pi/524288) q[38];
-cx q[56],q[38];
-u1(pi/524288) q[38];
-u1(pi/262144) q[56];
-cx q[56],q[39];
-u1(-pi/262144) q[39];
-cx q[56],q[39];
-u1(pi/262144) q[39];
-u1(pi/131072) q[56];
-cx q[56],q[40];
-u1(-pi/131072) q[40];
-cx q[56],q[40];
-u1(pi/131072) q[40];
-u1(pi/65536) q[56];
-cx q[56],q[41];
-u1(-pi/65536) q[41];
-cx q[56],q[41];
-u1(pi/65536) q[41];
-u1(pi/32768) q[56];
-cx q[56],q[42];
-u1(-pi/32768) q[42];
-cx q[56],q[42];
-u1(pi/32768) q[42];
-u1(pi/16384) q[56];
-cx q[56],q[43];
-u1(-pi/16384) q[43];
-cx q[56],q[43];
-u1(pi/16384) q[43];
-u1(pi/8192) q[56];
-cx q[56],q[44];
-u1(-pi/8192) q[44];
-cx q[56],q[44];
-u1(pi/8192) q[44];
-u1(pi/4096) q[56];
-cx q[56],q[45];
-u1(-pi/4096) q[45];
-cx q[56],q[45];
-u1(pi/4096) q[45];
-u1(pi/2048) q[56];
-cx q[56],q[46];
-u1(-pi/2048) q[46];
-cx q[56],q[46];
-u1(pi/2048) q[46];
-u1(pi/1024) q[56];
-cx q[56],q[47];
-u1(-pi/1024) q[47];
-cx q[56],q[47];
-u1(pi/1024) q[47];
-u1(pi/512) q[56];
-cx q[56],q[48];
-u1(-pi/512) q[48];
-cx q[56],q[48];
-u1(pi/512) q[48];
-u1(pi/256) q[56];
-cx q[56],q[49];
-u1(-pi/256) q[49];
-cx q[56],q[49];
-u1(pi/256) q[49];
-u1(pi/128) q[56];
-cx q[56],q[50];
-u1(-pi/128) q[50];
-cx q[56],q[50];
-u1(pi/128) q[50];
-u1(pi/64) q[56];
-cx q[56],q[51];
-u1(-pi/64) q[51];
-cx q[56],q[51];
-u1(pi/64) q[51];
-u1(pi/32) q[56];
-cx q[56],q[52];
-u1(-pi/32) q[52];
-cx q[56],q[52];
-u1(pi/32) q[52];
-u1(pi/16) q[56];
-cx q[56],q[53];
-u1(-pi/16) q[53];
-cx q[56],q[53];
-u1(pi/16) q[53];
-u1(pi/8) q[56];
-cx q[56],q[54];
-u1(-pi/8) q[54];
-cx q[56],q[54];
-u1(pi/8) q[54];
-u1(pi/4) q[56];
-cx q[56],q[55];
-u1(-pi/4) q[55];
-cx q[56],q[55];
-u1(pi/4) q[55];
-h q[56];
-u1(0) q[57];
-cx q[57],q[0];
-u1(0) q[0];
-cx q[57],q[0];
-u1(0) q[0];
-u1(0) q[57];
-cx q[57],q[1];
-u1(0) q[1];
-cx q[57],q[1];
-u1(0) q[1];
-u1(0) q[57];
-cx q[57],q[2];
-u1(0) q[2];
-cx q[57],q[2];
-u1(0) q[2];
-u1(0) q[57];
-cx q[57],q[3];
-u1(0) q[3];
-cx q[57],q[3];
-u1(0) q[3];
-u1(0) q[57];
-cx q[57],q[4];
-u1(0) q[4];
-cx q[57],q[4];
-u1(0) q[4];
-u1(0) q[57];
-cx q[57],q[5];
-u1(0) q[5];
-cx q[57],q[5];
-u1(0) q[5];
-u1(0) q[57];
-cx q[57],q[6];
-u1(0) q[6];
-cx q[57],q[6];
-u1(0) q[6];
-u1(0) q[57];
-cx q[57],q[7];
-u1(0) q[7];
-cx q[57],q[7];
-u1(0) q[7];
-u1(0) q[57];
-cx q[57],q[8];
-u1(0) q[8];
-cx q[57],q[8];
-u1(0) q[8];
-u1(0) q[57];
-cx q[57],q[9];
-u1(0) q[9];
-cx q[57],q[9];
-u1(0) q[9];
-u1(pi/281474976710656) q[57];
-cx q[57],q[10];
-u1(-pi/281474976710656) q[10];
-cx q[57],q[10];
-u1(pi/281474976710656) q[10];
-u1(pi/140737488355328) q[57];
-cx q[57],q[11];
-u1(-pi/140737488355328) q[11];
-cx q[57],q[11];
-u1(pi/140737488355328) q[11];
-u1(pi/70368744177664) q[57];
-cx q[57],q[12];
-u1(-pi/70368744177664) q[12];
-cx q[57],q[12];
-u1(pi/70368744177664) q[12];
-u1(pi/35184372088832) q[57];
-cx q[57],q[13];
-u1(-pi/35184372088832) q[13];
-cx q[57],q[13];
-u1(pi/35184372088832) q[13];
-u1(pi/17592186044416) q[57];
-cx q[57],q[14];
-u1(-pi/17592186044416) q[14];
-cx q[57],q[14];
-u1(pi/17592186044416) q[14];
-u1(pi/8796093022208) q[57];
-cx q[57],q[15];
-u1(-pi/8796093022208) q[15];
-cx q[57],q[15];
-u1(pi/8796093022208) q[15];
-u1(pi/4398046511104) q[57];
-cx q[57],q[16];
-u1(-pi/4398046511104) q[16];
-cx q[57],q[16];
-u1(pi/4398046511104) q[16];
-u1(pi/2199023255552) q[57];
-cx q[57],q[17];
-u1(-pi/2199023255552) q[17];
-cx q[57],q[17];
-u1(pi/2199023255552) q[17];
-u1(pi/1099511627776) q[57];
-cx q[57],q[18];
-u1(-pi/1099511627776) q[18];
-cx q[57],q[18];
-u1(pi/1099511627776) q[18];
-u1(pi/549755813888) q[57];
-cx q[57],q[19];
-u1(-pi/549755813888) q[19];
-cx q[57],q[19];
-u1(pi/549755813888) q[19];
-u1(pi/274877906944) q[57];
-cx q[57],q[20];
-u1(-pi/274877906944) q[20];
-cx q[57],q[20];
-u1(pi/274877906944) q[20];
-u1(pi/137438953472) q[57];
-cx q[57],q[21];
-u1(-pi/137438953472) q[21];
-cx q[57],q[21];
-u1(pi/137438953472) q[21];
-u1(pi/68719476736) q[57];
-cx q[57],q[22];
-u1(-pi/68719476736) q[22];
-cx q[57],q[22];
-u1(pi/68719476736) q[22];
-u1(pi/34359738368) q[57];
-cx q[57],q[23];
-u1(-pi/34359738368) q[23];
-cx q[57],q[23];
-u1(pi/34359738368) q[23];
-u1(pi/17179869184) q[57];
-cx q[57],q[24];
-u1(-pi/17179869184) q[24];
-cx q[57],q[24];
-u1(pi/17179869184) q[24];
-u1(pi/8589934592) q[57];
-cx q[57],q[25];
-u1(-pi/8589934592) q[25];
-cx q[57],q[25];
-u1(pi/8589934592) q[25];
-u1(pi/4294967296) q[57];
-cx q[57],q[26];
-u1(-pi/4294967296) q[26];
-cx q[57],q[26];
-u1(pi/4294967296) q[26];
-u1(pi/2147483648) q[57];
-cx q[57],q[27];
-u1(-pi/2147483648) q[27];
-cx q[57],q[27];
-u1(pi/2147483648) q[27];
-u1(pi/1073741824) q[57];
-cx q[57],q[28];
-u1(-pi/1073741824) q[28];
-cx q[57],q[28];
-u1(pi/1073741824) q[28];
-u1(pi/536870912) q[57];
-cx q[57],q[29];
-u1(-pi/536870912) q[29];
-cx q[57],q[29];
-u1(pi/536870912) q[29];
-u1(pi/268435456) q[57];
-cx q[57],q[30];
-u1(-pi/268435456) q[30];
-cx q[57],q[30];
-u1(pi/268435456) q[30];
-u1(pi/134217728) q[57];
-cx q[57],q[31];
-u1(-pi/134217728) q[31];
-cx q[57],q[31];
-u1(pi/134217728) q[31];
-u1(pi/67108864) q[57];
-cx q[57],q[32];
-u1(-pi/67108864) q[32];
-cx q[57],q[32];
-u1(pi/67108864) q[32];
-u1(pi/33554432) q[57];
-cx q[57],q[33];
-u1(-pi/33554432) q[33];
-cx q[57],q[33];
-u1(pi/33554432) q[33];
-u1(pi/16777216) q[57];
-cx q[57],q[34];
-u1(-pi/16777216) q[34];
-cx q[57],q[34];
-u1(pi/16777216) q[34];
-u1(pi/8388608) q[57];
-cx q[57],q[35];
-u1(-pi/8388608) q[35];
-cx q[57],q[35];
-u1(pi/8388608) q[35];
-u1(pi/4194304) q[57];
-cx q[57],q[36];
-u1(-pi/4194304) q[36];
-cx q[57],q[36];
-u1(pi/4194304) q[36];
-u1(pi/2097152) q[57];
-cx q[57],q[37];
-u1(-pi/2097152) q[37];
-cx q[57],q[37];
-u1(pi/2097152) q[37];
-u1(pi/1048576) q[57];
-cx q[57],q[38];
-u1(-pi/1048576) q[38];
-cx q[57],q[38];
-u1(pi/1048576) q[38];
-u1(pi/524288) q[57];
-cx q[57],q[39];
-u1(-pi/524288) q[39];
-cx q[57],q[39];
-u1(pi/524288) q[39];
-u1(pi/262144) q[57];
-cx q[57],q[40];
-u1(-pi/262144) q[40];
-cx q[57],q[40];
-u1(pi/262144) q[40];
-u1(pi/131072) q[57];
-cx q[57],q[41];
-u1(-pi/131072) q[41];
-cx q[57],q[41];
-u1(pi/131072) q[41];
-u1(pi/65536) q[57];
-cx q[57],q[42];
-u1(-pi/65536) q[42];
-cx q[57],q[42];
-u1(pi/65536) q[42];
-u1(pi/32768) q[57];
-cx q[57],q[43];
-u1(-pi/32768) q[43];
-cx q[57],q[43];
-u1(pi/32768) q[43];
-u1(pi/16384) q[57];
-cx q[57],q[44];
-u1(-pi/16384) q[44];
-cx q[57],q[44];
-u1(pi/16384) q[44];
-u1(pi/8192) q[57];
-cx q[57],q[45];
-u1(-pi/8192) q[45];
-cx q[57],q[45];
-u1(pi/8192) q[45];
-u1(pi/4096) q[57];
-cx q[57],q[46];
-u1(-pi/4096) q[46];
-cx q[57],q[46];
-u1(pi/4096) q[46];
-u1(pi/2048) q[57];
-cx q[57],q[47];
-u1(-pi/2048) q[47];
-cx q[57],q[47];
-u1(pi/2048) q[47];
-u1(pi/1024) q[57];
-cx q[57],q[48];
-u1(-pi/1024) q[48];
-cx q[57],q[48];
-u1(pi/1024) q[48];
-u1(pi/512) q[57];
-cx q[57],q[49];
-u1(-pi/512) q[49];
-cx q[57],q[49];
-u1(pi/512) q[49];
-u1(pi/256) q[57];
-cx q[57],q[50];
-u1(-pi/256) q[50];
-cx q[57],q[50];
-u1(pi/256) q[50];
-u1(pi/128) q[57];
-cx q[57],q[51];
-u1(-pi/128) q[51];
-cx q[57],q[51];
-u1(pi/128) q[51];
-u1(pi/64) q[57];
-cx q[57],q[52];
-u1(-pi/64) q[52];
-cx q[57],q[52];
-u1(pi/64) q[52];
-u1(pi/32) q[57];
-cx q[57],q[53];
-u1(-pi/32) q[53];
-cx q[57],q[53];
-u1(pi/32) q[53];
-u1(pi/16) q[57];
-cx q[57],q[54];
-u1(-pi/16) q[54];
-cx q[57],q[54];
-u1(pi/16) q[54];
-u1(pi/8) q[57];
-cx q[57],q[55];
-u1(-pi/8) q[55];
-cx q[57],q[55];
-u1(pi/8) q[55];
-u1(pi/4) q[57];
-cx q[57],q[56];
-u1(-pi/4) q[56];
-cx q[57],q[56];
-u1(pi/4) q[56];
-h q[57];
-u1(0) q[58];
-cx q[58],q[0];
-u1(0) q[0];
-cx q[58],q[0];
-u1(0) q[0];
-u1(0) q[58];
-cx q[58],q[1];
-u1(0) q[1];
-cx q[58],q[1];
-u1(0) q[1];
-u1(0) q[58];
-cx q[58],q[2];
-u1(0) q[2];
-cx q[58],q[2];
-u1(0) q[2];
-u1(0) q[58];
-cx q[58],q[3];
-u1(0) q[3];
-cx q[58],q[3];
-u1(0) q[3];
-u1(0) q[58];
-cx q[58],q[4];
-u1(0) q[4];
-cx q[58],q[4];
-u1(0) q[4];
-u1(0) q[58];
-cx q[58],q[5];
-u1(0) q[5];
-cx q[58],q[5];
-u1(0) q[5];
-u1(0) q[58];
-cx q[58],q[6];
-u1(0) q[6];
-cx q[58],q[6];
-u1(0) q[6];
-u1(0) q[58];
-cx q[58],q[7];
-u1(0) q[7];
-cx q[58],q[7];
-u1(0) q[7];
-u1(0) q[58];
-cx q[58],q[8];
-u1(0) q[8];
-cx q[58],q[8];
-u1(0) q[8];
-u1(0) q[58];
-cx q[58],q[9];
-u1(0) q[9];
-cx q[58],q[9];
-u1(0) q[9];
-u1(0) q[58];
-cx q[58],q[10];
-u1(0) q[10];
-cx q[58],q[10];
-u1(0) q[10];
-u1(pi/281474976710656) q[58];
-cx q[58],q[11];
-u1(-pi/281474976710656) q[11];
-cx q[58],q[11];
-u1(pi/281474976710656) q[11];
-u1(pi/140737488355328) q[58];
-cx q[58],q[12];
-u1(-pi/140737488355328) q[12];
-cx q[58],q[12];
-u1(pi/140737488355328) q[12];
-u1(pi/70368744177664) q[58];
-cx q[58],q[13];
-u1(-pi/70368744177664) q[13];
-cx q[58],q[13];
-u1(pi/70368744177664) q[13];
-u1(pi/35184372088832) q[58];
-cx q[58],q[14];
-u1(-pi/35184372088832) q[14];
-cx q[58],q[14];
-u1(pi/35184372088832) q[14];
-u1(pi/17592186044416) q[58];
-cx q[58],q[15];
-u1(-pi/17592186044416) q[15];
-cx q[58],q[15];
-u1(pi/17592186044416) q[15];
-u1(pi/8796093022208) q[58];
-cx q[58],q[16];
-u1(-pi/8796093022208) q[16];
-cx q[58],q[16];
-u1(pi/8796093022208) q[16];
-u1(pi/4398046511104) q[58];
-cx q[58],q[17];
-u1(-pi/4398046511104) q[17];
-cx q[58],q[17];
-u1(pi/4398046511104) q[17];
-u1(pi/2199023255552) q[58];
-cx q[58],q[18];
-u1(-pi/2199023255552) q[18];
-cx q[58],q[18];
-u1(pi/2199023255552) q[18];
-u1(pi/1099511627776) q[58];
-cx q[58],q[19];
-u1(-pi/1099511627776) q[19];
-cx q[58],q[19];
-u1(pi/1099511627776) q[19];
-u1(pi/549755813888) q[58];
-cx q[58],q[20];
-u1(-pi/549755813888) q[20];
-cx q[58],q[20];
-u1(pi/549755813888) q[20];
-u1(pi/274877906944) q[58];
-cx q[58],q[21];
-u1(-pi/274877906944) q[21];
-cx q[58],q[21];
-u1(pi/274877906944) q[21];
-u1(pi/137438953472) q[58];
-cx q[58],q[22];
-u1(-pi/137438953472) q[22];
-cx q[58],q[22];
-u1(pi/137438953472) q[22];
-u1(pi/68719476736) q[58];
-cx q[58],q[23];
-u1(-pi/68719476736) q[23];
-cx q[58],q[23];
-u1(pi/68719476736) q[23];
-u1(pi/34359738368) q[58];
-cx q[58],q[24];
-u1(-pi/34359738368) q[24];
-cx q[58],q[24];
-u1(pi/34359738368) q[24];
-u1(pi/17179869184) q[58];
-cx q[58],q[25];
-u1(-pi/17179869184) q[25];
-cx q[58],q[25];
-u1(pi/17179869184) q[25];
-u1(pi/8589934592) q[58];
-cx q[58],q[26];
-u1(-pi/8589934592) q[26];
-cx q[58],q[26];
-u1(pi/8589934592) q[26];
-u1(pi/4294967296) q[58];
-cx q[58],q[27];
-u1(-pi/4294967296) q[27];
-cx q[58],q[27];
-u1(pi/4294967296) q[27];
-u1(pi/2147483648) q[58];
-cx q[58],q[28];
-u1(-pi/2147483648) q[28];
-cx q[58],q[28];
-u1(pi/2147483648) q[28];
-u1(pi/1073741824) q[58];
-cx q[58],q[29];
-u1(-pi/1073741824) q[29];
-cx q[58],q[29];
-u1(pi/1073741824) q[29];
-u1(pi/536870912) q[58];
-cx q[58],q[30];
-u1(-pi/536870912) q[30];
-cx q[58],q[30];
-u1(pi/536870912) q[30];
-u1(pi/268435456) q[58];
-cx q[58],q[31];
-u1(-pi/268435456) q[31];
-cx q[58],q[31];
-u1(pi/268435456) q[31];
-u1(pi/134217728) q[58];
-cx q[58],q[32];
-u1(-pi/134217728) q[32];
-cx q[58],q[32];
-u1(pi/134217728) q[32];
-u1(pi/67108864) q[58];
-cx q[58],q[33];
-u1(-pi/67108864) q[33];
-cx q[58],q[33];
-u1(pi/67108864) q[33];
-u1(pi/33554432) q[58];
-cx q[58],q[34];
-u1(-pi/33554432) q[34];
-cx q[58],q[34];
-u1(pi/33554432) q[34];
-u1(pi/16777216) q[58];
-cx q[58],q[35];
-u1(-pi/16777216) q[35];
-cx q[58],q[35];
-u1(pi/16777216) q[35];
-u1(pi/8388608) q[58];
-cx q[58],q[36];
-u1(-pi/8388608) q[36];
-cx q[58],q[36];
-u1(pi/8388608) q[36];
-u1(pi/4194304) q[58];
-cx q[58],q[37];
-u1(-pi/4194304) q[37];
-cx q[58],q[37];
-u1(pi/4194304) q[37];
-u1(pi/2097152) q[58];
-cx q[58],q[38];
-u1(-pi/2097152) q[38];
-cx q[58],q[38];
-u1(pi/2097152) q[38];
-u1(pi/1048576) q[58];
-cx q[58],q[39];
-u1(-pi/1048576) q[39];
-cx q[58],q[39];
-u1(pi/1048576) q[39];
-u1(pi/524288) q[58];
-cx q[58],q[40];
-u1(-pi/524288) q[40];
-cx q[58],q[40];
-u1(pi/524288) q[40];
-u1(pi/262144) q[58];
-cx q[58],q[41];
-u1(-pi/262144) q[41];
-cx q[58],q[41];
-u1(pi/262144) q[41];
-u1(pi/131072) q[58];
-cx q[58],q[42];
-u1(-pi/131072) q[42];
-cx q[58],q[42];
-u1(pi/131072) q[42];
-u1(pi/65536) q[58];
-cx q[58],q[43];
-u1(-pi/65536) q[43];
-cx q[58],q[43];
-u1(pi/65536) q[43];
-u1(pi/32768) q[58];
-cx q[58],q[44];
-u1(-pi/32768) q[44];
-cx q[58],q[44];
-u1(pi/32768) q[44];
-u1(pi/16384) q[58];
-cx q[58],q[45];
-u1(-pi/16384) q[45];
-cx q[58],q[45];
-u1(pi/16384) q[45];
-u1(pi/8192) q[58];
-cx q[58],q[46];
-u1(-pi/8192) q[46];
-cx q[58],q[46];
-u1(pi/8192) q[46];
-u1(pi/4096) q[58];
-cx q[58],q[47];
-u1(-pi/4096) q[47];
-cx q[58],q[47];
-u1(pi/4096) q[47];
-u1(pi/2048) q[58];
-cx q[58],q[48];
-u1(-pi/2048) q[48];
-cx q[58],q[48];
-u1(pi/2048) q[48];
-u1(pi/1024) q[58];
-cx q[58],q[49];
-u1(-pi/1024) q[49];
-cx q[58],q[49];
-u1(pi/1024) q[49];
-u1(pi/512) q[58];
-cx q[58],q[50];
-u1(-pi/512) q[50];
-cx q[58],q[50];
-u1(pi/512) q[50];
-u1(pi/256) q[58];
-cx q[58],q[51];
-u1(-pi/256) q[51];
-cx q[58],q[51];
-u1(pi/256) q[51];
-u1(pi/128) q[58];
-cx q[58],q[52];
-u1(-pi/128) q[52];
-cx q[58],q[52];
-u1(pi/128) q[52];
-u1(pi/64) q[58];
-cx q[58],q[53];
-u1(-pi/64) q[53];
-cx q[58],q[53];
-u1(pi/64) q[53];
-u1(pi/32) q[58];
-cx q[58],q[54];
-u1(-pi/32) q[54];
-cx q[58],q[54];
-u1(pi/32) q[54];
-u1(pi/16) q[58];
-cx q[58],q[55];
-u1(-pi/16) q[55];
-cx q[58],q[55];
-u1(pi/16) q[55];
-u1(pi/8) q[58];
-cx q[58],q[56];
-u1(-pi/8) q[56];
-cx q[58],q[56];
-u1(pi/8) q[56];
-u1(pi/4) q[58];
-cx q[58],q[57];
-u1(-pi/4) q[57];
-cx q[58],q[57];
-u1(pi/4) q[57];
-h q[58];
-u1(0) q[59];
-cx q[59],q[0];
-u1(0) q[0];
-cx q[59],q[0];
-u1(0) q[0];
-u1(0) q[59];
-cx q[59],q[1];
-u1(0) q[1];
-cx q[59],q[1];
-u1(0) q[1];
-u1(0) q[59];
-cx q[59],q[2];
-u1(0) q[2];
-cx q[59],q[2];
-u1(0) q[2];
-u1(0) q[59];
-cx q[59],q[3];
-u1(0) q[3];
-cx q[59],q[3];
-u1(0) q[3];
-u1(0) q[59];
-cx q[59],q[4];
-u1(0) q[4];
-cx q[59],q[4];
-u1(0) q[4];
-u1(0) q[59];
-cx q[59],q[5];
-u1(0) q[5];
-cx q[59],q[5];
-u1(0) q[5];
-u1(0) q[59];
-cx q[59],q[6];
-u1(0) q[6];
-cx q[59],q[6];
-u1(0) q[6];
-u1(0) q[59];
-cx q[59],q[7];
-u1(0) q[7];
-cx q[59],q[7];
-u1(0) q[7];
-u1(0) q[59];
-cx q[59],q[8];
-u1(0) q[8];
-cx q[59],q[8];
-u1(0) q[8];
-u1(0) q[59];
-cx q[59],q[9];
-u1(0) q[9];
-cx q[59],q[9];
-u1(0) q[9];
-u1(0) q[59];
-cx q[59],q[10];
-u1(0) q[10];
-cx q[59],q[10];
-u1(0) q[10];
-u1(0) q[59];
-cx q[59],q[11];
-u1(0) q[11];
-cx q[59],q[11];
-u1(0) q[11];
-u1(pi/281474976710656) q[59];
-cx q[59],q[12];
-u1(-pi/281474976710656) q[12];
-cx q[59],q[12];
-u1(pi/281474976710656) q[12];
-u1(pi/140737488355328) q[59];
-cx q[59],q[13];
-u1(-pi/140737488355328) q[13];
-cx q[59],q[13];
-u1(pi/140737488355328) q[13];
-u1(pi/70368744177664) q[59];
-cx q[59],q[14];
-u1(-pi/70368744177664) q[14];
-cx q[59],q[14];
-u1(pi/70368744177664) q[14];
-u1(pi/35184372088832) q[59];
-cx q[59],q[15];
-u1(-pi/35184372088832) q[15];
-cx q[59],q[15];
-u1(pi/35184372088832) q[15];
-u1(pi/17592186044416) q[59];
-cx q[59],q[16];
-u1(-pi/17592186044416) q[16];
-cx q[59],q[16];
-u1(pi/17592186044416) q[16];
-u1(pi/8796093022208) q[59];
-cx q[59],q[17];
-u1(-pi/8796093022208) q[17];
-cx q[59],q[17];
-u1(pi/8796093022208) q[17];
-u1(pi/4398046511104) q[59];
-cx q[59],q[18];
-u1(-pi/4398046511104) q[18];
-cx q[59],q[18];
-u1(pi/4398046511104) q[18];
-u1(pi/2199023255552) q[59];
-cx q[59],q[19];
-u1(-pi/2199023255552) q[19];
-cx q[59],q[19];
-u1(pi/2199023255552) q[19];
-u1(pi/1099511627776) q[59];
-cx q[59],q[20];
-u1(-pi/1099511627776) q[20];
-cx q[59],q[20];
-u1(pi/1099511627776) q[20];
-u1(pi/549755813888) q[59];
-cx q[59],q[21];
-u1(-pi/549755813888) q[21];
-cx q[59],q[21];
-u1(pi/549755813888) q[21];
-u1(pi/274877906944) q[59];
-cx q[59],q[22];
-u1(-pi/274877906944) q[22];
-cx q[59],q[22];
-u1(pi/274877906944) q[22];
-u1(pi/137438953472) q[59];
-cx q[59],q[23];
-u1(-pi/137438953472) q[23];
-cx q[59],q[23];
-u1(pi/137438953472) q[23];
-u1(pi/68719476736) q[59];
-cx q[59],q[24];
-u1(-pi/68719476736) q[24];
-cx q[59],q[24];
-u1(pi/68719476736) q[24];
-u1(pi/34359738368) q[59];
-cx q[59],q[25];
-u1(-pi/34359738368) q[25];
-cx q[59],q[25];
-u1(pi/34359738368) q[25];
-u1(pi/17179869184) q[59];
-cx q[59],q[26];
-u1(-pi/17179869184) q[26];
-cx q[59],q[26];
-u1(pi/17179869184) q[26];
-u1(pi/8589934592) q[59];
-cx q[59],q[27];
-u1(-pi/8589934592) q[27];
-cx q[59],q[27];
-u1(pi/8589934592) q[27];
-u1(pi/4294967296) q[59];
-cx q[59],q[28];
-u1(-pi/4294967296) q[28];
-cx q[59],q[28];
-u1(pi/4294967296) q[28];
-u1(pi/2147483648) q[59];
-cx q[59],q[29];
-u1(-pi/2147483648) q[29];
-cx q[59],q[29];
-u1(pi/2147483648) q[29];
-u1(pi/1073741824) q[59];
-cx q[59],q[30];
-u1(-pi/1073741824) q[30];
-cx q[59],q[30];
-u1(pi/1073741824) q[30];
-u1(pi/536870912) q[59];
-cx q[59],q[31];
-u1(-pi/536870912) q[31];
-cx q[59],q[31];
-u1(pi/536870912) q[31];
-u1(pi/268435456) q[59];
-cx q[59],q[32];
-u1(-pi/268435456) q[32];
-cx q[59],q[32];
-u1(pi/268435456) q[32];
-u1(pi/134217728) q[59];
-cx q[59],q[33];
-u1(-pi/134217728) q[33];
-cx q[59],q[33];
-u1(pi/134217728) q[33];
-u1(pi/67108864) q[59];
-cx q[59],q[34];
-u1(-pi/67108864) q[34];
-cx q[59],q[34];
-u1(pi/67108864) q[34];
-u1(pi/33554432) q[59];
-cx q[59],q[35];
-u1(-pi/33554432) q[35];
-cx q[59],q[35];
-u1(pi/33554432) q[35];
-u1(pi/16777216) q[59];
-cx q[59],q[36];
-u1(-pi/16777216) q[36];
-cx q[59],q[36];
-u1(pi/16777216) q[36];
-u1(pi/8388608) q[59];
-cx q[59],q[37];
-u1(-pi/8388608) q[37];
-cx q[59],q[37];
-u1(pi/8388608) q[37];
-u1(pi/4194304) q[59];
-cx q[59],q[38];
-u1(-pi/4194304) q[38];
-cx q[59],q[38];
-u1(pi/4194304) q[38];
-u1(pi/2097152) q[59];
-cx q[59],q[39];
-u1(-pi/2097152) q[39];
-cx q[59],q[39];
-u1(pi/2097152) q[39];
-u1(pi/1048576) q[59];
-cx q[59],q[40];
-u1(-pi/1048576) q[40];
-cx q[59],q[40];
-u1(pi/1048576) q[40];
-u1(pi/524288) q[59];
-cx q[59],q[41];
-u1(-pi/524288) q[41];
-cx q[59],q[41];
-u1(pi/524288) q[41];
-u1(pi/262144) q[59];
-cx q[59],q[42];
-u1(-pi/262144) q[42];
-cx q[59],q[42];
-u1(pi/262144) q[42];
-u1(pi/131072) q[59];
-cx q[59],q[43];
-u1(-pi/131072) q[43];
-cx q[59],q[43];
-u1(pi/131072) q[43];
-u1(pi/65536) q[59];
-cx q[59],q[44];
-u1(-pi/65536) q[44];
-cx q[59],q[44];
-u1(pi/65536) q[44];
-u1(pi/32768) q[59];
-cx q[59],q[45];
-u1(-pi/32768) q[45];
-cx q[59],q[45];
-u1(pi/32768) q[45];
-u1(pi/16384) q[59];
-cx q[59],q[46];
-u1(-pi/16384) q[46];
-cx q[59],q[46];
-u1(pi/16384) q[46];
-u1(pi/8192) q[59];
-cx q[59],q[47];
-u1(-pi/8192) q[47];
-cx q[59],q[47];
-u1(pi/8192) q[47];
-u1(pi/4096) q[59];
-cx q[59],q[48];
-u1(-pi/4096) q[48];
-cx q[59],q[48];
-u1(pi/4096) q[48];
-u1(pi/2048) q[59];
-cx q[59],q[49];
-u1(-pi/2048) q[49];
-cx q[59],q[49];
-u1(pi/2048) q[49];
-u1(pi/1024) q[59];
-cx q[59],q[50];
-u1(-pi/1024) q[50];
-cx q[59],q[50];
-u1(pi/1024) q[50];
-u1(pi/512) q[59];
-cx q[59],q[51];
-u1(-pi/512) q[51];
-cx q[59],q[51];
-u1(pi/512) q[51];
-u1(pi/256) q[59];
-cx q[59],q[52];
-u1(-pi/256) q[52];
-cx q[59],q[52];
-u1(pi/256) q[52];
-u1(pi/128) q[59];
-cx q[59],q[53];
-u1(-pi/128) q[53];
-cx q[59],q[53];
-u1(pi/128) q[53];
-u1(pi/64) q[59];
-cx q[59],q[54];
-u1(-pi/64) q[54];
-cx q[59],q[54];
-u1(pi/64) q[54];
-u1(pi/32) q[59];
-cx q[59],q[55];
-u1(-pi/32) q[55];
-cx q[59],q[55];
-u1(pi/32) q[55];
-u1(pi/16) q[59];
-cx q[59],q[56];
-u1(-pi/16) q[56];
-cx q[59],q[56];
-u1(pi/16) q[56];
-u1(pi/8) q[59];
-cx q[59],q[57];
-u1(-pi/8) q[57];
-cx q[59],q[57];
-u1(pi/8) q[57];
-u1(pi/4) q[59];
-cx q[59],q[58];
-u1(-pi/4) q[58];
-cx q[59],q[58];
-u1(pi/4) q[58];
-h q[59];
-u1(0) q[60];
-cx q[60],q[0];
-u1(0) q[0];
-cx q[60],q[0];
-u1(0) q[0];
-u1(0) q[60];
-cx q[60],q[1];
-u1(0) q[1];
-cx q[60],q[1];
-u1(0) q[1];
-u1(0) q[60];
-cx q[60],q[2];
-u1(0) q[2];
-cx q[60],q[2];
-u1(0) q[2];
-u1(0) q[60];
-cx q[60],q[3];
-u1(0) q[3];
-cx q[60],q[3];
-u1(0) q[3];
-u1(0) q[60];
-cx q[60],q[4];
-u1(0) q[4];
-cx q[60],q[4];
-u1(0) q[4];
-u1(0) q[60];
-cx q[60],q[5];
-u1(0) q[5];
-cx q[60],q[5];
-u1(0) q[5];
-u1(0) q[60];
-cx q[60],q[6];
-u1(0) q[6];
-cx q[60],q[6];
-u1(0) q[6];
-u1(0) q[60];
-cx q[60],q[7];
-u1(0) q[7];
-cx q[60],q[7];
-u1(0) q[7];
-u1(0) q[60];
-cx q[60],q[8];
-u1(0) q[8];
-cx q[60],q[8];
-u1(0) q[8];
-u1(0) q[60];
-cx q[60],q[9];
-u1(0) q[9];
-cx q[60],q[9];
-u1(0) q[9];
-u1(0) q[60];
-cx q[60],q[10];
-u1(0) q[10];
-cx q[60],q[10];
-u1(0) q[10];
-u1(0) q[60];
-cx q[60],q[11];
-u1(0) q[11];
-cx q[60],q[11];
-u1(0) q[11];
-u1(0) q[60];
-cx q[60],q[12];
-u1(0) q[12];
-cx q[60],q[12];
-u1(0) q[12];
-u1(pi/281474976710656) q[60];
-cx q[60],q[13];
-u1(-pi/281474976710656) q[13];
-cx q[60],q[13];
-u1(pi/281474976710656) q[13];
-u1(pi/140737488355328) q[60];
-cx q[60],q[14];
-u1(-pi/140737488355328) q[14];
-cx q[60],q[14];
-u1(pi/140737488355328) q[14];
-u1(pi/70368744177664) q[60];
-cx q[60],q[15];
-u1(-pi/70368744177664) q[15];
-cx q[60],q[15];
-u1(pi/70368744177664) q[15];
-u1(pi/35184372088832) q[60];
-cx q[60],q[16];
-u1(-pi/35184372088832) q[16];
-cx q[60],q[16];
-u1(pi/35184372088832) q[16];
-u1(pi/17592186044416) q[60];
-cx q[60],q[17];
-u1(-pi/17592186044416) q[17];
-cx q[60],q[17];
-u1(pi/17592186044416) q[17];
-u1(pi/8796093022208) q[60];
-cx q[60],q[18];
-u1(-pi/8796093022208) q[18];
-cx q[60],q[18];
-u1(pi/8796093022208) q[18];
-u1(pi/4398046511104) q[60];
-cx q[60],q[19];
-u1(-pi/4398046511104) q[19];
-cx q[60],q[19];
-u1(pi/4398046511104) q[19];
-u1(pi/2199023255552) q[60];
-cx q[60],q[20];
-u1(-pi/2199023255552) q[20];
-cx q[60],q[20];
-u1(pi/2199023255552) q[20];
-u1(pi/1099511627776) q[60];
-cx q[60],q[21];
-u1(-pi/1099511627776) q[21];
-cx q[60],q[21];
-u1(pi/1099511627776) q[21];
-u1(pi/549755813888) q[60];
-cx q[60],q[22];
-u1(-pi/549755813888) q[22];
-cx q[60],q[22];
-u1(pi/549755813888) q[22];
-u1(pi/274877906944) q[60];
-cx q[60],q[23];
-u1(-pi/274877906944) q[23];
-cx q[60],q[23];
-u1(pi/274877906944) q[23];
-u1(pi/137438953472) q[60];
-cx q[60],q[24];
-u1(-pi/137438953472) q[24];
-cx q[60],q[24];
-u1(pi/137438953472) q[24];
-u1(pi/68719476736) q[60];
-cx q[60],q[25];
-u1(-pi/68719476736) q[25];
-cx q[60],q[25];
-u1(pi/68719476736) q[25];
-u1(pi/34359738368) q[60];
-cx q[60],q[26];
-u1(-pi/34359738368) q[26];
-cx q[60],q[26];
-u1(pi/34359738368) q[26];
-u1(pi/17179869184) q[60];
-cx q[60],q[27];
-u1(-pi/17179869184) q[27];
-cx q[60],q[27];
-u1(pi/17179869184) q[27];
-u1(pi/8589934592) q[60];
-cx q[60],q[28];
-u1(-pi/8589934592) q[28];
-cx q[60],q[28];
-u1(pi/8589934592) q[28];
-u1(pi/4294967296) q[60];
-cx q[60],q[29];
-u1(-pi/4294967296) q[29];
-cx q[60],q[29];
-u1(pi/4294967296) q[29];
-u1(pi/2147483648) q[60];
-cx q[60],q[30];
-u1(-pi/2147483648) q[30];
-cx q[60],q[30];
-u1(pi/2147483648) q[30];
-u1(pi/1073741824) q[60];
-cx q[60],q[31];
-u1(-pi/1073741824) q[31];
-cx q[60],q[31];
-u1(pi/1073741824) q[31];
-u1(pi/536870912) q[60];
-cx q[60],q[32];
-u1(-pi/536870912) q[32];
-cx q[60],q[32];
-u1(pi/536870912) q[32];
-u1(pi/268435456) q[60];
-cx q[60],q[33];
-u1(-pi/268435456) q[33];
-cx q[60],q[33];
-u1(pi/268435456) q[33];
-u1(pi/134217728) q[60];
-cx q[60],q[34];
-u1(-pi/134217728) q[34];
-cx q[60],q[34];
-u1(pi/134217728) q[34];
-u1(pi/67108864) q[60];
-cx q[60],q[35];
-u1(-pi/67108864) q[35];
-cx q[60],q[35];
-u1(pi/67108864) q[35];
-u1(pi/33554432) q[60];
-cx q[60],q[36];
-u1(-pi/33554432) q[36];
-cx q[60],q[36];
-u1(pi/33554432) q[36];
-u1(pi/16777216) q[60];
-cx q[60],q[37];
-u1(-pi/16777216) q[37];
-cx q[60],q[37];
-u1(pi/16777216) q[37];
-u1(pi/8388608) q[60];
-cx q[60],q[38];
-u1(-pi/8388608) q[38];
-cx q[60],q[38];
-u1(pi/8388608) q[38];
-u1(pi/4194304) q[60];
-cx q[60],q[39];
-u1(-pi/4194304) q[39];
-cx q[60],q[39];
-u1(pi/4194304) q[39];
-u1(pi/2097152) q[60];
-cx q[60],q[40];
-u1(-pi/2097152) q[40];
-cx q[60],q[40];
-u1(pi/2097152) q[40];
-u1(pi/1048576) q[60];
-cx q[60],q[41];
-u1(-pi/1048576) q[41];
-cx q[60],q[41];
-u1(pi/1048576) q[41];
-u1(pi/524288) q[60];
-cx q[60],q[42];
-u1(-pi/524288) q[42];
-cx q[60],q[42];
-u1(pi/524288) q[42];
-u1(pi/262144) q[60];
-cx q[60],q[43];
-u1(-pi/262144) q[43];
-cx q[60],q[43];
-u1(pi/262144) q[43];
-u1(pi/131072) q[60];
-cx q[60],q[44];
-u1(-pi/131072) q[44];
-cx q[60],q[44];
-u1(pi/131072) q[44];
-u1(pi/65536) q[60];
-cx q[60],q[45];
-u1(-pi/65536) q[45];
-cx q[60],q[45];
-u1(pi/65536) q[45];
-u1(pi/32768) q[60];
-cx q[60],q[46];
-u1(-pi/32768) q[46];
-cx q[60],q[46];
-u1(pi/32768) q[46];
-u1(pi/16384) q[60];
-cx q[60],q[47];
-u1(-pi/16384) q[47];
-cx q[60],q[47];
-u1(pi/16384) q[47];
-u1(pi/8192) q[60];
-cx q[60],q[48];
-u1(-pi/8192) q[48];
-cx q[60],q[48];
-u1(pi/8192) q[48];
-u1(pi/4096) q[60];
-cx q[60],q[49];
-u1(-pi/4096) q[49];
-cx q[60],q[49];
-u1(pi/4096) q[49];
-u1(pi/2048) q[60];
-cx q[60],q[50];
-u1(-pi/2048) q[50];
-cx q[60],q[50];
-u1(pi/2048) q[50];
-u1(pi/1024) q[60];
-cx q[60],q[51];
-u1(-pi/1024) q[51];
-cx q[60],q[51];
-u1(pi/1024) q[51];
-u1(pi/512) q[60];
-cx q[60],q[52];
-u1(-pi/512) q[52];
-cx q[60],q[52];
-u1(pi/512) q[52];
-u1(pi/256) q[60];
-cx q[60],q[53];
-u1(-pi/256) q[53];
-cx q[60],q[53];
-u1(pi/256) q[53];
-u1(pi/128) q[60];
-cx q[60],q[54];
-u1(-pi/128) q[54];
-cx q[60],q[54];
-u1(pi/128) q[54];
-u1(pi/64) q[60];
-cx q[60],q[55];
-u1(-pi/64) q[55];
-cx q[60],q[55];
-u1(pi/64) q[55];
-u1(pi/32) q[60];
-cx q[60],q[56];
-u1(-pi/32) q[56];
-cx q[60],q[56];
-u1(pi/32) q[56];
-u1(pi/16) q[60];
-cx q[60],q[57];
-u1(-pi/16) q[57];
-cx q[60],q[57];
-u1(pi/16) q[57];
-u1(pi/8) q[60];
-cx q[60],q[58];
-u1(-pi/8) q[58];
-cx q[60],q[58];
-u1(pi/8) q[58];
-u1(pi/4) q[60];
-cx q[60],q[59];
-u1(-pi/4) q[59];
-cx q[60],q[59];
-u1(pi/4) q[59];
-h q[60];
-u1(0) q[61];
-cx q[61],q[0];
-u1(0) q[0];
-cx q[61],q[0];
-u1(0) q[0];
-u1(0) q[61];
-cx q[61],q[1];
-u1(0) q[1];
-cx q[61],q[1];
-u1(0) q[1];
-u1(0) q[61];
-cx q[61],q[2];
-u1(0) q[2];
-cx q[61],q[2];
-u1(0) q[2];
-u1(0) q[61];
-cx q[61],q[3];
-u1(0) q[3];
-cx q[61],q[3];
-u1(0) q[3];
-u1(0) q[61];
-cx q[61],q[4];
-u1(0) q[4];
-cx q[61],q[4];
-u1(0) q[4];
-u1(0) q[61];
-cx q[61],q[5];
-u1(0) q[5];
-cx q[61],q[5];
-u1(0) q[5];
-u1(0) q[61];
-cx q[61],q[6];
-u1(0) q[6];
-cx q[61],q[6];
-u1(0) q[6];
-u1(0) q[61];
-cx q[61],q[7];
-u1(0) q[7];
-cx q[61],q[7];
-u1(0) q[7];
-u1(0) q[61];
-cx q[61],q[8];
-u1(0) q[8];
-cx q[61],q[8];
-u1(0) q[8];
-u1(0) q[61];
-cx q[61],q[9];
-u1(0) q[9];
-cx q[61],q[9];
-u1(0) q[9];
-u1(0) q[61];
-cx q[61],q[10];
-u1(0) q[10];
-cx q[61],q[10];
-u1(0) q[10];
-u1(0) q[61];
-cx q[61],q[11];
-u1(0) q[11];
-cx q[61],q[11];
-u1(0) q[11];
-u1(0) q[61];
-cx q[61],q[12];
-u1(0) q[12];
-cx q[61],q[12];
-u1(0) q[12];
-u1(0) q[61];
-cx q[61],q[13];
-u1(0) q[13];
-cx q[61],q[13];
-u1(0) q[13];
-u1(pi/281474976710656) q[61];
-cx q[61],q[14];
-u1(-pi/281474976710656) q[14];
-cx q[61],q[14];
-u1(pi/281474976710656) q[14];
-u1(pi/140737488355328) q[61];
-cx q[61],q[15];
-u1(-pi/140737488355328) q[15];
-cx q[61],q[15];
-u1(pi/140737488355328) q[15];
-u1(pi/70368744177664) q[61];
-cx q[61],q[16];
-u1(-pi/70368744177664) q[16];
-cx q[61],q[16];
-u1(pi/70368744177664) q[16];
-u1(pi/35184372088832) q[61];
-cx q[61],q[17];
-u1(-pi/35184372088832) q[17];
-cx q[61],q[17];
-u1(pi/35184372088832) q[17];
-u1(pi/17592186044416) q[61];
-cx q[61],q[18];
-u1(-pi/17592186044416) q[18];
-cx q[61],q[18];
-u1(pi/17592186044416) q[18];
-u1(pi/8796093022208) q[61];
-cx q[61],q[19];
-u1(-pi/8796093022208) q[19];
-cx q[61],q[19];
-u1(pi/8796093022208) q[19];
-u1(pi/4398046511104) q[61];
-cx q[61],q[20];
-u1(-pi/4398046511104) q[20];
-cx q[61],q[20];
-u1(pi/4398046511104) q[20];
-u1(pi/2199023255552) q[61];
-cx q[61],q[21];
-u1(-pi/2199023255552) q[21];
-cx q[61],q[21];
-u1(pi/2199023255552) q[21];
-u1(pi/1099511627776) q[61];
-cx q[61],q[22];
-u1(-pi/1099511627776) q[22];
-cx q[61],q[22];
-u1(pi/1099511627776) q[22];
-u1(pi/549755813888) q[61];
-cx q[61],q[23];
-u1(-pi/549755813888) q[23];
-cx q[61],q[23];
-u1(pi/549755813888) q[23];
-u1(pi/274877906944) q[61];
-cx q[61],q[24];
-u1(-pi/274877906944) q[24];
-cx q[61],q[24];
-u1(pi/274877906944) q[24];
-u1(pi/137438953472) q[61];
-cx q[61],q[25];
-u1(-pi/137438953472) q[25];
-cx q[61],q[25];
-u1(pi/137438953472) q[25];
-u1(pi/68719476736) q[61];
-cx q[61],q[26];
-u1(-pi/68719476736) q[26];
-cx q[61],q[26];
-u1(pi/68719476736) q[26];
-u1(pi/34359738368) q[61];
-cx q[61],q[27];
-u1(-pi/34359738368) q[27];
-cx q[61],q[27];
-u1(pi/34359738368) q[27];
-u1(pi/17179869184) q[61];
-cx q[61],q[28];
-u1(-pi/17179869184) q[28];
-cx q[61],q[28];
-u1(pi/17179869184) q[28];
-u1(pi/8589934592) q[61];
-cx q[61],q[29];
-u1(-pi/8589934592) q[29];
-cx q[61],q[29];
-u1(pi/8589934592) q[29];
-u1(pi/4294967296) q[61];
-cx q[61],q[30];
-u1(-pi/4294967296) q[30];
-cx q[61],q[30];
-u1(pi/4294967296) q[30];
-u1(pi/2147483648) q[61];
-cx q[61],q[31];
-u1(-pi/2147483648) q[31];
-cx q[61],q[31];
-u1(pi/2147483648) q[31];
-u1(pi/1073741824) q[61];
-cx q[61],q[32];
-u1(-pi/1073741824) q[32];
-cx q[61],q[32];
-u1(pi/1073741824) q[32];
-u1(pi/536870912) q[61];
-cx q[61],q[33];
-u1(-pi/536870912) q[33];
-cx q[61],q[33];
-u1(pi/536870912) q[33];
-u1(pi/268435456) q[61];
-cx q[61],q[34];
-u1(-pi/268435456) q[34];
-cx q[61],q[34];
-u1(pi/268435456) q[34];
-u1(pi/134217728) q[61];
-cx q[61],q[35];
-u1(-pi/134217728) q[35];
-cx q[61],q[35];
-u1(pi/134217728) q[35];
-u1(pi/67108864) q[61];
-cx q[61],q[36];
-u1(-pi/67108864) q[36];
-cx q[61],q[36];
-u1(pi/67108864) q[36];
-u1(pi/33554432) q[61];
-cx q[61],q[37];
-u1(-pi/33554432) q[37];
-cx q[61],q[37];
-u1(pi/33554432) q[37];
-u1(pi/16777216) q[61];
-cx q[61],q[38];
-u1(-pi/16777216) q[38];
-cx q[61],q[38];
-u1(pi/16777216) q[38];
-u1(pi/8388608) q[61];
-cx q[61],q[39];
-u1(-pi/8388608) q[39];
-cx q[61],q[39];
-u1(pi/8388608) q[39];
-u1(pi/4194304) q[61];
-cx q[61],q[40];
-u1(-pi/4194304) q[40];
-cx q[61],q[40];
-u1(pi/4194304) q[40];
-u1(pi/2097152) q[61];
-cx q[61],q[41];
-u1(-pi/2097152) q[41];
-cx q[61],q[41];
-u1(pi/2097152) q[41];
-u1(pi/1048576) q[61];
-cx q[61],q[42];
-u1(-pi/1048576) q[42];
-cx q[61],q[42];
-u1(pi/1048576) q[42];
-u1(pi/524288) q[61];
-cx q[61],q[43];
-u1(-pi/524288) q[43];
-cx q[61],q[43];
-u1(pi/524288) q[43];
-u1(pi/262144) q[61];
-cx q[61],q[44];
-u1(-pi/262144) q[44];
-cx q[61],q[44];
-u1(pi/262144) q[44];
-u1(pi/131072) q[61];
-cx q[61],q[45];
-u1(-pi/131072) q[45];
-cx q[61],q[45];
-u1(pi/131072) q[45];
-u1(pi/65536) q[61];
-cx q[61],q[46];
-u1(-pi/65536) q[46];
-cx q[61],q[46];
-u1(pi/65536) q[46];
-u1(pi/32768) q[61];
-cx q[61],q[47];
-u1(-pi/32768) q[47];
-cx q[61],q[47];
-u1(pi/32768) q[47];
-u1(pi/16384) q[61];
-cx q[61],q[48];
-u1(-pi/16384) q[48];
-cx q[61],q[48];
-u1(pi/16384) q[48];
-u1(pi/8192) q[61];
-cx q[61],q[49];
-u1(-pi/8192) q[49];
-cx q[61],q[49];
-u1(pi/8192) q[49];
-u1(pi/4096) q[61];
-cx q[61],q[50];
-u1(-pi/4096) q[50];
-cx q[61],q[50];
-u1(pi/4096) q[50];
-u1(pi/2048) q[61];
-cx q[61],q[51];
-u1(-pi/2048) q[51];
-cx q[61],q[51];
-u1(pi/2048) q[51];
-u1(pi/1024) q[61];
-cx q[61],q[52];
-u1(-pi/1024) q[52];
-cx q[61],q[52];
-u1(pi/1024) q[52];
-u1(pi/512) q[61];
-cx q[61],q[53];
-u1(-pi/512) q[53];
-cx q[61],q[53];
-u1(pi/512) q[53];
-u1(pi/256) q[61];
-cx q[61],q[54];
-u1(-pi/256) q[54];
-cx q[61],q[54];
-u1(pi/256) q[54];
-u1(pi/128) q[61];
-cx q[61],q[55];
-u1(-pi/128) q[55];
-cx q[61],q[55];
-u1(pi/128) q[55];
-u1(pi/64) q[61];
-cx q[61],q[56];
-u1(-pi/64) q[56];
-cx q[61],q[56];
-u1(pi/64) q[56];
-u1(pi/32) q[61];
-cx q[61],q[57];
-u1(-pi/32) q[57];
-cx q[61],q[57];
-u1(pi/32) q[57];
-u1(pi/16) q[61];
-cx q[61],q[58];
-u1(-pi/16) q[58];
-cx q[61],q[58];
-u1(pi/16) q[58];
-u1(pi/8) q[61];
-cx q[61],q[59];
-u1(-pi/8) q[59];
-cx q[61],q[59];
-u1(pi/8) q[59];
-u1(pi/4) q[61];
-cx q[61],q[60];
-u1(-pi/4) q[60];
-cx q[61],q[60];
-u1(pi/4) q[60];
-h q[61];
-u1(0) q[62];
-cx q[62],q[0];
-u1(0) q[0];
-cx q[62],q[0];
-u1(0) q[0];
-u1(0) q[62];
-cx q[62],q[1];
-u1(0) q[1];
-cx q[62],q[1];
-u1(0) q[1];
-u1(0) q[62];
-cx q[62],q[2];
-u1(0) q[2];
-cx q[62],q[2];
-u1(0) q[2];
-u1(0) q[62];
-cx q[62],q[3];
-u1(0) q[3];
-cx q[62],q[3];
-u1(0) q[3];
-u1(0) q[62];
-cx q[62],q[4];
-u1(0) q[4];
-cx q[62],q[4];
-u1(0) q[4];
-u1(0) q[62];
-cx q[62],q[5];
-u1(0) q[5];
-cx q[62],q[5];
-u1(0) q[5];
-u1(0) q[62];
-cx q[62],q[6];
-u1(0) q[6];
-cx q[62],q[6];
-u1(0) q[6];
-u1(0) q[62];
-cx q[62],q[7];
-u1(0) q[7];
-cx q[62],q[7];
-u1(0) q[7];
-u1(0) q[62];
-cx q[62],q[8];
-u1(0) q[8];
-cx q[62],q[8];
-u1(0) q[8];
-u1(0) q[62];
-cx q[62],q[9];
-u1(0) q[9];
-cx q[62],q[9];
-u1(0) q[9];
-u1(0) q[62];
-cx q[62],q[10];
-u1(0) q[10];
-cx q[62],q[10];
-u1(0) q[10];
-u1(0) q[62];
-cx q[62],q[11];
-u1(0) q[11];
-cx q[62],q[11];
-u1(0) q[11];
-u1(0) q[62];
-cx q[62],q[12];
-u1(0) q[12];
-cx q[62],q[12];
-u1(0) q[12];
-u1(0) q[62];
-cx q[62],q[13];
-u1(0) q[13];
-cx q[62],q[13];
-u1(0) q[13];
-u1(0) q[62];
-cx q[62],q[14];
-u1(0) q[14];
-cx q[62],q[14];
-u1(0) q[14];
-u1(pi/281474976710656) q[62];
-cx q[62],q[15];
-u1(-pi/281474976710656) q[15];
-cx q[62],q[15];
-u1(pi/281474976710656) q[15];
-u1(pi/140737488355328) q[62];
-cx q[62],q[16];
-u1(-pi/140737488355328) q[16];
-cx q[62],q[16];
-u1(pi/140737488355328) q[16];
-u1(pi/70368744177664) q[62];
-cx q[62],q[17];
-u1(-pi/70368744177664) q[17];
-cx q[62],q[17];
-u1(pi/70368744177664) q[17];
-u1(pi/35184372088832) q[62];
-cx q[62],q[18];
-u1(-pi/35184372088832) q[18];
-cx q[62],q[18];
-u1(pi/35184372088832) q[18];
-u1(pi/17592186044416) q[62];
-cx q[62],q[19];
-u1(-pi/17592186044416) q[19];
-cx q[62],q[19];
-u1(pi/17592186044416) q[19];
-u1(pi/8796093022208) q[62];
-cx q[62],q[20];
-u1(-pi/8796093022208) q[20];
-cx q[62],q[20];
-u1(pi/8796093022208) q[20];
-u1(pi/4398046511104) q[62];
-cx q[62],q[21];
-u1(-pi/4398046511104) q[21];
-cx q[62],q[21];
-u1(pi/4398046511104) q[21];
-u1(pi/2199023255552) q[62];
-cx q[62],q[22];
-u1(-pi/2199023255552) q[22];
-cx q[62],q[22];
-u1(pi/2199023255552) q[22];
-u1(pi/1099511627776) q[62];
-cx q[62],q[23];
-u1(-pi/1099511627776) q[23];
-cx q[62],q[23];
-u1(pi/1099511627776) q[23];
-u1(pi/549755813888) q[62];
-cx q[62],q[24];
-u1(-pi/549755813888) q[24];
-cx q[62],q[24];
-u1(pi/549755813888) q[24];
-u1(pi/274877906944) q[62];
-cx q[62],q[25];
-u1(-pi/274877906944) q[25];
-cx q[62],q[25];
-u1(pi/274877906944) q[25];
-u1(pi/137438953472) q[62];
-cx q[62],q[26];
-u1(-pi/137438953472) q[26];
-cx q[62],q[26];
-u1(pi/137438953472) q[26];
-u1(pi/68719476736) q[62];
-cx q[62],q[27];
-u1(-pi/68719476736) q[27];
-cx q[62],q[27];
-u1(pi/68719476736) q[27];
-u1(pi/34359738368) q[62];
-cx q[62],q[28];
-u1(-pi/34359738368) q[28];
-cx q[62],q[28];
-u1(pi/34359738368) q[28];
-u1(pi/17179869184) q[62];
-cx q[62],q[29];
-u1(-pi/17179869184) q[29];
-cx q[62],q[29];
-u1(pi/17179869184) q[29];
-u1(pi/8589934592) q[62];
-cx q[62],q[30];
-u1(-pi/8589934592) q[30];
-cx q[62],q[30];
-u1(pi/8589934592) q[30];
-u1(pi/4294967296) q[62];
-cx q[62],q[31];
-u1(-pi/4294967296) q[31];
-cx q[62],q[31];
-u1(pi/4294967296) q[31];
-u1(pi/2147483648) q[62];
-cx q[62],q[32];
-u1(-pi/2147483648) q[32];
-cx q[62],q[32];
-u1(pi/2147483648) q[32];
-u1(pi/1073741824) q[62];
-cx q[62],q[33];
-u1(-pi/1073741824) q[33];
-cx q[62],q[33];
-u1(pi/1073741824) q[33];
-u1(pi/536870912) q[62];
-cx q[62],q[34];
-u1(-pi/536870912) q[34];
-cx q[62],q[34];
-u1(pi/536870912) q[34];
-u1(pi/268435456) q[62];
-cx q[62],q[35];
-u1(-pi/268435456) q[35];
-cx q[62],q[35];
-u1(pi/268435456) q[35];
-u1(pi/134217728) q[62];
-cx q[62],q[36];
-u1(-pi/134217728) q[36];
-cx q[62],q[36];
-u1(pi/134217728) q[36];
-u1(pi/67108864) q[62];
-cx q[62],q[37];
-u1(-pi/67108864) q[37];
-cx q[62],q[37];
-u1(pi/67108864) q[37];
-u1(pi/33554432) q[62];
-cx q[62],q[38];
-u1(-pi/33554432) q[38];
-cx q[62],q[38];
-u1(pi/33554432) q[38];
-u1(pi/16777216) q[62];
-cx q[62],q[39];
-u1(-pi/16777216) q[39];
-cx q[62],q[39];
-u1(pi/16777216) q[39];
-u1(pi/8388608) q[62];
-cx q[62],q[40];
-u1(-pi/8388608) q[40];
-cx q[62],q[40];
-u1(pi/8388608) q[40];
-u1(pi/4194304) q[62];
-cx q[62],q[41];
-u1(-pi/4194304) q[41];
-cx q[62],q[41];
-u1(pi/4194304) q[41];
-u1(pi/2097152) q[62];
-cx q[62],q[42];
-u1(-pi/2097152) q[42];
-cx q[62],q[42];
-u1(pi/2097152) q[42];
-u1(pi/1048576) q[62];
-cx q[62],q[43];
-u1(-pi/1048576) q[43];
-cx q[62],q[43];
-u1(pi/1048576) q[43];
-u1(pi/524288) q[62];
-cx q[62],q[44];
-u1(-pi/524288) q[44];
-cx q[62],q[44];
-u1(pi/524288) q[44];
-u1(pi/262144) q[62];
-cx q[62],q[45];
-u1(-pi/262144) q[45];
-cx q[62],q[45];
-u1(pi/262144) q[45];
-u1(pi/131072) q[62];
-cx q[62],q[46];
-u1(-pi/131072) q[46];
-cx q[62],q[46];
-u1(pi/131072) q[46];
-u1(pi/65536) q[62];
-cx q[62],q[47];
-u1(-pi/65536) q[47];
-cx q[62],q[47];
-u1(pi/65536) q[47];
-u1(pi/32768) q[62];
-cx q[62],q[48];
-u1(-pi/32768) q[48];
-cx q[62],q[48];
-u1(pi/32768) q[48];
-u1(pi/16384) q[62];
-cx q[62],q[49];
-u1(-pi/16384) q[49];
-cx q[62],q[49];
-u1(pi/16384) q[49];
-u1(pi/8192) q[62];
-cx q[62],q[50];
-u1(-pi/8192) q[50];
-cx q[62],q[50];
-u1(pi/8192) q[50];
-u1(pi/4096) q[62];
-cx q[62],q[51];
-u1(-pi/4096) q[51];
-cx q[62],q[51];
-u1(pi/4096) q[51];
-u1(pi/2048) q[62];
-cx q[62],q[52];
-u1(-pi/2048) q[52];
-cx q[62],q[52];
-u1(pi/2048) q[52];
-u1(pi/1024) q[62];
-cx q[62],q[53];
-u1(-pi/1024) q[53];
-cx q[62],q[53];
-u1(pi/1024) q[53];
-u1(pi/512) q[62];
-cx q[62],q[54];
-u1(-pi/512) q[54];
-cx q[62],q[54];
-u1(pi/512) q[54];
-u1(pi/256) q[62];
-cx q[62],q[55];
-u1(-pi/256) q[55];
-cx q[62],q[55];
-u1(pi/256) q[55];
-u1(pi/128) q[62];
-cx q[62],q[56];
-u1(-pi/128) q[56];
-cx q[62],q[56];
-u1(pi/128) q[56];
-u1(pi/64) q[62];
-cx q[62],q[57];
-u1(-pi/64) q[57];
-cx q[62],q[57];
-u1(pi/64) q[57];
-u1(pi/32) q[62];
-cx q[62],q[58];
-u1(-pi/32) q[58];
-cx q[62],q[58];
-u1(pi/32) q[58];
-u1(pi/16) q[62];
-cx q[62],q[59];
-u1(-pi/16) q[59];
-cx q[62],q[59];
-u1(pi/16) q[59];
-u1(pi/8) q[62];
-cx q[62],q[60];
-u1(-pi/8) q[60];
-cx q[62],q[60];
-u1(pi/8) q[60];
-u1(pi/4) q[62];
-cx q[62],q[61];
-u1(-pi/4) q[61];
-cx q[62],q[61];
-u1(pi/4) q[61];
-h q[62];
-barrier q[0],q[1],q[2],q[3],q[4],q[5],q[6],q[7],q[8],q[9],q[10],q[11],q[12],q[13],q[14],q[15],q[16],q[17],q[18],q[19],q[20],q[21],q[22],q[23],q[24],q[25],q[26],q[27],q[28],q[29],q[30],q[31],q[32],q[33],q[34],q[35],q[36],q[37],q[38],q[39],q[40],q[41],q[42],q[43],q[44],q[45],q[46],q[47],q[48],q[49],q[50],q[51],q[52],q[53],q[54],q[55],q[56],q[57],q[58],q[59],q[60],q[61],q[62];
-measure q[0] -> meas[0];
-measure q[1] -> meas[1];
-measure q[2] -> meas[2];
-measure q[3] -> meas[3];
-measure q[4] -> meas[4];
-measure q[5] -> meas[5];
-measure q[6] -> meas[6];
-measure q[7] -> meas[7];
-measure q[8] -> meas[8];
-measure q[9] -> meas[9];
-measure q[10] -> meas[10];
-measure q[11] -> meas[11];
-measure q[12] -> meas[12];
-measure q[13] -> meas[13];
-measure q[14] -> meas[14];
-measure q[15] -> meas[15];
-measure q[16] -> meas[16];
-measure q[17] -> meas[17];
-measure q[18] -> meas[18];
-measure q[19] -> meas[19];
-measure q[20] -> meas[20];
-measure q[21] -> meas[21];
-measure q[22] -> meas[22];
-measure q[23] -> meas[23];
-measure q[24] -> meas[24];
-measure q[25] -> meas[25];
-measure q[26] -> meas[26];
-measure q[27] -> meas[27];
-measure q[28] -> meas[28];
-measure q[29] -> meas[29];
-measure q[30] -> meas[30];
-measure q[31] -> meas[31];
-measure q[32] -> meas[32];
-measure q[33] -> meas[33];
-measure q[34] -> meas[34];
-measure q[35] -> meas[35];
-measure q[36] -> meas[36];
-measure q[37] -> meas[37];
-measure q[38] -> meas[38];
-measure q[39] -> meas[39];
-measure q[40] -> meas[40];
-measure q[41] -> meas[41];
-measure q[42] -> meas[42];
-measure q[43] -> meas[43];
-measure q[44] -> meas[44];
-measure q[45] -> meas[45];
-measure q[46] -> meas[46];
-measure q[47] -> meas[47];
-measure q[48] -> meas[48];
-measure q[49] -> meas[49];
-measure q[50] -> meas[50];
-measure q[51] -> meas[51];
-measure q[52] -> meas[52];
-measure q[53] -> meas[53];
-measure q[54] -> meas[54];
-measure q[55] -> meas[55];
-measure q[56] -> meas[56];
-measure q[57] -> meas[57];
-measure q[58] -> meas[58];
-measure q[59] -> meas[59];
-measure q[60] -> meas[60];
-measure q[61] -> meas[61];
-measure q[62] -> meas[62];
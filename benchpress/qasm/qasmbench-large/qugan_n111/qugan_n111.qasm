@@ -1,1529 +0,0 @@
-OPENQASM 2.0;
-include "qelib1.inc";
-gate cry(lambda) a,b
-{
-  ry(lambda/2) b;
-  cx a,b;
-  ry(-lambda/2) b;
-  cx a,b;
-}
-gate ryy(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(2.5637222) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140310028070240(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(0.2108704) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140310028070288(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(0.51369547) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140310028070480(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(2.8238647) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140310028070624(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(1.3477687) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140310028070768(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(2.0249589) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140310028095552(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(0.43922448) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140310028095696(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(1.2584965) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140310028095840(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(1.8083655) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140310028095984(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(2.8770134) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140310028096128(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(1.1837205) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140310028096272(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(2.8247172) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140310028096416(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(0.73135464) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140310028096560(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(1.0803831) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140310028096704(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(0.3345058) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140310028096848(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(0.92235506) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140310028096992(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(0.2940848) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140310028097136(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(2.0604343) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140310028097280(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(1.4779059) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140310028097424(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(1.0765142) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140310028097568(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(0.37819689) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140310028097712(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(1.2369987) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140310028097856(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(1.489163) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140310028098000(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(2.8755004) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140310028098144(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(2.6589816) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140310028098288(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(0.95838142) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140310028098432(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(1.8541361) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140310028098576(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(1.9303154) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140310028098720(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(0.70034427) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140310028098864(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(1.1611626) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140310028099008(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(0.12161016) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140310028099152(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(2.3137336) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140310028099296(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(2.8157716) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140310028099440(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(1.8876118) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140310028132416(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(0.75635977) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140310028132560(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(1.3626014) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140310028132704(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(2.0802224) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140310028132848(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(1.6552831) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140310028132992(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(0.39086101) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140310028133136(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(3.0113546) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140310028133280(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(1.3102658) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140310028133424(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(1.5840762) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140310028133568(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(2.5856628) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140310028133712(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(1.9590985) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140310028133856(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(2.6254829) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140310028134000(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(1.1261279) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140310028134144(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(2.1483767) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140310028134288(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(2.2246625) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140310028134432(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(2.9177984) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140310028134576(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(0.91076904) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140310028134720(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(1.4027166) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140310028134864(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(0.26611291) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140310028135008(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(1.6216331) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140310028135152(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(2.0714958) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140310028135296(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(3.0566959) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140310028135440(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(2.8694781) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140310028135584(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(0.48278117) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140310028135728(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(1.824497) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140310028135872(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(2.6647255) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140310028136016(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(2.1300967) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140310028136160(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(1.0408431) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140310028136304(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(2.6704929) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140310028165184(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(1.4606507) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140310028165328(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(2.7149738) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140310028165472(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(1.3806377) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140310028165616(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(2.9430886) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140310028165760(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(0.23627111) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140310028165904(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(1.9810158) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140310028166048(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(2.5105756) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140310028166192(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(1.2427889) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140310028166336(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(1.4203298) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140310028166480(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(0.74631883) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140310028166624(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(2.5600028) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140310028166768(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(1.4298412) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140310028166912(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(1.3683175) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140310028167056(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(2.3584912) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140310028167200(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(0.81695589) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140310028167344(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(1.283897) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140310028167488(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(2.2676042) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140310028167632(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(0.37348451) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140310028167776(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(0.73232847) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140310028167920(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(1.2752985) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140310028168064(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(0.9433834) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140310028168208(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(0.56679944) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140310028168352(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(2.8725646) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140310028168496(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(2.2350797) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140310028168640(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(1.6881056) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140310028168784(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(2.9399296) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140310028168928(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(1.0792485) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140310028169072(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(1.4255663) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140310028202048(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(2.1346978) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140310028202192(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(0.3178141) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140310028202336(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(1.3791102) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140310028202480(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(0.31457219) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140310028202624(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(2.6029457) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140310028202768(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(0.38966741) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140310028202912(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(2.2942652) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140310028203056(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(0.32027946) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140310028203200(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(1.3616667) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140310028203344(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(2.2357687) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140310028203488(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(1.9949377) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140310028203632(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(2.8786892) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140310028203776(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(0.24862676) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140310028203920(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(0.92048106) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140310028204064(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(0.59693891) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140310028204208(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(0.51329017) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140310028204352(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(1.9968497) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140310028204496(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(1.336929) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-qreg q0[111];
-creg c0[55];
-ry(3.1204404) q0[1];
-ry(1.7891383) q0[2];
-ry(0.32300517) q0[3];
-ry(0.11540927) q0[4];
-ry(2.1654056) q0[5];
-ry(0.86592384) q0[6];
-ry(1.090019) q0[7];
-ry(0.55369201) q0[8];
-ry(2.5922672) q0[9];
-ry(2.2331653) q0[10];
-ry(3.0781087) q0[11];
-ry(1.6134564) q0[12];
-ry(1.7841618) q0[13];
-ry(1.8052335) q0[14];
-ry(2.6279578) q0[15];
-ry(0.76409858) q0[16];
-ry(2.212253) q0[17];
-ry(0.62136589) q0[18];
-ry(0.79025238) q0[19];
-ry(1.3689065) q0[20];
-ry(2.4277327) q0[21];
-ry(0.17382031) q0[22];
-ry(1.7671684) q0[23];
-ry(1.4180674) q0[24];
-ry(0.69351577) q0[25];
-ry(1.0955155) q0[26];
-ry(2.1016888) q0[27];
-ry(0.43624399) q0[28];
-ry(2.3723833) q0[29];
-ry(0.43302403) q0[30];
-ry(1.3289846) q0[31];
-ry(1.484815) q0[32];
-ry(3.13281) q0[33];
-ry(2.6082425) q0[34];
-ry(1.2250795) q0[35];
-ry(1.6529141) q0[36];
-ry(1.9126456) q0[37];
-ry(2.5925507) q0[38];
-ry(1.239433) q0[39];
-ry(1.7132152) q0[40];
-ry(0.20185697) q0[41];
-ry(1.4297044) q0[42];
-ry(3.0798088) q0[43];
-ry(0.71655602) q0[44];
-ry(2.4177944) q0[45];
-ry(2.6378762) q0[46];
-ry(2.0445065) q0[47];
-ry(2.9996053) q0[48];
-ry(0.98778128) q0[49];
-ry(2.9146619) q0[50];
-ry(2.4087536) q0[51];
-ry(0.29445382) q0[52];
-ry(1.5838136) q0[53];
-ry(2.6909684) q0[54];
-ry(2.947646) q0[55];
-ry(3.1215422) q0[56];
-ry(0.78828941) q0[57];
-ry(0.94323992) q0[58];
-ry(2.8735258) q0[59];
-ry(0.84399775) q0[60];
-ry(1.7669334) q0[61];
-ry(0.4374749) q0[62];
-ry(3.0765902) q0[63];
-ry(2.6785426) q0[64];
-ry(0.096487671) q0[65];
-ry(1.7758095) q0[66];
-ry(2.9063449) q0[67];
-ry(2.4915022) q0[68];
-ry(2.4374524) q0[69];
-ry(1.1801639) q0[70];
-ry(0.75220483) q0[71];
-ry(0.65151532) q0[72];
-ry(0.63273516) q0[73];
-ry(0.46986542) q0[74];
-ry(2.8145417) q0[75];
-ry(3.0835165) q0[76];
-ry(2.5606492) q0[77];
-ry(2.9912538) q0[78];
-ry(0.28814541) q0[79];
-ry(0.83758492) q0[80];
-ry(0.85842636) q0[81];
-ry(1.0611267) q0[82];
-ry(1.5533722) q0[83];
-ry(2.3855186) q0[84];
-ry(2.1463239) q0[85];
-ry(0.42448099) q0[86];
-ry(1.4338093) q0[87];
-ry(2.7967341) q0[88];
-ry(0.17070267) q0[89];
-ry(1.6690391) q0[90];
-ry(0.24944556) q0[91];
-ry(0.61222913) q0[92];
-ry(1.4645165) q0[93];
-ry(1.5299084) q0[94];
-ry(3.0804031) q0[95];
-ry(1.5298344) q0[96];
-ry(2.60582) q0[97];
-ry(1.4487496) q0[98];
-ry(1.8313782) q0[99];
-ry(2.1333211) q0[100];
-ry(2.605398) q0[101];
-ry(1.5510535) q0[102];
-ry(1.3957899) q0[103];
-ry(0.50104014) q0[104];
-ry(0.4092344) q0[105];
-ry(1.3162278) q0[106];
-ry(2.5227595) q0[107];
-ry(2.0135545) q0[108];
-ry(1.324608) q0[109];
-ry(0.75480402) q0[110];
-ryy(2.5637222) q0[1],q0[2];
-cry(1.1280893) q0[1],q0[2];
-ryy_140310028070240(0.2108704) q0[2],q0[3];
-cry(0.12513909) q0[2],q0[3];
-ryy_140310028070288(0.51369547) q0[3],q0[4];
-cry(2.533284) q0[3],q0[4];
-ryy_140310028070480(2.8238647) q0[4],q0[5];
-cry(1.6258131) q0[4],q0[5];
-ryy_140310028070624(1.3477687) q0[5],q0[6];
-cry(2.6097237) q0[5],q0[6];
-ryy_140310028070768(2.0249589) q0[6],q0[7];
-cry(2.3342389) q0[6],q0[7];
-ryy_140310028095552(0.43922448) q0[7],q0[8];
-cry(1.098942) q0[7],q0[8];
-ryy_140310028095696(1.2584965) q0[8],q0[9];
-cry(0.44187187) q0[8],q0[9];
-ryy_140310028095840(1.8083655) q0[9],q0[10];
-cry(1.4837289) q0[9],q0[10];
-ryy_140310028095984(2.8770134) q0[10],q0[11];
-cry(0.60685626) q0[10],q0[11];
-ryy_140310028096128(1.1837205) q0[11],q0[12];
-cry(2.9517027) q0[11],q0[12];
-ryy_140310028096272(2.8247172) q0[12],q0[13];
-cry(1.5813898) q0[12],q0[13];
-ryy_140310028096416(0.73135464) q0[13],q0[14];
-cry(1.8202954) q0[13],q0[14];
-ryy_140310028096560(1.0803831) q0[14],q0[15];
-cry(2.0391383) q0[14],q0[15];
-ryy_140310028096704(0.3345058) q0[15],q0[16];
-cry(3.1197315) q0[15],q0[16];
-ryy_140310028096848(0.92235506) q0[16],q0[17];
-cry(0.55869367) q0[16],q0[17];
-ryy_140310028096992(0.2940848) q0[17],q0[18];
-cry(0.65840396) q0[17],q0[18];
-ryy_140310028097136(2.0604343) q0[18],q0[19];
-cry(1.4985147) q0[18],q0[19];
-ryy_140310028097280(1.4779059) q0[19],q0[20];
-cry(0.926314) q0[19],q0[20];
-ryy_140310028097424(1.0765142) q0[20],q0[21];
-cry(0.42282986) q0[20],q0[21];
-ryy_140310028097568(0.37819689) q0[21],q0[22];
-cry(1.8656723) q0[21],q0[22];
-ryy_140310028097712(1.2369987) q0[22],q0[23];
-cry(3.0017633) q0[22],q0[23];
-ryy_140310028097856(1.489163) q0[23],q0[24];
-cry(1.9528969) q0[23],q0[24];
-ryy_140310028098000(2.8755004) q0[24],q0[25];
-cry(2.854216) q0[24],q0[25];
-ryy_140310028098144(2.6589816) q0[25],q0[26];
-cry(0.98066165) q0[25],q0[26];
-ryy_140310028098288(0.95838142) q0[26],q0[27];
-cry(2.5926205) q0[26],q0[27];
-ryy_140310028098432(1.8541361) q0[27],q0[28];
-cry(1.7932555) q0[27],q0[28];
-ryy_140310028098576(1.9303154) q0[28],q0[29];
-cry(0.72378801) q0[28],q0[29];
-ryy_140310028098720(0.70034427) q0[29],q0[30];
-cry(0.90542731) q0[29],q0[30];
-ryy_140310028098864(1.1611626) q0[30],q0[31];
-cry(1.0975841) q0[30],q0[31];
-ryy_140310028099008(0.12161016) q0[31],q0[32];
-cry(1.8639981) q0[31],q0[32];
-ryy_140310028099152(2.3137336) q0[32],q0[33];
-cry(2.8864027) q0[32],q0[33];
-ryy_140310028099296(2.8157716) q0[33],q0[34];
-cry(2.7402348) q0[33],q0[34];
-ryy_140310028099440(1.8876118) q0[34],q0[35];
-cry(0.38929342) q0[34],q0[35];
-ryy_140310028132416(0.75635977) q0[35],q0[36];
-cry(1.5922497) q0[35],q0[36];
-ryy_140310028132560(1.3626014) q0[36],q0[37];
-cry(2.4933759) q0[36],q0[37];
-ryy_140310028132704(2.0802224) q0[37],q0[38];
-cry(2.8228586) q0[37],q0[38];
-ryy_140310028132848(1.6552831) q0[38],q0[39];
-cry(1.6266618) q0[38],q0[39];
-ryy_140310028132992(0.39086101) q0[39],q0[40];
-cry(2.7017193) q0[39],q0[40];
-ryy_140310028133136(3.0113546) q0[40],q0[41];
-cry(1.4302886) q0[40],q0[41];
-ryy_140310028133280(1.3102658) q0[41],q0[42];
-cry(2.0465511) q0[41],q0[42];
-ryy_140310028133424(1.5840762) q0[42],q0[43];
-cry(0.24465289) q0[42],q0[43];
-ryy_140310028133568(2.5856628) q0[43],q0[44];
-cry(0.06907658) q0[43],q0[44];
-ryy_140310028133712(1.9590985) q0[44],q0[45];
-cry(2.2741064) q0[44],q0[45];
-ryy_140310028133856(2.6254829) q0[45],q0[46];
-cry(0.30416889) q0[45],q0[46];
-ryy_140310028134000(1.1261279) q0[46],q0[47];
-cry(0.60998206) q0[46],q0[47];
-ryy_140310028134144(2.1483767) q0[47],q0[48];
-cry(3.0822306) q0[47],q0[48];
-ryy_140310028134288(2.2246625) q0[48],q0[49];
-cry(2.5482734) q0[48],q0[49];
-ryy_140310028134432(2.9177984) q0[49],q0[50];
-cry(2.7601891) q0[49],q0[50];
-ryy_140310028134576(0.91076904) q0[50],q0[51];
-cry(2.9693718) q0[50],q0[51];
-ryy_140310028134720(1.4027166) q0[51],q0[52];
-cry(0.6449874) q0[51],q0[52];
-ryy_140310028134864(0.26611291) q0[52],q0[53];
-cry(3.0200684) q0[52],q0[53];
-ryy_140310028135008(1.6216331) q0[53],q0[54];
-cry(2.0395013) q0[53],q0[54];
-ryy_140310028135152(2.0714958) q0[54],q0[55];
-cry(0.20813013) q0[54],q0[55];
-ryy_140310028135296(3.0566959) q0[56],q0[57];
-cry(2.1301188) q0[56],q0[57];
-ryy_140310028135440(2.8694781) q0[57],q0[58];
-cry(1.3266167) q0[57],q0[58];
-ryy_140310028135584(0.48278117) q0[58],q0[59];
-cry(2.9209959) q0[58],q0[59];
-ryy_140310028135728(1.824497) q0[59],q0[60];
-cry(2.8684523) q0[59],q0[60];
-ryy_140310028135872(2.6647255) q0[60],q0[61];
-cry(2.9826309) q0[60],q0[61];
-ryy_140310028136016(2.1300967) q0[61],q0[62];
-cry(1.8529715) q0[61],q0[62];
-ryy_140310028136160(1.0408431) q0[62],q0[63];
-cry(3.0533325) q0[62],q0[63];
-ryy_140310028136304(2.6704929) q0[63],q0[64];
-cry(0.064263176) q0[63],q0[64];
-ryy_140310028165184(1.4606507) q0[64],q0[65];
-cry(2.073715) q0[64],q0[65];
-ryy_140310028165328(2.7149738) q0[65],q0[66];
-cry(0.36115351) q0[65],q0[66];
-ryy_140310028165472(1.3806377) q0[66],q0[67];
-cry(1.326552) q0[66],q0[67];
-ryy_140310028165616(2.9430886) q0[67],q0[68];
-cry(1.8197246) q0[67],q0[68];
-ryy_140310028165760(0.23627111) q0[68],q0[69];
-cry(0.7257511) q0[68],q0[69];
-ryy_140310028165904(1.9810158) q0[69],q0[70];
-cry(2.1533234) q0[69],q0[70];
-ryy_140310028166048(2.5105756) q0[70],q0[71];
-cry(2.9553829) q0[70],q0[71];
-ryy_140310028166192(1.2427889) q0[71],q0[72];
-cry(2.8284793) q0[71],q0[72];
-ryy_140310028166336(1.4203298) q0[72],q0[73];
-cry(3.1165885) q0[72],q0[73];
-ryy_140310028166480(0.74631883) q0[73],q0[74];
-cry(1.7430289) q0[73],q0[74];
-ryy_140310028166624(2.5600028) q0[74],q0[75];
-cry(2.8712283) q0[74],q0[75];
-ryy_140310028166768(1.4298412) q0[75],q0[76];
-cry(0.5964631) q0[75],q0[76];
-ryy_140310028166912(1.3683175) q0[76],q0[77];
-cry(2.6721554) q0[76],q0[77];
-ryy_140310028167056(2.3584912) q0[77],q0[78];
-cry(3.0921993) q0[77],q0[78];
-ryy_140310028167200(0.81695589) q0[78],q0[79];
-cry(1.8992097) q0[78],q0[79];
-ryy_140310028167344(1.283897) q0[79],q0[80];
-cry(1.1629911) q0[79],q0[80];
-ryy_140310028167488(2.2676042) q0[80],q0[81];
-cry(2.8462962) q0[80],q0[81];
-ryy_140310028167632(0.37348451) q0[81],q0[82];
-cry(0.52897834) q0[81],q0[82];
-ryy_140310028167776(0.73232847) q0[82],q0[83];
-cry(2.9480742) q0[82],q0[83];
-ryy_140310028167920(1.2752985) q0[83],q0[84];
-cry(2.4573023) q0[83],q0[84];
-ryy_140310028168064(0.9433834) q0[84],q0[85];
-cry(0.56045806) q0[84],q0[85];
-ryy_140310028168208(0.56679944) q0[85],q0[86];
-cry(1.4521064) q0[85],q0[86];
-ryy_140310028168352(2.8725646) q0[86],q0[87];
-cry(2.5534195) q0[86],q0[87];
-ryy_140310028168496(2.2350797) q0[87],q0[88];
-cry(2.002501) q0[87],q0[88];
-ryy_140310028168640(1.6881056) q0[88],q0[89];
-cry(2.157026) q0[88],q0[89];
-ryy_140310028168784(2.9399296) q0[89],q0[90];
-cry(0.60512317) q0[89],q0[90];
-ryy_140310028168928(1.0792485) q0[90],q0[91];
-cry(1.5439746) q0[90],q0[91];
-ryy_140310028169072(1.4255663) q0[91],q0[92];
-cry(2.9336907) q0[91],q0[92];
-ryy_140310028202048(2.1346978) q0[92],q0[93];
-cry(0.93577256) q0[92],q0[93];
-ryy_140310028202192(0.3178141) q0[93],q0[94];
-cry(2.4518602) q0[93],q0[94];
-ryy_140310028202336(1.3791102) q0[94],q0[95];
-cry(2.4163446) q0[94],q0[95];
-ryy_140310028202480(0.31457219) q0[95],q0[96];
-cry(2.5133458) q0[95],q0[96];
-ryy_140310028202624(2.6029457) q0[96],q0[97];
-cry(1.0433925) q0[96],q0[97];
-ryy_140310028202768(0.38966741) q0[97],q0[98];
-cry(1.9279261) q0[97],q0[98];
-ryy_140310028202912(2.2942652) q0[98],q0[99];
-cry(1.7044758) q0[98],q0[99];
-ryy_140310028203056(0.32027946) q0[99],q0[100];
-cry(2.2190229) q0[99],q0[100];
-ryy_140310028203200(1.3616667) q0[100],q0[101];
-cry(0.68614099) q0[100],q0[101];
-ryy_140310028203344(2.2357687) q0[101],q0[102];
-cry(1.9693699) q0[101],q0[102];
-ryy_140310028203488(1.9949377) q0[102],q0[103];
-cry(0.38573421) q0[102],q0[103];
-ryy_140310028203632(2.8786892) q0[103],q0[104];
-cry(0.83494815) q0[103],q0[104];
-ryy_140310028203776(0.24862676) q0[104],q0[105];
-cry(0.15397412) q0[104],q0[105];
-ryy_140310028203920(0.92048106) q0[105],q0[106];
-cry(0.85555381) q0[105],q0[106];
-ryy_140310028204064(0.59693891) q0[106],q0[107];
-cry(1.3572486) q0[106],q0[107];
-ryy_140310028204208(0.51329017) q0[107],q0[108];
-cry(0.97076979) q0[107],q0[108];
-ryy_140310028204352(1.9968497) q0[108],q0[109];
-cry(0.12923432) q0[108],q0[109];
-ryy_140310028204496(1.336929) q0[109],q0[110];
-cry(1.0005345) q0[109],q0[110];
-h q0[0];
-cswap q0[0],q0[1],q0[56];
-cswap q0[0],q0[2],q0[57];
-cswap q0[0],q0[3],q0[58];
-cswap q0[0],q0[4],q0[59];
-cswap q0[0],q0[5],q0[60];
-cswap q0[0],q0[6],q0[61];
-cswap q0[0],q0[7],q0[62];
-cswap q0[0],q0[8],q0[63];
-cswap q0[0],q0[9],q0[64];
-cswap q0[0],q0[10],q0[65];
-cswap q0[0],q0[11],q0[66];
-cswap q0[0],q0[12],q0[67];
-cswap q0[0],q0[13],q0[68];
-cswap q0[0],q0[14],q0[69];
-cswap q0[0],q0[15],q0[70];
-cswap q0[0],q0[16],q0[71];
-cswap q0[0],q0[17],q0[72];
-cswap q0[0],q0[18],q0[73];
-cswap q0[0],q0[19],q0[74];
-cswap q0[0],q0[20],q0[75];
-cswap q0[0],q0[21],q0[76];
-cswap q0[0],q0[22],q0[77];
-cswap q0[0],q0[23],q0[78];
-cswap q0[0],q0[24],q0[79];
-cswap q0[0],q0[25],q0[80];
-cswap q0[0],q0[26],q0[81];
-cswap q0[0],q0[27],q0[82];
-cswap q0[0],q0[28],q0[83];
-cswap q0[0],q0[29],q0[84];
-cswap q0[0],q0[30],q0[85];
-cswap q0[0],q0[31],q0[86];
-cswap q0[0],q0[32],q0[87];
-cswap q0[0],q0[33],q0[88];
-cswap q0[0],q0[34],q0[89];
-cswap q0[0],q0[35],q0[90];
-cswap q0[0],q0[36],q0[91];
-cswap q0[0],q0[37],q0[92];
-cswap q0[0],q0[38],q0[93];
-cswap q0[0],q0[39],q0[94];
-cswap q0[0],q0[40],q0[95];
-cswap q0[0],q0[41],q0[96];
-cswap q0[0],q0[42],q0[97];
-cswap q0[0],q0[43],q0[98];
-cswap q0[0],q0[44],q0[99];
-cswap q0[0],q0[45],q0[100];
-cswap q0[0],q0[46],q0[101];
-cswap q0[0],q0[47],q0[102];
-cswap q0[0],q0[48],q0[103];
-cswap q0[0],q0[49],q0[104];
-cswap q0[0],q0[50],q0[105];
-cswap q0[0],q0[51],q0[106];
-cswap q0[0],q0[52],q0[107];
-cswap q0[0],q0[53],q0[108];
-cswap q0[0],q0[54],q0[109];
-cswap q0[0],q0[55],q0[110];
-h q0[0];
-measure q0[56] -> c0[0];
-measure q0[57] -> c0[1];
-measure q0[58] -> c0[2];
-measure q0[59] -> c0[3];
-measure q0[60] -> c0[4];
-measure q0[61] -> c0[5];
-measure q0[62] -> c0[6];
-measure q0[63] -> c0[7];
-measure q0[64] -> c0[8];
-measure q0[65] -> c0[9];
-measure q0[66] -> c0[10];
-measure q0[67] -> c0[11];
-measure q0[68] -> c0[12];
-measure q0[69] -> c0[13];
-measure q0[70] -> c0[14];
-measure q0[71] -> c0[15];
-measure q0[72] -> c0[16];
-measure q0[73] -> c0[17];
-measure q0[74] -> c0[18];
-measure q0[75] -> c0[19];
-measure q0[76] -> c0[20];
-measure q0[77] -> c0[21];
-measure q0[78] -> c0[22];
-measure q0[79] -> c0[23];
-measure q0[80] -> c0[24];
-measure q0[81] -> c0[25];
-measure q0[82] -> c0[26];
-measure q0[83] -> c0[27];
-measure q0[84] -> c0[28];
-measure q0[85] -> c0[29];
-measure q0[86] -> c0[30];
-measure q0[87] -> c0[31];
-measure q0[88] -> c0[32];
-measure q0[89] -> c0[33];
-measure q0[90] -> c0[34];
-measure q0[91] -> c0[35];
-measure q0[92] -> c0[36];
-measure q0[93] -> c0[37];
-measure q0[94] -> c0[38];
-measure q0[95] -> c0[39];
-measure q0[96] -> c0[40];
-measure q0[97] -> c0[41];
-measure q0[98] -> c0[42];
-measure q0[99] -> c0[43];
-measure q0[100] -> c0[44];
-measure q0[101] -> c0[45];
-measure q0[102] -> c0[46];
-measure q0[103] -> c0[47];
-measure q0[104] -> c0[48];
-measure q0[105] -> c0[49];
-measure q0[106] -> c0[50];
-measure q0[107] -> c0[51];
-measure q0[108] -> c0[52];
-measure q0[109] -> c0[53];
-measure q0[110] -> c0[54];
@@ -1,3111 +0,0 @@
-OPENQASM 2.0;
-include "qelib1.inc";
-qreg q0[111];
-creg c0[55];
-rz(pi/2) q0[0];
-sx q0[0];
-rz(pi/2) q0[0];
-sx q0[1];
-rz(3.1204404) q0[1];
-sx q0[2];
-rz(1.7891383) q0[2];
-cx q0[1],q0[2];
-rz(2.5637222) q0[2];
-cx q0[1],q0[2];
-rz(-pi) q0[1];
-sx q0[1];
-rz(-pi) q0[1];
-rz(-2.577548) q0[2];
-sx q0[2];
-rz(-pi) q0[2];
-cx q0[1],q0[2];
-sx q0[2];
-rz(2.577548) q0[2];
-sx q0[2];
-rz(-pi) q0[2];
-cx q0[1],q0[2];
-sx q0[2];
-sx q0[3];
-rz(0.32300517) q0[3];
-cx q0[2],q0[3];
-rz(0.2108704) q0[3];
-cx q0[2],q0[3];
-rz(-pi) q0[2];
-sx q0[2];
-rz(-pi) q0[2];
-rz(-3.0790231) q0[3];
-sx q0[3];
-rz(-pi) q0[3];
-cx q0[2],q0[3];
-sx q0[3];
-rz(3.0790231) q0[3];
-sx q0[3];
-rz(-pi) q0[3];
-cx q0[2],q0[3];
-sx q0[3];
-sx q0[4];
-rz(0.11540927) q0[4];
-cx q0[3],q0[4];
-rz(0.51369547) q0[4];
-cx q0[3],q0[4];
-rz(-pi) q0[3];
-sx q0[3];
-rz(-pi) q0[3];
-rz(-1.8749507) q0[4];
-sx q0[4];
-rz(-pi) q0[4];
-cx q0[3],q0[4];
-sx q0[4];
-rz(1.8749507) q0[4];
-sx q0[4];
-rz(-pi) q0[4];
-cx q0[3],q0[4];
-sx q0[4];
-sx q0[5];
-rz(2.1654056) q0[5];
-cx q0[4],q0[5];
-rz(2.8238647) q0[5];
-cx q0[4],q0[5];
-rz(-pi) q0[4];
-sx q0[4];
-rz(-pi) q0[4];
-rz(-2.3286861) q0[5];
-sx q0[5];
-rz(-pi) q0[5];
-cx q0[4],q0[5];
-sx q0[5];
-rz(2.3286861) q0[5];
-sx q0[5];
-rz(-pi) q0[5];
-cx q0[4],q0[5];
-sx q0[5];
-sx q0[6];
-rz(0.86592384) q0[6];
-cx q0[5],q0[6];
-rz(1.3477687) q0[6];
-cx q0[5],q0[6];
-rz(-pi) q0[5];
-sx q0[5];
-rz(-pi) q0[5];
-rz(-1.8367308) q0[6];
-sx q0[6];
-rz(-pi) q0[6];
-cx q0[5],q0[6];
-sx q0[6];
-rz(1.8367308) q0[6];
-sx q0[6];
-rz(-pi) q0[6];
-cx q0[5],q0[6];
-sx q0[6];
-sx q0[7];
-rz(1.090019) q0[7];
-cx q0[6],q0[7];
-rz(2.0249589) q0[7];
-cx q0[6],q0[7];
-rz(-pi) q0[6];
-sx q0[6];
-rz(-pi) q0[6];
-rz(-1.9744732) q0[7];
-sx q0[7];
-rz(-pi) q0[7];
-cx q0[6],q0[7];
-sx q0[7];
-rz(1.9744732) q0[7];
-sx q0[7];
-rz(-pi) q0[7];
-cx q0[6],q0[7];
-sx q0[7];
-sx q0[8];
-rz(0.55369201) q0[8];
-cx q0[7],q0[8];
-rz(0.43922448) q0[8];
-cx q0[7],q0[8];
-rz(-pi) q0[7];
-sx q0[7];
-rz(-pi) q0[7];
-rz(-2.5921217) q0[8];
-sx q0[8];
-rz(-pi) q0[8];
-cx q0[7],q0[8];
-sx q0[8];
-rz(2.5921217) q0[8];
-sx q0[8];
-rz(-pi) q0[8];
-cx q0[7],q0[8];
-sx q0[8];
-sx q0[9];
-rz(2.5922672) q0[9];
-cx q0[8],q0[9];
-rz(1.2584965) q0[9];
-cx q0[8],q0[9];
-rz(-pi) q0[8];
-sx q0[8];
-rz(-pi) q0[8];
-rz(-2.9206567) q0[9];
-sx q0[9];
-rz(-pi) q0[9];
-cx q0[8],q0[9];
-sx q0[9];
-rz(2.9206567) q0[9];
-sx q0[9];
-rz(-pi) q0[9];
-cx q0[8],q0[9];
-sx q0[9];
-sx q0[10];
-rz(2.2331653) q0[10];
-cx q0[9],q0[10];
-rz(1.8083655) q0[10];
-cx q0[9],q0[10];
-rz(-2.3997282) q0[10];
-sx q0[10];
-rz(-pi) q0[10];
-rz(-pi) q0[9];
-sx q0[9];
-rz(-pi) q0[9];
-cx q0[9],q0[10];
-sx q0[10];
-rz(2.3997282) q0[10];
-sx q0[10];
-rz(-pi) q0[10];
-cx q0[9],q0[10];
-sx q0[10];
-sx q0[11];
-rz(3.0781087) q0[11];
-cx q0[10],q0[11];
-rz(2.8770134) q0[11];
-cx q0[10],q0[11];
-rz(-pi) q0[10];
-sx q0[10];
-rz(-pi) q0[10];
-rz(-2.8381645) q0[11];
-sx q0[11];
-rz(-pi) q0[11];
-cx q0[10],q0[11];
-sx q0[11];
-rz(2.8381645) q0[11];
-sx q0[11];
-rz(-pi) q0[11];
-cx q0[10],q0[11];
-sx q0[11];
-sx q0[12];
-rz(1.6134564) q0[12];
-cx q0[11],q0[12];
-rz(1.1837205) q0[12];
-cx q0[11],q0[12];
-rz(-pi) q0[11];
-sx q0[11];
-rz(-pi) q0[11];
-rz(-1.6657413) q0[12];
-sx q0[12];
-rz(-pi) q0[12];
-cx q0[11],q0[12];
-sx q0[12];
-rz(1.6657413) q0[12];
-sx q0[12];
-rz(-pi) q0[12];
-cx q0[11],q0[12];
-sx q0[12];
-sx q0[13];
-rz(1.7841618) q0[13];
-cx q0[12],q0[13];
-rz(2.8247172) q0[13];
-cx q0[12],q0[13];
-rz(-pi) q0[12];
-sx q0[12];
-rz(-pi) q0[12];
-rz(-2.3508978) q0[13];
-sx q0[13];
-rz(-pi) q0[13];
-cx q0[12],q0[13];
-sx q0[13];
-rz(2.3508978) q0[13];
-sx q0[13];
-rz(-pi) q0[13];
-cx q0[12],q0[13];
-sx q0[13];
-sx q0[14];
-rz(1.8052335) q0[14];
-cx q0[13],q0[14];
-rz(0.73135464) q0[14];
-cx q0[13],q0[14];
-rz(-pi) q0[13];
-sx q0[13];
-rz(-pi) q0[13];
-rz(-2.231445) q0[14];
-sx q0[14];
-rz(-pi) q0[14];
-cx q0[13],q0[14];
-sx q0[14];
-rz(2.231445) q0[14];
-sx q0[14];
-rz(-pi) q0[14];
-cx q0[13],q0[14];
-sx q0[14];
-sx q0[15];
-rz(2.6279578) q0[15];
-cx q0[14],q0[15];
-rz(1.0803831) q0[15];
-cx q0[14],q0[15];
-rz(-pi) q0[14];
-sx q0[14];
-rz(-pi) q0[14];
-rz(-2.1220235) q0[15];
-sx q0[15];
-rz(-pi) q0[15];
-cx q0[14],q0[15];
-sx q0[15];
-rz(2.1220235) q0[15];
-sx q0[15];
-rz(-pi) q0[15];
-cx q0[14],q0[15];
-sx q0[15];
-sx q0[16];
-rz(0.76409858) q0[16];
-cx q0[15],q0[16];
-rz(0.3345058) q0[16];
-cx q0[15],q0[16];
-rz(-pi) q0[15];
-sx q0[15];
-rz(-pi) q0[15];
-rz(-1.5817269) q0[16];
-sx q0[16];
-rz(-pi) q0[16];
-cx q0[15],q0[16];
-sx q0[16];
-rz(1.5817269) q0[16];
-sx q0[16];
-rz(-pi) q0[16];
-cx q0[15],q0[16];
-sx q0[16];
-sx q0[17];
-rz(2.212253) q0[17];
-cx q0[16],q0[17];
-rz(0.92235506) q0[17];
-cx q0[16],q0[17];
-rz(-pi) q0[16];
-sx q0[16];
-rz(-pi) q0[16];
-rz(-2.8622458) q0[17];
-sx q0[17];
-rz(-pi) q0[17];
-cx q0[16],q0[17];
-sx q0[17];
-rz(2.8622458) q0[17];
-sx q0[17];
-rz(-pi) q0[17];
-cx q0[16],q0[17];
-sx q0[17];
-sx q0[18];
-rz(0.62136589) q0[18];
-cx q0[17],q0[18];
-rz(0.2940848) q0[18];
-cx q0[17],q0[18];
-rz(-pi) q0[17];
-sx q0[17];
-rz(-pi) q0[17];
-rz(-2.8123907) q0[18];
-sx q0[18];
-rz(-pi) q0[18];
-cx q0[17],q0[18];
-sx q0[18];
-rz(2.8123907) q0[18];
-sx q0[18];
-rz(-pi) q0[18];
-cx q0[17],q0[18];
-sx q0[18];
-sx q0[19];
-rz(0.79025238) q0[19];
-cx q0[18],q0[19];
-rz(2.0604343) q0[19];
-cx q0[18],q0[19];
-rz(-pi) q0[18];
-sx q0[18];
-rz(-pi) q0[18];
-rz(-2.3923353) q0[19];
-sx q0[19];
-rz(-pi) q0[19];
-cx q0[18],q0[19];
-sx q0[19];
-rz(2.3923353) q0[19];
-sx q0[19];
-rz(-pi) q0[19];
-cx q0[18],q0[19];
-sx q0[19];
-sx q0[20];
-rz(1.3689065) q0[20];
-cx q0[19],q0[20];
-rz(1.4779059) q0[20];
-cx q0[19],q0[20];
-rz(-pi) q0[19];
-sx q0[19];
-rz(-pi) q0[19];
-rz(-2.6784357) q0[20];
-sx q0[20];
-rz(-pi) q0[20];
-cx q0[19],q0[20];
-sx q0[20];
-rz(2.6784357) q0[20];
-sx q0[20];
-rz(-pi) q0[20];
-cx q0[19],q0[20];
-sx q0[20];
-sx q0[21];
-rz(2.4277327) q0[21];
-cx q0[20],q0[21];
-rz(1.0765142) q0[21];
-cx q0[20],q0[21];
-rz(-pi) q0[20];
-sx q0[20];
-rz(-pi) q0[20];
-rz(-2.9301777) q0[21];
-sx q0[21];
-rz(-pi) q0[21];
-cx q0[20],q0[21];
-sx q0[21];
-rz(2.9301777) q0[21];
-sx q0[21];
-rz(-pi) q0[21];
-cx q0[20],q0[21];
-sx q0[21];
-sx q0[22];
-rz(0.17382031) q0[22];
-cx q0[21],q0[22];
-rz(0.37819689) q0[22];
-cx q0[21],q0[22];
-rz(-pi) q0[21];
-sx q0[21];
-rz(-pi) q0[21];
-rz(-2.2087565) q0[22];
-sx q0[22];
-rz(-pi) q0[22];
-cx q0[21],q0[22];
-sx q0[22];
-rz(2.2087565) q0[22];
-sx q0[22];
-rz(-pi) q0[22];
-cx q0[21],q0[22];
-sx q0[22];
-sx q0[23];
-rz(1.7671684) q0[23];
-cx q0[22],q0[23];
-rz(1.2369987) q0[23];
-cx q0[22],q0[23];
-rz(-pi) q0[22];
-sx q0[22];
-rz(-pi) q0[22];
-rz(-1.640711) q0[23];
-sx q0[23];
-rz(-pi) q0[23];
-cx q0[22],q0[23];
-sx q0[23];
-rz(1.640711) q0[23];
-sx q0[23];
-rz(-pi) q0[23];
-cx q0[22],q0[23];
-sx q0[23];
-sx q0[24];
-rz(1.4180674) q0[24];
-cx q0[23],q0[24];
-rz(1.489163) q0[24];
-cx q0[23],q0[24];
-rz(-pi) q0[23];
-sx q0[23];
-rz(-pi) q0[23];
-rz(-2.1651442) q0[24];
-sx q0[24];
-rz(-pi) q0[24];
-cx q0[23],q0[24];
-sx q0[24];
-rz(2.1651442) q0[24];
-sx q0[24];
-rz(-pi) q0[24];
-cx q0[23],q0[24];
-sx q0[24];
-sx q0[25];
-rz(0.69351577) q0[25];
-cx q0[24],q0[25];
-rz(2.8755004) q0[25];
-cx q0[24],q0[25];
-rz(-pi) q0[24];
-sx q0[24];
-rz(-pi) q0[24];
-rz(-1.7144847) q0[25];
-sx q0[25];
-rz(-pi) q0[25];
-cx q0[24],q0[25];
-sx q0[25];
-rz(1.7144847) q0[25];
-sx q0[25];
-rz(-pi) q0[25];
-cx q0[24],q0[25];
-sx q0[25];
-sx q0[26];
-rz(1.0955155) q0[26];
-cx q0[25],q0[26];
-rz(2.6589816) q0[26];
-cx q0[25],q0[26];
-rz(-pi) q0[25];
-sx q0[25];
-rz(-pi) q0[25];
-rz(-2.6512618) q0[26];
-sx q0[26];
-rz(-pi) q0[26];
-cx q0[25],q0[26];
-sx q0[26];
-rz(2.6512618) q0[26];
-sx q0[26];
-rz(-pi) q0[26];
-cx q0[25],q0[26];
-sx q0[26];
-sx q0[27];
-rz(2.1016888) q0[27];
-cx q0[26],q0[27];
-rz(0.95838142) q0[27];
-cx q0[26],q0[27];
-rz(-pi) q0[26];
-sx q0[26];
-rz(-pi) q0[26];
-rz(-1.8452824) q0[27];
-sx q0[27];
-rz(-pi) q0[27];
-cx q0[26],q0[27];
-sx q0[27];
-rz(1.8452824) q0[27];
-sx q0[27];
-rz(-pi) q0[27];
-cx q0[26],q0[27];
-sx q0[27];
-sx q0[28];
-rz(0.43624399) q0[28];
-cx q0[27],q0[28];
-rz(1.8541361) q0[28];
-cx q0[27],q0[28];
-rz(-pi) q0[27];
-sx q0[27];
-rz(-pi) q0[27];
-rz(-2.2449649) q0[28];
-sx q0[28];
-rz(-pi) q0[28];
-cx q0[27],q0[28];
-sx q0[28];
-rz(2.2449649) q0[28];
-sx q0[28];
-rz(-pi) q0[28];
-cx q0[27],q0[28];
-sx q0[28];
-sx q0[29];
-rz(2.3723833) q0[29];
-cx q0[28],q0[29];
-rz(1.9303154) q0[29];
-cx q0[28],q0[29];
-rz(-pi) q0[28];
-sx q0[28];
-rz(-pi) q0[28];
-rz(-2.7796986) q0[29];
-sx q0[29];
-rz(-pi) q0[29];
-cx q0[28],q0[29];
-sx q0[29];
-rz(2.7796986) q0[29];
-sx q0[29];
-rz(-pi) q0[29];
-cx q0[28],q0[29];
-sx q0[29];
-sx q0[30];
-rz(0.43302403) q0[30];
-cx q0[29],q0[30];
-rz(0.70034427) q0[30];
-cx q0[29],q0[30];
-rz(-pi) q0[29];
-sx q0[29];
-rz(-pi) q0[29];
-rz(-2.688879) q0[30];
-sx q0[30];
-rz(-pi) q0[30];
-cx q0[29],q0[30];
-sx q0[30];
-rz(2.688879) q0[30];
-sx q0[30];
-rz(-pi) q0[30];
-cx q0[29],q0[30];
-sx q0[30];
-sx q0[31];
-rz(1.3289846) q0[31];
-cx q0[30],q0[31];
-rz(1.1611626) q0[31];
-cx q0[30],q0[31];
-rz(-pi) q0[30];
-sx q0[30];
-rz(-pi) q0[30];
-rz(-2.5928006) q0[31];
-sx q0[31];
-rz(-pi) q0[31];
-cx q0[30],q0[31];
-sx q0[31];
-rz(2.5928006) q0[31];
-sx q0[31];
-rz(-pi) q0[31];
-cx q0[30],q0[31];
-sx q0[31];
-sx q0[32];
-rz(1.484815) q0[32];
-cx q0[31],q0[32];
-rz(0.12161016) q0[32];
-cx q0[31],q0[32];
-rz(-pi) q0[31];
-sx q0[31];
-rz(-pi) q0[31];
-rz(-2.2095936) q0[32];
-sx q0[32];
-rz(-pi) q0[32];
-cx q0[31],q0[32];
-sx q0[32];
-rz(2.2095936) q0[32];
-sx q0[32];
-rz(-pi) q0[32];
-cx q0[31],q0[32];
-sx q0[32];
-sx q0[33];
-rz(3.13281) q0[33];
-cx q0[32],q0[33];
-rz(2.3137336) q0[33];
-cx q0[32],q0[33];
-rz(-pi) q0[32];
-sx q0[32];
-rz(-pi) q0[32];
-rz(-1.6983913) q0[33];
-sx q0[33];
-rz(-pi) q0[33];
-cx q0[32],q0[33];
-sx q0[33];
-rz(1.6983913) q0[33];
-sx q0[33];
-rz(-pi) q0[33];
-cx q0[32],q0[33];
-sx q0[33];
-sx q0[34];
-rz(2.6082425) q0[34];
-cx q0[33],q0[34];
-rz(2.8157716) q0[34];
-cx q0[33],q0[34];
-rz(-pi) q0[33];
-sx q0[33];
-rz(-pi) q0[33];
-rz(-1.7714753) q0[34];
-sx q0[34];
-rz(-pi) q0[34];
-cx q0[33],q0[34];
-sx q0[34];
-rz(1.7714753) q0[34];
-sx q0[34];
-rz(-pi) q0[34];
-cx q0[33],q0[34];
-sx q0[34];
-sx q0[35];
-rz(1.2250795) q0[35];
-cx q0[34],q0[35];
-rz(1.8876118) q0[35];
-cx q0[34],q0[35];
-rz(-pi) q0[34];
-sx q0[34];
-rz(-pi) q0[34];
-rz(-2.9469459) q0[35];
-sx q0[35];
-rz(-pi) q0[35];
-cx q0[34],q0[35];
-sx q0[35];
-rz(2.9469459) q0[35];
-sx q0[35];
-rz(-pi) q0[35];
-cx q0[34],q0[35];
-sx q0[35];
-sx q0[36];
-rz(1.6529141) q0[36];
-cx q0[35],q0[36];
-rz(0.75635977) q0[36];
-cx q0[35],q0[36];
-rz(-pi) q0[35];
-sx q0[35];
-rz(-pi) q0[35];
-rz(-2.3454678) q0[36];
-sx q0[36];
-rz(-pi) q0[36];
-cx q0[35],q0[36];
-sx q0[36];
-rz(2.3454678) q0[36];
-sx q0[36];
-rz(-pi) q0[36];
-cx q0[35],q0[36];
-sx q0[36];
-sx q0[37];
-rz(1.9126456) q0[37];
-cx q0[36],q0[37];
-rz(1.3626014) q0[37];
-cx q0[36],q0[37];
-rz(-pi) q0[36];
-sx q0[36];
-rz(-pi) q0[36];
-rz(-1.8949047) q0[37];
-sx q0[37];
-rz(-pi) q0[37];
-cx q0[36],q0[37];
-sx q0[37];
-rz(1.8949047) q0[37];
-sx q0[37];
-rz(-pi) q0[37];
-cx q0[36],q0[37];
-sx q0[37];
-sx q0[38];
-rz(2.5925507) q0[38];
-cx q0[37],q0[38];
-rz(2.0802224) q0[38];
-cx q0[37],q0[38];
-rz(-pi) q0[37];
-sx q0[37];
-rz(-pi) q0[37];
-rz(-1.7301634) q0[38];
-sx q0[38];
-rz(-pi) q0[38];
-cx q0[37],q0[38];
-sx q0[38];
-rz(1.7301634) q0[38];
-sx q0[38];
-rz(-pi) q0[38];
-cx q0[37],q0[38];
-sx q0[38];
-sx q0[39];
-rz(1.239433) q0[39];
-cx q0[38],q0[39];
-rz(1.6552831) q0[39];
-cx q0[38],q0[39];
-rz(-pi) q0[38];
-sx q0[38];
-rz(-pi) q0[38];
-rz(-2.3282618) q0[39];
-sx q0[39];
-rz(-pi) q0[39];
-cx q0[38],q0[39];
-sx q0[39];
-rz(2.3282618) q0[39];
-sx q0[39];
-rz(-pi) q0[39];
-cx q0[38],q0[39];
-sx q0[39];
-sx q0[40];
-rz(1.7132152) q0[40];
-cx q0[39],q0[40];
-rz(0.39086101) q0[40];
-cx q0[39],q0[40];
-rz(-pi) q0[39];
-sx q0[39];
-rz(-pi) q0[39];
-rz(-1.790733) q0[40];
-sx q0[40];
-rz(-pi) q0[40];
-cx q0[39],q0[40];
-sx q0[40];
-rz(1.790733) q0[40];
-sx q0[40];
-rz(-pi) q0[40];
-cx q0[39],q0[40];
-sx q0[40];
-sx q0[41];
-rz(0.20185697) q0[41];
-cx q0[40],q0[41];
-rz(3.0113546) q0[41];
-cx q0[40],q0[41];
-rz(-pi) q0[40];
-sx q0[40];
-rz(-pi) q0[40];
-rz(-2.4264484) q0[41];
-sx q0[41];
-rz(-pi) q0[41];
-cx q0[40],q0[41];
-sx q0[41];
-rz(2.4264484) q0[41];
-sx q0[41];
-rz(-pi) q0[41];
-cx q0[40],q0[41];
-sx q0[41];
-sx q0[42];
-rz(1.4297044) q0[42];
-cx q0[41],q0[42];
-rz(1.3102658) q0[42];
-cx q0[41],q0[42];
-rz(-pi) q0[41];
-sx q0[41];
-rz(-pi) q0[41];
-rz(-2.1183171) q0[42];
-sx q0[42];
-rz(-pi) q0[42];
-cx q0[41],q0[42];
-sx q0[42];
-rz(2.1183171) q0[42];
-sx q0[42];
-rz(-pi) q0[42];
-cx q0[41],q0[42];
-sx q0[42];
-sx q0[43];
-rz(3.0798088) q0[43];
-cx q0[42],q0[43];
-rz(1.5840762) q0[43];
-cx q0[42],q0[43];
-rz(-pi) q0[42];
-sx q0[42];
-rz(-pi) q0[42];
-rz(-3.0192662) q0[43];
-sx q0[43];
-rz(-pi) q0[43];
-cx q0[42],q0[43];
-sx q0[43];
-rz(3.0192662) q0[43];
-sx q0[43];
-rz(-pi) q0[43];
-cx q0[42],q0[43];
-sx q0[43];
-sx q0[44];
-rz(0.71655602) q0[44];
-cx q0[43],q0[44];
-rz(2.5856628) q0[44];
-cx q0[43],q0[44];
-rz(-pi) q0[43];
-sx q0[43];
-rz(-pi) q0[43];
-rz(-3.1070544) q0[44];
-sx q0[44];
-rz(-pi) q0[44];
-cx q0[43],q0[44];
-sx q0[44];
-rz(3.1070544) q0[44];
-sx q0[44];
-rz(-pi) q0[44];
-cx q0[43],q0[44];
-sx q0[44];
-sx q0[45];
-rz(2.4177944) q0[45];
-cx q0[44],q0[45];
-rz(1.9590985) q0[45];
-cx q0[44],q0[45];
-rz(-pi) q0[44];
-sx q0[44];
-rz(-pi) q0[44];
-rz(-2.0045395) q0[45];
-sx q0[45];
-rz(-pi) q0[45];
-cx q0[44],q0[45];
-sx q0[45];
-rz(2.0045395) q0[45];
-sx q0[45];
-rz(-pi) q0[45];
-cx q0[44],q0[45];
-sx q0[45];
-sx q0[46];
-rz(2.6378762) q0[46];
-cx q0[45],q0[46];
-rz(2.6254829) q0[46];
-cx q0[45],q0[46];
-rz(-pi) q0[45];
-sx q0[45];
-rz(-pi) q0[45];
-rz(-2.9895082) q0[46];
-sx q0[46];
-rz(-pi) q0[46];
-cx q0[45],q0[46];
-sx q0[46];
-rz(2.9895082) q0[46];
-sx q0[46];
-rz(-pi) q0[46];
-cx q0[45],q0[46];
-sx q0[46];
-sx q0[47];
-rz(2.0445065) q0[47];
-cx q0[46],q0[47];
-rz(1.1261279) q0[47];
-cx q0[46],q0[47];
-rz(-pi) q0[46];
-sx q0[46];
-rz(-pi) q0[46];
-rz(-2.8366016) q0[47];
-sx q0[47];
-rz(-pi) q0[47];
-cx q0[46],q0[47];
-sx q0[47];
-rz(2.8366016) q0[47];
-sx q0[47];
-rz(-pi) q0[47];
-cx q0[46],q0[47];
-sx q0[47];
-sx q0[48];
-rz(2.9996053) q0[48];
-cx q0[47],q0[48];
-rz(2.1483767) q0[48];
-cx q0[47],q0[48];
-rz(-pi) q0[47];
-sx q0[47];
-rz(-pi) q0[47];
-rz(-1.6004774) q0[48];
-sx q0[48];
-rz(-pi) q0[48];
-cx q0[47],q0[48];
-sx q0[48];
-rz(1.6004774) q0[48];
-sx q0[48];
-rz(-pi) q0[48];
-cx q0[47],q0[48];
-sx q0[48];
-sx q0[49];
-rz(0.98778128) q0[49];
-cx q0[48],q0[49];
-rz(2.2246625) q0[49];
-cx q0[48],q0[49];
-rz(-pi) q0[48];
-sx q0[48];
-rz(-pi) q0[48];
-rz(-1.867456) q0[49];
-sx q0[49];
-rz(-pi) q0[49];
-cx q0[48],q0[49];
-sx q0[49];
-rz(1.867456) q0[49];
-sx q0[49];
-rz(-pi) q0[49];
-cx q0[48],q0[49];
-sx q0[49];
-sx q0[50];
-rz(2.9146619) q0[50];
-cx q0[49],q0[50];
-rz(2.9177984) q0[50];
-cx q0[49],q0[50];
-rz(-pi) q0[49];
-sx q0[49];
-rz(-pi) q0[49];
-rz(-1.7614981) q0[50];
-sx q0[50];
-rz(-pi) q0[50];
-cx q0[49],q0[50];
-sx q0[50];
-rz(1.7614981) q0[50];
-sx q0[50];
-rz(-pi) q0[50];
-cx q0[49],q0[50];
-sx q0[50];
-sx q0[51];
-rz(2.4087536) q0[51];
-cx q0[50],q0[51];
-rz(0.91076904) q0[51];
-cx q0[50],q0[51];
-rz(-pi) q0[50];
-sx q0[50];
-rz(-pi) q0[50];
-rz(-1.6569068) q0[51];
-sx q0[51];
-rz(-pi) q0[51];
-cx q0[50],q0[51];
-sx q0[51];
-rz(1.6569068) q0[51];
-sx q0[51];
-rz(-pi) q0[51];
-cx q0[50],q0[51];
-sx q0[51];
-sx q0[52];
-rz(0.29445382) q0[52];
-cx q0[51],q0[52];
-rz(1.4027166) q0[52];
-cx q0[51],q0[52];
-rz(-pi) q0[51];
-sx q0[51];
-rz(-pi) q0[51];
-rz(-2.819099) q0[52];
-sx q0[52];
-rz(-pi) q0[52];
-cx q0[51],q0[52];
-sx q0[52];
-rz(2.819099) q0[52];
-sx q0[52];
-rz(-pi) q0[52];
-cx q0[51],q0[52];
-sx q0[52];
-sx q0[53];
-rz(1.5838136) q0[53];
-cx q0[52],q0[53];
-rz(0.26611291) q0[53];
-cx q0[52],q0[53];
-rz(-pi) q0[52];
-sx q0[52];
-rz(-pi) q0[52];
-rz(-1.6315585) q0[53];
-sx q0[53];
-rz(-pi) q0[53];
-cx q0[52],q0[53];
-sx q0[53];
-rz(1.6315585) q0[53];
-sx q0[53];
-rz(-pi) q0[53];
-cx q0[52],q0[53];
-sx q0[53];
-sx q0[54];
-rz(2.6909684) q0[54];
-cx q0[53],q0[54];
-rz(1.6216331) q0[54];
-cx q0[53],q0[54];
-rz(-pi) q0[53];
-sx q0[53];
-rz(-pi) q0[53];
-rz(-2.121842) q0[54];
-sx q0[54];
-rz(-pi) q0[54];
-cx q0[53],q0[54];
-sx q0[54];
-rz(2.121842) q0[54];
-sx q0[54];
-rz(-pi) q0[54];
-cx q0[53],q0[54];
-sx q0[54];
-sx q0[55];
-rz(2.947646) q0[55];
-cx q0[54],q0[55];
-rz(2.0714958) q0[55];
-cx q0[54],q0[55];
-rz(-pi) q0[54];
-sx q0[54];
-rz(-pi) q0[54];
-rz(-3.0375276) q0[55];
-sx q0[55];
-rz(-pi) q0[55];
-cx q0[54],q0[55];
-sx q0[55];
-rz(3.0375276) q0[55];
-sx q0[55];
-rz(-pi) q0[55];
-cx q0[54],q0[55];
-sx q0[56];
-rz(3.1215422) q0[56];
-sx q0[57];
-rz(0.78828941) q0[57];
-cx q0[56],q0[57];
-rz(3.0566959) q0[57];
-cx q0[56],q0[57];
-rz(-pi) q0[56];
-sx q0[56];
-rz(-pi) q0[56];
-rz(-2.0765333) q0[57];
-sx q0[57];
-rz(-pi) q0[57];
-cx q0[56],q0[57];
-sx q0[57];
-rz(2.0765333) q0[57];
-sx q0[57];
-rz(-pi) q0[57];
-cx q0[56],q0[57];
-cx q0[56],q0[1];
-rz(pi/2) q0[56];
-sx q0[56];
-rz(pi/2) q0[56];
-cx q0[1],q0[56];
-rz(-pi/4) q0[56];
-cx q0[0],q0[56];
-rz(pi/4) q0[56];
-cx q0[1],q0[56];
-rz(pi/4) q0[1];
-rz(-pi/4) q0[56];
-cx q0[0],q0[56];
-cx q0[0],q0[1];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[1];
-cx q0[0],q0[1];
-rz(3*pi/4) q0[56];
-sx q0[56];
-rz(pi/2) q0[56];
-cx q0[56],q0[1];
-sx q0[57];
-sx q0[58];
-rz(0.94323992) q0[58];
-cx q0[57],q0[58];
-rz(2.8694781) q0[58];
-cx q0[57],q0[58];
-rz(-pi) q0[57];
-sx q0[57];
-rz(-pi) q0[57];
-rz(-2.4782843) q0[58];
-sx q0[58];
-rz(-pi) q0[58];
-cx q0[57],q0[58];
-sx q0[58];
-rz(2.4782843) q0[58];
-sx q0[58];
-rz(-pi) q0[58];
-cx q0[57],q0[58];
-cx q0[57],q0[2];
-rz(pi/2) q0[57];
-sx q0[57];
-rz(pi/2) q0[57];
-cx q0[2],q0[57];
-rz(-pi/4) q0[57];
-cx q0[0],q0[57];
-rz(pi/4) q0[57];
-cx q0[2],q0[57];
-rz(pi/4) q0[2];
-rz(-pi/4) q0[57];
-cx q0[0],q0[57];
-cx q0[0],q0[2];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[2];
-cx q0[0],q0[2];
-rz(3*pi/4) q0[57];
-sx q0[57];
-rz(pi/2) q0[57];
-cx q0[57],q0[2];
-sx q0[58];
-sx q0[59];
-rz(2.8735258) q0[59];
-cx q0[58],q0[59];
-rz(0.48278117) q0[59];
-cx q0[58],q0[59];
-rz(-pi) q0[58];
-sx q0[58];
-rz(-pi) q0[58];
-rz(-1.6810947) q0[59];
-sx q0[59];
-rz(-pi) q0[59];
-cx q0[58],q0[59];
-sx q0[59];
-rz(1.6810947) q0[59];
-sx q0[59];
-rz(-pi) q0[59];
-cx q0[58],q0[59];
-cx q0[58],q0[3];
-rz(pi/2) q0[58];
-sx q0[58];
-rz(pi/2) q0[58];
-cx q0[3],q0[58];
-rz(-pi/4) q0[58];
-cx q0[0],q0[58];
-rz(pi/4) q0[58];
-cx q0[3],q0[58];
-rz(pi/4) q0[3];
-rz(-pi/4) q0[58];
-cx q0[0],q0[58];
-cx q0[0],q0[3];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[3];
-cx q0[0],q0[3];
-rz(3*pi/4) q0[58];
-sx q0[58];
-rz(pi/2) q0[58];
-cx q0[58],q0[3];
-sx q0[59];
-sx q0[60];
-rz(0.84399775) q0[60];
-cx q0[59],q0[60];
-rz(1.824497) q0[60];
-cx q0[59],q0[60];
-rz(-pi) q0[59];
-sx q0[59];
-rz(-pi) q0[59];
-rz(-1.7073665) q0[60];
-sx q0[60];
-rz(-pi) q0[60];
-cx q0[59],q0[60];
-sx q0[60];
-rz(1.7073665) q0[60];
-sx q0[60];
-rz(-pi) q0[60];
-cx q0[59],q0[60];
-cx q0[59],q0[4];
-rz(pi/2) q0[59];
-sx q0[59];
-rz(pi/2) q0[59];
-cx q0[4],q0[59];
-rz(-pi/4) q0[59];
-cx q0[0],q0[59];
-rz(pi/4) q0[59];
-cx q0[4],q0[59];
-rz(pi/4) q0[4];
-rz(-pi/4) q0[59];
-cx q0[0],q0[59];
-cx q0[0],q0[4];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[4];
-cx q0[0],q0[4];
-rz(3*pi/4) q0[59];
-sx q0[59];
-rz(pi/2) q0[59];
-cx q0[59],q0[4];
-sx q0[60];
-sx q0[61];
-rz(1.7669334) q0[61];
-cx q0[60],q0[61];
-rz(2.6647255) q0[61];
-cx q0[60],q0[61];
-rz(-pi) q0[60];
-sx q0[60];
-rz(-pi) q0[60];
-rz(-1.6502772) q0[61];
-sx q0[61];
-rz(-pi) q0[61];
-cx q0[60],q0[61];
-sx q0[61];
-rz(1.6502772) q0[61];
-sx q0[61];
-rz(-pi) q0[61];
-cx q0[60],q0[61];
-cx q0[60],q0[5];
-rz(pi/2) q0[60];
-sx q0[60];
-rz(pi/2) q0[60];
-cx q0[5],q0[60];
-rz(-pi/4) q0[60];
-cx q0[0],q0[60];
-rz(pi/4) q0[60];
-cx q0[5],q0[60];
-rz(pi/4) q0[5];
-rz(-pi/4) q0[60];
-cx q0[0],q0[60];
-cx q0[0],q0[5];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[5];
-cx q0[0],q0[5];
-rz(3*pi/4) q0[60];
-sx q0[60];
-rz(pi/2) q0[60];
-cx q0[60],q0[5];
-sx q0[61];
-sx q0[62];
-rz(0.4374749) q0[62];
-cx q0[61],q0[62];
-rz(2.1300967) q0[62];
-cx q0[61],q0[62];
-rz(-pi) q0[61];
-sx q0[61];
-rz(-pi) q0[61];
-rz(-2.2151069) q0[62];
-sx q0[62];
-rz(-pi) q0[62];
-cx q0[61],q0[62];
-sx q0[62];
-rz(2.2151069) q0[62];
-sx q0[62];
-rz(-pi) q0[62];
-cx q0[61],q0[62];
-cx q0[61],q0[6];
-rz(pi/2) q0[61];
-sx q0[61];
-rz(pi/2) q0[61];
-cx q0[6],q0[61];
-rz(-pi/4) q0[61];
-cx q0[0],q0[61];
-rz(pi/4) q0[61];
-cx q0[6],q0[61];
-rz(pi/4) q0[6];
-rz(-pi/4) q0[61];
-cx q0[0],q0[61];
-cx q0[0],q0[6];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[6];
-cx q0[0],q0[6];
-rz(3*pi/4) q0[61];
-sx q0[61];
-rz(pi/2) q0[61];
-cx q0[61],q0[6];
-sx q0[62];
-sx q0[63];
-rz(3.0765902) q0[63];
-cx q0[62],q0[63];
-rz(1.0408431) q0[63];
-cx q0[62],q0[63];
-rz(-pi) q0[62];
-sx q0[62];
-rz(-pi) q0[62];
-rz(-1.6149264) q0[63];
-sx q0[63];
-rz(-pi) q0[63];
-cx q0[62],q0[63];
-sx q0[63];
-rz(1.6149264) q0[63];
-sx q0[63];
-rz(-pi) q0[63];
-cx q0[62],q0[63];
-cx q0[62],q0[7];
-rz(pi/2) q0[62];
-sx q0[62];
-rz(pi/2) q0[62];
-sx q0[63];
-cx q0[7],q0[62];
-rz(-pi/4) q0[62];
-cx q0[0],q0[62];
-rz(pi/4) q0[62];
-cx q0[7],q0[62];
-rz(-pi/4) q0[62];
-cx q0[0],q0[62];
-rz(3*pi/4) q0[62];
-sx q0[62];
-rz(pi/2) q0[62];
-rz(pi/4) q0[7];
-cx q0[0],q0[7];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[7];
-cx q0[0],q0[7];
-cx q0[62],q0[7];
-sx q0[64];
-rz(2.6785426) q0[64];
-cx q0[63],q0[64];
-rz(2.6704929) q0[64];
-cx q0[63],q0[64];
-rz(-pi) q0[63];
-sx q0[63];
-rz(-pi) q0[63];
-rz(-3.1094611) q0[64];
-sx q0[64];
-rz(-pi) q0[64];
-cx q0[63],q0[64];
-sx q0[64];
-rz(3.1094611) q0[64];
-sx q0[64];
-rz(-pi) q0[64];
-cx q0[63],q0[64];
-cx q0[63],q0[8];
-rz(pi/2) q0[63];
-sx q0[63];
-rz(pi/2) q0[63];
-sx q0[64];
-cx q0[8],q0[63];
-rz(-pi/4) q0[63];
-cx q0[0],q0[63];
-rz(pi/4) q0[63];
-cx q0[8],q0[63];
-rz(-pi/4) q0[63];
-cx q0[0],q0[63];
-rz(3*pi/4) q0[63];
-sx q0[63];
-rz(pi/2) q0[63];
-rz(pi/4) q0[8];
-cx q0[0],q0[8];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[8];
-cx q0[0],q0[8];
-cx q0[63],q0[8];
-sx q0[65];
-rz(0.096487671) q0[65];
-cx q0[64],q0[65];
-rz(1.4606507) q0[65];
-cx q0[64],q0[65];
-rz(-pi) q0[64];
-sx q0[64];
-rz(-pi) q0[64];
-rz(-2.1047352) q0[65];
-sx q0[65];
-rz(-pi) q0[65];
-cx q0[64],q0[65];
-sx q0[65];
-rz(2.1047352) q0[65];
-sx q0[65];
-rz(-pi) q0[65];
-cx q0[64],q0[65];
-cx q0[64],q0[9];
-rz(pi/2) q0[64];
-sx q0[64];
-rz(pi/2) q0[64];
-sx q0[65];
-cx q0[9],q0[64];
-rz(-pi/4) q0[64];
-cx q0[0],q0[64];
-rz(pi/4) q0[64];
-cx q0[9],q0[64];
-rz(-pi/4) q0[64];
-cx q0[0],q0[64];
-rz(3*pi/4) q0[64];
-sx q0[64];
-rz(pi/2) q0[64];
-rz(pi/4) q0[9];
-cx q0[0],q0[9];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[9];
-cx q0[0],q0[9];
-cx q0[64],q0[9];
-sx q0[66];
-rz(1.7758095) q0[66];
-cx q0[65],q0[66];
-rz(2.7149738) q0[66];
-cx q0[65],q0[66];
-rz(-pi) q0[65];
-sx q0[65];
-rz(-pi) q0[65];
-rz(-2.9610159) q0[66];
-sx q0[66];
-rz(-pi) q0[66];
-cx q0[65],q0[66];
-sx q0[66];
-rz(2.9610159) q0[66];
-sx q0[66];
-rz(-pi) q0[66];
-cx q0[65],q0[66];
-cx q0[65],q0[10];
-rz(pi/2) q0[65];
-sx q0[65];
-rz(pi/2) q0[65];
-cx q0[10],q0[65];
-rz(-pi/4) q0[65];
-cx q0[0],q0[65];
-rz(pi/4) q0[65];
-cx q0[10],q0[65];
-rz(pi/4) q0[10];
-rz(-pi/4) q0[65];
-cx q0[0],q0[65];
-cx q0[0],q0[10];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[10];
-cx q0[0],q0[10];
-rz(3*pi/4) q0[65];
-sx q0[65];
-rz(pi/2) q0[65];
-cx q0[65],q0[10];
-sx q0[66];
-sx q0[67];
-rz(2.9063449) q0[67];
-cx q0[66],q0[67];
-rz(1.3806377) q0[67];
-cx q0[66],q0[67];
-rz(-pi) q0[66];
-sx q0[66];
-rz(-pi) q0[66];
-rz(-2.4783167) q0[67];
-sx q0[67];
-rz(-pi) q0[67];
-cx q0[66],q0[67];
-sx q0[67];
-rz(2.4783167) q0[67];
-sx q0[67];
-rz(-pi) q0[67];
-cx q0[66],q0[67];
-cx q0[66],q0[11];
-rz(pi/2) q0[66];
-sx q0[66];
-rz(pi/2) q0[66];
-cx q0[11],q0[66];
-rz(-pi/4) q0[66];
-cx q0[0],q0[66];
-rz(pi/4) q0[66];
-cx q0[11],q0[66];
-rz(pi/4) q0[11];
-rz(-pi/4) q0[66];
-cx q0[0],q0[66];
-cx q0[0],q0[11];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[11];
-cx q0[0],q0[11];
-rz(3*pi/4) q0[66];
-sx q0[66];
-rz(pi/2) q0[66];
-cx q0[66],q0[11];
-sx q0[67];
-sx q0[68];
-rz(2.4915022) q0[68];
-cx q0[67],q0[68];
-rz(2.9430886) q0[68];
-cx q0[67],q0[68];
-rz(-pi) q0[67];
-sx q0[67];
-rz(-pi) q0[67];
-rz(-2.2317304) q0[68];
-sx q0[68];
-rz(-pi) q0[68];
-cx q0[67],q0[68];
-sx q0[68];
-rz(2.2317304) q0[68];
-sx q0[68];
-rz(-pi) q0[68];
-cx q0[67],q0[68];
-cx q0[67],q0[12];
-rz(pi/2) q0[67];
-sx q0[67];
-rz(pi/2) q0[67];
-cx q0[12],q0[67];
-rz(-pi/4) q0[67];
-cx q0[0],q0[67];
-rz(pi/4) q0[67];
-cx q0[12],q0[67];
-rz(pi/4) q0[12];
-rz(-pi/4) q0[67];
-cx q0[0],q0[67];
-cx q0[0],q0[12];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[12];
-cx q0[0],q0[12];
-rz(3*pi/4) q0[67];
-sx q0[67];
-rz(pi/2) q0[67];
-cx q0[67],q0[12];
-sx q0[68];
-sx q0[69];
-rz(2.4374524) q0[69];
-cx q0[68],q0[69];
-rz(0.23627111) q0[69];
-cx q0[68],q0[69];
-rz(-pi) q0[68];
-sx q0[68];
-rz(-pi) q0[68];
-rz(-2.7787171) q0[69];
-sx q0[69];
-rz(-pi) q0[69];
-cx q0[68],q0[69];
-sx q0[69];
-rz(2.7787171) q0[69];
-sx q0[69];
-rz(-pi) q0[69];
-cx q0[68],q0[69];
-cx q0[68],q0[13];
-rz(pi/2) q0[68];
-sx q0[68];
-rz(pi/2) q0[68];
-cx q0[13],q0[68];
-rz(-pi/4) q0[68];
-cx q0[0],q0[68];
-rz(pi/4) q0[68];
-cx q0[13],q0[68];
-rz(pi/4) q0[13];
-rz(-pi/4) q0[68];
-cx q0[0],q0[68];
-cx q0[0],q0[13];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[13];
-cx q0[0],q0[13];
-rz(3*pi/4) q0[68];
-sx q0[68];
-rz(pi/2) q0[68];
-cx q0[68],q0[13];
-sx q0[69];
-sx q0[70];
-rz(1.1801639) q0[70];
-cx q0[69],q0[70];
-rz(1.9810158) q0[70];
-cx q0[69],q0[70];
-rz(-pi) q0[69];
-sx q0[69];
-rz(-pi) q0[69];
-rz(-2.064931) q0[70];
-sx q0[70];
-rz(-pi) q0[70];
-cx q0[69],q0[70];
-sx q0[70];
-rz(2.064931) q0[70];
-sx q0[70];
-rz(-pi) q0[70];
-cx q0[69],q0[70];
-cx q0[69],q0[14];
-rz(pi/2) q0[69];
-sx q0[69];
-rz(pi/2) q0[69];
-cx q0[14],q0[69];
-rz(-pi/4) q0[69];
-cx q0[0],q0[69];
-rz(pi/4) q0[69];
-cx q0[14],q0[69];
-rz(pi/4) q0[14];
-rz(-pi/4) q0[69];
-cx q0[0],q0[69];
-cx q0[0],q0[14];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[14];
-cx q0[0],q0[14];
-rz(3*pi/4) q0[69];
-sx q0[69];
-rz(pi/2) q0[69];
-cx q0[69],q0[14];
-sx q0[70];
-sx q0[71];
-rz(0.75220483) q0[71];
-cx q0[70],q0[71];
-rz(2.5105756) q0[71];
-cx q0[70],q0[71];
-rz(-pi) q0[70];
-sx q0[70];
-rz(-pi) q0[70];
-rz(-1.6639012) q0[71];
-sx q0[71];
-rz(-pi) q0[71];
-cx q0[70],q0[71];
-sx q0[71];
-rz(1.6639012) q0[71];
-sx q0[71];
-rz(-pi) q0[71];
-cx q0[70],q0[71];
-cx q0[70],q0[15];
-rz(pi/2) q0[70];
-sx q0[70];
-rz(pi/2) q0[70];
-cx q0[15],q0[70];
-rz(-pi/4) q0[70];
-cx q0[0],q0[70];
-rz(pi/4) q0[70];
-cx q0[15],q0[70];
-rz(pi/4) q0[15];
-rz(-pi/4) q0[70];
-cx q0[0],q0[70];
-cx q0[0],q0[15];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[15];
-cx q0[0],q0[15];
-rz(3*pi/4) q0[70];
-sx q0[70];
-rz(pi/2) q0[70];
-cx q0[70],q0[15];
-sx q0[71];
-sx q0[72];
-rz(0.65151532) q0[72];
-cx q0[71],q0[72];
-rz(1.2427889) q0[72];
-cx q0[71],q0[72];
-rz(-pi) q0[71];
-sx q0[71];
-rz(-pi) q0[71];
-rz(-1.727353) q0[72];
-sx q0[72];
-rz(-pi) q0[72];
-cx q0[71],q0[72];
-sx q0[72];
-rz(1.727353) q0[72];
-sx q0[72];
-rz(-pi) q0[72];
-cx q0[71],q0[72];
-cx q0[71],q0[16];
-rz(pi/2) q0[71];
-sx q0[71];
-rz(pi/2) q0[71];
-cx q0[16],q0[71];
-rz(-pi/4) q0[71];
-cx q0[0],q0[71];
-rz(pi/4) q0[71];
-cx q0[16],q0[71];
-rz(pi/4) q0[16];
-rz(-pi/4) q0[71];
-cx q0[0],q0[71];
-cx q0[0],q0[16];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[16];
-cx q0[0],q0[16];
-rz(3*pi/4) q0[71];
-sx q0[71];
-rz(pi/2) q0[71];
-cx q0[71],q0[16];
-sx q0[72];
-sx q0[73];
-rz(0.63273516) q0[73];
-cx q0[72],q0[73];
-rz(1.4203298) q0[73];
-cx q0[72],q0[73];
-rz(-pi) q0[72];
-sx q0[72];
-rz(-pi) q0[72];
-rz(-1.5832984) q0[73];
-sx q0[73];
-rz(-pi) q0[73];
-cx q0[72],q0[73];
-sx q0[73];
-rz(1.5832984) q0[73];
-sx q0[73];
-rz(-pi) q0[73];
-cx q0[72],q0[73];
-cx q0[72],q0[17];
-rz(pi/2) q0[72];
-sx q0[72];
-rz(pi/2) q0[72];
-cx q0[17],q0[72];
-rz(-pi/4) q0[72];
-cx q0[0],q0[72];
-rz(pi/4) q0[72];
-cx q0[17],q0[72];
-rz(pi/4) q0[17];
-rz(-pi/4) q0[72];
-cx q0[0],q0[72];
-cx q0[0],q0[17];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[17];
-cx q0[0],q0[17];
-rz(3*pi/4) q0[72];
-sx q0[72];
-rz(pi/2) q0[72];
-cx q0[72],q0[17];
-sx q0[73];
-sx q0[74];
-rz(0.46986542) q0[74];
-cx q0[73],q0[74];
-rz(0.74631883) q0[74];
-cx q0[73],q0[74];
-rz(-pi) q0[73];
-sx q0[73];
-rz(-pi) q0[73];
-rz(-2.2700782) q0[74];
-sx q0[74];
-rz(-pi) q0[74];
-cx q0[73],q0[74];
-sx q0[74];
-rz(2.2700782) q0[74];
-sx q0[74];
-rz(-pi) q0[74];
-cx q0[73],q0[74];
-cx q0[73],q0[18];
-rz(pi/2) q0[73];
-sx q0[73];
-rz(pi/2) q0[73];
-cx q0[18],q0[73];
-rz(-pi/4) q0[73];
-cx q0[0],q0[73];
-rz(pi/4) q0[73];
-cx q0[18],q0[73];
-rz(pi/4) q0[18];
-rz(-pi/4) q0[73];
-cx q0[0],q0[73];
-cx q0[0],q0[18];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[18];
-cx q0[0],q0[18];
-rz(3*pi/4) q0[73];
-sx q0[73];
-rz(pi/2) q0[73];
-cx q0[73],q0[18];
-sx q0[74];
-sx q0[75];
-rz(2.8145417) q0[75];
-cx q0[74],q0[75];
-rz(2.5600028) q0[75];
-cx q0[74],q0[75];
-rz(-pi) q0[74];
-sx q0[74];
-rz(-pi) q0[74];
-rz(-1.7059785) q0[75];
-sx q0[75];
-rz(-pi) q0[75];
-cx q0[74],q0[75];
-sx q0[75];
-rz(1.7059785) q0[75];
-sx q0[75];
-rz(-pi) q0[75];
-cx q0[74],q0[75];
-cx q0[74],q0[19];
-rz(pi/2) q0[74];
-sx q0[74];
-rz(pi/2) q0[74];
-cx q0[19],q0[74];
-rz(-pi/4) q0[74];
-cx q0[0],q0[74];
-rz(pi/4) q0[74];
-cx q0[19],q0[74];
-rz(pi/4) q0[19];
-rz(-pi/4) q0[74];
-cx q0[0],q0[74];
-cx q0[0],q0[19];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[19];
-cx q0[0],q0[19];
-rz(3*pi/4) q0[74];
-sx q0[74];
-rz(pi/2) q0[74];
-cx q0[74],q0[19];
-sx q0[75];
-sx q0[76];
-rz(3.0835165) q0[76];
-cx q0[75],q0[76];
-rz(1.4298412) q0[76];
-cx q0[75],q0[76];
-rz(-pi) q0[75];
-sx q0[75];
-rz(-pi) q0[75];
-rz(-2.8433611) q0[76];
-sx q0[76];
-rz(-pi) q0[76];
-cx q0[75],q0[76];
-sx q0[76];
-rz(2.8433611) q0[76];
-sx q0[76];
-rz(-pi) q0[76];
-cx q0[75],q0[76];
-cx q0[75],q0[20];
-rz(pi/2) q0[75];
-sx q0[75];
-rz(pi/2) q0[75];
-cx q0[20],q0[75];
-rz(-pi/4) q0[75];
-cx q0[0],q0[75];
-rz(pi/4) q0[75];
-cx q0[20],q0[75];
-rz(pi/4) q0[20];
-rz(-pi/4) q0[75];
-cx q0[0],q0[75];
-cx q0[0],q0[20];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[20];
-cx q0[0],q0[20];
-rz(3*pi/4) q0[75];
-sx q0[75];
-rz(pi/2) q0[75];
-cx q0[75],q0[20];
-sx q0[76];
-sx q0[77];
-rz(2.5606492) q0[77];
-cx q0[76],q0[77];
-rz(1.3683175) q0[77];
-cx q0[76],q0[77];
-rz(-pi) q0[76];
-sx q0[76];
-rz(-pi) q0[76];
-rz(-1.805515) q0[77];
-sx q0[77];
-rz(-pi) q0[77];
-cx q0[76],q0[77];
-sx q0[77];
-rz(1.805515) q0[77];
-sx q0[77];
-rz(-pi) q0[77];
-cx q0[76],q0[77];
-cx q0[76],q0[21];
-rz(pi/2) q0[76];
-sx q0[76];
-rz(pi/2) q0[76];
-cx q0[21],q0[76];
-rz(-pi/4) q0[76];
-cx q0[0],q0[76];
-rz(pi/4) q0[76];
-cx q0[21],q0[76];
-rz(pi/4) q0[21];
-rz(-pi/4) q0[76];
-cx q0[0],q0[76];
-cx q0[0],q0[21];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[21];
-cx q0[0],q0[21];
-rz(3*pi/4) q0[76];
-sx q0[76];
-rz(pi/2) q0[76];
-cx q0[76],q0[21];
-sx q0[77];
-sx q0[78];
-rz(2.9912538) q0[78];
-cx q0[77],q0[78];
-rz(2.3584912) q0[78];
-cx q0[77],q0[78];
-rz(-pi) q0[77];
-sx q0[77];
-rz(-pi) q0[77];
-rz(-1.595493) q0[78];
-sx q0[78];
-rz(-pi) q0[78];
-cx q0[77],q0[78];
-sx q0[78];
-rz(1.595493) q0[78];
-sx q0[78];
-rz(-pi) q0[78];
-cx q0[77],q0[78];
-cx q0[77],q0[22];
-rz(pi/2) q0[77];
-sx q0[77];
-rz(pi/2) q0[77];
-cx q0[22],q0[77];
-rz(-pi/4) q0[77];
-cx q0[0],q0[77];
-rz(pi/4) q0[77];
-cx q0[22],q0[77];
-rz(pi/4) q0[22];
-rz(-pi/4) q0[77];
-cx q0[0],q0[77];
-cx q0[0],q0[22];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[22];
-cx q0[0],q0[22];
-rz(3*pi/4) q0[77];
-sx q0[77];
-rz(pi/2) q0[77];
-cx q0[77],q0[22];
-sx q0[78];
-sx q0[79];
-rz(0.28814541) q0[79];
-cx q0[78],q0[79];
-rz(0.81695589) q0[79];
-cx q0[78],q0[79];
-rz(-pi) q0[78];
-sx q0[78];
-rz(-pi) q0[78];
-rz(-2.1919878) q0[79];
-sx q0[79];
-rz(-pi) q0[79];
-cx q0[78],q0[79];
-sx q0[79];
-rz(2.1919878) q0[79];
-sx q0[79];
-rz(-pi) q0[79];
-cx q0[78],q0[79];
-cx q0[78],q0[23];
-rz(pi/2) q0[78];
-sx q0[78];
-rz(pi/2) q0[78];
-cx q0[23],q0[78];
-rz(-pi/4) q0[78];
-cx q0[0],q0[78];
-rz(pi/4) q0[78];
-cx q0[23],q0[78];
-rz(pi/4) q0[23];
-rz(-pi/4) q0[78];
-cx q0[0],q0[78];
-cx q0[0],q0[23];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[23];
-cx q0[0],q0[23];
-rz(3*pi/4) q0[78];
-sx q0[78];
-rz(pi/2) q0[78];
-cx q0[78],q0[23];
-sx q0[79];
-sx q0[80];
-rz(0.83758492) q0[80];
-cx q0[79],q0[80];
-rz(1.283897) q0[80];
-cx q0[79],q0[80];
-rz(-pi) q0[79];
-sx q0[79];
-rz(-pi) q0[79];
-rz(-2.5600971) q0[80];
-sx q0[80];
-rz(-pi) q0[80];
-cx q0[79],q0[80];
-sx q0[80];
-rz(2.5600971) q0[80];
-sx q0[80];
-rz(-pi) q0[80];
-cx q0[79],q0[80];
-cx q0[79],q0[24];
-rz(pi/2) q0[79];
-sx q0[79];
-rz(pi/2) q0[79];
-cx q0[24],q0[79];
-rz(-pi/4) q0[79];
-cx q0[0],q0[79];
-rz(pi/4) q0[79];
-cx q0[24],q0[79];
-rz(pi/4) q0[24];
-rz(-pi/4) q0[79];
-cx q0[0],q0[79];
-cx q0[0],q0[24];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[24];
-cx q0[0],q0[24];
-rz(3*pi/4) q0[79];
-sx q0[79];
-rz(pi/2) q0[79];
-cx q0[79],q0[24];
-sx q0[80];
-sx q0[81];
-rz(0.85842636) q0[81];
-cx q0[80],q0[81];
-rz(2.2676042) q0[81];
-cx q0[80],q0[81];
-rz(-pi) q0[80];
-sx q0[80];
-rz(-pi) q0[80];
-rz(-1.7184446) q0[81];
-sx q0[81];
-rz(-pi) q0[81];
-cx q0[80],q0[81];
-sx q0[81];
-rz(1.7184446) q0[81];
-sx q0[81];
-rz(-pi) q0[81];
-cx q0[80],q0[81];
-cx q0[80],q0[25];
-rz(pi/2) q0[80];
-sx q0[80];
-rz(pi/2) q0[80];
-cx q0[25],q0[80];
-rz(-pi/4) q0[80];
-cx q0[0],q0[80];
-rz(pi/4) q0[80];
-cx q0[25],q0[80];
-rz(pi/4) q0[25];
-rz(-pi/4) q0[80];
-cx q0[0],q0[80];
-cx q0[0],q0[25];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[25];
-cx q0[0],q0[25];
-rz(3*pi/4) q0[80];
-sx q0[80];
-rz(pi/2) q0[80];
-cx q0[80],q0[25];
-sx q0[81];
-sx q0[82];
-rz(1.0611267) q0[82];
-cx q0[81],q0[82];
-rz(0.37348451) q0[82];
-cx q0[81],q0[82];
-rz(-pi) q0[81];
-sx q0[81];
-rz(-pi) q0[81];
-rz(-2.8771035) q0[82];
-sx q0[82];
-rz(-pi) q0[82];
-cx q0[81],q0[82];
-sx q0[82];
-rz(2.8771035) q0[82];
-sx q0[82];
-rz(-pi) q0[82];
-cx q0[81],q0[82];
-cx q0[81],q0[26];
-rz(pi/2) q0[81];
-sx q0[81];
-rz(pi/2) q0[81];
-cx q0[26],q0[81];
-rz(-pi/4) q0[81];
-cx q0[0],q0[81];
-rz(pi/4) q0[81];
-cx q0[26],q0[81];
-rz(pi/4) q0[26];
-rz(-pi/4) q0[81];
-cx q0[0],q0[81];
-cx q0[0],q0[26];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[26];
-cx q0[0],q0[26];
-rz(3*pi/4) q0[81];
-sx q0[81];
-rz(pi/2) q0[81];
-cx q0[81],q0[26];
-sx q0[82];
-sx q0[83];
-rz(1.5533722) q0[83];
-cx q0[82],q0[83];
-rz(0.73232847) q0[83];
-cx q0[82],q0[83];
-rz(-pi) q0[82];
-sx q0[82];
-rz(-pi) q0[82];
-rz(-1.6675556) q0[83];
-sx q0[83];
-rz(-pi) q0[83];
-cx q0[82],q0[83];
-sx q0[83];
-rz(1.6675556) q0[83];
-sx q0[83];
-rz(-pi) q0[83];
-cx q0[82],q0[83];
-cx q0[82],q0[27];
-rz(pi/2) q0[82];
-sx q0[82];
-rz(pi/2) q0[82];
-cx q0[27],q0[82];
-rz(-pi/4) q0[82];
-cx q0[0],q0[82];
-rz(pi/4) q0[82];
-cx q0[27],q0[82];
-rz(pi/4) q0[27];
-rz(-pi/4) q0[82];
-cx q0[0],q0[82];
-cx q0[0],q0[27];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[27];
-cx q0[0],q0[27];
-rz(3*pi/4) q0[82];
-sx q0[82];
-rz(pi/2) q0[82];
-cx q0[82],q0[27];
-sx q0[83];
-sx q0[84];
-rz(2.3855186) q0[84];
-cx q0[83],q0[84];
-rz(1.2752985) q0[84];
-cx q0[83],q0[84];
-rz(-pi) q0[83];
-sx q0[83];
-rz(-pi) q0[83];
-rz(-1.9129415) q0[84];
-sx q0[84];
-rz(-pi) q0[84];
-cx q0[83],q0[84];
-sx q0[84];
-rz(1.9129415) q0[84];
-sx q0[84];
-rz(-pi) q0[84];
-cx q0[83],q0[84];
-cx q0[83],q0[28];
-rz(pi/2) q0[83];
-sx q0[83];
-rz(pi/2) q0[83];
-cx q0[28],q0[83];
-rz(-pi/4) q0[83];
-cx q0[0],q0[83];
-rz(pi/4) q0[83];
-cx q0[28],q0[83];
-rz(pi/4) q0[28];
-rz(-pi/4) q0[83];
-cx q0[0],q0[83];
-cx q0[0],q0[28];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[28];
-cx q0[0],q0[28];
-rz(3*pi/4) q0[83];
-sx q0[83];
-rz(pi/2) q0[83];
-cx q0[83],q0[28];
-sx q0[84];
-sx q0[85];
-rz(2.1463239) q0[85];
-cx q0[84],q0[85];
-rz(0.9433834) q0[85];
-cx q0[84],q0[85];
-rz(-pi) q0[84];
-sx q0[84];
-rz(-pi) q0[84];
-rz(-2.8613636) q0[85];
-sx q0[85];
-rz(-pi) q0[85];
-cx q0[84],q0[85];
-sx q0[85];
-rz(2.8613636) q0[85];
-sx q0[85];
-rz(-pi) q0[85];
-cx q0[84],q0[85];
-cx q0[84],q0[29];
-rz(pi/2) q0[84];
-sx q0[84];
-rz(pi/2) q0[84];
-cx q0[29],q0[84];
-rz(-pi/4) q0[84];
-cx q0[0],q0[84];
-rz(pi/4) q0[84];
-cx q0[29],q0[84];
-rz(pi/4) q0[29];
-rz(-pi/4) q0[84];
-cx q0[0],q0[84];
-cx q0[0],q0[29];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[29];
-cx q0[0],q0[29];
-rz(3*pi/4) q0[84];
-sx q0[84];
-rz(pi/2) q0[84];
-cx q0[84],q0[29];
-sx q0[85];
-sx q0[86];
-rz(0.42448099) q0[86];
-cx q0[85],q0[86];
-rz(0.56679944) q0[86];
-cx q0[85],q0[86];
-rz(-pi) q0[85];
-sx q0[85];
-rz(-pi) q0[85];
-rz(-2.4155395) q0[86];
-sx q0[86];
-rz(-pi) q0[86];
-cx q0[85],q0[86];
-sx q0[86];
-rz(2.4155395) q0[86];
-sx q0[86];
-rz(-pi) q0[86];
-cx q0[85],q0[86];
-cx q0[85],q0[30];
-rz(pi/2) q0[85];
-sx q0[85];
-rz(pi/2) q0[85];
-cx q0[30],q0[85];
-rz(-pi/4) q0[85];
-cx q0[0],q0[85];
-rz(pi/4) q0[85];
-cx q0[30],q0[85];
-rz(pi/4) q0[30];
-rz(-pi/4) q0[85];
-cx q0[0],q0[85];
-cx q0[0],q0[30];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[30];
-cx q0[0],q0[30];
-rz(3*pi/4) q0[85];
-sx q0[85];
-rz(pi/2) q0[85];
-cx q0[85],q0[30];
-sx q0[86];
-sx q0[87];
-rz(1.4338093) q0[87];
-cx q0[86],q0[87];
-rz(2.8725646) q0[87];
-cx q0[86],q0[87];
-rz(-pi) q0[86];
-sx q0[86];
-rz(-pi) q0[86];
-rz(-1.8648829) q0[87];
-sx q0[87];
-rz(-pi) q0[87];
-cx q0[86],q0[87];
-sx q0[87];
-rz(1.8648829) q0[87];
-sx q0[87];
-rz(-pi) q0[87];
-cx q0[86],q0[87];
-cx q0[86],q0[31];
-rz(pi/2) q0[86];
-sx q0[86];
-rz(pi/2) q0[86];
-cx q0[31],q0[86];
-rz(-pi/4) q0[86];
-cx q0[0],q0[86];
-rz(pi/4) q0[86];
-cx q0[31],q0[86];
-rz(pi/4) q0[31];
-rz(-pi/4) q0[86];
-cx q0[0],q0[86];
-cx q0[0],q0[31];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[31];
-cx q0[0],q0[31];
-rz(3*pi/4) q0[86];
-sx q0[86];
-rz(pi/2) q0[86];
-cx q0[86],q0[31];
-sx q0[87];
-sx q0[88];
-rz(2.7967341) q0[88];
-cx q0[87],q0[88];
-rz(2.2350797) q0[88];
-cx q0[87],q0[88];
-rz(-pi) q0[87];
-sx q0[87];
-rz(-pi) q0[87];
-rz(-2.1403422) q0[88];
-sx q0[88];
-rz(-pi) q0[88];
-cx q0[87],q0[88];
-sx q0[88];
-rz(2.1403422) q0[88];
-sx q0[88];
-rz(-pi) q0[88];
-cx q0[87],q0[88];
-cx q0[87],q0[32];
-rz(pi/2) q0[87];
-sx q0[87];
-rz(pi/2) q0[87];
-cx q0[32],q0[87];
-rz(-pi/4) q0[87];
-cx q0[0],q0[87];
-rz(pi/4) q0[87];
-cx q0[32],q0[87];
-rz(pi/4) q0[32];
-rz(-pi/4) q0[87];
-cx q0[0],q0[87];
-cx q0[0],q0[32];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[32];
-cx q0[0],q0[32];
-rz(3*pi/4) q0[87];
-sx q0[87];
-rz(pi/2) q0[87];
-cx q0[87],q0[32];
-sx q0[88];
-sx q0[89];
-rz(0.17070267) q0[89];
-cx q0[88],q0[89];
-rz(1.6881056) q0[89];
-cx q0[88],q0[89];
-rz(-pi) q0[88];
-sx q0[88];
-rz(-pi) q0[88];
-rz(-2.0630797) q0[89];
-sx q0[89];
-rz(-pi) q0[89];
-cx q0[88],q0[89];
-sx q0[89];
-rz(2.0630797) q0[89];
-sx q0[89];
-rz(-pi) q0[89];
-cx q0[88],q0[89];
-cx q0[88],q0[33];
-rz(pi/2) q0[88];
-sx q0[88];
-rz(pi/2) q0[88];
-cx q0[33],q0[88];
-rz(-pi/4) q0[88];
-cx q0[0],q0[88];
-rz(pi/4) q0[88];
-cx q0[33],q0[88];
-rz(pi/4) q0[33];
-rz(-pi/4) q0[88];
-cx q0[0],q0[88];
-cx q0[0],q0[33];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[33];
-cx q0[0],q0[33];
-rz(3*pi/4) q0[88];
-sx q0[88];
-rz(pi/2) q0[88];
-cx q0[88],q0[33];
-sx q0[89];
-sx q0[90];
-rz(1.6690391) q0[90];
-cx q0[89],q0[90];
-rz(2.9399296) q0[90];
-cx q0[89],q0[90];
-rz(-pi) q0[89];
-sx q0[89];
-rz(-pi) q0[89];
-rz(-2.8390311) q0[90];
-sx q0[90];
-rz(-pi) q0[90];
-cx q0[89],q0[90];
-sx q0[90];
-rz(2.8390311) q0[90];
-sx q0[90];
-rz(-pi) q0[90];
-cx q0[89],q0[90];
-cx q0[89],q0[34];
-rz(pi/2) q0[89];
-sx q0[89];
-rz(pi/2) q0[89];
-cx q0[34],q0[89];
-rz(-pi/4) q0[89];
-cx q0[0],q0[89];
-rz(pi/4) q0[89];
-cx q0[34],q0[89];
-rz(pi/4) q0[34];
-rz(-pi/4) q0[89];
-cx q0[0],q0[89];
-cx q0[0],q0[34];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[34];
-cx q0[0],q0[34];
-rz(3*pi/4) q0[89];
-sx q0[89];
-rz(pi/2) q0[89];
-cx q0[89],q0[34];
-sx q0[90];
-sx q0[91];
-rz(0.24944556) q0[91];
-cx q0[90],q0[91];
-rz(1.0792485) q0[91];
-cx q0[90],q0[91];
-rz(-pi) q0[90];
-sx q0[90];
-rz(-pi) q0[90];
-rz(-2.3696054) q0[91];
-sx q0[91];
-rz(-pi) q0[91];
-cx q0[90],q0[91];
-sx q0[91];
-rz(2.3696054) q0[91];
-sx q0[91];
-rz(-pi) q0[91];
-cx q0[90],q0[91];
-cx q0[90],q0[35];
-rz(pi/2) q0[90];
-sx q0[90];
-rz(pi/2) q0[90];
-cx q0[35],q0[90];
-rz(-pi/4) q0[90];
-cx q0[0],q0[90];
-rz(pi/4) q0[90];
-cx q0[35],q0[90];
-rz(pi/4) q0[35];
-rz(-pi/4) q0[90];
-cx q0[0],q0[90];
-cx q0[0],q0[35];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[35];
-cx q0[0],q0[35];
-rz(3*pi/4) q0[90];
-sx q0[90];
-rz(pi/2) q0[90];
-cx q0[90],q0[35];
-sx q0[91];
-sx q0[92];
-rz(0.61222913) q0[92];
-cx q0[91],q0[92];
-rz(1.4255663) q0[92];
-cx q0[91],q0[92];
-rz(-pi) q0[91];
-sx q0[91];
-rz(-pi) q0[91];
-rz(-1.6747473) q0[92];
-sx q0[92];
-rz(-pi) q0[92];
-cx q0[91],q0[92];
-sx q0[92];
-rz(1.6747473) q0[92];
-sx q0[92];
-rz(-pi) q0[92];
-cx q0[91],q0[92];
-cx q0[91],q0[36];
-rz(pi/2) q0[91];
-sx q0[91];
-rz(pi/2) q0[91];
-cx q0[36],q0[91];
-rz(-pi/4) q0[91];
-cx q0[0],q0[91];
-rz(pi/4) q0[91];
-cx q0[36],q0[91];
-rz(pi/4) q0[36];
-rz(-pi/4) q0[91];
-cx q0[0],q0[91];
-cx q0[0],q0[36];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[36];
-cx q0[0],q0[36];
-rz(3*pi/4) q0[91];
-sx q0[91];
-rz(pi/2) q0[91];
-cx q0[91],q0[36];
-sx q0[92];
-sx q0[93];
-rz(1.4645165) q0[93];
-cx q0[92],q0[93];
-rz(2.1346978) q0[93];
-cx q0[92],q0[93];
-rz(-pi) q0[92];
-sx q0[92];
-rz(-pi) q0[92];
-rz(-2.6737064) q0[93];
-sx q0[93];
-rz(-pi) q0[93];
-cx q0[92],q0[93];
-sx q0[93];
-rz(2.6737064) q0[93];
-sx q0[93];
-rz(-pi) q0[93];
-cx q0[92],q0[93];
-cx q0[92],q0[37];
-rz(pi/2) q0[92];
-sx q0[92];
-rz(pi/2) q0[92];
-cx q0[37],q0[92];
-rz(-pi/4) q0[92];
-cx q0[0],q0[92];
-rz(pi/4) q0[92];
-cx q0[37],q0[92];
-rz(pi/4) q0[37];
-rz(-pi/4) q0[92];
-cx q0[0],q0[92];
-cx q0[0],q0[37];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[37];
-cx q0[0],q0[37];
-rz(3*pi/4) q0[92];
-sx q0[92];
-rz(pi/2) q0[92];
-cx q0[92],q0[37];
-sx q0[93];
-sx q0[94];
-rz(1.5299084) q0[94];
-cx q0[93],q0[94];
-rz(0.3178141) q0[94];
-cx q0[93],q0[94];
-rz(-pi) q0[93];
-sx q0[93];
-rz(-pi) q0[93];
-rz(-1.9156626) q0[94];
-sx q0[94];
-rz(-pi) q0[94];
-cx q0[93],q0[94];
-sx q0[94];
-rz(1.9156626) q0[94];
-sx q0[94];
-rz(-pi) q0[94];
-cx q0[93],q0[94];
-cx q0[93],q0[38];
-rz(pi/2) q0[93];
-sx q0[93];
-rz(pi/2) q0[93];
-cx q0[38],q0[93];
-rz(-pi/4) q0[93];
-cx q0[0],q0[93];
-rz(pi/4) q0[93];
-cx q0[38],q0[93];
-rz(pi/4) q0[38];
-rz(-pi/4) q0[93];
-cx q0[0],q0[93];
-cx q0[0],q0[38];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[38];
-cx q0[0],q0[38];
-rz(3*pi/4) q0[93];
-sx q0[93];
-rz(pi/2) q0[93];
-cx q0[93],q0[38];
-sx q0[94];
-sx q0[95];
-rz(3.0804031) q0[95];
-cx q0[94],q0[95];
-rz(1.3791102) q0[95];
-cx q0[94],q0[95];
-rz(-pi) q0[94];
-sx q0[94];
-rz(-pi) q0[94];
-rz(-1.9334204) q0[95];
-sx q0[95];
-rz(-pi) q0[95];
-cx q0[94],q0[95];
-sx q0[95];
-rz(1.9334204) q0[95];
-sx q0[95];
-rz(-pi) q0[95];
-cx q0[94],q0[95];
-cx q0[94],q0[39];
-rz(pi/2) q0[94];
-sx q0[94];
-rz(pi/2) q0[94];
-cx q0[39],q0[94];
-rz(-pi/4) q0[94];
-cx q0[0],q0[94];
-rz(pi/4) q0[94];
-cx q0[39],q0[94];
-rz(pi/4) q0[39];
-rz(-pi/4) q0[94];
-cx q0[0],q0[94];
-cx q0[0],q0[39];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[39];
-cx q0[0],q0[39];
-rz(3*pi/4) q0[94];
-sx q0[94];
-rz(pi/2) q0[94];
-cx q0[94],q0[39];
-sx q0[95];
-sx q0[96];
-rz(1.5298344) q0[96];
-cx q0[95],q0[96];
-rz(0.31457219) q0[96];
-cx q0[95],q0[96];
-rz(-pi) q0[95];
-sx q0[95];
-rz(-pi) q0[95];
-rz(-1.8849198) q0[96];
-sx q0[96];
-rz(-pi) q0[96];
-cx q0[95],q0[96];
-sx q0[96];
-rz(1.8849198) q0[96];
-sx q0[96];
-rz(-pi) q0[96];
-cx q0[95],q0[96];
-cx q0[95],q0[40];
-rz(pi/2) q0[95];
-sx q0[95];
-rz(pi/2) q0[95];
-cx q0[40],q0[95];
-rz(-pi/4) q0[95];
-cx q0[0],q0[95];
-rz(pi/4) q0[95];
-cx q0[40],q0[95];
-rz(pi/4) q0[40];
-rz(-pi/4) q0[95];
-cx q0[0],q0[95];
-cx q0[0],q0[40];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[40];
-cx q0[0],q0[40];
-rz(3*pi/4) q0[95];
-sx q0[95];
-rz(pi/2) q0[95];
-cx q0[95],q0[40];
-sx q0[96];
-sx q0[97];
-rz(2.60582) q0[97];
-cx q0[96],q0[97];
-rz(2.6029457) q0[97];
-cx q0[96],q0[97];
-rz(-pi) q0[96];
-sx q0[96];
-rz(-pi) q0[96];
-rz(-2.6198964) q0[97];
-sx q0[97];
-rz(-pi) q0[97];
-cx q0[96],q0[97];
-sx q0[97];
-rz(2.6198964) q0[97];
-sx q0[97];
-rz(-pi) q0[97];
-cx q0[96],q0[97];
-cx q0[96],q0[41];
-rz(pi/2) q0[96];
-sx q0[96];
-rz(pi/2) q0[96];
-cx q0[41],q0[96];
-rz(-pi/4) q0[96];
-cx q0[0],q0[96];
-rz(pi/4) q0[96];
-cx q0[41],q0[96];
-rz(pi/4) q0[41];
-rz(-pi/4) q0[96];
-cx q0[0],q0[96];
-cx q0[0],q0[41];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[41];
-cx q0[0],q0[41];
-rz(3*pi/4) q0[96];
-sx q0[96];
-rz(pi/2) q0[96];
-cx q0[96],q0[41];
-sx q0[97];
-sx q0[98];
-rz(1.4487496) q0[98];
-cx q0[97],q0[98];
-rz(0.38966741) q0[98];
-cx q0[97],q0[98];
-rz(-pi) q0[97];
-sx q0[97];
-rz(-pi) q0[97];
-rz(-2.1776296) q0[98];
-sx q0[98];
-rz(-pi) q0[98];
-cx q0[97],q0[98];
-sx q0[98];
-rz(2.1776296) q0[98];
-sx q0[98];
-rz(-pi) q0[98];
-cx q0[97],q0[98];
-cx q0[97],q0[42];
-rz(pi/2) q0[97];
-sx q0[97];
-rz(pi/2) q0[97];
-cx q0[42],q0[97];
-rz(-pi/4) q0[97];
-cx q0[0],q0[97];
-rz(pi/4) q0[97];
-cx q0[42],q0[97];
-rz(pi/4) q0[42];
-rz(-pi/4) q0[97];
-cx q0[0],q0[97];
-cx q0[0],q0[42];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[42];
-cx q0[0],q0[42];
-rz(3*pi/4) q0[97];
-sx q0[97];
-rz(pi/2) q0[97];
-cx q0[97],q0[42];
-sx q0[98];
-sx q0[99];
-rz(1.8313782) q0[99];
-cx q0[98],q0[99];
-rz(2.2942652) q0[99];
-cx q0[98],q0[99];
-rz(-pi) q0[98];
-sx q0[98];
-rz(-pi) q0[98];
-rz(-2.2893548) q0[99];
-sx q0[99];
-rz(-pi) q0[99];
-cx q0[98],q0[99];
-sx q0[99];
-rz(2.2893548) q0[99];
-sx q0[99];
-rz(-pi) q0[99];
-cx q0[98],q0[99];
-cx q0[98],q0[43];
-rz(pi/2) q0[98];
-sx q0[98];
-rz(pi/2) q0[98];
-cx q0[43],q0[98];
-rz(-pi/4) q0[98];
-cx q0[0],q0[98];
-rz(pi/4) q0[98];
-cx q0[43],q0[98];
-rz(pi/4) q0[43];
-rz(-pi/4) q0[98];
-cx q0[0],q0[98];
-cx q0[0],q0[43];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[43];
-cx q0[0],q0[43];
-rz(3*pi/4) q0[98];
-sx q0[98];
-rz(pi/2) q0[98];
-cx q0[98],q0[43];
-sx q0[99];
-sx q0[100];
-rz(2.1333211) q0[100];
-cx q0[99],q0[100];
-rz(0.32027946) q0[100];
-cx q0[99],q0[100];
-rz(-2.0320812) q0[100];
-sx q0[100];
-rz(-pi) q0[100];
-rz(-pi) q0[99];
-sx q0[99];
-rz(-pi) q0[99];
-cx q0[99],q0[100];
-sx q0[100];
-rz(2.0320812) q0[100];
-sx q0[100];
-rz(-pi) q0[100];
-cx q0[99],q0[100];
-sx q0[100];
-cx q0[99],q0[44];
-rz(pi/2) q0[99];
-sx q0[99];
-rz(pi/2) q0[99];
-cx q0[44],q0[99];
-rz(-pi/4) q0[99];
-cx q0[0],q0[99];
-rz(pi/4) q0[99];
-cx q0[44],q0[99];
-rz(pi/4) q0[44];
-rz(-pi/4) q0[99];
-cx q0[0],q0[99];
-cx q0[0],q0[44];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[44];
-cx q0[0],q0[44];
-rz(3*pi/4) q0[99];
-sx q0[99];
-rz(pi/2) q0[99];
-cx q0[99],q0[44];
-sx q0[101];
-rz(2.605398) q0[101];
-cx q0[100],q0[101];
-rz(1.3616667) q0[101];
-cx q0[100],q0[101];
-rz(-pi) q0[100];
-sx q0[100];
-rz(-pi) q0[100];
-rz(-2.7985222) q0[101];
-sx q0[101];
-rz(-pi) q0[101];
-cx q0[100],q0[101];
-sx q0[101];
-rz(2.7985222) q0[101];
-sx q0[101];
-rz(-pi) q0[101];
-cx q0[100],q0[101];
-cx q0[100],q0[45];
-rz(pi/2) q0[100];
-sx q0[100];
-rz(pi/2) q0[100];
-sx q0[101];
-cx q0[45],q0[100];
-rz(-pi/4) q0[100];
-cx q0[0],q0[100];
-rz(pi/4) q0[100];
-cx q0[45],q0[100];
-rz(-pi/4) q0[100];
-cx q0[0],q0[100];
-rz(3*pi/4) q0[100];
-sx q0[100];
-rz(pi/2) q0[100];
-rz(pi/4) q0[45];
-cx q0[0],q0[45];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[45];
-cx q0[0],q0[45];
-cx q0[100],q0[45];
-sx q0[102];
-rz(1.5510535) q0[102];
-cx q0[101],q0[102];
-rz(2.2357687) q0[102];
-cx q0[101],q0[102];
-rz(-pi) q0[101];
-sx q0[101];
-rz(-pi) q0[101];
-rz(-2.1569077) q0[102];
-sx q0[102];
-rz(-pi) q0[102];
-cx q0[101],q0[102];
-sx q0[102];
-rz(2.1569077) q0[102];
-sx q0[102];
-rz(-pi) q0[102];
-cx q0[101],q0[102];
-cx q0[101],q0[46];
-rz(pi/2) q0[101];
-sx q0[101];
-rz(pi/2) q0[101];
-sx q0[102];
-cx q0[46],q0[101];
-rz(-pi/4) q0[101];
-cx q0[0],q0[101];
-rz(pi/4) q0[101];
-cx q0[46],q0[101];
-rz(-pi/4) q0[101];
-cx q0[0],q0[101];
-rz(3*pi/4) q0[101];
-sx q0[101];
-rz(pi/2) q0[101];
-rz(pi/4) q0[46];
-cx q0[0],q0[46];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[46];
-cx q0[0],q0[46];
-cx q0[101],q0[46];
-sx q0[103];
-rz(1.3957899) q0[103];
-cx q0[102],q0[103];
-rz(1.9949377) q0[103];
-cx q0[102],q0[103];
-rz(-pi) q0[102];
-sx q0[102];
-rz(-pi) q0[102];
-rz(-2.9487255) q0[103];
-sx q0[103];
-rz(-pi) q0[103];
-cx q0[102],q0[103];
-sx q0[103];
-rz(2.9487255) q0[103];
-sx q0[103];
-rz(-pi) q0[103];
-cx q0[102],q0[103];
-cx q0[102],q0[47];
-rz(pi/2) q0[102];
-sx q0[102];
-rz(pi/2) q0[102];
-sx q0[103];
-cx q0[47],q0[102];
-rz(-pi/4) q0[102];
-cx q0[0],q0[102];
-rz(pi/4) q0[102];
-cx q0[47],q0[102];
-rz(-pi/4) q0[102];
-cx q0[0],q0[102];
-rz(3*pi/4) q0[102];
-sx q0[102];
-rz(pi/2) q0[102];
-rz(pi/4) q0[47];
-cx q0[0],q0[47];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[47];
-cx q0[0],q0[47];
-cx q0[102],q0[47];
-sx q0[104];
-rz(0.50104014) q0[104];
-cx q0[103],q0[104];
-rz(2.8786892) q0[104];
-cx q0[103],q0[104];
-rz(-pi) q0[103];
-sx q0[103];
-rz(-pi) q0[103];
-rz(-2.7241186) q0[104];
-sx q0[104];
-rz(-pi) q0[104];
-cx q0[103],q0[104];
-sx q0[104];
-rz(2.7241186) q0[104];
-sx q0[104];
-rz(-pi) q0[104];
-cx q0[103],q0[104];
-cx q0[103],q0[48];
-rz(pi/2) q0[103];
-sx q0[103];
-rz(pi/2) q0[103];
-sx q0[104];
-cx q0[48],q0[103];
-rz(-pi/4) q0[103];
-cx q0[0],q0[103];
-rz(pi/4) q0[103];
-cx q0[48],q0[103];
-rz(-pi/4) q0[103];
-cx q0[0],q0[103];
-rz(3*pi/4) q0[103];
-sx q0[103];
-rz(pi/2) q0[103];
-rz(pi/4) q0[48];
-cx q0[0],q0[48];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[48];
-cx q0[0],q0[48];
-cx q0[103],q0[48];
-sx q0[105];
-rz(0.4092344) q0[105];
-cx q0[104],q0[105];
-rz(0.24862676) q0[105];
-cx q0[104],q0[105];
-rz(-pi) q0[104];
-sx q0[104];
-rz(-pi) q0[104];
-rz(-3.0646056) q0[105];
-sx q0[105];
-rz(-pi) q0[105];
-cx q0[104],q0[105];
-sx q0[105];
-rz(3.0646056) q0[105];
-sx q0[105];
-rz(-pi) q0[105];
-cx q0[104],q0[105];
-cx q0[104],q0[49];
-rz(pi/2) q0[104];
-sx q0[104];
-rz(pi/2) q0[104];
-sx q0[105];
-cx q0[49],q0[104];
-rz(-pi/4) q0[104];
-cx q0[0],q0[104];
-rz(pi/4) q0[104];
-cx q0[49],q0[104];
-rz(-pi/4) q0[104];
-cx q0[0],q0[104];
-rz(3*pi/4) q0[104];
-sx q0[104];
-rz(pi/2) q0[104];
-rz(pi/4) q0[49];
-cx q0[0],q0[49];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[49];
-cx q0[0],q0[49];
-cx q0[104],q0[49];
-sx q0[106];
-rz(1.3162278) q0[106];
-cx q0[105],q0[106];
-rz(0.92048106) q0[106];
-cx q0[105],q0[106];
-rz(-pi) q0[105];
-sx q0[105];
-rz(-pi) q0[105];
-rz(-2.7138157) q0[106];
-sx q0[106];
-rz(-pi) q0[106];
-cx q0[105],q0[106];
-sx q0[106];
-rz(2.7138157) q0[106];
-sx q0[106];
-rz(-pi) q0[106];
-cx q0[105],q0[106];
-cx q0[105],q0[50];
-rz(pi/2) q0[105];
-sx q0[105];
-rz(pi/2) q0[105];
-sx q0[106];
-cx q0[50],q0[105];
-rz(-pi/4) q0[105];
-cx q0[0],q0[105];
-rz(pi/4) q0[105];
-cx q0[50],q0[105];
-rz(-pi/4) q0[105];
-cx q0[0],q0[105];
-rz(3*pi/4) q0[105];
-sx q0[105];
-rz(pi/2) q0[105];
-rz(pi/4) q0[50];
-cx q0[0],q0[50];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[50];
-cx q0[0],q0[50];
-cx q0[105],q0[50];
-sx q0[107];
-rz(2.5227595) q0[107];
-cx q0[106],q0[107];
-rz(0.59693891) q0[107];
-cx q0[106],q0[107];
-rz(-pi) q0[106];
-sx q0[106];
-rz(-pi) q0[106];
-rz(-2.4629684) q0[107];
-sx q0[107];
-rz(-pi) q0[107];
-cx q0[106],q0[107];
-sx q0[107];
-rz(2.4629684) q0[107];
-sx q0[107];
-rz(-pi) q0[107];
-cx q0[106],q0[107];
-cx q0[106],q0[51];
-rz(pi/2) q0[106];
-sx q0[106];
-rz(pi/2) q0[106];
-sx q0[107];
-cx q0[51],q0[106];
-rz(-pi/4) q0[106];
-cx q0[0],q0[106];
-rz(pi/4) q0[106];
-cx q0[51],q0[106];
-rz(-pi/4) q0[106];
-cx q0[0],q0[106];
-rz(3*pi/4) q0[106];
-sx q0[106];
-rz(pi/2) q0[106];
-rz(pi/4) q0[51];
-cx q0[0],q0[51];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[51];
-cx q0[0],q0[51];
-cx q0[106],q0[51];
-sx q0[108];
-rz(2.0135545) q0[108];
-cx q0[107],q0[108];
-rz(0.51329017) q0[108];
-cx q0[107],q0[108];
-rz(-pi) q0[107];
-sx q0[107];
-rz(-pi) q0[107];
-rz(-2.6562078) q0[108];
-sx q0[108];
-rz(-pi) q0[108];
-cx q0[107],q0[108];
-sx q0[108];
-rz(2.6562078) q0[108];
-sx q0[108];
-rz(-pi) q0[108];
-cx q0[107],q0[108];
-cx q0[107],q0[52];
-rz(pi/2) q0[107];
-sx q0[107];
-rz(pi/2) q0[107];
-sx q0[108];
-cx q0[52],q0[107];
-rz(-pi/4) q0[107];
-cx q0[0],q0[107];
-rz(pi/4) q0[107];
-cx q0[52],q0[107];
-rz(-pi/4) q0[107];
-cx q0[0],q0[107];
-rz(3*pi/4) q0[107];
-sx q0[107];
-rz(pi/2) q0[107];
-rz(pi/4) q0[52];
-cx q0[0],q0[52];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[52];
-cx q0[0],q0[52];
-cx q0[107],q0[52];
-sx q0[109];
-rz(1.324608) q0[109];
-cx q0[108],q0[109];
-rz(1.9968497) q0[109];
-cx q0[108],q0[109];
-rz(-pi) q0[108];
-sx q0[108];
-rz(-pi) q0[108];
-rz(-3.0769755) q0[109];
-sx q0[109];
-rz(-pi) q0[109];
-cx q0[108],q0[109];
-sx q0[109];
-rz(3.0769755) q0[109];
-sx q0[109];
-rz(-pi) q0[109];
-cx q0[108],q0[109];
-cx q0[108],q0[53];
-rz(pi/2) q0[108];
-sx q0[108];
-rz(pi/2) q0[108];
-sx q0[109];
-cx q0[53],q0[108];
-rz(-pi/4) q0[108];
-cx q0[0],q0[108];
-rz(pi/4) q0[108];
-cx q0[53],q0[108];
-rz(-pi/4) q0[108];
-cx q0[0],q0[108];
-rz(3*pi/4) q0[108];
-sx q0[108];
-rz(pi/2) q0[108];
-rz(pi/4) q0[53];
-cx q0[0],q0[53];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[53];
-cx q0[0],q0[53];
-cx q0[108],q0[53];
-sx q0[110];
-rz(0.75480402) q0[110];
-cx q0[109],q0[110];
-rz(1.336929) q0[110];
-cx q0[109],q0[110];
-rz(-pi) q0[109];
-sx q0[109];
-rz(-pi) q0[109];
-rz(-2.6413254) q0[110];
-sx q0[110];
-rz(-pi) q0[110];
-cx q0[109],q0[110];
-sx q0[110];
-rz(2.6413254) q0[110];
-sx q0[110];
-rz(-pi) q0[110];
-cx q0[109],q0[110];
-cx q0[109],q0[54];
-rz(pi/2) q0[109];
-sx q0[109];
-rz(pi/2) q0[109];
-cx q0[110],q0[55];
-rz(pi/2) q0[110];
-sx q0[110];
-rz(pi/2) q0[110];
-cx q0[54],q0[109];
-rz(-pi/4) q0[109];
-cx q0[0],q0[109];
-rz(pi/4) q0[109];
-cx q0[54],q0[109];
-rz(-pi/4) q0[109];
-cx q0[0],q0[109];
-rz(3*pi/4) q0[109];
-sx q0[109];
-rz(pi/2) q0[109];
-rz(pi/4) q0[54];
-cx q0[0],q0[54];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[54];
-cx q0[0],q0[54];
-cx q0[109],q0[54];
-cx q0[55],q0[110];
-rz(-pi/4) q0[110];
-cx q0[0],q0[110];
-rz(pi/4) q0[110];
-cx q0[55],q0[110];
-rz(-pi/4) q0[110];
-cx q0[0],q0[110];
-rz(3*pi/4) q0[110];
-sx q0[110];
-rz(pi/2) q0[110];
-rz(pi/4) q0[55];
-cx q0[0],q0[55];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[55];
-cx q0[0],q0[55];
-rz(pi/2) q0[0];
-sx q0[0];
-rz(pi/2) q0[0];
-cx q0[110],q0[55];
-measure q0[56] -> c0[0];
-measure q0[57] -> c0[1];
-measure q0[58] -> c0[2];
-measure q0[59] -> c0[3];
-measure q0[60] -> c0[4];
-measure q0[61] -> c0[5];
-measure q0[62] -> c0[6];
-measure q0[63] -> c0[7];
-measure q0[64] -> c0[8];
-measure q0[65] -> c0[9];
-measure q0[66] -> c0[10];
-measure q0[67] -> c0[11];
-measure q0[68] -> c0[12];
-measure q0[69] -> c0[13];
-measure q0[70] -> c0[14];
-measure q0[71] -> c0[15];
-measure q0[72] -> c0[16];
-measure q0[73] -> c0[17];
-measure q0[74] -> c0[18];
-measure q0[75] -> c0[19];
-measure q0[76] -> c0[20];
-measure q0[77] -> c0[21];
-measure q0[78] -> c0[22];
-measure q0[79] -> c0[23];
-measure q0[80] -> c0[24];
-measure q0[81] -> c0[25];
-measure q0[82] -> c0[26];
-measure q0[83] -> c0[27];
-measure q0[84] -> c0[28];
-measure q0[85] -> c0[29];
-measure q0[86] -> c0[30];
-measure q0[87] -> c0[31];
-measure q0[88] -> c0[32];
-measure q0[89] -> c0[33];
-measure q0[90] -> c0[34];
-measure q0[91] -> c0[35];
-measure q0[92] -> c0[36];
-measure q0[93] -> c0[37];
-measure q0[94] -> c0[38];
-measure q0[95] -> c0[39];
-measure q0[96] -> c0[40];
-measure q0[97] -> c0[41];
-measure q0[98] -> c0[42];
-measure q0[99] -> c0[43];
-measure q0[100] -> c0[44];
-measure q0[101] -> c0[45];
-measure q0[102] -> c0[46];
-measure q0[103] -> c0[47];
-measure q0[104] -> c0[48];
-measure q0[105] -> c0[49];
-measure q0[106] -> c0[50];
-measure q0[107] -> c0[51];
-measure q0[108] -> c0[52];
-measure q0[109] -> c0[53];
-measure q0[110] -> c0[54];
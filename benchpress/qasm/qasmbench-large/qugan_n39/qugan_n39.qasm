@@ -1,521 +0,0 @@
-OPENQASM 2.0;
-include "qelib1.inc";
-gate cry(lambda) a,b
-{
-  ry(lambda/2) b;
-  cx a,b;
-  ry(-lambda/2) b;
-  cx a,b;
-}
-gate ryy(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(0.76446547) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140399673778672(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(0.34416824) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140399673778720(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(2.7731988) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140399673778912(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(0.2147293) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140399673779056(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(2.3787877) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140399673779200(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(1.0573239) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140399673779344(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(1.075753) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140399673779488(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(3.090095) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140399673779632(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(2.4358633) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140399673779776(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(0.91000299) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140399673779920(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(1.2085373) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140399673780064(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(1.7758962) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140399673780208(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(2.5475954) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140399673780352(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(0.867548) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140399673780496(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(2.3964954) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140399673780640(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(0.54088681) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140399673780784(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(0.61334925) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140399673780928(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(2.6394405) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140399673781072(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(3.0729479) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140399673781216(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(0.67304698) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140399673781360(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(2.2555347) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140399673781504(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(1.0439819) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140399673781648(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(2.4904675) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140399673781792(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(0.050942511) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140399673781936(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(0.49683723) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140399673782080(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(1.624836) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140399673778624(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(1.6539002) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140398859231392(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(2.9429706) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140398859231536(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(1.4193778) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140398859231680(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(0.026215759) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140398859231824(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(0.58184821) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140398859231968(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(0.45780698) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140398859232112(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(0.443122) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140398859232256(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(2.0384821) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140398859232400(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(1.6728918) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140398859232544(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(0.55692043) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-qreg q0[39];
-creg c0[19];
-ry(1.21164) q0[1];
-ry(2.5241461) q0[2];
-ry(1.2134639) q0[3];
-ry(1.1889917) q0[4];
-ry(2.0646731) q0[5];
-ry(2.9533582) q0[6];
-ry(2.7948109) q0[7];
-ry(0.85041083) q0[8];
-ry(0.51470186) q0[9];
-ry(0.98490236) q0[10];
-ry(1.0957216) q0[11];
-ry(2.3423953) q0[12];
-ry(3.0950762) q0[13];
-ry(1.9660574) q0[14];
-ry(0.6758841) q0[15];
-ry(1.9448734) q0[16];
-ry(1.2775659) q0[17];
-ry(2.2418681) q0[18];
-ry(0.34050827) q0[19];
-ry(1.2355343) q0[20];
-ry(2.2062918) q0[21];
-ry(1.4747604) q0[22];
-ry(1.9501992) q0[23];
-ry(2.6802962) q0[24];
-ry(1.2563738) q0[25];
-ry(0.98623661) q0[26];
-ry(2.6496319) q0[27];
-ry(0.65292998) q0[28];
-ry(1.8413394) q0[29];
-ry(2.4082759) q0[30];
-ry(0.26164311) q0[31];
-ry(1.6983907) q0[32];
-ry(2.8524951) q0[33];
-ry(0.72645641) q0[34];
-ry(0.18555618) q0[35];
-ry(0.998412) q0[36];
-ry(0.92565055) q0[37];
-ry(1.3395776) q0[38];
-ryy(0.76446547) q0[1],q0[2];
-cry(2.7436441) q0[1],q0[2];
-ryy_140399673778672(0.34416824) q0[2],q0[3];
-cry(2.7397433) q0[2],q0[3];
-ryy_140399673778720(2.7731988) q0[3],q0[4];
-cry(1.6816106) q0[3],q0[4];
-ryy_140399673778912(0.2147293) q0[4],q0[5];
-cry(2.3292527) q0[4],q0[5];
-ryy_140399673779056(2.3787877) q0[5],q0[6];
-cry(1.271826) q0[5],q0[6];
-ryy_140399673779200(1.0573239) q0[6],q0[7];
-cry(2.5782168) q0[6],q0[7];
-ryy_140399673779344(1.075753) q0[7],q0[8];
-cry(1.2818379) q0[7],q0[8];
-ryy_140399673779488(3.090095) q0[8],q0[9];
-cry(0.90590044) q0[8],q0[9];
-ryy_140399673779632(2.4358633) q0[9],q0[10];
-cry(1.8941595) q0[9],q0[10];
-ryy_140399673779776(0.91000299) q0[10],q0[11];
-cry(1.0675495) q0[10],q0[11];
-ryy_140399673779920(1.2085373) q0[11],q0[12];
-cry(2.9849461) q0[11],q0[12];
-ryy_140399673780064(1.7758962) q0[12],q0[13];
-cry(0.73822195) q0[12],q0[13];
-ryy_140399673780208(2.5475954) q0[13],q0[14];
-cry(3.0964021) q0[13],q0[14];
-ryy_140399673780352(0.867548) q0[14],q0[15];
-cry(2.3552642) q0[14],q0[15];
-ryy_140399673780496(2.3964954) q0[15],q0[16];
-cry(0.78387901) q0[15],q0[16];
-ryy_140399673780640(0.54088681) q0[16],q0[17];
-cry(2.5426411) q0[16],q0[17];
-ryy_140399673780784(0.61334925) q0[17],q0[18];
-cry(2.7096202) q0[17],q0[18];
-ryy_140399673780928(2.6394405) q0[18],q0[19];
-cry(0.26791435) q0[18],q0[19];
-ryy_140399673781072(3.0729479) q0[20],q0[21];
-cry(2.7213077) q0[20],q0[21];
-ryy_140399673781216(0.67304698) q0[21],q0[22];
-cry(1.5764746) q0[21],q0[22];
-ryy_140399673781360(2.2555347) q0[22],q0[23];
-cry(2.7955141) q0[22],q0[23];
-ryy_140399673781504(1.0439819) q0[23],q0[24];
-cry(2.3407518) q0[23],q0[24];
-ryy_140399673781648(2.4904675) q0[24],q0[25];
-cry(0.93779412) q0[24],q0[25];
-ryy_140399673781792(0.050942511) q0[25],q0[26];
-cry(1.0234601) q0[25],q0[26];
-ryy_140399673781936(0.49683723) q0[26],q0[27];
-cry(2.326859) q0[26],q0[27];
-ryy_140399673782080(1.624836) q0[27],q0[28];
-cry(0.28495261) q0[27],q0[28];
-ryy_140399673778624(1.6539002) q0[28],q0[29];
-cry(0.088620971) q0[28],q0[29];
-ryy_140398859231392(2.9429706) q0[29],q0[30];
-cry(1.5320644) q0[29],q0[30];
-ryy_140398859231536(1.4193778) q0[30],q0[31];
-cry(1.5973942) q0[30],q0[31];
-ryy_140398859231680(0.026215759) q0[31],q0[32];
-cry(3.1311863) q0[31],q0[32];
-ryy_140398859231824(0.58184821) q0[32],q0[33];
-cry(0.10188374) q0[32],q0[33];
-ryy_140398859231968(0.45780698) q0[33],q0[34];
-cry(0.76090212) q0[33],q0[34];
-ryy_140398859232112(0.443122) q0[34],q0[35];
-cry(2.8186649) q0[34],q0[35];
-ryy_140398859232256(2.0384821) q0[35],q0[36];
-cry(1.8334667) q0[35],q0[36];
-ryy_140398859232400(1.6728918) q0[36],q0[37];
-cry(1.0841192) q0[36],q0[37];
-ryy_140398859232544(0.55692043) q0[37],q0[38];
-cry(2.773903) q0[37],q0[38];
-h q0[0];
-cswap q0[0],q0[1],q0[20];
-cswap q0[0],q0[2],q0[21];
-cswap q0[0],q0[3],q0[22];
-cswap q0[0],q0[4],q0[23];
-cswap q0[0],q0[5],q0[24];
-cswap q0[0],q0[6],q0[25];
-cswap q0[0],q0[7],q0[26];
-cswap q0[0],q0[8],q0[27];
-cswap q0[0],q0[9],q0[28];
-cswap q0[0],q0[10],q0[29];
-cswap q0[0],q0[11],q0[30];
-cswap q0[0],q0[12],q0[31];
-cswap q0[0],q0[13],q0[32];
-cswap q0[0],q0[14],q0[33];
-cswap q0[0],q0[15],q0[34];
-cswap q0[0],q0[16],q0[35];
-cswap q0[0],q0[17],q0[36];
-cswap q0[0],q0[18],q0[37];
-cswap q0[0],q0[19],q0[38];
-h q0[0];
-measure q0[20] -> c0[0];
-measure q0[21] -> c0[1];
-measure q0[22] -> c0[2];
-measure q0[23] -> c0[3];
-measure q0[24] -> c0[4];
-measure q0[25] -> c0[5];
-measure q0[26] -> c0[6];
-measure q0[27] -> c0[7];
-measure q0[28] -> c0[8];
-measure q0[29] -> c0[9];
-measure q0[30] -> c0[10];
-measure q0[31] -> c0[11];
-measure q0[32] -> c0[12];
-measure q0[33] -> c0[13];
-measure q0[34] -> c0[14];
-measure q0[35] -> c0[15];
-measure q0[36] -> c0[16];
-measure q0[37] -> c0[17];
-measure q0[38] -> c0[18];
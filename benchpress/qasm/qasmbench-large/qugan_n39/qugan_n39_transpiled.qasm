@@ -1,1059 +0,0 @@
-OPENQASM 2.0;
-include "qelib1.inc";
-qreg q0[39];
-creg c0[19];
-rz(pi/2) q0[0];
-sx q0[0];
-rz(pi/2) q0[0];
-sx q0[1];
-rz(1.21164) q0[1];
-sx q0[2];
-rz(2.5241461) q0[2];
-cx q0[1],q0[2];
-rz(0.76446547) q0[2];
-cx q0[1],q0[2];
-rz(-pi) q0[1];
-sx q0[1];
-rz(-pi) q0[1];
-rz(-1.7697706) q0[2];
-sx q0[2];
-rz(-pi) q0[2];
-cx q0[1],q0[2];
-sx q0[2];
-rz(1.7697706) q0[2];
-sx q0[2];
-rz(-pi) q0[2];
-cx q0[1],q0[2];
-sx q0[2];
-sx q0[3];
-rz(1.2134639) q0[3];
-cx q0[2],q0[3];
-rz(0.34416824) q0[3];
-cx q0[2],q0[3];
-rz(-pi) q0[2];
-sx q0[2];
-rz(-pi) q0[2];
-rz(-1.771721) q0[3];
-sx q0[3];
-rz(-pi) q0[3];
-cx q0[2],q0[3];
-sx q0[3];
-rz(1.771721) q0[3];
-sx q0[3];
-rz(-pi) q0[3];
-cx q0[2],q0[3];
-sx q0[3];
-sx q0[4];
-rz(1.1889917) q0[4];
-cx q0[3],q0[4];
-rz(2.7731988) q0[4];
-cx q0[3],q0[4];
-rz(-pi) q0[3];
-sx q0[3];
-rz(-pi) q0[3];
-rz(-2.3007874) q0[4];
-sx q0[4];
-rz(-pi) q0[4];
-cx q0[3],q0[4];
-sx q0[4];
-rz(2.3007874) q0[4];
-sx q0[4];
-rz(-pi) q0[4];
-cx q0[3],q0[4];
-sx q0[4];
-sx q0[5];
-rz(2.0646731) q0[5];
-cx q0[4],q0[5];
-rz(0.2147293) q0[5];
-cx q0[4],q0[5];
-rz(-pi) q0[4];
-sx q0[4];
-rz(-pi) q0[4];
-rz(-1.9769663) q0[5];
-sx q0[5];
-rz(-pi) q0[5];
-cx q0[4],q0[5];
-sx q0[5];
-rz(1.9769663) q0[5];
-sx q0[5];
-rz(-pi) q0[5];
-cx q0[4],q0[5];
-sx q0[5];
-sx q0[6];
-rz(2.9533582) q0[6];
-cx q0[5],q0[6];
-rz(2.3787877) q0[6];
-cx q0[5],q0[6];
-rz(-pi) q0[5];
-sx q0[5];
-rz(-pi) q0[5];
-rz(-2.5056797) q0[6];
-sx q0[6];
-rz(-pi) q0[6];
-cx q0[5],q0[6];
-sx q0[6];
-rz(2.5056797) q0[6];
-sx q0[6];
-rz(-pi) q0[6];
-cx q0[5],q0[6];
-sx q0[6];
-sx q0[7];
-rz(2.7948109) q0[7];
-cx q0[6],q0[7];
-rz(1.0573239) q0[7];
-cx q0[6],q0[7];
-rz(-pi) q0[6];
-sx q0[6];
-rz(-pi) q0[6];
-rz(-1.8524843) q0[7];
-sx q0[7];
-rz(-pi) q0[7];
-cx q0[6],q0[7];
-sx q0[7];
-rz(1.8524843) q0[7];
-sx q0[7];
-rz(-pi) q0[7];
-cx q0[6],q0[7];
-sx q0[7];
-sx q0[8];
-rz(0.85041083) q0[8];
-cx q0[7],q0[8];
-rz(1.075753) q0[8];
-cx q0[7],q0[8];
-rz(-pi) q0[7];
-sx q0[7];
-rz(-pi) q0[7];
-rz(-2.5006737) q0[8];
-sx q0[8];
-rz(-pi) q0[8];
-cx q0[7],q0[8];
-sx q0[8];
-rz(2.5006737) q0[8];
-sx q0[8];
-rz(-pi) q0[8];
-cx q0[7],q0[8];
-sx q0[8];
-sx q0[9];
-rz(0.51470186) q0[9];
-cx q0[8],q0[9];
-rz(3.090095) q0[9];
-cx q0[8],q0[9];
-rz(-pi) q0[8];
-sx q0[8];
-rz(-pi) q0[8];
-rz(-2.6886424) q0[9];
-sx q0[9];
-rz(-pi) q0[9];
-cx q0[8],q0[9];
-sx q0[9];
-rz(2.6886424) q0[9];
-sx q0[9];
-rz(-pi) q0[9];
-cx q0[8],q0[9];
-sx q0[9];
-sx q0[10];
-rz(0.98490236) q0[10];
-cx q0[9],q0[10];
-rz(2.4358633) q0[10];
-cx q0[9],q0[10];
-rz(-2.1945129) q0[10];
-sx q0[10];
-rz(-pi) q0[10];
-rz(-pi) q0[9];
-sx q0[9];
-rz(-pi) q0[9];
-cx q0[9],q0[10];
-sx q0[10];
-rz(2.1945129) q0[10];
-sx q0[10];
-rz(-pi) q0[10];
-cx q0[9],q0[10];
-sx q0[10];
-sx q0[11];
-rz(1.0957216) q0[11];
-cx q0[10],q0[11];
-rz(0.91000299) q0[11];
-cx q0[10],q0[11];
-rz(-pi) q0[10];
-sx q0[10];
-rz(-pi) q0[10];
-rz(-2.6078179) q0[11];
-sx q0[11];
-rz(-pi) q0[11];
-cx q0[10],q0[11];
-sx q0[11];
-rz(2.6078179) q0[11];
-sx q0[11];
-rz(-pi) q0[11];
-cx q0[10],q0[11];
-sx q0[11];
-sx q0[12];
-rz(2.3423953) q0[12];
-cx q0[11],q0[12];
-rz(1.2085373) q0[12];
-cx q0[11],q0[12];
-rz(-pi) q0[11];
-sx q0[11];
-rz(-pi) q0[11];
-rz(-1.6491196) q0[12];
-sx q0[12];
-rz(-pi) q0[12];
-cx q0[11],q0[12];
-sx q0[12];
-rz(1.6491196) q0[12];
-sx q0[12];
-rz(-pi) q0[12];
-cx q0[11],q0[12];
-sx q0[12];
-sx q0[13];
-rz(3.0950762) q0[13];
-cx q0[12],q0[13];
-rz(1.7758962) q0[13];
-cx q0[12],q0[13];
-rz(-pi) q0[12];
-sx q0[12];
-rz(-pi) q0[12];
-rz(-2.7724817) q0[13];
-sx q0[13];
-rz(-pi) q0[13];
-cx q0[12],q0[13];
-sx q0[13];
-rz(2.7724817) q0[13];
-sx q0[13];
-rz(-pi) q0[13];
-cx q0[12],q0[13];
-sx q0[13];
-sx q0[14];
-rz(1.9660574) q0[14];
-cx q0[13],q0[14];
-rz(2.5475954) q0[14];
-cx q0[13],q0[14];
-rz(-pi) q0[13];
-sx q0[13];
-rz(-pi) q0[13];
-rz(-1.5933916) q0[14];
-sx q0[14];
-rz(-pi) q0[14];
-cx q0[13],q0[14];
-sx q0[14];
-rz(1.5933916) q0[14];
-sx q0[14];
-rz(-pi) q0[14];
-cx q0[13],q0[14];
-sx q0[14];
-sx q0[15];
-rz(0.6758841) q0[15];
-cx q0[14],q0[15];
-rz(0.867548) q0[15];
-cx q0[14],q0[15];
-rz(-pi) q0[14];
-sx q0[14];
-rz(-pi) q0[14];
-rz(-1.9639606) q0[15];
-sx q0[15];
-rz(-pi) q0[15];
-cx q0[14],q0[15];
-sx q0[15];
-rz(1.9639606) q0[15];
-sx q0[15];
-rz(-pi) q0[15];
-cx q0[14],q0[15];
-sx q0[15];
-sx q0[16];
-rz(1.9448734) q0[16];
-cx q0[15],q0[16];
-rz(2.3964954) q0[16];
-cx q0[15],q0[16];
-rz(-pi) q0[15];
-sx q0[15];
-rz(-pi) q0[15];
-rz(-2.7496531) q0[16];
-sx q0[16];
-rz(-pi) q0[16];
-cx q0[15],q0[16];
-sx q0[16];
-rz(2.7496531) q0[16];
-sx q0[16];
-rz(-pi) q0[16];
-cx q0[15],q0[16];
-sx q0[16];
-sx q0[17];
-rz(1.2775659) q0[17];
-cx q0[16],q0[17];
-rz(0.54088681) q0[17];
-cx q0[16],q0[17];
-rz(-pi) q0[16];
-sx q0[16];
-rz(-pi) q0[16];
-rz(-1.8702721) q0[17];
-sx q0[17];
-rz(-pi) q0[17];
-cx q0[16],q0[17];
-sx q0[17];
-rz(1.8702721) q0[17];
-sx q0[17];
-rz(-pi) q0[17];
-cx q0[16],q0[17];
-sx q0[17];
-sx q0[18];
-rz(2.2418681) q0[18];
-cx q0[17],q0[18];
-rz(0.61334925) q0[18];
-cx q0[17],q0[18];
-rz(-pi) q0[17];
-sx q0[17];
-rz(-pi) q0[17];
-rz(-1.7867826) q0[18];
-sx q0[18];
-rz(-pi) q0[18];
-cx q0[17],q0[18];
-sx q0[18];
-rz(1.7867826) q0[18];
-sx q0[18];
-rz(-pi) q0[18];
-cx q0[17],q0[18];
-sx q0[18];
-sx q0[19];
-rz(0.34050827) q0[19];
-cx q0[18],q0[19];
-rz(2.6394405) q0[19];
-cx q0[18],q0[19];
-rz(-pi) q0[18];
-sx q0[18];
-rz(-pi) q0[18];
-rz(-3.0076355) q0[19];
-sx q0[19];
-rz(-pi) q0[19];
-cx q0[18],q0[19];
-sx q0[19];
-rz(3.0076355) q0[19];
-sx q0[19];
-rz(-pi) q0[19];
-cx q0[18],q0[19];
-sx q0[20];
-rz(1.2355343) q0[20];
-sx q0[21];
-rz(2.2062918) q0[21];
-cx q0[20],q0[21];
-rz(3.0729479) q0[21];
-cx q0[20],q0[21];
-rz(-pi) q0[20];
-sx q0[20];
-rz(-pi) q0[20];
-rz(-1.7809388) q0[21];
-sx q0[21];
-rz(-pi) q0[21];
-cx q0[20],q0[21];
-sx q0[21];
-rz(1.7809388) q0[21];
-sx q0[21];
-rz(-pi) q0[21];
-cx q0[20],q0[21];
-cx q0[20],q0[1];
-rz(pi/2) q0[20];
-sx q0[20];
-rz(pi/2) q0[20];
-cx q0[1],q0[20];
-rz(-pi/4) q0[20];
-cx q0[0],q0[20];
-rz(pi/4) q0[20];
-cx q0[1],q0[20];
-rz(pi/4) q0[1];
-rz(-pi/4) q0[20];
-cx q0[0],q0[20];
-cx q0[0],q0[1];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[1];
-cx q0[0],q0[1];
-rz(3*pi/4) q0[20];
-sx q0[20];
-rz(pi/2) q0[20];
-cx q0[20],q0[1];
-sx q0[21];
-sx q0[22];
-rz(1.4747604) q0[22];
-cx q0[21],q0[22];
-rz(0.67304698) q0[22];
-cx q0[21],q0[22];
-rz(-pi) q0[21];
-sx q0[21];
-rz(-pi) q0[21];
-rz(-2.3533554) q0[22];
-sx q0[22];
-rz(-pi) q0[22];
-cx q0[21],q0[22];
-sx q0[22];
-rz(2.3533554) q0[22];
-sx q0[22];
-rz(-pi) q0[22];
-cx q0[21],q0[22];
-cx q0[21],q0[2];
-rz(pi/2) q0[21];
-sx q0[21];
-rz(pi/2) q0[21];
-cx q0[2],q0[21];
-rz(-pi/4) q0[21];
-cx q0[0],q0[21];
-rz(pi/4) q0[21];
-cx q0[2],q0[21];
-rz(pi/4) q0[2];
-rz(-pi/4) q0[21];
-cx q0[0],q0[21];
-cx q0[0],q0[2];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[2];
-cx q0[0],q0[2];
-rz(3*pi/4) q0[21];
-sx q0[21];
-rz(pi/2) q0[21];
-cx q0[21],q0[2];
-sx q0[22];
-sx q0[23];
-rz(1.9501992) q0[23];
-cx q0[22],q0[23];
-rz(2.2555347) q0[23];
-cx q0[22],q0[23];
-rz(-pi) q0[22];
-sx q0[22];
-rz(-pi) q0[22];
-rz(-1.7438356) q0[23];
-sx q0[23];
-rz(-pi) q0[23];
-cx q0[22],q0[23];
-sx q0[23];
-rz(1.7438356) q0[23];
-sx q0[23];
-rz(-pi) q0[23];
-cx q0[22],q0[23];
-cx q0[22],q0[3];
-rz(pi/2) q0[22];
-sx q0[22];
-rz(pi/2) q0[22];
-sx q0[23];
-cx q0[3],q0[22];
-rz(-pi/4) q0[22];
-cx q0[0],q0[22];
-rz(pi/4) q0[22];
-cx q0[3],q0[22];
-rz(-pi/4) q0[22];
-cx q0[0],q0[22];
-rz(3*pi/4) q0[22];
-sx q0[22];
-rz(pi/2) q0[22];
-rz(pi/4) q0[3];
-cx q0[0],q0[3];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[3];
-cx q0[0],q0[3];
-cx q0[22],q0[3];
-sx q0[24];
-rz(2.6802962) q0[24];
-cx q0[23],q0[24];
-rz(1.0439819) q0[24];
-cx q0[23],q0[24];
-rz(-pi) q0[23];
-sx q0[23];
-rz(-pi) q0[23];
-rz(-1.9712168) q0[24];
-sx q0[24];
-rz(-pi) q0[24];
-cx q0[23],q0[24];
-sx q0[24];
-rz(1.9712168) q0[24];
-sx q0[24];
-rz(-pi) q0[24];
-cx q0[23],q0[24];
-cx q0[23],q0[4];
-rz(pi/2) q0[23];
-sx q0[23];
-rz(pi/2) q0[23];
-sx q0[24];
-cx q0[4],q0[23];
-rz(-pi/4) q0[23];
-cx q0[0],q0[23];
-rz(pi/4) q0[23];
-cx q0[4],q0[23];
-rz(-pi/4) q0[23];
-cx q0[0],q0[23];
-rz(3*pi/4) q0[23];
-sx q0[23];
-rz(pi/2) q0[23];
-rz(pi/4) q0[4];
-cx q0[0],q0[4];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[4];
-cx q0[0],q0[4];
-cx q0[23],q0[4];
-sx q0[25];
-rz(1.2563738) q0[25];
-cx q0[24],q0[25];
-rz(2.4904675) q0[25];
-cx q0[24],q0[25];
-rz(-pi) q0[24];
-sx q0[24];
-rz(-pi) q0[24];
-rz(-2.6726956) q0[25];
-sx q0[25];
-rz(-pi) q0[25];
-cx q0[24],q0[25];
-sx q0[25];
-rz(2.6726956) q0[25];
-sx q0[25];
-rz(-pi) q0[25];
-cx q0[24],q0[25];
-cx q0[24],q0[5];
-rz(pi/2) q0[24];
-sx q0[24];
-rz(pi/2) q0[24];
-sx q0[25];
-cx q0[5],q0[24];
-rz(-pi/4) q0[24];
-cx q0[0],q0[24];
-rz(pi/4) q0[24];
-cx q0[5],q0[24];
-rz(-pi/4) q0[24];
-cx q0[0],q0[24];
-rz(3*pi/4) q0[24];
-sx q0[24];
-rz(pi/2) q0[24];
-rz(pi/4) q0[5];
-cx q0[0],q0[5];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[5];
-cx q0[0],q0[5];
-cx q0[24],q0[5];
-sx q0[26];
-rz(0.98623661) q0[26];
-cx q0[25],q0[26];
-rz(0.050942511) q0[26];
-cx q0[25],q0[26];
-rz(-pi) q0[25];
-sx q0[25];
-rz(-pi) q0[25];
-rz(-2.6298626) q0[26];
-sx q0[26];
-rz(-pi) q0[26];
-cx q0[25],q0[26];
-sx q0[26];
-rz(2.6298626) q0[26];
-sx q0[26];
-rz(-pi) q0[26];
-cx q0[25],q0[26];
-cx q0[25],q0[6];
-rz(pi/2) q0[25];
-sx q0[25];
-rz(pi/2) q0[25];
-sx q0[26];
-cx q0[6],q0[25];
-rz(-pi/4) q0[25];
-cx q0[0],q0[25];
-rz(pi/4) q0[25];
-cx q0[6],q0[25];
-rz(-pi/4) q0[25];
-cx q0[0],q0[25];
-rz(3*pi/4) q0[25];
-sx q0[25];
-rz(pi/2) q0[25];
-rz(pi/4) q0[6];
-cx q0[0],q0[6];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[6];
-cx q0[0],q0[6];
-cx q0[25],q0[6];
-sx q0[27];
-rz(2.6496319) q0[27];
-cx q0[26],q0[27];
-rz(0.49683723) q0[27];
-cx q0[26],q0[27];
-rz(-pi) q0[26];
-sx q0[26];
-rz(-pi) q0[26];
-rz(-1.9781632) q0[27];
-sx q0[27];
-rz(-pi) q0[27];
-cx q0[26],q0[27];
-sx q0[27];
-rz(1.9781632) q0[27];
-sx q0[27];
-rz(-pi) q0[27];
-cx q0[26],q0[27];
-cx q0[26],q0[7];
-rz(pi/2) q0[26];
-sx q0[26];
-rz(pi/2) q0[26];
-sx q0[27];
-cx q0[7],q0[26];
-rz(-pi/4) q0[26];
-cx q0[0],q0[26];
-rz(pi/4) q0[26];
-cx q0[7],q0[26];
-rz(-pi/4) q0[26];
-cx q0[0],q0[26];
-rz(3*pi/4) q0[26];
-sx q0[26];
-rz(pi/2) q0[26];
-rz(pi/4) q0[7];
-cx q0[0],q0[7];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[7];
-cx q0[0],q0[7];
-cx q0[26],q0[7];
-sx q0[28];
-rz(0.65292998) q0[28];
-cx q0[27],q0[28];
-rz(1.624836) q0[28];
-cx q0[27],q0[28];
-rz(-pi) q0[27];
-sx q0[27];
-rz(-pi) q0[27];
-rz(-2.9991163) q0[28];
-sx q0[28];
-rz(-pi) q0[28];
-cx q0[27],q0[28];
-sx q0[28];
-rz(2.9991163) q0[28];
-sx q0[28];
-rz(-pi) q0[28];
-cx q0[27],q0[28];
-cx q0[27],q0[8];
-rz(pi/2) q0[27];
-sx q0[27];
-rz(pi/2) q0[27];
-sx q0[28];
-cx q0[8],q0[27];
-rz(-pi/4) q0[27];
-cx q0[0],q0[27];
-rz(pi/4) q0[27];
-cx q0[8],q0[27];
-rz(-pi/4) q0[27];
-cx q0[0],q0[27];
-rz(3*pi/4) q0[27];
-sx q0[27];
-rz(pi/2) q0[27];
-rz(pi/4) q0[8];
-cx q0[0],q0[8];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[8];
-cx q0[0],q0[8];
-cx q0[27],q0[8];
-sx q0[29];
-rz(1.8413394) q0[29];
-cx q0[28],q0[29];
-rz(1.6539002) q0[29];
-cx q0[28],q0[29];
-rz(-pi) q0[28];
-sx q0[28];
-rz(-pi) q0[28];
-rz(-3.0972822) q0[29];
-sx q0[29];
-rz(-pi) q0[29];
-cx q0[28],q0[29];
-sx q0[29];
-rz(3.0972822) q0[29];
-sx q0[29];
-rz(-pi) q0[29];
-cx q0[28],q0[29];
-cx q0[28],q0[9];
-rz(pi/2) q0[28];
-sx q0[28];
-rz(pi/2) q0[28];
-sx q0[29];
-cx q0[9],q0[28];
-rz(-pi/4) q0[28];
-cx q0[0],q0[28];
-rz(pi/4) q0[28];
-cx q0[9],q0[28];
-rz(-pi/4) q0[28];
-cx q0[0],q0[28];
-rz(3*pi/4) q0[28];
-sx q0[28];
-rz(pi/2) q0[28];
-rz(pi/4) q0[9];
-cx q0[0],q0[9];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[9];
-cx q0[0],q0[9];
-cx q0[28],q0[9];
-sx q0[30];
-rz(2.4082759) q0[30];
-cx q0[29],q0[30];
-rz(2.9429706) q0[30];
-cx q0[29],q0[30];
-rz(-pi) q0[29];
-sx q0[29];
-rz(-pi) q0[29];
-rz(-2.3755605) q0[30];
-sx q0[30];
-rz(-pi) q0[30];
-cx q0[29],q0[30];
-sx q0[30];
-rz(2.3755605) q0[30];
-sx q0[30];
-rz(-pi) q0[30];
-cx q0[29],q0[30];
-cx q0[29],q0[10];
-rz(pi/2) q0[29];
-sx q0[29];
-rz(pi/2) q0[29];
-cx q0[10],q0[29];
-rz(-pi/4) q0[29];
-cx q0[0],q0[29];
-rz(pi/4) q0[29];
-cx q0[10],q0[29];
-rz(pi/4) q0[10];
-rz(-pi/4) q0[29];
-cx q0[0],q0[29];
-cx q0[0],q0[10];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[10];
-cx q0[0],q0[10];
-rz(3*pi/4) q0[29];
-sx q0[29];
-rz(pi/2) q0[29];
-cx q0[29],q0[10];
-sx q0[30];
-sx q0[31];
-rz(0.26164311) q0[31];
-cx q0[30],q0[31];
-rz(1.4193778) q0[31];
-cx q0[30],q0[31];
-rz(-pi) q0[30];
-sx q0[30];
-rz(-pi) q0[30];
-rz(-2.3428956) q0[31];
-sx q0[31];
-rz(-pi) q0[31];
-cx q0[30],q0[31];
-sx q0[31];
-rz(2.3428956) q0[31];
-sx q0[31];
-rz(-pi) q0[31];
-cx q0[30],q0[31];
-cx q0[30],q0[11];
-rz(pi/2) q0[30];
-sx q0[30];
-rz(pi/2) q0[30];
-cx q0[11],q0[30];
-rz(-pi/4) q0[30];
-cx q0[0],q0[30];
-rz(pi/4) q0[30];
-cx q0[11],q0[30];
-rz(pi/4) q0[11];
-rz(-pi/4) q0[30];
-cx q0[0],q0[30];
-cx q0[0],q0[11];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[11];
-cx q0[0],q0[11];
-rz(3*pi/4) q0[30];
-sx q0[30];
-rz(pi/2) q0[30];
-cx q0[30],q0[11];
-sx q0[31];
-sx q0[32];
-rz(1.6983907) q0[32];
-cx q0[31],q0[32];
-rz(0.026215759) q0[32];
-cx q0[31],q0[32];
-rz(-pi) q0[31];
-sx q0[31];
-rz(-pi) q0[31];
-rz(-1.5759995) q0[32];
-sx q0[32];
-rz(-pi) q0[32];
-cx q0[31],q0[32];
-sx q0[32];
-rz(1.5759995) q0[32];
-sx q0[32];
-rz(-pi) q0[32];
-cx q0[31],q0[32];
-cx q0[31],q0[12];
-rz(pi/2) q0[31];
-sx q0[31];
-rz(pi/2) q0[31];
-cx q0[12],q0[31];
-rz(-pi/4) q0[31];
-cx q0[0],q0[31];
-rz(pi/4) q0[31];
-cx q0[12],q0[31];
-rz(pi/4) q0[12];
-rz(-pi/4) q0[31];
-cx q0[0],q0[31];
-cx q0[0],q0[12];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[12];
-cx q0[0],q0[12];
-rz(3*pi/4) q0[31];
-sx q0[31];
-rz(pi/2) q0[31];
-cx q0[31],q0[12];
-sx q0[32];
-sx q0[33];
-rz(2.8524951) q0[33];
-cx q0[32],q0[33];
-rz(0.58184821) q0[33];
-cx q0[32],q0[33];
-rz(-pi) q0[32];
-sx q0[32];
-rz(-pi) q0[32];
-rz(-3.0906508) q0[33];
-sx q0[33];
-rz(-pi) q0[33];
-cx q0[32],q0[33];
-sx q0[33];
-rz(3.0906508) q0[33];
-sx q0[33];
-rz(-pi) q0[33];
-cx q0[32],q0[33];
-cx q0[32],q0[13];
-rz(pi/2) q0[32];
-sx q0[32];
-rz(pi/2) q0[32];
-cx q0[13],q0[32];
-rz(-pi/4) q0[32];
-cx q0[0],q0[32];
-rz(pi/4) q0[32];
-cx q0[13],q0[32];
-rz(pi/4) q0[13];
-rz(-pi/4) q0[32];
-cx q0[0],q0[32];
-cx q0[0],q0[13];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[13];
-cx q0[0],q0[13];
-rz(3*pi/4) q0[32];
-sx q0[32];
-rz(pi/2) q0[32];
-cx q0[32],q0[13];
-sx q0[33];
-sx q0[34];
-rz(0.72645641) q0[34];
-cx q0[33],q0[34];
-rz(0.45780698) q0[34];
-cx q0[33],q0[34];
-rz(-pi) q0[33];
-sx q0[33];
-rz(-pi) q0[33];
-rz(-2.7611416) q0[34];
-sx q0[34];
-rz(-pi) q0[34];
-cx q0[33],q0[34];
-sx q0[34];
-rz(2.7611416) q0[34];
-sx q0[34];
-rz(-pi) q0[34];
-cx q0[33],q0[34];
-cx q0[33],q0[14];
-rz(pi/2) q0[33];
-sx q0[33];
-rz(pi/2) q0[33];
-cx q0[14],q0[33];
-rz(-pi/4) q0[33];
-cx q0[0],q0[33];
-rz(pi/4) q0[33];
-cx q0[14],q0[33];
-rz(pi/4) q0[14];
-rz(-pi/4) q0[33];
-cx q0[0],q0[33];
-cx q0[0],q0[14];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[14];
-cx q0[0],q0[14];
-rz(3*pi/4) q0[33];
-sx q0[33];
-rz(pi/2) q0[33];
-cx q0[33],q0[14];
-sx q0[34];
-sx q0[35];
-rz(0.18555618) q0[35];
-cx q0[34],q0[35];
-rz(0.443122) q0[35];
-cx q0[34],q0[35];
-rz(-pi) q0[34];
-sx q0[34];
-rz(-pi) q0[34];
-rz(-1.7322602) q0[35];
-sx q0[35];
-rz(-pi) q0[35];
-cx q0[34],q0[35];
-sx q0[35];
-rz(1.7322602) q0[35];
-sx q0[35];
-rz(-pi) q0[35];
-cx q0[34],q0[35];
-cx q0[34],q0[15];
-rz(pi/2) q0[34];
-sx q0[34];
-rz(pi/2) q0[34];
-cx q0[15],q0[34];
-rz(-pi/4) q0[34];
-cx q0[0],q0[34];
-rz(pi/4) q0[34];
-cx q0[15],q0[34];
-rz(pi/4) q0[15];
-rz(-pi/4) q0[34];
-cx q0[0],q0[34];
-cx q0[0],q0[15];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[15];
-cx q0[0],q0[15];
-rz(3*pi/4) q0[34];
-sx q0[34];
-rz(pi/2) q0[34];
-cx q0[34],q0[15];
-sx q0[35];
-sx q0[36];
-rz(0.998412) q0[36];
-cx q0[35],q0[36];
-rz(2.0384821) q0[36];
-cx q0[35],q0[36];
-rz(-pi) q0[35];
-sx q0[35];
-rz(-pi) q0[35];
-rz(-2.2248593) q0[36];
-sx q0[36];
-rz(-pi) q0[36];
-cx q0[35],q0[36];
-sx q0[36];
-rz(2.2248593) q0[36];
-sx q0[36];
-rz(-pi) q0[36];
-cx q0[35],q0[36];
-cx q0[35],q0[16];
-rz(pi/2) q0[35];
-sx q0[35];
-rz(pi/2) q0[35];
-cx q0[16],q0[35];
-rz(-pi/4) q0[35];
-cx q0[0],q0[35];
-rz(pi/4) q0[35];
-cx q0[16],q0[35];
-rz(pi/4) q0[16];
-rz(-pi/4) q0[35];
-cx q0[0],q0[35];
-cx q0[0],q0[16];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[16];
-cx q0[0],q0[16];
-rz(3*pi/4) q0[35];
-sx q0[35];
-rz(pi/2) q0[35];
-cx q0[35],q0[16];
-sx q0[36];
-sx q0[37];
-rz(0.92565055) q0[37];
-cx q0[36],q0[37];
-rz(1.6728918) q0[37];
-cx q0[36],q0[37];
-rz(-pi) q0[36];
-sx q0[36];
-rz(-pi) q0[36];
-rz(-2.5995331) q0[37];
-sx q0[37];
-rz(-pi) q0[37];
-cx q0[36],q0[37];
-sx q0[37];
-rz(2.5995331) q0[37];
-sx q0[37];
-rz(-pi) q0[37];
-cx q0[36],q0[37];
-cx q0[36],q0[17];
-rz(pi/2) q0[36];
-sx q0[36];
-rz(pi/2) q0[36];
-cx q0[17],q0[36];
-rz(-pi/4) q0[36];
-cx q0[0],q0[36];
-rz(pi/4) q0[36];
-cx q0[17],q0[36];
-rz(pi/4) q0[17];
-rz(-pi/4) q0[36];
-cx q0[0],q0[36];
-cx q0[0],q0[17];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[17];
-cx q0[0],q0[17];
-rz(3*pi/4) q0[36];
-sx q0[36];
-rz(pi/2) q0[36];
-cx q0[36],q0[17];
-sx q0[37];
-sx q0[38];
-rz(1.3395776) q0[38];
-cx q0[37],q0[38];
-rz(0.55692043) q0[38];
-cx q0[37],q0[38];
-rz(-pi) q0[37];
-sx q0[37];
-rz(-pi) q0[37];
-rz(-1.7546412) q0[38];
-sx q0[38];
-rz(-pi) q0[38];
-cx q0[37],q0[38];
-sx q0[38];
-rz(1.7546412) q0[38];
-sx q0[38];
-rz(-pi) q0[38];
-cx q0[37],q0[38];
-cx q0[37],q0[18];
-rz(pi/2) q0[37];
-sx q0[37];
-rz(pi/2) q0[37];
-cx q0[18],q0[37];
-rz(-pi/4) q0[37];
-cx q0[0],q0[37];
-rz(pi/4) q0[37];
-cx q0[18],q0[37];
-rz(pi/4) q0[18];
-rz(-pi/4) q0[37];
-cx q0[0],q0[37];
-cx q0[0],q0[18];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[18];
-cx q0[0],q0[18];
-rz(3*pi/4) q0[37];
-sx q0[37];
-rz(pi/2) q0[37];
-cx q0[37],q0[18];
-cx q0[38],q0[19];
-rz(pi/2) q0[38];
-sx q0[38];
-rz(pi/2) q0[38];
-cx q0[19],q0[38];
-rz(-pi/4) q0[38];
-cx q0[0],q0[38];
-rz(pi/4) q0[38];
-cx q0[19],q0[38];
-rz(pi/4) q0[19];
-rz(-pi/4) q0[38];
-cx q0[0],q0[38];
-cx q0[0],q0[19];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[19];
-cx q0[0],q0[19];
-rz(pi/2) q0[0];
-sx q0[0];
-rz(pi/2) q0[0];
-rz(3*pi/4) q0[38];
-sx q0[38];
-rz(pi/2) q0[38];
-cx q0[38],q0[19];
-measure q0[20] -> c0[0];
-measure q0[21] -> c0[1];
-measure q0[22] -> c0[2];
-measure q0[23] -> c0[3];
-measure q0[24] -> c0[4];
-measure q0[25] -> c0[5];
-measure q0[26] -> c0[6];
-measure q0[27] -> c0[7];
-measure q0[28] -> c0[8];
-measure q0[29] -> c0[9];
-measure q0[30] -> c0[10];
-measure q0[31] -> c0[11];
-measure q0[32] -> c0[12];
-measure q0[33] -> c0[13];
-measure q0[34] -> c0[14];
-measure q0[35] -> c0[15];
-measure q0[36] -> c0[16];
-measure q0[37] -> c0[17];
-measure q0[38] -> c0[18];
@@ -1,5505 +0,0 @@
-OPENQASM 2.0;
-include "qelib1.inc";
-gate cry(lambda) a,b
-{
-  ry(lambda/2) b;
-  cx a,b;
-  ry(-lambda/2) b;
-  cx a,b;
-}
-gate ryy(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(0.94852206) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806422288(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(2.8716116) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806422336(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(0.73204575) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806422528(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(1.4107561) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806422672(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(1.218704) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806422816(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(0.53173013) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806422960(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(3.0054813) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806423104(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(2.0452639) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806423248(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(2.8863362) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806423392(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(0.15647598) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806423536(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(0.87923119) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806423680(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(0.25497833) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806423824(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(1.8317449) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806423968(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(2.3085119) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806424112(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(0.1835844) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806424256(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(2.5852464) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806424400(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(3.007103) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806424544(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(0.86205336) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806424688(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(1.7427516) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806424832(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(2.883636) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806424976(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(2.3111593) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806425120(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(1.8717912) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806425264(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(2.4297677) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806425408(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(0.81819445) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806422240(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(2.9462082) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806454432(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(1.4761479) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806454576(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(1.9117963) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806454720(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(1.1028255) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806454864(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(0.081822548) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806455008(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(2.2783774) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806455152(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(1.7669605) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806455296(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(2.396472) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806455440(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(1.6868652) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806455584(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(1.687576) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806455728(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(1.5759073) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806455872(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(3.090887) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806456016(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(1.2484491) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806456160(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(3.0645268) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806456304(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(0.75387412) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806456448(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(1.4689818) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806456592(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(3.0171094) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806456736(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(2.4614235) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806456880(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(0.91314195) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806457024(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(1.2445238) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806457168(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(0.83610803) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806457312(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(2.5055157) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806457456(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(2.9206257) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806457600(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(0.9050598) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806457744(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(0.97503863) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806457888(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(0.69497181) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806458032(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(1.3869379) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806458176(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(2.1639597) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806454336(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(2.3511181) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806487200(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(0.993908) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806487344(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(1.4392017) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806487488(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(1.6849692) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806487632(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(2.0309222) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806487776(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(0.069909012) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806487920(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(2.0940663) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806488064(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(2.6110195) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806488208(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(2.7795264) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806488352(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(0.42212044) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806488496(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(1.290329) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806488640(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(1.8960284) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806488784(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(2.3448624) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806488928(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(0.88404709) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806489072(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(1.7733888) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806489216(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(0.62354522) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806489360(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(0.089574994) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806489504(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(2.3215753) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806489648(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(0.50446427) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806489792(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(0.10555114) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806489936(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(0.71167568) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806490080(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(2.9978716) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806490224(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(1.1056734) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806490368(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(2.1073558) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806490512(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(1.2874318) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806490656(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(2.0925866) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806490800(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(1.9914997) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806490944(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(0.04435206) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806487104(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(0.79783944) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806524064(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(1.8814768) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806524208(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(2.2819645) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806524352(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(0.091683167) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806524496(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(0.99562055) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806524640(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(2.2496514) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806524784(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(0.12910029) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806524928(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(0.62683199) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806525072(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(2.3729978) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806525216(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(1.5905382) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806525360(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(0.45361847) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806525504(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(2.0165216) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806525648(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(0.52622344) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806525792(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(1.4870986) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806525936(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(0.09420832) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806526080(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(0.91134539) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806526224(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(0.07492038) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806526368(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(0.83469392) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806526512(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(3.0174095) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806526656(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(1.908003) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806526800(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(1.5094247) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806526944(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(1.9552772) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806527088(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(2.7582089) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806527232(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(0.1615129) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806527376(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(1.9451921) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806527520(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(0.36257372) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806527664(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(1.8477076) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806527808(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(1.2290716) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806523968(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(0.76239574) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806556832(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(2.5080714) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806556976(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(2.848587) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806557120(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(2.1787028) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806557264(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(0.93933659) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806557408(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(1.7185185) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806557552(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(2.3830063) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806557696(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(2.7379318) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806557840(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(1.9888968) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806557984(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(3.0713961) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806558128(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(2.4128489) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806558272(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(2.2133837) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806558416(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(1.4742865) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806558560(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(2.0255271) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806558704(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(0.87650918) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806558848(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(0.32270029) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806558992(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(2.6359198) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806559136(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(2.1139281) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806559280(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(0.84237726) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806559424(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(0.38412494) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806559568(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(0.55853378) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806559712(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(1.8152406) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806559856(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(2.9030946) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806560000(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(1.9836577) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806560144(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(2.1847853) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806560288(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(0.45802535) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806560432(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(0.22162475) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806560576(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(1.895919) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806556736(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(1.4362731) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806593696(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(0.7003644) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806593840(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(1.4694396) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806593984(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(0.85274736) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806594128(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(0.48645472) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806594272(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(1.3132601) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806594416(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(2.4868542) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806594560(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(1.4270531) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806594704(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(1.8061905) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806594848(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(0.1879796) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806594992(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(0.73786294) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806595136(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(0.47742554) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806595280(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(2.0210653) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806595424(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(1.1713892) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806595568(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(0.8475717) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806595712(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(0.80378619) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806595856(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(0.26959586) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806596000(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(1.2947419) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806596144(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(0.10108241) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806596288(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(2.326777) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806596432(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(1.4580794) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806596576(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(1.691651) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806596720(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(2.2696822) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806596864(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(2.2644066) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806597008(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(1.3197938) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806597152(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(1.3165732) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806597296(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(1.934567) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806597440(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(2.403996) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806593600(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(0.13362985) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806626464(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(2.710656) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806626608(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(1.7842596) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806626896(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(1.7025804) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806627040(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(2.7891683) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806627184(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(2.8724826) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806627328(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(0.76999502) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806627472(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(1.7606676) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806627616(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(2.4825255) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806627760(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(0.27171571) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806627904(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(1.9940917) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806628048(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(0.96574929) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806628192(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(1.1839278) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806628336(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(0.48290499) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806628480(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(2.0428957) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806628624(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(1.0737364) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806628768(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(0.72853883) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806628912(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(2.0294928) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806629056(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(0.68880536) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806629200(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(0.53211821) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806629344(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(1.2958097) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806629488(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(2.2534931) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806629632(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(0.14357148) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806629776(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(0.49606494) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806629920(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(1.1518938) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806630064(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(2.2568389) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806630208(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(1.5989233) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806626368(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(2.4428539) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806663328(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(2.6922271) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806663472(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(2.2720786) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806663616(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(2.2420432) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806663760(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(2.5245415) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806663904(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(0.33273558) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806664048(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(1.9473938) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806664192(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(1.4606068) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806664336(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(1.1393161) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806664480(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(2.4325036) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806664624(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(0.62183805) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806664768(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(0.66701395) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806664912(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(2.9040686) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806665056(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(0.99796253) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806665200(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(3.0439985) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806665344(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(0.20453229) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806665488(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(0.28573577) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806665632(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(3.0013781) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806665776(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(1.3638983) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806665920(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(1.8381776) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806666064(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(1.0520842) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806666208(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(2.2171996) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806666352(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(0.73332277) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806666496(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(1.1613811) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806666640(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(0.44149659) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806666784(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(2.0628831) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806666928(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(0.13676934) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806667072(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(0.45259893) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806663232(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(0.133906) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806700192(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(2.2103866) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806700336(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(2.8527195) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806700480(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(1.5602037) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806700624(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(1.7224586) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806700768(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(1.0540938) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806700912(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(1.8408743) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806701056(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(1.4415374) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806701200(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(0.22872974) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806701344(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(0.79665055) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806701488(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(2.6686223) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806701632(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(0.18312662) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806701776(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(1.0486101) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806701920(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(3.062795) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806702064(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(1.8013303) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806702208(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(0.4156719) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806702352(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(3.1134485) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806702496(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(1.1676215) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806702640(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(1.1638225) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806702784(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(0.94550818) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806702928(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(1.7749488) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806703072(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(1.7976703) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806703216(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(0.33502834) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806703360(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(0.53489282) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806703504(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(1.4773159) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806703648(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(1.977876) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806703792(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(1.6244161) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806703936(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(0.67364266) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806700096(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(1.0288547) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806737056(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(0.126036) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806737200(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(2.6528719) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806737344(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(0.083970227) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806737488(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(0.2913227) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806737632(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(2.273003) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806737776(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(0.75215466) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806737920(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(2.5400259) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806738064(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(2.5743366) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806738208(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(0.26618668) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806738352(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(2.9024561) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806738496(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(2.0431522) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806738640(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(0.78599814) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806738784(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(0.41775525) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806738928(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(0.49429264) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806739072(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(0.95716613) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806739216(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(2.602969) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806739360(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(1.4175711) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806739504(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(1.8175744) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806739648(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(1.7215713) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806739792(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(1.8998785) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806739936(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(1.8278401) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806740080(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(2.1266798) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806740224(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(0.98287847) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806740368(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(1.290705) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806740512(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(0.4911615) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806740656(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(1.9690473) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806740800(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(2.7018364) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806736960(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(3.014635) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806773920(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(2.4491297) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806774064(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(2.9893835) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806774208(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(1.5144285) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806774352(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(2.1816535) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806774496(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(0.58251655) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806774640(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(2.0260262) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806774784(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(0.47486584) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806774928(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(0.34207756) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806775072(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(2.7188525) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806775216(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(2.2907264) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806775360(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(1.1338155) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806775504(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(2.7500438) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806775648(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(0.79458337) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806775792(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(2.4153699) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806775936(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(0.46355037) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806776080(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(2.1389488) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806776224(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(2.4011371) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806776368(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(2.4093038) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806776512(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(3.025599) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806776656(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(2.3242671) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806776800(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(1.0171159) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806776944(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(2.8178665) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806777088(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(1.9432444) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806777232(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(1.4899325) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806777376(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(0.76037068) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806777520(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(2.8960004) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806777664(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(2.9248568) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806773824(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(2.2560017) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806802592(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(2.8271186) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806802736(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(3.0123899) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806802880(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(2.3014624) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806803024(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(2.5915995) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806803168(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(2.639159) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806803312(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(0.99110532) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806803456(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(3.0493187) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806803600(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(0.38571546) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806803744(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(1.9906111) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806803888(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(1.3175988) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806804032(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(0.33988956) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806804176(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(2.1366933) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806804320(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(1.7841979) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806804464(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(1.1891351) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806804608(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(3.1357634) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806804752(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(2.120048) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806804896(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(0.94035925) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806805040(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(2.9530097) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806805184(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(0.003241074) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806805328(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(2.981046) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806805472(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(0.6406385) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806805616(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(1.0172884) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806805760(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(0.72877723) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806805904(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(1.8415651) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806806048(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(1.3914951) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806806192(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(1.4633712) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806806336(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(1.6466676) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806802496(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(1.897962) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806839456(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(1.8738225) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806839600(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(1.6998335) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806839744(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(1.5662328) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806839888(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(2.3547071) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806840032(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(2.5930826) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806840176(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(1.7367507) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806840320(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(2.0614113) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806840464(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(0.9049402) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806840608(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(1.2158619) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806840752(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(0.097583798) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806840896(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(2.9997131) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806841040(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(0.99141132) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806841184(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(0.8010571) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806841328(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(1.2967798) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806841472(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(2.6560206) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806841616(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(1.2775981) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806841760(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(2.6569814) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806841904(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(1.6463791) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806842048(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(2.3600705) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806842192(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(0.042115548) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806842336(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(1.456421) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806842480(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(1.4452136) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806842624(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(2.3070021) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806842768(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(1.9828802) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806842912(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(1.8891172) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806843056(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(1.5600679) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806843200(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(0.89156043) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806839360(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(0.89233858) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806876320(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(2.639685) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806876464(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(1.9805582) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806876608(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(2.4081113) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806876752(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(0.7126561) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806876896(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(1.8327372) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806877040(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(2.9868758) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806877184(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(2.9094645) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806877328(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(2.161851) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806877472(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(1.4463808) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806877616(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(0.99592266) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806877760(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(0.70579958) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806877904(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(2.9021364) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806878048(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(2.5406431) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806878192(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(1.0037842) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806878336(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(1.7687061) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806878480(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(3.0421964) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806878624(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(2.0054963) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806878768(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(2.7787743) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806878912(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(1.9924883) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806879056(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(1.1425212) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806879200(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(2.9304298) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806879344(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(1.8963799) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806879488(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(1.2900985) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806879632(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(1.897802) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806879776(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(2.3851696) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806879920(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(1.5462128) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806880064(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(2.0107137) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806876224(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(2.7828087) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806909088(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(1.3099802) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806909232(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(1.5432147) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806909376(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(1.2578602) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140550806909520(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(1.5400429) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-qreg q0[395];
-creg c0[197];
-ry(3.1323971) q0[1];
-ry(1.2469352) q0[2];
-ry(2.7508252) q0[3];
-ry(1.5148666) q0[4];
-ry(2.7190479) q0[5];
-ry(1.1150559) q0[6];
-ry(2.497822) q0[7];
-ry(2.677804) q0[8];
-ry(2.921632) q0[9];
-ry(2.1257982) q0[10];
-ry(0.85139694) q0[11];
-ry(2.4976471) q0[12];
-ry(1.9690956) q0[13];
-ry(0.29398624) q0[14];
-ry(1.5015092) q0[15];
-ry(1.8139391) q0[16];
-ry(1.0351294) q0[17];
-ry(1.2129437) q0[18];
-ry(0.91617691) q0[19];
-ry(2.1315978) q0[20];
-ry(3.0632262) q0[21];
-ry(2.6983245) q0[22];
-ry(2.2559066) q0[23];
-ry(0.28887259) q0[24];
-ry(1.9347737) q0[25];
-ry(0.88475112) q0[26];
-ry(0.045768367) q0[27];
-ry(1.7300077) q0[28];
-ry(1.4711385) q0[29];
-ry(2.1473109) q0[30];
-ry(1.1331344) q0[31];
-ry(1.5703027) q0[32];
-ry(2.7634658) q0[33];
-ry(2.7339828) q0[34];
-ry(2.0896663) q0[35];
-ry(3.0966964) q0[36];
-ry(1.9392776) q0[37];
-ry(0.81037853) q0[38];
-ry(0.23785591) q0[39];
-ry(2.3880754) q0[40];
-ry(2.8091493) q0[41];
-ry(2.3045801) q0[42];
-ry(0.60831078) q0[43];
-ry(3.0767826) q0[44];
-ry(2.7417843) q0[45];
-ry(0.92029738) q0[46];
-ry(3.0193164) q0[47];
-ry(1.0161798) q0[48];
-ry(0.21580502) q0[49];
-ry(0.38333415) q0[50];
-ry(1.016126) q0[51];
-ry(1.1205201) q0[52];
-ry(1.30237) q0[53];
-ry(0.15281301) q0[54];
-ry(1.8967926) q0[55];
-ry(1.2844923) q0[56];
-ry(1.0951952) q0[57];
-ry(1.3678726) q0[58];
-ry(0.67931954) q0[59];
-ry(0.54091252) q0[60];
-ry(1.6669983) q0[61];
-ry(0.36056421) q0[62];
-ry(0.3367329) q0[63];
-ry(1.6037611) q0[64];
-ry(1.6795842) q0[65];
-ry(0.71496581) q0[66];
-ry(0.40443124) q0[67];
-ry(1.2882458) q0[68];
-ry(0.99635798) q0[69];
-ry(1.2943559) q0[70];
-ry(1.8264582) q0[71];
-ry(2.66483) q0[72];
-ry(1.0912735) q0[73];
-ry(0.15111374) q0[74];
-ry(3.0981727) q0[75];
-ry(0.48437169) q0[76];
-ry(3.0949113) q0[77];
-ry(2.1330728) q0[78];
-ry(1.1825139) q0[79];
-ry(1.4979684) q0[80];
-ry(0.88275504) q0[81];
-ry(1.2082921) q0[82];
-ry(2.0847477) q0[83];
-ry(1.6998864) q0[84];
-ry(0.2395207) q0[85];
-ry(2.6453639) q0[86];
-ry(2.1238084) q0[87];
-ry(2.3579009) q0[88];
-ry(1.7028574) q0[89];
-ry(2.9772621) q0[90];
-ry(1.8618715) q0[91];
-ry(0.58183144) q0[92];
-ry(1.7183666) q0[93];
-ry(0.84369616) q0[94];
-ry(2.8483141) q0[95];
-ry(1.1858021) q0[96];
-ry(2.3694306) q0[97];
-ry(2.3241994) q0[98];
-ry(0.76060713) q0[99];
-ry(0.0052190006) q0[100];
-ry(1.3397501) q0[101];
-ry(0.020860016) q0[102];
-ry(1.9965685) q0[103];
-ry(0.37460701) q0[104];
-ry(2.2456255) q0[105];
-ry(1.1636452) q0[106];
-ry(2.1194336) q0[107];
-ry(3.0415116) q0[108];
-ry(2.13862) q0[109];
-ry(2.8633886) q0[110];
-ry(0.17431383) q0[111];
-ry(2.9651498) q0[112];
-ry(0.80304491) q0[113];
-ry(1.2087831) q0[114];
-ry(1.4116286) q0[115];
-ry(1.3669678) q0[116];
-ry(0.34367634) q0[117];
-ry(0.14923949) q0[118];
-ry(1.9129046) q0[119];
-ry(0.71892373) q0[120];
-ry(0.38265132) q0[121];
-ry(1.276786) q0[122];
-ry(1.1225521) q0[123];
-ry(0.73771066) q0[124];
-ry(1.8196333) q0[125];
-ry(2.4362415) q0[126];
-ry(1.6148301) q0[127];
-ry(2.9820309) q0[128];
-ry(0.26036042) q0[129];
-ry(1.3422398) q0[130];
-ry(2.9075018) q0[131];
-ry(1.6723327) q0[132];
-ry(0.1309148) q0[133];
-ry(0.85262309) q0[134];
-ry(1.6283239) q0[135];
-ry(0.95487288) q0[136];
-ry(1.3555626) q0[137];
-ry(1.07411) q0[138];
-ry(1.5202303) q0[139];
-ry(1.9132508) q0[140];
-ry(1.26463) q0[141];
-ry(1.6239759) q0[142];
-ry(1.8556782) q0[143];
-ry(0.071622059) q0[144];
-ry(2.7254925) q0[145];
-ry(2.9667004) q0[146];
-ry(1.4757826) q0[147];
-ry(0.096425123) q0[148];
-ry(1.5117888) q0[149];
-ry(0.35193248) q0[150];
-ry(1.7672429) q0[151];
-ry(0.27767439) q0[152];
-ry(1.2543821) q0[153];
-ry(2.8335096) q0[154];
-ry(1.6717637) q0[155];
-ry(1.5099594) q0[156];
-ry(1.5359967) q0[157];
-ry(1.3336379) q0[158];
-ry(0.6218792) q0[159];
-ry(0.59495103) q0[160];
-ry(0.19783851) q0[161];
-ry(2.428694) q0[162];
-ry(0.73451069) q0[163];
-ry(2.5243719) q0[164];
-ry(0.714249) q0[165];
-ry(1.7974171) q0[166];
-ry(0.48833077) q0[167];
-ry(1.7617925) q0[168];
-ry(2.7372153) q0[169];
-ry(3.0868505) q0[170];
-ry(1.6677942) q0[171];
-ry(2.7151124) q0[172];
-ry(1.039549) q0[173];
-ry(1.5538977) q0[174];
-ry(0.050737995) q0[175];
-ry(2.5832453) q0[176];
-ry(2.2932145) q0[177];
-ry(2.820381) q0[178];
-ry(2.1697064) q0[179];
-ry(1.1043273) q0[180];
-ry(0.87948015) q0[181];
-ry(0.9698103) q0[182];
-ry(1.3678651) q0[183];
-ry(2.0495293) q0[184];
-ry(2.152917) q0[185];
-ry(2.0983427) q0[186];
-ry(0.69528419) q0[187];
-ry(2.1648894) q0[188];
-ry(0.10610008) q0[189];
-ry(2.6593406) q0[190];
-ry(3.1207505) q0[191];
-ry(0.044618441) q0[192];
-ry(0.063793651) q0[193];
-ry(0.62656161) q0[194];
-ry(3.1179568) q0[195];
-ry(2.8625736) q0[196];
-ry(2.5063983) q0[197];
-ry(0.45449626) q0[198];
-ry(0.51134631) q0[199];
-ry(2.3482473) q0[200];
-ry(2.6058162) q0[201];
-ry(2.5851275) q0[202];
-ry(2.0399198) q0[203];
-ry(1.7807831) q0[204];
-ry(0.48156072) q0[205];
-ry(0.90396812) q0[206];
-ry(2.1108017) q0[207];
-ry(2.2842531) q0[208];
-ry(2.3967002) q0[209];
-ry(2.7061945) q0[210];
-ry(2.9963796) q0[211];
-ry(1.8449536) q0[212];
-ry(1.5532856) q0[213];
-ry(1.4668821) q0[214];
-ry(2.7438307) q0[215];
-ry(0.76647066) q0[216];
-ry(2.4422525) q0[217];
-ry(0.18350178) q0[218];
-ry(1.1797743) q0[219];
-ry(0.86316719) q0[220];
-ry(1.0717994) q0[221];
-ry(2.2066899) q0[222];
-ry(1.537701) q0[223];
-ry(0.80069006) q0[224];
-ry(1.4704748) q0[225];
-ry(1.0374151) q0[226];
-ry(0.3807018) q0[227];
-ry(2.8544347) q0[228];
-ry(0.25805504) q0[229];
-ry(1.7466338) q0[230];
-ry(2.9208687) q0[231];
-ry(2.5166445) q0[232];
-ry(2.2169452) q0[233];
-ry(0.46446823) q0[234];
-ry(2.0710926) q0[235];
-ry(3.0492826) q0[236];
-ry(2.3288868) q0[237];
-ry(1.7332386) q0[238];
-ry(2.3805408) q0[239];
-ry(0.27676775) q0[240];
-ry(1.1737653) q0[241];
-ry(0.53884247) q0[242];
-ry(0.084868766) q0[243];
-ry(2.4440089) q0[244];
-ry(0.15399869) q0[245];
-ry(1.5786286) q0[246];
-ry(1.0843058) q0[247];
-ry(1.5739666) q0[248];
-ry(0.78841656) q0[249];
-ry(2.8265381) q0[250];
-ry(1.8195394) q0[251];
-ry(1.9644831) q0[252];
-ry(1.1095528) q0[253];
-ry(2.9090319) q0[254];
-ry(2.0761698) q0[255];
-ry(0.66833694) q0[256];
-ry(1.6783861) q0[257];
-ry(0.41522303) q0[258];
-ry(0.9491811) q0[259];
-ry(1.1374269) q0[260];
-ry(0.50947554) q0[261];
-ry(2.3228525) q0[262];
-ry(1.7730046) q0[263];
-ry(1.0931775) q0[264];
-ry(0.83740819) q0[265];
-ry(2.7981191) q0[266];
-ry(1.5991839) q0[267];
-ry(0.70036913) q0[268];
-ry(0.8627921) q0[269];
-ry(0.521997) q0[270];
-ry(2.1494993) q0[271];
-ry(1.1879547) q0[272];
-ry(0.025147919) q0[273];
-ry(0.55944942) q0[274];
-ry(0.62905815) q0[275];
-ry(2.0634554) q0[276];
-ry(2.6802985) q0[277];
-ry(1.8904227) q0[278];
-ry(2.6632026) q0[279];
-ry(3.0796992) q0[280];
-ry(2.4137934) q0[281];
-ry(0.16627015) q0[282];
-ry(1.4019257) q0[283];
-ry(1.0893591) q0[284];
-ry(2.9162498) q0[285];
-ry(1.0256587) q0[286];
-ry(0.047548274) q0[287];
-ry(2.7678702) q0[288];
-ry(0.62601274) q0[289];
-ry(2.4482956) q0[290];
-ry(2.7816214) q0[291];
-ry(0.39318029) q0[292];
-ry(0.1008094) q0[293];
-ry(0.21140908) q0[294];
-ry(2.4539608) q0[295];
-ry(1.8529145) q0[296];
-ry(2.4054671) q0[297];
-ry(1.6999012) q0[298];
-ry(1.1001696) q0[299];
-ry(1.0449832) q0[300];
-ry(0.41839761) q0[301];
-ry(2.1604455) q0[302];
-ry(2.5541099) q0[303];
-ry(0.43506589) q0[304];
-ry(0.5555724) q0[305];
-ry(0.1959697) q0[306];
-ry(2.5828351) q0[307];
-ry(2.2372966) q0[308];
-ry(2.6038194) q0[309];
-ry(2.3273882) q0[310];
-ry(0.21052527) q0[311];
-ry(2.1892329) q0[312];
-ry(1.1120022) q0[313];
-ry(0.79484739) q0[314];
-ry(0.93012014) q0[315];
-ry(0.098078104) q0[316];
-ry(1.5943504) q0[317];
-ry(1.4028986) q0[318];
-ry(1.1966041) q0[319];
-ry(0.99265203) q0[320];
-ry(3.0149651) q0[321];
-ry(0.54789279) q0[322];
-ry(1.5682676) q0[323];
-ry(1.585075) q0[324];
-ry(1.2206162) q0[325];
-ry(2.7152162) q0[326];
-ry(2.2928763) q0[327];
-ry(2.9794214) q0[328];
-ry(3.0988917) q0[329];
-ry(0.69433889) q0[330];
-ry(1.4115659) q0[331];
-ry(0.83138213) q0[332];
-ry(2.3417329) q0[333];
-ry(1.0922835) q0[334];
-ry(1.0373221) q0[335];
-ry(2.200996) q0[336];
-ry(1.9288142) q0[337];
-ry(0.58219466) q0[338];
-ry(2.9374784) q0[339];
-ry(1.8126715) q0[340];
-ry(1.3482068) q0[341];
-ry(0.59254194) q0[342];
-ry(0.37891453) q0[343];
-ry(3.0152938) q0[344];
-ry(1.1072103) q0[345];
-ry(2.4137206) q0[346];
-ry(0.43785745) q0[347];
-ry(1.4780867) q0[348];
-ry(0.93432246) q0[349];
-ry(1.6062181) q0[350];
-ry(1.5011492) q0[351];
-ry(0.60061592) q0[352];
-ry(0.65539772) q0[353];
-ry(0.56880297) q0[354];
-ry(1.4936208) q0[355];
-ry(1.3400041) q0[356];
-ry(0.97124211) q0[357];
-ry(1.1472695) q0[358];
-ry(2.2901804) q0[359];
-ry(2.6749266) q0[360];
-ry(0.21034941) q0[361];
-ry(1.3602805) q0[362];
-ry(2.1293937) q0[363];
-ry(0.054107417) q0[364];
-ry(0.19756816) q0[365];
-ry(0.1572763) q0[366];
-ry(2.0676358) q0[367];
-ry(0.78349363) q0[368];
-ry(1.3155391) q0[369];
-ry(0.77641331) q0[370];
-ry(2.2417986) q0[371];
-ry(1.5802789) q0[372];
-ry(2.3329901) q0[373];
-ry(0.57969223) q0[374];
-ry(0.60843307) q0[375];
-ry(2.8052485) q0[376];
-ry(2.7610307) q0[377];
-ry(1.6359077) q0[378];
-ry(0.89878615) q0[379];
-ry(2.9323285) q0[380];
-ry(1.6875793) q0[381];
-ry(1.9746192) q0[382];
-ry(0.96030406) q0[383];
-ry(2.7785155) q0[384];
-ry(1.2278955) q0[385];
-ry(1.9851611) q0[386];
-ry(1.796031) q0[387];
-ry(0.92199269) q0[388];
-ry(2.2646556) q0[389];
-ry(2.0936626) q0[390];
-ry(2.3324373) q0[391];
-ry(1.1316594) q0[392];
-ry(1.9053016) q0[393];
-ry(1.6973157) q0[394];
-ryy(0.94852206) q0[1],q0[2];
-cry(1.60375) q0[1],q0[2];
-ryy_140550806422288(2.8716116) q0[2],q0[3];
-cry(2.2301585) q0[2],q0[3];
-ryy_140550806422336(0.73204575) q0[3],q0[4];
-cry(2.8431483) q0[3],q0[4];
-ryy_140550806422528(1.4107561) q0[4],q0[5];
-cry(0.74102025) q0[4],q0[5];
-ryy_140550806422672(1.218704) q0[5],q0[6];
-cry(1.0394614) q0[5],q0[6];
-ryy_140550806422816(0.53173013) q0[6],q0[7];
-cry(0.83182782) q0[6],q0[7];
-ryy_140550806422960(3.0054813) q0[7],q0[8];
-cry(2.636276) q0[7],q0[8];
-ryy_140550806423104(2.0452639) q0[8],q0[9];
-cry(1.2487356) q0[8],q0[9];
-ryy_140550806423248(2.8863362) q0[9],q0[10];
-cry(2.7875788) q0[9],q0[10];
-ryy_140550806423392(0.15647598) q0[10],q0[11];
-cry(1.5548195) q0[10],q0[11];
-ryy_140550806423536(0.87923119) q0[11],q0[12];
-cry(2.2148025) q0[11],q0[12];
-ryy_140550806423680(0.25497833) q0[12],q0[13];
-cry(0.34239013) q0[12],q0[13];
-ryy_140550806423824(1.8317449) q0[13],q0[14];
-cry(0.5892989) q0[13],q0[14];
-ryy_140550806423968(2.3085119) q0[14],q0[15];
-cry(0.47070868) q0[14],q0[15];
-ryy_140550806424112(0.1835844) q0[15],q0[16];
-cry(0.49918927) q0[15],q0[16];
-ryy_140550806424256(2.5852464) q0[16],q0[17];
-cry(2.6393552) q0[16],q0[17];
-ryy_140550806424400(3.007103) q0[17],q0[18];
-cry(1.9286061) q0[17],q0[18];
-ryy_140550806424544(0.86205336) q0[18],q0[19];
-cry(1.6912958) q0[18],q0[19];
-ryy_140550806424688(1.7427516) q0[19],q0[20];
-cry(1.7364919) q0[19],q0[20];
-ryy_140550806424832(2.883636) q0[20],q0[21];
-cry(2.7657171) q0[20],q0[21];
-ryy_140550806424976(2.3111593) q0[21],q0[22];
-cry(1.2834644) q0[21],q0[22];
-ryy_140550806425120(1.8717912) q0[22],q0[23];
-cry(1.3644594) q0[22],q0[23];
-ryy_140550806425264(2.4297677) q0[23],q0[24];
-cry(0.021138286) q0[23],q0[24];
-ryy_140550806425408(0.81819445) q0[24],q0[25];
-cry(1.168592) q0[24],q0[25];
-ryy_140550806422240(2.9462082) q0[25],q0[26];
-cry(2.8784172) q0[25],q0[26];
-ryy_140550806454432(1.4761479) q0[26],q0[27];
-cry(0.93140356) q0[26],q0[27];
-ryy_140550806454576(1.9117963) q0[27],q0[28];
-cry(2.796606) q0[27],q0[28];
-ryy_140550806454720(1.1028255) q0[28],q0[29];
-cry(0.79409665) q0[28],q0[29];
-ryy_140550806454864(0.081822548) q0[29],q0[30];
-cry(1.3175244) q0[29],q0[30];
-ryy_140550806455008(2.2783774) q0[30],q0[31];
-cry(2.3242541) q0[30],q0[31];
-ryy_140550806455152(1.7669605) q0[31],q0[32];
-cry(1.9721804) q0[31],q0[32];
-ryy_140550806455296(2.396472) q0[32],q0[33];
-cry(2.4273682) q0[32],q0[33];
-ryy_140550806455440(1.6868652) q0[33],q0[34];
-cry(2.6834462) q0[33],q0[34];
-ryy_140550806455584(1.687576) q0[34],q0[35];
-cry(2.8240297) q0[34],q0[35];
-ryy_140550806455728(1.5759073) q0[35],q0[36];
-cry(1.2107007) q0[35],q0[36];
-ryy_140550806455872(3.090887) q0[36],q0[37];
-cry(2.1022557) q0[36],q0[37];
-ryy_140550806456016(1.2484491) q0[37],q0[38];
-cry(0.47395905) q0[37],q0[38];
-ryy_140550806456160(3.0645268) q0[38],q0[39];
-cry(0.98600286) q0[38],q0[39];
-ryy_140550806456304(0.75387412) q0[39],q0[40];
-cry(1.7034876) q0[39],q0[40];
-ryy_140550806456448(1.4689818) q0[40],q0[41];
-cry(0.89737474) q0[40],q0[41];
-ryy_140550806456592(3.0171094) q0[41],q0[42];
-cry(3.1280732) q0[41],q0[42];
-ryy_140550806456736(2.4614235) q0[42],q0[43];
-cry(2.7139474) q0[42],q0[43];
-ryy_140550806456880(0.91314195) q0[43],q0[44];
-cry(2.3196772) q0[43],q0[44];
-ryy_140550806457024(1.2445238) q0[44],q0[45];
-cry(0.6896549) q0[44],q0[45];
-ryy_140550806457168(0.83610803) q0[45],q0[46];
-cry(1.7483491) q0[45],q0[46];
-ryy_140550806457312(2.5055157) q0[46],q0[47];
-cry(2.0056114) q0[46],q0[47];
-ryy_140550806457456(2.9206257) q0[47],q0[48];
-cry(0.2256003) q0[47],q0[48];
-ryy_140550806457600(0.9050598) q0[48],q0[49];
-cry(0.98293288) q0[48],q0[49];
-ryy_140550806457744(0.97503863) q0[49],q0[50];
-cry(1.7360581) q0[49],q0[50];
-ryy_140550806457888(0.69497181) q0[50],q0[51];
-cry(1.0783028) q0[50],q0[51];
-ryy_140550806458032(1.3869379) q0[51],q0[52];
-cry(1.2178088) q0[51],q0[52];
-ryy_140550806458176(2.1639597) q0[52],q0[53];
-cry(2.1128452) q0[52],q0[53];
-ryy_140550806454336(2.3511181) q0[53],q0[54];
-cry(3.0329509) q0[53],q0[54];
-ryy_140550806487200(0.993908) q0[54],q0[55];
-cry(1.6324399) q0[54],q0[55];
-ryy_140550806487344(1.4392017) q0[55],q0[56];
-cry(0.46454506) q0[55],q0[56];
-ryy_140550806487488(1.6849692) q0[56],q0[57];
-cry(2.7265037) q0[56],q0[57];
-ryy_140550806487632(2.0309222) q0[57],q0[58];
-cry(2.4307726) q0[57],q0[58];
-ryy_140550806487776(0.069909012) q0[58],q0[59];
-cry(1.6350682) q0[58],q0[59];
-ryy_140550806487920(2.0940663) q0[59],q0[60];
-cry(1.7282178) q0[59],q0[60];
-ryy_140550806488064(2.6110195) q0[60],q0[61];
-cry(2.4382039) q0[60],q0[61];
-ryy_140550806488208(2.7795264) q0[61],q0[62];
-cry(0.80762377) q0[61],q0[62];
-ryy_140550806488352(0.42212044) q0[62],q0[63];
-cry(0.28311283) q0[62],q0[63];
-ryy_140550806488496(1.290329) q0[63],q0[64];
-cry(2.7378601) q0[63],q0[64];
-ryy_140550806488640(1.8960284) q0[64],q0[65];
-cry(0.73377009) q0[64],q0[65];
-ryy_140550806488784(2.3448624) q0[65],q0[66];
-cry(0.13326233) q0[65],q0[66];
-ryy_140550806488928(0.88404709) q0[66],q0[67];
-cry(2.8214741) q0[66],q0[67];
-ryy_140550806489072(1.7733888) q0[67],q0[68];
-cry(2.1865766) q0[67],q0[68];
-ryy_140550806489216(0.62354522) q0[68],q0[69];
-cry(2.3278208) q0[68],q0[69];
-ryy_140550806489360(0.089574994) q0[69],q0[70];
-cry(2.1357786) q0[69],q0[70];
-ryy_140550806489504(2.3215753) q0[70],q0[71];
-cry(3.0189293) q0[70],q0[71];
-ryy_140550806489648(0.50446427) q0[71],q0[72];
-cry(0.49943854) q0[71],q0[72];
-ryy_140550806489792(0.10555114) q0[72],q0[73];
-cry(0.20267215) q0[72],q0[73];
-ryy_140550806489936(0.71167568) q0[73],q0[74];
-cry(2.1104041) q0[73],q0[74];
-ryy_140550806490080(2.9978716) q0[74],q0[75];
-cry(0.95871327) q0[74],q0[75];
-ryy_140550806490224(1.1056734) q0[75],q0[76];
-cry(0.19475831) q0[75],q0[76];
-ryy_140550806490368(2.1073558) q0[76],q0[77];
-cry(0.35672457) q0[76],q0[77];
-ryy_140550806490512(1.2874318) q0[77],q0[78];
-cry(2.6946802) q0[77],q0[78];
-ryy_140550806490656(2.0925866) q0[78],q0[79];
-cry(2.8768049) q0[78],q0[79];
-ryy_140550806490800(1.9914997) q0[79],q0[80];
-cry(2.5913408) q0[79],q0[80];
-ryy_140550806490944(0.04435206) q0[80],q0[81];
-cry(2.6312427) q0[80],q0[81];
-ryy_140550806487104(0.79783944) q0[81],q0[82];
-cry(0.73758693) q0[81],q0[82];
-ryy_140550806524064(1.8814768) q0[82],q0[83];
-cry(0.36906249) q0[82],q0[83];
-ryy_140550806524208(2.2819645) q0[83],q0[84];
-cry(1.8802496) q0[83],q0[84];
-ryy_140550806524352(0.091683167) q0[84],q0[85];
-cry(2.9867687) q0[84],q0[85];
-ryy_140550806524496(0.99562055) q0[85],q0[86];
-cry(0.51230638) q0[85],q0[86];
-ryy_140550806524640(2.2496514) q0[86],q0[87];
-cry(0.07776071) q0[86],q0[87];
-ryy_140550806524784(0.12910029) q0[87],q0[88];
-cry(0.042457645) q0[87],q0[88];
-ryy_140550806524928(0.62683199) q0[88],q0[89];
-cry(0.94548499) q0[88],q0[89];
-ryy_140550806525072(2.3729978) q0[89],q0[90];
-cry(3.0618313) q0[89],q0[90];
-ryy_140550806525216(1.5905382) q0[90],q0[91];
-cry(2.7069993) q0[90],q0[91];
-ryy_140550806525360(0.45361847) q0[91],q0[92];
-cry(0.1246649) q0[91],q0[92];
-ryy_140550806525504(2.0165216) q0[92],q0[93];
-cry(0.31214337) q0[92],q0[93];
-ryy_140550806525648(0.52622344) q0[93],q0[94];
-cry(0.34059618) q0[93],q0[94];
-ryy_140550806525792(1.4870986) q0[94],q0[95];
-cry(0.52040076) q0[94],q0[95];
-ryy_140550806525936(0.09420832) q0[95],q0[96];
-cry(1.1254456) q0[95],q0[96];
-ryy_140550806526080(0.91134539) q0[96],q0[97];
-cry(0.5803286) q0[96],q0[97];
-ryy_140550806526224(0.07492038) q0[97],q0[98];
-cry(0.027976737) q0[97],q0[98];
-ryy_140550806526368(0.83469392) q0[98],q0[99];
-cry(1.3338878) q0[98],q0[99];
-ryy_140550806526512(3.0174095) q0[99],q0[100];
-cry(0.44727951) q0[99],q0[100];
-ryy_140550806526656(1.908003) q0[100],q0[101];
-cry(2.886655) q0[100],q0[101];
-ryy_140550806526800(1.5094247) q0[101],q0[102];
-cry(0.17785795) q0[101],q0[102];
-ryy_140550806526944(1.9552772) q0[102],q0[103];
-cry(2.1068825) q0[102],q0[103];
-ryy_140550806527088(2.7582089) q0[103],q0[104];
-cry(0.070886561) q0[103],q0[104];
-ryy_140550806527232(0.1615129) q0[104],q0[105];
-cry(1.4818304) q0[104],q0[105];
-ryy_140550806527376(1.9451921) q0[105],q0[106];
-cry(1.9408401) q0[105],q0[106];
-ryy_140550806527520(0.36257372) q0[106],q0[107];
-cry(0.049933216) q0[106],q0[107];
-ryy_140550806527664(1.8477076) q0[107],q0[108];
-cry(1.7295302) q0[107],q0[108];
-ryy_140550806527808(1.2290716) q0[108],q0[109];
-cry(2.511158) q0[108],q0[109];
-ryy_140550806523968(0.76239574) q0[109],q0[110];
-cry(1.4893638) q0[109],q0[110];
-ryy_140550806556832(2.5080714) q0[110],q0[111];
-cry(0.48030559) q0[110],q0[111];
-ryy_140550806556976(2.848587) q0[111],q0[112];
-cry(0.66424365) q0[111],q0[112];
-ryy_140550806557120(2.1787028) q0[112],q0[113];
-cry(0.72940355) q0[112],q0[113];
-ryy_140550806557264(0.93933659) q0[113],q0[114];
-cry(1.2590889) q0[113],q0[114];
-ryy_140550806557408(1.7185185) q0[114],q0[115];
-cry(0.41432714) q0[114],q0[115];
-ryy_140550806557552(2.3830063) q0[115],q0[116];
-cry(2.9213572) q0[115],q0[116];
-ryy_140550806557696(2.7379318) q0[116],q0[117];
-cry(2.4742966) q0[116],q0[117];
-ryy_140550806557840(1.9888968) q0[117],q0[118];
-cry(2.4775405) q0[117],q0[118];
-ryy_140550806557984(3.0713961) q0[118],q0[119];
-cry(3.1289955) q0[118],q0[119];
-ryy_140550806558128(2.4128489) q0[119],q0[120];
-cry(1.4290234) q0[119],q0[120];
-ryy_140550806558272(2.2133837) q0[120],q0[121];
-cry(1.5598841) q0[120],q0[121];
-ryy_140550806558416(1.4742865) q0[121],q0[122];
-cry(1.1218582) q0[121],q0[122];
-ryy_140550806558560(2.0255271) q0[122],q0[123];
-cry(1.4759835) q0[122],q0[123];
-ryy_140550806558704(0.87650918) q0[123],q0[124];
-cry(1.4856134) q0[123],q0[124];
-ryy_140550806558848(0.32270029) q0[124],q0[125];
-cry(2.8011349) q0[124],q0[125];
-ryy_140550806558992(2.6359198) q0[125],q0[126];
-cry(2.1917672) q0[125],q0[126];
-ryy_140550806559136(2.1139281) q0[126],q0[127];
-cry(0.0073382902) q0[126],q0[127];
-ryy_140550806559280(0.84237726) q0[127],q0[128];
-cry(0.90157832) q0[127],q0[128];
-ryy_140550806559424(0.38412494) q0[128],q0[129];
-cry(3.0162919) q0[128],q0[129];
-ryy_140550806559568(0.55853378) q0[129],q0[130];
-cry(1.0261159) q0[129],q0[130];
-ryy_140550806559712(1.8152406) q0[130],q0[131];
-cry(0.88104817) q0[130],q0[131];
-ryy_140550806559856(2.9030946) q0[131],q0[132];
-cry(0.086044979) q0[131],q0[132];
-ryy_140550806560000(1.9836577) q0[132],q0[133];
-cry(2.960958) q0[132],q0[133];
-ryy_140550806560144(2.1847853) q0[133],q0[134];
-cry(1.2018538) q0[133],q0[134];
-ryy_140550806560288(0.45802535) q0[134],q0[135];
-cry(2.0220353) q0[134],q0[135];
-ryy_140550806560432(0.22162475) q0[135],q0[136];
-cry(0.14210795) q0[135],q0[136];
-ryy_140550806560576(1.895919) q0[136],q0[137];
-cry(1.1333522) q0[136],q0[137];
-ryy_140550806556736(1.4362731) q0[137],q0[138];
-cry(0.22563259) q0[137],q0[138];
-ryy_140550806593696(0.7003644) q0[138],q0[139];
-cry(1.0112468) q0[138],q0[139];
-ryy_140550806593840(1.4694396) q0[139],q0[140];
-cry(0.5171277) q0[139],q0[140];
-ryy_140550806593984(0.85274736) q0[140],q0[141];
-cry(0.016453111) q0[140],q0[141];
-ryy_140550806594128(0.48645472) q0[141],q0[142];
-cry(1.5996392) q0[141],q0[142];
-ryy_140550806594272(1.3132601) q0[142],q0[143];
-cry(2.1118328) q0[142],q0[143];
-ryy_140550806594416(2.4868542) q0[143],q0[144];
-cry(1.1277747) q0[143],q0[144];
-ryy_140550806594560(1.4270531) q0[144],q0[145];
-cry(1.4839156) q0[144],q0[145];
-ryy_140550806594704(1.8061905) q0[145],q0[146];
-cry(0.026651935) q0[145],q0[146];
-ryy_140550806594848(0.1879796) q0[146],q0[147];
-cry(1.7767191) q0[146],q0[147];
-ryy_140550806594992(0.73786294) q0[147],q0[148];
-cry(0.89295184) q0[147],q0[148];
-ryy_140550806595136(0.47742554) q0[148],q0[149];
-cry(1.9606639) q0[148],q0[149];
-ryy_140550806595280(2.0210653) q0[149],q0[150];
-cry(0.097190571) q0[149],q0[150];
-ryy_140550806595424(1.1713892) q0[150],q0[151];
-cry(2.7450529) q0[150],q0[151];
-ryy_140550806595568(0.8475717) q0[151],q0[152];
-cry(2.8760061) q0[151],q0[152];
-ryy_140550806595712(0.80378619) q0[152],q0[153];
-cry(2.3282282) q0[152],q0[153];
-ryy_140550806595856(0.26959586) q0[153],q0[154];
-cry(0.99423955) q0[153],q0[154];
-ryy_140550806596000(1.2947419) q0[154],q0[155];
-cry(2.0417374) q0[154],q0[155];
-ryy_140550806596144(0.10108241) q0[155],q0[156];
-cry(2.1182137) q0[155],q0[156];
-ryy_140550806596288(2.326777) q0[156],q0[157];
-cry(0.71106503) q0[156],q0[157];
-ryy_140550806596432(1.4580794) q0[157],q0[158];
-cry(1.9988112) q0[157],q0[158];
-ryy_140550806596576(1.691651) q0[158],q0[159];
-cry(1.9068936) q0[158],q0[159];
-ryy_140550806596720(2.2696822) q0[159],q0[160];
-cry(1.1429804) q0[159],q0[160];
-ryy_140550806596864(2.2644066) q0[160],q0[161];
-cry(0.87154329) q0[160],q0[161];
-ryy_140550806597008(1.3197938) q0[161],q0[162];
-cry(2.3105468) q0[161],q0[162];
-ryy_140550806597152(1.3165732) q0[162],q0[163];
-cry(2.5718642) q0[162],q0[163];
-ryy_140550806597296(1.934567) q0[163],q0[164];
-cry(2.3350319) q0[163],q0[164];
-ryy_140550806597440(2.403996) q0[164],q0[165];
-cry(0.57077236) q0[164],q0[165];
-ryy_140550806593600(0.13362985) q0[165],q0[166];
-cry(1.2693421) q0[165],q0[166];
-ryy_140550806626464(2.710656) q0[166],q0[167];
-cry(3.0634261) q0[166],q0[167];
-ryy_140550806626608(1.7842596) q0[167],q0[168];
-cry(1.0725349) q0[167],q0[168];
-ryy_140550806626896(1.7025804) q0[168],q0[169];
-cry(3.0496549) q0[168],q0[169];
-ryy_140550806627040(2.7891683) q0[169],q0[170];
-cry(1.9235607) q0[169],q0[170];
-ryy_140550806627184(2.8724826) q0[170],q0[171];
-cry(2.9148181) q0[170],q0[171];
-ryy_140550806627328(0.76999502) q0[171],q0[172];
-cry(0.68760711) q0[171],q0[172];
-ryy_140550806627472(1.7606676) q0[172],q0[173];
-cry(1.7267226) q0[172],q0[173];
-ryy_140550806627616(2.4825255) q0[173],q0[174];
-cry(0.51046555) q0[173],q0[174];
-ryy_140550806627760(0.27171571) q0[174],q0[175];
-cry(0.6041998) q0[174],q0[175];
-ryy_140550806627904(1.9940917) q0[175],q0[176];
-cry(2.9746756) q0[175],q0[176];
-ryy_140550806628048(0.96574929) q0[176],q0[177];
-cry(2.1115009) q0[176],q0[177];
-ryy_140550806628192(1.1839278) q0[177],q0[178];
-cry(1.6578443) q0[177],q0[178];
-ryy_140550806628336(0.48290499) q0[178],q0[179];
-cry(1.019119) q0[178],q0[179];
-ryy_140550806628480(2.0428957) q0[179],q0[180];
-cry(0.23895316) q0[179],q0[180];
-ryy_140550806628624(1.0737364) q0[180],q0[181];
-cry(1.7341315) q0[180],q0[181];
-ryy_140550806628768(0.72853883) q0[181],q0[182];
-cry(0.10724836) q0[181],q0[182];
-ryy_140550806628912(2.0294928) q0[182],q0[183];
-cry(2.1107295) q0[182],q0[183];
-ryy_140550806629056(0.68880536) q0[183],q0[184];
-cry(1.0248011) q0[183],q0[184];
-ryy_140550806629200(0.53211821) q0[184],q0[185];
-cry(2.9768041) q0[184],q0[185];
-ryy_140550806629344(1.2958097) q0[185],q0[186];
-cry(0.077532502) q0[185],q0[186];
-ryy_140550806629488(2.2534931) q0[186],q0[187];
-cry(2.9487948) q0[186],q0[187];
-ryy_140550806629632(0.14357148) q0[187],q0[188];
-cry(0.14689322) q0[187],q0[188];
-ryy_140550806629776(0.49606494) q0[188],q0[189];
-cry(2.1232292) q0[188],q0[189];
-ryy_140550806629920(1.1518938) q0[189],q0[190];
-cry(2.8827511) q0[189],q0[190];
-ryy_140550806630064(2.2568389) q0[190],q0[191];
-cry(0.66848145) q0[190],q0[191];
-ryy_140550806630208(1.5989233) q0[191],q0[192];
-cry(2.0705257) q0[191],q0[192];
-ryy_140550806626368(2.4428539) q0[192],q0[193];
-cry(2.2550221) q0[192],q0[193];
-ryy_140550806663328(2.6922271) q0[193],q0[194];
-cry(2.9296767) q0[193],q0[194];
-ryy_140550806663472(2.2720786) q0[194],q0[195];
-cry(0.67905863) q0[194],q0[195];
-ryy_140550806663616(2.2420432) q0[195],q0[196];
-cry(1.1443125) q0[195],q0[196];
-ryy_140550806663760(2.5245415) q0[196],q0[197];
-cry(1.4673111) q0[196],q0[197];
-ryy_140550806663904(0.33273558) q0[198],q0[199];
-cry(0.29036491) q0[198],q0[199];
-ryy_140550806664048(1.9473938) q0[199],q0[200];
-cry(0.48619112) q0[199],q0[200];
-ryy_140550806664192(1.4606068) q0[200],q0[201];
-cry(1.9767854) q0[200],q0[201];
-ryy_140550806664336(1.1393161) q0[201],q0[202];
-cry(2.8223214) q0[201],q0[202];
-ryy_140550806664480(2.4325036) q0[202],q0[203];
-cry(2.865773) q0[202],q0[203];
-ryy_140550806664624(0.62183805) q0[203],q0[204];
-cry(2.452743) q0[203],q0[204];
-ryy_140550806664768(0.66701395) q0[204],q0[205];
-cry(0.35102664) q0[204],q0[205];
-ryy_140550806664912(2.9040686) q0[205],q0[206];
-cry(2.6530831) q0[205],q0[206];
-ryy_140550806665056(0.99796253) q0[206],q0[207];
-cry(2.3215867) q0[206],q0[207];
-ryy_140550806665200(3.0439985) q0[207],q0[208];
-cry(0.13271698) q0[207],q0[208];
-ryy_140550806665344(0.20453229) q0[208],q0[209];
-cry(1.7608261) q0[208],q0[209];
-ryy_140550806665488(0.28573577) q0[209],q0[210];
-cry(3.0432448) q0[209],q0[210];
-ryy_140550806665632(3.0013781) q0[210],q0[211];
-cry(2.3537851) q0[210],q0[211];
-ryy_140550806665776(1.3638983) q0[211],q0[212];
-cry(2.956477) q0[211],q0[212];
-ryy_140550806665920(1.8381776) q0[212],q0[213];
-cry(1.8363689) q0[212],q0[213];
-ryy_140550806666064(1.0520842) q0[213],q0[214];
-cry(1.9781066) q0[213],q0[214];
-ryy_140550806666208(2.2171996) q0[214],q0[215];
-cry(0.21035087) q0[214],q0[215];
-ryy_140550806666352(0.73332277) q0[215],q0[216];
-cry(2.6896089) q0[215],q0[216];
-ryy_140550806666496(1.1613811) q0[216],q0[217];
-cry(0.188607) q0[216],q0[217];
-ryy_140550806666640(0.44149659) q0[217],q0[218];
-cry(2.8330727) q0[217],q0[218];
-ryy_140550806666784(2.0628831) q0[218],q0[219];
-cry(0.047848133) q0[218],q0[219];
-ryy_140550806666928(0.13676934) q0[219],q0[220];
-cry(2.3643591) q0[219],q0[220];
-ryy_140550806667072(0.45259893) q0[220],q0[221];
-cry(0.58753812) q0[220],q0[221];
-ryy_140550806663232(0.133906) q0[221],q0[222];
-cry(2.7452023) q0[221],q0[222];
-ryy_140550806700192(2.2103866) q0[222],q0[223];
-cry(1.518952) q0[222],q0[223];
-ryy_140550806700336(2.8527195) q0[223],q0[224];
-cry(1.5370937) q0[223],q0[224];
-ryy_140550806700480(1.5602037) q0[224],q0[225];
-cry(1.9486882) q0[224],q0[225];
-ryy_140550806700624(1.7224586) q0[225],q0[226];
-cry(0.84304915) q0[225],q0[226];
-ryy_140550806700768(1.0540938) q0[226],q0[227];
-cry(3.1321873) q0[226],q0[227];
-ryy_140550806700912(1.8408743) q0[227],q0[228];
-cry(1.1427881) q0[227],q0[228];
-ryy_140550806701056(1.4415374) q0[228],q0[229];
-cry(1.8257252) q0[228],q0[229];
-ryy_140550806701200(0.22872974) q0[229],q0[230];
-cry(2.9744315) q0[229],q0[230];
-ryy_140550806701344(0.79665055) q0[230],q0[231];
-cry(3.121605) q0[230],q0[231];
-ryy_140550806701488(2.6686223) q0[231],q0[232];
-cry(2.4922529) q0[231],q0[232];
-ryy_140550806701632(0.18312662) q0[232],q0[233];
-cry(3.0449491) q0[232],q0[233];
-ryy_140550806701776(1.0486101) q0[233],q0[234];
-cry(0.67522949) q0[233],q0[234];
-ryy_140550806701920(3.062795) q0[234],q0[235];
-cry(0.46695285) q0[234],q0[235];
-ryy_140550806702064(1.8013303) q0[235],q0[236];
-cry(0.0025340358) q0[235],q0[236];
-ryy_140550806702208(0.4156719) q0[236],q0[237];
-cry(1.294037) q0[236],q0[237];
-ryy_140550806702352(3.1134485) q0[237],q0[238];
-cry(2.5804842) q0[237],q0[238];
-ryy_140550806702496(1.1676215) q0[238],q0[239];
-cry(0.36360818) q0[238],q0[239];
-ryy_140550806702640(1.1638225) q0[239],q0[240];
-cry(0.96781637) q0[239],q0[240];
-ryy_140550806702784(0.94550818) q0[240],q0[241];
-cry(0.37587165) q0[240],q0[241];
-ryy_140550806702928(1.7749488) q0[241],q0[242];
-cry(1.8607274) q0[241],q0[242];
-ryy_140550806703072(1.7976703) q0[242],q0[243];
-cry(0.55299634) q0[242],q0[243];
-ryy_140550806703216(0.33502834) q0[243],q0[244];
-cry(2.9867231) q0[243],q0[244];
-ryy_140550806703360(0.53489282) q0[244],q0[245];
-cry(2.2290932) q0[244],q0[245];
-ryy_140550806703504(1.4773159) q0[245],q0[246];
-cry(2.8243451) q0[245],q0[246];
-ryy_140550806703648(1.977876) q0[246],q0[247];
-cry(2.2679457) q0[246],q0[247];
-ryy_140550806703792(1.6244161) q0[247],q0[248];
-cry(2.8073675) q0[247],q0[248];
-ryy_140550806703936(0.67364266) q0[248],q0[249];
-cry(1.7786554) q0[248],q0[249];
-ryy_140550806700096(1.0288547) q0[249],q0[250];
-cry(1.0559354) q0[249],q0[250];
-ryy_140550806737056(0.126036) q0[250],q0[251];
-cry(1.3964441) q0[250],q0[251];
-ryy_140550806737200(2.6528719) q0[251],q0[252];
-cry(1.2618853) q0[251],q0[252];
-ryy_140550806737344(0.083970227) q0[252],q0[253];
-cry(0.11156303) q0[252],q0[253];
-ryy_140550806737488(0.2913227) q0[253],q0[254];
-cry(1.5929965) q0[253],q0[254];
-ryy_140550806737632(2.273003) q0[254],q0[255];
-cry(2.9135141) q0[254],q0[255];
-ryy_140550806737776(0.75215466) q0[255],q0[256];
-cry(0.12703335) q0[255],q0[256];
-ryy_140550806737920(2.5400259) q0[256],q0[257];
-cry(2.7606541) q0[256],q0[257];
-ryy_140550806738064(2.5743366) q0[257],q0[258];
-cry(1.7965137) q0[257],q0[258];
-ryy_140550806738208(0.26618668) q0[258],q0[259];
-cry(3.130919) q0[258],q0[259];
-ryy_140550806738352(2.9024561) q0[259],q0[260];
-cry(2.4314905) q0[259],q0[260];
-ryy_140550806738496(2.0431522) q0[260],q0[261];
-cry(1.1277598) q0[260],q0[261];
-ryy_140550806738640(0.78599814) q0[261],q0[262];
-cry(0.12054012) q0[261],q0[262];
-ryy_140550806738784(0.41775525) q0[262],q0[263];
-cry(2.6127995) q0[262],q0[263];
-ryy_140550806738928(0.49429264) q0[263],q0[264];
-cry(0.014993279) q0[263],q0[264];
-ryy_140550806739072(0.95716613) q0[264],q0[265];
-cry(1.6308406) q0[264],q0[265];
-ryy_140550806739216(2.602969) q0[265],q0[266];
-cry(1.7141929) q0[265],q0[266];
-ryy_140550806739360(1.4175711) q0[266],q0[267];
-cry(0.8876484) q0[266],q0[267];
-ryy_140550806739504(1.8175744) q0[267],q0[268];
-cry(3.0183301) q0[267],q0[268];
-ryy_140550806739648(1.7215713) q0[268],q0[269];
-cry(0.3876607) q0[268],q0[269];
-ryy_140550806739792(1.8998785) q0[269],q0[270];
-cry(3.1227263) q0[269],q0[270];
-ryy_140550806739936(1.8278401) q0[270],q0[271];
-cry(2.8170187) q0[270],q0[271];
-ryy_140550806740080(2.1266798) q0[271],q0[272];
-cry(0.55533976) q0[271],q0[272];
-ryy_140550806740224(0.98287847) q0[272],q0[273];
-cry(1.3557023) q0[272],q0[273];
-ryy_140550806740368(1.290705) q0[273],q0[274];
-cry(2.0692811) q0[273],q0[274];
-ryy_140550806740512(0.4911615) q0[274],q0[275];
-cry(2.0755711) q0[274],q0[275];
-ryy_140550806740656(1.9690473) q0[275],q0[276];
-cry(1.8501057) q0[275],q0[276];
-ryy_140550806740800(2.7018364) q0[276],q0[277];
-cry(0.49957304) q0[276],q0[277];
-ryy_140550806736960(3.014635) q0[277],q0[278];
-cry(1.5485763) q0[277],q0[278];
-ryy_140550806773920(2.4491297) q0[278],q0[279];
-cry(0.22835627) q0[278],q0[279];
-ryy_140550806774064(2.9893835) q0[279],q0[280];
-cry(1.1622919) q0[279],q0[280];
-ryy_140550806774208(1.5144285) q0[280],q0[281];
-cry(0.85459028) q0[280],q0[281];
-ryy_140550806774352(2.1816535) q0[281],q0[282];
-cry(2.5598906) q0[281],q0[282];
-ryy_140550806774496(0.58251655) q0[282],q0[283];
-cry(1.9087049) q0[282],q0[283];
-ryy_140550806774640(2.0260262) q0[283],q0[284];
-cry(1.1909009) q0[283],q0[284];
-ryy_140550806774784(0.47486584) q0[284],q0[285];
-cry(1.2945423) q0[284],q0[285];
-ryy_140550806774928(0.34207756) q0[285],q0[286];
-cry(0.64095056) q0[285],q0[286];
-ryy_140550806775072(2.7188525) q0[286],q0[287];
-cry(0.78131391) q0[286],q0[287];
-ryy_140550806775216(2.2907264) q0[287],q0[288];
-cry(2.1790928) q0[287],q0[288];
-ryy_140550806775360(1.1338155) q0[288],q0[289];
-cry(1.4802779) q0[288],q0[289];
-ryy_140550806775504(2.7500438) q0[289],q0[290];
-cry(0.51791657) q0[289],q0[290];
-ryy_140550806775648(0.79458337) q0[290],q0[291];
-cry(2.0559903) q0[290],q0[291];
-ryy_140550806775792(2.4153699) q0[291],q0[292];
-cry(0.39762185) q0[291],q0[292];
-ryy_140550806775936(0.46355037) q0[292],q0[293];
-cry(0.52848128) q0[292],q0[293];
-ryy_140550806776080(2.1389488) q0[293],q0[294];
-cry(1.9093403) q0[293],q0[294];
-ryy_140550806776224(2.4011371) q0[294],q0[295];
-cry(3.0384551) q0[294],q0[295];
-ryy_140550806776368(2.4093038) q0[295],q0[296];
-cry(3.1128099) q0[295],q0[296];
-ryy_140550806776512(3.025599) q0[296],q0[297];
-cry(1.2396801) q0[296],q0[297];
-ryy_140550806776656(2.3242671) q0[297],q0[298];
-cry(2.6004974) q0[297],q0[298];
-ryy_140550806776800(1.0171159) q0[298],q0[299];
-cry(2.4813606) q0[298],q0[299];
-ryy_140550806776944(2.8178665) q0[299],q0[300];
-cry(2.1310793) q0[299],q0[300];
-ryy_140550806777088(1.9432444) q0[300],q0[301];
-cry(0.77950915) q0[300],q0[301];
-ryy_140550806777232(1.4899325) q0[301],q0[302];
-cry(2.8874697) q0[301],q0[302];
-ryy_140550806777376(0.76037068) q0[302],q0[303];
-cry(1.154533) q0[302],q0[303];
-ryy_140550806777520(2.8960004) q0[303],q0[304];
-cry(1.158332) q0[303],q0[304];
-ryy_140550806777664(2.9248568) q0[304],q0[305];
-cry(1.1017574) q0[304],q0[305];
-ryy_140550806773824(2.2560017) q0[305],q0[306];
-cry(0.21083717) q0[305],q0[306];
-ryy_140550806802592(2.8271186) q0[306],q0[307];
-cry(0.75142184) q0[306],q0[307];
-ryy_140550806802736(3.0123899) q0[307],q0[308];
-cry(1.4746894) q0[307],q0[308];
-ryy_140550806802880(2.3014624) q0[308],q0[309];
-cry(2.2856181) q0[308],q0[309];
-ryy_140550806803024(2.5915995) q0[309],q0[310];
-cry(1.0258222) q0[309],q0[310];
-ryy_140550806803168(2.639159) q0[310],q0[311];
-cry(0.10958196) q0[310],q0[311];
-ryy_140550806803312(0.99110532) q0[311],q0[312];
-cry(1.8250409) q0[311],q0[312];
-ryy_140550806803456(3.0493187) q0[312],q0[313];
-cry(2.1414267) q0[312],q0[313];
-ryy_140550806803600(0.38571546) q0[313],q0[314];
-cry(2.2712414) q0[313],q0[314];
-ryy_140550806803744(1.9906111) q0[314],q0[315];
-cry(1.3640124) q0[314],q0[315];
-ryy_140550806803888(1.3175988) q0[315],q0[316];
-cry(1.1685443) q0[315],q0[316];
-ryy_140550806804032(0.33988956) q0[316],q0[317];
-cry(1.0459958) q0[316],q0[317];
-ryy_140550806804176(2.1366933) q0[317],q0[318];
-cry(3.0176307) q0[317],q0[318];
-ryy_140550806804320(1.7841979) q0[318],q0[319];
-cry(2.4558346) q0[318],q0[319];
-ryy_140550806804464(1.1891351) q0[319],q0[320];
-cry(1.1563577) q0[319],q0[320];
-ryy_140550806804608(3.1357634) q0[320],q0[321];
-cry(1.1548362) q0[320],q0[321];
-ryy_140550806804752(2.120048) q0[321],q0[322];
-cry(0.3966768) q0[321],q0[322];
-ryy_140550806804896(0.94035925) q0[322],q0[323];
-cry(0.27822325) q0[322],q0[323];
-ryy_140550806805040(2.9530097) q0[323],q0[324];
-cry(2.5568255) q0[323],q0[324];
-ryy_140550806805184(0.003241074) q0[324],q0[325];
-cry(2.0120123) q0[324],q0[325];
-ryy_140550806805328(2.981046) q0[325],q0[326];
-cry(1.9867518) q0[325],q0[326];
-ryy_140550806805472(0.6406385) q0[326],q0[327];
-cry(0.67208898) q0[326],q0[327];
-ryy_140550806805616(1.0172884) q0[327],q0[328];
-cry(2.6730986) q0[327],q0[328];
-ryy_140550806805760(0.72877723) q0[328],q0[329];
-cry(0.56144342) q0[328],q0[329];
-ryy_140550806805904(1.8415651) q0[329],q0[330];
-cry(0.59710634) q0[329],q0[330];
-ryy_140550806806048(1.3914951) q0[330],q0[331];
-cry(1.7728278) q0[330],q0[331];
-ryy_140550806806192(1.4633712) q0[331],q0[332];
-cry(2.0917628) q0[331],q0[332];
-ryy_140550806806336(1.6466676) q0[332],q0[333];
-cry(1.8011218) q0[332],q0[333];
-ryy_140550806802496(1.897962) q0[333],q0[334];
-cry(1.4900081) q0[333],q0[334];
-ryy_140550806839456(1.8738225) q0[334],q0[335];
-cry(0.7137967) q0[334],q0[335];
-ryy_140550806839600(1.6998335) q0[335],q0[336];
-cry(2.5205692) q0[335],q0[336];
-ryy_140550806839744(1.5662328) q0[336],q0[337];
-cry(0.028047746) q0[336],q0[337];
-ryy_140550806839888(2.3547071) q0[337],q0[338];
-cry(1.223184) q0[337],q0[338];
-ryy_140550806840032(2.5930826) q0[338],q0[339];
-cry(1.7386181) q0[338],q0[339];
-ryy_140550806840176(1.7367507) q0[339],q0[340];
-cry(2.6859345) q0[339],q0[340];
-ryy_140550806840320(2.0614113) q0[340],q0[341];
-cry(0.52692462) q0[340],q0[341];
-ryy_140550806840464(0.9049402) q0[341],q0[342];
-cry(0.70143633) q0[341],q0[342];
-ryy_140550806840608(1.2158619) q0[342],q0[343];
-cry(1.0577811) q0[342],q0[343];
-ryy_140550806840752(0.097583798) q0[343],q0[344];
-cry(0.39755904) q0[343],q0[344];
-ryy_140550806840896(2.9997131) q0[344],q0[345];
-cry(2.0779683) q0[344],q0[345];
-ryy_140550806841040(0.99141132) q0[345],q0[346];
-cry(2.2190007) q0[345],q0[346];
-ryy_140550806841184(0.8010571) q0[346],q0[347];
-cry(3.0000299) q0[346],q0[347];
-ryy_140550806841328(1.2967798) q0[347],q0[348];
-cry(0.79621439) q0[347],q0[348];
-ryy_140550806841472(2.6560206) q0[348],q0[349];
-cry(2.4478774) q0[348],q0[349];
-ryy_140550806841616(1.2775981) q0[349],q0[350];
-cry(2.8986437) q0[349],q0[350];
-ryy_140550806841760(2.6569814) q0[350],q0[351];
-cry(1.5055322) q0[350],q0[351];
-ryy_140550806841904(1.6463791) q0[351],q0[352];
-cry(1.2894972) q0[351],q0[352];
-ryy_140550806842048(2.3600705) q0[352],q0[353];
-cry(0.68260739) q0[352],q0[353];
-ryy_140550806842192(0.042115548) q0[353],q0[354];
-cry(2.622108) q0[353],q0[354];
-ryy_140550806842336(1.456421) q0[354],q0[355];
-cry(1.3067919) q0[354],q0[355];
-ryy_140550806842480(1.4452136) q0[355],q0[356];
-cry(2.7513486) q0[355],q0[356];
-ryy_140550806842624(2.3070021) q0[356],q0[357];
-cry(0.32517295) q0[356],q0[357];
-ryy_140550806842768(1.9828802) q0[357],q0[358];
-cry(2.9748007) q0[357],q0[358];
-ryy_140550806842912(1.8891172) q0[358],q0[359];
-cry(0.59000005) q0[358],q0[359];
-ryy_140550806843056(1.5600679) q0[359],q0[360];
-cry(2.5720141) q0[359],q0[360];
-ryy_140550806843200(0.89156043) q0[360],q0[361];
-cry(1.5646954) q0[360],q0[361];
-ryy_140550806839360(0.89233858) q0[361],q0[362];
-cry(2.0095646) q0[361],q0[362];
-ryy_140550806876320(2.639685) q0[362],q0[363];
-cry(0.62598698) q0[362],q0[363];
-ryy_140550806876464(1.9805582) q0[363],q0[364];
-cry(2.4630314) q0[363],q0[364];
-ryy_140550806876608(2.4081113) q0[364],q0[365];
-cry(2.8789872) q0[364],q0[365];
-ryy_140550806876752(0.7126561) q0[365],q0[366];
-cry(3.0504667) q0[365],q0[366];
-ryy_140550806876896(1.8327372) q0[366],q0[367];
-cry(1.7319841) q0[366],q0[367];
-ryy_140550806877040(2.9868758) q0[367],q0[368];
-cry(2.1671028) q0[367],q0[368];
-ryy_140550806877184(2.9094645) q0[368],q0[369];
-cry(2.409443) q0[368],q0[369];
-ryy_140550806877328(2.161851) q0[369],q0[370];
-cry(2.7460597) q0[369],q0[370];
-ryy_140550806877472(1.4463808) q0[370],q0[371];
-cry(1.953753) q0[370],q0[371];
-ryy_140550806877616(0.99592266) q0[371],q0[372];
-cry(0.4066119) q0[371],q0[372];
-ryy_140550806877760(0.70579958) q0[372],q0[373];
-cry(0.42452682) q0[372],q0[373];
-ryy_140550806877904(2.9021364) q0[373],q0[374];
-cry(2.6638595) q0[373],q0[374];
-ryy_140550806878048(2.5406431) q0[374],q0[375];
-cry(3.0453281) q0[374],q0[375];
-ryy_140550806878192(1.0037842) q0[375],q0[376];
-cry(0.88865319) q0[375],q0[376];
-ryy_140550806878336(1.7687061) q0[376],q0[377];
-cry(2.9242506) q0[376],q0[377];
-ryy_140550806878480(3.0421964) q0[377],q0[378];
-cry(0.39372266) q0[377],q0[378];
-ryy_140550806878624(2.0054963) q0[378],q0[379];
-cry(3.0414182) q0[378],q0[379];
-ryy_140550806878768(2.7787743) q0[379],q0[380];
-cry(2.1989596) q0[379],q0[380];
-ryy_140550806878912(1.9924883) q0[380],q0[381];
-cry(0.080012974) q0[380],q0[381];
-ryy_140550806879056(1.1425212) q0[381],q0[382];
-cry(2.4559129) q0[381],q0[382];
-ryy_140550806879200(2.9304298) q0[382],q0[383];
-cry(1.9664594) q0[382],q0[383];
-ryy_140550806879344(1.8963799) q0[383],q0[384];
-cry(2.8803144) q0[383],q0[384];
-ryy_140550806879488(1.2900985) q0[384],q0[385];
-cry(2.8677575) q0[384],q0[385];
-ryy_140550806879632(1.897802) q0[385],q0[386];
-cry(3.1107993) q0[385],q0[386];
-ryy_140550806879776(2.3851696) q0[386],q0[387];
-cry(2.9657617) q0[386],q0[387];
-ryy_140550806879920(1.5462128) q0[387],q0[388];
-cry(1.885616) q0[387],q0[388];
-ryy_140550806880064(2.0107137) q0[388],q0[389];
-cry(0.89228435) q0[388],q0[389];
-ryy_140550806876224(2.7828087) q0[389],q0[390];
-cry(0.38457467) q0[389],q0[390];
-ryy_140550806909088(1.3099802) q0[390],q0[391];
-cry(1.1721913) q0[390],q0[391];
-ryy_140550806909232(1.5432147) q0[391],q0[392];
-cry(0.48791601) q0[391],q0[392];
-ryy_140550806909376(1.2578602) q0[392],q0[393];
-cry(0.25892529) q0[392],q0[393];
-ryy_140550806909520(1.5400429) q0[393],q0[394];
-cry(0.90221442) q0[393],q0[394];
-h q0[0];
-cswap q0[0],q0[1],q0[198];
-cswap q0[0],q0[2],q0[199];
-cswap q0[0],q0[3],q0[200];
-cswap q0[0],q0[4],q0[201];
-cswap q0[0],q0[5],q0[202];
-cswap q0[0],q0[6],q0[203];
-cswap q0[0],q0[7],q0[204];
-cswap q0[0],q0[8],q0[205];
-cswap q0[0],q0[9],q0[206];
-cswap q0[0],q0[10],q0[207];
-cswap q0[0],q0[11],q0[208];
-cswap q0[0],q0[12],q0[209];
-cswap q0[0],q0[13],q0[210];
-cswap q0[0],q0[14],q0[211];
-cswap q0[0],q0[15],q0[212];
-cswap q0[0],q0[16],q0[213];
-cswap q0[0],q0[17],q0[214];
-cswap q0[0],q0[18],q0[215];
-cswap q0[0],q0[19],q0[216];
-cswap q0[0],q0[20],q0[217];
-cswap q0[0],q0[21],q0[218];
-cswap q0[0],q0[22],q0[219];
-cswap q0[0],q0[23],q0[220];
-cswap q0[0],q0[24],q0[221];
-cswap q0[0],q0[25],q0[222];
-cswap q0[0],q0[26],q0[223];
-cswap q0[0],q0[27],q0[224];
-cswap q0[0],q0[28],q0[225];
-cswap q0[0],q0[29],q0[226];
-cswap q0[0],q0[30],q0[227];
-cswap q0[0],q0[31],q0[228];
-cswap q0[0],q0[32],q0[229];
-cswap q0[0],q0[33],q0[230];
-cswap q0[0],q0[34],q0[231];
-cswap q0[0],q0[35],q0[232];
-cswap q0[0],q0[36],q0[233];
-cswap q0[0],q0[37],q0[234];
-cswap q0[0],q0[38],q0[235];
-cswap q0[0],q0[39],q0[236];
-cswap q0[0],q0[40],q0[237];
-cswap q0[0],q0[41],q0[238];
-cswap q0[0],q0[42],q0[239];
-cswap q0[0],q0[43],q0[240];
-cswap q0[0],q0[44],q0[241];
-cswap q0[0],q0[45],q0[242];
-cswap q0[0],q0[46],q0[243];
-cswap q0[0],q0[47],q0[244];
-cswap q0[0],q0[48],q0[245];
-cswap q0[0],q0[49],q0[246];
-cswap q0[0],q0[50],q0[247];
-cswap q0[0],q0[51],q0[248];
-cswap q0[0],q0[52],q0[249];
-cswap q0[0],q0[53],q0[250];
-cswap q0[0],q0[54],q0[251];
-cswap q0[0],q0[55],q0[252];
-cswap q0[0],q0[56],q0[253];
-cswap q0[0],q0[57],q0[254];
-cswap q0[0],q0[58],q0[255];
-cswap q0[0],q0[59],q0[256];
-cswap q0[0],q0[60],q0[257];
-cswap q0[0],q0[61],q0[258];
-cswap q0[0],q0[62],q0[259];
-cswap q0[0],q0[63],q0[260];
-cswap q0[0],q0[64],q0[261];
-cswap q0[0],q0[65],q0[262];
-cswap q0[0],q0[66],q0[263];
-cswap q0[0],q0[67],q0[264];
-cswap q0[0],q0[68],q0[265];
-cswap q0[0],q0[69],q0[266];
-cswap q0[0],q0[70],q0[267];
-cswap q0[0],q0[71],q0[268];
-cswap q0[0],q0[72],q0[269];
-cswap q0[0],q0[73],q0[270];
-cswap q0[0],q0[74],q0[271];
-cswap q0[0],q0[75],q0[272];
-cswap q0[0],q0[76],q0[273];
-cswap q0[0],q0[77],q0[274];
-cswap q0[0],q0[78],q0[275];
-cswap q0[0],q0[79],q0[276];
-cswap q0[0],q0[80],q0[277];
-cswap q0[0],q0[81],q0[278];
-cswap q0[0],q0[82],q0[279];
-cswap q0[0],q0[83],q0[280];
-cswap q0[0],q0[84],q0[281];
-cswap q0[0],q0[85],q0[282];
-cswap q0[0],q0[86],q0[283];
-cswap q0[0],q0[87],q0[284];
-cswap q0[0],q0[88],q0[285];
-cswap q0[0],q0[89],q0[286];
-cswap q0[0],q0[90],q0[287];
-cswap q0[0],q0[91],q0[288];
-cswap q0[0],q0[92],q0[289];
-cswap q0[0],q0[93],q0[290];
-cswap q0[0],q0[94],q0[291];
-cswap q0[0],q0[95],q0[292];
-cswap q0[0],q0[96],q0[293];
-cswap q0[0],q0[97],q0[294];
-cswap q0[0],q0[98],q0[295];
-cswap q0[0],q0[99],q0[296];
-cswap q0[0],q0[100],q0[297];
-cswap q0[0],q0[101],q0[298];
-cswap q0[0],q0[102],q0[299];
-cswap q0[0],q0[103],q0[300];
-cswap q0[0],q0[104],q0[301];
-cswap q0[0],q0[105],q0[302];
-cswap q0[0],q0[106],q0[303];
-cswap q0[0],q0[107],q0[304];
-cswap q0[0],q0[108],q0[305];
-cswap q0[0],q0[109],q0[306];
-cswap q0[0],q0[110],q0[307];
-cswap q0[0],q0[111],q0[308];
-cswap q0[0],q0[112],q0[309];
-cswap q0[0],q0[113],q0[310];
-cswap q0[0],q0[114],q0[311];
-cswap q0[0],q0[115],q0[312];
-cswap q0[0],q0[116],q0[313];
-cswap q0[0],q0[117],q0[314];
-cswap q0[0],q0[118],q0[315];
-cswap q0[0],q0[119],q0[316];
-cswap q0[0],q0[120],q0[317];
-cswap q0[0],q0[121],q0[318];
-cswap q0[0],q0[122],q0[319];
-cswap q0[0],q0[123],q0[320];
-cswap q0[0],q0[124],q0[321];
-cswap q0[0],q0[125],q0[322];
-cswap q0[0],q0[126],q0[323];
-cswap q0[0],q0[127],q0[324];
-cswap q0[0],q0[128],q0[325];
-cswap q0[0],q0[129],q0[326];
-cswap q0[0],q0[130],q0[327];
-cswap q0[0],q0[131],q0[328];
-cswap q0[0],q0[132],q0[329];
-cswap q0[0],q0[133],q0[330];
-cswap q0[0],q0[134],q0[331];
-cswap q0[0],q0[135],q0[332];
-cswap q0[0],q0[136],q0[333];
-cswap q0[0],q0[137],q0[334];
-cswap q0[0],q0[138],q0[335];
-cswap q0[0],q0[139],q0[336];
-cswap q0[0],q0[140],q0[337];
-cswap q0[0],q0[141],q0[338];
-cswap q0[0],q0[142],q0[339];
-cswap q0[0],q0[143],q0[340];
-cswap q0[0],q0[144],q0[341];
-cswap q0[0],q0[145],q0[342];
-cswap q0[0],q0[146],q0[343];
-cswap q0[0],q0[147],q0[344];
-cswap q0[0],q0[148],q0[345];
-cswap q0[0],q0[149],q0[346];
-cswap q0[0],q0[150],q0[347];
-cswap q0[0],q0[151],q0[348];
-cswap q0[0],q0[152],q0[349];
-cswap q0[0],q0[153],q0[350];
-cswap q0[0],q0[154],q0[351];
-cswap q0[0],q0[155],q0[352];
-cswap q0[0],q0[156],q0[353];
-cswap q0[0],q0[157],q0[354];
-cswap q0[0],q0[158],q0[355];
-cswap q0[0],q0[159],q0[356];
-cswap q0[0],q0[160],q0[357];
-cswap q0[0],q0[161],q0[358];
-cswap q0[0],q0[162],q0[359];
-cswap q0[0],q0[163],q0[360];
-cswap q0[0],q0[164],q0[361];
-cswap q0[0],q0[165],q0[362];
-cswap q0[0],q0[166],q0[363];
-cswap q0[0],q0[167],q0[364];
-cswap q0[0],q0[168],q0[365];
-cswap q0[0],q0[169],q0[366];
-cswap q0[0],q0[170],q0[367];
-cswap q0[0],q0[171],q0[368];
-cswap q0[0],q0[172],q0[369];
-cswap q0[0],q0[173],q0[370];
-cswap q0[0],q0[174],q0[371];
-cswap q0[0],q0[175],q0[372];
-cswap q0[0],q0[176],q0[373];
-cswap q0[0],q0[177],q0[374];
-cswap q0[0],q0[178],q0[375];
-cswap q0[0],q0[179],q0[376];
-cswap q0[0],q0[180],q0[377];
-cswap q0[0],q0[181],q0[378];
-cswap q0[0],q0[182],q0[379];
-cswap q0[0],q0[183],q0[380];
-cswap q0[0],q0[184],q0[381];
-cswap q0[0],q0[185],q0[382];
-cswap q0[0],q0[186],q0[383];
-cswap q0[0],q0[187],q0[384];
-cswap q0[0],q0[188],q0[385];
-cswap q0[0],q0[189],q0[386];
-cswap q0[0],q0[190],q0[387];
-cswap q0[0],q0[191],q0[388];
-cswap q0[0],q0[192],q0[389];
-cswap q0[0],q0[193],q0[390];
-cswap q0[0],q0[194],q0[391];
-cswap q0[0],q0[195],q0[392];
-cswap q0[0],q0[196],q0[393];
-cswap q0[0],q0[197],q0[394];
-h q0[0];
-measure q0[198] -> c0[0];
-measure q0[199] -> c0[1];
-measure q0[200] -> c0[2];
-measure q0[201] -> c0[3];
-measure q0[202] -> c0[4];
-measure q0[203] -> c0[5];
-measure q0[204] -> c0[6];
-measure q0[205] -> c0[7];
-measure q0[206] -> c0[8];
-measure q0[207] -> c0[9];
-measure q0[208] -> c0[10];
-measure q0[209] -> c0[11];
-measure q0[210] -> c0[12];
-measure q0[211] -> c0[13];
-measure q0[212] -> c0[14];
-measure q0[213] -> c0[15];
-measure q0[214] -> c0[16];
-measure q0[215] -> c0[17];
-measure q0[216] -> c0[18];
-measure q0[217] -> c0[19];
-measure q0[218] -> c0[20];
-measure q0[219] -> c0[21];
-measure q0[220] -> c0[22];
-measure q0[221] -> c0[23];
-measure q0[222] -> c0[24];
-measure q0[223] -> c0[25];
-measure q0[224] -> c0[26];
-measure q0[225] -> c0[27];
-measure q0[226] -> c0[28];
-measure q0[227] -> c0[29];
-measure q0[228] -> c0[30];
-measure q0[229] -> c0[31];
-measure q0[230] -> c0[32];
-measure q0[231] -> c0[33];
-measure q0[232] -> c0[34];
-measure q0[233] -> c0[35];
-measure q0[234] -> c0[36];
-measure q0[235] -> c0[37];
-measure q0[236] -> c0[38];
-measure q0[237] -> c0[39];
-measure q0[238] -> c0[40];
-measure q0[239] -> c0[41];
-measure q0[240] -> c0[42];
-measure q0[241] -> c0[43];
-measure q0[242] -> c0[44];
-measure q0[243] -> c0[45];
-measure q0[244] -> c0[46];
-measure q0[245] -> c0[47];
-measure q0[246] -> c0[48];
-measure q0[247] -> c0[49];
-measure q0[248] -> c0[50];
-measure q0[249] -> c0[51];
-measure q0[250] -> c0[52];
-measure q0[251] -> c0[53];
-measure q0[252] -> c0[54];
-measure q0[253] -> c0[55];
-measure q0[254] -> c0[56];
-measure q0[255] -> c0[57];
-measure q0[256] -> c0[58];
-measure q0[257] -> c0[59];
-measure q0[258] -> c0[60];
-measure q0[259] -> c0[61];
-measure q0[260] -> c0[62];
-measure q0[261] -> c0[63];
-measure q0[262] -> c0[64];
-measure q0[263] -> c0[65];
-measure q0[264] -> c0[66];
-measure q0[265] -> c0[67];
-measure q0[266] -> c0[68];
-measure q0[267] -> c0[69];
-measure q0[268] -> c0[70];
-measure q0[269] -> c0[71];
-measure q0[270] -> c0[72];
-measure q0[271] -> c0[73];
-measure q0[272] -> c0[74];
-measure q0[273] -> c0[75];
-measure q0[274] -> c0[76];
-measure q0[275] -> c0[77];
-measure q0[276] -> c0[78];
-measure q0[277] -> c0[79];
-measure q0[278] -> c0[80];
-measure q0[279] -> c0[81];
-measure q0[280] -> c0[82];
-measure q0[281] -> c0[83];
-measure q0[282] -> c0[84];
-measure q0[283] -> c0[85];
-measure q0[284] -> c0[86];
-measure q0[285] -> c0[87];
-measure q0[286] -> c0[88];
-measure q0[287] -> c0[89];
-measure q0[288] -> c0[90];
-measure q0[289] -> c0[91];
-measure q0[290] -> c0[92];
-measure q0[291] -> c0[93];
-measure q0[292] -> c0[94];
-measure q0[293] -> c0[95];
-measure q0[294] -> c0[96];
-measure q0[295] -> c0[97];
-measure q0[296] -> c0[98];
-measure q0[297] -> c0[99];
-measure q0[298] -> c0[100];
-measure q0[299] -> c0[101];
-measure q0[300] -> c0[102];
-measure q0[301] -> c0[103];
-measure q0[302] -> c0[104];
-measure q0[303] -> c0[105];
-measure q0[304] -> c0[106];
-measure q0[305] -> c0[107];
-measure q0[306] -> c0[108];
-measure q0[307] -> c0[109];
-measure q0[308] -> c0[110];
-measure q0[309] -> c0[111];
-measure q0[310] -> c0[112];
-measure q0[311] -> c0[113];
-measure q0[312] -> c0[114];
-measure q0[313] -> c0[115];
-measure q0[314] -> c0[116];
-measure q0[315] -> c0[117];
-measure q0[316] -> c0[118];
-measure q0[317] -> c0[119];
-measure q0[318] -> c0[120];
-measure q0[319] -> c0[121];
-measure q0[320] -> c0[122];
-measure q0[321] -> c0[123];
-measure q0[322] -> c0[124];
-measure q0[323] -> c0[125];
-measure q0[324] -> c0[126];
-measure q0[325] -> c0[127];
-measure q0[326] -> c0[128];
-measure q0[327] -> c0[129];
-measure q0[328] -> c0[130];
-measure q0[329] -> c0[131];
-measure q0[330] -> c0[132];
-measure q0[331] -> c0[133];
-measure q0[332] -> c0[134];
-measure q0[333] -> c0[135];
-measure q0[334] -> c0[136];
-measure q0[335] -> c0[137];
-measure q0[336] -> c0[138];
-measure q0[337] -> c0[139];
-measure q0[338] -> c0[140];
-measure q0[339] -> c0[141];
-measure q0[340] -> c0[142];
-measure q0[341] -> c0[143];
-measure q0[342] -> c0[144];
-measure q0[343] -> c0[145];
-measure q0[344] -> c0[146];
-measure q0[345] -> c0[147];
-measure q0[346] -> c0[148];
-measure q0[347] -> c0[149];
-measure q0[348] -> c0[150];
-measure q0[349] -> c0[151];
-measure q0[350] -> c0[152];
-measure q0[351] -> c0[153];
-measure q0[352] -> c0[154];
-measure q0[353] -> c0[155];
-measure q0[354] -> c0[156];
-measure q0[355] -> c0[157];
-measure q0[356] -> c0[158];
-measure q0[357] -> c0[159];
-measure q0[358] -> c0[160];
-measure q0[359] -> c0[161];
-measure q0[360] -> c0[162];
-measure q0[361] -> c0[163];
-measure q0[362] -> c0[164];
-measure q0[363] -> c0[165];
-measure q0[364] -> c0[166];
-measure q0[365] -> c0[167];
-measure q0[366] -> c0[168];
-measure q0[367] -> c0[169];
-measure q0[368] -> c0[170];
-measure q0[369] -> c0[171];
-measure q0[370] -> c0[172];
-measure q0[371] -> c0[173];
-measure q0[372] -> c0[174];
-measure q0[373] -> c0[175];
-measure q0[374] -> c0[176];
-measure q0[375] -> c0[177];
-measure q0[376] -> c0[178];
-measure q0[377] -> c0[179];
-measure q0[378] -> c0[180];
-measure q0[379] -> c0[181];
-measure q0[380] -> c0[182];
-measure q0[381] -> c0[183];
-measure q0[382] -> c0[184];
-measure q0[383] -> c0[185];
-measure q0[384] -> c0[186];
-measure q0[385] -> c0[187];
-measure q0[386] -> c0[188];
-measure q0[387] -> c0[189];
-measure q0[388] -> c0[190];
-measure q0[389] -> c0[191];
-measure q0[390] -> c0[192];
-measure q0[391] -> c0[193];
-measure q0[392] -> c0[194];
-measure q0[393] -> c0[195];
-measure q0[394] -> c0[196];
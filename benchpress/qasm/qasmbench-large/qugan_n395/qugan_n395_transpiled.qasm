@@ -1,11205 +0,0 @@
-OPENQASM 2.0;
-include "qelib1.inc";
-qreg q0[395];
-creg c0[197];
-rz(pi/2) q0[0];
-sx q0[0];
-rz(pi/2) q0[0];
-sx q0[1];
-rz(3.1323971) q0[1];
-sx q0[2];
-rz(1.2469352) q0[2];
-cx q0[1],q0[2];
-rz(0.94852206) q0[2];
-cx q0[1],q0[2];
-rz(-pi) q0[1];
-sx q0[1];
-rz(-pi) q0[1];
-rz(-2.3397177) q0[2];
-sx q0[2];
-rz(-pi) q0[2];
-cx q0[1],q0[2];
-sx q0[2];
-rz(2.3397177) q0[2];
-sx q0[2];
-rz(-pi) q0[2];
-cx q0[1],q0[2];
-sx q0[2];
-sx q0[3];
-rz(2.7508252) q0[3];
-cx q0[2],q0[3];
-rz(2.8716116) q0[3];
-cx q0[2],q0[3];
-rz(-pi) q0[2];
-sx q0[2];
-rz(-pi) q0[2];
-rz(-2.0265134) q0[3];
-sx q0[3];
-rz(-pi) q0[3];
-cx q0[2],q0[3];
-sx q0[3];
-rz(2.0265134) q0[3];
-sx q0[3];
-rz(-pi) q0[3];
-cx q0[2],q0[3];
-sx q0[3];
-sx q0[4];
-rz(1.5148666) q0[4];
-cx q0[3],q0[4];
-rz(0.73204575) q0[4];
-cx q0[3],q0[4];
-rz(-pi) q0[3];
-sx q0[3];
-rz(-pi) q0[3];
-rz(-1.7200185) q0[4];
-sx q0[4];
-rz(-pi) q0[4];
-cx q0[3],q0[4];
-sx q0[4];
-rz(1.7200185) q0[4];
-sx q0[4];
-rz(-pi) q0[4];
-cx q0[3],q0[4];
-sx q0[4];
-sx q0[5];
-rz(2.7190479) q0[5];
-cx q0[4],q0[5];
-rz(1.4107561) q0[5];
-cx q0[4],q0[5];
-rz(-pi) q0[4];
-sx q0[4];
-rz(-pi) q0[4];
-rz(-2.7710825) q0[5];
-sx q0[5];
-rz(-pi) q0[5];
-cx q0[4],q0[5];
-sx q0[5];
-rz(2.7710825) q0[5];
-sx q0[5];
-rz(-pi) q0[5];
-cx q0[4],q0[5];
-sx q0[5];
-sx q0[6];
-rz(1.1150559) q0[6];
-cx q0[5],q0[6];
-rz(1.218704) q0[6];
-cx q0[5],q0[6];
-rz(-pi) q0[5];
-sx q0[5];
-rz(-pi) q0[5];
-rz(-2.621862) q0[6];
-sx q0[6];
-rz(-pi) q0[6];
-cx q0[5],q0[6];
-sx q0[6];
-rz(2.621862) q0[6];
-sx q0[6];
-rz(-pi) q0[6];
-cx q0[5],q0[6];
-sx q0[6];
-sx q0[7];
-rz(2.497822) q0[7];
-cx q0[6],q0[7];
-rz(0.53173013) q0[7];
-cx q0[6],q0[7];
-rz(-pi) q0[6];
-sx q0[6];
-rz(-pi) q0[6];
-rz(-2.7256787) q0[7];
-sx q0[7];
-rz(-pi) q0[7];
-cx q0[6],q0[7];
-sx q0[7];
-rz(2.7256787) q0[7];
-sx q0[7];
-rz(-pi) q0[7];
-cx q0[6],q0[7];
-sx q0[7];
-sx q0[8];
-rz(2.677804) q0[8];
-cx q0[7],q0[8];
-rz(3.0054813) q0[8];
-cx q0[7],q0[8];
-rz(-pi) q0[7];
-sx q0[7];
-rz(-pi) q0[7];
-rz(-1.8234547) q0[8];
-sx q0[8];
-rz(-pi) q0[8];
-cx q0[7],q0[8];
-sx q0[8];
-rz(1.8234547) q0[8];
-sx q0[8];
-rz(-pi) q0[8];
-cx q0[7],q0[8];
-sx q0[8];
-sx q0[9];
-rz(2.921632) q0[9];
-cx q0[8],q0[9];
-rz(2.0452639) q0[9];
-cx q0[8],q0[9];
-rz(-pi) q0[8];
-sx q0[8];
-rz(-pi) q0[8];
-rz(-2.5172249) q0[9];
-sx q0[9];
-rz(-pi) q0[9];
-cx q0[8],q0[9];
-sx q0[9];
-rz(2.5172249) q0[9];
-sx q0[9];
-rz(-pi) q0[9];
-cx q0[8],q0[9];
-sx q0[9];
-sx q0[10];
-rz(2.1257982) q0[10];
-cx q0[9],q0[10];
-rz(2.8863362) q0[10];
-cx q0[9],q0[10];
-rz(-1.7478033) q0[10];
-sx q0[10];
-rz(-pi) q0[10];
-rz(-pi) q0[9];
-sx q0[9];
-rz(-pi) q0[9];
-cx q0[9],q0[10];
-sx q0[10];
-rz(1.7478033) q0[10];
-sx q0[10];
-rz(-pi) q0[10];
-cx q0[9],q0[10];
-sx q0[10];
-sx q0[11];
-rz(0.85139694) q0[11];
-cx q0[10],q0[11];
-rz(0.15647598) q0[11];
-cx q0[10],q0[11];
-rz(-pi) q0[10];
-sx q0[10];
-rz(-pi) q0[10];
-rz(-2.3641829) q0[11];
-sx q0[11];
-rz(-pi) q0[11];
-cx q0[10],q0[11];
-sx q0[11];
-rz(2.3641829) q0[11];
-sx q0[11];
-rz(-pi) q0[11];
-cx q0[10],q0[11];
-sx q0[11];
-sx q0[12];
-rz(2.4976471) q0[12];
-cx q0[11],q0[12];
-rz(0.87923119) q0[12];
-cx q0[11],q0[12];
-rz(-pi) q0[11];
-sx q0[11];
-rz(-pi) q0[11];
-rz(-2.0341914) q0[12];
-sx q0[12];
-rz(-pi) q0[12];
-cx q0[11],q0[12];
-sx q0[12];
-rz(2.0341914) q0[12];
-sx q0[12];
-rz(-pi) q0[12];
-cx q0[11],q0[12];
-sx q0[12];
-sx q0[13];
-rz(1.9690956) q0[13];
-cx q0[12],q0[13];
-rz(0.25497833) q0[13];
-cx q0[12],q0[13];
-rz(-pi) q0[12];
-sx q0[12];
-rz(-pi) q0[12];
-rz(-2.9703976) q0[13];
-sx q0[13];
-rz(-pi) q0[13];
-cx q0[12],q0[13];
-sx q0[13];
-rz(2.9703976) q0[13];
-sx q0[13];
-rz(-pi) q0[13];
-cx q0[12],q0[13];
-sx q0[13];
-sx q0[14];
-rz(0.29398624) q0[14];
-cx q0[13],q0[14];
-rz(1.8317449) q0[14];
-cx q0[13],q0[14];
-rz(-pi) q0[13];
-sx q0[13];
-rz(-pi) q0[13];
-rz(-2.8469432) q0[14];
-sx q0[14];
-rz(-pi) q0[14];
-cx q0[13],q0[14];
-sx q0[14];
-rz(2.8469432) q0[14];
-sx q0[14];
-rz(-pi) q0[14];
-cx q0[13],q0[14];
-sx q0[14];
-sx q0[15];
-rz(1.5015092) q0[15];
-cx q0[14],q0[15];
-rz(2.3085119) q0[15];
-cx q0[14],q0[15];
-rz(-pi) q0[14];
-sx q0[14];
-rz(-pi) q0[14];
-rz(-2.9062383) q0[15];
-sx q0[15];
-rz(-pi) q0[15];
-cx q0[14],q0[15];
-sx q0[15];
-rz(2.9062383) q0[15];
-sx q0[15];
-rz(-pi) q0[15];
-cx q0[14],q0[15];
-sx q0[15];
-sx q0[16];
-rz(1.8139391) q0[16];
-cx q0[15],q0[16];
-rz(0.1835844) q0[16];
-cx q0[15],q0[16];
-rz(-pi) q0[15];
-sx q0[15];
-rz(-pi) q0[15];
-rz(-2.891998) q0[16];
-sx q0[16];
-rz(-pi) q0[16];
-cx q0[15],q0[16];
-sx q0[16];
-rz(2.891998) q0[16];
-sx q0[16];
-rz(-pi) q0[16];
-cx q0[15],q0[16];
-sx q0[16];
-sx q0[17];
-rz(1.0351294) q0[17];
-cx q0[16],q0[17];
-rz(2.5852464) q0[17];
-cx q0[16],q0[17];
-rz(-pi) q0[16];
-sx q0[16];
-rz(-pi) q0[16];
-rz(-1.8219151) q0[17];
-sx q0[17];
-rz(-pi) q0[17];
-cx q0[16],q0[17];
-sx q0[17];
-rz(1.8219151) q0[17];
-sx q0[17];
-rz(-pi) q0[17];
-cx q0[16],q0[17];
-sx q0[17];
-sx q0[18];
-rz(1.2129437) q0[18];
-cx q0[17],q0[18];
-rz(3.007103) q0[18];
-cx q0[17],q0[18];
-rz(-pi) q0[17];
-sx q0[17];
-rz(-pi) q0[17];
-rz(-2.1772896) q0[18];
-sx q0[18];
-rz(-pi) q0[18];
-cx q0[17],q0[18];
-sx q0[18];
-rz(2.1772896) q0[18];
-sx q0[18];
-rz(-pi) q0[18];
-cx q0[17],q0[18];
-sx q0[18];
-sx q0[19];
-rz(0.91617691) q0[19];
-cx q0[18],q0[19];
-rz(0.86205336) q0[19];
-cx q0[18],q0[19];
-rz(-pi) q0[18];
-sx q0[18];
-rz(-pi) q0[18];
-rz(-2.2959448) q0[19];
-sx q0[19];
-rz(-pi) q0[19];
-cx q0[18],q0[19];
-sx q0[19];
-rz(2.2959448) q0[19];
-sx q0[19];
-rz(-pi) q0[19];
-cx q0[18],q0[19];
-sx q0[19];
-sx q0[20];
-rz(2.1315978) q0[20];
-cx q0[19],q0[20];
-rz(1.7427516) q0[20];
-cx q0[19],q0[20];
-rz(-pi) q0[19];
-sx q0[19];
-rz(-pi) q0[19];
-rz(-2.2733467) q0[20];
-sx q0[20];
-rz(-pi) q0[20];
-cx q0[19],q0[20];
-sx q0[20];
-rz(2.2733467) q0[20];
-sx q0[20];
-rz(-pi) q0[20];
-cx q0[19],q0[20];
-sx q0[20];
-sx q0[21];
-rz(3.0632262) q0[21];
-cx q0[20],q0[21];
-rz(2.883636) q0[21];
-cx q0[20],q0[21];
-rz(-pi) q0[20];
-sx q0[20];
-rz(-pi) q0[20];
-rz(-1.7587341) q0[21];
-sx q0[21];
-rz(-pi) q0[21];
-cx q0[20],q0[21];
-sx q0[21];
-rz(1.7587341) q0[21];
-sx q0[21];
-rz(-pi) q0[21];
-cx q0[20],q0[21];
-sx q0[21];
-sx q0[22];
-rz(2.6983245) q0[22];
-cx q0[21],q0[22];
-rz(2.3111593) q0[22];
-cx q0[21],q0[22];
-rz(-pi) q0[21];
-sx q0[21];
-rz(-pi) q0[21];
-rz(-2.4998605) q0[22];
-sx q0[22];
-rz(-pi) q0[22];
-cx q0[21],q0[22];
-sx q0[22];
-rz(2.4998605) q0[22];
-sx q0[22];
-rz(-pi) q0[22];
-cx q0[21],q0[22];
-sx q0[22];
-sx q0[23];
-rz(2.2559066) q0[23];
-cx q0[22],q0[23];
-rz(1.8717912) q0[23];
-cx q0[22],q0[23];
-rz(-pi) q0[22];
-sx q0[22];
-rz(-pi) q0[22];
-rz(-2.459363) q0[23];
-sx q0[23];
-rz(-pi) q0[23];
-cx q0[22],q0[23];
-sx q0[23];
-rz(2.459363) q0[23];
-sx q0[23];
-rz(-pi) q0[23];
-cx q0[22],q0[23];
-sx q0[23];
-sx q0[24];
-rz(0.28887259) q0[24];
-cx q0[23],q0[24];
-rz(2.4297677) q0[24];
-cx q0[23],q0[24];
-rz(-pi) q0[23];
-sx q0[23];
-rz(-pi) q0[23];
-rz(-3.1310235) q0[24];
-sx q0[24];
-rz(-pi) q0[24];
-cx q0[23],q0[24];
-sx q0[24];
-rz(3.1310235) q0[24];
-sx q0[24];
-rz(-pi) q0[24];
-cx q0[23],q0[24];
-sx q0[24];
-sx q0[25];
-rz(1.9347737) q0[25];
-cx q0[24],q0[25];
-rz(0.81819445) q0[25];
-cx q0[24],q0[25];
-rz(-pi) q0[24];
-sx q0[24];
-rz(-pi) q0[24];
-rz(-2.5572967) q0[25];
-sx q0[25];
-rz(-pi) q0[25];
-cx q0[24],q0[25];
-sx q0[25];
-rz(2.5572967) q0[25];
-sx q0[25];
-rz(-pi) q0[25];
-cx q0[24],q0[25];
-sx q0[25];
-sx q0[26];
-rz(0.88475112) q0[26];
-cx q0[25],q0[26];
-rz(2.9462082) q0[26];
-cx q0[25],q0[26];
-rz(-pi) q0[25];
-sx q0[25];
-rz(-pi) q0[25];
-rz(-1.7023841) q0[26];
-sx q0[26];
-rz(-pi) q0[26];
-cx q0[25],q0[26];
-sx q0[26];
-rz(1.7023841) q0[26];
-sx q0[26];
-rz(-pi) q0[26];
-cx q0[25],q0[26];
-sx q0[26];
-sx q0[27];
-rz(0.045768367) q0[27];
-cx q0[26],q0[27];
-rz(1.4761479) q0[27];
-cx q0[26],q0[27];
-rz(-pi) q0[26];
-sx q0[26];
-rz(-pi) q0[26];
-rz(-2.6758909) q0[27];
-sx q0[27];
-rz(-pi) q0[27];
-cx q0[26],q0[27];
-sx q0[27];
-rz(2.6758909) q0[27];
-sx q0[27];
-rz(-pi) q0[27];
-cx q0[26],q0[27];
-sx q0[27];
-sx q0[28];
-rz(1.7300077) q0[28];
-cx q0[27],q0[28];
-rz(1.9117963) q0[28];
-cx q0[27],q0[28];
-rz(-pi) q0[27];
-sx q0[27];
-rz(-pi) q0[27];
-rz(-1.7432897) q0[28];
-sx q0[28];
-rz(-pi) q0[28];
-cx q0[27],q0[28];
-sx q0[28];
-rz(1.7432897) q0[28];
-sx q0[28];
-rz(-pi) q0[28];
-cx q0[27],q0[28];
-sx q0[28];
-sx q0[29];
-rz(1.4711385) q0[29];
-cx q0[28],q0[29];
-rz(1.1028255) q0[29];
-cx q0[28],q0[29];
-rz(-pi) q0[28];
-sx q0[28];
-rz(-pi) q0[28];
-rz(-2.7445443) q0[29];
-sx q0[29];
-rz(-pi) q0[29];
-cx q0[28],q0[29];
-sx q0[29];
-rz(2.7445443) q0[29];
-sx q0[29];
-rz(-pi) q0[29];
-cx q0[28],q0[29];
-sx q0[29];
-sx q0[30];
-rz(2.1473109) q0[30];
-cx q0[29],q0[30];
-rz(0.081822548) q0[30];
-cx q0[29],q0[30];
-rz(-pi) q0[29];
-sx q0[29];
-rz(-pi) q0[29];
-rz(-2.4828305) q0[30];
-sx q0[30];
-rz(-pi) q0[30];
-cx q0[29],q0[30];
-sx q0[30];
-rz(2.4828305) q0[30];
-sx q0[30];
-rz(-pi) q0[30];
-cx q0[29],q0[30];
-sx q0[30];
-sx q0[31];
-rz(1.1331344) q0[31];
-cx q0[30],q0[31];
-rz(2.2783774) q0[31];
-cx q0[30],q0[31];
-rz(-pi) q0[30];
-sx q0[30];
-rz(-pi) q0[30];
-rz(-1.9794656) q0[31];
-sx q0[31];
-rz(-pi) q0[31];
-cx q0[30],q0[31];
-sx q0[31];
-rz(1.9794656) q0[31];
-sx q0[31];
-rz(-pi) q0[31];
-cx q0[30],q0[31];
-sx q0[31];
-sx q0[32];
-rz(1.5703027) q0[32];
-cx q0[31],q0[32];
-rz(1.7669605) q0[32];
-cx q0[31],q0[32];
-rz(-pi) q0[31];
-sx q0[31];
-rz(-pi) q0[31];
-rz(-2.1555025) q0[32];
-sx q0[32];
-rz(-pi) q0[32];
-cx q0[31],q0[32];
-sx q0[32];
-rz(2.1555025) q0[32];
-sx q0[32];
-rz(-pi) q0[32];
-cx q0[31],q0[32];
-sx q0[32];
-sx q0[33];
-rz(2.7634658) q0[33];
-cx q0[32],q0[33];
-rz(2.396472) q0[33];
-cx q0[32],q0[33];
-rz(-pi) q0[32];
-sx q0[32];
-rz(-pi) q0[32];
-rz(-1.9279086) q0[33];
-sx q0[33];
-rz(-pi) q0[33];
-cx q0[32],q0[33];
-sx q0[33];
-rz(1.9279086) q0[33];
-sx q0[33];
-rz(-pi) q0[33];
-cx q0[32],q0[33];
-sx q0[33];
-sx q0[34];
-rz(2.7339828) q0[34];
-cx q0[33],q0[34];
-rz(1.6868652) q0[34];
-cx q0[33],q0[34];
-rz(-pi) q0[33];
-sx q0[33];
-rz(-pi) q0[33];
-rz(-1.7998696) q0[34];
-sx q0[34];
-rz(-pi) q0[34];
-cx q0[33],q0[34];
-sx q0[34];
-rz(1.7998696) q0[34];
-sx q0[34];
-rz(-pi) q0[34];
-cx q0[33],q0[34];
-sx q0[34];
-sx q0[35];
-rz(2.0896663) q0[35];
-cx q0[34],q0[35];
-rz(1.687576) q0[35];
-cx q0[34],q0[35];
-rz(-pi) q0[34];
-sx q0[34];
-rz(-pi) q0[34];
-rz(-1.7295778) q0[35];
-sx q0[35];
-rz(-pi) q0[35];
-cx q0[34],q0[35];
-sx q0[35];
-rz(1.7295778) q0[35];
-sx q0[35];
-rz(-pi) q0[35];
-cx q0[34],q0[35];
-sx q0[35];
-sx q0[36];
-rz(3.0966964) q0[36];
-cx q0[35],q0[36];
-rz(1.5759073) q0[36];
-cx q0[35],q0[36];
-rz(-pi) q0[35];
-sx q0[35];
-rz(-pi) q0[35];
-rz(-2.5362423) q0[36];
-sx q0[36];
-rz(-pi) q0[36];
-cx q0[35],q0[36];
-sx q0[36];
-rz(2.5362423) q0[36];
-sx q0[36];
-rz(-pi) q0[36];
-cx q0[35],q0[36];
-sx q0[36];
-sx q0[37];
-rz(1.9392776) q0[37];
-cx q0[36],q0[37];
-rz(3.090887) q0[37];
-cx q0[36],q0[37];
-rz(-pi) q0[36];
-sx q0[36];
-rz(-pi) q0[36];
-rz(-2.0904648) q0[37];
-sx q0[37];
-rz(-pi) q0[37];
-cx q0[36],q0[37];
-sx q0[37];
-rz(2.0904648) q0[37];
-sx q0[37];
-rz(-pi) q0[37];
-cx q0[36],q0[37];
-sx q0[37];
-sx q0[38];
-rz(0.81037853) q0[38];
-cx q0[37],q0[38];
-rz(1.2484491) q0[38];
-cx q0[37],q0[38];
-rz(-pi) q0[37];
-sx q0[37];
-rz(-pi) q0[37];
-rz(-2.9046131) q0[38];
-sx q0[38];
-rz(-pi) q0[38];
-cx q0[37],q0[38];
-sx q0[38];
-rz(2.9046131) q0[38];
-sx q0[38];
-rz(-pi) q0[38];
-cx q0[37],q0[38];
-sx q0[38];
-sx q0[39];
-rz(0.23785591) q0[39];
-cx q0[38],q0[39];
-rz(3.0645268) q0[39];
-cx q0[38],q0[39];
-rz(-pi) q0[38];
-sx q0[38];
-rz(-pi) q0[38];
-rz(-2.6485912) q0[39];
-sx q0[39];
-rz(-pi) q0[39];
-cx q0[38],q0[39];
-sx q0[39];
-rz(2.6485912) q0[39];
-sx q0[39];
-rz(-pi) q0[39];
-cx q0[38],q0[39];
-sx q0[39];
-sx q0[40];
-rz(2.3880754) q0[40];
-cx q0[39],q0[40];
-rz(0.75387412) q0[40];
-cx q0[39],q0[40];
-rz(-pi) q0[39];
-sx q0[39];
-rz(-pi) q0[39];
-rz(-2.2898489) q0[40];
-sx q0[40];
-rz(-pi) q0[40];
-cx q0[39],q0[40];
-sx q0[40];
-rz(2.2898489) q0[40];
-sx q0[40];
-rz(-pi) q0[40];
-cx q0[39],q0[40];
-sx q0[40];
-sx q0[41];
-rz(2.8091493) q0[41];
-cx q0[40],q0[41];
-rz(1.4689818) q0[41];
-cx q0[40],q0[41];
-rz(-pi) q0[40];
-sx q0[40];
-rz(-pi) q0[40];
-rz(-2.6929053) q0[41];
-sx q0[41];
-rz(-pi) q0[41];
-cx q0[40],q0[41];
-sx q0[41];
-rz(2.6929053) q0[41];
-sx q0[41];
-rz(-pi) q0[41];
-cx q0[40],q0[41];
-sx q0[41];
-sx q0[42];
-rz(2.3045801) q0[42];
-cx q0[41],q0[42];
-rz(3.0171094) q0[42];
-cx q0[41],q0[42];
-rz(-pi) q0[41];
-sx q0[41];
-rz(-pi) q0[41];
-rz(-1.5775561) q0[42];
-sx q0[42];
-rz(-pi) q0[42];
-cx q0[41],q0[42];
-sx q0[42];
-rz(1.5775561) q0[42];
-sx q0[42];
-rz(-pi) q0[42];
-cx q0[41],q0[42];
-sx q0[42];
-sx q0[43];
-rz(0.60831078) q0[43];
-cx q0[42],q0[43];
-rz(2.4614235) q0[43];
-cx q0[42],q0[43];
-rz(-pi) q0[42];
-sx q0[42];
-rz(-pi) q0[42];
-rz(-1.784619) q0[43];
-sx q0[43];
-rz(-pi) q0[43];
-cx q0[42],q0[43];
-sx q0[43];
-rz(1.784619) q0[43];
-sx q0[43];
-rz(-pi) q0[43];
-cx q0[42],q0[43];
-sx q0[43];
-sx q0[44];
-rz(3.0767826) q0[44];
-cx q0[43],q0[44];
-rz(0.91314195) q0[44];
-cx q0[43],q0[44];
-rz(-pi) q0[43];
-sx q0[43];
-rz(-pi) q0[43];
-rz(-1.9817541) q0[44];
-sx q0[44];
-rz(-pi) q0[44];
-cx q0[43],q0[44];
-sx q0[44];
-rz(1.9817541) q0[44];
-sx q0[44];
-rz(-pi) q0[44];
-cx q0[43],q0[44];
-sx q0[44];
-sx q0[45];
-rz(2.7417843) q0[45];
-cx q0[44],q0[45];
-rz(1.2445238) q0[45];
-cx q0[44],q0[45];
-rz(-pi) q0[44];
-sx q0[44];
-rz(-pi) q0[44];
-rz(-2.7967652) q0[45];
-sx q0[45];
-rz(-pi) q0[45];
-cx q0[44],q0[45];
-sx q0[45];
-rz(2.7967652) q0[45];
-sx q0[45];
-rz(-pi) q0[45];
-cx q0[44],q0[45];
-sx q0[45];
-sx q0[46];
-rz(0.92029738) q0[46];
-cx q0[45],q0[46];
-rz(0.83610803) q0[46];
-cx q0[45],q0[46];
-rz(-pi) q0[45];
-sx q0[45];
-rz(-pi) q0[45];
-rz(-2.2674181) q0[46];
-sx q0[46];
-rz(-pi) q0[46];
-cx q0[45],q0[46];
-sx q0[46];
-rz(2.2674181) q0[46];
-sx q0[46];
-rz(-pi) q0[46];
-cx q0[45],q0[46];
-sx q0[46];
-sx q0[47];
-rz(3.0193164) q0[47];
-cx q0[46],q0[47];
-rz(2.5055157) q0[47];
-cx q0[46],q0[47];
-rz(-pi) q0[46];
-sx q0[46];
-rz(-pi) q0[46];
-rz(-2.138787) q0[47];
-sx q0[47];
-rz(-pi) q0[47];
-cx q0[46],q0[47];
-sx q0[47];
-rz(2.138787) q0[47];
-sx q0[47];
-rz(-pi) q0[47];
-cx q0[46],q0[47];
-sx q0[47];
-sx q0[48];
-rz(1.0161798) q0[48];
-cx q0[47],q0[48];
-rz(2.9206257) q0[48];
-cx q0[47],q0[48];
-rz(-pi) q0[47];
-sx q0[47];
-rz(-pi) q0[47];
-rz(-3.0287925) q0[48];
-sx q0[48];
-rz(-pi) q0[48];
-cx q0[47],q0[48];
-sx q0[48];
-rz(3.0287925) q0[48];
-sx q0[48];
-rz(-pi) q0[48];
-cx q0[47],q0[48];
-sx q0[48];
-sx q0[49];
-rz(0.21580502) q0[49];
-cx q0[48],q0[49];
-rz(0.9050598) q0[49];
-cx q0[48],q0[49];
-rz(-pi) q0[48];
-sx q0[48];
-rz(-pi) q0[48];
-rz(-2.6501262) q0[49];
-sx q0[49];
-rz(-pi) q0[49];
-cx q0[48],q0[49];
-sx q0[49];
-rz(2.6501262) q0[49];
-sx q0[49];
-rz(-pi) q0[49];
-cx q0[48],q0[49];
-sx q0[49];
-sx q0[50];
-rz(0.38333415) q0[50];
-cx q0[49],q0[50];
-rz(0.97503863) q0[50];
-cx q0[49],q0[50];
-rz(-pi) q0[49];
-sx q0[49];
-rz(-pi) q0[49];
-rz(-2.2735636) q0[50];
-sx q0[50];
-rz(-pi) q0[50];
-cx q0[49],q0[50];
-sx q0[50];
-rz(2.2735636) q0[50];
-sx q0[50];
-rz(-pi) q0[50];
-cx q0[49],q0[50];
-sx q0[50];
-sx q0[51];
-rz(1.016126) q0[51];
-cx q0[50],q0[51];
-rz(0.69497181) q0[51];
-cx q0[50],q0[51];
-rz(-pi) q0[50];
-sx q0[50];
-rz(-pi) q0[50];
-rz(-2.6024413) q0[51];
-sx q0[51];
-rz(-pi) q0[51];
-cx q0[50],q0[51];
-sx q0[51];
-rz(2.6024413) q0[51];
-sx q0[51];
-rz(-pi) q0[51];
-cx q0[50],q0[51];
-sx q0[51];
-sx q0[52];
-rz(1.1205201) q0[52];
-cx q0[51],q0[52];
-rz(1.3869379) q0[52];
-cx q0[51],q0[52];
-rz(-pi) q0[51];
-sx q0[51];
-rz(-pi) q0[51];
-rz(-2.5326883) q0[52];
-sx q0[52];
-rz(-pi) q0[52];
-cx q0[51],q0[52];
-sx q0[52];
-rz(2.5326883) q0[52];
-sx q0[52];
-rz(-pi) q0[52];
-cx q0[51],q0[52];
-sx q0[52];
-sx q0[53];
-rz(1.30237) q0[53];
-cx q0[52],q0[53];
-rz(2.1639597) q0[53];
-cx q0[52],q0[53];
-rz(-pi) q0[52];
-sx q0[52];
-rz(-pi) q0[52];
-rz(-2.0851701) q0[53];
-sx q0[53];
-rz(-pi) q0[53];
-cx q0[52],q0[53];
-sx q0[53];
-rz(2.0851701) q0[53];
-sx q0[53];
-rz(-pi) q0[53];
-cx q0[52],q0[53];
-sx q0[53];
-sx q0[54];
-rz(0.15281301) q0[54];
-cx q0[53],q0[54];
-rz(2.3511181) q0[54];
-cx q0[53],q0[54];
-rz(-pi) q0[53];
-sx q0[53];
-rz(-pi) q0[53];
-rz(-1.6251172) q0[54];
-sx q0[54];
-rz(-pi) q0[54];
-cx q0[53],q0[54];
-sx q0[54];
-rz(1.6251172) q0[54];
-sx q0[54];
-rz(-pi) q0[54];
-cx q0[53],q0[54];
-sx q0[54];
-sx q0[55];
-rz(1.8967926) q0[55];
-cx q0[54],q0[55];
-rz(0.993908) q0[55];
-cx q0[54],q0[55];
-rz(-pi) q0[54];
-sx q0[54];
-rz(-pi) q0[54];
-rz(-2.3253727) q0[55];
-sx q0[55];
-rz(-pi) q0[55];
-cx q0[54],q0[55];
-sx q0[55];
-rz(2.3253727) q0[55];
-sx q0[55];
-rz(-pi) q0[55];
-cx q0[54],q0[55];
-sx q0[55];
-sx q0[56];
-rz(1.2844923) q0[56];
-cx q0[55],q0[56];
-rz(1.4392017) q0[56];
-cx q0[55],q0[56];
-rz(-pi) q0[55];
-sx q0[55];
-rz(-pi) q0[55];
-rz(-2.9093201) q0[56];
-sx q0[56];
-rz(-pi) q0[56];
-cx q0[55],q0[56];
-sx q0[56];
-rz(2.9093201) q0[56];
-sx q0[56];
-rz(-pi) q0[56];
-cx q0[55],q0[56];
-sx q0[56];
-sx q0[57];
-rz(1.0951952) q0[57];
-cx q0[56],q0[57];
-rz(1.6849692) q0[57];
-cx q0[56],q0[57];
-rz(-pi) q0[56];
-sx q0[56];
-rz(-pi) q0[56];
-rz(-1.7783408) q0[57];
-sx q0[57];
-rz(-pi) q0[57];
-cx q0[56],q0[57];
-sx q0[57];
-rz(1.7783408) q0[57];
-sx q0[57];
-rz(-pi) q0[57];
-cx q0[56],q0[57];
-sx q0[57];
-sx q0[58];
-rz(1.3678726) q0[58];
-cx q0[57],q0[58];
-rz(2.0309222) q0[58];
-cx q0[57],q0[58];
-rz(-pi) q0[57];
-sx q0[57];
-rz(-pi) q0[57];
-rz(-1.9262064) q0[58];
-sx q0[58];
-rz(-pi) q0[58];
-cx q0[57],q0[58];
-sx q0[58];
-rz(1.9262064) q0[58];
-sx q0[58];
-rz(-pi) q0[58];
-cx q0[57],q0[58];
-sx q0[58];
-sx q0[59];
-rz(0.67931954) q0[59];
-cx q0[58],q0[59];
-rz(0.069909012) q0[59];
-cx q0[58],q0[59];
-rz(-pi) q0[58];
-sx q0[58];
-rz(-pi) q0[58];
-rz(-2.3240586) q0[59];
-sx q0[59];
-rz(-pi) q0[59];
-cx q0[58],q0[59];
-sx q0[59];
-rz(2.3240586) q0[59];
-sx q0[59];
-rz(-pi) q0[59];
-cx q0[58],q0[59];
-sx q0[59];
-sx q0[60];
-rz(0.54091252) q0[60];
-cx q0[59],q0[60];
-rz(2.0940663) q0[60];
-cx q0[59],q0[60];
-rz(-pi) q0[59];
-sx q0[59];
-rz(-pi) q0[59];
-rz(-2.2774838) q0[60];
-sx q0[60];
-rz(-pi) q0[60];
-cx q0[59],q0[60];
-sx q0[60];
-rz(2.2774838) q0[60];
-sx q0[60];
-rz(-pi) q0[60];
-cx q0[59],q0[60];
-sx q0[60];
-sx q0[61];
-rz(1.6669983) q0[61];
-cx q0[60],q0[61];
-rz(2.6110195) q0[61];
-cx q0[60],q0[61];
-rz(-pi) q0[60];
-sx q0[60];
-rz(-pi) q0[60];
-rz(-1.9224907) q0[61];
-sx q0[61];
-rz(-pi) q0[61];
-cx q0[60],q0[61];
-sx q0[61];
-rz(1.9224907) q0[61];
-sx q0[61];
-rz(-pi) q0[61];
-cx q0[60],q0[61];
-sx q0[61];
-sx q0[62];
-rz(0.36056421) q0[62];
-cx q0[61],q0[62];
-rz(2.7795264) q0[62];
-cx q0[61],q0[62];
-rz(-pi) q0[61];
-sx q0[61];
-rz(-pi) q0[61];
-rz(-2.7377808) q0[62];
-sx q0[62];
-rz(-pi) q0[62];
-cx q0[61],q0[62];
-sx q0[62];
-rz(2.7377808) q0[62];
-sx q0[62];
-rz(-pi) q0[62];
-cx q0[61],q0[62];
-sx q0[62];
-sx q0[63];
-rz(0.3367329) q0[63];
-cx q0[62],q0[63];
-rz(0.42212044) q0[63];
-cx q0[62],q0[63];
-rz(-pi) q0[62];
-sx q0[62];
-rz(-pi) q0[62];
-rz(-3.0000362) q0[63];
-sx q0[63];
-rz(-pi) q0[63];
-cx q0[62],q0[63];
-sx q0[63];
-rz(3.0000362) q0[63];
-sx q0[63];
-rz(-pi) q0[63];
-cx q0[62],q0[63];
-sx q0[63];
-sx q0[64];
-rz(1.6037611) q0[64];
-cx q0[63],q0[64];
-rz(1.290329) q0[64];
-cx q0[63],q0[64];
-rz(-pi) q0[63];
-sx q0[63];
-rz(-pi) q0[63];
-rz(-1.7726626) q0[64];
-sx q0[64];
-rz(-pi) q0[64];
-cx q0[63],q0[64];
-sx q0[64];
-rz(1.7726626) q0[64];
-sx q0[64];
-rz(-pi) q0[64];
-cx q0[63],q0[64];
-sx q0[64];
-sx q0[65];
-rz(1.6795842) q0[65];
-cx q0[64],q0[65];
-rz(1.8960284) q0[65];
-cx q0[64],q0[65];
-rz(-pi) q0[64];
-sx q0[64];
-rz(-pi) q0[64];
-rz(-2.7747076) q0[65];
-sx q0[65];
-rz(-pi) q0[65];
-cx q0[64],q0[65];
-sx q0[65];
-rz(2.7747076) q0[65];
-sx q0[65];
-rz(-pi) q0[65];
-cx q0[64],q0[65];
-sx q0[65];
-sx q0[66];
-rz(0.71496581) q0[66];
-cx q0[65],q0[66];
-rz(2.3448624) q0[66];
-cx q0[65],q0[66];
-rz(-pi) q0[65];
-sx q0[65];
-rz(-pi) q0[65];
-rz(-3.0749615) q0[66];
-sx q0[66];
-rz(-pi) q0[66];
-cx q0[65],q0[66];
-sx q0[66];
-rz(3.0749615) q0[66];
-sx q0[66];
-rz(-pi) q0[66];
-cx q0[65],q0[66];
-sx q0[66];
-sx q0[67];
-rz(0.40443124) q0[67];
-cx q0[66],q0[67];
-rz(0.88404709) q0[67];
-cx q0[66],q0[67];
-rz(-pi) q0[66];
-sx q0[66];
-rz(-pi) q0[66];
-rz(-1.7308556) q0[67];
-sx q0[67];
-rz(-pi) q0[67];
-cx q0[66],q0[67];
-sx q0[67];
-rz(1.7308556) q0[67];
-sx q0[67];
-rz(-pi) q0[67];
-cx q0[66],q0[67];
-sx q0[67];
-sx q0[68];
-rz(1.2882458) q0[68];
-cx q0[67],q0[68];
-rz(1.7733888) q0[68];
-cx q0[67],q0[68];
-rz(-pi) q0[67];
-sx q0[67];
-rz(-pi) q0[67];
-rz(-2.0483044) q0[68];
-sx q0[68];
-rz(-pi) q0[68];
-cx q0[67],q0[68];
-sx q0[68];
-rz(2.0483044) q0[68];
-sx q0[68];
-rz(-pi) q0[68];
-cx q0[67],q0[68];
-sx q0[68];
-sx q0[69];
-rz(0.99635798) q0[69];
-cx q0[68],q0[69];
-rz(0.62354522) q0[69];
-cx q0[68],q0[69];
-rz(-pi) q0[68];
-sx q0[68];
-rz(-pi) q0[68];
-rz(-1.9776823) q0[69];
-sx q0[69];
-rz(-pi) q0[69];
-cx q0[68],q0[69];
-sx q0[69];
-rz(1.9776823) q0[69];
-sx q0[69];
-rz(-pi) q0[69];
-cx q0[68],q0[69];
-sx q0[69];
-sx q0[70];
-rz(1.2943559) q0[70];
-cx q0[69],q0[70];
-rz(0.089574994) q0[70];
-cx q0[69],q0[70];
-rz(-pi) q0[69];
-sx q0[69];
-rz(-pi) q0[69];
-rz(-2.0737034) q0[70];
-sx q0[70];
-rz(-pi) q0[70];
-cx q0[69],q0[70];
-sx q0[70];
-rz(2.0737034) q0[70];
-sx q0[70];
-rz(-pi) q0[70];
-cx q0[69],q0[70];
-sx q0[70];
-sx q0[71];
-rz(1.8264582) q0[71];
-cx q0[70],q0[71];
-rz(2.3215753) q0[71];
-cx q0[70],q0[71];
-rz(-pi) q0[70];
-sx q0[70];
-rz(-pi) q0[70];
-rz(-1.632128) q0[71];
-sx q0[71];
-rz(-pi) q0[71];
-cx q0[70],q0[71];
-sx q0[71];
-rz(1.632128) q0[71];
-sx q0[71];
-rz(-pi) q0[71];
-cx q0[70],q0[71];
-sx q0[71];
-sx q0[72];
-rz(2.66483) q0[72];
-cx q0[71],q0[72];
-rz(0.50446427) q0[72];
-cx q0[71],q0[72];
-rz(-pi) q0[71];
-sx q0[71];
-rz(-pi) q0[71];
-rz(-2.8918734) q0[72];
-sx q0[72];
-rz(-pi) q0[72];
-cx q0[71],q0[72];
-sx q0[72];
-rz(2.8918734) q0[72];
-sx q0[72];
-rz(-pi) q0[72];
-cx q0[71],q0[72];
-sx q0[72];
-sx q0[73];
-rz(1.0912735) q0[73];
-cx q0[72],q0[73];
-rz(0.10555114) q0[73];
-cx q0[72],q0[73];
-rz(-pi) q0[72];
-sx q0[72];
-rz(-pi) q0[72];
-rz(-3.0402566) q0[73];
-sx q0[73];
-rz(-pi) q0[73];
-cx q0[72],q0[73];
-sx q0[73];
-rz(3.0402566) q0[73];
-sx q0[73];
-rz(-pi) q0[73];
-cx q0[72],q0[73];
-sx q0[73];
-sx q0[74];
-rz(0.15111374) q0[74];
-cx q0[73],q0[74];
-rz(0.71167568) q0[74];
-cx q0[73],q0[74];
-rz(-pi) q0[73];
-sx q0[73];
-rz(-pi) q0[73];
-rz(-2.0863906) q0[74];
-sx q0[74];
-rz(-pi) q0[74];
-cx q0[73],q0[74];
-sx q0[74];
-rz(2.0863906) q0[74];
-sx q0[74];
-rz(-pi) q0[74];
-cx q0[73],q0[74];
-sx q0[74];
-sx q0[75];
-rz(3.0981727) q0[75];
-cx q0[74],q0[75];
-rz(2.9978716) q0[75];
-cx q0[74],q0[75];
-rz(-pi) q0[74];
-sx q0[74];
-rz(-pi) q0[74];
-rz(-2.662236) q0[75];
-sx q0[75];
-rz(-pi) q0[75];
-cx q0[74],q0[75];
-sx q0[75];
-rz(2.662236) q0[75];
-sx q0[75];
-rz(-pi) q0[75];
-cx q0[74],q0[75];
-sx q0[75];
-sx q0[76];
-rz(0.48437169) q0[76];
-cx q0[75],q0[76];
-rz(1.1056734) q0[76];
-cx q0[75],q0[76];
-rz(-pi) q0[75];
-sx q0[75];
-rz(-pi) q0[75];
-rz(-3.0442135) q0[76];
-sx q0[76];
-rz(-pi) q0[76];
-cx q0[75],q0[76];
-sx q0[76];
-rz(3.0442135) q0[76];
-sx q0[76];
-rz(-pi) q0[76];
-cx q0[75],q0[76];
-sx q0[76];
-sx q0[77];
-rz(3.0949113) q0[77];
-cx q0[76],q0[77];
-rz(2.1073558) q0[77];
-cx q0[76],q0[77];
-rz(-pi) q0[76];
-sx q0[76];
-rz(-pi) q0[76];
-rz(-2.9632304) q0[77];
-sx q0[77];
-rz(-pi) q0[77];
-cx q0[76],q0[77];
-sx q0[77];
-rz(2.9632304) q0[77];
-sx q0[77];
-rz(-pi) q0[77];
-cx q0[76],q0[77];
-sx q0[77];
-sx q0[78];
-rz(2.1330728) q0[78];
-cx q0[77],q0[78];
-rz(1.2874318) q0[78];
-cx q0[77],q0[78];
-rz(-pi) q0[77];
-sx q0[77];
-rz(-pi) q0[77];
-rz(-1.7942526) q0[78];
-sx q0[78];
-rz(-pi) q0[78];
-cx q0[77],q0[78];
-sx q0[78];
-rz(1.7942526) q0[78];
-sx q0[78];
-rz(-pi) q0[78];
-cx q0[77],q0[78];
-sx q0[78];
-sx q0[79];
-rz(1.1825139) q0[79];
-cx q0[78],q0[79];
-rz(2.0925866) q0[79];
-cx q0[78],q0[79];
-rz(-pi) q0[78];
-sx q0[78];
-rz(-pi) q0[78];
-rz(-1.7031902) q0[79];
-sx q0[79];
-rz(-pi) q0[79];
-cx q0[78],q0[79];
-sx q0[79];
-rz(1.7031902) q0[79];
-sx q0[79];
-rz(-pi) q0[79];
-cx q0[78],q0[79];
-sx q0[79];
-sx q0[80];
-rz(1.4979684) q0[80];
-cx q0[79],q0[80];
-rz(1.9914997) q0[80];
-cx q0[79],q0[80];
-rz(-pi) q0[79];
-sx q0[79];
-rz(-pi) q0[79];
-rz(-1.8459223) q0[80];
-sx q0[80];
-rz(-pi) q0[80];
-cx q0[79],q0[80];
-sx q0[80];
-rz(1.8459223) q0[80];
-sx q0[80];
-rz(-pi) q0[80];
-cx q0[79],q0[80];
-sx q0[80];
-sx q0[81];
-rz(0.88275504) q0[81];
-cx q0[80],q0[81];
-rz(0.04435206) q0[81];
-cx q0[80],q0[81];
-rz(-pi) q0[80];
-sx q0[80];
-rz(-pi) q0[80];
-rz(-1.8259713) q0[81];
-sx q0[81];
-rz(-pi) q0[81];
-cx q0[80],q0[81];
-sx q0[81];
-rz(1.8259713) q0[81];
-sx q0[81];
-rz(-pi) q0[81];
-cx q0[80],q0[81];
-sx q0[81];
-sx q0[82];
-rz(1.2082921) q0[82];
-cx q0[81],q0[82];
-rz(0.79783944) q0[82];
-cx q0[81],q0[82];
-rz(-pi) q0[81];
-sx q0[81];
-rz(-pi) q0[81];
-rz(-2.7727992) q0[82];
-sx q0[82];
-rz(-pi) q0[82];
-cx q0[81],q0[82];
-sx q0[82];
-rz(2.7727992) q0[82];
-sx q0[82];
-rz(-pi) q0[82];
-cx q0[81],q0[82];
-sx q0[82];
-sx q0[83];
-rz(2.0847477) q0[83];
-cx q0[82],q0[83];
-rz(1.8814768) q0[83];
-cx q0[82],q0[83];
-rz(-pi) q0[82];
-sx q0[82];
-rz(-pi) q0[82];
-rz(-2.9570614) q0[83];
-sx q0[83];
-rz(-pi) q0[83];
-cx q0[82],q0[83];
-sx q0[83];
-rz(2.9570614) q0[83];
-sx q0[83];
-rz(-pi) q0[83];
-cx q0[82],q0[83];
-sx q0[83];
-sx q0[84];
-rz(1.6998864) q0[84];
-cx q0[83],q0[84];
-rz(2.2819645) q0[84];
-cx q0[83],q0[84];
-rz(-pi) q0[83];
-sx q0[83];
-rz(-pi) q0[83];
-rz(-2.2014679) q0[84];
-sx q0[84];
-rz(-pi) q0[84];
-cx q0[83],q0[84];
-sx q0[84];
-rz(2.2014679) q0[84];
-sx q0[84];
-rz(-pi) q0[84];
-cx q0[83],q0[84];
-sx q0[84];
-sx q0[85];
-rz(0.2395207) q0[85];
-cx q0[84],q0[85];
-rz(0.091683167) q0[85];
-cx q0[84],q0[85];
-rz(-pi) q0[84];
-sx q0[84];
-rz(-pi) q0[84];
-rz(-1.6482083) q0[85];
-sx q0[85];
-rz(-pi) q0[85];
-cx q0[84],q0[85];
-sx q0[85];
-rz(1.6482083) q0[85];
-sx q0[85];
-rz(-pi) q0[85];
-cx q0[84],q0[85];
-sx q0[85];
-sx q0[86];
-rz(2.6453639) q0[86];
-cx q0[85],q0[86];
-rz(0.99562055) q0[86];
-cx q0[85],q0[86];
-rz(-pi) q0[85];
-sx q0[85];
-rz(-pi) q0[85];
-rz(-2.8854395) q0[86];
-sx q0[86];
-rz(-pi) q0[86];
-cx q0[85],q0[86];
-sx q0[86];
-rz(2.8854395) q0[86];
-sx q0[86];
-rz(-pi) q0[86];
-cx q0[85],q0[86];
-sx q0[86];
-sx q0[87];
-rz(2.1238084) q0[87];
-cx q0[86],q0[87];
-rz(2.2496514) q0[87];
-cx q0[86],q0[87];
-rz(-pi) q0[86];
-sx q0[86];
-rz(-pi) q0[86];
-rz(-3.1027123) q0[87];
-sx q0[87];
-rz(-pi) q0[87];
-cx q0[86],q0[87];
-sx q0[87];
-rz(3.1027123) q0[87];
-sx q0[87];
-rz(-pi) q0[87];
-cx q0[86],q0[87];
-sx q0[87];
-sx q0[88];
-rz(2.3579009) q0[88];
-cx q0[87],q0[88];
-rz(0.12910029) q0[88];
-cx q0[87],q0[88];
-rz(-pi) q0[87];
-sx q0[87];
-rz(-pi) q0[87];
-rz(-3.1203638) q0[88];
-sx q0[88];
-rz(-pi) q0[88];
-cx q0[87],q0[88];
-sx q0[88];
-rz(3.1203638) q0[88];
-sx q0[88];
-rz(-pi) q0[88];
-cx q0[87],q0[88];
-sx q0[88];
-sx q0[89];
-rz(1.7028574) q0[89];
-cx q0[88],q0[89];
-rz(0.62683199) q0[89];
-cx q0[88],q0[89];
-rz(-pi) q0[88];
-sx q0[88];
-rz(-pi) q0[88];
-rz(-2.6688502) q0[89];
-sx q0[89];
-rz(-pi) q0[89];
-cx q0[88],q0[89];
-sx q0[89];
-rz(2.6688502) q0[89];
-sx q0[89];
-rz(-pi) q0[89];
-cx q0[88],q0[89];
-sx q0[89];
-sx q0[90];
-rz(2.9772621) q0[90];
-cx q0[89],q0[90];
-rz(2.3729978) q0[90];
-cx q0[89],q0[90];
-rz(-pi) q0[89];
-sx q0[89];
-rz(-pi) q0[89];
-rz(-1.610677) q0[90];
-sx q0[90];
-rz(-pi) q0[90];
-cx q0[89],q0[90];
-sx q0[90];
-rz(1.610677) q0[90];
-sx q0[90];
-rz(-pi) q0[90];
-cx q0[89],q0[90];
-sx q0[90];
-sx q0[91];
-rz(1.8618715) q0[91];
-cx q0[90],q0[91];
-rz(1.5905382) q0[91];
-cx q0[90],q0[91];
-rz(-pi) q0[90];
-sx q0[90];
-rz(-pi) q0[90];
-rz(-1.788093) q0[91];
-sx q0[91];
-rz(-pi) q0[91];
-cx q0[90],q0[91];
-sx q0[91];
-rz(1.788093) q0[91];
-sx q0[91];
-rz(-pi) q0[91];
-cx q0[90],q0[91];
-sx q0[91];
-sx q0[92];
-rz(0.58183144) q0[92];
-cx q0[91],q0[92];
-rz(0.45361847) q0[92];
-cx q0[91],q0[92];
-rz(-pi) q0[91];
-sx q0[91];
-rz(-pi) q0[91];
-rz(-3.0792602) q0[92];
-sx q0[92];
-rz(-pi) q0[92];
-cx q0[91],q0[92];
-sx q0[92];
-rz(3.0792602) q0[92];
-sx q0[92];
-rz(-pi) q0[92];
-cx q0[91],q0[92];
-sx q0[92];
-sx q0[93];
-rz(1.7183666) q0[93];
-cx q0[92],q0[93];
-rz(2.0165216) q0[93];
-cx q0[92],q0[93];
-rz(-pi) q0[92];
-sx q0[92];
-rz(-pi) q0[92];
-rz(-2.985521) q0[93];
-sx q0[93];
-rz(-pi) q0[93];
-cx q0[92],q0[93];
-sx q0[93];
-rz(2.985521) q0[93];
-sx q0[93];
-rz(-pi) q0[93];
-cx q0[92],q0[93];
-sx q0[93];
-sx q0[94];
-rz(0.84369616) q0[94];
-cx q0[93],q0[94];
-rz(0.52622344) q0[94];
-cx q0[93],q0[94];
-rz(-pi) q0[93];
-sx q0[93];
-rz(-pi) q0[93];
-rz(-2.9712946) q0[94];
-sx q0[94];
-rz(-pi) q0[94];
-cx q0[93],q0[94];
-sx q0[94];
-rz(2.9712946) q0[94];
-sx q0[94];
-rz(-pi) q0[94];
-cx q0[93],q0[94];
-sx q0[94];
-sx q0[95];
-rz(2.8483141) q0[95];
-cx q0[94],q0[95];
-rz(1.4870986) q0[95];
-cx q0[94],q0[95];
-rz(-pi) q0[94];
-sx q0[94];
-rz(-pi) q0[94];
-rz(-2.8813923) q0[95];
-sx q0[95];
-rz(-pi) q0[95];
-cx q0[94],q0[95];
-sx q0[95];
-rz(2.8813923) q0[95];
-sx q0[95];
-rz(-pi) q0[95];
-cx q0[94],q0[95];
-sx q0[95];
-sx q0[96];
-rz(1.1858021) q0[96];
-cx q0[95],q0[96];
-rz(0.09420832) q0[96];
-cx q0[95],q0[96];
-rz(-pi) q0[95];
-sx q0[95];
-rz(-pi) q0[95];
-rz(-2.5788699) q0[96];
-sx q0[96];
-rz(-pi) q0[96];
-cx q0[95],q0[96];
-sx q0[96];
-rz(2.5788699) q0[96];
-sx q0[96];
-rz(-pi) q0[96];
-cx q0[95],q0[96];
-sx q0[96];
-sx q0[97];
-rz(2.3694306) q0[97];
-cx q0[96],q0[97];
-rz(0.91134539) q0[97];
-cx q0[96],q0[97];
-rz(-pi) q0[96];
-sx q0[96];
-rz(-pi) q0[96];
-rz(-2.8514284) q0[97];
-sx q0[97];
-rz(-pi) q0[97];
-cx q0[96],q0[97];
-sx q0[97];
-rz(2.8514284) q0[97];
-sx q0[97];
-rz(-pi) q0[97];
-cx q0[96],q0[97];
-sx q0[97];
-sx q0[98];
-rz(2.3241994) q0[98];
-cx q0[97],q0[98];
-rz(0.07492038) q0[98];
-cx q0[97],q0[98];
-rz(-pi) q0[97];
-sx q0[97];
-rz(-pi) q0[97];
-rz(-3.1276043) q0[98];
-sx q0[98];
-rz(-pi) q0[98];
-cx q0[97],q0[98];
-sx q0[98];
-rz(3.1276043) q0[98];
-sx q0[98];
-rz(-pi) q0[98];
-cx q0[97],q0[98];
-sx q0[98];
-sx q0[99];
-rz(0.76060713) q0[99];
-cx q0[98],q0[99];
-rz(0.83469392) q0[99];
-cx q0[98],q0[99];
-rz(-pi) q0[98];
-sx q0[98];
-rz(-pi) q0[98];
-rz(-2.4746488) q0[99];
-sx q0[99];
-rz(-pi) q0[99];
-cx q0[98],q0[99];
-sx q0[99];
-rz(2.4746488) q0[99];
-sx q0[99];
-rz(-pi) q0[99];
-cx q0[98],q0[99];
-sx q0[99];
-sx q0[100];
-rz(0.0052190006) q0[100];
-cx q0[99],q0[100];
-rz(3.0174095) q0[100];
-cx q0[99],q0[100];
-rz(-2.9179529) q0[100];
-sx q0[100];
-rz(-pi) q0[100];
-rz(-pi) q0[99];
-sx q0[99];
-rz(-pi) q0[99];
-cx q0[99],q0[100];
-sx q0[100];
-rz(2.9179529) q0[100];
-sx q0[100];
-rz(-pi) q0[100];
-cx q0[99],q0[100];
-sx q0[100];
-sx q0[101];
-rz(1.3397501) q0[101];
-cx q0[100],q0[101];
-rz(1.908003) q0[101];
-cx q0[100],q0[101];
-rz(-pi) q0[100];
-sx q0[100];
-rz(-pi) q0[100];
-rz(-1.6982652) q0[101];
-sx q0[101];
-rz(-pi) q0[101];
-cx q0[100],q0[101];
-sx q0[101];
-rz(1.6982652) q0[101];
-sx q0[101];
-rz(-pi) q0[101];
-cx q0[100],q0[101];
-sx q0[101];
-sx q0[102];
-rz(0.020860016) q0[102];
-cx q0[101],q0[102];
-rz(1.5094247) q0[102];
-cx q0[101],q0[102];
-rz(-pi) q0[101];
-sx q0[101];
-rz(-pi) q0[101];
-rz(-3.0526637) q0[102];
-sx q0[102];
-rz(-pi) q0[102];
-cx q0[101],q0[102];
-sx q0[102];
-rz(3.0526637) q0[102];
-sx q0[102];
-rz(-pi) q0[102];
-cx q0[101],q0[102];
-sx q0[102];
-sx q0[103];
-rz(1.9965685) q0[103];
-cx q0[102],q0[103];
-rz(1.9552772) q0[103];
-cx q0[102],q0[103];
-rz(-pi) q0[102];
-sx q0[102];
-rz(-pi) q0[102];
-rz(-2.0881514) q0[103];
-sx q0[103];
-rz(-pi) q0[103];
-cx q0[102],q0[103];
-sx q0[103];
-rz(2.0881514) q0[103];
-sx q0[103];
-rz(-pi) q0[103];
-cx q0[102],q0[103];
-sx q0[103];
-sx q0[104];
-rz(0.37460701) q0[104];
-cx q0[103],q0[104];
-rz(2.7582089) q0[104];
-cx q0[103],q0[104];
-rz(-pi) q0[103];
-sx q0[103];
-rz(-pi) q0[103];
-rz(-3.1061494) q0[104];
-sx q0[104];
-rz(-pi) q0[104];
-cx q0[103],q0[104];
-sx q0[104];
-rz(3.1061494) q0[104];
-sx q0[104];
-rz(-pi) q0[104];
-cx q0[103],q0[104];
-sx q0[104];
-sx q0[105];
-rz(2.2456255) q0[105];
-cx q0[104],q0[105];
-rz(0.1615129) q0[105];
-cx q0[104],q0[105];
-rz(-pi) q0[104];
-sx q0[104];
-rz(-pi) q0[104];
-rz(-2.4006775) q0[105];
-sx q0[105];
-rz(-pi) q0[105];
-cx q0[104],q0[105];
-sx q0[105];
-rz(2.4006775) q0[105];
-sx q0[105];
-rz(-pi) q0[105];
-cx q0[104],q0[105];
-sx q0[105];
-sx q0[106];
-rz(1.1636452) q0[106];
-cx q0[105],q0[106];
-rz(1.9451921) q0[106];
-cx q0[105],q0[106];
-rz(-pi) q0[105];
-sx q0[105];
-rz(-pi) q0[105];
-rz(-2.1711726) q0[106];
-sx q0[106];
-rz(-pi) q0[106];
-cx q0[105],q0[106];
-sx q0[106];
-rz(2.1711726) q0[106];
-sx q0[106];
-rz(-pi) q0[106];
-cx q0[105],q0[106];
-sx q0[106];
-sx q0[107];
-rz(2.1194336) q0[107];
-cx q0[106],q0[107];
-rz(0.36257372) q0[107];
-cx q0[106],q0[107];
-rz(-pi) q0[106];
-sx q0[106];
-rz(-pi) q0[106];
-rz(-3.116626) q0[107];
-sx q0[107];
-rz(-pi) q0[107];
-cx q0[106],q0[107];
-sx q0[107];
-rz(3.116626) q0[107];
-sx q0[107];
-rz(-pi) q0[107];
-cx q0[106],q0[107];
-sx q0[107];
-sx q0[108];
-rz(3.0415116) q0[108];
-cx q0[107],q0[108];
-rz(1.8477076) q0[108];
-cx q0[107],q0[108];
-rz(-pi) q0[107];
-sx q0[107];
-rz(-pi) q0[107];
-rz(-2.2768276) q0[108];
-sx q0[108];
-rz(-pi) q0[108];
-cx q0[107],q0[108];
-sx q0[108];
-rz(2.2768276) q0[108];
-sx q0[108];
-rz(-pi) q0[108];
-cx q0[107],q0[108];
-sx q0[108];
-sx q0[109];
-rz(2.13862) q0[109];
-cx q0[108],q0[109];
-rz(1.2290716) q0[109];
-cx q0[108],q0[109];
-rz(-pi) q0[108];
-sx q0[108];
-rz(-pi) q0[108];
-rz(-1.8860137) q0[109];
-sx q0[109];
-rz(-pi) q0[109];
-cx q0[108],q0[109];
-sx q0[109];
-rz(1.8860137) q0[109];
-sx q0[109];
-rz(-pi) q0[109];
-cx q0[108],q0[109];
-sx q0[109];
-sx q0[110];
-rz(2.8633886) q0[110];
-cx q0[109],q0[110];
-rz(0.76239574) q0[110];
-cx q0[109],q0[110];
-rz(-pi) q0[109];
-sx q0[109];
-rz(-pi) q0[109];
-rz(-2.3969108) q0[110];
-sx q0[110];
-rz(-pi) q0[110];
-cx q0[109],q0[110];
-sx q0[110];
-rz(2.3969108) q0[110];
-sx q0[110];
-rz(-pi) q0[110];
-cx q0[109],q0[110];
-sx q0[110];
-sx q0[111];
-rz(0.17431383) q0[111];
-cx q0[110],q0[111];
-rz(2.5080714) q0[111];
-cx q0[110],q0[111];
-rz(-pi) q0[110];
-sx q0[110];
-rz(-pi) q0[110];
-rz(-2.9014399) q0[111];
-sx q0[111];
-rz(-pi) q0[111];
-cx q0[110],q0[111];
-sx q0[111];
-rz(2.9014399) q0[111];
-sx q0[111];
-rz(-pi) q0[111];
-cx q0[110],q0[111];
-sx q0[111];
-sx q0[112];
-rz(2.9651498) q0[112];
-cx q0[111],q0[112];
-rz(2.848587) q0[112];
-cx q0[111],q0[112];
-rz(-pi) q0[111];
-sx q0[111];
-rz(-pi) q0[111];
-rz(-2.8094708) q0[112];
-sx q0[112];
-rz(-pi) q0[112];
-cx q0[111],q0[112];
-sx q0[112];
-rz(2.8094708) q0[112];
-sx q0[112];
-rz(-pi) q0[112];
-cx q0[111],q0[112];
-sx q0[112];
-sx q0[113];
-rz(0.80304491) q0[113];
-cx q0[112],q0[113];
-rz(2.1787028) q0[113];
-cx q0[112],q0[113];
-rz(-pi) q0[112];
-sx q0[112];
-rz(-pi) q0[112];
-rz(-2.7768909) q0[113];
-sx q0[113];
-rz(-pi) q0[113];
-cx q0[112],q0[113];
-sx q0[113];
-rz(2.7768909) q0[113];
-sx q0[113];
-rz(-pi) q0[113];
-cx q0[112],q0[113];
-sx q0[113];
-sx q0[114];
-rz(1.2087831) q0[114];
-cx q0[113],q0[114];
-rz(0.93933659) q0[114];
-cx q0[113],q0[114];
-rz(-pi) q0[113];
-sx q0[113];
-rz(-pi) q0[113];
-rz(-2.5120482) q0[114];
-sx q0[114];
-rz(-pi) q0[114];
-cx q0[113],q0[114];
-sx q0[114];
-rz(2.5120482) q0[114];
-sx q0[114];
-rz(-pi) q0[114];
-cx q0[113],q0[114];
-sx q0[114];
-sx q0[115];
-rz(1.4116286) q0[115];
-cx q0[114],q0[115];
-rz(1.7185185) q0[115];
-cx q0[114],q0[115];
-rz(-pi) q0[114];
-sx q0[114];
-rz(-pi) q0[114];
-rz(-2.9344291) q0[115];
-sx q0[115];
-rz(-pi) q0[115];
-cx q0[114],q0[115];
-sx q0[115];
-rz(2.9344291) q0[115];
-sx q0[115];
-rz(-pi) q0[115];
-cx q0[114],q0[115];
-sx q0[115];
-sx q0[116];
-rz(1.3669678) q0[116];
-cx q0[115],q0[116];
-rz(2.3830063) q0[116];
-cx q0[115],q0[116];
-rz(-pi) q0[115];
-sx q0[115];
-rz(-pi) q0[115];
-rz(-1.6809141) q0[116];
-sx q0[116];
-rz(-pi) q0[116];
-cx q0[115],q0[116];
-sx q0[116];
-rz(1.6809141) q0[116];
-sx q0[116];
-rz(-pi) q0[116];
-cx q0[115],q0[116];
-sx q0[116];
-sx q0[117];
-rz(0.34367634) q0[117];
-cx q0[116],q0[117];
-rz(2.7379318) q0[117];
-cx q0[116],q0[117];
-rz(-pi) q0[116];
-sx q0[116];
-rz(-pi) q0[116];
-rz(-1.9044444) q0[117];
-sx q0[117];
-rz(-pi) q0[117];
-cx q0[116],q0[117];
-sx q0[117];
-rz(1.9044444) q0[117];
-sx q0[117];
-rz(-pi) q0[117];
-cx q0[116],q0[117];
-sx q0[117];
-sx q0[118];
-rz(0.14923949) q0[118];
-cx q0[117],q0[118];
-rz(1.9888968) q0[118];
-cx q0[117],q0[118];
-rz(-pi) q0[117];
-sx q0[117];
-rz(-pi) q0[117];
-rz(-1.9028224) q0[118];
-sx q0[118];
-rz(-pi) q0[118];
-cx q0[117],q0[118];
-sx q0[118];
-rz(1.9028224) q0[118];
-sx q0[118];
-rz(-pi) q0[118];
-cx q0[117],q0[118];
-sx q0[118];
-sx q0[119];
-rz(1.9129046) q0[119];
-cx q0[118],q0[119];
-rz(3.0713961) q0[119];
-cx q0[118],q0[119];
-rz(-pi) q0[118];
-sx q0[118];
-rz(-pi) q0[118];
-rz(-1.5770949) q0[119];
-sx q0[119];
-rz(-pi) q0[119];
-cx q0[118],q0[119];
-sx q0[119];
-rz(1.5770949) q0[119];
-sx q0[119];
-rz(-pi) q0[119];
-cx q0[118],q0[119];
-sx q0[119];
-sx q0[120];
-rz(0.71892373) q0[120];
-cx q0[119],q0[120];
-rz(2.4128489) q0[120];
-cx q0[119],q0[120];
-rz(-pi) q0[119];
-sx q0[119];
-rz(-pi) q0[119];
-rz(-2.427081) q0[120];
-sx q0[120];
-rz(-pi) q0[120];
-cx q0[119],q0[120];
-sx q0[120];
-rz(2.427081) q0[120];
-sx q0[120];
-rz(-pi) q0[120];
-cx q0[119],q0[120];
-sx q0[120];
-sx q0[121];
-rz(0.38265132) q0[121];
-cx q0[120],q0[121];
-rz(2.2133837) q0[121];
-cx q0[120],q0[121];
-rz(-pi) q0[120];
-sx q0[120];
-rz(-pi) q0[120];
-rz(-2.3616506) q0[121];
-sx q0[121];
-rz(-pi) q0[121];
-cx q0[120],q0[121];
-sx q0[121];
-rz(2.3616506) q0[121];
-sx q0[121];
-rz(-pi) q0[121];
-cx q0[120],q0[121];
-sx q0[121];
-sx q0[122];
-rz(1.276786) q0[122];
-cx q0[121],q0[122];
-rz(1.4742865) q0[122];
-cx q0[121],q0[122];
-rz(-pi) q0[121];
-sx q0[121];
-rz(-pi) q0[121];
-rz(-2.5806636) q0[122];
-sx q0[122];
-rz(-pi) q0[122];
-cx q0[121],q0[122];
-sx q0[122];
-rz(2.5806636) q0[122];
-sx q0[122];
-rz(-pi) q0[122];
-cx q0[121],q0[122];
-sx q0[122];
-sx q0[123];
-rz(1.1225521) q0[123];
-cx q0[122],q0[123];
-rz(2.0255271) q0[123];
-cx q0[122],q0[123];
-rz(-pi) q0[122];
-sx q0[122];
-rz(-pi) q0[122];
-rz(-2.4036009) q0[123];
-sx q0[123];
-rz(-pi) q0[123];
-cx q0[122],q0[123];
-sx q0[123];
-rz(2.4036009) q0[123];
-sx q0[123];
-rz(-pi) q0[123];
-cx q0[122],q0[123];
-sx q0[123];
-sx q0[124];
-rz(0.73771066) q0[124];
-cx q0[123],q0[124];
-rz(0.87650918) q0[124];
-cx q0[123],q0[124];
-rz(-pi) q0[123];
-sx q0[123];
-rz(-pi) q0[123];
-rz(-2.398786) q0[124];
-sx q0[124];
-rz(-pi) q0[124];
-cx q0[123],q0[124];
-sx q0[124];
-rz(2.398786) q0[124];
-sx q0[124];
-rz(-pi) q0[124];
-cx q0[123],q0[124];
-sx q0[124];
-sx q0[125];
-rz(1.8196333) q0[125];
-cx q0[124],q0[125];
-rz(0.32270029) q0[125];
-cx q0[124],q0[125];
-rz(-pi) q0[124];
-sx q0[124];
-rz(-pi) q0[124];
-rz(-1.7410252) q0[125];
-sx q0[125];
-rz(-pi) q0[125];
-cx q0[124],q0[125];
-sx q0[125];
-rz(1.7410252) q0[125];
-sx q0[125];
-rz(-pi) q0[125];
-cx q0[124],q0[125];
-sx q0[125];
-sx q0[126];
-rz(2.4362415) q0[126];
-cx q0[125],q0[126];
-rz(2.6359198) q0[126];
-cx q0[125],q0[126];
-rz(-pi) q0[125];
-sx q0[125];
-rz(-pi) q0[125];
-rz(-2.0457091) q0[126];
-sx q0[126];
-rz(-pi) q0[126];
-cx q0[125],q0[126];
-sx q0[126];
-rz(2.0457091) q0[126];
-sx q0[126];
-rz(-pi) q0[126];
-cx q0[125],q0[126];
-sx q0[126];
-sx q0[127];
-rz(1.6148301) q0[127];
-cx q0[126],q0[127];
-rz(2.1139281) q0[127];
-cx q0[126],q0[127];
-rz(-pi) q0[126];
-sx q0[126];
-rz(-pi) q0[126];
-rz(-3.1379235) q0[127];
-sx q0[127];
-rz(-pi) q0[127];
-cx q0[126],q0[127];
-sx q0[127];
-rz(3.1379235) q0[127];
-sx q0[127];
-rz(-pi) q0[127];
-cx q0[126],q0[127];
-sx q0[127];
-sx q0[128];
-rz(2.9820309) q0[128];
-cx q0[127],q0[128];
-rz(0.84237726) q0[128];
-cx q0[127],q0[128];
-rz(-pi) q0[127];
-sx q0[127];
-rz(-pi) q0[127];
-rz(-2.6908035) q0[128];
-sx q0[128];
-rz(-pi) q0[128];
-cx q0[127],q0[128];
-sx q0[128];
-rz(2.6908035) q0[128];
-sx q0[128];
-rz(-pi) q0[128];
-cx q0[127],q0[128];
-sx q0[128];
-sx q0[129];
-rz(0.26036042) q0[129];
-cx q0[128],q0[129];
-rz(0.38412494) q0[129];
-cx q0[128],q0[129];
-rz(-pi) q0[128];
-sx q0[128];
-rz(-pi) q0[128];
-rz(-1.6334467) q0[129];
-sx q0[129];
-rz(-pi) q0[129];
-cx q0[128],q0[129];
-sx q0[129];
-rz(1.6334467) q0[129];
-sx q0[129];
-rz(-pi) q0[129];
-cx q0[128],q0[129];
-sx q0[129];
-sx q0[130];
-rz(1.3422398) q0[130];
-cx q0[129],q0[130];
-rz(0.55853378) q0[130];
-cx q0[129],q0[130];
-rz(-pi) q0[129];
-sx q0[129];
-rz(-pi) q0[129];
-rz(-2.6285347) q0[130];
-sx q0[130];
-rz(-pi) q0[130];
-cx q0[129],q0[130];
-sx q0[130];
-rz(2.6285347) q0[130];
-sx q0[130];
-rz(-pi) q0[130];
-cx q0[129],q0[130];
-sx q0[130];
-sx q0[131];
-rz(2.9075018) q0[131];
-cx q0[130],q0[131];
-rz(1.8152406) q0[131];
-cx q0[130],q0[131];
-rz(-pi) q0[130];
-sx q0[130];
-rz(-pi) q0[130];
-rz(-2.7010686) q0[131];
-sx q0[131];
-rz(-pi) q0[131];
-cx q0[130],q0[131];
-sx q0[131];
-rz(2.7010686) q0[131];
-sx q0[131];
-rz(-pi) q0[131];
-cx q0[130],q0[131];
-sx q0[131];
-sx q0[132];
-rz(1.6723327) q0[132];
-cx q0[131],q0[132];
-rz(2.9030946) q0[132];
-cx q0[131],q0[132];
-rz(-pi) q0[131];
-sx q0[131];
-rz(-pi) q0[131];
-rz(-3.0985702) q0[132];
-sx q0[132];
-rz(-pi) q0[132];
-cx q0[131],q0[132];
-sx q0[132];
-rz(3.0985702) q0[132];
-sx q0[132];
-rz(-pi) q0[132];
-cx q0[131],q0[132];
-sx q0[132];
-sx q0[133];
-rz(0.1309148) q0[133];
-cx q0[132],q0[133];
-rz(1.9836577) q0[133];
-cx q0[132],q0[133];
-rz(-pi) q0[132];
-sx q0[132];
-rz(-pi) q0[132];
-rz(-1.6611137) q0[133];
-sx q0[133];
-rz(-pi) q0[133];
-cx q0[132],q0[133];
-sx q0[133];
-rz(1.6611137) q0[133];
-sx q0[133];
-rz(-pi) q0[133];
-cx q0[132],q0[133];
-sx q0[133];
-sx q0[134];
-rz(0.85262309) q0[134];
-cx q0[133],q0[134];
-rz(2.1847853) q0[134];
-cx q0[133],q0[134];
-rz(-pi) q0[133];
-sx q0[133];
-rz(-pi) q0[133];
-rz(-2.5406658) q0[134];
-sx q0[134];
-rz(-pi) q0[134];
-cx q0[133],q0[134];
-sx q0[134];
-rz(2.5406658) q0[134];
-sx q0[134];
-rz(-pi) q0[134];
-cx q0[133],q0[134];
-sx q0[134];
-sx q0[135];
-rz(1.6283239) q0[135];
-cx q0[134],q0[135];
-rz(0.45802535) q0[135];
-cx q0[134],q0[135];
-rz(-pi) q0[134];
-sx q0[134];
-rz(-pi) q0[134];
-rz(-2.130575) q0[135];
-sx q0[135];
-rz(-pi) q0[135];
-cx q0[134],q0[135];
-sx q0[135];
-rz(2.130575) q0[135];
-sx q0[135];
-rz(-pi) q0[135];
-cx q0[134],q0[135];
-sx q0[135];
-sx q0[136];
-rz(0.95487288) q0[136];
-cx q0[135],q0[136];
-rz(0.22162475) q0[136];
-cx q0[135],q0[136];
-rz(-pi) q0[135];
-sx q0[135];
-rz(-pi) q0[135];
-rz(-3.0705387) q0[136];
-sx q0[136];
-rz(-pi) q0[136];
-cx q0[135],q0[136];
-sx q0[136];
-rz(3.0705387) q0[136];
-sx q0[136];
-rz(-pi) q0[136];
-cx q0[135],q0[136];
-sx q0[136];
-sx q0[137];
-rz(1.3555626) q0[137];
-cx q0[136],q0[137];
-rz(1.895919) q0[137];
-cx q0[136],q0[137];
-rz(-pi) q0[136];
-sx q0[136];
-rz(-pi) q0[136];
-rz(-2.5749166) q0[137];
-sx q0[137];
-rz(-pi) q0[137];
-cx q0[136],q0[137];
-sx q0[137];
-rz(2.5749166) q0[137];
-sx q0[137];
-rz(-pi) q0[137];
-cx q0[136],q0[137];
-sx q0[137];
-sx q0[138];
-rz(1.07411) q0[138];
-cx q0[137],q0[138];
-rz(1.4362731) q0[138];
-cx q0[137],q0[138];
-rz(-pi) q0[137];
-sx q0[137];
-rz(-pi) q0[137];
-rz(-3.0287764) q0[138];
-sx q0[138];
-rz(-pi) q0[138];
-cx q0[137],q0[138];
-sx q0[138];
-rz(3.0287764) q0[138];
-sx q0[138];
-rz(-pi) q0[138];
-cx q0[137],q0[138];
-sx q0[138];
-sx q0[139];
-rz(1.5202303) q0[139];
-cx q0[138],q0[139];
-rz(0.7003644) q0[139];
-cx q0[138],q0[139];
-rz(-pi) q0[138];
-sx q0[138];
-rz(-pi) q0[138];
-rz(-2.6359693) q0[139];
-sx q0[139];
-rz(-pi) q0[139];
-cx q0[138],q0[139];
-sx q0[139];
-rz(2.6359693) q0[139];
-sx q0[139];
-rz(-pi) q0[139];
-cx q0[138],q0[139];
-sx q0[139];
-sx q0[140];
-rz(1.9132508) q0[140];
-cx q0[139],q0[140];
-rz(1.4694396) q0[140];
-cx q0[139],q0[140];
-rz(-pi) q0[139];
-sx q0[139];
-rz(-pi) q0[139];
-rz(-2.8830288) q0[140];
-sx q0[140];
-rz(-pi) q0[140];
-cx q0[139],q0[140];
-sx q0[140];
-rz(2.8830288) q0[140];
-sx q0[140];
-rz(-pi) q0[140];
-cx q0[139],q0[140];
-sx q0[140];
-sx q0[141];
-rz(1.26463) q0[141];
-cx q0[140],q0[141];
-rz(0.85274736) q0[141];
-cx q0[140],q0[141];
-rz(-pi) q0[140];
-sx q0[140];
-rz(-pi) q0[140];
-rz(-3.1333661) q0[141];
-sx q0[141];
-rz(-pi) q0[141];
-cx q0[140],q0[141];
-sx q0[141];
-rz(3.1333661) q0[141];
-sx q0[141];
-rz(-pi) q0[141];
-cx q0[140],q0[141];
-sx q0[141];
-sx q0[142];
-rz(1.6239759) q0[142];
-cx q0[141],q0[142];
-rz(0.48645472) q0[142];
-cx q0[141],q0[142];
-rz(-pi) q0[141];
-sx q0[141];
-rz(-pi) q0[141];
-rz(-2.3417731) q0[142];
-sx q0[142];
-rz(-pi) q0[142];
-cx q0[141],q0[142];
-sx q0[142];
-rz(2.3417731) q0[142];
-sx q0[142];
-rz(-pi) q0[142];
-cx q0[141],q0[142];
-sx q0[142];
-sx q0[143];
-rz(1.8556782) q0[143];
-cx q0[142],q0[143];
-rz(1.3132601) q0[143];
-cx q0[142],q0[143];
-rz(-pi) q0[142];
-sx q0[142];
-rz(-pi) q0[142];
-rz(-2.0856763) q0[143];
-sx q0[143];
-rz(-pi) q0[143];
-cx q0[142],q0[143];
-sx q0[143];
-rz(2.0856763) q0[143];
-sx q0[143];
-rz(-pi) q0[143];
-cx q0[142],q0[143];
-sx q0[143];
-sx q0[144];
-rz(0.071622059) q0[144];
-cx q0[143],q0[144];
-rz(2.4868542) q0[144];
-cx q0[143],q0[144];
-rz(-pi) q0[143];
-sx q0[143];
-rz(-pi) q0[143];
-rz(-2.5777053) q0[144];
-sx q0[144];
-rz(-pi) q0[144];
-cx q0[143],q0[144];
-sx q0[144];
-rz(2.5777053) q0[144];
-sx q0[144];
-rz(-pi) q0[144];
-cx q0[143],q0[144];
-sx q0[144];
-sx q0[145];
-rz(2.7254925) q0[145];
-cx q0[144],q0[145];
-rz(1.4270531) q0[145];
-cx q0[144],q0[145];
-rz(-pi) q0[144];
-sx q0[144];
-rz(-pi) q0[144];
-rz(-2.3996349) q0[145];
-sx q0[145];
-rz(-pi) q0[145];
-cx q0[144],q0[145];
-sx q0[145];
-rz(2.3996349) q0[145];
-sx q0[145];
-rz(-pi) q0[145];
-cx q0[144],q0[145];
-sx q0[145];
-sx q0[146];
-rz(2.9667004) q0[146];
-cx q0[145],q0[146];
-rz(1.8061905) q0[146];
-cx q0[145],q0[146];
-rz(-pi) q0[145];
-sx q0[145];
-rz(-pi) q0[145];
-rz(-3.1282667) q0[146];
-sx q0[146];
-rz(-pi) q0[146];
-cx q0[145],q0[146];
-sx q0[146];
-rz(3.1282667) q0[146];
-sx q0[146];
-rz(-pi) q0[146];
-cx q0[145],q0[146];
-sx q0[146];
-sx q0[147];
-rz(1.4757826) q0[147];
-cx q0[146],q0[147];
-rz(0.1879796) q0[147];
-cx q0[146],q0[147];
-rz(-pi) q0[146];
-sx q0[146];
-rz(-pi) q0[146];
-rz(-2.2532331) q0[147];
-sx q0[147];
-rz(-pi) q0[147];
-cx q0[146],q0[147];
-sx q0[147];
-rz(2.2532331) q0[147];
-sx q0[147];
-rz(-pi) q0[147];
-cx q0[146],q0[147];
-sx q0[147];
-sx q0[148];
-rz(0.096425123) q0[148];
-cx q0[147],q0[148];
-rz(0.73786294) q0[148];
-cx q0[147],q0[148];
-rz(-pi) q0[147];
-sx q0[147];
-rz(-pi) q0[147];
-rz(-2.6951167) q0[148];
-sx q0[148];
-rz(-pi) q0[148];
-cx q0[147],q0[148];
-sx q0[148];
-rz(2.6951167) q0[148];
-sx q0[148];
-rz(-pi) q0[148];
-cx q0[147],q0[148];
-sx q0[148];
-sx q0[149];
-rz(1.5117888) q0[149];
-cx q0[148],q0[149];
-rz(0.47742554) q0[149];
-cx q0[148],q0[149];
-rz(-pi) q0[148];
-sx q0[148];
-rz(-pi) q0[148];
-rz(-2.1612607) q0[149];
-sx q0[149];
-rz(-pi) q0[149];
-cx q0[148],q0[149];
-sx q0[149];
-rz(2.1612607) q0[149];
-sx q0[149];
-rz(-pi) q0[149];
-cx q0[148],q0[149];
-sx q0[149];
-sx q0[150];
-rz(0.35193248) q0[150];
-cx q0[149],q0[150];
-rz(2.0210653) q0[150];
-cx q0[149],q0[150];
-rz(-pi) q0[149];
-sx q0[149];
-rz(-pi) q0[149];
-rz(-3.0929974) q0[150];
-sx q0[150];
-rz(-pi) q0[150];
-cx q0[149],q0[150];
-sx q0[150];
-rz(3.0929974) q0[150];
-sx q0[150];
-rz(-pi) q0[150];
-cx q0[149],q0[150];
-sx q0[150];
-sx q0[151];
-rz(1.7672429) q0[151];
-cx q0[150],q0[151];
-rz(1.1713892) q0[151];
-cx q0[150],q0[151];
-rz(-pi) q0[150];
-sx q0[150];
-rz(-pi) q0[150];
-rz(-1.7690662) q0[151];
-sx q0[151];
-rz(-pi) q0[151];
-cx q0[150],q0[151];
-sx q0[151];
-rz(1.7690662) q0[151];
-sx q0[151];
-rz(-pi) q0[151];
-cx q0[150],q0[151];
-sx q0[151];
-sx q0[152];
-rz(0.27767439) q0[152];
-cx q0[151],q0[152];
-rz(0.8475717) q0[152];
-cx q0[151],q0[152];
-rz(-pi) q0[151];
-sx q0[151];
-rz(-pi) q0[151];
-rz(-1.7035896) q0[152];
-sx q0[152];
-rz(-pi) q0[152];
-cx q0[151],q0[152];
-sx q0[152];
-rz(1.7035896) q0[152];
-sx q0[152];
-rz(-pi) q0[152];
-cx q0[151],q0[152];
-sx q0[152];
-sx q0[153];
-rz(1.2543821) q0[153];
-cx q0[152],q0[153];
-rz(0.80378619) q0[153];
-cx q0[152],q0[153];
-rz(-pi) q0[152];
-sx q0[152];
-rz(-pi) q0[152];
-rz(-1.9774786) q0[153];
-sx q0[153];
-rz(-pi) q0[153];
-cx q0[152],q0[153];
-sx q0[153];
-rz(1.9774786) q0[153];
-sx q0[153];
-rz(-pi) q0[153];
-cx q0[152],q0[153];
-sx q0[153];
-sx q0[154];
-rz(2.8335096) q0[154];
-cx q0[153],q0[154];
-rz(0.26959586) q0[154];
-cx q0[153],q0[154];
-rz(-pi) q0[153];
-sx q0[153];
-rz(-pi) q0[153];
-rz(-2.6444729) q0[154];
-sx q0[154];
-rz(-pi) q0[154];
-cx q0[153],q0[154];
-sx q0[154];
-rz(2.6444729) q0[154];
-sx q0[154];
-rz(-pi) q0[154];
-cx q0[153],q0[154];
-sx q0[154];
-sx q0[155];
-rz(1.6717637) q0[155];
-cx q0[154],q0[155];
-rz(1.2947419) q0[155];
-cx q0[154],q0[155];
-rz(-pi) q0[154];
-sx q0[154];
-rz(-pi) q0[154];
-rz(-2.120724) q0[155];
-sx q0[155];
-rz(-pi) q0[155];
-cx q0[154],q0[155];
-sx q0[155];
-rz(2.120724) q0[155];
-sx q0[155];
-rz(-pi) q0[155];
-cx q0[154],q0[155];
-sx q0[155];
-sx q0[156];
-rz(1.5099594) q0[156];
-cx q0[155],q0[156];
-rz(0.10108241) q0[156];
-cx q0[155],q0[156];
-rz(-pi) q0[155];
-sx q0[155];
-rz(-pi) q0[155];
-rz(-2.0824858) q0[156];
-sx q0[156];
-rz(-pi) q0[156];
-cx q0[155],q0[156];
-sx q0[156];
-rz(2.0824858) q0[156];
-sx q0[156];
-rz(-pi) q0[156];
-cx q0[155],q0[156];
-sx q0[156];
-sx q0[157];
-rz(1.5359967) q0[157];
-cx q0[156],q0[157];
-rz(2.326777) q0[157];
-cx q0[156],q0[157];
-rz(-pi) q0[156];
-sx q0[156];
-rz(-pi) q0[156];
-rz(-2.7860601) q0[157];
-sx q0[157];
-rz(-pi) q0[157];
-cx q0[156],q0[157];
-sx q0[157];
-rz(2.7860601) q0[157];
-sx q0[157];
-rz(-pi) q0[157];
-cx q0[156],q0[157];
-sx q0[157];
-sx q0[158];
-rz(1.3336379) q0[158];
-cx q0[157],q0[158];
-rz(1.4580794) q0[158];
-cx q0[157],q0[158];
-rz(-pi) q0[157];
-sx q0[157];
-rz(-pi) q0[157];
-rz(-2.1421871) q0[158];
-sx q0[158];
-rz(-pi) q0[158];
-cx q0[157],q0[158];
-sx q0[158];
-rz(2.1421871) q0[158];
-sx q0[158];
-rz(-pi) q0[158];
-cx q0[157],q0[158];
-sx q0[158];
-sx q0[159];
-rz(0.6218792) q0[159];
-cx q0[158],q0[159];
-rz(1.691651) q0[159];
-cx q0[158],q0[159];
-rz(-pi) q0[158];
-sx q0[158];
-rz(-pi) q0[158];
-rz(-2.1881459) q0[159];
-sx q0[159];
-rz(-pi) q0[159];
-cx q0[158],q0[159];
-sx q0[159];
-rz(2.1881459) q0[159];
-sx q0[159];
-rz(-pi) q0[159];
-cx q0[158],q0[159];
-sx q0[159];
-sx q0[160];
-rz(0.59495103) q0[160];
-cx q0[159],q0[160];
-rz(2.2696822) q0[160];
-cx q0[159],q0[160];
-rz(-pi) q0[159];
-sx q0[159];
-rz(-pi) q0[159];
-rz(-2.5701025) q0[160];
-sx q0[160];
-rz(-pi) q0[160];
-cx q0[159],q0[160];
-sx q0[160];
-rz(2.5701025) q0[160];
-sx q0[160];
-rz(-pi) q0[160];
-cx q0[159],q0[160];
-sx q0[160];
-sx q0[161];
-rz(0.19783851) q0[161];
-cx q0[160],q0[161];
-rz(2.2644066) q0[161];
-cx q0[160],q0[161];
-rz(-pi) q0[160];
-sx q0[160];
-rz(-pi) q0[160];
-rz(-2.705821) q0[161];
-sx q0[161];
-rz(-pi) q0[161];
-cx q0[160],q0[161];
-sx q0[161];
-rz(2.705821) q0[161];
-sx q0[161];
-rz(-pi) q0[161];
-cx q0[160],q0[161];
-sx q0[161];
-sx q0[162];
-rz(2.428694) q0[162];
-cx q0[161],q0[162];
-rz(1.3197938) q0[162];
-cx q0[161],q0[162];
-rz(-pi) q0[161];
-sx q0[161];
-rz(-pi) q0[161];
-rz(-1.9863193) q0[162];
-sx q0[162];
-rz(-pi) q0[162];
-cx q0[161],q0[162];
-sx q0[162];
-rz(1.9863193) q0[162];
-sx q0[162];
-rz(-pi) q0[162];
-cx q0[161],q0[162];
-sx q0[162];
-sx q0[163];
-rz(0.73451069) q0[163];
-cx q0[162],q0[163];
-rz(1.3165732) q0[163];
-cx q0[162],q0[163];
-rz(-pi) q0[162];
-sx q0[162];
-rz(-pi) q0[162];
-rz(-1.8556606) q0[163];
-sx q0[163];
-rz(-pi) q0[163];
-cx q0[162],q0[163];
-sx q0[163];
-rz(1.8556606) q0[163];
-sx q0[163];
-rz(-pi) q0[163];
-cx q0[162],q0[163];
-sx q0[163];
-sx q0[164];
-rz(2.5243719) q0[164];
-cx q0[163],q0[164];
-rz(1.934567) q0[164];
-cx q0[163],q0[164];
-rz(-pi) q0[163];
-sx q0[163];
-rz(-pi) q0[163];
-rz(-1.9740767) q0[164];
-sx q0[164];
-rz(-pi) q0[164];
-cx q0[163],q0[164];
-sx q0[164];
-rz(1.9740767) q0[164];
-sx q0[164];
-rz(-pi) q0[164];
-cx q0[163],q0[164];
-sx q0[164];
-sx q0[165];
-rz(0.714249) q0[165];
-cx q0[164],q0[165];
-rz(2.403996) q0[165];
-cx q0[164],q0[165];
-rz(-pi) q0[164];
-sx q0[164];
-rz(-pi) q0[164];
-rz(-2.8562065) q0[165];
-sx q0[165];
-rz(-pi) q0[165];
-cx q0[164],q0[165];
-sx q0[165];
-rz(2.8562065) q0[165];
-sx q0[165];
-rz(-pi) q0[165];
-cx q0[164],q0[165];
-sx q0[165];
-sx q0[166];
-rz(1.7974171) q0[166];
-cx q0[165],q0[166];
-rz(0.13362985) q0[166];
-cx q0[165],q0[166];
-rz(-pi) q0[165];
-sx q0[165];
-rz(-pi) q0[165];
-rz(-2.5069216) q0[166];
-sx q0[166];
-rz(-pi) q0[166];
-cx q0[165],q0[166];
-sx q0[166];
-rz(2.5069216) q0[166];
-sx q0[166];
-rz(-pi) q0[166];
-cx q0[165],q0[166];
-sx q0[166];
-sx q0[167];
-rz(0.48833077) q0[167];
-cx q0[166],q0[167];
-rz(2.710656) q0[167];
-cx q0[166],q0[167];
-rz(-pi) q0[166];
-sx q0[166];
-rz(-pi) q0[166];
-rz(-1.6098796) q0[167];
-sx q0[167];
-rz(-pi) q0[167];
-cx q0[166],q0[167];
-sx q0[167];
-rz(1.6098796) q0[167];
-sx q0[167];
-rz(-pi) q0[167];
-cx q0[166],q0[167];
-sx q0[167];
-sx q0[168];
-rz(1.7617925) q0[168];
-cx q0[167],q0[168];
-rz(1.7842596) q0[168];
-cx q0[167],q0[168];
-rz(-pi) q0[167];
-sx q0[167];
-rz(-pi) q0[167];
-rz(-2.6053252) q0[168];
-sx q0[168];
-rz(-pi) q0[168];
-cx q0[167],q0[168];
-sx q0[168];
-rz(2.6053252) q0[168];
-sx q0[168];
-rz(-pi) q0[168];
-cx q0[167],q0[168];
-sx q0[168];
-sx q0[169];
-rz(2.7372153) q0[169];
-cx q0[168],q0[169];
-rz(1.7025804) q0[169];
-cx q0[168],q0[169];
-rz(-pi) q0[168];
-sx q0[168];
-rz(-pi) q0[168];
-rz(-1.6167652) q0[169];
-sx q0[169];
-rz(-pi) q0[169];
-cx q0[168],q0[169];
-sx q0[169];
-rz(1.6167652) q0[169];
-sx q0[169];
-rz(-pi) q0[169];
-cx q0[168],q0[169];
-sx q0[169];
-sx q0[170];
-rz(3.0868505) q0[170];
-cx q0[169],q0[170];
-rz(2.7891683) q0[170];
-cx q0[169],q0[170];
-rz(-pi) q0[169];
-sx q0[169];
-rz(-pi) q0[169];
-rz(-2.1798123) q0[170];
-sx q0[170];
-rz(-pi) q0[170];
-cx q0[169],q0[170];
-sx q0[170];
-rz(2.1798123) q0[170];
-sx q0[170];
-rz(-pi) q0[170];
-cx q0[169],q0[170];
-sx q0[170];
-sx q0[171];
-rz(1.6677942) q0[171];
-cx q0[170],q0[171];
-rz(2.8724826) q0[171];
-cx q0[170],q0[171];
-rz(-pi) q0[170];
-sx q0[170];
-rz(-pi) q0[170];
-rz(-1.6841836) q0[171];
-sx q0[171];
-rz(-pi) q0[171];
-cx q0[170],q0[171];
-sx q0[171];
-rz(1.6841836) q0[171];
-sx q0[171];
-rz(-pi) q0[171];
-cx q0[170],q0[171];
-sx q0[171];
-sx q0[172];
-rz(2.7151124) q0[172];
-cx q0[171],q0[172];
-rz(0.76999502) q0[172];
-cx q0[171],q0[172];
-rz(-pi) q0[171];
-sx q0[171];
-rz(-pi) q0[171];
-rz(-2.7977891) q0[172];
-sx q0[172];
-rz(-pi) q0[172];
-cx q0[171],q0[172];
-sx q0[172];
-rz(2.7977891) q0[172];
-sx q0[172];
-rz(-pi) q0[172];
-cx q0[171],q0[172];
-sx q0[172];
-sx q0[173];
-rz(1.039549) q0[173];
-cx q0[172],q0[173];
-rz(1.7606676) q0[173];
-cx q0[172],q0[173];
-rz(-pi) q0[172];
-sx q0[172];
-rz(-pi) q0[172];
-rz(-2.2782314) q0[173];
-sx q0[173];
-rz(-pi) q0[173];
-cx q0[172],q0[173];
-sx q0[173];
-rz(2.2782314) q0[173];
-sx q0[173];
-rz(-pi) q0[173];
-cx q0[172],q0[173];
-sx q0[173];
-sx q0[174];
-rz(1.5538977) q0[174];
-cx q0[173],q0[174];
-rz(2.4825255) q0[174];
-cx q0[173],q0[174];
-rz(-pi) q0[173];
-sx q0[173];
-rz(-pi) q0[173];
-rz(-2.8863599) q0[174];
-sx q0[174];
-rz(-pi) q0[174];
-cx q0[173],q0[174];
-sx q0[174];
-rz(2.8863599) q0[174];
-sx q0[174];
-rz(-pi) q0[174];
-cx q0[173],q0[174];
-sx q0[174];
-sx q0[175];
-rz(0.050737995) q0[175];
-cx q0[174],q0[175];
-rz(0.27171571) q0[175];
-cx q0[174],q0[175];
-rz(-pi) q0[174];
-sx q0[174];
-rz(-pi) q0[174];
-rz(-2.8394928) q0[175];
-sx q0[175];
-rz(-pi) q0[175];
-cx q0[174],q0[175];
-sx q0[175];
-rz(2.8394928) q0[175];
-sx q0[175];
-rz(-pi) q0[175];
-cx q0[174],q0[175];
-sx q0[175];
-sx q0[176];
-rz(2.5832453) q0[176];
-cx q0[175],q0[176];
-rz(1.9940917) q0[176];
-cx q0[175],q0[176];
-rz(-pi) q0[175];
-sx q0[175];
-rz(-pi) q0[175];
-rz(-1.6542549) q0[176];
-sx q0[176];
-rz(-pi) q0[176];
-cx q0[175],q0[176];
-sx q0[176];
-rz(1.6542549) q0[176];
-sx q0[176];
-rz(-pi) q0[176];
-cx q0[175],q0[176];
-sx q0[176];
-sx q0[177];
-rz(2.2932145) q0[177];
-cx q0[176],q0[177];
-rz(0.96574929) q0[177];
-cx q0[176],q0[177];
-rz(-pi) q0[176];
-sx q0[176];
-rz(-pi) q0[176];
-rz(-2.0858422) q0[177];
-sx q0[177];
-rz(-pi) q0[177];
-cx q0[176],q0[177];
-sx q0[177];
-rz(2.0858422) q0[177];
-sx q0[177];
-rz(-pi) q0[177];
-cx q0[176],q0[177];
-sx q0[177];
-sx q0[178];
-rz(2.820381) q0[178];
-cx q0[177],q0[178];
-rz(1.1839278) q0[178];
-cx q0[177],q0[178];
-rz(-pi) q0[177];
-sx q0[177];
-rz(-pi) q0[177];
-rz(-2.3126705) q0[178];
-sx q0[178];
-rz(-pi) q0[178];
-cx q0[177],q0[178];
-sx q0[178];
-rz(2.3126705) q0[178];
-sx q0[178];
-rz(-pi) q0[178];
-cx q0[177],q0[178];
-sx q0[178];
-sx q0[179];
-rz(2.1697064) q0[179];
-cx q0[178],q0[179];
-rz(0.48290499) q0[179];
-cx q0[178],q0[179];
-rz(-pi) q0[178];
-sx q0[178];
-rz(-pi) q0[178];
-rz(-2.6320332) q0[179];
-sx q0[179];
-rz(-pi) q0[179];
-cx q0[178],q0[179];
-sx q0[179];
-rz(2.6320332) q0[179];
-sx q0[179];
-rz(-pi) q0[179];
-cx q0[178],q0[179];
-sx q0[179];
-sx q0[180];
-rz(1.1043273) q0[180];
-cx q0[179],q0[180];
-rz(2.0428957) q0[180];
-cx q0[179],q0[180];
-rz(-pi) q0[179];
-sx q0[179];
-rz(-pi) q0[179];
-rz(-3.0221161) q0[180];
-sx q0[180];
-rz(-pi) q0[180];
-cx q0[179],q0[180];
-sx q0[180];
-rz(3.0221161) q0[180];
-sx q0[180];
-rz(-pi) q0[180];
-cx q0[179],q0[180];
-sx q0[180];
-sx q0[181];
-rz(0.87948015) q0[181];
-cx q0[180],q0[181];
-rz(1.0737364) q0[181];
-cx q0[180],q0[181];
-rz(-pi) q0[180];
-sx q0[180];
-rz(-pi) q0[180];
-rz(-2.2745269) q0[181];
-sx q0[181];
-rz(-pi) q0[181];
-cx q0[180],q0[181];
-sx q0[181];
-rz(2.2745269) q0[181];
-sx q0[181];
-rz(-pi) q0[181];
-cx q0[180],q0[181];
-sx q0[181];
-sx q0[182];
-rz(0.9698103) q0[182];
-cx q0[181],q0[182];
-rz(0.72853883) q0[182];
-cx q0[181],q0[182];
-rz(-pi) q0[181];
-sx q0[181];
-rz(-pi) q0[181];
-rz(-3.0879685) q0[182];
-sx q0[182];
-rz(-pi) q0[182];
-cx q0[181],q0[182];
-sx q0[182];
-rz(3.0879685) q0[182];
-sx q0[182];
-rz(-pi) q0[182];
-cx q0[181],q0[182];
-sx q0[182];
-sx q0[183];
-rz(1.3678651) q0[183];
-cx q0[182],q0[183];
-rz(2.0294928) q0[183];
-cx q0[182],q0[183];
-rz(-pi) q0[182];
-sx q0[182];
-rz(-pi) q0[182];
-rz(-2.0862279) q0[183];
-sx q0[183];
-rz(-pi) q0[183];
-cx q0[182],q0[183];
-sx q0[183];
-rz(2.0862279) q0[183];
-sx q0[183];
-rz(-pi) q0[183];
-cx q0[182],q0[183];
-sx q0[183];
-sx q0[184];
-rz(2.0495293) q0[184];
-cx q0[183],q0[184];
-rz(0.68880536) q0[184];
-cx q0[183],q0[184];
-rz(-pi) q0[183];
-sx q0[183];
-rz(-pi) q0[183];
-rz(-2.6291921) q0[184];
-sx q0[184];
-rz(-pi) q0[184];
-cx q0[183],q0[184];
-sx q0[184];
-rz(2.6291921) q0[184];
-sx q0[184];
-rz(-pi) q0[184];
-cx q0[183],q0[184];
-sx q0[184];
-sx q0[185];
-rz(2.152917) q0[185];
-cx q0[184],q0[185];
-rz(0.53211821) q0[185];
-cx q0[184],q0[185];
-rz(-pi) q0[184];
-sx q0[184];
-rz(-pi) q0[184];
-rz(-1.6531906) q0[185];
-sx q0[185];
-rz(-pi) q0[185];
-cx q0[184],q0[185];
-sx q0[185];
-rz(1.6531906) q0[185];
-sx q0[185];
-rz(-pi) q0[185];
-cx q0[184],q0[185];
-sx q0[185];
-sx q0[186];
-rz(2.0983427) q0[186];
-cx q0[185],q0[186];
-rz(1.2958097) q0[186];
-cx q0[185],q0[186];
-rz(-pi) q0[185];
-sx q0[185];
-rz(-pi) q0[185];
-rz(-3.1028264) q0[186];
-sx q0[186];
-rz(-pi) q0[186];
-cx q0[185],q0[186];
-sx q0[186];
-rz(3.1028264) q0[186];
-sx q0[186];
-rz(-pi) q0[186];
-cx q0[185],q0[186];
-sx q0[186];
-sx q0[187];
-rz(0.69528419) q0[187];
-cx q0[186],q0[187];
-rz(2.2534931) q0[187];
-cx q0[186],q0[187];
-rz(-pi) q0[186];
-sx q0[186];
-rz(-pi) q0[186];
-rz(-1.6671953) q0[187];
-sx q0[187];
-rz(-pi) q0[187];
-cx q0[186],q0[187];
-sx q0[187];
-rz(1.6671953) q0[187];
-sx q0[187];
-rz(-pi) q0[187];
-cx q0[186],q0[187];
-sx q0[187];
-sx q0[188];
-rz(2.1648894) q0[188];
-cx q0[187],q0[188];
-rz(0.14357148) q0[188];
-cx q0[187],q0[188];
-rz(-pi) q0[187];
-sx q0[187];
-rz(-pi) q0[187];
-rz(-3.068146) q0[188];
-sx q0[188];
-rz(-pi) q0[188];
-cx q0[187],q0[188];
-sx q0[188];
-rz(3.068146) q0[188];
-sx q0[188];
-rz(-pi) q0[188];
-cx q0[187],q0[188];
-sx q0[188];
-sx q0[189];
-rz(0.10610008) q0[189];
-cx q0[188],q0[189];
-rz(0.49606494) q0[189];
-cx q0[188],q0[189];
-rz(-pi) q0[188];
-sx q0[188];
-rz(-pi) q0[188];
-rz(-2.0799781) q0[189];
-sx q0[189];
-rz(-pi) q0[189];
-cx q0[188],q0[189];
-sx q0[189];
-rz(2.0799781) q0[189];
-sx q0[189];
-rz(-pi) q0[189];
-cx q0[188],q0[189];
-sx q0[189];
-sx q0[190];
-rz(2.6593406) q0[190];
-cx q0[189],q0[190];
-rz(1.1518938) q0[190];
-cx q0[189],q0[190];
-rz(-pi) q0[189];
-sx q0[189];
-rz(-pi) q0[189];
-rz(-1.7002171) q0[190];
-sx q0[190];
-rz(-pi) q0[190];
-cx q0[189],q0[190];
-sx q0[190];
-rz(1.7002171) q0[190];
-sx q0[190];
-rz(-pi) q0[190];
-cx q0[189],q0[190];
-sx q0[190];
-sx q0[191];
-rz(3.1207505) q0[191];
-cx q0[190],q0[191];
-rz(2.2568389) q0[191];
-cx q0[190],q0[191];
-rz(-pi) q0[190];
-sx q0[190];
-rz(-pi) q0[190];
-rz(-2.8073519) q0[191];
-sx q0[191];
-rz(-pi) q0[191];
-cx q0[190],q0[191];
-sx q0[191];
-rz(2.8073519) q0[191];
-sx q0[191];
-rz(-pi) q0[191];
-cx q0[190],q0[191];
-sx q0[191];
-sx q0[192];
-rz(0.044618441) q0[192];
-cx q0[191],q0[192];
-rz(1.5989233) q0[192];
-cx q0[191],q0[192];
-rz(-pi) q0[191];
-sx q0[191];
-rz(-pi) q0[191];
-rz(-2.1063298) q0[192];
-sx q0[192];
-rz(-pi) q0[192];
-cx q0[191],q0[192];
-sx q0[192];
-rz(2.1063298) q0[192];
-sx q0[192];
-rz(-pi) q0[192];
-cx q0[191],q0[192];
-sx q0[192];
-sx q0[193];
-rz(0.063793651) q0[193];
-cx q0[192],q0[193];
-rz(2.4428539) q0[193];
-cx q0[192],q0[193];
-rz(-pi) q0[192];
-sx q0[192];
-rz(-pi) q0[192];
-rz(-2.0140816) q0[193];
-sx q0[193];
-rz(-pi) q0[193];
-cx q0[192],q0[193];
-sx q0[193];
-rz(2.0140816) q0[193];
-sx q0[193];
-rz(-pi) q0[193];
-cx q0[192],q0[193];
-sx q0[193];
-sx q0[194];
-rz(0.62656161) q0[194];
-cx q0[193],q0[194];
-rz(2.6922271) q0[194];
-cx q0[193],q0[194];
-rz(-pi) q0[193];
-sx q0[193];
-rz(-pi) q0[193];
-rz(-1.6767543) q0[194];
-sx q0[194];
-rz(-pi) q0[194];
-cx q0[193],q0[194];
-sx q0[194];
-rz(1.6767543) q0[194];
-sx q0[194];
-rz(-pi) q0[194];
-cx q0[193],q0[194];
-sx q0[194];
-sx q0[195];
-rz(3.1179568) q0[195];
-cx q0[194],q0[195];
-rz(2.2720786) q0[195];
-cx q0[194],q0[195];
-rz(-pi) q0[194];
-sx q0[194];
-rz(-pi) q0[194];
-rz(-2.8020633) q0[195];
-sx q0[195];
-rz(-pi) q0[195];
-cx q0[194],q0[195];
-sx q0[195];
-rz(2.8020633) q0[195];
-sx q0[195];
-rz(-pi) q0[195];
-cx q0[194],q0[195];
-sx q0[195];
-sx q0[196];
-rz(2.8625736) q0[196];
-cx q0[195],q0[196];
-rz(2.2420432) q0[196];
-cx q0[195],q0[196];
-rz(-pi) q0[195];
-sx q0[195];
-rz(-pi) q0[195];
-rz(-2.5694364) q0[196];
-sx q0[196];
-rz(-pi) q0[196];
-cx q0[195],q0[196];
-sx q0[196];
-rz(2.5694364) q0[196];
-sx q0[196];
-rz(-pi) q0[196];
-cx q0[195],q0[196];
-sx q0[196];
-sx q0[197];
-rz(2.5063983) q0[197];
-cx q0[196],q0[197];
-rz(2.5245415) q0[197];
-cx q0[196],q0[197];
-rz(-pi) q0[196];
-sx q0[196];
-rz(-pi) q0[196];
-rz(-2.4079371) q0[197];
-sx q0[197];
-rz(-pi) q0[197];
-cx q0[196],q0[197];
-sx q0[197];
-rz(2.4079371) q0[197];
-sx q0[197];
-rz(-pi) q0[197];
-cx q0[196],q0[197];
-sx q0[198];
-rz(0.45449626) q0[198];
-sx q0[199];
-rz(0.51134631) q0[199];
-cx q0[198],q0[199];
-rz(0.33273558) q0[199];
-cx q0[198],q0[199];
-rz(-pi) q0[198];
-sx q0[198];
-rz(-pi) q0[198];
-rz(-2.9964102) q0[199];
-sx q0[199];
-rz(-pi) q0[199];
-cx q0[198],q0[199];
-sx q0[199];
-rz(2.9964102) q0[199];
-sx q0[199];
-rz(-pi) q0[199];
-cx q0[198],q0[199];
-cx q0[198],q0[1];
-rz(pi/2) q0[198];
-sx q0[198];
-rz(pi/2) q0[198];
-cx q0[1],q0[198];
-rz(-pi/4) q0[198];
-cx q0[0],q0[198];
-rz(pi/4) q0[198];
-cx q0[1],q0[198];
-rz(pi/4) q0[1];
-rz(-pi/4) q0[198];
-cx q0[0],q0[198];
-cx q0[0],q0[1];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[1];
-cx q0[0],q0[1];
-rz(3*pi/4) q0[198];
-sx q0[198];
-rz(pi/2) q0[198];
-cx q0[198],q0[1];
-sx q0[199];
-sx q0[200];
-rz(2.3482473) q0[200];
-cx q0[199],q0[200];
-rz(1.9473938) q0[200];
-cx q0[199],q0[200];
-rz(-pi) q0[199];
-sx q0[199];
-rz(-pi) q0[199];
-rz(-2.8984971) q0[200];
-sx q0[200];
-rz(-pi) q0[200];
-cx q0[199],q0[200];
-sx q0[200];
-rz(2.8984971) q0[200];
-sx q0[200];
-rz(-pi) q0[200];
-cx q0[199],q0[200];
-cx q0[199],q0[2];
-rz(pi/2) q0[199];
-sx q0[199];
-rz(pi/2) q0[199];
-cx q0[2],q0[199];
-rz(-pi/4) q0[199];
-cx q0[0],q0[199];
-rz(pi/4) q0[199];
-cx q0[2],q0[199];
-rz(-pi/4) q0[199];
-cx q0[0],q0[199];
-rz(3*pi/4) q0[199];
-sx q0[199];
-rz(pi/2) q0[199];
-rz(pi/4) q0[2];
-cx q0[0],q0[2];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[2];
-cx q0[0],q0[2];
-cx q0[199],q0[2];
-sx q0[200];
-sx q0[201];
-rz(2.6058162) q0[201];
-cx q0[200],q0[201];
-rz(1.4606068) q0[201];
-cx q0[200],q0[201];
-rz(-pi) q0[200];
-sx q0[200];
-rz(-pi) q0[200];
-rz(-2.1532) q0[201];
-sx q0[201];
-rz(-pi) q0[201];
-cx q0[200],q0[201];
-sx q0[201];
-rz(2.1532) q0[201];
-sx q0[201];
-rz(-pi) q0[201];
-cx q0[200],q0[201];
-cx q0[200],q0[3];
-rz(pi/2) q0[200];
-sx q0[200];
-rz(pi/2) q0[200];
-sx q0[201];
-cx q0[3],q0[200];
-rz(-pi/4) q0[200];
-cx q0[0],q0[200];
-rz(pi/4) q0[200];
-cx q0[3],q0[200];
-rz(-pi/4) q0[200];
-cx q0[0],q0[200];
-rz(3*pi/4) q0[200];
-sx q0[200];
-rz(pi/2) q0[200];
-rz(pi/4) q0[3];
-cx q0[0],q0[3];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[3];
-cx q0[0],q0[3];
-cx q0[200],q0[3];
-sx q0[202];
-rz(2.5851275) q0[202];
-cx q0[201],q0[202];
-rz(1.1393161) q0[202];
-cx q0[201],q0[202];
-rz(-pi) q0[201];
-sx q0[201];
-rz(-pi) q0[201];
-rz(-1.730432) q0[202];
-sx q0[202];
-rz(-pi) q0[202];
-cx q0[201],q0[202];
-sx q0[202];
-rz(1.730432) q0[202];
-sx q0[202];
-rz(-pi) q0[202];
-cx q0[201],q0[202];
-cx q0[201],q0[4];
-rz(pi/2) q0[201];
-sx q0[201];
-rz(pi/2) q0[201];
-sx q0[202];
-cx q0[4],q0[201];
-rz(-pi/4) q0[201];
-cx q0[0],q0[201];
-rz(pi/4) q0[201];
-cx q0[4],q0[201];
-rz(-pi/4) q0[201];
-cx q0[0],q0[201];
-rz(3*pi/4) q0[201];
-sx q0[201];
-rz(pi/2) q0[201];
-rz(pi/4) q0[4];
-cx q0[0],q0[4];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[4];
-cx q0[0],q0[4];
-cx q0[201],q0[4];
-sx q0[203];
-rz(2.0399198) q0[203];
-cx q0[202],q0[203];
-rz(2.4325036) q0[203];
-cx q0[202],q0[203];
-rz(-pi) q0[202];
-sx q0[202];
-rz(-pi) q0[202];
-rz(-1.7087062) q0[203];
-sx q0[203];
-rz(-pi) q0[203];
-cx q0[202],q0[203];
-sx q0[203];
-rz(1.7087062) q0[203];
-sx q0[203];
-rz(-pi) q0[203];
-cx q0[202],q0[203];
-cx q0[202],q0[5];
-rz(pi/2) q0[202];
-sx q0[202];
-rz(pi/2) q0[202];
-sx q0[203];
-cx q0[5],q0[202];
-rz(-pi/4) q0[202];
-cx q0[0],q0[202];
-rz(pi/4) q0[202];
-cx q0[5],q0[202];
-rz(-pi/4) q0[202];
-cx q0[0],q0[202];
-rz(3*pi/4) q0[202];
-sx q0[202];
-rz(pi/2) q0[202];
-rz(pi/4) q0[5];
-cx q0[0],q0[5];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[5];
-cx q0[0],q0[5];
-cx q0[202],q0[5];
-sx q0[204];
-rz(1.7807831) q0[204];
-cx q0[203],q0[204];
-rz(0.62183805) q0[204];
-cx q0[203],q0[204];
-rz(-pi) q0[203];
-sx q0[203];
-rz(-pi) q0[203];
-rz(-1.9152212) q0[204];
-sx q0[204];
-rz(-pi) q0[204];
-cx q0[203],q0[204];
-sx q0[204];
-rz(1.9152212) q0[204];
-sx q0[204];
-rz(-pi) q0[204];
-cx q0[203],q0[204];
-cx q0[203],q0[6];
-rz(pi/2) q0[203];
-sx q0[203];
-rz(pi/2) q0[203];
-sx q0[204];
-cx q0[6],q0[203];
-rz(-pi/4) q0[203];
-cx q0[0],q0[203];
-rz(pi/4) q0[203];
-cx q0[6],q0[203];
-rz(-pi/4) q0[203];
-cx q0[0],q0[203];
-rz(3*pi/4) q0[203];
-sx q0[203];
-rz(pi/2) q0[203];
-rz(pi/4) q0[6];
-cx q0[0],q0[6];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[6];
-cx q0[0],q0[6];
-cx q0[203],q0[6];
-sx q0[205];
-rz(0.48156072) q0[205];
-cx q0[204],q0[205];
-rz(0.66701395) q0[205];
-cx q0[204],q0[205];
-rz(-pi) q0[204];
-sx q0[204];
-rz(-pi) q0[204];
-rz(-2.9660793) q0[205];
-sx q0[205];
-rz(-pi) q0[205];
-cx q0[204],q0[205];
-sx q0[205];
-rz(2.9660793) q0[205];
-sx q0[205];
-rz(-pi) q0[205];
-cx q0[204],q0[205];
-cx q0[204],q0[7];
-rz(pi/2) q0[204];
-sx q0[204];
-rz(pi/2) q0[204];
-sx q0[205];
-cx q0[7],q0[204];
-rz(-pi/4) q0[204];
-cx q0[0],q0[204];
-rz(pi/4) q0[204];
-cx q0[7],q0[204];
-rz(-pi/4) q0[204];
-cx q0[0],q0[204];
-rz(3*pi/4) q0[204];
-sx q0[204];
-rz(pi/2) q0[204];
-rz(pi/4) q0[7];
-cx q0[0],q0[7];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[7];
-cx q0[0],q0[7];
-cx q0[204],q0[7];
-sx q0[206];
-rz(0.90396812) q0[206];
-cx q0[205],q0[206];
-rz(2.9040686) q0[206];
-cx q0[205],q0[206];
-rz(-pi) q0[205];
-sx q0[205];
-rz(-pi) q0[205];
-rz(-1.8150511) q0[206];
-sx q0[206];
-rz(-pi) q0[206];
-cx q0[205],q0[206];
-sx q0[206];
-rz(1.8150511) q0[206];
-sx q0[206];
-rz(-pi) q0[206];
-cx q0[205],q0[206];
-cx q0[205],q0[8];
-rz(pi/2) q0[205];
-sx q0[205];
-rz(pi/2) q0[205];
-sx q0[206];
-cx q0[8],q0[205];
-rz(-pi/4) q0[205];
-cx q0[0],q0[205];
-rz(pi/4) q0[205];
-cx q0[8],q0[205];
-rz(-pi/4) q0[205];
-cx q0[0],q0[205];
-rz(3*pi/4) q0[205];
-sx q0[205];
-rz(pi/2) q0[205];
-rz(pi/4) q0[8];
-cx q0[0],q0[8];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[8];
-cx q0[0],q0[8];
-cx q0[205],q0[8];
-sx q0[207];
-rz(2.1108017) q0[207];
-cx q0[206],q0[207];
-rz(0.99796253) q0[207];
-cx q0[206],q0[207];
-rz(-pi) q0[206];
-sx q0[206];
-rz(-pi) q0[206];
-rz(-1.9807993) q0[207];
-sx q0[207];
-rz(-pi) q0[207];
-cx q0[206],q0[207];
-sx q0[207];
-rz(1.9807993) q0[207];
-sx q0[207];
-rz(-pi) q0[207];
-cx q0[206],q0[207];
-cx q0[206],q0[9];
-rz(pi/2) q0[206];
-sx q0[206];
-rz(pi/2) q0[206];
-sx q0[207];
-cx q0[9],q0[206];
-rz(-pi/4) q0[206];
-cx q0[0],q0[206];
-rz(pi/4) q0[206];
-cx q0[9],q0[206];
-rz(-pi/4) q0[206];
-cx q0[0],q0[206];
-rz(3*pi/4) q0[206];
-sx q0[206];
-rz(pi/2) q0[206];
-rz(pi/4) q0[9];
-cx q0[0],q0[9];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[9];
-cx q0[0],q0[9];
-cx q0[206],q0[9];
-sx q0[208];
-rz(2.2842531) q0[208];
-cx q0[207],q0[208];
-rz(3.0439985) q0[208];
-cx q0[207],q0[208];
-rz(-pi) q0[207];
-sx q0[207];
-rz(-pi) q0[207];
-rz(-3.0752342) q0[208];
-sx q0[208];
-rz(-pi) q0[208];
-cx q0[207],q0[208];
-sx q0[208];
-rz(3.0752342) q0[208];
-sx q0[208];
-rz(-pi) q0[208];
-cx q0[207],q0[208];
-cx q0[207],q0[10];
-rz(pi/2) q0[207];
-sx q0[207];
-rz(pi/2) q0[207];
-cx q0[10],q0[207];
-rz(-pi/4) q0[207];
-cx q0[0],q0[207];
-rz(pi/4) q0[207];
-cx q0[10],q0[207];
-rz(pi/4) q0[10];
-rz(-pi/4) q0[207];
-cx q0[0],q0[207];
-cx q0[0],q0[10];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[10];
-cx q0[0],q0[10];
-rz(3*pi/4) q0[207];
-sx q0[207];
-rz(pi/2) q0[207];
-cx q0[207],q0[10];
-sx q0[208];
-sx q0[209];
-rz(2.3967002) q0[209];
-cx q0[208],q0[209];
-rz(0.20453229) q0[209];
-cx q0[208],q0[209];
-rz(-pi) q0[208];
-sx q0[208];
-rz(-pi) q0[208];
-rz(-2.2611796) q0[209];
-sx q0[209];
-rz(-pi) q0[209];
-cx q0[208],q0[209];
-sx q0[209];
-rz(2.2611796) q0[209];
-sx q0[209];
-rz(-pi) q0[209];
-cx q0[208],q0[209];
-cx q0[208],q0[11];
-rz(pi/2) q0[208];
-sx q0[208];
-rz(pi/2) q0[208];
-cx q0[11],q0[208];
-rz(-pi/4) q0[208];
-cx q0[0],q0[208];
-rz(pi/4) q0[208];
-cx q0[11],q0[208];
-rz(pi/4) q0[11];
-rz(-pi/4) q0[208];
-cx q0[0],q0[208];
-cx q0[0],q0[11];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[11];
-cx q0[0],q0[11];
-rz(3*pi/4) q0[208];
-sx q0[208];
-rz(pi/2) q0[208];
-cx q0[208],q0[11];
-sx q0[209];
-sx q0[210];
-rz(2.7061945) q0[210];
-cx q0[209],q0[210];
-rz(0.28573577) q0[210];
-cx q0[209],q0[210];
-rz(-pi) q0[209];
-sx q0[209];
-rz(-pi) q0[209];
-rz(-1.6199703) q0[210];
-sx q0[210];
-rz(-pi) q0[210];
-cx q0[209],q0[210];
-sx q0[210];
-rz(1.6199703) q0[210];
-sx q0[210];
-rz(-pi) q0[210];
-cx q0[209],q0[210];
-cx q0[209],q0[12];
-rz(pi/2) q0[209];
-sx q0[209];
-rz(pi/2) q0[209];
-cx q0[12],q0[209];
-rz(-pi/4) q0[209];
-cx q0[0],q0[209];
-rz(pi/4) q0[209];
-cx q0[12],q0[209];
-rz(pi/4) q0[12];
-rz(-pi/4) q0[209];
-cx q0[0],q0[209];
-cx q0[0],q0[12];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[12];
-cx q0[0],q0[12];
-rz(3*pi/4) q0[209];
-sx q0[209];
-rz(pi/2) q0[209];
-cx q0[209],q0[12];
-sx q0[210];
-sx q0[211];
-rz(2.9963796) q0[211];
-cx q0[210],q0[211];
-rz(3.0013781) q0[211];
-cx q0[210],q0[211];
-rz(-pi) q0[210];
-sx q0[210];
-rz(-pi) q0[210];
-rz(-1.9647001) q0[211];
-sx q0[211];
-rz(-pi) q0[211];
-cx q0[210],q0[211];
-sx q0[211];
-rz(1.9647001) q0[211];
-sx q0[211];
-rz(-pi) q0[211];
-cx q0[210],q0[211];
-cx q0[210],q0[13];
-rz(pi/2) q0[210];
-sx q0[210];
-rz(pi/2) q0[210];
-cx q0[13],q0[210];
-rz(-pi/4) q0[210];
-cx q0[0],q0[210];
-rz(pi/4) q0[210];
-cx q0[13],q0[210];
-rz(pi/4) q0[13];
-rz(-pi/4) q0[210];
-cx q0[0],q0[210];
-cx q0[0],q0[13];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[13];
-cx q0[0],q0[13];
-rz(3*pi/4) q0[210];
-sx q0[210];
-rz(pi/2) q0[210];
-cx q0[210],q0[13];
-sx q0[211];
-sx q0[212];
-rz(1.8449536) q0[212];
-cx q0[211],q0[212];
-rz(1.3638983) q0[212];
-cx q0[211],q0[212];
-rz(-pi) q0[211];
-sx q0[211];
-rz(-pi) q0[211];
-rz(-1.6633542) q0[212];
-sx q0[212];
-rz(-pi) q0[212];
-cx q0[211],q0[212];
-sx q0[212];
-rz(1.6633542) q0[212];
-sx q0[212];
-rz(-pi) q0[212];
-cx q0[211],q0[212];
-cx q0[211],q0[14];
-rz(pi/2) q0[211];
-sx q0[211];
-rz(pi/2) q0[211];
-cx q0[14],q0[211];
-rz(-pi/4) q0[211];
-cx q0[0],q0[211];
-rz(pi/4) q0[211];
-cx q0[14],q0[211];
-rz(pi/4) q0[14];
-rz(-pi/4) q0[211];
-cx q0[0],q0[211];
-cx q0[0],q0[14];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[14];
-cx q0[0],q0[14];
-rz(3*pi/4) q0[211];
-sx q0[211];
-rz(pi/2) q0[211];
-cx q0[211],q0[14];
-sx q0[212];
-sx q0[213];
-rz(1.5532856) q0[213];
-cx q0[212],q0[213];
-rz(1.8381776) q0[213];
-cx q0[212],q0[213];
-rz(-pi) q0[212];
-sx q0[212];
-rz(-pi) q0[212];
-rz(-2.2234082) q0[213];
-sx q0[213];
-rz(-pi) q0[213];
-cx q0[212],q0[213];
-sx q0[213];
-rz(2.2234082) q0[213];
-sx q0[213];
-rz(-pi) q0[213];
-cx q0[212],q0[213];
-cx q0[212],q0[15];
-rz(pi/2) q0[212];
-sx q0[212];
-rz(pi/2) q0[212];
-cx q0[15],q0[212];
-rz(-pi/4) q0[212];
-cx q0[0],q0[212];
-rz(pi/4) q0[212];
-cx q0[15],q0[212];
-rz(pi/4) q0[15];
-rz(-pi/4) q0[212];
-cx q0[0],q0[212];
-cx q0[0],q0[15];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[15];
-cx q0[0],q0[15];
-rz(3*pi/4) q0[212];
-sx q0[212];
-rz(pi/2) q0[212];
-cx q0[212],q0[15];
-sx q0[213];
-sx q0[214];
-rz(1.4668821) q0[214];
-cx q0[213],q0[214];
-rz(1.0520842) q0[214];
-cx q0[213],q0[214];
-rz(-pi) q0[213];
-sx q0[213];
-rz(-pi) q0[213];
-rz(-2.1525394) q0[214];
-sx q0[214];
-rz(-pi) q0[214];
-cx q0[213],q0[214];
-sx q0[214];
-rz(2.1525394) q0[214];
-sx q0[214];
-rz(-pi) q0[214];
-cx q0[213],q0[214];
-cx q0[213],q0[16];
-rz(pi/2) q0[213];
-sx q0[213];
-rz(pi/2) q0[213];
-cx q0[16],q0[213];
-rz(-pi/4) q0[213];
-cx q0[0],q0[213];
-rz(pi/4) q0[213];
-cx q0[16],q0[213];
-rz(pi/4) q0[16];
-rz(-pi/4) q0[213];
-cx q0[0],q0[213];
-cx q0[0],q0[16];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[16];
-cx q0[0],q0[16];
-rz(3*pi/4) q0[213];
-sx q0[213];
-rz(pi/2) q0[213];
-cx q0[213],q0[16];
-sx q0[214];
-sx q0[215];
-rz(2.7438307) q0[215];
-cx q0[214],q0[215];
-rz(2.2171996) q0[215];
-cx q0[214],q0[215];
-rz(-pi) q0[214];
-sx q0[214];
-rz(-pi) q0[214];
-rz(-3.0364172) q0[215];
-sx q0[215];
-rz(-pi) q0[215];
-cx q0[214],q0[215];
-sx q0[215];
-rz(3.0364172) q0[215];
-sx q0[215];
-rz(-pi) q0[215];
-cx q0[214],q0[215];
-cx q0[214],q0[17];
-rz(pi/2) q0[214];
-sx q0[214];
-rz(pi/2) q0[214];
-cx q0[17],q0[214];
-rz(-pi/4) q0[214];
-cx q0[0],q0[214];
-rz(pi/4) q0[214];
-cx q0[17],q0[214];
-rz(pi/4) q0[17];
-rz(-pi/4) q0[214];
-cx q0[0],q0[214];
-cx q0[0],q0[17];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[17];
-cx q0[0],q0[17];
-rz(3*pi/4) q0[214];
-sx q0[214];
-rz(pi/2) q0[214];
-cx q0[214],q0[17];
-sx q0[215];
-sx q0[216];
-rz(0.76647066) q0[216];
-cx q0[215],q0[216];
-rz(0.73332277) q0[216];
-cx q0[215],q0[216];
-rz(-pi) q0[215];
-sx q0[215];
-rz(-pi) q0[215];
-rz(-1.7967882) q0[216];
-sx q0[216];
-rz(-pi) q0[216];
-cx q0[215],q0[216];
-sx q0[216];
-rz(1.7967882) q0[216];
-sx q0[216];
-rz(-pi) q0[216];
-cx q0[215],q0[216];
-cx q0[215],q0[18];
-rz(pi/2) q0[215];
-sx q0[215];
-rz(pi/2) q0[215];
-cx q0[18],q0[215];
-rz(-pi/4) q0[215];
-cx q0[0],q0[215];
-rz(pi/4) q0[215];
-cx q0[18],q0[215];
-rz(pi/4) q0[18];
-rz(-pi/4) q0[215];
-cx q0[0],q0[215];
-cx q0[0],q0[18];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[18];
-cx q0[0],q0[18];
-rz(3*pi/4) q0[215];
-sx q0[215];
-rz(pi/2) q0[215];
-cx q0[215],q0[18];
-sx q0[216];
-sx q0[217];
-rz(2.4422525) q0[217];
-cx q0[216],q0[217];
-rz(1.1613811) q0[217];
-cx q0[216],q0[217];
-rz(-pi) q0[216];
-sx q0[216];
-rz(-pi) q0[216];
-rz(-3.0472892) q0[217];
-sx q0[217];
-rz(-pi) q0[217];
-cx q0[216],q0[217];
-sx q0[217];
-rz(3.0472892) q0[217];
-sx q0[217];
-rz(-pi) q0[217];
-cx q0[216],q0[217];
-cx q0[216],q0[19];
-rz(pi/2) q0[216];
-sx q0[216];
-rz(pi/2) q0[216];
-cx q0[19],q0[216];
-rz(-pi/4) q0[216];
-cx q0[0],q0[216];
-rz(pi/4) q0[216];
-cx q0[19],q0[216];
-rz(pi/4) q0[19];
-rz(-pi/4) q0[216];
-cx q0[0],q0[216];
-cx q0[0],q0[19];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[19];
-cx q0[0],q0[19];
-rz(3*pi/4) q0[216];
-sx q0[216];
-rz(pi/2) q0[216];
-cx q0[216],q0[19];
-sx q0[217];
-sx q0[218];
-rz(0.18350178) q0[218];
-cx q0[217],q0[218];
-rz(0.44149659) q0[218];
-cx q0[217],q0[218];
-rz(-pi) q0[217];
-sx q0[217];
-rz(-pi) q0[217];
-rz(-1.7250563) q0[218];
-sx q0[218];
-rz(-pi) q0[218];
-cx q0[217],q0[218];
-sx q0[218];
-rz(1.7250563) q0[218];
-sx q0[218];
-rz(-pi) q0[218];
-cx q0[217],q0[218];
-cx q0[217],q0[20];
-rz(pi/2) q0[217];
-sx q0[217];
-rz(pi/2) q0[217];
-cx q0[20],q0[217];
-rz(-pi/4) q0[217];
-cx q0[0],q0[217];
-rz(pi/4) q0[217];
-cx q0[20],q0[217];
-rz(pi/4) q0[20];
-rz(-pi/4) q0[217];
-cx q0[0],q0[217];
-cx q0[0],q0[20];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[20];
-cx q0[0],q0[20];
-rz(3*pi/4) q0[217];
-sx q0[217];
-rz(pi/2) q0[217];
-cx q0[217],q0[20];
-sx q0[218];
-sx q0[219];
-rz(1.1797743) q0[219];
-cx q0[218],q0[219];
-rz(2.0628831) q0[219];
-cx q0[218],q0[219];
-rz(-pi) q0[218];
-sx q0[218];
-rz(-pi) q0[218];
-rz(-3.1176686) q0[219];
-sx q0[219];
-rz(-pi) q0[219];
-cx q0[218],q0[219];
-sx q0[219];
-rz(3.1176686) q0[219];
-sx q0[219];
-rz(-pi) q0[219];
-cx q0[218],q0[219];
-cx q0[218],q0[21];
-rz(pi/2) q0[218];
-sx q0[218];
-rz(pi/2) q0[218];
-cx q0[21],q0[218];
-rz(-pi/4) q0[218];
-cx q0[0],q0[218];
-rz(pi/4) q0[218];
-cx q0[21],q0[218];
-rz(pi/4) q0[21];
-rz(-pi/4) q0[218];
-cx q0[0],q0[218];
-cx q0[0],q0[21];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[21];
-cx q0[0],q0[21];
-rz(3*pi/4) q0[218];
-sx q0[218];
-rz(pi/2) q0[218];
-cx q0[218],q0[21];
-sx q0[219];
-sx q0[220];
-rz(0.86316719) q0[220];
-cx q0[219],q0[220];
-rz(0.13676934) q0[220];
-cx q0[219],q0[220];
-rz(-pi) q0[219];
-sx q0[219];
-rz(-pi) q0[219];
-rz(-1.9594131) q0[220];
-sx q0[220];
-rz(-pi) q0[220];
-cx q0[219],q0[220];
-sx q0[220];
-rz(1.9594131) q0[220];
-sx q0[220];
-rz(-pi) q0[220];
-cx q0[219],q0[220];
-cx q0[219],q0[22];
-rz(pi/2) q0[219];
-sx q0[219];
-rz(pi/2) q0[219];
-cx q0[22],q0[219];
-rz(-pi/4) q0[219];
-cx q0[0],q0[219];
-rz(pi/4) q0[219];
-cx q0[22],q0[219];
-rz(-pi/4) q0[219];
-cx q0[0],q0[219];
-rz(3*pi/4) q0[219];
-sx q0[219];
-rz(pi/2) q0[219];
-rz(pi/4) q0[22];
-cx q0[0],q0[22];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[22];
-cx q0[0],q0[22];
-cx q0[219],q0[22];
-sx q0[220];
-sx q0[221];
-rz(1.0717994) q0[221];
-cx q0[220],q0[221];
-rz(0.45259893) q0[221];
-cx q0[220],q0[221];
-rz(-pi) q0[220];
-sx q0[220];
-rz(-pi) q0[220];
-rz(-2.8478236) q0[221];
-sx q0[221];
-rz(-pi) q0[221];
-cx q0[220],q0[221];
-sx q0[221];
-rz(2.8478236) q0[221];
-sx q0[221];
-rz(-pi) q0[221];
-cx q0[220],q0[221];
-cx q0[220],q0[23];
-rz(pi/2) q0[220];
-sx q0[220];
-rz(pi/2) q0[220];
-sx q0[221];
-cx q0[23],q0[220];
-rz(-pi/4) q0[220];
-cx q0[0],q0[220];
-rz(pi/4) q0[220];
-cx q0[23],q0[220];
-rz(-pi/4) q0[220];
-cx q0[0],q0[220];
-rz(3*pi/4) q0[220];
-sx q0[220];
-rz(pi/2) q0[220];
-rz(pi/4) q0[23];
-cx q0[0],q0[23];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[23];
-cx q0[0],q0[23];
-cx q0[220],q0[23];
-sx q0[222];
-rz(2.2066899) q0[222];
-cx q0[221],q0[222];
-rz(0.133906) q0[222];
-cx q0[221],q0[222];
-rz(-pi) q0[221];
-sx q0[221];
-rz(-pi) q0[221];
-rz(-1.7689915) q0[222];
-sx q0[222];
-rz(-pi) q0[222];
-cx q0[221],q0[222];
-sx q0[222];
-rz(1.7689915) q0[222];
-sx q0[222];
-rz(-pi) q0[222];
-cx q0[221],q0[222];
-cx q0[221],q0[24];
-rz(pi/2) q0[221];
-sx q0[221];
-rz(pi/2) q0[221];
-sx q0[222];
-cx q0[24],q0[221];
-rz(-pi/4) q0[221];
-cx q0[0],q0[221];
-rz(pi/4) q0[221];
-cx q0[24],q0[221];
-rz(-pi/4) q0[221];
-cx q0[0],q0[221];
-rz(3*pi/4) q0[221];
-sx q0[221];
-rz(pi/2) q0[221];
-rz(pi/4) q0[24];
-cx q0[0],q0[24];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[24];
-cx q0[0],q0[24];
-cx q0[221],q0[24];
-sx q0[223];
-rz(1.537701) q0[223];
-cx q0[222],q0[223];
-rz(2.2103866) q0[223];
-cx q0[222],q0[223];
-rz(-pi) q0[222];
-sx q0[222];
-rz(-pi) q0[222];
-rz(-2.3821167) q0[223];
-sx q0[223];
-rz(-pi) q0[223];
-cx q0[222],q0[223];
-sx q0[223];
-rz(2.3821167) q0[223];
-sx q0[223];
-rz(-pi) q0[223];
-cx q0[222],q0[223];
-cx q0[222],q0[25];
-rz(pi/2) q0[222];
-sx q0[222];
-rz(pi/2) q0[222];
-sx q0[223];
-cx q0[25],q0[222];
-rz(-pi/4) q0[222];
-cx q0[0],q0[222];
-rz(pi/4) q0[222];
-cx q0[25],q0[222];
-rz(-pi/4) q0[222];
-cx q0[0],q0[222];
-rz(3*pi/4) q0[222];
-sx q0[222];
-rz(pi/2) q0[222];
-rz(pi/4) q0[25];
-cx q0[0],q0[25];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[25];
-cx q0[0],q0[25];
-cx q0[222],q0[25];
-sx q0[224];
-rz(0.80069006) q0[224];
-cx q0[223],q0[224];
-rz(2.8527195) q0[224];
-cx q0[223],q0[224];
-rz(-pi) q0[223];
-sx q0[223];
-rz(-pi) q0[223];
-rz(-2.3730458) q0[224];
-sx q0[224];
-rz(-pi) q0[224];
-cx q0[223],q0[224];
-sx q0[224];
-rz(2.3730458) q0[224];
-sx q0[224];
-rz(-pi) q0[224];
-cx q0[223],q0[224];
-cx q0[223],q0[26];
-rz(pi/2) q0[223];
-sx q0[223];
-rz(pi/2) q0[223];
-sx q0[224];
-cx q0[26],q0[223];
-rz(-pi/4) q0[223];
-cx q0[0],q0[223];
-rz(pi/4) q0[223];
-cx q0[26],q0[223];
-rz(-pi/4) q0[223];
-cx q0[0],q0[223];
-rz(3*pi/4) q0[223];
-sx q0[223];
-rz(pi/2) q0[223];
-rz(pi/4) q0[26];
-cx q0[0],q0[26];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[26];
-cx q0[0],q0[26];
-cx q0[223],q0[26];
-sx q0[225];
-rz(1.4704748) q0[225];
-cx q0[224],q0[225];
-rz(1.5602037) q0[225];
-cx q0[224],q0[225];
-rz(-pi) q0[224];
-sx q0[224];
-rz(-pi) q0[224];
-rz(-2.1672486) q0[225];
-sx q0[225];
-rz(-pi) q0[225];
-cx q0[224],q0[225];
-sx q0[225];
-rz(2.1672486) q0[225];
-sx q0[225];
-rz(-pi) q0[225];
-cx q0[224],q0[225];
-cx q0[224],q0[27];
-rz(pi/2) q0[224];
-sx q0[224];
-rz(pi/2) q0[224];
-sx q0[225];
-cx q0[27],q0[224];
-rz(-pi/4) q0[224];
-cx q0[0],q0[224];
-rz(pi/4) q0[224];
-cx q0[27],q0[224];
-rz(-pi/4) q0[224];
-cx q0[0],q0[224];
-rz(3*pi/4) q0[224];
-sx q0[224];
-rz(pi/2) q0[224];
-rz(pi/4) q0[27];
-cx q0[0],q0[27];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[27];
-cx q0[0],q0[27];
-cx q0[224],q0[27];
-sx q0[226];
-rz(1.0374151) q0[226];
-cx q0[225],q0[226];
-rz(1.7224586) q0[226];
-cx q0[225],q0[226];
-rz(-pi) q0[225];
-sx q0[225];
-rz(-pi) q0[225];
-rz(-2.7200681) q0[226];
-sx q0[226];
-rz(-pi) q0[226];
-cx q0[225],q0[226];
-sx q0[226];
-rz(2.7200681) q0[226];
-sx q0[226];
-rz(-pi) q0[226];
-cx q0[225],q0[226];
-cx q0[225],q0[28];
-rz(pi/2) q0[225];
-sx q0[225];
-rz(pi/2) q0[225];
-sx q0[226];
-cx q0[28],q0[225];
-rz(-pi/4) q0[225];
-cx q0[0],q0[225];
-rz(pi/4) q0[225];
-cx q0[28],q0[225];
-rz(-pi/4) q0[225];
-cx q0[0],q0[225];
-rz(3*pi/4) q0[225];
-sx q0[225];
-rz(pi/2) q0[225];
-rz(pi/4) q0[28];
-cx q0[0],q0[28];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[28];
-cx q0[0],q0[28];
-cx q0[225],q0[28];
-sx q0[227];
-rz(0.3807018) q0[227];
-cx q0[226],q0[227];
-rz(1.0540938) q0[227];
-cx q0[226],q0[227];
-rz(-pi) q0[226];
-sx q0[226];
-rz(-pi) q0[226];
-rz(-1.575499) q0[227];
-sx q0[227];
-rz(-pi) q0[227];
-cx q0[226],q0[227];
-sx q0[227];
-rz(1.575499) q0[227];
-sx q0[227];
-rz(-pi) q0[227];
-cx q0[226],q0[227];
-cx q0[226],q0[29];
-rz(pi/2) q0[226];
-sx q0[226];
-rz(pi/2) q0[226];
-sx q0[227];
-cx q0[29],q0[226];
-rz(-pi/4) q0[226];
-cx q0[0],q0[226];
-rz(pi/4) q0[226];
-cx q0[29],q0[226];
-rz(-pi/4) q0[226];
-cx q0[0],q0[226];
-rz(3*pi/4) q0[226];
-sx q0[226];
-rz(pi/2) q0[226];
-rz(pi/4) q0[29];
-cx q0[0],q0[29];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[29];
-cx q0[0],q0[29];
-cx q0[226],q0[29];
-sx q0[228];
-rz(2.8544347) q0[228];
-cx q0[227],q0[228];
-rz(1.8408743) q0[228];
-cx q0[227],q0[228];
-rz(-pi) q0[227];
-sx q0[227];
-rz(-pi) q0[227];
-rz(-2.5701986) q0[228];
-sx q0[228];
-rz(-pi) q0[228];
-cx q0[227],q0[228];
-sx q0[228];
-rz(2.5701986) q0[228];
-sx q0[228];
-rz(-pi) q0[228];
-cx q0[227],q0[228];
-cx q0[227],q0[30];
-rz(pi/2) q0[227];
-sx q0[227];
-rz(pi/2) q0[227];
-sx q0[228];
-cx q0[30],q0[227];
-rz(-pi/4) q0[227];
-cx q0[0],q0[227];
-rz(pi/4) q0[227];
-cx q0[30],q0[227];
-rz(-pi/4) q0[227];
-cx q0[0],q0[227];
-rz(3*pi/4) q0[227];
-sx q0[227];
-rz(pi/2) q0[227];
-rz(pi/4) q0[30];
-cx q0[0],q0[30];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[30];
-cx q0[0],q0[30];
-cx q0[227],q0[30];
-sx q0[229];
-rz(0.25805504) q0[229];
-cx q0[228],q0[229];
-rz(1.4415374) q0[229];
-cx q0[228],q0[229];
-rz(-pi) q0[228];
-sx q0[228];
-rz(-pi) q0[228];
-rz(-2.2287301) q0[229];
-sx q0[229];
-rz(-pi) q0[229];
-cx q0[228],q0[229];
-sx q0[229];
-rz(2.2287301) q0[229];
-sx q0[229];
-rz(-pi) q0[229];
-cx q0[228],q0[229];
-cx q0[228],q0[31];
-rz(pi/2) q0[228];
-sx q0[228];
-rz(pi/2) q0[228];
-sx q0[229];
-cx q0[31],q0[228];
-rz(-pi/4) q0[228];
-cx q0[0],q0[228];
-rz(pi/4) q0[228];
-cx q0[31],q0[228];
-rz(-pi/4) q0[228];
-cx q0[0],q0[228];
-rz(3*pi/4) q0[228];
-sx q0[228];
-rz(pi/2) q0[228];
-rz(pi/4) q0[31];
-cx q0[0],q0[31];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[31];
-cx q0[0],q0[31];
-cx q0[228],q0[31];
-sx q0[230];
-rz(1.7466338) q0[230];
-cx q0[229],q0[230];
-rz(0.22872974) q0[230];
-cx q0[229],q0[230];
-rz(-pi) q0[229];
-sx q0[229];
-rz(-pi) q0[229];
-rz(-1.6543769) q0[230];
-sx q0[230];
-rz(-pi) q0[230];
-cx q0[229],q0[230];
-sx q0[230];
-rz(1.6543769) q0[230];
-sx q0[230];
-rz(-pi) q0[230];
-cx q0[229],q0[230];
-cx q0[229],q0[32];
-rz(pi/2) q0[229];
-sx q0[229];
-rz(pi/2) q0[229];
-sx q0[230];
-cx q0[32],q0[229];
-rz(-pi/4) q0[229];
-cx q0[0],q0[229];
-rz(pi/4) q0[229];
-cx q0[32],q0[229];
-rz(-pi/4) q0[229];
-cx q0[0],q0[229];
-rz(3*pi/4) q0[229];
-sx q0[229];
-rz(pi/2) q0[229];
-rz(pi/4) q0[32];
-cx q0[0],q0[32];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[32];
-cx q0[0],q0[32];
-cx q0[229],q0[32];
-sx q0[231];
-rz(2.9208687) q0[231];
-cx q0[230],q0[231];
-rz(0.79665055) q0[231];
-cx q0[230],q0[231];
-rz(-pi) q0[230];
-sx q0[230];
-rz(-pi) q0[230];
-rz(-1.5807902) q0[231];
-sx q0[231];
-rz(-pi) q0[231];
-cx q0[230],q0[231];
-sx q0[231];
-rz(1.5807902) q0[231];
-sx q0[231];
-rz(-pi) q0[231];
-cx q0[230],q0[231];
-cx q0[230],q0[33];
-rz(pi/2) q0[230];
-sx q0[230];
-rz(pi/2) q0[230];
-sx q0[231];
-cx q0[33],q0[230];
-rz(-pi/4) q0[230];
-cx q0[0],q0[230];
-rz(pi/4) q0[230];
-cx q0[33],q0[230];
-rz(-pi/4) q0[230];
-cx q0[0],q0[230];
-rz(3*pi/4) q0[230];
-sx q0[230];
-rz(pi/2) q0[230];
-rz(pi/4) q0[33];
-cx q0[0],q0[33];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[33];
-cx q0[0],q0[33];
-cx q0[230],q0[33];
-sx q0[232];
-rz(2.5166445) q0[232];
-cx q0[231],q0[232];
-rz(2.6686223) q0[232];
-cx q0[231],q0[232];
-rz(-pi) q0[231];
-sx q0[231];
-rz(-pi) q0[231];
-rz(-1.8954662) q0[232];
-sx q0[232];
-rz(-pi) q0[232];
-cx q0[231],q0[232];
-sx q0[232];
-rz(1.8954662) q0[232];
-sx q0[232];
-rz(-pi) q0[232];
-cx q0[231],q0[232];
-cx q0[231],q0[34];
-rz(pi/2) q0[231];
-sx q0[231];
-rz(pi/2) q0[231];
-sx q0[232];
-cx q0[34],q0[231];
-rz(-pi/4) q0[231];
-cx q0[0],q0[231];
-rz(pi/4) q0[231];
-cx q0[34],q0[231];
-rz(-pi/4) q0[231];
-cx q0[0],q0[231];
-rz(3*pi/4) q0[231];
-sx q0[231];
-rz(pi/2) q0[231];
-rz(pi/4) q0[34];
-cx q0[0],q0[34];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[34];
-cx q0[0],q0[34];
-cx q0[231],q0[34];
-sx q0[233];
-rz(2.2169452) q0[233];
-cx q0[232],q0[233];
-rz(0.18312662) q0[233];
-cx q0[232],q0[233];
-rz(-pi) q0[232];
-sx q0[232];
-rz(-pi) q0[232];
-rz(-1.6191181) q0[233];
-sx q0[233];
-rz(-pi) q0[233];
-cx q0[232],q0[233];
-sx q0[233];
-rz(1.6191181) q0[233];
-sx q0[233];
-rz(-pi) q0[233];
-cx q0[232],q0[233];
-cx q0[232],q0[35];
-rz(pi/2) q0[232];
-sx q0[232];
-rz(pi/2) q0[232];
-sx q0[233];
-cx q0[35],q0[232];
-rz(-pi/4) q0[232];
-cx q0[0],q0[232];
-rz(pi/4) q0[232];
-cx q0[35],q0[232];
-rz(-pi/4) q0[232];
-cx q0[0],q0[232];
-rz(3*pi/4) q0[232];
-sx q0[232];
-rz(pi/2) q0[232];
-rz(pi/4) q0[35];
-cx q0[0],q0[35];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[35];
-cx q0[0],q0[35];
-cx q0[232],q0[35];
-sx q0[234];
-rz(0.46446823) q0[234];
-cx q0[233],q0[234];
-rz(1.0486101) q0[234];
-cx q0[233],q0[234];
-rz(-pi) q0[233];
-sx q0[233];
-rz(-pi) q0[233];
-rz(-2.8039779) q0[234];
-sx q0[234];
-rz(-pi) q0[234];
-cx q0[233],q0[234];
-sx q0[234];
-rz(2.8039779) q0[234];
-sx q0[234];
-rz(-pi) q0[234];
-cx q0[233],q0[234];
-cx q0[233],q0[36];
-rz(pi/2) q0[233];
-sx q0[233];
-rz(pi/2) q0[233];
-sx q0[234];
-cx q0[36],q0[233];
-rz(-pi/4) q0[233];
-cx q0[0],q0[233];
-rz(pi/4) q0[233];
-cx q0[36],q0[233];
-rz(-pi/4) q0[233];
-cx q0[0],q0[233];
-rz(3*pi/4) q0[233];
-sx q0[233];
-rz(pi/2) q0[233];
-rz(pi/4) q0[36];
-cx q0[0],q0[36];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[36];
-cx q0[0],q0[36];
-cx q0[233],q0[36];
-sx q0[235];
-rz(2.0710926) q0[235];
-cx q0[234],q0[235];
-rz(3.062795) q0[235];
-cx q0[234],q0[235];
-rz(-pi) q0[234];
-sx q0[234];
-rz(-pi) q0[234];
-rz(-2.9081162) q0[235];
-sx q0[235];
-rz(-pi) q0[235];
-cx q0[234],q0[235];
-sx q0[235];
-rz(2.9081162) q0[235];
-sx q0[235];
-rz(-pi) q0[235];
-cx q0[234],q0[235];
-cx q0[234],q0[37];
-rz(pi/2) q0[234];
-sx q0[234];
-rz(pi/2) q0[234];
-sx q0[235];
-cx q0[37],q0[234];
-rz(-pi/4) q0[234];
-cx q0[0],q0[234];
-rz(pi/4) q0[234];
-cx q0[37],q0[234];
-rz(-pi/4) q0[234];
-cx q0[0],q0[234];
-rz(3*pi/4) q0[234];
-sx q0[234];
-rz(pi/2) q0[234];
-rz(pi/4) q0[37];
-cx q0[0],q0[37];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[37];
-cx q0[0],q0[37];
-cx q0[234],q0[37];
-sx q0[236];
-rz(3.0492826) q0[236];
-cx q0[235],q0[236];
-rz(1.8013303) q0[236];
-cx q0[235],q0[236];
-rz(-pi) q0[235];
-sx q0[235];
-rz(-pi) q0[235];
-rz(-3.1403256) q0[236];
-sx q0[236];
-rz(-pi) q0[236];
-cx q0[235],q0[236];
-sx q0[236];
-rz(3.1403256) q0[236];
-sx q0[236];
-rz(-pi) q0[236];
-cx q0[235],q0[236];
-cx q0[235],q0[38];
-rz(pi/2) q0[235];
-sx q0[235];
-rz(pi/2) q0[235];
-sx q0[236];
-cx q0[38],q0[235];
-rz(-pi/4) q0[235];
-cx q0[0],q0[235];
-rz(pi/4) q0[235];
-cx q0[38],q0[235];
-rz(-pi/4) q0[235];
-cx q0[0],q0[235];
-rz(3*pi/4) q0[235];
-sx q0[235];
-rz(pi/2) q0[235];
-rz(pi/4) q0[38];
-cx q0[0],q0[38];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[38];
-cx q0[0],q0[38];
-cx q0[235],q0[38];
-sx q0[237];
-rz(2.3288868) q0[237];
-cx q0[236],q0[237];
-rz(0.4156719) q0[237];
-cx q0[236],q0[237];
-rz(-pi) q0[236];
-sx q0[236];
-rz(-pi) q0[236];
-rz(-2.4945742) q0[237];
-sx q0[237];
-rz(-pi) q0[237];
-cx q0[236],q0[237];
-sx q0[237];
-rz(2.4945742) q0[237];
-sx q0[237];
-rz(-pi) q0[237];
-cx q0[236],q0[237];
-cx q0[236],q0[39];
-rz(pi/2) q0[236];
-sx q0[236];
-rz(pi/2) q0[236];
-sx q0[237];
-cx q0[39],q0[236];
-rz(-pi/4) q0[236];
-cx q0[0],q0[236];
-rz(pi/4) q0[236];
-cx q0[39],q0[236];
-rz(-pi/4) q0[236];
-cx q0[0],q0[236];
-rz(3*pi/4) q0[236];
-sx q0[236];
-rz(pi/2) q0[236];
-rz(pi/4) q0[39];
-cx q0[0],q0[39];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[39];
-cx q0[0],q0[39];
-cx q0[236],q0[39];
-sx q0[238];
-rz(1.7332386) q0[238];
-cx q0[237],q0[238];
-rz(3.1134485) q0[238];
-cx q0[237],q0[238];
-rz(-pi) q0[237];
-sx q0[237];
-rz(-pi) q0[237];
-rz(-1.8513506) q0[238];
-sx q0[238];
-rz(-pi) q0[238];
-cx q0[237],q0[238];
-sx q0[238];
-rz(1.8513506) q0[238];
-sx q0[238];
-rz(-pi) q0[238];
-cx q0[237],q0[238];
-cx q0[237],q0[40];
-rz(pi/2) q0[237];
-sx q0[237];
-rz(pi/2) q0[237];
-sx q0[238];
-cx q0[40],q0[237];
-rz(-pi/4) q0[237];
-cx q0[0],q0[237];
-rz(pi/4) q0[237];
-cx q0[40],q0[237];
-rz(-pi/4) q0[237];
-cx q0[0],q0[237];
-rz(3*pi/4) q0[237];
-sx q0[237];
-rz(pi/2) q0[237];
-rz(pi/4) q0[40];
-cx q0[0],q0[40];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[40];
-cx q0[0],q0[40];
-cx q0[237],q0[40];
-sx q0[239];
-rz(2.3805408) q0[239];
-cx q0[238],q0[239];
-rz(1.1676215) q0[239];
-cx q0[238],q0[239];
-rz(-pi) q0[238];
-sx q0[238];
-rz(-pi) q0[238];
-rz(-2.9597886) q0[239];
-sx q0[239];
-rz(-pi) q0[239];
-cx q0[238],q0[239];
-sx q0[239];
-rz(2.9597886) q0[239];
-sx q0[239];
-rz(-pi) q0[239];
-cx q0[238],q0[239];
-cx q0[238],q0[41];
-rz(pi/2) q0[238];
-sx q0[238];
-rz(pi/2) q0[238];
-sx q0[239];
-cx q0[41],q0[238];
-rz(-pi/4) q0[238];
-cx q0[0],q0[238];
-rz(pi/4) q0[238];
-cx q0[41],q0[238];
-rz(-pi/4) q0[238];
-cx q0[0],q0[238];
-rz(3*pi/4) q0[238];
-sx q0[238];
-rz(pi/2) q0[238];
-rz(pi/4) q0[41];
-cx q0[0],q0[41];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[41];
-cx q0[0],q0[41];
-cx q0[238],q0[41];
-sx q0[240];
-rz(0.27676775) q0[240];
-cx q0[239],q0[240];
-rz(1.1638225) q0[240];
-cx q0[239],q0[240];
-rz(-pi) q0[239];
-sx q0[239];
-rz(-pi) q0[239];
-rz(-2.6576845) q0[240];
-sx q0[240];
-rz(-pi) q0[240];
-cx q0[239],q0[240];
-sx q0[240];
-rz(2.6576845) q0[240];
-sx q0[240];
-rz(-pi) q0[240];
-cx q0[239],q0[240];
-cx q0[239],q0[42];
-rz(pi/2) q0[239];
-sx q0[239];
-rz(pi/2) q0[239];
-sx q0[240];
-cx q0[42],q0[239];
-rz(-pi/4) q0[239];
-cx q0[0],q0[239];
-rz(pi/4) q0[239];
-cx q0[42],q0[239];
-rz(-pi/4) q0[239];
-cx q0[0],q0[239];
-rz(3*pi/4) q0[239];
-sx q0[239];
-rz(pi/2) q0[239];
-rz(pi/4) q0[42];
-cx q0[0],q0[42];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[42];
-cx q0[0],q0[42];
-cx q0[239],q0[42];
-sx q0[241];
-rz(1.1737653) q0[241];
-cx q0[240],q0[241];
-rz(0.94550818) q0[241];
-cx q0[240],q0[241];
-rz(-pi) q0[240];
-sx q0[240];
-rz(-pi) q0[240];
-rz(-2.9536568) q0[241];
-sx q0[241];
-rz(-pi) q0[241];
-cx q0[240],q0[241];
-sx q0[241];
-rz(2.9536568) q0[241];
-sx q0[241];
-rz(-pi) q0[241];
-cx q0[240],q0[241];
-cx q0[240],q0[43];
-rz(pi/2) q0[240];
-sx q0[240];
-rz(pi/2) q0[240];
-sx q0[241];
-cx q0[43],q0[240];
-rz(-pi/4) q0[240];
-cx q0[0],q0[240];
-rz(pi/4) q0[240];
-cx q0[43],q0[240];
-rz(-pi/4) q0[240];
-cx q0[0],q0[240];
-rz(3*pi/4) q0[240];
-sx q0[240];
-rz(pi/2) q0[240];
-rz(pi/4) q0[43];
-cx q0[0],q0[43];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[43];
-cx q0[0],q0[43];
-cx q0[240],q0[43];
-sx q0[242];
-rz(0.53884247) q0[242];
-cx q0[241],q0[242];
-rz(1.7749488) q0[242];
-cx q0[241],q0[242];
-rz(-pi) q0[241];
-sx q0[241];
-rz(-pi) q0[241];
-rz(-2.211229) q0[242];
-sx q0[242];
-rz(-pi) q0[242];
-cx q0[241],q0[242];
-sx q0[242];
-rz(2.211229) q0[242];
-sx q0[242];
-rz(-pi) q0[242];
-cx q0[241],q0[242];
-cx q0[241],q0[44];
-rz(pi/2) q0[241];
-sx q0[241];
-rz(pi/2) q0[241];
-sx q0[242];
-cx q0[44],q0[241];
-rz(-pi/4) q0[241];
-cx q0[0],q0[241];
-rz(pi/4) q0[241];
-cx q0[44],q0[241];
-rz(-pi/4) q0[241];
-cx q0[0],q0[241];
-rz(3*pi/4) q0[241];
-sx q0[241];
-rz(pi/2) q0[241];
-rz(pi/4) q0[44];
-cx q0[0],q0[44];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[44];
-cx q0[0],q0[44];
-cx q0[241],q0[44];
-sx q0[243];
-rz(0.084868766) q0[243];
-cx q0[242],q0[243];
-rz(1.7976703) q0[243];
-cx q0[242],q0[243];
-rz(-pi) q0[242];
-sx q0[242];
-rz(-pi) q0[242];
-rz(-2.8650945) q0[243];
-sx q0[243];
-rz(-pi) q0[243];
-cx q0[242],q0[243];
-sx q0[243];
-rz(2.8650945) q0[243];
-sx q0[243];
-rz(-pi) q0[243];
-cx q0[242],q0[243];
-cx q0[242],q0[45];
-rz(pi/2) q0[242];
-sx q0[242];
-rz(pi/2) q0[242];
-sx q0[243];
-cx q0[45],q0[242];
-rz(-pi/4) q0[242];
-cx q0[0],q0[242];
-rz(pi/4) q0[242];
-cx q0[45],q0[242];
-rz(-pi/4) q0[242];
-cx q0[0],q0[242];
-rz(3*pi/4) q0[242];
-sx q0[242];
-rz(pi/2) q0[242];
-rz(pi/4) q0[45];
-cx q0[0],q0[45];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[45];
-cx q0[0],q0[45];
-cx q0[242],q0[45];
-sx q0[244];
-rz(2.4440089) q0[244];
-cx q0[243],q0[244];
-rz(0.33502834) q0[244];
-cx q0[243],q0[244];
-rz(-pi) q0[243];
-sx q0[243];
-rz(-pi) q0[243];
-rz(-1.6482311) q0[244];
-sx q0[244];
-rz(-pi) q0[244];
-cx q0[243],q0[244];
-sx q0[244];
-rz(1.6482311) q0[244];
-sx q0[244];
-rz(-pi) q0[244];
-cx q0[243],q0[244];
-cx q0[243],q0[46];
-rz(pi/2) q0[243];
-sx q0[243];
-rz(pi/2) q0[243];
-sx q0[244];
-cx q0[46],q0[243];
-rz(-pi/4) q0[243];
-cx q0[0],q0[243];
-rz(pi/4) q0[243];
-cx q0[46],q0[243];
-rz(-pi/4) q0[243];
-cx q0[0],q0[243];
-rz(3*pi/4) q0[243];
-sx q0[243];
-rz(pi/2) q0[243];
-rz(pi/4) q0[46];
-cx q0[0],q0[46];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[46];
-cx q0[0],q0[46];
-cx q0[243],q0[46];
-sx q0[245];
-rz(0.15399869) q0[245];
-cx q0[244],q0[245];
-rz(0.53489282) q0[245];
-cx q0[244],q0[245];
-rz(-pi) q0[244];
-sx q0[244];
-rz(-pi) q0[244];
-rz(-2.0270461) q0[245];
-sx q0[245];
-rz(-pi) q0[245];
-cx q0[244],q0[245];
-sx q0[245];
-rz(2.0270461) q0[245];
-sx q0[245];
-rz(-pi) q0[245];
-cx q0[244],q0[245];
-cx q0[244],q0[47];
-rz(pi/2) q0[244];
-sx q0[244];
-rz(pi/2) q0[244];
-sx q0[245];
-cx q0[47],q0[244];
-rz(-pi/4) q0[244];
-cx q0[0],q0[244];
-rz(pi/4) q0[244];
-cx q0[47],q0[244];
-rz(-pi/4) q0[244];
-cx q0[0],q0[244];
-rz(3*pi/4) q0[244];
-sx q0[244];
-rz(pi/2) q0[244];
-rz(pi/4) q0[47];
-cx q0[0],q0[47];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[47];
-cx q0[0],q0[47];
-cx q0[244],q0[47];
-sx q0[246];
-rz(1.5786286) q0[246];
-cx q0[245],q0[246];
-rz(1.4773159) q0[246];
-cx q0[245],q0[246];
-rz(-pi) q0[245];
-sx q0[245];
-rz(-pi) q0[245];
-rz(-1.7294201) q0[246];
-sx q0[246];
-rz(-pi) q0[246];
-cx q0[245],q0[246];
-sx q0[246];
-rz(1.7294201) q0[246];
-sx q0[246];
-rz(-pi) q0[246];
-cx q0[245],q0[246];
-cx q0[245],q0[48];
-rz(pi/2) q0[245];
-sx q0[245];
-rz(pi/2) q0[245];
-sx q0[246];
-cx q0[48],q0[245];
-rz(-pi/4) q0[245];
-cx q0[0],q0[245];
-rz(pi/4) q0[245];
-cx q0[48],q0[245];
-rz(-pi/4) q0[245];
-cx q0[0],q0[245];
-rz(3*pi/4) q0[245];
-sx q0[245];
-rz(pi/2) q0[245];
-rz(pi/4) q0[48];
-cx q0[0],q0[48];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[48];
-cx q0[0],q0[48];
-cx q0[245],q0[48];
-sx q0[247];
-rz(1.0843058) q0[247];
-cx q0[246],q0[247];
-rz(1.977876) q0[247];
-cx q0[246],q0[247];
-rz(-pi) q0[246];
-sx q0[246];
-rz(-pi) q0[246];
-rz(-2.0076198) q0[247];
-sx q0[247];
-rz(-pi) q0[247];
-cx q0[246],q0[247];
-sx q0[247];
-rz(2.0076198) q0[247];
-sx q0[247];
-rz(-pi) q0[247];
-cx q0[246],q0[247];
-cx q0[246],q0[49];
-rz(pi/2) q0[246];
-sx q0[246];
-rz(pi/2) q0[246];
-sx q0[247];
-cx q0[49],q0[246];
-rz(-pi/4) q0[246];
-cx q0[0],q0[246];
-rz(pi/4) q0[246];
-cx q0[49],q0[246];
-rz(-pi/4) q0[246];
-cx q0[0],q0[246];
-rz(3*pi/4) q0[246];
-sx q0[246];
-rz(pi/2) q0[246];
-rz(pi/4) q0[49];
-cx q0[0],q0[49];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[49];
-cx q0[0],q0[49];
-cx q0[246],q0[49];
-sx q0[248];
-rz(1.5739666) q0[248];
-cx q0[247],q0[248];
-rz(1.6244161) q0[248];
-cx q0[247],q0[248];
-rz(-pi) q0[247];
-sx q0[247];
-rz(-pi) q0[247];
-rz(-1.7379089) q0[248];
-sx q0[248];
-rz(-pi) q0[248];
-cx q0[247],q0[248];
-sx q0[248];
-rz(1.7379089) q0[248];
-sx q0[248];
-rz(-pi) q0[248];
-cx q0[247],q0[248];
-cx q0[247],q0[50];
-rz(pi/2) q0[247];
-sx q0[247];
-rz(pi/2) q0[247];
-sx q0[248];
-cx q0[50],q0[247];
-rz(-pi/4) q0[247];
-cx q0[0],q0[247];
-rz(pi/4) q0[247];
-cx q0[50],q0[247];
-rz(-pi/4) q0[247];
-cx q0[0],q0[247];
-rz(3*pi/4) q0[247];
-sx q0[247];
-rz(pi/2) q0[247];
-rz(pi/4) q0[50];
-cx q0[0],q0[50];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[50];
-cx q0[0],q0[50];
-cx q0[247],q0[50];
-sx q0[249];
-rz(0.78841656) q0[249];
-cx q0[248],q0[249];
-rz(0.67364266) q0[249];
-cx q0[248],q0[249];
-rz(-pi) q0[248];
-sx q0[248];
-rz(-pi) q0[248];
-rz(-2.252265) q0[249];
-sx q0[249];
-rz(-pi) q0[249];
-cx q0[248],q0[249];
-sx q0[249];
-rz(2.252265) q0[249];
-sx q0[249];
-rz(-pi) q0[249];
-cx q0[248],q0[249];
-cx q0[248],q0[51];
-rz(pi/2) q0[248];
-sx q0[248];
-rz(pi/2) q0[248];
-sx q0[249];
-cx q0[51],q0[248];
-rz(-pi/4) q0[248];
-cx q0[0],q0[248];
-rz(pi/4) q0[248];
-cx q0[51],q0[248];
-rz(-pi/4) q0[248];
-cx q0[0],q0[248];
-rz(3*pi/4) q0[248];
-sx q0[248];
-rz(pi/2) q0[248];
-rz(pi/4) q0[51];
-cx q0[0],q0[51];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[51];
-cx q0[0],q0[51];
-cx q0[248],q0[51];
-sx q0[250];
-rz(2.8265381) q0[250];
-cx q0[249],q0[250];
-rz(1.0288547) q0[250];
-cx q0[249],q0[250];
-rz(-pi) q0[249];
-sx q0[249];
-rz(-pi) q0[249];
-rz(-2.613625) q0[250];
-sx q0[250];
-rz(-pi) q0[250];
-cx q0[249],q0[250];
-sx q0[250];
-rz(2.613625) q0[250];
-sx q0[250];
-rz(-pi) q0[250];
-cx q0[249],q0[250];
-cx q0[249],q0[52];
-rz(pi/2) q0[249];
-sx q0[249];
-rz(pi/2) q0[249];
-sx q0[250];
-cx q0[52],q0[249];
-rz(-pi/4) q0[249];
-cx q0[0],q0[249];
-rz(pi/4) q0[249];
-cx q0[52],q0[249];
-rz(-pi/4) q0[249];
-cx q0[0],q0[249];
-rz(3*pi/4) q0[249];
-sx q0[249];
-rz(pi/2) q0[249];
-rz(pi/4) q0[52];
-cx q0[0],q0[52];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[52];
-cx q0[0],q0[52];
-cx q0[249],q0[52];
-sx q0[251];
-rz(1.8195394) q0[251];
-cx q0[250],q0[251];
-rz(0.126036) q0[251];
-cx q0[250],q0[251];
-rz(-pi) q0[250];
-sx q0[250];
-rz(-pi) q0[250];
-rz(-2.4433706) q0[251];
-sx q0[251];
-rz(-pi) q0[251];
-cx q0[250],q0[251];
-sx q0[251];
-rz(2.4433706) q0[251];
-sx q0[251];
-rz(-pi) q0[251];
-cx q0[250],q0[251];
-cx q0[250],q0[53];
-rz(pi/2) q0[250];
-sx q0[250];
-rz(pi/2) q0[250];
-sx q0[251];
-cx q0[53],q0[250];
-rz(-pi/4) q0[250];
-cx q0[0],q0[250];
-rz(pi/4) q0[250];
-cx q0[53],q0[250];
-rz(-pi/4) q0[250];
-cx q0[0],q0[250];
-rz(3*pi/4) q0[250];
-sx q0[250];
-rz(pi/2) q0[250];
-rz(pi/4) q0[53];
-cx q0[0],q0[53];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[53];
-cx q0[0],q0[53];
-cx q0[250],q0[53];
-sx q0[252];
-rz(1.9644831) q0[252];
-cx q0[251],q0[252];
-rz(2.6528719) q0[252];
-cx q0[251],q0[252];
-rz(-pi) q0[251];
-sx q0[251];
-rz(-pi) q0[251];
-rz(-2.51065) q0[252];
-sx q0[252];
-rz(-pi) q0[252];
-cx q0[251],q0[252];
-sx q0[252];
-rz(2.51065) q0[252];
-sx q0[252];
-rz(-pi) q0[252];
-cx q0[251],q0[252];
-cx q0[251],q0[54];
-rz(pi/2) q0[251];
-sx q0[251];
-rz(pi/2) q0[251];
-sx q0[252];
-cx q0[54],q0[251];
-rz(-pi/4) q0[251];
-cx q0[0],q0[251];
-rz(pi/4) q0[251];
-cx q0[54],q0[251];
-rz(-pi/4) q0[251];
-cx q0[0],q0[251];
-rz(3*pi/4) q0[251];
-sx q0[251];
-rz(pi/2) q0[251];
-rz(pi/4) q0[54];
-cx q0[0],q0[54];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[54];
-cx q0[0],q0[54];
-cx q0[251],q0[54];
-sx q0[253];
-rz(1.1095528) q0[253];
-cx q0[252],q0[253];
-rz(0.083970227) q0[253];
-cx q0[252],q0[253];
-rz(-pi) q0[252];
-sx q0[252];
-rz(-pi) q0[252];
-rz(-3.0858111) q0[253];
-sx q0[253];
-rz(-pi) q0[253];
-cx q0[252],q0[253];
-sx q0[253];
-rz(3.0858111) q0[253];
-sx q0[253];
-rz(-pi) q0[253];
-cx q0[252],q0[253];
-cx q0[252],q0[55];
-rz(pi/2) q0[252];
-sx q0[252];
-rz(pi/2) q0[252];
-sx q0[253];
-cx q0[55],q0[252];
-rz(-pi/4) q0[252];
-cx q0[0],q0[252];
-rz(pi/4) q0[252];
-cx q0[55],q0[252];
-rz(-pi/4) q0[252];
-cx q0[0],q0[252];
-rz(3*pi/4) q0[252];
-sx q0[252];
-rz(pi/2) q0[252];
-rz(pi/4) q0[55];
-cx q0[0],q0[55];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[55];
-cx q0[0],q0[55];
-cx q0[252],q0[55];
-sx q0[254];
-rz(2.9090319) q0[254];
-cx q0[253],q0[254];
-rz(0.2913227) q0[254];
-cx q0[253],q0[254];
-rz(-pi) q0[253];
-sx q0[253];
-rz(-pi) q0[253];
-rz(-2.3450944) q0[254];
-sx q0[254];
-rz(-pi) q0[254];
-cx q0[253],q0[254];
-sx q0[254];
-rz(2.3450944) q0[254];
-sx q0[254];
-rz(-pi) q0[254];
-cx q0[253],q0[254];
-cx q0[253],q0[56];
-rz(pi/2) q0[253];
-sx q0[253];
-rz(pi/2) q0[253];
-sx q0[254];
-cx q0[56],q0[253];
-rz(-pi/4) q0[253];
-cx q0[0],q0[253];
-rz(pi/4) q0[253];
-cx q0[56],q0[253];
-rz(-pi/4) q0[253];
-cx q0[0],q0[253];
-rz(3*pi/4) q0[253];
-sx q0[253];
-rz(pi/2) q0[253];
-rz(pi/4) q0[56];
-cx q0[0],q0[56];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[56];
-cx q0[0],q0[56];
-cx q0[253],q0[56];
-sx q0[255];
-rz(2.0761698) q0[255];
-cx q0[254],q0[255];
-rz(2.273003) q0[255];
-cx q0[254],q0[255];
-rz(-pi) q0[254];
-sx q0[254];
-rz(-pi) q0[254];
-rz(-1.6848356) q0[255];
-sx q0[255];
-rz(-pi) q0[255];
-cx q0[254],q0[255];
-sx q0[255];
-rz(1.6848356) q0[255];
-sx q0[255];
-rz(-pi) q0[255];
-cx q0[254],q0[255];
-cx q0[254],q0[57];
-rz(pi/2) q0[254];
-sx q0[254];
-rz(pi/2) q0[254];
-sx q0[255];
-cx q0[57],q0[254];
-rz(-pi/4) q0[254];
-cx q0[0],q0[254];
-rz(pi/4) q0[254];
-cx q0[57],q0[254];
-rz(-pi/4) q0[254];
-cx q0[0],q0[254];
-rz(3*pi/4) q0[254];
-sx q0[254];
-rz(pi/2) q0[254];
-rz(pi/4) q0[57];
-cx q0[0],q0[57];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[57];
-cx q0[0],q0[57];
-cx q0[254],q0[57];
-sx q0[256];
-rz(0.66833694) q0[256];
-cx q0[255],q0[256];
-rz(0.75215466) q0[256];
-cx q0[255],q0[256];
-rz(-pi) q0[255];
-sx q0[255];
-rz(-pi) q0[255];
-rz(-3.078076) q0[256];
-sx q0[256];
-rz(-pi) q0[256];
-cx q0[255],q0[256];
-sx q0[256];
-rz(3.078076) q0[256];
-sx q0[256];
-rz(-pi) q0[256];
-cx q0[255],q0[256];
-cx q0[255],q0[58];
-rz(pi/2) q0[255];
-sx q0[255];
-rz(pi/2) q0[255];
-sx q0[256];
-cx q0[58],q0[255];
-rz(-pi/4) q0[255];
-cx q0[0],q0[255];
-rz(pi/4) q0[255];
-cx q0[58],q0[255];
-rz(-pi/4) q0[255];
-cx q0[0],q0[255];
-rz(3*pi/4) q0[255];
-sx q0[255];
-rz(pi/2) q0[255];
-rz(pi/4) q0[58];
-cx q0[0],q0[58];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[58];
-cx q0[0],q0[58];
-cx q0[255],q0[58];
-sx q0[257];
-rz(1.6783861) q0[257];
-cx q0[256],q0[257];
-rz(2.5400259) q0[257];
-cx q0[256],q0[257];
-rz(-pi) q0[256];
-sx q0[256];
-rz(-pi) q0[256];
-rz(-1.7612656) q0[257];
-sx q0[257];
-rz(-pi) q0[257];
-cx q0[256],q0[257];
-sx q0[257];
-rz(1.7612656) q0[257];
-sx q0[257];
-rz(-pi) q0[257];
-cx q0[256],q0[257];
-cx q0[256],q0[59];
-rz(pi/2) q0[256];
-sx q0[256];
-rz(pi/2) q0[256];
-sx q0[257];
-cx q0[59],q0[256];
-rz(-pi/4) q0[256];
-cx q0[0],q0[256];
-rz(pi/4) q0[256];
-cx q0[59],q0[256];
-rz(-pi/4) q0[256];
-cx q0[0],q0[256];
-rz(3*pi/4) q0[256];
-sx q0[256];
-rz(pi/2) q0[256];
-rz(pi/4) q0[59];
-cx q0[0],q0[59];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[59];
-cx q0[0],q0[59];
-cx q0[256],q0[59];
-sx q0[258];
-rz(0.41522303) q0[258];
-cx q0[257],q0[258];
-rz(2.5743366) q0[258];
-cx q0[257],q0[258];
-rz(-pi) q0[257];
-sx q0[257];
-rz(-pi) q0[257];
-rz(-2.2433358) q0[258];
-sx q0[258];
-rz(-pi) q0[258];
-cx q0[257],q0[258];
-sx q0[258];
-rz(2.2433358) q0[258];
-sx q0[258];
-rz(-pi) q0[258];
-cx q0[257],q0[258];
-cx q0[257],q0[60];
-rz(pi/2) q0[257];
-sx q0[257];
-rz(pi/2) q0[257];
-sx q0[258];
-cx q0[60],q0[257];
-rz(-pi/4) q0[257];
-cx q0[0],q0[257];
-rz(pi/4) q0[257];
-cx q0[60],q0[257];
-rz(-pi/4) q0[257];
-cx q0[0],q0[257];
-rz(3*pi/4) q0[257];
-sx q0[257];
-rz(pi/2) q0[257];
-rz(pi/4) q0[60];
-cx q0[0],q0[60];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[60];
-cx q0[0],q0[60];
-cx q0[257],q0[60];
-sx q0[259];
-rz(0.9491811) q0[259];
-cx q0[258],q0[259];
-rz(0.26618668) q0[259];
-cx q0[258],q0[259];
-rz(-pi) q0[258];
-sx q0[258];
-rz(-pi) q0[258];
-rz(-1.5761332) q0[259];
-sx q0[259];
-rz(-pi) q0[259];
-cx q0[258],q0[259];
-sx q0[259];
-rz(1.5761332) q0[259];
-sx q0[259];
-rz(-pi) q0[259];
-cx q0[258],q0[259];
-cx q0[258],q0[61];
-rz(pi/2) q0[258];
-sx q0[258];
-rz(pi/2) q0[258];
-sx q0[259];
-cx q0[61],q0[258];
-rz(-pi/4) q0[258];
-cx q0[0],q0[258];
-rz(pi/4) q0[258];
-cx q0[61],q0[258];
-rz(-pi/4) q0[258];
-cx q0[0],q0[258];
-rz(3*pi/4) q0[258];
-sx q0[258];
-rz(pi/2) q0[258];
-rz(pi/4) q0[61];
-cx q0[0],q0[61];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[61];
-cx q0[0],q0[61];
-cx q0[258],q0[61];
-sx q0[260];
-rz(1.1374269) q0[260];
-cx q0[259],q0[260];
-rz(2.9024561) q0[260];
-cx q0[259],q0[260];
-rz(-pi) q0[259];
-sx q0[259];
-rz(-pi) q0[259];
-rz(-1.9258474) q0[260];
-sx q0[260];
-rz(-pi) q0[260];
-cx q0[259],q0[260];
-sx q0[260];
-rz(1.9258474) q0[260];
-sx q0[260];
-rz(-pi) q0[260];
-cx q0[259],q0[260];
-cx q0[259],q0[62];
-rz(pi/2) q0[259];
-sx q0[259];
-rz(pi/2) q0[259];
-sx q0[260];
-cx q0[62],q0[259];
-rz(-pi/4) q0[259];
-cx q0[0],q0[259];
-rz(pi/4) q0[259];
-cx q0[62],q0[259];
-rz(-pi/4) q0[259];
-cx q0[0],q0[259];
-rz(3*pi/4) q0[259];
-sx q0[259];
-rz(pi/2) q0[259];
-rz(pi/4) q0[62];
-cx q0[0],q0[62];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[62];
-cx q0[0],q0[62];
-cx q0[259],q0[62];
-sx q0[261];
-rz(0.50947554) q0[261];
-cx q0[260],q0[261];
-rz(2.0431522) q0[261];
-cx q0[260],q0[261];
-rz(-pi) q0[260];
-sx q0[260];
-rz(-pi) q0[260];
-rz(-2.5777128) q0[261];
-sx q0[261];
-rz(-pi) q0[261];
-cx q0[260],q0[261];
-sx q0[261];
-rz(2.5777128) q0[261];
-sx q0[261];
-rz(-pi) q0[261];
-cx q0[260],q0[261];
-cx q0[260],q0[63];
-rz(pi/2) q0[260];
-sx q0[260];
-rz(pi/2) q0[260];
-sx q0[261];
-cx q0[63],q0[260];
-rz(-pi/4) q0[260];
-cx q0[0],q0[260];
-rz(pi/4) q0[260];
-cx q0[63],q0[260];
-rz(-pi/4) q0[260];
-cx q0[0],q0[260];
-rz(3*pi/4) q0[260];
-sx q0[260];
-rz(pi/2) q0[260];
-rz(pi/4) q0[63];
-cx q0[0],q0[63];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[63];
-cx q0[0],q0[63];
-cx q0[260],q0[63];
-sx q0[262];
-rz(2.3228525) q0[262];
-cx q0[261],q0[262];
-rz(0.78599814) q0[262];
-cx q0[261],q0[262];
-rz(-pi) q0[261];
-sx q0[261];
-rz(-pi) q0[261];
-rz(-3.0813226) q0[262];
-sx q0[262];
-rz(-pi) q0[262];
-cx q0[261],q0[262];
-sx q0[262];
-rz(3.0813226) q0[262];
-sx q0[262];
-rz(-pi) q0[262];
-cx q0[261],q0[262];
-cx q0[261],q0[64];
-rz(pi/2) q0[261];
-sx q0[261];
-rz(pi/2) q0[261];
-sx q0[262];
-cx q0[64],q0[261];
-rz(-pi/4) q0[261];
-cx q0[0],q0[261];
-rz(pi/4) q0[261];
-cx q0[64],q0[261];
-rz(-pi/4) q0[261];
-cx q0[0],q0[261];
-rz(3*pi/4) q0[261];
-sx q0[261];
-rz(pi/2) q0[261];
-rz(pi/4) q0[64];
-cx q0[0],q0[64];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[64];
-cx q0[0],q0[64];
-cx q0[261],q0[64];
-sx q0[263];
-rz(1.7730046) q0[263];
-cx q0[262],q0[263];
-rz(0.41775525) q0[263];
-cx q0[262],q0[263];
-rz(-pi) q0[262];
-sx q0[262];
-rz(-pi) q0[262];
-rz(-1.8351929) q0[263];
-sx q0[263];
-rz(-pi) q0[263];
-cx q0[262],q0[263];
-sx q0[263];
-rz(1.8351929) q0[263];
-sx q0[263];
-rz(-pi) q0[263];
-cx q0[262],q0[263];
-cx q0[262],q0[65];
-rz(pi/2) q0[262];
-sx q0[262];
-rz(pi/2) q0[262];
-sx q0[263];
-cx q0[65],q0[262];
-rz(-pi/4) q0[262];
-cx q0[0],q0[262];
-rz(pi/4) q0[262];
-cx q0[65],q0[262];
-rz(-pi/4) q0[262];
-cx q0[0],q0[262];
-rz(3*pi/4) q0[262];
-sx q0[262];
-rz(pi/2) q0[262];
-rz(pi/4) q0[65];
-cx q0[0],q0[65];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[65];
-cx q0[0],q0[65];
-cx q0[262],q0[65];
-sx q0[264];
-rz(1.0931775) q0[264];
-cx q0[263],q0[264];
-rz(0.49429264) q0[264];
-cx q0[263],q0[264];
-rz(-pi) q0[263];
-sx q0[263];
-rz(-pi) q0[263];
-rz(-3.134096) q0[264];
-sx q0[264];
-rz(-pi) q0[264];
-cx q0[263],q0[264];
-sx q0[264];
-rz(3.134096) q0[264];
-sx q0[264];
-rz(-pi) q0[264];
-cx q0[263],q0[264];
-cx q0[263],q0[66];
-rz(pi/2) q0[263];
-sx q0[263];
-rz(pi/2) q0[263];
-sx q0[264];
-cx q0[66],q0[263];
-rz(-pi/4) q0[263];
-cx q0[0],q0[263];
-rz(pi/4) q0[263];
-cx q0[66],q0[263];
-rz(-pi/4) q0[263];
-cx q0[0],q0[263];
-rz(3*pi/4) q0[263];
-sx q0[263];
-rz(pi/2) q0[263];
-rz(pi/4) q0[66];
-cx q0[0],q0[66];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[66];
-cx q0[0],q0[66];
-cx q0[263],q0[66];
-sx q0[265];
-rz(0.83740819) q0[265];
-cx q0[264],q0[265];
-rz(0.95716613) q0[265];
-cx q0[264],q0[265];
-rz(-pi) q0[264];
-sx q0[264];
-rz(-pi) q0[264];
-rz(-2.3261724) q0[265];
-sx q0[265];
-rz(-pi) q0[265];
-cx q0[264],q0[265];
-sx q0[265];
-rz(2.3261724) q0[265];
-sx q0[265];
-rz(-pi) q0[265];
-cx q0[264],q0[265];
-cx q0[264],q0[67];
-rz(pi/2) q0[264];
-sx q0[264];
-rz(pi/2) q0[264];
-sx q0[265];
-cx q0[67],q0[264];
-rz(-pi/4) q0[264];
-cx q0[0],q0[264];
-rz(pi/4) q0[264];
-cx q0[67],q0[264];
-rz(-pi/4) q0[264];
-cx q0[0],q0[264];
-rz(3*pi/4) q0[264];
-sx q0[264];
-rz(pi/2) q0[264];
-rz(pi/4) q0[67];
-cx q0[0],q0[67];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[67];
-cx q0[0],q0[67];
-cx q0[264],q0[67];
-sx q0[266];
-rz(2.7981191) q0[266];
-cx q0[265],q0[266];
-rz(2.602969) q0[266];
-cx q0[265],q0[266];
-rz(-pi) q0[265];
-sx q0[265];
-rz(-pi) q0[265];
-rz(-2.2844962) q0[266];
-sx q0[266];
-rz(-pi) q0[266];
-cx q0[265],q0[266];
-sx q0[266];
-rz(2.2844962) q0[266];
-sx q0[266];
-rz(-pi) q0[266];
-cx q0[265],q0[266];
-cx q0[265],q0[68];
-rz(pi/2) q0[265];
-sx q0[265];
-rz(pi/2) q0[265];
-sx q0[266];
-cx q0[68],q0[265];
-rz(-pi/4) q0[265];
-cx q0[0],q0[265];
-rz(pi/4) q0[265];
-cx q0[68],q0[265];
-rz(-pi/4) q0[265];
-cx q0[0],q0[265];
-rz(3*pi/4) q0[265];
-sx q0[265];
-rz(pi/2) q0[265];
-rz(pi/4) q0[68];
-cx q0[0],q0[68];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[68];
-cx q0[0],q0[68];
-cx q0[265],q0[68];
-sx q0[267];
-rz(1.5991839) q0[267];
-cx q0[266],q0[267];
-rz(1.4175711) q0[267];
-cx q0[266],q0[267];
-rz(-pi) q0[266];
-sx q0[266];
-rz(-pi) q0[266];
-rz(-2.6977685) q0[267];
-sx q0[267];
-rz(-pi) q0[267];
-cx q0[266],q0[267];
-sx q0[267];
-rz(2.6977685) q0[267];
-sx q0[267];
-rz(-pi) q0[267];
-cx q0[266],q0[267];
-cx q0[266],q0[69];
-rz(pi/2) q0[266];
-sx q0[266];
-rz(pi/2) q0[266];
-sx q0[267];
-cx q0[69],q0[266];
-rz(-pi/4) q0[266];
-cx q0[0],q0[266];
-rz(pi/4) q0[266];
-cx q0[69],q0[266];
-rz(-pi/4) q0[266];
-cx q0[0],q0[266];
-rz(3*pi/4) q0[266];
-sx q0[266];
-rz(pi/2) q0[266];
-rz(pi/4) q0[69];
-cx q0[0],q0[69];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[69];
-cx q0[0],q0[69];
-cx q0[266],q0[69];
-sx q0[268];
-rz(0.70036913) q0[268];
-cx q0[267],q0[268];
-rz(1.8175744) q0[268];
-cx q0[267],q0[268];
-rz(-pi) q0[267];
-sx q0[267];
-rz(-pi) q0[267];
-rz(-1.6324276) q0[268];
-sx q0[268];
-rz(-pi) q0[268];
-cx q0[267],q0[268];
-sx q0[268];
-rz(1.6324276) q0[268];
-sx q0[268];
-rz(-pi) q0[268];
-cx q0[267],q0[268];
-cx q0[267],q0[70];
-rz(pi/2) q0[267];
-sx q0[267];
-rz(pi/2) q0[267];
-sx q0[268];
-cx q0[70],q0[267];
-rz(-pi/4) q0[267];
-cx q0[0],q0[267];
-rz(pi/4) q0[267];
-cx q0[70],q0[267];
-rz(-pi/4) q0[267];
-cx q0[0],q0[267];
-rz(3*pi/4) q0[267];
-sx q0[267];
-rz(pi/2) q0[267];
-rz(pi/4) q0[70];
-cx q0[0],q0[70];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[70];
-cx q0[0],q0[70];
-cx q0[267],q0[70];
-sx q0[269];
-rz(0.8627921) q0[269];
-cx q0[268],q0[269];
-rz(1.7215713) q0[269];
-cx q0[268],q0[269];
-rz(-pi) q0[268];
-sx q0[268];
-rz(-pi) q0[268];
-rz(-2.9477623) q0[269];
-sx q0[269];
-rz(-pi) q0[269];
-cx q0[268],q0[269];
-sx q0[269];
-rz(2.9477623) q0[269];
-sx q0[269];
-rz(-pi) q0[269];
-cx q0[268],q0[269];
-cx q0[268],q0[71];
-rz(pi/2) q0[268];
-sx q0[268];
-rz(pi/2) q0[268];
-sx q0[269];
-cx q0[71],q0[268];
-rz(-pi/4) q0[268];
-cx q0[0],q0[268];
-rz(pi/4) q0[268];
-cx q0[71],q0[268];
-rz(-pi/4) q0[268];
-cx q0[0],q0[268];
-rz(3*pi/4) q0[268];
-sx q0[268];
-rz(pi/2) q0[268];
-rz(pi/4) q0[71];
-cx q0[0],q0[71];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[71];
-cx q0[0],q0[71];
-cx q0[268],q0[71];
-sx q0[270];
-rz(0.521997) q0[270];
-cx q0[269],q0[270];
-rz(1.8998785) q0[270];
-cx q0[269],q0[270];
-rz(-pi) q0[269];
-sx q0[269];
-rz(-pi) q0[269];
-rz(-1.5802295) q0[270];
-sx q0[270];
-rz(-pi) q0[270];
-cx q0[269],q0[270];
-sx q0[270];
-rz(1.5802295) q0[270];
-sx q0[270];
-rz(-pi) q0[270];
-cx q0[269],q0[270];
-cx q0[269],q0[72];
-rz(pi/2) q0[269];
-sx q0[269];
-rz(pi/2) q0[269];
-sx q0[270];
-cx q0[72],q0[269];
-rz(-pi/4) q0[269];
-cx q0[0],q0[269];
-rz(pi/4) q0[269];
-cx q0[72],q0[269];
-rz(-pi/4) q0[269];
-cx q0[0],q0[269];
-rz(3*pi/4) q0[269];
-sx q0[269];
-rz(pi/2) q0[269];
-rz(pi/4) q0[72];
-cx q0[0],q0[72];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[72];
-cx q0[0],q0[72];
-cx q0[269],q0[72];
-sx q0[271];
-rz(2.1494993) q0[271];
-cx q0[270],q0[271];
-rz(1.8278401) q0[271];
-cx q0[270],q0[271];
-rz(-pi) q0[270];
-sx q0[270];
-rz(-pi) q0[270];
-rz(-1.7330833) q0[271];
-sx q0[271];
-rz(-pi) q0[271];
-cx q0[270],q0[271];
-sx q0[271];
-rz(1.7330833) q0[271];
-sx q0[271];
-rz(-pi) q0[271];
-cx q0[270],q0[271];
-cx q0[270],q0[73];
-rz(pi/2) q0[270];
-sx q0[270];
-rz(pi/2) q0[270];
-sx q0[271];
-cx q0[73],q0[270];
-rz(-pi/4) q0[270];
-cx q0[0],q0[270];
-rz(pi/4) q0[270];
-cx q0[73],q0[270];
-rz(-pi/4) q0[270];
-cx q0[0],q0[270];
-rz(3*pi/4) q0[270];
-sx q0[270];
-rz(pi/2) q0[270];
-rz(pi/4) q0[73];
-cx q0[0],q0[73];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[73];
-cx q0[0],q0[73];
-cx q0[270],q0[73];
-sx q0[272];
-rz(1.1879547) q0[272];
-cx q0[271],q0[272];
-rz(2.1266798) q0[272];
-cx q0[271],q0[272];
-rz(-pi) q0[271];
-sx q0[271];
-rz(-pi) q0[271];
-rz(-2.8639228) q0[272];
-sx q0[272];
-rz(-pi) q0[272];
-cx q0[271],q0[272];
-sx q0[272];
-rz(2.8639228) q0[272];
-sx q0[272];
-rz(-pi) q0[272];
-cx q0[271],q0[272];
-cx q0[271],q0[74];
-rz(pi/2) q0[271];
-sx q0[271];
-rz(pi/2) q0[271];
-sx q0[272];
-cx q0[74],q0[271];
-rz(-pi/4) q0[271];
-cx q0[0],q0[271];
-rz(pi/4) q0[271];
-cx q0[74],q0[271];
-rz(-pi/4) q0[271];
-cx q0[0],q0[271];
-rz(3*pi/4) q0[271];
-sx q0[271];
-rz(pi/2) q0[271];
-rz(pi/4) q0[74];
-cx q0[0],q0[74];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[74];
-cx q0[0],q0[74];
-cx q0[271],q0[74];
-sx q0[273];
-rz(0.025147919) q0[273];
-cx q0[272],q0[273];
-rz(0.98287847) q0[273];
-cx q0[272],q0[273];
-rz(-pi) q0[272];
-sx q0[272];
-rz(-pi) q0[272];
-rz(-2.4637415) q0[273];
-sx q0[273];
-rz(-pi) q0[273];
-cx q0[272],q0[273];
-sx q0[273];
-rz(2.4637415) q0[273];
-sx q0[273];
-rz(-pi) q0[273];
-cx q0[272],q0[273];
-cx q0[272],q0[75];
-rz(pi/2) q0[272];
-sx q0[272];
-rz(pi/2) q0[272];
-sx q0[273];
-cx q0[75],q0[272];
-rz(-pi/4) q0[272];
-cx q0[0],q0[272];
-rz(pi/4) q0[272];
-cx q0[75],q0[272];
-rz(-pi/4) q0[272];
-cx q0[0],q0[272];
-rz(3*pi/4) q0[272];
-sx q0[272];
-rz(pi/2) q0[272];
-rz(pi/4) q0[75];
-cx q0[0],q0[75];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[75];
-cx q0[0],q0[75];
-cx q0[272],q0[75];
-sx q0[274];
-rz(0.55944942) q0[274];
-cx q0[273],q0[274];
-rz(1.290705) q0[274];
-cx q0[273],q0[274];
-rz(-pi) q0[273];
-sx q0[273];
-rz(-pi) q0[273];
-rz(-2.1069521) q0[274];
-sx q0[274];
-rz(-pi) q0[274];
-cx q0[273],q0[274];
-sx q0[274];
-rz(2.1069521) q0[274];
-sx q0[274];
-rz(-pi) q0[274];
-cx q0[273],q0[274];
-cx q0[273],q0[76];
-rz(pi/2) q0[273];
-sx q0[273];
-rz(pi/2) q0[273];
-sx q0[274];
-cx q0[76],q0[273];
-rz(-pi/4) q0[273];
-cx q0[0],q0[273];
-rz(pi/4) q0[273];
-cx q0[76],q0[273];
-rz(-pi/4) q0[273];
-cx q0[0],q0[273];
-rz(3*pi/4) q0[273];
-sx q0[273];
-rz(pi/2) q0[273];
-rz(pi/4) q0[76];
-cx q0[0],q0[76];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[76];
-cx q0[0],q0[76];
-cx q0[273],q0[76];
-sx q0[275];
-rz(0.62905815) q0[275];
-cx q0[274],q0[275];
-rz(0.4911615) q0[275];
-cx q0[274],q0[275];
-rz(-pi) q0[274];
-sx q0[274];
-rz(-pi) q0[274];
-rz(-2.1038071) q0[275];
-sx q0[275];
-rz(-pi) q0[275];
-cx q0[274],q0[275];
-sx q0[275];
-rz(2.1038071) q0[275];
-sx q0[275];
-rz(-pi) q0[275];
-cx q0[274],q0[275];
-cx q0[274],q0[77];
-rz(pi/2) q0[274];
-sx q0[274];
-rz(pi/2) q0[274];
-sx q0[275];
-cx q0[77],q0[274];
-rz(-pi/4) q0[274];
-cx q0[0],q0[274];
-rz(pi/4) q0[274];
-cx q0[77],q0[274];
-rz(-pi/4) q0[274];
-cx q0[0],q0[274];
-rz(3*pi/4) q0[274];
-sx q0[274];
-rz(pi/2) q0[274];
-rz(pi/4) q0[77];
-cx q0[0],q0[77];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[77];
-cx q0[0],q0[77];
-cx q0[274],q0[77];
-sx q0[276];
-rz(2.0634554) q0[276];
-cx q0[275],q0[276];
-rz(1.9690473) q0[276];
-cx q0[275],q0[276];
-rz(-pi) q0[275];
-sx q0[275];
-rz(-pi) q0[275];
-rz(-2.2165398) q0[276];
-sx q0[276];
-rz(-pi) q0[276];
-cx q0[275],q0[276];
-sx q0[276];
-rz(2.2165398) q0[276];
-sx q0[276];
-rz(-pi) q0[276];
-cx q0[275],q0[276];
-cx q0[275],q0[78];
-rz(pi/2) q0[275];
-sx q0[275];
-rz(pi/2) q0[275];
-sx q0[276];
-cx q0[78],q0[275];
-rz(-pi/4) q0[275];
-cx q0[0],q0[275];
-rz(pi/4) q0[275];
-cx q0[78],q0[275];
-rz(-pi/4) q0[275];
-cx q0[0],q0[275];
-rz(3*pi/4) q0[275];
-sx q0[275];
-rz(pi/2) q0[275];
-rz(pi/4) q0[78];
-cx q0[0],q0[78];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[78];
-cx q0[0],q0[78];
-cx q0[275],q0[78];
-sx q0[277];
-rz(2.6802985) q0[277];
-cx q0[276],q0[277];
-rz(2.7018364) q0[277];
-cx q0[276],q0[277];
-rz(-pi) q0[276];
-sx q0[276];
-rz(-pi) q0[276];
-rz(-2.8918061) q0[277];
-sx q0[277];
-rz(-pi) q0[277];
-cx q0[276],q0[277];
-sx q0[277];
-rz(2.8918061) q0[277];
-sx q0[277];
-rz(-pi) q0[277];
-cx q0[276],q0[277];
-cx q0[276],q0[79];
-rz(pi/2) q0[276];
-sx q0[276];
-rz(pi/2) q0[276];
-sx q0[277];
-cx q0[79],q0[276];
-rz(-pi/4) q0[276];
-cx q0[0],q0[276];
-rz(pi/4) q0[276];
-cx q0[79],q0[276];
-rz(-pi/4) q0[276];
-cx q0[0],q0[276];
-rz(3*pi/4) q0[276];
-sx q0[276];
-rz(pi/2) q0[276];
-rz(pi/4) q0[79];
-cx q0[0],q0[79];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[79];
-cx q0[0],q0[79];
-cx q0[276],q0[79];
-sx q0[278];
-rz(1.8904227) q0[278];
-cx q0[277],q0[278];
-rz(3.014635) q0[278];
-cx q0[277],q0[278];
-rz(-pi) q0[277];
-sx q0[277];
-rz(-pi) q0[277];
-rz(-2.3673045) q0[278];
-sx q0[278];
-rz(-pi) q0[278];
-cx q0[277],q0[278];
-sx q0[278];
-rz(2.3673045) q0[278];
-sx q0[278];
-rz(-pi) q0[278];
-cx q0[277],q0[278];
-cx q0[277],q0[80];
-rz(pi/2) q0[277];
-sx q0[277];
-rz(pi/2) q0[277];
-sx q0[278];
-cx q0[80],q0[277];
-rz(-pi/4) q0[277];
-cx q0[0],q0[277];
-rz(pi/4) q0[277];
-cx q0[80],q0[277];
-rz(-pi/4) q0[277];
-cx q0[0],q0[277];
-rz(3*pi/4) q0[277];
-sx q0[277];
-rz(pi/2) q0[277];
-rz(pi/4) q0[80];
-cx q0[0],q0[80];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[80];
-cx q0[0],q0[80];
-cx q0[277],q0[80];
-sx q0[279];
-rz(2.6632026) q0[279];
-cx q0[278],q0[279];
-rz(2.4491297) q0[279];
-cx q0[278],q0[279];
-rz(-pi) q0[278];
-sx q0[278];
-rz(-pi) q0[278];
-rz(-3.0274145) q0[279];
-sx q0[279];
-rz(-pi) q0[279];
-cx q0[278],q0[279];
-sx q0[279];
-rz(3.0274145) q0[279];
-sx q0[279];
-rz(-pi) q0[279];
-cx q0[278],q0[279];
-cx q0[278],q0[81];
-rz(pi/2) q0[278];
-sx q0[278];
-rz(pi/2) q0[278];
-sx q0[279];
-cx q0[81],q0[278];
-rz(-pi/4) q0[278];
-cx q0[0],q0[278];
-rz(pi/4) q0[278];
-cx q0[81],q0[278];
-rz(-pi/4) q0[278];
-cx q0[0],q0[278];
-rz(3*pi/4) q0[278];
-sx q0[278];
-rz(pi/2) q0[278];
-rz(pi/4) q0[81];
-cx q0[0],q0[81];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[81];
-cx q0[0],q0[81];
-cx q0[278],q0[81];
-sx q0[280];
-rz(3.0796992) q0[280];
-cx q0[279],q0[280];
-rz(2.9893835) q0[280];
-cx q0[279],q0[280];
-rz(-pi) q0[279];
-sx q0[279];
-rz(-pi) q0[279];
-rz(-2.5604467) q0[280];
-sx q0[280];
-rz(-pi) q0[280];
-cx q0[279],q0[280];
-sx q0[280];
-rz(2.5604467) q0[280];
-sx q0[280];
-rz(-pi) q0[280];
-cx q0[279],q0[280];
-cx q0[279],q0[82];
-rz(pi/2) q0[279];
-sx q0[279];
-rz(pi/2) q0[279];
-sx q0[280];
-cx q0[82],q0[279];
-rz(-pi/4) q0[279];
-cx q0[0],q0[279];
-rz(pi/4) q0[279];
-cx q0[82],q0[279];
-rz(-pi/4) q0[279];
-cx q0[0],q0[279];
-rz(3*pi/4) q0[279];
-sx q0[279];
-rz(pi/2) q0[279];
-rz(pi/4) q0[82];
-cx q0[0],q0[82];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[82];
-cx q0[0],q0[82];
-cx q0[279],q0[82];
-sx q0[281];
-rz(2.4137934) q0[281];
-cx q0[280],q0[281];
-rz(1.5144285) q0[281];
-cx q0[280],q0[281];
-rz(-pi) q0[280];
-sx q0[280];
-rz(-pi) q0[280];
-rz(-2.7142975) q0[281];
-sx q0[281];
-rz(-pi) q0[281];
-cx q0[280],q0[281];
-sx q0[281];
-rz(2.7142975) q0[281];
-sx q0[281];
-rz(-pi) q0[281];
-cx q0[280],q0[281];
-cx q0[280],q0[83];
-rz(pi/2) q0[280];
-sx q0[280];
-rz(pi/2) q0[280];
-sx q0[281];
-cx q0[83],q0[280];
-rz(-pi/4) q0[280];
-cx q0[0],q0[280];
-rz(pi/4) q0[280];
-cx q0[83],q0[280];
-rz(-pi/4) q0[280];
-cx q0[0],q0[280];
-rz(3*pi/4) q0[280];
-sx q0[280];
-rz(pi/2) q0[280];
-rz(pi/4) q0[83];
-cx q0[0],q0[83];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[83];
-cx q0[0],q0[83];
-cx q0[280],q0[83];
-sx q0[282];
-rz(0.16627015) q0[282];
-cx q0[281],q0[282];
-rz(2.1816535) q0[282];
-cx q0[281],q0[282];
-rz(-pi) q0[281];
-sx q0[281];
-rz(-pi) q0[281];
-rz(-1.8616474) q0[282];
-sx q0[282];
-rz(-pi) q0[282];
-cx q0[281],q0[282];
-sx q0[282];
-rz(1.8616474) q0[282];
-sx q0[282];
-rz(-pi) q0[282];
-cx q0[281],q0[282];
-cx q0[281],q0[84];
-rz(pi/2) q0[281];
-sx q0[281];
-rz(pi/2) q0[281];
-sx q0[282];
-cx q0[84],q0[281];
-rz(-pi/4) q0[281];
-cx q0[0],q0[281];
-rz(pi/4) q0[281];
-cx q0[84],q0[281];
-rz(-pi/4) q0[281];
-cx q0[0],q0[281];
-rz(3*pi/4) q0[281];
-sx q0[281];
-rz(pi/2) q0[281];
-rz(pi/4) q0[84];
-cx q0[0],q0[84];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[84];
-cx q0[0],q0[84];
-cx q0[281],q0[84];
-sx q0[283];
-rz(1.4019257) q0[283];
-cx q0[282],q0[283];
-rz(0.58251655) q0[283];
-cx q0[282],q0[283];
-rz(-pi) q0[282];
-sx q0[282];
-rz(-pi) q0[282];
-rz(-2.1872402) q0[283];
-sx q0[283];
-rz(-pi) q0[283];
-cx q0[282],q0[283];
-sx q0[283];
-rz(2.1872402) q0[283];
-sx q0[283];
-rz(-pi) q0[283];
-cx q0[282],q0[283];
-cx q0[282],q0[85];
-rz(pi/2) q0[282];
-sx q0[282];
-rz(pi/2) q0[282];
-sx q0[283];
-cx q0[85],q0[282];
-rz(-pi/4) q0[282];
-cx q0[0],q0[282];
-rz(pi/4) q0[282];
-cx q0[85],q0[282];
-rz(-pi/4) q0[282];
-cx q0[0],q0[282];
-rz(3*pi/4) q0[282];
-sx q0[282];
-rz(pi/2) q0[282];
-rz(pi/4) q0[85];
-cx q0[0],q0[85];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[85];
-cx q0[0],q0[85];
-cx q0[282],q0[85];
-sx q0[284];
-rz(1.0893591) q0[284];
-cx q0[283],q0[284];
-rz(2.0260262) q0[284];
-cx q0[283],q0[284];
-rz(-pi) q0[283];
-sx q0[283];
-rz(-pi) q0[283];
-rz(-2.5461422) q0[284];
-sx q0[284];
-rz(-pi) q0[284];
-cx q0[283],q0[284];
-sx q0[284];
-rz(2.5461422) q0[284];
-sx q0[284];
-rz(-pi) q0[284];
-cx q0[283],q0[284];
-cx q0[283],q0[86];
-rz(pi/2) q0[283];
-sx q0[283];
-rz(pi/2) q0[283];
-sx q0[284];
-cx q0[86],q0[283];
-rz(-pi/4) q0[283];
-cx q0[0],q0[283];
-rz(pi/4) q0[283];
-cx q0[86],q0[283];
-rz(-pi/4) q0[283];
-cx q0[0],q0[283];
-rz(3*pi/4) q0[283];
-sx q0[283];
-rz(pi/2) q0[283];
-rz(pi/4) q0[86];
-cx q0[0],q0[86];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[86];
-cx q0[0],q0[86];
-cx q0[283],q0[86];
-sx q0[285];
-rz(2.9162498) q0[285];
-cx q0[284],q0[285];
-rz(0.47486584) q0[285];
-cx q0[284],q0[285];
-rz(-pi) q0[284];
-sx q0[284];
-rz(-pi) q0[284];
-rz(-2.4943215) q0[285];
-sx q0[285];
-rz(-pi) q0[285];
-cx q0[284],q0[285];
-sx q0[285];
-rz(2.4943215) q0[285];
-sx q0[285];
-rz(-pi) q0[285];
-cx q0[284],q0[285];
-cx q0[284],q0[87];
-rz(pi/2) q0[284];
-sx q0[284];
-rz(pi/2) q0[284];
-sx q0[285];
-cx q0[87],q0[284];
-rz(-pi/4) q0[284];
-cx q0[0],q0[284];
-rz(pi/4) q0[284];
-cx q0[87],q0[284];
-rz(-pi/4) q0[284];
-cx q0[0],q0[284];
-rz(3*pi/4) q0[284];
-sx q0[284];
-rz(pi/2) q0[284];
-rz(pi/4) q0[87];
-cx q0[0],q0[87];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[87];
-cx q0[0],q0[87];
-cx q0[284],q0[87];
-sx q0[286];
-rz(1.0256587) q0[286];
-cx q0[285],q0[286];
-rz(0.34207756) q0[286];
-cx q0[285],q0[286];
-rz(-pi) q0[285];
-sx q0[285];
-rz(-pi) q0[285];
-rz(-2.8211174) q0[286];
-sx q0[286];
-rz(-pi) q0[286];
-cx q0[285],q0[286];
-sx q0[286];
-rz(2.8211174) q0[286];
-sx q0[286];
-rz(-pi) q0[286];
-cx q0[285],q0[286];
-cx q0[285],q0[88];
-rz(pi/2) q0[285];
-sx q0[285];
-rz(pi/2) q0[285];
-sx q0[286];
-cx q0[88],q0[285];
-rz(-pi/4) q0[285];
-cx q0[0],q0[285];
-rz(pi/4) q0[285];
-cx q0[88],q0[285];
-rz(-pi/4) q0[285];
-cx q0[0],q0[285];
-rz(3*pi/4) q0[285];
-sx q0[285];
-rz(pi/2) q0[285];
-rz(pi/4) q0[88];
-cx q0[0],q0[88];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[88];
-cx q0[0],q0[88];
-cx q0[285],q0[88];
-sx q0[287];
-rz(0.047548274) q0[287];
-cx q0[286],q0[287];
-rz(2.7188525) q0[287];
-cx q0[286],q0[287];
-rz(-pi) q0[286];
-sx q0[286];
-rz(-pi) q0[286];
-rz(-2.7509357) q0[287];
-sx q0[287];
-rz(-pi) q0[287];
-cx q0[286],q0[287];
-sx q0[287];
-rz(2.7509357) q0[287];
-sx q0[287];
-rz(-pi) q0[287];
-cx q0[286],q0[287];
-cx q0[286],q0[89];
-rz(pi/2) q0[286];
-sx q0[286];
-rz(pi/2) q0[286];
-sx q0[287];
-cx q0[89],q0[286];
-rz(-pi/4) q0[286];
-cx q0[0],q0[286];
-rz(pi/4) q0[286];
-cx q0[89],q0[286];
-rz(-pi/4) q0[286];
-cx q0[0],q0[286];
-rz(3*pi/4) q0[286];
-sx q0[286];
-rz(pi/2) q0[286];
-rz(pi/4) q0[89];
-cx q0[0],q0[89];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[89];
-cx q0[0],q0[89];
-cx q0[286],q0[89];
-sx q0[288];
-rz(2.7678702) q0[288];
-cx q0[287],q0[288];
-rz(2.2907264) q0[288];
-cx q0[287],q0[288];
-rz(-pi) q0[287];
-sx q0[287];
-rz(-pi) q0[287];
-rz(-2.0520463) q0[288];
-sx q0[288];
-rz(-pi) q0[288];
-cx q0[287],q0[288];
-sx q0[288];
-rz(2.0520463) q0[288];
-sx q0[288];
-rz(-pi) q0[288];
-cx q0[287],q0[288];
-cx q0[287],q0[90];
-rz(pi/2) q0[287];
-sx q0[287];
-rz(pi/2) q0[287];
-sx q0[288];
-cx q0[90],q0[287];
-rz(-pi/4) q0[287];
-cx q0[0],q0[287];
-rz(pi/4) q0[287];
-cx q0[90],q0[287];
-rz(-pi/4) q0[287];
-cx q0[0],q0[287];
-rz(3*pi/4) q0[287];
-sx q0[287];
-rz(pi/2) q0[287];
-rz(pi/4) q0[90];
-cx q0[0],q0[90];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[90];
-cx q0[0],q0[90];
-cx q0[287],q0[90];
-sx q0[289];
-rz(0.62601274) q0[289];
-cx q0[288],q0[289];
-rz(1.1338155) q0[289];
-cx q0[288],q0[289];
-rz(-pi) q0[288];
-sx q0[288];
-rz(-pi) q0[288];
-rz(-2.4014537) q0[289];
-sx q0[289];
-rz(-pi) q0[289];
-cx q0[288],q0[289];
-sx q0[289];
-rz(2.4014537) q0[289];
-sx q0[289];
-rz(-pi) q0[289];
-cx q0[288],q0[289];
-cx q0[288],q0[91];
-rz(pi/2) q0[288];
-sx q0[288];
-rz(pi/2) q0[288];
-sx q0[289];
-cx q0[91],q0[288];
-rz(-pi/4) q0[288];
-cx q0[0],q0[288];
-rz(pi/4) q0[288];
-cx q0[91],q0[288];
-rz(-pi/4) q0[288];
-cx q0[0],q0[288];
-rz(3*pi/4) q0[288];
-sx q0[288];
-rz(pi/2) q0[288];
-rz(pi/4) q0[91];
-cx q0[0],q0[91];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[91];
-cx q0[0],q0[91];
-cx q0[288],q0[91];
-sx q0[290];
-rz(2.4482956) q0[290];
-cx q0[289],q0[290];
-rz(2.7500438) q0[290];
-cx q0[289],q0[290];
-rz(-pi) q0[289];
-sx q0[289];
-rz(-pi) q0[289];
-rz(-2.8826344) q0[290];
-sx q0[290];
-rz(-pi) q0[290];
-cx q0[289],q0[290];
-sx q0[290];
-rz(2.8826344) q0[290];
-sx q0[290];
-rz(-pi) q0[290];
-cx q0[289],q0[290];
-cx q0[289],q0[92];
-rz(pi/2) q0[289];
-sx q0[289];
-rz(pi/2) q0[289];
-sx q0[290];
-cx q0[92],q0[289];
-rz(-pi/4) q0[289];
-cx q0[0],q0[289];
-rz(pi/4) q0[289];
-cx q0[92],q0[289];
-rz(-pi/4) q0[289];
-cx q0[0],q0[289];
-rz(3*pi/4) q0[289];
-sx q0[289];
-rz(pi/2) q0[289];
-rz(pi/4) q0[92];
-cx q0[0],q0[92];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[92];
-cx q0[0],q0[92];
-cx q0[289],q0[92];
-sx q0[291];
-rz(2.7816214) q0[291];
-cx q0[290],q0[291];
-rz(0.79458337) q0[291];
-cx q0[290],q0[291];
-rz(-pi) q0[290];
-sx q0[290];
-rz(-pi) q0[290];
-rz(-2.1135975) q0[291];
-sx q0[291];
-rz(-pi) q0[291];
-cx q0[290],q0[291];
-sx q0[291];
-rz(2.1135975) q0[291];
-sx q0[291];
-rz(-pi) q0[291];
-cx q0[290],q0[291];
-cx q0[290],q0[93];
-rz(pi/2) q0[290];
-sx q0[290];
-rz(pi/2) q0[290];
-sx q0[291];
-cx q0[93],q0[290];
-rz(-pi/4) q0[290];
-cx q0[0],q0[290];
-rz(pi/4) q0[290];
-cx q0[93],q0[290];
-rz(-pi/4) q0[290];
-cx q0[0],q0[290];
-rz(3*pi/4) q0[290];
-sx q0[290];
-rz(pi/2) q0[290];
-rz(pi/4) q0[93];
-cx q0[0],q0[93];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[93];
-cx q0[0],q0[93];
-cx q0[290],q0[93];
-sx q0[292];
-rz(0.39318029) q0[292];
-cx q0[291],q0[292];
-rz(2.4153699) q0[292];
-cx q0[291],q0[292];
-rz(-pi) q0[291];
-sx q0[291];
-rz(-pi) q0[291];
-rz(-2.9427817) q0[292];
-sx q0[292];
-rz(-pi) q0[292];
-cx q0[291],q0[292];
-sx q0[292];
-rz(2.9427817) q0[292];
-sx q0[292];
-rz(-pi) q0[292];
-cx q0[291],q0[292];
-cx q0[291],q0[94];
-rz(pi/2) q0[291];
-sx q0[291];
-rz(pi/2) q0[291];
-sx q0[292];
-cx q0[94],q0[291];
-rz(-pi/4) q0[291];
-cx q0[0],q0[291];
-rz(pi/4) q0[291];
-cx q0[94],q0[291];
-rz(-pi/4) q0[291];
-cx q0[0],q0[291];
-rz(3*pi/4) q0[291];
-sx q0[291];
-rz(pi/2) q0[291];
-rz(pi/4) q0[94];
-cx q0[0],q0[94];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[94];
-cx q0[0],q0[94];
-cx q0[291],q0[94];
-sx q0[293];
-rz(0.1008094) q0[293];
-cx q0[292],q0[293];
-rz(0.46355037) q0[293];
-cx q0[292],q0[293];
-rz(-pi) q0[292];
-sx q0[292];
-rz(-pi) q0[292];
-rz(-2.877352) q0[293];
-sx q0[293];
-rz(-pi) q0[293];
-cx q0[292],q0[293];
-sx q0[293];
-rz(2.877352) q0[293];
-sx q0[293];
-rz(-pi) q0[293];
-cx q0[292],q0[293];
-cx q0[292],q0[95];
-rz(pi/2) q0[292];
-sx q0[292];
-rz(pi/2) q0[292];
-sx q0[293];
-cx q0[95],q0[292];
-rz(-pi/4) q0[292];
-cx q0[0],q0[292];
-rz(pi/4) q0[292];
-cx q0[95],q0[292];
-rz(-pi/4) q0[292];
-cx q0[0],q0[292];
-rz(3*pi/4) q0[292];
-sx q0[292];
-rz(pi/2) q0[292];
-rz(pi/4) q0[95];
-cx q0[0],q0[95];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[95];
-cx q0[0],q0[95];
-cx q0[292],q0[95];
-sx q0[294];
-rz(0.21140908) q0[294];
-cx q0[293],q0[294];
-rz(2.1389488) q0[294];
-cx q0[293],q0[294];
-rz(-pi) q0[293];
-sx q0[293];
-rz(-pi) q0[293];
-rz(-2.1869225) q0[294];
-sx q0[294];
-rz(-pi) q0[294];
-cx q0[293],q0[294];
-sx q0[294];
-rz(2.1869225) q0[294];
-sx q0[294];
-rz(-pi) q0[294];
-cx q0[293],q0[294];
-cx q0[293],q0[96];
-rz(pi/2) q0[293];
-sx q0[293];
-rz(pi/2) q0[293];
-sx q0[294];
-cx q0[96],q0[293];
-rz(-pi/4) q0[293];
-cx q0[0],q0[293];
-rz(pi/4) q0[293];
-cx q0[96],q0[293];
-rz(-pi/4) q0[293];
-cx q0[0],q0[293];
-rz(3*pi/4) q0[293];
-sx q0[293];
-rz(pi/2) q0[293];
-rz(pi/4) q0[96];
-cx q0[0],q0[96];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[96];
-cx q0[0],q0[96];
-cx q0[293],q0[96];
-sx q0[295];
-rz(2.4539608) q0[295];
-cx q0[294],q0[295];
-rz(2.4011371) q0[295];
-cx q0[294],q0[295];
-rz(-pi) q0[294];
-sx q0[294];
-rz(-pi) q0[294];
-rz(-1.6223651) q0[295];
-sx q0[295];
-rz(-pi) q0[295];
-cx q0[294],q0[295];
-sx q0[295];
-rz(1.6223651) q0[295];
-sx q0[295];
-rz(-pi) q0[295];
-cx q0[294],q0[295];
-cx q0[294],q0[97];
-rz(pi/2) q0[294];
-sx q0[294];
-rz(pi/2) q0[294];
-sx q0[295];
-cx q0[97],q0[294];
-rz(-pi/4) q0[294];
-cx q0[0],q0[294];
-rz(pi/4) q0[294];
-cx q0[97],q0[294];
-rz(-pi/4) q0[294];
-cx q0[0],q0[294];
-rz(3*pi/4) q0[294];
-sx q0[294];
-rz(pi/2) q0[294];
-rz(pi/4) q0[97];
-cx q0[0],q0[97];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[97];
-cx q0[0],q0[97];
-cx q0[294],q0[97];
-sx q0[296];
-rz(1.8529145) q0[296];
-cx q0[295],q0[296];
-rz(2.4093038) q0[296];
-cx q0[295],q0[296];
-rz(-pi) q0[295];
-sx q0[295];
-rz(-pi) q0[295];
-rz(-1.5851877) q0[296];
-sx q0[296];
-rz(-pi) q0[296];
-cx q0[295],q0[296];
-sx q0[296];
-rz(1.5851877) q0[296];
-sx q0[296];
-rz(-pi) q0[296];
-cx q0[295],q0[296];
-cx q0[295],q0[98];
-rz(pi/2) q0[295];
-sx q0[295];
-rz(pi/2) q0[295];
-sx q0[296];
-cx q0[98],q0[295];
-rz(-pi/4) q0[295];
-cx q0[0],q0[295];
-rz(pi/4) q0[295];
-cx q0[98],q0[295];
-rz(-pi/4) q0[295];
-cx q0[0],q0[295];
-rz(3*pi/4) q0[295];
-sx q0[295];
-rz(pi/2) q0[295];
-rz(pi/4) q0[98];
-cx q0[0],q0[98];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[98];
-cx q0[0],q0[98];
-cx q0[295],q0[98];
-sx q0[297];
-rz(2.4054671) q0[297];
-cx q0[296],q0[297];
-rz(3.025599) q0[297];
-cx q0[296],q0[297];
-rz(-pi) q0[296];
-sx q0[296];
-rz(-pi) q0[296];
-rz(-2.5217526) q0[297];
-sx q0[297];
-rz(-pi) q0[297];
-cx q0[296],q0[297];
-sx q0[297];
-rz(2.5217526) q0[297];
-sx q0[297];
-rz(-pi) q0[297];
-cx q0[296],q0[297];
-cx q0[296],q0[99];
-rz(pi/2) q0[296];
-sx q0[296];
-rz(pi/2) q0[296];
-sx q0[297];
-cx q0[99],q0[296];
-rz(-pi/4) q0[296];
-cx q0[0],q0[296];
-rz(pi/4) q0[296];
-cx q0[99],q0[296];
-rz(-pi/4) q0[296];
-cx q0[0],q0[296];
-rz(3*pi/4) q0[296];
-sx q0[296];
-rz(pi/2) q0[296];
-rz(pi/4) q0[99];
-cx q0[0],q0[99];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[99];
-cx q0[0],q0[99];
-cx q0[296],q0[99];
-sx q0[298];
-rz(1.6999012) q0[298];
-cx q0[297],q0[298];
-rz(2.3242671) q0[298];
-cx q0[297],q0[298];
-rz(-pi) q0[297];
-sx q0[297];
-rz(-pi) q0[297];
-rz(-1.841344) q0[298];
-sx q0[298];
-rz(-pi) q0[298];
-cx q0[297],q0[298];
-sx q0[298];
-rz(1.841344) q0[298];
-sx q0[298];
-rz(-pi) q0[298];
-cx q0[297],q0[298];
-cx q0[297],q0[100];
-rz(pi/2) q0[297];
-sx q0[297];
-rz(pi/2) q0[297];
-cx q0[100],q0[297];
-rz(-pi/4) q0[297];
-cx q0[0],q0[297];
-rz(pi/4) q0[297];
-cx q0[100],q0[297];
-rz(pi/4) q0[100];
-rz(-pi/4) q0[297];
-cx q0[0],q0[297];
-cx q0[0],q0[100];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[100];
-cx q0[0],q0[100];
-rz(3*pi/4) q0[297];
-sx q0[297];
-rz(pi/2) q0[297];
-cx q0[297],q0[100];
-sx q0[298];
-sx q0[299];
-rz(1.1001696) q0[299];
-cx q0[298],q0[299];
-rz(1.0171159) q0[299];
-cx q0[298],q0[299];
-rz(-pi) q0[298];
-sx q0[298];
-rz(-pi) q0[298];
-rz(-1.9009124) q0[299];
-sx q0[299];
-rz(-pi) q0[299];
-cx q0[298],q0[299];
-sx q0[299];
-rz(1.9009124) q0[299];
-sx q0[299];
-rz(-pi) q0[299];
-cx q0[298],q0[299];
-cx q0[298],q0[101];
-rz(pi/2) q0[298];
-sx q0[298];
-rz(pi/2) q0[298];
-cx q0[101],q0[298];
-rz(-pi/4) q0[298];
-cx q0[0],q0[298];
-rz(pi/4) q0[298];
-cx q0[101],q0[298];
-rz(pi/4) q0[101];
-rz(-pi/4) q0[298];
-cx q0[0],q0[298];
-cx q0[0],q0[101];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[101];
-cx q0[0],q0[101];
-rz(3*pi/4) q0[298];
-sx q0[298];
-rz(pi/2) q0[298];
-cx q0[298],q0[101];
-sx q0[299];
-sx q0[300];
-rz(1.0449832) q0[300];
-cx q0[299],q0[300];
-rz(2.8178665) q0[300];
-cx q0[299],q0[300];
-rz(-pi) q0[299];
-sx q0[299];
-rz(-pi) q0[299];
-rz(-2.076053) q0[300];
-sx q0[300];
-rz(-pi) q0[300];
-cx q0[299],q0[300];
-sx q0[300];
-rz(2.076053) q0[300];
-sx q0[300];
-rz(-pi) q0[300];
-cx q0[299],q0[300];
-cx q0[299],q0[102];
-rz(pi/2) q0[299];
-sx q0[299];
-rz(pi/2) q0[299];
-cx q0[102],q0[299];
-rz(-pi/4) q0[299];
-cx q0[0],q0[299];
-rz(pi/4) q0[299];
-cx q0[102],q0[299];
-rz(pi/4) q0[102];
-rz(-pi/4) q0[299];
-cx q0[0],q0[299];
-cx q0[0],q0[102];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[102];
-cx q0[0],q0[102];
-rz(3*pi/4) q0[299];
-sx q0[299];
-rz(pi/2) q0[299];
-cx q0[299],q0[102];
-sx q0[300];
-sx q0[301];
-rz(0.41839761) q0[301];
-cx q0[300],q0[301];
-rz(1.9432444) q0[301];
-cx q0[300],q0[301];
-rz(-pi) q0[300];
-sx q0[300];
-rz(-pi) q0[300];
-rz(-2.7518381) q0[301];
-sx q0[301];
-rz(-pi) q0[301];
-cx q0[300],q0[301];
-sx q0[301];
-rz(2.7518381) q0[301];
-sx q0[301];
-rz(-pi) q0[301];
-cx q0[300],q0[301];
-cx q0[300],q0[103];
-rz(pi/2) q0[300];
-sx q0[300];
-rz(pi/2) q0[300];
-cx q0[103],q0[300];
-rz(-pi/4) q0[300];
-cx q0[0],q0[300];
-rz(pi/4) q0[300];
-cx q0[103],q0[300];
-rz(pi/4) q0[103];
-rz(-pi/4) q0[300];
-cx q0[0],q0[300];
-cx q0[0],q0[103];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[103];
-cx q0[0],q0[103];
-rz(3*pi/4) q0[300];
-sx q0[300];
-rz(pi/2) q0[300];
-cx q0[300],q0[103];
-sx q0[301];
-sx q0[302];
-rz(2.1604455) q0[302];
-cx q0[301],q0[302];
-rz(1.4899325) q0[302];
-cx q0[301],q0[302];
-rz(-pi) q0[301];
-sx q0[301];
-rz(-pi) q0[301];
-rz(-1.6978578) q0[302];
-sx q0[302];
-rz(-pi) q0[302];
-cx q0[301],q0[302];
-sx q0[302];
-rz(1.6978578) q0[302];
-sx q0[302];
-rz(-pi) q0[302];
-cx q0[301],q0[302];
-cx q0[301],q0[104];
-rz(pi/2) q0[301];
-sx q0[301];
-rz(pi/2) q0[301];
-cx q0[104],q0[301];
-rz(-pi/4) q0[301];
-cx q0[0],q0[301];
-rz(pi/4) q0[301];
-cx q0[104],q0[301];
-rz(pi/4) q0[104];
-rz(-pi/4) q0[301];
-cx q0[0],q0[301];
-cx q0[0],q0[104];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[104];
-cx q0[0],q0[104];
-rz(3*pi/4) q0[301];
-sx q0[301];
-rz(pi/2) q0[301];
-cx q0[301],q0[104];
-sx q0[302];
-sx q0[303];
-rz(2.5541099) q0[303];
-cx q0[302],q0[303];
-rz(0.76037068) q0[303];
-cx q0[302],q0[303];
-rz(-pi) q0[302];
-sx q0[302];
-rz(-pi) q0[302];
-rz(-2.5643262) q0[303];
-sx q0[303];
-rz(-pi) q0[303];
-cx q0[302],q0[303];
-sx q0[303];
-rz(2.5643262) q0[303];
-sx q0[303];
-rz(-pi) q0[303];
-cx q0[302],q0[303];
-cx q0[302],q0[105];
-rz(pi/2) q0[302];
-sx q0[302];
-rz(pi/2) q0[302];
-cx q0[105],q0[302];
-rz(-pi/4) q0[302];
-cx q0[0],q0[302];
-rz(pi/4) q0[302];
-cx q0[105],q0[302];
-rz(pi/4) q0[105];
-rz(-pi/4) q0[302];
-cx q0[0],q0[302];
-cx q0[0],q0[105];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[105];
-cx q0[0],q0[105];
-rz(3*pi/4) q0[302];
-sx q0[302];
-rz(pi/2) q0[302];
-cx q0[302],q0[105];
-sx q0[303];
-sx q0[304];
-rz(0.43506589) q0[304];
-cx q0[303],q0[304];
-rz(2.8960004) q0[304];
-cx q0[303],q0[304];
-rz(-pi) q0[303];
-sx q0[303];
-rz(-pi) q0[303];
-rz(-2.5624267) q0[304];
-sx q0[304];
-rz(-pi) q0[304];
-cx q0[303],q0[304];
-sx q0[304];
-rz(2.5624267) q0[304];
-sx q0[304];
-rz(-pi) q0[304];
-cx q0[303],q0[304];
-cx q0[303],q0[106];
-rz(pi/2) q0[303];
-sx q0[303];
-rz(pi/2) q0[303];
-cx q0[106],q0[303];
-rz(-pi/4) q0[303];
-cx q0[0],q0[303];
-rz(pi/4) q0[303];
-cx q0[106],q0[303];
-rz(pi/4) q0[106];
-rz(-pi/4) q0[303];
-cx q0[0],q0[303];
-cx q0[0],q0[106];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[106];
-cx q0[0],q0[106];
-rz(3*pi/4) q0[303];
-sx q0[303];
-rz(pi/2) q0[303];
-cx q0[303],q0[106];
-sx q0[304];
-sx q0[305];
-rz(0.5555724) q0[305];
-cx q0[304],q0[305];
-rz(2.9248568) q0[305];
-cx q0[304],q0[305];
-rz(-pi) q0[304];
-sx q0[304];
-rz(-pi) q0[304];
-rz(-2.590714) q0[305];
-sx q0[305];
-rz(-pi) q0[305];
-cx q0[304],q0[305];
-sx q0[305];
-rz(2.590714) q0[305];
-sx q0[305];
-rz(-pi) q0[305];
-cx q0[304],q0[305];
-cx q0[304],q0[107];
-rz(pi/2) q0[304];
-sx q0[304];
-rz(pi/2) q0[304];
-cx q0[107],q0[304];
-rz(-pi/4) q0[304];
-cx q0[0],q0[304];
-rz(pi/4) q0[304];
-cx q0[107],q0[304];
-rz(pi/4) q0[107];
-rz(-pi/4) q0[304];
-cx q0[0],q0[304];
-cx q0[0],q0[107];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[107];
-cx q0[0],q0[107];
-rz(3*pi/4) q0[304];
-sx q0[304];
-rz(pi/2) q0[304];
-cx q0[304],q0[107];
-sx q0[305];
-sx q0[306];
-rz(0.1959697) q0[306];
-cx q0[305],q0[306];
-rz(2.2560017) q0[306];
-cx q0[305],q0[306];
-rz(-pi) q0[305];
-sx q0[305];
-rz(-pi) q0[305];
-rz(-3.0361741) q0[306];
-sx q0[306];
-rz(-pi) q0[306];
-cx q0[305],q0[306];
-sx q0[306];
-rz(3.0361741) q0[306];
-sx q0[306];
-rz(-pi) q0[306];
-cx q0[305],q0[306];
-cx q0[305],q0[108];
-rz(pi/2) q0[305];
-sx q0[305];
-rz(pi/2) q0[305];
-cx q0[108],q0[305];
-rz(-pi/4) q0[305];
-cx q0[0],q0[305];
-rz(pi/4) q0[305];
-cx q0[108],q0[305];
-rz(pi/4) q0[108];
-rz(-pi/4) q0[305];
-cx q0[0],q0[305];
-cx q0[0],q0[108];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[108];
-cx q0[0],q0[108];
-rz(3*pi/4) q0[305];
-sx q0[305];
-rz(pi/2) q0[305];
-cx q0[305],q0[108];
-sx q0[306];
-sx q0[307];
-rz(2.5828351) q0[307];
-cx q0[306],q0[307];
-rz(2.8271186) q0[307];
-cx q0[306],q0[307];
-rz(-pi) q0[306];
-sx q0[306];
-rz(-pi) q0[306];
-rz(-2.7658817) q0[307];
-sx q0[307];
-rz(-pi) q0[307];
-cx q0[306],q0[307];
-sx q0[307];
-rz(2.7658817) q0[307];
-sx q0[307];
-rz(-pi) q0[307];
-cx q0[306],q0[307];
-cx q0[306],q0[109];
-rz(pi/2) q0[306];
-sx q0[306];
-rz(pi/2) q0[306];
-cx q0[109],q0[306];
-rz(-pi/4) q0[306];
-cx q0[0],q0[306];
-rz(pi/4) q0[306];
-cx q0[109],q0[306];
-rz(pi/4) q0[109];
-rz(-pi/4) q0[306];
-cx q0[0],q0[306];
-cx q0[0],q0[109];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[109];
-cx q0[0],q0[109];
-rz(3*pi/4) q0[306];
-sx q0[306];
-rz(pi/2) q0[306];
-cx q0[306],q0[109];
-sx q0[307];
-sx q0[308];
-rz(2.2372966) q0[308];
-cx q0[307],q0[308];
-rz(3.0123899) q0[308];
-cx q0[307],q0[308];
-rz(-pi) q0[307];
-sx q0[307];
-rz(-pi) q0[307];
-rz(-2.404248) q0[308];
-sx q0[308];
-rz(-pi) q0[308];
-cx q0[307],q0[308];
-sx q0[308];
-rz(2.404248) q0[308];
-sx q0[308];
-rz(-pi) q0[308];
-cx q0[307],q0[308];
-cx q0[307],q0[110];
-rz(pi/2) q0[307];
-sx q0[307];
-rz(pi/2) q0[307];
-cx q0[110],q0[307];
-rz(-pi/4) q0[307];
-cx q0[0],q0[307];
-rz(pi/4) q0[307];
-cx q0[110],q0[307];
-rz(pi/4) q0[110];
-rz(-pi/4) q0[307];
-cx q0[0],q0[307];
-cx q0[0],q0[110];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[110];
-cx q0[0],q0[110];
-rz(3*pi/4) q0[307];
-sx q0[307];
-rz(pi/2) q0[307];
-cx q0[307],q0[110];
-sx q0[308];
-sx q0[309];
-rz(2.6038194) q0[309];
-cx q0[308],q0[309];
-rz(2.3014624) q0[309];
-cx q0[308],q0[309];
-rz(-pi) q0[308];
-sx q0[308];
-rz(-pi) q0[308];
-rz(-1.9987836) q0[309];
-sx q0[309];
-rz(-pi) q0[309];
-cx q0[308],q0[309];
-sx q0[309];
-rz(1.9987836) q0[309];
-sx q0[309];
-rz(-pi) q0[309];
-cx q0[308],q0[309];
-cx q0[308],q0[111];
-rz(pi/2) q0[308];
-sx q0[308];
-rz(pi/2) q0[308];
-cx q0[111],q0[308];
-rz(-pi/4) q0[308];
-cx q0[0],q0[308];
-rz(pi/4) q0[308];
-cx q0[111],q0[308];
-rz(pi/4) q0[111];
-rz(-pi/4) q0[308];
-cx q0[0],q0[308];
-cx q0[0],q0[111];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[111];
-cx q0[0],q0[111];
-rz(3*pi/4) q0[308];
-sx q0[308];
-rz(pi/2) q0[308];
-cx q0[308],q0[111];
-sx q0[309];
-sx q0[310];
-rz(2.3273882) q0[310];
-cx q0[309],q0[310];
-rz(2.5915995) q0[310];
-cx q0[309],q0[310];
-rz(-pi) q0[309];
-sx q0[309];
-rz(-pi) q0[309];
-rz(-2.6286816) q0[310];
-sx q0[310];
-rz(-pi) q0[310];
-cx q0[309],q0[310];
-sx q0[310];
-rz(2.6286816) q0[310];
-sx q0[310];
-rz(-pi) q0[310];
-cx q0[309],q0[310];
-cx q0[309],q0[112];
-rz(pi/2) q0[309];
-sx q0[309];
-rz(pi/2) q0[309];
-cx q0[112],q0[309];
-rz(-pi/4) q0[309];
-cx q0[0],q0[309];
-rz(pi/4) q0[309];
-cx q0[112],q0[309];
-rz(pi/4) q0[112];
-rz(-pi/4) q0[309];
-cx q0[0],q0[309];
-cx q0[0],q0[112];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[112];
-cx q0[0],q0[112];
-rz(3*pi/4) q0[309];
-sx q0[309];
-rz(pi/2) q0[309];
-cx q0[309],q0[112];
-sx q0[310];
-sx q0[311];
-rz(0.21052527) q0[311];
-cx q0[310],q0[311];
-rz(2.639159) q0[311];
-cx q0[310],q0[311];
-rz(-pi) q0[310];
-sx q0[310];
-rz(-pi) q0[310];
-rz(-3.0868017) q0[311];
-sx q0[311];
-rz(-pi) q0[311];
-cx q0[310],q0[311];
-sx q0[311];
-rz(3.0868017) q0[311];
-sx q0[311];
-rz(-pi) q0[311];
-cx q0[310],q0[311];
-cx q0[310],q0[113];
-rz(pi/2) q0[310];
-sx q0[310];
-rz(pi/2) q0[310];
-cx q0[113],q0[310];
-rz(-pi/4) q0[310];
-cx q0[0],q0[310];
-rz(pi/4) q0[310];
-cx q0[113],q0[310];
-rz(pi/4) q0[113];
-rz(-pi/4) q0[310];
-cx q0[0],q0[310];
-cx q0[0],q0[113];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[113];
-cx q0[0],q0[113];
-rz(3*pi/4) q0[310];
-sx q0[310];
-rz(pi/2) q0[310];
-cx q0[310],q0[113];
-sx q0[311];
-sx q0[312];
-rz(2.1892329) q0[312];
-cx q0[311],q0[312];
-rz(0.99110532) q0[312];
-cx q0[311],q0[312];
-rz(-pi) q0[311];
-sx q0[311];
-rz(-pi) q0[311];
-rz(-2.2290722) q0[312];
-sx q0[312];
-rz(-pi) q0[312];
-cx q0[311],q0[312];
-sx q0[312];
-rz(2.2290722) q0[312];
-sx q0[312];
-rz(-pi) q0[312];
-cx q0[311],q0[312];
-cx q0[311],q0[114];
-rz(pi/2) q0[311];
-sx q0[311];
-rz(pi/2) q0[311];
-cx q0[114],q0[311];
-rz(-pi/4) q0[311];
-cx q0[0],q0[311];
-rz(pi/4) q0[311];
-cx q0[114],q0[311];
-rz(pi/4) q0[114];
-rz(-pi/4) q0[311];
-cx q0[0],q0[311];
-cx q0[0],q0[114];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[114];
-cx q0[0],q0[114];
-rz(3*pi/4) q0[311];
-sx q0[311];
-rz(pi/2) q0[311];
-cx q0[311],q0[114];
-sx q0[312];
-sx q0[313];
-rz(1.1120022) q0[313];
-cx q0[312],q0[313];
-rz(3.0493187) q0[313];
-cx q0[312],q0[313];
-rz(-pi) q0[312];
-sx q0[312];
-rz(-pi) q0[312];
-rz(-2.0708793) q0[313];
-sx q0[313];
-rz(-pi) q0[313];
-cx q0[312],q0[313];
-sx q0[313];
-rz(2.0708793) q0[313];
-sx q0[313];
-rz(-pi) q0[313];
-cx q0[312],q0[313];
-cx q0[312],q0[115];
-rz(pi/2) q0[312];
-sx q0[312];
-rz(pi/2) q0[312];
-cx q0[115],q0[312];
-rz(-pi/4) q0[312];
-cx q0[0],q0[312];
-rz(pi/4) q0[312];
-cx q0[115],q0[312];
-rz(pi/4) q0[115];
-rz(-pi/4) q0[312];
-cx q0[0],q0[312];
-cx q0[0],q0[115];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[115];
-cx q0[0],q0[115];
-rz(3*pi/4) q0[312];
-sx q0[312];
-rz(pi/2) q0[312];
-cx q0[312],q0[115];
-sx q0[313];
-sx q0[314];
-rz(0.79484739) q0[314];
-cx q0[313],q0[314];
-rz(0.38571546) q0[314];
-cx q0[313],q0[314];
-rz(-pi) q0[313];
-sx q0[313];
-rz(-pi) q0[313];
-rz(-2.005972) q0[314];
-sx q0[314];
-rz(-pi) q0[314];
-cx q0[313],q0[314];
-sx q0[314];
-rz(2.005972) q0[314];
-sx q0[314];
-rz(-pi) q0[314];
-cx q0[313],q0[314];
-cx q0[313],q0[116];
-rz(pi/2) q0[313];
-sx q0[313];
-rz(pi/2) q0[313];
-cx q0[116],q0[313];
-rz(-pi/4) q0[313];
-cx q0[0],q0[313];
-rz(pi/4) q0[313];
-cx q0[116],q0[313];
-rz(pi/4) q0[116];
-rz(-pi/4) q0[313];
-cx q0[0],q0[313];
-cx q0[0],q0[116];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[116];
-cx q0[0],q0[116];
-rz(3*pi/4) q0[313];
-sx q0[313];
-rz(pi/2) q0[313];
-cx q0[313],q0[116];
-sx q0[314];
-sx q0[315];
-rz(0.93012014) q0[315];
-cx q0[314],q0[315];
-rz(1.9906111) q0[315];
-cx q0[314],q0[315];
-rz(-pi) q0[314];
-sx q0[314];
-rz(-pi) q0[314];
-rz(-2.4595865) q0[315];
-sx q0[315];
-rz(-pi) q0[315];
-cx q0[314],q0[315];
-sx q0[315];
-rz(2.4595865) q0[315];
-sx q0[315];
-rz(-pi) q0[315];
-cx q0[314],q0[315];
-cx q0[314],q0[117];
-rz(pi/2) q0[314];
-sx q0[314];
-rz(pi/2) q0[314];
-cx q0[117],q0[314];
-rz(-pi/4) q0[314];
-cx q0[0],q0[314];
-rz(pi/4) q0[314];
-cx q0[117],q0[314];
-rz(pi/4) q0[117];
-rz(-pi/4) q0[314];
-cx q0[0],q0[314];
-cx q0[0],q0[117];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[117];
-cx q0[0],q0[117];
-rz(3*pi/4) q0[314];
-sx q0[314];
-rz(pi/2) q0[314];
-cx q0[314],q0[117];
-sx q0[315];
-sx q0[316];
-rz(0.098078104) q0[316];
-cx q0[315],q0[316];
-rz(1.3175988) q0[316];
-cx q0[315],q0[316];
-rz(-pi) q0[315];
-sx q0[315];
-rz(-pi) q0[315];
-rz(-2.5573205) q0[316];
-sx q0[316];
-rz(-pi) q0[316];
-cx q0[315],q0[316];
-sx q0[316];
-rz(2.5573205) q0[316];
-sx q0[316];
-rz(-pi) q0[316];
-cx q0[315],q0[316];
-cx q0[315],q0[118];
-rz(pi/2) q0[315];
-sx q0[315];
-rz(pi/2) q0[315];
-cx q0[118],q0[315];
-rz(-pi/4) q0[315];
-cx q0[0],q0[315];
-rz(pi/4) q0[315];
-cx q0[118],q0[315];
-rz(pi/4) q0[118];
-rz(-pi/4) q0[315];
-cx q0[0],q0[315];
-cx q0[0],q0[118];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[118];
-cx q0[0],q0[118];
-rz(3*pi/4) q0[315];
-sx q0[315];
-rz(pi/2) q0[315];
-cx q0[315],q0[118];
-sx q0[316];
-sx q0[317];
-rz(1.5943504) q0[317];
-cx q0[316],q0[317];
-rz(0.33988956) q0[317];
-cx q0[316],q0[317];
-rz(-pi) q0[316];
-sx q0[316];
-rz(-pi) q0[316];
-rz(-2.6185948) q0[317];
-sx q0[317];
-rz(-pi) q0[317];
-cx q0[316],q0[317];
-sx q0[317];
-rz(2.6185948) q0[317];
-sx q0[317];
-rz(-pi) q0[317];
-cx q0[316],q0[317];
-cx q0[316],q0[119];
-rz(pi/2) q0[316];
-sx q0[316];
-rz(pi/2) q0[316];
-cx q0[119],q0[316];
-rz(-pi/4) q0[316];
-cx q0[0],q0[316];
-rz(pi/4) q0[316];
-cx q0[119],q0[316];
-rz(pi/4) q0[119];
-rz(-pi/4) q0[316];
-cx q0[0],q0[316];
-cx q0[0],q0[119];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[119];
-cx q0[0],q0[119];
-rz(3*pi/4) q0[316];
-sx q0[316];
-rz(pi/2) q0[316];
-cx q0[316],q0[119];
-sx q0[317];
-sx q0[318];
-rz(1.4028986) q0[318];
-cx q0[317],q0[318];
-rz(2.1366933) q0[318];
-cx q0[317],q0[318];
-rz(-pi) q0[317];
-sx q0[317];
-rz(-pi) q0[317];
-rz(-1.6327773) q0[318];
-sx q0[318];
-rz(-pi) q0[318];
-cx q0[317],q0[318];
-sx q0[318];
-rz(1.6327773) q0[318];
-sx q0[318];
-rz(-pi) q0[318];
-cx q0[317],q0[318];
-cx q0[317],q0[120];
-rz(pi/2) q0[317];
-sx q0[317];
-rz(pi/2) q0[317];
-cx q0[120],q0[317];
-rz(-pi/4) q0[317];
-cx q0[0],q0[317];
-rz(pi/4) q0[317];
-cx q0[120],q0[317];
-rz(pi/4) q0[120];
-rz(-pi/4) q0[317];
-cx q0[0],q0[317];
-cx q0[0],q0[120];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[120];
-cx q0[0],q0[120];
-rz(3*pi/4) q0[317];
-sx q0[317];
-rz(pi/2) q0[317];
-cx q0[317],q0[120];
-sx q0[318];
-sx q0[319];
-rz(1.1966041) q0[319];
-cx q0[318],q0[319];
-rz(1.7841979) q0[319];
-cx q0[318],q0[319];
-rz(-pi) q0[318];
-sx q0[318];
-rz(-pi) q0[318];
-rz(-1.9136754) q0[319];
-sx q0[319];
-rz(-pi) q0[319];
-cx q0[318],q0[319];
-sx q0[319];
-rz(1.9136754) q0[319];
-sx q0[319];
-rz(-pi) q0[319];
-cx q0[318],q0[319];
-cx q0[318],q0[121];
-rz(pi/2) q0[318];
-sx q0[318];
-rz(pi/2) q0[318];
-cx q0[121],q0[318];
-rz(-pi/4) q0[318];
-cx q0[0],q0[318];
-rz(pi/4) q0[318];
-cx q0[121],q0[318];
-rz(pi/4) q0[121];
-rz(-pi/4) q0[318];
-cx q0[0],q0[318];
-cx q0[0],q0[121];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[121];
-cx q0[0],q0[121];
-rz(3*pi/4) q0[318];
-sx q0[318];
-rz(pi/2) q0[318];
-cx q0[318],q0[121];
-sx q0[319];
-sx q0[320];
-rz(0.99265203) q0[320];
-cx q0[319],q0[320];
-rz(1.1891351) q0[320];
-cx q0[319],q0[320];
-rz(-pi) q0[319];
-sx q0[319];
-rz(-pi) q0[319];
-rz(-2.5634138) q0[320];
-sx q0[320];
-rz(-pi) q0[320];
-cx q0[319],q0[320];
-sx q0[320];
-rz(2.5634138) q0[320];
-sx q0[320];
-rz(-pi) q0[320];
-cx q0[319],q0[320];
-cx q0[319],q0[122];
-rz(pi/2) q0[319];
-sx q0[319];
-rz(pi/2) q0[319];
-cx q0[122],q0[319];
-rz(-pi/4) q0[319];
-cx q0[0],q0[319];
-rz(pi/4) q0[319];
-cx q0[122],q0[319];
-rz(pi/4) q0[122];
-rz(-pi/4) q0[319];
-cx q0[0],q0[319];
-cx q0[0],q0[122];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[122];
-cx q0[0],q0[122];
-rz(3*pi/4) q0[319];
-sx q0[319];
-rz(pi/2) q0[319];
-cx q0[319],q0[122];
-sx q0[320];
-sx q0[321];
-rz(3.0149651) q0[321];
-cx q0[320],q0[321];
-rz(3.1357634) q0[321];
-cx q0[320],q0[321];
-rz(-pi) q0[320];
-sx q0[320];
-rz(-pi) q0[320];
-rz(-2.5641746) q0[321];
-sx q0[321];
-rz(-pi) q0[321];
-cx q0[320],q0[321];
-sx q0[321];
-rz(2.5641746) q0[321];
-sx q0[321];
-rz(-pi) q0[321];
-cx q0[320],q0[321];
-cx q0[320],q0[123];
-rz(pi/2) q0[320];
-sx q0[320];
-rz(pi/2) q0[320];
-cx q0[123],q0[320];
-rz(-pi/4) q0[320];
-cx q0[0],q0[320];
-rz(pi/4) q0[320];
-cx q0[123],q0[320];
-rz(pi/4) q0[123];
-rz(-pi/4) q0[320];
-cx q0[0],q0[320];
-cx q0[0],q0[123];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[123];
-cx q0[0],q0[123];
-rz(3*pi/4) q0[320];
-sx q0[320];
-rz(pi/2) q0[320];
-cx q0[320],q0[123];
-sx q0[321];
-sx q0[322];
-rz(0.54789279) q0[322];
-cx q0[321],q0[322];
-rz(2.120048) q0[322];
-cx q0[321],q0[322];
-rz(-pi) q0[321];
-sx q0[321];
-rz(-pi) q0[321];
-rz(-2.9432543) q0[322];
-sx q0[322];
-rz(-pi) q0[322];
-cx q0[321],q0[322];
-sx q0[322];
-rz(2.9432543) q0[322];
-sx q0[322];
-rz(-pi) q0[322];
-cx q0[321],q0[322];
-cx q0[321],q0[124];
-rz(pi/2) q0[321];
-sx q0[321];
-rz(pi/2) q0[321];
-cx q0[124],q0[321];
-rz(-pi/4) q0[321];
-cx q0[0],q0[321];
-rz(pi/4) q0[321];
-cx q0[124],q0[321];
-rz(pi/4) q0[124];
-rz(-pi/4) q0[321];
-cx q0[0],q0[321];
-cx q0[0],q0[124];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[124];
-cx q0[0],q0[124];
-rz(3*pi/4) q0[321];
-sx q0[321];
-rz(pi/2) q0[321];
-cx q0[321],q0[124];
-sx q0[322];
-sx q0[323];
-rz(1.5682676) q0[323];
-cx q0[322],q0[323];
-rz(0.94035925) q0[323];
-cx q0[322],q0[323];
-rz(-pi) q0[322];
-sx q0[322];
-rz(-pi) q0[322];
-rz(-3.002481) q0[323];
-sx q0[323];
-rz(-pi) q0[323];
-cx q0[322],q0[323];
-sx q0[323];
-rz(3.002481) q0[323];
-sx q0[323];
-rz(-pi) q0[323];
-cx q0[322],q0[323];
-cx q0[322],q0[125];
-rz(pi/2) q0[322];
-sx q0[322];
-rz(pi/2) q0[322];
-cx q0[125],q0[322];
-rz(-pi/4) q0[322];
-cx q0[0],q0[322];
-rz(pi/4) q0[322];
-cx q0[125],q0[322];
-rz(pi/4) q0[125];
-rz(-pi/4) q0[322];
-cx q0[0],q0[322];
-cx q0[0],q0[125];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[125];
-cx q0[0],q0[125];
-rz(3*pi/4) q0[322];
-sx q0[322];
-rz(pi/2) q0[322];
-cx q0[322],q0[125];
-sx q0[323];
-sx q0[324];
-rz(1.585075) q0[324];
-cx q0[323],q0[324];
-rz(2.9530097) q0[324];
-cx q0[323],q0[324];
-rz(-pi) q0[323];
-sx q0[323];
-rz(-pi) q0[323];
-rz(-1.8631799) q0[324];
-sx q0[324];
-rz(-pi) q0[324];
-cx q0[323],q0[324];
-sx q0[324];
-rz(1.8631799) q0[324];
-sx q0[324];
-rz(-pi) q0[324];
-cx q0[323],q0[324];
-cx q0[323],q0[126];
-rz(pi/2) q0[323];
-sx q0[323];
-rz(pi/2) q0[323];
-cx q0[126],q0[323];
-rz(-pi/4) q0[323];
-cx q0[0],q0[323];
-rz(pi/4) q0[323];
-cx q0[126],q0[323];
-rz(pi/4) q0[126];
-rz(-pi/4) q0[323];
-cx q0[0],q0[323];
-cx q0[0],q0[126];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[126];
-cx q0[0],q0[126];
-rz(3*pi/4) q0[323];
-sx q0[323];
-rz(pi/2) q0[323];
-cx q0[323],q0[126];
-sx q0[324];
-sx q0[325];
-rz(1.2206162) q0[325];
-cx q0[324],q0[325];
-rz(0.003241074) q0[325];
-cx q0[324],q0[325];
-rz(-pi) q0[324];
-sx q0[324];
-rz(-pi) q0[324];
-rz(-2.1355865) q0[325];
-sx q0[325];
-rz(-pi) q0[325];
-cx q0[324],q0[325];
-sx q0[325];
-rz(2.1355865) q0[325];
-sx q0[325];
-rz(-pi) q0[325];
-cx q0[324],q0[325];
-cx q0[324],q0[127];
-rz(pi/2) q0[324];
-sx q0[324];
-rz(pi/2) q0[324];
-cx q0[127],q0[324];
-rz(-pi/4) q0[324];
-cx q0[0],q0[324];
-rz(pi/4) q0[324];
-cx q0[127],q0[324];
-rz(pi/4) q0[127];
-rz(-pi/4) q0[324];
-cx q0[0],q0[324];
-cx q0[0],q0[127];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[127];
-cx q0[0],q0[127];
-rz(3*pi/4) q0[324];
-sx q0[324];
-rz(pi/2) q0[324];
-cx q0[324],q0[127];
-sx q0[325];
-sx q0[326];
-rz(2.7152162) q0[326];
-cx q0[325],q0[326];
-rz(2.981046) q0[326];
-cx q0[325],q0[326];
-rz(-pi) q0[325];
-sx q0[325];
-rz(-pi) q0[325];
-rz(-2.1482168) q0[326];
-sx q0[326];
-rz(-pi) q0[326];
-cx q0[325],q0[326];
-sx q0[326];
-rz(2.1482168) q0[326];
-sx q0[326];
-rz(-pi) q0[326];
-cx q0[325],q0[326];
-cx q0[325],q0[128];
-rz(pi/2) q0[325];
-sx q0[325];
-rz(pi/2) q0[325];
-cx q0[128],q0[325];
-rz(-pi/4) q0[325];
-cx q0[0],q0[325];
-rz(pi/4) q0[325];
-cx q0[128],q0[325];
-rz(pi/4) q0[128];
-rz(-pi/4) q0[325];
-cx q0[0],q0[325];
-cx q0[0],q0[128];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[128];
-cx q0[0],q0[128];
-rz(3*pi/4) q0[325];
-sx q0[325];
-rz(pi/2) q0[325];
-cx q0[325],q0[128];
-sx q0[326];
-sx q0[327];
-rz(2.2928763) q0[327];
-cx q0[326],q0[327];
-rz(0.6406385) q0[327];
-cx q0[326],q0[327];
-rz(-pi) q0[326];
-sx q0[326];
-rz(-pi) q0[326];
-rz(-2.8055482) q0[327];
-sx q0[327];
-rz(-pi) q0[327];
-cx q0[326],q0[327];
-sx q0[327];
-rz(2.8055482) q0[327];
-sx q0[327];
-rz(-pi) q0[327];
-cx q0[326],q0[327];
-cx q0[326],q0[129];
-rz(pi/2) q0[326];
-sx q0[326];
-rz(pi/2) q0[326];
-cx q0[129],q0[326];
-rz(-pi/4) q0[326];
-cx q0[0],q0[326];
-rz(pi/4) q0[326];
-cx q0[129],q0[326];
-rz(pi/4) q0[129];
-rz(-pi/4) q0[326];
-cx q0[0],q0[326];
-cx q0[0],q0[129];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[129];
-cx q0[0],q0[129];
-rz(3*pi/4) q0[326];
-sx q0[326];
-rz(pi/2) q0[326];
-cx q0[326],q0[129];
-sx q0[327];
-sx q0[328];
-rz(2.9794214) q0[328];
-cx q0[327],q0[328];
-rz(1.0172884) q0[328];
-cx q0[327],q0[328];
-rz(-pi) q0[327];
-sx q0[327];
-rz(-pi) q0[327];
-rz(-1.8050434) q0[328];
-sx q0[328];
-rz(-pi) q0[328];
-cx q0[327],q0[328];
-sx q0[328];
-rz(1.8050434) q0[328];
-sx q0[328];
-rz(-pi) q0[328];
-cx q0[327],q0[328];
-cx q0[327],q0[130];
-rz(pi/2) q0[327];
-sx q0[327];
-rz(pi/2) q0[327];
-cx q0[130],q0[327];
-rz(-pi/4) q0[327];
-cx q0[0],q0[327];
-rz(pi/4) q0[327];
-cx q0[130],q0[327];
-rz(pi/4) q0[130];
-rz(-pi/4) q0[327];
-cx q0[0],q0[327];
-cx q0[0],q0[130];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[130];
-cx q0[0],q0[130];
-rz(3*pi/4) q0[327];
-sx q0[327];
-rz(pi/2) q0[327];
-cx q0[327],q0[130];
-sx q0[328];
-sx q0[329];
-rz(3.0988917) q0[329];
-cx q0[328],q0[329];
-rz(0.72877723) q0[329];
-cx q0[328],q0[329];
-rz(-pi) q0[328];
-sx q0[328];
-rz(-pi) q0[328];
-rz(-2.8608709) q0[329];
-sx q0[329];
-rz(-pi) q0[329];
-cx q0[328],q0[329];
-sx q0[329];
-rz(2.8608709) q0[329];
-sx q0[329];
-rz(-pi) q0[329];
-cx q0[328],q0[329];
-cx q0[328],q0[131];
-rz(pi/2) q0[328];
-sx q0[328];
-rz(pi/2) q0[328];
-cx q0[131],q0[328];
-rz(-pi/4) q0[328];
-cx q0[0],q0[328];
-rz(pi/4) q0[328];
-cx q0[131],q0[328];
-rz(pi/4) q0[131];
-rz(-pi/4) q0[328];
-cx q0[0],q0[328];
-cx q0[0],q0[131];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[131];
-cx q0[0],q0[131];
-rz(3*pi/4) q0[328];
-sx q0[328];
-rz(pi/2) q0[328];
-cx q0[328],q0[131];
-sx q0[329];
-sx q0[330];
-rz(0.69433889) q0[330];
-cx q0[329],q0[330];
-rz(1.8415651) q0[330];
-cx q0[329],q0[330];
-rz(-pi) q0[329];
-sx q0[329];
-rz(-pi) q0[329];
-rz(-2.8430395) q0[330];
-sx q0[330];
-rz(-pi) q0[330];
-cx q0[329],q0[330];
-sx q0[330];
-rz(2.8430395) q0[330];
-sx q0[330];
-rz(-pi) q0[330];
-cx q0[329],q0[330];
-cx q0[329],q0[132];
-rz(pi/2) q0[329];
-sx q0[329];
-rz(pi/2) q0[329];
-cx q0[132],q0[329];
-rz(-pi/4) q0[329];
-cx q0[0],q0[329];
-rz(pi/4) q0[329];
-cx q0[132],q0[329];
-rz(pi/4) q0[132];
-rz(-pi/4) q0[329];
-cx q0[0],q0[329];
-cx q0[0],q0[132];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[132];
-cx q0[0],q0[132];
-rz(3*pi/4) q0[329];
-sx q0[329];
-rz(pi/2) q0[329];
-cx q0[329],q0[132];
-sx q0[330];
-sx q0[331];
-rz(1.4115659) q0[331];
-cx q0[330],q0[331];
-rz(1.3914951) q0[331];
-cx q0[330],q0[331];
-rz(-pi) q0[330];
-sx q0[330];
-rz(-pi) q0[330];
-rz(-2.2551788) q0[331];
-sx q0[331];
-rz(-pi) q0[331];
-cx q0[330],q0[331];
-sx q0[331];
-rz(2.2551788) q0[331];
-sx q0[331];
-rz(-pi) q0[331];
-cx q0[330],q0[331];
-cx q0[330],q0[133];
-rz(pi/2) q0[330];
-sx q0[330];
-rz(pi/2) q0[330];
-cx q0[133],q0[330];
-rz(-pi/4) q0[330];
-cx q0[0],q0[330];
-rz(pi/4) q0[330];
-cx q0[133],q0[330];
-rz(pi/4) q0[133];
-rz(-pi/4) q0[330];
-cx q0[0],q0[330];
-cx q0[0],q0[133];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[133];
-cx q0[0],q0[133];
-rz(3*pi/4) q0[330];
-sx q0[330];
-rz(pi/2) q0[330];
-cx q0[330],q0[133];
-sx q0[331];
-sx q0[332];
-rz(0.83138213) q0[332];
-cx q0[331],q0[332];
-rz(1.4633712) q0[332];
-cx q0[331],q0[332];
-rz(-pi) q0[331];
-sx q0[331];
-rz(-pi) q0[331];
-rz(-2.0957113) q0[332];
-sx q0[332];
-rz(-pi) q0[332];
-cx q0[331],q0[332];
-sx q0[332];
-rz(2.0957113) q0[332];
-sx q0[332];
-rz(-pi) q0[332];
-cx q0[331],q0[332];
-cx q0[331],q0[134];
-rz(pi/2) q0[331];
-sx q0[331];
-rz(pi/2) q0[331];
-cx q0[134],q0[331];
-rz(-pi/4) q0[331];
-cx q0[0],q0[331];
-rz(pi/4) q0[331];
-cx q0[134],q0[331];
-rz(pi/4) q0[134];
-rz(-pi/4) q0[331];
-cx q0[0],q0[331];
-cx q0[0],q0[134];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[134];
-cx q0[0],q0[134];
-rz(3*pi/4) q0[331];
-sx q0[331];
-rz(pi/2) q0[331];
-cx q0[331],q0[134];
-sx q0[332];
-sx q0[333];
-rz(2.3417329) q0[333];
-cx q0[332],q0[333];
-rz(1.6466676) q0[333];
-cx q0[332],q0[333];
-rz(-pi) q0[332];
-sx q0[332];
-rz(-pi) q0[332];
-rz(-2.2410318) q0[333];
-sx q0[333];
-rz(-pi) q0[333];
-cx q0[332],q0[333];
-sx q0[333];
-rz(2.2410318) q0[333];
-sx q0[333];
-rz(-pi) q0[333];
-cx q0[332],q0[333];
-cx q0[332],q0[135];
-rz(pi/2) q0[332];
-sx q0[332];
-rz(pi/2) q0[332];
-cx q0[135],q0[332];
-rz(-pi/4) q0[332];
-cx q0[0],q0[332];
-rz(pi/4) q0[332];
-cx q0[135],q0[332];
-rz(pi/4) q0[135];
-rz(-pi/4) q0[332];
-cx q0[0],q0[332];
-cx q0[0],q0[135];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[135];
-cx q0[0],q0[135];
-rz(3*pi/4) q0[332];
-sx q0[332];
-rz(pi/2) q0[332];
-cx q0[332],q0[135];
-sx q0[333];
-sx q0[334];
-rz(1.0922835) q0[334];
-cx q0[333],q0[334];
-rz(1.897962) q0[334];
-cx q0[333],q0[334];
-rz(-pi) q0[333];
-sx q0[333];
-rz(-pi) q0[333];
-rz(-2.3965886) q0[334];
-sx q0[334];
-rz(-pi) q0[334];
-cx q0[333],q0[334];
-sx q0[334];
-rz(2.3965886) q0[334];
-sx q0[334];
-rz(-pi) q0[334];
-cx q0[333],q0[334];
-cx q0[333],q0[136];
-rz(pi/2) q0[333];
-sx q0[333];
-rz(pi/2) q0[333];
-cx q0[136],q0[333];
-rz(-pi/4) q0[333];
-cx q0[0],q0[333];
-rz(pi/4) q0[333];
-cx q0[136],q0[333];
-rz(pi/4) q0[136];
-rz(-pi/4) q0[333];
-cx q0[0],q0[333];
-cx q0[0],q0[136];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[136];
-cx q0[0],q0[136];
-rz(3*pi/4) q0[333];
-sx q0[333];
-rz(pi/2) q0[333];
-cx q0[333],q0[136];
-sx q0[334];
-sx q0[335];
-rz(1.0373221) q0[335];
-cx q0[334],q0[335];
-rz(1.8738225) q0[335];
-cx q0[334],q0[335];
-rz(-pi) q0[334];
-sx q0[334];
-rz(-pi) q0[334];
-rz(-2.7846943) q0[335];
-sx q0[335];
-rz(-pi) q0[335];
-cx q0[334],q0[335];
-sx q0[335];
-rz(2.7846943) q0[335];
-sx q0[335];
-rz(-pi) q0[335];
-cx q0[334],q0[335];
-cx q0[334],q0[137];
-rz(pi/2) q0[334];
-sx q0[334];
-rz(pi/2) q0[334];
-cx q0[137],q0[334];
-rz(-pi/4) q0[334];
-cx q0[0],q0[334];
-rz(pi/4) q0[334];
-cx q0[137],q0[334];
-rz(pi/4) q0[137];
-rz(-pi/4) q0[334];
-cx q0[0],q0[334];
-cx q0[0],q0[137];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[137];
-cx q0[0],q0[137];
-rz(3*pi/4) q0[334];
-sx q0[334];
-rz(pi/2) q0[334];
-cx q0[334],q0[137];
-sx q0[335];
-sx q0[336];
-rz(2.200996) q0[336];
-cx q0[335],q0[336];
-rz(1.6998335) q0[336];
-cx q0[335],q0[336];
-rz(-pi) q0[335];
-sx q0[335];
-rz(-pi) q0[335];
-rz(-1.8813081) q0[336];
-sx q0[336];
-rz(-pi) q0[336];
-cx q0[335],q0[336];
-sx q0[336];
-rz(1.8813081) q0[336];
-sx q0[336];
-rz(-pi) q0[336];
-cx q0[335],q0[336];
-cx q0[335],q0[138];
-rz(pi/2) q0[335];
-sx q0[335];
-rz(pi/2) q0[335];
-cx q0[138],q0[335];
-rz(-pi/4) q0[335];
-cx q0[0],q0[335];
-rz(pi/4) q0[335];
-cx q0[138],q0[335];
-rz(pi/4) q0[138];
-rz(-pi/4) q0[335];
-cx q0[0],q0[335];
-cx q0[0],q0[138];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[138];
-cx q0[0],q0[138];
-rz(3*pi/4) q0[335];
-sx q0[335];
-rz(pi/2) q0[335];
-cx q0[335],q0[138];
-sx q0[336];
-sx q0[337];
-rz(1.9288142) q0[337];
-cx q0[336],q0[337];
-rz(1.5662328) q0[337];
-cx q0[336],q0[337];
-rz(-pi) q0[336];
-sx q0[336];
-rz(-pi) q0[336];
-rz(-3.1275688) q0[337];
-sx q0[337];
-rz(-pi) q0[337];
-cx q0[336],q0[337];
-sx q0[337];
-rz(3.1275688) q0[337];
-sx q0[337];
-rz(-pi) q0[337];
-cx q0[336],q0[337];
-cx q0[336],q0[139];
-rz(pi/2) q0[336];
-sx q0[336];
-rz(pi/2) q0[336];
-cx q0[139],q0[336];
-rz(-pi/4) q0[336];
-cx q0[0],q0[336];
-rz(pi/4) q0[336];
-cx q0[139],q0[336];
-rz(pi/4) q0[139];
-rz(-pi/4) q0[336];
-cx q0[0],q0[336];
-cx q0[0],q0[139];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[139];
-cx q0[0],q0[139];
-rz(3*pi/4) q0[336];
-sx q0[336];
-rz(pi/2) q0[336];
-cx q0[336],q0[139];
-sx q0[337];
-sx q0[338];
-rz(0.58219466) q0[338];
-cx q0[337],q0[338];
-rz(2.3547071) q0[338];
-cx q0[337],q0[338];
-rz(-pi) q0[337];
-sx q0[337];
-rz(-pi) q0[337];
-rz(-2.5300007) q0[338];
-sx q0[338];
-rz(-pi) q0[338];
-cx q0[337],q0[338];
-sx q0[338];
-rz(2.5300007) q0[338];
-sx q0[338];
-rz(-pi) q0[338];
-cx q0[337],q0[338];
-cx q0[337],q0[140];
-rz(pi/2) q0[337];
-sx q0[337];
-rz(pi/2) q0[337];
-cx q0[140],q0[337];
-rz(-pi/4) q0[337];
-cx q0[0],q0[337];
-rz(pi/4) q0[337];
-cx q0[140],q0[337];
-rz(pi/4) q0[140];
-rz(-pi/4) q0[337];
-cx q0[0],q0[337];
-cx q0[0],q0[140];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[140];
-cx q0[0],q0[140];
-rz(3*pi/4) q0[337];
-sx q0[337];
-rz(pi/2) q0[337];
-cx q0[337],q0[140];
-sx q0[338];
-sx q0[339];
-rz(2.9374784) q0[339];
-cx q0[338],q0[339];
-rz(2.5930826) q0[339];
-cx q0[338],q0[339];
-rz(-pi) q0[338];
-sx q0[338];
-rz(-pi) q0[338];
-rz(-2.2722836) q0[339];
-sx q0[339];
-rz(-pi) q0[339];
-cx q0[338],q0[339];
-sx q0[339];
-rz(2.2722836) q0[339];
-sx q0[339];
-rz(-pi) q0[339];
-cx q0[338],q0[339];
-cx q0[338],q0[141];
-rz(pi/2) q0[338];
-sx q0[338];
-rz(pi/2) q0[338];
-cx q0[141],q0[338];
-rz(-pi/4) q0[338];
-cx q0[0],q0[338];
-rz(pi/4) q0[338];
-cx q0[141],q0[338];
-rz(pi/4) q0[141];
-rz(-pi/4) q0[338];
-cx q0[0],q0[338];
-cx q0[0],q0[141];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[141];
-cx q0[0],q0[141];
-rz(3*pi/4) q0[338];
-sx q0[338];
-rz(pi/2) q0[338];
-cx q0[338],q0[141];
-sx q0[339];
-sx q0[340];
-rz(1.8126715) q0[340];
-cx q0[339],q0[340];
-rz(1.7367507) q0[340];
-cx q0[339],q0[340];
-rz(-pi) q0[339];
-sx q0[339];
-rz(-pi) q0[339];
-rz(-1.7986254) q0[340];
-sx q0[340];
-rz(-pi) q0[340];
-cx q0[339],q0[340];
-sx q0[340];
-rz(1.7986254) q0[340];
-sx q0[340];
-rz(-pi) q0[340];
-cx q0[339],q0[340];
-cx q0[339],q0[142];
-rz(pi/2) q0[339];
-sx q0[339];
-rz(pi/2) q0[339];
-cx q0[142],q0[339];
-rz(-pi/4) q0[339];
-cx q0[0],q0[339];
-rz(pi/4) q0[339];
-cx q0[142],q0[339];
-rz(pi/4) q0[142];
-rz(-pi/4) q0[339];
-cx q0[0],q0[339];
-cx q0[0],q0[142];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[142];
-cx q0[0],q0[142];
-rz(3*pi/4) q0[339];
-sx q0[339];
-rz(pi/2) q0[339];
-cx q0[339],q0[142];
-sx q0[340];
-sx q0[341];
-rz(1.3482068) q0[341];
-cx q0[340],q0[341];
-rz(2.0614113) q0[341];
-cx q0[340],q0[341];
-rz(-pi) q0[340];
-sx q0[340];
-rz(-pi) q0[340];
-rz(-2.8781303) q0[341];
-sx q0[341];
-rz(-pi) q0[341];
-cx q0[340],q0[341];
-sx q0[341];
-rz(2.8781303) q0[341];
-sx q0[341];
-rz(-pi) q0[341];
-cx q0[340],q0[341];
-cx q0[340],q0[143];
-rz(pi/2) q0[340];
-sx q0[340];
-rz(pi/2) q0[340];
-cx q0[143],q0[340];
-rz(-pi/4) q0[340];
-cx q0[0],q0[340];
-rz(pi/4) q0[340];
-cx q0[143],q0[340];
-rz(pi/4) q0[143];
-rz(-pi/4) q0[340];
-cx q0[0],q0[340];
-cx q0[0],q0[143];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[143];
-cx q0[0],q0[143];
-rz(3*pi/4) q0[340];
-sx q0[340];
-rz(pi/2) q0[340];
-cx q0[340],q0[143];
-sx q0[341];
-sx q0[342];
-rz(0.59254194) q0[342];
-cx q0[341],q0[342];
-rz(0.9049402) q0[342];
-cx q0[341],q0[342];
-rz(-pi) q0[341];
-sx q0[341];
-rz(-pi) q0[341];
-rz(-2.7908745) q0[342];
-sx q0[342];
-rz(-pi) q0[342];
-cx q0[341],q0[342];
-sx q0[342];
-rz(2.7908745) q0[342];
-sx q0[342];
-rz(-pi) q0[342];
-cx q0[341],q0[342];
-cx q0[341],q0[144];
-rz(pi/2) q0[341];
-sx q0[341];
-rz(pi/2) q0[341];
-cx q0[144],q0[341];
-rz(-pi/4) q0[341];
-cx q0[0],q0[341];
-rz(pi/4) q0[341];
-cx q0[144],q0[341];
-rz(pi/4) q0[144];
-rz(-pi/4) q0[341];
-cx q0[0],q0[341];
-cx q0[0],q0[144];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[144];
-cx q0[0],q0[144];
-rz(3*pi/4) q0[341];
-sx q0[341];
-rz(pi/2) q0[341];
-cx q0[341],q0[144];
-sx q0[342];
-sx q0[343];
-rz(0.37891453) q0[343];
-cx q0[342],q0[343];
-rz(1.2158619) q0[343];
-cx q0[342],q0[343];
-rz(-pi) q0[342];
-sx q0[342];
-rz(-pi) q0[342];
-rz(-2.6127021) q0[343];
-sx q0[343];
-rz(-pi) q0[343];
-cx q0[342],q0[343];
-sx q0[343];
-rz(2.6127021) q0[343];
-sx q0[343];
-rz(-pi) q0[343];
-cx q0[342],q0[343];
-cx q0[342],q0[145];
-rz(pi/2) q0[342];
-sx q0[342];
-rz(pi/2) q0[342];
-cx q0[145],q0[342];
-rz(-pi/4) q0[342];
-cx q0[0],q0[342];
-rz(pi/4) q0[342];
-cx q0[145],q0[342];
-rz(pi/4) q0[145];
-rz(-pi/4) q0[342];
-cx q0[0],q0[342];
-cx q0[0],q0[145];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[145];
-cx q0[0],q0[145];
-rz(3*pi/4) q0[342];
-sx q0[342];
-rz(pi/2) q0[342];
-cx q0[342],q0[145];
-sx q0[343];
-sx q0[344];
-rz(3.0152938) q0[344];
-cx q0[343],q0[344];
-rz(0.097583798) q0[344];
-cx q0[343],q0[344];
-rz(-pi) q0[343];
-sx q0[343];
-rz(-pi) q0[343];
-rz(-2.9428131) q0[344];
-sx q0[344];
-rz(-pi) q0[344];
-cx q0[343],q0[344];
-sx q0[344];
-rz(2.9428131) q0[344];
-sx q0[344];
-rz(-pi) q0[344];
-cx q0[343],q0[344];
-cx q0[343],q0[146];
-rz(pi/2) q0[343];
-sx q0[343];
-rz(pi/2) q0[343];
-cx q0[146],q0[343];
-rz(-pi/4) q0[343];
-cx q0[0],q0[343];
-rz(pi/4) q0[343];
-cx q0[146],q0[343];
-rz(pi/4) q0[146];
-rz(-pi/4) q0[343];
-cx q0[0],q0[343];
-cx q0[0],q0[146];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[146];
-cx q0[0],q0[146];
-rz(3*pi/4) q0[343];
-sx q0[343];
-rz(pi/2) q0[343];
-cx q0[343],q0[146];
-sx q0[344];
-sx q0[345];
-rz(1.1072103) q0[345];
-cx q0[344],q0[345];
-rz(2.9997131) q0[345];
-cx q0[344],q0[345];
-rz(-pi) q0[344];
-sx q0[344];
-rz(-pi) q0[344];
-rz(-2.1026085) q0[345];
-sx q0[345];
-rz(-pi) q0[345];
-cx q0[344],q0[345];
-sx q0[345];
-rz(2.1026085) q0[345];
-sx q0[345];
-rz(-pi) q0[345];
-cx q0[344],q0[345];
-cx q0[344],q0[147];
-rz(pi/2) q0[344];
-sx q0[344];
-rz(pi/2) q0[344];
-cx q0[147],q0[344];
-rz(-pi/4) q0[344];
-cx q0[0],q0[344];
-rz(pi/4) q0[344];
-cx q0[147],q0[344];
-rz(pi/4) q0[147];
-rz(-pi/4) q0[344];
-cx q0[0],q0[344];
-cx q0[0],q0[147];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[147];
-cx q0[0],q0[147];
-rz(3*pi/4) q0[344];
-sx q0[344];
-rz(pi/2) q0[344];
-cx q0[344],q0[147];
-sx q0[345];
-sx q0[346];
-rz(2.4137206) q0[346];
-cx q0[345],q0[346];
-rz(0.99141132) q0[346];
-cx q0[345],q0[346];
-rz(-pi) q0[345];
-sx q0[345];
-rz(-pi) q0[345];
-rz(-2.0320923) q0[346];
-sx q0[346];
-rz(-pi) q0[346];
-cx q0[345],q0[346];
-sx q0[346];
-rz(2.0320923) q0[346];
-sx q0[346];
-rz(-pi) q0[346];
-cx q0[345],q0[346];
-cx q0[345],q0[148];
-rz(pi/2) q0[345];
-sx q0[345];
-rz(pi/2) q0[345];
-cx q0[148],q0[345];
-rz(-pi/4) q0[345];
-cx q0[0],q0[345];
-rz(pi/4) q0[345];
-cx q0[148],q0[345];
-rz(pi/4) q0[148];
-rz(-pi/4) q0[345];
-cx q0[0],q0[345];
-cx q0[0],q0[148];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[148];
-cx q0[0],q0[148];
-rz(3*pi/4) q0[345];
-sx q0[345];
-rz(pi/2) q0[345];
-cx q0[345],q0[148];
-sx q0[346];
-sx q0[347];
-rz(0.43785745) q0[347];
-cx q0[346],q0[347];
-rz(0.8010571) q0[347];
-cx q0[346],q0[347];
-rz(-pi) q0[346];
-sx q0[346];
-rz(-pi) q0[346];
-rz(-1.6415777) q0[347];
-sx q0[347];
-rz(-pi) q0[347];
-cx q0[346],q0[347];
-sx q0[347];
-rz(1.6415777) q0[347];
-sx q0[347];
-rz(-pi) q0[347];
-cx q0[346],q0[347];
-cx q0[346],q0[149];
-rz(pi/2) q0[346];
-sx q0[346];
-rz(pi/2) q0[346];
-cx q0[149],q0[346];
-rz(-pi/4) q0[346];
-cx q0[0],q0[346];
-rz(pi/4) q0[346];
-cx q0[149],q0[346];
-rz(pi/4) q0[149];
-rz(-pi/4) q0[346];
-cx q0[0],q0[346];
-cx q0[0],q0[149];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[149];
-cx q0[0],q0[149];
-rz(3*pi/4) q0[346];
-sx q0[346];
-rz(pi/2) q0[346];
-cx q0[346],q0[149];
-sx q0[347];
-sx q0[348];
-rz(1.4780867) q0[348];
-cx q0[347],q0[348];
-rz(1.2967798) q0[348];
-cx q0[347],q0[348];
-rz(-pi) q0[347];
-sx q0[347];
-rz(-pi) q0[347];
-rz(-2.7434855) q0[348];
-sx q0[348];
-rz(-pi) q0[348];
-cx q0[347],q0[348];
-sx q0[348];
-rz(2.7434855) q0[348];
-sx q0[348];
-rz(-pi) q0[348];
-cx q0[347],q0[348];
-cx q0[347],q0[150];
-rz(pi/2) q0[347];
-sx q0[347];
-rz(pi/2) q0[347];
-cx q0[150],q0[347];
-rz(-pi/4) q0[347];
-cx q0[0],q0[347];
-rz(pi/4) q0[347];
-cx q0[150],q0[347];
-rz(pi/4) q0[150];
-rz(-pi/4) q0[347];
-cx q0[0],q0[347];
-cx q0[0],q0[150];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[150];
-cx q0[0],q0[150];
-rz(3*pi/4) q0[347];
-sx q0[347];
-rz(pi/2) q0[347];
-cx q0[347],q0[150];
-sx q0[348];
-sx q0[349];
-rz(0.93432246) q0[349];
-cx q0[348],q0[349];
-rz(2.6560206) q0[349];
-cx q0[348],q0[349];
-rz(-pi) q0[348];
-sx q0[348];
-rz(-pi) q0[348];
-rz(-1.917654) q0[349];
-sx q0[349];
-rz(-pi) q0[349];
-cx q0[348],q0[349];
-sx q0[349];
-rz(1.917654) q0[349];
-sx q0[349];
-rz(-pi) q0[349];
-cx q0[348],q0[349];
-cx q0[348],q0[151];
-rz(pi/2) q0[348];
-sx q0[348];
-rz(pi/2) q0[348];
-cx q0[151],q0[348];
-rz(-pi/4) q0[348];
-cx q0[0],q0[348];
-rz(pi/4) q0[348];
-cx q0[151],q0[348];
-rz(pi/4) q0[151];
-rz(-pi/4) q0[348];
-cx q0[0],q0[348];
-cx q0[0],q0[151];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[151];
-cx q0[0],q0[151];
-rz(3*pi/4) q0[348];
-sx q0[348];
-rz(pi/2) q0[348];
-cx q0[348],q0[151];
-sx q0[349];
-sx q0[350];
-rz(1.6062181) q0[350];
-cx q0[349],q0[350];
-rz(1.2775981) q0[350];
-cx q0[349],q0[350];
-rz(-pi) q0[349];
-sx q0[349];
-rz(-pi) q0[349];
-rz(-1.6922708) q0[350];
-sx q0[350];
-rz(-pi) q0[350];
-cx q0[349],q0[350];
-sx q0[350];
-rz(1.6922708) q0[350];
-sx q0[350];
-rz(-pi) q0[350];
-cx q0[349],q0[350];
-cx q0[349],q0[152];
-rz(pi/2) q0[349];
-sx q0[349];
-rz(pi/2) q0[349];
-cx q0[152],q0[349];
-rz(-pi/4) q0[349];
-cx q0[0],q0[349];
-rz(pi/4) q0[349];
-cx q0[152],q0[349];
-rz(pi/4) q0[152];
-rz(-pi/4) q0[349];
-cx q0[0],q0[349];
-cx q0[0],q0[152];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[152];
-cx q0[0],q0[152];
-rz(3*pi/4) q0[349];
-sx q0[349];
-rz(pi/2) q0[349];
-cx q0[349],q0[152];
-sx q0[350];
-sx q0[351];
-rz(1.5011492) q0[351];
-cx q0[350],q0[351];
-rz(2.6569814) q0[351];
-cx q0[350],q0[351];
-rz(-pi) q0[350];
-sx q0[350];
-rz(-pi) q0[350];
-rz(-2.3888266) q0[351];
-sx q0[351];
-rz(-pi) q0[351];
-cx q0[350],q0[351];
-sx q0[351];
-rz(2.3888266) q0[351];
-sx q0[351];
-rz(-pi) q0[351];
-cx q0[350],q0[351];
-cx q0[350],q0[153];
-rz(pi/2) q0[350];
-sx q0[350];
-rz(pi/2) q0[350];
-cx q0[153],q0[350];
-rz(-pi/4) q0[350];
-cx q0[0],q0[350];
-rz(pi/4) q0[350];
-cx q0[153],q0[350];
-rz(pi/4) q0[153];
-rz(-pi/4) q0[350];
-cx q0[0],q0[350];
-cx q0[0],q0[153];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[153];
-cx q0[0],q0[153];
-rz(3*pi/4) q0[350];
-sx q0[350];
-rz(pi/2) q0[350];
-cx q0[350],q0[153];
-sx q0[351];
-sx q0[352];
-rz(0.60061592) q0[352];
-cx q0[351],q0[352];
-rz(1.6463791) q0[352];
-cx q0[351],q0[352];
-rz(-pi) q0[351];
-sx q0[351];
-rz(-pi) q0[351];
-rz(-2.4968441) q0[352];
-sx q0[352];
-rz(-pi) q0[352];
-cx q0[351],q0[352];
-sx q0[352];
-rz(2.4968441) q0[352];
-sx q0[352];
-rz(-pi) q0[352];
-cx q0[351],q0[352];
-cx q0[351],q0[154];
-rz(pi/2) q0[351];
-sx q0[351];
-rz(pi/2) q0[351];
-cx q0[154],q0[351];
-rz(-pi/4) q0[351];
-cx q0[0],q0[351];
-rz(pi/4) q0[351];
-cx q0[154],q0[351];
-rz(pi/4) q0[154];
-rz(-pi/4) q0[351];
-cx q0[0],q0[351];
-cx q0[0],q0[154];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[154];
-cx q0[0],q0[154];
-rz(3*pi/4) q0[351];
-sx q0[351];
-rz(pi/2) q0[351];
-cx q0[351],q0[154];
-sx q0[352];
-sx q0[353];
-rz(0.65539772) q0[353];
-cx q0[352],q0[353];
-rz(2.3600705) q0[353];
-cx q0[352],q0[353];
-rz(-pi) q0[352];
-sx q0[352];
-rz(-pi) q0[352];
-rz(-2.800289) q0[353];
-sx q0[353];
-rz(-pi) q0[353];
-cx q0[352],q0[353];
-sx q0[353];
-rz(2.800289) q0[353];
-sx q0[353];
-rz(-pi) q0[353];
-cx q0[352],q0[353];
-cx q0[352],q0[155];
-rz(pi/2) q0[352];
-sx q0[352];
-rz(pi/2) q0[352];
-cx q0[155],q0[352];
-rz(-pi/4) q0[352];
-cx q0[0],q0[352];
-rz(pi/4) q0[352];
-cx q0[155],q0[352];
-rz(pi/4) q0[155];
-rz(-pi/4) q0[352];
-cx q0[0],q0[352];
-cx q0[0],q0[155];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[155];
-cx q0[0],q0[155];
-rz(3*pi/4) q0[352];
-sx q0[352];
-rz(pi/2) q0[352];
-cx q0[352],q0[155];
-sx q0[353];
-sx q0[354];
-rz(0.56880297) q0[354];
-cx q0[353],q0[354];
-rz(0.042115548) q0[354];
-cx q0[353],q0[354];
-rz(-pi) q0[353];
-sx q0[353];
-rz(-pi) q0[353];
-rz(-1.8305387) q0[354];
-sx q0[354];
-rz(-pi) q0[354];
-cx q0[353],q0[354];
-sx q0[354];
-rz(1.8305387) q0[354];
-sx q0[354];
-rz(-pi) q0[354];
-cx q0[353],q0[354];
-cx q0[353],q0[156];
-rz(pi/2) q0[353];
-sx q0[353];
-rz(pi/2) q0[353];
-cx q0[156],q0[353];
-rz(-pi/4) q0[353];
-cx q0[0],q0[353];
-rz(pi/4) q0[353];
-cx q0[156],q0[353];
-rz(pi/4) q0[156];
-rz(-pi/4) q0[353];
-cx q0[0],q0[353];
-cx q0[0],q0[156];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[156];
-cx q0[0],q0[156];
-rz(3*pi/4) q0[353];
-sx q0[353];
-rz(pi/2) q0[353];
-cx q0[353],q0[156];
-sx q0[354];
-sx q0[355];
-rz(1.4936208) q0[355];
-cx q0[354],q0[355];
-rz(1.456421) q0[355];
-cx q0[354],q0[355];
-rz(-pi) q0[354];
-sx q0[354];
-rz(-pi) q0[354];
-rz(-2.4881967) q0[355];
-sx q0[355];
-rz(-pi) q0[355];
-cx q0[354],q0[355];
-sx q0[355];
-rz(2.4881967) q0[355];
-sx q0[355];
-rz(-pi) q0[355];
-cx q0[354],q0[355];
-cx q0[354],q0[157];
-rz(pi/2) q0[354];
-sx q0[354];
-rz(pi/2) q0[354];
-cx q0[157],q0[354];
-rz(-pi/4) q0[354];
-cx q0[0],q0[354];
-rz(pi/4) q0[354];
-cx q0[157],q0[354];
-rz(pi/4) q0[157];
-rz(-pi/4) q0[354];
-cx q0[0],q0[354];
-cx q0[0],q0[157];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[157];
-cx q0[0],q0[157];
-rz(3*pi/4) q0[354];
-sx q0[354];
-rz(pi/2) q0[354];
-cx q0[354],q0[157];
-sx q0[355];
-sx q0[356];
-rz(1.3400041) q0[356];
-cx q0[355],q0[356];
-rz(1.4452136) q0[356];
-cx q0[355],q0[356];
-rz(-pi) q0[355];
-sx q0[355];
-rz(-pi) q0[355];
-rz(-1.7659184) q0[356];
-sx q0[356];
-rz(-pi) q0[356];
-cx q0[355],q0[356];
-sx q0[356];
-rz(1.7659184) q0[356];
-sx q0[356];
-rz(-pi) q0[356];
-cx q0[355],q0[356];
-cx q0[355],q0[158];
-rz(pi/2) q0[355];
-sx q0[355];
-rz(pi/2) q0[355];
-cx q0[158],q0[355];
-rz(-pi/4) q0[355];
-cx q0[0],q0[355];
-rz(pi/4) q0[355];
-cx q0[158],q0[355];
-rz(pi/4) q0[158];
-rz(-pi/4) q0[355];
-cx q0[0],q0[355];
-cx q0[0],q0[158];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[158];
-cx q0[0],q0[158];
-rz(3*pi/4) q0[355];
-sx q0[355];
-rz(pi/2) q0[355];
-cx q0[355],q0[158];
-sx q0[356];
-sx q0[357];
-rz(0.97124211) q0[357];
-cx q0[356],q0[357];
-rz(2.3070021) q0[357];
-cx q0[356],q0[357];
-rz(-pi) q0[356];
-sx q0[356];
-rz(-pi) q0[356];
-rz(-2.9790062) q0[357];
-sx q0[357];
-rz(-pi) q0[357];
-cx q0[356],q0[357];
-sx q0[357];
-rz(2.9790062) q0[357];
-sx q0[357];
-rz(-pi) q0[357];
-cx q0[356],q0[357];
-cx q0[356],q0[159];
-rz(pi/2) q0[356];
-sx q0[356];
-rz(pi/2) q0[356];
-cx q0[159],q0[356];
-rz(-pi/4) q0[356];
-cx q0[0],q0[356];
-rz(pi/4) q0[356];
-cx q0[159],q0[356];
-rz(pi/4) q0[159];
-rz(-pi/4) q0[356];
-cx q0[0],q0[356];
-cx q0[0],q0[159];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[159];
-cx q0[0],q0[159];
-rz(3*pi/4) q0[356];
-sx q0[356];
-rz(pi/2) q0[356];
-cx q0[356],q0[159];
-sx q0[357];
-sx q0[358];
-rz(1.1472695) q0[358];
-cx q0[357],q0[358];
-rz(1.9828802) q0[358];
-cx q0[357],q0[358];
-rz(-pi) q0[357];
-sx q0[357];
-rz(-pi) q0[357];
-rz(-1.6541923) q0[358];
-sx q0[358];
-rz(-pi) q0[358];
-cx q0[357],q0[358];
-sx q0[358];
-rz(1.6541923) q0[358];
-sx q0[358];
-rz(-pi) q0[358];
-cx q0[357],q0[358];
-cx q0[357],q0[160];
-rz(pi/2) q0[357];
-sx q0[357];
-rz(pi/2) q0[357];
-cx q0[160],q0[357];
-rz(-pi/4) q0[357];
-cx q0[0],q0[357];
-rz(pi/4) q0[357];
-cx q0[160],q0[357];
-rz(pi/4) q0[160];
-rz(-pi/4) q0[357];
-cx q0[0],q0[357];
-cx q0[0],q0[160];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[160];
-cx q0[0],q0[160];
-rz(3*pi/4) q0[357];
-sx q0[357];
-rz(pi/2) q0[357];
-cx q0[357],q0[160];
-sx q0[358];
-sx q0[359];
-rz(2.2901804) q0[359];
-cx q0[358],q0[359];
-rz(1.8891172) q0[359];
-cx q0[358],q0[359];
-rz(-pi) q0[358];
-sx q0[358];
-rz(-pi) q0[358];
-rz(-2.8465926) q0[359];
-sx q0[359];
-rz(-pi) q0[359];
-cx q0[358],q0[359];
-sx q0[359];
-rz(2.8465926) q0[359];
-sx q0[359];
-rz(-pi) q0[359];
-cx q0[358],q0[359];
-cx q0[358],q0[161];
-rz(pi/2) q0[358];
-sx q0[358];
-rz(pi/2) q0[358];
-cx q0[161],q0[358];
-rz(-pi/4) q0[358];
-cx q0[0],q0[358];
-rz(pi/4) q0[358];
-cx q0[161],q0[358];
-rz(pi/4) q0[161];
-rz(-pi/4) q0[358];
-cx q0[0],q0[358];
-cx q0[0],q0[161];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[161];
-cx q0[0],q0[161];
-rz(3*pi/4) q0[358];
-sx q0[358];
-rz(pi/2) q0[358];
-cx q0[358],q0[161];
-sx q0[359];
-sx q0[360];
-rz(2.6749266) q0[360];
-cx q0[359],q0[360];
-rz(1.5600679) q0[360];
-cx q0[359],q0[360];
-rz(-pi) q0[359];
-sx q0[359];
-rz(-pi) q0[359];
-rz(-1.8555856) q0[360];
-sx q0[360];
-rz(-pi) q0[360];
-cx q0[359],q0[360];
-sx q0[360];
-rz(1.8555856) q0[360];
-sx q0[360];
-rz(-pi) q0[360];
-cx q0[359],q0[360];
-cx q0[359],q0[162];
-rz(pi/2) q0[359];
-sx q0[359];
-rz(pi/2) q0[359];
-cx q0[162],q0[359];
-rz(-pi/4) q0[359];
-cx q0[0],q0[359];
-rz(pi/4) q0[359];
-cx q0[162],q0[359];
-rz(pi/4) q0[162];
-rz(-pi/4) q0[359];
-cx q0[0],q0[359];
-cx q0[0],q0[162];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[162];
-cx q0[0],q0[162];
-rz(3*pi/4) q0[359];
-sx q0[359];
-rz(pi/2) q0[359];
-cx q0[359],q0[162];
-sx q0[360];
-sx q0[361];
-rz(0.21034941) q0[361];
-cx q0[360],q0[361];
-rz(0.89156043) q0[361];
-cx q0[360],q0[361];
-rz(-pi) q0[360];
-sx q0[360];
-rz(-pi) q0[360];
-rz(-2.359245) q0[361];
-sx q0[361];
-rz(-pi) q0[361];
-cx q0[360],q0[361];
-sx q0[361];
-rz(2.359245) q0[361];
-sx q0[361];
-rz(-pi) q0[361];
-cx q0[360],q0[361];
-cx q0[360],q0[163];
-rz(pi/2) q0[360];
-sx q0[360];
-rz(pi/2) q0[360];
-cx q0[163],q0[360];
-rz(-pi/4) q0[360];
-cx q0[0],q0[360];
-rz(pi/4) q0[360];
-cx q0[163],q0[360];
-rz(pi/4) q0[163];
-rz(-pi/4) q0[360];
-cx q0[0],q0[360];
-cx q0[0],q0[163];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[163];
-cx q0[0],q0[163];
-rz(3*pi/4) q0[360];
-sx q0[360];
-rz(pi/2) q0[360];
-cx q0[360],q0[163];
-sx q0[361];
-sx q0[362];
-rz(1.3602805) q0[362];
-cx q0[361],q0[362];
-rz(0.89233858) q0[362];
-cx q0[361],q0[362];
-rz(-pi) q0[361];
-sx q0[361];
-rz(-pi) q0[361];
-rz(-2.1368104) q0[362];
-sx q0[362];
-rz(-pi) q0[362];
-cx q0[361],q0[362];
-sx q0[362];
-rz(2.1368104) q0[362];
-sx q0[362];
-rz(-pi) q0[362];
-cx q0[361],q0[362];
-cx q0[361],q0[164];
-rz(pi/2) q0[361];
-sx q0[361];
-rz(pi/2) q0[361];
-cx q0[164],q0[361];
-rz(-pi/4) q0[361];
-cx q0[0],q0[361];
-rz(pi/4) q0[361];
-cx q0[164],q0[361];
-rz(pi/4) q0[164];
-rz(-pi/4) q0[361];
-cx q0[0],q0[361];
-cx q0[0],q0[164];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[164];
-cx q0[0],q0[164];
-rz(3*pi/4) q0[361];
-sx q0[361];
-rz(pi/2) q0[361];
-cx q0[361],q0[164];
-sx q0[362];
-sx q0[363];
-rz(2.1293937) q0[363];
-cx q0[362],q0[363];
-rz(2.639685) q0[363];
-cx q0[362],q0[363];
-rz(-pi) q0[362];
-sx q0[362];
-rz(-pi) q0[362];
-rz(-2.8285992) q0[363];
-sx q0[363];
-rz(-pi) q0[363];
-cx q0[362],q0[363];
-sx q0[363];
-rz(2.8285992) q0[363];
-sx q0[363];
-rz(-pi) q0[363];
-cx q0[362],q0[363];
-cx q0[362],q0[165];
-rz(pi/2) q0[362];
-sx q0[362];
-rz(pi/2) q0[362];
-cx q0[165],q0[362];
-rz(-pi/4) q0[362];
-cx q0[0],q0[362];
-rz(pi/4) q0[362];
-cx q0[165],q0[362];
-rz(pi/4) q0[165];
-rz(-pi/4) q0[362];
-cx q0[0],q0[362];
-cx q0[0],q0[165];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[165];
-cx q0[0],q0[165];
-rz(3*pi/4) q0[362];
-sx q0[362];
-rz(pi/2) q0[362];
-cx q0[362],q0[165];
-sx q0[363];
-sx q0[364];
-rz(0.054107417) q0[364];
-cx q0[363],q0[364];
-rz(1.9805582) q0[364];
-cx q0[363],q0[364];
-rz(-pi) q0[363];
-sx q0[363];
-rz(-pi) q0[363];
-rz(-1.910077) q0[364];
-sx q0[364];
-rz(-pi) q0[364];
-cx q0[363],q0[364];
-sx q0[364];
-rz(1.910077) q0[364];
-sx q0[364];
-rz(-pi) q0[364];
-cx q0[363],q0[364];
-cx q0[363],q0[166];
-rz(pi/2) q0[363];
-sx q0[363];
-rz(pi/2) q0[363];
-cx q0[166],q0[363];
-rz(-pi/4) q0[363];
-cx q0[0],q0[363];
-rz(pi/4) q0[363];
-cx q0[166],q0[363];
-rz(pi/4) q0[166];
-rz(-pi/4) q0[363];
-cx q0[0],q0[363];
-cx q0[0],q0[166];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[166];
-cx q0[0],q0[166];
-rz(3*pi/4) q0[363];
-sx q0[363];
-rz(pi/2) q0[363];
-cx q0[363],q0[166];
-sx q0[364];
-sx q0[365];
-rz(0.19756816) q0[365];
-cx q0[364],q0[365];
-rz(2.4081113) q0[365];
-cx q0[364],q0[365];
-rz(-pi) q0[364];
-sx q0[364];
-rz(-pi) q0[364];
-rz(-1.7020991) q0[365];
-sx q0[365];
-rz(-pi) q0[365];
-cx q0[364],q0[365];
-sx q0[365];
-rz(1.7020991) q0[365];
-sx q0[365];
-rz(-pi) q0[365];
-cx q0[364],q0[365];
-cx q0[364],q0[167];
-rz(pi/2) q0[364];
-sx q0[364];
-rz(pi/2) q0[364];
-cx q0[167],q0[364];
-rz(-pi/4) q0[364];
-cx q0[0],q0[364];
-rz(pi/4) q0[364];
-cx q0[167],q0[364];
-rz(pi/4) q0[167];
-rz(-pi/4) q0[364];
-cx q0[0],q0[364];
-cx q0[0],q0[167];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[167];
-cx q0[0],q0[167];
-rz(3*pi/4) q0[364];
-sx q0[364];
-rz(pi/2) q0[364];
-cx q0[364],q0[167];
-sx q0[365];
-sx q0[366];
-rz(0.1572763) q0[366];
-cx q0[365],q0[366];
-rz(0.7126561) q0[366];
-cx q0[365],q0[366];
-rz(-pi) q0[365];
-sx q0[365];
-rz(-pi) q0[365];
-rz(-1.6163593) q0[366];
-sx q0[366];
-rz(-pi) q0[366];
-cx q0[365],q0[366];
-sx q0[366];
-rz(1.6163593) q0[366];
-sx q0[366];
-rz(-pi) q0[366];
-cx q0[365],q0[366];
-cx q0[365],q0[168];
-rz(pi/2) q0[365];
-sx q0[365];
-rz(pi/2) q0[365];
-cx q0[168],q0[365];
-rz(-pi/4) q0[365];
-cx q0[0],q0[365];
-rz(pi/4) q0[365];
-cx q0[168],q0[365];
-rz(pi/4) q0[168];
-rz(-pi/4) q0[365];
-cx q0[0],q0[365];
-cx q0[0],q0[168];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[168];
-cx q0[0],q0[168];
-rz(3*pi/4) q0[365];
-sx q0[365];
-rz(pi/2) q0[365];
-cx q0[365],q0[168];
-sx q0[366];
-sx q0[367];
-rz(2.0676358) q0[367];
-cx q0[366],q0[367];
-rz(1.8327372) q0[367];
-cx q0[366],q0[367];
-rz(-pi) q0[366];
-sx q0[366];
-rz(-pi) q0[366];
-rz(-2.2756006) q0[367];
-sx q0[367];
-rz(-pi) q0[367];
-cx q0[366],q0[367];
-sx q0[367];
-rz(2.2756006) q0[367];
-sx q0[367];
-rz(-pi) q0[367];
-cx q0[366],q0[367];
-cx q0[366],q0[169];
-rz(pi/2) q0[366];
-sx q0[366];
-rz(pi/2) q0[366];
-cx q0[169],q0[366];
-rz(-pi/4) q0[366];
-cx q0[0],q0[366];
-rz(pi/4) q0[366];
-cx q0[169],q0[366];
-rz(pi/4) q0[169];
-rz(-pi/4) q0[366];
-cx q0[0],q0[366];
-cx q0[0],q0[169];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[169];
-cx q0[0],q0[169];
-rz(3*pi/4) q0[366];
-sx q0[366];
-rz(pi/2) q0[366];
-cx q0[366],q0[169];
-sx q0[367];
-sx q0[368];
-rz(0.78349363) q0[368];
-cx q0[367],q0[368];
-rz(2.9868758) q0[368];
-cx q0[367],q0[368];
-rz(-pi) q0[367];
-sx q0[367];
-rz(-pi) q0[367];
-rz(-2.0580413) q0[368];
-sx q0[368];
-rz(-pi) q0[368];
-cx q0[367],q0[368];
-sx q0[368];
-rz(2.0580413) q0[368];
-sx q0[368];
-rz(-pi) q0[368];
-cx q0[367],q0[368];
-cx q0[367],q0[170];
-rz(pi/2) q0[367];
-sx q0[367];
-rz(pi/2) q0[367];
-cx q0[170],q0[367];
-rz(-pi/4) q0[367];
-cx q0[0],q0[367];
-rz(pi/4) q0[367];
-cx q0[170],q0[367];
-rz(pi/4) q0[170];
-rz(-pi/4) q0[367];
-cx q0[0],q0[367];
-cx q0[0],q0[170];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[170];
-cx q0[0],q0[170];
-rz(3*pi/4) q0[367];
-sx q0[367];
-rz(pi/2) q0[367];
-cx q0[367],q0[170];
-sx q0[368];
-sx q0[369];
-rz(1.3155391) q0[369];
-cx q0[368],q0[369];
-rz(2.9094645) q0[369];
-cx q0[368],q0[369];
-rz(-pi) q0[368];
-sx q0[368];
-rz(-pi) q0[368];
-rz(-1.9368712) q0[369];
-sx q0[369];
-rz(-pi) q0[369];
-cx q0[368],q0[369];
-sx q0[369];
-rz(1.9368712) q0[369];
-sx q0[369];
-rz(-pi) q0[369];
-cx q0[368],q0[369];
-cx q0[368],q0[171];
-rz(pi/2) q0[368];
-sx q0[368];
-rz(pi/2) q0[368];
-cx q0[171],q0[368];
-rz(-pi/4) q0[368];
-cx q0[0],q0[368];
-rz(pi/4) q0[368];
-cx q0[171],q0[368];
-rz(pi/4) q0[171];
-rz(-pi/4) q0[368];
-cx q0[0],q0[368];
-cx q0[0],q0[171];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[171];
-cx q0[0],q0[171];
-rz(3*pi/4) q0[368];
-sx q0[368];
-rz(pi/2) q0[368];
-cx q0[368],q0[171];
-sx q0[369];
-sx q0[370];
-rz(0.77641331) q0[370];
-cx q0[369],q0[370];
-rz(2.161851) q0[370];
-cx q0[369],q0[370];
-rz(-pi) q0[369];
-sx q0[369];
-rz(-pi) q0[369];
-rz(-1.7685628) q0[370];
-sx q0[370];
-rz(-pi) q0[370];
-cx q0[369],q0[370];
-sx q0[370];
-rz(1.7685628) q0[370];
-sx q0[370];
-rz(-pi) q0[370];
-cx q0[369],q0[370];
-cx q0[369],q0[172];
-rz(pi/2) q0[369];
-sx q0[369];
-rz(pi/2) q0[369];
-cx q0[172],q0[369];
-rz(-pi/4) q0[369];
-cx q0[0],q0[369];
-rz(pi/4) q0[369];
-cx q0[172],q0[369];
-rz(pi/4) q0[172];
-rz(-pi/4) q0[369];
-cx q0[0],q0[369];
-cx q0[0],q0[172];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[172];
-cx q0[0],q0[172];
-rz(3*pi/4) q0[369];
-sx q0[369];
-rz(pi/2) q0[369];
-cx q0[369],q0[172];
-sx q0[370];
-sx q0[371];
-rz(2.2417986) q0[371];
-cx q0[370],q0[371];
-rz(1.4463808) q0[371];
-cx q0[370],q0[371];
-rz(-pi) q0[370];
-sx q0[370];
-rz(-pi) q0[370];
-rz(-2.1647162) q0[371];
-sx q0[371];
-rz(-pi) q0[371];
-cx q0[370],q0[371];
-sx q0[371];
-rz(2.1647162) q0[371];
-sx q0[371];
-rz(-pi) q0[371];
-cx q0[370],q0[371];
-cx q0[370],q0[173];
-rz(pi/2) q0[370];
-sx q0[370];
-rz(pi/2) q0[370];
-cx q0[173],q0[370];
-rz(-pi/4) q0[370];
-cx q0[0],q0[370];
-rz(pi/4) q0[370];
-cx q0[173],q0[370];
-rz(pi/4) q0[173];
-rz(-pi/4) q0[370];
-cx q0[0],q0[370];
-cx q0[0],q0[173];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[173];
-cx q0[0],q0[173];
-rz(3*pi/4) q0[370];
-sx q0[370];
-rz(pi/2) q0[370];
-cx q0[370],q0[173];
-sx q0[371];
-sx q0[372];
-rz(1.5802789) q0[372];
-cx q0[371],q0[372];
-rz(0.99592266) q0[372];
-cx q0[371],q0[372];
-rz(-pi) q0[371];
-sx q0[371];
-rz(-pi) q0[371];
-rz(-2.9382867) q0[372];
-sx q0[372];
-rz(-pi) q0[372];
-cx q0[371],q0[372];
-sx q0[372];
-rz(2.9382867) q0[372];
-sx q0[372];
-rz(-pi) q0[372];
-cx q0[371],q0[372];
-cx q0[371],q0[174];
-rz(pi/2) q0[371];
-sx q0[371];
-rz(pi/2) q0[371];
-cx q0[174],q0[371];
-rz(-pi/4) q0[371];
-cx q0[0],q0[371];
-rz(pi/4) q0[371];
-cx q0[174],q0[371];
-rz(pi/4) q0[174];
-rz(-pi/4) q0[371];
-cx q0[0],q0[371];
-cx q0[0],q0[174];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[174];
-cx q0[0],q0[174];
-rz(3*pi/4) q0[371];
-sx q0[371];
-rz(pi/2) q0[371];
-cx q0[371],q0[174];
-sx q0[372];
-sx q0[373];
-rz(2.3329901) q0[373];
-cx q0[372],q0[373];
-rz(0.70579958) q0[373];
-cx q0[372],q0[373];
-rz(-pi) q0[372];
-sx q0[372];
-rz(-pi) q0[372];
-rz(-2.9293292) q0[373];
-sx q0[373];
-rz(-pi) q0[373];
-cx q0[372],q0[373];
-sx q0[373];
-rz(2.9293292) q0[373];
-sx q0[373];
-rz(-pi) q0[373];
-cx q0[372],q0[373];
-cx q0[372],q0[175];
-rz(pi/2) q0[372];
-sx q0[372];
-rz(pi/2) q0[372];
-cx q0[175],q0[372];
-rz(-pi/4) q0[372];
-cx q0[0],q0[372];
-rz(pi/4) q0[372];
-cx q0[175],q0[372];
-rz(pi/4) q0[175];
-rz(-pi/4) q0[372];
-cx q0[0],q0[372];
-cx q0[0],q0[175];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[175];
-cx q0[0],q0[175];
-rz(3*pi/4) q0[372];
-sx q0[372];
-rz(pi/2) q0[372];
-cx q0[372],q0[175];
-sx q0[373];
-sx q0[374];
-rz(0.57969223) q0[374];
-cx q0[373],q0[374];
-rz(2.9021364) q0[374];
-cx q0[373],q0[374];
-rz(-pi) q0[373];
-sx q0[373];
-rz(-pi) q0[373];
-rz(-1.8096629) q0[374];
-sx q0[374];
-rz(-pi) q0[374];
-cx q0[373],q0[374];
-sx q0[374];
-rz(1.8096629) q0[374];
-sx q0[374];
-rz(-pi) q0[374];
-cx q0[373],q0[374];
-cx q0[373],q0[176];
-rz(pi/2) q0[373];
-sx q0[373];
-rz(pi/2) q0[373];
-cx q0[176],q0[373];
-rz(-pi/4) q0[373];
-cx q0[0],q0[373];
-rz(pi/4) q0[373];
-cx q0[176],q0[373];
-rz(pi/4) q0[176];
-rz(-pi/4) q0[373];
-cx q0[0],q0[373];
-cx q0[0],q0[176];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[176];
-cx q0[0],q0[176];
-rz(3*pi/4) q0[373];
-sx q0[373];
-rz(pi/2) q0[373];
-cx q0[373],q0[176];
-sx q0[374];
-sx q0[375];
-rz(0.60843307) q0[375];
-cx q0[374],q0[375];
-rz(2.5406431) q0[375];
-cx q0[374],q0[375];
-rz(-pi) q0[374];
-sx q0[374];
-rz(-pi) q0[374];
-rz(-1.6189286) q0[375];
-sx q0[375];
-rz(-pi) q0[375];
-cx q0[374],q0[375];
-sx q0[375];
-rz(1.6189286) q0[375];
-sx q0[375];
-rz(-pi) q0[375];
-cx q0[374],q0[375];
-cx q0[374],q0[177];
-rz(pi/2) q0[374];
-sx q0[374];
-rz(pi/2) q0[374];
-cx q0[177],q0[374];
-rz(-pi/4) q0[374];
-cx q0[0],q0[374];
-rz(pi/4) q0[374];
-cx q0[177],q0[374];
-rz(pi/4) q0[177];
-rz(-pi/4) q0[374];
-cx q0[0],q0[374];
-cx q0[0],q0[177];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[177];
-cx q0[0],q0[177];
-rz(3*pi/4) q0[374];
-sx q0[374];
-rz(pi/2) q0[374];
-cx q0[374],q0[177];
-sx q0[375];
-sx q0[376];
-rz(2.8052485) q0[376];
-cx q0[375],q0[376];
-rz(1.0037842) q0[376];
-cx q0[375],q0[376];
-rz(-pi) q0[375];
-sx q0[375];
-rz(-pi) q0[375];
-rz(-2.6972661) q0[376];
-sx q0[376];
-rz(-pi) q0[376];
-cx q0[375],q0[376];
-sx q0[376];
-rz(2.6972661) q0[376];
-sx q0[376];
-rz(-pi) q0[376];
-cx q0[375],q0[376];
-cx q0[375],q0[178];
-rz(pi/2) q0[375];
-sx q0[375];
-rz(pi/2) q0[375];
-cx q0[178],q0[375];
-rz(-pi/4) q0[375];
-cx q0[0],q0[375];
-rz(pi/4) q0[375];
-cx q0[178],q0[375];
-rz(pi/4) q0[178];
-rz(-pi/4) q0[375];
-cx q0[0],q0[375];
-cx q0[0],q0[178];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[178];
-cx q0[0],q0[178];
-rz(3*pi/4) q0[375];
-sx q0[375];
-rz(pi/2) q0[375];
-cx q0[375],q0[178];
-sx q0[376];
-sx q0[377];
-rz(2.7610307) q0[377];
-cx q0[376],q0[377];
-rz(1.7687061) q0[377];
-cx q0[376],q0[377];
-rz(-pi) q0[376];
-sx q0[376];
-rz(-pi) q0[376];
-rz(-1.6794674) q0[377];
-sx q0[377];
-rz(-pi) q0[377];
-cx q0[376],q0[377];
-sx q0[377];
-rz(1.6794674) q0[377];
-sx q0[377];
-rz(-pi) q0[377];
-cx q0[376],q0[377];
-cx q0[376],q0[179];
-rz(pi/2) q0[376];
-sx q0[376];
-rz(pi/2) q0[376];
-cx q0[179],q0[376];
-rz(-pi/4) q0[376];
-cx q0[0],q0[376];
-rz(pi/4) q0[376];
-cx q0[179],q0[376];
-rz(pi/4) q0[179];
-rz(-pi/4) q0[376];
-cx q0[0],q0[376];
-cx q0[0],q0[179];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[179];
-cx q0[0],q0[179];
-rz(3*pi/4) q0[376];
-sx q0[376];
-rz(pi/2) q0[376];
-cx q0[376],q0[179];
-sx q0[377];
-sx q0[378];
-rz(1.6359077) q0[378];
-cx q0[377],q0[378];
-rz(3.0421964) q0[378];
-cx q0[377],q0[378];
-rz(-pi) q0[377];
-sx q0[377];
-rz(-pi) q0[377];
-rz(-2.9447313) q0[378];
-sx q0[378];
-rz(-pi) q0[378];
-cx q0[377],q0[378];
-sx q0[378];
-rz(2.9447313) q0[378];
-sx q0[378];
-rz(-pi) q0[378];
-cx q0[377],q0[378];
-cx q0[377],q0[180];
-rz(pi/2) q0[377];
-sx q0[377];
-rz(pi/2) q0[377];
-cx q0[180],q0[377];
-rz(-pi/4) q0[377];
-cx q0[0],q0[377];
-rz(pi/4) q0[377];
-cx q0[180],q0[377];
-rz(pi/4) q0[180];
-rz(-pi/4) q0[377];
-cx q0[0],q0[377];
-cx q0[0],q0[180];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[180];
-cx q0[0],q0[180];
-rz(3*pi/4) q0[377];
-sx q0[377];
-rz(pi/2) q0[377];
-cx q0[377],q0[180];
-sx q0[378];
-sx q0[379];
-rz(0.89878615) q0[379];
-cx q0[378],q0[379];
-rz(2.0054963) q0[379];
-cx q0[378],q0[379];
-rz(-pi) q0[378];
-sx q0[378];
-rz(-pi) q0[378];
-rz(-1.6208836) q0[379];
-sx q0[379];
-rz(-pi) q0[379];
-cx q0[378],q0[379];
-sx q0[379];
-rz(1.6208836) q0[379];
-sx q0[379];
-rz(-pi) q0[379];
-cx q0[378],q0[379];
-cx q0[378],q0[181];
-rz(pi/2) q0[378];
-sx q0[378];
-rz(pi/2) q0[378];
-cx q0[181],q0[378];
-rz(-pi/4) q0[378];
-cx q0[0],q0[378];
-rz(pi/4) q0[378];
-cx q0[181],q0[378];
-rz(pi/4) q0[181];
-rz(-pi/4) q0[378];
-cx q0[0],q0[378];
-cx q0[0],q0[181];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[181];
-cx q0[0],q0[181];
-rz(3*pi/4) q0[378];
-sx q0[378];
-rz(pi/2) q0[378];
-cx q0[378],q0[181];
-sx q0[379];
-sx q0[380];
-rz(2.9323285) q0[380];
-cx q0[379],q0[380];
-rz(2.7787743) q0[380];
-cx q0[379],q0[380];
-rz(-pi) q0[379];
-sx q0[379];
-rz(-pi) q0[379];
-rz(-2.0421129) q0[380];
-sx q0[380];
-rz(-pi) q0[380];
-cx q0[379],q0[380];
-sx q0[380];
-rz(2.0421129) q0[380];
-sx q0[380];
-rz(-pi) q0[380];
-cx q0[379],q0[380];
-cx q0[379],q0[182];
-rz(pi/2) q0[379];
-sx q0[379];
-rz(pi/2) q0[379];
-cx q0[182],q0[379];
-rz(-pi/4) q0[379];
-cx q0[0],q0[379];
-rz(pi/4) q0[379];
-cx q0[182],q0[379];
-rz(pi/4) q0[182];
-rz(-pi/4) q0[379];
-cx q0[0],q0[379];
-cx q0[0],q0[182];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[182];
-cx q0[0],q0[182];
-rz(3*pi/4) q0[379];
-sx q0[379];
-rz(pi/2) q0[379];
-cx q0[379],q0[182];
-sx q0[380];
-sx q0[381];
-rz(1.6875793) q0[381];
-cx q0[380],q0[381];
-rz(1.9924883) q0[381];
-cx q0[380],q0[381];
-rz(-pi) q0[380];
-sx q0[380];
-rz(-pi) q0[380];
-rz(-3.1015862) q0[381];
-sx q0[381];
-rz(-pi) q0[381];
-cx q0[380],q0[381];
-sx q0[381];
-rz(3.1015862) q0[381];
-sx q0[381];
-rz(-pi) q0[381];
-cx q0[380],q0[381];
-cx q0[380],q0[183];
-rz(pi/2) q0[380];
-sx q0[380];
-rz(pi/2) q0[380];
-cx q0[183],q0[380];
-rz(-pi/4) q0[380];
-cx q0[0],q0[380];
-rz(pi/4) q0[380];
-cx q0[183],q0[380];
-rz(pi/4) q0[183];
-rz(-pi/4) q0[380];
-cx q0[0],q0[380];
-cx q0[0],q0[183];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[183];
-cx q0[0],q0[183];
-rz(3*pi/4) q0[380];
-sx q0[380];
-rz(pi/2) q0[380];
-cx q0[380],q0[183];
-sx q0[381];
-sx q0[382];
-rz(1.9746192) q0[382];
-cx q0[381],q0[382];
-rz(1.1425212) q0[382];
-cx q0[381],q0[382];
-rz(-pi) q0[381];
-sx q0[381];
-rz(-pi) q0[381];
-rz(-1.9136362) q0[382];
-sx q0[382];
-rz(-pi) q0[382];
-cx q0[381],q0[382];
-sx q0[382];
-rz(1.9136362) q0[382];
-sx q0[382];
-rz(-pi) q0[382];
-cx q0[381],q0[382];
-cx q0[381],q0[184];
-rz(pi/2) q0[381];
-sx q0[381];
-rz(pi/2) q0[381];
-cx q0[184],q0[381];
-rz(-pi/4) q0[381];
-cx q0[0],q0[381];
-rz(pi/4) q0[381];
-cx q0[184],q0[381];
-rz(pi/4) q0[184];
-rz(-pi/4) q0[381];
-cx q0[0],q0[381];
-cx q0[0],q0[184];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[184];
-cx q0[0],q0[184];
-rz(3*pi/4) q0[381];
-sx q0[381];
-rz(pi/2) q0[381];
-cx q0[381],q0[184];
-sx q0[382];
-sx q0[383];
-rz(0.96030406) q0[383];
-cx q0[382],q0[383];
-rz(2.9304298) q0[383];
-cx q0[382],q0[383];
-rz(-pi) q0[382];
-sx q0[382];
-rz(-pi) q0[382];
-rz(-2.158363) q0[383];
-sx q0[383];
-rz(-pi) q0[383];
-cx q0[382],q0[383];
-sx q0[383];
-rz(2.158363) q0[383];
-sx q0[383];
-rz(-pi) q0[383];
-cx q0[382],q0[383];
-cx q0[382],q0[185];
-rz(pi/2) q0[382];
-sx q0[382];
-rz(pi/2) q0[382];
-cx q0[185],q0[382];
-rz(-pi/4) q0[382];
-cx q0[0],q0[382];
-rz(pi/4) q0[382];
-cx q0[185],q0[382];
-rz(pi/4) q0[185];
-rz(-pi/4) q0[382];
-cx q0[0],q0[382];
-cx q0[0],q0[185];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[185];
-cx q0[0],q0[185];
-rz(3*pi/4) q0[382];
-sx q0[382];
-rz(pi/2) q0[382];
-cx q0[382],q0[185];
-sx q0[383];
-sx q0[384];
-rz(2.7785155) q0[384];
-cx q0[383],q0[384];
-rz(1.8963799) q0[384];
-cx q0[383],q0[384];
-rz(-pi) q0[383];
-sx q0[383];
-rz(-pi) q0[383];
-rz(-1.7014355) q0[384];
-sx q0[384];
-rz(-pi) q0[384];
-cx q0[383],q0[384];
-sx q0[384];
-rz(1.7014355) q0[384];
-sx q0[384];
-rz(-pi) q0[384];
-cx q0[383],q0[384];
-cx q0[383],q0[186];
-rz(pi/2) q0[383];
-sx q0[383];
-rz(pi/2) q0[383];
-cx q0[186],q0[383];
-rz(-pi/4) q0[383];
-cx q0[0],q0[383];
-rz(pi/4) q0[383];
-cx q0[186],q0[383];
-rz(pi/4) q0[186];
-rz(-pi/4) q0[383];
-cx q0[0],q0[383];
-cx q0[0],q0[186];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[186];
-cx q0[0],q0[186];
-rz(3*pi/4) q0[383];
-sx q0[383];
-rz(pi/2) q0[383];
-cx q0[383],q0[186];
-sx q0[384];
-sx q0[385];
-rz(1.2278955) q0[385];
-cx q0[384],q0[385];
-rz(1.2900985) q0[385];
-cx q0[384],q0[385];
-rz(-pi) q0[384];
-sx q0[384];
-rz(-pi) q0[384];
-rz(-1.7077139) q0[385];
-sx q0[385];
-rz(-pi) q0[385];
-cx q0[384],q0[385];
-sx q0[385];
-rz(1.7077139) q0[385];
-sx q0[385];
-rz(-pi) q0[385];
-cx q0[384],q0[385];
-cx q0[384],q0[187];
-rz(pi/2) q0[384];
-sx q0[384];
-rz(pi/2) q0[384];
-cx q0[187],q0[384];
-rz(-pi/4) q0[384];
-cx q0[0],q0[384];
-rz(pi/4) q0[384];
-cx q0[187],q0[384];
-rz(pi/4) q0[187];
-rz(-pi/4) q0[384];
-cx q0[0],q0[384];
-cx q0[0],q0[187];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[187];
-cx q0[0],q0[187];
-rz(3*pi/4) q0[384];
-sx q0[384];
-rz(pi/2) q0[384];
-cx q0[384],q0[187];
-sx q0[385];
-sx q0[386];
-rz(1.9851611) q0[386];
-cx q0[385],q0[386];
-rz(1.897802) q0[386];
-cx q0[385],q0[386];
-rz(-pi) q0[385];
-sx q0[385];
-rz(-pi) q0[385];
-rz(-1.586193) q0[386];
-sx q0[386];
-rz(-pi) q0[386];
-cx q0[385],q0[386];
-sx q0[386];
-rz(1.586193) q0[386];
-sx q0[386];
-rz(-pi) q0[386];
-cx q0[385],q0[386];
-cx q0[385],q0[188];
-rz(pi/2) q0[385];
-sx q0[385];
-rz(pi/2) q0[385];
-cx q0[188],q0[385];
-rz(-pi/4) q0[385];
-cx q0[0],q0[385];
-rz(pi/4) q0[385];
-cx q0[188],q0[385];
-rz(pi/4) q0[188];
-rz(-pi/4) q0[385];
-cx q0[0],q0[385];
-cx q0[0],q0[188];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[188];
-cx q0[0],q0[188];
-rz(3*pi/4) q0[385];
-sx q0[385];
-rz(pi/2) q0[385];
-cx q0[385],q0[188];
-sx q0[386];
-sx q0[387];
-rz(1.796031) q0[387];
-cx q0[386],q0[387];
-rz(2.3851696) q0[387];
-cx q0[386],q0[387];
-rz(-pi) q0[386];
-sx q0[386];
-rz(-pi) q0[386];
-rz(-1.6587118) q0[387];
-sx q0[387];
-rz(-pi) q0[387];
-cx q0[386],q0[387];
-sx q0[387];
-rz(1.6587118) q0[387];
-sx q0[387];
-rz(-pi) q0[387];
-cx q0[386],q0[387];
-cx q0[386],q0[189];
-rz(pi/2) q0[386];
-sx q0[386];
-rz(pi/2) q0[386];
-cx q0[189],q0[386];
-rz(-pi/4) q0[386];
-cx q0[0],q0[386];
-rz(pi/4) q0[386];
-cx q0[189],q0[386];
-rz(pi/4) q0[189];
-rz(-pi/4) q0[386];
-cx q0[0],q0[386];
-cx q0[0],q0[189];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[189];
-cx q0[0],q0[189];
-rz(3*pi/4) q0[386];
-sx q0[386];
-rz(pi/2) q0[386];
-cx q0[386],q0[189];
-sx q0[387];
-sx q0[388];
-rz(0.92199269) q0[388];
-cx q0[387],q0[388];
-rz(1.5462128) q0[388];
-cx q0[387],q0[388];
-rz(-pi) q0[387];
-sx q0[387];
-rz(-pi) q0[387];
-rz(-2.1987847) q0[388];
-sx q0[388];
-rz(-pi) q0[388];
-cx q0[387],q0[388];
-sx q0[388];
-rz(2.1987847) q0[388];
-sx q0[388];
-rz(-pi) q0[388];
-cx q0[387],q0[388];
-cx q0[387],q0[190];
-rz(pi/2) q0[387];
-sx q0[387];
-rz(pi/2) q0[387];
-cx q0[190],q0[387];
-rz(-pi/4) q0[387];
-cx q0[0],q0[387];
-rz(pi/4) q0[387];
-cx q0[190],q0[387];
-rz(pi/4) q0[190];
-rz(-pi/4) q0[387];
-cx q0[0],q0[387];
-cx q0[0],q0[190];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[190];
-cx q0[0],q0[190];
-rz(3*pi/4) q0[387];
-sx q0[387];
-rz(pi/2) q0[387];
-cx q0[387],q0[190];
-sx q0[388];
-sx q0[389];
-rz(2.2646556) q0[389];
-cx q0[388],q0[389];
-rz(2.0107137) q0[389];
-cx q0[388],q0[389];
-rz(-pi) q0[388];
-sx q0[388];
-rz(-pi) q0[388];
-rz(-2.6954505) q0[389];
-sx q0[389];
-rz(-pi) q0[389];
-cx q0[388],q0[389];
-sx q0[389];
-rz(2.6954505) q0[389];
-sx q0[389];
-rz(-pi) q0[389];
-cx q0[388],q0[389];
-cx q0[388],q0[191];
-rz(pi/2) q0[388];
-sx q0[388];
-rz(pi/2) q0[388];
-cx q0[191],q0[388];
-rz(-pi/4) q0[388];
-cx q0[0],q0[388];
-rz(pi/4) q0[388];
-cx q0[191],q0[388];
-rz(pi/4) q0[191];
-rz(-pi/4) q0[388];
-cx q0[0],q0[388];
-cx q0[0],q0[191];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[191];
-cx q0[0],q0[191];
-rz(3*pi/4) q0[388];
-sx q0[388];
-rz(pi/2) q0[388];
-cx q0[388],q0[191];
-sx q0[389];
-sx q0[390];
-rz(2.0936626) q0[390];
-cx q0[389],q0[390];
-rz(2.7828087) q0[390];
-cx q0[389],q0[390];
-rz(-pi) q0[389];
-sx q0[389];
-rz(-pi) q0[389];
-rz(-2.9493053) q0[390];
-sx q0[390];
-rz(-pi) q0[390];
-cx q0[389],q0[390];
-sx q0[390];
-rz(2.9493053) q0[390];
-sx q0[390];
-rz(-pi) q0[390];
-cx q0[389],q0[390];
-cx q0[389],q0[192];
-rz(pi/2) q0[389];
-sx q0[389];
-rz(pi/2) q0[389];
-cx q0[192],q0[389];
-rz(-pi/4) q0[389];
-cx q0[0],q0[389];
-rz(pi/4) q0[389];
-cx q0[192],q0[389];
-rz(pi/4) q0[192];
-rz(-pi/4) q0[389];
-cx q0[0],q0[389];
-cx q0[0],q0[192];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[192];
-cx q0[0],q0[192];
-rz(3*pi/4) q0[389];
-sx q0[389];
-rz(pi/2) q0[389];
-cx q0[389],q0[192];
-sx q0[390];
-sx q0[391];
-rz(2.3324373) q0[391];
-cx q0[390],q0[391];
-rz(1.3099802) q0[391];
-cx q0[390],q0[391];
-rz(-pi) q0[390];
-sx q0[390];
-rz(-pi) q0[390];
-rz(-2.555497) q0[391];
-sx q0[391];
-rz(-pi) q0[391];
-cx q0[390],q0[391];
-sx q0[391];
-rz(2.555497) q0[391];
-sx q0[391];
-rz(-pi) q0[391];
-cx q0[390],q0[391];
-cx q0[390],q0[193];
-rz(pi/2) q0[390];
-sx q0[390];
-rz(pi/2) q0[390];
-cx q0[193],q0[390];
-rz(-pi/4) q0[390];
-cx q0[0],q0[390];
-rz(pi/4) q0[390];
-cx q0[193],q0[390];
-rz(pi/4) q0[193];
-rz(-pi/4) q0[390];
-cx q0[0],q0[390];
-cx q0[0],q0[193];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[193];
-cx q0[0],q0[193];
-rz(3*pi/4) q0[390];
-sx q0[390];
-rz(pi/2) q0[390];
-cx q0[390],q0[193];
-sx q0[391];
-sx q0[392];
-rz(1.1316594) q0[392];
-cx q0[391],q0[392];
-rz(1.5432147) q0[392];
-cx q0[391],q0[392];
-rz(-pi) q0[391];
-sx q0[391];
-rz(-pi) q0[391];
-rz(-2.8976346) q0[392];
-sx q0[392];
-rz(-pi) q0[392];
-cx q0[391],q0[392];
-sx q0[392];
-rz(2.8976346) q0[392];
-sx q0[392];
-rz(-pi) q0[392];
-cx q0[391],q0[392];
-cx q0[391],q0[194];
-rz(pi/2) q0[391];
-sx q0[391];
-rz(pi/2) q0[391];
-cx q0[194],q0[391];
-rz(-pi/4) q0[391];
-cx q0[0],q0[391];
-rz(pi/4) q0[391];
-cx q0[194],q0[391];
-rz(pi/4) q0[194];
-rz(-pi/4) q0[391];
-cx q0[0],q0[391];
-cx q0[0],q0[194];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[194];
-cx q0[0],q0[194];
-rz(3*pi/4) q0[391];
-sx q0[391];
-rz(pi/2) q0[391];
-cx q0[391],q0[194];
-sx q0[392];
-sx q0[393];
-rz(1.9053016) q0[393];
-cx q0[392],q0[393];
-rz(1.2578602) q0[393];
-cx q0[392],q0[393];
-rz(-pi) q0[392];
-sx q0[392];
-rz(-pi) q0[392];
-rz(-3.01213) q0[393];
-sx q0[393];
-rz(-pi) q0[393];
-cx q0[392],q0[393];
-sx q0[393];
-rz(3.01213) q0[393];
-sx q0[393];
-rz(-pi) q0[393];
-cx q0[392],q0[393];
-cx q0[392],q0[195];
-rz(pi/2) q0[392];
-sx q0[392];
-rz(pi/2) q0[392];
-cx q0[195],q0[392];
-rz(-pi/4) q0[392];
-cx q0[0],q0[392];
-rz(pi/4) q0[392];
-cx q0[195],q0[392];
-rz(pi/4) q0[195];
-rz(-pi/4) q0[392];
-cx q0[0],q0[392];
-cx q0[0],q0[195];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[195];
-cx q0[0],q0[195];
-rz(3*pi/4) q0[392];
-sx q0[392];
-rz(pi/2) q0[392];
-cx q0[392],q0[195];
-sx q0[393];
-sx q0[394];
-rz(1.6973157) q0[394];
-cx q0[393],q0[394];
-rz(1.5400429) q0[394];
-cx q0[393],q0[394];
-rz(-pi) q0[393];
-sx q0[393];
-rz(-pi) q0[393];
-rz(-2.6904854) q0[394];
-sx q0[394];
-rz(-pi) q0[394];
-cx q0[393],q0[394];
-sx q0[394];
-rz(2.6904854) q0[394];
-sx q0[394];
-rz(-pi) q0[394];
-cx q0[393],q0[394];
-cx q0[393],q0[196];
-rz(pi/2) q0[393];
-sx q0[393];
-rz(pi/2) q0[393];
-cx q0[196],q0[393];
-rz(-pi/4) q0[393];
-cx q0[0],q0[393];
-rz(pi/4) q0[393];
-cx q0[196],q0[393];
-rz(pi/4) q0[196];
-rz(-pi/4) q0[393];
-cx q0[0],q0[393];
-cx q0[0],q0[196];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[196];
-cx q0[0],q0[196];
-rz(3*pi/4) q0[393];
-sx q0[393];
-rz(pi/2) q0[393];
-cx q0[393],q0[196];
-cx q0[394],q0[197];
-rz(pi/2) q0[394];
-sx q0[394];
-rz(pi/2) q0[394];
-cx q0[197],q0[394];
-rz(-pi/4) q0[394];
-cx q0[0],q0[394];
-rz(pi/4) q0[394];
-cx q0[197],q0[394];
-rz(pi/4) q0[197];
-rz(-pi/4) q0[394];
-cx q0[0],q0[394];
-cx q0[0],q0[197];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[197];
-cx q0[0],q0[197];
-rz(pi/2) q0[0];
-sx q0[0];
-rz(pi/2) q0[0];
-rz(3*pi/4) q0[394];
-sx q0[394];
-rz(pi/2) q0[394];
-cx q0[394],q0[197];
-measure q0[198] -> c0[0];
-measure q0[199] -> c0[1];
-measure q0[200] -> c0[2];
-measure q0[201] -> c0[3];
-measure q0[202] -> c0[4];
-measure q0[203] -> c0[5];
-measure q0[204] -> c0[6];
-measure q0[205] -> c0[7];
-measure q0[206] -> c0[8];
-measure q0[207] -> c0[9];
-measure q0[208] -> c0[10];
-measure q0[209] -> c0[11];
-measure q0[210] -> c0[12];
-measure q0[211] -> c0[13];
-measure q0[212] -> c0[14];
-measure q0[213] -> c0[15];
-measure q0[214] -> c0[16];
-measure q0[215] -> c0[17];
-measure q0[216] -> c0[18];
-measure q0[217] -> c0[19];
-measure q0[218] -> c0[20];
-measure q0[219] -> c0[21];
-measure q0[220] -> c0[22];
-measure q0[221] -> c0[23];
-measure q0[222] -> c0[24];
-measure q0[223] -> c0[25];
-measure q0[224] -> c0[26];
-measure q0[225] -> c0[27];
-measure q0[226] -> c0[28];
-measure q0[227] -> c0[29];
-measure q0[228] -> c0[30];
-measure q0[229] -> c0[31];
-measure q0[230] -> c0[32];
-measure q0[231] -> c0[33];
-measure q0[232] -> c0[34];
-measure q0[233] -> c0[35];
-measure q0[234] -> c0[36];
-measure q0[235] -> c0[37];
-measure q0[236] -> c0[38];
-measure q0[237] -> c0[39];
-measure q0[238] -> c0[40];
-measure q0[239] -> c0[41];
-measure q0[240] -> c0[42];
-measure q0[241] -> c0[43];
-measure q0[242] -> c0[44];
-measure q0[243] -> c0[45];
-measure q0[244] -> c0[46];
-measure q0[245] -> c0[47];
-measure q0[246] -> c0[48];
-measure q0[247] -> c0[49];
-measure q0[248] -> c0[50];
-measure q0[249] -> c0[51];
-measure q0[250] -> c0[52];
-measure q0[251] -> c0[53];
-measure q0[252] -> c0[54];
-measure q0[253] -> c0[55];
-measure q0[254] -> c0[56];
-measure q0[255] -> c0[57];
-measure q0[256] -> c0[58];
-measure q0[257] -> c0[59];
-measure q0[258] -> c0[60];
-measure q0[259] -> c0[61];
-measure q0[260] -> c0[62];
-measure q0[261] -> c0[63];
-measure q0[262] -> c0[64];
-measure q0[263] -> c0[65];
-measure q0[264] -> c0[66];
-measure q0[265] -> c0[67];
-measure q0[266] -> c0[68];
-measure q0[267] -> c0[69];
-measure q0[268] -> c0[70];
-measure q0[269] -> c0[71];
-measure q0[270] -> c0[72];
-measure q0[271] -> c0[73];
-measure q0[272] -> c0[74];
-measure q0[273] -> c0[75];
-measure q0[274] -> c0[76];
-measure q0[275] -> c0[77];
-measure q0[276] -> c0[78];
-measure q0[277] -> c0[79];
-measure q0[278] -> c0[80];
-measure q0[279] -> c0[81];
-measure q0[280] -> c0[82];
-measure q0[281] -> c0[83];
-measure q0[282] -> c0[84];
-measure q0[283] -> c0[85];
-measure q0[284] -> c0[86];
-measure q0[285] -> c0[87];
-measure q0[286] -> c0[88];
-measure q0[287] -> c0[89];
-measure q0[288] -> c0[90];
-measure q0[289] -> c0[91];
-measure q0[290] -> c0[92];
-measure q0[291] -> c0[93];
-measure q0[292] -> c0[94];
-measure q0[293] -> c0[95];
-measure q0[294] -> c0[96];
-measure q0[295] -> c0[97];
-measure q0[296] -> c0[98];
-measure q0[297] -> c0[99];
-measure q0[298] -> c0[100];
-measure q0[299] -> c0[101];
-measure q0[300] -> c0[102];
-measure q0[301] -> c0[103];
-measure q0[302] -> c0[104];
-measure q0[303] -> c0[105];
-measure q0[304] -> c0[106];
-measure q0[305] -> c0[107];
-measure q0[306] -> c0[108];
-measure q0[307] -> c0[109];
-measure q0[308] -> c0[110];
-measure q0[309] -> c0[111];
-measure q0[310] -> c0[112];
-measure q0[311] -> c0[113];
-measure q0[312] -> c0[114];
-measure q0[313] -> c0[115];
-measure q0[314] -> c0[116];
-measure q0[315] -> c0[117];
-measure q0[316] -> c0[118];
-measure q0[317] -> c0[119];
-measure q0[318] -> c0[120];
-measure q0[319] -> c0[121];
-measure q0[320] -> c0[122];
-measure q0[321] -> c0[123];
-measure q0[322] -> c0[124];
-measure q0[323] -> c0[125];
-measure q0[324] -> c0[126];
-measure q0[325] -> c0[127];
-measure q0[326] -> c0[128];
-measure q0[327] -> c0[129];
-measure q0[328] -> c0[130];
-measure q0[329] -> c0[131];
-measure q0[330] -> c0[132];
-measure q0[331] -> c0[133];
-measure q0[332] -> c0[134];
-measure q0[333] -> c0[135];
-measure q0[334] -> c0[136];
-measure q0[335] -> c0[137];
-measure q0[336] -> c0[138];
-measure q0[337] -> c0[139];
-measure q0[338] -> c0[140];
-measure q0[339] -> c0[141];
-measure q0[340] -> c0[142];
-measure q0[341] -> c0[143];
-measure q0[342] -> c0[144];
-measure q0[343] -> c0[145];
-measure q0[344] -> c0[146];
-measure q0[345] -> c0[147];
-measure q0[346] -> c0[148];
-measure q0[347] -> c0[149];
-measure q0[348] -> c0[150];
-measure q0[349] -> c0[151];
-measure q0[350] -> c0[152];
-measure q0[351] -> c0[153];
-measure q0[352] -> c0[154];
-measure q0[353] -> c0[155];
-measure q0[354] -> c0[156];
-measure q0[355] -> c0[157];
-measure q0[356] -> c0[158];
-measure q0[357] -> c0[159];
-measure q0[358] -> c0[160];
-measure q0[359] -> c0[161];
-measure q0[360] -> c0[162];
-measure q0[361] -> c0[163];
-measure q0[362] -> c0[164];
-measure q0[363] -> c0[165];
-measure q0[364] -> c0[166];
-measure q0[365] -> c0[167];
-measure q0[366] -> c0[168];
-measure q0[367] -> c0[169];
-measure q0[368] -> c0[170];
-measure q0[369] -> c0[171];
-measure q0[370] -> c0[172];
-measure q0[371] -> c0[173];
-measure q0[372] -> c0[174];
-measure q0[373] -> c0[175];
-measure q0[374] -> c0[176];
-measure q0[375] -> c0[177];
-measure q0[376] -> c0[178];
-measure q0[377] -> c0[179];
-measure q0[378] -> c0[180];
-measure q0[379] -> c0[181];
-measure q0[380] -> c0[182];
-measure q0[381] -> c0[183];
-measure q0[382] -> c0[184];
-measure q0[383] -> c0[185];
-measure q0[384] -> c0[186];
-measure q0[385] -> c0[187];
-measure q0[386] -> c0[188];
-measure q0[387] -> c0[189];
-measure q0[388] -> c0[190];
-measure q0[389] -> c0[191];
-measure q0[390] -> c0[192];
-measure q0[391] -> c0[193];
-measure q0[392] -> c0[194];
-measure q0[393] -> c0[195];
-measure q0[394] -> c0[196];
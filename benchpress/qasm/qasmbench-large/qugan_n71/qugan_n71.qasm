@@ -1,969 +0,0 @@
-OPENQASM 2.0;
-include "qelib1.inc";
-gate cry(lambda) a,b
-{
-  ry(lambda/2) b;
-  cx a,b;
-  ry(-lambda/2) b;
-  cx a,b;
-}
-gate ryy(param0) q0,q1
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(0.37801308) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140559802116176(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(0.60315936) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140559802116224(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(1.5685545) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140559802116416(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(2.2262939) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140559802116560(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(0.9777365) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140559802116704(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(2.965619) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140559802116848(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(3.0684385) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140559802116992(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(3.1344834) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140559802117136(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(2.6383543) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140559802117280(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(1.9298847) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140559802117424(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(1.9480977) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140559802117568(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(1.4842395) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140559802117712(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(2.0591632) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140559802117856(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(2.3664484) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140559802118000(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(1.5927152) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140559802142784(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(2.8257534) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140559802142928(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(1.766115) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140559802143072(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(2.6190469) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140559802143216(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(1.2667484) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140559802143360(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(2.1537013) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140559802143504(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(1.9804998) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140559802143648(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(1.8640001) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140559802143792(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(1.0648088) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140559802143936(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(1.2105711) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140559802144080(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(0.45624656) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140559802144224(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(2.9246279) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140559802144368(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(1.2560414) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140559802144512(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(2.4598683) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140559802144656(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(2.7153963) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140559802144800(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(2.2515577) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140559802144944(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(2.9885346) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140559802145088(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(1.2390958) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140559802145232(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(1.3476186) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140559802145376(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(2.3855581) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140559802145520(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(0.28394792) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140559802145664(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(2.3964043) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140559802145808(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(0.069203563) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140559802145952(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(2.9295707) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140559802146096(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(1.1835645) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140559802146240(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(1.7346777) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140559802146384(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(2.2026393) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140559802146528(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(2.7884327) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140559802146672(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(0.43692005) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140559802179648(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(2.203985) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140559802179792(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(0.23169498) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140559802179936(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(1.2748688) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140559802180080(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(0.26726754) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140559802180224(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(0.22853502) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140559802180368(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(0.29843777) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140559802180512(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(0.70597603) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140559802180656(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(3.119782) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140559802180800(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(1.9957659) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140559802180944(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(1.0076265) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140559802181088(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(0.30244669) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140559802181232(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(1.5078537) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140559802181376(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(1.9738488) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140559802181520(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(2.6776606) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140559802181664(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(2.2955856) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140559802181808(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(0.75764322) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140559802181952(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(2.2263563) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140559802182096(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(2.6180636) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140559802182240(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(2.9746413) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140559802182384(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(0.64578417) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140559802182528(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(1.391042) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140559802182672(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(1.5090598) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140559802182816(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(0.36142268) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140559802182960(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(2.6525633) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-gate ryy_140559802183104(param0) q0,q1 
-{
- rx(pi/2) q0;
- rx(pi/2) q1;
- cx q0,q1;
- rz(1.987401) q1;
- cx q0,q1;
- rx(-pi/2) q0;
- rx(-pi/2) q1;
- }
-qreg q0[71];
-creg c0[35];
-ry(2.8936041) q0[1];
-ry(0.92133168) q0[2];
-ry(1.5992548) q0[3];
-ry(0.57445231) q0[4];
-ry(0.66092628) q0[5];
-ry(1.3882666) q0[6];
-ry(2.2220818) q0[7];
-ry(1.6160803) q0[8];
-ry(0.051823999) q0[9];
-ry(1.7323988) q0[10];
-ry(1.5895333) q0[11];
-ry(3.0105009) q0[12];
-ry(0.73540902) q0[13];
-ry(0.59173927) q0[14];
-ry(2.8135405) q0[15];
-ry(2.549282) q0[16];
-ry(1.7207823) q0[17];
-ry(1.9661947) q0[18];
-ry(0.71755007) q0[19];
-ry(3.0663258) q0[20];
-ry(2.4747031) q0[21];
-ry(2.8505007) q0[22];
-ry(0.70665159) q0[23];
-ry(0.86425804) q0[24];
-ry(0.6111809) q0[25];
-ry(3.0867277) q0[26];
-ry(0.68949391) q0[27];
-ry(0.52150999) q0[28];
-ry(3.108291) q0[29];
-ry(1.4822812) q0[30];
-ry(0.49437888) q0[31];
-ry(1.9991759) q0[32];
-ry(1.1005099) q0[33];
-ry(2.2615418) q0[34];
-ry(1.1335878) q0[35];
-ry(2.4612714) q0[36];
-ry(1.5892128) q0[37];
-ry(1.4274111) q0[38];
-ry(2.7560504) q0[39];
-ry(1.6110611) q0[40];
-ry(2.9099214) q0[41];
-ry(2.6088848) q0[42];
-ry(2.2626523) q0[43];
-ry(2.1297101) q0[44];
-ry(0.37794834) q0[45];
-ry(0.44494063) q0[46];
-ry(2.1976427) q0[47];
-ry(2.2214514) q0[48];
-ry(1.8789997) q0[49];
-ry(2.8315723) q0[50];
-ry(1.8937317) q0[51];
-ry(2.303765) q0[52];
-ry(1.3255635) q0[53];
-ry(0.069979459) q0[54];
-ry(2.274601) q0[55];
-ry(2.9932988) q0[56];
-ry(1.0154233) q0[57];
-ry(2.3320042) q0[58];
-ry(0.28822303) q0[59];
-ry(0.085633548) q0[60];
-ry(1.413769) q0[61];
-ry(0.78563886) q0[62];
-ry(1.6893952) q0[63];
-ry(0.70706204) q0[64];
-ry(0.13523078) q0[65];
-ry(2.9429546) q0[66];
-ry(3.1294093) q0[67];
-ry(1.0608749) q0[68];
-ry(2.131791) q0[69];
-ry(0.29306844) q0[70];
-ryy(0.37801308) q0[1],q0[2];
-cry(1.2182379) q0[1],q0[2];
-ryy_140559802116176(0.60315936) q0[2],q0[3];
-cry(0.19607509) q0[2],q0[3];
-ryy_140559802116224(1.5685545) q0[3],q0[4];
-cry(2.944679) q0[3],q0[4];
-ryy_140559802116416(2.2262939) q0[4],q0[5];
-cry(0.11756635) q0[4],q0[5];
-ryy_140559802116560(0.9777365) q0[5],q0[6];
-cry(1.8206338) q0[5],q0[6];
-ryy_140559802116704(2.965619) q0[6],q0[7];
-cry(2.7562907) q0[6],q0[7];
-ryy_140559802116848(3.0684385) q0[7],q0[8];
-cry(2.0178954) q0[7],q0[8];
-ryy_140559802116992(3.1344834) q0[8],q0[9];
-cry(2.4417164) q0[8],q0[9];
-ryy_140559802117136(2.6383543) q0[9],q0[10];
-cry(0.21101225) q0[9],q0[10];
-ryy_140559802117280(1.9298847) q0[10],q0[11];
-cry(0.44535202) q0[10],q0[11];
-ryy_140559802117424(1.9480977) q0[11],q0[12];
-cry(1.4911725) q0[11],q0[12];
-ryy_140559802117568(1.4842395) q0[12],q0[13];
-cry(0.32941664) q0[12],q0[13];
-ryy_140559802117712(2.0591632) q0[13],q0[14];
-cry(1.1284897) q0[13],q0[14];
-ryy_140559802117856(2.3664484) q0[14],q0[15];
-cry(1.4108146) q0[14],q0[15];
-ryy_140559802118000(1.5927152) q0[15],q0[16];
-cry(2.5873337) q0[15],q0[16];
-ryy_140559802142784(2.8257534) q0[16],q0[17];
-cry(1.3941592) q0[16],q0[17];
-ryy_140559802142928(1.766115) q0[17],q0[18];
-cry(1.0879473) q0[17],q0[18];
-ryy_140559802143072(2.6190469) q0[18],q0[19];
-cry(1.3203164) q0[18],q0[19];
-ryy_140559802143216(1.2667484) q0[19],q0[20];
-cry(2.4435558) q0[19],q0[20];
-ryy_140559802143360(2.1537013) q0[20],q0[21];
-cry(0.14172348) q0[20],q0[21];
-ryy_140559802143504(1.9804998) q0[21],q0[22];
-cry(0.36235547) q0[21],q0[22];
-ryy_140559802143648(1.8640001) q0[22],q0[23];
-cry(2.6250976) q0[22],q0[23];
-ryy_140559802143792(1.0648088) q0[23],q0[24];
-cry(1.1610721) q0[23],q0[24];
-ryy_140559802143936(1.2105711) q0[24],q0[25];
-cry(1.0665719) q0[24],q0[25];
-ryy_140559802144080(0.45624656) q0[25],q0[26];
-cry(1.0755865) q0[25],q0[26];
-ryy_140559802144224(2.9246279) q0[26],q0[27];
-cry(2.9064294) q0[26],q0[27];
-ryy_140559802144368(1.2560414) q0[27],q0[28];
-cry(0.71672131) q0[27],q0[28];
-ryy_140559802144512(2.4598683) q0[28],q0[29];
-cry(0.99432956) q0[28],q0[29];
-ryy_140559802144656(2.7153963) q0[29],q0[30];
-cry(3.1167097) q0[29],q0[30];
-ryy_140559802144800(2.2515577) q0[30],q0[31];
-cry(2.2466181) q0[30],q0[31];
-ryy_140559802144944(2.9885346) q0[31],q0[32];
-cry(1.8264136) q0[31],q0[32];
-ryy_140559802145088(1.2390958) q0[32],q0[33];
-cry(0.85981279) q0[32],q0[33];
-ryy_140559802145232(1.3476186) q0[33],q0[34];
-cry(2.7218569) q0[33],q0[34];
-ryy_140559802145376(2.3855581) q0[34],q0[35];
-cry(1.8607028) q0[34],q0[35];
-ryy_140559802145520(0.28394792) q0[36],q0[37];
-cry(1.2694266) q0[36],q0[37];
-ryy_140559802145664(2.3964043) q0[37],q0[38];
-cry(0.14742052) q0[37],q0[38];
-ryy_140559802145808(0.069203563) q0[38],q0[39];
-cry(0.53524866) q0[38],q0[39];
-ryy_140559802145952(2.9295707) q0[39],q0[40];
-cry(0.59414552) q0[39],q0[40];
-ryy_140559802146096(1.1835645) q0[40],q0[41];
-cry(1.0680439) q0[40],q0[41];
-ryy_140559802146240(1.7346777) q0[41],q0[42];
-cry(0.092834099) q0[41],q0[42];
-ryy_140559802146384(2.2026393) q0[42],q0[43];
-cry(1.3511534) q0[42],q0[43];
-ryy_140559802146528(2.7884327) q0[43],q0[44];
-cry(3.0616752) q0[43],q0[44];
-ryy_140559802146672(0.43692005) q0[44],q0[45];
-cry(0.17912182) q0[44],q0[45];
-ryy_140559802179648(2.203985) q0[45],q0[46];
-cry(0.4363465) q0[45],q0[46];
-ryy_140559802179792(0.23169498) q0[46],q0[47];
-cry(1.8093907) q0[46],q0[47];
-ryy_140559802179936(1.2748688) q0[47],q0[48];
-cry(2.7292841) q0[47],q0[48];
-ryy_140559802180080(0.26726754) q0[48],q0[49];
-cry(0.64389308) q0[48],q0[49];
-ryy_140559802180224(0.22853502) q0[49],q0[50];
-cry(2.4978263) q0[49],q0[50];
-ryy_140559802180368(0.29843777) q0[50],q0[51];
-cry(2.8875562) q0[50],q0[51];
-ryy_140559802180512(0.70597603) q0[51],q0[52];
-cry(2.1901336) q0[51],q0[52];
-ryy_140559802180656(3.119782) q0[52],q0[53];
-cry(0.9088523) q0[52],q0[53];
-ryy_140559802180800(1.9957659) q0[53],q0[54];
-cry(1.5415985) q0[53],q0[54];
-ryy_140559802180944(1.0076265) q0[54],q0[55];
-cry(1.6550717) q0[54],q0[55];
-ryy_140559802181088(0.30244669) q0[55],q0[56];
-cry(0.77031218) q0[55],q0[56];
-ryy_140559802181232(1.5078537) q0[56],q0[57];
-cry(2.9457423) q0[56],q0[57];
-ryy_140559802181376(1.9738488) q0[57],q0[58];
-cry(1.4411383) q0[57],q0[58];
-ryy_140559802181520(2.6776606) q0[58],q0[59];
-cry(0.41651774) q0[58],q0[59];
-ryy_140559802181664(2.2955856) q0[59],q0[60];
-cry(2.5566445) q0[59],q0[60];
-ryy_140559802181808(0.75764322) q0[60],q0[61];
-cry(0.035676774) q0[60],q0[61];
-ryy_140559802181952(2.2263563) q0[61],q0[62];
-cry(2.5942137) q0[61],q0[62];
-ryy_140559802182096(2.6180636) q0[62],q0[63];
-cry(1.1903191) q0[62],q0[63];
-ryy_140559802182240(2.9746413) q0[63],q0[64];
-cry(1.6153111) q0[63],q0[64];
-ryy_140559802182384(0.64578417) q0[64],q0[65];
-cry(1.1078309) q0[64],q0[65];
-ryy_140559802182528(1.391042) q0[65],q0[66];
-cry(2.1999866) q0[65],q0[66];
-ryy_140559802182672(1.5090598) q0[66],q0[67];
-cry(1.9032963) q0[66],q0[67];
-ryy_140559802182816(0.36142268) q0[67],q0[68];
-cry(2.6959329) q0[67],q0[68];
-ryy_140559802182960(2.6525633) q0[68],q0[69];
-cry(3.0189765) q0[68],q0[69];
-ryy_140559802183104(1.987401) q0[69],q0[70];
-cry(0.66519545) q0[69],q0[70];
-h q0[0];
-cswap q0[0],q0[1],q0[36];
-cswap q0[0],q0[2],q0[37];
-cswap q0[0],q0[3],q0[38];
-cswap q0[0],q0[4],q0[39];
-cswap q0[0],q0[5],q0[40];
-cswap q0[0],q0[6],q0[41];
-cswap q0[0],q0[7],q0[42];
-cswap q0[0],q0[8],q0[43];
-cswap q0[0],q0[9],q0[44];
-cswap q0[0],q0[10],q0[45];
-cswap q0[0],q0[11],q0[46];
-cswap q0[0],q0[12],q0[47];
-cswap q0[0],q0[13],q0[48];
-cswap q0[0],q0[14],q0[49];
-cswap q0[0],q0[15],q0[50];
-cswap q0[0],q0[16],q0[51];
-cswap q0[0],q0[17],q0[52];
-cswap q0[0],q0[18],q0[53];
-cswap q0[0],q0[19],q0[54];
-cswap q0[0],q0[20],q0[55];
-cswap q0[0],q0[21],q0[56];
-cswap q0[0],q0[22],q0[57];
-cswap q0[0],q0[23],q0[58];
-cswap q0[0],q0[24],q0[59];
-cswap q0[0],q0[25],q0[60];
-cswap q0[0],q0[26],q0[61];
-cswap q0[0],q0[27],q0[62];
-cswap q0[0],q0[28],q0[63];
-cswap q0[0],q0[29],q0[64];
-cswap q0[0],q0[30],q0[65];
-cswap q0[0],q0[31],q0[66];
-cswap q0[0],q0[32],q0[67];
-cswap q0[0],q0[33],q0[68];
-cswap q0[0],q0[34],q0[69];
-cswap q0[0],q0[35],q0[70];
-h q0[0];
-measure q0[36] -> c0[0];
-measure q0[37] -> c0[1];
-measure q0[38] -> c0[2];
-measure q0[39] -> c0[3];
-measure q0[40] -> c0[4];
-measure q0[41] -> c0[5];
-measure q0[42] -> c0[6];
-measure q0[43] -> c0[7];
-measure q0[44] -> c0[8];
-measure q0[45] -> c0[9];
-measure q0[46] -> c0[10];
-measure q0[47] -> c0[11];
-measure q0[48] -> c0[12];
-measure q0[49] -> c0[13];
-measure q0[50] -> c0[14];
-measure q0[51] -> c0[15];
-measure q0[52] -> c0[16];
-measure q0[53] -> c0[17];
-measure q0[54] -> c0[18];
-measure q0[55] -> c0[19];
-measure q0[56] -> c0[20];
-measure q0[57] -> c0[21];
-measure q0[58] -> c0[22];
-measure q0[59] -> c0[23];
-measure q0[60] -> c0[24];
-measure q0[61] -> c0[25];
-measure q0[62] -> c0[26];
-measure q0[63] -> c0[27];
-measure q0[64] -> c0[28];
-measure q0[65] -> c0[29];
-measure q0[66] -> c0[30];
-measure q0[67] -> c0[31];
-measure q0[68] -> c0[32];
-measure q0[69] -> c0[33];
-measure q0[70] -> c0[34];
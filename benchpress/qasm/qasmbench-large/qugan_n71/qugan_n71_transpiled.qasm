@@ -1,1971 +0,0 @@
-OPENQASM 2.0;
-include "qelib1.inc";
-qreg q0[71];
-creg c0[35];
-rz(pi/2) q0[0];
-sx q0[0];
-rz(pi/2) q0[0];
-sx q0[1];
-rz(2.8936041) q0[1];
-sx q0[2];
-rz(0.92133168) q0[2];
-cx q0[1],q0[2];
-rz(0.37801308) q0[2];
-cx q0[1],q0[2];
-rz(-pi) q0[1];
-sx q0[1];
-rz(-pi) q0[1];
-rz(-2.5324737) q0[2];
-sx q0[2];
-rz(-pi) q0[2];
-cx q0[1],q0[2];
-sx q0[2];
-rz(2.5324737) q0[2];
-sx q0[2];
-rz(-pi) q0[2];
-cx q0[1],q0[2];
-sx q0[2];
-sx q0[3];
-rz(1.5992548) q0[3];
-cx q0[2],q0[3];
-rz(0.60315936) q0[3];
-cx q0[2],q0[3];
-rz(-pi) q0[2];
-sx q0[2];
-rz(-pi) q0[2];
-rz(-3.0435551) q0[3];
-sx q0[3];
-rz(-pi) q0[3];
-cx q0[2],q0[3];
-sx q0[3];
-rz(3.0435551) q0[3];
-sx q0[3];
-rz(-pi) q0[3];
-cx q0[2],q0[3];
-sx q0[3];
-sx q0[4];
-rz(0.57445231) q0[4];
-cx q0[3],q0[4];
-rz(1.5685545) q0[4];
-cx q0[3],q0[4];
-rz(-pi) q0[3];
-sx q0[3];
-rz(-pi) q0[3];
-rz(-1.6692532) q0[4];
-sx q0[4];
-rz(-pi) q0[4];
-cx q0[3],q0[4];
-sx q0[4];
-rz(1.6692532) q0[4];
-sx q0[4];
-rz(-pi) q0[4];
-cx q0[3],q0[4];
-sx q0[4];
-sx q0[5];
-rz(0.66092628) q0[5];
-cx q0[4],q0[5];
-rz(2.2262939) q0[5];
-cx q0[4],q0[5];
-rz(-pi) q0[4];
-sx q0[4];
-rz(-pi) q0[4];
-rz(-3.0828095) q0[5];
-sx q0[5];
-rz(-pi) q0[5];
-cx q0[4],q0[5];
-sx q0[5];
-rz(3.0828095) q0[5];
-sx q0[5];
-rz(-pi) q0[5];
-cx q0[4],q0[5];
-sx q0[5];
-sx q0[6];
-rz(1.3882666) q0[6];
-cx q0[5],q0[6];
-rz(0.9777365) q0[6];
-cx q0[5],q0[6];
-rz(-pi) q0[5];
-sx q0[5];
-rz(-pi) q0[5];
-rz(-2.2312758) q0[6];
-sx q0[6];
-rz(-pi) q0[6];
-cx q0[5],q0[6];
-sx q0[6];
-rz(2.2312758) q0[6];
-sx q0[6];
-rz(-pi) q0[6];
-cx q0[5],q0[6];
-sx q0[6];
-sx q0[7];
-rz(2.2220818) q0[7];
-cx q0[6],q0[7];
-rz(2.965619) q0[7];
-cx q0[6],q0[7];
-rz(-pi) q0[6];
-sx q0[6];
-rz(-pi) q0[6];
-rz(-1.7634473) q0[7];
-sx q0[7];
-rz(-pi) q0[7];
-cx q0[6],q0[7];
-sx q0[7];
-rz(1.7634473) q0[7];
-sx q0[7];
-rz(-pi) q0[7];
-cx q0[6],q0[7];
-sx q0[7];
-sx q0[8];
-rz(1.6160803) q0[8];
-cx q0[7],q0[8];
-rz(3.0684385) q0[8];
-cx q0[7],q0[8];
-rz(-pi) q0[7];
-sx q0[7];
-rz(-pi) q0[7];
-rz(-2.132645) q0[8];
-sx q0[8];
-rz(-pi) q0[8];
-cx q0[7],q0[8];
-sx q0[8];
-rz(2.132645) q0[8];
-sx q0[8];
-rz(-pi) q0[8];
-cx q0[7],q0[8];
-sx q0[8];
-sx q0[9];
-rz(0.051823999) q0[9];
-cx q0[8],q0[9];
-rz(3.1344834) q0[9];
-cx q0[8],q0[9];
-rz(-pi) q0[8];
-sx q0[8];
-rz(-pi) q0[8];
-rz(-1.9207345) q0[9];
-sx q0[9];
-rz(-pi) q0[9];
-cx q0[8],q0[9];
-sx q0[9];
-rz(1.9207345) q0[9];
-sx q0[9];
-rz(-pi) q0[9];
-cx q0[8],q0[9];
-sx q0[9];
-sx q0[10];
-rz(1.7323988) q0[10];
-cx q0[9],q0[10];
-rz(2.6383543) q0[10];
-cx q0[9],q0[10];
-rz(-3.0360865) q0[10];
-sx q0[10];
-rz(-pi) q0[10];
-rz(-pi) q0[9];
-sx q0[9];
-rz(-pi) q0[9];
-cx q0[9],q0[10];
-sx q0[10];
-rz(3.0360865) q0[10];
-sx q0[10];
-rz(-pi) q0[10];
-cx q0[9],q0[10];
-sx q0[10];
-sx q0[11];
-rz(1.5895333) q0[11];
-cx q0[10],q0[11];
-rz(1.9298847) q0[11];
-cx q0[10],q0[11];
-rz(-pi) q0[10];
-sx q0[10];
-rz(-pi) q0[10];
-rz(-2.9189166) q0[11];
-sx q0[11];
-rz(-pi) q0[11];
-cx q0[10],q0[11];
-sx q0[11];
-rz(2.9189166) q0[11];
-sx q0[11];
-rz(-pi) q0[11];
-cx q0[10],q0[11];
-sx q0[11];
-sx q0[12];
-rz(3.0105009) q0[12];
-cx q0[11],q0[12];
-rz(1.9480977) q0[12];
-cx q0[11],q0[12];
-rz(-pi) q0[11];
-sx q0[11];
-rz(-pi) q0[11];
-rz(-2.3960064) q0[12];
-sx q0[12];
-rz(-pi) q0[12];
-cx q0[11],q0[12];
-sx q0[12];
-rz(2.3960064) q0[12];
-sx q0[12];
-rz(-pi) q0[12];
-cx q0[11],q0[12];
-sx q0[12];
-sx q0[13];
-rz(0.73540902) q0[13];
-cx q0[12],q0[13];
-rz(1.4842395) q0[13];
-cx q0[12],q0[13];
-rz(-pi) q0[12];
-sx q0[12];
-rz(-pi) q0[12];
-rz(-2.9768843) q0[13];
-sx q0[13];
-rz(-pi) q0[13];
-cx q0[12],q0[13];
-sx q0[13];
-rz(2.9768843) q0[13];
-sx q0[13];
-rz(-pi) q0[13];
-cx q0[12],q0[13];
-sx q0[13];
-sx q0[14];
-rz(0.59173927) q0[14];
-cx q0[13],q0[14];
-rz(2.0591632) q0[14];
-cx q0[13],q0[14];
-rz(-pi) q0[13];
-sx q0[13];
-rz(-pi) q0[13];
-rz(-2.5773478) q0[14];
-sx q0[14];
-rz(-pi) q0[14];
-cx q0[13],q0[14];
-sx q0[14];
-rz(2.5773478) q0[14];
-sx q0[14];
-rz(-pi) q0[14];
-cx q0[13],q0[14];
-sx q0[14];
-sx q0[15];
-rz(2.8135405) q0[15];
-cx q0[14],q0[15];
-rz(2.3664484) q0[15];
-cx q0[14],q0[15];
-rz(-pi) q0[14];
-sx q0[14];
-rz(-pi) q0[14];
-rz(-2.4361854) q0[15];
-sx q0[15];
-rz(-pi) q0[15];
-cx q0[14],q0[15];
-sx q0[15];
-rz(2.4361854) q0[15];
-sx q0[15];
-rz(-pi) q0[15];
-cx q0[14],q0[15];
-sx q0[15];
-sx q0[16];
-rz(2.549282) q0[16];
-cx q0[15],q0[16];
-rz(1.5927152) q0[16];
-cx q0[15],q0[16];
-rz(-pi) q0[15];
-sx q0[15];
-rz(-pi) q0[15];
-rz(-1.8479258) q0[16];
-sx q0[16];
-rz(-pi) q0[16];
-cx q0[15],q0[16];
-sx q0[16];
-rz(1.8479258) q0[16];
-sx q0[16];
-rz(-pi) q0[16];
-cx q0[15],q0[16];
-sx q0[16];
-sx q0[17];
-rz(1.7207823) q0[17];
-cx q0[16],q0[17];
-rz(2.8257534) q0[17];
-cx q0[16],q0[17];
-rz(-pi) q0[16];
-sx q0[16];
-rz(-pi) q0[16];
-rz(-2.4445131) q0[17];
-sx q0[17];
-rz(-pi) q0[17];
-cx q0[16],q0[17];
-sx q0[17];
-rz(2.4445131) q0[17];
-sx q0[17];
-rz(-pi) q0[17];
-cx q0[16],q0[17];
-sx q0[17];
-sx q0[18];
-rz(1.9661947) q0[18];
-cx q0[17],q0[18];
-rz(1.766115) q0[18];
-cx q0[17],q0[18];
-rz(-pi) q0[17];
-sx q0[17];
-rz(-pi) q0[17];
-rz(-2.597619) q0[18];
-sx q0[18];
-rz(-pi) q0[18];
-cx q0[17],q0[18];
-sx q0[18];
-rz(2.597619) q0[18];
-sx q0[18];
-rz(-pi) q0[18];
-cx q0[17],q0[18];
-sx q0[18];
-sx q0[19];
-rz(0.71755007) q0[19];
-cx q0[18],q0[19];
-rz(2.6190469) q0[19];
-cx q0[18],q0[19];
-rz(-pi) q0[18];
-sx q0[18];
-rz(-pi) q0[18];
-rz(-2.4814345) q0[19];
-sx q0[19];
-rz(-pi) q0[19];
-cx q0[18],q0[19];
-sx q0[19];
-rz(2.4814345) q0[19];
-sx q0[19];
-rz(-pi) q0[19];
-cx q0[18],q0[19];
-sx q0[19];
-sx q0[20];
-rz(3.0663258) q0[20];
-cx q0[19],q0[20];
-rz(1.2667484) q0[20];
-cx q0[19],q0[20];
-rz(-pi) q0[19];
-sx q0[19];
-rz(-pi) q0[19];
-rz(-1.9198148) q0[20];
-sx q0[20];
-rz(-pi) q0[20];
-cx q0[19],q0[20];
-sx q0[20];
-rz(1.9198148) q0[20];
-sx q0[20];
-rz(-pi) q0[20];
-cx q0[19],q0[20];
-sx q0[20];
-sx q0[21];
-rz(2.4747031) q0[21];
-cx q0[20],q0[21];
-rz(2.1537013) q0[21];
-cx q0[20],q0[21];
-rz(-pi) q0[20];
-sx q0[20];
-rz(-pi) q0[20];
-rz(-3.0707309) q0[21];
-sx q0[21];
-rz(-pi) q0[21];
-cx q0[20],q0[21];
-sx q0[21];
-rz(3.0707309) q0[21];
-sx q0[21];
-rz(-pi) q0[21];
-cx q0[20],q0[21];
-sx q0[21];
-sx q0[22];
-rz(2.8505007) q0[22];
-cx q0[21],q0[22];
-rz(1.9804998) q0[22];
-cx q0[21],q0[22];
-rz(-pi) q0[21];
-sx q0[21];
-rz(-pi) q0[21];
-rz(-2.9604149) q0[22];
-sx q0[22];
-rz(-pi) q0[22];
-cx q0[21],q0[22];
-sx q0[22];
-rz(2.9604149) q0[22];
-sx q0[22];
-rz(-pi) q0[22];
-cx q0[21],q0[22];
-sx q0[22];
-sx q0[23];
-rz(0.70665159) q0[23];
-cx q0[22],q0[23];
-rz(1.8640001) q0[23];
-cx q0[22],q0[23];
-rz(-pi) q0[22];
-sx q0[22];
-rz(-pi) q0[22];
-rz(-1.8290439) q0[23];
-sx q0[23];
-rz(-pi) q0[23];
-cx q0[22],q0[23];
-sx q0[23];
-rz(1.8290439) q0[23];
-sx q0[23];
-rz(-pi) q0[23];
-cx q0[22],q0[23];
-sx q0[23];
-sx q0[24];
-rz(0.86425804) q0[24];
-cx q0[23],q0[24];
-rz(1.0648088) q0[24];
-cx q0[23],q0[24];
-rz(-pi) q0[23];
-sx q0[23];
-rz(-pi) q0[23];
-rz(-2.5610566) q0[24];
-sx q0[24];
-rz(-pi) q0[24];
-cx q0[23],q0[24];
-sx q0[24];
-rz(2.5610566) q0[24];
-sx q0[24];
-rz(-pi) q0[24];
-cx q0[23],q0[24];
-sx q0[24];
-sx q0[25];
-rz(0.6111809) q0[25];
-cx q0[24],q0[25];
-rz(1.2105711) q0[25];
-cx q0[24],q0[25];
-rz(-pi) q0[24];
-sx q0[24];
-rz(-pi) q0[24];
-rz(-2.6083067) q0[25];
-sx q0[25];
-rz(-pi) q0[25];
-cx q0[24],q0[25];
-sx q0[25];
-rz(2.6083067) q0[25];
-sx q0[25];
-rz(-pi) q0[25];
-cx q0[24],q0[25];
-sx q0[25];
-sx q0[26];
-rz(3.0867277) q0[26];
-cx q0[25],q0[26];
-rz(0.45624656) q0[26];
-cx q0[25],q0[26];
-rz(-pi) q0[25];
-sx q0[25];
-rz(-pi) q0[25];
-rz(-2.6037994) q0[26];
-sx q0[26];
-rz(-pi) q0[26];
-cx q0[25],q0[26];
-sx q0[26];
-rz(2.6037994) q0[26];
-sx q0[26];
-rz(-pi) q0[26];
-cx q0[25],q0[26];
-sx q0[26];
-sx q0[27];
-rz(0.68949391) q0[27];
-cx q0[26],q0[27];
-rz(2.9246279) q0[27];
-cx q0[26],q0[27];
-rz(-pi) q0[26];
-sx q0[26];
-rz(-pi) q0[26];
-rz(-1.688378) q0[27];
-sx q0[27];
-rz(-pi) q0[27];
-cx q0[26],q0[27];
-sx q0[27];
-rz(1.688378) q0[27];
-sx q0[27];
-rz(-pi) q0[27];
-cx q0[26],q0[27];
-sx q0[27];
-sx q0[28];
-rz(0.52150999) q0[28];
-cx q0[27],q0[28];
-rz(1.2560414) q0[28];
-cx q0[27],q0[28];
-rz(-pi) q0[27];
-sx q0[27];
-rz(-pi) q0[27];
-rz(-2.783232) q0[28];
-sx q0[28];
-rz(-pi) q0[28];
-cx q0[27],q0[28];
-sx q0[28];
-rz(2.783232) q0[28];
-sx q0[28];
-rz(-pi) q0[28];
-cx q0[27],q0[28];
-sx q0[28];
-sx q0[29];
-rz(3.108291) q0[29];
-cx q0[28],q0[29];
-rz(2.4598683) q0[29];
-cx q0[28],q0[29];
-rz(-pi) q0[28];
-sx q0[28];
-rz(-pi) q0[28];
-rz(-2.6444279) q0[29];
-sx q0[29];
-rz(-pi) q0[29];
-cx q0[28],q0[29];
-sx q0[29];
-rz(2.6444279) q0[29];
-sx q0[29];
-rz(-pi) q0[29];
-cx q0[28],q0[29];
-sx q0[29];
-sx q0[30];
-rz(1.4822812) q0[30];
-cx q0[29],q0[30];
-rz(2.7153963) q0[30];
-cx q0[29],q0[30];
-rz(-pi) q0[29];
-sx q0[29];
-rz(-pi) q0[29];
-rz(-1.5832378) q0[30];
-sx q0[30];
-rz(-pi) q0[30];
-cx q0[29],q0[30];
-sx q0[30];
-rz(1.5832378) q0[30];
-sx q0[30];
-rz(-pi) q0[30];
-cx q0[29],q0[30];
-sx q0[30];
-sx q0[31];
-rz(0.49437888) q0[31];
-cx q0[30],q0[31];
-rz(2.2515577) q0[31];
-cx q0[30],q0[31];
-rz(-pi) q0[30];
-sx q0[30];
-rz(-pi) q0[30];
-rz(-2.0182836) q0[31];
-sx q0[31];
-rz(-pi) q0[31];
-cx q0[30],q0[31];
-sx q0[31];
-rz(2.0182836) q0[31];
-sx q0[31];
-rz(-pi) q0[31];
-cx q0[30],q0[31];
-sx q0[31];
-sx q0[32];
-rz(1.9991759) q0[32];
-cx q0[31],q0[32];
-rz(2.9885346) q0[32];
-cx q0[31],q0[32];
-rz(-pi) q0[31];
-sx q0[31];
-rz(-pi) q0[31];
-rz(-2.2283859) q0[32];
-sx q0[32];
-rz(-pi) q0[32];
-cx q0[31],q0[32];
-sx q0[32];
-rz(2.2283859) q0[32];
-sx q0[32];
-rz(-pi) q0[32];
-cx q0[31],q0[32];
-sx q0[32];
-sx q0[33];
-rz(1.1005099) q0[33];
-cx q0[32],q0[33];
-rz(1.2390958) q0[33];
-cx q0[32],q0[33];
-rz(-pi) q0[32];
-sx q0[32];
-rz(-pi) q0[32];
-rz(-2.7116863) q0[33];
-sx q0[33];
-rz(-pi) q0[33];
-cx q0[32],q0[33];
-sx q0[33];
-rz(2.7116863) q0[33];
-sx q0[33];
-rz(-pi) q0[33];
-cx q0[32],q0[33];
-sx q0[33];
-sx q0[34];
-rz(2.2615418) q0[34];
-cx q0[33],q0[34];
-rz(1.3476186) q0[34];
-cx q0[33],q0[34];
-rz(-pi) q0[33];
-sx q0[33];
-rz(-pi) q0[33];
-rz(-1.7806642) q0[34];
-sx q0[34];
-rz(-pi) q0[34];
-cx q0[33],q0[34];
-sx q0[34];
-rz(1.7806642) q0[34];
-sx q0[34];
-rz(-pi) q0[34];
-cx q0[33],q0[34];
-sx q0[34];
-sx q0[35];
-rz(1.1335878) q0[35];
-cx q0[34],q0[35];
-rz(2.3855581) q0[35];
-cx q0[34],q0[35];
-rz(-pi) q0[34];
-sx q0[34];
-rz(-pi) q0[34];
-rz(-2.2112413) q0[35];
-sx q0[35];
-rz(-pi) q0[35];
-cx q0[34],q0[35];
-sx q0[35];
-rz(2.2112413) q0[35];
-sx q0[35];
-rz(-pi) q0[35];
-cx q0[34],q0[35];
-sx q0[36];
-rz(2.4612714) q0[36];
-sx q0[37];
-rz(1.5892128) q0[37];
-cx q0[36],q0[37];
-rz(0.28394792) q0[37];
-cx q0[36],q0[37];
-rz(-pi) q0[36];
-sx q0[36];
-rz(-pi) q0[36];
-rz(-2.5068794) q0[37];
-sx q0[37];
-rz(-pi) q0[37];
-cx q0[36],q0[37];
-sx q0[37];
-rz(2.5068794) q0[37];
-sx q0[37];
-rz(-pi) q0[37];
-cx q0[36],q0[37];
-cx q0[36],q0[1];
-rz(pi/2) q0[36];
-sx q0[36];
-rz(pi/2) q0[36];
-cx q0[1],q0[36];
-rz(-pi/4) q0[36];
-cx q0[0],q0[36];
-rz(pi/4) q0[36];
-cx q0[1],q0[36];
-rz(pi/4) q0[1];
-rz(-pi/4) q0[36];
-cx q0[0],q0[36];
-cx q0[0],q0[1];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[1];
-cx q0[0],q0[1];
-rz(3*pi/4) q0[36];
-sx q0[36];
-rz(pi/2) q0[36];
-cx q0[36],q0[1];
-sx q0[37];
-sx q0[38];
-rz(1.4274111) q0[38];
-cx q0[37],q0[38];
-rz(2.3964043) q0[38];
-cx q0[37],q0[38];
-rz(-pi) q0[37];
-sx q0[37];
-rz(-pi) q0[37];
-rz(-3.0678824) q0[38];
-sx q0[38];
-rz(-pi) q0[38];
-cx q0[37],q0[38];
-sx q0[38];
-rz(3.0678824) q0[38];
-sx q0[38];
-rz(-pi) q0[38];
-cx q0[37],q0[38];
-cx q0[37],q0[2];
-rz(pi/2) q0[37];
-sx q0[37];
-rz(pi/2) q0[37];
-cx q0[2],q0[37];
-rz(-pi/4) q0[37];
-cx q0[0],q0[37];
-rz(pi/4) q0[37];
-cx q0[2],q0[37];
-rz(pi/4) q0[2];
-rz(-pi/4) q0[37];
-cx q0[0],q0[37];
-cx q0[0],q0[2];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[2];
-cx q0[0],q0[2];
-rz(3*pi/4) q0[37];
-sx q0[37];
-rz(pi/2) q0[37];
-cx q0[37],q0[2];
-sx q0[38];
-sx q0[39];
-rz(2.7560504) q0[39];
-cx q0[38],q0[39];
-rz(0.069203563) q0[39];
-cx q0[38],q0[39];
-rz(-pi) q0[38];
-sx q0[38];
-rz(-pi) q0[38];
-rz(-2.8739683) q0[39];
-sx q0[39];
-rz(-pi) q0[39];
-cx q0[38],q0[39];
-sx q0[39];
-rz(2.8739683) q0[39];
-sx q0[39];
-rz(-pi) q0[39];
-cx q0[38],q0[39];
-cx q0[38],q0[3];
-rz(pi/2) q0[38];
-sx q0[38];
-rz(pi/2) q0[38];
-cx q0[3],q0[38];
-rz(-pi/4) q0[38];
-cx q0[0],q0[38];
-rz(pi/4) q0[38];
-cx q0[3],q0[38];
-rz(pi/4) q0[3];
-rz(-pi/4) q0[38];
-cx q0[0],q0[38];
-cx q0[0],q0[3];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[3];
-cx q0[0],q0[3];
-rz(3*pi/4) q0[38];
-sx q0[38];
-rz(pi/2) q0[38];
-cx q0[38],q0[3];
-sx q0[39];
-sx q0[40];
-rz(1.6110611) q0[40];
-cx q0[39],q0[40];
-rz(2.9295707) q0[40];
-cx q0[39],q0[40];
-rz(-pi) q0[39];
-sx q0[39];
-rz(-pi) q0[39];
-rz(-2.8445199) q0[40];
-sx q0[40];
-rz(-pi) q0[40];
-cx q0[39],q0[40];
-sx q0[40];
-rz(2.8445199) q0[40];
-sx q0[40];
-rz(-pi) q0[40];
-cx q0[39],q0[40];
-cx q0[39],q0[4];
-rz(pi/2) q0[39];
-sx q0[39];
-rz(pi/2) q0[39];
-cx q0[4],q0[39];
-rz(-pi/4) q0[39];
-cx q0[0],q0[39];
-rz(pi/4) q0[39];
-cx q0[4],q0[39];
-rz(-pi/4) q0[39];
-cx q0[0],q0[39];
-rz(3*pi/4) q0[39];
-sx q0[39];
-rz(pi/2) q0[39];
-rz(pi/4) q0[4];
-cx q0[0],q0[4];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[4];
-cx q0[0],q0[4];
-cx q0[39],q0[4];
-sx q0[40];
-sx q0[41];
-rz(2.9099214) q0[41];
-cx q0[40],q0[41];
-rz(1.1835645) q0[41];
-cx q0[40],q0[41];
-rz(-pi) q0[40];
-sx q0[40];
-rz(-pi) q0[40];
-rz(-2.6075707) q0[41];
-sx q0[41];
-rz(-pi) q0[41];
-cx q0[40],q0[41];
-sx q0[41];
-rz(2.6075707) q0[41];
-sx q0[41];
-rz(-pi) q0[41];
-cx q0[40],q0[41];
-cx q0[40],q0[5];
-rz(pi/2) q0[40];
-sx q0[40];
-rz(pi/2) q0[40];
-sx q0[41];
-cx q0[5],q0[40];
-rz(-pi/4) q0[40];
-cx q0[0],q0[40];
-rz(pi/4) q0[40];
-cx q0[5],q0[40];
-rz(-pi/4) q0[40];
-cx q0[0],q0[40];
-rz(3*pi/4) q0[40];
-sx q0[40];
-rz(pi/2) q0[40];
-rz(pi/4) q0[5];
-cx q0[0],q0[5];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[5];
-cx q0[0],q0[5];
-cx q0[40],q0[5];
-sx q0[42];
-rz(2.6088848) q0[42];
-cx q0[41],q0[42];
-rz(1.7346777) q0[42];
-cx q0[41],q0[42];
-rz(-pi) q0[41];
-sx q0[41];
-rz(-pi) q0[41];
-rz(-3.0951756) q0[42];
-sx q0[42];
-rz(-pi) q0[42];
-cx q0[41],q0[42];
-sx q0[42];
-rz(3.0951756) q0[42];
-sx q0[42];
-rz(-pi) q0[42];
-cx q0[41],q0[42];
-cx q0[41],q0[6];
-rz(pi/2) q0[41];
-sx q0[41];
-rz(pi/2) q0[41];
-sx q0[42];
-cx q0[6],q0[41];
-rz(-pi/4) q0[41];
-cx q0[0],q0[41];
-rz(pi/4) q0[41];
-cx q0[6],q0[41];
-rz(-pi/4) q0[41];
-cx q0[0],q0[41];
-rz(3*pi/4) q0[41];
-sx q0[41];
-rz(pi/2) q0[41];
-rz(pi/4) q0[6];
-cx q0[0],q0[6];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[6];
-cx q0[0],q0[6];
-cx q0[41],q0[6];
-sx q0[43];
-rz(2.2626523) q0[43];
-cx q0[42],q0[43];
-rz(2.2026393) q0[43];
-cx q0[42],q0[43];
-rz(-pi) q0[42];
-sx q0[42];
-rz(-pi) q0[42];
-rz(-2.466016) q0[43];
-sx q0[43];
-rz(-pi) q0[43];
-cx q0[42],q0[43];
-sx q0[43];
-rz(2.466016) q0[43];
-sx q0[43];
-rz(-pi) q0[43];
-cx q0[42],q0[43];
-cx q0[42],q0[7];
-rz(pi/2) q0[42];
-sx q0[42];
-rz(pi/2) q0[42];
-sx q0[43];
-cx q0[7],q0[42];
-rz(-pi/4) q0[42];
-cx q0[0],q0[42];
-rz(pi/4) q0[42];
-cx q0[7],q0[42];
-rz(-pi/4) q0[42];
-cx q0[0],q0[42];
-rz(3*pi/4) q0[42];
-sx q0[42];
-rz(pi/2) q0[42];
-rz(pi/4) q0[7];
-cx q0[0],q0[7];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[7];
-cx q0[0],q0[7];
-cx q0[42],q0[7];
-sx q0[44];
-rz(2.1297101) q0[44];
-cx q0[43],q0[44];
-rz(2.7884327) q0[44];
-cx q0[43],q0[44];
-rz(-pi) q0[43];
-sx q0[43];
-rz(-pi) q0[43];
-rz(-1.6107551) q0[44];
-sx q0[44];
-rz(-pi) q0[44];
-cx q0[43],q0[44];
-sx q0[44];
-rz(1.6107551) q0[44];
-sx q0[44];
-rz(-pi) q0[44];
-cx q0[43],q0[44];
-cx q0[43],q0[8];
-rz(pi/2) q0[43];
-sx q0[43];
-rz(pi/2) q0[43];
-sx q0[44];
-cx q0[8],q0[43];
-rz(-pi/4) q0[43];
-cx q0[0],q0[43];
-rz(pi/4) q0[43];
-cx q0[8],q0[43];
-rz(-pi/4) q0[43];
-cx q0[0],q0[43];
-rz(3*pi/4) q0[43];
-sx q0[43];
-rz(pi/2) q0[43];
-rz(pi/4) q0[8];
-cx q0[0],q0[8];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[8];
-cx q0[0],q0[8];
-cx q0[43],q0[8];
-sx q0[45];
-rz(0.37794834) q0[45];
-cx q0[44],q0[45];
-rz(0.43692005) q0[45];
-cx q0[44],q0[45];
-rz(-pi) q0[44];
-sx q0[44];
-rz(-pi) q0[44];
-rz(-3.0520317) q0[45];
-sx q0[45];
-rz(-pi) q0[45];
-cx q0[44],q0[45];
-sx q0[45];
-rz(3.0520317) q0[45];
-sx q0[45];
-rz(-pi) q0[45];
-cx q0[44],q0[45];
-cx q0[44],q0[9];
-rz(pi/2) q0[44];
-sx q0[44];
-rz(pi/2) q0[44];
-sx q0[45];
-cx q0[9],q0[44];
-rz(-pi/4) q0[44];
-cx q0[0],q0[44];
-rz(pi/4) q0[44];
-cx q0[9],q0[44];
-rz(-pi/4) q0[44];
-cx q0[0],q0[44];
-rz(3*pi/4) q0[44];
-sx q0[44];
-rz(pi/2) q0[44];
-rz(pi/4) q0[9];
-cx q0[0],q0[9];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[9];
-cx q0[0],q0[9];
-cx q0[44],q0[9];
-sx q0[46];
-rz(0.44494063) q0[46];
-cx q0[45],q0[46];
-rz(2.203985) q0[46];
-cx q0[45],q0[46];
-rz(-pi) q0[45];
-sx q0[45];
-rz(-pi) q0[45];
-rz(-2.9234194) q0[46];
-sx q0[46];
-rz(-pi) q0[46];
-cx q0[45],q0[46];
-sx q0[46];
-rz(2.9234194) q0[46];
-sx q0[46];
-rz(-pi) q0[46];
-cx q0[45],q0[46];
-cx q0[45],q0[10];
-rz(pi/2) q0[45];
-sx q0[45];
-rz(pi/2) q0[45];
-cx q0[10],q0[45];
-rz(-pi/4) q0[45];
-cx q0[0],q0[45];
-rz(pi/4) q0[45];
-cx q0[10],q0[45];
-rz(pi/4) q0[10];
-rz(-pi/4) q0[45];
-cx q0[0],q0[45];
-cx q0[0],q0[10];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[10];
-cx q0[0],q0[10];
-rz(3*pi/4) q0[45];
-sx q0[45];
-rz(pi/2) q0[45];
-cx q0[45],q0[10];
-sx q0[46];
-sx q0[47];
-rz(2.1976427) q0[47];
-cx q0[46],q0[47];
-rz(0.23169498) q0[47];
-cx q0[46],q0[47];
-rz(-pi) q0[46];
-sx q0[46];
-rz(-pi) q0[46];
-rz(-2.2368973) q0[47];
-sx q0[47];
-rz(-pi) q0[47];
-cx q0[46],q0[47];
-sx q0[47];
-rz(2.2368973) q0[47];
-sx q0[47];
-rz(-pi) q0[47];
-cx q0[46],q0[47];
-cx q0[46],q0[11];
-rz(pi/2) q0[46];
-sx q0[46];
-rz(pi/2) q0[46];
-cx q0[11],q0[46];
-rz(-pi/4) q0[46];
-cx q0[0],q0[46];
-rz(pi/4) q0[46];
-cx q0[11],q0[46];
-rz(pi/4) q0[11];
-rz(-pi/4) q0[46];
-cx q0[0],q0[46];
-cx q0[0],q0[11];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[11];
-cx q0[0],q0[11];
-rz(3*pi/4) q0[46];
-sx q0[46];
-rz(pi/2) q0[46];
-cx q0[46],q0[11];
-sx q0[47];
-sx q0[48];
-rz(2.2214514) q0[48];
-cx q0[47],q0[48];
-rz(1.2748688) q0[48];
-cx q0[47],q0[48];
-rz(-pi) q0[47];
-sx q0[47];
-rz(-pi) q0[47];
-rz(-1.7769506) q0[48];
-sx q0[48];
-rz(-pi) q0[48];
-cx q0[47],q0[48];
-sx q0[48];
-rz(1.7769506) q0[48];
-sx q0[48];
-rz(-pi) q0[48];
-cx q0[47],q0[48];
-cx q0[47],q0[12];
-rz(pi/2) q0[47];
-sx q0[47];
-rz(pi/2) q0[47];
-cx q0[12],q0[47];
-rz(-pi/4) q0[47];
-cx q0[0],q0[47];
-rz(pi/4) q0[47];
-cx q0[12],q0[47];
-rz(pi/4) q0[12];
-rz(-pi/4) q0[47];
-cx q0[0],q0[47];
-cx q0[0],q0[12];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[12];
-cx q0[0],q0[12];
-rz(3*pi/4) q0[47];
-sx q0[47];
-rz(pi/2) q0[47];
-cx q0[47],q0[12];
-sx q0[48];
-sx q0[49];
-rz(1.8789997) q0[49];
-cx q0[48],q0[49];
-rz(0.26726754) q0[49];
-cx q0[48],q0[49];
-rz(-pi) q0[48];
-sx q0[48];
-rz(-pi) q0[48];
-rz(-2.8196461) q0[49];
-sx q0[49];
-rz(-pi) q0[49];
-cx q0[48],q0[49];
-sx q0[49];
-rz(2.8196461) q0[49];
-sx q0[49];
-rz(-pi) q0[49];
-cx q0[48],q0[49];
-cx q0[48],q0[13];
-rz(pi/2) q0[48];
-sx q0[48];
-rz(pi/2) q0[48];
-cx q0[13],q0[48];
-rz(-pi/4) q0[48];
-cx q0[0],q0[48];
-rz(pi/4) q0[48];
-cx q0[13],q0[48];
-rz(pi/4) q0[13];
-rz(-pi/4) q0[48];
-cx q0[0],q0[48];
-cx q0[0],q0[13];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[13];
-cx q0[0],q0[13];
-rz(3*pi/4) q0[48];
-sx q0[48];
-rz(pi/2) q0[48];
-cx q0[48],q0[13];
-sx q0[49];
-sx q0[50];
-rz(2.8315723) q0[50];
-cx q0[49],q0[50];
-rz(0.22853502) q0[50];
-cx q0[49],q0[50];
-rz(-pi) q0[49];
-sx q0[49];
-rz(-pi) q0[49];
-rz(-1.8926795) q0[50];
-sx q0[50];
-rz(-pi) q0[50];
-cx q0[49],q0[50];
-sx q0[50];
-rz(1.8926795) q0[50];
-sx q0[50];
-rz(-pi) q0[50];
-cx q0[49],q0[50];
-cx q0[49],q0[14];
-rz(pi/2) q0[49];
-sx q0[49];
-rz(pi/2) q0[49];
-cx q0[14],q0[49];
-rz(-pi/4) q0[49];
-cx q0[0],q0[49];
-rz(pi/4) q0[49];
-cx q0[14],q0[49];
-rz(pi/4) q0[14];
-rz(-pi/4) q0[49];
-cx q0[0],q0[49];
-cx q0[0],q0[14];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[14];
-cx q0[0],q0[14];
-rz(3*pi/4) q0[49];
-sx q0[49];
-rz(pi/2) q0[49];
-cx q0[49],q0[14];
-sx q0[50];
-sx q0[51];
-rz(1.8937317) q0[51];
-cx q0[50],q0[51];
-rz(0.29843777) q0[51];
-cx q0[50],q0[51];
-rz(-pi) q0[50];
-sx q0[50];
-rz(-pi) q0[50];
-rz(-1.6978146) q0[51];
-sx q0[51];
-rz(-pi) q0[51];
-cx q0[50],q0[51];
-sx q0[51];
-rz(1.6978146) q0[51];
-sx q0[51];
-rz(-pi) q0[51];
-cx q0[50],q0[51];
-cx q0[50],q0[15];
-rz(pi/2) q0[50];
-sx q0[50];
-rz(pi/2) q0[50];
-cx q0[15],q0[50];
-rz(-pi/4) q0[50];
-cx q0[0],q0[50];
-rz(pi/4) q0[50];
-cx q0[15],q0[50];
-rz(pi/4) q0[15];
-rz(-pi/4) q0[50];
-cx q0[0],q0[50];
-cx q0[0],q0[15];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[15];
-cx q0[0],q0[15];
-rz(3*pi/4) q0[50];
-sx q0[50];
-rz(pi/2) q0[50];
-cx q0[50],q0[15];
-sx q0[51];
-sx q0[52];
-rz(2.303765) q0[52];
-cx q0[51],q0[52];
-rz(0.70597603) q0[52];
-cx q0[51],q0[52];
-rz(-pi) q0[51];
-sx q0[51];
-rz(-pi) q0[51];
-rz(-2.0465259) q0[52];
-sx q0[52];
-rz(-pi) q0[52];
-cx q0[51],q0[52];
-sx q0[52];
-rz(2.0465259) q0[52];
-sx q0[52];
-rz(-pi) q0[52];
-cx q0[51],q0[52];
-cx q0[51],q0[16];
-rz(pi/2) q0[51];
-sx q0[51];
-rz(pi/2) q0[51];
-cx q0[16],q0[51];
-rz(-pi/4) q0[51];
-cx q0[0],q0[51];
-rz(pi/4) q0[51];
-cx q0[16],q0[51];
-rz(pi/4) q0[16];
-rz(-pi/4) q0[51];
-cx q0[0],q0[51];
-cx q0[0],q0[16];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[16];
-cx q0[0],q0[16];
-rz(3*pi/4) q0[51];
-sx q0[51];
-rz(pi/2) q0[51];
-cx q0[51],q0[16];
-sx q0[52];
-sx q0[53];
-rz(1.3255635) q0[53];
-cx q0[52],q0[53];
-rz(3.119782) q0[53];
-cx q0[52],q0[53];
-rz(-pi) q0[52];
-sx q0[52];
-rz(-pi) q0[52];
-rz(-2.6871665) q0[53];
-sx q0[53];
-rz(-pi) q0[53];
-cx q0[52],q0[53];
-sx q0[53];
-rz(2.6871665) q0[53];
-sx q0[53];
-rz(-pi) q0[53];
-cx q0[52],q0[53];
-cx q0[52],q0[17];
-rz(pi/2) q0[52];
-sx q0[52];
-rz(pi/2) q0[52];
-cx q0[17],q0[52];
-rz(-pi/4) q0[52];
-cx q0[0],q0[52];
-rz(pi/4) q0[52];
-cx q0[17],q0[52];
-rz(pi/4) q0[17];
-rz(-pi/4) q0[52];
-cx q0[0],q0[52];
-cx q0[0],q0[17];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[17];
-cx q0[0],q0[17];
-rz(3*pi/4) q0[52];
-sx q0[52];
-rz(pi/2) q0[52];
-cx q0[52],q0[17];
-sx q0[53];
-sx q0[54];
-rz(0.069979459) q0[54];
-cx q0[53],q0[54];
-rz(1.9957659) q0[54];
-cx q0[53],q0[54];
-rz(-pi) q0[53];
-sx q0[53];
-rz(-pi) q0[53];
-rz(-2.3707934) q0[54];
-sx q0[54];
-rz(-pi) q0[54];
-cx q0[53],q0[54];
-sx q0[54];
-rz(2.3707934) q0[54];
-sx q0[54];
-rz(-pi) q0[54];
-cx q0[53],q0[54];
-cx q0[53],q0[18];
-rz(pi/2) q0[53];
-sx q0[53];
-rz(pi/2) q0[53];
-cx q0[18],q0[53];
-rz(-pi/4) q0[53];
-cx q0[0],q0[53];
-rz(pi/4) q0[53];
-cx q0[18],q0[53];
-rz(pi/4) q0[18];
-rz(-pi/4) q0[53];
-cx q0[0],q0[53];
-cx q0[0],q0[18];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[18];
-cx q0[0],q0[18];
-rz(3*pi/4) q0[53];
-sx q0[53];
-rz(pi/2) q0[53];
-cx q0[53],q0[18];
-sx q0[54];
-sx q0[55];
-rz(2.274601) q0[55];
-cx q0[54],q0[55];
-rz(1.0076265) q0[55];
-cx q0[54],q0[55];
-rz(-pi) q0[54];
-sx q0[54];
-rz(-pi) q0[54];
-rz(-2.3140568) q0[55];
-sx q0[55];
-rz(-pi) q0[55];
-cx q0[54],q0[55];
-sx q0[55];
-rz(2.3140568) q0[55];
-sx q0[55];
-rz(-pi) q0[55];
-cx q0[54],q0[55];
-cx q0[54],q0[19];
-rz(pi/2) q0[54];
-sx q0[54];
-rz(pi/2) q0[54];
-cx q0[19],q0[54];
-rz(-pi/4) q0[54];
-cx q0[0],q0[54];
-rz(pi/4) q0[54];
-cx q0[19],q0[54];
-rz(pi/4) q0[19];
-rz(-pi/4) q0[54];
-cx q0[0],q0[54];
-cx q0[0],q0[19];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[19];
-cx q0[0],q0[19];
-rz(3*pi/4) q0[54];
-sx q0[54];
-rz(pi/2) q0[54];
-cx q0[54],q0[19];
-sx q0[55];
-sx q0[56];
-rz(2.9932988) q0[56];
-cx q0[55],q0[56];
-rz(0.30244669) q0[56];
-cx q0[55],q0[56];
-rz(-pi) q0[55];
-sx q0[55];
-rz(-pi) q0[55];
-rz(-2.7564366) q0[56];
-sx q0[56];
-rz(-pi) q0[56];
-cx q0[55],q0[56];
-sx q0[56];
-rz(2.7564366) q0[56];
-sx q0[56];
-rz(-pi) q0[56];
-cx q0[55],q0[56];
-cx q0[55],q0[20];
-rz(pi/2) q0[55];
-sx q0[55];
-rz(pi/2) q0[55];
-cx q0[20],q0[55];
-rz(-pi/4) q0[55];
-cx q0[0],q0[55];
-rz(pi/4) q0[55];
-cx q0[20],q0[55];
-rz(pi/4) q0[20];
-rz(-pi/4) q0[55];
-cx q0[0],q0[55];
-cx q0[0],q0[20];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[20];
-cx q0[0],q0[20];
-rz(3*pi/4) q0[55];
-sx q0[55];
-rz(pi/2) q0[55];
-cx q0[55],q0[20];
-sx q0[56];
-sx q0[57];
-rz(1.0154233) q0[57];
-cx q0[56],q0[57];
-rz(1.5078537) q0[57];
-cx q0[56],q0[57];
-rz(-pi) q0[56];
-sx q0[56];
-rz(-pi) q0[56];
-rz(-1.6687215) q0[57];
-sx q0[57];
-rz(-pi) q0[57];
-cx q0[56],q0[57];
-sx q0[57];
-rz(1.6687215) q0[57];
-sx q0[57];
-rz(-pi) q0[57];
-cx q0[56],q0[57];
-cx q0[56],q0[21];
-rz(pi/2) q0[56];
-sx q0[56];
-rz(pi/2) q0[56];
-cx q0[21],q0[56];
-rz(-pi/4) q0[56];
-cx q0[0],q0[56];
-rz(pi/4) q0[56];
-cx q0[21],q0[56];
-rz(pi/4) q0[21];
-rz(-pi/4) q0[56];
-cx q0[0],q0[56];
-cx q0[0],q0[21];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[21];
-cx q0[0],q0[21];
-rz(3*pi/4) q0[56];
-sx q0[56];
-rz(pi/2) q0[56];
-cx q0[56],q0[21];
-sx q0[57];
-sx q0[58];
-rz(2.3320042) q0[58];
-cx q0[57],q0[58];
-rz(1.9738488) q0[58];
-cx q0[57],q0[58];
-rz(-pi) q0[57];
-sx q0[57];
-rz(-pi) q0[57];
-rz(-2.4210235) q0[58];
-sx q0[58];
-rz(-pi) q0[58];
-cx q0[57],q0[58];
-sx q0[58];
-rz(2.4210235) q0[58];
-sx q0[58];
-rz(-pi) q0[58];
-cx q0[57],q0[58];
-cx q0[57],q0[22];
-rz(pi/2) q0[57];
-sx q0[57];
-rz(pi/2) q0[57];
-cx q0[22],q0[57];
-rz(-pi/4) q0[57];
-cx q0[0],q0[57];
-rz(pi/4) q0[57];
-cx q0[22],q0[57];
-rz(pi/4) q0[22];
-rz(-pi/4) q0[57];
-cx q0[0],q0[57];
-cx q0[0],q0[22];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[22];
-cx q0[0],q0[22];
-rz(3*pi/4) q0[57];
-sx q0[57];
-rz(pi/2) q0[57];
-cx q0[57],q0[22];
-sx q0[58];
-sx q0[59];
-rz(0.28822303) q0[59];
-cx q0[58],q0[59];
-rz(2.6776606) q0[59];
-cx q0[58],q0[59];
-rz(-pi) q0[58];
-sx q0[58];
-rz(-pi) q0[58];
-rz(-2.9333338) q0[59];
-sx q0[59];
-rz(-pi) q0[59];
-cx q0[58],q0[59];
-sx q0[59];
-rz(2.9333338) q0[59];
-sx q0[59];
-rz(-pi) q0[59];
-cx q0[58],q0[59];
-cx q0[58],q0[23];
-rz(pi/2) q0[58];
-sx q0[58];
-rz(pi/2) q0[58];
-cx q0[23],q0[58];
-rz(-pi/4) q0[58];
-cx q0[0],q0[58];
-rz(pi/4) q0[58];
-cx q0[23],q0[58];
-rz(pi/4) q0[23];
-rz(-pi/4) q0[58];
-cx q0[0],q0[58];
-cx q0[0],q0[23];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[23];
-cx q0[0],q0[23];
-rz(3*pi/4) q0[58];
-sx q0[58];
-rz(pi/2) q0[58];
-cx q0[58],q0[23];
-sx q0[59];
-sx q0[60];
-rz(0.085633548) q0[60];
-cx q0[59],q0[60];
-rz(2.2955856) q0[60];
-cx q0[59],q0[60];
-rz(-pi) q0[59];
-sx q0[59];
-rz(-pi) q0[59];
-rz(-1.8632704) q0[60];
-sx q0[60];
-rz(-pi) q0[60];
-cx q0[59],q0[60];
-sx q0[60];
-rz(1.8632704) q0[60];
-sx q0[60];
-rz(-pi) q0[60];
-cx q0[59],q0[60];
-cx q0[59],q0[24];
-rz(pi/2) q0[59];
-sx q0[59];
-rz(pi/2) q0[59];
-cx q0[24],q0[59];
-rz(-pi/4) q0[59];
-cx q0[0],q0[59];
-rz(pi/4) q0[59];
-cx q0[24],q0[59];
-rz(pi/4) q0[24];
-rz(-pi/4) q0[59];
-cx q0[0],q0[59];
-cx q0[0],q0[24];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[24];
-cx q0[0],q0[24];
-rz(3*pi/4) q0[59];
-sx q0[59];
-rz(pi/2) q0[59];
-cx q0[59],q0[24];
-sx q0[60];
-sx q0[61];
-rz(1.413769) q0[61];
-cx q0[60],q0[61];
-rz(0.75764322) q0[61];
-cx q0[60],q0[61];
-rz(-pi) q0[60];
-sx q0[60];
-rz(-pi) q0[60];
-rz(-3.1237543) q0[61];
-sx q0[61];
-rz(-pi) q0[61];
-cx q0[60],q0[61];
-sx q0[61];
-rz(3.1237543) q0[61];
-sx q0[61];
-rz(-pi) q0[61];
-cx q0[60],q0[61];
-cx q0[60],q0[25];
-rz(pi/2) q0[60];
-sx q0[60];
-rz(pi/2) q0[60];
-cx q0[25],q0[60];
-rz(-pi/4) q0[60];
-cx q0[0],q0[60];
-rz(pi/4) q0[60];
-cx q0[25],q0[60];
-rz(pi/4) q0[25];
-rz(-pi/4) q0[60];
-cx q0[0],q0[60];
-cx q0[0],q0[25];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[25];
-cx q0[0],q0[25];
-rz(3*pi/4) q0[60];
-sx q0[60];
-rz(pi/2) q0[60];
-cx q0[60],q0[25];
-sx q0[61];
-sx q0[62];
-rz(0.78563886) q0[62];
-cx q0[61],q0[62];
-rz(2.2263563) q0[62];
-cx q0[61],q0[62];
-rz(-pi) q0[61];
-sx q0[61];
-rz(-pi) q0[61];
-rz(-1.8444858) q0[62];
-sx q0[62];
-rz(-pi) q0[62];
-cx q0[61],q0[62];
-sx q0[62];
-rz(1.8444858) q0[62];
-sx q0[62];
-rz(-pi) q0[62];
-cx q0[61],q0[62];
-cx q0[61],q0[26];
-rz(pi/2) q0[61];
-sx q0[61];
-rz(pi/2) q0[61];
-cx q0[26],q0[61];
-rz(-pi/4) q0[61];
-cx q0[0],q0[61];
-rz(pi/4) q0[61];
-cx q0[26],q0[61];
-rz(pi/4) q0[26];
-rz(-pi/4) q0[61];
-cx q0[0],q0[61];
-cx q0[0],q0[26];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[26];
-cx q0[0],q0[26];
-rz(3*pi/4) q0[61];
-sx q0[61];
-rz(pi/2) q0[61];
-cx q0[61],q0[26];
-sx q0[62];
-sx q0[63];
-rz(1.6893952) q0[63];
-cx q0[62],q0[63];
-rz(2.6180636) q0[63];
-cx q0[62],q0[63];
-rz(-pi) q0[62];
-sx q0[62];
-rz(-pi) q0[62];
-rz(-2.5464331) q0[63];
-sx q0[63];
-rz(-pi) q0[63];
-cx q0[62],q0[63];
-sx q0[63];
-rz(2.5464331) q0[63];
-sx q0[63];
-rz(-pi) q0[63];
-cx q0[62],q0[63];
-cx q0[62],q0[27];
-rz(pi/2) q0[62];
-sx q0[62];
-rz(pi/2) q0[62];
-cx q0[27],q0[62];
-rz(-pi/4) q0[62];
-cx q0[0],q0[62];
-rz(pi/4) q0[62];
-cx q0[27],q0[62];
-rz(pi/4) q0[27];
-rz(-pi/4) q0[62];
-cx q0[0],q0[62];
-cx q0[0],q0[27];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[27];
-cx q0[0],q0[27];
-rz(3*pi/4) q0[62];
-sx q0[62];
-rz(pi/2) q0[62];
-cx q0[62],q0[27];
-sx q0[63];
-sx q0[64];
-rz(0.70706204) q0[64];
-cx q0[63],q0[64];
-rz(2.9746413) q0[64];
-cx q0[63],q0[64];
-rz(-pi) q0[63];
-sx q0[63];
-rz(-pi) q0[63];
-rz(-2.3339371) q0[64];
-sx q0[64];
-rz(-pi) q0[64];
-cx q0[63],q0[64];
-sx q0[64];
-rz(2.3339371) q0[64];
-sx q0[64];
-rz(-pi) q0[64];
-cx q0[63],q0[64];
-cx q0[63],q0[28];
-rz(pi/2) q0[63];
-sx q0[63];
-rz(pi/2) q0[63];
-cx q0[28],q0[63];
-rz(-pi/4) q0[63];
-cx q0[0],q0[63];
-rz(pi/4) q0[63];
-cx q0[28],q0[63];
-rz(pi/4) q0[28];
-rz(-pi/4) q0[63];
-cx q0[0],q0[63];
-cx q0[0],q0[28];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[28];
-cx q0[0],q0[28];
-rz(3*pi/4) q0[63];
-sx q0[63];
-rz(pi/2) q0[63];
-cx q0[63],q0[28];
-sx q0[64];
-sx q0[65];
-rz(0.13523078) q0[65];
-cx q0[64],q0[65];
-rz(0.64578417) q0[65];
-cx q0[64],q0[65];
-rz(-pi) q0[64];
-sx q0[64];
-rz(-pi) q0[64];
-rz(-2.5876772) q0[65];
-sx q0[65];
-rz(-pi) q0[65];
-cx q0[64],q0[65];
-sx q0[65];
-rz(2.5876772) q0[65];
-sx q0[65];
-rz(-pi) q0[65];
-cx q0[64],q0[65];
-cx q0[64],q0[29];
-rz(pi/2) q0[64];
-sx q0[64];
-rz(pi/2) q0[64];
-cx q0[29],q0[64];
-rz(-pi/4) q0[64];
-cx q0[0],q0[64];
-rz(pi/4) q0[64];
-cx q0[29],q0[64];
-rz(pi/4) q0[29];
-rz(-pi/4) q0[64];
-cx q0[0],q0[64];
-cx q0[0],q0[29];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[29];
-cx q0[0],q0[29];
-rz(3*pi/4) q0[64];
-sx q0[64];
-rz(pi/2) q0[64];
-cx q0[64],q0[29];
-sx q0[65];
-sx q0[66];
-rz(2.9429546) q0[66];
-cx q0[65],q0[66];
-rz(1.391042) q0[66];
-cx q0[65],q0[66];
-rz(-pi) q0[65];
-sx q0[65];
-rz(-pi) q0[65];
-rz(-2.0415994) q0[66];
-sx q0[66];
-rz(-pi) q0[66];
-cx q0[65],q0[66];
-sx q0[66];
-rz(2.0415994) q0[66];
-sx q0[66];
-rz(-pi) q0[66];
-cx q0[65],q0[66];
-cx q0[65],q0[30];
-rz(pi/2) q0[65];
-sx q0[65];
-rz(pi/2) q0[65];
-cx q0[30],q0[65];
-rz(-pi/4) q0[65];
-cx q0[0],q0[65];
-rz(pi/4) q0[65];
-cx q0[30],q0[65];
-rz(pi/4) q0[30];
-rz(-pi/4) q0[65];
-cx q0[0],q0[65];
-cx q0[0],q0[30];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[30];
-cx q0[0],q0[30];
-rz(3*pi/4) q0[65];
-sx q0[65];
-rz(pi/2) q0[65];
-cx q0[65],q0[30];
-sx q0[66];
-sx q0[67];
-rz(3.1294093) q0[67];
-cx q0[66],q0[67];
-rz(1.5090598) q0[67];
-cx q0[66],q0[67];
-rz(-pi) q0[66];
-sx q0[66];
-rz(-pi) q0[66];
-rz(-2.1899445) q0[67];
-sx q0[67];
-rz(-pi) q0[67];
-cx q0[66],q0[67];
-sx q0[67];
-rz(2.1899445) q0[67];
-sx q0[67];
-rz(-pi) q0[67];
-cx q0[66],q0[67];
-cx q0[66],q0[31];
-rz(pi/2) q0[66];
-sx q0[66];
-rz(pi/2) q0[66];
-cx q0[31],q0[66];
-rz(-pi/4) q0[66];
-cx q0[0],q0[66];
-rz(pi/4) q0[66];
-cx q0[31],q0[66];
-rz(pi/4) q0[31];
-rz(-pi/4) q0[66];
-cx q0[0],q0[66];
-cx q0[0],q0[31];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[31];
-cx q0[0],q0[31];
-rz(3*pi/4) q0[66];
-sx q0[66];
-rz(pi/2) q0[66];
-cx q0[66],q0[31];
-sx q0[67];
-sx q0[68];
-rz(1.0608749) q0[68];
-cx q0[67],q0[68];
-rz(0.36142268) q0[68];
-cx q0[67],q0[68];
-rz(-pi) q0[67];
-sx q0[67];
-rz(-pi) q0[67];
-rz(-1.7936262) q0[68];
-sx q0[68];
-rz(-pi) q0[68];
-cx q0[67],q0[68];
-sx q0[68];
-rz(1.7936262) q0[68];
-sx q0[68];
-rz(-pi) q0[68];
-cx q0[67],q0[68];
-cx q0[67],q0[32];
-rz(pi/2) q0[67];
-sx q0[67];
-rz(pi/2) q0[67];
-cx q0[32],q0[67];
-rz(-pi/4) q0[67];
-cx q0[0],q0[67];
-rz(pi/4) q0[67];
-cx q0[32],q0[67];
-rz(pi/4) q0[32];
-rz(-pi/4) q0[67];
-cx q0[0],q0[67];
-cx q0[0],q0[32];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[32];
-cx q0[0],q0[32];
-rz(3*pi/4) q0[67];
-sx q0[67];
-rz(pi/2) q0[67];
-cx q0[67],q0[32];
-sx q0[68];
-sx q0[69];
-rz(2.131791) q0[69];
-cx q0[68],q0[69];
-rz(2.6525633) q0[69];
-cx q0[68],q0[69];
-rz(-pi) q0[68];
-sx q0[68];
-rz(-pi) q0[68];
-rz(-1.6321044) q0[69];
-sx q0[69];
-rz(-pi) q0[69];
-cx q0[68],q0[69];
-sx q0[69];
-rz(1.6321044) q0[69];
-sx q0[69];
-rz(-pi) q0[69];
-cx q0[68],q0[69];
-cx q0[68],q0[33];
-rz(pi/2) q0[68];
-sx q0[68];
-rz(pi/2) q0[68];
-cx q0[33],q0[68];
-rz(-pi/4) q0[68];
-cx q0[0],q0[68];
-rz(pi/4) q0[68];
-cx q0[33],q0[68];
-rz(pi/4) q0[33];
-rz(-pi/4) q0[68];
-cx q0[0],q0[68];
-cx q0[0],q0[33];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[33];
-cx q0[0],q0[33];
-rz(3*pi/4) q0[68];
-sx q0[68];
-rz(pi/2) q0[68];
-cx q0[68],q0[33];
-sx q0[69];
-sx q0[70];
-rz(0.29306844) q0[70];
-cx q0[69],q0[70];
-rz(1.987401) q0[70];
-cx q0[69],q0[70];
-rz(-pi) q0[69];
-sx q0[69];
-rz(-pi) q0[69];
-rz(-2.8089949) q0[70];
-sx q0[70];
-rz(-pi) q0[70];
-cx q0[69],q0[70];
-sx q0[70];
-rz(2.8089949) q0[70];
-sx q0[70];
-rz(-pi) q0[70];
-cx q0[69],q0[70];
-cx q0[69],q0[34];
-rz(pi/2) q0[69];
-sx q0[69];
-rz(pi/2) q0[69];
-cx q0[34],q0[69];
-rz(-pi/4) q0[69];
-cx q0[0],q0[69];
-rz(pi/4) q0[69];
-cx q0[34],q0[69];
-rz(pi/4) q0[34];
-rz(-pi/4) q0[69];
-cx q0[0],q0[69];
-cx q0[0],q0[34];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[34];
-cx q0[0],q0[34];
-rz(3*pi/4) q0[69];
-sx q0[69];
-rz(pi/2) q0[69];
-cx q0[69],q0[34];
-cx q0[70],q0[35];
-rz(pi/2) q0[70];
-sx q0[70];
-rz(pi/2) q0[70];
-cx q0[35],q0[70];
-rz(-pi/4) q0[70];
-cx q0[0],q0[70];
-rz(pi/4) q0[70];
-cx q0[35],q0[70];
-rz(pi/4) q0[35];
-rz(-pi/4) q0[70];
-cx q0[0],q0[70];
-cx q0[0],q0[35];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[35];
-cx q0[0],q0[35];
-rz(pi/2) q0[0];
-sx q0[0];
-rz(pi/2) q0[0];
-rz(3*pi/4) q0[70];
-sx q0[70];
-rz(pi/2) q0[70];
-cx q0[70],q0[35];
-measure q0[36] -> c0[0];
-measure q0[37] -> c0[1];
-measure q0[38] -> c0[2];
-measure q0[39] -> c0[3];
-measure q0[40] -> c0[4];
-measure q0[41] -> c0[5];
-measure q0[42] -> c0[6];
-measure q0[43] -> c0[7];
-measure q0[44] -> c0[8];
-measure q0[45] -> c0[9];
-measure q0[46] -> c0[10];
-measure q0[47] -> c0[11];
-measure q0[48] -> c0[12];
-measure q0[49] -> c0[13];
-measure q0[50] -> c0[14];
-measure q0[51] -> c0[15];
-measure q0[52] -> c0[16];
-measure q0[53] -> c0[17];
-measure q0[54] -> c0[18];
-measure q0[55] -> c0[19];
-measure q0[56] -> c0[20];
-measure q0[57] -> c0[21];
-measure q0[58] -> c0[22];
-measure q0[59] -> c0[23];
-measure q0[60] -> c0[24];
-measure q0[61] -> c0[25];
-measure q0[62] -> c0[26];
-measure q0[63] -> c0[27];
-measure q0[64] -> c0[28];
-measure q0[65] -> c0[29];
-measure q0[66] -> c0[30];
-measure q0[67] -> c0[31];
-measure q0[68] -> c0[32];
-measure q0[69] -> c0[33];
-measure q0[70] -> c0[34];
@@ -1,31099 +0,0 @@
-OPENQASM 2.0;
-include "qelib1.inc";
-qreg q[45];
-creg c[31];
-h q[0];
-h q[1];
-h q[2];
-h q[3];
-h q[4];
-h q[5];
-h q[6];
-h q[7];
-h q[8];
-h q[9];
-h q[10];
-h q[11];
-h q[12];
-h q[13];
-h q[14];
-cx q[0],q[15];
-cx q[1],q[17];
-cx q[2],q[19];
-cx q[3],q[21];
-cx q[4],q[23];
-cx q[5],q[25];
-cx q[6],q[27];
-cx q[7],q[29];
-cx q[8],q[16];
-cx q[8],q[17];
-cx q[9],q[18];
-cx q[9],q[19];
-cx q[10],q[20];
-cx q[10],q[21];
-cx q[11],q[22];
-cx q[11],q[23];
-cx q[12],q[24];
-cx q[12],q[25];
-cx q[13],q[26];
-cx q[13],q[27];
-cx q[14],q[28];
-cx q[14],q[29];
-x q[15];
-x q[17];
-x q[18];
-x q[19];
-x q[20];
-x q[21];
-x q[22];
-x q[23];
-x q[24];
-x q[25];
-x q[26];
-x q[27];
-x q[28];
-x q[29];
-reset q[31];
-reset q[32];
-reset q[33];
-reset q[34];
-reset q[35];
-reset q[36];
-reset q[37];
-reset q[38];
-reset q[39];
-reset q[40];
-reset q[41];
-reset q[42];
-reset q[43];
-reset q[44];
-ccx q[16],q[15],q[31];
-ccx q[31],q[17],q[32];
-ccx q[32],q[18],q[33];
-ccx q[33],q[19],q[34];
-ccx q[34],q[20],q[35];
-ccx q[35],q[21],q[36];
-ccx q[36],q[22],q[37];
-ccx q[37],q[23],q[38];
-ccx q[38],q[24],q[39];
-ccx q[39],q[25],q[40];
-ccx q[40],q[26],q[41];
-ccx q[41],q[27],q[42];
-ccx q[42],q[28],q[43];
-ccx q[43],q[29],q[44];
-z q[44];
-ccx q[43],q[29],q[44];
-ccx q[42],q[28],q[43];
-ccx q[41],q[27],q[42];
-ccx q[40],q[26],q[41];
-ccx q[39],q[25],q[40];
-ccx q[38],q[24],q[39];
-ccx q[37],q[23],q[38];
-ccx q[36],q[22],q[37];
-ccx q[35],q[21],q[36];
-ccx q[34],q[20],q[35];
-ccx q[33],q[19],q[34];
-ccx q[32],q[18],q[33];
-ccx q[31],q[17],q[32];
-ccx q[16],q[15],q[31];
-x q[15];
-x q[17];
-x q[18];
-x q[19];
-x q[20];
-x q[21];
-x q[22];
-x q[23];
-x q[24];
-x q[25];
-x q[26];
-x q[27];
-x q[28];
-x q[29];
-cx q[0],q[15];
-cx q[1],q[17];
-cx q[2],q[19];
-cx q[3],q[21];
-cx q[4],q[23];
-cx q[5],q[25];
-cx q[6],q[27];
-cx q[7],q[29];
-cx q[8],q[16];
-cx q[8],q[17];
-cx q[9],q[18];
-cx q[9],q[19];
-cx q[10],q[20];
-cx q[10],q[21];
-cx q[11],q[22];
-cx q[11],q[23];
-cx q[12],q[24];
-cx q[12],q[25];
-cx q[13],q[26];
-cx q[13],q[27];
-cx q[14],q[28];
-cx q[14],q[29];
-h q[0];
-h q[1];
-h q[2];
-h q[3];
-h q[4];
-h q[5];
-h q[6];
-h q[7];
-h q[8];
-h q[9];
-h q[10];
-h q[11];
-h q[12];
-h q[13];
-h q[14];
-x q[0];
-x q[1];
-x q[2];
-x q[3];
-x q[4];
-x q[5];
-x q[6];
-x q[7];
-x q[8];
-x q[9];
-x q[10];
-x q[11];
-x q[12];
-x q[13];
-x q[14];
-reset q[31];
-reset q[32];
-reset q[33];
-reset q[34];
-reset q[35];
-reset q[36];
-reset q[37];
-reset q[38];
-reset q[39];
-reset q[40];
-reset q[41];
-reset q[42];
-reset q[43];
-reset q[44];
-ccx q[1],q[0],q[31];
-ccx q[31],q[2],q[32];
-ccx q[32],q[3],q[33];
-ccx q[33],q[4],q[34];
-ccx q[34],q[5],q[35];
-ccx q[35],q[6],q[36];
-ccx q[36],q[7],q[37];
-ccx q[37],q[8],q[38];
-ccx q[38],q[9],q[39];
-ccx q[39],q[10],q[40];
-ccx q[40],q[11],q[41];
-ccx q[41],q[12],q[42];
-ccx q[42],q[13],q[43];
-ccx q[43],q[14],q[44];
-z q[44];
-ccx q[43],q[14],q[44];
-ccx q[42],q[13],q[43];
-ccx q[41],q[12],q[42];
-ccx q[40],q[11],q[41];
-ccx q[39],q[10],q[40];
-ccx q[38],q[9],q[39];
-ccx q[37],q[8],q[38];
-ccx q[36],q[7],q[37];
-ccx q[35],q[6],q[36];
-ccx q[34],q[5],q[35];
-ccx q[33],q[4],q[34];
-ccx q[32],q[3],q[33];
-ccx q[31],q[2],q[32];
-ccx q[1],q[0],q[31];
-x q[0];
-x q[1];
-x q[2];
-x q[3];
-x q[4];
-x q[5];
-x q[6];
-x q[7];
-x q[8];
-x q[9];
-x q[10];
-x q[11];
-x q[12];
-x q[13];
-x q[14];
-h q[0];
-h q[1];
-h q[2];
-h q[3];
-h q[4];
-h q[5];
-h q[6];
-h q[7];
-h q[8];
-h q[9];
-h q[10];
-h q[11];
-h q[12];
-h q[13];
-h q[14];
-cx q[0],q[15];
-cx q[1],q[17];
-cx q[2],q[19];
-cx q[3],q[21];
-cx q[4],q[23];
-cx q[5],q[25];
-cx q[6],q[27];
-cx q[7],q[29];
-cx q[8],q[16];
-cx q[8],q[17];
-cx q[9],q[18];
-cx q[9],q[19];
-cx q[10],q[20];
-cx q[10],q[21];
-cx q[11],q[22];
-cx q[11],q[23];
-cx q[12],q[24];
-cx q[12],q[25];
-cx q[13],q[26];
-cx q[13],q[27];
-cx q[14],q[28];
-cx q[14],q[29];
-x q[15];
-x q[17];
-x q[18];
-x q[19];
-x q[20];
-x q[21];
-x q[22];
-x q[23];
-x q[24];
-x q[25];
-x q[26];
-x q[27];
-x q[28];
-x q[29];
-reset q[31];
-reset q[32];
-reset q[33];
-reset q[34];
-reset q[35];
-reset q[36];
-reset q[37];
-reset q[38];
-reset q[39];
-reset q[40];
-reset q[41];
-reset q[42];
-reset q[43];
-reset q[44];
-ccx q[16],q[15],q[31];
-ccx q[31],q[17],q[32];
-ccx q[32],q[18],q[33];
-ccx q[33],q[19],q[34];
-ccx q[34],q[20],q[35];
-ccx q[35],q[21],q[36];
-ccx q[36],q[22],q[37];
-ccx q[37],q[23],q[38];
-ccx q[38],q[24],q[39];
-ccx q[39],q[25],q[40];
-ccx q[40],q[26],q[41];
-ccx q[41],q[27],q[42];
-ccx q[42],q[28],q[43];
-ccx q[43],q[29],q[44];
-z q[44];
-ccx q[43],q[29],q[44];
-ccx q[42],q[28],q[43];
-ccx q[41],q[27],q[42];
-ccx q[40],q[26],q[41];
-ccx q[39],q[25],q[40];
-ccx q[38],q[24],q[39];
-ccx q[37],q[23],q[38];
-ccx q[36],q[22],q[37];
-ccx q[35],q[21],q[36];
-ccx q[34],q[20],q[35];
-ccx q[33],q[19],q[34];
-ccx q[32],q[18],q[33];
-ccx q[31],q[17],q[32];
-ccx q[16],q[15],q[31];
-x q[15];
-x q[17];
-x q[18];
-x q[19];
-x q[20];
-x q[21];
-x q[22];
-x q[23];
-x q[24];
-x q[25];
-x q[26];
-x q[27];
-x q[28];
-x q[29];
-cx q[0],q[15];
-cx q[1],q[17];
-cx q[2],q[19];
-cx q[3],q[21];
-cx q[4],q[23];
-cx q[5],q[25];
-cx q[6],q[27];
-cx q[7],q[29];
-cx q[8],q[16];
-cx q[8],q[17];
-cx q[9],q[18];
-cx q[9],q[19];
-cx q[10],q[20];
-cx q[10],q[21];
-cx q[11],q[22];
-cx q[11],q[23];
-cx q[12],q[24];
-cx q[12],q[25];
-cx q[13],q[26];
-cx q[13],q[27];
-cx q[14],q[28];
-cx q[14],q[29];
-h q[0];
-h q[1];
-h q[2];
-h q[3];
-h q[4];
-h q[5];
-h q[6];
-h q[7];
-h q[8];
-h q[9];
-h q[10];
-h q[11];
-h q[12];
-h q[13];
-h q[14];
-x q[0];
-x q[1];
-x q[2];
-x q[3];
-x q[4];
-x q[5];
-x q[6];
-x q[7];
-x q[8];
-x q[9];
-x q[10];
-x q[11];
-x q[12];
-x q[13];
-x q[14];
-reset q[31];
-reset q[32];
-reset q[33];
-reset q[34];
-reset q[35];
-reset q[36];
-reset q[37];
-reset q[38];
-reset q[39];
-reset q[40];
-reset q[41];
-reset q[42];
-reset q[43];
-reset q[44];
-ccx q[1],q[0],q[31];
-ccx q[31],q[2],q[32];
-ccx q[32],q[3],q[33];
-ccx q[33],q[4],q[34];
-ccx q[34],q[5],q[35];
-ccx q[35],q[6],q[36];
-ccx q[36],q[7],q[37];
-ccx q[37],q[8],q[38];
-ccx q[38],q[9],q[39];
-ccx q[39],q[10],q[40];
-ccx q[40],q[11],q[41];
-ccx q[41],q[12],q[42];
-ccx q[42],q[13],q[43];
-ccx q[43],q[14],q[44];
-z q[44];
-ccx q[43],q[14],q[44];
-ccx q[42],q[13],q[43];
-ccx q[41],q[12],q[42];
-ccx q[40],q[11],q[41];
-ccx q[39],q[10],q[40];
-ccx q[38],q[9],q[39];
-ccx q[37],q[8],q[38];
-ccx q[36],q[7],q[37];
-ccx q[35],q[6],q[36];
-ccx q[34],q[5],q[35];
-ccx q[33],q[4],q[34];
-ccx q[32],q[3],q[33];
-ccx q[31],q[2],q[32];
-ccx q[1],q[0],q[31];
-x q[0];
-x q[1];
-x q[2];
-x q[3];
-x q[4];
-x q[5];
-x q[6];
-x q[7];
-x q[8];
-x q[9];
-x q[10];
-x q[11];
-x q[12];
-x q[13];
-x q[14];
-h q[0];
-h q[1];
-h q[2];
-h q[3];
-h q[4];
-h q[5];
-h q[6];
-h q[7];
-h q[8];
-h q[9];
-h q[10];
-h q[11];
-h q[12];
-h q[13];
-h q[14];
-cx q[0],q[15];
-cx q[1],q[17];
-cx q[2],q[19];
-cx q[3],q[21];
-cx q[4],q[23];
-cx q[5],q[25];
-cx q[6],q[27];
-cx q[7],q[29];
-cx q[8],q[16];
-cx q[8],q[17];
-cx q[9],q[18];
-cx q[9],q[19];
-cx q[10],q[20];
-cx q[10],q[21];
-cx q[11],q[22];
-cx q[11],q[23];
-cx q[12],q[24];
-cx q[12],q[25];
-cx q[13],q[26];
-cx q[13],q[27];
-cx q[14],q[28];
-cx q[14],q[29];
-x q[15];
-x q[17];
-x q[18];
-x q[19];
-x q[20];
-x q[21];
-x q[22];
-x q[23];
-x q[24];
-x q[25];
-x q[26];
-x q[27];
-x q[28];
-x q[29];
-reset q[31];
-reset q[32];
-reset q[33];
-reset q[34];
-reset q[35];
-reset q[36];
-reset q[37];
-reset q[38];
-reset q[39];
-reset q[40];
-reset q[41];
-reset q[42];
-reset q[43];
-reset q[44];
-ccx q[16],q[15],q[31];
-ccx q[31],q[17],q[32];
-ccx q[32],q[18],q[33];
-ccx q[33],q[19],q[34];
-ccx q[34],q[20],q[35];
-ccx q[35],q[21],q[36];
-ccx q[36],q[22],q[37];
-ccx q[37],q[23],q[38];
-ccx q[38],q[24],q[39];
-ccx q[39],q[25],q[40];
-ccx q[40],q[26],q[41];
-ccx q[41],q[27],q[42];
-ccx q[42],q[28],q[43];
-ccx q[43],q[29],q[44];
-z q[44];
-ccx q[43],q[29],q[44];
-ccx q[42],q[28],q[43];
-ccx q[41],q[27],q[42];
-ccx q[40],q[26],q[41];
-ccx q[39],q[25],q[40];
-ccx q[38],q[24],q[39];
-ccx q[37],q[23],q[38];
-ccx q[36],q[22],q[37];
-ccx q[35],q[21],q[36];
-ccx q[34],q[20],q[35];
-ccx q[33],q[19],q[34];
-ccx q[32],q[18],q[33];
-ccx q[31],q[17],q[32];
-ccx q[16],q[15],q[31];
-x q[15];
-x q[17];
-x q[18];
-x q[19];
-x q[20];
-x q[21];
-x q[22];
-x q[23];
-x q[24];
-x q[25];
-x q[26];
-x q[27];
-x q[28];
-x q[29];
-cx q[0],q[15];
-cx q[1],q[17];
-cx q[2],q[19];
-cx q[3],q[21];
-cx q[4],q[23];
-cx q[5],q[25];
-cx q[6],q[27];
-cx q[7],q[29];
-cx q[8],q[16];
-cx q[8],q[17];
-cx q[9],q[18];
-cx q[9],q[19];
-cx q[10],q[20];
-cx q[10],q[21];
-cx q[11],q[22];
-cx q[11],q[23];
-cx q[12],q[24];
-cx q[12],q[25];
-cx q[13],q[26];
-cx q[13],q[27];
-cx q[14],q[28];
-cx q[14],q[29];
-h q[0];
-h q[1];
-h q[2];
-h q[3];
-h q[4];
-h q[5];
-h q[6];
-h q[7];
-h q[8];
-h q[9];
-h q[10];
-h q[11];
-h q[12];
-h q[13];
-h q[14];
-x q[0];
-x q[1];
-x q[2];
-x q[3];
-x q[4];
-x q[5];
-x q[6];
-x q[7];
-x q[8];
-x q[9];
-x q[10];
-x q[11];
-x q[12];
-x q[13];
-x q[14];
-reset q[31];
-reset q[32];
-reset q[33];
-reset q[34];
-reset q[35];
-reset q[36];
-reset q[37];
-reset q[38];
-reset q[39];
-reset q[40];
-reset q[41];
-reset q[42];
-reset q[43];
-reset q[44];
-ccx q[1],q[0],q[31];
-ccx q[31],q[2],q[32];
-ccx q[32],q[3],q[33];
-ccx q[33],q[4],q[34];
-ccx q[34],q[5],q[35];
-ccx q[35],q[6],q[36];
-ccx q[36],q[7],q[37];
-ccx q[37],q[8],q[38];
-ccx q[38],q[9],q[39];
-ccx q[39],q[10],q[40];
-ccx q[40],q[11],q[41];
-ccx q[41],q[12],q[42];
-ccx q[42],q[13],q[43];
-ccx q[43],q[14],q[44];
-z q[44];
-ccx q[43],q[14],q[44];
-ccx q[42],q[13],q[43];
-ccx q[41],q[12],q[42];
-ccx q[40],q[11],q[41];
-ccx q[39],q[10],q[40];
-ccx q[38],q[9],q[39];
-ccx q[37],q[8],q[38];
-ccx q[36],q[7],q[37];
-ccx q[35],q[6],q[36];
-ccx q[34],q[5],q[35];
-ccx q[33],q[4],q[34];
-ccx q[32],q[3],q[33];
-ccx q[31],q[2],q[32];
-ccx q[1],q[0],q[31];
-x q[0];
-x q[1];
-x q[2];
-x q[3];
-x q[4];
-x q[5];
-x q[6];
-x q[7];
-x q[8];
-x q[9];
-x q[10];
-x q[11];
-x q[12];
-x q[13];
-x q[14];
-h q[0];
-h q[1];
-h q[2];
-h q[3];
-h q[4];
-h q[5];
-h q[6];
-h q[7];
-h q[8];
-h q[9];
-h q[10];
-h q[11];
-h q[12];
-h q[13];
-h q[14];
-cx q[0],q[15];
-cx q[1],q[17];
-cx q[2],q[19];
-cx q[3],q[21];
-cx q[4],q[23];
-cx q[5],q[25];
-cx q[6],q[27];
-cx q[7],q[29];
-cx q[8],q[16];
-cx q[8],q[17];
-cx q[9],q[18];
-cx q[9],q[19];
-cx q[10],q[20];
-cx q[10],q[21];
-cx q[11],q[22];
-cx q[11],q[23];
-cx q[12],q[24];
-cx q[12],q[25];
-cx q[13],q[26];
-cx q[13],q[27];
-cx q[14],q[28];
-cx q[14],q[29];
-x q[15];
-x q[17];
-x q[18];
-x q[19];
-x q[20];
-x q[21];
-x q[22];
-x q[23];
-x q[24];
-x q[25];
-x q[26];
-x q[27];
-x q[28];
-x q[29];
-reset q[31];
-reset q[32];
-reset q[33];
-reset q[34];
-reset q[35];
-reset q[36];
-reset q[37];
-reset q[38];
-reset q[39];
-reset q[40];
-reset q[41];
-reset q[42];
-reset q[43];
-reset q[44];
-ccx q[16],q[15],q[31];
-ccx q[31],q[17],q[32];
-ccx q[32],q[18],q[33];
-ccx q[33],q[19],q[34];
-ccx q[34],q[20],q[35];
-ccx q[35],q[21],q[36];
-ccx q[36],q[22],q[37];
-ccx q[37],q[23],q[38];
-ccx q[38],q[24],q[39];
-ccx q[39],q[25],q[40];
-ccx q[40],q[26],q[41];
-ccx q[41],q[27],q[42];
-ccx q[42],q[28],q[43];
-ccx q[43],q[29],q[44];
-z q[44];
-ccx q[43],q[29],q[44];
-ccx q[42],q[28],q[43];
-ccx q[41],q[27],q[42];
-ccx q[40],q[26],q[41];
-ccx q[39],q[25],q[40];
-ccx q[38],q[24],q[39];
-ccx q[37],q[23],q[38];
-ccx q[36],q[22],q[37];
-ccx q[35],q[21],q[36];
-ccx q[34],q[20],q[35];
-ccx q[33],q[19],q[34];
-ccx q[32],q[18],q[33];
-ccx q[31],q[17],q[32];
-ccx q[16],q[15],q[31];
-x q[15];
-x q[17];
-x q[18];
-x q[19];
-x q[20];
-x q[21];
-x q[22];
-x q[23];
-x q[24];
-x q[25];
-x q[26];
-x q[27];
-x q[28];
-x q[29];
-cx q[0],q[15];
-cx q[1],q[17];
-cx q[2],q[19];
-cx q[3],q[21];
-cx q[4],q[23];
-cx q[5],q[25];
-cx q[6],q[27];
-cx q[7],q[29];
-cx q[8],q[16];
-cx q[8],q[17];
-cx q[9],q[18];
-cx q[9],q[19];
-cx q[10],q[20];
-cx q[10],q[21];
-cx q[11],q[22];
-cx q[11],q[23];
-cx q[12],q[24];
-cx q[12],q[25];
-cx q[13],q[26];
-cx q[13],q[27];
-cx q[14],q[28];
-cx q[14],q[29];
-h q[0];
-h q[1];
-h q[2];
-h q[3];
-h q[4];
-h q[5];
-h q[6];
-h q[7];
-h q[8];
-h q[9];
-h q[10];
-h q[11];
-h q[12];
-h q[13];
-h q[14];
-x q[0];
-x q[1];
-x q[2];
-x q[3];
-x q[4];
-x q[5];
-x q[6];
-x q[7];
-x q[8];
-x q[9];
-x q[10];
-x q[11];
-x q[12];
-x q[13];
-x q[14];
-reset q[31];
-reset q[32];
-reset q[33];
-reset q[34];
-reset q[35];
-reset q[36];
-reset q[37];
-reset q[38];
-reset q[39];
-reset q[40];
-reset q[41];
-reset q[42];
-reset q[43];
-reset q[44];
-ccx q[1],q[0],q[31];
-ccx q[31],q[2],q[32];
-ccx q[32],q[3],q[33];
-ccx q[33],q[4],q[34];
-ccx q[34],q[5],q[35];
-ccx q[35],q[6],q[36];
-ccx q[36],q[7],q[37];
-ccx q[37],q[8],q[38];
-ccx q[38],q[9],q[39];
-ccx q[39],q[10],q[40];
-ccx q[40],q[11],q[41];
-ccx q[41],q[12],q[42];
-ccx q[42],q[13],q[43];
-ccx q[43],q[14],q[44];
-z q[44];
-ccx q[43],q[14],q[44];
-ccx q[42],q[13],q[43];
-ccx q[41],q[12],q[42];
-ccx q[40],q[11],q[41];
-ccx q[39],q[10],q[40];
-ccx q[38],q[9],q[39];
-ccx q[37],q[8],q[38];
-ccx q[36],q[7],q[37];
-ccx q[35],q[6],q[36];
-ccx q[34],q[5],q[35];
-ccx q[33],q[4],q[34];
-ccx q[32],q[3],q[33];
-ccx q[31],q[2],q[32];
-ccx q[1],q[0],q[31];
-x q[0];
-x q[1];
-x q[2];
-x q[3];
-x q[4];
-x q[5];
-x q[6];
-x q[7];
-x q[8];
-x q[9];
-x q[10];
-x q[11];
-x q[12];
-x q[13];
-x q[14];
-h q[0];
-h q[1];
-h q[2];
-h q[3];
-h q[4];
-h q[5];
-h q[6];
-h q[7];
-h q[8];
-h q[9];
-h q[10];
-h q[11];
-h q[12];
-h q[13];
-h q[14];
-cx q[0],q[15];
-cx q[1],q[17];
-cx q[2],q[19];
-cx q[3],q[21];
-cx q[4],q[23];
-cx q[5],q[25];
-cx q[6],q[27];
-cx q[7],q[29];
-cx q[8],q[16];
-cx q[8],q[17];
-cx q[9],q[18];
-cx q[9],q[19];
-cx q[10],q[20];
-cx q[10],q[21];
-cx q[11],q[22];
-cx q[11],q[23];
-cx q[12],q[24];
-cx q[12],q[25];
-cx q[13],q[26];
-cx q[13],q[27];
-cx q[14],q[28];
-cx q[14],q[29];
-x q[15];
-x q[17];
-x q[18];
-x q[19];
-x q[20];
-x q[21];
-x q[22];
-x q[23];
-x q[24];
-x q[25];
-x q[26];
-x q[27];
-x q[28];
-x q[29];
-reset q[31];
-reset q[32];
-reset q[33];
-reset q[34];
-reset q[35];
-reset q[36];
-reset q[37];
-reset q[38];
-reset q[39];
-reset q[40];
-reset q[41];
-reset q[42];
-reset q[43];
-reset q[44];
-ccx q[16],q[15],q[31];
-ccx q[31],q[17],q[32];
-ccx q[32],q[18],q[33];
-ccx q[33],q[19],q[34];
-ccx q[34],q[20],q[35];
-ccx q[35],q[21],q[36];
-ccx q[36],q[22],q[37];
-ccx q[37],q[23],q[38];
-ccx q[38],q[24],q[39];
-ccx q[39],q[25],q[40];
-ccx q[40],q[26],q[41];
-ccx q[41],q[27],q[42];
-ccx q[42],q[28],q[43];
-ccx q[43],q[29],q[44];
-z q[44];
-ccx q[43],q[29],q[44];
-ccx q[42],q[28],q[43];
-ccx q[41],q[27],q[42];
-ccx q[40],q[26],q[41];
-ccx q[39],q[25],q[40];
-ccx q[38],q[24],q[39];
-ccx q[37],q[23],q[38];
-ccx q[36],q[22],q[37];
-ccx q[35],q[21],q[36];
-ccx q[34],q[20],q[35];
-ccx q[33],q[19],q[34];
-ccx q[32],q[18],q[33];
-ccx q[31],q[17],q[32];
-ccx q[16],q[15],q[31];
-x q[15];
-x q[17];
-x q[18];
-x q[19];
-x q[20];
-x q[21];
-x q[22];
-x q[23];
-x q[24];
-x q[25];
-x q[26];
-x q[27];
-x q[28];
-x q[29];
-cx q[0],q[15];
-cx q[1],q[17];
-cx q[2],q[19];
-cx q[3],q[21];
-cx q[4],q[23];
-cx q[5],q[25];
-cx q[6],q[27];
-cx q[7],q[29];
-cx q[8],q[16];
-cx q[8],q[17];
-cx q[9],q[18];
-cx q[9],q[19];
-cx q[10],q[20];
-cx q[10],q[21];
-cx q[11],q[22];
-cx q[11],q[23];
-cx q[12],q[24];
-cx q[12],q[25];
-cx q[13],q[26];
-cx q[13],q[27];
-cx q[14],q[28];
-cx q[14],q[29];
-h q[0];
-h q[1];
-h q[2];
-h q[3];
-h q[4];
-h q[5];
-h q[6];
-h q[7];
-h q[8];
-h q[9];
-h q[10];
-h q[11];
-h q[12];
-h q[13];
-h q[14];
-x q[0];
-x q[1];
-x q[2];
-x q[3];
-x q[4];
-x q[5];
-x q[6];
-x q[7];
-x q[8];
-x q[9];
-x q[10];
-x q[11];
-x q[12];
-x q[13];
-x q[14];
-reset q[31];
-reset q[32];
-reset q[33];
-reset q[34];
-reset q[35];
-reset q[36];
-reset q[37];
-reset q[38];
-reset q[39];
-reset q[40];
-reset q[41];
-reset q[42];
-reset q[43];
-reset q[44];
-ccx q[1],q[0],q[31];
-ccx q[31],q[2],q[32];
-ccx q[32],q[3],q[33];
-ccx q[33],q[4],q[34];
-ccx q[34],q[5],q[35];
-ccx q[35],q[6],q[36];
-ccx q[36],q[7],q[37];
-ccx q[37],q[8],q[38];
-ccx q[38],q[9],q[39];
-ccx q[39],q[10],q[40];
-ccx q[40],q[11],q[41];
-ccx q[41],q[12],q[42];
-ccx q[42],q[13],q[43];
-ccx q[43],q[14],q[44];
-z q[44];
-ccx q[43],q[14],q[44];
-ccx q[42],q[13],q[43];
-ccx q[41],q[12],q[42];
-ccx q[40],q[11],q[41];
-ccx q[39],q[10],q[40];
-ccx q[38],q[9],q[39];
-ccx q[37],q[8],q[38];
-ccx q[36],q[7],q[37];
-ccx q[35],q[6],q[36];
-ccx q[34],q[5],q[35];
-ccx q[33],q[4],q[34];
-ccx q[32],q[3],q[33];
-ccx q[31],q[2],q[32];
-ccx q[1],q[0],q[31];
-x q[0];
-x q[1];
-x q[2];
-x q[3];
-x q[4];
-x q[5];
-x q[6];
-x q[7];
-x q[8];
-x q[9];
-x q[10];
-x q[11];
-x q[12];
-x q[13];
-x q[14];
-h q[0];
-h q[1];
-h q[2];
-h q[3];
-h q[4];
-h q[5];
-h q[6];
-h q[7];
-h q[8];
-h q[9];
-h q[10];
-h q[11];
-h q[12];
-h q[13];
-h q[14];
-cx q[0],q[15];
-cx q[1],q[17];
-cx q[2],q[19];
-cx q[3],q[21];
-cx q[4],q[23];
-cx q[5],q[25];
-cx q[6],q[27];
-cx q[7],q[29];
-cx q[8],q[16];
-cx q[8],q[17];
-cx q[9],q[18];
-cx q[9],q[19];
-cx q[10],q[20];
-cx q[10],q[21];
-cx q[11],q[22];
-cx q[11],q[23];
-cx q[12],q[24];
-cx q[12],q[25];
-cx q[13],q[26];
-cx q[13],q[27];
-cx q[14],q[28];
-cx q[14],q[29];
-x q[15];
-x q[17];
-x q[18];
-x q[19];
-x q[20];
-x q[21];
-x q[22];
-x q[23];
-x q[24];
-x q[25];
-x q[26];
-x q[27];
-x q[28];
-x q[29];
-reset q[31];
-reset q[32];
-reset q[33];
-reset q[34];
-reset q[35];
-reset q[36];
-reset q[37];
-reset q[38];
-reset q[39];
-reset q[40];
-reset q[41];
-reset q[42];
-reset q[43];
-reset q[44];
-ccx q[16],q[15],q[31];
-ccx q[31],q[17],q[32];
-ccx q[32],q[18],q[33];
-ccx q[33],q[19],q[34];
-ccx q[34],q[20],q[35];
-ccx q[35],q[21],q[36];
-ccx q[36],q[22],q[37];
-ccx q[37],q[23],q[38];
-ccx q[38],q[24],q[39];
-ccx q[39],q[25],q[40];
-ccx q[40],q[26],q[41];
-ccx q[41],q[27],q[42];
-ccx q[42],q[28],q[43];
-ccx q[43],q[29],q[44];
-z q[44];
-ccx q[43],q[29],q[44];
-ccx q[42],q[28],q[43];
-ccx q[41],q[27],q[42];
-ccx q[40],q[26],q[41];
-ccx q[39],q[25],q[40];
-ccx q[38],q[24],q[39];
-ccx q[37],q[23],q[38];
-ccx q[36],q[22],q[37];
-ccx q[35],q[21],q[36];
-ccx q[34],q[20],q[35];
-ccx q[33],q[19],q[34];
-ccx q[32],q[18],q[33];
-ccx q[31],q[17],q[32];
-ccx q[16],q[15],q[31];
-x q[15];
-x q[17];
-x q[18];
-x q[19];
-x q[20];
-x q[21];
-x q[22];
-x q[23];
-x q[24];
-x q[25];
-x q[26];
-x q[27];
-x q[28];
-x q[29];
-cx q[0],q[15];
-cx q[1],q[17];
-cx q[2],q[19];
-cx q[3],q[21];
-cx q[4],q[23];
-cx q[5],q[25];
-cx q[6],q[27];
-cx q[7],q[29];
-cx q[8],q[16];
-cx q[8],q[17];
-cx q[9],q[18];
-cx q[9],q[19];
-cx q[10],q[20];
-cx q[10],q[21];
-cx q[11],q[22];
-cx q[11],q[23];
-cx q[12],q[24];
-cx q[12],q[25];
-cx q[13],q[26];
-cx q[13],q[27];
-cx q[14],q[28];
-cx q[14],q[29];
-h q[0];
-h q[1];
-h q[2];
-h q[3];
-h q[4];
-h q[5];
-h q[6];
-h q[7];
-h q[8];
-h q[9];
-h q[10];
-h q[11];
-h q[12];
-h q[13];
-h q[14];
-x q[0];
-x q[1];
-x q[2];
-x q[3];
-x q[4];
-x q[5];
-x q[6];
-x q[7];
-x q[8];
-x q[9];
-x q[10];
-x q[11];
-x q[12];
-x q[13];
-x q[14];
-reset q[31];
-reset q[32];
-reset q[33];
-reset q[34];
-reset q[35];
-reset q[36];
-reset q[37];
-reset q[38];
-reset q[39];
-reset q[40];
-reset q[41];
-reset q[42];
-reset q[43];
-reset q[44];
-ccx q[1],q[0],q[31];
-ccx q[31],q[2],q[32];
-ccx q[32],q[3],q[33];
-ccx q[33],q[4],q[34];
-ccx q[34],q[5],q[35];
-ccx q[35],q[6],q[36];
-ccx q[36],q[7],q[37];
-ccx q[37],q[8],q[38];
-ccx q[38],q[9],q[39];
-ccx q[39],q[10],q[40];
-ccx q[40],q[11],q[41];
-ccx q[41],q[12],q[42];
-ccx q[42],q[13],q[43];
-ccx q[43],q[14],q[44];
-z q[44];
-ccx q[43],q[14],q[44];
-ccx q[42],q[13],q[43];
-ccx q[41],q[12],q[42];
-ccx q[40],q[11],q[41];
-ccx q[39],q[10],q[40];
-ccx q[38],q[9],q[39];
-ccx q[37],q[8],q[38];
-ccx q[36],q[7],q[37];
-ccx q[35],q[6],q[36];
-ccx q[34],q[5],q[35];
-ccx q[33],q[4],q[34];
-ccx q[32],q[3],q[33];
-ccx q[31],q[2],q[32];
-ccx q[1],q[0],q[31];
-x q[0];
-x q[1];
-x q[2];
-x q[3];
-x q[4];
-x q[5];
-x q[6];
-x q[7];
-x q[8];
-x q[9];
-x q[10];
-x q[11];
-x q[12];
-x q[13];
-x q[14];
-h q[0];
-h q[1];
-h q[2];
-h q[3];
-h q[4];
-h q[5];
-h q[6];
-h q[7];
-h q[8];
-h q[9];
-h q[10];
-h q[11];
-h q[12];
-h q[13];
-h q[14];
-cx q[0],q[15];
-cx q[1],q[17];
-cx q[2],q[19];
-cx q[3],q[21];
-cx q[4],q[23];
-cx q[5],q[25];
-cx q[6],q[27];
-cx q[7],q[29];
-cx q[8],q[16];
-cx q[8],q[17];
-cx q[9],q[18];
-cx q[9],q[19];
-cx q[10],q[20];
-cx q[10],q[21];
-cx q[11],q[22];
-cx q[11],q[23];
-cx q[12],q[24];
-cx q[12],q[25];
-cx q[13],q[26];
-cx q[13],q[27];
-cx q[14],q[28];
-cx q[14],q[29];
-x q[15];
-x q[17];
-x q[18];
-x q[19];
-x q[20];
-x q[21];
-x q[22];
-x q[23];
-x q[24];
-x q[25];
-x q[26];
-x q[27];
-x q[28];
-x q[29];
-reset q[31];
-reset q[32];
-reset q[33];
-reset q[34];
-reset q[35];
-reset q[36];
-reset q[37];
-reset q[38];
-reset q[39];
-reset q[40];
-reset q[41];
-reset q[42];
-reset q[43];
-reset q[44];
-ccx q[16],q[15],q[31];
-ccx q[31],q[17],q[32];
-ccx q[32],q[18],q[33];
-ccx q[33],q[19],q[34];
-ccx q[34],q[20],q[35];
-ccx q[35],q[21],q[36];
-ccx q[36],q[22],q[37];
-ccx q[37],q[23],q[38];
-ccx q[38],q[24],q[39];
-ccx q[39],q[25],q[40];
-ccx q[40],q[26],q[41];
-ccx q[41],q[27],q[42];
-ccx q[42],q[28],q[43];
-ccx q[43],q[29],q[44];
-z q[44];
-ccx q[43],q[29],q[44];
-ccx q[42],q[28],q[43];
-ccx q[41],q[27],q[42];
-ccx q[40],q[26],q[41];
-ccx q[39],q[25],q[40];
-ccx q[38],q[24],q[39];
-ccx q[37],q[23],q[38];
-ccx q[36],q[22],q[37];
-ccx q[35],q[21],q[36];
-ccx q[34],q[20],q[35];
-ccx q[33],q[19],q[34];
-ccx q[32],q[18],q[33];
-ccx q[31],q[17],q[32];
-ccx q[16],q[15],q[31];
-x q[15];
-x q[17];
-x q[18];
-x q[19];
-x q[20];
-x q[21];
-x q[22];
-x q[23];
-x q[24];
-x q[25];
-x q[26];
-x q[27];
-x q[28];
-x q[29];
-cx q[0],q[15];
-cx q[1],q[17];
-cx q[2],q[19];
-cx q[3],q[21];
-cx q[4],q[23];
-cx q[5],q[25];
-cx q[6],q[27];
-cx q[7],q[29];
-cx q[8],q[16];
-cx q[8],q[17];
-cx q[9],q[18];
-cx q[9],q[19];
-cx q[10],q[20];
-cx q[10],q[21];
-cx q[11],q[22];
-cx q[11],q[23];
-cx q[12],q[24];
-cx q[12],q[25];
-cx q[13],q[26];
-cx q[13],q[27];
-cx q[14],q[28];
-cx q[14],q[29];
-h q[0];
-h q[1];
-h q[2];
-h q[3];
-h q[4];
-h q[5];
-h q[6];
-h q[7];
-h q[8];
-h q[9];
-h q[10];
-h q[11];
-h q[12];
-h q[13];
-h q[14];
-x q[0];
-x q[1];
-x q[2];
-x q[3];
-x q[4];
-x q[5];
-x q[6];
-x q[7];
-x q[8];
-x q[9];
-x q[10];
-x q[11];
-x q[12];
-x q[13];
-x q[14];
-reset q[31];
-reset q[32];
-reset q[33];
-reset q[34];
-reset q[35];
-reset q[36];
-reset q[37];
-reset q[38];
-reset q[39];
-reset q[40];
-reset q[41];
-reset q[42];
-reset q[43];
-reset q[44];
-ccx q[1],q[0],q[31];
-ccx q[31],q[2],q[32];
-ccx q[32],q[3],q[33];
-ccx q[33],q[4],q[34];
-ccx q[34],q[5],q[35];
-ccx q[35],q[6],q[36];
-ccx q[36],q[7],q[37];
-ccx q[37],q[8],q[38];
-ccx q[38],q[9],q[39];
-ccx q[39],q[10],q[40];
-ccx q[40],q[11],q[41];
-ccx q[41],q[12],q[42];
-ccx q[42],q[13],q[43];
-ccx q[43],q[14],q[44];
-z q[44];
-ccx q[43],q[14],q[44];
-ccx q[42],q[13],q[43];
-ccx q[41],q[12],q[42];
-ccx q[40],q[11],q[41];
-ccx q[39],q[10],q[40];
-ccx q[38],q[9],q[39];
-ccx q[37],q[8],q[38];
-ccx q[36],q[7],q[37];
-ccx q[35],q[6],q[36];
-ccx q[34],q[5],q[35];
-ccx q[33],q[4],q[34];
-ccx q[32],q[3],q[33];
-ccx q[31],q[2],q[32];
-ccx q[1],q[0],q[31];
-x q[0];
-x q[1];
-x q[2];
-x q[3];
-x q[4];
-x q[5];
-x q[6];
-x q[7];
-x q[8];
-x q[9];
-x q[10];
-x q[11];
-x q[12];
-x q[13];
-x q[14];
-h q[0];
-h q[1];
-h q[2];
-h q[3];
-h q[4];
-h q[5];
-h q[6];
-h q[7];
-h q[8];
-h q[9];
-h q[10];
-h q[11];
-h q[12];
-h q[13];
-h q[14];
-cx q[0],q[15];
-cx q[1],q[17];
-cx q[2],q[19];
-cx q[3],q[21];
-cx q[4],q[23];
-cx q[5],q[25];
-cx q[6],q[27];
-cx q[7],q[29];
-cx q[8],q[16];
-cx q[8],q[17];
-cx q[9],q[18];
-cx q[9],q[19];
-cx q[10],q[20];
-cx q[10],q[21];
-cx q[11],q[22];
-cx q[11],q[23];
-cx q[12],q[24];
-cx q[12],q[25];
-cx q[13],q[26];
-cx q[13],q[27];
-cx q[14],q[28];
-cx q[14],q[29];
-x q[15];
-x q[17];
-x q[18];
-x q[19];
-x q[20];
-x q[21];
-x q[22];
-x q[23];
-x q[24];
-x q[25];
-x q[26];
-x q[27];
-x q[28];
-x q[29];
-reset q[31];
-reset q[32];
-reset q[33];
-reset q[34];
-reset q[35];
-reset q[36];
-reset q[37];
-reset q[38];
-reset q[39];
-reset q[40];
-reset q[41];
-reset q[42];
-reset q[43];
-reset q[44];
-ccx q[16],q[15],q[31];
-ccx q[31],q[17],q[32];
-ccx q[32],q[18],q[33];
-ccx q[33],q[19],q[34];
-ccx q[34],q[20],q[35];
-ccx q[35],q[21],q[36];
-ccx q[36],q[22],q[37];
-ccx q[37],q[23],q[38];
-ccx q[38],q[24],q[39];
-ccx q[39],q[25],q[40];
-ccx q[40],q[26],q[41];
-ccx q[41],q[27],q[42];
-ccx q[42],q[28],q[43];
-ccx q[43],q[29],q[44];
-z q[44];
-ccx q[43],q[29],q[44];
-ccx q[42],q[28],q[43];
-ccx q[41],q[27],q[42];
-ccx q[40],q[26],q[41];
-ccx q[39],q[25],q[40];
-ccx q[38],q[24],q[39];
-ccx q[37],q[23],q[38];
-ccx q[36],q[22],q[37];
-ccx q[35],q[21],q[36];
-ccx q[34],q[20],q[35];
-ccx q[33],q[19],q[34];
-ccx q[32],q[18],q[33];
-ccx q[31],q[17],q[32];
-ccx q[16],q[15],q[31];
-x q[15];
-x q[17];
-x q[18];
-x q[19];
-x q[20];
-x q[21];
-x q[22];
-x q[23];
-x q[24];
-x q[25];
-x q[26];
-x q[27];
-x q[28];
-x q[29];
-cx q[0],q[15];
-cx q[1],q[17];
-cx q[2],q[19];
-cx q[3],q[21];
-cx q[4],q[23];
-cx q[5],q[25];
-cx q[6],q[27];
-cx q[7],q[29];
-cx q[8],q[16];
-cx q[8],q[17];
-cx q[9],q[18];
-cx q[9],q[19];
-cx q[10],q[20];
-cx q[10],q[21];
-cx q[11],q[22];
-cx q[11],q[23];
-cx q[12],q[24];
-cx q[12],q[25];
-cx q[13],q[26];
-cx q[13],q[27];
-cx q[14],q[28];
-cx q[14],q[29];
-h q[0];
-h q[1];
-h q[2];
-h q[3];
-h q[4];
-h q[5];
-h q[6];
-h q[7];
-h q[8];
-h q[9];
-h q[10];
-h q[11];
-h q[12];
-h q[13];
-h q[14];
-x q[0];
-x q[1];
-x q[2];
-x q[3];
-x q[4];
-x q[5];
-x q[6];
-x q[7];
-x q[8];
-x q[9];
-x q[10];
-x q[11];
-x q[12];
-x q[13];
-x q[14];
-reset q[31];
-reset q[32];
-reset q[33];
-reset q[34];
-reset q[35];
-reset q[36];
-reset q[37];
-reset q[38];
-reset q[39];
-reset q[40];
-reset q[41];
-reset q[42];
-reset q[43];
-reset q[44];
-ccx q[1],q[0],q[31];
-ccx q[31],q[2],q[32];
-ccx q[32],q[3],q[33];
-ccx q[33],q[4],q[34];
-ccx q[34],q[5],q[35];
-ccx q[35],q[6],q[36];
-ccx q[36],q[7],q[37];
-ccx q[37],q[8],q[38];
-ccx q[38],q[9],q[39];
-ccx q[39],q[10],q[40];
-ccx q[40],q[11],q[41];
-ccx q[41],q[12],q[42];
-ccx q[42],q[13],q[43];
-ccx q[43],q[14],q[44];
-z q[44];
-ccx q[43],q[14],q[44];
-ccx q[42],q[13],q[43];
-ccx q[41],q[12],q[42];
-ccx q[40],q[11],q[41];
-ccx q[39],q[10],q[40];
-ccx q[38],q[9],q[39];
-ccx q[37],q[8],q[38];
-ccx q[36],q[7],q[37];
-ccx q[35],q[6],q[36];
-ccx q[34],q[5],q[35];
-ccx q[33],q[4],q[34];
-ccx q[32],q[3],q[33];
-ccx q[31],q[2],q[32];
-ccx q[1],q[0],q[31];
-x q[0];
-x q[1];
-x q[2];
-x q[3];
-x q[4];
-x q[5];
-x q[6];
-x q[7];
-x q[8];
-x q[9];
-x q[10];
-x q[11];
-x q[12];
-x q[13];
-x q[14];
-h q[0];
-h q[1];
-h q[2];
-h q[3];
-h q[4];
-h q[5];
-h q[6];
-h q[7];
-h q[8];
-h q[9];
-h q[10];
-h q[11];
-h q[12];
-h q[13];
-h q[14];
-cx q[0],q[15];
-cx q[1],q[17];
-cx q[2],q[19];
-cx q[3],q[21];
-cx q[4],q[23];
-cx q[5],q[25];
-cx q[6],q[27];
-cx q[7],q[29];
-cx q[8],q[16];
-cx q[8],q[17];
-cx q[9],q[18];
-cx q[9],q[19];
-cx q[10],q[20];
-cx q[10],q[21];
-cx q[11],q[22];
-cx q[11],q[23];
-cx q[12],q[24];
-cx q[12],q[25];
-cx q[13],q[26];
-cx q[13],q[27];
-cx q[14],q[28];
-cx q[14],q[29];
-x q[15];
-x q[17];
-x q[18];
-x q[19];
-x q[20];
-x q[21];
-x q[22];
-x q[23];
-x q[24];
-x q[25];
-x q[26];
-x q[27];
-x q[28];
-x q[29];
-reset q[31];
-reset q[32];
-reset q[33];
-reset q[34];
-reset q[35];
-reset q[36];
-reset q[37];
-reset q[38];
-reset q[39];
-reset q[40];
-reset q[41];
-reset q[42];
-reset q[43];
-reset q[44];
-ccx q[16],q[15],q[31];
-ccx q[31],q[17],q[32];
-ccx q[32],q[18],q[33];
-ccx q[33],q[19],q[34];
-ccx q[34],q[20],q[35];
-ccx q[35],q[21],q[36];
-ccx q[36],q[22],q[37];
-ccx q[37],q[23],q[38];
-ccx q[38],q[24],q[39];
-ccx q[39],q[25],q[40];
-ccx q[40],q[26],q[41];
-ccx q[41],q[27],q[42];
-ccx q[42],q[28],q[43];
-ccx q[43],q[29],q[44];
-z q[44];
-ccx q[43],q[29],q[44];
-ccx q[42],q[28],q[43];
-ccx q[41],q[27],q[42];
-ccx q[40],q[26],q[41];
-ccx q[39],q[25],q[40];
-ccx q[38],q[24],q[39];
-ccx q[37],q[23],q[38];
-ccx q[36],q[22],q[37];
-ccx q[35],q[21],q[36];
-ccx q[34],q[20],q[35];
-ccx q[33],q[19],q[34];
-ccx q[32],q[18],q[33];
-ccx q[31],q[17],q[32];
-ccx q[16],q[15],q[31];
-x q[15];
-x q[17];
-x q[18];
-x q[19];
-x q[20];
-x q[21];
-x q[22];
-x q[23];
-x q[24];
-x q[25];
-x q[26];
-x q[27];
-x q[28];
-x q[29];
-cx q[0],q[15];
-cx q[1],q[17];
-cx q[2],q[19];
-cx q[3],q[21];
-cx q[4],q[23];
-cx q[5],q[25];
-cx q[6],q[27];
-cx q[7],q[29];
-cx q[8],q[16];
-cx q[8],q[17];
-cx q[9],q[18];
-cx q[9],q[19];
-cx q[10],q[20];
-cx q[10],q[21];
-cx q[11],q[22];
-cx q[11],q[23];
-cx q[12],q[24];
-cx q[12],q[25];
-cx q[13],q[26];
-cx q[13],q[27];
-cx q[14],q[28];
-cx q[14],q[29];
-h q[0];
-h q[1];
-h q[2];
-h q[3];
-h q[4];
-h q[5];
-h q[6];
-h q[7];
-h q[8];
-h q[9];
-h q[10];
-h q[11];
-h q[12];
-h q[13];
-h q[14];
-x q[0];
-x q[1];
-x q[2];
-x q[3];
-x q[4];
-x q[5];
-x q[6];
-x q[7];
-x q[8];
-x q[9];
-x q[10];
-x q[11];
-x q[12];
-x q[13];
-x q[14];
-reset q[31];
-reset q[32];
-reset q[33];
-reset q[34];
-reset q[35];
-reset q[36];
-reset q[37];
-reset q[38];
-reset q[39];
-reset q[40];
-reset q[41];
-reset q[42];
-reset q[43];
-reset q[44];
-ccx q[1],q[0],q[31];
-ccx q[31],q[2],q[32];
-ccx q[32],q[3],q[33];
-ccx q[33],q[4],q[34];
-ccx q[34],q[5],q[35];
-ccx q[35],q[6],q[36];
-ccx q[36],q[7],q[37];
-ccx q[37],q[8],q[38];
-ccx q[38],q[9],q[39];
-ccx q[39],q[10],q[40];
-ccx q[40],q[11],q[41];
-ccx q[41],q[12],q[42];
-ccx q[42],q[13],q[43];
-ccx q[43],q[14],q[44];
-z q[44];
-ccx q[43],q[14],q[44];
-ccx q[42],q[13],q[43];
-ccx q[41],q[12],q[42];
-ccx q[40],q[11],q[41];
-ccx q[39],q[10],q[40];
-ccx q[38],q[9],q[39];
-ccx q[37],q[8],q[38];
-ccx q[36],q[7],q[37];
-ccx q[35],q[6],q[36];
-ccx q[34],q[5],q[35];
-ccx q[33],q[4],q[34];
-ccx q[32],q[3],q[33];
-ccx q[31],q[2],q[32];
-ccx q[1],q[0],q[31];
-x q[0];
-x q[1];
-x q[2];
-x q[3];
-x q[4];
-x q[5];
-x q[6];
-x q[7];
-x q[8];
-x q[9];
-x q[10];
-x q[11];
-x q[12];
-x q[13];
-x q[14];
-h q[0];
-h q[1];
-h q[2];
-h q[3];
-h q[4];
-h q[5];
-h q[6];
-h q[7];
-h q[8];
-h q[9];
-h q[10];
-h q[11];
-h q[12];
-h q[13];
-h q[14];
-cx q[0],q[15];
-cx q[1],q[17];
-cx q[2],q[19];
-cx q[3],q[21];
-cx q[4],q[23];
-cx q[5],q[25];
-cx q[6],q[27];
-cx q[7],q[29];
-cx q[8],q[16];
-cx q[8],q[17];
-cx q[9],q[18];
-cx q[9],q[19];
-cx q[10],q[20];
-cx q[10],q[21];
-cx q[11],q[22];
-cx q[11],q[23];
-cx q[12],q[24];
-cx q[12],q[25];
-cx q[13],q[26];
-cx q[13],q[27];
-cx q[14],q[28];
-cx q[14],q[29];
-x q[15];
-x q[17];
-x q[18];
-x q[19];
-x q[20];
-x q[21];
-x q[22];
-x q[23];
-x q[24];
-x q[25];
-x q[26];
-x q[27];
-x q[28];
-x q[29];
-reset q[31];
-reset q[32];
-reset q[33];
-reset q[34];
-reset q[35];
-reset q[36];
-reset q[37];
-reset q[38];
-reset q[39];
-reset q[40];
-reset q[41];
-reset q[42];
-reset q[43];
-reset q[44];
-ccx q[16],q[15],q[31];
-ccx q[31],q[17],q[32];
-ccx q[32],q[18],q[33];
-ccx q[33],q[19],q[34];
-ccx q[34],q[20],q[35];
-ccx q[35],q[21],q[36];
-ccx q[36],q[22],q[37];
-ccx q[37],q[23],q[38];
-ccx q[38],q[24],q[39];
-ccx q[39],q[25],q[40];
-ccx q[40],q[26],q[41];
-ccx q[41],q[27],q[42];
-ccx q[42],q[28],q[43];
-ccx q[43],q[29],q[44];
-z q[44];
-ccx q[43],q[29],q[44];
-ccx q[42],q[28],q[43];
-ccx q[41],q[27],q[42];
-ccx q[40],q[26],q[41];
-ccx q[39],q[25],q[40];
-ccx q[38],q[24],q[39];
-ccx q[37],q[23],q[38];
-ccx q[36],q[22],q[37];
-ccx q[35],q[21],q[36];
-ccx q[34],q[20],q[35];
-ccx q[33],q[19],q[34];
-ccx q[32],q[18],q[33];
-ccx q[31],q[17],q[32];
-ccx q[16],q[15],q[31];
-x q[15];
-x q[17];
-x q[18];
-x q[19];
-x q[20];
-x q[21];
-x q[22];
-x q[23];
-x q[24];
-x q[25];
-x q[26];
-x q[27];
-x q[28];
-x q[29];
-cx q[0],q[15];
-cx q[1],q[17];
-cx q[2],q[19];
-cx q[3],q[21];
-cx q[4],q[23];
-cx q[5],q[25];
-cx q[6],q[27];
-cx q[7],q[29];
-cx q[8],q[16];
-cx q[8],q[17];
-cx q[9],q[18];
-cx q[9],q[19];
-cx q[10],q[20];
-cx q[10],q[21];
-cx q[11],q[22];
-cx q[11],q[23];
-cx q[12],q[24];
-cx q[12],q[25];
-cx q[13],q[26];
-cx q[13],q[27];
-cx q[14],q[28];
-cx q[14],q[29];
-h q[0];
-h q[1];
-h q[2];
-h q[3];
-h q[4];
-h q[5];
-h q[6];
-h q[7];
-h q[8];
-h q[9];
-h q[10];
-h q[11];
-h q[12];
-h q[13];
-h q[14];
-x q[0];
-x q[1];
-x q[2];
-x q[3];
-x q[4];
-x q[5];
-x q[6];
-x q[7];
-x q[8];
-x q[9];
-x q[10];
-x q[11];
-x q[12];
-x q[13];
-x q[14];
-reset q[31];
-reset q[32];
-reset q[33];
-reset q[34];
-reset q[35];
-reset q[36];
-reset q[37];
-reset q[38];
-reset q[39];
-reset q[40];
-reset q[41];
-reset q[42];
-reset q[43];
-reset q[44];
-ccx q[1],q[0],q[31];
-ccx q[31],q[2],q[32];
-ccx q[32],q[3],q[33];
-ccx q[33],q[4],q[34];
-ccx q[34],q[5],q[35];
-ccx q[35],q[6],q[36];
-ccx q[36],q[7],q[37];
-ccx q[37],q[8],q[38];
-ccx q[38],q[9],q[39];
-ccx q[39],q[10],q[40];
-ccx q[40],q[11],q[41];
-ccx q[41],q[12],q[42];
-ccx q[42],q[13],q[43];
-ccx q[43],q[14],q[44];
-z q[44];
-ccx q[43],q[14],q[44];
-ccx q[42],q[13],q[43];
-ccx q[41],q[12],q[42];
-ccx q[40],q[11],q[41];
-ccx q[39],q[10],q[40];
-ccx q[38],q[9],q[39];
-ccx q[37],q[8],q[38];
-ccx q[36],q[7],q[37];
-ccx q[35],q[6],q[36];
-ccx q[34],q[5],q[35];
-ccx q[33],q[4],q[34];
-ccx q[32],q[3],q[33];
-ccx q[31],q[2],q[32];
-ccx q[1],q[0],q[31];
-x q[0];
-x q[1];
-x q[2];
-x q[3];
-x q[4];
-x q[5];
-x q[6];
-x q[7];
-x q[8];
-x q[9];
-x q[10];
-x q[11];
-x q[12];
-x q[13];
-x q[14];
-h q[0];
-h q[1];
-h q[2];
-h q[3];
-h q[4];
-h q[5];
-h q[6];
-h q[7];
-h q[8];
-h q[9];
-h q[10];
-h q[11];
-h q[12];
-h q[13];
-h q[14];
-cx q[0],q[15];
-cx q[1],q[17];
-cx q[2],q[19];
-cx q[3],q[21];
-cx q[4],q[23];
-cx q[5],q[25];
-cx q[6],q[27];
-cx q[7],q[29];
-cx q[8],q[16];
-cx q[8],q[17];
-cx q[9],q[18];
-cx q[9],q[19];
-cx q[10],q[20];
-cx q[10],q[21];
-cx q[11],q[22];
-cx q[11],q[23];
-cx q[12],q[24];
-cx q[12],q[25];
-cx q[13],q[26];
-cx q[13],q[27];
-cx q[14],q[28];
-cx q[14],q[29];
-x q[15];
-x q[17];
-x q[18];
-x q[19];
-x q[20];
-x q[21];
-x q[22];
-x q[23];
-x q[24];
-x q[25];
-x q[26];
-x q[27];
-x q[28];
-x q[29];
-reset q[31];
-reset q[32];
-reset q[33];
-reset q[34];
-reset q[35];
-reset q[36];
-reset q[37];
-reset q[38];
-reset q[39];
-reset q[40];
-reset q[41];
-reset q[42];
-reset q[43];
-reset q[44];
-ccx q[16],q[15],q[31];
-ccx q[31],q[17],q[32];
-ccx q[32],q[18],q[33];
-ccx q[33],q[19],q[34];
-ccx q[34],q[20],q[35];
-ccx q[35],q[21],q[36];
-ccx q[36],q[22],q[37];
-ccx q[37],q[23],q[38];
-ccx q[38],q[24],q[39];
-ccx q[39],q[25],q[40];
-ccx q[40],q[26],q[41];
-ccx q[41],q[27],q[42];
-ccx q[42],q[28],q[43];
-ccx q[43],q[29],q[44];
-z q[44];
-ccx q[43],q[29],q[44];
-ccx q[42],q[28],q[43];
-ccx q[41],q[27],q[42];
-ccx q[40],q[26],q[41];
-ccx q[39],q[25],q[40];
-ccx q[38],q[24],q[39];
-ccx q[37],q[23],q[38];
-ccx q[36],q[22],q[37];
-ccx q[35],q[21],q[36];
-ccx q[34],q[20],q[35];
-ccx q[33],q[19],q[34];
-ccx q[32],q[18],q[33];
-ccx q[31],q[17],q[32];
-ccx q[16],q[15],q[31];
-x q[15];
-x q[17];
-x q[18];
-x q[19];
-x q[20];
-x q[21];
-x q[22];
-x q[23];
-x q[24];
-x q[25];
-x q[26];
-x q[27];
-x q[28];
-x q[29];
-cx q[0],q[15];
-cx q[1],q[17];
-cx q[2],q[19];
-cx q[3],q[21];
-cx q[4],q[23];
-cx q[5],q[25];
-cx q[6],q[27];
-cx q[7],q[29];
-cx q[8],q[16];
-cx q[8],q[17];
-cx q[9],q[18];
-cx q[9],q[19];
-cx q[10],q[20];
-cx q[10],q[21];
-cx q[11],q[22];
-cx q[11],q[23];
-cx q[12],q[24];
-cx q[12],q[25];
-cx q[13],q[26];
-cx q[13],q[27];
-cx q[14],q[28];
-cx q[14],q[29];
-h q[0];
-h q[1];
-h q[2];
-h q[3];
-h q[4];
-h q[5];
-h q[6];
-h q[7];
-h q[8];
-h q[9];
-h q[10];
-h q[11];
-h q[12];
-h q[13];
-h q[14];
-x q[0];
-x q[1];
-x q[2];
-x q[3];
-x q[4];
-x q[5];
-x q[6];
-x q[7];
-x q[8];
-x q[9];
-x q[10];
-x q[11];
-x q[12];
-x q[13];
-x q[14];
-reset q[31];
-reset q[32];
-reset q[33];
-reset q[34];
-reset q[35];
-reset q[36];
-reset q[37];
-reset q[38];
-reset q[39];
-reset q[40];
-reset q[41];
-reset q[42];
-reset q[43];
-reset q[44];
-ccx q[1],q[0],q[31];
-ccx q[31],q[2],q[32];
-ccx q[32],q[3],q[33];
-ccx q[33],q[4],q[34];
-ccx q[34],q[5],q[35];
-ccx q[35],q[6],q[36];
-ccx q[36],q[7],q[37];
-ccx q[37],q[8],q[38];
-ccx q[38],q[9],q[39];
-ccx q[39],q[10],q[40];
-ccx q[40],q[11],q[41];
-ccx q[41],q[12],q[42];
-ccx q[42],q[13],q[43];
-ccx q[43],q[14],q[44];
-z q[44];
-ccx q[43],q[14],q[44];
-ccx q[42],q[13],q[43];
-ccx q[41],q[12],q[42];
-ccx q[40],q[11],q[41];
-ccx q[39],q[10],q[40];
-ccx q[38],q[9],q[39];
-ccx q[37],q[8],q[38];
-ccx q[36],q[7],q[37];
-ccx q[35],q[6],q[36];
-ccx q[34],q[5],q[35];
-ccx q[33],q[4],q[34];
-ccx q[32],q[3],q[33];
-ccx q[31],q[2],q[32];
-ccx q[1],q[0],q[31];
-x q[0];
-x q[1];
-x q[2];
-x q[3];
-x q[4];
-x q[5];
-x q[6];
-x q[7];
-x q[8];
-x q[9];
-x q[10];
-x q[11];
-x q[12];
-x q[13];
-x q[14];
-h q[0];
-h q[1];
-h q[2];
-h q[3];
-h q[4];
-h q[5];
-h q[6];
-h q[7];
-h q[8];
-h q[9];
-h q[10];
-h q[11];
-h q[12];
-h q[13];
-h q[14];
-cx q[0],q[15];
-cx q[1],q[17];
-cx q[2],q[19];
-cx q[3],q[21];
-cx q[4],q[23];
-cx q[5],q[25];
-cx q[6],q[27];
-cx q[7],q[29];
-cx q[8],q[16];
-cx q[8],q[17];
-cx q[9],q[18];
-cx q[9],q[19];
-cx q[10],q[20];
-cx q[10],q[21];
-cx q[11],q[22];
-cx q[11],q[23];
-cx q[12],q[24];
-cx q[12],q[25];
-cx q[13],q[26];
-cx q[13],q[27];
-cx q[14],q[28];
-cx q[14],q[29];
-x q[15];
-x q[17];
-x q[18];
-x q[19];
-x q[20];
-x q[21];
-x q[22];
-x q[23];
-x q[24];
-x q[25];
-x q[26];
-x q[27];
-x q[28];
-x q[29];
-reset q[31];
-reset q[32];
-reset q[33];
-reset q[34];
-reset q[35];
-reset q[36];
-reset q[37];
-reset q[38];
-reset q[39];
-reset q[40];
-reset q[41];
-reset q[42];
-reset q[43];
-reset q[44];
-ccx q[16],q[15],q[31];
-ccx q[31],q[17],q[32];
-ccx q[32],q[18],q[33];
-ccx q[33],q[19],q[34];
-ccx q[34],q[20],q[35];
-ccx q[35],q[21],q[36];
-ccx q[36],q[22],q[37];
-ccx q[37],q[23],q[38];
-ccx q[38],q[24],q[39];
-ccx q[39],q[25],q[40];
-ccx q[40],q[26],q[41];
-ccx q[41],q[27],q[42];
-ccx q[42],q[28],q[43];
-ccx q[43],q[29],q[44];
-z q[44];
-ccx q[43],q[29],q[44];
-ccx q[42],q[28],q[43];
-ccx q[41],q[27],q[42];
-ccx q[40],q[26],q[41];
-ccx q[39],q[25],q[40];
-ccx q[38],q[24],q[39];
-ccx q[37],q[23],q[38];
-ccx q[36],q[22],q[37];
-ccx q[35],q[21],q[36];
-ccx q[34],q[20],q[35];
-ccx q[33],q[19],q[34];
-ccx q[32],q[18],q[33];
-ccx q[31],q[17],q[32];
-ccx q[16],q[15],q[31];
-x q[15];
-x q[17];
-x q[18];
-x q[19];
-x q[20];
-x q[21];
-x q[22];
-x q[23];
-x q[24];
-x q[25];
-x q[26];
-x q[27];
-x q[28];
-x q[29];
-cx q[0],q[15];
-cx q[1],q[17];
-cx q[2],q[19];
-cx q[3],q[21];
-cx q[4],q[23];
-cx q[5],q[25];
-cx q[6],q[27];
-cx q[7],q[29];
-cx q[8],q[16];
-cx q[8],q[17];
-cx q[9],q[18];
-cx q[9],q[19];
-cx q[10],q[20];
-cx q[10],q[21];
-cx q[11],q[22];
-cx q[11],q[23];
-cx q[12],q[24];
-cx q[12],q[25];
-cx q[13],q[26];
-cx q[13],q[27];
-cx q[14],q[28];
-cx q[14],q[29];
-h q[0];
-h q[1];
-h q[2];
-h q[3];
-h q[4];
-h q[5];
-h q[6];
-h q[7];
-h q[8];
-h q[9];
-h q[10];
-h q[11];
-h q[12];
-h q[13];
-h q[14];
-x q[0];
-x q[1];
-x q[2];
-x q[3];
-x q[4];
-x q[5];
-x q[6];
-x q[7];
-x q[8];
-x q[9];
-x q[10];
-x q[11];
-x q[12];
-x q[13];
-x q[14];
-reset q[31];
-reset q[32];
-reset q[33];
-reset q[34];
-reset q[35];
-reset q[36];
-reset q[37];
-reset q[38];
-reset q[39];
-reset q[40];
-reset q[41];
-reset q[42];
-reset q[43];
-reset q[44];
-ccx q[1],q[0],q[31];
-ccx q[31],q[2],q[32];
-ccx q[32],q[3],q[33];
-ccx q[33],q[4],q[34];
-ccx q[34],q[5],q[35];
-ccx q[35],q[6],q[36];
-ccx q[36],q[7],q[37];
-ccx q[37],q[8],q[38];
-ccx q[38],q[9],q[39];
-ccx q[39],q[10],q[40];
-ccx q[40],q[11],q[41];
-ccx q[41],q[12],q[42];
-ccx q[42],q[13],q[43];
-ccx q[43],q[14],q[44];
-z q[44];
-ccx q[43],q[14],q[44];
-ccx q[42],q[13],q[43];
-ccx q[41],q[12],q[42];
-ccx q[40],q[11],q[41];
-ccx q[39],q[10],q[40];
-ccx q[38],q[9],q[39];
-ccx q[37],q[8],q[38];
-ccx q[36],q[7],q[37];
-ccx q[35],q[6],q[36];
-ccx q[34],q[5],q[35];
-ccx q[33],q[4],q[34];
-ccx q[32],q[3],q[33];
-ccx q[31],q[2],q[32];
-ccx q[1],q[0],q[31];
-x q[0];
-x q[1];
-x q[2];
-x q[3];
-x q[4];
-x q[5];
-x q[6];
-x q[7];
-x q[8];
-x q[9];
-x q[10];
-x q[11];
-x q[12];
-x q[13];
-x q[14];
-h q[0];
-h q[1];
-h q[2];
-h q[3];
-h q[4];
-h q[5];
-h q[6];
-h q[7];
-h q[8];
-h q[9];
-h q[10];
-h q[11];
-h q[12];
-h q[13];
-h q[14];
-cx q[0],q[15];
-cx q[1],q[17];
-cx q[2],q[19];
-cx q[3],q[21];
-cx q[4],q[23];
-cx q[5],q[25];
-cx q[6],q[27];
-cx q[7],q[29];
-cx q[8],q[16];
-cx q[8],q[17];
-cx q[9],q[18];
-cx q[9],q[19];
-cx q[10],q[20];
-cx q[10],q[21];
-cx q[11],q[22];
-cx q[11],q[23];
-cx q[12],q[24];
-cx q[12],q[25];
-cx q[13],q[26];
-cx q[13],q[27];
-cx q[14],q[28];
-cx q[14],q[29];
-x q[15];
-x q[17];
-x q[18];
-x q[19];
-x q[20];
-x q[21];
-x q[22];
-x q[23];
-x q[24];
-x q[25];
-x q[26];
-x q[27];
-x q[28];
-x q[29];
-reset q[31];
-reset q[32];
-reset q[33];
-reset q[34];
-reset q[35];
-reset q[36];
-reset q[37];
-reset q[38];
-reset q[39];
-reset q[40];
-reset q[41];
-reset q[42];
-reset q[43];
-reset q[44];
-ccx q[16],q[15],q[31];
-ccx q[31],q[17],q[32];
-ccx q[32],q[18],q[33];
-ccx q[33],q[19],q[34];
-ccx q[34],q[20],q[35];
-ccx q[35],q[21],q[36];
-ccx q[36],q[22],q[37];
-ccx q[37],q[23],q[38];
-ccx q[38],q[24],q[39];
-ccx q[39],q[25],q[40];
-ccx q[40],q[26],q[41];
-ccx q[41],q[27],q[42];
-ccx q[42],q[28],q[43];
-ccx q[43],q[29],q[44];
-z q[44];
-ccx q[43],q[29],q[44];
-ccx q[42],q[28],q[43];
-ccx q[41],q[27],q[42];
-ccx q[40],q[26],q[41];
-ccx q[39],q[25],q[40];
-ccx q[38],q[24],q[39];
-ccx q[37],q[23],q[38];
-ccx q[36],q[22],q[37];
-ccx q[35],q[21],q[36];
-ccx q[34],q[20],q[35];
-ccx q[33],q[19],q[34];
-ccx q[32],q[18],q[33];
-ccx q[31],q[17],q[32];
-ccx q[16],q[15],q[31];
-x q[15];
-x q[17];
-x q[18];
-x q[19];
-x q[20];
-x q[21];
-x q[22];
-x q[23];
-x q[24];
-x q[25];
-x q[26];
-x q[27];
-x q[28];
-x q[29];
-cx q[0],q[15];
-cx q[1],q[17];
-cx q[2],q[19];
-cx q[3],q[21];
-cx q[4],q[23];
-cx q[5],q[25];
-cx q[6],q[27];
-cx q[7],q[29];
-cx q[8],q[16];
-cx q[8],q[17];
-cx q[9],q[18];
-cx q[9],q[19];
-cx q[10],q[20];
-cx q[10],q[21];
-cx q[11],q[22];
-cx q[11],q[23];
-cx q[12],q[24];
-cx q[12],q[25];
-cx q[13],q[26];
-cx q[13],q[27];
-cx q[14],q[28];
-cx q[14],q[29];
-h q[0];
-h q[1];
-h q[2];
-h q[3];
-h q[4];
-h q[5];
-h q[6];
-h q[7];
-h q[8];
-h q[9];
-h q[10];
-h q[11];
-h q[12];
-h q[13];
-h q[14];
-x q[0];
-x q[1];
-x q[2];
-x q[3];
-x q[4];
-x q[5];
-x q[6];
-x q[7];
-x q[8];
-x q[9];
-x q[10];
-x q[11];
-x q[12];
-x q[13];
-x q[14];
-reset q[31];
-reset q[32];
-reset q[33];
-reset q[34];
-reset q[35];
-reset q[36];
-reset q[37];
-reset q[38];
-reset q[39];
-reset q[40];
-reset q[41];
-reset q[42];
-reset q[43];
-reset q[44];
-ccx q[1],q[0],q[31];
-ccx q[31],q[2],q[32];
-ccx q[32],q[3],q[33];
-ccx q[33],q[4],q[34];
-ccx q[34],q[5],q[35];
-ccx q[35],q[6],q[36];
-ccx q[36],q[7],q[37];
-ccx q[37],q[8],q[38];
-ccx q[38],q[9],q[39];
-ccx q[39],q[10],q[40];
-ccx q[40],q[11],q[41];
-ccx q[41],q[12],q[42];
-ccx q[42],q[13],q[43];
-ccx q[43],q[14],q[44];
-z q[44];
-ccx q[43],q[14],q[44];
-ccx q[42],q[13],q[43];
-ccx q[41],q[12],q[42];
-ccx q[40],q[11],q[41];
-ccx q[39],q[10],q[40];
-ccx q[38],q[9],q[39];
-ccx q[37],q[8],q[38];
-ccx q[36],q[7],q[37];
-ccx q[35],q[6],q[36];
-ccx q[34],q[5],q[35];
-ccx q[33],q[4],q[34];
-ccx q[32],q[3],q[33];
-ccx q[31],q[2],q[32];
-ccx q[1],q[0],q[31];
-x q[0];
-x q[1];
-x q[2];
-x q[3];
-x q[4];
-x q[5];
-x q[6];
-x q[7];
-x q[8];
-x q[9];
-x q[10];
-x q[11];
-x q[12];
-x q[13];
-x q[14];
-h q[0];
-h q[1];
-h q[2];
-h q[3];
-h q[4];
-h q[5];
-h q[6];
-h q[7];
-h q[8];
-h q[9];
-h q[10];
-h q[11];
-h q[12];
-h q[13];
-h q[14];
-cx q[0],q[15];
-cx q[1],q[17];
-cx q[2],q[19];
-cx q[3],q[21];
-cx q[4],q[23];
-cx q[5],q[25];
-cx q[6],q[27];
-cx q[7],q[29];
-cx q[8],q[16];
-cx q[8],q[17];
-cx q[9],q[18];
-cx q[9],q[19];
-cx q[10],q[20];
-cx q[10],q[21];
-cx q[11],q[22];
-cx q[11],q[23];
-cx q[12],q[24];
-cx q[12],q[25];
-cx q[13],q[26];
-cx q[13],q[27];
-cx q[14],q[28];
-cx q[14],q[29];
-x q[15];
-x q[17];
-x q[18];
-x q[19];
-x q[20];
-x q[21];
-x q[22];
-x q[23];
-x q[24];
-x q[25];
-x q[26];
-x q[27];
-x q[28];
-x q[29];
-reset q[31];
-reset q[32];
-reset q[33];
-reset q[34];
-reset q[35];
-reset q[36];
-reset q[37];
-reset q[38];
-reset q[39];
-reset q[40];
-reset q[41];
-reset q[42];
-reset q[43];
-reset q[44];
-ccx q[16],q[15],q[31];
-ccx q[31],q[17],q[32];
-ccx q[32],q[18],q[33];
-ccx q[33],q[19],q[34];
-ccx q[34],q[20],q[35];
-ccx q[35],q[21],q[36];
-ccx q[36],q[22],q[37];
-ccx q[37],q[23],q[38];
-ccx q[38],q[24],q[39];
-ccx q[39],q[25],q[40];
-ccx q[40],q[26],q[41];
-ccx q[41],q[27],q[42];
-ccx q[42],q[28],q[43];
-ccx q[43],q[29],q[44];
-z q[44];
-ccx q[43],q[29],q[44];
-ccx q[42],q[28],q[43];
-ccx q[41],q[27],q[42];
-ccx q[40],q[26],q[41];
-ccx q[39],q[25],q[40];
-ccx q[38],q[24],q[39];
-ccx q[37],q[23],q[38];
-ccx q[36],q[22],q[37];
-ccx q[35],q[21],q[36];
-ccx q[34],q[20],q[35];
-ccx q[33],q[19],q[34];
-ccx q[32],q[18],q[33];
-ccx q[31],q[17],q[32];
-ccx q[16],q[15],q[31];
-x q[15];
-x q[17];
-x q[18];
-x q[19];
-x q[20];
-x q[21];
-x q[22];
-x q[23];
-x q[24];
-x q[25];
-x q[26];
-x q[27];
-x q[28];
-x q[29];
-cx q[0],q[15];
-cx q[1],q[17];
-cx q[2],q[19];
-cx q[3],q[21];
-cx q[4],q[23];
-cx q[5],q[25];
-cx q[6],q[27];
-cx q[7],q[29];
-cx q[8],q[16];
-cx q[8],q[17];
-cx q[9],q[18];
-cx q[9],q[19];
-cx q[10],q[20];
-cx q[10],q[21];
-cx q[11],q[22];
-cx q[11],q[23];
-cx q[12],q[24];
-cx q[12],q[25];
-cx q[13],q[26];
-cx q[13],q[27];
-cx q[14],q[28];
-cx q[14],q[29];
-h q[0];
-h q[1];
-h q[2];
-h q[3];
-h q[4];
-h q[5];
-h q[6];
-h q[7];
-h q[8];
-h q[9];
-h q[10];
-h q[11];
-h q[12];
-h q[13];
-h q[14];
-x q[0];
-x q[1];
-x q[2];
-x q[3];
-x q[4];
-x q[5];
-x q[6];
-x q[7];
-x q[8];
-x q[9];
-x q[10];
-x q[11];
-x q[12];
-x q[13];
-x q[14];
-reset q[31];
-reset q[32];
-reset q[33];
-reset q[34];
-reset q[35];
-reset q[36];
-reset q[37];
-reset q[38];
-reset q[39];
-reset q[40];
-reset q[41];
-reset q[42];
-reset q[43];
-reset q[44];
-ccx q[1],q[0],q[31];
-ccx q[31],q[2],q[32];
-ccx q[32],q[3],q[33];
-ccx q[33],q[4],q[34];
-ccx q[34],q[5],q[35];
-ccx q[35],q[6],q[36];
-ccx q[36],q[7],q[37];
-ccx q[37],q[8],q[38];
-ccx q[38],q[9],q[39];
-ccx q[39],q[10],q[40];
-ccx q[40],q[11],q[41];
-ccx q[41],q[12],q[42];
-ccx q[42],q[13],q[43];
-ccx q[43],q[14],q[44];
-z q[44];
-ccx q[43],q[14],q[44];
-ccx q[42],q[13],q[43];
-ccx q[41],q[12],q[42];
-ccx q[40],q[11],q[41];
-ccx q[39],q[10],q[40];
-ccx q[38],q[9],q[39];
-ccx q[37],q[8],q[38];
-ccx q[36],q[7],q[37];
-ccx q[35],q[6],q[36];
-ccx q[34],q[5],q[35];
-ccx q[33],q[4],q[34];
-ccx q[32],q[3],q[33];
-ccx q[31],q[2],q[32];
-ccx q[1],q[0],q[31];
-x q[0];
-x q[1];
-x q[2];
-x q[3];
-x q[4];
-x q[5];
-x q[6];
-x q[7];
-x q[8];
-x q[9];
-x q[10];
-x q[11];
-x q[12];
-x q[13];
-x q[14];
-h q[0];
-h q[1];
-h q[2];
-h q[3];
-h q[4];
-h q[5];
-h q[6];
-h q[7];
-h q[8];
-h q[9];
-h q[10];
-h q[11];
-h q[12];
-h q[13];
-h q[14];
-cx q[0],q[15];
-cx q[1],q[17];
-cx q[2],q[19];
-cx q[3],q[21];
-cx q[4],q[23];
-cx q[5],q[25];
-cx q[6],q[27];
-cx q[7],q[29];
-cx q[8],q[16];
-cx q[8],q[17];
-cx q[9],q[18];
-cx q[9],q[19];
-cx q[10],q[20];
-cx q[10],q[21];
-cx q[11],q[22];
-cx q[11],q[23];
-cx q[12],q[24];
-cx q[12],q[25];
-cx q[13],q[26];
-cx q[13],q[27];
-cx q[14],q[28];
-cx q[14],q[29];
-x q[15];
-x q[17];
-x q[18];
-x q[19];
-x q[20];
-x q[21];
-x q[22];
-x q[23];
-x q[24];
-x q[25];
-x q[26];
-x q[27];
-x q[28];
-x q[29];
-reset q[31];
-reset q[32];
-reset q[33];
-reset q[34];
-reset q[35];
-reset q[36];
-reset q[37];
-reset q[38];
-reset q[39];
-reset q[40];
-reset q[41];
-reset q[42];
-reset q[43];
-reset q[44];
-ccx q[16],q[15],q[31];
-ccx q[31],q[17],q[32];
-ccx q[32],q[18],q[33];
-ccx q[33],q[19],q[34];
-ccx q[34],q[20],q[35];
-ccx q[35],q[21],q[36];
-ccx q[36],q[22],q[37];
-ccx q[37],q[23],q[38];
-ccx q[38],q[24],q[39];
-ccx q[39],q[25],q[40];
-ccx q[40],q[26],q[41];
-ccx q[41],q[27],q[42];
-ccx q[42],q[28],q[43];
-ccx q[43],q[29],q[44];
-z q[44];
-ccx q[43],q[29],q[44];
-ccx q[42],q[28],q[43];
-ccx q[41],q[27],q[42];
-ccx q[40],q[26],q[41];
-ccx q[39],q[25],q[40];
-ccx q[38],q[24],q[39];
-ccx q[37],q[23],q[38];
-ccx q[36],q[22],q[37];
-ccx q[35],q[21],q[36];
-ccx q[34],q[20],q[35];
-ccx q[33],q[19],q[34];
-ccx q[32],q[18],q[33];
-ccx q[31],q[17],q[32];
-ccx q[16],q[15],q[31];
-x q[15];
-x q[17];
-x q[18];
-x q[19];
-x q[20];
-x q[21];
-x q[22];
-x q[23];
-x q[24];
-x q[25];
-x q[26];
-x q[27];
-x q[28];
-x q[29];
-cx q[0],q[15];
-cx q[1],q[17];
-cx q[2],q[19];
-cx q[3],q[21];
-cx q[4],q[23];
-cx q[5],q[25];
-cx q[6],q[27];
-cx q[7],q[29];
-cx q[8],q[16];
-cx q[8],q[17];
-cx q[9],q[18];
-cx q[9],q[19];
-cx q[10],q[20];
-cx q[10],q[21];
-cx q[11],q[22];
-cx q[11],q[23];
-cx q[12],q[24];
-cx q[12],q[25];
-cx q[13],q[26];
-cx q[13],q[27];
-cx q[14],q[28];
-cx q[14],q[29];
-h q[0];
-h q[1];
-h q[2];
-h q[3];
-h q[4];
-h q[5];
-h q[6];
-h q[7];
-h q[8];
-h q[9];
-h q[10];
-h q[11];
-h q[12];
-h q[13];
-h q[14];
-x q[0];
-x q[1];
-x q[2];
-x q[3];
-x q[4];
-x q[5];
-x q[6];
-x q[7];
-x q[8];
-x q[9];
-x q[10];
-x q[11];
-x q[12];
-x q[13];
-x q[14];
-reset q[31];
-reset q[32];
-reset q[33];
-reset q[34];
-reset q[35];
-reset q[36];
-reset q[37];
-reset q[38];
-reset q[39];
-reset q[40];
-reset q[41];
-reset q[42];
-reset q[43];
-reset q[44];
-ccx q[1],q[0],q[31];
-ccx q[31],q[2],q[32];
-ccx q[32],q[3],q[33];
-ccx q[33],q[4],q[34];
-ccx q[34],q[5],q[35];
-ccx q[35],q[6],q[36];
-ccx q[36],q[7],q[37];
-ccx q[37],q[8],q[38];
-ccx q[38],q[9],q[39];
-ccx q[39],q[10],q[40];
-ccx q[40],q[11],q[41];
-ccx q[41],q[12],q[42];
-ccx q[42],q[13],q[43];
-ccx q[43],q[14],q[44];
-z q[44];
-ccx q[43],q[14],q[44];
-ccx q[42],q[13],q[43];
-ccx q[41],q[12],q[42];
-ccx q[40],q[11],q[41];
-ccx q[39],q[10],q[40];
-ccx q[38],q[9],q[39];
-ccx q[37],q[8],q[38];
-ccx q[36],q[7],q[37];
-ccx q[35],q[6],q[36];
-ccx q[34],q[5],q[35];
-ccx q[33],q[4],q[34];
-ccx q[32],q[3],q[33];
-ccx q[31],q[2],q[32];
-ccx q[1],q[0],q[31];
-x q[0];
-x q[1];
-x q[2];
-x q[3];
-x q[4];
-x q[5];
-x q[6];
-x q[7];
-x q[8];
-x q[9];
-x q[10];
-x q[11];
-x q[12];
-x q[13];
-x q[14];
-h q[0];
-h q[1];
-h q[2];
-h q[3];
-h q[4];
-h q[5];
-h q[6];
-h q[7];
-h q[8];
-h q[9];
-h q[10];
-h q[11];
-h q[12];
-h q[13];
-h q[14];
-cx q[0],q[15];
-cx q[1],q[17];
-cx q[2],q[19];
-cx q[3],q[21];
-cx q[4],q[23];
-cx q[5],q[25];
-cx q[6],q[27];
-cx q[7],q[29];
-cx q[8],q[16];
-cx q[8],q[17];
-cx q[9],q[18];
-cx q[9],q[19];
-cx q[10],q[20];
-cx q[10],q[21];
-cx q[11],q[22];
-cx q[11],q[23];
-cx q[12],q[24];
-cx q[12],q[25];
-cx q[13],q[26];
-cx q[13],q[27];
-cx q[14],q[28];
-cx q[14],q[29];
-x q[15];
-x q[17];
-x q[18];
-x q[19];
-x q[20];
-x q[21];
-x q[22];
-x q[23];
-x q[24];
-x q[25];
-x q[26];
-x q[27];
-x q[28];
-x q[29];
-reset q[31];
-reset q[32];
-reset q[33];
-reset q[34];
-reset q[35];
-reset q[36];
-reset q[37];
-reset q[38];
-reset q[39];
-reset q[40];
-reset q[41];
-reset q[42];
-reset q[43];
-reset q[44];
-ccx q[16],q[15],q[31];
-ccx q[31],q[17],q[32];
-ccx q[32],q[18],q[33];
-ccx q[33],q[19],q[34];
-ccx q[34],q[20],q[35];
-ccx q[35],q[21],q[36];
-ccx q[36],q[22],q[37];
-ccx q[37],q[23],q[38];
-ccx q[38],q[24],q[39];
-ccx q[39],q[25],q[40];
-ccx q[40],q[26],q[41];
-ccx q[41],q[27],q[42];
-ccx q[42],q[28],q[43];
-ccx q[43],q[29],q[44];
-z q[44];
-ccx q[43],q[29],q[44];
-ccx q[42],q[28],q[43];
-ccx q[41],q[27],q[42];
-ccx q[40],q[26],q[41];
-ccx q[39],q[25],q[40];
-ccx q[38],q[24],q[39];
-ccx q[37],q[23],q[38];
-ccx q[36],q[22],q[37];
-ccx q[35],q[21],q[36];
-ccx q[34],q[20],q[35];
-ccx q[33],q[19],q[34];
-ccx q[32],q[18],q[33];
-ccx q[31],q[17],q[32];
-ccx q[16],q[15],q[31];
-x q[15];
-x q[17];
-x q[18];
-x q[19];
-x q[20];
-x q[21];
-x q[22];
-x q[23];
-x q[24];
-x q[25];
-x q[26];
-x q[27];
-x q[28];
-x q[29];
-cx q[0],q[15];
-cx q[1],q[17];
-cx q[2],q[19];
-cx q[3],q[21];
-cx q[4],q[23];
-cx q[5],q[25];
-cx q[6],q[27];
-cx q[7],q[29];
-cx q[8],q[16];
-cx q[8],q[17];
-cx q[9],q[18];
-cx q[9],q[19];
-cx q[10],q[20];
-cx q[10],q[21];
-cx q[11],q[22];
-cx q[11],q[23];
-cx q[12],q[24];
-cx q[12],q[25];
-cx q[13],q[26];
-cx q[13],q[27];
-cx q[14],q[28];
-cx q[14],q[29];
-h q[0];
-h q[1];
-h q[2];
-h q[3];
-h q[4];
-h q[5];
-h q[6];
-h q[7];
-h q[8];
-h q[9];
-h q[10];
-h q[11];
-h q[12];
-h q[13];
-h q[14];
-x q[0];
-x q[1];
-x q[2];
-x q[3];
-x q[4];
-x q[5];
-x q[6];
-x q[7];
-x q[8];
-x q[9];
-x q[10];
-x q[11];
-x q[12];
-x q[13];
-x q[14];
-reset q[31];
-reset q[32];
-reset q[33];
-reset q[34];
-reset q[35];
-reset q[36];
-reset q[37];
-reset q[38];
-reset q[39];
-reset q[40];
-reset q[41];
-reset q[42];
-reset q[43];
-reset q[44];
-ccx q[1],q[0],q[31];
-ccx q[31],q[2],q[32];
-ccx q[32],q[3],q[33];
-ccx q[33],q[4],q[34];
-ccx q[34],q[5],q[35];
-ccx q[35],q[6],q[36];
-ccx q[36],q[7],q[37];
-ccx q[37],q[8],q[38];
-ccx q[38],q[9],q[39];
-ccx q[39],q[10],q[40];
-ccx q[40],q[11],q[41];
-ccx q[41],q[12],q[42];
-ccx q[42],q[13],q[43];
-ccx q[43],q[14],q[44];
-z q[44];
-ccx q[43],q[14],q[44];
-ccx q[42],q[13],q[43];
-ccx q[41],q[12],q[42];
-ccx q[40],q[11],q[41];
-ccx q[39],q[10],q[40];
-ccx q[38],q[9],q[39];
-ccx q[37],q[8],q[38];
-ccx q[36],q[7],q[37];
-ccx q[35],q[6],q[36];
-ccx q[34],q[5],q[35];
-ccx q[33],q[4],q[34];
-ccx q[32],q[3],q[33];
-ccx q[31],q[2],q[32];
-ccx q[1],q[0],q[31];
-x q[0];
-x q[1];
-x q[2];
-x q[3];
-x q[4];
-x q[5];
-x q[6];
-x q[7];
-x q[8];
-x q[9];
-x q[10];
-x q[11];
-x q[12];
-x q[13];
-x q[14];
-h q[0];
-h q[1];
-h q[2];
-h q[3];
-h q[4];
-h q[5];
-h q[6];
-h q[7];
-h q[8];
-h q[9];
-h q[10];
-h q[11];
-h q[12];
-h q[13];
-h q[14];
-cx q[0],q[15];
-cx q[1],q[17];
-cx q[2],q[19];
-cx q[3],q[21];
-cx q[4],q[23];
-cx q[5],q[25];
-cx q[6],q[27];
-cx q[7],q[29];
-cx q[8],q[16];
-cx q[8],q[17];
-cx q[9],q[18];
-cx q[9],q[19];
-cx q[10],q[20];
-cx q[10],q[21];
-cx q[11],q[22];
-cx q[11],q[23];
-cx q[12],q[24];
-cx q[12],q[25];
-cx q[13],q[26];
-cx q[13],q[27];
-cx q[14],q[28];
-cx q[14],q[29];
-x q[15];
-x q[17];
-x q[18];
-x q[19];
-x q[20];
-x q[21];
-x q[22];
-x q[23];
-x q[24];
-x q[25];
-x q[26];
-x q[27];
-x q[28];
-x q[29];
-reset q[31];
-reset q[32];
-reset q[33];
-reset q[34];
-reset q[35];
-reset q[36];
-reset q[37];
-reset q[38];
-reset q[39];
-reset q[40];
-reset q[41];
-reset q[42];
-reset q[43];
-reset q[44];
-ccx q[16],q[15],q[31];
-ccx q[31],q[17],q[32];
-ccx q[32],q[18],q[33];
-ccx q[33],q[19],q[34];
-ccx q[34],q[20],q[35];
-ccx q[35],q[21],q[36];
-ccx q[36],q[22],q[37];
-ccx q[37],q[23],q[38];
-ccx q[38],q[24],q[39];
-ccx q[39],q[25],q[40];
-ccx q[40],q[26],q[41];
-ccx q[41],q[27],q[42];
-ccx q[42],q[28],q[43];
-ccx q[43],q[29],q[44];
-z q[44];
-ccx q[43],q[29],q[44];
-ccx q[42],q[28],q[43];
-ccx q[41],q[27],q[42];
-ccx q[40],q[26],q[41];
-ccx q[39],q[25],q[40];
-ccx q[38],q[24],q[39];
-ccx q[37],q[23],q[38];
-ccx q[36],q[22],q[37];
-ccx q[35],q[21],q[36];
-ccx q[34],q[20],q[35];
-ccx q[33],q[19],q[34];
-ccx q[32],q[18],q[33];
-ccx q[31],q[17],q[32];
-ccx q[16],q[15],q[31];
-x q[15];
-x q[17];
-x q[18];
-x q[19];
-x q[20];
-x q[21];
-x q[22];
-x q[23];
-x q[24];
-x q[25];
-x q[26];
-x q[27];
-x q[28];
-x q[29];
-cx q[0],q[15];
-cx q[1],q[17];
-cx q[2],q[19];
-cx q[3],q[21];
-cx q[4],q[23];
-cx q[5],q[25];
-cx q[6],q[27];
-cx q[7],q[29];
-cx q[8],q[16];
-cx q[8],q[17];
-cx q[9],q[18];
-cx q[9],q[19];
-cx q[10],q[20];
-cx q[10],q[21];
-cx q[11],q[22];
-cx q[11],q[23];
-cx q[12],q[24];
-cx q[12],q[25];
-cx q[13],q[26];
-cx q[13],q[27];
-cx q[14],q[28];
-cx q[14],q[29];
-h q[0];
-h q[1];
-h q[2];
-h q[3];
-h q[4];
-h q[5];
-h q[6];
-h q[7];
-h q[8];
-h q[9];
-h q[10];
-h q[11];
-h q[12];
-h q[13];
-h q[14];
-x q[0];
-x q[1];
-x q[2];
-x q[3];
-x q[4];
-x q[5];
-x q[6];
-x q[7];
-x q[8];
-x q[9];
-x q[10];
-x q[11];
-x q[12];
-x q[13];
-x q[14];
-reset q[31];
-reset q[32];
-reset q[33];
-reset q[34];
-reset q[35];
-reset q[36];
-reset q[37];
-reset q[38];
-reset q[39];
-reset q[40];
-reset q[41];
-reset q[42];
-reset q[43];
-reset q[44];
-ccx q[1],q[0],q[31];
-ccx q[31],q[2],q[32];
-ccx q[32],q[3],q[33];
-ccx q[33],q[4],q[34];
-ccx q[34],q[5],q[35];
-ccx q[35],q[6],q[36];
-ccx q[36],q[7],q[37];
-ccx q[37],q[8],q[38];
-ccx q[38],q[9],q[39];
-ccx q[39],q[10],q[40];
-ccx q[40],q[11],q[41];
-ccx q[41],q[12],q[42];
-ccx q[42],q[13],q[43];
-ccx q[43],q[14],q[44];
-z q[44];
-ccx q[43],q[14],q[44];
-ccx q[42],q[13],q[43];
-ccx q[41],q[12],q[42];
-ccx q[40],q[11],q[41];
-ccx q[39],q[10],q[40];
-ccx q[38],q[9],q[39];
-ccx q[37],q[8],q[38];
-ccx q[36],q[7],q[37];
-ccx q[35],q[6],q[36];
-ccx q[34],q[5],q[35];
-ccx q[33],q[4],q[34];
-ccx q[32],q[3],q[33];
-ccx q[31],q[2],q[32];
-ccx q[1],q[0],q[31];
-x q[0];
-x q[1];
-x q[2];
-x q[3];
-x q[4];
-x q[5];
-x q[6];
-x q[7];
-x q[8];
-x q[9];
-x q[10];
-x q[11];
-x q[12];
-x q[13];
-x q[14];
-h q[0];
-h q[1];
-h q[2];
-h q[3];
-h q[4];
-h q[5];
-h q[6];
-h q[7];
-h q[8];
-h q[9];
-h q[10];
-h q[11];
-h q[12];
-h q[13];
-h q[14];
-cx q[0],q[15];
-cx q[1],q[17];
-cx q[2],q[19];
-cx q[3],q[21];
-cx q[4],q[23];
-cx q[5],q[25];
-cx q[6],q[27];
-cx q[7],q[29];
-cx q[8],q[16];
-cx q[8],q[17];
-cx q[9],q[18];
-cx q[9],q[19];
-cx q[10],q[20];
-cx q[10],q[21];
-cx q[11],q[22];
-cx q[11],q[23];
-cx q[12],q[24];
-cx q[12],q[25];
-cx q[13],q[26];
-cx q[13],q[27];
-cx q[14],q[28];
-cx q[14],q[29];
-x q[15];
-x q[17];
-x q[18];
-x q[19];
-x q[20];
-x q[21];
-x q[22];
-x q[23];
-x q[24];
-x q[25];
-x q[26];
-x q[27];
-x q[28];
-x q[29];
-reset q[31];
-reset q[32];
-reset q[33];
-reset q[34];
-reset q[35];
-reset q[36];
-reset q[37];
-reset q[38];
-reset q[39];
-reset q[40];
-reset q[41];
-reset q[42];
-reset q[43];
-reset q[44];
-ccx q[16],q[15],q[31];
-ccx q[31],q[17],q[32];
-ccx q[32],q[18],q[33];
-ccx q[33],q[19],q[34];
-ccx q[34],q[20],q[35];
-ccx q[35],q[21],q[36];
-ccx q[36],q[22],q[37];
-ccx q[37],q[23],q[38];
-ccx q[38],q[24],q[39];
-ccx q[39],q[25],q[40];
-ccx q[40],q[26],q[41];
-ccx q[41],q[27],q[42];
-ccx q[42],q[28],q[43];
-ccx q[43],q[29],q[44];
-z q[44];
-ccx q[43],q[29],q[44];
-ccx q[42],q[28],q[43];
-ccx q[41],q[27],q[42];
-ccx q[40],q[26],q[41];
-ccx q[39],q[25],q[40];
-ccx q[38],q[24],q[39];
-ccx q[37],q[23],q[38];
-ccx q[36],q[22],q[37];
-ccx q[35],q[21],q[36];
-ccx q[34],q[20],q[35];
-ccx q[33],q[19],q[34];
-ccx q[32],q[18],q[33];
-ccx q[31],q[17],q[32];
-ccx q[16],q[15],q[31];
-x q[15];
-x q[17];
-x q[18];
-x q[19];
-x q[20];
-x q[21];
-x q[22];
-x q[23];
-x q[24];
-x q[25];
-x q[26];
-x q[27];
-x q[28];
-x q[29];
-cx q[0],q[15];
-cx q[1],q[17];
-cx q[2],q[19];
-cx q[3],q[21];
-cx q[4],q[23];
-cx q[5],q[25];
-cx q[6],q[27];
-cx q[7],q[29];
-cx q[8],q[16];
-cx q[8],q[17];
-cx q[9],q[18];
-cx q[9],q[19];
-cx q[10],q[20];
-cx q[10],q[21];
-cx q[11],q[22];
-cx q[11],q[23];
-cx q[12],q[24];
-cx q[12],q[25];
-cx q[13],q[26];
-cx q[13],q[27];
-cx q[14],q[28];
-cx q[14],q[29];
-h q[0];
-h q[1];
-h q[2];
-h q[3];
-h q[4];
-h q[5];
-h q[6];
-h q[7];
-h q[8];
-h q[9];
-h q[10];
-h q[11];
-h q[12];
-h q[13];
-h q[14];
-x q[0];
-x q[1];
-x q[2];
-x q[3];
-x q[4];
-x q[5];
-x q[6];
-x q[7];
-x q[8];
-x q[9];
-x q[10];
-x q[11];
-x q[12];
-x q[13];
-x q[14];
-reset q[31];
-reset q[32];
-reset q[33];
-reset q[34];
-reset q[35];
-reset q[36];
-reset q[37];
-reset q[38];
-reset q[39];
-reset q[40];
-reset q[41];
-reset q[42];
-reset q[43];
-reset q[44];
-ccx q[1],q[0],q[31];
-ccx q[31],q[2],q[32];
-ccx q[32],q[3],q[33];
-ccx q[33],q[4],q[34];
-ccx q[34],q[5],q[35];
-ccx q[35],q[6],q[36];
-ccx q[36],q[7],q[37];
-ccx q[37],q[8],q[38];
-ccx q[38],q[9],q[39];
-ccx q[39],q[10],q[40];
-ccx q[40],q[11],q[41];
-ccx q[41],q[12],q[42];
-ccx q[42],q[13],q[43];
-ccx q[43],q[14],q[44];
-z q[44];
-ccx q[43],q[14],q[44];
-ccx q[42],q[13],q[43];
-ccx q[41],q[12],q[42];
-ccx q[40],q[11],q[41];
-ccx q[39],q[10],q[40];
-ccx q[38],q[9],q[39];
-ccx q[37],q[8],q[38];
-ccx q[36],q[7],q[37];
-ccx q[35],q[6],q[36];
-ccx q[34],q[5],q[35];
-ccx q[33],q[4],q[34];
-ccx q[32],q[3],q[33];
-ccx q[31],q[2],q[32];
-ccx q[1],q[0],q[31];
-x q[0];
-x q[1];
-x q[2];
-x q[3];
-x q[4];
-x q[5];
-x q[6];
-x q[7];
-x q[8];
-x q[9];
-x q[10];
-x q[11];
-x q[12];
-x q[13];
-x q[14];
-h q[0];
-h q[1];
-h q[2];
-h q[3];
-h q[4];
-h q[5];
-h q[6];
-h q[7];
-h q[8];
-h q[9];
-h q[10];
-h q[11];
-h q[12];
-h q[13];
-h q[14];
-cx q[0],q[15];
-cx q[1],q[17];
-cx q[2],q[19];
-cx q[3],q[21];
-cx q[4],q[23];
-cx q[5],q[25];
-cx q[6],q[27];
-cx q[7],q[29];
-cx q[8],q[16];
-cx q[8],q[17];
-cx q[9],q[18];
-cx q[9],q[19];
-cx q[10],q[20];
-cx q[10],q[21];
-cx q[11],q[22];
-cx q[11],q[23];
-cx q[12],q[24];
-cx q[12],q[25];
-cx q[13],q[26];
-cx q[13],q[27];
-cx q[14],q[28];
-cx q[14],q[29];
-x q[15];
-x q[17];
-x q[18];
-x q[19];
-x q[20];
-x q[21];
-x q[22];
-x q[23];
-x q[24];
-x q[25];
-x q[26];
-x q[27];
-x q[28];
-x q[29];
-reset q[31];
-reset q[32];
-reset q[33];
-reset q[34];
-reset q[35];
-reset q[36];
-reset q[37];
-reset q[38];
-reset q[39];
-reset q[40];
-reset q[41];
-reset q[42];
-reset q[43];
-reset q[44];
-ccx q[16],q[15],q[31];
-ccx q[31],q[17],q[32];
-ccx q[32],q[18],q[33];
-ccx q[33],q[19],q[34];
-ccx q[34],q[20],q[35];
-ccx q[35],q[21],q[36];
-ccx q[36],q[22],q[37];
-ccx q[37],q[23],q[38];
-ccx q[38],q[24],q[39];
-ccx q[39],q[25],q[40];
-ccx q[40],q[26],q[41];
-ccx q[41],q[27],q[42];
-ccx q[42],q[28],q[43];
-ccx q[43],q[29],q[44];
-z q[44];
-ccx q[43],q[29],q[44];
-ccx q[42],q[28],q[43];
-ccx q[41],q[27],q[42];
-ccx q[40],q[26],q[41];
-ccx q[39],q[25],q[40];
-ccx q[38],q[24],q[39];
-ccx q[37],q[23],q[38];
-ccx q[36],q[22],q[37];
-ccx q[35],q[21],q[36];
-ccx q[34],q[20],q[35];
-ccx q[33],q[19],q[34];
-ccx q[32],q[18],q[33];
-ccx q[31],q[17],q[32];
-ccx q[16],q[15],q[31];
-x q[15];
-x q[17];
-x q[18];
-x q[19];
-x q[20];
-x q[21];
-x q[22];
-x q[23];
-x q[24];
-x q[25];
-x q[26];
-x q[27];
-x q[28];
-x q[29];
-cx q[0],q[15];
-cx q[1],q[17];
-cx q[2],q[19];
-cx q[3],q[21];
-cx q[4],q[23];
-cx q[5],q[25];
-cx q[6],q[27];
-cx q[7],q[29];
-cx q[8],q[16];
-cx q[8],q[17];
-cx q[9],q[18];
-cx q[9],q[19];
-cx q[10],q[20];
-cx q[10],q[21];
-cx q[11],q[22];
-cx q[11],q[23];
-cx q[12],q[24];
-cx q[12],q[25];
-cx q[13],q[26];
-cx q[13],q[27];
-cx q[14],q[28];
-cx q[14],q[29];
-h q[0];
-h q[1];
-h q[2];
-h q[3];
-h q[4];
-h q[5];
-h q[6];
-h q[7];
-h q[8];
-h q[9];
-h q[10];
-h q[11];
-h q[12];
-h q[13];
-h q[14];
-x q[0];
-x q[1];
-x q[2];
-x q[3];
-x q[4];
-x q[5];
-x q[6];
-x q[7];
-x q[8];
-x q[9];
-x q[10];
-x q[11];
-x q[12];
-x q[13];
-x q[14];
-reset q[31];
-reset q[32];
-reset q[33];
-reset q[34];
-reset q[35];
-reset q[36];
-reset q[37];
-reset q[38];
-reset q[39];
-reset q[40];
-reset q[41];
-reset q[42];
-reset q[43];
-reset q[44];
-ccx q[1],q[0],q[31];
-ccx q[31],q[2],q[32];
-ccx q[32],q[3],q[33];
-ccx q[33],q[4],q[34];
-ccx q[34],q[5],q[35];
-ccx q[35],q[6],q[36];
-ccx q[36],q[7],q[37];
-ccx q[37],q[8],q[38];
-ccx q[38],q[9],q[39];
-ccx q[39],q[10],q[40];
-ccx q[40],q[11],q[41];
-ccx q[41],q[12],q[42];
-ccx q[42],q[13],q[43];
-ccx q[43],q[14],q[44];
-z q[44];
-ccx q[43],q[14],q[44];
-ccx q[42],q[13],q[43];
-ccx q[41],q[12],q[42];
-ccx q[40],q[11],q[41];
-ccx q[39],q[10],q[40];
-ccx q[38],q[9],q[39];
-ccx q[37],q[8],q[38];
-ccx q[36],q[7],q[37];
-ccx q[35],q[6],q[36];
-ccx q[34],q[5],q[35];
-ccx q[33],q[4],q[34];
-ccx q[32],q[3],q[33];
-ccx q[31],q[2],q[32];
-ccx q[1],q[0],q[31];
-x q[0];
-x q[1];
-x q[2];
-x q[3];
-x q[4];
-x q[5];
-x q[6];
-x q[7];
-x q[8];
-x q[9];
-x q[10];
-x q[11];
-x q[12];
-x q[13];
-x q[14];
-h q[0];
-h q[1];
-h q[2];
-h q[3];
-h q[4];
-h q[5];
-h q[6];
-h q[7];
-h q[8];
-h q[9];
-h q[10];
-h q[11];
-h q[12];
-h q[13];
-h q[14];
-cx q[0],q[15];
-cx q[1],q[17];
-cx q[2],q[19];
-cx q[3],q[21];
-cx q[4],q[23];
-cx q[5],q[25];
-cx q[6],q[27];
-cx q[7],q[29];
-cx q[8],q[16];
-cx q[8],q[17];
-cx q[9],q[18];
-cx q[9],q[19];
-cx q[10],q[20];
-cx q[10],q[21];
-cx q[11],q[22];
-cx q[11],q[23];
-cx q[12],q[24];
-cx q[12],q[25];
-cx q[13],q[26];
-cx q[13],q[27];
-cx q[14],q[28];
-cx q[14],q[29];
-x q[15];
-x q[17];
-x q[18];
-x q[19];
-x q[20];
-x q[21];
-x q[22];
-x q[23];
-x q[24];
-x q[25];
-x q[26];
-x q[27];
-x q[28];
-x q[29];
-reset q[31];
-reset q[32];
-reset q[33];
-reset q[34];
-reset q[35];
-reset q[36];
-reset q[37];
-reset q[38];
-reset q[39];
-reset q[40];
-reset q[41];
-reset q[42];
-reset q[43];
-reset q[44];
-ccx q[16],q[15],q[31];
-ccx q[31],q[17],q[32];
-ccx q[32],q[18],q[33];
-ccx q[33],q[19],q[34];
-ccx q[34],q[20],q[35];
-ccx q[35],q[21],q[36];
-ccx q[36],q[22],q[37];
-ccx q[37],q[23],q[38];
-ccx q[38],q[24],q[39];
-ccx q[39],q[25],q[40];
-ccx q[40],q[26],q[41];
-ccx q[41],q[27],q[42];
-ccx q[42],q[28],q[43];
-ccx q[43],q[29],q[44];
-z q[44];
-ccx q[43],q[29],q[44];
-ccx q[42],q[28],q[43];
-ccx q[41],q[27],q[42];
-ccx q[40],q[26],q[41];
-ccx q[39],q[25],q[40];
-ccx q[38],q[24],q[39];
-ccx q[37],q[23],q[38];
-ccx q[36],q[22],q[37];
-ccx q[35],q[21],q[36];
-ccx q[34],q[20],q[35];
-ccx q[33],q[19],q[34];
-ccx q[32],q[18],q[33];
-ccx q[31],q[17],q[32];
-ccx q[16],q[15],q[31];
-x q[15];
-x q[17];
-x q[18];
-x q[19];
-x q[20];
-x q[21];
-x q[22];
-x q[23];
-x q[24];
-x q[25];
-x q[26];
-x q[27];
-x q[28];
-x q[29];
-cx q[0],q[15];
-cx q[1],q[17];
-cx q[2],q[19];
-cx q[3],q[21];
-cx q[4],q[23];
-cx q[5],q[25];
-cx q[6],q[27];
-cx q[7],q[29];
-cx q[8],q[16];
-cx q[8],q[17];
-cx q[9],q[18];
-cx q[9],q[19];
-cx q[10],q[20];
-cx q[10],q[21];
-cx q[11],q[22];
-cx q[11],q[23];
-cx q[12],q[24];
-cx q[12],q[25];
-cx q[13],q[26];
-cx q[13],q[27];
-cx q[14],q[28];
-cx q[14],q[29];
-h q[0];
-h q[1];
-h q[2];
-h q[3];
-h q[4];
-h q[5];
-h q[6];
-h q[7];
-h q[8];
-h q[9];
-h q[10];
-h q[11];
-h q[12];
-h q[13];
-h q[14];
-x q[0];
-x q[1];
-x q[2];
-x q[3];
-x q[4];
-x q[5];
-x q[6];
-x q[7];
-x q[8];
-x q[9];
-x q[10];
-x q[11];
-x q[12];
-x q[13];
-x q[14];
-reset q[31];
-reset q[32];
-reset q[33];
-reset q[34];
-reset q[35];
-reset q[36];
-reset q[37];
-reset q[38];
-reset q[39];
-reset q[40];
-reset q[41];
-reset q[42];
-reset q[43];
-reset q[44];
-ccx q[1],q[0],q[31];
-ccx q[31],q[2],q[32];
-ccx q[32],q[3],q[33];
-ccx q[33],q[4],q[34];
-ccx q[34],q[5],q[35];
-ccx q[35],q[6],q[36];
-ccx q[36],q[7],q[37];
-ccx q[37],q[8],q[38];
-ccx q[38],q[9],q[39];
-ccx q[39],q[10],q[40];
-ccx q[40],q[11],q[41];
-ccx q[41],q[12],q[42];
-ccx q[42],q[13],q[43];
-ccx q[43],q[14],q[44];
-z q[44];
-ccx q[43],q[14],q[44];
-ccx q[42],q[13],q[43];
-ccx q[41],q[12],q[42];
-ccx q[40],q[11],q[41];
-ccx q[39],q[10],q[40];
-ccx q[38],q[9],q[39];
-ccx q[37],q[8],q[38];
-ccx q[36],q[7],q[37];
-ccx q[35],q[6],q[36];
-ccx q[34],q[5],q[35];
-ccx q[33],q[4],q[34];
-ccx q[32],q[3],q[33];
-ccx q[31],q[2],q[32];
-ccx q[1],q[0],q[31];
-x q[0];
-x q[1];
-x q[2];
-x q[3];
-x q[4];
-x q[5];
-x q[6];
-x q[7];
-x q[8];
-x q[9];
-x q[10];
-x q[11];
-x q[12];
-x q[13];
-x q[14];
-h q[0];
-h q[1];
-h q[2];
-h q[3];
-h q[4];
-h q[5];
-h q[6];
-h q[7];
-h q[8];
-h q[9];
-h q[10];
-h q[11];
-h q[12];
-h q[13];
-h q[14];
-cx q[0],q[15];
-cx q[1],q[17];
-cx q[2],q[19];
-cx q[3],q[21];
-cx q[4],q[23];
-cx q[5],q[25];
-cx q[6],q[27];
-cx q[7],q[29];
-cx q[8],q[16];
-cx q[8],q[17];
-cx q[9],q[18];
-cx q[9],q[19];
-cx q[10],q[20];
-cx q[10],q[21];
-cx q[11],q[22];
-cx q[11],q[23];
-cx q[12],q[24];
-cx q[12],q[25];
-cx q[13],q[26];
-cx q[13],q[27];
-cx q[14],q[28];
-cx q[14],q[29];
-x q[15];
-x q[17];
-x q[18];
-x q[19];
-x q[20];
-x q[21];
-x q[22];
-x q[23];
-x q[24];
-x q[25];
-x q[26];
-x q[27];
-x q[28];
-x q[29];
-reset q[31];
-reset q[32];
-reset q[33];
-reset q[34];
-reset q[35];
-reset q[36];
-reset q[37];
-reset q[38];
-reset q[39];
-reset q[40];
-reset q[41];
-reset q[42];
-reset q[43];
-reset q[44];
-ccx q[16],q[15],q[31];
-ccx q[31],q[17],q[32];
-ccx q[32],q[18],q[33];
-ccx q[33],q[19],q[34];
-ccx q[34],q[20],q[35];
-ccx q[35],q[21],q[36];
-ccx q[36],q[22],q[37];
-ccx q[37],q[23],q[38];
-ccx q[38],q[24],q[39];
-ccx q[39],q[25],q[40];
-ccx q[40],q[26],q[41];
-ccx q[41],q[27],q[42];
-ccx q[42],q[28],q[43];
-ccx q[43],q[29],q[44];
-z q[44];
-ccx q[43],q[29],q[44];
-ccx q[42],q[28],q[43];
-ccx q[41],q[27],q[42];
-ccx q[40],q[26],q[41];
-ccx q[39],q[25],q[40];
-ccx q[38],q[24],q[39];
-ccx q[37],q[23],q[38];
-ccx q[36],q[22],q[37];
-ccx q[35],q[21],q[36];
-ccx q[34],q[20],q[35];
-ccx q[33],q[19],q[34];
-ccx q[32],q[18],q[33];
-ccx q[31],q[17],q[32];
-ccx q[16],q[15],q[31];
-x q[15];
-x q[17];
-x q[18];
-x q[19];
-x q[20];
-x q[21];
-x q[22];
-x q[23];
-x q[24];
-x q[25];
-x q[26];
-x q[27];
-x q[28];
-x q[29];
-cx q[0],q[15];
-cx q[1],q[17];
-cx q[2],q[19];
-cx q[3],q[21];
-cx q[4],q[23];
-cx q[5],q[25];
-cx q[6],q[27];
-cx q[7],q[29];
-cx q[8],q[16];
-cx q[8],q[17];
-cx q[9],q[18];
-cx q[9],q[19];
-cx q[10],q[20];
-cx q[10],q[21];
-cx q[11],q[22];
-cx q[11],q[23];
-cx q[12],q[24];
-cx q[12],q[25];
-cx q[13],q[26];
-cx q[13],q[27];
-cx q[14],q[28];
-cx q[14],q[29];
-h q[0];
-h q[1];
-h q[2];
-h q[3];
-h q[4];
-h q[5];
-h q[6];
-h q[7];
-h q[8];
-h q[9];
-h q[10];
-h q[11];
-h q[12];
-h q[13];
-h q[14];
-x q[0];
-x q[1];
-x q[2];
-x q[3];
-x q[4];
-x q[5];
-x q[6];
-x q[7];
-x q[8];
-x q[9];
-x q[10];
-x q[11];
-x q[12];
-x q[13];
-x q[14];
-reset q[31];
-reset q[32];
-reset q[33];
-reset q[34];
-reset q[35];
-reset q[36];
-reset q[37];
-reset q[38];
-reset q[39];
-reset q[40];
-reset q[41];
-reset q[42];
-reset q[43];
-reset q[44];
-ccx q[1],q[0],q[31];
-ccx q[31],q[2],q[32];
-ccx q[32],q[3],q[33];
-ccx q[33],q[4],q[34];
-ccx q[34],q[5],q[35];
-ccx q[35],q[6],q[36];
-ccx q[36],q[7],q[37];
-ccx q[37],q[8],q[38];
-ccx q[38],q[9],q[39];
-ccx q[39],q[10],q[40];
-ccx q[40],q[11],q[41];
-ccx q[41],q[12],q[42];
-ccx q[42],q[13],q[43];
-ccx q[43],q[14],q[44];
-z q[44];
-ccx q[43],q[14],q[44];
-ccx q[42],q[13],q[43];
-ccx q[41],q[12],q[42];
-ccx q[40],q[11],q[41];
-ccx q[39],q[10],q[40];
-ccx q[38],q[9],q[39];
-ccx q[37],q[8],q[38];
-ccx q[36],q[7],q[37];
-ccx q[35],q[6],q[36];
-ccx q[34],q[5],q[35];
-ccx q[33],q[4],q[34];
-ccx q[32],q[3],q[33];
-ccx q[31],q[2],q[32];
-ccx q[1],q[0],q[31];
-x q[0];
-x q[1];
-x q[2];
-x q[3];
-x q[4];
-x q[5];
-x q[6];
-x q[7];
-x q[8];
-x q[9];
-x q[10];
-x q[11];
-x q[12];
-x q[13];
-x q[14];
-h q[0];
-h q[1];
-h q[2];
-h q[3];
-h q[4];
-h q[5];
-h q[6];
-h q[7];
-h q[8];
-h q[9];
-h q[10];
-h q[11];
-h q[12];
-h q[13];
-h q[14];
-cx q[0],q[15];
-cx q[1],q[17];
-cx q[2],q[19];
-cx q[3],q[21];
-cx q[4],q[23];
-cx q[5],q[25];
-cx q[6],q[27];
-cx q[7],q[29];
-cx q[8],q[16];
-cx q[8],q[17];
-cx q[9],q[18];
-cx q[9],q[19];
-cx q[10],q[20];
-cx q[10],q[21];
-cx q[11],q[22];
-cx q[11],q[23];
-cx q[12],q[24];
-cx q[12],q[25];
-cx q[13],q[26];
-cx q[13],q[27];
-cx q[14],q[28];
-cx q[14],q[29];
-x q[15];
-x q[17];
-x q[18];
-x q[19];
-x q[20];
-x q[21];
-x q[22];
-x q[23];
-x q[24];
-x q[25];
-x q[26];
-x q[27];
-x q[28];
-x q[29];
-reset q[31];
-reset q[32];
-reset q[33];
-reset q[34];
-reset q[35];
-reset q[36];
-reset q[37];
-reset q[38];
-reset q[39];
-reset q[40];
-reset q[41];
-reset q[42];
-reset q[43];
-reset q[44];
-ccx q[16],q[15],q[31];
-ccx q[31],q[17],q[32];
-ccx q[32],q[18],q[33];
-ccx q[33],q[19],q[34];
-ccx q[34],q[20],q[35];
-ccx q[35],q[21],q[36];
-ccx q[36],q[22],q[37];
-ccx q[37],q[23],q[38];
-ccx q[38],q[24],q[39];
-ccx q[39],q[25],q[40];
-ccx q[40],q[26],q[41];
-ccx q[41],q[27],q[42];
-ccx q[42],q[28],q[43];
-ccx q[43],q[29],q[44];
-z q[44];
-ccx q[43],q[29],q[44];
-ccx q[42],q[28],q[43];
-ccx q[41],q[27],q[42];
-ccx q[40],q[26],q[41];
-ccx q[39],q[25],q[40];
-ccx q[38],q[24],q[39];
-ccx q[37],q[23],q[38];
-ccx q[36],q[22],q[37];
-ccx q[35],q[21],q[36];
-ccx q[34],q[20],q[35];
-ccx q[33],q[19],q[34];
-ccx q[32],q[18],q[33];
-ccx q[31],q[17],q[32];
-ccx q[16],q[15],q[31];
-x q[15];
-x q[17];
-x q[18];
-x q[19];
-x q[20];
-x q[21];
-x q[22];
-x q[23];
-x q[24];
-x q[25];
-x q[26];
-x q[27];
-x q[28];
-x q[29];
-cx q[0],q[15];
-cx q[1],q[17];
-cx q[2],q[19];
-cx q[3],q[21];
-cx q[4],q[23];
-cx q[5],q[25];
-cx q[6],q[27];
-cx q[7],q[29];
-cx q[8],q[16];
-cx q[8],q[17];
-cx q[9],q[18];
-cx q[9],q[19];
-cx q[10],q[20];
-cx q[10],q[21];
-cx q[11],q[22];
-cx q[11],q[23];
-cx q[12],q[24];
-cx q[12],q[25];
-cx q[13],q[26];
-cx q[13],q[27];
-cx q[14],q[28];
-cx q[14],q[29];
-h q[0];
-h q[1];
-h q[2];
-h q[3];
-h q[4];
-h q[5];
-h q[6];
-h q[7];
-h q[8];
-h q[9];
-h q[10];
-h q[11];
-h q[12];
-h q[13];
-h q[14];
-x q[0];
-x q[1];
-x q[2];
-x q[3];
-x q[4];
-x q[5];
-x q[6];
-x q[7];
-x q[8];
-x q[9];
-x q[10];
-x q[11];
-x q[12];
-x q[13];
-x q[14];
-reset q[31];
-reset q[32];
-reset q[33];
-reset q[34];
-reset q[35];
-reset q[36];
-reset q[37];
-reset q[38];
-reset q[39];
-reset q[40];
-reset q[41];
-reset q[42];
-reset q[43];
-reset q[44];
-ccx q[1],q[0],q[31];
-ccx q[31],q[2],q[32];
-ccx q[32],q[3],q[33];
-ccx q[33],q[4],q[34];
-ccx q[34],q[5],q[35];
-ccx q[35],q[6],q[36];
-ccx q[36],q[7],q[37];
-ccx q[37],q[8],q[38];
-ccx q[38],q[9],q[39];
-ccx q[39],q[10],q[40];
-ccx q[40],q[11],q[41];
-ccx q[41],q[12],q[42];
-ccx q[42],q[13],q[43];
-ccx q[43],q[14],q[44];
-z q[44];
-ccx q[43],q[14],q[44];
-ccx q[42],q[13],q[43];
-ccx q[41],q[12],q[42];
-ccx q[40],q[11],q[41];
-ccx q[39],q[10],q[40];
-ccx q[38],q[9],q[39];
-ccx q[37],q[8],q[38];
-ccx q[36],q[7],q[37];
-ccx q[35],q[6],q[36];
-ccx q[34],q[5],q[35];
-ccx q[33],q[4],q[34];
-ccx q[32],q[3],q[33];
-ccx q[31],q[2],q[32];
-ccx q[1],q[0],q[31];
-x q[0];
-x q[1];
-x q[2];
-x q[3];
-x q[4];
-x q[5];
-x q[6];
-x q[7];
-x q[8];
-x q[9];
-x q[10];
-x q[11];
-x q[12];
-x q[13];
-x q[14];
-h q[0];
-h q[1];
-h q[2];
-h q[3];
-h q[4];
-h q[5];
-h q[6];
-h q[7];
-h q[8];
-h q[9];
-h q[10];
-h q[11];
-h q[12];
-h q[13];
-h q[14];
-cx q[0],q[15];
-cx q[1],q[17];
-cx q[2],q[19];
-cx q[3],q[21];
-cx q[4],q[23];
-cx q[5],q[25];
-cx q[6],q[27];
-cx q[7],q[29];
-cx q[8],q[16];
-cx q[8],q[17];
-cx q[9],q[18];
-cx q[9],q[19];
-cx q[10],q[20];
-cx q[10],q[21];
-cx q[11],q[22];
-cx q[11],q[23];
-cx q[12],q[24];
-cx q[12],q[25];
-cx q[13],q[26];
-cx q[13],q[27];
-cx q[14],q[28];
-cx q[14],q[29];
-x q[15];
-x q[17];
-x q[18];
-x q[19];
-x q[20];
-x q[21];
-x q[22];
-x q[23];
-x q[24];
-x q[25];
-x q[26];
-x q[27];
-x q[28];
-x q[29];
-reset q[31];
-reset q[32];
-reset q[33];
-reset q[34];
-reset q[35];
-reset q[36];
-reset q[37];
-reset q[38];
-reset q[39];
-reset q[40];
-reset q[41];
-reset q[42];
-reset q[43];
-reset q[44];
-ccx q[16],q[15],q[31];
-ccx q[31],q[17],q[32];
-ccx q[32],q[18],q[33];
-ccx q[33],q[19],q[34];
-ccx q[34],q[20],q[35];
-ccx q[35],q[21],q[36];
-ccx q[36],q[22],q[37];
-ccx q[37],q[23],q[38];
-ccx q[38],q[24],q[39];
-ccx q[39],q[25],q[40];
-ccx q[40],q[26],q[41];
-ccx q[41],q[27],q[42];
-ccx q[42],q[28],q[43];
-ccx q[43],q[29],q[44];
-z q[44];
-ccx q[43],q[29],q[44];
-ccx q[42],q[28],q[43];
-ccx q[41],q[27],q[42];
-ccx q[40],q[26],q[41];
-ccx q[39],q[25],q[40];
-ccx q[38],q[24],q[39];
-ccx q[37],q[23],q[38];
-ccx q[36],q[22],q[37];
-ccx q[35],q[21],q[36];
-ccx q[34],q[20],q[35];
-ccx q[33],q[19],q[34];
-ccx q[32],q[18],q[33];
-ccx q[31],q[17],q[32];
-ccx q[16],q[15],q[31];
-x q[15];
-x q[17];
-x q[18];
-x q[19];
-x q[20];
-x q[21];
-x q[22];
-x q[23];
-x q[24];
-x q[25];
-x q[26];
-x q[27];
-x q[28];
-x q[29];
-cx q[0],q[15];
-cx q[1],q[17];
-cx q[2],q[19];
-cx q[3],q[21];
-cx q[4],q[23];
-cx q[5],q[25];
-cx q[6],q[27];
-cx q[7],q[29];
-cx q[8],q[16];
-cx q[8],q[17];
-cx q[9],q[18];
-cx q[9],q[19];
-cx q[10],q[20];
-cx q[10],q[21];
-cx q[11],q[22];
-cx q[11],q[23];
-cx q[12],q[24];
-cx q[12],q[25];
-cx q[13],q[26];
-cx q[13],q[27];
-cx q[14],q[28];
-cx q[14],q[29];
-h q[0];
-h q[1];
-h q[2];
-h q[3];
-h q[4];
-h q[5];
-h q[6];
-h q[7];
-h q[8];
-h q[9];
-h q[10];
-h q[11];
-h q[12];
-h q[13];
-h q[14];
-x q[0];
-x q[1];
-x q[2];
-x q[3];
-x q[4];
-x q[5];
-x q[6];
-x q[7];
-x q[8];
-x q[9];
-x q[10];
-x q[11];
-x q[12];
-x q[13];
-x q[14];
-reset q[31];
-reset q[32];
-reset q[33];
-reset q[34];
-reset q[35];
-reset q[36];
-reset q[37];
-reset q[38];
-reset q[39];
-reset q[40];
-reset q[41];
-reset q[42];
-reset q[43];
-reset q[44];
-ccx q[1],q[0],q[31];
-ccx q[31],q[2],q[32];
-ccx q[32],q[3],q[33];
-ccx q[33],q[4],q[34];
-ccx q[34],q[5],q[35];
-ccx q[35],q[6],q[36];
-ccx q[36],q[7],q[37];
-ccx q[37],q[8],q[38];
-ccx q[38],q[9],q[39];
-ccx q[39],q[10],q[40];
-ccx q[40],q[11],q[41];
-ccx q[41],q[12],q[42];
-ccx q[42],q[13],q[43];
-ccx q[43],q[14],q[44];
-z q[44];
-ccx q[43],q[14],q[44];
-ccx q[42],q[13],q[43];
-ccx q[41],q[12],q[42];
-ccx q[40],q[11],q[41];
-ccx q[39],q[10],q[40];
-ccx q[38],q[9],q[39];
-ccx q[37],q[8],q[38];
-ccx q[36],q[7],q[37];
-ccx q[35],q[6],q[36];
-ccx q[34],q[5],q[35];
-ccx q[33],q[4],q[34];
-ccx q[32],q[3],q[33];
-ccx q[31],q[2],q[32];
-ccx q[1],q[0],q[31];
-x q[0];
-x q[1];
-x q[2];
-x q[3];
-x q[4];
-x q[5];
-x q[6];
-x q[7];
-x q[8];
-x q[9];
-x q[10];
-x q[11];
-x q[12];
-x q[13];
-x q[14];
-h q[0];
-h q[1];
-h q[2];
-h q[3];
-h q[4];
-h q[5];
-h q[6];
-h q[7];
-h q[8];
-h q[9];
-h q[10];
-h q[11];
-h q[12];
-h q[13];
-h q[14];
-cx q[0],q[15];
-cx q[1],q[17];
-cx q[2],q[19];
-cx q[3],q[21];
-cx q[4],q[23];
-cx q[5],q[25];
-cx q[6],q[27];
-cx q[7],q[29];
-cx q[8],q[16];
-cx q[8],q[17];
-cx q[9],q[18];
-cx q[9],q[19];
-cx q[10],q[20];
-cx q[10],q[21];
-cx q[11],q[22];
-cx q[11],q[23];
-cx q[12],q[24];
-cx q[12],q[25];
-cx q[13],q[26];
-cx q[13],q[27];
-cx q[14],q[28];
-cx q[14],q[29];
-x q[15];
-x q[17];
-x q[18];
-x q[19];
-x q[20];
-x q[21];
-x q[22];
-x q[23];
-x q[24];
-x q[25];
-x q[26];
-x q[27];
-x q[28];
-x q[29];
-reset q[31];
-reset q[32];
-reset q[33];
-reset q[34];
-reset q[35];
-reset q[36];
-reset q[37];
-reset q[38];
-reset q[39];
-reset q[40];
-reset q[41];
-reset q[42];
-reset q[43];
-reset q[44];
-ccx q[16],q[15],q[31];
-ccx q[31],q[17],q[32];
-ccx q[32],q[18],q[33];
-ccx q[33],q[19],q[34];
-ccx q[34],q[20],q[35];
-ccx q[35],q[21],q[36];
-ccx q[36],q[22],q[37];
-ccx q[37],q[23],q[38];
-ccx q[38],q[24],q[39];
-ccx q[39],q[25],q[40];
-ccx q[40],q[26],q[41];
-ccx q[41],q[27],q[42];
-ccx q[42],q[28],q[43];
-ccx q[43],q[29],q[44];
-z q[44];
-ccx q[43],q[29],q[44];
-ccx q[42],q[28],q[43];
-ccx q[41],q[27],q[42];
-ccx q[40],q[26],q[41];
-ccx q[39],q[25],q[40];
-ccx q[38],q[24],q[39];
-ccx q[37],q[23],q[38];
-ccx q[36],q[22],q[37];
-ccx q[35],q[21],q[36];
-ccx q[34],q[20],q[35];
-ccx q[33],q[19],q[34];
-ccx q[32],q[18],q[33];
-ccx q[31],q[17],q[32];
-ccx q[16],q[15],q[31];
-x q[15];
-x q[17];
-x q[18];
-x q[19];
-x q[20];
-x q[21];
-x q[22];
-x q[23];
-x q[24];
-x q[25];
-x q[26];
-x q[27];
-x q[28];
-x q[29];
-cx q[0],q[15];
-cx q[1],q[17];
-cx q[2],q[19];
-cx q[3],q[21];
-cx q[4],q[23];
-cx q[5],q[25];
-cx q[6],q[27];
-cx q[7],q[29];
-cx q[8],q[16];
-cx q[8],q[17];
-cx q[9],q[18];
-cx q[9],q[19];
-cx q[10],q[20];
-cx q[10],q[21];
-cx q[11],q[22];
-cx q[11],q[23];
-cx q[12],q[24];
-cx q[12],q[25];
-cx q[13],q[26];
-cx q[13],q[27];
-cx q[14],q[28];
-cx q[14],q[29];
-h q[0];
-h q[1];
-h q[2];
-h q[3];
-h q[4];
-h q[5];
-h q[6];
-h q[7];
-h q[8];
-h q[9];
-h q[10];
-h q[11];
-h q[12];
-h q[13];
-h q[14];
-x q[0];
-x q[1];
-x q[2];
-x q[3];
-x q[4];
-x q[5];
-x q[6];
-x q[7];
-x q[8];
-x q[9];
-x q[10];
-x q[11];
-x q[12];
-x q[13];
-x q[14];
-reset q[31];
-reset q[32];
-reset q[33];
-reset q[34];
-reset q[35];
-reset q[36];
-reset q[37];
-reset q[38];
-reset q[39];
-reset q[40];
-reset q[41];
-reset q[42];
-reset q[43];
-reset q[44];
-ccx q[1],q[0],q[31];
-ccx q[31],q[2],q[32];
-ccx q[32],q[3],q[33];
-ccx q[33],q[4],q[34];
-ccx q[34],q[5],q[35];
-ccx q[35],q[6],q[36];
-ccx q[36],q[7],q[37];
-ccx q[37],q[8],q[38];
-ccx q[38],q[9],q[39];
-ccx q[39],q[10],q[40];
-ccx q[40],q[11],q[41];
-ccx q[41],q[12],q[42];
-ccx q[42],q[13],q[43];
-ccx q[43],q[14],q[44];
-z q[44];
-ccx q[43],q[14],q[44];
-ccx q[42],q[13],q[43];
-ccx q[41],q[12],q[42];
-ccx q[40],q[11],q[41];
-ccx q[39],q[10],q[40];
-ccx q[38],q[9],q[39];
-ccx q[37],q[8],q[38];
-ccx q[36],q[7],q[37];
-ccx q[35],q[6],q[36];
-ccx q[34],q[5],q[35];
-ccx q[33],q[4],q[34];
-ccx q[32],q[3],q[33];
-ccx q[31],q[2],q[32];
-ccx q[1],q[0],q[31];
-x q[0];
-x q[1];
-x q[2];
-x q[3];
-x q[4];
-x q[5];
-x q[6];
-x q[7];
-x q[8];
-x q[9];
-x q[10];
-x q[11];
-x q[12];
-x q[13];
-x q[14];
-h q[0];
-h q[1];
-h q[2];
-h q[3];
-h q[4];
-h q[5];
-h q[6];
-h q[7];
-h q[8];
-h q[9];
-h q[10];
-h q[11];
-h q[12];
-h q[13];
-h q[14];
-cx q[0],q[15];
-cx q[1],q[17];
-cx q[2],q[19];
-cx q[3],q[21];
-cx q[4],q[23];
-cx q[5],q[25];
-cx q[6],q[27];
-cx q[7],q[29];
-cx q[8],q[16];
-cx q[8],q[17];
-cx q[9],q[18];
-cx q[9],q[19];
-cx q[10],q[20];
-cx q[10],q[21];
-cx q[11],q[22];
-cx q[11],q[23];
-cx q[12],q[24];
-cx q[12],q[25];
-cx q[13],q[26];
-cx q[13],q[27];
-cx q[14],q[28];
-cx q[14],q[29];
-x q[15];
-x q[17];
-x q[18];
-x q[19];
-x q[20];
-x q[21];
-x q[22];
-x q[23];
-x q[24];
-x q[25];
-x q[26];
-x q[27];
-x q[28];
-x q[29];
-reset q[31];
-reset q[32];
-reset q[33];
-reset q[34];
-reset q[35];
-reset q[36];
-reset q[37];
-reset q[38];
-reset q[39];
-reset q[40];
-reset q[41];
-reset q[42];
-reset q[43];
-reset q[44];
-ccx q[16],q[15],q[31];
-ccx q[31],q[17],q[32];
-ccx q[32],q[18],q[33];
-ccx q[33],q[19],q[34];
-ccx q[34],q[20],q[35];
-ccx q[35],q[21],q[36];
-ccx q[36],q[22],q[37];
-ccx q[37],q[23],q[38];
-ccx q[38],q[24],q[39];
-ccx q[39],q[25],q[40];
-ccx q[40],q[26],q[41];
-ccx q[41],q[27],q[42];
-ccx q[42],q[28],q[43];
-ccx q[43],q[29],q[44];
-z q[44];
-ccx q[43],q[29],q[44];
-ccx q[42],q[28],q[43];
-ccx q[41],q[27],q[42];
-ccx q[40],q[26],q[41];
-ccx q[39],q[25],q[40];
-ccx q[38],q[24],q[39];
-ccx q[37],q[23],q[38];
-ccx q[36],q[22],q[37];
-ccx q[35],q[21],q[36];
-ccx q[34],q[20],q[35];
-ccx q[33],q[19],q[34];
-ccx q[32],q[18],q[33];
-ccx q[31],q[17],q[32];
-ccx q[16],q[15],q[31];
-x q[15];
-x q[17];
-x q[18];
-x q[19];
-x q[20];
-x q[21];
-x q[22];
-x q[23];
-x q[24];
-x q[25];
-x q[26];
-x q[27];
-x q[28];
-x q[29];
-cx q[0],q[15];
-cx q[1],q[17];
-cx q[2],q[19];
-cx q[3],q[21];
-cx q[4],q[23];
-cx q[5],q[25];
-cx q[6],q[27];
-cx q[7],q[29];
-cx q[8],q[16];
-cx q[8],q[17];
-cx q[9],q[18];
-cx q[9],q[19];
-cx q[10],q[20];
-cx q[10],q[21];
-cx q[11],q[22];
-cx q[11],q[23];
-cx q[12],q[24];
-cx q[12],q[25];
-cx q[13],q[26];
-cx q[13],q[27];
-cx q[14],q[28];
-cx q[14],q[29];
-h q[0];
-h q[1];
-h q[2];
-h q[3];
-h q[4];
-h q[5];
-h q[6];
-h q[7];
-h q[8];
-h q[9];
-h q[10];
-h q[11];
-h q[12];
-h q[13];
-h q[14];
-x q[0];
-x q[1];
-x q[2];
-x q[3];
-x q[4];
-x q[5];
-x q[6];
-x q[7];
-x q[8];
-x q[9];
-x q[10];
-x q[11];
-x q[12];
-x q[13];
-x q[14];
-reset q[31];
-reset q[32];
-reset q[33];
-reset q[34];
-reset q[35];
-reset q[36];
-reset q[37];
-reset q[38];
-reset q[39];
-reset q[40];
-reset q[41];
-reset q[42];
-reset q[43];
-reset q[44];
-ccx q[1],q[0],q[31];
-ccx q[31],q[2],q[32];
-ccx q[32],q[3],q[33];
-ccx q[33],q[4],q[34];
-ccx q[34],q[5],q[35];
-ccx q[35],q[6],q[36];
-ccx q[36],q[7],q[37];
-ccx q[37],q[8],q[38];
-ccx q[38],q[9],q[39];
-ccx q[39],q[10],q[40];
-ccx q[40],q[11],q[41];
-ccx q[41],q[12],q[42];
-ccx q[42],q[13],q[43];
-ccx q[43],q[14],q[44];
-z q[44];
-ccx q[43],q[14],q[44];
-ccx q[42],q[13],q[43];
-ccx q[41],q[12],q[42];
-ccx q[40],q[11],q[41];
-ccx q[39],q[10],q[40];
-ccx q[38],q[9],q[39];
-ccx q[37],q[8],q[38];
-ccx q[36],q[7],q[37];
-ccx q[35],q[6],q[36];
-ccx q[34],q[5],q[35];
-ccx q[33],q[4],q[34];
-ccx q[32],q[3],q[33];
-ccx q[31],q[2],q[32];
-ccx q[1],q[0],q[31];
-x q[0];
-x q[1];
-x q[2];
-x q[3];
-x q[4];
-x q[5];
-x q[6];
-x q[7];
-x q[8];
-x q[9];
-x q[10];
-x q[11];
-x q[12];
-x q[13];
-x q[14];
-h q[0];
-h q[1];
-h q[2];
-h q[3];
-h q[4];
-h q[5];
-h q[6];
-h q[7];
-h q[8];
-h q[9];
-h q[10];
-h q[11];
-h q[12];
-h q[13];
-h q[14];
-cx q[0],q[15];
-cx q[1],q[17];
-cx q[2],q[19];
-cx q[3],q[21];
-cx q[4],q[23];
-cx q[5],q[25];
-cx q[6],q[27];
-cx q[7],q[29];
-cx q[8],q[16];
-cx q[8],q[17];
-cx q[9],q[18];
-cx q[9],q[19];
-cx q[10],q[20];
-cx q[10],q[21];
-cx q[11],q[22];
-cx q[11],q[23];
-cx q[12],q[24];
-cx q[12],q[25];
-cx q[13],q[26];
-cx q[13],q[27];
-cx q[14],q[28];
-cx q[14],q[29];
-x q[15];
-x q[17];
-x q[18];
-x q[19];
-x q[20];
-x q[21];
-x q[22];
-x q[23];
-x q[24];
-x q[25];
-x q[26];
-x q[27];
-x q[28];
-x q[29];
-reset q[31];
-reset q[32];
-reset q[33];
-reset q[34];
-reset q[35];
-reset q[36];
-reset q[37];
-reset q[38];
-reset q[39];
-reset q[40];
-reset q[41];
-reset q[42];
-reset q[43];
-reset q[44];
-ccx q[16],q[15],q[31];
-ccx q[31],q[17],q[32];
-ccx q[32],q[18],q[33];
-ccx q[33],q[19],q[34];
-ccx q[34],q[20],q[35];
-ccx q[35],q[21],q[36];
-ccx q[36],q[22],q[37];
-ccx q[37],q[23],q[38];
-ccx q[38],q[24],q[39];
-ccx q[39],q[25],q[40];
-ccx q[40],q[26],q[41];
-ccx q[41],q[27],q[42];
-ccx q[42],q[28],q[43];
-ccx q[43],q[29],q[44];
-z q[44];
-ccx q[43],q[29],q[44];
-ccx q[42],q[28],q[43];
-ccx q[41],q[27],q[42];
-ccx q[40],q[26],q[41];
-ccx q[39],q[25],q[40];
-ccx q[38],q[24],q[39];
-ccx q[37],q[23],q[38];
-ccx q[36],q[22],q[37];
-ccx q[35],q[21],q[36];
-ccx q[34],q[20],q[35];
-ccx q[33],q[19],q[34];
-ccx q[32],q[18],q[33];
-ccx q[31],q[17],q[32];
-ccx q[16],q[15],q[31];
-x q[15];
-x q[17];
-x q[18];
-x q[19];
-x q[20];
-x q[21];
-x q[22];
-x q[23];
-x q[24];
-x q[25];
-x q[26];
-x q[27];
-x q[28];
-x q[29];
-cx q[0],q[15];
-cx q[1],q[17];
-cx q[2],q[19];
-cx q[3],q[21];
-cx q[4],q[23];
-cx q[5],q[25];
-cx q[6],q[27];
-cx q[7],q[29];
-cx q[8],q[16];
-cx q[8],q[17];
-cx q[9],q[18];
-cx q[9],q[19];
-cx q[10],q[20];
-cx q[10],q[21];
-cx q[11],q[22];
-cx q[11],q[23];
-cx q[12],q[24];
-cx q[12],q[25];
-cx q[13],q[26];
-cx q[13],q[27];
-cx q[14],q[28];
-cx q[14],q[29];
-h q[0];
-h q[1];
-h q[2];
-h q[3];
-h q[4];
-h q[5];
-h q[6];
-h q[7];
-h q[8];
-h q[9];
-h q[10];
-h q[11];
-h q[12];
-h q[13];
-h q[14];
-x q[0];
-x q[1];
-x q[2];
-x q[3];
-x q[4];
-x q[5];
-x q[6];
-x q[7];
-x q[8];
-x q[9];
-x q[10];
-x q[11];
-x q[12];
-x q[13];
-x q[14];
-reset q[31];
-reset q[32];
-reset q[33];
-reset q[34];
-reset q[35];
-reset q[36];
-reset q[37];
-reset q[38];
-reset q[39];
-reset q[40];
-reset q[41];
-reset q[42];
-reset q[43];
-reset q[44];
-ccx q[1],q[0],q[31];
-ccx q[31],q[2],q[32];
-ccx q[32],q[3],q[33];
-ccx q[33],q[4],q[34];
-ccx q[34],q[5],q[35];
-ccx q[35],q[6],q[36];
-ccx q[36],q[7],q[37];
-ccx q[37],q[8],q[38];
-ccx q[38],q[9],q[39];
-ccx q[39],q[10],q[40];
-ccx q[40],q[11],q[41];
-ccx q[41],q[12],q[42];
-ccx q[42],q[13],q[43];
-ccx q[43],q[14],q[44];
-z q[44];
-ccx q[43],q[14],q[44];
-ccx q[42],q[13],q[43];
-ccx q[41],q[12],q[42];
-ccx q[40],q[11],q[41];
-ccx q[39],q[10],q[40];
-ccx q[38],q[9],q[39];
-ccx q[37],q[8],q[38];
-ccx q[36],q[7],q[37];
-ccx q[35],q[6],q[36];
-ccx q[34],q[5],q[35];
-ccx q[33],q[4],q[34];
-ccx q[32],q[3],q[33];
-ccx q[31],q[2],q[32];
-ccx q[1],q[0],q[31];
-x q[0];
-x q[1];
-x q[2];
-x q[3];
-x q[4];
-x q[5];
-x q[6];
-x q[7];
-x q[8];
-x q[9];
-x q[10];
-x q[11];
-x q[12];
-x q[13];
-x q[14];
-h q[0];
-h q[1];
-h q[2];
-h q[3];
-h q[4];
-h q[5];
-h q[6];
-h q[7];
-h q[8];
-h q[9];
-h q[10];
-h q[11];
-h q[12];
-h q[13];
-h q[14];
-cx q[0],q[15];
-cx q[1],q[17];
-cx q[2],q[19];
-cx q[3],q[21];
-cx q[4],q[23];
-cx q[5],q[25];
-cx q[6],q[27];
-cx q[7],q[29];
-cx q[8],q[16];
-cx q[8],q[17];
-cx q[9],q[18];
-cx q[9],q[19];
-cx q[10],q[20];
-cx q[10],q[21];
-cx q[11],q[22];
-cx q[11],q[23];
-cx q[12],q[24];
-cx q[12],q[25];
-cx q[13],q[26];
-cx q[13],q[27];
-cx q[14],q[28];
-cx q[14],q[29];
-x q[15];
-x q[17];
-x q[18];
-x q[19];
-x q[20];
-x q[21];
-x q[22];
-x q[23];
-x q[24];
-x q[25];
-x q[26];
-x q[27];
-x q[28];
-x q[29];
-reset q[31];
-reset q[32];
-reset q[33];
-reset q[34];
-reset q[35];
-reset q[36];
-reset q[37];
-reset q[38];
-reset q[39];
-reset q[40];
-reset q[41];
-reset q[42];
-reset q[43];
-reset q[44];
-ccx q[16],q[15],q[31];
-ccx q[31],q[17],q[32];
-ccx q[32],q[18],q[33];
-ccx q[33],q[19],q[34];
-ccx q[34],q[20],q[35];
-ccx q[35],q[21],q[36];
-ccx q[36],q[22],q[37];
-ccx q[37],q[23],q[38];
-ccx q[38],q[24],q[39];
-ccx q[39],q[25],q[40];
-ccx q[40],q[26],q[41];
-ccx q[41],q[27],q[42];
-ccx q[42],q[28],q[43];
-ccx q[43],q[29],q[44];
-z q[44];
-ccx q[43],q[29],q[44];
-ccx q[42],q[28],q[43];
-ccx q[41],q[27],q[42];
-ccx q[40],q[26],q[41];
-ccx q[39],q[25],q[40];
-ccx q[38],q[24],q[39];
-ccx q[37],q[23],q[38];
-ccx q[36],q[22],q[37];
-ccx q[35],q[21],q[36];
-ccx q[34],q[20],q[35];
-ccx q[33],q[19],q[34];
-ccx q[32],q[18],q[33];
-ccx q[31],q[17],q[32];
-ccx q[16],q[15],q[31];
-x q[15];
-x q[17];
-x q[18];
-x q[19];
-x q[20];
-x q[21];
-x q[22];
-x q[23];
-x q[24];
-x q[25];
-x q[26];
-x q[27];
-x q[28];
-x q[29];
-cx q[0],q[15];
-cx q[1],q[17];
-cx q[2],q[19];
-cx q[3],q[21];
-cx q[4],q[23];
-cx q[5],q[25];
-cx q[6],q[27];
-cx q[7],q[29];
-cx q[8],q[16];
-cx q[8],q[17];
-cx q[9],q[18];
-cx q[9],q[19];
-cx q[10],q[20];
-cx q[10],q[21];
-cx q[11],q[22];
-cx q[11],q[23];
-cx q[12],q[24];
-cx q[12],q[25];
-cx q[13],q[26];
-cx q[13],q[27];
-cx q[14],q[28];
-cx q[14],q[29];
-h q[0];
-h q[1];
-h q[2];
-h q[3];
-h q[4];
-h q[5];
-h q[6];
-h q[7];
-h q[8];
-h q[9];
-h q[10];
-h q[11];
-h q[12];
-h q[13];
-h q[14];
-x q[0];
-x q[1];
-x q[2];
-x q[3];
-x q[4];
-x q[5];
-x q[6];
-x q[7];
-x q[8];
-x q[9];
-x q[10];
-x q[11];
-x q[12];
-x q[13];
-x q[14];
-reset q[31];
-reset q[32];
-reset q[33];
-reset q[34];
-reset q[35];
-reset q[36];
-reset q[37];
-reset q[38];
-reset q[39];
-reset q[40];
-reset q[41];
-reset q[42];
-reset q[43];
-reset q[44];
-ccx q[1],q[0],q[31];
-ccx q[31],q[2],q[32];
-ccx q[32],q[3],q[33];
-ccx q[33],q[4],q[34];
-ccx q[34],q[5],q[35];
-ccx q[35],q[6],q[36];
-ccx q[36],q[7],q[37];
-ccx q[37],q[8],q[38];
-ccx q[38],q[9],q[39];
-ccx q[39],q[10],q[40];
-ccx q[40],q[11],q[41];
-ccx q[41],q[12],q[42];
-ccx q[42],q[13],q[43];
-ccx q[43],q[14],q[44];
-z q[44];
-ccx q[43],q[14],q[44];
-ccx q[42],q[13],q[43];
-ccx q[41],q[12],q[42];
-ccx q[40],q[11],q[41];
-ccx q[39],q[10],q[40];
-ccx q[38],q[9],q[39];
-ccx q[37],q[8],q[38];
-ccx q[36],q[7],q[37];
-ccx q[35],q[6],q[36];
-ccx q[34],q[5],q[35];
-ccx q[33],q[4],q[34];
-ccx q[32],q[3],q[33];
-ccx q[31],q[2],q[32];
-ccx q[1],q[0],q[31];
-x q[0];
-x q[1];
-x q[2];
-x q[3];
-x q[4];
-x q[5];
-x q[6];
-x q[7];
-x q[8];
-x q[9];
-x q[10];
-x q[11];
-x q[12];
-x q[13];
-x q[14];
-h q[0];
-h q[1];
-h q[2];
-h q[3];
-h q[4];
-h q[5];
-h q[6];
-h q[7];
-h q[8];
-h q[9];
-h q[10];
-h q[11];
-h q[12];
-h q[13];
-h q[14];
-cx q[0],q[15];
-cx q[1],q[17];
-cx q[2],q[19];
-cx q[3],q[21];
-cx q[4],q[23];
-cx q[5],q[25];
-cx q[6],q[27];
-cx q[7],q[29];
-cx q[8],q[16];
-cx q[8],q[17];
-cx q[9],q[18];
-cx q[9],q[19];
-cx q[10],q[20];
-cx q[10],q[21];
-cx q[11],q[22];
-cx q[11],q[23];
-cx q[12],q[24];
-cx q[12],q[25];
-cx q[13],q[26];
-cx q[13],q[27];
-cx q[14],q[28];
-cx q[14],q[29];
-x q[15];
-x q[17];
-x q[18];
-x q[19];
-x q[20];
-x q[21];
-x q[22];
-x q[23];
-x q[24];
-x q[25];
-x q[26];
-x q[27];
-x q[28];
-x q[29];
-reset q[31];
-reset q[32];
-reset q[33];
-reset q[34];
-reset q[35];
-reset q[36];
-reset q[37];
-reset q[38];
-reset q[39];
-reset q[40];
-reset q[41];
-reset q[42];
-reset q[43];
-reset q[44];
-ccx q[16],q[15],q[31];
-ccx q[31],q[17],q[32];
-ccx q[32],q[18],q[33];
-ccx q[33],q[19],q[34];
-ccx q[34],q[20],q[35];
-ccx q[35],q[21],q[36];
-ccx q[36],q[22],q[37];
-ccx q[37],q[23],q[38];
-ccx q[38],q[24],q[39];
-ccx q[39],q[25],q[40];
-ccx q[40],q[26],q[41];
-ccx q[41],q[27],q[42];
-ccx q[42],q[28],q[43];
-ccx q[43],q[29],q[44];
-z q[44];
-ccx q[43],q[29],q[44];
-ccx q[42],q[28],q[43];
-ccx q[41],q[27],q[42];
-ccx q[40],q[26],q[41];
-ccx q[39],q[25],q[40];
-ccx q[38],q[24],q[39];
-ccx q[37],q[23],q[38];
-ccx q[36],q[22],q[37];
-ccx q[35],q[21],q[36];
-ccx q[34],q[20],q[35];
-ccx q[33],q[19],q[34];
-ccx q[32],q[18],q[33];
-ccx q[31],q[17],q[32];
-ccx q[16],q[15],q[31];
-x q[15];
-x q[17];
-x q[18];
-x q[19];
-x q[20];
-x q[21];
-x q[22];
-x q[23];
-x q[24];
-x q[25];
-x q[26];
-x q[27];
-x q[28];
-x q[29];
-cx q[0],q[15];
-cx q[1],q[17];
-cx q[2],q[19];
-cx q[3],q[21];
-cx q[4],q[23];
-cx q[5],q[25];
-cx q[6],q[27];
-cx q[7],q[29];
-cx q[8],q[16];
-cx q[8],q[17];
-cx q[9],q[18];
-cx q[9],q[19];
-cx q[10],q[20];
-cx q[10],q[21];
-cx q[11],q[22];
-cx q[11],q[23];
-cx q[12],q[24];
-cx q[12],q[25];
-cx q[13],q[26];
-cx q[13],q[27];
-cx q[14],q[28];
-cx q[14],q[29];
-h q[0];
-h q[1];
-h q[2];
-h q[3];
-h q[4];
-h q[5];
-h q[6];
-h q[7];
-h q[8];
-h q[9];
-h q[10];
-h q[11];
-h q[12];
-h q[13];
-h q[14];
-x q[0];
-x q[1];
-x q[2];
-x q[3];
-x q[4];
-x q[5];
-x q[6];
-x q[7];
-x q[8];
-x q[9];
-x q[10];
-x q[11];
-x q[12];
-x q[13];
-x q[14];
-reset q[31];
-reset q[32];
-reset q[33];
-reset q[34];
-reset q[35];
-reset q[36];
-reset q[37];
-reset q[38];
-reset q[39];
-reset q[40];
-reset q[41];
-reset q[42];
-reset q[43];
-reset q[44];
-ccx q[1],q[0],q[31];
-ccx q[31],q[2],q[32];
-ccx q[32],q[3],q[33];
-ccx q[33],q[4],q[34];
-ccx q[34],q[5],q[35];
-ccx q[35],q[6],q[36];
-ccx q[36],q[7],q[37];
-ccx q[37],q[8],q[38];
-ccx q[38],q[9],q[39];
-ccx q[39],q[10],q[40];
-ccx q[40],q[11],q[41];
-ccx q[41],q[12],q[42];
-ccx q[42],q[13],q[43];
-ccx q[43],q[14],q[44];
-z q[44];
-ccx q[43],q[14],q[44];
-ccx q[42],q[13],q[43];
-ccx q[41],q[12],q[42];
-ccx q[40],q[11],q[41];
-ccx q[39],q[10],q[40];
-ccx q[38],q[9],q[39];
-ccx q[37],q[8],q[38];
-ccx q[36],q[7],q[37];
-ccx q[35],q[6],q[36];
-ccx q[34],q[5],q[35];
-ccx q[33],q[4],q[34];
-ccx q[32],q[3],q[33];
-ccx q[31],q[2],q[32];
-ccx q[1],q[0],q[31];
-x q[0];
-x q[1];
-x q[2];
-x q[3];
-x q[4];
-x q[5];
-x q[6];
-x q[7];
-x q[8];
-x q[9];
-x q[10];
-x q[11];
-x q[12];
-x q[13];
-x q[14];
-h q[0];
-h q[1];
-h q[2];
-h q[3];
-h q[4];
-h q[5];
-h q[6];
-h q[7];
-h q[8];
-h q[9];
-h q[10];
-h q[11];
-h q[12];
-h q[13];
-h q[14];
-cx q[0],q[15];
-cx q[1],q[17];
-cx q[2],q[19];
-cx q[3],q[21];
-cx q[4],q[23];
-cx q[5],q[25];
-cx q[6],q[27];
-cx q[7],q[29];
-cx q[8],q[16];
-cx q[8],q[17];
-cx q[9],q[18];
-cx q[9],q[19];
-cx q[10],q[20];
-cx q[10],q[21];
-cx q[11],q[22];
-cx q[11],q[23];
-cx q[12],q[24];
-cx q[12],q[25];
-cx q[13],q[26];
-cx q[13],q[27];
-cx q[14],q[28];
-cx q[14],q[29];
-x q[15];
-x q[17];
-x q[18];
-x q[19];
-x q[20];
-x q[21];
-x q[22];
-x q[23];
-x q[24];
-x q[25];
-x q[26];
-x q[27];
-x q[28];
-x q[29];
-reset q[31];
-reset q[32];
-reset q[33];
-reset q[34];
-reset q[35];
-reset q[36];
-reset q[37];
-reset q[38];
-reset q[39];
-reset q[40];
-reset q[41];
-reset q[42];
-reset q[43];
-reset q[44];
-ccx q[16],q[15],q[31];
-ccx q[31],q[17],q[32];
-ccx q[32],q[18],q[33];
-ccx q[33],q[19],q[34];
-ccx q[34],q[20],q[35];
-ccx q[35],q[21],q[36];
-ccx q[36],q[22],q[37];
-ccx q[37],q[23],q[38];
-ccx q[38],q[24],q[39];
-ccx q[39],q[25],q[40];
-ccx q[40],q[26],q[41];
-ccx q[41],q[27],q[42];
-ccx q[42],q[28],q[43];
-ccx q[43],q[29],q[44];
-z q[44];
-ccx q[43],q[29],q[44];
-ccx q[42],q[28],q[43];
-ccx q[41],q[27],q[42];
-ccx q[40],q[26],q[41];
-ccx q[39],q[25],q[40];
-ccx q[38],q[24],q[39];
-ccx q[37],q[23],q[38];
-ccx q[36],q[22],q[37];
-ccx q[35],q[21],q[36];
-ccx q[34],q[20],q[35];
-ccx q[33],q[19],q[34];
-ccx q[32],q[18],q[33];
-ccx q[31],q[17],q[32];
-ccx q[16],q[15],q[31];
-x q[15];
-x q[17];
-x q[18];
-x q[19];
-x q[20];
-x q[21];
-x q[22];
-x q[23];
-x q[24];
-x q[25];
-x q[26];
-x q[27];
-x q[28];
-x q[29];
-cx q[0],q[15];
-cx q[1],q[17];
-cx q[2],q[19];
-cx q[3],q[21];
-cx q[4],q[23];
-cx q[5],q[25];
-cx q[6],q[27];
-cx q[7],q[29];
-cx q[8],q[16];
-cx q[8],q[17];
-cx q[9],q[18];
-cx q[9],q[19];
-cx q[10],q[20];
-cx q[10],q[21];
-cx q[11],q[22];
-cx q[11],q[23];
-cx q[12],q[24];
-cx q[12],q[25];
-cx q[13],q[26];
-cx q[13],q[27];
-cx q[14],q[28];
-cx q[14],q[29];
-h q[0];
-h q[1];
-h q[2];
-h q[3];
-h q[4];
-h q[5];
-h q[6];
-h q[7];
-h q[8];
-h q[9];
-h q[10];
-h q[11];
-h q[12];
-h q[13];
-h q[14];
-x q[0];
-x q[1];
-x q[2];
-x q[3];
-x q[4];
-x q[5];
-x q[6];
-x q[7];
-x q[8];
-x q[9];
-x q[10];
-x q[11];
-x q[12];
-x q[13];
-x q[14];
-reset q[31];
-reset q[32];
-reset q[33];
-reset q[34];
-reset q[35];
-reset q[36];
-reset q[37];
-reset q[38];
-reset q[39];
-reset q[40];
-reset q[41];
-reset q[42];
-reset q[43];
-reset q[44];
-ccx q[1],q[0],q[31];
-ccx q[31],q[2],q[32];
-ccx q[32],q[3],q[33];
-ccx q[33],q[4],q[34];
-ccx q[34],q[5],q[35];
-ccx q[35],q[6],q[36];
-ccx q[36],q[7],q[37];
-ccx q[37],q[8],q[38];
-ccx q[38],q[9],q[39];
-ccx q[39],q[10],q[40];
-ccx q[40],q[11],q[41];
-ccx q[41],q[12],q[42];
-ccx q[42],q[13],q[43];
-ccx q[43],q[14],q[44];
-z q[44];
-ccx q[43],q[14],q[44];
-ccx q[42],q[13],q[43];
-ccx q[41],q[12],q[42];
-ccx q[40],q[11],q[41];
-ccx q[39],q[10],q[40];
-ccx q[38],q[9],q[39];
-ccx q[37],q[8],q[38];
-ccx q[36],q[7],q[37];
-ccx q[35],q[6],q[36];
-ccx q[34],q[5],q[35];
-ccx q[33],q[4],q[34];
-ccx q[32],q[3],q[33];
-ccx q[31],q[2],q[32];
-ccx q[1],q[0],q[31];
-x q[0];
-x q[1];
-x q[2];
-x q[3];
-x q[4];
-x q[5];
-x q[6];
-x q[7];
-x q[8];
-x q[9];
-x q[10];
-x q[11];
-x q[12];
-x q[13];
-x q[14];
-h q[0];
-h q[1];
-h q[2];
-h q[3];
-h q[4];
-h q[5];
-h q[6];
-h q[7];
-h q[8];
-h q[9];
-h q[10];
-h q[11];
-h q[12];
-h q[13];
-h q[14];
-cx q[0],q[15];
-cx q[1],q[17];
-cx q[2],q[19];
-cx q[3],q[21];
-cx q[4],q[23];
-cx q[5],q[25];
-cx q[6],q[27];
-cx q[7],q[29];
-cx q[8],q[16];
-cx q[8],q[17];
-cx q[9],q[18];
-cx q[9],q[19];
-cx q[10],q[20];
-cx q[10],q[21];
-cx q[11],q[22];
-cx q[11],q[23];
-cx q[12],q[24];
-cx q[12],q[25];
-cx q[13],q[26];
-cx q[13],q[27];
-cx q[14],q[28];
-cx q[14],q[29];
-x q[15];
-x q[17];
-x q[18];
-x q[19];
-x q[20];
-x q[21];
-x q[22];
-x q[23];
-x q[24];
-x q[25];
-x q[26];
-x q[27];
-x q[28];
-x q[29];
-reset q[31];
-reset q[32];
-reset q[33];
-reset q[34];
-reset q[35];
-reset q[36];
-reset q[37];
-reset q[38];
-reset q[39];
-reset q[40];
-reset q[41];
-reset q[42];
-reset q[43];
-reset q[44];
-ccx q[16],q[15],q[31];
-ccx q[31],q[17],q[32];
-ccx q[32],q[18],q[33];
-ccx q[33],q[19],q[34];
-ccx q[34],q[20],q[35];
-ccx q[35],q[21],q[36];
-ccx q[36],q[22],q[37];
-ccx q[37],q[23],q[38];
-ccx q[38],q[24],q[39];
-ccx q[39],q[25],q[40];
-ccx q[40],q[26],q[41];
-ccx q[41],q[27],q[42];
-ccx q[42],q[28],q[43];
-ccx q[43],q[29],q[44];
-z q[44];
-ccx q[43],q[29],q[44];
-ccx q[42],q[28],q[43];
-ccx q[41],q[27],q[42];
-ccx q[40],q[26],q[41];
-ccx q[39],q[25],q[40];
-ccx q[38],q[24],q[39];
-ccx q[37],q[23],q[38];
-ccx q[36],q[22],q[37];
-ccx q[35],q[21],q[36];
-ccx q[34],q[20],q[35];
-ccx q[33],q[19],q[34];
-ccx q[32],q[18],q[33];
-ccx q[31],q[17],q[32];
-ccx q[16],q[15],q[31];
-x q[15];
-x q[17];
-x q[18];
-x q[19];
-x q[20];
-x q[21];
-x q[22];
-x q[23];
-x q[24];
-x q[25];
-x q[26];
-x q[27];
-x q[28];
-x q[29];
-cx q[0],q[15];
-cx q[1],q[17];
-cx q[2],q[19];
-cx q[3],q[21];
-cx q[4],q[23];
-cx q[5],q[25];
-cx q[6],q[27];
-cx q[7],q[29];
-cx q[8],q[16];
-cx q[8],q[17];
-cx q[9],q[18];
-cx q[9],q[19];
-cx q[10],q[20];
-cx q[10],q[21];
-cx q[11],q[22];
-cx q[11],q[23];
-cx q[12],q[24];
-cx q[12],q[25];
-cx q[13],q[26];
-cx q[13],q[27];
-cx q[14],q[28];
-cx q[14],q[29];
-h q[0];
-h q[1];
-h q[2];
-h q[3];
-h q[4];
-h q[5];
-h q[6];
-h q[7];
-h q[8];
-h q[9];
-h q[10];
-h q[11];
-h q[12];
-h q[13];
-h q[14];
-x q[0];
-x q[1];
-x q[2];
-x q[3];
-x q[4];
-x q[5];
-x q[6];
-x q[7];
-x q[8];
-x q[9];
-x q[10];
-x q[11];
-x q[12];
-x q[13];
-x q[14];
-reset q[31];
-reset q[32];
-reset q[33];
-reset q[34];
-reset q[35];
-reset q[36];
-reset q[37];
-reset q[38];
-reset q[39];
-reset q[40];
-reset q[41];
-reset q[42];
-reset q[43];
-reset q[44];
-ccx q[1],q[0],q[31];
-ccx q[31],q[2],q[32];
-ccx q[32],q[3],q[33];
-ccx q[33],q[4],q[34];
-ccx q[34],q[5],q[35];
-ccx q[35],q[6],q[36];
-ccx q[36],q[7],q[37];
-ccx q[37],q[8],q[38];
-ccx q[38],q[9],q[39];
-ccx q[39],q[10],q[40];
-ccx q[40],q[11],q[41];
-ccx q[41],q[12],q[42];
-ccx q[42],q[13],q[43];
-ccx q[43],q[14],q[44];
-z q[44];
-ccx q[43],q[14],q[44];
-ccx q[42],q[13],q[43];
-ccx q[41],q[12],q[42];
-ccx q[40],q[11],q[41];
-ccx q[39],q[10],q[40];
-ccx q[38],q[9],q[39];
-ccx q[37],q[8],q[38];
-ccx q[36],q[7],q[37];
-ccx q[35],q[6],q[36];
-ccx q[34],q[5],q[35];
-ccx q[33],q[4],q[34];
-ccx q[32],q[3],q[33];
-ccx q[31],q[2],q[32];
-ccx q[1],q[0],q[31];
-x q[0];
-x q[1];
-x q[2];
-x q[3];
-x q[4];
-x q[5];
-x q[6];
-x q[7];
-x q[8];
-x q[9];
-x q[10];
-x q[11];
-x q[12];
-x q[13];
-x q[14];
-h q[0];
-h q[1];
-h q[2];
-h q[3];
-h q[4];
-h q[5];
-h q[6];
-h q[7];
-h q[8];
-h q[9];
-h q[10];
-h q[11];
-h q[12];
-h q[13];
-h q[14];
-cx q[0],q[15];
-cx q[1],q[17];
-cx q[2],q[19];
-cx q[3],q[21];
-cx q[4],q[23];
-cx q[5],q[25];
-cx q[6],q[27];
-cx q[7],q[29];
-cx q[8],q[16];
-cx q[8],q[17];
-cx q[9],q[18];
-cx q[9],q[19];
-cx q[10],q[20];
-cx q[10],q[21];
-cx q[11],q[22];
-cx q[11],q[23];
-cx q[12],q[24];
-cx q[12],q[25];
-cx q[13],q[26];
-cx q[13],q[27];
-cx q[14],q[28];
-cx q[14],q[29];
-x q[15];
-x q[17];
-x q[18];
-x q[19];
-x q[20];
-x q[21];
-x q[22];
-x q[23];
-x q[24];
-x q[25];
-x q[26];
-x q[27];
-x q[28];
-x q[29];
-reset q[31];
-reset q[32];
-reset q[33];
-reset q[34];
-reset q[35];
-reset q[36];
-reset q[37];
-reset q[38];
-reset q[39];
-reset q[40];
-reset q[41];
-reset q[42];
-reset q[43];
-reset q[44];
-ccx q[16],q[15],q[31];
-ccx q[31],q[17],q[32];
-ccx q[32],q[18],q[33];
-ccx q[33],q[19],q[34];
-ccx q[34],q[20],q[35];
-ccx q[35],q[21],q[36];
-ccx q[36],q[22],q[37];
-ccx q[37],q[23],q[38];
-ccx q[38],q[24],q[39];
-ccx q[39],q[25],q[40];
-ccx q[40],q[26],q[41];
-ccx q[41],q[27],q[42];
-ccx q[42],q[28],q[43];
-ccx q[43],q[29],q[44];
-z q[44];
-ccx q[43],q[29],q[44];
-ccx q[42],q[28],q[43];
-ccx q[41],q[27],q[42];
-ccx q[40],q[26],q[41];
-ccx q[39],q[25],q[40];
-ccx q[38],q[24],q[39];
-ccx q[37],q[23],q[38];
-ccx q[36],q[22],q[37];
-ccx q[35],q[21],q[36];
-ccx q[34],q[20],q[35];
-ccx q[33],q[19],q[34];
-ccx q[32],q[18],q[33];
-ccx q[31],q[17],q[32];
-ccx q[16],q[15],q[31];
-x q[15];
-x q[17];
-x q[18];
-x q[19];
-x q[20];
-x q[21];
-x q[22];
-x q[23];
-x q[24];
-x q[25];
-x q[26];
-x q[27];
-x q[28];
-x q[29];
-cx q[0],q[15];
-cx q[1],q[17];
-cx q[2],q[19];
-cx q[3],q[21];
-cx q[4],q[23];
-cx q[5],q[25];
-cx q[6],q[27];
-cx q[7],q[29];
-cx q[8],q[16];
-cx q[8],q[17];
-cx q[9],q[18];
-cx q[9],q[19];
-cx q[10],q[20];
-cx q[10],q[21];
-cx q[11],q[22];
-cx q[11],q[23];
-cx q[12],q[24];
-cx q[12],q[25];
-cx q[13],q[26];
-cx q[13],q[27];
-cx q[14],q[28];
-cx q[14],q[29];
-h q[0];
-h q[1];
-h q[2];
-h q[3];
-h q[4];
-h q[5];
-h q[6];
-h q[7];
-h q[8];
-h q[9];
-h q[10];
-h q[11];
-h q[12];
-h q[13];
-h q[14];
-x q[0];
-x q[1];
-x q[2];
-x q[3];
-x q[4];
-x q[5];
-x q[6];
-x q[7];
-x q[8];
-x q[9];
-x q[10];
-x q[11];
-x q[12];
-x q[13];
-x q[14];
-reset q[31];
-reset q[32];
-reset q[33];
-reset q[34];
-reset q[35];
-reset q[36];
-reset q[37];
-reset q[38];
-reset q[39];
-reset q[40];
-reset q[41];
-reset q[42];
-reset q[43];
-reset q[44];
-ccx q[1],q[0],q[31];
-ccx q[31],q[2],q[32];
-ccx q[32],q[3],q[33];
-ccx q[33],q[4],q[34];
-ccx q[34],q[5],q[35];
-ccx q[35],q[6],q[36];
-ccx q[36],q[7],q[37];
-ccx q[37],q[8],q[38];
-ccx q[38],q[9],q[39];
-ccx q[39],q[10],q[40];
-ccx q[40],q[11],q[41];
-ccx q[41],q[12],q[42];
-ccx q[42],q[13],q[43];
-ccx q[43],q[14],q[44];
-z q[44];
-ccx q[43],q[14],q[44];
-ccx q[42],q[13],q[43];
-ccx q[41],q[12],q[42];
-ccx q[40],q[11],q[41];
-ccx q[39],q[10],q[40];
-ccx q[38],q[9],q[39];
-ccx q[37],q[8],q[38];
-ccx q[36],q[7],q[37];
-ccx q[35],q[6],q[36];
-ccx q[34],q[5],q[35];
-ccx q[33],q[4],q[34];
-ccx q[32],q[3],q[33];
-ccx q[31],q[2],q[32];
-ccx q[1],q[0],q[31];
-x q[0];
-x q[1];
-x q[2];
-x q[3];
-x q[4];
-x q[5];
-x q[6];
-x q[7];
-x q[8];
-x q[9];
-x q[10];
-x q[11];
-x q[12];
-x q[13];
-x q[14];
-h q[0];
-h q[1];
-h q[2];
-h q[3];
-h q[4];
-h q[5];
-h q[6];
-h q[7];
-h q[8];
-h q[9];
-h q[10];
-h q[11];
-h q[12];
-h q[13];
-h q[14];
-cx q[0],q[15];
-cx q[1],q[17];
-cx q[2],q[19];
-cx q[3],q[21];
-cx q[4],q[23];
-cx q[5],q[25];
-cx q[6],q[27];
-cx q[7],q[29];
-cx q[8],q[16];
-cx q[8],q[17];
-cx q[9],q[18];
-cx q[9],q[19];
-cx q[10],q[20];
-cx q[10],q[21];
-cx q[11],q[22];
-cx q[11],q[23];
-cx q[12],q[24];
-cx q[12],q[25];
-cx q[13],q[26];
-cx q[13],q[27];
-cx q[14],q[28];
-cx q[14],q[29];
-x q[15];
-x q[17];
-x q[18];
-x q[19];
-x q[20];
-x q[21];
-x q[22];
-x q[23];
-x q[24];
-x q[25];
-x q[26];
-x q[27];
-x q[28];
-x q[29];
-reset q[31];
-reset q[32];
-reset q[33];
-reset q[34];
-reset q[35];
-reset q[36];
-reset q[37];
-reset q[38];
-reset q[39];
-reset q[40];
-reset q[41];
-reset q[42];
-reset q[43];
-reset q[44];
-ccx q[16],q[15],q[31];
-ccx q[31],q[17],q[32];
-ccx q[32],q[18],q[33];
-ccx q[33],q[19],q[34];
-ccx q[34],q[20],q[35];
-ccx q[35],q[21],q[36];
-ccx q[36],q[22],q[37];
-ccx q[37],q[23],q[38];
-ccx q[38],q[24],q[39];
-ccx q[39],q[25],q[40];
-ccx q[40],q[26],q[41];
-ccx q[41],q[27],q[42];
-ccx q[42],q[28],q[43];
-ccx q[43],q[29],q[44];
-z q[44];
-ccx q[43],q[29],q[44];
-ccx q[42],q[28],q[43];
-ccx q[41],q[27],q[42];
-ccx q[40],q[26],q[41];
-ccx q[39],q[25],q[40];
-ccx q[38],q[24],q[39];
-ccx q[37],q[23],q[38];
-ccx q[36],q[22],q[37];
-ccx q[35],q[21],q[36];
-ccx q[34],q[20],q[35];
-ccx q[33],q[19],q[34];
-ccx q[32],q[18],q[33];
-ccx q[31],q[17],q[32];
-ccx q[16],q[15],q[31];
-x q[15];
-x q[17];
-x q[18];
-x q[19];
-x q[20];
-x q[21];
-x q[22];
-x q[23];
-x q[24];
-x q[25];
-x q[26];
-x q[27];
-x q[28];
-x q[29];
-cx q[0],q[15];
-cx q[1],q[17];
-cx q[2],q[19];
-cx q[3],q[21];
-cx q[4],q[23];
-cx q[5],q[25];
-cx q[6],q[27];
-cx q[7],q[29];
-cx q[8],q[16];
-cx q[8],q[17];
-cx q[9],q[18];
-cx q[9],q[19];
-cx q[10],q[20];
-cx q[10],q[21];
-cx q[11],q[22];
-cx q[11],q[23];
-cx q[12],q[24];
-cx q[12],q[25];
-cx q[13],q[26];
-cx q[13],q[27];
-cx q[14],q[28];
-cx q[14],q[29];
-h q[0];
-h q[1];
-h q[2];
-h q[3];
-h q[4];
-h q[5];
-h q[6];
-h q[7];
-h q[8];
-h q[9];
-h q[10];
-h q[11];
-h q[12];
-h q[13];
-h q[14];
-x q[0];
-x q[1];
-x q[2];
-x q[3];
-x q[4];
-x q[5];
-x q[6];
-x q[7];
-x q[8];
-x q[9];
-x q[10];
-x q[11];
-x q[12];
-x q[13];
-x q[14];
-reset q[31];
-reset q[32];
-reset q[33];
-reset q[34];
-reset q[35];
-reset q[36];
-reset q[37];
-reset q[38];
-reset q[39];
-reset q[40];
-reset q[41];
-reset q[42];
-reset q[43];
-reset q[44];
-ccx q[1],q[0],q[31];
-ccx q[31],q[2],q[32];
-ccx q[32],q[3],q[33];
-ccx q[33],q[4],q[34];
-ccx q[34],q[5],q[35];
-ccx q[35],q[6],q[36];
-ccx q[36],q[7],q[37];
-ccx q[37],q[8],q[38];
-ccx q[38],q[9],q[39];
-ccx q[39],q[10],q[40];
-ccx q[40],q[11],q[41];
-ccx q[41],q[12],q[42];
-ccx q[42],q[13],q[43];
-ccx q[43],q[14],q[44];
-z q[44];
-ccx q[43],q[14],q[44];
-ccx q[42],q[13],q[43];
-ccx q[41],q[12],q[42];
-ccx q[40],q[11],q[41];
-ccx q[39],q[10],q[40];
-ccx q[38],q[9],q[39];
-ccx q[37],q[8],q[38];
-ccx q[36],q[7],q[37];
-ccx q[35],q[6],q[36];
-ccx q[34],q[5],q[35];
-ccx q[33],q[4],q[34];
-ccx q[32],q[3],q[33];
-ccx q[31],q[2],q[32];
-ccx q[1],q[0],q[31];
-x q[0];
-x q[1];
-x q[2];
-x q[3];
-x q[4];
-x q[5];
-x q[6];
-x q[7];
-x q[8];
-x q[9];
-x q[10];
-x q[11];
-x q[12];
-x q[13];
-x q[14];
-h q[0];
-h q[1];
-h q[2];
-h q[3];
-h q[4];
-h q[5];
-h q[6];
-h q[7];
-h q[8];
-h q[9];
-h q[10];
-h q[11];
-h q[12];
-h q[13];
-h q[14];
-cx q[0],q[15];
-cx q[1],q[17];
-cx q[2],q[19];
-cx q[3],q[21];
-cx q[4],q[23];
-cx q[5],q[25];
-cx q[6],q[27];
-cx q[7],q[29];
-cx q[8],q[16];
-cx q[8],q[17];
-cx q[9],q[18];
-cx q[9],q[19];
-cx q[10],q[20];
-cx q[10],q[21];
-cx q[11],q[22];
-cx q[11],q[23];
-cx q[12],q[24];
-cx q[12],q[25];
-cx q[13],q[26];
-cx q[13],q[27];
-cx q[14],q[28];
-cx q[14],q[29];
-x q[15];
-x q[17];
-x q[18];
-x q[19];
-x q[20];
-x q[21];
-x q[22];
-x q[23];
-x q[24];
-x q[25];
-x q[26];
-x q[27];
-x q[28];
-x q[29];
-reset q[31];
-reset q[32];
-reset q[33];
-reset q[34];
-reset q[35];
-reset q[36];
-reset q[37];
-reset q[38];
-reset q[39];
-reset q[40];
-reset q[41];
-reset q[42];
-reset q[43];
-reset q[44];
-ccx q[16],q[15],q[31];
-ccx q[31],q[17],q[32];
-ccx q[32],q[18],q[33];
-ccx q[33],q[19],q[34];
-ccx q[34],q[20],q[35];
-ccx q[35],q[21],q[36];
-ccx q[36],q[22],q[37];
-ccx q[37],q[23],q[38];
-ccx q[38],q[24],q[39];
-ccx q[39],q[25],q[40];
-ccx q[40],q[26],q[41];
-ccx q[41],q[27],q[42];
-ccx q[42],q[28],q[43];
-ccx q[43],q[29],q[44];
-z q[44];
-ccx q[43],q[29],q[44];
-ccx q[42],q[28],q[43];
-ccx q[41],q[27],q[42];
-ccx q[40],q[26],q[41];
-ccx q[39],q[25],q[40];
-ccx q[38],q[24],q[39];
-ccx q[37],q[23],q[38];
-ccx q[36],q[22],q[37];
-ccx q[35],q[21],q[36];
-ccx q[34],q[20],q[35];
-ccx q[33],q[19],q[34];
-ccx q[32],q[18],q[33];
-ccx q[31],q[17],q[32];
-ccx q[16],q[15],q[31];
-x q[15];
-x q[17];
-x q[18];
-x q[19];
-x q[20];
-x q[21];
-x q[22];
-x q[23];
-x q[24];
-x q[25];
-x q[26];
-x q[27];
-x q[28];
-x q[29];
-cx q[0],q[15];
-cx q[1],q[17];
-cx q[2],q[19];
-cx q[3],q[21];
-cx q[4],q[23];
-cx q[5],q[25];
-cx q[6],q[27];
-cx q[7],q[29];
-cx q[8],q[16];
-cx q[8],q[17];
-cx q[9],q[18];
-cx q[9],q[19];
-cx q[10],q[20];
-cx q[10],q[21];
-cx q[11],q[22];
-cx q[11],q[23];
-cx q[12],q[24];
-cx q[12],q[25];
-cx q[13],q[26];
-cx q[13],q[27];
-cx q[14],q[28];
-cx q[14],q[29];
-h q[0];
-h q[1];
-h q[2];
-h q[3];
-h q[4];
-h q[5];
-h q[6];
-h q[7];
-h q[8];
-h q[9];
-h q[10];
-h q[11];
-h q[12];
-h q[13];
-h q[14];
-x q[0];
-x q[1];
-x q[2];
-x q[3];
-x q[4];
-x q[5];
-x q[6];
-x q[7];
-x q[8];
-x q[9];
-x q[10];
-x q[11];
-x q[12];
-x q[13];
-x q[14];
-reset q[31];
-reset q[32];
-reset q[33];
-reset q[34];
-reset q[35];
-reset q[36];
-reset q[37];
-reset q[38];
-reset q[39];
-reset q[40];
-reset q[41];
-reset q[42];
-reset q[43];
-reset q[44];
-ccx q[1],q[0],q[31];
-ccx q[31],q[2],q[32];
-ccx q[32],q[3],q[33];
-ccx q[33],q[4],q[34];
-ccx q[34],q[5],q[35];
-ccx q[35],q[6],q[36];
-ccx q[36],q[7],q[37];
-ccx q[37],q[8],q[38];
-ccx q[38],q[9],q[39];
-ccx q[39],q[10],q[40];
-ccx q[40],q[11],q[41];
-ccx q[41],q[12],q[42];
-ccx q[42],q[13],q[43];
-ccx q[43],q[14],q[44];
-z q[44];
-ccx q[43],q[14],q[44];
-ccx q[42],q[13],q[43];
-ccx q[41],q[12],q[42];
-ccx q[40],q[11],q[41];
-ccx q[39],q[10],q[40];
-ccx q[38],q[9],q[39];
-ccx q[37],q[8],q[38];
-ccx q[36],q[7],q[37];
-ccx q[35],q[6],q[36];
-ccx q[34],q[5],q[35];
-ccx q[33],q[4],q[34];
-ccx q[32],q[3],q[33];
-ccx q[31],q[2],q[32];
-ccx q[1],q[0],q[31];
-x q[0];
-x q[1];
-x q[2];
-x q[3];
-x q[4];
-x q[5];
-x q[6];
-x q[7];
-x q[8];
-x q[9];
-x q[10];
-x q[11];
-x q[12];
-x q[13];
-x q[14];
-h q[0];
-h q[1];
-h q[2];
-h q[3];
-h q[4];
-h q[5];
-h q[6];
-h q[7];
-h q[8];
-h q[9];
-h q[10];
-h q[11];
-h q[12];
-h q[13];
-h q[14];
-cx q[0],q[15];
-cx q[1],q[17];
-cx q[2],q[19];
-cx q[3],q[21];
-cx q[4],q[23];
-cx q[5],q[25];
-cx q[6],q[27];
-cx q[7],q[29];
-cx q[8],q[16];
-cx q[8],q[17];
-cx q[9],q[18];
-cx q[9],q[19];
-cx q[10],q[20];
-cx q[10],q[21];
-cx q[11],q[22];
-cx q[11],q[23];
-cx q[12],q[24];
-cx q[12],q[25];
-cx q[13],q[26];
-cx q[13],q[27];
-cx q[14],q[28];
-cx q[14],q[29];
-x q[15];
-x q[17];
-x q[18];
-x q[19];
-x q[20];
-x q[21];
-x q[22];
-x q[23];
-x q[24];
-x q[25];
-x q[26];
-x q[27];
-x q[28];
-x q[29];
-reset q[31];
-reset q[32];
-reset q[33];
-reset q[34];
-reset q[35];
-reset q[36];
-reset q[37];
-reset q[38];
-reset q[39];
-reset q[40];
-reset q[41];
-reset q[42];
-reset q[43];
-reset q[44];
-ccx q[16],q[15],q[31];
-ccx q[31],q[17],q[32];
-ccx q[32],q[18],q[33];
-ccx q[33],q[19],q[34];
-ccx q[34],q[20],q[35];
-ccx q[35],q[21],q[36];
-ccx q[36],q[22],q[37];
-ccx q[37],q[23],q[38];
-ccx q[38],q[24],q[39];
-ccx q[39],q[25],q[40];
-ccx q[40],q[26],q[41];
-ccx q[41],q[27],q[42];
-ccx q[42],q[28],q[43];
-ccx q[43],q[29],q[44];
-z q[44];
-ccx q[43],q[29],q[44];
-ccx q[42],q[28],q[43];
-ccx q[41],q[27],q[42];
-ccx q[40],q[26],q[41];
-ccx q[39],q[25],q[40];
-ccx q[38],q[24],q[39];
-ccx q[37],q[23],q[38];
-ccx q[36],q[22],q[37];
-ccx q[35],q[21],q[36];
-ccx q[34],q[20],q[35];
-ccx q[33],q[19],q[34];
-ccx q[32],q[18],q[33];
-ccx q[31],q[17],q[32];
-ccx q[16],q[15],q[31];
-x q[15];
-x q[17];
-x q[18];
-x q[19];
-x q[20];
-x q[21];
-x q[22];
-x q[23];
-x q[24];
-x q[25];
-x q[26];
-x q[27];
-x q[28];
-x q[29];
-cx q[0],q[15];
-cx q[1],q[17];
-cx q[2],q[19];
-cx q[3],q[21];
-cx q[4],q[23];
-cx q[5],q[25];
-cx q[6],q[27];
-cx q[7],q[29];
-cx q[8],q[16];
-cx q[8],q[17];
-cx q[9],q[18];
-cx q[9],q[19];
-cx q[10],q[20];
-cx q[10],q[21];
-cx q[11],q[22];
-cx q[11],q[23];
-cx q[12],q[24];
-cx q[12],q[25];
-cx q[13],q[26];
-cx q[13],q[27];
-cx q[14],q[28];
-cx q[14],q[29];
-h q[0];
-h q[1];
-h q[2];
-h q[3];
-h q[4];
-h q[5];
-h q[6];
-h q[7];
-h q[8];
-h q[9];
-h q[10];
-h q[11];
-h q[12];
-h q[13];
-h q[14];
-x q[0];
-x q[1];
-x q[2];
-x q[3];
-x q[4];
-x q[5];
-x q[6];
-x q[7];
-x q[8];
-x q[9];
-x q[10];
-x q[11];
-x q[12];
-x q[13];
-x q[14];
-reset q[31];
-reset q[32];
-reset q[33];
-reset q[34];
-reset q[35];
-reset q[36];
-reset q[37];
-reset q[38];
-reset q[39];
-reset q[40];
-reset q[41];
-reset q[42];
-reset q[43];
-reset q[44];
-ccx q[1],q[0],q[31];
-ccx q[31],q[2],q[32];
-ccx q[32],q[3],q[33];
-ccx q[33],q[4],q[34];
-ccx q[34],q[5],q[35];
-ccx q[35],q[6],q[36];
-ccx q[36],q[7],q[37];
-ccx q[37],q[8],q[38];
-ccx q[38],q[9],q[39];
-ccx q[39],q[10],q[40];
-ccx q[40],q[11],q[41];
-ccx q[41],q[12],q[42];
-ccx q[42],q[13],q[43];
-ccx q[43],q[14],q[44];
-z q[44];
-ccx q[43],q[14],q[44];
-ccx q[42],q[13],q[43];
-ccx q[41],q[12],q[42];
-ccx q[40],q[11],q[41];
-ccx q[39],q[10],q[40];
-ccx q[38],q[9],q[39];
-ccx q[37],q[8],q[38];
-ccx q[36],q[7],q[37];
-ccx q[35],q[6],q[36];
-ccx q[34],q[5],q[35];
-ccx q[33],q[4],q[34];
-ccx q[32],q[3],q[33];
-ccx q[31],q[2],q[32];
-ccx q[1],q[0],q[31];
-x q[0];
-x q[1];
-x q[2];
-x q[3];
-x q[4];
-x q[5];
-x q[6];
-x q[7];
-x q[8];
-x q[9];
-x q[10];
-x q[11];
-x q[12];
-x q[13];
-x q[14];
-h q[0];
-h q[1];
-h q[2];
-h q[3];
-h q[4];
-h q[5];
-h q[6];
-h q[7];
-h q[8];
-h q[9];
-h q[10];
-h q[11];
-h q[12];
-h q[13];
-h q[14];
-cx q[0],q[15];
-cx q[1],q[17];
-cx q[2],q[19];
-cx q[3],q[21];
-cx q[4],q[23];
-cx q[5],q[25];
-cx q[6],q[27];
-cx q[7],q[29];
-cx q[8],q[16];
-cx q[8],q[17];
-cx q[9],q[18];
-cx q[9],q[19];
-cx q[10],q[20];
-cx q[10],q[21];
-cx q[11],q[22];
-cx q[11],q[23];
-cx q[12],q[24];
-cx q[12],q[25];
-cx q[13],q[26];
-cx q[13],q[27];
-cx q[14],q[28];
-cx q[14],q[29];
-x q[15];
-x q[17];
-x q[18];
-x q[19];
-x q[20];
-x q[21];
-x q[22];
-x q[23];
-x q[24];
-x q[25];
-x q[26];
-x q[27];
-x q[28];
-x q[29];
-reset q[31];
-reset q[32];
-reset q[33];
-reset q[34];
-reset q[35];
-reset q[36];
-reset q[37];
-reset q[38];
-reset q[39];
-reset q[40];
-reset q[41];
-reset q[42];
-reset q[43];
-reset q[44];
-ccx q[16],q[15],q[31];
-ccx q[31],q[17],q[32];
-ccx q[32],q[18],q[33];
-ccx q[33],q[19],q[34];
-ccx q[34],q[20],q[35];
-ccx q[35],q[21],q[36];
-ccx q[36],q[22],q[37];
-ccx q[37],q[23],q[38];
-ccx q[38],q[24],q[39];
-ccx q[39],q[25],q[40];
-ccx q[40],q[26],q[41];
-ccx q[41],q[27],q[42];
-ccx q[42],q[28],q[43];
-ccx q[43],q[29],q[44];
-z q[44];
-ccx q[43],q[29],q[44];
-ccx q[42],q[28],q[43];
-ccx q[41],q[27],q[42];
-ccx q[40],q[26],q[41];
-ccx q[39],q[25],q[40];
-ccx q[38],q[24],q[39];
-ccx q[37],q[23],q[38];
-ccx q[36],q[22],q[37];
-ccx q[35],q[21],q[36];
-ccx q[34],q[20],q[35];
-ccx q[33],q[19],q[34];
-ccx q[32],q[18],q[33];
-ccx q[31],q[17],q[32];
-ccx q[16],q[15],q[31];
-x q[15];
-x q[17];
-x q[18];
-x q[19];
-x q[20];
-x q[21];
-x q[22];
-x q[23];
-x q[24];
-x q[25];
-x q[26];
-x q[27];
-x q[28];
-x q[29];
-cx q[0],q[15];
-cx q[1],q[17];
-cx q[2],q[19];
-cx q[3],q[21];
-cx q[4],q[23];
-cx q[5],q[25];
-cx q[6],q[27];
-cx q[7],q[29];
-cx q[8],q[16];
-cx q[8],q[17];
-cx q[9],q[18];
-cx q[9],q[19];
-cx q[10],q[20];
-cx q[10],q[21];
-cx q[11],q[22];
-cx q[11],q[23];
-cx q[12],q[24];
-cx q[12],q[25];
-cx q[13],q[26];
-cx q[13],q[27];
-cx q[14],q[28];
-cx q[14],q[29];
-h q[0];
-h q[1];
-h q[2];
-h q[3];
-h q[4];
-h q[5];
-h q[6];
-h q[7];
-h q[8];
-h q[9];
-h q[10];
-h q[11];
-h q[12];
-h q[13];
-h q[14];
-x q[0];
-x q[1];
-x q[2];
-x q[3];
-x q[4];
-x q[5];
-x q[6];
-x q[7];
-x q[8];
-x q[9];
-x q[10];
-x q[11];
-x q[12];
-x q[13];
-x q[14];
-reset q[31];
-reset q[32];
-reset q[33];
-reset q[34];
-reset q[35];
-reset q[36];
-reset q[37];
-reset q[38];
-reset q[39];
-reset q[40];
-reset q[41];
-reset q[42];
-reset q[43];
-reset q[44];
-ccx q[1],q[0],q[31];
-ccx q[31],q[2],q[32];
-ccx q[32],q[3],q[33];
-ccx q[33],q[4],q[34];
-ccx q[34],q[5],q[35];
-ccx q[35],q[6],q[36];
-ccx q[36],q[7],q[37];
-ccx q[37],q[8],q[38];
-ccx q[38],q[9],q[39];
-ccx q[39],q[10],q[40];
-ccx q[40],q[11],q[41];
-ccx q[41],q[12],q[42];
-ccx q[42],q[13],q[43];
-ccx q[43],q[14],q[44];
-z q[44];
-ccx q[43],q[14],q[44];
-ccx q[42],q[13],q[43];
-ccx q[41],q[12],q[42];
-ccx q[40],q[11],q[41];
-ccx q[39],q[10],q[40];
-ccx q[38],q[9],q[39];
-ccx q[37],q[8],q[38];
-ccx q[36],q[7],q[37];
-ccx q[35],q[6],q[36];
-ccx q[34],q[5],q[35];
-ccx q[33],q[4],q[34];
-ccx q[32],q[3],q[33];
-ccx q[31],q[2],q[32];
-ccx q[1],q[0],q[31];
-x q[0];
-x q[1];
-x q[2];
-x q[3];
-x q[4];
-x q[5];
-x q[6];
-x q[7];
-x q[8];
-x q[9];
-x q[10];
-x q[11];
-x q[12];
-x q[13];
-x q[14];
-h q[0];
-h q[1];
-h q[2];
-h q[3];
-h q[4];
-h q[5];
-h q[6];
-h q[7];
-h q[8];
-h q[9];
-h q[10];
-h q[11];
-h q[12];
-h q[13];
-h q[14];
-cx q[0],q[15];
-cx q[1],q[17];
-cx q[2],q[19];
-cx q[3],q[21];
-cx q[4],q[23];
-cx q[5],q[25];
-cx q[6],q[27];
-cx q[7],q[29];
-cx q[8],q[16];
-cx q[8],q[17];
-cx q[9],q[18];
-cx q[9],q[19];
-cx q[10],q[20];
-cx q[10],q[21];
-cx q[11],q[22];
-cx q[11],q[23];
-cx q[12],q[24];
-cx q[12],q[25];
-cx q[13],q[26];
-cx q[13],q[27];
-cx q[14],q[28];
-cx q[14],q[29];
-x q[15];
-x q[17];
-x q[18];
-x q[19];
-x q[20];
-x q[21];
-x q[22];
-x q[23];
-x q[24];
-x q[25];
-x q[26];
-x q[27];
-x q[28];
-x q[29];
-reset q[31];
-reset q[32];
-reset q[33];
-reset q[34];
-reset q[35];
-reset q[36];
-reset q[37];
-reset q[38];
-reset q[39];
-reset q[40];
-reset q[41];
-reset q[42];
-reset q[43];
-reset q[44];
-ccx q[16],q[15],q[31];
-ccx q[31],q[17],q[32];
-ccx q[32],q[18],q[33];
-ccx q[33],q[19],q[34];
-ccx q[34],q[20],q[35];
-ccx q[35],q[21],q[36];
-ccx q[36],q[22],q[37];
-ccx q[37],q[23],q[38];
-ccx q[38],q[24],q[39];
-ccx q[39],q[25],q[40];
-ccx q[40],q[26],q[41];
-ccx q[41],q[27],q[42];
-ccx q[42],q[28],q[43];
-ccx q[43],q[29],q[44];
-z q[44];
-ccx q[43],q[29],q[44];
-ccx q[42],q[28],q[43];
-ccx q[41],q[27],q[42];
-ccx q[40],q[26],q[41];
-ccx q[39],q[25],q[40];
-ccx q[38],q[24],q[39];
-ccx q[37],q[23],q[38];
-ccx q[36],q[22],q[37];
-ccx q[35],q[21],q[36];
-ccx q[34],q[20],q[35];
-ccx q[33],q[19],q[34];
-ccx q[32],q[18],q[33];
-ccx q[31],q[17],q[32];
-ccx q[16],q[15],q[31];
-x q[15];
-x q[17];
-x q[18];
-x q[19];
-x q[20];
-x q[21];
-x q[22];
-x q[23];
-x q[24];
-x q[25];
-x q[26];
-x q[27];
-x q[28];
-x q[29];
-cx q[0],q[15];
-cx q[1],q[17];
-cx q[2],q[19];
-cx q[3],q[21];
-cx q[4],q[23];
-cx q[5],q[25];
-cx q[6],q[27];
-cx q[7],q[29];
-cx q[8],q[16];
-cx q[8],q[17];
-cx q[9],q[18];
-cx q[9],q[19];
-cx q[10],q[20];
-cx q[10],q[21];
-cx q[11],q[22];
-cx q[11],q[23];
-cx q[12],q[24];
-cx q[12],q[25];
-cx q[13],q[26];
-cx q[13],q[27];
-cx q[14],q[28];
-cx q[14],q[29];
-h q[0];
-h q[1];
-h q[2];
-h q[3];
-h q[4];
-h q[5];
-h q[6];
-h q[7];
-h q[8];
-h q[9];
-h q[10];
-h q[11];
-h q[12];
-h q[13];
-h q[14];
-x q[0];
-x q[1];
-x q[2];
-x q[3];
-x q[4];
-x q[5];
-x q[6];
-x q[7];
-x q[8];
-x q[9];
-x q[10];
-x q[11];
-x q[12];
-x q[13];
-x q[14];
-reset q[31];
-reset q[32];
-reset q[33];
-reset q[34];
-reset q[35];
-reset q[36];
-reset q[37];
-reset q[38];
-reset q[39];
-reset q[40];
-reset q[41];
-reset q[42];
-reset q[43];
-reset q[44];
-ccx q[1],q[0],q[31];
-ccx q[31],q[2],q[32];
-ccx q[32],q[3],q[33];
-ccx q[33],q[4],q[34];
-ccx q[34],q[5],q[35];
-ccx q[35],q[6],q[36];
-ccx q[36],q[7],q[37];
-ccx q[37],q[8],q[38];
-ccx q[38],q[9],q[39];
-ccx q[39],q[10],q[40];
-ccx q[40],q[11],q[41];
-ccx q[41],q[12],q[42];
-ccx q[42],q[13],q[43];
-ccx q[43],q[14],q[44];
-z q[44];
-ccx q[43],q[14],q[44];
-ccx q[42],q[13],q[43];
-ccx q[41],q[12],q[42];
-ccx q[40],q[11],q[41];
-ccx q[39],q[10],q[40];
-ccx q[38],q[9],q[39];
-ccx q[37],q[8],q[38];
-ccx q[36],q[7],q[37];
-ccx q[35],q[6],q[36];
-ccx q[34],q[5],q[35];
-ccx q[33],q[4],q[34];
-ccx q[32],q[3],q[33];
-ccx q[31],q[2],q[32];
-ccx q[1],q[0],q[31];
-x q[0];
-x q[1];
-x q[2];
-x q[3];
-x q[4];
-x q[5];
-x q[6];
-x q[7];
-x q[8];
-x q[9];
-x q[10];
-x q[11];
-x q[12];
-x q[13];
-x q[14];
-h q[0];
-h q[1];
-h q[2];
-h q[3];
-h q[4];
-h q[5];
-h q[6];
-h q[7];
-h q[8];
-h q[9];
-h q[10];
-h q[11];
-h q[12];
-h q[13];
-h q[14];
-cx q[0],q[15];
-cx q[1],q[17];
-cx q[2],q[19];
-cx q[3],q[21];
-cx q[4],q[23];
-cx q[5],q[25];
-cx q[6],q[27];
-cx q[7],q[29];
-cx q[8],q[16];
-cx q[8],q[17];
-cx q[9],q[18];
-cx q[9],q[19];
-cx q[10],q[20];
-cx q[10],q[21];
-cx q[11],q[22];
-cx q[11],q[23];
-cx q[12],q[24];
-cx q[12],q[25];
-cx q[13],q[26];
-cx q[13],q[27];
-cx q[14],q[28];
-cx q[14],q[29];
-x q[15];
-x q[17];
-x q[18];
-x q[19];
-x q[20];
-x q[21];
-x q[22];
-x q[23];
-x q[24];
-x q[25];
-x q[26];
-x q[27];
-x q[28];
-x q[29];
-reset q[31];
-reset q[32];
-reset q[33];
-reset q[34];
-reset q[35];
-reset q[36];
-reset q[37];
-reset q[38];
-reset q[39];
-reset q[40];
-reset q[41];
-reset q[42];
-reset q[43];
-reset q[44];
-ccx q[16],q[15],q[31];
-ccx q[31],q[17],q[32];
-ccx q[32],q[18],q[33];
-ccx q[33],q[19],q[34];
-ccx q[34],q[20],q[35];
-ccx q[35],q[21],q[36];
-ccx q[36],q[22],q[37];
-ccx q[37],q[23],q[38];
-ccx q[38],q[24],q[39];
-ccx q[39],q[25],q[40];
-ccx q[40],q[26],q[41];
-ccx q[41],q[27],q[42];
-ccx q[42],q[28],q[43];
-ccx q[43],q[29],q[44];
-z q[44];
-ccx q[43],q[29],q[44];
-ccx q[42],q[28],q[43];
-ccx q[41],q[27],q[42];
-ccx q[40],q[26],q[41];
-ccx q[39],q[25],q[40];
-ccx q[38],q[24],q[39];
-ccx q[37],q[23],q[38];
-ccx q[36],q[22],q[37];
-ccx q[35],q[21],q[36];
-ccx q[34],q[20],q[35];
-ccx q[33],q[19],q[34];
-ccx q[32],q[18],q[33];
-ccx q[31],q[17],q[32];
-ccx q[16],q[15],q[31];
-x q[15];
-x q[17];
-x q[18];
-x q[19];
-x q[20];
-x q[21];
-x q[22];
-x q[23];
-x q[24];
-x q[25];
-x q[26];
-x q[27];
-x q[28];
-x q[29];
-cx q[0],q[15];
-cx q[1],q[17];
-cx q[2],q[19];
-cx q[3],q[21];
-cx q[4],q[23];
-cx q[5],q[25];
-cx q[6],q[27];
-cx q[7],q[29];
-cx q[8],q[16];
-cx q[8],q[17];
-cx q[9],q[18];
-cx q[9],q[19];
-cx q[10],q[20];
-cx q[10],q[21];
-cx q[11],q[22];
-cx q[11],q[23];
-cx q[12],q[24];
-cx q[12],q[25];
-cx q[13],q[26];
-cx q[13],q[27];
-cx q[14],q[28];
-cx q[14],q[29];
-h q[0];
-h q[1];
-h q[2];
-h q[3];
-h q[4];
-h q[5];
-h q[6];
-h q[7];
-h q[8];
-h q[9];
-h q[10];
-h q[11];
-h q[12];
-h q[13];
-h q[14];
-x q[0];
-x q[1];
-x q[2];
-x q[3];
-x q[4];
-x q[5];
-x q[6];
-x q[7];
-x q[8];
-x q[9];
-x q[10];
-x q[11];
-x q[12];
-x q[13];
-x q[14];
-reset q[31];
-reset q[32];
-reset q[33];
-reset q[34];
-reset q[35];
-reset q[36];
-reset q[37];
-reset q[38];
-reset q[39];
-reset q[40];
-reset q[41];
-reset q[42];
-reset q[43];
-reset q[44];
-ccx q[1],q[0],q[31];
-ccx q[31],q[2],q[32];
-ccx q[32],q[3],q[33];
-ccx q[33],q[4],q[34];
-ccx q[34],q[5],q[35];
-ccx q[35],q[6],q[36];
-ccx q[36],q[7],q[37];
-ccx q[37],q[8],q[38];
-ccx q[38],q[9],q[39];
-ccx q[39],q[10],q[40];
-ccx q[40],q[11],q[41];
-ccx q[41],q[12],q[42];
-ccx q[42],q[13],q[43];
-ccx q[43],q[14],q[44];
-z q[44];
-ccx q[43],q[14],q[44];
-ccx q[42],q[13],q[43];
-ccx q[41],q[12],q[42];
-ccx q[40],q[11],q[41];
-ccx q[39],q[10],q[40];
-ccx q[38],q[9],q[39];
-ccx q[37],q[8],q[38];
-ccx q[36],q[7],q[37];
-ccx q[35],q[6],q[36];
-ccx q[34],q[5],q[35];
-ccx q[33],q[4],q[34];
-ccx q[32],q[3],q[33];
-ccx q[31],q[2],q[32];
-ccx q[1],q[0],q[31];
-x q[0];
-x q[1];
-x q[2];
-x q[3];
-x q[4];
-x q[5];
-x q[6];
-x q[7];
-x q[8];
-x q[9];
-x q[10];
-x q[11];
-x q[12];
-x q[13];
-x q[14];
-h q[0];
-h q[1];
-h q[2];
-h q[3];
-h q[4];
-h q[5];
-h q[6];
-h q[7];
-h q[8];
-h q[9];
-h q[10];
-h q[11];
-h q[12];
-h q[13];
-h q[14];
-cx q[0],q[15];
-cx q[1],q[17];
-cx q[2],q[19];
-cx q[3],q[21];
-cx q[4],q[23];
-cx q[5],q[25];
-cx q[6],q[27];
-cx q[7],q[29];
-cx q[8],q[16];
-cx q[8],q[17];
-cx q[9],q[18];
-cx q[9],q[19];
-cx q[10],q[20];
-cx q[10],q[21];
-cx q[11],q[22];
-cx q[11],q[23];
-cx q[12],q[24];
-cx q[12],q[25];
-cx q[13],q[26];
-cx q[13],q[27];
-cx q[14],q[28];
-cx q[14],q[29];
-x q[15];
-x q[17];
-x q[18];
-x q[19];
-x q[20];
-x q[21];
-x q[22];
-x q[23];
-x q[24];
-x q[25];
-x q[26];
-x q[27];
-x q[28];
-x q[29];
-reset q[31];
-reset q[32];
-reset q[33];
-reset q[34];
-reset q[35];
-reset q[36];
-reset q[37];
-reset q[38];
-reset q[39];
-reset q[40];
-reset q[41];
-reset q[42];
-reset q[43];
-reset q[44];
-ccx q[16],q[15],q[31];
-ccx q[31],q[17],q[32];
-ccx q[32],q[18],q[33];
-ccx q[33],q[19],q[34];
-ccx q[34],q[20],q[35];
-ccx q[35],q[21],q[36];
-ccx q[36],q[22],q[37];
-ccx q[37],q[23],q[38];
-ccx q[38],q[24],q[39];
-ccx q[39],q[25],q[40];
-ccx q[40],q[26],q[41];
-ccx q[41],q[27],q[42];
-ccx q[42],q[28],q[43];
-ccx q[43],q[29],q[44];
-z q[44];
-ccx q[43],q[29],q[44];
-ccx q[42],q[28],q[43];
-ccx q[41],q[27],q[42];
-ccx q[40],q[26],q[41];
-ccx q[39],q[25],q[40];
-ccx q[38],q[24],q[39];
-ccx q[37],q[23],q[38];
-ccx q[36],q[22],q[37];
-ccx q[35],q[21],q[36];
-ccx q[34],q[20],q[35];
-ccx q[33],q[19],q[34];
-ccx q[32],q[18],q[33];
-ccx q[31],q[17],q[32];
-ccx q[16],q[15],q[31];
-x q[15];
-x q[17];
-x q[18];
-x q[19];
-x q[20];
-x q[21];
-x q[22];
-x q[23];
-x q[24];
-x q[25];
-x q[26];
-x q[27];
-x q[28];
-x q[29];
-cx q[0],q[15];
-cx q[1],q[17];
-cx q[2],q[19];
-cx q[3],q[21];
-cx q[4],q[23];
-cx q[5],q[25];
-cx q[6],q[27];
-cx q[7],q[29];
-cx q[8],q[16];
-cx q[8],q[17];
-cx q[9],q[18];
-cx q[9],q[19];
-cx q[10],q[20];
-cx q[10],q[21];
-cx q[11],q[22];
-cx q[11],q[23];
-cx q[12],q[24];
-cx q[12],q[25];
-cx q[13],q[26];
-cx q[13],q[27];
-cx q[14],q[28];
-cx q[14],q[29];
-h q[0];
-h q[1];
-h q[2];
-h q[3];
-h q[4];
-h q[5];
-h q[6];
-h q[7];
-h q[8];
-h q[9];
-h q[10];
-h q[11];
-h q[12];
-h q[13];
-h q[14];
-x q[0];
-x q[1];
-x q[2];
-x q[3];
-x q[4];
-x q[5];
-x q[6];
-x q[7];
-x q[8];
-x q[9];
-x q[10];
-x q[11];
-x q[12];
-x q[13];
-x q[14];
-reset q[31];
-reset q[32];
-reset q[33];
-reset q[34];
-reset q[35];
-reset q[36];
-reset q[37];
-reset q[38];
-reset q[39];
-reset q[40];
-reset q[41];
-reset q[42];
-reset q[43];
-reset q[44];
-ccx q[1],q[0],q[31];
-ccx q[31],q[2],q[32];
-ccx q[32],q[3],q[33];
-ccx q[33],q[4],q[34];
-ccx q[34],q[5],q[35];
-ccx q[35],q[6],q[36];
-ccx q[36],q[7],q[37];
-ccx q[37],q[8],q[38];
-ccx q[38],q[9],q[39];
-ccx q[39],q[10],q[40];
-ccx q[40],q[11],q[41];
-ccx q[41],q[12],q[42];
-ccx q[42],q[13],q[43];
-ccx q[43],q[14],q[44];
-z q[44];
-ccx q[43],q[14],q[44];
-ccx q[42],q[13],q[43];
-ccx q[41],q[12],q[42];
-ccx q[40],q[11],q[41];
-ccx q[39],q[10],q[40];
-ccx q[38],q[9],q[39];
-ccx q[37],q[8],q[38];
-ccx q[36],q[7],q[37];
-ccx q[35],q[6],q[36];
-ccx q[34],q[5],q[35];
-ccx q[33],q[4],q[34];
-ccx q[32],q[3],q[33];
-ccx q[31],q[2],q[32];
-ccx q[1],q[0],q[31];
-x q[0];
-x q[1];
-x q[2];
-x q[3];
-x q[4];
-x q[5];
-x q[6];
-x q[7];
-x q[8];
-x q[9];
-x q[10];
-x q[11];
-x q[12];
-x q[13];
-x q[14];
-h q[0];
-h q[1];
-h q[2];
-h q[3];
-h q[4];
-h q[5];
-h q[6];
-h q[7];
-h q[8];
-h q[9];
-h q[10];
-h q[11];
-h q[12];
-h q[13];
-h q[14];
-cx q[0],q[15];
-cx q[1],q[17];
-cx q[2],q[19];
-cx q[3],q[21];
-cx q[4],q[23];
-cx q[5],q[25];
-cx q[6],q[27];
-cx q[7],q[29];
-cx q[8],q[16];
-cx q[8],q[17];
-cx q[9],q[18];
-cx q[9],q[19];
-cx q[10],q[20];
-cx q[10],q[21];
-cx q[11],q[22];
-cx q[11],q[23];
-cx q[12],q[24];
-cx q[12],q[25];
-cx q[13],q[26];
-cx q[13],q[27];
-cx q[14],q[28];
-cx q[14],q[29];
-x q[15];
-x q[17];
-x q[18];
-x q[19];
-x q[20];
-x q[21];
-x q[22];
-x q[23];
-x q[24];
-x q[25];
-x q[26];
-x q[27];
-x q[28];
-x q[29];
-reset q[31];
-reset q[32];
-reset q[33];
-reset q[34];
-reset q[35];
-reset q[36];
-reset q[37];
-reset q[38];
-reset q[39];
-reset q[40];
-reset q[41];
-reset q[42];
-reset q[43];
-reset q[44];
-ccx q[16],q[15],q[31];
-ccx q[31],q[17],q[32];
-ccx q[32],q[18],q[33];
-ccx q[33],q[19],q[34];
-ccx q[34],q[20],q[35];
-ccx q[35],q[21],q[36];
-ccx q[36],q[22],q[37];
-ccx q[37],q[23],q[38];
-ccx q[38],q[24],q[39];
-ccx q[39],q[25],q[40];
-ccx q[40],q[26],q[41];
-ccx q[41],q[27],q[42];
-ccx q[42],q[28],q[43];
-ccx q[43],q[29],q[44];
-z q[44];
-ccx q[43],q[29],q[44];
-ccx q[42],q[28],q[43];
-ccx q[41],q[27],q[42];
-ccx q[40],q[26],q[41];
-ccx q[39],q[25],q[40];
-ccx q[38],q[24],q[39];
-ccx q[37],q[23],q[38];
-ccx q[36],q[22],q[37];
-ccx q[35],q[21],q[36];
-ccx q[34],q[20],q[35];
-ccx q[33],q[19],q[34];
-ccx q[32],q[18],q[33];
-ccx q[31],q[17],q[32];
-ccx q[16],q[15],q[31];
-x q[15];
-x q[17];
-x q[18];
-x q[19];
-x q[20];
-x q[21];
-x q[22];
-x q[23];
-x q[24];
-x q[25];
-x q[26];
-x q[27];
-x q[28];
-x q[29];
-cx q[0],q[15];
-cx q[1],q[17];
-cx q[2],q[19];
-cx q[3],q[21];
-cx q[4],q[23];
-cx q[5],q[25];
-cx q[6],q[27];
-cx q[7],q[29];
-cx q[8],q[16];
-cx q[8],q[17];
-cx q[9],q[18];
-cx q[9],q[19];
-cx q[10],q[20];
-cx q[10],q[21];
-cx q[11],q[22];
-cx q[11],q[23];
-cx q[12],q[24];
-cx q[12],q[25];
-cx q[13],q[26];
-cx q[13],q[27];
-cx q[14],q[28];
-cx q[14],q[29];
-h q[0];
-h q[1];
-h q[2];
-h q[3];
-h q[4];
-h q[5];
-h q[6];
-h q[7];
-h q[8];
-h q[9];
-h q[10];
-h q[11];
-h q[12];
-h q[13];
-h q[14];
-x q[0];
-x q[1];
-x q[2];
-x q[3];
-x q[4];
-x q[5];
-x q[6];
-x q[7];
-x q[8];
-x q[9];
-x q[10];
-x q[11];
-x q[12];
-x q[13];
-x q[14];
-reset q[31];
-reset q[32];
-reset q[33];
-reset q[34];
-reset q[35];
-reset q[36];
-reset q[37];
-reset q[38];
-reset q[39];
-reset q[40];
-reset q[41];
-reset q[42];
-reset q[43];
-reset q[44];
-ccx q[1],q[0],q[31];
-ccx q[31],q[2],q[32];
-ccx q[32],q[3],q[33];
-ccx q[33],q[4],q[34];
-ccx q[34],q[5],q[35];
-ccx q[35],q[6],q[36];
-ccx q[36],q[7],q[37];
-ccx q[37],q[8],q[38];
-ccx q[38],q[9],q[39];
-ccx q[39],q[10],q[40];
-ccx q[40],q[11],q[41];
-ccx q[41],q[12],q[42];
-ccx q[42],q[13],q[43];
-ccx q[43],q[14],q[44];
-z q[44];
-ccx q[43],q[14],q[44];
-ccx q[42],q[13],q[43];
-ccx q[41],q[12],q[42];
-ccx q[40],q[11],q[41];
-ccx q[39],q[10],q[40];
-ccx q[38],q[9],q[39];
-ccx q[37],q[8],q[38];
-ccx q[36],q[7],q[37];
-ccx q[35],q[6],q[36];
-ccx q[34],q[5],q[35];
-ccx q[33],q[4],q[34];
-ccx q[32],q[3],q[33];
-ccx q[31],q[2],q[32];
-ccx q[1],q[0],q[31];
-x q[0];
-x q[1];
-x q[2];
-x q[3];
-x q[4];
-x q[5];
-x q[6];
-x q[7];
-x q[8];
-x q[9];
-x q[10];
-x q[11];
-x q[12];
-x q[13];
-x q[14];
-h q[0];
-h q[1];
-h q[2];
-h q[3];
-h q[4];
-h q[5];
-h q[6];
-h q[7];
-h q[8];
-h q[9];
-h q[10];
-h q[11];
-h q[12];
-h q[13];
-h q[14];
-cx q[0],q[15];
-cx q[1],q[17];
-cx q[2],q[19];
-cx q[3],q[21];
-cx q[4],q[23];
-cx q[5],q[25];
-cx q[6],q[27];
-cx q[7],q[29];
-cx q[8],q[16];
-cx q[8],q[17];
-cx q[9],q[18];
-cx q[9],q[19];
-cx q[10],q[20];
-cx q[10],q[21];
-cx q[11],q[22];
-cx q[11],q[23];
-cx q[12],q[24];
-cx q[12],q[25];
-cx q[13],q[26];
-cx q[13],q[27];
-cx q[14],q[28];
-cx q[14],q[29];
-x q[15];
-x q[17];
-x q[18];
-x q[19];
-x q[20];
-x q[21];
-x q[22];
-x q[23];
-x q[24];
-x q[25];
-x q[26];
-x q[27];
-x q[28];
-x q[29];
-reset q[31];
-reset q[32];
-reset q[33];
-reset q[34];
-reset q[35];
-reset q[36];
-reset q[37];
-reset q[38];
-reset q[39];
-reset q[40];
-reset q[41];
-reset q[42];
-reset q[43];
-reset q[44];
-ccx q[16],q[15],q[31];
-ccx q[31],q[17],q[32];
-ccx q[32],q[18],q[33];
-ccx q[33],q[19],q[34];
-ccx q[34],q[20],q[35];
-ccx q[35],q[21],q[36];
-ccx q[36],q[22],q[37];
-ccx q[37],q[23],q[38];
-ccx q[38],q[24],q[39];
-ccx q[39],q[25],q[40];
-ccx q[40],q[26],q[41];
-ccx q[41],q[27],q[42];
-ccx q[42],q[28],q[43];
-ccx q[43],q[29],q[44];
-z q[44];
-ccx q[43],q[29],q[44];
-ccx q[42],q[28],q[43];
-ccx q[41],q[27],q[42];
-ccx q[40],q[26],q[41];
-ccx q[39],q[25],q[40];
-ccx q[38],q[24],q[39];
-ccx q[37],q[23],q[38];
-ccx q[36],q[22],q[37];
-ccx q[35],q[21],q[36];
-ccx q[34],q[20],q[35];
-ccx q[33],q[19],q[34];
-ccx q[32],q[18],q[33];
-ccx q[31],q[17],q[32];
-ccx q[16],q[15],q[31];
-x q[15];
-x q[17];
-x q[18];
-x q[19];
-x q[20];
-x q[21];
-x q[22];
-x q[23];
-x q[24];
-x q[25];
-x q[26];
-x q[27];
-x q[28];
-x q[29];
-cx q[0],q[15];
-cx q[1],q[17];
-cx q[2],q[19];
-cx q[3],q[21];
-cx q[4],q[23];
-cx q[5],q[25];
-cx q[6],q[27];
-cx q[7],q[29];
-cx q[8],q[16];
-cx q[8],q[17];
-cx q[9],q[18];
-cx q[9],q[19];
-cx q[10],q[20];
-cx q[10],q[21];
-cx q[11],q[22];
-cx q[11],q[23];
-cx q[12],q[24];
-cx q[12],q[25];
-cx q[13],q[26];
-cx q[13],q[27];
-cx q[14],q[28];
-cx q[14],q[29];
-h q[0];
-h q[1];
-h q[2];
-h q[3];
-h q[4];
-h q[5];
-h q[6];
-h q[7];
-h q[8];
-h q[9];
-h q[10];
-h q[11];
-h q[12];
-h q[13];
-h q[14];
-x q[0];
-x q[1];
-x q[2];
-x q[3];
-x q[4];
-x q[5];
-x q[6];
-x q[7];
-x q[8];
-x q[9];
-x q[10];
-x q[11];
-x q[12];
-x q[13];
-x q[14];
-reset q[31];
-reset q[32];
-reset q[33];
-reset q[34];
-reset q[35];
-reset q[36];
-reset q[37];
-reset q[38];
-reset q[39];
-reset q[40];
-reset q[41];
-reset q[42];
-reset q[43];
-reset q[44];
-ccx q[1],q[0],q[31];
-ccx q[31],q[2],q[32];
-ccx q[32],q[3],q[33];
-ccx q[33],q[4],q[34];
-ccx q[34],q[5],q[35];
-ccx q[35],q[6],q[36];
-ccx q[36],q[7],q[37];
-ccx q[37],q[8],q[38];
-ccx q[38],q[9],q[39];
-ccx q[39],q[10],q[40];
-ccx q[40],q[11],q[41];
-ccx q[41],q[12],q[42];
-ccx q[42],q[13],q[43];
-ccx q[43],q[14],q[44];
-z q[44];
-ccx q[43],q[14],q[44];
-ccx q[42],q[13],q[43];
-ccx q[41],q[12],q[42];
-ccx q[40],q[11],q[41];
-ccx q[39],q[10],q[40];
-ccx q[38],q[9],q[39];
-ccx q[37],q[8],q[38];
-ccx q[36],q[7],q[37];
-ccx q[35],q[6],q[36];
-ccx q[34],q[5],q[35];
-ccx q[33],q[4],q[34];
-ccx q[32],q[3],q[33];
-ccx q[31],q[2],q[32];
-ccx q[1],q[0],q[31];
-x q[0];
-x q[1];
-x q[2];
-x q[3];
-x q[4];
-x q[5];
-x q[6];
-x q[7];
-x q[8];
-x q[9];
-x q[10];
-x q[11];
-x q[12];
-x q[13];
-x q[14];
-h q[0];
-h q[1];
-h q[2];
-h q[3];
-h q[4];
-h q[5];
-h q[6];
-h q[7];
-h q[8];
-h q[9];
-h q[10];
-h q[11];
-h q[12];
-h q[13];
-h q[14];
-cx q[0],q[15];
-cx q[1],q[17];
-cx q[2],q[19];
-cx q[3],q[21];
-cx q[4],q[23];
-cx q[5],q[25];
-cx q[6],q[27];
-cx q[7],q[29];
-cx q[8],q[16];
-cx q[8],q[17];
-cx q[9],q[18];
-cx q[9],q[19];
-cx q[10],q[20];
-cx q[10],q[21];
-cx q[11],q[22];
-cx q[11],q[23];
-cx q[12],q[24];
-cx q[12],q[25];
-cx q[13],q[26];
-cx q[13],q[27];
-cx q[14],q[28];
-cx q[14],q[29];
-x q[15];
-x q[17];
-x q[18];
-x q[19];
-x q[20];
-x q[21];
-x q[22];
-x q[23];
-x q[24];
-x q[25];
-x q[26];
-x q[27];
-x q[28];
-x q[29];
-reset q[31];
-reset q[32];
-reset q[33];
-reset q[34];
-reset q[35];
-reset q[36];
-reset q[37];
-reset q[38];
-reset q[39];
-reset q[40];
-reset q[41];
-reset q[42];
-reset q[43];
-reset q[44];
-ccx q[16],q[15],q[31];
-ccx q[31],q[17],q[32];
-ccx q[32],q[18],q[33];
-ccx q[33],q[19],q[34];
-ccx q[34],q[20],q[35];
-ccx q[35],q[21],q[36];
-ccx q[36],q[22],q[37];
-ccx q[37],q[23],q[38];
-ccx q[38],q[24],q[39];
-ccx q[39],q[25],q[40];
-ccx q[40],q[26],q[41];
-ccx q[41],q[27],q[42];
-ccx q[42],q[28],q[43];
-ccx q[43],q[29],q[44];
-z q[44];
-ccx q[43],q[29],q[44];
-ccx q[42],q[28],q[43];
-ccx q[41],q[27],q[42];
-ccx q[40],q[26],q[41];
-ccx q[39],q[25],q[40];
-ccx q[38],q[24],q[39];
-ccx q[37],q[23],q[38];
-ccx q[36],q[22],q[37];
-ccx q[35],q[21],q[36];
-ccx q[34],q[20],q[35];
-ccx q[33],q[19],q[34];
-ccx q[32],q[18],q[33];
-ccx q[31],q[17],q[32];
-ccx q[16],q[15],q[31];
-x q[15];
-x q[17];
-x q[18];
-x q[19];
-x q[20];
-x q[21];
-x q[22];
-x q[23];
-x q[24];
-x q[25];
-x q[26];
-x q[27];
-x q[28];
-x q[29];
-cx q[0],q[15];
-cx q[1],q[17];
-cx q[2],q[19];
-cx q[3],q[21];
-cx q[4],q[23];
-cx q[5],q[25];
-cx q[6],q[27];
-cx q[7],q[29];
-cx q[8],q[16];
-cx q[8],q[17];
-cx q[9],q[18];
-cx q[9],q[19];
-cx q[10],q[20];
-cx q[10],q[21];
-cx q[11],q[22];
-cx q[11],q[23];
-cx q[12],q[24];
-cx q[12],q[25];
-cx q[13],q[26];
-cx q[13],q[27];
-cx q[14],q[28];
-cx q[14],q[29];
-h q[0];
-h q[1];
-h q[2];
-h q[3];
-h q[4];
-h q[5];
-h q[6];
-h q[7];
-h q[8];
-h q[9];
-h q[10];
-h q[11];
-h q[12];
-h q[13];
-h q[14];
-x q[0];
-x q[1];
-x q[2];
-x q[3];
-x q[4];
-x q[5];
-x q[6];
-x q[7];
-x q[8];
-x q[9];
-x q[10];
-x q[11];
-x q[12];
-x q[13];
-x q[14];
-reset q[31];
-reset q[32];
-reset q[33];
-reset q[34];
-reset q[35];
-reset q[36];
-reset q[37];
-reset q[38];
-reset q[39];
-reset q[40];
-reset q[41];
-reset q[42];
-reset q[43];
-reset q[44];
-ccx q[1],q[0],q[31];
-ccx q[31],q[2],q[32];
-ccx q[32],q[3],q[33];
-ccx q[33],q[4],q[34];
-ccx q[34],q[5],q[35];
-ccx q[35],q[6],q[36];
-ccx q[36],q[7],q[37];
-ccx q[37],q[8],q[38];
-ccx q[38],q[9],q[39];
-ccx q[39],q[10],q[40];
-ccx q[40],q[11],q[41];
-ccx q[41],q[12],q[42];
-ccx q[42],q[13],q[43];
-ccx q[43],q[14],q[44];
-z q[44];
-ccx q[43],q[14],q[44];
-ccx q[42],q[13],q[43];
-ccx q[41],q[12],q[42];
-ccx q[40],q[11],q[41];
-ccx q[39],q[10],q[40];
-ccx q[38],q[9],q[39];
-ccx q[37],q[8],q[38];
-ccx q[36],q[7],q[37];
-ccx q[35],q[6],q[36];
-ccx q[34],q[5],q[35];
-ccx q[33],q[4],q[34];
-ccx q[32],q[3],q[33];
-ccx q[31],q[2],q[32];
-ccx q[1],q[0],q[31];
-x q[0];
-x q[1];
-x q[2];
-x q[3];
-x q[4];
-x q[5];
-x q[6];
-x q[7];
-x q[8];
-x q[9];
-x q[10];
-x q[11];
-x q[12];
-x q[13];
-x q[14];
-h q[0];
-h q[1];
-h q[2];
-h q[3];
-h q[4];
-h q[5];
-h q[6];
-h q[7];
-h q[8];
-h q[9];
-h q[10];
-h q[11];
-h q[12];
-h q[13];
-h q[14];
-cx q[0],q[15];
-cx q[1],q[17];
-cx q[2],q[19];
-cx q[3],q[21];
-cx q[4],q[23];
-cx q[5],q[25];
-cx q[6],q[27];
-cx q[7],q[29];
-cx q[8],q[16];
-cx q[8],q[17];
-cx q[9],q[18];
-cx q[9],q[19];
-cx q[10],q[20];
-cx q[10],q[21];
-cx q[11],q[22];
-cx q[11],q[23];
-cx q[12],q[24];
-cx q[12],q[25];
-cx q[13],q[26];
-cx q[13],q[27];
-cx q[14],q[28];
-cx q[14],q[29];
-x q[15];
-x q[17];
-x q[18];
-x q[19];
-x q[20];
-x q[21];
-x q[22];
-x q[23];
-x q[24];
-x q[25];
-x q[26];
-x q[27];
-x q[28];
-x q[29];
-reset q[31];
-reset q[32];
-reset q[33];
-reset q[34];
-reset q[35];
-reset q[36];
-reset q[37];
-reset q[38];
-reset q[39];
-reset q[40];
-reset q[41];
-reset q[42];
-reset q[43];
-reset q[44];
-ccx q[16],q[15],q[31];
-ccx q[31],q[17],q[32];
-ccx q[32],q[18],q[33];
-ccx q[33],q[19],q[34];
-ccx q[34],q[20],q[35];
-ccx q[35],q[21],q[36];
-ccx q[36],q[22],q[37];
-ccx q[37],q[23],q[38];
-ccx q[38],q[24],q[39];
-ccx q[39],q[25],q[40];
-ccx q[40],q[26],q[41];
-ccx q[41],q[27],q[42];
-ccx q[42],q[28],q[43];
-ccx q[43],q[29],q[44];
-z q[44];
-ccx q[43],q[29],q[44];
-ccx q[42],q[28],q[43];
-ccx q[41],q[27],q[42];
-ccx q[40],q[26],q[41];
-ccx q[39],q[25],q[40];
-ccx q[38],q[24],q[39];
-ccx q[37],q[23],q[38];
-ccx q[36],q[22],q[37];
-ccx q[35],q[21],q[36];
-ccx q[34],q[20],q[35];
-ccx q[33],q[19],q[34];
-ccx q[32],q[18],q[33];
-ccx q[31],q[17],q[32];
-ccx q[16],q[15],q[31];
-x q[15];
-x q[17];
-x q[18];
-x q[19];
-x q[20];
-x q[21];
-x q[22];
-x q[23];
-x q[24];
-x q[25];
-x q[26];
-x q[27];
-x q[28];
-x q[29];
-cx q[0],q[15];
-cx q[1],q[17];
-cx q[2],q[19];
-cx q[3],q[21];
-cx q[4],q[23];
-cx q[5],q[25];
-cx q[6],q[27];
-cx q[7],q[29];
-cx q[8],q[16];
-cx q[8],q[17];
-cx q[9],q[18];
-cx q[9],q[19];
-cx q[10],q[20];
-cx q[10],q[21];
-cx q[11],q[22];
-cx q[11],q[23];
-cx q[12],q[24];
-cx q[12],q[25];
-cx q[13],q[26];
-cx q[13],q[27];
-cx q[14],q[28];
-cx q[14],q[29];
-h q[0];
-h q[1];
-h q[2];
-h q[3];
-h q[4];
-h q[5];
-h q[6];
-h q[7];
-h q[8];
-h q[9];
-h q[10];
-h q[11];
-h q[12];
-h q[13];
-h q[14];
-x q[0];
-x q[1];
-x q[2];
-x q[3];
-x q[4];
-x q[5];
-x q[6];
-x q[7];
-x q[8];
-x q[9];
-x q[10];
-x q[11];
-x q[12];
-x q[13];
-x q[14];
-reset q[31];
-reset q[32];
-reset q[33];
-reset q[34];
-reset q[35];
-reset q[36];
-reset q[37];
-reset q[38];
-reset q[39];
-reset q[40];
-reset q[41];
-reset q[42];
-reset q[43];
-reset q[44];
-ccx q[1],q[0],q[31];
-ccx q[31],q[2],q[32];
-ccx q[32],q[3],q[33];
-ccx q[33],q[4],q[34];
-ccx q[34],q[5],q[35];
-ccx q[35],q[6],q[36];
-ccx q[36],q[7],q[37];
-ccx q[37],q[8],q[38];
-ccx q[38],q[9],q[39];
-ccx q[39],q[10],q[40];
-ccx q[40],q[11],q[41];
-ccx q[41],q[12],q[42];
-ccx q[42],q[13],q[43];
-ccx q[43],q[14],q[44];
-z q[44];
-ccx q[43],q[14],q[44];
-ccx q[42],q[13],q[43];
-ccx q[41],q[12],q[42];
-ccx q[40],q[11],q[41];
-ccx q[39],q[10],q[40];
-ccx q[38],q[9],q[39];
-ccx q[37],q[8],q[38];
-ccx q[36],q[7],q[37];
-ccx q[35],q[6],q[36];
-ccx q[34],q[5],q[35];
-ccx q[33],q[4],q[34];
-ccx q[32],q[3],q[33];
-ccx q[31],q[2],q[32];
-ccx q[1],q[0],q[31];
-x q[0];
-x q[1];
-x q[2];
-x q[3];
-x q[4];
-x q[5];
-x q[6];
-x q[7];
-x q[8];
-x q[9];
-x q[10];
-x q[11];
-x q[12];
-x q[13];
-x q[14];
-h q[0];
-h q[1];
-h q[2];
-h q[3];
-h q[4];
-h q[5];
-h q[6];
-h q[7];
-h q[8];
-h q[9];
-h q[10];
-h q[11];
-h q[12];
-h q[13];
-h q[14];
-cx q[0],q[15];
-cx q[1],q[17];
-cx q[2],q[19];
-cx q[3],q[21];
-cx q[4],q[23];
-cx q[5],q[25];
-cx q[6],q[27];
-cx q[7],q[29];
-cx q[8],q[16];
-cx q[8],q[17];
-cx q[9],q[18];
-cx q[9],q[19];
-cx q[10],q[20];
-cx q[10],q[21];
-cx q[11],q[22];
-cx q[11],q[23];
-cx q[12],q[24];
-cx q[12],q[25];
-cx q[13],q[26];
-cx q[13],q[27];
-cx q[14],q[28];
-cx q[14],q[29];
-x q[15];
-x q[17];
-x q[18];
-x q[19];
-x q[20];
-x q[21];
-x q[22];
-x q[23];
-x q[24];
-x q[25];
-x q[26];
-x q[27];
-x q[28];
-x q[29];
-reset q[31];
-reset q[32];
-reset q[33];
-reset q[34];
-reset q[35];
-reset q[36];
-reset q[37];
-reset q[38];
-reset q[39];
-reset q[40];
-reset q[41];
-reset q[42];
-reset q[43];
-reset q[44];
-ccx q[16],q[15],q[31];
-ccx q[31],q[17],q[32];
-ccx q[32],q[18],q[33];
-ccx q[33],q[19],q[34];
-ccx q[34],q[20],q[35];
-ccx q[35],q[21],q[36];
-ccx q[36],q[22],q[37];
-ccx q[37],q[23],q[38];
-ccx q[38],q[24],q[39];
-ccx q[39],q[25],q[40];
-ccx q[40],q[26],q[41];
-ccx q[41],q[27],q[42];
-ccx q[42],q[28],q[43];
-ccx q[43],q[29],q[44];
-z q[44];
-ccx q[43],q[29],q[44];
-ccx q[42],q[28],q[43];
-ccx q[41],q[27],q[42];
-ccx q[40],q[26],q[41];
-ccx q[39],q[25],q[40];
-ccx q[38],q[24],q[39];
-ccx q[37],q[23],q[38];
-ccx q[36],q[22],q[37];
-ccx q[35],q[21],q[36];
-ccx q[34],q[20],q[35];
-ccx q[33],q[19],q[34];
-ccx q[32],q[18],q[33];
-ccx q[31],q[17],q[32];
-ccx q[16],q[15],q[31];
-x q[15];
-x q[17];
-x q[18];
-x q[19];
-x q[20];
-x q[21];
-x q[22];
-x q[23];
-x q[24];
-x q[25];
-x q[26];
-x q[27];
-x q[28];
-x q[29];
-cx q[0],q[15];
-cx q[1],q[17];
-cx q[2],q[19];
-cx q[3],q[21];
-cx q[4],q[23];
-cx q[5],q[25];
-cx q[6],q[27];
-cx q[7],q[29];
-cx q[8],q[16];
-cx q[8],q[17];
-cx q[9],q[18];
-cx q[9],q[19];
-cx q[10],q[20];
-cx q[10],q[21];
-cx q[11],q[22];
-cx q[11],q[23];
-cx q[12],q[24];
-cx q[12],q[25];
-cx q[13],q[26];
-cx q[13],q[27];
-cx q[14],q[28];
-cx q[14],q[29];
-h q[0];
-h q[1];
-h q[2];
-h q[3];
-h q[4];
-h q[5];
-h q[6];
-h q[7];
-h q[8];
-h q[9];
-h q[10];
-h q[11];
-h q[12];
-h q[13];
-h q[14];
-x q[0];
-x q[1];
-x q[2];
-x q[3];
-x q[4];
-x q[5];
-x q[6];
-x q[7];
-x q[8];
-x q[9];
-x q[10];
-x q[11];
-x q[12];
-x q[13];
-x q[14];
-reset q[31];
-reset q[32];
-reset q[33];
-reset q[34];
-reset q[35];
-reset q[36];
-reset q[37];
-reset q[38];
-reset q[39];
-reset q[40];
-reset q[41];
-reset q[42];
-reset q[43];
-reset q[44];
-ccx q[1],q[0],q[31];
-ccx q[31],q[2],q[32];
-ccx q[32],q[3],q[33];
-ccx q[33],q[4],q[34];
-ccx q[34],q[5],q[35];
-ccx q[35],q[6],q[36];
-ccx q[36],q[7],q[37];
-ccx q[37],q[8],q[38];
-ccx q[38],q[9],q[39];
-ccx q[39],q[10],q[40];
-ccx q[40],q[11],q[41];
-ccx q[41],q[12],q[42];
-ccx q[42],q[13],q[43];
-ccx q[43],q[14],q[44];
-z q[44];
-ccx q[43],q[14],q[44];
-ccx q[42],q[13],q[43];
-ccx q[41],q[12],q[42];
-ccx q[40],q[11],q[41];
-ccx q[39],q[10],q[40];
-ccx q[38],q[9],q[39];
-ccx q[37],q[8],q[38];
-ccx q[36],q[7],q[37];
-ccx q[35],q[6],q[36];
-ccx q[34],q[5],q[35];
-ccx q[33],q[4],q[34];
-ccx q[32],q[3],q[33];
-ccx q[31],q[2],q[32];
-ccx q[1],q[0],q[31];
-x q[0];
-x q[1];
-x q[2];
-x q[3];
-x q[4];
-x q[5];
-x q[6];
-x q[7];
-x q[8];
-x q[9];
-x q[10];
-x q[11];
-x q[12];
-x q[13];
-x q[14];
-h q[0];
-h q[1];
-h q[2];
-h q[3];
-h q[4];
-h q[5];
-h q[6];
-h q[7];
-h q[8];
-h q[9];
-h q[10];
-h q[11];
-h q[12];
-h q[13];
-h q[14];
-cx q[0],q[15];
-cx q[1],q[17];
-cx q[2],q[19];
-cx q[3],q[21];
-cx q[4],q[23];
-cx q[5],q[25];
-cx q[6],q[27];
-cx q[7],q[29];
-cx q[8],q[16];
-cx q[8],q[17];
-cx q[9],q[18];
-cx q[9],q[19];
-cx q[10],q[20];
-cx q[10],q[21];
-cx q[11],q[22];
-cx q[11],q[23];
-cx q[12],q[24];
-cx q[12],q[25];
-cx q[13],q[26];
-cx q[13],q[27];
-cx q[14],q[28];
-cx q[14],q[29];
-x q[15];
-x q[17];
-x q[18];
-x q[19];
-x q[20];
-x q[21];
-x q[22];
-x q[23];
-x q[24];
-x q[25];
-x q[26];
-x q[27];
-x q[28];
-x q[29];
-reset q[31];
-reset q[32];
-reset q[33];
-reset q[34];
-reset q[35];
-reset q[36];
-reset q[37];
-reset q[38];
-reset q[39];
-reset q[40];
-reset q[41];
-reset q[42];
-reset q[43];
-reset q[44];
-ccx q[16],q[15],q[31];
-ccx q[31],q[17],q[32];
-ccx q[32],q[18],q[33];
-ccx q[33],q[19],q[34];
-ccx q[34],q[20],q[35];
-ccx q[35],q[21],q[36];
-ccx q[36],q[22],q[37];
-ccx q[37],q[23],q[38];
-ccx q[38],q[24],q[39];
-ccx q[39],q[25],q[40];
-ccx q[40],q[26],q[41];
-ccx q[41],q[27],q[42];
-ccx q[42],q[28],q[43];
-ccx q[43],q[29],q[44];
-z q[44];
-ccx q[43],q[29],q[44];
-ccx q[42],q[28],q[43];
-ccx q[41],q[27],q[42];
-ccx q[40],q[26],q[41];
-ccx q[39],q[25],q[40];
-ccx q[38],q[24],q[39];
-ccx q[37],q[23],q[38];
-ccx q[36],q[22],q[37];
-ccx q[35],q[21],q[36];
-ccx q[34],q[20],q[35];
-ccx q[33],q[19],q[34];
-ccx q[32],q[18],q[33];
-ccx q[31],q[17],q[32];
-ccx q[16],q[15],q[31];
-x q[15];
-x q[17];
-x q[18];
-x q[19];
-x q[20];
-x q[21];
-x q[22];
-x q[23];
-x q[24];
-x q[25];
-x q[26];
-x q[27];
-x q[28];
-x q[29];
-cx q[0],q[15];
-cx q[1],q[17];
-cx q[2],q[19];
-cx q[3],q[21];
-cx q[4],q[23];
-cx q[5],q[25];
-cx q[6],q[27];
-cx q[7],q[29];
-cx q[8],q[16];
-cx q[8],q[17];
-cx q[9],q[18];
-cx q[9],q[19];
-cx q[10],q[20];
-cx q[10],q[21];
-cx q[11],q[22];
-cx q[11],q[23];
-cx q[12],q[24];
-cx q[12],q[25];
-cx q[13],q[26];
-cx q[13],q[27];
-cx q[14],q[28];
-cx q[14],q[29];
-h q[0];
-h q[1];
-h q[2];
-h q[3];
-h q[4];
-h q[5];
-h q[6];
-h q[7];
-h q[8];
-h q[9];
-h q[10];
-h q[11];
-h q[12];
-h q[13];
-h q[14];
-x q[0];
-x q[1];
-x q[2];
-x q[3];
-x q[4];
-x q[5];
-x q[6];
-x q[7];
-x q[8];
-x q[9];
-x q[10];
-x q[11];
-x q[12];
-x q[13];
-x q[14];
-reset q[31];
-reset q[32];
-reset q[33];
-reset q[34];
-reset q[35];
-reset q[36];
-reset q[37];
-reset q[38];
-reset q[39];
-reset q[40];
-reset q[41];
-reset q[42];
-reset q[43];
-reset q[44];
-ccx q[1],q[0],q[31];
-ccx q[31],q[2],q[32];
-ccx q[32],q[3],q[33];
-ccx q[33],q[4],q[34];
-ccx q[34],q[5],q[35];
-ccx q[35],q[6],q[36];
-ccx q[36],q[7],q[37];
-ccx q[37],q[8],q[38];
-ccx q[38],q[9],q[39];
-ccx q[39],q[10],q[40];
-ccx q[40],q[11],q[41];
-ccx q[41],q[12],q[42];
-ccx q[42],q[13],q[43];
-ccx q[43],q[14],q[44];
-z q[44];
-ccx q[43],q[14],q[44];
-ccx q[42],q[13],q[43];
-ccx q[41],q[12],q[42];
-ccx q[40],q[11],q[41];
-ccx q[39],q[10],q[40];
-ccx q[38],q[9],q[39];
-ccx q[37],q[8],q[38];
-ccx q[36],q[7],q[37];
-ccx q[35],q[6],q[36];
-ccx q[34],q[5],q[35];
-ccx q[33],q[4],q[34];
-ccx q[32],q[3],q[33];
-ccx q[31],q[2],q[32];
-ccx q[1],q[0],q[31];
-x q[0];
-x q[1];
-x q[2];
-x q[3];
-x q[4];
-x q[5];
-x q[6];
-x q[7];
-x q[8];
-x q[9];
-x q[10];
-x q[11];
-x q[12];
-x q[13];
-x q[14];
-h q[0];
-h q[1];
-h q[2];
-h q[3];
-h q[4];
-h q[5];
-h q[6];
-h q[7];
-h q[8];
-h q[9];
-h q[10];
-h q[11];
-h q[12];
-h q[13];
-h q[14];
-cx q[0],q[15];
-cx q[1],q[17];
-cx q[2],q[19];
-cx q[3],q[21];
-cx q[4],q[23];
-cx q[5],q[25];
-cx q[6],q[27];
-cx q[7],q[29];
-cx q[8],q[16];
-cx q[8],q[17];
-cx q[9],q[18];
-cx q[9],q[19];
-cx q[10],q[20];
-cx q[10],q[21];
-cx q[11],q[22];
-cx q[11],q[23];
-cx q[12],q[24];
-cx q[12],q[25];
-cx q[13],q[26];
-cx q[13],q[27];
-cx q[14],q[28];
-cx q[14],q[29];
-x q[15];
-x q[17];
-x q[18];
-x q[19];
-x q[20];
-x q[21];
-x q[22];
-x q[23];
-x q[24];
-x q[25];
-x q[26];
-x q[27];
-x q[28];
-x q[29];
-reset q[31];
-reset q[32];
-reset q[33];
-reset q[34];
-reset q[35];
-reset q[36];
-reset q[37];
-reset q[38];
-reset q[39];
-reset q[40];
-reset q[41];
-reset q[42];
-reset q[43];
-reset q[44];
-ccx q[16],q[15],q[31];
-ccx q[31],q[17],q[32];
-ccx q[32],q[18],q[33];
-ccx q[33],q[19],q[34];
-ccx q[34],q[20],q[35];
-ccx q[35],q[21],q[36];
-ccx q[36],q[22],q[37];
-ccx q[37],q[23],q[38];
-ccx q[38],q[24],q[39];
-ccx q[39],q[25],q[40];
-ccx q[40],q[26],q[41];
-ccx q[41],q[27],q[42];
-ccx q[42],q[28],q[43];
-ccx q[43],q[29],q[44];
-z q[44];
-ccx q[43],q[29],q[44];
-ccx q[42],q[28],q[43];
-ccx q[41],q[27],q[42];
-ccx q[40],q[26],q[41];
-ccx q[39],q[25],q[40];
-ccx q[38],q[24],q[39];
-ccx q[37],q[23],q[38];
-ccx q[36],q[22],q[37];
-ccx q[35],q[21],q[36];
-ccx q[34],q[20],q[35];
-ccx q[33],q[19],q[34];
-ccx q[32],q[18],q[33];
-ccx q[31],q[17],q[32];
-ccx q[16],q[15],q[31];
-x q[15];
-x q[17];
-x q[18];
-x q[19];
-x q[20];
-x q[21];
-x q[22];
-x q[23];
-x q[24];
-x q[25];
-x q[26];
-x q[27];
-x q[28];
-x q[29];
-cx q[0],q[15];
-cx q[1],q[17];
-cx q[2],q[19];
-cx q[3],q[21];
-cx q[4],q[23];
-cx q[5],q[25];
-cx q[6],q[27];
-cx q[7],q[29];
-cx q[8],q[16];
-cx q[8],q[17];
-cx q[9],q[18];
-cx q[9],q[19];
-cx q[10],q[20];
-cx q[10],q[21];
-cx q[11],q[22];
-cx q[11],q[23];
-cx q[12],q[24];
-cx q[12],q[25];
-cx q[13],q[26];
-cx q[13],q[27];
-cx q[14],q[28];
-cx q[14],q[29];
-h q[0];
-h q[1];
-h q[2];
-h q[3];
-h q[4];
-h q[5];
-h q[6];
-h q[7];
-h q[8];
-h q[9];
-h q[10];
-h q[11];
-h q[12];
-h q[13];
-h q[14];
-x q[0];
-x q[1];
-x q[2];
-x q[3];
-x q[4];
-x q[5];
-x q[6];
-x q[7];
-x q[8];
-x q[9];
-x q[10];
-x q[11];
-x q[12];
-x q[13];
-x q[14];
-reset q[31];
-reset q[32];
-reset q[33];
-reset q[34];
-reset q[35];
-reset q[36];
-reset q[37];
-reset q[38];
-reset q[39];
-reset q[40];
-reset q[41];
-reset q[42];
-reset q[43];
-reset q[44];
-ccx q[1],q[0],q[31];
-ccx q[31],q[2],q[32];
-ccx q[32],q[3],q[33];
-ccx q[33],q[4],q[34];
-ccx q[34],q[5],q[35];
-ccx q[35],q[6],q[36];
-ccx q[36],q[7],q[37];
-ccx q[37],q[8],q[38];
-ccx q[38],q[9],q[39];
-ccx q[39],q[10],q[40];
-ccx q[40],q[11],q[41];
-ccx q[41],q[12],q[42];
-ccx q[42],q[13],q[43];
-ccx q[43],q[14],q[44];
-z q[44];
-ccx q[43],q[14],q[44];
-ccx q[42],q[13],q[43];
-ccx q[41],q[12],q[42];
-ccx q[40],q[11],q[41];
-ccx q[39],q[10],q[40];
-ccx q[38],q[9],q[39];
-ccx q[37],q[8],q[38];
-ccx q[36],q[7],q[37];
-ccx q[35],q[6],q[36];
-ccx q[34],q[5],q[35];
-ccx q[33],q[4],q[34];
-ccx q[32],q[3],q[33];
-ccx q[31],q[2],q[32];
-ccx q[1],q[0],q[31];
-x q[0];
-x q[1];
-x q[2];
-x q[3];
-x q[4];
-x q[5];
-x q[6];
-x q[7];
-x q[8];
-x q[9];
-x q[10];
-x q[11];
-x q[12];
-x q[13];
-x q[14];
-h q[0];
-h q[1];
-h q[2];
-h q[3];
-h q[4];
-h q[5];
-h q[6];
-h q[7];
-h q[8];
-h q[9];
-h q[10];
-h q[11];
-h q[12];
-h q[13];
-h q[14];
-cx q[0],q[15];
-cx q[1],q[17];
-cx q[2],q[19];
-cx q[3],q[21];
-cx q[4],q[23];
-cx q[5],q[25];
-cx q[6],q[27];
-cx q[7],q[29];
-cx q[8],q[16];
-cx q[8],q[17];
-cx q[9],q[18];
-cx q[9],q[19];
-cx q[10],q[20];
-cx q[10],q[21];
-cx q[11],q[22];
-cx q[11],q[23];
-cx q[12],q[24];
-cx q[12],q[25];
-cx q[13],q[26];
-cx q[13],q[27];
-cx q[14],q[28];
-cx q[14],q[29];
-x q[15];
-x q[17];
-x q[18];
-x q[19];
-x q[20];
-x q[21];
-x q[22];
-x q[23];
-x q[24];
-x q[25];
-x q[26];
-x q[27];
-x q[28];
-x q[29];
-reset q[31];
-reset q[32];
-reset q[33];
-reset q[34];
-reset q[35];
-reset q[36];
-reset q[37];
-reset q[38];
-reset q[39];
-reset q[40];
-reset q[41];
-reset q[42];
-reset q[43];
-reset q[44];
-ccx q[16],q[15],q[31];
-ccx q[31],q[17],q[32];
-ccx q[32],q[18],q[33];
-ccx q[33],q[19],q[34];
-ccx q[34],q[20],q[35];
-ccx q[35],q[21],q[36];
-ccx q[36],q[22],q[37];
-ccx q[37],q[23],q[38];
-ccx q[38],q[24],q[39];
-ccx q[39],q[25],q[40];
-ccx q[40],q[26],q[41];
-ccx q[41],q[27],q[42];
-ccx q[42],q[28],q[43];
-ccx q[43],q[29],q[44];
-z q[44];
-ccx q[43],q[29],q[44];
-ccx q[42],q[28],q[43];
-ccx q[41],q[27],q[42];
-ccx q[40],q[26],q[41];
-ccx q[39],q[25],q[40];
-ccx q[38],q[24],q[39];
-ccx q[37],q[23],q[38];
-ccx q[36],q[22],q[37];
-ccx q[35],q[21],q[36];
-ccx q[34],q[20],q[35];
-ccx q[33],q[19],q[34];
-ccx q[32],q[18],q[33];
-ccx q[31],q[17],q[32];
-ccx q[16],q[15],q[31];
-x q[15];
-x q[17];
-x q[18];
-x q[19];
-x q[20];
-x q[21];
-x q[22];
-x q[23];
-x q[24];
-x q[25];
-x q[26];
-x q[27];
-x q[28];
-x q[29];
-cx q[0],q[15];
-cx q[1],q[17];
-cx q[2],q[19];
-cx q[3],q[21];
-cx q[4],q[23];
-cx q[5],q[25];
-cx q[6],q[27];
-cx q[7],q[29];
-cx q[8],q[16];
-cx q[8],q[17];
-cx q[9],q[18];
-cx q[9],q[19];
-cx q[10],q[20];
-cx q[10],q[21];
-cx q[11],q[22];
-cx q[11],q[23];
-cx q[12],q[24];
-cx q[12],q[25];
-cx q[13],q[26];
-cx q[13],q[27];
-cx q[14],q[28];
-cx q[14],q[29];
-h q[0];
-h q[1];
-h q[2];
-h q[3];
-h q[4];
-h q[5];
-h q[6];
-h q[7];
-h q[8];
-h q[9];
-h q[10];
-h q[11];
-h q[12];
-h q[13];
-h q[14];
-x q[0];
-x q[1];
-x q[2];
-x q[3];
-x q[4];
-x q[5];
-x q[6];
-x q[7];
-x q[8];
-x q[9];
-x q[10];
-x q[11];
-x q[12];
-x q[13];
-x q[14];
-reset q[31];
-reset q[32];
-reset q[33];
-reset q[34];
-reset q[35];
-reset q[36];
-reset q[37];
-reset q[38];
-reset q[39];
-reset q[40];
-reset q[41];
-reset q[42];
-reset q[43];
-reset q[44];
-ccx q[1],q[0],q[31];
-ccx q[31],q[2],q[32];
-ccx q[32],q[3],q[33];
-ccx q[33],q[4],q[34];
-ccx q[34],q[5],q[35];
-ccx q[35],q[6],q[36];
-ccx q[36],q[7],q[37];
-ccx q[37],q[8],q[38];
-ccx q[38],q[9],q[39];
-ccx q[39],q[10],q[40];
-ccx q[40],q[11],q[41];
-ccx q[41],q[12],q[42];
-ccx q[42],q[13],q[43];
-ccx q[43],q[14],q[44];
-z q[44];
-ccx q[43],q[14],q[44];
-ccx q[42],q[13],q[43];
-ccx q[41],q[12],q[42];
-ccx q[40],q[11],q[41];
-ccx q[39],q[10],q[40];
-ccx q[38],q[9],q[39];
-ccx q[37],q[8],q[38];
-ccx q[36],q[7],q[37];
-ccx q[35],q[6],q[36];
-ccx q[34],q[5],q[35];
-ccx q[33],q[4],q[34];
-ccx q[32],q[3],q[33];
-ccx q[31],q[2],q[32];
-ccx q[1],q[0],q[31];
-x q[0];
-x q[1];
-x q[2];
-x q[3];
-x q[4];
-x q[5];
-x q[6];
-x q[7];
-x q[8];
-x q[9];
-x q[10];
-x q[11];
-x q[12];
-x q[13];
-x q[14];
-h q[0];
-h q[1];
-h q[2];
-h q[3];
-h q[4];
-h q[5];
-h q[6];
-h q[7];
-h q[8];
-h q[9];
-h q[10];
-h q[11];
-h q[12];
-h q[13];
-h q[14];
-cx q[0],q[15];
-cx q[1],q[17];
-cx q[2],q[19];
-cx q[3],q[21];
-cx q[4],q[23];
-cx q[5],q[25];
-cx q[6],q[27];
-cx q[7],q[29];
-cx q[8],q[16];
-cx q[8],q[17];
-cx q[9],q[18];
-cx q[9],q[19];
-cx q[10],q[20];
-cx q[10],q[21];
-cx q[11],q[22];
-cx q[11],q[23];
-cx q[12],q[24];
-cx q[12],q[25];
-cx q[13],q[26];
-cx q[13],q[27];
-cx q[14],q[28];
-cx q[14],q[29];
-x q[15];
-x q[17];
-x q[18];
-x q[19];
-x q[20];
-x q[21];
-x q[22];
-x q[23];
-x q[24];
-x q[25];
-x q[26];
-x q[27];
-x q[28];
-x q[29];
-reset q[31];
-reset q[32];
-reset q[33];
-reset q[34];
-reset q[35];
-reset q[36];
-reset q[37];
-reset q[38];
-reset q[39];
-reset q[40];
-reset q[41];
-reset q[42];
-reset q[43];
-reset q[44];
-ccx q[16],q[15],q[31];
-ccx q[31],q[17],q[32];
-ccx q[32],q[18],q[33];
-ccx q[33],q[19],q[34];
-ccx q[34],q[20],q[35];
-ccx q[35],q[21],q[36];
-ccx q[36],q[22],q[37];
-ccx q[37],q[23],q[38];
-ccx q[38],q[24],q[39];
-ccx q[39],q[25],q[40];
-ccx q[40],q[26],q[41];
-ccx q[41],q[27],q[42];
-ccx q[42],q[28],q[43];
-ccx q[43],q[29],q[44];
-z q[44];
-ccx q[43],q[29],q[44];
-ccx q[42],q[28],q[43];
-ccx q[41],q[27],q[42];
-ccx q[40],q[26],q[41];
-ccx q[39],q[25],q[40];
-ccx q[38],q[24],q[39];
-ccx q[37],q[23],q[38];
-ccx q[36],q[22],q[37];
-ccx q[35],q[21],q[36];
-ccx q[34],q[20],q[35];
-ccx q[33],q[19],q[34];
-ccx q[32],q[18],q[33];
-ccx q[31],q[17],q[32];
-ccx q[16],q[15],q[31];
-x q[15];
-x q[17];
-x q[18];
-x q[19];
-x q[20];
-x q[21];
-x q[22];
-x q[23];
-x q[24];
-x q[25];
-x q[26];
-x q[27];
-x q[28];
-x q[29];
-cx q[0],q[15];
-cx q[1],q[17];
-cx q[2],q[19];
-cx q[3],q[21];
-cx q[4],q[23];
-cx q[5],q[25];
-cx q[6],q[27];
-cx q[7],q[29];
-cx q[8],q[16];
-cx q[8],q[17];
-cx q[9],q[18];
-cx q[9],q[19];
-cx q[10],q[20];
-cx q[10],q[21];
-cx q[11],q[22];
-cx q[11],q[23];
-cx q[12],q[24];
-cx q[12],q[25];
-cx q[13],q[26];
-cx q[13],q[27];
-cx q[14],q[28];
-cx q[14],q[29];
-h q[0];
-h q[1];
-h q[2];
-h q[3];
-h q[4];
-h q[5];
-h q[6];
-h q[7];
-h q[8];
-h q[9];
-h q[10];
-h q[11];
-h q[12];
-h q[13];
-h q[14];
-x q[0];
-x q[1];
-x q[2];
-x q[3];
-x q[4];
-x q[5];
-x q[6];
-x q[7];
-x q[8];
-x q[9];
-x q[10];
-x q[11];
-x q[12];
-x q[13];
-x q[14];
-reset q[31];
-reset q[32];
-reset q[33];
-reset q[34];
-reset q[35];
-reset q[36];
-reset q[37];
-reset q[38];
-reset q[39];
-reset q[40];
-reset q[41];
-reset q[42];
-reset q[43];
-reset q[44];
-ccx q[1],q[0],q[31];
-ccx q[31],q[2],q[32];
-ccx q[32],q[3],q[33];
-ccx q[33],q[4],q[34];
-ccx q[34],q[5],q[35];
-ccx q[35],q[6],q[36];
-ccx q[36],q[7],q[37];
-ccx q[37],q[8],q[38];
-ccx q[38],q[9],q[39];
-ccx q[39],q[10],q[40];
-ccx q[40],q[11],q[41];
-ccx q[41],q[12],q[42];
-ccx q[42],q[13],q[43];
-ccx q[43],q[14],q[44];
-z q[44];
-ccx q[43],q[14],q[44];
-ccx q[42],q[13],q[43];
-ccx q[41],q[12],q[42];
-ccx q[40],q[11],q[41];
-ccx q[39],q[10],q[40];
-ccx q[38],q[9],q[39];
-ccx q[37],q[8],q[38];
-ccx q[36],q[7],q[37];
-ccx q[35],q[6],q[36];
-ccx q[34],q[5],q[35];
-ccx q[33],q[4],q[34];
-ccx q[32],q[3],q[33];
-ccx q[31],q[2],q[32];
-ccx q[1],q[0],q[31];
-x q[0];
-x q[1];
-x q[2];
-x q[3];
-x q[4];
-x q[5];
-x q[6];
-x q[7];
-x q[8];
-x q[9];
-x q[10];
-x q[11];
-x q[12];
-x q[13];
-x q[14];
-h q[0];
-h q[1];
-h q[2];
-h q[3];
-h q[4];
-h q[5];
-h q[6];
-h q[7];
-h q[8];
-h q[9];
-h q[10];
-h q[11];
-h q[12];
-h q[13];
-h q[14];
-cx q[0],q[15];
-cx q[1],q[17];
-cx q[2],q[19];
-cx q[3],q[21];
-cx q[4],q[23];
-cx q[5],q[25];
-cx q[6],q[27];
-cx q[7],q[29];
-cx q[8],q[16];
-cx q[8],q[17];
-cx q[9],q[18];
-cx q[9],q[19];
-cx q[10],q[20];
-cx q[10],q[21];
-cx q[11],q[22];
-cx q[11],q[23];
-cx q[12],q[24];
-cx q[12],q[25];
-cx q[13],q[26];
-cx q[13],q[27];
-cx q[14],q[28];
-cx q[14],q[29];
-x q[15];
-x q[17];
-x q[18];
-x q[19];
-x q[20];
-x q[21];
-x q[22];
-x q[23];
-x q[24];
-x q[25];
-x q[26];
-x q[27];
-x q[28];
-x q[29];
-reset q[31];
-reset q[32];
-reset q[33];
-reset q[34];
-reset q[35];
-reset q[36];
-reset q[37];
-reset q[38];
-reset q[39];
-reset q[40];
-reset q[41];
-reset q[42];
-reset q[43];
-reset q[44];
-ccx q[16],q[15],q[31];
-ccx q[31],q[17],q[32];
-ccx q[32],q[18],q[33];
-ccx q[33],q[19],q[34];
-ccx q[34],q[20],q[35];
-ccx q[35],q[21],q[36];
-ccx q[36],q[22],q[37];
-ccx q[37],q[23],q[38];
-ccx q[38],q[24],q[39];
-ccx q[39],q[25],q[40];
-ccx q[40],q[26],q[41];
-ccx q[41],q[27],q[42];
-ccx q[42],q[28],q[43];
-ccx q[43],q[29],q[44];
-z q[44];
-ccx q[43],q[29],q[44];
-ccx q[42],q[28],q[43];
-ccx q[41],q[27],q[42];
-ccx q[40],q[26],q[41];
-ccx q[39],q[25],q[40];
-ccx q[38],q[24],q[39];
-ccx q[37],q[23],q[38];
-ccx q[36],q[22],q[37];
-ccx q[35],q[21],q[36];
-ccx q[34],q[20],q[35];
-ccx q[33],q[19],q[34];
-ccx q[32],q[18],q[33];
-ccx q[31],q[17],q[32];
-ccx q[16],q[15],q[31];
-x q[15];
-x q[17];
-x q[18];
-x q[19];
-x q[20];
-x q[21];
-x q[22];
-x q[23];
-x q[24];
-x q[25];
-x q[26];
-x q[27];
-x q[28];
-x q[29];
-cx q[0],q[15];
-cx q[1],q[17];
-cx q[2],q[19];
-cx q[3],q[21];
-cx q[4],q[23];
-cx q[5],q[25];
-cx q[6],q[27];
-cx q[7],q[29];
-cx q[8],q[16];
-cx q[8],q[17];
-cx q[9],q[18];
-cx q[9],q[19];
-cx q[10],q[20];
-cx q[10],q[21];
-cx q[11],q[22];
-cx q[11],q[23];
-cx q[12],q[24];
-cx q[12],q[25];
-cx q[13],q[26];
-cx q[13],q[27];
-cx q[14],q[28];
-cx q[14],q[29];
-h q[0];
-h q[1];
-h q[2];
-h q[3];
-h q[4];
-h q[5];
-h q[6];
-h q[7];
-h q[8];
-h q[9];
-h q[10];
-h q[11];
-h q[12];
-h q[13];
-h q[14];
-x q[0];
-x q[1];
-x q[2];
-x q[3];
-x q[4];
-x q[5];
-x q[6];
-x q[7];
-x q[8];
-x q[9];
-x q[10];
-x q[11];
-x q[12];
-x q[13];
-x q[14];
-reset q[31];
-reset q[32];
-reset q[33];
-reset q[34];
-reset q[35];
-reset q[36];
-reset q[37];
-reset q[38];
-reset q[39];
-reset q[40];
-reset q[41];
-reset q[42];
-reset q[43];
-reset q[44];
-ccx q[1],q[0],q[31];
-ccx q[31],q[2],q[32];
-ccx q[32],q[3],q[33];
-ccx q[33],q[4],q[34];
-ccx q[34],q[5],q[35];
-ccx q[35],q[6],q[36];
-ccx q[36],q[7],q[37];
-ccx q[37],q[8],q[38];
-ccx q[38],q[9],q[39];
-ccx q[39],q[10],q[40];
-ccx q[40],q[11],q[41];
-ccx q[41],q[12],q[42];
-ccx q[42],q[13],q[43];
-ccx q[43],q[14],q[44];
-z q[44];
-ccx q[43],q[14],q[44];
-ccx q[42],q[13],q[43];
-ccx q[41],q[12],q[42];
-ccx q[40],q[11],q[41];
-ccx q[39],q[10],q[40];
-ccx q[38],q[9],q[39];
-ccx q[37],q[8],q[38];
-ccx q[36],q[7],q[37];
-ccx q[35],q[6],q[36];
-ccx q[34],q[5],q[35];
-ccx q[33],q[4],q[34];
-ccx q[32],q[3],q[33];
-ccx q[31],q[2],q[32];
-ccx q[1],q[0],q[31];
-x q[0];
-x q[1];
-x q[2];
-x q[3];
-x q[4];
-x q[5];
-x q[6];
-x q[7];
-x q[8];
-x q[9];
-x q[10];
-x q[11];
-x q[12];
-x q[13];
-x q[14];
-h q[0];
-h q[1];
-h q[2];
-h q[3];
-h q[4];
-h q[5];
-h q[6];
-h q[7];
-h q[8];
-h q[9];
-h q[10];
-h q[11];
-h q[12];
-h q[13];
-h q[14];
-cx q[0],q[15];
-cx q[1],q[17];
-cx q[2],q[19];
-cx q[3],q[21];
-cx q[4],q[23];
-cx q[5],q[25];
-cx q[6],q[27];
-cx q[7],q[29];
-cx q[8],q[16];
-cx q[8],q[17];
-cx q[9],q[18];
-cx q[9],q[19];
-cx q[10],q[20];
-cx q[10],q[21];
-cx q[11],q[22];
-cx q[11],q[23];
-cx q[12],q[24];
-cx q[12],q[25];
-cx q[13],q[26];
-cx q[13],q[27];
-cx q[14],q[28];
-cx q[14],q[29];
-x q[15];
-x q[17];
-x q[18];
-x q[19];
-x q[20];
-x q[21];
-x q[22];
-x q[23];
-x q[24];
-x q[25];
-x q[26];
-x q[27];
-x q[28];
-x q[29];
-reset q[31];
-reset q[32];
-reset q[33];
-reset q[34];
-reset q[35];
-reset q[36];
-reset q[37];
-reset q[38];
-reset q[39];
-reset q[40];
-reset q[41];
-reset q[42];
-reset q[43];
-reset q[44];
-ccx q[16],q[15],q[31];
-ccx q[31],q[17],q[32];
-ccx q[32],q[18],q[33];
-ccx q[33],q[19],q[34];
-ccx q[34],q[20],q[35];
-ccx q[35],q[21],q[36];
-ccx q[36],q[22],q[37];
-ccx q[37],q[23],q[38];
-ccx q[38],q[24],q[39];
-ccx q[39],q[25],q[40];
-ccx q[40],q[26],q[41];
-ccx q[41],q[27],q[42];
-ccx q[42],q[28],q[43];
-ccx q[43],q[29],q[44];
-z q[44];
-ccx q[43],q[29],q[44];
-ccx q[42],q[28],q[43];
-ccx q[41],q[27],q[42];
-ccx q[40],q[26],q[41];
-ccx q[39],q[25],q[40];
-ccx q[38],q[24],q[39];
-ccx q[37],q[23],q[38];
-ccx q[36],q[22],q[37];
-ccx q[35],q[21],q[36];
-ccx q[34],q[20],q[35];
-ccx q[33],q[19],q[34];
-ccx q[32],q[18],q[33];
-ccx q[31],q[17],q[32];
-ccx q[16],q[15],q[31];
-x q[15];
-x q[17];
-x q[18];
-x q[19];
-x q[20];
-x q[21];
-x q[22];
-x q[23];
-x q[24];
-x q[25];
-x q[26];
-x q[27];
-x q[28];
-x q[29];
-cx q[0],q[15];
-cx q[1],q[17];
-cx q[2],q[19];
-cx q[3],q[21];
-cx q[4],q[23];
-cx q[5],q[25];
-cx q[6],q[27];
-cx q[7],q[29];
-cx q[8],q[16];
-cx q[8],q[17];
-cx q[9],q[18];
-cx q[9],q[19];
-cx q[10],q[20];
-cx q[10],q[21];
-cx q[11],q[22];
-cx q[11],q[23];
-cx q[12],q[24];
-cx q[12],q[25];
-cx q[13],q[26];
-cx q[13],q[27];
-cx q[14],q[28];
-cx q[14],q[29];
-h q[0];
-h q[1];
-h q[2];
-h q[3];
-h q[4];
-h q[5];
-h q[6];
-h q[7];
-h q[8];
-h q[9];
-h q[10];
-h q[11];
-h q[12];
-h q[13];
-h q[14];
-x q[0];
-x q[1];
-x q[2];
-x q[3];
-x q[4];
-x q[5];
-x q[6];
-x q[7];
-x q[8];
-x q[9];
-x q[10];
-x q[11];
-x q[12];
-x q[13];
-x q[14];
-reset q[31];
-reset q[32];
-reset q[33];
-reset q[34];
-reset q[35];
-reset q[36];
-reset q[37];
-reset q[38];
-reset q[39];
-reset q[40];
-reset q[41];
-reset q[42];
-reset q[43];
-reset q[44];
-ccx q[1],q[0],q[31];
-ccx q[31],q[2],q[32];
-ccx q[32],q[3],q[33];
-ccx q[33],q[4],q[34];
-ccx q[34],q[5],q[35];
-ccx q[35],q[6],q[36];
-ccx q[36],q[7],q[37];
-ccx q[37],q[8],q[38];
-ccx q[38],q[9],q[39];
-ccx q[39],q[10],q[40];
-ccx q[40],q[11],q[41];
-ccx q[41],q[12],q[42];
-ccx q[42],q[13],q[43];
-ccx q[43],q[14],q[44];
-z q[44];
-ccx q[43],q[14],q[44];
-ccx q[42],q[13],q[43];
-ccx q[41],q[12],q[42];
-ccx q[40],q[11],q[41];
-ccx q[39],q[10],q[40];
-ccx q[38],q[9],q[39];
-ccx q[37],q[8],q[38];
-ccx q[36],q[7],q[37];
-ccx q[35],q[6],q[36];
-ccx q[34],q[5],q[35];
-ccx q[33],q[4],q[34];
-ccx q[32],q[3],q[33];
-ccx q[31],q[2],q[32];
-ccx q[1],q[0],q[31];
-x q[0];
-x q[1];
-x q[2];
-x q[3];
-x q[4];
-x q[5];
-x q[6];
-x q[7];
-x q[8];
-x q[9];
-x q[10];
-x q[11];
-x q[12];
-x q[13];
-x q[14];
-h q[0];
-h q[1];
-h q[2];
-h q[3];
-h q[4];
-h q[5];
-h q[6];
-h q[7];
-h q[8];
-h q[9];
-h q[10];
-h q[11];
-h q[12];
-h q[13];
-h q[14];
-cx q[0],q[15];
-cx q[1],q[17];
-cx q[2],q[19];
-cx q[3],q[21];
-cx q[4],q[23];
-cx q[5],q[25];
-cx q[6],q[27];
-cx q[7],q[29];
-cx q[8],q[16];
-cx q[8],q[17];
-cx q[9],q[18];
-cx q[9],q[19];
-cx q[10],q[20];
-cx q[10],q[21];
-cx q[11],q[22];
-cx q[11],q[23];
-cx q[12],q[24];
-cx q[12],q[25];
-cx q[13],q[26];
-cx q[13],q[27];
-cx q[14],q[28];
-cx q[14],q[29];
-x q[15];
-x q[17];
-x q[18];
-x q[19];
-x q[20];
-x q[21];
-x q[22];
-x q[23];
-x q[24];
-x q[25];
-x q[26];
-x q[27];
-x q[28];
-x q[29];
-reset q[31];
-reset q[32];
-reset q[33];
-reset q[34];
-reset q[35];
-reset q[36];
-reset q[37];
-reset q[38];
-reset q[39];
-reset q[40];
-reset q[41];
-reset q[42];
-reset q[43];
-reset q[44];
-ccx q[16],q[15],q[31];
-ccx q[31],q[17],q[32];
-ccx q[32],q[18],q[33];
-ccx q[33],q[19],q[34];
-ccx q[34],q[20],q[35];
-ccx q[35],q[21],q[36];
-ccx q[36],q[22],q[37];
-ccx q[37],q[23],q[38];
-ccx q[38],q[24],q[39];
-ccx q[39],q[25],q[40];
-ccx q[40],q[26],q[41];
-ccx q[41],q[27],q[42];
-ccx q[42],q[28],q[43];
-ccx q[43],q[29],q[44];
-z q[44];
-ccx q[43],q[29],q[44];
-ccx q[42],q[28],q[43];
-ccx q[41],q[27],q[42];
-ccx q[40],q[26],q[41];
-ccx q[39],q[25],q[40];
-ccx q[38],q[24],q[39];
-ccx q[37],q[23],q[38];
-ccx q[36],q[22],q[37];
-ccx q[35],q[21],q[36];
-ccx q[34],q[20],q[35];
-ccx q[33],q[19],q[34];
-ccx q[32],q[18],q[33];
-ccx q[31],q[17],q[32];
-ccx q[16],q[15],q[31];
-x q[15];
-x q[17];
-x q[18];
-x q[19];
-x q[20];
-x q[21];
-x q[22];
-x q[23];
-x q[24];
-x q[25];
-x q[26];
-x q[27];
-x q[28];
-x q[29];
-cx q[0],q[15];
-cx q[1],q[17];
-cx q[2],q[19];
-cx q[3],q[21];
-cx q[4],q[23];
-cx q[5],q[25];
-cx q[6],q[27];
-cx q[7],q[29];
-cx q[8],q[16];
-cx q[8],q[17];
-cx q[9],q[18];
-cx q[9],q[19];
-cx q[10],q[20];
-cx q[10],q[21];
-cx q[11],q[22];
-cx q[11],q[23];
-cx q[12],q[24];
-cx q[12],q[25];
-cx q[13],q[26];
-cx q[13],q[27];
-cx q[14],q[28];
-cx q[14],q[29];
-h q[0];
-h q[1];
-h q[2];
-h q[3];
-h q[4];
-h q[5];
-h q[6];
-h q[7];
-h q[8];
-h q[9];
-h q[10];
-h q[11];
-h q[12];
-h q[13];
-h q[14];
-x q[0];
-x q[1];
-x q[2];
-x q[3];
-x q[4];
-x q[5];
-x q[6];
-x q[7];
-x q[8];
-x q[9];
-x q[10];
-x q[11];
-x q[12];
-x q[13];
-x q[14];
-reset q[31];
-reset q[32];
-reset q[33];
-reset q[34];
-reset q[35];
-reset q[36];
-reset q[37];
-reset q[38];
-reset q[39];
-reset q[40];
-reset q[41];
-reset q[42];
-reset q[43];
-reset q[44];
-ccx q[1],q[0],q[31];
-ccx q[31],q[2],q[32];
-ccx q[32],q[3],q[33];
-ccx q[33],q[4],q[34];
-ccx q[34],q[5],q[35];
-ccx q[35],q[6],q[36];
-ccx q[36],q[7],q[37];
-ccx q[37],q[8],q[38];
-ccx q[38],q[9],q[39];
-ccx q[39],q[10],q[40];
-ccx q[40],q[11],q[41];
-ccx q[41],q[12],q[42];
-ccx q[42],q[13],q[43];
-ccx q[43],q[14],q[44];
-z q[44];
-ccx q[43],q[14],q[44];
-ccx q[42],q[13],q[43];
-ccx q[41],q[12],q[42];
-ccx q[40],q[11],q[41];
-ccx q[39],q[10],q[40];
-ccx q[38],q[9],q[39];
-ccx q[37],q[8],q[38];
-ccx q[36],q[7],q[37];
-ccx q[35],q[6],q[36];
-ccx q[34],q[5],q[35];
-ccx q[33],q[4],q[34];
-ccx q[32],q[3],q[33];
-ccx q[31],q[2],q[32];
-ccx q[1],q[0],q[31];
-x q[0];
-x q[1];
-x q[2];
-x q[3];
-x q[4];
-x q[5];
-x q[6];
-x q[7];
-x q[8];
-x q[9];
-x q[10];
-x q[11];
-x q[12];
-x q[13];
-x q[14];
-h q[0];
-h q[1];
-h q[2];
-h q[3];
-h q[4];
-h q[5];
-h q[6];
-h q[7];
-h q[8];
-h q[9];
-h q[10];
-h q[11];
-h q[12];
-h q[13];
-h q[14];
-cx q[0],q[15];
-cx q[1],q[17];
-cx q[2],q[19];
-cx q[3],q[21];
-cx q[4],q[23];
-cx q[5],q[25];
-cx q[6],q[27];
-cx q[7],q[29];
-cx q[8],q[16];
-cx q[8],q[17];
-cx q[9],q[18];
-cx q[9],q[19];
-cx q[10],q[20];
-cx q[10],q[21];
-cx q[11],q[22];
-cx q[11],q[23];
-cx q[12],q[24];
-cx q[12],q[25];
-cx q[13],q[26];
-cx q[13],q[27];
-cx q[14],q[28];
-cx q[14],q[29];
-x q[15];
-x q[17];
-x q[18];
-x q[19];
-x q[20];
-x q[21];
-x q[22];
-x q[23];
-x q[24];
-x q[25];
-x q[26];
-x q[27];
-x q[28];
-x q[29];
-reset q[31];
-reset q[32];
-reset q[33];
-reset q[34];
-reset q[35];
-reset q[36];
-reset q[37];
-reset q[38];
-reset q[39];
-reset q[40];
-reset q[41];
-reset q[42];
-reset q[43];
-reset q[44];
-ccx q[16],q[15],q[31];
-ccx q[31],q[17],q[32];
-ccx q[32],q[18],q[33];
-ccx q[33],q[19],q[34];
-ccx q[34],q[20],q[35];
-ccx q[35],q[21],q[36];
-ccx q[36],q[22],q[37];
-ccx q[37],q[23],q[38];
-ccx q[38],q[24],q[39];
-ccx q[39],q[25],q[40];
-ccx q[40],q[26],q[41];
-ccx q[41],q[27],q[42];
-ccx q[42],q[28],q[43];
-ccx q[43],q[29],q[44];
-z q[44];
-ccx q[43],q[29],q[44];
-ccx q[42],q[28],q[43];
-ccx q[41],q[27],q[42];
-ccx q[40],q[26],q[41];
-ccx q[39],q[25],q[40];
-ccx q[38],q[24],q[39];
-ccx q[37],q[23],q[38];
-ccx q[36],q[22],q[37];
-ccx q[35],q[21],q[36];
-ccx q[34],q[20],q[35];
-ccx q[33],q[19],q[34];
-ccx q[32],q[18],q[33];
-ccx q[31],q[17],q[32];
-ccx q[16],q[15],q[31];
-x q[15];
-x q[17];
-x q[18];
-x q[19];
-x q[20];
-x q[21];
-x q[22];
-x q[23];
-x q[24];
-x q[25];
-x q[26];
-x q[27];
-x q[28];
-x q[29];
-cx q[0],q[15];
-cx q[1],q[17];
-cx q[2],q[19];
-cx q[3],q[21];
-cx q[4],q[23];
-cx q[5],q[25];
-cx q[6],q[27];
-cx q[7],q[29];
-cx q[8],q[16];
-cx q[8],q[17];
-cx q[9],q[18];
-cx q[9],q[19];
-cx q[10],q[20];
-cx q[10],q[21];
-cx q[11],q[22];
-cx q[11],q[23];
-cx q[12],q[24];
-cx q[12],q[25];
-cx q[13],q[26];
-cx q[13],q[27];
-cx q[14],q[28];
-cx q[14],q[29];
-h q[0];
-h q[1];
-h q[2];
-h q[3];
-h q[4];
-h q[5];
-h q[6];
-h q[7];
-h q[8];
-h q[9];
-h q[10];
-h q[11];
-h q[12];
-h q[13];
-h q[14];
-x q[0];
-x q[1];
-x q[2];
-x q[3];
-x q[4];
-x q[5];
-x q[6];
-x q[7];
-x q[8];
-x q[9];
-x q[10];
-x q[11];
-x q[12];
-x q[13];
-x q[14];
-reset q[31];
-reset q[32];
-reset q[33];
-reset q[34];
-reset q[35];
-reset q[36];
-reset q[37];
-reset q[38];
-reset q[39];
-reset q[40];
-reset q[41];
-reset q[42];
-reset q[43];
-reset q[44];
-ccx q[1],q[0],q[31];
-ccx q[31],q[2],q[32];
-ccx q[32],q[3],q[33];
-ccx q[33],q[4],q[34];
-ccx q[34],q[5],q[35];
-ccx q[35],q[6],q[36];
-ccx q[36],q[7],q[37];
-ccx q[37],q[8],q[38];
-ccx q[38],q[9],q[39];
-ccx q[39],q[10],q[40];
-ccx q[40],q[11],q[41];
-ccx q[41],q[12],q[42];
-ccx q[42],q[13],q[43];
-ccx q[43],q[14],q[44];
-z q[44];
-ccx q[43],q[14],q[44];
-ccx q[42],q[13],q[43];
-ccx q[41],q[12],q[42];
-ccx q[40],q[11],q[41];
-ccx q[39],q[10],q[40];
-ccx q[38],q[9],q[39];
-ccx q[37],q[8],q[38];
-ccx q[36],q[7],q[37];
-ccx q[35],q[6],q[36];
-ccx q[34],q[5],q[35];
-ccx q[33],q[4],q[34];
-ccx q[32],q[3],q[33];
-ccx q[31],q[2],q[32];
-ccx q[1],q[0],q[31];
-x q[0];
-x q[1];
-x q[2];
-x q[3];
-x q[4];
-x q[5];
-x q[6];
-x q[7];
-x q[8];
-x q[9];
-x q[10];
-x q[11];
-x q[12];
-x q[13];
-x q[14];
-h q[0];
-h q[1];
-h q[2];
-h q[3];
-h q[4];
-h q[5];
-h q[6];
-h q[7];
-h q[8];
-h q[9];
-h q[10];
-h q[11];
-h q[12];
-h q[13];
-h q[14];
-cx q[0],q[15];
-cx q[1],q[17];
-cx q[2],q[19];
-cx q[3],q[21];
-cx q[4],q[23];
-cx q[5],q[25];
-cx q[6],q[27];
-cx q[7],q[29];
-cx q[8],q[16];
-cx q[8],q[17];
-cx q[9],q[18];
-cx q[9],q[19];
-cx q[10],q[20];
-cx q[10],q[21];
-cx q[11],q[22];
-cx q[11],q[23];
-cx q[12],q[24];
-cx q[12],q[25];
-cx q[13],q[26];
-cx q[13],q[27];
-cx q[14],q[28];
-cx q[14],q[29];
-x q[15];
-x q[17];
-x q[18];
-x q[19];
-x q[20];
-x q[21];
-x q[22];
-x q[23];
-x q[24];
-x q[25];
-x q[26];
-x q[27];
-x q[28];
-x q[29];
-reset q[31];
-reset q[32];
-reset q[33];
-reset q[34];
-reset q[35];
-reset q[36];
-reset q[37];
-reset q[38];
-reset q[39];
-reset q[40];
-reset q[41];
-reset q[42];
-reset q[43];
-reset q[44];
-ccx q[16],q[15],q[31];
-ccx q[31],q[17],q[32];
-ccx q[32],q[18],q[33];
-ccx q[33],q[19],q[34];
-ccx q[34],q[20],q[35];
-ccx q[35],q[21],q[36];
-ccx q[36],q[22],q[37];
-ccx q[37],q[23],q[38];
-ccx q[38],q[24],q[39];
-ccx q[39],q[25],q[40];
-ccx q[40],q[26],q[41];
-ccx q[41],q[27],q[42];
-ccx q[42],q[28],q[43];
-ccx q[43],q[29],q[44];
-z q[44];
-ccx q[43],q[29],q[44];
-ccx q[42],q[28],q[43];
-ccx q[41],q[27],q[42];
-ccx q[40],q[26],q[41];
-ccx q[39],q[25],q[40];
-ccx q[38],q[24],q[39];
-ccx q[37],q[23],q[38];
-ccx q[36],q[22],q[37];
-ccx q[35],q[21],q[36];
-ccx q[34],q[20],q[35];
-ccx q[33],q[19],q[34];
-ccx q[32],q[18],q[33];
-ccx q[31],q[17],q[32];
-ccx q[16],q[15],q[31];
-x q[15];
-x q[17];
-x q[18];
-x q[19];
-x q[20];
-x q[21];
-x q[22];
-x q[23];
-x q[24];
-x q[25];
-x q[26];
-x q[27];
-x q[28];
-x q[29];
-cx q[0],q[15];
-cx q[1],q[17];
-cx q[2],q[19];
-cx q[3],q[21];
-cx q[4],q[23];
-cx q[5],q[25];
-cx q[6],q[27];
-cx q[7],q[29];
-cx q[8],q[16];
-cx q[8],q[17];
-cx q[9],q[18];
-cx q[9],q[19];
-cx q[10],q[20];
-cx q[10],q[21];
-cx q[11],q[22];
-cx q[11],q[23];
-cx q[12],q[24];
-cx q[12],q[25];
-cx q[13],q[26];
-cx q[13],q[27];
-cx q[14],q[28];
-cx q[14],q[29];
-h q[0];
-h q[1];
-h q[2];
-h q[3];
-h q[4];
-h q[5];
-h q[6];
-h q[7];
-h q[8];
-h q[9];
-h q[10];
-h q[11];
-h q[12];
-h q[13];
-h q[14];
-x q[0];
-x q[1];
-x q[2];
-x q[3];
-x q[4];
-x q[5];
-x q[6];
-x q[7];
-x q[8];
-x q[9];
-x q[10];
-x q[11];
-x q[12];
-x q[13];
-x q[14];
-reset q[31];
-reset q[32];
-reset q[33];
-reset q[34];
-reset q[35];
-reset q[36];
-reset q[37];
-reset q[38];
-reset q[39];
-reset q[40];
-reset q[41];
-reset q[42];
-reset q[43];
-reset q[44];
-ccx q[1],q[0],q[31];
-ccx q[31],q[2],q[32];
-ccx q[32],q[3],q[33];
-ccx q[33],q[4],q[34];
-ccx q[34],q[5],q[35];
-ccx q[35],q[6],q[36];
-ccx q[36],q[7],q[37];
-ccx q[37],q[8],q[38];
-ccx q[38],q[9],q[39];
-ccx q[39],q[10],q[40];
-ccx q[40],q[11],q[41];
-ccx q[41],q[12],q[42];
-ccx q[42],q[13],q[43];
-ccx q[43],q[14],q[44];
-z q[44];
-ccx q[43],q[14],q[44];
-ccx q[42],q[13],q[43];
-ccx q[41],q[12],q[42];
-ccx q[40],q[11],q[41];
-ccx q[39],q[10],q[40];
-ccx q[38],q[9],q[39];
-ccx q[37],q[8],q[38];
-ccx q[36],q[7],q[37];
-ccx q[35],q[6],q[36];
-ccx q[34],q[5],q[35];
-ccx q[33],q[4],q[34];
-ccx q[32],q[3],q[33];
-ccx q[31],q[2],q[32];
-ccx q[1],q[0],q[31];
-x q[0];
-x q[1];
-x q[2];
-x q[3];
-x q[4];
-x q[5];
-x q[6];
-x q[7];
-x q[8];
-x q[9];
-x q[10];
-x q[11];
-x q[12];
-x q[13];
-x q[14];
-h q[0];
-h q[1];
-h q[2];
-h q[3];
-h q[4];
-h q[5];
-h q[6];
-h q[7];
-h q[8];
-h q[9];
-h q[10];
-h q[11];
-h q[12];
-h q[13];
-h q[14];
-cx q[0],q[15];
-cx q[1],q[17];
-cx q[2],q[19];
-cx q[3],q[21];
-cx q[4],q[23];
-cx q[5],q[25];
-cx q[6],q[27];
-cx q[7],q[29];
-cx q[8],q[16];
-cx q[8],q[17];
-cx q[9],q[18];
-cx q[9],q[19];
-cx q[10],q[20];
-cx q[10],q[21];
-cx q[11],q[22];
-cx q[11],q[23];
-cx q[12],q[24];
-cx q[12],q[25];
-cx q[13],q[26];
-cx q[13],q[27];
-cx q[14],q[28];
-cx q[14],q[29];
-x q[15];
-x q[17];
-x q[18];
-x q[19];
-x q[20];
-x q[21];
-x q[22];
-x q[23];
-x q[24];
-x q[25];
-x q[26];
-x q[27];
-x q[28];
-x q[29];
-reset q[31];
-reset q[32];
-reset q[33];
-reset q[34];
-reset q[35];
-reset q[36];
-reset q[37];
-reset q[38];
-reset q[39];
-reset q[40];
-reset q[41];
-reset q[42];
-reset q[43];
-reset q[44];
-ccx q[16],q[15],q[31];
-ccx q[31],q[17],q[32];
-ccx q[32],q[18],q[33];
-ccx q[33],q[19],q[34];
-ccx q[34],q[20],q[35];
-ccx q[35],q[21],q[36];
-ccx q[36],q[22],q[37];
-ccx q[37],q[23],q[38];
-ccx q[38],q[24],q[39];
-ccx q[39],q[25],q[40];
-ccx q[40],q[26],q[41];
-ccx q[41],q[27],q[42];
-ccx q[42],q[28],q[43];
-ccx q[43],q[29],q[44];
-z q[44];
-ccx q[43],q[29],q[44];
-ccx q[42],q[28],q[43];
-ccx q[41],q[27],q[42];
-ccx q[40],q[26],q[41];
-ccx q[39],q[25],q[40];
-ccx q[38],q[24],q[39];
-ccx q[37],q[23],q[38];
-ccx q[36],q[22],q[37];
-ccx q[35],q[21],q[36];
-ccx q[34],q[20],q[35];
-ccx q[33],q[19],q[34];
-ccx q[32],q[18],q[33];
-ccx q[31],q[17],q[32];
-ccx q[16],q[15],q[31];
-x q[15];
-x q[17];
-x q[18];
-x q[19];
-x q[20];
-x q[21];
-x q[22];
-x q[23];
-x q[24];
-x q[25];
-x q[26];
-x q[27];
-x q[28];
-x q[29];
-cx q[0],q[15];
-cx q[1],q[17];
-cx q[2],q[19];
-cx q[3],q[21];
-cx q[4],q[23];
-cx q[5],q[25];
-cx q[6],q[27];
-cx q[7],q[29];
-cx q[8],q[16];
-cx q[8],q[17];
-cx q[9],q[18];
-cx q[9],q[19];
-cx q[10],q[20];
-cx q[10],q[21];
-cx q[11],q[22];
-cx q[11],q[23];
-cx q[12],q[24];
-cx q[12],q[25];
-cx q[13],q[26];
-cx q[13],q[27];
-cx q[14],q[28];
-cx q[14],q[29];
-h q[0];
-h q[1];
-h q[2];
-h q[3];
-h q[4];
-h q[5];
-h q[6];
-h q[7];
-h q[8];
-h q[9];
-h q[10];
-h q[11];
-h q[12];
-h q[13];
-h q[14];
-x q[0];
-x q[1];
-x q[2];
-x q[3];
-x q[4];
-x q[5];
-x q[6];
-x q[7];
-x q[8];
-x q[9];
-x q[10];
-x q[11];
-x q[12];
-x q[13];
-x q[14];
-reset q[31];
-reset q[32];
-reset q[33];
-reset q[34];
-reset q[35];
-reset q[36];
-reset q[37];
-reset q[38];
-reset q[39];
-reset q[40];
-reset q[41];
-reset q[42];
-reset q[43];
-reset q[44];
-ccx q[1],q[0],q[31];
-ccx q[31],q[2],q[32];
-ccx q[32],q[3],q[33];
-ccx q[33],q[4],q[34];
-ccx q[34],q[5],q[35];
-ccx q[35],q[6],q[36];
-ccx q[36],q[7],q[37];
-ccx q[37],q[8],q[38];
-ccx q[38],q[9],q[39];
-ccx q[39],q[10],q[40];
-ccx q[40],q[11],q[41];
-ccx q[41],q[12],q[42];
-ccx q[42],q[13],q[43];
-ccx q[43],q[14],q[44];
-z q[44];
-ccx q[43],q[14],q[44];
-ccx q[42],q[13],q[43];
-ccx q[41],q[12],q[42];
-ccx q[40],q[11],q[41];
-ccx q[39],q[10],q[40];
-ccx q[38],q[9],q[39];
-ccx q[37],q[8],q[38];
-ccx q[36],q[7],q[37];
-ccx q[35],q[6],q[36];
-ccx q[34],q[5],q[35];
-ccx q[33],q[4],q[34];
-ccx q[32],q[3],q[33];
-ccx q[31],q[2],q[32];
-ccx q[1],q[0],q[31];
-x q[0];
-x q[1];
-x q[2];
-x q[3];
-x q[4];
-x q[5];
-x q[6];
-x q[7];
-x q[8];
-x q[9];
-x q[10];
-x q[11];
-x q[12];
-x q[13];
-x q[14];
-h q[0];
-h q[1];
-h q[2];
-h q[3];
-h q[4];
-h q[5];
-h q[6];
-h q[7];
-h q[8];
-h q[9];
-h q[10];
-h q[11];
-h q[12];
-h q[13];
-h q[14];
-cx q[0],q[15];
-cx q[1],q[17];
-cx q[2],q[19];
-cx q[3],q[21];
-cx q[4],q[23];
-cx q[5],q[25];
-cx q[6],q[27];
-cx q[7],q[29];
-cx q[8],q[16];
-cx q[8],q[17];
-cx q[9],q[18];
-cx q[9],q[19];
-cx q[10],q[20];
-cx q[10],q[21];
-cx q[11],q[22];
-cx q[11],q[23];
-cx q[12],q[24];
-cx q[12],q[25];
-cx q[13],q[26];
-cx q[13],q[27];
-cx q[14],q[28];
-cx q[14],q[29];
-x q[15];
-x q[17];
-x q[18];
-x q[19];
-x q[20];
-x q[21];
-x q[22];
-x q[23];
-x q[24];
-x q[25];
-x q[26];
-x q[27];
-x q[28];
-x q[29];
-reset q[31];
-reset q[32];
-reset q[33];
-reset q[34];
-reset q[35];
-reset q[36];
-reset q[37];
-reset q[38];
-reset q[39];
-reset q[40];
-reset q[41];
-reset q[42];
-reset q[43];
-reset q[44];
-ccx q[16],q[15],q[31];
-ccx q[31],q[17],q[32];
-ccx q[32],q[18],q[33];
-ccx q[33],q[19],q[34];
-ccx q[34],q[20],q[35];
-ccx q[35],q[21],q[36];
-ccx q[36],q[22],q[37];
-ccx q[37],q[23],q[38];
-ccx q[38],q[24],q[39];
-ccx q[39],q[25],q[40];
-ccx q[40],q[26],q[41];
-ccx q[41],q[27],q[42];
-ccx q[42],q[28],q[43];
-ccx q[43],q[29],q[44];
-z q[44];
-ccx q[43],q[29],q[44];
-ccx q[42],q[28],q[43];
-ccx q[41],q[27],q[42];
-ccx q[40],q[26],q[41];
-ccx q[39],q[25],q[40];
-ccx q[38],q[24],q[39];
-ccx q[37],q[23],q[38];
-ccx q[36],q[22],q[37];
-ccx q[35],q[21],q[36];
-ccx q[34],q[20],q[35];
-ccx q[33],q[19],q[34];
-ccx q[32],q[18],q[33];
-ccx q[31],q[17],q[32];
-ccx q[16],q[15],q[31];
-x q[15];
-x q[17];
-x q[18];
-x q[19];
-x q[20];
-x q[21];
-x q[22];
-x q[23];
-x q[24];
-x q[25];
-x q[26];
-x q[27];
-x q[28];
-x q[29];
-cx q[0],q[15];
-cx q[1],q[17];
-cx q[2],q[19];
-cx q[3],q[21];
-cx q[4],q[23];
-cx q[5],q[25];
-cx q[6],q[27];
-cx q[7],q[29];
-cx q[8],q[16];
-cx q[8],q[17];
-cx q[9],q[18];
-cx q[9],q[19];
-cx q[10],q[20];
-cx q[10],q[21];
-cx q[11],q[22];
-cx q[11],q[23];
-cx q[12],q[24];
-cx q[12],q[25];
-cx q[13],q[26];
-cx q[13],q[27];
-cx q[14],q[28];
-cx q[14],q[29];
-h q[0];
-h q[1];
-h q[2];
-h q[3];
-h q[4];
-h q[5];
-h q[6];
-h q[7];
-h q[8];
-h q[9];
-h q[10];
-h q[11];
-h q[12];
-h q[13];
-h q[14];
-x q[0];
-x q[1];
-x q[2];
-x q[3];
-x q[4];
-x q[5];
-x q[6];
-x q[7];
-x q[8];
-x q[9];
-x q[10];
-x q[11];
-x q[12];
-x q[13];
-x q[14];
-reset q[31];
-reset q[32];
-reset q[33];
-reset q[34];
-reset q[35];
-reset q[36];
-reset q[37];
-reset q[38];
-reset q[39];
-reset q[40];
-reset q[41];
-reset q[42];
-reset q[43];
-reset q[44];
-ccx q[1],q[0],q[31];
-ccx q[31],q[2],q[32];
-ccx q[32],q[3],q[33];
-ccx q[33],q[4],q[34];
-ccx q[34],q[5],q[35];
-ccx q[35],q[6],q[36];
-ccx q[36],q[7],q[37];
-ccx q[37],q[8],q[38];
-ccx q[38],q[9],q[39];
-ccx q[39],q[10],q[40];
-ccx q[40],q[11],q[41];
-ccx q[41],q[12],q[42];
-ccx q[42],q[13],q[43];
-ccx q[43],q[14],q[44];
-z q[44];
-ccx q[43],q[14],q[44];
-ccx q[42],q[13],q[43];
-ccx q[41],q[12],q[42];
-ccx q[40],q[11],q[41];
-ccx q[39],q[10],q[40];
-ccx q[38],q[9],q[39];
-ccx q[37],q[8],q[38];
-ccx q[36],q[7],q[37];
-ccx q[35],q[6],q[36];
-ccx q[34],q[5],q[35];
-ccx q[33],q[4],q[34];
-ccx q[32],q[3],q[33];
-ccx q[31],q[2],q[32];
-ccx q[1],q[0],q[31];
-x q[0];
-x q[1];
-x q[2];
-x q[3];
-x q[4];
-x q[5];
-x q[6];
-x q[7];
-x q[8];
-x q[9];
-x q[10];
-x q[11];
-x q[12];
-x q[13];
-x q[14];
-h q[0];
-h q[1];
-h q[2];
-h q[3];
-h q[4];
-h q[5];
-h q[6];
-h q[7];
-h q[8];
-h q[9];
-h q[10];
-h q[11];
-h q[12];
-h q[13];
-h q[14];
-cx q[0],q[15];
-cx q[1],q[17];
-cx q[2],q[19];
-cx q[3],q[21];
-cx q[4],q[23];
-cx q[5],q[25];
-cx q[6],q[27];
-cx q[7],q[29];
-cx q[8],q[16];
-cx q[8],q[17];
-cx q[9],q[18];
-cx q[9],q[19];
-cx q[10],q[20];
-cx q[10],q[21];
-cx q[11],q[22];
-cx q[11],q[23];
-cx q[12],q[24];
-cx q[12],q[25];
-cx q[13],q[26];
-cx q[13],q[27];
-cx q[14],q[28];
-cx q[14],q[29];
-x q[15];
-x q[17];
-x q[18];
-x q[19];
-x q[20];
-x q[21];
-x q[22];
-x q[23];
-x q[24];
-x q[25];
-x q[26];
-x q[27];
-x q[28];
-x q[29];
-reset q[31];
-reset q[32];
-reset q[33];
-reset q[34];
-reset q[35];
-reset q[36];
-reset q[37];
-reset q[38];
-reset q[39];
-reset q[40];
-reset q[41];
-reset q[42];
-reset q[43];
-reset q[44];
-ccx q[16],q[15],q[31];
-ccx q[31],q[17],q[32];
-ccx q[32],q[18],q[33];
-ccx q[33],q[19],q[34];
-ccx q[34],q[20],q[35];
-ccx q[35],q[21],q[36];
-ccx q[36],q[22],q[37];
-ccx q[37],q[23],q[38];
-ccx q[38],q[24],q[39];
-ccx q[39],q[25],q[40];
-ccx q[40],q[26],q[41];
-ccx q[41],q[27],q[42];
-ccx q[42],q[28],q[43];
-ccx q[43],q[29],q[44];
-z q[44];
-ccx q[43],q[29],q[44];
-ccx q[42],q[28],q[43];
-ccx q[41],q[27],q[42];
-ccx q[40],q[26],q[41];
-ccx q[39],q[25],q[40];
-ccx q[38],q[24],q[39];
-ccx q[37],q[23],q[38];
-ccx q[36],q[22],q[37];
-ccx q[35],q[21],q[36];
-ccx q[34],q[20],q[35];
-ccx q[33],q[19],q[34];
-ccx q[32],q[18],q[33];
-ccx q[31],q[17],q[32];
-ccx q[16],q[15],q[31];
-x q[15];
-x q[17];
-x q[18];
-x q[19];
-x q[20];
-x q[21];
-x q[22];
-x q[23];
-x q[24];
-x q[25];
-x q[26];
-x q[27];
-x q[28];
-x q[29];
-cx q[0],q[15];
-cx q[1],q[17];
-cx q[2],q[19];
-cx q[3],q[21];
-cx q[4],q[23];
-cx q[5],q[25];
-cx q[6],q[27];
-cx q[7],q[29];
-cx q[8],q[16];
-cx q[8],q[17];
-cx q[9],q[18];
-cx q[9],q[19];
-cx q[10],q[20];
-cx q[10],q[21];
-cx q[11],q[22];
-cx q[11],q[23];
-cx q[12],q[24];
-cx q[12],q[25];
-cx q[13],q[26];
-cx q[13],q[27];
-cx q[14],q[28];
-cx q[14],q[29];
-h q[0];
-h q[1];
-h q[2];
-h q[3];
-h q[4];
-h q[5];
-h q[6];
-h q[7];
-h q[8];
-h q[9];
-h q[10];
-h q[11];
-h q[12];
-h q[13];
-h q[14];
-x q[0];
-x q[1];
-x q[2];
-x q[3];
-x q[4];
-x q[5];
-x q[6];
-x q[7];
-x q[8];
-x q[9];
-x q[10];
-x q[11];
-x q[12];
-x q[13];
-x q[14];
-reset q[31];
-reset q[32];
-reset q[33];
-reset q[34];
-reset q[35];
-reset q[36];
-reset q[37];
-reset q[38];
-reset q[39];
-reset q[40];
-reset q[41];
-reset q[42];
-reset q[43];
-reset q[44];
-ccx q[1],q[0],q[31];
-ccx q[31],q[2],q[32];
-ccx q[32],q[3],q[33];
-ccx q[33],q[4],q[34];
-ccx q[34],q[5],q[35];
-ccx q[35],q[6],q[36];
-ccx q[36],q[7],q[37];
-ccx q[37],q[8],q[38];
-ccx q[38],q[9],q[39];
-ccx q[39],q[10],q[40];
-ccx q[40],q[11],q[41];
-ccx q[41],q[12],q[42];
-ccx q[42],q[13],q[43];
-ccx q[43],q[14],q[44];
-z q[44];
-ccx q[43],q[14],q[44];
-ccx q[42],q[13],q[43];
-ccx q[41],q[12],q[42];
-ccx q[40],q[11],q[41];
-ccx q[39],q[10],q[40];
-ccx q[38],q[9],q[39];
-ccx q[37],q[8],q[38];
-ccx q[36],q[7],q[37];
-ccx q[35],q[6],q[36];
-ccx q[34],q[5],q[35];
-ccx q[33],q[4],q[34];
-ccx q[32],q[3],q[33];
-ccx q[31],q[2],q[32];
-ccx q[1],q[0],q[31];
-x q[0];
-x q[1];
-x q[2];
-x q[3];
-x q[4];
-x q[5];
-x q[6];
-x q[7];
-x q[8];
-x q[9];
-x q[10];
-x q[11];
-x q[12];
-x q[13];
-x q[14];
-h q[0];
-h q[1];
-h q[2];
-h q[3];
-h q[4];
-h q[5];
-h q[6];
-h q[7];
-h q[8];
-h q[9];
-h q[10];
-h q[11];
-h q[12];
-h q[13];
-h q[14];
-cx q[0],q[15];
-cx q[1],q[17];
-cx q[2],q[19];
-cx q[3],q[21];
-cx q[4],q[23];
-cx q[5],q[25];
-cx q[6],q[27];
-cx q[7],q[29];
-cx q[8],q[16];
-cx q[8],q[17];
-cx q[9],q[18];
-cx q[9],q[19];
-cx q[10],q[20];
-cx q[10],q[21];
-cx q[11],q[22];
-cx q[11],q[23];
-cx q[12],q[24];
-cx q[12],q[25];
-cx q[13],q[26];
-cx q[13],q[27];
-cx q[14],q[28];
-cx q[14],q[29];
-x q[15];
-x q[17];
-x q[18];
-x q[19];
-x q[20];
-x q[21];
-x q[22];
-x q[23];
-x q[24];
-x q[25];
-x q[26];
-x q[27];
-x q[28];
-x q[29];
-reset q[31];
-reset q[32];
-reset q[33];
-reset q[34];
-reset q[35];
-reset q[36];
-reset q[37];
-reset q[38];
-reset q[39];
-reset q[40];
-reset q[41];
-reset q[42];
-reset q[43];
-reset q[44];
-ccx q[16],q[15],q[31];
-ccx q[31],q[17],q[32];
-ccx q[32],q[18],q[33];
-ccx q[33],q[19],q[34];
-ccx q[34],q[20],q[35];
-ccx q[35],q[21],q[36];
-ccx q[36],q[22],q[37];
-ccx q[37],q[23],q[38];
-ccx q[38],q[24],q[39];
-ccx q[39],q[25],q[40];
-ccx q[40],q[26],q[41];
-ccx q[41],q[27],q[42];
-ccx q[42],q[28],q[43];
-ccx q[43],q[29],q[44];
-z q[44];
-ccx q[43],q[29],q[44];
-ccx q[42],q[28],q[43];
-ccx q[41],q[27],q[42];
-ccx q[40],q[26],q[41];
-ccx q[39],q[25],q[40];
-ccx q[38],q[24],q[39];
-ccx q[37],q[23],q[38];
-ccx q[36],q[22],q[37];
-ccx q[35],q[21],q[36];
-ccx q[34],q[20],q[35];
-ccx q[33],q[19],q[34];
-ccx q[32],q[18],q[33];
-ccx q[31],q[17],q[32];
-ccx q[16],q[15],q[31];
-x q[15];
-x q[17];
-x q[18];
-x q[19];
-x q[20];
-x q[21];
-x q[22];
-x q[23];
-x q[24];
-x q[25];
-x q[26];
-x q[27];
-x q[28];
-x q[29];
-cx q[0],q[15];
-cx q[1],q[17];
-cx q[2],q[19];
-cx q[3],q[21];
-cx q[4],q[23];
-cx q[5],q[25];
-cx q[6],q[27];
-cx q[7],q[29];
-cx q[8],q[16];
-cx q[8],q[17];
-cx q[9],q[18];
-cx q[9],q[19];
-cx q[10],q[20];
-cx q[10],q[21];
-cx q[11],q[22];
-cx q[11],q[23];
-cx q[12],q[24];
-cx q[12],q[25];
-cx q[13],q[26];
-cx q[13],q[27];
-cx q[14],q[28];
-cx q[14],q[29];
-h q[0];
-h q[1];
-h q[2];
-h q[3];
-h q[4];
-h q[5];
-h q[6];
-h q[7];
-h q[8];
-h q[9];
-h q[10];
-h q[11];
-h q[12];
-h q[13];
-h q[14];
-x q[0];
-x q[1];
-x q[2];
-x q[3];
-x q[4];
-x q[5];
-x q[6];
-x q[7];
-x q[8];
-x q[9];
-x q[10];
-x q[11];
-x q[12];
-x q[13];
-x q[14];
-reset q[31];
-reset q[32];
-reset q[33];
-reset q[34];
-reset q[35];
-reset q[36];
-reset q[37];
-reset q[38];
-reset q[39];
-reset q[40];
-reset q[41];
-reset q[42];
-reset q[43];
-reset q[44];
-ccx q[1],q[0],q[31];
-ccx q[31],q[2],q[32];
-ccx q[32],q[3],q[33];
-ccx q[33],q[4],q[34];
-ccx q[34],q[5],q[35];
-ccx q[35],q[6],q[36];
-ccx q[36],q[7],q[37];
-ccx q[37],q[8],q[38];
-ccx q[38],q[9],q[39];
-ccx q[39],q[10],q[40];
-ccx q[40],q[11],q[41];
-ccx q[41],q[12],q[42];
-ccx q[42],q[13],q[43];
-ccx q[43],q[14],q[44];
-z q[44];
-ccx q[43],q[14],q[44];
-ccx q[42],q[13],q[43];
-ccx q[41],q[12],q[42];
-ccx q[40],q[11],q[41];
-ccx q[39],q[10],q[40];
-ccx q[38],q[9],q[39];
-ccx q[37],q[8],q[38];
-ccx q[36],q[7],q[37];
-ccx q[35],q[6],q[36];
-ccx q[34],q[5],q[35];
-ccx q[33],q[4],q[34];
-ccx q[32],q[3],q[33];
-ccx q[31],q[2],q[32];
-ccx q[1],q[0],q[31];
-x q[0];
-x q[1];
-x q[2];
-x q[3];
-x q[4];
-x q[5];
-x q[6];
-x q[7];
-x q[8];
-x q[9];
-x q[10];
-x q[11];
-x q[12];
-x q[13];
-x q[14];
-h q[0];
-h q[1];
-h q[2];
-h q[3];
-h q[4];
-h q[5];
-h q[6];
-h q[7];
-h q[8];
-h q[9];
-h q[10];
-h q[11];
-h q[12];
-h q[13];
-h q[14];
-cx q[0],q[15];
-cx q[1],q[17];
-cx q[2],q[19];
-cx q[3],q[21];
-cx q[4],q[23];
-cx q[5],q[25];
-cx q[6],q[27];
-cx q[7],q[29];
-cx q[8],q[16];
-cx q[8],q[17];
-cx q[9],q[18];
-cx q[9],q[19];
-cx q[10],q[20];
-cx q[10],q[21];
-cx q[11],q[22];
-cx q[11],q[23];
-cx q[12],q[24];
-cx q[12],q[25];
-cx q[13],q[26];
-cx q[13],q[27];
-cx q[14],q[28];
-cx q[14],q[29];
-x q[15];
-x q[17];
-x q[18];
-x q[19];
-x q[20];
-x q[21];
-x q[22];
-x q[23];
-x q[24];
-x q[25];
-x q[26];
-x q[27];
-x q[28];
-x q[29];
-reset q[31];
-reset q[32];
-reset q[33];
-reset q[34];
-reset q[35];
-reset q[36];
-reset q[37];
-reset q[38];
-reset q[39];
-reset q[40];
-reset q[41];
-reset q[42];
-reset q[43];
-reset q[44];
-ccx q[16],q[15],q[31];
-ccx q[31],q[17],q[32];
-ccx q[32],q[18],q[33];
-ccx q[33],q[19],q[34];
-ccx q[34],q[20],q[35];
-ccx q[35],q[21],q[36];
-ccx q[36],q[22],q[37];
-ccx q[37],q[23],q[38];
-ccx q[38],q[24],q[39];
-ccx q[39],q[25],q[40];
-ccx q[40],q[26],q[41];
-ccx q[41],q[27],q[42];
-ccx q[42],q[28],q[43];
-ccx q[43],q[29],q[44];
-z q[44];
-ccx q[43],q[29],q[44];
-ccx q[42],q[28],q[43];
-ccx q[41],q[27],q[42];
-ccx q[40],q[26],q[41];
-ccx q[39],q[25],q[40];
-ccx q[38],q[24],q[39];
-ccx q[37],q[23],q[38];
-ccx q[36],q[22],q[37];
-ccx q[35],q[21],q[36];
-ccx q[34],q[20],q[35];
-ccx q[33],q[19],q[34];
-ccx q[32],q[18],q[33];
-ccx q[31],q[17],q[32];
-ccx q[16],q[15],q[31];
-x q[15];
-x q[17];
-x q[18];
-x q[19];
-x q[20];
-x q[21];
-x q[22];
-x q[23];
-x q[24];
-x q[25];
-x q[26];
-x q[27];
-x q[28];
-x q[29];
-cx q[0],q[15];
-cx q[1],q[17];
-cx q[2],q[19];
-cx q[3],q[21];
-cx q[4],q[23];
-cx q[5],q[25];
-cx q[6],q[27];
-cx q[7],q[29];
-cx q[8],q[16];
-cx q[8],q[17];
-cx q[9],q[18];
-cx q[9],q[19];
-cx q[10],q[20];
-cx q[10],q[21];
-cx q[11],q[22];
-cx q[11],q[23];
-cx q[12],q[24];
-cx q[12],q[25];
-cx q[13],q[26];
-cx q[13],q[27];
-cx q[14],q[28];
-cx q[14],q[29];
-h q[0];
-h q[1];
-h q[2];
-h q[3];
-h q[4];
-h q[5];
-h q[6];
-h q[7];
-h q[8];
-h q[9];
-h q[10];
-h q[11];
-h q[12];
-h q[13];
-h q[14];
-x q[0];
-x q[1];
-x q[2];
-x q[3];
-x q[4];
-x q[5];
-x q[6];
-x q[7];
-x q[8];
-x q[9];
-x q[10];
-x q[11];
-x q[12];
-x q[13];
-x q[14];
-reset q[31];
-reset q[32];
-reset q[33];
-reset q[34];
-reset q[35];
-reset q[36];
-reset q[37];
-reset q[38];
-reset q[39];
-reset q[40];
-reset q[41];
-reset q[42];
-reset q[43];
-reset q[44];
-ccx q[1],q[0],q[31];
-ccx q[31],q[2],q[32];
-ccx q[32],q[3],q[33];
-ccx q[33],q[4],q[34];
-ccx q[34],q[5],q[35];
-ccx q[35],q[6],q[36];
-ccx q[36],q[7],q[37];
-ccx q[37],q[8],q[38];
-ccx q[38],q[9],q[39];
-ccx q[39],q[10],q[40];
-ccx q[40],q[11],q[41];
-ccx q[41],q[12],q[42];
-ccx q[42],q[13],q[43];
-ccx q[43],q[14],q[44];
-z q[44];
-ccx q[43],q[14],q[44];
-ccx q[42],q[13],q[43];
-ccx q[41],q[12],q[42];
-ccx q[40],q[11],q[41];
-ccx q[39],q[10],q[40];
-ccx q[38],q[9],q[39];
-ccx q[37],q[8],q[38];
-ccx q[36],q[7],q[37];
-ccx q[35],q[6],q[36];
-ccx q[34],q[5],q[35];
-ccx q[33],q[4],q[34];
-ccx q[32],q[3],q[33];
-ccx q[31],q[2],q[32];
-ccx q[1],q[0],q[31];
-x q[0];
-x q[1];
-x q[2];
-x q[3];
-x q[4];
-x q[5];
-x q[6];
-x q[7];
-x q[8];
-x q[9];
-x q[10];
-x q[11];
-x q[12];
-x q[13];
-x q[14];
-h q[0];
-h q[1];
-h q[2];
-h q[3];
-h q[4];
-h q[5];
-h q[6];
-h q[7];
-h q[8];
-h q[9];
-h q[10];
-h q[11];
-h q[12];
-h q[13];
-h q[14];
-cx q[0],q[15];
-cx q[1],q[17];
-cx q[2],q[19];
-cx q[3],q[21];
-cx q[4],q[23];
-cx q[5],q[25];
-cx q[6],q[27];
-cx q[7],q[29];
-cx q[8],q[16];
-cx q[8],q[17];
-cx q[9],q[18];
-cx q[9],q[19];
-cx q[10],q[20];
-cx q[10],q[21];
-cx q[11],q[22];
-cx q[11],q[23];
-cx q[12],q[24];
-cx q[12],q[25];
-cx q[13],q[26];
-cx q[13],q[27];
-cx q[14],q[28];
-cx q[14],q[29];
-x q[15];
-x q[17];
-x q[18];
-x q[19];
-x q[20];
-x q[21];
-x q[22];
-x q[23];
-x q[24];
-x q[25];
-x q[26];
-x q[27];
-x q[28];
-x q[29];
-reset q[31];
-reset q[32];
-reset q[33];
-reset q[34];
-reset q[35];
-reset q[36];
-reset q[37];
-reset q[38];
-reset q[39];
-reset q[40];
-reset q[41];
-reset q[42];
-reset q[43];
-reset q[44];
-ccx q[16],q[15],q[31];
-ccx q[31],q[17],q[32];
-ccx q[32],q[18],q[33];
-ccx q[33],q[19],q[34];
-ccx q[34],q[20],q[35];
-ccx q[35],q[21],q[36];
-ccx q[36],q[22],q[37];
-ccx q[37],q[23],q[38];
-ccx q[38],q[24],q[39];
-ccx q[39],q[25],q[40];
-ccx q[40],q[26],q[41];
-ccx q[41],q[27],q[42];
-ccx q[42],q[28],q[43];
-ccx q[43],q[29],q[44];
-z q[44];
-ccx q[43],q[29],q[44];
-ccx q[42],q[28],q[43];
-ccx q[41],q[27],q[42];
-ccx q[40],q[26],q[41];
-ccx q[39],q[25],q[40];
-ccx q[38],q[24],q[39];
-ccx q[37],q[23],q[38];
-ccx q[36],q[22],q[37];
-ccx q[35],q[21],q[36];
-ccx q[34],q[20],q[35];
-ccx q[33],q[19],q[34];
-ccx q[32],q[18],q[33];
-ccx q[31],q[17],q[32];
-ccx q[16],q[15],q[31];
-x q[15];
-x q[17];
-x q[18];
-x q[19];
-x q[20];
-x q[21];
-x q[22];
-x q[23];
-x q[24];
-x q[25];
-x q[26];
-x q[27];
-x q[28];
-x q[29];
-cx q[0],q[15];
-cx q[1],q[17];
-cx q[2],q[19];
-cx q[3],q[21];
-cx q[4],q[23];
-cx q[5],q[25];
-cx q[6],q[27];
-cx q[7],q[29];
-cx q[8],q[16];
-cx q[8],q[17];
-cx q[9],q[18];
-cx q[9],q[19];
-cx q[10],q[20];
-cx q[10],q[21];
-cx q[11],q[22];
-cx q[11],q[23];
-cx q[12],q[24];
-cx q[12],q[25];
-cx q[13],q[26];
-cx q[13],q[27];
-cx q[14],q[28];
-cx q[14],q[29];
-h q[0];
-h q[1];
-h q[2];
-h q[3];
-h q[4];
-h q[5];
-h q[6];
-h q[7];
-h q[8];
-h q[9];
-h q[10];
-h q[11];
-h q[12];
-h q[13];
-h q[14];
-x q[0];
-x q[1];
-x q[2];
-x q[3];
-x q[4];
-x q[5];
-x q[6];
-x q[7];
-x q[8];
-x q[9];
-x q[10];
-x q[11];
-x q[12];
-x q[13];
-x q[14];
-reset q[31];
-reset q[32];
-reset q[33];
-reset q[34];
-reset q[35];
-reset q[36];
-reset q[37];
-reset q[38];
-reset q[39];
-reset q[40];
-reset q[41];
-reset q[42];
-reset q[43];
-reset q[44];
-ccx q[1],q[0],q[31];
-ccx q[31],q[2],q[32];
-ccx q[32],q[3],q[33];
-ccx q[33],q[4],q[34];
-ccx q[34],q[5],q[35];
-ccx q[35],q[6],q[36];
-ccx q[36],q[7],q[37];
-ccx q[37],q[8],q[38];
-ccx q[38],q[9],q[39];
-ccx q[39],q[10],q[40];
-ccx q[40],q[11],q[41];
-ccx q[41],q[12],q[42];
-ccx q[42],q[13],q[43];
-ccx q[43],q[14],q[44];
-z q[44];
-ccx q[43],q[14],q[44];
-ccx q[42],q[13],q[43];
-ccx q[41],q[12],q[42];
-ccx q[40],q[11],q[41];
-ccx q[39],q[10],q[40];
-ccx q[38],q[9],q[39];
-ccx q[37],q[8],q[38];
-ccx q[36],q[7],q[37];
-ccx q[35],q[6],q[36];
-ccx q[34],q[5],q[35];
-ccx q[33],q[4],q[34];
-ccx q[32],q[3],q[33];
-ccx q[31],q[2],q[32];
-ccx q[1],q[0],q[31];
-x q[0];
-x q[1];
-x q[2];
-x q[3];
-x q[4];
-x q[5];
-x q[6];
-x q[7];
-x q[8];
-x q[9];
-x q[10];
-x q[11];
-x q[12];
-x q[13];
-x q[14];
-h q[0];
-h q[1];
-h q[2];
-h q[3];
-h q[4];
-h q[5];
-h q[6];
-h q[7];
-h q[8];
-h q[9];
-h q[10];
-h q[11];
-h q[12];
-h q[13];
-h q[14];
-cx q[0],q[15];
-cx q[1],q[17];
-cx q[2],q[19];
-cx q[3],q[21];
-cx q[4],q[23];
-cx q[5],q[25];
-cx q[6],q[27];
-cx q[7],q[29];
-cx q[8],q[16];
-cx q[8],q[17];
-cx q[9],q[18];
-cx q[9],q[19];
-cx q[10],q[20];
-cx q[10],q[21];
-cx q[11],q[22];
-cx q[11],q[23];
-cx q[12],q[24];
-cx q[12],q[25];
-cx q[13],q[26];
-cx q[13],q[27];
-cx q[14],q[28];
-cx q[14],q[29];
-x q[15];
-x q[17];
-x q[18];
-x q[19];
-x q[20];
-x q[21];
-x q[22];
-x q[23];
-x q[24];
-x q[25];
-x q[26];
-x q[27];
-x q[28];
-x q[29];
-reset q[31];
-reset q[32];
-reset q[33];
-reset q[34];
-reset q[35];
-reset q[36];
-reset q[37];
-reset q[38];
-reset q[39];
-reset q[40];
-reset q[41];
-reset q[42];
-reset q[43];
-reset q[44];
-ccx q[16],q[15],q[31];
-ccx q[31],q[17],q[32];
-ccx q[32],q[18],q[33];
-ccx q[33],q[19],q[34];
-ccx q[34],q[20],q[35];
-ccx q[35],q[21],q[36];
-ccx q[36],q[22],q[37];
-ccx q[37],q[23],q[38];
-ccx q[38],q[24],q[39];
-ccx q[39],q[25],q[40];
-ccx q[40],q[26],q[41];
-ccx q[41],q[27],q[42];
-ccx q[42],q[28],q[43];
-ccx q[43],q[29],q[44];
-z q[44];
-ccx q[43],q[29],q[44];
-ccx q[42],q[28],q[43];
-ccx q[41],q[27],q[42];
-ccx q[40],q[26],q[41];
-ccx q[39],q[25],q[40];
-ccx q[38],q[24],q[39];
-ccx q[37],q[23],q[38];
-ccx q[36],q[22],q[37];
-ccx q[35],q[21],q[36];
-ccx q[34],q[20],q[35];
-ccx q[33],q[19],q[34];
-ccx q[32],q[18],q[33];
-ccx q[31],q[17],q[32];
-ccx q[16],q[15],q[31];
-x q[15];
-x q[17];
-x q[18];
-x q[19];
-x q[20];
-x q[21];
-x q[22];
-x q[23];
-x q[24];
-x q[25];
-x q[26];
-x q[27];
-x q[28];
-x q[29];
-cx q[0],q[15];
-cx q[1],q[17];
-cx q[2],q[19];
-cx q[3],q[21];
-cx q[4],q[23];
-cx q[5],q[25];
-cx q[6],q[27];
-cx q[7],q[29];
-cx q[8],q[16];
-cx q[8],q[17];
-cx q[9],q[18];
-cx q[9],q[19];
-cx q[10],q[20];
-cx q[10],q[21];
-cx q[11],q[22];
-cx q[11],q[23];
-cx q[12],q[24];
-cx q[12],q[25];
-cx q[13],q[26];
-cx q[13],q[27];
-cx q[14],q[28];
-cx q[14],q[29];
-h q[0];
-h q[1];
-h q[2];
-h q[3];
-h q[4];
-h q[5];
-h q[6];
-h q[7];
-h q[8];
-h q[9];
-h q[10];
-h q[11];
-h q[12];
-h q[13];
-h q[14];
-x q[0];
-x q[1];
-x q[2];
-x q[3];
-x q[4];
-x q[5];
-x q[6];
-x q[7];
-x q[8];
-x q[9];
-x q[10];
-x q[11];
-x q[12];
-x q[13];
-x q[14];
-reset q[31];
-reset q[32];
-reset q[33];
-reset q[34];
-reset q[35];
-reset q[36];
-reset q[37];
-reset q[38];
-reset q[39];
-reset q[40];
-reset q[41];
-reset q[42];
-reset q[43];
-reset q[44];
-ccx q[1],q[0],q[31];
-ccx q[31],q[2],q[32];
-ccx q[32],q[3],q[33];
-ccx q[33],q[4],q[34];
-ccx q[34],q[5],q[35];
-ccx q[35],q[6],q[36];
-ccx q[36],q[7],q[37];
-ccx q[37],q[8],q[38];
-ccx q[38],q[9],q[39];
-ccx q[39],q[10],q[40];
-ccx q[40],q[11],q[41];
-ccx q[41],q[12],q[42];
-ccx q[42],q[13],q[43];
-ccx q[43],q[14],q[44];
-z q[44];
-ccx q[43],q[14],q[44];
-ccx q[42],q[13],q[43];
-ccx q[41],q[12],q[42];
-ccx q[40],q[11],q[41];
-ccx q[39],q[10],q[40];
-ccx q[38],q[9],q[39];
-ccx q[37],q[8],q[38];
-ccx q[36],q[7],q[37];
-ccx q[35],q[6],q[36];
-ccx q[34],q[5],q[35];
-ccx q[33],q[4],q[34];
-ccx q[32],q[3],q[33];
-ccx q[31],q[2],q[32];
-ccx q[1],q[0],q[31];
-x q[0];
-x q[1];
-x q[2];
-x q[3];
-x q[4];
-x q[5];
-x q[6];
-x q[7];
-x q[8];
-x q[9];
-x q[10];
-x q[11];
-x q[12];
-x q[13];
-x q[14];
-h q[0];
-h q[1];
-h q[2];
-h q[3];
-h q[4];
-h q[5];
-h q[6];
-h q[7];
-h q[8];
-h q[9];
-h q[10];
-h q[11];
-h q[12];
-h q[13];
-h q[14];
-cx q[0],q[15];
-cx q[1],q[17];
-cx q[2],q[19];
-cx q[3],q[21];
-cx q[4],q[23];
-cx q[5],q[25];
-cx q[6],q[27];
-cx q[7],q[29];
-cx q[8],q[16];
-cx q[8],q[17];
-cx q[9],q[18];
-cx q[9],q[19];
-cx q[10],q[20];
-cx q[10],q[21];
-cx q[11],q[22];
-cx q[11],q[23];
-cx q[12],q[24];
-cx q[12],q[25];
-cx q[13],q[26];
-cx q[13],q[27];
-cx q[14],q[28];
-cx q[14],q[29];
-x q[15];
-x q[17];
-x q[18];
-x q[19];
-x q[20];
-x q[21];
-x q[22];
-x q[23];
-x q[24];
-x q[25];
-x q[26];
-x q[27];
-x q[28];
-x q[29];
-reset q[31];
-reset q[32];
-reset q[33];
-reset q[34];
-reset q[35];
-reset q[36];
-reset q[37];
-reset q[38];
-reset q[39];
-reset q[40];
-reset q[41];
-reset q[42];
-reset q[43];
-reset q[44];
-ccx q[16],q[15],q[31];
-ccx q[31],q[17],q[32];
-ccx q[32],q[18],q[33];
-ccx q[33],q[19],q[34];
-ccx q[34],q[20],q[35];
-ccx q[35],q[21],q[36];
-ccx q[36],q[22],q[37];
-ccx q[37],q[23],q[38];
-ccx q[38],q[24],q[39];
-ccx q[39],q[25],q[40];
-ccx q[40],q[26],q[41];
-ccx q[41],q[27],q[42];
-ccx q[42],q[28],q[43];
-ccx q[43],q[29],q[44];
-z q[44];
-ccx q[43],q[29],q[44];
-ccx q[42],q[28],q[43];
-ccx q[41],q[27],q[42];
-ccx q[40],q[26],q[41];
-ccx q[39],q[25],q[40];
-ccx q[38],q[24],q[39];
-ccx q[37],q[23],q[38];
-ccx q[36],q[22],q[37];
-ccx q[35],q[21],q[36];
-ccx q[34],q[20],q[35];
-ccx q[33],q[19],q[34];
-ccx q[32],q[18],q[33];
-ccx q[31],q[17],q[32];
-ccx q[16],q[15],q[31];
-x q[15];
-x q[17];
-x q[18];
-x q[19];
-x q[20];
-x q[21];
-x q[22];
-x q[23];
-x q[24];
-x q[25];
-x q[26];
-x q[27];
-x q[28];
-x q[29];
-cx q[0],q[15];
-cx q[1],q[17];
-cx q[2],q[19];
-cx q[3],q[21];
-cx q[4],q[23];
-cx q[5],q[25];
-cx q[6],q[27];
-cx q[7],q[29];
-cx q[8],q[16];
-cx q[8],q[17];
-cx q[9],q[18];
-cx q[9],q[19];
-cx q[10],q[20];
-cx q[10],q[21];
-cx q[11],q[22];
-cx q[11],q[23];
-cx q[12],q[24];
-cx q[12],q[25];
-cx q[13],q[26];
-cx q[13],q[27];
-cx q[14],q[28];
-cx q[14],q[29];
-h q[0];
-h q[1];
-h q[2];
-h q[3];
-h q[4];
-h q[5];
-h q[6];
-h q[7];
-h q[8];
-h q[9];
-h q[10];
-h q[11];
-h q[12];
-h q[13];
-h q[14];
-x q[0];
-x q[1];
-x q[2];
-x q[3];
-x q[4];
-x q[5];
-x q[6];
-x q[7];
-x q[8];
-x q[9];
-x q[10];
-x q[11];
-x q[12];
-x q[13];
-x q[14];
-reset q[31];
-reset q[32];
-reset q[33];
-reset q[34];
-reset q[35];
-reset q[36];
-reset q[37];
-reset q[38];
-reset q[39];
-reset q[40];
-reset q[41];
-reset q[42];
-reset q[43];
-reset q[44];
-ccx q[1],q[0],q[31];
-ccx q[31],q[2],q[32];
-ccx q[32],q[3],q[33];
-ccx q[33],q[4],q[34];
-ccx q[34],q[5],q[35];
-ccx q[35],q[6],q[36];
-ccx q[36],q[7],q[37];
-ccx q[37],q[8],q[38];
-ccx q[38],q[9],q[39];
-ccx q[39],q[10],q[40];
-ccx q[40],q[11],q[41];
-ccx q[41],q[12],q[42];
-ccx q[42],q[13],q[43];
-ccx q[43],q[14],q[44];
-z q[44];
-ccx q[43],q[14],q[44];
-ccx q[42],q[13],q[43];
-ccx q[41],q[12],q[42];
-ccx q[40],q[11],q[41];
-ccx q[39],q[10],q[40];
-ccx q[38],q[9],q[39];
-ccx q[37],q[8],q[38];
-ccx q[36],q[7],q[37];
-ccx q[35],q[6],q[36];
-ccx q[34],q[5],q[35];
-ccx q[33],q[4],q[34];
-ccx q[32],q[3],q[33];
-ccx q[31],q[2],q[32];
-ccx q[1],q[0],q[31];
-x q[0];
-x q[1];
-x q[2];
-x q[3];
-x q[4];
-x q[5];
-x q[6];
-x q[7];
-x q[8];
-x q[9];
-x q[10];
-x q[11];
-x q[12];
-x q[13];
-x q[14];
-h q[0];
-h q[1];
-h q[2];
-h q[3];
-h q[4];
-h q[5];
-h q[6];
-h q[7];
-h q[8];
-h q[9];
-h q[10];
-h q[11];
-h q[12];
-h q[13];
-h q[14];
-cx q[0],q[15];
-cx q[1],q[17];
-cx q[2],q[19];
-cx q[3],q[21];
-cx q[4],q[23];
-cx q[5],q[25];
-cx q[6],q[27];
-cx q[7],q[29];
-cx q[8],q[16];
-cx q[8],q[17];
-cx q[9],q[18];
-cx q[9],q[19];
-cx q[10],q[20];
-cx q[10],q[21];
-cx q[11],q[22];
-cx q[11],q[23];
-cx q[12],q[24];
-cx q[12],q[25];
-cx q[13],q[26];
-cx q[13],q[27];
-cx q[14],q[28];
-cx q[14],q[29];
-x q[15];
-x q[17];
-x q[18];
-x q[19];
-x q[20];
-x q[21];
-x q[22];
-x q[23];
-x q[24];
-x q[25];
-x q[26];
-x q[27];
-x q[28];
-x q[29];
-reset q[31];
-reset q[32];
-reset q[33];
-reset q[34];
-reset q[35];
-reset q[36];
-reset q[37];
-reset q[38];
-reset q[39];
-reset q[40];
-reset q[41];
-reset q[42];
-reset q[43];
-reset q[44];
-ccx q[16],q[15],q[31];
-ccx q[31],q[17],q[32];
-ccx q[32],q[18],q[33];
-ccx q[33],q[19],q[34];
-ccx q[34],q[20],q[35];
-ccx q[35],q[21],q[36];
-ccx q[36],q[22],q[37];
-ccx q[37],q[23],q[38];
-ccx q[38],q[24],q[39];
-ccx q[39],q[25],q[40];
-ccx q[40],q[26],q[41];
-ccx q[41],q[27],q[42];
-ccx q[42],q[28],q[43];
-ccx q[43],q[29],q[44];
-z q[44];
-ccx q[43],q[29],q[44];
-ccx q[42],q[28],q[43];
-ccx q[41],q[27],q[42];
-ccx q[40],q[26],q[41];
-ccx q[39],q[25],q[40];
-ccx q[38],q[24],q[39];
-ccx q[37],q[23],q[38];
-ccx q[36],q[22],q[37];
-ccx q[35],q[21],q[36];
-ccx q[34],q[20],q[35];
-ccx q[33],q[19],q[34];
-ccx q[32],q[18],q[33];
-ccx q[31],q[17],q[32];
-ccx q[16],q[15],q[31];
-x q[15];
-x q[17];
-x q[18];
-x q[19];
-x q[20];
-x q[21];
-x q[22];
-x q[23];
-x q[24];
-x q[25];
-x q[26];
-x q[27];
-x q[28];
-x q[29];
-cx q[0],q[15];
-cx q[1],q[17];
-cx q[2],q[19];
-cx q[3],q[21];
-cx q[4],q[23];
-cx q[5],q[25];
-cx q[6],q[27];
-cx q[7],q[29];
-cx q[8],q[16];
-cx q[8],q[17];
-cx q[9],q[18];
-cx q[9],q[19];
-cx q[10],q[20];
-cx q[10],q[21];
-cx q[11],q[22];
-cx q[11],q[23];
-cx q[12],q[24];
-cx q[12],q[25];
-cx q[13],q[26];
-cx q[13],q[27];
-cx q[14],q[28];
-cx q[14],q[29];
-h q[0];
-h q[1];
-h q[2];
-h q[3];
-h q[4];
-h q[5];
-h q[6];
-h q[7];
-h q[8];
-h q[9];
-h q[10];
-h q[11];
-h q[12];
-h q[13];
-h q[14];
-x q[0];
-x q[1];
-x q[2];
-x q[3];
-x q[4];
-x q[5];
-x q[6];
-x q[7];
-x q[8];
-x q[9];
-x q[10];
-x q[11];
-x q[12];
-x q[13];
-x q[14];
-reset q[31];
-reset q[32];
-reset q[33];
-reset q[34];
-reset q[35];
-reset q[36];
-reset q[37];
-reset q[38];
-reset q[39];
-reset q[40];
-reset q[41];
-reset q[42];
-reset q[43];
-reset q[44];
-ccx q[1],q[0],q[31];
-ccx q[31],q[2],q[32];
-ccx q[32],q[3],q[33];
-ccx q[33],q[4],q[34];
-ccx q[34],q[5],q[35];
-ccx q[35],q[6],q[36];
-ccx q[36],q[7],q[37];
-ccx q[37],q[8],q[38];
-ccx q[38],q[9],q[39];
-ccx q[39],q[10],q[40];
-ccx q[40],q[11],q[41];
-ccx q[41],q[12],q[42];
-ccx q[42],q[13],q[43];
-ccx q[43],q[14],q[44];
-z q[44];
-ccx q[43],q[14],q[44];
-ccx q[42],q[13],q[43];
-ccx q[41],q[12],q[42];
-ccx q[40],q[11],q[41];
-ccx q[39],q[10],q[40];
-ccx q[38],q[9],q[39];
-ccx q[37],q[8],q[38];
-ccx q[36],q[7],q[37];
-ccx q[35],q[6],q[36];
-ccx q[34],q[5],q[35];
-ccx q[33],q[4],q[34];
-ccx q[32],q[3],q[33];
-ccx q[31],q[2],q[32];
-ccx q[1],q[0],q[31];
-x q[0];
-x q[1];
-x q[2];
-x q[3];
-x q[4];
-x q[5];
-x q[6];
-x q[7];
-x q[8];
-x q[9];
-x q[10];
-x q[11];
-x q[12];
-x q[13];
-x q[14];
-h q[0];
-h q[1];
-h q[2];
-h q[3];
-h q[4];
-h q[5];
-h q[6];
-h q[7];
-h q[8];
-h q[9];
-h q[10];
-h q[11];
-h q[12];
-h q[13];
-h q[14];
-cx q[0],q[15];
-cx q[1],q[17];
-cx q[2],q[19];
-cx q[3],q[21];
-cx q[4],q[23];
-cx q[5],q[25];
-cx q[6],q[27];
-cx q[7],q[29];
-cx q[8],q[16];
-cx q[8],q[17];
-cx q[9],q[18];
-cx q[9],q[19];
-cx q[10],q[20];
-cx q[10],q[21];
-cx q[11],q[22];
-cx q[11],q[23];
-cx q[12],q[24];
-cx q[12],q[25];
-cx q[13],q[26];
-cx q[13],q[27];
-cx q[14],q[28];
-cx q[14],q[29];
-x q[15];
-x q[17];
-x q[18];
-x q[19];
-x q[20];
-x q[21];
-x q[22];
-x q[23];
-x q[24];
-x q[25];
-x q[26];
-x q[27];
-x q[28];
-x q[29];
-reset q[31];
-reset q[32];
-reset q[33];
-reset q[34];
-reset q[35];
-reset q[36];
-reset q[37];
-reset q[38];
-reset q[39];
-reset q[40];
-reset q[41];
-reset q[42];
-reset q[43];
-reset q[44];
-ccx q[16],q[15],q[31];
-ccx q[31],q[17],q[32];
-ccx q[32],q[18],q[33];
-ccx q[33],q[19],q[34];
-ccx q[34],q[20],q[35];
-ccx q[35],q[21],q[36];
-ccx q[36],q[22],q[37];
-ccx q[37],q[23],q[38];
-ccx q[38],q[24],q[39];
-ccx q[39],q[25],q[40];
-ccx q[40],q[26],q[41];
-ccx q[41],q[27],q[42];
-ccx q[42],q[28],q[43];
-ccx q[43],q[29],q[44];
-z q[44];
-ccx q[43],q[29],q[44];
-ccx q[42],q[28],q[43];
-ccx q[41],q[27],q[42];
-ccx q[40],q[26],q[41];
-ccx q[39],q[25],q[40];
-ccx q[38],q[24],q[39];
-ccx q[37],q[23],q[38];
-ccx q[36],q[22],q[37];
-ccx q[35],q[21],q[36];
-ccx q[34],q[20],q[35];
-ccx q[33],q[19],q[34];
-ccx q[32],q[18],q[33];
-ccx q[31],q[17],q[32];
-ccx q[16],q[15],q[31];
-x q[15];
-x q[17];
-x q[18];
-x q[19];
-x q[20];
-x q[21];
-x q[22];
-x q[23];
-x q[24];
-x q[25];
-x q[26];
-x q[27];
-x q[28];
-x q[29];
-cx q[0],q[15];
-cx q[1],q[17];
-cx q[2],q[19];
-cx q[3],q[21];
-cx q[4],q[23];
-cx q[5],q[25];
-cx q[6],q[27];
-cx q[7],q[29];
-cx q[8],q[16];
-cx q[8],q[17];
-cx q[9],q[18];
-cx q[9],q[19];
-cx q[10],q[20];
-cx q[10],q[21];
-cx q[11],q[22];
-cx q[11],q[23];
-cx q[12],q[24];
-cx q[12],q[25];
-cx q[13],q[26];
-cx q[13],q[27];
-cx q[14],q[28];
-cx q[14],q[29];
-h q[0];
-h q[1];
-h q[2];
-h q[3];
-h q[4];
-h q[5];
-h q[6];
-h q[7];
-h q[8];
-h q[9];
-h q[10];
-h q[11];
-h q[12];
-h q[13];
-h q[14];
-x q[0];
-x q[1];
-x q[2];
-x q[3];
-x q[4];
-x q[5];
-x q[6];
-x q[7];
-x q[8];
-x q[9];
-x q[10];
-x q[11];
-x q[12];
-x q[13];
-x q[14];
-reset q[31];
-reset q[32];
-reset q[33];
-reset q[34];
-reset q[35];
-reset q[36];
-reset q[37];
-reset q[38];
-reset q[39];
-reset q[40];
-reset q[41];
-reset q[42];
-reset q[43];
-reset q[44];
-ccx q[1],q[0],q[31];
-ccx q[31],q[2],q[32];
-ccx q[32],q[3],q[33];
-ccx q[33],q[4],q[34];
-ccx q[34],q[5],q[35];
-ccx q[35],q[6],q[36];
-ccx q[36],q[7],q[37];
-ccx q[37],q[8],q[38];
-ccx q[38],q[9],q[39];
-ccx q[39],q[10],q[40];
-ccx q[40],q[11],q[41];
-ccx q[41],q[12],q[42];
-ccx q[42],q[13],q[43];
-ccx q[43],q[14],q[44];
-z q[44];
-ccx q[43],q[14],q[44];
-ccx q[42],q[13],q[43];
-ccx q[41],q[12],q[42];
-ccx q[40],q[11],q[41];
-ccx q[39],q[10],q[40];
-ccx q[38],q[9],q[39];
-ccx q[37],q[8],q[38];
-ccx q[36],q[7],q[37];
-ccx q[35],q[6],q[36];
-ccx q[34],q[5],q[35];
-ccx q[33],q[4],q[34];
-ccx q[32],q[3],q[33];
-ccx q[31],q[2],q[32];
-ccx q[1],q[0],q[31];
-x q[0];
-x q[1];
-x q[2];
-x q[3];
-x q[4];
-x q[5];
-x q[6];
-x q[7];
-x q[8];
-x q[9];
-x q[10];
-x q[11];
-x q[12];
-x q[13];
-x q[14];
-h q[0];
-h q[1];
-h q[2];
-h q[3];
-h q[4];
-h q[5];
-h q[6];
-h q[7];
-h q[8];
-h q[9];
-h q[10];
-h q[11];
-h q[12];
-h q[13];
-h q[14];
-cx q[0],q[15];
-cx q[1],q[17];
-cx q[2],q[19];
-cx q[3],q[21];
-cx q[4],q[23];
-cx q[5],q[25];
-cx q[6],q[27];
-cx q[7],q[29];
-cx q[8],q[16];
-cx q[8],q[17];
-cx q[9],q[18];
-cx q[9],q[19];
-cx q[10],q[20];
-cx q[10],q[21];
-cx q[11],q[22];
-cx q[11],q[23];
-cx q[12],q[24];
-cx q[12],q[25];
-cx q[13],q[26];
-cx q[13],q[27];
-cx q[14],q[28];
-cx q[14],q[29];
-x q[15];
-x q[17];
-x q[18];
-x q[19];
-x q[20];
-x q[21];
-x q[22];
-x q[23];
-x q[24];
-x q[25];
-x q[26];
-x q[27];
-x q[28];
-x q[29];
-reset q[31];
-reset q[32];
-reset q[33];
-reset q[34];
-reset q[35];
-reset q[36];
-reset q[37];
-reset q[38];
-reset q[39];
-reset q[40];
-reset q[41];
-reset q[42];
-reset q[43];
-reset q[44];
-ccx q[16],q[15],q[31];
-ccx q[31],q[17],q[32];
-ccx q[32],q[18],q[33];
-ccx q[33],q[19],q[34];
-ccx q[34],q[20],q[35];
-ccx q[35],q[21],q[36];
-ccx q[36],q[22],q[37];
-ccx q[37],q[23],q[38];
-ccx q[38],q[24],q[39];
-ccx q[39],q[25],q[40];
-ccx q[40],q[26],q[41];
-ccx q[41],q[27],q[42];
-ccx q[42],q[28],q[43];
-ccx q[43],q[29],q[44];
-z q[44];
-ccx q[43],q[29],q[44];
-ccx q[42],q[28],q[43];
-ccx q[41],q[27],q[42];
-ccx q[40],q[26],q[41];
-ccx q[39],q[25],q[40];
-ccx q[38],q[24],q[39];
-ccx q[37],q[23],q[38];
-ccx q[36],q[22],q[37];
-ccx q[35],q[21],q[36];
-ccx q[34],q[20],q[35];
-ccx q[33],q[19],q[34];
-ccx q[32],q[18],q[33];
-ccx q[31],q[17],q[32];
-ccx q[16],q[15],q[31];
-x q[15];
-x q[17];
-x q[18];
-x q[19];
-x q[20];
-x q[21];
-x q[22];
-x q[23];
-x q[24];
-x q[25];
-x q[26];
-x q[27];
-x q[28];
-x q[29];
-cx q[0],q[15];
-cx q[1],q[17];
-cx q[2],q[19];
-cx q[3],q[21];
-cx q[4],q[23];
-cx q[5],q[25];
-cx q[6],q[27];
-cx q[7],q[29];
-cx q[8],q[16];
-cx q[8],q[17];
-cx q[9],q[18];
-cx q[9],q[19];
-cx q[10],q[20];
-cx q[10],q[21];
-cx q[11],q[22];
-cx q[11],q[23];
-cx q[12],q[24];
-cx q[12],q[25];
-cx q[13],q[26];
-cx q[13],q[27];
-cx q[14],q[28];
-cx q[14],q[29];
-h q[0];
-h q[1];
-h q[2];
-h q[3];
-h q[4];
-h q[5];
-h q[6];
-h q[7];
-h q[8];
-h q[9];
-h q[10];
-h q[11];
-h q[12];
-h q[13];
-h q[14];
-x q[0];
-x q[1];
-x q[2];
-x q[3];
-x q[4];
-x q[5];
-x q[6];
-x q[7];
-x q[8];
-x q[9];
-x q[10];
-x q[11];
-x q[12];
-x q[13];
-x q[14];
-reset q[31];
-reset q[32];
-reset q[33];
-reset q[34];
-reset q[35];
-reset q[36];
-reset q[37];
-reset q[38];
-reset q[39];
-reset q[40];
-reset q[41];
-reset q[42];
-reset q[43];
-reset q[44];
-ccx q[1],q[0],q[31];
-ccx q[31],q[2],q[32];
-ccx q[32],q[3],q[33];
-ccx q[33],q[4],q[34];
-ccx q[34],q[5],q[35];
-ccx q[35],q[6],q[36];
-ccx q[36],q[7],q[37];
-ccx q[37],q[8],q[38];
-ccx q[38],q[9],q[39];
-ccx q[39],q[10],q[40];
-ccx q[40],q[11],q[41];
-ccx q[41],q[12],q[42];
-ccx q[42],q[13],q[43];
-ccx q[43],q[14],q[44];
-z q[44];
-ccx q[43],q[14],q[44];
-ccx q[42],q[13],q[43];
-ccx q[41],q[12],q[42];
-ccx q[40],q[11],q[41];
-ccx q[39],q[10],q[40];
-ccx q[38],q[9],q[39];
-ccx q[37],q[8],q[38];
-ccx q[36],q[7],q[37];
-ccx q[35],q[6],q[36];
-ccx q[34],q[5],q[35];
-ccx q[33],q[4],q[34];
-ccx q[32],q[3],q[33];
-ccx q[31],q[2],q[32];
-ccx q[1],q[0],q[31];
-x q[0];
-x q[1];
-x q[2];
-x q[3];
-x q[4];
-x q[5];
-x q[6];
-x q[7];
-x q[8];
-x q[9];
-x q[10];
-x q[11];
-x q[12];
-x q[13];
-x q[14];
-h q[0];
-h q[1];
-h q[2];
-h q[3];
-h q[4];
-h q[5];
-h q[6];
-h q[7];
-h q[8];
-h q[9];
-h q[10];
-h q[11];
-h q[12];
-h q[13];
-h q[14];
-cx q[0],q[15];
-cx q[1],q[17];
-cx q[2],q[19];
-cx q[3],q[21];
-cx q[4],q[23];
-cx q[5],q[25];
-cx q[6],q[27];
-cx q[7],q[29];
-cx q[8],q[16];
-cx q[8],q[17];
-cx q[9],q[18];
-cx q[9],q[19];
-cx q[10],q[20];
-cx q[10],q[21];
-cx q[11],q[22];
-cx q[11],q[23];
-cx q[12],q[24];
-cx q[12],q[25];
-cx q[13],q[26];
-cx q[13],q[27];
-cx q[14],q[28];
-cx q[14],q[29];
-x q[15];
-x q[17];
-x q[18];
-x q[19];
-x q[20];
-x q[21];
-x q[22];
-x q[23];
-x q[24];
-x q[25];
-x q[26];
-x q[27];
-x q[28];
-x q[29];
-reset q[31];
-reset q[32];
-reset q[33];
-reset q[34];
-reset q[35];
-reset q[36];
-reset q[37];
-reset q[38];
-reset q[39];
-reset q[40];
-reset q[41];
-reset q[42];
-reset q[43];
-reset q[44];
-ccx q[16],q[15],q[31];
-ccx q[31],q[17],q[32];
-ccx q[32],q[18],q[33];
-ccx q[33],q[19],q[34];
-ccx q[34],q[20],q[35];
-ccx q[35],q[21],q[36];
-ccx q[36],q[22],q[37];
-ccx q[37],q[23],q[38];
-ccx q[38],q[24],q[39];
-ccx q[39],q[25],q[40];
-ccx q[40],q[26],q[41];
-ccx q[41],q[27],q[42];
-ccx q[42],q[28],q[43];
-ccx q[43],q[29],q[44];
-z q[44];
-ccx q[43],q[29],q[44];
-ccx q[42],q[28],q[43];
-ccx q[41],q[27],q[42];
-ccx q[40],q[26],q[41];
-ccx q[39],q[25],q[40];
-ccx q[38],q[24],q[39];
-ccx q[37],q[23],q[38];
-ccx q[36],q[22],q[37];
-ccx q[35],q[21],q[36];
-ccx q[34],q[20],q[35];
-ccx q[33],q[19],q[34];
-ccx q[32],q[18],q[33];
-ccx q[31],q[17],q[32];
-ccx q[16],q[15],q[31];
-x q[15];
-x q[17];
-x q[18];
-x q[19];
-x q[20];
-x q[21];
-x q[22];
-x q[23];
-x q[24];
-x q[25];
-x q[26];
-x q[27];
-x q[28];
-x q[29];
-cx q[0],q[15];
-cx q[1],q[17];
-cx q[2],q[19];
-cx q[3],q[21];
-cx q[4],q[23];
-cx q[5],q[25];
-cx q[6],q[27];
-cx q[7],q[29];
-cx q[8],q[16];
-cx q[8],q[17];
-cx q[9],q[18];
-cx q[9],q[19];
-cx q[10],q[20];
-cx q[10],q[21];
-cx q[11],q[22];
-cx q[11],q[23];
-cx q[12],q[24];
-cx q[12],q[25];
-cx q[13],q[26];
-cx q[13],q[27];
-cx q[14],q[28];
-cx q[14],q[29];
-h q[0];
-h q[1];
-h q[2];
-h q[3];
-h q[4];
-h q[5];
-h q[6];
-h q[7];
-h q[8];
-h q[9];
-h q[10];
-h q[11];
-h q[12];
-h q[13];
-h q[14];
-x q[0];
-x q[1];
-x q[2];
-x q[3];
-x q[4];
-x q[5];
-x q[6];
-x q[7];
-x q[8];
-x q[9];
-x q[10];
-x q[11];
-x q[12];
-x q[13];
-x q[14];
-reset q[31];
-reset q[32];
-reset q[33];
-reset q[34];
-reset q[35];
-reset q[36];
-reset q[37];
-reset q[38];
-reset q[39];
-reset q[40];
-reset q[41];
-reset q[42];
-reset q[43];
-reset q[44];
-ccx q[1],q[0],q[31];
-ccx q[31],q[2],q[32];
-ccx q[32],q[3],q[33];
-ccx q[33],q[4],q[34];
-ccx q[34],q[5],q[35];
-ccx q[35],q[6],q[36];
-ccx q[36],q[7],q[37];
-ccx q[37],q[8],q[38];
-ccx q[38],q[9],q[39];
-ccx q[39],q[10],q[40];
-ccx q[40],q[11],q[41];
-ccx q[41],q[12],q[42];
-ccx q[42],q[13],q[43];
-ccx q[43],q[14],q[44];
-z q[44];
-ccx q[43],q[14],q[44];
-ccx q[42],q[13],q[43];
-ccx q[41],q[12],q[42];
-ccx q[40],q[11],q[41];
-ccx q[39],q[10],q[40];
-ccx q[38],q[9],q[39];
-ccx q[37],q[8],q[38];
-ccx q[36],q[7],q[37];
-ccx q[35],q[6],q[36];
-ccx q[34],q[5],q[35];
-ccx q[33],q[4],q[34];
-ccx q[32],q[3],q[33];
-ccx q[31],q[2],q[32];
-ccx q[1],q[0],q[31];
-x q[0];
-x q[1];
-x q[2];
-x q[3];
-x q[4];
-x q[5];
-x q[6];
-x q[7];
-x q[8];
-x q[9];
-x q[10];
-x q[11];
-x q[12];
-x q[13];
-x q[14];
-h q[0];
-h q[1];
-h q[2];
-h q[3];
-h q[4];
-h q[5];
-h q[6];
-h q[7];
-h q[8];
-h q[9];
-h q[10];
-h q[11];
-h q[12];
-h q[13];
-h q[14];
-cx q[0],q[15];
-cx q[1],q[17];
-cx q[2],q[19];
-cx q[3],q[21];
-cx q[4],q[23];
-cx q[5],q[25];
-cx q[6],q[27];
-cx q[7],q[29];
-cx q[8],q[16];
-cx q[8],q[17];
-cx q[9],q[18];
-cx q[9],q[19];
-cx q[10],q[20];
-cx q[10],q[21];
-cx q[11],q[22];
-cx q[11],q[23];
-cx q[12],q[24];
-cx q[12],q[25];
-cx q[13],q[26];
-cx q[13],q[27];
-cx q[14],q[28];
-cx q[14],q[29];
-x q[15];
-x q[17];
-x q[18];
-x q[19];
-x q[20];
-x q[21];
-x q[22];
-x q[23];
-x q[24];
-x q[25];
-x q[26];
-x q[27];
-x q[28];
-x q[29];
-reset q[31];
-reset q[32];
-reset q[33];
-reset q[34];
-reset q[35];
-reset q[36];
-reset q[37];
-reset q[38];
-reset q[39];
-reset q[40];
-reset q[41];
-reset q[42];
-reset q[43];
-reset q[44];
-ccx q[16],q[15],q[31];
-ccx q[31],q[17],q[32];
-ccx q[32],q[18],q[33];
-ccx q[33],q[19],q[34];
-ccx q[34],q[20],q[35];
-ccx q[35],q[21],q[36];
-ccx q[36],q[22],q[37];
-ccx q[37],q[23],q[38];
-ccx q[38],q[24],q[39];
-ccx q[39],q[25],q[40];
-ccx q[40],q[26],q[41];
-ccx q[41],q[27],q[42];
-ccx q[42],q[28],q[43];
-ccx q[43],q[29],q[44];
-z q[44];
-ccx q[43],q[29],q[44];
-ccx q[42],q[28],q[43];
-ccx q[41],q[27],q[42];
-ccx q[40],q[26],q[41];
-ccx q[39],q[25],q[40];
-ccx q[38],q[24],q[39];
-ccx q[37],q[23],q[38];
-ccx q[36],q[22],q[37];
-ccx q[35],q[21],q[36];
-ccx q[34],q[20],q[35];
-ccx q[33],q[19],q[34];
-ccx q[32],q[18],q[33];
-ccx q[31],q[17],q[32];
-ccx q[16],q[15],q[31];
-x q[15];
-x q[17];
-x q[18];
-x q[19];
-x q[20];
-x q[21];
-x q[22];
-x q[23];
-x q[24];
-x q[25];
-x q[26];
-x q[27];
-x q[28];
-x q[29];
-cx q[0],q[15];
-cx q[1],q[17];
-cx q[2],q[19];
-cx q[3],q[21];
-cx q[4],q[23];
-cx q[5],q[25];
-cx q[6],q[27];
-cx q[7],q[29];
-cx q[8],q[16];
-cx q[8],q[17];
-cx q[9],q[18];
-cx q[9],q[19];
-cx q[10],q[20];
-cx q[10],q[21];
-cx q[11],q[22];
-cx q[11],q[23];
-cx q[12],q[24];
-cx q[12],q[25];
-cx q[13],q[26];
-cx q[13],q[27];
-cx q[14],q[28];
-cx q[14],q[29];
-h q[0];
-h q[1];
-h q[2];
-h q[3];
-h q[4];
-h q[5];
-h q[6];
-h q[7];
-h q[8];
-h q[9];
-h q[10];
-h q[11];
-h q[12];
-h q[13];
-h q[14];
-x q[0];
-x q[1];
-x q[2];
-x q[3];
-x q[4];
-x q[5];
-x q[6];
-x q[7];
-x q[8];
-x q[9];
-x q[10];
-x q[11];
-x q[12];
-x q[13];
-x q[14];
-reset q[31];
-reset q[32];
-reset q[33];
-reset q[34];
-reset q[35];
-reset q[36];
-reset q[37];
-reset q[38];
-reset q[39];
-reset q[40];
-reset q[41];
-reset q[42];
-reset q[43];
-reset q[44];
-ccx q[1],q[0],q[31];
-ccx q[31],q[2],q[32];
-ccx q[32],q[3],q[33];
-ccx q[33],q[4],q[34];
-ccx q[34],q[5],q[35];
-ccx q[35],q[6],q[36];
-ccx q[36],q[7],q[37];
-ccx q[37],q[8],q[38];
-ccx q[38],q[9],q[39];
-ccx q[39],q[10],q[40];
-ccx q[40],q[11],q[41];
-ccx q[41],q[12],q[42];
-ccx q[42],q[13],q[43];
-ccx q[43],q[14],q[44];
-z q[44];
-ccx q[43],q[14],q[44];
-ccx q[42],q[13],q[43];
-ccx q[41],q[12],q[42];
-ccx q[40],q[11],q[41];
-ccx q[39],q[10],q[40];
-ccx q[38],q[9],q[39];
-ccx q[37],q[8],q[38];
-ccx q[36],q[7],q[37];
-ccx q[35],q[6],q[36];
-ccx q[34],q[5],q[35];
-ccx q[33],q[4],q[34];
-ccx q[32],q[3],q[33];
-ccx q[31],q[2],q[32];
-ccx q[1],q[0],q[31];
-x q[0];
-x q[1];
-x q[2];
-x q[3];
-x q[4];
-x q[5];
-x q[6];
-x q[7];
-x q[8];
-x q[9];
-x q[10];
-x q[11];
-x q[12];
-x q[13];
-x q[14];
-h q[0];
-h q[1];
-h q[2];
-h q[3];
-h q[4];
-h q[5];
-h q[6];
-h q[7];
-h q[8];
-h q[9];
-h q[10];
-h q[11];
-h q[12];
-h q[13];
-h q[14];
-cx q[0],q[15];
-cx q[1],q[17];
-cx q[2],q[19];
-cx q[3],q[21];
-cx q[4],q[23];
-cx q[5],q[25];
-cx q[6],q[27];
-cx q[7],q[29];
-cx q[8],q[16];
-cx q[8],q[17];
-cx q[9],q[18];
-cx q[9],q[19];
-cx q[10],q[20];
-cx q[10],q[21];
-cx q[11],q[22];
-cx q[11],q[23];
-cx q[12],q[24];
-cx q[12],q[25];
-cx q[13],q[26];
-cx q[13],q[27];
-cx q[14],q[28];
-cx q[14],q[29];
-x q[15];
-x q[17];
-x q[18];
-x q[19];
-x q[20];
-x q[21];
-x q[22];
-x q[23];
-x q[24];
-x q[25];
-x q[26];
-x q[27];
-x q[28];
-x q[29];
-reset q[31];
-reset q[32];
-reset q[33];
-reset q[34];
-reset q[35];
-reset q[36];
-reset q[37];
-reset q[38];
-reset q[39];
-reset q[40];
-reset q[41];
-reset q[42];
-reset q[43];
-reset q[44];
-ccx q[16],q[15],q[31];
-ccx q[31],q[17],q[32];
-ccx q[32],q[18],q[33];
-ccx q[33],q[19],q[34];
-ccx q[34],q[20],q[35];
-ccx q[35],q[21],q[36];
-ccx q[36],q[22],q[37];
-ccx q[37],q[23],q[38];
-ccx q[38],q[24],q[39];
-ccx q[39],q[25],q[40];
-ccx q[40],q[26],q[41];
-ccx q[41],q[27],q[42];
-ccx q[42],q[28],q[43];
-ccx q[43],q[29],q[44];
-z q[44];
-ccx q[43],q[29],q[44];
-ccx q[42],q[28],q[43];
-ccx q[41],q[27],q[42];
-ccx q[40],q[26],q[41];
-ccx q[39],q[25],q[40];
-ccx q[38],q[24],q[39];
-ccx q[37],q[23],q[38];
-ccx q[36],q[22],q[37];
-ccx q[35],q[21],q[36];
-ccx q[34],q[20],q[35];
-ccx q[33],q[19],q[34];
-ccx q[32],q[18],q[33];
-ccx q[31],q[17],q[32];
-ccx q[16],q[15],q[31];
-x q[15];
-x q[17];
-x q[18];
-x q[19];
-x q[20];
-x q[21];
-x q[22];
-x q[23];
-x q[24];
-x q[25];
-x q[26];
-x q[27];
-x q[28];
-x q[29];
-cx q[0],q[15];
-cx q[1],q[17];
-cx q[2],q[19];
-cx q[3],q[21];
-cx q[4],q[23];
-cx q[5],q[25];
-cx q[6],q[27];
-cx q[7],q[29];
-cx q[8],q[16];
-cx q[8],q[17];
-cx q[9],q[18];
-cx q[9],q[19];
-cx q[10],q[20];
-cx q[10],q[21];
-cx q[11],q[22];
-cx q[11],q[23];
-cx q[12],q[24];
-cx q[12],q[25];
-cx q[13],q[26];
-cx q[13],q[27];
-cx q[14],q[28];
-cx q[14],q[29];
-h q[0];
-h q[1];
-h q[2];
-h q[3];
-h q[4];
-h q[5];
-h q[6];
-h q[7];
-h q[8];
-h q[9];
-h q[10];
-h q[11];
-h q[12];
-h q[13];
-h q[14];
-x q[0];
-x q[1];
-x q[2];
-x q[3];
-x q[4];
-x q[5];
-x q[6];
-x q[7];
-x q[8];
-x q[9];
-x q[10];
-x q[11];
-x q[12];
-x q[13];
-x q[14];
-reset q[31];
-reset q[32];
-reset q[33];
-reset q[34];
-reset q[35];
-reset q[36];
-reset q[37];
-reset q[38];
-reset q[39];
-reset q[40];
-reset q[41];
-reset q[42];
-reset q[43];
-reset q[44];
-ccx q[1],q[0],q[31];
-ccx q[31],q[2],q[32];
-ccx q[32],q[3],q[33];
-ccx q[33],q[4],q[34];
-ccx q[34],q[5],q[35];
-ccx q[35],q[6],q[36];
-ccx q[36],q[7],q[37];
-ccx q[37],q[8],q[38];
-ccx q[38],q[9],q[39];
-ccx q[39],q[10],q[40];
-ccx q[40],q[11],q[41];
-ccx q[41],q[12],q[42];
-ccx q[42],q[13],q[43];
-ccx q[43],q[14],q[44];
-z q[44];
-ccx q[43],q[14],q[44];
-ccx q[42],q[13],q[43];
-ccx q[41],q[12],q[42];
-ccx q[40],q[11],q[41];
-ccx q[39],q[10],q[40];
-ccx q[38],q[9],q[39];
-ccx q[37],q[8],q[38];
-ccx q[36],q[7],q[37];
-ccx q[35],q[6],q[36];
-ccx q[34],q[5],q[35];
-ccx q[33],q[4],q[34];
-ccx q[32],q[3],q[33];
-ccx q[31],q[2],q[32];
-ccx q[1],q[0],q[31];
-x q[0];
-x q[1];
-x q[2];
-x q[3];
-x q[4];
-x q[5];
-x q[6];
-x q[7];
-x q[8];
-x q[9];
-x q[10];
-x q[11];
-x q[12];
-x q[13];
-x q[14];
-h q[0];
-h q[1];
-h q[2];
-h q[3];
-h q[4];
-h q[5];
-h q[6];
-h q[7];
-h q[8];
-h q[9];
-h q[10];
-h q[11];
-h q[12];
-h q[13];
-h q[14];
-cx q[0],q[15];
-cx q[1],q[17];
-cx q[2],q[19];
-cx q[3],q[21];
-cx q[4],q[23];
-cx q[5],q[25];
-cx q[6],q[27];
-cx q[7],q[29];
-cx q[8],q[16];
-cx q[8],q[17];
-cx q[9],q[18];
-cx q[9],q[19];
-cx q[10],q[20];
-cx q[10],q[21];
-cx q[11],q[22];
-cx q[11],q[23];
-cx q[12],q[24];
-cx q[12],q[25];
-cx q[13],q[26];
-cx q[13],q[27];
-cx q[14],q[28];
-cx q[14],q[29];
-x q[15];
-x q[17];
-x q[18];
-x q[19];
-x q[20];
-x q[21];
-x q[22];
-x q[23];
-x q[24];
-x q[25];
-x q[26];
-x q[27];
-x q[28];
-x q[29];
-reset q[31];
-reset q[32];
-reset q[33];
-reset q[34];
-reset q[35];
-reset q[36];
-reset q[37];
-reset q[38];
-reset q[39];
-reset q[40];
-reset q[41];
-reset q[42];
-reset q[43];
-reset q[44];
-ccx q[16],q[15],q[31];
-ccx q[31],q[17],q[32];
-ccx q[32],q[18],q[33];
-ccx q[33],q[19],q[34];
-ccx q[34],q[20],q[35];
-ccx q[35],q[21],q[36];
-ccx q[36],q[22],q[37];
-ccx q[37],q[23],q[38];
-ccx q[38],q[24],q[39];
-ccx q[39],q[25],q[40];
-ccx q[40],q[26],q[41];
-ccx q[41],q[27],q[42];
-ccx q[42],q[28],q[43];
-ccx q[43],q[29],q[44];
-z q[44];
-ccx q[43],q[29],q[44];
-ccx q[42],q[28],q[43];
-ccx q[41],q[27],q[42];
-ccx q[40],q[26],q[41];
-ccx q[39],q[25],q[40];
-ccx q[38],q[24],q[39];
-ccx q[37],q[23],q[38];
-ccx q[36],q[22],q[37];
-ccx q[35],q[21],q[36];
-ccx q[34],q[20],q[35];
-ccx q[33],q[19],q[34];
-ccx q[32],q[18],q[33];
-ccx q[31],q[17],q[32];
-ccx q[16],q[15],q[31];
-x q[15];
-x q[17];
-x q[18];
-x q[19];
-x q[20];
-x q[21];
-x q[22];
-x q[23];
-x q[24];
-x q[25];
-x q[26];
-x q[27];
-x q[28];
-x q[29];
-cx q[0],q[15];
-cx q[1],q[17];
-cx q[2],q[19];
-cx q[3],q[21];
-cx q[4],q[23];
-cx q[5],q[25];
-cx q[6],q[27];
-cx q[7],q[29];
-cx q[8],q[16];
-cx q[8],q[17];
-cx q[9],q[18];
-cx q[9],q[19];
-cx q[10],q[20];
-cx q[10],q[21];
-cx q[11],q[22];
-cx q[11],q[23];
-cx q[12],q[24];
-cx q[12],q[25];
-cx q[13],q[26];
-cx q[13],q[27];
-cx q[14],q[28];
-cx q[14],q[29];
-h q[0];
-h q[1];
-h q[2];
-h q[3];
-h q[4];
-h q[5];
-h q[6];
-h q[7];
-h q[8];
-h q[9];
-h q[10];
-h q[11];
-h q[12];
-h q[13];
-h q[14];
-x q[0];
-x q[1];
-x q[2];
-x q[3];
-x q[4];
-x q[5];
-x q[6];
-x q[7];
-x q[8];
-x q[9];
-x q[10];
-x q[11];
-x q[12];
-x q[13];
-x q[14];
-reset q[31];
-reset q[32];
-reset q[33];
-reset q[34];
-reset q[35];
-reset q[36];
-reset q[37];
-reset q[38];
-reset q[39];
-reset q[40];
-reset q[41];
-reset q[42];
-reset q[43];
-reset q[44];
-ccx q[1],q[0],q[31];
-ccx q[31],q[2],q[32];
-ccx q[32],q[3],q[33];
-ccx q[33],q[4],q[34];
-ccx q[34],q[5],q[35];
-ccx q[35],q[6],q[36];
-ccx q[36],q[7],q[37];
-ccx q[37],q[8],q[38];
-ccx q[38],q[9],q[39];
-ccx q[39],q[10],q[40];
-ccx q[40],q[11],q[41];
-ccx q[41],q[12],q[42];
-ccx q[42],q[13],q[43];
-ccx q[43],q[14],q[44];
-z q[44];
-ccx q[43],q[14],q[44];
-ccx q[42],q[13],q[43];
-ccx q[41],q[12],q[42];
-ccx q[40],q[11],q[41];
-ccx q[39],q[10],q[40];
-ccx q[38],q[9],q[39];
-ccx q[37],q[8],q[38];
-ccx q[36],q[7],q[37];
-ccx q[35],q[6],q[36];
-ccx q[34],q[5],q[35];
-ccx q[33],q[4],q[34];
-ccx q[32],q[3],q[33];
-ccx q[31],q[2],q[32];
-ccx q[1],q[0],q[31];
-x q[0];
-x q[1];
-x q[2];
-x q[3];
-x q[4];
-x q[5];
-x q[6];
-x q[7];
-x q[8];
-x q[9];
-x q[10];
-x q[11];
-x q[12];
-x q[13];
-x q[14];
-h q[0];
-h q[1];
-h q[2];
-h q[3];
-h q[4];
-h q[5];
-h q[6];
-h q[7];
-h q[8];
-h q[9];
-h q[10];
-h q[11];
-h q[12];
-h q[13];
-h q[14];
-cx q[0],q[15];
-cx q[1],q[17];
-cx q[2],q[19];
-cx q[3],q[21];
-cx q[4],q[23];
-cx q[5],q[25];
-cx q[6],q[27];
-cx q[7],q[29];
-cx q[8],q[16];
-cx q[8],q[17];
-cx q[9],q[18];
-cx q[9],q[19];
-cx q[10],q[20];
-cx q[10],q[21];
-cx q[11],q[22];
-cx q[11],q[23];
-cx q[12],q[24];
-cx q[12],q[25];
-cx q[13],q[26];
-cx q[13],q[27];
-cx q[14],q[28];
-cx q[14],q[29];
-x q[15];
-x q[17];
-x q[18];
-x q[19];
-x q[20];
-x q[21];
-x q[22];
-x q[23];
-x q[24];
-x q[25];
-x q[26];
-x q[27];
-x q[28];
-x q[29];
-reset q[31];
-reset q[32];
-reset q[33];
-reset q[34];
-reset q[35];
-reset q[36];
-reset q[37];
-reset q[38];
-reset q[39];
-reset q[40];
-reset q[41];
-reset q[42];
-reset q[43];
-reset q[44];
-ccx q[16],q[15],q[31];
-ccx q[31],q[17],q[32];
-ccx q[32],q[18],q[33];
-ccx q[33],q[19],q[34];
-ccx q[34],q[20],q[35];
-ccx q[35],q[21],q[36];
-ccx q[36],q[22],q[37];
-ccx q[37],q[23],q[38];
-ccx q[38],q[24],q[39];
-ccx q[39],q[25],q[40];
-ccx q[40],q[26],q[41];
-ccx q[41],q[27],q[42];
-ccx q[42],q[28],q[43];
-ccx q[43],q[29],q[44];
-z q[44];
-ccx q[43],q[29],q[44];
-ccx q[42],q[28],q[43];
-ccx q[41],q[27],q[42];
-ccx q[40],q[26],q[41];
-ccx q[39],q[25],q[40];
-ccx q[38],q[24],q[39];
-ccx q[37],q[23],q[38];
-ccx q[36],q[22],q[37];
-ccx q[35],q[21],q[36];
-ccx q[34],q[20],q[35];
-ccx q[33],q[19],q[34];
-ccx q[32],q[18],q[33];
-ccx q[31],q[17],q[32];
-ccx q[16],q[15],q[31];
-x q[15];
-x q[17];
-x q[18];
-x q[19];
-x q[20];
-x q[21];
-x q[22];
-x q[23];
-x q[24];
-x q[25];
-x q[26];
-x q[27];
-x q[28];
-x q[29];
-cx q[0],q[15];
-cx q[1],q[17];
-cx q[2],q[19];
-cx q[3],q[21];
-cx q[4],q[23];
-cx q[5],q[25];
-cx q[6],q[27];
-cx q[7],q[29];
-cx q[8],q[16];
-cx q[8],q[17];
-cx q[9],q[18];
-cx q[9],q[19];
-cx q[10],q[20];
-cx q[10],q[21];
-cx q[11],q[22];
-cx q[11],q[23];
-cx q[12],q[24];
-cx q[12],q[25];
-cx q[13],q[26];
-cx q[13],q[27];
-cx q[14],q[28];
-cx q[14],q[29];
-h q[0];
-h q[1];
-h q[2];
-h q[3];
-h q[4];
-h q[5];
-h q[6];
-h q[7];
-h q[8];
-h q[9];
-h q[10];
-h q[11];
-h q[12];
-h q[13];
-h q[14];
-x q[0];
-x q[1];
-x q[2];
-x q[3];
-x q[4];
-x q[5];
-x q[6];
-x q[7];
-x q[8];
-x q[9];
-x q[10];
-x q[11];
-x q[12];
-x q[13];
-x q[14];
-reset q[31];
-reset q[32];
-reset q[33];
-reset q[34];
-reset q[35];
-reset q[36];
-reset q[37];
-reset q[38];
-reset q[39];
-reset q[40];
-reset q[41];
-reset q[42];
-reset q[43];
-reset q[44];
-ccx q[1],q[0],q[31];
-ccx q[31],q[2],q[32];
-ccx q[32],q[3],q[33];
-ccx q[33],q[4],q[34];
-ccx q[34],q[5],q[35];
-ccx q[35],q[6],q[36];
-ccx q[36],q[7],q[37];
-ccx q[37],q[8],q[38];
-ccx q[38],q[9],q[39];
-ccx q[39],q[10],q[40];
-ccx q[40],q[11],q[41];
-ccx q[41],q[12],q[42];
-ccx q[42],q[13],q[43];
-ccx q[43],q[14],q[44];
-z q[44];
-ccx q[43],q[14],q[44];
-ccx q[42],q[13],q[43];
-ccx q[41],q[12],q[42];
-ccx q[40],q[11],q[41];
-ccx q[39],q[10],q[40];
-ccx q[38],q[9],q[39];
-ccx q[37],q[8],q[38];
-ccx q[36],q[7],q[37];
-ccx q[35],q[6],q[36];
-ccx q[34],q[5],q[35];
-ccx q[33],q[4],q[34];
-ccx q[32],q[3],q[33];
-ccx q[31],q[2],q[32];
-ccx q[1],q[0],q[31];
-x q[0];
-x q[1];
-x q[2];
-x q[3];
-x q[4];
-x q[5];
-x q[6];
-x q[7];
-x q[8];
-x q[9];
-x q[10];
-x q[11];
-x q[12];
-x q[13];
-x q[14];
-h q[0];
-h q[1];
-h q[2];
-h q[3];
-h q[4];
-h q[5];
-h q[6];
-h q[7];
-h q[8];
-h q[9];
-h q[10];
-h q[11];
-h q[12];
-h q[13];
-h q[14];
-cx q[0],q[15];
-cx q[1],q[17];
-cx q[2],q[19];
-cx q[3],q[21];
-cx q[4],q[23];
-cx q[5],q[25];
-cx q[6],q[27];
-cx q[7],q[29];
-cx q[8],q[16];
-cx q[8],q[17];
-cx q[9],q[18];
-cx q[9],q[19];
-cx q[10],q[20];
-cx q[10],q[21];
-cx q[11],q[22];
-cx q[11],q[23];
-cx q[12],q[24];
-cx q[12],q[25];
-cx q[13],q[26];
-cx q[13],q[27];
-cx q[14],q[28];
-cx q[14],q[29];
-x q[15];
-x q[17];
-x q[18];
-x q[19];
-x q[20];
-x q[21];
-x q[22];
-x q[23];
-x q[24];
-x q[25];
-x q[26];
-x q[27];
-x q[28];
-x q[29];
-reset q[31];
-reset q[32];
-reset q[33];
-reset q[34];
-reset q[35];
-reset q[36];
-reset q[37];
-reset q[38];
-reset q[39];
-reset q[40];
-reset q[41];
-reset q[42];
-reset q[43];
-reset q[44];
-ccx q[16],q[15],q[31];
-ccx q[31],q[17],q[32];
-ccx q[32],q[18],q[33];
-ccx q[33],q[19],q[34];
-ccx q[34],q[20],q[35];
-ccx q[35],q[21],q[36];
-ccx q[36],q[22],q[37];
-ccx q[37],q[23],q[38];
-ccx q[38],q[24],q[39];
-ccx q[39],q[25],q[40];
-ccx q[40],q[26],q[41];
-ccx q[41],q[27],q[42];
-ccx q[42],q[28],q[43];
-ccx q[43],q[29],q[44];
-z q[44];
-ccx q[43],q[29],q[44];
-ccx q[42],q[28],q[43];
-ccx q[41],q[27],q[42];
-ccx q[40],q[26],q[41];
-ccx q[39],q[25],q[40];
-ccx q[38],q[24],q[39];
-ccx q[37],q[23],q[38];
-ccx q[36],q[22],q[37];
-ccx q[35],q[21],q[36];
-ccx q[34],q[20],q[35];
-ccx q[33],q[19],q[34];
-ccx q[32],q[18],q[33];
-ccx q[31],q[17],q[32];
-ccx q[16],q[15],q[31];
-x q[15];
-x q[17];
-x q[18];
-x q[19];
-x q[20];
-x q[21];
-x q[22];
-x q[23];
-x q[24];
-x q[25];
-x q[26];
-x q[27];
-x q[28];
-x q[29];
-cx q[0],q[15];
-cx q[1],q[17];
-cx q[2],q[19];
-cx q[3],q[21];
-cx q[4],q[23];
-cx q[5],q[25];
-cx q[6],q[27];
-cx q[7],q[29];
-cx q[8],q[16];
-cx q[8],q[17];
-cx q[9],q[18];
-cx q[9],q[19];
-cx q[10],q[20];
-cx q[10],q[21];
-cx q[11],q[22];
-cx q[11],q[23];
-cx q[12],q[24];
-cx q[12],q[25];
-cx q[13],q[26];
-cx q[13],q[27];
-cx q[14],q[28];
-cx q[14],q[29];
-h q[0];
-h q[1];
-h q[2];
-h q[3];
-h q[4];
-h q[5];
-h q[6];
-h q[7];
-h q[8];
-h q[9];
-h q[10];
-h q[11];
-h q[12];
-h q[13];
-h q[14];
-x q[0];
-x q[1];
-x q[2];
-x q[3];
-x q[4];
-x q[5];
-x q[6];
-x q[7];
-x q[8];
-x q[9];
-x q[10];
-x q[11];
-x q[12];
-x q[13];
-x q[14];
-reset q[31];
-reset q[32];
-reset q[33];
-reset q[34];
-reset q[35];
-reset q[36];
-reset q[37];
-reset q[38];
-reset q[39];
-reset q[40];
-reset q[41];
-reset q[42];
-reset q[43];
-reset q[44];
-ccx q[1],q[0],q[31];
-ccx q[31],q[2],q[32];
-ccx q[32],q[3],q[33];
-ccx q[33],q[4],q[34];
-ccx q[34],q[5],q[35];
-ccx q[35],q[6],q[36];
-ccx q[36],q[7],q[37];
-ccx q[37],q[8],q[38];
-ccx q[38],q[9],q[39];
-ccx q[39],q[10],q[40];
-ccx q[40],q[11],q[41];
-ccx q[41],q[12],q[42];
-ccx q[42],q[13],q[43];
-ccx q[43],q[14],q[44];
-z q[44];
-ccx q[43],q[14],q[44];
-ccx q[42],q[13],q[43];
-ccx q[41],q[12],q[42];
-ccx q[40],q[11],q[41];
-ccx q[39],q[10],q[40];
-ccx q[38],q[9],q[39];
-ccx q[37],q[8],q[38];
-ccx q[36],q[7],q[37];
-ccx q[35],q[6],q[36];
-ccx q[34],q[5],q[35];
-ccx q[33],q[4],q[34];
-ccx q[32],q[3],q[33];
-ccx q[31],q[2],q[32];
-ccx q[1],q[0],q[31];
-x q[0];
-x q[1];
-x q[2];
-x q[3];
-x q[4];
-x q[5];
-x q[6];
-x q[7];
-x q[8];
-x q[9];
-x q[10];
-x q[11];
-x q[12];
-x q[13];
-x q[14];
-h q[0];
-h q[1];
-h q[2];
-h q[3];
-h q[4];
-h q[5];
-h q[6];
-h q[7];
-h q[8];
-h q[9];
-h q[10];
-h q[11];
-h q[12];
-h q[13];
-h q[14];
-cx q[0],q[15];
-cx q[1],q[17];
-cx q[2],q[19];
-cx q[3],q[21];
-cx q[4],q[23];
-cx q[5],q[25];
-cx q[6],q[27];
-cx q[7],q[29];
-cx q[8],q[16];
-cx q[8],q[17];
-cx q[9],q[18];
-cx q[9],q[19];
-cx q[10],q[20];
-cx q[10],q[21];
-cx q[11],q[22];
-cx q[11],q[23];
-cx q[12],q[24];
-cx q[12],q[25];
-cx q[13],q[26];
-cx q[13],q[27];
-cx q[14],q[28];
-cx q[14],q[29];
-x q[15];
-x q[17];
-x q[18];
-x q[19];
-x q[20];
-x q[21];
-x q[22];
-x q[23];
-x q[24];
-x q[25];
-x q[26];
-x q[27];
-x q[28];
-x q[29];
-reset q[31];
-reset q[32];
-reset q[33];
-reset q[34];
-reset q[35];
-reset q[36];
-reset q[37];
-reset q[38];
-reset q[39];
-reset q[40];
-reset q[41];
-reset q[42];
-reset q[43];
-reset q[44];
-ccx q[16],q[15],q[31];
-ccx q[31],q[17],q[32];
-ccx q[32],q[18],q[33];
-ccx q[33],q[19],q[34];
-ccx q[34],q[20],q[35];
-ccx q[35],q[21],q[36];
-ccx q[36],q[22],q[37];
-ccx q[37],q[23],q[38];
-ccx q[38],q[24],q[39];
-ccx q[39],q[25],q[40];
-ccx q[40],q[26],q[41];
-ccx q[41],q[27],q[42];
-ccx q[42],q[28],q[43];
-ccx q[43],q[29],q[44];
-z q[44];
-ccx q[43],q[29],q[44];
-ccx q[42],q[28],q[43];
-ccx q[41],q[27],q[42];
-ccx q[40],q[26],q[41];
-ccx q[39],q[25],q[40];
-ccx q[38],q[24],q[39];
-ccx q[37],q[23],q[38];
-ccx q[36],q[22],q[37];
-ccx q[35],q[21],q[36];
-ccx q[34],q[20],q[35];
-ccx q[33],q[19],q[34];
-ccx q[32],q[18],q[33];
-ccx q[31],q[17],q[32];
-ccx q[16],q[15],q[31];
-x q[15];
-x q[17];
-x q[18];
-x q[19];
-x q[20];
-x q[21];
-x q[22];
-x q[23];
-x q[24];
-x q[25];
-x q[26];
-x q[27];
-x q[28];
-x q[29];
-cx q[0],q[15];
-cx q[1],q[17];
-cx q[2],q[19];
-cx q[3],q[21];
-cx q[4],q[23];
-cx q[5],q[25];
-cx q[6],q[27];
-cx q[7],q[29];
-cx q[8],q[16];
-cx q[8],q[17];
-cx q[9],q[18];
-cx q[9],q[19];
-cx q[10],q[20];
-cx q[10],q[21];
-cx q[11],q[22];
-cx q[11],q[23];
-cx q[12],q[24];
-cx q[12],q[25];
-cx q[13],q[26];
-cx q[13],q[27];
-cx q[14],q[28];
-cx q[14],q[29];
-h q[0];
-h q[1];
-h q[2];
-h q[3];
-h q[4];
-h q[5];
-h q[6];
-h q[7];
-h q[8];
-h q[9];
-h q[10];
-h q[11];
-h q[12];
-h q[13];
-h q[14];
-x q[0];
-x q[1];
-x q[2];
-x q[3];
-x q[4];
-x q[5];
-x q[6];
-x q[7];
-x q[8];
-x q[9];
-x q[10];
-x q[11];
-x q[12];
-x q[13];
-x q[14];
-reset q[31];
-reset q[32];
-reset q[33];
-reset q[34];
-reset q[35];
-reset q[36];
-reset q[37];
-reset q[38];
-reset q[39];
-reset q[40];
-reset q[41];
-reset q[42];
-reset q[43];
-reset q[44];
-ccx q[1],q[0],q[31];
-ccx q[31],q[2],q[32];
-ccx q[32],q[3],q[33];
-ccx q[33],q[4],q[34];
-ccx q[34],q[5],q[35];
-ccx q[35],q[6],q[36];
-ccx q[36],q[7],q[37];
-ccx q[37],q[8],q[38];
-ccx q[38],q[9],q[39];
-ccx q[39],q[10],q[40];
-ccx q[40],q[11],q[41];
-ccx q[41],q[12],q[42];
-ccx q[42],q[13],q[43];
-ccx q[43],q[14],q[44];
-z q[44];
-ccx q[43],q[14],q[44];
-ccx q[42],q[13],q[43];
-ccx q[41],q[12],q[42];
-ccx q[40],q[11],q[41];
-ccx q[39],q[10],q[40];
-ccx q[38],q[9],q[39];
-ccx q[37],q[8],q[38];
-ccx q[36],q[7],q[37];
-ccx q[35],q[6],q[36];
-ccx q[34],q[5],q[35];
-ccx q[33],q[4],q[34];
-ccx q[32],q[3],q[33];
-ccx q[31],q[2],q[32];
-ccx q[1],q[0],q[31];
-x q[0];
-x q[1];
-x q[2];
-x q[3];
-x q[4];
-x q[5];
-x q[6];
-x q[7];
-x q[8];
-x q[9];
-x q[10];
-x q[11];
-x q[12];
-x q[13];
-x q[14];
-h q[0];
-h q[1];
-h q[2];
-h q[3];
-h q[4];
-h q[5];
-h q[6];
-h q[7];
-h q[8];
-h q[9];
-h q[10];
-h q[11];
-h q[12];
-h q[13];
-h q[14];
-cx q[0],q[15];
-cx q[1],q[17];
-cx q[2],q[19];
-cx q[3],q[21];
-cx q[4],q[23];
-cx q[5],q[25];
-cx q[6],q[27];
-cx q[7],q[29];
-cx q[8],q[16];
-cx q[8],q[17];
-cx q[9],q[18];
-cx q[9],q[19];
-cx q[10],q[20];
-cx q[10],q[21];
-cx q[11],q[22];
-cx q[11],q[23];
-cx q[12],q[24];
-cx q[12],q[25];
-cx q[13],q[26];
-cx q[13],q[27];
-cx q[14],q[28];
-cx q[14],q[29];
-x q[15];
-x q[17];
-x q[18];
-x q[19];
-x q[20];
-x q[21];
-x q[22];
-x q[23];
-x q[24];
-x q[25];
-x q[26];
-x q[27];
-x q[28];
-x q[29];
-reset q[31];
-reset q[32];
-reset q[33];
-reset q[34];
-reset q[35];
-reset q[36];
-reset q[37];
-reset q[38];
-reset q[39];
-reset q[40];
-reset q[41];
-reset q[42];
-reset q[43];
-reset q[44];
-ccx q[16],q[15],q[31];
-ccx q[31],q[17],q[32];
-ccx q[32],q[18],q[33];
-ccx q[33],q[19],q[34];
-ccx q[34],q[20],q[35];
-ccx q[35],q[21],q[36];
-ccx q[36],q[22],q[37];
-ccx q[37],q[23],q[38];
-ccx q[38],q[24],q[39];
-ccx q[39],q[25],q[40];
-ccx q[40],q[26],q[41];
-ccx q[41],q[27],q[42];
-ccx q[42],q[28],q[43];
-ccx q[43],q[29],q[44];
-z q[44];
-ccx q[43],q[29],q[44];
-ccx q[42],q[28],q[43];
-ccx q[41],q[27],q[42];
-ccx q[40],q[26],q[41];
-ccx q[39],q[25],q[40];
-ccx q[38],q[24],q[39];
-ccx q[37],q[23],q[38];
-ccx q[36],q[22],q[37];
-ccx q[35],q[21],q[36];
-ccx q[34],q[20],q[35];
-ccx q[33],q[19],q[34];
-ccx q[32],q[18],q[33];
-ccx q[31],q[17],q[32];
-ccx q[16],q[15],q[31];
-x q[15];
-x q[17];
-x q[18];
-x q[19];
-x q[20];
-x q[21];
-x q[22];
-x q[23];
-x q[24];
-x q[25];
-x q[26];
-x q[27];
-x q[28];
-x q[29];
-cx q[0],q[15];
-cx q[1],q[17];
-cx q[2],q[19];
-cx q[3],q[21];
-cx q[4],q[23];
-cx q[5],q[25];
-cx q[6],q[27];
-cx q[7],q[29];
-cx q[8],q[16];
-cx q[8],q[17];
-cx q[9],q[18];
-cx q[9],q[19];
-cx q[10],q[20];
-cx q[10],q[21];
-cx q[11],q[22];
-cx q[11],q[23];
-cx q[12],q[24];
-cx q[12],q[25];
-cx q[13],q[26];
-cx q[13],q[27];
-cx q[14],q[28];
-cx q[14],q[29];
-h q[0];
-h q[1];
-h q[2];
-h q[3];
-h q[4];
-h q[5];
-h q[6];
-h q[7];
-h q[8];
-h q[9];
-h q[10];
-h q[11];
-h q[12];
-h q[13];
-h q[14];
-x q[0];
-x q[1];
-x q[2];
-x q[3];
-x q[4];
-x q[5];
-x q[6];
-x q[7];
-x q[8];
-x q[9];
-x q[10];
-x q[11];
-x q[12];
-x q[13];
-x q[14];
-reset q[31];
-reset q[32];
-reset q[33];
-reset q[34];
-reset q[35];
-reset q[36];
-reset q[37];
-reset q[38];
-reset q[39];
-reset q[40];
-reset q[41];
-reset q[42];
-reset q[43];
-reset q[44];
-ccx q[1],q[0],q[31];
-ccx q[31],q[2],q[32];
-ccx q[32],q[3],q[33];
-ccx q[33],q[4],q[34];
-ccx q[34],q[5],q[35];
-ccx q[35],q[6],q[36];
-ccx q[36],q[7],q[37];
-ccx q[37],q[8],q[38];
-ccx q[38],q[9],q[39];
-ccx q[39],q[10],q[40];
-ccx q[40],q[11],q[41];
-ccx q[41],q[12],q[42];
-ccx q[42],q[13],q[43];
-ccx q[43],q[14],q[44];
-z q[44];
-ccx q[43],q[14],q[44];
-ccx q[42],q[13],q[43];
-ccx q[41],q[12],q[42];
-ccx q[40],q[11],q[41];
-ccx q[39],q[10],q[40];
-ccx q[38],q[9],q[39];
-ccx q[37],q[8],q[38];
-ccx q[36],q[7],q[37];
-ccx q[35],q[6],q[36];
-ccx q[34],q[5],q[35];
-ccx q[33],q[4],q[34];
-ccx q[32],q[3],q[33];
-ccx q[31],q[2],q[32];
-ccx q[1],q[0],q[31];
-x q[0];
-x q[1];
-x q[2];
-x q[3];
-x q[4];
-x q[5];
-x q[6];
-x q[7];
-x q[8];
-x q[9];
-x q[10];
-x q[11];
-x q[12];
-x q[13];
-x q[14];
-h q[0];
-h q[1];
-h q[2];
-h q[3];
-h q[4];
-h q[5];
-h q[6];
-h q[7];
-h q[8];
-h q[9];
-h q[10];
-h q[11];
-h q[12];
-h q[13];
-h q[14];
-cx q[0],q[15];
-cx q[1],q[17];
-cx q[2],q[19];
-cx q[3],q[21];
-cx q[4],q[23];
-cx q[5],q[25];
-cx q[6],q[27];
-cx q[7],q[29];
-cx q[8],q[16];
-cx q[8],q[17];
-cx q[9],q[18];
-cx q[9],q[19];
-cx q[10],q[20];
-cx q[10],q[21];
-cx q[11],q[22];
-cx q[11],q[23];
-cx q[12],q[24];
-cx q[12],q[25];
-cx q[13],q[26];
-cx q[13],q[27];
-cx q[14],q[28];
-cx q[14],q[29];
-x q[15];
-x q[17];
-x q[18];
-x q[19];
-x q[20];
-x q[21];
-x q[22];
-x q[23];
-x q[24];
-x q[25];
-x q[26];
-x q[27];
-x q[28];
-x q[29];
-reset q[31];
-reset q[32];
-reset q[33];
-reset q[34];
-reset q[35];
-reset q[36];
-reset q[37];
-reset q[38];
-reset q[39];
-reset q[40];
-reset q[41];
-reset q[42];
-reset q[43];
-reset q[44];
-ccx q[16],q[15],q[31];
-ccx q[31],q[17],q[32];
-ccx q[32],q[18],q[33];
-ccx q[33],q[19],q[34];
-ccx q[34],q[20],q[35];
-ccx q[35],q[21],q[36];
-ccx q[36],q[22],q[37];
-ccx q[37],q[23],q[38];
-ccx q[38],q[24],q[39];
-ccx q[39],q[25],q[40];
-ccx q[40],q[26],q[41];
-ccx q[41],q[27],q[42];
-ccx q[42],q[28],q[43];
-ccx q[43],q[29],q[44];
-z q[44];
-ccx q[43],q[29],q[44];
-ccx q[42],q[28],q[43];
-ccx q[41],q[27],q[42];
-ccx q[40],q[26],q[41];
-ccx q[39],q[25],q[40];
-ccx q[38],q[24],q[39];
-ccx q[37],q[23],q[38];
-ccx q[36],q[22],q[37];
-ccx q[35],q[21],q[36];
-ccx q[34],q[20],q[35];
-ccx q[33],q[19],q[34];
-ccx q[32],q[18],q[33];
-ccx q[31],q[17],q[32];
-ccx q[16],q[15],q[31];
-x q[15];
-x q[17];
-x q[18];
-x q[19];
-x q[20];
-x q[21];
-x q[22];
-x q[23];
-x q[24];
-x q[25];
-x q[26];
-x q[27];
-x q[28];
-x q[29];
-cx q[0],q[15];
-cx q[1],q[17];
-cx q[2],q[19];
-cx q[3],q[21];
-cx q[4],q[23];
-cx q[5],q[25];
-cx q[6],q[27];
-cx q[7],q[29];
-cx q[8],q[16];
-cx q[8],q[17];
-cx q[9],q[18];
-cx q[9],q[19];
-cx q[10],q[20];
-cx q[10],q[21];
-cx q[11],q[22];
-cx q[11],q[23];
-cx q[12],q[24];
-cx q[12],q[25];
-cx q[13],q[26];
-cx q[13],q[27];
-cx q[14],q[28];
-cx q[14],q[29];
-h q[0];
-h q[1];
-h q[2];
-h q[3];
-h q[4];
-h q[5];
-h q[6];
-h q[7];
-h q[8];
-h q[9];
-h q[10];
-h q[11];
-h q[12];
-h q[13];
-h q[14];
-x q[0];
-x q[1];
-x q[2];
-x q[3];
-x q[4];
-x q[5];
-x q[6];
-x q[7];
-x q[8];
-x q[9];
-x q[10];
-x q[11];
-x q[12];
-x q[13];
-x q[14];
-reset q[31];
-reset q[32];
-reset q[33];
-reset q[34];
-reset q[35];
-reset q[36];
-reset q[37];
-reset q[38];
-reset q[39];
-reset q[40];
-reset q[41];
-reset q[42];
-reset q[43];
-reset q[44];
-ccx q[1],q[0],q[31];
-ccx q[31],q[2],q[32];
-ccx q[32],q[3],q[33];
-ccx q[33],q[4],q[34];
-ccx q[34],q[5],q[35];
-ccx q[35],q[6],q[36];
-ccx q[36],q[7],q[37];
-ccx q[37],q[8],q[38];
-ccx q[38],q[9],q[39];
-ccx q[39],q[10],q[40];
-ccx q[40],q[11],q[41];
-ccx q[41],q[12],q[42];
-ccx q[42],q[13],q[43];
-ccx q[43],q[14],q[44];
-z q[44];
-ccx q[43],q[14],q[44];
-ccx q[42],q[13],q[43];
-ccx q[41],q[12],q[42];
-ccx q[40],q[11],q[41];
-ccx q[39],q[10],q[40];
-ccx q[38],q[9],q[39];
-ccx q[37],q[8],q[38];
-ccx q[36],q[7],q[37];
-ccx q[35],q[6],q[36];
-ccx q[34],q[5],q[35];
-ccx q[33],q[4],q[34];
-ccx q[32],q[3],q[33];
-ccx q[31],q[2],q[32];
-ccx q[1],q[0],q[31];
-x q[0];
-x q[1];
-x q[2];
-x q[3];
-x q[4];
-x q[5];
-x q[6];
-x q[7];
-x q[8];
-x q[9];
-x q[10];
-x q[11];
-x q[12];
-x q[13];
-x q[14];
-h q[0];
-h q[1];
-h q[2];
-h q[3];
-h q[4];
-h q[5];
-h q[6];
-h q[7];
-h q[8];
-h q[9];
-h q[10];
-h q[11];
-h q[12];
-h q[13];
-h q[14];
-cx q[0],q[15];
-cx q[1],q[17];
-cx q[2],q[19];
-cx q[3],q[21];
-cx q[4],q[23];
-cx q[5],q[25];
-cx q[6],q[27];
-cx q[7],q[29];
-cx q[8],q[16];
-cx q[8],q[17];
-cx q[9],q[18];
-cx q[9],q[19];
-cx q[10],q[20];
-cx q[10],q[21];
-cx q[11],q[22];
-cx q[11],q[23];
-cx q[12],q[24];
-cx q[12],q[25];
-cx q[13],q[26];
-cx q[13],q[27];
-cx q[14],q[28];
-cx q[14],q[29];
-x q[15];
-x q[17];
-x q[18];
-x q[19];
-x q[20];
-x q[21];
-x q[22];
-x q[23];
-x q[24];
-x q[25];
-x q[26];
-x q[27];
-x q[28];
-x q[29];
-reset q[31];
-reset q[32];
-reset q[33];
-reset q[34];
-reset q[35];
-reset q[36];
-reset q[37];
-reset q[38];
-reset q[39];
-reset q[40];
-reset q[41];
-reset q[42];
-reset q[43];
-reset q[44];
-ccx q[16],q[15],q[31];
-ccx q[31],q[17],q[32];
-ccx q[32],q[18],q[33];
-ccx q[33],q[19],q[34];
-ccx q[34],q[20],q[35];
-ccx q[35],q[21],q[36];
-ccx q[36],q[22],q[37];
-ccx q[37],q[23],q[38];
-ccx q[38],q[24],q[39];
-ccx q[39],q[25],q[40];
-ccx q[40],q[26],q[41];
-ccx q[41],q[27],q[42];
-ccx q[42],q[28],q[43];
-ccx q[43],q[29],q[44];
-z q[44];
-ccx q[43],q[29],q[44];
-ccx q[42],q[28],q[43];
-ccx q[41],q[27],q[42];
-ccx q[40],q[26],q[41];
-ccx q[39],q[25],q[40];
-ccx q[38],q[24],q[39];
-ccx q[37],q[23],q[38];
-ccx q[36],q[22],q[37];
-ccx q[35],q[21],q[36];
-ccx q[34],q[20],q[35];
-ccx q[33],q[19],q[34];
-ccx q[32],q[18],q[33];
-ccx q[31],q[17],q[32];
-ccx q[16],q[15],q[31];
-x q[15];
-x q[17];
-x q[18];
-x q[19];
-x q[20];
-x q[21];
-x q[22];
-x q[23];
-x q[24];
-x q[25];
-x q[26];
-x q[27];
-x q[28];
-x q[29];
-cx q[0],q[15];
-cx q[1],q[17];
-cx q[2],q[19];
-cx q[3],q[21];
-cx q[4],q[23];
-cx q[5],q[25];
-cx q[6],q[27];
-cx q[7],q[29];
-cx q[8],q[16];
-cx q[8],q[17];
-cx q[9],q[18];
-cx q[9],q[19];
-cx q[10],q[20];
-cx q[10],q[21];
-cx q[11],q[22];
-cx q[11],q[23];
-cx q[12],q[24];
-cx q[12],q[25];
-cx q[13],q[26];
-cx q[13],q[27];
-cx q[14],q[28];
-cx q[14],q[29];
-h q[0];
-h q[1];
-h q[2];
-h q[3];
-h q[4];
-h q[5];
-h q[6];
-h q[7];
-h q[8];
-h q[9];
-h q[10];
-h q[11];
-h q[12];
-h q[13];
-h q[14];
-x q[0];
-x q[1];
-x q[2];
-x q[3];
-x q[4];
-x q[5];
-x q[6];
-x q[7];
-x q[8];
-x q[9];
-x q[10];
-x q[11];
-x q[12];
-x q[13];
-x q[14];
-reset q[31];
-reset q[32];
-reset q[33];
-reset q[34];
-reset q[35];
-reset q[36];
-reset q[37];
-reset q[38];
-reset q[39];
-reset q[40];
-reset q[41];
-reset q[42];
-reset q[43];
-reset q[44];
-ccx q[1],q[0],q[31];
-ccx q[31],q[2],q[32];
-ccx q[32],q[3],q[33];
-ccx q[33],q[4],q[34];
-ccx q[34],q[5],q[35];
-ccx q[35],q[6],q[36];
-ccx q[36],q[7],q[37];
-ccx q[37],q[8],q[38];
-ccx q[38],q[9],q[39];
-ccx q[39],q[10],q[40];
-ccx q[40],q[11],q[41];
-ccx q[41],q[12],q[42];
-ccx q[42],q[13],q[43];
-ccx q[43],q[14],q[44];
-z q[44];
-ccx q[43],q[14],q[44];
-ccx q[42],q[13],q[43];
-ccx q[41],q[12],q[42];
-ccx q[40],q[11],q[41];
-ccx q[39],q[10],q[40];
-ccx q[38],q[9],q[39];
-ccx q[37],q[8],q[38];
-ccx q[36],q[7],q[37];
-ccx q[35],q[6],q[36];
-ccx q[34],q[5],q[35];
-ccx q[33],q[4],q[34];
-ccx q[32],q[3],q[33];
-ccx q[31],q[2],q[32];
-ccx q[1],q[0],q[31];
-x q[0];
-x q[1];
-x q[2];
-x q[3];
-x q[4];
-x q[5];
-x q[6];
-x q[7];
-x q[8];
-x q[9];
-x q[10];
-x q[11];
-x q[12];
-x q[13];
-x q[14];
-h q[0];
-h q[1];
-h q[2];
-h q[3];
-h q[4];
-h q[5];
-h q[6];
-h q[7];
-h q[8];
-h q[9];
-h q[10];
-h q[11];
-h q[12];
-h q[13];
-h q[14];
-cx q[0],q[15];
-cx q[1],q[17];
-cx q[2],q[19];
-cx q[3],q[21];
-cx q[4],q[23];
-cx q[5],q[25];
-cx q[6],q[27];
-cx q[7],q[29];
-cx q[8],q[16];
-cx q[8],q[17];
-cx q[9],q[18];
-cx q[9],q[19];
-cx q[10],q[20];
-cx q[10],q[21];
-cx q[11],q[22];
-cx q[11],q[23];
-cx q[12],q[24];
-cx q[12],q[25];
-cx q[13],q[26];
-cx q[13],q[27];
-cx q[14],q[28];
-cx q[14],q[29];
-x q[15];
-x q[17];
-x q[18];
-x q[19];
-x q[20];
-x q[21];
-x q[22];
-x q[23];
-x q[24];
-x q[25];
-x q[26];
-x q[27];
-x q[28];
-x q[29];
-reset q[31];
-reset q[32];
-reset q[33];
-reset q[34];
-reset q[35];
-reset q[36];
-reset q[37];
-reset q[38];
-reset q[39];
-reset q[40];
-reset q[41];
-reset q[42];
-reset q[43];
-reset q[44];
-ccx q[16],q[15],q[31];
-ccx q[31],q[17],q[32];
-ccx q[32],q[18],q[33];
-ccx q[33],q[19],q[34];
-ccx q[34],q[20],q[35];
-ccx q[35],q[21],q[36];
-ccx q[36],q[22],q[37];
-ccx q[37],q[23],q[38];
-ccx q[38],q[24],q[39];
-ccx q[39],q[25],q[40];
-ccx q[40],q[26],q[41];
-ccx q[41],q[27],q[42];
-ccx q[42],q[28],q[43];
-ccx q[43],q[29],q[44];
-z q[44];
-ccx q[43],q[29],q[44];
-ccx q[42],q[28],q[43];
-ccx q[41],q[27],q[42];
-ccx q[40],q[26],q[41];
-ccx q[39],q[25],q[40];
-ccx q[38],q[24],q[39];
-ccx q[37],q[23],q[38];
-ccx q[36],q[22],q[37];
-ccx q[35],q[21],q[36];
-ccx q[34],q[20],q[35];
-ccx q[33],q[19],q[34];
-ccx q[32],q[18],q[33];
-ccx q[31],q[17],q[32];
-ccx q[16],q[15],q[31];
-x q[15];
-x q[17];
-x q[18];
-x q[19];
-x q[20];
-x q[21];
-x q[22];
-x q[23];
-x q[24];
-x q[25];
-x q[26];
-x q[27];
-x q[28];
-x q[29];
-cx q[0],q[15];
-cx q[1],q[17];
-cx q[2],q[19];
-cx q[3],q[21];
-cx q[4],q[23];
-cx q[5],q[25];
-cx q[6],q[27];
-cx q[7],q[29];
-cx q[8],q[16];
-cx q[8],q[17];
-cx q[9],q[18];
-cx q[9],q[19];
-cx q[10],q[20];
-cx q[10],q[21];
-cx q[11],q[22];
-cx q[11],q[23];
-cx q[12],q[24];
-cx q[12],q[25];
-cx q[13],q[26];
-cx q[13],q[27];
-cx q[14],q[28];
-cx q[14],q[29];
-h q[0];
-h q[1];
-h q[2];
-h q[3];
-h q[4];
-h q[5];
-h q[6];
-h q[7];
-h q[8];
-h q[9];
-h q[10];
-h q[11];
-h q[12];
-h q[13];
-h q[14];
-x q[0];
-x q[1];
-x q[2];
-x q[3];
-x q[4];
-x q[5];
-x q[6];
-x q[7];
-x q[8];
-x q[9];
-x q[10];
-x q[11];
-x q[12];
-x q[13];
-x q[14];
-reset q[31];
-reset q[32];
-reset q[33];
-reset q[34];
-reset q[35];
-reset q[36];
-reset q[37];
-reset q[38];
-reset q[39];
-reset q[40];
-reset q[41];
-reset q[42];
-reset q[43];
-reset q[44];
-ccx q[1],q[0],q[31];
-ccx q[31],q[2],q[32];
-ccx q[32],q[3],q[33];
-ccx q[33],q[4],q[34];
-ccx q[34],q[5],q[35];
-ccx q[35],q[6],q[36];
-ccx q[36],q[7],q[37];
-ccx q[37],q[8],q[38];
-ccx q[38],q[9],q[39];
-ccx q[39],q[10],q[40];
-ccx q[40],q[11],q[41];
-ccx q[41],q[12],q[42];
-ccx q[42],q[13],q[43];
-ccx q[43],q[14],q[44];
-z q[44];
-ccx q[43],q[14],q[44];
-ccx q[42],q[13],q[43];
-ccx q[41],q[12],q[42];
-ccx q[40],q[11],q[41];
-ccx q[39],q[10],q[40];
-ccx q[38],q[9],q[39];
-ccx q[37],q[8],q[38];
-ccx q[36],q[7],q[37];
-ccx q[35],q[6],q[36];
-ccx q[34],q[5],q[35];
-ccx q[33],q[4],q[34];
-ccx q[32],q[3],q[33];
-ccx q[31],q[2],q[32];
-ccx q[1],q[0],q[31];
-x q[0];
-x q[1];
-x q[2];
-x q[3];
-x q[4];
-x q[5];
-x q[6];
-x q[7];
-x q[8];
-x q[9];
-x q[10];
-x q[11];
-x q[12];
-x q[13];
-x q[14];
-h q[0];
-h q[1];
-h q[2];
-h q[3];
-h q[4];
-h q[5];
-h q[6];
-h q[7];
-h q[8];
-h q[9];
-h q[10];
-h q[11];
-h q[12];
-h q[13];
-h q[14];
-cx q[0],q[15];
-cx q[1],q[17];
-cx q[2],q[19];
-cx q[3],q[21];
-cx q[4],q[23];
-cx q[5],q[25];
-cx q[6],q[27];
-cx q[7],q[29];
-cx q[8],q[16];
-cx q[8],q[17];
-cx q[9],q[18];
-cx q[9],q[19];
-cx q[10],q[20];
-cx q[10],q[21];
-cx q[11],q[22];
-cx q[11],q[23];
-cx q[12],q[24];
-cx q[12],q[25];
-cx q[13],q[26];
-cx q[13],q[27];
-cx q[14],q[28];
-cx q[14],q[29];
-x q[15];
-x q[17];
-x q[18];
-x q[19];
-x q[20];
-x q[21];
-x q[22];
-x q[23];
-x q[24];
-x q[25];
-x q[26];
-x q[27];
-x q[28];
-x q[29];
-reset q[31];
-reset q[32];
-reset q[33];
-reset q[34];
-reset q[35];
-reset q[36];
-reset q[37];
-reset q[38];
-reset q[39];
-reset q[40];
-reset q[41];
-reset q[42];
-reset q[43];
-reset q[44];
-ccx q[16],q[15],q[31];
-ccx q[31],q[17],q[32];
-ccx q[32],q[18],q[33];
-ccx q[33],q[19],q[34];
-ccx q[34],q[20],q[35];
-ccx q[35],q[21],q[36];
-ccx q[36],q[22],q[37];
-ccx q[37],q[23],q[38];
-ccx q[38],q[24],q[39];
-ccx q[39],q[25],q[40];
-ccx q[40],q[26],q[41];
-ccx q[41],q[27],q[42];
-ccx q[42],q[28],q[43];
-ccx q[43],q[29],q[44];
-z q[44];
-ccx q[43],q[29],q[44];
-ccx q[42],q[28],q[43];
-ccx q[41],q[27],q[42];
-ccx q[40],q[26],q[41];
-ccx q[39],q[25],q[40];
-ccx q[38],q[24],q[39];
-ccx q[37],q[23],q[38];
-ccx q[36],q[22],q[37];
-ccx q[35],q[21],q[36];
-ccx q[34],q[20],q[35];
-ccx q[33],q[19],q[34];
-ccx q[32],q[18],q[33];
-ccx q[31],q[17],q[32];
-ccx q[16],q[15],q[31];
-x q[15];
-x q[17];
-x q[18];
-x q[19];
-x q[20];
-x q[21];
-x q[22];
-x q[23];
-x q[24];
-x q[25];
-x q[26];
-x q[27];
-x q[28];
-x q[29];
-cx q[0],q[15];
-cx q[1],q[17];
-cx q[2],q[19];
-cx q[3],q[21];
-cx q[4],q[23];
-cx q[5],q[25];
-cx q[6],q[27];
-cx q[7],q[29];
-cx q[8],q[16];
-cx q[8],q[17];
-cx q[9],q[18];
-cx q[9],q[19];
-cx q[10],q[20];
-cx q[10],q[21];
-cx q[11],q[22];
-cx q[11],q[23];
-cx q[12],q[24];
-cx q[12],q[25];
-cx q[13],q[26];
-cx q[13],q[27];
-cx q[14],q[28];
-cx q[14],q[29];
-h q[0];
-h q[1];
-h q[2];
-h q[3];
-h q[4];
-h q[5];
-h q[6];
-h q[7];
-h q[8];
-h q[9];
-h q[10];
-h q[11];
-h q[12];
-h q[13];
-h q[14];
-x q[0];
-x q[1];
-x q[2];
-x q[3];
-x q[4];
-x q[5];
-x q[6];
-x q[7];
-x q[8];
-x q[9];
-x q[10];
-x q[11];
-x q[12];
-x q[13];
-x q[14];
-reset q[31];
-reset q[32];
-reset q[33];
-reset q[34];
-reset q[35];
-reset q[36];
-reset q[37];
-reset q[38];
-reset q[39];
-reset q[40];
-reset q[41];
-reset q[42];
-reset q[43];
-reset q[44];
-ccx q[1],q[0],q[31];
-ccx q[31],q[2],q[32];
-ccx q[32],q[3],q[33];
-ccx q[33],q[4],q[34];
-ccx q[34],q[5],q[35];
-ccx q[35],q[6],q[36];
-ccx q[36],q[7],q[37];
-ccx q[37],q[8],q[38];
-ccx q[38],q[9],q[39];
-ccx q[39],q[10],q[40];
-ccx q[40],q[11],q[41];
-ccx q[41],q[12],q[42];
-ccx q[42],q[13],q[43];
-ccx q[43],q[14],q[44];
-z q[44];
-ccx q[43],q[14],q[44];
-ccx q[42],q[13],q[43];
-ccx q[41],q[12],q[42];
-ccx q[40],q[11],q[41];
-ccx q[39],q[10],q[40];
-ccx q[38],q[9],q[39];
-ccx q[37],q[8],q[38];
-ccx q[36],q[7],q[37];
-ccx q[35],q[6],q[36];
-ccx q[34],q[5],q[35];
-ccx q[33],q[4],q[34];
-ccx q[32],q[3],q[33];
-ccx q[31],q[2],q[32];
-ccx q[1],q[0],q[31];
-x q[0];
-x q[1];
-x q[2];
-x q[3];
-x q[4];
-x q[5];
-x q[6];
-x q[7];
-x q[8];
-x q[9];
-x q[10];
-x q[11];
-x q[12];
-x q[13];
-x q[14];
-h q[0];
-h q[1];
-h q[2];
-h q[3];
-h q[4];
-h q[5];
-h q[6];
-h q[7];
-h q[8];
-h q[9];
-h q[10];
-h q[11];
-h q[12];
-h q[13];
-h q[14];
-cx q[0],q[15];
-cx q[1],q[17];
-cx q[2],q[19];
-cx q[3],q[21];
-cx q[4],q[23];
-cx q[5],q[25];
-cx q[6],q[27];
-cx q[7],q[29];
-cx q[8],q[16];
-cx q[8],q[17];
-cx q[9],q[18];
-cx q[9],q[19];
-cx q[10],q[20];
-cx q[10],q[21];
-cx q[11],q[22];
-cx q[11],q[23];
-cx q[12],q[24];
-cx q[12],q[25];
-cx q[13],q[26];
-cx q[13],q[27];
-cx q[14],q[28];
-cx q[14],q[29];
-x q[15];
-x q[17];
-x q[18];
-x q[19];
-x q[20];
-x q[21];
-x q[22];
-x q[23];
-x q[24];
-x q[25];
-x q[26];
-x q[27];
-x q[28];
-x q[29];
-reset q[31];
-reset q[32];
-reset q[33];
-reset q[34];
-reset q[35];
-reset q[36];
-reset q[37];
-reset q[38];
-reset q[39];
-reset q[40];
-reset q[41];
-reset q[42];
-reset q[43];
-reset q[44];
-ccx q[16],q[15],q[31];
-ccx q[31],q[17],q[32];
-ccx q[32],q[18],q[33];
-ccx q[33],q[19],q[34];
-ccx q[34],q[20],q[35];
-ccx q[35],q[21],q[36];
-ccx q[36],q[22],q[37];
-ccx q[37],q[23],q[38];
-ccx q[38],q[24],q[39];
-ccx q[39],q[25],q[40];
-ccx q[40],q[26],q[41];
-ccx q[41],q[27],q[42];
-ccx q[42],q[28],q[43];
-ccx q[43],q[29],q[44];
-z q[44];
-ccx q[43],q[29],q[44];
-ccx q[42],q[28],q[43];
-ccx q[41],q[27],q[42];
-ccx q[40],q[26],q[41];
-ccx q[39],q[25],q[40];
-ccx q[38],q[24],q[39];
-ccx q[37],q[23],q[38];
-ccx q[36],q[22],q[37];
-ccx q[35],q[21],q[36];
-ccx q[34],q[20],q[35];
-ccx q[33],q[19],q[34];
-ccx q[32],q[18],q[33];
-ccx q[31],q[17],q[32];
-ccx q[16],q[15],q[31];
-x q[15];
-x q[17];
-x q[18];
-x q[19];
-x q[20];
-x q[21];
-x q[22];
-x q[23];
-x q[24];
-x q[25];
-x q[26];
-x q[27];
-x q[28];
-x q[29];
-cx q[0],q[15];
-cx q[1],q[17];
-cx q[2],q[19];
-cx q[3],q[21];
-cx q[4],q[23];
-cx q[5],q[25];
-cx q[6],q[27];
-cx q[7],q[29];
-cx q[8],q[16];
-cx q[8],q[17];
-cx q[9],q[18];
-cx q[9],q[19];
-cx q[10],q[20];
-cx q[10],q[21];
-cx q[11],q[22];
-cx q[11],q[23];
-cx q[12],q[24];
-cx q[12],q[25];
-cx q[13],q[26];
-cx q[13],q[27];
-cx q[14],q[28];
-cx q[14],q[29];
-h q[0];
-h q[1];
-h q[2];
-h q[3];
-h q[4];
-h q[5];
-h q[6];
-h q[7];
-h q[8];
-h q[9];
-h q[10];
-h q[11];
-h q[12];
-h q[13];
-h q[14];
-x q[0];
-x q[1];
-x q[2];
-x q[3];
-x q[4];
-x q[5];
-x q[6];
-x q[7];
-x q[8];
-x q[9];
-x q[10];
-x q[11];
-x q[12];
-x q[13];
-x q[14];
-reset q[31];
-reset q[32];
-reset q[33];
-reset q[34];
-reset q[35];
-reset q[36];
-reset q[37];
-reset q[38];
-reset q[39];
-reset q[40];
-reset q[41];
-reset q[42];
-reset q[43];
-reset q[44];
-ccx q[1],q[0],q[31];
-ccx q[31],q[2],q[32];
-ccx q[32],q[3],q[33];
-ccx q[33],q[4],q[34];
-ccx q[34],q[5],q[35];
-ccx q[35],q[6],q[36];
-ccx q[36],q[7],q[37];
-ccx q[37],q[8],q[38];
-ccx q[38],q[9],q[39];
-ccx q[39],q[10],q[40];
-ccx q[40],q[11],q[41];
-ccx q[41],q[12],q[42];
-ccx q[42],q[13],q[43];
-ccx q[43],q[14],q[44];
-z q[44];
-ccx q[43],q[14],q[44];
-ccx q[42],q[13],q[43];
-ccx q[41],q[12],q[42];
-ccx q[40],q[11],q[41];
-ccx q[39],q[10],q[40];
-ccx q[38],q[9],q[39];
-ccx q[37],q[8],q[38];
-ccx q[36],q[7],q[37];
-ccx q[35],q[6],q[36];
-ccx q[34],q[5],q[35];
-ccx q[33],q[4],q[34];
-ccx q[32],q[3],q[33];
-ccx q[31],q[2],q[32];
-ccx q[1],q[0],q[31];
-x q[0];
-x q[1];
-x q[2];
-x q[3];
-x q[4];
-x q[5];
-x q[6];
-x q[7];
-x q[8];
-x q[9];
-x q[10];
-x q[11];
-x q[12];
-x q[13];
-x q[14];
-h q[0];
-h q[1];
-h q[2];
-h q[3];
-h q[4];
-h q[5];
-h q[6];
-h q[7];
-h q[8];
-h q[9];
-h q[10];
-h q[11];
-h q[12];
-h q[13];
-h q[14];
-cx q[0],q[15];
-cx q[1],q[17];
-cx q[2],q[19];
-cx q[3],q[21];
-cx q[4],q[23];
-cx q[5],q[25];
-cx q[6],q[27];
-cx q[7],q[29];
-cx q[8],q[16];
-cx q[8],q[17];
-cx q[9],q[18];
-cx q[9],q[19];
-cx q[10],q[20];
-cx q[10],q[21];
-cx q[11],q[22];
-cx q[11],q[23];
-cx q[12],q[24];
-cx q[12],q[25];
-cx q[13],q[26];
-cx q[13],q[27];
-cx q[14],q[28];
-cx q[14],q[29];
-x q[15];
-x q[17];
-x q[18];
-x q[19];
-x q[20];
-x q[21];
-x q[22];
-x q[23];
-x q[24];
-x q[25];
-x q[26];
-x q[27];
-x q[28];
-x q[29];
-reset q[31];
-reset q[32];
-reset q[33];
-reset q[34];
-reset q[35];
-reset q[36];
-reset q[37];
-reset q[38];
-reset q[39];
-reset q[40];
-reset q[41];
-reset q[42];
-reset q[43];
-reset q[44];
-ccx q[16],q[15],q[31];
-ccx q[31],q[17],q[32];
-ccx q[32],q[18],q[33];
-ccx q[33],q[19],q[34];
-ccx q[34],q[20],q[35];
-ccx q[35],q[21],q[36];
-ccx q[36],q[22],q[37];
-ccx q[37],q[23],q[38];
-ccx q[38],q[24],q[39];
-ccx q[39],q[25],q[40];
-ccx q[40],q[26],q[41];
-ccx q[41],q[27],q[42];
-ccx q[42],q[28],q[43];
-ccx q[43],q[29],q[44];
-z q[44];
-ccx q[43],q[29],q[44];
-ccx q[42],q[28],q[43];
-ccx q[41],q[27],q[42];
-ccx q[40],q[26],q[41];
-ccx q[39],q[25],q[40];
-ccx q[38],q[24],q[39];
-ccx q[37],q[23],q[38];
-ccx q[36],q[22],q[37];
-ccx q[35],q[21],q[36];
-ccx q[34],q[20],q[35];
-ccx q[33],q[19],q[34];
-ccx q[32],q[18],q[33];
-ccx q[31],q[17],q[32];
-ccx q[16],q[15],q[31];
-x q[15];
-x q[17];
-x q[18];
-x q[19];
-x q[20];
-x q[21];
-x q[22];
-x q[23];
-x q[24];
-x q[25];
-x q[26];
-x q[27];
-x q[28];
-x q[29];
-cx q[0],q[15];
-cx q[1],q[17];
-cx q[2],q[19];
-cx q[3],q[21];
-cx q[4],q[23];
-cx q[5],q[25];
-cx q[6],q[27];
-cx q[7],q[29];
-cx q[8],q[16];
-cx q[8],q[17];
-cx q[9],q[18];
-cx q[9],q[19];
-cx q[10],q[20];
-cx q[10],q[21];
-cx q[11],q[22];
-cx q[11],q[23];
-cx q[12],q[24];
-cx q[12],q[25];
-cx q[13],q[26];
-cx q[13],q[27];
-cx q[14],q[28];
-cx q[14],q[29];
-h q[0];
-h q[1];
-h q[2];
-h q[3];
-h q[4];
-h q[5];
-h q[6];
-h q[7];
-h q[8];
-h q[9];
-h q[10];
-h q[11];
-h q[12];
-h q[13];
-h q[14];
-x q[0];
-x q[1];
-x q[2];
-x q[3];
-x q[4];
-x q[5];
-x q[6];
-x q[7];
-x q[8];
-x q[9];
-x q[10];
-x q[11];
-x q[12];
-x q[13];
-x q[14];
-reset q[31];
-reset q[32];
-reset q[33];
-reset q[34];
-reset q[35];
-reset q[36];
-reset q[37];
-reset q[38];
-reset q[39];
-reset q[40];
-reset q[41];
-reset q[42];
-reset q[43];
-reset q[44];
-ccx q[1],q[0],q[31];
-ccx q[31],q[2],q[32];
-ccx q[32],q[3],q[33];
-ccx q[33],q[4],q[34];
-ccx q[34],q[5],q[35];
-ccx q[35],q[6],q[36];
-ccx q[36],q[7],q[37];
-ccx q[37],q[8],q[38];
-ccx q[38],q[9],q[39];
-ccx q[39],q[10],q[40];
-ccx q[40],q[11],q[41];
-ccx q[41],q[12],q[42];
-ccx q[42],q[13],q[43];
-ccx q[43],q[14],q[44];
-z q[44];
-ccx q[43],q[14],q[44];
-ccx q[42],q[13],q[43];
-ccx q[41],q[12],q[42];
-ccx q[40],q[11],q[41];
-ccx q[39],q[10],q[40];
-ccx q[38],q[9],q[39];
-ccx q[37],q[8],q[38];
-ccx q[36],q[7],q[37];
-ccx q[35],q[6],q[36];
-ccx q[34],q[5],q[35];
-ccx q[33],q[4],q[34];
-ccx q[32],q[3],q[33];
-ccx q[31],q[2],q[32];
-ccx q[1],q[0],q[31];
-x q[0];
-x q[1];
-x q[2];
-x q[3];
-x q[4];
-x q[5];
-x q[6];
-x q[7];
-x q[8];
-x q[9];
-x q[10];
-x q[11];
-x q[12];
-x q[13];
-x q[14];
-h q[0];
-h q[1];
-h q[2];
-h q[3];
-h q[4];
-h q[5];
-h q[6];
-h q[7];
-h q[8];
-h q[9];
-h q[10];
-h q[11];
-h q[12];
-h q[13];
-h q[14];
-cx q[0],q[15];
-cx q[1],q[17];
-cx q[2],q[19];
-cx q[3],q[21];
-cx q[4],q[23];
-cx q[5],q[25];
-cx q[6],q[27];
-cx q[7],q[29];
-cx q[8],q[16];
-cx q[8],q[17];
-cx q[9],q[18];
-cx q[9],q[19];
-cx q[10],q[20];
-cx q[10],q[21];
-cx q[11],q[22];
-cx q[11],q[23];
-cx q[12],q[24];
-cx q[12],q[25];
-cx q[13],q[26];
-cx q[13],q[27];
-cx q[14],q[28];
-cx q[14],q[29];
-x q[15];
-x q[17];
-x q[18];
-x q[19];
-x q[20];
-x q[21];
-x q[22];
-x q[23];
-x q[24];
-x q[25];
-x q[26];
-x q[27];
-x q[28];
-x q[29];
-reset q[31];
-reset q[32];
-reset q[33];
-reset q[34];
-reset q[35];
-reset q[36];
-reset q[37];
-reset q[38];
-reset q[39];
-reset q[40];
-reset q[41];
-reset q[42];
-reset q[43];
-reset q[44];
-ccx q[16],q[15],q[31];
-ccx q[31],q[17],q[32];
-ccx q[32],q[18],q[33];
-ccx q[33],q[19],q[34];
-ccx q[34],q[20],q[35];
-ccx q[35],q[21],q[36];
-ccx q[36],q[22],q[37];
-ccx q[37],q[23],q[38];
-ccx q[38],q[24],q[39];
-ccx q[39],q[25],q[40];
-ccx q[40],q[26],q[41];
-ccx q[41],q[27],q[42];
-ccx q[42],q[28],q[43];
-ccx q[43],q[29],q[44];
-z q[44];
-ccx q[43],q[29],q[44];
-ccx q[42],q[28],q[43];
-ccx q[41],q[27],q[42];
-ccx q[40],q[26],q[41];
-ccx q[39],q[25],q[40];
-ccx q[38],q[24],q[39];
-ccx q[37],q[23],q[38];
-ccx q[36],q[22],q[37];
-ccx q[35],q[21],q[36];
-ccx q[34],q[20],q[35];
-ccx q[33],q[19],q[34];
-ccx q[32],q[18],q[33];
-ccx q[31],q[17],q[32];
-ccx q[16],q[15],q[31];
-x q[15];
-x q[17];
-x q[18];
-x q[19];
-x q[20];
-x q[21];
-x q[22];
-x q[23];
-x q[24];
-x q[25];
-x q[26];
-x q[27];
-x q[28];
-x q[29];
-cx q[0],q[15];
-cx q[1],q[17];
-cx q[2],q[19];
-cx q[3],q[21];
-cx q[4],q[23];
-cx q[5],q[25];
-cx q[6],q[27];
-cx q[7],q[29];
-cx q[8],q[16];
-cx q[8],q[17];
-cx q[9],q[18];
-cx q[9],q[19];
-cx q[10],q[20];
-cx q[10],q[21];
-cx q[11],q[22];
-cx q[11],q[23];
-cx q[12],q[24];
-cx q[12],q[25];
-cx q[13],q[26];
-cx q[13],q[27];
-cx q[14],q[28];
-cx q[14],q[29];
-h q[0];
-h q[1];
-h q[2];
-h q[3];
-h q[4];
-h q[5];
-h q[6];
-h q[7];
-h q[8];
-h q[9];
-h q[10];
-h q[11];
-h q[12];
-h q[13];
-h q[14];
-x q[0];
-x q[1];
-x q[2];
-x q[3];
-x q[4];
-x q[5];
-x q[6];
-x q[7];
-x q[8];
-x q[9];
-x q[10];
-x q[11];
-x q[12];
-x q[13];
-x q[14];
-reset q[31];
-reset q[32];
-reset q[33];
-reset q[34];
-reset q[35];
-reset q[36];
-reset q[37];
-reset q[38];
-reset q[39];
-reset q[40];
-reset q[41];
-reset q[42];
-reset q[43];
-reset q[44];
-ccx q[1],q[0],q[31];
-ccx q[31],q[2],q[32];
-ccx q[32],q[3],q[33];
-ccx q[33],q[4],q[34];
-ccx q[34],q[5],q[35];
-ccx q[35],q[6],q[36];
-ccx q[36],q[7],q[37];
-ccx q[37],q[8],q[38];
-ccx q[38],q[9],q[39];
-ccx q[39],q[10],q[40];
-ccx q[40],q[11],q[41];
-ccx q[41],q[12],q[42];
-ccx q[42],q[13],q[43];
-ccx q[43],q[14],q[44];
-z q[44];
-ccx q[43],q[14],q[44];
-ccx q[42],q[13],q[43];
-ccx q[41],q[12],q[42];
-ccx q[40],q[11],q[41];
-ccx q[39],q[10],q[40];
-ccx q[38],q[9],q[39];
-ccx q[37],q[8],q[38];
-ccx q[36],q[7],q[37];
-ccx q[35],q[6],q[36];
-ccx q[34],q[5],q[35];
-ccx q[33],q[4],q[34];
-ccx q[32],q[3],q[33];
-ccx q[31],q[2],q[32];
-ccx q[1],q[0],q[31];
-x q[0];
-x q[1];
-x q[2];
-x q[3];
-x q[4];
-x q[5];
-x q[6];
-x q[7];
-x q[8];
-x q[9];
-x q[10];
-x q[11];
-x q[12];
-x q[13];
-x q[14];
-h q[0];
-h q[1];
-h q[2];
-h q[3];
-h q[4];
-h q[5];
-h q[6];
-h q[7];
-h q[8];
-h q[9];
-h q[10];
-h q[11];
-h q[12];
-h q[13];
-h q[14];
-cx q[0],q[15];
-cx q[1],q[17];
-cx q[2],q[19];
-cx q[3],q[21];
-cx q[4],q[23];
-cx q[5],q[25];
-cx q[6],q[27];
-cx q[7],q[29];
-cx q[8],q[16];
-cx q[8],q[17];
-cx q[9],q[18];
-cx q[9],q[19];
-cx q[10],q[20];
-cx q[10],q[21];
-cx q[11],q[22];
-cx q[11],q[23];
-cx q[12],q[24];
-cx q[12],q[25];
-cx q[13],q[26];
-cx q[13],q[27];
-cx q[14],q[28];
-cx q[14],q[29];
-x q[15];
-x q[17];
-x q[18];
-x q[19];
-x q[20];
-x q[21];
-x q[22];
-x q[23];
-x q[24];
-x q[25];
-x q[26];
-x q[27];
-x q[28];
-x q[29];
-reset q[31];
-reset q[32];
-reset q[33];
-reset q[34];
-reset q[35];
-reset q[36];
-reset q[37];
-reset q[38];
-reset q[39];
-reset q[40];
-reset q[41];
-reset q[42];
-reset q[43];
-reset q[44];
-ccx q[16],q[15],q[31];
-ccx q[31],q[17],q[32];
-ccx q[32],q[18],q[33];
-ccx q[33],q[19],q[34];
-ccx q[34],q[20],q[35];
-ccx q[35],q[21],q[36];
-ccx q[36],q[22],q[37];
-ccx q[37],q[23],q[38];
-ccx q[38],q[24],q[39];
-ccx q[39],q[25],q[40];
-ccx q[40],q[26],q[41];
-ccx q[41],q[27],q[42];
-ccx q[42],q[28],q[43];
-ccx q[43],q[29],q[44];
-z q[44];
-ccx q[43],q[29],q[44];
-ccx q[42],q[28],q[43];
-ccx q[41],q[27],q[42];
-ccx q[40],q[26],q[41];
-ccx q[39],q[25],q[40];
-ccx q[38],q[24],q[39];
-ccx q[37],q[23],q[38];
-ccx q[36],q[22],q[37];
-ccx q[35],q[21],q[36];
-ccx q[34],q[20],q[35];
-ccx q[33],q[19],q[34];
-ccx q[32],q[18],q[33];
-ccx q[31],q[17],q[32];
-ccx q[16],q[15],q[31];
-x q[15];
-x q[17];
-x q[18];
-x q[19];
-x q[20];
-x q[21];
-x q[22];
-x q[23];
-x q[24];
-x q[25];
-x q[26];
-x q[27];
-x q[28];
-x q[29];
-cx q[0],q[15];
-cx q[1],q[17];
-cx q[2],q[19];
-cx q[3],q[21];
-cx q[4],q[23];
-cx q[5],q[25];
-cx q[6],q[27];
-cx q[7],q[29];
-cx q[8],q[16];
-cx q[8],q[17];
-cx q[9],q[18];
-cx q[9],q[19];
-cx q[10],q[20];
-cx q[10],q[21];
-cx q[11],q[22];
-cx q[11],q[23];
-cx q[12],q[24];
-cx q[12],q[25];
-cx q[13],q[26];
-cx q[13],q[27];
-cx q[14],q[28];
-cx q[14],q[29];
-h q[0];
-h q[1];
-h q[2];
-h q[3];
-h q[4];
-h q[5];
-h q[6];
-h q[7];
-h q[8];
-h q[9];
-h q[10];
-h q[11];
-h q[12];
-h q[13];
-h q[14];
-x q[0];
-x q[1];
-x q[2];
-x q[3];
-x q[4];
-x q[5];
-x q[6];
-x q[7];
-x q[8];
-x q[9];
-x q[10];
-x q[11];
-x q[12];
-x q[13];
-x q[14];
-reset q[31];
-reset q[32];
-reset q[33];
-reset q[34];
-reset q[35];
-reset q[36];
-reset q[37];
-reset q[38];
-reset q[39];
-reset q[40];
-reset q[41];
-reset q[42];
-reset q[43];
-reset q[44];
-ccx q[1],q[0],q[31];
-ccx q[31],q[2],q[32];
-ccx q[32],q[3],q[33];
-ccx q[33],q[4],q[34];
-ccx q[34],q[5],q[35];
-ccx q[35],q[6],q[36];
-ccx q[36],q[7],q[37];
-ccx q[37],q[8],q[38];
-ccx q[38],q[9],q[39];
-ccx q[39],q[10],q[40];
-ccx q[40],q[11],q[41];
-ccx q[41],q[12],q[42];
-ccx q[42],q[13],q[43];
-ccx q[43],q[14],q[44];
-z q[44];
-ccx q[43],q[14],q[44];
-ccx q[42],q[13],q[43];
-ccx q[41],q[12],q[42];
-ccx q[40],q[11],q[41];
-ccx q[39],q[10],q[40];
-ccx q[38],q[9],q[39];
-ccx q[37],q[8],q[38];
-ccx q[36],q[7],q[37];
-ccx q[35],q[6],q[36];
-ccx q[34],q[5],q[35];
-ccx q[33],q[4],q[34];
-ccx q[32],q[3],q[33];
-ccx q[31],q[2],q[32];
-ccx q[1],q[0],q[31];
-x q[0];
-x q[1];
-x q[2];
-x q[3];
-x q[4];
-x q[5];
-x q[6];
-x q[7];
-x q[8];
-x q[9];
-x q[10];
-x q[11];
-x q[12];
-x q[13];
-x q[14];
-h q[0];
-h q[1];
-h q[2];
-h q[3];
-h q[4];
-h q[5];
-h q[6];
-h q[7];
-h q[8];
-h q[9];
-h q[10];
-h q[11];
-h q[12];
-h q[13];
-h q[14];
-cx q[0],q[15];
-cx q[1],q[17];
-cx q[2],q[19];
-cx q[3],q[21];
-cx q[4],q[23];
-cx q[5],q[25];
-cx q[6],q[27];
-cx q[7],q[29];
-cx q[8],q[16];
-cx q[8],q[17];
-cx q[9],q[18];
-cx q[9],q[19];
-cx q[10],q[20];
-cx q[10],q[21];
-cx q[11],q[22];
-cx q[11],q[23];
-cx q[12],q[24];
-cx q[12],q[25];
-cx q[13],q[26];
-cx q[13],q[27];
-cx q[14],q[28];
-cx q[14],q[29];
-x q[15];
-x q[17];
-x q[18];
-x q[19];
-x q[20];
-x q[21];
-x q[22];
-x q[23];
-x q[24];
-x q[25];
-x q[26];
-x q[27];
-x q[28];
-x q[29];
-reset q[31];
-reset q[32];
-reset q[33];
-reset q[34];
-reset q[35];
-reset q[36];
-reset q[37];
-reset q[38];
-reset q[39];
-reset q[40];
-reset q[41];
-reset q[42];
-reset q[43];
-reset q[44];
-ccx q[16],q[15],q[31];
-ccx q[31],q[17],q[32];
-ccx q[32],q[18],q[33];
-ccx q[33],q[19],q[34];
-ccx q[34],q[20],q[35];
-ccx q[35],q[21],q[36];
-ccx q[36],q[22],q[37];
-ccx q[37],q[23],q[38];
-ccx q[38],q[24],q[39];
-ccx q[39],q[25],q[40];
-ccx q[40],q[26],q[41];
-ccx q[41],q[27],q[42];
-ccx q[42],q[28],q[43];
-ccx q[43],q[29],q[44];
-z q[44];
-ccx q[43],q[29],q[44];
-ccx q[42],q[28],q[43];
-ccx q[41],q[27],q[42];
-ccx q[40],q[26],q[41];
-ccx q[39],q[25],q[40];
-ccx q[38],q[24],q[39];
-ccx q[37],q[23],q[38];
-ccx q[36],q[22],q[37];
-ccx q[35],q[21],q[36];
-ccx q[34],q[20],q[35];
-ccx q[33],q[19],q[34];
-ccx q[32],q[18],q[33];
-ccx q[31],q[17],q[32];
-ccx q[16],q[15],q[31];
-x q[15];
-x q[17];
-x q[18];
-x q[19];
-x q[20];
-x q[21];
-x q[22];
-x q[23];
-x q[24];
-x q[25];
-x q[26];
-x q[27];
-x q[28];
-x q[29];
-cx q[0],q[15];
-cx q[1],q[17];
-cx q[2],q[19];
-cx q[3],q[21];
-cx q[4],q[23];
-cx q[5],q[25];
-cx q[6],q[27];
-cx q[7],q[29];
-cx q[8],q[16];
-cx q[8],q[17];
-cx q[9],q[18];
-cx q[9],q[19];
-cx q[10],q[20];
-cx q[10],q[21];
-cx q[11],q[22];
-cx q[11],q[23];
-cx q[12],q[24];
-cx q[12],q[25];
-cx q[13],q[26];
-cx q[13],q[27];
-cx q[14],q[28];
-cx q[14],q[29];
-h q[0];
-h q[1];
-h q[2];
-h q[3];
-h q[4];
-h q[5];
-h q[6];
-h q[7];
-h q[8];
-h q[9];
-h q[10];
-h q[11];
-h q[12];
-h q[13];
-h q[14];
-x q[0];
-x q[1];
-x q[2];
-x q[3];
-x q[4];
-x q[5];
-x q[6];
-x q[7];
-x q[8];
-x q[9];
-x q[10];
-x q[11];
-x q[12];
-x q[13];
-x q[14];
-reset q[31];
-reset q[32];
-reset q[33];
-reset q[34];
-reset q[35];
-reset q[36];
-reset q[37];
-reset q[38];
-reset q[39];
-reset q[40];
-reset q[41];
-reset q[42];
-reset q[43];
-reset q[44];
-ccx q[1],q[0],q[31];
-ccx q[31],q[2],q[32];
-ccx q[32],q[3],q[33];
-ccx q[33],q[4],q[34];
-ccx q[34],q[5],q[35];
-ccx q[35],q[6],q[36];
-ccx q[36],q[7],q[37];
-ccx q[37],q[8],q[38];
-ccx q[38],q[9],q[39];
-ccx q[39],q[10],q[40];
-ccx q[40],q[11],q[41];
-ccx q[41],q[12],q[42];
-ccx q[42],q[13],q[43];
-ccx q[43],q[14],q[44];
-z q[44];
-ccx q[43],q[14],q[44];
-ccx q[42],q[13],q[43];
-ccx q[41],q[12],q[42];
-ccx q[40],q[11],q[41];
-ccx q[39],q[10],q[40];
-ccx q[38],q[9],q[39];
-ccx q[37],q[8],q[38];
-ccx q[36],q[7],q[37];
-ccx q[35],q[6],q[36];
-ccx q[34],q[5],q[35];
-ccx q[33],q[4],q[34];
-ccx q[32],q[3],q[33];
-ccx q[31],q[2],q[32];
-ccx q[1],q[0],q[31];
-x q[0];
-x q[1];
-x q[2];
-x q[3];
-x q[4];
-x q[5];
-x q[6];
-x q[7];
-x q[8];
-x q[9];
-x q[10];
-x q[11];
-x q[12];
-x q[13];
-x q[14];
-h q[0];
-h q[1];
-h q[2];
-h q[3];
-h q[4];
-h q[5];
-h q[6];
-h q[7];
-h q[8];
-h q[9];
-h q[10];
-h q[11];
-h q[12];
-h q[13];
-h q[14];
-cx q[0],q[15];
-cx q[1],q[17];
-cx q[2],q[19];
-cx q[3],q[21];
-cx q[4],q[23];
-cx q[5],q[25];
-cx q[6],q[27];
-cx q[7],q[29];
-cx q[8],q[16];
-cx q[8],q[17];
-cx q[9],q[18];
-cx q[9],q[19];
-cx q[10],q[20];
-cx q[10],q[21];
-cx q[11],q[22];
-cx q[11],q[23];
-cx q[12],q[24];
-cx q[12],q[25];
-cx q[13],q[26];
-cx q[13],q[27];
-cx q[14],q[28];
-cx q[14],q[29];
-x q[15];
-x q[17];
-x q[18];
-x q[19];
-x q[20];
-x q[21];
-x q[22];
-x q[23];
-x q[24];
-x q[25];
-x q[26];
-x q[27];
-x q[28];
-x q[29];
-reset q[31];
-reset q[32];
-reset q[33];
-reset q[34];
-reset q[35];
-reset q[36];
-reset q[37];
-reset q[38];
-reset q[39];
-reset q[40];
-reset q[41];
-reset q[42];
-reset q[43];
-reset q[44];
-ccx q[16],q[15],q[31];
-ccx q[31],q[17],q[32];
-ccx q[32],q[18],q[33];
-ccx q[33],q[19],q[34];
-ccx q[34],q[20],q[35];
-ccx q[35],q[21],q[36];
-ccx q[36],q[22],q[37];
-ccx q[37],q[23],q[38];
-ccx q[38],q[24],q[39];
-ccx q[39],q[25],q[40];
-ccx q[40],q[26],q[41];
-ccx q[41],q[27],q[42];
-ccx q[42],q[28],q[43];
-ccx q[43],q[29],q[44];
-z q[44];
-ccx q[43],q[29],q[44];
-ccx q[42],q[28],q[43];
-ccx q[41],q[27],q[42];
-ccx q[40],q[26],q[41];
-ccx q[39],q[25],q[40];
-ccx q[38],q[24],q[39];
-ccx q[37],q[23],q[38];
-ccx q[36],q[22],q[37];
-ccx q[35],q[21],q[36];
-ccx q[34],q[20],q[35];
-ccx q[33],q[19],q[34];
-ccx q[32],q[18],q[33];
-ccx q[31],q[17],q[32];
-ccx q[16],q[15],q[31];
-x q[15];
-x q[17];
-x q[18];
-x q[19];
-x q[20];
-x q[21];
-x q[22];
-x q[23];
-x q[24];
-x q[25];
-x q[26];
-x q[27];
-x q[28];
-x q[29];
-cx q[0],q[15];
-cx q[1],q[17];
-cx q[2],q[19];
-cx q[3],q[21];
-cx q[4],q[23];
-cx q[5],q[25];
-cx q[6],q[27];
-cx q[7],q[29];
-cx q[8],q[16];
-cx q[8],q[17];
-cx q[9],q[18];
-cx q[9],q[19];
-cx q[10],q[20];
-cx q[10],q[21];
-cx q[11],q[22];
-cx q[11],q[23];
-cx q[12],q[24];
-cx q[12],q[25];
-cx q[13],q[26];
-cx q[13],q[27];
-cx q[14],q[28];
-cx q[14],q[29];
-h q[0];
-h q[1];
-h q[2];
-h q[3];
-h q[4];
-h q[5];
-h q[6];
-h q[7];
-h q[8];
-h q[9];
-h q[10];
-h q[11];
-h q[12];
-h q[13];
-h q[14];
-x q[0];
-x q[1];
-x q[2];
-x q[3];
-x q[4];
-x q[5];
-x q[6];
-x q[7];
-x q[8];
-x q[9];
-x q[10];
-x q[11];
-x q[12];
-x q[13];
-x q[14];
-reset q[31];
-reset q[32];
-reset q[33];
-reset q[34];
-reset q[35];
-reset q[36];
-reset q[37];
-reset q[38];
-reset q[39];
-reset q[40];
-reset q[41];
-reset q[42];
-reset q[43];
-reset q[44];
-ccx q[1],q[0],q[31];
-ccx q[31],q[2],q[32];
-ccx q[32],q[3],q[33];
-ccx q[33],q[4],q[34];
-ccx q[34],q[5],q[35];
-ccx q[35],q[6],q[36];
-ccx q[36],q[7],q[37];
-ccx q[37],q[8],q[38];
-ccx q[38],q[9],q[39];
-ccx q[39],q[10],q[40];
-ccx q[40],q[11],q[41];
-ccx q[41],q[12],q[42];
-ccx q[42],q[13],q[43];
-ccx q[43],q[14],q[44];
-z q[44];
-ccx q[43],q[14],q[44];
-ccx q[42],q[13],q[43];
-ccx q[41],q[12],q[42];
-ccx q[40],q[11],q[41];
-ccx q[39],q[10],q[40];
-ccx q[38],q[9],q[39];
-ccx q[37],q[8],q[38];
-ccx q[36],q[7],q[37];
-ccx q[35],q[6],q[36];
-ccx q[34],q[5],q[35];
-ccx q[33],q[4],q[34];
-ccx q[32],q[3],q[33];
-ccx q[31],q[2],q[32];
-ccx q[1],q[0],q[31];
-x q[0];
-x q[1];
-x q[2];
-x q[3];
-x q[4];
-x q[5];
-x q[6];
-x q[7];
-x q[8];
-x q[9];
-x q[10];
-x q[11];
-x q[12];
-x q[13];
-x q[14];
-h q[0];
-h q[1];
-h q[2];
-h q[3];
-h q[4];
-h q[5];
-h q[6];
-h q[7];
-h q[8];
-h q[9];
-h q[10];
-h q[11];
-h q[12];
-h q[13];
-h q[14];
-cx q[0],q[15];
-cx q[1],q[17];
-cx q[2],q[19];
-cx q[3],q[21];
-cx q[4],q[23];
-cx q[5],q[25];
-cx q[6],q[27];
-cx q[7],q[29];
-cx q[8],q[16];
-cx q[8],q[17];
-cx q[9],q[18];
-cx q[9],q[19];
-cx q[10],q[20];
-cx q[10],q[21];
-cx q[11],q[22];
-cx q[11],q[23];
-cx q[12],q[24];
-cx q[12],q[25];
-cx q[13],q[26];
-cx q[13],q[27];
-cx q[14],q[28];
-cx q[14],q[29];
-x q[15];
-x q[17];
-x q[18];
-x q[19];
-x q[20];
-x q[21];
-x q[22];
-x q[23];
-x q[24];
-x q[25];
-x q[26];
-x q[27];
-x q[28];
-x q[29];
-reset q[31];
-reset q[32];
-reset q[33];
-reset q[34];
-reset q[35];
-reset q[36];
-reset q[37];
-reset q[38];
-reset q[39];
-reset q[40];
-reset q[41];
-reset q[42];
-reset q[43];
-reset q[44];
-ccx q[16],q[15],q[31];
-ccx q[31],q[17],q[32];
-ccx q[32],q[18],q[33];
-ccx q[33],q[19],q[34];
-ccx q[34],q[20],q[35];
-ccx q[35],q[21],q[36];
-ccx q[36],q[22],q[37];
-ccx q[37],q[23],q[38];
-ccx q[38],q[24],q[39];
-ccx q[39],q[25],q[40];
-ccx q[40],q[26],q[41];
-ccx q[41],q[27],q[42];
-ccx q[42],q[28],q[43];
-ccx q[43],q[29],q[44];
-z q[44];
-ccx q[43],q[29],q[44];
-ccx q[42],q[28],q[43];
-ccx q[41],q[27],q[42];
-ccx q[40],q[26],q[41];
-ccx q[39],q[25],q[40];
-ccx q[38],q[24],q[39];
-ccx q[37],q[23],q[38];
-ccx q[36],q[22],q[37];
-ccx q[35],q[21],q[36];
-ccx q[34],q[20],q[35];
-ccx q[33],q[19],q[34];
-ccx q[32],q[18],q[33];
-ccx q[31],q[17],q[32];
-ccx q[16],q[15],q[31];
-x q[15];
-x q[17];
-x q[18];
-x q[19];
-x q[20];
-x q[21];
-x q[22];
-x q[23];
-x q[24];
-x q[25];
-x q[26];
-x q[27];
-x q[28];
-x q[29];
-cx q[0],q[15];
-cx q[1],q[17];
-cx q[2],q[19];
-cx q[3],q[21];
-cx q[4],q[23];
-cx q[5],q[25];
-cx q[6],q[27];
-cx q[7],q[29];
-cx q[8],q[16];
-cx q[8],q[17];
-cx q[9],q[18];
-cx q[9],q[19];
-cx q[10],q[20];
-cx q[10],q[21];
-cx q[11],q[22];
-cx q[11],q[23];
-cx q[12],q[24];
-cx q[12],q[25];
-cx q[13],q[26];
-cx q[13],q[27];
-cx q[14],q[28];
-cx q[14],q[29];
-h q[0];
-h q[1];
-h q[2];
-h q[3];
-h q[4];
-h q[5];
-h q[6];
-h q[7];
-h q[8];
-h q[9];
-h q[10];
-h q[11];
-h q[12];
-h q[13];
-h q[14];
-x q[0];
-x q[1];
-x q[2];
-x q[3];
-x q[4];
-x q[5];
-x q[6];
-x q[7];
-x q[8];
-x q[9];
-x q[10];
-x q[11];
-x q[12];
-x q[13];
-x q[14];
-reset q[31];
-reset q[32];
-reset q[33];
-reset q[34];
-reset q[35];
-reset q[36];
-reset q[37];
-reset q[38];
-reset q[39];
-reset q[40];
-reset q[41];
-reset q[42];
-reset q[43];
-reset q[44];
-ccx q[1],q[0],q[31];
-ccx q[31],q[2],q[32];
-ccx q[32],q[3],q[33];
-ccx q[33],q[4],q[34];
-ccx q[34],q[5],q[35];
-ccx q[35],q[6],q[36];
-ccx q[36],q[7],q[37];
-ccx q[37],q[8],q[38];
-ccx q[38],q[9],q[39];
-ccx q[39],q[10],q[40];
-ccx q[40],q[11],q[41];
-ccx q[41],q[12],q[42];
-ccx q[42],q[13],q[43];
-ccx q[43],q[14],q[44];
-z q[44];
-ccx q[43],q[14],q[44];
-ccx q[42],q[13],q[43];
-ccx q[41],q[12],q[42];
-ccx q[40],q[11],q[41];
-ccx q[39],q[10],q[40];
-ccx q[38],q[9],q[39];
-ccx q[37],q[8],q[38];
-ccx q[36],q[7],q[37];
-ccx q[35],q[6],q[36];
-ccx q[34],q[5],q[35];
-ccx q[33],q[4],q[34];
-ccx q[32],q[3],q[33];
-ccx q[31],q[2],q[32];
-ccx q[1],q[0],q[31];
-x q[0];
-x q[1];
-x q[2];
-x q[3];
-x q[4];
-x q[5];
-x q[6];
-x q[7];
-x q[8];
-x q[9];
-x q[10];
-x q[11];
-x q[12];
-x q[13];
-x q[14];
-h q[0];
-h q[1];
-h q[2];
-h q[3];
-h q[4];
-h q[5];
-h q[6];
-h q[7];
-h q[8];
-h q[9];
-h q[10];
-h q[11];
-h q[12];
-h q[13];
-h q[14];
-cx q[0],q[15];
-cx q[1],q[17];
-cx q[2],q[19];
-cx q[3],q[21];
-cx q[4],q[23];
-cx q[5],q[25];
-cx q[6],q[27];
-cx q[7],q[29];
-cx q[8],q[16];
-cx q[8],q[17];
-cx q[9],q[18];
-cx q[9],q[19];
-cx q[10],q[20];
-cx q[10],q[21];
-cx q[11],q[22];
-cx q[11],q[23];
-cx q[12],q[24];
-cx q[12],q[25];
-cx q[13],q[26];
-cx q[13],q[27];
-cx q[14],q[28];
-cx q[14],q[29];
-x q[15];
-x q[17];
-x q[18];
-x q[19];
-x q[20];
-x q[21];
-x q[22];
-x q[23];
-x q[24];
-x q[25];
-x q[26];
-x q[27];
-x q[28];
-x q[29];
-reset q[31];
-reset q[32];
-reset q[33];
-reset q[34];
-reset q[35];
-reset q[36];
-reset q[37];
-reset q[38];
-reset q[39];
-reset q[40];
-reset q[41];
-reset q[42];
-reset q[43];
-reset q[44];
-ccx q[16],q[15],q[31];
-ccx q[31],q[17],q[32];
-ccx q[32],q[18],q[33];
-ccx q[33],q[19],q[34];
-ccx q[34],q[20],q[35];
-ccx q[35],q[21],q[36];
-ccx q[36],q[22],q[37];
-ccx q[37],q[23],q[38];
-ccx q[38],q[24],q[39];
-ccx q[39],q[25],q[40];
-ccx q[40],q[26],q[41];
-ccx q[41],q[27],q[42];
-ccx q[42],q[28],q[43];
-ccx q[43],q[29],q[44];
-z q[44];
-ccx q[43],q[29],q[44];
-ccx q[42],q[28],q[43];
-ccx q[41],q[27],q[42];
-ccx q[40],q[26],q[41];
-ccx q[39],q[25],q[40];
-ccx q[38],q[24],q[39];
-ccx q[37],q[23],q[38];
-ccx q[36],q[22],q[37];
-ccx q[35],q[21],q[36];
-ccx q[34],q[20],q[35];
-ccx q[33],q[19],q[34];
-ccx q[32],q[18],q[33];
-ccx q[31],q[17],q[32];
-ccx q[16],q[15],q[31];
-x q[15];
-x q[17];
-x q[18];
-x q[19];
-x q[20];
-x q[21];
-x q[22];
-x q[23];
-x q[24];
-x q[25];
-x q[26];
-x q[27];
-x q[28];
-x q[29];
-cx q[0],q[15];
-cx q[1],q[17];
-cx q[2],q[19];
-cx q[3],q[21];
-cx q[4],q[23];
-cx q[5],q[25];
-cx q[6],q[27];
-cx q[7],q[29];
-cx q[8],q[16];
-cx q[8],q[17];
-cx q[9],q[18];
-cx q[9],q[19];
-cx q[10],q[20];
-cx q[10],q[21];
-cx q[11],q[22];
-cx q[11],q[23];
-cx q[12],q[24];
-cx q[12],q[25];
-cx q[13],q[26];
-cx q[13],q[27];
-cx q[14],q[28];
-cx q[14],q[29];
-h q[0];
-h q[1];
-h q[2];
-h q[3];
-h q[4];
-h q[5];
-h q[6];
-h q[7];
-h q[8];
-h q[9];
-h q[10];
-h q[11];
-h q[12];
-h q[13];
-h q[14];
-x q[0];
-x q[1];
-x q[2];
-x q[3];
-x q[4];
-x q[5];
-x q[6];
-x q[7];
-x q[8];
-x q[9];
-x q[10];
-x q[11];
-x q[12];
-x q[13];
-x q[14];
-reset q[31];
-reset q[32];
-reset q[33];
-reset q[34];
-reset q[35];
-reset q[36];
-reset q[37];
-reset q[38];
-reset q[39];
-reset q[40];
-reset q[41];
-reset q[42];
-reset q[43];
-reset q[44];
-ccx q[1],q[0],q[31];
-ccx q[31],q[2],q[32];
-ccx q[32],q[3],q[33];
-ccx q[33],q[4],q[34];
-ccx q[34],q[5],q[35];
-ccx q[35],q[6],q[36];
-ccx q[36],q[7],q[37];
-ccx q[37],q[8],q[38];
-ccx q[38],q[9],q[39];
-ccx q[39],q[10],q[40];
-ccx q[40],q[11],q[41];
-ccx q[41],q[12],q[42];
-ccx q[42],q[13],q[43];
-ccx q[43],q[14],q[44];
-z q[44];
-ccx q[43],q[14],q[44];
-ccx q[42],q[13],q[43];
-ccx q[41],q[12],q[42];
-ccx q[40],q[11],q[41];
-ccx q[39],q[10],q[40];
-ccx q[38],q[9],q[39];
-ccx q[37],q[8],q[38];
-ccx q[36],q[7],q[37];
-ccx q[35],q[6],q[36];
-ccx q[34],q[5],q[35];
-ccx q[33],q[4],q[34];
-ccx q[32],q[3],q[33];
-ccx q[31],q[2],q[32];
-ccx q[1],q[0],q[31];
-x q[0];
-x q[1];
-x q[2];
-x q[3];
-x q[4];
-x q[5];
-x q[6];
-x q[7];
-x q[8];
-x q[9];
-x q[10];
-x q[11];
-x q[12];
-x q[13];
-x q[14];
-h q[0];
-h q[1];
-h q[2];
-h q[3];
-h q[4];
-h q[5];
-h q[6];
-h q[7];
-h q[8];
-h q[9];
-h q[10];
-h q[11];
-h q[12];
-h q[13];
-h q[14];
-cx q[0],q[15];
-cx q[1],q[17];
-cx q[2],q[19];
-cx q[3],q[21];
-cx q[4],q[23];
-cx q[5],q[25];
-cx q[6],q[27];
-cx q[7],q[29];
-cx q[8],q[16];
-cx q[8],q[17];
-cx q[9],q[18];
-cx q[9],q[19];
-cx q[10],q[20];
-cx q[10],q[21];
-cx q[11],q[22];
-cx q[11],q[23];
-cx q[12],q[24];
-cx q[12],q[25];
-cx q[13],q[26];
-cx q[13],q[27];
-cx q[14],q[28];
-cx q[14],q[29];
-x q[15];
-x q[17];
-x q[18];
-x q[19];
-x q[20];
-x q[21];
-x q[22];
-x q[23];
-x q[24];
-x q[25];
-x q[26];
-x q[27];
-x q[28];
-x q[29];
-reset q[31];
-reset q[32];
-reset q[33];
-reset q[34];
-reset q[35];
-reset q[36];
-reset q[37];
-reset q[38];
-reset q[39];
-reset q[40];
-reset q[41];
-reset q[42];
-reset q[43];
-reset q[44];
-ccx q[16],q[15],q[31];
-ccx q[31],q[17],q[32];
-ccx q[32],q[18],q[33];
-ccx q[33],q[19],q[34];
-ccx q[34],q[20],q[35];
-ccx q[35],q[21],q[36];
-ccx q[36],q[22],q[37];
-ccx q[37],q[23],q[38];
-ccx q[38],q[24],q[39];
-ccx q[39],q[25],q[40];
-ccx q[40],q[26],q[41];
-ccx q[41],q[27],q[42];
-ccx q[42],q[28],q[43];
-ccx q[43],q[29],q[44];
-z q[44];
-ccx q[43],q[29],q[44];
-ccx q[42],q[28],q[43];
-ccx q[41],q[27],q[42];
-ccx q[40],q[26],q[41];
-ccx q[39],q[25],q[40];
-ccx q[38],q[24],q[39];
-ccx q[37],q[23],q[38];
-ccx q[36],q[22],q[37];
-ccx q[35],q[21],q[36];
-ccx q[34],q[20],q[35];
-ccx q[33],q[19],q[34];
-ccx q[32],q[18],q[33];
-ccx q[31],q[17],q[32];
-ccx q[16],q[15],q[31];
-x q[15];
-x q[17];
-x q[18];
-x q[19];
-x q[20];
-x q[21];
-x q[22];
-x q[23];
-x q[24];
-x q[25];
-x q[26];
-x q[27];
-x q[28];
-x q[29];
-cx q[0],q[15];
-cx q[1],q[17];
-cx q[2],q[19];
-cx q[3],q[21];
-cx q[4],q[23];
-cx q[5],q[25];
-cx q[6],q[27];
-cx q[7],q[29];
-cx q[8],q[16];
-cx q[8],q[17];
-cx q[9],q[18];
-cx q[9],q[19];
-cx q[10],q[20];
-cx q[10],q[21];
-cx q[11],q[22];
-cx q[11],q[23];
-cx q[12],q[24];
-cx q[12],q[25];
-cx q[13],q[26];
-cx q[13],q[27];
-cx q[14],q[28];
-cx q[14],q[29];
-h q[0];
-h q[1];
-h q[2];
-h q[3];
-h q[4];
-h q[5];
-h q[6];
-h q[7];
-h q[8];
-h q[9];
-h q[10];
-h q[11];
-h q[12];
-h q[13];
-h q[14];
-x q[0];
-x q[1];
-x q[2];
-x q[3];
-x q[4];
-x q[5];
-x q[6];
-x q[7];
-x q[8];
-x q[9];
-x q[10];
-x q[11];
-x q[12];
-x q[13];
-x q[14];
-reset q[31];
-reset q[32];
-reset q[33];
-reset q[34];
-reset q[35];
-reset q[36];
-reset q[37];
-reset q[38];
-reset q[39];
-reset q[40];
-reset q[41];
-reset q[42];
-reset q[43];
-reset q[44];
-ccx q[1],q[0],q[31];
-ccx q[31],q[2],q[32];
-ccx q[32],q[3],q[33];
-ccx q[33],q[4],q[34];
-ccx q[34],q[5],q[35];
-ccx q[35],q[6],q[36];
-ccx q[36],q[7],q[37];
-ccx q[37],q[8],q[38];
-ccx q[38],q[9],q[39];
-ccx q[39],q[10],q[40];
-ccx q[40],q[11],q[41];
-ccx q[41],q[12],q[42];
-ccx q[42],q[13],q[43];
-ccx q[43],q[14],q[44];
-z q[44];
-ccx q[43],q[14],q[44];
-ccx q[42],q[13],q[43];
-ccx q[41],q[12],q[42];
-ccx q[40],q[11],q[41];
-ccx q[39],q[10],q[40];
-ccx q[38],q[9],q[39];
-ccx q[37],q[8],q[38];
-ccx q[36],q[7],q[37];
-ccx q[35],q[6],q[36];
-ccx q[34],q[5],q[35];
-ccx q[33],q[4],q[34];
-ccx q[32],q[3],q[33];
-ccx q[31],q[2],q[32];
-ccx q[1],q[0],q[31];
-x q[0];
-x q[1];
-x q[2];
-x q[3];
-x q[4];
-x q[5];
-x q[6];
-x q[7];
-x q[8];
-x q[9];
-x q[10];
-x q[11];
-x q[12];
-x q[13];
-x q[14];
-h q[0];
-h q[1];
-h q[2];
-h q[3];
-h q[4];
-h q[5];
-h q[6];
-h q[7];
-h q[8];
-h q[9];
-h q[10];
-h q[11];
-h q[12];
-h q[13];
-h q[14];
-cx q[0],q[15];
-cx q[1],q[17];
-cx q[2],q[19];
-cx q[3],q[21];
-cx q[4],q[23];
-cx q[5],q[25];
-cx q[6],q[27];
-cx q[7],q[29];
-cx q[8],q[16];
-cx q[8],q[17];
-cx q[9],q[18];
-cx q[9],q[19];
-cx q[10],q[20];
-cx q[10],q[21];
-cx q[11],q[22];
-cx q[11],q[23];
-cx q[12],q[24];
-cx q[12],q[25];
-cx q[13],q[26];
-cx q[13],q[27];
-cx q[14],q[28];
-cx q[14],q[29];
-x q[15];
-x q[17];
-x q[18];
-x q[19];
-x q[20];
-x q[21];
-x q[22];
-x q[23];
-x q[24];
-x q[25];
-x q[26];
-x q[27];
-x q[28];
-x q[29];
-reset q[31];
-reset q[32];
-reset q[33];
-reset q[34];
-reset q[35];
-reset q[36];
-reset q[37];
-reset q[38];
-reset q[39];
-reset q[40];
-reset q[41];
-reset q[42];
-reset q[43];
-reset q[44];
-ccx q[16],q[15],q[31];
-ccx q[31],q[17],q[32];
-ccx q[32],q[18],q[33];
-ccx q[33],q[19],q[34];
-ccx q[34],q[20],q[35];
-ccx q[35],q[21],q[36];
-ccx q[36],q[22],q[37];
-ccx q[37],q[23],q[38];
-ccx q[38],q[24],q[39];
-ccx q[39],q[25],q[40];
-ccx q[40],q[26],q[41];
-ccx q[41],q[27],q[42];
-ccx q[42],q[28],q[43];
-ccx q[43],q[29],q[44];
-z q[44];
-ccx q[43],q[29],q[44];
-ccx q[42],q[28],q[43];
-ccx q[41],q[27],q[42];
-ccx q[40],q[26],q[41];
-ccx q[39],q[25],q[40];
-ccx q[38],q[24],q[39];
-ccx q[37],q[23],q[38];
-ccx q[36],q[22],q[37];
-ccx q[35],q[21],q[36];
-ccx q[34],q[20],q[35];
-ccx q[33],q[19],q[34];
-ccx q[32],q[18],q[33];
-ccx q[31],q[17],q[32];
-ccx q[16],q[15],q[31];
-x q[15];
-x q[17];
-x q[18];
-x q[19];
-x q[20];
-x q[21];
-x q[22];
-x q[23];
-x q[24];
-x q[25];
-x q[26];
-x q[27];
-x q[28];
-x q[29];
-cx q[0],q[15];
-cx q[1],q[17];
-cx q[2],q[19];
-cx q[3],q[21];
-cx q[4],q[23];
-cx q[5],q[25];
-cx q[6],q[27];
-cx q[7],q[29];
-cx q[8],q[16];
-cx q[8],q[17];
-cx q[9],q[18];
-cx q[9],q[19];
-cx q[10],q[20];
-cx q[10],q[21];
-cx q[11],q[22];
-cx q[11],q[23];
-cx q[12],q[24];
-cx q[12],q[25];
-cx q[13],q[26];
-cx q[13],q[27];
-cx q[14],q[28];
-cx q[14],q[29];
-h q[0];
-h q[1];
-h q[2];
-h q[3];
-h q[4];
-h q[5];
-h q[6];
-h q[7];
-h q[8];
-h q[9];
-h q[10];
-h q[11];
-h q[12];
-h q[13];
-h q[14];
-x q[0];
-x q[1];
-x q[2];
-x q[3];
-x q[4];
-x q[5];
-x q[6];
-x q[7];
-x q[8];
-x q[9];
-x q[10];
-x q[11];
-x q[12];
-x q[13];
-x q[14];
-reset q[31];
-reset q[32];
-reset q[33];
-reset q[34];
-reset q[35];
-reset q[36];
-reset q[37];
-reset q[38];
-reset q[39];
-reset q[40];
-reset q[41];
-reset q[42];
-reset q[43];
-reset q[44];
-ccx q[1],q[0],q[31];
-ccx q[31],q[2],q[32];
-ccx q[32],q[3],q[33];
-ccx q[33],q[4],q[34];
-ccx q[34],q[5],q[35];
-ccx q[35],q[6],q[36];
-ccx q[36],q[7],q[37];
-ccx q[37],q[8],q[38];
-ccx q[38],q[9],q[39];
-ccx q[39],q[10],q[40];
-ccx q[40],q[11],q[41];
-ccx q[41],q[12],q[42];
-ccx q[42],q[13],q[43];
-ccx q[43],q[14],q[44];
-z q[44];
-ccx q[43],q[14],q[44];
-ccx q[42],q[13],q[43];
-ccx q[41],q[12],q[42];
-ccx q[40],q[11],q[41];
-ccx q[39],q[10],q[40];
-ccx q[38],q[9],q[39];
-ccx q[37],q[8],q[38];
-ccx q[36],q[7],q[37];
-ccx q[35],q[6],q[36];
-ccx q[34],q[5],q[35];
-ccx q[33],q[4],q[34];
-ccx q[32],q[3],q[33];
-ccx q[31],q[2],q[32];
-ccx q[1],q[0],q[31];
-x q[0];
-x q[1];
-x q[2];
-x q[3];
-x q[4];
-x q[5];
-x q[6];
-x q[7];
-x q[8];
-x q[9];
-x q[10];
-x q[11];
-x q[12];
-x q[13];
-x q[14];
-h q[0];
-h q[1];
-h q[2];
-h q[3];
-h q[4];
-h q[5];
-h q[6];
-h q[7];
-h q[8];
-h q[9];
-h q[10];
-h q[11];
-h q[12];
-h q[13];
-h q[14];
-cx q[0],q[15];
-cx q[1],q[17];
-cx q[2],q[19];
-cx q[3],q[21];
-cx q[4],q[23];
-cx q[5],q[25];
-cx q[6],q[27];
-cx q[7],q[29];
-cx q[8],q[16];
-cx q[8],q[17];
-cx q[9],q[18];
-cx q[9],q[19];
-cx q[10],q[20];
-cx q[10],q[21];
-cx q[11],q[22];
-cx q[11],q[23];
-cx q[12],q[24];
-cx q[12],q[25];
-cx q[13],q[26];
-cx q[13],q[27];
-cx q[14],q[28];
-cx q[14],q[29];
-x q[15];
-x q[17];
-x q[18];
-x q[19];
-x q[20];
-x q[21];
-x q[22];
-x q[23];
-x q[24];
-x q[25];
-x q[26];
-x q[27];
-x q[28];
-x q[29];
-reset q[31];
-reset q[32];
-reset q[33];
-reset q[34];
-reset q[35];
-reset q[36];
-reset q[37];
-reset q[38];
-reset q[39];
-reset q[40];
-reset q[41];
-reset q[42];
-reset q[43];
-reset q[44];
-ccx q[16],q[15],q[31];
-ccx q[31],q[17],q[32];
-ccx q[32],q[18],q[33];
-ccx q[33],q[19],q[34];
-ccx q[34],q[20],q[35];
-ccx q[35],q[21],q[36];
-ccx q[36],q[22],q[37];
-ccx q[37],q[23],q[38];
-ccx q[38],q[24],q[39];
-ccx q[39],q[25],q[40];
-ccx q[40],q[26],q[41];
-ccx q[41],q[27],q[42];
-ccx q[42],q[28],q[43];
-ccx q[43],q[29],q[44];
-z q[44];
-ccx q[43],q[29],q[44];
-ccx q[42],q[28],q[43];
-ccx q[41],q[27],q[42];
-ccx q[40],q[26],q[41];
-ccx q[39],q[25],q[40];
-ccx q[38],q[24],q[39];
-ccx q[37],q[23],q[38];
-ccx q[36],q[22],q[37];
-ccx q[35],q[21],q[36];
-ccx q[34],q[20],q[35];
-ccx q[33],q[19],q[34];
-ccx q[32],q[18],q[33];
-ccx q[31],q[17],q[32];
-ccx q[16],q[15],q[31];
-x q[15];
-x q[17];
-x q[18];
-x q[19];
-x q[20];
-x q[21];
-x q[22];
-x q[23];
-x q[24];
-x q[25];
-x q[26];
-x q[27];
-x q[28];
-x q[29];
-cx q[0],q[15];
-cx q[1],q[17];
-cx q[2],q[19];
-cx q[3],q[21];
-cx q[4],q[23];
-cx q[5],q[25];
-cx q[6],q[27];
-cx q[7],q[29];
-cx q[8],q[16];
-cx q[8],q[17];
-cx q[9],q[18];
-cx q[9],q[19];
-cx q[10],q[20];
-cx q[10],q[21];
-cx q[11],q[22];
-cx q[11],q[23];
-cx q[12],q[24];
-cx q[12],q[25];
-cx q[13],q[26];
-cx q[13],q[27];
-cx q[14],q[28];
-cx q[14],q[29];
-h q[0];
-h q[1];
-h q[2];
-h q[3];
-h q[4];
-h q[5];
-h q[6];
-h q[7];
-h q[8];
-h q[9];
-h q[10];
-h q[11];
-h q[12];
-h q[13];
-h q[14];
-x q[0];
-x q[1];
-x q[2];
-x q[3];
-x q[4];
-x q[5];
-x q[6];
-x q[7];
-x q[8];
-x q[9];
-x q[10];
-x q[11];
-x q[12];
-x q[13];
-x q[14];
-reset q[31];
-reset q[32];
-reset q[33];
-reset q[34];
-reset q[35];
-reset q[36];
-reset q[37];
-reset q[38];
-reset q[39];
-reset q[40];
-reset q[41];
-reset q[42];
-reset q[43];
-reset q[44];
-ccx q[1],q[0],q[31];
-ccx q[31],q[2],q[32];
-ccx q[32],q[3],q[33];
-ccx q[33],q[4],q[34];
-ccx q[34],q[5],q[35];
-ccx q[35],q[6],q[36];
-ccx q[36],q[7],q[37];
-ccx q[37],q[8],q[38];
-ccx q[38],q[9],q[39];
-ccx q[39],q[10],q[40];
-ccx q[40],q[11],q[41];
-ccx q[41],q[12],q[42];
-ccx q[42],q[13],q[43];
-ccx q[43],q[14],q[44];
-z q[44];
-ccx q[43],q[14],q[44];
-ccx q[42],q[13],q[43];
-ccx q[41],q[12],q[42];
-ccx q[40],q[11],q[41];
-ccx q[39],q[10],q[40];
-ccx q[38],q[9],q[39];
-ccx q[37],q[8],q[38];
-ccx q[36],q[7],q[37];
-ccx q[35],q[6],q[36];
-ccx q[34],q[5],q[35];
-ccx q[33],q[4],q[34];
-ccx q[32],q[3],q[33];
-ccx q[31],q[2],q[32];
-ccx q[1],q[0],q[31];
-x q[0];
-x q[1];
-x q[2];
-x q[3];
-x q[4];
-x q[5];
-x q[6];
-x q[7];
-x q[8];
-x q[9];
-x q[10];
-x q[11];
-x q[12];
-x q[13];
-x q[14];
-h q[0];
-h q[1];
-h q[2];
-h q[3];
-h q[4];
-h q[5];
-h q[6];
-h q[7];
-h q[8];
-h q[9];
-h q[10];
-h q[11];
-h q[12];
-h q[13];
-h q[14];
-cx q[0],q[15];
-cx q[1],q[17];
-cx q[2],q[19];
-cx q[3],q[21];
-cx q[4],q[23];
-cx q[5],q[25];
-cx q[6],q[27];
-cx q[7],q[29];
-cx q[8],q[16];
-cx q[8],q[17];
-cx q[9],q[18];
-cx q[9],q[19];
-cx q[10],q[20];
-cx q[10],q[21];
-cx q[11],q[22];
-cx q[11],q[23];
-cx q[12],q[24];
-cx q[12],q[25];
-cx q[13],q[26];
-cx q[13],q[27];
-cx q[14],q[28];
-cx q[14],q[29];
-x q[15];
-x q[17];
-x q[18];
-x q[19];
-x q[20];
-x q[21];
-x q[22];
-x q[23];
-x q[24];
-x q[25];
-x q[26];
-x q[27];
-x q[28];
-x q[29];
-reset q[31];
-reset q[32];
-reset q[33];
-reset q[34];
-reset q[35];
-reset q[36];
-reset q[37];
-reset q[38];
-reset q[39];
-reset q[40];
-reset q[41];
-reset q[42];
-reset q[43];
-reset q[44];
-ccx q[16],q[15],q[31];
-ccx q[31],q[17],q[32];
-ccx q[32],q[18],q[33];
-ccx q[33],q[19],q[34];
-ccx q[34],q[20],q[35];
-ccx q[35],q[21],q[36];
-ccx q[36],q[22],q[37];
-ccx q[37],q[23],q[38];
-ccx q[38],q[24],q[39];
-ccx q[39],q[25],q[40];
-ccx q[40],q[26],q[41];
-ccx q[41],q[27],q[42];
-ccx q[42],q[28],q[43];
-ccx q[43],q[29],q[44];
-z q[44];
-ccx q[43],q[29],q[44];
-ccx q[42],q[28],q[43];
-ccx q[41],q[27],q[42];
-ccx q[40],q[26],q[41];
-ccx q[39],q[25],q[40];
-ccx q[38],q[24],q[39];
-ccx q[37],q[23],q[38];
-ccx q[36],q[22],q[37];
-ccx q[35],q[21],q[36];
-ccx q[34],q[20],q[35];
-ccx q[33],q[19],q[34];
-ccx q[32],q[18],q[33];
-ccx q[31],q[17],q[32];
-ccx q[16],q[15],q[31];
-x q[15];
-x q[17];
-x q[18];
-x q[19];
-x q[20];
-x q[21];
-x q[22];
-x q[23];
-x q[24];
-x q[25];
-x q[26];
-x q[27];
-x q[28];
-x q[29];
-cx q[0],q[15];
-cx q[1],q[17];
-cx q[2],q[19];
-cx q[3],q[21];
-cx q[4],q[23];
-cx q[5],q[25];
-cx q[6],q[27];
-cx q[7],q[29];
-cx q[8],q[16];
-cx q[8],q[17];
-cx q[9],q[18];
-cx q[9],q[19];
-cx q[10],q[20];
-cx q[10],q[21];
-cx q[11],q[22];
-cx q[11],q[23];
-cx q[12],q[24];
-cx q[12],q[25];
-cx q[13],q[26];
-cx q[13],q[27];
-cx q[14],q[28];
-cx q[14],q[29];
-h q[0];
-h q[1];
-h q[2];
-h q[3];
-h q[4];
-h q[5];
-h q[6];
-h q[7];
-h q[8];
-h q[9];
-h q[10];
-h q[11];
-h q[12];
-h q[13];
-h q[14];
-x q[0];
-x q[1];
-x q[2];
-x q[3];
-x q[4];
-x q[5];
-x q[6];
-x q[7];
-x q[8];
-x q[9];
-x q[10];
-x q[11];
-x q[12];
-x q[13];
-x q[14];
-reset q[31];
-reset q[32];
-reset q[33];
-reset q[34];
-reset q[35];
-reset q[36];
-reset q[37];
-reset q[38];
-reset q[39];
-reset q[40];
-reset q[41];
-reset q[42];
-reset q[43];
-reset q[44];
-ccx q[1],q[0],q[31];
-ccx q[31],q[2],q[32];
-ccx q[32],q[3],q[33];
-ccx q[33],q[4],q[34];
-ccx q[34],q[5],q[35];
-ccx q[35],q[6],q[36];
-ccx q[36],q[7],q[37];
-ccx q[37],q[8],q[38];
-ccx q[38],q[9],q[39];
-ccx q[39],q[10],q[40];
-ccx q[40],q[11],q[41];
-ccx q[41],q[12],q[42];
-ccx q[42],q[13],q[43];
-ccx q[43],q[14],q[44];
-z q[44];
-ccx q[43],q[14],q[44];
-ccx q[42],q[13],q[43];
-ccx q[41],q[12],q[42];
-ccx q[40],q[11],q[41];
-ccx q[39],q[10],q[40];
-ccx q[38],q[9],q[39];
-ccx q[37],q[8],q[38];
-ccx q[36],q[7],q[37];
-ccx q[35],q[6],q[36];
-ccx q[34],q[5],q[35];
-ccx q[33],q[4],q[34];
-ccx q[32],q[3],q[33];
-ccx q[31],q[2],q[32];
-ccx q[1],q[0],q[31];
-x q[0];
-x q[1];
-x q[2];
-x q[3];
-x q[4];
-x q[5];
-x q[6];
-x q[7];
-x q[8];
-x q[9];
-x q[10];
-x q[11];
-x q[12];
-x q[13];
-x q[14];
-h q[0];
-h q[1];
-h q[2];
-h q[3];
-h q[4];
-h q[5];
-h q[6];
-h q[7];
-h q[8];
-h q[9];
-h q[10];
-h q[11];
-h q[12];
-h q[13];
-h q[14];
-cx q[0],q[15];
-cx q[1],q[17];
-cx q[2],q[19];
-cx q[3],q[21];
-cx q[4],q[23];
-cx q[5],q[25];
-cx q[6],q[27];
-cx q[7],q[29];
-cx q[8],q[16];
-cx q[8],q[17];
-cx q[9],q[18];
-cx q[9],q[19];
-cx q[10],q[20];
-cx q[10],q[21];
-cx q[11],q[22];
-cx q[11],q[23];
-cx q[12],q[24];
-cx q[12],q[25];
-cx q[13],q[26];
-cx q[13],q[27];
-cx q[14],q[28];
-cx q[14],q[29];
-x q[15];
-x q[17];
-x q[18];
-x q[19];
-x q[20];
-x q[21];
-x q[22];
-x q[23];
-x q[24];
-x q[25];
-x q[26];
-x q[27];
-x q[28];
-x q[29];
-reset q[31];
-reset q[32];
-reset q[33];
-reset q[34];
-reset q[35];
-reset q[36];
-reset q[37];
-reset q[38];
-reset q[39];
-reset q[40];
-reset q[41];
-reset q[42];
-reset q[43];
-reset q[44];
-ccx q[16],q[15],q[31];
-ccx q[31],q[17],q[32];
-ccx q[32],q[18],q[33];
-ccx q[33],q[19],q[34];
-ccx q[34],q[20],q[35];
-ccx q[35],q[21],q[36];
-ccx q[36],q[22],q[37];
-ccx q[37],q[23],q[38];
-ccx q[38],q[24],q[39];
-ccx q[39],q[25],q[40];
-ccx q[40],q[26],q[41];
-ccx q[41],q[27],q[42];
-ccx q[42],q[28],q[43];
-ccx q[43],q[29],q[44];
-z q[44];
-ccx q[43],q[29],q[44];
-ccx q[42],q[28],q[43];
-ccx q[41],q[27],q[42];
-ccx q[40],q[26],q[41];
-ccx q[39],q[25],q[40];
-ccx q[38],q[24],q[39];
-ccx q[37],q[23],q[38];
-ccx q[36],q[22],q[37];
-ccx q[35],q[21],q[36];
-ccx q[34],q[20],q[35];
-ccx q[33],q[19],q[34];
-ccx q[32],q[18],q[33];
-ccx q[31],q[17],q[32];
-ccx q[16],q[15],q[31];
-x q[15];
-x q[17];
-x q[18];
-x q[19];
-x q[20];
-x q[21];
-x q[22];
-x q[23];
-x q[24];
-x q[25];
-x q[26];
-x q[27];
-x q[28];
-x q[29];
-cx q[0],q[15];
-cx q[1],q[17];
-cx q[2],q[19];
-cx q[3],q[21];
-cx q[4],q[23];
-cx q[5],q[25];
-cx q[6],q[27];
-cx q[7],q[29];
-cx q[8],q[16];
-cx q[8],q[17];
-cx q[9],q[18];
-cx q[9],q[19];
-cx q[10],q[20];
-cx q[10],q[21];
-cx q[11],q[22];
-cx q[11],q[23];
-cx q[12],q[24];
-cx q[12],q[25];
-cx q[13],q[26];
-cx q[13],q[27];
-cx q[14],q[28];
-cx q[14],q[29];
-h q[0];
-h q[1];
-h q[2];
-h q[3];
-h q[4];
-h q[5];
-h q[6];
-h q[7];
-h q[8];
-h q[9];
-h q[10];
-h q[11];
-h q[12];
-h q[13];
-h q[14];
-x q[0];
-x q[1];
-x q[2];
-x q[3];
-x q[4];
-x q[5];
-x q[6];
-x q[7];
-x q[8];
-x q[9];
-x q[10];
-x q[11];
-x q[12];
-x q[13];
-x q[14];
-reset q[31];
-reset q[32];
-reset q[33];
-reset q[34];
-reset q[35];
-reset q[36];
-reset q[37];
-reset q[38];
-reset q[39];
-reset q[40];
-reset q[41];
-reset q[42];
-reset q[43];
-reset q[44];
-ccx q[1],q[0],q[31];
-ccx q[31],q[2],q[32];
-ccx q[32],q[3],q[33];
-ccx q[33],q[4],q[34];
-ccx q[34],q[5],q[35];
-ccx q[35],q[6],q[36];
-ccx q[36],q[7],q[37];
-ccx q[37],q[8],q[38];
-ccx q[38],q[9],q[39];
-ccx q[39],q[10],q[40];
-ccx q[40],q[11],q[41];
-ccx q[41],q[12],q[42];
-ccx q[42],q[13],q[43];
-ccx q[43],q[14],q[44];
-z q[44];
-ccx q[43],q[14],q[44];
-ccx q[42],q[13],q[43];
-ccx q[41],q[12],q[42];
-ccx q[40],q[11],q[41];
-ccx q[39],q[10],q[40];
-ccx q[38],q[9],q[39];
-ccx q[37],q[8],q[38];
-ccx q[36],q[7],q[37];
-ccx q[35],q[6],q[36];
-ccx q[34],q[5],q[35];
-ccx q[33],q[4],q[34];
-ccx q[32],q[3],q[33];
-ccx q[31],q[2],q[32];
-ccx q[1],q[0],q[31];
-x q[0];
-x q[1];
-x q[2];
-x q[3];
-x q[4];
-x q[5];
-x q[6];
-x q[7];
-x q[8];
-x q[9];
-x q[10];
-x q[11];
-x q[12];
-x q[13];
-x q[14];
-h q[0];
-h q[1];
-h q[2];
-h q[3];
-h q[4];
-h q[5];
-h q[6];
-h q[7];
-h q[8];
-h q[9];
-h q[10];
-h q[11];
-h q[12];
-h q[13];
-h q[14];
-cx q[0],q[15];
-cx q[1],q[17];
-cx q[2],q[19];
-cx q[3],q[21];
-cx q[4],q[23];
-cx q[5],q[25];
-cx q[6],q[27];
-cx q[7],q[29];
-cx q[8],q[16];
-cx q[8],q[17];
-cx q[9],q[18];
-cx q[9],q[19];
-cx q[10],q[20];
-cx q[10],q[21];
-cx q[11],q[22];
-cx q[11],q[23];
-cx q[12],q[24];
-cx q[12],q[25];
-cx q[13],q[26];
-cx q[13],q[27];
-cx q[14],q[28];
-cx q[14],q[29];
-x q[15];
-x q[17];
-x q[18];
-x q[19];
-x q[20];
-x q[21];
-x q[22];
-x q[23];
-x q[24];
-x q[25];
-x q[26];
-x q[27];
-x q[28];
-x q[29];
-reset q[31];
-reset q[32];
-reset q[33];
-reset q[34];
-reset q[35];
-reset q[36];
-reset q[37];
-reset q[38];
-reset q[39];
-reset q[40];
-reset q[41];
-reset q[42];
-reset q[43];
-reset q[44];
-ccx q[16],q[15],q[31];
-ccx q[31],q[17],q[32];
-ccx q[32],q[18],q[33];
-ccx q[33],q[19],q[34];
-ccx q[34],q[20],q[35];
-ccx q[35],q[21],q[36];
-ccx q[36],q[22],q[37];
-ccx q[37],q[23],q[38];
-ccx q[38],q[24],q[39];
-ccx q[39],q[25],q[40];
-ccx q[40],q[26],q[41];
-ccx q[41],q[27],q[42];
-ccx q[42],q[28],q[43];
-ccx q[43],q[29],q[44];
-z q[44];
-ccx q[43],q[29],q[44];
-ccx q[42],q[28],q[43];
-ccx q[41],q[27],q[42];
-ccx q[40],q[26],q[41];
-ccx q[39],q[25],q[40];
-ccx q[38],q[24],q[39];
-ccx q[37],q[23],q[38];
-ccx q[36],q[22],q[37];
-ccx q[35],q[21],q[36];
-ccx q[34],q[20],q[35];
-ccx q[33],q[19],q[34];
-ccx q[32],q[18],q[33];
-ccx q[31],q[17],q[32];
-ccx q[16],q[15],q[31];
-x q[15];
-x q[17];
-x q[18];
-x q[19];
-x q[20];
-x q[21];
-x q[22];
-x q[23];
-x q[24];
-x q[25];
-x q[26];
-x q[27];
-x q[28];
-x q[29];
-cx q[0],q[15];
-cx q[1],q[17];
-cx q[2],q[19];
-cx q[3],q[21];
-cx q[4],q[23];
-cx q[5],q[25];
-cx q[6],q[27];
-cx q[7],q[29];
-cx q[8],q[16];
-cx q[8],q[17];
-cx q[9],q[18];
-cx q[9],q[19];
-cx q[10],q[20];
-cx q[10],q[21];
-cx q[11],q[22];
-cx q[11],q[23];
-cx q[12],q[24];
-cx q[12],q[25];
-cx q[13],q[26];
-cx q[13],q[27];
-cx q[14],q[28];
-cx q[14],q[29];
-h q[0];
-h q[1];
-h q[2];
-h q[3];
-h q[4];
-h q[5];
-h q[6];
-h q[7];
-h q[8];
-h q[9];
-h q[10];
-h q[11];
-h q[12];
-h q[13];
-h q[14];
-x q[0];
-x q[1];
-x q[2];
-x q[3];
-x q[4];
-x q[5];
-x q[6];
-x q[7];
-x q[8];
-x q[9];
-x q[10];
-x q[11];
-x q[12];
-x q[13];
-x q[14];
-reset q[31];
-reset q[32];
-reset q[33];
-reset q[34];
-reset q[35];
-reset q[36];
-reset q[37];
-reset q[38];
-reset q[39];
-reset q[40];
-reset q[41];
-reset q[42];
-reset q[43];
-reset q[44];
-ccx q[1],q[0],q[31];
-ccx q[31],q[2],q[32];
-ccx q[32],q[3],q[33];
-ccx q[33],q[4],q[34];
-ccx q[34],q[5],q[35];
-ccx q[35],q[6],q[36];
-ccx q[36],q[7],q[37];
-ccx q[37],q[8],q[38];
-ccx q[38],q[9],q[39];
-ccx q[39],q[10],q[40];
-ccx q[40],q[11],q[41];
-ccx q[41],q[12],q[42];
-ccx q[42],q[13],q[43];
-ccx q[43],q[14],q[44];
-z q[44];
-ccx q[43],q[14],q[44];
-ccx q[42],q[13],q[43];
-ccx q[41],q[12],q[42];
-ccx q[40],q[11],q[41];
-ccx q[39],q[10],q[40];
-ccx q[38],q[9],q[39];
-ccx q[37],q[8],q[38];
-ccx q[36],q[7],q[37];
-ccx q[35],q[6],q[36];
-ccx q[34],q[5],q[35];
-ccx q[33],q[4],q[34];
-ccx q[32],q[3],q[33];
-ccx q[31],q[2],q[32];
-ccx q[1],q[0],q[31];
-x q[0];
-x q[1];
-x q[2];
-x q[3];
-x q[4];
-x q[5];
-x q[6];
-x q[7];
-x q[8];
-x q[9];
-x q[10];
-x q[11];
-x q[12];
-x q[13];
-x q[14];
-h q[0];
-h q[1];
-h q[2];
-h q[3];
-h q[4];
-h q[5];
-h q[6];
-h q[7];
-h q[8];
-h q[9];
-h q[10];
-h q[11];
-h q[12];
-h q[13];
-h q[14];
-cx q[0],q[15];
-cx q[1],q[17];
-cx q[2],q[19];
-cx q[3],q[21];
-cx q[4],q[23];
-cx q[5],q[25];
-cx q[6],q[27];
-cx q[7],q[29];
-cx q[8],q[16];
-cx q[8],q[17];
-cx q[9],q[18];
-cx q[9],q[19];
-cx q[10],q[20];
-cx q[10],q[21];
-cx q[11],q[22];
-cx q[11],q[23];
-cx q[12],q[24];
-cx q[12],q[25];
-cx q[13],q[26];
-cx q[13],q[27];
-cx q[14],q[28];
-cx q[14],q[29];
-x q[15];
-x q[17];
-x q[18];
-x q[19];
-x q[20];
-x q[21];
-x q[22];
-x q[23];
-x q[24];
-x q[25];
-x q[26];
-x q[27];
-x q[28];
-x q[29];
-reset q[31];
-reset q[32];
-reset q[33];
-reset q[34];
-reset q[35];
-reset q[36];
-reset q[37];
-reset q[38];
-reset q[39];
-reset q[40];
-reset q[41];
-reset q[42];
-reset q[43];
-reset q[44];
-ccx q[16],q[15],q[31];
-ccx q[31],q[17],q[32];
-ccx q[32],q[18],q[33];
-ccx q[33],q[19],q[34];
-ccx q[34],q[20],q[35];
-ccx q[35],q[21],q[36];
-ccx q[36],q[22],q[37];
-ccx q[37],q[23],q[38];
-ccx q[38],q[24],q[39];
-ccx q[39],q[25],q[40];
-ccx q[40],q[26],q[41];
-ccx q[41],q[27],q[42];
-ccx q[42],q[28],q[43];
-ccx q[43],q[29],q[44];
-z q[44];
-ccx q[43],q[29],q[44];
-ccx q[42],q[28],q[43];
-ccx q[41],q[27],q[42];
-ccx q[40],q[26],q[41];
-ccx q[39],q[25],q[40];
-ccx q[38],q[24],q[39];
-ccx q[37],q[23],q[38];
-ccx q[36],q[22],q[37];
-ccx q[35],q[21],q[36];
-ccx q[34],q[20],q[35];
-ccx q[33],q[19],q[34];
-ccx q[32],q[18],q[33];
-ccx q[31],q[17],q[32];
-ccx q[16],q[15],q[31];
-x q[15];
-x q[17];
-x q[18];
-x q[19];
-x q[20];
-x q[21];
-x q[22];
-x q[23];
-x q[24];
-x q[25];
-x q[26];
-x q[27];
-x q[28];
-x q[29];
-cx q[0],q[15];
-cx q[1],q[17];
-cx q[2],q[19];
-cx q[3],q[21];
-cx q[4],q[23];
-cx q[5],q[25];
-cx q[6],q[27];
-cx q[7],q[29];
-cx q[8],q[16];
-cx q[8],q[17];
-cx q[9],q[18];
-cx q[9],q[19];
-cx q[10],q[20];
-cx q[10],q[21];
-cx q[11],q[22];
-cx q[11],q[23];
-cx q[12],q[24];
-cx q[12],q[25];
-cx q[13],q[26];
-cx q[13],q[27];
-cx q[14],q[28];
-cx q[14],q[29];
-h q[0];
-h q[1];
-h q[2];
-h q[3];
-h q[4];
-h q[5];
-h q[6];
-h q[7];
-h q[8];
-h q[9];
-h q[10];
-h q[11];
-h q[12];
-h q[13];
-h q[14];
-x q[0];
-x q[1];
-x q[2];
-x q[3];
-x q[4];
-x q[5];
-x q[6];
-x q[7];
-x q[8];
-x q[9];
-x q[10];
-x q[11];
-x q[12];
-x q[13];
-x q[14];
-reset q[31];
-reset q[32];
-reset q[33];
-reset q[34];
-reset q[35];
-reset q[36];
-reset q[37];
-reset q[38];
-reset q[39];
-reset q[40];
-reset q[41];
-reset q[42];
-reset q[43];
-reset q[44];
-ccx q[1],q[0],q[31];
-ccx q[31],q[2],q[32];
-ccx q[32],q[3],q[33];
-ccx q[33],q[4],q[34];
-ccx q[34],q[5],q[35];
-ccx q[35],q[6],q[36];
-ccx q[36],q[7],q[37];
-ccx q[37],q[8],q[38];
-ccx q[38],q[9],q[39];
-ccx q[39],q[10],q[40];
-ccx q[40],q[11],q[41];
-ccx q[41],q[12],q[42];
-ccx q[42],q[13],q[43];
-ccx q[43],q[14],q[44];
-z q[44];
-ccx q[43],q[14],q[44];
-ccx q[42],q[13],q[43];
-ccx q[41],q[12],q[42];
-ccx q[40],q[11],q[41];
-ccx q[39],q[10],q[40];
-ccx q[38],q[9],q[39];
-ccx q[37],q[8],q[38];
-ccx q[36],q[7],q[37];
-ccx q[35],q[6],q[36];
-ccx q[34],q[5],q[35];
-ccx q[33],q[4],q[34];
-ccx q[32],q[3],q[33];
-ccx q[31],q[2],q[32];
-ccx q[1],q[0],q[31];
-x q[0];
-x q[1];
-x q[2];
-x q[3];
-x q[4];
-x q[5];
-x q[6];
-x q[7];
-x q[8];
-x q[9];
-x q[10];
-x q[11];
-x q[12];
-x q[13];
-x q[14];
-h q[0];
-h q[1];
-h q[2];
-h q[3];
-h q[4];
-h q[5];
-h q[6];
-h q[7];
-h q[8];
-h q[9];
-h q[10];
-h q[11];
-h q[12];
-h q[13];
-h q[14];
-cx q[0],q[15];
-cx q[1],q[17];
-cx q[2],q[19];
-cx q[3],q[21];
-cx q[4],q[23];
-cx q[5],q[25];
-cx q[6],q[27];
-cx q[7],q[29];
-cx q[8],q[16];
-cx q[8],q[17];
-cx q[9],q[18];
-cx q[9],q[19];
-cx q[10],q[20];
-cx q[10],q[21];
-cx q[11],q[22];
-cx q[11],q[23];
-cx q[12],q[24];
-cx q[12],q[25];
-cx q[13],q[26];
-cx q[13],q[27];
-cx q[14],q[28];
-cx q[14],q[29];
-x q[15];
-x q[17];
-x q[18];
-x q[19];
-x q[20];
-x q[21];
-x q[22];
-x q[23];
-x q[24];
-x q[25];
-x q[26];
-x q[27];
-x q[28];
-x q[29];
-reset q[31];
-reset q[32];
-reset q[33];
-reset q[34];
-reset q[35];
-reset q[36];
-reset q[37];
-reset q[38];
-reset q[39];
-reset q[40];
-reset q[41];
-reset q[42];
-reset q[43];
-reset q[44];
-ccx q[16],q[15],q[31];
-ccx q[31],q[17],q[32];
-ccx q[32],q[18],q[33];
-ccx q[33],q[19],q[34];
-ccx q[34],q[20],q[35];
-ccx q[35],q[21],q[36];
-ccx q[36],q[22],q[37];
-ccx q[37],q[23],q[38];
-ccx q[38],q[24],q[39];
-ccx q[39],q[25],q[40];
-ccx q[40],q[26],q[41];
-ccx q[41],q[27],q[42];
-ccx q[42],q[28],q[43];
-ccx q[43],q[29],q[44];
-z q[44];
-ccx q[43],q[29],q[44];
-ccx q[42],q[28],q[43];
-ccx q[41],q[27],q[42];
-ccx q[40],q[26],q[41];
-ccx q[39],q[25],q[40];
-ccx q[38],q[24],q[39];
-ccx q[37],q[23],q[38];
-ccx q[36],q[22],q[37];
-ccx q[35],q[21],q[36];
-ccx q[34],q[20],q[35];
-ccx q[33],q[19],q[34];
-ccx q[32],q[18],q[33];
-ccx q[31],q[17],q[32];
-ccx q[16],q[15],q[31];
-x q[15];
-x q[17];
-x q[18];
-x q[19];
-x q[20];
-x q[21];
-x q[22];
-x q[23];
-x q[24];
-x q[25];
-x q[26];
-x q[27];
-x q[28];
-x q[29];
-cx q[0],q[15];
-cx q[1],q[17];
-cx q[2],q[19];
-cx q[3],q[21];
-cx q[4],q[23];
-cx q[5],q[25];
-cx q[6],q[27];
-cx q[7],q[29];
-cx q[8],q[16];
-cx q[8],q[17];
-cx q[9],q[18];
-cx q[9],q[19];
-cx q[10],q[20];
-cx q[10],q[21];
-cx q[11],q[22];
-cx q[11],q[23];
-cx q[12],q[24];
-cx q[12],q[25];
-cx q[13],q[26];
-cx q[13],q[27];
-cx q[14],q[28];
-cx q[14],q[29];
-h q[0];
-h q[1];
-h q[2];
-h q[3];
-h q[4];
-h q[5];
-h q[6];
-h q[7];
-h q[8];
-h q[9];
-h q[10];
-h q[11];
-h q[12];
-h q[13];
-h q[14];
-x q[0];
-x q[1];
-x q[2];
-x q[3];
-x q[4];
-x q[5];
-x q[6];
-x q[7];
-x q[8];
-x q[9];
-x q[10];
-x q[11];
-x q[12];
-x q[13];
-x q[14];
-reset q[31];
-reset q[32];
-reset q[33];
-reset q[34];
-reset q[35];
-reset q[36];
-reset q[37];
-reset q[38];
-reset q[39];
-reset q[40];
-reset q[41];
-reset q[42];
-reset q[43];
-reset q[44];
-ccx q[1],q[0],q[31];
-ccx q[31],q[2],q[32];
-ccx q[32],q[3],q[33];
-ccx q[33],q[4],q[34];
-ccx q[34],q[5],q[35];
-ccx q[35],q[6],q[36];
-ccx q[36],q[7],q[37];
-ccx q[37],q[8],q[38];
-ccx q[38],q[9],q[39];
-ccx q[39],q[10],q[40];
-ccx q[40],q[11],q[41];
-ccx q[41],q[12],q[42];
-ccx q[42],q[13],q[43];
-ccx q[43],q[14],q[44];
-z q[44];
-ccx q[43],q[14],q[44];
-ccx q[42],q[13],q[43];
-ccx q[41],q[12],q[42];
-ccx q[40],q[11],q[41];
-ccx q[39],q[10],q[40];
-ccx q[38],q[9],q[39];
-ccx q[37],q[8],q[38];
-ccx q[36],q[7],q[37];
-ccx q[35],q[6],q[36];
-ccx q[34],q[5],q[35];
-ccx q[33],q[4],q[34];
-ccx q[32],q[3],q[33];
-ccx q[31],q[2],q[32];
-ccx q[1],q[0],q[31];
-x q[0];
-x q[1];
-x q[2];
-x q[3];
-x q[4];
-x q[5];
-x q[6];
-x q[7];
-x q[8];
-x q[9];
-x q[10];
-x q[11];
-x q[12];
-x q[13];
-x q[14];
-h q[0];
-h q[1];
-h q[2];
-h q[3];
-h q[4];
-h q[5];
-h q[6];
-h q[7];
-h q[8];
-h q[9];
-h q[10];
-h q[11];
-h q[12];
-h q[13];
-h q[14];
-cx q[0],q[15];
-cx q[1],q[17];
-cx q[2],q[19];
-cx q[3],q[21];
-cx q[4],q[23];
-cx q[5],q[25];
-cx q[6],q[27];
-cx q[7],q[29];
-cx q[8],q[16];
-cx q[8],q[17];
-cx q[9],q[18];
-cx q[9],q[19];
-cx q[10],q[20];
-cx q[10],q[21];
-cx q[11],q[22];
-cx q[11],q[23];
-cx q[12],q[24];
-cx q[12],q[25];
-cx q[13],q[26];
-cx q[13],q[27];
-cx q[14],q[28];
-cx q[14],q[29];
-x q[15];
-x q[17];
-x q[18];
-x q[19];
-x q[20];
-x q[21];
-x q[22];
-x q[23];
-x q[24];
-x q[25];
-x q[26];
-x q[27];
-x q[28];
-x q[29];
-reset q[31];
-reset q[32];
-reset q[33];
-reset q[34];
-reset q[35];
-reset q[36];
-reset q[37];
-reset q[38];
-reset q[39];
-reset q[40];
-reset q[41];
-reset q[42];
-reset q[43];
-reset q[44];
-ccx q[16],q[15],q[31];
-ccx q[31],q[17],q[32];
-ccx q[32],q[18],q[33];
-ccx q[33],q[19],q[34];
-ccx q[34],q[20],q[35];
-ccx q[35],q[21],q[36];
-ccx q[36],q[22],q[37];
-ccx q[37],q[23],q[38];
-ccx q[38],q[24],q[39];
-ccx q[39],q[25],q[40];
-ccx q[40],q[26],q[41];
-ccx q[41],q[27],q[42];
-ccx q[42],q[28],q[43];
-ccx q[43],q[29],q[44];
-z q[44];
-ccx q[43],q[29],q[44];
-ccx q[42],q[28],q[43];
-ccx q[41],q[27],q[42];
-ccx q[40],q[26],q[41];
-ccx q[39],q[25],q[40];
-ccx q[38],q[24],q[39];
-ccx q[37],q[23],q[38];
-ccx q[36],q[22],q[37];
-ccx q[35],q[21],q[36];
-ccx q[34],q[20],q[35];
-ccx q[33],q[19],q[34];
-ccx q[32],q[18],q[33];
-ccx q[31],q[17],q[32];
-ccx q[16],q[15],q[31];
-x q[15];
-x q[17];
-x q[18];
-x q[19];
-x q[20];
-x q[21];
-x q[22];
-x q[23];
-x q[24];
-x q[25];
-x q[26];
-x q[27];
-x q[28];
-x q[29];
-cx q[0],q[15];
-cx q[1],q[17];
-cx q[2],q[19];
-cx q[3],q[21];
-cx q[4],q[23];
-cx q[5],q[25];
-cx q[6],q[27];
-cx q[7],q[29];
-cx q[8],q[16];
-cx q[8],q[17];
-cx q[9],q[18];
-cx q[9],q[19];
-cx q[10],q[20];
-cx q[10],q[21];
-cx q[11],q[22];
-cx q[11],q[23];
-cx q[12],q[24];
-cx q[12],q[25];
-cx q[13],q[26];
-cx q[13],q[27];
-cx q[14],q[28];
-cx q[14],q[29];
-h q[0];
-h q[1];
-h q[2];
-h q[3];
-h q[4];
-h q[5];
-h q[6];
-h q[7];
-h q[8];
-h q[9];
-h q[10];
-h q[11];
-h q[12];
-h q[13];
-h q[14];
-x q[0];
-x q[1];
-x q[2];
-x q[3];
-x q[4];
-x q[5];
-x q[6];
-x q[7];
-x q[8];
-x q[9];
-x q[10];
-x q[11];
-x q[12];
-x q[13];
-x q[14];
-reset q[31];
-reset q[32];
-reset q[33];
-reset q[34];
-reset q[35];
-reset q[36];
-reset q[37];
-reset q[38];
-reset q[39];
-reset q[40];
-reset q[41];
-reset q[42];
-reset q[43];
-reset q[44];
-ccx q[1],q[0],q[31];
-ccx q[31],q[2],q[32];
-ccx q[32],q[3],q[33];
-ccx q[33],q[4],q[34];
-ccx q[34],q[5],q[35];
-ccx q[35],q[6],q[36];
-ccx q[36],q[7],q[37];
-ccx q[37],q[8],q[38];
-ccx q[38],q[9],q[39];
-ccx q[39],q[10],q[40];
-ccx q[40],q[11],q[41];
-ccx q[41],q[12],q[42];
-ccx q[42],q[13],q[43];
-ccx q[43],q[14],q[44];
-z q[44];
-ccx q[43],q[14],q[44];
-ccx q[42],q[13],q[43];
-ccx q[41],q[12],q[42];
-ccx q[40],q[11],q[41];
-ccx q[39],q[10],q[40];
-ccx q[38],q[9],q[39];
-ccx q[37],q[8],q[38];
-ccx q[36],q[7],q[37];
-ccx q[35],q[6],q[36];
-ccx q[34],q[5],q[35];
-ccx q[33],q[4],q[34];
-ccx q[32],q[3],q[33];
-ccx q[31],q[2],q[32];
-ccx q[1],q[0],q[31];
-x q[0];
-x q[1];
-x q[2];
-x q[3];
-x q[4];
-x q[5];
-x q[6];
-x q[7];
-x q[8];
-x q[9];
-x q[10];
-x q[11];
-x q[12];
-x q[13];
-x q[14];
-h q[0];
-h q[1];
-h q[2];
-h q[3];
-h q[4];
-h q[5];
-h q[6];
-h q[7];
-h q[8];
-h q[9];
-h q[10];
-h q[11];
-h q[12];
-h q[13];
-h q[14];
-cx q[0],q[15];
-cx q[1],q[17];
-cx q[2],q[19];
-cx q[3],q[21];
-cx q[4],q[23];
-cx q[5],q[25];
-cx q[6],q[27];
-cx q[7],q[29];
-cx q[8],q[16];
-cx q[8],q[17];
-cx q[9],q[18];
-cx q[9],q[19];
-cx q[10],q[20];
-cx q[10],q[21];
-cx q[11],q[22];
-cx q[11],q[23];
-cx q[12],q[24];
-cx q[12],q[25];
-cx q[13],q[26];
-cx q[13],q[27];
-cx q[14],q[28];
-cx q[14],q[29];
-x q[15];
-x q[17];
-x q[18];
-x q[19];
-x q[20];
-x q[21];
-x q[22];
-x q[23];
-x q[24];
-x q[25];
-x q[26];
-x q[27];
-x q[28];
-x q[29];
-reset q[31];
-reset q[32];
-reset q[33];
-reset q[34];
-reset q[35];
-reset q[36];
-reset q[37];
-reset q[38];
-reset q[39];
-reset q[40];
-reset q[41];
-reset q[42];
-reset q[43];
-reset q[44];
-ccx q[16],q[15],q[31];
-ccx q[31],q[17],q[32];
-ccx q[32],q[18],q[33];
-ccx q[33],q[19],q[34];
-ccx q[34],q[20],q[35];
-ccx q[35],q[21],q[36];
-ccx q[36],q[22],q[37];
-ccx q[37],q[23],q[38];
-ccx q[38],q[24],q[39];
-ccx q[39],q[25],q[40];
-ccx q[40],q[26],q[41];
-ccx q[41],q[27],q[42];
-ccx q[42],q[28],q[43];
-ccx q[43],q[29],q[44];
-z q[44];
-ccx q[43],q[29],q[44];
-ccx q[42],q[28],q[43];
-ccx q[41],q[27],q[42];
-ccx q[40],q[26],q[41];
-ccx q[39],q[25],q[40];
-ccx q[38],q[24],q[39];
-ccx q[37],q[23],q[38];
-ccx q[36],q[22],q[37];
-ccx q[35],q[21],q[36];
-ccx q[34],q[20],q[35];
-ccx q[33],q[19],q[34];
-ccx q[32],q[18],q[33];
-ccx q[31],q[17],q[32];
-ccx q[16],q[15],q[31];
-x q[15];
-x q[17];
-x q[18];
-x q[19];
-x q[20];
-x q[21];
-x q[22];
-x q[23];
-x q[24];
-x q[25];
-x q[26];
-x q[27];
-x q[28];
-x q[29];
-cx q[0],q[15];
-cx q[1],q[17];
-cx q[2],q[19];
-cx q[3],q[21];
-cx q[4],q[23];
-cx q[5],q[25];
-cx q[6],q[27];
-cx q[7],q[29];
-cx q[8],q[16];
-cx q[8],q[17];
-cx q[9],q[18];
-cx q[9],q[19];
-cx q[10],q[20];
-cx q[10],q[21];
-cx q[11],q[22];
-cx q[11],q[23];
-cx q[12],q[24];
-cx q[12],q[25];
-cx q[13],q[26];
-cx q[13],q[27];
-cx q[14],q[28];
-cx q[14],q[29];
-h q[0];
-h q[1];
-h q[2];
-h q[3];
-h q[4];
-h q[5];
-h q[6];
-h q[7];
-h q[8];
-h q[9];
-h q[10];
-h q[11];
-h q[12];
-h q[13];
-h q[14];
-x q[0];
-x q[1];
-x q[2];
-x q[3];
-x q[4];
-x q[5];
-x q[6];
-x q[7];
-x q[8];
-x q[9];
-x q[10];
-x q[11];
-x q[12];
-x q[13];
-x q[14];
-reset q[31];
-reset q[32];
-reset q[33];
-reset q[34];
-reset q[35];
-reset q[36];
-reset q[37];
-reset q[38];
-reset q[39];
-reset q[40];
-reset q[41];
-reset q[42];
-reset q[43];
-reset q[44];
-ccx q[1],q[0],q[31];
-ccx q[31],q[2],q[32];
-ccx q[32],q[3],q[33];
-ccx q[33],q[4],q[34];
-ccx q[34],q[5],q[35];
-ccx q[35],q[6],q[36];
-ccx q[36],q[7],q[37];
-ccx q[37],q[8],q[38];
-ccx q[38],q[9],q[39];
-ccx q[39],q[10],q[40];
-ccx q[40],q[11],q[41];
-ccx q[41],q[12],q[42];
-ccx q[42],q[13],q[43];
-ccx q[43],q[14],q[44];
-z q[44];
-ccx q[43],q[14],q[44];
-ccx q[42],q[13],q[43];
-ccx q[41],q[12],q[42];
-ccx q[40],q[11],q[41];
-ccx q[39],q[10],q[40];
-ccx q[38],q[9],q[39];
-ccx q[37],q[8],q[38];
-ccx q[36],q[7],q[37];
-ccx q[35],q[6],q[36];
-ccx q[34],q[5],q[35];
-ccx q[33],q[4],q[34];
-ccx q[32],q[3],q[33];
-ccx q[31],q[2],q[32];
-ccx q[1],q[0],q[31];
-x q[0];
-x q[1];
-x q[2];
-x q[3];
-x q[4];
-x q[5];
-x q[6];
-x q[7];
-x q[8];
-x q[9];
-x q[10];
-x q[11];
-x q[12];
-x q[13];
-x q[14];
-h q[0];
-h q[1];
-h q[2];
-h q[3];
-h q[4];
-h q[5];
-h q[6];
-h q[7];
-h q[8];
-h q[9];
-h q[10];
-h q[11];
-h q[12];
-h q[13];
-h q[14];
-cx q[0],q[15];
-cx q[1],q[17];
-cx q[2],q[19];
-cx q[3],q[21];
-cx q[4],q[23];
-cx q[5],q[25];
-cx q[6],q[27];
-cx q[7],q[29];
-cx q[8],q[16];
-cx q[8],q[17];
-cx q[9],q[18];
-cx q[9],q[19];
-cx q[10],q[20];
-cx q[10],q[21];
-cx q[11],q[22];
-cx q[11],q[23];
-cx q[12],q[24];
-cx q[12],q[25];
-cx q[13],q[26];
-cx q[13],q[27];
-cx q[14],q[28];
-cx q[14],q[29];
-x q[15];
-x q[17];
-x q[18];
-x q[19];
-x q[20];
-x q[21];
-x q[22];
-x q[23];
-x q[24];
-x q[25];
-x q[26];
-x q[27];
-x q[28];
-x q[29];
-reset q[31];
-reset q[32];
-reset q[33];
-reset q[34];
-reset q[35];
-reset q[36];
-reset q[37];
-reset q[38];
-reset q[39];
-reset q[40];
-reset q[41];
-reset q[42];
-reset q[43];
-reset q[44];
-ccx q[16],q[15],q[31];
-ccx q[31],q[17],q[32];
-ccx q[32],q[18],q[33];
-ccx q[33],q[19],q[34];
-ccx q[34],q[20],q[35];
-ccx q[35],q[21],q[36];
-ccx q[36],q[22],q[37];
-ccx q[37],q[23],q[38];
-ccx q[38],q[24],q[39];
-ccx q[39],q[25],q[40];
-ccx q[40],q[26],q[41];
-ccx q[41],q[27],q[42];
-ccx q[42],q[28],q[43];
-ccx q[43],q[29],q[44];
-z q[44];
-ccx q[43],q[29],q[44];
-ccx q[42],q[28],q[43];
-ccx q[41],q[27],q[42];
-ccx q[40],q[26],q[41];
-ccx q[39],q[25],q[40];
-ccx q[38],q[24],q[39];
-ccx q[37],q[23],q[38];
-ccx q[36],q[22],q[37];
-ccx q[35],q[21],q[36];
-ccx q[34],q[20],q[35];
-ccx q[33],q[19],q[34];
-ccx q[32],q[18],q[33];
-ccx q[31],q[17],q[32];
-ccx q[16],q[15],q[31];
-x q[15];
-x q[17];
-x q[18];
-x q[19];
-x q[20];
-x q[21];
-x q[22];
-x q[23];
-x q[24];
-x q[25];
-x q[26];
-x q[27];
-x q[28];
-x q[29];
-cx q[0],q[15];
-cx q[1],q[17];
-cx q[2],q[19];
-cx q[3],q[21];
-cx q[4],q[23];
-cx q[5],q[25];
-cx q[6],q[27];
-cx q[7],q[29];
-cx q[8],q[16];
-cx q[8],q[17];
-cx q[9],q[18];
-cx q[9],q[19];
-cx q[10],q[20];
-cx q[10],q[21];
-cx q[11],q[22];
-cx q[11],q[23];
-cx q[12],q[24];
-cx q[12],q[25];
-cx q[13],q[26];
-cx q[13],q[27];
-cx q[14],q[28];
-cx q[14],q[29];
-h q[0];
-h q[1];
-h q[2];
-h q[3];
-h q[4];
-h q[5];
-h q[6];
-h q[7];
-h q[8];
-h q[9];
-h q[10];
-h q[11];
-h q[12];
-h q[13];
-h q[14];
-x q[0];
-x q[1];
-x q[2];
-x q[3];
-x q[4];
-x q[5];
-x q[6];
-x q[7];
-x q[8];
-x q[9];
-x q[10];
-x q[11];
-x q[12];
-x q[13];
-x q[14];
-reset q[31];
-reset q[32];
-reset q[33];
-reset q[34];
-reset q[35];
-reset q[36];
-reset q[37];
-reset q[38];
-reset q[39];
-reset q[40];
-reset q[41];
-reset q[42];
-reset q[43];
-reset q[44];
-ccx q[1],q[0],q[31];
-ccx q[31],q[2],q[32];
-ccx q[32],q[3],q[33];
-ccx q[33],q[4],q[34];
-ccx q[34],q[5],q[35];
-ccx q[35],q[6],q[36];
-ccx q[36],q[7],q[37];
-ccx q[37],q[8],q[38];
-ccx q[38],q[9],q[39];
-ccx q[39],q[10],q[40];
-ccx q[40],q[11],q[41];
-ccx q[41],q[12],q[42];
-ccx q[42],q[13],q[43];
-ccx q[43],q[14],q[44];
-z q[44];
-ccx q[43],q[14],q[44];
-ccx q[42],q[13],q[43];
-ccx q[41],q[12],q[42];
-ccx q[40],q[11],q[41];
-ccx q[39],q[10],q[40];
-ccx q[38],q[9],q[39];
-ccx q[37],q[8],q[38];
-ccx q[36],q[7],q[37];
-ccx q[35],q[6],q[36];
-ccx q[34],q[5],q[35];
-ccx q[33],q[4],q[34];
-ccx q[32],q[3],q[33];
-ccx q[31],q[2],q[32];
-ccx q[1],q[0],q[31];
-x q[0];
-x q[1];
-x q[2];
-x q[3];
-x q[4];
-x q[5];
-x q[6];
-x q[7];
-x q[8];
-x q[9];
-x q[10];
-x q[11];
-x q[12];
-x q[13];
-x q[14];
-h q[0];
-h q[1];
-h q[2];
-h q[3];
-h q[4];
-h q[5];
-h q[6];
-h q[7];
-h q[8];
-h q[9];
-h q[10];
-h q[11];
-h q[12];
-h q[13];
-h q[14];
-cx q[0],q[15];
-cx q[1],q[17];
-cx q[2],q[19];
-cx q[3],q[21];
-cx q[4],q[23];
-cx q[5],q[25];
-cx q[6],q[27];
-cx q[7],q[29];
-cx q[8],q[16];
-cx q[8],q[17];
-cx q[9],q[18];
-cx q[9],q[19];
-cx q[10],q[20];
-cx q[10],q[21];
-cx q[11],q[22];
-cx q[11],q[23];
-cx q[12],q[24];
-cx q[12],q[25];
-cx q[13],q[26];
-cx q[13],q[27];
-cx q[14],q[28];
-cx q[14],q[29];
-x q[15];
-x q[17];
-x q[18];
-x q[19];
-x q[20];
-x q[21];
-x q[22];
-x q[23];
-x q[24];
-x q[25];
-x q[26];
-x q[27];
-x q[28];
-x q[29];
-reset q[31];
-reset q[32];
-reset q[33];
-reset q[34];
-reset q[35];
-reset q[36];
-reset q[37];
-reset q[38];
-reset q[39];
-reset q[40];
-reset q[41];
-reset q[42];
-reset q[43];
-reset q[44];
-ccx q[16],q[15],q[31];
-ccx q[31],q[17],q[32];
-ccx q[32],q[18],q[33];
-ccx q[33],q[19],q[34];
-ccx q[34],q[20],q[35];
-ccx q[35],q[21],q[36];
-ccx q[36],q[22],q[37];
-ccx q[37],q[23],q[38];
-ccx q[38],q[24],q[39];
-ccx q[39],q[25],q[40];
-ccx q[40],q[26],q[41];
-ccx q[41],q[27],q[42];
-ccx q[42],q[28],q[43];
-ccx q[43],q[29],q[44];
-z q[44];
-ccx q[43],q[29],q[44];
-ccx q[42],q[28],q[43];
-ccx q[41],q[27],q[42];
-ccx q[40],q[26],q[41];
-ccx q[39],q[25],q[40];
-ccx q[38],q[24],q[39];
-ccx q[37],q[23],q[38];
-ccx q[36],q[22],q[37];
-ccx q[35],q[21],q[36];
-ccx q[34],q[20],q[35];
-ccx q[33],q[19],q[34];
-ccx q[32],q[18],q[33];
-ccx q[31],q[17],q[32];
-ccx q[16],q[15],q[31];
-x q[15];
-x q[17];
-x q[18];
-x q[19];
-x q[20];
-x q[21];
-x q[22];
-x q[23];
-x q[24];
-x q[25];
-x q[26];
-x q[27];
-x q[28];
-x q[29];
-cx q[0],q[15];
-cx q[1],q[17];
-cx q[2],q[19];
-cx q[3],q[21];
-cx q[4],q[23];
-cx q[5],q[25];
-cx q[6],q[27];
-cx q[7],q[29];
-cx q[8],q[16];
-cx q[8],q[17];
-cx q[9],q[18];
-cx q[9],q[19];
-cx q[10],q[20];
-cx q[10],q[21];
-cx q[11],q[22];
-cx q[11],q[23];
-cx q[12],q[24];
-cx q[12],q[25];
-cx q[13],q[26];
-cx q[13],q[27];
-cx q[14],q[28];
-cx q[14],q[29];
-h q[0];
-h q[1];
-h q[2];
-h q[3];
-h q[4];
-h q[5];
-h q[6];
-h q[7];
-h q[8];
-h q[9];
-h q[10];
-h q[11];
-h q[12];
-h q[13];
-h q[14];
-x q[0];
-x q[1];
-x q[2];
-x q[3];
-x q[4];
-x q[5];
-x q[6];
-x q[7];
-x q[8];
-x q[9];
-x q[10];
-x q[11];
-x q[12];
-x q[13];
-x q[14];
-reset q[31];
-reset q[32];
-reset q[33];
-reset q[34];
-reset q[35];
-reset q[36];
-reset q[37];
-reset q[38];
-reset q[39];
-reset q[40];
-reset q[41];
-reset q[42];
-reset q[43];
-reset q[44];
-ccx q[1],q[0],q[31];
-ccx q[31],q[2],q[32];
-ccx q[32],q[3],q[33];
-ccx q[33],q[4],q[34];
-ccx q[34],q[5],q[35];
-ccx q[35],q[6],q[36];
-ccx q[36],q[7],q[37];
-ccx q[37],q[8],q[38];
-ccx q[38],q[9],q[39];
-ccx q[39],q[10],q[40];
-ccx q[40],q[11],q[41];
-ccx q[41],q[12],q[42];
-ccx q[42],q[13],q[43];
-ccx q[43],q[14],q[44];
-z q[44];
-ccx q[43],q[14],q[44];
-ccx q[42],q[13],q[43];
-ccx q[41],q[12],q[42];
-ccx q[40],q[11],q[41];
-ccx q[39],q[10],q[40];
-ccx q[38],q[9],q[39];
-ccx q[37],q[8],q[38];
-ccx q[36],q[7],q[37];
-ccx q[35],q[6],q[36];
-ccx q[34],q[5],q[35];
-ccx q[33],q[4],q[34];
-ccx q[32],q[3],q[33];
-ccx q[31],q[2],q[32];
-ccx q[1],q[0],q[31];
-x q[0];
-x q[1];
-x q[2];
-x q[3];
-x q[4];
-x q[5];
-x q[6];
-x q[7];
-x q[8];
-x q[9];
-x q[10];
-x q[11];
-x q[12];
-x q[13];
-x q[14];
-h q[0];
-h q[1];
-h q[2];
-h q[3];
-h q[4];
-h q[5];
-h q[6];
-h q[7];
-h q[8];
-h q[9];
-h q[10];
-h q[11];
-h q[12];
-h q[13];
-h q[14];
-cx q[0],q[15];
-cx q[1],q[17];
-cx q[2],q[19];
-cx q[3],q[21];
-cx q[4],q[23];
-cx q[5],q[25];
-cx q[6],q[27];
-cx q[7],q[29];
-cx q[8],q[16];
-cx q[8],q[17];
-cx q[9],q[18];
-cx q[9],q[19];
-cx q[10],q[20];
-cx q[10],q[21];
-cx q[11],q[22];
-cx q[11],q[23];
-cx q[12],q[24];
-cx q[12],q[25];
-cx q[13],q[26];
-cx q[13],q[27];
-cx q[14],q[28];
-cx q[14],q[29];
-x q[15];
-x q[17];
-x q[18];
-x q[19];
-x q[20];
-x q[21];
-x q[22];
-x q[23];
-x q[24];
-x q[25];
-x q[26];
-x q[27];
-x q[28];
-x q[29];
-reset q[31];
-reset q[32];
-reset q[33];
-reset q[34];
-reset q[35];
-reset q[36];
-reset q[37];
-reset q[38];
-reset q[39];
-reset q[40];
-reset q[41];
-reset q[42];
-reset q[43];
-reset q[44];
-ccx q[16],q[15],q[31];
-ccx q[31],q[17],q[32];
-ccx q[32],q[18],q[33];
-ccx q[33],q[19],q[34];
-ccx q[34],q[20],q[35];
-ccx q[35],q[21],q[36];
-ccx q[36],q[22],q[37];
-ccx q[37],q[23],q[38];
-ccx q[38],q[24],q[39];
-ccx q[39],q[25],q[40];
-ccx q[40],q[26],q[41];
-ccx q[41],q[27],q[42];
-ccx q[42],q[28],q[43];
-ccx q[43],q[29],q[44];
-z q[44];
-ccx q[43],q[29],q[44];
-ccx q[42],q[28],q[43];
-ccx q[41],q[27],q[42];
-ccx q[40],q[26],q[41];
-ccx q[39],q[25],q[40];
-ccx q[38],q[24],q[39];
-ccx q[37],q[23],q[38];
-ccx q[36],q[22],q[37];
-ccx q[35],q[21],q[36];
-ccx q[34],q[20],q[35];
-ccx q[33],q[19],q[34];
-ccx q[32],q[18],q[33];
-ccx q[31],q[17],q[32];
-ccx q[16],q[15],q[31];
-x q[15];
-x q[17];
-x q[18];
-x q[19];
-x q[20];
-x q[21];
-x q[22];
-x q[23];
-x q[24];
-x q[25];
-x q[26];
-x q[27];
-x q[28];
-x q[29];
-cx q[0],q[15];
-cx q[1],q[17];
-cx q[2],q[19];
-cx q[3],q[21];
-cx q[4],q[23];
-cx q[5],q[25];
-cx q[6],q[27];
-cx q[7],q[29];
-cx q[8],q[16];
-cx q[8],q[17];
-cx q[9],q[18];
-cx q[9],q[19];
-cx q[10],q[20];
-cx q[10],q[21];
-cx q[11],q[22];
-cx q[11],q[23];
-cx q[12],q[24];
-cx q[12],q[25];
-cx q[13],q[26];
-cx q[13],q[27];
-cx q[14],q[28];
-cx q[14],q[29];
-h q[0];
-h q[1];
-h q[2];
-h q[3];
-h q[4];
-h q[5];
-h q[6];
-h q[7];
-h q[8];
-h q[9];
-h q[10];
-h q[11];
-h q[12];
-h q[13];
-h q[14];
-x q[0];
-x q[1];
-x q[2];
-x q[3];
-x q[4];
-x q[5];
-x q[6];
-x q[7];
-x q[8];
-x q[9];
-x q[10];
-x q[11];
-x q[12];
-x q[13];
-x q[14];
-reset q[31];
-reset q[32];
-reset q[33];
-reset q[34];
-reset q[35];
-reset q[36];
-reset q[37];
-reset q[38];
-reset q[39];
-reset q[40];
-reset q[41];
-reset q[42];
-reset q[43];
-reset q[44];
-ccx q[1],q[0],q[31];
-ccx q[31],q[2],q[32];
-ccx q[32],q[3],q[33];
-ccx q[33],q[4],q[34];
-ccx q[34],q[5],q[35];
-ccx q[35],q[6],q[36];
-ccx q[36],q[7],q[37];
-ccx q[37],q[8],q[38];
-ccx q[38],q[9],q[39];
-ccx q[39],q[10],q[40];
-ccx q[40],q[11],q[41];
-ccx q[41],q[12],q[42];
-ccx q[42],q[13],q[43];
-ccx q[43],q[14],q[44];
-z q[44];
-ccx q[43],q[14],q[44];
-ccx q[42],q[13],q[43];
-ccx q[41],q[12],q[42];
-ccx q[40],q[11],q[41];
-ccx q[39],q[10],q[40];
-ccx q[38],q[9],q[39];
-ccx q[37],q[8],q[38];
-ccx q[36],q[7],q[37];
-ccx q[35],q[6],q[36];
-ccx q[34],q[5],q[35];
-ccx q[33],q[4],q[34];
-ccx q[32],q[3],q[33];
-ccx q[31],q[2],q[32];
-ccx q[1],q[0],q[31];
-x q[0];
-x q[1];
-x q[2];
-x q[3];
-x q[4];
-x q[5];
-x q[6];
-x q[7];
-x q[8];
-x q[9];
-x q[10];
-x q[11];
-x q[12];
-x q[13];
-x q[14];
-h q[0];
-h q[1];
-h q[2];
-h q[3];
-h q[4];
-h q[5];
-h q[6];
-h q[7];
-h q[8];
-h q[9];
-h q[10];
-h q[11];
-h q[12];
-h q[13];
-h q[14];
-cx q[0],q[15];
-cx q[1],q[17];
-cx q[2],q[19];
-cx q[3],q[21];
-cx q[4],q[23];
-cx q[5],q[25];
-cx q[6],q[27];
-cx q[7],q[29];
-cx q[8],q[16];
-cx q[8],q[17];
-cx q[9],q[18];
-cx q[9],q[19];
-cx q[10],q[20];
-cx q[10],q[21];
-cx q[11],q[22];
-cx q[11],q[23];
-cx q[12],q[24];
-cx q[12],q[25];
-cx q[13],q[26];
-cx q[13],q[27];
-cx q[14],q[28];
-cx q[14],q[29];
-x q[15];
-x q[17];
-x q[18];
-x q[19];
-x q[20];
-x q[21];
-x q[22];
-x q[23];
-x q[24];
-x q[25];
-x q[26];
-x q[27];
-x q[28];
-x q[29];
-reset q[31];
-reset q[32];
-reset q[33];
-reset q[34];
-reset q[35];
-reset q[36];
-reset q[37];
-reset q[38];
-reset q[39];
-reset q[40];
-reset q[41];
-reset q[42];
-reset q[43];
-reset q[44];
-ccx q[16],q[15],q[31];
-ccx q[31],q[17],q[32];
-ccx q[32],q[18],q[33];
-ccx q[33],q[19],q[34];
-ccx q[34],q[20],q[35];
-ccx q[35],q[21],q[36];
-ccx q[36],q[22],q[37];
-ccx q[37],q[23],q[38];
-ccx q[38],q[24],q[39];
-ccx q[39],q[25],q[40];
-ccx q[40],q[26],q[41];
-ccx q[41],q[27],q[42];
-ccx q[42],q[28],q[43];
-ccx q[43],q[29],q[44];
-z q[44];
-ccx q[43],q[29],q[44];
-ccx q[42],q[28],q[43];
-ccx q[41],q[27],q[42];
-ccx q[40],q[26],q[41];
-ccx q[39],q[25],q[40];
-ccx q[38],q[24],q[39];
-ccx q[37],q[23],q[38];
-ccx q[36],q[22],q[37];
-ccx q[35],q[21],q[36];
-ccx q[34],q[20],q[35];
-ccx q[33],q[19],q[34];
-ccx q[32],q[18],q[33];
-ccx q[31],q[17],q[32];
-ccx q[16],q[15],q[31];
-x q[15];
-x q[17];
-x q[18];
-x q[19];
-x q[20];
-x q[21];
-x q[22];
-x q[23];
-x q[24];
-x q[25];
-x q[26];
-x q[27];
-x q[28];
-x q[29];
-cx q[0],q[15];
-cx q[1],q[17];
-cx q[2],q[19];
-cx q[3],q[21];
-cx q[4],q[23];
-cx q[5],q[25];
-cx q[6],q[27];
-cx q[7],q[29];
-cx q[8],q[16];
-cx q[8],q[17];
-cx q[9],q[18];
-cx q[9],q[19];
-cx q[10],q[20];
-cx q[10],q[21];
-cx q[11],q[22];
-cx q[11],q[23];
-cx q[12],q[24];
-cx q[12],q[25];
-cx q[13],q[26];
-cx q[13],q[27];
-cx q[14],q[28];
-cx q[14],q[29];
-h q[0];
-h q[1];
-h q[2];
-h q[3];
-h q[4];
-h q[5];
-h q[6];
-h q[7];
-h q[8];
-h q[9];
-h q[10];
-h q[11];
-h q[12];
-h q[13];
-h q[14];
-x q[0];
-x q[1];
-x q[2];
-x q[3];
-x q[4];
-x q[5];
-x q[6];
-x q[7];
-x q[8];
-x q[9];
-x q[10];
-x q[11];
-x q[12];
-x q[13];
-x q[14];
-reset q[31];
-reset q[32];
-reset q[33];
-reset q[34];
-reset q[35];
-reset q[36];
-reset q[37];
-reset q[38];
-reset q[39];
-reset q[40];
-reset q[41];
-reset q[42];
-reset q[43];
-reset q[44];
-ccx q[1],q[0],q[31];
-ccx q[31],q[2],q[32];
-ccx q[32],q[3],q[33];
-ccx q[33],q[4],q[34];
-ccx q[34],q[5],q[35];
-ccx q[35],q[6],q[36];
-ccx q[36],q[7],q[37];
-ccx q[37],q[8],q[38];
-ccx q[38],q[9],q[39];
-ccx q[39],q[10],q[40];
-ccx q[40],q[11],q[41];
-ccx q[41],q[12],q[42];
-ccx q[42],q[13],q[43];
-ccx q[43],q[14],q[44];
-z q[44];
-ccx q[43],q[14],q[44];
-ccx q[42],q[13],q[43];
-ccx q[41],q[12],q[42];
-ccx q[40],q[11],q[41];
-ccx q[39],q[10],q[40];
-ccx q[38],q[9],q[39];
-ccx q[37],q[8],q[38];
-ccx q[36],q[7],q[37];
-ccx q[35],q[6],q[36];
-ccx q[34],q[5],q[35];
-ccx q[33],q[4],q[34];
-ccx q[32],q[3],q[33];
-ccx q[31],q[2],q[32];
-ccx q[1],q[0],q[31];
-x q[0];
-x q[1];
-x q[2];
-x q[3];
-x q[4];
-x q[5];
-x q[6];
-x q[7];
-x q[8];
-x q[9];
-x q[10];
-x q[11];
-x q[12];
-x q[13];
-x q[14];
-h q[0];
-h q[1];
-h q[2];
-h q[3];
-h q[4];
-h q[5];
-h q[6];
-h q[7];
-h q[8];
-h q[9];
-h q[10];
-h q[11];
-h q[12];
-h q[13];
-h q[14];
-cx q[0],q[15];
-cx q[1],q[17];
-cx q[2],q[19];
-cx q[3],q[21];
-cx q[4],q[23];
-cx q[5],q[25];
-cx q[6],q[27];
-cx q[7],q[29];
-cx q[8],q[16];
-cx q[8],q[17];
-cx q[9],q[18];
-cx q[9],q[19];
-cx q[10],q[20];
-cx q[10],q[21];
-cx q[11],q[22];
-cx q[11],q[23];
-cx q[12],q[24];
-cx q[12],q[25];
-cx q[13],q[26];
-cx q[13],q[27];
-cx q[14],q[28];
-cx q[14],q[29];
-x q[15];
-x q[17];
-x q[18];
-x q[19];
-x q[20];
-x q[21];
-x q[22];
-x q[23];
-x q[24];
-x q[25];
-x q[26];
-x q[27];
-x q[28];
-x q[29];
-reset q[31];
-reset q[32];
-reset q[33];
-reset q[34];
-reset q[35];
-reset q[36];
-reset q[37];
-reset q[38];
-reset q[39];
-reset q[40];
-reset q[41];
-reset q[42];
-reset q[43];
-reset q[44];
-ccx q[16],q[15],q[31];
-ccx q[31],q[17],q[32];
-ccx q[32],q[18],q[33];
-ccx q[33],q[19],q[34];
-ccx q[34],q[20],q[35];
-ccx q[35],q[21],q[36];
-ccx q[36],q[22],q[37];
-ccx q[37],q[23],q[38];
-ccx q[38],q[24],q[39];
-ccx q[39],q[25],q[40];
-ccx q[40],q[26],q[41];
-ccx q[41],q[27],q[42];
-ccx q[42],q[28],q[43];
-ccx q[43],q[29],q[44];
-z q[44];
-ccx q[43],q[29],q[44];
-ccx q[42],q[28],q[43];
-ccx q[41],q[27],q[42];
-ccx q[40],q[26],q[41];
-ccx q[39],q[25],q[40];
-ccx q[38],q[24],q[39];
-ccx q[37],q[23],q[38];
-ccx q[36],q[22],q[37];
-ccx q[35],q[21],q[36];
-ccx q[34],q[20],q[35];
-ccx q[33],q[19],q[34];
-ccx q[32],q[18],q[33];
-ccx q[31],q[17],q[32];
-ccx q[16],q[15],q[31];
-x q[15];
-x q[17];
-x q[18];
-x q[19];
-x q[20];
-x q[21];
-x q[22];
-x q[23];
-x q[24];
-x q[25];
-x q[26];
-x q[27];
-x q[28];
-x q[29];
-cx q[0],q[15];
-cx q[1],q[17];
-cx q[2],q[19];
-cx q[3],q[21];
-cx q[4],q[23];
-cx q[5],q[25];
-cx q[6],q[27];
-cx q[7],q[29];
-cx q[8],q[16];
-cx q[8],q[17];
-cx q[9],q[18];
-cx q[9],q[19];
-cx q[10],q[20];
-cx q[10],q[21];
-cx q[11],q[22];
-cx q[11],q[23];
-cx q[12],q[24];
-cx q[12],q[25];
-cx q[13],q[26];
-cx q[13],q[27];
-cx q[14],q[28];
-cx q[14],q[29];
-h q[0];
-h q[1];
-h q[2];
-h q[3];
-h q[4];
-h q[5];
-h q[6];
-h q[7];
-h q[8];
-h q[9];
-h q[10];
-h q[11];
-h q[12];
-h q[13];
-h q[14];
-x q[0];
-x q[1];
-x q[2];
-x q[3];
-x q[4];
-x q[5];
-x q[6];
-x q[7];
-x q[8];
-x q[9];
-x q[10];
-x q[11];
-x q[12];
-x q[13];
-x q[14];
-reset q[31];
-reset q[32];
-reset q[33];
-reset q[34];
-reset q[35];
-reset q[36];
-reset q[37];
-reset q[38];
-reset q[39];
-reset q[40];
-reset q[41];
-reset q[42];
-reset q[43];
-reset q[44];
-ccx q[1],q[0],q[31];
-ccx q[31],q[2],q[32];
-ccx q[32],q[3],q[33];
-ccx q[33],q[4],q[34];
-ccx q[34],q[5],q[35];
-ccx q[35],q[6],q[36];
-ccx q[36],q[7],q[37];
-ccx q[37],q[8],q[38];
-ccx q[38],q[9],q[39];
-ccx q[39],q[10],q[40];
-ccx q[40],q[11],q[41];
-ccx q[41],q[12],q[42];
-ccx q[42],q[13],q[43];
-ccx q[43],q[14],q[44];
-z q[44];
-ccx q[43],q[14],q[44];
-ccx q[42],q[13],q[43];
-ccx q[41],q[12],q[42];
-ccx q[40],q[11],q[41];
-ccx q[39],q[10],q[40];
-ccx q[38],q[9],q[39];
-ccx q[37],q[8],q[38];
-ccx q[36],q[7],q[37];
-ccx q[35],q[6],q[36];
-ccx q[34],q[5],q[35];
-ccx q[33],q[4],q[34];
-ccx q[32],q[3],q[33];
-ccx q[31],q[2],q[32];
-ccx q[1],q[0],q[31];
-x q[0];
-x q[1];
-x q[2];
-x q[3];
-x q[4];
-x q[5];
-x q[6];
-x q[7];
-x q[8];
-x q[9];
-x q[10];
-x q[11];
-x q[12];
-x q[13];
-x q[14];
-h q[0];
-h q[1];
-h q[2];
-h q[3];
-h q[4];
-h q[5];
-h q[6];
-h q[7];
-h q[8];
-h q[9];
-h q[10];
-h q[11];
-h q[12];
-h q[13];
-h q[14];
-cx q[0],q[15];
-cx q[1],q[17];
-cx q[2],q[19];
-cx q[3],q[21];
-cx q[4],q[23];
-cx q[5],q[25];
-cx q[6],q[27];
-cx q[7],q[29];
-cx q[8],q[16];
-cx q[8],q[17];
-cx q[9],q[18];
-cx q[9],q[19];
-cx q[10],q[20];
-cx q[10],q[21];
-cx q[11],q[22];
-cx q[11],q[23];
-cx q[12],q[24];
-cx q[12],q[25];
-cx q[13],q[26];
-cx q[13],q[27];
-cx q[14],q[28];
-cx q[14],q[29];
-x q[15];
-x q[17];
-x q[18];
-x q[19];
-x q[20];
-x q[21];
-x q[22];
-x q[23];
-x q[24];
-x q[25];
-x q[26];
-x q[27];
-x q[28];
-x q[29];
-reset q[31];
-reset q[32];
-reset q[33];
-reset q[34];
-reset q[35];
-reset q[36];
-reset q[37];
-reset q[38];
-reset q[39];
-reset q[40];
-reset q[41];
-reset q[42];
-reset q[43];
-reset q[44];
-ccx q[16],q[15],q[31];
-ccx q[31],q[17],q[32];
-ccx q[32],q[18],q[33];
-ccx q[33],q[19],q[34];
-ccx q[34],q[20],q[35];
-ccx q[35],q[21],q[36];
-ccx q[36],q[22],q[37];
-ccx q[37],q[23],q[38];
-ccx q[38],q[24],q[39];
-ccx q[39],q[25],q[40];
-ccx q[40],q[26],q[41];
-ccx q[41],q[27],q[42];
-ccx q[42],q[28],q[43];
-ccx q[43],q[29],q[44];
-z q[44];
-ccx q[43],q[29],q[44];
-ccx q[42],q[28],q[43];
-ccx q[41],q[27],q[42];
-ccx q[40],q[26],q[41];
-ccx q[39],q[25],q[40];
-ccx q[38],q[24],q[39];
-ccx q[37],q[23],q[38];
-ccx q[36],q[22],q[37];
-ccx q[35],q[21],q[36];
-ccx q[34],q[20],q[35];
-ccx q[33],q[19],q[34];
-ccx q[32],q[18],q[33];
-ccx q[31],q[17],q[32];
-ccx q[16],q[15],q[31];
-x q[15];
-x q[17];
-x q[18];
-x q[19];
-x q[20];
-x q[21];
-x q[22];
-x q[23];
-x q[24];
-x q[25];
-x q[26];
-x q[27];
-x q[28];
-x q[29];
-cx q[0],q[15];
-cx q[1],q[17];
-cx q[2],q[19];
-cx q[3],q[21];
-cx q[4],q[23];
-cx q[5],q[25];
-cx q[6],q[27];
-cx q[7],q[29];
-cx q[8],q[16];
-cx q[8],q[17];
-cx q[9],q[18];
-cx q[9],q[19];
-cx q[10],q[20];
-cx q[10],q[21];
-cx q[11],q[22];
-cx q[11],q[23];
-cx q[12],q[24];
-cx q[12],q[25];
-cx q[13],q[26];
-cx q[13],q[27];
-cx q[14],q[28];
-cx q[14],q[29];
-h q[0];
-h q[1];
-h q[2];
-h q[3];
-h q[4];
-h q[5];
-h q[6];
-h q[7];
-h q[8];
-h q[9];
-h q[10];
-h q[11];
-h q[12];
-h q[13];
-h q[14];
-x q[0];
-x q[1];
-x q[2];
-x q[3];
-x q[4];
-x q[5];
-x q[6];
-x q[7];
-x q[8];
-x q[9];
-x q[10];
-x q[11];
-x q[12];
-x q[13];
-x q[14];
-reset q[31];
-reset q[32];
-reset q[33];
-reset q[34];
-reset q[35];
-reset q[36];
-reset q[37];
-reset q[38];
-reset q[39];
-reset q[40];
-reset q[41];
-reset q[42];
-reset q[43];
-reset q[44];
-ccx q[1],q[0],q[31];
-ccx q[31],q[2],q[32];
-ccx q[32],q[3],q[33];
-ccx q[33],q[4],q[34];
-ccx q[34],q[5],q[35];
-ccx q[35],q[6],q[36];
-ccx q[36],q[7],q[37];
-ccx q[37],q[8],q[38];
-ccx q[38],q[9],q[39];
-ccx q[39],q[10],q[40];
-ccx q[40],q[11],q[41];
-ccx q[41],q[12],q[42];
-ccx q[42],q[13],q[43];
-ccx q[43],q[14],q[44];
-z q[44];
-ccx q[43],q[14],q[44];
-ccx q[42],q[13],q[43];
-ccx q[41],q[12],q[42];
-ccx q[40],q[11],q[41];
-ccx q[39],q[10],q[40];
-ccx q[38],q[9],q[39];
-ccx q[37],q[8],q[38];
-ccx q[36],q[7],q[37];
-ccx q[35],q[6],q[36];
-ccx q[34],q[5],q[35];
-ccx q[33],q[4],q[34];
-ccx q[32],q[3],q[33];
-ccx q[31],q[2],q[32];
-ccx q[1],q[0],q[31];
-x q[0];
-x q[1];
-x q[2];
-x q[3];
-x q[4];
-x q[5];
-x q[6];
-x q[7];
-x q[8];
-x q[9];
-x q[10];
-x q[11];
-x q[12];
-x q[13];
-x q[14];
-h q[0];
-h q[1];
-h q[2];
-h q[3];
-h q[4];
-h q[5];
-h q[6];
-h q[7];
-h q[8];
-h q[9];
-h q[10];
-h q[11];
-h q[12];
-h q[13];
-h q[14];
-cx q[0],q[15];
-cx q[1],q[17];
-cx q[2],q[19];
-cx q[3],q[21];
-cx q[4],q[23];
-cx q[5],q[25];
-cx q[6],q[27];
-cx q[7],q[29];
-cx q[8],q[16];
-cx q[8],q[17];
-cx q[9],q[18];
-cx q[9],q[19];
-cx q[10],q[20];
-cx q[10],q[21];
-cx q[11],q[22];
-cx q[11],q[23];
-cx q[12],q[24];
-cx q[12],q[25];
-cx q[13],q[26];
-cx q[13],q[27];
-cx q[14],q[28];
-cx q[14],q[29];
-x q[15];
-x q[17];
-x q[18];
-x q[19];
-x q[20];
-x q[21];
-x q[22];
-x q[23];
-x q[24];
-x q[25];
-x q[26];
-x q[27];
-x q[28];
-x q[29];
-reset q[31];
-reset q[32];
-reset q[33];
-reset q[34];
-reset q[35];
-reset q[36];
-reset q[37];
-reset q[38];
-reset q[39];
-reset q[40];
-reset q[41];
-reset q[42];
-reset q[43];
-reset q[44];
-ccx q[16],q[15],q[31];
-ccx q[31],q[17],q[32];
-ccx q[32],q[18],q[33];
-ccx q[33],q[19],q[34];
-ccx q[34],q[20],q[35];
-ccx q[35],q[21],q[36];
-ccx q[36],q[22],q[37];
-ccx q[37],q[23],q[38];
-ccx q[38],q[24],q[39];
-ccx q[39],q[25],q[40];
-ccx q[40],q[26],q[41];
-ccx q[41],q[27],q[42];
-ccx q[42],q[28],q[43];
-ccx q[43],q[29],q[44];
-z q[44];
-ccx q[43],q[29],q[44];
-ccx q[42],q[28],q[43];
-ccx q[41],q[27],q[42];
-ccx q[40],q[26],q[41];
-ccx q[39],q[25],q[40];
-ccx q[38],q[24],q[39];
-ccx q[37],q[23],q[38];
-ccx q[36],q[22],q[37];
-ccx q[35],q[21],q[36];
-ccx q[34],q[20],q[35];
-ccx q[33],q[19],q[34];
-ccx q[32],q[18],q[33];
-ccx q[31],q[17],q[32];
-ccx q[16],q[15],q[31];
-x q[15];
-x q[17];
-x q[18];
-x q[19];
-x q[20];
-x q[21];
-x q[22];
-x q[23];
-x q[24];
-x q[25];
-x q[26];
-x q[27];
-x q[28];
-x q[29];
-cx q[0],q[15];
-cx q[1],q[17];
-cx q[2],q[19];
-cx q[3],q[21];
-cx q[4],q[23];
-cx q[5],q[25];
-cx q[6],q[27];
-cx q[7],q[29];
-cx q[8],q[16];
-cx q[8],q[17];
-cx q[9],q[18];
-cx q[9],q[19];
-cx q[10],q[20];
-cx q[10],q[21];
-cx q[11],q[22];
-cx q[11],q[23];
-cx q[12],q[24];
-cx q[12],q[25];
-cx q[13],q[26];
-cx q[13],q[27];
-cx q[14],q[28];
-cx q[14],q[29];
-h q[0];
-h q[1];
-h q[2];
-h q[3];
-h q[4];
-h q[5];
-h q[6];
-h q[7];
-h q[8];
-h q[9];
-h q[10];
-h q[11];
-h q[12];
-h q[13];
-h q[14];
-x q[0];
-x q[1];
-x q[2];
-x q[3];
-x q[4];
-x q[5];
-x q[6];
-x q[7];
-x q[8];
-x q[9];
-x q[10];
-x q[11];
-x q[12];
-x q[13];
-x q[14];
-reset q[31];
-reset q[32];
-reset q[33];
-reset q[34];
-reset q[35];
-reset q[36];
-reset q[37];
-reset q[38];
-reset q[39];
-reset q[40];
-reset q[41];
-reset q[42];
-reset q[43];
-reset q[44];
-ccx q[1],q[0],q[31];
-ccx q[31],q[2],q[32];
-ccx q[32],q[3],q[33];
-ccx q[33],q[4],q[34];
-ccx q[34],q[5],q[35];
-ccx q[35],q[6],q[36];
-ccx q[36],q[7],q[37];
-ccx q[37],q[8],q[38];
-ccx q[38],q[9],q[39];
-ccx q[39],q[10],q[40];
-ccx q[40],q[11],q[41];
-ccx q[41],q[12],q[42];
-ccx q[42],q[13],q[43];
-ccx q[43],q[14],q[44];
-z q[44];
-ccx q[43],q[14],q[44];
-ccx q[42],q[13],q[43];
-ccx q[41],q[12],q[42];
-ccx q[40],q[11],q[41];
-ccx q[39],q[10],q[40];
-ccx q[38],q[9],q[39];
-ccx q[37],q[8],q[38];
-ccx q[36],q[7],q[37];
-ccx q[35],q[6],q[36];
-ccx q[34],q[5],q[35];
-ccx q[33],q[4],q[34];
-ccx q[32],q[3],q[33];
-ccx q[31],q[2],q[32];
-ccx q[1],q[0],q[31];
-x q[0];
-x q[1];
-x q[2];
-x q[3];
-x q[4];
-x q[5];
-x q[6];
-x q[7];
-x q[8];
-x q[9];
-x q[10];
-x q[11];
-x q[12];
-x q[13];
-x q[14];
-h q[0];
-h q[1];
-h q[2];
-h q[3];
-h q[4];
-h q[5];
-h q[6];
-h q[7];
-h q[8];
-h q[9];
-h q[10];
-h q[11];
-h q[12];
-h q[13];
-h q[14];
-cx q[0],q[15];
-cx q[1],q[17];
-cx q[2],q[19];
-cx q[3],q[21];
-cx q[4],q[23];
-cx q[5],q[25];
-cx q[6],q[27];
-cx q[7],q[29];
-cx q[8],q[16];
-cx q[8],q[17];
-cx q[9],q[18];
-cx q[9],q[19];
-cx q[10],q[20];
-cx q[10],q[21];
-cx q[11],q[22];
-cx q[11],q[23];
-cx q[12],q[24];
-cx q[12],q[25];
-cx q[13],q[26];
-cx q[13],q[27];
-cx q[14],q[28];
-cx q[14],q[29];
-x q[15];
-x q[17];
-x q[18];
-x q[19];
-x q[20];
-x q[21];
-x q[22];
-x q[23];
-x q[24];
-x q[25];
-x q[26];
-x q[27];
-x q[28];
-x q[29];
-reset q[31];
-reset q[32];
-reset q[33];
-reset q[34];
-reset q[35];
-reset q[36];
-reset q[37];
-reset q[38];
-reset q[39];
-reset q[40];
-reset q[41];
-reset q[42];
-reset q[43];
-reset q[44];
-ccx q[16],q[15],q[31];
-ccx q[31],q[17],q[32];
-ccx q[32],q[18],q[33];
-ccx q[33],q[19],q[34];
-ccx q[34],q[20],q[35];
-ccx q[35],q[21],q[36];
-ccx q[36],q[22],q[37];
-ccx q[37],q[23],q[38];
-ccx q[38],q[24],q[39];
-ccx q[39],q[25],q[40];
-ccx q[40],q[26],q[41];
-ccx q[41],q[27],q[42];
-ccx q[42],q[28],q[43];
-ccx q[43],q[29],q[44];
-z q[44];
-ccx q[43],q[29],q[44];
-ccx q[42],q[28],q[43];
-ccx q[41],q[27],q[42];
-ccx q[40],q[26],q[41];
-ccx q[39],q[25],q[40];
-ccx q[38],q[24],q[39];
-ccx q[37],q[23],q[38];
-ccx q[36],q[22],q[37];
-ccx q[35],q[21],q[36];
-ccx q[34],q[20],q[35];
-ccx q[33],q[19],q[34];
-ccx q[32],q[18],q[33];
-ccx q[31],q[17],q[32];
-ccx q[16],q[15],q[31];
-x q[15];
-x q[17];
-x q[18];
-x q[19];
-x q[20];
-x q[21];
-x q[22];
-x q[23];
-x q[24];
-x q[25];
-x q[26];
-x q[27];
-x q[28];
-x q[29];
-cx q[0],q[15];
-cx q[1],q[17];
-cx q[2],q[19];
-cx q[3],q[21];
-cx q[4],q[23];
-cx q[5],q[25];
-cx q[6],q[27];
-cx q[7],q[29];
-cx q[8],q[16];
-cx q[8],q[17];
-cx q[9],q[18];
-cx q[9],q[19];
-cx q[10],q[20];
-cx q[10],q[21];
-cx q[11],q[22];
-cx q[11],q[23];
-cx q[12],q[24];
-cx q[12],q[25];
-cx q[13],q[26];
-cx q[13],q[27];
-cx q[14],q[28];
-cx q[14],q[29];
-h q[0];
-h q[1];
-h q[2];
-h q[3];
-h q[4];
-h q[5];
-h q[6];
-h q[7];
-h q[8];
-h q[9];
-h q[10];
-h q[11];
-h q[12];
-h q[13];
-h q[14];
-x q[0];
-x q[1];
-x q[2];
-x q[3];
-x q[4];
-x q[5];
-x q[6];
-x q[7];
-x q[8];
-x q[9];
-x q[10];
-x q[11];
-x q[12];
-x q[13];
-x q[14];
-reset q[31];
-reset q[32];
-reset q[33];
-reset q[34];
-reset q[35];
-reset q[36];
-reset q[37];
-reset q[38];
-reset q[39];
-reset q[40];
-reset q[41];
-reset q[42];
-reset q[43];
-reset q[44];
-ccx q[1],q[0],q[31];
-ccx q[31],q[2],q[32];
-ccx q[32],q[3],q[33];
-ccx q[33],q[4],q[34];
-ccx q[34],q[5],q[35];
-ccx q[35],q[6],q[36];
-ccx q[36],q[7],q[37];
-ccx q[37],q[8],q[38];
-ccx q[38],q[9],q[39];
-ccx q[39],q[10],q[40];
-ccx q[40],q[11],q[41];
-ccx q[41],q[12],q[42];
-ccx q[42],q[13],q[43];
-ccx q[43],q[14],q[44];
-z q[44];
-ccx q[43],q[14],q[44];
-ccx q[42],q[13],q[43];
-ccx q[41],q[12],q[42];
-ccx q[40],q[11],q[41];
-ccx q[39],q[10],q[40];
-ccx q[38],q[9],q[39];
-ccx q[37],q[8],q[38];
-ccx q[36],q[7],q[37];
-ccx q[35],q[6],q[36];
-ccx q[34],q[5],q[35];
-ccx q[33],q[4],q[34];
-ccx q[32],q[3],q[33];
-ccx q[31],q[2],q[32];
-ccx q[1],q[0],q[31];
-x q[0];
-x q[1];
-x q[2];
-x q[3];
-x q[4];
-x q[5];
-x q[6];
-x q[7];
-x q[8];
-x q[9];
-x q[10];
-x q[11];
-x q[12];
-x q[13];
-x q[14];
-h q[0];
-h q[1];
-h q[2];
-h q[3];
-h q[4];
-h q[5];
-h q[6];
-h q[7];
-h q[8];
-h q[9];
-h q[10];
-h q[11];
-h q[12];
-h q[13];
-h q[14];
-cx q[0],q[15];
-cx q[1],q[17];
-cx q[2],q[19];
-cx q[3],q[21];
-cx q[4],q[23];
-cx q[5],q[25];
-cx q[6],q[27];
-cx q[7],q[29];
-cx q[8],q[16];
-cx q[8],q[17];
-cx q[9],q[18];
-cx q[9],q[19];
-cx q[10],q[20];
-cx q[10],q[21];
-cx q[11],q[22];
-cx q[11],q[23];
-cx q[12],q[24];
-cx q[12],q[25];
-cx q[13],q[26];
-cx q[13],q[27];
-cx q[14],q[28];
-cx q[14],q[29];
-x q[15];
-x q[17];
-x q[18];
-x q[19];
-x q[20];
-x q[21];
-x q[22];
-x q[23];
-x q[24];
-x q[25];
-x q[26];
-x q[27];
-x q[28];
-x q[29];
-reset q[31];
-reset q[32];
-reset q[33];
-reset q[34];
-reset q[35];
-reset q[36];
-reset q[37];
-reset q[38];
-reset q[39];
-reset q[40];
-reset q[41];
-reset q[42];
-reset q[43];
-reset q[44];
-ccx q[16],q[15],q[31];
-ccx q[31],q[17],q[32];
-ccx q[32],q[18],q[33];
-ccx q[33],q[19],q[34];
-ccx q[34],q[20],q[35];
-ccx q[35],q[21],q[36];
-ccx q[36],q[22],q[37];
-ccx q[37],q[23],q[38];
-ccx q[38],q[24],q[39];
-ccx q[39],q[25],q[40];
-ccx q[40],q[26],q[41];
-ccx q[41],q[27],q[42];
-ccx q[42],q[28],q[43];
-ccx q[43],q[29],q[44];
-z q[44];
-ccx q[43],q[29],q[44];
-ccx q[42],q[28],q[43];
-ccx q[41],q[27],q[42];
-ccx q[40],q[26],q[41];
-ccx q[39],q[25],q[40];
-ccx q[38],q[24],q[39];
-ccx q[37],q[23],q[38];
-ccx q[36],q[22],q[37];
-ccx q[35],q[21],q[36];
-ccx q[34],q[20],q[35];
-ccx q[33],q[19],q[34];
-ccx q[32],q[18],q[33];
-ccx q[31],q[17],q[32];
-ccx q[16],q[15],q[31];
-x q[15];
-x q[17];
-x q[18];
-x q[19];
-x q[20];
-x q[21];
-x q[22];
-x q[23];
-x q[24];
-x q[25];
-x q[26];
-x q[27];
-x q[28];
-x q[29];
-cx q[0],q[15];
-cx q[1],q[17];
-cx q[2],q[19];
-cx q[3],q[21];
-cx q[4],q[23];
-cx q[5],q[25];
-cx q[6],q[27];
-cx q[7],q[29];
-cx q[8],q[16];
-cx q[8],q[17];
-cx q[9],q[18];
-cx q[9],q[19];
-cx q[10],q[20];
-cx q[10],q[21];
-cx q[11],q[22];
-cx q[11],q[23];
-cx q[12],q[24];
-cx q[12],q[25];
-cx q[13],q[26];
-cx q[13],q[27];
-cx q[14],q[28];
-cx q[14],q[29];
-h q[0];
-h q[1];
-h q[2];
-h q[3];
-h q[4];
-h q[5];
-h q[6];
-h q[7];
-h q[8];
-h q[9];
-h q[10];
-h q[11];
-h q[12];
-h q[13];
-h q[14];
-x q[0];
-x q[1];
-x q[2];
-x q[3];
-x q[4];
-x q[5];
-x q[6];
-x q[7];
-x q[8];
-x q[9];
-x q[10];
-x q[11];
-x q[12];
-x q[13];
-x q[14];
-reset q[31];
-reset q[32];
-reset q[33];
-reset q[34];
-reset q[35];
-reset q[36];
-reset q[37];
-reset q[38];
-reset q[39];
-reset q[40];
-reset q[41];
-reset q[42];
-reset q[43];
-reset q[44];
-ccx q[1],q[0],q[31];
-ccx q[31],q[2],q[32];
-ccx q[32],q[3],q[33];
-ccx q[33],q[4],q[34];
-ccx q[34],q[5],q[35];
-ccx q[35],q[6],q[36];
-ccx q[36],q[7],q[37];
-ccx q[37],q[8],q[38];
-ccx q[38],q[9],q[39];
-ccx q[39],q[10],q[40];
-ccx q[40],q[11],q[41];
-ccx q[41],q[12],q[42];
-ccx q[42],q[13],q[43];
-ccx q[43],q[14],q[44];
-z q[44];
-ccx q[43],q[14],q[44];
-ccx q[42],q[13],q[43];
-ccx q[41],q[12],q[42];
-ccx q[40],q[11],q[41];
-ccx q[39],q[10],q[40];
-ccx q[38],q[9],q[39];
-ccx q[37],q[8],q[38];
-ccx q[36],q[7],q[37];
-ccx q[35],q[6],q[36];
-ccx q[34],q[5],q[35];
-ccx q[33],q[4],q[34];
-ccx q[32],q[3],q[33];
-ccx q[31],q[2],q[32];
-ccx q[1],q[0],q[31];
-x q[0];
-x q[1];
-x q[2];
-x q[3];
-x q[4];
-x q[5];
-x q[6];
-x q[7];
-x q[8];
-x q[9];
-x q[10];
-x q[11];
-x q[12];
-x q[13];
-x q[14];
-h q[0];
-h q[1];
-h q[2];
-h q[3];
-h q[4];
-h q[5];
-h q[6];
-h q[7];
-h q[8];
-h q[9];
-h q[10];
-h q[11];
-h q[12];
-h q[13];
-h q[14];
-cx q[0],q[15];
-cx q[1],q[17];
-cx q[2],q[19];
-cx q[3],q[21];
-cx q[4],q[23];
-cx q[5],q[25];
-cx q[6],q[27];
-cx q[7],q[29];
-cx q[8],q[16];
-cx q[8],q[17];
-cx q[9],q[18];
-cx q[9],q[19];
-cx q[10],q[20];
-cx q[10],q[21];
-cx q[11],q[22];
-cx q[11],q[23];
-cx q[12],q[24];
-cx q[12],q[25];
-cx q[13],q[26];
-cx q[13],q[27];
-cx q[14],q[28];
-cx q[14],q[29];
-x q[15];
-x q[17];
-x q[18];
-x q[19];
-x q[20];
-x q[21];
-x q[22];
-x q[23];
-x q[24];
-x q[25];
-x q[26];
-x q[27];
-x q[28];
-x q[29];
-reset q[31];
-reset q[32];
-reset q[33];
-reset q[34];
-reset q[35];
-reset q[36];
-reset q[37];
-reset q[38];
-reset q[39];
-reset q[40];
-reset q[41];
-reset q[42];
-reset q[43];
-reset q[44];
-ccx q[16],q[15],q[31];
-ccx q[31],q[17],q[32];
-ccx q[32],q[18],q[33];
-ccx q[33],q[19],q[34];
-ccx q[34],q[20],q[35];
-ccx q[35],q[21],q[36];
-ccx q[36],q[22],q[37];
-ccx q[37],q[23],q[38];
-ccx q[38],q[24],q[39];
-ccx q[39],q[25],q[40];
-ccx q[40],q[26],q[41];
-ccx q[41],q[27],q[42];
-ccx q[42],q[28],q[43];
-ccx q[43],q[29],q[44];
-z q[44];
-ccx q[43],q[29],q[44];
-ccx q[42],q[28],q[43];
-ccx q[41],q[27],q[42];
-ccx q[40],q[26],q[41];
-ccx q[39],q[25],q[40];
-ccx q[38],q[24],q[39];
-ccx q[37],q[23],q[38];
-ccx q[36],q[22],q[37];
-ccx q[35],q[21],q[36];
-ccx q[34],q[20],q[35];
-ccx q[33],q[19],q[34];
-ccx q[32],q[18],q[33];
-ccx q[31],q[17],q[32];
-ccx q[16],q[15],q[31];
-x q[15];
-x q[17];
-x q[18];
-x q[19];
-x q[20];
-x q[21];
-x q[22];
-x q[23];
-x q[24];
-x q[25];
-x q[26];
-x q[27];
-x q[28];
-x q[29];
-cx q[0],q[15];
-cx q[1],q[17];
-cx q[2],q[19];
-cx q[3],q[21];
-cx q[4],q[23];
-cx q[5],q[25];
-cx q[6],q[27];
-cx q[7],q[29];
-cx q[8],q[16];
-cx q[8],q[17];
-cx q[9],q[18];
-cx q[9],q[19];
-cx q[10],q[20];
-cx q[10],q[21];
-cx q[11],q[22];
-cx q[11],q[23];
-cx q[12],q[24];
-cx q[12],q[25];
-cx q[13],q[26];
-cx q[13],q[27];
-cx q[14],q[28];
-cx q[14],q[29];
-h q[0];
-h q[1];
-h q[2];
-h q[3];
-h q[4];
-h q[5];
-h q[6];
-h q[7];
-h q[8];
-h q[9];
-h q[10];
-h q[11];
-h q[12];
-h q[13];
-h q[14];
-x q[0];
-x q[1];
-x q[2];
-x q[3];
-x q[4];
-x q[5];
-x q[6];
-x q[7];
-x q[8];
-x q[9];
-x q[10];
-x q[11];
-x q[12];
-x q[13];
-x q[14];
-reset q[31];
-reset q[32];
-reset q[33];
-reset q[34];
-reset q[35];
-reset q[36];
-reset q[37];
-reset q[38];
-reset q[39];
-reset q[40];
-reset q[41];
-reset q[42];
-reset q[43];
-reset q[44];
-ccx q[1],q[0],q[31];
-ccx q[31],q[2],q[32];
-ccx q[32],q[3],q[33];
-ccx q[33],q[4],q[34];
-ccx q[34],q[5],q[35];
-ccx q[35],q[6],q[36];
-ccx q[36],q[7],q[37];
-ccx q[37],q[8],q[38];
-ccx q[38],q[9],q[39];
-ccx q[39],q[10],q[40];
-ccx q[40],q[11],q[41];
-ccx q[41],q[12],q[42];
-ccx q[42],q[13],q[43];
-ccx q[43],q[14],q[44];
-z q[44];
-ccx q[43],q[14],q[44];
-ccx q[42],q[13],q[43];
-ccx q[41],q[12],q[42];
-ccx q[40],q[11],q[41];
-ccx q[39],q[10],q[40];
-ccx q[38],q[9],q[39];
-ccx q[37],q[8],q[38];
-ccx q[36],q[7],q[37];
-ccx q[35],q[6],q[36];
-ccx q[34],q[5],q[35];
-ccx q[33],q[4],q[34];
-ccx q[32],q[3],q[33];
-ccx q[31],q[2],q[32];
-ccx q[1],q[0],q[31];
-x q[0];
-x q[1];
-x q[2];
-x q[3];
-x q[4];
-x q[5];
-x q[6];
-x q[7];
-x q[8];
-x q[9];
-x q[10];
-x q[11];
-x q[12];
-x q[13];
-x q[14];
-h q[0];
-h q[1];
-h q[2];
-h q[3];
-h q[4];
-h q[5];
-h q[6];
-h q[7];
-h q[8];
-h q[9];
-h q[10];
-h q[11];
-h q[12];
-h q[13];
-h q[14];
-cx q[0],q[15];
-cx q[1],q[17];
-cx q[2],q[19];
-cx q[3],q[21];
-cx q[4],q[23];
-cx q[5],q[25];
-cx q[6],q[27];
-cx q[7],q[29];
-cx q[8],q[16];
-cx q[8],q[17];
-cx q[9],q[18];
-cx q[9],q[19];
-cx q[10],q[20];
-cx q[10],q[21];
-cx q[11],q[22];
-cx q[11],q[23];
-cx q[12],q[24];
-cx q[12],q[25];
-cx q[13],q[26];
-cx q[13],q[27];
-cx q[14],q[28];
-cx q[14],q[29];
-x q[15];
-x q[17];
-x q[18];
-x q[19];
-x q[20];
-x q[21];
-x q[22];
-x q[23];
-x q[24];
-x q[25];
-x q[26];
-x q[27];
-x q[28];
-x q[29];
-reset q[31];
-reset q[32];
-reset q[33];
-reset q[34];
-reset q[35];
-reset q[36];
-reset q[37];
-reset q[38];
-reset q[39];
-reset q[40];
-reset q[41];
-reset q[42];
-reset q[43];
-reset q[44];
-ccx q[16],q[15],q[31];
-ccx q[31],q[17],q[32];
-ccx q[32],q[18],q[33];
-ccx q[33],q[19],q[34];
-ccx q[34],q[20],q[35];
-ccx q[35],q[21],q[36];
-ccx q[36],q[22],q[37];
-ccx q[37],q[23],q[38];
-ccx q[38],q[24],q[39];
-ccx q[39],q[25],q[40];
-ccx q[40],q[26],q[41];
-ccx q[41],q[27],q[42];
-ccx q[42],q[28],q[43];
-ccx q[43],q[29],q[44];
-z q[44];
-ccx q[43],q[29],q[44];
-ccx q[42],q[28],q[43];
-ccx q[41],q[27],q[42];
-ccx q[40],q[26],q[41];
-ccx q[39],q[25],q[40];
-ccx q[38],q[24],q[39];
-ccx q[37],q[23],q[38];
-ccx q[36],q[22],q[37];
-ccx q[35],q[21],q[36];
-ccx q[34],q[20],q[35];
-ccx q[33],q[19],q[34];
-ccx q[32],q[18],q[33];
-ccx q[31],q[17],q[32];
-ccx q[16],q[15],q[31];
-x q[15];
-x q[17];
-x q[18];
-x q[19];
-x q[20];
-x q[21];
-x q[22];
-x q[23];
-x q[24];
-x q[25];
-x q[26];
-x q[27];
-x q[28];
-x q[29];
-cx q[0],q[15];
-cx q[1],q[17];
-cx q[2],q[19];
-cx q[3],q[21];
-cx q[4],q[23];
-cx q[5],q[25];
-cx q[6],q[27];
-cx q[7],q[29];
-cx q[8],q[16];
-cx q[8],q[17];
-cx q[9],q[18];
-cx q[9],q[19];
-cx q[10],q[20];
-cx q[10],q[21];
-cx q[11],q[22];
-cx q[11],q[23];
-cx q[12],q[24];
-cx q[12],q[25];
-cx q[13],q[26];
-cx q[13],q[27];
-cx q[14],q[28];
-cx q[14],q[29];
-h q[0];
-h q[1];
-h q[2];
-h q[3];
-h q[4];
-h q[5];
-h q[6];
-h q[7];
-h q[8];
-h q[9];
-h q[10];
-h q[11];
-h q[12];
-h q[13];
-h q[14];
-x q[0];
-x q[1];
-x q[2];
-x q[3];
-x q[4];
-x q[5];
-x q[6];
-x q[7];
-x q[8];
-x q[9];
-x q[10];
-x q[11];
-x q[12];
-x q[13];
-x q[14];
-reset q[31];
-reset q[32];
-reset q[33];
-reset q[34];
-reset q[35];
-reset q[36];
-reset q[37];
-reset q[38];
-reset q[39];
-reset q[40];
-reset q[41];
-reset q[42];
-reset q[43];
-reset q[44];
-ccx q[1],q[0],q[31];
-ccx q[31],q[2],q[32];
-ccx q[32],q[3],q[33];
-ccx q[33],q[4],q[34];
-ccx q[34],q[5],q[35];
-ccx q[35],q[6],q[36];
-ccx q[36],q[7],q[37];
-ccx q[37],q[8],q[38];
-ccx q[38],q[9],q[39];
-ccx q[39],q[10],q[40];
-ccx q[40],q[11],q[41];
-ccx q[41],q[12],q[42];
-ccx q[42],q[13],q[43];
-ccx q[43],q[14],q[44];
-z q[44];
-ccx q[43],q[14],q[44];
-ccx q[42],q[13],q[43];
-ccx q[41],q[12],q[42];
-ccx q[40],q[11],q[41];
-ccx q[39],q[10],q[40];
-ccx q[38],q[9],q[39];
-ccx q[37],q[8],q[38];
-ccx q[36],q[7],q[37];
-ccx q[35],q[6],q[36];
-ccx q[34],q[5],q[35];
-ccx q[33],q[4],q[34];
-ccx q[32],q[3],q[33];
-ccx q[31],q[2],q[32];
-ccx q[1],q[0],q[31];
-x q[0];
-x q[1];
-x q[2];
-x q[3];
-x q[4];
-x q[5];
-x q[6];
-x q[7];
-x q[8];
-x q[9];
-x q[10];
-x q[11];
-x q[12];
-x q[13];
-x q[14];
-h q[0];
-h q[1];
-h q[2];
-h q[3];
-h q[4];
-h q[5];
-h q[6];
-h q[7];
-h q[8];
-h q[9];
-h q[10];
-h q[11];
-h q[12];
-h q[13];
-h q[14];
-cx q[0],q[15];
-cx q[1],q[17];
-cx q[2],q[19];
-cx q[3],q[21];
-cx q[4],q[23];
-cx q[5],q[25];
-cx q[6],q[27];
-cx q[7],q[29];
-cx q[8],q[16];
-cx q[8],q[17];
-cx q[9],q[18];
-cx q[9],q[19];
-cx q[10],q[20];
-cx q[10],q[21];
-cx q[11],q[22];
-cx q[11],q[23];
-cx q[12],q[24];
-cx q[12],q[25];
-cx q[13],q[26];
-cx q[13],q[27];
-cx q[14],q[28];
-cx q[14],q[29];
-x q[15];
-x q[17];
-x q[18];
-x q[19];
-x q[20];
-x q[21];
-x q[22];
-x q[23];
-x q[24];
-x q[25];
-x q[26];
-x q[27];
-x q[28];
-x q[29];
-reset q[31];
-reset q[32];
-reset q[33];
-reset q[34];
-reset q[35];
-reset q[36];
-reset q[37];
-reset q[38];
-reset q[39];
-reset q[40];
-reset q[41];
-reset q[42];
-reset q[43];
-reset q[44];
-ccx q[16],q[15],q[31];
-ccx q[31],q[17],q[32];
-ccx q[32],q[18],q[33];
-ccx q[33],q[19],q[34];
-ccx q[34],q[20],q[35];
-ccx q[35],q[21],q[36];
-ccx q[36],q[22],q[37];
-ccx q[37],q[23],q[38];
-ccx q[38],q[24],q[39];
-ccx q[39],q[25],q[40];
-ccx q[40],q[26],q[41];
-ccx q[41],q[27],q[42];
-ccx q[42],q[28],q[43];
-ccx q[43],q[29],q[44];
-z q[44];
-ccx q[43],q[29],q[44];
-ccx q[42],q[28],q[43];
-ccx q[41],q[27],q[42];
-ccx q[40],q[26],q[41];
-ccx q[39],q[25],q[40];
-ccx q[38],q[24],q[39];
-ccx q[37],q[23],q[38];
-ccx q[36],q[22],q[37];
-ccx q[35],q[21],q[36];
-ccx q[34],q[20],q[35];
-ccx q[33],q[19],q[34];
-ccx q[32],q[18],q[33];
-ccx q[31],q[17],q[32];
-ccx q[16],q[15],q[31];
-x q[15];
-x q[17];
-x q[18];
-x q[19];
-x q[20];
-x q[21];
-x q[22];
-x q[23];
-x q[24];
-x q[25];
-x q[26];
-x q[27];
-x q[28];
-x q[29];
-cx q[0],q[15];
-cx q[1],q[17];
-cx q[2],q[19];
-cx q[3],q[21];
-cx q[4],q[23];
-cx q[5],q[25];
-cx q[6],q[27];
-cx q[7],q[29];
-cx q[8],q[16];
-cx q[8],q[17];
-cx q[9],q[18];
-cx q[9],q[19];
-cx q[10],q[20];
-cx q[10],q[21];
-cx q[11],q[22];
-cx q[11],q[23];
-cx q[12],q[24];
-cx q[12],q[25];
-cx q[13],q[26];
-cx q[13],q[27];
-cx q[14],q[28];
-cx q[14],q[29];
-h q[0];
-h q[1];
-h q[2];
-h q[3];
-h q[4];
-h q[5];
-h q[6];
-h q[7];
-h q[8];
-h q[9];
-h q[10];
-h q[11];
-h q[12];
-h q[13];
-h q[14];
-x q[0];
-x q[1];
-x q[2];
-x q[3];
-x q[4];
-x q[5];
-x q[6];
-x q[7];
-x q[8];
-x q[9];
-x q[10];
-x q[11];
-x q[12];
-x q[13];
-x q[14];
-reset q[31];
-reset q[32];
-reset q[33];
-reset q[34];
-reset q[35];
-reset q[36];
-reset q[37];
-reset q[38];
-reset q[39];
-reset q[40];
-reset q[41];
-reset q[42];
-reset q[43];
-reset q[44];
-ccx q[1],q[0],q[31];
-ccx q[31],q[2],q[32];
-ccx q[32],q[3],q[33];
-ccx q[33],q[4],q[34];
-ccx q[34],q[5],q[35];
-ccx q[35],q[6],q[36];
-ccx q[36],q[7],q[37];
-ccx q[37],q[8],q[38];
-ccx q[38],q[9],q[39];
-ccx q[39],q[10],q[40];
-ccx q[40],q[11],q[41];
-ccx q[41],q[12],q[42];
-ccx q[42],q[13],q[43];
-ccx q[43],q[14],q[44];
-z q[44];
-ccx q[43],q[14],q[44];
-ccx q[42],q[13],q[43];
-ccx q[41],q[12],q[42];
-ccx q[40],q[11],q[41];
-ccx q[39],q[10],q[40];
-ccx q[38],q[9],q[39];
-ccx q[37],q[8],q[38];
-ccx q[36],q[7],q[37];
-ccx q[35],q[6],q[36];
-ccx q[34],q[5],q[35];
-ccx q[33],q[4],q[34];
-ccx q[32],q[3],q[33];
-ccx q[31],q[2],q[32];
-ccx q[1],q[0],q[31];
-x q[0];
-x q[1];
-x q[2];
-x q[3];
-x q[4];
-x q[5];
-x q[6];
-x q[7];
-x q[8];
-x q[9];
-x q[10];
-x q[11];
-x q[12];
-x q[13];
-x q[14];
-h q[0];
-h q[1];
-h q[2];
-h q[3];
-h q[4];
-h q[5];
-h q[6];
-h q[7];
-h q[8];
-h q[9];
-h q[10];
-h q[11];
-h q[12];
-h q[13];
-h q[14];
-cx q[0],q[15];
-cx q[1],q[17];
-cx q[2],q[19];
-cx q[3],q[21];
-cx q[4],q[23];
-cx q[5],q[25];
-cx q[6],q[27];
-cx q[7],q[29];
-cx q[8],q[16];
-cx q[8],q[17];
-cx q[9],q[18];
-cx q[9],q[19];
-cx q[10],q[20];
-cx q[10],q[21];
-cx q[11],q[22];
-cx q[11],q[23];
-cx q[12],q[24];
-cx q[12],q[25];
-cx q[13],q[26];
-cx q[13],q[27];
-cx q[14],q[28];
-cx q[14],q[29];
-x q[15];
-x q[17];
-x q[18];
-x q[19];
-x q[20];
-x q[21];
-x q[22];
-x q[23];
-x q[24];
-x q[25];
-x q[26];
-x q[27];
-x q[28];
-x q[29];
-reset q[31];
-reset q[32];
-reset q[33];
-reset q[34];
-reset q[35];
-reset q[36];
-reset q[37];
-reset q[38];
-reset q[39];
-reset q[40];
-reset q[41];
-reset q[42];
-reset q[43];
-reset q[44];
-ccx q[16],q[15],q[31];
-ccx q[31],q[17],q[32];
-ccx q[32],q[18],q[33];
-ccx q[33],q[19],q[34];
-ccx q[34],q[20],q[35];
-ccx q[35],q[21],q[36];
-ccx q[36],q[22],q[37];
-ccx q[37],q[23],q[38];
-ccx q[38],q[24],q[39];
-ccx q[39],q[25],q[40];
-ccx q[40],q[26],q[41];
-ccx q[41],q[27],q[42];
-ccx q[42],q[28],q[43];
-ccx q[43],q[29],q[44];
-z q[44];
-ccx q[43],q[29],q[44];
-ccx q[42],q[28],q[43];
-ccx q[41],q[27],q[42];
-ccx q[40],q[26],q[41];
-ccx q[39],q[25],q[40];
-ccx q[38],q[24],q[39];
-ccx q[37],q[23],q[38];
-ccx q[36],q[22],q[37];
-ccx q[35],q[21],q[36];
-ccx q[34],q[20],q[35];
-ccx q[33],q[19],q[34];
-ccx q[32],q[18],q[33];
-ccx q[31],q[17],q[32];
-ccx q[16],q[15],q[31];
-x q[15];
-x q[17];
-x q[18];
-x q[19];
-x q[20];
-x q[21];
-x q[22];
-x q[23];
-x q[24];
-x q[25];
-x q[26];
-x q[27];
-x q[28];
-x q[29];
-cx q[0],q[15];
-cx q[1],q[17];
-cx q[2],q[19];
-cx q[3],q[21];
-cx q[4],q[23];
-cx q[5],q[25];
-cx q[6],q[27];
-cx q[7],q[29];
-cx q[8],q[16];
-cx q[8],q[17];
-cx q[9],q[18];
-cx q[9],q[19];
-cx q[10],q[20];
-cx q[10],q[21];
-cx q[11],q[22];
-cx q[11],q[23];
-cx q[12],q[24];
-cx q[12],q[25];
-cx q[13],q[26];
-cx q[13],q[27];
-cx q[14],q[28];
-cx q[14],q[29];
-h q[0];
-h q[1];
-h q[2];
-h q[3];
-h q[4];
-h q[5];
-h q[6];
-h q[7];
-h q[8];
-h q[9];
-h q[10];
-h q[11];
-h q[12];
-h q[13];
-h q[14];
-x q[0];
-x q[1];
-x q[2];
-x q[3];
-x q[4];
-x q[5];
-x q[6];
-x q[7];
-x q[8];
-x q[9];
-x q[10];
-x q[11];
-x q[12];
-x q[13];
-x q[14];
-reset q[31];
-reset q[32];
-reset q[33];
-reset q[34];
-reset q[35];
-reset q[36];
-reset q[37];
-reset q[38];
-reset q[39];
-reset q[40];
-reset q[41];
-reset q[42];
-reset q[43];
-reset q[44];
-ccx q[1],q[0],q[31];
-ccx q[31],q[2],q[32];
-ccx q[32],q[3],q[33];
-ccx q[33],q[4],q[34];
-ccx q[34],q[5],q[35];
-ccx q[35],q[6],q[36];
-ccx q[36],q[7],q[37];
-ccx q[37],q[8],q[38];
-ccx q[38],q[9],q[39];
-ccx q[39],q[10],q[40];
-ccx q[40],q[11],q[41];
-ccx q[41],q[12],q[42];
-ccx q[42],q[13],q[43];
-ccx q[43],q[14],q[44];
-z q[44];
-ccx q[43],q[14],q[44];
-ccx q[42],q[13],q[43];
-ccx q[41],q[12],q[42];
-ccx q[40],q[11],q[41];
-ccx q[39],q[10],q[40];
-ccx q[38],q[9],q[39];
-ccx q[37],q[8],q[38];
-ccx q[36],q[7],q[37];
-ccx q[35],q[6],q[36];
-ccx q[34],q[5],q[35];
-ccx q[33],q[4],q[34];
-ccx q[32],q[3],q[33];
-ccx q[31],q[2],q[32];
-ccx q[1],q[0],q[31];
-x q[0];
-x q[1];
-x q[2];
-x q[3];
-x q[4];
-x q[5];
-x q[6];
-x q[7];
-x q[8];
-x q[9];
-x q[10];
-x q[11];
-x q[12];
-x q[13];
-x q[14];
-h q[0];
-h q[1];
-h q[2];
-h q[3];
-h q[4];
-h q[5];
-h q[6];
-h q[7];
-h q[8];
-h q[9];
-h q[10];
-h q[11];
-h q[12];
-h q[13];
-h q[14];
-cx q[0],q[15];
-cx q[1],q[17];
-cx q[2],q[19];
-cx q[3],q[21];
-cx q[4],q[23];
-cx q[5],q[25];
-cx q[6],q[27];
-cx q[7],q[29];
-cx q[8],q[16];
-cx q[8],q[17];
-cx q[9],q[18];
-cx q[9],q[19];
-cx q[10],q[20];
-cx q[10],q[21];
-cx q[11],q[22];
-cx q[11],q[23];
-cx q[12],q[24];
-cx q[12],q[25];
-cx q[13],q[26];
-cx q[13],q[27];
-cx q[14],q[28];
-cx q[14],q[29];
-x q[15];
-x q[17];
-x q[18];
-x q[19];
-x q[20];
-x q[21];
-x q[22];
-x q[23];
-x q[24];
-x q[25];
-x q[26];
-x q[27];
-x q[28];
-x q[29];
-reset q[31];
-reset q[32];
-reset q[33];
-reset q[34];
-reset q[35];
-reset q[36];
-reset q[37];
-reset q[38];
-reset q[39];
-reset q[40];
-reset q[41];
-reset q[42];
-reset q[43];
-reset q[44];
-ccx q[16],q[15],q[31];
-ccx q[31],q[17],q[32];
-ccx q[32],q[18],q[33];
-ccx q[33],q[19],q[34];
-ccx q[34],q[20],q[35];
-ccx q[35],q[21],q[36];
-ccx q[36],q[22],q[37];
-ccx q[37],q[23],q[38];
-ccx q[38],q[24],q[39];
-ccx q[39],q[25],q[40];
-ccx q[40],q[26],q[41];
-ccx q[41],q[27],q[42];
-ccx q[42],q[28],q[43];
-ccx q[43],q[29],q[44];
-z q[44];
-ccx q[43],q[29],q[44];
-ccx q[42],q[28],q[43];
-ccx q[41],q[27],q[42];
-ccx q[40],q[26],q[41];
-ccx q[39],q[25],q[40];
-ccx q[38],q[24],q[39];
-ccx q[37],q[23],q[38];
-ccx q[36],q[22],q[37];
-ccx q[35],q[21],q[36];
-ccx q[34],q[20],q[35];
-ccx q[33],q[19],q[34];
-ccx q[32],q[18],q[33];
-ccx q[31],q[17],q[32];
-ccx q[16],q[15],q[31];
-x q[15];
-x q[17];
-x q[18];
-x q[19];
-x q[20];
-x q[21];
-x q[22];
-x q[23];
-x q[24];
-x q[25];
-x q[26];
-x q[27];
-x q[28];
-x q[29];
-cx q[0],q[15];
-cx q[1],q[17];
-cx q[2],q[19];
-cx q[3],q[21];
-cx q[4],q[23];
-cx q[5],q[25];
-cx q[6],q[27];
-cx q[7],q[29];
-cx q[8],q[16];
-cx q[8],q[17];
-cx q[9],q[18];
-cx q[9],q[19];
-cx q[10],q[20];
-cx q[10],q[21];
-cx q[11],q[22];
-cx q[11],q[23];
-cx q[12],q[24];
-cx q[12],q[25];
-cx q[13],q[26];
-cx q[13],q[27];
-cx q[14],q[28];
-cx q[14],q[29];
-h q[0];
-h q[1];
-h q[2];
-h q[3];
-h q[4];
-h q[5];
-h q[6];
-h q[7];
-h q[8];
-h q[9];
-h q[10];
-h q[11];
-h q[12];
-h q[13];
-h q[14];
-x q[0];
-x q[1];
-x q[2];
-x q[3];
-x q[4];
-x q[5];
-x q[6];
-x q[7];
-x q[8];
-x q[9];
-x q[10];
-x q[11];
-x q[12];
-x q[13];
-x q[14];
-reset q[31];
-reset q[32];
-reset q[33];
-reset q[34];
-reset q[35];
-reset q[36];
-reset q[37];
-reset q[38];
-reset q[39];
-reset q[40];
-reset q[41];
-reset q[42];
-reset q[43];
-reset q[44];
-ccx q[1],q[0],q[31];
-ccx q[31],q[2],q[32];
-ccx q[32],q[3],q[33];
-ccx q[33],q[4],q[34];
-ccx q[34],q[5],q[35];
-ccx q[35],q[6],q[36];
-ccx q[36],q[7],q[37];
-ccx q[37],q[8],q[38];
-ccx q[38],q[9],q[39];
-ccx q[39],q[10],q[40];
-ccx q[40],q[11],q[41];
-ccx q[41],q[12],q[42];
-ccx q[42],q[13],q[43];
-ccx q[43],q[14],q[44];
-z q[44];
-ccx q[43],q[14],q[44];
-ccx q[42],q[13],q[43];
-ccx q[41],q[12],q[42];
-ccx q[40],q[11],q[41];
-ccx q[39],q[10],q[40];
-ccx q[38],q[9],q[39];
-ccx q[37],q[8],q[38];
-ccx q[36],q[7],q[37];
-ccx q[35],q[6],q[36];
-ccx q[34],q[5],q[35];
-ccx q[33],q[4],q[34];
-ccx q[32],q[3],q[33];
-ccx q[31],q[2],q[32];
-ccx q[1],q[0],q[31];
-x q[0];
-x q[1];
-x q[2];
-x q[3];
-x q[4];
-x q[5];
-x q[6];
-x q[7];
-x q[8];
-x q[9];
-x q[10];
-x q[11];
-x q[12];
-x q[13];
-x q[14];
-h q[0];
-h q[1];
-h q[2];
-h q[3];
-h q[4];
-h q[5];
-h q[6];
-h q[7];
-h q[8];
-h q[9];
-h q[10];
-h q[11];
-h q[12];
-h q[13];
-h q[14];
-cx q[0],q[15];
-cx q[1],q[17];
-cx q[2],q[19];
-cx q[3],q[21];
-cx q[4],q[23];
-cx q[5],q[25];
-cx q[6],q[27];
-cx q[7],q[29];
-cx q[8],q[16];
-cx q[8],q[17];
-cx q[9],q[18];
-cx q[9],q[19];
-cx q[10],q[20];
-cx q[10],q[21];
-cx q[11],q[22];
-cx q[11],q[23];
-cx q[12],q[24];
-cx q[12],q[25];
-cx q[13],q[26];
-cx q[13],q[27];
-cx q[14],q[28];
-cx q[14],q[29];
-x q[15];
-x q[17];
-x q[18];
-x q[19];
-x q[20];
-x q[21];
-x q[22];
-x q[23];
-x q[24];
-x q[25];
-x q[26];
-x q[27];
-x q[28];
-x q[29];
-reset q[31];
-reset q[32];
-reset q[33];
-reset q[34];
-reset q[35];
-reset q[36];
-reset q[37];
-reset q[38];
-reset q[39];
-reset q[40];
-reset q[41];
-reset q[42];
-reset q[43];
-reset q[44];
-ccx q[16],q[15],q[31];
-ccx q[31],q[17],q[32];
-ccx q[32],q[18],q[33];
-ccx q[33],q[19],q[34];
-ccx q[34],q[20],q[35];
-ccx q[35],q[21],q[36];
-ccx q[36],q[22],q[37];
-ccx q[37],q[23],q[38];
-ccx q[38],q[24],q[39];
-ccx q[39],q[25],q[40];
-ccx q[40],q[26],q[41];
-ccx q[41],q[27],q[42];
-ccx q[42],q[28],q[43];
-ccx q[43],q[29],q[44];
-z q[44];
-ccx q[43],q[29],q[44];
-ccx q[42],q[28],q[43];
-ccx q[41],q[27],q[42];
-ccx q[40],q[26],q[41];
-ccx q[39],q[25],q[40];
-ccx q[38],q[24],q[39];
-ccx q[37],q[23],q[38];
-ccx q[36],q[22],q[37];
-ccx q[35],q[21],q[36];
-ccx q[34],q[20],q[35];
-ccx q[33],q[19],q[34];
-ccx q[32],q[18],q[33];
-ccx q[31],q[17],q[32];
-ccx q[16],q[15],q[31];
-x q[15];
-x q[17];
-x q[18];
-x q[19];
-x q[20];
-x q[21];
-x q[22];
-x q[23];
-x q[24];
-x q[25];
-x q[26];
-x q[27];
-x q[28];
-x q[29];
-cx q[0],q[15];
-cx q[1],q[17];
-cx q[2],q[19];
-cx q[3],q[21];
-cx q[4],q[23];
-cx q[5],q[25];
-cx q[6],q[27];
-cx q[7],q[29];
-cx q[8],q[16];
-cx q[8],q[17];
-cx q[9],q[18];
-cx q[9],q[19];
-cx q[10],q[20];
-cx q[10],q[21];
-cx q[11],q[22];
-cx q[11],q[23];
-cx q[12],q[24];
-cx q[12],q[25];
-cx q[13],q[26];
-cx q[13],q[27];
-cx q[14],q[28];
-cx q[14],q[29];
-h q[0];
-h q[1];
-h q[2];
-h q[3];
-h q[4];
-h q[5];
-h q[6];
-h q[7];
-h q[8];
-h q[9];
-h q[10];
-h q[11];
-h q[12];
-h q[13];
-h q[14];
-x q[0];
-x q[1];
-x q[2];
-x q[3];
-x q[4];
-x q[5];
-x q[6];
-x q[7];
-x q[8];
-x q[9];
-x q[10];
-x q[11];
-x q[12];
-x q[13];
-x q[14];
-reset q[31];
-reset q[32];
-reset q[33];
-reset q[34];
-reset q[35];
-reset q[36];
-reset q[37];
-reset q[38];
-reset q[39];
-reset q[40];
-reset q[41];
-reset q[42];
-reset q[43];
-reset q[44];
-ccx q[1],q[0],q[31];
-ccx q[31],q[2],q[32];
-ccx q[32],q[3],q[33];
-ccx q[33],q[4],q[34];
-ccx q[34],q[5],q[35];
-ccx q[35],q[6],q[36];
-ccx q[36],q[7],q[37];
-ccx q[37],q[8],q[38];
-ccx q[38],q[9],q[39];
-ccx q[39],q[10],q[40];
-ccx q[40],q[11],q[41];
-ccx q[41],q[12],q[42];
-ccx q[42],q[13],q[43];
-ccx q[43],q[14],q[44];
-z q[44];
-ccx q[43],q[14],q[44];
-ccx q[42],q[13],q[43];
-ccx q[41],q[12],q[42];
-ccx q[40],q[11],q[41];
-ccx q[39],q[10],q[40];
-ccx q[38],q[9],q[39];
-ccx q[37],q[8],q[38];
-ccx q[36],q[7],q[37];
-ccx q[35],q[6],q[36];
-ccx q[34],q[5],q[35];
-ccx q[33],q[4],q[34];
-ccx q[32],q[3],q[33];
-ccx q[31],q[2],q[32];
-ccx q[1],q[0],q[31];
-x q[0];
-x q[1];
-x q[2];
-x q[3];
-x q[4];
-x q[5];
-x q[6];
-x q[7];
-x q[8];
-x q[9];
-x q[10];
-x q[11];
-x q[12];
-x q[13];
-x q[14];
-h q[0];
-h q[1];
-h q[2];
-h q[3];
-h q[4];
-h q[5];
-h q[6];
-h q[7];
-h q[8];
-h q[9];
-h q[10];
-h q[11];
-h q[12];
-h q[13];
-h q[14];
-cx q[0],q[15];
-cx q[1],q[17];
-cx q[2],q[19];
-cx q[3],q[21];
-cx q[4],q[23];
-cx q[5],q[25];
-cx q[6],q[27];
-cx q[7],q[29];
-cx q[8],q[16];
-cx q[8],q[17];
-cx q[9],q[18];
-cx q[9],q[19];
-cx q[10],q[20];
-cx q[10],q[21];
-cx q[11],q[22];
-cx q[11],q[23];
-cx q[12],q[24];
-cx q[12],q[25];
-cx q[13],q[26];
-cx q[13],q[27];
-cx q[14],q[28];
-cx q[14],q[29];
-x q[15];
-x q[17];
-x q[18];
-x q[19];
-x q[20];
-x q[21];
-x q[22];
-x q[23];
-x q[24];
-x q[25];
-x q[26];
-x q[27];
-x q[28];
-x q[29];
-reset q[31];
-reset q[32];
-reset q[33];
-reset q[34];
-reset q[35];
-reset q[36];
-reset q[37];
-reset q[38];
-reset q[39];
-reset q[40];
-reset q[41];
-reset q[42];
-reset q[43];
-reset q[44];
-ccx q[16],q[15],q[31];
-ccx q[31],q[17],q[32];
-ccx q[32],q[18],q[33];
-ccx q[33],q[19],q[34];
-ccx q[34],q[20],q[35];
-ccx q[35],q[21],q[36];
-ccx q[36],q[22],q[37];
-ccx q[37],q[23],q[38];
-ccx q[38],q[24],q[39];
-ccx q[39],q[25],q[40];
-ccx q[40],q[26],q[41];
-ccx q[41],q[27],q[42];
-ccx q[42],q[28],q[43];
-ccx q[43],q[29],q[44];
-z q[44];
-ccx q[43],q[29],q[44];
-ccx q[42],q[28],q[43];
-ccx q[41],q[27],q[42];
-ccx q[40],q[26],q[41];
-ccx q[39],q[25],q[40];
-ccx q[38],q[24],q[39];
-ccx q[37],q[23],q[38];
-ccx q[36],q[22],q[37];
-ccx q[35],q[21],q[36];
-ccx q[34],q[20],q[35];
-ccx q[33],q[19],q[34];
-ccx q[32],q[18],q[33];
-ccx q[31],q[17],q[32];
-ccx q[16],q[15],q[31];
-x q[15];
-x q[17];
-x q[18];
-x q[19];
-x q[20];
-x q[21];
-x q[22];
-x q[23];
-x q[24];
-x q[25];
-x q[26];
-x q[27];
-x q[28];
-x q[29];
-cx q[0],q[15];
-cx q[1],q[17];
-cx q[2],q[19];
-cx q[3],q[21];
-cx q[4],q[23];
-cx q[5],q[25];
-cx q[6],q[27];
-cx q[7],q[29];
-cx q[8],q[16];
-cx q[8],q[17];
-cx q[9],q[18];
-cx q[9],q[19];
-cx q[10],q[20];
-cx q[10],q[21];
-cx q[11],q[22];
-cx q[11],q[23];
-cx q[12],q[24];
-cx q[12],q[25];
-cx q[13],q[26];
-cx q[13],q[27];
-cx q[14],q[28];
-cx q[14],q[29];
-h q[0];
-h q[1];
-h q[2];
-h q[3];
-h q[4];
-h q[5];
-h q[6];
-h q[7];
-h q[8];
-h q[9];
-h q[10];
-h q[11];
-h q[12];
-h q[13];
-h q[14];
-x q[0];
-x q[1];
-x q[2];
-x q[3];
-x q[4];
-x q[5];
-x q[6];
-x q[7];
-x q[8];
-x q[9];
-x q[10];
-x q[11];
-x q[12];
-x q[13];
-x q[14];
-reset q[31];
-reset q[32];
-reset q[33];
-reset q[34];
-reset q[35];
-reset q[36];
-reset q[37];
-reset q[38];
-reset q[39];
-reset q[40];
-reset q[41];
-reset q[42];
-reset q[43];
-reset q[44];
-ccx q[1],q[0],q[31];
-ccx q[31],q[2],q[32];
-ccx q[32],q[3],q[33];
-ccx q[33],q[4],q[34];
-ccx q[34],q[5],q[35];
-ccx q[35],q[6],q[36];
-ccx q[36],q[7],q[37];
-ccx q[37],q[8],q[38];
-ccx q[38],q[9],q[39];
-ccx q[39],q[10],q[40];
-ccx q[40],q[11],q[41];
-ccx q[41],q[12],q[42];
-ccx q[42],q[13],q[43];
-ccx q[43],q[14],q[44];
-z q[44];
-ccx q[43],q[14],q[44];
-ccx q[42],q[13],q[43];
-ccx q[41],q[12],q[42];
-ccx q[40],q[11],q[41];
-ccx q[39],q[10],q[40];
-ccx q[38],q[9],q[39];
-ccx q[37],q[8],q[38];
-ccx q[36],q[7],q[37];
-ccx q[35],q[6],q[36];
-ccx q[34],q[5],q[35];
-ccx q[33],q[4],q[34];
-ccx q[32],q[3],q[33];
-ccx q[31],q[2],q[32];
-ccx q[1],q[0],q[31];
-x q[0];
-x q[1];
-x q[2];
-x q[3];
-x q[4];
-x q[5];
-x q[6];
-x q[7];
-x q[8];
-x q[9];
-x q[10];
-x q[11];
-x q[12];
-x q[13];
-x q[14];
-h q[0];
-h q[1];
-h q[2];
-h q[3];
-h q[4];
-h q[5];
-h q[6];
-h q[7];
-h q[8];
-h q[9];
-h q[10];
-h q[11];
-h q[12];
-h q[13];
-h q[14];
-cx q[0],q[15];
-cx q[1],q[17];
-cx q[2],q[19];
-cx q[3],q[21];
-cx q[4],q[23];
-cx q[5],q[25];
-cx q[6],q[27];
-cx q[7],q[29];
-cx q[8],q[16];
-cx q[8],q[17];
-cx q[9],q[18];
-cx q[9],q[19];
-cx q[10],q[20];
-cx q[10],q[21];
-cx q[11],q[22];
-cx q[11],q[23];
-cx q[12],q[24];
-cx q[12],q[25];
-cx q[13],q[26];
-cx q[13],q[27];
-cx q[14],q[28];
-cx q[14],q[29];
-x q[15];
-x q[17];
-x q[18];
-x q[19];
-x q[20];
-x q[21];
-x q[22];
-x q[23];
-x q[24];
-x q[25];
-x q[26];
-x q[27];
-x q[28];
-x q[29];
-reset q[31];
-reset q[32];
-reset q[33];
-reset q[34];
-reset q[35];
-reset q[36];
-reset q[37];
-reset q[38];
-reset q[39];
-reset q[40];
-reset q[41];
-reset q[42];
-reset q[43];
-reset q[44];
-ccx q[16],q[15],q[31];
-ccx q[31],q[17],q[32];
-ccx q[32],q[18],q[33];
-ccx q[33],q[19],q[34];
-ccx q[34],q[20],q[35];
-ccx q[35],q[21],q[36];
-ccx q[36],q[22],q[37];
-ccx q[37],q[23],q[38];
-ccx q[38],q[24],q[39];
-ccx q[39],q[25],q[40];
-ccx q[40],q[26],q[41];
-ccx q[41],q[27],q[42];
-ccx q[42],q[28],q[43];
-ccx q[43],q[29],q[44];
-z q[44];
-ccx q[43],q[29],q[44];
-ccx q[42],q[28],q[43];
-ccx q[41],q[27],q[42];
-ccx q[40],q[26],q[41];
-ccx q[39],q[25],q[40];
-ccx q[38],q[24],q[39];
-ccx q[37],q[23],q[38];
-ccx q[36],q[22],q[37];
-ccx q[35],q[21],q[36];
-ccx q[34],q[20],q[35];
-ccx q[33],q[19],q[34];
-ccx q[32],q[18],q[33];
-ccx q[31],q[17],q[32];
-ccx q[16],q[15],q[31];
-x q[15];
-x q[17];
-x q[18];
-x q[19];
-x q[20];
-x q[21];
-x q[22];
-x q[23];
-x q[24];
-x q[25];
-x q[26];
-x q[27];
-x q[28];
-x q[29];
-cx q[0],q[15];
-cx q[1],q[17];
-cx q[2],q[19];
-cx q[3],q[21];
-cx q[4],q[23];
-cx q[5],q[25];
-cx q[6],q[27];
-cx q[7],q[29];
-cx q[8],q[16];
-cx q[8],q[17];
-cx q[9],q[18];
-cx q[9],q[19];
-cx q[10],q[20];
-cx q[10],q[21];
-cx q[11],q[22];
-cx q[11],q[23];
-cx q[12],q[24];
-cx q[12],q[25];
-cx q[13],q[26];
-cx q[13],q[27];
-cx q[14],q[28];
-cx q[14],q[29];
-h q[0];
-h q[1];
-h q[2];
-h q[3];
-h q[4];
-h q[5];
-h q[6];
-h q[7];
-h q[8];
-h q[9];
-h q[10];
-h q[11];
-h q[12];
-h q[13];
-h q[14];
-x q[0];
-x q[1];
-x q[2];
-x q[3];
-x q[4];
-x q[5];
-x q[6];
-x q[7];
-x q[8];
-x q[9];
-x q[10];
-x q[11];
-x q[12];
-x q[13];
-x q[14];
-reset q[31];
-reset q[32];
-reset q[33];
-reset q[34];
-reset q[35];
-reset q[36];
-reset q[37];
-reset q[38];
-reset q[39];
-reset q[40];
-reset q[41];
-reset q[42];
-reset q[43];
-reset q[44];
-ccx q[1],q[0],q[31];
-ccx q[31],q[2],q[32];
-ccx q[32],q[3],q[33];
-ccx q[33],q[4],q[34];
-ccx q[34],q[5],q[35];
-ccx q[35],q[6],q[36];
-ccx q[36],q[7],q[37];
-ccx q[37],q[8],q[38];
-ccx q[38],q[9],q[39];
-ccx q[39],q[10],q[40];
-ccx q[40],q[11],q[41];
-ccx q[41],q[12],q[42];
-ccx q[42],q[13],q[43];
-ccx q[43],q[14],q[44];
-z q[44];
-ccx q[43],q[14],q[44];
-ccx q[42],q[13],q[43];
-ccx q[41],q[12],q[42];
-ccx q[40],q[11],q[41];
-ccx q[39],q[10],q[40];
-ccx q[38],q[9],q[39];
-ccx q[37],q[8],q[38];
-ccx q[36],q[7],q[37];
-ccx q[35],q[6],q[36];
-ccx q[34],q[5],q[35];
-ccx q[33],q[4],q[34];
-ccx q[32],q[3],q[33];
-ccx q[31],q[2],q[32];
-ccx q[1],q[0],q[31];
-x q[0];
-x q[1];
-x q[2];
-x q[3];
-x q[4];
-x q[5];
-x q[6];
-x q[7];
-x q[8];
-x q[9];
-x q[10];
-x q[11];
-x q[12];
-x q[13];
-x q[14];
-h q[0];
-h q[1];
-h q[2];
-h q[3];
-h q[4];
-h q[5];
-h q[6];
-h q[7];
-h q[8];
-h q[9];
-h q[10];
-h q[11];
-h q[12];
-h q[13];
-h q[14];
-cx q[0],q[15];
-cx q[1],q[17];
-cx q[2],q[19];
-cx q[3],q[21];
-cx q[4],q[23];
-cx q[5],q[25];
-cx q[6],q[27];
-cx q[7],q[29];
-cx q[8],q[16];
-cx q[8],q[17];
-cx q[9],q[18];
-cx q[9],q[19];
-cx q[10],q[20];
-cx q[10],q[21];
-cx q[11],q[22];
-cx q[11],q[23];
-cx q[12],q[24];
-cx q[12],q[25];
-cx q[13],q[26];
-cx q[13],q[27];
-cx q[14],q[28];
-cx q[14],q[29];
-x q[15];
-x q[17];
-x q[18];
-x q[19];
-x q[20];
-x q[21];
-x q[22];
-x q[23];
-x q[24];
-x q[25];
-x q[26];
-x q[27];
-x q[28];
-x q[29];
-reset q[31];
-reset q[32];
-reset q[33];
-reset q[34];
-reset q[35];
-reset q[36];
-reset q[37];
-reset q[38];
-reset q[39];
-reset q[40];
-reset q[41];
-reset q[42];
-reset q[43];
-reset q[44];
-ccx q[16],q[15],q[31];
-ccx q[31],q[17],q[32];
-ccx q[32],q[18],q[33];
-ccx q[33],q[19],q[34];
-ccx q[34],q[20],q[35];
-ccx q[35],q[21],q[36];
-ccx q[36],q[22],q[37];
-ccx q[37],q[23],q[38];
-ccx q[38],q[24],q[39];
-ccx q[39],q[25],q[40];
-ccx q[40],q[26],q[41];
-ccx q[41],q[27],q[42];
-ccx q[42],q[28],q[43];
-ccx q[43],q[29],q[44];
-z q[44];
-ccx q[43],q[29],q[44];
-ccx q[42],q[28],q[43];
-ccx q[41],q[27],q[42];
-ccx q[40],q[26],q[41];
-ccx q[39],q[25],q[40];
-ccx q[38],q[24],q[39];
-ccx q[37],q[23],q[38];
-ccx q[36],q[22],q[37];
-ccx q[35],q[21],q[36];
-ccx q[34],q[20],q[35];
-ccx q[33],q[19],q[34];
-ccx q[32],q[18],q[33];
-ccx q[31],q[17],q[32];
-ccx q[16],q[15],q[31];
-x q[15];
-x q[17];
-x q[18];
-x q[19];
-x q[20];
-x q[21];
-x q[22];
-x q[23];
-x q[24];
-x q[25];
-x q[26];
-x q[27];
-x q[28];
-x q[29];
-cx q[0],q[15];
-cx q[1],q[17];
-cx q[2],q[19];
-cx q[3],q[21];
-cx q[4],q[23];
-cx q[5],q[25];
-cx q[6],q[27];
-cx q[7],q[29];
-cx q[8],q[16];
-cx q[8],q[17];
-cx q[9],q[18];
-cx q[9],q[19];
-cx q[10],q[20];
-cx q[10],q[21];
-cx q[11],q[22];
-cx q[11],q[23];
-cx q[12],q[24];
-cx q[12],q[25];
-cx q[13],q[26];
-cx q[13],q[27];
-cx q[14],q[28];
-cx q[14],q[29];
-h q[0];
-h q[1];
-h q[2];
-h q[3];
-h q[4];
-h q[5];
-h q[6];
-h q[7];
-h q[8];
-h q[9];
-h q[10];
-h q[11];
-h q[12];
-h q[13];
-h q[14];
-x q[0];
-x q[1];
-x q[2];
-x q[3];
-x q[4];
-x q[5];
-x q[6];
-x q[7];
-x q[8];
-x q[9];
-x q[10];
-x q[11];
-x q[12];
-x q[13];
-x q[14];
-reset q[31];
-reset q[32];
-reset q[33];
-reset q[34];
-reset q[35];
-reset q[36];
-reset q[37];
-reset q[38];
-reset q[39];
-reset q[40];
-reset q[41];
-reset q[42];
-reset q[43];
-reset q[44];
-ccx q[1],q[0],q[31];
-ccx q[31],q[2],q[32];
-ccx q[32],q[3],q[33];
-ccx q[33],q[4],q[34];
-ccx q[34],q[5],q[35];
-ccx q[35],q[6],q[36];
-ccx q[36],q[7],q[37];
-ccx q[37],q[8],q[38];
-ccx q[38],q[9],q[39];
-ccx q[39],q[10],q[40];
-ccx q[40],q[11],q[41];
-ccx q[41],q[12],q[42];
-ccx q[42],q[13],q[43];
-ccx q[43],q[14],q[44];
-z q[44];
-ccx q[43],q[14],q[44];
-ccx q[42],q[13],q[43];
-ccx q[41],q[12],q[42];
-ccx q[40],q[11],q[41];
-ccx q[39],q[10],q[40];
-ccx q[38],q[9],q[39];
-ccx q[37],q[8],q[38];
-ccx q[36],q[7],q[37];
-ccx q[35],q[6],q[36];
-ccx q[34],q[5],q[35];
-ccx q[33],q[4],q[34];
-ccx q[32],q[3],q[33];
-ccx q[31],q[2],q[32];
-ccx q[1],q[0],q[31];
-x q[0];
-x q[1];
-x q[2];
-x q[3];
-x q[4];
-x q[5];
-x q[6];
-x q[7];
-x q[8];
-x q[9];
-x q[10];
-x q[11];
-x q[12];
-x q[13];
-x q[14];
-h q[0];
-h q[1];
-h q[2];
-h q[3];
-h q[4];
-h q[5];
-h q[6];
-h q[7];
-h q[8];
-h q[9];
-h q[10];
-h q[11];
-h q[12];
-h q[13];
-h q[14];
-cx q[0],q[15];
-cx q[1],q[17];
-cx q[2],q[19];
-cx q[3],q[21];
-cx q[4],q[23];
-cx q[5],q[25];
-cx q[6],q[27];
-cx q[7],q[29];
-cx q[8],q[16];
-cx q[8],q[17];
-cx q[9],q[18];
-cx q[9],q[19];
-cx q[10],q[20];
-cx q[10],q[21];
-cx q[11],q[22];
-cx q[11],q[23];
-cx q[12],q[24];
-cx q[12],q[25];
-cx q[13],q[26];
-cx q[13],q[27];
-cx q[14],q[28];
-cx q[14],q[29];
-x q[15];
-x q[17];
-x q[18];
-x q[19];
-x q[20];
-x q[21];
-x q[22];
-x q[23];
-x q[24];
-x q[25];
-x q[26];
-x q[27];
-x q[28];
-x q[29];
-reset q[31];
-reset q[32];
-reset q[33];
-reset q[34];
-reset q[35];
-reset q[36];
-reset q[37];
-reset q[38];
-reset q[39];
-reset q[40];
-reset q[41];
-reset q[42];
-reset q[43];
-reset q[44];
-ccx q[16],q[15],q[31];
-ccx q[31],q[17],q[32];
-ccx q[32],q[18],q[33];
-ccx q[33],q[19],q[34];
-ccx q[34],q[20],q[35];
-ccx q[35],q[21],q[36];
-ccx q[36],q[22],q[37];
-ccx q[37],q[23],q[38];
-ccx q[38],q[24],q[39];
-ccx q[39],q[25],q[40];
-ccx q[40],q[26],q[41];
-ccx q[41],q[27],q[42];
-ccx q[42],q[28],q[43];
-ccx q[43],q[29],q[44];
-z q[44];
-ccx q[43],q[29],q[44];
-ccx q[42],q[28],q[43];
-ccx q[41],q[27],q[42];
-ccx q[40],q[26],q[41];
-ccx q[39],q[25],q[40];
-ccx q[38],q[24],q[39];
-ccx q[37],q[23],q[38];
-ccx q[36],q[22],q[37];
-ccx q[35],q[21],q[36];
-ccx q[34],q[20],q[35];
-ccx q[33],q[19],q[34];
-ccx q[32],q[18],q[33];
-ccx q[31],q[17],q[32];
-ccx q[16],q[15],q[31];
-x q[15];
-x q[17];
-x q[18];
-x q[19];
-x q[20];
-x q[21];
-x q[22];
-x q[23];
-x q[24];
-x q[25];
-x q[26];
-x q[27];
-x q[28];
-x q[29];
-cx q[0],q[15];
-cx q[1],q[17];
-cx q[2],q[19];
-cx q[3],q[21];
-cx q[4],q[23];
-cx q[5],q[25];
-cx q[6],q[27];
-cx q[7],q[29];
-cx q[8],q[16];
-cx q[8],q[17];
-cx q[9],q[18];
-cx q[9],q[19];
-cx q[10],q[20];
-cx q[10],q[21];
-cx q[11],q[22];
-cx q[11],q[23];
-cx q[12],q[24];
-cx q[12],q[25];
-cx q[13],q[26];
-cx q[13],q[27];
-cx q[14],q[28];
-cx q[14],q[29];
-h q[0];
-h q[1];
-h q[2];
-h q[3];
-h q[4];
-h q[5];
-h q[6];
-h q[7];
-h q[8];
-h q[9];
-h q[10];
-h q[11];
-h q[12];
-h q[13];
-h q[14];
-x q[0];
-x q[1];
-x q[2];
-x q[3];
-x q[4];
-x q[5];
-x q[6];
-x q[7];
-x q[8];
-x q[9];
-x q[10];
-x q[11];
-x q[12];
-x q[13];
-x q[14];
-reset q[31];
-reset q[32];
-reset q[33];
-reset q[34];
-reset q[35];
-reset q[36];
-reset q[37];
-reset q[38];
-reset q[39];
-reset q[40];
-reset q[41];
-reset q[42];
-reset q[43];
-reset q[44];
-ccx q[1],q[0],q[31];
-ccx q[31],q[2],q[32];
-ccx q[32],q[3],q[33];
-ccx q[33],q[4],q[34];
-ccx q[34],q[5],q[35];
-ccx q[35],q[6],q[36];
-ccx q[36],q[7],q[37];
-ccx q[37],q[8],q[38];
-ccx q[38],q[9],q[39];
-ccx q[39],q[10],q[40];
-ccx q[40],q[11],q[41];
-ccx q[41],q[12],q[42];
-ccx q[42],q[13],q[43];
-ccx q[43],q[14],q[44];
-z q[44];
-ccx q[43],q[14],q[44];
-ccx q[42],q[13],q[43];
-ccx q[41],q[12],q[42];
-ccx q[40],q[11],q[41];
-ccx q[39],q[10],q[40];
-ccx q[38],q[9],q[39];
-ccx q[37],q[8],q[38];
-ccx q[36],q[7],q[37];
-ccx q[35],q[6],q[36];
-ccx q[34],q[5],q[35];
-ccx q[33],q[4],q[34];
-ccx q[32],q[3],q[33];
-ccx q[31],q[2],q[32];
-ccx q[1],q[0],q[31];
-x q[0];
-x q[1];
-x q[2];
-x q[3];
-x q[4];
-x q[5];
-x q[6];
-x q[7];
-x q[8];
-x q[9];
-x q[10];
-x q[11];
-x q[12];
-x q[13];
-x q[14];
-h q[0];
-h q[1];
-h q[2];
-h q[3];
-h q[4];
-h q[5];
-h q[6];
-h q[7];
-h q[8];
-h q[9];
-h q[10];
-h q[11];
-h q[12];
-h q[13];
-h q[14];
-cx q[0],q[15];
-cx q[1],q[17];
-cx q[2],q[19];
-cx q[3],q[21];
-cx q[4],q[23];
-cx q[5],q[25];
-cx q[6],q[27];
-cx q[7],q[29];
-cx q[8],q[16];
-cx q[8],q[17];
-cx q[9],q[18];
-cx q[9],q[19];
-cx q[10],q[20];
-cx q[10],q[21];
-cx q[11],q[22];
-cx q[11],q[23];
-cx q[12],q[24];
-cx q[12],q[25];
-cx q[13],q[26];
-cx q[13],q[27];
-cx q[14],q[28];
-cx q[14],q[29];
-x q[15];
-x q[17];
-x q[18];
-x q[19];
-x q[20];
-x q[21];
-x q[22];
-x q[23];
-x q[24];
-x q[25];
-x q[26];
-x q[27];
-x q[28];
-x q[29];
-reset q[31];
-reset q[32];
-reset q[33];
-reset q[34];
-reset q[35];
-reset q[36];
-reset q[37];
-reset q[38];
-reset q[39];
-reset q[40];
-reset q[41];
-reset q[42];
-reset q[43];
-reset q[44];
-ccx q[16],q[15],q[31];
-ccx q[31],q[17],q[32];
-ccx q[32],q[18],q[33];
-ccx q[33],q[19],q[34];
-ccx q[34],q[20],q[35];
-ccx q[35],q[21],q[36];
-ccx q[36],q[22],q[37];
-ccx q[37],q[23],q[38];
-ccx q[38],q[24],q[39];
-ccx q[39],q[25],q[40];
-ccx q[40],q[26],q[41];
-ccx q[41],q[27],q[42];
-ccx q[42],q[28],q[43];
-ccx q[43],q[29],q[44];
-z q[44];
-ccx q[43],q[29],q[44];
-ccx q[42],q[28],q[43];
-ccx q[41],q[27],q[42];
-ccx q[40],q[26],q[41];
-ccx q[39],q[25],q[40];
-ccx q[38],q[24],q[39];
-ccx q[37],q[23],q[38];
-ccx q[36],q[22],q[37];
-ccx q[35],q[21],q[36];
-ccx q[34],q[20],q[35];
-ccx q[33],q[19],q[34];
-ccx q[32],q[18],q[33];
-ccx q[31],q[17],q[32];
-ccx q[16],q[15],q[31];
-x q[15];
-x q[17];
-x q[18];
-x q[19];
-x q[20];
-x q[21];
-x q[22];
-x q[23];
-x q[24];
-x q[25];
-x q[26];
-x q[27];
-x q[28];
-x q[29];
-cx q[0],q[15];
-cx q[1],q[17];
-cx q[2],q[19];
-cx q[3],q[21];
-cx q[4],q[23];
-cx q[5],q[25];
-cx q[6],q[27];
-cx q[7],q[29];
-cx q[8],q[16];
-cx q[8],q[17];
-cx q[9],q[18];
-cx q[9],q[19];
-cx q[10],q[20];
-cx q[10],q[21];
-cx q[11],q[22];
-cx q[11],q[23];
-cx q[12],q[24];
-cx q[12],q[25];
-cx q[13],q[26];
-cx q[13],q[27];
-cx q[14],q[28];
-cx q[14],q[29];
-h q[0];
-h q[1];
-h q[2];
-h q[3];
-h q[4];
-h q[5];
-h q[6];
-h q[7];
-h q[8];
-h q[9];
-h q[10];
-h q[11];
-h q[12];
-h q[13];
-h q[14];
-x q[0];
-x q[1];
-x q[2];
-x q[3];
-x q[4];
-x q[5];
-x q[6];
-x q[7];
-x q[8];
-x q[9];
-x q[10];
-x q[11];
-x q[12];
-x q[13];
-x q[14];
-reset q[31];
-reset q[32];
-reset q[33];
-reset q[34];
-reset q[35];
-reset q[36];
-reset q[37];
-reset q[38];
-reset q[39];
-reset q[40];
-reset q[41];
-reset q[42];
-reset q[43];
-reset q[44];
-ccx q[1],q[0],q[31];
-ccx q[31],q[2],q[32];
-ccx q[32],q[3],q[33];
-ccx q[33],q[4],q[34];
-ccx q[34],q[5],q[35];
-ccx q[35],q[6],q[36];
-ccx q[36],q[7],q[37];
-ccx q[37],q[8],q[38];
-ccx q[38],q[9],q[39];
-ccx q[39],q[10],q[40];
-ccx q[40],q[11],q[41];
-ccx q[41],q[12],q[42];
-ccx q[42],q[13],q[43];
-ccx q[43],q[14],q[44];
-z q[44];
-ccx q[43],q[14],q[44];
-ccx q[42],q[13],q[43];
-ccx q[41],q[12],q[42];
-ccx q[40],q[11],q[41];
-ccx q[39],q[10],q[40];
-ccx q[38],q[9],q[39];
-ccx q[37],q[8],q[38];
-ccx q[36],q[7],q[37];
-ccx q[35],q[6],q[36];
-ccx q[34],q[5],q[35];
-ccx q[33],q[4],q[34];
-ccx q[32],q[3],q[33];
-ccx q[31],q[2],q[32];
-ccx q[1],q[0],q[31];
-x q[0];
-x q[1];
-x q[2];
-x q[3];
-x q[4];
-x q[5];
-x q[6];
-x q[7];
-x q[8];
-x q[9];
-x q[10];
-x q[11];
-x q[12];
-x q[13];
-x q[14];
-h q[0];
-h q[1];
-h q[2];
-h q[3];
-h q[4];
-h q[5];
-h q[6];
-h q[7];
-h q[8];
-h q[9];
-h q[10];
-h q[11];
-h q[12];
-h q[13];
-h q[14];
-cx q[0],q[15];
-cx q[1],q[17];
-cx q[2],q[19];
-cx q[3],q[21];
-cx q[4],q[23];
-cx q[5],q[25];
-cx q[6],q[27];
-cx q[7],q[29];
-cx q[8],q[16];
-cx q[8],q[17];
-cx q[9],q[18];
-cx q[9],q[19];
-cx q[10],q[20];
-cx q[10],q[21];
-cx q[11],q[22];
-cx q[11],q[23];
-cx q[12],q[24];
-cx q[12],q[25];
-cx q[13],q[26];
-cx q[13],q[27];
-cx q[14],q[28];
-cx q[14],q[29];
-x q[15];
-x q[17];
-x q[18];
-x q[19];
-x q[20];
-x q[21];
-x q[22];
-x q[23];
-x q[24];
-x q[25];
-x q[26];
-x q[27];
-x q[28];
-x q[29];
-reset q[31];
-reset q[32];
-reset q[33];
-reset q[34];
-reset q[35];
-reset q[36];
-reset q[37];
-reset q[38];
-reset q[39];
-reset q[40];
-reset q[41];
-reset q[42];
-reset q[43];
-reset q[44];
-ccx q[16],q[15],q[31];
-ccx q[31],q[17],q[32];
-ccx q[32],q[18],q[33];
-ccx q[33],q[19],q[34];
-ccx q[34],q[20],q[35];
-ccx q[35],q[21],q[36];
-ccx q[36],q[22],q[37];
-ccx q[37],q[23],q[38];
-ccx q[38],q[24],q[39];
-ccx q[39],q[25],q[40];
-ccx q[40],q[26],q[41];
-ccx q[41],q[27],q[42];
-ccx q[42],q[28],q[43];
-ccx q[43],q[29],q[44];
-z q[44];
-ccx q[43],q[29],q[44];
-ccx q[42],q[28],q[43];
-ccx q[41],q[27],q[42];
-ccx q[40],q[26],q[41];
-ccx q[39],q[25],q[40];
-ccx q[38],q[24],q[39];
-ccx q[37],q[23],q[38];
-ccx q[36],q[22],q[37];
-ccx q[35],q[21],q[36];
-ccx q[34],q[20],q[35];
-ccx q[33],q[19],q[34];
-ccx q[32],q[18],q[33];
-ccx q[31],q[17],q[32];
-ccx q[16],q[15],q[31];
-x q[15];
-x q[17];
-x q[18];
-x q[19];
-x q[20];
-x q[21];
-x q[22];
-x q[23];
-x q[24];
-x q[25];
-x q[26];
-x q[27];
-x q[28];
-x q[29];
-cx q[0],q[15];
-cx q[1],q[17];
-cx q[2],q[19];
-cx q[3],q[21];
-cx q[4],q[23];
-cx q[5],q[25];
-cx q[6],q[27];
-cx q[7],q[29];
-cx q[8],q[16];
-cx q[8],q[17];
-cx q[9],q[18];
-cx q[9],q[19];
-cx q[10],q[20];
-cx q[10],q[21];
-cx q[11],q[22];
-cx q[11],q[23];
-cx q[12],q[24];
-cx q[12],q[25];
-cx q[13],q[26];
-cx q[13],q[27];
-cx q[14],q[28];
-cx q[14],q[29];
-h q[0];
-h q[1];
-h q[2];
-h q[3];
-h q[4];
-h q[5];
-h q[6];
-h q[7];
-h q[8];
-h q[9];
-h q[10];
-h q[11];
-h q[12];
-h q[13];
-h q[14];
-x q[0];
-x q[1];
-x q[2];
-x q[3];
-x q[4];
-x q[5];
-x q[6];
-x q[7];
-x q[8];
-x q[9];
-x q[10];
-x q[11];
-x q[12];
-x q[13];
-x q[14];
-reset q[31];
-reset q[32];
-reset q[33];
-reset q[34];
-reset q[35];
-reset q[36];
-reset q[37];
-reset q[38];
-reset q[39];
-reset q[40];
-reset q[41];
-reset q[42];
-reset q[43];
-reset q[44];
-ccx q[1],q[0],q[31];
-ccx q[31],q[2],q[32];
-ccx q[32],q[3],q[33];
-ccx q[33],q[4],q[34];
-ccx q[34],q[5],q[35];
-ccx q[35],q[6],q[36];
-ccx q[36],q[7],q[37];
-ccx q[37],q[8],q[38];
-ccx q[38],q[9],q[39];
-ccx q[39],q[10],q[40];
-ccx q[40],q[11],q[41];
-ccx q[41],q[12],q[42];
-ccx q[42],q[13],q[43];
-ccx q[43],q[14],q[44];
-z q[44];
-ccx q[43],q[14],q[44];
-ccx q[42],q[13],q[43];
-ccx q[41],q[12],q[42];
-ccx q[40],q[11],q[41];
-ccx q[39],q[10],q[40];
-ccx q[38],q[9],q[39];
-ccx q[37],q[8],q[38];
-ccx q[36],q[7],q[37];
-ccx q[35],q[6],q[36];
-ccx q[34],q[5],q[35];
-ccx q[33],q[4],q[34];
-ccx q[32],q[3],q[33];
-ccx q[31],q[2],q[32];
-ccx q[1],q[0],q[31];
-x q[0];
-x q[1];
-x q[2];
-x q[3];
-x q[4];
-x q[5];
-x q[6];
-x q[7];
-x q[8];
-x q[9];
-x q[10];
-x q[11];
-x q[12];
-x q[13];
-x q[14];
-h q[0];
-h q[1];
-h q[2];
-h q[3];
-h q[4];
-h q[5];
-h q[6];
-h q[7];
-h q[8];
-h q[9];
-h q[10];
-h q[11];
-h q[12];
-h q[13];
-h q[14];
-cx q[0],q[15];
-cx q[1],q[17];
-cx q[2],q[19];
-cx q[3],q[21];
-cx q[4],q[23];
-cx q[5],q[25];
-cx q[6],q[27];
-cx q[7],q[29];
-cx q[8],q[16];
-cx q[8],q[17];
-cx q[9],q[18];
-cx q[9],q[19];
-cx q[10],q[20];
-cx q[10],q[21];
-cx q[11],q[22];
-cx q[11],q[23];
-cx q[12],q[24];
-cx q[12],q[25];
-cx q[13],q[26];
-cx q[13],q[27];
-cx q[14],q[28];
-cx q[14],q[29];
-x q[15];
-x q[17];
-x q[18];
-x q[19];
-x q[20];
-x q[21];
-x q[22];
-x q[23];
-x q[24];
-x q[25];
-x q[26];
-x q[27];
-x q[28];
-x q[29];
-reset q[31];
-reset q[32];
-reset q[33];
-reset q[34];
-reset q[35];
-reset q[36];
-reset q[37];
-reset q[38];
-reset q[39];
-reset q[40];
-reset q[41];
-reset q[42];
-reset q[43];
-reset q[44];
-ccx q[16],q[15],q[31];
-ccx q[31],q[17],q[32];
-ccx q[32],q[18],q[33];
-ccx q[33],q[19],q[34];
-ccx q[34],q[20],q[35];
-ccx q[35],q[21],q[36];
-ccx q[36],q[22],q[37];
-ccx q[37],q[23],q[38];
-ccx q[38],q[24],q[39];
-ccx q[39],q[25],q[40];
-ccx q[40],q[26],q[41];
-ccx q[41],q[27],q[42];
-ccx q[42],q[28],q[43];
-ccx q[43],q[29],q[44];
-z q[44];
-ccx q[43],q[29],q[44];
-ccx q[42],q[28],q[43];
-ccx q[41],q[27],q[42];
-ccx q[40],q[26],q[41];
-ccx q[39],q[25],q[40];
-ccx q[38],q[24],q[39];
-ccx q[37],q[23],q[38];
-ccx q[36],q[22],q[37];
-ccx q[35],q[21],q[36];
-ccx q[34],q[20],q[35];
-ccx q[33],q[19],q[34];
-ccx q[32],q[18],q[33];
-ccx q[31],q[17],q[32];
-ccx q[16],q[15],q[31];
-x q[15];
-x q[17];
-x q[18];
-x q[19];
-x q[20];
-x q[21];
-x q[22];
-x q[23];
-x q[24];
-x q[25];
-x q[26];
-x q[27];
-x q[28];
-x q[29];
-cx q[0],q[15];
-cx q[1],q[17];
-cx q[2],q[19];
-cx q[3],q[21];
-cx q[4],q[23];
-cx q[5],q[25];
-cx q[6],q[27];
-cx q[7],q[29];
-cx q[8],q[16];
-cx q[8],q[17];
-cx q[9],q[18];
-cx q[9],q[19];
-cx q[10],q[20];
-cx q[10],q[21];
-cx q[11],q[22];
-cx q[11],q[23];
-cx q[12],q[24];
-cx q[12],q[25];
-cx q[13],q[26];
-cx q[13],q[27];
-cx q[14],q[28];
-cx q[14],q[29];
-h q[0];
-h q[1];
-h q[2];
-h q[3];
-h q[4];
-h q[5];
-h q[6];
-h q[7];
-h q[8];
-h q[9];
-h q[10];
-h q[11];
-h q[12];
-h q[13];
-h q[14];
-x q[0];
-x q[1];
-x q[2];
-x q[3];
-x q[4];
-x q[5];
-x q[6];
-x q[7];
-x q[8];
-x q[9];
-x q[10];
-x q[11];
-x q[12];
-x q[13];
-x q[14];
-reset q[31];
-reset q[32];
-reset q[33];
-reset q[34];
-reset q[35];
-reset q[36];
-reset q[37];
-reset q[38];
-reset q[39];
-reset q[40];
-reset q[41];
-reset q[42];
-reset q[43];
-reset q[44];
-ccx q[1],q[0],q[31];
-ccx q[31],q[2],q[32];
-ccx q[32],q[3],q[33];
-ccx q[33],q[4],q[34];
-ccx q[34],q[5],q[35];
-ccx q[35],q[6],q[36];
-ccx q[36],q[7],q[37];
-ccx q[37],q[8],q[38];
-ccx q[38],q[9],q[39];
-ccx q[39],q[10],q[40];
-ccx q[40],q[11],q[41];
-ccx q[41],q[12],q[42];
-ccx q[42],q[13],q[43];
-ccx q[43],q[14],q[44];
-z q[44];
-ccx q[43],q[14],q[44];
-ccx q[42],q[13],q[43];
-ccx q[41],q[12],q[42];
-ccx q[40],q[11],q[41];
-ccx q[39],q[10],q[40];
-ccx q[38],q[9],q[39];
-ccx q[37],q[8],q[38];
-ccx q[36],q[7],q[37];
-ccx q[35],q[6],q[36];
-ccx q[34],q[5],q[35];
-ccx q[33],q[4],q[34];
-ccx q[32],q[3],q[33];
-ccx q[31],q[2],q[32];
-ccx q[1],q[0],q[31];
-x q[0];
-x q[1];
-x q[2];
-x q[3];
-x q[4];
-x q[5];
-x q[6];
-x q[7];
-x q[8];
-x q[9];
-x q[10];
-x q[11];
-x q[12];
-x q[13];
-x q[14];
-h q[0];
-h q[1];
-h q[2];
-h q[3];
-h q[4];
-h q[5];
-h q[6];
-h q[7];
-h q[8];
-h q[9];
-h q[10];
-h q[11];
-h q[12];
-h q[13];
-h q[14];
-cx q[0],q[15];
-cx q[1],q[17];
-cx q[2],q[19];
-cx q[3],q[21];
-cx q[4],q[23];
-cx q[5],q[25];
-cx q[6],q[27];
-cx q[7],q[29];
-cx q[8],q[16];
-cx q[8],q[17];
-cx q[9],q[18];
-cx q[9],q[19];
-cx q[10],q[20];
-cx q[10],q[21];
-cx q[11],q[22];
-cx q[11],q[23];
-cx q[12],q[24];
-cx q[12],q[25];
-cx q[13],q[26];
-cx q[13],q[27];
-cx q[14],q[28];
-cx q[14],q[29];
-x q[15];
-x q[17];
-x q[18];
-x q[19];
-x q[20];
-x q[21];
-x q[22];
-x q[23];
-x q[24];
-x q[25];
-x q[26];
-x q[27];
-x q[28];
-x q[29];
-reset q[31];
-reset q[32];
-reset q[33];
-reset q[34];
-reset q[35];
-reset q[36];
-reset q[37];
-reset q[38];
-reset q[39];
-reset q[40];
-reset q[41];
-reset q[42];
-reset q[43];
-reset q[44];
-ccx q[16],q[15],q[31];
-ccx q[31],q[17],q[32];
-ccx q[32],q[18],q[33];
-ccx q[33],q[19],q[34];
-ccx q[34],q[20],q[35];
-ccx q[35],q[21],q[36];
-ccx q[36],q[22],q[37];
-ccx q[37],q[23],q[38];
-ccx q[38],q[24],q[39];
-ccx q[39],q[25],q[40];
-ccx q[40],q[26],q[41];
-ccx q[41],q[27],q[42];
-ccx q[42],q[28],q[43];
-ccx q[43],q[29],q[44];
-z q[44];
-ccx q[43],q[29],q[44];
-ccx q[42],q[28],q[43];
-ccx q[41],q[27],q[42];
-ccx q[40],q[26],q[41];
-ccx q[39],q[25],q[40];
-ccx q[38],q[24],q[39];
-ccx q[37],q[23],q[38];
-ccx q[36],q[22],q[37];
-ccx q[35],q[21],q[36];
-ccx q[34],q[20],q[35];
-ccx q[33],q[19],q[34];
-ccx q[32],q[18],q[33];
-ccx q[31],q[17],q[32];
-ccx q[16],q[15],q[31];
-x q[15];
-x q[17];
-x q[18];
-x q[19];
-x q[20];
-x q[21];
-x q[22];
-x q[23];
-x q[24];
-x q[25];
-x q[26];
-x q[27];
-x q[28];
-x q[29];
-cx q[0],q[15];
-cx q[1],q[17];
-cx q[2],q[19];
-cx q[3],q[21];
-cx q[4],q[23];
-cx q[5],q[25];
-cx q[6],q[27];
-cx q[7],q[29];
-cx q[8],q[16];
-cx q[8],q[17];
-cx q[9],q[18];
-cx q[9],q[19];
-cx q[10],q[20];
-cx q[10],q[21];
-cx q[11],q[22];
-cx q[11],q[23];
-cx q[12],q[24];
-cx q[12],q[25];
-cx q[13],q[26];
-cx q[13],q[27];
-cx q[14],q[28];
-cx q[14],q[29];
-h q[0];
-h q[1];
-h q[2];
-h q[3];
-h q[4];
-h q[5];
-h q[6];
-h q[7];
-h q[8];
-h q[9];
-h q[10];
-h q[11];
-h q[12];
-h q[13];
-h q[14];
-x q[0];
-x q[1];
-x q[2];
-x q[3];
-x q[4];
-x q[5];
-x q[6];
-x q[7];
-x q[8];
-x q[9];
-x q[10];
-x q[11];
-x q[12];
-x q[13];
-x q[14];
-reset q[31];
-reset q[32];
-reset q[33];
-reset q[34];
-reset q[35];
-reset q[36];
-reset q[37];
-reset q[38];
-reset q[39];
-reset q[40];
-reset q[41];
-reset q[42];
-reset q[43];
-reset q[44];
-ccx q[1],q[0],q[31];
-ccx q[31],q[2],q[32];
-ccx q[32],q[3],q[33];
-ccx q[33],q[4],q[34];
-ccx q[34],q[5],q[35];
-ccx q[35],q[6],q[36];
-ccx q[36],q[7],q[37];
-ccx q[37],q[8],q[38];
-ccx q[38],q[9],q[39];
-ccx q[39],q[10],q[40];
-ccx q[40],q[11],q[41];
-ccx q[41],q[12],q[42];
-ccx q[42],q[13],q[43];
-ccx q[43],q[14],q[44];
-z q[44];
-ccx q[43],q[14],q[44];
-ccx q[42],q[13],q[43];
-ccx q[41],q[12],q[42];
-ccx q[40],q[11],q[41];
-ccx q[39],q[10],q[40];
-ccx q[38],q[9],q[39];
-ccx q[37],q[8],q[38];
-ccx q[36],q[7],q[37];
-ccx q[35],q[6],q[36];
-ccx q[34],q[5],q[35];
-ccx q[33],q[4],q[34];
-ccx q[32],q[3],q[33];
-ccx q[31],q[2],q[32];
-ccx q[1],q[0],q[31];
-x q[0];
-x q[1];
-x q[2];
-x q[3];
-x q[4];
-x q[5];
-x q[6];
-x q[7];
-x q[8];
-x q[9];
-x q[10];
-x q[11];
-x q[12];
-x q[13];
-x q[14];
-h q[0];
-h q[1];
-h q[2];
-h q[3];
-h q[4];
-h q[5];
-h q[6];
-h q[7];
-h q[8];
-h q[9];
-h q[10];
-h q[11];
-h q[12];
-h q[13];
-h q[14];
-cx q[0],q[15];
-cx q[1],q[17];
-cx q[2],q[19];
-cx q[3],q[21];
-cx q[4],q[23];
-cx q[5],q[25];
-cx q[6],q[27];
-cx q[7],q[29];
-cx q[8],q[16];
-cx q[8],q[17];
-cx q[9],q[18];
-cx q[9],q[19];
-cx q[10],q[20];
-cx q[10],q[21];
-cx q[11],q[22];
-cx q[11],q[23];
-cx q[12],q[24];
-cx q[12],q[25];
-cx q[13],q[26];
-cx q[13],q[27];
-cx q[14],q[28];
-cx q[14],q[29];
-x q[15];
-x q[17];
-x q[18];
-x q[19];
-x q[20];
-x q[21];
-x q[22];
-x q[23];
-x q[24];
-x q[25];
-x q[26];
-x q[27];
-x q[28];
-x q[29];
-reset q[31];
-reset q[32];
-reset q[33];
-reset q[34];
-reset q[35];
-reset q[36];
-reset q[37];
-reset q[38];
-reset q[39];
-reset q[40];
-reset q[41];
-reset q[42];
-reset q[43];
-reset q[44];
-ccx q[16],q[15],q[31];
-ccx q[31],q[17],q[32];
-ccx q[32],q[18],q[33];
-ccx q[33],q[19],q[34];
-ccx q[34],q[20],q[35];
-ccx q[35],q[21],q[36];
-ccx q[36],q[22],q[37];
-ccx q[37],q[23],q[38];
-ccx q[38],q[24],q[39];
-ccx q[39],q[25],q[40];
-ccx q[40],q[26],q[41];
-ccx q[41],q[27],q[42];
-ccx q[42],q[28],q[43];
-ccx q[43],q[29],q[44];
-z q[44];
-ccx q[43],q[29],q[44];
-ccx q[42],q[28],q[43];
-ccx q[41],q[27],q[42];
-ccx q[40],q[26],q[41];
-ccx q[39],q[25],q[40];
-ccx q[38],q[24],q[39];
-ccx q[37],q[23],q[38];
-ccx q[36],q[22],q[37];
-ccx q[35],q[21],q[36];
-ccx q[34],q[20],q[35];
-ccx q[33],q[19],q[34];
-ccx q[32],q[18],q[33];
-ccx q[31],q[17],q[32];
-ccx q[16],q[15],q[31];
-x q[15];
-x q[17];
-x q[18];
-x q[19];
-x q[20];
-x q[21];
-x q[22];
-x q[23];
-x q[24];
-x q[25];
-x q[26];
-x q[27];
-x q[28];
-x q[29];
-cx q[0],q[15];
-cx q[1],q[17];
-cx q[2],q[19];
-cx q[3],q[21];
-cx q[4],q[23];
-cx q[5],q[25];
-cx q[6],q[27];
-cx q[7],q[29];
-cx q[8],q[16];
-cx q[8],q[17];
-cx q[9],q[18];
-cx q[9],q[19];
-cx q[10],q[20];
-cx q[10],q[21];
-cx q[11],q[22];
-cx q[11],q[23];
-cx q[12],q[24];
-cx q[12],q[25];
-cx q[13],q[26];
-cx q[13],q[27];
-cx q[14],q[28];
-cx q[14],q[29];
-h q[0];
-h q[1];
-h q[2];
-h q[3];
-h q[4];
-h q[5];
-h q[6];
-h q[7];
-h q[8];
-h q[9];
-h q[10];
-h q[11];
-h q[12];
-h q[13];
-h q[14];
-x q[0];
-x q[1];
-x q[2];
-x q[3];
-x q[4];
-x q[5];
-x q[6];
-x q[7];
-x q[8];
-x q[9];
-x q[10];
-x q[11];
-x q[12];
-x q[13];
-x q[14];
-reset q[31];
-reset q[32];
-reset q[33];
-reset q[34];
-reset q[35];
-reset q[36];
-reset q[37];
-reset q[38];
-reset q[39];
-reset q[40];
-reset q[41];
-reset q[42];
-reset q[43];
-reset q[44];
-ccx q[1],q[0],q[31];
-ccx q[31],q[2],q[32];
-ccx q[32],q[3],q[33];
-ccx q[33],q[4],q[34];
-ccx q[34],q[5],q[35];
-ccx q[35],q[6],q[36];
-ccx q[36],q[7],q[37];
-ccx q[37],q[8],q[38];
-ccx q[38],q[9],q[39];
-ccx q[39],q[10],q[40];
-ccx q[40],q[11],q[41];
-ccx q[41],q[12],q[42];
-ccx q[42],q[13],q[43];
-ccx q[43],q[14],q[44];
-z q[44];
-ccx q[43],q[14],q[44];
-ccx q[42],q[13],q[43];
-ccx q[41],q[12],q[42];
-ccx q[40],q[11],q[41];
-ccx q[39],q[10],q[40];
-ccx q[38],q[9],q[39];
-ccx q[37],q[8],q[38];
-ccx q[36],q[7],q[37];
-ccx q[35],q[6],q[36];
-ccx q[34],q[5],q[35];
-ccx q[33],q[4],q[34];
-ccx q[32],q[3],q[33];
-ccx q[31],q[2],q[32];
-ccx q[1],q[0],q[31];
-x q[0];
-x q[1];
-x q[2];
-x q[3];
-x q[4];
-x q[5];
-x q[6];
-x q[7];
-x q[8];
-x q[9];
-x q[10];
-x q[11];
-x q[12];
-x q[13];
-x q[14];
-h q[0];
-h q[1];
-h q[2];
-h q[3];
-h q[4];
-h q[5];
-h q[6];
-h q[7];
-h q[8];
-h q[9];
-h q[10];
-h q[11];
-h q[12];
-h q[13];
-h q[14];
-cx q[0],q[15];
-cx q[1],q[17];
-cx q[2],q[19];
-cx q[3],q[21];
-cx q[4],q[23];
-cx q[5],q[25];
-cx q[6],q[27];
-cx q[7],q[29];
-cx q[8],q[16];
-cx q[8],q[17];
-cx q[9],q[18];
-cx q[9],q[19];
-cx q[10],q[20];
-cx q[10],q[21];
-cx q[11],q[22];
-cx q[11],q[23];
-cx q[12],q[24];
-cx q[12],q[25];
-cx q[13],q[26];
-cx q[13],q[27];
-cx q[14],q[28];
-cx q[14],q[29];
-x q[15];
-x q[17];
-x q[18];
-x q[19];
-x q[20];
-x q[21];
-x q[22];
-x q[23];
-x q[24];
-x q[25];
-x q[26];
-x q[27];
-x q[28];
-x q[29];
-reset q[31];
-reset q[32];
-reset q[33];
-reset q[34];
-reset q[35];
-reset q[36];
-reset q[37];
-reset q[38];
-reset q[39];
-reset q[40];
-reset q[41];
-reset q[42];
-reset q[43];
-reset q[44];
-ccx q[16],q[15],q[31];
-ccx q[31],q[17],q[32];
-ccx q[32],q[18],q[33];
-ccx q[33],q[19],q[34];
-ccx q[34],q[20],q[35];
-ccx q[35],q[21],q[36];
-ccx q[36],q[22],q[37];
-ccx q[37],q[23],q[38];
-ccx q[38],q[24],q[39];
-ccx q[39],q[25],q[40];
-ccx q[40],q[26],q[41];
-ccx q[41],q[27],q[42];
-ccx q[42],q[28],q[43];
-ccx q[43],q[29],q[44];
-z q[44];
-ccx q[43],q[29],q[44];
-ccx q[42],q[28],q[43];
-ccx q[41],q[27],q[42];
-ccx q[40],q[26],q[41];
-ccx q[39],q[25],q[40];
-ccx q[38],q[24],q[39];
-ccx q[37],q[23],q[38];
-ccx q[36],q[22],q[37];
-ccx q[35],q[21],q[36];
-ccx q[34],q[20],q[35];
-ccx q[33],q[19],q[34];
-ccx q[32],q[18],q[33];
-ccx q[31],q[17],q[32];
-ccx q[16],q[15],q[31];
-x q[15];
-x q[17];
-x q[18];
-x q[19];
-x q[20];
-x q[21];
-x q[22];
-x q[23];
-x q[24];
-x q[25];
-x q[26];
-x q[27];
-x q[28];
-x q[29];
-cx q[0],q[15];
-cx q[1],q[17];
-cx q[2],q[19];
-cx q[3],q[21];
-cx q[4],q[23];
-cx q[5],q[25];
-cx q[6],q[27];
-cx q[7],q[29];
-cx q[8],q[16];
-cx q[8],q[17];
-cx q[9],q[18];
-cx q[9],q[19];
-cx q[10],q[20];
-cx q[10],q[21];
-cx q[11],q[22];
-cx q[11],q[23];
-cx q[12],q[24];
-cx q[12],q[25];
-cx q[13],q[26];
-cx q[13],q[27];
-cx q[14],q[28];
-cx q[14],q[29];
-h q[0];
-h q[1];
-h q[2];
-h q[3];
-h q[4];
-h q[5];
-h q[6];
-h q[7];
-h q[8];
-h q[9];
-h q[10];
-h q[11];
-h q[12];
-h q[13];
-h q[14];
-x q[0];
-x q[1];
-x q[2];
-x q[3];
-x q[4];
-x q[5];
-x q[6];
-x q[7];
-x q[8];
-x q[9];
-x q[10];
-x q[11];
-x q[12];
-x q[13];
-x q[14];
-reset q[31];
-reset q[32];
-reset q[33];
-reset q[34];
-reset q[35];
-reset q[36];
-reset q[37];
-reset q[38];
-reset q[39];
-reset q[40];
-reset q[41];
-reset q[42];
-reset q[43];
-reset q[44];
-ccx q[1],q[0],q[31];
-ccx q[31],q[2],q[32];
-ccx q[32],q[3],q[33];
-ccx q[33],q[4],q[34];
-ccx q[34],q[5],q[35];
-ccx q[35],q[6],q[36];
-ccx q[36],q[7],q[37];
-ccx q[37],q[8],q[38];
-ccx q[38],q[9],q[39];
-ccx q[39],q[10],q[40];
-ccx q[40],q[11],q[41];
-ccx q[41],q[12],q[42];
-ccx q[42],q[13],q[43];
-ccx q[43],q[14],q[44];
-z q[44];
-ccx q[43],q[14],q[44];
-ccx q[42],q[13],q[43];
-ccx q[41],q[12],q[42];
-ccx q[40],q[11],q[41];
-ccx q[39],q[10],q[40];
-ccx q[38],q[9],q[39];
-ccx q[37],q[8],q[38];
-ccx q[36],q[7],q[37];
-ccx q[35],q[6],q[36];
-ccx q[34],q[5],q[35];
-ccx q[33],q[4],q[34];
-ccx q[32],q[3],q[33];
-ccx q[31],q[2],q[32];
-ccx q[1],q[0],q[31];
-x q[0];
-x q[1];
-x q[2];
-x q[3];
-x q[4];
-x q[5];
-x q[6];
-x q[7];
-x q[8];
-x q[9];
-x q[10];
-x q[11];
-x q[12];
-x q[13];
-x q[14];
-h q[0];
-h q[1];
-h q[2];
-h q[3];
-h q[4];
-h q[5];
-h q[6];
-h q[7];
-h q[8];
-h q[9];
-h q[10];
-h q[11];
-h q[12];
-h q[13];
-h q[14];
-cx q[0],q[15];
-cx q[1],q[17];
-cx q[2],q[19];
-cx q[3],q[21];
-cx q[4],q[23];
-cx q[5],q[25];
-cx q[6],q[27];
-cx q[7],q[29];
-cx q[8],q[16];
-cx q[8],q[17];
-cx q[9],q[18];
-cx q[9],q[19];
-cx q[10],q[20];
-cx q[10],q[21];
-cx q[11],q[22];
-cx q[11],q[23];
-cx q[12],q[24];
-cx q[12],q[25];
-cx q[13],q[26];
-cx q[13],q[27];
-cx q[14],q[28];
-cx q[14],q[29];
-x q[15];
-x q[17];
-x q[18];
-x q[19];
-x q[20];
-x q[21];
-x q[22];
-x q[23];
-x q[24];
-x q[25];
-x q[26];
-x q[27];
-x q[28];
-x q[29];
-reset q[31];
-reset q[32];
-reset q[33];
-reset q[34];
-reset q[35];
-reset q[36];
-reset q[37];
-reset q[38];
-reset q[39];
-reset q[40];
-reset q[41];
-reset q[42];
-reset q[43];
-reset q[44];
-ccx q[16],q[15],q[31];
-ccx q[31],q[17],q[32];
-ccx q[32],q[18],q[33];
-ccx q[33],q[19],q[34];
-ccx q[34],q[20],q[35];
-ccx q[35],q[21],q[36];
-ccx q[36],q[22],q[37];
-ccx q[37],q[23],q[38];
-ccx q[38],q[24],q[39];
-ccx q[39],q[25],q[40];
-ccx q[40],q[26],q[41];
-ccx q[41],q[27],q[42];
-ccx q[42],q[28],q[43];
-ccx q[43],q[29],q[44];
-z q[44];
-ccx q[43],q[29],q[44];
-ccx q[42],q[28],q[43];
-ccx q[41],q[27],q[42];
-ccx q[40],q[26],q[41];
-ccx q[39],q[25],q[40];
-ccx q[38],q[24],q[39];
-ccx q[37],q[23],q[38];
-ccx q[36],q[22],q[37];
-ccx q[35],q[21],q[36];
-ccx q[34],q[20],q[35];
-ccx q[33],q[19],q[34];
-ccx q[32],q[18],q[33];
-ccx q[31],q[17],q[32];
-ccx q[16],q[15],q[31];
-x q[15];
-x q[17];
-x q[18];
-x q[19];
-x q[20];
-x q[21];
-x q[22];
-x q[23];
-x q[24];
-x q[25];
-x q[26];
-x q[27];
-x q[28];
-x q[29];
-cx q[0],q[15];
-cx q[1],q[17];
-cx q[2],q[19];
-cx q[3],q[21];
-cx q[4],q[23];
-cx q[5],q[25];
-cx q[6],q[27];
-cx q[7],q[29];
-cx q[8],q[16];
-cx q[8],q[17];
-cx q[9],q[18];
-cx q[9],q[19];
-cx q[10],q[20];
-cx q[10],q[21];
-cx q[11],q[22];
-cx q[11],q[23];
-cx q[12],q[24];
-cx q[12],q[25];
-cx q[13],q[26];
-cx q[13],q[27];
-cx q[14],q[28];
-cx q[14],q[29];
-h q[0];
-h q[1];
-h q[2];
-h q[3];
-h q[4];
-h q[5];
-h q[6];
-h q[7];
-h q[8];
-h q[9];
-h q[10];
-h q[11];
-h q[12];
-h q[13];
-h q[14];
-x q[0];
-x q[1];
-x q[2];
-x q[3];
-x q[4];
-x q[5];
-x q[6];
-x q[7];
-x q[8];
-x q[9];
-x q[10];
-x q[11];
-x q[12];
-x q[13];
-x q[14];
-reset q[31];
-reset q[32];
-reset q[33];
-reset q[34];
-reset q[35];
-reset q[36];
-reset q[37];
-reset q[38];
-reset q[39];
-reset q[40];
-reset q[41];
-reset q[42];
-reset q[43];
-reset q[44];
-ccx q[1],q[0],q[31];
-ccx q[31],q[2],q[32];
-ccx q[32],q[3],q[33];
-ccx q[33],q[4],q[34];
-ccx q[34],q[5],q[35];
-ccx q[35],q[6],q[36];
-ccx q[36],q[7],q[37];
-ccx q[37],q[8],q[38];
-ccx q[38],q[9],q[39];
-ccx q[39],q[10],q[40];
-ccx q[40],q[11],q[41];
-ccx q[41],q[12],q[42];
-ccx q[42],q[13],q[43];
-ccx q[43],q[14],q[44];
-z q[44];
-ccx q[43],q[14],q[44];
-ccx q[42],q[13],q[43];
-ccx q[41],q[12],q[42];
-ccx q[40],q[11],q[41];
-ccx q[39],q[10],q[40];
-ccx q[38],q[9],q[39];
-ccx q[37],q[8],q[38];
-ccx q[36],q[7],q[37];
-ccx q[35],q[6],q[36];
-ccx q[34],q[5],q[35];
-ccx q[33],q[4],q[34];
-ccx q[32],q[3],q[33];
-ccx q[31],q[2],q[32];
-ccx q[1],q[0],q[31];
-x q[0];
-x q[1];
-x q[2];
-x q[3];
-x q[4];
-x q[5];
-x q[6];
-x q[7];
-x q[8];
-x q[9];
-x q[10];
-x q[11];
-x q[12];
-x q[13];
-x q[14];
-h q[0];
-h q[1];
-h q[2];
-h q[3];
-h q[4];
-h q[5];
-h q[6];
-h q[7];
-h q[8];
-h q[9];
-h q[10];
-h q[11];
-h q[12];
-h q[13];
-h q[14];
-cx q[0],q[15];
-cx q[1],q[17];
-cx q[2],q[19];
-cx q[3],q[21];
-cx q[4],q[23];
-cx q[5],q[25];
-cx q[6],q[27];
-cx q[7],q[29];
-cx q[8],q[16];
-cx q[8],q[17];
-cx q[9],q[18];
-cx q[9],q[19];
-cx q[10],q[20];
-cx q[10],q[21];
-cx q[11],q[22];
-cx q[11],q[23];
-cx q[12],q[24];
-cx q[12],q[25];
-cx q[13],q[26];
-cx q[13],q[27];
-cx q[14],q[28];
-cx q[14],q[29];
-x q[15];
-x q[17];
-x q[18];
-x q[19];
-x q[20];
-x q[21];
-x q[22];
-x q[23];
-x q[24];
-x q[25];
-x q[26];
-x q[27];
-x q[28];
-x q[29];
-reset q[31];
-reset q[32];
-reset q[33];
-reset q[34];
-reset q[35];
-reset q[36];
-reset q[37];
-reset q[38];
-reset q[39];
-reset q[40];
-reset q[41];
-reset q[42];
-reset q[43];
-reset q[44];
-ccx q[16],q[15],q[31];
-ccx q[31],q[17],q[32];
-ccx q[32],q[18],q[33];
-ccx q[33],q[19],q[34];
-ccx q[34],q[20],q[35];
-ccx q[35],q[21],q[36];
-ccx q[36],q[22],q[37];
-ccx q[37],q[23],q[38];
-ccx q[38],q[24],q[39];
-ccx q[39],q[25],q[40];
-ccx q[40],q[26],q[41];
-ccx q[41],q[27],q[42];
-ccx q[42],q[28],q[43];
-ccx q[43],q[29],q[44];
-z q[44];
-ccx q[43],q[29],q[44];
-ccx q[42],q[28],q[43];
-ccx q[41],q[27],q[42];
-ccx q[40],q[26],q[41];
-ccx q[39],q[25],q[40];
-ccx q[38],q[24],q[39];
-ccx q[37],q[23],q[38];
-ccx q[36],q[22],q[37];
-ccx q[35],q[21],q[36];
-ccx q[34],q[20],q[35];
-ccx q[33],q[19],q[34];
-ccx q[32],q[18],q[33];
-ccx q[31],q[17],q[32];
-ccx q[16],q[15],q[31];
-x q[15];
-x q[17];
-x q[18];
-x q[19];
-x q[20];
-x q[21];
-x q[22];
-x q[23];
-x q[24];
-x q[25];
-x q[26];
-x q[27];
-x q[28];
-x q[29];
-cx q[0],q[15];
-cx q[1],q[17];
-cx q[2],q[19];
-cx q[3],q[21];
-cx q[4],q[23];
-cx q[5],q[25];
-cx q[6],q[27];
-cx q[7],q[29];
-cx q[8],q[16];
-cx q[8],q[17];
-cx q[9],q[18];
-cx q[9],q[19];
-cx q[10],q[20];
-cx q[10],q[21];
-cx q[11],q[22];
-cx q[11],q[23];
-cx q[12],q[24];
-cx q[12],q[25];
-cx q[13],q[26];
-cx q[13],q[27];
-cx q[14],q[28];
-cx q[14],q[29];
-h q[0];
-h q[1];
-h q[2];
-h q[3];
-h q[4];
-h q[5];
-h q[6];
-h q[7];
-h q[8];
-h q[9];
-h q[10];
-h q[11];
-h q[12];
-h q[13];
-h q[14];
-x q[0];
-x q[1];
-x q[2];
-x q[3];
-x q[4];
-x q[5];
-x q[6];
-x q[7];
-x q[8];
-x q[9];
-x q[10];
-x q[11];
-x q[12];
-x q[13];
-x q[14];
-reset q[31];
-reset q[32];
-reset q[33];
-reset q[34];
-reset q[35];
-reset q[36];
-reset q[37];
-reset q[38];
-reset q[39];
-reset q[40];
-reset q[41];
-reset q[42];
-reset q[43];
-reset q[44];
-ccx q[1],q[0],q[31];
-ccx q[31],q[2],q[32];
-ccx q[32],q[3],q[33];
-ccx q[33],q[4],q[34];
-ccx q[34],q[5],q[35];
-ccx q[35],q[6],q[36];
-ccx q[36],q[7],q[37];
-ccx q[37],q[8],q[38];
-ccx q[38],q[9],q[39];
-ccx q[39],q[10],q[40];
-ccx q[40],q[11],q[41];
-ccx q[41],q[12],q[42];
-ccx q[42],q[13],q[43];
-ccx q[43],q[14],q[44];
-z q[44];
-ccx q[43],q[14],q[44];
-ccx q[42],q[13],q[43];
-ccx q[41],q[12],q[42];
-ccx q[40],q[11],q[41];
-ccx q[39],q[10],q[40];
-ccx q[38],q[9],q[39];
-ccx q[37],q[8],q[38];
-ccx q[36],q[7],q[37];
-ccx q[35],q[6],q[36];
-ccx q[34],q[5],q[35];
-ccx q[33],q[4],q[34];
-ccx q[32],q[3],q[33];
-ccx q[31],q[2],q[32];
-ccx q[1],q[0],q[31];
-x q[0];
-x q[1];
-x q[2];
-x q[3];
-x q[4];
-x q[5];
-x q[6];
-x q[7];
-x q[8];
-x q[9];
-x q[10];
-x q[11];
-x q[12];
-x q[13];
-x q[14];
-h q[0];
-h q[1];
-h q[2];
-h q[3];
-h q[4];
-h q[5];
-h q[6];
-h q[7];
-h q[8];
-h q[9];
-h q[10];
-h q[11];
-h q[12];
-h q[13];
-h q[14];
-cx q[0],q[15];
-cx q[1],q[17];
-cx q[2],q[19];
-cx q[3],q[21];
-cx q[4],q[23];
-cx q[5],q[25];
-cx q[6],q[27];
-cx q[7],q[29];
-cx q[8],q[16];
-cx q[8],q[17];
-cx q[9],q[18];
-cx q[9],q[19];
-cx q[10],q[20];
-cx q[10],q[21];
-cx q[11],q[22];
-cx q[11],q[23];
-cx q[12],q[24];
-cx q[12],q[25];
-cx q[13],q[26];
-cx q[13],q[27];
-cx q[14],q[28];
-cx q[14],q[29];
-x q[15];
-x q[17];
-x q[18];
-x q[19];
-x q[20];
-x q[21];
-x q[22];
-x q[23];
-x q[24];
-x q[25];
-x q[26];
-x q[27];
-x q[28];
-x q[29];
-reset q[31];
-reset q[32];
-reset q[33];
-reset q[34];
-reset q[35];
-reset q[36];
-reset q[37];
-reset q[38];
-reset q[39];
-reset q[40];
-reset q[41];
-reset q[42];
-reset q[43];
-reset q[44];
-ccx q[16],q[15],q[31];
-ccx q[31],q[17],q[32];
-ccx q[32],q[18],q[33];
-ccx q[33],q[19],q[34];
-ccx q[34],q[20],q[35];
-ccx q[35],q[21],q[36];
-ccx q[36],q[22],q[37];
-ccx q[37],q[23],q[38];
-ccx q[38],q[24],q[39];
-ccx q[39],q[25],q[40];
-ccx q[40],q[26],q[41];
-ccx q[41],q[27],q[42];
-ccx q[42],q[28],q[43];
-ccx q[43],q[29],q[44];
-z q[44];
-ccx q[43],q[29],q[44];
-ccx q[42],q[28],q[43];
-ccx q[41],q[27],q[42];
-ccx q[40],q[26],q[41];
-ccx q[39],q[25],q[40];
-ccx q[38],q[24],q[39];
-ccx q[37],q[23],q[38];
-ccx q[36],q[22],q[37];
-ccx q[35],q[21],q[36];
-ccx q[34],q[20],q[35];
-ccx q[33],q[19],q[34];
-ccx q[32],q[18],q[33];
-ccx q[31],q[17],q[32];
-ccx q[16],q[15],q[31];
-x q[15];
-x q[17];
-x q[18];
-x q[19];
-x q[20];
-x q[21];
-x q[22];
-x q[23];
-x q[24];
-x q[25];
-x q[26];
-x q[27];
-x q[28];
-x q[29];
-cx q[0],q[15];
-cx q[1],q[17];
-cx q[2],q[19];
-cx q[3],q[21];
-cx q[4],q[23];
-cx q[5],q[25];
-cx q[6],q[27];
-cx q[7],q[29];
-cx q[8],q[16];
-cx q[8],q[17];
-cx q[9],q[18];
-cx q[9],q[19];
-cx q[10],q[20];
-cx q[10],q[21];
-cx q[11],q[22];
-cx q[11],q[23];
-cx q[12],q[24];
-cx q[12],q[25];
-cx q[13],q[26];
-cx q[13],q[27];
-cx q[14],q[28];
-cx q[14],q[29];
-h q[0];
-h q[1];
-h q[2];
-h q[3];
-h q[4];
-h q[5];
-h q[6];
-h q[7];
-h q[8];
-h q[9];
-h q[10];
-h q[11];
-h q[12];
-h q[13];
-h q[14];
-x q[0];
-x q[1];
-x q[2];
-x q[3];
-x q[4];
-x q[5];
-x q[6];
-x q[7];
-x q[8];
-x q[9];
-x q[10];
-x q[11];
-x q[12];
-x q[13];
-x q[14];
-reset q[31];
-reset q[32];
-reset q[33];
-reset q[34];
-reset q[35];
-reset q[36];
-reset q[37];
-reset q[38];
-reset q[39];
-reset q[40];
-reset q[41];
-reset q[42];
-reset q[43];
-reset q[44];
-ccx q[1],q[0],q[31];
-ccx q[31],q[2],q[32];
-ccx q[32],q[3],q[33];
-ccx q[33],q[4],q[34];
-ccx q[34],q[5],q[35];
-ccx q[35],q[6],q[36];
-ccx q[36],q[7],q[37];
-ccx q[37],q[8],q[38];
-ccx q[38],q[9],q[39];
-ccx q[39],q[10],q[40];
-ccx q[40],q[11],q[41];
-ccx q[41],q[12],q[42];
-ccx q[42],q[13],q[43];
-ccx q[43],q[14],q[44];
-z q[44];
-ccx q[43],q[14],q[44];
-ccx q[42],q[13],q[43];
-ccx q[41],q[12],q[42];
-ccx q[40],q[11],q[41];
-ccx q[39],q[10],q[40];
-ccx q[38],q[9],q[39];
-ccx q[37],q[8],q[38];
-ccx q[36],q[7],q[37];
-ccx q[35],q[6],q[36];
-ccx q[34],q[5],q[35];
-ccx q[33],q[4],q[34];
-ccx q[32],q[3],q[33];
-ccx q[31],q[2],q[32];
-ccx q[1],q[0],q[31];
-x q[0];
-x q[1];
-x q[2];
-x q[3];
-x q[4];
-x q[5];
-x q[6];
-x q[7];
-x q[8];
-x q[9];
-x q[10];
-x q[11];
-x q[12];
-x q[13];
-x q[14];
-h q[0];
-h q[1];
-h q[2];
-h q[3];
-h q[4];
-h q[5];
-h q[6];
-h q[7];
-h q[8];
-h q[9];
-h q[10];
-h q[11];
-h q[12];
-h q[13];
-h q[14];
-cx q[0],q[15];
-cx q[1],q[17];
-cx q[2],q[19];
-cx q[3],q[21];
-cx q[4],q[23];
-cx q[5],q[25];
-cx q[6],q[27];
-cx q[7],q[29];
-cx q[8],q[16];
-cx q[8],q[17];
-cx q[9],q[18];
-cx q[9],q[19];
-cx q[10],q[20];
-cx q[10],q[21];
-cx q[11],q[22];
-cx q[11],q[23];
-cx q[12],q[24];
-cx q[12],q[25];
-cx q[13],q[26];
-cx q[13],q[27];
-cx q[14],q[28];
-cx q[14],q[29];
-x q[15];
-x q[17];
-x q[18];
-x q[19];
-x q[20];
-x q[21];
-x q[22];
-x q[23];
-x q[24];
-x q[25];
-x q[26];
-x q[27];
-x q[28];
-x q[29];
-reset q[31];
-reset q[32];
-reset q[33];
-reset q[34];
-reset q[35];
-reset q[36];
-reset q[37];
-reset q[38];
-reset q[39];
-reset q[40];
-reset q[41];
-reset q[42];
-reset q[43];
-reset q[44];
-ccx q[16],q[15],q[31];
-ccx q[31],q[17],q[32];
-ccx q[32],q[18],q[33];
-ccx q[33],q[19],q[34];
-ccx q[34],q[20],q[35];
-ccx q[35],q[21],q[36];
-ccx q[36],q[22],q[37];
-ccx q[37],q[23],q[38];
-ccx q[38],q[24],q[39];
-ccx q[39],q[25],q[40];
-ccx q[40],q[26],q[41];
-ccx q[41],q[27],q[42];
-ccx q[42],q[28],q[43];
-ccx q[43],q[29],q[44];
-z q[44];
-ccx q[43],q[29],q[44];
-ccx q[42],q[28],q[43];
-ccx q[41],q[27],q[42];
-ccx q[40],q[26],q[41];
-ccx q[39],q[25],q[40];
-ccx q[38],q[24],q[39];
-ccx q[37],q[23],q[38];
-ccx q[36],q[22],q[37];
-ccx q[35],q[21],q[36];
-ccx q[34],q[20],q[35];
-ccx q[33],q[19],q[34];
-ccx q[32],q[18],q[33];
-ccx q[31],q[17],q[32];
-ccx q[16],q[15],q[31];
-x q[15];
-x q[17];
-x q[18];
-x q[19];
-x q[20];
-x q[21];
-x q[22];
-x q[23];
-x q[24];
-x q[25];
-x q[26];
-x q[27];
-x q[28];
-x q[29];
-cx q[0],q[15];
-cx q[1],q[17];
-cx q[2],q[19];
-cx q[3],q[21];
-cx q[4],q[23];
-cx q[5],q[25];
-cx q[6],q[27];
-cx q[7],q[29];
-cx q[8],q[16];
-cx q[8],q[17];
-cx q[9],q[18];
-cx q[9],q[19];
-cx q[10],q[20];
-cx q[10],q[21];
-cx q[11],q[22];
-cx q[11],q[23];
-cx q[12],q[24];
-cx q[12],q[25];
-cx q[13],q[26];
-cx q[13],q[27];
-cx q[14],q[28];
-cx q[14],q[29];
-h q[0];
-h q[1];
-h q[2];
-h q[3];
-h q[4];
-h q[5];
-h q[6];
-h q[7];
-h q[8];
-h q[9];
-h q[10];
-h q[11];
-h q[12];
-h q[13];
-h q[14];
-x q[0];
-x q[1];
-x q[2];
-x q[3];
-x q[4];
-x q[5];
-x q[6];
-x q[7];
-x q[8];
-x q[9];
-x q[10];
-x q[11];
-x q[12];
-x q[13];
-x q[14];
-reset q[31];
-reset q[32];
-reset q[33];
-reset q[34];
-reset q[35];
-reset q[36];
-reset q[37];
-reset q[38];
-reset q[39];
-reset q[40];
-reset q[41];
-reset q[42];
-reset q[43];
-reset q[44];
-ccx q[1],q[0],q[31];
-ccx q[31],q[2],q[32];
-ccx q[32],q[3],q[33];
-ccx q[33],q[4],q[34];
-ccx q[34],q[5],q[35];
-ccx q[35],q[6],q[36];
-ccx q[36],q[7],q[37];
-ccx q[37],q[8],q[38];
-ccx q[38],q[9],q[39];
-ccx q[39],q[10],q[40];
-ccx q[40],q[11],q[41];
-ccx q[41],q[12],q[42];
-ccx q[42],q[13],q[43];
-ccx q[43],q[14],q[44];
-z q[44];
-ccx q[43],q[14],q[44];
-ccx q[42],q[13],q[43];
-ccx q[41],q[12],q[42];
-ccx q[40],q[11],q[41];
-ccx q[39],q[10],q[40];
-ccx q[38],q[9],q[39];
-ccx q[37],q[8],q[38];
-ccx q[36],q[7],q[37];
-ccx q[35],q[6],q[36];
-ccx q[34],q[5],q[35];
-ccx q[33],q[4],q[34];
-ccx q[32],q[3],q[33];
-ccx q[31],q[2],q[32];
-ccx q[1],q[0],q[31];
-x q[0];
-x q[1];
-x q[2];
-x q[3];
-x q[4];
-x q[5];
-x q[6];
-x q[7];
-x q[8];
-x q[9];
-x q[10];
-x q[11];
-x q[12];
-x q[13];
-x q[14];
-h q[0];
-h q[1];
-h q[2];
-h q[3];
-h q[4];
-h q[5];
-h q[6];
-h q[7];
-h q[8];
-h q[9];
-h q[10];
-h q[11];
-h q[12];
-h q[13];
-h q[14];
-cx q[0],q[15];
-cx q[1],q[17];
-cx q[2],q[19];
-cx q[3],q[21];
-cx q[4],q[23];
-cx q[5],q[25];
-cx q[6],q[27];
-cx q[7],q[29];
-cx q[8],q[16];
-cx q[8],q[17];
-cx q[9],q[18];
-cx q[9],q[19];
-cx q[10],q[20];
-cx q[10],q[21];
-cx q[11],q[22];
-cx q[11],q[23];
-cx q[12],q[24];
-cx q[12],q[25];
-cx q[13],q[26];
-cx q[13],q[27];
-cx q[14],q[28];
-cx q[14],q[29];
-x q[15];
-x q[17];
-x q[18];
-x q[19];
-x q[20];
-x q[21];
-x q[22];
-x q[23];
-x q[24];
-x q[25];
-x q[26];
-x q[27];
-x q[28];
-x q[29];
-reset q[31];
-reset q[32];
-reset q[33];
-reset q[34];
-reset q[35];
-reset q[36];
-reset q[37];
-reset q[38];
-reset q[39];
-reset q[40];
-reset q[41];
-reset q[42];
-reset q[43];
-reset q[44];
-ccx q[16],q[15],q[31];
-ccx q[31],q[17],q[32];
-ccx q[32],q[18],q[33];
-ccx q[33],q[19],q[34];
-ccx q[34],q[20],q[35];
-ccx q[35],q[21],q[36];
-ccx q[36],q[22],q[37];
-ccx q[37],q[23],q[38];
-ccx q[38],q[24],q[39];
-ccx q[39],q[25],q[40];
-ccx q[40],q[26],q[41];
-ccx q[41],q[27],q[42];
-ccx q[42],q[28],q[43];
-ccx q[43],q[29],q[44];
-z q[44];
-ccx q[43],q[29],q[44];
-ccx q[42],q[28],q[43];
-ccx q[41],q[27],q[42];
-ccx q[40],q[26],q[41];
-ccx q[39],q[25],q[40];
-ccx q[38],q[24],q[39];
-ccx q[37],q[23],q[38];
-ccx q[36],q[22],q[37];
-ccx q[35],q[21],q[36];
-ccx q[34],q[20],q[35];
-ccx q[33],q[19],q[34];
-ccx q[32],q[18],q[33];
-ccx q[31],q[17],q[32];
-ccx q[16],q[15],q[31];
-x q[15];
-x q[17];
-x q[18];
-x q[19];
-x q[20];
-x q[21];
-x q[22];
-x q[23];
-x q[24];
-x q[25];
-x q[26];
-x q[27];
-x q[28];
-x q[29];
-cx q[0],q[15];
-cx q[1],q[17];
-cx q[2],q[19];
-cx q[3],q[21];
-cx q[4],q[23];
-cx q[5],q[25];
-cx q[6],q[27];
-cx q[7],q[29];
-cx q[8],q[16];
-cx q[8],q[17];
-cx q[9],q[18];
-cx q[9],q[19];
-cx q[10],q[20];
-cx q[10],q[21];
-cx q[11],q[22];
-cx q[11],q[23];
-cx q[12],q[24];
-cx q[12],q[25];
-cx q[13],q[26];
-cx q[13],q[27];
-cx q[14],q[28];
-cx q[14],q[29];
-h q[0];
-h q[1];
-h q[2];
-h q[3];
-h q[4];
-h q[5];
-h q[6];
-h q[7];
-h q[8];
-h q[9];
-h q[10];
-h q[11];
-h q[12];
-h q[13];
-h q[14];
-x q[0];
-x q[1];
-x q[2];
-x q[3];
-x q[4];
-x q[5];
-x q[6];
-x q[7];
-x q[8];
-x q[9];
-x q[10];
-x q[11];
-x q[12];
-x q[13];
-x q[14];
-reset q[31];
-reset q[32];
-reset q[33];
-reset q[34];
-reset q[35];
-reset q[36];
-reset q[37];
-reset q[38];
-reset q[39];
-reset q[40];
-reset q[41];
-reset q[42];
-reset q[43];
-reset q[44];
-ccx q[1],q[0],q[31];
-ccx q[31],q[2],q[32];
-ccx q[32],q[3],q[33];
-ccx q[33],q[4],q[34];
-ccx q[34],q[5],q[35];
-ccx q[35],q[6],q[36];
-ccx q[36],q[7],q[37];
-ccx q[37],q[8],q[38];
-ccx q[38],q[9],q[39];
-ccx q[39],q[10],q[40];
-ccx q[40],q[11],q[41];
-ccx q[41],q[12],q[42];
-ccx q[42],q[13],q[43];
-ccx q[43],q[14],q[44];
-z q[44];
-ccx q[43],q[14],q[44];
-ccx q[42],q[13],q[43];
-ccx q[41],q[12],q[42];
-ccx q[40],q[11],q[41];
-ccx q[39],q[10],q[40];
-ccx q[38],q[9],q[39];
-ccx q[37],q[8],q[38];
-ccx q[36],q[7],q[37];
-ccx q[35],q[6],q[36];
-ccx q[34],q[5],q[35];
-ccx q[33],q[4],q[34];
-ccx q[32],q[3],q[33];
-ccx q[31],q[2],q[32];
-ccx q[1],q[0],q[31];
-x q[0];
-x q[1];
-x q[2];
-x q[3];
-x q[4];
-x q[5];
-x q[6];
-x q[7];
-x q[8];
-x q[9];
-x q[10];
-x q[11];
-x q[12];
-x q[13];
-x q[14];
-h q[0];
-h q[1];
-h q[2];
-h q[3];
-h q[4];
-h q[5];
-h q[6];
-h q[7];
-h q[8];
-h q[9];
-h q[10];
-h q[11];
-h q[12];
-h q[13];
-h q[14];
-cx q[0],q[15];
-cx q[1],q[17];
-cx q[2],q[19];
-cx q[3],q[21];
-cx q[4],q[23];
-cx q[5],q[25];
-cx q[6],q[27];
-cx q[7],q[29];
-cx q[8],q[16];
-cx q[8],q[17];
-cx q[9],q[18];
-cx q[9],q[19];
-cx q[10],q[20];
-cx q[10],q[21];
-cx q[11],q[22];
-cx q[11],q[23];
-cx q[12],q[24];
-cx q[12],q[25];
-cx q[13],q[26];
-cx q[13],q[27];
-cx q[14],q[28];
-cx q[14],q[29];
-x q[15];
-x q[17];
-x q[18];
-x q[19];
-x q[20];
-x q[21];
-x q[22];
-x q[23];
-x q[24];
-x q[25];
-x q[26];
-x q[27];
-x q[28];
-x q[29];
-reset q[31];
-reset q[32];
-reset q[33];
-reset q[34];
-reset q[35];
-reset q[36];
-reset q[37];
-reset q[38];
-reset q[39];
-reset q[40];
-reset q[41];
-reset q[42];
-reset q[43];
-reset q[44];
-ccx q[16],q[15],q[31];
-ccx q[31],q[17],q[32];
-ccx q[32],q[18],q[33];
-ccx q[33],q[19],q[34];
-ccx q[34],q[20],q[35];
-ccx q[35],q[21],q[36];
-ccx q[36],q[22],q[37];
-ccx q[37],q[23],q[38];
-ccx q[38],q[24],q[39];
-ccx q[39],q[25],q[40];
-ccx q[40],q[26],q[41];
-ccx q[41],q[27],q[42];
-ccx q[42],q[28],q[43];
-ccx q[43],q[29],q[44];
-z q[44];
-ccx q[43],q[29],q[44];
-ccx q[42],q[28],q[43];
-ccx q[41],q[27],q[42];
-ccx q[40],q[26],q[41];
-ccx q[39],q[25],q[40];
-ccx q[38],q[24],q[39];
-ccx q[37],q[23],q[38];
-ccx q[36],q[22],q[37];
-ccx q[35],q[21],q[36];
-ccx q[34],q[20],q[35];
-ccx q[33],q[19],q[34];
-ccx q[32],q[18],q[33];
-ccx q[31],q[17],q[32];
-ccx q[16],q[15],q[31];
-x q[15];
-x q[17];
-x q[18];
-x q[19];
-x q[20];
-x q[21];
-x q[22];
-x q[23];
-x q[24];
-x q[25];
-x q[26];
-x q[27];
-x q[28];
-x q[29];
-cx q[0],q[15];
-cx q[1],q[17];
-cx q[2],q[19];
-cx q[3],q[21];
-cx q[4],q[23];
-cx q[5],q[25];
-cx q[6],q[27];
-cx q[7],q[29];
-cx q[8],q[16];
-cx q[8],q[17];
-cx q[9],q[18];
-cx q[9],q[19];
-cx q[10],q[20];
-cx q[10],q[21];
-cx q[11],q[22];
-cx q[11],q[23];
-cx q[12],q[24];
-cx q[12],q[25];
-cx q[13],q[26];
-cx q[13],q[27];
-cx q[14],q[28];
-cx q[14],q[29];
-h q[0];
-h q[1];
-h q[2];
-h q[3];
-h q[4];
-h q[5];
-h q[6];
-h q[7];
-h q[8];
-h q[9];
-h q[10];
-h q[11];
-h q[12];
-h q[13];
-h q[14];
-x q[0];
-x q[1];
-x q[2];
-x q[3];
-x q[4];
-x q[5];
-x q[6];
-x q[7];
-x q[8];
-x q[9];
-x q[10];
-x q[11];
-x q[12];
-x q[13];
-x q[14];
-reset q[31];
-reset q[32];
-reset q[33];
-reset q[34];
-reset q[35];
-reset q[36];
-reset q[37];
-reset q[38];
-reset q[39];
-reset q[40];
-reset q[41];
-reset q[42];
-reset q[43];
-reset q[44];
-ccx q[1],q[0],q[31];
-ccx q[31],q[2],q[32];
-ccx q[32],q[3],q[33];
-ccx q[33],q[4],q[34];
-ccx q[34],q[5],q[35];
-ccx q[35],q[6],q[36];
-ccx q[36],q[7],q[37];
-ccx q[37],q[8],q[38];
-ccx q[38],q[9],q[39];
-ccx q[39],q[10],q[40];
-ccx q[40],q[11],q[41];
-ccx q[41],q[12],q[42];
-ccx q[42],q[13],q[43];
-ccx q[43],q[14],q[44];
-z q[44];
-ccx q[43],q[14],q[44];
-ccx q[42],q[13],q[43];
-ccx q[41],q[12],q[42];
-ccx q[40],q[11],q[41];
-ccx q[39],q[10],q[40];
-ccx q[38],q[9],q[39];
-ccx q[37],q[8],q[38];
-ccx q[36],q[7],q[37];
-ccx q[35],q[6],q[36];
-ccx q[34],q[5],q[35];
-ccx q[33],q[4],q[34];
-ccx q[32],q[3],q[33];
-ccx q[31],q[2],q[32];
-ccx q[1],q[0],q[31];
-x q[0];
-x q[1];
-x q[2];
-x q[3];
-x q[4];
-x q[5];
-x q[6];
-x q[7];
-x q[8];
-x q[9];
-x q[10];
-x q[11];
-x q[12];
-x q[13];
-x q[14];
-h q[0];
-h q[1];
-h q[2];
-h q[3];
-h q[4];
-h q[5];
-h q[6];
-h q[7];
-h q[8];
-h q[9];
-h q[10];
-h q[11];
-h q[12];
-h q[13];
-h q[14];
-cx q[0],q[15];
-cx q[1],q[17];
-cx q[2],q[19];
-cx q[3],q[21];
-cx q[4],q[23];
-cx q[5],q[25];
-cx q[6],q[27];
-cx q[7],q[29];
-cx q[8],q[16];
-cx q[8],q[17];
-cx q[9],q[18];
-cx q[9],q[19];
-cx q[10],q[20];
-cx q[10],q[21];
-cx q[11],q[22];
-cx q[11],q[23];
-cx q[12],q[24];
-cx q[12],q[25];
-cx q[13],q[26];
-cx q[13],q[27];
-cx q[14],q[28];
-cx q[14],q[29];
-x q[15];
-x q[17];
-x q[18];
-x q[19];
-x q[20];
-x q[21];
-x q[22];
-x q[23];
-x q[24];
-x q[25];
-x q[26];
-x q[27];
-x q[28];
-x q[29];
-reset q[31];
-reset q[32];
-reset q[33];
-reset q[34];
-reset q[35];
-reset q[36];
-reset q[37];
-reset q[38];
-reset q[39];
-reset q[40];
-reset q[41];
-reset q[42];
-reset q[43];
-reset q[44];
-ccx q[16],q[15],q[31];
-ccx q[31],q[17],q[32];
-ccx q[32],q[18],q[33];
-ccx q[33],q[19],q[34];
-ccx q[34],q[20],q[35];
-ccx q[35],q[21],q[36];
-ccx q[36],q[22],q[37];
-ccx q[37],q[23],q[38];
-ccx q[38],q[24],q[39];
-ccx q[39],q[25],q[40];
-ccx q[40],q[26],q[41];
-ccx q[41],q[27],q[42];
-ccx q[42],q[28],q[43];
-ccx q[43],q[29],q[44];
-z q[44];
-ccx q[43],q[29],q[44];
-ccx q[42],q[28],q[43];
-ccx q[41],q[27],q[42];
-ccx q[40],q[26],q[41];
-ccx q[39],q[25],q[40];
-ccx q[38],q[24],q[39];
-ccx q[37],q[23],q[38];
-ccx q[36],q[22],q[37];
-ccx q[35],q[21],q[36];
-ccx q[34],q[20],q[35];
-ccx q[33],q[19],q[34];
-ccx q[32],q[18],q[33];
-ccx q[31],q[17],q[32];
-ccx q[16],q[15],q[31];
-x q[15];
-x q[17];
-x q[18];
-x q[19];
-x q[20];
-x q[21];
-x q[22];
-x q[23];
-x q[24];
-x q[25];
-x q[26];
-x q[27];
-x q[28];
-x q[29];
-cx q[0],q[15];
-cx q[1],q[17];
-cx q[2],q[19];
-cx q[3],q[21];
-cx q[4],q[23];
-cx q[5],q[25];
-cx q[6],q[27];
-cx q[7],q[29];
-cx q[8],q[16];
-cx q[8],q[17];
-cx q[9],q[18];
-cx q[9],q[19];
-cx q[10],q[20];
-cx q[10],q[21];
-cx q[11],q[22];
-cx q[11],q[23];
-cx q[12],q[24];
-cx q[12],q[25];
-cx q[13],q[26];
-cx q[13],q[27];
-cx q[14],q[28];
-cx q[14],q[29];
-h q[0];
-h q[1];
-h q[2];
-h q[3];
-h q[4];
-h q[5];
-h q[6];
-h q[7];
-h q[8];
-h q[9];
-h q[10];
-h q[11];
-h q[12];
-h q[13];
-h q[14];
-x q[0];
-x q[1];
-x q[2];
-x q[3];
-x q[4];
-x q[5];
-x q[6];
-x q[7];
-x q[8];
-x q[9];
-x q[10];
-x q[11];
-x q[12];
-x q[13];
-x q[14];
-reset q[31];
-reset q[32];
-reset q[33];
-reset q[34];
-reset q[35];
-reset q[36];
-reset q[37];
-reset q[38];
-reset q[39];
-reset q[40];
-reset q[41];
-reset q[42];
-reset q[43];
-reset q[44];
-ccx q[1],q[0],q[31];
-ccx q[31],q[2],q[32];
-ccx q[32],q[3],q[33];
-ccx q[33],q[4],q[34];
-ccx q[34],q[5],q[35];
-ccx q[35],q[6],q[36];
-ccx q[36],q[7],q[37];
-ccx q[37],q[8],q[38];
-ccx q[38],q[9],q[39];
-ccx q[39],q[10],q[40];
-ccx q[40],q[11],q[41];
-ccx q[41],q[12],q[42];
-ccx q[42],q[13],q[43];
-ccx q[43],q[14],q[44];
-z q[44];
-ccx q[43],q[14],q[44];
-ccx q[42],q[13],q[43];
-ccx q[41],q[12],q[42];
-ccx q[40],q[11],q[41];
-ccx q[39],q[10],q[40];
-ccx q[38],q[9],q[39];
-ccx q[37],q[8],q[38];
-ccx q[36],q[7],q[37];
-ccx q[35],q[6],q[36];
-ccx q[34],q[5],q[35];
-ccx q[33],q[4],q[34];
-ccx q[32],q[3],q[33];
-ccx q[31],q[2],q[32];
-ccx q[1],q[0],q[31];
-x q[0];
-x q[1];
-x q[2];
-x q[3];
-x q[4];
-x q[5];
-x q[6];
-x q[7];
-x q[8];
-x q[9];
-x q[10];
-x q[11];
-x q[12];
-x q[13];
-x q[14];
-h q[0];
-h q[1];
-h q[2];
-h q[3];
-h q[4];
-h q[5];
-h q[6];
-h q[7];
-h q[8];
-h q[9];
-h q[10];
-h q[11];
-h q[12];
-h q[13];
-h q[14];
-cx q[0],q[15];
-cx q[1],q[17];
-cx q[2],q[19];
-cx q[3],q[21];
-cx q[4],q[23];
-cx q[5],q[25];
-cx q[6],q[27];
-cx q[7],q[29];
-cx q[8],q[16];
-cx q[8],q[17];
-cx q[9],q[18];
-cx q[9],q[19];
-cx q[10],q[20];
-cx q[10],q[21];
-cx q[11],q[22];
-cx q[11],q[23];
-cx q[12],q[24];
-cx q[12],q[25];
-cx q[13],q[26];
-cx q[13],q[27];
-cx q[14],q[28];
-cx q[14],q[29];
-x q[15];
-x q[17];
-x q[18];
-x q[19];
-x q[20];
-x q[21];
-x q[22];
-x q[23];
-x q[24];
-x q[25];
-x q[26];
-x q[27];
-x q[28];
-x q[29];
-reset q[31];
-reset q[32];
-reset q[33];
-reset q[34];
-reset q[35];
-reset q[36];
-reset q[37];
-reset q[38];
-reset q[39];
-reset q[40];
-reset q[41];
-reset q[42];
-reset q[43];
-reset q[44];
-ccx q[16],q[15],q[31];
-ccx q[31],q[17],q[32];
-ccx q[32],q[18],q[33];
-ccx q[33],q[19],q[34];
-ccx q[34],q[20],q[35];
-ccx q[35],q[21],q[36];
-ccx q[36],q[22],q[37];
-ccx q[37],q[23],q[38];
-ccx q[38],q[24],q[39];
-ccx q[39],q[25],q[40];
-ccx q[40],q[26],q[41];
-ccx q[41],q[27],q[42];
-ccx q[42],q[28],q[43];
-ccx q[43],q[29],q[44];
-z q[44];
-ccx q[43],q[29],q[44];
-ccx q[42],q[28],q[43];
-ccx q[41],q[27],q[42];
-ccx q[40],q[26],q[41];
-ccx q[39],q[25],q[40];
-ccx q[38],q[24],q[39];
-ccx q[37],q[23],q[38];
-ccx q[36],q[22],q[37];
-ccx q[35],q[21],q[36];
-ccx q[34],q[20],q[35];
-ccx q[33],q[19],q[34];
-ccx q[32],q[18],q[33];
-ccx q[31],q[17],q[32];
-ccx q[16],q[15],q[31];
-x q[15];
-x q[17];
-x q[18];
-x q[19];
-x q[20];
-x q[21];
-x q[22];
-x q[23];
-x q[24];
-x q[25];
-x q[26];
-x q[27];
-x q[28];
-x q[29];
-cx q[0],q[15];
-cx q[1],q[17];
-cx q[2],q[19];
-cx q[3],q[21];
-cx q[4],q[23];
-cx q[5],q[25];
-cx q[6],q[27];
-cx q[7],q[29];
-cx q[8],q[16];
-cx q[8],q[17];
-cx q[9],q[18];
-cx q[9],q[19];
-cx q[10],q[20];
-cx q[10],q[21];
-cx q[11],q[22];
-cx q[11],q[23];
-cx q[12],q[24];
-cx q[12],q[25];
-cx q[13],q[26];
-cx q[13],q[27];
-cx q[14],q[28];
-cx q[14],q[29];
-h q[0];
-h q[1];
-h q[2];
-h q[3];
-h q[4];
-h q[5];
-h q[6];
-h q[7];
-h q[8];
-h q[9];
-h q[10];
-h q[11];
-h q[12];
-h q[13];
-h q[14];
-x q[0];
-x q[1];
-x q[2];
-x q[3];
-x q[4];
-x q[5];
-x q[6];
-x q[7];
-x q[8];
-x q[9];
-x q[10];
-x q[11];
-x q[12];
-x q[13];
-x q[14];
-reset q[31];
-reset q[32];
-reset q[33];
-reset q[34];
-reset q[35];
-reset q[36];
-reset q[37];
-reset q[38];
-reset q[39];
-reset q[40];
-reset q[41];
-reset q[42];
-reset q[43];
-reset q[44];
-ccx q[1],q[0],q[31];
-ccx q[31],q[2],q[32];
-ccx q[32],q[3],q[33];
-ccx q[33],q[4],q[34];
-ccx q[34],q[5],q[35];
-ccx q[35],q[6],q[36];
-ccx q[36],q[7],q[37];
-ccx q[37],q[8],q[38];
-ccx q[38],q[9],q[39];
-ccx q[39],q[10],q[40];
-ccx q[40],q[11],q[41];
-ccx q[41],q[12],q[42];
-ccx q[42],q[13],q[43];
-ccx q[43],q[14],q[44];
-z q[44];
-ccx q[43],q[14],q[44];
-ccx q[42],q[13],q[43];
-ccx q[41],q[12],q[42];
-ccx q[40],q[11],q[41];
-ccx q[39],q[10],q[40];
-ccx q[38],q[9],q[39];
-ccx q[37],q[8],q[38];
-ccx q[36],q[7],q[37];
-ccx q[35],q[6],q[36];
-ccx q[34],q[5],q[35];
-ccx q[33],q[4],q[34];
-ccx q[32],q[3],q[33];
-ccx q[31],q[2],q[32];
-ccx q[1],q[0],q[31];
-x q[0];
-x q[1];
-x q[2];
-x q[3];
-x q[4];
-x q[5];
-x q[6];
-x q[7];
-x q[8];
-x q[9];
-x q[10];
-x q[11];
-x q[12];
-x q[13];
-x q[14];
-h q[0];
-h q[1];
-h q[2];
-h q[3];
-h q[4];
-h q[5];
-h q[6];
-h q[7];
-h q[8];
-h q[9];
-h q[10];
-h q[11];
-h q[12];
-h q[13];
-h q[14];
-cx q[0],q[15];
-cx q[1],q[17];
-cx q[2],q[19];
-cx q[3],q[21];
-cx q[4],q[23];
-cx q[5],q[25];
-cx q[6],q[27];
-cx q[7],q[29];
-cx q[8],q[16];
-cx q[8],q[17];
-cx q[9],q[18];
-cx q[9],q[19];
-cx q[10],q[20];
-cx q[10],q[21];
-cx q[11],q[22];
-cx q[11],q[23];
-cx q[12],q[24];
-cx q[12],q[25];
-cx q[13],q[26];
-cx q[13],q[27];
-cx q[14],q[28];
-cx q[14],q[29];
-x q[15];
-x q[17];
-x q[18];
-x q[19];
-x q[20];
-x q[21];
-x q[22];
-x q[23];
-x q[24];
-x q[25];
-x q[26];
-x q[27];
-x q[28];
-x q[29];
-reset q[31];
-reset q[32];
-reset q[33];
-reset q[34];
-reset q[35];
-reset q[36];
-reset q[37];
-reset q[38];
-reset q[39];
-reset q[40];
-reset q[41];
-reset q[42];
-reset q[43];
-reset q[44];
-ccx q[16],q[15],q[31];
-ccx q[31],q[17],q[32];
-ccx q[32],q[18],q[33];
-ccx q[33],q[19],q[34];
-ccx q[34],q[20],q[35];
-ccx q[35],q[21],q[36];
-ccx q[36],q[22],q[37];
-ccx q[37],q[23],q[38];
-ccx q[38],q[24],q[39];
-ccx q[39],q[25],q[40];
-ccx q[40],q[26],q[41];
-ccx q[41],q[27],q[42];
-ccx q[42],q[28],q[43];
-ccx q[43],q[29],q[44];
-z q[44];
-ccx q[43],q[29],q[44];
-ccx q[42],q[28],q[43];
-ccx q[41],q[27],q[42];
-ccx q[40],q[26],q[41];
-ccx q[39],q[25],q[40];
-ccx q[38],q[24],q[39];
-ccx q[37],q[23],q[38];
-ccx q[36],q[22],q[37];
-ccx q[35],q[21],q[36];
-ccx q[34],q[20],q[35];
-ccx q[33],q[19],q[34];
-ccx q[32],q[18],q[33];
-ccx q[31],q[17],q[32];
-ccx q[16],q[15],q[31];
-x q[15];
-x q[17];
-x q[18];
-x q[19];
-x q[20];
-x q[21];
-x q[22];
-x q[23];
-x q[24];
-x q[25];
-x q[26];
-x q[27];
-x q[28];
-x q[29];
-cx q[0],q[15];
-cx q[1],q[17];
-cx q[2],q[19];
-cx q[3],q[21];
-cx q[4],q[23];
-cx q[5],q[25];
-cx q[6],q[27];
-cx q[7],q[29];
-cx q[8],q[16];
-cx q[8],q[17];
-cx q[9],q[18];
-cx q[9],q[19];
-cx q[10],q[20];
-cx q[10],q[21];
-cx q[11],q[22];
-cx q[11],q[23];
-cx q[12],q[24];
-cx q[12],q[25];
-cx q[13],q[26];
-cx q[13],q[27];
-cx q[14],q[28];
-cx q[14],q[29];
-h q[0];
-h q[1];
-h q[2];
-h q[3];
-h q[4];
-h q[5];
-h q[6];
-h q[7];
-h q[8];
-h q[9];
-h q[10];
-h q[11];
-h q[12];
-h q[13];
-h q[14];
-x q[0];
-x q[1];
-x q[2];
-x q[3];
-x q[4];
-x q[5];
-x q[6];
-x q[7];
-x q[8];
-x q[9];
-x q[10];
-x q[11];
-x q[12];
-x q[13];
-x q[14];
-reset q[31];
-reset q[32];
-reset q[33];
-reset q[34];
-reset q[35];
-reset q[36];
-reset q[37];
-reset q[38];
-reset q[39];
-reset q[40];
-reset q[41];
-reset q[42];
-reset q[43];
-reset q[44];
-ccx q[1],q[0],q[31];
-ccx q[31],q[2],q[32];
-ccx q[32],q[3],q[33];
-ccx q[33],q[4],q[34];
-ccx q[34],q[5],q[35];
-ccx q[35],q[6],q[36];
-ccx q[36],q[7],q[37];
-ccx q[37],q[8],q[38];
-ccx q[38],q[9],q[39];
-ccx q[39],q[10],q[40];
-ccx q[40],q[11],q[41];
-ccx q[41],q[12],q[42];
-ccx q[42],q[13],q[43];
-ccx q[43],q[14],q[44];
-z q[44];
-ccx q[43],q[14],q[44];
-ccx q[42],q[13],q[43];
-ccx q[41],q[12],q[42];
-ccx q[40],q[11],q[41];
-ccx q[39],q[10],q[40];
-ccx q[38],q[9],q[39];
-ccx q[37],q[8],q[38];
-ccx q[36],q[7],q[37];
-ccx q[35],q[6],q[36];
-ccx q[34],q[5],q[35];
-ccx q[33],q[4],q[34];
-ccx q[32],q[3],q[33];
-ccx q[31],q[2],q[32];
-ccx q[1],q[0],q[31];
-x q[0];
-x q[1];
-x q[2];
-x q[3];
-x q[4];
-x q[5];
-x q[6];
-x q[7];
-x q[8];
-x q[9];
-x q[10];
-x q[11];
-x q[12];
-x q[13];
-x q[14];
-h q[0];
-h q[1];
-h q[2];
-h q[3];
-h q[4];
-h q[5];
-h q[6];
-h q[7];
-h q[8];
-h q[9];
-h q[10];
-h q[11];
-h q[12];
-h q[13];
-h q[14];
-cx q[0],q[15];
-cx q[1],q[17];
-cx q[2],q[19];
-cx q[3],q[21];
-cx q[4],q[23];
-cx q[5],q[25];
-cx q[6],q[27];
-cx q[7],q[29];
-cx q[8],q[16];
-cx q[8],q[17];
-cx q[9],q[18];
-cx q[9],q[19];
-cx q[10],q[20];
-cx q[10],q[21];
-cx q[11],q[22];
-cx q[11],q[23];
-cx q[12],q[24];
-cx q[12],q[25];
-cx q[13],q[26];
-cx q[13],q[27];
-cx q[14],q[28];
-cx q[14],q[29];
-x q[15];
-x q[17];
-x q[18];
-x q[19];
-x q[20];
-x q[21];
-x q[22];
-x q[23];
-x q[24];
-x q[25];
-x q[26];
-x q[27];
-x q[28];
-x q[29];
-reset q[31];
-reset q[32];
-reset q[33];
-reset q[34];
-reset q[35];
-reset q[36];
-reset q[37];
-reset q[38];
-reset q[39];
-reset q[40];
-reset q[41];
-reset q[42];
-reset q[43];
-reset q[44];
-ccx q[16],q[15],q[31];
-ccx q[31],q[17],q[32];
-ccx q[32],q[18],q[33];
-ccx q[33],q[19],q[34];
-ccx q[34],q[20],q[35];
-ccx q[35],q[21],q[36];
-ccx q[36],q[22],q[37];
-ccx q[37],q[23],q[38];
-ccx q[38],q[24],q[39];
-ccx q[39],q[25],q[40];
-ccx q[40],q[26],q[41];
-ccx q[41],q[27],q[42];
-ccx q[42],q[28],q[43];
-ccx q[43],q[29],q[44];
-z q[44];
-ccx q[43],q[29],q[44];
-ccx q[42],q[28],q[43];
-ccx q[41],q[27],q[42];
-ccx q[40],q[26],q[41];
-ccx q[39],q[25],q[40];
-ccx q[38],q[24],q[39];
-ccx q[37],q[23],q[38];
-ccx q[36],q[22],q[37];
-ccx q[35],q[21],q[36];
-ccx q[34],q[20],q[35];
-ccx q[33],q[19],q[34];
-ccx q[32],q[18],q[33];
-ccx q[31],q[17],q[32];
-ccx q[16],q[15],q[31];
-x q[15];
-x q[17];
-x q[18];
-x q[19];
-x q[20];
-x q[21];
-x q[22];
-x q[23];
-x q[24];
-x q[25];
-x q[26];
-x q[27];
-x q[28];
-x q[29];
-cx q[0],q[15];
-cx q[1],q[17];
-cx q[2],q[19];
-cx q[3],q[21];
-cx q[4],q[23];
-cx q[5],q[25];
-cx q[6],q[27];
-cx q[7],q[29];
-cx q[8],q[16];
-cx q[8],q[17];
-cx q[9],q[18];
-cx q[9],q[19];
-cx q[10],q[20];
-cx q[10],q[21];
-cx q[11],q[22];
-cx q[11],q[23];
-cx q[12],q[24];
-cx q[12],q[25];
-cx q[13],q[26];
-cx q[13],q[27];
-cx q[14],q[28];
-cx q[14],q[29];
-h q[0];
-h q[1];
-h q[2];
-h q[3];
-h q[4];
-h q[5];
-h q[6];
-h q[7];
-h q[8];
-h q[9];
-h q[10];
-h q[11];
-h q[12];
-h q[13];
-h q[14];
-x q[0];
-x q[1];
-x q[2];
-x q[3];
-x q[4];
-x q[5];
-x q[6];
-x q[7];
-x q[8];
-x q[9];
-x q[10];
-x q[11];
-x q[12];
-x q[13];
-x q[14];
-reset q[31];
-reset q[32];
-reset q[33];
-reset q[34];
-reset q[35];
-reset q[36];
-reset q[37];
-reset q[38];
-reset q[39];
-reset q[40];
-reset q[41];
-reset q[42];
-reset q[43];
-reset q[44];
-ccx q[1],q[0],q[31];
-ccx q[31],q[2],q[32];
-ccx q[32],q[3],q[33];
-ccx q[33],q[4],q[34];
-ccx q[34],q[5],q[35];
-ccx q[35],q[6],q[36];
-ccx q[36],q[7],q[37];
-ccx q[37],q[8],q[38];
-ccx q[38],q[9],q[39];
-ccx q[39],q[10],q[40];
-ccx q[40],q[11],q[41];
-ccx q[41],q[12],q[42];
-ccx q[42],q[13],q[43];
-ccx q[43],q[14],q[44];
-z q[44];
-ccx q[43],q[14],q[44];
-ccx q[42],q[13],q[43];
-ccx q[41],q[12],q[42];
-ccx q[40],q[11],q[41];
-ccx q[39],q[10],q[40];
-ccx q[38],q[9],q[39];
-ccx q[37],q[8],q[38];
-ccx q[36],q[7],q[37];
-ccx q[35],q[6],q[36];
-ccx q[34],q[5],q[35];
-ccx q[33],q[4],q[34];
-ccx q[32],q[3],q[33];
-ccx q[31],q[2],q[32];
-ccx q[1],q[0],q[31];
-x q[0];
-x q[1];
-x q[2];
-x q[3];
-x q[4];
-x q[5];
-x q[6];
-x q[7];
-x q[8];
-x q[9];
-x q[10];
-x q[11];
-x q[12];
-x q[13];
-x q[14];
-h q[0];
-h q[1];
-h q[2];
-h q[3];
-h q[4];
-h q[5];
-h q[6];
-h q[7];
-h q[8];
-h q[9];
-h q[10];
-h q[11];
-h q[12];
-h q[13];
-h q[14];
-cx q[0],q[15];
-cx q[1],q[17];
-cx q[2],q[19];
-cx q[3],q[21];
-cx q[4],q[23];
-cx q[5],q[25];
-cx q[6],q[27];
-cx q[7],q[29];
-cx q[8],q[16];
-cx q[8],q[17];
-cx q[9],q[18];
-cx q[9],q[19];
-cx q[10],q[20];
-cx q[10],q[21];
-cx q[11],q[22];
-cx q[11],q[23];
-cx q[12],q[24];
-cx q[12],q[25];
-cx q[13],q[26];
-cx q[13],q[27];
-cx q[14],q[28];
-cx q[14],q[29];
-x q[15];
-x q[17];
-x q[18];
-x q[19];
-x q[20];
-x q[21];
-x q[22];
-x q[23];
-x q[24];
-x q[25];
-x q[26];
-x q[27];
-x q[28];
-x q[29];
-reset q[31];
-reset q[32];
-reset q[33];
-reset q[34];
-reset q[35];
-reset q[36];
-reset q[37];
-reset q[38];
-reset q[39];
-reset q[40];
-reset q[41];
-reset q[42];
-reset q[43];
-reset q[44];
-ccx q[16],q[15],q[31];
-ccx q[31],q[17],q[32];
-ccx q[32],q[18],q[33];
-ccx q[33],q[19],q[34];
-ccx q[34],q[20],q[35];
-ccx q[35],q[21],q[36];
-ccx q[36],q[22],q[37];
-ccx q[37],q[23],q[38];
-ccx q[38],q[24],q[39];
-ccx q[39],q[25],q[40];
-ccx q[40],q[26],q[41];
-ccx q[41],q[27],q[42];
-ccx q[42],q[28],q[43];
-ccx q[43],q[29],q[44];
-z q[44];
-ccx q[43],q[29],q[44];
-ccx q[42],q[28],q[43];
-ccx q[41],q[27],q[42];
-ccx q[40],q[26],q[41];
-ccx q[39],q[25],q[40];
-ccx q[38],q[24],q[39];
-ccx q[37],q[23],q[38];
-ccx q[36],q[22],q[37];
-ccx q[35],q[21],q[36];
-ccx q[34],q[20],q[35];
-ccx q[33],q[19],q[34];
-ccx q[32],q[18],q[33];
-ccx q[31],q[17],q[32];
-ccx q[16],q[15],q[31];
-x q[15];
-x q[17];
-x q[18];
-x q[19];
-x q[20];
-x q[21];
-x q[22];
-x q[23];
-x q[24];
-x q[25];
-x q[26];
-x q[27];
-x q[28];
-x q[29];
-cx q[0],q[15];
-cx q[1],q[17];
-cx q[2],q[19];
-cx q[3],q[21];
-cx q[4],q[23];
-cx q[5],q[25];
-cx q[6],q[27];
-cx q[7],q[29];
-cx q[8],q[16];
-cx q[8],q[17];
-cx q[9],q[18];
-cx q[9],q[19];
-cx q[10],q[20];
-cx q[10],q[21];
-cx q[11],q[22];
-cx q[11],q[23];
-cx q[12],q[24];
-cx q[12],q[25];
-cx q[13],q[26];
-cx q[13],q[27];
-cx q[14],q[28];
-cx q[14],q[29];
-h q[0];
-h q[1];
-h q[2];
-h q[3];
-h q[4];
-h q[5];
-h q[6];
-h q[7];
-h q[8];
-h q[9];
-h q[10];
-h q[11];
-h q[12];
-h q[13];
-h q[14];
-x q[0];
-x q[1];
-x q[2];
-x q[3];
-x q[4];
-x q[5];
-x q[6];
-x q[7];
-x q[8];
-x q[9];
-x q[10];
-x q[11];
-x q[12];
-x q[13];
-x q[14];
-reset q[31];
-reset q[32];
-reset q[33];
-reset q[34];
-reset q[35];
-reset q[36];
-reset q[37];
-reset q[38];
-reset q[39];
-reset q[40];
-reset q[41];
-reset q[42];
-reset q[43];
-reset q[44];
-ccx q[1],q[0],q[31];
-ccx q[31],q[2],q[32];
-ccx q[32],q[3],q[33];
-ccx q[33],q[4],q[34];
-ccx q[34],q[5],q[35];
-ccx q[35],q[6],q[36];
-ccx q[36],q[7],q[37];
-ccx q[37],q[8],q[38];
-ccx q[38],q[9],q[39];
-ccx q[39],q[10],q[40];
-ccx q[40],q[11],q[41];
-ccx q[41],q[12],q[42];
-ccx q[42],q[13],q[43];
-ccx q[43],q[14],q[44];
-z q[44];
-ccx q[43],q[14],q[44];
-ccx q[42],q[13],q[43];
-ccx q[41],q[12],q[42];
-ccx q[40],q[11],q[41];
-ccx q[39],q[10],q[40];
-ccx q[38],q[9],q[39];
-ccx q[37],q[8],q[38];
-ccx q[36],q[7],q[37];
-ccx q[35],q[6],q[36];
-ccx q[34],q[5],q[35];
-ccx q[33],q[4],q[34];
-ccx q[32],q[3],q[33];
-ccx q[31],q[2],q[32];
-ccx q[1],q[0],q[31];
-x q[0];
-x q[1];
-x q[2];
-x q[3];
-x q[4];
-x q[5];
-x q[6];
-x q[7];
-x q[8];
-x q[9];
-x q[10];
-x q[11];
-x q[12];
-x q[13];
-x q[14];
-h q[0];
-h q[1];
-h q[2];
-h q[3];
-h q[4];
-h q[5];
-h q[6];
-h q[7];
-h q[8];
-h q[9];
-h q[10];
-h q[11];
-h q[12];
-h q[13];
-h q[14];
-cx q[0],q[15];
-cx q[1],q[17];
-cx q[2],q[19];
-cx q[3],q[21];
-cx q[4],q[23];
-cx q[5],q[25];
-cx q[6],q[27];
-cx q[7],q[29];
-cx q[8],q[16];
-cx q[8],q[17];
-cx q[9],q[18];
-cx q[9],q[19];
-cx q[10],q[20];
-cx q[10],q[21];
-cx q[11],q[22];
-cx q[11],q[23];
-cx q[12],q[24];
-cx q[12],q[25];
-cx q[13],q[26];
-cx q[13],q[27];
-cx q[14],q[28];
-cx q[14],q[29];
-x q[15];
-x q[17];
-x q[18];
-x q[19];
-x q[20];
-x q[21];
-x q[22];
-x q[23];
-x q[24];
-x q[25];
-x q[26];
-x q[27];
-x q[28];
-x q[29];
-reset q[31];
-reset q[32];
-reset q[33];
-reset q[34];
-reset q[35];
-reset q[36];
-reset q[37];
-reset q[38];
-reset q[39];
-reset q[40];
-reset q[41];
-reset q[42];
-reset q[43];
-reset q[44];
-ccx q[16],q[15],q[31];
-ccx q[31],q[17],q[32];
-ccx q[32],q[18],q[33];
-ccx q[33],q[19],q[34];
-ccx q[34],q[20],q[35];
-ccx q[35],q[21],q[36];
-ccx q[36],q[22],q[37];
-ccx q[37],q[23],q[38];
-ccx q[38],q[24],q[39];
-ccx q[39],q[25],q[40];
-ccx q[40],q[26],q[41];
-ccx q[41],q[27],q[42];
-ccx q[42],q[28],q[43];
-ccx q[43],q[29],q[44];
-z q[44];
-ccx q[43],q[29],q[44];
-ccx q[42],q[28],q[43];
-ccx q[41],q[27],q[42];
-ccx q[40],q[26],q[41];
-ccx q[39],q[25],q[40];
-ccx q[38],q[24],q[39];
-ccx q[37],q[23],q[38];
-ccx q[36],q[22],q[37];
-ccx q[35],q[21],q[36];
-ccx q[34],q[20],q[35];
-ccx q[33],q[19],q[34];
-ccx q[32],q[18],q[33];
-ccx q[31],q[17],q[32];
-ccx q[16],q[15],q[31];
-x q[15];
-x q[17];
-x q[18];
-x q[19];
-x q[20];
-x q[21];
-x q[22];
-x q[23];
-x q[24];
-x q[25];
-x q[26];
-x q[27];
-x q[28];
-x q[29];
-cx q[0],q[15];
-cx q[1],q[17];
-cx q[2],q[19];
-cx q[3],q[21];
-cx q[4],q[23];
-cx q[5],q[25];
-cx q[6],q[27];
-cx q[7],q[29];
-cx q[8],q[16];
-cx q[8],q[17];
-cx q[9],q[18];
-cx q[9],q[19];
-cx q[10],q[20];
-cx q[10],q[21];
-cx q[11],q[22];
-cx q[11],q[23];
-cx q[12],q[24];
-cx q[12],q[25];
-cx q[13],q[26];
-cx q[13],q[27];
-cx q[14],q[28];
-cx q[14],q[29];
-h q[0];
-h q[1];
-h q[2];
-h q[3];
-h q[4];
-h q[5];
-h q[6];
-h q[7];
-h q[8];
-h q[9];
-h q[10];
-h q[11];
-h q[12];
-h q[13];
-h q[14];
-x q[0];
-x q[1];
-x q[2];
-x q[3];
-x q[4];
-x q[5];
-x q[6];
-x q[7];
-x q[8];
-x q[9];
-x q[10];
-x q[11];
-x q[12];
-x q[13];
-x q[14];
-reset q[31];
-reset q[32];
-reset q[33];
-reset q[34];
-reset q[35];
-reset q[36];
-reset q[37];
-reset q[38];
-reset q[39];
-reset q[40];
-reset q[41];
-reset q[42];
-reset q[43];
-reset q[44];
-ccx q[1],q[0],q[31];
-ccx q[31],q[2],q[32];
-ccx q[32],q[3],q[33];
-ccx q[33],q[4],q[34];
-ccx q[34],q[5],q[35];
-ccx q[35],q[6],q[36];
-ccx q[36],q[7],q[37];
-ccx q[37],q[8],q[38];
-ccx q[38],q[9],q[39];
-ccx q[39],q[10],q[40];
-ccx q[40],q[11],q[41];
-ccx q[41],q[12],q[42];
-ccx q[42],q[13],q[43];
-ccx q[43],q[14],q[44];
-z q[44];
-ccx q[43],q[14],q[44];
-ccx q[42],q[13],q[43];
-ccx q[41],q[12],q[42];
-ccx q[40],q[11],q[41];
-ccx q[39],q[10],q[40];
-ccx q[38],q[9],q[39];
-ccx q[37],q[8],q[38];
-ccx q[36],q[7],q[37];
-ccx q[35],q[6],q[36];
-ccx q[34],q[5],q[35];
-ccx q[33],q[4],q[34];
-ccx q[32],q[3],q[33];
-ccx q[31],q[2],q[32];
-ccx q[1],q[0],q[31];
-x q[0];
-x q[1];
-x q[2];
-x q[3];
-x q[4];
-x q[5];
-x q[6];
-x q[7];
-x q[8];
-x q[9];
-x q[10];
-x q[11];
-x q[12];
-x q[13];
-x q[14];
-h q[0];
-h q[1];
-h q[2];
-h q[3];
-h q[4];
-h q[5];
-h q[6];
-h q[7];
-h q[8];
-h q[9];
-h q[10];
-h q[11];
-h q[12];
-h q[13];
-h q[14];
-cx q[0],q[15];
-cx q[1],q[17];
-cx q[2],q[19];
-cx q[3],q[21];
-cx q[4],q[23];
-cx q[5],q[25];
-cx q[6],q[27];
-cx q[7],q[29];
-cx q[8],q[16];
-cx q[8],q[17];
-cx q[9],q[18];
-cx q[9],q[19];
-cx q[10],q[20];
-cx q[10],q[21];
-cx q[11],q[22];
-cx q[11],q[23];
-cx q[12],q[24];
-cx q[12],q[25];
-cx q[13],q[26];
-cx q[13],q[27];
-cx q[14],q[28];
-cx q[14],q[29];
-x q[15];
-x q[17];
-x q[18];
-x q[19];
-x q[20];
-x q[21];
-x q[22];
-x q[23];
-x q[24];
-x q[25];
-x q[26];
-x q[27];
-x q[28];
-x q[29];
-reset q[31];
-reset q[32];
-reset q[33];
-reset q[34];
-reset q[35];
-reset q[36];
-reset q[37];
-reset q[38];
-reset q[39];
-reset q[40];
-reset q[41];
-reset q[42];
-reset q[43];
-reset q[44];
-ccx q[16],q[15],q[31];
-ccx q[31],q[17],q[32];
-ccx q[32],q[18],q[33];
-ccx q[33],q[19],q[34];
-ccx q[34],q[20],q[35];
-ccx q[35],q[21],q[36];
-ccx q[36],q[22],q[37];
-ccx q[37],q[23],q[38];
-ccx q[38],q[24],q[39];
-ccx q[39],q[25],q[40];
-ccx q[40],q[26],q[41];
-ccx q[41],q[27],q[42];
-ccx q[42],q[28],q[43];
-ccx q[43],q[29],q[44];
-z q[44];
-ccx q[43],q[29],q[44];
-ccx q[42],q[28],q[43];
-ccx q[41],q[27],q[42];
-ccx q[40],q[26],q[41];
-ccx q[39],q[25],q[40];
-ccx q[38],q[24],q[39];
-ccx q[37],q[23],q[38];
-ccx q[36],q[22],q[37];
-ccx q[35],q[21],q[36];
-ccx q[34],q[20],q[35];
-ccx q[33],q[19],q[34];
-ccx q[32],q[18],q[33];
-ccx q[31],q[17],q[32];
-ccx q[16],q[15],q[31];
-x q[15];
-x q[17];
-x q[18];
-x q[19];
-x q[20];
-x q[21];
-x q[22];
-x q[23];
-x q[24];
-x q[25];
-x q[26];
-x q[27];
-x q[28];
-x q[29];
-cx q[0],q[15];
-cx q[1],q[17];
-cx q[2],q[19];
-cx q[3],q[21];
-cx q[4],q[23];
-cx q[5],q[25];
-cx q[6],q[27];
-cx q[7],q[29];
-cx q[8],q[16];
-cx q[8],q[17];
-cx q[9],q[18];
-cx q[9],q[19];
-cx q[10],q[20];
-cx q[10],q[21];
-cx q[11],q[22];
-cx q[11],q[23];
-cx q[12],q[24];
-cx q[12],q[25];
-cx q[13],q[26];
-cx q[13],q[27];
-cx q[14],q[28];
-cx q[14],q[29];
-h q[0];
-h q[1];
-h q[2];
-h q[3];
-h q[4];
-h q[5];
-h q[6];
-h q[7];
-h q[8];
-h q[9];
-h q[10];
-h q[11];
-h q[12];
-h q[13];
-h q[14];
-x q[0];
-x q[1];
-x q[2];
-x q[3];
-x q[4];
-x q[5];
-x q[6];
-x q[7];
-x q[8];
-x q[9];
-x q[10];
-x q[11];
-x q[12];
-x q[13];
-x q[14];
-reset q[31];
-reset q[32];
-reset q[33];
-reset q[34];
-reset q[35];
-reset q[36];
-reset q[37];
-reset q[38];
-reset q[39];
-reset q[40];
-reset q[41];
-reset q[42];
-reset q[43];
-reset q[44];
-ccx q[1],q[0],q[31];
-ccx q[31],q[2],q[32];
-ccx q[32],q[3],q[33];
-ccx q[33],q[4],q[34];
-ccx q[34],q[5],q[35];
-ccx q[35],q[6],q[36];
-ccx q[36],q[7],q[37];
-ccx q[37],q[8],q[38];
-ccx q[38],q[9],q[39];
-ccx q[39],q[10],q[40];
-ccx q[40],q[11],q[41];
-ccx q[41],q[12],q[42];
-ccx q[42],q[13],q[43];
-ccx q[43],q[14],q[44];
-z q[44];
-ccx q[43],q[14],q[44];
-ccx q[42],q[13],q[43];
-ccx q[41],q[12],q[42];
-ccx q[40],q[11],q[41];
-ccx q[39],q[10],q[40];
-ccx q[38],q[9],q[39];
-ccx q[37],q[8],q[38];
-ccx q[36],q[7],q[37];
-ccx q[35],q[6],q[36];
-ccx q[34],q[5],q[35];
-ccx q[33],q[4],q[34];
-ccx q[32],q[3],q[33];
-ccx q[31],q[2],q[32];
-ccx q[1],q[0],q[31];
-x q[0];
-x q[1];
-x q[2];
-x q[3];
-x q[4];
-x q[5];
-x q[6];
-x q[7];
-x q[8];
-x q[9];
-x q[10];
-x q[11];
-x q[12];
-x q[13];
-x q[14];
-h q[0];
-h q[1];
-h q[2];
-h q[3];
-h q[4];
-h q[5];
-h q[6];
-h q[7];
-h q[8];
-h q[9];
-h q[10];
-h q[11];
-h q[12];
-h q[13];
-h q[14];
-cx q[0],q[15];
-cx q[1],q[17];
-cx q[2],q[19];
-cx q[3],q[21];
-cx q[4],q[23];
-cx q[5],q[25];
-cx q[6],q[27];
-cx q[7],q[29];
-cx q[8],q[16];
-cx q[8],q[17];
-cx q[9],q[18];
-cx q[9],q[19];
-cx q[10],q[20];
-cx q[10],q[21];
-cx q[11],q[22];
-cx q[11],q[23];
-cx q[12],q[24];
-cx q[12],q[25];
-cx q[13],q[26];
-cx q[13],q[27];
-cx q[14],q[28];
-cx q[14],q[29];
-x q[15];
-x q[17];
-x q[18];
-x q[19];
-x q[20];
-x q[21];
-x q[22];
-x q[23];
-x q[24];
-x q[25];
-x q[26];
-x q[27];
-x q[28];
-x q[29];
-reset q[31];
-reset q[32];
-reset q[33];
-reset q[34];
-reset q[35];
-reset q[36];
-reset q[37];
-reset q[38];
-reset q[39];
-reset q[40];
-reset q[41];
-reset q[42];
-reset q[43];
-reset q[44];
-ccx q[16],q[15],q[31];
-ccx q[31],q[17],q[32];
-ccx q[32],q[18],q[33];
-ccx q[33],q[19],q[34];
-ccx q[34],q[20],q[35];
-ccx q[35],q[21],q[36];
-ccx q[36],q[22],q[37];
-ccx q[37],q[23],q[38];
-ccx q[38],q[24],q[39];
-ccx q[39],q[25],q[40];
-ccx q[40],q[26],q[41];
-ccx q[41],q[27],q[42];
-ccx q[42],q[28],q[43];
-ccx q[43],q[29],q[44];
-z q[44];
-ccx q[43],q[29],q[44];
-ccx q[42],q[28],q[43];
-ccx q[41],q[27],q[42];
-ccx q[40],q[26],q[41];
-ccx q[39],q[25],q[40];
-ccx q[38],q[24],q[39];
-ccx q[37],q[23],q[38];
-ccx q[36],q[22],q[37];
-ccx q[35],q[21],q[36];
-ccx q[34],q[20],q[35];
-ccx q[33],q[19],q[34];
-ccx q[32],q[18],q[33];
-ccx q[31],q[17],q[32];
-ccx q[16],q[15],q[31];
-x q[15];
-x q[17];
-x q[18];
-x q[19];
-x q[20];
-x q[21];
-x q[22];
-x q[23];
-x q[24];
-x q[25];
-x q[26];
-x q[27];
-x q[28];
-x q[29];
-cx q[0],q[15];
-cx q[1],q[17];
-cx q[2],q[19];
-cx q[3],q[21];
-cx q[4],q[23];
-cx q[5],q[25];
-cx q[6],q[27];
-cx q[7],q[29];
-cx q[8],q[16];
-cx q[8],q[17];
-cx q[9],q[18];
-cx q[9],q[19];
-cx q[10],q[20];
-cx q[10],q[21];
-cx q[11],q[22];
-cx q[11],q[23];
-cx q[12],q[24];
-cx q[12],q[25];
-cx q[13],q[26];
-cx q[13],q[27];
-cx q[14],q[28];
-cx q[14],q[29];
-h q[0];
-h q[1];
-h q[2];
-h q[3];
-h q[4];
-h q[5];
-h q[6];
-h q[7];
-h q[8];
-h q[9];
-h q[10];
-h q[11];
-h q[12];
-h q[13];
-h q[14];
-x q[0];
-x q[1];
-x q[2];
-x q[3];
-x q[4];
-x q[5];
-x q[6];
-x q[7];
-x q[8];
-x q[9];
-x q[10];
-x q[11];
-x q[12];
-x q[13];
-x q[14];
-reset q[31];
-reset q[32];
-reset q[33];
-reset q[34];
-reset q[35];
-reset q[36];
-reset q[37];
-reset q[38];
-reset q[39];
-reset q[40];
-reset q[41];
-reset q[42];
-reset q[43];
-reset q[44];
-ccx q[1],q[0],q[31];
-ccx q[31],q[2],q[32];
-ccx q[32],q[3],q[33];
-ccx q[33],q[4],q[34];
-ccx q[34],q[5],q[35];
-ccx q[35],q[6],q[36];
-ccx q[36],q[7],q[37];
-ccx q[37],q[8],q[38];
-ccx q[38],q[9],q[39];
-ccx q[39],q[10],q[40];
-ccx q[40],q[11],q[41];
-ccx q[41],q[12],q[42];
-ccx q[42],q[13],q[43];
-ccx q[43],q[14],q[44];
-z q[44];
-ccx q[43],q[14],q[44];
-ccx q[42],q[13],q[43];
-ccx q[41],q[12],q[42];
-ccx q[40],q[11],q[41];
-ccx q[39],q[10],q[40];
-ccx q[38],q[9],q[39];
-ccx q[37],q[8],q[38];
-ccx q[36],q[7],q[37];
-ccx q[35],q[6],q[36];
-ccx q[34],q[5],q[35];
-ccx q[33],q[4],q[34];
-ccx q[32],q[3],q[33];
-ccx q[31],q[2],q[32];
-ccx q[1],q[0],q[31];
-x q[0];
-x q[1];
-x q[2];
-x q[3];
-x q[4];
-x q[5];
-x q[6];
-x q[7];
-x q[8];
-x q[9];
-x q[10];
-x q[11];
-x q[12];
-x q[13];
-x q[14];
-h q[0];
-h q[1];
-h q[2];
-h q[3];
-h q[4];
-h q[5];
-h q[6];
-h q[7];
-h q[8];
-h q[9];
-h q[10];
-h q[11];
-h q[12];
-h q[13];
-h q[14];
-cx q[0],q[15];
-cx q[1],q[17];
-cx q[2],q[19];
-cx q[3],q[21];
-cx q[4],q[23];
-cx q[5],q[25];
-cx q[6],q[27];
-cx q[7],q[29];
-cx q[8],q[16];
-cx q[8],q[17];
-cx q[9],q[18];
-cx q[9],q[19];
-cx q[10],q[20];
-cx q[10],q[21];
-cx q[11],q[22];
-cx q[11],q[23];
-cx q[12],q[24];
-cx q[12],q[25];
-cx q[13],q[26];
-cx q[13],q[27];
-cx q[14],q[28];
-cx q[14],q[29];
-x q[15];
-x q[17];
-x q[18];
-x q[19];
-x q[20];
-x q[21];
-x q[22];
-x q[23];
-x q[24];
-x q[25];
-x q[26];
-x q[27];
-x q[28];
-x q[29];
-reset q[31];
-reset q[32];
-reset q[33];
-reset q[34];
-reset q[35];
-reset q[36];
-reset q[37];
-reset q[38];
-reset q[39];
-reset q[40];
-reset q[41];
-reset q[42];
-reset q[43];
-reset q[44];
-ccx q[16],q[15],q[31];
-ccx q[31],q[17],q[32];
-ccx q[32],q[18],q[33];
-ccx q[33],q[19],q[34];
-ccx q[34],q[20],q[35];
-ccx q[35],q[21],q[36];
-ccx q[36],q[22],q[37];
-ccx q[37],q[23],q[38];
-ccx q[38],q[24],q[39];
-ccx q[39],q[25],q[40];
-ccx q[40],q[26],q[41];
-ccx q[41],q[27],q[42];
-ccx q[42],q[28],q[43];
-ccx q[43],q[29],q[44];
-z q[44];
-ccx q[43],q[29],q[44];
-ccx q[42],q[28],q[43];
-ccx q[41],q[27],q[42];
-ccx q[40],q[26],q[41];
-ccx q[39],q[25],q[40];
-ccx q[38],q[24],q[39];
-ccx q[37],q[23],q[38];
-ccx q[36],q[22],q[37];
-ccx q[35],q[21],q[36];
-ccx q[34],q[20],q[35];
-ccx q[33],q[19],q[34];
-ccx q[32],q[18],q[33];
-ccx q[31],q[17],q[32];
-ccx q[16],q[15],q[31];
-x q[15];
-x q[17];
-x q[18];
-x q[19];
-x q[20];
-x q[21];
-x q[22];
-x q[23];
-x q[24];
-x q[25];
-x q[26];
-x q[27];
-x q[28];
-x q[29];
-cx q[0],q[15];
-cx q[1],q[17];
-cx q[2],q[19];
-cx q[3],q[21];
-cx q[4],q[23];
-cx q[5],q[25];
-cx q[6],q[27];
-cx q[7],q[29];
-cx q[8],q[16];
-cx q[8],q[17];
-cx q[9],q[18];
-cx q[9],q[19];
-cx q[10],q[20];
-cx q[10],q[21];
-cx q[11],q[22];
-cx q[11],q[23];
-cx q[12],q[24];
-cx q[12],q[25];
-cx q[13],q[26];
-cx q[13],q[27];
-cx q[14],q[28];
-cx q[14],q[29];
-h q[0];
-h q[1];
-h q[2];
-h q[3];
-h q[4];
-h q[5];
-h q[6];
-h q[7];
-h q[8];
-h q[9];
-h q[10];
-h q[11];
-h q[12];
-h q[13];
-h q[14];
-x q[0];
-x q[1];
-x q[2];
-x q[3];
-x q[4];
-x q[5];
-x q[6];
-x q[7];
-x q[8];
-x q[9];
-x q[10];
-x q[11];
-x q[12];
-x q[13];
-x q[14];
-reset q[31];
-reset q[32];
-reset q[33];
-reset q[34];
-reset q[35];
-reset q[36];
-reset q[37];
-reset q[38];
-reset q[39];
-reset q[40];
-reset q[41];
-reset q[42];
-reset q[43];
-reset q[44];
-ccx q[1],q[0],q[31];
-ccx q[31],q[2],q[32];
-ccx q[32],q[3],q[33];
-ccx q[33],q[4],q[34];
-ccx q[34],q[5],q[35];
-ccx q[35],q[6],q[36];
-ccx q[36],q[7],q[37];
-ccx q[37],q[8],q[38];
-ccx q[38],q[9],q[39];
-ccx q[39],q[10],q[40];
-ccx q[40],q[11],q[41];
-ccx q[41],q[12],q[42];
-ccx q[42],q[13],q[43];
-ccx q[43],q[14],q[44];
-z q[44];
-ccx q[43],q[14],q[44];
-ccx q[42],q[13],q[43];
-ccx q[41],q[12],q[42];
-ccx q[40],q[11],q[41];
-ccx q[39],q[10],q[40];
-ccx q[38],q[9],q[39];
-ccx q[37],q[8],q[38];
-ccx q[36],q[7],q[37];
-ccx q[35],q[6],q[36];
-ccx q[34],q[5],q[35];
-ccx q[33],q[4],q[34];
-ccx q[32],q[3],q[33];
-ccx q[31],q[2],q[32];
-ccx q[1],q[0],q[31];
-x q[0];
-x q[1];
-x q[2];
-x q[3];
-x q[4];
-x q[5];
-x q[6];
-x q[7];
-x q[8];
-x q[9];
-x q[10];
-x q[11];
-x q[12];
-x q[13];
-x q[14];
-h q[0];
-h q[1];
-h q[2];
-h q[3];
-h q[4];
-h q[5];
-h q[6];
-h q[7];
-h q[8];
-h q[9];
-h q[10];
-h q[11];
-h q[12];
-h q[13];
-h q[14];
-cx q[0],q[15];
-cx q[1],q[17];
-cx q[2],q[19];
-cx q[3],q[21];
-cx q[4],q[23];
-cx q[5],q[25];
-cx q[6],q[27];
-cx q[7],q[29];
-cx q[8],q[16];
-cx q[8],q[17];
-cx q[9],q[18];
-cx q[9],q[19];
-cx q[10],q[20];
-cx q[10],q[21];
-cx q[11],q[22];
-cx q[11],q[23];
-cx q[12],q[24];
-cx q[12],q[25];
-cx q[13],q[26];
-cx q[13],q[27];
-cx q[14],q[28];
-cx q[14],q[29];
-x q[15];
-x q[17];
-x q[18];
-x q[19];
-x q[20];
-x q[21];
-x q[22];
-x q[23];
-x q[24];
-x q[25];
-x q[26];
-x q[27];
-x q[28];
-x q[29];
-reset q[31];
-reset q[32];
-reset q[33];
-reset q[34];
-reset q[35];
-reset q[36];
-reset q[37];
-reset q[38];
-reset q[39];
-reset q[40];
-reset q[41];
-reset q[42];
-reset q[43];
-reset q[44];
-ccx q[16],q[15],q[31];
-ccx q[31],q[17],q[32];
-ccx q[32],q[18],q[33];
-ccx q[33],q[19],q[34];
-ccx q[34],q[20],q[35];
-ccx q[35],q[21],q[36];
-ccx q[36],q[22],q[37];
-ccx q[37],q[23],q[38];
-ccx q[38],q[24],q[39];
-ccx q[39],q[25],q[40];
-ccx q[40],q[26],q[41];
-ccx q[41],q[27],q[42];
-ccx q[42],q[28],q[43];
-ccx q[43],q[29],q[44];
-z q[44];
-ccx q[43],q[29],q[44];
-ccx q[42],q[28],q[43];
-ccx q[41],q[27],q[42];
-ccx q[40],q[26],q[41];
-ccx q[39],q[25],q[40];
-ccx q[38],q[24],q[39];
-ccx q[37],q[23],q[38];
-ccx q[36],q[22],q[37];
-ccx q[35],q[21],q[36];
-ccx q[34],q[20],q[35];
-ccx q[33],q[19],q[34];
-ccx q[32],q[18],q[33];
-ccx q[31],q[17],q[32];
-ccx q[16],q[15],q[31];
-x q[15];
-x q[17];
-x q[18];
-x q[19];
-x q[20];
-x q[21];
-x q[22];
-x q[23];
-x q[24];
-x q[25];
-x q[26];
-x q[27];
-x q[28];
-x q[29];
-cx q[0],q[15];
-cx q[1],q[17];
-cx q[2],q[19];
-cx q[3],q[21];
-cx q[4],q[23];
-cx q[5],q[25];
-cx q[6],q[27];
-cx q[7],q[29];
-cx q[8],q[16];
-cx q[8],q[17];
-cx q[9],q[18];
-cx q[9],q[19];
-cx q[10],q[20];
-cx q[10],q[21];
-cx q[11],q[22];
-cx q[11],q[23];
-cx q[12],q[24];
-cx q[12],q[25];
-cx q[13],q[26];
-cx q[13],q[27];
-cx q[14],q[28];
-cx q[14],q[29];
-h q[0];
-h q[1];
-h q[2];
-h q[3];
-h q[4];
-h q[5];
-h q[6];
-h q[7];
-h q[8];
-h q[9];
-h q[10];
-h q[11];
-h q[12];
-h q[13];
-h q[14];
-x q[0];
-x q[1];
-x q[2];
-x q[3];
-x q[4];
-x q[5];
-x q[6];
-x q[7];
-x q[8];
-x q[9];
-x q[10];
-x q[11];
-x q[12];
-x q[13];
-x q[14];
-reset q[31];
-reset q[32];
-reset q[33];
-reset q[34];
-reset q[35];
-reset q[36];
-reset q[37];
-reset q[38];
-reset q[39];
-reset q[40];
-reset q[41];
-reset q[42];
-reset q[43];
-reset q[44];
-ccx q[1],q[0],q[31];
-ccx q[31],q[2],q[32];
-ccx q[32],q[3],q[33];
-ccx q[33],q[4],q[34];
-ccx q[34],q[5],q[35];
-ccx q[35],q[6],q[36];
-ccx q[36],q[7],q[37];
-ccx q[37],q[8],q[38];
-ccx q[38],q[9],q[39];
-ccx q[39],q[10],q[40];
-ccx q[40],q[11],q[41];
-ccx q[41],q[12],q[42];
-ccx q[42],q[13],q[43];
-ccx q[43],q[14],q[44];
-z q[44];
-ccx q[43],q[14],q[44];
-ccx q[42],q[13],q[43];
-ccx q[41],q[12],q[42];
-ccx q[40],q[11],q[41];
-ccx q[39],q[10],q[40];
-ccx q[38],q[9],q[39];
-ccx q[37],q[8],q[38];
-ccx q[36],q[7],q[37];
-ccx q[35],q[6],q[36];
-ccx q[34],q[5],q[35];
-ccx q[33],q[4],q[34];
-ccx q[32],q[3],q[33];
-ccx q[31],q[2],q[32];
-ccx q[1],q[0],q[31];
-x q[0];
-x q[1];
-x q[2];
-x q[3];
-x q[4];
-x q[5];
-x q[6];
-x q[7];
-x q[8];
-x q[9];
-x q[10];
-x q[11];
-x q[12];
-x q[13];
-x q[14];
-h q[0];
-h q[1];
-h q[2];
-h q[3];
-h q[4];
-h q[5];
-h q[6];
-h q[7];
-h q[8];
-h q[9];
-h q[10];
-h q[11];
-h q[12];
-h q[13];
-h q[14];
-cx q[0],q[15];
-cx q[1],q[17];
-cx q[2],q[19];
-cx q[3],q[21];
-cx q[4],q[23];
-cx q[5],q[25];
-cx q[6],q[27];
-cx q[7],q[29];
-cx q[8],q[16];
-cx q[8],q[17];
-cx q[9],q[18];
-cx q[9],q[19];
-cx q[10],q[20];
-cx q[10],q[21];
-cx q[11],q[22];
-cx q[11],q[23];
-cx q[12],q[24];
-cx q[12],q[25];
-cx q[13],q[26];
-cx q[13],q[27];
-cx q[14],q[28];
-cx q[14],q[29];
-x q[15];
-x q[17];
-x q[18];
-x q[19];
-x q[20];
-x q[21];
-x q[22];
-x q[23];
-x q[24];
-x q[25];
-x q[26];
-x q[27];
-x q[28];
-x q[29];
-reset q[31];
-reset q[32];
-reset q[33];
-reset q[34];
-reset q[35];
-reset q[36];
-reset q[37];
-reset q[38];
-reset q[39];
-reset q[40];
-reset q[41];
-reset q[42];
-reset q[43];
-reset q[44];
-ccx q[16],q[15],q[31];
-ccx q[31],q[17],q[32];
-ccx q[32],q[18],q[33];
-ccx q[33],q[19],q[34];
-ccx q[34],q[20],q[35];
-ccx q[35],q[21],q[36];
-ccx q[36],q[22],q[37];
-ccx q[37],q[23],q[38];
-ccx q[38],q[24],q[39];
-ccx q[39],q[25],q[40];
-ccx q[40],q[26],q[41];
-ccx q[41],q[27],q[42];
-ccx q[42],q[28],q[43];
-ccx q[43],q[29],q[44];
-z q[44];
-ccx q[43],q[29],q[44];
-ccx q[42],q[28],q[43];
-ccx q[41],q[27],q[42];
-ccx q[40],q[26],q[41];
-ccx q[39],q[25],q[40];
-ccx q[38],q[24],q[39];
-ccx q[37],q[23],q[38];
-ccx q[36],q[22],q[37];
-ccx q[35],q[21],q[36];
-ccx q[34],q[20],q[35];
-ccx q[33],q[19],q[34];
-ccx q[32],q[18],q[33];
-ccx q[31],q[17],q[32];
-ccx q[16],q[15],q[31];
-x q[15];
-x q[17];
-x q[18];
-x q[19];
-x q[20];
-x q[21];
-x q[22];
-x q[23];
-x q[24];
-x q[25];
-x q[26];
-x q[27];
-x q[28];
-x q[29];
-cx q[0],q[15];
-cx q[1],q[17];
-cx q[2],q[19];
-cx q[3],q[21];
-cx q[4],q[23];
-cx q[5],q[25];
-cx q[6],q[27];
-cx q[7],q[29];
-cx q[8],q[16];
-cx q[8],q[17];
-cx q[9],q[18];
-cx q[9],q[19];
-cx q[10],q[20];
-cx q[10],q[21];
-cx q[11],q[22];
-cx q[11],q[23];
-cx q[12],q[24];
-cx q[12],q[25];
-cx q[13],q[26];
-cx q[13],q[27];
-cx q[14],q[28];
-cx q[14],q[29];
-h q[0];
-h q[1];
-h q[2];
-h q[3];
-h q[4];
-h q[5];
-h q[6];
-h q[7];
-h q[8];
-h q[9];
-h q[10];
-h q[11];
-h q[12];
-h q[13];
-h q[14];
-x q[0];
-x q[1];
-x q[2];
-x q[3];
-x q[4];
-x q[5];
-x q[6];
-x q[7];
-x q[8];
-x q[9];
-x q[10];
-x q[11];
-x q[12];
-x q[13];
-x q[14];
-reset q[31];
-reset q[32];
-reset q[33];
-reset q[34];
-reset q[35];
-reset q[36];
-reset q[37];
-reset q[38];
-reset q[39];
-reset q[40];
-reset q[41];
-reset q[42];
-reset q[43];
-reset q[44];
-ccx q[1],q[0],q[31];
-ccx q[31],q[2],q[32];
-ccx q[32],q[3],q[33];
-ccx q[33],q[4],q[34];
-ccx q[34],q[5],q[35];
-ccx q[35],q[6],q[36];
-ccx q[36],q[7],q[37];
-ccx q[37],q[8],q[38];
-ccx q[38],q[9],q[39];
-ccx q[39],q[10],q[40];
-ccx q[40],q[11],q[41];
-ccx q[41],q[12],q[42];
-ccx q[42],q[13],q[43];
-ccx q[43],q[14],q[44];
-z q[44];
-ccx q[43],q[14],q[44];
-ccx q[42],q[13],q[43];
-ccx q[41],q[12],q[42];
-ccx q[40],q[11],q[41];
-ccx q[39],q[10],q[40];
-ccx q[38],q[9],q[39];
-ccx q[37],q[8],q[38];
-ccx q[36],q[7],q[37];
-ccx q[35],q[6],q[36];
-ccx q[34],q[5],q[35];
-ccx q[33],q[4],q[34];
-ccx q[32],q[3],q[33];
-ccx q[31],q[2],q[32];
-ccx q[1],q[0],q[31];
-x q[0];
-x q[1];
-x q[2];
-x q[3];
-x q[4];
-x q[5];
-x q[6];
-x q[7];
-x q[8];
-x q[9];
-x q[10];
-x q[11];
-x q[12];
-x q[13];
-x q[14];
-h q[0];
-h q[1];
-h q[2];
-h q[3];
-h q[4];
-h q[5];
-h q[6];
-h q[7];
-h q[8];
-h q[9];
-h q[10];
-h q[11];
-h q[12];
-h q[13];
-h q[14];
-cx q[0],q[15];
-cx q[1],q[17];
-cx q[2],q[19];
-cx q[3],q[21];
-cx q[4],q[23];
-cx q[5],q[25];
-cx q[6],q[27];
-cx q[7],q[29];
-cx q[8],q[16];
-cx q[8],q[17];
-cx q[9],q[18];
-cx q[9],q[19];
-cx q[10],q[20];
-cx q[10],q[21];
-cx q[11],q[22];
-cx q[11],q[23];
-cx q[12],q[24];
-cx q[12],q[25];
-cx q[13],q[26];
-cx q[13],q[27];
-cx q[14],q[28];
-cx q[14],q[29];
-x q[15];
-x q[17];
-x q[18];
-x q[19];
-x q[20];
-x q[21];
-x q[22];
-x q[23];
-x q[24];
-x q[25];
-x q[26];
-x q[27];
-x q[28];
-x q[29];
-reset q[31];
-reset q[32];
-reset q[33];
-reset q[34];
-reset q[35];
-reset q[36];
-reset q[37];
-reset q[38];
-reset q[39];
-reset q[40];
-reset q[41];
-reset q[42];
-reset q[43];
-reset q[44];
-ccx q[16],q[15],q[31];
-ccx q[31],q[17],q[32];
-ccx q[32],q[18],q[33];
-ccx q[33],q[19],q[34];
-ccx q[34],q[20],q[35];
-ccx q[35],q[21],q[36];
-ccx q[36],q[22],q[37];
-ccx q[37],q[23],q[38];
-ccx q[38],q[24],q[39];
-ccx q[39],q[25],q[40];
-ccx q[40],q[26],q[41];
-ccx q[41],q[27],q[42];
-ccx q[42],q[28],q[43];
-ccx q[43],q[29],q[44];
-z q[44];
-ccx q[43],q[29],q[44];
-ccx q[42],q[28],q[43];
-ccx q[41],q[27],q[42];
-ccx q[40],q[26],q[41];
-ccx q[39],q[25],q[40];
-ccx q[38],q[24],q[39];
-ccx q[37],q[23],q[38];
-ccx q[36],q[22],q[37];
-ccx q[35],q[21],q[36];
-ccx q[34],q[20],q[35];
-ccx q[33],q[19],q[34];
-ccx q[32],q[18],q[33];
-ccx q[31],q[17],q[32];
-ccx q[16],q[15],q[31];
-x q[15];
-x q[17];
-x q[18];
-x q[19];
-x q[20];
-x q[21];
-x q[22];
-x q[23];
-x q[24];
-x q[25];
-x q[26];
-x q[27];
-x q[28];
-x q[29];
-cx q[0],q[15];
-cx q[1],q[17];
-cx q[2],q[19];
-cx q[3],q[21];
-cx q[4],q[23];
-cx q[5],q[25];
-cx q[6],q[27];
-cx q[7],q[29];
-cx q[8],q[16];
-cx q[8],q[17];
-cx q[9],q[18];
-cx q[9],q[19];
-cx q[10],q[20];
-cx q[10],q[21];
-cx q[11],q[22];
-cx q[11],q[23];
-cx q[12],q[24];
-cx q[12],q[25];
-cx q[13],q[26];
-cx q[13],q[27];
-cx q[14],q[28];
-cx q[14],q[29];
-h q[0];
-h q[1];
-h q[2];
-h q[3];
-h q[4];
-h q[5];
-h q[6];
-h q[7];
-h q[8];
-h q[9];
-h q[10];
-h q[11];
-h q[12];
-h q[13];
-h q[14];
-x q[0];
-x q[1];
-x q[2];
-x q[3];
-x q[4];
-x q[5];
-x q[6];
-x q[7];
-x q[8];
-x q[9];
-x q[10];
-x q[11];
-x q[12];
-x q[13];
-x q[14];
-reset q[31];
-reset q[32];
-reset q[33];
-reset q[34];
-reset q[35];
-reset q[36];
-reset q[37];
-reset q[38];
-reset q[39];
-reset q[40];
-reset q[41];
-reset q[42];
-reset q[43];
-reset q[44];
-ccx q[1],q[0],q[31];
-ccx q[31],q[2],q[32];
-ccx q[32],q[3],q[33];
-ccx q[33],q[4],q[34];
-ccx q[34],q[5],q[35];
-ccx q[35],q[6],q[36];
-ccx q[36],q[7],q[37];
-ccx q[37],q[8],q[38];
-ccx q[38],q[9],q[39];
-ccx q[39],q[10],q[40];
-ccx q[40],q[11],q[41];
-ccx q[41],q[12],q[42];
-ccx q[42],q[13],q[43];
-ccx q[43],q[14],q[44];
-z q[44];
-ccx q[43],q[14],q[44];
-ccx q[42],q[13],q[43];
-ccx q[41],q[12],q[42];
-ccx q[40],q[11],q[41];
-ccx q[39],q[10],q[40];
-ccx q[38],q[9],q[39];
-ccx q[37],q[8],q[38];
-ccx q[36],q[7],q[37];
-ccx q[35],q[6],q[36];
-ccx q[34],q[5],q[35];
-ccx q[33],q[4],q[34];
-ccx q[32],q[3],q[33];
-ccx q[31],q[2],q[32];
-ccx q[1],q[0],q[31];
-x q[0];
-x q[1];
-x q[2];
-x q[3];
-x q[4];
-x q[5];
-x q[6];
-x q[7];
-x q[8];
-x q[9];
-x q[10];
-x q[11];
-x q[12];
-x q[13];
-x q[14];
-h q[0];
-h q[1];
-h q[2];
-h q[3];
-h q[4];
-h q[5];
-h q[6];
-h q[7];
-h q[8];
-h q[9];
-h q[10];
-h q[11];
-h q[12];
-h q[13];
-h q[14];
-cx q[0],q[15];
-cx q[1],q[17];
-cx q[2],q[19];
-cx q[3],q[21];
-cx q[4],q[23];
-cx q[5],q[25];
-cx q[6],q[27];
-cx q[7],q[29];
-cx q[8],q[16];
-cx q[8],q[17];
-cx q[9],q[18];
-cx q[9],q[19];
-cx q[10],q[20];
-cx q[10],q[21];
-cx q[11],q[22];
-cx q[11],q[23];
-cx q[12],q[24];
-cx q[12],q[25];
-cx q[13],q[26];
-cx q[13],q[27];
-cx q[14],q[28];
-cx q[14],q[29];
-x q[15];
-x q[17];
-x q[18];
-x q[19];
-x q[20];
-x q[21];
-x q[22];
-x q[23];
-x q[24];
-x q[25];
-x q[26];
-x q[27];
-x q[28];
-x q[29];
-reset q[31];
-reset q[32];
-reset q[33];
-reset q[34];
-reset q[35];
-reset q[36];
-reset q[37];
-reset q[38];
-reset q[39];
-reset q[40];
-reset q[41];
-reset q[42];
-reset q[43];
-reset q[44];
-ccx q[16],q[15],q[31];
-ccx q[31],q[17],q[32];
-ccx q[32],q[18],q[33];
-ccx q[33],q[19],q[34];
-ccx q[34],q[20],q[35];
-ccx q[35],q[21],q[36];
-ccx q[36],q[22],q[37];
-ccx q[37],q[23],q[38];
-ccx q[38],q[24],q[39];
-ccx q[39],q[25],q[40];
-ccx q[40],q[26],q[41];
-ccx q[41],q[27],q[42];
-ccx q[42],q[28],q[43];
-ccx q[43],q[29],q[44];
-z q[44];
-ccx q[43],q[29],q[44];
-ccx q[42],q[28],q[43];
-ccx q[41],q[27],q[42];
-ccx q[40],q[26],q[41];
-ccx q[39],q[25],q[40];
-ccx q[38],q[24],q[39];
-ccx q[37],q[23],q[38];
-ccx q[36],q[22],q[37];
-ccx q[35],q[21],q[36];
-ccx q[34],q[20],q[35];
-ccx q[33],q[19],q[34];
-ccx q[32],q[18],q[33];
-ccx q[31],q[17],q[32];
-ccx q[16],q[15],q[31];
-x q[15];
-x q[17];
-x q[18];
-x q[19];
-x q[20];
-x q[21];
-x q[22];
-x q[23];
-x q[24];
-x q[25];
-x q[26];
-x q[27];
-x q[28];
-x q[29];
-cx q[0],q[15];
-cx q[1],q[17];
-cx q[2],q[19];
-cx q[3],q[21];
-cx q[4],q[23];
-cx q[5],q[25];
-cx q[6],q[27];
-cx q[7],q[29];
-cx q[8],q[16];
-cx q[8],q[17];
-cx q[9],q[18];
-cx q[9],q[19];
-cx q[10],q[20];
-cx q[10],q[21];
-cx q[11],q[22];
-cx q[11],q[23];
-cx q[12],q[24];
-cx q[12],q[25];
-cx q[13],q[26];
-cx q[13],q[27];
-cx q[14],q[28];
-cx q[14],q[29];
-h q[0];
-h q[1];
-h q[2];
-h q[3];
-h q[4];
-h q[5];
-h q[6];
-h q[7];
-h q[8];
-h q[9];
-h q[10];
-h q[11];
-h q[12];
-h q[13];
-h q[14];
-x q[0];
-x q[1];
-x q[2];
-x q[3];
-x q[4];
-x q[5];
-x q[6];
-x q[7];
-x q[8];
-x q[9];
-x q[10];
-x q[11];
-x q[12];
-x q[13];
-x q[14];
-reset q[31];
-reset q[32];
-reset q[33];
-reset q[34];
-reset q[35];
-reset q[36];
-reset q[37];
-reset q[38];
-reset q[39];
-reset q[40];
-reset q[41];
-reset q[42];
-reset q[43];
-reset q[44];
-ccx q[1],q[0],q[31];
-ccx q[31],q[2],q[32];
-ccx q[32],q[3],q[33];
-ccx q[33],q[4],q[34];
-ccx q[34],q[5],q[35];
-ccx q[35],q[6],q[36];
-ccx q[36],q[7],q[37];
-ccx q[37],q[8],q[38];
-ccx q[38],q[9],q[39];
-ccx q[39],q[10],q[40];
-ccx q[40],q[11],q[41];
-ccx q[41],q[12],q[42];
-ccx q[42],q[13],q[43];
-ccx q[43],q[14],q[44];
-z q[44];
-ccx q[43],q[14],q[44];
-ccx q[42],q[13],q[43];
-ccx q[41],q[12],q[42];
-ccx q[40],q[11],q[41];
-ccx q[39],q[10],q[40];
-ccx q[38],q[9],q[39];
-ccx q[37],q[8],q[38];
-ccx q[36],q[7],q[37];
-ccx q[35],q[6],q[36];
-ccx q[34],q[5],q[35];
-ccx q[33],q[4],q[34];
-ccx q[32],q[3],q[33];
-ccx q[31],q[2],q[32];
-ccx q[1],q[0],q[31];
-x q[0];
-x q[1];
-x q[2];
-x q[3];
-x q[4];
-x q[5];
-x q[6];
-x q[7];
-x q[8];
-x q[9];
-x q[10];
-x q[11];
-x q[12];
-x q[13];
-x q[14];
-h q[0];
-h q[1];
-h q[2];
-h q[3];
-h q[4];
-h q[5];
-h q[6];
-h q[7];
-h q[8];
-h q[9];
-h q[10];
-h q[11];
-h q[12];
-h q[13];
-h q[14];
-cx q[0],q[15];
-cx q[1],q[17];
-cx q[2],q[19];
-cx q[3],q[21];
-cx q[4],q[23];
-cx q[5],q[25];
-cx q[6],q[27];
-cx q[7],q[29];
-cx q[8],q[16];
-cx q[8],q[17];
-cx q[9],q[18];
-cx q[9],q[19];
-cx q[10],q[20];
-cx q[10],q[21];
-cx q[11],q[22];
-cx q[11],q[23];
-cx q[12],q[24];
-cx q[12],q[25];
-cx q[13],q[26];
-cx q[13],q[27];
-cx q[14],q[28];
-cx q[14],q[29];
-x q[15];
-x q[17];
-x q[18];
-x q[19];
-x q[20];
-x q[21];
-x q[22];
-x q[23];
-x q[24];
-x q[25];
-x q[26];
-x q[27];
-x q[28];
-x q[29];
-reset q[31];
-reset q[32];
-reset q[33];
-reset q[34];
-reset q[35];
-reset q[36];
-reset q[37];
-reset q[38];
-reset q[39];
-reset q[40];
-reset q[41];
-reset q[42];
-reset q[43];
-reset q[44];
-ccx q[16],q[15],q[31];
-ccx q[31],q[17],q[32];
-ccx q[32],q[18],q[33];
-ccx q[33],q[19],q[34];
-ccx q[34],q[20],q[35];
-ccx q[35],q[21],q[36];
-ccx q[36],q[22],q[37];
-ccx q[37],q[23],q[38];
-ccx q[38],q[24],q[39];
-ccx q[39],q[25],q[40];
-ccx q[40],q[26],q[41];
-ccx q[41],q[27],q[42];
-ccx q[42],q[28],q[43];
-ccx q[43],q[29],q[44];
-z q[44];
-ccx q[43],q[29],q[44];
-ccx q[42],q[28],q[43];
-ccx q[41],q[27],q[42];
-ccx q[40],q[26],q[41];
-ccx q[39],q[25],q[40];
-ccx q[38],q[24],q[39];
-ccx q[37],q[23],q[38];
-ccx q[36],q[22],q[37];
-ccx q[35],q[21],q[36];
-ccx q[34],q[20],q[35];
-ccx q[33],q[19],q[34];
-ccx q[32],q[18],q[33];
-ccx q[31],q[17],q[32];
-ccx q[16],q[15],q[31];
-x q[15];
-x q[17];
-x q[18];
-x q[19];
-x q[20];
-x q[21];
-x q[22];
-x q[23];
-x q[24];
-x q[25];
-x q[26];
-x q[27];
-x q[28];
-x q[29];
-cx q[0],q[15];
-cx q[1],q[17];
-cx q[2],q[19];
-cx q[3],q[21];
-cx q[4],q[23];
-cx q[5],q[25];
-cx q[6],q[27];
-cx q[7],q[29];
-cx q[8],q[16];
-cx q[8],q[17];
-cx q[9],q[18];
-cx q[9],q[19];
-cx q[10],q[20];
-cx q[10],q[21];
-cx q[11],q[22];
-cx q[11],q[23];
-cx q[12],q[24];
-cx q[12],q[25];
-cx q[13],q[26];
-cx q[13],q[27];
-cx q[14],q[28];
-cx q[14],q[29];
-h q[0];
-h q[1];
-h q[2];
-h q[3];
-h q[4];
-h q[5];
-h q[6];
-h q[7];
-h q[8];
-h q[9];
-h q[10];
-h q[11];
-h q[12];
-h q[13];
-h q[14];
-x q[0];
-x q[1];
-x q[2];
-x q[3];
-x q[4];
-x q[5];
-x q[6];
-x q[7];
-x q[8];
-x q[9];
-x q[10];
-x q[11];
-x q[12];
-x q[13];
-x q[14];
-reset q[31];
-reset q[32];
-reset q[33];
-reset q[34];
-reset q[35];
-reset q[36];
-reset q[37];
-reset q[38];
-reset q[39];
-reset q[40];
-reset q[41];
-reset q[42];
-reset q[43];
-reset q[44];
-ccx q[1],q[0],q[31];
-ccx q[31],q[2],q[32];
-ccx q[32],q[3],q[33];
-ccx q[33],q[4],q[34];
-ccx q[34],q[5],q[35];
-ccx q[35],q[6],q[36];
-ccx q[36],q[7],q[37];
-ccx q[37],q[8],q[38];
-ccx q[38],q[9],q[39];
-ccx q[39],q[10],q[40];
-ccx q[40],q[11],q[41];
-ccx q[41],q[12],q[42];
-ccx q[42],q[13],q[43];
-ccx q[43],q[14],q[44];
-z q[44];
-ccx q[43],q[14],q[44];
-ccx q[42],q[13],q[43];
-ccx q[41],q[12],q[42];
-ccx q[40],q[11],q[41];
-ccx q[39],q[10],q[40];
-ccx q[38],q[9],q[39];
-ccx q[37],q[8],q[38];
-ccx q[36],q[7],q[37];
-ccx q[35],q[6],q[36];
-ccx q[34],q[5],q[35];
-ccx q[33],q[4],q[34];
-ccx q[32],q[3],q[33];
-ccx q[31],q[2],q[32];
-ccx q[1],q[0],q[31];
-x q[0];
-x q[1];
-x q[2];
-x q[3];
-x q[4];
-x q[5];
-x q[6];
-x q[7];
-x q[8];
-x q[9];
-x q[10];
-x q[11];
-x q[12];
-x q[13];
-x q[14];
-h q[0];
-h q[1];
-h q[2];
-h q[3];
-h q[4];
-h q[5];
-h q[6];
-h q[7];
-h q[8];
-h q[9];
-h q[10];
-h q[11];
-h q[12];
-h q[13];
-h q[14];
-cx q[0],q[15];
-cx q[1],q[17];
-cx q[2],q[19];
-cx q[3],q[21];
-cx q[4],q[23];
-cx q[5],q[25];
-cx q[6],q[27];
-cx q[7],q[29];
-cx q[8],q[16];
-cx q[8],q[17];
-cx q[9],q[18];
-cx q[9],q[19];
-cx q[10],q[20];
-cx q[10],q[21];
-cx q[11],q[22];
-cx q[11],q[23];
-cx q[12],q[24];
-cx q[12],q[25];
-cx q[13],q[26];
-cx q[13],q[27];
-cx q[14],q[28];
-cx q[14],q[29];
-x q[15];
-x q[17];
-x q[18];
-x q[19];
-x q[20];
-x q[21];
-x q[22];
-x q[23];
-x q[24];
-x q[25];
-x q[26];
-x q[27];
-x q[28];
-x q[29];
-reset q[31];
-reset q[32];
-reset q[33];
-reset q[34];
-reset q[35];
-reset q[36];
-reset q[37];
-reset q[38];
-reset q[39];
-reset q[40];
-reset q[41];
-reset q[42];
-reset q[43];
-reset q[44];
-ccx q[16],q[15],q[31];
-ccx q[31],q[17],q[32];
-ccx q[32],q[18],q[33];
-ccx q[33],q[19],q[34];
-ccx q[34],q[20],q[35];
-ccx q[35],q[21],q[36];
-ccx q[36],q[22],q[37];
-ccx q[37],q[23],q[38];
-ccx q[38],q[24],q[39];
-ccx q[39],q[25],q[40];
-ccx q[40],q[26],q[41];
-ccx q[41],q[27],q[42];
-ccx q[42],q[28],q[43];
-ccx q[43],q[29],q[44];
-z q[44];
-ccx q[43],q[29],q[44];
-ccx q[42],q[28],q[43];
-ccx q[41],q[27],q[42];
-ccx q[40],q[26],q[41];
-ccx q[39],q[25],q[40];
-ccx q[38],q[24],q[39];
-ccx q[37],q[23],q[38];
-ccx q[36],q[22],q[37];
-ccx q[35],q[21],q[36];
-ccx q[34],q[20],q[35];
-ccx q[33],q[19],q[34];
-ccx q[32],q[18],q[33];
-ccx q[31],q[17],q[32];
-ccx q[16],q[15],q[31];
-x q[15];
-x q[17];
-x q[18];
-x q[19];
-x q[20];
-x q[21];
-x q[22];
-x q[23];
-x q[24];
-x q[25];
-x q[26];
-x q[27];
-x q[28];
-x q[29];
-cx q[0],q[15];
-cx q[1],q[17];
-cx q[2],q[19];
-cx q[3],q[21];
-cx q[4],q[23];
-cx q[5],q[25];
-cx q[6],q[27];
-cx q[7],q[29];
-cx q[8],q[16];
-cx q[8],q[17];
-cx q[9],q[18];
-cx q[9],q[19];
-cx q[10],q[20];
-cx q[10],q[21];
-cx q[11],q[22];
-cx q[11],q[23];
-cx q[12],q[24];
-cx q[12],q[25];
-cx q[13],q[26];
-cx q[13],q[27];
-cx q[14],q[28];
-cx q[14],q[29];
-h q[0];
-h q[1];
-h q[2];
-h q[3];
-h q[4];
-h q[5];
-h q[6];
-h q[7];
-h q[8];
-h q[9];
-h q[10];
-h q[11];
-h q[12];
-h q[13];
-h q[14];
-x q[0];
-x q[1];
-x q[2];
-x q[3];
-x q[4];
-x q[5];
-x q[6];
-x q[7];
-x q[8];
-x q[9];
-x q[10];
-x q[11];
-x q[12];
-x q[13];
-x q[14];
-reset q[31];
-reset q[32];
-reset q[33];
-reset q[34];
-reset q[35];
-reset q[36];
-reset q[37];
-reset q[38];
-reset q[39];
-reset q[40];
-reset q[41];
-reset q[42];
-reset q[43];
-reset q[44];
-ccx q[1],q[0],q[31];
-ccx q[31],q[2],q[32];
-ccx q[32],q[3],q[33];
-ccx q[33],q[4],q[34];
-ccx q[34],q[5],q[35];
-ccx q[35],q[6],q[36];
-ccx q[36],q[7],q[37];
-ccx q[37],q[8],q[38];
-ccx q[38],q[9],q[39];
-ccx q[39],q[10],q[40];
-ccx q[40],q[11],q[41];
-ccx q[41],q[12],q[42];
-ccx q[42],q[13],q[43];
-ccx q[43],q[14],q[44];
-z q[44];
-ccx q[43],q[14],q[44];
-ccx q[42],q[13],q[43];
-ccx q[41],q[12],q[42];
-ccx q[40],q[11],q[41];
-ccx q[39],q[10],q[40];
-ccx q[38],q[9],q[39];
-ccx q[37],q[8],q[38];
-ccx q[36],q[7],q[37];
-ccx q[35],q[6],q[36];
-ccx q[34],q[5],q[35];
-ccx q[33],q[4],q[34];
-ccx q[32],q[3],q[33];
-ccx q[31],q[2],q[32];
-ccx q[1],q[0],q[31];
-x q[0];
-x q[1];
-x q[2];
-x q[3];
-x q[4];
-x q[5];
-x q[6];
-x q[7];
-x q[8];
-x q[9];
-x q[10];
-x q[11];
-x q[12];
-x q[13];
-x q[14];
-h q[0];
-h q[1];
-h q[2];
-h q[3];
-h q[4];
-h q[5];
-h q[6];
-h q[7];
-h q[8];
-h q[9];
-h q[10];
-h q[11];
-h q[12];
-h q[13];
-h q[14];
-cx q[0],q[15];
-cx q[1],q[17];
-cx q[2],q[19];
-cx q[3],q[21];
-cx q[4],q[23];
-cx q[5],q[25];
-cx q[6],q[27];
-cx q[7],q[29];
-cx q[8],q[16];
-cx q[8],q[17];
-cx q[9],q[18];
-cx q[9],q[19];
-cx q[10],q[20];
-cx q[10],q[21];
-cx q[11],q[22];
-cx q[11],q[23];
-cx q[12],q[24];
-cx q[12],q[25];
-cx q[13],q[26];
-cx q[13],q[27];
-cx q[14],q[28];
-cx q[14],q[29];
-x q[15];
-x q[17];
-x q[18];
-x q[19];
-x q[20];
-x q[21];
-x q[22];
-x q[23];
-x q[24];
-x q[25];
-x q[26];
-x q[27];
-x q[28];
-x q[29];
-reset q[31];
-reset q[32];
-reset q[33];
-reset q[34];
-reset q[35];
-reset q[36];
-reset q[37];
-reset q[38];
-reset q[39];
-reset q[40];
-reset q[41];
-reset q[42];
-reset q[43];
-reset q[44];
-ccx q[16],q[15],q[31];
-ccx q[31],q[17],q[32];
-ccx q[32],q[18],q[33];
-ccx q[33],q[19],q[34];
-ccx q[34],q[20],q[35];
-ccx q[35],q[21],q[36];
-ccx q[36],q[22],q[37];
-ccx q[37],q[23],q[38];
-ccx q[38],q[24],q[39];
-ccx q[39],q[25],q[40];
-ccx q[40],q[26],q[41];
-ccx q[41],q[27],q[42];
-ccx q[42],q[28],q[43];
-ccx q[43],q[29],q[44];
-z q[44];
-ccx q[43],q[29],q[44];
-ccx q[42],q[28],q[43];
-ccx q[41],q[27],q[42];
-ccx q[40],q[26],q[41];
-ccx q[39],q[25],q[40];
-ccx q[38],q[24],q[39];
-ccx q[37],q[23],q[38];
-ccx q[36],q[22],q[37];
-ccx q[35],q[21],q[36];
-ccx q[34],q[20],q[35];
-ccx q[33],q[19],q[34];
-ccx q[32],q[18],q[33];
-ccx q[31],q[17],q[32];
-ccx q[16],q[15],q[31];
-x q[15];
-x q[17];
-x q[18];
-x q[19];
-x q[20];
-x q[21];
-x q[22];
-x q[23];
-x q[24];
-x q[25];
-x q[26];
-x q[27];
-x q[28];
-x q[29];
-cx q[0],q[15];
-cx q[1],q[17];
-cx q[2],q[19];
-cx q[3],q[21];
-cx q[4],q[23];
-cx q[5],q[25];
-cx q[6],q[27];
-cx q[7],q[29];
-cx q[8],q[16];
-cx q[8],q[17];
-cx q[9],q[18];
-cx q[9],q[19];
-cx q[10],q[20];
-cx q[10],q[21];
-cx q[11],q[22];
-cx q[11],q[23];
-cx q[12],q[24];
-cx q[12],q[25];
-cx q[13],q[26];
-cx q[13],q[27];
-cx q[14],q[28];
-cx q[14],q[29];
-h q[0];
-h q[1];
-h q[2];
-h q[3];
-h q[4];
-h q[5];
-h q[6];
-h q[7];
-h q[8];
-h q[9];
-h q[10];
-h q[11];
-h q[12];
-h q[13];
-h q[14];
-x q[0];
-x q[1];
-x q[2];
-x q[3];
-x q[4];
-x q[5];
-x q[6];
-x q[7];
-x q[8];
-x q[9];
-x q[10];
-x q[11];
-x q[12];
-x q[13];
-x q[14];
-reset q[31];
-reset q[32];
-reset q[33];
-reset q[34];
-reset q[35];
-reset q[36];
-reset q[37];
-reset q[38];
-reset q[39];
-reset q[40];
-reset q[41];
-reset q[42];
-reset q[43];
-reset q[44];
-ccx q[1],q[0],q[31];
-ccx q[31],q[2],q[32];
-ccx q[32],q[3],q[33];
-ccx q[33],q[4],q[34];
-ccx q[34],q[5],q[35];
-ccx q[35],q[6],q[36];
-ccx q[36],q[7],q[37];
-ccx q[37],q[8],q[38];
-ccx q[38],q[9],q[39];
-ccx q[39],q[10],q[40];
-ccx q[40],q[11],q[41];
-ccx q[41],q[12],q[42];
-ccx q[42],q[13],q[43];
-ccx q[43],q[14],q[44];
-z q[44];
-ccx q[43],q[14],q[44];
-ccx q[42],q[13],q[43];
-ccx q[41],q[12],q[42];
-ccx q[40],q[11],q[41];
-ccx q[39],q[10],q[40];
-ccx q[38],q[9],q[39];
-ccx q[37],q[8],q[38];
-ccx q[36],q[7],q[37];
-ccx q[35],q[6],q[36];
-ccx q[34],q[5],q[35];
-ccx q[33],q[4],q[34];
-ccx q[32],q[3],q[33];
-ccx q[31],q[2],q[32];
-ccx q[1],q[0],q[31];
-x q[0];
-x q[1];
-x q[2];
-x q[3];
-x q[4];
-x q[5];
-x q[6];
-x q[7];
-x q[8];
-x q[9];
-x q[10];
-x q[11];
-x q[12];
-x q[13];
-x q[14];
-h q[0];
-h q[1];
-h q[2];
-h q[3];
-h q[4];
-h q[5];
-h q[6];
-h q[7];
-h q[8];
-h q[9];
-h q[10];
-h q[11];
-h q[12];
-h q[13];
-h q[14];
-cx q[0],q[15];
-cx q[1],q[17];
-cx q[2],q[19];
-cx q[3],q[21];
-cx q[4],q[23];
-cx q[5],q[25];
-cx q[6],q[27];
-cx q[7],q[29];
-cx q[8],q[16];
-cx q[8],q[17];
-cx q[9],q[18];
-cx q[9],q[19];
-cx q[10],q[20];
-cx q[10],q[21];
-cx q[11],q[22];
-cx q[11],q[23];
-cx q[12],q[24];
-cx q[12],q[25];
-cx q[13],q[26];
-cx q[13],q[27];
-cx q[14],q[28];
-cx q[14],q[29];
-x q[15];
-x q[17];
-x q[18];
-x q[19];
-x q[20];
-x q[21];
-x q[22];
-x q[23];
-x q[24];
-x q[25];
-x q[26];
-x q[27];
-x q[28];
-x q[29];
-reset q[31];
-reset q[32];
-reset q[33];
-reset q[34];
-reset q[35];
-reset q[36];
-reset q[37];
-reset q[38];
-reset q[39];
-reset q[40];
-reset q[41];
-reset q[42];
-reset q[43];
-reset q[44];
-ccx q[16],q[15],q[31];
-ccx q[31],q[17],q[32];
-ccx q[32],q[18],q[33];
-ccx q[33],q[19],q[34];
-ccx q[34],q[20],q[35];
-ccx q[35],q[21],q[36];
-ccx q[36],q[22],q[37];
-ccx q[37],q[23],q[38];
-ccx q[38],q[24],q[39];
-ccx q[39],q[25],q[40];
-ccx q[40],q[26],q[41];
-ccx q[41],q[27],q[42];
-ccx q[42],q[28],q[43];
-ccx q[43],q[29],q[44];
-z q[44];
-ccx q[43],q[29],q[44];
-ccx q[42],q[28],q[43];
-ccx q[41],q[27],q[42];
-ccx q[40],q[26],q[41];
-ccx q[39],q[25],q[40];
-ccx q[38],q[24],q[39];
-ccx q[37],q[23],q[38];
-ccx q[36],q[22],q[37];
-ccx q[35],q[21],q[36];
-ccx q[34],q[20],q[35];
-ccx q[33],q[19],q[34];
-ccx q[32],q[18],q[33];
-ccx q[31],q[17],q[32];
-ccx q[16],q[15],q[31];
-x q[15];
-x q[17];
-x q[18];
-x q[19];
-x q[20];
-x q[21];
-x q[22];
-x q[23];
-x q[24];
-x q[25];
-x q[26];
-x q[27];
-x q[28];
-x q[29];
-cx q[0],q[15];
-cx q[1],q[17];
-cx q[2],q[19];
-cx q[3],q[21];
-cx q[4],q[23];
-cx q[5],q[25];
-cx q[6],q[27];
-cx q[7],q[29];
-cx q[8],q[16];
-cx q[8],q[17];
-cx q[9],q[18];
-cx q[9],q[19];
-cx q[10],q[20];
-cx q[10],q[21];
-cx q[11],q[22];
-cx q[11],q[23];
-cx q[12],q[24];
-cx q[12],q[25];
-cx q[13],q[26];
-cx q[13],q[27];
-cx q[14],q[28];
-cx q[14],q[29];
-h q[0];
-h q[1];
-h q[2];
-h q[3];
-h q[4];
-h q[5];
-h q[6];
-h q[7];
-h q[8];
-h q[9];
-h q[10];
-h q[11];
-h q[12];
-h q[13];
-h q[14];
-x q[0];
-x q[1];
-x q[2];
-x q[3];
-x q[4];
-x q[5];
-x q[6];
-x q[7];
-x q[8];
-x q[9];
-x q[10];
-x q[11];
-x q[12];
-x q[13];
-x q[14];
-reset q[31];
-reset q[32];
-reset q[33];
-reset q[34];
-reset q[35];
-reset q[36];
-reset q[37];
-reset q[38];
-reset q[39];
-reset q[40];
-reset q[41];
-reset q[42];
-reset q[43];
-reset q[44];
-ccx q[1],q[0],q[31];
-ccx q[31],q[2],q[32];
-ccx q[32],q[3],q[33];
-ccx q[33],q[4],q[34];
-ccx q[34],q[5],q[35];
-ccx q[35],q[6],q[36];
-ccx q[36],q[7],q[37];
-ccx q[37],q[8],q[38];
-ccx q[38],q[9],q[39];
-ccx q[39],q[10],q[40];
-ccx q[40],q[11],q[41];
-ccx q[41],q[12],q[42];
-ccx q[42],q[13],q[43];
-ccx q[43],q[14],q[44];
-z q[44];
-ccx q[43],q[14],q[44];
-ccx q[42],q[13],q[43];
-ccx q[41],q[12],q[42];
-ccx q[40],q[11],q[41];
-ccx q[39],q[10],q[40];
-ccx q[38],q[9],q[39];
-ccx q[37],q[8],q[38];
-ccx q[36],q[7],q[37];
-ccx q[35],q[6],q[36];
-ccx q[34],q[5],q[35];
-ccx q[33],q[4],q[34];
-ccx q[32],q[3],q[33];
-ccx q[31],q[2],q[32];
-ccx q[1],q[0],q[31];
-x q[0];
-x q[1];
-x q[2];
-x q[3];
-x q[4];
-x q[5];
-x q[6];
-x q[7];
-x q[8];
-x q[9];
-x q[10];
-x q[11];
-x q[12];
-x q[13];
-x q[14];
-h q[0];
-h q[1];
-h q[2];
-h q[3];
-h q[4];
-h q[5];
-h q[6];
-h q[7];
-h q[8];
-h q[9];
-h q[10];
-h q[11];
-h q[12];
-h q[13];
-h q[14];
-cx q[0],q[15];
-cx q[1],q[17];
-cx q[2],q[19];
-cx q[3],q[21];
-cx q[4],q[23];
-cx q[5],q[25];
-cx q[6],q[27];
-cx q[7],q[29];
-cx q[8],q[16];
-cx q[8],q[17];
-cx q[9],q[18];
-cx q[9],q[19];
-cx q[10],q[20];
-cx q[10],q[21];
-cx q[11],q[22];
-cx q[11],q[23];
-cx q[12],q[24];
-cx q[12],q[25];
-cx q[13],q[26];
-cx q[13],q[27];
-cx q[14],q[28];
-cx q[14],q[29];
-x q[15];
-x q[17];
-x q[18];
-x q[19];
-x q[20];
-x q[21];
-x q[22];
-x q[23];
-x q[24];
-x q[25];
-x q[26];
-x q[27];
-x q[28];
-x q[29];
-reset q[31];
-reset q[32];
-reset q[33];
-reset q[34];
-reset q[35];
-reset q[36];
-reset q[37];
-reset q[38];
-reset q[39];
-reset q[40];
-reset q[41];
-reset q[42];
-reset q[43];
-reset q[44];
-ccx q[16],q[15],q[31];
-ccx q[31],q[17],q[32];
-ccx q[32],q[18],q[33];
-ccx q[33],q[19],q[34];
-ccx q[34],q[20],q[35];
-ccx q[35],q[21],q[36];
-ccx q[36],q[22],q[37];
-ccx q[37],q[23],q[38];
-ccx q[38],q[24],q[39];
-ccx q[39],q[25],q[40];
-ccx q[40],q[26],q[41];
-ccx q[41],q[27],q[42];
-ccx q[42],q[28],q[43];
-ccx q[43],q[29],q[44];
-z q[44];
-ccx q[43],q[29],q[44];
-ccx q[42],q[28],q[43];
-ccx q[41],q[27],q[42];
-ccx q[40],q[26],q[41];
-ccx q[39],q[25],q[40];
-ccx q[38],q[24],q[39];
-ccx q[37],q[23],q[38];
-ccx q[36],q[22],q[37];
-ccx q[35],q[21],q[36];
-ccx q[34],q[20],q[35];
-ccx q[33],q[19],q[34];
-ccx q[32],q[18],q[33];
-ccx q[31],q[17],q[32];
-ccx q[16],q[15],q[31];
-x q[15];
-x q[17];
-x q[18];
-x q[19];
-x q[20];
-x q[21];
-x q[22];
-x q[23];
-x q[24];
-x q[25];
-x q[26];
-x q[27];
-x q[28];
-x q[29];
-cx q[0],q[15];
-cx q[1],q[17];
-cx q[2],q[19];
-cx q[3],q[21];
-cx q[4],q[23];
-cx q[5],q[25];
-cx q[6],q[27];
-cx q[7],q[29];
-cx q[8],q[16];
-cx q[8],q[17];
-cx q[9],q[18];
-cx q[9],q[19];
-cx q[10],q[20];
-cx q[10],q[21];
-cx q[11],q[22];
-cx q[11],q[23];
-cx q[12],q[24];
-cx q[12],q[25];
-cx q[13],q[26];
-cx q[13],q[27];
-cx q[14],q[28];
-cx q[14],q[29];
-h q[0];
-h q[1];
-h q[2];
-h q[3];
-h q[4];
-h q[5];
-h q[6];
-h q[7];
-h q[8];
-h q[9];
-h q[10];
-h q[11];
-h q[12];
-h q[13];
-h q[14];
-x q[0];
-x q[1];
-x q[2];
-x q[3];
-x q[4];
-x q[5];
-x q[6];
-x q[7];
-x q[8];
-x q[9];
-x q[10];
-x q[11];
-x q[12];
-x q[13];
-x q[14];
-reset q[31];
-reset q[32];
-reset q[33];
-reset q[34];
-reset q[35];
-reset q[36];
-reset q[37];
-reset q[38];
-reset q[39];
-reset q[40];
-reset q[41];
-reset q[42];
-reset q[43];
-reset q[44];
-ccx q[1],q[0],q[31];
-ccx q[31],q[2],q[32];
-ccx q[32],q[3],q[33];
-ccx q[33],q[4],q[34];
-ccx q[34],q[5],q[35];
-ccx q[35],q[6],q[36];
-ccx q[36],q[7],q[37];
-ccx q[37],q[8],q[38];
-ccx q[38],q[9],q[39];
-ccx q[39],q[10],q[40];
-ccx q[40],q[11],q[41];
-ccx q[41],q[12],q[42];
-ccx q[42],q[13],q[43];
-ccx q[43],q[14],q[44];
-z q[44];
-ccx q[43],q[14],q[44];
-ccx q[42],q[13],q[43];
-ccx q[41],q[12],q[42];
-ccx q[40],q[11],q[41];
-ccx q[39],q[10],q[40];
-ccx q[38],q[9],q[39];
-ccx q[37],q[8],q[38];
-ccx q[36],q[7],q[37];
-ccx q[35],q[6],q[36];
-ccx q[34],q[5],q[35];
-ccx q[33],q[4],q[34];
-ccx q[32],q[3],q[33];
-ccx q[31],q[2],q[32];
-ccx q[1],q[0],q[31];
-x q[0];
-x q[1];
-x q[2];
-x q[3];
-x q[4];
-x q[5];
-x q[6];
-x q[7];
-x q[8];
-x q[9];
-x q[10];
-x q[11];
-x q[12];
-x q[13];
-x q[14];
-h q[0];
-h q[1];
-h q[2];
-h q[3];
-h q[4];
-h q[5];
-h q[6];
-h q[7];
-h q[8];
-h q[9];
-h q[10];
-h q[11];
-h q[12];
-h q[13];
-h q[14];
-cx q[0],q[15];
-cx q[1],q[17];
-cx q[2],q[19];
-cx q[3],q[21];
-cx q[4],q[23];
-cx q[5],q[25];
-cx q[6],q[27];
-cx q[7],q[29];
-cx q[8],q[16];
-cx q[8],q[17];
-cx q[9],q[18];
-cx q[9],q[19];
-cx q[10],q[20];
-cx q[10],q[21];
-cx q[11],q[22];
-cx q[11],q[23];
-cx q[12],q[24];
-cx q[12],q[25];
-cx q[13],q[26];
-cx q[13],q[27];
-cx q[14],q[28];
-cx q[14],q[29];
-x q[15];
-x q[17];
-x q[18];
-x q[19];
-x q[20];
-x q[21];
-x q[22];
-x q[23];
-x q[24];
-x q[25];
-x q[26];
-x q[27];
-x q[28];
-x q[29];
-reset q[31];
-reset q[32];
-reset q[33];
-reset q[34];
-reset q[35];
-reset q[36];
-reset q[37];
-reset q[38];
-reset q[39];
-reset q[40];
-reset q[41];
-reset q[42];
-reset q[43];
-reset q[44];
-ccx q[16],q[15],q[31];
-ccx q[31],q[17],q[32];
-ccx q[32],q[18],q[33];
-ccx q[33],q[19],q[34];
-ccx q[34],q[20],q[35];
-ccx q[35],q[21],q[36];
-ccx q[36],q[22],q[37];
-ccx q[37],q[23],q[38];
-ccx q[38],q[24],q[39];
-ccx q[39],q[25],q[40];
-ccx q[40],q[26],q[41];
-ccx q[41],q[27],q[42];
-ccx q[42],q[28],q[43];
-ccx q[43],q[29],q[44];
-cx q[44],q[30];
-ccx q[43],q[29],q[44];
-ccx q[42],q[28],q[43];
-ccx q[41],q[27],q[42];
-ccx q[40],q[26],q[41];
-ccx q[39],q[25],q[40];
-ccx q[38],q[24],q[39];
-ccx q[37],q[23],q[38];
-ccx q[36],q[22],q[37];
-ccx q[35],q[21],q[36];
-ccx q[34],q[20],q[35];
-ccx q[33],q[19],q[34];
-ccx q[32],q[18],q[33];
-ccx q[31],q[17],q[32];
-ccx q[16],q[15],q[31];
-x q[15];
-x q[17];
-x q[18];
-x q[19];
-x q[20];
-x q[21];
-x q[22];
-x q[23];
-x q[24];
-x q[25];
-x q[26];
-x q[27];
-x q[28];
-x q[29];
-measure q[30] -> c[30];
-measure q[0] -> c[0];
-measure q[1] -> c[1];
-measure q[2] -> c[2];
-measure q[3] -> c[3];
-measure q[4] -> c[4];
-measure q[5] -> c[5];
-measure q[6] -> c[6];
-measure q[7] -> c[7];
-measure q[8] -> c[8];
-measure q[9] -> c[9];
-measure q[10] -> c[10];
-measure q[11] -> c[11];
-measure q[12] -> c[12];
-measure q[13] -> c[13];
-measure q[14] -> c[14];
-measure q[15] -> c[15];
-measure q[16] -> c[16];
-measure q[17] -> c[17];
-measure q[18] -> c[18];
-measure q[19] -> c[19];
-measure q[20] -> c[20];
-measure q[21] -> c[21];
-measure q[22] -> c[22];
-measure q[23] -> c[23];
-measure q[24] -> c[24];
-measure q[25] -> c[25];
-measure q[26] -> c[26];
-measure q[27] -> c[27];
-measure q[28] -> c[28];
-measure q[29] -> c[29];
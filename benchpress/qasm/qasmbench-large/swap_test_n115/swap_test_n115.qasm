@@ -1,178 +0,0 @@
-OPENQASM 2.0;
-include "qelib1.inc";
-qreg q0[115];
-creg c0[1];
-rx(-3.6924814) q0[1];
-rx(-3.2923147) q0[58];
-rx(5.4291652) q0[2];
-rx(5.6875289) q0[59];
-rx(1.3594796) q0[3];
-rx(1.2065807) q0[60];
-rx(-5.9123043) q0[4];
-rx(-6.0041031) q0[61];
-rx(-0.13186279) q0[5];
-rx(0.50271205) q0[62];
-rx(-4.3869008) q0[6];
-rx(-4.1172873) q0[63];
-rx(4.9830092) q0[7];
-rx(4.8261369) q0[64];
-rx(-1.4181518) q0[8];
-rx(-1.5885531) q0[65];
-rx(3.9058792) q0[9];
-rx(3.2780951) q0[66];
-rx(2.1483107) q0[10];
-rx(2.2125048) q0[67];
-rx(-1.552265) q0[11];
-rx(-2.1338861) q0[68];
-rx(3.5437778) q0[12];
-rx(2.9294436) q0[69];
-rx(3.5074824) q0[13];
-rx(4.0850493) q0[70];
-rx(-3.1458178) q0[14];
-rx(-2.9631606) q0[71];
-rx(2.9808713) q0[15];
-rx(2.9322572) q0[72];
-rx(-4.5722067) q0[16];
-rx(-4.3125018) q0[73];
-rx(-2.9717581) q0[17];
-rx(-2.9593885) q0[74];
-rx(4.3812134) q0[18];
-rx(4.335384) q0[75];
-rx(-0.54413824) q0[19];
-rx(-0.18151701) q0[76];
-rx(2.8824416) q0[20];
-rx(3.026406) q0[77];
-rx(0.99178896) q0[21];
-rx(0.67977512) q0[78];
-rx(5.4169858) q0[22];
-rx(5.3901384) q0[79];
-rx(5.7239307) q0[23];
-rx(5.4778772) q0[80];
-rx(3.7629698) q0[24];
-rx(3.2416375) q0[81];
-rx(-4.5485128) q0[25];
-rx(-4.6932636) q0[82];
-rx(-1.2568228) q0[26];
-rx(-1.5358894) q0[83];
-rx(0.23981735) q0[27];
-rx(0.14196899) q0[84];
-rx(3.7984922) q0[28];
-rx(2.8545295) q0[85];
-rx(-3.8848018) q0[29];
-rx(-4.6828012) q0[86];
-rx(6.3001558) q0[30];
-rx(6.3839722) q0[87];
-rx(-3.4069529) q0[31];
-rx(-3.4187853) q0[88];
-rx(4.7466145) q0[32];
-rx(5.2615537) q0[89];
-rx(-2.1814104) q0[33];
-rx(-2.4920183) q0[90];
-rx(-0.57507011) q0[34];
-rx(-0.077795552) q0[91];
-rx(4.6805446) q0[35];
-rx(4.6515072) q0[92];
-rx(4.5772178) q0[36];
-rx(4.8120644) q0[93];
-rx(-4.7849305) q0[37];
-rx(-4.962639) q0[94];
-rx(5.0410485) q0[38];
-rx(4.1251127) q0[95];
-rx(2.8838226) q0[39];
-rx(3.4555457) q0[96];
-rx(0.44292461) q0[40];
-rx(0.56942526) q0[97];
-rx(3.7197327) q0[41];
-rx(3.2111797) q0[98];
-rx(-1.8943073) q0[42];
-rx(-2.7306572) q0[99];
-rx(-1.999106) q0[43];
-rx(-2.0374113) q0[100];
-rx(1.3418585) q0[44];
-rx(1.4501265) q0[101];
-rx(0.046586934) q0[45];
-rx(0.02156321) q0[102];
-rx(0.73527235) q0[46];
-rx(0.4687879) q0[103];
-rx(1.9151106) q0[47];
-rx(2.0856004) q0[104];
-rx(6.3955771) q0[48];
-rx(6.7713486) q0[105];
-rx(-2.5115015) q0[49];
-rx(-2.6921068) q0[106];
-rx(6.5211642) q0[50];
-rx(5.7855169) q0[107];
-rx(6.8379368) q0[51];
-rx(6.9857737) q0[108];
-rx(-2.2780919) q0[52];
-rx(-1.7109631) q0[109];
-rx(4.2623893) q0[53];
-rx(4.9122169) q0[110];
-rx(-3.7078176) q0[54];
-rx(-3.422463) q0[111];
-rx(0.22391519) q0[55];
-rx(0.060814331) q0[112];
-rx(0.096857984) q0[56];
-rx(-0.51278735) q0[113];
-rx(-5.1068641) q0[57];
-rx(-5.0352525) q0[114];
-h q0[0];
-cswap q0[0],q0[1],q0[58];
-cswap q0[0],q0[2],q0[59];
-cswap q0[0],q0[3],q0[60];
-cswap q0[0],q0[4],q0[61];
-cswap q0[0],q0[5],q0[62];
-cswap q0[0],q0[6],q0[63];
-cswap q0[0],q0[7],q0[64];
-cswap q0[0],q0[8],q0[65];
-cswap q0[0],q0[9],q0[66];
-cswap q0[0],q0[10],q0[67];
-cswap q0[0],q0[11],q0[68];
-cswap q0[0],q0[12],q0[69];
-cswap q0[0],q0[13],q0[70];
-cswap q0[0],q0[14],q0[71];
-cswap q0[0],q0[15],q0[72];
-cswap q0[0],q0[16],q0[73];
-cswap q0[0],q0[17],q0[74];
-cswap q0[0],q0[18],q0[75];
-cswap q0[0],q0[19],q0[76];
-cswap q0[0],q0[20],q0[77];
-cswap q0[0],q0[21],q0[78];
-cswap q0[0],q0[22],q0[79];
-cswap q0[0],q0[23],q0[80];
-cswap q0[0],q0[24],q0[81];
-cswap q0[0],q0[25],q0[82];
-cswap q0[0],q0[26],q0[83];
-cswap q0[0],q0[27],q0[84];
-cswap q0[0],q0[28],q0[85];
-cswap q0[0],q0[29],q0[86];
-cswap q0[0],q0[30],q0[87];
-cswap q0[0],q0[31],q0[88];
-cswap q0[0],q0[32],q0[89];
-cswap q0[0],q0[33],q0[90];
-cswap q0[0],q0[34],q0[91];
-cswap q0[0],q0[35],q0[92];
-cswap q0[0],q0[36],q0[93];
-cswap q0[0],q0[37],q0[94];
-cswap q0[0],q0[38],q0[95];
-cswap q0[0],q0[39],q0[96];
-cswap q0[0],q0[40],q0[97];
-cswap q0[0],q0[41],q0[98];
-cswap q0[0],q0[42],q0[99];
-cswap q0[0],q0[43],q0[100];
-cswap q0[0],q0[44],q0[101];
-cswap q0[0],q0[45],q0[102];
-cswap q0[0],q0[46],q0[103];
-cswap q0[0],q0[47],q0[104];
-cswap q0[0],q0[48],q0[105];
-cswap q0[0],q0[49],q0[106];
-cswap q0[0],q0[50],q0[107];
-cswap q0[0],q0[51],q0[108];
-cswap q0[0],q0[52],q0[109];
-cswap q0[0],q0[53],q0[110];
-cswap q0[0],q0[54],q0[111];
-cswap q0[0],q0[55],q0[112];
-cswap q0[0],q0[56],q0[113];
-cswap q0[0],q0[57],q0[114];
-h q0[0];
-measure q0[0] -> c0[0];
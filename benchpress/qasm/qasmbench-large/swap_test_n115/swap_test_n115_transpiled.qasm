@@ -1,1721 +0,0 @@
-OPENQASM 2.0;
-include "qelib1.inc";
-qreg q0[115];
-creg c0[1];
-rz(pi/2) q0[0];
-sx q0[0];
-rz(pi/2) q0[0];
-rz(pi/2) q0[1];
-sx q0[1];
-rz(-0.550888746410207) q0[1];
-sx q0[1];
-rz(5*pi/2) q0[1];
-rz(pi/2) q0[2];
-sx q0[2];
-rz(8.57075785358979) q0[2];
-sx q0[2];
-rz(5*pi/2) q0[2];
-rz(pi/2) q0[3];
-sx q0[3];
-rz(4.50107225358979) q0[3];
-sx q0[3];
-rz(5*pi/2) q0[3];
-rz(pi/2) q0[4];
-sx q0[4];
-rz(-2.77071164641021) q0[4];
-sx q0[4];
-rz(5*pi/2) q0[4];
-rz(pi/2) q0[5];
-sx q0[5];
-rz(3.00972986358979) q0[5];
-sx q0[5];
-rz(5*pi/2) q0[5];
-rz(pi/2) q0[6];
-sx q0[6];
-rz(-1.24530814641021) q0[6];
-sx q0[6];
-rz(5*pi/2) q0[6];
-rz(pi/2) q0[7];
-sx q0[7];
-rz(8.12460185358979) q0[7];
-sx q0[7];
-rz(5*pi/2) q0[7];
-rz(pi/2) q0[8];
-sx q0[8];
-rz(1.72344085358979) q0[8];
-sx q0[8];
-rz(5*pi/2) q0[8];
-rz(pi/2) q0[9];
-sx q0[9];
-rz(7.04747185358979) q0[9];
-sx q0[9];
-rz(5*pi/2) q0[9];
-rz(pi/2) q0[10];
-sx q0[10];
-rz(5.28990335358979) q0[10];
-sx q0[10];
-rz(5*pi/2) q0[10];
-rz(pi/2) q0[11];
-sx q0[11];
-rz(1.58932765358979) q0[11];
-sx q0[11];
-rz(5*pi/2) q0[11];
-rz(pi/2) q0[12];
-sx q0[12];
-rz(6.68537045358979) q0[12];
-sx q0[12];
-rz(5*pi/2) q0[12];
-rz(pi/2) q0[13];
-sx q0[13];
-rz(6.64907505358979) q0[13];
-sx q0[13];
-rz(5*pi/2) q0[13];
-rz(pi/2) q0[14];
-sx q0[14];
-rz(-0.00422514641020699) q0[14];
-sx q0[14];
-rz(5*pi/2) q0[14];
-rz(pi/2) q0[15];
-sx q0[15];
-rz(6.12246395358979) q0[15];
-sx q0[15];
-rz(5*pi/2) q0[15];
-rz(pi/2) q0[16];
-sx q0[16];
-rz(-1.43061404641021) q0[16];
-sx q0[16];
-rz(5*pi/2) q0[16];
-rz(pi/2) q0[17];
-sx q0[17];
-rz(0.169834553589793) q0[17];
-sx q0[17];
-rz(5*pi/2) q0[17];
-rz(pi/2) q0[18];
-sx q0[18];
-rz(7.52280605358979) q0[18];
-sx q0[18];
-rz(5*pi/2) q0[18];
-rz(pi/2) q0[19];
-sx q0[19];
-rz(2.59745441358979) q0[19];
-sx q0[19];
-rz(5*pi/2) q0[19];
-rz(pi/2) q0[20];
-sx q0[20];
-rz(6.02403425358979) q0[20];
-sx q0[20];
-rz(5*pi/2) q0[20];
-rz(pi/2) q0[21];
-sx q0[21];
-rz(4.13338161358979) q0[21];
-sx q0[21];
-rz(5*pi/2) q0[21];
-rz(pi/2) q0[22];
-sx q0[22];
-rz(8.55857845358979) q0[22];
-sx q0[22];
-rz(5*pi/2) q0[22];
-rz(pi/2) q0[23];
-sx q0[23];
-rz(8.86552335358979) q0[23];
-sx q0[23];
-rz(5*pi/2) q0[23];
-rz(pi/2) q0[24];
-sx q0[24];
-rz(6.90456245358979) q0[24];
-sx q0[24];
-rz(5*pi/2) q0[24];
-rz(pi/2) q0[25];
-sx q0[25];
-rz(-1.40692014641021) q0[25];
-sx q0[25];
-rz(5*pi/2) q0[25];
-rz(pi/2) q0[26];
-sx q0[26];
-rz(1.88476985358979) q0[26];
-sx q0[26];
-rz(5*pi/2) q0[26];
-rz(pi/2) q0[27];
-sx q0[27];
-rz(3.38141000358979) q0[27];
-sx q0[27];
-rz(5*pi/2) q0[27];
-rz(pi/2) q0[28];
-sx q0[28];
-rz(6.94008485358979) q0[28];
-sx q0[28];
-rz(5*pi/2) q0[28];
-rz(pi/2) q0[29];
-sx q0[29];
-rz(-0.743209146410207) q0[29];
-sx q0[29];
-rz(5*pi/2) q0[29];
-rz(pi/2) q0[30];
-sx q0[30];
-rz(9.44174845358979) q0[30];
-sx q0[30];
-rz(5*pi/2) q0[30];
-rz(pi/2) q0[31];
-sx q0[31];
-rz(-0.265360246410207) q0[31];
-sx q0[31];
-rz(5*pi/2) q0[31];
-rz(pi/2) q0[32];
-sx q0[32];
-rz(7.88820715358979) q0[32];
-sx q0[32];
-rz(5*pi/2) q0[32];
-rz(pi/2) q0[33];
-sx q0[33];
-rz(0.960182253589793) q0[33];
-sx q0[33];
-rz(5*pi/2) q0[33];
-rz(pi/2) q0[34];
-sx q0[34];
-rz(2.56652254358979) q0[34];
-sx q0[34];
-rz(5*pi/2) q0[34];
-rz(pi/2) q0[35];
-sx q0[35];
-rz(7.82213725358979) q0[35];
-sx q0[35];
-rz(5*pi/2) q0[35];
-rz(pi/2) q0[36];
-sx q0[36];
-rz(7.71881045358979) q0[36];
-sx q0[36];
-rz(5*pi/2) q0[36];
-rz(pi/2) q0[37];
-sx q0[37];
-rz(-1.64333784641021) q0[37];
-sx q0[37];
-rz(5*pi/2) q0[37];
-rz(pi/2) q0[38];
-sx q0[38];
-rz(8.18264115358979) q0[38];
-sx q0[38];
-rz(5*pi/2) q0[38];
-rz(pi/2) q0[39];
-sx q0[39];
-rz(6.02541525358979) q0[39];
-sx q0[39];
-rz(5*pi/2) q0[39];
-rz(pi/2) q0[40];
-sx q0[40];
-rz(3.58451726358979) q0[40];
-sx q0[40];
-rz(5*pi/2) q0[40];
-rz(pi/2) q0[41];
-sx q0[41];
-rz(6.86132535358979) q0[41];
-sx q0[41];
-rz(5*pi/2) q0[41];
-rz(pi/2) q0[42];
-sx q0[42];
-rz(1.24728535358979) q0[42];
-sx q0[42];
-rz(5*pi/2) q0[42];
-rz(pi/2) q0[43];
-sx q0[43];
-rz(1.14248665358979) q0[43];
-sx q0[43];
-rz(5*pi/2) q0[43];
-rz(pi/2) q0[44];
-sx q0[44];
-rz(4.48345115358979) q0[44];
-sx q0[44];
-rz(5*pi/2) q0[44];
-rz(pi/2) q0[45];
-sx q0[45];
-rz(3.18817958758979) q0[45];
-sx q0[45];
-rz(5*pi/2) q0[45];
-rz(pi/2) q0[46];
-sx q0[46];
-rz(3.87686500358979) q0[46];
-sx q0[46];
-rz(5*pi/2) q0[46];
-rz(pi/2) q0[47];
-sx q0[47];
-rz(5.05670325358979) q0[47];
-sx q0[47];
-rz(5*pi/2) q0[47];
-rz(pi/2) q0[48];
-sx q0[48];
-rz(9.53716975358979) q0[48];
-sx q0[48];
-rz(5*pi/2) q0[48];
-rz(pi/2) q0[49];
-sx q0[49];
-rz(0.630091153589793) q0[49];
-sx q0[49];
-rz(5*pi/2) q0[49];
-rz(pi/2) q0[50];
-sx q0[50];
-rz(9.66275685358979) q0[50];
-sx q0[50];
-rz(5*pi/2) q0[50];
-rz(pi/2) q0[51];
-sx q0[51];
-rz(9.97952945358979) q0[51];
-sx q0[51];
-rz(5*pi/2) q0[51];
-rz(pi/2) q0[52];
-sx q0[52];
-rz(0.863500753589793) q0[52];
-sx q0[52];
-rz(5*pi/2) q0[52];
-rz(pi/2) q0[53];
-sx q0[53];
-rz(7.40398195358979) q0[53];
-sx q0[53];
-rz(5*pi/2) q0[53];
-rz(pi/2) q0[54];
-sx q0[54];
-rz(-0.566224946410207) q0[54];
-sx q0[54];
-rz(5*pi/2) q0[54];
-rz(pi/2) q0[55];
-sx q0[55];
-rz(3.36550784358979) q0[55];
-sx q0[55];
-rz(5*pi/2) q0[55];
-rz(pi/2) q0[56];
-sx q0[56];
-rz(3.23845063758979) q0[56];
-sx q0[56];
-rz(5*pi/2) q0[56];
-rz(pi/2) q0[57];
-sx q0[57];
-rz(-1.96527144641021) q0[57];
-sx q0[57];
-rz(5*pi/2) q0[57];
-rz(pi/2) q0[58];
-sx q0[58];
-rz(-0.150722046410207) q0[58];
-sx q0[58];
-rz(5*pi/2) q0[58];
-cx q0[58],q0[1];
-rz(pi/2) q0[58];
-sx q0[58];
-rz(pi/2) q0[58];
-cx q0[1],q0[58];
-rz(-pi/4) q0[58];
-cx q0[0],q0[58];
-rz(pi/4) q0[58];
-cx q0[1],q0[58];
-rz(pi/4) q0[1];
-rz(-pi/4) q0[58];
-cx q0[0],q0[58];
-cx q0[0],q0[1];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[1];
-cx q0[0],q0[1];
-rz(3*pi/4) q0[58];
-sx q0[58];
-rz(pi/2) q0[58];
-cx q0[58],q0[1];
-rz(pi/2) q0[59];
-sx q0[59];
-rz(8.82912155358979) q0[59];
-sx q0[59];
-rz(5*pi/2) q0[59];
-cx q0[59],q0[2];
-rz(pi/2) q0[59];
-sx q0[59];
-rz(pi/2) q0[59];
-cx q0[2],q0[59];
-rz(-pi/4) q0[59];
-cx q0[0],q0[59];
-rz(pi/4) q0[59];
-cx q0[2],q0[59];
-rz(pi/4) q0[2];
-rz(-pi/4) q0[59];
-cx q0[0],q0[59];
-cx q0[0],q0[2];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[2];
-cx q0[0],q0[2];
-rz(3*pi/4) q0[59];
-sx q0[59];
-rz(pi/2) q0[59];
-cx q0[59],q0[2];
-rz(pi/2) q0[60];
-sx q0[60];
-rz(4.34817335358979) q0[60];
-sx q0[60];
-rz(5*pi/2) q0[60];
-cx q0[60],q0[3];
-rz(pi/2) q0[60];
-sx q0[60];
-rz(pi/2) q0[60];
-cx q0[3],q0[60];
-rz(-pi/4) q0[60];
-cx q0[0],q0[60];
-rz(pi/4) q0[60];
-cx q0[3],q0[60];
-rz(pi/4) q0[3];
-rz(-pi/4) q0[60];
-cx q0[0],q0[60];
-cx q0[0],q0[3];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[3];
-cx q0[0],q0[3];
-rz(3*pi/4) q0[60];
-sx q0[60];
-rz(pi/2) q0[60];
-cx q0[60],q0[3];
-rz(pi/2) q0[61];
-sx q0[61];
-rz(-2.86251044641021) q0[61];
-sx q0[61];
-rz(5*pi/2) q0[61];
-cx q0[61],q0[4];
-rz(pi/2) q0[61];
-sx q0[61];
-rz(pi/2) q0[61];
-cx q0[4],q0[61];
-rz(-pi/4) q0[61];
-cx q0[0],q0[61];
-rz(pi/4) q0[61];
-cx q0[4],q0[61];
-rz(pi/4) q0[4];
-rz(-pi/4) q0[61];
-cx q0[0],q0[61];
-cx q0[0],q0[4];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[4];
-cx q0[0],q0[4];
-rz(3*pi/4) q0[61];
-sx q0[61];
-rz(pi/2) q0[61];
-cx q0[61],q0[4];
-rz(pi/2) q0[62];
-sx q0[62];
-rz(3.64430470358979) q0[62];
-sx q0[62];
-rz(5*pi/2) q0[62];
-cx q0[62],q0[5];
-rz(pi/2) q0[62];
-sx q0[62];
-rz(pi/2) q0[62];
-cx q0[5],q0[62];
-rz(-pi/4) q0[62];
-cx q0[0],q0[62];
-rz(pi/4) q0[62];
-cx q0[5],q0[62];
-rz(pi/4) q0[5];
-rz(-pi/4) q0[62];
-cx q0[0],q0[62];
-cx q0[0],q0[5];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[5];
-cx q0[0],q0[5];
-rz(3*pi/4) q0[62];
-sx q0[62];
-rz(pi/2) q0[62];
-cx q0[62],q0[5];
-rz(pi/2) q0[63];
-sx q0[63];
-rz(-0.975694646410207) q0[63];
-sx q0[63];
-rz(5*pi/2) q0[63];
-cx q0[63],q0[6];
-rz(pi/2) q0[63];
-sx q0[63];
-rz(pi/2) q0[63];
-cx q0[6],q0[63];
-rz(-pi/4) q0[63];
-cx q0[0],q0[63];
-rz(pi/4) q0[63];
-cx q0[6],q0[63];
-rz(pi/4) q0[6];
-rz(-pi/4) q0[63];
-cx q0[0],q0[63];
-cx q0[0],q0[6];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[6];
-cx q0[0],q0[6];
-rz(3*pi/4) q0[63];
-sx q0[63];
-rz(pi/2) q0[63];
-cx q0[63],q0[6];
-rz(pi/2) q0[64];
-sx q0[64];
-rz(7.96772955358979) q0[64];
-sx q0[64];
-rz(5*pi/2) q0[64];
-cx q0[64],q0[7];
-rz(pi/2) q0[64];
-sx q0[64];
-rz(pi/2) q0[64];
-cx q0[7],q0[64];
-rz(-pi/4) q0[64];
-cx q0[0],q0[64];
-rz(pi/4) q0[64];
-cx q0[7],q0[64];
-rz(-pi/4) q0[64];
-cx q0[0],q0[64];
-rz(3*pi/4) q0[64];
-sx q0[64];
-rz(pi/2) q0[64];
-rz(pi/4) q0[7];
-cx q0[0],q0[7];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[7];
-cx q0[0],q0[7];
-cx q0[64],q0[7];
-rz(pi/2) q0[65];
-sx q0[65];
-rz(1.55303955358979) q0[65];
-sx q0[65];
-rz(5*pi/2) q0[65];
-cx q0[65],q0[8];
-rz(pi/2) q0[65];
-sx q0[65];
-rz(pi/2) q0[65];
-cx q0[8],q0[65];
-rz(-pi/4) q0[65];
-cx q0[0],q0[65];
-rz(pi/4) q0[65];
-cx q0[8],q0[65];
-rz(-pi/4) q0[65];
-cx q0[0],q0[65];
-rz(3*pi/4) q0[65];
-sx q0[65];
-rz(pi/2) q0[65];
-rz(pi/4) q0[8];
-cx q0[0],q0[8];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[8];
-cx q0[0],q0[8];
-cx q0[65],q0[8];
-rz(pi/2) q0[66];
-sx q0[66];
-rz(6.41968775358979) q0[66];
-sx q0[66];
-rz(5*pi/2) q0[66];
-cx q0[66],q0[9];
-rz(pi/2) q0[66];
-sx q0[66];
-rz(pi/2) q0[66];
-cx q0[9],q0[66];
-rz(-pi/4) q0[66];
-cx q0[0],q0[66];
-rz(pi/4) q0[66];
-cx q0[9],q0[66];
-rz(-pi/4) q0[66];
-cx q0[0],q0[66];
-rz(3*pi/4) q0[66];
-sx q0[66];
-rz(pi/2) q0[66];
-rz(pi/4) q0[9];
-cx q0[0],q0[9];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[9];
-cx q0[0],q0[9];
-cx q0[66],q0[9];
-rz(pi/2) q0[67];
-sx q0[67];
-rz(5.35409745358979) q0[67];
-sx q0[67];
-rz(5*pi/2) q0[67];
-cx q0[67],q0[10];
-rz(pi/2) q0[67];
-sx q0[67];
-rz(pi/2) q0[67];
-cx q0[10],q0[67];
-rz(-pi/4) q0[67];
-cx q0[0],q0[67];
-rz(pi/4) q0[67];
-cx q0[10],q0[67];
-rz(pi/4) q0[10];
-rz(-pi/4) q0[67];
-cx q0[0],q0[67];
-cx q0[0],q0[10];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[10];
-cx q0[0],q0[10];
-rz(3*pi/4) q0[67];
-sx q0[67];
-rz(pi/2) q0[67];
-cx q0[67],q0[10];
-rz(pi/2) q0[68];
-sx q0[68];
-rz(1.00770655358979) q0[68];
-sx q0[68];
-rz(5*pi/2) q0[68];
-cx q0[68],q0[11];
-rz(pi/2) q0[68];
-sx q0[68];
-rz(pi/2) q0[68];
-cx q0[11],q0[68];
-rz(-pi/4) q0[68];
-cx q0[0],q0[68];
-rz(pi/4) q0[68];
-cx q0[11],q0[68];
-rz(pi/4) q0[11];
-rz(-pi/4) q0[68];
-cx q0[0],q0[68];
-cx q0[0],q0[11];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[11];
-cx q0[0],q0[11];
-rz(3*pi/4) q0[68];
-sx q0[68];
-rz(pi/2) q0[68];
-cx q0[68],q0[11];
-rz(pi/2) q0[69];
-sx q0[69];
-rz(6.07103625358979) q0[69];
-sx q0[69];
-rz(5*pi/2) q0[69];
-cx q0[69],q0[12];
-rz(pi/2) q0[69];
-sx q0[69];
-rz(pi/2) q0[69];
-cx q0[12],q0[69];
-rz(-pi/4) q0[69];
-cx q0[0],q0[69];
-rz(pi/4) q0[69];
-cx q0[12],q0[69];
-rz(pi/4) q0[12];
-rz(-pi/4) q0[69];
-cx q0[0],q0[69];
-cx q0[0],q0[12];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[12];
-cx q0[0],q0[12];
-rz(3*pi/4) q0[69];
-sx q0[69];
-rz(pi/2) q0[69];
-cx q0[69],q0[12];
-rz(pi/2) q0[70];
-sx q0[70];
-rz(7.22664195358979) q0[70];
-sx q0[70];
-rz(5*pi/2) q0[70];
-cx q0[70],q0[13];
-rz(pi/2) q0[70];
-sx q0[70];
-rz(pi/2) q0[70];
-cx q0[13],q0[70];
-rz(-pi/4) q0[70];
-cx q0[0],q0[70];
-rz(pi/4) q0[70];
-cx q0[13],q0[70];
-rz(pi/4) q0[13];
-rz(-pi/4) q0[70];
-cx q0[0],q0[70];
-cx q0[0],q0[13];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[13];
-cx q0[0],q0[13];
-rz(3*pi/4) q0[70];
-sx q0[70];
-rz(pi/2) q0[70];
-cx q0[70],q0[13];
-rz(pi/2) q0[71];
-sx q0[71];
-rz(0.178432053589793) q0[71];
-sx q0[71];
-rz(5*pi/2) q0[71];
-cx q0[71],q0[14];
-rz(pi/2) q0[71];
-sx q0[71];
-rz(pi/2) q0[71];
-cx q0[14],q0[71];
-rz(-pi/4) q0[71];
-cx q0[0],q0[71];
-rz(pi/4) q0[71];
-cx q0[14],q0[71];
-rz(pi/4) q0[14];
-rz(-pi/4) q0[71];
-cx q0[0],q0[71];
-cx q0[0],q0[14];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[14];
-cx q0[0],q0[14];
-rz(3*pi/4) q0[71];
-sx q0[71];
-rz(pi/2) q0[71];
-cx q0[71],q0[14];
-rz(pi/2) q0[72];
-sx q0[72];
-rz(6.07384985358979) q0[72];
-sx q0[72];
-rz(5*pi/2) q0[72];
-cx q0[72],q0[15];
-rz(pi/2) q0[72];
-sx q0[72];
-rz(pi/2) q0[72];
-cx q0[15],q0[72];
-rz(-pi/4) q0[72];
-cx q0[0],q0[72];
-rz(pi/4) q0[72];
-cx q0[15],q0[72];
-rz(pi/4) q0[15];
-rz(-pi/4) q0[72];
-cx q0[0],q0[72];
-cx q0[0],q0[15];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[15];
-cx q0[0],q0[15];
-rz(3*pi/4) q0[72];
-sx q0[72];
-rz(pi/2) q0[72];
-cx q0[72],q0[15];
-rz(pi/2) q0[73];
-sx q0[73];
-rz(-1.17090914641021) q0[73];
-sx q0[73];
-rz(5*pi/2) q0[73];
-cx q0[73],q0[16];
-rz(pi/2) q0[73];
-sx q0[73];
-rz(pi/2) q0[73];
-cx q0[16],q0[73];
-rz(-pi/4) q0[73];
-cx q0[0],q0[73];
-rz(pi/4) q0[73];
-cx q0[16],q0[73];
-rz(pi/4) q0[16];
-rz(-pi/4) q0[73];
-cx q0[0],q0[73];
-cx q0[0],q0[16];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[16];
-cx q0[0],q0[16];
-rz(3*pi/4) q0[73];
-sx q0[73];
-rz(pi/2) q0[73];
-cx q0[73],q0[16];
-rz(pi/2) q0[74];
-sx q0[74];
-rz(0.182204153589793) q0[74];
-sx q0[74];
-rz(5*pi/2) q0[74];
-cx q0[74],q0[17];
-rz(pi/2) q0[74];
-sx q0[74];
-rz(pi/2) q0[74];
-cx q0[17],q0[74];
-rz(-pi/4) q0[74];
-cx q0[0],q0[74];
-rz(pi/4) q0[74];
-cx q0[17],q0[74];
-rz(pi/4) q0[17];
-rz(-pi/4) q0[74];
-cx q0[0],q0[74];
-cx q0[0],q0[17];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[17];
-cx q0[0],q0[17];
-rz(3*pi/4) q0[74];
-sx q0[74];
-rz(pi/2) q0[74];
-cx q0[74],q0[17];
-rz(pi/2) q0[75];
-sx q0[75];
-rz(7.47697665358979) q0[75];
-sx q0[75];
-rz(5*pi/2) q0[75];
-cx q0[75],q0[18];
-rz(pi/2) q0[75];
-sx q0[75];
-rz(pi/2) q0[75];
-cx q0[18],q0[75];
-rz(-pi/4) q0[75];
-cx q0[0],q0[75];
-rz(pi/4) q0[75];
-cx q0[18],q0[75];
-rz(pi/4) q0[18];
-rz(-pi/4) q0[75];
-cx q0[0],q0[75];
-cx q0[0],q0[18];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[18];
-cx q0[0],q0[18];
-rz(3*pi/4) q0[75];
-sx q0[75];
-rz(pi/2) q0[75];
-cx q0[75],q0[18];
-rz(pi/2) q0[76];
-sx q0[76];
-rz(2.96007564358979) q0[76];
-sx q0[76];
-rz(5*pi/2) q0[76];
-cx q0[76],q0[19];
-rz(pi/2) q0[76];
-sx q0[76];
-rz(pi/2) q0[76];
-cx q0[19],q0[76];
-rz(-pi/4) q0[76];
-cx q0[0],q0[76];
-rz(pi/4) q0[76];
-cx q0[19],q0[76];
-rz(pi/4) q0[19];
-rz(-pi/4) q0[76];
-cx q0[0],q0[76];
-cx q0[0],q0[19];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[19];
-cx q0[0],q0[19];
-rz(3*pi/4) q0[76];
-sx q0[76];
-rz(pi/2) q0[76];
-cx q0[76],q0[19];
-rz(pi/2) q0[77];
-sx q0[77];
-rz(6.16799865358979) q0[77];
-sx q0[77];
-rz(5*pi/2) q0[77];
-cx q0[77],q0[20];
-rz(pi/2) q0[77];
-sx q0[77];
-rz(pi/2) q0[77];
-cx q0[20],q0[77];
-rz(-pi/4) q0[77];
-cx q0[0],q0[77];
-rz(pi/4) q0[77];
-cx q0[20],q0[77];
-rz(pi/4) q0[20];
-rz(-pi/4) q0[77];
-cx q0[0],q0[77];
-cx q0[0],q0[20];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[20];
-cx q0[0],q0[20];
-rz(3*pi/4) q0[77];
-sx q0[77];
-rz(pi/2) q0[77];
-cx q0[77],q0[20];
-rz(pi/2) q0[78];
-sx q0[78];
-rz(3.82136777358979) q0[78];
-sx q0[78];
-rz(5*pi/2) q0[78];
-cx q0[78],q0[21];
-rz(pi/2) q0[78];
-sx q0[78];
-rz(pi/2) q0[78];
-cx q0[21],q0[78];
-rz(-pi/4) q0[78];
-cx q0[0],q0[78];
-rz(pi/4) q0[78];
-cx q0[21],q0[78];
-rz(pi/4) q0[21];
-rz(-pi/4) q0[78];
-cx q0[0],q0[78];
-cx q0[0],q0[21];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[21];
-cx q0[0],q0[21];
-rz(3*pi/4) q0[78];
-sx q0[78];
-rz(pi/2) q0[78];
-cx q0[78],q0[21];
-rz(pi/2) q0[79];
-sx q0[79];
-rz(8.53173105358979) q0[79];
-sx q0[79];
-rz(5*pi/2) q0[79];
-cx q0[79],q0[22];
-rz(pi/2) q0[79];
-sx q0[79];
-rz(pi/2) q0[79];
-cx q0[22],q0[79];
-rz(-pi/4) q0[79];
-cx q0[0],q0[79];
-rz(pi/4) q0[79];
-cx q0[22],q0[79];
-rz(pi/4) q0[22];
-rz(-pi/4) q0[79];
-cx q0[0],q0[79];
-cx q0[0],q0[22];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[22];
-cx q0[0],q0[22];
-rz(3*pi/4) q0[79];
-sx q0[79];
-rz(pi/2) q0[79];
-cx q0[79],q0[22];
-rz(pi/2) q0[80];
-sx q0[80];
-rz(8.61946985358979) q0[80];
-sx q0[80];
-rz(5*pi/2) q0[80];
-cx q0[80],q0[23];
-rz(pi/2) q0[80];
-sx q0[80];
-rz(pi/2) q0[80];
-cx q0[23],q0[80];
-rz(-pi/4) q0[80];
-cx q0[0],q0[80];
-rz(pi/4) q0[80];
-cx q0[23],q0[80];
-rz(pi/4) q0[23];
-rz(-pi/4) q0[80];
-cx q0[0],q0[80];
-cx q0[0],q0[23];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[23];
-cx q0[0],q0[23];
-rz(3*pi/4) q0[80];
-sx q0[80];
-rz(pi/2) q0[80];
-cx q0[80],q0[23];
-rz(pi/2) q0[81];
-sx q0[81];
-rz(6.38323015358979) q0[81];
-sx q0[81];
-rz(5*pi/2) q0[81];
-cx q0[81],q0[24];
-rz(pi/2) q0[81];
-sx q0[81];
-rz(pi/2) q0[81];
-cx q0[24],q0[81];
-rz(-pi/4) q0[81];
-cx q0[0],q0[81];
-rz(pi/4) q0[81];
-cx q0[24],q0[81];
-rz(pi/4) q0[24];
-rz(-pi/4) q0[81];
-cx q0[0],q0[81];
-cx q0[0],q0[24];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[24];
-cx q0[0],q0[24];
-rz(3*pi/4) q0[81];
-sx q0[81];
-rz(pi/2) q0[81];
-cx q0[81],q0[24];
-rz(pi/2) q0[82];
-sx q0[82];
-rz(-1.55167094641021) q0[82];
-sx q0[82];
-rz(5*pi/2) q0[82];
-cx q0[82],q0[25];
-rz(pi/2) q0[82];
-sx q0[82];
-rz(pi/2) q0[82];
-cx q0[25],q0[82];
-rz(-pi/4) q0[82];
-cx q0[0],q0[82];
-rz(pi/4) q0[82];
-cx q0[25],q0[82];
-rz(pi/4) q0[25];
-rz(-pi/4) q0[82];
-cx q0[0],q0[82];
-cx q0[0],q0[25];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[25];
-cx q0[0],q0[25];
-rz(3*pi/4) q0[82];
-sx q0[82];
-rz(pi/2) q0[82];
-cx q0[82],q0[25];
-rz(pi/2) q0[83];
-sx q0[83];
-rz(1.60570325358979) q0[83];
-sx q0[83];
-rz(5*pi/2) q0[83];
-cx q0[83],q0[26];
-rz(pi/2) q0[83];
-sx q0[83];
-rz(pi/2) q0[83];
-cx q0[26],q0[83];
-rz(-pi/4) q0[83];
-cx q0[0],q0[83];
-rz(pi/4) q0[83];
-cx q0[26],q0[83];
-rz(pi/4) q0[26];
-rz(-pi/4) q0[83];
-cx q0[0],q0[83];
-cx q0[0],q0[26];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[26];
-cx q0[0],q0[26];
-rz(3*pi/4) q0[83];
-sx q0[83];
-rz(pi/2) q0[83];
-cx q0[83],q0[26];
-rz(pi/2) q0[84];
-sx q0[84];
-rz(3.28356164358979) q0[84];
-sx q0[84];
-rz(5*pi/2) q0[84];
-cx q0[84],q0[27];
-rz(pi/2) q0[84];
-sx q0[84];
-rz(pi/2) q0[84];
-cx q0[27],q0[84];
-rz(-pi/4) q0[84];
-cx q0[0],q0[84];
-rz(pi/4) q0[84];
-cx q0[27],q0[84];
-rz(pi/4) q0[27];
-rz(-pi/4) q0[84];
-cx q0[0],q0[84];
-cx q0[0],q0[27];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[27];
-cx q0[0],q0[27];
-rz(3*pi/4) q0[84];
-sx q0[84];
-rz(pi/2) q0[84];
-cx q0[84],q0[27];
-rz(pi/2) q0[85];
-sx q0[85];
-rz(5.99612215358979) q0[85];
-sx q0[85];
-rz(5*pi/2) q0[85];
-cx q0[85],q0[28];
-rz(pi/2) q0[85];
-sx q0[85];
-rz(pi/2) q0[85];
-cx q0[28],q0[85];
-rz(-pi/4) q0[85];
-cx q0[0],q0[85];
-rz(pi/4) q0[85];
-cx q0[28],q0[85];
-rz(pi/4) q0[28];
-rz(-pi/4) q0[85];
-cx q0[0],q0[85];
-cx q0[0],q0[28];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[28];
-cx q0[0],q0[28];
-rz(3*pi/4) q0[85];
-sx q0[85];
-rz(pi/2) q0[85];
-cx q0[85],q0[28];
-rz(pi/2) q0[86];
-sx q0[86];
-rz(-1.54120854641021) q0[86];
-sx q0[86];
-rz(5*pi/2) q0[86];
-cx q0[86],q0[29];
-rz(pi/2) q0[86];
-sx q0[86];
-rz(pi/2) q0[86];
-cx q0[29],q0[86];
-rz(-pi/4) q0[86];
-cx q0[0],q0[86];
-rz(pi/4) q0[86];
-cx q0[29],q0[86];
-rz(pi/4) q0[29];
-rz(-pi/4) q0[86];
-cx q0[0],q0[86];
-cx q0[0],q0[29];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[29];
-cx q0[0],q0[29];
-rz(3*pi/4) q0[86];
-sx q0[86];
-rz(pi/2) q0[86];
-cx q0[86],q0[29];
-rz(pi/2) q0[87];
-sx q0[87];
-rz(9.52556485358979) q0[87];
-sx q0[87];
-rz(5*pi/2) q0[87];
-cx q0[87],q0[30];
-rz(pi/2) q0[87];
-sx q0[87];
-rz(pi/2) q0[87];
-cx q0[30],q0[87];
-rz(-pi/4) q0[87];
-cx q0[0],q0[87];
-rz(pi/4) q0[87];
-cx q0[30],q0[87];
-rz(pi/4) q0[30];
-rz(-pi/4) q0[87];
-cx q0[0],q0[87];
-cx q0[0],q0[30];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[30];
-cx q0[0],q0[30];
-rz(3*pi/4) q0[87];
-sx q0[87];
-rz(pi/2) q0[87];
-cx q0[87],q0[30];
-rz(pi/2) q0[88];
-sx q0[88];
-rz(-0.277192646410207) q0[88];
-sx q0[88];
-rz(5*pi/2) q0[88];
-cx q0[88],q0[31];
-rz(pi/2) q0[88];
-sx q0[88];
-rz(pi/2) q0[88];
-cx q0[31],q0[88];
-rz(-pi/4) q0[88];
-cx q0[0],q0[88];
-rz(pi/4) q0[88];
-cx q0[31],q0[88];
-rz(pi/4) q0[31];
-rz(-pi/4) q0[88];
-cx q0[0],q0[88];
-cx q0[0],q0[31];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[31];
-cx q0[0],q0[31];
-rz(3*pi/4) q0[88];
-sx q0[88];
-rz(pi/2) q0[88];
-cx q0[88],q0[31];
-rz(pi/2) q0[89];
-sx q0[89];
-rz(8.40314635358979) q0[89];
-sx q0[89];
-rz(5*pi/2) q0[89];
-cx q0[89],q0[32];
-rz(pi/2) q0[89];
-sx q0[89];
-rz(pi/2) q0[89];
-cx q0[32],q0[89];
-rz(-pi/4) q0[89];
-cx q0[0],q0[89];
-rz(pi/4) q0[89];
-cx q0[32],q0[89];
-rz(pi/4) q0[32];
-rz(-pi/4) q0[89];
-cx q0[0],q0[89];
-cx q0[0],q0[32];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[32];
-cx q0[0],q0[32];
-rz(3*pi/4) q0[89];
-sx q0[89];
-rz(pi/2) q0[89];
-cx q0[89],q0[32];
-rz(pi/2) q0[90];
-sx q0[90];
-rz(0.649574353589793) q0[90];
-sx q0[90];
-rz(5*pi/2) q0[90];
-cx q0[90],q0[33];
-rz(pi/2) q0[90];
-sx q0[90];
-rz(pi/2) q0[90];
-cx q0[33],q0[90];
-rz(-pi/4) q0[90];
-cx q0[0],q0[90];
-rz(pi/4) q0[90];
-cx q0[33],q0[90];
-rz(pi/4) q0[33];
-rz(-pi/4) q0[90];
-cx q0[0],q0[90];
-cx q0[0],q0[33];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[33];
-cx q0[0],q0[33];
-rz(3*pi/4) q0[90];
-sx q0[90];
-rz(pi/2) q0[90];
-cx q0[90],q0[33];
-rz(pi/2) q0[91];
-sx q0[91];
-rz(3.06379710158979) q0[91];
-sx q0[91];
-rz(5*pi/2) q0[91];
-cx q0[91],q0[34];
-rz(pi/2) q0[91];
-sx q0[91];
-rz(pi/2) q0[91];
-cx q0[34],q0[91];
-rz(-pi/4) q0[91];
-cx q0[0],q0[91];
-rz(pi/4) q0[91];
-cx q0[34],q0[91];
-rz(pi/4) q0[34];
-rz(-pi/4) q0[91];
-cx q0[0],q0[91];
-cx q0[0],q0[34];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[34];
-cx q0[0],q0[34];
-rz(3*pi/4) q0[91];
-sx q0[91];
-rz(pi/2) q0[91];
-cx q0[91],q0[34];
-rz(pi/2) q0[92];
-sx q0[92];
-rz(7.79309985358979) q0[92];
-sx q0[92];
-rz(5*pi/2) q0[92];
-cx q0[92],q0[35];
-rz(pi/2) q0[92];
-sx q0[92];
-rz(pi/2) q0[92];
-cx q0[35],q0[92];
-rz(-pi/4) q0[92];
-cx q0[0],q0[92];
-rz(pi/4) q0[92];
-cx q0[35],q0[92];
-rz(pi/4) q0[35];
-rz(-pi/4) q0[92];
-cx q0[0],q0[92];
-cx q0[0],q0[35];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[35];
-cx q0[0],q0[35];
-rz(3*pi/4) q0[92];
-sx q0[92];
-rz(pi/2) q0[92];
-cx q0[92],q0[35];
-rz(pi/2) q0[93];
-sx q0[93];
-rz(7.95365705358979) q0[93];
-sx q0[93];
-rz(5*pi/2) q0[93];
-cx q0[93],q0[36];
-rz(pi/2) q0[93];
-sx q0[93];
-rz(pi/2) q0[93];
-cx q0[36],q0[93];
-rz(-pi/4) q0[93];
-cx q0[0],q0[93];
-rz(pi/4) q0[93];
-cx q0[36],q0[93];
-rz(pi/4) q0[36];
-rz(-pi/4) q0[93];
-cx q0[0],q0[93];
-cx q0[0],q0[36];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[36];
-cx q0[0],q0[36];
-rz(3*pi/4) q0[93];
-sx q0[93];
-rz(pi/2) q0[93];
-cx q0[93],q0[36];
-rz(pi/2) q0[94];
-sx q0[94];
-rz(-1.82104634641021) q0[94];
-sx q0[94];
-rz(5*pi/2) q0[94];
-cx q0[94],q0[37];
-rz(pi/2) q0[94];
-sx q0[94];
-rz(pi/2) q0[94];
-cx q0[37],q0[94];
-rz(-pi/4) q0[94];
-cx q0[0],q0[94];
-rz(pi/4) q0[94];
-cx q0[37],q0[94];
-rz(pi/4) q0[37];
-rz(-pi/4) q0[94];
-cx q0[0],q0[94];
-cx q0[0],q0[37];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[37];
-cx q0[0],q0[37];
-rz(3*pi/4) q0[94];
-sx q0[94];
-rz(pi/2) q0[94];
-cx q0[94],q0[37];
-rz(pi/2) q0[95];
-sx q0[95];
-rz(7.26670535358979) q0[95];
-sx q0[95];
-rz(5*pi/2) q0[95];
-cx q0[95],q0[38];
-rz(pi/2) q0[95];
-sx q0[95];
-rz(pi/2) q0[95];
-cx q0[38],q0[95];
-rz(-pi/4) q0[95];
-cx q0[0],q0[95];
-rz(pi/4) q0[95];
-cx q0[38],q0[95];
-rz(pi/4) q0[38];
-rz(-pi/4) q0[95];
-cx q0[0],q0[95];
-cx q0[0],q0[38];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[38];
-cx q0[0],q0[38];
-rz(3*pi/4) q0[95];
-sx q0[95];
-rz(pi/2) q0[95];
-cx q0[95],q0[38];
-rz(pi/2) q0[96];
-sx q0[96];
-rz(6.59713835358979) q0[96];
-sx q0[96];
-rz(5*pi/2) q0[96];
-cx q0[96],q0[39];
-rz(pi/2) q0[96];
-sx q0[96];
-rz(pi/2) q0[96];
-cx q0[39],q0[96];
-rz(-pi/4) q0[96];
-cx q0[0],q0[96];
-rz(pi/4) q0[96];
-cx q0[39],q0[96];
-rz(pi/4) q0[39];
-rz(-pi/4) q0[96];
-cx q0[0],q0[96];
-cx q0[0],q0[39];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[39];
-cx q0[0],q0[39];
-rz(3*pi/4) q0[96];
-sx q0[96];
-rz(pi/2) q0[96];
-cx q0[96],q0[39];
-rz(pi/2) q0[97];
-sx q0[97];
-rz(3.71101791358979) q0[97];
-sx q0[97];
-rz(5*pi/2) q0[97];
-cx q0[97],q0[40];
-rz(pi/2) q0[97];
-sx q0[97];
-rz(pi/2) q0[97];
-cx q0[40],q0[97];
-rz(-pi/4) q0[97];
-cx q0[0],q0[97];
-rz(pi/4) q0[97];
-cx q0[40],q0[97];
-rz(pi/4) q0[40];
-rz(-pi/4) q0[97];
-cx q0[0],q0[97];
-cx q0[0],q0[40];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[40];
-cx q0[0],q0[40];
-rz(3*pi/4) q0[97];
-sx q0[97];
-rz(pi/2) q0[97];
-cx q0[97],q0[40];
-rz(pi/2) q0[98];
-sx q0[98];
-rz(6.35277235358979) q0[98];
-sx q0[98];
-rz(5*pi/2) q0[98];
-cx q0[98],q0[41];
-rz(pi/2) q0[98];
-sx q0[98];
-rz(pi/2) q0[98];
-cx q0[41],q0[98];
-rz(-pi/4) q0[98];
-cx q0[0],q0[98];
-rz(pi/4) q0[98];
-cx q0[41],q0[98];
-rz(pi/4) q0[41];
-rz(-pi/4) q0[98];
-cx q0[0],q0[98];
-cx q0[0],q0[41];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[41];
-cx q0[0],q0[41];
-rz(3*pi/4) q0[98];
-sx q0[98];
-rz(pi/2) q0[98];
-cx q0[98],q0[41];
-rz(pi/2) q0[99];
-sx q0[99];
-rz(0.410935453589793) q0[99];
-sx q0[99];
-rz(5*pi/2) q0[99];
-cx q0[99],q0[42];
-rz(pi/2) q0[99];
-sx q0[99];
-rz(pi/2) q0[99];
-cx q0[42],q0[99];
-rz(-pi/4) q0[99];
-cx q0[0],q0[99];
-rz(pi/4) q0[99];
-cx q0[42],q0[99];
-rz(pi/4) q0[42];
-rz(-pi/4) q0[99];
-cx q0[0],q0[99];
-cx q0[0],q0[42];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[42];
-cx q0[0],q0[42];
-rz(3*pi/4) q0[99];
-sx q0[99];
-rz(pi/2) q0[99];
-cx q0[99],q0[42];
-rz(pi/2) q0[100];
-sx q0[100];
-rz(1.10418135358979) q0[100];
-sx q0[100];
-rz(5*pi/2) q0[100];
-cx q0[100],q0[43];
-rz(pi/2) q0[100];
-sx q0[100];
-rz(pi/2) q0[100];
-cx q0[43],q0[100];
-rz(-pi/4) q0[100];
-cx q0[0],q0[100];
-rz(pi/4) q0[100];
-cx q0[43],q0[100];
-rz(-pi/4) q0[100];
-cx q0[0],q0[100];
-rz(3*pi/4) q0[100];
-sx q0[100];
-rz(pi/2) q0[100];
-rz(pi/4) q0[43];
-cx q0[0],q0[43];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[43];
-cx q0[0],q0[43];
-cx q0[100],q0[43];
-rz(pi/2) q0[101];
-sx q0[101];
-rz(4.59171915358979) q0[101];
-sx q0[101];
-rz(5*pi/2) q0[101];
-cx q0[101],q0[44];
-rz(pi/2) q0[101];
-sx q0[101];
-rz(pi/2) q0[101];
-cx q0[44],q0[101];
-rz(-pi/4) q0[101];
-cx q0[0],q0[101];
-rz(pi/4) q0[101];
-cx q0[44],q0[101];
-rz(-pi/4) q0[101];
-cx q0[0],q0[101];
-rz(3*pi/4) q0[101];
-sx q0[101];
-rz(pi/2) q0[101];
-rz(pi/4) q0[44];
-cx q0[0],q0[44];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[44];
-cx q0[0],q0[44];
-cx q0[101],q0[44];
-rz(pi/2) q0[102];
-sx q0[102];
-rz(3.16315586358979) q0[102];
-sx q0[102];
-rz(5*pi/2) q0[102];
-cx q0[102],q0[45];
-rz(pi/2) q0[102];
-sx q0[102];
-rz(pi/2) q0[102];
-cx q0[45],q0[102];
-rz(-pi/4) q0[102];
-cx q0[0],q0[102];
-rz(pi/4) q0[102];
-cx q0[45],q0[102];
-rz(-pi/4) q0[102];
-cx q0[0],q0[102];
-rz(3*pi/4) q0[102];
-sx q0[102];
-rz(pi/2) q0[102];
-rz(pi/4) q0[45];
-cx q0[0],q0[45];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[45];
-cx q0[0],q0[45];
-cx q0[102],q0[45];
-rz(pi/2) q0[103];
-sx q0[103];
-rz(3.61038055358979) q0[103];
-sx q0[103];
-rz(5*pi/2) q0[103];
-cx q0[103],q0[46];
-rz(pi/2) q0[103];
-sx q0[103];
-rz(pi/2) q0[103];
-cx q0[46],q0[103];
-rz(-pi/4) q0[103];
-cx q0[0],q0[103];
-rz(pi/4) q0[103];
-cx q0[46],q0[103];
-rz(-pi/4) q0[103];
-cx q0[0],q0[103];
-rz(3*pi/4) q0[103];
-sx q0[103];
-rz(pi/2) q0[103];
-rz(pi/4) q0[46];
-cx q0[0],q0[46];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[46];
-cx q0[0],q0[46];
-cx q0[103],q0[46];
-rz(pi/2) q0[104];
-sx q0[104];
-rz(5.22719305358979) q0[104];
-sx q0[104];
-rz(5*pi/2) q0[104];
-cx q0[104],q0[47];
-rz(pi/2) q0[104];
-sx q0[104];
-rz(pi/2) q0[104];
-cx q0[47],q0[104];
-rz(-pi/4) q0[104];
-cx q0[0],q0[104];
-rz(pi/4) q0[104];
-cx q0[47],q0[104];
-rz(-pi/4) q0[104];
-cx q0[0],q0[104];
-rz(3*pi/4) q0[104];
-sx q0[104];
-rz(pi/2) q0[104];
-rz(pi/4) q0[47];
-cx q0[0],q0[47];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[47];
-cx q0[0],q0[47];
-cx q0[104],q0[47];
-rz(pi/2) q0[105];
-sx q0[105];
-rz(9.91294125358979) q0[105];
-sx q0[105];
-rz(5*pi/2) q0[105];
-cx q0[105],q0[48];
-rz(pi/2) q0[105];
-sx q0[105];
-rz(pi/2) q0[105];
-cx q0[48],q0[105];
-rz(-pi/4) q0[105];
-cx q0[0],q0[105];
-rz(pi/4) q0[105];
-cx q0[48],q0[105];
-rz(-pi/4) q0[105];
-cx q0[0],q0[105];
-rz(3*pi/4) q0[105];
-sx q0[105];
-rz(pi/2) q0[105];
-rz(pi/4) q0[48];
-cx q0[0],q0[48];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[48];
-cx q0[0],q0[48];
-cx q0[105],q0[48];
-rz(pi/2) q0[106];
-sx q0[106];
-rz(0.449485853589793) q0[106];
-sx q0[106];
-rz(5*pi/2) q0[106];
-cx q0[106],q0[49];
-rz(pi/2) q0[106];
-sx q0[106];
-rz(pi/2) q0[106];
-cx q0[49],q0[106];
-rz(-pi/4) q0[106];
-cx q0[0],q0[106];
-rz(pi/4) q0[106];
-cx q0[49],q0[106];
-rz(-pi/4) q0[106];
-cx q0[0],q0[106];
-rz(3*pi/4) q0[106];
-sx q0[106];
-rz(pi/2) q0[106];
-rz(pi/4) q0[49];
-cx q0[0],q0[49];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[49];
-cx q0[0],q0[49];
-cx q0[106],q0[49];
-rz(pi/2) q0[107];
-sx q0[107];
-rz(8.92710955358979) q0[107];
-sx q0[107];
-rz(5*pi/2) q0[107];
-cx q0[107],q0[50];
-rz(pi/2) q0[107];
-sx q0[107];
-rz(pi/2) q0[107];
-cx q0[50],q0[107];
-rz(-pi/4) q0[107];
-cx q0[0],q0[107];
-rz(pi/4) q0[107];
-cx q0[50],q0[107];
-rz(-pi/4) q0[107];
-cx q0[0],q0[107];
-rz(3*pi/4) q0[107];
-sx q0[107];
-rz(pi/2) q0[107];
-rz(pi/4) q0[50];
-cx q0[0],q0[50];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[50];
-cx q0[0],q0[50];
-cx q0[107],q0[50];
-rz(pi/2) q0[108];
-sx q0[108];
-rz(10.1273663535898) q0[108];
-sx q0[108];
-rz(5*pi/2) q0[108];
-cx q0[108],q0[51];
-rz(pi/2) q0[108];
-sx q0[108];
-rz(pi/2) q0[108];
-cx q0[51],q0[108];
-rz(-pi/4) q0[108];
-cx q0[0],q0[108];
-rz(pi/4) q0[108];
-cx q0[51],q0[108];
-rz(-pi/4) q0[108];
-cx q0[0],q0[108];
-rz(3*pi/4) q0[108];
-sx q0[108];
-rz(pi/2) q0[108];
-rz(pi/4) q0[51];
-cx q0[0],q0[51];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[51];
-cx q0[0],q0[51];
-cx q0[108],q0[51];
-rz(pi/2) q0[109];
-sx q0[109];
-rz(1.43062955358979) q0[109];
-sx q0[109];
-rz(5*pi/2) q0[109];
-cx q0[109],q0[52];
-rz(pi/2) q0[109];
-sx q0[109];
-rz(pi/2) q0[109];
-cx q0[52],q0[109];
-rz(-pi/4) q0[109];
-cx q0[0],q0[109];
-rz(pi/4) q0[109];
-cx q0[52],q0[109];
-rz(-pi/4) q0[109];
-cx q0[0],q0[109];
-rz(3*pi/4) q0[109];
-sx q0[109];
-rz(pi/2) q0[109];
-rz(pi/4) q0[52];
-cx q0[0],q0[52];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[52];
-cx q0[0],q0[52];
-cx q0[109],q0[52];
-rz(pi/2) q0[110];
-sx q0[110];
-rz(8.05380955358979) q0[110];
-sx q0[110];
-rz(5*pi/2) q0[110];
-cx q0[110],q0[53];
-rz(pi/2) q0[110];
-sx q0[110];
-rz(pi/2) q0[110];
-cx q0[53],q0[110];
-rz(-pi/4) q0[110];
-cx q0[0],q0[110];
-rz(pi/4) q0[110];
-cx q0[53],q0[110];
-rz(-pi/4) q0[110];
-cx q0[0],q0[110];
-rz(3*pi/4) q0[110];
-sx q0[110];
-rz(pi/2) q0[110];
-rz(pi/4) q0[53];
-cx q0[0],q0[53];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[53];
-cx q0[0],q0[53];
-cx q0[110],q0[53];
-rz(pi/2) q0[111];
-sx q0[111];
-rz(-0.280870346410207) q0[111];
-sx q0[111];
-rz(5*pi/2) q0[111];
-cx q0[111],q0[54];
-rz(pi/2) q0[111];
-sx q0[111];
-rz(pi/2) q0[111];
-cx q0[54],q0[111];
-rz(-pi/4) q0[111];
-cx q0[0],q0[111];
-rz(pi/4) q0[111];
-cx q0[54],q0[111];
-rz(-pi/4) q0[111];
-cx q0[0],q0[111];
-rz(3*pi/4) q0[111];
-sx q0[111];
-rz(pi/2) q0[111];
-rz(pi/4) q0[54];
-cx q0[0],q0[54];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[54];
-cx q0[0],q0[54];
-cx q0[111],q0[54];
-rz(pi/2) q0[112];
-sx q0[112];
-rz(3.20240698458979) q0[112];
-sx q0[112];
-rz(5*pi/2) q0[112];
-cx q0[112],q0[55];
-rz(pi/2) q0[112];
-sx q0[112];
-rz(pi/2) q0[112];
-cx q0[55],q0[112];
-rz(-pi/4) q0[112];
-cx q0[0],q0[112];
-rz(pi/4) q0[112];
-cx q0[55],q0[112];
-rz(-pi/4) q0[112];
-cx q0[0],q0[112];
-rz(3*pi/4) q0[112];
-sx q0[112];
-rz(pi/2) q0[112];
-rz(pi/4) q0[55];
-cx q0[0],q0[55];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[55];
-cx q0[0],q0[55];
-cx q0[112],q0[55];
-rz(pi/2) q0[113];
-sx q0[113];
-rz(2.62880530358979) q0[113];
-sx q0[113];
-rz(5*pi/2) q0[113];
-cx q0[113],q0[56];
-rz(pi/2) q0[113];
-sx q0[113];
-rz(pi/2) q0[113];
-cx q0[56],q0[113];
-rz(-pi/4) q0[113];
-cx q0[0],q0[113];
-rz(pi/4) q0[113];
-cx q0[56],q0[113];
-rz(-pi/4) q0[113];
-cx q0[0],q0[113];
-rz(3*pi/4) q0[113];
-sx q0[113];
-rz(pi/2) q0[113];
-rz(pi/4) q0[56];
-cx q0[0],q0[56];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[56];
-cx q0[0],q0[56];
-cx q0[113],q0[56];
-rz(pi/2) q0[114];
-sx q0[114];
-rz(-1.89365984641021) q0[114];
-sx q0[114];
-rz(5*pi/2) q0[114];
-cx q0[114],q0[57];
-rz(pi/2) q0[114];
-sx q0[114];
-rz(pi/2) q0[114];
-cx q0[57],q0[114];
-rz(-pi/4) q0[114];
-cx q0[0],q0[114];
-rz(pi/4) q0[114];
-cx q0[57],q0[114];
-rz(-pi/4) q0[114];
-cx q0[0],q0[114];
-rz(3*pi/4) q0[114];
-sx q0[114];
-rz(pi/2) q0[114];
-rz(pi/4) q0[57];
-cx q0[0],q0[57];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[57];
-cx q0[0],q0[57];
-rz(pi/2) q0[0];
-sx q0[0];
-rz(pi/2) q0[0];
-cx q0[114],q0[57];
-measure q0[0] -> c0[0];
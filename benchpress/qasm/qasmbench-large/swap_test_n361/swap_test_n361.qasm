@@ -1,547 +0,0 @@
-OPENQASM 2.0;
-include "qelib1.inc";
-qreg q0[361];
-creg c0[1];
-rx(-3.6924814) q0[1];
-rx(-3.2923147) q0[181];
-rx(5.4291652) q0[2];
-rx(5.6875289) q0[182];
-rx(1.3594796) q0[3];
-rx(1.2065807) q0[183];
-rx(-5.9123043) q0[4];
-rx(-6.0041031) q0[184];
-rx(-0.13186279) q0[5];
-rx(0.50271205) q0[185];
-rx(-4.3869008) q0[6];
-rx(-4.1172873) q0[186];
-rx(4.9830092) q0[7];
-rx(4.8261369) q0[187];
-rx(-1.4181518) q0[8];
-rx(-1.5885531) q0[188];
-rx(3.9058792) q0[9];
-rx(3.2780951) q0[189];
-rx(2.1483107) q0[10];
-rx(2.2125048) q0[190];
-rx(-1.552265) q0[11];
-rx(-2.1338861) q0[191];
-rx(3.5437778) q0[12];
-rx(2.9294436) q0[192];
-rx(3.5074824) q0[13];
-rx(4.0850493) q0[193];
-rx(-3.1458178) q0[14];
-rx(-2.9631606) q0[194];
-rx(2.9808713) q0[15];
-rx(2.9322572) q0[195];
-rx(-4.5722067) q0[16];
-rx(-4.3125018) q0[196];
-rx(-2.9717581) q0[17];
-rx(-2.9593885) q0[197];
-rx(4.3812134) q0[18];
-rx(4.335384) q0[198];
-rx(-0.54413824) q0[19];
-rx(-0.18151701) q0[199];
-rx(2.8824416) q0[20];
-rx(3.026406) q0[200];
-rx(0.99178896) q0[21];
-rx(0.67977512) q0[201];
-rx(5.4169858) q0[22];
-rx(5.3901384) q0[202];
-rx(5.7239307) q0[23];
-rx(5.4778772) q0[203];
-rx(3.7629698) q0[24];
-rx(3.2416375) q0[204];
-rx(-4.5485128) q0[25];
-rx(-4.6932636) q0[205];
-rx(-1.2568228) q0[26];
-rx(-1.5358894) q0[206];
-rx(0.23981735) q0[27];
-rx(0.14196899) q0[207];
-rx(3.7984922) q0[28];
-rx(2.8545295) q0[208];
-rx(-3.8848018) q0[29];
-rx(-4.6828012) q0[209];
-rx(6.3001558) q0[30];
-rx(6.3839722) q0[210];
-rx(-3.4069529) q0[31];
-rx(-3.4187853) q0[211];
-rx(4.7466145) q0[32];
-rx(5.2615537) q0[212];
-rx(-2.1814104) q0[33];
-rx(-2.4920183) q0[213];
-rx(-0.57507011) q0[34];
-rx(-0.077795552) q0[214];
-rx(4.6805446) q0[35];
-rx(4.6515072) q0[215];
-rx(4.5772178) q0[36];
-rx(4.8120644) q0[216];
-rx(-4.7849305) q0[37];
-rx(-4.962639) q0[217];
-rx(5.0410485) q0[38];
-rx(4.1251127) q0[218];
-rx(2.8838226) q0[39];
-rx(3.4555457) q0[219];
-rx(0.44292461) q0[40];
-rx(0.56942526) q0[220];
-rx(3.7197327) q0[41];
-rx(3.2111797) q0[221];
-rx(-1.8943073) q0[42];
-rx(-2.7306572) q0[222];
-rx(-1.999106) q0[43];
-rx(-2.0374113) q0[223];
-rx(1.3418585) q0[44];
-rx(1.4501265) q0[224];
-rx(0.046586934) q0[45];
-rx(0.02156321) q0[225];
-rx(0.73527235) q0[46];
-rx(0.4687879) q0[226];
-rx(1.9151106) q0[47];
-rx(2.0856004) q0[227];
-rx(6.3955771) q0[48];
-rx(6.7713486) q0[228];
-rx(-2.5115015) q0[49];
-rx(-2.6921068) q0[229];
-rx(6.5211642) q0[50];
-rx(5.7855169) q0[230];
-rx(6.8379368) q0[51];
-rx(6.9857737) q0[231];
-rx(-2.2780919) q0[52];
-rx(-1.7109631) q0[232];
-rx(4.2623893) q0[53];
-rx(4.9122169) q0[233];
-rx(-3.7078176) q0[54];
-rx(-3.422463) q0[234];
-rx(0.22391519) q0[55];
-rx(0.060814331) q0[235];
-rx(0.096857984) q0[56];
-rx(-0.51278735) q0[236];
-rx(-5.1068641) q0[57];
-rx(-5.0352525) q0[237];
-rx(1.1543728) q0[58];
-rx(1.319854) q0[238];
-rx(5.8568848) q0[59];
-rx(6.3763221) q0[239];
-rx(6.3190782) q0[60];
-rx(5.6302223) q0[240];
-rx(5.6341856) q0[61];
-rx(5.6556796) q0[241];
-rx(2.1336755) q0[62];
-rx(2.5667855) q0[242];
-rx(-4.0970239) q0[63];
-rx(-4.2014397) q0[243];
-rx(2.2445044) q0[64];
-rx(2.324589) q0[244];
-rx(-2.1818261) q0[65];
-rx(-2.0482154) q0[245];
-rx(-3.3533693) q0[66];
-rx(-3.6480583) q0[246];
-rx(4.9059587) q0[67];
-rx(4.3998826) q0[247];
-rx(0.7139056) q0[68];
-rx(0.73642818) q0[248];
-rx(5.6124228) q0[69];
-rx(5.6506841) q0[249];
-rx(-1.1411557) q0[70];
-rx(-1.6811264) q0[250];
-rx(3.2711233) q0[71];
-rx(2.9185577) q0[251];
-rx(0.92759127) q0[72];
-rx(0.17358245) q0[252];
-rx(2.6582032) q0[73];
-rx(2.3037178) q0[253];
-rx(4.8551446) q0[74];
-rx(4.7000605) q0[254];
-rx(5.7703458) q0[75];
-rx(5.8717959) q0[255];
-rx(-1.9216475) q0[76];
-rx(-1.4892113) q0[256];
-rx(3.1840633) q0[77];
-rx(3.7863148) q0[257];
-rx(0.8899403) q0[78];
-rx(0.72543923) q0[258];
-rx(1.8913308) q0[79];
-rx(1.3974056) q0[259];
-rx(-5.6615452) q0[80];
-rx(-6.1819635) q0[260];
-rx(6.2855008) q0[81];
-rx(6.6248228) q0[261];
-rx(5.3608132) q0[82];
-rx(5.197115) q0[262];
-rx(-0.4728144) q0[83];
-rx(-1.1346169) q0[263];
-rx(6.7103164) q0[84];
-rx(5.9805975) q0[264];
-rx(4.3123765) q0[85];
-rx(4.301998) q0[265];
-rx(-4.6253459) q0[86];
-rx(-4.9610687) q0[266];
-rx(-3.4217858) q0[87];
-rx(-3.3051946) q0[267];
-rx(4.1129981) q0[88];
-rx(4.0115377) q0[268];
-rx(1.674348) q0[89];
-rx(2.0676231) q0[269];
-rx(4.7557704) q0[90];
-rx(4.9791479) q0[270];
-rx(0.88290043) q0[91];
-rx(0.5328541) q0[271];
-rx(5.1522939) q0[92];
-rx(4.6418072) q0[272];
-rx(2.8404581) q0[93];
-rx(3.6251008) q0[273];
-rx(-0.24648448) q0[94];
-rx(-1.1907803) q0[274];
-rx(4.2327467) q0[95];
-rx(3.7028201) q0[275];
-rx(5.6092432) q0[96];
-rx(6.0248922) q0[276];
-rx(-3.3646834) q0[97];
-rx(-3.2319543) q0[277];
-rx(-3.901024) q0[98];
-rx(-4.5133558) q0[278];
-rx(-1.4738139) q0[99];
-rx(-2.0967118) q0[279];
-rx(5.8886835) q0[100];
-rx(5.866537) q0[280];
-rx(-2.3279167) q0[101];
-rx(-2.4200032) q0[281];
-rx(2.231453) q0[102];
-rx(2.2743921) q0[282];
-rx(-0.32958664) q0[103];
-rx(-0.40479271) q0[283];
-rx(-4.5002795) q0[104];
-rx(-4.3862855) q0[284];
-rx(-5.6134957) q0[105];
-rx(-5.2804952) q0[285];
-rx(5.8076277) q0[106];
-rx(5.6921489) q0[286];
-rx(-4.042968) q0[107];
-rx(-3.5702073) q0[287];
-rx(6.8377517) q0[108];
-rx(6.3506749) q0[288];
-rx(-1.7781123) q0[109];
-rx(-1.9376241) q0[289];
-rx(-0.14198847) q0[110];
-rx(-0.21735253) q0[290];
-rx(-3.2630098) q0[111];
-rx(-3.3301175) q0[291];
-rx(-1.9844887) q0[112];
-rx(-2.1335076) q0[292];
-rx(-3.3940374) q0[113];
-rx(-3.5196064) q0[293];
-rx(-3.1232754) q0[114];
-rx(-3.6009081) q0[294];
-rx(5.0662374) q0[115];
-rx(5.2678313) q0[295];
-rx(0.85998891) q0[116];
-rx(1.4824409) q0[296];
-rx(2.690926) q0[117];
-rx(2.9443704) q0[297];
-rx(-2.6809906) q0[118];
-rx(-2.8907785) q0[298];
-rx(3.593235) q0[119];
-rx(4.1793883) q0[299];
-rx(-4.5231065) q0[120];
-rx(-5.0616817) q0[300];
-rx(5.3169658) q0[121];
-rx(6.1433344) q0[301];
-rx(-5.0019447) q0[122];
-rx(-4.9401837) q0[302];
-rx(-4.4640305) q0[123];
-rx(-4.279577) q0[303];
-rx(4.1727881) q0[124];
-rx(4.6285452) q0[304];
-rx(6.0883242) q0[125];
-rx(5.9804731) q0[305];
-rx(3.2972517) q0[126];
-rx(2.9641592) q0[306];
-rx(2.4148519) q0[127];
-rx(2.9615751) q0[307];
-rx(4.7913005) q0[128];
-rx(4.4997211) q0[308];
-rx(3.6959334) q0[129];
-rx(3.6759003) q0[309];
-rx(-4.508222) q0[130];
-rx(-4.6597826) q0[310];
-rx(-4.6884815) q0[131];
-rx(-4.9645186) q0[311];
-rx(4.6775913) q0[132];
-rx(5.3607883) q0[312];
-rx(6.4101211) q0[133];
-rx(6.3879251) q0[313];
-rx(4.9845057) q0[134];
-rx(4.4508876) q0[314];
-rx(2.8465881) q0[135];
-rx(3.2965802) q0[315];
-rx(2.892682) q0[136];
-rx(3.5354781) q0[316];
-rx(-4.1552167) q0[137];
-rx(-3.8718014) q0[317];
-rx(4.3365494) q0[138];
-rx(4.2077856) q0[318];
-rx(0.49293814) q0[139];
-rx(0.088965217) q0[319];
-rx(-4.5739317) q0[140];
-rx(-4.5139061) q0[320];
-rx(-4.1539028) q0[141];
-rx(-4.4186153) q0[321];
-rx(3.9446584) q0[142];
-rx(4.3692474) q0[322];
-rx(-1.8940288) q0[143];
-rx(-2.3993085) q0[323];
-rx(-0.87457796) q0[144];
-rx(-1.036967) q0[324];
-rx(3.7665018) q0[145];
-rx(4.1103612) q0[325];
-rx(4.3520535) q0[146];
-rx(4.2704336) q0[326];
-rx(-0.55758041) q0[147];
-rx(-0.39624022) q0[327];
-rx(-0.43633694) q0[148];
-rx(-0.27246979) q0[328];
-rx(-3.4420584) q0[149];
-rx(-3.2655263) q0[329];
-rx(-5.1655281) q0[150];
-rx(-4.8093183) q0[330];
-rx(-4.3789943) q0[151];
-rx(-4.8786812) q0[331];
-rx(4.6915486) q0[152];
-rx(4.562596) q0[332];
-rx(-2.5454702) q0[153];
-rx(-2.1736168) q0[333];
-rx(-1.0212872) q0[154];
-rx(-0.74921041) q0[334];
-rx(1.7643467) q0[155];
-rx(1.2725979) q0[335];
-rx(2.4939082) q0[156];
-rx(2.4905638) q0[336];
-rx(-1.0512173) q0[157];
-rx(-1.6312351) q0[337];
-rx(2.3742942) q0[158];
-rx(2.3078433) q0[338];
-rx(5.7536739) q0[159];
-rx(5.5349958) q0[339];
-rx(2.3346237) q0[160];
-rx(2.4241287) q0[340];
-rx(2.1191211) q0[161];
-rx(1.3571785) q0[341];
-rx(-1.1758494) q0[162];
-rx(-1.4146889) q0[342];
-rx(4.8243815) q0[163];
-rx(4.7464332) q0[343];
-rx(0.4537895) q0[164];
-rx(0.77719657) q0[344];
-rx(-1.3926907) q0[165];
-rx(-0.6678465) q0[345];
-rx(4.8428953) q0[166];
-rx(4.3767859) q0[346];
-rx(-3.1291023) q0[167];
-rx(-3.1440285) q0[347];
-rx(5.6996359) q0[168];
-rx(5.1733578) q0[348];
-rx(-4.9058798) q0[169];
-rx(-4.8108484) q0[349];
-rx(-0.89663461) q0[170];
-rx(-0.98852863) q0[350];
-rx(-3.798405) q0[171];
-rx(-3.4861604) q0[351];
-rx(4.1704015) q0[172];
-rx(4.2710988) q0[352];
-rx(4.0070183) q0[173];
-rx(4.4083824) q0[353];
-rx(-2.040684) q0[174];
-rx(-1.9453083) q0[354];
-rx(-5.4003829) q0[175];
-rx(-5.1268554) q0[355];
-rx(1.6036885) q0[176];
-rx(1.871735) q0[356];
-rx(2.2504526) q0[177];
-rx(1.5335221) q0[357];
-rx(-2.280643) q0[178];
-rx(-2.0769697) q0[358];
-rx(-0.21695779) q0[179];
-rx(-0.61861804) q0[359];
-rx(-3.3981408) q0[180];
-rx(-4.3556243) q0[360];
-h q0[0];
-cswap q0[0],q0[1],q0[181];
-cswap q0[0],q0[2],q0[182];
-cswap q0[0],q0[3],q0[183];
-cswap q0[0],q0[4],q0[184];
-cswap q0[0],q0[5],q0[185];
-cswap q0[0],q0[6],q0[186];
-cswap q0[0],q0[7],q0[187];
-cswap q0[0],q0[8],q0[188];
-cswap q0[0],q0[9],q0[189];
-cswap q0[0],q0[10],q0[190];
-cswap q0[0],q0[11],q0[191];
-cswap q0[0],q0[12],q0[192];
-cswap q0[0],q0[13],q0[193];
-cswap q0[0],q0[14],q0[194];
-cswap q0[0],q0[15],q0[195];
-cswap q0[0],q0[16],q0[196];
-cswap q0[0],q0[17],q0[197];
-cswap q0[0],q0[18],q0[198];
-cswap q0[0],q0[19],q0[199];
-cswap q0[0],q0[20],q0[200];
-cswap q0[0],q0[21],q0[201];
-cswap q0[0],q0[22],q0[202];
-cswap q0[0],q0[23],q0[203];
-cswap q0[0],q0[24],q0[204];
-cswap q0[0],q0[25],q0[205];
-cswap q0[0],q0[26],q0[206];
-cswap q0[0],q0[27],q0[207];
-cswap q0[0],q0[28],q0[208];
-cswap q0[0],q0[29],q0[209];
-cswap q0[0],q0[30],q0[210];
-cswap q0[0],q0[31],q0[211];
-cswap q0[0],q0[32],q0[212];
-cswap q0[0],q0[33],q0[213];
-cswap q0[0],q0[34],q0[214];
-cswap q0[0],q0[35],q0[215];
-cswap q0[0],q0[36],q0[216];
-cswap q0[0],q0[37],q0[217];
-cswap q0[0],q0[38],q0[218];
-cswap q0[0],q0[39],q0[219];
-cswap q0[0],q0[40],q0[220];
-cswap q0[0],q0[41],q0[221];
-cswap q0[0],q0[42],q0[222];
-cswap q0[0],q0[43],q0[223];
-cswap q0[0],q0[44],q0[224];
-cswap q0[0],q0[45],q0[225];
-cswap q0[0],q0[46],q0[226];
-cswap q0[0],q0[47],q0[227];
-cswap q0[0],q0[48],q0[228];
-cswap q0[0],q0[49],q0[229];
-cswap q0[0],q0[50],q0[230];
-cswap q0[0],q0[51],q0[231];
-cswap q0[0],q0[52],q0[232];
-cswap q0[0],q0[53],q0[233];
-cswap q0[0],q0[54],q0[234];
-cswap q0[0],q0[55],q0[235];
-cswap q0[0],q0[56],q0[236];
-cswap q0[0],q0[57],q0[237];
-cswap q0[0],q0[58],q0[238];
-cswap q0[0],q0[59],q0[239];
-cswap q0[0],q0[60],q0[240];
-cswap q0[0],q0[61],q0[241];
-cswap q0[0],q0[62],q0[242];
-cswap q0[0],q0[63],q0[243];
-cswap q0[0],q0[64],q0[244];
-cswap q0[0],q0[65],q0[245];
-cswap q0[0],q0[66],q0[246];
-cswap q0[0],q0[67],q0[247];
-cswap q0[0],q0[68],q0[248];
-cswap q0[0],q0[69],q0[249];
-cswap q0[0],q0[70],q0[250];
-cswap q0[0],q0[71],q0[251];
-cswap q0[0],q0[72],q0[252];
-cswap q0[0],q0[73],q0[253];
-cswap q0[0],q0[74],q0[254];
-cswap q0[0],q0[75],q0[255];
-cswap q0[0],q0[76],q0[256];
-cswap q0[0],q0[77],q0[257];
-cswap q0[0],q0[78],q0[258];
-cswap q0[0],q0[79],q0[259];
-cswap q0[0],q0[80],q0[260];
-cswap q0[0],q0[81],q0[261];
-cswap q0[0],q0[82],q0[262];
-cswap q0[0],q0[83],q0[263];
-cswap q0[0],q0[84],q0[264];
-cswap q0[0],q0[85],q0[265];
-cswap q0[0],q0[86],q0[266];
-cswap q0[0],q0[87],q0[267];
-cswap q0[0],q0[88],q0[268];
-cswap q0[0],q0[89],q0[269];
-cswap q0[0],q0[90],q0[270];
-cswap q0[0],q0[91],q0[271];
-cswap q0[0],q0[92],q0[272];
-cswap q0[0],q0[93],q0[273];
-cswap q0[0],q0[94],q0[274];
-cswap q0[0],q0[95],q0[275];
-cswap q0[0],q0[96],q0[276];
-cswap q0[0],q0[97],q0[277];
-cswap q0[0],q0[98],q0[278];
-cswap q0[0],q0[99],q0[279];
-cswap q0[0],q0[100],q0[280];
-cswap q0[0],q0[101],q0[281];
-cswap q0[0],q0[102],q0[282];
-cswap q0[0],q0[103],q0[283];
-cswap q0[0],q0[104],q0[284];
-cswap q0[0],q0[105],q0[285];
-cswap q0[0],q0[106],q0[286];
-cswap q0[0],q0[107],q0[287];
-cswap q0[0],q0[108],q0[288];
-cswap q0[0],q0[109],q0[289];
-cswap q0[0],q0[110],q0[290];
-cswap q0[0],q0[111],q0[291];
-cswap q0[0],q0[112],q0[292];
-cswap q0[0],q0[113],q0[293];
-cswap q0[0],q0[114],q0[294];
-cswap q0[0],q0[115],q0[295];
-cswap q0[0],q0[116],q0[296];
-cswap q0[0],q0[117],q0[297];
-cswap q0[0],q0[118],q0[298];
-cswap q0[0],q0[119],q0[299];
-cswap q0[0],q0[120],q0[300];
-cswap q0[0],q0[121],q0[301];
-cswap q0[0],q0[122],q0[302];
-cswap q0[0],q0[123],q0[303];
-cswap q0[0],q0[124],q0[304];
-cswap q0[0],q0[125],q0[305];
-cswap q0[0],q0[126],q0[306];
-cswap q0[0],q0[127],q0[307];
-cswap q0[0],q0[128],q0[308];
-cswap q0[0],q0[129],q0[309];
-cswap q0[0],q0[130],q0[310];
-cswap q0[0],q0[131],q0[311];
-cswap q0[0],q0[132],q0[312];
-cswap q0[0],q0[133],q0[313];
-cswap q0[0],q0[134],q0[314];
-cswap q0[0],q0[135],q0[315];
-cswap q0[0],q0[136],q0[316];
-cswap q0[0],q0[137],q0[317];
-cswap q0[0],q0[138],q0[318];
-cswap q0[0],q0[139],q0[319];
-cswap q0[0],q0[140],q0[320];
-cswap q0[0],q0[141],q0[321];
-cswap q0[0],q0[142],q0[322];
-cswap q0[0],q0[143],q0[323];
-cswap q0[0],q0[144],q0[324];
-cswap q0[0],q0[145],q0[325];
-cswap q0[0],q0[146],q0[326];
-cswap q0[0],q0[147],q0[327];
-cswap q0[0],q0[148],q0[328];
-cswap q0[0],q0[149],q0[329];
-cswap q0[0],q0[150],q0[330];
-cswap q0[0],q0[151],q0[331];
-cswap q0[0],q0[152],q0[332];
-cswap q0[0],q0[153],q0[333];
-cswap q0[0],q0[154],q0[334];
-cswap q0[0],q0[155],q0[335];
-cswap q0[0],q0[156],q0[336];
-cswap q0[0],q0[157],q0[337];
-cswap q0[0],q0[158],q0[338];
-cswap q0[0],q0[159],q0[339];
-cswap q0[0],q0[160],q0[340];
-cswap q0[0],q0[161],q0[341];
-cswap q0[0],q0[162],q0[342];
-cswap q0[0],q0[163],q0[343];
-cswap q0[0],q0[164],q0[344];
-cswap q0[0],q0[165],q0[345];
-cswap q0[0],q0[166],q0[346];
-cswap q0[0],q0[167],q0[347];
-cswap q0[0],q0[168],q0[348];
-cswap q0[0],q0[169],q0[349];
-cswap q0[0],q0[170],q0[350];
-cswap q0[0],q0[171],q0[351];
-cswap q0[0],q0[172],q0[352];
-cswap q0[0],q0[173],q0[353];
-cswap q0[0],q0[174],q0[354];
-cswap q0[0],q0[175],q0[355];
-cswap q0[0],q0[176],q0[356];
-cswap q0[0],q0[177],q0[357];
-cswap q0[0],q0[178],q0[358];
-cswap q0[0],q0[179],q0[359];
-cswap q0[0],q0[180],q0[360];
-h q0[0];
-measure q0[0] -> c0[0];
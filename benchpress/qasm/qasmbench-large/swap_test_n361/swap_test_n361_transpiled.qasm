@@ -1,5411 +0,0 @@
-OPENQASM 2.0;
-include "qelib1.inc";
-qreg q0[361];
-creg c0[1];
-rz(pi/2) q0[0];
-sx q0[0];
-rz(pi/2) q0[0];
-rz(pi/2) q0[1];
-sx q0[1];
-rz(-0.550888746410207) q0[1];
-sx q0[1];
-rz(5*pi/2) q0[1];
-rz(pi/2) q0[2];
-sx q0[2];
-rz(8.57075785358979) q0[2];
-sx q0[2];
-rz(5*pi/2) q0[2];
-rz(pi/2) q0[3];
-sx q0[3];
-rz(4.50107225358979) q0[3];
-sx q0[3];
-rz(5*pi/2) q0[3];
-rz(pi/2) q0[4];
-sx q0[4];
-rz(-2.77071164641021) q0[4];
-sx q0[4];
-rz(5*pi/2) q0[4];
-rz(pi/2) q0[5];
-sx q0[5];
-rz(3.00972986358979) q0[5];
-sx q0[5];
-rz(5*pi/2) q0[5];
-rz(pi/2) q0[6];
-sx q0[6];
-rz(-1.24530814641021) q0[6];
-sx q0[6];
-rz(5*pi/2) q0[6];
-rz(pi/2) q0[7];
-sx q0[7];
-rz(8.12460185358979) q0[7];
-sx q0[7];
-rz(5*pi/2) q0[7];
-rz(pi/2) q0[8];
-sx q0[8];
-rz(1.72344085358979) q0[8];
-sx q0[8];
-rz(5*pi/2) q0[8];
-rz(pi/2) q0[9];
-sx q0[9];
-rz(7.04747185358979) q0[9];
-sx q0[9];
-rz(5*pi/2) q0[9];
-rz(pi/2) q0[10];
-sx q0[10];
-rz(5.28990335358979) q0[10];
-sx q0[10];
-rz(5*pi/2) q0[10];
-rz(pi/2) q0[11];
-sx q0[11];
-rz(1.58932765358979) q0[11];
-sx q0[11];
-rz(5*pi/2) q0[11];
-rz(pi/2) q0[12];
-sx q0[12];
-rz(6.68537045358979) q0[12];
-sx q0[12];
-rz(5*pi/2) q0[12];
-rz(pi/2) q0[13];
-sx q0[13];
-rz(6.64907505358979) q0[13];
-sx q0[13];
-rz(5*pi/2) q0[13];
-rz(pi/2) q0[14];
-sx q0[14];
-rz(-0.00422514641020699) q0[14];
-sx q0[14];
-rz(5*pi/2) q0[14];
-rz(pi/2) q0[15];
-sx q0[15];
-rz(6.12246395358979) q0[15];
-sx q0[15];
-rz(5*pi/2) q0[15];
-rz(pi/2) q0[16];
-sx q0[16];
-rz(-1.43061404641021) q0[16];
-sx q0[16];
-rz(5*pi/2) q0[16];
-rz(pi/2) q0[17];
-sx q0[17];
-rz(0.169834553589793) q0[17];
-sx q0[17];
-rz(5*pi/2) q0[17];
-rz(pi/2) q0[18];
-sx q0[18];
-rz(7.52280605358979) q0[18];
-sx q0[18];
-rz(5*pi/2) q0[18];
-rz(pi/2) q0[19];
-sx q0[19];
-rz(2.59745441358979) q0[19];
-sx q0[19];
-rz(5*pi/2) q0[19];
-rz(pi/2) q0[20];
-sx q0[20];
-rz(6.02403425358979) q0[20];
-sx q0[20];
-rz(5*pi/2) q0[20];
-rz(pi/2) q0[21];
-sx q0[21];
-rz(4.13338161358979) q0[21];
-sx q0[21];
-rz(5*pi/2) q0[21];
-rz(pi/2) q0[22];
-sx q0[22];
-rz(8.55857845358979) q0[22];
-sx q0[22];
-rz(5*pi/2) q0[22];
-rz(pi/2) q0[23];
-sx q0[23];
-rz(8.86552335358979) q0[23];
-sx q0[23];
-rz(5*pi/2) q0[23];
-rz(pi/2) q0[24];
-sx q0[24];
-rz(6.90456245358979) q0[24];
-sx q0[24];
-rz(5*pi/2) q0[24];
-rz(pi/2) q0[25];
-sx q0[25];
-rz(-1.40692014641021) q0[25];
-sx q0[25];
-rz(5*pi/2) q0[25];
-rz(pi/2) q0[26];
-sx q0[26];
-rz(1.88476985358979) q0[26];
-sx q0[26];
-rz(5*pi/2) q0[26];
-rz(pi/2) q0[27];
-sx q0[27];
-rz(3.38141000358979) q0[27];
-sx q0[27];
-rz(5*pi/2) q0[27];
-rz(pi/2) q0[28];
-sx q0[28];
-rz(6.94008485358979) q0[28];
-sx q0[28];
-rz(5*pi/2) q0[28];
-rz(pi/2) q0[29];
-sx q0[29];
-rz(-0.743209146410207) q0[29];
-sx q0[29];
-rz(5*pi/2) q0[29];
-rz(pi/2) q0[30];
-sx q0[30];
-rz(9.44174845358979) q0[30];
-sx q0[30];
-rz(5*pi/2) q0[30];
-rz(pi/2) q0[31];
-sx q0[31];
-rz(-0.265360246410207) q0[31];
-sx q0[31];
-rz(5*pi/2) q0[31];
-rz(pi/2) q0[32];
-sx q0[32];
-rz(7.88820715358979) q0[32];
-sx q0[32];
-rz(5*pi/2) q0[32];
-rz(pi/2) q0[33];
-sx q0[33];
-rz(0.960182253589793) q0[33];
-sx q0[33];
-rz(5*pi/2) q0[33];
-rz(pi/2) q0[34];
-sx q0[34];
-rz(2.56652254358979) q0[34];
-sx q0[34];
-rz(5*pi/2) q0[34];
-rz(pi/2) q0[35];
-sx q0[35];
-rz(7.82213725358979) q0[35];
-sx q0[35];
-rz(5*pi/2) q0[35];
-rz(pi/2) q0[36];
-sx q0[36];
-rz(7.71881045358979) q0[36];
-sx q0[36];
-rz(5*pi/2) q0[36];
-rz(pi/2) q0[37];
-sx q0[37];
-rz(-1.64333784641021) q0[37];
-sx q0[37];
-rz(5*pi/2) q0[37];
-rz(pi/2) q0[38];
-sx q0[38];
-rz(8.18264115358979) q0[38];
-sx q0[38];
-rz(5*pi/2) q0[38];
-rz(pi/2) q0[39];
-sx q0[39];
-rz(6.02541525358979) q0[39];
-sx q0[39];
-rz(5*pi/2) q0[39];
-rz(pi/2) q0[40];
-sx q0[40];
-rz(3.58451726358979) q0[40];
-sx q0[40];
-rz(5*pi/2) q0[40];
-rz(pi/2) q0[41];
-sx q0[41];
-rz(6.86132535358979) q0[41];
-sx q0[41];
-rz(5*pi/2) q0[41];
-rz(pi/2) q0[42];
-sx q0[42];
-rz(1.24728535358979) q0[42];
-sx q0[42];
-rz(5*pi/2) q0[42];
-rz(pi/2) q0[43];
-sx q0[43];
-rz(1.14248665358979) q0[43];
-sx q0[43];
-rz(5*pi/2) q0[43];
-rz(pi/2) q0[44];
-sx q0[44];
-rz(4.48345115358979) q0[44];
-sx q0[44];
-rz(5*pi/2) q0[44];
-rz(pi/2) q0[45];
-sx q0[45];
-rz(3.18817958758979) q0[45];
-sx q0[45];
-rz(5*pi/2) q0[45];
-rz(pi/2) q0[46];
-sx q0[46];
-rz(3.87686500358979) q0[46];
-sx q0[46];
-rz(5*pi/2) q0[46];
-rz(pi/2) q0[47];
-sx q0[47];
-rz(5.05670325358979) q0[47];
-sx q0[47];
-rz(5*pi/2) q0[47];
-rz(pi/2) q0[48];
-sx q0[48];
-rz(9.53716975358979) q0[48];
-sx q0[48];
-rz(5*pi/2) q0[48];
-rz(pi/2) q0[49];
-sx q0[49];
-rz(0.630091153589793) q0[49];
-sx q0[49];
-rz(5*pi/2) q0[49];
-rz(pi/2) q0[50];
-sx q0[50];
-rz(9.66275685358979) q0[50];
-sx q0[50];
-rz(5*pi/2) q0[50];
-rz(pi/2) q0[51];
-sx q0[51];
-rz(9.97952945358979) q0[51];
-sx q0[51];
-rz(5*pi/2) q0[51];
-rz(pi/2) q0[52];
-sx q0[52];
-rz(0.863500753589793) q0[52];
-sx q0[52];
-rz(5*pi/2) q0[52];
-rz(pi/2) q0[53];
-sx q0[53];
-rz(7.40398195358979) q0[53];
-sx q0[53];
-rz(5*pi/2) q0[53];
-rz(pi/2) q0[54];
-sx q0[54];
-rz(-0.566224946410207) q0[54];
-sx q0[54];
-rz(5*pi/2) q0[54];
-rz(pi/2) q0[55];
-sx q0[55];
-rz(3.36550784358979) q0[55];
-sx q0[55];
-rz(5*pi/2) q0[55];
-rz(pi/2) q0[56];
-sx q0[56];
-rz(3.23845063758979) q0[56];
-sx q0[56];
-rz(5*pi/2) q0[56];
-rz(pi/2) q0[57];
-sx q0[57];
-rz(-1.96527144641021) q0[57];
-sx q0[57];
-rz(5*pi/2) q0[57];
-rz(pi/2) q0[58];
-sx q0[58];
-rz(4.29596545358979) q0[58];
-sx q0[58];
-rz(5*pi/2) q0[58];
-rz(pi/2) q0[59];
-sx q0[59];
-rz(8.99847745358979) q0[59];
-sx q0[59];
-rz(5*pi/2) q0[59];
-rz(pi/2) q0[60];
-sx q0[60];
-rz(9.46067085358979) q0[60];
-sx q0[60];
-rz(5*pi/2) q0[60];
-rz(pi/2) q0[61];
-sx q0[61];
-rz(8.77577825358979) q0[61];
-sx q0[61];
-rz(5*pi/2) q0[61];
-rz(pi/2) q0[62];
-sx q0[62];
-rz(5.27526815358979) q0[62];
-sx q0[62];
-rz(5*pi/2) q0[62];
-rz(pi/2) q0[63];
-sx q0[63];
-rz(-0.955431246410207) q0[63];
-sx q0[63];
-rz(5*pi/2) q0[63];
-rz(pi/2) q0[64];
-sx q0[64];
-rz(5.38609705358979) q0[64];
-sx q0[64];
-rz(5*pi/2) q0[64];
-rz(pi/2) q0[65];
-sx q0[65];
-rz(0.959766553589793) q0[65];
-sx q0[65];
-rz(5*pi/2) q0[65];
-rz(pi/2) q0[66];
-sx q0[66];
-rz(-0.211776646410207) q0[66];
-sx q0[66];
-rz(5*pi/2) q0[66];
-rz(pi/2) q0[67];
-sx q0[67];
-rz(8.04755135358979) q0[67];
-sx q0[67];
-rz(5*pi/2) q0[67];
-rz(pi/2) q0[68];
-sx q0[68];
-rz(3.85549825358979) q0[68];
-sx q0[68];
-rz(5*pi/2) q0[68];
-rz(pi/2) q0[69];
-sx q0[69];
-rz(8.75401545358979) q0[69];
-sx q0[69];
-rz(5*pi/2) q0[69];
-rz(pi/2) q0[70];
-sx q0[70];
-rz(2.00043695358979) q0[70];
-sx q0[70];
-rz(5*pi/2) q0[70];
-rz(pi/2) q0[71];
-sx q0[71];
-rz(6.41271595358979) q0[71];
-sx q0[71];
-rz(5*pi/2) q0[71];
-rz(pi/2) q0[72];
-sx q0[72];
-rz(4.06918392358979) q0[72];
-sx q0[72];
-rz(5*pi/2) q0[72];
-rz(pi/2) q0[73];
-sx q0[73];
-rz(5.79979585358979) q0[73];
-sx q0[73];
-rz(5*pi/2) q0[73];
-rz(pi/2) q0[74];
-sx q0[74];
-rz(7.99673725358979) q0[74];
-sx q0[74];
-rz(5*pi/2) q0[74];
-rz(pi/2) q0[75];
-sx q0[75];
-rz(8.91193845358979) q0[75];
-sx q0[75];
-rz(5*pi/2) q0[75];
-rz(pi/2) q0[76];
-sx q0[76];
-rz(1.21994515358979) q0[76];
-sx q0[76];
-rz(5*pi/2) q0[76];
-rz(pi/2) q0[77];
-sx q0[77];
-rz(6.32565595358979) q0[77];
-sx q0[77];
-rz(5*pi/2) q0[77];
-rz(pi/2) q0[78];
-sx q0[78];
-rz(4.03153295358979) q0[78];
-sx q0[78];
-rz(5*pi/2) q0[78];
-rz(pi/2) q0[79];
-sx q0[79];
-rz(5.03292345358979) q0[79];
-sx q0[79];
-rz(5*pi/2) q0[79];
-rz(pi/2) q0[80];
-sx q0[80];
-rz(-2.51995254641021) q0[80];
-sx q0[80];
-rz(5*pi/2) q0[80];
-rz(pi/2) q0[81];
-sx q0[81];
-rz(9.42709345358979) q0[81];
-sx q0[81];
-rz(5*pi/2) q0[81];
-rz(pi/2) q0[82];
-sx q0[82];
-rz(8.50240585358979) q0[82];
-sx q0[82];
-rz(5*pi/2) q0[82];
-rz(pi/2) q0[83];
-sx q0[83];
-rz(2.66877825358979) q0[83];
-sx q0[83];
-rz(5*pi/2) q0[83];
-rz(pi/2) q0[84];
-sx q0[84];
-rz(9.85190905358979) q0[84];
-sx q0[84];
-rz(5*pi/2) q0[84];
-rz(pi/2) q0[85];
-sx q0[85];
-rz(7.45396915358979) q0[85];
-sx q0[85];
-rz(5*pi/2) q0[85];
-rz(pi/2) q0[86];
-sx q0[86];
-rz(-1.48375324641021) q0[86];
-sx q0[86];
-rz(5*pi/2) q0[86];
-rz(pi/2) q0[87];
-sx q0[87];
-rz(-0.280193146410207) q0[87];
-sx q0[87];
-rz(5*pi/2) q0[87];
-rz(pi/2) q0[88];
-sx q0[88];
-rz(7.25459075358979) q0[88];
-sx q0[88];
-rz(5*pi/2) q0[88];
-rz(pi/2) q0[89];
-sx q0[89];
-rz(4.81594065358979) q0[89];
-sx q0[89];
-rz(5*pi/2) q0[89];
-rz(pi/2) q0[90];
-sx q0[90];
-rz(7.89736305358979) q0[90];
-sx q0[90];
-rz(5*pi/2) q0[90];
-rz(pi/2) q0[91];
-sx q0[91];
-rz(4.02449308358979) q0[91];
-sx q0[91];
-rz(5*pi/2) q0[91];
-rz(pi/2) q0[92];
-sx q0[92];
-rz(8.29388655358979) q0[92];
-sx q0[92];
-rz(5*pi/2) q0[92];
-rz(pi/2) q0[93];
-sx q0[93];
-rz(5.98205075358979) q0[93];
-sx q0[93];
-rz(5*pi/2) q0[93];
-rz(pi/2) q0[94];
-sx q0[94];
-rz(2.89510817358979) q0[94];
-sx q0[94];
-rz(5*pi/2) q0[94];
-rz(pi/2) q0[95];
-sx q0[95];
-rz(7.37433935358979) q0[95];
-sx q0[95];
-rz(5*pi/2) q0[95];
-rz(pi/2) q0[96];
-sx q0[96];
-rz(8.75083585358979) q0[96];
-sx q0[96];
-rz(5*pi/2) q0[96];
-rz(pi/2) q0[97];
-sx q0[97];
-rz(-0.223090746410207) q0[97];
-sx q0[97];
-rz(5*pi/2) q0[97];
-rz(pi/2) q0[98];
-sx q0[98];
-rz(-0.759431346410207) q0[98];
-sx q0[98];
-rz(5*pi/2) q0[98];
-rz(pi/2) q0[99];
-sx q0[99];
-rz(1.66777875358979) q0[99];
-sx q0[99];
-rz(5*pi/2) q0[99];
-rz(pi/2) q0[100];
-sx q0[100];
-rz(9.03027615358979) q0[100];
-sx q0[100];
-rz(5*pi/2) q0[100];
-rz(pi/2) q0[101];
-sx q0[101];
-rz(0.813675953589793) q0[101];
-sx q0[101];
-rz(5*pi/2) q0[101];
-rz(pi/2) q0[102];
-sx q0[102];
-rz(5.37304565358979) q0[102];
-sx q0[102];
-rz(5*pi/2) q0[102];
-rz(pi/2) q0[103];
-sx q0[103];
-rz(2.81200601358979) q0[103];
-sx q0[103];
-rz(5*pi/2) q0[103];
-rz(pi/2) q0[104];
-sx q0[104];
-rz(-1.35868684641021) q0[104];
-sx q0[104];
-rz(5*pi/2) q0[104];
-rz(pi/2) q0[105];
-sx q0[105];
-rz(-2.47190304641021) q0[105];
-sx q0[105];
-rz(5*pi/2) q0[105];
-rz(pi/2) q0[106];
-sx q0[106];
-rz(8.94922035358979) q0[106];
-sx q0[106];
-rz(5*pi/2) q0[106];
-rz(pi/2) q0[107];
-sx q0[107];
-rz(-0.901375346410207) q0[107];
-sx q0[107];
-rz(5*pi/2) q0[107];
-rz(pi/2) q0[108];
-sx q0[108];
-rz(9.97934435358979) q0[108];
-sx q0[108];
-rz(5*pi/2) q0[108];
-rz(pi/2) q0[109];
-sx q0[109];
-rz(1.36348035358979) q0[109];
-sx q0[109];
-rz(5*pi/2) q0[109];
-rz(pi/2) q0[110];
-sx q0[110];
-rz(2.99960418358979) q0[110];
-sx q0[110];
-rz(5*pi/2) q0[110];
-rz(pi/2) q0[111];
-sx q0[111];
-rz(-0.121417146410207) q0[111];
-sx q0[111];
-rz(5*pi/2) q0[111];
-rz(pi/2) q0[112];
-sx q0[112];
-rz(1.15710395358979) q0[112];
-sx q0[112];
-rz(5*pi/2) q0[112];
-rz(pi/2) q0[113];
-sx q0[113];
-rz(-0.252444746410207) q0[113];
-sx q0[113];
-rz(5*pi/2) q0[113];
-rz(pi/2) q0[114];
-sx q0[114];
-rz(0.0183172535897933) q0[114];
-sx q0[114];
-rz(5*pi/2) q0[114];
-rz(pi/2) q0[115];
-sx q0[115];
-rz(8.20783005358979) q0[115];
-sx q0[115];
-rz(5*pi/2) q0[115];
-rz(pi/2) q0[116];
-sx q0[116];
-rz(4.00158156358979) q0[116];
-sx q0[116];
-rz(5*pi/2) q0[116];
-rz(pi/2) q0[117];
-sx q0[117];
-rz(5.83251865358979) q0[117];
-sx q0[117];
-rz(5*pi/2) q0[117];
-rz(pi/2) q0[118];
-sx q0[118];
-rz(0.460602053589793) q0[118];
-sx q0[118];
-rz(5*pi/2) q0[118];
-rz(pi/2) q0[119];
-sx q0[119];
-rz(6.73482765358979) q0[119];
-sx q0[119];
-rz(5*pi/2) q0[119];
-rz(pi/2) q0[120];
-sx q0[120];
-rz(-1.38151384641021) q0[120];
-sx q0[120];
-rz(5*pi/2) q0[120];
-rz(pi/2) q0[121];
-sx q0[121];
-rz(8.45855845358979) q0[121];
-sx q0[121];
-rz(5*pi/2) q0[121];
-rz(pi/2) q0[122];
-sx q0[122];
-rz(-1.86035204641021) q0[122];
-sx q0[122];
-rz(5*pi/2) q0[122];
-rz(pi/2) q0[123];
-sx q0[123];
-rz(-1.32243784641021) q0[123];
-sx q0[123];
-rz(5*pi/2) q0[123];
-rz(pi/2) q0[124];
-sx q0[124];
-rz(7.31438075358979) q0[124];
-sx q0[124];
-rz(5*pi/2) q0[124];
-rz(pi/2) q0[125];
-sx q0[125];
-rz(9.22991685358979) q0[125];
-sx q0[125];
-rz(5*pi/2) q0[125];
-rz(pi/2) q0[126];
-sx q0[126];
-rz(6.43884435358979) q0[126];
-sx q0[126];
-rz(5*pi/2) q0[126];
-rz(pi/2) q0[127];
-sx q0[127];
-rz(5.55644455358979) q0[127];
-sx q0[127];
-rz(5*pi/2) q0[127];
-rz(pi/2) q0[128];
-sx q0[128];
-rz(7.93289315358979) q0[128];
-sx q0[128];
-rz(5*pi/2) q0[128];
-rz(pi/2) q0[129];
-sx q0[129];
-rz(6.83752605358979) q0[129];
-sx q0[129];
-rz(5*pi/2) q0[129];
-rz(pi/2) q0[130];
-sx q0[130];
-rz(-1.36662934641021) q0[130];
-sx q0[130];
-rz(5*pi/2) q0[130];
-rz(pi/2) q0[131];
-sx q0[131];
-rz(-1.54688884641021) q0[131];
-sx q0[131];
-rz(5*pi/2) q0[131];
-rz(pi/2) q0[132];
-sx q0[132];
-rz(7.81918395358979) q0[132];
-sx q0[132];
-rz(5*pi/2) q0[132];
-rz(pi/2) q0[133];
-sx q0[133];
-rz(9.55171375358979) q0[133];
-sx q0[133];
-rz(5*pi/2) q0[133];
-rz(pi/2) q0[134];
-sx q0[134];
-rz(8.12609835358979) q0[134];
-sx q0[134];
-rz(5*pi/2) q0[134];
-rz(pi/2) q0[135];
-sx q0[135];
-rz(5.98818075358979) q0[135];
-sx q0[135];
-rz(5*pi/2) q0[135];
-rz(pi/2) q0[136];
-sx q0[136];
-rz(6.03427465358979) q0[136];
-sx q0[136];
-rz(5*pi/2) q0[136];
-rz(pi/2) q0[137];
-sx q0[137];
-rz(-1.01362404641021) q0[137];
-sx q0[137];
-rz(5*pi/2) q0[137];
-rz(pi/2) q0[138];
-sx q0[138];
-rz(7.47814205358979) q0[138];
-sx q0[138];
-rz(5*pi/2) q0[138];
-rz(pi/2) q0[139];
-sx q0[139];
-rz(3.63453079358979) q0[139];
-sx q0[139];
-rz(5*pi/2) q0[139];
-rz(pi/2) q0[140];
-sx q0[140];
-rz(-1.43233904641021) q0[140];
-sx q0[140];
-rz(5*pi/2) q0[140];
-rz(pi/2) q0[141];
-sx q0[141];
-rz(-1.01231014641021) q0[141];
-sx q0[141];
-rz(5*pi/2) q0[141];
-rz(pi/2) q0[142];
-sx q0[142];
-rz(7.08625105358979) q0[142];
-sx q0[142];
-rz(5*pi/2) q0[142];
-rz(pi/2) q0[143];
-sx q0[143];
-rz(1.24756385358979) q0[143];
-sx q0[143];
-rz(5*pi/2) q0[143];
-rz(pi/2) q0[144];
-sx q0[144];
-rz(2.26701469358979) q0[144];
-sx q0[144];
-rz(5*pi/2) q0[144];
-rz(pi/2) q0[145];
-sx q0[145];
-rz(6.90809445358979) q0[145];
-sx q0[145];
-rz(5*pi/2) q0[145];
-rz(pi/2) q0[146];
-sx q0[146];
-rz(7.49364615358979) q0[146];
-sx q0[146];
-rz(5*pi/2) q0[146];
-rz(pi/2) q0[147];
-sx q0[147];
-rz(2.58401224358979) q0[147];
-sx q0[147];
-rz(5*pi/2) q0[147];
-rz(pi/2) q0[148];
-sx q0[148];
-rz(2.70525571358979) q0[148];
-sx q0[148];
-rz(5*pi/2) q0[148];
-rz(pi/2) q0[149];
-sx q0[149];
-rz(-0.300465746410207) q0[149];
-sx q0[149];
-rz(5*pi/2) q0[149];
-rz(pi/2) q0[150];
-sx q0[150];
-rz(-2.02393544641021) q0[150];
-sx q0[150];
-rz(5*pi/2) q0[150];
-rz(pi/2) q0[151];
-sx q0[151];
-rz(-1.23740164641021) q0[151];
-sx q0[151];
-rz(5*pi/2) q0[151];
-rz(pi/2) q0[152];
-sx q0[152];
-rz(7.83314125358979) q0[152];
-sx q0[152];
-rz(5*pi/2) q0[152];
-rz(pi/2) q0[153];
-sx q0[153];
-rz(0.596122453589793) q0[153];
-sx q0[153];
-rz(5*pi/2) q0[153];
-rz(pi/2) q0[154];
-sx q0[154];
-rz(2.12030545358979) q0[154];
-sx q0[154];
-rz(5*pi/2) q0[154];
-rz(pi/2) q0[155];
-sx q0[155];
-rz(4.90593935358979) q0[155];
-sx q0[155];
-rz(5*pi/2) q0[155];
-rz(pi/2) q0[156];
-sx q0[156];
-rz(5.63550085358979) q0[156];
-sx q0[156];
-rz(5*pi/2) q0[156];
-rz(pi/2) q0[157];
-sx q0[157];
-rz(2.09037535358979) q0[157];
-sx q0[157];
-rz(5*pi/2) q0[157];
-rz(pi/2) q0[158];
-sx q0[158];
-rz(5.51588685358979) q0[158];
-sx q0[158];
-rz(5*pi/2) q0[158];
-rz(pi/2) q0[159];
-sx q0[159];
-rz(8.89526655358979) q0[159];
-sx q0[159];
-rz(5*pi/2) q0[159];
-rz(pi/2) q0[160];
-sx q0[160];
-rz(5.47621635358979) q0[160];
-sx q0[160];
-rz(5*pi/2) q0[160];
-rz(pi/2) q0[161];
-sx q0[161];
-rz(5.26071375358979) q0[161];
-sx q0[161];
-rz(5*pi/2) q0[161];
-rz(pi/2) q0[162];
-sx q0[162];
-rz(1.96574325358979) q0[162];
-sx q0[162];
-rz(5*pi/2) q0[162];
-rz(pi/2) q0[163];
-sx q0[163];
-rz(7.96597415358979) q0[163];
-sx q0[163];
-rz(5*pi/2) q0[163];
-rz(pi/2) q0[164];
-sx q0[164];
-rz(3.59538215358979) q0[164];
-sx q0[164];
-rz(5*pi/2) q0[164];
-rz(pi/2) q0[165];
-sx q0[165];
-rz(1.74890195358979) q0[165];
-sx q0[165];
-rz(5*pi/2) q0[165];
-rz(pi/2) q0[166];
-sx q0[166];
-rz(7.98448795358979) q0[166];
-sx q0[166];
-rz(5*pi/2) q0[166];
-rz(pi/2) q0[167];
-sx q0[167];
-rz(0.0124903535897931) q0[167];
-sx q0[167];
-rz(5*pi/2) q0[167];
-rz(pi/2) q0[168];
-sx q0[168];
-rz(8.84122855358979) q0[168];
-sx q0[168];
-rz(5*pi/2) q0[168];
-rz(pi/2) q0[169];
-sx q0[169];
-rz(-1.76428714641021) q0[169];
-sx q0[169];
-rz(5*pi/2) q0[169];
-rz(pi/2) q0[170];
-sx q0[170];
-rz(2.24495804358979) q0[170];
-sx q0[170];
-rz(5*pi/2) q0[170];
-rz(pi/2) q0[171];
-sx q0[171];
-rz(-0.656812346410207) q0[171];
-sx q0[171];
-rz(5*pi/2) q0[171];
-rz(pi/2) q0[172];
-sx q0[172];
-rz(7.31199415358979) q0[172];
-sx q0[172];
-rz(5*pi/2) q0[172];
-rz(pi/2) q0[173];
-sx q0[173];
-rz(7.14861095358979) q0[173];
-sx q0[173];
-rz(5*pi/2) q0[173];
-rz(pi/2) q0[174];
-sx q0[174];
-rz(1.10090865358979) q0[174];
-sx q0[174];
-rz(5*pi/2) q0[174];
-rz(pi/2) q0[175];
-sx q0[175];
-rz(-2.25879024641021) q0[175];
-sx q0[175];
-rz(5*pi/2) q0[175];
-rz(pi/2) q0[176];
-sx q0[176];
-rz(4.74528115358979) q0[176];
-sx q0[176];
-rz(5*pi/2) q0[176];
-rz(pi/2) q0[177];
-sx q0[177];
-rz(5.39204525358979) q0[177];
-sx q0[177];
-rz(5*pi/2) q0[177];
-rz(pi/2) q0[178];
-sx q0[178];
-rz(0.860949653589793) q0[178];
-sx q0[178];
-rz(5*pi/2) q0[178];
-rz(pi/2) q0[179];
-sx q0[179];
-rz(2.92463486358979) q0[179];
-sx q0[179];
-rz(5*pi/2) q0[179];
-rz(pi/2) q0[180];
-sx q0[180];
-rz(-0.256548146410207) q0[180];
-sx q0[180];
-rz(5*pi/2) q0[180];
-rz(pi/2) q0[181];
-sx q0[181];
-rz(-0.150722046410207) q0[181];
-sx q0[181];
-rz(5*pi/2) q0[181];
-cx q0[181],q0[1];
-rz(pi/2) q0[181];
-sx q0[181];
-rz(pi/2) q0[181];
-cx q0[1],q0[181];
-rz(-pi/4) q0[181];
-cx q0[0],q0[181];
-rz(pi/4) q0[181];
-cx q0[1],q0[181];
-rz(pi/4) q0[1];
-rz(-pi/4) q0[181];
-cx q0[0],q0[181];
-cx q0[0],q0[1];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[1];
-cx q0[0],q0[1];
-rz(3*pi/4) q0[181];
-sx q0[181];
-rz(pi/2) q0[181];
-cx q0[181],q0[1];
-rz(pi/2) q0[182];
-sx q0[182];
-rz(8.82912155358979) q0[182];
-sx q0[182];
-rz(5*pi/2) q0[182];
-cx q0[182],q0[2];
-rz(pi/2) q0[182];
-sx q0[182];
-rz(pi/2) q0[182];
-cx q0[2],q0[182];
-rz(-pi/4) q0[182];
-cx q0[0],q0[182];
-rz(pi/4) q0[182];
-cx q0[2],q0[182];
-rz(-pi/4) q0[182];
-cx q0[0],q0[182];
-rz(3*pi/4) q0[182];
-sx q0[182];
-rz(pi/2) q0[182];
-rz(pi/4) q0[2];
-cx q0[0],q0[2];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[2];
-cx q0[0],q0[2];
-cx q0[182],q0[2];
-rz(pi/2) q0[183];
-sx q0[183];
-rz(4.34817335358979) q0[183];
-sx q0[183];
-rz(5*pi/2) q0[183];
-cx q0[183],q0[3];
-rz(pi/2) q0[183];
-sx q0[183];
-rz(pi/2) q0[183];
-cx q0[3],q0[183];
-rz(-pi/4) q0[183];
-cx q0[0],q0[183];
-rz(pi/4) q0[183];
-cx q0[3],q0[183];
-rz(-pi/4) q0[183];
-cx q0[0],q0[183];
-rz(3*pi/4) q0[183];
-sx q0[183];
-rz(pi/2) q0[183];
-rz(pi/4) q0[3];
-cx q0[0],q0[3];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[3];
-cx q0[0],q0[3];
-cx q0[183],q0[3];
-rz(pi/2) q0[184];
-sx q0[184];
-rz(-2.86251044641021) q0[184];
-sx q0[184];
-rz(5*pi/2) q0[184];
-cx q0[184],q0[4];
-rz(pi/2) q0[184];
-sx q0[184];
-rz(pi/2) q0[184];
-cx q0[4],q0[184];
-rz(-pi/4) q0[184];
-cx q0[0],q0[184];
-rz(pi/4) q0[184];
-cx q0[4],q0[184];
-rz(-pi/4) q0[184];
-cx q0[0],q0[184];
-rz(3*pi/4) q0[184];
-sx q0[184];
-rz(pi/2) q0[184];
-rz(pi/4) q0[4];
-cx q0[0],q0[4];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[4];
-cx q0[0],q0[4];
-cx q0[184],q0[4];
-rz(pi/2) q0[185];
-sx q0[185];
-rz(3.64430470358979) q0[185];
-sx q0[185];
-rz(5*pi/2) q0[185];
-cx q0[185],q0[5];
-rz(pi/2) q0[185];
-sx q0[185];
-rz(pi/2) q0[185];
-cx q0[5],q0[185];
-rz(-pi/4) q0[185];
-cx q0[0],q0[185];
-rz(pi/4) q0[185];
-cx q0[5],q0[185];
-rz(-pi/4) q0[185];
-cx q0[0],q0[185];
-rz(3*pi/4) q0[185];
-sx q0[185];
-rz(pi/2) q0[185];
-rz(pi/4) q0[5];
-cx q0[0],q0[5];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[5];
-cx q0[0],q0[5];
-cx q0[185],q0[5];
-rz(pi/2) q0[186];
-sx q0[186];
-rz(-0.975694646410207) q0[186];
-sx q0[186];
-rz(5*pi/2) q0[186];
-cx q0[186],q0[6];
-rz(pi/2) q0[186];
-sx q0[186];
-rz(pi/2) q0[186];
-cx q0[6],q0[186];
-rz(-pi/4) q0[186];
-cx q0[0],q0[186];
-rz(pi/4) q0[186];
-cx q0[6],q0[186];
-rz(-pi/4) q0[186];
-cx q0[0],q0[186];
-rz(3*pi/4) q0[186];
-sx q0[186];
-rz(pi/2) q0[186];
-rz(pi/4) q0[6];
-cx q0[0],q0[6];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[6];
-cx q0[0],q0[6];
-cx q0[186],q0[6];
-rz(pi/2) q0[187];
-sx q0[187];
-rz(7.96772955358979) q0[187];
-sx q0[187];
-rz(5*pi/2) q0[187];
-cx q0[187],q0[7];
-rz(pi/2) q0[187];
-sx q0[187];
-rz(pi/2) q0[187];
-cx q0[7],q0[187];
-rz(-pi/4) q0[187];
-cx q0[0],q0[187];
-rz(pi/4) q0[187];
-cx q0[7],q0[187];
-rz(-pi/4) q0[187];
-cx q0[0],q0[187];
-rz(3*pi/4) q0[187];
-sx q0[187];
-rz(pi/2) q0[187];
-rz(pi/4) q0[7];
-cx q0[0],q0[7];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[7];
-cx q0[0],q0[7];
-cx q0[187],q0[7];
-rz(pi/2) q0[188];
-sx q0[188];
-rz(1.55303955358979) q0[188];
-sx q0[188];
-rz(5*pi/2) q0[188];
-cx q0[188],q0[8];
-rz(pi/2) q0[188];
-sx q0[188];
-rz(pi/2) q0[188];
-cx q0[8],q0[188];
-rz(-pi/4) q0[188];
-cx q0[0],q0[188];
-rz(pi/4) q0[188];
-cx q0[8],q0[188];
-rz(-pi/4) q0[188];
-cx q0[0],q0[188];
-rz(3*pi/4) q0[188];
-sx q0[188];
-rz(pi/2) q0[188];
-rz(pi/4) q0[8];
-cx q0[0],q0[8];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[8];
-cx q0[0],q0[8];
-cx q0[188],q0[8];
-rz(pi/2) q0[189];
-sx q0[189];
-rz(6.41968775358979) q0[189];
-sx q0[189];
-rz(5*pi/2) q0[189];
-cx q0[189],q0[9];
-rz(pi/2) q0[189];
-sx q0[189];
-rz(pi/2) q0[189];
-cx q0[9],q0[189];
-rz(-pi/4) q0[189];
-cx q0[0],q0[189];
-rz(pi/4) q0[189];
-cx q0[9],q0[189];
-rz(-pi/4) q0[189];
-cx q0[0],q0[189];
-rz(3*pi/4) q0[189];
-sx q0[189];
-rz(pi/2) q0[189];
-rz(pi/4) q0[9];
-cx q0[0],q0[9];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[9];
-cx q0[0],q0[9];
-cx q0[189],q0[9];
-rz(pi/2) q0[190];
-sx q0[190];
-rz(5.35409745358979) q0[190];
-sx q0[190];
-rz(5*pi/2) q0[190];
-cx q0[190],q0[10];
-rz(pi/2) q0[190];
-sx q0[190];
-rz(pi/2) q0[190];
-cx q0[10],q0[190];
-rz(-pi/4) q0[190];
-cx q0[0],q0[190];
-rz(pi/4) q0[190];
-cx q0[10],q0[190];
-rz(pi/4) q0[10];
-rz(-pi/4) q0[190];
-cx q0[0],q0[190];
-cx q0[0],q0[10];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[10];
-cx q0[0],q0[10];
-rz(3*pi/4) q0[190];
-sx q0[190];
-rz(pi/2) q0[190];
-cx q0[190],q0[10];
-rz(pi/2) q0[191];
-sx q0[191];
-rz(1.00770655358979) q0[191];
-sx q0[191];
-rz(5*pi/2) q0[191];
-cx q0[191],q0[11];
-rz(pi/2) q0[191];
-sx q0[191];
-rz(pi/2) q0[191];
-cx q0[11],q0[191];
-rz(-pi/4) q0[191];
-cx q0[0],q0[191];
-rz(pi/4) q0[191];
-cx q0[11],q0[191];
-rz(pi/4) q0[11];
-rz(-pi/4) q0[191];
-cx q0[0],q0[191];
-cx q0[0],q0[11];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[11];
-cx q0[0],q0[11];
-rz(3*pi/4) q0[191];
-sx q0[191];
-rz(pi/2) q0[191];
-cx q0[191],q0[11];
-rz(pi/2) q0[192];
-sx q0[192];
-rz(6.07103625358979) q0[192];
-sx q0[192];
-rz(5*pi/2) q0[192];
-cx q0[192],q0[12];
-rz(pi/2) q0[192];
-sx q0[192];
-rz(pi/2) q0[192];
-cx q0[12],q0[192];
-rz(-pi/4) q0[192];
-cx q0[0],q0[192];
-rz(pi/4) q0[192];
-cx q0[12],q0[192];
-rz(pi/4) q0[12];
-rz(-pi/4) q0[192];
-cx q0[0],q0[192];
-cx q0[0],q0[12];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[12];
-cx q0[0],q0[12];
-rz(3*pi/4) q0[192];
-sx q0[192];
-rz(pi/2) q0[192];
-cx q0[192],q0[12];
-rz(pi/2) q0[193];
-sx q0[193];
-rz(7.22664195358979) q0[193];
-sx q0[193];
-rz(5*pi/2) q0[193];
-cx q0[193],q0[13];
-rz(pi/2) q0[193];
-sx q0[193];
-rz(pi/2) q0[193];
-cx q0[13],q0[193];
-rz(-pi/4) q0[193];
-cx q0[0],q0[193];
-rz(pi/4) q0[193];
-cx q0[13],q0[193];
-rz(pi/4) q0[13];
-rz(-pi/4) q0[193];
-cx q0[0],q0[193];
-cx q0[0],q0[13];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[13];
-cx q0[0],q0[13];
-rz(3*pi/4) q0[193];
-sx q0[193];
-rz(pi/2) q0[193];
-cx q0[193],q0[13];
-rz(pi/2) q0[194];
-sx q0[194];
-rz(0.178432053589793) q0[194];
-sx q0[194];
-rz(5*pi/2) q0[194];
-cx q0[194],q0[14];
-rz(pi/2) q0[194];
-sx q0[194];
-rz(pi/2) q0[194];
-cx q0[14],q0[194];
-rz(-pi/4) q0[194];
-cx q0[0],q0[194];
-rz(pi/4) q0[194];
-cx q0[14],q0[194];
-rz(pi/4) q0[14];
-rz(-pi/4) q0[194];
-cx q0[0],q0[194];
-cx q0[0],q0[14];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[14];
-cx q0[0],q0[14];
-rz(3*pi/4) q0[194];
-sx q0[194];
-rz(pi/2) q0[194];
-cx q0[194],q0[14];
-rz(pi/2) q0[195];
-sx q0[195];
-rz(6.07384985358979) q0[195];
-sx q0[195];
-rz(5*pi/2) q0[195];
-cx q0[195],q0[15];
-rz(pi/2) q0[195];
-sx q0[195];
-rz(pi/2) q0[195];
-cx q0[15],q0[195];
-rz(-pi/4) q0[195];
-cx q0[0],q0[195];
-rz(pi/4) q0[195];
-cx q0[15],q0[195];
-rz(pi/4) q0[15];
-rz(-pi/4) q0[195];
-cx q0[0],q0[195];
-cx q0[0],q0[15];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[15];
-cx q0[0],q0[15];
-rz(3*pi/4) q0[195];
-sx q0[195];
-rz(pi/2) q0[195];
-cx q0[195],q0[15];
-rz(pi/2) q0[196];
-sx q0[196];
-rz(-1.17090914641021) q0[196];
-sx q0[196];
-rz(5*pi/2) q0[196];
-cx q0[196],q0[16];
-rz(pi/2) q0[196];
-sx q0[196];
-rz(pi/2) q0[196];
-cx q0[16],q0[196];
-rz(-pi/4) q0[196];
-cx q0[0],q0[196];
-rz(pi/4) q0[196];
-cx q0[16],q0[196];
-rz(pi/4) q0[16];
-rz(-pi/4) q0[196];
-cx q0[0],q0[196];
-cx q0[0],q0[16];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[16];
-cx q0[0],q0[16];
-rz(3*pi/4) q0[196];
-sx q0[196];
-rz(pi/2) q0[196];
-cx q0[196],q0[16];
-rz(pi/2) q0[197];
-sx q0[197];
-rz(0.182204153589793) q0[197];
-sx q0[197];
-rz(5*pi/2) q0[197];
-cx q0[197],q0[17];
-rz(pi/2) q0[197];
-sx q0[197];
-rz(pi/2) q0[197];
-cx q0[17],q0[197];
-rz(-pi/4) q0[197];
-cx q0[0],q0[197];
-rz(pi/4) q0[197];
-cx q0[17],q0[197];
-rz(pi/4) q0[17];
-rz(-pi/4) q0[197];
-cx q0[0],q0[197];
-cx q0[0],q0[17];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[17];
-cx q0[0],q0[17];
-rz(3*pi/4) q0[197];
-sx q0[197];
-rz(pi/2) q0[197];
-cx q0[197],q0[17];
-rz(pi/2) q0[198];
-sx q0[198];
-rz(7.47697665358979) q0[198];
-sx q0[198];
-rz(5*pi/2) q0[198];
-cx q0[198],q0[18];
-rz(pi/2) q0[198];
-sx q0[198];
-rz(pi/2) q0[198];
-cx q0[18],q0[198];
-rz(-pi/4) q0[198];
-cx q0[0],q0[198];
-rz(pi/4) q0[198];
-cx q0[18],q0[198];
-rz(pi/4) q0[18];
-rz(-pi/4) q0[198];
-cx q0[0],q0[198];
-cx q0[0],q0[18];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[18];
-cx q0[0],q0[18];
-rz(3*pi/4) q0[198];
-sx q0[198];
-rz(pi/2) q0[198];
-cx q0[198],q0[18];
-rz(pi/2) q0[199];
-sx q0[199];
-rz(2.96007564358979) q0[199];
-sx q0[199];
-rz(5*pi/2) q0[199];
-cx q0[199],q0[19];
-rz(pi/2) q0[199];
-sx q0[199];
-rz(pi/2) q0[199];
-cx q0[19],q0[199];
-rz(-pi/4) q0[199];
-cx q0[0],q0[199];
-rz(pi/4) q0[199];
-cx q0[19],q0[199];
-rz(pi/4) q0[19];
-rz(-pi/4) q0[199];
-cx q0[0],q0[199];
-cx q0[0],q0[19];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[19];
-cx q0[0],q0[19];
-rz(3*pi/4) q0[199];
-sx q0[199];
-rz(pi/2) q0[199];
-cx q0[199],q0[19];
-rz(pi/2) q0[200];
-sx q0[200];
-rz(6.16799865358979) q0[200];
-sx q0[200];
-rz(5*pi/2) q0[200];
-cx q0[200],q0[20];
-rz(pi/2) q0[200];
-sx q0[200];
-rz(pi/2) q0[200];
-cx q0[20],q0[200];
-rz(-pi/4) q0[200];
-cx q0[0],q0[200];
-rz(pi/4) q0[200];
-cx q0[20],q0[200];
-rz(pi/4) q0[20];
-rz(-pi/4) q0[200];
-cx q0[0],q0[200];
-cx q0[0],q0[20];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[20];
-cx q0[0],q0[20];
-rz(3*pi/4) q0[200];
-sx q0[200];
-rz(pi/2) q0[200];
-cx q0[200],q0[20];
-rz(pi/2) q0[201];
-sx q0[201];
-rz(3.82136777358979) q0[201];
-sx q0[201];
-rz(5*pi/2) q0[201];
-cx q0[201],q0[21];
-rz(pi/2) q0[201];
-sx q0[201];
-rz(pi/2) q0[201];
-cx q0[21],q0[201];
-rz(-pi/4) q0[201];
-cx q0[0],q0[201];
-rz(pi/4) q0[201];
-cx q0[21],q0[201];
-rz(-pi/4) q0[201];
-cx q0[0],q0[201];
-rz(3*pi/4) q0[201];
-sx q0[201];
-rz(pi/2) q0[201];
-rz(pi/4) q0[21];
-cx q0[0],q0[21];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[21];
-cx q0[0],q0[21];
-cx q0[201],q0[21];
-rz(pi/2) q0[202];
-sx q0[202];
-rz(8.53173105358979) q0[202];
-sx q0[202];
-rz(5*pi/2) q0[202];
-cx q0[202],q0[22];
-rz(pi/2) q0[202];
-sx q0[202];
-rz(pi/2) q0[202];
-cx q0[22],q0[202];
-rz(-pi/4) q0[202];
-cx q0[0],q0[202];
-rz(pi/4) q0[202];
-cx q0[22],q0[202];
-rz(-pi/4) q0[202];
-cx q0[0],q0[202];
-rz(3*pi/4) q0[202];
-sx q0[202];
-rz(pi/2) q0[202];
-rz(pi/4) q0[22];
-cx q0[0],q0[22];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[22];
-cx q0[0],q0[22];
-cx q0[202],q0[22];
-rz(pi/2) q0[203];
-sx q0[203];
-rz(8.61946985358979) q0[203];
-sx q0[203];
-rz(5*pi/2) q0[203];
-cx q0[203],q0[23];
-rz(pi/2) q0[203];
-sx q0[203];
-rz(pi/2) q0[203];
-cx q0[23],q0[203];
-rz(-pi/4) q0[203];
-cx q0[0],q0[203];
-rz(pi/4) q0[203];
-cx q0[23],q0[203];
-rz(-pi/4) q0[203];
-cx q0[0],q0[203];
-rz(3*pi/4) q0[203];
-sx q0[203];
-rz(pi/2) q0[203];
-rz(pi/4) q0[23];
-cx q0[0],q0[23];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[23];
-cx q0[0],q0[23];
-cx q0[203],q0[23];
-rz(pi/2) q0[204];
-sx q0[204];
-rz(6.38323015358979) q0[204];
-sx q0[204];
-rz(5*pi/2) q0[204];
-cx q0[204],q0[24];
-rz(pi/2) q0[204];
-sx q0[204];
-rz(pi/2) q0[204];
-cx q0[24],q0[204];
-rz(-pi/4) q0[204];
-cx q0[0],q0[204];
-rz(pi/4) q0[204];
-cx q0[24],q0[204];
-rz(-pi/4) q0[204];
-cx q0[0],q0[204];
-rz(3*pi/4) q0[204];
-sx q0[204];
-rz(pi/2) q0[204];
-rz(pi/4) q0[24];
-cx q0[0],q0[24];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[24];
-cx q0[0],q0[24];
-cx q0[204],q0[24];
-rz(pi/2) q0[205];
-sx q0[205];
-rz(-1.55167094641021) q0[205];
-sx q0[205];
-rz(5*pi/2) q0[205];
-cx q0[205],q0[25];
-rz(pi/2) q0[205];
-sx q0[205];
-rz(pi/2) q0[205];
-cx q0[25],q0[205];
-rz(-pi/4) q0[205];
-cx q0[0],q0[205];
-rz(pi/4) q0[205];
-cx q0[25],q0[205];
-rz(-pi/4) q0[205];
-cx q0[0],q0[205];
-rz(3*pi/4) q0[205];
-sx q0[205];
-rz(pi/2) q0[205];
-rz(pi/4) q0[25];
-cx q0[0],q0[25];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[25];
-cx q0[0],q0[25];
-cx q0[205],q0[25];
-rz(pi/2) q0[206];
-sx q0[206];
-rz(1.60570325358979) q0[206];
-sx q0[206];
-rz(5*pi/2) q0[206];
-cx q0[206],q0[26];
-rz(pi/2) q0[206];
-sx q0[206];
-rz(pi/2) q0[206];
-cx q0[26],q0[206];
-rz(-pi/4) q0[206];
-cx q0[0],q0[206];
-rz(pi/4) q0[206];
-cx q0[26],q0[206];
-rz(-pi/4) q0[206];
-cx q0[0],q0[206];
-rz(3*pi/4) q0[206];
-sx q0[206];
-rz(pi/2) q0[206];
-rz(pi/4) q0[26];
-cx q0[0],q0[26];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[26];
-cx q0[0],q0[26];
-cx q0[206],q0[26];
-rz(pi/2) q0[207];
-sx q0[207];
-rz(3.28356164358979) q0[207];
-sx q0[207];
-rz(5*pi/2) q0[207];
-cx q0[207],q0[27];
-rz(pi/2) q0[207];
-sx q0[207];
-rz(pi/2) q0[207];
-cx q0[27],q0[207];
-rz(-pi/4) q0[207];
-cx q0[0],q0[207];
-rz(pi/4) q0[207];
-cx q0[27],q0[207];
-rz(-pi/4) q0[207];
-cx q0[0],q0[207];
-rz(3*pi/4) q0[207];
-sx q0[207];
-rz(pi/2) q0[207];
-rz(pi/4) q0[27];
-cx q0[0],q0[27];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[27];
-cx q0[0],q0[27];
-cx q0[207],q0[27];
-rz(pi/2) q0[208];
-sx q0[208];
-rz(5.99612215358979) q0[208];
-sx q0[208];
-rz(5*pi/2) q0[208];
-cx q0[208],q0[28];
-rz(pi/2) q0[208];
-sx q0[208];
-rz(pi/2) q0[208];
-cx q0[28],q0[208];
-rz(-pi/4) q0[208];
-cx q0[0],q0[208];
-rz(pi/4) q0[208];
-cx q0[28],q0[208];
-rz(-pi/4) q0[208];
-cx q0[0],q0[208];
-rz(3*pi/4) q0[208];
-sx q0[208];
-rz(pi/2) q0[208];
-rz(pi/4) q0[28];
-cx q0[0],q0[28];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[28];
-cx q0[0],q0[28];
-cx q0[208],q0[28];
-rz(pi/2) q0[209];
-sx q0[209];
-rz(-1.54120854641021) q0[209];
-sx q0[209];
-rz(5*pi/2) q0[209];
-cx q0[209],q0[29];
-rz(pi/2) q0[209];
-sx q0[209];
-rz(pi/2) q0[209];
-cx q0[29],q0[209];
-rz(-pi/4) q0[209];
-cx q0[0],q0[209];
-rz(pi/4) q0[209];
-cx q0[29],q0[209];
-rz(-pi/4) q0[209];
-cx q0[0],q0[209];
-rz(3*pi/4) q0[209];
-sx q0[209];
-rz(pi/2) q0[209];
-rz(pi/4) q0[29];
-cx q0[0],q0[29];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[29];
-cx q0[0],q0[29];
-cx q0[209],q0[29];
-rz(pi/2) q0[210];
-sx q0[210];
-rz(9.52556485358979) q0[210];
-sx q0[210];
-rz(5*pi/2) q0[210];
-cx q0[210],q0[30];
-rz(pi/2) q0[210];
-sx q0[210];
-rz(pi/2) q0[210];
-cx q0[30],q0[210];
-rz(-pi/4) q0[210];
-cx q0[0],q0[210];
-rz(pi/4) q0[210];
-cx q0[30],q0[210];
-rz(-pi/4) q0[210];
-cx q0[0],q0[210];
-rz(3*pi/4) q0[210];
-sx q0[210];
-rz(pi/2) q0[210];
-rz(pi/4) q0[30];
-cx q0[0],q0[30];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[30];
-cx q0[0],q0[30];
-cx q0[210],q0[30];
-rz(pi/2) q0[211];
-sx q0[211];
-rz(-0.277192646410207) q0[211];
-sx q0[211];
-rz(5*pi/2) q0[211];
-cx q0[211],q0[31];
-rz(pi/2) q0[211];
-sx q0[211];
-rz(pi/2) q0[211];
-cx q0[31],q0[211];
-rz(-pi/4) q0[211];
-cx q0[0],q0[211];
-rz(pi/4) q0[211];
-cx q0[31],q0[211];
-rz(-pi/4) q0[211];
-cx q0[0],q0[211];
-rz(3*pi/4) q0[211];
-sx q0[211];
-rz(pi/2) q0[211];
-rz(pi/4) q0[31];
-cx q0[0],q0[31];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[31];
-cx q0[0],q0[31];
-cx q0[211],q0[31];
-rz(pi/2) q0[212];
-sx q0[212];
-rz(8.40314635358979) q0[212];
-sx q0[212];
-rz(5*pi/2) q0[212];
-cx q0[212],q0[32];
-rz(pi/2) q0[212];
-sx q0[212];
-rz(pi/2) q0[212];
-cx q0[32],q0[212];
-rz(-pi/4) q0[212];
-cx q0[0],q0[212];
-rz(pi/4) q0[212];
-cx q0[32],q0[212];
-rz(-pi/4) q0[212];
-cx q0[0],q0[212];
-rz(3*pi/4) q0[212];
-sx q0[212];
-rz(pi/2) q0[212];
-rz(pi/4) q0[32];
-cx q0[0],q0[32];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[32];
-cx q0[0],q0[32];
-cx q0[212],q0[32];
-rz(pi/2) q0[213];
-sx q0[213];
-rz(0.649574353589793) q0[213];
-sx q0[213];
-rz(5*pi/2) q0[213];
-cx q0[213],q0[33];
-rz(pi/2) q0[213];
-sx q0[213];
-rz(pi/2) q0[213];
-cx q0[33],q0[213];
-rz(-pi/4) q0[213];
-cx q0[0],q0[213];
-rz(pi/4) q0[213];
-cx q0[33],q0[213];
-rz(-pi/4) q0[213];
-cx q0[0],q0[213];
-rz(3*pi/4) q0[213];
-sx q0[213];
-rz(pi/2) q0[213];
-rz(pi/4) q0[33];
-cx q0[0],q0[33];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[33];
-cx q0[0],q0[33];
-cx q0[213],q0[33];
-rz(pi/2) q0[214];
-sx q0[214];
-rz(3.06379710158979) q0[214];
-sx q0[214];
-rz(5*pi/2) q0[214];
-cx q0[214],q0[34];
-rz(pi/2) q0[214];
-sx q0[214];
-rz(pi/2) q0[214];
-cx q0[34],q0[214];
-rz(-pi/4) q0[214];
-cx q0[0],q0[214];
-rz(pi/4) q0[214];
-cx q0[34],q0[214];
-rz(-pi/4) q0[214];
-cx q0[0],q0[214];
-rz(3*pi/4) q0[214];
-sx q0[214];
-rz(pi/2) q0[214];
-rz(pi/4) q0[34];
-cx q0[0],q0[34];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[34];
-cx q0[0],q0[34];
-cx q0[214],q0[34];
-rz(pi/2) q0[215];
-sx q0[215];
-rz(7.79309985358979) q0[215];
-sx q0[215];
-rz(5*pi/2) q0[215];
-cx q0[215],q0[35];
-rz(pi/2) q0[215];
-sx q0[215];
-rz(pi/2) q0[215];
-cx q0[35],q0[215];
-rz(-pi/4) q0[215];
-cx q0[0],q0[215];
-rz(pi/4) q0[215];
-cx q0[35],q0[215];
-rz(-pi/4) q0[215];
-cx q0[0],q0[215];
-rz(3*pi/4) q0[215];
-sx q0[215];
-rz(pi/2) q0[215];
-rz(pi/4) q0[35];
-cx q0[0],q0[35];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[35];
-cx q0[0],q0[35];
-cx q0[215],q0[35];
-rz(pi/2) q0[216];
-sx q0[216];
-rz(7.95365705358979) q0[216];
-sx q0[216];
-rz(5*pi/2) q0[216];
-cx q0[216],q0[36];
-rz(pi/2) q0[216];
-sx q0[216];
-rz(pi/2) q0[216];
-cx q0[36],q0[216];
-rz(-pi/4) q0[216];
-cx q0[0],q0[216];
-rz(pi/4) q0[216];
-cx q0[36],q0[216];
-rz(-pi/4) q0[216];
-cx q0[0],q0[216];
-rz(3*pi/4) q0[216];
-sx q0[216];
-rz(pi/2) q0[216];
-rz(pi/4) q0[36];
-cx q0[0],q0[36];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[36];
-cx q0[0],q0[36];
-cx q0[216],q0[36];
-rz(pi/2) q0[217];
-sx q0[217];
-rz(-1.82104634641021) q0[217];
-sx q0[217];
-rz(5*pi/2) q0[217];
-cx q0[217],q0[37];
-rz(pi/2) q0[217];
-sx q0[217];
-rz(pi/2) q0[217];
-cx q0[37],q0[217];
-rz(-pi/4) q0[217];
-cx q0[0],q0[217];
-rz(pi/4) q0[217];
-cx q0[37],q0[217];
-rz(-pi/4) q0[217];
-cx q0[0],q0[217];
-rz(3*pi/4) q0[217];
-sx q0[217];
-rz(pi/2) q0[217];
-rz(pi/4) q0[37];
-cx q0[0],q0[37];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[37];
-cx q0[0],q0[37];
-cx q0[217],q0[37];
-rz(pi/2) q0[218];
-sx q0[218];
-rz(7.26670535358979) q0[218];
-sx q0[218];
-rz(5*pi/2) q0[218];
-cx q0[218],q0[38];
-rz(pi/2) q0[218];
-sx q0[218];
-rz(pi/2) q0[218];
-cx q0[38],q0[218];
-rz(-pi/4) q0[218];
-cx q0[0],q0[218];
-rz(pi/4) q0[218];
-cx q0[38],q0[218];
-rz(-pi/4) q0[218];
-cx q0[0],q0[218];
-rz(3*pi/4) q0[218];
-sx q0[218];
-rz(pi/2) q0[218];
-rz(pi/4) q0[38];
-cx q0[0],q0[38];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[38];
-cx q0[0],q0[38];
-cx q0[218],q0[38];
-rz(pi/2) q0[219];
-sx q0[219];
-rz(6.59713835358979) q0[219];
-sx q0[219];
-rz(5*pi/2) q0[219];
-cx q0[219],q0[39];
-rz(pi/2) q0[219];
-sx q0[219];
-rz(pi/2) q0[219];
-cx q0[39],q0[219];
-rz(-pi/4) q0[219];
-cx q0[0],q0[219];
-rz(pi/4) q0[219];
-cx q0[39],q0[219];
-rz(-pi/4) q0[219];
-cx q0[0],q0[219];
-rz(3*pi/4) q0[219];
-sx q0[219];
-rz(pi/2) q0[219];
-rz(pi/4) q0[39];
-cx q0[0],q0[39];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[39];
-cx q0[0],q0[39];
-cx q0[219],q0[39];
-rz(pi/2) q0[220];
-sx q0[220];
-rz(3.71101791358979) q0[220];
-sx q0[220];
-rz(5*pi/2) q0[220];
-cx q0[220],q0[40];
-rz(pi/2) q0[220];
-sx q0[220];
-rz(pi/2) q0[220];
-cx q0[40],q0[220];
-rz(-pi/4) q0[220];
-cx q0[0],q0[220];
-rz(pi/4) q0[220];
-cx q0[40],q0[220];
-rz(-pi/4) q0[220];
-cx q0[0],q0[220];
-rz(3*pi/4) q0[220];
-sx q0[220];
-rz(pi/2) q0[220];
-rz(pi/4) q0[40];
-cx q0[0],q0[40];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[40];
-cx q0[0],q0[40];
-cx q0[220],q0[40];
-rz(pi/2) q0[221];
-sx q0[221];
-rz(6.35277235358979) q0[221];
-sx q0[221];
-rz(5*pi/2) q0[221];
-cx q0[221],q0[41];
-rz(pi/2) q0[221];
-sx q0[221];
-rz(pi/2) q0[221];
-cx q0[41],q0[221];
-rz(-pi/4) q0[221];
-cx q0[0],q0[221];
-rz(pi/4) q0[221];
-cx q0[41],q0[221];
-rz(-pi/4) q0[221];
-cx q0[0],q0[221];
-rz(3*pi/4) q0[221];
-sx q0[221];
-rz(pi/2) q0[221];
-rz(pi/4) q0[41];
-cx q0[0],q0[41];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[41];
-cx q0[0],q0[41];
-cx q0[221],q0[41];
-rz(pi/2) q0[222];
-sx q0[222];
-rz(0.410935453589793) q0[222];
-sx q0[222];
-rz(5*pi/2) q0[222];
-cx q0[222],q0[42];
-rz(pi/2) q0[222];
-sx q0[222];
-rz(pi/2) q0[222];
-cx q0[42],q0[222];
-rz(-pi/4) q0[222];
-cx q0[0],q0[222];
-rz(pi/4) q0[222];
-cx q0[42],q0[222];
-rz(-pi/4) q0[222];
-cx q0[0],q0[222];
-rz(3*pi/4) q0[222];
-sx q0[222];
-rz(pi/2) q0[222];
-rz(pi/4) q0[42];
-cx q0[0],q0[42];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[42];
-cx q0[0],q0[42];
-cx q0[222],q0[42];
-rz(pi/2) q0[223];
-sx q0[223];
-rz(1.10418135358979) q0[223];
-sx q0[223];
-rz(5*pi/2) q0[223];
-cx q0[223],q0[43];
-rz(pi/2) q0[223];
-sx q0[223];
-rz(pi/2) q0[223];
-cx q0[43],q0[223];
-rz(-pi/4) q0[223];
-cx q0[0],q0[223];
-rz(pi/4) q0[223];
-cx q0[43],q0[223];
-rz(-pi/4) q0[223];
-cx q0[0],q0[223];
-rz(3*pi/4) q0[223];
-sx q0[223];
-rz(pi/2) q0[223];
-rz(pi/4) q0[43];
-cx q0[0],q0[43];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[43];
-cx q0[0],q0[43];
-cx q0[223],q0[43];
-rz(pi/2) q0[224];
-sx q0[224];
-rz(4.59171915358979) q0[224];
-sx q0[224];
-rz(5*pi/2) q0[224];
-cx q0[224],q0[44];
-rz(pi/2) q0[224];
-sx q0[224];
-rz(pi/2) q0[224];
-cx q0[44],q0[224];
-rz(-pi/4) q0[224];
-cx q0[0],q0[224];
-rz(pi/4) q0[224];
-cx q0[44],q0[224];
-rz(-pi/4) q0[224];
-cx q0[0],q0[224];
-rz(3*pi/4) q0[224];
-sx q0[224];
-rz(pi/2) q0[224];
-rz(pi/4) q0[44];
-cx q0[0],q0[44];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[44];
-cx q0[0],q0[44];
-cx q0[224],q0[44];
-rz(pi/2) q0[225];
-sx q0[225];
-rz(3.16315586358979) q0[225];
-sx q0[225];
-rz(5*pi/2) q0[225];
-cx q0[225],q0[45];
-rz(pi/2) q0[225];
-sx q0[225];
-rz(pi/2) q0[225];
-cx q0[45],q0[225];
-rz(-pi/4) q0[225];
-cx q0[0],q0[225];
-rz(pi/4) q0[225];
-cx q0[45],q0[225];
-rz(-pi/4) q0[225];
-cx q0[0],q0[225];
-rz(3*pi/4) q0[225];
-sx q0[225];
-rz(pi/2) q0[225];
-rz(pi/4) q0[45];
-cx q0[0],q0[45];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[45];
-cx q0[0],q0[45];
-cx q0[225],q0[45];
-rz(pi/2) q0[226];
-sx q0[226];
-rz(3.61038055358979) q0[226];
-sx q0[226];
-rz(5*pi/2) q0[226];
-cx q0[226],q0[46];
-rz(pi/2) q0[226];
-sx q0[226];
-rz(pi/2) q0[226];
-cx q0[46],q0[226];
-rz(-pi/4) q0[226];
-cx q0[0],q0[226];
-rz(pi/4) q0[226];
-cx q0[46],q0[226];
-rz(-pi/4) q0[226];
-cx q0[0],q0[226];
-rz(3*pi/4) q0[226];
-sx q0[226];
-rz(pi/2) q0[226];
-rz(pi/4) q0[46];
-cx q0[0],q0[46];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[46];
-cx q0[0],q0[46];
-cx q0[226],q0[46];
-rz(pi/2) q0[227];
-sx q0[227];
-rz(5.22719305358979) q0[227];
-sx q0[227];
-rz(5*pi/2) q0[227];
-cx q0[227],q0[47];
-rz(pi/2) q0[227];
-sx q0[227];
-rz(pi/2) q0[227];
-cx q0[47],q0[227];
-rz(-pi/4) q0[227];
-cx q0[0],q0[227];
-rz(pi/4) q0[227];
-cx q0[47],q0[227];
-rz(-pi/4) q0[227];
-cx q0[0],q0[227];
-rz(3*pi/4) q0[227];
-sx q0[227];
-rz(pi/2) q0[227];
-rz(pi/4) q0[47];
-cx q0[0],q0[47];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[47];
-cx q0[0],q0[47];
-cx q0[227],q0[47];
-rz(pi/2) q0[228];
-sx q0[228];
-rz(9.91294125358979) q0[228];
-sx q0[228];
-rz(5*pi/2) q0[228];
-cx q0[228],q0[48];
-rz(pi/2) q0[228];
-sx q0[228];
-rz(pi/2) q0[228];
-cx q0[48],q0[228];
-rz(-pi/4) q0[228];
-cx q0[0],q0[228];
-rz(pi/4) q0[228];
-cx q0[48],q0[228];
-rz(-pi/4) q0[228];
-cx q0[0],q0[228];
-rz(3*pi/4) q0[228];
-sx q0[228];
-rz(pi/2) q0[228];
-rz(pi/4) q0[48];
-cx q0[0],q0[48];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[48];
-cx q0[0],q0[48];
-cx q0[228],q0[48];
-rz(pi/2) q0[229];
-sx q0[229];
-rz(0.449485853589793) q0[229];
-sx q0[229];
-rz(5*pi/2) q0[229];
-cx q0[229],q0[49];
-rz(pi/2) q0[229];
-sx q0[229];
-rz(pi/2) q0[229];
-cx q0[49],q0[229];
-rz(-pi/4) q0[229];
-cx q0[0],q0[229];
-rz(pi/4) q0[229];
-cx q0[49],q0[229];
-rz(-pi/4) q0[229];
-cx q0[0],q0[229];
-rz(3*pi/4) q0[229];
-sx q0[229];
-rz(pi/2) q0[229];
-rz(pi/4) q0[49];
-cx q0[0],q0[49];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[49];
-cx q0[0],q0[49];
-cx q0[229],q0[49];
-rz(pi/2) q0[230];
-sx q0[230];
-rz(8.92710955358979) q0[230];
-sx q0[230];
-rz(5*pi/2) q0[230];
-cx q0[230],q0[50];
-rz(pi/2) q0[230];
-sx q0[230];
-rz(pi/2) q0[230];
-cx q0[50],q0[230];
-rz(-pi/4) q0[230];
-cx q0[0],q0[230];
-rz(pi/4) q0[230];
-cx q0[50],q0[230];
-rz(-pi/4) q0[230];
-cx q0[0],q0[230];
-rz(3*pi/4) q0[230];
-sx q0[230];
-rz(pi/2) q0[230];
-rz(pi/4) q0[50];
-cx q0[0],q0[50];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[50];
-cx q0[0],q0[50];
-cx q0[230],q0[50];
-rz(pi/2) q0[231];
-sx q0[231];
-rz(10.1273663535898) q0[231];
-sx q0[231];
-rz(5*pi/2) q0[231];
-cx q0[231],q0[51];
-rz(pi/2) q0[231];
-sx q0[231];
-rz(pi/2) q0[231];
-cx q0[51],q0[231];
-rz(-pi/4) q0[231];
-cx q0[0],q0[231];
-rz(pi/4) q0[231];
-cx q0[51],q0[231];
-rz(-pi/4) q0[231];
-cx q0[0],q0[231];
-rz(3*pi/4) q0[231];
-sx q0[231];
-rz(pi/2) q0[231];
-rz(pi/4) q0[51];
-cx q0[0],q0[51];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[51];
-cx q0[0],q0[51];
-cx q0[231],q0[51];
-rz(pi/2) q0[232];
-sx q0[232];
-rz(1.43062955358979) q0[232];
-sx q0[232];
-rz(5*pi/2) q0[232];
-cx q0[232],q0[52];
-rz(pi/2) q0[232];
-sx q0[232];
-rz(pi/2) q0[232];
-cx q0[52],q0[232];
-rz(-pi/4) q0[232];
-cx q0[0],q0[232];
-rz(pi/4) q0[232];
-cx q0[52],q0[232];
-rz(-pi/4) q0[232];
-cx q0[0],q0[232];
-rz(3*pi/4) q0[232];
-sx q0[232];
-rz(pi/2) q0[232];
-rz(pi/4) q0[52];
-cx q0[0],q0[52];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[52];
-cx q0[0],q0[52];
-cx q0[232],q0[52];
-rz(pi/2) q0[233];
-sx q0[233];
-rz(8.05380955358979) q0[233];
-sx q0[233];
-rz(5*pi/2) q0[233];
-cx q0[233],q0[53];
-rz(pi/2) q0[233];
-sx q0[233];
-rz(pi/2) q0[233];
-cx q0[53],q0[233];
-rz(-pi/4) q0[233];
-cx q0[0],q0[233];
-rz(pi/4) q0[233];
-cx q0[53],q0[233];
-rz(-pi/4) q0[233];
-cx q0[0],q0[233];
-rz(3*pi/4) q0[233];
-sx q0[233];
-rz(pi/2) q0[233];
-rz(pi/4) q0[53];
-cx q0[0],q0[53];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[53];
-cx q0[0],q0[53];
-cx q0[233],q0[53];
-rz(pi/2) q0[234];
-sx q0[234];
-rz(-0.280870346410207) q0[234];
-sx q0[234];
-rz(5*pi/2) q0[234];
-cx q0[234],q0[54];
-rz(pi/2) q0[234];
-sx q0[234];
-rz(pi/2) q0[234];
-cx q0[54],q0[234];
-rz(-pi/4) q0[234];
-cx q0[0],q0[234];
-rz(pi/4) q0[234];
-cx q0[54],q0[234];
-rz(-pi/4) q0[234];
-cx q0[0],q0[234];
-rz(3*pi/4) q0[234];
-sx q0[234];
-rz(pi/2) q0[234];
-rz(pi/4) q0[54];
-cx q0[0],q0[54];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[54];
-cx q0[0],q0[54];
-cx q0[234],q0[54];
-rz(pi/2) q0[235];
-sx q0[235];
-rz(3.20240698458979) q0[235];
-sx q0[235];
-rz(5*pi/2) q0[235];
-cx q0[235],q0[55];
-rz(pi/2) q0[235];
-sx q0[235];
-rz(pi/2) q0[235];
-cx q0[55],q0[235];
-rz(-pi/4) q0[235];
-cx q0[0],q0[235];
-rz(pi/4) q0[235];
-cx q0[55],q0[235];
-rz(-pi/4) q0[235];
-cx q0[0],q0[235];
-rz(3*pi/4) q0[235];
-sx q0[235];
-rz(pi/2) q0[235];
-rz(pi/4) q0[55];
-cx q0[0],q0[55];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[55];
-cx q0[0],q0[55];
-cx q0[235],q0[55];
-rz(pi/2) q0[236];
-sx q0[236];
-rz(2.62880530358979) q0[236];
-sx q0[236];
-rz(5*pi/2) q0[236];
-cx q0[236],q0[56];
-rz(pi/2) q0[236];
-sx q0[236];
-rz(pi/2) q0[236];
-cx q0[56],q0[236];
-rz(-pi/4) q0[236];
-cx q0[0],q0[236];
-rz(pi/4) q0[236];
-cx q0[56],q0[236];
-rz(-pi/4) q0[236];
-cx q0[0],q0[236];
-rz(3*pi/4) q0[236];
-sx q0[236];
-rz(pi/2) q0[236];
-rz(pi/4) q0[56];
-cx q0[0],q0[56];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[56];
-cx q0[0],q0[56];
-cx q0[236],q0[56];
-rz(pi/2) q0[237];
-sx q0[237];
-rz(-1.89365984641021) q0[237];
-sx q0[237];
-rz(5*pi/2) q0[237];
-cx q0[237],q0[57];
-rz(pi/2) q0[237];
-sx q0[237];
-rz(pi/2) q0[237];
-cx q0[57],q0[237];
-rz(-pi/4) q0[237];
-cx q0[0],q0[237];
-rz(pi/4) q0[237];
-cx q0[57],q0[237];
-rz(-pi/4) q0[237];
-cx q0[0],q0[237];
-rz(3*pi/4) q0[237];
-sx q0[237];
-rz(pi/2) q0[237];
-rz(pi/4) q0[57];
-cx q0[0],q0[57];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[57];
-cx q0[0],q0[57];
-cx q0[237],q0[57];
-rz(pi/2) q0[238];
-sx q0[238];
-rz(4.46144665358979) q0[238];
-sx q0[238];
-rz(5*pi/2) q0[238];
-cx q0[238],q0[58];
-rz(pi/2) q0[238];
-sx q0[238];
-rz(pi/2) q0[238];
-cx q0[58],q0[238];
-rz(-pi/4) q0[238];
-cx q0[0],q0[238];
-rz(pi/4) q0[238];
-cx q0[58],q0[238];
-rz(-pi/4) q0[238];
-cx q0[0],q0[238];
-rz(3*pi/4) q0[238];
-sx q0[238];
-rz(pi/2) q0[238];
-rz(pi/4) q0[58];
-cx q0[0],q0[58];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[58];
-cx q0[0],q0[58];
-cx q0[238],q0[58];
-rz(pi/2) q0[239];
-sx q0[239];
-rz(9.51791475358979) q0[239];
-sx q0[239];
-rz(5*pi/2) q0[239];
-cx q0[239],q0[59];
-rz(pi/2) q0[239];
-sx q0[239];
-rz(pi/2) q0[239];
-cx q0[59],q0[239];
-rz(-pi/4) q0[239];
-cx q0[0],q0[239];
-rz(pi/4) q0[239];
-cx q0[59],q0[239];
-rz(-pi/4) q0[239];
-cx q0[0],q0[239];
-rz(3*pi/4) q0[239];
-sx q0[239];
-rz(pi/2) q0[239];
-rz(pi/4) q0[59];
-cx q0[0],q0[59];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[59];
-cx q0[0],q0[59];
-cx q0[239],q0[59];
-rz(pi/2) q0[240];
-sx q0[240];
-rz(8.77181495358979) q0[240];
-sx q0[240];
-rz(5*pi/2) q0[240];
-cx q0[240],q0[60];
-rz(pi/2) q0[240];
-sx q0[240];
-rz(pi/2) q0[240];
-cx q0[60],q0[240];
-rz(-pi/4) q0[240];
-cx q0[0],q0[240];
-rz(pi/4) q0[240];
-cx q0[60],q0[240];
-rz(-pi/4) q0[240];
-cx q0[0],q0[240];
-rz(3*pi/4) q0[240];
-sx q0[240];
-rz(pi/2) q0[240];
-rz(pi/4) q0[60];
-cx q0[0],q0[60];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[60];
-cx q0[0],q0[60];
-cx q0[240],q0[60];
-rz(pi/2) q0[241];
-sx q0[241];
-rz(8.79727225358979) q0[241];
-sx q0[241];
-rz(5*pi/2) q0[241];
-cx q0[241],q0[61];
-rz(pi/2) q0[241];
-sx q0[241];
-rz(pi/2) q0[241];
-cx q0[61],q0[241];
-rz(-pi/4) q0[241];
-cx q0[0],q0[241];
-rz(pi/4) q0[241];
-cx q0[61],q0[241];
-rz(-pi/4) q0[241];
-cx q0[0],q0[241];
-rz(3*pi/4) q0[241];
-sx q0[241];
-rz(pi/2) q0[241];
-rz(pi/4) q0[61];
-cx q0[0],q0[61];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[61];
-cx q0[0],q0[61];
-cx q0[241],q0[61];
-rz(pi/2) q0[242];
-sx q0[242];
-rz(5.70837815358979) q0[242];
-sx q0[242];
-rz(5*pi/2) q0[242];
-cx q0[242],q0[62];
-rz(pi/2) q0[242];
-sx q0[242];
-rz(pi/2) q0[242];
-cx q0[62],q0[242];
-rz(-pi/4) q0[242];
-cx q0[0],q0[242];
-rz(pi/4) q0[242];
-cx q0[62],q0[242];
-rz(-pi/4) q0[242];
-cx q0[0],q0[242];
-rz(3*pi/4) q0[242];
-sx q0[242];
-rz(pi/2) q0[242];
-rz(pi/4) q0[62];
-cx q0[0],q0[62];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[62];
-cx q0[0],q0[62];
-cx q0[242],q0[62];
-rz(pi/2) q0[243];
-sx q0[243];
-rz(-1.05984704641021) q0[243];
-sx q0[243];
-rz(5*pi/2) q0[243];
-cx q0[243],q0[63];
-rz(pi/2) q0[243];
-sx q0[243];
-rz(pi/2) q0[243];
-cx q0[63],q0[243];
-rz(-pi/4) q0[243];
-cx q0[0],q0[243];
-rz(pi/4) q0[243];
-cx q0[63],q0[243];
-rz(-pi/4) q0[243];
-cx q0[0],q0[243];
-rz(3*pi/4) q0[243];
-sx q0[243];
-rz(pi/2) q0[243];
-rz(pi/4) q0[63];
-cx q0[0],q0[63];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[63];
-cx q0[0],q0[63];
-cx q0[243],q0[63];
-rz(pi/2) q0[244];
-sx q0[244];
-rz(5.46618165358979) q0[244];
-sx q0[244];
-rz(5*pi/2) q0[244];
-cx q0[244],q0[64];
-rz(pi/2) q0[244];
-sx q0[244];
-rz(pi/2) q0[244];
-cx q0[64],q0[244];
-rz(-pi/4) q0[244];
-cx q0[0],q0[244];
-rz(pi/4) q0[244];
-cx q0[64],q0[244];
-rz(-pi/4) q0[244];
-cx q0[0],q0[244];
-rz(3*pi/4) q0[244];
-sx q0[244];
-rz(pi/2) q0[244];
-rz(pi/4) q0[64];
-cx q0[0],q0[64];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[64];
-cx q0[0],q0[64];
-cx q0[244],q0[64];
-rz(pi/2) q0[245];
-sx q0[245];
-rz(1.09337725358979) q0[245];
-sx q0[245];
-rz(5*pi/2) q0[245];
-cx q0[245],q0[65];
-rz(pi/2) q0[245];
-sx q0[245];
-rz(pi/2) q0[245];
-cx q0[65],q0[245];
-rz(-pi/4) q0[245];
-cx q0[0],q0[245];
-rz(pi/4) q0[245];
-cx q0[65],q0[245];
-rz(-pi/4) q0[245];
-cx q0[0],q0[245];
-rz(3*pi/4) q0[245];
-sx q0[245];
-rz(pi/2) q0[245];
-rz(pi/4) q0[65];
-cx q0[0],q0[65];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[65];
-cx q0[0],q0[65];
-cx q0[245],q0[65];
-rz(pi/2) q0[246];
-sx q0[246];
-rz(-0.506465646410207) q0[246];
-sx q0[246];
-rz(5*pi/2) q0[246];
-cx q0[246],q0[66];
-rz(pi/2) q0[246];
-sx q0[246];
-rz(pi/2) q0[246];
-cx q0[66],q0[246];
-rz(-pi/4) q0[246];
-cx q0[0],q0[246];
-rz(pi/4) q0[246];
-cx q0[66],q0[246];
-rz(-pi/4) q0[246];
-cx q0[0],q0[246];
-rz(3*pi/4) q0[246];
-sx q0[246];
-rz(pi/2) q0[246];
-rz(pi/4) q0[66];
-cx q0[0],q0[66];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[66];
-cx q0[0],q0[66];
-cx q0[246],q0[66];
-rz(pi/2) q0[247];
-sx q0[247];
-rz(7.54147525358979) q0[247];
-sx q0[247];
-rz(5*pi/2) q0[247];
-cx q0[247],q0[67];
-rz(pi/2) q0[247];
-sx q0[247];
-rz(pi/2) q0[247];
-cx q0[67],q0[247];
-rz(-pi/4) q0[247];
-cx q0[0],q0[247];
-rz(pi/4) q0[247];
-cx q0[67],q0[247];
-rz(-pi/4) q0[247];
-cx q0[0],q0[247];
-rz(3*pi/4) q0[247];
-sx q0[247];
-rz(pi/2) q0[247];
-rz(pi/4) q0[67];
-cx q0[0],q0[67];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[67];
-cx q0[0],q0[67];
-cx q0[247],q0[67];
-rz(pi/2) q0[248];
-sx q0[248];
-rz(3.87802083358979) q0[248];
-sx q0[248];
-rz(5*pi/2) q0[248];
-cx q0[248],q0[68];
-rz(pi/2) q0[248];
-sx q0[248];
-rz(pi/2) q0[248];
-cx q0[68],q0[248];
-rz(-pi/4) q0[248];
-cx q0[0],q0[248];
-rz(pi/4) q0[248];
-cx q0[68],q0[248];
-rz(-pi/4) q0[248];
-cx q0[0],q0[248];
-rz(3*pi/4) q0[248];
-sx q0[248];
-rz(pi/2) q0[248];
-rz(pi/4) q0[68];
-cx q0[0],q0[68];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[68];
-cx q0[0],q0[68];
-cx q0[248],q0[68];
-rz(pi/2) q0[249];
-sx q0[249];
-rz(8.79227675358979) q0[249];
-sx q0[249];
-rz(5*pi/2) q0[249];
-cx q0[249],q0[69];
-rz(pi/2) q0[249];
-sx q0[249];
-rz(pi/2) q0[249];
-cx q0[69],q0[249];
-rz(-pi/4) q0[249];
-cx q0[0],q0[249];
-rz(pi/4) q0[249];
-cx q0[69],q0[249];
-rz(-pi/4) q0[249];
-cx q0[0],q0[249];
-rz(3*pi/4) q0[249];
-sx q0[249];
-rz(pi/2) q0[249];
-rz(pi/4) q0[69];
-cx q0[0],q0[69];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[69];
-cx q0[0],q0[69];
-cx q0[249],q0[69];
-rz(pi/2) q0[250];
-sx q0[250];
-rz(1.46046625358979) q0[250];
-sx q0[250];
-rz(5*pi/2) q0[250];
-cx q0[250],q0[70];
-rz(pi/2) q0[250];
-sx q0[250];
-rz(pi/2) q0[250];
-cx q0[70],q0[250];
-rz(-pi/4) q0[250];
-cx q0[0],q0[250];
-rz(pi/4) q0[250];
-cx q0[70],q0[250];
-rz(-pi/4) q0[250];
-cx q0[0],q0[250];
-rz(3*pi/4) q0[250];
-sx q0[250];
-rz(pi/2) q0[250];
-rz(pi/4) q0[70];
-cx q0[0],q0[70];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[70];
-cx q0[0],q0[70];
-cx q0[250],q0[70];
-rz(pi/2) q0[251];
-sx q0[251];
-rz(6.06015035358979) q0[251];
-sx q0[251];
-rz(5*pi/2) q0[251];
-cx q0[251],q0[71];
-rz(pi/2) q0[251];
-sx q0[251];
-rz(pi/2) q0[251];
-cx q0[71],q0[251];
-rz(-pi/4) q0[251];
-cx q0[0],q0[251];
-rz(pi/4) q0[251];
-cx q0[71],q0[251];
-rz(-pi/4) q0[251];
-cx q0[0],q0[251];
-rz(3*pi/4) q0[251];
-sx q0[251];
-rz(pi/2) q0[251];
-rz(pi/4) q0[71];
-cx q0[0],q0[71];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[71];
-cx q0[0],q0[71];
-cx q0[251],q0[71];
-rz(pi/2) q0[252];
-sx q0[252];
-rz(3.31517510358979) q0[252];
-sx q0[252];
-rz(5*pi/2) q0[252];
-cx q0[252],q0[72];
-rz(pi/2) q0[252];
-sx q0[252];
-rz(pi/2) q0[252];
-cx q0[72],q0[252];
-rz(-pi/4) q0[252];
-cx q0[0],q0[252];
-rz(pi/4) q0[252];
-cx q0[72],q0[252];
-rz(-pi/4) q0[252];
-cx q0[0],q0[252];
-rz(3*pi/4) q0[252];
-sx q0[252];
-rz(pi/2) q0[252];
-rz(pi/4) q0[72];
-cx q0[0],q0[72];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[72];
-cx q0[0],q0[72];
-cx q0[252],q0[72];
-rz(pi/2) q0[253];
-sx q0[253];
-rz(5.44531045358979) q0[253];
-sx q0[253];
-rz(5*pi/2) q0[253];
-cx q0[253],q0[73];
-rz(pi/2) q0[253];
-sx q0[253];
-rz(pi/2) q0[253];
-cx q0[73],q0[253];
-rz(-pi/4) q0[253];
-cx q0[0],q0[253];
-rz(pi/4) q0[253];
-cx q0[73],q0[253];
-rz(-pi/4) q0[253];
-cx q0[0],q0[253];
-rz(3*pi/4) q0[253];
-sx q0[253];
-rz(pi/2) q0[253];
-rz(pi/4) q0[73];
-cx q0[0],q0[73];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[73];
-cx q0[0],q0[73];
-cx q0[253],q0[73];
-rz(pi/2) q0[254];
-sx q0[254];
-rz(7.84165315358979) q0[254];
-sx q0[254];
-rz(5*pi/2) q0[254];
-cx q0[254],q0[74];
-rz(pi/2) q0[254];
-sx q0[254];
-rz(pi/2) q0[254];
-cx q0[74],q0[254];
-rz(-pi/4) q0[254];
-cx q0[0],q0[254];
-rz(pi/4) q0[254];
-cx q0[74],q0[254];
-rz(-pi/4) q0[254];
-cx q0[0],q0[254];
-rz(3*pi/4) q0[254];
-sx q0[254];
-rz(pi/2) q0[254];
-rz(pi/4) q0[74];
-cx q0[0],q0[74];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[74];
-cx q0[0],q0[74];
-cx q0[254],q0[74];
-rz(pi/2) q0[255];
-sx q0[255];
-rz(9.01338855358979) q0[255];
-sx q0[255];
-rz(5*pi/2) q0[255];
-cx q0[255],q0[75];
-rz(pi/2) q0[255];
-sx q0[255];
-rz(pi/2) q0[255];
-cx q0[75],q0[255];
-rz(-pi/4) q0[255];
-cx q0[0],q0[255];
-rz(pi/4) q0[255];
-cx q0[75],q0[255];
-rz(-pi/4) q0[255];
-cx q0[0],q0[255];
-rz(3*pi/4) q0[255];
-sx q0[255];
-rz(pi/2) q0[255];
-rz(pi/4) q0[75];
-cx q0[0],q0[75];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[75];
-cx q0[0],q0[75];
-cx q0[255],q0[75];
-rz(pi/2) q0[256];
-sx q0[256];
-rz(1.65238135358979) q0[256];
-sx q0[256];
-rz(5*pi/2) q0[256];
-cx q0[256],q0[76];
-rz(pi/2) q0[256];
-sx q0[256];
-rz(pi/2) q0[256];
-cx q0[76],q0[256];
-rz(-pi/4) q0[256];
-cx q0[0],q0[256];
-rz(pi/4) q0[256];
-cx q0[76],q0[256];
-rz(-pi/4) q0[256];
-cx q0[0],q0[256];
-rz(3*pi/4) q0[256];
-sx q0[256];
-rz(pi/2) q0[256];
-rz(pi/4) q0[76];
-cx q0[0],q0[76];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[76];
-cx q0[0],q0[76];
-cx q0[256],q0[76];
-rz(pi/2) q0[257];
-sx q0[257];
-rz(6.92790745358979) q0[257];
-sx q0[257];
-rz(5*pi/2) q0[257];
-cx q0[257],q0[77];
-rz(pi/2) q0[257];
-sx q0[257];
-rz(pi/2) q0[257];
-cx q0[77],q0[257];
-rz(-pi/4) q0[257];
-cx q0[0],q0[257];
-rz(pi/4) q0[257];
-cx q0[77],q0[257];
-rz(-pi/4) q0[257];
-cx q0[0],q0[257];
-rz(3*pi/4) q0[257];
-sx q0[257];
-rz(pi/2) q0[257];
-rz(pi/4) q0[77];
-cx q0[0],q0[77];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[77];
-cx q0[0],q0[77];
-cx q0[257],q0[77];
-rz(pi/2) q0[258];
-sx q0[258];
-rz(3.86703188358979) q0[258];
-sx q0[258];
-rz(5*pi/2) q0[258];
-cx q0[258],q0[78];
-rz(pi/2) q0[258];
-sx q0[258];
-rz(pi/2) q0[258];
-cx q0[78],q0[258];
-rz(-pi/4) q0[258];
-cx q0[0],q0[258];
-rz(pi/4) q0[258];
-cx q0[78],q0[258];
-rz(-pi/4) q0[258];
-cx q0[0],q0[258];
-rz(3*pi/4) q0[258];
-sx q0[258];
-rz(pi/2) q0[258];
-rz(pi/4) q0[78];
-cx q0[0],q0[78];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[78];
-cx q0[0],q0[78];
-cx q0[258],q0[78];
-rz(pi/2) q0[259];
-sx q0[259];
-rz(4.53899825358979) q0[259];
-sx q0[259];
-rz(5*pi/2) q0[259];
-cx q0[259],q0[79];
-rz(pi/2) q0[259];
-sx q0[259];
-rz(pi/2) q0[259];
-cx q0[79],q0[259];
-rz(-pi/4) q0[259];
-cx q0[0],q0[259];
-rz(pi/4) q0[259];
-cx q0[79],q0[259];
-rz(-pi/4) q0[259];
-cx q0[0],q0[259];
-rz(3*pi/4) q0[259];
-sx q0[259];
-rz(pi/2) q0[259];
-rz(pi/4) q0[79];
-cx q0[0],q0[79];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[79];
-cx q0[0],q0[79];
-cx q0[259],q0[79];
-rz(pi/2) q0[260];
-sx q0[260];
-rz(-3.04037084641021) q0[260];
-sx q0[260];
-rz(5*pi/2) q0[260];
-cx q0[260],q0[80];
-rz(pi/2) q0[260];
-sx q0[260];
-rz(pi/2) q0[260];
-cx q0[80],q0[260];
-rz(-pi/4) q0[260];
-cx q0[0],q0[260];
-rz(pi/4) q0[260];
-cx q0[80],q0[260];
-rz(-pi/4) q0[260];
-cx q0[0],q0[260];
-rz(3*pi/4) q0[260];
-sx q0[260];
-rz(pi/2) q0[260];
-rz(pi/4) q0[80];
-cx q0[0],q0[80];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[80];
-cx q0[0],q0[80];
-cx q0[260],q0[80];
-rz(pi/2) q0[261];
-sx q0[261];
-rz(9.76641545358979) q0[261];
-sx q0[261];
-rz(5*pi/2) q0[261];
-cx q0[261],q0[81];
-rz(pi/2) q0[261];
-sx q0[261];
-rz(pi/2) q0[261];
-cx q0[81],q0[261];
-rz(-pi/4) q0[261];
-cx q0[0],q0[261];
-rz(pi/4) q0[261];
-cx q0[81],q0[261];
-rz(-pi/4) q0[261];
-cx q0[0],q0[261];
-rz(3*pi/4) q0[261];
-sx q0[261];
-rz(pi/2) q0[261];
-rz(pi/4) q0[81];
-cx q0[0],q0[81];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[81];
-cx q0[0],q0[81];
-cx q0[261],q0[81];
-rz(pi/2) q0[262];
-sx q0[262];
-rz(8.33870765358979) q0[262];
-sx q0[262];
-rz(5*pi/2) q0[262];
-cx q0[262],q0[82];
-rz(pi/2) q0[262];
-sx q0[262];
-rz(pi/2) q0[262];
-cx q0[82],q0[262];
-rz(-pi/4) q0[262];
-cx q0[0],q0[262];
-rz(pi/4) q0[262];
-cx q0[82],q0[262];
-rz(-pi/4) q0[262];
-cx q0[0],q0[262];
-rz(3*pi/4) q0[262];
-sx q0[262];
-rz(pi/2) q0[262];
-rz(pi/4) q0[82];
-cx q0[0],q0[82];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[82];
-cx q0[0],q0[82];
-cx q0[262],q0[82];
-rz(pi/2) q0[263];
-sx q0[263];
-rz(2.00697575358979) q0[263];
-sx q0[263];
-rz(5*pi/2) q0[263];
-cx q0[263],q0[83];
-rz(pi/2) q0[263];
-sx q0[263];
-rz(pi/2) q0[263];
-cx q0[83],q0[263];
-rz(-pi/4) q0[263];
-cx q0[0],q0[263];
-rz(pi/4) q0[263];
-cx q0[83],q0[263];
-rz(-pi/4) q0[263];
-cx q0[0],q0[263];
-rz(3*pi/4) q0[263];
-sx q0[263];
-rz(pi/2) q0[263];
-rz(pi/4) q0[83];
-cx q0[0],q0[83];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[83];
-cx q0[0],q0[83];
-cx q0[263],q0[83];
-rz(pi/2) q0[264];
-sx q0[264];
-rz(9.12219015358979) q0[264];
-sx q0[264];
-rz(5*pi/2) q0[264];
-cx q0[264],q0[84];
-rz(pi/2) q0[264];
-sx q0[264];
-rz(pi/2) q0[264];
-cx q0[84],q0[264];
-rz(-pi/4) q0[264];
-cx q0[0],q0[264];
-rz(pi/4) q0[264];
-cx q0[84],q0[264];
-rz(-pi/4) q0[264];
-cx q0[0],q0[264];
-rz(3*pi/4) q0[264];
-sx q0[264];
-rz(pi/2) q0[264];
-rz(pi/4) q0[84];
-cx q0[0],q0[84];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[84];
-cx q0[0],q0[84];
-cx q0[264],q0[84];
-rz(pi/2) q0[265];
-sx q0[265];
-rz(7.44359065358979) q0[265];
-sx q0[265];
-rz(5*pi/2) q0[265];
-cx q0[265],q0[85];
-rz(pi/2) q0[265];
-sx q0[265];
-rz(pi/2) q0[265];
-cx q0[85],q0[265];
-rz(-pi/4) q0[265];
-cx q0[0],q0[265];
-rz(pi/4) q0[265];
-cx q0[85],q0[265];
-rz(-pi/4) q0[265];
-cx q0[0],q0[265];
-rz(3*pi/4) q0[265];
-sx q0[265];
-rz(pi/2) q0[265];
-rz(pi/4) q0[85];
-cx q0[0],q0[85];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[85];
-cx q0[0],q0[85];
-cx q0[265],q0[85];
-rz(pi/2) q0[266];
-sx q0[266];
-rz(-1.81947604641021) q0[266];
-sx q0[266];
-rz(5*pi/2) q0[266];
-cx q0[266],q0[86];
-rz(pi/2) q0[266];
-sx q0[266];
-rz(pi/2) q0[266];
-cx q0[86],q0[266];
-rz(-pi/4) q0[266];
-cx q0[0],q0[266];
-rz(pi/4) q0[266];
-cx q0[86],q0[266];
-rz(-pi/4) q0[266];
-cx q0[0],q0[266];
-rz(3*pi/4) q0[266];
-sx q0[266];
-rz(pi/2) q0[266];
-rz(pi/4) q0[86];
-cx q0[0],q0[86];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[86];
-cx q0[0],q0[86];
-cx q0[266],q0[86];
-rz(pi/2) q0[267];
-sx q0[267];
-rz(-0.163601946410207) q0[267];
-sx q0[267];
-rz(5*pi/2) q0[267];
-cx q0[267],q0[87];
-rz(pi/2) q0[267];
-sx q0[267];
-rz(pi/2) q0[267];
-cx q0[87],q0[267];
-rz(-pi/4) q0[267];
-cx q0[0],q0[267];
-rz(pi/4) q0[267];
-cx q0[87],q0[267];
-rz(-pi/4) q0[267];
-cx q0[0],q0[267];
-rz(3*pi/4) q0[267];
-sx q0[267];
-rz(pi/2) q0[267];
-rz(pi/4) q0[87];
-cx q0[0],q0[87];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[87];
-cx q0[0],q0[87];
-cx q0[267],q0[87];
-rz(pi/2) q0[268];
-sx q0[268];
-rz(7.15313035358979) q0[268];
-sx q0[268];
-rz(5*pi/2) q0[268];
-cx q0[268],q0[88];
-rz(pi/2) q0[268];
-sx q0[268];
-rz(pi/2) q0[268];
-cx q0[88],q0[268];
-rz(-pi/4) q0[268];
-cx q0[0],q0[268];
-rz(pi/4) q0[268];
-cx q0[88],q0[268];
-rz(-pi/4) q0[268];
-cx q0[0],q0[268];
-rz(3*pi/4) q0[268];
-sx q0[268];
-rz(pi/2) q0[268];
-rz(pi/4) q0[88];
-cx q0[0],q0[88];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[88];
-cx q0[0],q0[88];
-cx q0[268],q0[88];
-rz(pi/2) q0[269];
-sx q0[269];
-rz(5.20921575358979) q0[269];
-sx q0[269];
-rz(5*pi/2) q0[269];
-cx q0[269],q0[89];
-rz(pi/2) q0[269];
-sx q0[269];
-rz(pi/2) q0[269];
-cx q0[89],q0[269];
-rz(-pi/4) q0[269];
-cx q0[0],q0[269];
-rz(pi/4) q0[269];
-cx q0[89],q0[269];
-rz(-pi/4) q0[269];
-cx q0[0],q0[269];
-rz(3*pi/4) q0[269];
-sx q0[269];
-rz(pi/2) q0[269];
-rz(pi/4) q0[89];
-cx q0[0],q0[89];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[89];
-cx q0[0],q0[89];
-cx q0[269],q0[89];
-rz(pi/2) q0[270];
-sx q0[270];
-rz(8.12074055358979) q0[270];
-sx q0[270];
-rz(5*pi/2) q0[270];
-cx q0[270],q0[90];
-rz(pi/2) q0[270];
-sx q0[270];
-rz(pi/2) q0[270];
-cx q0[90],q0[270];
-rz(-pi/4) q0[270];
-cx q0[0],q0[270];
-rz(pi/4) q0[270];
-cx q0[90],q0[270];
-rz(-pi/4) q0[270];
-cx q0[0],q0[270];
-rz(3*pi/4) q0[270];
-sx q0[270];
-rz(pi/2) q0[270];
-rz(pi/4) q0[90];
-cx q0[0],q0[90];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[90];
-cx q0[0],q0[90];
-cx q0[270],q0[90];
-rz(pi/2) q0[271];
-sx q0[271];
-rz(3.67444675358979) q0[271];
-sx q0[271];
-rz(5*pi/2) q0[271];
-cx q0[271],q0[91];
-rz(pi/2) q0[271];
-sx q0[271];
-rz(pi/2) q0[271];
-cx q0[91],q0[271];
-rz(-pi/4) q0[271];
-cx q0[0],q0[271];
-rz(pi/4) q0[271];
-cx q0[91],q0[271];
-rz(-pi/4) q0[271];
-cx q0[0],q0[271];
-rz(3*pi/4) q0[271];
-sx q0[271];
-rz(pi/2) q0[271];
-rz(pi/4) q0[91];
-cx q0[0],q0[91];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[91];
-cx q0[0],q0[91];
-cx q0[271],q0[91];
-rz(pi/2) q0[272];
-sx q0[272];
-rz(7.78339985358979) q0[272];
-sx q0[272];
-rz(5*pi/2) q0[272];
-cx q0[272],q0[92];
-rz(pi/2) q0[272];
-sx q0[272];
-rz(pi/2) q0[272];
-cx q0[92],q0[272];
-rz(-pi/4) q0[272];
-cx q0[0],q0[272];
-rz(pi/4) q0[272];
-cx q0[92],q0[272];
-rz(-pi/4) q0[272];
-cx q0[0],q0[272];
-rz(3*pi/4) q0[272];
-sx q0[272];
-rz(pi/2) q0[272];
-rz(pi/4) q0[92];
-cx q0[0],q0[92];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[92];
-cx q0[0],q0[92];
-cx q0[272],q0[92];
-rz(pi/2) q0[273];
-sx q0[273];
-rz(6.76669345358979) q0[273];
-sx q0[273];
-rz(5*pi/2) q0[273];
-cx q0[273],q0[93];
-rz(pi/2) q0[273];
-sx q0[273];
-rz(pi/2) q0[273];
-cx q0[93],q0[273];
-rz(-pi/4) q0[273];
-cx q0[0],q0[273];
-rz(pi/4) q0[273];
-cx q0[93],q0[273];
-rz(-pi/4) q0[273];
-cx q0[0],q0[273];
-rz(3*pi/4) q0[273];
-sx q0[273];
-rz(pi/2) q0[273];
-rz(pi/4) q0[93];
-cx q0[0],q0[93];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[93];
-cx q0[0],q0[93];
-cx q0[273],q0[93];
-rz(pi/2) q0[274];
-sx q0[274];
-rz(1.95081235358979) q0[274];
-sx q0[274];
-rz(5*pi/2) q0[274];
-cx q0[274],q0[94];
-rz(pi/2) q0[274];
-sx q0[274];
-rz(pi/2) q0[274];
-cx q0[94],q0[274];
-rz(-pi/4) q0[274];
-cx q0[0],q0[274];
-rz(pi/4) q0[274];
-cx q0[94],q0[274];
-rz(-pi/4) q0[274];
-cx q0[0],q0[274];
-rz(3*pi/4) q0[274];
-sx q0[274];
-rz(pi/2) q0[274];
-rz(pi/4) q0[94];
-cx q0[0],q0[94];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[94];
-cx q0[0],q0[94];
-cx q0[274],q0[94];
-rz(pi/2) q0[275];
-sx q0[275];
-rz(6.84441275358979) q0[275];
-sx q0[275];
-rz(5*pi/2) q0[275];
-cx q0[275],q0[95];
-rz(pi/2) q0[275];
-sx q0[275];
-rz(pi/2) q0[275];
-cx q0[95],q0[275];
-rz(-pi/4) q0[275];
-cx q0[0],q0[275];
-rz(pi/4) q0[275];
-cx q0[95],q0[275];
-rz(-pi/4) q0[275];
-cx q0[0],q0[275];
-rz(3*pi/4) q0[275];
-sx q0[275];
-rz(pi/2) q0[275];
-rz(pi/4) q0[95];
-cx q0[0],q0[95];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[95];
-cx q0[0],q0[95];
-cx q0[275],q0[95];
-rz(pi/2) q0[276];
-sx q0[276];
-rz(9.16648485358979) q0[276];
-sx q0[276];
-rz(5*pi/2) q0[276];
-cx q0[276],q0[96];
-rz(pi/2) q0[276];
-sx q0[276];
-rz(pi/2) q0[276];
-cx q0[96],q0[276];
-rz(-pi/4) q0[276];
-cx q0[0],q0[276];
-rz(pi/4) q0[276];
-cx q0[96],q0[276];
-rz(-pi/4) q0[276];
-cx q0[0],q0[276];
-rz(3*pi/4) q0[276];
-sx q0[276];
-rz(pi/2) q0[276];
-rz(pi/4) q0[96];
-cx q0[0],q0[96];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[96];
-cx q0[0],q0[96];
-cx q0[276],q0[96];
-rz(pi/2) q0[277];
-sx q0[277];
-rz(-0.0903616464102068) q0[277];
-sx q0[277];
-rz(5*pi/2) q0[277];
-cx q0[277],q0[97];
-rz(pi/2) q0[277];
-sx q0[277];
-rz(pi/2) q0[277];
-cx q0[97],q0[277];
-rz(-pi/4) q0[277];
-cx q0[0],q0[277];
-rz(pi/4) q0[277];
-cx q0[97],q0[277];
-rz(-pi/4) q0[277];
-cx q0[0],q0[277];
-rz(3*pi/4) q0[277];
-sx q0[277];
-rz(pi/2) q0[277];
-rz(pi/4) q0[97];
-cx q0[0],q0[97];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[97];
-cx q0[0],q0[97];
-cx q0[277],q0[97];
-rz(pi/2) q0[278];
-sx q0[278];
-rz(-1.37176314641021) q0[278];
-sx q0[278];
-rz(5*pi/2) q0[278];
-cx q0[278],q0[98];
-rz(pi/2) q0[278];
-sx q0[278];
-rz(pi/2) q0[278];
-cx q0[98],q0[278];
-rz(-pi/4) q0[278];
-cx q0[0],q0[278];
-rz(pi/4) q0[278];
-cx q0[98],q0[278];
-rz(-pi/4) q0[278];
-cx q0[0],q0[278];
-rz(3*pi/4) q0[278];
-sx q0[278];
-rz(pi/2) q0[278];
-rz(pi/4) q0[98];
-cx q0[0],q0[98];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[98];
-cx q0[0],q0[98];
-cx q0[278],q0[98];
-rz(pi/2) q0[279];
-sx q0[279];
-rz(1.04488085358979) q0[279];
-sx q0[279];
-rz(5*pi/2) q0[279];
-cx q0[279],q0[99];
-rz(pi/2) q0[279];
-sx q0[279];
-rz(pi/2) q0[279];
-cx q0[99],q0[279];
-rz(-pi/4) q0[279];
-cx q0[0],q0[279];
-rz(pi/4) q0[279];
-cx q0[99],q0[279];
-rz(-pi/4) q0[279];
-cx q0[0],q0[279];
-rz(3*pi/4) q0[279];
-sx q0[279];
-rz(pi/2) q0[279];
-rz(pi/4) q0[99];
-cx q0[0],q0[99];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[99];
-cx q0[0],q0[99];
-cx q0[279],q0[99];
-rz(pi/2) q0[280];
-sx q0[280];
-rz(9.00812965358979) q0[280];
-sx q0[280];
-rz(5*pi/2) q0[280];
-cx q0[280],q0[100];
-rz(pi/2) q0[280];
-sx q0[280];
-rz(pi/2) q0[280];
-cx q0[100],q0[280];
-rz(-pi/4) q0[280];
-cx q0[0],q0[280];
-rz(pi/4) q0[280];
-cx q0[100],q0[280];
-rz(pi/4) q0[100];
-rz(-pi/4) q0[280];
-cx q0[0],q0[280];
-cx q0[0],q0[100];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[100];
-cx q0[0],q0[100];
-rz(3*pi/4) q0[280];
-sx q0[280];
-rz(pi/2) q0[280];
-cx q0[280],q0[100];
-rz(pi/2) q0[281];
-sx q0[281];
-rz(0.721589453589793) q0[281];
-sx q0[281];
-rz(5*pi/2) q0[281];
-cx q0[281],q0[101];
-rz(pi/2) q0[281];
-sx q0[281];
-rz(pi/2) q0[281];
-cx q0[101],q0[281];
-rz(-pi/4) q0[281];
-cx q0[0],q0[281];
-rz(pi/4) q0[281];
-cx q0[101],q0[281];
-rz(pi/4) q0[101];
-rz(-pi/4) q0[281];
-cx q0[0],q0[281];
-cx q0[0],q0[101];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[101];
-cx q0[0],q0[101];
-rz(3*pi/4) q0[281];
-sx q0[281];
-rz(pi/2) q0[281];
-cx q0[281],q0[101];
-rz(pi/2) q0[282];
-sx q0[282];
-rz(5.41598475358979) q0[282];
-sx q0[282];
-rz(5*pi/2) q0[282];
-cx q0[282],q0[102];
-rz(pi/2) q0[282];
-sx q0[282];
-rz(pi/2) q0[282];
-cx q0[102],q0[282];
-rz(-pi/4) q0[282];
-cx q0[0],q0[282];
-rz(pi/4) q0[282];
-cx q0[102],q0[282];
-rz(pi/4) q0[102];
-rz(-pi/4) q0[282];
-cx q0[0],q0[282];
-cx q0[0],q0[102];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[102];
-cx q0[0],q0[102];
-rz(3*pi/4) q0[282];
-sx q0[282];
-rz(pi/2) q0[282];
-cx q0[282],q0[102];
-rz(pi/2) q0[283];
-sx q0[283];
-rz(2.73679994358979) q0[283];
-sx q0[283];
-rz(5*pi/2) q0[283];
-cx q0[283],q0[103];
-rz(pi/2) q0[283];
-sx q0[283];
-rz(pi/2) q0[283];
-cx q0[103],q0[283];
-rz(-pi/4) q0[283];
-cx q0[0],q0[283];
-rz(pi/4) q0[283];
-cx q0[103],q0[283];
-rz(pi/4) q0[103];
-rz(-pi/4) q0[283];
-cx q0[0],q0[283];
-cx q0[0],q0[103];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[103];
-cx q0[0],q0[103];
-rz(3*pi/4) q0[283];
-sx q0[283];
-rz(pi/2) q0[283];
-cx q0[283],q0[103];
-rz(pi/2) q0[284];
-sx q0[284];
-rz(-1.24469284641021) q0[284];
-sx q0[284];
-rz(5*pi/2) q0[284];
-cx q0[284],q0[104];
-rz(pi/2) q0[284];
-sx q0[284];
-rz(pi/2) q0[284];
-cx q0[104],q0[284];
-rz(-pi/4) q0[284];
-cx q0[0],q0[284];
-rz(pi/4) q0[284];
-cx q0[104],q0[284];
-rz(pi/4) q0[104];
-rz(-pi/4) q0[284];
-cx q0[0],q0[284];
-cx q0[0],q0[104];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[104];
-cx q0[0],q0[104];
-rz(3*pi/4) q0[284];
-sx q0[284];
-rz(pi/2) q0[284];
-cx q0[284],q0[104];
-rz(pi/2) q0[285];
-sx q0[285];
-rz(-2.13890254641021) q0[285];
-sx q0[285];
-rz(5*pi/2) q0[285];
-cx q0[285],q0[105];
-rz(pi/2) q0[285];
-sx q0[285];
-rz(pi/2) q0[285];
-cx q0[105],q0[285];
-rz(-pi/4) q0[285];
-cx q0[0],q0[285];
-rz(pi/4) q0[285];
-cx q0[105],q0[285];
-rz(pi/4) q0[105];
-rz(-pi/4) q0[285];
-cx q0[0],q0[285];
-cx q0[0],q0[105];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[105];
-cx q0[0],q0[105];
-rz(3*pi/4) q0[285];
-sx q0[285];
-rz(pi/2) q0[285];
-cx q0[285],q0[105];
-rz(pi/2) q0[286];
-sx q0[286];
-rz(8.83374155358979) q0[286];
-sx q0[286];
-rz(5*pi/2) q0[286];
-cx q0[286],q0[106];
-rz(pi/2) q0[286];
-sx q0[286];
-rz(pi/2) q0[286];
-cx q0[106],q0[286];
-rz(-pi/4) q0[286];
-cx q0[0],q0[286];
-rz(pi/4) q0[286];
-cx q0[106],q0[286];
-rz(pi/4) q0[106];
-rz(-pi/4) q0[286];
-cx q0[0],q0[286];
-cx q0[0],q0[106];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[106];
-cx q0[0],q0[106];
-rz(3*pi/4) q0[286];
-sx q0[286];
-rz(pi/2) q0[286];
-cx q0[286],q0[106];
-rz(pi/2) q0[287];
-sx q0[287];
-rz(-0.428614646410207) q0[287];
-sx q0[287];
-rz(5*pi/2) q0[287];
-cx q0[287],q0[107];
-rz(pi/2) q0[287];
-sx q0[287];
-rz(pi/2) q0[287];
-cx q0[107],q0[287];
-rz(-pi/4) q0[287];
-cx q0[0],q0[287];
-rz(pi/4) q0[287];
-cx q0[107],q0[287];
-rz(pi/4) q0[107];
-rz(-pi/4) q0[287];
-cx q0[0],q0[287];
-cx q0[0],q0[107];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[107];
-cx q0[0],q0[107];
-rz(3*pi/4) q0[287];
-sx q0[287];
-rz(pi/2) q0[287];
-cx q0[287],q0[107];
-rz(pi/2) q0[288];
-sx q0[288];
-rz(9.49226755358979) q0[288];
-sx q0[288];
-rz(5*pi/2) q0[288];
-cx q0[288],q0[108];
-rz(pi/2) q0[288];
-sx q0[288];
-rz(pi/2) q0[288];
-cx q0[108],q0[288];
-rz(-pi/4) q0[288];
-cx q0[0],q0[288];
-rz(pi/4) q0[288];
-cx q0[108],q0[288];
-rz(pi/4) q0[108];
-rz(-pi/4) q0[288];
-cx q0[0],q0[288];
-cx q0[0],q0[108];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[108];
-cx q0[0],q0[108];
-rz(3*pi/4) q0[288];
-sx q0[288];
-rz(pi/2) q0[288];
-cx q0[288],q0[108];
-rz(pi/2) q0[289];
-sx q0[289];
-rz(1.20396855358979) q0[289];
-sx q0[289];
-rz(5*pi/2) q0[289];
-cx q0[289],q0[109];
-rz(pi/2) q0[289];
-sx q0[289];
-rz(pi/2) q0[289];
-cx q0[109],q0[289];
-rz(-pi/4) q0[289];
-cx q0[0],q0[289];
-rz(pi/4) q0[289];
-cx q0[109],q0[289];
-rz(pi/4) q0[109];
-rz(-pi/4) q0[289];
-cx q0[0],q0[289];
-cx q0[0],q0[109];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[109];
-cx q0[0],q0[109];
-rz(3*pi/4) q0[289];
-sx q0[289];
-rz(pi/2) q0[289];
-cx q0[289],q0[109];
-rz(pi/2) q0[290];
-sx q0[290];
-rz(2.92424012358979) q0[290];
-sx q0[290];
-rz(5*pi/2) q0[290];
-cx q0[290],q0[110];
-rz(pi/2) q0[290];
-sx q0[290];
-rz(pi/2) q0[290];
-cx q0[110],q0[290];
-rz(-pi/4) q0[290];
-cx q0[0],q0[290];
-rz(pi/4) q0[290];
-cx q0[110],q0[290];
-rz(pi/4) q0[110];
-rz(-pi/4) q0[290];
-cx q0[0],q0[290];
-cx q0[0],q0[110];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[110];
-cx q0[0],q0[110];
-rz(3*pi/4) q0[290];
-sx q0[290];
-rz(pi/2) q0[290];
-cx q0[290],q0[110];
-rz(pi/2) q0[291];
-sx q0[291];
-rz(-0.188524846410207) q0[291];
-sx q0[291];
-rz(5*pi/2) q0[291];
-cx q0[291],q0[111];
-rz(pi/2) q0[291];
-sx q0[291];
-rz(pi/2) q0[291];
-cx q0[111],q0[291];
-rz(-pi/4) q0[291];
-cx q0[0],q0[291];
-rz(pi/4) q0[291];
-cx q0[111],q0[291];
-rz(pi/4) q0[111];
-rz(-pi/4) q0[291];
-cx q0[0],q0[291];
-cx q0[0],q0[111];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[111];
-cx q0[0],q0[111];
-rz(3*pi/4) q0[291];
-sx q0[291];
-rz(pi/2) q0[291];
-cx q0[291],q0[111];
-rz(pi/2) q0[292];
-sx q0[292];
-rz(1.00808505358979) q0[292];
-sx q0[292];
-rz(5*pi/2) q0[292];
-cx q0[292],q0[112];
-rz(pi/2) q0[292];
-sx q0[292];
-rz(pi/2) q0[292];
-cx q0[112],q0[292];
-rz(-pi/4) q0[292];
-cx q0[0],q0[292];
-rz(pi/4) q0[292];
-cx q0[112],q0[292];
-rz(pi/4) q0[112];
-rz(-pi/4) q0[292];
-cx q0[0],q0[292];
-cx q0[0],q0[112];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[112];
-cx q0[0],q0[112];
-rz(3*pi/4) q0[292];
-sx q0[292];
-rz(pi/2) q0[292];
-cx q0[292],q0[112];
-rz(pi/2) q0[293];
-sx q0[293];
-rz(-0.378013746410207) q0[293];
-sx q0[293];
-rz(5*pi/2) q0[293];
-cx q0[293],q0[113];
-rz(pi/2) q0[293];
-sx q0[293];
-rz(pi/2) q0[293];
-cx q0[113],q0[293];
-rz(-pi/4) q0[293];
-cx q0[0],q0[293];
-rz(pi/4) q0[293];
-cx q0[113],q0[293];
-rz(pi/4) q0[113];
-rz(-pi/4) q0[293];
-cx q0[0],q0[293];
-cx q0[0],q0[113];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[113];
-cx q0[0],q0[113];
-rz(3*pi/4) q0[293];
-sx q0[293];
-rz(pi/2) q0[293];
-cx q0[293],q0[113];
-rz(pi/2) q0[294];
-sx q0[294];
-rz(-0.459315446410207) q0[294];
-sx q0[294];
-rz(5*pi/2) q0[294];
-cx q0[294],q0[114];
-rz(pi/2) q0[294];
-sx q0[294];
-rz(pi/2) q0[294];
-cx q0[114],q0[294];
-rz(-pi/4) q0[294];
-cx q0[0],q0[294];
-rz(pi/4) q0[294];
-cx q0[114],q0[294];
-rz(pi/4) q0[114];
-rz(-pi/4) q0[294];
-cx q0[0],q0[294];
-cx q0[0],q0[114];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[114];
-cx q0[0],q0[114];
-rz(3*pi/4) q0[294];
-sx q0[294];
-rz(pi/2) q0[294];
-cx q0[294],q0[114];
-rz(pi/2) q0[295];
-sx q0[295];
-rz(8.40942395358979) q0[295];
-sx q0[295];
-rz(5*pi/2) q0[295];
-cx q0[295],q0[115];
-rz(pi/2) q0[295];
-sx q0[295];
-rz(pi/2) q0[295];
-cx q0[115],q0[295];
-rz(-pi/4) q0[295];
-cx q0[0],q0[295];
-rz(pi/4) q0[295];
-cx q0[115],q0[295];
-rz(pi/4) q0[115];
-rz(-pi/4) q0[295];
-cx q0[0],q0[295];
-cx q0[0],q0[115];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[115];
-cx q0[0],q0[115];
-rz(3*pi/4) q0[295];
-sx q0[295];
-rz(pi/2) q0[295];
-cx q0[295],q0[115];
-rz(pi/2) q0[296];
-sx q0[296];
-rz(4.62403355358979) q0[296];
-sx q0[296];
-rz(5*pi/2) q0[296];
-cx q0[296],q0[116];
-rz(pi/2) q0[296];
-sx q0[296];
-rz(pi/2) q0[296];
-cx q0[116],q0[296];
-rz(-pi/4) q0[296];
-cx q0[0],q0[296];
-rz(pi/4) q0[296];
-cx q0[116],q0[296];
-rz(pi/4) q0[116];
-rz(-pi/4) q0[296];
-cx q0[0],q0[296];
-cx q0[0],q0[116];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[116];
-cx q0[0],q0[116];
-rz(3*pi/4) q0[296];
-sx q0[296];
-rz(pi/2) q0[296];
-cx q0[296],q0[116];
-rz(pi/2) q0[297];
-sx q0[297];
-rz(6.08596305358979) q0[297];
-sx q0[297];
-rz(5*pi/2) q0[297];
-cx q0[297],q0[117];
-rz(pi/2) q0[297];
-sx q0[297];
-rz(pi/2) q0[297];
-cx q0[117],q0[297];
-rz(-pi/4) q0[297];
-cx q0[0],q0[297];
-rz(pi/4) q0[297];
-cx q0[117],q0[297];
-rz(pi/4) q0[117];
-rz(-pi/4) q0[297];
-cx q0[0],q0[297];
-cx q0[0],q0[117];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[117];
-cx q0[0],q0[117];
-rz(3*pi/4) q0[297];
-sx q0[297];
-rz(pi/2) q0[297];
-cx q0[297],q0[117];
-rz(pi/2) q0[298];
-sx q0[298];
-rz(0.250814153589793) q0[298];
-sx q0[298];
-rz(5*pi/2) q0[298];
-cx q0[298],q0[118];
-rz(pi/2) q0[298];
-sx q0[298];
-rz(pi/2) q0[298];
-cx q0[118],q0[298];
-rz(-pi/4) q0[298];
-cx q0[0],q0[298];
-rz(pi/4) q0[298];
-cx q0[118],q0[298];
-rz(pi/4) q0[118];
-rz(-pi/4) q0[298];
-cx q0[0],q0[298];
-cx q0[0],q0[118];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[118];
-cx q0[0],q0[118];
-rz(3*pi/4) q0[298];
-sx q0[298];
-rz(pi/2) q0[298];
-cx q0[298],q0[118];
-rz(pi/2) q0[299];
-sx q0[299];
-rz(7.32098095358979) q0[299];
-sx q0[299];
-rz(5*pi/2) q0[299];
-cx q0[299],q0[119];
-rz(pi/2) q0[299];
-sx q0[299];
-rz(pi/2) q0[299];
-cx q0[119],q0[299];
-rz(-pi/4) q0[299];
-cx q0[0],q0[299];
-rz(pi/4) q0[299];
-cx q0[119],q0[299];
-rz(pi/4) q0[119];
-rz(-pi/4) q0[299];
-cx q0[0],q0[299];
-cx q0[0],q0[119];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[119];
-cx q0[0],q0[119];
-rz(3*pi/4) q0[299];
-sx q0[299];
-rz(pi/2) q0[299];
-cx q0[299],q0[119];
-rz(pi/2) q0[300];
-sx q0[300];
-rz(-1.92008904641021) q0[300];
-sx q0[300];
-rz(5*pi/2) q0[300];
-cx q0[300],q0[120];
-rz(pi/2) q0[300];
-sx q0[300];
-rz(pi/2) q0[300];
-cx q0[120],q0[300];
-rz(-pi/4) q0[300];
-cx q0[0],q0[300];
-rz(pi/4) q0[300];
-cx q0[120],q0[300];
-rz(pi/4) q0[120];
-rz(-pi/4) q0[300];
-cx q0[0],q0[300];
-cx q0[0],q0[120];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[120];
-cx q0[0],q0[120];
-rz(3*pi/4) q0[300];
-sx q0[300];
-rz(pi/2) q0[300];
-cx q0[300],q0[120];
-rz(pi/2) q0[301];
-sx q0[301];
-rz(9.28492705358979) q0[301];
-sx q0[301];
-rz(5*pi/2) q0[301];
-cx q0[301],q0[121];
-rz(pi/2) q0[301];
-sx q0[301];
-rz(pi/2) q0[301];
-cx q0[121],q0[301];
-rz(-pi/4) q0[301];
-cx q0[0],q0[301];
-rz(pi/4) q0[301];
-cx q0[121],q0[301];
-rz(pi/4) q0[121];
-rz(-pi/4) q0[301];
-cx q0[0],q0[301];
-cx q0[0],q0[121];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[121];
-cx q0[0],q0[121];
-rz(3*pi/4) q0[301];
-sx q0[301];
-rz(pi/2) q0[301];
-cx q0[301],q0[121];
-rz(pi/2) q0[302];
-sx q0[302];
-rz(-1.79859104641021) q0[302];
-sx q0[302];
-rz(5*pi/2) q0[302];
-cx q0[302],q0[122];
-rz(pi/2) q0[302];
-sx q0[302];
-rz(pi/2) q0[302];
-cx q0[122],q0[302];
-rz(-pi/4) q0[302];
-cx q0[0],q0[302];
-rz(pi/4) q0[302];
-cx q0[122],q0[302];
-rz(pi/4) q0[122];
-rz(-pi/4) q0[302];
-cx q0[0],q0[302];
-cx q0[0],q0[122];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[122];
-cx q0[0],q0[122];
-rz(3*pi/4) q0[302];
-sx q0[302];
-rz(pi/2) q0[302];
-cx q0[302],q0[122];
-rz(pi/2) q0[303];
-sx q0[303];
-rz(-1.13798434641021) q0[303];
-sx q0[303];
-rz(5*pi/2) q0[303];
-cx q0[303],q0[123];
-rz(pi/2) q0[303];
-sx q0[303];
-rz(pi/2) q0[303];
-cx q0[123],q0[303];
-rz(-pi/4) q0[303];
-cx q0[0],q0[303];
-rz(pi/4) q0[303];
-cx q0[123],q0[303];
-rz(pi/4) q0[123];
-rz(-pi/4) q0[303];
-cx q0[0],q0[303];
-cx q0[0],q0[123];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[123];
-cx q0[0],q0[123];
-rz(3*pi/4) q0[303];
-sx q0[303];
-rz(pi/2) q0[303];
-cx q0[303],q0[123];
-rz(pi/2) q0[304];
-sx q0[304];
-rz(7.77013785358979) q0[304];
-sx q0[304];
-rz(5*pi/2) q0[304];
-cx q0[304],q0[124];
-rz(pi/2) q0[304];
-sx q0[304];
-rz(pi/2) q0[304];
-cx q0[124],q0[304];
-rz(-pi/4) q0[304];
-cx q0[0],q0[304];
-rz(pi/4) q0[304];
-cx q0[124],q0[304];
-rz(pi/4) q0[124];
-rz(-pi/4) q0[304];
-cx q0[0],q0[304];
-cx q0[0],q0[124];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[124];
-cx q0[0],q0[124];
-rz(3*pi/4) q0[304];
-sx q0[304];
-rz(pi/2) q0[304];
-cx q0[304],q0[124];
-rz(pi/2) q0[305];
-sx q0[305];
-rz(9.12206575358979) q0[305];
-sx q0[305];
-rz(5*pi/2) q0[305];
-cx q0[305],q0[125];
-rz(pi/2) q0[305];
-sx q0[305];
-rz(pi/2) q0[305];
-cx q0[125],q0[305];
-rz(-pi/4) q0[305];
-cx q0[0],q0[305];
-rz(pi/4) q0[305];
-cx q0[125],q0[305];
-rz(pi/4) q0[125];
-rz(-pi/4) q0[305];
-cx q0[0],q0[305];
-cx q0[0],q0[125];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[125];
-cx q0[0],q0[125];
-rz(3*pi/4) q0[305];
-sx q0[305];
-rz(pi/2) q0[305];
-cx q0[305],q0[125];
-rz(pi/2) q0[306];
-sx q0[306];
-rz(6.10575185358979) q0[306];
-sx q0[306];
-rz(5*pi/2) q0[306];
-cx q0[306],q0[126];
-rz(pi/2) q0[306];
-sx q0[306];
-rz(pi/2) q0[306];
-cx q0[126],q0[306];
-rz(-pi/4) q0[306];
-cx q0[0],q0[306];
-rz(pi/4) q0[306];
-cx q0[126],q0[306];
-rz(pi/4) q0[126];
-rz(-pi/4) q0[306];
-cx q0[0],q0[306];
-cx q0[0],q0[126];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[126];
-cx q0[0],q0[126];
-rz(3*pi/4) q0[306];
-sx q0[306];
-rz(pi/2) q0[306];
-cx q0[306],q0[126];
-rz(pi/2) q0[307];
-sx q0[307];
-rz(6.10316775358979) q0[307];
-sx q0[307];
-rz(5*pi/2) q0[307];
-cx q0[307],q0[127];
-rz(pi/2) q0[307];
-sx q0[307];
-rz(pi/2) q0[307];
-cx q0[127],q0[307];
-rz(-pi/4) q0[307];
-cx q0[0],q0[307];
-rz(pi/4) q0[307];
-cx q0[127],q0[307];
-rz(pi/4) q0[127];
-rz(-pi/4) q0[307];
-cx q0[0],q0[307];
-cx q0[0],q0[127];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[127];
-cx q0[0],q0[127];
-rz(3*pi/4) q0[307];
-sx q0[307];
-rz(pi/2) q0[307];
-cx q0[307],q0[127];
-rz(pi/2) q0[308];
-sx q0[308];
-rz(7.64131375358979) q0[308];
-sx q0[308];
-rz(5*pi/2) q0[308];
-cx q0[308],q0[128];
-rz(pi/2) q0[308];
-sx q0[308];
-rz(pi/2) q0[308];
-cx q0[128],q0[308];
-rz(-pi/4) q0[308];
-cx q0[0],q0[308];
-rz(pi/4) q0[308];
-cx q0[128],q0[308];
-rz(pi/4) q0[128];
-rz(-pi/4) q0[308];
-cx q0[0],q0[308];
-cx q0[0],q0[128];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[128];
-cx q0[0],q0[128];
-rz(3*pi/4) q0[308];
-sx q0[308];
-rz(pi/2) q0[308];
-cx q0[308],q0[128];
-rz(pi/2) q0[309];
-sx q0[309];
-rz(6.81749295358979) q0[309];
-sx q0[309];
-rz(5*pi/2) q0[309];
-cx q0[309],q0[129];
-rz(pi/2) q0[309];
-sx q0[309];
-rz(pi/2) q0[309];
-cx q0[129],q0[309];
-rz(-pi/4) q0[309];
-cx q0[0],q0[309];
-rz(pi/4) q0[309];
-cx q0[129],q0[309];
-rz(pi/4) q0[129];
-rz(-pi/4) q0[309];
-cx q0[0],q0[309];
-cx q0[0],q0[129];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[129];
-cx q0[0],q0[129];
-rz(3*pi/4) q0[309];
-sx q0[309];
-rz(pi/2) q0[309];
-cx q0[309],q0[129];
-rz(pi/2) q0[310];
-sx q0[310];
-rz(-1.51818994641021) q0[310];
-sx q0[310];
-rz(5*pi/2) q0[310];
-cx q0[310],q0[130];
-rz(pi/2) q0[310];
-sx q0[310];
-rz(pi/2) q0[310];
-cx q0[130],q0[310];
-rz(-pi/4) q0[310];
-cx q0[0],q0[310];
-rz(pi/4) q0[310];
-cx q0[130],q0[310];
-rz(pi/4) q0[130];
-rz(-pi/4) q0[310];
-cx q0[0],q0[310];
-cx q0[0],q0[130];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[130];
-cx q0[0],q0[130];
-rz(3*pi/4) q0[310];
-sx q0[310];
-rz(pi/2) q0[310];
-cx q0[310],q0[130];
-rz(pi/2) q0[311];
-sx q0[311];
-rz(-1.82292594641021) q0[311];
-sx q0[311];
-rz(5*pi/2) q0[311];
-cx q0[311],q0[131];
-rz(pi/2) q0[311];
-sx q0[311];
-rz(pi/2) q0[311];
-cx q0[131],q0[311];
-rz(-pi/4) q0[311];
-cx q0[0],q0[311];
-rz(pi/4) q0[311];
-cx q0[131],q0[311];
-rz(pi/4) q0[131];
-rz(-pi/4) q0[311];
-cx q0[0],q0[311];
-cx q0[0],q0[131];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[131];
-cx q0[0],q0[131];
-rz(3*pi/4) q0[311];
-sx q0[311];
-rz(pi/2) q0[311];
-cx q0[311],q0[131];
-rz(pi/2) q0[312];
-sx q0[312];
-rz(8.50238095358979) q0[312];
-sx q0[312];
-rz(5*pi/2) q0[312];
-cx q0[312],q0[132];
-rz(pi/2) q0[312];
-sx q0[312];
-rz(pi/2) q0[312];
-cx q0[132],q0[312];
-rz(-pi/4) q0[312];
-cx q0[0],q0[312];
-rz(pi/4) q0[312];
-cx q0[132],q0[312];
-rz(pi/4) q0[132];
-rz(-pi/4) q0[312];
-cx q0[0],q0[312];
-cx q0[0],q0[132];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[132];
-cx q0[0],q0[132];
-rz(3*pi/4) q0[312];
-sx q0[312];
-rz(pi/2) q0[312];
-cx q0[312],q0[132];
-rz(pi/2) q0[313];
-sx q0[313];
-rz(9.52951775358979) q0[313];
-sx q0[313];
-rz(5*pi/2) q0[313];
-cx q0[313],q0[133];
-rz(pi/2) q0[313];
-sx q0[313];
-rz(pi/2) q0[313];
-cx q0[133],q0[313];
-rz(-pi/4) q0[313];
-cx q0[0],q0[313];
-rz(pi/4) q0[313];
-cx q0[133],q0[313];
-rz(pi/4) q0[133];
-rz(-pi/4) q0[313];
-cx q0[0],q0[313];
-cx q0[0],q0[133];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[133];
-cx q0[0],q0[133];
-rz(3*pi/4) q0[313];
-sx q0[313];
-rz(pi/2) q0[313];
-cx q0[313],q0[133];
-rz(pi/2) q0[314];
-sx q0[314];
-rz(7.59248025358979) q0[314];
-sx q0[314];
-rz(5*pi/2) q0[314];
-cx q0[314],q0[134];
-rz(pi/2) q0[314];
-sx q0[314];
-rz(pi/2) q0[314];
-cx q0[134],q0[314];
-rz(-pi/4) q0[314];
-cx q0[0],q0[314];
-rz(pi/4) q0[314];
-cx q0[134],q0[314];
-rz(pi/4) q0[134];
-rz(-pi/4) q0[314];
-cx q0[0],q0[314];
-cx q0[0],q0[134];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[134];
-cx q0[0],q0[134];
-rz(3*pi/4) q0[314];
-sx q0[314];
-rz(pi/2) q0[314];
-cx q0[314],q0[134];
-rz(pi/2) q0[315];
-sx q0[315];
-rz(6.43817285358979) q0[315];
-sx q0[315];
-rz(5*pi/2) q0[315];
-cx q0[315],q0[135];
-rz(pi/2) q0[315];
-sx q0[315];
-rz(pi/2) q0[315];
-cx q0[135],q0[315];
-rz(-pi/4) q0[315];
-cx q0[0],q0[315];
-rz(pi/4) q0[315];
-cx q0[135],q0[315];
-rz(pi/4) q0[135];
-rz(-pi/4) q0[315];
-cx q0[0],q0[315];
-cx q0[0],q0[135];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[135];
-cx q0[0],q0[135];
-rz(3*pi/4) q0[315];
-sx q0[315];
-rz(pi/2) q0[315];
-cx q0[315],q0[135];
-rz(pi/2) q0[316];
-sx q0[316];
-rz(6.67707075358979) q0[316];
-sx q0[316];
-rz(5*pi/2) q0[316];
-cx q0[316],q0[136];
-rz(pi/2) q0[316];
-sx q0[316];
-rz(pi/2) q0[316];
-cx q0[136],q0[316];
-rz(-pi/4) q0[316];
-cx q0[0],q0[316];
-rz(pi/4) q0[316];
-cx q0[136],q0[316];
-rz(pi/4) q0[136];
-rz(-pi/4) q0[316];
-cx q0[0],q0[316];
-cx q0[0],q0[136];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[136];
-cx q0[0],q0[136];
-rz(3*pi/4) q0[316];
-sx q0[316];
-rz(pi/2) q0[316];
-cx q0[316],q0[136];
-rz(pi/2) q0[317];
-sx q0[317];
-rz(-0.730208746410207) q0[317];
-sx q0[317];
-rz(5*pi/2) q0[317];
-cx q0[317],q0[137];
-rz(pi/2) q0[317];
-sx q0[317];
-rz(pi/2) q0[317];
-cx q0[137],q0[317];
-rz(-pi/4) q0[317];
-cx q0[0],q0[317];
-rz(pi/4) q0[317];
-cx q0[137],q0[317];
-rz(pi/4) q0[137];
-rz(-pi/4) q0[317];
-cx q0[0],q0[317];
-cx q0[0],q0[137];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[137];
-cx q0[0],q0[137];
-rz(3*pi/4) q0[317];
-sx q0[317];
-rz(pi/2) q0[317];
-cx q0[317],q0[137];
-rz(pi/2) q0[318];
-sx q0[318];
-rz(7.34937825358979) q0[318];
-sx q0[318];
-rz(5*pi/2) q0[318];
-cx q0[318],q0[138];
-rz(pi/2) q0[318];
-sx q0[318];
-rz(pi/2) q0[318];
-cx q0[138],q0[318];
-rz(-pi/4) q0[318];
-cx q0[0],q0[318];
-rz(pi/4) q0[318];
-cx q0[138],q0[318];
-rz(pi/4) q0[138];
-rz(-pi/4) q0[318];
-cx q0[0],q0[318];
-cx q0[0],q0[138];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[138];
-cx q0[0],q0[138];
-rz(3*pi/4) q0[318];
-sx q0[318];
-rz(pi/2) q0[318];
-cx q0[318],q0[138];
-rz(pi/2) q0[319];
-sx q0[319];
-rz(3.23055787058979) q0[319];
-sx q0[319];
-rz(5*pi/2) q0[319];
-cx q0[319],q0[139];
-rz(pi/2) q0[319];
-sx q0[319];
-rz(pi/2) q0[319];
-cx q0[139],q0[319];
-rz(-pi/4) q0[319];
-cx q0[0],q0[319];
-rz(pi/4) q0[319];
-cx q0[139],q0[319];
-rz(pi/4) q0[139];
-rz(-pi/4) q0[319];
-cx q0[0],q0[319];
-cx q0[0],q0[139];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[139];
-cx q0[0],q0[139];
-rz(3*pi/4) q0[319];
-sx q0[319];
-rz(pi/2) q0[319];
-cx q0[319],q0[139];
-rz(pi/2) q0[320];
-sx q0[320];
-rz(-1.37231344641021) q0[320];
-sx q0[320];
-rz(5*pi/2) q0[320];
-cx q0[320],q0[140];
-rz(pi/2) q0[320];
-sx q0[320];
-rz(pi/2) q0[320];
-cx q0[140],q0[320];
-rz(-pi/4) q0[320];
-cx q0[0],q0[320];
-rz(pi/4) q0[320];
-cx q0[140],q0[320];
-rz(pi/4) q0[140];
-rz(-pi/4) q0[320];
-cx q0[0],q0[320];
-cx q0[0],q0[140];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[140];
-cx q0[0],q0[140];
-rz(3*pi/4) q0[320];
-sx q0[320];
-rz(pi/2) q0[320];
-cx q0[320],q0[140];
-rz(pi/2) q0[321];
-sx q0[321];
-rz(-1.27702264641021) q0[321];
-sx q0[321];
-rz(5*pi/2) q0[321];
-cx q0[321],q0[141];
-rz(pi/2) q0[321];
-sx q0[321];
-rz(pi/2) q0[321];
-cx q0[141],q0[321];
-rz(-pi/4) q0[321];
-cx q0[0],q0[321];
-rz(pi/4) q0[321];
-cx q0[141],q0[321];
-rz(pi/4) q0[141];
-rz(-pi/4) q0[321];
-cx q0[0],q0[321];
-cx q0[0],q0[141];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[141];
-cx q0[0],q0[141];
-rz(3*pi/4) q0[321];
-sx q0[321];
-rz(pi/2) q0[321];
-cx q0[321],q0[141];
-rz(pi/2) q0[322];
-sx q0[322];
-rz(7.51084005358979) q0[322];
-sx q0[322];
-rz(5*pi/2) q0[322];
-cx q0[322],q0[142];
-rz(pi/2) q0[322];
-sx q0[322];
-rz(pi/2) q0[322];
-cx q0[142],q0[322];
-rz(-pi/4) q0[322];
-cx q0[0],q0[322];
-rz(pi/4) q0[322];
-cx q0[142],q0[322];
-rz(pi/4) q0[142];
-rz(-pi/4) q0[322];
-cx q0[0],q0[322];
-cx q0[0],q0[142];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[142];
-cx q0[0],q0[142];
-rz(3*pi/4) q0[322];
-sx q0[322];
-rz(pi/2) q0[322];
-cx q0[322],q0[142];
-rz(pi/2) q0[323];
-sx q0[323];
-rz(0.742284153589793) q0[323];
-sx q0[323];
-rz(5*pi/2) q0[323];
-cx q0[323],q0[143];
-rz(pi/2) q0[323];
-sx q0[323];
-rz(pi/2) q0[323];
-cx q0[143],q0[323];
-rz(-pi/4) q0[323];
-cx q0[0],q0[323];
-rz(pi/4) q0[323];
-cx q0[143],q0[323];
-rz(pi/4) q0[143];
-rz(-pi/4) q0[323];
-cx q0[0],q0[323];
-cx q0[0],q0[143];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[143];
-cx q0[0],q0[143];
-rz(3*pi/4) q0[323];
-sx q0[323];
-rz(pi/2) q0[323];
-cx q0[323],q0[143];
-rz(pi/2) q0[324];
-sx q0[324];
-rz(2.10462565358979) q0[324];
-sx q0[324];
-rz(5*pi/2) q0[324];
-cx q0[324],q0[144];
-rz(pi/2) q0[324];
-sx q0[324];
-rz(pi/2) q0[324];
-cx q0[144],q0[324];
-rz(-pi/4) q0[324];
-cx q0[0],q0[324];
-rz(pi/4) q0[324];
-cx q0[144],q0[324];
-rz(pi/4) q0[144];
-rz(-pi/4) q0[324];
-cx q0[0],q0[324];
-cx q0[0],q0[144];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[144];
-cx q0[0],q0[144];
-rz(3*pi/4) q0[324];
-sx q0[324];
-rz(pi/2) q0[324];
-cx q0[324],q0[144];
-rz(pi/2) q0[325];
-sx q0[325];
-rz(7.25195385358979) q0[325];
-sx q0[325];
-rz(5*pi/2) q0[325];
-cx q0[325],q0[145];
-rz(pi/2) q0[325];
-sx q0[325];
-rz(pi/2) q0[325];
-cx q0[145],q0[325];
-rz(-pi/4) q0[325];
-cx q0[0],q0[325];
-rz(pi/4) q0[325];
-cx q0[145],q0[325];
-rz(pi/4) q0[145];
-rz(-pi/4) q0[325];
-cx q0[0],q0[325];
-cx q0[0],q0[145];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[145];
-cx q0[0],q0[145];
-rz(3*pi/4) q0[325];
-sx q0[325];
-rz(pi/2) q0[325];
-cx q0[325],q0[145];
-rz(pi/2) q0[326];
-sx q0[326];
-rz(7.41202625358979) q0[326];
-sx q0[326];
-rz(5*pi/2) q0[326];
-cx q0[326],q0[146];
-rz(pi/2) q0[326];
-sx q0[326];
-rz(pi/2) q0[326];
-cx q0[146],q0[326];
-rz(-pi/4) q0[326];
-cx q0[0],q0[326];
-rz(pi/4) q0[326];
-cx q0[146],q0[326];
-rz(pi/4) q0[146];
-rz(-pi/4) q0[326];
-cx q0[0],q0[326];
-cx q0[0],q0[146];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[146];
-cx q0[0],q0[146];
-rz(3*pi/4) q0[326];
-sx q0[326];
-rz(pi/2) q0[326];
-cx q0[326],q0[146];
-rz(pi/2) q0[327];
-sx q0[327];
-rz(2.74535243358979) q0[327];
-sx q0[327];
-rz(5*pi/2) q0[327];
-cx q0[327],q0[147];
-rz(pi/2) q0[327];
-sx q0[327];
-rz(pi/2) q0[327];
-cx q0[147],q0[327];
-rz(-pi/4) q0[327];
-cx q0[0],q0[327];
-rz(pi/4) q0[327];
-cx q0[147],q0[327];
-rz(pi/4) q0[147];
-rz(-pi/4) q0[327];
-cx q0[0],q0[327];
-cx q0[0],q0[147];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[147];
-cx q0[0],q0[147];
-rz(3*pi/4) q0[327];
-sx q0[327];
-rz(pi/2) q0[327];
-cx q0[327],q0[147];
-rz(pi/2) q0[328];
-sx q0[328];
-rz(2.86912286358979) q0[328];
-sx q0[328];
-rz(5*pi/2) q0[328];
-cx q0[328],q0[148];
-rz(pi/2) q0[328];
-sx q0[328];
-rz(pi/2) q0[328];
-cx q0[148],q0[328];
-rz(-pi/4) q0[328];
-cx q0[0],q0[328];
-rz(pi/4) q0[328];
-cx q0[148],q0[328];
-rz(pi/4) q0[148];
-rz(-pi/4) q0[328];
-cx q0[0],q0[328];
-cx q0[0],q0[148];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[148];
-cx q0[0],q0[148];
-rz(3*pi/4) q0[328];
-sx q0[328];
-rz(pi/2) q0[328];
-cx q0[328],q0[148];
-rz(pi/2) q0[329];
-sx q0[329];
-rz(-0.123933646410207) q0[329];
-sx q0[329];
-rz(5*pi/2) q0[329];
-cx q0[329],q0[149];
-rz(pi/2) q0[329];
-sx q0[329];
-rz(pi/2) q0[329];
-cx q0[149],q0[329];
-rz(-pi/4) q0[329];
-cx q0[0],q0[329];
-rz(pi/4) q0[329];
-cx q0[149],q0[329];
-rz(pi/4) q0[149];
-rz(-pi/4) q0[329];
-cx q0[0],q0[329];
-cx q0[0],q0[149];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[149];
-cx q0[0],q0[149];
-rz(3*pi/4) q0[329];
-sx q0[329];
-rz(pi/2) q0[329];
-cx q0[329],q0[149];
-rz(pi/2) q0[330];
-sx q0[330];
-rz(-1.66772564641021) q0[330];
-sx q0[330];
-rz(5*pi/2) q0[330];
-cx q0[330],q0[150];
-rz(pi/2) q0[330];
-sx q0[330];
-rz(pi/2) q0[330];
-cx q0[150],q0[330];
-rz(-pi/4) q0[330];
-cx q0[0],q0[330];
-rz(pi/4) q0[330];
-cx q0[150],q0[330];
-rz(pi/4) q0[150];
-rz(-pi/4) q0[330];
-cx q0[0],q0[330];
-cx q0[0],q0[150];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[150];
-cx q0[0],q0[150];
-rz(3*pi/4) q0[330];
-sx q0[330];
-rz(pi/2) q0[330];
-cx q0[330],q0[150];
-rz(pi/2) q0[331];
-sx q0[331];
-rz(-1.73708854641021) q0[331];
-sx q0[331];
-rz(5*pi/2) q0[331];
-cx q0[331],q0[151];
-rz(pi/2) q0[331];
-sx q0[331];
-rz(pi/2) q0[331];
-cx q0[151],q0[331];
-rz(-pi/4) q0[331];
-cx q0[0],q0[331];
-rz(pi/4) q0[331];
-cx q0[151],q0[331];
-rz(pi/4) q0[151];
-rz(-pi/4) q0[331];
-cx q0[0],q0[331];
-cx q0[0],q0[151];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[151];
-cx q0[0],q0[151];
-rz(3*pi/4) q0[331];
-sx q0[331];
-rz(pi/2) q0[331];
-cx q0[331],q0[151];
-rz(pi/2) q0[332];
-sx q0[332];
-rz(7.70418865358979) q0[332];
-sx q0[332];
-rz(5*pi/2) q0[332];
-cx q0[332],q0[152];
-rz(pi/2) q0[332];
-sx q0[332];
-rz(pi/2) q0[332];
-cx q0[152],q0[332];
-rz(-pi/4) q0[332];
-cx q0[0],q0[332];
-rz(pi/4) q0[332];
-cx q0[152],q0[332];
-rz(pi/4) q0[152];
-rz(-pi/4) q0[332];
-cx q0[0],q0[332];
-cx q0[0],q0[152];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[152];
-cx q0[0],q0[152];
-rz(3*pi/4) q0[332];
-sx q0[332];
-rz(pi/2) q0[332];
-cx q0[332],q0[152];
-rz(pi/2) q0[333];
-sx q0[333];
-rz(0.967975853589793) q0[333];
-sx q0[333];
-rz(5*pi/2) q0[333];
-cx q0[333],q0[153];
-rz(pi/2) q0[333];
-sx q0[333];
-rz(pi/2) q0[333];
-cx q0[153],q0[333];
-rz(-pi/4) q0[333];
-cx q0[0],q0[333];
-rz(pi/4) q0[333];
-cx q0[153],q0[333];
-rz(pi/4) q0[153];
-rz(-pi/4) q0[333];
-cx q0[0],q0[333];
-cx q0[0],q0[153];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[153];
-cx q0[0],q0[153];
-rz(3*pi/4) q0[333];
-sx q0[333];
-rz(pi/2) q0[333];
-cx q0[333],q0[153];
-rz(pi/2) q0[334];
-sx q0[334];
-rz(2.39238224358979) q0[334];
-sx q0[334];
-rz(5*pi/2) q0[334];
-cx q0[334],q0[154];
-rz(pi/2) q0[334];
-sx q0[334];
-rz(pi/2) q0[334];
-cx q0[154],q0[334];
-rz(-pi/4) q0[334];
-cx q0[0],q0[334];
-rz(pi/4) q0[334];
-cx q0[154],q0[334];
-rz(pi/4) q0[154];
-rz(-pi/4) q0[334];
-cx q0[0],q0[334];
-cx q0[0],q0[154];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[154];
-cx q0[0],q0[154];
-rz(3*pi/4) q0[334];
-sx q0[334];
-rz(pi/2) q0[334];
-cx q0[334],q0[154];
-rz(pi/2) q0[335];
-sx q0[335];
-rz(4.41419055358979) q0[335];
-sx q0[335];
-rz(5*pi/2) q0[335];
-cx q0[335],q0[155];
-rz(pi/2) q0[335];
-sx q0[335];
-rz(pi/2) q0[335];
-cx q0[155],q0[335];
-rz(-pi/4) q0[335];
-cx q0[0],q0[335];
-rz(pi/4) q0[335];
-cx q0[155],q0[335];
-rz(pi/4) q0[155];
-rz(-pi/4) q0[335];
-cx q0[0],q0[335];
-cx q0[0],q0[155];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[155];
-cx q0[0],q0[155];
-rz(3*pi/4) q0[335];
-sx q0[335];
-rz(pi/2) q0[335];
-cx q0[335],q0[155];
-rz(pi/2) q0[336];
-sx q0[336];
-rz(5.63215645358979) q0[336];
-sx q0[336];
-rz(5*pi/2) q0[336];
-cx q0[336],q0[156];
-rz(pi/2) q0[336];
-sx q0[336];
-rz(pi/2) q0[336];
-cx q0[156],q0[336];
-rz(-pi/4) q0[336];
-cx q0[0],q0[336];
-rz(pi/4) q0[336];
-cx q0[156],q0[336];
-rz(pi/4) q0[156];
-rz(-pi/4) q0[336];
-cx q0[0],q0[336];
-cx q0[0],q0[156];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[156];
-cx q0[0],q0[156];
-rz(3*pi/4) q0[336];
-sx q0[336];
-rz(pi/2) q0[336];
-cx q0[336],q0[156];
-rz(pi/2) q0[337];
-sx q0[337];
-rz(1.51035755358979) q0[337];
-sx q0[337];
-rz(5*pi/2) q0[337];
-cx q0[337],q0[157];
-rz(pi/2) q0[337];
-sx q0[337];
-rz(pi/2) q0[337];
-cx q0[157],q0[337];
-rz(-pi/4) q0[337];
-cx q0[0],q0[337];
-rz(pi/4) q0[337];
-cx q0[157],q0[337];
-rz(pi/4) q0[157];
-rz(-pi/4) q0[337];
-cx q0[0],q0[337];
-cx q0[0],q0[157];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[157];
-cx q0[0],q0[157];
-rz(3*pi/4) q0[337];
-sx q0[337];
-rz(pi/2) q0[337];
-cx q0[337],q0[157];
-rz(pi/2) q0[338];
-sx q0[338];
-rz(5.44943595358979) q0[338];
-sx q0[338];
-rz(5*pi/2) q0[338];
-cx q0[338],q0[158];
-rz(pi/2) q0[338];
-sx q0[338];
-rz(pi/2) q0[338];
-cx q0[158],q0[338];
-rz(-pi/4) q0[338];
-cx q0[0],q0[338];
-rz(pi/4) q0[338];
-cx q0[158],q0[338];
-rz(pi/4) q0[158];
-rz(-pi/4) q0[338];
-cx q0[0],q0[338];
-cx q0[0],q0[158];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[158];
-cx q0[0],q0[158];
-rz(3*pi/4) q0[338];
-sx q0[338];
-rz(pi/2) q0[338];
-cx q0[338],q0[158];
-rz(pi/2) q0[339];
-sx q0[339];
-rz(8.67658845358979) q0[339];
-sx q0[339];
-rz(5*pi/2) q0[339];
-cx q0[339],q0[159];
-rz(pi/2) q0[339];
-sx q0[339];
-rz(pi/2) q0[339];
-cx q0[159],q0[339];
-rz(-pi/4) q0[339];
-cx q0[0],q0[339];
-rz(pi/4) q0[339];
-cx q0[159],q0[339];
-rz(pi/4) q0[159];
-rz(-pi/4) q0[339];
-cx q0[0],q0[339];
-cx q0[0],q0[159];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[159];
-cx q0[0],q0[159];
-rz(3*pi/4) q0[339];
-sx q0[339];
-rz(pi/2) q0[339];
-cx q0[339],q0[159];
-rz(pi/2) q0[340];
-sx q0[340];
-rz(5.56572135358979) q0[340];
-sx q0[340];
-rz(5*pi/2) q0[340];
-cx q0[340],q0[160];
-rz(pi/2) q0[340];
-sx q0[340];
-rz(pi/2) q0[340];
-cx q0[160],q0[340];
-rz(-pi/4) q0[340];
-cx q0[0],q0[340];
-rz(pi/4) q0[340];
-cx q0[160],q0[340];
-rz(pi/4) q0[160];
-rz(-pi/4) q0[340];
-cx q0[0],q0[340];
-cx q0[0],q0[160];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[160];
-cx q0[0],q0[160];
-rz(3*pi/4) q0[340];
-sx q0[340];
-rz(pi/2) q0[340];
-cx q0[340],q0[160];
-rz(pi/2) q0[341];
-sx q0[341];
-rz(4.49877115358979) q0[341];
-sx q0[341];
-rz(5*pi/2) q0[341];
-cx q0[341],q0[161];
-rz(pi/2) q0[341];
-sx q0[341];
-rz(pi/2) q0[341];
-cx q0[161],q0[341];
-rz(-pi/4) q0[341];
-cx q0[0],q0[341];
-rz(pi/4) q0[341];
-cx q0[161],q0[341];
-rz(pi/4) q0[161];
-rz(-pi/4) q0[341];
-cx q0[0],q0[341];
-cx q0[0],q0[161];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[161];
-cx q0[0],q0[161];
-rz(3*pi/4) q0[341];
-sx q0[341];
-rz(pi/2) q0[341];
-cx q0[341],q0[161];
-rz(pi/2) q0[342];
-sx q0[342];
-rz(1.72690375358979) q0[342];
-sx q0[342];
-rz(5*pi/2) q0[342];
-cx q0[342],q0[162];
-rz(pi/2) q0[342];
-sx q0[342];
-rz(pi/2) q0[342];
-cx q0[162],q0[342];
-rz(-pi/4) q0[342];
-cx q0[0],q0[342];
-rz(pi/4) q0[342];
-cx q0[162],q0[342];
-rz(pi/4) q0[162];
-rz(-pi/4) q0[342];
-cx q0[0],q0[342];
-cx q0[0],q0[162];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[162];
-cx q0[0],q0[162];
-rz(3*pi/4) q0[342];
-sx q0[342];
-rz(pi/2) q0[342];
-cx q0[342],q0[162];
-rz(pi/2) q0[343];
-sx q0[343];
-rz(7.88802585358979) q0[343];
-sx q0[343];
-rz(5*pi/2) q0[343];
-cx q0[343],q0[163];
-rz(pi/2) q0[343];
-sx q0[343];
-rz(pi/2) q0[343];
-cx q0[163],q0[343];
-rz(-pi/4) q0[343];
-cx q0[0],q0[343];
-rz(pi/4) q0[343];
-cx q0[163],q0[343];
-rz(pi/4) q0[163];
-rz(-pi/4) q0[343];
-cx q0[0],q0[343];
-cx q0[0],q0[163];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[163];
-cx q0[0],q0[163];
-rz(3*pi/4) q0[343];
-sx q0[343];
-rz(pi/2) q0[343];
-cx q0[343],q0[163];
-rz(pi/2) q0[344];
-sx q0[344];
-rz(3.91878922358979) q0[344];
-sx q0[344];
-rz(5*pi/2) q0[344];
-cx q0[344],q0[164];
-rz(pi/2) q0[344];
-sx q0[344];
-rz(pi/2) q0[344];
-cx q0[164],q0[344];
-rz(-pi/4) q0[344];
-cx q0[0],q0[344];
-rz(pi/4) q0[344];
-cx q0[164],q0[344];
-rz(pi/4) q0[164];
-rz(-pi/4) q0[344];
-cx q0[0],q0[344];
-cx q0[0],q0[164];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[164];
-cx q0[0],q0[164];
-rz(3*pi/4) q0[344];
-sx q0[344];
-rz(pi/2) q0[344];
-cx q0[344],q0[164];
-rz(pi/2) q0[345];
-sx q0[345];
-rz(2.47374615358979) q0[345];
-sx q0[345];
-rz(5*pi/2) q0[345];
-cx q0[345],q0[165];
-rz(pi/2) q0[345];
-sx q0[345];
-rz(pi/2) q0[345];
-cx q0[165],q0[345];
-rz(-pi/4) q0[345];
-cx q0[0],q0[345];
-rz(pi/4) q0[345];
-cx q0[165],q0[345];
-rz(pi/4) q0[165];
-rz(-pi/4) q0[345];
-cx q0[0],q0[345];
-cx q0[0],q0[165];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[165];
-cx q0[0],q0[165];
-rz(3*pi/4) q0[345];
-sx q0[345];
-rz(pi/2) q0[345];
-cx q0[345],q0[165];
-rz(pi/2) q0[346];
-sx q0[346];
-rz(7.51837855358979) q0[346];
-sx q0[346];
-rz(5*pi/2) q0[346];
-cx q0[346],q0[166];
-rz(pi/2) q0[346];
-sx q0[346];
-rz(pi/2) q0[346];
-cx q0[166],q0[346];
-rz(-pi/4) q0[346];
-cx q0[0],q0[346];
-rz(pi/4) q0[346];
-cx q0[166],q0[346];
-rz(pi/4) q0[166];
-rz(-pi/4) q0[346];
-cx q0[0],q0[346];
-cx q0[0],q0[166];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[166];
-cx q0[0],q0[166];
-rz(3*pi/4) q0[346];
-sx q0[346];
-rz(pi/2) q0[346];
-cx q0[346],q0[166];
-rz(pi/2) q0[347];
-sx q0[347];
-rz(-0.002435846410207) q0[347];
-sx q0[347];
-rz(5*pi/2) q0[347];
-cx q0[347],q0[167];
-rz(pi/2) q0[347];
-sx q0[347];
-rz(pi/2) q0[347];
-cx q0[167],q0[347];
-rz(-pi/4) q0[347];
-cx q0[0],q0[347];
-rz(pi/4) q0[347];
-cx q0[167],q0[347];
-rz(pi/4) q0[167];
-rz(-pi/4) q0[347];
-cx q0[0],q0[347];
-cx q0[0],q0[167];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[167];
-cx q0[0],q0[167];
-rz(3*pi/4) q0[347];
-sx q0[347];
-rz(pi/2) q0[347];
-cx q0[347],q0[167];
-rz(pi/2) q0[348];
-sx q0[348];
-rz(8.31495045358979) q0[348];
-sx q0[348];
-rz(5*pi/2) q0[348];
-cx q0[348],q0[168];
-rz(pi/2) q0[348];
-sx q0[348];
-rz(pi/2) q0[348];
-cx q0[168],q0[348];
-rz(-pi/4) q0[348];
-cx q0[0],q0[348];
-rz(pi/4) q0[348];
-cx q0[168],q0[348];
-rz(pi/4) q0[168];
-rz(-pi/4) q0[348];
-cx q0[0],q0[348];
-cx q0[0],q0[168];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[168];
-cx q0[0],q0[168];
-rz(3*pi/4) q0[348];
-sx q0[348];
-rz(pi/2) q0[348];
-cx q0[348],q0[168];
-rz(pi/2) q0[349];
-sx q0[349];
-rz(-1.66925574641021) q0[349];
-sx q0[349];
-rz(5*pi/2) q0[349];
-cx q0[349],q0[169];
-rz(pi/2) q0[349];
-sx q0[349];
-rz(pi/2) q0[349];
-cx q0[169],q0[349];
-rz(-pi/4) q0[349];
-cx q0[0],q0[349];
-rz(pi/4) q0[349];
-cx q0[169],q0[349];
-rz(pi/4) q0[169];
-rz(-pi/4) q0[349];
-cx q0[0],q0[349];
-cx q0[0],q0[169];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[169];
-cx q0[0],q0[169];
-rz(3*pi/4) q0[349];
-sx q0[349];
-rz(pi/2) q0[349];
-cx q0[349],q0[169];
-rz(pi/2) q0[350];
-sx q0[350];
-rz(2.15306402358979) q0[350];
-sx q0[350];
-rz(5*pi/2) q0[350];
-cx q0[350],q0[170];
-rz(pi/2) q0[350];
-sx q0[350];
-rz(pi/2) q0[350];
-cx q0[170],q0[350];
-rz(-pi/4) q0[350];
-cx q0[0],q0[350];
-rz(pi/4) q0[350];
-cx q0[170],q0[350];
-rz(pi/4) q0[170];
-rz(-pi/4) q0[350];
-cx q0[0],q0[350];
-cx q0[0],q0[170];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[170];
-cx q0[0],q0[170];
-rz(3*pi/4) q0[350];
-sx q0[350];
-rz(pi/2) q0[350];
-cx q0[350],q0[170];
-rz(pi/2) q0[351];
-sx q0[351];
-rz(-0.344567746410207) q0[351];
-sx q0[351];
-rz(5*pi/2) q0[351];
-cx q0[351],q0[171];
-rz(pi/2) q0[351];
-sx q0[351];
-rz(pi/2) q0[351];
-cx q0[171],q0[351];
-rz(-pi/4) q0[351];
-cx q0[0],q0[351];
-rz(pi/4) q0[351];
-cx q0[171],q0[351];
-rz(pi/4) q0[171];
-rz(-pi/4) q0[351];
-cx q0[0],q0[351];
-cx q0[0],q0[171];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[171];
-cx q0[0],q0[171];
-rz(3*pi/4) q0[351];
-sx q0[351];
-rz(pi/2) q0[351];
-cx q0[351],q0[171];
-rz(pi/2) q0[352];
-sx q0[352];
-rz(7.41269145358979) q0[352];
-sx q0[352];
-rz(5*pi/2) q0[352];
-cx q0[352],q0[172];
-rz(pi/2) q0[352];
-sx q0[352];
-rz(pi/2) q0[352];
-cx q0[172],q0[352];
-rz(-pi/4) q0[352];
-cx q0[0],q0[352];
-rz(pi/4) q0[352];
-cx q0[172],q0[352];
-rz(pi/4) q0[172];
-rz(-pi/4) q0[352];
-cx q0[0],q0[352];
-cx q0[0],q0[172];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[172];
-cx q0[0],q0[172];
-rz(3*pi/4) q0[352];
-sx q0[352];
-rz(pi/2) q0[352];
-cx q0[352],q0[172];
-rz(pi/2) q0[353];
-sx q0[353];
-rz(7.54997505358979) q0[353];
-sx q0[353];
-rz(5*pi/2) q0[353];
-cx q0[353],q0[173];
-rz(pi/2) q0[353];
-sx q0[353];
-rz(pi/2) q0[353];
-cx q0[173],q0[353];
-rz(-pi/4) q0[353];
-cx q0[0],q0[353];
-rz(pi/4) q0[353];
-cx q0[173],q0[353];
-rz(pi/4) q0[173];
-rz(-pi/4) q0[353];
-cx q0[0],q0[353];
-cx q0[0],q0[173];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[173];
-cx q0[0],q0[173];
-rz(3*pi/4) q0[353];
-sx q0[353];
-rz(pi/2) q0[353];
-cx q0[353],q0[173];
-rz(pi/2) q0[354];
-sx q0[354];
-rz(1.19628435358979) q0[354];
-sx q0[354];
-rz(5*pi/2) q0[354];
-cx q0[354],q0[174];
-rz(pi/2) q0[354];
-sx q0[354];
-rz(pi/2) q0[354];
-cx q0[174],q0[354];
-rz(-pi/4) q0[354];
-cx q0[0],q0[354];
-rz(pi/4) q0[354];
-cx q0[174],q0[354];
-rz(pi/4) q0[174];
-rz(-pi/4) q0[354];
-cx q0[0],q0[354];
-cx q0[0],q0[174];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[174];
-cx q0[0],q0[174];
-rz(3*pi/4) q0[354];
-sx q0[354];
-rz(pi/2) q0[354];
-cx q0[354],q0[174];
-rz(pi/2) q0[355];
-sx q0[355];
-rz(-1.98526274641021) q0[355];
-sx q0[355];
-rz(5*pi/2) q0[355];
-cx q0[355],q0[175];
-rz(pi/2) q0[355];
-sx q0[355];
-rz(pi/2) q0[355];
-cx q0[175],q0[355];
-rz(-pi/4) q0[355];
-cx q0[0],q0[355];
-rz(pi/4) q0[355];
-cx q0[175],q0[355];
-rz(pi/4) q0[175];
-rz(-pi/4) q0[355];
-cx q0[0],q0[355];
-cx q0[0],q0[175];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[175];
-cx q0[0],q0[175];
-rz(3*pi/4) q0[355];
-sx q0[355];
-rz(pi/2) q0[355];
-cx q0[355],q0[175];
-rz(pi/2) q0[356];
-sx q0[356];
-rz(5.01332765358979) q0[356];
-sx q0[356];
-rz(5*pi/2) q0[356];
-cx q0[356],q0[176];
-rz(pi/2) q0[356];
-sx q0[356];
-rz(pi/2) q0[356];
-cx q0[176],q0[356];
-rz(-pi/4) q0[356];
-cx q0[0],q0[356];
-rz(pi/4) q0[356];
-cx q0[176],q0[356];
-rz(pi/4) q0[176];
-rz(-pi/4) q0[356];
-cx q0[0],q0[356];
-cx q0[0],q0[176];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[176];
-cx q0[0],q0[176];
-rz(3*pi/4) q0[356];
-sx q0[356];
-rz(pi/2) q0[356];
-cx q0[356],q0[176];
-rz(pi/2) q0[357];
-sx q0[357];
-rz(4.67511475358979) q0[357];
-sx q0[357];
-rz(5*pi/2) q0[357];
-cx q0[357],q0[177];
-rz(pi/2) q0[357];
-sx q0[357];
-rz(pi/2) q0[357];
-cx q0[177],q0[357];
-rz(-pi/4) q0[357];
-cx q0[0],q0[357];
-rz(pi/4) q0[357];
-cx q0[177],q0[357];
-rz(pi/4) q0[177];
-rz(-pi/4) q0[357];
-cx q0[0],q0[357];
-cx q0[0],q0[177];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[177];
-cx q0[0],q0[177];
-rz(3*pi/4) q0[357];
-sx q0[357];
-rz(pi/2) q0[357];
-cx q0[357],q0[177];
-rz(pi/2) q0[358];
-sx q0[358];
-rz(1.06462295358979) q0[358];
-sx q0[358];
-rz(5*pi/2) q0[358];
-cx q0[358],q0[178];
-rz(pi/2) q0[358];
-sx q0[358];
-rz(pi/2) q0[358];
-cx q0[178],q0[358];
-rz(-pi/4) q0[358];
-cx q0[0],q0[358];
-rz(pi/4) q0[358];
-cx q0[178],q0[358];
-rz(pi/4) q0[178];
-rz(-pi/4) q0[358];
-cx q0[0],q0[358];
-cx q0[0],q0[178];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[178];
-cx q0[0],q0[178];
-rz(3*pi/4) q0[358];
-sx q0[358];
-rz(pi/2) q0[358];
-cx q0[358],q0[178];
-rz(pi/2) q0[359];
-sx q0[359];
-rz(2.52297461358979) q0[359];
-sx q0[359];
-rz(5*pi/2) q0[359];
-cx q0[359],q0[179];
-rz(pi/2) q0[359];
-sx q0[359];
-rz(pi/2) q0[359];
-cx q0[179],q0[359];
-rz(-pi/4) q0[359];
-cx q0[0],q0[359];
-rz(pi/4) q0[359];
-cx q0[179],q0[359];
-rz(pi/4) q0[179];
-rz(-pi/4) q0[359];
-cx q0[0],q0[359];
-cx q0[0],q0[179];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[179];
-cx q0[0],q0[179];
-rz(3*pi/4) q0[359];
-sx q0[359];
-rz(pi/2) q0[359];
-cx q0[359],q0[179];
-rz(pi/2) q0[360];
-sx q0[360];
-rz(-1.21403164641021) q0[360];
-sx q0[360];
-rz(5*pi/2) q0[360];
-cx q0[360],q0[180];
-rz(pi/2) q0[360];
-sx q0[360];
-rz(pi/2) q0[360];
-cx q0[180],q0[360];
-rz(-pi/4) q0[360];
-cx q0[0],q0[360];
-rz(pi/4) q0[360];
-cx q0[180],q0[360];
-rz(pi/4) q0[180];
-rz(-pi/4) q0[360];
-cx q0[0],q0[360];
-cx q0[0],q0[180];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[180];
-cx q0[0],q0[180];
-rz(pi/2) q0[0];
-sx q0[0];
-rz(pi/2) q0[0];
-rz(3*pi/4) q0[360];
-sx q0[360];
-rz(pi/2) q0[360];
-cx q0[360],q0[180];
-measure q0[0] -> c0[0];
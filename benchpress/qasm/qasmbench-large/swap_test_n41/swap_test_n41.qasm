@@ -1,67 +0,0 @@
-OPENQASM 2.0;
-include "qelib1.inc";
-qreg q0[41];
-creg c0[1];
-rx(-3.6924814) q0[1];
-rx(-3.2923147) q0[21];
-rx(5.4291652) q0[2];
-rx(5.6875289) q0[22];
-rx(1.3594796) q0[3];
-rx(1.2065807) q0[23];
-rx(-5.9123043) q0[4];
-rx(-6.0041031) q0[24];
-rx(-0.13186279) q0[5];
-rx(0.50271205) q0[25];
-rx(-4.3869008) q0[6];
-rx(-4.1172873) q0[26];
-rx(4.9830092) q0[7];
-rx(4.8261369) q0[27];
-rx(-1.4181518) q0[8];
-rx(-1.5885531) q0[28];
-rx(3.9058792) q0[9];
-rx(3.2780951) q0[29];
-rx(2.1483107) q0[10];
-rx(2.2125048) q0[30];
-rx(-1.552265) q0[11];
-rx(-2.1338861) q0[31];
-rx(3.5437778) q0[12];
-rx(2.9294436) q0[32];
-rx(3.5074824) q0[13];
-rx(4.0850493) q0[33];
-rx(-3.1458178) q0[14];
-rx(-2.9631606) q0[34];
-rx(2.9808713) q0[15];
-rx(2.9322572) q0[35];
-rx(-4.5722067) q0[16];
-rx(-4.3125018) q0[36];
-rx(-2.9717581) q0[17];
-rx(-2.9593885) q0[37];
-rx(4.3812134) q0[18];
-rx(4.335384) q0[38];
-rx(-0.54413824) q0[19];
-rx(-0.18151701) q0[39];
-rx(2.8824416) q0[20];
-rx(3.026406) q0[40];
-h q0[0];
-cswap q0[0],q0[1],q0[21];
-cswap q0[0],q0[2],q0[22];
-cswap q0[0],q0[3],q0[23];
-cswap q0[0],q0[4],q0[24];
-cswap q0[0],q0[5],q0[25];
-cswap q0[0],q0[6],q0[26];
-cswap q0[0],q0[7],q0[27];
-cswap q0[0],q0[8],q0[28];
-cswap q0[0],q0[9],q0[29];
-cswap q0[0],q0[10],q0[30];
-cswap q0[0],q0[11],q0[31];
-cswap q0[0],q0[12],q0[32];
-cswap q0[0],q0[13],q0[33];
-cswap q0[0],q0[14],q0[34];
-cswap q0[0],q0[15],q0[35];
-cswap q0[0],q0[16],q0[36];
-cswap q0[0],q0[17],q0[37];
-cswap q0[0],q0[18],q0[38];
-cswap q0[0],q0[19],q0[39];
-cswap q0[0],q0[20],q0[40];
-h q0[0];
-measure q0[0] -> c0[0];
@@ -1,1903 +0,0 @@
-OPENQASM 2.0;
-include "qelib1.inc";
-qreg q[380];
-creg c[380];
-creg meas[380];
-x q[379];
-ry(-1.5194749) q[378];
-cz q[379],q[378];
-ry(1.5194749) q[378];
-ry(-1.5194072) q[377];
-cz q[378],q[377];
-ry(1.5194072) q[377];
-ry(-1.5193392) q[376];
-cz q[377],q[376];
-ry(1.5193392) q[376];
-ry(-1.5192709) q[375];
-cz q[376],q[375];
-ry(1.5192709) q[375];
-ry(-1.5192024) q[374];
-cz q[375],q[374];
-ry(1.5192024) q[374];
-ry(-1.5191336) q[373];
-cz q[374],q[373];
-ry(1.5191336) q[373];
-ry(-1.5190645) q[372];
-cz q[373],q[372];
-ry(1.5190645) q[372];
-ry(-1.5189951) q[371];
-cz q[372],q[371];
-ry(1.5189951) q[371];
-ry(-1.5189255) q[370];
-cz q[371],q[370];
-ry(1.5189255) q[370];
-ry(-1.5188556) q[369];
-cz q[370],q[369];
-ry(1.5188556) q[369];
-ry(-1.5187854) q[368];
-cz q[369],q[368];
-ry(1.5187854) q[368];
-ry(-1.5187149) q[367];
-cz q[368],q[367];
-ry(1.5187149) q[367];
-ry(-1.5186441) q[366];
-cz q[367],q[366];
-ry(1.5186441) q[366];
-ry(-1.518573) q[365];
-cz q[366],q[365];
-ry(1.518573) q[365];
-ry(-1.5185017) q[364];
-cz q[365],q[364];
-ry(1.5185017) q[364];
-ry(-1.51843) q[363];
-cz q[364],q[363];
-ry(1.51843) q[363];
-ry(-1.5183581) q[362];
-cz q[363],q[362];
-ry(1.5183581) q[362];
-ry(-1.5182858) q[361];
-cz q[362],q[361];
-ry(1.5182858) q[361];
-ry(-1.5182133) q[360];
-cz q[361],q[360];
-ry(1.5182133) q[360];
-ry(-1.5181404) q[359];
-cz q[360],q[359];
-ry(1.5181404) q[359];
-ry(-1.5180673) q[358];
-cz q[359],q[358];
-ry(1.5180673) q[358];
-ry(-1.5179938) q[357];
-cz q[358],q[357];
-ry(1.5179938) q[357];
-ry(-1.51792) q[356];
-cz q[357],q[356];
-ry(1.51792) q[356];
-ry(-1.517846) q[355];
-cz q[356],q[355];
-ry(1.517846) q[355];
-ry(-1.5177716) q[354];
-cz q[355],q[354];
-ry(1.5177716) q[354];
-ry(-1.5176969) q[353];
-cz q[354],q[353];
-ry(1.5176969) q[353];
-ry(-1.5176219) q[352];
-cz q[353],q[352];
-ry(1.5176219) q[352];
-ry(-1.5175465) q[351];
-cz q[352],q[351];
-ry(1.5175465) q[351];
-ry(-1.5174709) q[350];
-cz q[351],q[350];
-ry(1.5174709) q[350];
-ry(-1.5173949) q[349];
-cz q[350],q[349];
-ry(1.5173949) q[349];
-ry(-1.5173186) q[348];
-cz q[349],q[348];
-ry(1.5173186) q[348];
-ry(-1.517242) q[347];
-cz q[348],q[347];
-ry(1.517242) q[347];
-ry(-1.517165) q[346];
-cz q[347],q[346];
-ry(1.517165) q[346];
-ry(-1.5170877) q[345];
-cz q[346],q[345];
-ry(1.5170877) q[345];
-ry(-1.5170101) q[344];
-cz q[345],q[344];
-ry(1.5170101) q[344];
-ry(-1.5169321) q[343];
-cz q[344],q[343];
-ry(1.5169321) q[343];
-ry(-1.5168538) q[342];
-cz q[343],q[342];
-ry(1.5168538) q[342];
-ry(-1.5167751) q[341];
-cz q[342],q[341];
-ry(1.5167751) q[341];
-ry(-1.5166961) q[340];
-cz q[341],q[340];
-ry(1.5166961) q[340];
-ry(-1.5166168) q[339];
-cz q[340],q[339];
-ry(1.5166168) q[339];
-ry(-1.5165371) q[338];
-cz q[339],q[338];
-ry(1.5165371) q[338];
-ry(-1.516457) q[337];
-cz q[338],q[337];
-ry(1.516457) q[337];
-ry(-1.5163766) q[336];
-cz q[337],q[336];
-ry(1.5163766) q[336];
-ry(-1.5162959) q[335];
-cz q[336],q[335];
-ry(1.5162959) q[335];
-ry(-1.5162148) q[334];
-cz q[335],q[334];
-ry(1.5162148) q[334];
-ry(-1.5161333) q[333];
-cz q[334],q[333];
-ry(1.5161333) q[333];
-ry(-1.5160514) q[332];
-cz q[333],q[332];
-ry(1.5160514) q[332];
-ry(-1.5159692) q[331];
-cz q[332],q[331];
-ry(1.5159692) q[331];
-ry(-1.5158866) q[330];
-cz q[331],q[330];
-ry(1.5158866) q[330];
-ry(-1.5158036) q[329];
-cz q[330],q[329];
-ry(1.5158036) q[329];
-ry(-1.5157203) q[328];
-cz q[329],q[328];
-ry(1.5157203) q[328];
-ry(-1.5156366) q[327];
-cz q[328],q[327];
-ry(1.5156366) q[327];
-ry(-1.5155525) q[326];
-cz q[327],q[326];
-ry(1.5155525) q[326];
-ry(-1.515468) q[325];
-cz q[326],q[325];
-ry(1.515468) q[325];
-ry(-1.5153831) q[324];
-cz q[325],q[324];
-ry(1.5153831) q[324];
-ry(-1.5152978) q[323];
-cz q[324],q[323];
-ry(1.5152978) q[323];
-ry(-1.5152122) q[322];
-cz q[323],q[322];
-ry(1.5152122) q[322];
-ry(-1.5151261) q[321];
-cz q[322],q[321];
-ry(1.5151261) q[321];
-ry(-1.5150396) q[320];
-cz q[321],q[320];
-ry(1.5150396) q[320];
-ry(-1.5149527) q[319];
-cz q[320],q[319];
-ry(1.5149527) q[319];
-ry(-1.5148655) q[318];
-cz q[319],q[318];
-ry(1.5148655) q[318];
-ry(-1.5147778) q[317];
-cz q[318],q[317];
-ry(1.5147778) q[317];
-ry(-1.5146897) q[316];
-cz q[317],q[316];
-ry(1.5146897) q[316];
-ry(-1.5146012) q[315];
-cz q[316],q[315];
-ry(1.5146012) q[315];
-ry(-1.5145122) q[314];
-cz q[315],q[314];
-ry(1.5145122) q[314];
-ry(-1.5144229) q[313];
-cz q[314],q[313];
-ry(1.5144229) q[313];
-ry(-1.5143331) q[312];
-cz q[313],q[312];
-ry(1.5143331) q[312];
-ry(-1.5142428) q[311];
-cz q[312],q[311];
-ry(1.5142428) q[311];
-ry(-1.5141522) q[310];
-cz q[311],q[310];
-ry(1.5141522) q[310];
-ry(-1.5140611) q[309];
-cz q[310],q[309];
-ry(1.5140611) q[309];
-ry(-1.5139696) q[308];
-cz q[309],q[308];
-ry(1.5139696) q[308];
-ry(-1.5138776) q[307];
-cz q[308],q[307];
-ry(1.5138776) q[307];
-ry(-1.5137852) q[306];
-cz q[307],q[306];
-ry(1.5137852) q[306];
-ry(-1.5136923) q[305];
-cz q[306],q[305];
-ry(1.5136923) q[305];
-ry(-1.5135989) q[304];
-cz q[305],q[304];
-ry(1.5135989) q[304];
-ry(-1.5135052) q[303];
-cz q[304],q[303];
-ry(1.5135052) q[303];
-ry(-1.5134109) q[302];
-cz q[303],q[302];
-ry(1.5134109) q[302];
-ry(-1.5133162) q[301];
-cz q[302],q[301];
-ry(1.5133162) q[301];
-ry(-1.513221) q[300];
-cz q[301],q[300];
-ry(1.513221) q[300];
-ry(-1.5131253) q[299];
-cz q[300],q[299];
-ry(1.5131253) q[299];
-ry(-1.5130292) q[298];
-cz q[299],q[298];
-ry(1.5130292) q[298];
-ry(-1.5129325) q[297];
-cz q[298],q[297];
-ry(1.5129325) q[297];
-ry(-1.5128354) q[296];
-cz q[297],q[296];
-ry(1.5128354) q[296];
-ry(-1.5127378) q[295];
-cz q[296],q[295];
-ry(1.5127378) q[295];
-ry(-1.5126397) q[294];
-cz q[295],q[294];
-ry(1.5126397) q[294];
-ry(-1.5125411) q[293];
-cz q[294],q[293];
-ry(1.5125411) q[293];
-ry(-1.512442) q[292];
-cz q[293],q[292];
-ry(1.512442) q[292];
-ry(-1.5123424) q[291];
-cz q[292],q[291];
-ry(1.5123424) q[291];
-ry(-1.5122423) q[290];
-cz q[291],q[290];
-ry(1.5122423) q[290];
-ry(-1.5121417) q[289];
-cz q[290],q[289];
-ry(1.5121417) q[289];
-ry(-1.5120405) q[288];
-cz q[289],q[288];
-ry(1.5120405) q[288];
-ry(-1.5119388) q[287];
-cz q[288],q[287];
-ry(1.5119388) q[287];
-ry(-1.5118366) q[286];
-cz q[287],q[286];
-ry(1.5118366) q[286];
-ry(-1.5117339) q[285];
-cz q[286],q[285];
-ry(1.5117339) q[285];
-ry(-1.5116306) q[284];
-cz q[285],q[284];
-ry(1.5116306) q[284];
-ry(-1.5115267) q[283];
-cz q[284],q[283];
-ry(1.5115267) q[283];
-ry(-1.5114224) q[282];
-cz q[283],q[282];
-ry(1.5114224) q[282];
-ry(-1.5113174) q[281];
-cz q[282],q[281];
-ry(1.5113174) q[281];
-ry(-1.5112119) q[280];
-cz q[281],q[280];
-ry(1.5112119) q[280];
-ry(-1.5111059) q[279];
-cz q[280],q[279];
-ry(1.5111059) q[279];
-ry(-1.5109993) q[278];
-cz q[279],q[278];
-ry(1.5109993) q[278];
-ry(-1.5108921) q[277];
-cz q[278],q[277];
-ry(1.5108921) q[277];
-ry(-1.5107843) q[276];
-cz q[277],q[276];
-ry(1.5107843) q[276];
-ry(-1.5106759) q[275];
-cz q[276],q[275];
-ry(1.5106759) q[275];
-ry(-1.510567) q[274];
-cz q[275],q[274];
-ry(1.510567) q[274];
-ry(-1.5104575) q[273];
-cz q[274],q[273];
-ry(1.5104575) q[273];
-ry(-1.5103473) q[272];
-cz q[273],q[272];
-ry(1.5103473) q[272];
-ry(-1.5102366) q[271];
-cz q[272],q[271];
-ry(1.5102366) q[271];
-ry(-1.5101252) q[270];
-cz q[271],q[270];
-ry(1.5101252) q[270];
-ry(-1.5100132) q[269];
-cz q[270],q[269];
-ry(1.5100132) q[269];
-ry(-1.5099006) q[268];
-cz q[269],q[268];
-ry(1.5099006) q[268];
-ry(-1.5097874) q[267];
-cz q[268],q[267];
-ry(1.5097874) q[267];
-ry(-1.5096736) q[266];
-cz q[267],q[266];
-ry(1.5096736) q[266];
-ry(-1.5095591) q[265];
-cz q[266],q[265];
-ry(1.5095591) q[265];
-ry(-1.5094439) q[264];
-cz q[265],q[264];
-ry(1.5094439) q[264];
-ry(-1.5093281) q[263];
-cz q[264],q[263];
-ry(1.5093281) q[263];
-ry(-1.5092117) q[262];
-cz q[263],q[262];
-ry(1.5092117) q[262];
-ry(-1.5090945) q[261];
-cz q[262],q[261];
-ry(1.5090945) q[261];
-ry(-1.5089768) q[260];
-cz q[261],q[260];
-ry(1.5089768) q[260];
-ry(-1.5088583) q[259];
-cz q[260],q[259];
-ry(1.5088583) q[259];
-ry(-1.5087391) q[258];
-cz q[259],q[258];
-ry(1.5087391) q[258];
-ry(-1.5086193) q[257];
-cz q[258],q[257];
-ry(1.5086193) q[257];
-ry(-1.5084988) q[256];
-cz q[257],q[256];
-ry(1.5084988) q[256];
-ry(-1.5083775) q[255];
-cz q[256],q[255];
-ry(1.5083775) q[255];
-ry(-1.5082556) q[254];
-cz q[255],q[254];
-ry(1.5082556) q[254];
-ry(-1.5081329) q[253];
-cz q[254],q[253];
-ry(1.5081329) q[253];
-ry(-1.5080095) q[252];
-cz q[253],q[252];
-ry(1.5080095) q[252];
-ry(-1.5078854) q[251];
-cz q[252],q[251];
-ry(1.5078854) q[251];
-ry(-1.5077605) q[250];
-cz q[251],q[250];
-ry(1.5077605) q[250];
-ry(-1.5076349) q[249];
-cz q[250],q[249];
-ry(1.5076349) q[249];
-ry(-1.5075085) q[248];
-cz q[249],q[248];
-ry(1.5075085) q[248];
-ry(-1.5073814) q[247];
-cz q[248],q[247];
-ry(1.5073814) q[247];
-ry(-1.5072535) q[246];
-cz q[247],q[246];
-ry(1.5072535) q[246];
-ry(-1.5071248) q[245];
-cz q[246],q[245];
-ry(1.5071248) q[245];
-ry(-1.5069954) q[244];
-cz q[245],q[244];
-ry(1.5069954) q[244];
-ry(-1.5068651) q[243];
-cz q[244],q[243];
-ry(1.5068651) q[243];
-ry(-1.5067341) q[242];
-cz q[243],q[242];
-ry(1.5067341) q[242];
-ry(-1.5066022) q[241];
-cz q[242],q[241];
-ry(1.5066022) q[241];
-ry(-1.5064695) q[240];
-cz q[241],q[240];
-ry(1.5064695) q[240];
-ry(-1.506336) q[239];
-cz q[240],q[239];
-ry(1.506336) q[239];
-ry(-1.5062017) q[238];
-cz q[239],q[238];
-ry(1.5062017) q[238];
-ry(-1.5060665) q[237];
-cz q[238],q[237];
-ry(1.5060665) q[237];
-ry(-1.5059305) q[236];
-cz q[237],q[236];
-ry(1.5059305) q[236];
-ry(-1.5057936) q[235];
-cz q[236],q[235];
-ry(1.5057936) q[235];
-ry(-1.5056558) q[234];
-cz q[235],q[234];
-ry(1.5056558) q[234];
-ry(-1.5055172) q[233];
-cz q[234],q[233];
-ry(1.5055172) q[233];
-ry(-1.5053776) q[232];
-cz q[233],q[232];
-ry(1.5053776) q[232];
-ry(-1.5052372) q[231];
-cz q[232],q[231];
-ry(1.5052372) q[231];
-ry(-1.5050959) q[230];
-cz q[231],q[230];
-ry(1.5050959) q[230];
-ry(-1.5049536) q[229];
-cz q[230],q[229];
-ry(1.5049536) q[229];
-ry(-1.5048104) q[228];
-cz q[229],q[228];
-ry(1.5048104) q[228];
-ry(-1.5046663) q[227];
-cz q[228],q[227];
-ry(1.5046663) q[227];
-ry(-1.5045212) q[226];
-cz q[227],q[226];
-ry(1.5045212) q[226];
-ry(-1.5043752) q[225];
-cz q[226],q[225];
-ry(1.5043752) q[225];
-ry(-1.5042282) q[224];
-cz q[225],q[224];
-ry(1.5042282) q[224];
-ry(-1.5040802) q[223];
-cz q[224],q[223];
-ry(1.5040802) q[223];
-ry(-1.5039312) q[222];
-cz q[223],q[222];
-ry(1.5039312) q[222];
-ry(-1.5037812) q[221];
-cz q[222],q[221];
-ry(1.5037812) q[221];
-ry(-1.5036302) q[220];
-cz q[221],q[220];
-ry(1.5036302) q[220];
-ry(-1.5034782) q[219];
-cz q[220],q[219];
-ry(1.5034782) q[219];
-ry(-1.5033252) q[218];
-cz q[219],q[218];
-ry(1.5033252) q[218];
-ry(-1.5031711) q[217];
-cz q[218],q[217];
-ry(1.5031711) q[217];
-ry(-1.5030159) q[216];
-cz q[217],q[216];
-ry(1.5030159) q[216];
-ry(-1.5028597) q[215];
-cz q[216],q[215];
-ry(1.5028597) q[215];
-ry(-1.5027023) q[214];
-cz q[215],q[214];
-ry(1.5027023) q[214];
-ry(-1.5025439) q[213];
-cz q[214],q[213];
-ry(1.5025439) q[213];
-ry(-1.5023844) q[212];
-cz q[213],q[212];
-ry(1.5023844) q[212];
-ry(-1.5022237) q[211];
-cz q[212],q[211];
-ry(1.5022237) q[211];
-ry(-1.5020619) q[210];
-cz q[211],q[210];
-ry(1.5020619) q[210];
-ry(-1.501899) q[209];
-cz q[210],q[209];
-ry(1.501899) q[209];
-ry(-1.5017349) q[208];
-cz q[209],q[208];
-ry(1.5017349) q[208];
-ry(-1.5015696) q[207];
-cz q[208],q[207];
-ry(1.5015696) q[207];
-ry(-1.5014031) q[206];
-cz q[207],q[206];
-ry(1.5014031) q[206];
-ry(-1.5012354) q[205];
-cz q[206],q[205];
-ry(1.5012354) q[205];
-ry(-1.5010665) q[204];
-cz q[205],q[204];
-ry(1.5010665) q[204];
-ry(-1.5008964) q[203];
-cz q[204],q[203];
-ry(1.5008964) q[203];
-ry(-1.500725) q[202];
-cz q[203],q[202];
-ry(1.500725) q[202];
-ry(-1.5005523) q[201];
-cz q[202],q[201];
-ry(1.5005523) q[201];
-ry(-1.5003784) q[200];
-cz q[201],q[200];
-ry(1.5003784) q[200];
-ry(-1.5002031) q[199];
-cz q[200],q[199];
-ry(1.5002031) q[199];
-ry(-1.5000266) q[198];
-cz q[199],q[198];
-ry(1.5000266) q[198];
-ry(-1.4998487) q[197];
-cz q[198],q[197];
-ry(1.4998487) q[197];
-ry(-1.4996695) q[196];
-cz q[197],q[196];
-ry(1.4996695) q[196];
-ry(-1.4994889) q[195];
-cz q[196],q[195];
-ry(1.4994889) q[195];
-ry(-1.4993069) q[194];
-cz q[195],q[194];
-ry(1.4993069) q[194];
-ry(-1.4991235) q[193];
-cz q[194],q[193];
-ry(1.4991235) q[193];
-ry(-1.4989387) q[192];
-cz q[193],q[192];
-ry(1.4989387) q[192];
-ry(-1.4987524) q[191];
-cz q[192],q[191];
-ry(1.4987524) q[191];
-ry(-1.4985647) q[190];
-cz q[191],q[190];
-ry(1.4985647) q[190];
-ry(-1.4983756) q[189];
-cz q[190],q[189];
-ry(1.4983756) q[189];
-ry(-1.4981849) q[188];
-cz q[189],q[188];
-ry(1.4981849) q[188];
-ry(-1.4979927) q[187];
-cz q[188],q[187];
-ry(1.4979927) q[187];
-ry(-1.497799) q[186];
-cz q[187],q[186];
-ry(1.497799) q[186];
-ry(-1.4976038) q[185];
-cz q[186],q[185];
-ry(1.4976038) q[185];
-ry(-1.4974069) q[184];
-cz q[185],q[184];
-ry(1.4974069) q[184];
-ry(-1.4972085) q[183];
-cz q[184],q[183];
-ry(1.4972085) q[183];
-ry(-1.4970084) q[182];
-cz q[183],q[182];
-ry(1.4970084) q[182];
-ry(-1.4968067) q[181];
-cz q[182],q[181];
-ry(1.4968067) q[181];
-ry(-1.4966033) q[180];
-cz q[181],q[180];
-ry(1.4966033) q[180];
-ry(-1.4963983) q[179];
-cz q[180],q[179];
-ry(1.4963983) q[179];
-ry(-1.4961915) q[178];
-cz q[179],q[178];
-ry(1.4961915) q[178];
-ry(-1.495983) q[177];
-cz q[178],q[177];
-ry(1.495983) q[177];
-ry(-1.4957728) q[176];
-cz q[177],q[176];
-ry(1.4957728) q[176];
-ry(-1.4955608) q[175];
-cz q[176],q[175];
-ry(1.4955608) q[175];
-ry(-1.4953469) q[174];
-cz q[175],q[174];
-ry(1.4953469) q[174];
-ry(-1.4951313) q[173];
-cz q[174],q[173];
-ry(1.4951313) q[173];
-ry(-1.4949137) q[172];
-cz q[173],q[172];
-ry(1.4949137) q[172];
-ry(-1.4946943) q[171];
-cz q[172],q[171];
-ry(1.4946943) q[171];
-ry(-1.494473) q[170];
-cz q[171],q[170];
-ry(1.494473) q[170];
-ry(-1.4942497) q[169];
-cz q[170],q[169];
-ry(1.4942497) q[169];
-ry(-1.4940244) q[168];
-cz q[169],q[168];
-ry(1.4940244) q[168];
-ry(-1.4937972) q[167];
-cz q[168],q[167];
-ry(1.4937972) q[167];
-ry(-1.4935679) q[166];
-cz q[167],q[166];
-ry(1.4935679) q[166];
-ry(-1.4933366) q[165];
-cz q[166],q[165];
-ry(1.4933366) q[165];
-ry(-1.4931031) q[164];
-cz q[165],q[164];
-ry(1.4931031) q[164];
-ry(-1.4928676) q[163];
-cz q[164],q[163];
-ry(1.4928676) q[163];
-ry(-1.4926299) q[162];
-cz q[163],q[162];
-ry(1.4926299) q[162];
-ry(-1.49239) q[161];
-cz q[162],q[161];
-ry(1.49239) q[161];
-ry(-1.4921479) q[160];
-cz q[161],q[160];
-ry(1.4921479) q[160];
-ry(-1.4919035) q[159];
-cz q[160],q[159];
-ry(1.4919035) q[159];
-ry(-1.4916568) q[158];
-cz q[159],q[158];
-ry(1.4916568) q[158];
-ry(-1.4914078) q[157];
-cz q[158],q[157];
-ry(1.4914078) q[157];
-ry(-1.4911564) q[156];
-cz q[157],q[156];
-ry(1.4911564) q[156];
-ry(-1.4909027) q[155];
-cz q[156],q[155];
-ry(1.4909027) q[155];
-ry(-1.4906465) q[154];
-cz q[155],q[154];
-ry(1.4906465) q[154];
-ry(-1.4903878) q[153];
-cz q[154],q[153];
-ry(1.4903878) q[153];
-ry(-1.4901266) q[152];
-cz q[153],q[152];
-ry(1.4901266) q[152];
-ry(-1.4898628) q[151];
-cz q[152],q[151];
-ry(1.4898628) q[151];
-ry(-1.4895964) q[150];
-cz q[151],q[150];
-ry(1.4895964) q[150];
-ry(-1.4893274) q[149];
-cz q[150],q[149];
-ry(1.4893274) q[149];
-ry(-1.4890557) q[148];
-cz q[149],q[148];
-ry(1.4890557) q[148];
-ry(-1.4887812) q[147];
-cz q[148],q[147];
-ry(1.4887812) q[147];
-ry(-1.488504) q[146];
-cz q[147],q[146];
-ry(1.488504) q[146];
-ry(-1.4882239) q[145];
-cz q[146],q[145];
-ry(1.4882239) q[145];
-ry(-1.487941) q[144];
-cz q[145],q[144];
-ry(1.487941) q[144];
-ry(-1.4876551) q[143];
-cz q[144],q[143];
-ry(1.4876551) q[143];
-ry(-1.4873662) q[142];
-cz q[143],q[142];
-ry(1.4873662) q[142];
-ry(-1.4870744) q[141];
-cz q[142],q[141];
-ry(1.4870744) q[141];
-ry(-1.4867794) q[140];
-cz q[141],q[140];
-ry(1.4867794) q[140];
-ry(-1.4864813) q[139];
-cz q[140],q[139];
-ry(1.4864813) q[139];
-ry(-1.48618) q[138];
-cz q[139],q[138];
-ry(1.48618) q[138];
-ry(-1.4858754) q[137];
-cz q[138],q[137];
-ry(1.4858754) q[137];
-ry(-1.4855675) q[136];
-cz q[137],q[136];
-ry(1.4855675) q[136];
-ry(-1.4852563) q[135];
-cz q[136],q[135];
-ry(1.4852563) q[135];
-ry(-1.4849416) q[134];
-cz q[135],q[134];
-ry(1.4849416) q[134];
-ry(-1.4846234) q[133];
-cz q[134],q[133];
-ry(1.4846234) q[133];
-ry(-1.4843017) q[132];
-cz q[133],q[132];
-ry(1.4843017) q[132];
-ry(-1.4839763) q[131];
-cz q[132],q[131];
-ry(1.4839763) q[131];
-ry(-1.4836472) q[130];
-cz q[131],q[130];
-ry(1.4836472) q[130];
-ry(-1.4833144) q[129];
-cz q[130],q[129];
-ry(1.4833144) q[129];
-ry(-1.4829777) q[128];
-cz q[129],q[128];
-ry(1.4829777) q[128];
-ry(-1.4826371) q[127];
-cz q[128],q[127];
-ry(1.4826371) q[127];
-ry(-1.4822925) q[126];
-cz q[127],q[126];
-ry(1.4822925) q[126];
-ry(-1.4819438) q[125];
-cz q[126],q[125];
-ry(1.4819438) q[125];
-ry(-1.481591) q[124];
-cz q[125],q[124];
-ry(1.481591) q[124];
-ry(-1.4812339) q[123];
-cz q[124],q[123];
-ry(1.4812339) q[123];
-ry(-1.4808725) q[122];
-cz q[123],q[122];
-ry(1.4808725) q[122];
-ry(-1.4805067) q[121];
-cz q[122],q[121];
-ry(1.4805067) q[121];
-ry(-1.4801364) q[120];
-cz q[121],q[120];
-ry(1.4801364) q[120];
-ry(-1.4797615) q[119];
-cz q[120],q[119];
-ry(1.4797615) q[119];
-ry(-1.479382) q[118];
-cz q[119],q[118];
-ry(1.479382) q[118];
-ry(-1.4789976) q[117];
-cz q[118],q[117];
-ry(1.4789976) q[117];
-ry(-1.4786083) q[116];
-cz q[117],q[116];
-ry(1.4786083) q[116];
-ry(-1.4782141) q[115];
-cz q[116],q[115];
-ry(1.4782141) q[115];
-ry(-1.4778147) q[114];
-cz q[115],q[114];
-ry(1.4778147) q[114];
-ry(-1.4774102) q[113];
-cz q[114],q[113];
-ry(1.4774102) q[113];
-ry(-1.4770003) q[112];
-cz q[113],q[112];
-ry(1.4770003) q[112];
-ry(-1.4765849) q[111];
-cz q[112],q[111];
-ry(1.4765849) q[111];
-ry(-1.476164) q[110];
-cz q[111],q[110];
-ry(1.476164) q[110];
-ry(-1.4757374) q[109];
-cz q[110],q[109];
-ry(1.4757374) q[109];
-ry(-1.475305) q[108];
-cz q[109],q[108];
-ry(1.475305) q[108];
-ry(-1.4748666) q[107];
-cz q[108],q[107];
-ry(1.4748666) q[107];
-ry(-1.4744222) q[106];
-cz q[107],q[106];
-ry(1.4744222) q[106];
-ry(-1.4739715) q[105];
-cz q[106],q[105];
-ry(1.4739715) q[105];
-ry(-1.4735144) q[104];
-cz q[105],q[104];
-ry(1.4735144) q[104];
-ry(-1.4730507) q[103];
-cz q[104],q[103];
-ry(1.4730507) q[103];
-ry(-1.4725804) q[102];
-cz q[103],q[102];
-ry(1.4725804) q[102];
-ry(-1.4721033) q[101];
-cz q[102],q[101];
-ry(1.4721033) q[101];
-ry(-1.4716191) q[100];
-cz q[101],q[100];
-ry(1.4716191) q[100];
-ry(-1.4711277) q[99];
-cz q[100],q[99];
-ry(1.4711277) q[99];
-ry(-1.4706289) q[98];
-cz q[99],q[98];
-ry(1.4706289) q[98];
-ry(-1.4701226) q[97];
-cz q[98],q[97];
-ry(1.4701226) q[97];
-ry(-1.4696085) q[96];
-cz q[97],q[96];
-ry(1.4696085) q[96];
-ry(-1.4690864) q[95];
-cz q[96],q[95];
-ry(1.4690864) q[95];
-ry(-1.4685562) q[94];
-cz q[95],q[94];
-ry(1.4685562) q[94];
-ry(-1.4680176) q[93];
-cz q[94],q[93];
-ry(1.4680176) q[93];
-ry(-1.4674704) q[92];
-cz q[93],q[92];
-ry(1.4674704) q[92];
-ry(-1.4669144) q[91];
-cz q[92],q[91];
-ry(1.4669144) q[91];
-ry(-1.4663493) q[90];
-cz q[91],q[90];
-ry(1.4663493) q[90];
-ry(-1.4657749) q[89];
-cz q[90],q[89];
-ry(1.4657749) q[89];
-ry(-1.4651909) q[88];
-cz q[89],q[88];
-ry(1.4651909) q[88];
-ry(-1.464597) q[87];
-cz q[88],q[87];
-ry(1.464597) q[87];
-ry(-1.463993) q[86];
-cz q[87],q[86];
-ry(1.463993) q[86];
-ry(-1.4633786) q[85];
-cz q[86],q[85];
-ry(1.4633786) q[85];
-ry(-1.4627535) q[84];
-cz q[85],q[84];
-ry(1.4627535) q[84];
-ry(-1.4621173) q[83];
-cz q[84],q[83];
-ry(1.4621173) q[83];
-ry(-1.4614697) q[82];
-cz q[83],q[82];
-ry(1.4614697) q[82];
-ry(-1.4608105) q[81];
-cz q[82],q[81];
-ry(1.4608105) q[81];
-ry(-1.4601391) q[80];
-cz q[81],q[80];
-ry(1.4601391) q[80];
-ry(-1.4594553) q[79];
-cz q[80],q[79];
-ry(1.4594553) q[79];
-ry(-1.4587587) q[78];
-cz q[79],q[78];
-ry(1.4587587) q[78];
-ry(-1.4580488) q[77];
-cz q[78],q[77];
-ry(1.4580488) q[77];
-ry(-1.4573253) q[76];
-cz q[77],q[76];
-ry(1.4573253) q[76];
-ry(-1.4565876) q[75];
-cz q[76],q[75];
-ry(1.4565876) q[75];
-ry(-1.4558354) q[74];
-cz q[75],q[74];
-ry(1.4558354) q[74];
-ry(-1.4550681) q[73];
-cz q[74],q[73];
-ry(1.4550681) q[73];
-ry(-1.4542853) q[72];
-cz q[73],q[72];
-ry(1.4542853) q[72];
-ry(-1.4534863) q[71];
-cz q[72],q[71];
-ry(1.4534863) q[71];
-ry(-1.4526707) q[70];
-cz q[71],q[70];
-ry(1.4526707) q[70];
-ry(-1.4518378) q[69];
-cz q[70],q[69];
-ry(1.4518378) q[69];
-ry(-1.450987) q[68];
-cz q[69],q[68];
-ry(1.450987) q[68];
-ry(-1.4501178) q[67];
-cz q[68],q[67];
-ry(1.4501178) q[67];
-ry(-1.4492293) q[66];
-cz q[67],q[66];
-ry(1.4492293) q[66];
-ry(-1.4483209) q[65];
-cz q[66],q[65];
-ry(1.4483209) q[65];
-ry(-1.4473919) q[64];
-cz q[65],q[64];
-ry(1.4473919) q[64];
-ry(-1.4464413) q[63];
-cz q[64],q[63];
-ry(1.4464413) q[63];
-ry(-1.4454685) q[62];
-cz q[63],q[62];
-ry(1.4454685) q[62];
-ry(-1.4444725) q[61];
-cz q[62],q[61];
-ry(1.4444725) q[61];
-ry(-1.4434523) q[60];
-cz q[61],q[60];
-ry(1.4434523) q[60];
-ry(-1.442407) q[59];
-cz q[60],q[59];
-ry(1.442407) q[59];
-ry(-1.4413356) q[58];
-cz q[59],q[58];
-ry(1.4413356) q[58];
-ry(-1.4402368) q[57];
-cz q[58],q[57];
-ry(1.4402368) q[57];
-ry(-1.4391096) q[56];
-cz q[57],q[56];
-ry(1.4391096) q[56];
-ry(-1.4379527) q[55];
-cz q[56],q[55];
-ry(1.4379527) q[55];
-ry(-1.4367648) q[54];
-cz q[55],q[54];
-ry(1.4367648) q[54];
-ry(-1.4355444) q[53];
-cz q[54],q[53];
-ry(1.4355444) q[53];
-ry(-1.43429) q[52];
-cz q[53],q[52];
-ry(1.43429) q[52];
-ry(-1.4330001) q[51];
-cz q[52],q[51];
-ry(1.4330001) q[51];
-ry(-1.4316729) q[50];
-cz q[51],q[50];
-ry(1.4316729) q[50];
-ry(-1.4303066) q[49];
-cz q[50],q[49];
-ry(1.4303066) q[49];
-ry(-1.4288993) q[48];
-cz q[49],q[48];
-ry(1.4288993) q[48];
-ry(-1.4274488) q[47];
-cz q[48],q[47];
-ry(1.4274488) q[47];
-ry(-1.4259528) q[46];
-cz q[47],q[46];
-ry(1.4259528) q[46];
-ry(-1.4244091) q[45];
-cz q[46],q[45];
-ry(1.4244091) q[45];
-ry(-1.4228149) q[44];
-cz q[45],q[44];
-ry(1.4228149) q[44];
-ry(-1.4211674) q[43];
-cz q[44],q[43];
-ry(1.4211674) q[43];
-ry(-1.4194637) q[42];
-cz q[43],q[42];
-ry(1.4194637) q[42];
-ry(-1.4177004) q[41];
-cz q[42],q[41];
-ry(1.4177004) q[41];
-ry(-1.415874) q[40];
-cz q[41],q[40];
-ry(1.415874) q[40];
-ry(-1.4139806) q[39];
-cz q[40],q[39];
-ry(1.4139806) q[39];
-ry(-1.4120161) q[38];
-cz q[39],q[38];
-ry(1.4120161) q[38];
-ry(-1.4099758) q[37];
-cz q[38],q[37];
-ry(1.4099758) q[37];
-ry(-1.4078548) q[36];
-cz q[37],q[36];
-ry(1.4078548) q[36];
-ry(-1.4056476) q[35];
-cz q[36],q[35];
-ry(1.4056476) q[35];
-ry(-1.4033482) q[34];
-cz q[35],q[34];
-ry(1.4033482) q[34];
-ry(-1.40095) q[33];
-cz q[34],q[33];
-ry(1.40095) q[33];
-ry(-1.3984457) q[32];
-cz q[33],q[32];
-ry(1.3984457) q[32];
-ry(-1.3958273) q[31];
-cz q[32],q[31];
-ry(1.3958273) q[31];
-ry(-1.3930857) q[30];
-cz q[31],q[30];
-ry(1.3930857) q[30];
-ry(-1.3902111) q[29];
-cz q[30],q[29];
-ry(1.3902111) q[29];
-ry(-1.3871923) q[28];
-cz q[29],q[28];
-ry(1.3871923) q[28];
-ry(-1.3840169) q[27];
-cz q[28],q[27];
-ry(1.3840169) q[27];
-ry(-1.3806707) q[26];
-cz q[27],q[26];
-ry(1.3806707) q[26];
-ry(-1.377138) q[25];
-cz q[26],q[25];
-ry(1.377138) q[25];
-ry(-1.3734008) q[24];
-cz q[25],q[24];
-ry(1.3734008) q[24];
-ry(-1.3694384) q[23];
-cz q[24],q[23];
-ry(1.3694384) q[23];
-ry(-1.3652274) q[22];
-cz q[23],q[22];
-ry(1.3652274) q[22];
-ry(-1.3607406) q[21];
-cz q[22],q[21];
-ry(1.3607406) q[21];
-ry(-1.3559465) q[20];
-cz q[21],q[20];
-ry(1.3559465) q[20];
-ry(-1.3508083) q[19];
-cz q[20],q[19];
-ry(1.3508083) q[19];
-ry(-1.3452829) q[18];
-cz q[19],q[18];
-ry(1.3452829) q[18];
-ry(-1.339319) q[17];
-cz q[18],q[17];
-ry(1.339319) q[17];
-ry(-1.3328552) q[16];
-cz q[17],q[16];
-ry(1.3328552) q[16];
-ry(-1.3258177) q[15];
-cz q[16],q[15];
-ry(1.3258177) q[15];
-ry(-1.3181161) q[14];
-cz q[15],q[14];
-ry(1.3181161) q[14];
-ry(-1.3096389) q[13];
-cz q[14],q[13];
-ry(1.3096389) q[13];
-ry(-1.3002466) q[12];
-cz q[13],q[12];
-ry(1.3002466) q[12];
-ry(-1.2897614) q[11];
-cz q[12],q[11];
-ry(1.2897614) q[11];
-ry(-1.2779536) q[10];
-cz q[11],q[10];
-ry(1.2779536) q[10];
-ry(-1.264519) q[9];
-cz q[10],q[9];
-ry(1.264519) q[9];
-ry(-1.2490458) q[8];
-cz q[9],q[8];
-ry(1.2490458) q[8];
-ry(-1.2309594) q[7];
-cz q[8],q[7];
-ry(1.2309594) q[7];
-ry(-1.2094292) q[6];
-cz q[7],q[6];
-ry(1.2094292) q[6];
-ry(-1.1831996) q[5];
-cz q[6],q[5];
-ry(1.1831996) q[5];
-ry(-1.150262) q[4];
-cz q[5],q[4];
-ry(1.150262) q[4];
-ry(-1.1071487) q[3];
-cz q[4],q[3];
-ry(1.1071487) q[3];
-ry(-pi/3) q[2];
-cz q[3],q[2];
-ry(pi/3) q[2];
-ry(-0.95531662) q[1];
-cz q[2],q[1];
-ry(0.95531662) q[1];
-ry(-pi/4) q[0];
-cz q[1],q[0];
-ry(pi/4) q[0];
-cx q[378],q[379];
-cx q[377],q[378];
-cx q[376],q[377];
-cx q[375],q[376];
-cx q[374],q[375];
-cx q[373],q[374];
-cx q[372],q[373];
-cx q[371],q[372];
-cx q[370],q[371];
-cx q[369],q[370];
-cx q[368],q[369];
-cx q[367],q[368];
-cx q[366],q[367];
-cx q[365],q[366];
-cx q[364],q[365];
-cx q[363],q[364];
-cx q[362],q[363];
-cx q[361],q[362];
-cx q[360],q[361];
-cx q[359],q[360];
-cx q[358],q[359];
-cx q[357],q[358];
-cx q[356],q[357];
-cx q[355],q[356];
-cx q[354],q[355];
-cx q[353],q[354];
-cx q[352],q[353];
-cx q[351],q[352];
-cx q[350],q[351];
-cx q[349],q[350];
-cx q[348],q[349];
-cx q[347],q[348];
-cx q[346],q[347];
-cx q[345],q[346];
-cx q[344],q[345];
-cx q[343],q[344];
-cx q[342],q[343];
-cx q[341],q[342];
-cx q[340],q[341];
-cx q[339],q[340];
-cx q[338],q[339];
-cx q[337],q[338];
-cx q[336],q[337];
-cx q[335],q[336];
-cx q[334],q[335];
-cx q[333],q[334];
-cx q[332],q[333];
-cx q[331],q[332];
-cx q[330],q[331];
-cx q[329],q[330];
-cx q[328],q[329];
-cx q[327],q[328];
-cx q[326],q[327];
-cx q[325],q[326];
-cx q[324],q[325];
-cx q[323],q[324];
-cx q[322],q[323];
-cx q[321],q[322];
-cx q[320],q[321];
-cx q[319],q[320];
-cx q[318],q[319];
-cx q[317],q[318];
-cx q[316],q[317];
-cx q[315],q[316];
-cx q[314],q[315];
-cx q[313],q[314];
-cx q[312],q[313];
-cx q[311],q[312];
-cx q[310],q[311];
-cx q[309],q[310];
-cx q[308],q[309];
-cx q[307],q[308];
-cx q[306],q[307];
-cx q[305],q[306];
-cx q[304],q[305];
-cx q[303],q[304];
-cx q[302],q[303];
-cx q[301],q[302];
-cx q[300],q[301];
-cx q[299],q[300];
-cx q[298],q[299];
-cx q[297],q[298];
-cx q[296],q[297];
-cx q[295],q[296];
-cx q[294],q[295];
-cx q[293],q[294];
-cx q[292],q[293];
-cx q[291],q[292];
-cx q[290],q[291];
-cx q[289],q[290];
-cx q[288],q[289];
-cx q[287],q[288];
-cx q[286],q[287];
-cx q[285],q[286];
-cx q[284],q[285];
-cx q[283],q[284];
-cx q[282],q[283];
-cx q[281],q[282];
-cx q[280],q[281];
-cx q[279],q[280];
-cx q[278],q[279];
-cx q[277],q[278];
-cx q[276],q[277];
-cx q[275],q[276];
-cx q[274],q[275];
-cx q[273],q[274];
-cx q[272],q[273];
-cx q[271],q[272];
-cx q[270],q[271];
-cx q[269],q[270];
-cx q[268],q[269];
-cx q[267],q[268];
-cx q[266],q[267];
-cx q[265],q[266];
-cx q[264],q[265];
-cx q[263],q[264];
-cx q[262],q[263];
-cx q[261],q[262];
-cx q[260],q[261];
-cx q[259],q[260];
-cx q[258],q[259];
-cx q[257],q[258];
-cx q[256],q[257];
-cx q[255],q[256];
-cx q[254],q[255];
-cx q[253],q[254];
-cx q[252],q[253];
-cx q[251],q[252];
-cx q[250],q[251];
-cx q[249],q[250];
-cx q[248],q[249];
-cx q[247],q[248];
-cx q[246],q[247];
-cx q[245],q[246];
-cx q[244],q[245];
-cx q[243],q[244];
-cx q[242],q[243];
-cx q[241],q[242];
-cx q[240],q[241];
-cx q[239],q[240];
-cx q[238],q[239];
-cx q[237],q[238];
-cx q[236],q[237];
-cx q[235],q[236];
-cx q[234],q[235];
-cx q[233],q[234];
-cx q[232],q[233];
-cx q[231],q[232];
-cx q[230],q[231];
-cx q[229],q[230];
-cx q[228],q[229];
-cx q[227],q[228];
-cx q[226],q[227];
-cx q[225],q[226];
-cx q[224],q[225];
-cx q[223],q[224];
-cx q[222],q[223];
-cx q[221],q[222];
-cx q[220],q[221];
-cx q[219],q[220];
-cx q[218],q[219];
-cx q[217],q[218];
-cx q[216],q[217];
-cx q[215],q[216];
-cx q[214],q[215];
-cx q[213],q[214];
-cx q[212],q[213];
-cx q[211],q[212];
-cx q[210],q[211];
-cx q[209],q[210];
-cx q[208],q[209];
-cx q[207],q[208];
-cx q[206],q[207];
-cx q[205],q[206];
-cx q[204],q[205];
-cx q[203],q[204];
-cx q[202],q[203];
-cx q[201],q[202];
-cx q[200],q[201];
-cx q[199],q[200];
-cx q[198],q[199];
-cx q[197],q[198];
-cx q[196],q[197];
-cx q[195],q[196];
-cx q[194],q[195];
-cx q[193],q[194];
-cx q[192],q[193];
-cx q[191],q[192];
-cx q[190],q[191];
-cx q[189],q[190];
-cx q[188],q[189];
-cx q[187],q[188];
-cx q[186],q[187];
-cx q[185],q[186];
-cx q[184],q[185];
-cx q[183],q[184];
-cx q[182],q[183];
-cx q[181],q[182];
-cx q[180],q[181];
-cx q[179],q[180];
-cx q[178],q[179];
-cx q[177],q[178];
-cx q[176],q[177];
-cx q[175],q[176];
-cx q[174],q[175];
-cx q[173],q[174];
-cx q[172],q[173];
-cx q[171],q[172];
-cx q[170],q[171];
-cx q[169],q[170];
-cx q[168],q[169];
-cx q[167],q[168];
-cx q[166],q[167];
-cx q[165],q[166];
-cx q[164],q[165];
-cx q[163],q[164];
-cx q[162],q[163];
-cx q[161],q[162];
-cx q[160],q[161];
-cx q[159],q[160];
-cx q[158],q[159];
-cx q[157],q[158];
-cx q[156],q[157];
-cx q[155],q[156];
-cx q[154],q[155];
-cx q[153],q[154];
-cx q[152],q[153];
-cx q[151],q[152];
-cx q[150],q[151];
-cx q[149],q[150];
-cx q[148],q[149];
-cx q[147],q[148];
-cx q[146],q[147];
-cx q[145],q[146];
-cx q[144],q[145];
-cx q[143],q[144];
-cx q[142],q[143];
-cx q[141],q[142];
-cx q[140],q[141];
-cx q[139],q[140];
-cx q[138],q[139];
-cx q[137],q[138];
-cx q[136],q[137];
-cx q[135],q[136];
-cx q[134],q[135];
-cx q[133],q[134];
-cx q[132],q[133];
-cx q[131],q[132];
-cx q[130],q[131];
-cx q[129],q[130];
-cx q[128],q[129];
-cx q[127],q[128];
-cx q[126],q[127];
-cx q[125],q[126];
-cx q[124],q[125];
-cx q[123],q[124];
-cx q[122],q[123];
-cx q[121],q[122];
-cx q[120],q[121];
-cx q[119],q[120];
-cx q[118],q[119];
-cx q[117],q[118];
-cx q[116],q[117];
-cx q[115],q[116];
-cx q[114],q[115];
-cx q[113],q[114];
-cx q[112],q[113];
-cx q[111],q[112];
-cx q[110],q[111];
-cx q[109],q[110];
-cx q[108],q[109];
-cx q[107],q[108];
-cx q[106],q[107];
-cx q[105],q[106];
-cx q[104],q[105];
-cx q[103],q[104];
-cx q[102],q[103];
-cx q[101],q[102];
-cx q[100],q[101];
-cx q[99],q[100];
-cx q[98],q[99];
-cx q[97],q[98];
-cx q[96],q[97];
-cx q[95],q[96];
-cx q[94],q[95];
-cx q[93],q[94];
-cx q[92],q[93];
-cx q[91],q[92];
-cx q[90],q[91];
-cx q[89],q[90];
-cx q[88],q[89];
-cx q[87],q[88];
-cx q[86],q[87];
-cx q[85],q[86];
-cx q[84],q[85];
-cx q[83],q[84];
-cx q[82],q[83];
-cx q[81],q[82];
-cx q[80],q[81];
-cx q[79],q[80];
-cx q[78],q[79];
-cx q[77],q[78];
-cx q[76],q[77];
-cx q[75],q[76];
-cx q[74],q[75];
-cx q[73],q[74];
-cx q[72],q[73];
-cx q[71],q[72];
-cx q[70],q[71];
-cx q[69],q[70];
-cx q[68],q[69];
-cx q[67],q[68];
-cx q[66],q[67];
-cx q[65],q[66];
-cx q[64],q[65];
-cx q[63],q[64];
-cx q[62],q[63];
-cx q[61],q[62];
-cx q[60],q[61];
-cx q[59],q[60];
-cx q[58],q[59];
-cx q[57],q[58];
-cx q[56],q[57];
-cx q[55],q[56];
-cx q[54],q[55];
-cx q[53],q[54];
-cx q[52],q[53];
-cx q[51],q[52];
-cx q[50],q[51];
-cx q[49],q[50];
-cx q[48],q[49];
-cx q[47],q[48];
-cx q[46],q[47];
-cx q[45],q[46];
-cx q[44],q[45];
-cx q[43],q[44];
-cx q[42],q[43];
-cx q[41],q[42];
-cx q[40],q[41];
-cx q[39],q[40];
-cx q[38],q[39];
-cx q[37],q[38];
-cx q[36],q[37];
-cx q[35],q[36];
-cx q[34],q[35];
-cx q[33],q[34];
-cx q[32],q[33];
-cx q[31],q[32];
-cx q[30],q[31];
-cx q[29],q[30];
-cx q[28],q[29];
-cx q[27],q[28];
-cx q[26],q[27];
-cx q[25],q[26];
-cx q[24],q[25];
-cx q[23],q[24];
-cx q[22],q[23];
-cx q[21],q[22];
-cx q[20],q[21];
-cx q[19],q[20];
-cx q[18],q[19];
-cx q[17],q[18];
-cx q[16],q[17];
-cx q[15],q[16];
-cx q[14],q[15];
-cx q[13],q[14];
-cx q[12],q[13];
-cx q[11],q[12];
-cx q[10],q[11];
-cx q[9],q[10];
-cx q[8],q[9];
-cx q[7],q[8];
-cx q[6],q[7];
-cx q[5],q[6];
-cx q[4],q[5];
-cx q[3],q[4];
-cx q[2],q[3];
-cx q[1],q[2];
-cx q[0],q[1];
-barrier q[0],q[1],q[2],q[3],q[4],q[5],q[6],q[7],q[8],q[9],q[10],q[11],q[12],q[13],q[14],q[15],q[16],q[17],q[18],q[19],q[20],q[21],q[22],q[23],q[24],q[25],q[26],q[27],q[28],q[29],q[30],q[31],q[32],q[33],q[34],q[35],q[36],q[37],q[38],q[39],q[40],q[41],q[42],q[43],q[44],q[45],q[46],q[47],q[48],q[49],q[50],q[51],q[52],q[53],q[54],q[55],q[56],q[57],q[58],q[59],q[60],q[61],q[62],q[63],q[64],q[65],q[66],q[67],q[68],q[69],q[70],q[71],q[72],q[73],q[74],q[75],q[76],q[77],q[78],q[79],q[80],q[81],q[82],q[83],q[84],q[85],q[86],q[87],q[88],q[89],q[90],q[91],q[92],q[93],q[94],q[95],q[96],q[97],q[98],q[99],q[100],q[101],q[102],q[103],q[104],q[105],q[106],q[107],q[108],q[109],q[110],q[111],q[112],q[113],q[114],q[115],q[116],q[117],q[118],q[119],q[120],q[121],q[122],q[123],q[124],q[125],q[126],q[127],q[128],q[129],q[130],q[131],q[132],q[133],q[134],q[135],q[136],q[137],q[138],q[139],q[140],q[141],q[142],q[143],q[144],q[145],q[146],q[147],q[148],q[149],q[150],q[151],q[152],q[153],q[154],q[155],q[156],q[157],q[158],q[159],q[160],q[161],q[162],q[163],q[164],q[165],q[166],q[167],q[168],q[169],q[170],q[171],q[172],q[173],q[174],q[175],q[176],q[177],q[178],q[179],q[180],q[181],q[182],q[183],q[184],q[185],q[186],q[187],q[188],q[189],q[190],q[191],q[192],q[193],q[194],q[195],q[196],q[197],q[198],q[199],q[200],q[201],q[202],q[203],q[204],q[205],q[206],q[207],q[208],q[209],q[210],q[211],q[212],q[213],q[214],q[215],q[216],q[217],q[218],q[219],q[220],q[221],q[222],q[223],q[224],q[225],q[226],q[227],q[228],q[229],q[230],q[231],q[232],q[233],q[234],q[235],q[236],q[237],q[238],q[239],q[240],q[241],q[242],q[243],q[244],q[245],q[246],q[247],q[248],q[249],q[250],q[251],q[252],q[253],q[254],q[255],q[256],q[257],q[258],q[259],q[260],q[261],q[262],q[263],q[264],q[265],q[266],q[267],q[268],q[269],q[270],q[271],q[272],q[273],q[274],q[275],q[276],q[277],q[278],q[279],q[280],q[281],q[282],q[283],q[284],q[285],q[286],q[287],q[288],q[289],q[290],q[291],q[292],q[293],q[294],q[295],q[296],q[297],q[298],q[299],q[300],q[301],q[302],q[303],q[304],q[305],q[306],q[307],q[308],q[309],q[310],q[311],q[312],q[313],q[314],q[315],q[316],q[317],q[318],q[319],q[320],q[321],q[322],q[323],q[324],q[325],q[326],q[327],q[328],q[329],q[330],q[331],q[332],q[333],q[334],q[335],q[336],q[337],q[338],q[339],q[340],q[341],q[342],q[343],q[344],q[345],q[346],q[347],q[348],q[349],q[350],q[351],q[352],q[353],q[354],q[355],q[356],q[357],q[358],q[359],q[360],q[361],q[362],q[363],q[364],q[365],q[366],q[367],q[368],q[369],q[370],q[371],q[372],q[373],q[374],q[375],q[376],q[377],q[378],q[379];
-measure q[0] -> meas[0];
-measure q[1] -> meas[1];
-measure q[2] -> meas[2];
-measure q[3] -> meas[3];
-measure q[4] -> meas[4];
-measure q[5] -> meas[5];
-measure q[6] -> meas[6];
-measure q[7] -> meas[7];
-measure q[8] -> meas[8];
-measure q[9] -> meas[9];
-measure q[10] -> meas[10];
-measure q[11] -> meas[11];
-measure q[12] -> meas[12];
-measure q[13] -> meas[13];
-measure q[14] -> meas[14];
-measure q[15] -> meas[15];
-measure q[16] -> meas[16];
-measure q[17] -> meas[17];
-measure q[18] -> meas[18];
-measure q[19] -> meas[19];
-measure q[20] -> meas[20];
-measure q[21] -> meas[21];
-measure q[22] -> meas[22];
-measure q[23] -> meas[23];
-measure q[24] -> meas[24];
-measure q[25] -> meas[25];
-measure q[26] -> meas[26];
-measure q[27] -> meas[27];
-measure q[28] -> meas[28];
-measure q[29] -> meas[29];
-measure q[30] -> meas[30];
-measure q[31] -> meas[31];
-measure q[32] -> meas[32];
-measure q[33] -> meas[33];
-measure q[34] -> meas[34];
-measure q[35] -> meas[35];
-measure q[36] -> meas[36];
-measure q[37] -> meas[37];
-measure q[38] -> meas[38];
-measure q[39] -> meas[39];
-measure q[40] -> meas[40];
-measure q[41] -> meas[41];
-measure q[42] -> meas[42];
-measure q[43] -> meas[43];
-measure q[44] -> meas[44];
-measure q[45] -> meas[45];
-measure q[46] -> meas[46];
-measure q[47] -> meas[47];
-measure q[48] -> meas[48];
-measure q[49] -> meas[49];
-measure q[50] -> meas[50];
-measure q[51] -> meas[51];
-measure q[52] -> meas[52];
-measure q[53] -> meas[53];
-measure q[54] -> meas[54];
-measure q[55] -> meas[55];
-measure q[56] -> meas[56];
-measure q[57] -> meas[57];
-measure q[58] -> meas[58];
-measure q[59] -> meas[59];
-measure q[60] -> meas[60];
-measure q[61] -> meas[61];
-measure q[62] -> meas[62];
-measure q[63] -> meas[63];
-measure q[64] -> meas[64];
-measure q[65] -> meas[65];
-measure q[66] -> meas[66];
-measure q[67] -> meas[67];
-measure q[68] -> meas[68];
-measure q[69] -> meas[69];
-measure q[70] -> meas[70];
-measure q[71] -> meas[71];
-measure q[72] -> meas[72];
-measure q[73] -> meas[73];
-measure q[74] -> meas[74];
-measure q[75] -> meas[75];
-measure q[76] -> meas[76];
-measure q[77] -> meas[77];
-measure q[78] -> meas[78];
-measure q[79] -> meas[79];
-measure q[80] -> meas[80];
-measure q[81] -> meas[81];
-measure q[82] -> meas[82];
-measure q[83] -> meas[83];
-measure q[84] -> meas[84];
-measure q[85] -> meas[85];
-measure q[86] -> meas[86];
-measure q[87] -> meas[87];
-measure q[88] -> meas[88];
-measure q[89] -> meas[89];
-measure q[90] -> meas[90];
-measure q[91] -> meas[91];
-measure q[92] -> meas[92];
-measure q[93] -> meas[93];
-measure q[94] -> meas[94];
-measure q[95] -> meas[95];
-measure q[96] -> meas[96];
-measure q[97] -> meas[97];
-measure q[98] -> meas[98];
-measure q[99] -> meas[99];
-measure q[100] -> meas[100];
-measure q[101] -> meas[101];
-measure q[102] -> meas[102];
-measure q[103] -> meas[103];
-measure q[104] -> meas[104];
-measure q[105] -> meas[105];
-measure q[106] -> meas[106];
-measure q[107] -> meas[107];
-measure q[108] -> meas[108];
-measure q[109] -> meas[109];
-measure q[110] -> meas[110];
-measure q[111] -> meas[111];
-measure q[112] -> meas[112];
-measure q[113] -> meas[113];
-measure q[114] -> meas[114];
-measure q[115] -> meas[115];
-measure q[116] -> meas[116];
-measure q[117] -> meas[117];
-measure q[118] -> meas[118];
-measure q[119] -> meas[119];
-measure q[120] -> meas[120];
-measure q[121] -> meas[121];
-measure q[122] -> meas[122];
-measure q[123] -> meas[123];
-measure q[124] -> meas[124];
-measure q[125] -> meas[125];
-measure q[126] -> meas[126];
-measure q[127] -> meas[127];
-measure q[128] -> meas[128];
-measure q[129] -> meas[129];
-measure q[130] -> meas[130];
-measure q[131] -> meas[131];
-measure q[132] -> meas[132];
-measure q[133] -> meas[133];
-measure q[134] -> meas[134];
-measure q[135] -> meas[135];
-measure q[136] -> meas[136];
-measure q[137] -> meas[137];
-measure q[138] -> meas[138];
-measure q[139] -> meas[139];
-measure q[140] -> meas[140];
-measure q[141] -> meas[141];
-measure q[142] -> meas[142];
-measure q[143] -> meas[143];
-measure q[144] -> meas[144];
-measure q[145] -> meas[145];
-measure q[146] -> meas[146];
-measure q[147] -> meas[147];
-measure q[148] -> meas[148];
-measure q[149] -> meas[149];
-measure q[150] -> meas[150];
-measure q[151] -> meas[151];
-measure q[152] -> meas[152];
-measure q[153] -> meas[153];
-measure q[154] -> meas[154];
-measure q[155] -> meas[155];
-measure q[156] -> meas[156];
-measure q[157] -> meas[157];
-measure q[158] -> meas[158];
-measure q[159] -> meas[159];
-measure q[160] -> meas[160];
-measure q[161] -> meas[161];
-measure q[162] -> meas[162];
-measure q[163] -> meas[163];
-measure q[164] -> meas[164];
-measure q[165] -> meas[165];
-measure q[166] -> meas[166];
-measure q[167] -> meas[167];
-measure q[168] -> meas[168];
-measure q[169] -> meas[169];
-measure q[170] -> meas[170];
-measure q[171] -> meas[171];
-measure q[172] -> meas[172];
-measure q[173] -> meas[173];
-measure q[174] -> meas[174];
-measure q[175] -> meas[175];
-measure q[176] -> meas[176];
-measure q[177] -> meas[177];
-measure q[178] -> meas[178];
-measure q[179] -> meas[179];
-measure q[180] -> meas[180];
-measure q[181] -> meas[181];
-measure q[182] -> meas[182];
-measure q[183] -> meas[183];
-measure q[184] -> meas[184];
-measure q[185] -> meas[185];
-measure q[186] -> meas[186];
-measure q[187] -> meas[187];
-measure q[188] -> meas[188];
-measure q[189] -> meas[189];
-measure q[190] -> meas[190];
-measure q[191] -> meas[191];
-measure q[192] -> meas[192];
-measure q[193] -> meas[193];
-measure q[194] -> meas[194];
-measure q[195] -> meas[195];
-measure q[196] -> meas[196];
-measure q[197] -> meas[197];
-measure q[198] -> meas[198];
-measure q[199] -> meas[199];
-measure q[200] -> meas[200];
-measure q[201] -> meas[201];
-measure q[202] -> meas[202];
-measure q[203] -> meas[203];
-measure q[204] -> meas[204];
-measure q[205] -> meas[205];
-measure q[206] -> meas[206];
-measure q[207] -> meas[207];
-measure q[208] -> meas[208];
-measure q[209] -> meas[209];
-measure q[210] -> meas[210];
-measure q[211] -> meas[211];
-measure q[212] -> meas[212];
-measure q[213] -> meas[213];
-measure q[214] -> meas[214];
-measure q[215] -> meas[215];
-measure q[216] -> meas[216];
-measure q[217] -> meas[217];
-measure q[218] -> meas[218];
-measure q[219] -> meas[219];
-measure q[220] -> meas[220];
-measure q[221] -> meas[221];
-measure q[222] -> meas[222];
-measure q[223] -> meas[223];
-measure q[224] -> meas[224];
-measure q[225] -> meas[225];
-measure q[226] -> meas[226];
-measure q[227] -> meas[227];
-measure q[228] -> meas[228];
-measure q[229] -> meas[229];
-measure q[230] -> meas[230];
-measure q[231] -> meas[231];
-measure q[232] -> meas[232];
-measure q[233] -> meas[233];
-measure q[234] -> meas[234];
-measure q[235] -> meas[235];
-measure q[236] -> meas[236];
-measure q[237] -> meas[237];
-measure q[238] -> meas[238];
-measure q[239] -> meas[239];
-measure q[240] -> meas[240];
-measure q[241] -> meas[241];
-measure q[242] -> meas[242];
-measure q[243] -> meas[243];
-measure q[244] -> meas[244];
-measure q[245] -> meas[245];
-measure q[246] -> meas[246];
-measure q[247] -> meas[247];
-measure q[248] -> meas[248];
-measure q[249] -> meas[249];
-measure q[250] -> meas[250];
-measure q[251] -> meas[251];
-measure q[252] -> meas[252];
-measure q[253] -> meas[253];
-measure q[254] -> meas[254];
-measure q[255] -> meas[255];
-measure q[256] -> meas[256];
-measure q[257] -> meas[257];
-measure q[258] -> meas[258];
-measure q[259] -> meas[259];
-measure q[260] -> meas[260];
-measure q[261] -> meas[261];
-measure q[262] -> meas[262];
-measure q[263] -> meas[263];
-measure q[264] -> meas[264];
-measure q[265] -> meas[265];
-measure q[266] -> meas[266];
-measure q[267] -> meas[267];
-measure q[268] -> meas[268];
-measure q[269] -> meas[269];
-measure q[270] -> meas[270];
-measure q[271] -> meas[271];
-measure q[272] -> meas[272];
-measure q[273] -> meas[273];
-measure q[274] -> meas[274];
-measure q[275] -> meas[275];
-measure q[276] -> meas[276];
-measure q[277] -> meas[277];
-measure q[278] -> meas[278];
-measure q[279] -> meas[279];
-measure q[280] -> meas[280];
-measure q[281] -> meas[281];
-measure q[282] -> meas[282];
-measure q[283] -> meas[283];
-measure q[284] -> meas[284];
-measure q[285] -> meas[285];
-measure q[286] -> meas[286];
-measure q[287] -> meas[287];
-measure q[288] -> meas[288];
-measure q[289] -> meas[289];
-measure q[290] -> meas[290];
-measure q[291] -> meas[291];
-measure q[292] -> meas[292];
-measure q[293] -> meas[293];
-measure q[294] -> meas[294];
-measure q[295] -> meas[295];
-measure q[296] -> meas[296];
-measure q[297] -> meas[297];
-measure q[298] -> meas[298];
-measure q[299] -> meas[299];
-measure q[300] -> meas[300];
-measure q[301] -> meas[301];
-measure q[302] -> meas[302];
-measure q[303] -> meas[303];
-measure q[304] -> meas[304];
-measure q[305] -> meas[305];
-measure q[306] -> meas[306];
-measure q[307] -> meas[307];
-measure q[308] -> meas[308];
-measure q[309] -> meas[309];
-measure q[310] -> meas[310];
-measure q[311] -> meas[311];
-measure q[312] -> meas[312];
-measure q[313] -> meas[313];
-measure q[314] -> meas[314];
-measure q[315] -> meas[315];
-measure q[316] -> meas[316];
-measure q[317] -> meas[317];
-measure q[318] -> meas[318];
-measure q[319] -> meas[319];
-measure q[320] -> meas[320];
-measure q[321] -> meas[321];
-measure q[322] -> meas[322];
-measure q[323] -> meas[323];
-measure q[324] -> meas[324];
-measure q[325] -> meas[325];
-measure q[326] -> meas[326];
-measure q[327] -> meas[327];
-measure q[328] -> meas[328];
-measure q[329] -> meas[329];
-measure q[330] -> meas[330];
-measure q[331] -> meas[331];
-measure q[332] -> meas[332];
-measure q[333] -> meas[333];
-measure q[334] -> meas[334];
-measure q[335] -> meas[335];
-measure q[336] -> meas[336];
-measure q[337] -> meas[337];
-measure q[338] -> meas[338];
-measure q[339] -> meas[339];
-measure q[340] -> meas[340];
-measure q[341] -> meas[341];
-measure q[342] -> meas[342];
-measure q[343] -> meas[343];
-measure q[344] -> meas[344];
-measure q[345] -> meas[345];
-measure q[346] -> meas[346];
-measure q[347] -> meas[347];
-measure q[348] -> meas[348];
-measure q[349] -> meas[349];
-measure q[350] -> meas[350];
-measure q[351] -> meas[351];
-measure q[352] -> meas[352];
-measure q[353] -> meas[353];
-measure q[354] -> meas[354];
-measure q[355] -> meas[355];
-measure q[356] -> meas[356];
-measure q[357] -> meas[357];
-measure q[358] -> meas[358];
-measure q[359] -> meas[359];
-measure q[360] -> meas[360];
-measure q[361] -> meas[361];
-measure q[362] -> meas[362];
-measure q[363] -> meas[363];
-measure q[364] -> meas[364];
-measure q[365] -> meas[365];
-measure q[366] -> meas[366];
-measure q[367] -> meas[367];
-measure q[368] -> meas[368];
-measure q[369] -> meas[369];
-measure q[370] -> meas[370];
-measure q[371] -> meas[371];
-measure q[372] -> meas[372];
-measure q[373] -> meas[373];
-measure q[374] -> meas[374];
-measure q[375] -> meas[375];
-measure q[376] -> meas[376];
-measure q[377] -> meas[377];
-measure q[378] -> meas[378];
-measure q[379] -> meas[379];
@@ -1,3419 +0,0 @@
-OPENQASM 2.0;
-include "qelib1.inc";
-qreg q[380];
-creg c[380];
-creg meas[380];
-sx q[0];
-rz(pi/4) q[0];
-sx q[0];
-sx q[1];
-rz(0.61547971) q[1];
-sx q[1];
-sx q[2];
-rz(pi/6) q[2];
-sx q[2];
-sx q[3];
-rz(0.46364763) q[3];
-sx q[3];
-sx q[4];
-rz(0.42053433) q[4];
-sx q[4];
-sx q[5];
-rz(0.38759673) q[5];
-sx q[5];
-sx q[6];
-rz(0.36136713) q[6];
-sx q[6];
-sx q[7];
-rz(0.33983693) q[7];
-sx q[7];
-sx q[8];
-rz(0.32175053) q[8];
-sx q[8];
-sx q[9];
-rz(0.30627733) q[9];
-sx q[9];
-sx q[10];
-rz(0.29284273) q[10];
-sx q[10];
-sx q[11];
-rz(0.28103493) q[11];
-sx q[11];
-sx q[12];
-rz(0.27054973) q[12];
-sx q[12];
-sx q[13];
-rz(0.26115743) q[13];
-sx q[13];
-sx q[14];
-rz(0.25268023) q[14];
-sx q[14];
-sx q[15];
-rz(0.24497863) q[15];
-sx q[15];
-sx q[16];
-rz(0.23794113) q[16];
-sx q[16];
-sx q[17];
-rz(0.23147733) q[17];
-sx q[17];
-sx q[18];
-rz(0.22551343) q[18];
-sx q[18];
-sx q[19];
-rz(0.21998803) q[19];
-sx q[19];
-sx q[20];
-rz(0.21484983) q[20];
-sx q[20];
-sx q[21];
-rz(0.21005573) q[21];
-sx q[21];
-sx q[22];
-rz(0.20556893) q[22];
-sx q[22];
-sx q[23];
-rz(0.20135793) q[23];
-sx q[23];
-sx q[24];
-rz(0.19739553) q[24];
-sx q[24];
-sx q[25];
-rz(0.19365833) q[25];
-sx q[25];
-sx q[26];
-rz(0.19012563) q[26];
-sx q[26];
-sx q[27];
-rz(0.18677943) q[27];
-sx q[27];
-sx q[28];
-rz(0.18360403) q[28];
-sx q[28];
-sx q[29];
-rz(0.18058523) q[29];
-sx q[29];
-sx q[30];
-rz(0.17771063) q[30];
-sx q[30];
-sx q[31];
-rz(0.17496903) q[31];
-sx q[31];
-sx q[32];
-rz(0.17235063) q[32];
-sx q[32];
-sx q[33];
-rz(0.16984633) q[33];
-sx q[33];
-sx q[34];
-rz(0.16744813) q[34];
-sx q[34];
-sx q[35];
-rz(0.16514873) q[35];
-sx q[35];
-sx q[36];
-rz(0.16294153) q[36];
-sx q[36];
-sx q[37];
-rz(0.16082053) q[37];
-sx q[37];
-sx q[38];
-rz(0.15878023) q[38];
-sx q[38];
-sx q[39];
-rz(0.15681573) q[39];
-sx q[39];
-sx q[40];
-rz(0.15492233) q[40];
-sx q[40];
-sx q[41];
-rz(0.15309593) q[41];
-sx q[41];
-sx q[42];
-rz(0.15133263) q[42];
-sx q[42];
-sx q[43];
-rz(0.14962893) q[43];
-sx q[43];
-sx q[44];
-rz(0.14798143) q[44];
-sx q[44];
-sx q[45];
-rz(0.14638723) q[45];
-sx q[45];
-sx q[46];
-rz(0.14484353) q[46];
-sx q[46];
-sx q[47];
-rz(0.14334753) q[47];
-sx q[47];
-sx q[48];
-rz(0.14189703) q[48];
-sx q[48];
-sx q[49];
-rz(0.14048973) q[49];
-sx q[49];
-sx q[50];
-rz(0.13912343) q[50];
-sx q[50];
-sx q[51];
-rz(0.13779623) q[51];
-sx q[51];
-sx q[52];
-rz(0.13650633) q[52];
-sx q[52];
-sx q[53];
-rz(0.13525193) q[53];
-sx q[53];
-sx q[54];
-rz(0.13403153) q[54];
-sx q[54];
-sx q[55];
-rz(0.13284363) q[55];
-sx q[55];
-sx q[56];
-rz(0.13168673) q[56];
-sx q[56];
-sx q[57];
-rz(0.13055953) q[57];
-sx q[57];
-sx q[58];
-rz(0.12946073) q[58];
-sx q[58];
-sx q[59];
-rz(0.12838933) q[59];
-sx q[59];
-sx q[60];
-rz(0.12734403) q[60];
-sx q[60];
-sx q[61];
-rz(0.12632383) q[61];
-sx q[61];
-sx q[62];
-rz(0.12532783) q[62];
-sx q[62];
-sx q[63];
-rz(0.12435503) q[63];
-sx q[63];
-sx q[64];
-rz(0.12340443) q[64];
-sx q[64];
-sx q[65];
-rz(0.12247543) q[65];
-sx q[65];
-sx q[66];
-rz(0.12156703) q[66];
-sx q[66];
-sx q[67];
-rz(0.12067853) q[67];
-sx q[67];
-sx q[68];
-rz(0.11980933) q[68];
-sx q[68];
-sx q[69];
-rz(0.11895853) q[69];
-sx q[69];
-sx q[70];
-rz(0.11812563) q[70];
-sx q[70];
-sx q[71];
-rz(0.11731003) q[71];
-sx q[71];
-sx q[72];
-rz(0.11651103) q[72];
-sx q[72];
-sx q[73];
-rz(0.11572823) q[73];
-sx q[73];
-sx q[74];
-rz(0.11496093) q[74];
-sx q[74];
-sx q[75];
-rz(0.11420873) q[75];
-sx q[75];
-sx q[76];
-rz(0.11347103) q[76];
-sx q[76];
-sx q[77];
-rz(0.11274753) q[77];
-sx q[77];
-sx q[78];
-rz(0.11203763) q[78];
-sx q[78];
-sx q[79];
-rz(0.11134103) q[79];
-sx q[79];
-sx q[80];
-rz(0.11065723) q[80];
-sx q[80];
-sx q[81];
-rz(0.10998583) q[81];
-sx q[81];
-sx q[82];
-rz(0.10932663) q[82];
-sx q[82];
-sx q[83];
-rz(0.10867903) q[83];
-sx q[83];
-sx q[84];
-rz(0.10804283) q[84];
-sx q[84];
-sx q[85];
-rz(0.10741773) q[85];
-sx q[85];
-sx q[86];
-rz(0.10680333) q[86];
-sx q[86];
-sx q[87];
-rz(0.10619933) q[87];
-sx q[87];
-sx q[88];
-rz(0.10560543) q[88];
-sx q[88];
-sx q[89];
-rz(0.10502143) q[89];
-sx q[89];
-sx q[90];
-rz(0.10444703) q[90];
-sx q[90];
-sx q[91];
-rz(0.10388193) q[91];
-sx q[91];
-sx q[92];
-rz(0.10332593) q[92];
-sx q[92];
-sx q[93];
-rz(0.10277873) q[93];
-sx q[93];
-sx q[94];
-rz(0.10224013) q[94];
-sx q[94];
-sx q[95];
-rz(0.10170993) q[95];
-sx q[95];
-sx q[96];
-rz(0.10118783) q[96];
-sx q[96];
-sx q[97];
-rz(0.10067373) q[97];
-sx q[97];
-sx q[98];
-rz(0.10016743) q[98];
-sx q[98];
-sx q[99];
-rz(0.099668627) q[99];
-sx q[99];
-sx q[100];
-rz(0.099177227) q[100];
-sx q[100];
-sx q[101];
-rz(0.098693027) q[101];
-sx q[101];
-sx q[102];
-rz(0.098215927) q[102];
-sx q[102];
-sx q[103];
-rz(0.097745627) q[103];
-sx q[103];
-sx q[104];
-rz(0.097281927) q[104];
-sx q[104];
-sx q[105];
-rz(0.096824827) q[105];
-sx q[105];
-sx q[106];
-rz(0.096374127) q[106];
-sx q[106];
-sx q[107];
-rz(0.095929727) q[107];
-sx q[107];
-sx q[108];
-rz(0.095491327) q[108];
-sx q[108];
-sx q[109];
-rz(0.095058927) q[109];
-sx q[109];
-sx q[110];
-rz(0.094632327) q[110];
-sx q[110];
-sx q[111];
-rz(0.094211427) q[111];
-sx q[111];
-sx q[112];
-rz(0.093796027) q[112];
-sx q[112];
-sx q[113];
-rz(0.093386127) q[113];
-sx q[113];
-sx q[114];
-rz(0.092981627) q[114];
-sx q[114];
-sx q[115];
-rz(0.092582227) q[115];
-sx q[115];
-sx q[116];
-rz(0.092188027) q[116];
-sx q[116];
-sx q[117];
-rz(0.091798727) q[117];
-sx q[117];
-sx q[118];
-rz(0.091414327) q[118];
-sx q[118];
-sx q[119];
-rz(0.091034827) q[119];
-sx q[119];
-sx q[120];
-rz(0.090659927) q[120];
-sx q[120];
-sx q[121];
-rz(0.090289627) q[121];
-sx q[121];
-sx q[122];
-rz(0.089923827) q[122];
-sx q[122];
-sx q[123];
-rz(0.089562427) q[123];
-sx q[123];
-sx q[124];
-rz(0.089205327) q[124];
-sx q[124];
-sx q[125];
-rz(0.088852527) q[125];
-sx q[125];
-sx q[126];
-rz(0.088503827) q[126];
-sx q[126];
-sx q[127];
-rz(0.088159227) q[127];
-sx q[127];
-sx q[128];
-rz(0.087818627) q[128];
-sx q[128];
-sx q[129];
-rz(0.087481927) q[129];
-sx q[129];
-sx q[130];
-rz(0.087149127) q[130];
-sx q[130];
-sx q[131];
-rz(0.086820027) q[131];
-sx q[131];
-sx q[132];
-rz(0.086494627) q[132];
-sx q[132];
-sx q[133];
-rz(0.086172927) q[133];
-sx q[133];
-sx q[134];
-rz(0.085854727) q[134];
-sx q[134];
-sx q[135];
-rz(0.085540027) q[135];
-sx q[135];
-sx q[136];
-rz(0.085228827) q[136];
-sx q[136];
-sx q[137];
-rz(0.084920927) q[137];
-sx q[137];
-sx q[138];
-rz(0.084616327) q[138];
-sx q[138];
-sx q[139];
-rz(0.084315027) q[139];
-sx q[139];
-sx q[140];
-rz(0.084016927) q[140];
-sx q[140];
-sx q[141];
-rz(0.083721927) q[141];
-sx q[141];
-sx q[142];
-rz(0.083430127) q[142];
-sx q[142];
-sx q[143];
-rz(0.083141227) q[143];
-sx q[143];
-sx q[144];
-rz(0.082855327) q[144];
-sx q[144];
-sx q[145];
-rz(0.082572427) q[145];
-sx q[145];
-sx q[146];
-rz(0.082292327) q[146];
-sx q[146];
-sx q[147];
-rz(0.082015127) q[147];
-sx q[147];
-sx q[148];
-rz(0.081740627) q[148];
-sx q[148];
-sx q[149];
-rz(0.081468927) q[149];
-sx q[149];
-sx q[150];
-rz(0.081199927) q[150];
-sx q[150];
-sx q[151];
-rz(0.080933527) q[151];
-sx q[151];
-sx q[152];
-rz(0.080669727) q[152];
-sx q[152];
-sx q[153];
-rz(0.080408527) q[153];
-sx q[153];
-sx q[154];
-rz(0.080149827) q[154];
-sx q[154];
-sx q[155];
-rz(0.079893627) q[155];
-sx q[155];
-sx q[156];
-rz(0.079639927) q[156];
-sx q[156];
-sx q[157];
-rz(0.079388527) q[157];
-sx q[157];
-sx q[158];
-rz(0.079139527) q[158];
-sx q[158];
-sx q[159];
-rz(0.078892827) q[159];
-sx q[159];
-sx q[160];
-rz(0.078648427) q[160];
-sx q[160];
-sx q[161];
-rz(0.078406327) q[161];
-sx q[161];
-sx q[162];
-rz(0.078166427) q[162];
-sx q[162];
-sx q[163];
-rz(0.077928727) q[163];
-sx q[163];
-sx q[164];
-rz(0.077693227) q[164];
-sx q[164];
-sx q[165];
-rz(0.077459727) q[165];
-sx q[165];
-sx q[166];
-rz(0.077228427) q[166];
-sx q[166];
-sx q[167];
-rz(0.076999127) q[167];
-sx q[167];
-sx q[168];
-rz(0.076771927) q[168];
-sx q[168];
-sx q[169];
-rz(0.076546627) q[169];
-sx q[169];
-sx q[170];
-rz(0.076323327) q[170];
-sx q[170];
-sx q[171];
-rz(0.076102027) q[171];
-sx q[171];
-sx q[172];
-rz(0.075882627) q[172];
-sx q[172];
-sx q[173];
-rz(0.075665027) q[173];
-sx q[173];
-sx q[174];
-rz(0.075449427) q[174];
-sx q[174];
-sx q[175];
-rz(0.075235527) q[175];
-sx q[175];
-sx q[176];
-rz(0.075023527) q[176];
-sx q[176];
-sx q[177];
-rz(0.074813327) q[177];
-sx q[177];
-sx q[178];
-rz(0.074604827) q[178];
-sx q[178];
-sx q[179];
-rz(0.074398027) q[179];
-sx q[179];
-sx q[180];
-rz(0.074193027) q[180];
-sx q[180];
-sx q[181];
-rz(0.073989627) q[181];
-sx q[181];
-sx q[182];
-rz(0.073787927) q[182];
-sx q[182];
-sx q[183];
-rz(0.073587827) q[183];
-sx q[183];
-sx q[184];
-rz(0.073389427) q[184];
-sx q[184];
-sx q[185];
-rz(0.073192527) q[185];
-sx q[185];
-sx q[186];
-rz(0.072997327) q[186];
-sx q[186];
-sx q[187];
-rz(0.072803627) q[187];
-sx q[187];
-sx q[188];
-rz(0.072611427) q[188];
-sx q[188];
-sx q[189];
-rz(0.072420727) q[189];
-sx q[189];
-sx q[190];
-rz(0.072231627) q[190];
-sx q[190];
-sx q[191];
-rz(0.072043927) q[191];
-sx q[191];
-sx q[192];
-rz(0.071857627) q[192];
-sx q[192];
-sx q[193];
-rz(0.071672827) q[193];
-sx q[193];
-sx q[194];
-rz(0.071489427) q[194];
-sx q[194];
-sx q[195];
-rz(0.071307427) q[195];
-sx q[195];
-sx q[196];
-rz(0.071126827) q[196];
-sx q[196];
-sx q[197];
-rz(0.070947627) q[197];
-sx q[197];
-sx q[198];
-rz(0.070769727) q[198];
-sx q[198];
-sx q[199];
-rz(0.070593227) q[199];
-sx q[199];
-sx q[200];
-rz(0.070417927) q[200];
-sx q[200];
-sx q[201];
-rz(0.070244027) q[201];
-sx q[201];
-sx q[202];
-rz(0.070071327) q[202];
-sx q[202];
-sx q[203];
-rz(0.069899927) q[203];
-sx q[203];
-sx q[204];
-rz(0.069729827) q[204];
-sx q[204];
-sx q[205];
-rz(0.069560927) q[205];
-sx q[205];
-sx q[206];
-rz(0.069393227) q[206];
-sx q[206];
-sx q[207];
-rz(0.069226727) q[207];
-sx q[207];
-sx q[208];
-rz(0.069061427) q[208];
-sx q[208];
-sx q[209];
-rz(0.068897327) q[209];
-sx q[209];
-sx q[210];
-rz(0.068734427) q[210];
-sx q[210];
-sx q[211];
-rz(0.068572627) q[211];
-sx q[211];
-sx q[212];
-rz(0.068411927) q[212];
-sx q[212];
-sx q[213];
-rz(0.068252427) q[213];
-sx q[213];
-sx q[214];
-rz(0.068094027) q[214];
-sx q[214];
-sx q[215];
-rz(0.067936627) q[215];
-sx q[215];
-sx q[216];
-rz(0.067780427) q[216];
-sx q[216];
-sx q[217];
-rz(0.067625227) q[217];
-sx q[217];
-sx q[218];
-rz(0.067471127) q[218];
-sx q[218];
-sx q[219];
-rz(0.067318127) q[219];
-sx q[219];
-sx q[220];
-rz(0.067166127) q[220];
-sx q[220];
-sx q[221];
-rz(0.067015127) q[221];
-sx q[221];
-sx q[222];
-rz(0.066865127) q[222];
-sx q[222];
-sx q[223];
-rz(0.066716127) q[223];
-sx q[223];
-sx q[224];
-rz(0.066568127) q[224];
-sx q[224];
-sx q[225];
-rz(0.066421127) q[225];
-sx q[225];
-sx q[226];
-rz(0.066275127) q[226];
-sx q[226];
-sx q[227];
-rz(0.066130027) q[227];
-sx q[227];
-sx q[228];
-rz(0.065985927) q[228];
-sx q[228];
-sx q[229];
-rz(0.065842727) q[229];
-sx q[229];
-sx q[230];
-rz(0.065700427) q[230];
-sx q[230];
-sx q[231];
-rz(0.065559127) q[231];
-sx q[231];
-sx q[232];
-rz(0.065418727) q[232];
-sx q[232];
-sx q[233];
-rz(0.065279127) q[233];
-sx q[233];
-sx q[234];
-rz(0.065140527) q[234];
-sx q[234];
-sx q[235];
-rz(0.065002727) q[235];
-sx q[235];
-sx q[236];
-rz(0.064865827) q[236];
-sx q[236];
-sx q[237];
-rz(0.064729827) q[237];
-sx q[237];
-sx q[238];
-rz(0.064594627) q[238];
-sx q[238];
-sx q[239];
-rz(0.064460327) q[239];
-sx q[239];
-sx q[240];
-rz(0.064326827) q[240];
-sx q[240];
-sx q[241];
-rz(0.064194127) q[241];
-sx q[241];
-sx q[242];
-rz(0.064062227) q[242];
-sx q[242];
-sx q[243];
-rz(0.063931227) q[243];
-sx q[243];
-sx q[244];
-rz(0.063800927) q[244];
-sx q[244];
-sx q[245];
-rz(0.063671527) q[245];
-sx q[245];
-sx q[246];
-rz(0.063542827) q[246];
-sx q[246];
-sx q[247];
-rz(0.063414927) q[247];
-sx q[247];
-sx q[248];
-rz(0.063287827) q[248];
-sx q[248];
-sx q[249];
-rz(0.063161427) q[249];
-sx q[249];
-sx q[250];
-rz(0.063035827) q[250];
-sx q[250];
-sx q[251];
-rz(0.062910927) q[251];
-sx q[251];
-sx q[252];
-rz(0.062786827) q[252];
-sx q[252];
-sx q[253];
-rz(0.062663427) q[253];
-sx q[253];
-sx q[254];
-rz(0.062540727) q[254];
-sx q[254];
-sx q[255];
-rz(0.062418827) q[255];
-sx q[255];
-sx q[256];
-rz(0.062297527) q[256];
-sx q[256];
-sx q[257];
-rz(0.062177027) q[257];
-sx q[257];
-sx q[258];
-rz(0.062057227) q[258];
-sx q[258];
-sx q[259];
-rz(0.061938027) q[259];
-sx q[259];
-sx q[260];
-rz(0.061819527) q[260];
-sx q[260];
-sx q[261];
-rz(0.061701827) q[261];
-sx q[261];
-sx q[262];
-rz(0.061584627) q[262];
-sx q[262];
-sx q[263];
-rz(0.061468227) q[263];
-sx q[263];
-sx q[264];
-rz(0.061352427) q[264];
-sx q[264];
-sx q[265];
-rz(0.061237227) q[265];
-sx q[265];
-sx q[266];
-rz(0.061122727) q[266];
-sx q[266];
-sx q[267];
-rz(0.061008927) q[267];
-sx q[267];
-sx q[268];
-rz(0.060895727) q[268];
-sx q[268];
-sx q[269];
-rz(0.060783127) q[269];
-sx q[269];
-sx q[270];
-rz(0.060671127) q[270];
-sx q[270];
-sx q[271];
-rz(0.060559727) q[271];
-sx q[271];
-sx q[272];
-rz(0.060449027) q[272];
-sx q[272];
-sx q[273];
-rz(0.060338827) q[273];
-sx q[273];
-sx q[274];
-rz(0.060229327) q[274];
-sx q[274];
-sx q[275];
-rz(0.060120427) q[275];
-sx q[275];
-sx q[276];
-rz(0.060012027) q[276];
-sx q[276];
-sx q[277];
-rz(0.059904227) q[277];
-sx q[277];
-sx q[278];
-rz(0.059797027) q[278];
-sx q[278];
-sx q[279];
-rz(0.059690427) q[279];
-sx q[279];
-sx q[280];
-rz(0.059584427) q[280];
-sx q[280];
-sx q[281];
-rz(0.059478927) q[281];
-sx q[281];
-sx q[282];
-rz(0.059373927) q[282];
-sx q[282];
-sx q[283];
-rz(0.059269627) q[283];
-sx q[283];
-sx q[284];
-rz(0.059165727) q[284];
-sx q[284];
-sx q[285];
-rz(0.059062427) q[285];
-sx q[285];
-sx q[286];
-rz(0.058959727) q[286];
-sx q[286];
-sx q[287];
-rz(0.058857527) q[287];
-sx q[287];
-sx q[288];
-rz(0.058755827) q[288];
-sx q[288];
-sx q[289];
-rz(0.058654627) q[289];
-sx q[289];
-sx q[290];
-rz(0.058554027) q[290];
-sx q[290];
-sx q[291];
-rz(0.058453927) q[291];
-sx q[291];
-sx q[292];
-rz(0.058354327) q[292];
-sx q[292];
-sx q[293];
-rz(0.058255227) q[293];
-sx q[293];
-sx q[294];
-rz(0.058156627) q[294];
-sx q[294];
-sx q[295];
-rz(0.058058527) q[295];
-sx q[295];
-sx q[296];
-rz(0.057960927) q[296];
-sx q[296];
-sx q[297];
-rz(0.057863827) q[297];
-sx q[297];
-sx q[298];
-rz(0.057767127) q[298];
-sx q[298];
-sx q[299];
-rz(0.057671027) q[299];
-sx q[299];
-sx q[300];
-rz(0.057575327) q[300];
-sx q[300];
-sx q[301];
-rz(0.057480127) q[301];
-sx q[301];
-sx q[302];
-rz(0.057385427) q[302];
-sx q[302];
-sx q[303];
-rz(0.057291127) q[303];
-sx q[303];
-sx q[304];
-rz(0.057197427) q[304];
-sx q[304];
-sx q[305];
-rz(0.057104027) q[305];
-sx q[305];
-sx q[306];
-rz(0.057011127) q[306];
-sx q[306];
-sx q[307];
-rz(0.056918727) q[307];
-sx q[307];
-sx q[308];
-rz(0.056826727) q[308];
-sx q[308];
-sx q[309];
-rz(0.056735227) q[309];
-sx q[309];
-sx q[310];
-rz(0.056644127) q[310];
-sx q[310];
-sx q[311];
-rz(0.056553527) q[311];
-sx q[311];
-sx q[312];
-rz(0.056463227) q[312];
-sx q[312];
-sx q[313];
-rz(0.056373427) q[313];
-sx q[313];
-sx q[314];
-rz(0.056284127) q[314];
-sx q[314];
-sx q[315];
-rz(0.056195127) q[315];
-sx q[315];
-sx q[316];
-rz(0.056106627) q[316];
-sx q[316];
-sx q[317];
-rz(0.056018527) q[317];
-sx q[317];
-sx q[318];
-rz(0.055930827) q[318];
-sx q[318];
-sx q[319];
-rz(0.055843627) q[319];
-sx q[319];
-sx q[320];
-rz(0.055756727) q[320];
-sx q[320];
-sx q[321];
-rz(0.055670227) q[321];
-sx q[321];
-sx q[322];
-rz(0.055584127) q[322];
-sx q[322];
-sx q[323];
-rz(0.055498527) q[323];
-sx q[323];
-sx q[324];
-rz(0.055413227) q[324];
-sx q[324];
-sx q[325];
-rz(0.055328327) q[325];
-sx q[325];
-sx q[326];
-rz(0.055243827) q[326];
-sx q[326];
-sx q[327];
-rz(0.055159727) q[327];
-sx q[327];
-sx q[328];
-rz(0.055076027) q[328];
-sx q[328];
-sx q[329];
-rz(0.054992727) q[329];
-sx q[329];
-sx q[330];
-rz(0.054909727) q[330];
-sx q[330];
-sx q[331];
-rz(0.054827127) q[331];
-sx q[331];
-sx q[332];
-rz(0.054744927) q[332];
-sx q[332];
-sx q[333];
-rz(0.054663027) q[333];
-sx q[333];
-sx q[334];
-rz(0.054581527) q[334];
-sx q[334];
-sx q[335];
-rz(0.054500427) q[335];
-sx q[335];
-sx q[336];
-rz(0.054419727) q[336];
-sx q[336];
-sx q[337];
-rz(0.054339327) q[337];
-sx q[337];
-sx q[338];
-rz(0.054259227) q[338];
-sx q[338];
-sx q[339];
-rz(0.054179527) q[339];
-sx q[339];
-sx q[340];
-rz(0.054100227) q[340];
-sx q[340];
-sx q[341];
-rz(0.054021227) q[341];
-sx q[341];
-sx q[342];
-rz(0.053942527) q[342];
-sx q[342];
-sx q[343];
-rz(0.053864227) q[343];
-sx q[343];
-sx q[344];
-rz(0.053786227) q[344];
-sx q[344];
-sx q[345];
-rz(0.053708627) q[345];
-sx q[345];
-sx q[346];
-rz(0.053631327) q[346];
-sx q[346];
-sx q[347];
-rz(0.053554327) q[347];
-sx q[347];
-sx q[348];
-rz(0.053477727) q[348];
-sx q[348];
-sx q[349];
-rz(0.053401427) q[349];
-sx q[349];
-sx q[350];
-rz(0.053325427) q[350];
-sx q[350];
-sx q[351];
-rz(0.053249827) q[351];
-sx q[351];
-sx q[352];
-rz(0.053174427) q[352];
-sx q[352];
-sx q[353];
-rz(0.053099427) q[353];
-sx q[353];
-sx q[354];
-rz(0.053024727) q[354];
-sx q[354];
-sx q[355];
-rz(0.052950327) q[355];
-sx q[355];
-sx q[356];
-rz(0.052876327) q[356];
-sx q[356];
-sx q[357];
-rz(0.052802527) q[357];
-sx q[357];
-sx q[358];
-rz(0.052729027) q[358];
-sx q[358];
-sx q[359];
-rz(0.052655927) q[359];
-sx q[359];
-sx q[360];
-rz(0.052583027) q[360];
-sx q[360];
-sx q[361];
-rz(0.052510527) q[361];
-sx q[361];
-sx q[362];
-rz(0.052438227) q[362];
-sx q[362];
-sx q[363];
-rz(0.052366327) q[363];
-sx q[363];
-sx q[364];
-rz(0.052294627) q[364];
-sx q[364];
-sx q[365];
-rz(0.052223327) q[365];
-sx q[365];
-sx q[366];
-rz(0.052152227) q[366];
-sx q[366];
-sx q[367];
-rz(0.052081427) q[367];
-sx q[367];
-sx q[368];
-rz(0.052010927) q[368];
-sx q[368];
-sx q[369];
-rz(0.051940727) q[369];
-sx q[369];
-sx q[370];
-rz(0.051870827) q[370];
-sx q[370];
-sx q[371];
-rz(0.051801227) q[371];
-sx q[371];
-sx q[372];
-rz(0.051731827) q[372];
-sx q[372];
-sx q[373];
-rz(0.051662727) q[373];
-sx q[373];
-sx q[374];
-rz(0.051593927) q[374];
-sx q[374];
-sx q[375];
-rz(0.051525427) q[375];
-sx q[375];
-sx q[376];
-rz(0.051457127) q[376];
-sx q[376];
-sx q[377];
-rz(0.051389127) q[377];
-sx q[377];
-sx q[378];
-rz(0.051321427) q[378];
-sx q[378];
-x q[379];
-cx q[379],q[378];
-sx q[378];
-rz(0.051321427) q[378];
-sx q[378];
-cx q[378],q[377];
-sx q[377];
-rz(0.051389127) q[377];
-sx q[377];
-cx q[377],q[376];
-sx q[376];
-rz(0.051457127) q[376];
-sx q[376];
-cx q[376],q[375];
-sx q[375];
-rz(0.051525427) q[375];
-sx q[375];
-cx q[375],q[374];
-sx q[374];
-rz(0.051593927) q[374];
-sx q[374];
-cx q[374],q[373];
-sx q[373];
-rz(0.051662727) q[373];
-sx q[373];
-cx q[373],q[372];
-sx q[372];
-rz(0.051731827) q[372];
-sx q[372];
-cx q[372],q[371];
-sx q[371];
-rz(0.051801227) q[371];
-sx q[371];
-cx q[371],q[370];
-sx q[370];
-rz(0.051870827) q[370];
-sx q[370];
-cx q[370],q[369];
-sx q[369];
-rz(0.051940727) q[369];
-sx q[369];
-cx q[369],q[368];
-sx q[368];
-rz(0.052010927) q[368];
-sx q[368];
-cx q[368],q[367];
-sx q[367];
-rz(0.052081427) q[367];
-sx q[367];
-cx q[367],q[366];
-sx q[366];
-rz(0.052152227) q[366];
-sx q[366];
-cx q[366],q[365];
-sx q[365];
-rz(0.052223327) q[365];
-sx q[365];
-cx q[365],q[364];
-sx q[364];
-rz(0.052294627) q[364];
-sx q[364];
-cx q[364],q[363];
-sx q[363];
-rz(0.052366327) q[363];
-sx q[363];
-cx q[363],q[362];
-sx q[362];
-rz(0.052438227) q[362];
-sx q[362];
-cx q[362],q[361];
-sx q[361];
-rz(0.052510527) q[361];
-sx q[361];
-cx q[361],q[360];
-sx q[360];
-rz(0.052583027) q[360];
-sx q[360];
-cx q[360],q[359];
-sx q[359];
-rz(0.052655927) q[359];
-sx q[359];
-cx q[359],q[358];
-sx q[358];
-rz(0.052729027) q[358];
-sx q[358];
-cx q[358],q[357];
-sx q[357];
-rz(0.052802527) q[357];
-sx q[357];
-cx q[357],q[356];
-sx q[356];
-rz(0.052876327) q[356];
-sx q[356];
-cx q[356],q[355];
-sx q[355];
-rz(0.052950327) q[355];
-sx q[355];
-cx q[355],q[354];
-sx q[354];
-rz(0.053024727) q[354];
-sx q[354];
-cx q[354],q[353];
-sx q[353];
-rz(0.053099427) q[353];
-sx q[353];
-cx q[353],q[352];
-sx q[352];
-rz(0.053174427) q[352];
-sx q[352];
-cx q[352],q[351];
-sx q[351];
-rz(0.053249827) q[351];
-sx q[351];
-cx q[351],q[350];
-sx q[350];
-rz(0.053325427) q[350];
-sx q[350];
-cx q[350],q[349];
-sx q[349];
-rz(0.053401427) q[349];
-sx q[349];
-cx q[349],q[348];
-sx q[348];
-rz(0.053477727) q[348];
-sx q[348];
-cx q[348],q[347];
-sx q[347];
-rz(0.053554327) q[347];
-sx q[347];
-cx q[347],q[346];
-sx q[346];
-rz(0.053631327) q[346];
-sx q[346];
-cx q[346],q[345];
-sx q[345];
-rz(0.053708627) q[345];
-sx q[345];
-cx q[345],q[344];
-sx q[344];
-rz(0.053786227) q[344];
-sx q[344];
-cx q[344],q[343];
-sx q[343];
-rz(0.053864227) q[343];
-sx q[343];
-cx q[343],q[342];
-sx q[342];
-rz(0.053942527) q[342];
-sx q[342];
-cx q[342],q[341];
-sx q[341];
-rz(0.054021227) q[341];
-sx q[341];
-cx q[341],q[340];
-sx q[340];
-rz(0.054100227) q[340];
-sx q[340];
-cx q[340],q[339];
-sx q[339];
-rz(0.054179527) q[339];
-sx q[339];
-cx q[339],q[338];
-sx q[338];
-rz(0.054259227) q[338];
-sx q[338];
-cx q[338],q[337];
-sx q[337];
-rz(0.054339327) q[337];
-sx q[337];
-cx q[337],q[336];
-sx q[336];
-rz(0.054419727) q[336];
-sx q[336];
-cx q[336],q[335];
-sx q[335];
-rz(0.054500427) q[335];
-sx q[335];
-cx q[335],q[334];
-sx q[334];
-rz(0.054581527) q[334];
-sx q[334];
-cx q[334],q[333];
-sx q[333];
-rz(0.054663027) q[333];
-sx q[333];
-cx q[333],q[332];
-sx q[332];
-rz(0.054744927) q[332];
-sx q[332];
-cx q[332],q[331];
-sx q[331];
-rz(0.054827127) q[331];
-sx q[331];
-cx q[331],q[330];
-sx q[330];
-rz(0.054909727) q[330];
-sx q[330];
-cx q[330],q[329];
-sx q[329];
-rz(0.054992727) q[329];
-sx q[329];
-cx q[329],q[328];
-sx q[328];
-rz(0.055076027) q[328];
-sx q[328];
-cx q[328],q[327];
-sx q[327];
-rz(0.055159727) q[327];
-sx q[327];
-cx q[327],q[326];
-sx q[326];
-rz(0.055243827) q[326];
-sx q[326];
-cx q[326],q[325];
-sx q[325];
-rz(0.055328327) q[325];
-sx q[325];
-cx q[325],q[324];
-sx q[324];
-rz(0.055413227) q[324];
-sx q[324];
-cx q[324],q[323];
-sx q[323];
-rz(0.055498527) q[323];
-sx q[323];
-cx q[323],q[322];
-sx q[322];
-rz(0.055584127) q[322];
-sx q[322];
-cx q[322],q[321];
-sx q[321];
-rz(0.055670227) q[321];
-sx q[321];
-cx q[321],q[320];
-sx q[320];
-rz(0.055756727) q[320];
-sx q[320];
-cx q[320],q[319];
-sx q[319];
-rz(0.055843627) q[319];
-sx q[319];
-cx q[319],q[318];
-sx q[318];
-rz(0.055930827) q[318];
-sx q[318];
-cx q[318],q[317];
-sx q[317];
-rz(0.056018527) q[317];
-sx q[317];
-cx q[317],q[316];
-sx q[316];
-rz(0.056106627) q[316];
-sx q[316];
-cx q[316],q[315];
-sx q[315];
-rz(0.056195127) q[315];
-sx q[315];
-cx q[315],q[314];
-sx q[314];
-rz(0.056284127) q[314];
-sx q[314];
-cx q[314],q[313];
-sx q[313];
-rz(0.056373427) q[313];
-sx q[313];
-cx q[313],q[312];
-sx q[312];
-rz(0.056463227) q[312];
-sx q[312];
-cx q[312],q[311];
-sx q[311];
-rz(0.056553527) q[311];
-sx q[311];
-cx q[311],q[310];
-sx q[310];
-rz(0.056644127) q[310];
-sx q[310];
-cx q[310],q[309];
-sx q[309];
-rz(0.056735227) q[309];
-sx q[309];
-cx q[309],q[308];
-sx q[308];
-rz(0.056826727) q[308];
-sx q[308];
-cx q[308],q[307];
-sx q[307];
-rz(0.056918727) q[307];
-sx q[307];
-cx q[307],q[306];
-sx q[306];
-rz(0.057011127) q[306];
-sx q[306];
-cx q[306],q[305];
-sx q[305];
-rz(0.057104027) q[305];
-sx q[305];
-cx q[305],q[304];
-sx q[304];
-rz(0.057197427) q[304];
-sx q[304];
-cx q[304],q[303];
-sx q[303];
-rz(0.057291127) q[303];
-sx q[303];
-cx q[303],q[302];
-sx q[302];
-rz(0.057385427) q[302];
-sx q[302];
-cx q[302],q[301];
-sx q[301];
-rz(0.057480127) q[301];
-sx q[301];
-cx q[301],q[300];
-sx q[300];
-rz(0.057575327) q[300];
-sx q[300];
-cx q[300],q[299];
-sx q[299];
-rz(0.057671027) q[299];
-sx q[299];
-cx q[299],q[298];
-sx q[298];
-rz(0.057767127) q[298];
-sx q[298];
-cx q[298],q[297];
-sx q[297];
-rz(0.057863827) q[297];
-sx q[297];
-cx q[297],q[296];
-sx q[296];
-rz(0.057960927) q[296];
-sx q[296];
-cx q[296],q[295];
-sx q[295];
-rz(0.058058527) q[295];
-sx q[295];
-cx q[295],q[294];
-sx q[294];
-rz(0.058156627) q[294];
-sx q[294];
-cx q[294],q[293];
-sx q[293];
-rz(0.058255227) q[293];
-sx q[293];
-cx q[293],q[292];
-sx q[292];
-rz(0.058354327) q[292];
-sx q[292];
-cx q[292],q[291];
-sx q[291];
-rz(0.058453927) q[291];
-sx q[291];
-cx q[291],q[290];
-sx q[290];
-rz(0.058554027) q[290];
-sx q[290];
-cx q[290],q[289];
-sx q[289];
-rz(0.058654627) q[289];
-sx q[289];
-cx q[289],q[288];
-sx q[288];
-rz(0.058755827) q[288];
-sx q[288];
-cx q[288],q[287];
-sx q[287];
-rz(0.058857527) q[287];
-sx q[287];
-cx q[287],q[286];
-sx q[286];
-rz(0.058959727) q[286];
-sx q[286];
-cx q[286],q[285];
-sx q[285];
-rz(0.059062427) q[285];
-sx q[285];
-cx q[285],q[284];
-sx q[284];
-rz(0.059165727) q[284];
-sx q[284];
-cx q[284],q[283];
-sx q[283];
-rz(0.059269627) q[283];
-sx q[283];
-cx q[283],q[282];
-sx q[282];
-rz(0.059373927) q[282];
-sx q[282];
-cx q[282],q[281];
-sx q[281];
-rz(0.059478927) q[281];
-sx q[281];
-cx q[281],q[280];
-sx q[280];
-rz(0.059584427) q[280];
-sx q[280];
-cx q[280],q[279];
-sx q[279];
-rz(0.059690427) q[279];
-sx q[279];
-cx q[279],q[278];
-sx q[278];
-rz(0.059797027) q[278];
-sx q[278];
-cx q[278],q[277];
-sx q[277];
-rz(0.059904227) q[277];
-sx q[277];
-cx q[277],q[276];
-sx q[276];
-rz(0.060012027) q[276];
-sx q[276];
-cx q[276],q[275];
-sx q[275];
-rz(0.060120427) q[275];
-sx q[275];
-cx q[275],q[274];
-sx q[274];
-rz(0.060229327) q[274];
-sx q[274];
-cx q[274],q[273];
-sx q[273];
-rz(0.060338827) q[273];
-sx q[273];
-cx q[273],q[272];
-sx q[272];
-rz(0.060449027) q[272];
-sx q[272];
-cx q[272],q[271];
-sx q[271];
-rz(0.060559727) q[271];
-sx q[271];
-cx q[271],q[270];
-sx q[270];
-rz(0.060671127) q[270];
-sx q[270];
-cx q[270],q[269];
-sx q[269];
-rz(0.060783127) q[269];
-sx q[269];
-cx q[269],q[268];
-sx q[268];
-rz(0.060895727) q[268];
-sx q[268];
-cx q[268],q[267];
-sx q[267];
-rz(0.061008927) q[267];
-sx q[267];
-cx q[267],q[266];
-sx q[266];
-rz(0.061122727) q[266];
-sx q[266];
-cx q[266],q[265];
-sx q[265];
-rz(0.061237227) q[265];
-sx q[265];
-cx q[265],q[264];
-sx q[264];
-rz(0.061352427) q[264];
-sx q[264];
-cx q[264],q[263];
-sx q[263];
-rz(0.061468227) q[263];
-sx q[263];
-cx q[263],q[262];
-sx q[262];
-rz(0.061584627) q[262];
-sx q[262];
-cx q[262],q[261];
-sx q[261];
-rz(0.061701827) q[261];
-sx q[261];
-cx q[261],q[260];
-sx q[260];
-rz(0.061819527) q[260];
-sx q[260];
-cx q[260],q[259];
-sx q[259];
-rz(0.061938027) q[259];
-sx q[259];
-cx q[259],q[258];
-sx q[258];
-rz(0.062057227) q[258];
-sx q[258];
-cx q[258],q[257];
-sx q[257];
-rz(0.062177027) q[257];
-sx q[257];
-cx q[257],q[256];
-sx q[256];
-rz(0.062297527) q[256];
-sx q[256];
-cx q[256],q[255];
-sx q[255];
-rz(0.062418827) q[255];
-sx q[255];
-cx q[255],q[254];
-sx q[254];
-rz(0.062540727) q[254];
-sx q[254];
-cx q[254],q[253];
-sx q[253];
-rz(0.062663427) q[253];
-sx q[253];
-cx q[253],q[252];
-sx q[252];
-rz(0.062786827) q[252];
-sx q[252];
-cx q[252],q[251];
-sx q[251];
-rz(0.062910927) q[251];
-sx q[251];
-cx q[251],q[250];
-sx q[250];
-rz(0.063035827) q[250];
-sx q[250];
-cx q[250],q[249];
-sx q[249];
-rz(0.063161427) q[249];
-sx q[249];
-cx q[249],q[248];
-sx q[248];
-rz(0.063287827) q[248];
-sx q[248];
-cx q[248],q[247];
-sx q[247];
-rz(0.063414927) q[247];
-sx q[247];
-cx q[247],q[246];
-sx q[246];
-rz(0.063542827) q[246];
-sx q[246];
-cx q[246],q[245];
-sx q[245];
-rz(0.063671527) q[245];
-sx q[245];
-cx q[245],q[244];
-sx q[244];
-rz(0.063800927) q[244];
-sx q[244];
-cx q[244],q[243];
-sx q[243];
-rz(0.063931227) q[243];
-sx q[243];
-cx q[243],q[242];
-sx q[242];
-rz(0.064062227) q[242];
-sx q[242];
-cx q[242],q[241];
-sx q[241];
-rz(0.064194127) q[241];
-sx q[241];
-cx q[241],q[240];
-sx q[240];
-rz(0.064326827) q[240];
-sx q[240];
-cx q[240],q[239];
-sx q[239];
-rz(0.064460327) q[239];
-sx q[239];
-cx q[239],q[238];
-sx q[238];
-rz(0.064594627) q[238];
-sx q[238];
-cx q[238],q[237];
-sx q[237];
-rz(0.064729827) q[237];
-sx q[237];
-cx q[237],q[236];
-sx q[236];
-rz(0.064865827) q[236];
-sx q[236];
-cx q[236],q[235];
-sx q[235];
-rz(0.065002727) q[235];
-sx q[235];
-cx q[235],q[234];
-sx q[234];
-rz(0.065140527) q[234];
-sx q[234];
-cx q[234],q[233];
-sx q[233];
-rz(0.065279127) q[233];
-sx q[233];
-cx q[233],q[232];
-sx q[232];
-rz(0.065418727) q[232];
-sx q[232];
-cx q[232],q[231];
-sx q[231];
-rz(0.065559127) q[231];
-sx q[231];
-cx q[231],q[230];
-sx q[230];
-rz(0.065700427) q[230];
-sx q[230];
-cx q[230],q[229];
-sx q[229];
-rz(0.065842727) q[229];
-sx q[229];
-cx q[229],q[228];
-sx q[228];
-rz(0.065985927) q[228];
-sx q[228];
-cx q[228],q[227];
-sx q[227];
-rz(0.066130027) q[227];
-sx q[227];
-cx q[227],q[226];
-sx q[226];
-rz(0.066275127) q[226];
-sx q[226];
-cx q[226],q[225];
-sx q[225];
-rz(0.066421127) q[225];
-sx q[225];
-cx q[225],q[224];
-sx q[224];
-rz(0.066568127) q[224];
-sx q[224];
-cx q[224],q[223];
-sx q[223];
-rz(0.066716127) q[223];
-sx q[223];
-cx q[223],q[222];
-sx q[222];
-rz(0.066865127) q[222];
-sx q[222];
-cx q[222],q[221];
-sx q[221];
-rz(0.067015127) q[221];
-sx q[221];
-cx q[221],q[220];
-sx q[220];
-rz(0.067166127) q[220];
-sx q[220];
-cx q[220],q[219];
-sx q[219];
-rz(0.067318127) q[219];
-sx q[219];
-cx q[219],q[218];
-sx q[218];
-rz(0.067471127) q[218];
-sx q[218];
-cx q[218],q[217];
-sx q[217];
-rz(0.067625227) q[217];
-sx q[217];
-cx q[217],q[216];
-sx q[216];
-rz(0.067780427) q[216];
-sx q[216];
-cx q[216],q[215];
-sx q[215];
-rz(0.067936627) q[215];
-sx q[215];
-cx q[215],q[214];
-sx q[214];
-rz(0.068094027) q[214];
-sx q[214];
-cx q[214],q[213];
-sx q[213];
-rz(0.068252427) q[213];
-sx q[213];
-cx q[213],q[212];
-sx q[212];
-rz(0.068411927) q[212];
-sx q[212];
-cx q[212],q[211];
-sx q[211];
-rz(0.068572627) q[211];
-sx q[211];
-cx q[211],q[210];
-sx q[210];
-rz(0.068734427) q[210];
-sx q[210];
-cx q[210],q[209];
-sx q[209];
-rz(0.068897327) q[209];
-sx q[209];
-cx q[209],q[208];
-sx q[208];
-rz(0.069061427) q[208];
-sx q[208];
-cx q[208],q[207];
-sx q[207];
-rz(0.069226727) q[207];
-sx q[207];
-cx q[207],q[206];
-sx q[206];
-rz(0.069393227) q[206];
-sx q[206];
-cx q[206],q[205];
-sx q[205];
-rz(0.069560927) q[205];
-sx q[205];
-cx q[205],q[204];
-sx q[204];
-rz(0.069729827) q[204];
-sx q[204];
-cx q[204],q[203];
-sx q[203];
-rz(0.069899927) q[203];
-sx q[203];
-cx q[203],q[202];
-sx q[202];
-rz(0.070071327) q[202];
-sx q[202];
-cx q[202],q[201];
-sx q[201];
-rz(0.070244027) q[201];
-sx q[201];
-cx q[201],q[200];
-sx q[200];
-rz(0.070417927) q[200];
-sx q[200];
-cx q[200],q[199];
-sx q[199];
-rz(0.070593227) q[199];
-sx q[199];
-cx q[199],q[198];
-sx q[198];
-rz(0.070769727) q[198];
-sx q[198];
-cx q[198],q[197];
-sx q[197];
-rz(0.070947627) q[197];
-sx q[197];
-cx q[197],q[196];
-sx q[196];
-rz(0.071126827) q[196];
-sx q[196];
-cx q[196],q[195];
-sx q[195];
-rz(0.071307427) q[195];
-sx q[195];
-cx q[195],q[194];
-sx q[194];
-rz(0.071489427) q[194];
-sx q[194];
-cx q[194],q[193];
-sx q[193];
-rz(0.071672827) q[193];
-sx q[193];
-cx q[193],q[192];
-sx q[192];
-rz(0.071857627) q[192];
-sx q[192];
-cx q[192],q[191];
-sx q[191];
-rz(0.072043927) q[191];
-sx q[191];
-cx q[191],q[190];
-sx q[190];
-rz(0.072231627) q[190];
-sx q[190];
-cx q[190],q[189];
-sx q[189];
-rz(0.072420727) q[189];
-sx q[189];
-cx q[189],q[188];
-sx q[188];
-rz(0.072611427) q[188];
-sx q[188];
-cx q[188],q[187];
-sx q[187];
-rz(0.072803627) q[187];
-sx q[187];
-cx q[187],q[186];
-sx q[186];
-rz(0.072997327) q[186];
-sx q[186];
-cx q[186],q[185];
-sx q[185];
-rz(0.073192527) q[185];
-sx q[185];
-cx q[185],q[184];
-sx q[184];
-rz(0.073389427) q[184];
-sx q[184];
-cx q[184],q[183];
-sx q[183];
-rz(0.073587827) q[183];
-sx q[183];
-cx q[183],q[182];
-sx q[182];
-rz(0.073787927) q[182];
-sx q[182];
-cx q[182],q[181];
-sx q[181];
-rz(0.073989627) q[181];
-sx q[181];
-cx q[181],q[180];
-sx q[180];
-rz(0.074193027) q[180];
-sx q[180];
-cx q[180],q[179];
-sx q[179];
-rz(0.074398027) q[179];
-sx q[179];
-cx q[179],q[178];
-sx q[178];
-rz(0.074604827) q[178];
-sx q[178];
-cx q[178],q[177];
-sx q[177];
-rz(0.074813327) q[177];
-sx q[177];
-cx q[177],q[176];
-sx q[176];
-rz(0.075023527) q[176];
-sx q[176];
-cx q[176],q[175];
-sx q[175];
-rz(0.075235527) q[175];
-sx q[175];
-cx q[175],q[174];
-sx q[174];
-rz(0.075449427) q[174];
-sx q[174];
-cx q[174],q[173];
-sx q[173];
-rz(0.075665027) q[173];
-sx q[173];
-cx q[173],q[172];
-sx q[172];
-rz(0.075882627) q[172];
-sx q[172];
-cx q[172],q[171];
-sx q[171];
-rz(0.076102027) q[171];
-sx q[171];
-cx q[171],q[170];
-sx q[170];
-rz(0.076323327) q[170];
-sx q[170];
-cx q[170],q[169];
-sx q[169];
-rz(0.076546627) q[169];
-sx q[169];
-cx q[169],q[168];
-sx q[168];
-rz(0.076771927) q[168];
-sx q[168];
-cx q[168],q[167];
-sx q[167];
-rz(0.076999127) q[167];
-sx q[167];
-cx q[167],q[166];
-sx q[166];
-rz(0.077228427) q[166];
-sx q[166];
-cx q[166],q[165];
-sx q[165];
-rz(0.077459727) q[165];
-sx q[165];
-cx q[165],q[164];
-sx q[164];
-rz(0.077693227) q[164];
-sx q[164];
-cx q[164],q[163];
-sx q[163];
-rz(0.077928727) q[163];
-sx q[163];
-cx q[163],q[162];
-sx q[162];
-rz(0.078166427) q[162];
-sx q[162];
-cx q[162],q[161];
-sx q[161];
-rz(0.078406327) q[161];
-sx q[161];
-cx q[161],q[160];
-sx q[160];
-rz(0.078648427) q[160];
-sx q[160];
-cx q[160],q[159];
-sx q[159];
-rz(0.078892827) q[159];
-sx q[159];
-cx q[159],q[158];
-sx q[158];
-rz(0.079139527) q[158];
-sx q[158];
-cx q[158],q[157];
-sx q[157];
-rz(0.079388527) q[157];
-sx q[157];
-cx q[157],q[156];
-sx q[156];
-rz(0.079639927) q[156];
-sx q[156];
-cx q[156],q[155];
-sx q[155];
-rz(0.079893627) q[155];
-sx q[155];
-cx q[155],q[154];
-sx q[154];
-rz(0.080149827) q[154];
-sx q[154];
-cx q[154],q[153];
-sx q[153];
-rz(0.080408527) q[153];
-sx q[153];
-cx q[153],q[152];
-sx q[152];
-rz(0.080669727) q[152];
-sx q[152];
-cx q[152],q[151];
-sx q[151];
-rz(0.080933527) q[151];
-sx q[151];
-cx q[151],q[150];
-sx q[150];
-rz(0.081199927) q[150];
-sx q[150];
-cx q[150],q[149];
-sx q[149];
-rz(0.081468927) q[149];
-sx q[149];
-cx q[149],q[148];
-sx q[148];
-rz(0.081740627) q[148];
-sx q[148];
-cx q[148],q[147];
-sx q[147];
-rz(0.082015127) q[147];
-sx q[147];
-cx q[147],q[146];
-sx q[146];
-rz(0.082292327) q[146];
-sx q[146];
-cx q[146],q[145];
-sx q[145];
-rz(0.082572427) q[145];
-sx q[145];
-cx q[145],q[144];
-sx q[144];
-rz(0.082855327) q[144];
-sx q[144];
-cx q[144],q[143];
-sx q[143];
-rz(0.083141227) q[143];
-sx q[143];
-cx q[143],q[142];
-sx q[142];
-rz(0.083430127) q[142];
-sx q[142];
-cx q[142],q[141];
-sx q[141];
-rz(0.083721927) q[141];
-sx q[141];
-cx q[141],q[140];
-sx q[140];
-rz(0.084016927) q[140];
-sx q[140];
-cx q[140],q[139];
-sx q[139];
-rz(0.084315027) q[139];
-sx q[139];
-cx q[139],q[138];
-sx q[138];
-rz(0.084616327) q[138];
-sx q[138];
-cx q[138],q[137];
-sx q[137];
-rz(0.084920927) q[137];
-sx q[137];
-cx q[137],q[136];
-sx q[136];
-rz(0.085228827) q[136];
-sx q[136];
-cx q[136],q[135];
-sx q[135];
-rz(0.085540027) q[135];
-sx q[135];
-cx q[135],q[134];
-sx q[134];
-rz(0.085854727) q[134];
-sx q[134];
-cx q[134],q[133];
-sx q[133];
-rz(0.086172927) q[133];
-sx q[133];
-cx q[133],q[132];
-sx q[132];
-rz(0.086494627) q[132];
-sx q[132];
-cx q[132],q[131];
-sx q[131];
-rz(0.086820027) q[131];
-sx q[131];
-cx q[131],q[130];
-sx q[130];
-rz(0.087149127) q[130];
-sx q[130];
-cx q[130],q[129];
-sx q[129];
-rz(0.087481927) q[129];
-sx q[129];
-cx q[129],q[128];
-sx q[128];
-rz(0.087818627) q[128];
-sx q[128];
-cx q[128],q[127];
-sx q[127];
-rz(0.088159227) q[127];
-sx q[127];
-cx q[127],q[126];
-sx q[126];
-rz(0.088503827) q[126];
-sx q[126];
-cx q[126],q[125];
-sx q[125];
-rz(0.088852527) q[125];
-sx q[125];
-cx q[125],q[124];
-sx q[124];
-rz(0.089205327) q[124];
-sx q[124];
-cx q[124],q[123];
-sx q[123];
-rz(0.089562427) q[123];
-sx q[123];
-cx q[123],q[122];
-sx q[122];
-rz(0.089923827) q[122];
-sx q[122];
-cx q[122],q[121];
-sx q[121];
-rz(0.090289627) q[121];
-sx q[121];
-cx q[121],q[120];
-sx q[120];
-rz(0.090659927) q[120];
-sx q[120];
-cx q[120],q[119];
-sx q[119];
-rz(0.091034827) q[119];
-sx q[119];
-cx q[119],q[118];
-sx q[118];
-rz(0.091414327) q[118];
-sx q[118];
-cx q[118],q[117];
-sx q[117];
-rz(0.091798727) q[117];
-sx q[117];
-cx q[117],q[116];
-sx q[116];
-rz(0.092188027) q[116];
-sx q[116];
-cx q[116],q[115];
-sx q[115];
-rz(0.092582227) q[115];
-sx q[115];
-cx q[115],q[114];
-sx q[114];
-rz(0.092981627) q[114];
-sx q[114];
-cx q[114],q[113];
-sx q[113];
-rz(0.093386127) q[113];
-sx q[113];
-cx q[113],q[112];
-sx q[112];
-rz(0.093796027) q[112];
-sx q[112];
-cx q[112],q[111];
-sx q[111];
-rz(0.094211427) q[111];
-sx q[111];
-cx q[111],q[110];
-sx q[110];
-rz(0.094632327) q[110];
-sx q[110];
-cx q[110],q[109];
-sx q[109];
-rz(0.095058927) q[109];
-sx q[109];
-cx q[109],q[108];
-sx q[108];
-rz(0.095491327) q[108];
-sx q[108];
-cx q[108],q[107];
-sx q[107];
-rz(0.095929727) q[107];
-sx q[107];
-cx q[107],q[106];
-sx q[106];
-rz(0.096374127) q[106];
-sx q[106];
-cx q[106],q[105];
-sx q[105];
-rz(0.096824827) q[105];
-sx q[105];
-cx q[105],q[104];
-sx q[104];
-rz(0.097281927) q[104];
-sx q[104];
-cx q[104],q[103];
-sx q[103];
-rz(0.097745627) q[103];
-sx q[103];
-cx q[103],q[102];
-sx q[102];
-rz(0.098215927) q[102];
-sx q[102];
-cx q[102],q[101];
-sx q[101];
-rz(0.098693027) q[101];
-sx q[101];
-cx q[101],q[100];
-sx q[100];
-rz(0.099177227) q[100];
-sx q[100];
-cx q[100],q[99];
-cx q[378],q[379];
-cx q[377],q[378];
-cx q[376],q[377];
-cx q[375],q[376];
-cx q[374],q[375];
-cx q[373],q[374];
-cx q[372],q[373];
-cx q[371],q[372];
-cx q[370],q[371];
-cx q[369],q[370];
-cx q[368],q[369];
-cx q[367],q[368];
-cx q[366],q[367];
-cx q[365],q[366];
-cx q[364],q[365];
-cx q[363],q[364];
-cx q[362],q[363];
-cx q[361],q[362];
-cx q[360],q[361];
-cx q[359],q[360];
-cx q[358],q[359];
-cx q[357],q[358];
-cx q[356],q[357];
-cx q[355],q[356];
-cx q[354],q[355];
-cx q[353],q[354];
-cx q[352],q[353];
-cx q[351],q[352];
-cx q[350],q[351];
-cx q[349],q[350];
-cx q[348],q[349];
-cx q[347],q[348];
-cx q[346],q[347];
-cx q[345],q[346];
-cx q[344],q[345];
-cx q[343],q[344];
-cx q[342],q[343];
-cx q[341],q[342];
-cx q[340],q[341];
-cx q[339],q[340];
-cx q[338],q[339];
-cx q[337],q[338];
-cx q[336],q[337];
-cx q[335],q[336];
-cx q[334],q[335];
-cx q[333],q[334];
-cx q[332],q[333];
-cx q[331],q[332];
-cx q[330],q[331];
-cx q[329],q[330];
-cx q[328],q[329];
-cx q[327],q[328];
-cx q[326],q[327];
-cx q[325],q[326];
-cx q[324],q[325];
-cx q[323],q[324];
-cx q[322],q[323];
-cx q[321],q[322];
-cx q[320],q[321];
-cx q[319],q[320];
-cx q[318],q[319];
-cx q[317],q[318];
-cx q[316],q[317];
-cx q[315],q[316];
-cx q[314],q[315];
-cx q[313],q[314];
-cx q[312],q[313];
-cx q[311],q[312];
-cx q[310],q[311];
-cx q[309],q[310];
-cx q[308],q[309];
-cx q[307],q[308];
-cx q[306],q[307];
-cx q[305],q[306];
-cx q[304],q[305];
-cx q[303],q[304];
-cx q[302],q[303];
-cx q[301],q[302];
-cx q[300],q[301];
-cx q[299],q[300];
-cx q[298],q[299];
-cx q[297],q[298];
-cx q[296],q[297];
-cx q[295],q[296];
-cx q[294],q[295];
-cx q[293],q[294];
-cx q[292],q[293];
-cx q[291],q[292];
-cx q[290],q[291];
-cx q[289],q[290];
-cx q[288],q[289];
-cx q[287],q[288];
-cx q[286],q[287];
-cx q[285],q[286];
-cx q[284],q[285];
-cx q[283],q[284];
-cx q[282],q[283];
-cx q[281],q[282];
-cx q[280],q[281];
-cx q[279],q[280];
-cx q[278],q[279];
-cx q[277],q[278];
-cx q[276],q[277];
-cx q[275],q[276];
-cx q[274],q[275];
-cx q[273],q[274];
-cx q[272],q[273];
-cx q[271],q[272];
-cx q[270],q[271];
-cx q[269],q[270];
-cx q[268],q[269];
-cx q[267],q[268];
-cx q[266],q[267];
-cx q[265],q[266];
-cx q[264],q[265];
-cx q[263],q[264];
-cx q[262],q[263];
-cx q[261],q[262];
-cx q[260],q[261];
-cx q[259],q[260];
-cx q[258],q[259];
-cx q[257],q[258];
-cx q[256],q[257];
-cx q[255],q[256];
-cx q[254],q[255];
-cx q[253],q[254];
-cx q[252],q[253];
-cx q[251],q[252];
-cx q[250],q[251];
-cx q[249],q[250];
-cx q[248],q[249];
-cx q[247],q[248];
-cx q[246],q[247];
-cx q[245],q[246];
-cx q[244],q[245];
-cx q[243],q[244];
-cx q[242],q[243];
-cx q[241],q[242];
-cx q[240],q[241];
-cx q[239],q[240];
-cx q[238],q[239];
-cx q[237],q[238];
-cx q[236],q[237];
-cx q[235],q[236];
-cx q[234],q[235];
-cx q[233],q[234];
-cx q[232],q[233];
-cx q[231],q[232];
-cx q[230],q[231];
-cx q[229],q[230];
-cx q[228],q[229];
-cx q[227],q[228];
-cx q[226],q[227];
-cx q[225],q[226];
-cx q[224],q[225];
-cx q[223],q[224];
-cx q[222],q[223];
-cx q[221],q[222];
-cx q[220],q[221];
-cx q[219],q[220];
-cx q[218],q[219];
-cx q[217],q[218];
-cx q[216],q[217];
-cx q[215],q[216];
-cx q[214],q[215];
-cx q[213],q[214];
-cx q[212],q[213];
-cx q[211],q[212];
-cx q[210],q[211];
-cx q[209],q[210];
-cx q[208],q[209];
-cx q[207],q[208];
-cx q[206],q[207];
-cx q[205],q[206];
-cx q[204],q[205];
-cx q[203],q[204];
-cx q[202],q[203];
-cx q[201],q[202];
-cx q[200],q[201];
-cx q[199],q[200];
-cx q[198],q[199];
-cx q[197],q[198];
-cx q[196],q[197];
-cx q[195],q[196];
-cx q[194],q[195];
-cx q[193],q[194];
-cx q[192],q[193];
-cx q[191],q[192];
-cx q[190],q[191];
-cx q[189],q[190];
-cx q[188],q[189];
-cx q[187],q[188];
-cx q[186],q[187];
-cx q[185],q[186];
-cx q[184],q[185];
-cx q[183],q[184];
-cx q[182],q[183];
-cx q[181],q[182];
-cx q[180],q[181];
-cx q[179],q[180];
-cx q[178],q[179];
-cx q[177],q[178];
-cx q[176],q[177];
-cx q[175],q[176];
-cx q[174],q[175];
-cx q[173],q[174];
-cx q[172],q[173];
-cx q[171],q[172];
-cx q[170],q[171];
-cx q[169],q[170];
-cx q[168],q[169];
-cx q[167],q[168];
-cx q[166],q[167];
-cx q[165],q[166];
-cx q[164],q[165];
-cx q[163],q[164];
-cx q[162],q[163];
-cx q[161],q[162];
-cx q[160],q[161];
-cx q[159],q[160];
-cx q[158],q[159];
-cx q[157],q[158];
-cx q[156],q[157];
-cx q[155],q[156];
-cx q[154],q[155];
-cx q[153],q[154];
-cx q[152],q[153];
-cx q[151],q[152];
-cx q[150],q[151];
-cx q[149],q[150];
-cx q[148],q[149];
-cx q[147],q[148];
-cx q[146],q[147];
-cx q[145],q[146];
-cx q[144],q[145];
-cx q[143],q[144];
-cx q[142],q[143];
-cx q[141],q[142];
-cx q[140],q[141];
-cx q[139],q[140];
-cx q[138],q[139];
-cx q[137],q[138];
-cx q[136],q[137];
-cx q[135],q[136];
-cx q[134],q[135];
-cx q[133],q[134];
-cx q[132],q[133];
-cx q[131],q[132];
-cx q[130],q[131];
-cx q[129],q[130];
-cx q[128],q[129];
-cx q[127],q[128];
-cx q[126],q[127];
-cx q[125],q[126];
-cx q[124],q[125];
-cx q[123],q[124];
-cx q[122],q[123];
-cx q[121],q[122];
-cx q[120],q[121];
-cx q[119],q[120];
-cx q[118],q[119];
-cx q[117],q[118];
-cx q[116],q[117];
-cx q[115],q[116];
-cx q[114],q[115];
-cx q[113],q[114];
-cx q[112],q[113];
-cx q[111],q[112];
-cx q[110],q[111];
-cx q[109],q[110];
-cx q[108],q[109];
-cx q[107],q[108];
-cx q[106],q[107];
-cx q[105],q[106];
-cx q[104],q[105];
-cx q[103],q[104];
-cx q[102],q[103];
-cx q[101],q[102];
-cx q[100],q[101];
-sx q[99];
-rz(0.099668627) q[99];
-sx q[99];
-cx q[99],q[98];
-sx q[98];
-rz(0.10016743) q[98];
-sx q[98];
-cx q[98],q[97];
-sx q[97];
-rz(0.10067373) q[97];
-sx q[97];
-cx q[97],q[96];
-sx q[96];
-rz(0.10118783) q[96];
-sx q[96];
-cx q[96],q[95];
-sx q[95];
-rz(0.10170993) q[95];
-sx q[95];
-cx q[95],q[94];
-sx q[94];
-rz(0.10224013) q[94];
-sx q[94];
-cx q[94],q[93];
-sx q[93];
-rz(0.10277873) q[93];
-sx q[93];
-cx q[93],q[92];
-sx q[92];
-rz(0.10332593) q[92];
-sx q[92];
-cx q[92],q[91];
-sx q[91];
-rz(0.10388193) q[91];
-sx q[91];
-cx q[91],q[90];
-sx q[90];
-rz(0.10444703) q[90];
-sx q[90];
-cx q[90],q[89];
-sx q[89];
-rz(0.10502143) q[89];
-sx q[89];
-cx q[89],q[88];
-sx q[88];
-rz(0.10560543) q[88];
-sx q[88];
-cx q[88],q[87];
-sx q[87];
-rz(0.10619933) q[87];
-sx q[87];
-cx q[87],q[86];
-sx q[86];
-rz(0.10680333) q[86];
-sx q[86];
-cx q[86],q[85];
-sx q[85];
-rz(0.10741773) q[85];
-sx q[85];
-cx q[85],q[84];
-sx q[84];
-rz(0.10804283) q[84];
-sx q[84];
-cx q[84],q[83];
-sx q[83];
-rz(0.10867903) q[83];
-sx q[83];
-cx q[83],q[82];
-sx q[82];
-rz(0.10932663) q[82];
-sx q[82];
-cx q[82],q[81];
-sx q[81];
-rz(0.10998583) q[81];
-sx q[81];
-cx q[81],q[80];
-sx q[80];
-rz(0.11065723) q[80];
-sx q[80];
-cx q[80],q[79];
-sx q[79];
-rz(0.11134103) q[79];
-sx q[79];
-cx q[79],q[78];
-sx q[78];
-rz(0.11203763) q[78];
-sx q[78];
-cx q[78],q[77];
-sx q[77];
-rz(0.11274753) q[77];
-sx q[77];
-cx q[77],q[76];
-sx q[76];
-rz(0.11347103) q[76];
-sx q[76];
-cx q[76],q[75];
-sx q[75];
-rz(0.11420873) q[75];
-sx q[75];
-cx q[75],q[74];
-sx q[74];
-rz(0.11496093) q[74];
-sx q[74];
-cx q[74],q[73];
-sx q[73];
-rz(0.11572823) q[73];
-sx q[73];
-cx q[73],q[72];
-sx q[72];
-rz(0.11651103) q[72];
-sx q[72];
-cx q[72],q[71];
-sx q[71];
-rz(0.11731003) q[71];
-sx q[71];
-cx q[71],q[70];
-sx q[70];
-rz(0.11812563) q[70];
-sx q[70];
-cx q[70],q[69];
-sx q[69];
-rz(0.11895853) q[69];
-sx q[69];
-cx q[69],q[68];
-sx q[68];
-rz(0.11980933) q[68];
-sx q[68];
-cx q[68],q[67];
-sx q[67];
-rz(0.12067853) q[67];
-sx q[67];
-cx q[67],q[66];
-sx q[66];
-rz(0.12156703) q[66];
-sx q[66];
-cx q[66],q[65];
-sx q[65];
-rz(0.12247543) q[65];
-sx q[65];
-cx q[65],q[64];
-sx q[64];
-rz(0.12340443) q[64];
-sx q[64];
-cx q[64],q[63];
-sx q[63];
-rz(0.12435503) q[63];
-sx q[63];
-cx q[63],q[62];
-sx q[62];
-rz(0.12532783) q[62];
-sx q[62];
-cx q[62],q[61];
-sx q[61];
-rz(0.12632383) q[61];
-sx q[61];
-cx q[61],q[60];
-sx q[60];
-rz(0.12734403) q[60];
-sx q[60];
-cx q[60],q[59];
-sx q[59];
-rz(0.12838933) q[59];
-sx q[59];
-cx q[59],q[58];
-sx q[58];
-rz(0.12946073) q[58];
-sx q[58];
-cx q[58],q[57];
-sx q[57];
-rz(0.13055953) q[57];
-sx q[57];
-cx q[57],q[56];
-sx q[56];
-rz(0.13168673) q[56];
-sx q[56];
-cx q[56],q[55];
-sx q[55];
-rz(0.13284363) q[55];
-sx q[55];
-cx q[55],q[54];
-sx q[54];
-rz(0.13403153) q[54];
-sx q[54];
-cx q[54],q[53];
-sx q[53];
-rz(0.13525193) q[53];
-sx q[53];
-cx q[53],q[52];
-sx q[52];
-rz(0.13650633) q[52];
-sx q[52];
-cx q[52],q[51];
-sx q[51];
-rz(0.13779623) q[51];
-sx q[51];
-cx q[51],q[50];
-sx q[50];
-rz(0.13912343) q[50];
-sx q[50];
-cx q[50],q[49];
-sx q[49];
-rz(0.14048973) q[49];
-sx q[49];
-cx q[49],q[48];
-sx q[48];
-rz(0.14189703) q[48];
-sx q[48];
-cx q[48],q[47];
-sx q[47];
-rz(0.14334753) q[47];
-sx q[47];
-cx q[47],q[46];
-sx q[46];
-rz(0.14484353) q[46];
-sx q[46];
-cx q[46],q[45];
-sx q[45];
-rz(0.14638723) q[45];
-sx q[45];
-cx q[45],q[44];
-sx q[44];
-rz(0.14798143) q[44];
-sx q[44];
-cx q[44],q[43];
-sx q[43];
-rz(0.14962893) q[43];
-sx q[43];
-cx q[43],q[42];
-sx q[42];
-rz(0.15133263) q[42];
-sx q[42];
-cx q[42],q[41];
-sx q[41];
-rz(0.15309593) q[41];
-sx q[41];
-cx q[41],q[40];
-sx q[40];
-rz(0.15492233) q[40];
-sx q[40];
-cx q[40],q[39];
-sx q[39];
-rz(0.15681573) q[39];
-sx q[39];
-cx q[39],q[38];
-sx q[38];
-rz(0.15878023) q[38];
-sx q[38];
-cx q[38],q[37];
-sx q[37];
-rz(0.16082053) q[37];
-sx q[37];
-cx q[37],q[36];
-sx q[36];
-rz(0.16294153) q[36];
-sx q[36];
-cx q[36],q[35];
-sx q[35];
-rz(0.16514873) q[35];
-sx q[35];
-cx q[35],q[34];
-sx q[34];
-rz(0.16744813) q[34];
-sx q[34];
-cx q[34],q[33];
-sx q[33];
-rz(0.16984633) q[33];
-sx q[33];
-cx q[33],q[32];
-sx q[32];
-rz(0.17235063) q[32];
-sx q[32];
-cx q[32],q[31];
-sx q[31];
-rz(0.17496903) q[31];
-sx q[31];
-cx q[31],q[30];
-sx q[30];
-rz(0.17771063) q[30];
-sx q[30];
-cx q[30],q[29];
-sx q[29];
-rz(0.18058523) q[29];
-sx q[29];
-cx q[29],q[28];
-sx q[28];
-rz(0.18360403) q[28];
-sx q[28];
-cx q[28],q[27];
-sx q[27];
-rz(0.18677943) q[27];
-sx q[27];
-cx q[27],q[26];
-sx q[26];
-rz(0.19012563) q[26];
-sx q[26];
-cx q[26],q[25];
-sx q[25];
-rz(0.19365833) q[25];
-sx q[25];
-cx q[25],q[24];
-sx q[24];
-rz(0.19739553) q[24];
-sx q[24];
-cx q[24],q[23];
-sx q[23];
-rz(0.20135793) q[23];
-sx q[23];
-cx q[23],q[22];
-sx q[22];
-rz(0.20556893) q[22];
-sx q[22];
-cx q[22],q[21];
-sx q[21];
-rz(0.21005573) q[21];
-sx q[21];
-cx q[21],q[20];
-sx q[20];
-rz(0.21484983) q[20];
-sx q[20];
-cx q[20],q[19];
-sx q[19];
-rz(0.21998803) q[19];
-sx q[19];
-cx q[19],q[18];
-sx q[18];
-rz(0.22551343) q[18];
-sx q[18];
-cx q[18],q[17];
-sx q[17];
-rz(0.23147733) q[17];
-sx q[17];
-cx q[17],q[16];
-sx q[16];
-rz(0.23794113) q[16];
-sx q[16];
-cx q[16],q[15];
-sx q[15];
-rz(0.24497863) q[15];
-sx q[15];
-cx q[15],q[14];
-sx q[14];
-rz(0.25268023) q[14];
-sx q[14];
-cx q[14],q[13];
-sx q[13];
-rz(0.26115743) q[13];
-sx q[13];
-cx q[13],q[12];
-sx q[12];
-rz(0.27054973) q[12];
-sx q[12];
-cx q[12],q[11];
-sx q[11];
-rz(0.28103493) q[11];
-sx q[11];
-cx q[11],q[10];
-sx q[10];
-rz(0.29284273) q[10];
-sx q[10];
-cx q[10],q[9];
-sx q[9];
-rz(0.30627733) q[9];
-sx q[9];
-cx q[9],q[8];
-sx q[8];
-rz(0.32175053) q[8];
-sx q[8];
-cx q[8],q[7];
-sx q[7];
-rz(0.33983693) q[7];
-sx q[7];
-cx q[7],q[6];
-sx q[6];
-rz(0.36136713) q[6];
-sx q[6];
-cx q[6],q[5];
-sx q[5];
-rz(0.38759673) q[5];
-sx q[5];
-cx q[5],q[4];
-sx q[4];
-rz(0.42053433) q[4];
-sx q[4];
-cx q[4],q[3];
-sx q[3];
-rz(0.46364763) q[3];
-sx q[3];
-cx q[3],q[2];
-sx q[2];
-rz(pi/6) q[2];
-sx q[2];
-cx q[2],q[1];
-sx q[1];
-rz(0.61547971) q[1];
-sx q[1];
-cx q[1],q[0];
-sx q[0];
-rz(pi/4) q[0];
-sx q[0];
-cx q[99],q[100];
-cx q[98],q[99];
-cx q[97],q[98];
-cx q[96],q[97];
-cx q[95],q[96];
-cx q[94],q[95];
-cx q[93],q[94];
-cx q[92],q[93];
-cx q[91],q[92];
-cx q[90],q[91];
-cx q[89],q[90];
-cx q[88],q[89];
-cx q[87],q[88];
-cx q[86],q[87];
-cx q[85],q[86];
-cx q[84],q[85];
-cx q[83],q[84];
-cx q[82],q[83];
-cx q[81],q[82];
-cx q[80],q[81];
-cx q[79],q[80];
-cx q[78],q[79];
-cx q[77],q[78];
-cx q[76],q[77];
-cx q[75],q[76];
-cx q[74],q[75];
-cx q[73],q[74];
-cx q[72],q[73];
-cx q[71],q[72];
-cx q[70],q[71];
-cx q[69],q[70];
-cx q[68],q[69];
-cx q[67],q[68];
-cx q[66],q[67];
-cx q[65],q[66];
-cx q[64],q[65];
-cx q[63],q[64];
-cx q[62],q[63];
-cx q[61],q[62];
-cx q[60],q[61];
-cx q[59],q[60];
-cx q[58],q[59];
-cx q[57],q[58];
-cx q[56],q[57];
-cx q[55],q[56];
-cx q[54],q[55];
-cx q[53],q[54];
-cx q[52],q[53];
-cx q[51],q[52];
-cx q[50],q[51];
-cx q[49],q[50];
-cx q[48],q[49];
-cx q[47],q[48];
-cx q[46],q[47];
-cx q[45],q[46];
-cx q[44],q[45];
-cx q[43],q[44];
-cx q[42],q[43];
-cx q[41],q[42];
-cx q[40],q[41];
-cx q[39],q[40];
-cx q[38],q[39];
-cx q[37],q[38];
-cx q[36],q[37];
-cx q[35],q[36];
-cx q[34],q[35];
-cx q[33],q[34];
-cx q[32],q[33];
-cx q[31],q[32];
-cx q[30],q[31];
-cx q[29],q[30];
-cx q[28],q[29];
-cx q[27],q[28];
-cx q[26],q[27];
-cx q[25],q[26];
-cx q[24],q[25];
-cx q[23],q[24];
-cx q[22],q[23];
-cx q[21],q[22];
-cx q[20],q[21];
-cx q[19],q[20];
-cx q[18],q[19];
-cx q[17],q[18];
-cx q[16],q[17];
-cx q[15],q[16];
-cx q[14],q[15];
-cx q[13],q[14];
-cx q[12],q[13];
-cx q[11],q[12];
-cx q[10],q[11];
-cx q[9],q[10];
-cx q[8],q[9];
-cx q[7],q[8];
-cx q[6],q[7];
-cx q[5],q[6];
-cx q[4],q[5];
-cx q[3],q[4];
-cx q[2],q[3];
-cx q[1],q[2];
-cx q[0],q[1];
-barrier q[0],q[1],q[2],q[3],q[4],q[5],q[6],q[7],q[8],q[9],q[10],q[11],q[12],q[13],q[14],q[15],q[16],q[17],q[18],q[19],q[20],q[21],q[22],q[23],q[24],q[25],q[26],q[27],q[28],q[29],q[30],q[31],q[32],q[33],q[34],q[35],q[36],q[37],q[38],q[39],q[40],q[41],q[42],q[43],q[44],q[45],q[46],q[47],q[48],q[49],q[50],q[51],q[52],q[53],q[54],q[55],q[56],q[57],q[58],q[59],q[60],q[61],q[62],q[63],q[64],q[65],q[66],q[67],q[68],q[69],q[70],q[71],q[72],q[73],q[74],q[75],q[76],q[77],q[78],q[79],q[80],q[81],q[82],q[83],q[84],q[85],q[86],q[87],q[88],q[89],q[90],q[91],q[92],q[93],q[94],q[95],q[96],q[97],q[98],q[99],q[100],q[101],q[102],q[103],q[104],q[105],q[106],q[107],q[108],q[109],q[110],q[111],q[112],q[113],q[114],q[115],q[116],q[117],q[118],q[119],q[120],q[121],q[122],q[123],q[124],q[125],q[126],q[127],q[128],q[129],q[130],q[131],q[132],q[133],q[134],q[135],q[136],q[137],q[138],q[139],q[140],q[141],q[142],q[143],q[144],q[145],q[146],q[147],q[148],q[149],q[150],q[151],q[152],q[153],q[154],q[155],q[156],q[157],q[158],q[159],q[160],q[161],q[162],q[163],q[164],q[165],q[166],q[167],q[168],q[169],q[170],q[171],q[172],q[173],q[174],q[175],q[176],q[177],q[178],q[179],q[180],q[181],q[182],q[183],q[184],q[185],q[186],q[187],q[188],q[189],q[190],q[191],q[192],q[193],q[194],q[195],q[196],q[197],q[198],q[199],q[200],q[201],q[202],q[203],q[204],q[205],q[206],q[207],q[208],q[209],q[210],q[211],q[212],q[213],q[214],q[215],q[216],q[217],q[218],q[219],q[220],q[221],q[222],q[223],q[224],q[225],q[226],q[227],q[228],q[229],q[230],q[231],q[232],q[233],q[234],q[235],q[236],q[237],q[238],q[239],q[240],q[241],q[242],q[243],q[244],q[245],q[246],q[247],q[248],q[249],q[250],q[251],q[252],q[253],q[254],q[255],q[256],q[257],q[258],q[259],q[260],q[261],q[262],q[263],q[264],q[265],q[266],q[267],q[268],q[269],q[270],q[271],q[272],q[273],q[274],q[275],q[276],q[277],q[278],q[279],q[280],q[281],q[282],q[283],q[284],q[285],q[286],q[287],q[288],q[289],q[290],q[291],q[292],q[293],q[294],q[295],q[296],q[297],q[298],q[299],q[300],q[301],q[302],q[303],q[304],q[305],q[306],q[307],q[308],q[309],q[310],q[311],q[312],q[313],q[314],q[315],q[316],q[317],q[318],q[319],q[320],q[321],q[322],q[323],q[324],q[325],q[326],q[327],q[328],q[329],q[330],q[331],q[332],q[333],q[334],q[335],q[336],q[337],q[338],q[339],q[340],q[341],q[342],q[343],q[344],q[345],q[346],q[347],q[348],q[349],q[350],q[351],q[352],q[353],q[354],q[355],q[356],q[357],q[358],q[359],q[360],q[361],q[362],q[363],q[364],q[365],q[366],q[367],q[368],q[369],q[370],q[371],q[372],q[373],q[374],q[375],q[376],q[377],q[378],q[379];
-measure q[0] -> meas[0];
-measure q[1] -> meas[1];
-measure q[2] -> meas[2];
-measure q[3] -> meas[3];
-measure q[4] -> meas[4];
-measure q[5] -> meas[5];
-measure q[6] -> meas[6];
-measure q[7] -> meas[7];
-measure q[8] -> meas[8];
-measure q[9] -> meas[9];
-measure q[10] -> meas[10];
-measure q[11] -> meas[11];
-measure q[12] -> meas[12];
-measure q[13] -> meas[13];
-measure q[14] -> meas[14];
-measure q[15] -> meas[15];
-measure q[16] -> meas[16];
-measure q[17] -> meas[17];
-measure q[18] -> meas[18];
-measure q[19] -> meas[19];
-measure q[20] -> meas[20];
-measure q[21] -> meas[21];
-measure q[22] -> meas[22];
-measure q[23] -> meas[23];
-measure q[24] -> meas[24];
-measure q[25] -> meas[25];
-measure q[26] -> meas[26];
-measure q[27] -> meas[27];
-measure q[28] -> meas[28];
-measure q[29] -> meas[29];
-measure q[30] -> meas[30];
-measure q[31] -> meas[31];
-measure q[32] -> meas[32];
-measure q[33] -> meas[33];
-measure q[34] -> meas[34];
-measure q[35] -> meas[35];
-measure q[36] -> meas[36];
-measure q[37] -> meas[37];
-measure q[38] -> meas[38];
-measure q[39] -> meas[39];
-measure q[40] -> meas[40];
-measure q[41] -> meas[41];
-measure q[42] -> meas[42];
-measure q[43] -> meas[43];
-measure q[44] -> meas[44];
-measure q[45] -> meas[45];
-measure q[46] -> meas[46];
-measure q[47] -> meas[47];
-measure q[48] -> meas[48];
-measure q[49] -> meas[49];
-measure q[50] -> meas[50];
-measure q[51] -> meas[51];
-measure q[52] -> meas[52];
-measure q[53] -> meas[53];
-measure q[54] -> meas[54];
-measure q[55] -> meas[55];
-measure q[56] -> meas[56];
-measure q[57] -> meas[57];
-measure q[58] -> meas[58];
-measure q[59] -> meas[59];
-measure q[60] -> meas[60];
-measure q[61] -> meas[61];
-measure q[62] -> meas[62];
-measure q[63] -> meas[63];
-measure q[64] -> meas[64];
-measure q[65] -> meas[65];
-measure q[66] -> meas[66];
-measure q[67] -> meas[67];
-measure q[68] -> meas[68];
-measure q[69] -> meas[69];
-measure q[70] -> meas[70];
-measure q[71] -> meas[71];
-measure q[72] -> meas[72];
-measure q[73] -> meas[73];
-measure q[74] -> meas[74];
-measure q[75] -> meas[75];
-measure q[76] -> meas[76];
-measure q[77] -> meas[77];
-measure q[78] -> meas[78];
-measure q[79] -> meas[79];
-measure q[80] -> meas[80];
-measure q[81] -> meas[81];
-measure q[82] -> meas[82];
-measure q[83] -> meas[83];
-measure q[84] -> meas[84];
-measure q[85] -> meas[85];
-measure q[86] -> meas[86];
-measure q[87] -> meas[87];
-measure q[88] -> meas[88];
-measure q[89] -> meas[89];
-measure q[90] -> meas[90];
-measure q[91] -> meas[91];
-measure q[92] -> meas[92];
-measure q[93] -> meas[93];
-measure q[94] -> meas[94];
-measure q[95] -> meas[95];
-measure q[96] -> meas[96];
-measure q[97] -> meas[97];
-measure q[98] -> meas[98];
-measure q[99] -> meas[99];
-measure q[100] -> meas[100];
-measure q[101] -> meas[101];
-measure q[102] -> meas[102];
-measure q[103] -> meas[103];
-measure q[104] -> meas[104];
-measure q[105] -> meas[105];
-measure q[106] -> meas[106];
-measure q[107] -> meas[107];
-measure q[108] -> meas[108];
-measure q[109] -> meas[109];
-measure q[110] -> meas[110];
-measure q[111] -> meas[111];
-measure q[112] -> meas[112];
-measure q[113] -> meas[113];
-measure q[114] -> meas[114];
-measure q[115] -> meas[115];
-measure q[116] -> meas[116];
-measure q[117] -> meas[117];
-measure q[118] -> meas[118];
-measure q[119] -> meas[119];
-measure q[120] -> meas[120];
-measure q[121] -> meas[121];
-measure q[122] -> meas[122];
-measure q[123] -> meas[123];
-measure q[124] -> meas[124];
-measure q[125] -> meas[125];
-measure q[126] -> meas[126];
-measure q[127] -> meas[127];
-measure q[128] -> meas[128];
-measure q[129] -> meas[129];
-measure q[130] -> meas[130];
-measure q[131] -> meas[131];
-measure q[132] -> meas[132];
-measure q[133] -> meas[133];
-measure q[134] -> meas[134];
-measure q[135] -> meas[135];
-measure q[136] -> meas[136];
-measure q[137] -> meas[137];
-measure q[138] -> meas[138];
-measure q[139] -> meas[139];
-measure q[140] -> meas[140];
-measure q[141] -> meas[141];
-measure q[142] -> meas[142];
-measure q[143] -> meas[143];
-measure q[144] -> meas[144];
-measure q[145] -> meas[145];
-measure q[146] -> meas[146];
-measure q[147] -> meas[147];
-measure q[148] -> meas[148];
-measure q[149] -> meas[149];
-measure q[150] -> meas[150];
-measure q[151] -> meas[151];
-measure q[152] -> meas[152];
-measure q[153] -> meas[153];
-measure q[154] -> meas[154];
-measure q[155] -> meas[155];
-measure q[156] -> meas[156];
-measure q[157] -> meas[157];
-measure q[158] -> meas[158];
-measure q[159] -> meas[159];
-measure q[160] -> meas[160];
-measure q[161] -> meas[161];
-measure q[162] -> meas[162];
-measure q[163] -> meas[163];
-measure q[164] -> meas[164];
-measure q[165] -> meas[165];
-measure q[166] -> meas[166];
-measure q[167] -> meas[167];
-measure q[168] -> meas[168];
-measure q[169] -> meas[169];
-measure q[170] -> meas[170];
-measure q[171] -> meas[171];
-measure q[172] -> meas[172];
-measure q[173] -> meas[173];
-measure q[174] -> meas[174];
-measure q[175] -> meas[175];
-measure q[176] -> meas[176];
-measure q[177] -> meas[177];
-measure q[178] -> meas[178];
-measure q[179] -> meas[179];
-measure q[180] -> meas[180];
-measure q[181] -> meas[181];
-measure q[182] -> meas[182];
-measure q[183] -> meas[183];
-measure q[184] -> meas[184];
-measure q[185] -> meas[185];
-measure q[186] -> meas[186];
-measure q[187] -> meas[187];
-measure q[188] -> meas[188];
-measure q[189] -> meas[189];
-measure q[190] -> meas[190];
-measure q[191] -> meas[191];
-measure q[192] -> meas[192];
-measure q[193] -> meas[193];
-measure q[194] -> meas[194];
-measure q[195] -> meas[195];
-measure q[196] -> meas[196];
-measure q[197] -> meas[197];
-measure q[198] -> meas[198];
-measure q[199] -> meas[199];
-measure q[200] -> meas[200];
-measure q[201] -> meas[201];
-measure q[202] -> meas[202];
-measure q[203] -> meas[203];
-measure q[204] -> meas[204];
-measure q[205] -> meas[205];
-measure q[206] -> meas[206];
-measure q[207] -> meas[207];
-measure q[208] -> meas[208];
-measure q[209] -> meas[209];
-measure q[210] -> meas[210];
-measure q[211] -> meas[211];
-measure q[212] -> meas[212];
-measure q[213] -> meas[213];
-measure q[214] -> meas[214];
-measure q[215] -> meas[215];
-measure q[216] -> meas[216];
-measure q[217] -> meas[217];
-measure q[218] -> meas[218];
-measure q[219] -> meas[219];
-measure q[220] -> meas[220];
-measure q[221] -> meas[221];
-measure q[222] -> meas[222];
-measure q[223] -> meas[223];
-measure q[224] -> meas[224];
-measure q[225] -> meas[225];
-measure q[226] -> meas[226];
-measure q[227] -> meas[227];
-measure q[228] -> meas[228];
-measure q[229] -> meas[229];
-measure q[230] -> meas[230];
-measure q[231] -> meas[231];
-measure q[232] -> meas[232];
-measure q[233] -> meas[233];
-measure q[234] -> meas[234];
-measure q[235] -> meas[235];
-measure q[236] -> meas[236];
-measure q[237] -> meas[237];
-measure q[238] -> meas[238];
-measure q[239] -> meas[239];
-measure q[240] -> meas[240];
-measure q[241] -> meas[241];
-measure q[242] -> meas[242];
-measure q[243] -> meas[243];
-measure q[244] -> meas[244];
-measure q[245] -> meas[245];
-measure q[246] -> meas[246];
-measure q[247] -> meas[247];
-measure q[248] -> meas[248];
-measure q[249] -> meas[249];
-measure q[250] -> meas[250];
-measure q[251] -> meas[251];
-measure q[252] -> meas[252];
-measure q[253] -> meas[253];
-measure q[254] -> meas[254];
-measure q[255] -> meas[255];
-measure q[256] -> meas[256];
-measure q[257] -> meas[257];
-measure q[258] -> meas[258];
-measure q[259] -> meas[259];
-measure q[260] -> meas[260];
-measure q[261] -> meas[261];
-measure q[262] -> meas[262];
-measure q[263] -> meas[263];
-measure q[264] -> meas[264];
-measure q[265] -> meas[265];
-measure q[266] -> meas[266];
-measure q[267] -> meas[267];
-measure q[268] -> meas[268];
-measure q[269] -> meas[269];
-measure q[270] -> meas[270];
-measure q[271] -> meas[271];
-measure q[272] -> meas[272];
-measure q[273] -> meas[273];
-measure q[274] -> meas[274];
-measure q[275] -> meas[275];
-measure q[276] -> meas[276];
-measure q[277] -> meas[277];
-measure q[278] -> meas[278];
-measure q[279] -> meas[279];
-measure q[280] -> meas[280];
-measure q[281] -> meas[281];
-measure q[282] -> meas[282];
-measure q[283] -> meas[283];
-measure q[284] -> meas[284];
-measure q[285] -> meas[285];
-measure q[286] -> meas[286];
-measure q[287] -> meas[287];
-measure q[288] -> meas[288];
-measure q[289] -> meas[289];
-measure q[290] -> meas[290];
-measure q[291] -> meas[291];
-measure q[292] -> meas[292];
-measure q[293] -> meas[293];
-measure q[294] -> meas[294];
-measure q[295] -> meas[295];
-measure q[296] -> meas[296];
-measure q[297] -> meas[297];
-measure q[298] -> meas[298];
-measure q[299] -> meas[299];
-measure q[300] -> meas[300];
-measure q[301] -> meas[301];
-measure q[302] -> meas[302];
-measure q[303] -> meas[303];
-measure q[304] -> meas[304];
-measure q[305] -> meas[305];
-measure q[306] -> meas[306];
-measure q[307] -> meas[307];
-measure q[308] -> meas[308];
-measure q[309] -> meas[309];
-measure q[310] -> meas[310];
-measure q[311] -> meas[311];
-measure q[312] -> meas[312];
-measure q[313] -> meas[313];
-measure q[314] -> meas[314];
-measure q[315] -> meas[315];
-measure q[316] -> meas[316];
-measure q[317] -> meas[317];
-measure q[318] -> meas[318];
-measure q[319] -> meas[319];
-measure q[320] -> meas[320];
-measure q[321] -> meas[321];
-measure q[322] -> meas[322];
-measure q[323] -> meas[323];
-measure q[324] -> meas[324];
-measure q[325] -> meas[325];
-measure q[326] -> meas[326];
-measure q[327] -> meas[327];
-measure q[328] -> meas[328];
-measure q[329] -> meas[329];
-measure q[330] -> meas[330];
-measure q[331] -> meas[331];
-measure q[332] -> meas[332];
-measure q[333] -> meas[333];
-measure q[334] -> meas[334];
-measure q[335] -> meas[335];
-measure q[336] -> meas[336];
-measure q[337] -> meas[337];
-measure q[338] -> meas[338];
-measure q[339] -> meas[339];
-measure q[340] -> meas[340];
-measure q[341] -> meas[341];
-measure q[342] -> meas[342];
-measure q[343] -> meas[343];
-measure q[344] -> meas[344];
-measure q[345] -> meas[345];
-measure q[346] -> meas[346];
-measure q[347] -> meas[347];
-measure q[348] -> meas[348];
-measure q[349] -> meas[349];
-measure q[350] -> meas[350];
-measure q[351] -> meas[351];
-measure q[352] -> meas[352];
-measure q[353] -> meas[353];
-measure q[354] -> meas[354];
-measure q[355] -> meas[355];
-measure q[356] -> meas[356];
-measure q[357] -> meas[357];
-measure q[358] -> meas[358];
-measure q[359] -> meas[359];
-measure q[360] -> meas[360];
-measure q[361] -> meas[361];
-measure q[362] -> meas[362];
-measure q[363] -> meas[363];
-measure q[364] -> meas[364];
-measure q[365] -> meas[365];
-measure q[366] -> meas[366];
-measure q[367] -> meas[367];
-measure q[368] -> meas[368];
-measure q[369] -> meas[369];
-measure q[370] -> meas[370];
-measure q[371] -> meas[371];
-measure q[372] -> meas[372];
-measure q[373] -> meas[373];
-measure q[374] -> meas[374];
-measure q[375] -> meas[375];
-measure q[376] -> meas[376];
-measure q[377] -> meas[377];
-measure q[378] -> meas[378];
-measure q[379] -> meas[379];
@@ -1,683 +0,0 @@
-OPENQASM 2.0;
-include "qelib1.inc";
-qreg q[76];
-creg c[76];
-creg meas[76];
-sx q[0];
-rz(pi/4) q[0];
-sx q[0];
-sx q[1];
-rz(0.61547971) q[1];
-sx q[1];
-sx q[2];
-rz(pi/6) q[2];
-sx q[2];
-sx q[3];
-rz(0.46364763) q[3];
-sx q[3];
-sx q[4];
-rz(0.42053433) q[4];
-sx q[4];
-sx q[5];
-rz(0.38759673) q[5];
-sx q[5];
-sx q[6];
-rz(0.36136713) q[6];
-sx q[6];
-sx q[7];
-rz(0.33983693) q[7];
-sx q[7];
-sx q[8];
-rz(0.32175053) q[8];
-sx q[8];
-sx q[9];
-rz(0.30627733) q[9];
-sx q[9];
-sx q[10];
-rz(0.29284273) q[10];
-sx q[10];
-sx q[11];
-rz(0.28103493) q[11];
-sx q[11];
-sx q[12];
-rz(0.27054973) q[12];
-sx q[12];
-sx q[13];
-rz(0.26115743) q[13];
-sx q[13];
-sx q[14];
-rz(0.25268023) q[14];
-sx q[14];
-sx q[15];
-rz(0.24497863) q[15];
-sx q[15];
-sx q[16];
-rz(0.23794113) q[16];
-sx q[16];
-sx q[17];
-rz(0.23147733) q[17];
-sx q[17];
-sx q[18];
-rz(0.22551343) q[18];
-sx q[18];
-sx q[19];
-rz(0.21998803) q[19];
-sx q[19];
-sx q[20];
-rz(0.21484983) q[20];
-sx q[20];
-sx q[21];
-rz(0.21005573) q[21];
-sx q[21];
-sx q[22];
-rz(0.20556893) q[22];
-sx q[22];
-sx q[23];
-rz(0.20135793) q[23];
-sx q[23];
-sx q[24];
-rz(0.19739553) q[24];
-sx q[24];
-sx q[25];
-rz(0.19365833) q[25];
-sx q[25];
-sx q[26];
-rz(0.19012563) q[26];
-sx q[26];
-sx q[27];
-rz(0.18677943) q[27];
-sx q[27];
-sx q[28];
-rz(0.18360403) q[28];
-sx q[28];
-sx q[29];
-rz(0.18058523) q[29];
-sx q[29];
-sx q[30];
-rz(0.17771063) q[30];
-sx q[30];
-sx q[31];
-rz(0.17496903) q[31];
-sx q[31];
-sx q[32];
-rz(0.17235063) q[32];
-sx q[32];
-sx q[33];
-rz(0.16984633) q[33];
-sx q[33];
-sx q[34];
-rz(0.16744813) q[34];
-sx q[34];
-sx q[35];
-rz(0.16514873) q[35];
-sx q[35];
-sx q[36];
-rz(0.16294153) q[36];
-sx q[36];
-sx q[37];
-rz(0.16082053) q[37];
-sx q[37];
-sx q[38];
-rz(0.15878023) q[38];
-sx q[38];
-sx q[39];
-rz(0.15681573) q[39];
-sx q[39];
-sx q[40];
-rz(0.15492233) q[40];
-sx q[40];
-sx q[41];
-rz(0.15309593) q[41];
-sx q[41];
-sx q[42];
-rz(0.15133263) q[42];
-sx q[42];
-sx q[43];
-rz(0.14962893) q[43];
-sx q[43];
-sx q[44];
-rz(0.14798143) q[44];
-sx q[44];
-sx q[45];
-rz(0.14638723) q[45];
-sx q[45];
-sx q[46];
-rz(0.14484353) q[46];
-sx q[46];
-sx q[47];
-rz(0.14334753) q[47];
-sx q[47];
-sx q[48];
-rz(0.14189703) q[48];
-sx q[48];
-sx q[49];
-rz(0.14048973) q[49];
-sx q[49];
-sx q[50];
-rz(0.13912343) q[50];
-sx q[50];
-sx q[51];
-rz(0.13779623) q[51];
-sx q[51];
-sx q[52];
-rz(0.13650633) q[52];
-sx q[52];
-sx q[53];
-rz(0.13525193) q[53];
-sx q[53];
-sx q[54];
-rz(0.13403153) q[54];
-sx q[54];
-sx q[55];
-rz(0.13284363) q[55];
-sx q[55];
-sx q[56];
-rz(0.13168673) q[56];
-sx q[56];
-sx q[57];
-rz(0.13055953) q[57];
-sx q[57];
-sx q[58];
-rz(0.12946073) q[58];
-sx q[58];
-sx q[59];
-rz(0.12838933) q[59];
-sx q[59];
-sx q[60];
-rz(0.12734403) q[60];
-sx q[60];
-sx q[61];
-rz(0.12632383) q[61];
-sx q[61];
-sx q[62];
-rz(0.12532783) q[62];
-sx q[62];
-sx q[63];
-rz(0.12435503) q[63];
-sx q[63];
-sx q[64];
-rz(0.12340443) q[64];
-sx q[64];
-sx q[65];
-rz(0.12247543) q[65];
-sx q[65];
-sx q[66];
-rz(0.12156703) q[66];
-sx q[66];
-sx q[67];
-rz(0.12067853) q[67];
-sx q[67];
-sx q[68];
-rz(0.11980933) q[68];
-sx q[68];
-sx q[69];
-rz(0.11895853) q[69];
-sx q[69];
-sx q[70];
-rz(0.11812563) q[70];
-sx q[70];
-sx q[71];
-rz(0.11731003) q[71];
-sx q[71];
-sx q[72];
-rz(0.11651103) q[72];
-sx q[72];
-sx q[73];
-rz(0.11572823) q[73];
-sx q[73];
-sx q[74];
-rz(0.11496093) q[74];
-sx q[74];
-x q[75];
-cx q[75],q[74];
-sx q[74];
-rz(0.11496093) q[74];
-sx q[74];
-cx q[74],q[73];
-sx q[73];
-rz(0.11572823) q[73];
-sx q[73];
-cx q[73],q[72];
-sx q[72];
-rz(0.11651103) q[72];
-sx q[72];
-cx q[72],q[71];
-sx q[71];
-rz(0.11731003) q[71];
-sx q[71];
-cx q[71],q[70];
-sx q[70];
-rz(0.11812563) q[70];
-sx q[70];
-cx q[70],q[69];
-sx q[69];
-rz(0.11895853) q[69];
-sx q[69];
-cx q[69],q[68];
-sx q[68];
-rz(0.11980933) q[68];
-sx q[68];
-cx q[68],q[67];
-sx q[67];
-rz(0.12067853) q[67];
-sx q[67];
-cx q[67],q[66];
-sx q[66];
-rz(0.12156703) q[66];
-sx q[66];
-cx q[66],q[65];
-sx q[65];
-rz(0.12247543) q[65];
-sx q[65];
-cx q[65],q[64];
-sx q[64];
-rz(0.12340443) q[64];
-sx q[64];
-cx q[64],q[63];
-sx q[63];
-rz(0.12435503) q[63];
-sx q[63];
-cx q[63],q[62];
-sx q[62];
-rz(0.12532783) q[62];
-sx q[62];
-cx q[62],q[61];
-sx q[61];
-rz(0.12632383) q[61];
-sx q[61];
-cx q[61],q[60];
-sx q[60];
-rz(0.12734403) q[60];
-sx q[60];
-cx q[60],q[59];
-sx q[59];
-rz(0.12838933) q[59];
-sx q[59];
-cx q[59],q[58];
-sx q[58];
-rz(0.12946073) q[58];
-sx q[58];
-cx q[58],q[57];
-sx q[57];
-rz(0.13055953) q[57];
-sx q[57];
-cx q[57],q[56];
-sx q[56];
-rz(0.13168673) q[56];
-sx q[56];
-cx q[56],q[55];
-sx q[55];
-rz(0.13284363) q[55];
-sx q[55];
-cx q[55],q[54];
-sx q[54];
-rz(0.13403153) q[54];
-sx q[54];
-cx q[54],q[53];
-sx q[53];
-rz(0.13525193) q[53];
-sx q[53];
-cx q[53],q[52];
-sx q[52];
-rz(0.13650633) q[52];
-sx q[52];
-cx q[52],q[51];
-sx q[51];
-rz(0.13779623) q[51];
-sx q[51];
-cx q[51],q[50];
-sx q[50];
-rz(0.13912343) q[50];
-sx q[50];
-cx q[50],q[49];
-sx q[49];
-rz(0.14048973) q[49];
-sx q[49];
-cx q[49],q[48];
-sx q[48];
-rz(0.14189703) q[48];
-sx q[48];
-cx q[48],q[47];
-sx q[47];
-rz(0.14334753) q[47];
-sx q[47];
-cx q[47],q[46];
-sx q[46];
-rz(0.14484353) q[46];
-sx q[46];
-cx q[46],q[45];
-sx q[45];
-rz(0.14638723) q[45];
-sx q[45];
-cx q[45],q[44];
-sx q[44];
-rz(0.14798143) q[44];
-sx q[44];
-cx q[44],q[43];
-sx q[43];
-rz(0.14962893) q[43];
-sx q[43];
-cx q[43],q[42];
-sx q[42];
-rz(0.15133263) q[42];
-sx q[42];
-cx q[42],q[41];
-sx q[41];
-rz(0.15309593) q[41];
-sx q[41];
-cx q[41],q[40];
-sx q[40];
-rz(0.15492233) q[40];
-sx q[40];
-cx q[40],q[39];
-sx q[39];
-rz(0.15681573) q[39];
-sx q[39];
-cx q[39],q[38];
-sx q[38];
-rz(0.15878023) q[38];
-sx q[38];
-cx q[38],q[37];
-sx q[37];
-rz(0.16082053) q[37];
-sx q[37];
-cx q[37],q[36];
-sx q[36];
-rz(0.16294153) q[36];
-sx q[36];
-cx q[36],q[35];
-sx q[35];
-rz(0.16514873) q[35];
-sx q[35];
-cx q[35],q[34];
-sx q[34];
-rz(0.16744813) q[34];
-sx q[34];
-cx q[34],q[33];
-sx q[33];
-rz(0.16984633) q[33];
-sx q[33];
-cx q[33],q[32];
-sx q[32];
-rz(0.17235063) q[32];
-sx q[32];
-cx q[32],q[31];
-sx q[31];
-rz(0.17496903) q[31];
-sx q[31];
-cx q[31],q[30];
-sx q[30];
-rz(0.17771063) q[30];
-sx q[30];
-cx q[30],q[29];
-sx q[29];
-rz(0.18058523) q[29];
-sx q[29];
-cx q[29],q[28];
-sx q[28];
-rz(0.18360403) q[28];
-sx q[28];
-cx q[28],q[27];
-sx q[27];
-rz(0.18677943) q[27];
-sx q[27];
-cx q[27],q[26];
-sx q[26];
-rz(0.19012563) q[26];
-sx q[26];
-cx q[26],q[25];
-sx q[25];
-rz(0.19365833) q[25];
-sx q[25];
-cx q[25],q[24];
-sx q[24];
-rz(0.19739553) q[24];
-sx q[24];
-cx q[24],q[23];
-sx q[23];
-rz(0.20135793) q[23];
-sx q[23];
-cx q[23],q[22];
-sx q[22];
-rz(0.20556893) q[22];
-sx q[22];
-cx q[22],q[21];
-sx q[21];
-rz(0.21005573) q[21];
-sx q[21];
-cx q[21],q[20];
-sx q[20];
-rz(0.21484983) q[20];
-sx q[20];
-cx q[20],q[19];
-sx q[19];
-rz(0.21998803) q[19];
-sx q[19];
-cx q[19],q[18];
-sx q[18];
-rz(0.22551343) q[18];
-sx q[18];
-cx q[18],q[17];
-sx q[17];
-rz(0.23147733) q[17];
-sx q[17];
-cx q[17],q[16];
-sx q[16];
-rz(0.23794113) q[16];
-sx q[16];
-cx q[16],q[15];
-sx q[15];
-rz(0.24497863) q[15];
-sx q[15];
-cx q[15],q[14];
-sx q[14];
-rz(0.25268023) q[14];
-sx q[14];
-cx q[14],q[13];
-sx q[13];
-rz(0.26115743) q[13];
-sx q[13];
-cx q[13],q[12];
-sx q[12];
-rz(0.27054973) q[12];
-sx q[12];
-cx q[12],q[11];
-sx q[11];
-rz(0.28103493) q[11];
-sx q[11];
-cx q[11],q[10];
-sx q[10];
-rz(0.29284273) q[10];
-sx q[10];
-cx q[10],q[9];
-cx q[74],q[75];
-cx q[73],q[74];
-cx q[72],q[73];
-cx q[71],q[72];
-cx q[70],q[71];
-cx q[69],q[70];
-cx q[68],q[69];
-cx q[67],q[68];
-cx q[66],q[67];
-cx q[65],q[66];
-cx q[64],q[65];
-cx q[63],q[64];
-cx q[62],q[63];
-cx q[61],q[62];
-cx q[60],q[61];
-cx q[59],q[60];
-cx q[58],q[59];
-cx q[57],q[58];
-cx q[56],q[57];
-cx q[55],q[56];
-cx q[54],q[55];
-cx q[53],q[54];
-cx q[52],q[53];
-cx q[51],q[52];
-cx q[50],q[51];
-cx q[49],q[50];
-cx q[48],q[49];
-cx q[47],q[48];
-cx q[46],q[47];
-cx q[45],q[46];
-cx q[44],q[45];
-cx q[43],q[44];
-cx q[42],q[43];
-cx q[41],q[42];
-cx q[40],q[41];
-cx q[39],q[40];
-cx q[38],q[39];
-cx q[37],q[38];
-cx q[36],q[37];
-cx q[35],q[36];
-cx q[34],q[35];
-cx q[33],q[34];
-cx q[32],q[33];
-cx q[31],q[32];
-cx q[30],q[31];
-cx q[29],q[30];
-cx q[28],q[29];
-cx q[27],q[28];
-cx q[26],q[27];
-cx q[25],q[26];
-cx q[24],q[25];
-cx q[23],q[24];
-cx q[22],q[23];
-cx q[21],q[22];
-cx q[20],q[21];
-cx q[19],q[20];
-cx q[18],q[19];
-cx q[17],q[18];
-cx q[16],q[17];
-cx q[15],q[16];
-cx q[14],q[15];
-cx q[13],q[14];
-cx q[12],q[13];
-cx q[11],q[12];
-cx q[10],q[11];
-sx q[9];
-rz(0.30627733) q[9];
-sx q[9];
-cx q[9],q[8];
-sx q[8];
-rz(0.32175053) q[8];
-sx q[8];
-cx q[8],q[7];
-sx q[7];
-rz(0.33983693) q[7];
-sx q[7];
-cx q[7],q[6];
-sx q[6];
-rz(0.36136713) q[6];
-sx q[6];
-cx q[6],q[5];
-sx q[5];
-rz(0.38759673) q[5];
-sx q[5];
-cx q[5],q[4];
-sx q[4];
-rz(0.42053433) q[4];
-sx q[4];
-cx q[4],q[3];
-sx q[3];
-rz(0.46364763) q[3];
-sx q[3];
-cx q[3],q[2];
-sx q[2];
-rz(pi/6) q[2];
-sx q[2];
-cx q[2],q[1];
-sx q[1];
-rz(0.61547971) q[1];
-sx q[1];
-cx q[1],q[0];
-sx q[0];
-rz(pi/4) q[0];
-sx q[0];
-cx q[9],q[10];
-cx q[8],q[9];
-cx q[7],q[8];
-cx q[6],q[7];
-cx q[5],q[6];
-cx q[4],q[5];
-cx q[3],q[4];
-cx q[2],q[3];
-cx q[1],q[2];
-cx q[0],q[1];
-barrier q[0],q[1],q[2],q[3],q[4],q[5],q[6],q[7],q[8],q[9],q[10],q[11],q[12],q[13],q[14],q[15],q[16],q[17],q[18],q[19],q[20],q[21],q[22],q[23],q[24],q[25],q[26],q[27],q[28],q[29],q[30],q[31],q[32],q[33],q[34],q[35],q[36],q[37],q[38],q[39],q[40],q[41],q[42],q[43],q[44],q[45],q[46],q[47],q[48],q[49],q[50],q[51],q[52],q[53],q[54],q[55],q[56],q[57],q[58],q[59],q[60],q[61],q[62],q[63],q[64],q[65],q[66],q[67],q[68],q[69],q[70],q[71],q[72],q[73],q[74],q[75];
-measure q[0] -> meas[0];
-measure q[1] -> meas[1];
-measure q[2] -> meas[2];
-measure q[3] -> meas[3];
-measure q[4] -> meas[4];
-measure q[5] -> meas[5];
-measure q[6] -> meas[6];
-measure q[7] -> meas[7];
-measure q[8] -> meas[8];
-measure q[9] -> meas[9];
-measure q[10] -> meas[10];
-measure q[11] -> meas[11];
-measure q[12] -> meas[12];
-measure q[13] -> meas[13];
-measure q[14] -> meas[14];
-measure q[15] -> meas[15];
-measure q[16] -> meas[16];
-measure q[17] -> meas[17];
-measure q[18] -> meas[18];
-measure q[19] -> meas[19];
-measure q[20] -> meas[20];
-measure q[21] -> meas[21];
-measure q[22] -> meas[22];
-measure q[23] -> meas[23];
-measure q[24] -> meas[24];
-measure q[25] -> meas[25];
-measure q[26] -> meas[26];
-measure q[27] -> meas[27];
-measure q[28] -> meas[28];
-measure q[29] -> meas[29];
-measure q[30] -> meas[30];
-measure q[31] -> meas[31];
-measure q[32] -> meas[32];
-measure q[33] -> meas[33];
-measure q[34] -> meas[34];
-measure q[35] -> meas[35];
-measure q[36] -> meas[36];
-measure q[37] -> meas[37];
-measure q[38] -> meas[38];
-measure q[39] -> meas[39];
-measure q[40] -> meas[40];
-measure q[41] -> meas[41];
-measure q[42] -> meas[42];
-measure q[43] -> meas[43];
-measure q[44] -> meas[44];
-measure q[45] -> meas[45];
-measure q[46] -> meas[46];
-measure q[47] -> meas[47];
-measure q[48] -> meas[48];
-measure q[49] -> meas[49];
-measure q[50] -> meas[50];
-measure q[51] -> meas[51];
-measure q[52] -> meas[52];
-measure q[53] -> meas[53];
-measure q[54] -> meas[54];
-measure q[55] -> meas[55];
-measure q[56] -> meas[56];
-measure q[57] -> meas[57];
-measure q[58] -> meas[58];
-measure q[59] -> meas[59];
-measure q[60] -> meas[60];
-measure q[61] -> meas[61];
-measure q[62] -> meas[62];
-measure q[63] -> meas[63];
-measure q[64] -> meas[64];
-measure q[65] -> meas[65];
-measure q[66] -> meas[66];
-measure q[67] -> meas[67];
-measure q[68] -> meas[68];
-measure q[69] -> meas[69];
-measure q[70] -> meas[70];
-measure q[71] -> meas[71];
-measure q[72] -> meas[72];
-measure q[73] -> meas[73];
-measure q[74] -> meas[74];
-measure q[75] -> meas[75];
@@ -1,346 +0,0 @@
-OPENQASM 2.0;
-include "qelib1.inc";
-qreg carry[2];
-qreg a[8];
-qreg b[8];
-creg ans[8];
-creg carryout[1];
-x a[0];
-x b[0];
-cx a[0],b[0];
-cx a[0],carry[0];
-rz(pi/2) a[0];
-sx a[0];
-rz(pi/2) a[0];
-cx b[0],a[0];
-rz(-pi/4) a[0];
-cx carry[0],a[0];
-rz(pi/4) a[0];
-cx b[0],a[0];
-rz(-pi/4) a[0];
-cx carry[0],a[0];
-rz(3*pi/4) a[0];
-sx a[0];
-rz(pi/2) a[0];
-rz(pi/4) b[0];
-cx carry[0],b[0];
-rz(pi/4) carry[0];
-rz(-pi/4) b[0];
-cx carry[0],b[0];
-x b[1];
-cx a[1],b[1];
-cx a[1],a[0];
-rz(pi/2) a[1];
-sx a[1];
-rz(pi/2) a[1];
-cx b[1],a[1];
-rz(-pi/4) a[1];
-cx a[0],a[1];
-rz(pi/4) a[1];
-cx b[1],a[1];
-rz(-pi/4) a[1];
-cx a[0],a[1];
-rz(3*pi/4) a[1];
-sx a[1];
-rz(pi/2) a[1];
-rz(pi/4) b[1];
-cx a[0],b[1];
-rz(pi/4) a[0];
-rz(-pi/4) b[1];
-cx a[0],b[1];
-x b[2];
-cx a[2],b[2];
-cx a[2],a[1];
-rz(pi/2) a[2];
-sx a[2];
-rz(pi/2) a[2];
-cx b[2],a[2];
-rz(-pi/4) a[2];
-cx a[1],a[2];
-rz(pi/4) a[2];
-cx b[2],a[2];
-rz(-pi/4) a[2];
-cx a[1],a[2];
-rz(3*pi/4) a[2];
-sx a[2];
-rz(pi/2) a[2];
-rz(pi/4) b[2];
-cx a[1],b[2];
-rz(pi/4) a[1];
-rz(-pi/4) b[2];
-cx a[1],b[2];
-x b[3];
-cx a[3],b[3];
-cx a[3],a[2];
-rz(pi/2) a[3];
-sx a[3];
-rz(pi/2) a[3];
-cx b[3],a[3];
-rz(-pi/4) a[3];
-cx a[2],a[3];
-rz(pi/4) a[3];
-cx b[3],a[3];
-rz(-pi/4) a[3];
-cx a[2],a[3];
-rz(3*pi/4) a[3];
-sx a[3];
-rz(pi/2) a[3];
-cx a[3],carry[1];
-rz(pi/2) a[3];
-sx a[3];
-rz(pi/2) a[3];
-rz(pi/4) b[3];
-cx a[2],b[3];
-rz(pi/4) a[2];
-rz(-pi/4) b[3];
-cx a[2],b[3];
-cx b[3],a[3];
-rz(-pi/4) a[3];
-cx a[2],a[3];
-rz(pi/4) a[3];
-cx b[3],a[3];
-rz(-pi/4) a[3];
-cx a[2],a[3];
-rz(3*pi/4) a[3];
-sx a[3];
-rz(pi/2) a[3];
-rz(pi/4) b[3];
-cx a[2],b[3];
-rz(pi/4) a[2];
-rz(-pi/4) b[3];
-cx a[2],b[3];
-cx a[3],a[2];
-cx a[2],b[3];
-rz(pi/2) a[2];
-sx a[2];
-rz(pi/2) a[2];
-cx b[2],a[2];
-rz(-pi/4) a[2];
-cx a[1],a[2];
-rz(pi/4) a[2];
-cx b[2],a[2];
-rz(-pi/4) a[2];
-cx a[1],a[2];
-rz(3*pi/4) a[2];
-sx a[2];
-rz(pi/2) a[2];
-rz(pi/4) b[2];
-cx a[1],b[2];
-rz(pi/4) a[1];
-rz(-pi/4) b[2];
-cx a[1],b[2];
-cx a[2],a[1];
-cx a[1],b[2];
-rz(pi/2) a[1];
-sx a[1];
-rz(pi/2) a[1];
-cx b[1],a[1];
-rz(-pi/4) a[1];
-cx a[0],a[1];
-rz(pi/4) a[1];
-cx b[1],a[1];
-rz(-pi/4) a[1];
-cx a[0],a[1];
-rz(3*pi/4) a[1];
-sx a[1];
-rz(pi/2) a[1];
-rz(pi/4) b[1];
-cx a[0],b[1];
-rz(pi/4) a[0];
-rz(-pi/4) b[1];
-cx a[0],b[1];
-cx a[1],a[0];
-cx a[0],b[1];
-rz(pi/2) a[0];
-sx a[0];
-rz(pi/2) a[0];
-cx b[0],a[0];
-rz(-pi/4) a[0];
-cx carry[0],a[0];
-rz(pi/4) a[0];
-cx b[0],a[0];
-rz(-pi/4) a[0];
-cx carry[0],a[0];
-rz(3*pi/4) a[0];
-sx a[0];
-rz(pi/2) a[0];
-rz(pi/4) b[0];
-cx carry[0],b[0];
-rz(pi/4) carry[0];
-rz(-pi/4) b[0];
-cx carry[0],b[0];
-cx a[0],carry[0];
-cx carry[0],b[0];
-x b[4];
-cx a[4],b[4];
-cx a[4],carry[1];
-rz(pi/2) a[4];
-sx a[4];
-rz(pi/2) a[4];
-cx b[4],a[4];
-rz(-pi/4) a[4];
-cx carry[1],a[4];
-rz(pi/4) a[4];
-cx b[4],a[4];
-rz(-pi/4) a[4];
-cx carry[1],a[4];
-rz(3*pi/4) a[4];
-sx a[4];
-rz(pi/2) a[4];
-rz(pi/4) b[4];
-cx carry[1],b[4];
-rz(pi/4) carry[1];
-rz(-pi/4) b[4];
-cx carry[1],b[4];
-x b[5];
-cx a[5],b[5];
-cx a[5],a[4];
-rz(pi/2) a[5];
-sx a[5];
-rz(pi/2) a[5];
-cx b[5],a[5];
-rz(-pi/4) a[5];
-cx a[4],a[5];
-rz(pi/4) a[5];
-cx b[5],a[5];
-rz(-pi/4) a[5];
-cx a[4],a[5];
-rz(3*pi/4) a[5];
-sx a[5];
-rz(pi/2) a[5];
-rz(pi/4) b[5];
-cx a[4],b[5];
-rz(pi/4) a[4];
-rz(-pi/4) b[5];
-cx a[4],b[5];
-cx a[6],b[6];
-cx a[6],a[5];
-rz(pi/2) a[6];
-sx a[6];
-rz(pi/2) a[6];
-cx b[6],a[6];
-rz(-pi/4) a[6];
-cx a[5],a[6];
-rz(pi/4) a[6];
-cx b[6],a[6];
-rz(-pi/4) a[6];
-cx a[5],a[6];
-rz(3*pi/4) a[6];
-sx a[6];
-rz(pi/2) a[6];
-rz(pi/4) b[6];
-cx a[5],b[6];
-rz(pi/4) a[5];
-rz(-pi/4) b[6];
-cx a[5],b[6];
-x b[7];
-cx a[7],b[7];
-cx a[7],a[6];
-rz(pi/2) a[7];
-sx a[7];
-rz(pi/2) a[7];
-cx b[7],a[7];
-rz(-pi/4) a[7];
-cx a[6],a[7];
-rz(pi/4) a[7];
-cx b[7],a[7];
-rz(-pi/4) a[7];
-cx a[6],a[7];
-rz(3*pi/4) a[7];
-sx a[7];
-rz(pi/2) a[7];
-cx a[7],carry[0];
-rz(pi/2) a[7];
-sx a[7];
-rz(pi/2) a[7];
-rz(pi/4) b[7];
-cx a[6],b[7];
-rz(pi/4) a[6];
-rz(-pi/4) b[7];
-cx a[6],b[7];
-cx b[7],a[7];
-rz(-pi/4) a[7];
-cx a[6],a[7];
-rz(pi/4) a[7];
-cx b[7],a[7];
-rz(-pi/4) a[7];
-cx a[6],a[7];
-rz(3*pi/4) a[7];
-sx a[7];
-rz(pi/2) a[7];
-rz(pi/4) b[7];
-cx a[6],b[7];
-rz(pi/4) a[6];
-rz(-pi/4) b[7];
-cx a[6],b[7];
-cx a[7],a[6];
-cx a[6],b[7];
-rz(pi/2) a[6];
-sx a[6];
-rz(pi/2) a[6];
-cx b[6],a[6];
-rz(-pi/4) a[6];
-cx a[5],a[6];
-rz(pi/4) a[6];
-cx b[6],a[6];
-rz(-pi/4) a[6];
-cx a[5],a[6];
-rz(3*pi/4) a[6];
-sx a[6];
-rz(pi/2) a[6];
-rz(pi/4) b[6];
-cx a[5],b[6];
-rz(pi/4) a[5];
-rz(-pi/4) b[6];
-cx a[5],b[6];
-cx a[6],a[5];
-cx a[5],b[6];
-rz(pi/2) a[5];
-sx a[5];
-rz(pi/2) a[5];
-cx b[5],a[5];
-rz(-pi/4) a[5];
-cx a[4],a[5];
-rz(pi/4) a[5];
-cx b[5],a[5];
-rz(-pi/4) a[5];
-cx a[4],a[5];
-rz(3*pi/4) a[5];
-sx a[5];
-rz(pi/2) a[5];
-rz(pi/4) b[5];
-cx a[4],b[5];
-rz(pi/4) a[4];
-rz(-pi/4) b[5];
-cx a[4],b[5];
-cx a[5],a[4];
-cx a[4],b[5];
-rz(pi/2) a[4];
-sx a[4];
-rz(pi/2) a[4];
-cx b[4],a[4];
-rz(-pi/4) a[4];
-cx carry[1],a[4];
-rz(pi/4) a[4];
-cx b[4],a[4];
-rz(-pi/4) a[4];
-cx carry[1],a[4];
-rz(3*pi/4) a[4];
-sx a[4];
-rz(pi/2) a[4];
-rz(pi/4) b[4];
-cx carry[1],b[4];
-rz(pi/4) carry[1];
-rz(-pi/4) b[4];
-cx carry[1],b[4];
-cx a[4],carry[1];
-cx carry[1],b[4];
-measure b[0] -> ans[0];
-measure b[1] -> ans[1];
-measure b[2] -> ans[2];
-measure b[3] -> ans[3];
-measure b[4] -> ans[4];
-measure b[5] -> ans[5];
-measure b[6] -> ans[6];
-measure b[7] -> ans[7];
-measure carry[0] -> carryout[0];
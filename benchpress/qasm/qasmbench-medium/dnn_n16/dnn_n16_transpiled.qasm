@@ -1,2852 +0,0 @@
-OPENQASM 2.0;
-include "qelib1.inc";
-qreg q[16];
-creg ans[16];
-rz(-0.79715247) q[0];
-sx q[0];
-rz(-0.55272686) q[0];
-sx q[0];
-rz(1.9734881) q[0];
-rz(-0.79715247) q[1];
-sx q[1];
-rz(-0.55272686) q[1];
-sx q[1];
-rz(-1.1681045) q[1];
-cx q[0],q[1];
-rz(pi/2) q[0];
-sx q[0];
-rz(7*pi/5) q[0];
-sx q[0];
-rz(5*pi/2) q[0];
-rz(-pi/2) q[1];
-sx q[1];
-rz(pi/2) q[1];
-cx q[1],q[0];
-rz(-pi) q[1];
-sx q[1];
-rz(-pi/2) q[1];
-cx q[0],q[1];
-rz(pi/2) q[0];
-sx q[0];
-rz(2.0420352) q[0];
-sx q[0];
-rz(-pi/2) q[1];
-sx q[1];
-rz(-2.6703538) q[1];
-cx q[0],q[1];
-rz(pi/2) q[0];
-sx q[0];
-rz(7*pi/5) q[0];
-sx q[0];
-rz(5*pi/2) q[0];
-rz(-pi/2) q[1];
-sx q[1];
-rz(pi/2) q[1];
-cx q[1],q[0];
-rz(-pi) q[1];
-sx q[1];
-rz(-pi/2) q[1];
-cx q[0],q[1];
-rz(pi/2) q[0];
-rz(pi/2) q[1];
-sx q[1];
-cx q[0],q[1];
-rz(pi/2) q[0];
-sx q[0];
-rz(7*pi/5) q[0];
-sx q[0];
-rz(5*pi/2) q[0];
-rz(-pi/2) q[1];
-sx q[1];
-rz(pi/2) q[1];
-cx q[1],q[0];
-rz(-pi) q[1];
-sx q[1];
-rz(-pi/2) q[1];
-cx q[0],q[1];
-rz(-0.77207828) q[0];
-sx q[0];
-rz(-0.83518121) q[0];
-sx q[0];
-rz(0.84575039) q[0];
-rz(2.3695144) q[1];
-sx q[1];
-rz(-0.83518121) q[1];
-sx q[1];
-rz(-2.2958423) q[1];
-rz(-0.79715247) q[2];
-sx q[2];
-rz(-0.55272686) q[2];
-sx q[2];
-rz(1.9734881) q[2];
-rz(-0.79715247) q[3];
-sx q[3];
-rz(-0.55272686) q[3];
-sx q[3];
-rz(-1.1681045) q[3];
-cx q[2],q[3];
-rz(pi/2) q[2];
-sx q[2];
-rz(7*pi/5) q[2];
-sx q[2];
-rz(5*pi/2) q[2];
-rz(-pi/2) q[3];
-sx q[3];
-rz(pi/2) q[3];
-cx q[3],q[2];
-rz(-pi) q[3];
-sx q[3];
-rz(-pi/2) q[3];
-cx q[2],q[3];
-rz(pi/2) q[2];
-sx q[2];
-rz(2.0420352) q[2];
-sx q[2];
-rz(-pi/2) q[3];
-sx q[3];
-rz(-2.6703538) q[3];
-cx q[2],q[3];
-rz(pi/2) q[2];
-sx q[2];
-rz(7*pi/5) q[2];
-sx q[2];
-rz(5*pi/2) q[2];
-rz(-pi/2) q[3];
-sx q[3];
-rz(pi/2) q[3];
-cx q[3],q[2];
-rz(-pi) q[3];
-sx q[3];
-rz(-pi/2) q[3];
-cx q[2],q[3];
-rz(pi/2) q[2];
-rz(pi/2) q[3];
-sx q[3];
-cx q[2],q[3];
-rz(pi/2) q[2];
-sx q[2];
-rz(7*pi/5) q[2];
-sx q[2];
-rz(5*pi/2) q[2];
-rz(-pi/2) q[3];
-sx q[3];
-rz(pi/2) q[3];
-cx q[3],q[2];
-rz(-pi) q[3];
-sx q[3];
-rz(-pi/2) q[3];
-cx q[2],q[3];
-rz(-0.77207828) q[2];
-sx q[2];
-rz(-0.83518121) q[2];
-sx q[2];
-rz(0.84575039) q[2];
-cx q[1],q[2];
-rz(pi/2) q[1];
-sx q[1];
-rz(7*pi/5) q[1];
-sx q[1];
-rz(5*pi/2) q[1];
-rz(-pi/2) q[2];
-sx q[2];
-rz(pi/2) q[2];
-cx q[2],q[1];
-rz(-pi) q[2];
-sx q[2];
-rz(-pi/2) q[2];
-cx q[1],q[2];
-rz(pi/2) q[1];
-sx q[1];
-rz(2.0420352) q[1];
-sx q[1];
-rz(-pi/2) q[2];
-sx q[2];
-rz(-2.6703538) q[2];
-cx q[1],q[2];
-rz(pi/2) q[1];
-sx q[1];
-rz(7*pi/5) q[1];
-sx q[1];
-rz(5*pi/2) q[1];
-rz(-pi/2) q[2];
-sx q[2];
-rz(pi/2) q[2];
-cx q[2],q[1];
-rz(-pi) q[2];
-sx q[2];
-rz(-pi/2) q[2];
-cx q[1],q[2];
-rz(pi/2) q[1];
-rz(pi/2) q[2];
-sx q[2];
-cx q[1],q[2];
-rz(pi/2) q[1];
-sx q[1];
-rz(7*pi/5) q[1];
-sx q[1];
-rz(5*pi/2) q[1];
-rz(-pi/2) q[2];
-sx q[2];
-rz(pi/2) q[2];
-cx q[2],q[1];
-rz(-pi) q[2];
-sx q[2];
-rz(-pi/2) q[2];
-cx q[1],q[2];
-rz(-0.19043683) q[1];
-sx q[1];
-rz(-1.9392357) q[1];
-sx q[1];
-rz(-1.6179568) q[1];
-rz(-2.1495275) q[2];
-sx q[2];
-rz(-2.2330665) q[2];
-sx q[2];
-rz(2.1090252) q[2];
-rz(2.3695144) q[3];
-sx q[3];
-rz(-0.83518121) q[3];
-sx q[3];
-rz(-2.2958423) q[3];
-rz(-0.79715247) q[4];
-sx q[4];
-rz(-0.55272686) q[4];
-sx q[4];
-rz(1.9734881) q[4];
-rz(-0.79715247) q[5];
-sx q[5];
-rz(-0.55272686) q[5];
-sx q[5];
-rz(-1.1681045) q[5];
-cx q[4],q[5];
-rz(pi/2) q[4];
-sx q[4];
-rz(7*pi/5) q[4];
-sx q[4];
-rz(5*pi/2) q[4];
-rz(-pi/2) q[5];
-sx q[5];
-rz(pi/2) q[5];
-cx q[5],q[4];
-rz(-pi) q[5];
-sx q[5];
-rz(-pi/2) q[5];
-cx q[4],q[5];
-rz(pi/2) q[4];
-sx q[4];
-rz(2.0420352) q[4];
-sx q[4];
-rz(-pi/2) q[5];
-sx q[5];
-rz(-2.6703538) q[5];
-cx q[4],q[5];
-rz(pi/2) q[4];
-sx q[4];
-rz(7*pi/5) q[4];
-sx q[4];
-rz(5*pi/2) q[4];
-rz(-pi/2) q[5];
-sx q[5];
-rz(pi/2) q[5];
-cx q[5],q[4];
-rz(-pi) q[5];
-sx q[5];
-rz(-pi/2) q[5];
-cx q[4],q[5];
-rz(pi/2) q[4];
-rz(pi/2) q[5];
-sx q[5];
-cx q[4],q[5];
-rz(pi/2) q[4];
-sx q[4];
-rz(7*pi/5) q[4];
-sx q[4];
-rz(5*pi/2) q[4];
-rz(-pi/2) q[5];
-sx q[5];
-rz(pi/2) q[5];
-cx q[5],q[4];
-rz(-pi) q[5];
-sx q[5];
-rz(-pi/2) q[5];
-cx q[4],q[5];
-rz(-0.77207828) q[4];
-sx q[4];
-rz(-0.83518121) q[4];
-sx q[4];
-rz(0.84575039) q[4];
-cx q[3],q[4];
-rz(pi/2) q[3];
-sx q[3];
-rz(7*pi/5) q[3];
-sx q[3];
-rz(5*pi/2) q[3];
-rz(-pi/2) q[4];
-sx q[4];
-rz(pi/2) q[4];
-cx q[4],q[3];
-rz(-pi) q[4];
-sx q[4];
-rz(-pi/2) q[4];
-cx q[3],q[4];
-rz(pi/2) q[3];
-sx q[3];
-rz(2.0420352) q[3];
-sx q[3];
-rz(-pi/2) q[4];
-sx q[4];
-rz(-2.6703538) q[4];
-cx q[3],q[4];
-rz(pi/2) q[3];
-sx q[3];
-rz(7*pi/5) q[3];
-sx q[3];
-rz(5*pi/2) q[3];
-rz(-pi/2) q[4];
-sx q[4];
-rz(pi/2) q[4];
-cx q[4],q[3];
-rz(-pi) q[4];
-sx q[4];
-rz(-pi/2) q[4];
-cx q[3],q[4];
-rz(pi/2) q[3];
-rz(pi/2) q[4];
-sx q[4];
-cx q[3],q[4];
-rz(pi/2) q[3];
-sx q[3];
-rz(7*pi/5) q[3];
-sx q[3];
-rz(5*pi/2) q[3];
-rz(-pi/2) q[4];
-sx q[4];
-rz(pi/2) q[4];
-cx q[4],q[3];
-rz(-pi) q[4];
-sx q[4];
-rz(-pi/2) q[4];
-cx q[3],q[4];
-rz(-0.19043683) q[3];
-sx q[3];
-rz(-1.9392357) q[3];
-sx q[3];
-rz(-1.6179568) q[3];
-cx q[2],q[3];
-rz(pi/2) q[2];
-sx q[2];
-rz(3.29867228626928) q[2];
-sx q[2];
-rz(5*pi/2) q[2];
-rz(-pi/2) q[3];
-sx q[3];
-rz(pi/2) q[3];
-cx q[3],q[2];
-rz(-pi) q[3];
-sx q[3];
-rz(-pi/2) q[3];
-cx q[2],q[3];
-rz(pi/2) q[2];
-sx q[2];
-rz(-2.984513) q[2];
-sx q[2];
-rz(pi/2) q[2];
-rz(0.68021498) q[3];
-sx q[3];
-rz(-1.1421643) q[3];
-sx q[3];
-rz(2.6670111) q[3];
-cx q[2],q[3];
-rz(pi/2) q[2];
-sx q[2];
-rz(3.29867228626928) q[2];
-sx q[2];
-rz(5*pi/2) q[2];
-rz(-pi/2) q[3];
-sx q[3];
-rz(pi/2) q[3];
-cx q[3],q[2];
-rz(-pi) q[3];
-sx q[3];
-rz(-pi/2) q[3];
-cx q[2],q[3];
-rz(-0.53138965) q[2];
-sx q[2];
-rz(-2.1798132) q[2];
-sx q[2];
-rz(-0.77184216) q[2];
-rz(pi/2) q[3];
-sx q[3];
-rz(-1.727876) q[3];
-sx q[3];
-rz(-pi/2) q[3];
-rz(-2.1495275) q[4];
-sx q[4];
-rz(-2.2330665) q[4];
-sx q[4];
-rz(2.1090252) q[4];
-rz(2.3695144) q[5];
-sx q[5];
-rz(-0.83518121) q[5];
-sx q[5];
-rz(-2.2958423) q[5];
-rz(-0.79715247) q[6];
-sx q[6];
-rz(-0.55272686) q[6];
-sx q[6];
-rz(1.9734881) q[6];
-rz(-0.79715247) q[7];
-sx q[7];
-rz(-0.55272686) q[7];
-sx q[7];
-rz(-1.1681045) q[7];
-cx q[6],q[7];
-rz(pi/2) q[6];
-sx q[6];
-rz(7*pi/5) q[6];
-sx q[6];
-rz(5*pi/2) q[6];
-rz(-pi/2) q[7];
-sx q[7];
-rz(pi/2) q[7];
-cx q[7],q[6];
-rz(-pi) q[7];
-sx q[7];
-rz(-pi/2) q[7];
-cx q[6],q[7];
-rz(pi/2) q[6];
-sx q[6];
-rz(2.0420352) q[6];
-sx q[6];
-rz(-pi/2) q[7];
-sx q[7];
-rz(-2.6703538) q[7];
-cx q[6],q[7];
-rz(pi/2) q[6];
-sx q[6];
-rz(7*pi/5) q[6];
-sx q[6];
-rz(5*pi/2) q[6];
-rz(-pi/2) q[7];
-sx q[7];
-rz(pi/2) q[7];
-cx q[7],q[6];
-rz(-pi) q[7];
-sx q[7];
-rz(-pi/2) q[7];
-cx q[6],q[7];
-rz(pi/2) q[6];
-rz(pi/2) q[7];
-sx q[7];
-cx q[6],q[7];
-rz(pi/2) q[6];
-sx q[6];
-rz(7*pi/5) q[6];
-sx q[6];
-rz(5*pi/2) q[6];
-rz(-pi/2) q[7];
-sx q[7];
-rz(pi/2) q[7];
-cx q[7],q[6];
-rz(-pi) q[7];
-sx q[7];
-rz(-pi/2) q[7];
-cx q[6],q[7];
-rz(-0.77207828) q[6];
-sx q[6];
-rz(-0.83518121) q[6];
-sx q[6];
-rz(0.84575039) q[6];
-cx q[5],q[6];
-rz(pi/2) q[5];
-sx q[5];
-rz(7*pi/5) q[5];
-sx q[5];
-rz(5*pi/2) q[5];
-rz(-pi/2) q[6];
-sx q[6];
-rz(pi/2) q[6];
-cx q[6],q[5];
-rz(-pi) q[6];
-sx q[6];
-rz(-pi/2) q[6];
-cx q[5],q[6];
-rz(pi/2) q[5];
-sx q[5];
-rz(2.0420352) q[5];
-sx q[5];
-rz(-pi/2) q[6];
-sx q[6];
-rz(-2.6703538) q[6];
-cx q[5],q[6];
-rz(pi/2) q[5];
-sx q[5];
-rz(7*pi/5) q[5];
-sx q[5];
-rz(5*pi/2) q[5];
-rz(-pi/2) q[6];
-sx q[6];
-rz(pi/2) q[6];
-cx q[6],q[5];
-rz(-pi) q[6];
-sx q[6];
-rz(-pi/2) q[6];
-cx q[5],q[6];
-rz(pi/2) q[5];
-rz(pi/2) q[6];
-sx q[6];
-cx q[5],q[6];
-rz(pi/2) q[5];
-sx q[5];
-rz(7*pi/5) q[5];
-sx q[5];
-rz(5*pi/2) q[5];
-rz(-pi/2) q[6];
-sx q[6];
-rz(pi/2) q[6];
-cx q[6],q[5];
-rz(-pi) q[6];
-sx q[6];
-rz(-pi/2) q[6];
-cx q[5],q[6];
-rz(-0.19043683) q[5];
-sx q[5];
-rz(-1.9392357) q[5];
-sx q[5];
-rz(-1.6179568) q[5];
-cx q[4],q[5];
-rz(pi/2) q[4];
-sx q[4];
-rz(3.29867228626928) q[4];
-sx q[4];
-rz(5*pi/2) q[4];
-rz(-pi/2) q[5];
-sx q[5];
-rz(pi/2) q[5];
-cx q[5],q[4];
-rz(-pi) q[5];
-sx q[5];
-rz(-pi/2) q[5];
-cx q[4],q[5];
-rz(pi/2) q[4];
-sx q[4];
-rz(-2.984513) q[4];
-sx q[4];
-rz(pi/2) q[4];
-rz(0.68021498) q[5];
-sx q[5];
-rz(-1.1421643) q[5];
-sx q[5];
-rz(2.6670111) q[5];
-cx q[4],q[5];
-rz(pi/2) q[4];
-sx q[4];
-rz(3.29867228626928) q[4];
-sx q[4];
-rz(5*pi/2) q[4];
-rz(-pi/2) q[5];
-sx q[5];
-rz(pi/2) q[5];
-cx q[5],q[4];
-rz(-pi) q[5];
-sx q[5];
-rz(-pi/2) q[5];
-cx q[4],q[5];
-rz(-0.53138965) q[4];
-sx q[4];
-rz(-2.1798132) q[4];
-sx q[4];
-rz(-0.77184216) q[4];
-cx q[3],q[4];
-rz(pi/2) q[3];
-sx q[3];
-rz(3.29867228626928) q[3];
-sx q[3];
-rz(5*pi/2) q[3];
-rz(-pi/2) q[4];
-sx q[4];
-rz(pi/2) q[4];
-cx q[4],q[3];
-rz(-pi) q[4];
-sx q[4];
-rz(-pi/2) q[4];
-cx q[3],q[4];
-rz(pi/2) q[3];
-sx q[3];
-rz(-2.984513) q[3];
-sx q[3];
-rz(pi/2) q[3];
-rz(0.68021498) q[4];
-sx q[4];
-rz(-1.1421643) q[4];
-sx q[4];
-rz(2.6670111) q[4];
-cx q[3],q[4];
-rz(pi/2) q[3];
-sx q[3];
-rz(3.29867228626928) q[3];
-sx q[3];
-rz(5*pi/2) q[3];
-rz(-pi/2) q[4];
-sx q[4];
-rz(pi/2) q[4];
-cx q[4],q[3];
-rz(-pi) q[4];
-sx q[4];
-rz(-pi/2) q[4];
-cx q[3],q[4];
-rz(-0.089094174) q[3];
-sx q[3];
-rz(-1.024559) q[3];
-sx q[3];
-rz(1.8031906) q[3];
-rz(-2.5935896) q[4];
-sx q[4];
-rz(-1.4946939) q[4];
-sx q[4];
-rz(0.27876616) q[4];
-rz(pi/2) q[5];
-sx q[5];
-rz(-1.727876) q[5];
-sx q[5];
-rz(-pi/2) q[5];
-rz(-2.1495275) q[6];
-sx q[6];
-rz(-2.2330665) q[6];
-sx q[6];
-rz(2.1090252) q[6];
-rz(2.3695144) q[7];
-sx q[7];
-rz(-0.83518121) q[7];
-sx q[7];
-rz(-2.2958423) q[7];
-rz(-0.79715247) q[8];
-sx q[8];
-rz(-0.55272686) q[8];
-sx q[8];
-rz(1.9734881) q[8];
-rz(-0.79715247) q[9];
-sx q[9];
-rz(-0.55272686) q[9];
-sx q[9];
-rz(-1.1681045) q[9];
-cx q[8],q[9];
-rz(pi/2) q[8];
-sx q[8];
-rz(7*pi/5) q[8];
-sx q[8];
-rz(5*pi/2) q[8];
-rz(-pi/2) q[9];
-sx q[9];
-rz(pi/2) q[9];
-cx q[9],q[8];
-rz(-pi) q[9];
-sx q[9];
-rz(-pi/2) q[9];
-cx q[8],q[9];
-rz(pi/2) q[8];
-sx q[8];
-rz(2.0420352) q[8];
-sx q[8];
-rz(-pi/2) q[9];
-sx q[9];
-rz(-2.6703538) q[9];
-cx q[8],q[9];
-rz(pi/2) q[8];
-sx q[8];
-rz(7*pi/5) q[8];
-sx q[8];
-rz(5*pi/2) q[8];
-rz(-pi/2) q[9];
-sx q[9];
-rz(pi/2) q[9];
-cx q[9],q[8];
-rz(-pi) q[9];
-sx q[9];
-rz(-pi/2) q[9];
-cx q[8],q[9];
-rz(pi/2) q[8];
-rz(pi/2) q[9];
-sx q[9];
-cx q[8],q[9];
-rz(pi/2) q[8];
-sx q[8];
-rz(7*pi/5) q[8];
-sx q[8];
-rz(5*pi/2) q[8];
-rz(-pi/2) q[9];
-sx q[9];
-rz(pi/2) q[9];
-cx q[9],q[8];
-rz(-pi) q[9];
-sx q[9];
-rz(-pi/2) q[9];
-cx q[8],q[9];
-rz(-0.77207828) q[8];
-sx q[8];
-rz(-0.83518121) q[8];
-sx q[8];
-rz(0.84575039) q[8];
-cx q[7],q[8];
-rz(pi/2) q[7];
-sx q[7];
-rz(7*pi/5) q[7];
-sx q[7];
-rz(5*pi/2) q[7];
-rz(-pi/2) q[8];
-sx q[8];
-rz(pi/2) q[8];
-cx q[8],q[7];
-rz(-pi) q[8];
-sx q[8];
-rz(-pi/2) q[8];
-cx q[7],q[8];
-rz(pi/2) q[7];
-sx q[7];
-rz(2.0420352) q[7];
-sx q[7];
-rz(-pi/2) q[8];
-sx q[8];
-rz(-2.6703538) q[8];
-cx q[7],q[8];
-rz(pi/2) q[7];
-sx q[7];
-rz(7*pi/5) q[7];
-sx q[7];
-rz(5*pi/2) q[7];
-rz(-pi/2) q[8];
-sx q[8];
-rz(pi/2) q[8];
-cx q[8],q[7];
-rz(-pi) q[8];
-sx q[8];
-rz(-pi/2) q[8];
-cx q[7],q[8];
-rz(pi/2) q[7];
-rz(pi/2) q[8];
-sx q[8];
-cx q[7],q[8];
-rz(pi/2) q[7];
-sx q[7];
-rz(7*pi/5) q[7];
-sx q[7];
-rz(5*pi/2) q[7];
-rz(-pi/2) q[8];
-sx q[8];
-rz(pi/2) q[8];
-cx q[8],q[7];
-rz(-pi) q[8];
-sx q[8];
-rz(-pi/2) q[8];
-cx q[7],q[8];
-rz(-0.19043683) q[7];
-sx q[7];
-rz(-1.9392357) q[7];
-sx q[7];
-rz(-1.6179568) q[7];
-cx q[6],q[7];
-rz(pi/2) q[6];
-sx q[6];
-rz(3.29867228626928) q[6];
-sx q[6];
-rz(5*pi/2) q[6];
-rz(-pi/2) q[7];
-sx q[7];
-rz(pi/2) q[7];
-cx q[7],q[6];
-rz(-pi) q[7];
-sx q[7];
-rz(-pi/2) q[7];
-cx q[6],q[7];
-rz(pi/2) q[6];
-sx q[6];
-rz(-2.984513) q[6];
-sx q[6];
-rz(pi/2) q[6];
-rz(0.68021498) q[7];
-sx q[7];
-rz(-1.1421643) q[7];
-sx q[7];
-rz(2.6670111) q[7];
-cx q[6],q[7];
-rz(pi/2) q[6];
-sx q[6];
-rz(3.29867228626928) q[6];
-sx q[6];
-rz(5*pi/2) q[6];
-rz(-pi/2) q[7];
-sx q[7];
-rz(pi/2) q[7];
-cx q[7],q[6];
-rz(-pi) q[7];
-sx q[7];
-rz(-pi/2) q[7];
-cx q[6],q[7];
-rz(-0.53138965) q[6];
-sx q[6];
-rz(-2.1798132) q[6];
-sx q[6];
-rz(-0.77184216) q[6];
-cx q[5],q[6];
-rz(pi/2) q[5];
-sx q[5];
-rz(3.29867228626928) q[5];
-sx q[5];
-rz(5*pi/2) q[5];
-rz(-pi/2) q[6];
-sx q[6];
-rz(pi/2) q[6];
-cx q[6],q[5];
-rz(-pi) q[6];
-sx q[6];
-rz(-pi/2) q[6];
-cx q[5],q[6];
-rz(pi/2) q[5];
-sx q[5];
-rz(-2.984513) q[5];
-sx q[5];
-rz(pi/2) q[5];
-rz(0.68021498) q[6];
-sx q[6];
-rz(-1.1421643) q[6];
-sx q[6];
-rz(2.6670111) q[6];
-cx q[5],q[6];
-rz(pi/2) q[5];
-sx q[5];
-rz(3.29867228626928) q[5];
-sx q[5];
-rz(5*pi/2) q[5];
-rz(-pi/2) q[6];
-sx q[6];
-rz(pi/2) q[6];
-cx q[6],q[5];
-rz(-pi) q[6];
-sx q[6];
-rz(-pi/2) q[6];
-cx q[5],q[6];
-rz(-0.089094174) q[5];
-sx q[5];
-rz(-1.024559) q[5];
-sx q[5];
-rz(1.8031906) q[5];
-cx q[4],q[5];
-rz(pi/2) q[4];
-sx q[4];
-rz(7*pi/5) q[4];
-sx q[4];
-rz(5*pi/2) q[4];
-rz(-pi/2) q[5];
-sx q[5];
-rz(pi/2) q[5];
-cx q[5],q[4];
-rz(-pi) q[5];
-sx q[5];
-rz(-pi/2) q[5];
-cx q[4],q[5];
-rz(pi/2) q[4];
-sx q[4];
-rz(2.0420352) q[4];
-sx q[4];
-rz(-pi/2) q[5];
-sx q[5];
-rz(-2.6703538) q[5];
-cx q[4],q[5];
-rz(pi/2) q[4];
-sx q[4];
-rz(7*pi/5) q[4];
-sx q[4];
-rz(5*pi/2) q[4];
-rz(-pi/2) q[5];
-sx q[5];
-rz(pi/2) q[5];
-cx q[5],q[4];
-rz(-pi) q[5];
-sx q[5];
-rz(-pi/2) q[5];
-cx q[4],q[5];
-rz(pi/2) q[4];
-rz(pi/2) q[5];
-sx q[5];
-cx q[4],q[5];
-rz(pi/2) q[4];
-sx q[4];
-rz(7*pi/5) q[4];
-sx q[4];
-rz(5*pi/2) q[4];
-rz(-pi/2) q[5];
-sx q[5];
-rz(pi/2) q[5];
-cx q[5],q[4];
-rz(-pi) q[5];
-sx q[5];
-rz(-pi/2) q[5];
-cx q[4],q[5];
-rz(-0.77207828) q[4];
-sx q[4];
-rz(-0.83518121) q[4];
-sx q[4];
-rz(0.84575039) q[4];
-rz(2.3695144) q[5];
-sx q[5];
-rz(-0.83518121) q[5];
-sx q[5];
-rz(-2.2958423) q[5];
-rz(-2.5935896) q[6];
-sx q[6];
-rz(-1.4946939) q[6];
-sx q[6];
-rz(0.27876616) q[6];
-rz(pi/2) q[7];
-sx q[7];
-rz(-1.727876) q[7];
-sx q[7];
-rz(-pi/2) q[7];
-rz(-2.1495275) q[8];
-sx q[8];
-rz(-2.2330665) q[8];
-sx q[8];
-rz(2.1090252) q[8];
-rz(2.3695144) q[9];
-sx q[9];
-rz(-0.83518121) q[9];
-sx q[9];
-rz(-2.2958423) q[9];
-rz(-0.79715247) q[10];
-sx q[10];
-rz(-0.55272686) q[10];
-sx q[10];
-rz(1.9734881) q[10];
-rz(-0.79715247) q[11];
-sx q[11];
-rz(-0.55272686) q[11];
-sx q[11];
-rz(-1.1681045) q[11];
-cx q[10],q[11];
-rz(pi/2) q[10];
-sx q[10];
-rz(7*pi/5) q[10];
-sx q[10];
-rz(5*pi/2) q[10];
-rz(-pi/2) q[11];
-sx q[11];
-rz(pi/2) q[11];
-cx q[11],q[10];
-rz(-pi) q[11];
-sx q[11];
-rz(-pi/2) q[11];
-cx q[10],q[11];
-rz(pi/2) q[10];
-sx q[10];
-rz(2.0420352) q[10];
-sx q[10];
-rz(-pi/2) q[11];
-sx q[11];
-rz(-2.6703538) q[11];
-cx q[10],q[11];
-rz(pi/2) q[10];
-sx q[10];
-rz(7*pi/5) q[10];
-sx q[10];
-rz(5*pi/2) q[10];
-rz(-pi/2) q[11];
-sx q[11];
-rz(pi/2) q[11];
-cx q[11],q[10];
-rz(-pi) q[11];
-sx q[11];
-rz(-pi/2) q[11];
-cx q[10],q[11];
-rz(pi/2) q[10];
-rz(pi/2) q[11];
-sx q[11];
-cx q[10],q[11];
-rz(pi/2) q[10];
-sx q[10];
-rz(7*pi/5) q[10];
-sx q[10];
-rz(5*pi/2) q[10];
-rz(-pi/2) q[11];
-sx q[11];
-rz(pi/2) q[11];
-cx q[11],q[10];
-rz(-pi) q[11];
-sx q[11];
-rz(-pi/2) q[11];
-cx q[10],q[11];
-rz(-0.77207828) q[10];
-sx q[10];
-rz(-0.83518121) q[10];
-sx q[10];
-rz(0.84575039) q[10];
-rz(2.3695144) q[11];
-sx q[11];
-rz(-0.83518121) q[11];
-sx q[11];
-rz(-2.2958423) q[11];
-cx q[9],q[10];
-rz(-pi/2) q[10];
-sx q[10];
-rz(pi/2) q[10];
-rz(pi/2) q[9];
-sx q[9];
-rz(7*pi/5) q[9];
-sx q[9];
-rz(5*pi/2) q[9];
-cx q[10],q[9];
-rz(-pi) q[10];
-sx q[10];
-rz(-pi/2) q[10];
-cx q[9],q[10];
-rz(-pi/2) q[10];
-sx q[10];
-rz(-2.6703538) q[10];
-rz(pi/2) q[9];
-sx q[9];
-rz(2.0420352) q[9];
-sx q[9];
-cx q[9],q[10];
-rz(-pi/2) q[10];
-sx q[10];
-rz(pi/2) q[10];
-rz(pi/2) q[9];
-sx q[9];
-rz(7*pi/5) q[9];
-sx q[9];
-rz(5*pi/2) q[9];
-cx q[10],q[9];
-rz(-pi) q[10];
-sx q[10];
-rz(-pi/2) q[10];
-cx q[9],q[10];
-rz(pi/2) q[10];
-sx q[10];
-rz(pi/2) q[9];
-cx q[9],q[10];
-rz(-pi/2) q[10];
-sx q[10];
-rz(pi/2) q[10];
-rz(pi/2) q[9];
-sx q[9];
-rz(7*pi/5) q[9];
-sx q[9];
-rz(5*pi/2) q[9];
-cx q[10],q[9];
-rz(-pi) q[10];
-sx q[10];
-rz(-pi/2) q[10];
-cx q[9],q[10];
-rz(-2.1495275) q[10];
-sx q[10];
-rz(-2.2330665) q[10];
-sx q[10];
-rz(2.1090252) q[10];
-rz(-0.19043683) q[9];
-sx q[9];
-rz(-1.9392357) q[9];
-sx q[9];
-rz(-1.6179568) q[9];
-cx q[8],q[9];
-rz(pi/2) q[8];
-sx q[8];
-rz(3.29867228626928) q[8];
-sx q[8];
-rz(5*pi/2) q[8];
-rz(-pi/2) q[9];
-sx q[9];
-rz(pi/2) q[9];
-cx q[9],q[8];
-rz(-pi) q[9];
-sx q[9];
-rz(-pi/2) q[9];
-cx q[8],q[9];
-rz(pi/2) q[8];
-sx q[8];
-rz(-2.984513) q[8];
-sx q[8];
-rz(pi/2) q[8];
-rz(0.68021498) q[9];
-sx q[9];
-rz(-1.1421643) q[9];
-sx q[9];
-rz(2.6670111) q[9];
-cx q[8],q[9];
-rz(pi/2) q[8];
-sx q[8];
-rz(3.29867228626928) q[8];
-sx q[8];
-rz(5*pi/2) q[8];
-rz(-pi/2) q[9];
-sx q[9];
-rz(pi/2) q[9];
-cx q[9],q[8];
-rz(-pi) q[9];
-sx q[9];
-rz(-pi/2) q[9];
-cx q[8],q[9];
-rz(-0.53138965) q[8];
-sx q[8];
-rz(-2.1798132) q[8];
-sx q[8];
-rz(-0.77184216) q[8];
-cx q[7],q[8];
-rz(pi/2) q[7];
-sx q[7];
-rz(3.29867228626928) q[7];
-sx q[7];
-rz(5*pi/2) q[7];
-rz(-pi/2) q[8];
-sx q[8];
-rz(pi/2) q[8];
-cx q[8],q[7];
-rz(-pi) q[8];
-sx q[8];
-rz(-pi/2) q[8];
-cx q[7],q[8];
-rz(pi/2) q[7];
-sx q[7];
-rz(-2.984513) q[7];
-sx q[7];
-rz(pi/2) q[7];
-rz(0.68021498) q[8];
-sx q[8];
-rz(-1.1421643) q[8];
-sx q[8];
-rz(2.6670111) q[8];
-cx q[7],q[8];
-rz(pi/2) q[7];
-sx q[7];
-rz(3.29867228626928) q[7];
-sx q[7];
-rz(5*pi/2) q[7];
-rz(-pi/2) q[8];
-sx q[8];
-rz(pi/2) q[8];
-cx q[8],q[7];
-rz(-pi) q[8];
-sx q[8];
-rz(-pi/2) q[8];
-cx q[7],q[8];
-rz(-0.089094174) q[7];
-sx q[7];
-rz(-1.024559) q[7];
-sx q[7];
-rz(1.8031906) q[7];
-cx q[6],q[7];
-rz(pi/2) q[6];
-sx q[6];
-rz(7*pi/5) q[6];
-sx q[6];
-rz(5*pi/2) q[6];
-rz(-pi/2) q[7];
-sx q[7];
-rz(pi/2) q[7];
-cx q[7],q[6];
-rz(-pi) q[7];
-sx q[7];
-rz(-pi/2) q[7];
-cx q[6],q[7];
-rz(pi/2) q[6];
-sx q[6];
-rz(2.0420352) q[6];
-sx q[6];
-rz(-pi/2) q[7];
-sx q[7];
-rz(-2.6703538) q[7];
-cx q[6],q[7];
-rz(pi/2) q[6];
-sx q[6];
-rz(7*pi/5) q[6];
-sx q[6];
-rz(5*pi/2) q[6];
-rz(-pi/2) q[7];
-sx q[7];
-rz(pi/2) q[7];
-cx q[7],q[6];
-rz(-pi) q[7];
-sx q[7];
-rz(-pi/2) q[7];
-cx q[6],q[7];
-rz(pi/2) q[6];
-rz(pi/2) q[7];
-sx q[7];
-cx q[6],q[7];
-rz(pi/2) q[6];
-sx q[6];
-rz(7*pi/5) q[6];
-sx q[6];
-rz(5*pi/2) q[6];
-rz(-pi/2) q[7];
-sx q[7];
-rz(pi/2) q[7];
-cx q[7],q[6];
-rz(-pi) q[7];
-sx q[7];
-rz(-pi/2) q[7];
-cx q[6],q[7];
-rz(-0.77207828) q[6];
-sx q[6];
-rz(-0.83518121) q[6];
-sx q[6];
-rz(0.84575039) q[6];
-cx q[5],q[6];
-rz(pi/2) q[5];
-sx q[5];
-rz(7*pi/5) q[5];
-sx q[5];
-rz(5*pi/2) q[5];
-rz(-pi/2) q[6];
-sx q[6];
-rz(pi/2) q[6];
-cx q[6],q[5];
-rz(-pi) q[6];
-sx q[6];
-rz(-pi/2) q[6];
-cx q[5],q[6];
-rz(pi/2) q[5];
-sx q[5];
-rz(2.0420352) q[5];
-sx q[5];
-rz(-pi/2) q[6];
-sx q[6];
-rz(-2.6703538) q[6];
-cx q[5],q[6];
-rz(pi/2) q[5];
-sx q[5];
-rz(7*pi/5) q[5];
-sx q[5];
-rz(5*pi/2) q[5];
-rz(-pi/2) q[6];
-sx q[6];
-rz(pi/2) q[6];
-cx q[6],q[5];
-rz(-pi) q[6];
-sx q[6];
-rz(-pi/2) q[6];
-cx q[5],q[6];
-rz(pi/2) q[5];
-rz(pi/2) q[6];
-sx q[6];
-cx q[5],q[6];
-rz(pi/2) q[5];
-sx q[5];
-rz(7*pi/5) q[5];
-sx q[5];
-rz(5*pi/2) q[5];
-rz(-pi/2) q[6];
-sx q[6];
-rz(pi/2) q[6];
-cx q[6],q[5];
-rz(-pi) q[6];
-sx q[6];
-rz(-pi/2) q[6];
-cx q[5],q[6];
-rz(2.914702) q[5];
-sx q[5];
-rz(-1.9869531) q[5];
-sx q[5];
-rz(-1.5226946) q[5];
-rz(-0.22689068) q[6];
-sx q[6];
-rz(-1.9869531) q[6];
-sx q[6];
-rz(-1.5226946) q[6];
-rz(2.3695144) q[7];
-sx q[7];
-rz(-0.83518121) q[7];
-sx q[7];
-rz(-2.2958423) q[7];
-rz(-2.5935896) q[8];
-sx q[8];
-rz(-1.4946939) q[8];
-sx q[8];
-rz(0.27876616) q[8];
-rz(pi/2) q[9];
-sx q[9];
-rz(-1.727876) q[9];
-sx q[9];
-rz(-pi/2) q[9];
-rz(-0.79715247) q[12];
-sx q[12];
-rz(-0.55272686) q[12];
-sx q[12];
-rz(1.9734881) q[12];
-rz(-0.79715247) q[13];
-sx q[13];
-rz(-0.55272686) q[13];
-sx q[13];
-rz(-1.1681045) q[13];
-cx q[12],q[13];
-rz(pi/2) q[12];
-sx q[12];
-rz(7*pi/5) q[12];
-sx q[12];
-rz(5*pi/2) q[12];
-rz(-pi/2) q[13];
-sx q[13];
-rz(pi/2) q[13];
-cx q[13],q[12];
-rz(-pi) q[13];
-sx q[13];
-rz(-pi/2) q[13];
-cx q[12],q[13];
-rz(pi/2) q[12];
-sx q[12];
-rz(2.0420352) q[12];
-sx q[12];
-rz(-pi/2) q[13];
-sx q[13];
-rz(-2.6703538) q[13];
-cx q[12],q[13];
-rz(pi/2) q[12];
-sx q[12];
-rz(7*pi/5) q[12];
-sx q[12];
-rz(5*pi/2) q[12];
-rz(-pi/2) q[13];
-sx q[13];
-rz(pi/2) q[13];
-cx q[13],q[12];
-rz(-pi) q[13];
-sx q[13];
-rz(-pi/2) q[13];
-cx q[12],q[13];
-rz(pi/2) q[12];
-rz(pi/2) q[13];
-sx q[13];
-cx q[12],q[13];
-rz(pi/2) q[12];
-sx q[12];
-rz(7*pi/5) q[12];
-sx q[12];
-rz(5*pi/2) q[12];
-rz(-pi/2) q[13];
-sx q[13];
-rz(pi/2) q[13];
-cx q[13],q[12];
-rz(-pi) q[13];
-sx q[13];
-rz(-pi/2) q[13];
-cx q[12],q[13];
-rz(-0.77207828) q[12];
-sx q[12];
-rz(-0.83518121) q[12];
-sx q[12];
-rz(0.84575039) q[12];
-cx q[11],q[12];
-rz(pi/2) q[11];
-sx q[11];
-rz(7*pi/5) q[11];
-sx q[11];
-rz(5*pi/2) q[11];
-rz(-pi/2) q[12];
-sx q[12];
-rz(pi/2) q[12];
-cx q[12],q[11];
-rz(-pi) q[12];
-sx q[12];
-rz(-pi/2) q[12];
-cx q[11],q[12];
-rz(pi/2) q[11];
-sx q[11];
-rz(2.0420352) q[11];
-sx q[11];
-rz(-pi/2) q[12];
-sx q[12];
-rz(-2.6703538) q[12];
-cx q[11],q[12];
-rz(pi/2) q[11];
-sx q[11];
-rz(7*pi/5) q[11];
-sx q[11];
-rz(5*pi/2) q[11];
-rz(-pi/2) q[12];
-sx q[12];
-rz(pi/2) q[12];
-cx q[12],q[11];
-rz(-pi) q[12];
-sx q[12];
-rz(-pi/2) q[12];
-cx q[11],q[12];
-rz(pi/2) q[11];
-rz(pi/2) q[12];
-sx q[12];
-cx q[11],q[12];
-rz(pi/2) q[11];
-sx q[11];
-rz(7*pi/5) q[11];
-sx q[11];
-rz(5*pi/2) q[11];
-rz(-pi/2) q[12];
-sx q[12];
-rz(pi/2) q[12];
-cx q[12],q[11];
-rz(-pi) q[12];
-sx q[12];
-rz(-pi/2) q[12];
-cx q[11],q[12];
-rz(-0.19043683) q[11];
-sx q[11];
-rz(-1.9392357) q[11];
-sx q[11];
-rz(-1.6179568) q[11];
-cx q[10],q[11];
-rz(pi/2) q[10];
-sx q[10];
-rz(3.29867228626928) q[10];
-sx q[10];
-rz(5*pi/2) q[10];
-rz(-pi/2) q[11];
-sx q[11];
-rz(pi/2) q[11];
-cx q[11],q[10];
-rz(-pi) q[11];
-sx q[11];
-rz(-pi/2) q[11];
-cx q[10],q[11];
-rz(pi/2) q[10];
-sx q[10];
-rz(-2.984513) q[10];
-sx q[10];
-rz(pi/2) q[10];
-rz(0.68021498) q[11];
-sx q[11];
-rz(-1.1421643) q[11];
-sx q[11];
-rz(2.6670111) q[11];
-cx q[10],q[11];
-rz(pi/2) q[10];
-sx q[10];
-rz(3.29867228626928) q[10];
-sx q[10];
-rz(5*pi/2) q[10];
-rz(-pi/2) q[11];
-sx q[11];
-rz(pi/2) q[11];
-cx q[11],q[10];
-rz(-pi) q[11];
-sx q[11];
-rz(-pi/2) q[11];
-cx q[10],q[11];
-rz(-0.53138965) q[10];
-sx q[10];
-rz(-2.1798132) q[10];
-sx q[10];
-rz(-0.77184216) q[10];
-rz(pi/2) q[11];
-sx q[11];
-rz(-1.727876) q[11];
-sx q[11];
-rz(-pi/2) q[11];
-rz(-2.1495275) q[12];
-sx q[12];
-rz(-2.2330665) q[12];
-sx q[12];
-rz(2.1090252) q[12];
-rz(2.3695144) q[13];
-sx q[13];
-rz(-0.83518121) q[13];
-sx q[13];
-rz(-2.2958423) q[13];
-cx q[9],q[10];
-rz(-pi/2) q[10];
-sx q[10];
-rz(pi/2) q[10];
-rz(pi/2) q[9];
-sx q[9];
-rz(3.29867228626928) q[9];
-sx q[9];
-rz(5*pi/2) q[9];
-cx q[10],q[9];
-rz(-pi) q[10];
-sx q[10];
-rz(-pi/2) q[10];
-cx q[9],q[10];
-rz(0.68021498) q[10];
-sx q[10];
-rz(-1.1421643) q[10];
-sx q[10];
-rz(2.6670111) q[10];
-rz(pi/2) q[9];
-sx q[9];
-rz(-2.984513) q[9];
-sx q[9];
-rz(pi/2) q[9];
-cx q[9],q[10];
-rz(-pi/2) q[10];
-sx q[10];
-rz(pi/2) q[10];
-rz(pi/2) q[9];
-sx q[9];
-rz(3.29867228626928) q[9];
-sx q[9];
-rz(5*pi/2) q[9];
-cx q[10],q[9];
-rz(-pi) q[10];
-sx q[10];
-rz(-pi/2) q[10];
-cx q[9],q[10];
-rz(-2.5935896) q[10];
-sx q[10];
-rz(-1.4946939) q[10];
-sx q[10];
-rz(0.27876616) q[10];
-rz(-0.089094174) q[9];
-sx q[9];
-rz(-1.024559) q[9];
-sx q[9];
-rz(1.8031906) q[9];
-cx q[8],q[9];
-rz(pi/2) q[8];
-sx q[8];
-rz(7*pi/5) q[8];
-sx q[8];
-rz(5*pi/2) q[8];
-rz(-pi/2) q[9];
-sx q[9];
-rz(pi/2) q[9];
-cx q[9],q[8];
-rz(-pi) q[9];
-sx q[9];
-rz(-pi/2) q[9];
-cx q[8],q[9];
-rz(pi/2) q[8];
-sx q[8];
-rz(2.0420352) q[8];
-sx q[8];
-rz(-pi/2) q[9];
-sx q[9];
-rz(-2.6703538) q[9];
-cx q[8],q[9];
-rz(pi/2) q[8];
-sx q[8];
-rz(7*pi/5) q[8];
-sx q[8];
-rz(5*pi/2) q[8];
-rz(-pi/2) q[9];
-sx q[9];
-rz(pi/2) q[9];
-cx q[9],q[8];
-rz(-pi) q[9];
-sx q[9];
-rz(-pi/2) q[9];
-cx q[8],q[9];
-rz(pi/2) q[8];
-rz(pi/2) q[9];
-sx q[9];
-cx q[8],q[9];
-rz(pi/2) q[8];
-sx q[8];
-rz(7*pi/5) q[8];
-sx q[8];
-rz(5*pi/2) q[8];
-rz(-pi/2) q[9];
-sx q[9];
-rz(pi/2) q[9];
-cx q[9],q[8];
-rz(-pi) q[9];
-sx q[9];
-rz(-pi/2) q[9];
-cx q[8],q[9];
-rz(-0.77207828) q[8];
-sx q[8];
-rz(-0.83518121) q[8];
-sx q[8];
-rz(0.84575039) q[8];
-cx q[7],q[8];
-rz(pi/2) q[7];
-sx q[7];
-rz(7*pi/5) q[7];
-sx q[7];
-rz(5*pi/2) q[7];
-rz(-pi/2) q[8];
-sx q[8];
-rz(pi/2) q[8];
-cx q[8],q[7];
-rz(-pi) q[8];
-sx q[8];
-rz(-pi/2) q[8];
-cx q[7],q[8];
-rz(pi/2) q[7];
-sx q[7];
-rz(2.0420352) q[7];
-sx q[7];
-rz(-pi/2) q[8];
-sx q[8];
-rz(-2.6703538) q[8];
-cx q[7],q[8];
-rz(pi/2) q[7];
-sx q[7];
-rz(7*pi/5) q[7];
-sx q[7];
-rz(5*pi/2) q[7];
-rz(-pi/2) q[8];
-sx q[8];
-rz(pi/2) q[8];
-cx q[8],q[7];
-rz(-pi) q[8];
-sx q[8];
-rz(-pi/2) q[8];
-cx q[7],q[8];
-rz(pi/2) q[7];
-rz(pi/2) q[8];
-sx q[8];
-cx q[7],q[8];
-rz(pi/2) q[7];
-sx q[7];
-rz(7*pi/5) q[7];
-sx q[7];
-rz(5*pi/2) q[7];
-rz(-pi/2) q[8];
-sx q[8];
-rz(pi/2) q[8];
-cx q[8],q[7];
-rz(-pi) q[8];
-sx q[8];
-rz(-pi/2) q[8];
-cx q[7],q[8];
-rz(2.914702) q[7];
-sx q[7];
-rz(-1.9869531) q[7];
-sx q[7];
-rz(-1.5226946) q[7];
-rz(-0.22689068) q[8];
-sx q[8];
-rz(-1.9869531) q[8];
-sx q[8];
-rz(-1.5226946) q[8];
-rz(2.3695144) q[9];
-sx q[9];
-rz(-0.83518121) q[9];
-sx q[9];
-rz(-2.2958423) q[9];
-rz(-0.79715247) q[14];
-sx q[14];
-rz(-0.55272686) q[14];
-sx q[14];
-rz(1.9734881) q[14];
-rz(-0.79715247) q[15];
-sx q[15];
-rz(-0.55272686) q[15];
-sx q[15];
-rz(-1.1681045) q[15];
-cx q[14],q[15];
-rz(pi/2) q[14];
-sx q[14];
-rz(7*pi/5) q[14];
-sx q[14];
-rz(5*pi/2) q[14];
-rz(-pi/2) q[15];
-sx q[15];
-rz(pi/2) q[15];
-cx q[15],q[14];
-rz(-pi) q[15];
-sx q[15];
-rz(-pi/2) q[15];
-cx q[14],q[15];
-rz(pi/2) q[14];
-sx q[14];
-rz(2.0420352) q[14];
-sx q[14];
-rz(-pi/2) q[15];
-sx q[15];
-rz(-2.6703538) q[15];
-cx q[14],q[15];
-rz(pi/2) q[14];
-sx q[14];
-rz(7*pi/5) q[14];
-sx q[14];
-rz(5*pi/2) q[14];
-rz(-pi/2) q[15];
-sx q[15];
-rz(pi/2) q[15];
-cx q[15],q[14];
-rz(-pi) q[15];
-sx q[15];
-rz(-pi/2) q[15];
-cx q[14],q[15];
-rz(pi/2) q[14];
-rz(pi/2) q[15];
-sx q[15];
-cx q[14],q[15];
-rz(pi/2) q[14];
-sx q[14];
-rz(7*pi/5) q[14];
-sx q[14];
-rz(5*pi/2) q[14];
-rz(-pi/2) q[15];
-sx q[15];
-rz(pi/2) q[15];
-cx q[15],q[14];
-rz(-pi) q[15];
-sx q[15];
-rz(-pi/2) q[15];
-cx q[14],q[15];
-rz(-0.77207828) q[14];
-sx q[14];
-rz(-0.83518121) q[14];
-sx q[14];
-rz(0.84575039) q[14];
-cx q[13],q[14];
-rz(pi/2) q[13];
-sx q[13];
-rz(7*pi/5) q[13];
-sx q[13];
-rz(5*pi/2) q[13];
-rz(-pi/2) q[14];
-sx q[14];
-rz(pi/2) q[14];
-cx q[14],q[13];
-rz(-pi) q[14];
-sx q[14];
-rz(-pi/2) q[14];
-cx q[13],q[14];
-rz(pi/2) q[13];
-sx q[13];
-rz(2.0420352) q[13];
-sx q[13];
-rz(-pi/2) q[14];
-sx q[14];
-rz(-2.6703538) q[14];
-cx q[13],q[14];
-rz(pi/2) q[13];
-sx q[13];
-rz(7*pi/5) q[13];
-sx q[13];
-rz(5*pi/2) q[13];
-rz(-pi/2) q[14];
-sx q[14];
-rz(pi/2) q[14];
-cx q[14],q[13];
-rz(-pi) q[14];
-sx q[14];
-rz(-pi/2) q[14];
-cx q[13],q[14];
-rz(pi/2) q[13];
-rz(pi/2) q[14];
-sx q[14];
-cx q[13],q[14];
-rz(pi/2) q[13];
-sx q[13];
-rz(7*pi/5) q[13];
-sx q[13];
-rz(5*pi/2) q[13];
-rz(-pi/2) q[14];
-sx q[14];
-rz(pi/2) q[14];
-cx q[14],q[13];
-rz(-pi) q[14];
-sx q[14];
-rz(-pi/2) q[14];
-cx q[13],q[14];
-rz(-0.19043683) q[13];
-sx q[13];
-rz(-1.9392357) q[13];
-sx q[13];
-rz(-1.6179568) q[13];
-cx q[12],q[13];
-rz(pi/2) q[12];
-sx q[12];
-rz(3.29867228626928) q[12];
-sx q[12];
-rz(5*pi/2) q[12];
-rz(-pi/2) q[13];
-sx q[13];
-rz(pi/2) q[13];
-cx q[13],q[12];
-rz(-pi) q[13];
-sx q[13];
-rz(-pi/2) q[13];
-cx q[12],q[13];
-rz(pi/2) q[12];
-sx q[12];
-rz(-2.984513) q[12];
-sx q[12];
-rz(pi/2) q[12];
-rz(0.68021498) q[13];
-sx q[13];
-rz(-1.1421643) q[13];
-sx q[13];
-rz(2.6670111) q[13];
-cx q[12],q[13];
-rz(pi/2) q[12];
-sx q[12];
-rz(3.29867228626928) q[12];
-sx q[12];
-rz(5*pi/2) q[12];
-rz(-pi/2) q[13];
-sx q[13];
-rz(pi/2) q[13];
-cx q[13],q[12];
-rz(-pi) q[13];
-sx q[13];
-rz(-pi/2) q[13];
-cx q[12],q[13];
-rz(-0.53138965) q[12];
-sx q[12];
-rz(-2.1798132) q[12];
-sx q[12];
-rz(-0.77184216) q[12];
-cx q[11],q[12];
-rz(pi/2) q[11];
-sx q[11];
-rz(3.29867228626928) q[11];
-sx q[11];
-rz(5*pi/2) q[11];
-rz(-pi/2) q[12];
-sx q[12];
-rz(pi/2) q[12];
-cx q[12],q[11];
-rz(-pi) q[12];
-sx q[12];
-rz(-pi/2) q[12];
-cx q[11],q[12];
-rz(pi/2) q[11];
-sx q[11];
-rz(-2.984513) q[11];
-sx q[11];
-rz(pi/2) q[11];
-rz(0.68021498) q[12];
-sx q[12];
-rz(-1.1421643) q[12];
-sx q[12];
-rz(2.6670111) q[12];
-cx q[11],q[12];
-rz(pi/2) q[11];
-sx q[11];
-rz(3.29867228626928) q[11];
-sx q[11];
-rz(5*pi/2) q[11];
-rz(-pi/2) q[12];
-sx q[12];
-rz(pi/2) q[12];
-cx q[12],q[11];
-rz(-pi) q[12];
-sx q[12];
-rz(-pi/2) q[12];
-cx q[11],q[12];
-rz(-0.089094174) q[11];
-sx q[11];
-rz(-1.024559) q[11];
-sx q[11];
-rz(1.8031906) q[11];
-cx q[10],q[11];
-rz(pi/2) q[10];
-sx q[10];
-rz(7*pi/5) q[10];
-sx q[10];
-rz(5*pi/2) q[10];
-rz(-pi/2) q[11];
-sx q[11];
-rz(pi/2) q[11];
-cx q[11],q[10];
-rz(-pi) q[11];
-sx q[11];
-rz(-pi/2) q[11];
-cx q[10],q[11];
-rz(pi/2) q[10];
-sx q[10];
-rz(2.0420352) q[10];
-sx q[10];
-rz(-pi/2) q[11];
-sx q[11];
-rz(-2.6703538) q[11];
-cx q[10],q[11];
-rz(pi/2) q[10];
-sx q[10];
-rz(7*pi/5) q[10];
-sx q[10];
-rz(5*pi/2) q[10];
-rz(-pi/2) q[11];
-sx q[11];
-rz(pi/2) q[11];
-cx q[11],q[10];
-rz(-pi) q[11];
-sx q[11];
-rz(-pi/2) q[11];
-cx q[10],q[11];
-rz(pi/2) q[10];
-rz(pi/2) q[11];
-sx q[11];
-cx q[10],q[11];
-rz(pi/2) q[10];
-sx q[10];
-rz(7*pi/5) q[10];
-sx q[10];
-rz(5*pi/2) q[10];
-rz(-pi/2) q[11];
-sx q[11];
-rz(pi/2) q[11];
-cx q[11],q[10];
-rz(-pi) q[11];
-sx q[11];
-rz(-pi/2) q[11];
-cx q[10],q[11];
-rz(-0.77207828) q[10];
-sx q[10];
-rz(-0.83518121) q[10];
-sx q[10];
-rz(0.84575039) q[10];
-rz(2.3695144) q[11];
-sx q[11];
-rz(-0.83518121) q[11];
-sx q[11];
-rz(-2.2958423) q[11];
-rz(-2.5935896) q[12];
-sx q[12];
-rz(-1.4946939) q[12];
-sx q[12];
-rz(0.27876616) q[12];
-rz(pi/2) q[13];
-sx q[13];
-rz(-1.727876) q[13];
-sx q[13];
-rz(-pi/2) q[13];
-rz(-2.1495275) q[14];
-sx q[14];
-rz(-2.2330665) q[14];
-sx q[14];
-rz(2.1090252) q[14];
-rz(2.3695144) q[15];
-sx q[15];
-rz(-0.83518121) q[15];
-sx q[15];
-rz(-2.2958423) q[15];
-cx q[15],q[0];
-rz(-pi/2) q[0];
-sx q[0];
-rz(pi/2) q[0];
-rz(pi/2) q[15];
-sx q[15];
-rz(7*pi/5) q[15];
-sx q[15];
-rz(5*pi/2) q[15];
-cx q[0],q[15];
-rz(-pi) q[0];
-sx q[0];
-rz(-pi/2) q[0];
-cx q[15],q[0];
-rz(-pi/2) q[0];
-sx q[0];
-rz(-2.6703538) q[0];
-rz(pi/2) q[15];
-sx q[15];
-rz(2.0420352) q[15];
-sx q[15];
-cx q[15],q[0];
-rz(-pi/2) q[0];
-sx q[0];
-rz(pi/2) q[0];
-rz(pi/2) q[15];
-sx q[15];
-rz(7*pi/5) q[15];
-sx q[15];
-rz(5*pi/2) q[15];
-cx q[0],q[15];
-rz(-pi) q[0];
-sx q[0];
-rz(-pi/2) q[0];
-cx q[15],q[0];
-rz(pi/2) q[0];
-sx q[0];
-rz(pi/2) q[15];
-cx q[15],q[0];
-rz(-pi/2) q[0];
-sx q[0];
-rz(pi/2) q[0];
-rz(pi/2) q[15];
-sx q[15];
-rz(7*pi/5) q[15];
-sx q[15];
-rz(5*pi/2) q[15];
-cx q[0],q[15];
-rz(-pi) q[0];
-sx q[0];
-rz(-pi/2) q[0];
-cx q[15],q[0];
-rz(-2.1495275) q[0];
-sx q[0];
-rz(-2.2330665) q[0];
-sx q[0];
-rz(2.1090252) q[0];
-cx q[0],q[1];
-rz(pi/2) q[0];
-sx q[0];
-rz(3.29867228626928) q[0];
-sx q[0];
-rz(5*pi/2) q[0];
-rz(-pi/2) q[1];
-sx q[1];
-rz(pi/2) q[1];
-cx q[1],q[0];
-rz(-pi) q[1];
-sx q[1];
-rz(-pi/2) q[1];
-cx q[0],q[1];
-rz(pi/2) q[0];
-sx q[0];
-rz(-2.984513) q[0];
-sx q[0];
-rz(pi/2) q[0];
-rz(0.68021498) q[1];
-sx q[1];
-rz(-1.1421643) q[1];
-sx q[1];
-rz(2.6670111) q[1];
-cx q[0],q[1];
-rz(pi/2) q[0];
-sx q[0];
-rz(3.29867228626928) q[0];
-sx q[0];
-rz(5*pi/2) q[0];
-rz(-pi/2) q[1];
-sx q[1];
-rz(pi/2) q[1];
-cx q[1],q[0];
-rz(-pi) q[1];
-sx q[1];
-rz(-pi/2) q[1];
-cx q[0],q[1];
-rz(-0.53138965) q[0];
-sx q[0];
-rz(-2.1798132) q[0];
-sx q[0];
-rz(-0.77184216) q[0];
-rz(pi/2) q[1];
-sx q[1];
-rz(-1.727876) q[1];
-sx q[1];
-rz(-pi/2) q[1];
-cx q[1],q[2];
-rz(pi/2) q[1];
-sx q[1];
-rz(3.29867228626928) q[1];
-sx q[1];
-rz(5*pi/2) q[1];
-rz(-0.19043683) q[15];
-sx q[15];
-rz(-1.9392357) q[15];
-sx q[15];
-rz(-1.6179568) q[15];
-cx q[14],q[15];
-rz(pi/2) q[14];
-sx q[14];
-rz(3.29867228626928) q[14];
-sx q[14];
-rz(5*pi/2) q[14];
-rz(-pi/2) q[15];
-sx q[15];
-rz(pi/2) q[15];
-cx q[15],q[14];
-rz(-pi) q[15];
-sx q[15];
-rz(-pi/2) q[15];
-cx q[14],q[15];
-rz(pi/2) q[14];
-sx q[14];
-rz(-2.984513) q[14];
-sx q[14];
-rz(pi/2) q[14];
-rz(0.68021498) q[15];
-sx q[15];
-rz(-1.1421643) q[15];
-sx q[15];
-rz(2.6670111) q[15];
-cx q[14],q[15];
-rz(pi/2) q[14];
-sx q[14];
-rz(3.29867228626928) q[14];
-sx q[14];
-rz(5*pi/2) q[14];
-rz(-pi/2) q[15];
-sx q[15];
-rz(pi/2) q[15];
-cx q[15],q[14];
-rz(-pi) q[15];
-sx q[15];
-rz(-pi/2) q[15];
-cx q[14],q[15];
-rz(-0.53138965) q[14];
-sx q[14];
-rz(-2.1798132) q[14];
-sx q[14];
-rz(-0.77184216) q[14];
-cx q[13],q[14];
-rz(pi/2) q[13];
-sx q[13];
-rz(3.29867228626928) q[13];
-sx q[13];
-rz(5*pi/2) q[13];
-rz(-pi/2) q[14];
-sx q[14];
-rz(pi/2) q[14];
-cx q[14],q[13];
-rz(-pi) q[14];
-sx q[14];
-rz(-pi/2) q[14];
-cx q[13],q[14];
-rz(pi/2) q[13];
-sx q[13];
-rz(-2.984513) q[13];
-sx q[13];
-rz(pi/2) q[13];
-rz(0.68021498) q[14];
-sx q[14];
-rz(-1.1421643) q[14];
-sx q[14];
-rz(2.6670111) q[14];
-cx q[13],q[14];
-rz(pi/2) q[13];
-sx q[13];
-rz(3.29867228626928) q[13];
-sx q[13];
-rz(5*pi/2) q[13];
-rz(-pi/2) q[14];
-sx q[14];
-rz(pi/2) q[14];
-cx q[14],q[13];
-rz(-pi) q[14];
-sx q[14];
-rz(-pi/2) q[14];
-cx q[13],q[14];
-rz(-0.089094174) q[13];
-sx q[13];
-rz(-1.024559) q[13];
-sx q[13];
-rz(1.8031906) q[13];
-cx q[12],q[13];
-rz(pi/2) q[12];
-sx q[12];
-rz(7*pi/5) q[12];
-sx q[12];
-rz(5*pi/2) q[12];
-rz(-pi/2) q[13];
-sx q[13];
-rz(pi/2) q[13];
-cx q[13],q[12];
-rz(-pi) q[13];
-sx q[13];
-rz(-pi/2) q[13];
-cx q[12],q[13];
-rz(pi/2) q[12];
-sx q[12];
-rz(2.0420352) q[12];
-sx q[12];
-rz(-pi/2) q[13];
-sx q[13];
-rz(-2.6703538) q[13];
-cx q[12],q[13];
-rz(pi/2) q[12];
-sx q[12];
-rz(7*pi/5) q[12];
-sx q[12];
-rz(5*pi/2) q[12];
-rz(-pi/2) q[13];
-sx q[13];
-rz(pi/2) q[13];
-cx q[13],q[12];
-rz(-pi) q[13];
-sx q[13];
-rz(-pi/2) q[13];
-cx q[12],q[13];
-rz(pi/2) q[12];
-rz(pi/2) q[13];
-sx q[13];
-cx q[12],q[13];
-rz(pi/2) q[12];
-sx q[12];
-rz(7*pi/5) q[12];
-sx q[12];
-rz(5*pi/2) q[12];
-rz(-pi/2) q[13];
-sx q[13];
-rz(pi/2) q[13];
-cx q[13],q[12];
-rz(-pi) q[13];
-sx q[13];
-rz(-pi/2) q[13];
-cx q[12],q[13];
-rz(-0.77207828) q[12];
-sx q[12];
-rz(-0.83518121) q[12];
-sx q[12];
-rz(0.84575039) q[12];
-cx q[11],q[12];
-rz(pi/2) q[11];
-sx q[11];
-rz(7*pi/5) q[11];
-sx q[11];
-rz(5*pi/2) q[11];
-rz(-pi/2) q[12];
-sx q[12];
-rz(pi/2) q[12];
-cx q[12],q[11];
-rz(-pi) q[12];
-sx q[12];
-rz(-pi/2) q[12];
-cx q[11],q[12];
-rz(pi/2) q[11];
-sx q[11];
-rz(2.0420352) q[11];
-sx q[11];
-rz(-pi/2) q[12];
-sx q[12];
-rz(-2.6703538) q[12];
-cx q[11],q[12];
-rz(pi/2) q[11];
-sx q[11];
-rz(7*pi/5) q[11];
-sx q[11];
-rz(5*pi/2) q[11];
-rz(-pi/2) q[12];
-sx q[12];
-rz(pi/2) q[12];
-cx q[12],q[11];
-rz(-pi) q[12];
-sx q[12];
-rz(-pi/2) q[12];
-cx q[11],q[12];
-rz(pi/2) q[11];
-rz(pi/2) q[12];
-sx q[12];
-cx q[11],q[12];
-rz(pi/2) q[11];
-sx q[11];
-rz(7*pi/5) q[11];
-sx q[11];
-rz(5*pi/2) q[11];
-rz(-pi/2) q[12];
-sx q[12];
-rz(pi/2) q[12];
-cx q[12],q[11];
-rz(-pi) q[12];
-sx q[12];
-rz(-pi/2) q[12];
-cx q[11],q[12];
-rz(2.914702) q[11];
-sx q[11];
-rz(-1.9869531) q[11];
-sx q[11];
-rz(-1.5226946) q[11];
-rz(-0.22689068) q[12];
-sx q[12];
-rz(-1.9869531) q[12];
-sx q[12];
-rz(-1.5226946) q[12];
-rz(2.3695144) q[13];
-sx q[13];
-rz(-0.83518121) q[13];
-sx q[13];
-rz(-2.2958423) q[13];
-rz(-2.5935896) q[14];
-sx q[14];
-rz(-1.4946939) q[14];
-sx q[14];
-rz(0.27876616) q[14];
-rz(pi/2) q[15];
-sx q[15];
-rz(-1.727876) q[15];
-sx q[15];
-rz(-pi/2) q[15];
-cx q[15],q[0];
-rz(-pi/2) q[0];
-sx q[0];
-rz(pi/2) q[0];
-rz(pi/2) q[15];
-sx q[15];
-rz(3.29867228626928) q[15];
-sx q[15];
-rz(5*pi/2) q[15];
-cx q[0],q[15];
-rz(-pi) q[0];
-sx q[0];
-rz(-pi/2) q[0];
-cx q[15],q[0];
-rz(0.68021498) q[0];
-sx q[0];
-rz(-1.1421643) q[0];
-sx q[0];
-rz(2.6670111) q[0];
-rz(pi/2) q[15];
-sx q[15];
-rz(-2.984513) q[15];
-sx q[15];
-rz(pi/2) q[15];
-cx q[15],q[0];
-rz(-pi/2) q[0];
-sx q[0];
-rz(pi/2) q[0];
-rz(pi/2) q[15];
-sx q[15];
-rz(3.29867228626928) q[15];
-sx q[15];
-rz(5*pi/2) q[15];
-cx q[0],q[15];
-rz(-pi) q[0];
-sx q[0];
-rz(-pi/2) q[0];
-cx q[15],q[0];
-rz(-2.5935896) q[0];
-sx q[0];
-rz(-1.4946939) q[0];
-sx q[0];
-rz(0.27876616) q[0];
-rz(-0.089094174) q[15];
-sx q[15];
-rz(-1.024559) q[15];
-sx q[15];
-rz(1.8031906) q[15];
-cx q[14],q[15];
-rz(pi/2) q[14];
-sx q[14];
-rz(7*pi/5) q[14];
-sx q[14];
-rz(5*pi/2) q[14];
-rz(-pi/2) q[15];
-sx q[15];
-rz(pi/2) q[15];
-cx q[15],q[14];
-rz(-pi) q[15];
-sx q[15];
-rz(-pi/2) q[15];
-cx q[14],q[15];
-rz(pi/2) q[14];
-sx q[14];
-rz(2.0420352) q[14];
-sx q[14];
-rz(-pi/2) q[15];
-sx q[15];
-rz(-2.6703538) q[15];
-cx q[14],q[15];
-rz(pi/2) q[14];
-sx q[14];
-rz(7*pi/5) q[14];
-sx q[14];
-rz(5*pi/2) q[14];
-rz(-pi/2) q[15];
-sx q[15];
-rz(pi/2) q[15];
-cx q[15],q[14];
-rz(-pi) q[15];
-sx q[15];
-rz(-pi/2) q[15];
-cx q[14],q[15];
-rz(pi/2) q[14];
-rz(pi/2) q[15];
-sx q[15];
-cx q[14],q[15];
-rz(pi/2) q[14];
-sx q[14];
-rz(7*pi/5) q[14];
-sx q[14];
-rz(5*pi/2) q[14];
-rz(-pi/2) q[15];
-sx q[15];
-rz(pi/2) q[15];
-cx q[15],q[14];
-rz(-pi) q[15];
-sx q[15];
-rz(-pi/2) q[15];
-cx q[14],q[15];
-rz(-0.77207828) q[14];
-sx q[14];
-rz(-0.83518121) q[14];
-sx q[14];
-rz(0.84575039) q[14];
-cx q[13],q[14];
-rz(pi/2) q[13];
-sx q[13];
-rz(7*pi/5) q[13];
-sx q[13];
-rz(5*pi/2) q[13];
-rz(-pi/2) q[14];
-sx q[14];
-rz(pi/2) q[14];
-cx q[14],q[13];
-rz(-pi) q[14];
-sx q[14];
-rz(-pi/2) q[14];
-cx q[13],q[14];
-rz(pi/2) q[13];
-sx q[13];
-rz(2.0420352) q[13];
-sx q[13];
-rz(-pi/2) q[14];
-sx q[14];
-rz(-2.6703538) q[14];
-cx q[13],q[14];
-rz(pi/2) q[13];
-sx q[13];
-rz(7*pi/5) q[13];
-sx q[13];
-rz(5*pi/2) q[13];
-rz(-pi/2) q[14];
-sx q[14];
-rz(pi/2) q[14];
-cx q[14],q[13];
-rz(-pi) q[14];
-sx q[14];
-rz(-pi/2) q[14];
-cx q[13],q[14];
-rz(pi/2) q[13];
-rz(pi/2) q[14];
-sx q[14];
-cx q[13],q[14];
-rz(pi/2) q[13];
-sx q[13];
-rz(7*pi/5) q[13];
-sx q[13];
-rz(5*pi/2) q[13];
-rz(-pi/2) q[14];
-sx q[14];
-rz(pi/2) q[14];
-cx q[14],q[13];
-rz(-pi) q[14];
-sx q[14];
-rz(-pi/2) q[14];
-cx q[13],q[14];
-rz(2.914702) q[13];
-sx q[13];
-rz(-1.9869531) q[13];
-sx q[13];
-rz(-1.5226946) q[13];
-rz(-0.22689068) q[14];
-sx q[14];
-rz(-1.9869531) q[14];
-sx q[14];
-rz(-1.5226946) q[14];
-rz(2.3695144) q[15];
-sx q[15];
-rz(-0.83518121) q[15];
-sx q[15];
-rz(-2.2958423) q[15];
-rz(-pi/2) q[2];
-sx q[2];
-rz(pi/2) q[2];
-cx q[2],q[1];
-rz(-pi) q[2];
-sx q[2];
-rz(-pi/2) q[2];
-cx q[1],q[2];
-rz(pi/2) q[1];
-sx q[1];
-rz(-2.984513) q[1];
-sx q[1];
-rz(pi/2) q[1];
-rz(0.68021498) q[2];
-sx q[2];
-rz(-1.1421643) q[2];
-sx q[2];
-rz(2.6670111) q[2];
-cx q[1],q[2];
-rz(pi/2) q[1];
-sx q[1];
-rz(3.29867228626928) q[1];
-sx q[1];
-rz(5*pi/2) q[1];
-rz(-pi/2) q[2];
-sx q[2];
-rz(pi/2) q[2];
-cx q[2],q[1];
-rz(-pi) q[2];
-sx q[2];
-rz(-pi/2) q[2];
-cx q[1],q[2];
-rz(-0.089094174) q[1];
-sx q[1];
-rz(-1.024559) q[1];
-sx q[1];
-rz(1.8031906) q[1];
-cx q[0],q[1];
-rz(pi/2) q[0];
-sx q[0];
-rz(7*pi/5) q[0];
-sx q[0];
-rz(5*pi/2) q[0];
-rz(-pi/2) q[1];
-sx q[1];
-rz(pi/2) q[1];
-cx q[1],q[0];
-rz(-pi) q[1];
-sx q[1];
-rz(-pi/2) q[1];
-cx q[0],q[1];
-rz(pi/2) q[0];
-sx q[0];
-rz(2.0420352) q[0];
-sx q[0];
-rz(-pi/2) q[1];
-sx q[1];
-rz(-2.6703538) q[1];
-cx q[0],q[1];
-rz(pi/2) q[0];
-sx q[0];
-rz(7*pi/5) q[0];
-sx q[0];
-rz(5*pi/2) q[0];
-rz(-pi/2) q[1];
-sx q[1];
-rz(pi/2) q[1];
-cx q[1],q[0];
-rz(-pi) q[1];
-sx q[1];
-rz(-pi/2) q[1];
-cx q[0],q[1];
-rz(pi/2) q[0];
-rz(pi/2) q[1];
-sx q[1];
-cx q[0],q[1];
-rz(pi/2) q[0];
-sx q[0];
-rz(7*pi/5) q[0];
-sx q[0];
-rz(5*pi/2) q[0];
-rz(-pi/2) q[1];
-sx q[1];
-rz(pi/2) q[1];
-cx q[1],q[0];
-rz(-pi) q[1];
-sx q[1];
-rz(-pi/2) q[1];
-cx q[0],q[1];
-rz(-0.77207828) q[0];
-sx q[0];
-rz(-0.83518121) q[0];
-sx q[0];
-rz(0.84575039) q[0];
-rz(2.3695144) q[1];
-sx q[1];
-rz(-0.83518121) q[1];
-sx q[1];
-rz(-2.2958423) q[1];
-cx q[15],q[0];
-rz(-pi/2) q[0];
-sx q[0];
-rz(pi/2) q[0];
-rz(pi/2) q[15];
-sx q[15];
-rz(7*pi/5) q[15];
-sx q[15];
-rz(5*pi/2) q[15];
-cx q[0],q[15];
-rz(-pi) q[0];
-sx q[0];
-rz(-pi/2) q[0];
-cx q[15],q[0];
-rz(-pi/2) q[0];
-sx q[0];
-rz(-2.6703538) q[0];
-rz(pi/2) q[15];
-sx q[15];
-rz(2.0420352) q[15];
-sx q[15];
-cx q[15],q[0];
-rz(-pi/2) q[0];
-sx q[0];
-rz(pi/2) q[0];
-rz(pi/2) q[15];
-sx q[15];
-rz(7*pi/5) q[15];
-sx q[15];
-rz(5*pi/2) q[15];
-cx q[0],q[15];
-rz(-pi) q[0];
-sx q[0];
-rz(-pi/2) q[0];
-cx q[15],q[0];
-rz(pi/2) q[0];
-sx q[0];
-rz(pi/2) q[15];
-cx q[15],q[0];
-rz(-pi/2) q[0];
-sx q[0];
-rz(pi/2) q[0];
-rz(pi/2) q[15];
-sx q[15];
-rz(7*pi/5) q[15];
-sx q[15];
-rz(5*pi/2) q[15];
-cx q[0],q[15];
-rz(-pi) q[0];
-sx q[0];
-rz(-pi/2) q[0];
-cx q[15],q[0];
-rz(-0.22689068) q[0];
-sx q[0];
-rz(-1.9869531) q[0];
-sx q[0];
-rz(-1.5226946) q[0];
-rz(2.914702) q[15];
-sx q[15];
-rz(-1.9869531) q[15];
-sx q[15];
-rz(-1.5226946) q[15];
-rz(-2.5935896) q[2];
-sx q[2];
-rz(-1.4946939) q[2];
-sx q[2];
-rz(0.27876616) q[2];
-cx q[2],q[3];
-rz(pi/2) q[2];
-sx q[2];
-rz(7*pi/5) q[2];
-sx q[2];
-rz(5*pi/2) q[2];
-rz(-pi/2) q[3];
-sx q[3];
-rz(pi/2) q[3];
-cx q[3],q[2];
-rz(-pi) q[3];
-sx q[3];
-rz(-pi/2) q[3];
-cx q[2],q[3];
-rz(pi/2) q[2];
-sx q[2];
-rz(2.0420352) q[2];
-sx q[2];
-rz(-pi/2) q[3];
-sx q[3];
-rz(-2.6703538) q[3];
-cx q[2],q[3];
-rz(pi/2) q[2];
-sx q[2];
-rz(7*pi/5) q[2];
-sx q[2];
-rz(5*pi/2) q[2];
-rz(-pi/2) q[3];
-sx q[3];
-rz(pi/2) q[3];
-cx q[3],q[2];
-rz(-pi) q[3];
-sx q[3];
-rz(-pi/2) q[3];
-cx q[2],q[3];
-rz(pi/2) q[2];
-rz(pi/2) q[3];
-sx q[3];
-cx q[2],q[3];
-rz(pi/2) q[2];
-sx q[2];
-rz(7*pi/5) q[2];
-sx q[2];
-rz(5*pi/2) q[2];
-rz(-pi/2) q[3];
-sx q[3];
-rz(pi/2) q[3];
-cx q[3],q[2];
-rz(-pi) q[3];
-sx q[3];
-rz(-pi/2) q[3];
-cx q[2],q[3];
-rz(-0.77207828) q[2];
-sx q[2];
-rz(-0.83518121) q[2];
-sx q[2];
-rz(0.84575039) q[2];
-cx q[1],q[2];
-rz(pi/2) q[1];
-sx q[1];
-rz(7*pi/5) q[1];
-sx q[1];
-rz(5*pi/2) q[1];
-rz(-pi/2) q[2];
-sx q[2];
-rz(pi/2) q[2];
-cx q[2],q[1];
-rz(-pi) q[2];
-sx q[2];
-rz(-pi/2) q[2];
-cx q[1],q[2];
-rz(pi/2) q[1];
-sx q[1];
-rz(2.0420352) q[1];
-sx q[1];
-rz(-pi/2) q[2];
-sx q[2];
-rz(-2.6703538) q[2];
-cx q[1],q[2];
-rz(pi/2) q[1];
-sx q[1];
-rz(7*pi/5) q[1];
-sx q[1];
-rz(5*pi/2) q[1];
-rz(-pi/2) q[2];
-sx q[2];
-rz(pi/2) q[2];
-cx q[2],q[1];
-rz(-pi) q[2];
-sx q[2];
-rz(-pi/2) q[2];
-cx q[1],q[2];
-rz(pi/2) q[1];
-rz(pi/2) q[2];
-sx q[2];
-cx q[1],q[2];
-rz(pi/2) q[1];
-sx q[1];
-rz(7*pi/5) q[1];
-sx q[1];
-rz(5*pi/2) q[1];
-rz(-pi/2) q[2];
-sx q[2];
-rz(pi/2) q[2];
-cx q[2],q[1];
-rz(-pi) q[2];
-sx q[2];
-rz(-pi/2) q[2];
-cx q[1],q[2];
-rz(2.914702) q[1];
-sx q[1];
-rz(-1.9869531) q[1];
-sx q[1];
-rz(-1.5226946) q[1];
-rz(-0.22689068) q[2];
-sx q[2];
-rz(-1.9869531) q[2];
-sx q[2];
-rz(-1.5226946) q[2];
-rz(2.3695144) q[3];
-sx q[3];
-rz(-0.83518121) q[3];
-sx q[3];
-rz(-2.2958423) q[3];
-cx q[3],q[4];
-rz(pi/2) q[3];
-sx q[3];
-rz(7*pi/5) q[3];
-sx q[3];
-rz(5*pi/2) q[3];
-rz(-pi/2) q[4];
-sx q[4];
-rz(pi/2) q[4];
-cx q[4],q[3];
-rz(-pi) q[4];
-sx q[4];
-rz(-pi/2) q[4];
-cx q[3],q[4];
-rz(pi/2) q[3];
-sx q[3];
-rz(2.0420352) q[3];
-sx q[3];
-rz(-pi/2) q[4];
-sx q[4];
-rz(-2.6703538) q[4];
-cx q[3],q[4];
-rz(pi/2) q[3];
-sx q[3];
-rz(7*pi/5) q[3];
-sx q[3];
-rz(5*pi/2) q[3];
-rz(-pi/2) q[4];
-sx q[4];
-rz(pi/2) q[4];
-cx q[4],q[3];
-rz(-pi) q[4];
-sx q[4];
-rz(-pi/2) q[4];
-cx q[3],q[4];
-rz(pi/2) q[3];
-rz(pi/2) q[4];
-sx q[4];
-cx q[3],q[4];
-rz(pi/2) q[3];
-sx q[3];
-rz(7*pi/5) q[3];
-sx q[3];
-rz(5*pi/2) q[3];
-rz(-pi/2) q[4];
-sx q[4];
-rz(pi/2) q[4];
-cx q[4],q[3];
-rz(-pi) q[4];
-sx q[4];
-rz(-pi/2) q[4];
-cx q[3],q[4];
-rz(2.914702) q[3];
-sx q[3];
-rz(-1.9869531) q[3];
-sx q[3];
-rz(-1.5226946) q[3];
-rz(-0.22689068) q[4];
-sx q[4];
-rz(-1.9869531) q[4];
-sx q[4];
-rz(-1.5226946) q[4];
-cx q[9],q[10];
-rz(-pi/2) q[10];
-sx q[10];
-rz(pi/2) q[10];
-rz(pi/2) q[9];
-sx q[9];
-rz(7*pi/5) q[9];
-sx q[9];
-rz(5*pi/2) q[9];
-cx q[10],q[9];
-rz(-pi) q[10];
-sx q[10];
-rz(-pi/2) q[10];
-cx q[9],q[10];
-rz(-pi/2) q[10];
-sx q[10];
-rz(-2.6703538) q[10];
-rz(pi/2) q[9];
-sx q[9];
-rz(2.0420352) q[9];
-sx q[9];
-cx q[9],q[10];
-rz(-pi/2) q[10];
-sx q[10];
-rz(pi/2) q[10];
-rz(pi/2) q[9];
-sx q[9];
-rz(7*pi/5) q[9];
-sx q[9];
-rz(5*pi/2) q[9];
-cx q[10],q[9];
-rz(-pi) q[10];
-sx q[10];
-rz(-pi/2) q[10];
-cx q[9],q[10];
-rz(pi/2) q[10];
-sx q[10];
-rz(pi/2) q[9];
-cx q[9],q[10];
-rz(-pi/2) q[10];
-sx q[10];
-rz(pi/2) q[10];
-rz(pi/2) q[9];
-sx q[9];
-rz(7*pi/5) q[9];
-sx q[9];
-rz(5*pi/2) q[9];
-cx q[10],q[9];
-rz(-pi) q[10];
-sx q[10];
-rz(-pi/2) q[10];
-cx q[9],q[10];
-rz(-0.22689068) q[10];
-sx q[10];
-rz(-1.9869531) q[10];
-sx q[10];
-rz(-1.5226946) q[10];
-rz(2.914702) q[9];
-sx q[9];
-rz(-1.9869531) q[9];
-sx q[9];
-rz(-1.5226946) q[9];
-measure q[0] -> ans[0];
-measure q[1] -> ans[1];
-measure q[2] -> ans[2];
-measure q[3] -> ans[3];
-measure q[4] -> ans[4];
-measure q[5] -> ans[5];
-measure q[6] -> ans[6];
-measure q[7] -> ans[7];
-measure q[8] -> ans[8];
-measure q[9] -> ans[9];
-measure q[10] -> ans[10];
-measure q[11] -> ans[11];
-measure q[12] -> ans[12];
-measure q[13] -> ans[13];
-measure q[14] -> ans[14];
-measure q[15] -> ans[15];
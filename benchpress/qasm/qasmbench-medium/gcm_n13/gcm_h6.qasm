@@ -1,3158 +0,0 @@
-// Term: YYIIIIIIIIXX
-OPENQASM 2.0;
-include "qelib1.inc";
-
-gate sx a { sdg a; h a; sdg a; }
-
-qreg q[13];
-creg c[1];
-
-rz(pi/2) q[0];
-sx q[0];
-rz(3*pi/4) q[0];
-x q[1];
-rz(-pi/4) q[1];
-cx q[0],q[1];
-rz(3*pi/4) q[1];
-sx q[1];
-rz(-3*pi/4) q[1];
-sx q[1];
-cx q[0],q[1];
-rz(-3*pi/4) q[0];
-sx q[1];
-rz(-3*pi/4) q[1];
-sx q[1];
-rz(-pi/2) q[1];
-x q[2];
-rz(-pi/4) q[2];
-cx q[0],q[2];
-rz(-pi/4) q[2];
-sx q[2];
-rz(-2.776735301803516) q[2];
-sx q[2];
-cx q[0],q[2];
-sx q[2];
-rz(1.9356536785811738) q[2];
-cx q[1],q[2];
-rz(-pi/4) q[2];
-cx q[0],q[2];
-rz(pi/4) q[2];
-cx q[1],q[2];
-rz(pi/4) q[1];
-rz(-pi/4) q[2];
-cx q[0],q[2];
-cx q[0],q[1];
-rz(pi/4) q[0];
-rz(-pi/4) q[1];
-cx q[0],q[1];
-rz(-pi/4) q[0];
-rz(3*pi/4) q[1];
-cx q[0],q[1];
-rz(-3*pi/4) q[1];
-sx q[1];
-rz(-3*pi/4) q[1];
-sx q[1];
-cx q[0],q[1];
-rz(0.9545852216623132) q[0];
-sx q[1];
-rz(-3*pi/4) q[1];
-sx q[1];
-rz(3*pi/4) q[2];
-sx q[2];
-rz(3.0630469651805647) q[2];
-cx q[0],q[2];
-rz(2.18700743192748) q[2];
-sx q[2];
-rz(-2.616207406461066) q[2];
-sx q[2];
-cx q[0],q[2];
-rz(2.5381420683163585) q[2];
-sx q[2];
-rz(-2.016154863944406) q[2];
-sx q[2];
-rz(-2.8529815780542025) q[2];
-cx q[1],q[2];
-rz(-pi/4) q[2];
-cx q[0],q[2];
-rz(pi/4) q[2];
-cx q[1],q[2];
-rz(pi/4) q[1];
-rz(-pi/4) q[2];
-cx q[0],q[2];
-cx q[0],q[1];
-rz(pi/4) q[0];
-rz(-pi/4) q[1];
-cx q[0],q[1];
-rz(-pi/4) q[0];
-rz(pi/4) q[1];
-cx q[0],q[1];
-rz(-3*pi/4) q[1];
-sx q[1];
-rz(-3*pi/4) q[1];
-sx q[1];
-cx q[0],q[1];
-rz(-3*pi/4) q[0];
-sx q[1];
-rz(-3*pi/4) q[1];
-sx q[1];
-rz(pi/4) q[1];
-cx q[0],q[1];
-rz(-pi/4) q[1];
-sx q[1];
-rz(-2.776735301803516) q[1];
-sx q[1];
-cx q[0],q[1];
-rz(pi/2) q[0];
-sx q[1];
-rz(1.9356536785811738) q[1];
-rz(3*pi/4) q[2];
-sx q[2];
-rz(pi/2) q[2];
-cx q[0],q[2];
-rz(pi/2) q[2];
-sx q[2];
-rz(-2.721051841978622) q[2];
-sx q[2];
-cx q[0],q[2];
-rz(pi/4) q[0];
-sx q[2];
-rz(-2.721051841978622) q[2];
-sx q[2];
-rz(-3*pi/4) q[2];
-cx q[0],q[2];
-rz(3*pi/4) q[2];
-sx q[2];
-rz(-3*pi/4) q[2];
-sx q[2];
-cx q[0],q[2];
-rz(pi/2) q[0];
-sx q[2];
-rz(-3*pi/4) q[2];
-sx q[2];
-rz(-pi/2) q[2];
-x q[3];
-rz(pi/2) q[3];
-cx q[0],q[3];
-rz(pi/2) q[3];
-sx q[3];
-rz(-3*pi/4) q[3];
-sx q[3];
-cx q[0],q[3];
-rz(pi/2) q[0];
-rz(-pi) q[3];
-sx q[3];
-rz(3*pi/4) q[3];
-sx q[3];
-rz(pi/2) q[4];
-cx q[0],q[4];
-rz(pi/2) q[4];
-sx q[4];
-rz(-3*pi/4) q[4];
-sx q[4];
-cx q[0],q[4];
-rz(pi/2) q[0];
-sx q[4];
-rz(-3*pi/4) q[4];
-sx q[4];
-rz(-pi/2) q[4];
-cx q[0],q[4];
-rz(pi/2) q[4];
-sx q[4];
-rz(-3*pi/4) q[4];
-sx q[4];
-cx q[0],q[4];
-sx q[4];
-rz(3*pi/4) q[4];
-sx q[4];
-cx q[3],q[4];
-rz(-pi/4) q[4];
-cx q[0],q[4];
-rz(pi/4) q[4];
-cx q[3],q[4];
-rz(pi/4) q[3];
-rz(-pi/4) q[4];
-cx q[0],q[4];
-cx q[0],q[3];
-rz(pi/4) q[0];
-rz(3*pi/4) q[3];
-sx q[3];
-rz(2.143557788959604) q[3];
-sx q[3];
-cx q[0],q[3];
-rz(pi/2) q[0];
-sx q[3];
-rz(2.143557788959603) q[3];
-sx q[3];
-rz(-pi) q[3];
-rz(3*pi/4) q[4];
-sx q[4];
-rz(-pi) q[4];
-cx q[0],q[4];
-rz(pi/2) q[4];
-sx q[4];
-rz(-3*pi/4) q[4];
-sx q[4];
-cx q[0],q[4];
-rz(-pi) q[4];
-sx q[4];
-rz(3*pi/4) q[4];
-sx q[4];
-cx q[0],q[4];
-sx q[4];
-rz(2.143557788959603) q[4];
-sx q[4];
-rz(-pi) q[4];
-cx q[0],q[4];
-rz(pi/2) q[0];
-sx q[4];
-rz(-2.143557788959604) q[4];
-sx q[4];
-rz(-pi/2) q[4];
-cx q[0],q[4];
-rz(pi/2) q[4];
-sx q[4];
-rz(-3*pi/4) q[4];
-sx q[4];
-cx q[0],q[4];
-sx q[4];
-rz(3*pi/4) q[4];
-sx q[4];
-cx q[3],q[4];
-rz(-pi/4) q[4];
-cx q[0],q[4];
-rz(pi/4) q[4];
-cx q[3],q[4];
-rz(pi/4) q[3];
-rz(-pi/4) q[4];
-cx q[0],q[4];
-cx q[0],q[3];
-rz(pi/4) q[0];
-rz(-pi/4) q[3];
-cx q[0],q[3];
-rz(pi/2) q[0];
-rz(pi/2) q[3];
-cx q[0],q[3];
-rz(pi/2) q[3];
-sx q[3];
-rz(-3*pi/4) q[3];
-sx q[3];
-cx q[0],q[3];
-rz(-3*pi/4) q[0];
-sx q[3];
-rz(-3*pi/4) q[3];
-sx q[3];
-rz(3*pi/4) q[3];
-cx q[0],q[3];
-rz(-pi/4) q[3];
-sx q[3];
-rz(-2.776735301803516) q[3];
-sx q[3];
-cx q[0],q[3];
-sx q[3];
-rz(1.9356536785811738) q[3];
-cx q[2],q[3];
-rz(-pi/4) q[3];
-cx q[0],q[3];
-rz(pi/4) q[3];
-cx q[2],q[3];
-rz(pi/4) q[2];
-rz(-pi/4) q[3];
-cx q[0],q[3];
-cx q[0],q[2];
-rz(pi/4) q[0];
-rz(-pi/4) q[2];
-cx q[0],q[2];
-rz(-pi/4) q[0];
-rz(3*pi/4) q[2];
-cx q[0],q[2];
-rz(-3*pi/4) q[2];
-sx q[2];
-rz(-3*pi/4) q[2];
-sx q[2];
-cx q[0],q[2];
-rz(0.9545852216623132) q[0];
-sx q[2];
-rz(-3*pi/4) q[2];
-sx q[2];
-rz(3*pi/4) q[3];
-sx q[3];
-rz(3.0630469651805647) q[3];
-cx q[0],q[3];
-rz(2.18700743192748) q[3];
-sx q[3];
-rz(-2.616207406461066) q[3];
-sx q[3];
-cx q[0],q[3];
-rz(2.5381420683163585) q[3];
-sx q[3];
-rz(-2.016154863944406) q[3];
-sx q[3];
-rz(-2.8529815780542025) q[3];
-cx q[2],q[3];
-rz(-pi/4) q[3];
-cx q[0],q[3];
-rz(pi/4) q[3];
-cx q[2],q[3];
-rz(pi/4) q[2];
-rz(-pi/4) q[3];
-cx q[0],q[3];
-cx q[0],q[2];
-rz(pi/4) q[0];
-rz(-pi/4) q[2];
-cx q[0],q[2];
-rz(-pi/4) q[0];
-rz(pi/4) q[2];
-cx q[0],q[2];
-rz(-3*pi/4) q[2];
-sx q[2];
-rz(-3*pi/4) q[2];
-sx q[2];
-cx q[0],q[2];
-rz(-3*pi/4) q[0];
-sx q[2];
-rz(-3*pi/4) q[2];
-sx q[2];
-rz(pi/4) q[2];
-cx q[0],q[2];
-rz(-pi/4) q[2];
-sx q[2];
-rz(-2.776735301803516) q[2];
-sx q[2];
-cx q[0],q[2];
-rz(pi/2) q[0];
-sx q[2];
-rz(1.9356536785811738) q[2];
-rz(3*pi/4) q[3];
-sx q[3];
-rz(pi/2) q[3];
-cx q[0],q[3];
-rz(pi/2) q[3];
-sx q[3];
-rz(-2.721051841978622) q[3];
-sx q[3];
-cx q[0],q[3];
-rz(pi/4) q[0];
-sx q[3];
-rz(-2.721051841978622) q[3];
-sx q[3];
-rz(-3*pi/4) q[3];
-cx q[0],q[3];
-rz(3*pi/4) q[3];
-sx q[3];
-rz(-3*pi/4) q[3];
-sx q[3];
-cx q[0],q[3];
-rz(pi/2) q[0];
-sx q[3];
-rz(-3*pi/4) q[3];
-sx q[3];
-rz(-pi/2) q[3];
-rz(3*pi/4) q[4];
-sx q[4];
-rz(-pi) q[4];
-cx q[0],q[4];
-rz(pi/2) q[4];
-sx q[4];
-rz(-3*pi/4) q[4];
-sx q[4];
-cx q[0],q[4];
-rz(pi/2) q[0];
-sx q[4];
-rz(-3*pi/4) q[4];
-sx q[4];
-rz(-pi/2) q[4];
-cx q[0],q[4];
-rz(pi/2) q[4];
-sx q[4];
-rz(-3*pi/4) q[4];
-sx q[4];
-cx q[0],q[4];
-rz(-3*pi/4) q[0];
-sx q[4];
-rz(-3*pi/4) q[4];
-sx q[4];
-rz(3*pi/4) q[4];
-cx q[0],q[4];
-rz(-pi/4) q[4];
-sx q[4];
-rz(-2.776735301803516) q[4];
-sx q[4];
-cx q[0],q[4];
-sx q[4];
-rz(1.9356536785811738) q[4];
-cx q[3],q[4];
-rz(-pi/4) q[4];
-cx q[0],q[4];
-rz(pi/4) q[4];
-cx q[3],q[4];
-rz(pi/4) q[3];
-rz(-pi/4) q[4];
-cx q[0],q[4];
-cx q[0],q[3];
-rz(pi/4) q[0];
-rz(-pi/4) q[3];
-cx q[0],q[3];
-rz(-pi/4) q[0];
-rz(3*pi/4) q[3];
-cx q[0],q[3];
-rz(-3*pi/4) q[3];
-sx q[3];
-rz(-3*pi/4) q[3];
-sx q[3];
-cx q[0],q[3];
-rz(0.9545852216623132) q[0];
-sx q[3];
-rz(-3*pi/4) q[3];
-sx q[3];
-rz(3*pi/4) q[4];
-sx q[4];
-rz(3.0630469651805647) q[4];
-cx q[0],q[4];
-rz(2.18700743192748) q[4];
-sx q[4];
-rz(-2.616207406461066) q[4];
-sx q[4];
-cx q[0],q[4];
-rz(2.5381420683163585) q[4];
-sx q[4];
-rz(-2.016154863944406) q[4];
-sx q[4];
-rz(-2.8529815780542025) q[4];
-cx q[3],q[4];
-rz(-pi/4) q[4];
-cx q[0],q[4];
-rz(pi/4) q[4];
-cx q[3],q[4];
-rz(pi/4) q[3];
-rz(-pi/4) q[4];
-cx q[0],q[4];
-cx q[0],q[3];
-rz(pi/4) q[0];
-rz(-pi/4) q[3];
-cx q[0],q[3];
-rz(-pi/4) q[0];
-rz(pi/4) q[3];
-cx q[0],q[3];
-rz(-3*pi/4) q[3];
-sx q[3];
-rz(-3*pi/4) q[3];
-sx q[3];
-cx q[0],q[3];
-rz(-3*pi/4) q[0];
-sx q[3];
-rz(-3*pi/4) q[3];
-sx q[3];
-rz(pi/4) q[3];
-cx q[0],q[3];
-rz(-pi/4) q[3];
-sx q[3];
-rz(-2.776735301803516) q[3];
-sx q[3];
-cx q[0],q[3];
-rz(pi/2) q[0];
-sx q[3];
-rz(1.9356536785811738) q[3];
-rz(3*pi/4) q[4];
-sx q[4];
-rz(pi/2) q[4];
-cx q[0],q[4];
-rz(pi/2) q[4];
-sx q[4];
-rz(-2.721051841978622) q[4];
-sx q[4];
-cx q[0],q[4];
-rz(pi/4) q[0];
-sx q[4];
-rz(-2.721051841978622) q[4];
-sx q[4];
-rz(-3*pi/4) q[4];
-cx q[0],q[4];
-rz(3*pi/4) q[4];
-sx q[4];
-rz(-3*pi/4) q[4];
-sx q[4];
-cx q[0],q[4];
-rz(-3*pi/4) q[0];
-sx q[4];
-rz(-3*pi/4) q[4];
-sx q[4];
-rz(-pi/2) q[4];
-rz(-pi/4) q[5];
-cx q[0],q[5];
-rz(-pi/4) q[5];
-sx q[5];
-rz(-2.776735301803516) q[5];
-sx q[5];
-cx q[0],q[5];
-sx q[5];
-rz(1.9356536785811738) q[5];
-cx q[4],q[5];
-rz(-pi/4) q[5];
-cx q[0],q[5];
-rz(pi/4) q[5];
-cx q[4],q[5];
-rz(pi/4) q[4];
-rz(-pi/4) q[5];
-cx q[0],q[5];
-cx q[0],q[4];
-rz(pi/4) q[0];
-rz(-pi/4) q[4];
-cx q[0],q[4];
-rz(-pi/4) q[0];
-rz(3*pi/4) q[4];
-cx q[0],q[4];
-rz(-3*pi/4) q[4];
-sx q[4];
-rz(-3*pi/4) q[4];
-sx q[4];
-cx q[0],q[4];
-rz(0.9545852216623132) q[0];
-sx q[4];
-rz(-3*pi/4) q[4];
-sx q[4];
-rz(3*pi/4) q[5];
-sx q[5];
-rz(3.0630469651805647) q[5];
-cx q[0],q[5];
-rz(2.18700743192748) q[5];
-sx q[5];
-rz(-2.616207406461066) q[5];
-sx q[5];
-cx q[0],q[5];
-rz(2.5381420683163585) q[5];
-sx q[5];
-rz(-2.016154863944406) q[5];
-sx q[5];
-rz(-2.8529815780542025) q[5];
-cx q[4],q[5];
-rz(-pi/4) q[5];
-cx q[0],q[5];
-rz(pi/4) q[5];
-cx q[4],q[5];
-rz(pi/4) q[4];
-rz(-pi/4) q[5];
-cx q[0],q[5];
-cx q[0],q[4];
-rz(pi/4) q[0];
-rz(-pi/4) q[4];
-cx q[0],q[4];
-rz(-pi/4) q[0];
-rz(pi/4) q[4];
-cx q[0],q[4];
-rz(-3*pi/4) q[4];
-sx q[4];
-rz(-3*pi/4) q[4];
-sx q[4];
-cx q[0],q[4];
-rz(-3*pi/4) q[0];
-sx q[4];
-rz(-3*pi/4) q[4];
-sx q[4];
-rz(pi/4) q[4];
-cx q[0],q[4];
-rz(-pi/4) q[4];
-sx q[4];
-rz(-2.776735301803516) q[4];
-sx q[4];
-cx q[0],q[4];
-rz(pi/2) q[0];
-sx q[4];
-rz(1.9356536785811738) q[4];
-rz(3*pi/4) q[5];
-sx q[5];
-rz(pi/2) q[5];
-cx q[0],q[5];
-rz(pi/2) q[5];
-sx q[5];
-rz(-2.721051841978622) q[5];
-sx q[5];
-cx q[0],q[5];
-rz(pi/2) q[0];
-sx q[5];
-rz(-2.721051841978622) q[5];
-sx q[5];
-cx q[0],q[5];
-rz(pi/2) q[5];
-sx q[5];
-rz(-3*pi/4) q[5];
-sx q[5];
-cx q[0],q[5];
-rz(pi/2) q[0];
-rz(-pi) q[5];
-sx q[5];
-rz(3*pi/4) q[5];
-sx q[5];
-rz(pi/2) q[6];
-cx q[0],q[6];
-rz(pi/2) q[6];
-sx q[6];
-rz(-3*pi/4) q[6];
-sx q[6];
-cx q[0],q[6];
-rz(pi/2) q[0];
-sx q[6];
-rz(-3*pi/4) q[6];
-sx q[6];
-rz(-pi/2) q[6];
-cx q[0],q[6];
-rz(pi/2) q[6];
-sx q[6];
-rz(-3*pi/4) q[6];
-sx q[6];
-cx q[0],q[6];
-sx q[6];
-rz(3*pi/4) q[6];
-sx q[6];
-cx q[5],q[6];
-rz(-pi/4) q[6];
-cx q[0],q[6];
-rz(pi/4) q[6];
-cx q[5],q[6];
-rz(pi/4) q[5];
-rz(-pi/4) q[6];
-cx q[0],q[6];
-cx q[0],q[5];
-rz(pi/4) q[0];
-rz(3*pi/4) q[5];
-sx q[5];
-rz(-0.3281242057491873) q[5];
-sx q[5];
-cx q[0],q[5];
-rz(pi/2) q[0];
-rz(-pi) q[5];
-sx q[5];
-rz(0.3281242057491882) q[5];
-sx q[5];
-rz(3*pi/4) q[6];
-sx q[6];
-rz(-pi) q[6];
-cx q[0],q[6];
-rz(pi/2) q[6];
-sx q[6];
-rz(-3*pi/4) q[6];
-sx q[6];
-cx q[0],q[6];
-rz(-pi) q[6];
-sx q[6];
-rz(3*pi/4) q[6];
-sx q[6];
-cx q[0],q[6];
-rz(-pi) q[6];
-sx q[6];
-rz(0.3281242057491882) q[6];
-sx q[6];
-cx q[0],q[6];
-rz(pi/2) q[0];
-sx q[6];
-rz(0.32812420574918777) q[6];
-sx q[6];
-rz(-pi/2) q[6];
-cx q[0],q[6];
-rz(pi/2) q[6];
-sx q[6];
-rz(-3*pi/4) q[6];
-sx q[6];
-cx q[0],q[6];
-sx q[6];
-rz(3*pi/4) q[6];
-sx q[6];
-cx q[5],q[6];
-rz(-pi/4) q[6];
-cx q[0],q[6];
-rz(pi/4) q[6];
-cx q[5],q[6];
-rz(pi/4) q[5];
-rz(-pi/4) q[6];
-cx q[0],q[6];
-cx q[0],q[5];
-rz(pi/4) q[0];
-rz(-pi/4) q[5];
-cx q[0],q[5];
-rz(pi/2) q[0];
-rz(pi/2) q[5];
-cx q[0],q[5];
-rz(pi/2) q[5];
-sx q[5];
-rz(-3*pi/4) q[5];
-sx q[5];
-cx q[0],q[5];
-rz(pi/4) q[0];
-sx q[5];
-rz(-3*pi/4) q[5];
-sx q[5];
-rz(3*pi/4) q[5];
-cx q[0],q[5];
-rz(3*pi/4) q[5];
-sx q[5];
-rz(-3*pi/4) q[5];
-sx q[5];
-cx q[0],q[5];
-sx q[5];
-rz(-3*pi/4) q[5];
-sx q[5];
-rz(-pi/2) q[5];
-cx q[5],q[4];
-rz(-pi/4) q[4];
-cx q[0],q[4];
-rz(pi/4) q[4];
-cx q[5],q[4];
-rz(-pi/4) q[4];
-cx q[0],q[4];
-rz(3*pi/4) q[4];
-sx q[4];
-rz(3.0630469651805647) q[4];
-rz(pi/4) q[5];
-cx q[0],q[5];
-rz(pi/4) q[0];
-rz(-pi/4) q[5];
-cx q[0],q[5];
-rz(0.9545852216623132) q[0];
-cx q[0],q[4];
-rz(2.18700743192748) q[4];
-sx q[4];
-rz(-2.616207406461066) q[4];
-sx q[4];
-cx q[0],q[4];
-rz(-pi/4) q[0];
-rz(2.5381420683163585) q[4];
-sx q[4];
-rz(-2.016154863944406) q[4];
-sx q[4];
-rz(-2.8529815780542025) q[4];
-rz(3*pi/4) q[5];
-cx q[0],q[5];
-rz(-3*pi/4) q[5];
-sx q[5];
-rz(-3*pi/4) q[5];
-sx q[5];
-cx q[0],q[5];
-sx q[5];
-rz(-3*pi/4) q[5];
-sx q[5];
-cx q[5],q[4];
-rz(-pi/4) q[4];
-cx q[0],q[4];
-rz(pi/4) q[4];
-cx q[5],q[4];
-rz(-pi/4) q[4];
-cx q[0],q[4];
-rz(3*pi/4) q[4];
-sx q[4];
-rz(pi/2) q[4];
-rz(pi/4) q[5];
-cx q[0],q[5];
-rz(pi/4) q[0];
-rz(-pi/4) q[5];
-cx q[0],q[5];
-rz(pi/2) q[0];
-cx q[0],q[4];
-rz(pi/2) q[4];
-sx q[4];
-rz(-2.721051841978622) q[4];
-sx q[4];
-cx q[0],q[4];
-rz(pi/4) q[0];
-sx q[4];
-rz(-2.721051841978622) q[4];
-sx q[4];
-rz(-3*pi/4) q[4];
-cx q[0],q[4];
-rz(3*pi/4) q[4];
-sx q[4];
-rz(-3*pi/4) q[4];
-sx q[4];
-cx q[0],q[4];
-sx q[4];
-rz(-3*pi/4) q[4];
-sx q[4];
-rz(-pi/2) q[4];
-cx q[4],q[3];
-rz(-pi/4) q[3];
-cx q[0],q[3];
-rz(pi/4) q[3];
-cx q[4],q[3];
-rz(-pi/4) q[3];
-cx q[0],q[3];
-rz(3*pi/4) q[3];
-sx q[3];
-rz(3.0630469651805647) q[3];
-rz(pi/4) q[4];
-cx q[0],q[4];
-rz(pi/4) q[0];
-rz(-pi/4) q[4];
-cx q[0],q[4];
-rz(0.9545852216623132) q[0];
-cx q[0],q[3];
-rz(2.18700743192748) q[3];
-sx q[3];
-rz(-2.616207406461066) q[3];
-sx q[3];
-cx q[0],q[3];
-rz(-pi/4) q[0];
-rz(2.5381420683163585) q[3];
-sx q[3];
-rz(-2.016154863944406) q[3];
-sx q[3];
-rz(-2.8529815780542025) q[3];
-rz(3*pi/4) q[4];
-cx q[0],q[4];
-rz(-3*pi/4) q[4];
-sx q[4];
-rz(-3*pi/4) q[4];
-sx q[4];
-cx q[0],q[4];
-sx q[4];
-rz(-3*pi/4) q[4];
-sx q[4];
-cx q[4],q[3];
-rz(-pi/4) q[3];
-cx q[0],q[3];
-rz(pi/4) q[3];
-cx q[4],q[3];
-rz(-pi/4) q[3];
-cx q[0],q[3];
-rz(3*pi/4) q[3];
-sx q[3];
-rz(pi/2) q[3];
-rz(pi/4) q[4];
-cx q[0],q[4];
-rz(pi/4) q[0];
-rz(-pi/4) q[4];
-cx q[0],q[4];
-rz(pi/2) q[0];
-cx q[0],q[3];
-rz(pi/2) q[3];
-sx q[3];
-rz(-2.721051841978622) q[3];
-sx q[3];
-cx q[0],q[3];
-rz(pi/4) q[0];
-sx q[3];
-rz(-2.721051841978622) q[3];
-sx q[3];
-rz(-3*pi/4) q[3];
-cx q[0],q[3];
-rz(3*pi/4) q[3];
-sx q[3];
-rz(-3*pi/4) q[3];
-sx q[3];
-cx q[0],q[3];
-sx q[3];
-rz(-3*pi/4) q[3];
-sx q[3];
-rz(-pi/2) q[3];
-cx q[3],q[2];
-rz(-pi/4) q[2];
-cx q[0],q[2];
-rz(pi/4) q[2];
-cx q[3],q[2];
-rz(-pi/4) q[2];
-cx q[0],q[2];
-rz(3*pi/4) q[2];
-sx q[2];
-rz(3.0630469651805647) q[2];
-rz(pi/4) q[3];
-cx q[0],q[3];
-rz(pi/4) q[0];
-rz(-pi/4) q[3];
-cx q[0],q[3];
-rz(0.9545852216623132) q[0];
-cx q[0],q[2];
-rz(2.18700743192748) q[2];
-sx q[2];
-rz(-2.616207406461066) q[2];
-sx q[2];
-cx q[0],q[2];
-rz(-pi/4) q[0];
-rz(2.5381420683163585) q[2];
-sx q[2];
-rz(-2.016154863944406) q[2];
-sx q[2];
-rz(-2.8529815780542025) q[2];
-rz(3*pi/4) q[3];
-cx q[0],q[3];
-rz(-3*pi/4) q[3];
-sx q[3];
-rz(-3*pi/4) q[3];
-sx q[3];
-cx q[0],q[3];
-sx q[3];
-rz(-3*pi/4) q[3];
-sx q[3];
-cx q[3],q[2];
-rz(-pi/4) q[2];
-cx q[0],q[2];
-rz(pi/4) q[2];
-cx q[3],q[2];
-rz(-pi/4) q[2];
-cx q[0],q[2];
-rz(3*pi/4) q[2];
-sx q[2];
-rz(pi/2) q[2];
-rz(pi/4) q[3];
-cx q[0],q[3];
-rz(pi/4) q[0];
-rz(-pi/4) q[3];
-cx q[0],q[3];
-rz(pi/2) q[0];
-cx q[0],q[2];
-rz(pi/2) q[2];
-sx q[2];
-rz(-2.721051841978622) q[2];
-sx q[2];
-cx q[0],q[2];
-rz(pi/4) q[0];
-sx q[2];
-rz(-2.721051841978622) q[2];
-sx q[2];
-rz(-3*pi/4) q[2];
-cx q[0],q[2];
-rz(3*pi/4) q[2];
-sx q[2];
-rz(-3*pi/4) q[2];
-sx q[2];
-cx q[0],q[2];
-sx q[2];
-rz(-3*pi/4) q[2];
-sx q[2];
-rz(-pi/2) q[2];
-cx q[2],q[1];
-rz(-pi/4) q[1];
-cx q[0],q[1];
-rz(pi/4) q[1];
-cx q[2],q[1];
-rz(-pi/4) q[1];
-cx q[0],q[1];
-rz(3*pi/4) q[1];
-sx q[1];
-rz(3.0630469651805647) q[1];
-rz(pi/4) q[2];
-cx q[0],q[2];
-rz(pi/4) q[0];
-rz(-pi/4) q[2];
-cx q[0],q[2];
-rz(0.9545852216623132) q[0];
-cx q[0],q[1];
-rz(2.18700743192748) q[1];
-sx q[1];
-rz(-2.616207406461066) q[1];
-sx q[1];
-cx q[0],q[1];
-rz(-pi/4) q[0];
-rz(2.5381420683163585) q[1];
-sx q[1];
-rz(-2.016154863944406) q[1];
-sx q[1];
-rz(-2.8529815780542025) q[1];
-rz(3*pi/4) q[2];
-cx q[0],q[2];
-rz(-3*pi/4) q[2];
-sx q[2];
-rz(-3*pi/4) q[2];
-sx q[2];
-cx q[0],q[2];
-sx q[2];
-rz(-3*pi/4) q[2];
-sx q[2];
-cx q[2],q[1];
-rz(-pi/4) q[1];
-cx q[0],q[1];
-rz(pi/4) q[1];
-cx q[2],q[1];
-rz(-pi/4) q[1];
-cx q[0],q[1];
-rz(3*pi/4) q[1];
-sx q[1];
-rz(pi/2) q[1];
-rz(pi/4) q[2];
-cx q[0],q[2];
-rz(pi/4) q[0];
-rz(-pi/4) q[2];
-cx q[0],q[2];
-rz(pi/2) q[0];
-cx q[0],q[1];
-rz(pi/2) q[1];
-sx q[1];
-rz(-2.721051841978622) q[1];
-sx q[1];
-cx q[0],q[1];
-sx q[1];
-rz(-2.721051841978622) q[1];
-sx q[1];
-rz(-pi/2) q[1];
-cx q[0],q[1];
-rz(pi/4) q[0];
-rz(-pi/4) q[1];
-cx q[0],q[1];
-rz(3*pi/4) q[1];
-sx q[1];
-rz(-3*pi/4) q[1];
-sx q[1];
-cx q[0],q[1];
-rz(-pi/4) q[0];
-sx q[1];
-rz(-3*pi/4) q[1];
-sx q[1];
-rz(-pi/2) q[1];
-rz(pi/4) q[2];
-cx q[0],q[2];
-rz(-3*pi/4) q[2];
-sx q[2];
-rz(-3*pi/4) q[2];
-sx q[2];
-cx q[0],q[2];
-sx q[2];
-rz(-3*pi/4) q[2];
-sx q[2];
-rz(pi/2) q[2];
-cx q[0],q[2];
-rz(-3*pi/4) q[0];
-rz(-pi/4) q[2];
-cx q[0],q[2];
-rz(-pi/4) q[2];
-sx q[2];
-rz(-2.776735301803516) q[2];
-sx q[2];
-cx q[0],q[2];
-sx q[2];
-rz(1.9356536785811738) q[2];
-cx q[1],q[2];
-rz(-pi/4) q[2];
-cx q[0],q[2];
-rz(pi/4) q[2];
-cx q[1],q[2];
-rz(pi/4) q[1];
-rz(-pi/4) q[2];
-cx q[0],q[2];
-cx q[0],q[1];
-rz(pi/4) q[0];
-rz(-pi/4) q[1];
-cx q[0],q[1];
-rz(-pi/4) q[0];
-rz(3*pi/4) q[1];
-cx q[0],q[1];
-rz(-3*pi/4) q[1];
-sx q[1];
-rz(-3*pi/4) q[1];
-sx q[1];
-cx q[0],q[1];
-rz(0.9545852216623132) q[0];
-sx q[1];
-rz(-3*pi/4) q[1];
-sx q[1];
-rz(3*pi/4) q[2];
-sx q[2];
-rz(3.0630469651805647) q[2];
-cx q[0],q[2];
-rz(2.18700743192748) q[2];
-sx q[2];
-rz(-2.616207406461066) q[2];
-sx q[2];
-cx q[0],q[2];
-rz(2.5381420683163585) q[2];
-sx q[2];
-rz(-2.016154863944406) q[2];
-sx q[2];
-rz(-2.8529815780542025) q[2];
-cx q[1],q[2];
-rz(-pi/4) q[2];
-cx q[0],q[2];
-rz(pi/4) q[2];
-cx q[1],q[2];
-rz(pi/4) q[1];
-rz(-pi/4) q[2];
-cx q[0],q[2];
-cx q[0],q[1];
-rz(pi/4) q[0];
-rz(-pi/4) q[1];
-cx q[0],q[1];
-rz(-pi/4) q[0];
-rz(pi/4) q[1];
-cx q[0],q[1];
-rz(-3*pi/4) q[1];
-sx q[1];
-rz(-3*pi/4) q[1];
-sx q[1];
-cx q[0],q[1];
-rz(-3*pi/4) q[0];
-sx q[1];
-rz(-3*pi/4) q[1];
-sx q[1];
-rz(pi/4) q[1];
-cx q[0],q[1];
-rz(-pi/4) q[1];
-sx q[1];
-rz(-2.776735301803516) q[1];
-sx q[1];
-cx q[0],q[1];
-rz(pi/2) q[0];
-sx q[1];
-rz(1.9356536785811738) q[1];
-rz(3*pi/4) q[2];
-sx q[2];
-rz(pi/2) q[2];
-cx q[0],q[2];
-rz(pi/2) q[2];
-sx q[2];
-rz(-2.721051841978622) q[2];
-sx q[2];
-cx q[0],q[2];
-rz(pi/4) q[0];
-sx q[2];
-rz(-2.721051841978622) q[2];
-sx q[2];
-rz(-3*pi/4) q[2];
-cx q[0],q[2];
-rz(3*pi/4) q[2];
-sx q[2];
-rz(-3*pi/4) q[2];
-sx q[2];
-cx q[0],q[2];
-rz(-pi/4) q[0];
-sx q[2];
-rz(-3*pi/4) q[2];
-sx q[2];
-rz(-pi/2) q[2];
-rz(pi/4) q[3];
-cx q[0],q[3];
-rz(-3*pi/4) q[3];
-sx q[3];
-rz(-3*pi/4) q[3];
-sx q[3];
-cx q[0],q[3];
-rz(-3*pi/4) q[0];
-sx q[3];
-rz(-3*pi/4) q[3];
-sx q[3];
-rz(pi/4) q[3];
-cx q[0],q[3];
-rz(-pi/4) q[3];
-sx q[3];
-rz(-2.776735301803516) q[3];
-sx q[3];
-cx q[0],q[3];
-sx q[3];
-rz(1.9356536785811738) q[3];
-cx q[2],q[3];
-rz(-pi/4) q[3];
-cx q[0],q[3];
-rz(pi/4) q[3];
-cx q[2],q[3];
-rz(pi/4) q[2];
-rz(-pi/4) q[3];
-cx q[0],q[3];
-cx q[0],q[2];
-rz(pi/4) q[0];
-rz(-pi/4) q[2];
-cx q[0],q[2];
-rz(-pi/4) q[0];
-rz(3*pi/4) q[2];
-cx q[0],q[2];
-rz(-3*pi/4) q[2];
-sx q[2];
-rz(-3*pi/4) q[2];
-sx q[2];
-cx q[0],q[2];
-rz(0.9545852216623132) q[0];
-sx q[2];
-rz(-3*pi/4) q[2];
-sx q[2];
-rz(3*pi/4) q[3];
-sx q[3];
-rz(3.0630469651805647) q[3];
-cx q[0],q[3];
-rz(2.18700743192748) q[3];
-sx q[3];
-rz(-2.616207406461066) q[3];
-sx q[3];
-cx q[0],q[3];
-rz(2.5381420683163585) q[3];
-sx q[3];
-rz(-2.016154863944406) q[3];
-sx q[3];
-rz(-2.8529815780542025) q[3];
-cx q[2],q[3];
-rz(-pi/4) q[3];
-cx q[0],q[3];
-rz(pi/4) q[3];
-cx q[2],q[3];
-rz(pi/4) q[2];
-rz(-pi/4) q[3];
-cx q[0],q[3];
-cx q[0],q[2];
-rz(pi/4) q[0];
-rz(-pi/4) q[2];
-cx q[0],q[2];
-rz(-pi/4) q[0];
-rz(pi/4) q[2];
-cx q[0],q[2];
-rz(-3*pi/4) q[2];
-sx q[2];
-rz(-3*pi/4) q[2];
-sx q[2];
-cx q[0],q[2];
-rz(-3*pi/4) q[0];
-sx q[2];
-rz(-3*pi/4) q[2];
-sx q[2];
-rz(pi/4) q[2];
-cx q[0],q[2];
-rz(-pi/4) q[2];
-sx q[2];
-rz(-2.776735301803516) q[2];
-sx q[2];
-cx q[0],q[2];
-rz(pi/2) q[0];
-sx q[2];
-rz(1.9356536785811738) q[2];
-rz(3*pi/4) q[3];
-sx q[3];
-rz(pi/2) q[3];
-cx q[0],q[3];
-rz(pi/2) q[3];
-sx q[3];
-rz(-2.721051841978622) q[3];
-sx q[3];
-cx q[0],q[3];
-rz(pi/4) q[0];
-sx q[3];
-rz(-2.721051841978622) q[3];
-sx q[3];
-rz(-3*pi/4) q[3];
-cx q[0],q[3];
-rz(3*pi/4) q[3];
-sx q[3];
-rz(-3*pi/4) q[3];
-sx q[3];
-cx q[0],q[3];
-rz(-pi/4) q[0];
-sx q[3];
-rz(-3*pi/4) q[3];
-sx q[3];
-rz(-pi/2) q[3];
-rz(pi/4) q[4];
-cx q[0],q[4];
-rz(-3*pi/4) q[4];
-sx q[4];
-rz(-3*pi/4) q[4];
-sx q[4];
-cx q[0],q[4];
-rz(-3*pi/4) q[0];
-sx q[4];
-rz(-3*pi/4) q[4];
-sx q[4];
-rz(pi/4) q[4];
-cx q[0],q[4];
-rz(-pi/4) q[4];
-sx q[4];
-rz(-2.776735301803516) q[4];
-sx q[4];
-cx q[0],q[4];
-sx q[4];
-rz(1.9356536785811738) q[4];
-cx q[3],q[4];
-rz(-pi/4) q[4];
-cx q[0],q[4];
-rz(pi/4) q[4];
-cx q[3],q[4];
-rz(pi/4) q[3];
-rz(-pi/4) q[4];
-cx q[0],q[4];
-cx q[0],q[3];
-rz(pi/4) q[0];
-rz(-pi/4) q[3];
-cx q[0],q[3];
-rz(-pi/4) q[0];
-rz(3*pi/4) q[3];
-cx q[0],q[3];
-rz(-3*pi/4) q[3];
-sx q[3];
-rz(-3*pi/4) q[3];
-sx q[3];
-cx q[0],q[3];
-rz(0.9545852216623132) q[0];
-sx q[3];
-rz(-3*pi/4) q[3];
-sx q[3];
-rz(3*pi/4) q[4];
-sx q[4];
-rz(3.0630469651805647) q[4];
-cx q[0],q[4];
-rz(2.18700743192748) q[4];
-sx q[4];
-rz(-2.616207406461066) q[4];
-sx q[4];
-cx q[0],q[4];
-rz(2.5381420683163585) q[4];
-sx q[4];
-rz(-2.016154863944406) q[4];
-sx q[4];
-rz(-2.8529815780542025) q[4];
-cx q[3],q[4];
-rz(-pi/4) q[4];
-cx q[0],q[4];
-rz(pi/4) q[4];
-cx q[3],q[4];
-rz(pi/4) q[3];
-rz(-pi/4) q[4];
-cx q[0],q[4];
-cx q[0],q[3];
-rz(pi/4) q[0];
-rz(-pi/4) q[3];
-cx q[0],q[3];
-rz(-pi/4) q[0];
-rz(pi/4) q[3];
-cx q[0],q[3];
-rz(-3*pi/4) q[3];
-sx q[3];
-rz(-3*pi/4) q[3];
-sx q[3];
-cx q[0],q[3];
-rz(-3*pi/4) q[0];
-sx q[3];
-rz(-3*pi/4) q[3];
-sx q[3];
-rz(pi/4) q[3];
-cx q[0],q[3];
-rz(-pi/4) q[3];
-sx q[3];
-rz(-2.776735301803516) q[3];
-sx q[3];
-cx q[0],q[3];
-rz(pi/2) q[0];
-sx q[3];
-rz(1.9356536785811738) q[3];
-rz(3*pi/4) q[4];
-sx q[4];
-rz(pi/2) q[4];
-cx q[0],q[4];
-rz(pi/2) q[4];
-sx q[4];
-rz(-2.721051841978622) q[4];
-sx q[4];
-cx q[0],q[4];
-rz(pi/4) q[0];
-sx q[4];
-rz(-2.721051841978622) q[4];
-sx q[4];
-rz(-3*pi/4) q[4];
-cx q[0],q[4];
-rz(3*pi/4) q[4];
-sx q[4];
-rz(-3*pi/4) q[4];
-sx q[4];
-cx q[0],q[4];
-rz(-pi/4) q[0];
-sx q[4];
-rz(-3*pi/4) q[4];
-sx q[4];
-rz(-pi/2) q[4];
-rz(pi/4) q[5];
-cx q[0],q[5];
-rz(-3*pi/4) q[5];
-sx q[5];
-rz(-3*pi/4) q[5];
-sx q[5];
-cx q[0],q[5];
-rz(-3*pi/4) q[0];
-sx q[5];
-rz(-3*pi/4) q[5];
-sx q[5];
-rz(pi/4) q[5];
-cx q[0],q[5];
-rz(-pi/4) q[5];
-sx q[5];
-rz(-2.776735301803516) q[5];
-sx q[5];
-cx q[0],q[5];
-sx q[5];
-rz(1.9356536785811738) q[5];
-cx q[4],q[5];
-rz(-pi/4) q[5];
-cx q[0],q[5];
-rz(pi/4) q[5];
-cx q[4],q[5];
-rz(pi/4) q[4];
-rz(-pi/4) q[5];
-cx q[0],q[5];
-cx q[0],q[4];
-rz(pi/4) q[0];
-rz(-pi/4) q[4];
-cx q[0],q[4];
-rz(-pi/4) q[0];
-rz(3*pi/4) q[4];
-cx q[0],q[4];
-rz(-3*pi/4) q[4];
-sx q[4];
-rz(-3*pi/4) q[4];
-sx q[4];
-cx q[0],q[4];
-rz(0.9545852216623132) q[0];
-sx q[4];
-rz(-3*pi/4) q[4];
-sx q[4];
-rz(3*pi/4) q[5];
-sx q[5];
-rz(3.0630469651805647) q[5];
-cx q[0],q[5];
-rz(2.18700743192748) q[5];
-sx q[5];
-rz(-2.616207406461066) q[5];
-sx q[5];
-cx q[0],q[5];
-rz(2.5381420683163585) q[5];
-sx q[5];
-rz(-2.016154863944406) q[5];
-sx q[5];
-rz(-2.8529815780542025) q[5];
-cx q[4],q[5];
-rz(-pi/4) q[5];
-cx q[0],q[5];
-rz(pi/4) q[5];
-cx q[4],q[5];
-rz(pi/4) q[4];
-rz(-pi/4) q[5];
-cx q[0],q[5];
-cx q[0],q[4];
-rz(pi/4) q[0];
-rz(-pi/4) q[4];
-cx q[0],q[4];
-rz(-pi/4) q[0];
-rz(pi/4) q[4];
-cx q[0],q[4];
-rz(-3*pi/4) q[4];
-sx q[4];
-rz(-3*pi/4) q[4];
-sx q[4];
-cx q[0],q[4];
-rz(-3*pi/4) q[0];
-sx q[4];
-rz(-3*pi/4) q[4];
-sx q[4];
-rz(pi/4) q[4];
-cx q[0],q[4];
-rz(-pi/4) q[4];
-sx q[4];
-rz(-2.776735301803516) q[4];
-sx q[4];
-cx q[0],q[4];
-rz(pi/2) q[0];
-sx q[4];
-rz(1.9356536785811738) q[4];
-rz(3*pi/4) q[5];
-sx q[5];
-rz(pi/2) q[5];
-cx q[0],q[5];
-rz(pi/2) q[5];
-sx q[5];
-rz(-2.721051841978622) q[5];
-sx q[5];
-cx q[0],q[5];
-rz(pi/2) q[0];
-sx q[5];
-rz(-2.721051841978622) q[5];
-sx q[5];
-cx q[0],q[5];
-rz(pi/2) q[5];
-sx q[5];
-rz(-3*pi/4) q[5];
-sx q[5];
-cx q[0],q[5];
-rz(pi/2) q[0];
-rz(-pi) q[5];
-sx q[5];
-rz(3*pi/4) q[5];
-sx q[5];
-rz(3*pi/4) q[6];
-sx q[6];
-rz(-pi) q[6];
-cx q[0],q[6];
-rz(pi/2) q[6];
-sx q[6];
-rz(-3*pi/4) q[6];
-sx q[6];
-cx q[0],q[6];
-rz(pi/2) q[0];
-sx q[6];
-rz(-3*pi/4) q[6];
-sx q[6];
-rz(-pi/2) q[6];
-cx q[0],q[6];
-rz(pi/2) q[6];
-sx q[6];
-rz(-3*pi/4) q[6];
-sx q[6];
-cx q[0],q[6];
-rz(pi/2) q[0];
-sx q[6];
-rz(-3*pi/4) q[6];
-sx q[6];
-rz(-pi/2) q[6];
-cx q[0],q[6];
-rz(pi/2) q[6];
-sx q[6];
-rz(-3*pi/4) q[6];
-sx q[6];
-cx q[0],q[6];
-rz(pi/2) q[0];
-sx q[6];
-rz(-3*pi/4) q[6];
-sx q[6];
-rz(-pi/2) q[6];
-cx q[0],q[6];
-rz(pi/2) q[6];
-sx q[6];
-rz(-3*pi/4) q[6];
-sx q[6];
-cx q[0],q[6];
-sx q[6];
-rz(3*pi/4) q[6];
-sx q[6];
-cx q[5],q[6];
-rz(-pi/4) q[6];
-cx q[0],q[6];
-rz(pi/4) q[6];
-cx q[5],q[6];
-rz(pi/4) q[5];
-rz(-pi/4) q[6];
-cx q[0],q[6];
-cx q[0],q[5];
-rz(pi/4) q[0];
-rz(3*pi/4) q[5];
-sx q[5];
-rz(-1.1617770265956633) q[5];
-sx q[5];
-cx q[0],q[5];
-rz(pi/2) q[0];
-rz(-pi) q[5];
-sx q[5];
-rz(1.1617770265956562) q[5];
-sx q[5];
-rz(3*pi/4) q[6];
-sx q[6];
-rz(-pi) q[6];
-cx q[0],q[6];
-rz(pi/2) q[6];
-sx q[6];
-rz(-3*pi/4) q[6];
-sx q[6];
-cx q[0],q[6];
-rz(-pi) q[6];
-sx q[6];
-rz(3*pi/4) q[6];
-sx q[6];
-cx q[0],q[6];
-rz(-pi) q[6];
-sx q[6];
-rz(1.1617770265956562) q[6];
-sx q[6];
-cx q[0],q[6];
-rz(pi/2) q[0];
-sx q[6];
-rz(1.1617770265956633) q[6];
-sx q[6];
-rz(-pi/2) q[6];
-cx q[0],q[6];
-rz(pi/2) q[6];
-sx q[6];
-rz(-3*pi/4) q[6];
-sx q[6];
-cx q[0],q[6];
-sx q[6];
-rz(3*pi/4) q[6];
-sx q[6];
-cx q[5],q[6];
-rz(-pi/4) q[6];
-cx q[0],q[6];
-rz(pi/4) q[6];
-cx q[5],q[6];
-rz(pi/4) q[5];
-rz(-pi/4) q[6];
-cx q[0],q[6];
-cx q[0],q[5];
-rz(pi/4) q[0];
-rz(-pi/4) q[5];
-cx q[0],q[5];
-rz(pi/2) q[0];
-rz(pi/2) q[5];
-cx q[0],q[5];
-rz(pi/2) q[5];
-sx q[5];
-rz(-3*pi/4) q[5];
-sx q[5];
-cx q[0],q[5];
-rz(pi/4) q[0];
-sx q[5];
-rz(-3*pi/4) q[5];
-sx q[5];
-rz(3*pi/4) q[5];
-cx q[0],q[5];
-rz(3*pi/4) q[5];
-sx q[5];
-rz(-3*pi/4) q[5];
-sx q[5];
-cx q[0],q[5];
-sx q[5];
-rz(-3*pi/4) q[5];
-sx q[5];
-rz(-pi/2) q[5];
-cx q[5],q[4];
-rz(-pi/4) q[4];
-cx q[0],q[4];
-rz(pi/4) q[4];
-cx q[5],q[4];
-rz(-pi/4) q[4];
-cx q[0],q[4];
-rz(3*pi/4) q[4];
-sx q[4];
-rz(3.0630469651805647) q[4];
-rz(pi/4) q[5];
-cx q[0],q[5];
-rz(pi/4) q[0];
-rz(-pi/4) q[5];
-cx q[0],q[5];
-rz(0.9545852216623132) q[0];
-cx q[0],q[4];
-rz(2.18700743192748) q[4];
-sx q[4];
-rz(-2.616207406461066) q[4];
-sx q[4];
-cx q[0],q[4];
-rz(-pi/4) q[0];
-rz(2.5381420683163585) q[4];
-sx q[4];
-rz(-2.016154863944406) q[4];
-sx q[4];
-rz(-2.8529815780542025) q[4];
-rz(3*pi/4) q[5];
-cx q[0],q[5];
-rz(-3*pi/4) q[5];
-sx q[5];
-rz(-3*pi/4) q[5];
-sx q[5];
-cx q[0],q[5];
-sx q[5];
-rz(-3*pi/4) q[5];
-sx q[5];
-cx q[5],q[4];
-rz(-pi/4) q[4];
-cx q[0],q[4];
-rz(pi/4) q[4];
-cx q[5],q[4];
-rz(-pi/4) q[4];
-cx q[0],q[4];
-rz(3*pi/4) q[4];
-sx q[4];
-rz(pi/2) q[4];
-rz(pi/4) q[5];
-cx q[0],q[5];
-rz(pi/4) q[0];
-rz(-pi/4) q[5];
-cx q[0],q[5];
-rz(pi/2) q[0];
-cx q[0],q[4];
-rz(pi/2) q[4];
-sx q[4];
-rz(-2.721051841978622) q[4];
-sx q[4];
-cx q[0],q[4];
-rz(pi/4) q[0];
-sx q[4];
-rz(-2.721051841978622) q[4];
-sx q[4];
-rz(-3*pi/4) q[4];
-cx q[0],q[4];
-rz(3*pi/4) q[4];
-sx q[4];
-rz(-3*pi/4) q[4];
-sx q[4];
-cx q[0],q[4];
-sx q[4];
-rz(-3*pi/4) q[4];
-sx q[4];
-rz(-pi/2) q[4];
-cx q[4],q[3];
-rz(-pi/4) q[3];
-cx q[0],q[3];
-rz(pi/4) q[3];
-cx q[4],q[3];
-rz(-pi/4) q[3];
-cx q[0],q[3];
-rz(3*pi/4) q[3];
-sx q[3];
-rz(3.0630469651805647) q[3];
-rz(pi/4) q[4];
-cx q[0],q[4];
-rz(pi/4) q[0];
-rz(-pi/4) q[4];
-cx q[0],q[4];
-rz(0.9545852216623132) q[0];
-cx q[0],q[3];
-rz(2.18700743192748) q[3];
-sx q[3];
-rz(-2.616207406461066) q[3];
-sx q[3];
-cx q[0],q[3];
-rz(-pi/4) q[0];
-rz(2.5381420683163585) q[3];
-sx q[3];
-rz(-2.016154863944406) q[3];
-sx q[3];
-rz(-2.8529815780542025) q[3];
-rz(3*pi/4) q[4];
-cx q[0],q[4];
-rz(-3*pi/4) q[4];
-sx q[4];
-rz(-3*pi/4) q[4];
-sx q[4];
-cx q[0],q[4];
-sx q[4];
-rz(-3*pi/4) q[4];
-sx q[4];
-cx q[4],q[3];
-rz(-pi/4) q[3];
-cx q[0],q[3];
-rz(pi/4) q[3];
-cx q[4],q[3];
-rz(-pi/4) q[3];
-cx q[0],q[3];
-rz(3*pi/4) q[3];
-sx q[3];
-rz(pi/2) q[3];
-rz(pi/4) q[4];
-cx q[0],q[4];
-rz(pi/4) q[0];
-rz(-pi/4) q[4];
-cx q[0],q[4];
-rz(pi/2) q[0];
-cx q[0],q[3];
-rz(pi/2) q[3];
-sx q[3];
-rz(-2.721051841978622) q[3];
-sx q[3];
-cx q[0],q[3];
-rz(pi/4) q[0];
-sx q[3];
-rz(-2.721051841978622) q[3];
-sx q[3];
-rz(-3*pi/4) q[3];
-cx q[0],q[3];
-rz(3*pi/4) q[3];
-sx q[3];
-rz(-3*pi/4) q[3];
-sx q[3];
-cx q[0],q[3];
-sx q[3];
-rz(-3*pi/4) q[3];
-sx q[3];
-rz(-pi/2) q[3];
-cx q[3],q[2];
-rz(-pi/4) q[2];
-cx q[0],q[2];
-rz(pi/4) q[2];
-cx q[3],q[2];
-rz(-pi/4) q[2];
-cx q[0],q[2];
-rz(3*pi/4) q[2];
-sx q[2];
-rz(3.0630469651805647) q[2];
-rz(pi/4) q[3];
-cx q[0],q[3];
-rz(pi/4) q[0];
-rz(-pi/4) q[3];
-cx q[0],q[3];
-rz(0.9545852216623132) q[0];
-cx q[0],q[2];
-rz(2.18700743192748) q[2];
-sx q[2];
-rz(-2.616207406461066) q[2];
-sx q[2];
-cx q[0],q[2];
-rz(-pi/4) q[0];
-rz(2.5381420683163585) q[2];
-sx q[2];
-rz(-2.016154863944406) q[2];
-sx q[2];
-rz(-2.8529815780542025) q[2];
-rz(3*pi/4) q[3];
-cx q[0],q[3];
-rz(-3*pi/4) q[3];
-sx q[3];
-rz(-3*pi/4) q[3];
-sx q[3];
-cx q[0],q[3];
-sx q[3];
-rz(-3*pi/4) q[3];
-sx q[3];
-cx q[3],q[2];
-rz(-pi/4) q[2];
-cx q[0],q[2];
-rz(pi/4) q[2];
-cx q[3],q[2];
-rz(-pi/4) q[2];
-cx q[0],q[2];
-rz(3*pi/4) q[2];
-sx q[2];
-rz(pi/2) q[2];
-rz(pi/4) q[3];
-cx q[0],q[3];
-rz(pi/4) q[0];
-rz(-pi/4) q[3];
-cx q[0],q[3];
-rz(pi/2) q[0];
-cx q[0],q[2];
-rz(pi/2) q[2];
-sx q[2];
-rz(-2.721051841978622) q[2];
-sx q[2];
-cx q[0],q[2];
-rz(pi/4) q[0];
-sx q[2];
-rz(-2.721051841978622) q[2];
-sx q[2];
-rz(-3*pi/4) q[2];
-cx q[0],q[2];
-rz(3*pi/4) q[2];
-sx q[2];
-rz(-3*pi/4) q[2];
-sx q[2];
-cx q[0],q[2];
-sx q[2];
-rz(-3*pi/4) q[2];
-sx q[2];
-rz(-pi/2) q[2];
-cx q[2],q[1];
-rz(-pi/4) q[1];
-cx q[0],q[1];
-rz(pi/4) q[1];
-cx q[2],q[1];
-rz(-pi/4) q[1];
-cx q[0],q[1];
-rz(3*pi/4) q[1];
-sx q[1];
-rz(3.0630469651805647) q[1];
-rz(pi/4) q[2];
-cx q[0],q[2];
-rz(pi/4) q[0];
-rz(-pi/4) q[2];
-cx q[0],q[2];
-rz(0.9545852216623132) q[0];
-cx q[0],q[1];
-rz(2.18700743192748) q[1];
-sx q[1];
-rz(-2.616207406461066) q[1];
-sx q[1];
-cx q[0],q[1];
-rz(-pi/4) q[0];
-rz(2.5381420683163585) q[1];
-sx q[1];
-rz(-2.016154863944406) q[1];
-sx q[1];
-rz(-2.8529815780542025) q[1];
-rz(3*pi/4) q[2];
-cx q[0],q[2];
-rz(-3*pi/4) q[2];
-sx q[2];
-rz(-3*pi/4) q[2];
-sx q[2];
-cx q[0],q[2];
-sx q[2];
-rz(-3*pi/4) q[2];
-sx q[2];
-cx q[2],q[1];
-rz(-pi/4) q[1];
-cx q[0],q[1];
-rz(pi/4) q[1];
-cx q[2],q[1];
-rz(-pi/4) q[1];
-cx q[0],q[1];
-rz(3*pi/4) q[1];
-sx q[1];
-rz(pi/2) q[1];
-rz(pi/4) q[2];
-cx q[0],q[2];
-rz(pi/4) q[0];
-rz(-pi/4) q[2];
-cx q[0],q[2];
-rz(pi/2) q[0];
-cx q[0],q[1];
-rz(pi/2) q[1];
-sx q[1];
-rz(-2.721051841978622) q[1];
-sx q[1];
-cx q[0],q[1];
-rz(-pi/4) q[0];
-sx q[1];
-rz(-2.721051841978622) q[1];
-sx q[1];
-rz(-pi/2) q[1];
-rz(pi/4) q[2];
-cx q[0],q[2];
-rz(-3*pi/4) q[2];
-sx q[2];
-rz(-3*pi/4) q[2];
-sx q[2];
-cx q[0],q[2];
-rz(-pi/4) q[0];
-sx q[2];
-rz(-3*pi/4) q[2];
-sx q[2];
-rz(pi/2) q[2];
-rz(pi/4) q[3];
-cx q[0],q[3];
-rz(-3*pi/4) q[3];
-sx q[3];
-rz(-3*pi/4) q[3];
-sx q[3];
-cx q[0],q[3];
-rz(-pi/4) q[0];
-sx q[3];
-rz(-3*pi/4) q[3];
-sx q[3];
-rz(pi/2) q[3];
-rz(pi/4) q[4];
-cx q[0],q[4];
-rz(-3*pi/4) q[4];
-sx q[4];
-rz(-3*pi/4) q[4];
-sx q[4];
-cx q[0],q[4];
-rz(-pi/4) q[0];
-sx q[4];
-rz(-3*pi/4) q[4];
-sx q[4];
-rz(pi/2) q[4];
-rz(pi/4) q[5];
-cx q[0],q[5];
-rz(-3*pi/4) q[5];
-sx q[5];
-rz(-3*pi/4) q[5];
-sx q[5];
-cx q[0],q[5];
-rz(pi/2) q[0];
-sx q[5];
-rz(-3*pi/4) q[5];
-sx q[5];
-rz(pi/2) q[5];
-rz(3*pi/4) q[6];
-sx q[6];
-rz(-pi) q[6];
-cx q[0],q[6];
-rz(pi/2) q[6];
-sx q[6];
-rz(-3*pi/4) q[6];
-sx q[6];
-cx q[0],q[6];
-rz(pi/2) q[0];
-sx q[6];
-rz(-3*pi/4) q[6];
-sx q[6];
-rz(-pi/2) q[6];
-cx q[0],q[6];
-rz(pi/2) q[6];
-sx q[6];
-rz(-3*pi/4) q[6];
-sx q[6];
-cx q[0],q[6];
-rz(pi/4) q[0];
-rz(-pi) q[6];
-sx q[6];
-rz(3*pi/4) q[6];
-sx q[6];
-x q[7];
-rz(-pi/4) q[7];
-cx q[0],q[7];
-rz(3*pi/4) q[7];
-sx q[7];
-rz(-3*pi/4) q[7];
-sx q[7];
-cx q[0],q[7];
-rz(-3*pi/4) q[0];
-sx q[7];
-rz(-3*pi/4) q[7];
-sx q[7];
-rz(-pi/2) q[7];
-x q[8];
-rz(-pi/4) q[8];
-cx q[0],q[8];
-rz(-pi/4) q[8];
-sx q[8];
-rz(-2.776735301803516) q[8];
-sx q[8];
-cx q[0],q[8];
-sx q[8];
-rz(1.9356536785811738) q[8];
-cx q[7],q[8];
-rz(-pi/4) q[8];
-cx q[0],q[8];
-rz(pi/4) q[8];
-cx q[7],q[8];
-rz(pi/4) q[7];
-rz(-pi/4) q[8];
-cx q[0],q[8];
-cx q[0],q[7];
-rz(pi/4) q[0];
-rz(-pi/4) q[7];
-cx q[0],q[7];
-rz(-pi/4) q[0];
-rz(3*pi/4) q[7];
-cx q[0],q[7];
-rz(-3*pi/4) q[7];
-sx q[7];
-rz(-3*pi/4) q[7];
-sx q[7];
-cx q[0],q[7];
-rz(0.9545852216623132) q[0];
-sx q[7];
-rz(-3*pi/4) q[7];
-sx q[7];
-rz(3*pi/4) q[8];
-sx q[8];
-rz(3.0630469651805647) q[8];
-cx q[0],q[8];
-rz(2.18700743192748) q[8];
-sx q[8];
-rz(-2.616207406461066) q[8];
-sx q[8];
-cx q[0],q[8];
-rz(2.5381420683163585) q[8];
-sx q[8];
-rz(-2.016154863944406) q[8];
-sx q[8];
-rz(-2.8529815780542025) q[8];
-cx q[7],q[8];
-rz(-pi/4) q[8];
-cx q[0],q[8];
-rz(pi/4) q[8];
-cx q[7],q[8];
-rz(pi/4) q[7];
-rz(-pi/4) q[8];
-cx q[0],q[8];
-cx q[0],q[7];
-rz(pi/4) q[0];
-rz(-pi/4) q[7];
-cx q[0],q[7];
-rz(-pi/4) q[0];
-rz(pi/4) q[7];
-cx q[0],q[7];
-rz(-3*pi/4) q[7];
-sx q[7];
-rz(-3*pi/4) q[7];
-sx q[7];
-cx q[0],q[7];
-rz(-3*pi/4) q[0];
-sx q[7];
-rz(-3*pi/4) q[7];
-sx q[7];
-rz(pi/4) q[7];
-cx q[0],q[7];
-rz(-pi/4) q[7];
-sx q[7];
-rz(-2.776735301803516) q[7];
-sx q[7];
-cx q[0],q[7];
-rz(pi/2) q[0];
-sx q[7];
-rz(1.9356536785811738) q[7];
-rz(3*pi/4) q[8];
-sx q[8];
-rz(pi/2) q[8];
-cx q[0],q[8];
-rz(pi/2) q[8];
-sx q[8];
-rz(-2.721051841978622) q[8];
-sx q[8];
-cx q[0],q[8];
-rz(pi/4) q[0];
-sx q[8];
-rz(-2.721051841978622) q[8];
-sx q[8];
-rz(-3*pi/4) q[8];
-cx q[0],q[8];
-rz(3*pi/4) q[8];
-sx q[8];
-rz(-3*pi/4) q[8];
-sx q[8];
-cx q[0],q[8];
-rz(pi/2) q[0];
-sx q[8];
-rz(-3*pi/4) q[8];
-sx q[8];
-rz(-pi/2) q[8];
-x q[9];
-rz(pi/2) q[9];
-cx q[0],q[9];
-rz(pi/2) q[9];
-sx q[9];
-rz(-3*pi/4) q[9];
-sx q[9];
-cx q[0],q[9];
-rz(pi/2) q[0];
-rz(-pi) q[9];
-sx q[9];
-rz(3*pi/4) q[9];
-sx q[9];
-rz(pi/2) q[10];
-cx q[0],q[10];
-rz(pi/2) q[10];
-sx q[10];
-rz(-3*pi/4) q[10];
-sx q[10];
-cx q[0],q[10];
-rz(pi/2) q[0];
-sx q[10];
-rz(-3*pi/4) q[10];
-sx q[10];
-rz(-pi/2) q[10];
-cx q[0],q[10];
-rz(pi/2) q[10];
-sx q[10];
-rz(-3*pi/4) q[10];
-sx q[10];
-cx q[0],q[10];
-sx q[10];
-rz(3*pi/4) q[10];
-sx q[10];
-cx q[9],q[10];
-rz(-pi/4) q[10];
-cx q[0],q[10];
-rz(pi/4) q[10];
-cx q[9],q[10];
-rz(-pi/4) q[10];
-cx q[0],q[10];
-rz(3*pi/4) q[10];
-sx q[10];
-rz(-pi) q[10];
-rz(pi/4) q[9];
-cx q[0],q[9];
-rz(pi/4) q[0];
-rz(3*pi/4) q[9];
-sx q[9];
-rz(2.143557788959604) q[9];
-sx q[9];
-cx q[0],q[9];
-rz(pi/2) q[0];
-cx q[0],q[10];
-rz(pi/2) q[10];
-sx q[10];
-rz(-3*pi/4) q[10];
-sx q[10];
-cx q[0],q[10];
-rz(-pi) q[10];
-sx q[10];
-rz(3*pi/4) q[10];
-sx q[10];
-cx q[0],q[10];
-sx q[10];
-rz(2.143557788959603) q[10];
-sx q[10];
-rz(-pi) q[10];
-cx q[0],q[10];
-rz(pi/2) q[0];
-sx q[10];
-rz(-2.143557788959604) q[10];
-sx q[10];
-rz(-pi/2) q[10];
-cx q[0],q[10];
-rz(pi/2) q[10];
-sx q[10];
-rz(-3*pi/4) q[10];
-sx q[10];
-cx q[0],q[10];
-sx q[10];
-rz(3*pi/4) q[10];
-sx q[10];
-sx q[9];
-rz(2.143557788959603) q[9];
-sx q[9];
-rz(-pi) q[9];
-cx q[9],q[10];
-rz(-pi/4) q[10];
-cx q[0],q[10];
-rz(pi/4) q[10];
-cx q[9],q[10];
-rz(-pi/4) q[10];
-cx q[0],q[10];
-rz(3*pi/4) q[10];
-sx q[10];
-rz(-pi) q[10];
-rz(pi/4) q[9];
-cx q[0],q[9];
-rz(pi/4) q[0];
-rz(-pi/4) q[9];
-cx q[0],q[9];
-rz(pi/2) q[0];
-rz(pi/2) q[9];
-cx q[0],q[9];
-rz(pi/2) q[9];
-sx q[9];
-rz(-3*pi/4) q[9];
-sx q[9];
-cx q[0],q[9];
-rz(-3*pi/4) q[0];
-sx q[9];
-rz(-3*pi/4) q[9];
-sx q[9];
-rz(3*pi/4) q[9];
-cx q[0],q[9];
-rz(-pi/4) q[9];
-sx q[9];
-rz(-2.776735301803516) q[9];
-sx q[9];
-cx q[0],q[9];
-sx q[9];
-rz(1.9356536785811738) q[9];
-cx q[8],q[9];
-rz(-pi/4) q[9];
-cx q[0],q[9];
-rz(pi/4) q[9];
-cx q[8],q[9];
-rz(pi/4) q[8];
-rz(-pi/4) q[9];
-cx q[0],q[9];
-cx q[0],q[8];
-rz(pi/4) q[0];
-rz(-pi/4) q[8];
-cx q[0],q[8];
-rz(-pi/4) q[0];
-rz(3*pi/4) q[8];
-cx q[0],q[8];
-rz(-3*pi/4) q[8];
-sx q[8];
-rz(-3*pi/4) q[8];
-sx q[8];
-cx q[0],q[8];
-rz(0.9545852216623132) q[0];
-sx q[8];
-rz(-3*pi/4) q[8];
-sx q[8];
-rz(3*pi/4) q[9];
-sx q[9];
-rz(3.0630469651805647) q[9];
-cx q[0],q[9];
-rz(2.18700743192748) q[9];
-sx q[9];
-rz(-2.616207406461066) q[9];
-sx q[9];
-cx q[0],q[9];
-rz(2.5381420683163585) q[9];
-sx q[9];
-rz(-2.016154863944406) q[9];
-sx q[9];
-rz(-2.8529815780542025) q[9];
-cx q[8],q[9];
-rz(-pi/4) q[9];
-cx q[0],q[9];
-rz(pi/4) q[9];
-cx q[8],q[9];
-rz(pi/4) q[8];
-rz(-pi/4) q[9];
-cx q[0],q[9];
-cx q[0],q[8];
-rz(pi/4) q[0];
-rz(-pi/4) q[8];
-cx q[0],q[8];
-rz(-pi/4) q[0];
-rz(pi/4) q[8];
-cx q[0],q[8];
-rz(-3*pi/4) q[8];
-sx q[8];
-rz(-3*pi/4) q[8];
-sx q[8];
-cx q[0],q[8];
-rz(-3*pi/4) q[0];
-sx q[8];
-rz(-3*pi/4) q[8];
-sx q[8];
-rz(pi/4) q[8];
-cx q[0],q[8];
-rz(-pi/4) q[8];
-sx q[8];
-rz(-2.776735301803516) q[8];
-sx q[8];
-cx q[0],q[8];
-rz(pi/2) q[0];
-sx q[8];
-rz(1.9356536785811738) q[8];
-rz(3*pi/4) q[9];
-sx q[9];
-rz(pi/2) q[9];
-cx q[0],q[9];
-rz(pi/2) q[9];
-sx q[9];
-rz(-2.721051841978622) q[9];
-sx q[9];
-cx q[0],q[9];
-rz(pi/4) q[0];
-sx q[9];
-rz(-2.721051841978622) q[9];
-sx q[9];
-rz(-3*pi/4) q[9];
-cx q[0],q[9];
-rz(3*pi/4) q[9];
-sx q[9];
-rz(-3*pi/4) q[9];
-sx q[9];
-cx q[0],q[9];
-rz(pi/2) q[0];
-cx q[0],q[10];
-rz(pi/2) q[10];
-sx q[10];
-rz(-3*pi/4) q[10];
-sx q[10];
-cx q[0],q[10];
-rz(pi/2) q[0];
-sx q[10];
-rz(-3*pi/4) q[10];
-sx q[10];
-rz(-pi/2) q[10];
-cx q[0],q[10];
-rz(pi/2) q[10];
-sx q[10];
-rz(-3*pi/4) q[10];
-sx q[10];
-cx q[0],q[10];
-rz(-3*pi/4) q[0];
-sx q[10];
-rz(-3*pi/4) q[10];
-sx q[10];
-rz(3*pi/4) q[10];
-cx q[0],q[10];
-rz(-pi/4) q[10];
-sx q[10];
-rz(-2.776735301803516) q[10];
-sx q[10];
-cx q[0],q[10];
-sx q[10];
-rz(1.9356536785811738) q[10];
-sx q[9];
-rz(-3*pi/4) q[9];
-sx q[9];
-rz(-pi/2) q[9];
-cx q[9],q[10];
-rz(-pi/4) q[10];
-cx q[0],q[10];
-rz(pi/4) q[10];
-cx q[9],q[10];
-rz(-pi/4) q[10];
-cx q[0],q[10];
-rz(3*pi/4) q[10];
-sx q[10];
-rz(3.0630469651805647) q[10];
-rz(pi/4) q[9];
-cx q[0],q[9];
-rz(pi/4) q[0];
-rz(-pi/4) q[9];
-cx q[0],q[9];
-rz(-pi/4) q[0];
-rz(3*pi/4) q[9];
-cx q[0],q[9];
-rz(-3*pi/4) q[9];
-sx q[9];
-rz(-3*pi/4) q[9];
-sx q[9];
-cx q[0],q[9];
-rz(0.9545852216623132) q[0];
-cx q[0],q[10];
-rz(2.18700743192748) q[10];
-sx q[10];
-rz(-2.616207406461066) q[10];
-sx q[10];
-cx q[0],q[10];
-rz(2.5381420683163585) q[10];
-sx q[10];
-rz(-2.016154863944406) q[10];
-sx q[10];
-rz(-2.8529815780542025) q[10];
-sx q[9];
-rz(-3*pi/4) q[9];
-sx q[9];
-cx q[9],q[10];
-rz(-pi/4) q[10];
-cx q[0],q[10];
-rz(pi/4) q[10];
-cx q[9],q[10];
-rz(-pi/4) q[10];
-cx q[0],q[10];
-rz(3*pi/4) q[10];
-sx q[10];
-rz(pi/2) q[10];
-rz(pi/4) q[9];
-cx q[0],q[9];
-rz(pi/4) q[0];
-rz(-pi/4) q[9];
-cx q[0],q[9];
-rz(-pi/4) q[0];
-rz(pi/4) q[9];
-cx q[0],q[9];
-rz(-3*pi/4) q[9];
-sx q[9];
-rz(-3*pi/4) q[9];
-sx q[9];
-cx q[0],q[9];
-rz(-3*pi/4) q[0];
-sx q[9];
-rz(-3*pi/4) q[9];
-sx q[9];
-rz(pi/4) q[9];
-cx q[0],q[9];
-rz(-pi/4) q[9];
-sx q[9];
-rz(-2.776735301803516) q[9];
-sx q[9];
-cx q[0],q[9];
-rz(pi/2) q[0];
-cx q[0],q[10];
-rz(pi/2) q[10];
-sx q[10];
-rz(-2.721051841978622) q[10];
-sx q[10];
-cx q[0],q[10];
-rz(pi/4) q[0];
-sx q[10];
-rz(-2.721051841978622) q[10];
-sx q[10];
-rz(-3*pi/4) q[10];
-cx q[0],q[10];
-rz(3*pi/4) q[10];
-sx q[10];
-rz(-3*pi/4) q[10];
-sx q[10];
-cx q[0],q[10];
-rz(-3*pi/4) q[0];
-sx q[10];
-rz(-3*pi/4) q[10];
-sx q[10];
-rz(-pi/2) q[10];
-sx q[9];
-rz(1.9356536785811738) q[9];
-rz(-pi/4) q[11];
-cx q[0],q[11];
-rz(-pi/4) q[11];
-sx q[11];
-rz(-2.776735301803516) q[11];
-sx q[11];
-cx q[0],q[11];
-sx q[11];
-rz(1.9356536785811738) q[11];
-cx q[10],q[11];
-rz(-pi/4) q[11];
-cx q[0],q[11];
-rz(pi/4) q[11];
-cx q[10],q[11];
-rz(pi/4) q[10];
-rz(-pi/4) q[11];
-cx q[0],q[11];
-cx q[0],q[10];
-rz(pi/4) q[0];
-rz(-pi/4) q[10];
-cx q[0],q[10];
-rz(0.9545852216623132) q[0];
-rz(3*pi/4) q[10];
-rz(3*pi/4) q[11];
-sx q[11];
-rz(3.0630469651805647) q[11];
-cx q[0],q[11];
-rz(2.18700743192748) q[11];
-sx q[11];
-rz(-2.616207406461066) q[11];
-sx q[11];
-cx q[0],q[11];
-rz(-pi/4) q[0];
-cx q[0],q[10];
-rz(-3*pi/4) q[10];
-sx q[10];
-rz(-3*pi/4) q[10];
-sx q[10];
-cx q[0],q[10];
-sx q[10];
-rz(-3*pi/4) q[10];
-sx q[10];
-rz(2.5381420683163585) q[11];
-sx q[11];
-rz(-2.016154863944406) q[11];
-sx q[11];
-rz(-2.8529815780542025) q[11];
-cx q[10],q[11];
-rz(-pi/4) q[11];
-cx q[0],q[11];
-rz(pi/4) q[11];
-cx q[10],q[11];
-rz(pi/4) q[10];
-rz(-pi/4) q[11];
-cx q[0],q[11];
-cx q[0],q[10];
-rz(pi/4) q[0];
-rz(-pi/4) q[10];
-cx q[0],q[10];
-rz(pi/2) q[0];
-rz(pi/4) q[10];
-rz(3*pi/4) q[11];
-sx q[11];
-rz(pi/2) q[11];
-cx q[0],q[11];
-rz(pi/2) q[11];
-sx q[11];
-rz(-2.721051841978622) q[11];
-sx q[11];
-cx q[0],q[11];
-rz(pi/2) q[0];
-sx q[11];
-rz(-2.721051841978622) q[11];
-sx q[11];
-cx q[0],q[11];
-rz(pi/2) q[11];
-sx q[11];
-rz(-3*pi/4) q[11];
-sx q[11];
-cx q[0],q[11];
-rz(-pi/4) q[0];
-cx q[0],q[10];
-rz(-3*pi/4) q[10];
-sx q[10];
-rz(-3*pi/4) q[10];
-sx q[10];
-cx q[0],q[10];
-rz(-3*pi/4) q[0];
-sx q[10];
-rz(-3*pi/4) q[10];
-sx q[10];
-rz(pi/4) q[10];
-cx q[0],q[10];
-rz(-pi/4) q[10];
-sx q[10];
-rz(-2.776735301803516) q[10];
-sx q[10];
-cx q[0],q[10];
-rz(pi/2) q[0];
-sx q[10];
-rz(1.9356536785811738) q[10];
-rz(-pi) q[11];
-sx q[11];
-rz(3*pi/4) q[11];
-sx q[11];
-rz(pi/2) q[12];
-cx q[0],q[12];
-rz(pi/2) q[12];
-sx q[12];
-rz(-3*pi/4) q[12];
-sx q[12];
-cx q[0],q[12];
-rz(pi/2) q[0];
-sx q[12];
-rz(-3*pi/4) q[12];
-sx q[12];
-rz(-pi/2) q[12];
-cx q[0],q[12];
-rz(pi/2) q[12];
-sx q[12];
-rz(-3*pi/4) q[12];
-sx q[12];
-cx q[0],q[12];
-sx q[12];
-rz(3*pi/4) q[12];
-sx q[12];
-cx q[11],q[12];
-rz(-pi/4) q[12];
-cx q[0],q[12];
-rz(pi/4) q[12];
-cx q[11],q[12];
-rz(pi/4) q[11];
-rz(-pi/4) q[12];
-cx q[0],q[12];
-cx q[0],q[11];
-rz(pi/4) q[0];
-rz(3*pi/4) q[11];
-sx q[11];
-rz(-0.3281242057491873) q[11];
-sx q[11];
-cx q[0],q[11];
-rz(pi/2) q[0];
-rz(-pi) q[11];
-sx q[11];
-rz(0.3281242057491882) q[11];
-sx q[11];
-rz(3*pi/4) q[12];
-sx q[12];
-rz(-pi) q[12];
-cx q[0],q[12];
-rz(pi/2) q[12];
-sx q[12];
-rz(-3*pi/4) q[12];
-sx q[12];
-cx q[0],q[12];
-rz(-pi) q[12];
-sx q[12];
-rz(3*pi/4) q[12];
-sx q[12];
-cx q[0],q[12];
-rz(-pi) q[12];
-sx q[12];
-rz(0.3281242057491882) q[12];
-sx q[12];
-cx q[0],q[12];
-rz(pi/2) q[0];
-sx q[12];
-rz(0.32812420574918777) q[12];
-sx q[12];
-rz(-pi/2) q[12];
-cx q[0],q[12];
-rz(pi/2) q[12];
-sx q[12];
-rz(-3*pi/4) q[12];
-sx q[12];
-cx q[0],q[12];
-sx q[12];
-rz(3*pi/4) q[12];
-sx q[12];
-cx q[11],q[12];
-rz(-pi/4) q[12];
-cx q[0],q[12];
-rz(pi/4) q[12];
-cx q[11],q[12];
-rz(pi/4) q[11];
-rz(-pi/4) q[12];
-cx q[0],q[12];
-cx q[0],q[11];
-rz(pi/4) q[0];
-rz(-pi/4) q[11];
-cx q[0],q[11];
-rz(pi/2) q[0];
-rz(pi/2) q[11];
-cx q[0],q[11];
-rz(pi/2) q[11];
-sx q[11];
-rz(-3*pi/4) q[11];
-sx q[11];
-cx q[0],q[11];
-rz(pi/4) q[0];
-sx q[11];
-rz(-3*pi/4) q[11];
-sx q[11];
-rz(3*pi/4) q[11];
-cx q[0],q[11];
-rz(3*pi/4) q[11];
-sx q[11];
-rz(-3*pi/4) q[11];
-sx q[11];
-cx q[0],q[11];
-sx q[11];
-rz(-3*pi/4) q[11];
-sx q[11];
-rz(-pi/2) q[11];
-cx q[11],q[10];
-rz(-pi/4) q[10];
-cx q[0],q[10];
-rz(pi/4) q[10];
-cx q[11],q[10];
-rz(-pi/4) q[10];
-cx q[0],q[10];
-rz(3*pi/4) q[10];
-sx q[10];
-rz(3.0630469651805647) q[10];
-rz(pi/4) q[11];
-cx q[0],q[11];
-rz(pi/4) q[0];
-rz(-pi/4) q[11];
-cx q[0],q[11];
-rz(-pi/4) q[0];
-rz(3*pi/4) q[11];
-cx q[0],q[11];
-rz(-3*pi/4) q[11];
-sx q[11];
-rz(-3*pi/4) q[11];
-sx q[11];
-cx q[0],q[11];
-rz(pi/2) q[0];
-sx q[11];
-rz(-3*pi/4) q[11];
-sx q[11];
-rz(3*pi/4) q[12];
-sx q[12];
-rz(-pi) q[12];
-cx q[0],q[12];
-rz(pi/2) q[12];
-sx q[12];
-rz(-3*pi/4) q[12];
-sx q[12];
-cx q[0],q[12];
-rz(pi/2) q[0];
-sx q[12];
-rz(-3*pi/4) q[12];
-sx q[12];
-rz(-pi/2) q[12];
-cx q[0],q[12];
-rz(pi/2) q[12];
-sx q[12];
-rz(-3*pi/4) q[12];
-sx q[12];
-cx q[0],q[12];
-rz(pi/2) q[0];
-rz(-pi) q[12];
-sx q[12];
-rz(3*pi/4) q[12];
-sx q[12];
-cx q[0],q[12];
-sx q[12];
-rz(-pi/2) q[12];
-cx q[0],q[12];
-rz(0.9545852216623132) q[0];
-cx q[0],q[10];
-rz(2.18700743192748) q[10];
-sx q[10];
-rz(-2.616207406461066) q[10];
-sx q[10];
-cx q[0],q[10];
-rz(2.5381420683163585) q[10];
-sx q[10];
-rz(-2.016154863944406) q[10];
-sx q[10];
-rz(-2.8529815780542025) q[10];
-cx q[11],q[10];
-rz(-pi/4) q[10];
-cx q[0],q[10];
-rz(pi/4) q[10];
-cx q[11],q[10];
-rz(-pi/4) q[10];
-cx q[0],q[10];
-rz(3*pi/4) q[10];
-sx q[10];
-rz(pi/2) q[10];
-rz(pi/4) q[11];
-cx q[0],q[11];
-rz(pi/4) q[0];
-rz(-pi/4) q[11];
-cx q[0],q[11];
-rz(-pi/4) q[0];
-rz(pi/4) q[11];
-cx q[0],q[11];
-rz(-3*pi/4) q[11];
-sx q[11];
-rz(-3*pi/4) q[11];
-sx q[11];
-cx q[0],q[11];
-rz(pi/2) q[0];
-sx q[11];
-rz(-3*pi/4) q[11];
-sx q[11];
-rz(pi/2) q[11];
-cx q[0],q[11];
-sx q[11];
-rz(-pi/2) q[11];
-cx q[0],q[11];
-rz(pi/2) q[0];
-cx q[0],q[10];
-rz(pi/2) q[10];
-sx q[10];
-rz(-2.721051841978622) q[10];
-sx q[10];
-cx q[0],q[10];
-rz(pi/4) q[0];
-sx q[10];
-rz(-2.721051841978622) q[10];
-sx q[10];
-rz(-3*pi/4) q[10];
-cx q[0],q[10];
-rz(3*pi/4) q[10];
-sx q[10];
-rz(-3*pi/4) q[10];
-sx q[10];
-cx q[0],q[10];
-sx q[10];
-rz(-3*pi/4) q[10];
-sx q[10];
-rz(-pi/2) q[10];
-cx q[10],q[9];
-rz(-pi/2) q[11];
-sx q[11];
-rz(-pi) q[11];
-rz(-pi/2) q[12];
-sx q[12];
-rz(-pi) q[12];
-rz(-pi/4) q[9];
-cx q[0],q[9];
-rz(pi/4) q[9];
-cx q[10],q[9];
-rz(pi/4) q[10];
-rz(-pi/4) q[9];
-cx q[0],q[9];
-cx q[0],q[10];
-rz(pi/4) q[0];
-rz(-pi/4) q[10];
-cx q[0],q[10];
-rz(0.9545852216623132) q[0];
-rz(3*pi/4) q[10];
-rz(3*pi/4) q[9];
-sx q[9];
-rz(3.0630469651805647) q[9];
-cx q[0],q[9];
-rz(2.18700743192748) q[9];
-sx q[9];
-rz(-2.616207406461066) q[9];
-sx q[9];
-cx q[0],q[9];
-rz(-pi/4) q[0];
-cx q[0],q[10];
-rz(-3*pi/4) q[10];
-sx q[10];
-rz(-3*pi/4) q[10];
-sx q[10];
-cx q[0],q[10];
-sx q[10];
-rz(-3*pi/4) q[10];
-sx q[10];
-rz(2.5381420683163585) q[9];
-sx q[9];
-rz(-2.016154863944406) q[9];
-sx q[9];
-rz(-2.8529815780542025) q[9];
-cx q[10],q[9];
-rz(-pi/4) q[9];
-cx q[0],q[9];
-rz(pi/4) q[9];
-cx q[10],q[9];
-rz(pi/4) q[10];
-rz(-pi/4) q[9];
-cx q[0],q[9];
-cx q[0],q[10];
-rz(pi/4) q[0];
-rz(-pi/4) q[10];
-cx q[0],q[10];
-rz(pi/2) q[0];
-rz(pi/4) q[10];
-rz(3*pi/4) q[9];
-sx q[9];
-rz(pi/2) q[9];
-cx q[0],q[9];
-rz(pi/2) q[9];
-sx q[9];
-rz(-2.721051841978622) q[9];
-sx q[9];
-cx q[0],q[9];
-rz(pi/4) q[0];
-sx q[9];
-rz(-2.721051841978622) q[9];
-sx q[9];
-rz(-3*pi/4) q[9];
-cx q[0],q[9];
-rz(3*pi/4) q[9];
-sx q[9];
-rz(-3*pi/4) q[9];
-sx q[9];
-cx q[0],q[9];
-sx q[9];
-rz(-3*pi/4) q[9];
-sx q[9];
-rz(-pi/2) q[9];
-cx q[9],q[8];
-rz(-pi/4) q[8];
-cx q[0],q[8];
-rz(pi/4) q[8];
-cx q[9],q[8];
-rz(-pi/4) q[8];
-cx q[0],q[8];
-rz(3*pi/4) q[8];
-sx q[8];
-rz(3.0630469651805647) q[8];
-rz(pi/4) q[9];
-cx q[0],q[9];
-rz(pi/4) q[0];
-rz(-pi/4) q[9];
-cx q[0],q[9];
-rz(0.9545852216623132) q[0];
-cx q[0],q[8];
-rz(2.18700743192748) q[8];
-sx q[8];
-rz(-2.616207406461066) q[8];
-sx q[8];
-cx q[0],q[8];
-rz(-pi/4) q[0];
-rz(2.5381420683163585) q[8];
-sx q[8];
-rz(-2.016154863944406) q[8];
-sx q[8];
-rz(-2.8529815780542025) q[8];
-rz(3*pi/4) q[9];
-cx q[0],q[9];
-rz(-3*pi/4) q[9];
-sx q[9];
-rz(-3*pi/4) q[9];
-sx q[9];
-cx q[0],q[9];
-sx q[9];
-rz(-3*pi/4) q[9];
-sx q[9];
-cx q[9],q[8];
-rz(-pi/4) q[8];
-cx q[0],q[8];
-rz(pi/4) q[8];
-cx q[9],q[8];
-rz(-pi/4) q[8];
-cx q[0],q[8];
-rz(3*pi/4) q[8];
-sx q[8];
-rz(pi/2) q[8];
-rz(pi/4) q[9];
-cx q[0],q[9];
-rz(pi/4) q[0];
-rz(-pi/4) q[9];
-cx q[0],q[9];
-rz(pi/2) q[0];
-cx q[0],q[8];
-rz(pi/2) q[8];
-sx q[8];
-rz(-2.721051841978622) q[8];
-sx q[8];
-cx q[0],q[8];
-rz(pi/4) q[0];
-sx q[8];
-rz(-2.721051841978622) q[8];
-sx q[8];
-rz(-3*pi/4) q[8];
-cx q[0],q[8];
-rz(3*pi/4) q[8];
-sx q[8];
-rz(-3*pi/4) q[8];
-sx q[8];
-cx q[0],q[8];
-sx q[8];
-rz(-3*pi/4) q[8];
-sx q[8];
-rz(-pi/2) q[8];
-cx q[8],q[7];
-rz(-pi/4) q[7];
-cx q[0],q[7];
-rz(pi/4) q[7];
-cx q[8],q[7];
-rz(-pi/4) q[7];
-cx q[0],q[7];
-rz(3*pi/4) q[7];
-sx q[7];
-rz(3.0630469651805647) q[7];
-rz(pi/4) q[8];
-cx q[0],q[8];
-rz(pi/4) q[0];
-rz(-pi/4) q[8];
-cx q[0],q[8];
-rz(0.9545852216623132) q[0];
-cx q[0],q[7];
-rz(2.18700743192748) q[7];
-sx q[7];
-rz(-2.616207406461066) q[7];
-sx q[7];
-cx q[0],q[7];
-rz(-pi/4) q[0];
-rz(2.5381420683163585) q[7];
-sx q[7];
-rz(-2.016154863944406) q[7];
-sx q[7];
-rz(-2.8529815780542025) q[7];
-rz(3*pi/4) q[8];
-cx q[0],q[8];
-rz(-3*pi/4) q[8];
-sx q[8];
-rz(-3*pi/4) q[8];
-sx q[8];
-cx q[0],q[8];
-sx q[8];
-rz(-3*pi/4) q[8];
-sx q[8];
-cx q[8],q[7];
-rz(-pi/4) q[7];
-cx q[0],q[7];
-rz(pi/4) q[7];
-cx q[8],q[7];
-rz(-pi/4) q[7];
-cx q[0],q[7];
-rz(3*pi/4) q[7];
-sx q[7];
-rz(pi/2) q[7];
-rz(pi/4) q[8];
-cx q[0],q[8];
-rz(pi/4) q[0];
-rz(-pi/4) q[8];
-cx q[0],q[8];
-rz(pi/2) q[0];
-cx q[0],q[7];
-rz(pi/2) q[7];
-sx q[7];
-rz(-2.721051841978622) q[7];
-sx q[7];
-cx q[0],q[7];
-rz(-pi/4) q[0];
-sx q[7];
-rz(-2.721051841978622) q[7];
-sx q[7];
-rz(-pi/2) q[7];
-rz(pi/4) q[8];
-cx q[0],q[8];
-rz(-3*pi/4) q[8];
-sx q[8];
-rz(-3*pi/4) q[8];
-sx q[8];
-cx q[0],q[8];
-rz(-pi/4) q[0];
-sx q[8];
-rz(-3*pi/4) q[8];
-sx q[8];
-rz(pi/2) q[8];
-rz(pi/4) q[9];
-cx q[0],q[9];
-rz(-3*pi/4) q[9];
-sx q[9];
-rz(-3*pi/4) q[9];
-sx q[9];
-cx q[0],q[9];
-rz(pi/2) q[0];
-rz(-pi) q[9];
-sx q[9];
-rz(3*pi/4) q[9];
-sx q[9];
-cx q[0],q[9];
-rz(pi/2) q[9];
-sx q[9];
-rz(-3*pi/4) q[9];
-sx q[9];
-cx q[0],q[9];
-rz(-pi/4) q[0];
-cx q[0],q[10];
-rz(-3*pi/4) q[10];
-sx q[10];
-rz(-3*pi/4) q[10];
-sx q[10];
-cx q[0],q[10];
-rz(pi/2) q[0];
-rz(-pi) q[10];
-sx q[10];
-rz(3*pi/4) q[10];
-sx q[10];
-cx q[0],q[10];
-rz(pi/2) q[10];
-sx q[10];
-rz(-3*pi/4) q[10];
-sx q[10];
-cx q[0],q[10];
-rz(pi/2) q[0];
-sx q[10];
-rz(-3*pi/4) q[10];
-sx q[10];
-rz(-pi/2) q[10];
-cx q[0],q[10];
-rz(pi/2) q[10];
-sx q[10];
-rz(-3*pi/4) q[10];
-sx q[10];
-cx q[0],q[10];
-sx q[10];
-rz(3*pi/4) q[10];
-sx q[10];
-rz(-pi) q[9];
-sx q[9];
-rz(3*pi/4) q[9];
-sx q[9];
-cx q[9],q[10];
-rz(-pi/4) q[10];
-cx q[0],q[10];
-rz(pi/4) q[10];
-cx q[9],q[10];
-rz(-pi/4) q[10];
-cx q[0],q[10];
-rz(3*pi/4) q[10];
-sx q[10];
-rz(-pi) q[10];
-rz(pi/4) q[9];
-cx q[0],q[9];
-rz(pi/4) q[0];
-rz(3*pi/4) q[9];
-sx q[9];
-rz(-1.1617770265956633) q[9];
-sx q[9];
-cx q[0],q[9];
-rz(pi/2) q[0];
-cx q[0],q[10];
-rz(pi/2) q[10];
-sx q[10];
-rz(-3*pi/4) q[10];
-sx q[10];
-cx q[0],q[10];
-rz(-pi) q[10];
-sx q[10];
-rz(3*pi/4) q[10];
-sx q[10];
-cx q[0],q[10];
-rz(-pi) q[10];
-sx q[10];
-rz(1.1617770265956562) q[10];
-sx q[10];
-cx q[0],q[10];
-rz(pi/2) q[0];
-sx q[10];
-rz(1.1617770265956633) q[10];
-sx q[10];
-rz(-pi/2) q[10];
-cx q[0],q[10];
-rz(pi/2) q[10];
-sx q[10];
-rz(-3*pi/4) q[10];
-sx q[10];
-cx q[0],q[10];
-sx q[10];
-rz(3*pi/4) q[10];
-sx q[10];
-rz(-pi) q[9];
-sx q[9];
-rz(1.1617770265956562) q[9];
-sx q[9];
-cx q[9],q[10];
-rz(-pi/4) q[10];
-cx q[0],q[10];
-rz(pi/4) q[10];
-cx q[9],q[10];
-rz(-pi/4) q[10];
-cx q[0],q[10];
-rz(3*pi/4) q[10];
-sx q[10];
-rz(-pi) q[10];
-rz(pi/4) q[9];
-cx q[0],q[9];
-rz(pi/4) q[0];
-rz(-pi/4) q[9];
-cx q[0],q[9];
-rz(pi/2) q[0];
-rz(pi/2) q[9];
-cx q[0],q[9];
-rz(pi/2) q[9];
-sx q[9];
-rz(-3*pi/4) q[9];
-sx q[9];
-cx q[0],q[9];
-rz(pi/2) q[0];
-cx q[0],q[10];
-rz(pi/2) q[10];
-sx q[10];
-rz(-3*pi/4) q[10];
-sx q[10];
-cx q[0],q[10];
-rz(pi/2) q[0];
-sx q[10];
-rz(-3*pi/4) q[10];
-sx q[10];
-rz(-pi/2) q[10];
-cx q[0],q[10];
-rz(pi/2) q[10];
-sx q[10];
-rz(-3*pi/4) q[10];
-sx q[10];
-cx q[0],q[10];
-rz(-2.4896930715618826) q[0];
-sx q[0];
-rz(pi/2) q[0];
-rz(-pi) q[10];
-sx q[10];
-rz(3*pi/4) q[10];
-sx q[10];
-rz(-pi) q[9];
-sx q[9];
-rz(3*pi/4) q[9];
-sx q[9];
-measure q[0] -> c[0];
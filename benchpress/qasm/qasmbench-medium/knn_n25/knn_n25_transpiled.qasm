@@ -1,347 +0,0 @@
-OPENQASM 2.0;
-include "qelib1.inc";
-qreg q0[25];
-creg c0[1];
-rz(pi/2) q0[0];
-sx q0[0];
-rz(pi/2) q0[0];
-rz(-pi) q0[1];
-sx q0[1];
-rz(2.2081245) q0[1];
-sx q0[1];
-rz(-pi) q0[2];
-sx q0[2];
-rz(2.3117105) q0[2];
-sx q0[2];
-rz(-pi) q0[3];
-sx q0[3];
-rz(1.9604817) q0[3];
-sx q0[3];
-rz(-pi) q0[4];
-sx q0[4];
-rz(1.3390897) q0[4];
-sx q0[4];
-rz(-pi) q0[5];
-sx q0[5];
-rz(0.17178765) q0[5];
-sx q0[5];
-rz(-pi) q0[6];
-sx q0[6];
-rz(1.5650374) q0[6];
-sx q0[6];
-rz(-pi) q0[7];
-sx q0[7];
-rz(1.3075034) q0[7];
-sx q0[7];
-rz(-pi) q0[8];
-sx q0[8];
-rz(0.39966765) q0[8];
-sx q0[8];
-rz(-pi) q0[9];
-sx q0[9];
-rz(1.6309566) q0[9];
-sx q0[9];
-rz(-pi) q0[10];
-sx q0[10];
-rz(2.3780523) q0[10];
-sx q0[10];
-rz(-pi) q0[11];
-sx q0[11];
-rz(2.9867463) q0[11];
-sx q0[11];
-rz(-pi) q0[12];
-sx q0[12];
-rz(1.2104495) q0[12];
-sx q0[12];
-rz(-pi) q0[13];
-sx q0[13];
-rz(2.4510175) q0[13];
-sx q0[13];
-cx q0[13],q0[1];
-rz(pi/2) q0[13];
-sx q0[13];
-rz(pi/2) q0[13];
-cx q0[1],q0[13];
-rz(-pi/4) q0[13];
-cx q0[0],q0[13];
-rz(pi/4) q0[13];
-cx q0[1],q0[13];
-rz(pi/4) q0[1];
-rz(-pi/4) q0[13];
-cx q0[0],q0[13];
-cx q0[0],q0[1];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[1];
-cx q0[0],q0[1];
-rz(3*pi/4) q0[13];
-sx q0[13];
-rz(pi/2) q0[13];
-cx q0[13],q0[1];
-rz(-pi) q0[14];
-sx q0[14];
-rz(2.3986476) q0[14];
-sx q0[14];
-cx q0[14],q0[2];
-rz(pi/2) q0[14];
-sx q0[14];
-rz(pi/2) q0[14];
-cx q0[2],q0[14];
-rz(-pi/4) q0[14];
-cx q0[0],q0[14];
-rz(pi/4) q0[14];
-cx q0[2],q0[14];
-rz(-pi/4) q0[14];
-cx q0[0],q0[14];
-rz(3*pi/4) q0[14];
-sx q0[14];
-rz(pi/2) q0[14];
-rz(pi/4) q0[2];
-cx q0[0],q0[2];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[2];
-cx q0[0],q0[2];
-cx q0[14],q0[2];
-rz(-pi) q0[15];
-sx q0[15];
-rz(2.3482062) q0[15];
-sx q0[15];
-cx q0[15],q0[3];
-rz(pi/2) q0[15];
-sx q0[15];
-rz(pi/2) q0[15];
-cx q0[3],q0[15];
-rz(-pi/4) q0[15];
-cx q0[0],q0[15];
-rz(pi/4) q0[15];
-cx q0[3],q0[15];
-rz(-pi/4) q0[15];
-cx q0[0],q0[15];
-rz(3*pi/4) q0[15];
-sx q0[15];
-rz(pi/2) q0[15];
-rz(pi/4) q0[3];
-cx q0[0],q0[3];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[3];
-cx q0[0],q0[3];
-cx q0[15],q0[3];
-rz(-pi) q0[16];
-sx q0[16];
-rz(1.2340782) q0[16];
-sx q0[16];
-cx q0[16],q0[4];
-rz(pi/2) q0[16];
-sx q0[16];
-rz(pi/2) q0[16];
-cx q0[4],q0[16];
-rz(-pi/4) q0[16];
-cx q0[0],q0[16];
-rz(pi/4) q0[16];
-cx q0[4],q0[16];
-rz(-pi/4) q0[16];
-cx q0[0],q0[16];
-rz(3*pi/4) q0[16];
-sx q0[16];
-rz(pi/2) q0[16];
-rz(pi/4) q0[4];
-cx q0[0],q0[4];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[4];
-cx q0[0],q0[4];
-cx q0[16],q0[4];
-rz(-pi) q0[17];
-sx q0[17];
-rz(0.55634695) q0[17];
-sx q0[17];
-cx q0[17],q0[5];
-rz(pi/2) q0[17];
-sx q0[17];
-rz(pi/2) q0[17];
-cx q0[5],q0[17];
-rz(-pi/4) q0[17];
-cx q0[0],q0[17];
-rz(pi/4) q0[17];
-cx q0[5],q0[17];
-rz(-pi/4) q0[17];
-cx q0[0],q0[17];
-rz(3*pi/4) q0[17];
-sx q0[17];
-rz(pi/2) q0[17];
-rz(pi/4) q0[5];
-cx q0[0],q0[5];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[5];
-cx q0[0],q0[5];
-cx q0[17],q0[5];
-rz(-pi) q0[18];
-sx q0[18];
-rz(1.6027298) q0[18];
-sx q0[18];
-cx q0[18],q0[6];
-rz(pi/2) q0[18];
-sx q0[18];
-rz(pi/2) q0[18];
-cx q0[6],q0[18];
-rz(-pi/4) q0[18];
-cx q0[0],q0[18];
-rz(pi/4) q0[18];
-cx q0[6],q0[18];
-rz(-pi/4) q0[18];
-cx q0[0],q0[18];
-rz(3*pi/4) q0[18];
-sx q0[18];
-rz(pi/2) q0[18];
-rz(pi/4) q0[6];
-cx q0[0],q0[6];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[6];
-cx q0[0],q0[6];
-cx q0[18],q0[6];
-rz(-pi) q0[19];
-sx q0[19];
-rz(2.2931258) q0[19];
-sx q0[19];
-cx q0[19],q0[7];
-rz(pi/2) q0[19];
-sx q0[19];
-rz(pi/2) q0[19];
-cx q0[7],q0[19];
-rz(-pi/4) q0[19];
-cx q0[0],q0[19];
-rz(pi/4) q0[19];
-cx q0[7],q0[19];
-rz(-pi/4) q0[19];
-cx q0[0],q0[19];
-rz(3*pi/4) q0[19];
-sx q0[19];
-rz(pi/2) q0[19];
-rz(pi/4) q0[7];
-cx q0[0],q0[7];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[7];
-cx q0[0],q0[7];
-cx q0[19],q0[7];
-rz(-pi) q0[20];
-sx q0[20];
-rz(1.1626022) q0[20];
-sx q0[20];
-cx q0[20],q0[8];
-rz(pi/2) q0[20];
-sx q0[20];
-rz(pi/2) q0[20];
-cx q0[8],q0[20];
-rz(-pi/4) q0[20];
-cx q0[0],q0[20];
-rz(pi/4) q0[20];
-cx q0[8],q0[20];
-rz(-pi/4) q0[20];
-cx q0[0],q0[20];
-rz(3*pi/4) q0[20];
-sx q0[20];
-rz(pi/2) q0[20];
-rz(pi/4) q0[8];
-cx q0[0],q0[8];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[8];
-cx q0[0],q0[8];
-cx q0[20],q0[8];
-rz(-pi) q0[21];
-sx q0[21];
-rz(1.9641197) q0[21];
-sx q0[21];
-cx q0[21],q0[9];
-rz(pi/2) q0[21];
-sx q0[21];
-rz(pi/2) q0[21];
-cx q0[9],q0[21];
-rz(-pi/4) q0[21];
-cx q0[0],q0[21];
-rz(pi/4) q0[21];
-cx q0[9],q0[21];
-rz(-pi/4) q0[21];
-cx q0[0],q0[21];
-rz(3*pi/4) q0[21];
-sx q0[21];
-rz(pi/2) q0[21];
-rz(pi/4) q0[9];
-cx q0[0],q0[9];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[9];
-cx q0[0],q0[9];
-cx q0[21],q0[9];
-rz(-pi) q0[22];
-sx q0[22];
-rz(2.6804648) q0[22];
-sx q0[22];
-cx q0[22],q0[10];
-rz(pi/2) q0[22];
-sx q0[22];
-rz(pi/2) q0[22];
-cx q0[10],q0[22];
-rz(-pi/4) q0[22];
-cx q0[0],q0[22];
-rz(pi/4) q0[22];
-cx q0[10],q0[22];
-rz(pi/4) q0[10];
-rz(-pi/4) q0[22];
-cx q0[0],q0[22];
-cx q0[0],q0[10];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[10];
-cx q0[0],q0[10];
-rz(3*pi/4) q0[22];
-sx q0[22];
-rz(pi/2) q0[22];
-cx q0[22],q0[10];
-rz(-pi) q0[23];
-sx q0[23];
-rz(2.970942) q0[23];
-sx q0[23];
-cx q0[23],q0[11];
-rz(pi/2) q0[23];
-sx q0[23];
-rz(pi/2) q0[23];
-cx q0[11],q0[23];
-rz(-pi/4) q0[23];
-cx q0[0],q0[23];
-rz(pi/4) q0[23];
-cx q0[11],q0[23];
-rz(pi/4) q0[11];
-rz(-pi/4) q0[23];
-cx q0[0],q0[23];
-cx q0[0],q0[11];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[11];
-cx q0[0],q0[11];
-rz(3*pi/4) q0[23];
-sx q0[23];
-rz(pi/2) q0[23];
-cx q0[23],q0[11];
-rz(-pi) q0[24];
-sx q0[24];
-rz(1.3153054) q0[24];
-sx q0[24];
-cx q0[24],q0[12];
-rz(pi/2) q0[24];
-sx q0[24];
-rz(pi/2) q0[24];
-cx q0[12],q0[24];
-rz(-pi/4) q0[24];
-cx q0[0],q0[24];
-rz(pi/4) q0[24];
-cx q0[12],q0[24];
-rz(pi/4) q0[12];
-rz(-pi/4) q0[24];
-cx q0[0],q0[24];
-cx q0[0],q0[12];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[12];
-cx q0[0],q0[12];
-rz(pi/2) q0[0];
-sx q0[0];
-rz(pi/2) q0[0];
-rz(3*pi/4) q0[24];
-sx q0[24];
-rz(pi/2) q0[24];
-cx q0[24],q0[12];
-measure q0[0] -> c0[0];
@@ -1,127 +0,0 @@
-OPENQASM 2.0;
-include "qelib1.inc";
-qreg q[13];
-creg c[4];
-x q[0];
-x q[1];
-x q[2];
-x q[4];
-barrier q[0],q[1],q[2],q[3],q[4],q[5],q[6],q[7],q[8],q[9],q[10],q[11],q[12];
-rz(pi/2) q[10];
-sx q[10];
-rz(pi/2) q[10];
-rz(pi/2) q[5];
-sx q[5];
-rz(pi/2) q[5];
-cx q[0],q[5];
-rz(-pi/4) q[5];
-cx q[2],q[5];
-rz(pi/4) q[5];
-cx q[0],q[5];
-rz(pi/4) q[0];
-rz(-pi/4) q[5];
-cx q[2],q[5];
-cx q[2],q[0];
-rz(-pi/4) q[0];
-rz(pi/4) q[2];
-cx q[2],q[0];
-rz(3*pi/4) q[5];
-sx q[5];
-rz(pi/2) q[5];
-rz(pi/2) q[6];
-sx q[6];
-rz(pi/2) q[6];
-cx q[1],q[6];
-rz(-pi/4) q[6];
-cx q[2],q[6];
-rz(pi/4) q[6];
-cx q[1],q[6];
-rz(pi/4) q[1];
-rz(-pi/4) q[6];
-cx q[2],q[6];
-cx q[2],q[1];
-rz(-pi/4) q[1];
-rz(pi/4) q[2];
-cx q[2],q[1];
-rz(3*pi/4) q[6];
-sx q[6];
-rz(pi/2) q[6];
-rz(pi/2) q[7];
-sx q[7];
-rz(pi/2) q[7];
-cx q[0],q[7];
-rz(-pi/4) q[7];
-cx q[3],q[7];
-rz(pi/4) q[7];
-cx q[0],q[7];
-rz(pi/4) q[0];
-rz(-pi/4) q[7];
-cx q[3],q[7];
-cx q[3],q[0];
-rz(-pi/4) q[0];
-rz(pi/4) q[3];
-cx q[3],q[0];
-rz(3*pi/4) q[7];
-sx q[7];
-rz(pi/2) q[7];
-rz(pi/2) q[8];
-sx q[8];
-rz(pi/2) q[8];
-cx q[1],q[8];
-rz(-pi/4) q[8];
-cx q[3],q[8];
-rz(pi/4) q[8];
-cx q[1],q[8];
-rz(pi/4) q[1];
-rz(-pi/4) q[8];
-cx q[3],q[8];
-cx q[3],q[1];
-rz(-pi/4) q[1];
-rz(pi/4) q[3];
-cx q[3],q[1];
-cx q[1],q[10];
-rz(-pi/4) q[10];
-rz(3*pi/4) q[8];
-sx q[8];
-rz(pi/2) q[8];
-rz(pi/2) q[9];
-sx q[9];
-rz(pi/2) q[9];
-cx q[0],q[9];
-rz(-pi/4) q[9];
-cx q[4],q[9];
-rz(pi/4) q[9];
-cx q[0],q[9];
-rz(pi/4) q[0];
-rz(-pi/4) q[9];
-cx q[4],q[9];
-cx q[4],q[0];
-rz(-pi/4) q[0];
-rz(pi/4) q[4];
-cx q[4],q[0];
-cx q[4],q[10];
-rz(pi/4) q[10];
-cx q[1],q[10];
-rz(pi/4) q[1];
-rz(-pi/4) q[10];
-cx q[4],q[10];
-rz(3*pi/4) q[10];
-sx q[10];
-rz(pi/2) q[10];
-cx q[4],q[1];
-rz(-pi/4) q[1];
-rz(pi/4) q[4];
-cx q[4],q[1];
-rz(3*pi/4) q[9];
-sx q[9];
-rz(pi/2) q[9];
-barrier q[0],q[1],q[2],q[3],q[4],q[5],q[6],q[7],q[8],q[9],q[10],q[11],q[12];
-cx q[6],q[11];
-cx q[7],q[11];
-cx q[8],q[12];
-cx q[9],q[12];
-barrier q[0],q[1],q[2],q[3],q[4],q[5],q[6],q[7],q[8],q[9],q[10],q[11],q[12];
-measure q[5] -> c[0];
-measure q[11] -> c[1];
-measure q[12] -> c[2];
-measure q[10] -> c[3];
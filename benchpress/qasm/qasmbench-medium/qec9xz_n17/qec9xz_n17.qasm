@@ -1,66 +0,0 @@
-OPENQASM 2.0;
-include "qelib1.inc";
-qreg q0[9];
-qreg q1[8];
-creg c0[8];
-h q0[0];
-cx q0[0],q0[3];
-cx q0[0],q0[6];
-h q0[0];
-h q0[3];
-h q0[6];
-cx q0[0],q0[1];
-cx q0[0],q0[2];
-cx q0[3],q0[4];
-cx q0[3],q0[5];
-cx q0[6],q0[7];
-cx q0[6],q0[8];
-cx q0[0],q1[0];
-cx q0[1],q1[0];
-cx q0[1],q1[1];
-cx q0[2],q1[1];
-cx q0[3],q1[2];
-cx q0[4],q1[2];
-cx q0[4],q1[3];
-cx q0[5],q1[3];
-cx q0[6],q1[4];
-cx q0[7],q1[4];
-cx q0[7],q1[5];
-cx q0[8],q1[5];
-measure q1[0] -> c0[0];
-measure q1[1] -> c0[1];
-measure q1[2] -> c0[2];
-measure q1[3] -> c0[3];
-measure q1[4] -> c0[4];
-measure q1[5] -> c0[5];
-h q0[0];
-h q0[1];
-h q0[2];
-h q0[3];
-h q0[4];
-h q0[5];
-h q0[6];
-h q0[7];
-h q0[8];
-cx q0[0],q1[6];
-cx q0[3],q1[7];
-cx q0[1],q1[6];
-cx q0[4],q1[7];
-cx q0[2],q1[6];
-cx q0[5],q1[7];
-cx q0[3],q1[6];
-cx q0[6],q1[7];
-cx q0[4],q1[6];
-cx q0[7],q1[7];
-cx q0[5],q1[6];
-cx q0[8],q1[7];
-measure q1[6] -> c0[6];
-measure q1[7] -> c0[7];
-h q0[0];
-h q0[1];
-h q0[2];
-h q0[3];
-h q0[4];
-h q0[5];
-h q0[6];
-h q0[7];
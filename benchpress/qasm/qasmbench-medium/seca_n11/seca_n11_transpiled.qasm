@@ -1,296 +0,0 @@
-OPENQASM 2.0;
-include "qelib1.inc";
-qreg q[11];
-creg c[11];
-rz(-pi/2) q[0];
-sx q[0];
-rz(pi/2) q[0];
-barrier q[0],q[1],q[2],q[3],q[4],q[5],q[6],q[7],q[8],q[9],q[10];
-cx q[0],q[3];
-cx q[0],q[6];
-rz(pi/2) q[3];
-sx q[3];
-rz(pi/2) q[3];
-cx q[0],q[3];
-rz(-pi) q[3];
-cx q[3],q[4];
-cx q[3],q[5];
-rz(pi/2) q[4];
-sx q[4];
-rz(pi/2) q[4];
-cx q[3],q[4];
-rz(pi/2) q[4];
-sx q[4];
-rz(pi/2) q[4];
-rz(pi/2) q[5];
-sx q[5];
-rz(pi/2) q[5];
-cx q[3],q[5];
-rz(pi/2) q[5];
-sx q[5];
-rz(pi/2) q[5];
-rz(pi/2) q[6];
-sx q[6];
-rz(pi/2) q[6];
-cx q[0],q[6];
-rz(pi/2) q[0];
-sx q[0];
-rz(-pi/2) q[0];
-cx q[0],q[1];
-cx q[0],q[2];
-rz(pi/2) q[1];
-sx q[1];
-rz(pi/2) q[1];
-cx q[0],q[1];
-rz(pi/2) q[1];
-sx q[1];
-rz(pi/2) q[1];
-rz(pi/2) q[2];
-sx q[2];
-rz(pi/2) q[2];
-cx q[0],q[2];
-rz(pi/2) q[2];
-sx q[2];
-rz(pi/2) q[2];
-rz(-pi) q[6];
-cx q[6],q[7];
-cx q[6],q[8];
-rz(pi/2) q[7];
-sx q[7];
-rz(pi/2) q[7];
-cx q[6],q[7];
-rz(pi/2) q[7];
-sx q[7];
-rz(pi/2) q[7];
-rz(pi/2) q[8];
-sx q[8];
-rz(pi/2) q[8];
-cx q[6],q[8];
-rz(pi/2) q[8];
-sx q[8];
-rz(pi/2) q[8];
-barrier q[0],q[1],q[2],q[3],q[4],q[5],q[6],q[7],q[8],q[9],q[10];
-rz(pi/2) q[9];
-sx q[9];
-rz(pi/2) q[9];
-cx q[9],q[10];
-barrier q[0],q[1],q[2],q[3],q[4],q[5],q[6],q[7],q[8],q[9],q[10];
-cx q[0],q[9];
-rz(pi/2) q[0];
-sx q[0];
-rz(pi/2) q[0];
-measure q[0] -> c[0];
-measure q[9] -> c[9];
-cx q[9],q[10];
-rz(pi/2) q[10];
-sx q[10];
-rz(pi/2) q[10];
-cx q[0],q[10];
-rz(pi/2) q[10];
-sx q[10];
-rz(pi/2) q[10];
-barrier q[0],q[1],q[2],q[3],q[4],q[5],q[6],q[7],q[8],q[9],q[10];
-cx q[10],q[1];
-rz(pi/2) q[1];
-sx q[1];
-rz(pi/2) q[1];
-cx q[10],q[2];
-cx q[10],q[1];
-rz(pi/2) q[1];
-sx q[1];
-rz(pi/2) q[1];
-rz(pi/2) q[2];
-sx q[2];
-rz(pi/2) q[2];
-cx q[10],q[2];
-rz(pi/2) q[10];
-sx q[10];
-rz(pi/2) q[10];
-rz(pi/2) q[2];
-sx q[2];
-rz(pi/2) q[2];
-cx q[2],q[10];
-rz(-pi/4) q[10];
-cx q[1],q[10];
-rz(pi/4) q[10];
-cx q[2],q[10];
-rz(-pi/4) q[10];
-cx q[1],q[10];
-rz(3*pi/4) q[10];
-sx q[10];
-rz(pi/2) q[10];
-rz(pi/4) q[2];
-cx q[1],q[2];
-rz(pi/4) q[1];
-rz(-pi/4) q[2];
-cx q[1],q[2];
-cx q[3],q[4];
-cx q[3],q[5];
-rz(pi/2) q[4];
-sx q[4];
-rz(pi/2) q[4];
-cx q[3],q[4];
-rz(pi/2) q[4];
-sx q[4];
-rz(pi/2) q[4];
-rz(pi/2) q[5];
-sx q[5];
-rz(pi/2) q[5];
-cx q[3],q[5];
-rz(pi/2) q[3];
-sx q[3];
-rz(pi/2) q[3];
-cx q[4],q[3];
-rz(-pi/4) q[3];
-rz(pi/2) q[5];
-sx q[5];
-rz(pi/2) q[5];
-cx q[5],q[3];
-rz(pi/4) q[3];
-cx q[4],q[3];
-rz(-pi/4) q[3];
-rz(pi/4) q[4];
-cx q[5],q[3];
-rz(3*pi/4) q[3];
-sx q[3];
-rz(pi/2) q[3];
-cx q[5],q[4];
-rz(-pi/4) q[4];
-rz(pi/4) q[5];
-cx q[5],q[4];
-cx q[6],q[7];
-cx q[6],q[8];
-rz(pi/2) q[7];
-sx q[7];
-rz(pi/2) q[7];
-cx q[6],q[7];
-rz(pi/2) q[7];
-sx q[7];
-rz(pi/2) q[7];
-rz(pi/2) q[8];
-sx q[8];
-rz(pi/2) q[8];
-cx q[6],q[8];
-rz(pi/2) q[6];
-sx q[6];
-rz(pi/2) q[6];
-cx q[7],q[6];
-rz(-pi/4) q[6];
-rz(pi/2) q[8];
-sx q[8];
-rz(pi/2) q[8];
-cx q[8],q[6];
-rz(pi/4) q[6];
-cx q[7],q[6];
-rz(-pi/4) q[6];
-rz(pi/4) q[7];
-cx q[8],q[6];
-rz(3*pi/4) q[6];
-sx q[6];
-rz(pi/2) q[6];
-cx q[8],q[7];
-rz(-pi/4) q[7];
-rz(pi/4) q[8];
-cx q[8],q[7];
-barrier q[0],q[1],q[2],q[3],q[4],q[5],q[6],q[7],q[8],q[9],q[10];
-cx q[2],q[10];
-rz(-pi/4) q[10];
-cx q[1],q[10];
-rz(pi/4) q[10];
-cx q[2],q[10];
-rz(-pi/4) q[10];
-cx q[1],q[10];
-rz(pi/4) q[10];
-rz(pi/4) q[2];
-cx q[1],q[2];
-rz(pi/4) q[1];
-rz(-pi/4) q[2];
-cx q[1],q[2];
-cx q[4],q[3];
-rz(-pi/4) q[3];
-cx q[5],q[3];
-rz(pi/4) q[3];
-cx q[4],q[3];
-rz(-pi/4) q[3];
-rz(pi/4) q[4];
-cx q[5],q[3];
-rz(pi/4) q[3];
-cx q[5],q[4];
-rz(-pi/4) q[4];
-rz(pi/4) q[5];
-cx q[5],q[4];
-cx q[7],q[6];
-rz(-pi/4) q[6];
-cx q[8],q[6];
-rz(pi/4) q[6];
-cx q[7],q[6];
-rz(-pi/4) q[6];
-rz(pi/4) q[7];
-cx q[8],q[6];
-rz(pi/4) q[6];
-cx q[8],q[7];
-rz(-pi/4) q[7];
-rz(pi/4) q[8];
-cx q[8],q[7];
-barrier q[0],q[1],q[2],q[3],q[4],q[5],q[6],q[7],q[8],q[9],q[10];
-rz(pi/2) q[10];
-sx q[10];
-rz(-pi/2) q[10];
-rz(pi/2) q[3];
-sx q[3];
-rz(-pi/2) q[3];
-cx q[10],q[3];
-rz(pi/2) q[3];
-sx q[3];
-rz(pi/2) q[3];
-rz(pi/2) q[6];
-sx q[6];
-rz(-pi/2) q[6];
-cx q[10],q[6];
-cx q[10],q[3];
-rz(pi/2) q[3];
-sx q[3];
-rz(pi/2) q[3];
-rz(pi/2) q[6];
-sx q[6];
-rz(pi/2) q[6];
-cx q[10],q[6];
-rz(pi/2) q[10];
-sx q[10];
-rz(pi/2) q[10];
-rz(pi/2) q[6];
-sx q[6];
-rz(pi/2) q[6];
-cx q[6],q[10];
-rz(-pi/4) q[10];
-cx q[3],q[10];
-rz(pi/4) q[10];
-cx q[6],q[10];
-rz(-pi/4) q[10];
-cx q[3],q[10];
-rz(3*pi/4) q[10];
-sx q[10];
-rz(pi/2) q[10];
-rz(pi/4) q[6];
-cx q[3],q[6];
-rz(pi/4) q[3];
-rz(-pi/4) q[6];
-cx q[3],q[6];
-cx q[6],q[10];
-rz(-pi/4) q[10];
-cx q[3],q[10];
-rz(pi/4) q[10];
-cx q[6],q[10];
-rz(-pi/4) q[10];
-cx q[3],q[10];
-rz(pi/4) q[10];
-rz(pi/4) q[6];
-cx q[3],q[6];
-rz(pi/4) q[3];
-rz(-pi/4) q[6];
-cx q[3],q[6];
-barrier q[0],q[1],q[2],q[3],q[4],q[5],q[6],q[7],q[8],q[9],q[10];
-rz(pi/2) q[10];
-sx q[10];
-rz(-pi/2) q[10];
-measure q[10] -> c[10];
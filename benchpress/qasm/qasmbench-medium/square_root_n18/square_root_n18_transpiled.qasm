@@ -1,2791 +0,0 @@
-OPENQASM 2.0;
-include "qelib1.inc";
-qreg q[18];
-creg c[13];
-rz(pi/2) q[0];
-sx q[0];
-rz(pi/2) q[0];
-rz(pi/2) q[1];
-sx q[1];
-rz(pi/2) q[1];
-rz(pi/2) q[2];
-sx q[2];
-rz(pi/2) q[2];
-rz(pi/2) q[3];
-sx q[3];
-rz(pi/2) q[3];
-rz(pi/2) q[4];
-sx q[4];
-rz(pi/2) q[4];
-rz(pi/2) q[5];
-sx q[5];
-rz(pi/2) q[5];
-cx q[0],q[6];
-cx q[3],q[6];
-x q[6];
-cx q[3],q[7];
-cx q[1],q[8];
-cx q[4],q[8];
-x q[8];
-cx q[4],q[9];
-x q[9];
-cx q[2],q[10];
-cx q[5],q[10];
-x q[10];
-cx q[5],q[11];
-x q[11];
-rz(pi/2) q[13];
-sx q[13];
-rz(pi/2) q[13];
-cx q[6],q[13];
-rz(-pi/4) q[13];
-cx q[7],q[13];
-rz(pi/4) q[13];
-cx q[6],q[13];
-rz(-pi/4) q[13];
-rz(pi/4) q[6];
-cx q[7],q[13];
-rz(3*pi/4) q[13];
-sx q[13];
-rz(pi/2) q[13];
-cx q[7],q[6];
-rz(-pi/4) q[6];
-rz(pi/4) q[7];
-cx q[7],q[6];
-rz(pi/2) q[14];
-sx q[14];
-rz(pi/2) q[14];
-cx q[8],q[14];
-rz(-pi/4) q[14];
-cx q[13],q[14];
-rz(pi/4) q[14];
-cx q[8],q[14];
-rz(-pi/4) q[14];
-cx q[13],q[14];
-rz(3*pi/4) q[14];
-sx q[14];
-rz(pi/2) q[14];
-rz(pi/4) q[8];
-cx q[13],q[8];
-rz(pi/4) q[13];
-rz(-pi/4) q[8];
-cx q[13],q[8];
-rz(pi/2) q[15];
-sx q[15];
-rz(pi/2) q[15];
-cx q[9],q[15];
-rz(-pi/4) q[15];
-cx q[14],q[15];
-rz(pi/4) q[15];
-cx q[9],q[15];
-rz(-pi/4) q[15];
-cx q[14],q[15];
-rz(3*pi/4) q[15];
-sx q[15];
-rz(pi/2) q[15];
-rz(pi/4) q[9];
-cx q[14],q[9];
-rz(pi/4) q[14];
-rz(-pi/4) q[9];
-cx q[14],q[9];
-rz(pi/2) q[16];
-sx q[16];
-rz(pi/2) q[16];
-cx q[10],q[16];
-rz(-pi/4) q[16];
-cx q[15],q[16];
-rz(pi/4) q[16];
-cx q[10],q[16];
-rz(pi/4) q[10];
-rz(-pi/4) q[16];
-cx q[15],q[16];
-cx q[15],q[10];
-rz(-pi/4) q[10];
-rz(pi/4) q[15];
-cx q[15],q[10];
-rz(3*pi/4) q[16];
-sx q[16];
-rz(pi/2) q[16];
-rz(pi/2) q[17];
-sx q[17];
-rz(pi/2) q[17];
-cx q[11],q[17];
-rz(-pi/4) q[17];
-cx q[16],q[17];
-rz(pi/4) q[17];
-cx q[11],q[17];
-rz(pi/4) q[11];
-rz(-pi/4) q[17];
-cx q[16],q[17];
-cx q[16],q[11];
-rz(-pi/4) q[11];
-rz(pi/4) q[16];
-cx q[16],q[11];
-x q[17];
-rz(-pi/4) q[17];
-cx q[11],q[17];
-rz(-pi/4) q[17];
-cx q[16],q[17];
-rz(pi/4) q[17];
-cx q[11],q[17];
-rz(pi/4) q[11];
-rz(-pi/4) q[17];
-cx q[16],q[17];
-cx q[16],q[11];
-rz(-pi/4) q[11];
-rz(pi/4) q[16];
-cx q[16],q[11];
-x q[11];
-rz(pi/2) q[16];
-sx q[16];
-rz(pi/2) q[16];
-cx q[10],q[16];
-rz(-pi/4) q[16];
-cx q[15],q[16];
-rz(pi/4) q[16];
-cx q[10],q[16];
-rz(pi/4) q[10];
-rz(-pi/4) q[16];
-cx q[15],q[16];
-cx q[15],q[10];
-rz(-pi/4) q[10];
-rz(pi/4) q[15];
-cx q[15],q[10];
-x q[10];
-rz(pi/2) q[15];
-sx q[15];
-rz(pi/2) q[15];
-rz(3*pi/4) q[16];
-sx q[16];
-rz(pi/2) q[16];
-reset q[16];
-rz(pi/2) q[16];
-sx q[16];
-rz(pi/2) q[16];
-rz(3*pi/4) q[17];
-sx q[17];
-rz(pi/2) q[17];
-reset q[17];
-rz(pi/2) q[17];
-sx q[17];
-rz(pi/2) q[17];
-cx q[2],q[10];
-rz(-pi/2) q[2];
-sx q[2];
-rz(pi/2) q[2];
-cx q[5],q[10];
-cx q[5],q[11];
-rz(-pi/2) q[5];
-sx q[5];
-rz(pi/2) q[5];
-cx q[5],q[17];
-rz(-pi/4) q[17];
-cx q[9],q[15];
-rz(-pi/4) q[15];
-cx q[14],q[15];
-rz(pi/4) q[15];
-cx q[9],q[15];
-rz(-pi/4) q[15];
-cx q[14],q[15];
-rz(3*pi/4) q[15];
-sx q[15];
-rz(pi/2) q[15];
-reset q[15];
-rz(pi/2) q[15];
-sx q[15];
-rz(pi/2) q[15];
-rz(pi/4) q[9];
-cx q[14],q[9];
-rz(pi/4) q[14];
-rz(-pi/4) q[9];
-cx q[14],q[9];
-rz(pi/2) q[14];
-sx q[14];
-rz(pi/2) q[14];
-cx q[8],q[14];
-rz(-pi/4) q[14];
-cx q[13],q[14];
-rz(pi/4) q[14];
-cx q[8],q[14];
-rz(-pi/4) q[14];
-cx q[13],q[14];
-rz(3*pi/4) q[14];
-sx q[14];
-rz(pi/2) q[14];
-reset q[14];
-rz(pi/2) q[14];
-sx q[14];
-rz(pi/2) q[14];
-cx q[2],q[14];
-rz(-pi/4) q[14];
-rz(pi/4) q[8];
-cx q[13],q[8];
-rz(pi/4) q[13];
-rz(-pi/4) q[8];
-cx q[13],q[8];
-rz(pi/2) q[13];
-sx q[13];
-rz(pi/2) q[13];
-cx q[6],q[13];
-rz(-pi/4) q[13];
-cx q[7],q[13];
-rz(pi/4) q[13];
-cx q[6],q[13];
-rz(-pi/4) q[13];
-rz(pi/4) q[6];
-cx q[7],q[13];
-rz(3*pi/4) q[13];
-sx q[13];
-rz(pi/2) q[13];
-reset q[13];
-rz(pi/2) q[13];
-sx q[13];
-rz(pi/2) q[13];
-cx q[7],q[6];
-rz(-pi/4) q[6];
-rz(pi/4) q[7];
-cx q[7],q[6];
-x q[6];
-cx q[0],q[6];
-rz(-pi/2) q[0];
-sx q[0];
-rz(pi/2) q[0];
-cx q[0],q[13];
-rz(-pi/4) q[13];
-cx q[3],q[6];
-cx q[3],q[7];
-rz(-pi/2) q[3];
-sx q[3];
-rz(pi/2) q[3];
-cx q[3],q[15];
-rz(-pi/4) q[15];
-x q[8];
-cx q[1],q[8];
-rz(-pi/2) q[1];
-sx q[1];
-rz(pi/2) q[1];
-cx q[1],q[13];
-rz(pi/4) q[13];
-cx q[0],q[13];
-rz(pi/4) q[0];
-rz(-pi/4) q[13];
-cx q[1],q[13];
-cx q[1],q[0];
-rz(-pi/4) q[0];
-rz(pi/4) q[1];
-cx q[1],q[0];
-rz(3*pi/4) q[13];
-sx q[13];
-rz(pi/2) q[13];
-cx q[13],q[14];
-rz(pi/4) q[14];
-cx q[2],q[14];
-rz(-pi/4) q[14];
-cx q[13],q[14];
-rz(3*pi/4) q[14];
-sx q[14];
-rz(pi/2) q[14];
-cx q[14],q[15];
-rz(pi/4) q[15];
-rz(pi/4) q[2];
-cx q[13],q[2];
-rz(pi/4) q[13];
-rz(-pi/4) q[2];
-cx q[13],q[2];
-cx q[3],q[15];
-rz(-pi/4) q[15];
-cx q[14],q[15];
-rz(3*pi/4) q[15];
-sx q[15];
-rz(pi/2) q[15];
-rz(pi/4) q[3];
-cx q[14],q[3];
-rz(pi/4) q[14];
-rz(-pi/4) q[3];
-cx q[14],q[3];
-cx q[4],q[8];
-x q[9];
-cx q[4],q[9];
-rz(-pi/2) q[4];
-sx q[4];
-rz(pi/2) q[4];
-cx q[4],q[16];
-rz(-pi/4) q[16];
-cx q[15],q[16];
-rz(pi/4) q[16];
-cx q[4],q[16];
-rz(-pi/4) q[16];
-cx q[15],q[16];
-rz(3*pi/4) q[16];
-sx q[16];
-rz(pi/2) q[16];
-cx q[16],q[17];
-rz(pi/4) q[17];
-rz(pi/4) q[4];
-cx q[15],q[4];
-rz(pi/4) q[15];
-rz(-pi/4) q[4];
-cx q[15],q[4];
-cx q[5],q[17];
-rz(-pi/4) q[17];
-cx q[16],q[17];
-x q[17];
-rz(-pi/4) q[17];
-rz(pi/4) q[5];
-cx q[16],q[5];
-rz(pi/4) q[16];
-rz(-pi/4) q[5];
-cx q[16],q[5];
-cx q[5],q[17];
-rz(-pi/4) q[17];
-cx q[16],q[17];
-rz(pi/4) q[17];
-cx q[5],q[17];
-rz(-pi/4) q[17];
-cx q[16],q[17];
-rz(3*pi/4) q[17];
-sx q[17];
-rz(pi/2) q[17];
-reset q[17];
-rz(pi/2) q[17];
-sx q[17];
-rz(pi/2) q[17];
-rz(pi/4) q[5];
-cx q[16],q[5];
-rz(pi/4) q[16];
-rz(-pi/4) q[5];
-cx q[16],q[5];
-rz(pi/2) q[16];
-sx q[16];
-rz(pi/2) q[16];
-cx q[4],q[16];
-rz(-pi/4) q[16];
-cx q[15],q[16];
-rz(pi/4) q[16];
-cx q[4],q[16];
-rz(-pi/4) q[16];
-cx q[15],q[16];
-rz(3*pi/4) q[16];
-sx q[16];
-rz(pi/2) q[16];
-reset q[16];
-rz(pi/2) q[16];
-sx q[16];
-rz(pi/2) q[16];
-rz(pi/4) q[4];
-cx q[15],q[4];
-rz(pi/4) q[15];
-rz(-pi/4) q[4];
-cx q[15],q[4];
-rz(pi/2) q[15];
-sx q[15];
-rz(pi/2) q[15];
-cx q[3],q[15];
-rz(-pi/4) q[15];
-cx q[14],q[15];
-rz(pi/4) q[15];
-cx q[3],q[15];
-rz(-pi/4) q[15];
-cx q[14],q[15];
-rz(3*pi/4) q[15];
-sx q[15];
-rz(pi/2) q[15];
-reset q[15];
-rz(pi/2) q[15];
-sx q[15];
-rz(pi/2) q[15];
-rz(pi/4) q[3];
-cx q[14],q[3];
-rz(pi/4) q[14];
-rz(-pi/4) q[3];
-cx q[14],q[3];
-rz(pi/2) q[14];
-sx q[14];
-rz(pi/2) q[14];
-cx q[2],q[14];
-rz(-pi/4) q[14];
-cx q[13],q[14];
-rz(pi/4) q[14];
-cx q[2],q[14];
-rz(-pi/4) q[14];
-cx q[13],q[14];
-rz(3*pi/4) q[14];
-sx q[14];
-rz(pi/2) q[14];
-reset q[14];
-rz(pi/2) q[14];
-sx q[14];
-rz(pi/2) q[14];
-rz(pi/4) q[2];
-cx q[13],q[2];
-rz(pi/4) q[13];
-rz(-pi/4) q[2];
-cx q[13],q[2];
-rz(pi/2) q[13];
-sx q[13];
-rz(pi/2) q[13];
-cx q[0],q[13];
-rz(-pi/4) q[13];
-cx q[1],q[13];
-rz(pi/4) q[13];
-cx q[0],q[13];
-rz(pi/4) q[0];
-rz(-pi/4) q[13];
-cx q[1],q[13];
-cx q[1],q[0];
-rz(-pi/4) q[0];
-rz(pi/4) q[1];
-cx q[1],q[0];
-rz(pi/2) q[0];
-sx q[0];
-rz(-pi/2) q[0];
-cx q[0],q[6];
-rz(pi/2) q[1];
-sx q[1];
-rz(-pi/2) q[1];
-cx q[1],q[8];
-rz(3*pi/4) q[13];
-sx q[13];
-rz(pi/2) q[13];
-reset q[13];
-rz(pi/2) q[13];
-sx q[13];
-rz(pi/2) q[13];
-rz(pi/2) q[2];
-sx q[2];
-rz(-pi/2) q[2];
-cx q[2],q[10];
-rz(pi/2) q[3];
-sx q[3];
-rz(-pi/2) q[3];
-cx q[3],q[6];
-cx q[3],q[7];
-rz(pi/2) q[4];
-sx q[4];
-rz(-pi/2) q[4];
-cx q[4],q[8];
-cx q[4],q[9];
-rz(pi/2) q[5];
-sx q[5];
-rz(-pi/2) q[5];
-cx q[5],q[10];
-x q[10];
-cx q[10],q[16];
-rz(-pi/4) q[16];
-cx q[5],q[11];
-x q[11];
-cx q[11],q[17];
-rz(-pi/4) q[17];
-x q[6];
-cx q[6],q[13];
-rz(-pi/4) q[13];
-cx q[7],q[13];
-rz(pi/4) q[13];
-cx q[6],q[13];
-rz(-pi/4) q[13];
-rz(pi/4) q[6];
-cx q[7],q[13];
-rz(3*pi/4) q[13];
-sx q[13];
-rz(pi/2) q[13];
-cx q[7],q[6];
-rz(-pi/4) q[6];
-rz(pi/4) q[7];
-cx q[7],q[6];
-x q[8];
-cx q[8],q[14];
-rz(-pi/4) q[14];
-cx q[13],q[14];
-rz(pi/4) q[14];
-cx q[8],q[14];
-rz(-pi/4) q[14];
-cx q[13],q[14];
-rz(3*pi/4) q[14];
-sx q[14];
-rz(pi/2) q[14];
-rz(pi/4) q[8];
-cx q[13],q[8];
-rz(pi/4) q[13];
-rz(-pi/4) q[8];
-cx q[13],q[8];
-x q[9];
-cx q[9],q[15];
-rz(-pi/4) q[15];
-cx q[14],q[15];
-rz(pi/4) q[15];
-cx q[9],q[15];
-rz(-pi/4) q[15];
-cx q[14],q[15];
-rz(3*pi/4) q[15];
-sx q[15];
-rz(pi/2) q[15];
-cx q[15],q[16];
-rz(pi/4) q[16];
-cx q[10],q[16];
-rz(pi/4) q[10];
-rz(-pi/4) q[16];
-cx q[15],q[16];
-cx q[15],q[10];
-rz(-pi/4) q[10];
-rz(pi/4) q[15];
-cx q[15],q[10];
-rz(3*pi/4) q[16];
-sx q[16];
-rz(pi/2) q[16];
-cx q[16],q[17];
-rz(pi/4) q[17];
-cx q[11],q[17];
-rz(pi/4) q[11];
-rz(-pi/4) q[17];
-cx q[16],q[17];
-cx q[16],q[11];
-rz(-pi/4) q[11];
-rz(pi/4) q[16];
-cx q[16],q[11];
-x q[17];
-rz(-pi/4) q[17];
-cx q[11],q[17];
-rz(-pi/4) q[17];
-cx q[16],q[17];
-rz(pi/4) q[17];
-cx q[11],q[17];
-rz(pi/4) q[11];
-rz(-pi/4) q[17];
-cx q[16],q[17];
-cx q[16],q[11];
-rz(-pi/4) q[11];
-rz(pi/4) q[16];
-cx q[16],q[11];
-x q[11];
-rz(pi/2) q[16];
-sx q[16];
-rz(pi/2) q[16];
-cx q[10],q[16];
-rz(-pi/4) q[16];
-cx q[15],q[16];
-rz(pi/4) q[16];
-cx q[10],q[16];
-rz(pi/4) q[10];
-rz(-pi/4) q[16];
-cx q[15],q[16];
-cx q[15],q[10];
-rz(-pi/4) q[10];
-rz(pi/4) q[15];
-cx q[15],q[10];
-x q[10];
-rz(pi/2) q[15];
-sx q[15];
-rz(pi/2) q[15];
-rz(3*pi/4) q[16];
-sx q[16];
-rz(pi/2) q[16];
-reset q[16];
-rz(pi/2) q[16];
-sx q[16];
-rz(pi/2) q[16];
-rz(3*pi/4) q[17];
-sx q[17];
-rz(pi/2) q[17];
-reset q[17];
-rz(pi/2) q[17];
-sx q[17];
-rz(pi/2) q[17];
-cx q[2],q[10];
-rz(-pi/2) q[2];
-sx q[2];
-rz(pi/2) q[2];
-cx q[5],q[10];
-cx q[5],q[11];
-rz(-pi/2) q[5];
-sx q[5];
-rz(pi/2) q[5];
-cx q[5],q[17];
-rz(-pi/4) q[17];
-rz(pi/4) q[9];
-cx q[14],q[9];
-rz(pi/4) q[14];
-rz(-pi/4) q[9];
-cx q[14],q[9];
-cx q[9],q[15];
-rz(-pi/4) q[15];
-cx q[14],q[15];
-rz(pi/4) q[15];
-cx q[9],q[15];
-rz(-pi/4) q[15];
-cx q[14],q[15];
-rz(3*pi/4) q[15];
-sx q[15];
-rz(pi/2) q[15];
-reset q[15];
-rz(pi/2) q[15];
-sx q[15];
-rz(pi/2) q[15];
-rz(pi/4) q[9];
-cx q[14],q[9];
-rz(pi/4) q[14];
-rz(-pi/4) q[9];
-cx q[14],q[9];
-rz(pi/2) q[14];
-sx q[14];
-rz(pi/2) q[14];
-cx q[8],q[14];
-rz(-pi/4) q[14];
-cx q[13],q[14];
-rz(pi/4) q[14];
-cx q[8],q[14];
-rz(-pi/4) q[14];
-cx q[13],q[14];
-rz(3*pi/4) q[14];
-sx q[14];
-rz(pi/2) q[14];
-reset q[14];
-rz(pi/2) q[14];
-sx q[14];
-rz(pi/2) q[14];
-cx q[2],q[14];
-rz(-pi/4) q[14];
-rz(pi/4) q[8];
-cx q[13],q[8];
-rz(pi/4) q[13];
-rz(-pi/4) q[8];
-cx q[13],q[8];
-rz(pi/2) q[13];
-sx q[13];
-rz(pi/2) q[13];
-cx q[6],q[13];
-rz(-pi/4) q[13];
-cx q[7],q[13];
-rz(pi/4) q[13];
-cx q[6],q[13];
-rz(-pi/4) q[13];
-rz(pi/4) q[6];
-cx q[7],q[13];
-rz(3*pi/4) q[13];
-sx q[13];
-rz(pi/2) q[13];
-reset q[13];
-rz(pi/2) q[13];
-sx q[13];
-rz(pi/2) q[13];
-cx q[7],q[6];
-rz(-pi/4) q[6];
-rz(pi/4) q[7];
-cx q[7],q[6];
-x q[6];
-cx q[0],q[6];
-rz(-pi/2) q[0];
-sx q[0];
-rz(pi/2) q[0];
-cx q[0],q[13];
-rz(-pi/4) q[13];
-cx q[3],q[6];
-cx q[3],q[7];
-rz(-pi/2) q[3];
-sx q[3];
-rz(pi/2) q[3];
-cx q[3],q[15];
-rz(-pi/4) q[15];
-x q[8];
-cx q[1],q[8];
-rz(-pi/2) q[1];
-sx q[1];
-rz(pi/2) q[1];
-cx q[1],q[13];
-rz(pi/4) q[13];
-cx q[0],q[13];
-rz(pi/4) q[0];
-rz(-pi/4) q[13];
-cx q[1],q[13];
-cx q[1],q[0];
-rz(-pi/4) q[0];
-rz(pi/4) q[1];
-cx q[1],q[0];
-rz(3*pi/4) q[13];
-sx q[13];
-rz(pi/2) q[13];
-cx q[13],q[14];
-rz(pi/4) q[14];
-cx q[2],q[14];
-rz(-pi/4) q[14];
-cx q[13],q[14];
-rz(3*pi/4) q[14];
-sx q[14];
-rz(pi/2) q[14];
-cx q[14],q[15];
-rz(pi/4) q[15];
-rz(pi/4) q[2];
-cx q[13],q[2];
-rz(pi/4) q[13];
-rz(-pi/4) q[2];
-cx q[13],q[2];
-cx q[3],q[15];
-rz(-pi/4) q[15];
-cx q[14],q[15];
-rz(3*pi/4) q[15];
-sx q[15];
-rz(pi/2) q[15];
-rz(pi/4) q[3];
-cx q[14],q[3];
-rz(pi/4) q[14];
-rz(-pi/4) q[3];
-cx q[14],q[3];
-cx q[4],q[8];
-x q[9];
-cx q[4],q[9];
-rz(-pi/2) q[4];
-sx q[4];
-rz(pi/2) q[4];
-cx q[4],q[16];
-rz(-pi/4) q[16];
-cx q[15],q[16];
-rz(pi/4) q[16];
-cx q[4],q[16];
-rz(-pi/4) q[16];
-cx q[15],q[16];
-rz(3*pi/4) q[16];
-sx q[16];
-rz(pi/2) q[16];
-cx q[16],q[17];
-rz(pi/4) q[17];
-rz(pi/4) q[4];
-cx q[15],q[4];
-rz(pi/4) q[15];
-rz(-pi/4) q[4];
-cx q[15],q[4];
-cx q[5],q[17];
-rz(-pi/4) q[17];
-cx q[16],q[17];
-x q[17];
-rz(-pi/4) q[17];
-rz(pi/4) q[5];
-cx q[16],q[5];
-rz(pi/4) q[16];
-rz(-pi/4) q[5];
-cx q[16],q[5];
-cx q[5],q[17];
-rz(-pi/4) q[17];
-cx q[16],q[17];
-rz(pi/4) q[17];
-cx q[5],q[17];
-rz(-pi/4) q[17];
-cx q[16],q[17];
-rz(3*pi/4) q[17];
-sx q[17];
-rz(pi/2) q[17];
-reset q[17];
-rz(pi/2) q[17];
-sx q[17];
-rz(pi/2) q[17];
-rz(pi/4) q[5];
-cx q[16],q[5];
-rz(pi/4) q[16];
-rz(-pi/4) q[5];
-cx q[16],q[5];
-rz(pi/2) q[16];
-sx q[16];
-rz(pi/2) q[16];
-cx q[4],q[16];
-rz(-pi/4) q[16];
-cx q[15],q[16];
-rz(pi/4) q[16];
-cx q[4],q[16];
-rz(-pi/4) q[16];
-cx q[15],q[16];
-rz(3*pi/4) q[16];
-sx q[16];
-rz(pi/2) q[16];
-reset q[16];
-rz(pi/2) q[16];
-sx q[16];
-rz(pi/2) q[16];
-rz(pi/4) q[4];
-cx q[15],q[4];
-rz(pi/4) q[15];
-rz(-pi/4) q[4];
-cx q[15],q[4];
-rz(pi/2) q[15];
-sx q[15];
-rz(pi/2) q[15];
-cx q[3],q[15];
-rz(-pi/4) q[15];
-cx q[14],q[15];
-rz(pi/4) q[15];
-cx q[3],q[15];
-rz(-pi/4) q[15];
-cx q[14],q[15];
-rz(3*pi/4) q[15];
-sx q[15];
-rz(pi/2) q[15];
-reset q[15];
-rz(pi/2) q[15];
-sx q[15];
-rz(pi/2) q[15];
-rz(pi/4) q[3];
-cx q[14],q[3];
-rz(pi/4) q[14];
-rz(-pi/4) q[3];
-cx q[14],q[3];
-rz(pi/2) q[14];
-sx q[14];
-rz(pi/2) q[14];
-cx q[2],q[14];
-rz(-pi/4) q[14];
-cx q[13],q[14];
-rz(pi/4) q[14];
-cx q[2],q[14];
-rz(-pi/4) q[14];
-cx q[13],q[14];
-rz(3*pi/4) q[14];
-sx q[14];
-rz(pi/2) q[14];
-reset q[14];
-rz(pi/2) q[14];
-sx q[14];
-rz(pi/2) q[14];
-rz(pi/4) q[2];
-cx q[13],q[2];
-rz(pi/4) q[13];
-rz(-pi/4) q[2];
-cx q[13],q[2];
-rz(pi/2) q[13];
-sx q[13];
-rz(pi/2) q[13];
-cx q[0],q[13];
-rz(-pi/4) q[13];
-cx q[1],q[13];
-rz(pi/4) q[13];
-cx q[0],q[13];
-rz(pi/4) q[0];
-rz(-pi/4) q[13];
-cx q[1],q[13];
-cx q[1],q[0];
-rz(-pi/4) q[0];
-rz(pi/4) q[1];
-cx q[1],q[0];
-rz(pi/2) q[0];
-sx q[0];
-rz(-pi/2) q[0];
-cx q[0],q[6];
-rz(pi/2) q[1];
-sx q[1];
-rz(-pi/2) q[1];
-cx q[1],q[8];
-rz(3*pi/4) q[13];
-sx q[13];
-rz(pi/2) q[13];
-reset q[13];
-rz(pi/2) q[13];
-sx q[13];
-rz(pi/2) q[13];
-rz(pi/2) q[2];
-sx q[2];
-rz(-pi/2) q[2];
-cx q[2],q[10];
-rz(pi/2) q[3];
-sx q[3];
-rz(-pi/2) q[3];
-cx q[3],q[6];
-cx q[3],q[7];
-rz(pi/2) q[4];
-sx q[4];
-rz(-pi/2) q[4];
-cx q[4],q[8];
-cx q[4],q[9];
-rz(pi/2) q[5];
-sx q[5];
-rz(-pi/2) q[5];
-cx q[5],q[10];
-x q[10];
-cx q[10],q[16];
-rz(-pi/4) q[16];
-cx q[5],q[11];
-x q[11];
-cx q[11],q[17];
-rz(-pi/4) q[17];
-x q[6];
-cx q[6],q[13];
-rz(-pi/4) q[13];
-cx q[7],q[13];
-rz(pi/4) q[13];
-cx q[6],q[13];
-rz(-pi/4) q[13];
-rz(pi/4) q[6];
-cx q[7],q[13];
-rz(3*pi/4) q[13];
-sx q[13];
-rz(pi/2) q[13];
-cx q[7],q[6];
-rz(-pi/4) q[6];
-rz(pi/4) q[7];
-cx q[7],q[6];
-x q[8];
-cx q[8],q[14];
-rz(-pi/4) q[14];
-cx q[13],q[14];
-rz(pi/4) q[14];
-cx q[8],q[14];
-rz(-pi/4) q[14];
-cx q[13],q[14];
-rz(3*pi/4) q[14];
-sx q[14];
-rz(pi/2) q[14];
-rz(pi/4) q[8];
-cx q[13],q[8];
-rz(pi/4) q[13];
-rz(-pi/4) q[8];
-cx q[13],q[8];
-x q[9];
-cx q[9],q[15];
-rz(-pi/4) q[15];
-cx q[14],q[15];
-rz(pi/4) q[15];
-cx q[9],q[15];
-rz(-pi/4) q[15];
-cx q[14],q[15];
-rz(3*pi/4) q[15];
-sx q[15];
-rz(pi/2) q[15];
-cx q[15],q[16];
-rz(pi/4) q[16];
-cx q[10],q[16];
-rz(pi/4) q[10];
-rz(-pi/4) q[16];
-cx q[15],q[16];
-cx q[15],q[10];
-rz(-pi/4) q[10];
-rz(pi/4) q[15];
-cx q[15],q[10];
-rz(3*pi/4) q[16];
-sx q[16];
-rz(pi/2) q[16];
-cx q[16],q[17];
-rz(pi/4) q[17];
-cx q[11],q[17];
-rz(pi/4) q[11];
-rz(-pi/4) q[17];
-cx q[16],q[17];
-cx q[16],q[11];
-rz(-pi/4) q[11];
-rz(pi/4) q[16];
-cx q[16],q[11];
-x q[17];
-rz(-pi/4) q[17];
-cx q[11],q[17];
-rz(-pi/4) q[17];
-cx q[16],q[17];
-rz(pi/4) q[17];
-cx q[11],q[17];
-rz(pi/4) q[11];
-rz(-pi/4) q[17];
-cx q[16],q[17];
-cx q[16],q[11];
-rz(-pi/4) q[11];
-rz(pi/4) q[16];
-cx q[16],q[11];
-x q[11];
-rz(pi/2) q[16];
-sx q[16];
-rz(pi/2) q[16];
-cx q[10],q[16];
-rz(-pi/4) q[16];
-cx q[15],q[16];
-rz(pi/4) q[16];
-cx q[10],q[16];
-rz(pi/4) q[10];
-rz(-pi/4) q[16];
-cx q[15],q[16];
-cx q[15],q[10];
-rz(-pi/4) q[10];
-rz(pi/4) q[15];
-cx q[15],q[10];
-x q[10];
-rz(pi/2) q[15];
-sx q[15];
-rz(pi/2) q[15];
-rz(3*pi/4) q[16];
-sx q[16];
-rz(pi/2) q[16];
-reset q[16];
-rz(pi/2) q[16];
-sx q[16];
-rz(pi/2) q[16];
-rz(3*pi/4) q[17];
-sx q[17];
-rz(pi/2) q[17];
-reset q[17];
-rz(pi/2) q[17];
-sx q[17];
-rz(pi/2) q[17];
-cx q[2],q[10];
-rz(-pi/2) q[2];
-sx q[2];
-rz(pi/2) q[2];
-cx q[5],q[10];
-cx q[5],q[11];
-rz(-pi/2) q[5];
-sx q[5];
-rz(pi/2) q[5];
-cx q[5],q[17];
-rz(-pi/4) q[17];
-rz(pi/4) q[9];
-cx q[14],q[9];
-rz(pi/4) q[14];
-rz(-pi/4) q[9];
-cx q[14],q[9];
-cx q[9],q[15];
-rz(-pi/4) q[15];
-cx q[14],q[15];
-rz(pi/4) q[15];
-cx q[9],q[15];
-rz(-pi/4) q[15];
-cx q[14],q[15];
-rz(3*pi/4) q[15];
-sx q[15];
-rz(pi/2) q[15];
-reset q[15];
-rz(pi/2) q[15];
-sx q[15];
-rz(pi/2) q[15];
-rz(pi/4) q[9];
-cx q[14],q[9];
-rz(pi/4) q[14];
-rz(-pi/4) q[9];
-cx q[14],q[9];
-rz(pi/2) q[14];
-sx q[14];
-rz(pi/2) q[14];
-cx q[8],q[14];
-rz(-pi/4) q[14];
-cx q[13],q[14];
-rz(pi/4) q[14];
-cx q[8],q[14];
-rz(-pi/4) q[14];
-cx q[13],q[14];
-rz(3*pi/4) q[14];
-sx q[14];
-rz(pi/2) q[14];
-reset q[14];
-rz(pi/2) q[14];
-sx q[14];
-rz(pi/2) q[14];
-cx q[2],q[14];
-rz(-pi/4) q[14];
-rz(pi/4) q[8];
-cx q[13],q[8];
-rz(pi/4) q[13];
-rz(-pi/4) q[8];
-cx q[13],q[8];
-rz(pi/2) q[13];
-sx q[13];
-rz(pi/2) q[13];
-cx q[6],q[13];
-rz(-pi/4) q[13];
-cx q[7],q[13];
-rz(pi/4) q[13];
-cx q[6],q[13];
-rz(-pi/4) q[13];
-rz(pi/4) q[6];
-cx q[7],q[13];
-rz(3*pi/4) q[13];
-sx q[13];
-rz(pi/2) q[13];
-reset q[13];
-rz(pi/2) q[13];
-sx q[13];
-rz(pi/2) q[13];
-cx q[7],q[6];
-rz(-pi/4) q[6];
-rz(pi/4) q[7];
-cx q[7],q[6];
-x q[6];
-cx q[0],q[6];
-rz(-pi/2) q[0];
-sx q[0];
-rz(pi/2) q[0];
-cx q[0],q[13];
-rz(-pi/4) q[13];
-cx q[3],q[6];
-cx q[3],q[7];
-rz(-pi/2) q[3];
-sx q[3];
-rz(pi/2) q[3];
-cx q[3],q[15];
-rz(-pi/4) q[15];
-x q[8];
-cx q[1],q[8];
-rz(-pi/2) q[1];
-sx q[1];
-rz(pi/2) q[1];
-cx q[1],q[13];
-rz(pi/4) q[13];
-cx q[0],q[13];
-rz(pi/4) q[0];
-rz(-pi/4) q[13];
-cx q[1],q[13];
-cx q[1],q[0];
-rz(-pi/4) q[0];
-rz(pi/4) q[1];
-cx q[1],q[0];
-rz(3*pi/4) q[13];
-sx q[13];
-rz(pi/2) q[13];
-cx q[13],q[14];
-rz(pi/4) q[14];
-cx q[2],q[14];
-rz(-pi/4) q[14];
-cx q[13],q[14];
-rz(3*pi/4) q[14];
-sx q[14];
-rz(pi/2) q[14];
-cx q[14],q[15];
-rz(pi/4) q[15];
-rz(pi/4) q[2];
-cx q[13],q[2];
-rz(pi/4) q[13];
-rz(-pi/4) q[2];
-cx q[13],q[2];
-cx q[3],q[15];
-rz(-pi/4) q[15];
-cx q[14],q[15];
-rz(3*pi/4) q[15];
-sx q[15];
-rz(pi/2) q[15];
-rz(pi/4) q[3];
-cx q[14],q[3];
-rz(pi/4) q[14];
-rz(-pi/4) q[3];
-cx q[14],q[3];
-cx q[4],q[8];
-x q[9];
-cx q[4],q[9];
-rz(-pi/2) q[4];
-sx q[4];
-rz(pi/2) q[4];
-cx q[4],q[16];
-rz(-pi/4) q[16];
-cx q[15],q[16];
-rz(pi/4) q[16];
-cx q[4],q[16];
-rz(-pi/4) q[16];
-cx q[15],q[16];
-rz(3*pi/4) q[16];
-sx q[16];
-rz(pi/2) q[16];
-cx q[16],q[17];
-rz(pi/4) q[17];
-rz(pi/4) q[4];
-cx q[15],q[4];
-rz(pi/4) q[15];
-rz(-pi/4) q[4];
-cx q[15],q[4];
-cx q[5],q[17];
-rz(-pi/4) q[17];
-cx q[16],q[17];
-x q[17];
-rz(-pi/4) q[17];
-rz(pi/4) q[5];
-cx q[16],q[5];
-rz(pi/4) q[16];
-rz(-pi/4) q[5];
-cx q[16],q[5];
-cx q[5],q[17];
-rz(-pi/4) q[17];
-cx q[16],q[17];
-rz(pi/4) q[17];
-cx q[5],q[17];
-rz(-pi/4) q[17];
-cx q[16],q[17];
-rz(3*pi/4) q[17];
-sx q[17];
-rz(pi/2) q[17];
-reset q[17];
-rz(pi/2) q[17];
-sx q[17];
-rz(pi/2) q[17];
-rz(pi/4) q[5];
-cx q[16],q[5];
-rz(pi/4) q[16];
-rz(-pi/4) q[5];
-cx q[16],q[5];
-rz(pi/2) q[16];
-sx q[16];
-rz(pi/2) q[16];
-cx q[4],q[16];
-rz(-pi/4) q[16];
-cx q[15],q[16];
-rz(pi/4) q[16];
-cx q[4],q[16];
-rz(-pi/4) q[16];
-cx q[15],q[16];
-rz(3*pi/4) q[16];
-sx q[16];
-rz(pi/2) q[16];
-reset q[16];
-rz(pi/2) q[16];
-sx q[16];
-rz(pi/2) q[16];
-rz(pi/4) q[4];
-cx q[15],q[4];
-rz(pi/4) q[15];
-rz(-pi/4) q[4];
-cx q[15],q[4];
-rz(pi/2) q[15];
-sx q[15];
-rz(pi/2) q[15];
-cx q[3],q[15];
-rz(-pi/4) q[15];
-cx q[14],q[15];
-rz(pi/4) q[15];
-cx q[3],q[15];
-rz(-pi/4) q[15];
-cx q[14],q[15];
-rz(3*pi/4) q[15];
-sx q[15];
-rz(pi/2) q[15];
-reset q[15];
-rz(pi/2) q[15];
-sx q[15];
-rz(pi/2) q[15];
-rz(pi/4) q[3];
-cx q[14],q[3];
-rz(pi/4) q[14];
-rz(-pi/4) q[3];
-cx q[14],q[3];
-rz(pi/2) q[14];
-sx q[14];
-rz(pi/2) q[14];
-cx q[2],q[14];
-rz(-pi/4) q[14];
-cx q[13],q[14];
-rz(pi/4) q[14];
-cx q[2],q[14];
-rz(-pi/4) q[14];
-cx q[13],q[14];
-rz(3*pi/4) q[14];
-sx q[14];
-rz(pi/2) q[14];
-reset q[14];
-rz(pi/2) q[14];
-sx q[14];
-rz(pi/2) q[14];
-rz(pi/4) q[2];
-cx q[13],q[2];
-rz(pi/4) q[13];
-rz(-pi/4) q[2];
-cx q[13],q[2];
-rz(pi/2) q[13];
-sx q[13];
-rz(pi/2) q[13];
-cx q[0],q[13];
-rz(-pi/4) q[13];
-cx q[1],q[13];
-rz(pi/4) q[13];
-cx q[0],q[13];
-rz(pi/4) q[0];
-rz(-pi/4) q[13];
-cx q[1],q[13];
-cx q[1],q[0];
-rz(-pi/4) q[0];
-rz(pi/4) q[1];
-cx q[1],q[0];
-rz(pi/2) q[0];
-sx q[0];
-rz(-pi/2) q[0];
-cx q[0],q[6];
-rz(pi/2) q[1];
-sx q[1];
-rz(-pi/2) q[1];
-cx q[1],q[8];
-rz(3*pi/4) q[13];
-sx q[13];
-rz(pi/2) q[13];
-reset q[13];
-rz(pi/2) q[13];
-sx q[13];
-rz(pi/2) q[13];
-rz(pi/2) q[2];
-sx q[2];
-rz(-pi/2) q[2];
-cx q[2],q[10];
-rz(pi/2) q[3];
-sx q[3];
-rz(-pi/2) q[3];
-cx q[3],q[6];
-cx q[3],q[7];
-rz(pi/2) q[4];
-sx q[4];
-rz(-pi/2) q[4];
-cx q[4],q[8];
-cx q[4],q[9];
-rz(pi/2) q[5];
-sx q[5];
-rz(-pi/2) q[5];
-cx q[5],q[10];
-x q[10];
-cx q[10],q[16];
-rz(-pi/4) q[16];
-cx q[5],q[11];
-x q[11];
-cx q[11],q[17];
-rz(-pi/4) q[17];
-x q[6];
-cx q[6],q[13];
-rz(-pi/4) q[13];
-cx q[7],q[13];
-rz(pi/4) q[13];
-cx q[6],q[13];
-rz(-pi/4) q[13];
-rz(pi/4) q[6];
-cx q[7],q[13];
-rz(3*pi/4) q[13];
-sx q[13];
-rz(pi/2) q[13];
-cx q[7],q[6];
-rz(-pi/4) q[6];
-rz(pi/4) q[7];
-cx q[7],q[6];
-x q[8];
-cx q[8],q[14];
-rz(-pi/4) q[14];
-cx q[13],q[14];
-rz(pi/4) q[14];
-cx q[8],q[14];
-rz(-pi/4) q[14];
-cx q[13],q[14];
-rz(3*pi/4) q[14];
-sx q[14];
-rz(pi/2) q[14];
-rz(pi/4) q[8];
-cx q[13],q[8];
-rz(pi/4) q[13];
-rz(-pi/4) q[8];
-cx q[13],q[8];
-x q[9];
-cx q[9],q[15];
-rz(-pi/4) q[15];
-cx q[14],q[15];
-rz(pi/4) q[15];
-cx q[9],q[15];
-rz(-pi/4) q[15];
-cx q[14],q[15];
-rz(3*pi/4) q[15];
-sx q[15];
-rz(pi/2) q[15];
-cx q[15],q[16];
-rz(pi/4) q[16];
-cx q[10],q[16];
-rz(pi/4) q[10];
-rz(-pi/4) q[16];
-cx q[15],q[16];
-cx q[15],q[10];
-rz(-pi/4) q[10];
-rz(pi/4) q[15];
-cx q[15],q[10];
-rz(3*pi/4) q[16];
-sx q[16];
-rz(pi/2) q[16];
-cx q[16],q[17];
-rz(pi/4) q[17];
-cx q[11],q[17];
-rz(pi/4) q[11];
-rz(-pi/4) q[17];
-cx q[16],q[17];
-cx q[16],q[11];
-rz(-pi/4) q[11];
-rz(pi/4) q[16];
-cx q[16],q[11];
-x q[17];
-rz(-pi/4) q[17];
-cx q[11],q[17];
-rz(-pi/4) q[17];
-cx q[16],q[17];
-rz(pi/4) q[17];
-cx q[11],q[17];
-rz(pi/4) q[11];
-rz(-pi/4) q[17];
-cx q[16],q[17];
-cx q[16],q[11];
-rz(-pi/4) q[11];
-rz(pi/4) q[16];
-cx q[16],q[11];
-x q[11];
-rz(pi/2) q[16];
-sx q[16];
-rz(pi/2) q[16];
-cx q[10],q[16];
-rz(-pi/4) q[16];
-cx q[15],q[16];
-rz(pi/4) q[16];
-cx q[10],q[16];
-rz(pi/4) q[10];
-rz(-pi/4) q[16];
-cx q[15],q[16];
-cx q[15],q[10];
-rz(-pi/4) q[10];
-rz(pi/4) q[15];
-cx q[15],q[10];
-x q[10];
-rz(pi/2) q[15];
-sx q[15];
-rz(pi/2) q[15];
-rz(3*pi/4) q[16];
-sx q[16];
-rz(pi/2) q[16];
-reset q[16];
-rz(pi/2) q[16];
-sx q[16];
-rz(pi/2) q[16];
-rz(3*pi/4) q[17];
-sx q[17];
-rz(pi/2) q[17];
-reset q[17];
-rz(pi/2) q[17];
-sx q[17];
-rz(pi/2) q[17];
-cx q[2],q[10];
-rz(-pi/2) q[2];
-sx q[2];
-rz(pi/2) q[2];
-cx q[5],q[10];
-cx q[5],q[11];
-rz(-pi/2) q[5];
-sx q[5];
-rz(pi/2) q[5];
-cx q[5],q[17];
-rz(-pi/4) q[17];
-rz(pi/4) q[9];
-cx q[14],q[9];
-rz(pi/4) q[14];
-rz(-pi/4) q[9];
-cx q[14],q[9];
-cx q[9],q[15];
-rz(-pi/4) q[15];
-cx q[14],q[15];
-rz(pi/4) q[15];
-cx q[9],q[15];
-rz(-pi/4) q[15];
-cx q[14],q[15];
-rz(3*pi/4) q[15];
-sx q[15];
-rz(pi/2) q[15];
-reset q[15];
-rz(pi/2) q[15];
-sx q[15];
-rz(pi/2) q[15];
-rz(pi/4) q[9];
-cx q[14],q[9];
-rz(pi/4) q[14];
-rz(-pi/4) q[9];
-cx q[14],q[9];
-rz(pi/2) q[14];
-sx q[14];
-rz(pi/2) q[14];
-cx q[8],q[14];
-rz(-pi/4) q[14];
-cx q[13],q[14];
-rz(pi/4) q[14];
-cx q[8],q[14];
-rz(-pi/4) q[14];
-cx q[13],q[14];
-rz(3*pi/4) q[14];
-sx q[14];
-rz(pi/2) q[14];
-reset q[14];
-rz(pi/2) q[14];
-sx q[14];
-rz(pi/2) q[14];
-cx q[2],q[14];
-rz(-pi/4) q[14];
-rz(pi/4) q[8];
-cx q[13],q[8];
-rz(pi/4) q[13];
-rz(-pi/4) q[8];
-cx q[13],q[8];
-rz(pi/2) q[13];
-sx q[13];
-rz(pi/2) q[13];
-cx q[6],q[13];
-rz(-pi/4) q[13];
-cx q[7],q[13];
-rz(pi/4) q[13];
-cx q[6],q[13];
-rz(-pi/4) q[13];
-rz(pi/4) q[6];
-cx q[7],q[13];
-rz(3*pi/4) q[13];
-sx q[13];
-rz(pi/2) q[13];
-reset q[13];
-rz(pi/2) q[13];
-sx q[13];
-rz(pi/2) q[13];
-cx q[7],q[6];
-rz(-pi/4) q[6];
-rz(pi/4) q[7];
-cx q[7],q[6];
-x q[6];
-cx q[0],q[6];
-rz(-pi/2) q[0];
-sx q[0];
-rz(pi/2) q[0];
-cx q[0],q[13];
-rz(-pi/4) q[13];
-cx q[3],q[6];
-cx q[3],q[7];
-rz(-pi/2) q[3];
-sx q[3];
-rz(pi/2) q[3];
-cx q[3],q[15];
-rz(-pi/4) q[15];
-x q[8];
-cx q[1],q[8];
-rz(-pi/2) q[1];
-sx q[1];
-rz(pi/2) q[1];
-cx q[1],q[13];
-rz(pi/4) q[13];
-cx q[0],q[13];
-rz(pi/4) q[0];
-rz(-pi/4) q[13];
-cx q[1],q[13];
-cx q[1],q[0];
-rz(-pi/4) q[0];
-rz(pi/4) q[1];
-cx q[1],q[0];
-rz(3*pi/4) q[13];
-sx q[13];
-rz(pi/2) q[13];
-cx q[13],q[14];
-rz(pi/4) q[14];
-cx q[2],q[14];
-rz(-pi/4) q[14];
-cx q[13],q[14];
-rz(3*pi/4) q[14];
-sx q[14];
-rz(pi/2) q[14];
-cx q[14],q[15];
-rz(pi/4) q[15];
-rz(pi/4) q[2];
-cx q[13],q[2];
-rz(pi/4) q[13];
-rz(-pi/4) q[2];
-cx q[13],q[2];
-cx q[3],q[15];
-rz(-pi/4) q[15];
-cx q[14],q[15];
-rz(3*pi/4) q[15];
-sx q[15];
-rz(pi/2) q[15];
-rz(pi/4) q[3];
-cx q[14],q[3];
-rz(pi/4) q[14];
-rz(-pi/4) q[3];
-cx q[14],q[3];
-cx q[4],q[8];
-x q[9];
-cx q[4],q[9];
-rz(-pi/2) q[4];
-sx q[4];
-rz(pi/2) q[4];
-cx q[4],q[16];
-rz(-pi/4) q[16];
-cx q[15],q[16];
-rz(pi/4) q[16];
-cx q[4],q[16];
-rz(-pi/4) q[16];
-cx q[15],q[16];
-rz(3*pi/4) q[16];
-sx q[16];
-rz(pi/2) q[16];
-cx q[16],q[17];
-rz(pi/4) q[17];
-rz(pi/4) q[4];
-cx q[15],q[4];
-rz(pi/4) q[15];
-rz(-pi/4) q[4];
-cx q[15],q[4];
-cx q[5],q[17];
-rz(-pi/4) q[17];
-cx q[16],q[17];
-x q[17];
-rz(-pi/4) q[17];
-rz(pi/4) q[5];
-cx q[16],q[5];
-rz(pi/4) q[16];
-rz(-pi/4) q[5];
-cx q[16],q[5];
-cx q[5],q[17];
-rz(-pi/4) q[17];
-cx q[16],q[17];
-rz(pi/4) q[17];
-cx q[5],q[17];
-rz(-pi/4) q[17];
-cx q[16],q[17];
-rz(3*pi/4) q[17];
-sx q[17];
-rz(pi/2) q[17];
-reset q[17];
-rz(pi/2) q[17];
-sx q[17];
-rz(pi/2) q[17];
-rz(pi/4) q[5];
-cx q[16],q[5];
-rz(pi/4) q[16];
-rz(-pi/4) q[5];
-cx q[16],q[5];
-rz(pi/2) q[16];
-sx q[16];
-rz(pi/2) q[16];
-cx q[4],q[16];
-rz(-pi/4) q[16];
-cx q[15],q[16];
-rz(pi/4) q[16];
-cx q[4],q[16];
-rz(-pi/4) q[16];
-cx q[15],q[16];
-rz(3*pi/4) q[16];
-sx q[16];
-rz(pi/2) q[16];
-reset q[16];
-rz(pi/2) q[16];
-sx q[16];
-rz(pi/2) q[16];
-rz(pi/4) q[4];
-cx q[15],q[4];
-rz(pi/4) q[15];
-rz(-pi/4) q[4];
-cx q[15],q[4];
-rz(pi/2) q[15];
-sx q[15];
-rz(pi/2) q[15];
-cx q[3],q[15];
-rz(-pi/4) q[15];
-cx q[14],q[15];
-rz(pi/4) q[15];
-cx q[3],q[15];
-rz(-pi/4) q[15];
-cx q[14],q[15];
-rz(3*pi/4) q[15];
-sx q[15];
-rz(pi/2) q[15];
-reset q[15];
-rz(pi/2) q[15];
-sx q[15];
-rz(pi/2) q[15];
-rz(pi/4) q[3];
-cx q[14],q[3];
-rz(pi/4) q[14];
-rz(-pi/4) q[3];
-cx q[14],q[3];
-rz(pi/2) q[14];
-sx q[14];
-rz(pi/2) q[14];
-cx q[2],q[14];
-rz(-pi/4) q[14];
-cx q[13],q[14];
-rz(pi/4) q[14];
-cx q[2],q[14];
-rz(-pi/4) q[14];
-cx q[13],q[14];
-rz(3*pi/4) q[14];
-sx q[14];
-rz(pi/2) q[14];
-reset q[14];
-rz(pi/2) q[14];
-sx q[14];
-rz(pi/2) q[14];
-rz(pi/4) q[2];
-cx q[13],q[2];
-rz(pi/4) q[13];
-rz(-pi/4) q[2];
-cx q[13],q[2];
-rz(pi/2) q[13];
-sx q[13];
-rz(pi/2) q[13];
-cx q[0],q[13];
-rz(-pi/4) q[13];
-cx q[1],q[13];
-rz(pi/4) q[13];
-cx q[0],q[13];
-rz(pi/4) q[0];
-rz(-pi/4) q[13];
-cx q[1],q[13];
-cx q[1],q[0];
-rz(-pi/4) q[0];
-rz(pi/4) q[1];
-cx q[1],q[0];
-rz(pi/2) q[0];
-sx q[0];
-rz(-pi/2) q[0];
-cx q[0],q[6];
-rz(pi/2) q[1];
-sx q[1];
-rz(-pi/2) q[1];
-cx q[1],q[8];
-rz(3*pi/4) q[13];
-sx q[13];
-rz(pi/2) q[13];
-reset q[13];
-rz(pi/2) q[13];
-sx q[13];
-rz(pi/2) q[13];
-rz(pi/2) q[2];
-sx q[2];
-rz(-pi/2) q[2];
-cx q[2],q[10];
-rz(pi/2) q[3];
-sx q[3];
-rz(-pi/2) q[3];
-cx q[3],q[6];
-cx q[3],q[7];
-rz(pi/2) q[4];
-sx q[4];
-rz(-pi/2) q[4];
-cx q[4],q[8];
-cx q[4],q[9];
-rz(pi/2) q[5];
-sx q[5];
-rz(-pi/2) q[5];
-cx q[5],q[10];
-x q[10];
-cx q[10],q[16];
-rz(-pi/4) q[16];
-cx q[5],q[11];
-x q[11];
-cx q[11],q[17];
-rz(-pi/4) q[17];
-x q[6];
-cx q[6],q[13];
-rz(-pi/4) q[13];
-cx q[7],q[13];
-rz(pi/4) q[13];
-cx q[6],q[13];
-rz(-pi/4) q[13];
-rz(pi/4) q[6];
-cx q[7],q[13];
-rz(3*pi/4) q[13];
-sx q[13];
-rz(pi/2) q[13];
-cx q[7],q[6];
-rz(-pi/4) q[6];
-rz(pi/4) q[7];
-cx q[7],q[6];
-x q[8];
-cx q[8],q[14];
-rz(-pi/4) q[14];
-cx q[13],q[14];
-rz(pi/4) q[14];
-cx q[8],q[14];
-rz(-pi/4) q[14];
-cx q[13],q[14];
-rz(3*pi/4) q[14];
-sx q[14];
-rz(pi/2) q[14];
-rz(pi/4) q[8];
-cx q[13],q[8];
-rz(pi/4) q[13];
-rz(-pi/4) q[8];
-cx q[13],q[8];
-x q[9];
-cx q[9],q[15];
-rz(-pi/4) q[15];
-cx q[14],q[15];
-rz(pi/4) q[15];
-cx q[9],q[15];
-rz(-pi/4) q[15];
-cx q[14],q[15];
-rz(3*pi/4) q[15];
-sx q[15];
-rz(pi/2) q[15];
-cx q[15],q[16];
-rz(pi/4) q[16];
-cx q[10],q[16];
-rz(pi/4) q[10];
-rz(-pi/4) q[16];
-cx q[15],q[16];
-cx q[15],q[10];
-rz(-pi/4) q[10];
-rz(pi/4) q[15];
-cx q[15],q[10];
-rz(3*pi/4) q[16];
-sx q[16];
-rz(pi/2) q[16];
-cx q[16],q[17];
-rz(pi/4) q[17];
-cx q[11],q[17];
-rz(pi/4) q[11];
-rz(-pi/4) q[17];
-cx q[16],q[17];
-cx q[16],q[11];
-rz(-pi/4) q[11];
-rz(pi/4) q[16];
-cx q[16],q[11];
-x q[17];
-rz(-pi/4) q[17];
-cx q[11],q[17];
-rz(-pi/4) q[17];
-cx q[16],q[17];
-rz(pi/4) q[17];
-cx q[11],q[17];
-rz(pi/4) q[11];
-rz(-pi/4) q[17];
-cx q[16],q[17];
-cx q[16],q[11];
-rz(-pi/4) q[11];
-rz(pi/4) q[16];
-cx q[16],q[11];
-x q[11];
-rz(pi/2) q[16];
-sx q[16];
-rz(pi/2) q[16];
-cx q[10],q[16];
-rz(-pi/4) q[16];
-cx q[15],q[16];
-rz(pi/4) q[16];
-cx q[10],q[16];
-rz(pi/4) q[10];
-rz(-pi/4) q[16];
-cx q[15],q[16];
-cx q[15],q[10];
-rz(-pi/4) q[10];
-rz(pi/4) q[15];
-cx q[15],q[10];
-x q[10];
-rz(pi/2) q[15];
-sx q[15];
-rz(pi/2) q[15];
-rz(3*pi/4) q[16];
-sx q[16];
-rz(pi/2) q[16];
-reset q[16];
-rz(pi/2) q[16];
-sx q[16];
-rz(pi/2) q[16];
-rz(3*pi/4) q[17];
-sx q[17];
-rz(pi/2) q[17];
-reset q[17];
-rz(pi/2) q[17];
-sx q[17];
-rz(pi/2) q[17];
-cx q[2],q[10];
-rz(-pi/2) q[2];
-sx q[2];
-rz(pi/2) q[2];
-cx q[5],q[10];
-cx q[5],q[11];
-rz(-pi/2) q[5];
-sx q[5];
-rz(pi/2) q[5];
-cx q[5],q[17];
-rz(-pi/4) q[17];
-rz(pi/4) q[9];
-cx q[14],q[9];
-rz(pi/4) q[14];
-rz(-pi/4) q[9];
-cx q[14],q[9];
-cx q[9],q[15];
-rz(-pi/4) q[15];
-cx q[14],q[15];
-rz(pi/4) q[15];
-cx q[9],q[15];
-rz(-pi/4) q[15];
-cx q[14],q[15];
-rz(3*pi/4) q[15];
-sx q[15];
-rz(pi/2) q[15];
-reset q[15];
-rz(pi/2) q[15];
-sx q[15];
-rz(pi/2) q[15];
-rz(pi/4) q[9];
-cx q[14],q[9];
-rz(pi/4) q[14];
-rz(-pi/4) q[9];
-cx q[14],q[9];
-rz(pi/2) q[14];
-sx q[14];
-rz(pi/2) q[14];
-cx q[8],q[14];
-rz(-pi/4) q[14];
-cx q[13],q[14];
-rz(pi/4) q[14];
-cx q[8],q[14];
-rz(-pi/4) q[14];
-cx q[13],q[14];
-rz(3*pi/4) q[14];
-sx q[14];
-rz(pi/2) q[14];
-reset q[14];
-rz(pi/2) q[14];
-sx q[14];
-rz(pi/2) q[14];
-cx q[2],q[14];
-rz(-pi/4) q[14];
-rz(pi/4) q[8];
-cx q[13],q[8];
-rz(pi/4) q[13];
-rz(-pi/4) q[8];
-cx q[13],q[8];
-rz(pi/2) q[13];
-sx q[13];
-rz(pi/2) q[13];
-cx q[6],q[13];
-rz(-pi/4) q[13];
-cx q[7],q[13];
-rz(pi/4) q[13];
-cx q[6],q[13];
-rz(-pi/4) q[13];
-rz(pi/4) q[6];
-cx q[7],q[13];
-rz(3*pi/4) q[13];
-sx q[13];
-rz(pi/2) q[13];
-reset q[13];
-rz(pi/2) q[13];
-sx q[13];
-rz(pi/2) q[13];
-cx q[7],q[6];
-rz(-pi/4) q[6];
-rz(pi/4) q[7];
-cx q[7],q[6];
-x q[6];
-cx q[0],q[6];
-rz(-pi/2) q[0];
-sx q[0];
-rz(pi/2) q[0];
-cx q[0],q[13];
-rz(-pi/4) q[13];
-cx q[3],q[6];
-cx q[3],q[7];
-rz(-pi/2) q[3];
-sx q[3];
-rz(pi/2) q[3];
-cx q[3],q[15];
-rz(-pi/4) q[15];
-x q[8];
-cx q[1],q[8];
-rz(-pi/2) q[1];
-sx q[1];
-rz(pi/2) q[1];
-cx q[1],q[13];
-rz(pi/4) q[13];
-cx q[0],q[13];
-rz(pi/4) q[0];
-rz(-pi/4) q[13];
-cx q[1],q[13];
-cx q[1],q[0];
-rz(-pi/4) q[0];
-rz(pi/4) q[1];
-cx q[1],q[0];
-rz(3*pi/4) q[13];
-sx q[13];
-rz(pi/2) q[13];
-cx q[13],q[14];
-rz(pi/4) q[14];
-cx q[2],q[14];
-rz(-pi/4) q[14];
-cx q[13],q[14];
-rz(3*pi/4) q[14];
-sx q[14];
-rz(pi/2) q[14];
-cx q[14],q[15];
-rz(pi/4) q[15];
-rz(pi/4) q[2];
-cx q[13],q[2];
-rz(pi/4) q[13];
-rz(-pi/4) q[2];
-cx q[13],q[2];
-cx q[3],q[15];
-rz(-pi/4) q[15];
-cx q[14],q[15];
-rz(3*pi/4) q[15];
-sx q[15];
-rz(pi/2) q[15];
-rz(pi/4) q[3];
-cx q[14],q[3];
-rz(pi/4) q[14];
-rz(-pi/4) q[3];
-cx q[14],q[3];
-cx q[4],q[8];
-x q[9];
-cx q[4],q[9];
-rz(-pi/2) q[4];
-sx q[4];
-rz(pi/2) q[4];
-cx q[4],q[16];
-rz(-pi/4) q[16];
-cx q[15],q[16];
-rz(pi/4) q[16];
-cx q[4],q[16];
-rz(-pi/4) q[16];
-cx q[15],q[16];
-rz(3*pi/4) q[16];
-sx q[16];
-rz(pi/2) q[16];
-cx q[16],q[17];
-rz(pi/4) q[17];
-rz(pi/4) q[4];
-cx q[15],q[4];
-rz(pi/4) q[15];
-rz(-pi/4) q[4];
-cx q[15],q[4];
-cx q[5],q[17];
-rz(-pi/4) q[17];
-cx q[16],q[17];
-x q[17];
-rz(-pi/4) q[17];
-rz(pi/4) q[5];
-cx q[16],q[5];
-rz(pi/4) q[16];
-rz(-pi/4) q[5];
-cx q[16],q[5];
-cx q[5],q[17];
-rz(-pi/4) q[17];
-cx q[16],q[17];
-rz(pi/4) q[17];
-cx q[5],q[17];
-rz(-pi/4) q[17];
-cx q[16],q[17];
-rz(3*pi/4) q[17];
-sx q[17];
-rz(pi/2) q[17];
-reset q[17];
-rz(pi/2) q[17];
-sx q[17];
-rz(pi/2) q[17];
-rz(pi/4) q[5];
-cx q[16],q[5];
-rz(pi/4) q[16];
-rz(-pi/4) q[5];
-cx q[16],q[5];
-rz(pi/2) q[16];
-sx q[16];
-rz(pi/2) q[16];
-cx q[4],q[16];
-rz(-pi/4) q[16];
-cx q[15],q[16];
-rz(pi/4) q[16];
-cx q[4],q[16];
-rz(-pi/4) q[16];
-cx q[15],q[16];
-rz(3*pi/4) q[16];
-sx q[16];
-rz(pi/2) q[16];
-reset q[16];
-rz(pi/2) q[16];
-sx q[16];
-rz(pi/2) q[16];
-rz(pi/4) q[4];
-cx q[15],q[4];
-rz(pi/4) q[15];
-rz(-pi/4) q[4];
-cx q[15],q[4];
-rz(pi/2) q[15];
-sx q[15];
-rz(pi/2) q[15];
-cx q[3],q[15];
-rz(-pi/4) q[15];
-cx q[14],q[15];
-rz(pi/4) q[15];
-cx q[3],q[15];
-rz(-pi/4) q[15];
-cx q[14],q[15];
-rz(3*pi/4) q[15];
-sx q[15];
-rz(pi/2) q[15];
-reset q[15];
-rz(pi/2) q[15];
-sx q[15];
-rz(pi/2) q[15];
-rz(pi/4) q[3];
-cx q[14],q[3];
-rz(pi/4) q[14];
-rz(-pi/4) q[3];
-cx q[14],q[3];
-rz(pi/2) q[14];
-sx q[14];
-rz(pi/2) q[14];
-cx q[2],q[14];
-rz(-pi/4) q[14];
-cx q[13],q[14];
-rz(pi/4) q[14];
-cx q[2],q[14];
-rz(-pi/4) q[14];
-cx q[13],q[14];
-rz(3*pi/4) q[14];
-sx q[14];
-rz(pi/2) q[14];
-reset q[14];
-rz(pi/2) q[14];
-sx q[14];
-rz(pi/2) q[14];
-rz(pi/4) q[2];
-cx q[13],q[2];
-rz(pi/4) q[13];
-rz(-pi/4) q[2];
-cx q[13],q[2];
-rz(pi/2) q[13];
-sx q[13];
-rz(pi/2) q[13];
-cx q[0],q[13];
-rz(-pi/4) q[13];
-cx q[1],q[13];
-rz(pi/4) q[13];
-cx q[0],q[13];
-rz(pi/4) q[0];
-rz(-pi/4) q[13];
-cx q[1],q[13];
-cx q[1],q[0];
-rz(-pi/4) q[0];
-rz(pi/4) q[1];
-cx q[1],q[0];
-rz(pi/2) q[0];
-sx q[0];
-rz(-pi/2) q[0];
-cx q[0],q[6];
-rz(pi/2) q[1];
-sx q[1];
-rz(-pi/2) q[1];
-cx q[1],q[8];
-rz(3*pi/4) q[13];
-sx q[13];
-rz(pi/2) q[13];
-reset q[13];
-rz(pi/2) q[13];
-sx q[13];
-rz(pi/2) q[13];
-rz(pi/2) q[2];
-sx q[2];
-rz(-pi/2) q[2];
-cx q[2],q[10];
-rz(pi/2) q[3];
-sx q[3];
-rz(-pi/2) q[3];
-cx q[3],q[6];
-cx q[3],q[7];
-rz(pi/2) q[4];
-sx q[4];
-rz(-pi/2) q[4];
-cx q[4],q[8];
-cx q[4],q[9];
-rz(pi/2) q[5];
-sx q[5];
-rz(-pi/2) q[5];
-cx q[5],q[10];
-x q[10];
-cx q[10],q[16];
-rz(-pi/4) q[16];
-cx q[5],q[11];
-x q[11];
-cx q[11],q[17];
-rz(-pi/4) q[17];
-x q[6];
-cx q[6],q[13];
-rz(-pi/4) q[13];
-cx q[7],q[13];
-rz(pi/4) q[13];
-cx q[6],q[13];
-rz(-pi/4) q[13];
-rz(pi/4) q[6];
-cx q[7],q[13];
-rz(3*pi/4) q[13];
-sx q[13];
-rz(pi/2) q[13];
-cx q[7],q[6];
-rz(-pi/4) q[6];
-rz(pi/4) q[7];
-cx q[7],q[6];
-x q[8];
-cx q[8],q[14];
-rz(-pi/4) q[14];
-cx q[13],q[14];
-rz(pi/4) q[14];
-cx q[8],q[14];
-rz(-pi/4) q[14];
-cx q[13],q[14];
-rz(3*pi/4) q[14];
-sx q[14];
-rz(pi/2) q[14];
-rz(pi/4) q[8];
-cx q[13],q[8];
-rz(pi/4) q[13];
-rz(-pi/4) q[8];
-cx q[13],q[8];
-x q[9];
-cx q[9],q[15];
-rz(-pi/4) q[15];
-cx q[14],q[15];
-rz(pi/4) q[15];
-cx q[9],q[15];
-rz(-pi/4) q[15];
-cx q[14],q[15];
-rz(3*pi/4) q[15];
-sx q[15];
-rz(pi/2) q[15];
-cx q[15],q[16];
-rz(pi/4) q[16];
-cx q[10],q[16];
-rz(pi/4) q[10];
-rz(-pi/4) q[16];
-cx q[15],q[16];
-cx q[15],q[10];
-rz(-pi/4) q[10];
-rz(pi/4) q[15];
-cx q[15],q[10];
-rz(3*pi/4) q[16];
-sx q[16];
-rz(pi/2) q[16];
-cx q[16],q[17];
-rz(pi/4) q[17];
-cx q[11],q[17];
-rz(pi/4) q[11];
-rz(-pi/4) q[17];
-cx q[16],q[17];
-cx q[16],q[11];
-rz(-pi/4) q[11];
-rz(pi/4) q[16];
-cx q[16],q[11];
-x q[17];
-rz(-pi/4) q[17];
-cx q[11],q[17];
-rz(-pi/4) q[17];
-cx q[16],q[17];
-rz(pi/4) q[17];
-cx q[11],q[17];
-rz(pi/4) q[11];
-rz(-pi/4) q[17];
-cx q[16],q[17];
-cx q[16],q[11];
-rz(-pi/4) q[11];
-rz(pi/4) q[16];
-cx q[16],q[11];
-x q[11];
-rz(pi/2) q[16];
-sx q[16];
-rz(pi/2) q[16];
-cx q[10],q[16];
-rz(-pi/4) q[16];
-cx q[15],q[16];
-rz(pi/4) q[16];
-cx q[10],q[16];
-rz(pi/4) q[10];
-rz(-pi/4) q[16];
-cx q[15],q[16];
-cx q[15],q[10];
-rz(-pi/4) q[10];
-rz(pi/4) q[15];
-cx q[15],q[10];
-x q[10];
-rz(pi/2) q[15];
-sx q[15];
-rz(pi/2) q[15];
-rz(3*pi/4) q[16];
-sx q[16];
-rz(pi/2) q[16];
-reset q[16];
-rz(pi/2) q[16];
-sx q[16];
-rz(pi/2) q[16];
-rz(3*pi/4) q[17];
-sx q[17];
-rz(pi/2) q[17];
-reset q[17];
-rz(pi/2) q[17];
-sx q[17];
-rz(pi/2) q[17];
-cx q[2],q[10];
-rz(-pi/2) q[2];
-sx q[2];
-rz(pi/2) q[2];
-cx q[5],q[10];
-cx q[5],q[11];
-rz(-pi/2) q[5];
-sx q[5];
-rz(pi/2) q[5];
-cx q[5],q[17];
-rz(-pi/4) q[17];
-rz(pi/4) q[9];
-cx q[14],q[9];
-rz(pi/4) q[14];
-rz(-pi/4) q[9];
-cx q[14],q[9];
-cx q[9],q[15];
-rz(-pi/4) q[15];
-cx q[14],q[15];
-rz(pi/4) q[15];
-cx q[9],q[15];
-rz(-pi/4) q[15];
-cx q[14],q[15];
-rz(3*pi/4) q[15];
-sx q[15];
-rz(pi/2) q[15];
-reset q[15];
-rz(pi/2) q[15];
-sx q[15];
-rz(pi/2) q[15];
-rz(pi/4) q[9];
-cx q[14],q[9];
-rz(pi/4) q[14];
-rz(-pi/4) q[9];
-cx q[14],q[9];
-rz(pi/2) q[14];
-sx q[14];
-rz(pi/2) q[14];
-cx q[8],q[14];
-rz(-pi/4) q[14];
-cx q[13],q[14];
-rz(pi/4) q[14];
-cx q[8],q[14];
-rz(-pi/4) q[14];
-cx q[13],q[14];
-rz(3*pi/4) q[14];
-sx q[14];
-rz(pi/2) q[14];
-reset q[14];
-rz(pi/2) q[14];
-sx q[14];
-rz(pi/2) q[14];
-cx q[2],q[14];
-rz(-pi/4) q[14];
-rz(pi/4) q[8];
-cx q[13],q[8];
-rz(pi/4) q[13];
-rz(-pi/4) q[8];
-cx q[13],q[8];
-rz(pi/2) q[13];
-sx q[13];
-rz(pi/2) q[13];
-cx q[6],q[13];
-rz(-pi/4) q[13];
-cx q[7],q[13];
-rz(pi/4) q[13];
-cx q[6],q[13];
-rz(-pi/4) q[13];
-rz(pi/4) q[6];
-cx q[7],q[13];
-rz(3*pi/4) q[13];
-sx q[13];
-rz(pi/2) q[13];
-reset q[13];
-rz(pi/2) q[13];
-sx q[13];
-rz(pi/2) q[13];
-cx q[7],q[6];
-rz(-pi/4) q[6];
-rz(pi/4) q[7];
-cx q[7],q[6];
-x q[6];
-cx q[0],q[6];
-rz(-pi/2) q[0];
-sx q[0];
-rz(pi/2) q[0];
-cx q[0],q[13];
-rz(-pi/4) q[13];
-cx q[3],q[6];
-cx q[3],q[7];
-rz(-pi/2) q[3];
-sx q[3];
-rz(pi/2) q[3];
-cx q[3],q[15];
-rz(-pi/4) q[15];
-x q[8];
-cx q[1],q[8];
-rz(-pi/2) q[1];
-sx q[1];
-rz(pi/2) q[1];
-cx q[1],q[13];
-rz(pi/4) q[13];
-cx q[0],q[13];
-rz(pi/4) q[0];
-rz(-pi/4) q[13];
-cx q[1],q[13];
-cx q[1],q[0];
-rz(-pi/4) q[0];
-rz(pi/4) q[1];
-cx q[1],q[0];
-rz(3*pi/4) q[13];
-sx q[13];
-rz(pi/2) q[13];
-cx q[13],q[14];
-rz(pi/4) q[14];
-cx q[2],q[14];
-rz(-pi/4) q[14];
-cx q[13],q[14];
-rz(3*pi/4) q[14];
-sx q[14];
-rz(pi/2) q[14];
-cx q[14],q[15];
-rz(pi/4) q[15];
-rz(pi/4) q[2];
-cx q[13],q[2];
-rz(pi/4) q[13];
-rz(-pi/4) q[2];
-cx q[13],q[2];
-cx q[3],q[15];
-rz(-pi/4) q[15];
-cx q[14],q[15];
-rz(3*pi/4) q[15];
-sx q[15];
-rz(pi/2) q[15];
-rz(pi/4) q[3];
-cx q[14],q[3];
-rz(pi/4) q[14];
-rz(-pi/4) q[3];
-cx q[14],q[3];
-cx q[4],q[8];
-x q[9];
-cx q[4],q[9];
-rz(-pi/2) q[4];
-sx q[4];
-rz(pi/2) q[4];
-cx q[4],q[16];
-rz(-pi/4) q[16];
-cx q[15],q[16];
-rz(pi/4) q[16];
-cx q[4],q[16];
-rz(-pi/4) q[16];
-cx q[15],q[16];
-rz(3*pi/4) q[16];
-sx q[16];
-rz(pi/2) q[16];
-cx q[16],q[17];
-rz(pi/4) q[17];
-rz(pi/4) q[4];
-cx q[15],q[4];
-rz(pi/4) q[15];
-rz(-pi/4) q[4];
-cx q[15],q[4];
-cx q[5],q[17];
-rz(-pi/4) q[17];
-cx q[16],q[17];
-x q[17];
-rz(-pi/4) q[17];
-rz(pi/4) q[5];
-cx q[16],q[5];
-rz(pi/4) q[16];
-rz(-pi/4) q[5];
-cx q[16],q[5];
-cx q[5],q[17];
-rz(-pi/4) q[17];
-cx q[16],q[17];
-rz(pi/4) q[17];
-cx q[5],q[17];
-rz(-pi/4) q[17];
-cx q[16],q[17];
-rz(3*pi/4) q[17];
-sx q[17];
-rz(pi/2) q[17];
-reset q[17];
-rz(pi/2) q[17];
-sx q[17];
-rz(pi/2) q[17];
-rz(pi/4) q[5];
-cx q[16],q[5];
-rz(pi/4) q[16];
-rz(-pi/4) q[5];
-cx q[16],q[5];
-rz(pi/2) q[16];
-sx q[16];
-rz(pi/2) q[16];
-cx q[4],q[16];
-rz(-pi/4) q[16];
-cx q[15],q[16];
-rz(pi/4) q[16];
-cx q[4],q[16];
-rz(-pi/4) q[16];
-cx q[15],q[16];
-rz(3*pi/4) q[16];
-sx q[16];
-rz(pi/2) q[16];
-reset q[16];
-rz(pi/2) q[16];
-sx q[16];
-rz(pi/2) q[16];
-rz(pi/4) q[4];
-cx q[15],q[4];
-rz(pi/4) q[15];
-rz(-pi/4) q[4];
-cx q[15],q[4];
-rz(pi/2) q[15];
-sx q[15];
-rz(pi/2) q[15];
-cx q[3],q[15];
-rz(-pi/4) q[15];
-cx q[14],q[15];
-rz(pi/4) q[15];
-cx q[3],q[15];
-rz(-pi/4) q[15];
-cx q[14],q[15];
-rz(3*pi/4) q[15];
-sx q[15];
-rz(pi/2) q[15];
-reset q[15];
-rz(pi/2) q[15];
-sx q[15];
-rz(pi/2) q[15];
-rz(pi/4) q[3];
-cx q[14],q[3];
-rz(pi/4) q[14];
-rz(-pi/4) q[3];
-cx q[14],q[3];
-rz(pi/2) q[14];
-sx q[14];
-rz(pi/2) q[14];
-cx q[2],q[14];
-rz(-pi/4) q[14];
-cx q[13],q[14];
-rz(pi/4) q[14];
-cx q[2],q[14];
-rz(-pi/4) q[14];
-cx q[13],q[14];
-rz(3*pi/4) q[14];
-sx q[14];
-rz(pi/2) q[14];
-reset q[14];
-rz(pi/2) q[14];
-sx q[14];
-rz(pi/2) q[14];
-rz(pi/4) q[2];
-cx q[13],q[2];
-rz(pi/4) q[13];
-rz(-pi/4) q[2];
-cx q[13],q[2];
-rz(pi/2) q[13];
-sx q[13];
-rz(pi/2) q[13];
-cx q[0],q[13];
-rz(-pi/4) q[13];
-cx q[1],q[13];
-rz(pi/4) q[13];
-cx q[0],q[13];
-rz(pi/4) q[0];
-rz(-pi/4) q[13];
-cx q[1],q[13];
-cx q[1],q[0];
-rz(-pi/4) q[0];
-rz(pi/4) q[1];
-cx q[1],q[0];
-rz(pi/2) q[0];
-sx q[0];
-rz(-pi/2) q[0];
-cx q[0],q[6];
-rz(pi/2) q[1];
-sx q[1];
-rz(-pi/2) q[1];
-cx q[1],q[8];
-rz(3*pi/4) q[13];
-sx q[13];
-rz(pi/2) q[13];
-reset q[13];
-rz(pi/2) q[13];
-sx q[13];
-rz(pi/2) q[13];
-rz(pi/2) q[2];
-sx q[2];
-rz(-pi/2) q[2];
-cx q[2],q[10];
-rz(pi/2) q[3];
-sx q[3];
-rz(-pi/2) q[3];
-cx q[3],q[6];
-cx q[3],q[7];
-rz(pi/2) q[4];
-sx q[4];
-rz(-pi/2) q[4];
-cx q[4],q[8];
-cx q[4],q[9];
-rz(pi/2) q[5];
-sx q[5];
-rz(-pi/2) q[5];
-cx q[5],q[10];
-x q[10];
-cx q[10],q[16];
-rz(-pi/4) q[16];
-cx q[5],q[11];
-x q[11];
-cx q[11],q[17];
-rz(-pi/4) q[17];
-x q[6];
-cx q[6],q[13];
-rz(-pi/4) q[13];
-cx q[7],q[13];
-rz(pi/4) q[13];
-cx q[6],q[13];
-rz(-pi/4) q[13];
-rz(pi/4) q[6];
-cx q[7],q[13];
-rz(3*pi/4) q[13];
-sx q[13];
-rz(pi/2) q[13];
-cx q[7],q[6];
-rz(-pi/4) q[6];
-rz(pi/4) q[7];
-cx q[7],q[6];
-x q[8];
-cx q[8],q[14];
-rz(-pi/4) q[14];
-cx q[13],q[14];
-rz(pi/4) q[14];
-cx q[8],q[14];
-rz(-pi/4) q[14];
-cx q[13],q[14];
-rz(3*pi/4) q[14];
-sx q[14];
-rz(pi/2) q[14];
-rz(pi/4) q[8];
-cx q[13],q[8];
-rz(pi/4) q[13];
-rz(-pi/4) q[8];
-cx q[13],q[8];
-x q[9];
-cx q[9],q[15];
-rz(-pi/4) q[15];
-cx q[14],q[15];
-rz(pi/4) q[15];
-cx q[9],q[15];
-rz(-pi/4) q[15];
-cx q[14],q[15];
-rz(3*pi/4) q[15];
-sx q[15];
-rz(pi/2) q[15];
-cx q[15],q[16];
-rz(pi/4) q[16];
-cx q[10],q[16];
-rz(pi/4) q[10];
-rz(-pi/4) q[16];
-cx q[15],q[16];
-cx q[15],q[10];
-rz(-pi/4) q[10];
-rz(pi/4) q[15];
-cx q[15],q[10];
-rz(3*pi/4) q[16];
-sx q[16];
-rz(pi/2) q[16];
-cx q[16],q[17];
-rz(pi/4) q[17];
-cx q[11],q[17];
-rz(pi/4) q[11];
-rz(-pi/4) q[17];
-cx q[16],q[17];
-cx q[16],q[11];
-rz(-pi/4) q[11];
-rz(pi/4) q[16];
-cx q[16],q[11];
-rz(3*pi/4) q[17];
-sx q[17];
-rz(pi/2) q[17];
-cx q[17],q[12];
-rz(pi/2) q[17];
-sx q[17];
-rz(pi/2) q[17];
-cx q[11],q[17];
-rz(-pi/4) q[17];
-cx q[16],q[17];
-rz(pi/4) q[17];
-cx q[11],q[17];
-rz(pi/4) q[11];
-rz(-pi/4) q[17];
-cx q[16],q[17];
-cx q[16],q[11];
-rz(-pi/4) q[11];
-rz(pi/4) q[16];
-cx q[16],q[11];
-x q[11];
-rz(pi/2) q[16];
-sx q[16];
-rz(pi/2) q[16];
-cx q[10],q[16];
-rz(-pi/4) q[16];
-cx q[15],q[16];
-rz(pi/4) q[16];
-cx q[10],q[16];
-rz(pi/4) q[10];
-rz(-pi/4) q[16];
-cx q[15],q[16];
-cx q[15],q[10];
-rz(-pi/4) q[10];
-rz(pi/4) q[15];
-cx q[15],q[10];
-x q[10];
-rz(pi/2) q[15];
-sx q[15];
-rz(pi/2) q[15];
-rz(3*pi/4) q[16];
-sx q[16];
-rz(pi/2) q[16];
-rz(3*pi/4) q[17];
-sx q[17];
-rz(pi/2) q[17];
-rz(pi/4) q[9];
-cx q[14],q[9];
-rz(pi/4) q[14];
-rz(-pi/4) q[9];
-cx q[14],q[9];
-cx q[9],q[15];
-rz(-pi/4) q[15];
-cx q[14],q[15];
-rz(pi/4) q[15];
-cx q[9],q[15];
-rz(-pi/4) q[15];
-cx q[14],q[15];
-rz(3*pi/4) q[15];
-sx q[15];
-rz(pi/2) q[15];
-rz(pi/4) q[9];
-cx q[14],q[9];
-rz(pi/4) q[14];
-rz(-pi/4) q[9];
-cx q[14],q[9];
-rz(pi/2) q[14];
-sx q[14];
-rz(pi/2) q[14];
-cx q[8],q[14];
-rz(-pi/4) q[14];
-cx q[13],q[14];
-rz(pi/4) q[14];
-cx q[8],q[14];
-rz(-pi/4) q[14];
-cx q[13],q[14];
-rz(3*pi/4) q[14];
-sx q[14];
-rz(pi/2) q[14];
-rz(pi/4) q[8];
-cx q[13],q[8];
-rz(pi/4) q[13];
-rz(-pi/4) q[8];
-cx q[13],q[8];
-rz(pi/2) q[13];
-sx q[13];
-rz(pi/2) q[13];
-cx q[6],q[13];
-rz(-pi/4) q[13];
-cx q[7],q[13];
-rz(pi/4) q[13];
-cx q[6],q[13];
-rz(-pi/4) q[13];
-rz(pi/4) q[6];
-cx q[7],q[13];
-rz(3*pi/4) q[13];
-sx q[13];
-rz(pi/2) q[13];
-cx q[7],q[6];
-rz(-pi/4) q[6];
-rz(pi/4) q[7];
-cx q[7],q[6];
-x q[6];
-x q[8];
-x q[9];
-measure q[0] -> c[0];
-measure q[1] -> c[1];
-measure q[2] -> c[2];
-measure q[3] -> c[3];
-measure q[4] -> c[4];
-measure q[5] -> c[5];
-measure q[6] -> c[6];
-measure q[7] -> c[7];
-measure q[8] -> c[8];
-measure q[9] -> c[9];
-measure q[10] -> c[10];
-measure q[11] -> c[11];
-measure q[12] -> c[12];
@@ -1,371 +0,0 @@
-OPENQASM 2.0;
-include "qelib1.inc";
-qreg q0[25];
-creg c0[1];
-rz(pi/2) q0[0];
-sx q0[0];
-rz(pi/2) q0[0];
-rz(pi/2) q0[1];
-sx q0[1];
-rz(-0.550888746410207) q0[1];
-sx q0[1];
-rz(5*pi/2) q0[1];
-rz(pi/2) q0[2];
-sx q0[2];
-rz(8.57075785358979) q0[2];
-sx q0[2];
-rz(5*pi/2) q0[2];
-rz(pi/2) q0[3];
-sx q0[3];
-rz(4.50107225358979) q0[3];
-sx q0[3];
-rz(5*pi/2) q0[3];
-rz(pi/2) q0[4];
-sx q0[4];
-rz(-2.77071164641021) q0[4];
-sx q0[4];
-rz(5*pi/2) q0[4];
-rz(pi/2) q0[5];
-sx q0[5];
-rz(3.00972986358979) q0[5];
-sx q0[5];
-rz(5*pi/2) q0[5];
-rz(pi/2) q0[6];
-sx q0[6];
-rz(-1.24530814641021) q0[6];
-sx q0[6];
-rz(5*pi/2) q0[6];
-rz(pi/2) q0[7];
-sx q0[7];
-rz(8.12460185358979) q0[7];
-sx q0[7];
-rz(5*pi/2) q0[7];
-rz(pi/2) q0[8];
-sx q0[8];
-rz(1.72344085358979) q0[8];
-sx q0[8];
-rz(5*pi/2) q0[8];
-rz(pi/2) q0[9];
-sx q0[9];
-rz(7.04747185358979) q0[9];
-sx q0[9];
-rz(5*pi/2) q0[9];
-rz(pi/2) q0[10];
-sx q0[10];
-rz(5.28990335358979) q0[10];
-sx q0[10];
-rz(5*pi/2) q0[10];
-rz(pi/2) q0[11];
-sx q0[11];
-rz(1.58932765358979) q0[11];
-sx q0[11];
-rz(5*pi/2) q0[11];
-rz(pi/2) q0[12];
-sx q0[12];
-rz(6.68537045358979) q0[12];
-sx q0[12];
-rz(5*pi/2) q0[12];
-rz(pi/2) q0[13];
-sx q0[13];
-rz(-0.150722046410207) q0[13];
-sx q0[13];
-rz(5*pi/2) q0[13];
-cx q0[13],q0[1];
-rz(pi/2) q0[13];
-sx q0[13];
-rz(pi/2) q0[13];
-cx q0[1],q0[13];
-rz(-pi/4) q0[13];
-cx q0[0],q0[13];
-rz(pi/4) q0[13];
-cx q0[1],q0[13];
-rz(pi/4) q0[1];
-rz(-pi/4) q0[13];
-cx q0[0],q0[13];
-cx q0[0],q0[1];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[1];
-cx q0[0],q0[1];
-rz(3*pi/4) q0[13];
-sx q0[13];
-rz(pi/2) q0[13];
-cx q0[13],q0[1];
-rz(pi/2) q0[14];
-sx q0[14];
-rz(8.82912155358979) q0[14];
-sx q0[14];
-rz(5*pi/2) q0[14];
-cx q0[14],q0[2];
-rz(pi/2) q0[14];
-sx q0[14];
-rz(pi/2) q0[14];
-cx q0[2],q0[14];
-rz(-pi/4) q0[14];
-cx q0[0],q0[14];
-rz(pi/4) q0[14];
-cx q0[2],q0[14];
-rz(-pi/4) q0[14];
-cx q0[0],q0[14];
-rz(3*pi/4) q0[14];
-sx q0[14];
-rz(pi/2) q0[14];
-rz(pi/4) q0[2];
-cx q0[0],q0[2];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[2];
-cx q0[0],q0[2];
-cx q0[14],q0[2];
-rz(pi/2) q0[15];
-sx q0[15];
-rz(4.34817335358979) q0[15];
-sx q0[15];
-rz(5*pi/2) q0[15];
-cx q0[15],q0[3];
-rz(pi/2) q0[15];
-sx q0[15];
-rz(pi/2) q0[15];
-cx q0[3],q0[15];
-rz(-pi/4) q0[15];
-cx q0[0],q0[15];
-rz(pi/4) q0[15];
-cx q0[3],q0[15];
-rz(-pi/4) q0[15];
-cx q0[0],q0[15];
-rz(3*pi/4) q0[15];
-sx q0[15];
-rz(pi/2) q0[15];
-rz(pi/4) q0[3];
-cx q0[0],q0[3];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[3];
-cx q0[0],q0[3];
-cx q0[15],q0[3];
-rz(pi/2) q0[16];
-sx q0[16];
-rz(-2.86251044641021) q0[16];
-sx q0[16];
-rz(5*pi/2) q0[16];
-cx q0[16],q0[4];
-rz(pi/2) q0[16];
-sx q0[16];
-rz(pi/2) q0[16];
-cx q0[4],q0[16];
-rz(-pi/4) q0[16];
-cx q0[0],q0[16];
-rz(pi/4) q0[16];
-cx q0[4],q0[16];
-rz(-pi/4) q0[16];
-cx q0[0],q0[16];
-rz(3*pi/4) q0[16];
-sx q0[16];
-rz(pi/2) q0[16];
-rz(pi/4) q0[4];
-cx q0[0],q0[4];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[4];
-cx q0[0],q0[4];
-cx q0[16],q0[4];
-rz(pi/2) q0[17];
-sx q0[17];
-rz(3.64430470358979) q0[17];
-sx q0[17];
-rz(5*pi/2) q0[17];
-cx q0[17],q0[5];
-rz(pi/2) q0[17];
-sx q0[17];
-rz(pi/2) q0[17];
-cx q0[5],q0[17];
-rz(-pi/4) q0[17];
-cx q0[0],q0[17];
-rz(pi/4) q0[17];
-cx q0[5],q0[17];
-rz(-pi/4) q0[17];
-cx q0[0],q0[17];
-rz(3*pi/4) q0[17];
-sx q0[17];
-rz(pi/2) q0[17];
-rz(pi/4) q0[5];
-cx q0[0],q0[5];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[5];
-cx q0[0],q0[5];
-cx q0[17],q0[5];
-rz(pi/2) q0[18];
-sx q0[18];
-rz(-0.975694646410207) q0[18];
-sx q0[18];
-rz(5*pi/2) q0[18];
-cx q0[18],q0[6];
-rz(pi/2) q0[18];
-sx q0[18];
-rz(pi/2) q0[18];
-cx q0[6],q0[18];
-rz(-pi/4) q0[18];
-cx q0[0],q0[18];
-rz(pi/4) q0[18];
-cx q0[6],q0[18];
-rz(-pi/4) q0[18];
-cx q0[0],q0[18];
-rz(3*pi/4) q0[18];
-sx q0[18];
-rz(pi/2) q0[18];
-rz(pi/4) q0[6];
-cx q0[0],q0[6];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[6];
-cx q0[0],q0[6];
-cx q0[18],q0[6];
-rz(pi/2) q0[19];
-sx q0[19];
-rz(7.96772955358979) q0[19];
-sx q0[19];
-rz(5*pi/2) q0[19];
-cx q0[19],q0[7];
-rz(pi/2) q0[19];
-sx q0[19];
-rz(pi/2) q0[19];
-cx q0[7],q0[19];
-rz(-pi/4) q0[19];
-cx q0[0],q0[19];
-rz(pi/4) q0[19];
-cx q0[7],q0[19];
-rz(-pi/4) q0[19];
-cx q0[0],q0[19];
-rz(3*pi/4) q0[19];
-sx q0[19];
-rz(pi/2) q0[19];
-rz(pi/4) q0[7];
-cx q0[0],q0[7];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[7];
-cx q0[0],q0[7];
-cx q0[19],q0[7];
-rz(pi/2) q0[20];
-sx q0[20];
-rz(1.55303955358979) q0[20];
-sx q0[20];
-rz(5*pi/2) q0[20];
-cx q0[20],q0[8];
-rz(pi/2) q0[20];
-sx q0[20];
-rz(pi/2) q0[20];
-cx q0[8],q0[20];
-rz(-pi/4) q0[20];
-cx q0[0],q0[20];
-rz(pi/4) q0[20];
-cx q0[8],q0[20];
-rz(-pi/4) q0[20];
-cx q0[0],q0[20];
-rz(3*pi/4) q0[20];
-sx q0[20];
-rz(pi/2) q0[20];
-rz(pi/4) q0[8];
-cx q0[0],q0[8];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[8];
-cx q0[0],q0[8];
-cx q0[20],q0[8];
-rz(pi/2) q0[21];
-sx q0[21];
-rz(6.41968775358979) q0[21];
-sx q0[21];
-rz(5*pi/2) q0[21];
-cx q0[21],q0[9];
-rz(pi/2) q0[21];
-sx q0[21];
-rz(pi/2) q0[21];
-cx q0[9],q0[21];
-rz(-pi/4) q0[21];
-cx q0[0],q0[21];
-rz(pi/4) q0[21];
-cx q0[9],q0[21];
-rz(-pi/4) q0[21];
-cx q0[0],q0[21];
-rz(3*pi/4) q0[21];
-sx q0[21];
-rz(pi/2) q0[21];
-rz(pi/4) q0[9];
-cx q0[0],q0[9];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[9];
-cx q0[0],q0[9];
-cx q0[21],q0[9];
-rz(pi/2) q0[22];
-sx q0[22];
-rz(5.35409745358979) q0[22];
-sx q0[22];
-rz(5*pi/2) q0[22];
-cx q0[22],q0[10];
-rz(pi/2) q0[22];
-sx q0[22];
-rz(pi/2) q0[22];
-cx q0[10],q0[22];
-rz(-pi/4) q0[22];
-cx q0[0],q0[22];
-rz(pi/4) q0[22];
-cx q0[10],q0[22];
-rz(pi/4) q0[10];
-rz(-pi/4) q0[22];
-cx q0[0],q0[22];
-cx q0[0],q0[10];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[10];
-cx q0[0],q0[10];
-rz(3*pi/4) q0[22];
-sx q0[22];
-rz(pi/2) q0[22];
-cx q0[22],q0[10];
-rz(pi/2) q0[23];
-sx q0[23];
-rz(1.00770655358979) q0[23];
-sx q0[23];
-rz(5*pi/2) q0[23];
-cx q0[23],q0[11];
-rz(pi/2) q0[23];
-sx q0[23];
-rz(pi/2) q0[23];
-cx q0[11],q0[23];
-rz(-pi/4) q0[23];
-cx q0[0],q0[23];
-rz(pi/4) q0[23];
-cx q0[11],q0[23];
-rz(pi/4) q0[11];
-rz(-pi/4) q0[23];
-cx q0[0],q0[23];
-cx q0[0],q0[11];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[11];
-cx q0[0],q0[11];
-rz(3*pi/4) q0[23];
-sx q0[23];
-rz(pi/2) q0[23];
-cx q0[23],q0[11];
-rz(pi/2) q0[24];
-sx q0[24];
-rz(6.07103625358979) q0[24];
-sx q0[24];
-rz(5*pi/2) q0[24];
-cx q0[24],q0[12];
-rz(pi/2) q0[24];
-sx q0[24];
-rz(pi/2) q0[24];
-cx q0[12],q0[24];
-rz(-pi/4) q0[24];
-cx q0[0],q0[24];
-rz(pi/4) q0[24];
-cx q0[12],q0[24];
-rz(pi/4) q0[12];
-rz(-pi/4) q0[24];
-cx q0[0],q0[24];
-cx q0[0],q0[12];
-rz(pi/4) q0[0];
-rz(-pi/4) q0[12];
-cx q0[0],q0[12];
-rz(pi/2) q0[0];
-sx q0[0];
-rz(pi/2) q0[0];
-rz(3*pi/4) q0[24];
-sx q0[24];
-rz(pi/2) q0[24];
-cx q0[24],q0[12];
-measure q0[0] -> c0[0];
@@ -1,49 +0,0 @@
-// Generated from Cirq v0.8.0
-
-OPENQASM 2.0;
-include "qelib1.inc";
-
-
-// Qubits: [0, 1, 2]
-qreg q[3];
-creg c[3];
-
-
-u3(pi*0.5,0,pi*0.0564006755) q[2];
-u3(pi*0.5,pi*1.5,pi*0.2945501109) q[1];
-u3(pi*0.5,pi*1.5,pi*1.5) q[0];
-cz q[1],q[2];
-u3(pi*0.1242949803,0,0) q[2];
-u3(pi*0.1242949803,pi*0.5,pi*1.5) q[1];
-cz q[1],q[2];
-u3(pi*0.0298311566,pi*1.5,pi*0.5) q[2];
-u3(pi*0.7273849664,pi*1.5,pi*1.0) q[1];
-cz q[0],q[1];
-u3(pi*0.328242091,0,0) q[1];
-u3(pi*0.328242091,pi*0.5,pi*1.5) q[0];
-cz q[0],q[1];
-u3(pi*0.1374475291,pi*2.0,pi*1.5) q[1];
-u3(pi*0.9766098537,0,0) q[0];
-cz q[1],q[2];
-u3(pi*0.2326621647,0,0) q[2];
-u3(pi*0.2326621647,pi*0.5,pi*1.5) q[1];
-cz q[1],q[2];
-u3(pi*0.5780153762,pi*0.5,pi*0.5) q[2];
-u3(pi*0.6257049652,pi*0.5,0) q[1];
-cz q[0],q[1];
-u3(pi*0.328242091,0,0) q[1];
-u3(pi*0.328242091,pi*0.5,pi*1.5) q[0];
-cz q[0],q[1];
-u3(pi*0.6817377913,0,pi*0.5) q[1];
-u3(pi*0.5,pi*0.3593182384,pi*1.5) q[0];
-cz q[1],q[2];
-u3(pi*0.1242949803,0,0) q[2];
-u3(pi*0.1242949803,pi*0.5,pi*1.5) q[1];
-cz q[1],q[2];
-u3(pi*0.5,pi*1.3937948052,0) q[2];
-u3(pi*0.5,pi*1.1556453697,pi*0.5) q[1];
-
-measure q[0] -> c[0];
-measure q[1] -> c[1];
-measure q[2] -> c[2];
-
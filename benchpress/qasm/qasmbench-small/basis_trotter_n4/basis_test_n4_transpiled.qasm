@@ -1,121 +0,0 @@
-OPENQASM 2.0;
-include "qelib1.inc";
-qreg q[4];
-creg c[4];
-rz(-3*pi/4) q[0];
-rz(-3*pi/4) q[1];
-rz(3*pi/4) q[2];
-cx q[1],q[2];
-rz(pi/2) q[1];
-sx q[1];
-rz(pi/2) q[1];
-cx q[2],q[1];
-rz(-pi/2) q[1];
-cx q[2],q[1];
-rz(-pi) q[1];
-sx q[1];
-rz(pi/2) q[1];
-cx q[1],q[2];
-rz(-pi/2) q[1];
-cx q[0],q[1];
-rz(pi/2) q[0];
-sx q[0];
-rz(pi/2) q[0];
-cx q[1],q[0];
-rz(0.1277154) q[0];
-cx q[1],q[0];
-rz(1.4430809) q[0];
-sx q[0];
-rz(pi/2) q[0];
-cx q[0],q[1];
-rz(0.35285658) q[0];
-rz(pi/2) q[1];
-rz(pi/2) q[2];
-rz(3*pi/4) q[3];
-cx q[2],q[3];
-rz(pi/2) q[2];
-sx q[2];
-rz(pi/2) q[2];
-cx q[3],q[2];
-rz(-0.1277154) q[2];
-cx q[3],q[2];
-rz(1.6985117) q[2];
-sx q[2];
-rz(pi/2) q[2];
-cx q[2],q[3];
-rz(-pi/2) q[2];
-cx q[1],q[2];
-rz(pi/2) q[1];
-sx q[1];
-rz(pi/2) q[1];
-cx q[2],q[1];
-rz(-pi/2) q[1];
-cx q[2],q[1];
-rz(-pi) q[1];
-sx q[1];
-rz(pi/2) q[1];
-cx q[1],q[2];
-rz(0.35285658) q[1];
-rz(0.1774717) q[2];
-cx q[1],q[2];
-rz(pi/2) q[1];
-sx q[1];
-rz(pi/2) q[1];
-cx q[2],q[1];
-rz(-pi/2) q[1];
-cx q[2],q[1];
-rz(-pi) q[1];
-sx q[1];
-rz(pi/2) q[1];
-cx q[1],q[2];
-rz(-pi/2) q[1];
-cx q[0],q[1];
-rz(pi/2) q[0];
-sx q[0];
-rz(pi/2) q[0];
-cx q[1],q[0];
-rz(-0.080156964) q[0];
-cx q[1],q[0];
-rz(1.6509533) q[0];
-sx q[0];
-rz(pi/2) q[0];
-cx q[0],q[1];
-rz(-pi/4) q[0];
-rz(pi/4) q[1];
-cx q[1],q[0];
-cx q[0],q[1];
-cx q[1],q[0];
-rz(pi/2) q[2];
-rz(0.1774717) q[3];
-cx q[2],q[3];
-rz(pi/2) q[2];
-sx q[2];
-rz(pi/2) q[2];
-cx q[3],q[2];
-rz(0.080156964) q[2];
-cx q[3],q[2];
-rz(1.4906394) q[2];
-sx q[2];
-rz(pi/2) q[2];
-cx q[2],q[3];
-rz(-pi/4) q[2];
-rz(pi/4) q[3];
-cx q[3],q[2];
-cx q[2],q[3];
-cx q[3],q[2];
-cx q[2],q[1];
-cx q[1],q[2];
-cx q[2],q[1];
-cx q[1],q[0];
-cx q[0],q[1];
-cx q[1],q[0];
-cx q[3],q[2];
-cx q[2],q[3];
-cx q[3],q[2];
-cx q[2],q[1];
-cx q[1],q[2];
-cx q[2],q[1];
-measure q[0] -> c[0];
-measure q[1] -> c[1];
-measure q[2] -> c[2];
-measure q[3] -> c[3];
@@ -1,50 +0,0 @@
-OPENQASM 2.0;
-include "qelib1.inc";
-qreg q[8];
-creg m6[1];
-creg m0[1];
-creg m3[1];
-creg m1[1];
-creg m2[1];
-creg m4[1];
-creg m5[1];
-creg m7[1];
-x q[0];
-rz(pi/2) q[2];
-sx q[2];
-rz(-pi/2) q[2];
-x q[3];
-rz(pi/2) q[4];
-sx q[4];
-rz(-pi/2) q[4];
-rz(pi/2) q[5];
-sx q[5];
-rz(-pi/2) q[5];
-measure q[6] -> m6[0];
-rz(pi/2) q[6];
-sx q[6];
-rz(pi/2) q[6];
-measure q[6] -> m6[0];
-measure q[0] -> m0[0];
-x q[0];
-measure q[0] -> m0[0];
-measure q[3] -> m3[0];
-rz(pi/2) q[3];
-sx q[3];
-rz(-pi/2) q[3];
-measure q[3] -> m3[0];
-measure q[1] -> m1[0];
-measure q[1] -> m1[0];
-measure q[2] -> m2[0];
-x q[2];
-measure q[2] -> m2[0];
-measure q[4] -> m4[0];
-x q[4];
-measure q[4] -> m4[0];
-measure q[5] -> m5[0];
-rz(pi/2) q[5];
-sx q[5];
-rz(pi/2) q[5];
-measure q[5] -> m5[0];
-measure q[7] -> m7[0];
-measure q[7] -> m7[0];
@@ -1,64 +0,0 @@
-OPENQASM 2.0;
-include "qelib1.inc";
-qreg q[4];
-creg m_b[1];
-creg m_y[1];
-creg m_a[1];
-creg m_x[1];
-rz(pi/2) q[0];
-sx q[0];
-rz(pi/2) q[0];
-rz(pi/2) q[1];
-sx q[1];
-rz(-3*pi/4) q[1];
-sx q[1];
-rz(pi/2) q[1];
-cx q[0],q[2];
-cx q[1],q[0];
-rz(-pi/2) q[0];
-sx q[0];
-rz(pi/2) q[0];
-rz(pi/2) q[1];
-sx q[1];
-rz(5*pi/4) q[1];
-sx q[1];
-rz(5*pi/2) q[1];
-cx q[0],q[1];
-rz(-pi) q[0];
-sx q[0];
-rz(-pi/2) q[0];
-cx q[1],q[0];
-rz(pi/2) q[1];
-sx q[1];
-rz(-pi) q[1];
-rz(pi/2) q[2];
-sx q[2];
-rz(-3*pi/4) q[2];
-sx q[2];
-rz(pi/2) q[2];
-rz(pi/2) q[3];
-sx q[3];
-rz(-3*pi/4) q[3];
-sx q[3];
-rz(pi/2) q[3];
-cx q[3],q[2];
-rz(-pi/2) q[2];
-sx q[2];
-rz(pi/2) q[2];
-rz(pi/2) q[3];
-sx q[3];
-rz(5*pi/4) q[3];
-sx q[3];
-rz(5*pi/2) q[3];
-cx q[2],q[3];
-rz(-pi) q[2];
-sx q[2];
-rz(-pi/2) q[2];
-cx q[3],q[2];
-rz(pi/2) q[3];
-sx q[3];
-rz(-pi) q[3];
-measure q[2] -> m_b[0];
-measure q[3] -> m_y[0];
-measure q[0] -> m_a[0];
-measure q[1] -> m_x[0];
@@ -1,272 +0,0 @@
-// A TWO QUBIT CIRCIUT 3 LAYERS DEEP 
-// Generated from Cirq v0.8.0
-
-OPENQASM 2.0;
-include "qelib1.inc";
-
-// Qubits: [(0, 0), (0, 1)]
-qreg q[2];
-creg ans[2];
-
-rx(pi*0.3501408748) q[0];
-ry(pi*0.3501408748) q[0];
-rz(pi*0.3501408748) q[0];
-rx(pi*0.3501408748) q[1];
-ry(pi*0.3501408748) q[1];
-rz(pi*0.3501408748) q[1];
-
-// Gate: ZZ**1.1
-rz(pi*1.1) q[0];
-rz(pi*1.1) q[1];
-u3(pi*0.5,0,pi*0.25) q[0];
-u3(pi*0.5,pi*1.0,pi*0.75) q[1];
-rx(pi*0.5) q[0];
-cx q[0],q[1];
-rx(pi*0.4) q[0];
-ry(pi*0.5) q[1];
-cx q[1],q[0];
-rx(pi*-0.5) q[1];
-rz(pi*0.5) q[1];
-cx q[0],q[1];
-u3(pi*0.5,pi*0.65,pi*1.0) q[0];
-u3(pi*0.5,pi*0.15,0) q[1];
-
-// Gate: YY**1.1
-u3(0,pi*1.0,pi*0.5) q[0];
-u3(0,0,pi*0.5) q[1];
-rx(pi*0.5) q[0];
-cx q[0],q[1];
-rx(pi*0.4) q[0];
-ry(pi*0.5) q[1];
-cx q[1],q[0];
-rx(pi*-0.5) q[1];
-rz(pi*0.5) q[1];
-cx q[0],q[1];
-u3(pi*1.0,0,pi*0.5) q[0];
-u3(pi*1.0,0,pi*1.5) q[1];
-
-// Gate: XX**1.1
-u3(pi*0.5,pi*1.5,pi*1.5) q[0];
-u3(pi*0.5,pi*0.5,pi*1.5) q[1];
-rx(pi*0.5) q[0];
-cx q[0],q[1];
-rx(pi*0.4) q[0];
-ry(pi*0.5) q[1];
-cx q[1],q[0];
-rx(pi*-0.5) q[1];
-rz(pi*0.5) q[1];
-cx q[0],q[1];
-u3(pi*0.5,pi*0.5,pi*0.5) q[0];
-u3(pi*0.5,pi*0.5,pi*1.5) q[1];
-
-rx(pi*0.3501408748) q[0];
-ry(pi*0.3501408748) q[0];
-rz(pi*0.3501408748) q[0];
-rx(pi*0.3501408748) q[1];
-ry(pi*0.3501408748) q[1];
-rz(pi*0.3501408748) q[1];
-rx(pi*0.3501408748) q[1];
-ry(pi*0.3501408748) q[1];
-rz(pi*0.3501408748) q[1];
-rx(pi*0.3501408748) q[0];
-ry(pi*0.3501408748) q[0];
-rz(pi*0.3501408748) q[0];
-
-// Gate: ZZ**1.1
-rz(pi*1.1) q[1];
-rz(pi*1.1) q[0];
-u3(pi*0.5,0,pi*0.25) q[1];
-u3(pi*0.5,pi*1.0,pi*0.75) q[0];
-rx(pi*0.5) q[1];
-cx q[1],q[0];
-rx(pi*0.4) q[1];
-ry(pi*0.5) q[0];
-cx q[0],q[1];
-rx(pi*-0.5) q[0];
-rz(pi*0.5) q[0];
-cx q[1],q[0];
-u3(pi*0.5,pi*0.65,pi*1.0) q[1];
-u3(pi*0.5,pi*0.15,0) q[0];
-
-// Gate: YY**1.1
-u3(0,pi*1.0,pi*0.5) q[1];
-u3(0,0,pi*0.5) q[0];
-rx(pi*0.5) q[1];
-cx q[1],q[0];
-rx(pi*0.4) q[1];
-ry(pi*0.5) q[0];
-cx q[0],q[1];
-rx(pi*-0.5) q[0];
-rz(pi*0.5) q[0];
-cx q[1],q[0];
-u3(pi*1.0,0,pi*0.5) q[1];
-u3(pi*1.0,0,pi*1.5) q[0];
-
-// Gate: XX**1.1
-u3(pi*0.5,pi*1.5,pi*1.5) q[1];
-u3(pi*0.5,pi*0.5,pi*1.5) q[0];
-rx(pi*0.5) q[1];
-cx q[1],q[0];
-rx(pi*0.4) q[1];
-ry(pi*0.5) q[0];
-cx q[0],q[1];
-rx(pi*-0.5) q[0];
-rz(pi*0.5) q[0];
-cx q[1],q[0];
-u3(pi*0.5,pi*0.5,pi*0.5) q[1];
-u3(pi*0.5,pi*0.5,pi*1.5) q[0];
-
-rx(pi*0.3501408748) q[1];
-ry(pi*0.3501408748) q[1];
-rz(pi*0.3501408748) q[1];
-rx(pi*0.3501408748) q[0];
-ry(pi*0.3501408748) q[0];
-rz(pi*0.3501408748) q[0];
-
-// Gate: CNOT**1.1
-ry(pi*-0.5) q[1];
-u3(pi*0.5,0,pi*0.25) q[0];
-u3(pi*0.5,pi*1.0,pi*0.75) q[1];
-rx(pi*0.5) q[0];
-cx q[0],q[1];
-rx(pi*0.05) q[0];
-ry(pi*0.5) q[1];
-cx q[1],q[0];
-rx(pi*-0.5) q[1];
-rz(pi*0.5) q[1];
-cx q[0],q[1];
-u3(pi*0.5,pi*0.3,pi*1.0) q[0];
-u3(pi*0.5,pi*1.8,0) q[1];
-ry(pi*0.5) q[1];
-
-// Gate: CZ**1.1
-u3(pi*0.5,0,pi*0.25) q[0];
-u3(pi*0.5,pi*1.0,pi*0.75) q[1];
-rx(pi*0.5) q[0];
-cx q[0],q[1];
-rx(pi*0.05) q[0];
-ry(pi*0.5) q[1];
-cx q[1],q[0];
-rx(pi*-0.5) q[1];
-rz(pi*0.5) q[1];
-cx q[0],q[1];
-u3(pi*0.5,pi*0.3,pi*1.0) q[0];
-u3(pi*0.5,pi*1.8,0) q[1];
-
-rx(pi*0.3501408748) q[0];
-ry(pi*0.3501408748) q[0];
-rz(pi*0.3501408748) q[0];
-rx(pi*0.3501408748) q[1];
-ry(pi*0.3501408748) q[1];
-rz(pi*0.3501408748) q[1];
-
-// Gate: ZZ**1.1
-rz(pi*1.1) q[0];
-rz(pi*1.1) q[1];
-u3(pi*0.5,0,pi*0.25) q[0];
-u3(pi*0.5,pi*1.0,pi*0.75) q[1];
-rx(pi*0.5) q[0];
-cx q[0],q[1];
-rx(pi*0.4) q[0];
-ry(pi*0.5) q[1];
-cx q[1],q[0];
-rx(pi*-0.5) q[1];
-rz(pi*0.5) q[1];
-cx q[0],q[1];
-u3(pi*0.5,pi*0.65,pi*1.0) q[0];
-u3(pi*0.5,pi*0.15,0) q[1];
-
-// Gate: YY**1.1
-u3(0,pi*1.0,pi*0.5) q[0];
-u3(0,0,pi*0.5) q[1];
-rx(pi*0.5) q[0];
-cx q[0],q[1];
-rx(pi*0.4) q[0];
-ry(pi*0.5) q[1];
-cx q[1],q[0];
-rx(pi*-0.5) q[1];
-rz(pi*0.5) q[1];
-cx q[0],q[1];
-u3(pi*1.0,0,pi*0.5) q[0];
-u3(pi*1.0,0,pi*1.5) q[1];
-
-// Gate: XX**1.1
-u3(pi*0.5,pi*1.5,pi*1.5) q[0];
-u3(pi*0.5,pi*0.5,pi*1.5) q[1];
-rx(pi*0.5) q[0];
-cx q[0],q[1];
-rx(pi*0.4) q[0];
-ry(pi*0.5) q[1];
-cx q[1],q[0];
-rx(pi*-0.5) q[1];
-rz(pi*0.5) q[1];
-cx q[0],q[1];
-u3(pi*0.5,pi*0.5,pi*0.5) q[0];
-u3(pi*0.5,pi*0.5,pi*1.5) q[1];
-
-rx(pi*0.3501408748) q[0];
-ry(pi*0.3501408748) q[0];
-rz(pi*0.3501408748) q[0];
-rx(pi*0.3501408748) q[1];
-ry(pi*0.3501408748) q[1];
-rz(pi*0.3501408748) q[1];
-rx(pi*0.3501408748) q[1];
-ry(pi*0.3501408748) q[1];
-rz(pi*0.3501408748) q[1];
-rx(pi*0.3501408748) q[0];
-ry(pi*0.3501408748) q[0];
-rz(pi*0.3501408748) q[0];
-
-// Gate: ZZ**1.1
-rz(pi*1.1) q[1];
-rz(pi*1.1) q[0];
-u3(pi*0.5,0,pi*0.25) q[1];
-u3(pi*0.5,pi*1.0,pi*0.75) q[0];
-rx(pi*0.5) q[1];
-cx q[1],q[0];
-rx(pi*0.4) q[1];
-ry(pi*0.5) q[0];
-cx q[0],q[1];
-rx(pi*-0.5) q[0];
-rz(pi*0.5) q[0];
-cx q[1],q[0];
-u3(pi*0.5,pi*0.65,pi*1.0) q[1];
-u3(pi*0.5,pi*0.15,0) q[0];
-
-// Gate: YY**1.1
-u3(0,pi*1.0,pi*0.5) q[1];
-u3(0,0,pi*0.5) q[0];
-rx(pi*0.5) q[1];
-cx q[1],q[0];
-rx(pi*0.4) q[1];
-ry(pi*0.5) q[0];
-cx q[0],q[1];
-rx(pi*-0.5) q[0];
-rz(pi*0.5) q[0];
-cx q[1],q[0];
-u3(pi*1.0,0,pi*0.5) q[1];
-u3(pi*1.0,0,pi*1.5) q[0];
-
-// Gate: XX**1.1
-u3(pi*0.5,pi*1.5,pi*1.5) q[1];
-u3(pi*0.5,pi*0.5,pi*1.5) q[0];
-rx(pi*0.5) q[1];
-cx q[1],q[0];
-rx(pi*0.4) q[1];
-ry(pi*0.5) q[0];
-cx q[0],q[1];
-rx(pi*-0.5) q[0];
-rz(pi*0.5) q[0];
-cx q[1],q[0];
-u3(pi*0.5,pi*0.5,pi*0.5) q[1];
-u3(pi*0.5,pi*0.5,pi*1.5) q[0];
-
-rx(pi*0.3501408748) q[1];
-ry(pi*0.3501408748) q[1];
-rz(pi*0.3501408748) q[1];
-rx(pi*0.3501408748) q[0];
-ry(pi*0.3501408748) q[0];
-rz(pi*0.3501408748) q[0];
-
-measure q[0] -> ans[0];
-measure q[1] -> ans[1];
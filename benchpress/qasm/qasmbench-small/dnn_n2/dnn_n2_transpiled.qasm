@@ -1,312 +0,0 @@
-OPENQASM 2.0;
-include "qelib1.inc";
-qreg q[2];
-creg ans[2];
-rz(-0.79715247) q[0];
-sx q[0];
-rz(-0.55272686) q[0];
-sx q[0];
-rz(1.9734881) q[0];
-rz(-0.79715247) q[1];
-sx q[1];
-rz(-0.55272686) q[1];
-sx q[1];
-rz(-1.1681045) q[1];
-cx q[0],q[1];
-rz(pi/2) q[0];
-sx q[0];
-rz(7*pi/5) q[0];
-sx q[0];
-rz(5*pi/2) q[0];
-rz(-pi/2) q[1];
-sx q[1];
-rz(pi/2) q[1];
-cx q[1],q[0];
-rz(-pi) q[1];
-sx q[1];
-rz(-pi/2) q[1];
-cx q[0],q[1];
-rz(pi/2) q[0];
-sx q[0];
-rz(2.0420352) q[0];
-sx q[0];
-rz(-pi/2) q[1];
-sx q[1];
-rz(-2.6703538) q[1];
-cx q[0],q[1];
-rz(pi/2) q[0];
-sx q[0];
-rz(7*pi/5) q[0];
-sx q[0];
-rz(5*pi/2) q[0];
-rz(-pi/2) q[1];
-sx q[1];
-rz(pi/2) q[1];
-cx q[1],q[0];
-rz(-pi) q[1];
-sx q[1];
-rz(-pi/2) q[1];
-cx q[0],q[1];
-rz(pi/2) q[0];
-rz(pi/2) q[1];
-sx q[1];
-cx q[0],q[1];
-rz(pi/2) q[0];
-sx q[0];
-rz(7*pi/5) q[0];
-sx q[0];
-rz(5*pi/2) q[0];
-rz(-pi/2) q[1];
-sx q[1];
-rz(pi/2) q[1];
-cx q[1],q[0];
-rz(-pi) q[1];
-sx q[1];
-rz(-pi/2) q[1];
-cx q[0],q[1];
-rz(-0.77207828) q[0];
-sx q[0];
-rz(-0.83518121) q[0];
-sx q[0];
-rz(0.84575039) q[0];
-rz(2.3695144) q[1];
-sx q[1];
-rz(-0.83518121) q[1];
-sx q[1];
-rz(-2.2958423) q[1];
-cx q[1],q[0];
-rz(-pi/2) q[0];
-sx q[0];
-rz(pi/2) q[0];
-rz(pi/2) q[1];
-sx q[1];
-rz(7*pi/5) q[1];
-sx q[1];
-rz(5*pi/2) q[1];
-cx q[0],q[1];
-rz(-pi) q[0];
-sx q[0];
-rz(-pi/2) q[0];
-cx q[1],q[0];
-rz(-pi/2) q[0];
-sx q[0];
-rz(-2.6703538) q[0];
-rz(pi/2) q[1];
-sx q[1];
-rz(2.0420352) q[1];
-sx q[1];
-cx q[1],q[0];
-rz(-pi/2) q[0];
-sx q[0];
-rz(pi/2) q[0];
-rz(pi/2) q[1];
-sx q[1];
-rz(7*pi/5) q[1];
-sx q[1];
-rz(5*pi/2) q[1];
-cx q[0],q[1];
-rz(-pi) q[0];
-sx q[0];
-rz(-pi/2) q[0];
-cx q[1],q[0];
-rz(pi/2) q[0];
-sx q[0];
-rz(pi/2) q[1];
-cx q[1],q[0];
-rz(-pi/2) q[0];
-sx q[0];
-rz(pi/2) q[0];
-rz(pi/2) q[1];
-sx q[1];
-rz(7*pi/5) q[1];
-sx q[1];
-rz(5*pi/2) q[1];
-cx q[0],q[1];
-rz(-pi) q[0];
-sx q[0];
-rz(-pi/2) q[0];
-cx q[1],q[0];
-rz(-2.1495275) q[0];
-sx q[0];
-rz(-2.2330665) q[0];
-sx q[0];
-rz(2.1090252) q[0];
-rz(-0.19043683) q[1];
-sx q[1];
-rz(-1.9392357) q[1];
-sx q[1];
-rz(-1.6179568) q[1];
-cx q[0],q[1];
-rz(pi/2) q[0];
-sx q[0];
-rz(3.29867228626928) q[0];
-sx q[0];
-rz(5*pi/2) q[0];
-rz(-pi/2) q[1];
-sx q[1];
-rz(pi/2) q[1];
-cx q[1],q[0];
-rz(-pi) q[1];
-sx q[1];
-rz(-pi/2) q[1];
-cx q[0],q[1];
-rz(pi/2) q[0];
-sx q[0];
-rz(-2.984513) q[0];
-sx q[0];
-rz(pi/2) q[0];
-rz(0.68021498) q[1];
-sx q[1];
-rz(-1.1421643) q[1];
-sx q[1];
-rz(2.6670111) q[1];
-cx q[0],q[1];
-rz(pi/2) q[0];
-sx q[0];
-rz(3.29867228626928) q[0];
-sx q[0];
-rz(5*pi/2) q[0];
-rz(-pi/2) q[1];
-sx q[1];
-rz(pi/2) q[1];
-cx q[1],q[0];
-rz(-pi) q[1];
-sx q[1];
-rz(-pi/2) q[1];
-cx q[0],q[1];
-rz(-0.089094174) q[0];
-sx q[0];
-rz(-1.024559) q[0];
-sx q[0];
-rz(-1.338402) q[0];
-rz(-2.5935896) q[1];
-sx q[1];
-rz(-1.4946939) q[1];
-sx q[1];
-rz(-2.8628265) q[1];
-cx q[0],q[1];
-rz(pi/2) q[0];
-sx q[0];
-rz(7*pi/5) q[0];
-sx q[0];
-rz(5*pi/2) q[0];
-rz(-pi/2) q[1];
-sx q[1];
-rz(pi/2) q[1];
-cx q[1],q[0];
-rz(-pi) q[1];
-sx q[1];
-rz(-pi/2) q[1];
-cx q[0],q[1];
-rz(pi/2) q[0];
-sx q[0];
-rz(2.0420352) q[0];
-sx q[0];
-rz(-pi/2) q[1];
-sx q[1];
-rz(-2.6703538) q[1];
-cx q[0],q[1];
-rz(pi/2) q[0];
-sx q[0];
-rz(7*pi/5) q[0];
-sx q[0];
-rz(5*pi/2) q[0];
-rz(-pi/2) q[1];
-sx q[1];
-rz(pi/2) q[1];
-cx q[1],q[0];
-rz(-pi) q[1];
-sx q[1];
-rz(-pi/2) q[1];
-cx q[0],q[1];
-rz(pi/2) q[0];
-rz(pi/2) q[1];
-sx q[1];
-cx q[0],q[1];
-rz(pi/2) q[0];
-sx q[0];
-rz(7*pi/5) q[0];
-sx q[0];
-rz(5*pi/2) q[0];
-rz(-pi/2) q[1];
-sx q[1];
-rz(pi/2) q[1];
-cx q[1],q[0];
-rz(-pi) q[1];
-sx q[1];
-rz(-pi/2) q[1];
-cx q[0],q[1];
-rz(-0.77207828) q[0];
-sx q[0];
-rz(-0.83518121) q[0];
-sx q[0];
-rz(0.84575039) q[0];
-rz(2.3695144) q[1];
-sx q[1];
-rz(-0.83518121) q[1];
-sx q[1];
-rz(-2.2958423) q[1];
-cx q[1],q[0];
-rz(-pi/2) q[0];
-sx q[0];
-rz(pi/2) q[0];
-rz(pi/2) q[1];
-sx q[1];
-rz(7*pi/5) q[1];
-sx q[1];
-rz(5*pi/2) q[1];
-cx q[0],q[1];
-rz(-pi) q[0];
-sx q[0];
-rz(-pi/2) q[0];
-cx q[1],q[0];
-rz(-pi/2) q[0];
-sx q[0];
-rz(-2.6703538) q[0];
-rz(pi/2) q[1];
-sx q[1];
-rz(2.0420352) q[1];
-sx q[1];
-cx q[1],q[0];
-rz(-pi/2) q[0];
-sx q[0];
-rz(pi/2) q[0];
-rz(pi/2) q[1];
-sx q[1];
-rz(7*pi/5) q[1];
-sx q[1];
-rz(5*pi/2) q[1];
-cx q[0],q[1];
-rz(-pi) q[0];
-sx q[0];
-rz(-pi/2) q[0];
-cx q[1],q[0];
-rz(pi/2) q[0];
-sx q[0];
-rz(pi/2) q[1];
-cx q[1],q[0];
-rz(-pi/2) q[0];
-sx q[0];
-rz(pi/2) q[0];
-rz(pi/2) q[1];
-sx q[1];
-rz(7*pi/5) q[1];
-sx q[1];
-rz(5*pi/2) q[1];
-cx q[0],q[1];
-rz(-pi) q[0];
-sx q[0];
-rz(-pi/2) q[0];
-cx q[1],q[0];
-rz(-0.22689068) q[0];
-sx q[0];
-rz(-1.9869531) q[0];
-sx q[0];
-rz(-1.5226946) q[0];
-rz(2.914702) q[1];
-sx q[1];
-rz(-1.9869531) q[1];
-sx q[1];
-rz(-1.5226946) q[1];
-measure q[0] -> ans[0];
-measure q[1] -> ans[1];
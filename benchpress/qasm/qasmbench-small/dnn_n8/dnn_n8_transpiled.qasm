@@ -1,1428 +0,0 @@
-OPENQASM 2.0;
-include "qelib1.inc";
-qreg q[8];
-creg ans[8];
-rz(-0.79715247) q[0];
-sx q[0];
-rz(-0.55272686) q[0];
-sx q[0];
-rz(1.9734881) q[0];
-rz(-0.79715247) q[1];
-sx q[1];
-rz(-0.55272686) q[1];
-sx q[1];
-rz(-1.1681045) q[1];
-cx q[0],q[1];
-rz(pi/2) q[0];
-sx q[0];
-rz(7*pi/5) q[0];
-sx q[0];
-rz(5*pi/2) q[0];
-rz(-pi/2) q[1];
-sx q[1];
-rz(pi/2) q[1];
-cx q[1],q[0];
-rz(-pi) q[1];
-sx q[1];
-rz(-pi/2) q[1];
-cx q[0],q[1];
-rz(pi/2) q[0];
-sx q[0];
-rz(2.0420352) q[0];
-sx q[0];
-rz(-pi/2) q[1];
-sx q[1];
-rz(-2.6703538) q[1];
-cx q[0],q[1];
-rz(pi/2) q[0];
-sx q[0];
-rz(7*pi/5) q[0];
-sx q[0];
-rz(5*pi/2) q[0];
-rz(-pi/2) q[1];
-sx q[1];
-rz(pi/2) q[1];
-cx q[1],q[0];
-rz(-pi) q[1];
-sx q[1];
-rz(-pi/2) q[1];
-cx q[0],q[1];
-rz(pi/2) q[0];
-rz(pi/2) q[1];
-sx q[1];
-cx q[0],q[1];
-rz(pi/2) q[0];
-sx q[0];
-rz(7*pi/5) q[0];
-sx q[0];
-rz(5*pi/2) q[0];
-rz(-pi/2) q[1];
-sx q[1];
-rz(pi/2) q[1];
-cx q[1],q[0];
-rz(-pi) q[1];
-sx q[1];
-rz(-pi/2) q[1];
-cx q[0],q[1];
-rz(-0.77207828) q[0];
-sx q[0];
-rz(-0.83518121) q[0];
-sx q[0];
-rz(0.84575039) q[0];
-rz(2.3695144) q[1];
-sx q[1];
-rz(-0.83518121) q[1];
-sx q[1];
-rz(-2.2958423) q[1];
-rz(-0.79715247) q[2];
-sx q[2];
-rz(-0.55272686) q[2];
-sx q[2];
-rz(1.9734881) q[2];
-rz(-0.79715247) q[3];
-sx q[3];
-rz(-0.55272686) q[3];
-sx q[3];
-rz(-1.1681045) q[3];
-cx q[2],q[3];
-rz(pi/2) q[2];
-sx q[2];
-rz(7*pi/5) q[2];
-sx q[2];
-rz(5*pi/2) q[2];
-rz(-pi/2) q[3];
-sx q[3];
-rz(pi/2) q[3];
-cx q[3],q[2];
-rz(-pi) q[3];
-sx q[3];
-rz(-pi/2) q[3];
-cx q[2],q[3];
-rz(pi/2) q[2];
-sx q[2];
-rz(2.0420352) q[2];
-sx q[2];
-rz(-pi/2) q[3];
-sx q[3];
-rz(-2.6703538) q[3];
-cx q[2],q[3];
-rz(pi/2) q[2];
-sx q[2];
-rz(7*pi/5) q[2];
-sx q[2];
-rz(5*pi/2) q[2];
-rz(-pi/2) q[3];
-sx q[3];
-rz(pi/2) q[3];
-cx q[3],q[2];
-rz(-pi) q[3];
-sx q[3];
-rz(-pi/2) q[3];
-cx q[2],q[3];
-rz(pi/2) q[2];
-rz(pi/2) q[3];
-sx q[3];
-cx q[2],q[3];
-rz(pi/2) q[2];
-sx q[2];
-rz(7*pi/5) q[2];
-sx q[2];
-rz(5*pi/2) q[2];
-rz(-pi/2) q[3];
-sx q[3];
-rz(pi/2) q[3];
-cx q[3],q[2];
-rz(-pi) q[3];
-sx q[3];
-rz(-pi/2) q[3];
-cx q[2],q[3];
-rz(-0.77207828) q[2];
-sx q[2];
-rz(-0.83518121) q[2];
-sx q[2];
-rz(0.84575039) q[2];
-cx q[1],q[2];
-rz(pi/2) q[1];
-sx q[1];
-rz(7*pi/5) q[1];
-sx q[1];
-rz(5*pi/2) q[1];
-rz(-pi/2) q[2];
-sx q[2];
-rz(pi/2) q[2];
-cx q[2],q[1];
-rz(-pi) q[2];
-sx q[2];
-rz(-pi/2) q[2];
-cx q[1],q[2];
-rz(pi/2) q[1];
-sx q[1];
-rz(2.0420352) q[1];
-sx q[1];
-rz(-pi/2) q[2];
-sx q[2];
-rz(-2.6703538) q[2];
-cx q[1],q[2];
-rz(pi/2) q[1];
-sx q[1];
-rz(7*pi/5) q[1];
-sx q[1];
-rz(5*pi/2) q[1];
-rz(-pi/2) q[2];
-sx q[2];
-rz(pi/2) q[2];
-cx q[2],q[1];
-rz(-pi) q[2];
-sx q[2];
-rz(-pi/2) q[2];
-cx q[1],q[2];
-rz(pi/2) q[1];
-rz(pi/2) q[2];
-sx q[2];
-cx q[1],q[2];
-rz(pi/2) q[1];
-sx q[1];
-rz(7*pi/5) q[1];
-sx q[1];
-rz(5*pi/2) q[1];
-rz(-pi/2) q[2];
-sx q[2];
-rz(pi/2) q[2];
-cx q[2],q[1];
-rz(-pi) q[2];
-sx q[2];
-rz(-pi/2) q[2];
-cx q[1],q[2];
-rz(-0.19043683) q[1];
-sx q[1];
-rz(-1.9392357) q[1];
-sx q[1];
-rz(-1.6179568) q[1];
-rz(-2.1495275) q[2];
-sx q[2];
-rz(-2.2330665) q[2];
-sx q[2];
-rz(2.1090252) q[2];
-rz(2.3695144) q[3];
-sx q[3];
-rz(-0.83518121) q[3];
-sx q[3];
-rz(-2.2958423) q[3];
-rz(-0.79715247) q[4];
-sx q[4];
-rz(-0.55272686) q[4];
-sx q[4];
-rz(1.9734881) q[4];
-rz(-0.79715247) q[5];
-sx q[5];
-rz(-0.55272686) q[5];
-sx q[5];
-rz(-1.1681045) q[5];
-cx q[4],q[5];
-rz(pi/2) q[4];
-sx q[4];
-rz(7*pi/5) q[4];
-sx q[4];
-rz(5*pi/2) q[4];
-rz(-pi/2) q[5];
-sx q[5];
-rz(pi/2) q[5];
-cx q[5],q[4];
-rz(-pi) q[5];
-sx q[5];
-rz(-pi/2) q[5];
-cx q[4],q[5];
-rz(pi/2) q[4];
-sx q[4];
-rz(2.0420352) q[4];
-sx q[4];
-rz(-pi/2) q[5];
-sx q[5];
-rz(-2.6703538) q[5];
-cx q[4],q[5];
-rz(pi/2) q[4];
-sx q[4];
-rz(7*pi/5) q[4];
-sx q[4];
-rz(5*pi/2) q[4];
-rz(-pi/2) q[5];
-sx q[5];
-rz(pi/2) q[5];
-cx q[5],q[4];
-rz(-pi) q[5];
-sx q[5];
-rz(-pi/2) q[5];
-cx q[4],q[5];
-rz(pi/2) q[4];
-rz(pi/2) q[5];
-sx q[5];
-cx q[4],q[5];
-rz(pi/2) q[4];
-sx q[4];
-rz(7*pi/5) q[4];
-sx q[4];
-rz(5*pi/2) q[4];
-rz(-pi/2) q[5];
-sx q[5];
-rz(pi/2) q[5];
-cx q[5],q[4];
-rz(-pi) q[5];
-sx q[5];
-rz(-pi/2) q[5];
-cx q[4],q[5];
-rz(-0.77207828) q[4];
-sx q[4];
-rz(-0.83518121) q[4];
-sx q[4];
-rz(0.84575039) q[4];
-cx q[3],q[4];
-rz(pi/2) q[3];
-sx q[3];
-rz(7*pi/5) q[3];
-sx q[3];
-rz(5*pi/2) q[3];
-rz(-pi/2) q[4];
-sx q[4];
-rz(pi/2) q[4];
-cx q[4],q[3];
-rz(-pi) q[4];
-sx q[4];
-rz(-pi/2) q[4];
-cx q[3],q[4];
-rz(pi/2) q[3];
-sx q[3];
-rz(2.0420352) q[3];
-sx q[3];
-rz(-pi/2) q[4];
-sx q[4];
-rz(-2.6703538) q[4];
-cx q[3],q[4];
-rz(pi/2) q[3];
-sx q[3];
-rz(7*pi/5) q[3];
-sx q[3];
-rz(5*pi/2) q[3];
-rz(-pi/2) q[4];
-sx q[4];
-rz(pi/2) q[4];
-cx q[4],q[3];
-rz(-pi) q[4];
-sx q[4];
-rz(-pi/2) q[4];
-cx q[3],q[4];
-rz(pi/2) q[3];
-rz(pi/2) q[4];
-sx q[4];
-cx q[3],q[4];
-rz(pi/2) q[3];
-sx q[3];
-rz(7*pi/5) q[3];
-sx q[3];
-rz(5*pi/2) q[3];
-rz(-pi/2) q[4];
-sx q[4];
-rz(pi/2) q[4];
-cx q[4],q[3];
-rz(-pi) q[4];
-sx q[4];
-rz(-pi/2) q[4];
-cx q[3],q[4];
-rz(-0.19043683) q[3];
-sx q[3];
-rz(-1.9392357) q[3];
-sx q[3];
-rz(-1.6179568) q[3];
-cx q[2],q[3];
-rz(pi/2) q[2];
-sx q[2];
-rz(3.29867228626928) q[2];
-sx q[2];
-rz(5*pi/2) q[2];
-rz(-pi/2) q[3];
-sx q[3];
-rz(pi/2) q[3];
-cx q[3],q[2];
-rz(-pi) q[3];
-sx q[3];
-rz(-pi/2) q[3];
-cx q[2],q[3];
-rz(pi/2) q[2];
-sx q[2];
-rz(-2.984513) q[2];
-sx q[2];
-rz(pi/2) q[2];
-rz(0.68021498) q[3];
-sx q[3];
-rz(-1.1421643) q[3];
-sx q[3];
-rz(2.6670111) q[3];
-cx q[2],q[3];
-rz(pi/2) q[2];
-sx q[2];
-rz(3.29867228626928) q[2];
-sx q[2];
-rz(5*pi/2) q[2];
-rz(-pi/2) q[3];
-sx q[3];
-rz(pi/2) q[3];
-cx q[3],q[2];
-rz(-pi) q[3];
-sx q[3];
-rz(-pi/2) q[3];
-cx q[2],q[3];
-rz(-0.53138965) q[2];
-sx q[2];
-rz(-2.1798132) q[2];
-sx q[2];
-rz(-0.77184216) q[2];
-rz(pi/2) q[3];
-sx q[3];
-rz(-1.727876) q[3];
-sx q[3];
-rz(-pi/2) q[3];
-rz(-2.1495275) q[4];
-sx q[4];
-rz(-2.2330665) q[4];
-sx q[4];
-rz(2.1090252) q[4];
-rz(2.3695144) q[5];
-sx q[5];
-rz(-0.83518121) q[5];
-sx q[5];
-rz(-2.2958423) q[5];
-rz(-0.79715247) q[6];
-sx q[6];
-rz(-0.55272686) q[6];
-sx q[6];
-rz(1.9734881) q[6];
-rz(-0.79715247) q[7];
-sx q[7];
-rz(-0.55272686) q[7];
-sx q[7];
-rz(-1.1681045) q[7];
-cx q[6],q[7];
-rz(pi/2) q[6];
-sx q[6];
-rz(7*pi/5) q[6];
-sx q[6];
-rz(5*pi/2) q[6];
-rz(-pi/2) q[7];
-sx q[7];
-rz(pi/2) q[7];
-cx q[7],q[6];
-rz(-pi) q[7];
-sx q[7];
-rz(-pi/2) q[7];
-cx q[6],q[7];
-rz(pi/2) q[6];
-sx q[6];
-rz(2.0420352) q[6];
-sx q[6];
-rz(-pi/2) q[7];
-sx q[7];
-rz(-2.6703538) q[7];
-cx q[6],q[7];
-rz(pi/2) q[6];
-sx q[6];
-rz(7*pi/5) q[6];
-sx q[6];
-rz(5*pi/2) q[6];
-rz(-pi/2) q[7];
-sx q[7];
-rz(pi/2) q[7];
-cx q[7],q[6];
-rz(-pi) q[7];
-sx q[7];
-rz(-pi/2) q[7];
-cx q[6],q[7];
-rz(pi/2) q[6];
-rz(pi/2) q[7];
-sx q[7];
-cx q[6],q[7];
-rz(pi/2) q[6];
-sx q[6];
-rz(7*pi/5) q[6];
-sx q[6];
-rz(5*pi/2) q[6];
-rz(-pi/2) q[7];
-sx q[7];
-rz(pi/2) q[7];
-cx q[7],q[6];
-rz(-pi) q[7];
-sx q[7];
-rz(-pi/2) q[7];
-cx q[6],q[7];
-rz(-0.77207828) q[6];
-sx q[6];
-rz(-0.83518121) q[6];
-sx q[6];
-rz(0.84575039) q[6];
-cx q[5],q[6];
-rz(pi/2) q[5];
-sx q[5];
-rz(7*pi/5) q[5];
-sx q[5];
-rz(5*pi/2) q[5];
-rz(-pi/2) q[6];
-sx q[6];
-rz(pi/2) q[6];
-cx q[6],q[5];
-rz(-pi) q[6];
-sx q[6];
-rz(-pi/2) q[6];
-cx q[5],q[6];
-rz(pi/2) q[5];
-sx q[5];
-rz(2.0420352) q[5];
-sx q[5];
-rz(-pi/2) q[6];
-sx q[6];
-rz(-2.6703538) q[6];
-cx q[5],q[6];
-rz(pi/2) q[5];
-sx q[5];
-rz(7*pi/5) q[5];
-sx q[5];
-rz(5*pi/2) q[5];
-rz(-pi/2) q[6];
-sx q[6];
-rz(pi/2) q[6];
-cx q[6],q[5];
-rz(-pi) q[6];
-sx q[6];
-rz(-pi/2) q[6];
-cx q[5],q[6];
-rz(pi/2) q[5];
-rz(pi/2) q[6];
-sx q[6];
-cx q[5],q[6];
-rz(pi/2) q[5];
-sx q[5];
-rz(7*pi/5) q[5];
-sx q[5];
-rz(5*pi/2) q[5];
-rz(-pi/2) q[6];
-sx q[6];
-rz(pi/2) q[6];
-cx q[6],q[5];
-rz(-pi) q[6];
-sx q[6];
-rz(-pi/2) q[6];
-cx q[5],q[6];
-rz(-0.19043683) q[5];
-sx q[5];
-rz(-1.9392357) q[5];
-sx q[5];
-rz(-1.6179568) q[5];
-cx q[4],q[5];
-rz(pi/2) q[4];
-sx q[4];
-rz(3.29867228626928) q[4];
-sx q[4];
-rz(5*pi/2) q[4];
-rz(-pi/2) q[5];
-sx q[5];
-rz(pi/2) q[5];
-cx q[5],q[4];
-rz(-pi) q[5];
-sx q[5];
-rz(-pi/2) q[5];
-cx q[4],q[5];
-rz(pi/2) q[4];
-sx q[4];
-rz(-2.984513) q[4];
-sx q[4];
-rz(pi/2) q[4];
-rz(0.68021498) q[5];
-sx q[5];
-rz(-1.1421643) q[5];
-sx q[5];
-rz(2.6670111) q[5];
-cx q[4],q[5];
-rz(pi/2) q[4];
-sx q[4];
-rz(3.29867228626928) q[4];
-sx q[4];
-rz(5*pi/2) q[4];
-rz(-pi/2) q[5];
-sx q[5];
-rz(pi/2) q[5];
-cx q[5],q[4];
-rz(-pi) q[5];
-sx q[5];
-rz(-pi/2) q[5];
-cx q[4],q[5];
-rz(-0.53138965) q[4];
-sx q[4];
-rz(-2.1798132) q[4];
-sx q[4];
-rz(-0.77184216) q[4];
-cx q[3],q[4];
-rz(pi/2) q[3];
-sx q[3];
-rz(3.29867228626928) q[3];
-sx q[3];
-rz(5*pi/2) q[3];
-rz(-pi/2) q[4];
-sx q[4];
-rz(pi/2) q[4];
-cx q[4],q[3];
-rz(-pi) q[4];
-sx q[4];
-rz(-pi/2) q[4];
-cx q[3],q[4];
-rz(pi/2) q[3];
-sx q[3];
-rz(-2.984513) q[3];
-sx q[3];
-rz(pi/2) q[3];
-rz(0.68021498) q[4];
-sx q[4];
-rz(-1.1421643) q[4];
-sx q[4];
-rz(2.6670111) q[4];
-cx q[3],q[4];
-rz(pi/2) q[3];
-sx q[3];
-rz(3.29867228626928) q[3];
-sx q[3];
-rz(5*pi/2) q[3];
-rz(-pi/2) q[4];
-sx q[4];
-rz(pi/2) q[4];
-cx q[4],q[3];
-rz(-pi) q[4];
-sx q[4];
-rz(-pi/2) q[4];
-cx q[3],q[4];
-rz(-0.089094174) q[3];
-sx q[3];
-rz(-1.024559) q[3];
-sx q[3];
-rz(1.8031906) q[3];
-rz(-2.5935896) q[4];
-sx q[4];
-rz(-1.4946939) q[4];
-sx q[4];
-rz(0.27876616) q[4];
-rz(pi/2) q[5];
-sx q[5];
-rz(-1.727876) q[5];
-sx q[5];
-rz(-pi/2) q[5];
-rz(-2.1495275) q[6];
-sx q[6];
-rz(-2.2330665) q[6];
-sx q[6];
-rz(2.1090252) q[6];
-rz(2.3695144) q[7];
-sx q[7];
-rz(-0.83518121) q[7];
-sx q[7];
-rz(-2.2958423) q[7];
-cx q[7],q[0];
-rz(-pi/2) q[0];
-sx q[0];
-rz(pi/2) q[0];
-rz(pi/2) q[7];
-sx q[7];
-rz(7*pi/5) q[7];
-sx q[7];
-rz(5*pi/2) q[7];
-cx q[0],q[7];
-rz(-pi) q[0];
-sx q[0];
-rz(-pi/2) q[0];
-cx q[7],q[0];
-rz(-pi/2) q[0];
-sx q[0];
-rz(-2.6703538) q[0];
-rz(pi/2) q[7];
-sx q[7];
-rz(2.0420352) q[7];
-sx q[7];
-cx q[7],q[0];
-rz(-pi/2) q[0];
-sx q[0];
-rz(pi/2) q[0];
-rz(pi/2) q[7];
-sx q[7];
-rz(7*pi/5) q[7];
-sx q[7];
-rz(5*pi/2) q[7];
-cx q[0],q[7];
-rz(-pi) q[0];
-sx q[0];
-rz(-pi/2) q[0];
-cx q[7],q[0];
-rz(pi/2) q[0];
-sx q[0];
-rz(pi/2) q[7];
-cx q[7],q[0];
-rz(-pi/2) q[0];
-sx q[0];
-rz(pi/2) q[0];
-rz(pi/2) q[7];
-sx q[7];
-rz(7*pi/5) q[7];
-sx q[7];
-rz(5*pi/2) q[7];
-cx q[0],q[7];
-rz(-pi) q[0];
-sx q[0];
-rz(-pi/2) q[0];
-cx q[7],q[0];
-rz(-2.1495275) q[0];
-sx q[0];
-rz(-2.2330665) q[0];
-sx q[0];
-rz(2.1090252) q[0];
-cx q[0],q[1];
-rz(pi/2) q[0];
-sx q[0];
-rz(3.29867228626928) q[0];
-sx q[0];
-rz(5*pi/2) q[0];
-rz(-pi/2) q[1];
-sx q[1];
-rz(pi/2) q[1];
-cx q[1],q[0];
-rz(-pi) q[1];
-sx q[1];
-rz(-pi/2) q[1];
-cx q[0],q[1];
-rz(pi/2) q[0];
-sx q[0];
-rz(-2.984513) q[0];
-sx q[0];
-rz(pi/2) q[0];
-rz(0.68021498) q[1];
-sx q[1];
-rz(-1.1421643) q[1];
-sx q[1];
-rz(2.6670111) q[1];
-cx q[0],q[1];
-rz(pi/2) q[0];
-sx q[0];
-rz(3.29867228626928) q[0];
-sx q[0];
-rz(5*pi/2) q[0];
-rz(-pi/2) q[1];
-sx q[1];
-rz(pi/2) q[1];
-cx q[1],q[0];
-rz(-pi) q[1];
-sx q[1];
-rz(-pi/2) q[1];
-cx q[0],q[1];
-rz(-0.53138965) q[0];
-sx q[0];
-rz(-2.1798132) q[0];
-sx q[0];
-rz(-0.77184216) q[0];
-rz(pi/2) q[1];
-sx q[1];
-rz(-1.727876) q[1];
-sx q[1];
-rz(-pi/2) q[1];
-cx q[1],q[2];
-rz(pi/2) q[1];
-sx q[1];
-rz(3.29867228626928) q[1];
-sx q[1];
-rz(5*pi/2) q[1];
-rz(-pi/2) q[2];
-sx q[2];
-rz(pi/2) q[2];
-cx q[2],q[1];
-rz(-pi) q[2];
-sx q[2];
-rz(-pi/2) q[2];
-cx q[1],q[2];
-rz(pi/2) q[1];
-sx q[1];
-rz(-2.984513) q[1];
-sx q[1];
-rz(pi/2) q[1];
-rz(0.68021498) q[2];
-sx q[2];
-rz(-1.1421643) q[2];
-sx q[2];
-rz(2.6670111) q[2];
-cx q[1],q[2];
-rz(pi/2) q[1];
-sx q[1];
-rz(3.29867228626928) q[1];
-sx q[1];
-rz(5*pi/2) q[1];
-rz(-pi/2) q[2];
-sx q[2];
-rz(pi/2) q[2];
-cx q[2],q[1];
-rz(-pi) q[2];
-sx q[2];
-rz(-pi/2) q[2];
-cx q[1],q[2];
-rz(-0.089094174) q[1];
-sx q[1];
-rz(-1.024559) q[1];
-sx q[1];
-rz(1.8031906) q[1];
-rz(-2.5935896) q[2];
-sx q[2];
-rz(-1.4946939) q[2];
-sx q[2];
-rz(0.27876616) q[2];
-cx q[2],q[3];
-rz(pi/2) q[2];
-sx q[2];
-rz(7*pi/5) q[2];
-sx q[2];
-rz(5*pi/2) q[2];
-rz(-pi/2) q[3];
-sx q[3];
-rz(pi/2) q[3];
-cx q[3],q[2];
-rz(-pi) q[3];
-sx q[3];
-rz(-pi/2) q[3];
-cx q[2],q[3];
-rz(pi/2) q[2];
-sx q[2];
-rz(2.0420352) q[2];
-sx q[2];
-rz(-pi/2) q[3];
-sx q[3];
-rz(-2.6703538) q[3];
-cx q[2],q[3];
-rz(pi/2) q[2];
-sx q[2];
-rz(7*pi/5) q[2];
-sx q[2];
-rz(5*pi/2) q[2];
-rz(-pi/2) q[3];
-sx q[3];
-rz(pi/2) q[3];
-cx q[3],q[2];
-rz(-pi) q[3];
-sx q[3];
-rz(-pi/2) q[3];
-cx q[2],q[3];
-rz(pi/2) q[2];
-rz(pi/2) q[3];
-sx q[3];
-cx q[2],q[3];
-rz(pi/2) q[2];
-sx q[2];
-rz(7*pi/5) q[2];
-sx q[2];
-rz(5*pi/2) q[2];
-rz(-pi/2) q[3];
-sx q[3];
-rz(pi/2) q[3];
-cx q[3],q[2];
-rz(-pi) q[3];
-sx q[3];
-rz(-pi/2) q[3];
-cx q[2],q[3];
-rz(-0.77207828) q[2];
-sx q[2];
-rz(-0.83518121) q[2];
-sx q[2];
-rz(0.84575039) q[2];
-rz(2.3695144) q[3];
-sx q[3];
-rz(-0.83518121) q[3];
-sx q[3];
-rz(-2.2958423) q[3];
-rz(-0.19043683) q[7];
-sx q[7];
-rz(-1.9392357) q[7];
-sx q[7];
-rz(-1.6179568) q[7];
-cx q[6],q[7];
-rz(pi/2) q[6];
-sx q[6];
-rz(3.29867228626928) q[6];
-sx q[6];
-rz(5*pi/2) q[6];
-rz(-pi/2) q[7];
-sx q[7];
-rz(pi/2) q[7];
-cx q[7],q[6];
-rz(-pi) q[7];
-sx q[7];
-rz(-pi/2) q[7];
-cx q[6],q[7];
-rz(pi/2) q[6];
-sx q[6];
-rz(-2.984513) q[6];
-sx q[6];
-rz(pi/2) q[6];
-rz(0.68021498) q[7];
-sx q[7];
-rz(-1.1421643) q[7];
-sx q[7];
-rz(2.6670111) q[7];
-cx q[6],q[7];
-rz(pi/2) q[6];
-sx q[6];
-rz(3.29867228626928) q[6];
-sx q[6];
-rz(5*pi/2) q[6];
-rz(-pi/2) q[7];
-sx q[7];
-rz(pi/2) q[7];
-cx q[7],q[6];
-rz(-pi) q[7];
-sx q[7];
-rz(-pi/2) q[7];
-cx q[6],q[7];
-rz(-0.53138965) q[6];
-sx q[6];
-rz(-2.1798132) q[6];
-sx q[6];
-rz(-0.77184216) q[6];
-cx q[5],q[6];
-rz(pi/2) q[5];
-sx q[5];
-rz(3.29867228626928) q[5];
-sx q[5];
-rz(5*pi/2) q[5];
-rz(-pi/2) q[6];
-sx q[6];
-rz(pi/2) q[6];
-cx q[6],q[5];
-rz(-pi) q[6];
-sx q[6];
-rz(-pi/2) q[6];
-cx q[5],q[6];
-rz(pi/2) q[5];
-sx q[5];
-rz(-2.984513) q[5];
-sx q[5];
-rz(pi/2) q[5];
-rz(0.68021498) q[6];
-sx q[6];
-rz(-1.1421643) q[6];
-sx q[6];
-rz(2.6670111) q[6];
-cx q[5],q[6];
-rz(pi/2) q[5];
-sx q[5];
-rz(3.29867228626928) q[5];
-sx q[5];
-rz(5*pi/2) q[5];
-rz(-pi/2) q[6];
-sx q[6];
-rz(pi/2) q[6];
-cx q[6],q[5];
-rz(-pi) q[6];
-sx q[6];
-rz(-pi/2) q[6];
-cx q[5],q[6];
-rz(-0.089094174) q[5];
-sx q[5];
-rz(-1.024559) q[5];
-sx q[5];
-rz(1.8031906) q[5];
-cx q[4],q[5];
-rz(pi/2) q[4];
-sx q[4];
-rz(7*pi/5) q[4];
-sx q[4];
-rz(5*pi/2) q[4];
-rz(-pi/2) q[5];
-sx q[5];
-rz(pi/2) q[5];
-cx q[5],q[4];
-rz(-pi) q[5];
-sx q[5];
-rz(-pi/2) q[5];
-cx q[4],q[5];
-rz(pi/2) q[4];
-sx q[4];
-rz(2.0420352) q[4];
-sx q[4];
-rz(-pi/2) q[5];
-sx q[5];
-rz(-2.6703538) q[5];
-cx q[4],q[5];
-rz(pi/2) q[4];
-sx q[4];
-rz(7*pi/5) q[4];
-sx q[4];
-rz(5*pi/2) q[4];
-rz(-pi/2) q[5];
-sx q[5];
-rz(pi/2) q[5];
-cx q[5],q[4];
-rz(-pi) q[5];
-sx q[5];
-rz(-pi/2) q[5];
-cx q[4],q[5];
-rz(pi/2) q[4];
-rz(pi/2) q[5];
-sx q[5];
-cx q[4],q[5];
-rz(pi/2) q[4];
-sx q[4];
-rz(7*pi/5) q[4];
-sx q[4];
-rz(5*pi/2) q[4];
-rz(-pi/2) q[5];
-sx q[5];
-rz(pi/2) q[5];
-cx q[5],q[4];
-rz(-pi) q[5];
-sx q[5];
-rz(-pi/2) q[5];
-cx q[4],q[5];
-rz(-0.77207828) q[4];
-sx q[4];
-rz(-0.83518121) q[4];
-sx q[4];
-rz(0.84575039) q[4];
-cx q[3],q[4];
-rz(pi/2) q[3];
-sx q[3];
-rz(7*pi/5) q[3];
-sx q[3];
-rz(5*pi/2) q[3];
-rz(-pi/2) q[4];
-sx q[4];
-rz(pi/2) q[4];
-cx q[4],q[3];
-rz(-pi) q[4];
-sx q[4];
-rz(-pi/2) q[4];
-cx q[3],q[4];
-rz(pi/2) q[3];
-sx q[3];
-rz(2.0420352) q[3];
-sx q[3];
-rz(-pi/2) q[4];
-sx q[4];
-rz(-2.6703538) q[4];
-cx q[3],q[4];
-rz(pi/2) q[3];
-sx q[3];
-rz(7*pi/5) q[3];
-sx q[3];
-rz(5*pi/2) q[3];
-rz(-pi/2) q[4];
-sx q[4];
-rz(pi/2) q[4];
-cx q[4],q[3];
-rz(-pi) q[4];
-sx q[4];
-rz(-pi/2) q[4];
-cx q[3],q[4];
-rz(pi/2) q[3];
-rz(pi/2) q[4];
-sx q[4];
-cx q[3],q[4];
-rz(pi/2) q[3];
-sx q[3];
-rz(7*pi/5) q[3];
-sx q[3];
-rz(5*pi/2) q[3];
-rz(-pi/2) q[4];
-sx q[4];
-rz(pi/2) q[4];
-cx q[4],q[3];
-rz(-pi) q[4];
-sx q[4];
-rz(-pi/2) q[4];
-cx q[3],q[4];
-rz(2.914702) q[3];
-sx q[3];
-rz(-1.9869531) q[3];
-sx q[3];
-rz(-1.5226946) q[3];
-rz(-0.22689068) q[4];
-sx q[4];
-rz(-1.9869531) q[4];
-sx q[4];
-rz(-1.5226946) q[4];
-rz(2.3695144) q[5];
-sx q[5];
-rz(-0.83518121) q[5];
-sx q[5];
-rz(-2.2958423) q[5];
-rz(-2.5935896) q[6];
-sx q[6];
-rz(-1.4946939) q[6];
-sx q[6];
-rz(0.27876616) q[6];
-rz(pi/2) q[7];
-sx q[7];
-rz(-1.727876) q[7];
-sx q[7];
-rz(-pi/2) q[7];
-cx q[7],q[0];
-rz(-pi/2) q[0];
-sx q[0];
-rz(pi/2) q[0];
-rz(pi/2) q[7];
-sx q[7];
-rz(3.29867228626928) q[7];
-sx q[7];
-rz(5*pi/2) q[7];
-cx q[0],q[7];
-rz(-pi) q[0];
-sx q[0];
-rz(-pi/2) q[0];
-cx q[7],q[0];
-rz(0.68021498) q[0];
-sx q[0];
-rz(-1.1421643) q[0];
-sx q[0];
-rz(2.6670111) q[0];
-rz(pi/2) q[7];
-sx q[7];
-rz(-2.984513) q[7];
-sx q[7];
-rz(pi/2) q[7];
-cx q[7],q[0];
-rz(-pi/2) q[0];
-sx q[0];
-rz(pi/2) q[0];
-rz(pi/2) q[7];
-sx q[7];
-rz(3.29867228626928) q[7];
-sx q[7];
-rz(5*pi/2) q[7];
-cx q[0],q[7];
-rz(-pi) q[0];
-sx q[0];
-rz(-pi/2) q[0];
-cx q[7],q[0];
-rz(-2.5935896) q[0];
-sx q[0];
-rz(-1.4946939) q[0];
-sx q[0];
-rz(0.27876616) q[0];
-cx q[0],q[1];
-rz(pi/2) q[0];
-sx q[0];
-rz(7*pi/5) q[0];
-sx q[0];
-rz(5*pi/2) q[0];
-rz(-pi/2) q[1];
-sx q[1];
-rz(pi/2) q[1];
-cx q[1],q[0];
-rz(-pi) q[1];
-sx q[1];
-rz(-pi/2) q[1];
-cx q[0],q[1];
-rz(pi/2) q[0];
-sx q[0];
-rz(2.0420352) q[0];
-sx q[0];
-rz(-pi/2) q[1];
-sx q[1];
-rz(-2.6703538) q[1];
-cx q[0],q[1];
-rz(pi/2) q[0];
-sx q[0];
-rz(7*pi/5) q[0];
-sx q[0];
-rz(5*pi/2) q[0];
-rz(-pi/2) q[1];
-sx q[1];
-rz(pi/2) q[1];
-cx q[1],q[0];
-rz(-pi) q[1];
-sx q[1];
-rz(-pi/2) q[1];
-cx q[0],q[1];
-rz(pi/2) q[0];
-rz(pi/2) q[1];
-sx q[1];
-cx q[0],q[1];
-rz(pi/2) q[0];
-sx q[0];
-rz(7*pi/5) q[0];
-sx q[0];
-rz(5*pi/2) q[0];
-rz(-pi/2) q[1];
-sx q[1];
-rz(pi/2) q[1];
-cx q[1],q[0];
-rz(-pi) q[1];
-sx q[1];
-rz(-pi/2) q[1];
-cx q[0],q[1];
-rz(-0.77207828) q[0];
-sx q[0];
-rz(-0.83518121) q[0];
-sx q[0];
-rz(0.84575039) q[0];
-rz(2.3695144) q[1];
-sx q[1];
-rz(-0.83518121) q[1];
-sx q[1];
-rz(-2.2958423) q[1];
-cx q[1],q[2];
-rz(pi/2) q[1];
-sx q[1];
-rz(7*pi/5) q[1];
-sx q[1];
-rz(5*pi/2) q[1];
-rz(-pi/2) q[2];
-sx q[2];
-rz(pi/2) q[2];
-cx q[2],q[1];
-rz(-pi) q[2];
-sx q[2];
-rz(-pi/2) q[2];
-cx q[1],q[2];
-rz(pi/2) q[1];
-sx q[1];
-rz(2.0420352) q[1];
-sx q[1];
-rz(-pi/2) q[2];
-sx q[2];
-rz(-2.6703538) q[2];
-cx q[1],q[2];
-rz(pi/2) q[1];
-sx q[1];
-rz(7*pi/5) q[1];
-sx q[1];
-rz(5*pi/2) q[1];
-rz(-pi/2) q[2];
-sx q[2];
-rz(pi/2) q[2];
-cx q[2],q[1];
-rz(-pi) q[2];
-sx q[2];
-rz(-pi/2) q[2];
-cx q[1],q[2];
-rz(pi/2) q[1];
-rz(pi/2) q[2];
-sx q[2];
-cx q[1],q[2];
-rz(pi/2) q[1];
-sx q[1];
-rz(7*pi/5) q[1];
-sx q[1];
-rz(5*pi/2) q[1];
-rz(-pi/2) q[2];
-sx q[2];
-rz(pi/2) q[2];
-cx q[2],q[1];
-rz(-pi) q[2];
-sx q[2];
-rz(-pi/2) q[2];
-cx q[1],q[2];
-rz(2.914702) q[1];
-sx q[1];
-rz(-1.9869531) q[1];
-sx q[1];
-rz(-1.5226946) q[1];
-rz(-0.22689068) q[2];
-sx q[2];
-rz(-1.9869531) q[2];
-sx q[2];
-rz(-1.5226946) q[2];
-rz(-0.089094174) q[7];
-sx q[7];
-rz(-1.024559) q[7];
-sx q[7];
-rz(1.8031906) q[7];
-cx q[6],q[7];
-rz(pi/2) q[6];
-sx q[6];
-rz(7*pi/5) q[6];
-sx q[6];
-rz(5*pi/2) q[6];
-rz(-pi/2) q[7];
-sx q[7];
-rz(pi/2) q[7];
-cx q[7],q[6];
-rz(-pi) q[7];
-sx q[7];
-rz(-pi/2) q[7];
-cx q[6],q[7];
-rz(pi/2) q[6];
-sx q[6];
-rz(2.0420352) q[6];
-sx q[6];
-rz(-pi/2) q[7];
-sx q[7];
-rz(-2.6703538) q[7];
-cx q[6],q[7];
-rz(pi/2) q[6];
-sx q[6];
-rz(7*pi/5) q[6];
-sx q[6];
-rz(5*pi/2) q[6];
-rz(-pi/2) q[7];
-sx q[7];
-rz(pi/2) q[7];
-cx q[7],q[6];
-rz(-pi) q[7];
-sx q[7];
-rz(-pi/2) q[7];
-cx q[6],q[7];
-rz(pi/2) q[6];
-rz(pi/2) q[7];
-sx q[7];
-cx q[6],q[7];
-rz(pi/2) q[6];
-sx q[6];
-rz(7*pi/5) q[6];
-sx q[6];
-rz(5*pi/2) q[6];
-rz(-pi/2) q[7];
-sx q[7];
-rz(pi/2) q[7];
-cx q[7],q[6];
-rz(-pi) q[7];
-sx q[7];
-rz(-pi/2) q[7];
-cx q[6],q[7];
-rz(-0.77207828) q[6];
-sx q[6];
-rz(-0.83518121) q[6];
-sx q[6];
-rz(0.84575039) q[6];
-cx q[5],q[6];
-rz(pi/2) q[5];
-sx q[5];
-rz(7*pi/5) q[5];
-sx q[5];
-rz(5*pi/2) q[5];
-rz(-pi/2) q[6];
-sx q[6];
-rz(pi/2) q[6];
-cx q[6],q[5];
-rz(-pi) q[6];
-sx q[6];
-rz(-pi/2) q[6];
-cx q[5],q[6];
-rz(pi/2) q[5];
-sx q[5];
-rz(2.0420352) q[5];
-sx q[5];
-rz(-pi/2) q[6];
-sx q[6];
-rz(-2.6703538) q[6];
-cx q[5],q[6];
-rz(pi/2) q[5];
-sx q[5];
-rz(7*pi/5) q[5];
-sx q[5];
-rz(5*pi/2) q[5];
-rz(-pi/2) q[6];
-sx q[6];
-rz(pi/2) q[6];
-cx q[6],q[5];
-rz(-pi) q[6];
-sx q[6];
-rz(-pi/2) q[6];
-cx q[5],q[6];
-rz(pi/2) q[5];
-rz(pi/2) q[6];
-sx q[6];
-cx q[5],q[6];
-rz(pi/2) q[5];
-sx q[5];
-rz(7*pi/5) q[5];
-sx q[5];
-rz(5*pi/2) q[5];
-rz(-pi/2) q[6];
-sx q[6];
-rz(pi/2) q[6];
-cx q[6],q[5];
-rz(-pi) q[6];
-sx q[6];
-rz(-pi/2) q[6];
-cx q[5],q[6];
-rz(2.914702) q[5];
-sx q[5];
-rz(-1.9869531) q[5];
-sx q[5];
-rz(-1.5226946) q[5];
-rz(-0.22689068) q[6];
-sx q[6];
-rz(-1.9869531) q[6];
-sx q[6];
-rz(-1.5226946) q[6];
-rz(2.3695144) q[7];
-sx q[7];
-rz(-0.83518121) q[7];
-sx q[7];
-rz(-2.2958423) q[7];
-cx q[7],q[0];
-rz(-pi/2) q[0];
-sx q[0];
-rz(pi/2) q[0];
-rz(pi/2) q[7];
-sx q[7];
-rz(7*pi/5) q[7];
-sx q[7];
-rz(5*pi/2) q[7];
-cx q[0],q[7];
-rz(-pi) q[0];
-sx q[0];
-rz(-pi/2) q[0];
-cx q[7],q[0];
-rz(-pi/2) q[0];
-sx q[0];
-rz(-2.6703538) q[0];
-rz(pi/2) q[7];
-sx q[7];
-rz(2.0420352) q[7];
-sx q[7];
-cx q[7],q[0];
-rz(-pi/2) q[0];
-sx q[0];
-rz(pi/2) q[0];
-rz(pi/2) q[7];
-sx q[7];
-rz(7*pi/5) q[7];
-sx q[7];
-rz(5*pi/2) q[7];
-cx q[0],q[7];
-rz(-pi) q[0];
-sx q[0];
-rz(-pi/2) q[0];
-cx q[7],q[0];
-rz(pi/2) q[0];
-sx q[0];
-rz(pi/2) q[7];
-cx q[7],q[0];
-rz(-pi/2) q[0];
-sx q[0];
-rz(pi/2) q[0];
-rz(pi/2) q[7];
-sx q[7];
-rz(7*pi/5) q[7];
-sx q[7];
-rz(5*pi/2) q[7];
-cx q[0],q[7];
-rz(-pi) q[0];
-sx q[0];
-rz(-pi/2) q[0];
-cx q[7],q[0];
-rz(-0.22689068) q[0];
-sx q[0];
-rz(-1.9869531) q[0];
-sx q[0];
-rz(-1.5226946) q[0];
-rz(2.914702) q[7];
-sx q[7];
-rz(-1.9869531) q[7];
-sx q[7];
-rz(-1.5226946) q[7];
-measure q[0] -> ans[0];
-measure q[1] -> ans[1];
-measure q[2] -> ans[2];
-measure q[3] -> ans[3];
-measure q[4] -> ans[4];
-measure q[5] -> ans[5];
-measure q[6] -> ans[6];
-measure q[7] -> ans[7];
@@ -1,1004 +0,0 @@
-OPENQASM 2.0;
-include "qelib1.inc";
-qreg q0[1];
-qreg q1[5];
-qreg q2[1];
-creg meas[7];
-x q0[0];
-rz(-pi/2) q0[0];
-rz(pi/2) q1[0];
-sx q1[0];
-rz(2.2390639) q1[0];
-cx q1[0],q0[0];
-rz(2.4733252) q0[0];
-sx q0[0];
-rz(-2.1307216) q0[0];
-sx q0[0];
-cx q1[0],q0[0];
-sx q0[0];
-rz(-2.1307216) q0[0];
-sx q0[0];
-rz(-2.4733252) q0[0];
-rz(-1.7108829) q1[0];
-rz(pi/2) q1[1];
-sx q1[1];
-rz(2.2390639) q1[1];
-cx q1[1],q0[0];
-rz(2.4733252) q0[0];
-sx q0[0];
-rz(-2.1307216) q0[0];
-sx q0[0];
-cx q1[1],q0[0];
-sx q0[0];
-rz(-2.1307216) q0[0];
-sx q0[0];
-rz(-2.4733252) q0[0];
-rz(0.6682675) q1[1];
-cx q1[1],q0[0];
-rz(2.4733252) q0[0];
-sx q0[0];
-rz(-2.1307216) q0[0];
-sx q0[0];
-cx q1[1],q0[0];
-sx q0[0];
-rz(-2.1307216) q0[0];
-sx q0[0];
-rz(-2.4733252) q0[0];
-rz(-3.4217658) q1[1];
-rz(pi/2) q1[2];
-sx q1[2];
-rz(2.2390639) q1[2];
-cx q1[2],q0[0];
-rz(2.4733252) q0[0];
-sx q0[0];
-rz(-2.1307216) q0[0];
-sx q0[0];
-cx q1[2],q0[0];
-sx q0[0];
-rz(-2.1307216) q0[0];
-sx q0[0];
-rz(-2.4733252) q0[0];
-rz(0.6682675) q1[2];
-cx q1[2],q0[0];
-rz(2.4733252) q0[0];
-sx q0[0];
-rz(-2.1307216) q0[0];
-sx q0[0];
-cx q1[2],q0[0];
-sx q0[0];
-rz(-2.1307216) q0[0];
-sx q0[0];
-rz(-2.4733252) q0[0];
-rz(0.6682675) q1[2];
-cx q1[2],q0[0];
-rz(2.4733252) q0[0];
-sx q0[0];
-rz(-2.1307216) q0[0];
-sx q0[0];
-cx q1[2],q0[0];
-sx q0[0];
-rz(-2.1307216) q0[0];
-sx q0[0];
-rz(-2.4733252) q0[0];
-rz(0.6682675) q1[2];
-cx q1[2],q0[0];
-rz(2.4733252) q0[0];
-sx q0[0];
-rz(-2.1307216) q0[0];
-sx q0[0];
-cx q1[2],q0[0];
-sx q0[0];
-rz(-2.1307216) q0[0];
-sx q0[0];
-rz(-2.4733252) q0[0];
-rz(-0.56034639) q1[2];
-rz(pi/2) q1[3];
-sx q1[3];
-rz(2.2390639) q1[3];
-cx q1[3],q0[0];
-rz(2.4733252) q0[0];
-sx q0[0];
-rz(-2.1307216) q0[0];
-sx q0[0];
-cx q1[3],q0[0];
-sx q0[0];
-rz(-2.1307216) q0[0];
-sx q0[0];
-rz(-2.4733252) q0[0];
-rz(0.6682675) q1[3];
-cx q1[3],q0[0];
-rz(2.4733252) q0[0];
-sx q0[0];
-rz(-2.1307216) q0[0];
-sx q0[0];
-cx q1[3],q0[0];
-sx q0[0];
-rz(-2.1307216) q0[0];
-sx q0[0];
-rz(-2.4733252) q0[0];
-rz(0.6682675) q1[3];
-cx q1[3],q0[0];
-rz(2.4733252) q0[0];
-sx q0[0];
-rz(-2.1307216) q0[0];
-sx q0[0];
-cx q1[3],q0[0];
-sx q0[0];
-rz(-2.1307216) q0[0];
-sx q0[0];
-rz(-2.4733252) q0[0];
-rz(0.6682675) q1[3];
-cx q1[3],q0[0];
-rz(2.4733252) q0[0];
-sx q0[0];
-rz(-2.1307216) q0[0];
-sx q0[0];
-cx q1[3],q0[0];
-sx q0[0];
-rz(-2.1307216) q0[0];
-sx q0[0];
-rz(-2.4733252) q0[0];
-rz(0.6682675) q1[3];
-cx q1[3],q0[0];
-rz(2.4733252) q0[0];
-sx q0[0];
-rz(-2.1307216) q0[0];
-sx q0[0];
-cx q1[3],q0[0];
-sx q0[0];
-rz(-2.1307216) q0[0];
-sx q0[0];
-rz(-2.4733252) q0[0];
-rz(0.6682675) q1[3];
-cx q1[3],q0[0];
-rz(2.4733252) q0[0];
-sx q0[0];
-rz(-2.1307216) q0[0];
-sx q0[0];
-cx q1[3],q0[0];
-sx q0[0];
-rz(-2.1307216) q0[0];
-sx q0[0];
-rz(-2.4733252) q0[0];
-rz(0.6682675) q1[3];
-cx q1[3],q0[0];
-rz(2.4733252) q0[0];
-sx q0[0];
-rz(-2.1307216) q0[0];
-sx q0[0];
-cx q1[3],q0[0];
-sx q0[0];
-rz(-2.1307216) q0[0];
-sx q0[0];
-rz(-2.4733252) q0[0];
-rz(0.6682675) q1[3];
-cx q1[3],q0[0];
-rz(2.4733252) q0[0];
-sx q0[0];
-rz(-2.1307216) q0[0];
-sx q0[0];
-cx q1[3],q0[0];
-sx q0[0];
-rz(-2.1307216) q0[0];
-sx q0[0];
-rz(-2.4733252) q0[0];
-rz(-1.1206928) q1[3];
-rz(pi/2) q1[4];
-sx q1[4];
-rz(2.2390639) q1[4];
-cx q1[4],q0[0];
-rz(2.4733252) q0[0];
-sx q0[0];
-rz(-2.1307216) q0[0];
-sx q0[0];
-cx q1[4],q0[0];
-sx q0[0];
-rz(-2.1307216) q0[0];
-sx q0[0];
-rz(-2.4733252) q0[0];
-rz(0.6682675) q1[4];
-cx q1[4],q0[0];
-rz(2.4733252) q0[0];
-sx q0[0];
-rz(-2.1307216) q0[0];
-sx q0[0];
-cx q1[4],q0[0];
-sx q0[0];
-rz(-2.1307216) q0[0];
-sx q0[0];
-rz(-2.4733252) q0[0];
-rz(0.6682675) q1[4];
-cx q1[4],q0[0];
-rz(2.4733252) q0[0];
-sx q0[0];
-rz(-2.1307216) q0[0];
-sx q0[0];
-cx q1[4],q0[0];
-sx q0[0];
-rz(-2.1307216) q0[0];
-sx q0[0];
-rz(-2.4733252) q0[0];
-rz(0.6682675) q1[4];
-cx q1[4],q0[0];
-rz(2.4733252) q0[0];
-sx q0[0];
-rz(-2.1307216) q0[0];
-sx q0[0];
-cx q1[4],q0[0];
-sx q0[0];
-rz(-2.1307216) q0[0];
-sx q0[0];
-rz(-2.4733252) q0[0];
-rz(0.6682675) q1[4];
-cx q1[4],q0[0];
-rz(2.4733252) q0[0];
-sx q0[0];
-rz(-2.1307216) q0[0];
-sx q0[0];
-cx q1[4],q0[0];
-sx q0[0];
-rz(-2.1307216) q0[0];
-sx q0[0];
-rz(-2.4733252) q0[0];
-rz(0.6682675) q1[4];
-cx q1[4],q0[0];
-rz(2.4733252) q0[0];
-sx q0[0];
-rz(-2.1307216) q0[0];
-sx q0[0];
-cx q1[4],q0[0];
-sx q0[0];
-rz(-2.1307216) q0[0];
-sx q0[0];
-rz(-2.4733252) q0[0];
-rz(0.6682675) q1[4];
-cx q1[4],q0[0];
-rz(2.4733252) q0[0];
-sx q0[0];
-rz(-2.1307216) q0[0];
-sx q0[0];
-cx q1[4],q0[0];
-sx q0[0];
-rz(-2.1307216) q0[0];
-sx q0[0];
-rz(-2.4733252) q0[0];
-rz(0.6682675) q1[4];
-cx q1[4],q0[0];
-rz(2.4733252) q0[0];
-sx q0[0];
-rz(-2.1307216) q0[0];
-sx q0[0];
-cx q1[4],q0[0];
-sx q0[0];
-rz(-2.1307216) q0[0];
-sx q0[0];
-rz(-2.4733252) q0[0];
-rz(0.6682675) q1[4];
-cx q1[4],q0[0];
-rz(2.4733252) q0[0];
-sx q0[0];
-rz(-2.1307216) q0[0];
-sx q0[0];
-cx q1[4],q0[0];
-sx q0[0];
-rz(-2.1307216) q0[0];
-sx q0[0];
-rz(-2.4733252) q0[0];
-rz(0.6682675) q1[4];
-cx q1[4],q0[0];
-rz(2.4733252) q0[0];
-sx q0[0];
-rz(-2.1307216) q0[0];
-sx q0[0];
-cx q1[4],q0[0];
-sx q0[0];
-rz(-2.1307216) q0[0];
-sx q0[0];
-rz(-2.4733252) q0[0];
-rz(0.6682675) q1[4];
-cx q1[4],q0[0];
-rz(2.4733252) q0[0];
-sx q0[0];
-rz(-2.1307216) q0[0];
-sx q0[0];
-cx q1[4],q0[0];
-sx q0[0];
-rz(-2.1307216) q0[0];
-sx q0[0];
-rz(-2.4733252) q0[0];
-rz(0.6682675) q1[4];
-cx q1[4],q0[0];
-rz(2.4733252) q0[0];
-sx q0[0];
-rz(-2.1307216) q0[0];
-sx q0[0];
-cx q1[4],q0[0];
-sx q0[0];
-rz(-2.1307216) q0[0];
-sx q0[0];
-rz(-2.4733252) q0[0];
-rz(0.6682675) q1[4];
-cx q1[4],q0[0];
-rz(2.4733252) q0[0];
-sx q0[0];
-rz(-2.1307216) q0[0];
-sx q0[0];
-cx q1[4],q0[0];
-sx q0[0];
-rz(-2.1307216) q0[0];
-sx q0[0];
-rz(-2.4733252) q0[0];
-rz(0.6682675) q1[4];
-cx q1[4],q0[0];
-rz(2.4733252) q0[0];
-sx q0[0];
-rz(-2.1307216) q0[0];
-sx q0[0];
-cx q1[4],q0[0];
-sx q0[0];
-rz(-2.1307216) q0[0];
-sx q0[0];
-rz(-2.4733252) q0[0];
-rz(0.6682675) q1[4];
-cx q1[4],q0[0];
-rz(2.4733252) q0[0];
-sx q0[0];
-rz(-2.1307216) q0[0];
-sx q0[0];
-cx q1[4],q0[0];
-sx q0[0];
-rz(-2.1307216) q0[0];
-sx q0[0];
-rz(-2.4733252) q0[0];
-rz(0.6682675) q1[4];
-cx q1[4],q0[0];
-rz(2.4733252) q0[0];
-sx q0[0];
-rz(-2.1307216) q0[0];
-sx q0[0];
-cx q1[4],q0[0];
-sx q0[0];
-rz(-2.1307216) q0[0];
-sx q0[0];
-rz(0.66826745) q0[0];
-rz(0.90020707) q1[4];
-sx q1[4];
-rz(pi/2) q1[4];
-cx q1[3],q1[4];
-rz(pi/4) q1[4];
-cx q1[3],q1[4];
-rz(pi/2) q1[3];
-sx q1[3];
-rz(pi/2) q1[3];
-rz(-pi/4) q1[4];
-cx q1[2],q1[4];
-rz(pi/8) q1[4];
-cx q1[2],q1[4];
-rz(-pi/4) q1[2];
-cx q1[2],q1[3];
-rz(pi/4) q1[3];
-cx q1[2],q1[3];
-rz(pi/2) q1[2];
-sx q1[2];
-rz(pi/2) q1[2];
-rz(-pi/4) q1[3];
-rz(-pi/8) q1[4];
-cx q1[1],q1[4];
-rz(pi/16) q1[4];
-cx q1[1],q1[4];
-rz(-pi/8) q1[1];
-cx q1[1],q1[3];
-rz(pi/8) q1[3];
-cx q1[1],q1[3];
-rz(-pi/4) q1[1];
-cx q1[1],q1[2];
-rz(pi/4) q1[2];
-cx q1[1],q1[2];
-rz(pi/2) q1[1];
-sx q1[1];
-rz(pi/2) q1[1];
-rz(-pi/4) q1[2];
-rz(-pi/8) q1[3];
-rz(-pi/16) q1[4];
-cx q1[0],q1[4];
-rz(pi/32) q1[4];
-cx q1[0],q1[4];
-rz(-pi/16) q1[0];
-cx q1[0],q1[3];
-rz(pi/16) q1[3];
-cx q1[0],q1[3];
-rz(-pi/8) q1[0];
-cx q1[0],q1[2];
-rz(pi/8) q1[2];
-cx q1[0],q1[2];
-rz(-pi/4) q1[0];
-cx q1[0],q1[1];
-rz(pi/4) q1[1];
-cx q1[0],q1[1];
-rz(pi/2) q1[0];
-sx q1[0];
-rz(pi/2) q1[0];
-rz(-pi/4) q1[1];
-rz(-pi/8) q1[2];
-rz(-pi/16) q1[3];
-rz(-pi/32) q1[4];
-rz(-pi) q2[0];
-sx q2[0];
-rz(2.8519145) q2[0];
-sx q2[0];
-cx q1[4],q2[0];
-sx q2[0];
-rz(3.0627856) q2[0];
-sx q2[0];
-rz(-pi) q2[0];
-cx q1[3],q2[0];
-sx q2[0];
-rz(3.0341386) q2[0];
-sx q2[0];
-rz(-pi) q2[0];
-cx q1[4],q2[0];
-rz(-pi) q2[0];
-sx q2[0];
-rz(3.0821596) q2[0];
-sx q2[0];
-cx q1[2],q2[0];
-rz(-pi) q2[0];
-sx q2[0];
-rz(3.1045059) q2[0];
-sx q2[0];
-cx q1[4],q2[0];
-sx q2[0];
-rz(3.0304584) q2[0];
-sx q2[0];
-rz(-pi) q2[0];
-cx q1[3],q2[0];
-sx q2[0];
-rz(3.0511235) q2[0];
-sx q2[0];
-rz(-pi) q2[0];
-cx q1[4],q2[0];
-rz(-pi) q2[0];
-sx q2[0];
-rz(3.0251524) q2[0];
-sx q2[0];
-cx q1[1],q2[0];
-rz(-pi) q2[0];
-sx q2[0];
-rz(3.0439808) q2[0];
-sx q2[0];
-cx q1[4],q2[0];
-sx q2[0];
-rz(3.0495359) q2[0];
-sx q2[0];
-rz(-pi) q2[0];
-cx q1[3],q2[0];
-sx q2[0];
-rz(3.0300481) q2[0];
-sx q2[0];
-rz(-pi) q2[0];
-cx q1[4],q2[0];
-rz(-pi) q2[0];
-sx q2[0];
-rz(3.1076068) q2[0];
-sx q2[0];
-cx q1[2],q2[0];
-rz(-pi) q2[0];
-sx q2[0];
-rz(3.0919686) q2[0];
-sx q2[0];
-cx q1[4],q2[0];
-sx q2[0];
-rz(3.0332747) q2[0];
-sx q2[0];
-rz(-pi) q2[0];
-cx q1[3],q2[0];
-sx q2[0];
-rz(3.0578199) q2[0];
-sx q2[0];
-rz(-pi) q2[0];
-cx q1[4],q2[0];
-rz(-pi) q2[0];
-sx q2[0];
-rz(2.9793553) q2[0];
-sx q2[0];
-cx q1[0],q2[0];
-rz(-pi) q2[0];
-sx q2[0];
-rz(2.99476) q2[0];
-sx q2[0];
-cx q1[4],q2[0];
-sx q2[0];
-rz(3.0571235) q2[0];
-sx q2[0];
-rz(-pi) q2[0];
-cx q1[3],q2[0];
-sx q2[0];
-rz(3.0331795) q2[0];
-sx q2[0];
-rz(-pi) q2[0];
-cx q1[4],q2[0];
-rz(-pi) q2[0];
-sx q2[0];
-rz(3.0933526) q2[0];
-sx q2[0];
-cx q1[2],q2[0];
-rz(-pi) q2[0];
-sx q2[0];
-rz(3.1079691) q2[0];
-sx q2[0];
-cx q1[4],q2[0];
-sx q2[0];
-rz(3.0300152) q2[0];
-sx q2[0];
-rz(-pi) q2[0];
-cx q1[3],q2[0];
-sx q2[0];
-rz(3.0493529) q2[0];
-sx q2[0];
-rz(-pi) q2[0];
-cx q1[4],q2[0];
-rz(-pi) q2[0];
-sx q2[0];
-rz(3.0466842) q2[0];
-sx q2[0];
-cx q1[1],q2[0];
-rz(-pi) q2[0];
-sx q2[0];
-rz(3.0332036) q2[0];
-sx q2[0];
-cx q1[4],q2[0];
-sx q2[0];
-rz(3.0507441) q2[0];
-sx q2[0];
-rz(-pi) q2[0];
-cx q1[3],q2[0];
-sx q2[0];
-rz(3.030404) q2[0];
-sx q2[0];
-rz(-pi) q2[0];
-cx q1[4],q2[0];
-rz(-pi) q2[0];
-sx q2[0];
-rz(3.1052593) q2[0];
-sx q2[0];
-cx q1[2],q2[0];
-rz(-pi) q2[0];
-sx q2[0];
-rz(3.086239) q2[0];
-sx q2[0];
-cx q1[4],q2[0];
-sx q2[0];
-rz(3.0339437) q2[0];
-sx q2[0];
-rz(-pi) q2[0];
-cx q1[3],q2[0];
-sx q2[0];
-rz(3.0607387) q2[0];
-sx q2[0];
-rz(-pi) q2[0];
-cx q1[4],q2[0];
-rz(-pi) q2[0];
-sx q2[0];
-rz(2.9405744) q2[0];
-sx q2[0];
-cx q1[0],q2[0];
-rz(pi/2) q1[0];
-sx q1[0];
-rz(3*pi/4) q1[0];
-cx q1[0],q1[1];
-rz(-pi/4) q1[1];
-cx q1[0],q1[1];
-rz(pi/8) q1[0];
-cx q1[0],q1[2];
-rz(3*pi/4) q1[1];
-sx q1[1];
-rz(3*pi/4) q1[1];
-rz(-pi/8) q1[2];
-cx q1[0],q1[2];
-rz(pi/16) q1[0];
-cx q1[0],q1[3];
-rz(pi/8) q1[2];
-cx q1[1],q1[2];
-rz(-pi/4) q1[2];
-cx q1[1],q1[2];
-rz(pi/8) q1[1];
-rz(3*pi/4) q1[2];
-sx q1[2];
-rz(3*pi/4) q1[2];
-rz(-pi/16) q1[3];
-cx q1[0],q1[3];
-rz(pi/32) q1[0];
-cx q1[0],q1[4];
-rz(pi/16) q1[3];
-cx q1[1],q1[3];
-rz(-pi/8) q1[3];
-cx q1[1],q1[3];
-rz(pi/16) q1[1];
-rz(pi/8) q1[3];
-cx q1[2],q1[3];
-rz(-pi/4) q1[3];
-cx q1[2],q1[3];
-rz(pi/8) q1[2];
-rz(3*pi/4) q1[3];
-sx q1[3];
-rz(3*pi/4) q1[3];
-rz(-pi/32) q1[4];
-cx q1[0],q1[4];
-rz(-0.6682675) q1[0];
-rz(pi/32) q1[4];
-cx q1[1],q1[4];
-rz(-pi/16) q1[4];
-cx q1[1],q1[4];
-rz(-0.6682675) q1[1];
-rz(pi/16) q1[4];
-cx q1[2],q1[4];
-rz(-pi/8) q1[4];
-cx q1[2],q1[4];
-rz(-0.6682675) q1[2];
-rz(pi/8) q1[4];
-cx q1[3],q1[4];
-rz(-pi/4) q1[4];
-cx q1[3],q1[4];
-rz(-0.6682675) q1[3];
-rz(3*pi/4) q1[4];
-sx q1[4];
-rz(0.90252883) q1[4];
-cx q1[4],q0[0];
-rz(-2.4733252) q0[0];
-sx q0[0];
-rz(-2.1307216) q0[0];
-sx q0[0];
-cx q1[4],q0[0];
-sx q0[0];
-rz(-2.1307216) q0[0];
-sx q0[0];
-rz(2.4733252) q0[0];
-rz(-0.6682675) q1[4];
-cx q1[4],q0[0];
-rz(-2.4733252) q0[0];
-sx q0[0];
-rz(-2.1307216) q0[0];
-sx q0[0];
-cx q1[4],q0[0];
-sx q0[0];
-rz(-2.1307216) q0[0];
-sx q0[0];
-rz(2.4733252) q0[0];
-rz(-0.6682675) q1[4];
-cx q1[4],q0[0];
-rz(-2.4733252) q0[0];
-sx q0[0];
-rz(-2.1307216) q0[0];
-sx q0[0];
-cx q1[4],q0[0];
-sx q0[0];
-rz(-2.1307216) q0[0];
-sx q0[0];
-rz(2.4733252) q0[0];
-rz(-0.6682675) q1[4];
-cx q1[4],q0[0];
-rz(-2.4733252) q0[0];
-sx q0[0];
-rz(-2.1307216) q0[0];
-sx q0[0];
-cx q1[4],q0[0];
-sx q0[0];
-rz(-2.1307216) q0[0];
-sx q0[0];
-rz(2.4733252) q0[0];
-rz(-0.6682675) q1[4];
-cx q1[4],q0[0];
-rz(-2.4733252) q0[0];
-sx q0[0];
-rz(-2.1307216) q0[0];
-sx q0[0];
-cx q1[4],q0[0];
-sx q0[0];
-rz(-2.1307216) q0[0];
-sx q0[0];
-rz(2.4733252) q0[0];
-rz(-0.6682675) q1[4];
-cx q1[4],q0[0];
-rz(-2.4733252) q0[0];
-sx q0[0];
-rz(-2.1307216) q0[0];
-sx q0[0];
-cx q1[4],q0[0];
-sx q0[0];
-rz(-2.1307216) q0[0];
-sx q0[0];
-rz(2.4733252) q0[0];
-rz(-0.6682675) q1[4];
-cx q1[4],q0[0];
-rz(-2.4733252) q0[0];
-sx q0[0];
-rz(-2.1307216) q0[0];
-sx q0[0];
-cx q1[4],q0[0];
-sx q0[0];
-rz(-2.1307216) q0[0];
-sx q0[0];
-rz(2.4733252) q0[0];
-rz(-0.6682675) q1[4];
-cx q1[4],q0[0];
-rz(-2.4733252) q0[0];
-sx q0[0];
-rz(-2.1307216) q0[0];
-sx q0[0];
-cx q1[4],q0[0];
-sx q0[0];
-rz(-2.1307216) q0[0];
-sx q0[0];
-rz(2.4733252) q0[0];
-rz(-0.6682675) q1[4];
-cx q1[4],q0[0];
-rz(-2.4733252) q0[0];
-sx q0[0];
-rz(-2.1307216) q0[0];
-sx q0[0];
-cx q1[4],q0[0];
-sx q0[0];
-rz(-2.1307216) q0[0];
-sx q0[0];
-rz(2.4733252) q0[0];
-rz(-0.6682675) q1[4];
-cx q1[4],q0[0];
-rz(-2.4733252) q0[0];
-sx q0[0];
-rz(-2.1307216) q0[0];
-sx q0[0];
-cx q1[4],q0[0];
-sx q0[0];
-rz(-2.1307216) q0[0];
-sx q0[0];
-rz(2.4733252) q0[0];
-rz(-0.6682675) q1[4];
-cx q1[4],q0[0];
-rz(-2.4733252) q0[0];
-sx q0[0];
-rz(-2.1307216) q0[0];
-sx q0[0];
-cx q1[4],q0[0];
-sx q0[0];
-rz(-2.1307216) q0[0];
-sx q0[0];
-rz(2.4733252) q0[0];
-rz(-0.6682675) q1[4];
-cx q1[4],q0[0];
-rz(-2.4733252) q0[0];
-sx q0[0];
-rz(-2.1307216) q0[0];
-sx q0[0];
-cx q1[4],q0[0];
-sx q0[0];
-rz(-2.1307216) q0[0];
-sx q0[0];
-rz(2.4733252) q0[0];
-rz(-0.6682675) q1[4];
-cx q1[4],q0[0];
-rz(-2.4733252) q0[0];
-sx q0[0];
-rz(-2.1307216) q0[0];
-sx q0[0];
-cx q1[4],q0[0];
-sx q0[0];
-rz(-2.1307216) q0[0];
-sx q0[0];
-rz(2.4733252) q0[0];
-rz(-0.6682675) q1[4];
-cx q1[4],q0[0];
-rz(-2.4733252) q0[0];
-sx q0[0];
-rz(-2.1307216) q0[0];
-sx q0[0];
-cx q1[4],q0[0];
-sx q0[0];
-rz(-2.1307216) q0[0];
-sx q0[0];
-rz(2.4733252) q0[0];
-rz(-0.6682675) q1[4];
-cx q1[4],q0[0];
-rz(-2.4733252) q0[0];
-sx q0[0];
-rz(-2.1307216) q0[0];
-sx q0[0];
-cx q1[4],q0[0];
-sx q0[0];
-rz(-2.1307216) q0[0];
-sx q0[0];
-rz(2.4733252) q0[0];
-rz(-0.6682675) q1[4];
-cx q1[4],q0[0];
-rz(-2.4733252) q0[0];
-sx q0[0];
-rz(-2.1307216) q0[0];
-sx q0[0];
-cx q1[4],q0[0];
-sx q0[0];
-rz(-2.1307216) q0[0];
-sx q0[0];
-rz(2.4733252) q0[0];
-cx q1[3],q0[0];
-rz(-2.4733252) q0[0];
-sx q0[0];
-rz(-2.1307216) q0[0];
-sx q0[0];
-cx q1[3],q0[0];
-sx q0[0];
-rz(-2.1307216) q0[0];
-sx q0[0];
-rz(2.4733252) q0[0];
-rz(-0.6682675) q1[3];
-cx q1[3],q0[0];
-rz(-2.4733252) q0[0];
-sx q0[0];
-rz(-2.1307216) q0[0];
-sx q0[0];
-cx q1[3],q0[0];
-sx q0[0];
-rz(-2.1307216) q0[0];
-sx q0[0];
-rz(2.4733252) q0[0];
-rz(-0.6682675) q1[3];
-cx q1[3],q0[0];
-rz(-2.4733252) q0[0];
-sx q0[0];
-rz(-2.1307216) q0[0];
-sx q0[0];
-cx q1[3],q0[0];
-sx q0[0];
-rz(-2.1307216) q0[0];
-sx q0[0];
-rz(2.4733252) q0[0];
-rz(-0.6682675) q1[3];
-cx q1[3],q0[0];
-rz(-2.4733252) q0[0];
-sx q0[0];
-rz(-2.1307216) q0[0];
-sx q0[0];
-cx q1[3],q0[0];
-sx q0[0];
-rz(-2.1307216) q0[0];
-sx q0[0];
-rz(2.4733252) q0[0];
-rz(-0.6682675) q1[3];
-cx q1[3],q0[0];
-rz(-2.4733252) q0[0];
-sx q0[0];
-rz(-2.1307216) q0[0];
-sx q0[0];
-cx q1[3],q0[0];
-sx q0[0];
-rz(-2.1307216) q0[0];
-sx q0[0];
-rz(2.4733252) q0[0];
-rz(-0.6682675) q1[3];
-cx q1[3],q0[0];
-rz(-2.4733252) q0[0];
-sx q0[0];
-rz(-2.1307216) q0[0];
-sx q0[0];
-cx q1[3],q0[0];
-sx q0[0];
-rz(-2.1307216) q0[0];
-sx q0[0];
-rz(2.4733252) q0[0];
-rz(-0.6682675) q1[3];
-cx q1[3],q0[0];
-rz(-2.4733252) q0[0];
-sx q0[0];
-rz(-2.1307216) q0[0];
-sx q0[0];
-cx q1[3],q0[0];
-sx q0[0];
-rz(-2.1307216) q0[0];
-sx q0[0];
-rz(2.4733252) q0[0];
-rz(-0.6682675) q1[3];
-cx q1[3],q0[0];
-rz(-2.4733252) q0[0];
-sx q0[0];
-rz(-2.1307216) q0[0];
-sx q0[0];
-cx q1[3],q0[0];
-sx q0[0];
-rz(-2.1307216) q0[0];
-sx q0[0];
-rz(2.4733252) q0[0];
-cx q1[2],q0[0];
-rz(-2.4733252) q0[0];
-sx q0[0];
-rz(-2.1307216) q0[0];
-sx q0[0];
-cx q1[2],q0[0];
-sx q0[0];
-rz(-2.1307216) q0[0];
-sx q0[0];
-rz(2.4733252) q0[0];
-rz(-0.6682675) q1[2];
-cx q1[2],q0[0];
-rz(-2.4733252) q0[0];
-sx q0[0];
-rz(-2.1307216) q0[0];
-sx q0[0];
-cx q1[2],q0[0];
-sx q0[0];
-rz(-2.1307216) q0[0];
-sx q0[0];
-rz(2.4733252) q0[0];
-rz(-0.6682675) q1[2];
-cx q1[2],q0[0];
-rz(-2.4733252) q0[0];
-sx q0[0];
-rz(-2.1307216) q0[0];
-sx q0[0];
-cx q1[2],q0[0];
-sx q0[0];
-rz(-2.1307216) q0[0];
-sx q0[0];
-rz(2.4733252) q0[0];
-rz(-0.6682675) q1[2];
-cx q1[2],q0[0];
-rz(-2.4733252) q0[0];
-sx q0[0];
-rz(-2.1307216) q0[0];
-sx q0[0];
-cx q1[2],q0[0];
-sx q0[0];
-rz(-2.1307216) q0[0];
-sx q0[0];
-rz(2.4733252) q0[0];
-cx q1[1],q0[0];
-rz(-2.4733252) q0[0];
-sx q0[0];
-rz(-2.1307216) q0[0];
-sx q0[0];
-cx q1[1],q0[0];
-sx q0[0];
-rz(-2.1307216) q0[0];
-sx q0[0];
-rz(2.4733252) q0[0];
-rz(-0.6682675) q1[1];
-cx q1[1],q0[0];
-rz(-2.4733252) q0[0];
-sx q0[0];
-rz(-2.1307216) q0[0];
-sx q0[0];
-cx q1[1],q0[0];
-sx q0[0];
-rz(-2.1307216) q0[0];
-sx q0[0];
-rz(2.4733252) q0[0];
-cx q1[0],q0[0];
-rz(-2.4733252) q0[0];
-sx q0[0];
-rz(-2.1307216) q0[0];
-sx q0[0];
-cx q1[0],q0[0];
-sx q0[0];
-rz(-2.1307216) q0[0];
-sx q0[0];
-rz(-2.2390638) q0[0];
-rz(-3.0996808) q1[0];
-sx q1[0];
-rz(pi/2) q1[0];
-rz(-1.4869727) q1[1];
-sx q1[1];
-rz(pi/2) q1[1];
-rz(1.7384437) q1[2];
-sx q1[2];
-rz(pi/2) q1[2];
-rz(1.906091) q1[3];
-sx q1[3];
-rz(pi/2) q1[3];
-rz(2.2413856) q1[4];
-sx q1[4];
-rz(pi/2) q1[4];
-barrier q0[0],q1[0],q1[1],q1[2],q1[3],q1[4],q2[0];
-measure q0[0] -> meas[0];
-measure q1[0] -> meas[1];
-measure q1[1] -> meas[2];
-measure q1[2] -> meas[3];
-measure q1[3] -> meas[4];
-measure q1[4] -> meas[5];
-measure q2[0] -> meas[6];
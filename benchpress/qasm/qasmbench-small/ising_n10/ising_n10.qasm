@@ -1,497 +0,0 @@
-OPENQASM 2.0;
-include "qelib1.inc";
-qreg reg[10];
-creg c[10];
-
-h reg[0];
-h reg[1];
-h reg[2];
-h reg[3];
-h reg[4];
-h reg[5];
-h reg[6];
-h reg[7];
-h reg[8];
-h reg[9];
-rz(-3.000000e-01) reg[0];
-rz(3.000000e-01) reg[1];
-rz(3.000000e-01) reg[1];
-cx reg[0],reg[1];
-rz(-3.000000e-01) reg[1];
-cx reg[0],reg[1];
-rz(-3.600000e-01) reg[2];
-rz(3.600000e-01) reg[3];
-rz(3.600000e-01) reg[3];
-cx reg[2],reg[3];
-rz(-3.600000e-01) reg[3];
-cx reg[2],reg[3];
-rz(-1.200000e-01) reg[4];
-rz(1.200000e-01) reg[5];
-rz(1.200000e-01) reg[5];
-cx reg[4],reg[5];
-rz(-1.200000e-01) reg[5];
-cx reg[4],reg[5];
-rz(2.200000e-01) reg[6];
-rz(-2.200000e-01) reg[7];
-rz(-2.200000e-01) reg[7];
-cx reg[6],reg[7];
-rz(2.200000e-01) reg[7];
-cx reg[6],reg[7];
-rz(8.000000e-02) reg[8];
-rz(-8.000000e-02) reg[9];
-rz(-8.000000e-02) reg[9];
-cx reg[8],reg[9];
-rz(8.000000e-02) reg[9];
-cx reg[8],reg[9];
-rz(2.600000e-01) reg[1];
-rz(-2.600000e-01) reg[2];
-rz(-2.600000e-01) reg[2];
-cx reg[1],reg[2];
-rz(2.600000e-01) reg[2];
-cx reg[1],reg[2];
-rz(-2.600000e-01) reg[3];
-rz(2.600000e-01) reg[4];
-rz(2.600000e-01) reg[4];
-cx reg[3],reg[4];
-rz(-2.600000e-01) reg[4];
-cx reg[3],reg[4];
-rz(3.800000e-01) reg[5];
-rz(-3.800000e-01) reg[6];
-rz(-3.800000e-01) reg[6];
-cx reg[5],reg[6];
-rz(3.800000e-01) reg[6];
-cx reg[5],reg[6];
-rz(-2.600000e-01) reg[7];
-rz(2.600000e-01) reg[8];
-rz(2.600000e-01) reg[8];
-cx reg[7],reg[8];
-rz(-2.600000e-01) reg[8];
-cx reg[7],reg[8];
-h reg[0];
-rz(-1.920000e+00) reg[0];
-h reg[0];
-rz(-2.880000e-01) reg[0];
-h reg[1];
-rz(-1.920000e+00) reg[1];
-h reg[1];
-rz(8.640000e-01) reg[1];
-h reg[2];
-rz(-1.920000e+00) reg[2];
-h reg[2];
-rz(1.152000e+00) reg[2];
-h reg[3];
-rz(-1.920000e+00) reg[3];
-h reg[3];
-rz(-1.056000e+00) reg[3];
-h reg[4];
-rz(-1.920000e+00) reg[4];
-h reg[4];
-rz(-1.440000e+00) reg[4];
-h reg[5];
-rz(-1.920000e+00) reg[5];
-h reg[5];
-rz(-5.760000e-01) reg[5];
-h reg[6];
-rz(-1.920000e+00) reg[6];
-h reg[6];
-rz(1.536000e+00) reg[6];
-h reg[7];
-rz(-1.920000e+00) reg[7];
-h reg[7];
-rz(-2.880000e-01) reg[7];
-h reg[8];
-rz(-1.920000e+00) reg[8];
-h reg[8];
-rz(1.248000e+00) reg[8];
-h reg[9];
-rz(-1.920000e+00) reg[9];
-h reg[9];
-rz(-1.824000e+00) reg[9];
-rz(-9.000000e-01) reg[0];
-rz(9.000000e-01) reg[1];
-rz(9.000000e-01) reg[1];
-cx reg[0],reg[1];
-rz(-9.000000e-01) reg[1];
-cx reg[0],reg[1];
-rz(-1.080000e+00) reg[2];
-rz(1.080000e+00) reg[3];
-rz(1.080000e+00) reg[3];
-cx reg[2],reg[3];
-rz(-1.080000e+00) reg[3];
-cx reg[2],reg[3];
-rz(-3.600000e-01) reg[4];
-rz(3.600000e-01) reg[5];
-rz(3.600000e-01) reg[5];
-cx reg[4],reg[5];
-rz(-3.600000e-01) reg[5];
-cx reg[4],reg[5];
-rz(6.600000e-01) reg[6];
-rz(-6.600000e-01) reg[7];
-rz(-6.600000e-01) reg[7];
-cx reg[6],reg[7];
-rz(6.600000e-01) reg[7];
-cx reg[6],reg[7];
-rz(2.400000e-01) reg[8];
-rz(-2.400000e-01) reg[9];
-rz(-2.400000e-01) reg[9];
-cx reg[8],reg[9];
-rz(2.400000e-01) reg[9];
-cx reg[8],reg[9];
-rz(7.800000e-01) reg[1];
-rz(-7.800000e-01) reg[2];
-rz(-7.800000e-01) reg[2];
-cx reg[1],reg[2];
-rz(7.800000e-01) reg[2];
-cx reg[1],reg[2];
-rz(-7.800000e-01) reg[3];
-rz(7.800000e-01) reg[4];
-rz(7.800000e-01) reg[4];
-cx reg[3],reg[4];
-rz(-7.800000e-01) reg[4];
-cx reg[3],reg[4];
-rz(1.140000e+00) reg[5];
-rz(-1.140000e+00) reg[6];
-rz(-1.140000e+00) reg[6];
-cx reg[5],reg[6];
-rz(1.140000e+00) reg[6];
-cx reg[5],reg[6];
-rz(-7.800000e-01) reg[7];
-rz(7.800000e-01) reg[8];
-rz(7.800000e-01) reg[8];
-cx reg[7],reg[8];
-rz(-7.800000e-01) reg[8];
-cx reg[7],reg[8];
-h reg[0];
-rz(-9.600000e-01) reg[0];
-h reg[0];
-rz(-1.440000e-01) reg[0];
-h reg[1];
-rz(-9.600000e-01) reg[1];
-h reg[1];
-rz(4.320000e-01) reg[1];
-h reg[2];
-rz(-9.600000e-01) reg[2];
-h reg[2];
-rz(5.760000e-01) reg[2];
-h reg[3];
-rz(-9.600000e-01) reg[3];
-h reg[3];
-rz(-5.280000e-01) reg[3];
-h reg[4];
-rz(-9.600000e-01) reg[4];
-h reg[4];
-rz(-7.200000e-01) reg[4];
-h reg[5];
-rz(-9.600000e-01) reg[5];
-h reg[5];
-rz(-2.880000e-01) reg[5];
-h reg[6];
-rz(-9.600000e-01) reg[6];
-h reg[6];
-rz(7.680000e-01) reg[6];
-h reg[7];
-rz(-9.600000e-01) reg[7];
-h reg[7];
-rz(-1.440000e-01) reg[7];
-h reg[8];
-rz(-9.600000e-01) reg[8];
-h reg[8];
-rz(6.240000e-01) reg[8];
-h reg[9];
-rz(-9.600000e-01) reg[9];
-h reg[9];
-rz(-9.120000e-01) reg[9];
-rz(-1.500000e+00) reg[0];
-rz(1.500000e+00) reg[1];
-rz(1.500000e+00) reg[1];
-cx reg[0],reg[1];
-rz(-1.500000e+00) reg[1];
-cx reg[0],reg[1];
-rz(-1.800000e+00) reg[2];
-rz(1.800000e+00) reg[3];
-rz(1.800000e+00) reg[3];
-cx reg[2],reg[3];
-rz(-1.800000e+00) reg[3];
-cx reg[2],reg[3];
-rz(-6.000000e-01) reg[4];
-rz(6.000000e-01) reg[5];
-rz(6.000000e-01) reg[5];
-cx reg[4],reg[5];
-rz(-6.000000e-01) reg[5];
-cx reg[4],reg[5];
-rz(1.100000e+00) reg[6];
-rz(-1.100000e+00) reg[7];
-rz(-1.100000e+00) reg[7];
-cx reg[6],reg[7];
-rz(1.100000e+00) reg[7];
-cx reg[6],reg[7];
-rz(4.000000e-01) reg[8];
-rz(-4.000000e-01) reg[9];
-rz(-4.000000e-01) reg[9];
-cx reg[8],reg[9];
-rz(4.000000e-01) reg[9];
-cx reg[8],reg[9];
-rz(1.300000e+00) reg[1];
-rz(-1.300000e+00) reg[2];
-rz(-1.300000e+00) reg[2];
-cx reg[1],reg[2];
-rz(1.300000e+00) reg[2];
-cx reg[1],reg[2];
-rz(-1.300000e+00) reg[3];
-rz(1.300000e+00) reg[4];
-rz(1.300000e+00) reg[4];
-cx reg[3],reg[4];
-rz(-1.300000e+00) reg[4];
-cx reg[3],reg[4];
-rz(1.900000e+00) reg[5];
-rz(-1.900000e+00) reg[6];
-rz(-1.900000e+00) reg[6];
-cx reg[5],reg[6];
-rz(1.900000e+00) reg[6];
-cx reg[5],reg[6];
-rz(-1.300000e+00) reg[7];
-rz(1.300000e+00) reg[8];
-rz(1.300000e+00) reg[8];
-cx reg[7],reg[8];
-rz(-1.300000e+00) reg[8];
-cx reg[7],reg[8];
-h reg[0];
-rz(-0.000000e+00) reg[0];
-h reg[0];
-rz(-0.000000e+00) reg[0];
-h reg[1];
-rz(-0.000000e+00) reg[1];
-h reg[1];
-rz(0.000000e+00) reg[1];
-h reg[2];
-rz(-0.000000e+00) reg[2];
-h reg[2];
-rz(0.000000e+00) reg[2];
-h reg[3];
-rz(-0.000000e+00) reg[3];
-h reg[3];
-rz(-0.000000e+00) reg[3];
-h reg[4];
-rz(-0.000000e+00) reg[4];
-h reg[4];
-rz(-0.000000e+00) reg[4];
-h reg[5];
-rz(-0.000000e+00) reg[5];
-h reg[5];
-rz(-0.000000e+00) reg[5];
-h reg[6];
-rz(-0.000000e+00) reg[6];
-h reg[6];
-rz(0.000000e+00) reg[6];
-h reg[7];
-rz(-0.000000e+00) reg[7];
-h reg[7];
-rz(-0.000000e+00) reg[7];
-h reg[8];
-rz(-0.000000e+00) reg[8];
-h reg[8];
-rz(0.000000e+00) reg[8];
-h reg[9];
-rz(-0.000000e+00) reg[9];
-h reg[9];
-rz(-0.000000e+00) reg[9];
-rz(-2.100000e+00) reg[0];
-rz(2.100000e+00) reg[1];
-rz(2.100000e+00) reg[1];
-cx reg[0],reg[1];
-rz(-2.100000e+00) reg[1];
-cx reg[0],reg[1];
-rz(-2.520000e+00) reg[2];
-rz(2.520000e+00) reg[3];
-rz(2.520000e+00) reg[3];
-cx reg[2],reg[3];
-rz(-2.520000e+00) reg[3];
-cx reg[2],reg[3];
-rz(-8.400000e-01) reg[4];
-rz(8.400000e-01) reg[5];
-rz(8.400000e-01) reg[5];
-cx reg[4],reg[5];
-rz(-8.400000e-01) reg[5];
-cx reg[4],reg[5];
-rz(1.540000e+00) reg[6];
-rz(-1.540000e+00) reg[7];
-rz(-1.540000e+00) reg[7];
-cx reg[6],reg[7];
-rz(1.540000e+00) reg[7];
-cx reg[6],reg[7];
-rz(5.600000e-01) reg[8];
-rz(-5.600000e-01) reg[9];
-rz(-5.600000e-01) reg[9];
-cx reg[8],reg[9];
-rz(5.600000e-01) reg[9];
-cx reg[8],reg[9];
-rz(1.820000e+00) reg[1];
-rz(-1.820000e+00) reg[2];
-rz(-1.820000e+00) reg[2];
-cx reg[1],reg[2];
-rz(1.820000e+00) reg[2];
-cx reg[1],reg[2];
-rz(-1.820000e+00) reg[3];
-rz(1.820000e+00) reg[4];
-rz(1.820000e+00) reg[4];
-cx reg[3],reg[4];
-rz(-1.820000e+00) reg[4];
-cx reg[3],reg[4];
-rz(2.660000e+00) reg[5];
-rz(-2.660000e+00) reg[6];
-rz(-2.660000e+00) reg[6];
-cx reg[5],reg[6];
-rz(2.660000e+00) reg[6];
-cx reg[5],reg[6];
-rz(-1.820000e+00) reg[7];
-rz(1.820000e+00) reg[8];
-rz(1.820000e+00) reg[8];
-cx reg[7],reg[8];
-rz(-1.820000e+00) reg[8];
-cx reg[7],reg[8];
-h reg[0];
-rz(9.600000e-01) reg[0];
-h reg[0];
-rz(1.440000e-01) reg[0];
-h reg[1];
-rz(9.600000e-01) reg[1];
-h reg[1];
-rz(-4.320000e-01) reg[1];
-h reg[2];
-rz(9.600000e-01) reg[2];
-h reg[2];
-rz(-5.760000e-01) reg[2];
-h reg[3];
-rz(9.600000e-01) reg[3];
-h reg[3];
-rz(5.280000e-01) reg[3];
-h reg[4];
-rz(9.600000e-01) reg[4];
-h reg[4];
-rz(7.200000e-01) reg[4];
-h reg[5];
-rz(9.600000e-01) reg[5];
-h reg[5];
-rz(2.880000e-01) reg[5];
-h reg[6];
-rz(9.600000e-01) reg[6];
-h reg[6];
-rz(-7.680000e-01) reg[6];
-h reg[7];
-rz(9.600000e-01) reg[7];
-h reg[7];
-rz(1.440000e-01) reg[7];
-h reg[8];
-rz(9.600000e-01) reg[8];
-h reg[8];
-rz(-6.240000e-01) reg[8];
-h reg[9];
-rz(9.600000e-01) reg[9];
-h reg[9];
-rz(9.120000e-01) reg[9];
-rz(-2.700000e+00) reg[0];
-rz(2.700000e+00) reg[1];
-rz(2.700000e+00) reg[1];
-cx reg[0],reg[1];
-rz(-2.700000e+00) reg[1];
-cx reg[0],reg[1];
-rz(-3.240000e+00) reg[2];
-rz(3.240000e+00) reg[3];
-rz(3.240000e+00) reg[3];
-cx reg[2],reg[3];
-rz(-3.240000e+00) reg[3];
-cx reg[2],reg[3];
-rz(-1.080000e+00) reg[4];
-rz(1.080000e+00) reg[5];
-rz(1.080000e+00) reg[5];
-cx reg[4],reg[5];
-rz(-1.080000e+00) reg[5];
-cx reg[4],reg[5];
-rz(1.980000e+00) reg[6];
-rz(-1.980000e+00) reg[7];
-rz(-1.980000e+00) reg[7];
-cx reg[6],reg[7];
-rz(1.980000e+00) reg[7];
-cx reg[6],reg[7];
-rz(7.200000e-01) reg[8];
-rz(-7.200000e-01) reg[9];
-rz(-7.200000e-01) reg[9];
-cx reg[8],reg[9];
-rz(7.200000e-01) reg[9];
-cx reg[8],reg[9];
-rz(2.340000e+00) reg[1];
-rz(-2.340000e+00) reg[2];
-rz(-2.340000e+00) reg[2];
-cx reg[1],reg[2];
-rz(2.340000e+00) reg[2];
-cx reg[1],reg[2];
-rz(-2.340000e+00) reg[3];
-rz(2.340000e+00) reg[4];
-rz(2.340000e+00) reg[4];
-cx reg[3],reg[4];
-rz(-2.340000e+00) reg[4];
-cx reg[3],reg[4];
-rz(3.420000e+00) reg[5];
-rz(-3.420000e+00) reg[6];
-rz(-3.420000e+00) reg[6];
-cx reg[5],reg[6];
-rz(3.420000e+00) reg[6];
-cx reg[5],reg[6];
-rz(-2.340000e+00) reg[7];
-rz(2.340000e+00) reg[8];
-rz(2.340000e+00) reg[8];
-cx reg[7],reg[8];
-rz(-2.340000e+00) reg[8];
-cx reg[7],reg[8];
-h reg[0];
-rz(1.920000e+00) reg[0];
-h reg[0];
-rz(2.880000e-01) reg[0];
-h reg[1];
-rz(1.920000e+00) reg[1];
-h reg[1];
-rz(-8.640000e-01) reg[1];
-h reg[2];
-rz(1.920000e+00) reg[2];
-h reg[2];
-rz(-1.152000e+00) reg[2];
-h reg[3];
-rz(1.920000e+00) reg[3];
-h reg[3];
-rz(1.056000e+00) reg[3];
-h reg[4];
-rz(1.920000e+00) reg[4];
-h reg[4];
-rz(1.440000e+00) reg[4];
-h reg[5];
-rz(1.920000e+00) reg[5];
-h reg[5];
-rz(5.760000e-01) reg[5];
-h reg[6];
-rz(1.920000e+00) reg[6];
-h reg[6];
-rz(-1.536000e+00) reg[6];
-h reg[7];
-rz(1.920000e+00) reg[7];
-h reg[7];
-rz(2.880000e-01) reg[7];
-h reg[8];
-rz(1.920000e+00) reg[8];
-h reg[8];
-rz(-1.248000e+00) reg[8];
-h reg[9];
-rz(1.920000e+00) reg[9];
-h reg[9];
-rz(1.824000e+00) reg[9];
-
-measure reg[0] -> c[0];
-measure reg[1] -> c[1];
-measure reg[2] -> c[2];
-measure reg[3] -> c[3];
-measure reg[4] -> c[4];
-measure reg[5] -> c[5];
-measure reg[6] -> c[6];
-measure reg[7] -> c[7];
-measure reg[8] -> c[8];
-measure reg[9] -> c[9];
-
@@ -1,429 +0,0 @@
-OPENQASM 2.0;
-include "qelib1.inc";
-qreg reg[10];
-creg c[10];
-rz(pi/2) reg[0];
-sx reg[0];
-rz(1.2707963) reg[0];
-rz(pi/2) reg[1];
-sx reg[1];
-rz(2.1707963) reg[1];
-cx reg[0],reg[1];
-rz(-0.3) reg[1];
-cx reg[0],reg[1];
-rz(-pi/2) reg[0];
-sx reg[0];
-rz(-1.2215927) reg[0];
-sx reg[0];
-rz(-2.7587963) reg[0];
-rz(0.26) reg[1];
-rz(pi/2) reg[2];
-sx reg[2];
-rz(1.2107963) reg[2];
-rz(pi/2) reg[3];
-sx reg[3];
-rz(2.2907963) reg[3];
-cx reg[2],reg[3];
-rz(-0.36) reg[3];
-cx reg[2],reg[3];
-rz(-0.52) reg[2];
-cx reg[1],reg[2];
-rz(0.26) reg[2];
-cx reg[1],reg[2];
-rz(-pi/2) reg[1];
-sx reg[1];
-rz(-1.2215927) reg[1];
-sx reg[1];
-rz(1.0932037) reg[1];
-cx reg[0],reg[1];
-rz(-0.9) reg[1];
-cx reg[0],reg[1];
-rz(-pi/2) reg[0];
-sx reg[0];
-rz(-2.1815927) reg[0];
-sx reg[0];
-rz(3.068389) reg[0];
-rz(0.78) reg[1];
-rz(-pi/2) reg[2];
-sx reg[2];
-rz(-1.2215927) reg[2];
-sx reg[2];
-rz(-1.4987963) reg[2];
-rz(-0.26) reg[3];
-rz(pi/2) reg[4];
-sx reg[4];
-rz(1.4507963) reg[4];
-rz(pi/2) reg[5];
-sx reg[5];
-rz(1.8107963) reg[5];
-cx reg[4],reg[5];
-rz(-0.12) reg[5];
-cx reg[4],reg[5];
-rz(0.52) reg[4];
-cx reg[3],reg[4];
-rz(-0.26) reg[4];
-cx reg[3],reg[4];
-rz(-pi/2) reg[3];
-sx reg[3];
-rz(-1.2215927) reg[3];
-sx reg[3];
-rz(-0.46679633) reg[3];
-cx reg[2],reg[3];
-rz(-1.08) reg[3];
-cx reg[2],reg[3];
-rz(-1.56) reg[2];
-cx reg[1],reg[2];
-rz(0.78) reg[2];
-cx reg[1],reg[2];
-rz(-pi/2) reg[1];
-sx reg[1];
-rz(-2.1815927) reg[1];
-sx reg[1];
-rz(1.8612037) reg[1];
-cx reg[0],reg[1];
-rz(-1.5) reg[1];
-cx reg[0],reg[1];
-rz(-2.1) reg[0];
-rz(1.3) reg[1];
-rz(-pi/2) reg[2];
-sx reg[2];
-rz(-2.1815927) reg[2];
-sx reg[2];
-rz(-2.7947963) reg[2];
-rz(-0.78) reg[3];
-rz(-pi/2) reg[4];
-sx reg[4];
-rz(-1.2215927) reg[4];
-sx reg[4];
-rz(2.912389) reg[4];
-rz(0.38) reg[5];
-rz(pi/2) reg[6];
-sx reg[6];
-rz(1.7907963) reg[6];
-rz(pi/2) reg[7];
-sx reg[7];
-rz(1.1307963) reg[7];
-cx reg[6],reg[7];
-rz(0.22) reg[7];
-cx reg[6],reg[7];
-rz(-0.76) reg[6];
-cx reg[5],reg[6];
-rz(0.38) reg[6];
-cx reg[5],reg[6];
-rz(-pi/2) reg[5];
-sx reg[5];
-rz(-1.2215927) reg[5];
-sx reg[5];
-rz(-1.4267963) reg[5];
-cx reg[4],reg[5];
-rz(-0.36) reg[5];
-cx reg[4],reg[5];
-rz(1.56) reg[4];
-cx reg[3],reg[4];
-rz(-0.78) reg[4];
-cx reg[3],reg[4];
-rz(-pi/2) reg[3];
-sx reg[3];
-rz(-2.1815927) reg[3];
-sx reg[3];
-rz(1.5012037) reg[3];
-cx reg[2],reg[3];
-rz(-1.8) reg[3];
-cx reg[2],reg[3];
-rz(-2.6) reg[2];
-cx reg[1],reg[2];
-rz(1.3) reg[2];
-cx reg[1],reg[2];
-rz(-2.0831853) reg[1];
-cx reg[0],reg[1];
-rz(-2.1) reg[1];
-cx reg[0],reg[1];
-rz(pi/2) reg[0];
-sx reg[0];
-rz(-2.1815927) reg[0];
-sx reg[0];
-rz(-0.98520367) reg[0];
-rz(1.82) reg[1];
-rz(-2.52) reg[2];
-rz(-1.3) reg[3];
-rz(-pi/2) reg[4];
-sx reg[4];
-rz(-2.1815927) reg[4];
-sx reg[4];
-rz(-2.8907963) reg[4];
-rz(1.14) reg[5];
-rz(-pi/2) reg[6];
-sx reg[6];
-rz(-1.2215927) reg[6];
-sx reg[6];
-rz(0.62520367) reg[6];
-rz(-0.26) reg[7];
-rz(pi/2) reg[8];
-sx reg[8];
-rz(1.6507963) reg[8];
-rz(pi/2) reg[9];
-sx reg[9];
-rz(1.4107963) reg[9];
-cx reg[8],reg[9];
-rz(0.08) reg[9];
-cx reg[8],reg[9];
-rz(0.52) reg[8];
-cx reg[7],reg[8];
-rz(-0.26) reg[8];
-cx reg[7],reg[8];
-rz(-pi/2) reg[7];
-sx reg[7];
-rz(-1.2215927) reg[7];
-sx reg[7];
-rz(3.104389) reg[7];
-cx reg[6],reg[7];
-rz(0.66) reg[7];
-cx reg[6],reg[7];
-rz(-2.28) reg[6];
-cx reg[5],reg[6];
-rz(1.14) reg[6];
-cx reg[5],reg[6];
-rz(-pi/2) reg[5];
-sx reg[5];
-rz(-2.1815927) reg[5];
-sx reg[5];
-rz(-0.65879633) reg[5];
-cx reg[4],reg[5];
-rz(-0.6) reg[5];
-cx reg[4],reg[5];
-rz(2.6) reg[4];
-cx reg[3],reg[4];
-rz(-1.3) reg[4];
-cx reg[3],reg[4];
-rz(-1.2431853) reg[3];
-cx reg[2],reg[3];
-rz(-2.52) reg[3];
-cx reg[2],reg[3];
-rz(2.6431853) reg[2];
-cx reg[1],reg[2];
-rz(1.82) reg[2];
-cx reg[1],reg[2];
-rz(pi/2) reg[1];
-sx reg[1];
-rz(-2.1815927) reg[1];
-sx reg[1];
-rz(0.25561102) reg[1];
-cx reg[0],reg[1];
-rz(-2.7) reg[1];
-cx reg[0],reg[1];
-rz(pi/2) reg[0];
-sx reg[0];
-rz(-1.2215927) reg[0];
-sx reg[0];
-rz(1.8587963) reg[0];
-rz(2.34) reg[1];
-rz(pi/2) reg[2];
-sx reg[2];
-rz(-2.1815927) reg[2];
-sx reg[2];
-rz(-2.2452037) reg[2];
-rz(-1.82) reg[3];
-rz(-0.84) reg[4];
-rz(1.9) reg[5];
-rz(-pi/2) reg[6];
-sx reg[6];
-rz(-2.1815927) reg[6];
-sx reg[6];
-rz(0.29720367) reg[6];
-rz(-0.78) reg[7];
-rz(-pi/2) reg[8];
-sx reg[8];
-rz(-1.2215927) reg[8];
-sx reg[8];
-rz(-0.082796327) reg[8];
-rz(-pi/2) reg[9];
-sx reg[9];
-rz(-1.2215927) reg[9];
-sx reg[9];
-rz(2.408389) reg[9];
-cx reg[8],reg[9];
-rz(0.24) reg[9];
-cx reg[8],reg[9];
-rz(1.56) reg[8];
-cx reg[7],reg[8];
-rz(-0.78) reg[8];
-cx reg[7],reg[8];
-rz(-pi/2) reg[7];
-sx reg[7];
-rz(-2.1815927) reg[7];
-sx reg[7];
-rz(2.368389) reg[7];
-cx reg[6],reg[7];
-rz(1.1) reg[7];
-cx reg[6],reg[7];
-rz(2.4831853) reg[6];
-cx reg[5],reg[6];
-rz(1.9) reg[6];
-cx reg[5],reg[6];
-rz(1.68) reg[5];
-cx reg[4],reg[5];
-rz(-0.84) reg[5];
-cx reg[4],reg[5];
-rz(-2.6431853) reg[4];
-cx reg[3],reg[4];
-rz(-1.82) reg[4];
-cx reg[3],reg[4];
-rz(pi/2) reg[3];
-sx reg[3];
-rz(-2.1815927) reg[3];
-sx reg[3];
-rz(2.295611) reg[3];
-cx reg[2],reg[3];
-rz(-3.24) reg[3];
-cx reg[2],reg[3];
-rz(1.6031853) reg[2];
-cx reg[1],reg[2];
-rz(2.34) reg[2];
-cx reg[1],reg[2];
-rz(pi/2) reg[1];
-sx reg[1];
-rz(-1.2215927) reg[1];
-sx reg[1];
-rz(0.70679633) reg[1];
-rz(pi/2) reg[2];
-sx reg[2];
-rz(-1.2215927) reg[2];
-sx reg[2];
-rz(0.41879633) reg[2];
-rz(-2.34) reg[3];
-rz(pi/2) reg[4];
-sx reg[4];
-rz(-2.1815927) reg[4];
-sx reg[4];
-rz(1.2107963) reg[4];
-rz(2.66) reg[5];
-rz(1.54) reg[6];
-rz(-1.3) reg[7];
-rz(-pi/2) reg[8];
-sx reg[8];
-rz(-2.1815927) reg[8];
-sx reg[8];
-rz(-0.54679633) reg[8];
-rz(-pi/2) reg[9];
-sx reg[9];
-rz(-2.1815927) reg[9];
-sx reg[9];
-rz(3.000389) reg[9];
-cx reg[8],reg[9];
-rz(0.4) reg[9];
-cx reg[8],reg[9];
-rz(2.6) reg[8];
-cx reg[7],reg[8];
-rz(-1.3) reg[8];
-cx reg[7],reg[8];
-rz(-3.08) reg[7];
-cx reg[6],reg[7];
-rz(1.54) reg[7];
-cx reg[6],reg[7];
-rz(0.96318531) reg[6];
-cx reg[5],reg[6];
-rz(2.66) reg[6];
-cx reg[5],reg[6];
-rz(pi/2) reg[5];
-sx reg[5];
-rz(-2.1815927) reg[5];
-sx reg[5];
-rz(-2.264389) reg[5];
-cx reg[4],reg[5];
-rz(-1.08) reg[5];
-cx reg[4],reg[5];
-rz(-1.6031853) reg[4];
-cx reg[3],reg[4];
-rz(-2.34) reg[4];
-cx reg[3],reg[4];
-rz(pi/2) reg[3];
-sx reg[3];
-rz(-1.2215927) reg[3];
-sx reg[3];
-rz(2.6267963) reg[3];
-rz(pi/2) reg[4];
-sx reg[4];
-rz(-1.2215927) reg[4];
-sx reg[4];
-rz(3.0107963) reg[4];
-rz(3.42) reg[5];
-rz(pi/2) reg[6];
-sx reg[6];
-rz(-2.1815927) reg[6];
-sx reg[6];
-rz(2.7827963) reg[6];
-rz(-1.82) reg[7];
-rz(0.56) reg[8];
-rz(-1.12) reg[9];
-cx reg[8],reg[9];
-rz(0.56) reg[9];
-cx reg[8],reg[9];
-rz(-2.6431853) reg[8];
-cx reg[7],reg[8];
-rz(-1.82) reg[8];
-cx reg[7],reg[8];
-rz(pi/2) reg[7];
-sx reg[7];
-rz(-2.1815927) reg[7];
-sx reg[7];
-rz(-2.2452037) reg[7];
-cx reg[6],reg[7];
-rz(1.98) reg[7];
-cx reg[6],reg[7];
-rz(-0.55681469) reg[6];
-cx reg[5],reg[6];
-rz(3.42) reg[6];
-cx reg[5],reg[6];
-rz(pi/2) reg[5];
-sx reg[5];
-rz(-1.2215927) reg[5];
-sx reg[5];
-rz(2.1467963) reg[5];
-rz(pi/2) reg[6];
-sx reg[6];
-rz(-1.2215927) reg[6];
-sx reg[6];
-rz(0.034796327) reg[6];
-rz(-2.34) reg[7];
-rz(pi/2) reg[8];
-sx reg[8];
-rz(-2.1815927) reg[8];
-sx reg[8];
-rz(1.6667963) reg[8];
-rz(pi/2) reg[9];
-sx reg[9];
-rz(-2.1815927) reg[9];
-sx reg[9];
-rz(1.0427963) reg[9];
-cx reg[8],reg[9];
-rz(0.72) reg[9];
-cx reg[8],reg[9];
-rz(-1.6031853) reg[8];
-cx reg[7],reg[8];
-rz(-2.34) reg[8];
-cx reg[7],reg[8];
-rz(pi/2) reg[7];
-sx reg[7];
-rz(-1.2215927) reg[7];
-sx reg[7];
-rz(1.8587963) reg[7];
-rz(pi/2) reg[8];
-sx reg[8];
-rz(-1.2215927) reg[8];
-sx reg[8];
-rz(0.32279633) reg[8];
-rz(pi/2) reg[9];
-sx reg[9];
-rz(-1.2215927) reg[9];
-sx reg[9];
-rz(-2.888389) reg[9];
-measure reg[0] -> c[0];
-measure reg[1] -> c[1];
-measure reg[2] -> c[2];
-measure reg[3] -> c[3];
-measure reg[4] -> c[4];
-measure reg[5] -> c[5];
-measure reg[6] -> c[6];
-measure reg[7] -> c[7];
-measure reg[8] -> c[8];
-measure reg[9] -> c[9];
@@ -1,26 +0,0 @@
-OPENQASM 2.0;
-include "qelib1.inc";
-qreg q[5];
-creg c[5];
-rz(pi/2) q[0];
-sx q[0];
-rz(pi/2) q[0];
-rz(pi/2) q[3];
-sx q[3];
-rz(pi/2) q[3];
-cx q[3],q[2];
-cx q[0],q[2];
-rz(pi/2) q[0];
-sx q[0];
-rz(pi/2) q[0];
-rz(pi/2) q[2];
-sx q[2];
-rz(pi/2) q[2];
-rz(pi/2) q[3];
-sx q[3];
-rz(pi/2) q[3];
-measure q[0] -> c[0];
-measure q[1] -> c[1];
-measure q[2] -> c[2];
-measure q[3] -> c[3];
-measure q[4] -> c[4];
@@ -1,41 +0,0 @@
-OPENQASM 2.0;
-include "qelib1.inc";
-qreg q[3];
-creg m2[1];
-creg m0[1];
-creg m1[1];
-rz(pi/2) q[0];
-sx q[0];
-rz(pi/2) q[0];
-rz(pi/2) q[1];
-sx q[1];
-rz(pi/2) q[1];
-rz(pi/2) q[2];
-sx q[2];
-rz(pi/2) q[2];
-cx q[0],q[2];
-rz(5.654427) q[2];
-cx q[0],q[2];
-cx q[0],q[1];
-cx q[1],q[2];
-rz(-11.308885) q[2];
-cx q[1],q[2];
-cx q[0],q[1];
-rz(pi/2) q[0];
-sx q[0];
-rz(4.85484135766907) q[0];
-sx q[0];
-rz(5*pi/2) q[0];
-rz(-2.8261453) q[1];
-sx q[1];
-rz(-1.4283439) q[1];
-sx q[1];
-rz(pi/2) q[1];
-rz(pi/2) q[2];
-sx q[2];
-rz(4.85484135766907) q[2];
-sx q[2];
-rz(5*pi/2) q[2];
-measure q[2] -> m2[0];
-measure q[0] -> m0[0];
-measure q[1] -> m1[0];
@@ -1,388 +0,0 @@
-OPENQASM 2.0;
-include "qelib1.inc";
-qreg q[6];
-creg mm[6];
-rz(pi/2) q[0];
-sx q[0];
-rz(-1.3050066) q[0];
-sx q[0];
-rz(pi/2) q[0];
-rz(pi/2) q[1];
-sx q[1];
-rz(-2.8758029) q[1];
-sx q[1];
-rz(-pi/2) q[1];
-cx q[0],q[1];
-rz(pi/2) q[0];
-sx q[0];
-rz(4.44659921584326) q[0];
-sx q[0];
-rz(5*pi/2) q[0];
-rz(-pi/2) q[1];
-sx q[1];
-rz(pi/2) q[1];
-cx q[1],q[0];
-rz(-pi) q[1];
-sx q[1];
-rz(-pi/2) q[1];
-cx q[0],q[1];
-rz(-pi) q[0];
-sx q[0];
-rz(-pi) q[0];
-sx q[1];
-rz(-pi) q[1];
-rz(pi/2) q[2];
-sx q[2];
-rz(-2.8758029) q[2];
-sx q[2];
-rz(-pi/2) q[2];
-cx q[0],q[2];
-rz(pi/2) q[0];
-sx q[0];
-rz(4.44659921584326) q[0];
-sx q[0];
-rz(5*pi/2) q[0];
-rz(-pi/2) q[2];
-sx q[2];
-rz(pi/2) q[2];
-cx q[2],q[0];
-rz(-pi) q[2];
-sx q[2];
-rz(-pi/2) q[2];
-cx q[0],q[2];
-rz(-pi) q[0];
-sx q[0];
-rz(-pi) q[0];
-x q[2];
-cx q[1],q[2];
-rz(pi/2) q[1];
-sx q[1];
-rz(4.44659921584326) q[1];
-sx q[1];
-rz(5*pi/2) q[1];
-rz(-pi/2) q[2];
-sx q[2];
-rz(pi/2) q[2];
-cx q[2],q[1];
-rz(-pi) q[2];
-sx q[2];
-rz(-pi/2) q[2];
-cx q[1],q[2];
-rz(-pi) q[1];
-sx q[1];
-rz(-pi) q[1];
-sx q[2];
-rz(-pi) q[2];
-rz(pi/2) q[3];
-sx q[3];
-rz(-2.8758029) q[3];
-sx q[3];
-rz(-pi/2) q[3];
-cx q[1],q[3];
-rz(pi/2) q[1];
-sx q[1];
-rz(4.44659921584326) q[1];
-sx q[1];
-rz(5*pi/2) q[1];
-rz(-pi/2) q[3];
-sx q[3];
-rz(pi/2) q[3];
-cx q[3],q[1];
-rz(-pi) q[3];
-sx q[3];
-rz(-pi/2) q[3];
-cx q[1],q[3];
-rz(-0.94750035) q[1];
-sx q[1];
-rz(-2.894328) q[1];
-sx q[1];
-rz(2.9523523) q[1];
-x q[3];
-rz(pi/2) q[4];
-sx q[4];
-rz(-2.8758029) q[4];
-sx q[4];
-rz(-pi/2) q[4];
-cx q[2],q[4];
-rz(pi/2) q[2];
-sx q[2];
-rz(4.44659921584326) q[2];
-sx q[2];
-rz(5*pi/2) q[2];
-rz(-pi/2) q[4];
-sx q[4];
-rz(pi/2) q[4];
-cx q[4],q[2];
-rz(-pi) q[4];
-sx q[4];
-rz(-pi/2) q[4];
-cx q[2],q[4];
-rz(-0.94750035) q[2];
-sx q[2];
-rz(-2.894328) q[2];
-sx q[2];
-rz(2.9523523) q[2];
-sx q[4];
-rz(-pi) q[4];
-cx q[4],q[3];
-rz(-pi/2) q[3];
-sx q[3];
-rz(pi/2) q[3];
-rz(pi/2) q[4];
-sx q[4];
-rz(4.44659921584326) q[4];
-sx q[4];
-rz(5*pi/2) q[4];
-cx q[3],q[4];
-rz(-pi) q[3];
-sx q[3];
-rz(-pi/2) q[3];
-cx q[4],q[3];
-sx q[3];
-rz(-pi) q[3];
-rz(-pi) q[4];
-sx q[4];
-rz(-pi) q[4];
-rz(pi/2) q[5];
-sx q[5];
-rz(-2.8758029) q[5];
-sx q[5];
-rz(-pi/2) q[5];
-cx q[0],q[5];
-rz(pi/2) q[0];
-sx q[0];
-rz(4.44659921584326) q[0];
-sx q[0];
-rz(5*pi/2) q[0];
-rz(-pi/2) q[5];
-sx q[5];
-rz(pi/2) q[5];
-cx q[5],q[0];
-rz(-pi) q[5];
-sx q[5];
-rz(-pi/2) q[5];
-cx q[0],q[5];
-rz(-2.7019119) q[0];
-sx q[0];
-rz(-1.6168538) q[0];
-sx q[0];
-rz(1.3277727) q[0];
-cx q[0],q[1];
-rz(pi/2) q[0];
-sx q[0];
-rz(4.2451156842794) q[0];
-sx q[0];
-rz(5*pi/2) q[0];
-rz(-pi/2) q[1];
-sx q[1];
-rz(pi/2) q[1];
-cx q[1],q[0];
-rz(-pi) q[1];
-sx q[1];
-rz(-pi/2) q[1];
-cx q[0],q[1];
-sx q[0];
-cx q[0],q[2];
-rz(pi/2) q[0];
-sx q[0];
-rz(4.2451156842794) q[0];
-sx q[0];
-rz(5*pi/2) q[0];
-rz(-pi) q[1];
-sx q[1];
-rz(-pi/2) q[2];
-sx q[2];
-rz(pi/2) q[2];
-cx q[2],q[0];
-rz(-pi) q[2];
-sx q[2];
-rz(-pi/2) q[2];
-cx q[0],q[2];
-sx q[0];
-cx q[1],q[2];
-rz(pi/2) q[1];
-sx q[1];
-rz(4.2451156842794) q[1];
-sx q[1];
-rz(5*pi/2) q[1];
-rz(-pi/2) q[2];
-sx q[2];
-rz(pi/2) q[2];
-cx q[2],q[1];
-rz(-pi) q[2];
-sx q[2];
-rz(-pi/2) q[2];
-cx q[1],q[2];
-sx q[1];
-rz(-pi) q[2];
-sx q[2];
-x q[5];
-cx q[4],q[5];
-rz(pi/2) q[4];
-sx q[4];
-rz(4.44659921584326) q[4];
-sx q[4];
-rz(5*pi/2) q[4];
-rz(-pi/2) q[5];
-sx q[5];
-rz(pi/2) q[5];
-cx q[5],q[4];
-rz(-pi) q[5];
-sx q[5];
-rz(-pi/2) q[5];
-cx q[4],q[5];
-rz(-0.94750035) q[4];
-sx q[4];
-rz(-2.894328) q[4];
-sx q[4];
-rz(2.9523523) q[4];
-cx q[2],q[4];
-rz(pi/2) q[2];
-sx q[2];
-rz(4.2451156842794) q[2];
-sx q[2];
-rz(5*pi/2) q[2];
-rz(-pi/2) q[4];
-sx q[4];
-rz(pi/2) q[4];
-cx q[4],q[2];
-rz(-pi) q[4];
-sx q[4];
-rz(-pi/2) q[4];
-cx q[2],q[4];
-rz(-1.0281169) q[2];
-sx q[2];
-rz(-1.7053215) q[2];
-sx q[2];
-rz(-0.080708935) q[2];
-rz(-pi) q[4];
-sx q[4];
-x q[5];
-cx q[3],q[5];
-rz(pi/2) q[3];
-sx q[3];
-rz(4.44659921584326) q[3];
-sx q[3];
-rz(5*pi/2) q[3];
-rz(-pi/2) q[5];
-sx q[5];
-rz(pi/2) q[5];
-cx q[5],q[3];
-rz(-pi) q[5];
-sx q[5];
-rz(-pi/2) q[5];
-cx q[3],q[5];
-rz(-0.94750035) q[3];
-sx q[3];
-rz(-2.894328) q[3];
-sx q[3];
-rz(2.9523523) q[3];
-cx q[1],q[3];
-rz(pi/2) q[1];
-sx q[1];
-rz(4.2451156842794) q[1];
-sx q[1];
-rz(5*pi/2) q[1];
-rz(-pi/2) q[3];
-sx q[3];
-rz(pi/2) q[3];
-cx q[3],q[1];
-rz(-pi) q[3];
-sx q[3];
-rz(-pi/2) q[3];
-cx q[1],q[3];
-rz(-1.0281169) q[1];
-sx q[1];
-rz(-1.7053215) q[1];
-sx q[1];
-rz(-0.080708935) q[1];
-cx q[4],q[3];
-rz(-pi/2) q[3];
-sx q[3];
-rz(pi/2) q[3];
-rz(pi/2) q[4];
-sx q[4];
-rz(4.2451156842794) q[4];
-sx q[4];
-rz(5*pi/2) q[4];
-cx q[3],q[4];
-rz(-pi) q[3];
-sx q[3];
-rz(-pi/2) q[3];
-cx q[4],q[3];
-rz(-pi) q[3];
-sx q[3];
-sx q[4];
-rz(2.1940923) q[5];
-sx q[5];
-rz(-2.894328) q[5];
-sx q[5];
-rz(2.9523523) q[5];
-cx q[0],q[5];
-rz(pi/2) q[0];
-sx q[0];
-rz(4.2451156842794) q[0];
-sx q[0];
-rz(5*pi/2) q[0];
-rz(-pi/2) q[5];
-sx q[5];
-rz(pi/2) q[5];
-cx q[5],q[0];
-rz(-pi) q[5];
-sx q[5];
-rz(-pi/2) q[5];
-cx q[0],q[5];
-rz(-1.0281169) q[0];
-sx q[0];
-rz(-1.7053215) q[0];
-sx q[0];
-rz(-0.080708935) q[0];
-cx q[4],q[5];
-rz(pi/2) q[4];
-sx q[4];
-rz(4.2451156842794) q[4];
-sx q[4];
-rz(5*pi/2) q[4];
-rz(-pi/2) q[5];
-sx q[5];
-rz(pi/2) q[5];
-cx q[5],q[4];
-rz(-pi) q[5];
-sx q[5];
-rz(-pi/2) q[5];
-cx q[4],q[5];
-cx q[3],q[5];
-rz(pi/2) q[3];
-sx q[3];
-rz(4.2451156842794) q[3];
-sx q[3];
-rz(5*pi/2) q[3];
-rz(-1.0281169) q[4];
-sx q[4];
-rz(-1.7053215) q[4];
-sx q[4];
-rz(-0.080708935) q[4];
-rz(-pi/2) q[5];
-sx q[5];
-rz(pi/2) q[5];
-cx q[5],q[3];
-rz(-pi) q[5];
-sx q[5];
-rz(-pi/2) q[5];
-cx q[3],q[5];
-rz(-1.0281169) q[3];
-sx q[3];
-rz(-1.7053215) q[3];
-sx q[3];
-rz(-0.080708935) q[3];
-rz(2.1134758) q[5];
-sx q[5];
-rz(-1.7053215) q[5];
-sx q[5];
-rz(-0.080708935) q[5];
-measure q[0] -> mm[0];
-measure q[1] -> mm[1];
-measure q[2] -> mm[2];
-measure q[3] -> mm[3];
-measure q[4] -> mm[4];
-measure q[5] -> mm[5];
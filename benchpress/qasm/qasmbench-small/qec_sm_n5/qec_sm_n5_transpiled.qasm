@@ -1,20 +0,0 @@
-OPENQASM 2.0;
-include "qelib1.inc";
-qreg q[3];
-qreg a[2];
-creg c[3];
-creg syn[2];
-x q[0];
-barrier q[0],q[1],q[2];
-cx q[0],a[0];
-cx q[1],a[0];
-cx q[1],a[1];
-cx q[2],a[1];
-measure a[0] -> syn[0];
-measure a[1] -> syn[1];
-if(syn==1) x q[0];
-measure q[0] -> c[0];
-if(syn==2) x q[2];
-if(syn==3) x q[1];
-measure q[1] -> c[1];
-measure q[2] -> c[2];
@@ -1,166 +0,0 @@
-OPENQASM 2.0;
-include "qelib1.inc";
-qreg q[9];
-creg c[6];
-rz(pi/2) q[0];
-sx q[0];
-rz(pi/2) q[0];
-rz(pi/2) q[1];
-sx q[1];
-rz(pi/2) q[1];
-rz(pi/2) q[2];
-sx q[2];
-rz(pi/2) q[2];
-rz(pi/2) q[3];
-sx q[3];
-rz(pi/2) q[3];
-rz(pi/2) q[4];
-sx q[4];
-rz(pi/2) q[4];
-rz(pi/2) q[5];
-sx q[5];
-rz(pi/2) q[5];
-x q[6];
-x q[7];
-x q[8];
-barrier q[0],q[1],q[2],q[3],q[4],q[5],q[6],q[7],q[8];
-rz(pi/2) q[7];
-sx q[7];
-rz(pi/2) q[7];
-cx q[6],q[7];
-rz(-pi/4) q[7];
-cx q[5],q[7];
-rz(pi/4) q[7];
-cx q[6],q[7];
-rz(pi/4) q[6];
-rz(-pi/4) q[7];
-cx q[5],q[7];
-cx q[5],q[6];
-rz(pi/4) q[5];
-rz(-pi/4) q[6];
-cx q[5],q[6];
-rz(3*pi/4) q[7];
-sx q[7];
-rz(pi/2) q[7];
-rz(pi/2) q[8];
-sx q[8];
-rz(pi/2) q[8];
-cx q[7],q[8];
-rz(pi/2) q[7];
-sx q[7];
-rz(pi/2) q[7];
-cx q[6],q[7];
-rz(-pi/4) q[7];
-cx q[5],q[7];
-rz(pi/4) q[7];
-cx q[6],q[7];
-rz(pi/4) q[6];
-rz(-pi/4) q[7];
-cx q[5],q[7];
-cx q[5],q[6];
-rz(pi/4) q[5];
-rz(-pi/4) q[6];
-cx q[5],q[6];
-rz(3*pi/4) q[7];
-sx q[7];
-rz(pi/2) q[7];
-rz(pi/2) q[8];
-sx q[8];
-rz(pi/2) q[8];
-barrier q[0],q[1],q[2],q[3],q[4],q[5],q[6],q[7],q[8];
-rz(-pi/64) q[5];
-cx q[5],q[0];
-rz(pi/64) q[0];
-cx q[5],q[0];
-rz(-pi/64) q[0];
-rz(-pi/32) q[5];
-cx q[5],q[1];
-rz(pi/32) q[1];
-cx q[5],q[1];
-rz(-pi/32) q[1];
-rz(-pi/16) q[5];
-cx q[5],q[2];
-rz(pi/16) q[2];
-cx q[5],q[2];
-rz(-pi/16) q[2];
-rz(-pi/8) q[5];
-cx q[5],q[3];
-rz(pi/8) q[3];
-cx q[5],q[3];
-rz(-pi/8) q[3];
-rz(-pi/4) q[5];
-cx q[5],q[4];
-rz(pi/4) q[4];
-cx q[5],q[4];
-rz(-0.88357293) q[4];
-cx q[4],q[0];
-rz(pi/32) q[0];
-cx q[4],q[0];
-rz(-pi/32) q[0];
-rz(-pi/16) q[4];
-cx q[4],q[1];
-rz(pi/16) q[1];
-cx q[4],q[1];
-rz(-pi/16) q[1];
-rz(-pi/8) q[4];
-cx q[4],q[2];
-rz(pi/8) q[2];
-cx q[4],q[2];
-rz(-pi/8) q[2];
-rz(-pi/4) q[4];
-cx q[4],q[3];
-rz(pi/4) q[3];
-cx q[4],q[3];
-rz(-5*pi/16) q[3];
-cx q[3],q[0];
-rz(pi/16) q[0];
-cx q[3],q[0];
-rz(-pi/16) q[0];
-rz(-pi/8) q[3];
-cx q[3],q[1];
-rz(pi/8) q[1];
-cx q[3],q[1];
-rz(-pi/8) q[1];
-rz(-pi/4) q[3];
-cx q[3],q[2];
-rz(pi/4) q[2];
-cx q[3],q[2];
-rz(-3*pi/8) q[2];
-cx q[2],q[0];
-rz(pi/8) q[0];
-cx q[2],q[0];
-rz(-pi/8) q[0];
-rz(-pi/4) q[2];
-cx q[2],q[1];
-rz(pi/4) q[1];
-cx q[2],q[1];
-rz(-pi/2) q[1];
-cx q[1],q[0];
-rz(pi/4) q[0];
-cx q[1],q[0];
-rz(-pi/4) q[0];
-barrier q[0],q[1],q[2],q[3],q[4],q[5],q[6],q[7],q[8];
-rz(pi/2) q[0];
-sx q[0];
-rz(pi/2) q[0];
-rz(pi/2) q[1];
-sx q[1];
-rz(pi/2) q[1];
-rz(pi/2) q[2];
-sx q[2];
-rz(pi/2) q[2];
-rz(pi/2) q[3];
-sx q[3];
-rz(pi/2) q[3];
-rz(pi/2) q[4];
-sx q[4];
-rz(pi/2) q[4];
-rz(pi/2) q[5];
-sx q[5];
-rz(pi/2) q[5];
-measure q[0] -> c[0];
-measure q[1] -> c[1];
-measure q[2] -> c[2];
-measure q[3] -> c[3];
-measure q[4] -> c[4];
-measure q[5] -> c[5];
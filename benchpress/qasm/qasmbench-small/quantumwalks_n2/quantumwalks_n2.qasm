@@ -1,18 +0,0 @@
-OPENQASM 2.0;
-include "qelib1.inc";
-qreg q1[2];
-creg c1[2];
-u3(1.5705854245991118,-3.1667235621803993,-1.58730875641222e-05) q1[0];
-u3(0.7864502280785407,1.4997452219669574,0.050219564359156976) q1[1];
-cx q1[0],q1[1];
-u3(0.050224804187928476,-3.3306690738754696e-15,3.1415926535897967) q1[0];
-u3(1.6418473665068425,-1.5707963267948966,3.141592653589794) q1[1];
-cx q1[0],q1[1];
-u3(1.4956790561350626e-05,1.5707963268001452,3.1415926535845444) q1[0];
-u3(1.5707963267948966,1.5707963267948968,3.141592653589793) q1[1];
-cx q1[0],q1[1];
-u3(1.5705854245991133,-3.1416085266773286,-0.02513090859065059) q1[0];
-u3(2.3547213646862812,3.091394193838764,-0.07102121943155337) q1[1];
-measure q1[0] -> c1[0];
-measure q1[1] -> c1[1];
-
@@ -1,44 +0,0 @@
-OPENQASM 2.0;
-include "qelib1.inc";
-qreg q1[2];
-creg c1[2];
-rz(-1.58730875641222e-5) q1[0];
-sx q1[0];
-rz(4.7121780781889) q1[0];
-sx q1[0];
-rz(6.25805439858898) q1[0];
-rz(0.050219564359157) q1[1];
-sx q1[1];
-rz(3.92804288166833) q1[1];
-sx q1[1];
-rz(10.9245231827363) q1[1];
-cx q1[0],q1[1];
-sx q1[0];
-rz(3.0913678) q1[0];
-sx q1[0];
-sx q1[1];
-rz(1.4997453) q1[1];
-sx q1[1];
-rz(-pi/2) q1[1];
-cx q1[0],q1[1];
-rz(pi) q1[0];
-sx q1[0];
-rz(3.14160761038035) q1[0];
-sx q1[0];
-rz(7*pi/2) q1[0];
-rz(pi/2) q1[1];
-sx q1[1];
-rz(-pi) q1[1];
-cx q1[0],q1[1];
-rz(-0.0251309085906506) q1[0];
-sx q1[0];
-rz(4.71217807818891) q1[0];
-sx q1[0];
-rz(6.28316943409205) q1[0];
-rz(-0.0710212194315534) q1[1];
-sx q1[1];
-rz(5.49631401827607) q1[1];
-sx q1[1];
-rz(12.5161721546081) q1[1];
-measure q1[0] -> c1[0];
-measure q1[1] -> c1[1];
@@ -1,68 +0,0 @@
-OPENQASM 2.0;
-include "qelib1.inc";
-qreg q[6];
-creg c[6];
-rz(pi/2) q[0];
-sx q[0];
-rz(pi/2) q[0];
-rz(pi/2) q[1];
-sx q[1];
-rz(pi/2) q[1];
-rz(pi/2) q[2];
-sx q[2];
-rz(pi/2) q[2];
-barrier q[0],q[1],q[2],q[3],q[4],q[5];
-cx q[2],q[4];
-x q[3];
-cx q[2],q[3];
-rz(pi/2) q[3];
-sx q[3];
-rz(pi/2) q[3];
-cx q[1],q[3];
-rz(-pi/4) q[3];
-cx q[0],q[3];
-rz(pi/4) q[3];
-cx q[1],q[3];
-rz(pi/4) q[1];
-rz(-pi/4) q[3];
-cx q[0],q[3];
-cx q[0],q[1];
-rz(pi/4) q[0];
-rz(-pi/4) q[1];
-cx q[0],q[1];
-x q[0];
-x q[1];
-rz(pi/4) q[3];
-cx q[1],q[3];
-rz(-pi/4) q[3];
-cx q[0],q[3];
-rz(pi/4) q[3];
-cx q[1],q[3];
-rz(pi/4) q[1];
-rz(-pi/4) q[3];
-cx q[0],q[3];
-cx q[0],q[1];
-rz(pi/4) q[0];
-rz(-pi/4) q[1];
-cx q[0],q[1];
-x q[0];
-x q[1];
-rz(-pi/4) q[3];
-sx q[3];
-rz(pi/2) q[3];
-barrier q[0],q[1],q[2],q[3],q[4],q[5];
-rz(pi/2) q[0];
-sx q[0];
-rz(pi/2) q[0];
-rz(pi/2) q[1];
-sx q[1];
-rz(pi/2) q[1];
-rz(pi/2) q[2];
-sx q[2];
-rz(pi/2) q[2];
-measure q[0] -> c[0];
-measure q[1] -> c[1];
-measure q[2] -> c[2];
-measure q[3] -> c[3];
-measure q[4] -> c[4];
-measure q[5] -> c[5];
@@ -1,28 +0,0 @@
-OPENQASM 2.0;
-include "qelib1.inc";
-qreg a[3];
-creg c[3];
-x a[0];
-x a[1];
-rz(pi/2) a[2];
-sx a[2];
-rz(pi/2) a[2];
-cx a[1],a[2];
-rz(-pi/4) a[2];
-cx a[0],a[2];
-rz(pi/4) a[2];
-cx a[1],a[2];
-rz(-pi/4) a[1];
-rz(-pi/4) a[2];
-cx a[0],a[2];
-cx a[0],a[1];
-rz(-pi/4) a[1];
-cx a[0],a[1];
-rz(pi/4) a[0];
-rz(pi/2) a[1];
-rz(3*pi/4) a[2];
-sx a[2];
-rz(pi/2) a[2];
-measure a[0] -> c[0];
-measure a[1] -> c[1];
-measure a[2] -> c[2];
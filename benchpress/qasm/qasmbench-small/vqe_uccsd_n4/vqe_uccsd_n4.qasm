@@ -1,224 +0,0 @@
-OPENQASM 2.0;
-include "qelib1.inc";
-qreg reg[4];
-h reg[3];
-h reg[2];
-h reg[0];
-h reg[0];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(2.151746e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-h reg[3];
-h reg[2];
-h reg[0];
-h reg[0];
-y reg[3];
-y reg[2];
-y reg[0];
-y reg[0];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(2.151746e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-y reg[3];
-y reg[2];
-y reg[0];
-y reg[0];
-h reg[3];
-y reg[2];
-h reg[0];
-y reg[0];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(2.151746e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-h reg[3];
-y reg[2];
-h reg[0];
-y reg[0];
-y reg[3];
-h reg[2];
-y reg[0];
-h reg[0];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(2.151746e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-y reg[3];
-h reg[2];
-y reg[0];
-h reg[0];
-y reg[3];
-y reg[2];
-h reg[0];
-h reg[0];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(2.151746e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-y reg[3];
-y reg[2];
-h reg[0];
-h reg[0];
-h reg[3];
-h reg[2];
-y reg[0];
-y reg[0];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(2.151746e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-h reg[3];
-h reg[2];
-y reg[0];
-y reg[0];
-y reg[3];
-h reg[2];
-h reg[0];
-y reg[0];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(2.151746e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-y reg[3];
-h reg[2];
-h reg[0];
-y reg[0];
-h reg[3];
-y reg[2];
-y reg[0];
-h reg[0];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(2.151746e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-h reg[3];
-y reg[2];
-y reg[0];
-h reg[0];
-h reg[1];
-h reg[0];
-cx reg[1],reg[0];
-rz(1.995482e+00) reg[0];
-cx reg[1],reg[0];
-h reg[1];
-h reg[0];
-y reg[1];
-y reg[0];
-cx reg[1],reg[0];
-rz(1.995482e+00) reg[0];
-cx reg[1],reg[0];
-y reg[1];
-y reg[0];
-h reg[2];
-h reg[0];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(4.332582e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-h reg[2];
-h reg[0];
-y reg[2];
-y reg[0];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(4.332582e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-y reg[2];
-y reg[0];
-h reg[2];
-h reg[1];
-cx reg[2],reg[1];
-rz(4.619220e-01) reg[1];
-cx reg[2],reg[1];
-h reg[2];
-h reg[1];
-y reg[2];
-y reg[1];
-cx reg[2],reg[1];
-rz(4.619220e-01) reg[1];
-cx reg[2],reg[1];
-y reg[2];
-y reg[1];
-h reg[3];
-h reg[0];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(1.086976e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-h reg[3];
-h reg[0];
-y reg[3];
-y reg[0];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(1.086976e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-y reg[3];
-y reg[0];
-h reg[3];
-h reg[1];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-rz(2.258394e+00) reg[1];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-h reg[3];
-h reg[1];
-y reg[3];
-y reg[1];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-rz(2.258394e+00) reg[1];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-y reg[3];
-y reg[1];
-h reg[3];
-h reg[2];
-cx reg[3],reg[2];
-rz(1.228531e+00) reg[2];
-cx reg[3],reg[2];
-h reg[3];
-h reg[2];
-y reg[3];
-y reg[2];
-cx reg[3],reg[2];
-rz(1.228531e+00) reg[2];
-cx reg[3],reg[2];
-y reg[3];
-y reg[2];
-
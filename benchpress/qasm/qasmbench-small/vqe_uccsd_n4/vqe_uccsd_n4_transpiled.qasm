@@ -1,241 +0,0 @@
-OPENQASM 2.0;
-include "qelib1.inc";
-qreg reg[4];
-rz(pi/2) reg[2];
-sx reg[2];
-rz(pi/2) reg[2];
-rz(pi/2) reg[3];
-sx reg[3];
-rz(pi/2) reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(2.151746) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-rz(-pi/2) reg[2];
-sx reg[2];
-rz(-pi/2) reg[2];
-rz(-pi/2) reg[3];
-sx reg[3];
-rz(-pi/2) reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(2.151746) reg[0];
-cx reg[1],reg[0];
-rz(-pi/2) reg[0];
-sx reg[0];
-rz(-pi/2) reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-rz(-pi/2) reg[3];
-sx reg[3];
-rz(-pi/2) reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(2.151746) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-rz(-pi/2) reg[2];
-sx reg[2];
-rz(-pi/2) reg[2];
-rz(-pi/2) reg[3];
-sx reg[3];
-rz(-pi/2) reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(2.151746) reg[0];
-cx reg[1],reg[0];
-rz(-pi/2) reg[0];
-sx reg[0];
-rz(-pi/2) reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-rz(-pi/2) reg[2];
-sx reg[2];
-rz(-pi/2) reg[2];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(2.151746) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-rz(-pi/2) reg[2];
-sx reg[2];
-rz(-pi/2) reg[2];
-rz(-pi/2) reg[3];
-sx reg[3];
-rz(-pi/2) reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(2.151746) reg[0];
-cx reg[1],reg[0];
-rz(-pi/2) reg[0];
-sx reg[0];
-rz(-pi/2) reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-rz(-pi/2) reg[3];
-sx reg[3];
-rz(-pi/2) reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(2.151746) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-rz(-pi/2) reg[2];
-sx reg[2];
-rz(-pi/2) reg[2];
-rz(-pi/2) reg[3];
-sx reg[3];
-rz(-pi/2) reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(2.151746) reg[0];
-cx reg[1],reg[0];
-rz(-pi) reg[0];
-x reg[0];
-cx reg[2],reg[1];
-rz(pi/2) reg[1];
-sx reg[1];
-rz(pi/2) reg[1];
-cx reg[1],reg[0];
-rz(1.995482) reg[0];
-cx reg[1],reg[0];
-rz(-pi/2) reg[0];
-sx reg[0];
-rz(-pi/2) reg[0];
-rz(-pi/2) reg[1];
-sx reg[1];
-rz(-pi/2) reg[1];
-cx reg[1],reg[0];
-rz(1.995482) reg[0];
-cx reg[1],reg[0];
-rz(-pi/2) reg[0];
-sx reg[0];
-rz(-pi/2) reg[0];
-rz(-pi) reg[1];
-x reg[1];
-cx reg[3],reg[2];
-rz(-pi/2) reg[2];
-sx reg[2];
-rz(-pi/2) reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(4.332582) reg[0];
-cx reg[1],reg[0];
-rz(-pi/2) reg[0];
-sx reg[0];
-rz(-pi/2) reg[0];
-cx reg[2],reg[1];
-rz(-pi/2) reg[2];
-sx reg[2];
-rz(-pi/2) reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(4.332582) reg[0];
-cx reg[1],reg[0];
-rz(-pi/2) reg[0];
-sx reg[0];
-rz(-pi/2) reg[0];
-cx reg[2],reg[1];
-rz(pi/2) reg[1];
-sx reg[1];
-rz(pi/2) reg[1];
-rz(-pi/2) reg[2];
-sx reg[2];
-rz(-pi/2) reg[2];
-cx reg[2],reg[1];
-rz(0.461922) reg[1];
-cx reg[2],reg[1];
-rz(-pi/2) reg[1];
-sx reg[1];
-rz(-pi/2) reg[1];
-rz(-pi/2) reg[2];
-sx reg[2];
-rz(-pi/2) reg[2];
-cx reg[2],reg[1];
-rz(0.461922) reg[1];
-cx reg[2],reg[1];
-rz(-pi) reg[1];
-x reg[1];
-rz(-pi) reg[2];
-x reg[2];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(1.086976) reg[0];
-cx reg[1],reg[0];
-rz(-pi/2) reg[0];
-sx reg[0];
-rz(-pi/2) reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-rz(-pi/2) reg[3];
-sx reg[3];
-rz(-pi/2) reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(1.086976) reg[0];
-cx reg[1],reg[0];
-rz(-pi) reg[0];
-x reg[0];
-cx reg[2],reg[1];
-rz(pi/2) reg[1];
-sx reg[1];
-rz(pi/2) reg[1];
-cx reg[3],reg[2];
-rz(-pi/2) reg[3];
-sx reg[3];
-rz(-pi/2) reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-rz(2.258394) reg[1];
-cx reg[2],reg[1];
-rz(-pi/2) reg[1];
-sx reg[1];
-rz(-pi/2) reg[1];
-cx reg[3],reg[2];
-rz(-pi/2) reg[3];
-sx reg[3];
-rz(-pi/2) reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-rz(2.258394) reg[1];
-cx reg[2],reg[1];
-rz(-pi) reg[1];
-x reg[1];
-cx reg[3],reg[2];
-rz(pi/2) reg[2];
-sx reg[2];
-rz(pi/2) reg[2];
-rz(-pi/2) reg[3];
-sx reg[3];
-rz(-pi/2) reg[3];
-cx reg[3],reg[2];
-rz(1.228531) reg[2];
-cx reg[3],reg[2];
-rz(-pi/2) reg[2];
-sx reg[2];
-rz(-pi/2) reg[2];
-rz(-pi/2) reg[3];
-sx reg[3];
-rz(-pi/2) reg[3];
-cx reg[3],reg[2];
-rz(1.228531) reg[2];
-cx reg[3],reg[2];
-rz(-pi) reg[2];
-x reg[2];
-rz(-pi) reg[3];
-x reg[3];
@@ -1,2285 +0,0 @@
-OPENQASM 2.0;
-include "qelib1.inc";
-qreg reg[6];
-h reg[3];
-h reg[2];
-h reg[0];
-h reg[0];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(4.638775e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-h reg[3];
-h reg[2];
-h reg[0];
-h reg[0];
-y reg[3];
-y reg[2];
-y reg[0];
-y reg[0];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(4.638775e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-y reg[3];
-y reg[2];
-y reg[0];
-y reg[0];
-h reg[3];
-y reg[2];
-h reg[0];
-y reg[0];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(4.638775e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-h reg[3];
-y reg[2];
-h reg[0];
-y reg[0];
-y reg[3];
-h reg[2];
-y reg[0];
-h reg[0];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(4.638775e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-y reg[3];
-h reg[2];
-y reg[0];
-h reg[0];
-y reg[3];
-y reg[2];
-h reg[0];
-h reg[0];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(4.638775e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-y reg[3];
-y reg[2];
-h reg[0];
-h reg[0];
-h reg[3];
-h reg[2];
-y reg[0];
-y reg[0];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(4.638775e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-h reg[3];
-h reg[2];
-y reg[0];
-y reg[0];
-y reg[3];
-h reg[2];
-h reg[0];
-y reg[0];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(4.638775e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-y reg[3];
-h reg[2];
-h reg[0];
-y reg[0];
-h reg[3];
-y reg[2];
-y reg[0];
-h reg[0];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(4.638775e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-h reg[3];
-y reg[2];
-y reg[0];
-h reg[0];
-h reg[4];
-h reg[2];
-h reg[0];
-h reg[0];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(5.570539e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-h reg[4];
-h reg[2];
-h reg[0];
-h reg[0];
-y reg[4];
-y reg[2];
-y reg[0];
-y reg[0];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(5.570539e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-y reg[4];
-y reg[2];
-y reg[0];
-y reg[0];
-h reg[4];
-y reg[2];
-h reg[0];
-y reg[0];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(5.570539e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-h reg[4];
-y reg[2];
-h reg[0];
-y reg[0];
-y reg[4];
-h reg[2];
-y reg[0];
-h reg[0];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(5.570539e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-y reg[4];
-h reg[2];
-y reg[0];
-h reg[0];
-y reg[4];
-y reg[2];
-h reg[0];
-h reg[0];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(5.570539e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-y reg[4];
-y reg[2];
-h reg[0];
-h reg[0];
-h reg[4];
-h reg[2];
-y reg[0];
-y reg[0];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(5.570539e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-h reg[4];
-h reg[2];
-y reg[0];
-y reg[0];
-y reg[4];
-h reg[2];
-h reg[0];
-y reg[0];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(5.570539e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-y reg[4];
-h reg[2];
-h reg[0];
-y reg[0];
-h reg[4];
-y reg[2];
-y reg[0];
-h reg[0];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(5.570539e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-h reg[4];
-y reg[2];
-y reg[0];
-h reg[0];
-h reg[4];
-h reg[3];
-h reg[0];
-h reg[0];
-cx reg[4],reg[3];
-cx reg[3],reg[1];
-cx reg[1],reg[0];
-rz(5.663952e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[3],reg[1];
-cx reg[4],reg[3];
-h reg[4];
-h reg[3];
-h reg[0];
-h reg[0];
-y reg[4];
-y reg[3];
-y reg[0];
-y reg[0];
-cx reg[4],reg[3];
-cx reg[3],reg[1];
-cx reg[1],reg[0];
-rz(5.663952e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[3],reg[1];
-cx reg[4],reg[3];
-y reg[4];
-y reg[3];
-y reg[0];
-y reg[0];
-h reg[4];
-y reg[3];
-h reg[0];
-y reg[0];
-cx reg[4],reg[3];
-cx reg[3],reg[1];
-cx reg[1],reg[0];
-rz(5.663952e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[3],reg[1];
-cx reg[4],reg[3];
-h reg[4];
-y reg[3];
-h reg[0];
-y reg[0];
-y reg[4];
-h reg[3];
-y reg[0];
-h reg[0];
-cx reg[4],reg[3];
-cx reg[3],reg[1];
-cx reg[1],reg[0];
-rz(5.663952e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[3],reg[1];
-cx reg[4],reg[3];
-y reg[4];
-h reg[3];
-y reg[0];
-h reg[0];
-y reg[4];
-y reg[3];
-h reg[0];
-h reg[0];
-cx reg[4],reg[3];
-cx reg[3],reg[1];
-cx reg[1],reg[0];
-rz(5.663952e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[3],reg[1];
-cx reg[4],reg[3];
-y reg[4];
-y reg[3];
-h reg[0];
-h reg[0];
-h reg[4];
-h reg[3];
-y reg[0];
-y reg[0];
-cx reg[4],reg[3];
-cx reg[3],reg[1];
-cx reg[1],reg[0];
-rz(5.663952e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[3],reg[1];
-cx reg[4],reg[3];
-h reg[4];
-h reg[3];
-y reg[0];
-y reg[0];
-y reg[4];
-h reg[3];
-h reg[0];
-y reg[0];
-cx reg[4],reg[3];
-cx reg[3],reg[1];
-cx reg[1],reg[0];
-rz(5.663952e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[3],reg[1];
-cx reg[4],reg[3];
-y reg[4];
-h reg[3];
-h reg[0];
-y reg[0];
-h reg[4];
-y reg[3];
-y reg[0];
-h reg[0];
-cx reg[4],reg[3];
-cx reg[3],reg[1];
-cx reg[1],reg[0];
-rz(5.663952e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[3],reg[1];
-cx reg[4],reg[3];
-h reg[4];
-y reg[3];
-y reg[0];
-h reg[0];
-h reg[4];
-h reg[3];
-h reg[0];
-h reg[0];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(5.530073e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-h reg[4];
-h reg[3];
-h reg[0];
-h reg[0];
-y reg[4];
-y reg[3];
-y reg[0];
-y reg[0];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(5.530073e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-y reg[4];
-y reg[3];
-y reg[0];
-y reg[0];
-h reg[4];
-y reg[3];
-h reg[0];
-y reg[0];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(5.530073e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-h reg[4];
-y reg[3];
-h reg[0];
-y reg[0];
-y reg[4];
-h reg[3];
-y reg[0];
-h reg[0];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(5.530073e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-y reg[4];
-h reg[3];
-y reg[0];
-h reg[0];
-y reg[4];
-y reg[3];
-h reg[0];
-h reg[0];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(5.530073e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-y reg[4];
-y reg[3];
-h reg[0];
-h reg[0];
-h reg[4];
-h reg[3];
-y reg[0];
-y reg[0];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(5.530073e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-h reg[4];
-h reg[3];
-y reg[0];
-y reg[0];
-y reg[4];
-h reg[3];
-h reg[0];
-y reg[0];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(5.530073e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-y reg[4];
-h reg[3];
-h reg[0];
-y reg[0];
-h reg[4];
-y reg[3];
-y reg[0];
-h reg[0];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(5.530073e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-h reg[4];
-y reg[3];
-y reg[0];
-h reg[0];
-h reg[4];
-h reg[3];
-h reg[1];
-h reg[1];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-rz(2.009105e+00) reg[1];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-h reg[4];
-h reg[3];
-h reg[1];
-h reg[1];
-y reg[4];
-y reg[3];
-y reg[1];
-y reg[1];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-rz(2.009105e+00) reg[1];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-y reg[4];
-y reg[3];
-y reg[1];
-y reg[1];
-h reg[4];
-y reg[3];
-h reg[1];
-y reg[1];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-rz(2.009105e+00) reg[1];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-h reg[4];
-y reg[3];
-h reg[1];
-y reg[1];
-y reg[4];
-h reg[3];
-y reg[1];
-h reg[1];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-rz(2.009105e+00) reg[1];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-y reg[4];
-h reg[3];
-y reg[1];
-h reg[1];
-y reg[4];
-y reg[3];
-h reg[1];
-h reg[1];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-rz(2.009105e+00) reg[1];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-y reg[4];
-y reg[3];
-h reg[1];
-h reg[1];
-h reg[4];
-h reg[3];
-y reg[1];
-y reg[1];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-rz(2.009105e+00) reg[1];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-h reg[4];
-h reg[3];
-y reg[1];
-y reg[1];
-y reg[4];
-h reg[3];
-h reg[1];
-y reg[1];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-rz(2.009105e+00) reg[1];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-y reg[4];
-h reg[3];
-h reg[1];
-y reg[1];
-h reg[4];
-y reg[3];
-y reg[1];
-h reg[1];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-rz(2.009105e+00) reg[1];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-h reg[4];
-y reg[3];
-y reg[1];
-h reg[1];
-h reg[5];
-h reg[2];
-h reg[0];
-h reg[0];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(2.140866e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-h reg[5];
-h reg[2];
-h reg[0];
-h reg[0];
-y reg[5];
-y reg[2];
-y reg[0];
-y reg[0];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(2.140866e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-y reg[5];
-y reg[2];
-y reg[0];
-y reg[0];
-h reg[5];
-y reg[2];
-h reg[0];
-y reg[0];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(2.140866e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-h reg[5];
-y reg[2];
-h reg[0];
-y reg[0];
-y reg[5];
-h reg[2];
-y reg[0];
-h reg[0];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(2.140866e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-y reg[5];
-h reg[2];
-y reg[0];
-h reg[0];
-y reg[5];
-y reg[2];
-h reg[0];
-h reg[0];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(2.140866e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-y reg[5];
-y reg[2];
-h reg[0];
-h reg[0];
-h reg[5];
-h reg[2];
-y reg[0];
-y reg[0];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(2.140866e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-h reg[5];
-h reg[2];
-y reg[0];
-y reg[0];
-y reg[5];
-h reg[2];
-h reg[0];
-y reg[0];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(2.140866e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-y reg[5];
-h reg[2];
-h reg[0];
-y reg[0];
-h reg[5];
-y reg[2];
-y reg[0];
-h reg[0];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(2.140866e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-h reg[5];
-y reg[2];
-y reg[0];
-h reg[0];
-h reg[5];
-h reg[3];
-h reg[0];
-h reg[0];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[1];
-cx reg[1],reg[0];
-rz(1.847120e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[3],reg[1];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-h reg[5];
-h reg[3];
-h reg[0];
-h reg[0];
-y reg[5];
-y reg[3];
-y reg[0];
-y reg[0];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[1];
-cx reg[1],reg[0];
-rz(1.847120e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[3],reg[1];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-y reg[5];
-y reg[3];
-y reg[0];
-y reg[0];
-h reg[5];
-y reg[3];
-h reg[0];
-y reg[0];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[1];
-cx reg[1],reg[0];
-rz(1.847120e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[3],reg[1];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-h reg[5];
-y reg[3];
-h reg[0];
-y reg[0];
-y reg[5];
-h reg[3];
-y reg[0];
-h reg[0];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[1];
-cx reg[1],reg[0];
-rz(1.847120e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[3],reg[1];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-y reg[5];
-h reg[3];
-y reg[0];
-h reg[0];
-y reg[5];
-y reg[3];
-h reg[0];
-h reg[0];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[1];
-cx reg[1],reg[0];
-rz(1.847120e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[3],reg[1];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-y reg[5];
-y reg[3];
-h reg[0];
-h reg[0];
-h reg[5];
-h reg[3];
-y reg[0];
-y reg[0];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[1];
-cx reg[1],reg[0];
-rz(1.847120e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[3],reg[1];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-h reg[5];
-h reg[3];
-y reg[0];
-y reg[0];
-y reg[5];
-h reg[3];
-h reg[0];
-y reg[0];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[1];
-cx reg[1],reg[0];
-rz(1.847120e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[3],reg[1];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-y reg[5];
-h reg[3];
-h reg[0];
-y reg[0];
-h reg[5];
-y reg[3];
-y reg[0];
-h reg[0];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[1];
-cx reg[1],reg[0];
-rz(1.847120e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[3],reg[1];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-h reg[5];
-y reg[3];
-y reg[0];
-h reg[0];
-h reg[5];
-h reg[3];
-h reg[0];
-h reg[0];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(5.882886e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-h reg[5];
-h reg[3];
-h reg[0];
-h reg[0];
-y reg[5];
-y reg[3];
-y reg[0];
-y reg[0];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(5.882886e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-y reg[5];
-y reg[3];
-y reg[0];
-y reg[0];
-h reg[5];
-y reg[3];
-h reg[0];
-y reg[0];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(5.882886e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-h reg[5];
-y reg[3];
-h reg[0];
-y reg[0];
-y reg[5];
-h reg[3];
-y reg[0];
-h reg[0];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(5.882886e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-y reg[5];
-h reg[3];
-y reg[0];
-h reg[0];
-y reg[5];
-y reg[3];
-h reg[0];
-h reg[0];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(5.882886e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-y reg[5];
-y reg[3];
-h reg[0];
-h reg[0];
-h reg[5];
-h reg[3];
-y reg[0];
-y reg[0];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(5.882886e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-h reg[5];
-h reg[3];
-y reg[0];
-y reg[0];
-y reg[5];
-h reg[3];
-h reg[0];
-y reg[0];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(5.882886e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-y reg[5];
-h reg[3];
-h reg[0];
-y reg[0];
-h reg[5];
-y reg[3];
-y reg[0];
-h reg[0];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(5.882886e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-h reg[5];
-y reg[3];
-y reg[0];
-h reg[0];
-h reg[5];
-h reg[3];
-h reg[1];
-h reg[1];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-rz(5.285149e+00) reg[1];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-h reg[5];
-h reg[3];
-h reg[1];
-h reg[1];
-y reg[5];
-y reg[3];
-y reg[1];
-y reg[1];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-rz(5.285149e+00) reg[1];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-y reg[5];
-y reg[3];
-y reg[1];
-y reg[1];
-h reg[5];
-y reg[3];
-h reg[1];
-y reg[1];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-rz(5.285149e+00) reg[1];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-h reg[5];
-y reg[3];
-h reg[1];
-y reg[1];
-y reg[5];
-h reg[3];
-y reg[1];
-h reg[1];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-rz(5.285149e+00) reg[1];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-y reg[5];
-h reg[3];
-y reg[1];
-h reg[1];
-y reg[5];
-y reg[3];
-h reg[1];
-h reg[1];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-rz(5.285149e+00) reg[1];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-y reg[5];
-y reg[3];
-h reg[1];
-h reg[1];
-h reg[5];
-h reg[3];
-y reg[1];
-y reg[1];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-rz(5.285149e+00) reg[1];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-h reg[5];
-h reg[3];
-y reg[1];
-y reg[1];
-y reg[5];
-h reg[3];
-h reg[1];
-y reg[1];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-rz(5.285149e+00) reg[1];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-y reg[5];
-h reg[3];
-h reg[1];
-y reg[1];
-h reg[5];
-y reg[3];
-y reg[1];
-h reg[1];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-rz(5.285149e+00) reg[1];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-h reg[5];
-y reg[3];
-y reg[1];
-h reg[1];
-h reg[5];
-h reg[4];
-h reg[0];
-h reg[0];
-cx reg[5],reg[4];
-cx reg[4],reg[1];
-cx reg[1],reg[0];
-rz(1.671716e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[4],reg[1];
-cx reg[5],reg[4];
-h reg[5];
-h reg[4];
-h reg[0];
-h reg[0];
-y reg[5];
-y reg[4];
-y reg[0];
-y reg[0];
-cx reg[5],reg[4];
-cx reg[4],reg[1];
-cx reg[1],reg[0];
-rz(1.671716e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[4],reg[1];
-cx reg[5],reg[4];
-y reg[5];
-y reg[4];
-y reg[0];
-y reg[0];
-h reg[5];
-y reg[4];
-h reg[0];
-y reg[0];
-cx reg[5],reg[4];
-cx reg[4],reg[1];
-cx reg[1],reg[0];
-rz(1.671716e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[4],reg[1];
-cx reg[5],reg[4];
-h reg[5];
-y reg[4];
-h reg[0];
-y reg[0];
-y reg[5];
-h reg[4];
-y reg[0];
-h reg[0];
-cx reg[5],reg[4];
-cx reg[4],reg[1];
-cx reg[1],reg[0];
-rz(1.671716e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[4],reg[1];
-cx reg[5],reg[4];
-y reg[5];
-h reg[4];
-y reg[0];
-h reg[0];
-y reg[5];
-y reg[4];
-h reg[0];
-h reg[0];
-cx reg[5],reg[4];
-cx reg[4],reg[1];
-cx reg[1],reg[0];
-rz(1.671716e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[4],reg[1];
-cx reg[5],reg[4];
-y reg[5];
-y reg[4];
-h reg[0];
-h reg[0];
-h reg[5];
-h reg[4];
-y reg[0];
-y reg[0];
-cx reg[5],reg[4];
-cx reg[4],reg[1];
-cx reg[1],reg[0];
-rz(1.671716e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[4],reg[1];
-cx reg[5],reg[4];
-h reg[5];
-h reg[4];
-y reg[0];
-y reg[0];
-y reg[5];
-h reg[4];
-h reg[0];
-y reg[0];
-cx reg[5],reg[4];
-cx reg[4],reg[1];
-cx reg[1],reg[0];
-rz(1.671716e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[4],reg[1];
-cx reg[5],reg[4];
-y reg[5];
-h reg[4];
-h reg[0];
-y reg[0];
-h reg[5];
-y reg[4];
-y reg[0];
-h reg[0];
-cx reg[5],reg[4];
-cx reg[4],reg[1];
-cx reg[1],reg[0];
-rz(1.671716e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[4],reg[1];
-cx reg[5],reg[4];
-h reg[5];
-y reg[4];
-y reg[0];
-h reg[0];
-h reg[5];
-h reg[4];
-h reg[0];
-h reg[0];
-cx reg[5],reg[4];
-cx reg[4],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(3.028106e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[4],reg[2];
-cx reg[5],reg[4];
-h reg[5];
-h reg[4];
-h reg[0];
-h reg[0];
-y reg[5];
-y reg[4];
-y reg[0];
-y reg[0];
-cx reg[5],reg[4];
-cx reg[4],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(3.028106e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[4],reg[2];
-cx reg[5],reg[4];
-y reg[5];
-y reg[4];
-y reg[0];
-y reg[0];
-h reg[5];
-y reg[4];
-h reg[0];
-y reg[0];
-cx reg[5],reg[4];
-cx reg[4],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(3.028106e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[4],reg[2];
-cx reg[5],reg[4];
-h reg[5];
-y reg[4];
-h reg[0];
-y reg[0];
-y reg[5];
-h reg[4];
-y reg[0];
-h reg[0];
-cx reg[5],reg[4];
-cx reg[4],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(3.028106e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[4],reg[2];
-cx reg[5],reg[4];
-y reg[5];
-h reg[4];
-y reg[0];
-h reg[0];
-y reg[5];
-y reg[4];
-h reg[0];
-h reg[0];
-cx reg[5],reg[4];
-cx reg[4],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(3.028106e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[4],reg[2];
-cx reg[5],reg[4];
-y reg[5];
-y reg[4];
-h reg[0];
-h reg[0];
-h reg[5];
-h reg[4];
-y reg[0];
-y reg[0];
-cx reg[5],reg[4];
-cx reg[4],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(3.028106e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[4],reg[2];
-cx reg[5],reg[4];
-h reg[5];
-h reg[4];
-y reg[0];
-y reg[0];
-y reg[5];
-h reg[4];
-h reg[0];
-y reg[0];
-cx reg[5],reg[4];
-cx reg[4],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(3.028106e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[4],reg[2];
-cx reg[5],reg[4];
-y reg[5];
-h reg[4];
-h reg[0];
-y reg[0];
-h reg[5];
-y reg[4];
-y reg[0];
-h reg[0];
-cx reg[5],reg[4];
-cx reg[4],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(3.028106e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[4],reg[2];
-cx reg[5],reg[4];
-h reg[5];
-y reg[4];
-y reg[0];
-h reg[0];
-h reg[5];
-h reg[4];
-h reg[1];
-h reg[1];
-cx reg[5],reg[4];
-cx reg[4],reg[2];
-cx reg[2],reg[1];
-rz(1.398880e+00) reg[1];
-cx reg[2],reg[1];
-cx reg[4],reg[2];
-cx reg[5],reg[4];
-h reg[5];
-h reg[4];
-h reg[1];
-h reg[1];
-y reg[5];
-y reg[4];
-y reg[1];
-y reg[1];
-cx reg[5],reg[4];
-cx reg[4],reg[2];
-cx reg[2],reg[1];
-rz(1.398880e+00) reg[1];
-cx reg[2],reg[1];
-cx reg[4],reg[2];
-cx reg[5],reg[4];
-y reg[5];
-y reg[4];
-y reg[1];
-y reg[1];
-h reg[5];
-y reg[4];
-h reg[1];
-y reg[1];
-cx reg[5],reg[4];
-cx reg[4],reg[2];
-cx reg[2],reg[1];
-rz(1.398880e+00) reg[1];
-cx reg[2],reg[1];
-cx reg[4],reg[2];
-cx reg[5],reg[4];
-h reg[5];
-y reg[4];
-h reg[1];
-y reg[1];
-y reg[5];
-h reg[4];
-y reg[1];
-h reg[1];
-cx reg[5],reg[4];
-cx reg[4],reg[2];
-cx reg[2],reg[1];
-rz(1.398880e+00) reg[1];
-cx reg[2],reg[1];
-cx reg[4],reg[2];
-cx reg[5],reg[4];
-y reg[5];
-h reg[4];
-y reg[1];
-h reg[1];
-y reg[5];
-y reg[4];
-h reg[1];
-h reg[1];
-cx reg[5],reg[4];
-cx reg[4],reg[2];
-cx reg[2],reg[1];
-rz(1.398880e+00) reg[1];
-cx reg[2],reg[1];
-cx reg[4],reg[2];
-cx reg[5],reg[4];
-y reg[5];
-y reg[4];
-h reg[1];
-h reg[1];
-h reg[5];
-h reg[4];
-y reg[1];
-y reg[1];
-cx reg[5],reg[4];
-cx reg[4],reg[2];
-cx reg[2],reg[1];
-rz(1.398880e+00) reg[1];
-cx reg[2],reg[1];
-cx reg[4],reg[2];
-cx reg[5],reg[4];
-h reg[5];
-h reg[4];
-y reg[1];
-y reg[1];
-y reg[5];
-h reg[4];
-h reg[1];
-y reg[1];
-cx reg[5],reg[4];
-cx reg[4],reg[2];
-cx reg[2],reg[1];
-rz(1.398880e+00) reg[1];
-cx reg[2],reg[1];
-cx reg[4],reg[2];
-cx reg[5],reg[4];
-y reg[5];
-h reg[4];
-h reg[1];
-y reg[1];
-h reg[5];
-y reg[4];
-y reg[1];
-h reg[1];
-cx reg[5],reg[4];
-cx reg[4],reg[2];
-cx reg[2],reg[1];
-rz(1.398880e+00) reg[1];
-cx reg[2],reg[1];
-cx reg[4],reg[2];
-cx reg[5],reg[4];
-h reg[5];
-y reg[4];
-y reg[1];
-h reg[1];
-h reg[5];
-h reg[4];
-h reg[0];
-h reg[0];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(5.622395e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-h reg[5];
-h reg[4];
-h reg[0];
-h reg[0];
-y reg[5];
-y reg[4];
-y reg[0];
-y reg[0];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(5.622395e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-y reg[5];
-y reg[4];
-y reg[0];
-y reg[0];
-h reg[5];
-y reg[4];
-h reg[0];
-y reg[0];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(5.622395e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-h reg[5];
-y reg[4];
-h reg[0];
-y reg[0];
-y reg[5];
-h reg[4];
-y reg[0];
-h reg[0];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(5.622395e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-y reg[5];
-h reg[4];
-y reg[0];
-h reg[0];
-y reg[5];
-y reg[4];
-h reg[0];
-h reg[0];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(5.622395e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-y reg[5];
-y reg[4];
-h reg[0];
-h reg[0];
-h reg[5];
-h reg[4];
-y reg[0];
-y reg[0];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(5.622395e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-h reg[5];
-h reg[4];
-y reg[0];
-y reg[0];
-y reg[5];
-h reg[4];
-h reg[0];
-y reg[0];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(5.622395e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-y reg[5];
-h reg[4];
-h reg[0];
-y reg[0];
-h reg[5];
-y reg[4];
-y reg[0];
-h reg[0];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(5.622395e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-h reg[5];
-y reg[4];
-y reg[0];
-h reg[0];
-h reg[5];
-h reg[4];
-h reg[1];
-h reg[1];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-rz(1.674394e+00) reg[1];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-h reg[5];
-h reg[4];
-h reg[1];
-h reg[1];
-y reg[5];
-y reg[4];
-y reg[1];
-y reg[1];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-rz(1.674394e+00) reg[1];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-y reg[5];
-y reg[4];
-y reg[1];
-y reg[1];
-h reg[5];
-y reg[4];
-h reg[1];
-y reg[1];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-rz(1.674394e+00) reg[1];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-h reg[5];
-y reg[4];
-h reg[1];
-y reg[1];
-y reg[5];
-h reg[4];
-y reg[1];
-h reg[1];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-rz(1.674394e+00) reg[1];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-y reg[5];
-h reg[4];
-y reg[1];
-h reg[1];
-y reg[5];
-y reg[4];
-h reg[1];
-h reg[1];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-rz(1.674394e+00) reg[1];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-y reg[5];
-y reg[4];
-h reg[1];
-h reg[1];
-h reg[5];
-h reg[4];
-y reg[1];
-y reg[1];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-rz(1.674394e+00) reg[1];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-h reg[5];
-h reg[4];
-y reg[1];
-y reg[1];
-y reg[5];
-h reg[4];
-h reg[1];
-y reg[1];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-rz(1.674394e+00) reg[1];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-y reg[5];
-h reg[4];
-h reg[1];
-y reg[1];
-h reg[5];
-y reg[4];
-y reg[1];
-h reg[1];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-rz(1.674394e+00) reg[1];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-h reg[5];
-y reg[4];
-y reg[1];
-h reg[1];
-h reg[5];
-h reg[4];
-h reg[2];
-h reg[2];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-rz(2.693995e+00) reg[2];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-h reg[5];
-h reg[4];
-h reg[2];
-h reg[2];
-y reg[5];
-y reg[4];
-y reg[2];
-y reg[2];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-rz(2.693995e+00) reg[2];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-y reg[5];
-y reg[4];
-y reg[2];
-y reg[2];
-h reg[5];
-y reg[4];
-h reg[2];
-y reg[2];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-rz(2.693995e+00) reg[2];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-h reg[5];
-y reg[4];
-h reg[2];
-y reg[2];
-y reg[5];
-h reg[4];
-y reg[2];
-h reg[2];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-rz(2.693995e+00) reg[2];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-y reg[5];
-h reg[4];
-y reg[2];
-h reg[2];
-y reg[5];
-y reg[4];
-h reg[2];
-h reg[2];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-rz(2.693995e+00) reg[2];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-y reg[5];
-y reg[4];
-h reg[2];
-h reg[2];
-h reg[5];
-h reg[4];
-y reg[2];
-y reg[2];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-rz(2.693995e+00) reg[2];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-h reg[5];
-h reg[4];
-y reg[2];
-y reg[2];
-y reg[5];
-h reg[4];
-h reg[2];
-y reg[2];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-rz(2.693995e+00) reg[2];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-y reg[5];
-h reg[4];
-h reg[2];
-y reg[2];
-h reg[5];
-y reg[4];
-y reg[2];
-h reg[2];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-rz(2.693995e+00) reg[2];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-h reg[5];
-y reg[4];
-y reg[2];
-h reg[2];
-h reg[1];
-h reg[0];
-cx reg[1],reg[0];
-rz(2.340658e+00) reg[0];
-cx reg[1],reg[0];
-h reg[1];
-h reg[0];
-y reg[1];
-y reg[0];
-cx reg[1],reg[0];
-rz(2.340658e+00) reg[0];
-cx reg[1],reg[0];
-y reg[1];
-y reg[0];
-h reg[2];
-h reg[0];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(4.735789e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-h reg[2];
-h reg[0];
-y reg[2];
-y reg[0];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(4.735789e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-y reg[2];
-y reg[0];
-h reg[2];
-h reg[1];
-cx reg[2],reg[1];
-rz(3.247286e+00) reg[1];
-cx reg[2],reg[1];
-h reg[2];
-h reg[1];
-y reg[2];
-y reg[1];
-cx reg[2],reg[1];
-rz(3.247286e+00) reg[1];
-cx reg[2],reg[1];
-y reg[2];
-y reg[1];
-h reg[3];
-h reg[0];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(2.633612e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-h reg[3];
-h reg[0];
-y reg[3];
-y reg[0];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(2.633612e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-y reg[3];
-y reg[0];
-h reg[3];
-h reg[1];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-rz(6.033361e+00) reg[1];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-h reg[3];
-h reg[1];
-y reg[3];
-y reg[1];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-rz(6.033361e+00) reg[1];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-y reg[3];
-y reg[1];
-h reg[3];
-h reg[2];
-cx reg[3],reg[2];
-rz(1.606384e+00) reg[2];
-cx reg[3],reg[2];
-h reg[3];
-h reg[2];
-y reg[3];
-y reg[2];
-cx reg[3],reg[2];
-rz(1.606384e+00) reg[2];
-cx reg[3],reg[2];
-y reg[3];
-y reg[2];
-h reg[4];
-h reg[0];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(3.427706e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-h reg[4];
-h reg[0];
-y reg[4];
-y reg[0];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(3.427706e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-y reg[4];
-y reg[0];
-h reg[4];
-h reg[1];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-rz(3.353791e+00) reg[1];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-h reg[4];
-h reg[1];
-y reg[4];
-y reg[1];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-rz(3.353791e+00) reg[1];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-y reg[4];
-y reg[1];
-h reg[4];
-h reg[2];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-rz(5.428189e+00) reg[2];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-h reg[4];
-h reg[2];
-y reg[4];
-y reg[2];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-rz(5.428189e+00) reg[2];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-y reg[4];
-y reg[2];
-h reg[4];
-h reg[3];
-cx reg[4],reg[3];
-rz(8.538145e-01) reg[3];
-cx reg[4],reg[3];
-h reg[4];
-h reg[3];
-y reg[4];
-y reg[3];
-cx reg[4],reg[3];
-rz(8.538145e-01) reg[3];
-cx reg[4],reg[3];
-y reg[4];
-y reg[3];
-h reg[5];
-h reg[0];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(1.098986e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-h reg[5];
-h reg[0];
-y reg[5];
-y reg[0];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(1.098986e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-y reg[5];
-y reg[0];
-h reg[5];
-h reg[1];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-rz(4.019744e+00) reg[1];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-h reg[5];
-h reg[1];
-y reg[5];
-y reg[1];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-rz(4.019744e+00) reg[1];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-y reg[5];
-y reg[1];
-h reg[5];
-h reg[2];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-rz(2.683754e+00) reg[2];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-h reg[5];
-h reg[2];
-y reg[5];
-y reg[2];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-rz(2.683754e+00) reg[2];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-y reg[5];
-y reg[2];
-h reg[5];
-h reg[3];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-rz(6.790820e-01) reg[3];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-h reg[5];
-h reg[3];
-y reg[5];
-y reg[3];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-rz(6.790820e-01) reg[3];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-y reg[5];
-y reg[3];
-h reg[5];
-h reg[4];
-cx reg[5],reg[4];
-rz(5.547861e+00) reg[4];
-cx reg[5],reg[4];
-h reg[5];
-h reg[4];
-y reg[5];
-y reg[4];
-cx reg[5],reg[4];
-rz(5.547861e+00) reg[4];
-cx reg[5],reg[4];
-y reg[5];
-y reg[4];
@@ -1,2127 +0,0 @@
-OPENQASM 2.0;
-include "qelib1.inc";
-qreg reg[6];
-rz(pi/2) reg[2];
-sx reg[2];
-rz(pi/2) reg[2];
-rz(pi/2) reg[3];
-sx reg[3];
-rz(pi/2) reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(4.638775) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-rz(-pi/2) reg[2];
-sx reg[2];
-rz(-pi/2) reg[2];
-rz(-pi/2) reg[3];
-sx reg[3];
-rz(-pi/2) reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(4.638775) reg[0];
-cx reg[1],reg[0];
-rz(-pi/2) reg[0];
-sx reg[0];
-rz(-pi/2) reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-rz(-pi/2) reg[3];
-sx reg[3];
-rz(-pi/2) reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(4.638775) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-rz(-pi/2) reg[2];
-sx reg[2];
-rz(-pi/2) reg[2];
-rz(-pi/2) reg[3];
-sx reg[3];
-rz(-pi/2) reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(4.638775) reg[0];
-cx reg[1],reg[0];
-rz(-pi/2) reg[0];
-sx reg[0];
-rz(-pi/2) reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-rz(-pi/2) reg[2];
-sx reg[2];
-rz(-pi/2) reg[2];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(4.638775) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-rz(-pi/2) reg[2];
-sx reg[2];
-rz(-pi/2) reg[2];
-rz(-pi/2) reg[3];
-sx reg[3];
-rz(-pi/2) reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(4.638775) reg[0];
-cx reg[1],reg[0];
-rz(-pi/2) reg[0];
-sx reg[0];
-rz(-pi/2) reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-rz(-pi/2) reg[3];
-sx reg[3];
-rz(-pi/2) reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(4.638775) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-rz(-pi/2) reg[2];
-sx reg[2];
-rz(-pi/2) reg[2];
-rz(-pi/2) reg[3];
-sx reg[3];
-rz(-pi/2) reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(4.638775) reg[0];
-cx reg[1],reg[0];
-rz(-pi/2) reg[0];
-sx reg[0];
-rz(-pi/2) reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-rz(-pi/2) reg[2];
-sx reg[2];
-rz(-pi/2) reg[2];
-rz(pi/2) reg[3];
-sx reg[3];
-rz(pi/2) reg[3];
-rz(pi/2) reg[4];
-sx reg[4];
-rz(pi/2) reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(5.570539) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-rz(-pi/2) reg[2];
-sx reg[2];
-rz(-pi/2) reg[2];
-cx reg[4],reg[3];
-rz(-pi/2) reg[4];
-sx reg[4];
-rz(-pi/2) reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(5.570539) reg[0];
-cx reg[1],reg[0];
-rz(-pi/2) reg[0];
-sx reg[0];
-rz(-pi/2) reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-rz(-pi/2) reg[4];
-sx reg[4];
-rz(-pi/2) reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(5.570539) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-rz(-pi/2) reg[2];
-sx reg[2];
-rz(-pi/2) reg[2];
-cx reg[4],reg[3];
-rz(-pi/2) reg[4];
-sx reg[4];
-rz(-pi/2) reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(5.570539) reg[0];
-cx reg[1],reg[0];
-rz(-pi/2) reg[0];
-sx reg[0];
-rz(-pi/2) reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-rz(-pi/2) reg[2];
-sx reg[2];
-rz(-pi/2) reg[2];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(5.570539) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-rz(-pi/2) reg[2];
-sx reg[2];
-rz(-pi/2) reg[2];
-cx reg[4],reg[3];
-rz(-pi/2) reg[4];
-sx reg[4];
-rz(-pi/2) reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(5.570539) reg[0];
-cx reg[1],reg[0];
-rz(-pi/2) reg[0];
-sx reg[0];
-rz(-pi/2) reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-rz(-pi/2) reg[4];
-sx reg[4];
-rz(-pi/2) reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(5.570539) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-rz(-pi/2) reg[2];
-sx reg[2];
-rz(-pi/2) reg[2];
-cx reg[4],reg[3];
-rz(-pi/2) reg[4];
-sx reg[4];
-rz(-pi/2) reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(5.570539) reg[0];
-cx reg[1],reg[0];
-rz(-pi/2) reg[0];
-sx reg[0];
-rz(-pi/2) reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-rz(-pi) reg[2];
-x reg[2];
-cx reg[4],reg[3];
-rz(pi/2) reg[3];
-sx reg[3];
-rz(pi/2) reg[3];
-cx reg[4],reg[3];
-cx reg[3],reg[1];
-cx reg[1],reg[0];
-rz(5.663952) reg[0];
-cx reg[1],reg[0];
-cx reg[3],reg[1];
-cx reg[4],reg[3];
-rz(-pi/2) reg[3];
-sx reg[3];
-rz(-pi/2) reg[3];
-rz(-pi/2) reg[4];
-sx reg[4];
-rz(-pi/2) reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[1];
-cx reg[1],reg[0];
-rz(5.663952) reg[0];
-cx reg[1],reg[0];
-rz(-pi/2) reg[0];
-sx reg[0];
-rz(-pi/2) reg[0];
-cx reg[3],reg[1];
-cx reg[4],reg[3];
-rz(-pi/2) reg[4];
-sx reg[4];
-rz(-pi/2) reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[1];
-cx reg[1],reg[0];
-rz(5.663952) reg[0];
-cx reg[1],reg[0];
-cx reg[3],reg[1];
-cx reg[4],reg[3];
-rz(-pi/2) reg[3];
-sx reg[3];
-rz(-pi/2) reg[3];
-rz(-pi/2) reg[4];
-sx reg[4];
-rz(-pi/2) reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[1];
-cx reg[1],reg[0];
-rz(5.663952) reg[0];
-cx reg[1],reg[0];
-rz(-pi/2) reg[0];
-sx reg[0];
-rz(-pi/2) reg[0];
-cx reg[3],reg[1];
-cx reg[4],reg[3];
-rz(-pi/2) reg[3];
-sx reg[3];
-rz(-pi/2) reg[3];
-cx reg[4],reg[3];
-cx reg[3],reg[1];
-cx reg[1],reg[0];
-rz(5.663952) reg[0];
-cx reg[1],reg[0];
-cx reg[3],reg[1];
-cx reg[4],reg[3];
-rz(-pi/2) reg[3];
-sx reg[3];
-rz(-pi/2) reg[3];
-rz(-pi/2) reg[4];
-sx reg[4];
-rz(-pi/2) reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[1];
-cx reg[1],reg[0];
-rz(5.663952) reg[0];
-cx reg[1],reg[0];
-rz(-pi/2) reg[0];
-sx reg[0];
-rz(-pi/2) reg[0];
-cx reg[3],reg[1];
-cx reg[4],reg[3];
-rz(-pi/2) reg[4];
-sx reg[4];
-rz(-pi/2) reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[1];
-cx reg[1],reg[0];
-rz(5.663952) reg[0];
-cx reg[1],reg[0];
-cx reg[3],reg[1];
-cx reg[4],reg[3];
-rz(-pi/2) reg[3];
-sx reg[3];
-rz(-pi/2) reg[3];
-rz(-pi/2) reg[4];
-sx reg[4];
-rz(-pi/2) reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[1];
-cx reg[1],reg[0];
-rz(5.663952) reg[0];
-cx reg[1],reg[0];
-rz(-pi/2) reg[0];
-sx reg[0];
-rz(-pi/2) reg[0];
-cx reg[3],reg[1];
-cx reg[4],reg[3];
-rz(-pi/2) reg[3];
-sx reg[3];
-rz(-pi/2) reg[3];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(5.530073) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-rz(-pi/2) reg[3];
-sx reg[3];
-rz(-pi/2) reg[3];
-rz(-pi/2) reg[4];
-sx reg[4];
-rz(-pi/2) reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(5.530073) reg[0];
-cx reg[1],reg[0];
-rz(-pi/2) reg[0];
-sx reg[0];
-rz(-pi/2) reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-rz(-pi/2) reg[4];
-sx reg[4];
-rz(-pi/2) reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(5.530073) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-rz(-pi/2) reg[3];
-sx reg[3];
-rz(-pi/2) reg[3];
-rz(-pi/2) reg[4];
-sx reg[4];
-rz(-pi/2) reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(5.530073) reg[0];
-cx reg[1],reg[0];
-rz(-pi/2) reg[0];
-sx reg[0];
-rz(-pi/2) reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-rz(-pi/2) reg[3];
-sx reg[3];
-rz(-pi/2) reg[3];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(5.530073) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-rz(-pi/2) reg[3];
-sx reg[3];
-rz(-pi/2) reg[3];
-rz(-pi/2) reg[4];
-sx reg[4];
-rz(-pi/2) reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(5.530073) reg[0];
-cx reg[1],reg[0];
-rz(-pi/2) reg[0];
-sx reg[0];
-rz(-pi/2) reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-rz(-pi/2) reg[4];
-sx reg[4];
-rz(-pi/2) reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(5.530073) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-rz(-pi/2) reg[3];
-sx reg[3];
-rz(-pi/2) reg[3];
-rz(-pi/2) reg[4];
-sx reg[4];
-rz(-pi/2) reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(5.530073) reg[0];
-cx reg[1],reg[0];
-rz(-pi/2) reg[0];
-sx reg[0];
-rz(-pi/2) reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-rz(-pi/2) reg[3];
-sx reg[3];
-rz(-pi/2) reg[3];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-rz(2.009105) reg[1];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-rz(-pi/2) reg[3];
-sx reg[3];
-rz(-pi/2) reg[3];
-rz(-pi/2) reg[4];
-sx reg[4];
-rz(-pi/2) reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-rz(2.009105) reg[1];
-cx reg[2],reg[1];
-rz(-pi/2) reg[1];
-sx reg[1];
-rz(-pi/2) reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-rz(-pi/2) reg[4];
-sx reg[4];
-rz(-pi/2) reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-rz(2.009105) reg[1];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-rz(-pi/2) reg[3];
-sx reg[3];
-rz(-pi/2) reg[3];
-rz(-pi/2) reg[4];
-sx reg[4];
-rz(-pi/2) reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-rz(2.009105) reg[1];
-cx reg[2],reg[1];
-rz(-pi/2) reg[1];
-sx reg[1];
-rz(-pi/2) reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-rz(-pi/2) reg[3];
-sx reg[3];
-rz(-pi/2) reg[3];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-rz(2.009105) reg[1];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-rz(-pi/2) reg[3];
-sx reg[3];
-rz(-pi/2) reg[3];
-rz(-pi/2) reg[4];
-sx reg[4];
-rz(-pi/2) reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-rz(2.009105) reg[1];
-cx reg[2],reg[1];
-rz(-pi/2) reg[1];
-sx reg[1];
-rz(-pi/2) reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-rz(-pi/2) reg[4];
-sx reg[4];
-rz(-pi/2) reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-rz(2.009105) reg[1];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-rz(-pi/2) reg[3];
-sx reg[3];
-rz(-pi/2) reg[3];
-rz(-pi/2) reg[4];
-sx reg[4];
-rz(-pi/2) reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-rz(2.009105) reg[1];
-cx reg[2],reg[1];
-rz(-pi/2) reg[1];
-sx reg[1];
-rz(-pi/2) reg[1];
-cx reg[3],reg[2];
-rz(pi/2) reg[2];
-sx reg[2];
-rz(pi/2) reg[2];
-cx reg[4],reg[3];
-rz(-pi) reg[3];
-x reg[3];
-rz(pi/2) reg[4];
-sx reg[4];
-rz(pi/2) reg[4];
-rz(pi/2) reg[5];
-sx reg[5];
-rz(pi/2) reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(2.140866) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-rz(-pi/2) reg[2];
-sx reg[2];
-rz(-pi/2) reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-rz(-pi/2) reg[5];
-sx reg[5];
-rz(-pi/2) reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(2.140866) reg[0];
-cx reg[1],reg[0];
-rz(-pi/2) reg[0];
-sx reg[0];
-rz(-pi/2) reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-rz(-pi/2) reg[5];
-sx reg[5];
-rz(-pi/2) reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(2.140866) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-rz(-pi/2) reg[2];
-sx reg[2];
-rz(-pi/2) reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-rz(-pi/2) reg[5];
-sx reg[5];
-rz(-pi/2) reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(2.140866) reg[0];
-cx reg[1],reg[0];
-rz(-pi/2) reg[0];
-sx reg[0];
-rz(-pi/2) reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-rz(-pi/2) reg[2];
-sx reg[2];
-rz(-pi/2) reg[2];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(2.140866) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-rz(-pi/2) reg[2];
-sx reg[2];
-rz(-pi/2) reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-rz(-pi/2) reg[5];
-sx reg[5];
-rz(-pi/2) reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(2.140866) reg[0];
-cx reg[1],reg[0];
-rz(-pi/2) reg[0];
-sx reg[0];
-rz(-pi/2) reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-rz(-pi/2) reg[5];
-sx reg[5];
-rz(-pi/2) reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(2.140866) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-rz(-pi/2) reg[2];
-sx reg[2];
-rz(-pi/2) reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-rz(-pi/2) reg[5];
-sx reg[5];
-rz(-pi/2) reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(2.140866) reg[0];
-cx reg[1],reg[0];
-rz(-pi/2) reg[0];
-sx reg[0];
-rz(-pi/2) reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-rz(-pi) reg[2];
-x reg[2];
-cx reg[4],reg[3];
-rz(pi/2) reg[3];
-sx reg[3];
-rz(pi/2) reg[3];
-cx reg[4],reg[3];
-cx reg[3],reg[1];
-cx reg[1],reg[0];
-rz(1.84712) reg[0];
-cx reg[1],reg[0];
-cx reg[3],reg[1];
-cx reg[4],reg[3];
-rz(-pi/2) reg[3];
-sx reg[3];
-rz(-pi/2) reg[3];
-cx reg[5],reg[4];
-rz(-pi/2) reg[5];
-sx reg[5];
-rz(-pi/2) reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[1];
-cx reg[1],reg[0];
-rz(1.84712) reg[0];
-cx reg[1],reg[0];
-rz(-pi/2) reg[0];
-sx reg[0];
-rz(-pi/2) reg[0];
-cx reg[3],reg[1];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-rz(-pi/2) reg[5];
-sx reg[5];
-rz(-pi/2) reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[1];
-cx reg[1],reg[0];
-rz(1.84712) reg[0];
-cx reg[1],reg[0];
-cx reg[3],reg[1];
-cx reg[4],reg[3];
-rz(-pi/2) reg[3];
-sx reg[3];
-rz(-pi/2) reg[3];
-cx reg[5],reg[4];
-rz(-pi/2) reg[5];
-sx reg[5];
-rz(-pi/2) reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[1];
-cx reg[1],reg[0];
-rz(1.84712) reg[0];
-cx reg[1],reg[0];
-rz(-pi/2) reg[0];
-sx reg[0];
-rz(-pi/2) reg[0];
-cx reg[3],reg[1];
-cx reg[4],reg[3];
-rz(-pi/2) reg[3];
-sx reg[3];
-rz(-pi/2) reg[3];
-cx reg[4],reg[3];
-cx reg[3],reg[1];
-cx reg[1],reg[0];
-rz(1.84712) reg[0];
-cx reg[1],reg[0];
-cx reg[3],reg[1];
-cx reg[4],reg[3];
-rz(-pi/2) reg[3];
-sx reg[3];
-rz(-pi/2) reg[3];
-cx reg[5],reg[4];
-rz(-pi/2) reg[5];
-sx reg[5];
-rz(-pi/2) reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[1];
-cx reg[1],reg[0];
-rz(1.84712) reg[0];
-cx reg[1],reg[0];
-rz(-pi/2) reg[0];
-sx reg[0];
-rz(-pi/2) reg[0];
-cx reg[3],reg[1];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-rz(-pi/2) reg[5];
-sx reg[5];
-rz(-pi/2) reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[1];
-cx reg[1],reg[0];
-rz(1.84712) reg[0];
-cx reg[1],reg[0];
-cx reg[3],reg[1];
-cx reg[4],reg[3];
-rz(-pi/2) reg[3];
-sx reg[3];
-rz(-pi/2) reg[3];
-cx reg[5],reg[4];
-rz(-pi/2) reg[5];
-sx reg[5];
-rz(-pi/2) reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[1];
-cx reg[1],reg[0];
-rz(1.84712) reg[0];
-cx reg[1],reg[0];
-rz(-pi/2) reg[0];
-sx reg[0];
-rz(-pi/2) reg[0];
-cx reg[3],reg[1];
-cx reg[4],reg[3];
-rz(-pi/2) reg[3];
-sx reg[3];
-rz(-pi/2) reg[3];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(5.882886) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-rz(-pi/2) reg[3];
-sx reg[3];
-rz(-pi/2) reg[3];
-cx reg[5],reg[4];
-rz(-pi/2) reg[5];
-sx reg[5];
-rz(-pi/2) reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(5.882886) reg[0];
-cx reg[1],reg[0];
-rz(-pi/2) reg[0];
-sx reg[0];
-rz(-pi/2) reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-rz(-pi/2) reg[5];
-sx reg[5];
-rz(-pi/2) reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(5.882886) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-rz(-pi/2) reg[3];
-sx reg[3];
-rz(-pi/2) reg[3];
-cx reg[5],reg[4];
-rz(-pi/2) reg[5];
-sx reg[5];
-rz(-pi/2) reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(5.882886) reg[0];
-cx reg[1],reg[0];
-rz(-pi/2) reg[0];
-sx reg[0];
-rz(-pi/2) reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-rz(-pi/2) reg[3];
-sx reg[3];
-rz(-pi/2) reg[3];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(5.882886) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-rz(-pi/2) reg[3];
-sx reg[3];
-rz(-pi/2) reg[3];
-cx reg[5],reg[4];
-rz(-pi/2) reg[5];
-sx reg[5];
-rz(-pi/2) reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(5.882886) reg[0];
-cx reg[1],reg[0];
-rz(-pi/2) reg[0];
-sx reg[0];
-rz(-pi/2) reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-rz(-pi/2) reg[5];
-sx reg[5];
-rz(-pi/2) reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(5.882886) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-rz(-pi/2) reg[3];
-sx reg[3];
-rz(-pi/2) reg[3];
-cx reg[5],reg[4];
-rz(-pi/2) reg[5];
-sx reg[5];
-rz(-pi/2) reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(5.882886) reg[0];
-cx reg[1],reg[0];
-rz(-pi/2) reg[0];
-sx reg[0];
-rz(-pi/2) reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-rz(-pi/2) reg[3];
-sx reg[3];
-rz(-pi/2) reg[3];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-rz(5.285149) reg[1];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-rz(-pi/2) reg[3];
-sx reg[3];
-rz(-pi/2) reg[3];
-cx reg[5],reg[4];
-rz(-pi/2) reg[5];
-sx reg[5];
-rz(-pi/2) reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-rz(5.285149) reg[1];
-cx reg[2],reg[1];
-rz(-pi/2) reg[1];
-sx reg[1];
-rz(-pi/2) reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-rz(-pi/2) reg[5];
-sx reg[5];
-rz(-pi/2) reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-rz(5.285149) reg[1];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-rz(-pi/2) reg[3];
-sx reg[3];
-rz(-pi/2) reg[3];
-cx reg[5],reg[4];
-rz(-pi/2) reg[5];
-sx reg[5];
-rz(-pi/2) reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-rz(5.285149) reg[1];
-cx reg[2],reg[1];
-rz(-pi/2) reg[1];
-sx reg[1];
-rz(-pi/2) reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-rz(-pi/2) reg[3];
-sx reg[3];
-rz(-pi/2) reg[3];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-rz(5.285149) reg[1];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-rz(-pi/2) reg[3];
-sx reg[3];
-rz(-pi/2) reg[3];
-cx reg[5],reg[4];
-rz(-pi/2) reg[5];
-sx reg[5];
-rz(-pi/2) reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-rz(5.285149) reg[1];
-cx reg[2],reg[1];
-rz(-pi/2) reg[1];
-sx reg[1];
-rz(-pi/2) reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-rz(-pi/2) reg[5];
-sx reg[5];
-rz(-pi/2) reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-rz(5.285149) reg[1];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-rz(-pi/2) reg[3];
-sx reg[3];
-rz(-pi/2) reg[3];
-cx reg[5],reg[4];
-rz(-pi/2) reg[5];
-sx reg[5];
-rz(-pi/2) reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-rz(5.285149) reg[1];
-cx reg[2],reg[1];
-rz(-pi/2) reg[1];
-sx reg[1];
-rz(-pi/2) reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-rz(-pi) reg[3];
-x reg[3];
-cx reg[5],reg[4];
-rz(pi/2) reg[4];
-sx reg[4];
-rz(pi/2) reg[4];
-cx reg[5],reg[4];
-cx reg[4],reg[1];
-cx reg[1],reg[0];
-rz(1.671716) reg[0];
-cx reg[1],reg[0];
-cx reg[4],reg[1];
-cx reg[5],reg[4];
-rz(-pi/2) reg[4];
-sx reg[4];
-rz(-pi/2) reg[4];
-rz(-pi/2) reg[5];
-sx reg[5];
-rz(-pi/2) reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[1];
-cx reg[1],reg[0];
-rz(1.671716) reg[0];
-cx reg[1],reg[0];
-rz(-pi/2) reg[0];
-sx reg[0];
-rz(-pi/2) reg[0];
-cx reg[4],reg[1];
-cx reg[5],reg[4];
-rz(-pi/2) reg[5];
-sx reg[5];
-rz(-pi/2) reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[1];
-cx reg[1],reg[0];
-rz(1.671716) reg[0];
-cx reg[1],reg[0];
-cx reg[4],reg[1];
-cx reg[5],reg[4];
-rz(-pi/2) reg[4];
-sx reg[4];
-rz(-pi/2) reg[4];
-rz(-pi/2) reg[5];
-sx reg[5];
-rz(-pi/2) reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[1];
-cx reg[1],reg[0];
-rz(1.671716) reg[0];
-cx reg[1],reg[0];
-rz(-pi/2) reg[0];
-sx reg[0];
-rz(-pi/2) reg[0];
-cx reg[4],reg[1];
-cx reg[5],reg[4];
-rz(-pi/2) reg[4];
-sx reg[4];
-rz(-pi/2) reg[4];
-cx reg[5],reg[4];
-cx reg[4],reg[1];
-cx reg[1],reg[0];
-rz(1.671716) reg[0];
-cx reg[1],reg[0];
-cx reg[4],reg[1];
-cx reg[5],reg[4];
-rz(-pi/2) reg[4];
-sx reg[4];
-rz(-pi/2) reg[4];
-rz(-pi/2) reg[5];
-sx reg[5];
-rz(-pi/2) reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[1];
-cx reg[1],reg[0];
-rz(1.671716) reg[0];
-cx reg[1],reg[0];
-rz(-pi/2) reg[0];
-sx reg[0];
-rz(-pi/2) reg[0];
-cx reg[4],reg[1];
-cx reg[5],reg[4];
-rz(-pi/2) reg[5];
-sx reg[5];
-rz(-pi/2) reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[1];
-cx reg[1],reg[0];
-rz(1.671716) reg[0];
-cx reg[1],reg[0];
-cx reg[4],reg[1];
-cx reg[5],reg[4];
-rz(-pi/2) reg[4];
-sx reg[4];
-rz(-pi/2) reg[4];
-rz(-pi/2) reg[5];
-sx reg[5];
-rz(-pi/2) reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[1];
-cx reg[1],reg[0];
-rz(1.671716) reg[0];
-cx reg[1],reg[0];
-rz(-pi/2) reg[0];
-sx reg[0];
-rz(-pi/2) reg[0];
-cx reg[4],reg[1];
-cx reg[5],reg[4];
-rz(-pi/2) reg[4];
-sx reg[4];
-rz(-pi/2) reg[4];
-cx reg[5],reg[4];
-cx reg[4],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(3.028106) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[4],reg[2];
-cx reg[5],reg[4];
-rz(-pi/2) reg[4];
-sx reg[4];
-rz(-pi/2) reg[4];
-rz(-pi/2) reg[5];
-sx reg[5];
-rz(-pi/2) reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(3.028106) reg[0];
-cx reg[1],reg[0];
-rz(-pi/2) reg[0];
-sx reg[0];
-rz(-pi/2) reg[0];
-cx reg[2],reg[1];
-cx reg[4],reg[2];
-cx reg[5],reg[4];
-rz(-pi/2) reg[5];
-sx reg[5];
-rz(-pi/2) reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(3.028106) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[4],reg[2];
-cx reg[5],reg[4];
-rz(-pi/2) reg[4];
-sx reg[4];
-rz(-pi/2) reg[4];
-rz(-pi/2) reg[5];
-sx reg[5];
-rz(-pi/2) reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(3.028106) reg[0];
-cx reg[1],reg[0];
-rz(-pi/2) reg[0];
-sx reg[0];
-rz(-pi/2) reg[0];
-cx reg[2],reg[1];
-cx reg[4],reg[2];
-cx reg[5],reg[4];
-rz(-pi/2) reg[4];
-sx reg[4];
-rz(-pi/2) reg[4];
-cx reg[5],reg[4];
-cx reg[4],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(3.028106) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[4],reg[2];
-cx reg[5],reg[4];
-rz(-pi/2) reg[4];
-sx reg[4];
-rz(-pi/2) reg[4];
-rz(-pi/2) reg[5];
-sx reg[5];
-rz(-pi/2) reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(3.028106) reg[0];
-cx reg[1],reg[0];
-rz(-pi/2) reg[0];
-sx reg[0];
-rz(-pi/2) reg[0];
-cx reg[2],reg[1];
-cx reg[4],reg[2];
-cx reg[5],reg[4];
-rz(-pi/2) reg[5];
-sx reg[5];
-rz(-pi/2) reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(3.028106) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[4],reg[2];
-cx reg[5],reg[4];
-rz(-pi/2) reg[4];
-sx reg[4];
-rz(-pi/2) reg[4];
-rz(-pi/2) reg[5];
-sx reg[5];
-rz(-pi/2) reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(3.028106) reg[0];
-cx reg[1],reg[0];
-rz(-pi/2) reg[0];
-sx reg[0];
-rz(-pi/2) reg[0];
-cx reg[2],reg[1];
-cx reg[4],reg[2];
-cx reg[5],reg[4];
-rz(-pi/2) reg[4];
-sx reg[4];
-rz(-pi/2) reg[4];
-cx reg[5],reg[4];
-cx reg[4],reg[2];
-cx reg[2],reg[1];
-rz(1.39888) reg[1];
-cx reg[2],reg[1];
-cx reg[4],reg[2];
-cx reg[5],reg[4];
-rz(-pi/2) reg[4];
-sx reg[4];
-rz(-pi/2) reg[4];
-rz(-pi/2) reg[5];
-sx reg[5];
-rz(-pi/2) reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[2];
-cx reg[2],reg[1];
-rz(1.39888) reg[1];
-cx reg[2],reg[1];
-rz(-pi/2) reg[1];
-sx reg[1];
-rz(-pi/2) reg[1];
-cx reg[4],reg[2];
-cx reg[5],reg[4];
-rz(-pi/2) reg[5];
-sx reg[5];
-rz(-pi/2) reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[2];
-cx reg[2],reg[1];
-rz(1.39888) reg[1];
-cx reg[2],reg[1];
-cx reg[4],reg[2];
-cx reg[5],reg[4];
-rz(-pi/2) reg[4];
-sx reg[4];
-rz(-pi/2) reg[4];
-rz(-pi/2) reg[5];
-sx reg[5];
-rz(-pi/2) reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[2];
-cx reg[2],reg[1];
-rz(1.39888) reg[1];
-cx reg[2],reg[1];
-rz(-pi/2) reg[1];
-sx reg[1];
-rz(-pi/2) reg[1];
-cx reg[4],reg[2];
-cx reg[5],reg[4];
-rz(-pi/2) reg[4];
-sx reg[4];
-rz(-pi/2) reg[4];
-cx reg[5],reg[4];
-cx reg[4],reg[2];
-cx reg[2],reg[1];
-rz(1.39888) reg[1];
-cx reg[2],reg[1];
-cx reg[4],reg[2];
-cx reg[5],reg[4];
-rz(-pi/2) reg[4];
-sx reg[4];
-rz(-pi/2) reg[4];
-rz(-pi/2) reg[5];
-sx reg[5];
-rz(-pi/2) reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[2];
-cx reg[2],reg[1];
-rz(1.39888) reg[1];
-cx reg[2],reg[1];
-rz(-pi/2) reg[1];
-sx reg[1];
-rz(-pi/2) reg[1];
-cx reg[4],reg[2];
-cx reg[5],reg[4];
-rz(-pi/2) reg[5];
-sx reg[5];
-rz(-pi/2) reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[2];
-cx reg[2],reg[1];
-rz(1.39888) reg[1];
-cx reg[2],reg[1];
-cx reg[4],reg[2];
-cx reg[5],reg[4];
-rz(-pi/2) reg[4];
-sx reg[4];
-rz(-pi/2) reg[4];
-rz(-pi/2) reg[5];
-sx reg[5];
-rz(-pi/2) reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[2];
-cx reg[2],reg[1];
-rz(1.39888) reg[1];
-cx reg[2],reg[1];
-rz(-pi/2) reg[1];
-sx reg[1];
-rz(-pi/2) reg[1];
-cx reg[4],reg[2];
-cx reg[5],reg[4];
-rz(-pi/2) reg[4];
-sx reg[4];
-rz(-pi/2) reg[4];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(5.622395) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-rz(-pi/2) reg[4];
-sx reg[4];
-rz(-pi/2) reg[4];
-rz(-pi/2) reg[5];
-sx reg[5];
-rz(-pi/2) reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(5.622395) reg[0];
-cx reg[1],reg[0];
-rz(-pi/2) reg[0];
-sx reg[0];
-rz(-pi/2) reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-rz(-pi/2) reg[5];
-sx reg[5];
-rz(-pi/2) reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(5.622395) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-rz(-pi/2) reg[4];
-sx reg[4];
-rz(-pi/2) reg[4];
-rz(-pi/2) reg[5];
-sx reg[5];
-rz(-pi/2) reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(5.622395) reg[0];
-cx reg[1],reg[0];
-rz(-pi/2) reg[0];
-sx reg[0];
-rz(-pi/2) reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-rz(-pi/2) reg[4];
-sx reg[4];
-rz(-pi/2) reg[4];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(5.622395) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-rz(-pi/2) reg[4];
-sx reg[4];
-rz(-pi/2) reg[4];
-rz(-pi/2) reg[5];
-sx reg[5];
-rz(-pi/2) reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(5.622395) reg[0];
-cx reg[1],reg[0];
-rz(-pi/2) reg[0];
-sx reg[0];
-rz(-pi/2) reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-rz(-pi/2) reg[5];
-sx reg[5];
-rz(-pi/2) reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(5.622395) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-rz(-pi/2) reg[4];
-sx reg[4];
-rz(-pi/2) reg[4];
-rz(-pi/2) reg[5];
-sx reg[5];
-rz(-pi/2) reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(5.622395) reg[0];
-cx reg[1],reg[0];
-rz(-pi) reg[0];
-x reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-rz(-pi/2) reg[4];
-sx reg[4];
-rz(-pi/2) reg[4];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-rz(1.674394) reg[1];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-rz(-pi/2) reg[4];
-sx reg[4];
-rz(-pi/2) reg[4];
-rz(-pi/2) reg[5];
-sx reg[5];
-rz(-pi/2) reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-rz(1.674394) reg[1];
-cx reg[2],reg[1];
-rz(-pi/2) reg[1];
-sx reg[1];
-rz(-pi/2) reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-rz(-pi/2) reg[5];
-sx reg[5];
-rz(-pi/2) reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-rz(1.674394) reg[1];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-rz(-pi/2) reg[4];
-sx reg[4];
-rz(-pi/2) reg[4];
-rz(-pi/2) reg[5];
-sx reg[5];
-rz(-pi/2) reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-rz(1.674394) reg[1];
-cx reg[2],reg[1];
-rz(-pi/2) reg[1];
-sx reg[1];
-rz(-pi/2) reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-rz(-pi/2) reg[4];
-sx reg[4];
-rz(-pi/2) reg[4];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-rz(1.674394) reg[1];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-rz(-pi/2) reg[4];
-sx reg[4];
-rz(-pi/2) reg[4];
-rz(-pi/2) reg[5];
-sx reg[5];
-rz(-pi/2) reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-rz(1.674394) reg[1];
-cx reg[2],reg[1];
-rz(-pi/2) reg[1];
-sx reg[1];
-rz(-pi/2) reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-rz(-pi/2) reg[5];
-sx reg[5];
-rz(-pi/2) reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-rz(1.674394) reg[1];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-rz(-pi/2) reg[4];
-sx reg[4];
-rz(-pi/2) reg[4];
-rz(-pi/2) reg[5];
-sx reg[5];
-rz(-pi/2) reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-rz(1.674394) reg[1];
-cx reg[2],reg[1];
-rz(-pi) reg[1];
-x reg[1];
-cx reg[1],reg[0];
-rz(2.340658) reg[0];
-cx reg[1],reg[0];
-rz(-pi/2) reg[0];
-sx reg[0];
-rz(-pi/2) reg[0];
-rz(-pi/2) reg[1];
-sx reg[1];
-rz(-pi/2) reg[1];
-cx reg[1],reg[0];
-rz(2.340658) reg[0];
-cx reg[1],reg[0];
-rz(-pi/2) reg[0];
-sx reg[0];
-rz(-pi/2) reg[0];
-rz(-pi) reg[1];
-x reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-rz(-pi/2) reg[4];
-sx reg[4];
-rz(-pi/2) reg[4];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-rz(2.693995) reg[2];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-rz(-pi/2) reg[4];
-sx reg[4];
-rz(-pi/2) reg[4];
-rz(-pi/2) reg[5];
-sx reg[5];
-rz(-pi/2) reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-rz(2.693995) reg[2];
-cx reg[3],reg[2];
-rz(-pi/2) reg[2];
-sx reg[2];
-rz(-pi/2) reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-rz(-pi/2) reg[5];
-sx reg[5];
-rz(-pi/2) reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-rz(2.693995) reg[2];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-rz(-pi/2) reg[4];
-sx reg[4];
-rz(-pi/2) reg[4];
-rz(-pi/2) reg[5];
-sx reg[5];
-rz(-pi/2) reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-rz(2.693995) reg[2];
-cx reg[3],reg[2];
-rz(-pi/2) reg[2];
-sx reg[2];
-rz(-pi/2) reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-rz(-pi/2) reg[4];
-sx reg[4];
-rz(-pi/2) reg[4];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-rz(2.693995) reg[2];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-rz(-pi/2) reg[4];
-sx reg[4];
-rz(-pi/2) reg[4];
-rz(-pi/2) reg[5];
-sx reg[5];
-rz(-pi/2) reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-rz(2.693995) reg[2];
-cx reg[3],reg[2];
-rz(-pi/2) reg[2];
-sx reg[2];
-rz(-pi/2) reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-rz(-pi/2) reg[5];
-sx reg[5];
-rz(-pi/2) reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-rz(2.693995) reg[2];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-rz(-pi/2) reg[4];
-sx reg[4];
-rz(-pi/2) reg[4];
-rz(-pi/2) reg[5];
-sx reg[5];
-rz(-pi/2) reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-rz(2.693995) reg[2];
-cx reg[3],reg[2];
-rz(-pi) reg[2];
-x reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(4.735789) reg[0];
-cx reg[1],reg[0];
-rz(-pi/2) reg[0];
-sx reg[0];
-rz(-pi/2) reg[0];
-cx reg[2],reg[1];
-rz(-pi/2) reg[2];
-sx reg[2];
-rz(-pi/2) reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(4.735789) reg[0];
-cx reg[1],reg[0];
-rz(-pi/2) reg[0];
-sx reg[0];
-rz(-pi/2) reg[0];
-cx reg[2],reg[1];
-rz(pi/2) reg[1];
-sx reg[1];
-rz(pi/2) reg[1];
-rz(-pi/2) reg[2];
-sx reg[2];
-rz(-pi/2) reg[2];
-cx reg[2],reg[1];
-rz(3.247286) reg[1];
-cx reg[2],reg[1];
-rz(-pi/2) reg[1];
-sx reg[1];
-rz(-pi/2) reg[1];
-rz(-pi/2) reg[2];
-sx reg[2];
-rz(-pi/2) reg[2];
-cx reg[2],reg[1];
-rz(3.247286) reg[1];
-cx reg[2],reg[1];
-rz(-pi) reg[1];
-x reg[1];
-rz(-pi) reg[2];
-x reg[2];
-cx reg[4],reg[3];
-rz(pi/2) reg[3];
-sx reg[3];
-rz(pi/2) reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(2.633612) reg[0];
-cx reg[1],reg[0];
-rz(-pi/2) reg[0];
-sx reg[0];
-rz(-pi/2) reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-rz(-pi/2) reg[3];
-sx reg[3];
-rz(-pi/2) reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(2.633612) reg[0];
-cx reg[1],reg[0];
-rz(-pi/2) reg[0];
-sx reg[0];
-rz(-pi/2) reg[0];
-cx reg[2],reg[1];
-rz(pi/2) reg[1];
-sx reg[1];
-rz(pi/2) reg[1];
-cx reg[3],reg[2];
-rz(-pi/2) reg[3];
-sx reg[3];
-rz(-pi/2) reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-rz(6.033361) reg[1];
-cx reg[2],reg[1];
-rz(-pi/2) reg[1];
-sx reg[1];
-rz(-pi/2) reg[1];
-cx reg[3],reg[2];
-rz(-pi/2) reg[3];
-sx reg[3];
-rz(-pi/2) reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-rz(6.033361) reg[1];
-cx reg[2],reg[1];
-rz(-pi) reg[1];
-x reg[1];
-cx reg[3],reg[2];
-rz(pi/2) reg[2];
-sx reg[2];
-rz(pi/2) reg[2];
-rz(-pi/2) reg[3];
-sx reg[3];
-rz(-pi/2) reg[3];
-cx reg[3],reg[2];
-rz(1.606384) reg[2];
-cx reg[3],reg[2];
-rz(-pi/2) reg[2];
-sx reg[2];
-rz(-pi/2) reg[2];
-rz(-pi/2) reg[3];
-sx reg[3];
-rz(-pi/2) reg[3];
-cx reg[3],reg[2];
-rz(1.606384) reg[2];
-cx reg[3],reg[2];
-rz(-pi) reg[2];
-x reg[2];
-rz(-pi) reg[3];
-x reg[3];
-cx reg[5],reg[4];
-rz(-pi/2) reg[4];
-sx reg[4];
-rz(-pi/2) reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(3.427706) reg[0];
-cx reg[1],reg[0];
-rz(-pi/2) reg[0];
-sx reg[0];
-rz(-pi/2) reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-rz(-pi/2) reg[4];
-sx reg[4];
-rz(-pi/2) reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(3.427706) reg[0];
-cx reg[1],reg[0];
-rz(-pi/2) reg[0];
-sx reg[0];
-rz(-pi/2) reg[0];
-cx reg[2],reg[1];
-rz(pi/2) reg[1];
-sx reg[1];
-rz(pi/2) reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-rz(-pi/2) reg[4];
-sx reg[4];
-rz(-pi/2) reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-rz(3.353791) reg[1];
-cx reg[2],reg[1];
-rz(-pi/2) reg[1];
-sx reg[1];
-rz(-pi/2) reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-rz(-pi/2) reg[4];
-sx reg[4];
-rz(-pi/2) reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-rz(3.353791) reg[1];
-cx reg[2],reg[1];
-rz(-pi) reg[1];
-x reg[1];
-cx reg[3],reg[2];
-rz(pi/2) reg[2];
-sx reg[2];
-rz(pi/2) reg[2];
-cx reg[4],reg[3];
-rz(-pi/2) reg[4];
-sx reg[4];
-rz(-pi/2) reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-rz(5.428189) reg[2];
-cx reg[3],reg[2];
-rz(-pi/2) reg[2];
-sx reg[2];
-rz(-pi/2) reg[2];
-cx reg[4],reg[3];
-rz(-pi/2) reg[4];
-sx reg[4];
-rz(-pi/2) reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-rz(5.428189) reg[2];
-cx reg[3],reg[2];
-rz(-pi) reg[2];
-x reg[2];
-cx reg[4],reg[3];
-rz(pi/2) reg[3];
-sx reg[3];
-rz(pi/2) reg[3];
-rz(-pi/2) reg[4];
-sx reg[4];
-rz(-pi/2) reg[4];
-cx reg[4],reg[3];
-rz(0.8538145) reg[3];
-cx reg[4],reg[3];
-rz(-pi/2) reg[3];
-sx reg[3];
-rz(-pi/2) reg[3];
-rz(-pi/2) reg[4];
-sx reg[4];
-rz(-pi/2) reg[4];
-cx reg[4],reg[3];
-rz(0.8538145) reg[3];
-cx reg[4],reg[3];
-rz(-pi) reg[3];
-x reg[3];
-rz(-pi) reg[4];
-x reg[4];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(1.098986) reg[0];
-cx reg[1],reg[0];
-rz(-pi/2) reg[0];
-sx reg[0];
-rz(-pi/2) reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-rz(-pi/2) reg[5];
-sx reg[5];
-rz(-pi/2) reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(1.098986) reg[0];
-cx reg[1],reg[0];
-rz(-pi) reg[0];
-x reg[0];
-cx reg[2],reg[1];
-rz(pi/2) reg[1];
-sx reg[1];
-rz(pi/2) reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-rz(-pi/2) reg[5];
-sx reg[5];
-rz(-pi/2) reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-rz(4.019744) reg[1];
-cx reg[2],reg[1];
-rz(-pi/2) reg[1];
-sx reg[1];
-rz(-pi/2) reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-rz(-pi/2) reg[5];
-sx reg[5];
-rz(-pi/2) reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-rz(4.019744) reg[1];
-cx reg[2],reg[1];
-rz(-pi) reg[1];
-x reg[1];
-cx reg[3],reg[2];
-rz(pi/2) reg[2];
-sx reg[2];
-rz(pi/2) reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-rz(-pi/2) reg[5];
-sx reg[5];
-rz(-pi/2) reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-rz(2.683754) reg[2];
-cx reg[3],reg[2];
-rz(-pi/2) reg[2];
-sx reg[2];
-rz(-pi/2) reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-rz(-pi/2) reg[5];
-sx reg[5];
-rz(-pi/2) reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-rz(2.683754) reg[2];
-cx reg[3],reg[2];
-rz(-pi) reg[2];
-x reg[2];
-cx reg[4],reg[3];
-rz(pi/2) reg[3];
-sx reg[3];
-rz(pi/2) reg[3];
-cx reg[5],reg[4];
-rz(-pi/2) reg[5];
-sx reg[5];
-rz(-pi/2) reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-rz(0.679082) reg[3];
-cx reg[4],reg[3];
-rz(-pi/2) reg[3];
-sx reg[3];
-rz(-pi/2) reg[3];
-cx reg[5],reg[4];
-rz(-pi/2) reg[5];
-sx reg[5];
-rz(-pi/2) reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-rz(0.679082) reg[3];
-cx reg[4],reg[3];
-rz(-pi) reg[3];
-x reg[3];
-cx reg[5],reg[4];
-rz(pi/2) reg[4];
-sx reg[4];
-rz(pi/2) reg[4];
-rz(-pi/2) reg[5];
-sx reg[5];
-rz(-pi/2) reg[5];
-cx reg[5],reg[4];
-rz(5.547861) reg[4];
-cx reg[5],reg[4];
-rz(-pi/2) reg[4];
-sx reg[4];
-rz(-pi/2) reg[4];
-rz(-pi/2) reg[5];
-sx reg[5];
-rz(-pi/2) reg[5];
-cx reg[5],reg[4];
-rz(5.547861) reg[4];
-cx reg[5],reg[4];
-rz(-pi) reg[4];
-x reg[4];
-rz(-pi) reg[5];
-x reg[5];
@@ -1,10812 +0,0 @@
-OPENQASM 2.0;
-include "qelib1.inc";
-qreg reg[8];
-h reg[3];
-h reg[2];
-h reg[0];
-h reg[0];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(4.691361e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-h reg[3];
-h reg[2];
-h reg[0];
-h reg[0];
-y reg[3];
-y reg[2];
-y reg[0];
-y reg[0];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(4.691361e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-y reg[3];
-y reg[2];
-y reg[0];
-y reg[0];
-h reg[3];
-y reg[2];
-h reg[0];
-y reg[0];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(4.691361e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-h reg[3];
-y reg[2];
-h reg[0];
-y reg[0];
-y reg[3];
-h reg[2];
-y reg[0];
-h reg[0];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(4.691361e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-y reg[3];
-h reg[2];
-y reg[0];
-h reg[0];
-y reg[3];
-y reg[2];
-h reg[0];
-h reg[0];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(4.691361e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-y reg[3];
-y reg[2];
-h reg[0];
-h reg[0];
-h reg[3];
-h reg[2];
-y reg[0];
-y reg[0];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(4.691361e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-h reg[3];
-h reg[2];
-y reg[0];
-y reg[0];
-y reg[3];
-h reg[2];
-h reg[0];
-y reg[0];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(4.691361e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-y reg[3];
-h reg[2];
-h reg[0];
-y reg[0];
-h reg[3];
-y reg[2];
-y reg[0];
-h reg[0];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(4.691361e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-h reg[3];
-y reg[2];
-y reg[0];
-h reg[0];
-h reg[4];
-h reg[2];
-h reg[0];
-h reg[0];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(2.093191e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-h reg[4];
-h reg[2];
-h reg[0];
-h reg[0];
-y reg[4];
-y reg[2];
-y reg[0];
-y reg[0];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(2.093191e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-y reg[4];
-y reg[2];
-y reg[0];
-y reg[0];
-h reg[4];
-y reg[2];
-h reg[0];
-y reg[0];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(2.093191e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-h reg[4];
-y reg[2];
-h reg[0];
-y reg[0];
-y reg[4];
-h reg[2];
-y reg[0];
-h reg[0];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(2.093191e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-y reg[4];
-h reg[2];
-y reg[0];
-h reg[0];
-y reg[4];
-y reg[2];
-h reg[0];
-h reg[0];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(2.093191e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-y reg[4];
-y reg[2];
-h reg[0];
-h reg[0];
-h reg[4];
-h reg[2];
-y reg[0];
-y reg[0];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(2.093191e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-h reg[4];
-h reg[2];
-y reg[0];
-y reg[0];
-y reg[4];
-h reg[2];
-h reg[0];
-y reg[0];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(2.093191e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-y reg[4];
-h reg[2];
-h reg[0];
-y reg[0];
-h reg[4];
-y reg[2];
-y reg[0];
-h reg[0];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(2.093191e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-h reg[4];
-y reg[2];
-y reg[0];
-h reg[0];
-h reg[4];
-h reg[3];
-h reg[0];
-h reg[0];
-cx reg[4],reg[3];
-cx reg[3],reg[1];
-cx reg[1],reg[0];
-rz(2.779911e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[3],reg[1];
-cx reg[4],reg[3];
-h reg[4];
-h reg[3];
-h reg[0];
-h reg[0];
-y reg[4];
-y reg[3];
-y reg[0];
-y reg[0];
-cx reg[4],reg[3];
-cx reg[3],reg[1];
-cx reg[1],reg[0];
-rz(2.779911e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[3],reg[1];
-cx reg[4],reg[3];
-y reg[4];
-y reg[3];
-y reg[0];
-y reg[0];
-h reg[4];
-y reg[3];
-h reg[0];
-y reg[0];
-cx reg[4],reg[3];
-cx reg[3],reg[1];
-cx reg[1],reg[0];
-rz(2.779911e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[3],reg[1];
-cx reg[4],reg[3];
-h reg[4];
-y reg[3];
-h reg[0];
-y reg[0];
-y reg[4];
-h reg[3];
-y reg[0];
-h reg[0];
-cx reg[4],reg[3];
-cx reg[3],reg[1];
-cx reg[1],reg[0];
-rz(2.779911e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[3],reg[1];
-cx reg[4],reg[3];
-y reg[4];
-h reg[3];
-y reg[0];
-h reg[0];
-y reg[4];
-y reg[3];
-h reg[0];
-h reg[0];
-cx reg[4],reg[3];
-cx reg[3],reg[1];
-cx reg[1],reg[0];
-rz(2.779911e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[3],reg[1];
-cx reg[4],reg[3];
-y reg[4];
-y reg[3];
-h reg[0];
-h reg[0];
-h reg[4];
-h reg[3];
-y reg[0];
-y reg[0];
-cx reg[4],reg[3];
-cx reg[3],reg[1];
-cx reg[1],reg[0];
-rz(2.779911e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[3],reg[1];
-cx reg[4],reg[3];
-h reg[4];
-h reg[3];
-y reg[0];
-y reg[0];
-y reg[4];
-h reg[3];
-h reg[0];
-y reg[0];
-cx reg[4],reg[3];
-cx reg[3],reg[1];
-cx reg[1],reg[0];
-rz(2.779911e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[3],reg[1];
-cx reg[4],reg[3];
-y reg[4];
-h reg[3];
-h reg[0];
-y reg[0];
-h reg[4];
-y reg[3];
-y reg[0];
-h reg[0];
-cx reg[4],reg[3];
-cx reg[3],reg[1];
-cx reg[1],reg[0];
-rz(2.779911e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[3],reg[1];
-cx reg[4],reg[3];
-h reg[4];
-y reg[3];
-y reg[0];
-h reg[0];
-h reg[4];
-h reg[3];
-h reg[0];
-h reg[0];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(4.688447e-01) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-h reg[4];
-h reg[3];
-h reg[0];
-h reg[0];
-y reg[4];
-y reg[3];
-y reg[0];
-y reg[0];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(4.688447e-01) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-y reg[4];
-y reg[3];
-y reg[0];
-y reg[0];
-h reg[4];
-y reg[3];
-h reg[0];
-y reg[0];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(4.688447e-01) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-h reg[4];
-y reg[3];
-h reg[0];
-y reg[0];
-y reg[4];
-h reg[3];
-y reg[0];
-h reg[0];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(4.688447e-01) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-y reg[4];
-h reg[3];
-y reg[0];
-h reg[0];
-y reg[4];
-y reg[3];
-h reg[0];
-h reg[0];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(4.688447e-01) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-y reg[4];
-y reg[3];
-h reg[0];
-h reg[0];
-h reg[4];
-h reg[3];
-y reg[0];
-y reg[0];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(4.688447e-01) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-h reg[4];
-h reg[3];
-y reg[0];
-y reg[0];
-y reg[4];
-h reg[3];
-h reg[0];
-y reg[0];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(4.688447e-01) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-y reg[4];
-h reg[3];
-h reg[0];
-y reg[0];
-h reg[4];
-y reg[3];
-y reg[0];
-h reg[0];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(4.688447e-01) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-h reg[4];
-y reg[3];
-y reg[0];
-h reg[0];
-h reg[4];
-h reg[3];
-h reg[1];
-h reg[1];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-rz(9.386544e-01) reg[1];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-h reg[4];
-h reg[3];
-h reg[1];
-h reg[1];
-y reg[4];
-y reg[3];
-y reg[1];
-y reg[1];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-rz(9.386544e-01) reg[1];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-y reg[4];
-y reg[3];
-y reg[1];
-y reg[1];
-h reg[4];
-y reg[3];
-h reg[1];
-y reg[1];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-rz(9.386544e-01) reg[1];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-h reg[4];
-y reg[3];
-h reg[1];
-y reg[1];
-y reg[4];
-h reg[3];
-y reg[1];
-h reg[1];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-rz(9.386544e-01) reg[1];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-y reg[4];
-h reg[3];
-y reg[1];
-h reg[1];
-y reg[4];
-y reg[3];
-h reg[1];
-h reg[1];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-rz(9.386544e-01) reg[1];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-y reg[4];
-y reg[3];
-h reg[1];
-h reg[1];
-h reg[4];
-h reg[3];
-y reg[1];
-y reg[1];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-rz(9.386544e-01) reg[1];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-h reg[4];
-h reg[3];
-y reg[1];
-y reg[1];
-y reg[4];
-h reg[3];
-h reg[1];
-y reg[1];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-rz(9.386544e-01) reg[1];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-y reg[4];
-h reg[3];
-h reg[1];
-y reg[1];
-h reg[4];
-y reg[3];
-y reg[1];
-h reg[1];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-rz(9.386544e-01) reg[1];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-h reg[4];
-y reg[3];
-y reg[1];
-h reg[1];
-h reg[5];
-h reg[2];
-h reg[0];
-h reg[0];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(1.247019e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-h reg[5];
-h reg[2];
-h reg[0];
-h reg[0];
-y reg[5];
-y reg[2];
-y reg[0];
-y reg[0];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(1.247019e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-y reg[5];
-y reg[2];
-y reg[0];
-y reg[0];
-h reg[5];
-y reg[2];
-h reg[0];
-y reg[0];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(1.247019e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-h reg[5];
-y reg[2];
-h reg[0];
-y reg[0];
-y reg[5];
-h reg[2];
-y reg[0];
-h reg[0];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(1.247019e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-y reg[5];
-h reg[2];
-y reg[0];
-h reg[0];
-y reg[5];
-y reg[2];
-h reg[0];
-h reg[0];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(1.247019e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-y reg[5];
-y reg[2];
-h reg[0];
-h reg[0];
-h reg[5];
-h reg[2];
-y reg[0];
-y reg[0];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(1.247019e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-h reg[5];
-h reg[2];
-y reg[0];
-y reg[0];
-y reg[5];
-h reg[2];
-h reg[0];
-y reg[0];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(1.247019e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-y reg[5];
-h reg[2];
-h reg[0];
-y reg[0];
-h reg[5];
-y reg[2];
-y reg[0];
-h reg[0];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(1.247019e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-h reg[5];
-y reg[2];
-y reg[0];
-h reg[0];
-h reg[5];
-h reg[3];
-h reg[0];
-h reg[0];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[1];
-cx reg[1],reg[0];
-rz(3.290294e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[3],reg[1];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-h reg[5];
-h reg[3];
-h reg[0];
-h reg[0];
-y reg[5];
-y reg[3];
-y reg[0];
-y reg[0];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[1];
-cx reg[1],reg[0];
-rz(3.290294e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[3],reg[1];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-y reg[5];
-y reg[3];
-y reg[0];
-y reg[0];
-h reg[5];
-y reg[3];
-h reg[0];
-y reg[0];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[1];
-cx reg[1],reg[0];
-rz(3.290294e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[3],reg[1];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-h reg[5];
-y reg[3];
-h reg[0];
-y reg[0];
-y reg[5];
-h reg[3];
-y reg[0];
-h reg[0];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[1];
-cx reg[1],reg[0];
-rz(3.290294e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[3],reg[1];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-y reg[5];
-h reg[3];
-y reg[0];
-h reg[0];
-y reg[5];
-y reg[3];
-h reg[0];
-h reg[0];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[1];
-cx reg[1],reg[0];
-rz(3.290294e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[3],reg[1];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-y reg[5];
-y reg[3];
-h reg[0];
-h reg[0];
-h reg[5];
-h reg[3];
-y reg[0];
-y reg[0];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[1];
-cx reg[1],reg[0];
-rz(3.290294e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[3],reg[1];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-h reg[5];
-h reg[3];
-y reg[0];
-y reg[0];
-y reg[5];
-h reg[3];
-h reg[0];
-y reg[0];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[1];
-cx reg[1],reg[0];
-rz(3.290294e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[3],reg[1];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-y reg[5];
-h reg[3];
-h reg[0];
-y reg[0];
-h reg[5];
-y reg[3];
-y reg[0];
-h reg[0];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[1];
-cx reg[1],reg[0];
-rz(3.290294e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[3],reg[1];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-h reg[5];
-y reg[3];
-y reg[0];
-h reg[0];
-h reg[5];
-h reg[3];
-h reg[0];
-h reg[0];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(1.769559e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-h reg[5];
-h reg[3];
-h reg[0];
-h reg[0];
-y reg[5];
-y reg[3];
-y reg[0];
-y reg[0];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(1.769559e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-y reg[5];
-y reg[3];
-y reg[0];
-y reg[0];
-h reg[5];
-y reg[3];
-h reg[0];
-y reg[0];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(1.769559e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-h reg[5];
-y reg[3];
-h reg[0];
-y reg[0];
-y reg[5];
-h reg[3];
-y reg[0];
-h reg[0];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(1.769559e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-y reg[5];
-h reg[3];
-y reg[0];
-h reg[0];
-y reg[5];
-y reg[3];
-h reg[0];
-h reg[0];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(1.769559e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-y reg[5];
-y reg[3];
-h reg[0];
-h reg[0];
-h reg[5];
-h reg[3];
-y reg[0];
-y reg[0];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(1.769559e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-h reg[5];
-h reg[3];
-y reg[0];
-y reg[0];
-y reg[5];
-h reg[3];
-h reg[0];
-y reg[0];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(1.769559e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-y reg[5];
-h reg[3];
-h reg[0];
-y reg[0];
-h reg[5];
-y reg[3];
-y reg[0];
-h reg[0];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(1.769559e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-h reg[5];
-y reg[3];
-y reg[0];
-h reg[0];
-h reg[5];
-h reg[3];
-h reg[1];
-h reg[1];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-rz(5.048614e+00) reg[1];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-h reg[5];
-h reg[3];
-h reg[1];
-h reg[1];
-y reg[5];
-y reg[3];
-y reg[1];
-y reg[1];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-rz(5.048614e+00) reg[1];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-y reg[5];
-y reg[3];
-y reg[1];
-y reg[1];
-h reg[5];
-y reg[3];
-h reg[1];
-y reg[1];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-rz(5.048614e+00) reg[1];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-h reg[5];
-y reg[3];
-h reg[1];
-y reg[1];
-y reg[5];
-h reg[3];
-y reg[1];
-h reg[1];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-rz(5.048614e+00) reg[1];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-y reg[5];
-h reg[3];
-y reg[1];
-h reg[1];
-y reg[5];
-y reg[3];
-h reg[1];
-h reg[1];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-rz(5.048614e+00) reg[1];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-y reg[5];
-y reg[3];
-h reg[1];
-h reg[1];
-h reg[5];
-h reg[3];
-y reg[1];
-y reg[1];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-rz(5.048614e+00) reg[1];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-h reg[5];
-h reg[3];
-y reg[1];
-y reg[1];
-y reg[5];
-h reg[3];
-h reg[1];
-y reg[1];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-rz(5.048614e+00) reg[1];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-y reg[5];
-h reg[3];
-h reg[1];
-y reg[1];
-h reg[5];
-y reg[3];
-y reg[1];
-h reg[1];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-rz(5.048614e+00) reg[1];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-h reg[5];
-y reg[3];
-y reg[1];
-h reg[1];
-h reg[5];
-h reg[4];
-h reg[0];
-h reg[0];
-cx reg[5],reg[4];
-cx reg[4],reg[1];
-cx reg[1],reg[0];
-rz(4.302892e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[4],reg[1];
-cx reg[5],reg[4];
-h reg[5];
-h reg[4];
-h reg[0];
-h reg[0];
-y reg[5];
-y reg[4];
-y reg[0];
-y reg[0];
-cx reg[5],reg[4];
-cx reg[4],reg[1];
-cx reg[1],reg[0];
-rz(4.302892e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[4],reg[1];
-cx reg[5],reg[4];
-y reg[5];
-y reg[4];
-y reg[0];
-y reg[0];
-h reg[5];
-y reg[4];
-h reg[0];
-y reg[0];
-cx reg[5],reg[4];
-cx reg[4],reg[1];
-cx reg[1],reg[0];
-rz(4.302892e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[4],reg[1];
-cx reg[5],reg[4];
-h reg[5];
-y reg[4];
-h reg[0];
-y reg[0];
-y reg[5];
-h reg[4];
-y reg[0];
-h reg[0];
-cx reg[5],reg[4];
-cx reg[4],reg[1];
-cx reg[1],reg[0];
-rz(4.302892e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[4],reg[1];
-cx reg[5],reg[4];
-y reg[5];
-h reg[4];
-y reg[0];
-h reg[0];
-y reg[5];
-y reg[4];
-h reg[0];
-h reg[0];
-cx reg[5],reg[4];
-cx reg[4],reg[1];
-cx reg[1],reg[0];
-rz(4.302892e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[4],reg[1];
-cx reg[5],reg[4];
-y reg[5];
-y reg[4];
-h reg[0];
-h reg[0];
-h reg[5];
-h reg[4];
-y reg[0];
-y reg[0];
-cx reg[5],reg[4];
-cx reg[4],reg[1];
-cx reg[1],reg[0];
-rz(4.302892e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[4],reg[1];
-cx reg[5],reg[4];
-h reg[5];
-h reg[4];
-y reg[0];
-y reg[0];
-y reg[5];
-h reg[4];
-h reg[0];
-y reg[0];
-cx reg[5],reg[4];
-cx reg[4],reg[1];
-cx reg[1],reg[0];
-rz(4.302892e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[4],reg[1];
-cx reg[5],reg[4];
-y reg[5];
-h reg[4];
-h reg[0];
-y reg[0];
-h reg[5];
-y reg[4];
-y reg[0];
-h reg[0];
-cx reg[5],reg[4];
-cx reg[4],reg[1];
-cx reg[1],reg[0];
-rz(4.302892e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[4],reg[1];
-cx reg[5],reg[4];
-h reg[5];
-y reg[4];
-y reg[0];
-h reg[0];
-h reg[5];
-h reg[4];
-h reg[0];
-h reg[0];
-cx reg[5],reg[4];
-cx reg[4],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(9.926059e-01) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[4],reg[2];
-cx reg[5],reg[4];
-h reg[5];
-h reg[4];
-h reg[0];
-h reg[0];
-y reg[5];
-y reg[4];
-y reg[0];
-y reg[0];
-cx reg[5],reg[4];
-cx reg[4],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(9.926059e-01) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[4],reg[2];
-cx reg[5],reg[4];
-y reg[5];
-y reg[4];
-y reg[0];
-y reg[0];
-h reg[5];
-y reg[4];
-h reg[0];
-y reg[0];
-cx reg[5],reg[4];
-cx reg[4],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(9.926059e-01) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[4],reg[2];
-cx reg[5],reg[4];
-h reg[5];
-y reg[4];
-h reg[0];
-y reg[0];
-y reg[5];
-h reg[4];
-y reg[0];
-h reg[0];
-cx reg[5],reg[4];
-cx reg[4],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(9.926059e-01) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[4],reg[2];
-cx reg[5],reg[4];
-y reg[5];
-h reg[4];
-y reg[0];
-h reg[0];
-y reg[5];
-y reg[4];
-h reg[0];
-h reg[0];
-cx reg[5],reg[4];
-cx reg[4],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(9.926059e-01) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[4],reg[2];
-cx reg[5],reg[4];
-y reg[5];
-y reg[4];
-h reg[0];
-h reg[0];
-h reg[5];
-h reg[4];
-y reg[0];
-y reg[0];
-cx reg[5],reg[4];
-cx reg[4],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(9.926059e-01) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[4],reg[2];
-cx reg[5],reg[4];
-h reg[5];
-h reg[4];
-y reg[0];
-y reg[0];
-y reg[5];
-h reg[4];
-h reg[0];
-y reg[0];
-cx reg[5],reg[4];
-cx reg[4],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(9.926059e-01) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[4],reg[2];
-cx reg[5],reg[4];
-y reg[5];
-h reg[4];
-h reg[0];
-y reg[0];
-h reg[5];
-y reg[4];
-y reg[0];
-h reg[0];
-cx reg[5],reg[4];
-cx reg[4],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(9.926059e-01) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[4],reg[2];
-cx reg[5],reg[4];
-h reg[5];
-y reg[4];
-y reg[0];
-h reg[0];
-h reg[5];
-h reg[4];
-h reg[1];
-h reg[1];
-cx reg[5],reg[4];
-cx reg[4],reg[2];
-cx reg[2],reg[1];
-rz(6.762655e-01) reg[1];
-cx reg[2],reg[1];
-cx reg[4],reg[2];
-cx reg[5],reg[4];
-h reg[5];
-h reg[4];
-h reg[1];
-h reg[1];
-y reg[5];
-y reg[4];
-y reg[1];
-y reg[1];
-cx reg[5],reg[4];
-cx reg[4],reg[2];
-cx reg[2],reg[1];
-rz(6.762655e-01) reg[1];
-cx reg[2],reg[1];
-cx reg[4],reg[2];
-cx reg[5],reg[4];
-y reg[5];
-y reg[4];
-y reg[1];
-y reg[1];
-h reg[5];
-y reg[4];
-h reg[1];
-y reg[1];
-cx reg[5],reg[4];
-cx reg[4],reg[2];
-cx reg[2],reg[1];
-rz(6.762655e-01) reg[1];
-cx reg[2],reg[1];
-cx reg[4],reg[2];
-cx reg[5],reg[4];
-h reg[5];
-y reg[4];
-h reg[1];
-y reg[1];
-y reg[5];
-h reg[4];
-y reg[1];
-h reg[1];
-cx reg[5],reg[4];
-cx reg[4],reg[2];
-cx reg[2],reg[1];
-rz(6.762655e-01) reg[1];
-cx reg[2],reg[1];
-cx reg[4],reg[2];
-cx reg[5],reg[4];
-y reg[5];
-h reg[4];
-y reg[1];
-h reg[1];
-y reg[5];
-y reg[4];
-h reg[1];
-h reg[1];
-cx reg[5],reg[4];
-cx reg[4],reg[2];
-cx reg[2],reg[1];
-rz(6.762655e-01) reg[1];
-cx reg[2],reg[1];
-cx reg[4],reg[2];
-cx reg[5],reg[4];
-y reg[5];
-y reg[4];
-h reg[1];
-h reg[1];
-h reg[5];
-h reg[4];
-y reg[1];
-y reg[1];
-cx reg[5],reg[4];
-cx reg[4],reg[2];
-cx reg[2],reg[1];
-rz(6.762655e-01) reg[1];
-cx reg[2],reg[1];
-cx reg[4],reg[2];
-cx reg[5],reg[4];
-h reg[5];
-h reg[4];
-y reg[1];
-y reg[1];
-y reg[5];
-h reg[4];
-h reg[1];
-y reg[1];
-cx reg[5],reg[4];
-cx reg[4],reg[2];
-cx reg[2],reg[1];
-rz(6.762655e-01) reg[1];
-cx reg[2],reg[1];
-cx reg[4],reg[2];
-cx reg[5],reg[4];
-y reg[5];
-h reg[4];
-h reg[1];
-y reg[1];
-h reg[5];
-y reg[4];
-y reg[1];
-h reg[1];
-cx reg[5],reg[4];
-cx reg[4],reg[2];
-cx reg[2],reg[1];
-rz(6.762655e-01) reg[1];
-cx reg[2],reg[1];
-cx reg[4],reg[2];
-cx reg[5],reg[4];
-h reg[5];
-y reg[4];
-y reg[1];
-h reg[1];
-h reg[5];
-h reg[4];
-h reg[0];
-h reg[0];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(2.946331e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-h reg[5];
-h reg[4];
-h reg[0];
-h reg[0];
-y reg[5];
-y reg[4];
-y reg[0];
-y reg[0];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(2.946331e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-y reg[5];
-y reg[4];
-y reg[0];
-y reg[0];
-h reg[5];
-y reg[4];
-h reg[0];
-y reg[0];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(2.946331e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-h reg[5];
-y reg[4];
-h reg[0];
-y reg[0];
-y reg[5];
-h reg[4];
-y reg[0];
-h reg[0];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(2.946331e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-y reg[5];
-h reg[4];
-y reg[0];
-h reg[0];
-y reg[5];
-y reg[4];
-h reg[0];
-h reg[0];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(2.946331e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-y reg[5];
-y reg[4];
-h reg[0];
-h reg[0];
-h reg[5];
-h reg[4];
-y reg[0];
-y reg[0];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(2.946331e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-h reg[5];
-h reg[4];
-y reg[0];
-y reg[0];
-y reg[5];
-h reg[4];
-h reg[0];
-y reg[0];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(2.946331e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-y reg[5];
-h reg[4];
-h reg[0];
-y reg[0];
-h reg[5];
-y reg[4];
-y reg[0];
-h reg[0];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(2.946331e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-h reg[5];
-y reg[4];
-y reg[0];
-h reg[0];
-h reg[5];
-h reg[4];
-h reg[1];
-h reg[1];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-rz(2.867847e+00) reg[1];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-h reg[5];
-h reg[4];
-h reg[1];
-h reg[1];
-y reg[5];
-y reg[4];
-y reg[1];
-y reg[1];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-rz(2.867847e+00) reg[1];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-y reg[5];
-y reg[4];
-y reg[1];
-y reg[1];
-h reg[5];
-y reg[4];
-h reg[1];
-y reg[1];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-rz(2.867847e+00) reg[1];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-h reg[5];
-y reg[4];
-h reg[1];
-y reg[1];
-y reg[5];
-h reg[4];
-y reg[1];
-h reg[1];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-rz(2.867847e+00) reg[1];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-y reg[5];
-h reg[4];
-y reg[1];
-h reg[1];
-y reg[5];
-y reg[4];
-h reg[1];
-h reg[1];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-rz(2.867847e+00) reg[1];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-y reg[5];
-y reg[4];
-h reg[1];
-h reg[1];
-h reg[5];
-h reg[4];
-y reg[1];
-y reg[1];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-rz(2.867847e+00) reg[1];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-h reg[5];
-h reg[4];
-y reg[1];
-y reg[1];
-y reg[5];
-h reg[4];
-h reg[1];
-y reg[1];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-rz(2.867847e+00) reg[1];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-y reg[5];
-h reg[4];
-h reg[1];
-y reg[1];
-h reg[5];
-y reg[4];
-y reg[1];
-h reg[1];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-rz(2.867847e+00) reg[1];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-h reg[5];
-y reg[4];
-y reg[1];
-h reg[1];
-h reg[5];
-h reg[4];
-h reg[2];
-h reg[2];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-rz(1.324597e+00) reg[2];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-h reg[5];
-h reg[4];
-h reg[2];
-h reg[2];
-y reg[5];
-y reg[4];
-y reg[2];
-y reg[2];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-rz(1.324597e+00) reg[2];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-y reg[5];
-y reg[4];
-y reg[2];
-y reg[2];
-h reg[5];
-y reg[4];
-h reg[2];
-y reg[2];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-rz(1.324597e+00) reg[2];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-h reg[5];
-y reg[4];
-h reg[2];
-y reg[2];
-y reg[5];
-h reg[4];
-y reg[2];
-h reg[2];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-rz(1.324597e+00) reg[2];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-y reg[5];
-h reg[4];
-y reg[2];
-h reg[2];
-y reg[5];
-y reg[4];
-h reg[2];
-h reg[2];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-rz(1.324597e+00) reg[2];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-y reg[5];
-y reg[4];
-h reg[2];
-h reg[2];
-h reg[5];
-h reg[4];
-y reg[2];
-y reg[2];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-rz(1.324597e+00) reg[2];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-h reg[5];
-h reg[4];
-y reg[2];
-y reg[2];
-y reg[5];
-h reg[4];
-h reg[2];
-y reg[2];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-rz(1.324597e+00) reg[2];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-y reg[5];
-h reg[4];
-h reg[2];
-y reg[2];
-h reg[5];
-y reg[4];
-y reg[2];
-h reg[2];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-rz(1.324597e+00) reg[2];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-h reg[5];
-y reg[4];
-y reg[2];
-h reg[2];
-h reg[6];
-h reg[2];
-h reg[0];
-h reg[0];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(3.099363e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-h reg[6];
-h reg[2];
-h reg[0];
-h reg[0];
-y reg[6];
-y reg[2];
-y reg[0];
-y reg[0];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(3.099363e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-y reg[6];
-y reg[2];
-y reg[0];
-y reg[0];
-h reg[6];
-y reg[2];
-h reg[0];
-y reg[0];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(3.099363e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-h reg[6];
-y reg[2];
-h reg[0];
-y reg[0];
-y reg[6];
-h reg[2];
-y reg[0];
-h reg[0];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(3.099363e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-y reg[6];
-h reg[2];
-y reg[0];
-h reg[0];
-y reg[6];
-y reg[2];
-h reg[0];
-h reg[0];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(3.099363e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-y reg[6];
-y reg[2];
-h reg[0];
-h reg[0];
-h reg[6];
-h reg[2];
-y reg[0];
-y reg[0];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(3.099363e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-h reg[6];
-h reg[2];
-y reg[0];
-y reg[0];
-y reg[6];
-h reg[2];
-h reg[0];
-y reg[0];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(3.099363e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-y reg[6];
-h reg[2];
-h reg[0];
-y reg[0];
-h reg[6];
-y reg[2];
-y reg[0];
-h reg[0];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(3.099363e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-h reg[6];
-y reg[2];
-y reg[0];
-h reg[0];
-h reg[6];
-h reg[3];
-h reg[0];
-h reg[0];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[1];
-cx reg[1],reg[0];
-rz(2.270469e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[3],reg[1];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-h reg[6];
-h reg[3];
-h reg[0];
-h reg[0];
-y reg[6];
-y reg[3];
-y reg[0];
-y reg[0];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[1];
-cx reg[1],reg[0];
-rz(2.270469e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[3],reg[1];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-y reg[6];
-y reg[3];
-y reg[0];
-y reg[0];
-h reg[6];
-y reg[3];
-h reg[0];
-y reg[0];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[1];
-cx reg[1],reg[0];
-rz(2.270469e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[3],reg[1];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-h reg[6];
-y reg[3];
-h reg[0];
-y reg[0];
-y reg[6];
-h reg[3];
-y reg[0];
-h reg[0];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[1];
-cx reg[1],reg[0];
-rz(2.270469e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[3],reg[1];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-y reg[6];
-h reg[3];
-y reg[0];
-h reg[0];
-y reg[6];
-y reg[3];
-h reg[0];
-h reg[0];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[1];
-cx reg[1],reg[0];
-rz(2.270469e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[3],reg[1];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-y reg[6];
-y reg[3];
-h reg[0];
-h reg[0];
-h reg[6];
-h reg[3];
-y reg[0];
-y reg[0];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[1];
-cx reg[1],reg[0];
-rz(2.270469e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[3],reg[1];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-h reg[6];
-h reg[3];
-y reg[0];
-y reg[0];
-y reg[6];
-h reg[3];
-h reg[0];
-y reg[0];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[1];
-cx reg[1],reg[0];
-rz(2.270469e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[3],reg[1];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-y reg[6];
-h reg[3];
-h reg[0];
-y reg[0];
-h reg[6];
-y reg[3];
-y reg[0];
-h reg[0];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[1];
-cx reg[1],reg[0];
-rz(2.270469e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[3],reg[1];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-h reg[6];
-y reg[3];
-y reg[0];
-h reg[0];
-h reg[6];
-h reg[3];
-h reg[0];
-h reg[0];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(4.511343e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-h reg[6];
-h reg[3];
-h reg[0];
-h reg[0];
-y reg[6];
-y reg[3];
-y reg[0];
-y reg[0];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(4.511343e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-y reg[6];
-y reg[3];
-y reg[0];
-y reg[0];
-h reg[6];
-y reg[3];
-h reg[0];
-y reg[0];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(4.511343e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-h reg[6];
-y reg[3];
-h reg[0];
-y reg[0];
-y reg[6];
-h reg[3];
-y reg[0];
-h reg[0];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(4.511343e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-y reg[6];
-h reg[3];
-y reg[0];
-h reg[0];
-y reg[6];
-y reg[3];
-h reg[0];
-h reg[0];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(4.511343e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-y reg[6];
-y reg[3];
-h reg[0];
-h reg[0];
-h reg[6];
-h reg[3];
-y reg[0];
-y reg[0];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(4.511343e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-h reg[6];
-h reg[3];
-y reg[0];
-y reg[0];
-y reg[6];
-h reg[3];
-h reg[0];
-y reg[0];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(4.511343e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-y reg[6];
-h reg[3];
-h reg[0];
-y reg[0];
-h reg[6];
-y reg[3];
-y reg[0];
-h reg[0];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(4.511343e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-h reg[6];
-y reg[3];
-y reg[0];
-h reg[0];
-h reg[6];
-h reg[3];
-h reg[1];
-h reg[1];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-rz(2.655704e+00) reg[1];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-h reg[6];
-h reg[3];
-h reg[1];
-h reg[1];
-y reg[6];
-y reg[3];
-y reg[1];
-y reg[1];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-rz(2.655704e+00) reg[1];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-y reg[6];
-y reg[3];
-y reg[1];
-y reg[1];
-h reg[6];
-y reg[3];
-h reg[1];
-y reg[1];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-rz(2.655704e+00) reg[1];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-h reg[6];
-y reg[3];
-h reg[1];
-y reg[1];
-y reg[6];
-h reg[3];
-y reg[1];
-h reg[1];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-rz(2.655704e+00) reg[1];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-y reg[6];
-h reg[3];
-y reg[1];
-h reg[1];
-y reg[6];
-y reg[3];
-h reg[1];
-h reg[1];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-rz(2.655704e+00) reg[1];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-y reg[6];
-y reg[3];
-h reg[1];
-h reg[1];
-h reg[6];
-h reg[3];
-y reg[1];
-y reg[1];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-rz(2.655704e+00) reg[1];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-h reg[6];
-h reg[3];
-y reg[1];
-y reg[1];
-y reg[6];
-h reg[3];
-h reg[1];
-y reg[1];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-rz(2.655704e+00) reg[1];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-y reg[6];
-h reg[3];
-h reg[1];
-y reg[1];
-h reg[6];
-y reg[3];
-y reg[1];
-h reg[1];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-rz(2.655704e+00) reg[1];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-h reg[6];
-y reg[3];
-y reg[1];
-h reg[1];
-h reg[6];
-h reg[4];
-h reg[0];
-h reg[0];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[1];
-cx reg[1],reg[0];
-rz(5.354909e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[4],reg[1];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-h reg[6];
-h reg[4];
-h reg[0];
-h reg[0];
-y reg[6];
-y reg[4];
-y reg[0];
-y reg[0];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[1];
-cx reg[1],reg[0];
-rz(5.354909e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[4],reg[1];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-y reg[6];
-y reg[4];
-y reg[0];
-y reg[0];
-h reg[6];
-y reg[4];
-h reg[0];
-y reg[0];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[1];
-cx reg[1],reg[0];
-rz(5.354909e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[4],reg[1];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-h reg[6];
-y reg[4];
-h reg[0];
-y reg[0];
-y reg[6];
-h reg[4];
-y reg[0];
-h reg[0];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[1];
-cx reg[1],reg[0];
-rz(5.354909e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[4],reg[1];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-y reg[6];
-h reg[4];
-y reg[0];
-h reg[0];
-y reg[6];
-y reg[4];
-h reg[0];
-h reg[0];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[1];
-cx reg[1],reg[0];
-rz(5.354909e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[4],reg[1];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-y reg[6];
-y reg[4];
-h reg[0];
-h reg[0];
-h reg[6];
-h reg[4];
-y reg[0];
-y reg[0];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[1];
-cx reg[1],reg[0];
-rz(5.354909e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[4],reg[1];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-h reg[6];
-h reg[4];
-y reg[0];
-y reg[0];
-y reg[6];
-h reg[4];
-h reg[0];
-y reg[0];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[1];
-cx reg[1],reg[0];
-rz(5.354909e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[4],reg[1];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-y reg[6];
-h reg[4];
-h reg[0];
-y reg[0];
-h reg[6];
-y reg[4];
-y reg[0];
-h reg[0];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[1];
-cx reg[1],reg[0];
-rz(5.354909e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[4],reg[1];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-h reg[6];
-y reg[4];
-y reg[0];
-h reg[0];
-h reg[6];
-h reg[4];
-h reg[0];
-h reg[0];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(1.150055e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[4],reg[2];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-h reg[6];
-h reg[4];
-h reg[0];
-h reg[0];
-y reg[6];
-y reg[4];
-y reg[0];
-y reg[0];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(1.150055e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[4],reg[2];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-y reg[6];
-y reg[4];
-y reg[0];
-y reg[0];
-h reg[6];
-y reg[4];
-h reg[0];
-y reg[0];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(1.150055e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[4],reg[2];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-h reg[6];
-y reg[4];
-h reg[0];
-y reg[0];
-y reg[6];
-h reg[4];
-y reg[0];
-h reg[0];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(1.150055e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[4],reg[2];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-y reg[6];
-h reg[4];
-y reg[0];
-h reg[0];
-y reg[6];
-y reg[4];
-h reg[0];
-h reg[0];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(1.150055e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[4],reg[2];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-y reg[6];
-y reg[4];
-h reg[0];
-h reg[0];
-h reg[6];
-h reg[4];
-y reg[0];
-y reg[0];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(1.150055e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[4],reg[2];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-h reg[6];
-h reg[4];
-y reg[0];
-y reg[0];
-y reg[6];
-h reg[4];
-h reg[0];
-y reg[0];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(1.150055e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[4],reg[2];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-y reg[6];
-h reg[4];
-h reg[0];
-y reg[0];
-h reg[6];
-y reg[4];
-y reg[0];
-h reg[0];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(1.150055e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[4],reg[2];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-h reg[6];
-y reg[4];
-y reg[0];
-h reg[0];
-h reg[6];
-h reg[4];
-h reg[1];
-h reg[1];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[2];
-cx reg[2],reg[1];
-rz(5.886901e+00) reg[1];
-cx reg[2],reg[1];
-cx reg[4],reg[2];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-h reg[6];
-h reg[4];
-h reg[1];
-h reg[1];
-y reg[6];
-y reg[4];
-y reg[1];
-y reg[1];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[2];
-cx reg[2],reg[1];
-rz(5.886901e+00) reg[1];
-cx reg[2],reg[1];
-cx reg[4],reg[2];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-y reg[6];
-y reg[4];
-y reg[1];
-y reg[1];
-h reg[6];
-y reg[4];
-h reg[1];
-y reg[1];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[2];
-cx reg[2],reg[1];
-rz(5.886901e+00) reg[1];
-cx reg[2],reg[1];
-cx reg[4],reg[2];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-h reg[6];
-y reg[4];
-h reg[1];
-y reg[1];
-y reg[6];
-h reg[4];
-y reg[1];
-h reg[1];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[2];
-cx reg[2],reg[1];
-rz(5.886901e+00) reg[1];
-cx reg[2],reg[1];
-cx reg[4],reg[2];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-y reg[6];
-h reg[4];
-y reg[1];
-h reg[1];
-y reg[6];
-y reg[4];
-h reg[1];
-h reg[1];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[2];
-cx reg[2],reg[1];
-rz(5.886901e+00) reg[1];
-cx reg[2],reg[1];
-cx reg[4],reg[2];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-y reg[6];
-y reg[4];
-h reg[1];
-h reg[1];
-h reg[6];
-h reg[4];
-y reg[1];
-y reg[1];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[2];
-cx reg[2],reg[1];
-rz(5.886901e+00) reg[1];
-cx reg[2],reg[1];
-cx reg[4],reg[2];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-h reg[6];
-h reg[4];
-y reg[1];
-y reg[1];
-y reg[6];
-h reg[4];
-h reg[1];
-y reg[1];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[2];
-cx reg[2],reg[1];
-rz(5.886901e+00) reg[1];
-cx reg[2],reg[1];
-cx reg[4],reg[2];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-y reg[6];
-h reg[4];
-h reg[1];
-y reg[1];
-h reg[6];
-y reg[4];
-y reg[1];
-h reg[1];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[2];
-cx reg[2],reg[1];
-rz(5.886901e+00) reg[1];
-cx reg[2],reg[1];
-cx reg[4],reg[2];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-h reg[6];
-y reg[4];
-y reg[1];
-h reg[1];
-h reg[6];
-h reg[4];
-h reg[0];
-h reg[0];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(1.612143e-01) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-h reg[6];
-h reg[4];
-h reg[0];
-h reg[0];
-y reg[6];
-y reg[4];
-y reg[0];
-y reg[0];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(1.612143e-01) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-y reg[6];
-y reg[4];
-y reg[0];
-y reg[0];
-h reg[6];
-y reg[4];
-h reg[0];
-y reg[0];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(1.612143e-01) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-h reg[6];
-y reg[4];
-h reg[0];
-y reg[0];
-y reg[6];
-h reg[4];
-y reg[0];
-h reg[0];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(1.612143e-01) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-y reg[6];
-h reg[4];
-y reg[0];
-h reg[0];
-y reg[6];
-y reg[4];
-h reg[0];
-h reg[0];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(1.612143e-01) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-y reg[6];
-y reg[4];
-h reg[0];
-h reg[0];
-h reg[6];
-h reg[4];
-y reg[0];
-y reg[0];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(1.612143e-01) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-h reg[6];
-h reg[4];
-y reg[0];
-y reg[0];
-y reg[6];
-h reg[4];
-h reg[0];
-y reg[0];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(1.612143e-01) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-y reg[6];
-h reg[4];
-h reg[0];
-y reg[0];
-h reg[6];
-y reg[4];
-y reg[0];
-h reg[0];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(1.612143e-01) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-h reg[6];
-y reg[4];
-y reg[0];
-h reg[0];
-h reg[6];
-h reg[4];
-h reg[1];
-h reg[1];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-rz(1.367690e+00) reg[1];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-h reg[6];
-h reg[4];
-h reg[1];
-h reg[1];
-y reg[6];
-y reg[4];
-y reg[1];
-y reg[1];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-rz(1.367690e+00) reg[1];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-y reg[6];
-y reg[4];
-y reg[1];
-y reg[1];
-h reg[6];
-y reg[4];
-h reg[1];
-y reg[1];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-rz(1.367690e+00) reg[1];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-h reg[6];
-y reg[4];
-h reg[1];
-y reg[1];
-y reg[6];
-h reg[4];
-y reg[1];
-h reg[1];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-rz(1.367690e+00) reg[1];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-y reg[6];
-h reg[4];
-y reg[1];
-h reg[1];
-y reg[6];
-y reg[4];
-h reg[1];
-h reg[1];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-rz(1.367690e+00) reg[1];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-y reg[6];
-y reg[4];
-h reg[1];
-h reg[1];
-h reg[6];
-h reg[4];
-y reg[1];
-y reg[1];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-rz(1.367690e+00) reg[1];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-h reg[6];
-h reg[4];
-y reg[1];
-y reg[1];
-y reg[6];
-h reg[4];
-h reg[1];
-y reg[1];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-rz(1.367690e+00) reg[1];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-y reg[6];
-h reg[4];
-h reg[1];
-y reg[1];
-h reg[6];
-y reg[4];
-y reg[1];
-h reg[1];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-rz(1.367690e+00) reg[1];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-h reg[6];
-y reg[4];
-y reg[1];
-h reg[1];
-h reg[6];
-h reg[4];
-h reg[2];
-h reg[2];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-rz(4.481711e+00) reg[2];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-h reg[6];
-h reg[4];
-h reg[2];
-h reg[2];
-y reg[6];
-y reg[4];
-y reg[2];
-y reg[2];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-rz(4.481711e+00) reg[2];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-y reg[6];
-y reg[4];
-y reg[2];
-y reg[2];
-h reg[6];
-y reg[4];
-h reg[2];
-y reg[2];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-rz(4.481711e+00) reg[2];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-h reg[6];
-y reg[4];
-h reg[2];
-y reg[2];
-y reg[6];
-h reg[4];
-y reg[2];
-h reg[2];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-rz(4.481711e+00) reg[2];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-y reg[6];
-h reg[4];
-y reg[2];
-h reg[2];
-y reg[6];
-y reg[4];
-h reg[2];
-h reg[2];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-rz(4.481711e+00) reg[2];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-y reg[6];
-y reg[4];
-h reg[2];
-h reg[2];
-h reg[6];
-h reg[4];
-y reg[2];
-y reg[2];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-rz(4.481711e+00) reg[2];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-h reg[6];
-h reg[4];
-y reg[2];
-y reg[2];
-y reg[6];
-h reg[4];
-h reg[2];
-y reg[2];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-rz(4.481711e+00) reg[2];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-y reg[6];
-h reg[4];
-h reg[2];
-y reg[2];
-h reg[6];
-y reg[4];
-y reg[2];
-h reg[2];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-rz(4.481711e+00) reg[2];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-h reg[6];
-y reg[4];
-y reg[2];
-h reg[2];
-h reg[6];
-h reg[5];
-h reg[0];
-h reg[0];
-cx reg[6],reg[5];
-cx reg[5],reg[1];
-cx reg[1],reg[0];
-rz(3.846725e-01) reg[0];
-cx reg[1],reg[0];
-cx reg[5],reg[1];
-cx reg[6],reg[5];
-h reg[6];
-h reg[5];
-h reg[0];
-h reg[0];
-y reg[6];
-y reg[5];
-y reg[0];
-y reg[0];
-cx reg[6],reg[5];
-cx reg[5],reg[1];
-cx reg[1],reg[0];
-rz(3.846725e-01) reg[0];
-cx reg[1],reg[0];
-cx reg[5],reg[1];
-cx reg[6],reg[5];
-y reg[6];
-y reg[5];
-y reg[0];
-y reg[0];
-h reg[6];
-y reg[5];
-h reg[0];
-y reg[0];
-cx reg[6],reg[5];
-cx reg[5],reg[1];
-cx reg[1],reg[0];
-rz(3.846725e-01) reg[0];
-cx reg[1],reg[0];
-cx reg[5],reg[1];
-cx reg[6],reg[5];
-h reg[6];
-y reg[5];
-h reg[0];
-y reg[0];
-y reg[6];
-h reg[5];
-y reg[0];
-h reg[0];
-cx reg[6],reg[5];
-cx reg[5],reg[1];
-cx reg[1],reg[0];
-rz(3.846725e-01) reg[0];
-cx reg[1],reg[0];
-cx reg[5],reg[1];
-cx reg[6],reg[5];
-y reg[6];
-h reg[5];
-y reg[0];
-h reg[0];
-y reg[6];
-y reg[5];
-h reg[0];
-h reg[0];
-cx reg[6],reg[5];
-cx reg[5],reg[1];
-cx reg[1],reg[0];
-rz(3.846725e-01) reg[0];
-cx reg[1],reg[0];
-cx reg[5],reg[1];
-cx reg[6],reg[5];
-y reg[6];
-y reg[5];
-h reg[0];
-h reg[0];
-h reg[6];
-h reg[5];
-y reg[0];
-y reg[0];
-cx reg[6],reg[5];
-cx reg[5],reg[1];
-cx reg[1],reg[0];
-rz(3.846725e-01) reg[0];
-cx reg[1],reg[0];
-cx reg[5],reg[1];
-cx reg[6],reg[5];
-h reg[6];
-h reg[5];
-y reg[0];
-y reg[0];
-y reg[6];
-h reg[5];
-h reg[0];
-y reg[0];
-cx reg[6],reg[5];
-cx reg[5],reg[1];
-cx reg[1],reg[0];
-rz(3.846725e-01) reg[0];
-cx reg[1],reg[0];
-cx reg[5],reg[1];
-cx reg[6],reg[5];
-y reg[6];
-h reg[5];
-h reg[0];
-y reg[0];
-h reg[6];
-y reg[5];
-y reg[0];
-h reg[0];
-cx reg[6],reg[5];
-cx reg[5],reg[1];
-cx reg[1],reg[0];
-rz(3.846725e-01) reg[0];
-cx reg[1],reg[0];
-cx reg[5],reg[1];
-cx reg[6],reg[5];
-h reg[6];
-y reg[5];
-y reg[0];
-h reg[0];
-h reg[6];
-h reg[5];
-h reg[0];
-h reg[0];
-cx reg[6],reg[5];
-cx reg[5],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(4.746693e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[5],reg[2];
-cx reg[6],reg[5];
-h reg[6];
-h reg[5];
-h reg[0];
-h reg[0];
-y reg[6];
-y reg[5];
-y reg[0];
-y reg[0];
-cx reg[6],reg[5];
-cx reg[5],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(4.746693e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[5],reg[2];
-cx reg[6],reg[5];
-y reg[6];
-y reg[5];
-y reg[0];
-y reg[0];
-h reg[6];
-y reg[5];
-h reg[0];
-y reg[0];
-cx reg[6],reg[5];
-cx reg[5],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(4.746693e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[5],reg[2];
-cx reg[6],reg[5];
-h reg[6];
-y reg[5];
-h reg[0];
-y reg[0];
-y reg[6];
-h reg[5];
-y reg[0];
-h reg[0];
-cx reg[6],reg[5];
-cx reg[5],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(4.746693e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[5],reg[2];
-cx reg[6],reg[5];
-y reg[6];
-h reg[5];
-y reg[0];
-h reg[0];
-y reg[6];
-y reg[5];
-h reg[0];
-h reg[0];
-cx reg[6],reg[5];
-cx reg[5],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(4.746693e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[5],reg[2];
-cx reg[6],reg[5];
-y reg[6];
-y reg[5];
-h reg[0];
-h reg[0];
-h reg[6];
-h reg[5];
-y reg[0];
-y reg[0];
-cx reg[6],reg[5];
-cx reg[5],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(4.746693e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[5],reg[2];
-cx reg[6],reg[5];
-h reg[6];
-h reg[5];
-y reg[0];
-y reg[0];
-y reg[6];
-h reg[5];
-h reg[0];
-y reg[0];
-cx reg[6],reg[5];
-cx reg[5],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(4.746693e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[5],reg[2];
-cx reg[6],reg[5];
-y reg[6];
-h reg[5];
-h reg[0];
-y reg[0];
-h reg[6];
-y reg[5];
-y reg[0];
-h reg[0];
-cx reg[6],reg[5];
-cx reg[5],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(4.746693e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[5],reg[2];
-cx reg[6],reg[5];
-h reg[6];
-y reg[5];
-y reg[0];
-h reg[0];
-h reg[6];
-h reg[5];
-h reg[1];
-h reg[1];
-cx reg[6],reg[5];
-cx reg[5],reg[2];
-cx reg[2],reg[1];
-rz(1.945438e+00) reg[1];
-cx reg[2],reg[1];
-cx reg[5],reg[2];
-cx reg[6],reg[5];
-h reg[6];
-h reg[5];
-h reg[1];
-h reg[1];
-y reg[6];
-y reg[5];
-y reg[1];
-y reg[1];
-cx reg[6],reg[5];
-cx reg[5],reg[2];
-cx reg[2],reg[1];
-rz(1.945438e+00) reg[1];
-cx reg[2],reg[1];
-cx reg[5],reg[2];
-cx reg[6],reg[5];
-y reg[6];
-y reg[5];
-y reg[1];
-y reg[1];
-h reg[6];
-y reg[5];
-h reg[1];
-y reg[1];
-cx reg[6],reg[5];
-cx reg[5],reg[2];
-cx reg[2],reg[1];
-rz(1.945438e+00) reg[1];
-cx reg[2],reg[1];
-cx reg[5],reg[2];
-cx reg[6],reg[5];
-h reg[6];
-y reg[5];
-h reg[1];
-y reg[1];
-y reg[6];
-h reg[5];
-y reg[1];
-h reg[1];
-cx reg[6],reg[5];
-cx reg[5],reg[2];
-cx reg[2],reg[1];
-rz(1.945438e+00) reg[1];
-cx reg[2],reg[1];
-cx reg[5],reg[2];
-cx reg[6],reg[5];
-y reg[6];
-h reg[5];
-y reg[1];
-h reg[1];
-y reg[6];
-y reg[5];
-h reg[1];
-h reg[1];
-cx reg[6],reg[5];
-cx reg[5],reg[2];
-cx reg[2],reg[1];
-rz(1.945438e+00) reg[1];
-cx reg[2],reg[1];
-cx reg[5],reg[2];
-cx reg[6],reg[5];
-y reg[6];
-y reg[5];
-h reg[1];
-h reg[1];
-h reg[6];
-h reg[5];
-y reg[1];
-y reg[1];
-cx reg[6],reg[5];
-cx reg[5],reg[2];
-cx reg[2],reg[1];
-rz(1.945438e+00) reg[1];
-cx reg[2],reg[1];
-cx reg[5],reg[2];
-cx reg[6],reg[5];
-h reg[6];
-h reg[5];
-y reg[1];
-y reg[1];
-y reg[6];
-h reg[5];
-h reg[1];
-y reg[1];
-cx reg[6],reg[5];
-cx reg[5],reg[2];
-cx reg[2],reg[1];
-rz(1.945438e+00) reg[1];
-cx reg[2],reg[1];
-cx reg[5],reg[2];
-cx reg[6],reg[5];
-y reg[6];
-h reg[5];
-h reg[1];
-y reg[1];
-h reg[6];
-y reg[5];
-y reg[1];
-h reg[1];
-cx reg[6],reg[5];
-cx reg[5],reg[2];
-cx reg[2],reg[1];
-rz(1.945438e+00) reg[1];
-cx reg[2],reg[1];
-cx reg[5],reg[2];
-cx reg[6],reg[5];
-h reg[6];
-y reg[5];
-y reg[1];
-h reg[1];
-h reg[6];
-h reg[5];
-h reg[0];
-h reg[0];
-cx reg[6],reg[5];
-cx reg[5],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(2.899853e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[5],reg[3];
-cx reg[6],reg[5];
-h reg[6];
-h reg[5];
-h reg[0];
-h reg[0];
-y reg[6];
-y reg[5];
-y reg[0];
-y reg[0];
-cx reg[6],reg[5];
-cx reg[5],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(2.899853e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[5],reg[3];
-cx reg[6],reg[5];
-y reg[6];
-y reg[5];
-y reg[0];
-y reg[0];
-h reg[6];
-y reg[5];
-h reg[0];
-y reg[0];
-cx reg[6],reg[5];
-cx reg[5],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(2.899853e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[5],reg[3];
-cx reg[6],reg[5];
-h reg[6];
-y reg[5];
-h reg[0];
-y reg[0];
-y reg[6];
-h reg[5];
-y reg[0];
-h reg[0];
-cx reg[6],reg[5];
-cx reg[5],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(2.899853e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[5],reg[3];
-cx reg[6],reg[5];
-y reg[6];
-h reg[5];
-y reg[0];
-h reg[0];
-y reg[6];
-y reg[5];
-h reg[0];
-h reg[0];
-cx reg[6],reg[5];
-cx reg[5],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(2.899853e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[5],reg[3];
-cx reg[6],reg[5];
-y reg[6];
-y reg[5];
-h reg[0];
-h reg[0];
-h reg[6];
-h reg[5];
-y reg[0];
-y reg[0];
-cx reg[6],reg[5];
-cx reg[5],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(2.899853e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[5],reg[3];
-cx reg[6],reg[5];
-h reg[6];
-h reg[5];
-y reg[0];
-y reg[0];
-y reg[6];
-h reg[5];
-h reg[0];
-y reg[0];
-cx reg[6],reg[5];
-cx reg[5],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(2.899853e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[5],reg[3];
-cx reg[6],reg[5];
-y reg[6];
-h reg[5];
-h reg[0];
-y reg[0];
-h reg[6];
-y reg[5];
-y reg[0];
-h reg[0];
-cx reg[6],reg[5];
-cx reg[5],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(2.899853e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[5],reg[3];
-cx reg[6],reg[5];
-h reg[6];
-y reg[5];
-y reg[0];
-h reg[0];
-h reg[6];
-h reg[5];
-h reg[1];
-h reg[1];
-cx reg[6],reg[5];
-cx reg[5],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-rz(1.523242e+00) reg[1];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[5],reg[3];
-cx reg[6],reg[5];
-h reg[6];
-h reg[5];
-h reg[1];
-h reg[1];
-y reg[6];
-y reg[5];
-y reg[1];
-y reg[1];
-cx reg[6],reg[5];
-cx reg[5],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-rz(1.523242e+00) reg[1];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[5],reg[3];
-cx reg[6],reg[5];
-y reg[6];
-y reg[5];
-y reg[1];
-y reg[1];
-h reg[6];
-y reg[5];
-h reg[1];
-y reg[1];
-cx reg[6],reg[5];
-cx reg[5],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-rz(1.523242e+00) reg[1];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[5],reg[3];
-cx reg[6],reg[5];
-h reg[6];
-y reg[5];
-h reg[1];
-y reg[1];
-y reg[6];
-h reg[5];
-y reg[1];
-h reg[1];
-cx reg[6],reg[5];
-cx reg[5],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-rz(1.523242e+00) reg[1];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[5],reg[3];
-cx reg[6],reg[5];
-y reg[6];
-h reg[5];
-y reg[1];
-h reg[1];
-y reg[6];
-y reg[5];
-h reg[1];
-h reg[1];
-cx reg[6],reg[5];
-cx reg[5],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-rz(1.523242e+00) reg[1];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[5],reg[3];
-cx reg[6],reg[5];
-y reg[6];
-y reg[5];
-h reg[1];
-h reg[1];
-h reg[6];
-h reg[5];
-y reg[1];
-y reg[1];
-cx reg[6],reg[5];
-cx reg[5],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-rz(1.523242e+00) reg[1];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[5],reg[3];
-cx reg[6],reg[5];
-h reg[6];
-h reg[5];
-y reg[1];
-y reg[1];
-y reg[6];
-h reg[5];
-h reg[1];
-y reg[1];
-cx reg[6],reg[5];
-cx reg[5],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-rz(1.523242e+00) reg[1];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[5],reg[3];
-cx reg[6],reg[5];
-y reg[6];
-h reg[5];
-h reg[1];
-y reg[1];
-h reg[6];
-y reg[5];
-y reg[1];
-h reg[1];
-cx reg[6],reg[5];
-cx reg[5],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-rz(1.523242e+00) reg[1];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[5],reg[3];
-cx reg[6],reg[5];
-h reg[6];
-y reg[5];
-y reg[1];
-h reg[1];
-h reg[6];
-h reg[5];
-h reg[2];
-h reg[2];
-cx reg[6],reg[5];
-cx reg[5],reg[3];
-cx reg[3],reg[2];
-rz(9.439592e-01) reg[2];
-cx reg[3],reg[2];
-cx reg[5],reg[3];
-cx reg[6],reg[5];
-h reg[6];
-h reg[5];
-h reg[2];
-h reg[2];
-y reg[6];
-y reg[5];
-y reg[2];
-y reg[2];
-cx reg[6],reg[5];
-cx reg[5],reg[3];
-cx reg[3],reg[2];
-rz(9.439592e-01) reg[2];
-cx reg[3],reg[2];
-cx reg[5],reg[3];
-cx reg[6],reg[5];
-y reg[6];
-y reg[5];
-y reg[2];
-y reg[2];
-h reg[6];
-y reg[5];
-h reg[2];
-y reg[2];
-cx reg[6],reg[5];
-cx reg[5],reg[3];
-cx reg[3],reg[2];
-rz(9.439592e-01) reg[2];
-cx reg[3],reg[2];
-cx reg[5],reg[3];
-cx reg[6],reg[5];
-h reg[6];
-y reg[5];
-h reg[2];
-y reg[2];
-y reg[6];
-h reg[5];
-y reg[2];
-h reg[2];
-cx reg[6],reg[5];
-cx reg[5],reg[3];
-cx reg[3],reg[2];
-rz(9.439592e-01) reg[2];
-cx reg[3],reg[2];
-cx reg[5],reg[3];
-cx reg[6],reg[5];
-y reg[6];
-h reg[5];
-y reg[2];
-h reg[2];
-y reg[6];
-y reg[5];
-h reg[2];
-h reg[2];
-cx reg[6],reg[5];
-cx reg[5],reg[3];
-cx reg[3],reg[2];
-rz(9.439592e-01) reg[2];
-cx reg[3],reg[2];
-cx reg[5],reg[3];
-cx reg[6],reg[5];
-y reg[6];
-y reg[5];
-h reg[2];
-h reg[2];
-h reg[6];
-h reg[5];
-y reg[2];
-y reg[2];
-cx reg[6],reg[5];
-cx reg[5],reg[3];
-cx reg[3],reg[2];
-rz(9.439592e-01) reg[2];
-cx reg[3],reg[2];
-cx reg[5],reg[3];
-cx reg[6],reg[5];
-h reg[6];
-h reg[5];
-y reg[2];
-y reg[2];
-y reg[6];
-h reg[5];
-h reg[2];
-y reg[2];
-cx reg[6],reg[5];
-cx reg[5],reg[3];
-cx reg[3],reg[2];
-rz(9.439592e-01) reg[2];
-cx reg[3],reg[2];
-cx reg[5],reg[3];
-cx reg[6],reg[5];
-y reg[6];
-h reg[5];
-h reg[2];
-y reg[2];
-h reg[6];
-y reg[5];
-y reg[2];
-h reg[2];
-cx reg[6],reg[5];
-cx reg[5],reg[3];
-cx reg[3],reg[2];
-rz(9.439592e-01) reg[2];
-cx reg[3],reg[2];
-cx reg[5],reg[3];
-cx reg[6],reg[5];
-h reg[6];
-y reg[5];
-y reg[2];
-h reg[2];
-h reg[6];
-h reg[5];
-h reg[0];
-h reg[0];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(3.380417e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-h reg[6];
-h reg[5];
-h reg[0];
-h reg[0];
-y reg[6];
-y reg[5];
-y reg[0];
-y reg[0];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(3.380417e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-y reg[6];
-y reg[5];
-y reg[0];
-y reg[0];
-h reg[6];
-y reg[5];
-h reg[0];
-y reg[0];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(3.380417e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-h reg[6];
-y reg[5];
-h reg[0];
-y reg[0];
-y reg[6];
-h reg[5];
-y reg[0];
-h reg[0];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(3.380417e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-y reg[6];
-h reg[5];
-y reg[0];
-h reg[0];
-y reg[6];
-y reg[5];
-h reg[0];
-h reg[0];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(3.380417e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-y reg[6];
-y reg[5];
-h reg[0];
-h reg[0];
-h reg[6];
-h reg[5];
-y reg[0];
-y reg[0];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(3.380417e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-h reg[6];
-h reg[5];
-y reg[0];
-y reg[0];
-y reg[6];
-h reg[5];
-h reg[0];
-y reg[0];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(3.380417e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-y reg[6];
-h reg[5];
-h reg[0];
-y reg[0];
-h reg[6];
-y reg[5];
-y reg[0];
-h reg[0];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(3.380417e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-h reg[6];
-y reg[5];
-y reg[0];
-h reg[0];
-h reg[6];
-h reg[5];
-h reg[1];
-h reg[1];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-rz(4.625813e+00) reg[1];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-h reg[6];
-h reg[5];
-h reg[1];
-h reg[1];
-y reg[6];
-y reg[5];
-y reg[1];
-y reg[1];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-rz(4.625813e+00) reg[1];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-y reg[6];
-y reg[5];
-y reg[1];
-y reg[1];
-h reg[6];
-y reg[5];
-h reg[1];
-y reg[1];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-rz(4.625813e+00) reg[1];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-h reg[6];
-y reg[5];
-h reg[1];
-y reg[1];
-y reg[6];
-h reg[5];
-y reg[1];
-h reg[1];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-rz(4.625813e+00) reg[1];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-y reg[6];
-h reg[5];
-y reg[1];
-h reg[1];
-y reg[6];
-y reg[5];
-h reg[1];
-h reg[1];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-rz(4.625813e+00) reg[1];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-y reg[6];
-y reg[5];
-h reg[1];
-h reg[1];
-h reg[6];
-h reg[5];
-y reg[1];
-y reg[1];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-rz(4.625813e+00) reg[1];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-h reg[6];
-h reg[5];
-y reg[1];
-y reg[1];
-y reg[6];
-h reg[5];
-h reg[1];
-y reg[1];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-rz(4.625813e+00) reg[1];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-y reg[6];
-h reg[5];
-h reg[1];
-y reg[1];
-h reg[6];
-y reg[5];
-y reg[1];
-h reg[1];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-rz(4.625813e+00) reg[1];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-h reg[6];
-y reg[5];
-y reg[1];
-h reg[1];
-h reg[6];
-h reg[5];
-h reg[2];
-h reg[2];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-rz(1.281574e+00) reg[2];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-h reg[6];
-h reg[5];
-h reg[2];
-h reg[2];
-y reg[6];
-y reg[5];
-y reg[2];
-y reg[2];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-rz(1.281574e+00) reg[2];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-y reg[6];
-y reg[5];
-y reg[2];
-y reg[2];
-h reg[6];
-y reg[5];
-h reg[2];
-y reg[2];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-rz(1.281574e+00) reg[2];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-h reg[6];
-y reg[5];
-h reg[2];
-y reg[2];
-y reg[6];
-h reg[5];
-y reg[2];
-h reg[2];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-rz(1.281574e+00) reg[2];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-y reg[6];
-h reg[5];
-y reg[2];
-h reg[2];
-y reg[6];
-y reg[5];
-h reg[2];
-h reg[2];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-rz(1.281574e+00) reg[2];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-y reg[6];
-y reg[5];
-h reg[2];
-h reg[2];
-h reg[6];
-h reg[5];
-y reg[2];
-y reg[2];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-rz(1.281574e+00) reg[2];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-h reg[6];
-h reg[5];
-y reg[2];
-y reg[2];
-y reg[6];
-h reg[5];
-h reg[2];
-y reg[2];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-rz(1.281574e+00) reg[2];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-y reg[6];
-h reg[5];
-h reg[2];
-y reg[2];
-h reg[6];
-y reg[5];
-y reg[2];
-h reg[2];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-rz(1.281574e+00) reg[2];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-h reg[6];
-y reg[5];
-y reg[2];
-h reg[2];
-h reg[6];
-h reg[5];
-h reg[3];
-h reg[3];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-rz(3.229880e+00) reg[3];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-h reg[6];
-h reg[5];
-h reg[3];
-h reg[3];
-y reg[6];
-y reg[5];
-y reg[3];
-y reg[3];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-rz(3.229880e+00) reg[3];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-y reg[6];
-y reg[5];
-y reg[3];
-y reg[3];
-h reg[6];
-y reg[5];
-h reg[3];
-y reg[3];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-rz(3.229880e+00) reg[3];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-h reg[6];
-y reg[5];
-h reg[3];
-y reg[3];
-y reg[6];
-h reg[5];
-y reg[3];
-h reg[3];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-rz(3.229880e+00) reg[3];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-y reg[6];
-h reg[5];
-y reg[3];
-h reg[3];
-y reg[6];
-y reg[5];
-h reg[3];
-h reg[3];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-rz(3.229880e+00) reg[3];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-y reg[6];
-y reg[5];
-h reg[3];
-h reg[3];
-h reg[6];
-h reg[5];
-y reg[3];
-y reg[3];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-rz(3.229880e+00) reg[3];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-h reg[6];
-h reg[5];
-y reg[3];
-y reg[3];
-y reg[6];
-h reg[5];
-h reg[3];
-y reg[3];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-rz(3.229880e+00) reg[3];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-y reg[6];
-h reg[5];
-h reg[3];
-y reg[3];
-h reg[6];
-y reg[5];
-y reg[3];
-h reg[3];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-rz(3.229880e+00) reg[3];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-h reg[6];
-y reg[5];
-y reg[3];
-h reg[3];
-h reg[7];
-h reg[2];
-h reg[0];
-h reg[0];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(6.152348e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-h reg[7];
-h reg[2];
-h reg[0];
-h reg[0];
-y reg[7];
-y reg[2];
-y reg[0];
-y reg[0];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(6.152348e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-y reg[7];
-y reg[2];
-y reg[0];
-y reg[0];
-h reg[7];
-y reg[2];
-h reg[0];
-y reg[0];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(6.152348e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-h reg[7];
-y reg[2];
-h reg[0];
-y reg[0];
-y reg[7];
-h reg[2];
-y reg[0];
-h reg[0];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(6.152348e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-y reg[7];
-h reg[2];
-y reg[0];
-h reg[0];
-y reg[7];
-y reg[2];
-h reg[0];
-h reg[0];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(6.152348e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-y reg[7];
-y reg[2];
-h reg[0];
-h reg[0];
-h reg[7];
-h reg[2];
-y reg[0];
-y reg[0];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(6.152348e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-h reg[7];
-h reg[2];
-y reg[0];
-y reg[0];
-y reg[7];
-h reg[2];
-h reg[0];
-y reg[0];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(6.152348e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-y reg[7];
-h reg[2];
-h reg[0];
-y reg[0];
-h reg[7];
-y reg[2];
-y reg[0];
-h reg[0];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(6.152348e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-h reg[7];
-y reg[2];
-y reg[0];
-h reg[0];
-h reg[7];
-h reg[3];
-h reg[0];
-h reg[0];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[1];
-cx reg[1],reg[0];
-rz(5.685957e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[3],reg[1];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-h reg[7];
-h reg[3];
-h reg[0];
-h reg[0];
-y reg[7];
-y reg[3];
-y reg[0];
-y reg[0];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[1];
-cx reg[1],reg[0];
-rz(5.685957e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[3],reg[1];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-y reg[7];
-y reg[3];
-y reg[0];
-y reg[0];
-h reg[7];
-y reg[3];
-h reg[0];
-y reg[0];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[1];
-cx reg[1],reg[0];
-rz(5.685957e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[3],reg[1];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-h reg[7];
-y reg[3];
-h reg[0];
-y reg[0];
-y reg[7];
-h reg[3];
-y reg[0];
-h reg[0];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[1];
-cx reg[1],reg[0];
-rz(5.685957e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[3],reg[1];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-y reg[7];
-h reg[3];
-y reg[0];
-h reg[0];
-y reg[7];
-y reg[3];
-h reg[0];
-h reg[0];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[1];
-cx reg[1],reg[0];
-rz(5.685957e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[3],reg[1];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-y reg[7];
-y reg[3];
-h reg[0];
-h reg[0];
-h reg[7];
-h reg[3];
-y reg[0];
-y reg[0];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[1];
-cx reg[1],reg[0];
-rz(5.685957e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[3],reg[1];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-h reg[7];
-h reg[3];
-y reg[0];
-y reg[0];
-y reg[7];
-h reg[3];
-h reg[0];
-y reg[0];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[1];
-cx reg[1],reg[0];
-rz(5.685957e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[3],reg[1];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-y reg[7];
-h reg[3];
-h reg[0];
-y reg[0];
-h reg[7];
-y reg[3];
-y reg[0];
-h reg[0];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[1];
-cx reg[1],reg[0];
-rz(5.685957e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[3],reg[1];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-h reg[7];
-y reg[3];
-y reg[0];
-h reg[0];
-h reg[7];
-h reg[3];
-h reg[0];
-h reg[0];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(2.287362e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-h reg[7];
-h reg[3];
-h reg[0];
-h reg[0];
-y reg[7];
-y reg[3];
-y reg[0];
-y reg[0];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(2.287362e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-y reg[7];
-y reg[3];
-y reg[0];
-y reg[0];
-h reg[7];
-y reg[3];
-h reg[0];
-y reg[0];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(2.287362e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-h reg[7];
-y reg[3];
-h reg[0];
-y reg[0];
-y reg[7];
-h reg[3];
-y reg[0];
-h reg[0];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(2.287362e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-y reg[7];
-h reg[3];
-y reg[0];
-h reg[0];
-y reg[7];
-y reg[3];
-h reg[0];
-h reg[0];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(2.287362e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-y reg[7];
-y reg[3];
-h reg[0];
-h reg[0];
-h reg[7];
-h reg[3];
-y reg[0];
-y reg[0];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(2.287362e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-h reg[7];
-h reg[3];
-y reg[0];
-y reg[0];
-y reg[7];
-h reg[3];
-h reg[0];
-y reg[0];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(2.287362e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-y reg[7];
-h reg[3];
-h reg[0];
-y reg[0];
-h reg[7];
-y reg[3];
-y reg[0];
-h reg[0];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(2.287362e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-h reg[7];
-y reg[3];
-y reg[0];
-h reg[0];
-h reg[7];
-h reg[3];
-h reg[1];
-h reg[1];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-rz(5.950509e+00) reg[1];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-h reg[7];
-h reg[3];
-h reg[1];
-h reg[1];
-y reg[7];
-y reg[3];
-y reg[1];
-y reg[1];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-rz(5.950509e+00) reg[1];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-y reg[7];
-y reg[3];
-y reg[1];
-y reg[1];
-h reg[7];
-y reg[3];
-h reg[1];
-y reg[1];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-rz(5.950509e+00) reg[1];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-h reg[7];
-y reg[3];
-h reg[1];
-y reg[1];
-y reg[7];
-h reg[3];
-y reg[1];
-h reg[1];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-rz(5.950509e+00) reg[1];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-y reg[7];
-h reg[3];
-y reg[1];
-h reg[1];
-y reg[7];
-y reg[3];
-h reg[1];
-h reg[1];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-rz(5.950509e+00) reg[1];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-y reg[7];
-y reg[3];
-h reg[1];
-h reg[1];
-h reg[7];
-h reg[3];
-y reg[1];
-y reg[1];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-rz(5.950509e+00) reg[1];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-h reg[7];
-h reg[3];
-y reg[1];
-y reg[1];
-y reg[7];
-h reg[3];
-h reg[1];
-y reg[1];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-rz(5.950509e+00) reg[1];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-y reg[7];
-h reg[3];
-h reg[1];
-y reg[1];
-h reg[7];
-y reg[3];
-y reg[1];
-h reg[1];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-rz(5.950509e+00) reg[1];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-h reg[7];
-y reg[3];
-y reg[1];
-h reg[1];
-h reg[7];
-h reg[4];
-h reg[0];
-h reg[0];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[1];
-cx reg[1],reg[0];
-rz(2.615899e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[4],reg[1];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-h reg[7];
-h reg[4];
-h reg[0];
-h reg[0];
-y reg[7];
-y reg[4];
-y reg[0];
-y reg[0];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[1];
-cx reg[1],reg[0];
-rz(2.615899e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[4],reg[1];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-y reg[7];
-y reg[4];
-y reg[0];
-y reg[0];
-h reg[7];
-y reg[4];
-h reg[0];
-y reg[0];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[1];
-cx reg[1],reg[0];
-rz(2.615899e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[4],reg[1];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-h reg[7];
-y reg[4];
-h reg[0];
-y reg[0];
-y reg[7];
-h reg[4];
-y reg[0];
-h reg[0];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[1];
-cx reg[1],reg[0];
-rz(2.615899e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[4],reg[1];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-y reg[7];
-h reg[4];
-y reg[0];
-h reg[0];
-y reg[7];
-y reg[4];
-h reg[0];
-h reg[0];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[1];
-cx reg[1],reg[0];
-rz(2.615899e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[4],reg[1];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-y reg[7];
-y reg[4];
-h reg[0];
-h reg[0];
-h reg[7];
-h reg[4];
-y reg[0];
-y reg[0];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[1];
-cx reg[1],reg[0];
-rz(2.615899e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[4],reg[1];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-h reg[7];
-h reg[4];
-y reg[0];
-y reg[0];
-y reg[7];
-h reg[4];
-h reg[0];
-y reg[0];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[1];
-cx reg[1],reg[0];
-rz(2.615899e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[4],reg[1];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-y reg[7];
-h reg[4];
-h reg[0];
-y reg[0];
-h reg[7];
-y reg[4];
-y reg[0];
-h reg[0];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[1];
-cx reg[1],reg[0];
-rz(2.615899e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[4],reg[1];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-h reg[7];
-y reg[4];
-y reg[0];
-h reg[0];
-h reg[7];
-h reg[4];
-h reg[0];
-h reg[0];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(3.300548e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[4],reg[2];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-h reg[7];
-h reg[4];
-h reg[0];
-h reg[0];
-y reg[7];
-y reg[4];
-y reg[0];
-y reg[0];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(3.300548e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[4],reg[2];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-y reg[7];
-y reg[4];
-y reg[0];
-y reg[0];
-h reg[7];
-y reg[4];
-h reg[0];
-y reg[0];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(3.300548e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[4],reg[2];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-h reg[7];
-y reg[4];
-h reg[0];
-y reg[0];
-y reg[7];
-h reg[4];
-y reg[0];
-h reg[0];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(3.300548e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[4],reg[2];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-y reg[7];
-h reg[4];
-y reg[0];
-h reg[0];
-y reg[7];
-y reg[4];
-h reg[0];
-h reg[0];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(3.300548e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[4],reg[2];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-y reg[7];
-y reg[4];
-h reg[0];
-h reg[0];
-h reg[7];
-h reg[4];
-y reg[0];
-y reg[0];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(3.300548e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[4],reg[2];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-h reg[7];
-h reg[4];
-y reg[0];
-y reg[0];
-y reg[7];
-h reg[4];
-h reg[0];
-y reg[0];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(3.300548e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[4],reg[2];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-y reg[7];
-h reg[4];
-h reg[0];
-y reg[0];
-h reg[7];
-y reg[4];
-y reg[0];
-h reg[0];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(3.300548e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[4],reg[2];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-h reg[7];
-y reg[4];
-y reg[0];
-h reg[0];
-h reg[7];
-h reg[4];
-h reg[1];
-h reg[1];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[2];
-cx reg[2],reg[1];
-rz(5.061758e+00) reg[1];
-cx reg[2],reg[1];
-cx reg[4],reg[2];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-h reg[7];
-h reg[4];
-h reg[1];
-h reg[1];
-y reg[7];
-y reg[4];
-y reg[1];
-y reg[1];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[2];
-cx reg[2],reg[1];
-rz(5.061758e+00) reg[1];
-cx reg[2],reg[1];
-cx reg[4],reg[2];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-y reg[7];
-y reg[4];
-y reg[1];
-y reg[1];
-h reg[7];
-y reg[4];
-h reg[1];
-y reg[1];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[2];
-cx reg[2],reg[1];
-rz(5.061758e+00) reg[1];
-cx reg[2],reg[1];
-cx reg[4],reg[2];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-h reg[7];
-y reg[4];
-h reg[1];
-y reg[1];
-y reg[7];
-h reg[4];
-y reg[1];
-h reg[1];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[2];
-cx reg[2],reg[1];
-rz(5.061758e+00) reg[1];
-cx reg[2],reg[1];
-cx reg[4],reg[2];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-y reg[7];
-h reg[4];
-y reg[1];
-h reg[1];
-y reg[7];
-y reg[4];
-h reg[1];
-h reg[1];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[2];
-cx reg[2],reg[1];
-rz(5.061758e+00) reg[1];
-cx reg[2],reg[1];
-cx reg[4],reg[2];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-y reg[7];
-y reg[4];
-h reg[1];
-h reg[1];
-h reg[7];
-h reg[4];
-y reg[1];
-y reg[1];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[2];
-cx reg[2],reg[1];
-rz(5.061758e+00) reg[1];
-cx reg[2],reg[1];
-cx reg[4],reg[2];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-h reg[7];
-h reg[4];
-y reg[1];
-y reg[1];
-y reg[7];
-h reg[4];
-h reg[1];
-y reg[1];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[2];
-cx reg[2],reg[1];
-rz(5.061758e+00) reg[1];
-cx reg[2],reg[1];
-cx reg[4],reg[2];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-y reg[7];
-h reg[4];
-h reg[1];
-y reg[1];
-h reg[7];
-y reg[4];
-y reg[1];
-h reg[1];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[2];
-cx reg[2],reg[1];
-rz(5.061758e+00) reg[1];
-cx reg[2],reg[1];
-cx reg[4],reg[2];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-h reg[7];
-y reg[4];
-y reg[1];
-h reg[1];
-h reg[7];
-h reg[4];
-h reg[0];
-h reg[0];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(1.297123e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-h reg[7];
-h reg[4];
-h reg[0];
-h reg[0];
-y reg[7];
-y reg[4];
-y reg[0];
-y reg[0];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(1.297123e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-y reg[7];
-y reg[4];
-y reg[0];
-y reg[0];
-h reg[7];
-y reg[4];
-h reg[0];
-y reg[0];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(1.297123e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-h reg[7];
-y reg[4];
-h reg[0];
-y reg[0];
-y reg[7];
-h reg[4];
-y reg[0];
-h reg[0];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(1.297123e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-y reg[7];
-h reg[4];
-y reg[0];
-h reg[0];
-y reg[7];
-y reg[4];
-h reg[0];
-h reg[0];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(1.297123e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-y reg[7];
-y reg[4];
-h reg[0];
-h reg[0];
-h reg[7];
-h reg[4];
-y reg[0];
-y reg[0];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(1.297123e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-h reg[7];
-h reg[4];
-y reg[0];
-y reg[0];
-y reg[7];
-h reg[4];
-h reg[0];
-y reg[0];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(1.297123e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-y reg[7];
-h reg[4];
-h reg[0];
-y reg[0];
-h reg[7];
-y reg[4];
-y reg[0];
-h reg[0];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(1.297123e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-h reg[7];
-y reg[4];
-y reg[0];
-h reg[0];
-h reg[7];
-h reg[4];
-h reg[1];
-h reg[1];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-rz(5.493650e+00) reg[1];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-h reg[7];
-h reg[4];
-h reg[1];
-h reg[1];
-y reg[7];
-y reg[4];
-y reg[1];
-y reg[1];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-rz(5.493650e+00) reg[1];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-y reg[7];
-y reg[4];
-y reg[1];
-y reg[1];
-h reg[7];
-y reg[4];
-h reg[1];
-y reg[1];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-rz(5.493650e+00) reg[1];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-h reg[7];
-y reg[4];
-h reg[1];
-y reg[1];
-y reg[7];
-h reg[4];
-y reg[1];
-h reg[1];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-rz(5.493650e+00) reg[1];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-y reg[7];
-h reg[4];
-y reg[1];
-h reg[1];
-y reg[7];
-y reg[4];
-h reg[1];
-h reg[1];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-rz(5.493650e+00) reg[1];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-y reg[7];
-y reg[4];
-h reg[1];
-h reg[1];
-h reg[7];
-h reg[4];
-y reg[1];
-y reg[1];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-rz(5.493650e+00) reg[1];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-h reg[7];
-h reg[4];
-y reg[1];
-y reg[1];
-y reg[7];
-h reg[4];
-h reg[1];
-y reg[1];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-rz(5.493650e+00) reg[1];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-y reg[7];
-h reg[4];
-h reg[1];
-y reg[1];
-h reg[7];
-y reg[4];
-y reg[1];
-h reg[1];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-rz(5.493650e+00) reg[1];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-h reg[7];
-y reg[4];
-y reg[1];
-h reg[1];
-h reg[7];
-h reg[4];
-h reg[2];
-h reg[2];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-rz(4.918651e+00) reg[2];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-h reg[7];
-h reg[4];
-h reg[2];
-h reg[2];
-y reg[7];
-y reg[4];
-y reg[2];
-y reg[2];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-rz(4.918651e+00) reg[2];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-y reg[7];
-y reg[4];
-y reg[2];
-y reg[2];
-h reg[7];
-y reg[4];
-h reg[2];
-y reg[2];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-rz(4.918651e+00) reg[2];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-h reg[7];
-y reg[4];
-h reg[2];
-y reg[2];
-y reg[7];
-h reg[4];
-y reg[2];
-h reg[2];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-rz(4.918651e+00) reg[2];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-y reg[7];
-h reg[4];
-y reg[2];
-h reg[2];
-y reg[7];
-y reg[4];
-h reg[2];
-h reg[2];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-rz(4.918651e+00) reg[2];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-y reg[7];
-y reg[4];
-h reg[2];
-h reg[2];
-h reg[7];
-h reg[4];
-y reg[2];
-y reg[2];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-rz(4.918651e+00) reg[2];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-h reg[7];
-h reg[4];
-y reg[2];
-y reg[2];
-y reg[7];
-h reg[4];
-h reg[2];
-y reg[2];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-rz(4.918651e+00) reg[2];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-y reg[7];
-h reg[4];
-h reg[2];
-y reg[2];
-h reg[7];
-y reg[4];
-y reg[2];
-h reg[2];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-rz(4.918651e+00) reg[2];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-h reg[7];
-y reg[4];
-y reg[2];
-h reg[2];
-h reg[7];
-h reg[5];
-h reg[0];
-h reg[0];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[1];
-cx reg[1],reg[0];
-rz(3.591062e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[5],reg[1];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-h reg[7];
-h reg[5];
-h reg[0];
-h reg[0];
-y reg[7];
-y reg[5];
-y reg[0];
-y reg[0];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[1];
-cx reg[1],reg[0];
-rz(3.591062e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[5],reg[1];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-y reg[7];
-y reg[5];
-y reg[0];
-y reg[0];
-h reg[7];
-y reg[5];
-h reg[0];
-y reg[0];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[1];
-cx reg[1],reg[0];
-rz(3.591062e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[5],reg[1];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-h reg[7];
-y reg[5];
-h reg[0];
-y reg[0];
-y reg[7];
-h reg[5];
-y reg[0];
-h reg[0];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[1];
-cx reg[1],reg[0];
-rz(3.591062e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[5],reg[1];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-y reg[7];
-h reg[5];
-y reg[0];
-h reg[0];
-y reg[7];
-y reg[5];
-h reg[0];
-h reg[0];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[1];
-cx reg[1],reg[0];
-rz(3.591062e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[5],reg[1];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-y reg[7];
-y reg[5];
-h reg[0];
-h reg[0];
-h reg[7];
-h reg[5];
-y reg[0];
-y reg[0];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[1];
-cx reg[1],reg[0];
-rz(3.591062e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[5],reg[1];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-h reg[7];
-h reg[5];
-y reg[0];
-y reg[0];
-y reg[7];
-h reg[5];
-h reg[0];
-y reg[0];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[1];
-cx reg[1],reg[0];
-rz(3.591062e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[5],reg[1];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-y reg[7];
-h reg[5];
-h reg[0];
-y reg[0];
-h reg[7];
-y reg[5];
-y reg[0];
-h reg[0];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[1];
-cx reg[1],reg[0];
-rz(3.591062e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[5],reg[1];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-h reg[7];
-y reg[5];
-y reg[0];
-h reg[0];
-h reg[7];
-h reg[5];
-h reg[0];
-h reg[0];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(2.456721e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[5],reg[2];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-h reg[7];
-h reg[5];
-h reg[0];
-h reg[0];
-y reg[7];
-y reg[5];
-y reg[0];
-y reg[0];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(2.456721e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[5],reg[2];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-y reg[7];
-y reg[5];
-y reg[0];
-y reg[0];
-h reg[7];
-y reg[5];
-h reg[0];
-y reg[0];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(2.456721e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[5],reg[2];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-h reg[7];
-y reg[5];
-h reg[0];
-y reg[0];
-y reg[7];
-h reg[5];
-y reg[0];
-h reg[0];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(2.456721e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[5],reg[2];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-y reg[7];
-h reg[5];
-y reg[0];
-h reg[0];
-y reg[7];
-y reg[5];
-h reg[0];
-h reg[0];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(2.456721e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[5],reg[2];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-y reg[7];
-y reg[5];
-h reg[0];
-h reg[0];
-h reg[7];
-h reg[5];
-y reg[0];
-y reg[0];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(2.456721e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[5],reg[2];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-h reg[7];
-h reg[5];
-y reg[0];
-y reg[0];
-y reg[7];
-h reg[5];
-h reg[0];
-y reg[0];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(2.456721e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[5],reg[2];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-y reg[7];
-h reg[5];
-h reg[0];
-y reg[0];
-h reg[7];
-y reg[5];
-y reg[0];
-h reg[0];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(2.456721e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[5],reg[2];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-h reg[7];
-y reg[5];
-y reg[0];
-h reg[0];
-h reg[7];
-h reg[5];
-h reg[1];
-h reg[1];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[2];
-cx reg[2],reg[1];
-rz(5.109929e+00) reg[1];
-cx reg[2],reg[1];
-cx reg[5],reg[2];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-h reg[7];
-h reg[5];
-h reg[1];
-h reg[1];
-y reg[7];
-y reg[5];
-y reg[1];
-y reg[1];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[2];
-cx reg[2],reg[1];
-rz(5.109929e+00) reg[1];
-cx reg[2],reg[1];
-cx reg[5],reg[2];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-y reg[7];
-y reg[5];
-y reg[1];
-y reg[1];
-h reg[7];
-y reg[5];
-h reg[1];
-y reg[1];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[2];
-cx reg[2],reg[1];
-rz(5.109929e+00) reg[1];
-cx reg[2],reg[1];
-cx reg[5],reg[2];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-h reg[7];
-y reg[5];
-h reg[1];
-y reg[1];
-y reg[7];
-h reg[5];
-y reg[1];
-h reg[1];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[2];
-cx reg[2],reg[1];
-rz(5.109929e+00) reg[1];
-cx reg[2],reg[1];
-cx reg[5],reg[2];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-y reg[7];
-h reg[5];
-y reg[1];
-h reg[1];
-y reg[7];
-y reg[5];
-h reg[1];
-h reg[1];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[2];
-cx reg[2],reg[1];
-rz(5.109929e+00) reg[1];
-cx reg[2],reg[1];
-cx reg[5],reg[2];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-y reg[7];
-y reg[5];
-h reg[1];
-h reg[1];
-h reg[7];
-h reg[5];
-y reg[1];
-y reg[1];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[2];
-cx reg[2],reg[1];
-rz(5.109929e+00) reg[1];
-cx reg[2],reg[1];
-cx reg[5],reg[2];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-h reg[7];
-h reg[5];
-y reg[1];
-y reg[1];
-y reg[7];
-h reg[5];
-h reg[1];
-y reg[1];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[2];
-cx reg[2],reg[1];
-rz(5.109929e+00) reg[1];
-cx reg[2],reg[1];
-cx reg[5],reg[2];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-y reg[7];
-h reg[5];
-h reg[1];
-y reg[1];
-h reg[7];
-y reg[5];
-y reg[1];
-h reg[1];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[2];
-cx reg[2],reg[1];
-rz(5.109929e+00) reg[1];
-cx reg[2],reg[1];
-cx reg[5],reg[2];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-h reg[7];
-y reg[5];
-y reg[1];
-h reg[1];
-h reg[7];
-h reg[5];
-h reg[0];
-h reg[0];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(2.490813e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[5],reg[3];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-h reg[7];
-h reg[5];
-h reg[0];
-h reg[0];
-y reg[7];
-y reg[5];
-y reg[0];
-y reg[0];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(2.490813e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[5],reg[3];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-y reg[7];
-y reg[5];
-y reg[0];
-y reg[0];
-h reg[7];
-y reg[5];
-h reg[0];
-y reg[0];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(2.490813e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[5],reg[3];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-h reg[7];
-y reg[5];
-h reg[0];
-y reg[0];
-y reg[7];
-h reg[5];
-y reg[0];
-h reg[0];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(2.490813e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[5],reg[3];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-y reg[7];
-h reg[5];
-y reg[0];
-h reg[0];
-y reg[7];
-y reg[5];
-h reg[0];
-h reg[0];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(2.490813e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[5],reg[3];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-y reg[7];
-y reg[5];
-h reg[0];
-h reg[0];
-h reg[7];
-h reg[5];
-y reg[0];
-y reg[0];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(2.490813e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[5],reg[3];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-h reg[7];
-h reg[5];
-y reg[0];
-y reg[0];
-y reg[7];
-h reg[5];
-h reg[0];
-y reg[0];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(2.490813e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[5],reg[3];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-y reg[7];
-h reg[5];
-h reg[0];
-y reg[0];
-h reg[7];
-y reg[5];
-y reg[0];
-h reg[0];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(2.490813e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[5],reg[3];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-h reg[7];
-y reg[5];
-y reg[0];
-h reg[0];
-h reg[7];
-h reg[5];
-h reg[1];
-h reg[1];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-rz(6.311660e-01) reg[1];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[5],reg[3];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-h reg[7];
-h reg[5];
-h reg[1];
-h reg[1];
-y reg[7];
-y reg[5];
-y reg[1];
-y reg[1];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-rz(6.311660e-01) reg[1];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[5],reg[3];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-y reg[7];
-y reg[5];
-y reg[1];
-y reg[1];
-h reg[7];
-y reg[5];
-h reg[1];
-y reg[1];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-rz(6.311660e-01) reg[1];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[5],reg[3];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-h reg[7];
-y reg[5];
-h reg[1];
-y reg[1];
-y reg[7];
-h reg[5];
-y reg[1];
-h reg[1];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-rz(6.311660e-01) reg[1];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[5],reg[3];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-y reg[7];
-h reg[5];
-y reg[1];
-h reg[1];
-y reg[7];
-y reg[5];
-h reg[1];
-h reg[1];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-rz(6.311660e-01) reg[1];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[5],reg[3];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-y reg[7];
-y reg[5];
-h reg[1];
-h reg[1];
-h reg[7];
-h reg[5];
-y reg[1];
-y reg[1];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-rz(6.311660e-01) reg[1];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[5],reg[3];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-h reg[7];
-h reg[5];
-y reg[1];
-y reg[1];
-y reg[7];
-h reg[5];
-h reg[1];
-y reg[1];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-rz(6.311660e-01) reg[1];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[5],reg[3];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-y reg[7];
-h reg[5];
-h reg[1];
-y reg[1];
-h reg[7];
-y reg[5];
-y reg[1];
-h reg[1];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-rz(6.311660e-01) reg[1];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[5],reg[3];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-h reg[7];
-y reg[5];
-y reg[1];
-h reg[1];
-h reg[7];
-h reg[5];
-h reg[2];
-h reg[2];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[3];
-cx reg[3],reg[2];
-rz(1.651750e+00) reg[2];
-cx reg[3],reg[2];
-cx reg[5],reg[3];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-h reg[7];
-h reg[5];
-h reg[2];
-h reg[2];
-y reg[7];
-y reg[5];
-y reg[2];
-y reg[2];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[3];
-cx reg[3],reg[2];
-rz(1.651750e+00) reg[2];
-cx reg[3],reg[2];
-cx reg[5],reg[3];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-y reg[7];
-y reg[5];
-y reg[2];
-y reg[2];
-h reg[7];
-y reg[5];
-h reg[2];
-y reg[2];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[3];
-cx reg[3],reg[2];
-rz(1.651750e+00) reg[2];
-cx reg[3],reg[2];
-cx reg[5],reg[3];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-h reg[7];
-y reg[5];
-h reg[2];
-y reg[2];
-y reg[7];
-h reg[5];
-y reg[2];
-h reg[2];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[3];
-cx reg[3],reg[2];
-rz(1.651750e+00) reg[2];
-cx reg[3],reg[2];
-cx reg[5],reg[3];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-y reg[7];
-h reg[5];
-y reg[2];
-h reg[2];
-y reg[7];
-y reg[5];
-h reg[2];
-h reg[2];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[3];
-cx reg[3],reg[2];
-rz(1.651750e+00) reg[2];
-cx reg[3],reg[2];
-cx reg[5],reg[3];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-y reg[7];
-y reg[5];
-h reg[2];
-h reg[2];
-h reg[7];
-h reg[5];
-y reg[2];
-y reg[2];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[3];
-cx reg[3],reg[2];
-rz(1.651750e+00) reg[2];
-cx reg[3],reg[2];
-cx reg[5],reg[3];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-h reg[7];
-h reg[5];
-y reg[2];
-y reg[2];
-y reg[7];
-h reg[5];
-h reg[2];
-y reg[2];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[3];
-cx reg[3],reg[2];
-rz(1.651750e+00) reg[2];
-cx reg[3],reg[2];
-cx reg[5],reg[3];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-y reg[7];
-h reg[5];
-h reg[2];
-y reg[2];
-h reg[7];
-y reg[5];
-y reg[2];
-h reg[2];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[3];
-cx reg[3],reg[2];
-rz(1.651750e+00) reg[2];
-cx reg[3],reg[2];
-cx reg[5],reg[3];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-h reg[7];
-y reg[5];
-y reg[2];
-h reg[2];
-h reg[7];
-h reg[5];
-h reg[0];
-h reg[0];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(1.233693e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-h reg[7];
-h reg[5];
-h reg[0];
-h reg[0];
-y reg[7];
-y reg[5];
-y reg[0];
-y reg[0];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(1.233693e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-y reg[7];
-y reg[5];
-y reg[0];
-y reg[0];
-h reg[7];
-y reg[5];
-h reg[0];
-y reg[0];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(1.233693e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-h reg[7];
-y reg[5];
-h reg[0];
-y reg[0];
-y reg[7];
-h reg[5];
-y reg[0];
-h reg[0];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(1.233693e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-y reg[7];
-h reg[5];
-y reg[0];
-h reg[0];
-y reg[7];
-y reg[5];
-h reg[0];
-h reg[0];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(1.233693e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-y reg[7];
-y reg[5];
-h reg[0];
-h reg[0];
-h reg[7];
-h reg[5];
-y reg[0];
-y reg[0];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(1.233693e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-h reg[7];
-h reg[5];
-y reg[0];
-y reg[0];
-y reg[7];
-h reg[5];
-h reg[0];
-y reg[0];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(1.233693e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-y reg[7];
-h reg[5];
-h reg[0];
-y reg[0];
-h reg[7];
-y reg[5];
-y reg[0];
-h reg[0];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(1.233693e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-h reg[7];
-y reg[5];
-y reg[0];
-h reg[0];
-h reg[7];
-h reg[5];
-h reg[1];
-h reg[1];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-rz(3.968710e+00) reg[1];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-h reg[7];
-h reg[5];
-h reg[1];
-h reg[1];
-y reg[7];
-y reg[5];
-y reg[1];
-y reg[1];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-rz(3.968710e+00) reg[1];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-y reg[7];
-y reg[5];
-y reg[1];
-y reg[1];
-h reg[7];
-y reg[5];
-h reg[1];
-y reg[1];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-rz(3.968710e+00) reg[1];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-h reg[7];
-y reg[5];
-h reg[1];
-y reg[1];
-y reg[7];
-h reg[5];
-y reg[1];
-h reg[1];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-rz(3.968710e+00) reg[1];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-y reg[7];
-h reg[5];
-y reg[1];
-h reg[1];
-y reg[7];
-y reg[5];
-h reg[1];
-h reg[1];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-rz(3.968710e+00) reg[1];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-y reg[7];
-y reg[5];
-h reg[1];
-h reg[1];
-h reg[7];
-h reg[5];
-y reg[1];
-y reg[1];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-rz(3.968710e+00) reg[1];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-h reg[7];
-h reg[5];
-y reg[1];
-y reg[1];
-y reg[7];
-h reg[5];
-h reg[1];
-y reg[1];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-rz(3.968710e+00) reg[1];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-y reg[7];
-h reg[5];
-h reg[1];
-y reg[1];
-h reg[7];
-y reg[5];
-y reg[1];
-h reg[1];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-rz(3.968710e+00) reg[1];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-h reg[7];
-y reg[5];
-y reg[1];
-h reg[1];
-h reg[7];
-h reg[5];
-h reg[2];
-h reg[2];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-rz(5.442531e+00) reg[2];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-h reg[7];
-h reg[5];
-h reg[2];
-h reg[2];
-y reg[7];
-y reg[5];
-y reg[2];
-y reg[2];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-rz(5.442531e+00) reg[2];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-y reg[7];
-y reg[5];
-y reg[2];
-y reg[2];
-h reg[7];
-y reg[5];
-h reg[2];
-y reg[2];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-rz(5.442531e+00) reg[2];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-h reg[7];
-y reg[5];
-h reg[2];
-y reg[2];
-y reg[7];
-h reg[5];
-y reg[2];
-h reg[2];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-rz(5.442531e+00) reg[2];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-y reg[7];
-h reg[5];
-y reg[2];
-h reg[2];
-y reg[7];
-y reg[5];
-h reg[2];
-h reg[2];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-rz(5.442531e+00) reg[2];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-y reg[7];
-y reg[5];
-h reg[2];
-h reg[2];
-h reg[7];
-h reg[5];
-y reg[2];
-y reg[2];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-rz(5.442531e+00) reg[2];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-h reg[7];
-h reg[5];
-y reg[2];
-y reg[2];
-y reg[7];
-h reg[5];
-h reg[2];
-y reg[2];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-rz(5.442531e+00) reg[2];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-y reg[7];
-h reg[5];
-h reg[2];
-y reg[2];
-h reg[7];
-y reg[5];
-y reg[2];
-h reg[2];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-rz(5.442531e+00) reg[2];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-h reg[7];
-y reg[5];
-y reg[2];
-h reg[2];
-h reg[7];
-h reg[5];
-h reg[3];
-h reg[3];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-rz(3.581851e+00) reg[3];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-h reg[7];
-h reg[5];
-h reg[3];
-h reg[3];
-y reg[7];
-y reg[5];
-y reg[3];
-y reg[3];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-rz(3.581851e+00) reg[3];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-y reg[7];
-y reg[5];
-y reg[3];
-y reg[3];
-h reg[7];
-y reg[5];
-h reg[3];
-y reg[3];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-rz(3.581851e+00) reg[3];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-h reg[7];
-y reg[5];
-h reg[3];
-y reg[3];
-y reg[7];
-h reg[5];
-y reg[3];
-h reg[3];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-rz(3.581851e+00) reg[3];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-y reg[7];
-h reg[5];
-y reg[3];
-h reg[3];
-y reg[7];
-y reg[5];
-h reg[3];
-h reg[3];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-rz(3.581851e+00) reg[3];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-y reg[7];
-y reg[5];
-h reg[3];
-h reg[3];
-h reg[7];
-h reg[5];
-y reg[3];
-y reg[3];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-rz(3.581851e+00) reg[3];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-h reg[7];
-h reg[5];
-y reg[3];
-y reg[3];
-y reg[7];
-h reg[5];
-h reg[3];
-y reg[3];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-rz(3.581851e+00) reg[3];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-y reg[7];
-h reg[5];
-h reg[3];
-y reg[3];
-h reg[7];
-y reg[5];
-y reg[3];
-h reg[3];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-rz(3.581851e+00) reg[3];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-h reg[7];
-y reg[5];
-y reg[3];
-h reg[3];
-h reg[7];
-h reg[6];
-h reg[0];
-h reg[0];
-cx reg[7],reg[6];
-cx reg[6],reg[1];
-cx reg[1],reg[0];
-rz(1.736069e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[6],reg[1];
-cx reg[7],reg[6];
-h reg[7];
-h reg[6];
-h reg[0];
-h reg[0];
-y reg[7];
-y reg[6];
-y reg[0];
-y reg[0];
-cx reg[7],reg[6];
-cx reg[6],reg[1];
-cx reg[1],reg[0];
-rz(1.736069e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[6],reg[1];
-cx reg[7],reg[6];
-y reg[7];
-y reg[6];
-y reg[0];
-y reg[0];
-h reg[7];
-y reg[6];
-h reg[0];
-y reg[0];
-cx reg[7],reg[6];
-cx reg[6],reg[1];
-cx reg[1],reg[0];
-rz(1.736069e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[6],reg[1];
-cx reg[7],reg[6];
-h reg[7];
-y reg[6];
-h reg[0];
-y reg[0];
-y reg[7];
-h reg[6];
-y reg[0];
-h reg[0];
-cx reg[7],reg[6];
-cx reg[6],reg[1];
-cx reg[1],reg[0];
-rz(1.736069e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[6],reg[1];
-cx reg[7],reg[6];
-y reg[7];
-h reg[6];
-y reg[0];
-h reg[0];
-y reg[7];
-y reg[6];
-h reg[0];
-h reg[0];
-cx reg[7],reg[6];
-cx reg[6],reg[1];
-cx reg[1],reg[0];
-rz(1.736069e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[6],reg[1];
-cx reg[7],reg[6];
-y reg[7];
-y reg[6];
-h reg[0];
-h reg[0];
-h reg[7];
-h reg[6];
-y reg[0];
-y reg[0];
-cx reg[7],reg[6];
-cx reg[6],reg[1];
-cx reg[1],reg[0];
-rz(1.736069e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[6],reg[1];
-cx reg[7],reg[6];
-h reg[7];
-h reg[6];
-y reg[0];
-y reg[0];
-y reg[7];
-h reg[6];
-h reg[0];
-y reg[0];
-cx reg[7],reg[6];
-cx reg[6],reg[1];
-cx reg[1],reg[0];
-rz(1.736069e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[6],reg[1];
-cx reg[7],reg[6];
-y reg[7];
-h reg[6];
-h reg[0];
-y reg[0];
-h reg[7];
-y reg[6];
-y reg[0];
-h reg[0];
-cx reg[7],reg[6];
-cx reg[6],reg[1];
-cx reg[1],reg[0];
-rz(1.736069e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[6],reg[1];
-cx reg[7],reg[6];
-h reg[7];
-y reg[6];
-y reg[0];
-h reg[0];
-h reg[7];
-h reg[6];
-h reg[0];
-h reg[0];
-cx reg[7],reg[6];
-cx reg[6],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(2.509321e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[6],reg[2];
-cx reg[7],reg[6];
-h reg[7];
-h reg[6];
-h reg[0];
-h reg[0];
-y reg[7];
-y reg[6];
-y reg[0];
-y reg[0];
-cx reg[7],reg[6];
-cx reg[6],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(2.509321e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[6],reg[2];
-cx reg[7],reg[6];
-y reg[7];
-y reg[6];
-y reg[0];
-y reg[0];
-h reg[7];
-y reg[6];
-h reg[0];
-y reg[0];
-cx reg[7],reg[6];
-cx reg[6],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(2.509321e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[6],reg[2];
-cx reg[7],reg[6];
-h reg[7];
-y reg[6];
-h reg[0];
-y reg[0];
-y reg[7];
-h reg[6];
-y reg[0];
-h reg[0];
-cx reg[7],reg[6];
-cx reg[6],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(2.509321e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[6],reg[2];
-cx reg[7],reg[6];
-y reg[7];
-h reg[6];
-y reg[0];
-h reg[0];
-y reg[7];
-y reg[6];
-h reg[0];
-h reg[0];
-cx reg[7],reg[6];
-cx reg[6],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(2.509321e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[6],reg[2];
-cx reg[7],reg[6];
-y reg[7];
-y reg[6];
-h reg[0];
-h reg[0];
-h reg[7];
-h reg[6];
-y reg[0];
-y reg[0];
-cx reg[7],reg[6];
-cx reg[6],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(2.509321e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[6],reg[2];
-cx reg[7],reg[6];
-h reg[7];
-h reg[6];
-y reg[0];
-y reg[0];
-y reg[7];
-h reg[6];
-h reg[0];
-y reg[0];
-cx reg[7],reg[6];
-cx reg[6],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(2.509321e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[6],reg[2];
-cx reg[7],reg[6];
-y reg[7];
-h reg[6];
-h reg[0];
-y reg[0];
-h reg[7];
-y reg[6];
-y reg[0];
-h reg[0];
-cx reg[7],reg[6];
-cx reg[6],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(2.509321e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[6],reg[2];
-cx reg[7],reg[6];
-h reg[7];
-y reg[6];
-y reg[0];
-h reg[0];
-h reg[7];
-h reg[6];
-h reg[1];
-h reg[1];
-cx reg[7],reg[6];
-cx reg[6],reg[2];
-cx reg[2],reg[1];
-rz(6.928150e-01) reg[1];
-cx reg[2],reg[1];
-cx reg[6],reg[2];
-cx reg[7],reg[6];
-h reg[7];
-h reg[6];
-h reg[1];
-h reg[1];
-y reg[7];
-y reg[6];
-y reg[1];
-y reg[1];
-cx reg[7],reg[6];
-cx reg[6],reg[2];
-cx reg[2],reg[1];
-rz(6.928150e-01) reg[1];
-cx reg[2],reg[1];
-cx reg[6],reg[2];
-cx reg[7],reg[6];
-y reg[7];
-y reg[6];
-y reg[1];
-y reg[1];
-h reg[7];
-y reg[6];
-h reg[1];
-y reg[1];
-cx reg[7],reg[6];
-cx reg[6],reg[2];
-cx reg[2],reg[1];
-rz(6.928150e-01) reg[1];
-cx reg[2],reg[1];
-cx reg[6],reg[2];
-cx reg[7],reg[6];
-h reg[7];
-y reg[6];
-h reg[1];
-y reg[1];
-y reg[7];
-h reg[6];
-y reg[1];
-h reg[1];
-cx reg[7],reg[6];
-cx reg[6],reg[2];
-cx reg[2],reg[1];
-rz(6.928150e-01) reg[1];
-cx reg[2],reg[1];
-cx reg[6],reg[2];
-cx reg[7],reg[6];
-y reg[7];
-h reg[6];
-y reg[1];
-h reg[1];
-y reg[7];
-y reg[6];
-h reg[1];
-h reg[1];
-cx reg[7],reg[6];
-cx reg[6],reg[2];
-cx reg[2],reg[1];
-rz(6.928150e-01) reg[1];
-cx reg[2],reg[1];
-cx reg[6],reg[2];
-cx reg[7],reg[6];
-y reg[7];
-y reg[6];
-h reg[1];
-h reg[1];
-h reg[7];
-h reg[6];
-y reg[1];
-y reg[1];
-cx reg[7],reg[6];
-cx reg[6],reg[2];
-cx reg[2],reg[1];
-rz(6.928150e-01) reg[1];
-cx reg[2],reg[1];
-cx reg[6],reg[2];
-cx reg[7],reg[6];
-h reg[7];
-h reg[6];
-y reg[1];
-y reg[1];
-y reg[7];
-h reg[6];
-h reg[1];
-y reg[1];
-cx reg[7],reg[6];
-cx reg[6],reg[2];
-cx reg[2],reg[1];
-rz(6.928150e-01) reg[1];
-cx reg[2],reg[1];
-cx reg[6],reg[2];
-cx reg[7],reg[6];
-y reg[7];
-h reg[6];
-h reg[1];
-y reg[1];
-h reg[7];
-y reg[6];
-y reg[1];
-h reg[1];
-cx reg[7],reg[6];
-cx reg[6],reg[2];
-cx reg[2],reg[1];
-rz(6.928150e-01) reg[1];
-cx reg[2],reg[1];
-cx reg[6],reg[2];
-cx reg[7],reg[6];
-h reg[7];
-y reg[6];
-y reg[1];
-h reg[1];
-h reg[7];
-h reg[6];
-h reg[0];
-h reg[0];
-cx reg[7],reg[6];
-cx reg[6],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(2.448221e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[6],reg[3];
-cx reg[7],reg[6];
-h reg[7];
-h reg[6];
-h reg[0];
-h reg[0];
-y reg[7];
-y reg[6];
-y reg[0];
-y reg[0];
-cx reg[7],reg[6];
-cx reg[6],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(2.448221e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[6],reg[3];
-cx reg[7],reg[6];
-y reg[7];
-y reg[6];
-y reg[0];
-y reg[0];
-h reg[7];
-y reg[6];
-h reg[0];
-y reg[0];
-cx reg[7],reg[6];
-cx reg[6],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(2.448221e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[6],reg[3];
-cx reg[7],reg[6];
-h reg[7];
-y reg[6];
-h reg[0];
-y reg[0];
-y reg[7];
-h reg[6];
-y reg[0];
-h reg[0];
-cx reg[7],reg[6];
-cx reg[6],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(2.448221e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[6],reg[3];
-cx reg[7],reg[6];
-y reg[7];
-h reg[6];
-y reg[0];
-h reg[0];
-y reg[7];
-y reg[6];
-h reg[0];
-h reg[0];
-cx reg[7],reg[6];
-cx reg[6],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(2.448221e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[6],reg[3];
-cx reg[7],reg[6];
-y reg[7];
-y reg[6];
-h reg[0];
-h reg[0];
-h reg[7];
-h reg[6];
-y reg[0];
-y reg[0];
-cx reg[7],reg[6];
-cx reg[6],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(2.448221e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[6],reg[3];
-cx reg[7],reg[6];
-h reg[7];
-h reg[6];
-y reg[0];
-y reg[0];
-y reg[7];
-h reg[6];
-h reg[0];
-y reg[0];
-cx reg[7],reg[6];
-cx reg[6],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(2.448221e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[6],reg[3];
-cx reg[7],reg[6];
-y reg[7];
-h reg[6];
-h reg[0];
-y reg[0];
-h reg[7];
-y reg[6];
-y reg[0];
-h reg[0];
-cx reg[7],reg[6];
-cx reg[6],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(2.448221e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[6],reg[3];
-cx reg[7],reg[6];
-h reg[7];
-y reg[6];
-y reg[0];
-h reg[0];
-h reg[7];
-h reg[6];
-h reg[1];
-h reg[1];
-cx reg[7],reg[6];
-cx reg[6],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-rz(2.525158e+00) reg[1];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[6],reg[3];
-cx reg[7],reg[6];
-h reg[7];
-h reg[6];
-h reg[1];
-h reg[1];
-y reg[7];
-y reg[6];
-y reg[1];
-y reg[1];
-cx reg[7],reg[6];
-cx reg[6],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-rz(2.525158e+00) reg[1];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[6],reg[3];
-cx reg[7],reg[6];
-y reg[7];
-y reg[6];
-y reg[1];
-y reg[1];
-h reg[7];
-y reg[6];
-h reg[1];
-y reg[1];
-cx reg[7],reg[6];
-cx reg[6],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-rz(2.525158e+00) reg[1];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[6],reg[3];
-cx reg[7],reg[6];
-h reg[7];
-y reg[6];
-h reg[1];
-y reg[1];
-y reg[7];
-h reg[6];
-y reg[1];
-h reg[1];
-cx reg[7],reg[6];
-cx reg[6],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-rz(2.525158e+00) reg[1];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[6],reg[3];
-cx reg[7],reg[6];
-y reg[7];
-h reg[6];
-y reg[1];
-h reg[1];
-y reg[7];
-y reg[6];
-h reg[1];
-h reg[1];
-cx reg[7],reg[6];
-cx reg[6],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-rz(2.525158e+00) reg[1];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[6],reg[3];
-cx reg[7],reg[6];
-y reg[7];
-y reg[6];
-h reg[1];
-h reg[1];
-h reg[7];
-h reg[6];
-y reg[1];
-y reg[1];
-cx reg[7],reg[6];
-cx reg[6],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-rz(2.525158e+00) reg[1];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[6],reg[3];
-cx reg[7],reg[6];
-h reg[7];
-h reg[6];
-y reg[1];
-y reg[1];
-y reg[7];
-h reg[6];
-h reg[1];
-y reg[1];
-cx reg[7],reg[6];
-cx reg[6],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-rz(2.525158e+00) reg[1];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[6],reg[3];
-cx reg[7],reg[6];
-y reg[7];
-h reg[6];
-h reg[1];
-y reg[1];
-h reg[7];
-y reg[6];
-y reg[1];
-h reg[1];
-cx reg[7],reg[6];
-cx reg[6],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-rz(2.525158e+00) reg[1];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[6],reg[3];
-cx reg[7],reg[6];
-h reg[7];
-y reg[6];
-y reg[1];
-h reg[1];
-h reg[7];
-h reg[6];
-h reg[2];
-h reg[2];
-cx reg[7],reg[6];
-cx reg[6],reg[3];
-cx reg[3],reg[2];
-rz(1.632131e+00) reg[2];
-cx reg[3],reg[2];
-cx reg[6],reg[3];
-cx reg[7],reg[6];
-h reg[7];
-h reg[6];
-h reg[2];
-h reg[2];
-y reg[7];
-y reg[6];
-y reg[2];
-y reg[2];
-cx reg[7],reg[6];
-cx reg[6],reg[3];
-cx reg[3],reg[2];
-rz(1.632131e+00) reg[2];
-cx reg[3],reg[2];
-cx reg[6],reg[3];
-cx reg[7],reg[6];
-y reg[7];
-y reg[6];
-y reg[2];
-y reg[2];
-h reg[7];
-y reg[6];
-h reg[2];
-y reg[2];
-cx reg[7],reg[6];
-cx reg[6],reg[3];
-cx reg[3],reg[2];
-rz(1.632131e+00) reg[2];
-cx reg[3],reg[2];
-cx reg[6],reg[3];
-cx reg[7],reg[6];
-h reg[7];
-y reg[6];
-h reg[2];
-y reg[2];
-y reg[7];
-h reg[6];
-y reg[2];
-h reg[2];
-cx reg[7],reg[6];
-cx reg[6],reg[3];
-cx reg[3],reg[2];
-rz(1.632131e+00) reg[2];
-cx reg[3],reg[2];
-cx reg[6],reg[3];
-cx reg[7],reg[6];
-y reg[7];
-h reg[6];
-y reg[2];
-h reg[2];
-y reg[7];
-y reg[6];
-h reg[2];
-h reg[2];
-cx reg[7],reg[6];
-cx reg[6],reg[3];
-cx reg[3],reg[2];
-rz(1.632131e+00) reg[2];
-cx reg[3],reg[2];
-cx reg[6],reg[3];
-cx reg[7],reg[6];
-y reg[7];
-y reg[6];
-h reg[2];
-h reg[2];
-h reg[7];
-h reg[6];
-y reg[2];
-y reg[2];
-cx reg[7],reg[6];
-cx reg[6],reg[3];
-cx reg[3],reg[2];
-rz(1.632131e+00) reg[2];
-cx reg[3],reg[2];
-cx reg[6],reg[3];
-cx reg[7],reg[6];
-h reg[7];
-h reg[6];
-y reg[2];
-y reg[2];
-y reg[7];
-h reg[6];
-h reg[2];
-y reg[2];
-cx reg[7],reg[6];
-cx reg[6],reg[3];
-cx reg[3],reg[2];
-rz(1.632131e+00) reg[2];
-cx reg[3],reg[2];
-cx reg[6],reg[3];
-cx reg[7],reg[6];
-y reg[7];
-h reg[6];
-h reg[2];
-y reg[2];
-h reg[7];
-y reg[6];
-y reg[2];
-h reg[2];
-cx reg[7],reg[6];
-cx reg[6],reg[3];
-cx reg[3],reg[2];
-rz(1.632131e+00) reg[2];
-cx reg[3],reg[2];
-cx reg[6],reg[3];
-cx reg[7],reg[6];
-h reg[7];
-y reg[6];
-y reg[2];
-h reg[2];
-h reg[7];
-h reg[6];
-h reg[0];
-h reg[0];
-cx reg[7],reg[6];
-cx reg[6],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(2.821110e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[6],reg[4];
-cx reg[7],reg[6];
-h reg[7];
-h reg[6];
-h reg[0];
-h reg[0];
-y reg[7];
-y reg[6];
-y reg[0];
-y reg[0];
-cx reg[7],reg[6];
-cx reg[6],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(2.821110e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[6],reg[4];
-cx reg[7],reg[6];
-y reg[7];
-y reg[6];
-y reg[0];
-y reg[0];
-h reg[7];
-y reg[6];
-h reg[0];
-y reg[0];
-cx reg[7],reg[6];
-cx reg[6],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(2.821110e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[6],reg[4];
-cx reg[7],reg[6];
-h reg[7];
-y reg[6];
-h reg[0];
-y reg[0];
-y reg[7];
-h reg[6];
-y reg[0];
-h reg[0];
-cx reg[7],reg[6];
-cx reg[6],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(2.821110e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[6],reg[4];
-cx reg[7],reg[6];
-y reg[7];
-h reg[6];
-y reg[0];
-h reg[0];
-y reg[7];
-y reg[6];
-h reg[0];
-h reg[0];
-cx reg[7],reg[6];
-cx reg[6],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(2.821110e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[6],reg[4];
-cx reg[7],reg[6];
-y reg[7];
-y reg[6];
-h reg[0];
-h reg[0];
-h reg[7];
-h reg[6];
-y reg[0];
-y reg[0];
-cx reg[7],reg[6];
-cx reg[6],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(2.821110e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[6],reg[4];
-cx reg[7],reg[6];
-h reg[7];
-h reg[6];
-y reg[0];
-y reg[0];
-y reg[7];
-h reg[6];
-h reg[0];
-y reg[0];
-cx reg[7],reg[6];
-cx reg[6],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(2.821110e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[6],reg[4];
-cx reg[7],reg[6];
-y reg[7];
-h reg[6];
-h reg[0];
-y reg[0];
-h reg[7];
-y reg[6];
-y reg[0];
-h reg[0];
-cx reg[7],reg[6];
-cx reg[6],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(2.821110e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[6],reg[4];
-cx reg[7],reg[6];
-h reg[7];
-y reg[6];
-y reg[0];
-h reg[0];
-h reg[7];
-h reg[6];
-h reg[1];
-h reg[1];
-cx reg[7],reg[6];
-cx reg[6],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-rz(3.619499e+00) reg[1];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[6],reg[4];
-cx reg[7],reg[6];
-h reg[7];
-h reg[6];
-h reg[1];
-h reg[1];
-y reg[7];
-y reg[6];
-y reg[1];
-y reg[1];
-cx reg[7],reg[6];
-cx reg[6],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-rz(3.619499e+00) reg[1];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[6],reg[4];
-cx reg[7],reg[6];
-y reg[7];
-y reg[6];
-y reg[1];
-y reg[1];
-h reg[7];
-y reg[6];
-h reg[1];
-y reg[1];
-cx reg[7],reg[6];
-cx reg[6],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-rz(3.619499e+00) reg[1];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[6],reg[4];
-cx reg[7],reg[6];
-h reg[7];
-y reg[6];
-h reg[1];
-y reg[1];
-y reg[7];
-h reg[6];
-y reg[1];
-h reg[1];
-cx reg[7],reg[6];
-cx reg[6],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-rz(3.619499e+00) reg[1];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[6],reg[4];
-cx reg[7],reg[6];
-y reg[7];
-h reg[6];
-y reg[1];
-h reg[1];
-y reg[7];
-y reg[6];
-h reg[1];
-h reg[1];
-cx reg[7],reg[6];
-cx reg[6],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-rz(3.619499e+00) reg[1];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[6],reg[4];
-cx reg[7],reg[6];
-y reg[7];
-y reg[6];
-h reg[1];
-h reg[1];
-h reg[7];
-h reg[6];
-y reg[1];
-y reg[1];
-cx reg[7],reg[6];
-cx reg[6],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-rz(3.619499e+00) reg[1];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[6],reg[4];
-cx reg[7],reg[6];
-h reg[7];
-h reg[6];
-y reg[1];
-y reg[1];
-y reg[7];
-h reg[6];
-h reg[1];
-y reg[1];
-cx reg[7],reg[6];
-cx reg[6],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-rz(3.619499e+00) reg[1];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[6],reg[4];
-cx reg[7],reg[6];
-y reg[7];
-h reg[6];
-h reg[1];
-y reg[1];
-h reg[7];
-y reg[6];
-y reg[1];
-h reg[1];
-cx reg[7],reg[6];
-cx reg[6],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-rz(3.619499e+00) reg[1];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[6],reg[4];
-cx reg[7],reg[6];
-h reg[7];
-y reg[6];
-y reg[1];
-h reg[1];
-h reg[7];
-h reg[6];
-h reg[2];
-h reg[2];
-cx reg[7],reg[6];
-cx reg[6],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-rz(1.732299e+00) reg[2];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[6],reg[4];
-cx reg[7],reg[6];
-h reg[7];
-h reg[6];
-h reg[2];
-h reg[2];
-y reg[7];
-y reg[6];
-y reg[2];
-y reg[2];
-cx reg[7],reg[6];
-cx reg[6],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-rz(1.732299e+00) reg[2];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[6],reg[4];
-cx reg[7],reg[6];
-y reg[7];
-y reg[6];
-y reg[2];
-y reg[2];
-h reg[7];
-y reg[6];
-h reg[2];
-y reg[2];
-cx reg[7],reg[6];
-cx reg[6],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-rz(1.732299e+00) reg[2];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[6],reg[4];
-cx reg[7],reg[6];
-h reg[7];
-y reg[6];
-h reg[2];
-y reg[2];
-y reg[7];
-h reg[6];
-y reg[2];
-h reg[2];
-cx reg[7],reg[6];
-cx reg[6],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-rz(1.732299e+00) reg[2];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[6],reg[4];
-cx reg[7],reg[6];
-y reg[7];
-h reg[6];
-y reg[2];
-h reg[2];
-y reg[7];
-y reg[6];
-h reg[2];
-h reg[2];
-cx reg[7],reg[6];
-cx reg[6],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-rz(1.732299e+00) reg[2];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[6],reg[4];
-cx reg[7],reg[6];
-y reg[7];
-y reg[6];
-h reg[2];
-h reg[2];
-h reg[7];
-h reg[6];
-y reg[2];
-y reg[2];
-cx reg[7],reg[6];
-cx reg[6],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-rz(1.732299e+00) reg[2];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[6],reg[4];
-cx reg[7],reg[6];
-h reg[7];
-h reg[6];
-y reg[2];
-y reg[2];
-y reg[7];
-h reg[6];
-h reg[2];
-y reg[2];
-cx reg[7],reg[6];
-cx reg[6],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-rz(1.732299e+00) reg[2];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[6],reg[4];
-cx reg[7],reg[6];
-y reg[7];
-h reg[6];
-h reg[2];
-y reg[2];
-h reg[7];
-y reg[6];
-y reg[2];
-h reg[2];
-cx reg[7],reg[6];
-cx reg[6],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-rz(1.732299e+00) reg[2];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[6],reg[4];
-cx reg[7],reg[6];
-h reg[7];
-y reg[6];
-y reg[2];
-h reg[2];
-h reg[7];
-h reg[6];
-h reg[3];
-h reg[3];
-cx reg[7],reg[6];
-cx reg[6],reg[4];
-cx reg[4],reg[3];
-rz(3.668855e-01) reg[3];
-cx reg[4],reg[3];
-cx reg[6],reg[4];
-cx reg[7],reg[6];
-h reg[7];
-h reg[6];
-h reg[3];
-h reg[3];
-y reg[7];
-y reg[6];
-y reg[3];
-y reg[3];
-cx reg[7],reg[6];
-cx reg[6],reg[4];
-cx reg[4],reg[3];
-rz(3.668855e-01) reg[3];
-cx reg[4],reg[3];
-cx reg[6],reg[4];
-cx reg[7],reg[6];
-y reg[7];
-y reg[6];
-y reg[3];
-y reg[3];
-h reg[7];
-y reg[6];
-h reg[3];
-y reg[3];
-cx reg[7],reg[6];
-cx reg[6],reg[4];
-cx reg[4],reg[3];
-rz(3.668855e-01) reg[3];
-cx reg[4],reg[3];
-cx reg[6],reg[4];
-cx reg[7],reg[6];
-h reg[7];
-y reg[6];
-h reg[3];
-y reg[3];
-y reg[7];
-h reg[6];
-y reg[3];
-h reg[3];
-cx reg[7],reg[6];
-cx reg[6],reg[4];
-cx reg[4],reg[3];
-rz(3.668855e-01) reg[3];
-cx reg[4],reg[3];
-cx reg[6],reg[4];
-cx reg[7],reg[6];
-y reg[7];
-h reg[6];
-y reg[3];
-h reg[3];
-y reg[7];
-y reg[6];
-h reg[3];
-h reg[3];
-cx reg[7],reg[6];
-cx reg[6],reg[4];
-cx reg[4],reg[3];
-rz(3.668855e-01) reg[3];
-cx reg[4],reg[3];
-cx reg[6],reg[4];
-cx reg[7],reg[6];
-y reg[7];
-y reg[6];
-h reg[3];
-h reg[3];
-h reg[7];
-h reg[6];
-y reg[3];
-y reg[3];
-cx reg[7],reg[6];
-cx reg[6],reg[4];
-cx reg[4],reg[3];
-rz(3.668855e-01) reg[3];
-cx reg[4],reg[3];
-cx reg[6],reg[4];
-cx reg[7],reg[6];
-h reg[7];
-h reg[6];
-y reg[3];
-y reg[3];
-y reg[7];
-h reg[6];
-h reg[3];
-y reg[3];
-cx reg[7],reg[6];
-cx reg[6],reg[4];
-cx reg[4],reg[3];
-rz(3.668855e-01) reg[3];
-cx reg[4],reg[3];
-cx reg[6],reg[4];
-cx reg[7],reg[6];
-y reg[7];
-h reg[6];
-h reg[3];
-y reg[3];
-h reg[7];
-y reg[6];
-y reg[3];
-h reg[3];
-cx reg[7],reg[6];
-cx reg[6],reg[4];
-cx reg[4],reg[3];
-rz(3.668855e-01) reg[3];
-cx reg[4],reg[3];
-cx reg[6],reg[4];
-cx reg[7],reg[6];
-h reg[7];
-y reg[6];
-y reg[3];
-h reg[3];
-h reg[7];
-h reg[6];
-h reg[0];
-h reg[0];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(4.179376e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-h reg[7];
-h reg[6];
-h reg[0];
-h reg[0];
-y reg[7];
-y reg[6];
-y reg[0];
-y reg[0];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(4.179376e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-y reg[7];
-y reg[6];
-y reg[0];
-y reg[0];
-h reg[7];
-y reg[6];
-h reg[0];
-y reg[0];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(4.179376e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-h reg[7];
-y reg[6];
-h reg[0];
-y reg[0];
-y reg[7];
-h reg[6];
-y reg[0];
-h reg[0];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(4.179376e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-y reg[7];
-h reg[6];
-y reg[0];
-h reg[0];
-y reg[7];
-y reg[6];
-h reg[0];
-h reg[0];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(4.179376e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-y reg[7];
-y reg[6];
-h reg[0];
-h reg[0];
-h reg[7];
-h reg[6];
-y reg[0];
-y reg[0];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(4.179376e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-h reg[7];
-h reg[6];
-y reg[0];
-y reg[0];
-y reg[7];
-h reg[6];
-h reg[0];
-y reg[0];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(4.179376e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-y reg[7];
-h reg[6];
-h reg[0];
-y reg[0];
-h reg[7];
-y reg[6];
-y reg[0];
-h reg[0];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(4.179376e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-h reg[7];
-y reg[6];
-y reg[0];
-h reg[0];
-h reg[7];
-h reg[6];
-h reg[1];
-h reg[1];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-rz(5.087414e+00) reg[1];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-h reg[7];
-h reg[6];
-h reg[1];
-h reg[1];
-y reg[7];
-y reg[6];
-y reg[1];
-y reg[1];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-rz(5.087414e+00) reg[1];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-y reg[7];
-y reg[6];
-y reg[1];
-y reg[1];
-h reg[7];
-y reg[6];
-h reg[1];
-y reg[1];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-rz(5.087414e+00) reg[1];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-h reg[7];
-y reg[6];
-h reg[1];
-y reg[1];
-y reg[7];
-h reg[6];
-y reg[1];
-h reg[1];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-rz(5.087414e+00) reg[1];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-y reg[7];
-h reg[6];
-y reg[1];
-h reg[1];
-y reg[7];
-y reg[6];
-h reg[1];
-h reg[1];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-rz(5.087414e+00) reg[1];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-y reg[7];
-y reg[6];
-h reg[1];
-h reg[1];
-h reg[7];
-h reg[6];
-y reg[1];
-y reg[1];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-rz(5.087414e+00) reg[1];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-h reg[7];
-h reg[6];
-y reg[1];
-y reg[1];
-y reg[7];
-h reg[6];
-h reg[1];
-y reg[1];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-rz(5.087414e+00) reg[1];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-y reg[7];
-h reg[6];
-h reg[1];
-y reg[1];
-h reg[7];
-y reg[6];
-y reg[1];
-h reg[1];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-rz(5.087414e+00) reg[1];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-h reg[7];
-y reg[6];
-y reg[1];
-h reg[1];
-h reg[7];
-h reg[6];
-h reg[2];
-h reg[2];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-rz(6.281917e+00) reg[2];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-h reg[7];
-h reg[6];
-h reg[2];
-h reg[2];
-y reg[7];
-y reg[6];
-y reg[2];
-y reg[2];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-rz(6.281917e+00) reg[2];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-y reg[7];
-y reg[6];
-y reg[2];
-y reg[2];
-h reg[7];
-y reg[6];
-h reg[2];
-y reg[2];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-rz(6.281917e+00) reg[2];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-h reg[7];
-y reg[6];
-h reg[2];
-y reg[2];
-y reg[7];
-h reg[6];
-y reg[2];
-h reg[2];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-rz(6.281917e+00) reg[2];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-y reg[7];
-h reg[6];
-y reg[2];
-h reg[2];
-y reg[7];
-y reg[6];
-h reg[2];
-h reg[2];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-rz(6.281917e+00) reg[2];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-y reg[7];
-y reg[6];
-h reg[2];
-h reg[2];
-h reg[7];
-h reg[6];
-y reg[2];
-y reg[2];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-rz(6.281917e+00) reg[2];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-h reg[7];
-h reg[6];
-y reg[2];
-y reg[2];
-y reg[7];
-h reg[6];
-h reg[2];
-y reg[2];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-rz(6.281917e+00) reg[2];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-y reg[7];
-h reg[6];
-h reg[2];
-y reg[2];
-h reg[7];
-y reg[6];
-y reg[2];
-h reg[2];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-rz(6.281917e+00) reg[2];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-h reg[7];
-y reg[6];
-y reg[2];
-h reg[2];
-h reg[7];
-h reg[6];
-h reg[3];
-h reg[3];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-rz(5.860174e+00) reg[3];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-h reg[7];
-h reg[6];
-h reg[3];
-h reg[3];
-y reg[7];
-y reg[6];
-y reg[3];
-y reg[3];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-rz(5.860174e+00) reg[3];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-y reg[7];
-y reg[6];
-y reg[3];
-y reg[3];
-h reg[7];
-y reg[6];
-h reg[3];
-y reg[3];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-rz(5.860174e+00) reg[3];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-h reg[7];
-y reg[6];
-h reg[3];
-y reg[3];
-y reg[7];
-h reg[6];
-y reg[3];
-h reg[3];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-rz(5.860174e+00) reg[3];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-y reg[7];
-h reg[6];
-y reg[3];
-h reg[3];
-y reg[7];
-y reg[6];
-h reg[3];
-h reg[3];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-rz(5.860174e+00) reg[3];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-y reg[7];
-y reg[6];
-h reg[3];
-h reg[3];
-h reg[7];
-h reg[6];
-y reg[3];
-y reg[3];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-rz(5.860174e+00) reg[3];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-h reg[7];
-h reg[6];
-y reg[3];
-y reg[3];
-y reg[7];
-h reg[6];
-h reg[3];
-y reg[3];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-rz(5.860174e+00) reg[3];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-y reg[7];
-h reg[6];
-h reg[3];
-y reg[3];
-h reg[7];
-y reg[6];
-y reg[3];
-h reg[3];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-rz(5.860174e+00) reg[3];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-h reg[7];
-y reg[6];
-y reg[3];
-h reg[3];
-h reg[7];
-h reg[6];
-h reg[4];
-h reg[4];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-rz(2.255147e+00) reg[4];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-h reg[7];
-h reg[6];
-h reg[4];
-h reg[4];
-y reg[7];
-y reg[6];
-y reg[4];
-y reg[4];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-rz(2.255147e+00) reg[4];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-y reg[7];
-y reg[6];
-y reg[4];
-y reg[4];
-h reg[7];
-y reg[6];
-h reg[4];
-y reg[4];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-rz(2.255147e+00) reg[4];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-h reg[7];
-y reg[6];
-h reg[4];
-y reg[4];
-y reg[7];
-h reg[6];
-y reg[4];
-h reg[4];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-rz(2.255147e+00) reg[4];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-y reg[7];
-h reg[6];
-y reg[4];
-h reg[4];
-y reg[7];
-y reg[6];
-h reg[4];
-h reg[4];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-rz(2.255147e+00) reg[4];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-y reg[7];
-y reg[6];
-h reg[4];
-h reg[4];
-h reg[7];
-h reg[6];
-y reg[4];
-y reg[4];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-rz(2.255147e+00) reg[4];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-h reg[7];
-h reg[6];
-y reg[4];
-y reg[4];
-y reg[7];
-h reg[6];
-h reg[4];
-y reg[4];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-rz(2.255147e+00) reg[4];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-y reg[7];
-h reg[6];
-h reg[4];
-y reg[4];
-h reg[7];
-y reg[6];
-y reg[4];
-h reg[4];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-rz(2.255147e+00) reg[4];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-h reg[7];
-y reg[6];
-y reg[4];
-h reg[4];
-h reg[1];
-h reg[0];
-cx reg[1],reg[0];
-rz(1.072369e+00) reg[0];
-cx reg[1],reg[0];
-h reg[1];
-h reg[0];
-y reg[1];
-y reg[0];
-cx reg[1],reg[0];
-rz(1.072369e+00) reg[0];
-cx reg[1],reg[0];
-y reg[1];
-y reg[0];
-h reg[2];
-h reg[0];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(1.769972e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-h reg[2];
-h reg[0];
-y reg[2];
-y reg[0];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(1.769972e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-y reg[2];
-y reg[0];
-h reg[2];
-h reg[1];
-cx reg[2],reg[1];
-rz(4.363377e+00) reg[1];
-cx reg[2],reg[1];
-h reg[2];
-h reg[1];
-y reg[2];
-y reg[1];
-cx reg[2],reg[1];
-rz(4.363377e+00) reg[1];
-cx reg[2],reg[1];
-y reg[2];
-y reg[1];
-h reg[3];
-h reg[0];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(4.094162e-01) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-h reg[3];
-h reg[0];
-y reg[3];
-y reg[0];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(4.094162e-01) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-y reg[3];
-y reg[0];
-h reg[3];
-h reg[1];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-rz(3.037717e+00) reg[1];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-h reg[3];
-h reg[1];
-y reg[3];
-y reg[1];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-rz(3.037717e+00) reg[1];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-y reg[3];
-y reg[1];
-h reg[3];
-h reg[2];
-cx reg[3],reg[2];
-rz(1.949632e+00) reg[2];
-cx reg[3],reg[2];
-h reg[3];
-h reg[2];
-y reg[3];
-y reg[2];
-cx reg[3],reg[2];
-rz(1.949632e+00) reg[2];
-cx reg[3],reg[2];
-y reg[3];
-y reg[2];
-h reg[4];
-h reg[0];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(3.725793e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-h reg[4];
-h reg[0];
-y reg[4];
-y reg[0];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(3.725793e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-y reg[4];
-y reg[0];
-h reg[4];
-h reg[1];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-rz(3.286858e+00) reg[1];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-h reg[4];
-h reg[1];
-y reg[4];
-y reg[1];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-rz(3.286858e+00) reg[1];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-y reg[4];
-y reg[1];
-h reg[4];
-h reg[2];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-rz(3.531732e+00) reg[2];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-h reg[4];
-h reg[2];
-y reg[4];
-y reg[2];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-rz(3.531732e+00) reg[2];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-y reg[4];
-y reg[2];
-h reg[4];
-h reg[3];
-cx reg[4],reg[3];
-rz(2.812523e-01) reg[3];
-cx reg[4],reg[3];
-h reg[4];
-h reg[3];
-y reg[4];
-y reg[3];
-cx reg[4],reg[3];
-rz(2.812523e-01) reg[3];
-cx reg[4],reg[3];
-y reg[4];
-y reg[3];
-h reg[5];
-h reg[0];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(1.586907e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-h reg[5];
-h reg[0];
-y reg[5];
-y reg[0];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(1.586907e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-y reg[5];
-y reg[0];
-h reg[5];
-h reg[1];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-rz(1.029809e-01) reg[1];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-h reg[5];
-h reg[1];
-y reg[5];
-y reg[1];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-rz(1.029809e-01) reg[1];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-y reg[5];
-y reg[1];
-h reg[5];
-h reg[2];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-rz(3.621992e-01) reg[2];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-h reg[5];
-h reg[2];
-y reg[5];
-y reg[2];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-rz(3.621992e-01) reg[2];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-y reg[5];
-y reg[2];
-h reg[5];
-h reg[3];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-rz(1.144365e+00) reg[3];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-h reg[5];
-h reg[3];
-y reg[5];
-y reg[3];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-rz(1.144365e+00) reg[3];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-y reg[5];
-y reg[3];
-h reg[5];
-h reg[4];
-cx reg[5],reg[4];
-rz(4.962369e+00) reg[4];
-cx reg[5],reg[4];
-h reg[5];
-h reg[4];
-y reg[5];
-y reg[4];
-cx reg[5],reg[4];
-rz(4.962369e+00) reg[4];
-cx reg[5],reg[4];
-y reg[5];
-y reg[4];
-h reg[6];
-h reg[0];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(1.072176e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-h reg[6];
-h reg[0];
-y reg[6];
-y reg[0];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(1.072176e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-y reg[6];
-y reg[0];
-h reg[6];
-h reg[1];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-rz(5.936195e+00) reg[1];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-h reg[6];
-h reg[1];
-y reg[6];
-y reg[1];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-rz(5.936195e+00) reg[1];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-y reg[6];
-y reg[1];
-h reg[6];
-h reg[2];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-rz(4.511295e+00) reg[2];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-h reg[6];
-h reg[2];
-y reg[6];
-y reg[2];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-rz(4.511295e+00) reg[2];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-y reg[6];
-y reg[2];
-h reg[6];
-h reg[3];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-rz(3.864273e+00) reg[3];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-h reg[6];
-h reg[3];
-y reg[6];
-y reg[3];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-rz(3.864273e+00) reg[3];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-y reg[6];
-y reg[3];
-h reg[6];
-h reg[4];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-rz(3.494444e+00) reg[4];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-h reg[6];
-h reg[4];
-y reg[6];
-y reg[4];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-rz(3.494444e+00) reg[4];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-y reg[6];
-y reg[4];
-h reg[6];
-h reg[5];
-cx reg[6],reg[5];
-rz(5.171286e+00) reg[5];
-cx reg[6],reg[5];
-h reg[6];
-h reg[5];
-y reg[6];
-y reg[5];
-cx reg[6],reg[5];
-rz(5.171286e+00) reg[5];
-cx reg[6],reg[5];
-y reg[6];
-y reg[5];
-h reg[7];
-h reg[0];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(3.792309e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-h reg[7];
-h reg[0];
-y reg[7];
-y reg[0];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(3.792309e+00) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-y reg[7];
-y reg[0];
-h reg[7];
-h reg[1];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-rz(2.439179e+00) reg[1];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-h reg[7];
-h reg[1];
-y reg[7];
-y reg[1];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-rz(2.439179e+00) reg[1];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-y reg[7];
-y reg[1];
-h reg[7];
-h reg[2];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-rz(4.773200e+00) reg[2];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-h reg[7];
-h reg[2];
-y reg[7];
-y reg[2];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-rz(4.773200e+00) reg[2];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-y reg[7];
-y reg[2];
-h reg[7];
-h reg[3];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-rz(2.957330e+00) reg[3];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-h reg[7];
-h reg[3];
-y reg[7];
-y reg[3];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-rz(2.957330e+00) reg[3];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-y reg[7];
-y reg[3];
-h reg[7];
-h reg[4];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-rz(1.482614e+00) reg[4];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-h reg[7];
-h reg[4];
-y reg[7];
-y reg[4];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-rz(1.482614e+00) reg[4];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-y reg[7];
-y reg[4];
-h reg[7];
-h reg[5];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-rz(4.528935e+00) reg[5];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-h reg[7];
-h reg[5];
-y reg[7];
-y reg[5];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-rz(4.528935e+00) reg[5];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-y reg[7];
-y reg[5];
-h reg[7];
-h reg[6];
-cx reg[7],reg[6];
-rz(3.161797e+00) reg[6];
-cx reg[7],reg[6];
-h reg[7];
-h reg[6];
-y reg[7];
-y reg[6];
-cx reg[7],reg[6];
-rz(3.161797e+00) reg[6];
-cx reg[7],reg[6];
-y reg[7];
-y reg[6];
-
@@ -1,9679 +0,0 @@
-OPENQASM 2.0;
-include "qelib1.inc";
-qreg reg[8];
-rz(pi/2) reg[2];
-sx reg[2];
-rz(pi/2) reg[2];
-rz(pi/2) reg[3];
-sx reg[3];
-rz(pi/2) reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(4.691361) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-rz(-pi/2) reg[2];
-sx reg[2];
-rz(-pi/2) reg[2];
-rz(-pi/2) reg[3];
-sx reg[3];
-rz(-pi/2) reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(4.691361) reg[0];
-cx reg[1],reg[0];
-rz(-pi/2) reg[0];
-sx reg[0];
-rz(-pi/2) reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-rz(-pi/2) reg[3];
-sx reg[3];
-rz(-pi/2) reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(4.691361) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-rz(-pi/2) reg[2];
-sx reg[2];
-rz(-pi/2) reg[2];
-rz(-pi/2) reg[3];
-sx reg[3];
-rz(-pi/2) reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(4.691361) reg[0];
-cx reg[1],reg[0];
-rz(-pi/2) reg[0];
-sx reg[0];
-rz(-pi/2) reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-rz(-pi/2) reg[2];
-sx reg[2];
-rz(-pi/2) reg[2];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(4.691361) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-rz(-pi/2) reg[2];
-sx reg[2];
-rz(-pi/2) reg[2];
-rz(-pi/2) reg[3];
-sx reg[3];
-rz(-pi/2) reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(4.691361) reg[0];
-cx reg[1],reg[0];
-rz(-pi/2) reg[0];
-sx reg[0];
-rz(-pi/2) reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-rz(-pi/2) reg[3];
-sx reg[3];
-rz(-pi/2) reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(4.691361) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-rz(-pi/2) reg[2];
-sx reg[2];
-rz(-pi/2) reg[2];
-rz(-pi/2) reg[3];
-sx reg[3];
-rz(-pi/2) reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(4.691361) reg[0];
-cx reg[1],reg[0];
-rz(-pi/2) reg[0];
-sx reg[0];
-rz(-pi/2) reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-rz(-pi/2) reg[2];
-sx reg[2];
-rz(-pi/2) reg[2];
-rz(pi/2) reg[3];
-sx reg[3];
-rz(pi/2) reg[3];
-rz(pi/2) reg[4];
-sx reg[4];
-rz(pi/2) reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(2.093191) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-rz(-pi/2) reg[2];
-sx reg[2];
-rz(-pi/2) reg[2];
-cx reg[4],reg[3];
-rz(-pi/2) reg[4];
-sx reg[4];
-rz(-pi/2) reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(2.093191) reg[0];
-cx reg[1],reg[0];
-rz(-pi/2) reg[0];
-sx reg[0];
-rz(-pi/2) reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-rz(-pi/2) reg[4];
-sx reg[4];
-rz(-pi/2) reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(2.093191) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-rz(-pi/2) reg[2];
-sx reg[2];
-rz(-pi/2) reg[2];
-cx reg[4],reg[3];
-rz(-pi/2) reg[4];
-sx reg[4];
-rz(-pi/2) reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(2.093191) reg[0];
-cx reg[1],reg[0];
-rz(-pi/2) reg[0];
-sx reg[0];
-rz(-pi/2) reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-rz(-pi/2) reg[2];
-sx reg[2];
-rz(-pi/2) reg[2];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(2.093191) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-rz(-pi/2) reg[2];
-sx reg[2];
-rz(-pi/2) reg[2];
-cx reg[4],reg[3];
-rz(-pi/2) reg[4];
-sx reg[4];
-rz(-pi/2) reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(2.093191) reg[0];
-cx reg[1],reg[0];
-rz(-pi/2) reg[0];
-sx reg[0];
-rz(-pi/2) reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-rz(-pi/2) reg[4];
-sx reg[4];
-rz(-pi/2) reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(2.093191) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-rz(-pi/2) reg[2];
-sx reg[2];
-rz(-pi/2) reg[2];
-cx reg[4],reg[3];
-rz(-pi/2) reg[4];
-sx reg[4];
-rz(-pi/2) reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(2.093191) reg[0];
-cx reg[1],reg[0];
-rz(-pi/2) reg[0];
-sx reg[0];
-rz(-pi/2) reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-rz(-pi) reg[2];
-x reg[2];
-cx reg[4],reg[3];
-rz(pi/2) reg[3];
-sx reg[3];
-rz(pi/2) reg[3];
-cx reg[4],reg[3];
-cx reg[3],reg[1];
-cx reg[1],reg[0];
-rz(2.779911) reg[0];
-cx reg[1],reg[0];
-cx reg[3],reg[1];
-cx reg[4],reg[3];
-rz(-pi/2) reg[3];
-sx reg[3];
-rz(-pi/2) reg[3];
-rz(-pi/2) reg[4];
-sx reg[4];
-rz(-pi/2) reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[1];
-cx reg[1],reg[0];
-rz(2.779911) reg[0];
-cx reg[1],reg[0];
-rz(-pi/2) reg[0];
-sx reg[0];
-rz(-pi/2) reg[0];
-cx reg[3],reg[1];
-cx reg[4],reg[3];
-rz(-pi/2) reg[4];
-sx reg[4];
-rz(-pi/2) reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[1];
-cx reg[1],reg[0];
-rz(2.779911) reg[0];
-cx reg[1],reg[0];
-cx reg[3],reg[1];
-cx reg[4],reg[3];
-rz(-pi/2) reg[3];
-sx reg[3];
-rz(-pi/2) reg[3];
-rz(-pi/2) reg[4];
-sx reg[4];
-rz(-pi/2) reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[1];
-cx reg[1],reg[0];
-rz(2.779911) reg[0];
-cx reg[1],reg[0];
-rz(-pi/2) reg[0];
-sx reg[0];
-rz(-pi/2) reg[0];
-cx reg[3],reg[1];
-cx reg[4],reg[3];
-rz(-pi/2) reg[3];
-sx reg[3];
-rz(-pi/2) reg[3];
-cx reg[4],reg[3];
-cx reg[3],reg[1];
-cx reg[1],reg[0];
-rz(2.779911) reg[0];
-cx reg[1],reg[0];
-cx reg[3],reg[1];
-cx reg[4],reg[3];
-rz(-pi/2) reg[3];
-sx reg[3];
-rz(-pi/2) reg[3];
-rz(-pi/2) reg[4];
-sx reg[4];
-rz(-pi/2) reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[1];
-cx reg[1],reg[0];
-rz(2.779911) reg[0];
-cx reg[1],reg[0];
-rz(-pi/2) reg[0];
-sx reg[0];
-rz(-pi/2) reg[0];
-cx reg[3],reg[1];
-cx reg[4],reg[3];
-rz(-pi/2) reg[4];
-sx reg[4];
-rz(-pi/2) reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[1];
-cx reg[1],reg[0];
-rz(2.779911) reg[0];
-cx reg[1],reg[0];
-cx reg[3],reg[1];
-cx reg[4],reg[3];
-rz(-pi/2) reg[3];
-sx reg[3];
-rz(-pi/2) reg[3];
-rz(-pi/2) reg[4];
-sx reg[4];
-rz(-pi/2) reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[1];
-cx reg[1],reg[0];
-rz(2.779911) reg[0];
-cx reg[1],reg[0];
-rz(-pi/2) reg[0];
-sx reg[0];
-rz(-pi/2) reg[0];
-cx reg[3],reg[1];
-cx reg[4],reg[3];
-rz(-pi/2) reg[3];
-sx reg[3];
-rz(-pi/2) reg[3];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(0.4688447) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-rz(-pi/2) reg[3];
-sx reg[3];
-rz(-pi/2) reg[3];
-rz(-pi/2) reg[4];
-sx reg[4];
-rz(-pi/2) reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(0.4688447) reg[0];
-cx reg[1],reg[0];
-rz(-pi/2) reg[0];
-sx reg[0];
-rz(-pi/2) reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-rz(-pi/2) reg[4];
-sx reg[4];
-rz(-pi/2) reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(0.4688447) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-rz(-pi/2) reg[3];
-sx reg[3];
-rz(-pi/2) reg[3];
-rz(-pi/2) reg[4];
-sx reg[4];
-rz(-pi/2) reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(0.4688447) reg[0];
-cx reg[1],reg[0];
-rz(-pi/2) reg[0];
-sx reg[0];
-rz(-pi/2) reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-rz(-pi/2) reg[3];
-sx reg[3];
-rz(-pi/2) reg[3];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(0.4688447) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-rz(-pi/2) reg[3];
-sx reg[3];
-rz(-pi/2) reg[3];
-rz(-pi/2) reg[4];
-sx reg[4];
-rz(-pi/2) reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(0.4688447) reg[0];
-cx reg[1],reg[0];
-rz(-pi/2) reg[0];
-sx reg[0];
-rz(-pi/2) reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-rz(-pi/2) reg[4];
-sx reg[4];
-rz(-pi/2) reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(0.4688447) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-rz(-pi/2) reg[3];
-sx reg[3];
-rz(-pi/2) reg[3];
-rz(-pi/2) reg[4];
-sx reg[4];
-rz(-pi/2) reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(0.4688447) reg[0];
-cx reg[1],reg[0];
-rz(-pi/2) reg[0];
-sx reg[0];
-rz(-pi/2) reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-rz(-pi/2) reg[3];
-sx reg[3];
-rz(-pi/2) reg[3];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-rz(0.9386544) reg[1];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-rz(-pi/2) reg[3];
-sx reg[3];
-rz(-pi/2) reg[3];
-rz(-pi/2) reg[4];
-sx reg[4];
-rz(-pi/2) reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-rz(0.9386544) reg[1];
-cx reg[2],reg[1];
-rz(-pi/2) reg[1];
-sx reg[1];
-rz(-pi/2) reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-rz(-pi/2) reg[4];
-sx reg[4];
-rz(-pi/2) reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-rz(0.9386544) reg[1];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-rz(-pi/2) reg[3];
-sx reg[3];
-rz(-pi/2) reg[3];
-rz(-pi/2) reg[4];
-sx reg[4];
-rz(-pi/2) reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-rz(0.9386544) reg[1];
-cx reg[2],reg[1];
-rz(-pi/2) reg[1];
-sx reg[1];
-rz(-pi/2) reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-rz(-pi/2) reg[3];
-sx reg[3];
-rz(-pi/2) reg[3];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-rz(0.9386544) reg[1];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-rz(-pi/2) reg[3];
-sx reg[3];
-rz(-pi/2) reg[3];
-rz(-pi/2) reg[4];
-sx reg[4];
-rz(-pi/2) reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-rz(0.9386544) reg[1];
-cx reg[2],reg[1];
-rz(-pi/2) reg[1];
-sx reg[1];
-rz(-pi/2) reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-rz(-pi/2) reg[4];
-sx reg[4];
-rz(-pi/2) reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-rz(0.9386544) reg[1];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-rz(-pi/2) reg[3];
-sx reg[3];
-rz(-pi/2) reg[3];
-rz(-pi/2) reg[4];
-sx reg[4];
-rz(-pi/2) reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-rz(0.9386544) reg[1];
-cx reg[2],reg[1];
-rz(-pi/2) reg[1];
-sx reg[1];
-rz(-pi/2) reg[1];
-cx reg[3],reg[2];
-rz(pi/2) reg[2];
-sx reg[2];
-rz(pi/2) reg[2];
-cx reg[4],reg[3];
-rz(-pi) reg[3];
-x reg[3];
-rz(pi/2) reg[4];
-sx reg[4];
-rz(pi/2) reg[4];
-rz(pi/2) reg[5];
-sx reg[5];
-rz(pi/2) reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(1.247019) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-rz(-pi/2) reg[2];
-sx reg[2];
-rz(-pi/2) reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-rz(-pi/2) reg[5];
-sx reg[5];
-rz(-pi/2) reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(1.247019) reg[0];
-cx reg[1],reg[0];
-rz(-pi/2) reg[0];
-sx reg[0];
-rz(-pi/2) reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-rz(-pi/2) reg[5];
-sx reg[5];
-rz(-pi/2) reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(1.247019) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-rz(-pi/2) reg[2];
-sx reg[2];
-rz(-pi/2) reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-rz(-pi/2) reg[5];
-sx reg[5];
-rz(-pi/2) reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(1.247019) reg[0];
-cx reg[1],reg[0];
-rz(-pi/2) reg[0];
-sx reg[0];
-rz(-pi/2) reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-rz(-pi/2) reg[2];
-sx reg[2];
-rz(-pi/2) reg[2];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(1.247019) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-rz(-pi/2) reg[2];
-sx reg[2];
-rz(-pi/2) reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-rz(-pi/2) reg[5];
-sx reg[5];
-rz(-pi/2) reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(1.247019) reg[0];
-cx reg[1],reg[0];
-rz(-pi/2) reg[0];
-sx reg[0];
-rz(-pi/2) reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-rz(-pi/2) reg[5];
-sx reg[5];
-rz(-pi/2) reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(1.247019) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-rz(-pi/2) reg[2];
-sx reg[2];
-rz(-pi/2) reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-rz(-pi/2) reg[5];
-sx reg[5];
-rz(-pi/2) reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(1.247019) reg[0];
-cx reg[1],reg[0];
-rz(-pi/2) reg[0];
-sx reg[0];
-rz(-pi/2) reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-rz(-pi) reg[2];
-x reg[2];
-cx reg[4],reg[3];
-rz(pi/2) reg[3];
-sx reg[3];
-rz(pi/2) reg[3];
-cx reg[4],reg[3];
-cx reg[3],reg[1];
-cx reg[1],reg[0];
-rz(3.290294) reg[0];
-cx reg[1],reg[0];
-cx reg[3],reg[1];
-cx reg[4],reg[3];
-rz(-pi/2) reg[3];
-sx reg[3];
-rz(-pi/2) reg[3];
-cx reg[5],reg[4];
-rz(-pi/2) reg[5];
-sx reg[5];
-rz(-pi/2) reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[1];
-cx reg[1],reg[0];
-rz(3.290294) reg[0];
-cx reg[1],reg[0];
-rz(-pi/2) reg[0];
-sx reg[0];
-rz(-pi/2) reg[0];
-cx reg[3],reg[1];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-rz(-pi/2) reg[5];
-sx reg[5];
-rz(-pi/2) reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[1];
-cx reg[1],reg[0];
-rz(3.290294) reg[0];
-cx reg[1],reg[0];
-cx reg[3],reg[1];
-cx reg[4],reg[3];
-rz(-pi/2) reg[3];
-sx reg[3];
-rz(-pi/2) reg[3];
-cx reg[5],reg[4];
-rz(-pi/2) reg[5];
-sx reg[5];
-rz(-pi/2) reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[1];
-cx reg[1],reg[0];
-rz(3.290294) reg[0];
-cx reg[1],reg[0];
-rz(-pi/2) reg[0];
-sx reg[0];
-rz(-pi/2) reg[0];
-cx reg[3],reg[1];
-cx reg[4],reg[3];
-rz(-pi/2) reg[3];
-sx reg[3];
-rz(-pi/2) reg[3];
-cx reg[4],reg[3];
-cx reg[3],reg[1];
-cx reg[1],reg[0];
-rz(3.290294) reg[0];
-cx reg[1],reg[0];
-cx reg[3],reg[1];
-cx reg[4],reg[3];
-rz(-pi/2) reg[3];
-sx reg[3];
-rz(-pi/2) reg[3];
-cx reg[5],reg[4];
-rz(-pi/2) reg[5];
-sx reg[5];
-rz(-pi/2) reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[1];
-cx reg[1],reg[0];
-rz(3.290294) reg[0];
-cx reg[1],reg[0];
-rz(-pi/2) reg[0];
-sx reg[0];
-rz(-pi/2) reg[0];
-cx reg[3],reg[1];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-rz(-pi/2) reg[5];
-sx reg[5];
-rz(-pi/2) reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[1];
-cx reg[1],reg[0];
-rz(3.290294) reg[0];
-cx reg[1],reg[0];
-cx reg[3],reg[1];
-cx reg[4],reg[3];
-rz(-pi/2) reg[3];
-sx reg[3];
-rz(-pi/2) reg[3];
-cx reg[5],reg[4];
-rz(-pi/2) reg[5];
-sx reg[5];
-rz(-pi/2) reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[1];
-cx reg[1],reg[0];
-rz(3.290294) reg[0];
-cx reg[1],reg[0];
-rz(-pi/2) reg[0];
-sx reg[0];
-rz(-pi/2) reg[0];
-cx reg[3],reg[1];
-cx reg[4],reg[3];
-rz(-pi/2) reg[3];
-sx reg[3];
-rz(-pi/2) reg[3];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(1.769559) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-rz(-pi/2) reg[3];
-sx reg[3];
-rz(-pi/2) reg[3];
-cx reg[5],reg[4];
-rz(-pi/2) reg[5];
-sx reg[5];
-rz(-pi/2) reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(1.769559) reg[0];
-cx reg[1],reg[0];
-rz(-pi/2) reg[0];
-sx reg[0];
-rz(-pi/2) reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-rz(-pi/2) reg[5];
-sx reg[5];
-rz(-pi/2) reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(1.769559) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-rz(-pi/2) reg[3];
-sx reg[3];
-rz(-pi/2) reg[3];
-cx reg[5],reg[4];
-rz(-pi/2) reg[5];
-sx reg[5];
-rz(-pi/2) reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(1.769559) reg[0];
-cx reg[1],reg[0];
-rz(-pi/2) reg[0];
-sx reg[0];
-rz(-pi/2) reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-rz(-pi/2) reg[3];
-sx reg[3];
-rz(-pi/2) reg[3];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(1.769559) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-rz(-pi/2) reg[3];
-sx reg[3];
-rz(-pi/2) reg[3];
-cx reg[5],reg[4];
-rz(-pi/2) reg[5];
-sx reg[5];
-rz(-pi/2) reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(1.769559) reg[0];
-cx reg[1],reg[0];
-rz(-pi/2) reg[0];
-sx reg[0];
-rz(-pi/2) reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-rz(-pi/2) reg[5];
-sx reg[5];
-rz(-pi/2) reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(1.769559) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-rz(-pi/2) reg[3];
-sx reg[3];
-rz(-pi/2) reg[3];
-cx reg[5],reg[4];
-rz(-pi/2) reg[5];
-sx reg[5];
-rz(-pi/2) reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(1.769559) reg[0];
-cx reg[1],reg[0];
-rz(-pi/2) reg[0];
-sx reg[0];
-rz(-pi/2) reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-rz(-pi/2) reg[3];
-sx reg[3];
-rz(-pi/2) reg[3];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-rz(5.048614) reg[1];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-rz(-pi/2) reg[3];
-sx reg[3];
-rz(-pi/2) reg[3];
-cx reg[5],reg[4];
-rz(-pi/2) reg[5];
-sx reg[5];
-rz(-pi/2) reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-rz(5.048614) reg[1];
-cx reg[2],reg[1];
-rz(-pi/2) reg[1];
-sx reg[1];
-rz(-pi/2) reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-rz(-pi/2) reg[5];
-sx reg[5];
-rz(-pi/2) reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-rz(5.048614) reg[1];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-rz(-pi/2) reg[3];
-sx reg[3];
-rz(-pi/2) reg[3];
-cx reg[5],reg[4];
-rz(-pi/2) reg[5];
-sx reg[5];
-rz(-pi/2) reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-rz(5.048614) reg[1];
-cx reg[2],reg[1];
-rz(-pi/2) reg[1];
-sx reg[1];
-rz(-pi/2) reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-rz(-pi/2) reg[3];
-sx reg[3];
-rz(-pi/2) reg[3];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-rz(5.048614) reg[1];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-rz(-pi/2) reg[3];
-sx reg[3];
-rz(-pi/2) reg[3];
-cx reg[5],reg[4];
-rz(-pi/2) reg[5];
-sx reg[5];
-rz(-pi/2) reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-rz(5.048614) reg[1];
-cx reg[2],reg[1];
-rz(-pi/2) reg[1];
-sx reg[1];
-rz(-pi/2) reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-rz(-pi/2) reg[5];
-sx reg[5];
-rz(-pi/2) reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-rz(5.048614) reg[1];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-rz(-pi/2) reg[3];
-sx reg[3];
-rz(-pi/2) reg[3];
-cx reg[5],reg[4];
-rz(-pi/2) reg[5];
-sx reg[5];
-rz(-pi/2) reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-rz(5.048614) reg[1];
-cx reg[2],reg[1];
-rz(-pi/2) reg[1];
-sx reg[1];
-rz(-pi/2) reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-rz(-pi) reg[3];
-x reg[3];
-cx reg[5],reg[4];
-rz(pi/2) reg[4];
-sx reg[4];
-rz(pi/2) reg[4];
-cx reg[5],reg[4];
-cx reg[4],reg[1];
-cx reg[1],reg[0];
-rz(4.302892) reg[0];
-cx reg[1],reg[0];
-cx reg[4],reg[1];
-cx reg[5],reg[4];
-rz(-pi/2) reg[4];
-sx reg[4];
-rz(-pi/2) reg[4];
-rz(-pi/2) reg[5];
-sx reg[5];
-rz(-pi/2) reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[1];
-cx reg[1],reg[0];
-rz(4.302892) reg[0];
-cx reg[1],reg[0];
-rz(-pi/2) reg[0];
-sx reg[0];
-rz(-pi/2) reg[0];
-cx reg[4],reg[1];
-cx reg[5],reg[4];
-rz(-pi/2) reg[5];
-sx reg[5];
-rz(-pi/2) reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[1];
-cx reg[1],reg[0];
-rz(4.302892) reg[0];
-cx reg[1],reg[0];
-cx reg[4],reg[1];
-cx reg[5],reg[4];
-rz(-pi/2) reg[4];
-sx reg[4];
-rz(-pi/2) reg[4];
-rz(-pi/2) reg[5];
-sx reg[5];
-rz(-pi/2) reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[1];
-cx reg[1],reg[0];
-rz(4.302892) reg[0];
-cx reg[1],reg[0];
-rz(-pi/2) reg[0];
-sx reg[0];
-rz(-pi/2) reg[0];
-cx reg[4],reg[1];
-cx reg[5],reg[4];
-rz(-pi/2) reg[4];
-sx reg[4];
-rz(-pi/2) reg[4];
-cx reg[5],reg[4];
-cx reg[4],reg[1];
-cx reg[1],reg[0];
-rz(4.302892) reg[0];
-cx reg[1],reg[0];
-cx reg[4],reg[1];
-cx reg[5],reg[4];
-rz(-pi/2) reg[4];
-sx reg[4];
-rz(-pi/2) reg[4];
-rz(-pi/2) reg[5];
-sx reg[5];
-rz(-pi/2) reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[1];
-cx reg[1],reg[0];
-rz(4.302892) reg[0];
-cx reg[1],reg[0];
-rz(-pi/2) reg[0];
-sx reg[0];
-rz(-pi/2) reg[0];
-cx reg[4],reg[1];
-cx reg[5],reg[4];
-rz(-pi/2) reg[5];
-sx reg[5];
-rz(-pi/2) reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[1];
-cx reg[1],reg[0];
-rz(4.302892) reg[0];
-cx reg[1],reg[0];
-cx reg[4],reg[1];
-cx reg[5],reg[4];
-rz(-pi/2) reg[4];
-sx reg[4];
-rz(-pi/2) reg[4];
-rz(-pi/2) reg[5];
-sx reg[5];
-rz(-pi/2) reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[1];
-cx reg[1],reg[0];
-rz(4.302892) reg[0];
-cx reg[1],reg[0];
-rz(-pi/2) reg[0];
-sx reg[0];
-rz(-pi/2) reg[0];
-cx reg[4],reg[1];
-cx reg[5],reg[4];
-rz(-pi/2) reg[4];
-sx reg[4];
-rz(-pi/2) reg[4];
-cx reg[5],reg[4];
-cx reg[4],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(0.9926059) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[4],reg[2];
-cx reg[5],reg[4];
-rz(-pi/2) reg[4];
-sx reg[4];
-rz(-pi/2) reg[4];
-rz(-pi/2) reg[5];
-sx reg[5];
-rz(-pi/2) reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(0.9926059) reg[0];
-cx reg[1],reg[0];
-rz(-pi/2) reg[0];
-sx reg[0];
-rz(-pi/2) reg[0];
-cx reg[2],reg[1];
-cx reg[4],reg[2];
-cx reg[5],reg[4];
-rz(-pi/2) reg[5];
-sx reg[5];
-rz(-pi/2) reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(0.9926059) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[4],reg[2];
-cx reg[5],reg[4];
-rz(-pi/2) reg[4];
-sx reg[4];
-rz(-pi/2) reg[4];
-rz(-pi/2) reg[5];
-sx reg[5];
-rz(-pi/2) reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(0.9926059) reg[0];
-cx reg[1],reg[0];
-rz(-pi/2) reg[0];
-sx reg[0];
-rz(-pi/2) reg[0];
-cx reg[2],reg[1];
-cx reg[4],reg[2];
-cx reg[5],reg[4];
-rz(-pi/2) reg[4];
-sx reg[4];
-rz(-pi/2) reg[4];
-cx reg[5],reg[4];
-cx reg[4],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(0.9926059) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[4],reg[2];
-cx reg[5],reg[4];
-rz(-pi/2) reg[4];
-sx reg[4];
-rz(-pi/2) reg[4];
-rz(-pi/2) reg[5];
-sx reg[5];
-rz(-pi/2) reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(0.9926059) reg[0];
-cx reg[1],reg[0];
-rz(-pi/2) reg[0];
-sx reg[0];
-rz(-pi/2) reg[0];
-cx reg[2],reg[1];
-cx reg[4],reg[2];
-cx reg[5],reg[4];
-rz(-pi/2) reg[5];
-sx reg[5];
-rz(-pi/2) reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(0.9926059) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[4],reg[2];
-cx reg[5],reg[4];
-rz(-pi/2) reg[4];
-sx reg[4];
-rz(-pi/2) reg[4];
-rz(-pi/2) reg[5];
-sx reg[5];
-rz(-pi/2) reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(0.9926059) reg[0];
-cx reg[1],reg[0];
-rz(-pi/2) reg[0];
-sx reg[0];
-rz(-pi/2) reg[0];
-cx reg[2],reg[1];
-cx reg[4],reg[2];
-cx reg[5],reg[4];
-rz(-pi/2) reg[4];
-sx reg[4];
-rz(-pi/2) reg[4];
-cx reg[5],reg[4];
-cx reg[4],reg[2];
-cx reg[2],reg[1];
-rz(0.6762655) reg[1];
-cx reg[2],reg[1];
-cx reg[4],reg[2];
-cx reg[5],reg[4];
-rz(-pi/2) reg[4];
-sx reg[4];
-rz(-pi/2) reg[4];
-rz(-pi/2) reg[5];
-sx reg[5];
-rz(-pi/2) reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[2];
-cx reg[2],reg[1];
-rz(0.6762655) reg[1];
-cx reg[2],reg[1];
-rz(-pi/2) reg[1];
-sx reg[1];
-rz(-pi/2) reg[1];
-cx reg[4],reg[2];
-cx reg[5],reg[4];
-rz(-pi/2) reg[5];
-sx reg[5];
-rz(-pi/2) reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[2];
-cx reg[2],reg[1];
-rz(0.6762655) reg[1];
-cx reg[2],reg[1];
-cx reg[4],reg[2];
-cx reg[5],reg[4];
-rz(-pi/2) reg[4];
-sx reg[4];
-rz(-pi/2) reg[4];
-rz(-pi/2) reg[5];
-sx reg[5];
-rz(-pi/2) reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[2];
-cx reg[2],reg[1];
-rz(0.6762655) reg[1];
-cx reg[2],reg[1];
-rz(-pi/2) reg[1];
-sx reg[1];
-rz(-pi/2) reg[1];
-cx reg[4],reg[2];
-cx reg[5],reg[4];
-rz(-pi/2) reg[4];
-sx reg[4];
-rz(-pi/2) reg[4];
-cx reg[5],reg[4];
-cx reg[4],reg[2];
-cx reg[2],reg[1];
-rz(0.6762655) reg[1];
-cx reg[2],reg[1];
-cx reg[4],reg[2];
-cx reg[5],reg[4];
-rz(-pi/2) reg[4];
-sx reg[4];
-rz(-pi/2) reg[4];
-rz(-pi/2) reg[5];
-sx reg[5];
-rz(-pi/2) reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[2];
-cx reg[2],reg[1];
-rz(0.6762655) reg[1];
-cx reg[2],reg[1];
-rz(-pi/2) reg[1];
-sx reg[1];
-rz(-pi/2) reg[1];
-cx reg[4],reg[2];
-cx reg[5],reg[4];
-rz(-pi/2) reg[5];
-sx reg[5];
-rz(-pi/2) reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[2];
-cx reg[2],reg[1];
-rz(0.6762655) reg[1];
-cx reg[2],reg[1];
-cx reg[4],reg[2];
-cx reg[5],reg[4];
-rz(-pi/2) reg[4];
-sx reg[4];
-rz(-pi/2) reg[4];
-rz(-pi/2) reg[5];
-sx reg[5];
-rz(-pi/2) reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[2];
-cx reg[2],reg[1];
-rz(0.6762655) reg[1];
-cx reg[2],reg[1];
-rz(-pi/2) reg[1];
-sx reg[1];
-rz(-pi/2) reg[1];
-cx reg[4],reg[2];
-cx reg[5],reg[4];
-rz(-pi/2) reg[4];
-sx reg[4];
-rz(-pi/2) reg[4];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(2.946331) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-rz(-pi/2) reg[4];
-sx reg[4];
-rz(-pi/2) reg[4];
-rz(-pi/2) reg[5];
-sx reg[5];
-rz(-pi/2) reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(2.946331) reg[0];
-cx reg[1],reg[0];
-rz(-pi/2) reg[0];
-sx reg[0];
-rz(-pi/2) reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-rz(-pi/2) reg[5];
-sx reg[5];
-rz(-pi/2) reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(2.946331) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-rz(-pi/2) reg[4];
-sx reg[4];
-rz(-pi/2) reg[4];
-rz(-pi/2) reg[5];
-sx reg[5];
-rz(-pi/2) reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(2.946331) reg[0];
-cx reg[1],reg[0];
-rz(-pi/2) reg[0];
-sx reg[0];
-rz(-pi/2) reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-rz(-pi/2) reg[4];
-sx reg[4];
-rz(-pi/2) reg[4];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(2.946331) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-rz(-pi/2) reg[4];
-sx reg[4];
-rz(-pi/2) reg[4];
-rz(-pi/2) reg[5];
-sx reg[5];
-rz(-pi/2) reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(2.946331) reg[0];
-cx reg[1],reg[0];
-rz(-pi/2) reg[0];
-sx reg[0];
-rz(-pi/2) reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-rz(-pi/2) reg[5];
-sx reg[5];
-rz(-pi/2) reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(2.946331) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-rz(-pi/2) reg[4];
-sx reg[4];
-rz(-pi/2) reg[4];
-rz(-pi/2) reg[5];
-sx reg[5];
-rz(-pi/2) reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(2.946331) reg[0];
-cx reg[1],reg[0];
-rz(-pi/2) reg[0];
-sx reg[0];
-rz(-pi/2) reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-rz(-pi/2) reg[4];
-sx reg[4];
-rz(-pi/2) reg[4];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-rz(2.867847) reg[1];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-rz(-pi/2) reg[4];
-sx reg[4];
-rz(-pi/2) reg[4];
-rz(-pi/2) reg[5];
-sx reg[5];
-rz(-pi/2) reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-rz(2.867847) reg[1];
-cx reg[2],reg[1];
-rz(-pi/2) reg[1];
-sx reg[1];
-rz(-pi/2) reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-rz(-pi/2) reg[5];
-sx reg[5];
-rz(-pi/2) reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-rz(2.867847) reg[1];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-rz(-pi/2) reg[4];
-sx reg[4];
-rz(-pi/2) reg[4];
-rz(-pi/2) reg[5];
-sx reg[5];
-rz(-pi/2) reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-rz(2.867847) reg[1];
-cx reg[2],reg[1];
-rz(-pi/2) reg[1];
-sx reg[1];
-rz(-pi/2) reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-rz(-pi/2) reg[4];
-sx reg[4];
-rz(-pi/2) reg[4];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-rz(2.867847) reg[1];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-rz(-pi/2) reg[4];
-sx reg[4];
-rz(-pi/2) reg[4];
-rz(-pi/2) reg[5];
-sx reg[5];
-rz(-pi/2) reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-rz(2.867847) reg[1];
-cx reg[2],reg[1];
-rz(-pi/2) reg[1];
-sx reg[1];
-rz(-pi/2) reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-rz(-pi/2) reg[5];
-sx reg[5];
-rz(-pi/2) reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-rz(2.867847) reg[1];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-rz(-pi/2) reg[4];
-sx reg[4];
-rz(-pi/2) reg[4];
-rz(-pi/2) reg[5];
-sx reg[5];
-rz(-pi/2) reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-rz(2.867847) reg[1];
-cx reg[2],reg[1];
-rz(-pi/2) reg[1];
-sx reg[1];
-rz(-pi/2) reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-rz(-pi/2) reg[4];
-sx reg[4];
-rz(-pi/2) reg[4];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-rz(1.324597) reg[2];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-rz(-pi/2) reg[4];
-sx reg[4];
-rz(-pi/2) reg[4];
-rz(-pi/2) reg[5];
-sx reg[5];
-rz(-pi/2) reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-rz(1.324597) reg[2];
-cx reg[3],reg[2];
-rz(-pi/2) reg[2];
-sx reg[2];
-rz(-pi/2) reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-rz(-pi/2) reg[5];
-sx reg[5];
-rz(-pi/2) reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-rz(1.324597) reg[2];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-rz(-pi/2) reg[4];
-sx reg[4];
-rz(-pi/2) reg[4];
-rz(-pi/2) reg[5];
-sx reg[5];
-rz(-pi/2) reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-rz(1.324597) reg[2];
-cx reg[3],reg[2];
-rz(-pi/2) reg[2];
-sx reg[2];
-rz(-pi/2) reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-rz(-pi/2) reg[4];
-sx reg[4];
-rz(-pi/2) reg[4];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-rz(1.324597) reg[2];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-rz(-pi/2) reg[4];
-sx reg[4];
-rz(-pi/2) reg[4];
-rz(-pi/2) reg[5];
-sx reg[5];
-rz(-pi/2) reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-rz(1.324597) reg[2];
-cx reg[3],reg[2];
-rz(-pi/2) reg[2];
-sx reg[2];
-rz(-pi/2) reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-rz(-pi/2) reg[5];
-sx reg[5];
-rz(-pi/2) reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-rz(1.324597) reg[2];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-rz(-pi/2) reg[4];
-sx reg[4];
-rz(-pi/2) reg[4];
-rz(-pi/2) reg[5];
-sx reg[5];
-rz(-pi/2) reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-rz(1.324597) reg[2];
-cx reg[3],reg[2];
-rz(-pi) reg[2];
-x reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-rz(-pi) reg[4];
-x reg[4];
-rz(pi/2) reg[5];
-sx reg[5];
-rz(pi/2) reg[5];
-rz(pi/2) reg[6];
-sx reg[6];
-rz(pi/2) reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(3.099363) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-rz(-pi/2) reg[2];
-sx reg[2];
-rz(-pi/2) reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-rz(-pi/2) reg[6];
-sx reg[6];
-rz(-pi/2) reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(3.099363) reg[0];
-cx reg[1],reg[0];
-rz(-pi/2) reg[0];
-sx reg[0];
-rz(-pi/2) reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-rz(-pi/2) reg[6];
-sx reg[6];
-rz(-pi/2) reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(3.099363) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-rz(-pi/2) reg[2];
-sx reg[2];
-rz(-pi/2) reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-rz(-pi/2) reg[6];
-sx reg[6];
-rz(-pi/2) reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(3.099363) reg[0];
-cx reg[1],reg[0];
-rz(-pi/2) reg[0];
-sx reg[0];
-rz(-pi/2) reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-rz(-pi/2) reg[2];
-sx reg[2];
-rz(-pi/2) reg[2];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(3.099363) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-rz(-pi/2) reg[2];
-sx reg[2];
-rz(-pi/2) reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-rz(-pi/2) reg[6];
-sx reg[6];
-rz(-pi/2) reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(3.099363) reg[0];
-cx reg[1],reg[0];
-rz(-pi/2) reg[0];
-sx reg[0];
-rz(-pi/2) reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-rz(-pi/2) reg[6];
-sx reg[6];
-rz(-pi/2) reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(3.099363) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-rz(-pi/2) reg[2];
-sx reg[2];
-rz(-pi/2) reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-rz(-pi/2) reg[6];
-sx reg[6];
-rz(-pi/2) reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(3.099363) reg[0];
-cx reg[1],reg[0];
-rz(-pi/2) reg[0];
-sx reg[0];
-rz(-pi/2) reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-rz(-pi) reg[2];
-x reg[2];
-cx reg[4],reg[3];
-rz(pi/2) reg[3];
-sx reg[3];
-rz(pi/2) reg[3];
-cx reg[4],reg[3];
-cx reg[3],reg[1];
-cx reg[1],reg[0];
-rz(2.270469) reg[0];
-cx reg[1],reg[0];
-cx reg[3],reg[1];
-cx reg[4],reg[3];
-rz(-pi/2) reg[3];
-sx reg[3];
-rz(-pi/2) reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-rz(-pi/2) reg[6];
-sx reg[6];
-rz(-pi/2) reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[1];
-cx reg[1],reg[0];
-rz(2.270469) reg[0];
-cx reg[1],reg[0];
-rz(-pi/2) reg[0];
-sx reg[0];
-rz(-pi/2) reg[0];
-cx reg[3],reg[1];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-rz(-pi/2) reg[6];
-sx reg[6];
-rz(-pi/2) reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[1];
-cx reg[1],reg[0];
-rz(2.270469) reg[0];
-cx reg[1],reg[0];
-cx reg[3],reg[1];
-cx reg[4],reg[3];
-rz(-pi/2) reg[3];
-sx reg[3];
-rz(-pi/2) reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-rz(-pi/2) reg[6];
-sx reg[6];
-rz(-pi/2) reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[1];
-cx reg[1],reg[0];
-rz(2.270469) reg[0];
-cx reg[1],reg[0];
-rz(-pi/2) reg[0];
-sx reg[0];
-rz(-pi/2) reg[0];
-cx reg[3],reg[1];
-cx reg[4],reg[3];
-rz(-pi/2) reg[3];
-sx reg[3];
-rz(-pi/2) reg[3];
-cx reg[4],reg[3];
-cx reg[3],reg[1];
-cx reg[1],reg[0];
-rz(2.270469) reg[0];
-cx reg[1],reg[0];
-cx reg[3],reg[1];
-cx reg[4],reg[3];
-rz(-pi/2) reg[3];
-sx reg[3];
-rz(-pi/2) reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-rz(-pi/2) reg[6];
-sx reg[6];
-rz(-pi/2) reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[1];
-cx reg[1],reg[0];
-rz(2.270469) reg[0];
-cx reg[1],reg[0];
-rz(-pi/2) reg[0];
-sx reg[0];
-rz(-pi/2) reg[0];
-cx reg[3],reg[1];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-rz(-pi/2) reg[6];
-sx reg[6];
-rz(-pi/2) reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[1];
-cx reg[1],reg[0];
-rz(2.270469) reg[0];
-cx reg[1],reg[0];
-cx reg[3],reg[1];
-cx reg[4],reg[3];
-rz(-pi/2) reg[3];
-sx reg[3];
-rz(-pi/2) reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-rz(-pi/2) reg[6];
-sx reg[6];
-rz(-pi/2) reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[1];
-cx reg[1],reg[0];
-rz(2.270469) reg[0];
-cx reg[1],reg[0];
-rz(-pi/2) reg[0];
-sx reg[0];
-rz(-pi/2) reg[0];
-cx reg[3],reg[1];
-cx reg[4],reg[3];
-rz(-pi/2) reg[3];
-sx reg[3];
-rz(-pi/2) reg[3];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(4.511343) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-rz(-pi/2) reg[3];
-sx reg[3];
-rz(-pi/2) reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-rz(-pi/2) reg[6];
-sx reg[6];
-rz(-pi/2) reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(4.511343) reg[0];
-cx reg[1],reg[0];
-rz(-pi/2) reg[0];
-sx reg[0];
-rz(-pi/2) reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-rz(-pi/2) reg[6];
-sx reg[6];
-rz(-pi/2) reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(4.511343) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-rz(-pi/2) reg[3];
-sx reg[3];
-rz(-pi/2) reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-rz(-pi/2) reg[6];
-sx reg[6];
-rz(-pi/2) reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(4.511343) reg[0];
-cx reg[1],reg[0];
-rz(-pi/2) reg[0];
-sx reg[0];
-rz(-pi/2) reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-rz(-pi/2) reg[3];
-sx reg[3];
-rz(-pi/2) reg[3];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(4.511343) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-rz(-pi/2) reg[3];
-sx reg[3];
-rz(-pi/2) reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-rz(-pi/2) reg[6];
-sx reg[6];
-rz(-pi/2) reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(4.511343) reg[0];
-cx reg[1],reg[0];
-rz(-pi/2) reg[0];
-sx reg[0];
-rz(-pi/2) reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-rz(-pi/2) reg[6];
-sx reg[6];
-rz(-pi/2) reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(4.511343) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-rz(-pi/2) reg[3];
-sx reg[3];
-rz(-pi/2) reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-rz(-pi/2) reg[6];
-sx reg[6];
-rz(-pi/2) reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(4.511343) reg[0];
-cx reg[1],reg[0];
-rz(-pi/2) reg[0];
-sx reg[0];
-rz(-pi/2) reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-rz(-pi/2) reg[3];
-sx reg[3];
-rz(-pi/2) reg[3];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-rz(2.655704) reg[1];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-rz(-pi/2) reg[3];
-sx reg[3];
-rz(-pi/2) reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-rz(-pi/2) reg[6];
-sx reg[6];
-rz(-pi/2) reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-rz(2.655704) reg[1];
-cx reg[2],reg[1];
-rz(-pi/2) reg[1];
-sx reg[1];
-rz(-pi/2) reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-rz(-pi/2) reg[6];
-sx reg[6];
-rz(-pi/2) reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-rz(2.655704) reg[1];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-rz(-pi/2) reg[3];
-sx reg[3];
-rz(-pi/2) reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-rz(-pi/2) reg[6];
-sx reg[6];
-rz(-pi/2) reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-rz(2.655704) reg[1];
-cx reg[2],reg[1];
-rz(-pi/2) reg[1];
-sx reg[1];
-rz(-pi/2) reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-rz(-pi/2) reg[3];
-sx reg[3];
-rz(-pi/2) reg[3];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-rz(2.655704) reg[1];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-rz(-pi/2) reg[3];
-sx reg[3];
-rz(-pi/2) reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-rz(-pi/2) reg[6];
-sx reg[6];
-rz(-pi/2) reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-rz(2.655704) reg[1];
-cx reg[2],reg[1];
-rz(-pi/2) reg[1];
-sx reg[1];
-rz(-pi/2) reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-rz(-pi/2) reg[6];
-sx reg[6];
-rz(-pi/2) reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-rz(2.655704) reg[1];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-rz(-pi/2) reg[3];
-sx reg[3];
-rz(-pi/2) reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-rz(-pi/2) reg[6];
-sx reg[6];
-rz(-pi/2) reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-rz(2.655704) reg[1];
-cx reg[2],reg[1];
-rz(-pi/2) reg[1];
-sx reg[1];
-rz(-pi/2) reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-rz(-pi) reg[3];
-x reg[3];
-cx reg[5],reg[4];
-rz(pi/2) reg[4];
-sx reg[4];
-rz(pi/2) reg[4];
-cx reg[5],reg[4];
-cx reg[4],reg[1];
-cx reg[1],reg[0];
-rz(5.354909) reg[0];
-cx reg[1],reg[0];
-cx reg[4],reg[1];
-cx reg[5],reg[4];
-rz(-pi/2) reg[4];
-sx reg[4];
-rz(-pi/2) reg[4];
-cx reg[6],reg[5];
-rz(-pi/2) reg[6];
-sx reg[6];
-rz(-pi/2) reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[1];
-cx reg[1],reg[0];
-rz(5.354909) reg[0];
-cx reg[1],reg[0];
-rz(-pi/2) reg[0];
-sx reg[0];
-rz(-pi/2) reg[0];
-cx reg[4],reg[1];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-rz(-pi/2) reg[6];
-sx reg[6];
-rz(-pi/2) reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[1];
-cx reg[1],reg[0];
-rz(5.354909) reg[0];
-cx reg[1],reg[0];
-cx reg[4],reg[1];
-cx reg[5],reg[4];
-rz(-pi/2) reg[4];
-sx reg[4];
-rz(-pi/2) reg[4];
-cx reg[6],reg[5];
-rz(-pi/2) reg[6];
-sx reg[6];
-rz(-pi/2) reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[1];
-cx reg[1],reg[0];
-rz(5.354909) reg[0];
-cx reg[1],reg[0];
-rz(-pi/2) reg[0];
-sx reg[0];
-rz(-pi/2) reg[0];
-cx reg[4],reg[1];
-cx reg[5],reg[4];
-rz(-pi/2) reg[4];
-sx reg[4];
-rz(-pi/2) reg[4];
-cx reg[5],reg[4];
-cx reg[4],reg[1];
-cx reg[1],reg[0];
-rz(5.354909) reg[0];
-cx reg[1],reg[0];
-cx reg[4],reg[1];
-cx reg[5],reg[4];
-rz(-pi/2) reg[4];
-sx reg[4];
-rz(-pi/2) reg[4];
-cx reg[6],reg[5];
-rz(-pi/2) reg[6];
-sx reg[6];
-rz(-pi/2) reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[1];
-cx reg[1],reg[0];
-rz(5.354909) reg[0];
-cx reg[1],reg[0];
-rz(-pi/2) reg[0];
-sx reg[0];
-rz(-pi/2) reg[0];
-cx reg[4],reg[1];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-rz(-pi/2) reg[6];
-sx reg[6];
-rz(-pi/2) reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[1];
-cx reg[1],reg[0];
-rz(5.354909) reg[0];
-cx reg[1],reg[0];
-cx reg[4],reg[1];
-cx reg[5],reg[4];
-rz(-pi/2) reg[4];
-sx reg[4];
-rz(-pi/2) reg[4];
-cx reg[6],reg[5];
-rz(-pi/2) reg[6];
-sx reg[6];
-rz(-pi/2) reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[1];
-cx reg[1],reg[0];
-rz(5.354909) reg[0];
-cx reg[1],reg[0];
-rz(-pi/2) reg[0];
-sx reg[0];
-rz(-pi/2) reg[0];
-cx reg[4],reg[1];
-cx reg[5],reg[4];
-rz(-pi/2) reg[4];
-sx reg[4];
-rz(-pi/2) reg[4];
-cx reg[5],reg[4];
-cx reg[4],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(1.150055) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[4],reg[2];
-cx reg[5],reg[4];
-rz(-pi/2) reg[4];
-sx reg[4];
-rz(-pi/2) reg[4];
-cx reg[6],reg[5];
-rz(-pi/2) reg[6];
-sx reg[6];
-rz(-pi/2) reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(1.150055) reg[0];
-cx reg[1],reg[0];
-rz(-pi/2) reg[0];
-sx reg[0];
-rz(-pi/2) reg[0];
-cx reg[2],reg[1];
-cx reg[4],reg[2];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-rz(-pi/2) reg[6];
-sx reg[6];
-rz(-pi/2) reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(1.150055) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[4],reg[2];
-cx reg[5],reg[4];
-rz(-pi/2) reg[4];
-sx reg[4];
-rz(-pi/2) reg[4];
-cx reg[6],reg[5];
-rz(-pi/2) reg[6];
-sx reg[6];
-rz(-pi/2) reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(1.150055) reg[0];
-cx reg[1],reg[0];
-rz(-pi/2) reg[0];
-sx reg[0];
-rz(-pi/2) reg[0];
-cx reg[2],reg[1];
-cx reg[4],reg[2];
-cx reg[5],reg[4];
-rz(-pi/2) reg[4];
-sx reg[4];
-rz(-pi/2) reg[4];
-cx reg[5],reg[4];
-cx reg[4],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(1.150055) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[4],reg[2];
-cx reg[5],reg[4];
-rz(-pi/2) reg[4];
-sx reg[4];
-rz(-pi/2) reg[4];
-cx reg[6],reg[5];
-rz(-pi/2) reg[6];
-sx reg[6];
-rz(-pi/2) reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(1.150055) reg[0];
-cx reg[1],reg[0];
-rz(-pi/2) reg[0];
-sx reg[0];
-rz(-pi/2) reg[0];
-cx reg[2],reg[1];
-cx reg[4],reg[2];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-rz(-pi/2) reg[6];
-sx reg[6];
-rz(-pi/2) reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(1.150055) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[4],reg[2];
-cx reg[5],reg[4];
-rz(-pi/2) reg[4];
-sx reg[4];
-rz(-pi/2) reg[4];
-cx reg[6],reg[5];
-rz(-pi/2) reg[6];
-sx reg[6];
-rz(-pi/2) reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(1.150055) reg[0];
-cx reg[1],reg[0];
-rz(-pi/2) reg[0];
-sx reg[0];
-rz(-pi/2) reg[0];
-cx reg[2],reg[1];
-cx reg[4],reg[2];
-cx reg[5],reg[4];
-rz(-pi/2) reg[4];
-sx reg[4];
-rz(-pi/2) reg[4];
-cx reg[5],reg[4];
-cx reg[4],reg[2];
-cx reg[2],reg[1];
-rz(5.886901) reg[1];
-cx reg[2],reg[1];
-cx reg[4],reg[2];
-cx reg[5],reg[4];
-rz(-pi/2) reg[4];
-sx reg[4];
-rz(-pi/2) reg[4];
-cx reg[6],reg[5];
-rz(-pi/2) reg[6];
-sx reg[6];
-rz(-pi/2) reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[2];
-cx reg[2],reg[1];
-rz(5.886901) reg[1];
-cx reg[2],reg[1];
-rz(-pi/2) reg[1];
-sx reg[1];
-rz(-pi/2) reg[1];
-cx reg[4],reg[2];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-rz(-pi/2) reg[6];
-sx reg[6];
-rz(-pi/2) reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[2];
-cx reg[2],reg[1];
-rz(5.886901) reg[1];
-cx reg[2],reg[1];
-cx reg[4],reg[2];
-cx reg[5],reg[4];
-rz(-pi/2) reg[4];
-sx reg[4];
-rz(-pi/2) reg[4];
-cx reg[6],reg[5];
-rz(-pi/2) reg[6];
-sx reg[6];
-rz(-pi/2) reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[2];
-cx reg[2],reg[1];
-rz(5.886901) reg[1];
-cx reg[2],reg[1];
-rz(-pi/2) reg[1];
-sx reg[1];
-rz(-pi/2) reg[1];
-cx reg[4],reg[2];
-cx reg[5],reg[4];
-rz(-pi/2) reg[4];
-sx reg[4];
-rz(-pi/2) reg[4];
-cx reg[5],reg[4];
-cx reg[4],reg[2];
-cx reg[2],reg[1];
-rz(5.886901) reg[1];
-cx reg[2],reg[1];
-cx reg[4],reg[2];
-cx reg[5],reg[4];
-rz(-pi/2) reg[4];
-sx reg[4];
-rz(-pi/2) reg[4];
-cx reg[6],reg[5];
-rz(-pi/2) reg[6];
-sx reg[6];
-rz(-pi/2) reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[2];
-cx reg[2],reg[1];
-rz(5.886901) reg[1];
-cx reg[2],reg[1];
-rz(-pi/2) reg[1];
-sx reg[1];
-rz(-pi/2) reg[1];
-cx reg[4],reg[2];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-rz(-pi/2) reg[6];
-sx reg[6];
-rz(-pi/2) reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[2];
-cx reg[2],reg[1];
-rz(5.886901) reg[1];
-cx reg[2],reg[1];
-cx reg[4],reg[2];
-cx reg[5],reg[4];
-rz(-pi/2) reg[4];
-sx reg[4];
-rz(-pi/2) reg[4];
-cx reg[6],reg[5];
-rz(-pi/2) reg[6];
-sx reg[6];
-rz(-pi/2) reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[2];
-cx reg[2],reg[1];
-rz(5.886901) reg[1];
-cx reg[2],reg[1];
-rz(-pi/2) reg[1];
-sx reg[1];
-rz(-pi/2) reg[1];
-cx reg[4],reg[2];
-cx reg[5],reg[4];
-rz(-pi/2) reg[4];
-sx reg[4];
-rz(-pi/2) reg[4];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(0.1612143) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-rz(-pi/2) reg[4];
-sx reg[4];
-rz(-pi/2) reg[4];
-cx reg[6],reg[5];
-rz(-pi/2) reg[6];
-sx reg[6];
-rz(-pi/2) reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(0.1612143) reg[0];
-cx reg[1],reg[0];
-rz(-pi/2) reg[0];
-sx reg[0];
-rz(-pi/2) reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-rz(-pi/2) reg[6];
-sx reg[6];
-rz(-pi/2) reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(0.1612143) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-rz(-pi/2) reg[4];
-sx reg[4];
-rz(-pi/2) reg[4];
-cx reg[6],reg[5];
-rz(-pi/2) reg[6];
-sx reg[6];
-rz(-pi/2) reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(0.1612143) reg[0];
-cx reg[1],reg[0];
-rz(-pi/2) reg[0];
-sx reg[0];
-rz(-pi/2) reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-rz(-pi/2) reg[4];
-sx reg[4];
-rz(-pi/2) reg[4];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(0.1612143) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-rz(-pi/2) reg[4];
-sx reg[4];
-rz(-pi/2) reg[4];
-cx reg[6],reg[5];
-rz(-pi/2) reg[6];
-sx reg[6];
-rz(-pi/2) reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(0.1612143) reg[0];
-cx reg[1],reg[0];
-rz(-pi/2) reg[0];
-sx reg[0];
-rz(-pi/2) reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-rz(-pi/2) reg[6];
-sx reg[6];
-rz(-pi/2) reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(0.1612143) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-rz(-pi/2) reg[4];
-sx reg[4];
-rz(-pi/2) reg[4];
-cx reg[6],reg[5];
-rz(-pi/2) reg[6];
-sx reg[6];
-rz(-pi/2) reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(0.1612143) reg[0];
-cx reg[1],reg[0];
-rz(-pi/2) reg[0];
-sx reg[0];
-rz(-pi/2) reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-rz(-pi/2) reg[4];
-sx reg[4];
-rz(-pi/2) reg[4];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-rz(1.36769) reg[1];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-rz(-pi/2) reg[4];
-sx reg[4];
-rz(-pi/2) reg[4];
-cx reg[6],reg[5];
-rz(-pi/2) reg[6];
-sx reg[6];
-rz(-pi/2) reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-rz(1.36769) reg[1];
-cx reg[2],reg[1];
-rz(-pi/2) reg[1];
-sx reg[1];
-rz(-pi/2) reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-rz(-pi/2) reg[6];
-sx reg[6];
-rz(-pi/2) reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-rz(1.36769) reg[1];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-rz(-pi/2) reg[4];
-sx reg[4];
-rz(-pi/2) reg[4];
-cx reg[6],reg[5];
-rz(-pi/2) reg[6];
-sx reg[6];
-rz(-pi/2) reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-rz(1.36769) reg[1];
-cx reg[2],reg[1];
-rz(-pi/2) reg[1];
-sx reg[1];
-rz(-pi/2) reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-rz(-pi/2) reg[4];
-sx reg[4];
-rz(-pi/2) reg[4];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-rz(1.36769) reg[1];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-rz(-pi/2) reg[4];
-sx reg[4];
-rz(-pi/2) reg[4];
-cx reg[6],reg[5];
-rz(-pi/2) reg[6];
-sx reg[6];
-rz(-pi/2) reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-rz(1.36769) reg[1];
-cx reg[2],reg[1];
-rz(-pi/2) reg[1];
-sx reg[1];
-rz(-pi/2) reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-rz(-pi/2) reg[6];
-sx reg[6];
-rz(-pi/2) reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-rz(1.36769) reg[1];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-rz(-pi/2) reg[4];
-sx reg[4];
-rz(-pi/2) reg[4];
-cx reg[6],reg[5];
-rz(-pi/2) reg[6];
-sx reg[6];
-rz(-pi/2) reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-rz(1.36769) reg[1];
-cx reg[2],reg[1];
-rz(-pi/2) reg[1];
-sx reg[1];
-rz(-pi/2) reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-rz(-pi/2) reg[4];
-sx reg[4];
-rz(-pi/2) reg[4];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-rz(4.481711) reg[2];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-rz(-pi/2) reg[4];
-sx reg[4];
-rz(-pi/2) reg[4];
-cx reg[6],reg[5];
-rz(-pi/2) reg[6];
-sx reg[6];
-rz(-pi/2) reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-rz(4.481711) reg[2];
-cx reg[3],reg[2];
-rz(-pi/2) reg[2];
-sx reg[2];
-rz(-pi/2) reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-rz(-pi/2) reg[6];
-sx reg[6];
-rz(-pi/2) reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-rz(4.481711) reg[2];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-rz(-pi/2) reg[4];
-sx reg[4];
-rz(-pi/2) reg[4];
-cx reg[6],reg[5];
-rz(-pi/2) reg[6];
-sx reg[6];
-rz(-pi/2) reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-rz(4.481711) reg[2];
-cx reg[3],reg[2];
-rz(-pi/2) reg[2];
-sx reg[2];
-rz(-pi/2) reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-rz(-pi/2) reg[4];
-sx reg[4];
-rz(-pi/2) reg[4];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-rz(4.481711) reg[2];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-rz(-pi/2) reg[4];
-sx reg[4];
-rz(-pi/2) reg[4];
-cx reg[6],reg[5];
-rz(-pi/2) reg[6];
-sx reg[6];
-rz(-pi/2) reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-rz(4.481711) reg[2];
-cx reg[3],reg[2];
-rz(-pi/2) reg[2];
-sx reg[2];
-rz(-pi/2) reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-rz(-pi/2) reg[6];
-sx reg[6];
-rz(-pi/2) reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-rz(4.481711) reg[2];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-rz(-pi/2) reg[4];
-sx reg[4];
-rz(-pi/2) reg[4];
-cx reg[6],reg[5];
-rz(-pi/2) reg[6];
-sx reg[6];
-rz(-pi/2) reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-rz(4.481711) reg[2];
-cx reg[3],reg[2];
-rz(-pi/2) reg[2];
-sx reg[2];
-rz(-pi/2) reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-rz(-pi) reg[4];
-x reg[4];
-cx reg[6],reg[5];
-rz(pi/2) reg[5];
-sx reg[5];
-rz(pi/2) reg[5];
-cx reg[6],reg[5];
-cx reg[5],reg[1];
-cx reg[1],reg[0];
-rz(0.3846725) reg[0];
-cx reg[1],reg[0];
-cx reg[5],reg[1];
-cx reg[6],reg[5];
-rz(-pi/2) reg[5];
-sx reg[5];
-rz(-pi/2) reg[5];
-rz(-pi/2) reg[6];
-sx reg[6];
-rz(-pi/2) reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[1];
-cx reg[1],reg[0];
-rz(0.3846725) reg[0];
-cx reg[1],reg[0];
-rz(-pi/2) reg[0];
-sx reg[0];
-rz(-pi/2) reg[0];
-cx reg[5],reg[1];
-cx reg[6],reg[5];
-rz(-pi/2) reg[6];
-sx reg[6];
-rz(-pi/2) reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[1];
-cx reg[1],reg[0];
-rz(0.3846725) reg[0];
-cx reg[1],reg[0];
-cx reg[5],reg[1];
-cx reg[6],reg[5];
-rz(-pi/2) reg[5];
-sx reg[5];
-rz(-pi/2) reg[5];
-rz(-pi/2) reg[6];
-sx reg[6];
-rz(-pi/2) reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[1];
-cx reg[1],reg[0];
-rz(0.3846725) reg[0];
-cx reg[1],reg[0];
-rz(-pi/2) reg[0];
-sx reg[0];
-rz(-pi/2) reg[0];
-cx reg[5],reg[1];
-cx reg[6],reg[5];
-rz(-pi/2) reg[5];
-sx reg[5];
-rz(-pi/2) reg[5];
-cx reg[6],reg[5];
-cx reg[5],reg[1];
-cx reg[1],reg[0];
-rz(0.3846725) reg[0];
-cx reg[1],reg[0];
-cx reg[5],reg[1];
-cx reg[6],reg[5];
-rz(-pi/2) reg[5];
-sx reg[5];
-rz(-pi/2) reg[5];
-rz(-pi/2) reg[6];
-sx reg[6];
-rz(-pi/2) reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[1];
-cx reg[1],reg[0];
-rz(0.3846725) reg[0];
-cx reg[1],reg[0];
-rz(-pi/2) reg[0];
-sx reg[0];
-rz(-pi/2) reg[0];
-cx reg[5],reg[1];
-cx reg[6],reg[5];
-rz(-pi/2) reg[6];
-sx reg[6];
-rz(-pi/2) reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[1];
-cx reg[1],reg[0];
-rz(0.3846725) reg[0];
-cx reg[1],reg[0];
-cx reg[5],reg[1];
-cx reg[6],reg[5];
-rz(-pi/2) reg[5];
-sx reg[5];
-rz(-pi/2) reg[5];
-rz(-pi/2) reg[6];
-sx reg[6];
-rz(-pi/2) reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[1];
-cx reg[1],reg[0];
-rz(0.3846725) reg[0];
-cx reg[1],reg[0];
-rz(-pi/2) reg[0];
-sx reg[0];
-rz(-pi/2) reg[0];
-cx reg[5],reg[1];
-cx reg[6],reg[5];
-rz(-pi/2) reg[5];
-sx reg[5];
-rz(-pi/2) reg[5];
-cx reg[6],reg[5];
-cx reg[5],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(4.746693) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[5],reg[2];
-cx reg[6],reg[5];
-rz(-pi/2) reg[5];
-sx reg[5];
-rz(-pi/2) reg[5];
-rz(-pi/2) reg[6];
-sx reg[6];
-rz(-pi/2) reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(4.746693) reg[0];
-cx reg[1],reg[0];
-rz(-pi/2) reg[0];
-sx reg[0];
-rz(-pi/2) reg[0];
-cx reg[2],reg[1];
-cx reg[5],reg[2];
-cx reg[6],reg[5];
-rz(-pi/2) reg[6];
-sx reg[6];
-rz(-pi/2) reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(4.746693) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[5],reg[2];
-cx reg[6],reg[5];
-rz(-pi/2) reg[5];
-sx reg[5];
-rz(-pi/2) reg[5];
-rz(-pi/2) reg[6];
-sx reg[6];
-rz(-pi/2) reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(4.746693) reg[0];
-cx reg[1],reg[0];
-rz(-pi/2) reg[0];
-sx reg[0];
-rz(-pi/2) reg[0];
-cx reg[2],reg[1];
-cx reg[5],reg[2];
-cx reg[6],reg[5];
-rz(-pi/2) reg[5];
-sx reg[5];
-rz(-pi/2) reg[5];
-cx reg[6],reg[5];
-cx reg[5],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(4.746693) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[5],reg[2];
-cx reg[6],reg[5];
-rz(-pi/2) reg[5];
-sx reg[5];
-rz(-pi/2) reg[5];
-rz(-pi/2) reg[6];
-sx reg[6];
-rz(-pi/2) reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(4.746693) reg[0];
-cx reg[1],reg[0];
-rz(-pi/2) reg[0];
-sx reg[0];
-rz(-pi/2) reg[0];
-cx reg[2],reg[1];
-cx reg[5],reg[2];
-cx reg[6],reg[5];
-rz(-pi/2) reg[6];
-sx reg[6];
-rz(-pi/2) reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(4.746693) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[5],reg[2];
-cx reg[6],reg[5];
-rz(-pi/2) reg[5];
-sx reg[5];
-rz(-pi/2) reg[5];
-rz(-pi/2) reg[6];
-sx reg[6];
-rz(-pi/2) reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(4.746693) reg[0];
-cx reg[1],reg[0];
-rz(-pi/2) reg[0];
-sx reg[0];
-rz(-pi/2) reg[0];
-cx reg[2],reg[1];
-cx reg[5],reg[2];
-cx reg[6],reg[5];
-rz(-pi/2) reg[5];
-sx reg[5];
-rz(-pi/2) reg[5];
-cx reg[6],reg[5];
-cx reg[5],reg[2];
-cx reg[2],reg[1];
-rz(1.945438) reg[1];
-cx reg[2],reg[1];
-cx reg[5],reg[2];
-cx reg[6],reg[5];
-rz(-pi/2) reg[5];
-sx reg[5];
-rz(-pi/2) reg[5];
-rz(-pi/2) reg[6];
-sx reg[6];
-rz(-pi/2) reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[2];
-cx reg[2],reg[1];
-rz(1.945438) reg[1];
-cx reg[2],reg[1];
-rz(-pi/2) reg[1];
-sx reg[1];
-rz(-pi/2) reg[1];
-cx reg[5],reg[2];
-cx reg[6],reg[5];
-rz(-pi/2) reg[6];
-sx reg[6];
-rz(-pi/2) reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[2];
-cx reg[2],reg[1];
-rz(1.945438) reg[1];
-cx reg[2],reg[1];
-cx reg[5],reg[2];
-cx reg[6],reg[5];
-rz(-pi/2) reg[5];
-sx reg[5];
-rz(-pi/2) reg[5];
-rz(-pi/2) reg[6];
-sx reg[6];
-rz(-pi/2) reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[2];
-cx reg[2],reg[1];
-rz(1.945438) reg[1];
-cx reg[2],reg[1];
-rz(-pi/2) reg[1];
-sx reg[1];
-rz(-pi/2) reg[1];
-cx reg[5],reg[2];
-cx reg[6],reg[5];
-rz(-pi/2) reg[5];
-sx reg[5];
-rz(-pi/2) reg[5];
-cx reg[6],reg[5];
-cx reg[5],reg[2];
-cx reg[2],reg[1];
-rz(1.945438) reg[1];
-cx reg[2],reg[1];
-cx reg[5],reg[2];
-cx reg[6],reg[5];
-rz(-pi/2) reg[5];
-sx reg[5];
-rz(-pi/2) reg[5];
-rz(-pi/2) reg[6];
-sx reg[6];
-rz(-pi/2) reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[2];
-cx reg[2],reg[1];
-rz(1.945438) reg[1];
-cx reg[2],reg[1];
-rz(-pi/2) reg[1];
-sx reg[1];
-rz(-pi/2) reg[1];
-cx reg[5],reg[2];
-cx reg[6],reg[5];
-rz(-pi/2) reg[6];
-sx reg[6];
-rz(-pi/2) reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[2];
-cx reg[2],reg[1];
-rz(1.945438) reg[1];
-cx reg[2],reg[1];
-cx reg[5],reg[2];
-cx reg[6],reg[5];
-rz(-pi/2) reg[5];
-sx reg[5];
-rz(-pi/2) reg[5];
-rz(-pi/2) reg[6];
-sx reg[6];
-rz(-pi/2) reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[2];
-cx reg[2],reg[1];
-rz(1.945438) reg[1];
-cx reg[2],reg[1];
-rz(-pi/2) reg[1];
-sx reg[1];
-rz(-pi/2) reg[1];
-cx reg[5],reg[2];
-cx reg[6],reg[5];
-rz(-pi/2) reg[5];
-sx reg[5];
-rz(-pi/2) reg[5];
-cx reg[6],reg[5];
-cx reg[5],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(2.899853) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[5],reg[3];
-cx reg[6],reg[5];
-rz(-pi/2) reg[5];
-sx reg[5];
-rz(-pi/2) reg[5];
-rz(-pi/2) reg[6];
-sx reg[6];
-rz(-pi/2) reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(2.899853) reg[0];
-cx reg[1],reg[0];
-rz(-pi/2) reg[0];
-sx reg[0];
-rz(-pi/2) reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[5],reg[3];
-cx reg[6],reg[5];
-rz(-pi/2) reg[6];
-sx reg[6];
-rz(-pi/2) reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(2.899853) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[5],reg[3];
-cx reg[6],reg[5];
-rz(-pi/2) reg[5];
-sx reg[5];
-rz(-pi/2) reg[5];
-rz(-pi/2) reg[6];
-sx reg[6];
-rz(-pi/2) reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(2.899853) reg[0];
-cx reg[1],reg[0];
-rz(-pi/2) reg[0];
-sx reg[0];
-rz(-pi/2) reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[5],reg[3];
-cx reg[6],reg[5];
-rz(-pi/2) reg[5];
-sx reg[5];
-rz(-pi/2) reg[5];
-cx reg[6],reg[5];
-cx reg[5],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(2.899853) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[5],reg[3];
-cx reg[6],reg[5];
-rz(-pi/2) reg[5];
-sx reg[5];
-rz(-pi/2) reg[5];
-rz(-pi/2) reg[6];
-sx reg[6];
-rz(-pi/2) reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(2.899853) reg[0];
-cx reg[1],reg[0];
-rz(-pi/2) reg[0];
-sx reg[0];
-rz(-pi/2) reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[5],reg[3];
-cx reg[6],reg[5];
-rz(-pi/2) reg[6];
-sx reg[6];
-rz(-pi/2) reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(2.899853) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[5],reg[3];
-cx reg[6],reg[5];
-rz(-pi/2) reg[5];
-sx reg[5];
-rz(-pi/2) reg[5];
-rz(-pi/2) reg[6];
-sx reg[6];
-rz(-pi/2) reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(2.899853) reg[0];
-cx reg[1],reg[0];
-rz(-pi/2) reg[0];
-sx reg[0];
-rz(-pi/2) reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[5],reg[3];
-cx reg[6],reg[5];
-rz(-pi/2) reg[5];
-sx reg[5];
-rz(-pi/2) reg[5];
-cx reg[6],reg[5];
-cx reg[5],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-rz(1.523242) reg[1];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[5],reg[3];
-cx reg[6],reg[5];
-rz(-pi/2) reg[5];
-sx reg[5];
-rz(-pi/2) reg[5];
-rz(-pi/2) reg[6];
-sx reg[6];
-rz(-pi/2) reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-rz(1.523242) reg[1];
-cx reg[2],reg[1];
-rz(-pi/2) reg[1];
-sx reg[1];
-rz(-pi/2) reg[1];
-cx reg[3],reg[2];
-cx reg[5],reg[3];
-cx reg[6],reg[5];
-rz(-pi/2) reg[6];
-sx reg[6];
-rz(-pi/2) reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-rz(1.523242) reg[1];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[5],reg[3];
-cx reg[6],reg[5];
-rz(-pi/2) reg[5];
-sx reg[5];
-rz(-pi/2) reg[5];
-rz(-pi/2) reg[6];
-sx reg[6];
-rz(-pi/2) reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-rz(1.523242) reg[1];
-cx reg[2],reg[1];
-rz(-pi/2) reg[1];
-sx reg[1];
-rz(-pi/2) reg[1];
-cx reg[3],reg[2];
-cx reg[5],reg[3];
-cx reg[6],reg[5];
-rz(-pi/2) reg[5];
-sx reg[5];
-rz(-pi/2) reg[5];
-cx reg[6],reg[5];
-cx reg[5],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-rz(1.523242) reg[1];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[5],reg[3];
-cx reg[6],reg[5];
-rz(-pi/2) reg[5];
-sx reg[5];
-rz(-pi/2) reg[5];
-rz(-pi/2) reg[6];
-sx reg[6];
-rz(-pi/2) reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-rz(1.523242) reg[1];
-cx reg[2],reg[1];
-rz(-pi/2) reg[1];
-sx reg[1];
-rz(-pi/2) reg[1];
-cx reg[3],reg[2];
-cx reg[5],reg[3];
-cx reg[6],reg[5];
-rz(-pi/2) reg[6];
-sx reg[6];
-rz(-pi/2) reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-rz(1.523242) reg[1];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[5],reg[3];
-cx reg[6],reg[5];
-rz(-pi/2) reg[5];
-sx reg[5];
-rz(-pi/2) reg[5];
-rz(-pi/2) reg[6];
-sx reg[6];
-rz(-pi/2) reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-rz(1.523242) reg[1];
-cx reg[2],reg[1];
-rz(-pi/2) reg[1];
-sx reg[1];
-rz(-pi/2) reg[1];
-cx reg[3],reg[2];
-cx reg[5],reg[3];
-cx reg[6],reg[5];
-rz(-pi/2) reg[5];
-sx reg[5];
-rz(-pi/2) reg[5];
-cx reg[6],reg[5];
-cx reg[5],reg[3];
-cx reg[3],reg[2];
-rz(0.9439592) reg[2];
-cx reg[3],reg[2];
-cx reg[5],reg[3];
-cx reg[6],reg[5];
-rz(-pi/2) reg[5];
-sx reg[5];
-rz(-pi/2) reg[5];
-rz(-pi/2) reg[6];
-sx reg[6];
-rz(-pi/2) reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[3];
-cx reg[3],reg[2];
-rz(0.9439592) reg[2];
-cx reg[3],reg[2];
-rz(-pi/2) reg[2];
-sx reg[2];
-rz(-pi/2) reg[2];
-cx reg[5],reg[3];
-cx reg[6],reg[5];
-rz(-pi/2) reg[6];
-sx reg[6];
-rz(-pi/2) reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[3];
-cx reg[3],reg[2];
-rz(0.9439592) reg[2];
-cx reg[3],reg[2];
-cx reg[5],reg[3];
-cx reg[6],reg[5];
-rz(-pi/2) reg[5];
-sx reg[5];
-rz(-pi/2) reg[5];
-rz(-pi/2) reg[6];
-sx reg[6];
-rz(-pi/2) reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[3];
-cx reg[3],reg[2];
-rz(0.9439592) reg[2];
-cx reg[3],reg[2];
-rz(-pi/2) reg[2];
-sx reg[2];
-rz(-pi/2) reg[2];
-cx reg[5],reg[3];
-cx reg[6],reg[5];
-rz(-pi/2) reg[5];
-sx reg[5];
-rz(-pi/2) reg[5];
-cx reg[6],reg[5];
-cx reg[5],reg[3];
-cx reg[3],reg[2];
-rz(0.9439592) reg[2];
-cx reg[3],reg[2];
-cx reg[5],reg[3];
-cx reg[6],reg[5];
-rz(-pi/2) reg[5];
-sx reg[5];
-rz(-pi/2) reg[5];
-rz(-pi/2) reg[6];
-sx reg[6];
-rz(-pi/2) reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[3];
-cx reg[3],reg[2];
-rz(0.9439592) reg[2];
-cx reg[3],reg[2];
-rz(-pi/2) reg[2];
-sx reg[2];
-rz(-pi/2) reg[2];
-cx reg[5],reg[3];
-cx reg[6],reg[5];
-rz(-pi/2) reg[6];
-sx reg[6];
-rz(-pi/2) reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[3];
-cx reg[3],reg[2];
-rz(0.9439592) reg[2];
-cx reg[3],reg[2];
-cx reg[5],reg[3];
-cx reg[6],reg[5];
-rz(-pi/2) reg[5];
-sx reg[5];
-rz(-pi/2) reg[5];
-rz(-pi/2) reg[6];
-sx reg[6];
-rz(-pi/2) reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[3];
-cx reg[3],reg[2];
-rz(0.9439592) reg[2];
-cx reg[3],reg[2];
-rz(-pi/2) reg[2];
-sx reg[2];
-rz(-pi/2) reg[2];
-cx reg[5],reg[3];
-cx reg[6],reg[5];
-rz(-pi/2) reg[5];
-sx reg[5];
-rz(-pi/2) reg[5];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(3.380417) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-rz(-pi/2) reg[5];
-sx reg[5];
-rz(-pi/2) reg[5];
-rz(-pi/2) reg[6];
-sx reg[6];
-rz(-pi/2) reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(3.380417) reg[0];
-cx reg[1],reg[0];
-rz(-pi/2) reg[0];
-sx reg[0];
-rz(-pi/2) reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-rz(-pi/2) reg[6];
-sx reg[6];
-rz(-pi/2) reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(3.380417) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-rz(-pi/2) reg[5];
-sx reg[5];
-rz(-pi/2) reg[5];
-rz(-pi/2) reg[6];
-sx reg[6];
-rz(-pi/2) reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(3.380417) reg[0];
-cx reg[1],reg[0];
-rz(-pi/2) reg[0];
-sx reg[0];
-rz(-pi/2) reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-rz(-pi/2) reg[5];
-sx reg[5];
-rz(-pi/2) reg[5];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(3.380417) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-rz(-pi/2) reg[5];
-sx reg[5];
-rz(-pi/2) reg[5];
-rz(-pi/2) reg[6];
-sx reg[6];
-rz(-pi/2) reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(3.380417) reg[0];
-cx reg[1],reg[0];
-rz(-pi/2) reg[0];
-sx reg[0];
-rz(-pi/2) reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-rz(-pi/2) reg[6];
-sx reg[6];
-rz(-pi/2) reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(3.380417) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-rz(-pi/2) reg[5];
-sx reg[5];
-rz(-pi/2) reg[5];
-rz(-pi/2) reg[6];
-sx reg[6];
-rz(-pi/2) reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(3.380417) reg[0];
-cx reg[1],reg[0];
-rz(-pi/2) reg[0];
-sx reg[0];
-rz(-pi/2) reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-rz(-pi/2) reg[5];
-sx reg[5];
-rz(-pi/2) reg[5];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-rz(4.625813) reg[1];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-rz(-pi/2) reg[5];
-sx reg[5];
-rz(-pi/2) reg[5];
-rz(-pi/2) reg[6];
-sx reg[6];
-rz(-pi/2) reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-rz(4.625813) reg[1];
-cx reg[2],reg[1];
-rz(-pi/2) reg[1];
-sx reg[1];
-rz(-pi/2) reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-rz(-pi/2) reg[6];
-sx reg[6];
-rz(-pi/2) reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-rz(4.625813) reg[1];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-rz(-pi/2) reg[5];
-sx reg[5];
-rz(-pi/2) reg[5];
-rz(-pi/2) reg[6];
-sx reg[6];
-rz(-pi/2) reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-rz(4.625813) reg[1];
-cx reg[2],reg[1];
-rz(-pi/2) reg[1];
-sx reg[1];
-rz(-pi/2) reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-rz(-pi/2) reg[5];
-sx reg[5];
-rz(-pi/2) reg[5];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-rz(4.625813) reg[1];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-rz(-pi/2) reg[5];
-sx reg[5];
-rz(-pi/2) reg[5];
-rz(-pi/2) reg[6];
-sx reg[6];
-rz(-pi/2) reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-rz(4.625813) reg[1];
-cx reg[2],reg[1];
-rz(-pi/2) reg[1];
-sx reg[1];
-rz(-pi/2) reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-rz(-pi/2) reg[6];
-sx reg[6];
-rz(-pi/2) reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-rz(4.625813) reg[1];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-rz(-pi/2) reg[5];
-sx reg[5];
-rz(-pi/2) reg[5];
-rz(-pi/2) reg[6];
-sx reg[6];
-rz(-pi/2) reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-rz(4.625813) reg[1];
-cx reg[2],reg[1];
-rz(-pi/2) reg[1];
-sx reg[1];
-rz(-pi/2) reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-rz(-pi/2) reg[5];
-sx reg[5];
-rz(-pi/2) reg[5];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-rz(1.281574) reg[2];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-rz(-pi/2) reg[5];
-sx reg[5];
-rz(-pi/2) reg[5];
-rz(-pi/2) reg[6];
-sx reg[6];
-rz(-pi/2) reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-rz(1.281574) reg[2];
-cx reg[3],reg[2];
-rz(-pi/2) reg[2];
-sx reg[2];
-rz(-pi/2) reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-rz(-pi/2) reg[6];
-sx reg[6];
-rz(-pi/2) reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-rz(1.281574) reg[2];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-rz(-pi/2) reg[5];
-sx reg[5];
-rz(-pi/2) reg[5];
-rz(-pi/2) reg[6];
-sx reg[6];
-rz(-pi/2) reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-rz(1.281574) reg[2];
-cx reg[3],reg[2];
-rz(-pi/2) reg[2];
-sx reg[2];
-rz(-pi/2) reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-rz(-pi/2) reg[5];
-sx reg[5];
-rz(-pi/2) reg[5];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-rz(1.281574) reg[2];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-rz(-pi/2) reg[5];
-sx reg[5];
-rz(-pi/2) reg[5];
-rz(-pi/2) reg[6];
-sx reg[6];
-rz(-pi/2) reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-rz(1.281574) reg[2];
-cx reg[3],reg[2];
-rz(-pi/2) reg[2];
-sx reg[2];
-rz(-pi/2) reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-rz(-pi/2) reg[6];
-sx reg[6];
-rz(-pi/2) reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-rz(1.281574) reg[2];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-rz(-pi/2) reg[5];
-sx reg[5];
-rz(-pi/2) reg[5];
-rz(-pi/2) reg[6];
-sx reg[6];
-rz(-pi/2) reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-rz(1.281574) reg[2];
-cx reg[3],reg[2];
-rz(-pi) reg[2];
-x reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-rz(-pi/2) reg[5];
-sx reg[5];
-rz(-pi/2) reg[5];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-rz(3.22988) reg[3];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-rz(-pi/2) reg[5];
-sx reg[5];
-rz(-pi/2) reg[5];
-rz(-pi/2) reg[6];
-sx reg[6];
-rz(-pi/2) reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-rz(3.22988) reg[3];
-cx reg[4],reg[3];
-rz(-pi/2) reg[3];
-sx reg[3];
-rz(-pi/2) reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-rz(-pi/2) reg[6];
-sx reg[6];
-rz(-pi/2) reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-rz(3.22988) reg[3];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-rz(-pi/2) reg[5];
-sx reg[5];
-rz(-pi/2) reg[5];
-rz(-pi/2) reg[6];
-sx reg[6];
-rz(-pi/2) reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-rz(3.22988) reg[3];
-cx reg[4],reg[3];
-rz(-pi/2) reg[3];
-sx reg[3];
-rz(-pi/2) reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-rz(-pi/2) reg[5];
-sx reg[5];
-rz(-pi/2) reg[5];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-rz(3.22988) reg[3];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-rz(-pi/2) reg[5];
-sx reg[5];
-rz(-pi/2) reg[5];
-rz(-pi/2) reg[6];
-sx reg[6];
-rz(-pi/2) reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-rz(3.22988) reg[3];
-cx reg[4],reg[3];
-rz(-pi/2) reg[3];
-sx reg[3];
-rz(-pi/2) reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-rz(-pi/2) reg[6];
-sx reg[6];
-rz(-pi/2) reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-rz(3.22988) reg[3];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-rz(-pi/2) reg[5];
-sx reg[5];
-rz(-pi/2) reg[5];
-rz(-pi/2) reg[6];
-sx reg[6];
-rz(-pi/2) reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-rz(3.22988) reg[3];
-cx reg[4],reg[3];
-rz(-pi/2) reg[3];
-sx reg[3];
-rz(-pi/2) reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-rz(-pi) reg[5];
-x reg[5];
-rz(pi/2) reg[6];
-sx reg[6];
-rz(pi/2) reg[6];
-rz(pi/2) reg[7];
-sx reg[7];
-rz(pi/2) reg[7];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(6.152348) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-rz(-pi/2) reg[2];
-sx reg[2];
-rz(-pi/2) reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-rz(-pi/2) reg[7];
-sx reg[7];
-rz(-pi/2) reg[7];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(6.152348) reg[0];
-cx reg[1],reg[0];
-rz(-pi/2) reg[0];
-sx reg[0];
-rz(-pi/2) reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-rz(-pi/2) reg[7];
-sx reg[7];
-rz(-pi/2) reg[7];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(6.152348) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-rz(-pi/2) reg[2];
-sx reg[2];
-rz(-pi/2) reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-rz(-pi/2) reg[7];
-sx reg[7];
-rz(-pi/2) reg[7];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(6.152348) reg[0];
-cx reg[1],reg[0];
-rz(-pi/2) reg[0];
-sx reg[0];
-rz(-pi/2) reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-rz(-pi/2) reg[2];
-sx reg[2];
-rz(-pi/2) reg[2];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(6.152348) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-rz(-pi/2) reg[2];
-sx reg[2];
-rz(-pi/2) reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-rz(-pi/2) reg[7];
-sx reg[7];
-rz(-pi/2) reg[7];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(6.152348) reg[0];
-cx reg[1],reg[0];
-rz(-pi/2) reg[0];
-sx reg[0];
-rz(-pi/2) reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-rz(-pi/2) reg[7];
-sx reg[7];
-rz(-pi/2) reg[7];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(6.152348) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-rz(-pi/2) reg[2];
-sx reg[2];
-rz(-pi/2) reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-rz(-pi/2) reg[7];
-sx reg[7];
-rz(-pi/2) reg[7];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(6.152348) reg[0];
-cx reg[1],reg[0];
-rz(-pi/2) reg[0];
-sx reg[0];
-rz(-pi/2) reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-rz(-pi) reg[2];
-x reg[2];
-cx reg[4],reg[3];
-rz(pi/2) reg[3];
-sx reg[3];
-rz(pi/2) reg[3];
-cx reg[4],reg[3];
-cx reg[3],reg[1];
-cx reg[1],reg[0];
-rz(5.685957) reg[0];
-cx reg[1],reg[0];
-cx reg[3],reg[1];
-cx reg[4],reg[3];
-rz(-pi/2) reg[3];
-sx reg[3];
-rz(-pi/2) reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-rz(-pi/2) reg[7];
-sx reg[7];
-rz(-pi/2) reg[7];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[1];
-cx reg[1],reg[0];
-rz(5.685957) reg[0];
-cx reg[1],reg[0];
-rz(-pi/2) reg[0];
-sx reg[0];
-rz(-pi/2) reg[0];
-cx reg[3],reg[1];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-rz(-pi/2) reg[7];
-sx reg[7];
-rz(-pi/2) reg[7];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[1];
-cx reg[1],reg[0];
-rz(5.685957) reg[0];
-cx reg[1],reg[0];
-cx reg[3],reg[1];
-cx reg[4],reg[3];
-rz(-pi/2) reg[3];
-sx reg[3];
-rz(-pi/2) reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-rz(-pi/2) reg[7];
-sx reg[7];
-rz(-pi/2) reg[7];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[1];
-cx reg[1],reg[0];
-rz(5.685957) reg[0];
-cx reg[1],reg[0];
-rz(-pi/2) reg[0];
-sx reg[0];
-rz(-pi/2) reg[0];
-cx reg[3],reg[1];
-cx reg[4],reg[3];
-rz(-pi/2) reg[3];
-sx reg[3];
-rz(-pi/2) reg[3];
-cx reg[4],reg[3];
-cx reg[3],reg[1];
-cx reg[1],reg[0];
-rz(5.685957) reg[0];
-cx reg[1],reg[0];
-cx reg[3],reg[1];
-cx reg[4],reg[3];
-rz(-pi/2) reg[3];
-sx reg[3];
-rz(-pi/2) reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-rz(-pi/2) reg[7];
-sx reg[7];
-rz(-pi/2) reg[7];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[1];
-cx reg[1],reg[0];
-rz(5.685957) reg[0];
-cx reg[1],reg[0];
-rz(-pi/2) reg[0];
-sx reg[0];
-rz(-pi/2) reg[0];
-cx reg[3],reg[1];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-rz(-pi/2) reg[7];
-sx reg[7];
-rz(-pi/2) reg[7];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[1];
-cx reg[1],reg[0];
-rz(5.685957) reg[0];
-cx reg[1],reg[0];
-cx reg[3],reg[1];
-cx reg[4],reg[3];
-rz(-pi/2) reg[3];
-sx reg[3];
-rz(-pi/2) reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-rz(-pi/2) reg[7];
-sx reg[7];
-rz(-pi/2) reg[7];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[1];
-cx reg[1],reg[0];
-rz(5.685957) reg[0];
-cx reg[1],reg[0];
-rz(-pi/2) reg[0];
-sx reg[0];
-rz(-pi/2) reg[0];
-cx reg[3],reg[1];
-cx reg[4],reg[3];
-rz(-pi/2) reg[3];
-sx reg[3];
-rz(-pi/2) reg[3];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(2.287362) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-rz(-pi/2) reg[3];
-sx reg[3];
-rz(-pi/2) reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-rz(-pi/2) reg[7];
-sx reg[7];
-rz(-pi/2) reg[7];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(2.287362) reg[0];
-cx reg[1],reg[0];
-rz(-pi/2) reg[0];
-sx reg[0];
-rz(-pi/2) reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-rz(-pi/2) reg[7];
-sx reg[7];
-rz(-pi/2) reg[7];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(2.287362) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-rz(-pi/2) reg[3];
-sx reg[3];
-rz(-pi/2) reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-rz(-pi/2) reg[7];
-sx reg[7];
-rz(-pi/2) reg[7];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(2.287362) reg[0];
-cx reg[1],reg[0];
-rz(-pi/2) reg[0];
-sx reg[0];
-rz(-pi/2) reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-rz(-pi/2) reg[3];
-sx reg[3];
-rz(-pi/2) reg[3];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(2.287362) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-rz(-pi/2) reg[3];
-sx reg[3];
-rz(-pi/2) reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-rz(-pi/2) reg[7];
-sx reg[7];
-rz(-pi/2) reg[7];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(2.287362) reg[0];
-cx reg[1],reg[0];
-rz(-pi/2) reg[0];
-sx reg[0];
-rz(-pi/2) reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-rz(-pi/2) reg[7];
-sx reg[7];
-rz(-pi/2) reg[7];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(2.287362) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-rz(-pi/2) reg[3];
-sx reg[3];
-rz(-pi/2) reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-rz(-pi/2) reg[7];
-sx reg[7];
-rz(-pi/2) reg[7];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(2.287362) reg[0];
-cx reg[1],reg[0];
-rz(-pi/2) reg[0];
-sx reg[0];
-rz(-pi/2) reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-rz(-pi/2) reg[3];
-sx reg[3];
-rz(-pi/2) reg[3];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-rz(5.950509) reg[1];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-rz(-pi/2) reg[3];
-sx reg[3];
-rz(-pi/2) reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-rz(-pi/2) reg[7];
-sx reg[7];
-rz(-pi/2) reg[7];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-rz(5.950509) reg[1];
-cx reg[2],reg[1];
-rz(-pi/2) reg[1];
-sx reg[1];
-rz(-pi/2) reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-rz(-pi/2) reg[7];
-sx reg[7];
-rz(-pi/2) reg[7];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-rz(5.950509) reg[1];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-rz(-pi/2) reg[3];
-sx reg[3];
-rz(-pi/2) reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-rz(-pi/2) reg[7];
-sx reg[7];
-rz(-pi/2) reg[7];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-rz(5.950509) reg[1];
-cx reg[2],reg[1];
-rz(-pi/2) reg[1];
-sx reg[1];
-rz(-pi/2) reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-rz(-pi/2) reg[3];
-sx reg[3];
-rz(-pi/2) reg[3];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-rz(5.950509) reg[1];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-rz(-pi/2) reg[3];
-sx reg[3];
-rz(-pi/2) reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-rz(-pi/2) reg[7];
-sx reg[7];
-rz(-pi/2) reg[7];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-rz(5.950509) reg[1];
-cx reg[2],reg[1];
-rz(-pi/2) reg[1];
-sx reg[1];
-rz(-pi/2) reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-rz(-pi/2) reg[7];
-sx reg[7];
-rz(-pi/2) reg[7];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-rz(5.950509) reg[1];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-rz(-pi/2) reg[3];
-sx reg[3];
-rz(-pi/2) reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-rz(-pi/2) reg[7];
-sx reg[7];
-rz(-pi/2) reg[7];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-rz(5.950509) reg[1];
-cx reg[2],reg[1];
-rz(-pi/2) reg[1];
-sx reg[1];
-rz(-pi/2) reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-rz(-pi) reg[3];
-x reg[3];
-cx reg[5],reg[4];
-rz(pi/2) reg[4];
-sx reg[4];
-rz(pi/2) reg[4];
-cx reg[5],reg[4];
-cx reg[4],reg[1];
-cx reg[1],reg[0];
-rz(2.615899) reg[0];
-cx reg[1],reg[0];
-cx reg[4],reg[1];
-cx reg[5],reg[4];
-rz(-pi/2) reg[4];
-sx reg[4];
-rz(-pi/2) reg[4];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-rz(-pi/2) reg[7];
-sx reg[7];
-rz(-pi/2) reg[7];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[1];
-cx reg[1],reg[0];
-rz(2.615899) reg[0];
-cx reg[1],reg[0];
-rz(-pi/2) reg[0];
-sx reg[0];
-rz(-pi/2) reg[0];
-cx reg[4],reg[1];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-rz(-pi/2) reg[7];
-sx reg[7];
-rz(-pi/2) reg[7];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[1];
-cx reg[1],reg[0];
-rz(2.615899) reg[0];
-cx reg[1],reg[0];
-cx reg[4],reg[1];
-cx reg[5],reg[4];
-rz(-pi/2) reg[4];
-sx reg[4];
-rz(-pi/2) reg[4];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-rz(-pi/2) reg[7];
-sx reg[7];
-rz(-pi/2) reg[7];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[1];
-cx reg[1],reg[0];
-rz(2.615899) reg[0];
-cx reg[1],reg[0];
-rz(-pi/2) reg[0];
-sx reg[0];
-rz(-pi/2) reg[0];
-cx reg[4],reg[1];
-cx reg[5],reg[4];
-rz(-pi/2) reg[4];
-sx reg[4];
-rz(-pi/2) reg[4];
-cx reg[5],reg[4];
-cx reg[4],reg[1];
-cx reg[1],reg[0];
-rz(2.615899) reg[0];
-cx reg[1],reg[0];
-cx reg[4],reg[1];
-cx reg[5],reg[4];
-rz(-pi/2) reg[4];
-sx reg[4];
-rz(-pi/2) reg[4];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-rz(-pi/2) reg[7];
-sx reg[7];
-rz(-pi/2) reg[7];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[1];
-cx reg[1],reg[0];
-rz(2.615899) reg[0];
-cx reg[1],reg[0];
-rz(-pi/2) reg[0];
-sx reg[0];
-rz(-pi/2) reg[0];
-cx reg[4],reg[1];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-rz(-pi/2) reg[7];
-sx reg[7];
-rz(-pi/2) reg[7];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[1];
-cx reg[1],reg[0];
-rz(2.615899) reg[0];
-cx reg[1],reg[0];
-cx reg[4],reg[1];
-cx reg[5],reg[4];
-rz(-pi/2) reg[4];
-sx reg[4];
-rz(-pi/2) reg[4];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-rz(-pi/2) reg[7];
-sx reg[7];
-rz(-pi/2) reg[7];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[1];
-cx reg[1],reg[0];
-rz(2.615899) reg[0];
-cx reg[1],reg[0];
-rz(-pi/2) reg[0];
-sx reg[0];
-rz(-pi/2) reg[0];
-cx reg[4],reg[1];
-cx reg[5],reg[4];
-rz(-pi/2) reg[4];
-sx reg[4];
-rz(-pi/2) reg[4];
-cx reg[5],reg[4];
-cx reg[4],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(3.300548) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[4],reg[2];
-cx reg[5],reg[4];
-rz(-pi/2) reg[4];
-sx reg[4];
-rz(-pi/2) reg[4];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-rz(-pi/2) reg[7];
-sx reg[7];
-rz(-pi/2) reg[7];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(3.300548) reg[0];
-cx reg[1],reg[0];
-rz(-pi/2) reg[0];
-sx reg[0];
-rz(-pi/2) reg[0];
-cx reg[2],reg[1];
-cx reg[4],reg[2];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-rz(-pi/2) reg[7];
-sx reg[7];
-rz(-pi/2) reg[7];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(3.300548) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[4],reg[2];
-cx reg[5],reg[4];
-rz(-pi/2) reg[4];
-sx reg[4];
-rz(-pi/2) reg[4];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-rz(-pi/2) reg[7];
-sx reg[7];
-rz(-pi/2) reg[7];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(3.300548) reg[0];
-cx reg[1],reg[0];
-rz(-pi/2) reg[0];
-sx reg[0];
-rz(-pi/2) reg[0];
-cx reg[2],reg[1];
-cx reg[4],reg[2];
-cx reg[5],reg[4];
-rz(-pi/2) reg[4];
-sx reg[4];
-rz(-pi/2) reg[4];
-cx reg[5],reg[4];
-cx reg[4],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(3.300548) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[4],reg[2];
-cx reg[5],reg[4];
-rz(-pi/2) reg[4];
-sx reg[4];
-rz(-pi/2) reg[4];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-rz(-pi/2) reg[7];
-sx reg[7];
-rz(-pi/2) reg[7];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(3.300548) reg[0];
-cx reg[1],reg[0];
-rz(-pi/2) reg[0];
-sx reg[0];
-rz(-pi/2) reg[0];
-cx reg[2],reg[1];
-cx reg[4],reg[2];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-rz(-pi/2) reg[7];
-sx reg[7];
-rz(-pi/2) reg[7];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(3.300548) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[4],reg[2];
-cx reg[5],reg[4];
-rz(-pi/2) reg[4];
-sx reg[4];
-rz(-pi/2) reg[4];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-rz(-pi/2) reg[7];
-sx reg[7];
-rz(-pi/2) reg[7];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(3.300548) reg[0];
-cx reg[1],reg[0];
-rz(-pi/2) reg[0];
-sx reg[0];
-rz(-pi/2) reg[0];
-cx reg[2],reg[1];
-cx reg[4],reg[2];
-cx reg[5],reg[4];
-rz(-pi/2) reg[4];
-sx reg[4];
-rz(-pi/2) reg[4];
-cx reg[5],reg[4];
-cx reg[4],reg[2];
-cx reg[2],reg[1];
-rz(5.061758) reg[1];
-cx reg[2],reg[1];
-cx reg[4],reg[2];
-cx reg[5],reg[4];
-rz(-pi/2) reg[4];
-sx reg[4];
-rz(-pi/2) reg[4];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-rz(-pi/2) reg[7];
-sx reg[7];
-rz(-pi/2) reg[7];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[2];
-cx reg[2],reg[1];
-rz(5.061758) reg[1];
-cx reg[2],reg[1];
-rz(-pi/2) reg[1];
-sx reg[1];
-rz(-pi/2) reg[1];
-cx reg[4],reg[2];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-rz(-pi/2) reg[7];
-sx reg[7];
-rz(-pi/2) reg[7];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[2];
-cx reg[2],reg[1];
-rz(5.061758) reg[1];
-cx reg[2],reg[1];
-cx reg[4],reg[2];
-cx reg[5],reg[4];
-rz(-pi/2) reg[4];
-sx reg[4];
-rz(-pi/2) reg[4];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-rz(-pi/2) reg[7];
-sx reg[7];
-rz(-pi/2) reg[7];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[2];
-cx reg[2],reg[1];
-rz(5.061758) reg[1];
-cx reg[2],reg[1];
-rz(-pi/2) reg[1];
-sx reg[1];
-rz(-pi/2) reg[1];
-cx reg[4],reg[2];
-cx reg[5],reg[4];
-rz(-pi/2) reg[4];
-sx reg[4];
-rz(-pi/2) reg[4];
-cx reg[5],reg[4];
-cx reg[4],reg[2];
-cx reg[2],reg[1];
-rz(5.061758) reg[1];
-cx reg[2],reg[1];
-cx reg[4],reg[2];
-cx reg[5],reg[4];
-rz(-pi/2) reg[4];
-sx reg[4];
-rz(-pi/2) reg[4];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-rz(-pi/2) reg[7];
-sx reg[7];
-rz(-pi/2) reg[7];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[2];
-cx reg[2],reg[1];
-rz(5.061758) reg[1];
-cx reg[2],reg[1];
-rz(-pi/2) reg[1];
-sx reg[1];
-rz(-pi/2) reg[1];
-cx reg[4],reg[2];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-rz(-pi/2) reg[7];
-sx reg[7];
-rz(-pi/2) reg[7];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[2];
-cx reg[2],reg[1];
-rz(5.061758) reg[1];
-cx reg[2],reg[1];
-cx reg[4],reg[2];
-cx reg[5],reg[4];
-rz(-pi/2) reg[4];
-sx reg[4];
-rz(-pi/2) reg[4];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-rz(-pi/2) reg[7];
-sx reg[7];
-rz(-pi/2) reg[7];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[2];
-cx reg[2],reg[1];
-rz(5.061758) reg[1];
-cx reg[2],reg[1];
-rz(-pi/2) reg[1];
-sx reg[1];
-rz(-pi/2) reg[1];
-cx reg[4],reg[2];
-cx reg[5],reg[4];
-rz(-pi/2) reg[4];
-sx reg[4];
-rz(-pi/2) reg[4];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(1.297123) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-rz(-pi/2) reg[4];
-sx reg[4];
-rz(-pi/2) reg[4];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-rz(-pi/2) reg[7];
-sx reg[7];
-rz(-pi/2) reg[7];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(1.297123) reg[0];
-cx reg[1],reg[0];
-rz(-pi/2) reg[0];
-sx reg[0];
-rz(-pi/2) reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-rz(-pi/2) reg[7];
-sx reg[7];
-rz(-pi/2) reg[7];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(1.297123) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-rz(-pi/2) reg[4];
-sx reg[4];
-rz(-pi/2) reg[4];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-rz(-pi/2) reg[7];
-sx reg[7];
-rz(-pi/2) reg[7];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(1.297123) reg[0];
-cx reg[1],reg[0];
-rz(-pi/2) reg[0];
-sx reg[0];
-rz(-pi/2) reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-rz(-pi/2) reg[4];
-sx reg[4];
-rz(-pi/2) reg[4];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(1.297123) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-rz(-pi/2) reg[4];
-sx reg[4];
-rz(-pi/2) reg[4];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-rz(-pi/2) reg[7];
-sx reg[7];
-rz(-pi/2) reg[7];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(1.297123) reg[0];
-cx reg[1],reg[0];
-rz(-pi/2) reg[0];
-sx reg[0];
-rz(-pi/2) reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-rz(-pi/2) reg[7];
-sx reg[7];
-rz(-pi/2) reg[7];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(1.297123) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-rz(-pi/2) reg[4];
-sx reg[4];
-rz(-pi/2) reg[4];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-rz(-pi/2) reg[7];
-sx reg[7];
-rz(-pi/2) reg[7];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(1.297123) reg[0];
-cx reg[1],reg[0];
-rz(-pi/2) reg[0];
-sx reg[0];
-rz(-pi/2) reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-rz(-pi/2) reg[4];
-sx reg[4];
-rz(-pi/2) reg[4];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-rz(5.49365) reg[1];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-rz(-pi/2) reg[4];
-sx reg[4];
-rz(-pi/2) reg[4];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-rz(-pi/2) reg[7];
-sx reg[7];
-rz(-pi/2) reg[7];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-rz(5.49365) reg[1];
-cx reg[2],reg[1];
-rz(-pi/2) reg[1];
-sx reg[1];
-rz(-pi/2) reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-rz(-pi/2) reg[7];
-sx reg[7];
-rz(-pi/2) reg[7];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-rz(5.49365) reg[1];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-rz(-pi/2) reg[4];
-sx reg[4];
-rz(-pi/2) reg[4];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-rz(-pi/2) reg[7];
-sx reg[7];
-rz(-pi/2) reg[7];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-rz(5.49365) reg[1];
-cx reg[2],reg[1];
-rz(-pi/2) reg[1];
-sx reg[1];
-rz(-pi/2) reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-rz(-pi/2) reg[4];
-sx reg[4];
-rz(-pi/2) reg[4];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-rz(5.49365) reg[1];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-rz(-pi/2) reg[4];
-sx reg[4];
-rz(-pi/2) reg[4];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-rz(-pi/2) reg[7];
-sx reg[7];
-rz(-pi/2) reg[7];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-rz(5.49365) reg[1];
-cx reg[2],reg[1];
-rz(-pi/2) reg[1];
-sx reg[1];
-rz(-pi/2) reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-rz(-pi/2) reg[7];
-sx reg[7];
-rz(-pi/2) reg[7];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-rz(5.49365) reg[1];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-rz(-pi/2) reg[4];
-sx reg[4];
-rz(-pi/2) reg[4];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-rz(-pi/2) reg[7];
-sx reg[7];
-rz(-pi/2) reg[7];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-rz(5.49365) reg[1];
-cx reg[2],reg[1];
-rz(-pi/2) reg[1];
-sx reg[1];
-rz(-pi/2) reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-rz(-pi/2) reg[4];
-sx reg[4];
-rz(-pi/2) reg[4];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-rz(4.918651) reg[2];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-rz(-pi/2) reg[4];
-sx reg[4];
-rz(-pi/2) reg[4];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-rz(-pi/2) reg[7];
-sx reg[7];
-rz(-pi/2) reg[7];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-rz(4.918651) reg[2];
-cx reg[3],reg[2];
-rz(-pi/2) reg[2];
-sx reg[2];
-rz(-pi/2) reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-rz(-pi/2) reg[7];
-sx reg[7];
-rz(-pi/2) reg[7];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-rz(4.918651) reg[2];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-rz(-pi/2) reg[4];
-sx reg[4];
-rz(-pi/2) reg[4];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-rz(-pi/2) reg[7];
-sx reg[7];
-rz(-pi/2) reg[7];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-rz(4.918651) reg[2];
-cx reg[3],reg[2];
-rz(-pi/2) reg[2];
-sx reg[2];
-rz(-pi/2) reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-rz(-pi/2) reg[4];
-sx reg[4];
-rz(-pi/2) reg[4];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-rz(4.918651) reg[2];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-rz(-pi/2) reg[4];
-sx reg[4];
-rz(-pi/2) reg[4];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-rz(-pi/2) reg[7];
-sx reg[7];
-rz(-pi/2) reg[7];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-rz(4.918651) reg[2];
-cx reg[3],reg[2];
-rz(-pi/2) reg[2];
-sx reg[2];
-rz(-pi/2) reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-rz(-pi/2) reg[7];
-sx reg[7];
-rz(-pi/2) reg[7];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-rz(4.918651) reg[2];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-rz(-pi/2) reg[4];
-sx reg[4];
-rz(-pi/2) reg[4];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-rz(-pi/2) reg[7];
-sx reg[7];
-rz(-pi/2) reg[7];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-rz(4.918651) reg[2];
-cx reg[3],reg[2];
-rz(-pi/2) reg[2];
-sx reg[2];
-rz(-pi/2) reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-rz(-pi) reg[4];
-x reg[4];
-cx reg[6],reg[5];
-rz(pi/2) reg[5];
-sx reg[5];
-rz(pi/2) reg[5];
-cx reg[6],reg[5];
-cx reg[5],reg[1];
-cx reg[1],reg[0];
-rz(3.591062) reg[0];
-cx reg[1],reg[0];
-cx reg[5],reg[1];
-cx reg[6],reg[5];
-rz(-pi/2) reg[5];
-sx reg[5];
-rz(-pi/2) reg[5];
-cx reg[7],reg[6];
-rz(-pi/2) reg[7];
-sx reg[7];
-rz(-pi/2) reg[7];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[1];
-cx reg[1],reg[0];
-rz(3.591062) reg[0];
-cx reg[1],reg[0];
-rz(-pi/2) reg[0];
-sx reg[0];
-rz(-pi/2) reg[0];
-cx reg[5],reg[1];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-rz(-pi/2) reg[7];
-sx reg[7];
-rz(-pi/2) reg[7];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[1];
-cx reg[1],reg[0];
-rz(3.591062) reg[0];
-cx reg[1],reg[0];
-cx reg[5],reg[1];
-cx reg[6],reg[5];
-rz(-pi/2) reg[5];
-sx reg[5];
-rz(-pi/2) reg[5];
-cx reg[7],reg[6];
-rz(-pi/2) reg[7];
-sx reg[7];
-rz(-pi/2) reg[7];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[1];
-cx reg[1],reg[0];
-rz(3.591062) reg[0];
-cx reg[1],reg[0];
-rz(-pi/2) reg[0];
-sx reg[0];
-rz(-pi/2) reg[0];
-cx reg[5],reg[1];
-cx reg[6],reg[5];
-rz(-pi/2) reg[5];
-sx reg[5];
-rz(-pi/2) reg[5];
-cx reg[6],reg[5];
-cx reg[5],reg[1];
-cx reg[1],reg[0];
-rz(3.591062) reg[0];
-cx reg[1],reg[0];
-cx reg[5],reg[1];
-cx reg[6],reg[5];
-rz(-pi/2) reg[5];
-sx reg[5];
-rz(-pi/2) reg[5];
-cx reg[7],reg[6];
-rz(-pi/2) reg[7];
-sx reg[7];
-rz(-pi/2) reg[7];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[1];
-cx reg[1],reg[0];
-rz(3.591062) reg[0];
-cx reg[1],reg[0];
-rz(-pi/2) reg[0];
-sx reg[0];
-rz(-pi/2) reg[0];
-cx reg[5],reg[1];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-rz(-pi/2) reg[7];
-sx reg[7];
-rz(-pi/2) reg[7];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[1];
-cx reg[1],reg[0];
-rz(3.591062) reg[0];
-cx reg[1],reg[0];
-cx reg[5],reg[1];
-cx reg[6],reg[5];
-rz(-pi/2) reg[5];
-sx reg[5];
-rz(-pi/2) reg[5];
-cx reg[7],reg[6];
-rz(-pi/2) reg[7];
-sx reg[7];
-rz(-pi/2) reg[7];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[1];
-cx reg[1],reg[0];
-rz(3.591062) reg[0];
-cx reg[1],reg[0];
-rz(-pi/2) reg[0];
-sx reg[0];
-rz(-pi/2) reg[0];
-cx reg[5],reg[1];
-cx reg[6],reg[5];
-rz(-pi/2) reg[5];
-sx reg[5];
-rz(-pi/2) reg[5];
-cx reg[6],reg[5];
-cx reg[5],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(2.456721) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[5],reg[2];
-cx reg[6],reg[5];
-rz(-pi/2) reg[5];
-sx reg[5];
-rz(-pi/2) reg[5];
-cx reg[7],reg[6];
-rz(-pi/2) reg[7];
-sx reg[7];
-rz(-pi/2) reg[7];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(2.456721) reg[0];
-cx reg[1],reg[0];
-rz(-pi/2) reg[0];
-sx reg[0];
-rz(-pi/2) reg[0];
-cx reg[2],reg[1];
-cx reg[5],reg[2];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-rz(-pi/2) reg[7];
-sx reg[7];
-rz(-pi/2) reg[7];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(2.456721) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[5],reg[2];
-cx reg[6],reg[5];
-rz(-pi/2) reg[5];
-sx reg[5];
-rz(-pi/2) reg[5];
-cx reg[7],reg[6];
-rz(-pi/2) reg[7];
-sx reg[7];
-rz(-pi/2) reg[7];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(2.456721) reg[0];
-cx reg[1],reg[0];
-rz(-pi/2) reg[0];
-sx reg[0];
-rz(-pi/2) reg[0];
-cx reg[2],reg[1];
-cx reg[5],reg[2];
-cx reg[6],reg[5];
-rz(-pi/2) reg[5];
-sx reg[5];
-rz(-pi/2) reg[5];
-cx reg[6],reg[5];
-cx reg[5],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(2.456721) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[5],reg[2];
-cx reg[6],reg[5];
-rz(-pi/2) reg[5];
-sx reg[5];
-rz(-pi/2) reg[5];
-cx reg[7],reg[6];
-rz(-pi/2) reg[7];
-sx reg[7];
-rz(-pi/2) reg[7];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(2.456721) reg[0];
-cx reg[1],reg[0];
-rz(-pi/2) reg[0];
-sx reg[0];
-rz(-pi/2) reg[0];
-cx reg[2],reg[1];
-cx reg[5],reg[2];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-rz(-pi/2) reg[7];
-sx reg[7];
-rz(-pi/2) reg[7];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(2.456721) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[5],reg[2];
-cx reg[6],reg[5];
-rz(-pi/2) reg[5];
-sx reg[5];
-rz(-pi/2) reg[5];
-cx reg[7],reg[6];
-rz(-pi/2) reg[7];
-sx reg[7];
-rz(-pi/2) reg[7];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(2.456721) reg[0];
-cx reg[1],reg[0];
-rz(-pi/2) reg[0];
-sx reg[0];
-rz(-pi/2) reg[0];
-cx reg[2],reg[1];
-cx reg[5],reg[2];
-cx reg[6],reg[5];
-rz(-pi/2) reg[5];
-sx reg[5];
-rz(-pi/2) reg[5];
-cx reg[6],reg[5];
-cx reg[5],reg[2];
-cx reg[2],reg[1];
-rz(5.109929) reg[1];
-cx reg[2],reg[1];
-cx reg[5],reg[2];
-cx reg[6],reg[5];
-rz(-pi/2) reg[5];
-sx reg[5];
-rz(-pi/2) reg[5];
-cx reg[7],reg[6];
-rz(-pi/2) reg[7];
-sx reg[7];
-rz(-pi/2) reg[7];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[2];
-cx reg[2],reg[1];
-rz(5.109929) reg[1];
-cx reg[2],reg[1];
-rz(-pi/2) reg[1];
-sx reg[1];
-rz(-pi/2) reg[1];
-cx reg[5],reg[2];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-rz(-pi/2) reg[7];
-sx reg[7];
-rz(-pi/2) reg[7];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[2];
-cx reg[2],reg[1];
-rz(5.109929) reg[1];
-cx reg[2],reg[1];
-cx reg[5],reg[2];
-cx reg[6],reg[5];
-rz(-pi/2) reg[5];
-sx reg[5];
-rz(-pi/2) reg[5];
-cx reg[7],reg[6];
-rz(-pi/2) reg[7];
-sx reg[7];
-rz(-pi/2) reg[7];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[2];
-cx reg[2],reg[1];
-rz(5.109929) reg[1];
-cx reg[2],reg[1];
-rz(-pi/2) reg[1];
-sx reg[1];
-rz(-pi/2) reg[1];
-cx reg[5],reg[2];
-cx reg[6],reg[5];
-rz(-pi/2) reg[5];
-sx reg[5];
-rz(-pi/2) reg[5];
-cx reg[6],reg[5];
-cx reg[5],reg[2];
-cx reg[2],reg[1];
-rz(5.109929) reg[1];
-cx reg[2],reg[1];
-cx reg[5],reg[2];
-cx reg[6],reg[5];
-rz(-pi/2) reg[5];
-sx reg[5];
-rz(-pi/2) reg[5];
-cx reg[7],reg[6];
-rz(-pi/2) reg[7];
-sx reg[7];
-rz(-pi/2) reg[7];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[2];
-cx reg[2],reg[1];
-rz(5.109929) reg[1];
-cx reg[2],reg[1];
-rz(-pi/2) reg[1];
-sx reg[1];
-rz(-pi/2) reg[1];
-cx reg[5],reg[2];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-rz(-pi/2) reg[7];
-sx reg[7];
-rz(-pi/2) reg[7];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[2];
-cx reg[2],reg[1];
-rz(5.109929) reg[1];
-cx reg[2],reg[1];
-cx reg[5],reg[2];
-cx reg[6],reg[5];
-rz(-pi/2) reg[5];
-sx reg[5];
-rz(-pi/2) reg[5];
-cx reg[7],reg[6];
-rz(-pi/2) reg[7];
-sx reg[7];
-rz(-pi/2) reg[7];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[2];
-cx reg[2],reg[1];
-rz(5.109929) reg[1];
-cx reg[2],reg[1];
-rz(-pi/2) reg[1];
-sx reg[1];
-rz(-pi/2) reg[1];
-cx reg[5],reg[2];
-cx reg[6],reg[5];
-rz(-pi/2) reg[5];
-sx reg[5];
-rz(-pi/2) reg[5];
-cx reg[6],reg[5];
-cx reg[5],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(2.490813) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[5],reg[3];
-cx reg[6],reg[5];
-rz(-pi/2) reg[5];
-sx reg[5];
-rz(-pi/2) reg[5];
-cx reg[7],reg[6];
-rz(-pi/2) reg[7];
-sx reg[7];
-rz(-pi/2) reg[7];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(2.490813) reg[0];
-cx reg[1],reg[0];
-rz(-pi/2) reg[0];
-sx reg[0];
-rz(-pi/2) reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[5],reg[3];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-rz(-pi/2) reg[7];
-sx reg[7];
-rz(-pi/2) reg[7];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(2.490813) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[5],reg[3];
-cx reg[6],reg[5];
-rz(-pi/2) reg[5];
-sx reg[5];
-rz(-pi/2) reg[5];
-cx reg[7],reg[6];
-rz(-pi/2) reg[7];
-sx reg[7];
-rz(-pi/2) reg[7];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(2.490813) reg[0];
-cx reg[1],reg[0];
-rz(-pi/2) reg[0];
-sx reg[0];
-rz(-pi/2) reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[5],reg[3];
-cx reg[6],reg[5];
-rz(-pi/2) reg[5];
-sx reg[5];
-rz(-pi/2) reg[5];
-cx reg[6],reg[5];
-cx reg[5],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(2.490813) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[5],reg[3];
-cx reg[6],reg[5];
-rz(-pi/2) reg[5];
-sx reg[5];
-rz(-pi/2) reg[5];
-cx reg[7],reg[6];
-rz(-pi/2) reg[7];
-sx reg[7];
-rz(-pi/2) reg[7];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(2.490813) reg[0];
-cx reg[1],reg[0];
-rz(-pi/2) reg[0];
-sx reg[0];
-rz(-pi/2) reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[5],reg[3];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-rz(-pi/2) reg[7];
-sx reg[7];
-rz(-pi/2) reg[7];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(2.490813) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[5],reg[3];
-cx reg[6],reg[5];
-rz(-pi/2) reg[5];
-sx reg[5];
-rz(-pi/2) reg[5];
-cx reg[7],reg[6];
-rz(-pi/2) reg[7];
-sx reg[7];
-rz(-pi/2) reg[7];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(2.490813) reg[0];
-cx reg[1],reg[0];
-rz(-pi/2) reg[0];
-sx reg[0];
-rz(-pi/2) reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[5],reg[3];
-cx reg[6],reg[5];
-rz(-pi/2) reg[5];
-sx reg[5];
-rz(-pi/2) reg[5];
-cx reg[6],reg[5];
-cx reg[5],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-rz(0.631166) reg[1];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[5],reg[3];
-cx reg[6],reg[5];
-rz(-pi/2) reg[5];
-sx reg[5];
-rz(-pi/2) reg[5];
-cx reg[7],reg[6];
-rz(-pi/2) reg[7];
-sx reg[7];
-rz(-pi/2) reg[7];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-rz(0.631166) reg[1];
-cx reg[2],reg[1];
-rz(-pi/2) reg[1];
-sx reg[1];
-rz(-pi/2) reg[1];
-cx reg[3],reg[2];
-cx reg[5],reg[3];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-rz(-pi/2) reg[7];
-sx reg[7];
-rz(-pi/2) reg[7];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-rz(0.631166) reg[1];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[5],reg[3];
-cx reg[6],reg[5];
-rz(-pi/2) reg[5];
-sx reg[5];
-rz(-pi/2) reg[5];
-cx reg[7],reg[6];
-rz(-pi/2) reg[7];
-sx reg[7];
-rz(-pi/2) reg[7];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-rz(0.631166) reg[1];
-cx reg[2],reg[1];
-rz(-pi/2) reg[1];
-sx reg[1];
-rz(-pi/2) reg[1];
-cx reg[3],reg[2];
-cx reg[5],reg[3];
-cx reg[6],reg[5];
-rz(-pi/2) reg[5];
-sx reg[5];
-rz(-pi/2) reg[5];
-cx reg[6],reg[5];
-cx reg[5],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-rz(0.631166) reg[1];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[5],reg[3];
-cx reg[6],reg[5];
-rz(-pi/2) reg[5];
-sx reg[5];
-rz(-pi/2) reg[5];
-cx reg[7],reg[6];
-rz(-pi/2) reg[7];
-sx reg[7];
-rz(-pi/2) reg[7];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-rz(0.631166) reg[1];
-cx reg[2],reg[1];
-rz(-pi/2) reg[1];
-sx reg[1];
-rz(-pi/2) reg[1];
-cx reg[3],reg[2];
-cx reg[5],reg[3];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-rz(-pi/2) reg[7];
-sx reg[7];
-rz(-pi/2) reg[7];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-rz(0.631166) reg[1];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[5],reg[3];
-cx reg[6],reg[5];
-rz(-pi/2) reg[5];
-sx reg[5];
-rz(-pi/2) reg[5];
-cx reg[7],reg[6];
-rz(-pi/2) reg[7];
-sx reg[7];
-rz(-pi/2) reg[7];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-rz(0.631166) reg[1];
-cx reg[2],reg[1];
-rz(-pi/2) reg[1];
-sx reg[1];
-rz(-pi/2) reg[1];
-cx reg[3],reg[2];
-cx reg[5],reg[3];
-cx reg[6],reg[5];
-rz(-pi/2) reg[5];
-sx reg[5];
-rz(-pi/2) reg[5];
-cx reg[6],reg[5];
-cx reg[5],reg[3];
-cx reg[3],reg[2];
-rz(1.65175) reg[2];
-cx reg[3],reg[2];
-cx reg[5],reg[3];
-cx reg[6],reg[5];
-rz(-pi/2) reg[5];
-sx reg[5];
-rz(-pi/2) reg[5];
-cx reg[7],reg[6];
-rz(-pi/2) reg[7];
-sx reg[7];
-rz(-pi/2) reg[7];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[3];
-cx reg[3],reg[2];
-rz(1.65175) reg[2];
-cx reg[3],reg[2];
-rz(-pi/2) reg[2];
-sx reg[2];
-rz(-pi/2) reg[2];
-cx reg[5],reg[3];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-rz(-pi/2) reg[7];
-sx reg[7];
-rz(-pi/2) reg[7];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[3];
-cx reg[3],reg[2];
-rz(1.65175) reg[2];
-cx reg[3],reg[2];
-cx reg[5],reg[3];
-cx reg[6],reg[5];
-rz(-pi/2) reg[5];
-sx reg[5];
-rz(-pi/2) reg[5];
-cx reg[7],reg[6];
-rz(-pi/2) reg[7];
-sx reg[7];
-rz(-pi/2) reg[7];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[3];
-cx reg[3],reg[2];
-rz(1.65175) reg[2];
-cx reg[3],reg[2];
-rz(-pi/2) reg[2];
-sx reg[2];
-rz(-pi/2) reg[2];
-cx reg[5],reg[3];
-cx reg[6],reg[5];
-rz(-pi/2) reg[5];
-sx reg[5];
-rz(-pi/2) reg[5];
-cx reg[6],reg[5];
-cx reg[5],reg[3];
-cx reg[3],reg[2];
-rz(1.65175) reg[2];
-cx reg[3],reg[2];
-cx reg[5],reg[3];
-cx reg[6],reg[5];
-rz(-pi/2) reg[5];
-sx reg[5];
-rz(-pi/2) reg[5];
-cx reg[7],reg[6];
-rz(-pi/2) reg[7];
-sx reg[7];
-rz(-pi/2) reg[7];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[3];
-cx reg[3],reg[2];
-rz(1.65175) reg[2];
-cx reg[3],reg[2];
-rz(-pi/2) reg[2];
-sx reg[2];
-rz(-pi/2) reg[2];
-cx reg[5],reg[3];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-rz(-pi/2) reg[7];
-sx reg[7];
-rz(-pi/2) reg[7];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[3];
-cx reg[3],reg[2];
-rz(1.65175) reg[2];
-cx reg[3],reg[2];
-cx reg[5],reg[3];
-cx reg[6],reg[5];
-rz(-pi/2) reg[5];
-sx reg[5];
-rz(-pi/2) reg[5];
-cx reg[7],reg[6];
-rz(-pi/2) reg[7];
-sx reg[7];
-rz(-pi/2) reg[7];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[3];
-cx reg[3],reg[2];
-rz(1.65175) reg[2];
-cx reg[3],reg[2];
-rz(-pi/2) reg[2];
-sx reg[2];
-rz(-pi/2) reg[2];
-cx reg[5],reg[3];
-cx reg[6],reg[5];
-rz(-pi/2) reg[5];
-sx reg[5];
-rz(-pi/2) reg[5];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(1.233693) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-rz(-pi/2) reg[5];
-sx reg[5];
-rz(-pi/2) reg[5];
-cx reg[7],reg[6];
-rz(-pi/2) reg[7];
-sx reg[7];
-rz(-pi/2) reg[7];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(1.233693) reg[0];
-cx reg[1],reg[0];
-rz(-pi/2) reg[0];
-sx reg[0];
-rz(-pi/2) reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-rz(-pi/2) reg[7];
-sx reg[7];
-rz(-pi/2) reg[7];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(1.233693) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-rz(-pi/2) reg[5];
-sx reg[5];
-rz(-pi/2) reg[5];
-cx reg[7],reg[6];
-rz(-pi/2) reg[7];
-sx reg[7];
-rz(-pi/2) reg[7];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(1.233693) reg[0];
-cx reg[1],reg[0];
-rz(-pi/2) reg[0];
-sx reg[0];
-rz(-pi/2) reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-rz(-pi/2) reg[5];
-sx reg[5];
-rz(-pi/2) reg[5];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(1.233693) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-rz(-pi/2) reg[5];
-sx reg[5];
-rz(-pi/2) reg[5];
-cx reg[7],reg[6];
-rz(-pi/2) reg[7];
-sx reg[7];
-rz(-pi/2) reg[7];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(1.233693) reg[0];
-cx reg[1],reg[0];
-rz(-pi/2) reg[0];
-sx reg[0];
-rz(-pi/2) reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-rz(-pi/2) reg[7];
-sx reg[7];
-rz(-pi/2) reg[7];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(1.233693) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-rz(-pi/2) reg[5];
-sx reg[5];
-rz(-pi/2) reg[5];
-cx reg[7],reg[6];
-rz(-pi/2) reg[7];
-sx reg[7];
-rz(-pi/2) reg[7];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(1.233693) reg[0];
-cx reg[1],reg[0];
-rz(-pi/2) reg[0];
-sx reg[0];
-rz(-pi/2) reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-rz(-pi/2) reg[5];
-sx reg[5];
-rz(-pi/2) reg[5];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-rz(3.96871) reg[1];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-rz(-pi/2) reg[5];
-sx reg[5];
-rz(-pi/2) reg[5];
-cx reg[7],reg[6];
-rz(-pi/2) reg[7];
-sx reg[7];
-rz(-pi/2) reg[7];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-rz(3.96871) reg[1];
-cx reg[2],reg[1];
-rz(-pi/2) reg[1];
-sx reg[1];
-rz(-pi/2) reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-rz(-pi/2) reg[7];
-sx reg[7];
-rz(-pi/2) reg[7];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-rz(3.96871) reg[1];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-rz(-pi/2) reg[5];
-sx reg[5];
-rz(-pi/2) reg[5];
-cx reg[7],reg[6];
-rz(-pi/2) reg[7];
-sx reg[7];
-rz(-pi/2) reg[7];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-rz(3.96871) reg[1];
-cx reg[2],reg[1];
-rz(-pi/2) reg[1];
-sx reg[1];
-rz(-pi/2) reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-rz(-pi/2) reg[5];
-sx reg[5];
-rz(-pi/2) reg[5];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-rz(3.96871) reg[1];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-rz(-pi/2) reg[5];
-sx reg[5];
-rz(-pi/2) reg[5];
-cx reg[7],reg[6];
-rz(-pi/2) reg[7];
-sx reg[7];
-rz(-pi/2) reg[7];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-rz(3.96871) reg[1];
-cx reg[2],reg[1];
-rz(-pi/2) reg[1];
-sx reg[1];
-rz(-pi/2) reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-rz(-pi/2) reg[7];
-sx reg[7];
-rz(-pi/2) reg[7];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-rz(3.96871) reg[1];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-rz(-pi/2) reg[5];
-sx reg[5];
-rz(-pi/2) reg[5];
-cx reg[7],reg[6];
-rz(-pi/2) reg[7];
-sx reg[7];
-rz(-pi/2) reg[7];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-rz(3.96871) reg[1];
-cx reg[2],reg[1];
-rz(-pi/2) reg[1];
-sx reg[1];
-rz(-pi/2) reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-rz(-pi/2) reg[5];
-sx reg[5];
-rz(-pi/2) reg[5];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-rz(5.442531) reg[2];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-rz(-pi/2) reg[5];
-sx reg[5];
-rz(-pi/2) reg[5];
-cx reg[7],reg[6];
-rz(-pi/2) reg[7];
-sx reg[7];
-rz(-pi/2) reg[7];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-rz(5.442531) reg[2];
-cx reg[3],reg[2];
-rz(-pi/2) reg[2];
-sx reg[2];
-rz(-pi/2) reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-rz(-pi/2) reg[7];
-sx reg[7];
-rz(-pi/2) reg[7];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-rz(5.442531) reg[2];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-rz(-pi/2) reg[5];
-sx reg[5];
-rz(-pi/2) reg[5];
-cx reg[7],reg[6];
-rz(-pi/2) reg[7];
-sx reg[7];
-rz(-pi/2) reg[7];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-rz(5.442531) reg[2];
-cx reg[3],reg[2];
-rz(-pi/2) reg[2];
-sx reg[2];
-rz(-pi/2) reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-rz(-pi/2) reg[5];
-sx reg[5];
-rz(-pi/2) reg[5];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-rz(5.442531) reg[2];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-rz(-pi/2) reg[5];
-sx reg[5];
-rz(-pi/2) reg[5];
-cx reg[7],reg[6];
-rz(-pi/2) reg[7];
-sx reg[7];
-rz(-pi/2) reg[7];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-rz(5.442531) reg[2];
-cx reg[3],reg[2];
-rz(-pi/2) reg[2];
-sx reg[2];
-rz(-pi/2) reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-rz(-pi/2) reg[7];
-sx reg[7];
-rz(-pi/2) reg[7];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-rz(5.442531) reg[2];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-rz(-pi/2) reg[5];
-sx reg[5];
-rz(-pi/2) reg[5];
-cx reg[7],reg[6];
-rz(-pi/2) reg[7];
-sx reg[7];
-rz(-pi/2) reg[7];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-rz(5.442531) reg[2];
-cx reg[3],reg[2];
-rz(-pi/2) reg[2];
-sx reg[2];
-rz(-pi/2) reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-rz(-pi/2) reg[5];
-sx reg[5];
-rz(-pi/2) reg[5];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-rz(3.581851) reg[3];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-rz(-pi/2) reg[5];
-sx reg[5];
-rz(-pi/2) reg[5];
-cx reg[7],reg[6];
-rz(-pi/2) reg[7];
-sx reg[7];
-rz(-pi/2) reg[7];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-rz(3.581851) reg[3];
-cx reg[4],reg[3];
-rz(-pi/2) reg[3];
-sx reg[3];
-rz(-pi/2) reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-rz(-pi/2) reg[7];
-sx reg[7];
-rz(-pi/2) reg[7];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-rz(3.581851) reg[3];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-rz(-pi/2) reg[5];
-sx reg[5];
-rz(-pi/2) reg[5];
-cx reg[7],reg[6];
-rz(-pi/2) reg[7];
-sx reg[7];
-rz(-pi/2) reg[7];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-rz(3.581851) reg[3];
-cx reg[4],reg[3];
-rz(-pi/2) reg[3];
-sx reg[3];
-rz(-pi/2) reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-rz(-pi/2) reg[5];
-sx reg[5];
-rz(-pi/2) reg[5];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-rz(3.581851) reg[3];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-rz(-pi/2) reg[5];
-sx reg[5];
-rz(-pi/2) reg[5];
-cx reg[7],reg[6];
-rz(-pi/2) reg[7];
-sx reg[7];
-rz(-pi/2) reg[7];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-rz(3.581851) reg[3];
-cx reg[4],reg[3];
-rz(-pi/2) reg[3];
-sx reg[3];
-rz(-pi/2) reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-rz(-pi/2) reg[7];
-sx reg[7];
-rz(-pi/2) reg[7];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-rz(3.581851) reg[3];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-rz(-pi/2) reg[5];
-sx reg[5];
-rz(-pi/2) reg[5];
-cx reg[7],reg[6];
-rz(-pi/2) reg[7];
-sx reg[7];
-rz(-pi/2) reg[7];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-rz(3.581851) reg[3];
-cx reg[4],reg[3];
-rz(-pi/2) reg[3];
-sx reg[3];
-rz(-pi/2) reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-rz(-pi) reg[5];
-x reg[5];
-cx reg[7],reg[6];
-rz(pi/2) reg[6];
-sx reg[6];
-rz(pi/2) reg[6];
-cx reg[7],reg[6];
-cx reg[6],reg[1];
-cx reg[1],reg[0];
-rz(1.736069) reg[0];
-cx reg[1],reg[0];
-cx reg[6],reg[1];
-cx reg[7],reg[6];
-rz(-pi/2) reg[6];
-sx reg[6];
-rz(-pi/2) reg[6];
-rz(-pi/2) reg[7];
-sx reg[7];
-rz(-pi/2) reg[7];
-cx reg[7],reg[6];
-cx reg[6],reg[1];
-cx reg[1],reg[0];
-rz(1.736069) reg[0];
-cx reg[1],reg[0];
-rz(-pi/2) reg[0];
-sx reg[0];
-rz(-pi/2) reg[0];
-cx reg[6],reg[1];
-cx reg[7],reg[6];
-rz(-pi/2) reg[7];
-sx reg[7];
-rz(-pi/2) reg[7];
-cx reg[7],reg[6];
-cx reg[6],reg[1];
-cx reg[1],reg[0];
-rz(1.736069) reg[0];
-cx reg[1],reg[0];
-cx reg[6],reg[1];
-cx reg[7],reg[6];
-rz(-pi/2) reg[6];
-sx reg[6];
-rz(-pi/2) reg[6];
-rz(-pi/2) reg[7];
-sx reg[7];
-rz(-pi/2) reg[7];
-cx reg[7],reg[6];
-cx reg[6],reg[1];
-cx reg[1],reg[0];
-rz(1.736069) reg[0];
-cx reg[1],reg[0];
-rz(-pi/2) reg[0];
-sx reg[0];
-rz(-pi/2) reg[0];
-cx reg[6],reg[1];
-cx reg[7],reg[6];
-rz(-pi/2) reg[6];
-sx reg[6];
-rz(-pi/2) reg[6];
-cx reg[7],reg[6];
-cx reg[6],reg[1];
-cx reg[1],reg[0];
-rz(1.736069) reg[0];
-cx reg[1],reg[0];
-cx reg[6],reg[1];
-cx reg[7],reg[6];
-rz(-pi/2) reg[6];
-sx reg[6];
-rz(-pi/2) reg[6];
-rz(-pi/2) reg[7];
-sx reg[7];
-rz(-pi/2) reg[7];
-cx reg[7],reg[6];
-cx reg[6],reg[1];
-cx reg[1],reg[0];
-rz(1.736069) reg[0];
-cx reg[1],reg[0];
-rz(-pi/2) reg[0];
-sx reg[0];
-rz(-pi/2) reg[0];
-cx reg[6],reg[1];
-cx reg[7],reg[6];
-rz(-pi/2) reg[7];
-sx reg[7];
-rz(-pi/2) reg[7];
-cx reg[7],reg[6];
-cx reg[6],reg[1];
-cx reg[1],reg[0];
-rz(1.736069) reg[0];
-cx reg[1],reg[0];
-cx reg[6],reg[1];
-cx reg[7],reg[6];
-rz(-pi/2) reg[6];
-sx reg[6];
-rz(-pi/2) reg[6];
-rz(-pi/2) reg[7];
-sx reg[7];
-rz(-pi/2) reg[7];
-cx reg[7],reg[6];
-cx reg[6],reg[1];
-cx reg[1],reg[0];
-rz(1.736069) reg[0];
-cx reg[1],reg[0];
-rz(-pi/2) reg[0];
-sx reg[0];
-rz(-pi/2) reg[0];
-cx reg[6],reg[1];
-cx reg[7],reg[6];
-rz(-pi/2) reg[6];
-sx reg[6];
-rz(-pi/2) reg[6];
-cx reg[7],reg[6];
-cx reg[6],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(2.509321) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[6],reg[2];
-cx reg[7],reg[6];
-rz(-pi/2) reg[6];
-sx reg[6];
-rz(-pi/2) reg[6];
-rz(-pi/2) reg[7];
-sx reg[7];
-rz(-pi/2) reg[7];
-cx reg[7],reg[6];
-cx reg[6],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(2.509321) reg[0];
-cx reg[1],reg[0];
-rz(-pi/2) reg[0];
-sx reg[0];
-rz(-pi/2) reg[0];
-cx reg[2],reg[1];
-cx reg[6],reg[2];
-cx reg[7],reg[6];
-rz(-pi/2) reg[7];
-sx reg[7];
-rz(-pi/2) reg[7];
-cx reg[7],reg[6];
-cx reg[6],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(2.509321) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[6],reg[2];
-cx reg[7],reg[6];
-rz(-pi/2) reg[6];
-sx reg[6];
-rz(-pi/2) reg[6];
-rz(-pi/2) reg[7];
-sx reg[7];
-rz(-pi/2) reg[7];
-cx reg[7],reg[6];
-cx reg[6],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(2.509321) reg[0];
-cx reg[1],reg[0];
-rz(-pi/2) reg[0];
-sx reg[0];
-rz(-pi/2) reg[0];
-cx reg[2],reg[1];
-cx reg[6],reg[2];
-cx reg[7],reg[6];
-rz(-pi/2) reg[6];
-sx reg[6];
-rz(-pi/2) reg[6];
-cx reg[7],reg[6];
-cx reg[6],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(2.509321) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[6],reg[2];
-cx reg[7],reg[6];
-rz(-pi/2) reg[6];
-sx reg[6];
-rz(-pi/2) reg[6];
-rz(-pi/2) reg[7];
-sx reg[7];
-rz(-pi/2) reg[7];
-cx reg[7],reg[6];
-cx reg[6],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(2.509321) reg[0];
-cx reg[1],reg[0];
-rz(-pi/2) reg[0];
-sx reg[0];
-rz(-pi/2) reg[0];
-cx reg[2],reg[1];
-cx reg[6],reg[2];
-cx reg[7],reg[6];
-rz(-pi/2) reg[7];
-sx reg[7];
-rz(-pi/2) reg[7];
-cx reg[7],reg[6];
-cx reg[6],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(2.509321) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[6],reg[2];
-cx reg[7],reg[6];
-rz(-pi/2) reg[6];
-sx reg[6];
-rz(-pi/2) reg[6];
-rz(-pi/2) reg[7];
-sx reg[7];
-rz(-pi/2) reg[7];
-cx reg[7],reg[6];
-cx reg[6],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(2.509321) reg[0];
-cx reg[1],reg[0];
-rz(-pi/2) reg[0];
-sx reg[0];
-rz(-pi/2) reg[0];
-cx reg[2],reg[1];
-cx reg[6],reg[2];
-cx reg[7],reg[6];
-rz(-pi/2) reg[6];
-sx reg[6];
-rz(-pi/2) reg[6];
-cx reg[7],reg[6];
-cx reg[6],reg[2];
-cx reg[2],reg[1];
-rz(0.692815) reg[1];
-cx reg[2],reg[1];
-cx reg[6],reg[2];
-cx reg[7],reg[6];
-rz(-pi/2) reg[6];
-sx reg[6];
-rz(-pi/2) reg[6];
-rz(-pi/2) reg[7];
-sx reg[7];
-rz(-pi/2) reg[7];
-cx reg[7],reg[6];
-cx reg[6],reg[2];
-cx reg[2],reg[1];
-rz(0.692815) reg[1];
-cx reg[2],reg[1];
-rz(-pi/2) reg[1];
-sx reg[1];
-rz(-pi/2) reg[1];
-cx reg[6],reg[2];
-cx reg[7],reg[6];
-rz(-pi/2) reg[7];
-sx reg[7];
-rz(-pi/2) reg[7];
-cx reg[7],reg[6];
-cx reg[6],reg[2];
-cx reg[2],reg[1];
-rz(0.692815) reg[1];
-cx reg[2],reg[1];
-cx reg[6],reg[2];
-cx reg[7],reg[6];
-rz(-pi/2) reg[6];
-sx reg[6];
-rz(-pi/2) reg[6];
-rz(-pi/2) reg[7];
-sx reg[7];
-rz(-pi/2) reg[7];
-cx reg[7],reg[6];
-cx reg[6],reg[2];
-cx reg[2],reg[1];
-rz(0.692815) reg[1];
-cx reg[2],reg[1];
-rz(-pi/2) reg[1];
-sx reg[1];
-rz(-pi/2) reg[1];
-cx reg[6],reg[2];
-cx reg[7],reg[6];
-rz(-pi/2) reg[6];
-sx reg[6];
-rz(-pi/2) reg[6];
-cx reg[7],reg[6];
-cx reg[6],reg[2];
-cx reg[2],reg[1];
-rz(0.692815) reg[1];
-cx reg[2],reg[1];
-cx reg[6],reg[2];
-cx reg[7],reg[6];
-rz(-pi/2) reg[6];
-sx reg[6];
-rz(-pi/2) reg[6];
-rz(-pi/2) reg[7];
-sx reg[7];
-rz(-pi/2) reg[7];
-cx reg[7],reg[6];
-cx reg[6],reg[2];
-cx reg[2],reg[1];
-rz(0.692815) reg[1];
-cx reg[2],reg[1];
-rz(-pi/2) reg[1];
-sx reg[1];
-rz(-pi/2) reg[1];
-cx reg[6],reg[2];
-cx reg[7],reg[6];
-rz(-pi/2) reg[7];
-sx reg[7];
-rz(-pi/2) reg[7];
-cx reg[7],reg[6];
-cx reg[6],reg[2];
-cx reg[2],reg[1];
-rz(0.692815) reg[1];
-cx reg[2],reg[1];
-cx reg[6],reg[2];
-cx reg[7],reg[6];
-rz(-pi/2) reg[6];
-sx reg[6];
-rz(-pi/2) reg[6];
-rz(-pi/2) reg[7];
-sx reg[7];
-rz(-pi/2) reg[7];
-cx reg[7],reg[6];
-cx reg[6],reg[2];
-cx reg[2],reg[1];
-rz(0.692815) reg[1];
-cx reg[2],reg[1];
-rz(-pi/2) reg[1];
-sx reg[1];
-rz(-pi/2) reg[1];
-cx reg[6],reg[2];
-cx reg[7],reg[6];
-rz(-pi/2) reg[6];
-sx reg[6];
-rz(-pi/2) reg[6];
-cx reg[7],reg[6];
-cx reg[6],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(2.448221) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[6],reg[3];
-cx reg[7],reg[6];
-rz(-pi/2) reg[6];
-sx reg[6];
-rz(-pi/2) reg[6];
-rz(-pi/2) reg[7];
-sx reg[7];
-rz(-pi/2) reg[7];
-cx reg[7],reg[6];
-cx reg[6],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(2.448221) reg[0];
-cx reg[1],reg[0];
-rz(-pi/2) reg[0];
-sx reg[0];
-rz(-pi/2) reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[6],reg[3];
-cx reg[7],reg[6];
-rz(-pi/2) reg[7];
-sx reg[7];
-rz(-pi/2) reg[7];
-cx reg[7],reg[6];
-cx reg[6],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(2.448221) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[6],reg[3];
-cx reg[7],reg[6];
-rz(-pi/2) reg[6];
-sx reg[6];
-rz(-pi/2) reg[6];
-rz(-pi/2) reg[7];
-sx reg[7];
-rz(-pi/2) reg[7];
-cx reg[7],reg[6];
-cx reg[6],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(2.448221) reg[0];
-cx reg[1],reg[0];
-rz(-pi/2) reg[0];
-sx reg[0];
-rz(-pi/2) reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[6],reg[3];
-cx reg[7],reg[6];
-rz(-pi/2) reg[6];
-sx reg[6];
-rz(-pi/2) reg[6];
-cx reg[7],reg[6];
-cx reg[6],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(2.448221) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[6],reg[3];
-cx reg[7],reg[6];
-rz(-pi/2) reg[6];
-sx reg[6];
-rz(-pi/2) reg[6];
-rz(-pi/2) reg[7];
-sx reg[7];
-rz(-pi/2) reg[7];
-cx reg[7],reg[6];
-cx reg[6],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(2.448221) reg[0];
-cx reg[1],reg[0];
-rz(-pi/2) reg[0];
-sx reg[0];
-rz(-pi/2) reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[6],reg[3];
-cx reg[7],reg[6];
-rz(-pi/2) reg[7];
-sx reg[7];
-rz(-pi/2) reg[7];
-cx reg[7],reg[6];
-cx reg[6],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(2.448221) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[6],reg[3];
-cx reg[7],reg[6];
-rz(-pi/2) reg[6];
-sx reg[6];
-rz(-pi/2) reg[6];
-rz(-pi/2) reg[7];
-sx reg[7];
-rz(-pi/2) reg[7];
-cx reg[7],reg[6];
-cx reg[6],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(2.448221) reg[0];
-cx reg[1],reg[0];
-rz(-pi/2) reg[0];
-sx reg[0];
-rz(-pi/2) reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[6],reg[3];
-cx reg[7],reg[6];
-rz(-pi/2) reg[6];
-sx reg[6];
-rz(-pi/2) reg[6];
-cx reg[7],reg[6];
-cx reg[6],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-rz(2.525158) reg[1];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[6],reg[3];
-cx reg[7],reg[6];
-rz(-pi/2) reg[6];
-sx reg[6];
-rz(-pi/2) reg[6];
-rz(-pi/2) reg[7];
-sx reg[7];
-rz(-pi/2) reg[7];
-cx reg[7],reg[6];
-cx reg[6],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-rz(2.525158) reg[1];
-cx reg[2],reg[1];
-rz(-pi/2) reg[1];
-sx reg[1];
-rz(-pi/2) reg[1];
-cx reg[3],reg[2];
-cx reg[6],reg[3];
-cx reg[7],reg[6];
-rz(-pi/2) reg[7];
-sx reg[7];
-rz(-pi/2) reg[7];
-cx reg[7],reg[6];
-cx reg[6],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-rz(2.525158) reg[1];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[6],reg[3];
-cx reg[7],reg[6];
-rz(-pi/2) reg[6];
-sx reg[6];
-rz(-pi/2) reg[6];
-rz(-pi/2) reg[7];
-sx reg[7];
-rz(-pi/2) reg[7];
-cx reg[7],reg[6];
-cx reg[6],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-rz(2.525158) reg[1];
-cx reg[2],reg[1];
-rz(-pi/2) reg[1];
-sx reg[1];
-rz(-pi/2) reg[1];
-cx reg[3],reg[2];
-cx reg[6],reg[3];
-cx reg[7],reg[6];
-rz(-pi/2) reg[6];
-sx reg[6];
-rz(-pi/2) reg[6];
-cx reg[7],reg[6];
-cx reg[6],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-rz(2.525158) reg[1];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[6],reg[3];
-cx reg[7],reg[6];
-rz(-pi/2) reg[6];
-sx reg[6];
-rz(-pi/2) reg[6];
-rz(-pi/2) reg[7];
-sx reg[7];
-rz(-pi/2) reg[7];
-cx reg[7],reg[6];
-cx reg[6],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-rz(2.525158) reg[1];
-cx reg[2],reg[1];
-rz(-pi/2) reg[1];
-sx reg[1];
-rz(-pi/2) reg[1];
-cx reg[3],reg[2];
-cx reg[6],reg[3];
-cx reg[7],reg[6];
-rz(-pi/2) reg[7];
-sx reg[7];
-rz(-pi/2) reg[7];
-cx reg[7],reg[6];
-cx reg[6],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-rz(2.525158) reg[1];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[6],reg[3];
-cx reg[7],reg[6];
-rz(-pi/2) reg[6];
-sx reg[6];
-rz(-pi/2) reg[6];
-rz(-pi/2) reg[7];
-sx reg[7];
-rz(-pi/2) reg[7];
-cx reg[7],reg[6];
-cx reg[6],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-rz(2.525158) reg[1];
-cx reg[2],reg[1];
-rz(-pi/2) reg[1];
-sx reg[1];
-rz(-pi/2) reg[1];
-cx reg[3],reg[2];
-cx reg[6],reg[3];
-cx reg[7],reg[6];
-rz(-pi/2) reg[6];
-sx reg[6];
-rz(-pi/2) reg[6];
-cx reg[7],reg[6];
-cx reg[6],reg[3];
-cx reg[3],reg[2];
-rz(1.632131) reg[2];
-cx reg[3],reg[2];
-cx reg[6],reg[3];
-cx reg[7],reg[6];
-rz(-pi/2) reg[6];
-sx reg[6];
-rz(-pi/2) reg[6];
-rz(-pi/2) reg[7];
-sx reg[7];
-rz(-pi/2) reg[7];
-cx reg[7],reg[6];
-cx reg[6],reg[3];
-cx reg[3],reg[2];
-rz(1.632131) reg[2];
-cx reg[3],reg[2];
-rz(-pi/2) reg[2];
-sx reg[2];
-rz(-pi/2) reg[2];
-cx reg[6],reg[3];
-cx reg[7],reg[6];
-rz(-pi/2) reg[7];
-sx reg[7];
-rz(-pi/2) reg[7];
-cx reg[7],reg[6];
-cx reg[6],reg[3];
-cx reg[3],reg[2];
-rz(1.632131) reg[2];
-cx reg[3],reg[2];
-cx reg[6],reg[3];
-cx reg[7],reg[6];
-rz(-pi/2) reg[6];
-sx reg[6];
-rz(-pi/2) reg[6];
-rz(-pi/2) reg[7];
-sx reg[7];
-rz(-pi/2) reg[7];
-cx reg[7],reg[6];
-cx reg[6],reg[3];
-cx reg[3],reg[2];
-rz(1.632131) reg[2];
-cx reg[3],reg[2];
-rz(-pi/2) reg[2];
-sx reg[2];
-rz(-pi/2) reg[2];
-cx reg[6],reg[3];
-cx reg[7],reg[6];
-rz(-pi/2) reg[6];
-sx reg[6];
-rz(-pi/2) reg[6];
-cx reg[7],reg[6];
-cx reg[6],reg[3];
-cx reg[3],reg[2];
-rz(1.632131) reg[2];
-cx reg[3],reg[2];
-cx reg[6],reg[3];
-cx reg[7],reg[6];
-rz(-pi/2) reg[6];
-sx reg[6];
-rz(-pi/2) reg[6];
-rz(-pi/2) reg[7];
-sx reg[7];
-rz(-pi/2) reg[7];
-cx reg[7],reg[6];
-cx reg[6],reg[3];
-cx reg[3],reg[2];
-rz(1.632131) reg[2];
-cx reg[3],reg[2];
-rz(-pi/2) reg[2];
-sx reg[2];
-rz(-pi/2) reg[2];
-cx reg[6],reg[3];
-cx reg[7],reg[6];
-rz(-pi/2) reg[7];
-sx reg[7];
-rz(-pi/2) reg[7];
-cx reg[7],reg[6];
-cx reg[6],reg[3];
-cx reg[3],reg[2];
-rz(1.632131) reg[2];
-cx reg[3],reg[2];
-cx reg[6],reg[3];
-cx reg[7],reg[6];
-rz(-pi/2) reg[6];
-sx reg[6];
-rz(-pi/2) reg[6];
-rz(-pi/2) reg[7];
-sx reg[7];
-rz(-pi/2) reg[7];
-cx reg[7],reg[6];
-cx reg[6],reg[3];
-cx reg[3],reg[2];
-rz(1.632131) reg[2];
-cx reg[3],reg[2];
-rz(-pi/2) reg[2];
-sx reg[2];
-rz(-pi/2) reg[2];
-cx reg[6],reg[3];
-cx reg[7],reg[6];
-rz(-pi/2) reg[6];
-sx reg[6];
-rz(-pi/2) reg[6];
-cx reg[7],reg[6];
-cx reg[6],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(2.82111) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[6],reg[4];
-cx reg[7],reg[6];
-rz(-pi/2) reg[6];
-sx reg[6];
-rz(-pi/2) reg[6];
-rz(-pi/2) reg[7];
-sx reg[7];
-rz(-pi/2) reg[7];
-cx reg[7],reg[6];
-cx reg[6],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(2.82111) reg[0];
-cx reg[1],reg[0];
-rz(-pi/2) reg[0];
-sx reg[0];
-rz(-pi/2) reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[6],reg[4];
-cx reg[7],reg[6];
-rz(-pi/2) reg[7];
-sx reg[7];
-rz(-pi/2) reg[7];
-cx reg[7],reg[6];
-cx reg[6],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(2.82111) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[6],reg[4];
-cx reg[7],reg[6];
-rz(-pi/2) reg[6];
-sx reg[6];
-rz(-pi/2) reg[6];
-rz(-pi/2) reg[7];
-sx reg[7];
-rz(-pi/2) reg[7];
-cx reg[7],reg[6];
-cx reg[6],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(2.82111) reg[0];
-cx reg[1],reg[0];
-rz(-pi/2) reg[0];
-sx reg[0];
-rz(-pi/2) reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[6],reg[4];
-cx reg[7],reg[6];
-rz(-pi/2) reg[6];
-sx reg[6];
-rz(-pi/2) reg[6];
-cx reg[7],reg[6];
-cx reg[6],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(2.82111) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[6],reg[4];
-cx reg[7],reg[6];
-rz(-pi/2) reg[6];
-sx reg[6];
-rz(-pi/2) reg[6];
-rz(-pi/2) reg[7];
-sx reg[7];
-rz(-pi/2) reg[7];
-cx reg[7],reg[6];
-cx reg[6],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(2.82111) reg[0];
-cx reg[1],reg[0];
-rz(-pi/2) reg[0];
-sx reg[0];
-rz(-pi/2) reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[6],reg[4];
-cx reg[7],reg[6];
-rz(-pi/2) reg[7];
-sx reg[7];
-rz(-pi/2) reg[7];
-cx reg[7],reg[6];
-cx reg[6],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(2.82111) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[6],reg[4];
-cx reg[7],reg[6];
-rz(-pi/2) reg[6];
-sx reg[6];
-rz(-pi/2) reg[6];
-rz(-pi/2) reg[7];
-sx reg[7];
-rz(-pi/2) reg[7];
-cx reg[7],reg[6];
-cx reg[6],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(2.82111) reg[0];
-cx reg[1],reg[0];
-rz(-pi/2) reg[0];
-sx reg[0];
-rz(-pi/2) reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[6],reg[4];
-cx reg[7],reg[6];
-rz(-pi/2) reg[6];
-sx reg[6];
-rz(-pi/2) reg[6];
-cx reg[7],reg[6];
-cx reg[6],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-rz(3.619499) reg[1];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[6],reg[4];
-cx reg[7],reg[6];
-rz(-pi/2) reg[6];
-sx reg[6];
-rz(-pi/2) reg[6];
-rz(-pi/2) reg[7];
-sx reg[7];
-rz(-pi/2) reg[7];
-cx reg[7],reg[6];
-cx reg[6],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-rz(3.619499) reg[1];
-cx reg[2],reg[1];
-rz(-pi/2) reg[1];
-sx reg[1];
-rz(-pi/2) reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[6],reg[4];
-cx reg[7],reg[6];
-rz(-pi/2) reg[7];
-sx reg[7];
-rz(-pi/2) reg[7];
-cx reg[7],reg[6];
-cx reg[6],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-rz(3.619499) reg[1];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[6],reg[4];
-cx reg[7],reg[6];
-rz(-pi/2) reg[6];
-sx reg[6];
-rz(-pi/2) reg[6];
-rz(-pi/2) reg[7];
-sx reg[7];
-rz(-pi/2) reg[7];
-cx reg[7],reg[6];
-cx reg[6],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-rz(3.619499) reg[1];
-cx reg[2],reg[1];
-rz(-pi/2) reg[1];
-sx reg[1];
-rz(-pi/2) reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[6],reg[4];
-cx reg[7],reg[6];
-rz(-pi/2) reg[6];
-sx reg[6];
-rz(-pi/2) reg[6];
-cx reg[7],reg[6];
-cx reg[6],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-rz(3.619499) reg[1];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[6],reg[4];
-cx reg[7],reg[6];
-rz(-pi/2) reg[6];
-sx reg[6];
-rz(-pi/2) reg[6];
-rz(-pi/2) reg[7];
-sx reg[7];
-rz(-pi/2) reg[7];
-cx reg[7],reg[6];
-cx reg[6],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-rz(3.619499) reg[1];
-cx reg[2],reg[1];
-rz(-pi/2) reg[1];
-sx reg[1];
-rz(-pi/2) reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[6],reg[4];
-cx reg[7],reg[6];
-rz(-pi/2) reg[7];
-sx reg[7];
-rz(-pi/2) reg[7];
-cx reg[7],reg[6];
-cx reg[6],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-rz(3.619499) reg[1];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[6],reg[4];
-cx reg[7],reg[6];
-rz(-pi/2) reg[6];
-sx reg[6];
-rz(-pi/2) reg[6];
-rz(-pi/2) reg[7];
-sx reg[7];
-rz(-pi/2) reg[7];
-cx reg[7],reg[6];
-cx reg[6],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-rz(3.619499) reg[1];
-cx reg[2],reg[1];
-rz(-pi/2) reg[1];
-sx reg[1];
-rz(-pi/2) reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[6],reg[4];
-cx reg[7],reg[6];
-rz(-pi/2) reg[6];
-sx reg[6];
-rz(-pi/2) reg[6];
-cx reg[7],reg[6];
-cx reg[6],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-rz(1.732299) reg[2];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[6],reg[4];
-cx reg[7],reg[6];
-rz(-pi/2) reg[6];
-sx reg[6];
-rz(-pi/2) reg[6];
-rz(-pi/2) reg[7];
-sx reg[7];
-rz(-pi/2) reg[7];
-cx reg[7],reg[6];
-cx reg[6],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-rz(1.732299) reg[2];
-cx reg[3],reg[2];
-rz(-pi/2) reg[2];
-sx reg[2];
-rz(-pi/2) reg[2];
-cx reg[4],reg[3];
-cx reg[6],reg[4];
-cx reg[7],reg[6];
-rz(-pi/2) reg[7];
-sx reg[7];
-rz(-pi/2) reg[7];
-cx reg[7],reg[6];
-cx reg[6],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-rz(1.732299) reg[2];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[6],reg[4];
-cx reg[7],reg[6];
-rz(-pi/2) reg[6];
-sx reg[6];
-rz(-pi/2) reg[6];
-rz(-pi/2) reg[7];
-sx reg[7];
-rz(-pi/2) reg[7];
-cx reg[7],reg[6];
-cx reg[6],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-rz(1.732299) reg[2];
-cx reg[3],reg[2];
-rz(-pi/2) reg[2];
-sx reg[2];
-rz(-pi/2) reg[2];
-cx reg[4],reg[3];
-cx reg[6],reg[4];
-cx reg[7],reg[6];
-rz(-pi/2) reg[6];
-sx reg[6];
-rz(-pi/2) reg[6];
-cx reg[7],reg[6];
-cx reg[6],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-rz(1.732299) reg[2];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[6],reg[4];
-cx reg[7],reg[6];
-rz(-pi/2) reg[6];
-sx reg[6];
-rz(-pi/2) reg[6];
-rz(-pi/2) reg[7];
-sx reg[7];
-rz(-pi/2) reg[7];
-cx reg[7],reg[6];
-cx reg[6],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-rz(1.732299) reg[2];
-cx reg[3],reg[2];
-rz(-pi/2) reg[2];
-sx reg[2];
-rz(-pi/2) reg[2];
-cx reg[4],reg[3];
-cx reg[6],reg[4];
-cx reg[7],reg[6];
-rz(-pi/2) reg[7];
-sx reg[7];
-rz(-pi/2) reg[7];
-cx reg[7],reg[6];
-cx reg[6],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-rz(1.732299) reg[2];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[6],reg[4];
-cx reg[7],reg[6];
-rz(-pi/2) reg[6];
-sx reg[6];
-rz(-pi/2) reg[6];
-rz(-pi/2) reg[7];
-sx reg[7];
-rz(-pi/2) reg[7];
-cx reg[7],reg[6];
-cx reg[6],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-rz(1.732299) reg[2];
-cx reg[3],reg[2];
-rz(-pi/2) reg[2];
-sx reg[2];
-rz(-pi/2) reg[2];
-cx reg[4],reg[3];
-cx reg[6],reg[4];
-cx reg[7],reg[6];
-rz(-pi/2) reg[6];
-sx reg[6];
-rz(-pi/2) reg[6];
-cx reg[7],reg[6];
-cx reg[6],reg[4];
-cx reg[4],reg[3];
-rz(0.3668855) reg[3];
-cx reg[4],reg[3];
-cx reg[6],reg[4];
-cx reg[7],reg[6];
-rz(-pi/2) reg[6];
-sx reg[6];
-rz(-pi/2) reg[6];
-rz(-pi/2) reg[7];
-sx reg[7];
-rz(-pi/2) reg[7];
-cx reg[7],reg[6];
-cx reg[6],reg[4];
-cx reg[4],reg[3];
-rz(0.3668855) reg[3];
-cx reg[4],reg[3];
-rz(-pi/2) reg[3];
-sx reg[3];
-rz(-pi/2) reg[3];
-cx reg[6],reg[4];
-cx reg[7],reg[6];
-rz(-pi/2) reg[7];
-sx reg[7];
-rz(-pi/2) reg[7];
-cx reg[7],reg[6];
-cx reg[6],reg[4];
-cx reg[4],reg[3];
-rz(0.3668855) reg[3];
-cx reg[4],reg[3];
-cx reg[6],reg[4];
-cx reg[7],reg[6];
-rz(-pi/2) reg[6];
-sx reg[6];
-rz(-pi/2) reg[6];
-rz(-pi/2) reg[7];
-sx reg[7];
-rz(-pi/2) reg[7];
-cx reg[7],reg[6];
-cx reg[6],reg[4];
-cx reg[4],reg[3];
-rz(0.3668855) reg[3];
-cx reg[4],reg[3];
-rz(-pi/2) reg[3];
-sx reg[3];
-rz(-pi/2) reg[3];
-cx reg[6],reg[4];
-cx reg[7],reg[6];
-rz(-pi/2) reg[6];
-sx reg[6];
-rz(-pi/2) reg[6];
-cx reg[7],reg[6];
-cx reg[6],reg[4];
-cx reg[4],reg[3];
-rz(0.3668855) reg[3];
-cx reg[4],reg[3];
-cx reg[6],reg[4];
-cx reg[7],reg[6];
-rz(-pi/2) reg[6];
-sx reg[6];
-rz(-pi/2) reg[6];
-rz(-pi/2) reg[7];
-sx reg[7];
-rz(-pi/2) reg[7];
-cx reg[7],reg[6];
-cx reg[6],reg[4];
-cx reg[4],reg[3];
-rz(0.3668855) reg[3];
-cx reg[4],reg[3];
-rz(-pi/2) reg[3];
-sx reg[3];
-rz(-pi/2) reg[3];
-cx reg[6],reg[4];
-cx reg[7],reg[6];
-rz(-pi/2) reg[7];
-sx reg[7];
-rz(-pi/2) reg[7];
-cx reg[7],reg[6];
-cx reg[6],reg[4];
-cx reg[4],reg[3];
-rz(0.3668855) reg[3];
-cx reg[4],reg[3];
-cx reg[6],reg[4];
-cx reg[7],reg[6];
-rz(-pi/2) reg[6];
-sx reg[6];
-rz(-pi/2) reg[6];
-rz(-pi/2) reg[7];
-sx reg[7];
-rz(-pi/2) reg[7];
-cx reg[7],reg[6];
-cx reg[6],reg[4];
-cx reg[4],reg[3];
-rz(0.3668855) reg[3];
-cx reg[4],reg[3];
-rz(-pi/2) reg[3];
-sx reg[3];
-rz(-pi/2) reg[3];
-cx reg[6],reg[4];
-cx reg[7],reg[6];
-rz(-pi/2) reg[6];
-sx reg[6];
-rz(-pi/2) reg[6];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(4.179376) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-rz(-pi/2) reg[6];
-sx reg[6];
-rz(-pi/2) reg[6];
-rz(-pi/2) reg[7];
-sx reg[7];
-rz(-pi/2) reg[7];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(4.179376) reg[0];
-cx reg[1],reg[0];
-rz(-pi/2) reg[0];
-sx reg[0];
-rz(-pi/2) reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-rz(-pi/2) reg[7];
-sx reg[7];
-rz(-pi/2) reg[7];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(4.179376) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-rz(-pi/2) reg[6];
-sx reg[6];
-rz(-pi/2) reg[6];
-rz(-pi/2) reg[7];
-sx reg[7];
-rz(-pi/2) reg[7];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(4.179376) reg[0];
-cx reg[1],reg[0];
-rz(-pi/2) reg[0];
-sx reg[0];
-rz(-pi/2) reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-rz(-pi/2) reg[6];
-sx reg[6];
-rz(-pi/2) reg[6];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(4.179376) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-rz(-pi/2) reg[6];
-sx reg[6];
-rz(-pi/2) reg[6];
-rz(-pi/2) reg[7];
-sx reg[7];
-rz(-pi/2) reg[7];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(4.179376) reg[0];
-cx reg[1],reg[0];
-rz(-pi/2) reg[0];
-sx reg[0];
-rz(-pi/2) reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-rz(-pi/2) reg[7];
-sx reg[7];
-rz(-pi/2) reg[7];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(4.179376) reg[0];
-cx reg[1],reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-rz(-pi/2) reg[6];
-sx reg[6];
-rz(-pi/2) reg[6];
-rz(-pi/2) reg[7];
-sx reg[7];
-rz(-pi/2) reg[7];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(4.179376) reg[0];
-cx reg[1],reg[0];
-rz(-pi) reg[0];
-x reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-rz(-pi/2) reg[6];
-sx reg[6];
-rz(-pi/2) reg[6];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-rz(5.087414) reg[1];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-rz(-pi/2) reg[6];
-sx reg[6];
-rz(-pi/2) reg[6];
-rz(-pi/2) reg[7];
-sx reg[7];
-rz(-pi/2) reg[7];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-rz(5.087414) reg[1];
-cx reg[2],reg[1];
-rz(-pi/2) reg[1];
-sx reg[1];
-rz(-pi/2) reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-rz(-pi/2) reg[7];
-sx reg[7];
-rz(-pi/2) reg[7];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-rz(5.087414) reg[1];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-rz(-pi/2) reg[6];
-sx reg[6];
-rz(-pi/2) reg[6];
-rz(-pi/2) reg[7];
-sx reg[7];
-rz(-pi/2) reg[7];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-rz(5.087414) reg[1];
-cx reg[2],reg[1];
-rz(-pi/2) reg[1];
-sx reg[1];
-rz(-pi/2) reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-rz(-pi/2) reg[6];
-sx reg[6];
-rz(-pi/2) reg[6];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-rz(5.087414) reg[1];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-rz(-pi/2) reg[6];
-sx reg[6];
-rz(-pi/2) reg[6];
-rz(-pi/2) reg[7];
-sx reg[7];
-rz(-pi/2) reg[7];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-rz(5.087414) reg[1];
-cx reg[2],reg[1];
-rz(-pi/2) reg[1];
-sx reg[1];
-rz(-pi/2) reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-rz(-pi/2) reg[7];
-sx reg[7];
-rz(-pi/2) reg[7];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-rz(5.087414) reg[1];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-rz(-pi/2) reg[6];
-sx reg[6];
-rz(-pi/2) reg[6];
-rz(-pi/2) reg[7];
-sx reg[7];
-rz(-pi/2) reg[7];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-rz(5.087414) reg[1];
-cx reg[2],reg[1];
-rz(-pi) reg[1];
-x reg[1];
-cx reg[1],reg[0];
-rz(1.072369) reg[0];
-cx reg[1],reg[0];
-rz(-pi/2) reg[0];
-sx reg[0];
-rz(-pi/2) reg[0];
-rz(-pi/2) reg[1];
-sx reg[1];
-rz(-pi/2) reg[1];
-cx reg[1],reg[0];
-rz(1.072369) reg[0];
-cx reg[1],reg[0];
-rz(-pi/2) reg[0];
-sx reg[0];
-rz(-pi/2) reg[0];
-rz(-pi) reg[1];
-x reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-rz(-pi/2) reg[6];
-sx reg[6];
-rz(-pi/2) reg[6];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-rz(6.281917) reg[2];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-rz(-pi/2) reg[6];
-sx reg[6];
-rz(-pi/2) reg[6];
-rz(-pi/2) reg[7];
-sx reg[7];
-rz(-pi/2) reg[7];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-rz(6.281917) reg[2];
-cx reg[3],reg[2];
-rz(-pi/2) reg[2];
-sx reg[2];
-rz(-pi/2) reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-rz(-pi/2) reg[7];
-sx reg[7];
-rz(-pi/2) reg[7];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-rz(6.281917) reg[2];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-rz(-pi/2) reg[6];
-sx reg[6];
-rz(-pi/2) reg[6];
-rz(-pi/2) reg[7];
-sx reg[7];
-rz(-pi/2) reg[7];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-rz(6.281917) reg[2];
-cx reg[3],reg[2];
-rz(-pi/2) reg[2];
-sx reg[2];
-rz(-pi/2) reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-rz(-pi/2) reg[6];
-sx reg[6];
-rz(-pi/2) reg[6];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-rz(6.281917) reg[2];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-rz(-pi/2) reg[6];
-sx reg[6];
-rz(-pi/2) reg[6];
-rz(-pi/2) reg[7];
-sx reg[7];
-rz(-pi/2) reg[7];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-rz(6.281917) reg[2];
-cx reg[3],reg[2];
-rz(-pi/2) reg[2];
-sx reg[2];
-rz(-pi/2) reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-rz(-pi/2) reg[7];
-sx reg[7];
-rz(-pi/2) reg[7];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-rz(6.281917) reg[2];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-rz(-pi/2) reg[6];
-sx reg[6];
-rz(-pi/2) reg[6];
-rz(-pi/2) reg[7];
-sx reg[7];
-rz(-pi/2) reg[7];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-rz(6.281917) reg[2];
-cx reg[3],reg[2];
-rz(-pi) reg[2];
-x reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(1.769972) reg[0];
-cx reg[1],reg[0];
-rz(-pi/2) reg[0];
-sx reg[0];
-rz(-pi/2) reg[0];
-cx reg[2],reg[1];
-rz(-pi/2) reg[2];
-sx reg[2];
-rz(-pi/2) reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(1.769972) reg[0];
-cx reg[1],reg[0];
-rz(-pi/2) reg[0];
-sx reg[0];
-rz(-pi/2) reg[0];
-cx reg[2],reg[1];
-rz(pi/2) reg[1];
-sx reg[1];
-rz(pi/2) reg[1];
-rz(-pi/2) reg[2];
-sx reg[2];
-rz(-pi/2) reg[2];
-cx reg[2],reg[1];
-rz(4.363377) reg[1];
-cx reg[2],reg[1];
-rz(-pi/2) reg[1];
-sx reg[1];
-rz(-pi/2) reg[1];
-rz(-pi/2) reg[2];
-sx reg[2];
-rz(-pi/2) reg[2];
-cx reg[2],reg[1];
-rz(4.363377) reg[1];
-cx reg[2],reg[1];
-rz(-pi) reg[1];
-x reg[1];
-rz(-pi) reg[2];
-x reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-rz(-pi/2) reg[6];
-sx reg[6];
-rz(-pi/2) reg[6];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-rz(5.860174) reg[3];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-rz(-pi/2) reg[6];
-sx reg[6];
-rz(-pi/2) reg[6];
-rz(-pi/2) reg[7];
-sx reg[7];
-rz(-pi/2) reg[7];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-rz(5.860174) reg[3];
-cx reg[4],reg[3];
-rz(-pi/2) reg[3];
-sx reg[3];
-rz(-pi/2) reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-rz(-pi/2) reg[7];
-sx reg[7];
-rz(-pi/2) reg[7];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-rz(5.860174) reg[3];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-rz(-pi/2) reg[6];
-sx reg[6];
-rz(-pi/2) reg[6];
-rz(-pi/2) reg[7];
-sx reg[7];
-rz(-pi/2) reg[7];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-rz(5.860174) reg[3];
-cx reg[4],reg[3];
-rz(-pi/2) reg[3];
-sx reg[3];
-rz(-pi/2) reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-rz(-pi/2) reg[6];
-sx reg[6];
-rz(-pi/2) reg[6];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-rz(5.860174) reg[3];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-rz(-pi/2) reg[6];
-sx reg[6];
-rz(-pi/2) reg[6];
-rz(-pi/2) reg[7];
-sx reg[7];
-rz(-pi/2) reg[7];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-rz(5.860174) reg[3];
-cx reg[4],reg[3];
-rz(-pi/2) reg[3];
-sx reg[3];
-rz(-pi/2) reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-rz(-pi/2) reg[7];
-sx reg[7];
-rz(-pi/2) reg[7];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-rz(5.860174) reg[3];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-rz(-pi/2) reg[6];
-sx reg[6];
-rz(-pi/2) reg[6];
-rz(-pi/2) reg[7];
-sx reg[7];
-rz(-pi/2) reg[7];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-rz(5.860174) reg[3];
-cx reg[4],reg[3];
-rz(-pi) reg[3];
-x reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(0.4094162) reg[0];
-cx reg[1],reg[0];
-rz(-pi/2) reg[0];
-sx reg[0];
-rz(-pi/2) reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-rz(-pi/2) reg[3];
-sx reg[3];
-rz(-pi/2) reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(0.4094162) reg[0];
-cx reg[1],reg[0];
-rz(-pi/2) reg[0];
-sx reg[0];
-rz(-pi/2) reg[0];
-cx reg[2],reg[1];
-rz(pi/2) reg[1];
-sx reg[1];
-rz(pi/2) reg[1];
-cx reg[3],reg[2];
-rz(-pi/2) reg[3];
-sx reg[3];
-rz(-pi/2) reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-rz(3.037717) reg[1];
-cx reg[2],reg[1];
-rz(-pi/2) reg[1];
-sx reg[1];
-rz(-pi/2) reg[1];
-cx reg[3],reg[2];
-rz(-pi/2) reg[3];
-sx reg[3];
-rz(-pi/2) reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-rz(3.037717) reg[1];
-cx reg[2],reg[1];
-rz(-pi) reg[1];
-x reg[1];
-cx reg[3],reg[2];
-rz(pi/2) reg[2];
-sx reg[2];
-rz(pi/2) reg[2];
-rz(-pi/2) reg[3];
-sx reg[3];
-rz(-pi/2) reg[3];
-cx reg[3],reg[2];
-rz(1.949632) reg[2];
-cx reg[3],reg[2];
-rz(-pi/2) reg[2];
-sx reg[2];
-rz(-pi/2) reg[2];
-rz(-pi/2) reg[3];
-sx reg[3];
-rz(-pi/2) reg[3];
-cx reg[3],reg[2];
-rz(1.949632) reg[2];
-cx reg[3],reg[2];
-rz(-pi) reg[2];
-x reg[2];
-rz(-pi) reg[3];
-x reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-rz(-pi/2) reg[6];
-sx reg[6];
-rz(-pi/2) reg[6];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-rz(2.255147) reg[4];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-rz(-pi/2) reg[6];
-sx reg[6];
-rz(-pi/2) reg[6];
-rz(-pi/2) reg[7];
-sx reg[7];
-rz(-pi/2) reg[7];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-rz(2.255147) reg[4];
-cx reg[5],reg[4];
-rz(-pi/2) reg[4];
-sx reg[4];
-rz(-pi/2) reg[4];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-rz(-pi/2) reg[7];
-sx reg[7];
-rz(-pi/2) reg[7];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-rz(2.255147) reg[4];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-rz(-pi/2) reg[6];
-sx reg[6];
-rz(-pi/2) reg[6];
-rz(-pi/2) reg[7];
-sx reg[7];
-rz(-pi/2) reg[7];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-rz(2.255147) reg[4];
-cx reg[5],reg[4];
-rz(-pi/2) reg[4];
-sx reg[4];
-rz(-pi/2) reg[4];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-rz(-pi/2) reg[6];
-sx reg[6];
-rz(-pi/2) reg[6];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-rz(2.255147) reg[4];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-rz(-pi/2) reg[6];
-sx reg[6];
-rz(-pi/2) reg[6];
-rz(-pi/2) reg[7];
-sx reg[7];
-rz(-pi/2) reg[7];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-rz(2.255147) reg[4];
-cx reg[5],reg[4];
-rz(-pi/2) reg[4];
-sx reg[4];
-rz(-pi/2) reg[4];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-rz(-pi/2) reg[7];
-sx reg[7];
-rz(-pi/2) reg[7];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-rz(2.255147) reg[4];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-rz(-pi/2) reg[6];
-sx reg[6];
-rz(-pi/2) reg[6];
-rz(-pi/2) reg[7];
-sx reg[7];
-rz(-pi/2) reg[7];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-rz(2.255147) reg[4];
-cx reg[5],reg[4];
-rz(-pi) reg[4];
-x reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(3.725793) reg[0];
-cx reg[1],reg[0];
-rz(-pi/2) reg[0];
-sx reg[0];
-rz(-pi/2) reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-rz(-pi/2) reg[4];
-sx reg[4];
-rz(-pi/2) reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(3.725793) reg[0];
-cx reg[1],reg[0];
-rz(-pi/2) reg[0];
-sx reg[0];
-rz(-pi/2) reg[0];
-cx reg[2],reg[1];
-rz(pi/2) reg[1];
-sx reg[1];
-rz(pi/2) reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-rz(-pi/2) reg[4];
-sx reg[4];
-rz(-pi/2) reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-rz(3.286858) reg[1];
-cx reg[2],reg[1];
-rz(-pi/2) reg[1];
-sx reg[1];
-rz(-pi/2) reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-rz(-pi/2) reg[4];
-sx reg[4];
-rz(-pi/2) reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-rz(3.286858) reg[1];
-cx reg[2],reg[1];
-rz(-pi) reg[1];
-x reg[1];
-cx reg[3],reg[2];
-rz(pi/2) reg[2];
-sx reg[2];
-rz(pi/2) reg[2];
-cx reg[4],reg[3];
-rz(-pi/2) reg[4];
-sx reg[4];
-rz(-pi/2) reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-rz(3.531732) reg[2];
-cx reg[3],reg[2];
-rz(-pi/2) reg[2];
-sx reg[2];
-rz(-pi/2) reg[2];
-cx reg[4],reg[3];
-rz(-pi/2) reg[4];
-sx reg[4];
-rz(-pi/2) reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-rz(3.531732) reg[2];
-cx reg[3],reg[2];
-rz(-pi) reg[2];
-x reg[2];
-cx reg[4],reg[3];
-rz(pi/2) reg[3];
-sx reg[3];
-rz(pi/2) reg[3];
-rz(-pi/2) reg[4];
-sx reg[4];
-rz(-pi/2) reg[4];
-cx reg[4],reg[3];
-rz(0.2812523) reg[3];
-cx reg[4],reg[3];
-rz(-pi/2) reg[3];
-sx reg[3];
-rz(-pi/2) reg[3];
-rz(-pi/2) reg[4];
-sx reg[4];
-rz(-pi/2) reg[4];
-cx reg[4],reg[3];
-rz(0.2812523) reg[3];
-cx reg[4],reg[3];
-rz(-pi) reg[3];
-x reg[3];
-rz(-pi) reg[4];
-x reg[4];
-cx reg[6],reg[5];
-rz(pi/2) reg[5];
-sx reg[5];
-rz(pi/2) reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(1.586907) reg[0];
-cx reg[1],reg[0];
-rz(-pi/2) reg[0];
-sx reg[0];
-rz(-pi/2) reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-rz(-pi/2) reg[5];
-sx reg[5];
-rz(-pi/2) reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(1.586907) reg[0];
-cx reg[1],reg[0];
-rz(-pi/2) reg[0];
-sx reg[0];
-rz(-pi/2) reg[0];
-cx reg[2],reg[1];
-rz(pi/2) reg[1];
-sx reg[1];
-rz(pi/2) reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-rz(-pi/2) reg[5];
-sx reg[5];
-rz(-pi/2) reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-rz(0.1029809) reg[1];
-cx reg[2],reg[1];
-rz(-pi/2) reg[1];
-sx reg[1];
-rz(-pi/2) reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-rz(-pi/2) reg[5];
-sx reg[5];
-rz(-pi/2) reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-rz(0.1029809) reg[1];
-cx reg[2],reg[1];
-rz(-pi) reg[1];
-x reg[1];
-cx reg[3],reg[2];
-rz(pi/2) reg[2];
-sx reg[2];
-rz(pi/2) reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-rz(-pi/2) reg[5];
-sx reg[5];
-rz(-pi/2) reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-rz(0.3621992) reg[2];
-cx reg[3],reg[2];
-rz(-pi/2) reg[2];
-sx reg[2];
-rz(-pi/2) reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-rz(-pi/2) reg[5];
-sx reg[5];
-rz(-pi/2) reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-rz(0.3621992) reg[2];
-cx reg[3],reg[2];
-rz(-pi) reg[2];
-x reg[2];
-cx reg[4],reg[3];
-rz(pi/2) reg[3];
-sx reg[3];
-rz(pi/2) reg[3];
-cx reg[5],reg[4];
-rz(-pi/2) reg[5];
-sx reg[5];
-rz(-pi/2) reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-rz(1.144365) reg[3];
-cx reg[4],reg[3];
-rz(-pi/2) reg[3];
-sx reg[3];
-rz(-pi/2) reg[3];
-cx reg[5],reg[4];
-rz(-pi/2) reg[5];
-sx reg[5];
-rz(-pi/2) reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-rz(1.144365) reg[3];
-cx reg[4],reg[3];
-rz(-pi) reg[3];
-x reg[3];
-cx reg[5],reg[4];
-rz(pi/2) reg[4];
-sx reg[4];
-rz(pi/2) reg[4];
-rz(-pi/2) reg[5];
-sx reg[5];
-rz(-pi/2) reg[5];
-cx reg[5],reg[4];
-rz(4.962369) reg[4];
-cx reg[5],reg[4];
-rz(-pi/2) reg[4];
-sx reg[4];
-rz(-pi/2) reg[4];
-rz(-pi/2) reg[5];
-sx reg[5];
-rz(-pi/2) reg[5];
-cx reg[5],reg[4];
-rz(4.962369) reg[4];
-cx reg[5],reg[4];
-rz(-pi) reg[4];
-x reg[4];
-rz(-pi) reg[5];
-x reg[5];
-cx reg[7],reg[6];
-rz(-pi/2) reg[6];
-sx reg[6];
-rz(-pi/2) reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(1.072176) reg[0];
-cx reg[1],reg[0];
-rz(-pi/2) reg[0];
-sx reg[0];
-rz(-pi/2) reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-rz(-pi/2) reg[6];
-sx reg[6];
-rz(-pi/2) reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(1.072176) reg[0];
-cx reg[1],reg[0];
-rz(-pi/2) reg[0];
-sx reg[0];
-rz(-pi/2) reg[0];
-cx reg[2],reg[1];
-rz(pi/2) reg[1];
-sx reg[1];
-rz(pi/2) reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-rz(-pi/2) reg[6];
-sx reg[6];
-rz(-pi/2) reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-rz(5.936195) reg[1];
-cx reg[2],reg[1];
-rz(-pi/2) reg[1];
-sx reg[1];
-rz(-pi/2) reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-rz(-pi/2) reg[6];
-sx reg[6];
-rz(-pi/2) reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-rz(5.936195) reg[1];
-cx reg[2],reg[1];
-rz(-pi) reg[1];
-x reg[1];
-cx reg[3],reg[2];
-rz(pi/2) reg[2];
-sx reg[2];
-rz(pi/2) reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-rz(-pi/2) reg[6];
-sx reg[6];
-rz(-pi/2) reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-rz(4.511295) reg[2];
-cx reg[3],reg[2];
-rz(-pi/2) reg[2];
-sx reg[2];
-rz(-pi/2) reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-rz(-pi/2) reg[6];
-sx reg[6];
-rz(-pi/2) reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-rz(4.511295) reg[2];
-cx reg[3],reg[2];
-rz(-pi) reg[2];
-x reg[2];
-cx reg[4],reg[3];
-rz(pi/2) reg[3];
-sx reg[3];
-rz(pi/2) reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-rz(-pi/2) reg[6];
-sx reg[6];
-rz(-pi/2) reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-rz(3.864273) reg[3];
-cx reg[4],reg[3];
-rz(-pi/2) reg[3];
-sx reg[3];
-rz(-pi/2) reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-rz(-pi/2) reg[6];
-sx reg[6];
-rz(-pi/2) reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-rz(3.864273) reg[3];
-cx reg[4],reg[3];
-rz(-pi) reg[3];
-x reg[3];
-cx reg[5],reg[4];
-rz(pi/2) reg[4];
-sx reg[4];
-rz(pi/2) reg[4];
-cx reg[6],reg[5];
-rz(-pi/2) reg[6];
-sx reg[6];
-rz(-pi/2) reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-rz(3.494444) reg[4];
-cx reg[5],reg[4];
-rz(-pi/2) reg[4];
-sx reg[4];
-rz(-pi/2) reg[4];
-cx reg[6],reg[5];
-rz(-pi/2) reg[6];
-sx reg[6];
-rz(-pi/2) reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-rz(3.494444) reg[4];
-cx reg[5],reg[4];
-rz(-pi) reg[4];
-x reg[4];
-cx reg[6],reg[5];
-rz(pi/2) reg[5];
-sx reg[5];
-rz(pi/2) reg[5];
-rz(-pi/2) reg[6];
-sx reg[6];
-rz(-pi/2) reg[6];
-cx reg[6],reg[5];
-rz(5.171286) reg[5];
-cx reg[6],reg[5];
-rz(-pi/2) reg[5];
-sx reg[5];
-rz(-pi/2) reg[5];
-rz(-pi/2) reg[6];
-sx reg[6];
-rz(-pi/2) reg[6];
-cx reg[6],reg[5];
-rz(5.171286) reg[5];
-cx reg[6],reg[5];
-rz(-pi) reg[5];
-x reg[5];
-rz(-pi) reg[6];
-x reg[6];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(3.792309) reg[0];
-cx reg[1],reg[0];
-rz(-pi/2) reg[0];
-sx reg[0];
-rz(-pi/2) reg[0];
-cx reg[2],reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-rz(-pi/2) reg[7];
-sx reg[7];
-rz(-pi/2) reg[7];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-cx reg[1],reg[0];
-rz(3.792309) reg[0];
-cx reg[1],reg[0];
-rz(-pi) reg[0];
-x reg[0];
-cx reg[2],reg[1];
-rz(pi/2) reg[1];
-sx reg[1];
-rz(pi/2) reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-rz(-pi/2) reg[7];
-sx reg[7];
-rz(-pi/2) reg[7];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-rz(2.439179) reg[1];
-cx reg[2],reg[1];
-rz(-pi/2) reg[1];
-sx reg[1];
-rz(-pi/2) reg[1];
-cx reg[3],reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-rz(-pi/2) reg[7];
-sx reg[7];
-rz(-pi/2) reg[7];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-cx reg[2],reg[1];
-rz(2.439179) reg[1];
-cx reg[2],reg[1];
-rz(-pi) reg[1];
-x reg[1];
-cx reg[3],reg[2];
-rz(pi/2) reg[2];
-sx reg[2];
-rz(pi/2) reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-rz(-pi/2) reg[7];
-sx reg[7];
-rz(-pi/2) reg[7];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-rz(4.7732) reg[2];
-cx reg[3],reg[2];
-rz(-pi/2) reg[2];
-sx reg[2];
-rz(-pi/2) reg[2];
-cx reg[4],reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-rz(-pi/2) reg[7];
-sx reg[7];
-rz(-pi/2) reg[7];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-cx reg[3],reg[2];
-rz(4.7732) reg[2];
-cx reg[3],reg[2];
-rz(-pi) reg[2];
-x reg[2];
-cx reg[4],reg[3];
-rz(pi/2) reg[3];
-sx reg[3];
-rz(pi/2) reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-rz(-pi/2) reg[7];
-sx reg[7];
-rz(-pi/2) reg[7];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-rz(2.95733) reg[3];
-cx reg[4],reg[3];
-rz(-pi/2) reg[3];
-sx reg[3];
-rz(-pi/2) reg[3];
-cx reg[5],reg[4];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-rz(-pi/2) reg[7];
-sx reg[7];
-rz(-pi/2) reg[7];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-cx reg[4],reg[3];
-rz(2.95733) reg[3];
-cx reg[4],reg[3];
-rz(-pi) reg[3];
-x reg[3];
-cx reg[5],reg[4];
-rz(pi/2) reg[4];
-sx reg[4];
-rz(pi/2) reg[4];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-rz(-pi/2) reg[7];
-sx reg[7];
-rz(-pi/2) reg[7];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-rz(1.482614) reg[4];
-cx reg[5],reg[4];
-rz(-pi/2) reg[4];
-sx reg[4];
-rz(-pi/2) reg[4];
-cx reg[6],reg[5];
-cx reg[7],reg[6];
-rz(-pi/2) reg[7];
-sx reg[7];
-rz(-pi/2) reg[7];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-cx reg[5],reg[4];
-rz(1.482614) reg[4];
-cx reg[5],reg[4];
-rz(-pi) reg[4];
-x reg[4];
-cx reg[6],reg[5];
-rz(pi/2) reg[5];
-sx reg[5];
-rz(pi/2) reg[5];
-cx reg[7],reg[6];
-rz(-pi/2) reg[7];
-sx reg[7];
-rz(-pi/2) reg[7];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-rz(4.528935) reg[5];
-cx reg[6],reg[5];
-rz(-pi/2) reg[5];
-sx reg[5];
-rz(-pi/2) reg[5];
-cx reg[7],reg[6];
-rz(-pi/2) reg[7];
-sx reg[7];
-rz(-pi/2) reg[7];
-cx reg[7],reg[6];
-cx reg[6],reg[5];
-rz(4.528935) reg[5];
-cx reg[6],reg[5];
-rz(-pi) reg[5];
-x reg[5];
-cx reg[7],reg[6];
-rz(pi/2) reg[6];
-sx reg[6];
-rz(pi/2) reg[6];
-rz(-pi/2) reg[7];
-sx reg[7];
-rz(-pi/2) reg[7];
-cx reg[7],reg[6];
-rz(3.161797) reg[6];
-cx reg[7],reg[6];
-rz(-pi/2) reg[6];
-sx reg[6];
-rz(-pi/2) reg[6];
-rz(-pi/2) reg[7];
-sx reg[7];
-rz(-pi/2) reg[7];
-cx reg[7],reg[6];
-rz(3.161797) reg[6];
-cx reg[7],reg[6];
-rz(-pi) reg[6];
-x reg[6];
-rz(-pi) reg[7];
-x reg[7];
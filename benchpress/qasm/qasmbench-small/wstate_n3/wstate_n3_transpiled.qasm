@@ -1,42 +0,0 @@
-OPENQASM 2.0;
-include "qelib1.inc";
-qreg q[3];
-creg c[3];
-rz(-pi) q[0];
-sx q[0];
-rz(1.2309627) q[0];
-sx q[0];
-rz(pi/2) q[1];
-sx q[1];
-cx q[0],q[1];
-rz(pi/2) q[1];
-sx q[1];
-rz(3*pi/4) q[1];
-cx q[0],q[1];
-rz(pi/2) q[0];
-rz(-pi/4) q[1];
-sx q[1];
-rz(pi/2) q[2];
-sx q[2];
-rz(pi/2) q[2];
-cx q[1],q[2];
-rz(-pi/4) q[2];
-cx q[0],q[2];
-rz(pi/4) q[2];
-cx q[1],q[2];
-rz(pi/4) q[1];
-rz(-pi/4) q[2];
-cx q[0],q[2];
-cx q[0],q[1];
-rz(pi/4) q[0];
-rz(-pi/4) q[1];
-cx q[0],q[1];
-x q[0];
-x q[1];
-cx q[0],q[1];
-rz(3*pi/4) q[2];
-sx q[2];
-rz(pi/2) q[2];
-measure q[0] -> c[0];
-measure q[1] -> c[1];
-measure q[2] -> c[2];
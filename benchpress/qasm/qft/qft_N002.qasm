@@ -1,15 +0,0 @@
-OPENQASM 2.0;
-include "qelib1.inc";
-qreg q[2];
-ry(pi/2) q[1];
-rx(pi) q[1];
-rz(pi/4) q[1];
-cx q[1],q[0];
-rz(-pi/4) q[0];
-cx q[1],q[0];
-rz(pi/4) q[0];
-ry(pi/2) q[0];
-rx(pi) q[0];
-cx q[0],q[1];
-cx q[1],q[0];
-cx q[0],q[1];
\ No newline at end of file
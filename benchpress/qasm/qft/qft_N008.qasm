@@ -1,171 +0,0 @@
-OPENQASM 2.0;
-include "qelib1.inc";
-qreg q[8];
-ry(pi/2) q[7];
-rx(pi) q[7];
-rz(pi/4) q[7];
-cx q[7],q[6];
-rz(-pi/4) q[6];
-cx q[7],q[6];
-rz(pi/4) q[6];
-ry(pi/2) q[6];
-rx(pi) q[6];
-rz(pi/4) q[6];
-rz(pi/8) q[7];
-cx q[7],q[5];
-rz(-pi/8) q[5];
-cx q[7],q[5];
-rz(pi/8) q[5];
-cx q[6],q[5];
-rz(-pi/4) q[5];
-cx q[6],q[5];
-rz(pi/4) q[5];
-ry(pi/2) q[5];
-rx(pi) q[5];
-rz(pi/4) q[5];
-rz(pi/8) q[6];
-rz(pi/16) q[7];
-cx q[7],q[4];
-rz(-pi/16) q[4];
-cx q[7],q[4];
-rz(pi/16) q[4];
-cx q[6],q[4];
-rz(-pi/8) q[4];
-cx q[6],q[4];
-rz(pi/8) q[4];
-cx q[5],q[4];
-rz(-pi/4) q[4];
-cx q[5],q[4];
-rz(pi/4) q[4];
-ry(pi/2) q[4];
-rx(pi) q[4];
-rz(pi/4) q[4];
-rz(pi/8) q[5];
-rz(pi/16) q[6];
-rz(pi/32) q[7];
-cx q[7],q[3];
-rz(-pi/32) q[3];
-cx q[7],q[3];
-rz(pi/32) q[3];
-cx q[6],q[3];
-rz(-pi/16) q[3];
-cx q[6],q[3];
-rz(pi/16) q[3];
-cx q[5],q[3];
-rz(-pi/8) q[3];
-cx q[5],q[3];
-rz(pi/8) q[3];
-cx q[4],q[3];
-rz(-pi/4) q[3];
-cx q[4],q[3];
-rz(pi/4) q[3];
-ry(pi/2) q[3];
-rx(pi) q[3];
-rz(pi/4) q[3];
-rz(pi/8) q[4];
-rz(pi/16) q[5];
-rz(pi/32) q[6];
-rz(pi/64) q[7];
-cx q[7],q[2];
-rz(-pi/64) q[2];
-cx q[7],q[2];
-rz(pi/64) q[2];
-cx q[6],q[2];
-rz(-pi/32) q[2];
-cx q[6],q[2];
-rz(pi/32) q[2];
-cx q[5],q[2];
-rz(-pi/16) q[2];
-cx q[5],q[2];
-rz(pi/16) q[2];
-cx q[4],q[2];
-rz(-pi/8) q[2];
-cx q[4],q[2];
-rz(pi/8) q[2];
-cx q[3],q[2];
-rz(-pi/4) q[2];
-cx q[3],q[2];
-rz(pi/4) q[2];
-ry(pi/2) q[2];
-rx(pi) q[2];
-rz(pi/4) q[2];
-rz(pi/8) q[3];
-rz(pi/16) q[4];
-rz(pi/32) q[5];
-rz(pi/64) q[6];
-rz(pi/128) q[7];
-cx q[7],q[1];
-rz(-pi/128) q[1];
-cx q[7],q[1];
-rz(pi/128) q[1];
-cx q[6],q[1];
-rz(-pi/64) q[1];
-cx q[6],q[1];
-rz(pi/64) q[1];
-cx q[5],q[1];
-rz(-pi/32) q[1];
-cx q[5],q[1];
-rz(pi/32) q[1];
-cx q[4],q[1];
-rz(-pi/16) q[1];
-cx q[4],q[1];
-rz(pi/16) q[1];
-cx q[3],q[1];
-rz(-pi/8) q[1];
-cx q[3],q[1];
-rz(pi/8) q[1];
-cx q[2],q[1];
-rz(-pi/4) q[1];
-cx q[2],q[1];
-rz(pi/4) q[1];
-ry(pi/2) q[1];
-rx(pi) q[1];
-rz(pi/4) q[1];
-rz(pi/8) q[2];
-rz(pi/16) q[3];
-rz(pi/32) q[4];
-rz(pi/64) q[5];
-rz(pi/128) q[6];
-rz(pi/256) q[7];
-cx q[7],q[0];
-rz(-pi/256) q[0];
-cx q[7],q[0];
-rz(pi/256) q[0];
-cx q[6],q[0];
-rz(-pi/128) q[0];
-cx q[6],q[0];
-rz(pi/128) q[0];
-cx q[5],q[0];
-rz(-pi/64) q[0];
-cx q[5],q[0];
-rz(pi/64) q[0];
-cx q[4],q[0];
-rz(-pi/32) q[0];
-cx q[4],q[0];
-rz(pi/32) q[0];
-cx q[3],q[0];
-rz(-pi/16) q[0];
-cx q[3],q[0];
-rz(pi/16) q[0];
-cx q[2],q[0];
-rz(-pi/8) q[0];
-cx q[2],q[0];
-rz(pi/8) q[0];
-cx q[1],q[0];
-rz(-pi/4) q[0];
-cx q[1],q[0];
-rz(pi/4) q[0];
-ry(pi/2) q[0];
-rx(pi) q[0];
-cx q[0],q[7];
-cx q[1],q[6];
-cx q[2],q[5];
-cx q[3],q[4];
-cx q[4],q[3];
-cx q[3],q[4];
-cx q[5],q[2];
-cx q[2],q[5];
-cx q[6],q[1];
-cx q[1],q[6];
-cx q[7],q[0];
-cx q[0],q[7];
\ No newline at end of file
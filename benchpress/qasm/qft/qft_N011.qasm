@@ -1,315 +0,0 @@
-OPENQASM 2.0;
-include "qelib1.inc";
-qreg q[11];
-ry(pi/2) q[10];
-rx(pi) q[10];
-rz(pi/4) q[10];
-cx q[10],q[9];
-rz(-pi/4) q[9];
-cx q[10],q[9];
-rz(pi/4) q[9];
-ry(pi/2) q[9];
-rx(pi) q[9];
-rz(pi/4) q[9];
-rz(pi/8) q[10];
-cx q[10],q[8];
-rz(-pi/8) q[8];
-cx q[10],q[8];
-rz(pi/8) q[8];
-cx q[9],q[8];
-rz(-pi/4) q[8];
-cx q[9],q[8];
-rz(pi/4) q[8];
-ry(pi/2) q[8];
-rx(pi) q[8];
-rz(pi/4) q[8];
-rz(pi/8) q[9];
-rz(pi/16) q[10];
-cx q[10],q[7];
-rz(-pi/16) q[7];
-cx q[10],q[7];
-rz(pi/16) q[7];
-cx q[9],q[7];
-rz(-pi/8) q[7];
-cx q[9],q[7];
-rz(pi/8) q[7];
-cx q[8],q[7];
-rz(-pi/4) q[7];
-cx q[8],q[7];
-rz(pi/4) q[7];
-ry(pi/2) q[7];
-rx(pi) q[7];
-rz(pi/4) q[7];
-rz(pi/8) q[8];
-rz(pi/16) q[9];
-rz(pi/32) q[10];
-cx q[10],q[6];
-rz(-pi/32) q[6];
-cx q[10],q[6];
-rz(pi/32) q[6];
-cx q[9],q[6];
-rz(-pi/16) q[6];
-cx q[9],q[6];
-rz(pi/16) q[6];
-cx q[8],q[6];
-rz(-pi/8) q[6];
-cx q[8],q[6];
-rz(pi/8) q[6];
-cx q[7],q[6];
-rz(-pi/4) q[6];
-cx q[7],q[6];
-rz(pi/4) q[6];
-ry(pi/2) q[6];
-rx(pi) q[6];
-rz(pi/4) q[6];
-rz(pi/8) q[7];
-rz(pi/16) q[8];
-rz(pi/32) q[9];
-rz(pi/64) q[10];
-cx q[10],q[5];
-rz(-pi/64) q[5];
-cx q[10],q[5];
-rz(pi/64) q[5];
-cx q[9],q[5];
-rz(-pi/32) q[5];
-cx q[9],q[5];
-rz(pi/32) q[5];
-cx q[8],q[5];
-rz(-pi/16) q[5];
-cx q[8],q[5];
-rz(pi/16) q[5];
-cx q[7],q[5];
-rz(-pi/8) q[5];
-cx q[7],q[5];
-rz(pi/8) q[5];
-cx q[6],q[5];
-rz(-pi/4) q[5];
-cx q[6],q[5];
-rz(pi/4) q[5];
-ry(pi/2) q[5];
-rx(pi) q[5];
-rz(pi/4) q[5];
-rz(pi/8) q[6];
-rz(pi/16) q[7];
-rz(pi/32) q[8];
-rz(pi/64) q[9];
-rz(pi/128) q[10];
-cx q[10],q[4];
-rz(-pi/128) q[4];
-cx q[10],q[4];
-rz(pi/128) q[4];
-cx q[9],q[4];
-rz(-pi/64) q[4];
-cx q[9],q[4];
-rz(pi/64) q[4];
-cx q[8],q[4];
-rz(-pi/32) q[4];
-cx q[8],q[4];
-rz(pi/32) q[4];
-cx q[7],q[4];
-rz(-pi/16) q[4];
-cx q[7],q[4];
-rz(pi/16) q[4];
-cx q[6],q[4];
-rz(-pi/8) q[4];
-cx q[6],q[4];
-rz(pi/8) q[4];
-cx q[5],q[4];
-rz(-pi/4) q[4];
-cx q[5],q[4];
-rz(pi/4) q[4];
-ry(pi/2) q[4];
-rx(pi) q[4];
-rz(pi/4) q[4];
-rz(pi/8) q[5];
-rz(pi/16) q[6];
-rz(pi/32) q[7];
-rz(pi/64) q[8];
-rz(pi/128) q[9];
-rz(pi/256) q[10];
-cx q[10],q[3];
-rz(-pi/256) q[3];
-cx q[10],q[3];
-rz(pi/256) q[3];
-cx q[9],q[3];
-rz(-pi/128) q[3];
-cx q[9],q[3];
-rz(pi/128) q[3];
-cx q[8],q[3];
-rz(-pi/64) q[3];
-cx q[8],q[3];
-rz(pi/64) q[3];
-cx q[7],q[3];
-rz(-pi/32) q[3];
-cx q[7],q[3];
-rz(pi/32) q[3];
-cx q[6],q[3];
-rz(-pi/16) q[3];
-cx q[6],q[3];
-rz(pi/16) q[3];
-cx q[5],q[3];
-rz(-pi/8) q[3];
-cx q[5],q[3];
-rz(pi/8) q[3];
-cx q[4],q[3];
-rz(-pi/4) q[3];
-cx q[4],q[3];
-rz(pi/4) q[3];
-ry(pi/2) q[3];
-rx(pi) q[3];
-rz(pi/4) q[3];
-rz(pi/8) q[4];
-rz(pi/16) q[5];
-rz(pi/32) q[6];
-rz(pi/64) q[7];
-rz(pi/128) q[8];
-rz(pi/256) q[9];
-rz(pi/512) q[10];
-cx q[10],q[2];
-rz(-pi/512) q[2];
-cx q[10],q[2];
-rz(pi/512) q[2];
-cx q[9],q[2];
-rz(-pi/256) q[2];
-cx q[9],q[2];
-rz(pi/256) q[2];
-cx q[8],q[2];
-rz(-pi/128) q[2];
-cx q[8],q[2];
-rz(pi/128) q[2];
-cx q[7],q[2];
-rz(-pi/64) q[2];
-cx q[7],q[2];
-rz(pi/64) q[2];
-cx q[6],q[2];
-rz(-pi/32) q[2];
-cx q[6],q[2];
-rz(pi/32) q[2];
-cx q[5],q[2];
-rz(-pi/16) q[2];
-cx q[5],q[2];
-rz(pi/16) q[2];
-cx q[4],q[2];
-rz(-pi/8) q[2];
-cx q[4],q[2];
-rz(pi/8) q[2];
-cx q[3],q[2];
-rz(-pi/4) q[2];
-cx q[3],q[2];
-rz(pi/4) q[2];
-ry(pi/2) q[2];
-rx(pi) q[2];
-rz(pi/4) q[2];
-rz(pi/8) q[3];
-rz(pi/16) q[4];
-rz(pi/32) q[5];
-rz(pi/64) q[6];
-rz(pi/128) q[7];
-rz(pi/256) q[8];
-rz(pi/512) q[9];
-rz(pi/1024) q[10];
-cx q[10],q[1];
-rz(-pi/1024) q[1];
-cx q[10],q[1];
-rz(pi/1024) q[1];
-cx q[9],q[1];
-rz(-pi/512) q[1];
-cx q[9],q[1];
-rz(pi/512) q[1];
-cx q[8],q[1];
-rz(-pi/256) q[1];
-cx q[8],q[1];
-rz(pi/256) q[1];
-cx q[7],q[1];
-rz(-pi/128) q[1];
-cx q[7],q[1];
-rz(pi/128) q[1];
-cx q[6],q[1];
-rz(-pi/64) q[1];
-cx q[6],q[1];
-rz(pi/64) q[1];
-cx q[5],q[1];
-rz(-pi/32) q[1];
-cx q[5],q[1];
-rz(pi/32) q[1];
-cx q[4],q[1];
-rz(-pi/16) q[1];
-cx q[4],q[1];
-rz(pi/16) q[1];
-cx q[3],q[1];
-rz(-pi/8) q[1];
-cx q[3],q[1];
-rz(pi/8) q[1];
-cx q[2],q[1];
-rz(-pi/4) q[1];
-cx q[2],q[1];
-rz(pi/4) q[1];
-ry(pi/2) q[1];
-rx(pi) q[1];
-rz(pi/4) q[1];
-rz(pi/8) q[2];
-rz(pi/16) q[3];
-rz(pi/32) q[4];
-rz(pi/64) q[5];
-rz(pi/128) q[6];
-rz(pi/256) q[7];
-rz(pi/512) q[8];
-rz(pi/1024) q[9];
-rz(pi/2048) q[10];
-cx q[10],q[0];
-rz(-pi/2048) q[0];
-cx q[10],q[0];
-rz(pi/2048) q[0];
-cx q[9],q[0];
-rz(-pi/1024) q[0];
-cx q[9],q[0];
-rz(pi/1024) q[0];
-cx q[8],q[0];
-rz(-pi/512) q[0];
-cx q[8],q[0];
-rz(pi/512) q[0];
-cx q[7],q[0];
-rz(-pi/256) q[0];
-cx q[7],q[0];
-rz(pi/256) q[0];
-cx q[6],q[0];
-rz(-pi/128) q[0];
-cx q[6],q[0];
-rz(pi/128) q[0];
-cx q[5],q[0];
-rz(-pi/64) q[0];
-cx q[5],q[0];
-rz(pi/64) q[0];
-cx q[4],q[0];
-rz(-pi/32) q[0];
-cx q[4],q[0];
-rz(pi/32) q[0];
-cx q[3],q[0];
-rz(-pi/16) q[0];
-cx q[3],q[0];
-rz(pi/16) q[0];
-cx q[2],q[0];
-rz(-pi/8) q[0];
-cx q[2],q[0];
-rz(pi/8) q[0];
-cx q[1],q[0];
-rz(-pi/4) q[0];
-cx q[1],q[0];
-rz(pi/4) q[0];
-ry(pi/2) q[0];
-rx(pi) q[0];
-cx q[0],q[10];
-cx q[1],q[9];
-cx q[2],q[8];
-cx q[3],q[7];
-cx q[4],q[6];
-cx q[6],q[4];
-cx q[4],q[6];
-cx q[7],q[3];
-cx q[3],q[7];
-cx q[8],q[2];
-cx q[2],q[8];
-cx q[9],q[1];
-cx q[1],q[9];
-cx q[10],q[0];
-cx q[0],q[10];
\ No newline at end of file